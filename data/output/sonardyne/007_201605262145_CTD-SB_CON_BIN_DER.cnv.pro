@@ -0,0 +1,2435 @@
+test_read_store_and_write
+26/5/2016
+21:49:0
+Probe: SBE
+Source: /root/package/data/input/seabird/007_201605262145_CTD-SB_CON_BIN_DER.cnv
+      0.9940   1544.0800     35.5282     29.0575
+      1.9880   1544.0300     35.4595     29.0594
+      2.9810   1543.8500     35.4304     28.9801
+      3.9750   1544.2900     35.5602     29.1170
+      4.9690   1544.2700     35.5225     29.1194
+      5.9630   1544.3199     35.5460     29.1241
+      6.9570   1544.3000     35.5574     29.1022
+      7.9500   1544.1600     35.5737     29.0166
+      8.9440   1544.0200     35.6111     28.9281
+      9.9380   1543.9100     35.6902     28.8290
+     10.9320   1543.9399     35.7218     28.8193
+     11.9250   1543.9800     35.7739     28.8026
+     12.9190   1544.0699     35.8803     28.7848
+     13.9130   1544.1801     36.0182     28.7649
+     14.9070   1544.2600     36.1540     28.7268
+     15.9000   1544.2300     36.3363     28.6124
+     16.8940   1543.9200     36.4184     28.4213
+     17.8880   1543.6600     36.4601     28.2717
+     18.8810   1543.4301     36.4500     28.1629
+     19.8750   1543.1100     36.4422     28.0147
+     20.8690   1542.6200     36.3941     27.8054
+     21.8630   1541.6200     36.2573     27.4108
+     22.8560   1540.8900     36.4294     26.9942
+     23.8500   1540.5300     36.4855     26.8012
+     24.8440   1540.4900     36.4864     26.7770
+     25.8370   1540.4399     36.4852     26.7484
+     26.8310   1540.3199     36.4817     26.6900
+     27.8250   1540.2100     36.4821     26.6318
+     28.8180   1540.0300     36.4912     26.5412
+     29.8120   1539.8000     36.4579     26.4508
+     30.8060   1539.3300     36.3995     26.2636
+     31.7990   1538.4301     36.3306     25.9001
+     32.7930   1538.0500     36.4317     25.6829
+     33.7870   1537.8900     36.4456     25.6017
+     34.7800   1537.6899     36.3811     25.5372
+     35.7740   1537.2300     36.3891     25.3340
+     36.7670   1536.8300     36.3874     25.1567
+     37.7610   1536.3700     36.3637     24.9652
+     38.7550   1535.9800     36.4130     24.7731
+     39.7480   1535.8500     36.4314     24.7064
+     40.7420   1535.7200     36.4324     24.6460
+     41.7350   1535.6400     36.4529     24.5967
+     42.7290   1535.5200     36.4373     24.5441
+     43.7230   1535.4000     36.4477     24.4869
+     44.7160   1535.3400     36.4479     24.4536
+     45.7100   1535.2800     36.4503     24.4202
+     46.7030   1535.2100     36.4321     24.3914
+     47.6970   1535.0601     36.4139     24.3310
+     48.6910   1534.8700     36.4145     24.2481
+     49.6840   1534.6899     36.4130     24.1683
+     50.6780   1534.5800     36.4207     24.1140
+     51.6710   1534.4900     36.4159     24.0715
+     52.6650   1534.4200     36.4243     24.0312
+     53.6580   1534.3800     36.4318     24.0075
+     54.6520   1534.3500     36.4266     23.9904
+     55.6450   1534.2700     36.4052     23.9601
+     56.6390   1534.1500     36.4111     23.9031
+     57.6320   1534.0800     36.4095     23.8681
+     58.6260   1533.9700     36.4014     23.8180
+     59.6200   1533.8101     36.4044     23.7480
+     60.6130   1533.7700     36.4188     23.7173
+     61.6070   1533.7100     36.4189     23.6891
+     62.6000   1533.6899     36.4178     23.6724
+     63.5940   1533.6200     36.4043     23.6434
+     64.5870   1533.5100     36.3923     23.5977
+     65.5810   1533.3800     36.3926     23.5388
+     66.5740   1533.3000     36.4181     23.4877
+     67.5670   1533.3000     36.4240     23.4808
+     68.5610   1533.3101     36.4286     23.4755
+     69.5540   1533.3199     36.4295     23.4740
+     70.5480   1533.2800     36.4243     23.4522
+     71.5410   1533.2000     36.4134     23.4179
+     72.5350   1533.1400     36.4121     23.3872
+     73.5280   1533.0000     36.3881     23.3387
+     74.5220   1532.8199     36.3779     23.2626
+     75.5150   1532.6200     36.3869     23.1731
+     76.5090   1532.4900     36.4015     23.1098
+     77.5020   1532.4600     36.4002     23.0917
+     78.4950   1532.4301     36.3931     23.0733
+     79.4890   1532.3600     36.3757     23.0496
+     80.4820   1532.2200     36.3637     22.9899
+     81.4760   1532.1200     36.3859     22.9344
+     82.4690   1532.0100     36.3655     22.8948
+     83.4620   1531.8700     36.3681     22.8338
+     84.4560   1531.7900     36.3755     22.7925
+     85.4490   1531.6801     36.3490     22.7522
+     86.4430   1531.4700     36.3335     22.6688
+     87.4360   1531.2600     36.3418     22.5775
+     88.4290   1531.1400     36.3551     22.5189
+     89.4230   1531.0601     36.3450     22.4855
+     90.4160   1530.9200     36.3181     22.4365
+     91.4100   1530.7700     36.3423     22.3628
+     92.4030   1530.6600     36.3479     22.3093
+     93.3960   1530.5800     36.3748     22.2619
+     94.3900   1530.5800     36.3833     22.2501
+     95.3830   1530.5800     36.4153     22.2315
+     96.3760   1530.5900     36.4287     22.2214
+     97.3700   1530.5300     36.4331     22.1909
+     98.3630   1530.4000     36.3960     22.1510
+     99.3560   1530.0200     36.3376     22.0218
+    100.3500   1529.6200     36.3969     21.8372
+    101.3430   1529.4301     36.4455     21.7366
+    102.3360   1529.3700     36.4613     21.7006
+    103.3290   1529.3300     36.4827     21.6700
+    104.3230   1529.2800     36.4927     21.6436
+    105.3160   1529.1400     36.4762     21.5908
+    106.3090   1528.9800     36.4685     21.5274
+    107.3030   1528.8600     36.4883     21.4671
+    108.2960   1528.7900     36.4872     21.4349
+    109.2890   1528.6600     36.4856     21.3791
+    110.2820   1528.5699     36.4943     21.3332
+    111.2760   1528.4800     36.5043     21.2902
+    112.2690   1528.4100     36.5187     21.2522
+    113.2620   1528.3199     36.5062     21.2151
+    114.2560   1528.1600     36.5146     21.1486
+    115.2490   1528.0500     36.5169     21.0993
+    116.2420   1527.9100     36.5235     21.0360
+    117.2350   1527.7900     36.5285     20.9829
+    118.2280   1527.6700     36.5353     20.9303
+    119.2220   1527.5400     36.5273     20.8792
+    120.2150   1527.4500     36.5386     20.8332
+    121.2080   1527.2500     36.4951     20.7722
+    122.2010   1527.0200     36.5123     20.6739
+    123.1950   1526.8300     36.5147     20.5957
+    124.1880   1526.6500     36.5056     20.5274
+    125.1810   1526.5200     36.5340     20.4600
+    126.1740   1526.4800     36.5436     20.4365
+    127.1670   1526.3500     36.5177     20.3944
+    128.1610   1526.1500     36.5206     20.3140
+    129.1540   1526.0200     36.5223     20.2573
+    130.1470   1525.8800     36.5100     20.2040
+    131.1400   1525.7300     36.5167     20.1409
+    132.1330   1525.6200     36.5115     20.0967
+    133.1260   1525.5100     36.5244     20.0486
+    134.1200   1525.2900     36.4705     19.9814
+    135.1130   1524.9600     36.4487     19.8643
+    136.1060   1524.6600     36.4766     19.7389
+    137.0990   1524.4600     36.4860     19.6574
+    138.0920   1524.3101     36.4862     19.5998
+    139.0850   1524.2100     36.4962     19.5536
+    140.0780   1524.1500     36.5119     19.5186
+    141.0720   1524.1300     36.5311     19.4973
+    142.0650   1524.1500     36.5352     19.4961
+    143.0580   1524.1500     36.5322     19.4913
+    144.0510   1524.1300     36.5312     19.4789
+    145.0440   1524.1100     36.5262     19.4675
+    146.0370   1524.0300     36.5049     19.4439
+    147.0300   1523.9500     36.5110     19.4067
+    148.0230   1523.7500     36.4611     19.3498
+    149.0160   1523.4301     36.4536     19.2302
+    150.0090   1523.1000     36.4481     19.1100
+    151.0020   1522.9000     36.4722     19.0245
+    151.9960   1522.8400     36.4862     18.9921
+    152.9890   1522.8199     36.4865     18.9798
+    153.9820   1522.7200     36.4369     18.9558
+    154.9750   1522.5000     36.4315     18.8751
+    155.9680   1522.2900     36.4161     18.8036
+    156.9610   1522.0100     36.3946     18.7064
+    157.9540   1521.7200     36.4071     18.5960
+    158.9470   1521.5200     36.4347     18.5080
+    159.9400   1521.4500     36.4430     18.4737
+    160.9330   1521.4200     36.4423     18.4582
+    161.9260   1521.3900     36.4317     18.4459
+    162.9190     -0.0000     -0.0000     -0.0000
+    163.9120   1521.1801     36.3851     18.3822
+    164.9050   1521.0300     36.4024     18.3162
+    165.8980   1520.9600     36.4182     18.2789
+    166.8910   1520.8900     36.4058     18.2535
+    167.8840   1520.7700     36.4033     18.2101
+    168.8770   1520.6899     36.4066     18.1723
+    169.8700   1520.6100     36.3877     18.1485
+    170.8630   1520.4399     36.3610     18.0958
+    171.8560   1520.2300     36.3255     18.0296
+    172.8490   1520.0200     36.3236     17.9531
+    173.8420   1519.7700     36.2954     17.8728
+    174.8350   1519.6200     36.3321     17.8007
+    175.8280   1519.4700     36.3172     17.7511
+    176.8210   1519.2300     36.3020     17.6676
+    177.8140   1519.0300     36.3152     17.5909
+    178.8070   1518.9200     36.3163     17.5455
+    179.8000   1518.8400     36.3113     17.5148
+    180.7920   1518.7600     36.3155     17.4820
+    181.7850   1518.7300     36.3145     17.4669
+    182.7780   1518.6600     36.2825     17.4475
+    183.7710   1518.4900     36.2519     17.3972
+    184.7640   1518.3199     36.2598     17.3302
+    185.7570   1518.1700     36.2659     17.2748
+    186.7500   1517.9399     36.2346     17.2028
+    187.7430   1517.7100     36.2411     17.1182
+    188.7360   1517.5601     36.2281     17.0649
+    189.7290   1517.3800     36.2103     17.0076
+    190.7220   1517.2400     36.2235     16.9484
+    191.7140   1517.1300     36.2123     16.9134
+    192.7070   1516.9500     36.1878     16.8575
+    193.7000   1516.7900     36.1909     16.7957
+    194.6930   1516.6700     36.1910     16.7495
+    195.6860   1516.6000     36.1881     16.7221
+    196.6790   1516.4500     36.1719     16.6741
+    197.6720   1516.3199     36.1681     16.6265
+    198.6640   1516.1000     36.1550     16.5552
+    199.6570   1515.9301     36.1496     16.4927
+    200.6500   1515.8199     36.1548     16.4499
+    201.6430   1515.7700     36.1636     16.4241
+    202.6360   1515.6801     36.1377     16.3994
+    203.6290   1515.5800     36.1437     16.3591
+    204.6210   1515.5300     36.1483     16.3366
+    205.6140   1515.4700     36.1355     16.3167
+    206.6070   1515.3600     36.1097     16.2829
+    207.6000   1515.1000     36.0887     16.2026
+    208.5930   1514.9000     36.0908     16.1297
+    209.5850   1514.7100     36.0833     16.0663
+    210.5780   1514.6000     36.0863     16.0242
+    211.5710   1514.5200     36.0938     15.9877
+    212.5640   1514.4600     36.0875     15.9654
+    213.5560   1514.4200     36.0899     15.9483
+    214.5490   1514.3600     36.0681     15.9319
+    215.5420   1514.1899     36.0363     15.8815
+    216.5350   1513.9800     36.0332     15.8096
+    217.5280   1513.7900     36.0223     15.7477
+    218.5200   1513.6100     36.0249     15.6830
+    219.5130   1513.5200     36.0302     15.6449
+    220.5060   1513.3900     35.9979     15.6113
+    221.4980   1513.2700     36.0178     15.5593
+    222.4910   1513.2400     36.0302     15.5415
+    223.4840   1513.2400     36.0293     15.5366
+    224.4770   1513.1801     36.0091     15.5187
+    225.4690   1513.0900     36.0057     15.4852
+    226.4620   1513.0400     36.0116     15.4632
+    227.4550   1513.0000     36.0023     15.4480
+    228.4480   1512.9100     35.9752     15.4242
+    229.4400   1512.7000     35.9356     15.3674
+    230.4330   1512.5300     35.9655     15.2963
+    231.4260   1512.4500     35.9747     15.2606
+    232.4180   1512.3800     35.9746     15.2341
+    233.4110   1512.3600     35.9784     15.2212
+    234.4040   1512.3300     35.9686     15.2097
+    235.3960   1512.2600     35.9550     15.1866
+    236.3890   1512.1600     35.9466     15.1521
+    237.3820   1512.0500     35.9412     15.1156
+    238.3740   1511.9399     35.9351     15.0761
+    239.3670   1511.8101     35.9205     15.0349
+    240.3600   1511.6600     35.9158     14.9843
+    241.3520   1511.4900     35.9109     14.9279
+    242.3450   1511.3800     35.9096     14.8884
+    243.3370   1511.3000     35.9064     14.8579
+    244.3300   1511.1801     35.8762     14.8272
+    245.3230   1510.8900     35.8409     14.7425
+    246.3150   1510.6500     35.8510     14.6585
+    247.3080   1510.5100     35.8630     14.6054
+    248.3010   1510.3500     35.8474     14.5552
+    249.2930   1510.1801     35.8341     14.5043
+    250.2860   1510.0500     35.8440     14.4539
+    251.2780   1509.9600     35.8314     14.4242
+    252.2710   1509.8600     35.8266     14.3892
+    253.2630   1509.7400     35.8174     14.3513
+    254.2560   1509.6100     35.8111     14.3074
+    255.2490   1509.5000     35.8122     14.2681
+    256.2410   1509.4301     35.8126     14.2428
+    257.2340   1509.3600     35.8122     14.2137
+    258.2260   1509.3101     35.8187     14.1908
+    259.2190   1509.2900     35.8132     14.1821
+    260.2110   1509.2300     35.7961     14.1645
+    261.2040   1509.1600     35.7994     14.1386
+    262.1960   1509.1200     35.7976     14.1213
+    263.1890   1509.0500     35.7904     14.0976
+    264.1820   1508.9700     35.7809     14.0688
+    265.1740   1508.8000     35.7621     14.0187
+    266.1670   1508.6300     35.7573     13.9631
+    267.1590   1508.5200     35.7515     13.9283
+    268.1520   1508.4301     35.7588     13.8914
+    269.1440   1508.3800     35.7575     13.8702
+    270.1370   1508.2500     35.7414     13.8336
+    271.1290   1508.1600     35.7439     13.7981
+    272.1220   1508.0900     35.7459     13.7706
+    273.1140   1508.0500     35.7452     13.7535
+    274.1070   1507.9800     35.7307     13.7335
+    275.0990   1507.9000     35.7371     13.7019
+    276.0910   1507.7900     35.7137     13.6720
+    277.0840   1507.6300     35.7057     13.6220
+    278.0760   1507.5300     35.7025     13.5870
+    279.0690   1507.4000     35.6681     13.5547
+    280.0610   1507.1500     35.6400     13.4828
+    281.0540   1506.9700     35.6728     13.4128
+    282.0460   1506.9000     35.6845     13.3811
+    283.0390   1506.8600     35.6879     13.3615
+    284.0310   1506.7700     35.6630     13.3385
+    285.0240   1506.6700     35.6678     13.3030
+    286.0160   1506.5900     35.6567     13.2788
+    287.0080   1506.4600     35.6395     13.2387
+    288.0010   1506.3101     35.6371     13.1887
+    288.9930   1506.2200     35.6487     13.1526
+    289.9860   1506.1801     35.6464     13.1371
+    290.9780   1506.1100     35.6350     13.1165
+    291.9700   1505.9900     35.6209     13.0800
+    292.9630   1505.8900     35.6293     13.0405
+    293.9550   1505.8500     35.6355     13.0218
+    294.9480   1505.8300     35.6354     13.0120
+    295.9400   1505.8199     35.6333     13.0055
+    296.9320   1505.8000     35.6251     12.9953
+    297.9250   1505.7400     35.6177     12.9776
+    298.9170   1505.6500     35.6062     12.9480
+    299.9090   1505.5200     35.5962     12.9088
+    300.9020   1505.3300     35.5758     12.8525
+    301.8940   1505.2500     35.6014     12.8151
+    302.8860   1505.2300     35.6035     12.8041
+    303.8790   1505.2100     35.5998     12.7955
+    304.8710   1505.1000     35.5695     12.7682
+    305.8630   1504.9301     35.5701     12.7114
+    306.8560   1504.8400     35.5779     12.6788
+    307.8480   1504.7600     35.5575     12.6548
+    308.8400   1504.6500     35.5618     12.6171
+    309.8330   1504.6100     35.5687     12.5968
+    310.8250   1504.5699     35.5602     12.5837
+    311.8170   1504.5000     35.5563     12.5601
+    312.8100   1504.4600     35.5579     12.5413
+    313.8020   1504.3500     35.5347     12.5124
+    314.7940   1504.2200     35.5393     12.4686
+    315.7860   1504.1100     35.5338     12.4332
+    316.7790   1504.0200     35.5332     12.4025
+    317.7710   1503.9500     35.5330     12.3757
+    318.7630   1503.9301     35.5346     12.3658
+    319.7550   1503.9100     35.5321     12.3539
+    320.7480   1503.8900     35.5367     12.3430
+    321.7400   1503.8500     35.5211     12.3318
+    322.7320   1503.6600     35.4929     12.2821
+    323.7240   1503.4600     35.4980     12.2167
+    324.7170   1503.3900     35.5122     12.1853
+    325.7090   1503.3900     35.5160     12.1785
+    326.7010   1503.4000     35.5149     12.1771
+    327.6930   1503.4000     35.5124     12.1736
+    328.6860   1503.4000     35.5098     12.1688
+    329.6780   1503.3101     35.4891     12.1452
+    330.6700   1503.2300     35.4977     12.1135
+    331.6620   1503.2200     35.5036     12.1050
+    332.6540   1503.2300     35.5026     12.1023
+    333.6470   1503.2300     35.5042     12.0983
+    334.6390   1503.2400     35.5023     12.0970
+    335.6310   1503.1801     35.4704     12.0853
+    336.6230   1503.0000     35.4600     12.0324
+    337.6150   1502.9100     35.4767     11.9940
+    338.6080   1502.8900     35.4790     11.9821
+    339.6000   1502.8400     35.4674     11.9684
+    340.5920   1502.7500     35.4535     11.9403
+    341.5840   1502.6000     35.4532     11.8941
+    342.5760   1502.5300     35.4616     11.8637
+    343.5680   1502.5000     35.4602     11.8506
+    344.5600   1502.4700     35.4593     11.8380
+    345.5530   1502.4399     35.4530     11.8273
+    346.5450   1502.3500     35.4292     11.8050
+    347.5370   1502.1899     35.4273     11.7539
+    348.5290   1502.0601     35.4303     11.7103
+    349.5210   1501.9600     35.4252     11.6788
+    350.5130   1501.9000     35.4297     11.6561
+    351.5050   1501.8800     35.4301     11.6431
+    352.4970   1501.8400     35.4233     11.6313
+    353.4890   1501.7800     35.4147     11.6102
+    354.4820   1501.7000     35.4157     11.5833
+    355.4740   1501.6500     35.4147     11.5636
+    356.4660   1501.6000     35.4136     11.5457
+    357.4580   1501.5699     35.4161     11.5323
+    358.4500   1501.5200     35.4054     11.5159
+    359.4420   1501.4600     35.4063     11.4939
+    360.4340   1501.4399     35.4111     11.4807
+    361.4260   1501.4301     35.4087     11.4739
+    362.4180   1501.4000     35.4000     11.4652
+    363.4100   1501.3300     35.3848     11.4446
+    364.4020   1501.2700     35.3922     11.4191
+    365.3940   1501.2200     35.3864     11.4020
+    366.3860   1501.1600     35.3880     11.3801
+    367.3780   1501.1200     35.3898     11.3641
+    368.3700   1501.0500     35.3784     11.3421
+    369.3620   1500.9700     35.3770     11.3157
+    370.3540   1500.9100     35.3700     11.2960
+    371.3460   1500.8199     35.3572     11.2693
+    372.3380   1500.7300     35.3567     11.2391
+    373.3300   1500.6700     35.3645     11.2147
+    374.3220   1500.6400     35.3645     11.2020
+    375.3140   1500.5900     35.3613     11.1828
+    376.3060   1500.5400     35.3657     11.1642
+    377.2980   1500.5200     35.3642     11.1544
+    378.2900   1500.5100     35.3646     11.1470
+    379.2820   1500.5100     35.3629     11.1424
+    380.2740   1500.5000     35.3536     11.1365
+    381.2660   1500.4000     35.3393     11.1107
+    382.2580   1500.3300     35.3434     11.0827
+    383.2500   1500.2800     35.3453     11.0640
+    384.2420   1500.1899     35.3331     11.0366
+    385.2340   1500.1200     35.3384     11.0108
+    386.2260   1500.0699     35.3346     10.9944
+    387.2180   1500.0400     35.3368     10.9801
+    388.2100   1500.0200     35.3314     10.9698
+    389.2020   1499.9700     35.3283     10.9546
+    390.1940   1499.9301     35.3259     10.9373
+    391.1860   1499.8600     35.3132     10.9167
+    392.1780   1499.7000     35.3021     10.8720
+    393.1690   1499.6300     35.3162     10.8419
+    394.1610   1499.6100     35.3197     10.8314
+    395.1530   1499.6100     35.3209     10.8248
+    396.1450   1499.5601     35.3047     10.8129
+    397.1370   1499.4900     35.3047     10.7888
+    398.1290   1499.4200     35.2968     10.7657
+    399.1210   1499.3199     35.2889     10.7356
+    400.1130   1499.1801     35.2832     10.6940
+    401.1050   1499.0601     35.2878     10.6537
+    402.0960   1499.0200     35.2890     10.6387
+    403.0880   1498.9600     35.2689     10.6229
+    404.0800   1498.8800     35.2727     10.5949
+    405.0720   1498.8300     35.2785     10.5750
+    406.0640   1498.7800     35.2763     10.5558
+    407.0560   1498.7500     35.2814     10.5423
+    408.0480   1498.7500     35.2802     10.5365
+    409.0390   1498.7100     35.2718     10.5249
+    410.0310   1498.6600     35.2651     10.5075
+    411.0230   1498.6000     35.2681     10.4848
+    412.0150   1498.5800     35.2679     10.4735
+    413.0070   1498.5400     35.2634     10.4606
+    413.9980   1498.5000     35.2620     10.4465
+    414.9900   1498.4800     35.2631     10.4333
+    415.9820   1498.4399     35.2574     10.4197
+    416.9740   1498.3800     35.2524     10.4004
+    417.9660   1498.2800     35.2550     10.3671
+    418.9570   1498.2400     35.2555     10.3512
+    419.9490   1498.2300     35.2587     10.3444
+    420.9410   1498.2300     35.2533     10.3418
+    421.9330   1498.1801     35.2294     10.3301
+    422.9240   1498.0900     35.2292     10.3003
+    423.9160   1498.0100     35.2294     10.2736
+    424.9080   1497.8700     35.2161     10.2349
+    425.9000   1497.7400     35.2295     10.1890
+    426.8910   1497.7200     35.2377     10.1753
+    427.8830   1497.7300     35.2373     10.1753
+    428.8750   1497.7300     35.2305     10.1719
+    429.8670   1497.7100     35.2288     10.1635
+    430.8580   1497.6801     35.2214     10.1531
+    431.8500   1497.6300     35.2186     10.1349
+    432.8420   1497.5699     35.2102     10.1166
+    433.8340   1497.4900     35.2114     10.0903
+    434.8250   1497.4000     35.2050     10.0630
+    435.8170   1497.3400     35.2122     10.0384
+    436.8090   1497.3199     35.2140     10.0285
+    437.8000   1497.3199     35.2125     10.0236
+    438.7920   1497.3101     35.2064     10.0173
+    439.7840   1497.2900     35.2055     10.0082
+    440.7750   1497.2500     35.2041      9.9944
+    441.7670   1497.2400     35.2069      9.9836
+    442.7590   1497.2300     35.2068      9.9777
+    443.7500   1497.2200     35.2050      9.9711
+    444.7420   1497.1899     35.1946      9.9622
+    445.7340   1497.1200     35.1845      9.9414
+    446.7250   1497.0300     35.1771      9.9131
+    447.7170   1496.9000     35.1630      9.8792
+    448.7090   1496.8300     35.1825      9.8477
+    449.7000   1496.8000     35.1867      9.8331
+    450.6920   1496.7900     35.1867      9.8264
+    451.6840   1496.7700     35.1831      9.8186
+    452.6750   1496.7000     35.1702      9.7985
+    453.6670   1496.6100     35.1695      9.7685
+    454.6580   1496.5601     35.1774      9.7474
+    455.6500   1496.5300     35.1694      9.7392
+    456.6420   1496.4900     35.1699      9.7223
+    457.6330   1496.4500     35.1620      9.7088
+    458.6250   1496.3600     35.1524      9.6826
+    459.6160   1496.2800     35.1572      9.6546
+    460.6080   1496.2300     35.1568      9.6378
+    461.6000   1496.1700     35.1504      9.6185
+    462.5910   1496.0900     35.1424      9.5938
+    463.5830   1496.0200     35.1496      9.5677
+    464.5740   1495.9800     35.1494      9.5539
+    465.5660   1495.9301     35.1413      9.5389
+    466.5570   1495.8500     35.1288      9.5141
+    467.5490   1495.7800     35.1401      9.4894
+    468.5400   1495.7500     35.1409      9.4750
+    469.5320   1495.7200     35.1425      9.4621
+    470.5240   1495.6899     35.1342      9.4522
+    471.5150   1495.6400     35.1316      9.4341
+    472.5070   1495.6000     35.1317      9.4186
+    473.4980   1495.5400     35.1243      9.4005
+    474.4900   1495.4700     35.1283      9.3750
+    475.4810   1495.4399     35.1349      9.3604
+    476.4730   1495.4399     35.1303      9.3583
+    477.4640   1495.4000     35.1179      9.3466
+    478.4560   1495.3400     35.1127      9.3267
+    479.4470   1495.2600     35.1139      9.3001
+    480.4390   1495.2100     35.1130      9.2828
+    481.4300   1495.0900     35.1013      9.2494
+    482.4220   1495.0500     35.1121      9.2304
+    483.4130   1495.0000     35.1068      9.2159
+    484.4050   1494.9600     35.1062      9.1996
+    485.3960   1494.9000     35.1011      9.1796
+    486.3870   1494.8400     35.1055      9.1583
+    487.3790   1494.8300     35.1108      9.1498
+    488.3700   1494.8300     35.1088      9.1473
+    489.3620   1494.8199     35.1018      9.1410
+    490.3530   1494.7700     35.0978      9.1255
+    491.3450   1494.7100     35.0894      9.1069
+    492.3360   1494.6400     35.0944      9.0821
+    493.3280   1494.6200     35.0977      9.0710
+    494.3190   1494.6100     35.0978      9.0637
+    495.3100   1494.6000     35.0975      9.0566
+    496.3020   1494.5500     35.0852      9.0438
+    497.2930   1494.4800     35.0862      9.0190
+    498.2850   1494.4500     35.0908      9.0058
+    499.2760   1494.4399     35.0877      8.9979
+    500.2670   1494.4200     35.0888      8.9881
+    501.2590   1494.4000     35.0839      8.9793
+    502.2500   1494.3101     35.0740      8.9563
+    503.2420   1494.2600     35.0795      8.9350
+    504.2330   1494.2300     35.0805      8.9215
+    505.2240   1494.1899     35.0760      8.9088
+    506.2160   1494.1700     35.0814      8.8966
+    507.2070   1494.1500     35.0724      8.8897
+    508.1980   1494.0699     35.0580      8.8692
+    509.1900   1493.9900     35.0663      8.8417
+    510.1810   1493.9800     35.0720      8.8304
+    511.1720   1493.9500     35.0683      8.8198
+    512.1640   1493.9301     35.0696      8.8091
+    513.1550   1493.9100     35.0705      8.8012
+    514.1460   1493.9100     35.0699      8.7954
+    515.1380   1493.9100     35.0700      8.7903
+    516.1290   1493.9100     35.0696      8.7857
+    517.1200   1493.9000     35.0686      8.7807
+    518.1120   1493.8900     35.0640      8.7745
+    519.1030   1493.8300     35.0524      8.7588
+    520.0940   1493.7500     35.0524      8.7331
+    521.0860   1493.7000     35.0574      8.7140
+    522.0770   1493.6899     35.0608      8.7039
+    523.0680   1493.6801     35.0559      8.6984
+    524.0590   1493.6200     35.0518      8.6809
+    525.0510   1493.5900     35.0545      8.6661
+    526.0420   1493.5699     35.0538      8.6568
+    527.0330   1493.5601     35.0547      8.6489
+    528.0250   1493.5500     35.0527      8.6428
+    529.0160   1493.5400     35.0546      8.6352
+    530.0070   1493.5100     35.0474      8.6259
+    530.9980   1493.4800     35.0515      8.6112
+    531.9900   1493.4700     35.0504      8.6043
+    532.9810   1493.4399     35.0439      8.5959
+    533.9720   1493.4000     35.0425      8.5804
+    534.9630   1493.3500     35.0391      8.5644
+    535.9540   1493.2600     35.0247      8.5408
+    536.9460   1493.1600     35.0340      8.5062
+    537.9370   1493.1300     35.0346      8.4926
+    538.9280   1493.0800     35.0318      8.4753
+    539.9190   1493.0400     35.0334      8.4613
+    540.9100   1493.0300     35.0376      8.4517
+    541.9020   1493.0300     35.0368      8.4473
+    542.8930   1493.0200     35.0363      8.4420
+    543.8840   1493.0100     35.0344      8.4357
+    544.8750   1492.9700     35.0262      8.4229
+    545.8660   1492.9301     35.0280      8.4080
+    546.8580   1492.9200     35.0313      8.3982
+    547.8490   1492.9100     35.0322      8.3927
+    548.8400   1492.9100     35.0301      8.3873
+    549.8310   1492.8900     35.0275      8.3789
+    550.8220   1492.8500     35.0226      8.3663
+    551.8130   1492.8199     35.0237      8.3532
+    552.8040   1492.7800     35.0192      8.3408
+    553.7960   1492.7400     35.0192      8.3258
+    554.7870   1492.6899     35.0157      8.3095
+    555.7780   1492.6200     35.0141      8.2849
+    556.7690   1492.5800     35.0192      8.2705
+    557.7600   1492.5699     35.0187      8.2631
+    558.7510   1492.5601     35.0171      8.2559
+    559.7420   1492.5300     35.0112      8.2455
+    560.7330   1492.5000     35.0138      8.2318
+    561.7250   1492.4700     35.0122      8.2197
+    562.7160   1492.4301     35.0107      8.2067
+    563.7070   1492.4100     35.0150      8.1961
+    564.6980   1492.3800     35.0056      8.1863
+    565.6890   1492.3199     35.0053      8.1662
+    566.6800   1492.2800     35.0069      8.1512
+    567.6710   1492.2400     35.0016      8.1368
+    568.6620   1492.1801     34.9992      8.1169
+    569.6530   1492.1300     35.0036      8.0999
+    570.6440   1492.1200     35.0067      8.0914
+    571.6350   1492.1200     35.0065      8.0879
+    572.6260   1492.1000     34.9949      8.0801
+    573.6170   1492.0300     34.9938      8.0586
+    574.6080   1491.9600     34.9920      8.0357
+    575.5990   1491.9100     34.9985      8.0166
+    576.5900   1491.9000     35.0004      8.0102
+    577.5810   1491.9100     35.0003      8.0066
+    578.5720   1491.8900     34.9954      8.0011
+    579.5640   1491.8700     34.9920      7.9919
+    580.5550   1491.8500     34.9919      7.9812
+    581.5460   1491.8300     34.9926      7.9727
+    582.5370   1491.8101     34.9867      7.9643
+    583.5280   1491.7400     34.9815      7.9431
+    584.5180   1491.6500     34.9814      7.9143
+    585.5090   1491.5699     34.9828      7.8889
+    586.5000   1491.5200     34.9823      7.8731
+    587.4910   1491.5000     34.9806      7.8644
+    588.4820   1491.4800     34.9807      7.8545
+    589.4730   1491.4800     34.9850      7.8474
+    590.4640   1491.4900     34.9876      7.8443
+    591.4550   1491.5000     34.9875      7.8436
+    592.4460   1491.5100     34.9883      7.8427
+    593.4370   1491.5300     34.9887      7.8429
+    594.4280   1491.5500     34.9880      7.8429
+    595.4190   1491.5601     34.9879      7.8422
+    596.4100   1491.5699     34.9875      7.8407
+    597.4010   1491.5800     34.9859      7.8396
+    598.3920   1491.5800     34.9854      7.8357
+    599.3830   1491.5601     34.9798      7.8290
+    600.3740   1491.5300     34.9828      7.8152
+    601.3650   1491.5300     34.9779      7.8113
+    602.3560   1491.4900     34.9671      7.8000
+    603.3460   1491.4399     34.9701      7.7819
+    604.3370   1491.3800     34.9680      7.7637
+    605.3280   1491.3400     34.9722      7.7457
+    606.3190   1491.2800     34.9682      7.7275
+    607.3100   1491.2200     34.9693      7.7090
+    608.3010   1491.1899     34.9701      7.6952
+    609.2920   1491.1700     34.9691      7.6854
+    610.2830   1491.1500     34.9699      7.6759
+    611.2730   1491.1300     34.9641      7.6683
+    612.2640   1491.0400     34.9513      7.6450
+    613.2550   1490.9600     34.9610      7.6174
+    614.2460   1490.9399     34.9689      7.6041
+    615.2370   1490.9500     34.9700      7.6019
+    616.2280   1490.9500     34.9676      7.5985
+    617.2190   1490.9399     34.9662      7.5931
+    618.2090   1490.9200     34.9564      7.5856
+    619.2000   1490.8700     34.9532      7.5719
+    620.1910   1490.8400     34.9562      7.5573
+    621.1820   1490.7900     34.9507      7.5433
+    622.1730   1490.7500     34.9525      7.5262
+    623.1630   1490.6700     34.9525      7.5022
+    624.1540   1490.6000     34.9569      7.4791
+    625.1450   1490.6000     34.9606      7.4718
+    626.1360   1490.6000     34.9579      7.4700
+    627.1270   1490.5900     34.9541      7.4639
+    628.1170   1490.5699     34.9539      7.4550
+    629.1080   1490.5601     34.9560      7.4467
+    630.0990   1490.5400     34.9511      7.4397
+    631.0900   1490.5100     34.9505      7.4265
+    632.0800   1490.4700     34.9507      7.4131
+    633.0710   1490.4301     34.9500      7.3988
+    634.0620   1490.3900     34.9485      7.3848
+    635.0530   1490.3400     34.9425      7.3689
+    636.0430   1490.3101     34.9489      7.3532
+    637.0340   1490.2900     34.9492      7.3449
+    638.0250   1490.2800     34.9500      7.3385
+    639.0160   1490.2800     34.9509      7.3330
+    640.0060   1490.2700     34.9504      7.3276
+    640.9970   1490.2700     34.9514      7.3230
+    641.9880   1490.2700     34.9489      7.3173
+    642.9790   1490.2400     34.9491      7.3066
+    643.9690   1490.2400     34.9500      7.3008
+    644.9600   1490.2400     34.9486      7.2968
+    645.9510   1490.2400     34.9494      7.2926
+    646.9410   1490.2400     34.9503      7.2900
+    647.9320   1490.2300     34.9419      7.2858
+    648.9230   1490.1801     34.9387      7.2680
+    649.9130   1490.1500     34.9467      7.2536
+    650.9040   1490.1300     34.9448      7.2450
+    651.8950   1490.1200     34.9433      7.2380
+    652.8850   1490.0900     34.9401      7.2275
+    653.8760   1490.0601     34.9413      7.2154
+    654.8670   1490.0400     34.9403      7.2065
+    655.8570   1490.0200     34.9424      7.1978
+    656.8480   1490.0200     34.9437      7.1911
+    657.8390   1490.0100     34.9444      7.1862
+    658.8290   1490.0200     34.9429      7.1835
+    659.8200   1490.0000     34.9381      7.1770
+    660.8100   1489.9800     34.9386      7.1655
+    661.8010   1489.9600     34.9396      7.1572
+    662.7920   1489.9500     34.9397      7.1489
+    663.7820   1489.9399     34.9406      7.1422
+    664.7730   1489.9301     34.9397      7.1351
+    665.7640   1489.9200     34.9411      7.1288
+    666.7540   1489.9200     34.9413      7.1251
+    667.7450   1489.9301     34.9422      7.1224
+    668.7350   1489.9399     34.9425      7.1206
+    669.7260   1489.9301     34.9380      7.1155
+    670.7160   1489.9301     34.9401      7.1100
+    671.7070   1489.9200     34.9365      7.1051
+    672.6980   1489.8900     34.9352      7.0933
+    673.6880   1489.8400     34.9331      7.0784
+    674.6790   1489.8300     34.9368      7.0685
+    675.6690   1489.8199     34.9348      7.0627
+    676.6600   1489.8101     34.9357      7.0550
+    677.6500   1489.7900     34.9351      7.0480
+    678.6410   1489.7800     34.9346      7.0403
+    679.6310   1489.7600     34.9333      7.0318
+    680.6220   1489.7400     34.9325      7.0226
+    681.6130   1489.6600     34.9180      7.0029
+    682.6030   1489.6000     34.9285      6.9790
+    683.5940   1489.5601     34.9294      6.9643
+    684.5840   1489.5200     34.9292      6.9500
+    685.5750   1489.5000     34.9297      6.9411
+    686.5650   1489.4700     34.9204      6.9309
+    687.5560   1489.4399     34.9276      6.9180
+    688.5460   1489.4399     34.9316      6.9126
+    689.5370   1489.4500     34.9331      6.9089
+    690.5270   1489.4500     34.9333      6.9058
+    691.5180   1489.4399     34.9287      6.9009
+    692.5080   1489.4200     34.9269      6.8905
+    693.4980   1489.4000     34.9289      6.8823
+    694.4890   1489.3900     34.9276      6.8760
+    695.4790   1489.3800     34.9286      6.8686
+    696.4700   1489.3600     34.9257      6.8611
+    697.4600   1489.3400     34.9258      6.8499
+    698.4510   1489.3101     34.9237      6.8399
+    699.4410   1489.2700     34.9199      6.8273
+    700.4320   1489.2000     34.9162      6.8046
+    701.4220   1489.1500     34.9241      6.7864
+    702.4120   1489.1200     34.9215      6.7749
+    703.4030   1489.0800     34.9238      6.7606
+    704.3930   1489.0800     34.9264      6.7538
+    705.3840   1489.0800     34.9274      6.7506
+    706.3740   1489.0900     34.9264      6.7485
+    707.3650   1489.0900     34.9258      6.7454
+    708.3550   1489.0900     34.9248      6.7404
+    709.3450   1489.0800     34.9270      6.7336
+    710.3360   1489.0699     34.9245      6.7278
+    711.3260   1489.0500     34.9254      6.7193
+    712.3160   1489.0500     34.9242      6.7143
+    713.3070   1489.0400     34.9234      6.7085
+    714.2970   1489.0300     34.9201      6.7021
+    715.2880   1488.9900     34.9184      6.6877
+    716.2780   1488.9500     34.9192      6.6740
+    717.2680   1488.9301     34.9216      6.6640
+    718.2590   1488.9200     34.9230      6.6578
+    719.2490   1488.9100     34.9235      6.6502
+    720.2390   1488.9100     34.9230      6.6453
+    721.2300   1488.9000     34.9215      6.6399
+    722.2200   1488.8900     34.9198      6.6326
+    723.2100   1488.8600     34.9185      6.6232
+    724.2010   1488.8300     34.9165      6.6095
+    725.1910   1488.7900     34.9204      6.5952
+    726.1810   1488.7800     34.9214      6.5870
+    727.1720   1488.7700     34.9209      6.5815
+    728.1620   1488.7600     34.9194      6.5752
+    729.1520   1488.7400     34.9192      6.5668
+    730.1430   1488.7400     34.9201      6.5611
+    731.1330   1488.7300     34.9205      6.5554
+    732.1230   1488.7300     34.9211      6.5496
+    733.1130   1488.7200     34.9218      6.5425
+    734.1040   1488.7100     34.9223      6.5375
+    735.0940   1488.6899     34.9156      6.5307
+    736.0840   1488.6600     34.9148      6.5189
+    737.0740   1488.6400     34.9186      6.5084
+    738.0650   1488.6400     34.9202      6.5028
+    739.0550   1488.6400     34.9196      6.4982
+    740.0450   1488.6200     34.9187      6.4915
+    741.0350   1488.6100     34.9203      6.4834
+    742.0260   1488.6100     34.9215      6.4790
+    743.0160   1488.6200     34.9215      6.4774
+    744.0060   1488.6100     34.9143      6.4735
+    744.9960   1488.6000     34.9155      6.4650
+    745.9870   1488.5601     34.9113      6.4531
+    746.9770   1488.5300     34.9161      6.4392
+    747.9670   1488.5100     34.9182      6.4303
+    748.9570   1488.5000     34.9174      6.4222
+    749.9470   1488.4900     34.9191      6.4155
+    750.9380   1488.4900     34.9182      6.4117
+    751.9280   1488.4800     34.9154      6.4060
+    752.9180   1488.4700     34.9189      6.3979
+    753.9080   1488.4800     34.9209      6.3954
+    754.8980   1488.4800     34.9189      6.3936
+    755.8890   1488.4800     34.9186      6.3884
+    756.8790   1488.4700     34.9160      6.3821
+    757.8690   1488.4399     34.9111      6.3735
+    758.8590   1488.4200     34.9148      6.3626
+    759.8490   1488.4100     34.9159      6.3551
+    760.8390   1488.4000     34.9161      6.3483
+    761.8290   1488.3700     34.9153      6.3378
+    762.8200   1488.3500     34.9167      6.3283
+    763.8100   1488.3400     34.9174      6.3212
+    764.8000   1488.3400     34.9167      6.3154
+    765.7900   1488.3199     34.9163      6.3085
+    766.7800   1488.3000     34.9134      6.3002
+    767.7700   1488.2700     34.9130      6.2875
+    768.7600   1488.2500     34.9165      6.2778
+    769.7500   1488.2500     34.9192      6.2728
+    770.7410   1488.2400     34.9124      6.2667
+    771.7310   1488.1600     34.9098      6.2435
+    772.7210   1488.1100     34.9129      6.2258
+    773.7110   1488.0699     34.9107      6.2134
+    774.7010   1488.0400     34.9109      6.2011
+    775.6910   1488.0200     34.9142      6.1903
+    776.6810   1488.0200     34.9187      6.1844
+    777.6710   1488.0200     34.9195      6.1823
+    778.6610   1488.0400     34.9187      6.1816
+    779.6510   1488.0400     34.9175      6.1787
+    780.6410   1488.0500     34.9179      6.1757
+    781.6310   1488.0300     34.9157      6.1695
+    782.6210   1488.0200     34.9154      6.1617
+    783.6110   1488.0200     34.9170      6.1562
+    784.6010   1488.0100     34.9168      6.1507
+    785.5910   1488.0100     34.9178      6.1451
+    786.5820   1488.0000     34.9169      6.1407
+    787.5720   1488.0000     34.9174      6.1354
+    788.5620   1487.9900     34.9136      6.1311
+    789.5520   1487.9700     34.9118      6.1219
+    790.5420   1487.9301     34.9103      6.1082
+    791.5320   1487.9100     34.9153      6.0962
+    792.5220   1487.9000     34.9179      6.0900
+    793.5120   1487.9000     34.9184      6.0862
+    794.5020   1487.9100     34.9182      6.0830
+    795.4920   1487.8900     34.9146      6.0772
+    796.4820   1487.8800     34.9166      6.0690
+    797.4710   1487.8900     34.9188      6.0654
+    798.4610   1487.8800     34.9118      6.0621
+    799.4510   1487.8500     34.9162      6.0500
+    800.4410   1487.8600     34.9192      6.0454
+    801.4310   1487.8700     34.9185      6.0443
+    802.4210   1487.8700     34.9182      6.0411
+    803.4110   1487.8500     34.9144      6.0338
+    804.4010   1487.8199     34.9154      6.0224
+    805.3910   1487.8199     34.9172      6.0163
+    806.3810   1487.8199     34.9185      6.0130
+    807.3710   1487.8300     34.9178      6.0105
+    808.3610   1487.8199     34.9153      6.0054
+    809.3510   1487.8000     34.9159      5.9950
+    810.3410   1487.7900     34.9184      5.9873
+    811.3310   1487.7900     34.9194      5.9844
+    812.3210   1487.8000     34.9192      5.9830
+    813.3100   1487.8101     34.9183      5.9805
+    814.3000   1487.8101     34.9176      5.9761
+    815.2900   1487.8101     34.9197      5.9723
+    816.2800   1487.8199     34.9196      5.9703
+    817.2700   1487.8199     34.9177      5.9673
+    818.2600   1487.8199     34.9178      5.9625
+    819.2500   1487.8199     34.9189      5.9586
+    820.2400   1487.8300     34.9200      5.9562
+    821.2290   1487.8400     34.9205      5.9546
+    822.2190   1487.8500     34.9189      5.9531
+    823.2090   1487.8500     34.9181      5.9494
+    824.1990   1487.8500     34.9189      5.9457
+    825.1890   1487.8500     34.9195      5.9425
+    826.1790   1487.8600     34.9198      5.9401
+    827.1690   1487.8700     34.9193      5.9379
+    828.1580   1487.8600     34.9145      5.9337
+    829.1480   1487.8400     34.9164      5.9239
+    830.1380   1487.8199     34.9103      5.9167
+    831.1280   1487.8000     34.9143      5.9053
+    832.1180   1487.7800     34.9165      5.8971
+    833.1070   1487.7900     34.9205      5.8926
+    834.0970   1487.8000     34.9208      5.8911
+    835.0870   1487.8000     34.9193      5.8881
+    836.0770   1487.8101     34.9205      5.8854
+    837.0670   1487.8199     34.9198      5.8837
+    838.0560   1487.8199     34.9192      5.8803
+    839.0460   1487.8101     34.9180      5.8756
+    840.0360   1487.8101     34.9190      5.8697
+    841.0260   1487.8101     34.9198      5.8653
+    842.0150   1487.8101     34.9200      5.8625
+    843.0050   1487.8199     34.9208      5.8596
+    843.9950   1487.8300     34.9216      5.8585
+    844.9850   1487.8400     34.9211      5.8577
+    845.9740   1487.8500     34.9185      5.8547
+    846.9640   1487.8400     34.9177      5.8492
+    847.9540   1487.8199     34.9158      5.8414
+    848.9440   1487.7900     34.9120      5.8315
+    849.9330   1487.7400     34.9126      5.8133
+    850.9230   1487.7200     34.9191      5.8017
+    851.9130   1487.7200     34.9207      5.7972
+    852.9030   1487.7200     34.9207      5.7948
+    853.8920   1487.7200     34.9191      5.7907
+    854.8820   1487.7200     34.9198      5.7864
+    855.8720   1487.7200     34.9190      5.7834
+    856.8610   1487.6801     34.9115      5.7715
+    857.8510   1487.6300     34.9169      5.7527
+    858.8410   1487.6200     34.9210      5.7435
+    859.8300   1487.6200     34.9198      5.7403
+    860.8200   1487.6200     34.9208      5.7367
+    861.8100   1487.6300     34.9210      5.7342
+    862.7990   1487.6300     34.9211      5.7302
+    863.7890   1487.6300     34.9211      5.7264
+    864.7790   1487.6400     34.9225      5.7238
+    865.7680   1487.6500     34.9228      5.7227
+    866.7580   1487.6600     34.9226      5.7221
+    867.7480   1487.6700     34.9217      5.7210
+    868.7370   1487.6801     34.9209      5.7191
+    869.7270   1487.6801     34.9188      5.7151
+    870.7170   1487.6700     34.9193      5.7079
+    871.7060   1487.6600     34.9217      5.7017
+    872.6960   1487.6700     34.9228      5.6989
+    873.6850   1487.6801     34.9232      5.6979
+    874.6750   1487.6899     34.9219      5.6966
+    875.6650   1487.6899     34.9201      5.6937
+    876.6540   1487.6801     34.9188      5.6873
+    877.6440   1487.6700     34.9217      5.6799
+    878.6330   1487.6600     34.9194      5.6744
+    879.6230   1487.6400     34.9171      5.6662
+    880.6130   1487.6200     34.9196      5.6565
+    881.6020   1487.6000     34.9163      5.6480
+    882.5920   1487.5601     34.9208      5.6327
+    883.5810   1487.5500     34.9234      5.6246
+    884.5710   1487.5500     34.9220      5.6221
+    885.5600   1487.5500     34.9210      5.6176
+    886.5500   1487.5500     34.9217      5.6125
+    887.5390   1487.5300     34.9168      5.6065
+    888.5290   1487.5100     34.9210      5.5946
+    889.5190   1487.4900     34.9237      5.5861
+    890.5080   1487.5000     34.9256      5.5828
+    891.4980   1487.5100     34.9251      5.5820
+    892.4870   1487.5200     34.9231      5.5805
+    893.4770   1487.5100     34.9230      5.5742
+    894.4660   1487.5200     34.9256      5.5709
+    895.4560   1487.5300     34.9255      5.5700
+    896.4450   1487.5400     34.9252      5.5689
+    897.4350   1487.5400     34.9239      5.5661
+    898.4240   1487.5500     34.9243      5.5624
+    899.4140   1487.5500     34.9249      5.5589
+    900.4030   1487.5500     34.9224      5.5551
+    901.3930   1487.5400     34.9226      5.5493
+    902.3820   1487.5300     34.9227      5.5436
+    903.3720   1487.5300     34.9248      5.5387
+    904.3610   1487.5400     34.9256      5.5356
+    905.3500   1487.5400     34.9253      5.5319
+    906.3400   1487.5300     34.9225      5.5252
+    907.3290   1487.5100     34.9218      5.5175
+    908.3190   1487.5000     34.9226      5.5098
+    909.3080   1487.4900     34.9243      5.5046
+    910.2980   1487.4900     34.9263      5.5001
+    911.2870   1487.5000     34.9252      5.4973
+    912.2770   1487.4900     34.9262      5.4913
+    913.2660   1487.4900     34.9258      5.4867
+    914.2550   1487.4900     34.9258      5.4823
+    915.2450   1487.4800     34.9247      5.4780
+    916.2340   1487.4800     34.9262      5.4721
+    917.2240   1487.4800     34.9263      5.4690
+    918.2130   1487.4800     34.9250      5.4652
+    919.2020   1487.4700     34.9255      5.4584
+    920.1920   1487.4700     34.9272      5.4530
+    921.1810   1487.4700     34.9284      5.4499
+    922.1710   1487.4800     34.9279      5.4480
+    923.1600   1487.4900     34.9280      5.4461
+    924.1490   1487.4800     34.9232      5.4410
+    925.1390   1487.4600     34.9252      5.4304
+    926.1280   1487.4399     34.9270      5.4226
+    927.1170   1487.4301     34.9259      5.4165
+    928.1070   1487.4301     34.9271      5.4111
+    929.0960   1487.4200     34.9265      5.4057
+    930.0850   1487.4200     34.9259      5.4008
+    931.0750   1487.4000     34.9258      5.3929
+    932.0640   1487.4000     34.9281      5.3862
+    933.0530   1487.4000     34.9297      5.3820
+    934.0430   1487.4000     34.9289      5.3785
+    935.0320   1487.4000     34.9302      5.3744
+    936.0210   1487.4100     34.9309      5.3731
+    937.0110   1487.4200     34.9308      5.3719
+    938.0000   1487.4399     34.9308      5.3708
+    938.9890   1487.4500     34.9312      5.3701
+    939.9790   1487.4600     34.9304      5.3694
+    940.9680   1487.4600     34.9286      5.3648
+    941.9570   1487.4600     34.9319      5.3608
+    942.9470   1487.4700     34.9306      5.3598
+    943.9360   1487.4800     34.9295      5.3576
+    944.9250   1487.4800     34.9311      5.3539
+    945.9140   1487.4900     34.9315      5.3526
+    946.9040   1487.5000     34.9313      5.3513
+    947.8930   1487.5200     34.9310      5.3502
+    948.8820   1487.5300     34.9307      5.3485
+    949.8710   1487.5300     34.9305      5.3456
+    950.8610   1487.5300     34.9313      5.3408
+    951.8500   1487.5300     34.9319      5.3377
+    952.8390   1487.5400     34.9316      5.3366
+    953.8280   1487.5500     34.9313      5.3353
+    954.8180   1487.5601     34.9306      5.3330
+    955.8070   1487.5699     34.9310      5.3304
+    956.7960   1487.5699     34.9309      5.3270
+    957.7850   1487.5601     34.9309      5.3214
+    958.7740   1487.5500     34.9281      5.3159
+    959.7640   1487.5400     34.9300      5.3077
+    960.7530   1487.5400     34.9325      5.3024
+    961.7420   1487.5500     34.9336      5.3004
+    962.7310   1487.5601     34.9330      5.3000
+    963.7200   1487.5699     34.9320      5.2980
+    964.7100   1487.5699     34.9313      5.2936
+    965.6990   1487.5601     34.9292      5.2886
+    966.6880   1487.5300     34.9291      5.2785
+    967.6770   1487.5200     34.9302      5.2709
+    968.6660   1487.5100     34.9323      5.2623
+    969.6550   1487.5100     34.9342      5.2577
+    970.6450   1487.5100     34.9346      5.2554
+    971.6340   1487.5200     34.9338      5.2536
+    972.6230   1487.5200     34.9332      5.2505
+    973.6120   1487.5300     34.9340      5.2471
+    974.6010   1487.5400     34.9355      5.2447
+    975.5900   1487.5500     34.9344      5.2431
+    976.5790   1487.5500     34.9342      5.2409
+    977.5680   1487.5601     34.9355      5.2386
+    978.5580   1487.5699     34.9352      5.2372
+    979.5470   1487.5800     34.9347      5.2352
+    980.5360   1487.5800     34.9344      5.2327
+    981.5250   1487.5900     34.9346      5.2305
+    982.5140   1487.6000     34.9340      5.2278
+    983.5030   1487.5900     34.9299      5.2230
+    984.4920   1487.5800     34.9342      5.2153
+    985.4810   1487.5800     34.9363      5.2110
+    986.4700   1487.5900     34.9367      5.2102
+    987.4590   1487.6100     34.9353      5.2093
+    988.4480   1487.6100     34.9345      5.2067
+    989.4380   1487.6100     34.9339      5.2025
+    990.4270   1487.6000     34.9344      5.1968
+    991.4160   1487.5900     34.9349      5.1899
+    992.4050   1487.5900     34.9359      5.1839
+    993.3940   1487.5900     34.9352      5.1813
+    994.3830   1487.5900     34.9350      5.1770
+    995.3720   1487.5900     34.9344      5.1731
+    996.3610   1487.5900     34.9355      5.1679
+    997.3500   1487.5900     34.9366      5.1638
+    998.3390   1487.5900     34.9372      5.1605
+    999.3280   1487.5900     34.9367      5.1562
+   1000.3170   1487.5900     34.9374      5.1522
+   1001.3060   1487.5900     34.9359      5.1487
+   1002.2950   1487.5900     34.9375      5.1438
+   1003.2840   1487.6000     34.9370      5.1420
+   1004.2730   1487.6000     34.9363      5.1391
+   1005.2620   1487.6000     34.9367      5.1356
+   1006.2510   1487.6100     34.9382      5.1320
+   1007.2400   1487.6100     34.9384      5.1289
+   1008.2290   1487.6200     34.9393      5.1267
+   1009.2180   1487.6300     34.9391      5.1262
+   1010.2070   1487.6500     34.9391      5.1256
+   1011.1960   1487.6500     34.9362      5.1235
+   1012.1850   1487.6300     34.9336      5.1157
+   1013.1740   1487.6300     34.9375      5.1087
+   1014.1630   1487.6300     34.9393      5.1050
+   1015.1520   1487.6300     34.9375      5.1019
+   1016.1400   1487.6300     34.9375      5.0969
+   1017.1290   1487.6200     34.9385      5.0907
+   1018.1180   1487.6100     34.9380      5.0849
+   1019.1070   1487.6000     34.9391      5.0772
+   1020.0960   1487.6000     34.9394      5.0748
+   1021.0850   1487.6100     34.9402      5.0722
+   1022.0740   1487.6200     34.9409      5.0708
+   1023.0630   1487.6300     34.9397      5.0692
+   1024.0520   1487.6300     34.9398      5.0653
+   1025.0410   1487.6300     34.9394      5.0608
+   1026.0300   1487.6300     34.9407      5.0563
+   1027.0179   1487.6300     34.9416      5.0534
+   1028.0070   1487.6500     34.9415      5.0526
+   1028.9960   1487.6600     34.9414      5.0515
+   1029.9850   1487.6700     34.9399      5.0499
+   1030.9740   1487.6600     34.9356      5.0449
+   1031.9630   1487.6300     34.9370      5.0338
+   1032.9520   1487.6100     34.9399      5.0233
+   1033.9410   1487.6000     34.9417      5.0178
+   1034.9290   1487.6100     34.9429      5.0138
+   1035.9180   1487.6200     34.9428      5.0129
+   1036.9070   1487.6300     34.9424      5.0112
+   1037.8960   1487.6400     34.9416      5.0094
+   1038.8850   1487.6400     34.9419      5.0069
+   1039.8740   1487.6500     34.9411      5.0040
+   1040.8621   1487.6300     34.9394      4.9977
+   1041.8510   1487.6100     34.9419      4.9878
+   1042.8400   1487.6100     34.9435      4.9823
+   1043.8290   1487.6100     34.9426      4.9792
+   1044.8180   1487.6300     34.9448      4.9779
+   1045.8060   1487.6400     34.9438      4.9775
+   1046.7950   1487.6500     34.9441      4.9761
+   1047.7841   1487.6600     34.9439      4.9741
+   1048.7729   1487.6600     34.9433      4.9708
+   1049.7620   1487.6700     34.9448      4.9679
+   1050.7500   1487.6801     34.9440      4.9670
+   1051.7390   1487.6700     34.9426      4.9625
+   1052.7280   1487.6600     34.9404      4.9564
+   1053.7170   1487.6400     34.9403      4.9479
+   1054.7050   1487.6300     34.9426      4.9406
+   1055.6940   1487.6300     34.9435      4.9358
+   1056.6830   1487.6400     34.9454      4.9321
+   1057.6720   1487.6400     34.9460      4.9299
+   1058.6600   1487.6500     34.9461      4.9281
+   1059.6490   1487.6600     34.9462      4.9267
+   1060.6379   1487.6700     34.9447      4.9248
+   1061.6260   1487.6700     34.9439      4.9217
+   1062.6150   1487.6700     34.9424      4.9174
+   1063.6040   1487.6600     34.9431      4.9104
+   1064.5930   1487.6500     34.9450      4.9044
+   1065.5811   1487.6500     34.9472      4.9001
+   1066.5699   1487.6600     34.9455      4.8984
+   1067.5590   1487.6500     34.9455      4.8916
+   1068.5470   1487.6600     34.9470      4.8890
+   1069.5360   1487.6700     34.9475      4.8873
+   1070.5250   1487.6801     34.9476      4.8856
+   1071.5129   1487.6899     34.9479      4.8845
+   1072.5020   1487.7000     34.9473      4.8834
+   1073.4910   1487.7100     34.9484      4.8818
+   1074.4790   1487.7200     34.9474      4.8805
+   1075.4680   1487.7300     34.9475      4.8774
+   1076.4570   1487.7300     34.9469      4.8734
+   1077.4449   1487.7300     34.9481      4.8708
+   1078.4340   1487.7300     34.9452      4.8675
+   1079.4230   1487.7300     34.9462      4.8617
+   1080.4110   1487.7200     34.9476      4.8566
+   1081.4000   1487.7300     34.9487      4.8545
+   1082.3890   1487.7400     34.9473      4.8521
+   1083.3770   1487.7300     34.9471      4.8466
+   1084.3660   1487.7300     34.9490      4.8418
+   1085.3540   1487.7400     34.9493      4.8397
+   1086.3430   1487.7500     34.9501      4.8379
+   1087.3320   1487.7600     34.9505      4.8372
+   1088.3199   1487.7800     34.9503      4.8373
+   1089.3090   1487.8000     34.9505      4.8373
+   1090.2970   1487.8000     34.9473      4.8365
+   1091.2860   1487.8101     34.9481      4.8324
+   1092.2750   1487.7900     34.9471      4.8258
+   1093.2629   1487.7800     34.9501      4.8181
+   1094.2520   1487.7900     34.9507      4.8164
+   1095.2400   1487.8000     34.9498      4.8149
+   1096.2290   1487.8000     34.9485      4.8109
+   1097.2170   1487.8000     34.9504      4.8065
+   1098.2061   1487.8101     34.9508      4.8036
+   1099.1940   1487.8101     34.9502      4.8003
+   1100.1830   1487.8101     34.9504      4.7969
+   1101.1720   1487.8000     34.9485      4.7915
+   1102.1600   1487.7900     34.9490      4.7843
+   1103.1490   1487.7900     34.9517      4.7794
+   1104.1370   1487.7900     34.9513      4.7752
+   1105.1260   1487.8000     34.9532      4.7731
+   1106.1140   1487.8101     34.9533      4.7725
+   1107.1030   1487.8300     34.9534      4.7722
+   1108.0909   1487.8400     34.9532      4.7719
+   1109.0800   1487.8600     34.9530      4.7716
+   1110.0680   1487.8600     34.9523      4.7687
+   1111.0570   1487.8700     34.9531      4.7667
+   1112.0450   1487.8800     34.9528      4.7646
+   1113.0341   1487.8800     34.9525      4.7623
+   1114.0220   1487.8900     34.9523      4.7598
+   1115.0100   1487.8900     34.9523      4.7567
+   1115.9990   1487.9000     34.9524      4.7537
+   1116.9871   1487.8900     34.9524      4.7489
+   1117.9760   1487.9000     34.9546      4.7454
+   1118.9640   1487.9100     34.9523      4.7438
+   1119.9530   1487.9000     34.9521      4.7391
+   1120.9410   1487.9100     34.9543      4.7356
+   1121.9301   1487.9200     34.9546      4.7339
+   1122.9180   1487.9200     34.9520      4.7302
+   1123.9070   1487.9100     34.9540      4.7239
+   1124.8950   1487.9100     34.9554      4.7206
+   1125.8831   1487.9200     34.9553      4.7192
+   1126.8719   1487.9301     34.9542      4.7165
+   1127.8600   1487.9200     34.9547      4.7108
+   1128.8490   1487.9200     34.9561      4.7068
+   1129.8370   1487.9399     34.9564      4.7061
+   1130.8250   1487.9500     34.9560      4.7043
+   1131.8140   1487.9399     34.9541      4.6999
+   1132.8020   1487.9100     34.9518      4.6879
+   1133.7910   1487.8700     34.9570      4.6736
+   1134.7791   1487.8700     34.9574      4.6698
+   1135.7670   1487.8800     34.9567      4.6672
+   1136.7560   1487.8800     34.9578      4.6634
+   1137.7440   1487.8900     34.9579      4.6627
+   1138.7321   1487.9100     34.9579      4.6625
+   1139.7209   1487.9200     34.9580      4.6616
+   1140.7090   1487.9301     34.9578      4.6606
+   1141.6970   1487.9399     34.9575      4.6592
+   1142.6860   1487.9500     34.9582      4.6565
+   1143.6740   1487.9600     34.9579      4.6551
+   1144.6620   1487.9700     34.9580      4.6531
+   1145.6510   1487.9700     34.9576      4.6495
+   1146.6390   1487.9700     34.9585      4.6449
+   1147.6270   1487.9800     34.9591      4.6434
+   1148.6160   1487.9900     34.9586      4.6415
+   1149.6040   1487.9900     34.9588      4.6379
+   1150.5920   1488.0000     34.9589      4.6364
+   1151.5811   1488.0100     34.9590      4.6344
+   1152.5690   1488.0200     34.9591      4.6331
+   1153.5570   1488.0300     34.9580      4.6313
+   1154.5450   1488.0200     34.9568      4.6262
+   1155.5341   1488.0100     34.9592      4.6203
+   1156.5220   1488.0200     34.9585      4.6174
+   1157.5100   1488.0200     34.9590      4.6131
+   1158.4990   1488.0200     34.9599      4.6092
+   1159.4871   1488.0300     34.9596      4.6074
+   1160.4750   1488.0300     34.9586      4.6032
+   1161.4630   1488.0300     34.9600      4.5992
+   1162.4520   1488.0400     34.9608      4.5973
+   1163.4399   1488.0500     34.9601      4.5963
+   1164.4280   1488.0500     34.9604      4.5935
+   1165.4160   1488.0601     34.9607      4.5920
+   1166.4041   1488.0699     34.9599      4.5900
+   1167.3929   1488.0699     34.9595      4.5859
+   1168.3810   1488.0601     34.9598      4.5804
+   1169.3690   1488.0601     34.9598      4.5759
+   1170.3571   1488.0601     34.9610      4.5709
+   1171.3459   1488.0699     34.9613      4.5692
+   1172.3340   1488.0800     34.9614      4.5670
+   1173.3220   1488.0900     34.9619      4.5658
+   1174.3101   1488.1000     34.9609      4.5648
+   1175.2980   1488.1000     34.9602      4.5607
+   1176.2860   1488.1000     34.9620      4.5562
+   1177.2750   1488.1100     34.9623      4.5551
+   1178.2629   1488.1300     34.9627      4.5546
+   1179.2510   1488.1400     34.9624      4.5542
+   1180.2390   1488.1600     34.9626      4.5539
+   1181.2271   1488.1700     34.9622      4.5534
+   1182.2150   1488.1801     34.9623      4.5521
+   1183.2040   1488.1899     34.9624      4.5507
+   1184.1920   1488.2000     34.9626      4.5497
+   1185.1801   1488.2200     34.9624      4.5489
+   1186.1680   1488.2300     34.9624      4.5475
+   1187.1560   1488.2400     34.9623      4.5457
+   1188.1440   1488.2400     34.9619      4.5432
+   1189.1320   1488.2300     34.9618      4.5365
+   1190.1210   1488.2300     34.9636      4.5327
+   1191.1090   1488.2500     34.9629      4.5328
+   1192.0970   1488.2500     34.9621      4.5294
+   1193.0850   1488.2500     34.9637      4.5257
+   1194.0730   1488.2600     34.9637      4.5238
+   1195.0610   1488.2700     34.9638      4.5224
+   1196.0490   1488.2900     34.9640      4.5210
+   1197.0370   1488.3000     34.9639      4.5206
+   1198.0250   1488.3101     34.9635      4.5197
+   1199.0129   1488.3199     34.9639      4.5178
+   1200.0010   1488.3300     34.9646      4.5167
+   1200.9890   1488.3500     34.9645      4.5165
+   1201.9780   1488.3600     34.9642      4.5162
+   1202.9659   1488.3800     34.9647      4.5159
+   1203.9540   1488.3900     34.9637      4.5155
+   1204.9420   1488.4000     34.9632      4.5128
+   1205.9301   1488.4000     34.9643      4.5093
+   1206.9180   1488.4100     34.9649      4.5081
+   1207.9060   1488.4301     34.9644      4.5077
+   1208.8940   1488.4399     34.9644      4.5063
+   1209.8820   1488.4500     34.9636      4.5041
+   1210.8700   1488.4500     34.9641      4.5014
+   1211.8580   1488.4600     34.9651      4.4992
+   1212.8459   1488.4800     34.9654      4.4991
+   1213.8340   1488.4900     34.9654      4.4992
+   1214.8220   1488.5100     34.9650      4.4988
+   1215.8101   1488.5200     34.9642      4.4976
+   1216.7980   1488.5300     34.9647      4.4961
+   1217.7860   1488.5400     34.9643      4.4945
+   1218.7740   1488.5500     34.9656      4.4923
+   1219.7620   1488.5601     34.9655      4.4920
+   1220.7500   1488.5800     34.9642      4.4916
+   1221.7380   1488.5800     34.9642      4.4884
+   1222.7260   1488.5900     34.9653      4.4861
+   1223.7140   1488.6000     34.9659      4.4853
+   1224.7020   1488.6200     34.9658      4.4851
+   1225.6899   1488.6300     34.9658      4.4843
+   1226.6770   1488.6400     34.9657      4.4840
+   1227.6650   1488.6600     34.9659      4.4839
+   1228.6530   1488.6801     34.9657      4.4836
+   1229.6410   1488.6899     34.9657      4.4832
+   1230.6290   1488.7000     34.9654      4.4821
+   1231.6169   1488.7100     34.9658      4.4808
+   1232.6050   1488.7300     34.9652      4.4801
+   1233.5930   1488.7400     34.9658      4.4789
+   1234.5811   1488.7500     34.9642      4.4775
+   1235.5690   1488.7500     34.9663      4.4737
+   1236.5570   1488.7600     34.9657      4.4728
+   1237.5450   1488.7700     34.9655      4.4714
+   1238.5320   1488.7800     34.9656      4.4699
+   1239.5200   1488.8000     34.9662      4.4688
+   1240.5081   1488.8101     34.9664      4.4675
+   1241.4960   1488.8199     34.9660      4.4663
+   1242.4840   1488.8300     34.9657      4.4641
+   1243.4720   1488.8300     34.9661      4.4615
+   1244.4600   1488.8400     34.9664      4.4600
+   1245.4480   1488.8500     34.9667      4.4587
+   1246.4351   1488.8700     34.9670      4.4581
+   1247.4230   1488.8800     34.9660      4.4568
+   1248.4110   1488.8900     34.9663      4.4545
+   1249.3990   1488.8900     34.9665      4.4520
+   1250.3870   1488.9000     34.9669      4.4501
+   1251.3750   1488.9100     34.9671      4.4486
+   1252.3621   1488.9200     34.9667      4.4471
+   1253.3500   1488.9301     34.9669      4.4450
+   1254.3380   1488.9399     34.9671      4.4434
+   1255.3260   1488.9500     34.9673      4.4419
+   1256.3140   1488.9600     34.9681      4.4410
+   1257.3010   1488.9800     34.9680      4.4408
+   1258.2889   1488.9900     34.9665      4.4394
+   1259.2770   1488.9900     34.9658      4.4357
+   1260.2650   1488.9900     34.9670      4.4319
+   1261.2531   1489.0000     34.9681      4.4296
+   1262.2400   1489.0100     34.9685      4.4289
+   1263.2280   1489.0300     34.9685      4.4285
+   1264.2159   1489.0400     34.9687      4.4283
+   1265.2040   1489.0601     34.9687      4.4282
+   1266.1910   1489.0800     34.9688      4.4283
+   1267.1790   1489.0900     34.9683      4.4282
+   1268.1670   1489.1100     34.9683      4.4282
+   1269.1550   1489.1200     34.9674      4.4275
+   1270.1420   1489.1300     34.9675      4.4246
+   1271.1300   1489.1300     34.9684      4.4217
+   1272.1180   1489.1400     34.9682      4.4206
+   1273.1060   1489.1500     34.9681      4.4191
+   1274.0930   1489.1600     34.9686      4.4175
+   1275.0811   1489.1801     34.9691      4.4168
+   1276.0690   1489.1899     34.9687      4.4164
+   1277.0560   1489.2000     34.9681      4.4149
+   1278.0439   1489.2100     34.9684      4.4122
+   1279.0320   1489.2100     34.9689      4.4098
+   1280.0200   1489.2300     34.9693      4.4088
+   1281.0070   1489.2400     34.9693      4.4083
+   1281.9950   1489.2500     34.9687      4.4070
+   1282.9830   1489.2600     34.9694      4.4051
+   1283.9700   1489.2800     34.9700      4.4044
+   1284.9580   1489.2900     34.9698      4.4047
+   1285.9460   1489.3101     34.9701      4.4048
+   1286.9330   1489.3300     34.9699      4.4049
+   1287.9210   1489.3400     34.9698      4.4047
+   1288.9091   1489.3600     34.9698      4.4047
+   1289.8960   1489.3700     34.9694      4.4041
+   1290.8840   1489.3900     34.9694      4.4032
+   1291.8710   1489.4000     34.9699      4.4025
+   1292.8590   1489.4100     34.9693      4.4020
+   1293.8470   1489.4200     34.9690      4.4002
+   1294.8340   1489.4301     34.9694      4.3988
+   1295.8220   1489.4500     34.9699      4.3978
+   1296.8101   1489.4600     34.9696      4.3968
+   1297.7970   1489.4700     34.9699      4.3958
+   1298.7850   1489.4800     34.9702      4.3951
+   1299.7720   1489.5000     34.9695      4.3943
+   1300.7600   1489.5100     34.9702      4.3933
+   1301.7480   1489.5200     34.9703      4.3929
+   1302.7350   1489.5400     34.9706      4.3927
+   1303.7230   1489.5601     34.9709      4.3926
+   1304.7100   1489.5699     34.9702      4.3927
+   1305.6980   1489.5900     34.9702      4.3923
+   1306.6851   1489.6000     34.9707      4.3915
+   1307.6730   1489.6200     34.9702      4.3913
+   1308.6610   1489.6300     34.9703      4.3910
+   1309.6479   1489.6500     34.9706      4.3907
+   1310.6360   1489.6600     34.9703      4.3905
+   1311.6230   1489.6801     34.9701      4.3899
+   1312.6110   1489.6899     34.9702      4.3891
+   1313.5980   1489.7000     34.9700      4.3877
+   1314.5861   1489.7100     34.9702      4.3857
+   1315.5730   1489.7200     34.9704      4.3852
+   1316.5610   1489.7400     34.9702      4.3843
+   1317.5480   1489.7500     34.9697      4.3827
+   1318.5360   1489.7600     34.9708      4.3808
+   1319.5229   1489.7700     34.9710      4.3804
+   1320.5110   1489.7900     34.9708      4.3801
+   1321.4980   1489.8000     34.9706      4.3788
+   1322.4860   1489.8101     34.9710      4.3779
+   1323.4730   1489.8300     34.9711      4.3776
+   1324.4611   1489.8400     34.9711      4.3775
+   1325.4480   1489.8500     34.9707      4.3769
+   1326.4360   1489.8700     34.9707      4.3759
+   1327.4230   1489.8800     34.9715      4.3741
+   1328.4110   1489.8900     34.9711      4.3740
+   1329.3979   1489.9100     34.9712      4.3736
+   1330.3860   1489.9200     34.9710      4.3732
+   1331.3730   1489.9399     34.9713      4.3723
+   1332.3610   1489.9500     34.9713      4.3717
+   1333.3480   1489.9600     34.9715      4.3714
+   1334.3350   1489.9800     34.9713      4.3712
+   1335.3230   1490.0000     34.9712      4.3709
+   1336.3101   1490.0100     34.9715      4.3704
+   1337.2980   1490.0200     34.9715      4.3699
+   1338.2850   1490.0400     34.9716      4.3696
+   1339.2729   1490.0601     34.9716      4.3693
+   1340.2600   1490.0699     34.9715      4.3691
+   1341.2469   1490.0900     34.9715      4.3689
+   1342.2350   1490.1000     34.9715      4.3686
+   1343.2220   1490.1200     34.9714      4.3681
+   1344.2100   1490.1300     34.9714      4.3677
+   1345.1970   1490.1400     34.9714      4.3669
+   1346.1840   1490.1600     34.9718      4.3664
+   1347.1720   1490.1700     34.9721      4.3661
+   1348.1591   1490.1899     34.9721      4.3660
+   1349.1460   1490.2100     34.9718      4.3658
+   1350.1340   1490.2200     34.9721      4.3657
+   1351.1210   1490.2400     34.9718      4.3658
+   1352.1080   1490.2500     34.9718      4.3655
+   1353.0959   1490.2700     34.9715      4.3651
+   1354.0830   1490.2800     34.9716      4.3645
+   1355.0710   1490.3000     34.9717      4.3635
+   1356.0580   1490.3101     34.9718      4.3621
+   1357.0450   1490.3199     34.9715      4.3617
+   1358.0330   1490.3300     34.9717      4.3604
+   1359.0200   1490.3400     34.9718      4.3593
+   1360.0070   1490.3600     34.9718      4.3588
+   1360.9940   1490.3700     34.9716      4.3571
+   1361.9821   1490.3800     34.9723      4.3559
+   1362.9690   1490.4000     34.9725      4.3558
+   1363.9561   1490.4100     34.9724      4.3559
+   1364.9440   1490.4301     34.9723      4.3558
+   1365.9310   1490.4500     34.9724      4.3559
+   1366.9180   1490.4600     34.9723      4.3558
+   1367.9060   1490.4800     34.9723      4.3554
+   1368.8929   1490.4900     34.9724      4.3552
+   1369.8800   1490.5100     34.9724      4.3550
+   1370.8669   1490.5200     34.9723      4.3550
+   1371.8550   1490.5400     34.9726      4.3546
+   1372.8420   1490.5601     34.9724      4.3546
+   1373.8290   1490.5699     34.9719      4.3543
+   1374.8160   1490.5800     34.9719      4.3533
+   1375.8040   1490.6000     34.9726      4.3524
+   1376.7910   1490.6100     34.9724      4.3520
+   1377.7780   1490.6300     34.9725      4.3514
+   1378.7650   1490.6400     34.9723      4.3511
+   1379.7520   1490.6600     34.9721      4.3507
+   1380.7400   1490.6700     34.9728      4.3501
+   1381.7271   1490.6899     34.9725      4.3503
+   1382.7140   1490.7000     34.9726      4.3503
+   1383.7010   1490.7200     34.9725      4.3500
+   1384.6890   1490.7300     34.9727      4.3497
+   1385.6760   1490.7500     34.9725      4.3493
+   1386.6630   1490.7600     34.9728      4.3487
+   1387.6500   1490.7800     34.9725      4.3481
+   1388.6370   1490.7900     34.9725      4.3476
+   1389.6240   1490.8101     34.9725      4.3472
+   1390.6121   1490.8199     34.9726      4.3464
+   1391.5990   1490.8300     34.9726      4.3451
+   1392.5861   1490.8500     34.9728      4.3446
+   1393.5730   1490.8600     34.9728      4.3440
+   1394.5601   1490.8800     34.9728      4.3438
+   1395.5470   1490.8900     34.9728      4.3437
+   1396.5350   1490.9100     34.9725      4.3433
+   1397.5220   1490.9200     34.9730      4.3424
+   1398.5090   1490.9301     34.9727      4.3422
+   1399.4960   1490.9500     34.9725      4.3413
+   1400.4830   1490.9600     34.9731      4.3400
+   1401.4700   1490.9800     34.9731      4.3400
+   1402.4570   1490.9900     34.9729      4.3395
+   1403.4440   1491.0000     34.9731      4.3388
+   1404.4320   1491.0200     34.9731      4.3384
+   1405.4189   1491.0300     34.9730      4.3377
+   1406.4060   1491.0500     34.9730      4.3370
+   1407.3929   1491.0601     34.9734      4.3367
+   1408.3800   1491.0800     34.9732      4.3367
+   1409.3669   1491.0900     34.9729      4.3365
+   1410.3540   1491.1100     34.9733      4.3359
+   1411.3409   1491.1200     34.9735      4.3353
+   1412.3280   1491.1400     34.9736      4.3352
+   1413.3149   1491.1500     34.9733      4.3348
+   1414.3020   1491.1700     34.9737      4.3342
+   1415.2889   1491.1801     34.9737      4.3336
+   1416.2770   1491.1899     34.9735      4.3329
+   1417.2640   1491.2100     34.9734      4.3322
+   1418.2510   1491.2200     34.9736      4.3314
+   1419.2380   1491.2300     34.9733      4.3308
+   1420.2250   1491.2500     34.9735      4.3295
+   1421.2120   1491.2600     34.9738      4.3287
+   1422.1990   1491.2700     34.9738      4.3281
+   1423.1860   1491.2900     34.9735      4.3274
+   1424.1730   1491.3000     34.9740      4.3268
+   1425.1600   1491.3199     34.9741      4.3267
+   1426.1470   1491.3300     34.9738      4.3265
+   1427.1340   1491.3500     34.9737      4.3255
+   1428.1210   1491.3600     34.9733      4.3248
+   1429.1080   1491.3700     34.9738      4.3240
+   1430.0950   1491.3900     34.9738      4.3235
+   1431.0820   1491.4000     34.9744      4.3232
+   1432.0690   1491.4200     34.9742      4.3232
+   1433.0560   1491.4399     34.9744      4.3232
+   1434.0430   1491.4500     34.9738      4.3233
+   1435.0300   1491.4700     34.9741      4.3233
+   1436.0170   1491.4900     34.9742      4.3232
+   1437.0040   1491.5000     34.9740      4.3232
+   1437.9900   1491.5200     34.9739      4.3232
+   1438.9771   1491.5300     34.9737      4.3223
+   1439.9640   1491.5500     34.9743      4.3219
+   1440.9510   1491.5601     34.9744      4.3218
+   1441.9380   1491.5800     34.9743      4.3220
+   1442.9250   1491.6000     34.9744      4.3221
+   1443.9120   1491.6100     34.9739      4.3220
+   1444.8990   1491.6300     34.9744      4.3216
+   1445.8860   1491.6400     34.9739      4.3213
+   1446.8730   1491.6600     34.9744      4.3205
+   1447.8600   1491.6700     34.9742      4.3203
+   1448.8470   1491.6899     34.9743      4.3198
+   1449.8340   1491.7000     34.9743      4.3198
+   1450.8199   1491.7200     34.9742      4.3193
+   1451.8070   1491.7300     34.9743      4.3189
+   1452.7939   1491.7500     34.9742      4.3188
+   1453.7810   1491.7600     34.9743      4.3182
+   1454.7679   1491.7800     34.9749      4.3175
+   1455.7550   1491.7900     34.9744      4.3179
+   1456.7419   1491.8101     34.9748      4.3179
+   1457.7290   1491.8300     34.9745      4.3179
+   1458.7150   1491.8400     34.9746      4.3178
+   1459.7020   1491.8600     34.9745      4.3177
+   1460.6890   1491.8800     34.9744      4.3177
+   1461.6760   1491.8900     34.9742      4.3174
+   1462.6630   1491.9100     34.9743      4.3168
+   1463.6500   1491.9200     34.9747      4.3165
+   1464.6360   1491.9301     34.9741      4.3160
+   1465.6230   1491.9500     34.9743      4.3152
+   1466.6100   1491.9600     34.9745      4.3151
+   1467.5970   1491.9800     34.9745      4.3146
+   1468.5840   1491.9900     34.9743      4.3137
+   1469.5699   1492.0100     34.9750      4.3130
+   1470.5570   1492.0200     34.9745      4.3130
+   1471.5439   1492.0400     34.9744      4.3124
+   1472.5310   1492.0500     34.9748      4.3118
+   1473.5179   1492.0601     34.9746      4.3110
+   1474.5040   1492.0800     34.9749      4.3103
+   1475.4910   1492.0900     34.9748      4.3100
+   1476.4780   1492.1100     34.9749      4.3098
+   1477.4650   1492.1200     34.9750      4.3096
+   1478.4510   1492.1400     34.9748      4.3095
+   1479.4380   1492.1600     34.9749      4.3095
+   1480.4250   1492.1700     34.9749      4.3094
+   1481.4120   1492.1899     34.9749      4.3093
+   1482.3979   1492.2000     34.9748      4.3091
+   1483.3850   1492.2200     34.9750      4.3089
+   1484.3719   1492.2400     34.9749      4.3088
+   1485.3590   1492.2500     34.9748      4.3087
+   1486.3450   1492.2700     34.9751      4.3086
+   1487.3320   1492.2800     34.9746      4.3081
+   1488.3190   1492.2900     34.9747      4.3068
+   1489.3060   1492.3101     34.9748      4.3055
+   1490.2920   1492.3199     34.9750      4.3050
+   1491.2791   1492.3400     34.9750      4.3047
+   1492.2660   1492.3500     34.9754      4.3045
+   1493.2520   1492.3700     34.9753      4.3045
+   1494.2390   1492.3800     34.9752      4.3046
+   1495.2260   1492.4000     34.9752      4.3046
+   1496.2120   1492.4200     34.9753      4.3046
+   1497.1990   1492.4399     34.9754      4.3048
+   1498.1860   1492.4500     34.9753      4.3049
+   1499.1720   1492.4700     34.9753      4.3051
+   1500.1591   1492.4900     34.9754      4.3052
+   1501.1460   1492.5000     34.9751      4.3054
+   1502.1320   1492.5200     34.9751      4.3051
+   1503.1190   1492.5300     34.9748      4.3048
+   1504.1060   1492.5400     34.9745      4.3027
+   1505.0920   1492.5500     34.9754      4.3010
+   1506.0790   1492.5699     34.9754      4.3009
+   1507.0660   1492.5800     34.9753      4.3006
+   1508.0520   1492.6000     34.9755      4.3004
+   1509.0389   1492.6200     34.9755      4.3003
+   1510.0250   1492.6300     34.9754      4.3001
+   1511.0120   1492.6500     34.9756      4.2998
+   1511.9990   1492.6600     34.9755      4.2997
+   1512.9850   1492.6801     34.9755      4.2995
+   1513.9720   1492.6899     34.9753      4.2994
+   1514.9580   1492.7100     34.9753      4.2989
+   1515.9449   1492.7200     34.9757      4.2982
+   1516.9320   1492.7400     34.9756      4.2979
+   1517.9180   1492.7500     34.9754      4.2970
+   1518.9050   1492.7600     34.9755      4.2965
+   1519.8910   1492.7800     34.9758      4.2964
+   1520.8781   1492.8000     34.9758      4.2962
+   1521.8640   1492.8101     34.9750      4.2953
+   1522.8510   1492.8199     34.9758      4.2940
+   1523.8380   1492.8400     34.9761      4.2940
+   1524.8240   1492.8600     34.9761      4.2943
+   1525.8110   1492.8700     34.9759      4.2944
+   1526.7970   1492.8900     34.9758      4.2943
+   1527.7841   1492.9000     34.9755      4.2938
+   1528.7700   1492.9200     34.9760      4.2936
+   1529.7570   1492.9301     34.9760      4.2935
+   1530.7430   1492.9500     34.9757      4.2934
+   1531.7300   1492.9700     34.9760      4.2934
+   1532.7159   1492.9800     34.9759      4.2934
+   1533.7030   1493.0000     34.9761      4.2933
+   1534.6890   1493.0200     34.9759      4.2933
+   1535.6760   1493.0300     34.9761      4.2934
+   1536.6620   1493.0500     34.9759      4.2933
+   1537.6490   1493.0699     34.9760      4.2931
+   1538.6350   1493.0800     34.9760      4.2931
+   1539.6219   1493.1000     34.9761      4.2930
+   1540.6080   1493.1100     34.9758      4.2930
+   1541.5950   1493.1300     34.9760      4.2930
+   1542.5811   1493.1500     34.9759      4.2930
+   1543.5680   1493.1600     34.9761      4.2927
+   1544.5540   1493.1801     34.9758      4.2926
+   1545.5400   1493.1899     34.9761      4.2923
+   1546.5270   1493.2100     34.9762      4.2922
+   1547.5129   1493.2300     34.9764      4.2921
+   1548.5000   1493.2400     34.9760      4.2922
+   1549.4860   1493.2600     34.9759      4.2922
+   1550.4730   1493.2800     34.9759      4.2920
+   1551.4590   1493.2900     34.9757      4.2914
+   1552.4449   1493.3101     34.9762      4.2910
+   1553.4320   1493.3199     34.9759      4.2911
+   1554.4180   1493.3400     34.9761      4.2910
+   1555.4050   1493.3600     34.9761      4.2910
+   1556.3910   1493.3700     34.9762      4.2911
+   1557.3770   1493.3900     34.9758      4.2913
+   1558.3640   1493.4100     34.9762      4.2913
+   1559.3500   1493.4200     34.9759      4.2914
+   1560.3370   1493.4399     34.9763      4.2913
+   1561.3230   1493.4600     34.9761      4.2913
+   1562.3090   1493.4700     34.9764      4.2910
+   1563.2960   1493.4900     34.9761      4.2912
+   1564.2820   1493.5000     34.9760      4.2911
+   1565.2679   1493.5200     34.9759      4.2908
+   1566.2550   1493.5300     34.9762      4.2903
+   1567.2410   1493.5500     34.9762      4.2903
+   1568.2271   1493.5699     34.9762      4.2903
+   1569.2140   1493.5800     34.9759      4.2903
+   1570.2000   1493.6000     34.9762      4.2898
+   1571.1860   1493.6200     34.9763      4.2898
+   1572.1730   1493.6300     34.9760      4.2898
+   1573.1591   1493.6500     34.9761      4.2897
+   1574.1450   1493.6600     34.9762      4.2897
+   1575.1320   1493.6801     34.9762      4.2897
+   1576.1180   1493.7000     34.9763      4.2895
+   1577.1040   1493.7100     34.9762      4.2896
+   1578.0909   1493.7300     34.9762      4.2895
+   1579.0770   1493.7500     34.9762      4.2894
+   1580.0630   1493.7600     34.9763      4.2893
+   1581.0490   1493.7800     34.9758      4.2893
+   1582.0360   1493.7900     34.9758      4.2888
+   1583.0220   1493.8101     34.9762      4.2882
+   1584.0081   1493.8199     34.9764      4.2879
+   1584.9950   1493.8400     34.9764      4.2878
+   1585.9810   1493.8500     34.9761      4.2876
+   1586.9670   1493.8700     34.9758      4.2872
+   1587.9530   1493.8800     34.9765      4.2868
+   1588.9399   1493.9000     34.9765      4.2866
+   1589.9260   1493.9200     34.9764      4.2864
+   1590.9120   1493.9301     34.9766      4.2863
+   1591.8979   1493.9500     34.9763      4.2861
+   1592.8850   1493.9600     34.9763      4.2858
+   1593.8710   1493.9800     34.9765      4.2857
+   1594.8571   1494.0000     34.9767      4.2857
+   1595.8430   1494.0100     34.9764      4.2857
+   1596.8290   1494.0300     34.9765      4.2857
+   1597.8160   1494.0500     34.9765      4.2858
+   1598.8020   1494.0601     34.9767      4.2855
+   1599.7880   1494.0800     34.9764      4.2854
+   1600.7740   1494.0900     34.9766      4.2849
+   1601.7600   1494.1100     34.9764      4.2849
+   1602.7469   1494.1300     34.9765      4.2849
+   1603.7330   1494.1400     34.9767      4.2847
+   1604.7190   1494.1600     34.9763      4.2842
+   1605.7050   1494.1700     34.9767      4.2838
+   1606.6910   1494.1899     34.9767      4.2837
+   1607.6770   1494.2000     34.9767      4.2835
+   1608.6639   1494.2200     34.9769      4.2834
+   1609.6500   1494.2400     34.9765      4.2835
+   1610.6360   1494.2500     34.9768      4.2835
+   1611.6219   1494.2700     34.9768      4.2833
+   1612.6080   1494.2800     34.9765      4.2831
+   1613.5940   1494.3000     34.9766      4.2828
+   1614.5800   1494.3199     34.9766      4.2828
+   1615.5660   1494.3300     34.9767      4.2825
+   1616.5530   1494.3500     34.9763      4.2825
+   1617.5389   1494.3600     34.9765      4.2822
+   1618.5250   1494.3800     34.9766      4.2816
+   1619.5110   1494.3900     34.9768      4.2814
+   1620.4969   1494.4100     34.9767      4.2813
+   1621.4830   1494.4200     34.9764      4.2810
+   1622.4690   1494.4399     34.9771      4.2804
+   1623.4550   1494.4500     34.9767      4.2802
+   1624.4410   1494.4700     34.9770      4.2800
+   1625.4270   1494.4900     34.9768      4.2797
+   1626.4130   1494.5000     34.9769      4.2795
+   1627.4000   1494.5200     34.9769      4.2794
+   1628.3860   1494.5300     34.9767      4.2791
+   1629.3719   1494.5500     34.9770      4.2786
+   1630.3580   1494.5601     34.9770      4.2785
+   1631.3440   1494.5800     34.9769      4.2785
+   1632.3300   1494.6000     34.9769      4.2784
+   1633.3160   1494.6100     34.9773      4.2783
+   1634.3020   1494.6300     34.9769      4.2783
+   1635.2880   1494.6400     34.9773      4.2780
+   1636.2740   1494.6600     34.9771      4.2779
+   1637.2600   1494.6801     34.9770      4.2779
+   1638.2460   1494.6899     34.9771      4.2779
+   1639.2321   1494.7100     34.9770      4.2778
+   1640.2180   1494.7300     34.9768      4.2776
+   1641.2040   1494.7400     34.9769      4.2775
+   1642.1899   1494.7600     34.9771      4.2773
+   1643.1760   1494.7700     34.9772      4.2772
+   1644.1620   1494.7900     34.9771      4.2773
+   1645.1479   1494.8101     34.9771      4.2772
+   1646.1340   1494.8199     34.9772      4.2772
+   1647.1200   1494.8400     34.9771      4.2771
+   1648.1060   1494.8600     34.9774      4.2771
+   1649.0920   1494.8700     34.9773      4.2771
+   1650.0780   1494.8900     34.9771      4.2771
+   1651.0640   1494.9100     34.9770      4.2771
+   1652.0500   1494.9200     34.9770      4.2768
+   1653.0360   1494.9399     34.9771      4.2766
+   1654.0220   1494.9500     34.9769      4.2764
+   1655.0081   1494.9700     34.9770      4.2762
+   1655.9930   1494.9800     34.9772      4.2760
+   1656.9790   1495.0000     34.9773      4.2760
+   1657.9650   1495.0200     34.9771      4.2761
+   1658.9510   1495.0300     34.9770      4.2761
+   1659.9370   1495.0500     34.9777      4.2761
+   1660.9230   1495.0699     34.9772      4.2760
+   1661.9091   1495.0800     34.9770      4.2757
+   1662.8950   1495.1000     34.9771      4.2755
+   1663.8810   1495.1100     34.9771      4.2755
+   1664.8669   1495.1300     34.9771      4.2755
+   1665.8530   1495.1500     34.9773      4.2753
+   1666.8380   1495.1600     34.9774      4.2752
+   1667.8240   1495.1801     34.9773      4.2752
+   1668.8101   1495.2000     34.9773      4.2751
+   1669.7960   1495.2100     34.9773      4.2750
+   1670.7820   1495.2300     34.9772      4.2750
+   1671.7679   1495.2500     34.9775      4.2750
+   1672.7540   1495.2600     34.9773      4.2750
+   1673.7390   1495.2800     34.9775      4.2749
+   1674.7250   1495.3000     34.9771      4.2750
+   1675.7111   1495.3101     34.9774      4.2749
+   1676.6970   1495.3300     34.9771      4.2750
+   1677.6830   1495.3400     34.9772      4.2749
+   1678.6689   1495.3600     34.9774      4.2748
+   1679.6541   1495.3800     34.9771      4.2749
+   1680.6400   1495.3900     34.9772      4.2748
+   1681.6260   1495.4100     34.9774      4.2747
+   1682.6121   1495.4301     34.9775      4.2747
+   1683.5980   1495.4399     34.9774      4.2747
+   1684.5840   1495.4600     34.9773      4.2748
+   1685.5690   1495.4800     34.9775      4.2748
+   1686.5551   1495.4900     34.9774      4.2749
+   1687.5410   1495.5100     34.9774      4.2749
+   1688.5270   1495.5300     34.9772      4.2748
+   1689.5120   1495.5400     34.9777      4.2749
+   1690.4980   1495.5601     34.9776      4.2749
+   1691.4840   1495.5800     34.9773      4.2751
+   1692.4700   1495.5900     34.9774      4.2750
+   1693.4550   1495.6100     34.9772      4.2751
+   1694.4410   1495.6300     34.9775      4.2752
+   1695.4270   1495.6400     34.9773      4.2752
+   1696.4130   1495.6600     34.9775      4.2752
+   1697.3979   1495.6801     34.9772      4.2753
+   1698.3840   1495.7000     34.9775      4.2754
+   1699.3700   1495.7100     34.9775      4.2753
+   1700.3560   1495.7300     34.9774      4.2754
+   1701.3409   1495.7400     34.9775      4.2752
+   1702.3270   1495.7600     34.9775      4.2751
+   1703.3130   1495.7800     34.9774      4.2750
+   1704.2990   1495.7900     34.9774      4.2750
+   1705.2841   1495.8101     34.9775      4.2750
+   1706.2700   1495.8300     34.9776      4.2751
+   1707.2560   1495.8400     34.9777      4.2752
+   1708.2410   1495.8600     34.9776      4.2753
+   1709.2271   1495.8800     34.9773      4.2752
+   1710.2130   1495.8900     34.9778      4.2752
+   1711.1980   1495.9100     34.9780      4.2754
+   1712.1840   1495.9301     34.9774      4.2751
+   1713.1700   1495.9399     34.9776      4.2750
+   1714.1550   1495.9600     34.9777      4.2750
+   1715.1410   1495.9800     34.9778      4.2751
+   1716.1270   1495.9900     34.9777      4.2752
+   1717.1121   1496.0100     34.9775      4.2753
+   1718.0980   1496.0300     34.9776      4.2753
+   1719.0840   1496.0400     34.9776      4.2755
+   1720.0690   1496.0601     34.9774      4.2752
+   1721.0551   1496.0800     34.9776      4.2752
+   1722.0400   1496.0900     34.9775      4.2751
+   1723.0260   1496.1100     34.9775      4.2752
+   1724.0120   1496.1300     34.9775      4.2752
+   1724.9969   1496.1400     34.9777      4.2753
+   1725.9830   1496.1600     34.9777      4.2754
+   1726.9690   1496.1801     34.9777      4.2754
+   1727.9540   1496.1899     34.9777      4.2755
+   1728.9399   1496.2100     34.9776      4.2757
+   1729.9250   1496.2300     34.9778      4.2757
+   1730.9110   1496.2500     34.9776      4.2758
+   1731.8960   1496.2600     34.9774      4.2759
+   1732.8820   1496.2800     34.9777      4.2758
+   1733.8680   1496.2900     34.9775      4.2756
+   1734.8530   1496.3101     34.9777      4.2754
+   1735.8390   1496.3300     34.9773      4.2752
+   1736.8240   1496.3400     34.9774      4.2751
+   1737.8101   1496.3600     34.9776      4.2750
+   1738.7950   1496.3700     34.9775      4.2747
+   1739.7810   1496.3900     34.9776      4.2743
+   1740.7660   1496.4100     34.9777      4.2743
+   1741.7520   1496.4200     34.9774      4.2743
+   1742.7380   1496.4399     34.9780      4.2742
+   1743.7230   1496.4500     34.9773      4.2742
+   1744.7090   1496.4700     34.9775      4.2738
+   1745.6940   1496.4900     34.9776      4.2736
+   1746.6801   1496.5000     34.9779      4.2733
+   1747.6650   1496.5200     34.9779      4.2733
+   1748.6510   1496.5300     34.9776      4.2734
+   1749.6360   1496.5500     34.9779      4.2734
+   1750.6219   1496.5699     34.9779      4.2734
+   1751.6071   1496.5800     34.9776      4.2734
+   1752.5930   1496.6000     34.9778      4.2732
+   1753.5780   1496.6200     34.9776      4.2734
+   1754.5640   1496.6300     34.9779      4.2734
+   1755.5490   1496.6500     34.9777      4.2735
+   1756.5341   1496.6700     34.9777      4.2735
+   1757.5200   1496.6899     34.9777      4.2737
+   1758.5050   1496.7000     34.9779      4.2738
+   1759.4910   1496.7200     34.9778      4.2737
+   1760.4760   1496.7300     34.9778      4.2736
+   1761.4620   1496.7500     34.9778      4.2735
+   1762.4470   1496.7700     34.9777      4.2735
+   1763.4330   1496.7800     34.9777      4.2733
+   1764.4180   1496.8000     34.9776      4.2729
+   1765.4030   1496.8101     34.9777      4.2727
+   1766.3890   1496.8300     34.9778      4.2726
+   1767.3740   1496.8500     34.9777      4.2726
+   1768.3600   1496.8600     34.9780      4.2727
+   1769.3450   1496.8800     34.9779      4.2728
+   1770.3311   1496.9000     34.9779      4.2728
+   1771.3160   1496.9100     34.9779      4.2728
+   1772.3010   1496.9301     34.9778      4.2729
+   1773.2870   1496.9500     34.9780      4.2730
+   1774.2720   1496.9700     34.9778      4.2731
+   1775.2570   1496.9800     34.9779      4.2732
+   1776.2430   1497.0000     34.9780      4.2733
+   1777.2280   1497.0200     34.9778      4.2734
+   1778.2140   1497.0300     34.9778      4.2735
+   1779.1990   1497.0500     34.9779      4.2735
+   1780.1840   1497.0699     34.9777      4.2737
+   1781.1700   1497.0800     34.9779      4.2738
+   1782.1550   1497.1000     34.9778      4.2738
+   1783.1400   1497.1200     34.9779      4.2740
+   1784.1260   1497.1300     34.9776      4.2739
+   1785.1110   1497.1500     34.9780      4.2738
+   1786.0959   1497.1700     34.9778      4.2739
+   1787.0820   1497.1899     34.9778      4.2740
+   1788.0670   1497.2000     34.9780      4.2739
+   1789.0520   1497.2200     34.9778      4.2740
+   1790.0380   1497.2400     34.9780      4.2740
+   1791.0229   1497.2500     34.9779      4.2741
+   1792.0081   1497.2700     34.9779      4.2741
+   1792.9930   1497.2900     34.9779      4.2742
+   1793.9790   1497.3000     34.9780      4.2742
+   1794.9640   1497.3199     34.9775      4.2741
+   1795.9490   1497.3300     34.9777      4.2741
+   1796.9351   1497.3500     34.9776      4.2738
+   1797.9200   1497.3700     34.9778      4.2735
+   1798.9050   1497.3800     34.9778      4.2735
+   1799.8900   1497.4000     34.9782      4.2734
+   1800.8760   1497.4200     34.9779      4.2734
+   1801.8610   1497.4301     34.9780      4.2731
+   1802.8459   1497.4500     34.9780      4.2730
+   1803.8311   1497.4600     34.9779      4.2730
+   1804.8170   1497.4800     34.9783      4.2730
+   1805.8020   1497.5000     34.9777      4.2731
+   1806.7870   1497.5100     34.9779      4.2731
+   1807.7720   1497.5300     34.9782      4.2731
+   1808.7581   1497.5500     34.9776      4.2732
+   1809.7430   1497.5601     34.9780      4.2731
+   1810.7280   1497.5800     34.9780      4.2732
+   1811.7130   1497.6000     34.9781      4.2731
+   1812.6980   1497.6100     34.9779      4.2732
+   1813.6840   1497.6300     34.9780      4.2732
+   1814.6689   1497.6500     34.9779      4.2733
+   1815.6541   1497.6600     34.9780      4.2733
+   1816.6390   1497.6801     34.9778      4.2734
+   1817.6240   1497.7000     34.9781      4.2733
+   1818.6100   1497.7100     34.9779      4.2733
+   1819.5950   1497.7300     34.9780      4.2733
+   1820.5800   1497.7500     34.9779      4.2732
+   1821.5649   1497.7600     34.9781      4.2732
+   1822.5500   1497.7800     34.9781      4.2733
+   1823.5350   1497.8000     34.9781      4.2732
+   1824.5210   1497.8101     34.9779      4.2732
+   1825.5060   1497.8300     34.9779      4.2732
+   1826.4910   1497.8500     34.9783      4.2731
+   1827.4760   1497.8600     34.9782      4.2731
+   1828.4611   1497.8800     34.9781      4.2731
+   1829.4460   1497.9000     34.9780      4.2732
+   1830.4310   1497.9100     34.9781      4.2732
+   1831.4160   1497.9301     34.9776      4.2734
+   1832.4020   1497.9500     34.9787      4.2731
+   1833.3870   1497.9600     34.9780      4.2731
+   1834.3719   1497.9800     34.9779      4.2730
+   1835.3571   1498.0000     34.9779      4.2730
+   1836.3420   1498.0100     34.9780      4.2729
+   1837.3270   1498.0300     34.9781      4.2728
+   1838.3120   1498.0400     34.9783      4.2727
+   1839.2970   1498.0601     34.9781      4.2728
+   1840.2820   1498.0800     34.9781      4.2729
+   1841.2670   1498.1000     34.9781      4.2731
+   1842.2520   1498.1100     34.9780      4.2732
+   1843.2371   1498.1300     34.9781      4.2732
+   1844.2230   1498.1500     34.9780      4.2732
+   1845.2080   1498.1600     34.9779      4.2733
+   1846.1930   1498.1801     34.9781      4.2734
+   1847.1780   1498.2000     34.9778      4.2734
+   1848.1630   1498.2100     34.9780      4.2734
+   1849.1479   1498.2300     34.9781      4.2733
+   1850.1331   1498.2500     34.9781      4.2733
+   1851.1180   1498.2600     34.9781      4.2733
+   1852.1030   1498.2800     34.9781      4.2733
+   1853.0880   1498.3000     34.9780      4.2733
+   1854.0730   1498.3101     34.9780      4.2733
+   1855.0580   1498.3300     34.9780      4.2733
+   1856.0430   1498.3500     34.9781      4.2734
+   1857.0280   1498.3600     34.9779      4.2733
+   1858.0129   1498.3800     34.9780      4.2733
+   1858.9980   1498.4000     34.9778      4.2732
+   1859.9830   1498.4100     34.9781      4.2731
+   1860.9680   1498.4301     34.9778      4.2731
+   1861.9530   1498.4399     34.9781      4.2728
+   1862.9380   1498.4600     34.9780      4.2726
+   1863.9230   1498.4800     34.9780      4.2725
+   1864.9080   1498.4900     34.9783      4.2724
+   1865.8929   1498.5100     34.9781      4.2723
+   1866.8781   1498.5200     34.9783      4.2721
+   1867.8630   1498.5400     34.9781      4.2722
+   1868.8480   1498.5601     34.9782      4.2721
+   1869.8320   1498.5699     34.9782      4.2720
+   1870.8170   1498.5900     34.9783      4.2720
+   1871.8020   1498.6100     34.9783      4.2720
+   1872.7870   1498.6200     34.9780      4.2720
+   1873.7720   1498.6400     34.9780      4.2720
+   1874.7570   1498.6600     34.9783      4.2721
+   1875.7419   1498.6700     34.9784      4.2721
+   1876.7271   1498.6899     34.9779      4.2721
+   1877.7120   1498.7100     34.9779      4.2718
+   1878.6970   1498.7200     34.9782      4.2718
+   1879.6820   1498.7400     34.9781      4.2718
+   1880.6660   1498.7600     34.9783      4.2718
+   1881.6510   1498.7700     34.9783      4.2718
+   1882.6360   1498.7900     34.9785      4.2718
+   1883.6210   1498.8101     34.9785      4.2717
+   1884.6060   1498.8199     34.9781      4.2716
+   1885.5909   1498.8400     34.9782      4.2715
+   1886.5760   1498.8600     34.9782      4.2715
+   1887.5610   1498.8700     34.9782      4.2716
+   1888.5450   1498.8900     34.9781      4.2717
+   1889.5300   1498.9100     34.9781      4.2718
+   1890.5150   1498.9200     34.9784      4.2719
+   1891.5000   1498.9399     34.9783      4.2719
+   1892.4850   1498.9600     34.9784      4.2719
+   1893.4700   1498.9700     34.9782      4.2720
+   1894.4540   1498.9900     34.9782      4.2720
+   1895.4390   1499.0100     34.9782      4.2720
+   1896.4240   1499.0200     34.9781      4.2721
+   1897.4091   1499.0400     34.9782      4.2719
+   1898.3940   1499.0601     34.9781      4.2718
+   1899.3790   1499.0699     34.9783      4.2719
+   1900.3630   1499.0900     34.9781      4.2719
+   1901.3480   1499.1100     34.9781      4.2718
+   1902.3330   1499.1200     34.9786      4.2719
+   1903.3180   1499.1400     34.9782      4.2719
+   1904.3020   1499.1600     34.9783      4.2719
+   1905.2870   1499.1700     34.9782      4.2720
+   1906.2720   1499.1899     34.9784      4.2721
+   1907.2570   1499.2100     34.9784      4.2722
+   1908.2419   1499.2300     34.9782      4.2725
+   1909.2260   1499.2400     34.9783      4.2725
+   1910.2111   1499.2600     34.9782      4.2725
+   1911.1960   1499.2800     34.9783      4.2725
+   1912.1810   1499.2900     34.9782      4.2725
+   1913.1650   1499.3101     34.9783      4.2725
+   1914.1500   1499.3300     34.9782      4.2726
+   1915.1350   1499.3400     34.9783      4.2727
+   1916.1190   1499.3600     34.9783      4.2726
+   1917.1040   1499.3800     34.9781      4.2727
+   1918.0890   1499.3900     34.9781      4.2727
+   1919.0740   1499.4100     34.9782      4.2727
+   1920.0580   1499.4301     34.9781      4.2726
+   1921.0430   1499.4399     34.9780      4.2727
+   1922.0280   1499.4600     34.9785      4.2728
+   1923.0120   1499.4800     34.9783      4.2729
+   1923.9969   1499.4900     34.9783      4.2729
+   1924.9821   1499.5100     34.9781      4.2729
+   1925.9659   1499.5300     34.9784      4.2727
+   1926.9510   1499.5400     34.9785      4.2727
+   1927.9360   1499.5601     34.9784      4.2728
+   1928.9200   1499.5800     34.9785      4.2728
+   1929.9050   1499.5900     34.9785      4.2729
+   1930.8900   1499.6100     34.9785      4.2731
+   1931.8740   1499.6300     34.9784      4.2732
+   1932.8590   1499.6500     34.9783      4.2733
+   1933.8440   1499.6600     34.9780      4.2734
+   1934.8280   1499.6801     34.9782      4.2735
+   1935.8130   1499.7000     34.9783      4.2735
+   1936.7980   1499.7100     34.9781      4.2736
+   1937.7820   1499.7300     34.9786      4.2736
+   1938.7670   1499.7500     34.9782      4.2738
+   1939.7510   1499.7600     34.9785      4.2738
+   1940.7360   1499.7800     34.9784      4.2739
+   1941.7209   1499.8000     34.9784      4.2739
+   1942.7050   1499.8199     34.9784      4.2740
+   1943.6899   1499.8300     34.9783      4.2741
+   1944.6740   1499.8500     34.9781      4.2742
+   1945.6591   1499.8700     34.9782      4.2743
+   1946.6440   1499.8800     34.9782      4.2744
+   1947.6281   1499.9000     34.9783      4.2743
+   1948.6130   1499.9200     34.9782      4.2744
+   1949.5970   1499.9301     34.9785      4.2744
+   1950.5820   1499.9500     34.9780      4.2745
+   1951.5670   1499.9700     34.9784      4.2745
+   1952.5510   1499.9800     34.9784      4.2746
+   1953.5360   1500.0000     34.9782      4.2746
+   1954.5200   1500.0200     34.9782      4.2744
+   1955.5050   1500.0300     34.9783      4.2744
+   1956.4890   1500.0500     34.9783      4.2742
+   1957.4740   1500.0699     34.9785      4.2743
+   1958.4580   1500.0800     34.9783      4.2743
+   1959.4430   1500.1000     34.9786      4.2742
+   1960.4270   1500.1200     34.9785      4.2743
+   1961.4120   1500.1300     34.9782      4.2743
+   1962.3960   1500.1500     34.9785      4.2744
+   1963.3810   1500.1700     34.9786      4.2745
+   1964.3650   1500.1801     34.9787      4.2745
+   1965.3500   1500.2000     34.9786      4.2745
+   1966.3340   1500.2200     34.9784      4.2746
+   1967.3190   1500.2300     34.9784      4.2747
+   1968.3030   1500.2500     34.9784      4.2747
+   1969.2880   1500.2700     34.9783      4.2749
+   1970.2720   1500.2900     34.9788      4.2748
+   1971.2570   1500.3000     34.9785      4.2750
+   1972.2410   1500.3199     34.9787      4.2750
+   1973.2260   1500.3400     34.9785      4.2750
+   1974.2100   1500.3500     34.9786      4.2751
+   1975.1949   1500.3700     34.9785      4.2752
+   1976.1790   1500.3900     34.9783      4.2752
+   1977.1630   1500.4000     34.9782      4.2752
+   1978.1479   1500.4200     34.9786      4.2752
+   1979.1320   1500.4399     34.9785      4.2750
+   1980.1169   1500.4500     34.9786      4.2750
+   1981.1010   1500.4700     34.9784      4.2750
+   1982.0861   1500.4900     34.9785      4.2751
+   1983.0699   1500.5000     34.9786      4.2750
+   1984.0540   1500.5200     34.9785      4.2750
+   1985.0389   1500.5400     34.9785      4.2748
+   1986.0229   1500.5500     34.9785      4.2748
+   1987.0081   1500.5699     34.9783      4.2747
+   1987.9919   1500.5900     34.9787      4.2747
+   1988.9760   1500.6000     34.9783      4.2747
+   1989.9611   1500.6200     34.9785      4.2747
+   1990.9449   1500.6300     34.9784      4.2747
+   1991.9301   1500.6500     34.9786      4.2748
+   1992.9139   1500.6700     34.9784      4.2748
+   1993.8979   1500.6899     34.9786      4.2749
+   1994.8831   1500.7000     34.9784      4.2749
+   1995.8669   1500.7200     34.9784      4.2748
+   1996.8510   1500.7400     34.9787      4.2747
+   1997.8361   1500.7500     34.9785      4.2748
+   1998.8199   1500.7700     34.9787      4.2748
+   1999.8040   1500.7900     34.9785      4.2749
+   2000.7889   1500.8000     34.9786      4.2748
+   2001.7729   1500.8199     34.9785      4.2748
+   2002.7570   1500.8400     34.9785      4.2748
+   2003.7419   1500.8500     34.9787      4.2748
+   2004.7260   1500.8700     34.9784      4.2750
+   2005.7100   1500.8900     34.9786      4.2749
+   2006.6949   1500.9000     34.9788      4.2748
+   2007.6790   1500.9200     34.9782      4.2749
+   2008.6630   1500.9399     34.9786      4.2749
+   2009.6479   1500.9500     34.9787      4.2748
+   2010.6320   1500.9700     34.9784      4.2746
+   2011.6160   1500.9800     34.9785      4.2745
+   2012.6000   1501.0000     34.9785      4.2745
+   2013.5850   1501.0200     34.9789      4.2746
+   2014.5690   1501.0400     34.9786      4.2747
+   2015.5530   1501.0500     34.9783      4.2748
+   2016.5370   1501.0699     34.9785      4.2744
+   2017.5220   1501.0800     34.9782      4.2743
+   2018.5060   1501.1000     34.9785      4.2743
+   2019.4900   1501.1200     34.9788      4.2743
+   2020.4740   1501.1300     34.9786      4.2743
+   2021.4590   1501.1500     34.9785      4.2744
+   2022.4430   1501.1700     34.9783      4.2745
+   2023.4270   1501.1801     34.9786      4.2745
+   2024.4110   1501.2000     34.9787      4.2745
+   2025.3960   1501.2200     34.9785      4.2747
+   2026.3800   1501.2400     34.9786      4.2746
+   2027.3640   1501.2500     34.9785      4.2747
+   2028.3480   1501.2700     34.9784      4.2747
+   2029.3320   1501.2900     34.9787      4.2748
+   2030.3170   1501.3000     34.9786      4.2749
+   2031.3010   1501.3199     34.9788      4.2748
+   2032.2850   1501.3400     34.9787      4.2748
+   2033.2690   1501.3500     34.9787      4.2749
+   2034.2531   1501.3700     34.9785      4.2750
+   2035.2380   1501.3900     34.9788      4.2750
+   2036.2220   1501.4000     34.9786      4.2751
+   2037.2061   1501.4200     34.9786      4.2752
+   2038.1899   1501.4399     34.9787      4.2751
+   2039.1740   1501.4600     34.9788      4.2753
+   2040.1580   1501.4700     34.9789      4.2753
+   2041.1429   1501.4900     34.9785      4.2753
+   2042.1270   1501.5100     34.9787      4.2754
+   2043.1110   1501.5200     34.9784      4.2755
+   2044.0950   1501.5400     34.9788      4.2754
+   2045.0790   1501.5601     34.9788      4.2755
+   2046.0630   1501.5699     34.9789      4.2757
+   2047.0470   1501.5900     34.9789      4.2757
+   2048.0310   1501.6100     34.9785      4.2758
+   2049.0161   1501.6200     34.9789      4.2757
+   2050.0000   1501.6400     34.9788      4.2756
+   2050.9839   1501.6600     34.9782      4.2758
+   2051.9680   1501.6700     34.9790      4.2759
+   2052.9519   1501.6899     34.9788      4.2759
+   2053.9360   1501.7100     34.9788      4.2759
+   2054.9199   1501.7300     34.9788      4.2760
+   2055.9041   1501.7400     34.9787      4.2761
+   2056.8879   1501.7600     34.9787      4.2762
+   2057.8721   1501.7800     34.9790      4.2762
+   2058.8560   1501.7900     34.9788      4.2763
+   2059.8401   1501.8101     34.9789      4.2764
+   2060.8250   1501.8300     34.9787      4.2765
+   2061.8091   1501.8400     34.9786      4.2767
+   2062.7930   1501.8600     34.9786      4.2767
+   2063.7771   1501.8800     34.9786      4.2767
+   2064.7610   1501.9000     34.9789      4.2767
+   2065.7451   1501.9100     34.9788      4.2768
+   2066.7290   1501.9301     34.9787      4.2769
+   2067.7129   1501.9500     34.9786      4.2768
+   2068.6970   1501.9600     34.9788      4.2766
+   2069.6809   1501.9800     34.9788      4.2765
+   2070.6650   1502.0000     34.9789      4.2767
+   2071.6489   1502.0100     34.9789      4.2767
+   2072.6331   1502.0300     34.9786      4.2765
+   2073.6169   1502.0400     34.9788      4.2766
+   2074.6011   1502.0601     34.9788      4.2767
+   2075.5850   1502.0800     34.9787      4.2768
+   2076.5691   1502.0900     34.9785      4.2767
+   2077.5530   1502.1100     34.9791      4.2766
+   2078.5371   1502.1300     34.9787      4.2767
+   2079.5210   1502.1500     34.9787      4.2767
+   2080.5049   1502.1600     34.9787      4.2766
+   2081.4890   1502.1801     34.9788      4.2766
+   2082.4729   1502.2000     34.9790      4.2766
+   2083.4570   1502.2100     34.9789      4.2767
+   2084.4409   1502.2300     34.9786      4.2767
+   2085.4241   1502.2500     34.9790      4.2770
+   2086.4080   1502.2600     34.9787      4.2770
+   2087.3921   1502.2800     34.9788      4.2770
+   2088.3760   1502.3000     34.9789      4.2770
+   2089.3601   1502.3101     34.9787      4.2771
+   2090.3440   1502.3300     34.9788      4.2771
+   2091.3279   1502.3500     34.9788      4.2773
+   2092.3120   1502.3700     34.9789      4.2773
+   2093.2959   1502.3800     34.9788      4.2772
+   2094.2800   1502.4000     34.9786      4.2773
+   2095.2639   1502.4100     34.9786      4.2773
+   2096.2480   1502.4301     34.9787      4.2774
+   2097.2310   1502.4500     34.9788      4.2775
+   2098.2151   1502.4700     34.9789      4.2775
+   2099.1990   1502.4800     34.9788      4.2775
+   2100.1831   1502.5000     34.9787      4.2776
+   2101.1670   1502.5200     34.9791      4.2776
+   2102.1509   1502.5300     34.9789      4.2776
+   2103.1350   1502.5500     34.9788      4.2776
+   2104.1189   1502.5699     34.9786      4.2777
+   2105.1021   1502.5800     34.9788      4.2778
+   2106.0859   1502.6000     34.9789      4.2778
+   2107.0701   1502.6200     34.9788      4.2779
+   2108.0540   1502.6300     34.9785      4.2779
+   2109.0381   1502.6500     34.9788      4.2779
+   2110.0220   1502.6700     34.9788      4.2779
+   2111.0049   1502.6899     34.9788      4.2781
+   2111.9890   1502.7000     34.9790      4.2781
+   2112.9729   1502.7200     34.9785      4.2782
+   2113.9570   1502.7400     34.9787      4.2783
+   2114.9409   1502.7500     34.9786      4.2783
+   2115.9241   1502.7700     34.9789      4.2782
+   2116.9080   1502.7900     34.9787      4.2782
+   2117.8921   1502.8000     34.9788      4.2783
+   2118.8760   1502.8199     34.9787      4.2783
+   2119.8601   1502.8400     34.9787      4.2782
+   2120.8430   1502.8500     34.9786      4.2782
+   2121.8269   1502.8700     34.9788      4.2781
+   2122.8110   1502.8900     34.9790      4.2781
+   2123.7949   1502.9000     34.9787      4.2783
+   2124.7781   1502.9200     34.9789      4.2784
+   2125.7620   1502.9399     34.9788      4.2784
+   2126.7461   1502.9500     34.9786      4.2784
+   2127.7300   1502.9700     34.9789      4.2785
+   2128.7129   1502.9900     34.9791      4.2785
+   2129.6970   1503.0000     34.9788      4.2785
+   2130.6809   1503.0200     34.9789      4.2785
+   2131.6650   1503.0400     34.9789      4.2786
+   2132.6479   1503.0601     34.9790      4.2786
+   2133.6321   1503.0699     34.9789      4.2787
+   2134.6160   1503.0900     34.9791      4.2787
+   2135.6001   1503.1100     34.9791      4.2788
+   2136.5830   1503.1200     34.9790      4.2789
+   2137.5669   1503.1400     34.9790      4.2790
+   2138.5510   1503.1600     34.9790      4.2790
+   2139.5339   1503.1700     34.9787      4.2790
+   2140.5181   1503.1899     34.9793      4.2789
+   2141.5020   1503.2100     34.9790      4.2790
+   2142.4851   1503.2200     34.9791      4.2790
+   2143.4690   1503.2400     34.9789      4.2791
+   2144.4529   1503.2600     34.9790      4.2792
+   2145.4360   1503.2800     34.9788      4.2792
+   2146.4199   1503.2900     34.9789      4.2793
+   2147.4041   1503.3101     34.9790      4.2795
+   2148.3870   1503.3300     34.9792      4.2796
+   2149.3711   1503.3400     34.9789      4.2796
+   2150.3550   1503.3600     34.9790      4.2797
+   2151.3379   1503.3800     34.9790      4.2799
+   2152.3220   1503.3900     34.9788      4.2797
+   2153.3059   1503.4100     34.9790      4.2795
+   2154.2891   1503.4301     34.9791      4.2796
+   2155.2729   1503.4399     34.9791      4.2797
+   2156.2561   1503.4600     34.9789      4.2798
+   2157.2400   1503.4800     34.9790      4.2798
+   2158.2241   1503.5000     34.9790      4.2798
+   2159.2070   1503.5100     34.9788      4.2799
+   2160.1909   1503.5300     34.9788      4.2800
+   2161.1741   1503.5500     34.9788      4.2801
+   2162.1580   1503.5601     34.9789      4.2801
+   2163.1421   1503.5800     34.9790      4.2802
+   2164.1250   1503.6000     34.9789      4.2803
+   2165.1089   1503.6100     34.9790      4.2804
+   2166.0920   1503.6300     34.9788      4.2805
+   2167.0759   1503.6500     34.9790      4.2805
+   2168.0591   1503.6700     34.9789      4.2807
+   2169.0430   1503.6801     34.9788      4.2807
+   2170.0271   1503.7000     34.9789      4.2809
+   2171.0100   1503.7200     34.9791      4.2807
+   2171.9939   1503.7300     34.9791      4.2809
+   2172.9771   1503.7500     34.9790      4.2809
+   2173.9609   1503.7700     34.9791      4.2811
+   2174.9441   1503.7900     34.9789      4.2812
+   2175.9280   1503.8000     34.9789      4.2813
+   2176.9109   1503.8199     34.9791      4.2814
+   2177.8950   1503.8400     34.9790      4.2814
+   2178.8779   1503.8500     34.9789      4.2816
+   2179.8621   1503.8700     34.9788      4.2817
+   2180.8450   1503.8900     34.9790      4.2817
+   2181.8291   1503.9000     34.9790      4.2818
+   2182.8120   1503.9200     34.9788      4.2819
+   2183.7959   1503.9399     34.9788      4.2820
+   2184.7791   1503.9600     34.9788      4.2821
+   2185.7629   1503.9700     34.9791      4.2821
+   2186.7461   1503.9900     34.9791      4.2821
+   2187.7300   1504.0100     34.9789      4.2822
+   2188.7129   1504.0200     34.9788      4.2824
+   2189.6970   1504.0400     34.9789      4.2825
+   2190.6799   1504.0601     34.9788      4.2825
+   2191.6641   1504.0699     34.9789      4.2825
+   2192.6470   1504.0900     34.9789      4.2827
+   2193.6311   1504.1100     34.9791      4.2827
+   2194.6140   1504.1300     34.9792      4.2828
+   2195.5969   1504.1400     34.9788      4.2830
+   2196.5811   1504.1600     34.9788      4.2828
+   2197.5640   1504.1801     34.9789      4.2829
+   2198.5481   1504.1899     34.9791      4.2829
+   2199.5310   1504.2100     34.9789      4.2830
+   2200.5149   1504.2300     34.9791      4.2830
+   2201.4980   1504.2400     34.9789      4.2831
+   2202.4810   1504.2600     34.9788      4.2831
+   2203.4651   1504.2800     34.9790      4.2831
+   2204.4480   1504.2900     34.9793      4.2830
+   2205.4319   1504.3101     34.9791      4.2831
+   2206.4150   1504.3300     34.9790      4.2831
+   2207.3979   1504.3500     34.9790      4.2833
+   2208.3821   1504.3600     34.9791      4.2833
+   2209.3650   1504.3800     34.9791      4.2834
+   2210.3479   1504.4000     34.9790      4.2834
+   2211.3320   1504.4100     34.9790      4.2836
+   2212.3149   1504.4301     34.9788      4.2837
+   2213.2981   1504.4500     34.9791      4.2838
+   2214.2820   1504.4700     34.9791      4.2838
+   2215.2649   1504.4800     34.9790      4.2839
+   2216.2490   1504.5000     34.9790      4.2840
+   2217.2319   1504.5200     34.9788      4.2841
+   2218.2151   1504.5300     34.9790      4.2842
+   2219.1990   1504.5500     34.9790      4.2842
+   2220.1819   1504.5699     34.9791      4.2843
+   2221.1650   1504.5800     34.9791      4.2844
+   2222.1479   1504.6000     34.9789      4.2844
+   2223.1321   1504.6200     34.9792      4.2843
+   2224.1150   1504.6400     34.9791      4.2844
+   2225.0979   1504.6500     34.9790      4.2845
+   2226.0820   1504.6700     34.9795      4.2845
+   2227.0649   1504.6899     34.9792      4.2846
+   2228.0481   1504.7000     34.9792      4.2846
+   2229.0320   1504.7200     34.9792      4.2847
+   2230.0149   1504.7400     34.9791      4.2849
+   2230.9980   1504.7500     34.9790      4.2849
+   2231.9810   1504.7700     34.9789      4.2850
+   2232.9651   1504.7900     34.9791      4.2850
+   2233.9480   1504.8101     34.9794      4.2852
+   2234.9309   1504.8199     34.9791      4.2853
+   2235.9141   1504.8400     34.9791      4.2854
+   2236.8979   1504.8600     34.9792      4.2854
+   2237.8811   1504.8700     34.9790      4.2854
+   2238.8640   1504.8900     34.9790      4.2854
+   2239.8469   1504.9100     34.9792      4.2855
+   2240.8311   1504.9301     34.9797      4.2856
+   2241.8140   1504.9399     34.9789      4.2857
+   2242.7971   1504.9600     34.9793      4.2857
+   2243.7800   1504.9800     34.9789      4.2857
+   2244.7629   1504.9900     34.9793      4.2858
+   2245.7471   1505.0100     34.9792      4.2859
+   2246.7300   1505.0300     34.9791      4.2858
+   2247.7129   1505.0400     34.9793      4.2859
+   2248.6960   1505.0601     34.9792      4.2860
+   2249.6790   1505.0800     34.9789      4.2861
+   2250.6631   1505.0900     34.9790      4.2861
+   2251.6460   1505.1100     34.9791      4.2862
+   2252.6289   1505.1300     34.9792      4.2862
+   2253.6121   1505.1500     34.9792      4.2863
+   2254.5950   1505.1600     34.9795      4.2865
+   2255.5779   1505.1801     34.9793      4.2865
+   2256.5620   1505.2000     34.9792      4.2867
+   2257.5449   1505.2100     34.9790      4.2868
+   2258.5281   1505.2300     34.9791      4.2869
+   2259.5110   1505.2500     34.9791      4.2870
+   2260.4939   1505.2700     34.9793      4.2871
+   2261.4771   1505.2800     34.9792      4.2871
+   2262.4600   1505.3000     34.9788      4.2873
+   2263.4441   1505.3199     34.9792      4.2873
+   2264.4270   1505.3300     34.9790      4.2875
+   2265.4099   1505.3500     34.9791      4.2875
+   2266.3931   1505.3700     34.9792      4.2875
+   2267.3760   1505.3800     34.9789      4.2876
+   2268.3589   1505.4000     34.9789      4.2877
+   2269.3420   1505.4200     34.9791      4.2878
+   2270.3250   1505.4399     34.9790      4.2878
+   2271.3081   1505.4500     34.9792      4.2879
+   2272.2920   1505.4700     34.9789      4.2880
+   2273.2749   1505.4900     34.9793      4.2880
+   2274.2581   1505.5000     34.9791      4.2881
+   2275.2410   1505.5200     34.9792      4.2882
+   2276.2241   1505.5400     34.9789      4.2883
+   2277.2070   1505.5601     34.9791      4.2883
+   2278.1899   1505.5699     34.9791      4.2883
+   2279.1731   1505.5900     34.9794      4.2884
+   2280.1560   1505.6100     34.9790      4.2885
+   2281.1389   1505.6200     34.9792      4.2886
+   2282.1221   1505.6400     34.9790      4.2887
+   2283.1050   1505.6600     34.9789      4.2887
+   2284.0879   1505.6700     34.9791      4.2888
+   2285.0710   1505.6899     34.9793      4.2887
+   2286.0540   1505.7100     34.9792      4.2888
+   2287.0371   1505.7300     34.9793      4.2889
+   2288.0200   1505.7400     34.9792      4.2890
+   2289.0029   1505.7600     34.9790      4.2890
+   2289.9861   1505.7800     34.9793      4.2891
+   2290.9690   1505.7900     34.9797      4.2891
+   2291.9519   1505.8101     34.9794      4.2891
+   2292.9351   1505.8300     34.9790      4.2892
+   2293.9180   1505.8400     34.9790      4.2892
+   2294.9009   1505.8600     34.9791      4.2892
+   2295.8840   1505.8800     34.9791      4.2892
+   2296.8669   1505.8900     34.9790      4.2892
+   2297.8501   1505.9100     34.9790      4.2891
+   2298.8330   1505.9301     34.9792      4.2891
+   2299.8159   1505.9399     34.9791      4.2893
+   2300.7991   1505.9600     34.9793      4.2893
+   2301.7820   1505.9800     34.9791      4.2893
+   2302.7649   1506.0000     34.9793      4.2893
+   2303.7480   1506.0100     34.9792      4.2894
+   2304.7310   1506.0300     34.9793      4.2893
+   2305.7141   1506.0500     34.9793      4.2895
+   2306.6970   1506.0601     34.9791      4.2897
+   2307.6799   1506.0800     34.9794      4.2897
+   2308.6621   1506.1000     34.9794      4.2898
+   2309.6450   1506.1200     34.9794      4.2900
+   2310.6279   1506.1300     34.9790      4.2901
+   2311.6111   1506.1500     34.9791      4.2902
+   2312.5940   1506.1700     34.9795      4.2902
+   2313.5769   1506.1801     34.9791      4.2902
+   2314.5601   1506.2000     34.9792      4.2900
+   2315.5430   1506.2200     34.9794      4.2900
+   2316.5259   1506.2300     34.9794      4.2900
+   2317.5090   1506.2500     34.9794      4.2901
+   2318.4910   1506.2700     34.9793      4.2902
+   2319.4741   1506.2800     34.9793      4.2904
+   2320.4570   1506.3000     34.9792      4.2904
+   2321.4399   1506.3199     34.9793      4.2905
+   2322.4231   1506.3400     34.9792      4.2907
+   2323.4060   1506.3500     34.9793      4.2907
+   2324.3889   1506.3700     34.9792      4.2908
+   2325.3711   1506.3900     34.9793      4.2908
+   2326.3540   1506.4000     34.9792      4.2909
+   2327.3369   1506.4200     34.9792      4.2910
+   2328.3201   1506.4399     34.9793      4.2910
+   2329.3030   1506.4600     34.9792      4.2911
+   2330.2849   1506.4700     34.9794      4.2912
+   2331.2681   1506.4900     34.9791      4.2914
+   2332.2510   1506.5100     34.9793      4.2915
+   2333.2339   1506.5200     34.9792      4.2916
+   2334.2170   1506.5400     34.9793      4.2917
+   2335.2000   1506.5601     34.9795      4.2917
+   2336.1819   1506.5800     34.9792      4.2919
+   2337.1650   1506.5900     34.9791      4.2919
+   2338.1479   1506.6100     34.9794      4.2920
+   2339.1311   1506.6300     34.9793      4.2921
+   2340.1130   1506.6400     34.9791      4.2921
+   2341.0959   1506.6600     34.9793      4.2923
+   2342.0791   1506.6801     34.9794      4.2924
+   2343.0620   1506.7000     34.9794      4.2924
+   2344.0439   1506.7100     34.9793      4.2926
+   2345.0271   1506.7300     34.9791      4.2926
+   2346.0100   1506.7500     34.9793      4.2928
+   2346.9929   1506.7600     34.9792      4.2929
+   2347.9751   1506.7800     34.9792      4.2929
+   2348.9580   1506.8000     34.9796      4.2930
+   2349.9409   1506.8199     34.9793      4.2931
+   2350.9241   1506.8300     34.9794      4.2933
+   2351.9060   1506.8500     34.9794      4.2933
+   2352.8889   1506.8700     34.9794      4.2934
+   2353.8721   1506.8800     34.9793      4.2935
+   2354.8540   1506.9000     34.9793      4.2936
+   2355.8369   1506.9200     34.9793      4.2937
+   2356.8201   1506.9399     34.9794      4.2937
+   2357.8030   1506.9500     34.9794      4.2938
+   2358.7849   1506.9700     34.9792      4.2938
+   2359.7681   1506.9900     34.9794      4.2939
+   2360.7510   1507.0000     34.9794      4.2939
+   2361.7329   1507.0200     34.9795      4.2941
+   2362.7161   1507.0400     34.9791      4.2941
+   2363.6990   1507.0500     34.9792      4.2941
+   2364.6809   1507.0699     34.9795      4.2941
+   2365.6641   1507.0900     34.9793      4.2943
+   2366.6470   1507.1100     34.9792      4.2945
+   2367.6289   1507.1200     34.9794      4.2945
+   2368.6121   1507.1400     34.9796      4.2946
+   2369.5950   1507.1600     34.9793      4.2948
+   2370.5769   1507.1801     34.9791      4.2949
+   2371.5601   1507.1899     34.9793      4.2950
+   2372.5420   1507.2100     34.9792      4.2948
+   2373.5249   1507.2300     34.9794      4.2950
+   2374.5081   1507.2400     34.9794      4.2951
+   2375.4900   1507.2600     34.9796      4.2951
+   2376.4729   1507.2800     34.9791      4.2952
+   2377.4551   1507.2900     34.9792      4.2953
+   2378.4380   1507.3101     34.9793      4.2953
+   2379.4209   1507.3300     34.9792      4.2954
+   2380.4031   1507.3500     34.9793      4.2955
+   2381.3860   1507.3600     34.9794      4.2955
+   2382.3679   1507.3800     34.9794      4.2956
+   2383.3511   1507.4000     34.9792      4.2956
+   2384.3340   1507.4100     34.9793      4.2957
+   2385.3159   1507.4301     34.9795      4.2958
+   2386.2991   1507.4500     34.9794      4.2959
+   2387.2810   1507.4600     34.9793      4.2960
+   2388.2639   1507.4800     34.9792      4.2961
+   2389.2461   1507.5000     34.9793      4.2961
+   2390.2290   1507.5200     34.9794      4.2962
+   2391.2109   1507.5300     34.9792      4.2963
+   2392.1941   1507.5500     34.9794      4.2963
+   2393.1770   1507.5699     34.9792      4.2964
+   2394.1589   1507.5800     34.9792      4.2965
+   2395.1421   1507.6000     34.9795      4.2965
+   2396.1240   1507.6200     34.9795      4.2965
+   2397.1069   1507.6400     34.9795      4.2966
+   2398.0891   1507.6500     34.9792      4.2968
+   2399.0720   1507.6700     34.9796      4.2967
+   2400.0540   1507.6899     34.9794      4.2968
+   2401.0371   1507.7000     34.9793      4.2970
@@ -0,0 +1,2435 @@
+test_read_store_and_write
+26/5/2016
+21:49:0
+Probe: SBE
+Source: /root/package/data/input/seabird/007_201605262145_CTD-SBtest_CON_BIN.cnv
+      0.9920   1544.2057     35.5333     29.0575
+      1.9841   1544.1547     35.4647     29.0594
+      2.9761   1543.9716     35.4356     28.9801
+      3.9682   1544.4167     35.5654     29.1170
+      4.9602   1544.3992     35.5277     29.1194
+      5.9522   1544.4508     35.5512     29.1241
+      6.9442   1544.4328     35.5625     29.1022
+      7.9362   1544.2843     35.5789     29.0166
+      8.9282   1544.1511     35.6163     28.9281
+      9.9203   1544.0385     35.6954     28.8290
+     10.9123   1544.0677     35.7270     28.8193
+     11.9042   1544.1035     35.7791     28.8026
+     12.8962   1544.1939     35.8855     28.7848
+     13.8882   1544.3129     36.0234     28.7649
+     14.8802   1544.3906     36.1593     28.7268
+     15.8722   1544.3528     36.3416     28.6124
+     16.8641   1544.0427     36.4236     28.4213
+     17.8561   1543.7783     36.4653     28.2717
+     18.8481   1543.5470     36.4552     28.1629
+     19.8400   1543.2310     36.4474     28.0147
+     20.8320   1542.7358     36.3992     27.8054
+     21.8239   1541.7303     36.2624     27.4108
+     22.8159   1540.9923     36.4345     26.9942
+     23.8078   1540.6307     36.4906     26.8012
+     24.7997   1540.5933     36.4914     26.7770
+     25.7917   1540.5437     36.4902     26.7484
+     26.7836   1540.4235     36.4867     26.6900
+     27.7755   1540.3077     36.4871     26.6318
+     28.7674   1540.1267     36.4962     26.5412
+     29.7593   1539.9003     36.4629     26.4508
+     30.7512   1539.4228     36.4045     26.2636
+     31.7431   1538.5204     36.3356     25.9001
+     32.7350   1538.1361     36.4366     25.6829
+     33.7269   1537.9766     36.4505     25.6017
+     34.7188   1537.7718     36.3860     25.5372
+     35.7107   1537.3157     36.3940     25.3340
+     36.7025   1536.9080     36.3922     25.1567
+     37.6944   1536.4405     36.3685     24.9652
+     38.6863   1536.0478     36.4178     24.7731
+     39.6781   1535.9231     36.4362     24.7064
+     40.6700   1535.7947     36.4372     24.6460
+     41.6618   1535.7142     36.4577     24.5967
+     42.6537   1535.5862     36.4421     24.5441
+     43.6455   1535.4751     36.4525     24.4869
+     44.6373   1535.4109     36.4526     24.4536
+     45.6292   1535.3488     36.4550     24.4202
+     46.6210   1535.2756     36.4368     24.3914
+     47.6128   1535.1251     36.4187     24.3310
+     48.6046   1534.9395     36.4193     24.2481
+     49.5964   1534.7586     36.4177     24.1683
+     50.5883   1534.6503     36.4254     24.1140
+     51.5801   1534.5571     36.4206     24.0715
+     52.5719   1534.4836     36.4290     24.0312
+     53.5636   1534.4501     36.4366     24.0075
+     54.5554   1534.4190     36.4314     23.9904
+     55.5472   1534.3376     36.4099     23.9601
+     56.5390   1534.2197     36.4158     23.9031
+     57.5308   1534.1480     36.4142     23.8681
+     58.5225   1534.0317     36.4061     23.8180
+     59.5143   1533.8778     36.4091     23.7480
+     60.5061   1533.8339     36.4235     23.7173
+     61.4978   1533.7805     36.4236     23.6891
+     62.4896   1533.7544     36.4225     23.6724
+     63.4813   1533.6841     36.4089     23.6434
+     64.4730   1533.5737     36.3970     23.5977
+     65.4648   1533.4435     36.3972     23.5388
+     66.4565   1533.3602     36.4228     23.4877
+     67.4482   1533.3660     36.4286     23.4808
+     68.4399   1533.3745     36.4333     23.4755
+     69.4317   1533.3885     36.4342     23.4740
+     70.4234   1533.3449     36.4289     23.4522
+     71.4151   1533.2637     36.4181     23.4179
+     72.4068   1533.2019     36.4167     23.3872
+     73.3985   1533.0705     36.3927     23.3387
+     74.3902   1532.8844     36.3825     23.2626
+     75.3819   1532.6850     36.3915     23.1731
+     76.3735   1532.5575     36.4061     23.1098
+     77.3652   1532.5270     36.4048     23.0917
+     78.3569   1532.4894     36.3977     23.0733
+     79.3485   1532.4269     36.3802     23.0496
+     80.3402   1532.2790     36.3683     22.9899
+     81.3319   1532.1788     36.3904     22.9344
+     82.3235   1532.0724     36.3701     22.8948
+     83.3152   1531.9364     36.3726     22.8338
+     84.3068   1531.8557     36.3800     22.7925
+     85.2984   1531.7403     36.3535     22.7522
+     86.2901   1531.5265     36.3380     22.6688
+     87.2817   1531.3179     36.3463     22.5775
+     88.2733   1531.1985     36.3596     22.5189
+     89.2649   1531.1180     36.3495     22.4855
+     90.2566   1530.9787     36.3225     22.4365
+     91.2482   1530.8317     36.3468     22.3628
+     92.2398   1530.7161     36.3524     22.3093
+     93.2314   1530.6396     36.3793     22.2619
+     94.2230   1530.6350     36.3878     22.2501
+     95.2146   1530.6387     36.4198     22.2315
+     96.2061   1530.6440     36.4332     22.2214
+     97.1977   1530.5862     36.4375     22.1909
+     98.1893   1530.4584     36.4004     22.1510
+     99.1809   1530.0740     36.3420     22.0218
+    100.1724   1529.6731     36.4014     21.8372
+    101.1640   1529.4791     36.4499     21.7366
+    102.1556   1529.4186     36.4657     21.7006
+    103.1471   1529.3782     36.4871     21.6700
+    104.1386   1529.3365     36.4971     21.6436
+    105.1302   1529.1955     36.4806     21.5908
+    106.1217   1529.0361     36.4729     21.5274
+    107.1133   1528.9151     36.4927     21.4671
+    108.1048   1528.8452     36.4916     21.4349
+    109.0963   1528.7120     36.4900     21.3791
+    110.0878   1528.6163     36.4986     21.3332
+    111.0793   1528.5297     36.5087     21.2902
+    112.0709   1528.4611     36.5230     21.2522
+    113.0624   1528.3650     36.5105     21.2151
+    114.0539   1528.2134     36.5190     21.1486
+    115.0453   1528.1008     36.5213     21.0993
+    116.0368   1527.9552     36.5278     21.0360
+    117.0283   1527.8350     36.5328     20.9829
+    118.0198   1527.7180     36.5396     20.9303
+    119.0113   1527.5882     36.5316     20.8792
+    120.0027   1527.4935     36.5429     20.8332
+    120.9942   1527.2972     36.4994     20.7722
+    121.9857   1527.0672     36.5166     20.6739
+    122.9771   1526.8746     36.5190     20.5957
+    123.9686   1526.6956     36.5099     20.5274
+    124.9600   1526.5605     36.5382     20.4600
+    125.9515   1526.5238     36.5478     20.4365
+    126.9429   1526.3968     36.5219     20.3944
+    127.9343   1526.1972     36.5248     20.3140
+    128.9258   1526.0605     36.5265     20.2573
+    129.9172   1525.9174     36.5142     20.2040
+    130.9086   1525.7683     36.5208     20.1409
+    131.9000   1525.6577     36.5157     20.0967
+    132.8914   1525.5564     36.5286     20.0486
+    133.8828   1525.3274     36.4746     19.9814
+    134.8742   1524.9960     36.4529     19.8643
+    135.8656   1524.6962     36.4808     19.7389
+    136.8570   1524.4968     36.4901     19.6574
+    137.8484   1524.3532     36.4903     19.5998
+    138.8398   1524.2522     36.5003     19.5536
+    139.8311   1524.1887     36.5159     19.5186
+    140.8225   1524.1674     36.5352     19.4973
+    141.8139   1524.1854     36.5393     19.4961
+    142.8052   1524.1852     36.5363     19.4913
+    143.7966   1524.1661     36.5353     19.4789
+    144.7879   1524.1453     36.5303     19.4675
+    145.7793   1524.0719     36.5090     19.4439
+    146.7706   1523.9911     36.5150     19.4067
+    147.7619   1523.7921     36.4652     19.3498
+    148.7533   1523.4640     36.4576     19.2302
+    149.7446   1523.1353     36.4521     19.1100
+    150.7359   1522.9374     36.4762     19.0245
+    151.7272   1522.8780     36.4902     18.9921
+    152.7186   1522.8602     36.4905     18.9798
+    153.7099   1522.7527     36.4409     18.9558
+    154.7012   1522.5340     36.4355     18.8751
+    155.6925   1522.3298     36.4201     18.8036
+    156.6838   1522.0448     36.3985     18.7064
+    157.6750   1521.7598     36.4111     18.5960
+    158.6663   1521.5553     36.4386     18.5080
+    159.6576   1521.4829     36.4470     18.4737
+    160.6489   1521.4542     36.4463     18.4582
+    161.6402   1521.4233     36.4356     18.4459
+    162.6314         nan         nan     -0.0000
+    163.6227   1521.2203     36.3890     18.3822
+    164.6139   1521.0663     36.4063     18.3162
+    165.6052   1520.9932     36.4221     18.2789
+    166.5964   1520.9223     36.4097     18.2535
+    167.5877   1520.8105     36.4072     18.2101
+    168.5789   1520.7215     36.4105     18.1723
+    169.5701   1520.6476     36.3916     18.1485
+    170.5613   1520.4810     36.3649     18.0958
+    171.5526   1520.2648     36.3293     18.0296
+    172.5438   1520.0565     36.3274     17.9531
+    173.5350   1519.8066     36.2992     17.8728
+    174.5262   1519.6543     36.3359     17.8007
+    175.5174   1519.5086     36.3210     17.7511
+    176.5086   1519.2629     36.3057     17.6676
+    177.4998   1519.0690     36.3189     17.5909
+    178.4910   1518.9532     36.3200     17.5455
+    179.4822   1518.8737     36.3151     17.5148
+    180.4733   1518.7983     36.3192     17.4820
+    181.4645   1518.7692     36.3183     17.4669
+    182.4557   1518.6919     36.2862     17.4475
+    183.4468   1518.5248     36.2557     17.3972
+    184.4380   1518.3520     36.2635     17.3302
+    185.4292   1518.2113     36.2697     17.2748
+    186.4203   1517.9781     36.2383     17.2028
+    187.4114   1517.7503     36.2448     17.1182
+    188.4026   1517.5931     36.2318     17.0649
+    189.3937   1517.4180     36.2139     17.0076
+    190.3848   1517.2726     36.2272     16.9484
+    191.3760   1517.1715     36.2159     16.9134
+    192.3671   1516.9923     36.1915     16.8575
+    193.3582   1516.8267     36.1945     16.7957
+    194.3493   1516.7045     36.1946     16.7495
+    195.3404   1516.6353     36.1918     16.7221
+    196.3315   1516.4885     36.1755     16.6741
+    197.3226   1516.3571     36.1717     16.6265
+    198.3137   1516.1430     36.1586     16.5552
+    199.3048   1515.9641     36.1531     16.4927
+    200.2959   1515.8570     36.1584     16.4499
+    201.2870   1515.8054     36.1672     16.4241
+    202.2780   1515.7171     36.1413     16.3994
+    203.2691   1515.6180     36.1472     16.3591
+    204.2601   1515.5715     36.1519     16.3366
+    205.2512   1515.5127     36.1391     16.3167
+    206.2423   1515.3966     36.1133     16.2829
+    207.2333   1515.1438     36.0922     16.2026
+    208.2243   1514.9399     36.0943     16.1297
+    209.2154   1514.7537     36.0868     16.0663
+    210.2064   1514.6446     36.0898     16.0242
+    211.1974   1514.5578     36.0973     15.9877
+    212.1885   1514.4985     36.0910     15.9654
+    213.1795   1514.4653     36.0933     15.9483
+    214.1705   1514.4063     36.0716     15.9319
+    215.1615   1514.2308     36.0398     15.8815
+    216.1525   1514.0221     36.0367     15.8096
+    217.1435   1513.8349     36.0258     15.7477
+    218.1345   1513.6542     36.0284     15.6830
+    219.1255   1513.5589     36.0337     15.6449
+    220.1165   1513.4337     36.0013     15.6113
+    221.1075   1513.3119     36.0212     15.5593
+    222.0985   1513.2876     36.0336     15.5415
+    223.0894   1513.2880     36.0327     15.5366
+    224.0804   1513.2254     36.0125     15.5187
+    225.0714   1513.1338     36.0091     15.4852
+    226.0623   1513.0887     36.0150     15.4632
+    227.0533   1513.0471     36.0057     15.4480
+    228.0442   1512.9580     35.9786     15.4242
+    229.0352   1512.7512     35.9390     15.3674
+    230.0261   1512.5803     35.9688     15.2963
+    231.0170   1512.4958     35.9781     15.2606
+    232.0079   1512.4292     35.9779     15.2341
+    232.9989   1512.4098     35.9817     15.2212
+    233.9898   1512.3789     35.9720     15.2097
+    234.9807   1512.3072     35.9583     15.1866
+    235.9716   1512.2057     35.9500     15.1521
+    236.9625   1512.1012     35.9445     15.1156
+    237.9534   1511.9864     35.9384     15.0761
+    238.9443   1511.8562     35.9238     15.0349
+    239.9352   1511.7078     35.9191     14.9843
+    240.9261   1511.5406     35.9142     14.9279
+    241.9170   1511.4308     35.9129     14.8884
+    242.9079   1511.3471     35.9097     14.8579
+    243.8987   1511.2311     35.8795     14.8272
+    244.8896   1510.9378     35.8442     14.7425
+    245.8804   1510.6991     35.8542     14.6585
+    246.8713   1510.5606     35.8662     14.6054
+    247.8622   1510.3989     35.8507     14.5552
+    248.8530   1510.2373     35.8373     14.5043
+    249.8439   1510.1043     35.8472     14.4539
+    250.8347   1510.0111     35.8346     14.4242
+    251.8255   1509.9098     35.8297     14.3892
+    252.8163   1509.7941     35.8206     14.3513
+    253.8072   1509.6623     35.8143     14.3074
+    254.7980   1509.5539     35.8154     14.2681
+    255.7888   1509.4896     35.8158     14.2428
+    256.7796   1509.4120     35.8154     14.2137
+    257.7704   1509.3624     35.8218     14.1908
+    258.7612   1509.3446     35.8164     14.1821
+    259.7520   1509.2843     35.7993     14.1645
+    260.7428   1509.2211     35.8025     14.1386
+    261.7336   1509.1798     35.8007     14.1213
+    262.7244   1509.1114     35.7936     14.0976
+    263.7151   1509.0237     35.7840     14.0688
+    264.7059   1508.8561     35.7652     14.0187
+    265.6967   1508.6870     35.7605     13.9631
+    266.6874   1508.5839     35.7546     13.9283
+    267.6782   1508.4892     35.7619     13.8914
+    268.6689   1508.4355     35.7606     13.8702
+    269.6597   1508.3140     35.7445     13.8336
+    270.6504   1508.2181     35.7470     13.7981
+    271.6412   1508.1474     35.7489     13.7706
+    272.6319   1508.1074     35.7483     13.7535
+    273.6226   1508.0417     35.7338     13.7335
+    274.6133   1507.9627     35.7402     13.7019
+    275.6041   1507.8540     35.7168     13.6720
+    276.5948   1507.6977     35.7087     13.6220
+    277.5855   1507.5960     35.7056     13.5870
+    278.5762   1507.4661     35.6711     13.5547
+    279.5669   1507.2137     35.6430     13.4828
+    280.5576   1507.0391     35.6758     13.4128
+    281.5483   1506.9653     35.6875     13.3811
+    282.5390   1506.9213     35.6909     13.3615
+    283.5296   1506.8326     35.6660     13.3385
+    284.5203   1506.7378     35.6708     13.3030
+    285.5110   1506.6614     35.6597     13.2788
+    286.5016   1506.5252     35.6425     13.2387
+    287.4923   1506.3736     35.6400     13.1887
+    288.4830   1506.2844     35.6516     13.1526
+    289.4736   1506.2469     35.6493     13.1371
+    290.4643   1506.1817     35.6379     13.1165
+    291.4549   1506.0606     35.6238     13.0800
+    292.4456   1505.9560     35.6323     13.0405
+    293.4362   1505.9178     35.6384     13.0218
+    294.4268   1505.9017     35.6384     13.0120
+    295.4174   1505.8941     35.6362     13.0055
+    296.4081   1505.8671     35.6281     12.9953
+    297.3987   1505.8159     35.6206     12.9776
+    298.3893   1505.7204     35.6091     12.9480
+    299.3799   1505.5945     35.5991     12.9088
+    300.3705   1505.3991     35.5787     12.8525
+    301.3611   1505.3212     35.6043     12.8151
+    302.3517   1505.3035     35.6064     12.8041
+    303.3422   1505.2869     35.6027     12.7955
+    304.3328   1505.1762     35.5724     12.7682
+    305.3234   1505.0033     35.5730     12.7114
+    306.3140   1504.9199     35.5807     12.6788
+    307.3045   1504.8317     35.5603     12.6548
+    308.2951   1504.7269     35.5646     12.6171
+    309.2856   1504.6835     35.5715     12.5968
+    310.2762   1504.6459     35.5630     12.5837
+    311.2668   1504.5785     35.5591     12.5601
+    312.2573   1504.5337     35.5608     12.5413
+    313.2478   1504.4253     35.5375     12.5124
+    314.2383   1504.2998     35.5421     12.4686
+    315.2289   1504.1904     35.5366     12.4332
+    316.2194   1504.1026     35.5360     12.4025
+    317.2099   1504.0285     35.5358     12.3757
+    318.2004   1504.0135     35.5374     12.3658
+    319.1909   1503.9868     35.5349     12.3539
+    320.1814   1503.9720     35.5395     12.3430
+    321.1719   1503.9320     35.5239     12.3318
+    322.1624   1503.7467     35.4957     12.2821
+    323.1529   1503.5476     35.5008     12.2167
+    324.1434   1503.4747     35.5150     12.1853
+    325.1339   1503.4726     35.5188     12.1785
+    326.1244   1503.4831     35.5177     12.1771
+    327.1148   1503.4847     35.5151     12.1736
+    328.1053   1503.4819     35.5126     12.1688
+    329.0958   1503.3935     35.4919     12.1452
+    330.0862   1503.3125     35.5005     12.1135
+    331.0767   1503.3071     35.5063     12.1050
+    332.0671   1503.3133     35.5053     12.1023
+    333.0576   1503.3181     35.5069     12.0983
+    334.0480   1503.3279     35.5050     12.0970
+    335.0384   1503.2665     35.4731     12.0853
+    336.0288   1503.0904     35.4627     12.0324
+    337.0193   1502.9960     35.4794     11.9940
+    338.0097   1502.9747     35.4818     11.9821
+    339.0001   1502.9305     35.4701     11.9684
+    339.9905   1502.8345     35.4562     11.9403
+    340.9809   1502.6927     35.4559     11.8941
+    341.9713   1502.6153     35.4643     11.8637
+    342.9617   1502.5853     35.4629     11.8506
+    343.9521   1502.5575     35.4620     11.8380
+    344.9425   1502.5299     35.4557     11.8273
+    345.9329   1502.4414     35.4319     11.8050
+    346.9232   1502.2803     35.4300     11.7539
+    347.9136   1502.1507     35.4330     11.7103
+    348.9040   1502.0528     35.4279     11.6788
+    349.8943   1501.9966     35.4324     11.6561
+    350.8847   1501.9689     35.4328     11.6431
+    351.8750   1501.9366     35.4260     11.6313
+    352.8654   1501.8701     35.4173     11.6102
+    353.8557   1501.7951     35.4183     11.5833
+    354.8460   1501.7425     35.4173     11.5636
+    355.8364   1501.6959     35.4162     11.5457
+    356.8267   1501.6692     35.4188     11.5323
+    357.8170   1501.6162     35.4080     11.5159
+    358.8073   1501.5578     35.4089     11.4939
+    359.7977   1501.5344     35.4137     11.4807
+    360.7880   1501.5246     35.4113     11.4739
+    361.7783   1501.5005     35.4026     11.4652
+    362.7686   1501.4276     35.3875     11.4446
+    363.7589   1501.3647     35.3948     11.4191
+    364.7491   1501.3150     35.3890     11.4020
+    365.7394   1501.2575     35.3906     11.3801
+    366.7297   1501.2207     35.3924     11.3641
+    367.7200   1501.1473     35.3811     11.3421
+    368.7103   1501.0705     35.3796     11.3157
+    369.7005   1501.0101     35.3726     11.2960
+    370.6908   1500.9184     35.3598     11.2693
+    371.6810   1500.8293     35.3593     11.2391
+    372.6713   1500.7703     35.3671     11.2147
+    373.6615   1500.7426     35.3671     11.2020
+    374.6518   1500.6884     35.3638     11.1828
+    375.6420   1500.6455     35.3683     11.1642
+    376.6322   1500.6260     35.3668     11.1544
+    377.6225   1500.6172     35.3672     11.1470
+    378.6127   1500.6156     35.3654     11.1424
+    379.6029   1500.6003     35.3562     11.1365
+    380.5931   1500.5095     35.3418     11.1107
+    381.5833   1500.4332     35.3459     11.0827
+    382.5735   1500.3868     35.3479     11.0640
+    383.5637   1500.2928     35.3357     11.0366
+    384.5539   1500.2254     35.3409     11.0108
+    385.5441   1500.1799     35.3372     10.9944
+    386.5343   1500.1490     35.3393     10.9801
+    387.5245   1500.1229     35.3339     10.9698
+    388.5146   1500.0825     35.3309     10.9546
+    389.5048   1500.0354     35.3284     10.9373
+    390.4950   1499.9643     35.3157     10.9167
+    391.4851   1499.8105     35.3046     10.8720
+    392.4753   1499.7383     35.3187     10.8419
+    393.4655   1499.7221     35.3221     10.8314
+    394.4556   1499.7169     35.3234     10.8248
+    395.4457   1499.6720     35.3072     10.8129
+    396.4359   1499.6037     35.3071     10.7888
+    397.4260   1499.5294     35.2993     10.7657
+    398.4161   1499.4302     35.2914     10.7356
+    399.4062   1499.2932     35.2857     10.6940
+    400.3964   1499.1730     35.2903     10.6537
+    401.3865   1499.1380     35.2914     10.6387
+    402.3766   1499.0743     35.2714     10.6229
+    403.3667   1498.9964     35.2752     10.5949
+    404.3568   1498.9495     35.2809     10.5750
+    405.3469   1498.8955     35.2788     10.5558
+    406.3370   1498.8704     35.2839     10.5423
+    407.3271   1498.8649     35.2827     10.5365
+    408.3171   1498.8301     35.2742     10.5249
+    409.3072   1498.7767     35.2675     10.5075
+    410.2973   1498.7164     35.2705     10.4848
+    411.2874   1498.6926     35.2703     10.4735
+    412.2774   1498.6579     35.2659     10.4606
+    413.2675   1498.6226     35.2644     10.4465
+    414.2575   1498.5937     35.2655     10.4333
+    415.2476   1498.5548     35.2598     10.4197
+    416.2376   1498.4967     35.2548     10.4004
+    417.2276   1498.3979     35.2574     10.3671
+    418.2177   1498.3586     35.2579     10.3512
+    419.2077   1498.3547     35.2611     10.3444
+    420.1977   1498.3555     35.2557     10.3418
+    421.1877   1498.3012     35.2318     10.3301
+    422.1777   1498.2113     35.2316     10.3003
+    423.1678   1498.1328     35.2317     10.2736
+    424.1577   1497.9950     35.2184     10.2349
+    425.1478   1497.8639     35.2318     10.1890
+    426.1378   1497.8415     35.2401     10.1753
+    427.1277   1497.8575     35.2396     10.1753
+    428.1177   1497.8536     35.2329     10.1719
+    429.1077   1497.8380     35.2311     10.1635
+    430.0977   1497.8083     35.2238     10.1531
+    431.0876   1497.7563     35.2210     10.1349
+    432.0776   1497.6970     35.2125     10.1166
+    433.0676   1497.6208     35.2137     10.0903
+    434.0575   1497.5316     35.2073     10.0630
+    435.0475   1497.4687     35.2146     10.0384
+    436.0374   1497.4518     35.2163     10.0285
+    437.0274   1497.4490     35.2148     10.0236
+    438.0173   1497.4354     35.2087     10.0173
+    439.0072   1497.4182     35.2079     10.0082
+    439.9972   1497.3834     35.2064      9.9944
+    440.9871   1497.3646     35.2092      9.9836
+    441.9770   1497.3597     35.2091      9.9777
+    442.9669   1497.3503     35.2073      9.9711
+    443.9568   1497.3222     35.1969      9.9622
+    444.9467   1497.2515     35.1868      9.9414
+    445.9366   1497.1571     35.1794      9.9131
+    446.9265   1497.0344     35.1653      9.8792
+    447.9164   1496.9612     35.1848      9.8477
+    448.9063   1496.9302     35.1890      9.8331
+    449.8962   1496.9225     35.1889      9.8264
+    450.8860   1496.9064     35.1853      9.8186
+    451.8759   1496.8347     35.1725      9.7985
+    452.8658   1496.7420     35.1718      9.7685
+    453.8557   1496.6919     35.1797      9.7474
+    454.8455   1496.6689     35.1716      9.7392
+    455.8354   1496.6250     35.1722      9.7223
+    456.8252   1496.5831     35.1643      9.7088
+    457.8150   1496.4929     35.1546      9.6826
+    458.8049   1496.4139     35.1595      9.6546
+    459.7947   1496.3690     35.1591      9.6378
+    460.7845   1496.3077     35.1526      9.6185
+    461.7744   1496.2248     35.1446      9.5938
+    462.7642   1496.1554     35.1518      9.5677
+    463.7540   1496.1215     35.1516      9.5539
+    464.7438   1496.0736     35.1435      9.5389
+    465.7336   1495.9847     35.1311      9.5141
+    466.7234   1495.9252     35.1423      9.4894
+    467.7132   1495.8902     35.1431      9.4750
+    468.7030   1495.8618     35.1447      9.4621
+    469.6928   1495.8320     35.1364      9.4522
+    470.6826   1495.7794     35.1338      9.4341
+    471.6723   1495.7396     35.1340      9.4186
+    472.6621   1495.6810     35.1265      9.4005
+    473.6519   1495.6093     35.1305      9.3750
+    474.6416   1495.5807     35.1371      9.3604
+    475.6314   1495.5839     35.1325      9.3583
+    476.6211   1495.5425     35.1201      9.3466
+    477.6109   1495.4799     35.1149      9.3267
+    478.6006   1495.4006     35.1160      9.3001
+    479.5904   1495.3528     35.1152      9.2828
+    480.5801   1495.2327     35.1035      9.2494
+    481.5698   1495.1929     35.1143      9.2304
+    482.5595   1495.1498     35.1090      9.2159
+    483.5493   1495.1057     35.1083      9.1996
+    484.5390   1495.0427     35.1033      9.1796
+    485.5287   1494.9865     35.1076      9.1583
+    486.5184   1494.9783     35.1130      9.1498
+    487.5081   1494.9832     35.1110      9.1473
+    488.4978   1494.9679     35.1039      9.1410
+    489.4875   1494.9226     35.0999      9.1255
+    490.4771   1494.8605     35.0915      9.1069
+    491.4668   1494.7920     35.0965      9.0821
+    492.4565   1494.7718     35.0999      9.0710
+    493.4462   1494.7616     35.1000      9.0637
+    494.4359   1494.7515     35.0996      9.0566
+    495.4255   1494.7058     35.0873      9.0438
+    496.4152   1494.6322     35.0883      9.0190
+    497.4048   1494.6058     35.0929      9.0058
+    498.3944   1494.5894     35.0898      8.9979
+    499.3841   1494.5712     35.0909      8.9881
+    500.3737   1494.5491     35.0860      8.9793
+    501.3634   1494.4687     35.0761      8.9563
+    502.3530   1494.4134     35.0816      8.9350
+    503.3426   1494.3813     35.0826      8.9215
+    504.3322   1494.3454     35.0781      8.9088
+    505.3218   1494.3234     35.0835      8.8966
+    506.3115   1494.3034     35.0745      8.8897
+    507.3011   1494.2263     35.0601      8.8692
+    508.2906   1494.1514     35.0684      8.8417
+    509.2802   1494.1331     35.0741      8.8304
+    510.2698   1494.1059     35.0704      8.8198
+    511.2594   1494.0843     35.0716      8.8091
+    512.2490   1494.0727     35.0726      8.8012
+    513.2386   1494.0670     35.0720      8.7954
+    514.2281   1494.0648     35.0721      8.7903
+    515.2177   1494.0637     35.0716      8.7857
+    516.2073   1494.0605     35.0707      8.7807
+    517.1968   1494.0484     35.0661      8.7745
+    518.1864   1493.9924     35.0545      8.7588
+    519.1760   1493.9135     35.0545      8.7331
+    520.1655   1493.8653     35.0594      8.7140
+    521.1550   1493.8486     35.0629      8.7039
+    522.1445   1493.8387     35.0580      8.6984
+    523.1341   1493.7851     35.0539      8.6809
+    524.1236   1493.7499     35.0565      8.6661
+    525.1131   1493.7310     35.0558      8.6568
+    526.1027   1493.7192     35.0567      8.6489
+    527.0922   1493.7106     35.0547      8.6428
+    528.0817   1493.7012     35.0566      8.6352
+    529.0712   1493.6742     35.0494      8.6259
+    530.0607   1493.6412     35.0536      8.6112
+    531.0502   1493.6306     35.0524      8.6043
+    532.0396   1493.6078     35.0460      8.5959
+    533.0291   1493.5648     35.0445      8.5804
+    534.0186   1493.5176     35.0411      8.5644
+    535.0081   1493.4283     35.0267      8.5408
+    535.9975   1493.3274     35.0361      8.5062
+    536.9870   1493.2939     35.0367      8.4926
+    537.9764   1493.2423     35.0338      8.4753
+    538.9659   1493.2085     35.0354      8.4613
+    539.9553   1493.1943     35.0396      8.4517
+    540.9448   1493.1934     35.0388      8.4473
+    541.9342   1493.1895     35.0383      8.4420
+    542.9236   1493.1801     35.0364      8.4357
+    543.9131   1493.1386     35.0282      8.4229
+    544.9025   1493.1016     35.0300      8.4080
+    545.8919   1493.0855     35.0333      8.3982
+    546.8813   1493.0827     35.0342      8.3927
+    547.8707   1493.0763     35.0321      8.3873
+    548.8602   1493.0581     35.0295      8.3789
+    549.8495   1493.0214     35.0246      8.3663
+    550.8389   1492.9902     35.0256      8.3532
+    551.8284   1492.9547     35.0211      8.3408
+    552.8177   1492.9150     35.0212      8.3258
+    553.8071   1492.8660     35.0176      8.3095
+    554.7965   1492.7883     35.0161      8.2849
+    555.7859   1492.7571     35.0212      8.2705
+    556.7752   1492.7452     35.0206      8.2631
+    557.7646   1492.7327     35.0190      8.2559
+    558.7540   1492.7029     35.0132      8.2455
+    559.7433   1492.6712     35.0158      8.2318
+    560.7327   1492.6402     35.0141      8.2197
+    561.7220   1492.6059     35.0126      8.2067
+    562.7114   1492.5880     35.0170      8.1961
+    563.7007   1492.5560     35.0075      8.1863
+    564.6900   1492.4965     35.0072      8.1662
+    565.6793   1492.4585     35.0088      8.1512
+    566.6686   1492.4142     35.0035      8.1368
+    567.6580   1492.3528     35.0012      8.1169
+    568.6473   1492.3107     35.0055      8.0999
+    569.6366   1492.2990     35.0086      8.0914
+    570.6259   1492.3021     35.0084      8.0879
+    571.6152   1492.2748     34.9968      8.0801
+    572.6045   1492.2088     34.9957      8.0586
+    573.5938   1492.1366     34.9939      8.0357
+    574.5830   1492.0890     35.0004      8.0166
+    575.5723   1492.0838     35.0023      8.0102
+    576.5616   1492.0866     35.0022      8.0066
+    577.5508   1492.0762     34.9973      8.0011
+    578.5401   1492.0537     34.9939      7.9919
+    579.5294   1492.0297     34.9939      7.9812
+    580.5186   1492.0149     34.9945      7.9727
+    581.5079   1491.9923     34.9886      7.9643
+    582.4971   1491.9221     34.9834      7.9431
+    583.4863   1491.8294     34.9833      7.9143
+    584.4756   1491.7516     34.9847      7.8889
+    585.4648   1491.7075     34.9841      7.8731
+    586.4540   1491.6890     34.9825      7.8644
+    587.4433   1491.6680     34.9826      7.8545
+    588.4325   1491.6629     34.9869      7.8474
+    589.4217   1491.6709     34.9894      7.8443
+    590.4109   1491.6846     34.9893      7.8436
+    591.4001   1491.6987     34.9902      7.8427
+    592.3893   1491.7165     34.9906      7.8429
+    593.3785   1491.7322     34.9899      7.8429
+    594.3677   1491.7459     34.9898      7.8422
+    595.3569   1491.7562     34.9893      7.8407
+    596.3461   1491.7666     34.9878      7.8396
+    597.3352   1491.7677     34.9873      7.8357
+    598.3244   1491.7517     34.9817      7.8290
+    599.3135   1491.7196     34.9847      7.8152
+    600.3027   1491.7152     34.9797      7.8113
+    601.2919   1491.6753     34.9689      7.8000
+    602.2810   1491.6268     34.9720      7.7819
+    603.2701   1491.5716     34.9699      7.7637
+    604.2593   1491.5248     34.9740      7.7457
+    605.2484   1491.4671     34.9700      7.7275
+    606.2375   1491.4146     34.9711      7.7090
+    607.2267   1491.3796     34.9720      7.6952
+    608.2158   1491.3575     34.9709      7.6854
+    609.2049   1491.3388     34.9717      7.6759
+    610.1940   1491.3191     34.9659      7.6683
+    611.1832   1491.2309     34.9532      7.6450
+    612.1722   1491.1542     34.9628      7.6174
+    613.1613   1491.1299     34.9708      7.6041
+    614.1505   1491.1394     34.9719      7.6019
+    615.1395   1491.1398     34.9694      7.5985
+    616.1286   1491.1340     34.9680      7.5931
+    617.1177   1491.1096     34.9582      7.5856
+    618.1068   1491.0698     34.9550      7.5719
+    619.0958   1491.0343     34.9580      7.5573
+    620.0849   1490.9904     34.9525      7.5433
+    621.0740   1490.9438     34.9543      7.5262
+    622.0630   1490.8685     34.9543      7.5022
+    623.0521   1490.8021     34.9587      7.4791
+    624.0411   1490.7953     34.9624      7.4718
+    625.0302   1490.8015     34.9597      7.4700
+    626.0192   1490.7899     34.9559      7.4639
+    627.0082   1490.7721     34.9557      7.4550
+    627.9973   1490.7594     34.9578      7.4467
+    628.9863   1490.7429     34.9529      7.4397
+    629.9753   1490.7081     34.9523      7.4265
+    630.9643   1490.6736     34.9525      7.4131
+    631.9533   1490.6343     34.9517      7.3988
+    632.9423   1490.5953     34.9503      7.3848
+    633.9313   1490.5432     34.9443      7.3689
+    634.9203   1490.5074     34.9506      7.3532
+    635.9093   1490.4924     34.9510      7.3449
+    636.8983   1490.4854     34.9518      7.3385
+    637.8873   1490.4819     34.9527      7.3330
+    638.8762   1490.4770     34.9522      7.3276
+    639.8652   1490.4771     34.9531      7.3230
+    640.8542   1490.4686     34.9507      7.3173
+    641.8431   1490.4442     34.9509      7.3066
+    642.8321   1490.4396     34.9518      7.3008
+    643.8210   1490.4389     34.9503      7.2968
+    644.8100   1490.4403     34.9511      7.2926
+    645.7989   1490.4480     34.9521      7.2900
+    646.7878   1490.4378     34.9437      7.2858
+    647.7768   1490.3817     34.9405      7.2680
+    648.7657   1490.3528     34.9484      7.2536
+    649.7546   1490.3339     34.9466      7.2450
+    650.7435   1490.3216     34.9451      7.2380
+    651.7325   1490.2935     34.9418      7.2275
+    652.7214   1490.2649     34.9430      7.2154
+    653.7103   1490.2460     34.9421      7.2065
+    654.6992   1490.2315     34.9441      7.1978
+    655.6880   1490.2238     34.9454      7.1911
+    656.6769   1490.2223     34.9461      7.1862
+    657.6658   1490.2266     34.9447      7.1835
+    658.6547   1490.2119     34.9398      7.1770
+    659.6436   1490.1847     34.9403      7.1655
+    660.6324   1490.1704     34.9413      7.1572
+    661.6213   1490.1551     34.9415      7.1489
+    662.6102   1490.1468     34.9423      7.1422
+    663.5991   1490.1348     34.9414      7.1351
+    664.5879   1490.1287     34.9428      7.1288
+    665.5768   1490.1312     34.9430      7.1251
+    666.5656   1490.1384     34.9439      7.1224
+    667.5544   1490.1484     34.9442      7.1206
+    668.5433   1490.1395     34.9397      7.1155
+    669.5321   1490.1375     34.9418      7.1100
+    670.5209   1490.1305     34.9382      7.1051
+    671.5098   1490.0998     34.9369      7.0933
+    672.4985   1490.0561     34.9348      7.0784
+    673.4874   1490.0389     34.9385      7.0685
+    674.4762   1490.0304     34.9365      7.0627
+    675.4650   1490.0183     34.9374      7.0550
+    676.4537   1490.0070     34.9368      7.0480
+    677.4426   1489.9931     34.9363      7.0403
+    678.4313   1489.9751     34.9350      7.0318
+    679.4201   1489.9550     34.9342      7.0226
+    680.4089   1489.8769     34.9197      7.0029
+    681.3976   1489.8140     34.9302      6.9790
+    682.3864   1489.7746     34.9311      6.9643
+    683.3752   1489.7354     34.9309      6.9500
+    684.3640   1489.7181     34.9314      6.9411
+    685.3527   1489.6832     34.9220      6.9309
+    686.3414   1489.6588     34.9293      6.9180
+    687.3302   1489.6593     34.9332      6.9126
+    688.3190   1489.6634     34.9348      6.9089
+    689.3077   1489.6681     34.9350      6.9058
+    690.2964   1489.6598     34.9303      6.9009
+    691.2852   1489.6337     34.9286      6.8905
+    692.2739   1489.6208     34.9305      6.8823
+    693.2626   1489.6113     34.9293      6.8760
+    694.2513   1489.6003     34.9303      6.8686
+    695.2400   1489.5839     34.9273      6.8611
+    696.2287   1489.5570     34.9274      6.8499
+    697.2174   1489.5320     34.9254      6.8399
+    698.2061   1489.4947     34.9216      6.8273
+    699.1948   1489.4181     34.9178      6.8046
+    700.1834   1489.3738     34.9258      6.7864
+    701.1721   1489.3422     34.9231      6.7749
+    702.1608   1489.3059     34.9254      6.7606
+    703.1495   1489.2992     34.9281      6.7538
+    704.1381   1489.3045     34.9290      6.7506
+    705.1268   1489.3116     34.9280      6.7485
+    706.1154   1489.3153     34.9275      6.7454
+    707.1041   1489.3109     34.9264      6.7404
+    708.0927   1489.3037     34.9286      6.7336
+    709.0814   1489.2945     34.9261      6.7278
+    710.0700   1489.2791     34.9271      6.7193
+    711.0587   1489.2745     34.9258      6.7143
+    712.0472   1489.2673     34.9250      6.7085
+    713.0359   1489.2547     34.9217      6.7021
+    714.0245   1489.2129     34.9201      6.6877
+    715.0131   1489.1769     34.9208      6.6740
+    716.0017   1489.1574     34.9233      6.6640
+    716.9903   1489.1515     34.9246      6.6578
+    717.9789   1489.1389     34.9251      6.6502
+    718.9675   1489.1357     34.9246      6.6453
+    719.9561   1489.1292     34.9231      6.6399
+    720.9447   1489.1149     34.9214      6.6326
+    721.9332   1489.0931     34.9201      6.6232
+    722.9218   1489.0535     34.9181      6.6095
+    723.9104   1489.0189     34.9220      6.5952
+    724.8990   1489.0046     34.9230      6.5870
+    725.8875   1488.9990     34.9225      6.5815
+    726.8761   1488.9890     34.9210      6.5752
+    727.8646   1488.9723     34.9208      6.5668
+    728.8531   1488.9677     34.9217      6.5611
+    729.8417   1488.9624     34.9221      6.5554
+    730.8303   1488.9570     34.9227      6.5496
+    731.8188   1488.9465     34.9234      6.5425
+    732.8073   1488.9441     34.9239      6.5375
+    733.7958   1488.9255     34.9172      6.5307
+    734.7844   1488.8947     34.9164      6.5189
+    735.7729   1488.8748     34.9202      6.5084
+    736.7614   1488.8714     34.9218      6.5028
+    737.7499   1488.8692     34.9212      6.4982
+    738.7383   1488.8582     34.9202      6.4915
+    739.7269   1488.8449     34.9218      6.4834
+    740.7153   1488.8457     34.9230      6.4790
+    741.7039   1488.8561     34.9231      6.4774
+    742.6923   1488.8481     34.9159      6.4735
+    743.6808   1488.8328     34.9171      6.4650
+    744.6693   1488.7973     34.9129      6.4531
+    745.6577   1488.7653     34.9177      6.4392
+    746.6462   1488.7495     34.9198      6.4303
+    747.6346   1488.7331     34.9189      6.4222
+    748.6231   1488.7255     34.9207      6.4155
+    749.6116   1488.7259     34.9198      6.4117
+    750.6000   1488.7164     34.9169      6.4060
+    751.5884   1488.7056     34.9205      6.3979
+    752.5768   1488.7148     34.9225      6.3954
+    753.5653   1488.7217     34.9204      6.3936
+    754.5537   1488.7173     34.9201      6.3884
+    755.5421   1488.7059     34.9176      6.3821
+    756.5305   1488.6823     34.9127      6.3735
+    757.5189   1488.6606     34.9164      6.3626
+    758.5073   1488.6490     34.9175      6.3551
+    759.4957   1488.6390     34.9176      6.3483
+    760.4841   1488.6131     34.9168      6.3378
+    761.4725   1488.5940     34.9183      6.3283
+    762.4609   1488.5834     34.9189      6.3212
+    763.4493   1488.5762     34.9182      6.3154
+    764.4377   1488.5651     34.9178      6.3085
+    765.4260   1488.5452     34.9150      6.3002
+    766.4144   1488.5111     34.9145      6.2875
+    767.4028   1488.4938     34.9180      6.2778
+    768.3911   1488.4940     34.9207      6.2728
+    769.3795   1488.4779     34.9139      6.2667
+    770.3679   1488.3996     34.9113      6.2435
+    771.3562   1488.3501     34.9144      6.2258
+    772.3445   1488.3148     34.9122      6.2134
+    773.3328   1488.2830     34.9124      6.2011
+    774.3212   1488.2611     34.9158      6.1903
+    775.3095   1488.2599     34.9202      6.1844
+    776.2979   1488.2691     34.9210      6.1823
+    777.2861   1488.2819     34.9202      6.1816
+    778.2745   1488.2854     34.9190      6.1787
+    779.2628   1488.2907     34.9195      6.1757
+    780.2510   1488.2799     34.9172      6.1695
+    781.2394   1488.2651     34.9169      6.1617
+    782.2277   1488.2619     34.9185      6.1562
+    783.2159   1488.2564     34.9183      6.1507
+    784.2042   1488.2521     34.9193      6.1451
+    785.1925   1488.2500     34.9184      6.1407
+    786.1808   1488.2463     34.9189      6.1354
+    787.1690   1488.2409     34.9151      6.1311
+    788.1573   1488.2187     34.9133      6.1219
+    789.1456   1488.1790     34.9118      6.1082
+    790.1338   1488.1544     34.9168      6.0962
+    791.1221   1488.1496     34.9194      6.0900
+    792.1103   1488.1518     34.9199      6.0862
+    793.0985   1488.1554     34.9197      6.0830
+    794.0868   1488.1444     34.9161      6.0772
+    795.0750   1488.1309     34.9181      6.0690
+    796.0632   1488.1360     34.9203      6.0654
+    797.0515   1488.1305     34.9133      6.0621
+    798.0397   1488.1046     34.9177      6.0500
+    799.0279   1488.1067     34.9207      6.0454
+    800.0161   1488.1180     34.9200      6.0443
+    801.0043   1488.1215     34.9197      6.0411
+    801.9925   1488.1041     34.9159      6.0338
+    802.9807   1488.0767     34.9169      6.0224
+    803.9689   1488.0713     34.9187      6.0163
+    804.9570   1488.0764     34.9200      6.0130
+    805.9453   1488.0821     34.9192      6.0105
+    806.9334   1488.0752     34.9168      6.0054
+    807.9216   1488.0512     34.9174      5.9950
+    808.9097   1488.0403     34.9199      5.9873
+    809.8979   1488.0466     34.9208      5.9844
+    810.8860   1488.0574     34.9207      5.9830
+    811.8742   1488.0628     34.9198      5.9805
+    812.8624   1488.0609     34.9191      5.9761
+    813.8505   1488.0650     34.9211      5.9723
+    814.8386   1488.0734     34.9210      5.9703
+    815.8268   1488.0757     34.9192      5.9673
+    816.8149   1488.0733     34.9193      5.9625
+    817.8030   1488.0757     34.9203      5.9586
+    818.7911   1488.0841     34.9215      5.9562
+    819.7792   1488.0949     34.9220      5.9546
+    820.7673   1488.1034     34.9203      5.9531
+    821.7554   1488.1042     34.9195      5.9494
+    822.7435   1488.1071     34.9204      5.9457
+    823.7316   1488.1117     34.9210      5.9425
+    824.7197   1488.1190     34.9213      5.9401
+    825.7078   1488.1262     34.9208      5.9379
+    826.6959   1488.1199     34.9159      5.9337
+    827.6840   1488.0998     34.9178      5.9239
+    828.6721   1488.0800     34.9118      5.9167
+    829.6601   1488.0562     34.9157      5.9053
+    830.6482   1488.0429     34.9180      5.8971
+    831.6362   1488.0465     34.9219      5.8926
+    832.6243   1488.0575     34.9222      5.8911
+    833.6123   1488.0603     34.9208      5.8881
+    834.6003   1488.0675     34.9220      5.8854
+    835.5884   1488.0763     34.9212      5.8837
+    836.5764   1488.0786     34.9206      5.8803
+    837.5645   1488.0749     34.9194      5.8756
+    838.5525   1488.0692     34.9204      5.8697
+    839.5405   1488.0692     34.9212      5.8653
+    840.5285   1488.0749     34.9215      5.8625
+    841.5165   1488.0809     34.9223      5.8596
+    842.5045   1488.0940     34.9230      5.8585
+    843.4926   1488.1068     34.9226      5.8577
+    844.4805   1488.1081     34.9200      5.8547
+    845.4685   1488.1017     34.9192      5.8492
+    846.4565   1488.0847     34.9173      5.8414
+    847.4445   1488.0569     34.9135      5.8315
+    848.4325   1488.0016     34.9141      5.8133
+    849.4204   1487.9801     34.9205      5.8017
+    850.4084   1487.9807     34.9221      5.7972
+    851.3964   1487.9876     34.9221      5.7948
+    852.3843   1487.9857     34.9205      5.7907
+    853.3723   1487.9861     34.9212      5.7864
+    854.3602   1487.9896     34.9204      5.7834
+    855.3481   1487.9490     34.9129      5.7715
+    856.3361   1487.8974     34.9183      5.7527
+    857.3240   1487.8823     34.9224      5.7435
+    858.3120   1487.8845     34.9212      5.7403
+    859.2999   1487.8880     34.9222      5.7367
+    860.2878   1487.8948     34.9224      5.7342
+    861.2758   1487.8954     34.9225      5.7302
+    862.2637   1487.8968     34.9225      5.7264
+    863.2515   1487.9048     34.9240      5.7238
+    864.2394   1487.9172     34.9242      5.7227
+    865.2274   1487.9311     34.9240      5.7221
+    866.2153   1487.9422     34.9231      5.7210
+    867.2031   1487.9501     34.9223      5.7191
+    868.1910   1487.9480     34.9202      5.7151
+    869.1789   1487.9363     34.9207      5.7079
+    870.1667   1487.9311     34.9231      5.7017
+    871.1547   1487.9378     34.9242      5.6989
+    872.1425   1487.9509     34.9246      5.6979
+    873.1304   1487.9605     34.9233      5.6966
+    874.1182   1487.9632     34.9215      5.6937
+    875.1061   1487.9525     34.9202      5.6873
+    876.0939   1487.9431     34.9231      5.6799
+    877.0817   1487.9346     34.9207      5.6744
+    878.0696   1487.9155     34.9185      5.6662
+    879.0574   1487.8964     34.9210      5.6565
+    880.0452   1487.8746     34.9177      5.6480
+    881.0331   1487.8356     34.9222      5.6327
+    882.0209   1487.8230     34.9248      5.6246
+    883.0087   1487.8277     34.9233      5.6221
+    883.9965   1487.8250     34.9224      5.6176
+    884.9843   1487.8219     34.9230      5.6125
+    885.9721   1487.8082     34.9182      5.6065
+    886.9599   1487.7824     34.9224      5.5946
+    887.9477   1487.7683     34.9251      5.5861
+    888.9355   1487.7740     34.9270      5.5828
+    889.9233   1487.7867     34.9265      5.5820
+    890.9110   1487.7947     34.9245      5.5805
+    891.8988   1487.7858     34.9244      5.5742
+    892.8865   1487.7923     34.9269      5.5709
+    893.8743   1487.8052     34.9268      5.5700
+    894.8621   1487.8169     34.9265      5.5689
+    895.8499   1487.8206     34.9253      5.5661
+    896.8376   1487.8229     34.9257      5.5624
+    897.8253   1487.8260     34.9263      5.5589
+    898.8130   1487.8241     34.9237      5.5551
+    899.8008   1487.8177     34.9240      5.5493
+    900.7885   1487.8115     34.9241      5.5436
+    901.7762   1487.8110     34.9262      5.5387
+    902.7640   1487.8161     34.9270      5.5356
+    903.7516   1487.8174     34.9266      5.5319
+    904.7394   1487.8035     34.9239      5.5252
+    905.7271   1487.7881     34.9231      5.5175
+    906.7148   1487.7748     34.9240      5.5098
+    907.7025   1487.7726     34.9257      5.5046
+    908.6902   1487.7736     34.9276      5.5001
+    909.6779   1487.7775     34.9266      5.4973
+    910.6655   1487.7711     34.9275      5.4913
+    911.6532   1487.7687     34.9271      5.4867
+    912.6409   1487.7676     34.9272      5.4823
+    913.6285   1487.7654     34.9260      5.4780
+    914.6162   1487.7601     34.9275      5.4721
+    915.6039   1487.7644     34.9277      5.4690
+    916.5916   1487.7639     34.9263      5.4652
+    917.5792   1487.7538     34.9269      5.4584
+    918.5668   1487.7508     34.9286      5.4530
+    919.5544   1487.7564     34.9297      5.4499
+    920.5421   1487.7647     34.9293      5.4480
+    921.5297   1487.7737     34.9294      5.4461
+    922.5173   1487.7635     34.9245      5.4410
+    923.5050   1487.7399     34.9265      5.4304
+    924.4926   1487.7274     34.9283      5.4226
+    925.4802   1487.7179     34.9272      5.4165
+    926.4678   1487.7143     34.9284      5.4111
+    927.4554   1487.7083     34.9279      5.4057
+    928.4430   1487.7044     34.9272      5.4008
+    929.4306   1487.6889     34.9271      5.3929
+    930.4182   1487.6813     34.9294      5.3862
+    931.4058   1487.6831     34.9310      5.3820
+    932.3934   1487.6845     34.9303      5.3785
+    933.3809   1487.6861     34.9315      5.3744
+    934.3685   1487.6984     34.9323      5.3731
+    935.3561   1487.7100     34.9322      5.3719
+    936.3436   1487.7221     34.9321      5.3708
+    937.3312   1487.7363     34.9325      5.3701
+    938.3187   1487.7491     34.9317      5.3694
+    939.3063   1487.7447     34.9299      5.3648
+    940.2938   1487.7493     34.9332      5.3608
+    941.2814   1487.7603     34.9320      5.3598
+    942.2689   1487.7666     34.9309      5.3576
+    943.2564   1487.7701     34.9324      5.3539
+    944.2439   1487.7820     34.9328      5.3526
+    945.2314   1487.7930     34.9326      5.3513
+    946.2189   1487.8048     34.9323      5.3502
+    947.2065   1487.8142     34.9321      5.3485
+    948.1940   1487.8187     34.9318      5.3456
+    949.1815   1487.8169     34.9326      5.3408
+    950.1689   1487.8218     34.9332      5.3377
+    951.1564   1487.8334     34.9329      5.3366
+    952.1439   1487.8444     34.9326      5.3353
+    953.1314   1487.8508     34.9319      5.3330
+    954.1189   1487.8574     34.9324      5.3304
+    955.1064   1487.8601     34.9322      5.3270
+    956.0938   1487.8541     34.9323      5.3214
+    957.0813   1487.8448     34.9294      5.3159
+    958.0687   1487.8307     34.9314      5.3077
+    959.0562   1487.8290     34.9338      5.3024
+    960.0436   1487.8389     34.9349      5.3004
+    961.0311   1487.8531     34.9343      5.3000
+    962.0186   1487.8602     34.9333      5.2980
+    963.0060   1487.8581     34.9326      5.2936
+    963.9934   1487.8518     34.9305      5.2886
+    964.9808   1487.8273     34.9304      5.2785
+    965.9683   1487.8146     34.9315      5.2709
+    966.9556   1487.7991     34.9336      5.2623
+    967.9431   1487.7994     34.9355      5.2577
+    968.9305   1487.8072     34.9359      5.2554
+    969.9178   1487.8155     34.9351      5.2536
+    970.9053   1487.8187     34.9345      5.2505
+    971.8926   1487.8225     34.9352      5.2471
+    972.8801   1487.8314     34.9368      5.2447
+    973.8674   1487.8400     34.9357      5.2431
+    974.8548   1487.8475     34.9356      5.2409
+    975.8422   1487.8564     34.9368      5.2386
+    976.8295   1487.8669     34.9365      5.2372
+    977.8169   1487.8747     34.9360      5.2352
+    978.8043   1487.8807     34.9357      5.2327
+    979.7916   1487.8887     34.9359      5.2305
+    980.7789   1487.8936     34.9353      5.2278
+    981.7663   1487.8855     34.9312      5.2230
+    982.7537   1487.8763     34.9355      5.2153
+    983.7410   1487.8782     34.9376      5.2110
+    984.7283   1487.8921     34.9380      5.2102
+    985.7156   1487.9031     34.9366      5.2093
+    986.7029   1487.9081     34.9357      5.2067
+    987.6902   1487.9069     34.9351      5.2025
+    988.6776   1487.9011     34.9357      5.1968
+    989.6649   1487.8903     34.9362      5.1899
+    990.6522   1487.8838     34.9372      5.1839
+    991.6395   1487.8890     34.9365      5.1813
+    992.6268   1487.8879     34.9363      5.1770
+    993.6141   1487.8878     34.9357      5.1731
+    994.6014   1487.8847     34.9368      5.1679
+    995.5886   1487.8861     34.9379      5.1638
+    996.5759   1487.8900     34.9385      5.1605
+    997.5632   1487.8886     34.9380      5.1562
+    998.5505   1487.8898     34.9386      5.1522
+    999.5377   1487.8902     34.9372      5.1487
+   1000.5250   1487.8890     34.9388      5.1438
+   1001.5122   1487.8977     34.9383      5.1420
+   1002.4995   1487.9016     34.9376      5.1391
+   1003.4867   1487.9044     34.9379      5.1356
+   1004.4739   1487.9083     34.9395      5.1320
+   1005.4612   1487.9126     34.9397      5.1289
+   1006.4484   1487.9214     34.9406      5.1267
+   1007.4356   1487.9357     34.9404      5.1262
+   1008.4229   1487.9498     34.9404      5.1256
+   1009.4100   1487.9541     34.9375      5.1235
+   1010.3973   1487.9357     34.9349      5.1157
+   1011.3845   1487.9288     34.9387      5.1087
+   1012.3716   1487.9327     34.9406      5.1050
+   1013.3589   1487.9343     34.9387      5.1019
+   1014.3461   1487.9307     34.9388      5.0969
+   1015.3333   1487.9232     34.9397      5.0907
+   1016.3204   1487.9157     34.9393      5.0849
+   1017.3076   1487.9024     34.9404      5.0772
+   1018.2948   1487.9096     34.9406      5.0748
+   1019.2819   1487.9167     34.9415      5.0722
+   1020.2691   1487.9285     34.9422      5.0708
+   1021.2563   1487.9369     34.9409      5.0692
+   1022.2434   1487.9378     34.9410      5.0653
+   1023.2305   1487.9356     34.9407      5.0608
+   1024.2177   1487.9355     34.9420      5.0563
+   1025.2048   1487.9415     34.9429      5.0534
+   1026.1920   1487.9547     34.9428      5.0526
+   1027.1791   1487.9667     34.9427      5.0515
+   1028.1663   1487.9748     34.9412      5.0499
+   1029.1533   1487.9654     34.9368      5.0449
+   1030.1405   1487.9387     34.9383      5.0338
+   1031.1276   1487.9163     34.9412      5.0233
+   1032.1147   1487.9128     34.9429      5.0178
+   1033.1018   1487.9146     34.9441      5.0138
+   1034.0889   1487.9274     34.9440      5.0129
+   1035.0759   1487.9366     34.9437      5.0112
+   1036.0631   1487.9449     34.9429      5.0094
+   1037.0502   1487.9516     34.9432      5.0069
+   1038.0372   1487.9554     34.9424      5.0040
+   1039.0243   1487.9441     34.9407      4.9977
+   1040.0114   1487.9235     34.9431      4.9878
+   1040.9984   1487.9198     34.9447      4.9823
+   1041.9855   1487.9225     34.9438      4.9792
+   1042.9725   1487.9367     34.9461      4.9779
+   1043.9596   1487.9503     34.9450      4.9775
+   1044.9467   1487.9616     34.9453      4.9761
+   1045.9337   1487.9698     34.9451      4.9741
+   1046.9208   1487.9721     34.9445      4.9708
+   1047.9077   1487.9789     34.9461      4.9679
+   1048.8948   1487.9907     34.9452      4.9670
+   1049.8818   1487.9872     34.9438      4.9625
+   1050.8688   1487.9761     34.9417      4.9564
+   1051.8558   1487.9579     34.9415      4.9479
+   1052.8429   1487.9477     34.9439      4.9406
+   1053.8298   1487.9458     34.9447      4.9358
+   1054.8169   1487.9498     34.9466      4.9321
+   1055.8038   1487.9582     34.9473      4.9299
+   1056.7908   1487.9675     34.9473      4.9281
+   1057.7778   1487.9785     34.9474      4.9267
+   1058.7648   1487.9854     34.9459      4.9248
+   1059.7518   1487.9884     34.9451      4.9217
+   1060.7388   1487.9855     34.9436      4.9174
+   1061.7257   1487.9744     34.9443      4.9104
+   1062.7126   1487.9689     34.9462      4.9044
+   1063.6996   1487.9708     34.9484      4.9001
+   1064.6865   1487.9783     34.9467      4.8984
+   1065.6736   1487.9672     34.9468      4.8916
+   1066.6605   1487.9750     34.9482      4.8890
+   1067.6475   1487.9852     34.9487      4.8873
+   1068.6344   1487.9951     34.9488      4.8856
+   1069.6212   1488.0075     34.9491      4.8845
+   1070.6082   1488.0188     34.9485      4.8834
+   1071.5951   1488.0303     34.9496      4.8818
+   1072.5820   1488.0403     34.9486      4.8805
+   1073.5690   1488.0444     34.9487      4.8774
+   1074.5559   1488.0439     34.9481      4.8734
+   1075.5427   1488.0514     34.9493      4.8708
+   1076.5297   1488.0508     34.9464      4.8675
+   1077.5166   1488.0449     34.9474      4.8617
+   1078.5034   1488.0426     34.9489      4.8566
+   1079.4904   1488.0519     34.9499      4.8545
+   1080.4772   1488.0570     34.9485      4.8521
+   1081.4641   1488.0508     34.9483      4.8466
+   1082.4509   1488.0501     34.9502      4.8418
+   1083.4377   1488.0585     34.9505      4.8397
+   1084.4247   1488.0689     34.9513      4.8379
+   1085.4115   1488.0831     34.9517      4.8372
+   1086.3983   1488.0998     34.9515      4.8373
+   1087.3853   1488.1167     34.9517      4.8373
+   1088.3721   1488.1258     34.9485      4.8365
+   1089.3589   1488.1267     34.9492      4.8324
+   1090.3457   1488.1151     34.9483      4.8258
+   1091.3325   1488.1040     34.9513      4.8181
+   1092.3193   1488.1145     34.9519      4.8164
+   1093.3062   1488.1237     34.9509      4.8149
+   1094.2930   1488.1223     34.9497      4.8109
+   1095.2798   1488.1233     34.9516      4.8065
+   1096.2666   1488.1286     34.9520      4.8036
+   1097.2534   1488.1308     34.9514      4.8003
+   1098.2402   1488.1339     34.9516      4.7969
+   1099.2269   1488.1258     34.9497      4.7915
+   1100.2137   1488.1136     34.9502      4.7843
+   1101.2006   1488.1136     34.9529      4.7794
+   1102.1874   1488.1126     34.9525      4.7752
+   1103.1741   1488.1231     34.9544      4.7731
+   1104.1609   1488.1372     34.9544      4.7725
+   1105.1476   1488.1527     34.9546      4.7722
+   1106.1344   1488.1679     34.9544      4.7719
+   1107.1211   1488.1830     34.9542      4.7716
+   1108.1079   1488.1868     34.9535      4.7687
+   1109.0946   1488.1962     34.9542      4.7667
+   1110.0814   1488.2039     34.9540      4.7646
+   1111.0681   1488.2107     34.9537      4.7623
+   1112.0548   1488.2167     34.9534      4.7598
+   1113.0415   1488.2207     34.9535      4.7567
+   1114.0283   1488.2250     34.9535      4.7537
+   1115.0150   1488.2220     34.9536      4.7489
+   1116.0017   1488.2271     34.9557      4.7454
+   1116.9884   1488.2342     34.9535      4.7438
+   1117.9751   1488.2312     34.9533      4.7391
+   1118.9618   1488.2364     34.9555      4.7356
+   1119.9485   1488.2464     34.9558      4.7339
+   1120.9352   1488.2445     34.9532      4.7302
+   1121.9219   1488.2379     34.9552      4.7239
+   1122.9086   1488.2427     34.9566      4.7206
+   1123.8953   1488.2534     34.9564      4.7192
+   1124.8818   1488.2576     34.9554      4.7165
+   1125.8685   1488.2515     34.9559      4.7108
+   1126.8552   1488.2535     34.9573      4.7068
+   1127.8419   1488.2676     34.9576      4.7061
+   1128.8285   1488.2762     34.9571      4.7043
+   1129.8152   1488.2724     34.9553      4.6999
+   1130.8018   1488.2367     34.9529      4.6879
+   1131.7885   1488.2013     34.9581      4.6736
+   1132.7750   1488.2029     34.9585      4.6698
+   1133.7617   1488.2079     34.9579      4.6672
+   1134.7483   1488.2104     34.9590      4.6634
+   1135.7350   1488.2242     34.9590      4.6627
+   1136.7216   1488.2400     34.9591      4.6625
+   1137.7081   1488.2530     34.9591      4.6616
+   1138.6947   1488.2652     34.9589      4.6606
+   1139.6814   1488.2757     34.9587      4.6592
+   1140.6680   1488.2821     34.9593      4.6565
+   1141.6545   1488.2927     34.9591      4.6551
+   1142.6411   1488.3012     34.9592      4.6531
+   1143.6277   1488.3024     34.9587      4.6495
+   1144.6143   1488.3013     34.9596      4.6449
+   1145.6008   1488.3126     34.9603      4.6434
+   1146.5874   1488.3206     34.9597      4.6415
+   1147.5740   1488.3228     34.9599      4.6379
+   1148.5605   1488.3334     34.9601      4.6364
+   1149.5471   1488.3419     34.9602      4.6344
+   1150.5336   1488.3533     34.9603      4.6331
+   1151.5201   1488.3611     34.9592      4.6313
+   1152.5067   1488.3551     34.9579      4.6262
+   1153.4933   1488.3506     34.9603      4.6203
+   1154.4797   1488.3544     34.9596      4.6174
+   1155.4663   1488.3540     34.9602      4.6131
+   1156.4528   1488.3556     34.9610      4.6092
+   1157.4393   1488.3645     34.9607      4.6074
+   1158.4259   1488.3626     34.9597      4.6032
+   1159.4124   1488.3646     34.9612      4.5992
+   1160.3988   1488.3744     34.9620      4.5973
+   1161.3854   1488.3859     34.9612      4.5963
+   1162.3718   1488.3915     34.9616      4.5935
+   1163.3583   1488.4022     34.9618      4.5920
+   1164.3448   1488.4096     34.9610      4.5900
+   1165.3313   1488.4088     34.9606      4.5859
+   1166.3177   1488.4032     34.9609      4.5804
+   1167.3042   1488.4013     34.9609      4.5759
+   1168.2906   1488.3990     34.9622      4.5709
+   1169.2771   1488.4089     34.9624      4.5692
+   1170.2635   1488.4166     34.9625      4.5670
+   1171.2500   1488.4289     34.9630      4.5658
+   1172.2365   1488.4401     34.9620      4.5648
+   1173.2229   1488.4390     34.9613      4.5607
+   1174.2094   1488.4394     34.9631      4.5562
+   1175.1958   1488.4518     34.9634      4.5551
+   1176.1823   1488.4669     34.9639      4.5546
+   1177.1687   1488.4815     34.9636      4.5542
+   1178.1550   1488.4971     34.9637      4.5539
+   1179.1415   1488.5112     34.9634      4.5534
+   1180.1279   1488.5226     34.9634      4.5521
+   1181.1143   1488.5335     34.9635      4.5507
+   1182.1007   1488.5462     34.9637      4.5497
+   1183.0870   1488.5593     34.9635      4.5489
+   1184.0735   1488.5702     34.9635      4.5475
+   1185.0598   1488.5793     34.9634      4.5457
+   1186.0463   1488.5850     34.9630      4.5432
+   1187.0326   1488.5739     34.9629      4.5365
+   1188.0190   1488.5773     34.9647      4.5327
+   1189.0054   1488.5934     34.9640      4.5328
+   1189.9917   1488.5950     34.9632      4.5294
+   1190.9780   1488.5984     34.9648      4.5257
+   1191.9645   1488.6072     34.9648      4.5238
+   1192.9508   1488.6182     34.9649      4.5224
+   1193.9371   1488.6293     34.9651      4.5210
+   1194.9235   1488.6441     34.9650      4.5206
+   1195.9098   1488.6565     34.9646      4.5197
+   1196.8961   1488.6658     34.9650      4.5178
+   1197.8824   1488.6788     34.9657      4.5167
+   1198.8688   1488.6945     34.9657      4.5165
+   1199.8551   1488.7094     34.9653      4.5162
+   1200.8414   1488.7255     34.9658      4.5159
+   1201.8278   1488.7392     34.9649      4.5155
+   1202.8140   1488.7440     34.9643      4.5128
+   1203.8003   1488.7477     34.9655      4.5093
+   1204.7866   1488.7601     34.9660      4.5081
+   1205.7728   1488.7744     34.9656      4.5077
+   1206.7592   1488.7853     34.9656      4.5063
+   1207.7455   1488.7918     34.9648      4.5041
+   1208.7317   1488.7979     34.9652      4.5014
+   1209.7180   1488.8067     34.9662      4.4992
+   1210.7042   1488.8233     34.9665      4.4991
+   1211.6906   1488.8404     34.9666      4.4992
+   1212.6768   1488.8548     34.9661      4.4988
+   1213.6630   1488.8655     34.9654      4.4976
+   1214.6493   1488.8766     34.9658      4.4961
+   1215.6355   1488.8861     34.9654      4.4945
+   1216.6217   1488.8953     34.9667      4.4923
+   1217.6080   1488.9106     34.9667      4.4920
+   1218.5942   1488.9239     34.9653      4.4916
+   1219.5804   1488.9273     34.9653      4.4884
+   1220.5667   1488.9358     34.9664      4.4861
+   1221.5529   1488.9500     34.9670      4.4853
+   1222.5391   1488.9656     34.9669      4.4851
+   1223.5253   1488.9789     34.9669      4.4843
+   1224.5115   1488.9942     34.9668      4.4840
+   1225.4977   1489.0106     34.9670      4.4839
+   1226.4839   1489.0258     34.9668      4.4836
+   1227.4701   1489.0408     34.9669      4.4832
+   1228.4562   1489.0525     34.9665      4.4821
+   1229.4424   1489.0642     34.9669      4.4808
+   1230.4286   1489.0772     34.9664      4.4801
+   1231.4147   1489.0897     34.9670      4.4789
+   1232.4009   1489.0985     34.9654      4.4775
+   1233.3871   1489.1021     34.9674      4.4737
+   1234.3732   1489.1142     34.9668      4.4728
+   1235.3594   1489.1248     34.9666      4.4714
+   1236.3455   1489.1354     34.9667      4.4699
+   1237.3317   1489.1482     34.9673      4.4688
+   1238.3177   1489.1598     34.9675      4.4675
+   1239.3040   1489.1709     34.9671      4.4663
+   1240.2900   1489.1781     34.9668      4.4641
+   1241.2761   1489.1844     34.9672      4.4615
+   1242.2622   1489.1953     34.9675      4.4600
+   1243.2484   1489.2070     34.9679      4.4587
+   1244.2345   1489.2215     34.9681      4.4581
+   1245.2206   1489.2315     34.9671      4.4568
+   1246.2067   1489.2390     34.9674      4.4545
+   1247.1927   1489.2456     34.9676      4.4520
+   1248.1788   1489.2549     34.9680      4.4501
+   1249.1649   1489.2655     34.9682      4.4486
+   1250.1510   1489.2755     34.9678      4.4471
+   1251.1371   1489.2837     34.9680      4.4450
+   1252.1232   1489.2941     34.9683      4.4434
+   1253.1093   1489.3047     34.9684      4.4419
+   1254.0953   1489.3186     34.9692      4.4410
+   1255.0813   1489.3343     34.9691      4.4408
+   1256.0674   1489.3432     34.9676      4.4394
+   1257.0535   1489.3437     34.9669      4.4357
+   1258.0394   1489.3462     34.9681      4.4319
+   1259.0255   1489.3548     34.9692      4.4296
+   1260.0116   1489.3690     34.9696      4.4289
+   1260.9976   1489.3840     34.9696      4.4285
+   1261.9836   1489.4001     34.9698      4.4283
+   1262.9696   1489.4163     34.9698      4.4282
+   1263.9557   1489.4335     34.9699      4.4283
+   1264.9417   1489.4491     34.9694      4.4282
+   1265.9276   1489.4656     34.9694      4.4282
+   1266.9137   1489.4782     34.9685      4.4275
+   1267.8997   1489.4830     34.9686      4.4246
+   1268.8856   1489.4888     34.9695      4.4217
+   1269.8716   1489.5007     34.9693      4.4206
+   1270.8577   1489.5109     34.9692      4.4191
+   1271.8436   1489.5217     34.9697      4.4175
+   1272.8296   1489.5360     34.9702      4.4168
+   1273.8156   1489.5506     34.9698      4.4164
+   1274.8015   1489.5601     34.9692      4.4149
+   1275.7875   1489.5660     34.9695      4.4122
+   1276.7734   1489.5734     34.9700      4.4098
+   1277.7594   1489.5865     34.9704      4.4088
+   1278.7452   1489.6010     34.9704      4.4083
+   1279.7312   1489.6115     34.9698      4.4070
+   1280.7172   1489.6212     34.9705      4.4051
+   1281.7031   1489.6357     34.9711      4.4044
+   1282.6891   1489.6534     34.9709      4.4047
+   1283.6749   1489.6707     34.9712      4.4048
+   1284.6609   1489.6875     34.9710      4.4049
+   1285.6467   1489.7033     34.9709      4.4047
+   1286.6327   1489.7198     34.9709      4.4047
+   1287.6185   1489.7335     34.9705      4.4041
+   1288.6045   1489.7464     34.9705      4.4032
+   1289.5903   1489.7607     34.9710      4.4025
+   1290.5763   1489.7746     34.9704      4.4020
+   1291.5621   1489.7834     34.9701      4.4002
+   1292.5480   1489.7948     34.9705      4.3988
+   1293.5339   1489.8079     34.9710      4.3978
+   1294.5198   1489.8200     34.9707      4.3968
+   1295.5056   1489.8329     34.9710      4.3958
+   1296.4915   1489.8471     34.9713      4.3951
+   1297.4774   1489.8595     34.9706      4.3943
+   1298.4633   1489.8728     34.9713      4.3933
+   1299.4491   1489.8880     34.9714      4.3929
+   1300.4349   1489.9042     34.9717      4.3927
+   1301.4208   1489.9208     34.9720      4.3926
+   1302.4066   1489.9370     34.9713      4.3927
+   1303.3925   1489.9519     34.9713      4.3923
+   1304.3782   1489.9660     34.9718      4.3915
+   1305.3640   1489.9812     34.9713      4.3913
+   1306.3499   1489.9967     34.9714      4.3910
+   1307.3357   1490.0124     34.9717      4.3907
+   1308.3215   1490.0279     34.9714      4.3905
+   1309.3073   1490.0417     34.9712      4.3899
+   1310.2931   1490.0552     34.9713      4.3891
+   1311.2789   1490.0659     34.9711      4.3877
+   1312.2646   1490.0745     34.9713      4.3857
+   1313.2505   1490.0893     34.9715      4.3852
+   1314.2362   1490.1019     34.9713      4.3843
+   1315.2220   1490.1114     34.9708      4.3827
+   1316.2078   1490.1215     34.9719      4.3808
+   1317.1935   1490.1367     34.9721      4.3804
+   1318.1793   1490.1519     34.9719      4.3801
+   1319.1650   1490.1629     34.9717      4.3788
+   1320.1508   1490.1764     34.9721      4.3779
+   1321.1365   1490.1919     34.9722      4.3776
+   1322.1223   1490.2082     34.9722      4.3775
+   1323.1080   1490.2218     34.9718      4.3769
+   1324.0938   1490.2343     34.9718      4.3759
+   1325.0795   1490.2446     34.9726      4.3741
+   1326.0652   1490.2602     34.9722      4.3740
+   1327.0509   1490.2753     34.9723      4.3736
+   1328.0366   1490.2901     34.9721      4.3732
+   1329.0223   1490.3034     34.9724      4.3723
+   1330.0081   1490.3177     34.9724      4.3717
+   1330.9938   1490.3332     34.9726      4.3714
+   1331.9795   1490.3488     34.9724      4.3712
+   1332.9651   1490.3641     34.9723      4.3709
+   1333.9508   1490.3791     34.9726      4.3704
+   1334.9365   1490.3936     34.9725      4.3699
+   1335.9221   1490.4091     34.9727      4.3696
+   1336.9078   1490.4246     34.9727      4.3693
+   1337.8936   1490.4403     34.9726      4.3691
+   1338.8792   1490.4561     34.9726      4.3689
+   1339.8649   1490.4715     34.9726      4.3686
+   1340.8505   1490.4860     34.9725      4.3681
+   1341.8362   1490.5009     34.9725      4.3677
+   1342.8218   1490.5143     34.9725      4.3669
+   1343.8074   1490.5294     34.9729      4.3664
+   1344.7931   1490.5452     34.9732      4.3661
+   1345.7787   1490.5614     34.9732      4.3660
+   1346.7643   1490.5769     34.9729      4.3658
+   1347.7499   1490.5935     34.9732      4.3657
+   1348.7356   1490.6102     34.9729      4.3658
+   1349.7212   1490.6256     34.9729      4.3655
+   1350.7068   1490.6402     34.9726      4.3651
+   1351.6924   1490.6544     34.9727      4.3645
+   1352.6780   1490.6670     34.9727      4.3635
+   1353.6636   1490.6781     34.9729      4.3621
+   1354.6492   1490.6927     34.9726      4.3617
+   1355.6348   1490.7042     34.9728      4.3604
+   1356.6202   1490.7164     34.9729      4.3593
+   1357.6058   1490.7311     34.9729      4.3588
+   1358.5914   1490.7404     34.9727      4.3571
+   1359.5770   1490.7530     34.9734      4.3559
+   1360.5626   1490.7696     34.9736      4.3558
+   1361.5481   1490.7865     34.9735      4.3559
+   1362.5337   1490.8026     34.9734      4.3558
+   1363.5192   1490.8198     34.9735      4.3559
+   1364.5048   1490.8359     34.9734      4.3558
+   1365.4904   1490.8508     34.9734      4.3554
+   1366.4758   1490.8668     34.9735      4.3552
+   1367.4614   1490.8826     34.9735      4.3550
+   1368.4469   1490.8992     34.9734      4.3550
+   1369.4324   1490.9146     34.9737      4.3546
+   1370.4180   1490.9310     34.9735      4.3546
+   1371.4034   1490.9458     34.9730      4.3543
+   1372.3889   1490.9582     34.9730      4.3533
+   1373.3744   1490.9721     34.9737      4.3524
+   1374.3600   1490.9868     34.9735      4.3520
+   1375.3455   1491.0011     34.9736      4.3514
+   1376.3309   1491.0163     34.9734      4.3511
+   1377.3164   1491.0310     34.9732      4.3507
+   1378.3019   1491.0461     34.9739      4.3501
+   1379.2874   1491.0632     34.9736      4.3503
+   1380.2728   1491.0800     34.9737      4.3503
+   1381.2583   1491.0953     34.9736      4.3500
+   1382.2438   1491.1109     34.9737      4.3497
+   1383.2292   1491.1257     34.9736      4.3493
+   1384.2146   1491.1402     34.9738      4.3487
+   1385.2001   1491.1540     34.9736      4.3481
+   1386.1855   1491.1686     34.9735      4.3476
+   1387.1710   1491.1836     34.9735      4.3472
+   1388.1564   1491.1971     34.9737      4.3464
+   1389.1418   1491.2084     34.9737      4.3451
+   1390.1272   1491.2232     34.9739      4.3446
+   1391.1127   1491.2374     34.9738      4.3440
+   1392.0980   1491.2533     34.9739      4.3438
+   1393.0835   1491.2695     34.9739      4.3437
+   1394.0688   1491.2841     34.9736      4.3433
+   1395.0543   1491.2976     34.9740      4.3424
+   1396.0397   1491.3131     34.9738      4.3422
+   1397.0250   1491.3258     34.9736      4.3413
+   1398.0105   1491.3378     34.9742      4.3400
+   1398.9958   1491.3546     34.9742      4.3400
+   1399.9812   1491.3688     34.9739      4.3395
+   1400.9666   1491.3829     34.9742      4.3388
+   1401.9519   1491.3979     34.9742      4.3384
+   1402.9374   1491.4116     34.9741      4.3377
+   1403.9227   1491.4253     34.9741      4.3370
+   1404.9081   1491.4412     34.9745      4.3367
+   1405.8934   1491.4577     34.9743      4.3367
+   1406.8788   1491.4731     34.9740      4.3365
+   1407.8640   1491.4878     34.9744      4.3359
+   1408.8494   1491.5022     34.9746      4.3353
+   1409.8347   1491.5185     34.9746      4.3352
+   1410.8201   1491.5332     34.9744      4.3348
+   1411.8054   1491.5479     34.9748      4.3342
+   1412.7906   1491.5621     34.9748      4.3336
+   1413.7760   1491.5756     34.9746      4.3329
+   1414.7614   1491.5892     34.9745      4.3322
+   1415.7466   1491.6028     34.9747      4.3314
+   1416.7319   1491.6167     34.9744      4.3308
+   1417.7172   1491.6282     34.9746      4.3295
+   1418.7025   1491.6419     34.9748      4.3287
+   1419.6877   1491.6561     34.9749      4.3281
+   1420.6731   1491.6694     34.9745      4.3274
+   1421.6583   1491.6843     34.9751      4.3268
+   1422.6436   1491.7007     34.9752      4.3267
+   1423.6289   1491.7162     34.9749      4.3265
+   1424.6141   1491.7285     34.9748      4.3255
+   1425.5994   1491.7418     34.9744      4.3248
+   1426.5846   1491.7558     34.9749      4.3240
+   1427.5698   1491.7703     34.9748      4.3235
+   1428.5552   1491.7865     34.9754      4.3232
+   1429.5404   1491.8030     34.9752      4.3232
+   1430.5256   1491.8200     34.9755      4.3232
+   1431.5109   1491.8363     34.9749      4.3233
+   1432.4961   1491.8533     34.9752      4.3233
+   1433.4813   1491.8697     34.9753      4.3232
+   1434.4664   1491.8861     34.9751      4.3232
+   1435.4517   1491.9027     34.9750      4.3232
+   1436.4369   1491.9154     34.9748      4.3223
+   1437.4221   1491.9311     34.9754      4.3219
+   1438.4073   1491.9475     34.9755      4.3218
+   1439.3925   1491.9649     34.9754      4.3220
+   1440.3777   1491.9821     34.9755      4.3221
+   1441.3629   1491.9977     34.9750      4.3220
+   1442.3480   1492.0133     34.9755      4.3216
+   1443.3333   1492.0282     34.9750      4.3213
+   1444.3184   1492.0421     34.9754      4.3205
+   1445.3036   1492.0577     34.9753      4.3203
+   1446.2887   1492.0725     34.9754      4.3198
+   1447.2738   1492.0891     34.9754      4.3198
+   1448.2590   1492.1036     34.9753      4.3193
+   1449.2441   1492.1187     34.9753      4.3189
+   1450.2292   1492.1349     34.9753      4.3188
+   1451.2145   1492.1492     34.9754      4.3182
+   1452.1996   1492.1637     34.9759      4.3175
+   1453.1847   1492.1815     34.9755      4.3179
+   1454.1698   1492.1986     34.9759      4.3179
+   1455.1549   1492.2149     34.9756      4.3179
+   1456.1400   1492.2312     34.9756      4.3178
+   1457.1251   1492.2474     34.9756      4.3177
+   1458.1102   1492.2639     34.9754      4.3177
+   1459.0953   1492.2791     34.9753      4.3174
+   1460.0804   1492.2935     34.9754      4.3168
+   1461.0656   1492.3094     34.9758      4.3165
+   1462.0507   1492.3233     34.9752      4.3160
+   1463.0358   1492.3369     34.9754      4.3152
+   1464.0208   1492.3533     34.9756      4.3151
+   1465.0059   1492.3679     34.9755      4.3146
+   1465.9910   1492.3806     34.9754      4.3137
+   1466.9760   1492.3953     34.9761      4.3130
+   1467.9611   1492.4114     34.9756      4.3130
+   1468.9460   1492.4255     34.9755      4.3124
+   1469.9312   1492.4401     34.9759      4.3118
+   1470.9161   1492.4532     34.9757      4.3110
+   1471.9012   1492.4674     34.9760      4.3103
+   1472.8862   1492.4828     34.9759      4.3100
+   1473.8713   1492.4986     34.9760      4.3098
+   1474.8563   1492.5146     34.9760      4.3096
+   1475.8413   1492.5307     34.9759      4.3095
+   1476.8264   1492.5475     34.9760      4.3095
+   1477.8114   1492.5637     34.9760      4.3094
+   1478.7964   1492.5799     34.9759      4.3093
+   1479.7814   1492.5957     34.9759      4.3091
+   1480.7664   1492.6118     34.9761      4.3089
+   1481.7513   1492.6279     34.9759      4.3088
+   1482.7363   1492.6440     34.9758      4.3087
+   1483.7213   1492.6607     34.9762      4.3086
+   1484.7063   1492.6747     34.9757      4.3081
+   1485.6913   1492.6862     34.9758      4.3068
+   1486.6763   1492.6976     34.9759      4.3055
+   1487.6613   1492.7125     34.9761      4.3050
+   1488.6462   1492.7279     34.9761      4.3047
+   1489.6312   1492.7442     34.9764      4.3045
+   1490.6161   1492.7608     34.9764      4.3045
+   1491.6011   1492.7778     34.9763      4.3046
+   1492.5861   1492.7945     34.9763      4.3046
+   1493.5709   1492.8113     34.9764      4.3046
+   1494.5559   1492.8288     34.9764      4.3048
+   1495.5408   1492.8459     34.9764      4.3049
+   1496.5258   1492.8633     34.9764      4.3051
+   1497.5106   1492.8806     34.9765      4.3052
+   1498.4956   1492.8977     34.9762      4.3054
+   1499.4805   1492.9131     34.9762      4.3051
+   1500.4655   1492.9282     34.9759      4.3048
+   1501.4503   1492.9358     34.9756      4.3027
+   1502.4352   1492.9466     34.9764      4.3010
+   1503.4200   1492.9629     34.9765      4.3009
+   1504.4050   1492.9782     34.9764      4.3006
+   1505.3899   1492.9943     34.9766      4.3004
+   1506.3748   1493.0105     34.9765      4.3003
+   1507.3596   1493.0263     34.9765      4.3001
+   1508.3445   1493.0420     34.9767      4.2998
+   1509.3293   1493.0581     34.9765      4.2997
+   1510.3142   1493.0739     34.9765      4.2995
+   1511.2991   1493.0900     34.9764      4.2994
+   1512.2839   1493.1045     34.9763      4.2989
+   1513.2688   1493.1189     34.9767      4.2982
+   1514.2537   1493.1343     34.9767      4.2979
+   1515.2384   1493.1470     34.9765      4.2970
+   1516.2233   1493.1617     34.9766      4.2965
+   1517.2081   1493.1783     34.9768      4.2964
+   1518.1929   1493.1942     34.9769      4.2962
+   1519.1777   1493.2062     34.9761      4.2953
+   1520.1626   1493.2184     34.9769      4.2940
+   1521.1473   1493.2355     34.9771      4.2940
+   1522.1322   1493.2534     34.9771      4.2943
+   1523.1169   1493.2703     34.9770      4.2944
+   1524.1018   1493.2864     34.9769      4.2943
+   1525.0865   1493.3007     34.9766      4.2938
+   1526.0714   1493.3172     34.9771      4.2936
+   1527.0562   1493.3334     34.9771      4.2935
+   1528.0409   1493.3494     34.9768      4.2934
+   1529.0256   1493.3664     34.9771      4.2934
+   1530.0105   1493.3830     34.9770      4.2934
+   1530.9952   1493.3995     34.9771      4.2933
+   1531.9800   1493.4159     34.9770      4.2933
+   1532.9647   1493.4333     34.9771      4.2934
+   1533.9495   1493.4493     34.9770      4.2933
+   1534.9342   1493.4653     34.9771      4.2931
+   1535.9189   1493.4820     34.9771      4.2931
+   1536.9037   1493.4984     34.9772      4.2930
+   1537.8884   1493.5147     34.9769      4.2930
+   1538.8732   1493.5317     34.9771      4.2930
+   1539.8579   1493.5481     34.9769      4.2930
+   1540.8427   1493.5639     34.9772      4.2927
+   1541.8273   1493.5798     34.9769      4.2926
+   1542.8120   1493.5956     34.9772      4.2923
+   1543.7968   1493.6121     34.9773      4.2922
+   1544.7814   1493.6286     34.9775      4.2921
+   1545.7661   1493.6452     34.9771      4.2922
+   1546.7509   1493.6618     34.9770      4.2922
+   1547.7355   1493.6775     34.9769      4.2920
+   1548.7202   1493.6916     34.9768      4.2914
+   1549.7048   1493.7073     34.9773      4.2910
+   1550.6896   1493.7239     34.9770      4.2911
+   1551.6742   1493.7405     34.9772      4.2910
+   1552.6588   1493.7572     34.9772      4.2910
+   1553.6436   1493.7744     34.9773      4.2911
+   1554.6282   1493.7915     34.9769      4.2913
+   1555.6128   1493.8086     34.9772      4.2913
+   1556.5974   1493.8253     34.9769      4.2914
+   1557.5822   1493.8421     34.9774      4.2913
+   1558.5668   1493.8586     34.9772      4.2913
+   1559.5514   1493.8744     34.9774      4.2910
+   1560.5360   1493.8916     34.9772      4.2912
+   1561.5206   1493.9077     34.9771      4.2911
+   1562.5052   1493.9231     34.9770      4.2908
+   1563.4899   1493.9380     34.9772      4.2903
+   1564.4745   1493.9547     34.9772      4.2903
+   1565.4591   1493.9714     34.9772      4.2903
+   1566.4437   1493.9877     34.9770      4.2903
+   1567.4282   1494.0027     34.9773      4.2898
+   1568.4128   1494.0196     34.9774      4.2898
+   1569.3975   1494.0359     34.9771      4.2898
+   1570.3820   1494.0523     34.9772      4.2897
+   1571.3666   1494.0691     34.9773      4.2897
+   1572.3512   1494.0859     34.9773      4.2897
+   1573.3357   1494.1018     34.9773      4.2895
+   1574.3203   1494.1188     34.9772      4.2896
+   1575.3048   1494.1351     34.9773      4.2895
+   1576.2894   1494.1514     34.9773      4.2894
+   1577.2739   1494.1678     34.9774      4.2893
+   1578.2585   1494.1839     34.9769      4.2893
+   1579.2430   1494.1984     34.9768      4.2888
+   1580.2275   1494.2133     34.9773      4.2882
+   1581.2122   1494.2289     34.9774      4.2879
+   1582.1967   1494.2452     34.9775      4.2878
+   1583.1812   1494.2607     34.9772      4.2876
+   1584.1656   1494.2753     34.9768      4.2872
+   1585.1501   1494.2912     34.9775      4.2868
+   1586.1346   1494.3071     34.9775      4.2866
+   1587.1191   1494.3229     34.9775      4.2864
+   1588.1036   1494.3395     34.9777      4.2863
+   1589.0881   1494.3550     34.9774      4.2861
+   1590.0726   1494.3704     34.9774      4.2858
+   1591.0571   1494.3869     34.9775      4.2857
+   1592.0416   1494.4039     34.9778      4.2857
+   1593.0261   1494.4201     34.9774      4.2857
+   1594.0106   1494.4370     34.9775      4.2857
+   1594.9950   1494.4541     34.9776      4.2858
+   1595.9795   1494.4699     34.9778      4.2855
+   1596.9640   1494.4857     34.9774      4.2854
+   1597.9484   1494.5006     34.9776      4.2849
+   1598.9329   1494.5171     34.9775      4.2849
+   1599.9174   1494.5339     34.9775      4.2849
+   1600.9017   1494.5500     34.9777      4.2847
+   1601.8862   1494.5641     34.9773      4.2842
+   1602.8706   1494.5798     34.9778      4.2838
+   1603.8550   1494.5960     34.9777      4.2837
+   1604.8395   1494.6119     34.9778      4.2835
+   1605.8239   1494.6285     34.9780      4.2834
+   1606.8082   1494.6451     34.9776      4.2835
+   1607.7927   1494.6622     34.9779      4.2835
+   1608.7771   1494.6781     34.9779      4.2833
+   1609.7615   1494.6936     34.9776      4.2831
+   1610.7458   1494.7091     34.9777      4.2828
+   1611.7302   1494.7258     34.9776      4.2828
+   1612.7146   1494.7414     34.9778      4.2825
+   1613.6990   1494.7577     34.9774      4.2825
+   1614.6833   1494.7733     34.9776      4.2822
+   1615.6677   1494.7876     34.9776      4.2816
+   1616.6521   1494.8039     34.9779      4.2814
+   1617.6365   1494.8200     34.9777      4.2813
+   1618.6208   1494.8351     34.9775      4.2810
+   1619.6052   1494.8502     34.9782      4.2804
+   1620.5896   1494.8656     34.9778      4.2802
+   1621.5739   1494.8818     34.9780      4.2800
+   1622.5582   1494.8970     34.9778      4.2797
+   1623.5426   1494.9131     34.9780      4.2795
+   1624.5269   1494.9294     34.9780      4.2794
+   1625.5112   1494.9446     34.9778      4.2791
+   1626.4955   1494.9595     34.9781      4.2786
+   1627.4799   1494.9759     34.9781      4.2785
+   1628.4641   1494.9925     34.9780      4.2785
+   1629.4485   1495.0087     34.9780      4.2784
+   1630.4327   1495.0255     34.9784      4.2783
+   1631.4171   1495.0417     34.9780      4.2783
+   1632.4014   1495.0577     34.9784      4.2780
+   1633.3856   1495.0738     34.9782      4.2779
+   1634.3699   1495.0903     34.9780      4.2779
+   1635.3542   1495.1072     34.9782      4.2779
+   1636.3385   1495.1234     34.9781      4.2778
+   1637.3228   1495.1389     34.9779      4.2776
+   1638.3070   1495.1554     34.9780      4.2775
+   1639.2913   1495.1716     34.9782      4.2773
+   1640.2755   1495.1880     34.9783      4.2772
+   1641.2598   1495.2049     34.9781      4.2773
+   1642.2440   1495.2212     34.9781      4.2772
+   1643.2283   1495.2381     34.9783      4.2772
+   1644.2125   1495.2543     34.9782      4.2771
+   1645.1968   1495.2713     34.9784      4.2771
+   1646.1809   1495.2879     34.9783      4.2771
+   1647.1652   1495.3044     34.9782      4.2771
+   1648.1494   1495.3209     34.9780      4.2771
+   1649.1337   1495.3365     34.9781      4.2768
+   1650.1178   1495.3524     34.9781      4.2766
+   1651.1021   1495.3680     34.9779      4.2764
+   1652.0862   1495.3841     34.9781      4.2762
+   1653.0704   1495.4003     34.9783      4.2760
+   1654.0546   1495.4171     34.9784      4.2760
+   1655.0388   1495.4340     34.9782      4.2761
+   1656.0229   1495.4506     34.9781      4.2761
+   1657.0072   1495.4681     34.9787      4.2761
+   1657.9913   1495.4838     34.9782      4.2760
+   1658.9755   1495.4990     34.9781      4.2757
+   1659.9597   1495.5151     34.9782      4.2755
+   1660.9438   1495.5318     34.9782      4.2755
+   1661.9280   1495.5486     34.9782      4.2755
+   1662.9121   1495.5647     34.9784      4.2753
+   1663.8962   1495.5810     34.9784      4.2752
+   1664.8804   1495.5977     34.9784      4.2752
+   1665.8645   1495.6139     34.9783      4.2751
+   1666.8486   1495.6302     34.9783      4.2750
+   1667.8328   1495.6469     34.9783      4.2750
+   1668.8169   1495.6640     34.9786      4.2750
+   1669.8010   1495.6805     34.9784      4.2750
+   1670.7852   1495.6969     34.9785      4.2749
+   1671.7693   1495.7136     34.9782      4.2750
+   1672.7534   1495.7303     34.9785      4.2749
+   1673.7374   1495.7470     34.9782      4.2750
+   1674.7216   1495.7635     34.9783      4.2749
+   1675.7057   1495.7801     34.9785      4.2748
+   1676.6897   1495.7968     34.9782      4.2749
+   1677.6738   1495.8132     34.9783      4.2748
+   1678.6580   1495.8297     34.9784      4.2747
+   1679.6420   1495.8466     34.9785      4.2747
+   1680.6261   1495.8632     34.9785      4.2747
+   1681.6101   1495.8802     34.9783      4.2748
+   1682.5941   1495.8971     34.9785      4.2748
+   1683.5782   1495.9142     34.9785      4.2749
+   1684.5623   1495.9309     34.9784      4.2749
+   1685.5463   1495.9469     34.9783      4.2748
+   1686.5304   1495.9648     34.9788      4.2749
+   1687.5144   1495.9813     34.9787      4.2749
+   1688.4984   1495.9986     34.9784      4.2751
+   1689.4824   1496.0150     34.9785      4.2750
+   1690.4664   1496.0318     34.9783      4.2751
+   1691.4504   1496.0494     34.9786      4.2752
+   1692.4344   1496.0658     34.9784      4.2752
+   1693.4185   1496.0828     34.9786      4.2752
+   1694.4025   1496.0995     34.9783      4.2753
+   1695.3865   1496.1170     34.9785      4.2754
+   1696.3705   1496.1334     34.9786      4.2753
+   1697.3545   1496.1503     34.9784      4.2754
+   1698.3385   1496.1664     34.9785      4.2752
+   1699.3225   1496.1827     34.9785      4.2751
+   1700.3064   1496.1988     34.9784      4.2750
+   1701.2904   1496.2156     34.9785      4.2750
+   1702.2744   1496.2324     34.9785      4.2750
+   1703.2583   1496.2497     34.9787      4.2751
+   1704.2423   1496.2669     34.9787      4.2752
+   1705.2262   1496.2840     34.9787      4.2753
+   1706.2102   1496.2999     34.9783      4.2752
+   1707.1941   1496.3173     34.9789      4.2752
+   1708.1781   1496.3351     34.9791      4.2754
+   1709.1620   1496.3498     34.9784      4.2751
+   1710.1460   1496.3664     34.9786      4.2750
+   1711.1299   1496.3832     34.9787      4.2750
+   1712.1138   1496.4005     34.9788      4.2751
+   1713.0977   1496.4176     34.9788      4.2752
+   1714.0817   1496.4344     34.9786      4.2753
+   1715.0656   1496.4513     34.9787      4.2753
+   1716.0494   1496.4689     34.9787      4.2755
+   1717.0333   1496.4840     34.9785      4.2752
+   1718.0172   1496.5010     34.9786      4.2752
+   1719.0011   1496.5172     34.9785      4.2751
+   1719.9850   1496.5344     34.9786      4.2752
+   1720.9689   1496.5510     34.9785      4.2752
+   1721.9528   1496.5684     34.9787      4.2753
+   1722.9366   1496.5856     34.9787      4.2754
+   1723.9205   1496.6023     34.9787      4.2754
+   1724.9043   1496.6195     34.9788      4.2755
+   1725.8882   1496.6370     34.9787      4.2757
+   1726.8721   1496.6540     34.9789      4.2757
+   1727.8560   1496.6708     34.9787      4.2758
+   1728.8397   1496.6877     34.9785      4.2759
+   1729.8236   1496.7043     34.9787      4.2758
+   1730.8074   1496.7201     34.9786      4.2756
+   1731.7913   1496.7361     34.9787      4.2754
+   1732.7750   1496.7516     34.9784      4.2752
+   1733.7589   1496.7681     34.9785      4.2751
+   1734.7427   1496.7846     34.9787      4.2750
+   1735.7266   1496.8000     34.9786      4.2747
+   1736.7103   1496.8152     34.9787      4.2743
+   1737.6941   1496.8321     34.9788      4.2743
+   1738.6780   1496.8483     34.9784      4.2743
+   1739.6617   1496.8654     34.9790      4.2742
+   1740.6455   1496.8812     34.9783      4.2742
+   1741.6293   1496.8966     34.9786      4.2738
+   1742.6130   1496.9127     34.9787      4.2736
+   1743.5968   1496.9285     34.9789      4.2733
+   1744.5807   1496.9452     34.9789      4.2733
+   1745.5645   1496.9620     34.9786      4.2734
+   1746.5482   1496.9792     34.9790      4.2734
+   1747.5319   1496.9959     34.9790      4.2734
+   1748.5156   1497.0122     34.9786      4.2734
+   1749.4994   1497.0284     34.9789      4.2732
+   1750.4832   1497.0457     34.9787      4.2734
+   1751.4669   1497.0628     34.9789      4.2734
+   1752.4507   1497.0797     34.9788      4.2735
+   1753.4343   1497.0964     34.9787      4.2735
+   1754.4181   1497.1140     34.9788      4.2737
+   1755.4019   1497.1314     34.9789      4.2738
+   1756.3855   1497.1476     34.9789      4.2737
+   1757.3693   1497.1639     34.9788      4.2736
+   1758.3529   1497.1802     34.9788      4.2735
+   1759.3367   1497.1969     34.9788      4.2735
+   1760.3203   1497.2128     34.9788      4.2733
+   1761.3041   1497.2277     34.9787      4.2729
+   1762.2877   1497.2438     34.9788      4.2727
+   1763.2714   1497.2602     34.9788      4.2726
+   1764.2551   1497.2768     34.9788      4.2726
+   1765.2388   1497.2943     34.9790      4.2727
+   1766.2224   1497.3114     34.9790      4.2728
+   1767.2061   1497.3282     34.9790      4.2728
+   1768.1898   1497.3448     34.9790      4.2728
+   1769.1735   1497.3619     34.9789      4.2729
+   1770.1571   1497.3793     34.9791      4.2730
+   1771.1407   1497.3962     34.9789      4.2731
+   1772.1244   1497.4135     34.9790      4.2732
+   1773.1080   1497.4307     34.9791      4.2733
+   1774.0917   1497.4476     34.9788      4.2734
+   1775.0753   1497.4648     34.9789      4.2735
+   1776.0588   1497.4817     34.9790      4.2735
+   1777.0425   1497.4990     34.9788      4.2737
+   1778.0261   1497.5164     34.9790      4.2738
+   1779.0098   1497.5330     34.9789      4.2738
+   1779.9933   1497.5507     34.9790      4.2740
+   1780.9769   1497.5666     34.9787      4.2739
+   1781.9606   1497.5834     34.9790      4.2738
+   1782.9441   1497.6004     34.9789      4.2739
+   1783.9277   1497.6176     34.9789      4.2740
+   1784.9113   1497.6341     34.9791      4.2739
+   1785.8949   1497.6510     34.9789      4.2740
+   1786.8784   1497.6681     34.9791      4.2740
+   1787.8621   1497.6850     34.9790      4.2741
+   1788.8456   1497.7017     34.9789      4.2741
+   1789.8291   1497.7190     34.9790      4.2742
+   1790.8127   1497.7358     34.9791      4.2742
+   1791.7963   1497.7515     34.9786      4.2741
+   1792.7798   1497.7685     34.9788      4.2741
+   1793.7633   1497.7838     34.9786      4.2738
+   1794.7469   1497.7995     34.9788      4.2735
+   1795.7305   1497.8164     34.9789      4.2735
+   1796.7140   1497.8332     34.9792      4.2734
+   1797.6975   1497.8495     34.9789      4.2734
+   1798.6810   1497.8652     34.9791      4.2731
+   1799.6646   1497.8815     34.9790      4.2730
+   1800.6481   1497.8981     34.9790      4.2730
+   1801.6316   1497.9155     34.9794      4.2730
+   1802.6150   1497.9317     34.9787      4.2731
+   1803.5985   1497.9487     34.9789      4.2731
+   1804.5820   1497.9659     34.9792      4.2731
+   1805.5656   1497.9823     34.9786      4.2732
+   1806.5490   1497.9992     34.9791      4.2731
+   1807.5325   1498.0163     34.9791      4.2732
+   1808.5160   1498.0327     34.9791      4.2731
+   1809.4994   1498.0497     34.9790      4.2732
+   1810.4829   1498.0666     34.9791      4.2732
+   1811.4663   1498.0836     34.9790      4.2733
+   1812.4498   1498.1005     34.9791      4.2733
+   1813.4332   1498.1174     34.9789      4.2734
+   1814.4167   1498.1341     34.9792      4.2733
+   1815.4001   1498.1505     34.9789      4.2733
+   1816.3835   1498.1674     34.9790      4.2733
+   1817.3671   1498.1837     34.9790      4.2732
+   1818.3505   1498.2007     34.9792      4.2732
+   1819.3339   1498.2178     34.9791      4.2733
+   1820.3173   1498.2342     34.9792      4.2732
+   1821.3007   1498.2507     34.9790      4.2732
+   1822.2841   1498.2674     34.9789      4.2732
+   1823.2676   1498.2843     34.9794      4.2731
+   1824.2510   1498.3009     34.9793      4.2731
+   1825.2344   1498.3175     34.9792      4.2731
+   1826.2178   1498.3345     34.9791      4.2732
+   1827.2010   1498.3514     34.9792      4.2732
+   1828.1844   1498.3683     34.9786      4.2734
+   1829.1678   1498.3852     34.9797      4.2731
+   1830.1512   1498.4011     34.9790      4.2731
+   1831.1346   1498.4174     34.9790      4.2730
+   1832.1179   1498.4341     34.9790      4.2730
+   1833.1013   1498.4505     34.9790      4.2729
+   1834.0847   1498.4670     34.9792      4.2728
+   1835.0680   1498.4836     34.9794      4.2727
+   1836.0514   1498.5004     34.9791      4.2728
+   1837.0348   1498.5177     34.9792      4.2729
+   1838.0181   1498.5353     34.9792      4.2731
+   1839.0015   1498.5523     34.9790      4.2732
+   1839.9847   1498.5692     34.9792      4.2732
+   1840.9680   1498.5858     34.9791      4.2732
+   1841.9514   1498.6029     34.9790      4.2733
+   1842.9347   1498.6203     34.9792      4.2734
+   1843.9180   1498.6366     34.9789      4.2734
+   1844.9014   1498.6536     34.9790      4.2734
+   1845.8846   1498.6701     34.9791      4.2733
+   1846.8679   1498.6868     34.9792      4.2733
+   1847.8512   1498.7036     34.9791      4.2733
+   1848.8345   1498.7203     34.9791      4.2733
+   1849.8177   1498.7370     34.9791      4.2733
+   1850.8010   1498.7538     34.9791      4.2733
+   1851.7843   1498.7705     34.9791      4.2733
+   1852.7676   1498.7878     34.9791      4.2734
+   1853.7509   1498.8039     34.9790      4.2733
+   1854.7341   1498.8208     34.9791      4.2733
+   1855.7174   1498.8369     34.9789      4.2732
+   1856.7007   1498.8536     34.9792      4.2731
+   1857.6838   1498.8700     34.9789      4.2731
+   1858.6671   1498.8858     34.9791      4.2728
+   1859.6504   1498.9017     34.9791      4.2726
+   1860.6335   1498.9181     34.9791      4.2725
+   1861.6168   1498.9347     34.9794      4.2724
+   1862.6001   1498.9509     34.9792      4.2723
+   1863.5833   1498.9670     34.9794      4.2721
+   1864.5665   1498.9839     34.9792      4.2722
+   1865.5497   1499.0004     34.9793      4.2721
+   1866.5328   1499.0168     34.9793      4.2720
+   1867.5161   1499.0337     34.9794      4.2720
+   1868.4993   1499.0503     34.9793      4.2720
+   1869.4825   1499.0668     34.9791      4.2720
+   1870.4657   1499.0835     34.9791      4.2720
+   1871.4489   1499.1011     34.9794      4.2721
+   1872.4320   1499.1179     34.9794      4.2721
+   1873.4152   1499.1340     34.9789      4.2721
+   1874.3984   1499.1496     34.9790      4.2718
+   1875.3816   1499.1667     34.9793      4.2718
+   1876.3647   1499.1834     34.9792      4.2718
+   1877.3479   1499.2003     34.9793      4.2718
+   1878.3311   1499.2171     34.9793      4.2718
+   1879.3142   1499.2341     34.9795      4.2718
+   1880.2974   1499.2506     34.9796      4.2717
+   1881.2804   1499.2664     34.9792      4.2716
+   1882.2635   1499.2828     34.9793      4.2715
+   1883.2467   1499.2995     34.9792      4.2715
+   1884.2299   1499.3167     34.9792      4.2716
+   1885.2129   1499.3338     34.9792      4.2717
+   1886.1960   1499.3510     34.9792      4.2718
+   1887.1792   1499.3685     34.9794      4.2719
+   1888.1622   1499.3851     34.9793      4.2719
+   1889.1454   1499.4021     34.9795      4.2719
+   1890.1285   1499.4190     34.9793      4.2720
+   1891.1116   1499.4357     34.9793      4.2720
+   1892.0946   1499.4524     34.9792      4.2720
+   1893.0778   1499.4695     34.9792      4.2721
+   1894.0608   1499.4856     34.9792      4.2719
+   1895.0439   1499.5019     34.9792      4.2718
+   1896.0270   1499.5192     34.9793      4.2719
+   1897.0100   1499.5358     34.9792      4.2719
+   1897.9930   1499.5522     34.9792      4.2718
+   1898.9762   1499.5700     34.9797      4.2719
+   1899.9592   1499.5862     34.9793      4.2719
+   1900.9423   1499.6031     34.9793      4.2719
+   1901.9253   1499.6202     34.9793      4.2720
+   1902.9083   1499.6375     34.9794      4.2721
+   1903.8914   1499.6548     34.9795      4.2722
+   1904.8744   1499.6725     34.9793      4.2725
+   1905.8574   1499.6894     34.9793      4.2725
+   1906.8405   1499.7060     34.9792      4.2725
+   1907.8235   1499.7229     34.9793      4.2725
+   1908.8065   1499.7396     34.9793      4.2725
+   1909.7894   1499.7565     34.9794      4.2725
+   1910.7725   1499.7736     34.9793      4.2726
+   1911.7555   1499.7908     34.9794      4.2727
+   1912.7384   1499.8072     34.9794      4.2726
+   1913.7214   1499.8241     34.9792      4.2727
+   1914.7045   1499.8409     34.9792      4.2727
+   1915.6874   1499.8578     34.9793      4.2727
+   1916.6704   1499.8740     34.9792      4.2726
+   1917.6533   1499.8910     34.9790      4.2727
+   1918.6364   1499.9089     34.9796      4.2728
+   1919.6193   1499.9257     34.9793      4.2729
+   1920.6023   1499.9425     34.9793      4.2729
+   1921.5852   1499.9590     34.9791      4.2729
+   1922.5681   1499.9755     34.9795      4.2727
+   1923.5510   1499.9923     34.9796      4.2727
+   1924.5341   1500.0093     34.9794      4.2728
+   1925.5170   1500.0263     34.9796      4.2728
+   1926.4999   1500.0435     34.9796      4.2729
+   1927.4828   1500.0610     34.9795      4.2731
+   1928.4657   1500.0781     34.9795      4.2732
+   1929.4486   1500.0951     34.9793      4.2733
+   1930.4315   1500.1120     34.9791      4.2734
+   1931.4144   1500.1294     34.9793      4.2735
+   1932.3973   1500.1463     34.9793      4.2735
+   1933.3802   1500.1632     34.9791      4.2736
+   1934.3632   1500.1807     34.9797      4.2736
+   1935.3461   1500.1977     34.9793      4.2738
+   1936.3290   1500.2149     34.9796      4.2738
+   1937.3118   1500.2320     34.9795      4.2739
+   1938.2947   1500.2487     34.9795      4.2739
+   1939.2776   1500.2659     34.9795      4.2740
+   1940.2604   1500.2829     34.9794      4.2741
+   1941.2433   1500.2999     34.9792      4.2742
+   1942.2261   1500.3172     34.9793      4.2743
+   1943.2090   1500.3343     34.9792      4.2744
+   1944.1918   1500.3509     34.9794      4.2743
+   1945.1747   1500.3679     34.9793      4.2744
+   1946.1575   1500.3851     34.9796      4.2744
+   1947.1404   1500.4017     34.9791      4.2745
+   1948.1232   1500.4190     34.9795      4.2745
+   1949.1060   1500.4360     34.9794      4.2746
+   1950.0889   1500.4526     34.9792      4.2746
+   1951.0717   1500.4686     34.9793      4.2744
+   1952.0544   1500.4854     34.9793      4.2744
+   1953.0372   1500.5015     34.9794      4.2742
+   1954.0200   1500.5189     34.9796      4.2743
+   1955.0028   1500.5354     34.9793      4.2743
+   1955.9856   1500.5521     34.9796      4.2742
+   1956.9684   1500.5692     34.9796      4.2743
+   1957.9512   1500.5856     34.9792      4.2743
+   1958.9340   1500.6032     34.9796      4.2744
+   1959.9167   1500.6204     34.9796      4.2745
+   1960.8995   1500.6374     34.9798      4.2745
+   1961.8823   1500.6540     34.9796      4.2745
+   1962.8651   1500.6710     34.9795      4.2746
+   1963.8478   1500.6881     34.9794      4.2747
+   1964.8306   1500.7049     34.9794      4.2747
+   1965.8134   1500.7224     34.9794      4.2749
+   1966.7960   1500.7394     34.9798      4.2748
+   1967.7788   1500.7567     34.9796      4.2750
+   1968.7616   1500.7737     34.9798      4.2750
+   1969.7443   1500.7902     34.9796      4.2750
+   1970.7271   1500.8076     34.9797      4.2751
+   1971.7097   1500.8246     34.9795      4.2752
+   1972.6924   1500.8411     34.9794      4.2752
+   1973.6752   1500.8578     34.9793      4.2752
+   1974.6578   1500.8751     34.9797      4.2752
+   1975.6405   1500.8909     34.9796      4.2750
+   1976.6233   1500.9078     34.9796      4.2750
+   1977.6060   1500.9244     34.9795      4.2750
+   1978.5886   1500.9416     34.9796      4.2751
+   1979.5713   1500.9582     34.9797      4.2750
+   1980.5540   1500.9748     34.9796      4.2750
+   1981.5366   1500.9908     34.9796      4.2748
+   1982.5193   1501.0075     34.9796      4.2748
+   1983.5021   1501.0236     34.9793      4.2747
+   1984.4846   1501.0409     34.9797      4.2747
+   1985.4673   1501.0572     34.9794      4.2747
+   1986.4500   1501.0743     34.9796      4.2747
+   1987.4326   1501.0909     34.9795      4.2747
+   1988.4153   1501.1084     34.9797      4.2748
+   1989.3979   1501.1249     34.9795      4.2748
+   1990.3805   1501.1423     34.9796      4.2749
+   1991.3632   1501.1589     34.9795      4.2749
+   1992.3458   1501.1752     34.9794      4.2748
+   1993.3284   1501.1920     34.9798      4.2747
+   1994.3110   1501.2089     34.9796      4.2748
+   1995.2937   1501.2260     34.9798      4.2748
+   1996.2762   1501.2429     34.9796      4.2749
+   1997.2589   1501.2594     34.9796      4.2748
+   1998.2415   1501.2760     34.9796      4.2748
+   1999.2240   1501.2929     34.9796      4.2748
+   2000.2067   1501.3099     34.9798      4.2748
+   2001.1892   1501.3271     34.9795      4.2750
+   2002.1718   1501.3437     34.9796      4.2749
+   2003.1544   1501.3603     34.9798      4.2748
+   2004.1370   1501.3768     34.9793      4.2749
+   2005.1195   1501.3940     34.9796      4.2749
+   2006.1021   1501.4106     34.9797      4.2748
+   2007.0846   1501.4262     34.9795      4.2746
+   2008.0673   1501.4427     34.9796      4.2745
+   2009.0498   1501.4594     34.9795      4.2745
+   2010.0323   1501.4771     34.9799      4.2746
+   2011.0149   1501.4940     34.9797      4.2747
+   2011.9973   1501.5108     34.9793      4.2748
+   2012.9799   1501.5261     34.9795      4.2744
+   2013.9624   1501.5422     34.9793      4.2743
+   2014.9449   1501.5594     34.9796      4.2743
+   2015.9275   1501.5765     34.9798      4.2743
+   2016.9100   1501.5931     34.9797      4.2743
+   2017.8925   1501.6101     34.9795      4.2744
+   2018.8750   1501.6271     34.9794      4.2745
+   2019.8575   1501.6442     34.9796      4.2745
+   2020.8400   1501.6611     34.9797      4.2745
+   2021.8225   1501.6785     34.9795      4.2747
+   2022.8049   1501.6950     34.9796      4.2746
+   2023.7875   1501.7122     34.9796      4.2747
+   2024.7699   1501.7288     34.9795      4.2747
+   2025.7524   1501.7464     34.9798      4.2748
+   2026.7349   1501.7635     34.9797      4.2749
+   2027.7173   1501.7801     34.9799      4.2748
+   2028.6998   1501.7967     34.9797      4.2748
+   2029.6823   1501.8140     34.9798      4.2749
+   2030.6647   1501.8309     34.9796      4.2750
+   2031.6471   1501.8480     34.9798      4.2750
+   2032.6295   1501.8650     34.9797      4.2751
+   2033.6119   1501.8822     34.9796      4.2752
+   2034.5945   1501.8987     34.9797      4.2751
+   2035.5769   1501.9164     34.9798      4.2753
+   2036.5593   1501.9334     34.9800      4.2753
+   2037.5417   1501.9497     34.9796      4.2753
+   2038.5240   1501.9671     34.9797      4.2754
+   2039.5065   1501.9839     34.9795      4.2755
+   2040.4889   1502.0008     34.9799      4.2754
+   2041.4713   1502.0180     34.9798      4.2755
+   2042.4537   1502.0358     34.9799      4.2757
+   2043.4362   1502.0526     34.9800      4.2757
+   2044.4185   1502.0693     34.9796      4.2758
+   2045.4009   1502.0862     34.9799      4.2757
+   2046.3833   1502.1025     34.9799      4.2756
+   2047.3656   1502.1193     34.9793      4.2758
+   2048.3479   1502.1375     34.9800      4.2759
+   2049.3303   1502.1541     34.9799      4.2759
+   2050.3127   1502.1708     34.9799      4.2759
+   2051.2952   1502.1880     34.9798      4.2760
+   2052.2773   1502.2051     34.9797      4.2761
+   2053.2598   1502.2224     34.9798      4.2762
+   2054.2422   1502.2395     34.9800      4.2762
+   2055.2244   1502.2565     34.9799      4.2763
+   2056.2068   1502.2738     34.9799      4.2764
+   2057.1892   1502.2907     34.9797      4.2765
+   2058.1714   1502.3082     34.9796      4.2767
+   2059.1538   1502.3251     34.9797      4.2767
+   2060.1360   1502.3419     34.9797      4.2767
+   2061.1184   1502.3590     34.9799      4.2767
+   2062.1006   1502.3761     34.9798      4.2768
+   2063.0830   1502.3932     34.9797      4.2769
+   2064.0652   1502.4094     34.9796      4.2768
+   2065.0476   1502.4256     34.9798      4.2766
+   2066.0298   1502.4421     34.9799      4.2765
+   2067.0122   1502.4599     34.9800      4.2767
+   2067.9944   1502.4766     34.9799      4.2767
+   2068.9766   1502.4922     34.9797      4.2765
+   2069.9590   1502.5097     34.9798      4.2766
+   2070.9412   1502.5269     34.9798      4.2767
+   2071.9233   1502.5440     34.9798      4.2768
+   2072.9058   1502.5601     34.9795      4.2767
+   2073.8879   1502.5772     34.9801      4.2766
+   2074.8701   1502.5940     34.9798      4.2767
+   2075.8525   1502.6108     34.9798      4.2767
+   2076.8347   1502.6272     34.9798      4.2766
+   2077.8169   1502.6441     34.9799      4.2766
+   2078.7991   1502.6612     34.9801      4.2766
+   2079.7812   1502.6782     34.9799      4.2767
+   2080.7637   1502.6946     34.9796      4.2767
+   2081.7458   1502.7132     34.9801      4.2770
+   2082.7280   1502.7296     34.9798      4.2770
+   2083.7102   1502.7465     34.9799      4.2770
+   2084.6924   1502.7634     34.9799      4.2770
+   2085.6746   1502.7804     34.9797      4.2771
+   2086.6567   1502.7973     34.9799      4.2771
+   2087.6389   1502.8150     34.9799      4.2773
+   2088.6211   1502.8320     34.9800      4.2773
+   2089.6033   1502.8481     34.9798      4.2772
+   2090.5854   1502.8652     34.9797      4.2773
+   2091.5676   1502.8819     34.9796      4.2773
+   2092.5498   1502.8992     34.9797      4.2774
+   2093.5320   1502.9167     34.9799      4.2775
+   2094.5142   1502.9335     34.9799      4.2775
+   2095.4963   1502.9502     34.9799      4.2775
+   2096.4785   1502.9674     34.9798      4.2776
+   2097.4607   1502.9846     34.9802      4.2776
+   2098.4429   1503.0012     34.9800      4.2776
+   2099.4248   1503.0178     34.9798      4.2776
+   2100.4070   1503.0349     34.9797      4.2777
+   2101.3892   1503.0523     34.9798      4.2778
+   2102.3713   1503.0693     34.9800      4.2778
+   2103.3533   1503.0863     34.9798      4.2779
+   2104.3354   1503.1028     34.9796      4.2779
+   2105.3176   1503.1200     34.9799      4.2779
+   2106.2998   1503.1367     34.9798      4.2779
+   2107.2817   1503.1544     34.9799      4.2781
+   2108.2639   1503.1715     34.9801      4.2781
+   2109.2458   1503.1880     34.9796      4.2782
+   2110.2280   1503.2054     34.9797      4.2783
+   2111.2102   1503.2222     34.9797      4.2783
+   2112.1921   1503.2389     34.9799      4.2782
+   2113.1743   1503.2555     34.9798      4.2782
+   2114.1562   1503.2728     34.9798      4.2783
+   2115.1384   1503.2895     34.9797      4.2783
+   2116.1204   1503.3059     34.9797      4.2782
+   2117.1025   1503.3226     34.9796      4.2782
+   2118.0845   1503.3393     34.9799      4.2781
+   2119.0667   1503.3564     34.9801      4.2781
+   2120.0486   1503.3735     34.9797      4.2783
+   2121.0308   1503.3911     34.9800      4.2784
+   2122.0127   1503.4077     34.9799      4.2784
+   2122.9946   1503.4243     34.9797      4.2784
+   2123.9768   1503.4418     34.9799      4.2785
+   2124.9587   1503.4589     34.9801      4.2785
+   2125.9407   1503.4754     34.9799      4.2785
+   2126.9229   1503.4923     34.9799      4.2785
+   2127.9048   1503.5095     34.9799      4.2786
+   2128.8867   1503.5264     34.9800      4.2786
+   2129.8687   1503.5436     34.9800      4.2787
+   2130.8508   1503.5606     34.9801      4.2787
+   2131.8328   1503.5779     34.9802      4.2788
+   2132.8147   1503.5949     34.9800      4.2789
+   2133.7966   1503.6122     34.9801      4.2790
+   2134.7786   1503.6290     34.9800      4.2790
+   2135.7607   1503.6455     34.9798      4.2790
+   2136.7427   1503.6626     34.9803      4.2789
+   2137.7246   1503.6795     34.9801      4.2790
+   2138.7065   1503.6963     34.9801      4.2790
+   2139.6885   1503.7134     34.9800      4.2791
+   2140.6704   1503.7307     34.9801      4.2792
+   2141.6523   1503.7472     34.9798      4.2792
+   2142.6343   1503.7646     34.9800      4.2793
+   2143.6162   1503.7823     34.9800      4.2795
+   2144.5981   1503.7998     34.9802      4.2796
+   2145.5801   1503.8163     34.9799      4.2796
+   2146.5620   1503.8336     34.9800      4.2797
+   2147.5439   1503.8513     34.9801      4.2799
+   2148.5259   1503.8670     34.9798      4.2797
+   2149.5076   1503.8833     34.9801      4.2795
+   2150.4895   1503.9006     34.9802      4.2796
+   2151.4714   1503.9178     34.9801      4.2797
+   2152.4534   1503.9348     34.9799      4.2798
+   2153.4353   1503.9517     34.9800      4.2798
+   2154.4172   1503.9686     34.9801      4.2798
+   2155.3989   1503.9855     34.9799      4.2799
+   2156.3809   1504.0028     34.9799      4.2800
+   2157.3628   1504.0200     34.9799      4.2801
+   2158.3447   1504.0370     34.9800      4.2801
+   2159.3264   1504.0543     34.9800      4.2802
+   2160.3083   1504.0714     34.9800      4.2803
+   2161.2903   1504.0887     34.9800      4.2804
+   2162.2720   1504.1058     34.9799      4.2805
+   2163.2539   1504.1228     34.9800      4.2805
+   2164.2356   1504.1403     34.9799      4.2807
+   2165.2175   1504.1571     34.9799      4.2807
+   2166.1995   1504.1748     34.9800      4.2809
+   2167.1812   1504.1910     34.9801      4.2807
+   2168.1631   1504.2087     34.9802      4.2809
+   2169.1448   1504.2254     34.9801      4.2809
+   2170.1267   1504.2431     34.9801      4.2811
+   2171.1084   1504.2601     34.9799      4.2812
+   2172.0903   1504.2774     34.9800      4.2813
+   2173.0720   1504.2949     34.9802      4.2814
+   2174.0537   1504.3115     34.9800      4.2814
+   2175.0356   1504.3290     34.9799      4.2816
+   2176.0173   1504.3462     34.9799      4.2817
+   2176.9990   1504.3632     34.9801      4.2817
+   2177.9810   1504.3805     34.9801      4.2818
+   2178.9626   1504.3975     34.9799      4.2819
+   2179.9443   1504.4147     34.9799      4.2820
+   2180.9263   1504.4319     34.9798      4.2821
+   2181.9080   1504.4491     34.9801      4.2821
+   2182.8896   1504.4659     34.9801      4.2821
+   2183.8713   1504.4829     34.9800      4.2822
+   2184.8533   1504.5004     34.9798      4.2824
+   2185.8350   1504.5179     34.9800      4.2825
+   2186.8167   1504.5345     34.9799      4.2825
+   2187.7983   1504.5514     34.9800      4.2825
+   2188.7800   1504.5691     34.9800      4.2827
+   2189.7617   1504.5862     34.9802      4.2827
+   2190.7437   1504.6036     34.9803      4.2828
+   2191.7253   1504.6207     34.9799      4.2830
+   2192.7070   1504.6367     34.9799      4.2828
+   2193.6887   1504.6540     34.9799      4.2829
+   2194.6704   1504.6711     34.9802      4.2829
+   2195.6521   1504.6881     34.9800      4.2830
+   2196.6338   1504.7052     34.9802      4.2830
+   2197.6155   1504.7221     34.9799      4.2831
+   2198.5972   1504.7389     34.9799      4.2831
+   2199.5789   1504.7560     34.9801      4.2831
+   2200.5605   1504.7727     34.9804      4.2830
+   2201.5420   1504.7896     34.9801      4.2831
+   2202.5237   1504.8064     34.9801      4.2831
+   2203.5054   1504.8240     34.9800      4.2833
+   2204.4871   1504.8410     34.9802      4.2833
+   2205.4688   1504.8583     34.9802      4.2834
+   2206.4504   1504.8749     34.9800      4.2834
+   2207.4319   1504.8925     34.9800      4.2836
+   2208.4136   1504.9096     34.9799      4.2837
+   2209.3953   1504.9272     34.9802      4.2838
+   2210.3770   1504.9441     34.9802      4.2838
+   2211.3584   1504.9611     34.9801      4.2839
+   2212.3401   1504.9784     34.9801      4.2840
+   2213.3218   1504.9954     34.9799      4.2841
+   2214.3032   1505.0128     34.9800      4.2842
+   2215.2849   1505.0297     34.9801      4.2842
+   2216.2666   1505.0471     34.9802      4.2843
+   2217.2480   1505.0643     34.9802      4.2844
+   2218.2297   1505.0809     34.9800      4.2844
+   2219.2112   1505.0976     34.9802      4.2843
+   2220.1929   1505.1148     34.9802      4.2844
+   2221.1746   1505.1319     34.9801      4.2845
+   2222.1560   1505.1493     34.9805      4.2845
+   2223.1377   1505.1662     34.9802      4.2846
+   2224.1191   1505.1830     34.9802      4.2846
+   2225.1006   1505.2002     34.9802      4.2847
+   2226.0823   1505.2178     34.9802      4.2849
+   2227.0637   1505.2345     34.9801      4.2849
+   2228.0454   1505.2516     34.9800      4.2850
+   2229.0269   1505.2687     34.9802      4.2850
+   2230.0083   1505.2867     34.9804      4.2852
+   2230.9900   1505.3036     34.9802      4.2853
+   2231.9714   1505.3209     34.9802      4.2854
+   2232.9529   1505.3379     34.9803      4.2854
+   2233.9346   1505.3544     34.9801      4.2854
+   2234.9160   1505.3713     34.9801      4.2854
+   2235.8975   1505.3887     34.9802      4.2855
+   2236.8792   1505.4066     34.9807      4.2856
+   2237.8606   1505.4228     34.9800      4.2857
+   2238.8420   1505.4401     34.9803      4.2857
+   2239.8235   1505.4565     34.9800      4.2857
+   2240.8049   1505.4742     34.9803      4.2858
+   2241.7864   1505.4913     34.9802      4.2859
+   2242.7681   1505.5077     34.9802      4.2858
+   2243.7495   1505.5251     34.9803      4.2859
+   2244.7310   1505.5423     34.9803      4.2860
+   2245.7124   1505.5591     34.9799      4.2861
+   2246.6938   1505.5761     34.9801      4.2861
+   2247.6753   1505.5934     34.9801      4.2862
+   2248.6567   1505.6104     34.9803      4.2862
+   2249.6382   1505.6277     34.9803      4.2863
+   2250.6196   1505.6458     34.9806      4.2865
+   2251.6011   1505.6623     34.9804      4.2865
+   2252.5825   1505.6798     34.9802      4.2867
+   2253.5640   1505.6968     34.9801      4.2868
+   2254.5454   1505.7142     34.9802      4.2869
+   2255.5266   1505.7314     34.9801      4.2870
+   2256.5081   1505.7489     34.9804      4.2871
+   2257.4895   1505.7657     34.9803      4.2871
+   2258.4709   1505.7828     34.9799      4.2873
+   2259.4524   1505.8002     34.9803      4.2873
+   2260.4338   1505.8176     34.9801      4.2875
+   2261.4150   1505.8345     34.9801      4.2875
+   2262.3965   1505.8515     34.9803      4.2875
+   2263.3779   1505.8684     34.9800      4.2876
+   2264.3594   1505.8856     34.9799      4.2877
+   2265.3406   1505.9031     34.9802      4.2878
+   2266.3220   1505.9199     34.9801      4.2878
+   2267.3035   1505.9373     34.9803      4.2879
+   2268.2847   1505.9542     34.9799      4.2880
+   2269.2661   1505.9715     34.9803      4.2880
+   2270.2476   1505.9885     34.9801      4.2881
+   2271.2288   1506.0060     34.9803      4.2882
+   2272.2102   1506.0228     34.9800      4.2883
+   2273.1914   1506.0399     34.9802      4.2883
+   2274.1729   1506.0567     34.9801      4.2883
+   2275.1541   1506.0744     34.9805      4.2884
+   2276.1355   1506.0911     34.9801      4.2885
+   2277.1167   1506.1085     34.9802      4.2886
+   2278.0981   1506.1256     34.9801      4.2887
+   2279.0793   1506.1423     34.9799      4.2887
+   2280.0608   1506.1599     34.9802      4.2888
+   2281.0420   1506.1765     34.9804      4.2887
+   2282.0232   1506.1937     34.9803      4.2888
+   2283.0046   1506.2110     34.9803      4.2889
+   2283.9858   1506.2282     34.9803      4.2890
+   2284.9670   1506.2447     34.9801      4.2890
+   2285.9485   1506.2623     34.9803      4.2891
+   2286.9297   1506.2798     34.9808      4.2891
+   2287.9109   1506.2962     34.9805      4.2891
+   2288.8923   1506.3129     34.9801      4.2892
+   2289.8735   1506.3297     34.9800      4.2892
+   2290.8547   1506.3467     34.9801      4.2892
+   2291.8359   1506.3636     34.9802      4.2892
+   2292.8174   1506.3803     34.9801      4.2892
+   2293.7986   1506.3966     34.9800      4.2891
+   2294.7798   1506.4138     34.9803      4.2891
+   2295.7610   1506.4314     34.9802      4.2893
+   2296.7422   1506.4484     34.9804      4.2893
+   2297.7234   1506.4650     34.9801      4.2893
+   2298.7046   1506.4821     34.9804      4.2893
+   2299.6858   1506.4992     34.9802      4.2894
+   2300.6670   1506.5159     34.9804      4.2893
+   2301.6482   1506.5335     34.9804      4.2895
+   2302.6294   1506.5509     34.9802      4.2897
+   2303.6106   1506.5682     34.9805      4.2897
+   2304.5918   1506.5854     34.9805      4.2898
+   2305.5730   1506.6031     34.9805      4.2900
+   2306.5542   1506.6198     34.9801      4.2901
+   2307.5354   1506.6372     34.9802      4.2902
+   2308.5166   1506.6546     34.9806      4.2902
+   2309.4978   1506.6709     34.9802      4.2902
+   2310.4790   1506.6871     34.9803      4.2900
+   2311.4602   1506.7042     34.9805      4.2900
+   2312.4412   1506.7210     34.9804      4.2900
+   2313.4224   1506.7382     34.9805      4.2901
+   2314.4036   1506.7554     34.9804      4.2902
+   2315.3848   1506.7731     34.9804      4.2904
+   2316.3657   1506.7897     34.9802      4.2904
+   2317.3469   1506.8071     34.9803      4.2905
+   2318.3281   1506.8247     34.9803      4.2907
+   2319.3093   1506.8416     34.9803      4.2907
+   2320.2903   1506.8588     34.9803      4.2908
+   2321.2715   1506.8758     34.9804      4.2908
+   2322.2527   1506.8929     34.9803      4.2909
+   2323.2336   1506.9101     34.9802      4.2910
+   2324.2148   1506.9271     34.9803      4.2910
+   2325.1958   1506.9443     34.9803      4.2911
+   2326.1770   1506.9618     34.9804      4.2912
+   2327.1580   1506.9791     34.9802      4.2914
+   2328.1392   1506.9967     34.9804      4.2915
+   2329.1204   1507.0138     34.9803      4.2916
+   2330.1013   1507.0311     34.9803      4.2917
+   2331.0823   1507.0483     34.9806      4.2917
+   2332.0635   1507.0655     34.9802      4.2919
+   2333.0444   1507.0822     34.9801      4.2919
+   2334.0256   1507.0999     34.9804      4.2920
+   2335.0066   1507.1170     34.9803      4.2921
+   2335.9878   1507.1336     34.9802      4.2921
+   2336.9688   1507.1515     34.9803      4.2923
+   2337.9497   1507.1689     34.9805      4.2924
+   2338.9309   1507.1858     34.9805      4.2924
+   2339.9119   1507.2033     34.9803      4.2926
+   2340.8928   1507.2200     34.9802      4.2926
+   2341.8738   1507.2379     34.9804      4.2928
+   2342.8550   1507.2550     34.9803      4.2929
+   2343.8359   1507.2719     34.9803      4.2929
+   2344.8169   1507.2897     34.9807      4.2930
+   2345.7979   1507.3065     34.9804      4.2931
+   2346.7791   1507.3244     34.9805      4.2933
+   2347.7600   1507.3412     34.9805      4.2933
+   2348.7410   1507.3584     34.9804      4.2934
+   2349.7219   1507.3756     34.9803      4.2935
+   2350.7029   1507.3929     34.9804      4.2936
+   2351.6838   1507.4100     34.9803      4.2937
+   2352.6648   1507.4271     34.9804      4.2937
+   2353.6458   1507.4443     34.9804      4.2938
+   2354.6267   1507.4609     34.9802      4.2938
+   2355.6077   1507.4785     34.9805      4.2939
+   2356.5886   1507.4954     34.9805      4.2939
+   2357.5696   1507.5131     34.9805      4.2941
+   2358.5505   1507.5294     34.9801      4.2941
+   2359.5315   1507.5465     34.9803      4.2941
+   2360.5125   1507.5637     34.9806      4.2941
+   2361.4934   1507.5812     34.9804      4.2943
+   2362.4744   1507.5987     34.9803      4.2945
+   2363.4553   1507.6158     34.9804      4.2945
+   2364.4363   1507.6333     34.9807      4.2946
+   2365.4170   1507.6506     34.9803      4.2948
+   2366.3979   1507.6677     34.9802      4.2949
+   2367.3789   1507.6851     34.9803      4.2950
+   2368.3599   1507.7011     34.9803      4.2948
+   2369.3408   1507.7189     34.9804      4.2950
+   2370.3215   1507.7363     34.9805      4.2951
+   2371.3025   1507.7533     34.9806      4.2951
+   2372.2834   1507.7700     34.9801      4.2952
+   2373.2642   1507.7874     34.9802      4.2953
+   2374.2451   1507.8044     34.9804      4.2953
+   2375.2261   1507.8216     34.9803      4.2954
+   2376.2068   1507.8389     34.9804      4.2955
+   2377.1877   1507.8560     34.9805      4.2955
+   2378.1687   1507.8732     34.9805      4.2956
+   2379.1494   1507.8898     34.9803      4.2956
+   2380.1304   1507.9072     34.9804      4.2957
+   2381.1111   1507.9247     34.9806      4.2958
+   2382.0920   1507.9418     34.9804      4.2959
+   2383.0728   1507.9590     34.9804      4.2960
+   2384.0537   1507.9762     34.9803      4.2961
+   2385.0344   1507.9932     34.9804      4.2961
+   2386.0154   1508.0106     34.9805      4.2962
+   2386.9961   1508.0276     34.9803      4.2963
+   2387.9768   1508.0447     34.9805      4.2963
+   2388.9578   1508.0617     34.9803      4.2964
+   2389.9385   1508.0790     34.9803      4.2965
+   2390.9194   1508.0963     34.9806      4.2965
+   2391.9001   1508.1131     34.9806      4.2965
+   2392.8809   1508.1304     34.9806      4.2966
+   2393.8618   1508.1477     34.9803      4.2968
+   2394.8425   1508.1646     34.9807      4.2967
+   2395.8232   1508.1816     34.9804      4.2968
+   2396.8040   1508.1992     34.9804      4.2970
@@ -0,0 +1,32 @@
+test_read_store_and_write
+6/11/2011
+20:38:24
+Probe: Castaway
+Source: /root/package/data/input/castaway/10G100412_20111106_203824.csv
+      0.1532   1470.6127      0.0301     16.3455
+      0.4593   1442.0285      0.0431      8.6833
+      0.7653   1432.0222      0.0484      6.3099
+      1.0713   1428.7169      0.0466      5.5551
+      1.3773   1428.1427      0.0461      5.4246
+      1.6833   1427.7887      0.0459      5.3438
+      1.9893   1426.8277      0.0449      5.1274
+      2.2953   1426.2209      0.0447      4.9908
+      2.6012   1426.0045      0.0444      4.9416
+      2.9072   1425.6768      0.0443      4.8676
+      3.2132   1425.2055      0.0438      4.7620
+      3.5192   1425.1595      0.0437      4.7508
+      3.8252   1425.1544      0.0437      4.7486
+      4.1311   1425.0078      0.0437      4.7151
+      4.4371   1425.0003      0.0435      4.7124
+      4.7431   1424.9489      0.0435      4.7000
+      5.0491   1424.9658      0.0436      4.7027
+      5.3550   1424.9503      0.0437      4.6982
+      5.6610   1424.9513      0.0436      4.6974
+      5.9670   1424.9670      0.0437      4.6998
+      6.2730   1424.9426      0.0435      4.6934
+      6.5789   1424.9238      0.0434      4.6882
+      6.8849   1424.9287      0.0435      4.6882
+      7.1909   1424.9698      0.0436      4.6963
+      7.4969   1424.9883      0.0436      4.6993
+      7.8028   1424.9784      0.0437      4.6961
+      8.1317   1425.2299      0.0437      4.7507
@@ -0,0 +1,85 @@
+test_read_store_and_write
+22/2/2012
+7:9:24
+Probe: Castaway
+Source: /root/package/data/input/castaway/10M100491_20120222_070924_cast_away.csv
+      0.1491   1489.1013     35.2046      9.7271
+      0.4473   1489.1057     35.1733      9.7376
+      0.7455   1489.0930     35.1690      9.7341
+      1.0437   1489.0246     35.1463      9.7215
+      1.3419   1489.0023     35.1261      9.7208
+      1.6401   1488.9250     35.0661      9.7183
+      1.9383   1488.7943     34.9914      9.7060
+      2.2365   1488.7369     34.9430      9.7051
+      2.5348   1488.7678     34.9472      9.7109
+      2.8330   1488.8026     34.9574      9.7157
+      3.1312   1488.8389     34.9929      9.7124
+      3.4295   1488.9231     35.0554      9.7132
+      3.7277   1488.9153     35.0329      9.7173
+      4.0259   1488.9697     35.0573      9.7227
+      4.3241   1489.0952     35.1395      9.7283
+      4.6223   1489.1391     35.1426      9.7381
+      4.9205   1489.1950     35.1597      9.7464
+      5.2187   1489.2454     35.1647      9.7573
+      5.5169   1489.2807     35.1682      9.7646
+      5.8150   1489.3126     35.1691      9.7717
+      6.1132   1489.3613     35.1776      9.7810
+      6.4114   1489.3676     35.1611      9.7870
+      6.7096   1489.3845     35.1586      9.7911
+      7.0078   1489.3860     35.1528      9.7921
+      7.3060   1489.3703     35.1576      9.7848
+      7.6042   1489.3810     35.1718      9.7816
+      7.9024   1489.3966     35.1964      9.7762
+      8.2005   1489.3996     35.2025      9.7736
+      8.4987   1489.4129     35.1820      9.7829
+      8.7969   1489.3842     35.1710      9.7772
+      9.0951   1489.3687     35.1763      9.7698
+      9.3933   1489.3739     35.1780      9.7693
+      9.6915   1489.3750     35.1810      9.7672
+      9.9896   1489.3852     35.1881      9.7663
+     10.2878   1489.3863     35.1827      9.7670
+     10.5860   1489.3935     35.1835      9.7674
+     10.8842   1489.4128     35.1956      9.7673
+     11.1823   1489.4118     35.1910      9.7672
+     11.4805   1489.4262     35.1967      9.7679
+     11.7787   1489.4326     35.1993      9.7674
+     12.0769   1489.4412     35.1995      9.7683
+     12.3750   1489.4465     35.2022      9.7675
+     12.6732   1489.4606     35.2096      9.7676
+     12.9714   1489.4622     35.2117      9.7659
+     13.2696   1489.4580     35.2125      9.7631
+     13.5677   1489.4826     35.2177      9.7668
+     13.8659   1489.4948     35.2155      9.7696
+     14.1641   1489.5066     35.2191      9.7703
+     14.4622   1489.5175     35.2208      9.7713
+     14.7604   1489.5015     35.2200      9.7658
+     15.0586   1489.5078     35.2212      9.7658
+     15.3567   1489.5167     35.2198      9.7673
+     15.6549   1489.5266     35.2275      9.7661
+     15.9531   1489.5380     35.2233      9.7693
+     16.2512   1489.5597     35.2315      9.7712
+     16.5494   1489.5567     35.2260      9.7708
+     16.8475   1489.5783     35.2312      9.7737
+     17.1457   1489.5797     35.2298      9.7732
+     17.4439   1489.5721     35.2309      9.7693
+     17.7420   1489.6001     35.2375      9.7736
+     18.0402   1489.6039     35.2363      9.7736
+     18.3383   1489.6007     35.2277      9.7743
+     18.6365   1489.5776     35.2229      9.7681
+     18.9347   1489.5965     35.2348      9.7680
+     19.2328   1489.5936     35.2288      9.7678
+     19.5310   1489.6174     35.2359      9.7707
+     19.8291   1489.6177     35.2341      9.7700
+     20.1273   1489.6287     35.2328      9.7721
+     20.4255   1489.6184     35.2311      9.7685
+     20.7236   1489.6438     35.2338      9.7732
+     21.0218   1489.6396     35.2365      9.7698
+     21.3199   1489.6473     35.2290      9.7731
+     21.6181   1489.6096     35.2061      9.7690
+     21.9162   1489.6165     35.2060      9.7696
+     22.2144   1489.5994     35.1867      9.7700
+     22.5126   1489.6156     35.1930      9.7710
+     22.8107   1489.6417     35.1932      9.7768
+     23.1089   1489.6692     35.1833      9.7864
+     23.4071   1489.6862     35.2063      9.7819
+     23.7644   1489.6978     35.1921      9.7883
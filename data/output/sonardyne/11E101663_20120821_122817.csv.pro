@@ -0,0 +1,80 @@
+test_read_store_and_write
+21/8/2012
+12:28:17
+Probe: Castaway
+Source: /root/package/data/input/castaway/11E101663_20120821_122817.csv
+      0.1496   1512.6299     31.2639     18.3672
+      0.4490   1512.6520     31.2648     18.3727
+      0.7483   1512.6522     31.2678     18.3699
+      1.0476   1512.6496     31.2670     18.3676
+      1.3469   1512.6466     31.2694     18.3640
+      1.6462   1512.6505     31.2737     18.3619
+      1.9455   1512.6488     31.2808     18.3569
+      2.2448   1512.6325     31.2779     18.3507
+      2.5441   1512.6176     31.2858     18.3409
+      2.8434   1512.5855     31.2896     18.3268
+      3.1426   1512.5150     31.2945     18.2991
+      3.4419   1512.4358     31.3004     18.2681
+      3.7412   1512.3123     31.3221     18.2160
+      4.0405   1512.0736     31.3528     18.1213
+      4.3397   1511.8159     31.3350     18.0390
+      4.6390   1511.4352     31.3411     17.9062
+      4.9382   1510.9599     31.3266     17.7499
+      5.2375   1510.7445     31.3112     17.6817
+      5.5367   1510.4866     31.3277     17.5873
+      5.8359   1510.2625     31.3984     17.4838
+      6.1351   1509.4833     31.3669     17.2347
+      6.4343   1508.0100     31.3353     16.7591
+      6.7335   1506.6585     31.3543     16.3101
+      7.0326   1505.4748     31.4288     15.8995
+      7.3317   1504.4698     31.4959     15.5525
+      7.6307   1503.5422     31.5437     15.2399
+      7.9297   1502.9593     31.5648     15.0474
+      8.2287   1502.4811     31.5940     14.8855
+      8.5277   1502.1418     31.5988     14.7764
+      8.8267   1501.7369     31.6470     14.6315
+      9.1256   1501.2607     31.6682     14.4748
+      9.4246   1500.9690     31.6706     14.3823
+      9.7235   1500.8074     31.6908     14.3237
+     10.0224   1500.5074     31.6848     14.2321
+     10.3213   1499.6443     31.7053     13.9590
+     10.6202   1499.0633     31.7575     13.7620
+     10.9191   1498.6579     31.7960     13.6239
+     11.2180   1498.4233     31.8315     13.5388
+     11.5168   1498.3022     31.8761     13.4850
+     11.8156   1498.0860     31.8699     13.4205
+     12.1145   1497.8238     31.8563     13.3450
+     12.4133   1497.6198     31.8455     13.2861
+     12.7121   1497.2386     31.8644     13.1637
+     13.0109   1496.8743     31.8945     13.0428
+     13.3097   1496.2041     31.9042     12.8386
+     13.6085   1495.4377     31.9462     12.5957
+     13.9073   1494.8652     31.9559     12.4224
+     14.2060   1494.4301     31.9588     12.2924
+     14.5048   1494.2041     31.9569     12.2256
+     14.8035   1494.0659     31.9732     12.1781
+     15.1023   1493.9862     31.9885     12.1481
+     15.4010   1493.9284     32.0024     12.1250
+     15.6997   1493.9053     32.0030     12.1165
+     15.9984   1493.8945     32.0145     12.1080
+     16.2972   1493.8753     32.0185     12.0996
+     16.5959   1493.8161     32.0147     12.0822
+     16.8946   1493.7079     32.0106     12.0507
+     17.1933   1493.5851     32.0174     12.0112
+     17.4920   1493.3964     32.0290     11.9509
+     17.7907   1493.1375     32.0227     11.8766
+     18.0894   1493.0277     32.0202     11.8443
+     18.3882   1492.8822     32.0309     11.7971
+     18.6868   1492.7647     32.0424     11.7577
+     18.9855   1492.6903     32.0588     11.7292
+     19.2842   1492.6339     32.0568     11.7122
+     19.5829   1492.6051     32.0595     11.7015
+     19.8816   1492.5850     32.0636     11.6929
+     20.1803   1492.5480     32.0585     11.6825
+     20.4790   1492.5189     32.0589     11.6726
+     20.7777   1492.4869     32.0606     11.6614
+     21.0763   1492.4730     32.0759     11.6507
+     21.3750   1492.5357     32.0815     11.6654
+     21.6737   1492.2108     32.0698     11.5745
+     21.9724   1491.5410     32.1569     11.3511
+     22.3566   1491.7461     32.1851     11.3982
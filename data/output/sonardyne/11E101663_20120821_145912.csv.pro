@@ -0,0 +1,81 @@
+test_read_store_and_write
+21/8/2012
+14:59:12
+Probe: Castaway
+Source: /root/package/data/input/castaway/11E101663_20120821_145912.csv
+      0.1497   1514.1527     31.3323     18.8647
+      0.4490   1513.7070     31.3291     18.7101
+      0.7483   1513.3052     31.3495     18.5621
+      1.0476   1513.0235     31.3286     18.4718
+      1.3469   1512.9479     31.3218     18.4468
+      1.6462   1512.9313     31.3352     18.4342
+      1.9455   1512.8429     31.3217     18.4075
+      2.2447   1512.7171     31.3354     18.3575
+      2.5440   1512.5159     31.3572     18.2786
+      2.8433   1512.2772     31.3813     18.1864
+      3.1425   1511.9691     31.3777     18.0813
+      3.4418   1511.1560     31.3736     17.8063
+      3.7410   1510.3322     31.5016     17.4795
+      4.0402   1509.0355     31.3984     17.0860
+      4.3393   1506.9152     31.3877     16.3938
+      4.6384   1505.4110     31.3621     15.9165
+      4.9375   1504.2726     31.4265     15.5280
+      5.2366   1503.2184     31.5706     15.1407
+      5.5356   1502.5170     31.6132     14.9037
+      5.8346   1501.6129     31.5938     14.6277
+      6.1335   1500.9249     31.6395     14.3968
+      6.4325   1500.2162     31.6402     14.1770
+      6.7314   1499.6694     31.7036     13.9854
+      7.0303   1499.2876     31.7546     13.8493
+      7.3292   1499.0529     31.7772     13.7684
+      7.6280   1498.7717     31.7895     13.6772
+      7.9269   1498.5412     31.7831     13.6081
+      8.2258   1498.2346     31.8148     13.5028
+      8.5246   1498.0003     31.8532     13.4170
+      8.8234   1497.6844     31.8461     13.3231
+      9.1223   1497.3629     31.8489     13.2242
+      9.4211   1496.8107     31.8559     13.0552
+      9.7199   1496.4564     31.8983     12.9332
+     10.0187   1496.2878     31.9380     12.8677
+     10.3175   1496.2106     31.9500     12.8391
+     10.6163   1496.1805     31.9657     12.8232
+     10.9150   1496.1240     31.9659     12.8049
+     11.2138   1496.0771     31.9782     12.7852
+     11.5126   1496.0477     31.9835     12.7732
+     11.8114   1496.0101     31.9834     12.7606
+     12.1101   1495.9277     31.9949     12.7307
+     12.4089   1495.8602     32.0045     12.7059
+     12.7076   1495.7117     32.0265     12.6528
+     13.0064   1495.3118     32.0233     12.5345
+     13.3051   1495.0631     32.0004     12.4679
+     13.6039   1494.7250     32.0210     12.3600
+     13.9026   1494.4998     32.0796     12.2722
+     14.2013   1494.4032     32.1077     12.2327
+     14.5000   1494.3430     32.1222     12.2086
+     14.7987   1494.2942     32.1661     12.1776
+     15.0974   1494.2539     32.1819     12.1589
+     15.3961   1494.2562     32.2003     12.1517
+     15.6948   1494.2049     32.2087     12.1324
+     15.9935   1494.1715     32.2132     12.1197
+     16.2921   1494.1528     32.2249     12.1087
+     16.5908   1494.1320     32.2312     12.0990
+     16.8895   1494.1122     32.2376     12.0896
+     17.1881   1494.0905     32.2394     12.0812
+     17.4868   1494.0330     32.2451     12.0610
+     17.7855   1493.9078     32.2743     12.0130
+     18.0841   1493.4507     32.2372     11.8917
+     18.3828   1493.1458     32.1685     11.8257
+     18.6815   1492.8884     32.1052     11.7718
+     18.9801   1492.6133     32.1404     11.6788
+     19.2788   1492.5347     32.1902     11.6375
+     19.5774   1492.4284     32.2118     11.5981
+     19.8761   1492.3455     32.2124     11.5726
+     20.1747   1492.3022     32.2119     11.5589
+     20.4734   1492.2728     32.2161     11.5476
+     20.7720   1492.2409     32.2147     11.5375
+     21.0707   1492.1819     32.1877     11.5284
+     21.3693   1492.0399     32.1794     11.4891
+     21.6679   1491.8907     32.1550     11.4533
+     21.9666   1491.2863     31.9947     11.3340
+     22.2653   1490.4262     32.1230     11.0438
+     22.5576   1490.2664     32.2010     10.9705
@@ -0,0 +1,403 @@
+test_read_store_and_write
+18/10/2026
+22:50:17
+Probe: ELAC
+Source: /root/package/data/input/elac/19Jan07cast-300m.sva
+      1.0700   1809.8700      0.0000      0.0000
+      1.8800   1810.0000      0.0000      0.0000
+      2.8700   1810.0300      0.0000      0.0000
+      3.6900   1810.0300      0.0000      0.0000
+      4.4900   1810.0300      0.0000      0.0000
+      5.3900   1810.0300      0.0000      0.0000
+      6.2000   1810.0300      0.0000      0.0000
+      7.1000   1810.0300      0.0000      0.0000
+      8.0900   1810.0300      0.0000      0.0000
+      8.9900   1810.0300      0.0000      0.0000
+      9.8000   1810.0300      0.0000      0.0000
+     10.6000   1810.0300      0.0000      0.0000
+     11.4200   1810.0300      0.0000      0.0000
+     12.3100   1810.0300      0.0000      0.0000
+     13.1300   1810.0300      0.0000      0.0000
+     14.1100   1810.0300      0.0000      0.0000
+     15.1000   1810.0300      0.0000      0.0000
+     16.1900   1810.0300      0.0000      0.0000
+     16.9900   1810.0300      0.0000      0.0000
+     17.8100   1810.0300      0.0000      0.0000
+     18.8000   1810.0300      0.0000      0.0000
+     19.6000   1810.0300      0.0000      0.0000
+     20.5000   1810.0300      0.0000      0.0000
+     21.3100   1810.0300      0.0000      0.0000
+     22.2100   1810.0300      0.0000      0.0000
+     23.2900   1810.0300      0.0000      0.0000
+     24.1900   1810.0300      0.0000      0.0000
+     25.0000   1810.0300      0.0000      0.0000
+     25.9000   1810.0300      0.0000      0.0000
+     26.9800   1810.0300      0.0000      0.0000
+     27.8800   1810.0300      0.0000      0.0000
+     28.8700   1810.0300      0.0000      0.0000
+     29.6800   1810.0300      0.0000      0.0000
+     30.4900   1810.0300      0.0000      0.0000
+     31.3900   1810.0300      0.0000      0.0000
+     32.2900   1810.0300      0.0000      0.0000
+     33.1900   1810.0300      0.0000      0.0000
+     34.0900   1810.0300      0.0000      0.0000
+     34.9000   1810.0300      0.0000      0.0000
+     35.7100   1810.0300      0.0000      0.0000
+     36.5200   1810.0300      0.0000      0.0000
+     37.4200   1810.0300      0.0000      0.0000
+     38.2300   1810.0300      0.0000      0.0000
+     39.0400   1810.0300      0.0000      0.0000
+     39.8500   1810.0300      0.0000      0.0000
+     40.7500   1810.0300      0.0000      0.0000
+     41.9200   1810.0300      0.0000      0.0000
+     42.7300   1810.0300      0.0000      0.0000
+     43.7200   1810.0300      0.0000      0.0000
+     44.5200   1810.0300      0.0000      0.0000
+     45.5200   1810.0300      0.0000      0.0000
+     46.3200   1810.2000      0.0000      0.0000
+     47.4900   1810.2000      0.0000      0.0000
+     48.3100   1810.2000      0.0000      0.0000
+     49.2000   1810.2000      0.0000      0.0000
+     50.1900   1810.2000      0.0000      0.0000
+     51.2700   1810.2000      0.0000      0.0000
+     52.1800   1810.2000      0.0000      0.0000
+     52.9800   1810.2000      0.0000      0.0000
+     53.8900   1810.2000      0.0000      0.0000
+     54.6900   1810.2000      0.0000      0.0000
+     55.5000   1810.2000      0.0000      0.0000
+     56.4000   1810.2000      0.0000      0.0000
+     57.2100   1810.5400      0.0000      0.0000
+     58.2900   1810.5400      0.0000      0.0000
+     59.1900   1810.5400      0.0000      0.0000
+     60.1000   1810.5400      0.0000      0.0000
+     61.1700   1810.5400      0.0000      0.0000
+     61.9800   1810.5400      0.0000      0.0000
+     62.7900   1810.5400      0.0000      0.0000
+     63.7800   1810.5400      0.0000      0.0000
+     64.6000   1810.5400      0.0000      0.0000
+     65.4900   1810.5400      0.0000      0.0000
+     66.6600   1810.5400      0.0000      0.0000
+     67.4800   1810.5400      0.0000      0.0000
+     68.3700   1810.5400      0.0000      0.0000
+     69.3600   1810.5400      0.0000      0.0000
+     70.2700   1810.5400      0.0000      0.0000
+     71.0700   1810.5400      0.0000      0.0000
+     71.8800   1810.7000      0.0000      0.0000
+     72.8700   1810.7000      0.0000      0.0000
+     73.6900   1810.7000      0.0000      0.0000
+     74.5800   1810.7000      0.0000      0.0000
+     75.4000   1810.7000      0.0000      0.0000
+     76.2000   1810.7000      0.0000      0.0000
+     77.0200   1810.7000      0.0000      0.0000
+     77.8200   1810.7000      0.0000      0.0000
+     78.7300   1810.7000      0.0000      0.0000
+     79.5300   1810.7000      0.0000      0.0000
+     80.3500   1810.7000      0.0000      0.0000
+     81.1500   1810.7000      0.0000      0.0000
+     81.9600   1810.7000      0.0000      0.0000
+     82.7700   1810.8700      0.0000      0.0000
+     83.5800   1810.8700      0.0000      0.0000
+     84.4000   1810.8700      0.0000      0.0000
+     85.2000   1810.8700      0.0000      0.0000
+     86.1000   1810.8700      0.0000      0.0000
+     86.9100   1810.8700      0.0000      0.0000
+     87.7300   1810.8700      0.0000      0.0000
+     88.5300   1810.8700      0.0000      0.0000
+     89.3500   1810.8700      0.0000      0.0000
+     90.1500   1810.8700      0.0000      0.0000
+     91.0600   1810.8700      0.0000      0.0000
+     91.9500   1810.8700      0.0000      0.0000
+     92.9400   1810.8700      0.0000      0.0000
+     93.7600   1811.0400      0.0000      0.0000
+     94.7400   1811.0400      0.0000      0.0000
+     95.5600   1811.0400      0.0000      0.0000
+     96.4500   1811.0400      0.0000      0.0000
+     97.3500   1811.0400      0.0000      0.0000
+     98.1700   1811.0400      0.0000      0.0000
+     99.1500   1811.0400      0.0000      0.0000
+     99.9700   1811.0400      0.0000      0.0000
+    100.8600   1811.0400      0.0000      0.0000
+    101.7700   1811.0400      0.0000      0.0000
+    102.6700   1811.0400      0.0000      0.0000
+    103.4800   1811.0300      0.0000      0.0000
+    104.1800   1811.0400      0.0000      0.0000
+    104.8900   1811.0500      0.0000      0.0000
+    105.5900   1811.0600      0.0000      0.0000
+    106.3000   1811.0700      0.0000      0.0000
+    107.0000   1811.0800      0.0000      0.0000
+    107.7000   1811.0900      0.0000      0.0000
+    108.4100   1811.1000      0.0000      0.0000
+    109.1100   1811.1100      0.0000      0.0000
+    109.8200   1811.1200      0.0000      0.0000
+    110.5200   1811.1300      0.0000      0.0000
+    111.2300   1811.1400      0.0000      0.0000
+    111.9300   1811.1500      0.0000      0.0000
+    112.6400   1811.1600      0.0000      0.0000
+    113.3400   1811.1700      0.0000      0.0000
+    114.0500   1811.1800      0.0000      0.0000
+    114.7500   1811.2000      0.0000      0.0000
+    115.4600   1811.2100      0.0000      0.0000
+    116.1600   1811.2200      0.0000      0.0000
+    116.8700   1811.2300      0.0000      0.0000
+    117.5700   1811.2400      0.0000      0.0000
+    118.2800   1811.2500      0.0000      0.0000
+    118.9800   1811.2600      0.0000      0.0000
+    119.6800   1811.2700      0.0000      0.0000
+    120.3900   1811.2800      0.0000      0.0000
+    121.0900   1811.2900      0.0000      0.0000
+    121.8000   1811.3000      0.0000      0.0000
+    122.5000   1811.3100      0.0000      0.0000
+    123.2100   1811.3200      0.0000      0.0000
+    123.9100   1811.3300      0.0000      0.0000
+    124.6200   1811.3400      0.0000      0.0000
+    125.3200   1811.3600      0.0000      0.0000
+    126.0300   1811.3700      0.0000      0.0000
+    126.7300   1811.3800      0.0000      0.0000
+    127.4400   1811.3900      0.0000      0.0000
+    128.1400   1811.4000      0.0000      0.0000
+    128.8500   1811.4100      0.0000      0.0000
+    129.5500   1811.4200      0.0000      0.0000
+    130.2600   1811.4300      0.0000      0.0000
+    130.9600   1811.4400      0.0000      0.0000
+    131.6600   1811.4500      0.0000      0.0000
+    132.3700   1811.4600      0.0000      0.0000
+    133.0700   1811.4700      0.0000      0.0000
+    133.7800   1811.4800      0.0000      0.0000
+    134.4800   1811.4900      0.0000      0.0000
+    135.1900   1811.5000      0.0000      0.0000
+    135.8900   1811.5100      0.0000      0.0000
+    136.6000   1811.5300      0.0000      0.0000
+    137.3000   1811.5400      0.0000      0.0000
+    138.0100   1811.5500      0.0000      0.0000
+    138.7100   1811.5600      0.0000      0.0000
+    139.4200   1811.5700      0.0000      0.0000
+    140.1200   1811.5800      0.0000      0.0000
+    140.8300   1811.5900      0.0000      0.0000
+    141.5300   1811.6000      0.0000      0.0000
+    142.2400   1811.6100      0.0000      0.0000
+    142.9400   1811.6200      0.0000      0.0000
+    143.6400   1811.6300      0.0000      0.0000
+    144.3500   1811.6400      0.0000      0.0000
+    145.0500   1811.6500      0.0000      0.0000
+    145.7600   1811.6600      0.0000      0.0000
+    146.4600   1811.6700      0.0000      0.0000
+    147.1700   1811.6800      0.0000      0.0000
+    147.8700   1811.7000      0.0000      0.0000
+    148.5800   1811.7100      0.0000      0.0000
+    149.2800   1811.7200      0.0000      0.0000
+    149.9900   1811.7300      0.0000      0.0000
+    150.6900   1811.7400      0.0000      0.0000
+    151.4000   1811.7500      0.0000      0.0000
+    152.1000   1811.7600      0.0000      0.0000
+    152.8100   1811.7700      0.0000      0.0000
+    153.5100   1811.7800      0.0000      0.0000
+    154.2200   1811.7900      0.0000      0.0000
+    154.9200   1811.8000      0.0000      0.0000
+    155.6200   1811.8100      0.0000      0.0000
+    156.3300   1811.8200      0.0000      0.0000
+    157.0300   1811.8300      0.0000      0.0000
+    157.7400   1811.8400      0.0000      0.0000
+    158.4400   1811.8600      0.0000      0.0000
+    159.1500   1811.8700      0.0000      0.0000
+    159.8500   1811.8800      0.0000      0.0000
+    160.5600   1811.8900      0.0000      0.0000
+    161.2600   1811.9000      0.0000      0.0000
+    161.9700   1811.9100      0.0000      0.0000
+    162.6700   1811.9200      0.0000      0.0000
+    163.3800   1811.9300      0.0000      0.0000
+    164.0800   1811.9400      0.0000      0.0000
+    164.7900   1811.9500      0.0000      0.0000
+    165.4900   1811.9600      0.0000      0.0000
+    166.2000   1811.9700      0.0000      0.0000
+    166.9000   1811.9800      0.0000      0.0000
+    167.6000   1811.9900      0.0000      0.0000
+    168.3100   1812.0000      0.0000      0.0000
+    169.0100   1812.0100      0.0000      0.0000
+    169.7200   1812.0300      0.0000      0.0000
+    170.4200   1812.0400      0.0000      0.0000
+    171.1300   1812.0500      0.0000      0.0000
+    171.8300   1812.0600      0.0000      0.0000
+    172.5400   1812.0700      0.0000      0.0000
+    173.2400   1812.0800      0.0000      0.0000
+    173.9500   1812.0900      0.0000      0.0000
+    174.6500   1812.1000      0.0000      0.0000
+    175.3600   1812.1100      0.0000      0.0000
+    176.0600   1812.1200      0.0000      0.0000
+    176.7700   1812.1300      0.0000      0.0000
+    177.4700   1812.1400      0.0000      0.0000
+    178.1800   1812.1500      0.0000      0.0000
+    178.8800   1812.1600      0.0000      0.0000
+    179.5800   1812.1700      0.0000      0.0000
+    180.2900   1812.1800      0.0000      0.0000
+    180.9900   1812.2000      0.0000      0.0000
+    181.7000   1812.2100      0.0000      0.0000
+    182.4000   1812.2200      0.0000      0.0000
+    183.1100   1812.2300      0.0000      0.0000
+    183.8100   1812.2400      0.0000      0.0000
+    184.5200   1812.2500      0.0000      0.0000
+    185.2200   1812.2600      0.0000      0.0000
+    185.9300   1812.2700      0.0000      0.0000
+    186.6300   1812.2800      0.0000      0.0000
+    187.3400   1812.2900      0.0000      0.0000
+    188.0400   1812.3000      0.0000      0.0000
+    188.7500   1812.3100      0.0000      0.0000
+    189.4500   1812.3200      0.0000      0.0000
+    190.1600   1812.3300      0.0000      0.0000
+    190.8600   1812.3400      0.0000      0.0000
+    191.5600   1812.3600      0.0000      0.0000
+    192.2700   1812.3700      0.0000      0.0000
+    192.9700   1812.3800      0.0000      0.0000
+    193.6800   1812.3900      0.0000      0.0000
+    194.3800   1812.4000      0.0000      0.0000
+    195.0900   1812.4100      0.0000      0.0000
+    195.7900   1812.4200      0.0000      0.0000
+    196.5000   1812.4300      0.0000      0.0000
+    197.2000   1812.4400      0.0000      0.0000
+    197.9100   1812.4500      0.0000      0.0000
+    198.6100   1812.4600      0.0000      0.0000
+    199.3200   1812.4700      0.0000      0.0000
+    200.0200   1812.4800      0.0000      0.0000
+    200.7300   1812.4900      0.0000      0.0000
+    201.4300   1812.5000      0.0000      0.0000
+    202.1400   1812.5100      0.0000      0.0000
+    202.8400   1812.5300      0.0000      0.0000
+    203.5400   1812.5400      0.0000      0.0000
+    204.2500   1812.5500      0.0000      0.0000
+    204.9500   1812.5600      0.0000      0.0000
+    205.6600   1812.5700      0.0000      0.0000
+    206.3600   1812.5800      0.0000      0.0000
+    207.0700   1812.5900      0.0000      0.0000
+    207.7700   1812.6000      0.0000      0.0000
+    208.4800   1812.6100      0.0000      0.0000
+    209.1800   1812.6200      0.0000      0.0000
+    209.8900   1812.6300      0.0000      0.0000
+    210.5900   1812.6400      0.0000      0.0000
+    211.3000   1812.6500      0.0000      0.0000
+    212.0000   1812.6600      0.0000      0.0000
+    212.7100   1812.6700      0.0000      0.0000
+    213.4100   1812.6800      0.0000      0.0000
+    214.1200   1812.7000      0.0000      0.0000
+    214.8200   1812.7100      0.0000      0.0000
+    215.5200   1812.7200      0.0000      0.0000
+    216.2300   1812.7300      0.0000      0.0000
+    216.9300   1812.7400      0.0000      0.0000
+    217.6400   1812.7500      0.0000      0.0000
+    218.3400   1812.7600      0.0000      0.0000
+    219.0500   1812.7700      0.0000      0.0000
+    219.7500   1812.7800      0.0000      0.0000
+    220.4600   1812.7900      0.0000      0.0000
+    221.1600   1812.8000      0.0000      0.0000
+    221.8700   1812.8100      0.0000      0.0000
+    222.5700   1812.8200      0.0000      0.0000
+    223.2800   1812.8300      0.0000      0.0000
+    223.9800   1812.8400      0.0000      0.0000
+    224.6900   1812.8600      0.0000      0.0000
+    225.3900   1812.8700      0.0000      0.0000
+    226.1000   1812.8800      0.0000      0.0000
+    226.8000   1812.8900      0.0000      0.0000
+    227.5000   1812.9000      0.0000      0.0000
+    228.2100   1812.9100      0.0000      0.0000
+    228.9100   1812.9200      0.0000      0.0000
+    229.6200   1812.9300      0.0000      0.0000
+    230.3200   1812.9400      0.0000      0.0000
+    231.0300   1812.9500      0.0000      0.0000
+    231.7300   1812.9600      0.0000      0.0000
+    232.4400   1812.9700      0.0000      0.0000
+    233.1400   1812.9800      0.0000      0.0000
+    233.8500   1812.9900      0.0000      0.0000
+    234.5500   1813.0000      0.0000      0.0000
+    235.2600   1813.0100      0.0000      0.0000
+    235.9600   1813.0300      0.0000      0.0000
+    236.6700   1813.0400      0.0000      0.0000
+    237.3700   1813.0500      0.0000      0.0000
+    238.0800   1813.0600      0.0000      0.0000
+    238.7800   1813.0700      0.0000      0.0000
+    239.4800   1813.0800      0.0000      0.0000
+    240.1900   1813.0900      0.0000      0.0000
+    240.8900   1813.1000      0.0000      0.0000
+    241.6000   1813.1100      0.0000      0.0000
+    242.3000   1813.1200      0.0000      0.0000
+    243.0100   1813.1300      0.0000      0.0000
+    243.7100   1813.1400      0.0000      0.0000
+    244.4200   1813.1500      0.0000      0.0000
+    245.1200   1813.1600      0.0000      0.0000
+    245.8300   1813.1700      0.0000      0.0000
+    246.5300   1813.1800      0.0000      0.0000
+    247.2400   1813.2000      0.0000      0.0000
+    247.9400   1813.2100      0.0000      0.0000
+    248.6500   1813.2200      0.0000      0.0000
+    249.3500   1813.2300      0.0000      0.0000
+    250.0500   1813.2400      0.0000      0.0000
+    250.7600   1813.2500      0.0000      0.0000
+    251.4600   1813.2600      0.0000      0.0000
+    252.1700   1813.2700      0.0000      0.0000
+    252.8700   1813.2800      0.0000      0.0000
+    253.5800   1813.2900      0.0000      0.0000
+    254.2800   1813.3000      0.0000      0.0000
+    254.9900   1813.3100      0.0000      0.0000
+    255.6900   1813.3200      0.0000      0.0000
+    256.4000   1813.3300      0.0000      0.0000
+    257.1000   1813.3400      0.0000      0.0000
+    257.8100   1813.3600      0.0000      0.0000
+    258.5100   1813.3700      0.0000      0.0000
+    259.2200   1813.3800      0.0000      0.0000
+    259.9200   1813.3900      0.0000      0.0000
+    260.6300   1813.4000      0.0000      0.0000
+    261.3300   1813.4100      0.0000      0.0000
+    262.0300   1813.4200      0.0000      0.0000
+    262.7400   1813.4300      0.0000      0.0000
+    263.4400   1813.4400      0.0000      0.0000
+    264.1500   1813.4500      0.0000      0.0000
+    264.8500   1813.4600      0.0000      0.0000
+    265.5600   1813.4700      0.0000      0.0000
+    266.2600   1813.4800      0.0000      0.0000
+    266.9700   1813.4900      0.0000      0.0000
+    267.6700   1813.5000      0.0000      0.0000
+    268.3800   1813.5100      0.0000      0.0000
+    269.0800   1813.5300      0.0000      0.0000
+    269.7900   1813.5400      0.0000      0.0000
+    270.4900   1813.5500      0.0000      0.0000
+    271.2000   1813.5600      0.0000      0.0000
+    271.9000   1813.5700      0.0000      0.0000
+    272.6100   1813.5800      0.0000      0.0000
+    273.3100   1813.5900      0.0000      0.0000
+    274.0100   1813.6000      0.0000      0.0000
+    274.7200   1813.6100      0.0000      0.0000
+    275.4200   1813.6200      0.0000      0.0000
+    276.1300   1813.6300      0.0000      0.0000
+    276.8300   1813.6400      0.0000      0.0000
+    277.5400   1813.6500      0.0000      0.0000
+    278.2400   1813.6600      0.0000      0.0000
+    278.9500   1813.6700      0.0000      0.0000
+    279.6500   1813.6800      0.0000      0.0000
+    280.3600   1813.7000      0.0000      0.0000
+    281.0600   1813.7100      0.0000      0.0000
+    281.7700   1813.7200      0.0000      0.0000
+    282.4700   1813.7300      0.0000      0.0000
+    283.1800   1813.7400      0.0000      0.0000
+    283.8800   1813.7500      0.0000      0.0000
+    284.5900   1813.7600      0.0000      0.0000
+    285.2900   1813.7700      0.0000      0.0000
+    285.9900   1813.7800      0.0000      0.0000
+    286.7000   1813.7900      0.0000      0.0000
+    287.4000   1813.8000      0.0000      0.0000
+    288.1100   1813.8100      0.0000      0.0000
+    288.8100   1813.8200      0.0000      0.0000
+    289.5200   1813.8300      0.0000      0.0000
+    290.2200   1813.8400      0.0000      0.0000
+    290.9300   1813.8600      0.0000      0.0000
+    291.6300   1813.8700      0.0000      0.0000
+    292.3400   1813.8800      0.0000      0.0000
+    293.0400   1813.8900      0.0000      0.0000
+    293.7500   1813.9000      0.0000      0.0000
+    294.4500   1813.9100      0.0000      0.0000
+    295.1600   1813.9200      0.0000      0.0000
+    295.8600   1813.9300      0.0000      0.0000
+    296.5700   1813.9400      0.0000      0.0000
+    297.2700   1813.9500      0.0000      0.0000
+    297.9700   1813.9600      0.0000      0.0000
+    298.6800   1813.9700      0.0000      0.0000
+    299.3800   1813.9800      0.0000      0.0000
+    300.0900   1813.9900      0.0000      0.0000
+    300.7900   1814.0000      0.0000      0.0000
+    301.5000   1814.0100      0.0000      0.0000
@@ -0,0 +1,19 @@
+test_read_store_and_write
+21/9/2011
+19:45:0
+Probe: DigibarPro
+Source: /root/package/data/input/digibarpro/20110921SVP.txt
+      0.7000   1145.6000      0.0000     20.0000
+      1.0000   1266.6000      0.0000     20.0000
+      1.5000   1497.6000     13.5185     20.0000
+      2.0000   1506.2000     21.2532     20.0000
+      2.5000   1505.7000     20.7954     20.0000
+      3.0000   1504.7000     19.8868     20.0000
+      3.5000   1503.7000     16.3757     21.0000
+      4.0000   1502.7000     18.0710     20.0000
+      4.5000   1502.3000     17.7032     20.0000
+      5.0000   1502.1000     17.5156     20.0000
+      5.5000   1501.9000     14.7125     21.0000
+      6.0000   1500.1000     13.0737     21.0000
+      6.5000   1499.5000     15.1520     20.0000
+      7.0000   1123.3000      0.0000     20.0000
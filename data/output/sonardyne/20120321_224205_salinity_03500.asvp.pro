@@ -0,0 +1,40 @@
+test_read_store_and_write
+21/3/2012
+22:42:0
+Probe: ASVP
+Source: /root/package/data/input/asvp/20120321_224205_salinity_03500.asvp
+      0.0000   1531.4000      0.0000      0.0000
+      6.8700   1531.4000      0.0000      0.0000
+     10.0000   1530.1400      0.0000      0.0000
+     20.0000   1530.1900      0.0000      0.0000
+     30.0000   1530.1400      0.0000      0.0000
+     50.0000   1530.1000      0.0000      0.0000
+     75.0000   1529.8600      0.0000      0.0000
+    100.0000   1529.2900      0.0000      0.0000
+    125.0000   1528.0000      0.0000      0.0000
+    150.0000   1525.8000      0.0000      0.0000
+    200.0000   1519.4200      0.0000      0.0000
+    250.0000   1511.4700      0.0000      0.0000
+    300.0000   1503.0900      0.0000      0.0000
+    400.0000   1492.7600      0.0000      0.0000
+    500.0000   1485.8300      0.0000      0.0000
+    600.0000   1482.4900      0.0000      0.0000
+    700.0000   1481.4000      0.0000      0.0000
+    800.0000   1481.6600      0.0000      0.0000
+    900.0000   1481.9400      0.0000      0.0000
+   1000.0000   1482.4100      0.0000      0.0000
+   1100.0000   1483.1100      0.0000      0.0000
+   1200.0000   1483.7400      0.0000      0.0000
+   1300.0000   1484.5400      0.0000      0.0000
+   1400.0000   1485.2700      0.0000      0.0000
+   1500.0000   1486.2000      0.0000      0.0000
+   1750.0000   1488.5200      0.0000      0.0000
+   2000.0000   1491.6500      0.0000      0.0000
+   2500.0000   1508.4900      0.0000      0.0000
+   3000.0000   1506.4000      0.0000      0.0000
+   3500.0000   1514.8700      0.0000      0.0000
+   4000.0000   1523.6600      0.0000      0.0000
+   4500.0000   1532.6600      0.0000      0.0000
+   5000.0000   1541.7900      0.0000      0.0000
+   5500.0000   1550.8700      0.0000      0.0000
+  12000.0000   1675.8200      0.0000      0.0000
@@ -0,0 +1,1585 @@
+test_read_store_and_write
+18/10/2026
+22:50:17
+Probe: ELAC
+Source: /root/package/data/input/elac/20130619_055102.sva
+      0.6700   1531.1900      0.0000      0.0000
+      1.3400   1530.6500      0.0000      0.0000
+      2.0100   1530.4400      0.0000      0.0000
+      2.6800   1530.4000      0.0000      0.0000
+      3.3400   1530.3800      0.0000      0.0000
+      4.0100   1530.3900      0.0000      0.0000
+      4.6800   1530.2900      0.0000      0.0000
+      5.3500   1529.7900      0.0000      0.0000
+      6.0200   1530.5200      0.0000      0.0000
+      6.6900   1530.5100      0.0000      0.0000
+      7.3600   1530.2900      0.0000      0.0000
+      8.0300   1529.6600      0.0000      0.0000
+      8.6900   1528.6400      0.0000      0.0000
+      9.3600   1528.0900      0.0000      0.0000
+     10.0300   1527.6900      0.0000      0.0000
+     10.7000   1527.3200      0.0000      0.0000
+     11.3700   1526.7700      0.0000      0.0000
+     12.0400   1526.2300      0.0000      0.0000
+     12.7000   1525.9400      0.0000      0.0000
+     13.3700   1525.7600      0.0000      0.0000
+     14.0400   1525.6300      0.0000      0.0000
+     14.7100   1525.5400      0.0000      0.0000
+     15.3800   1525.4800      0.0000      0.0000
+     16.0500   1525.4500      0.0000      0.0000
+     16.7100   1525.4300      0.0000      0.0000
+     17.3800   1525.3600      0.0000      0.0000
+     18.0500   1525.2800      0.0000      0.0000
+     18.7200   1525.2100      0.0000      0.0000
+     19.3800   1525.1400      0.0000      0.0000
+     20.0500   1525.0600      0.0000      0.0000
+     20.7200   1525.0000      0.0000      0.0000
+     21.3900   1524.9300      0.0000      0.0000
+     22.0600   1524.9000      0.0000      0.0000
+     22.7200   1524.8400      0.0000      0.0000
+     23.3900   1524.8100      0.0000      0.0000
+     24.0600   1524.7600      0.0000      0.0000
+     24.7300   1524.7000      0.0000      0.0000
+     25.3900   1524.5700      0.0000      0.0000
+     26.0600   1524.4400      0.0000      0.0000
+     26.7300   1524.3700      0.0000      0.0000
+     27.4000   1524.3100      0.0000      0.0000
+     28.0600   1524.2800      0.0000      0.0000
+     28.7300   1524.2500      0.0000      0.0000
+     29.4000   1524.2200      0.0000      0.0000
+     30.0600   1524.1300      0.0000      0.0000
+     30.7300   1524.0600      0.0000      0.0000
+     31.4000   1523.9800      0.0000      0.0000
+     32.0600   1523.9000      0.0000      0.0000
+     32.7300   1523.7600      0.0000      0.0000
+     33.4000   1523.5900      0.0000      0.0000
+     34.0700   1523.4600      0.0000      0.0000
+     34.7300   1523.3900      0.0000      0.0000
+     35.4000   1523.2800      0.0000      0.0000
+     36.0700   1523.1700      0.0000      0.0000
+     36.7300   1523.0700      0.0000      0.0000
+     37.4000   1522.9400      0.0000      0.0000
+     38.0700   1522.8100      0.0000      0.0000
+     38.7300   1522.6800      0.0000      0.0000
+     39.4000   1522.6200      0.0000      0.0000
+     40.0600   1522.5600      0.0000      0.0000
+     40.7300   1522.5200      0.0000      0.0000
+     41.4000   1522.4000      0.0000      0.0000
+     42.0600   1522.2500      0.0000      0.0000
+     42.7300   1522.0900      0.0000      0.0000
+     43.4000   1521.9600      0.0000      0.0000
+     44.0600   1521.8400      0.0000      0.0000
+     44.7300   1521.7200      0.0000      0.0000
+     45.3900   1521.5800      0.0000      0.0000
+     46.0600   1521.4400      0.0000      0.0000
+     46.7300   1521.3300      0.0000      0.0000
+     47.3900   1521.2400      0.0000      0.0000
+     48.0600   1521.1100      0.0000      0.0000
+     48.7200   1521.0400      0.0000      0.0000
+     49.3900   1521.0300      0.0000      0.0000
+     50.0600   1520.9700      0.0000      0.0000
+     50.7200   1520.8500      0.0000      0.0000
+     51.3900   1520.8000      0.0000      0.0000
+     52.0500   1520.6700      0.0000      0.0000
+     52.7200   1520.5400      0.0000      0.0000
+     53.3800   1520.4600      0.0000      0.0000
+     54.0500   1520.4100      0.0000      0.0000
+     54.7100   1520.3500      0.0000      0.0000
+     55.3800   1520.3100      0.0000      0.0000
+     56.0500   1520.2200      0.0000      0.0000
+     56.7100   1520.0800      0.0000      0.0000
+     57.3800   1519.9400      0.0000      0.0000
+     58.0400   1519.7800      0.0000      0.0000
+     58.7100   1519.6000      0.0000      0.0000
+     59.3700   1519.4000      0.0000      0.0000
+     60.0400   1519.2900      0.0000      0.0000
+     60.7000   1519.1400      0.0000      0.0000
+     61.3700   1518.9800      0.0000      0.0000
+     62.0300   1518.8900      0.0000      0.0000
+     62.7000   1518.8500      0.0000      0.0000
+     63.3600   1518.8000      0.0000      0.0000
+     64.0300   1518.7300      0.0000      0.0000
+     64.6900   1518.6300      0.0000      0.0000
+     65.3600   1518.4400      0.0000      0.0000
+     66.0200   1518.2800      0.0000      0.0000
+     66.6900   1518.0600      0.0000      0.0000
+     67.3500   1517.7500      0.0000      0.0000
+     68.0100   1517.5200      0.0000      0.0000
+     68.6800   1517.4200      0.0000      0.0000
+     69.3400   1517.2900      0.0000      0.0000
+     70.0100   1517.1700      0.0000      0.0000
+     70.6700   1517.1300      0.0000      0.0000
+     71.3400   1517.0700      0.0000      0.0000
+     72.0000   1517.0200      0.0000      0.0000
+     72.6600   1516.9900      0.0000      0.0000
+     73.3300   1516.8900      0.0000      0.0000
+     73.9900   1516.4200      0.0000      0.0000
+     74.6600   1515.9100      0.0000      0.0000
+     75.3200   1515.4100      0.0000      0.0000
+     75.9900   1515.0600      0.0000      0.0000
+     76.6500   1514.6800      0.0000      0.0000
+     77.3100   1514.2900      0.0000      0.0000
+     77.9800   1513.8600      0.0000      0.0000
+     78.6400   1513.5500      0.0000      0.0000
+     79.3000   1513.3800      0.0000      0.0000
+     79.9700   1513.2900      0.0000      0.0000
+     80.6300   1513.2900      0.0000      0.0000
+     81.3000   1513.2400      0.0000      0.0000
+     81.9600   1513.2200      0.0000      0.0000
+     82.6200   1513.1500      0.0000      0.0000
+     83.2900   1513.0600      0.0000      0.0000
+     83.9500   1513.0000      0.0000      0.0000
+     84.6100   1512.9400      0.0000      0.0000
+     85.2800   1512.8500      0.0000      0.0000
+     85.9400   1512.7600      0.0000      0.0000
+     86.6000   1512.6700      0.0000      0.0000
+     87.2700   1512.6000      0.0000      0.0000
+     87.9300   1512.6100      0.0000      0.0000
+     88.5900   1512.5900      0.0000      0.0000
+     89.2600   1512.5300      0.0000      0.0000
+     89.9200   1512.4500      0.0000      0.0000
+     90.5800   1512.3800      0.0000      0.0000
+     91.2400   1512.2800      0.0000      0.0000
+     91.9100   1512.2300      0.0000      0.0000
+     92.5700   1512.2000      0.0000      0.0000
+     93.2300   1512.1800      0.0000      0.0000
+     93.9000   1512.1800      0.0000      0.0000
+     94.5600   1512.1500      0.0000      0.0000
+     95.2200   1512.1300      0.0000      0.0000
+     95.8800   1512.0600      0.0000      0.0000
+     96.5500   1511.9700      0.0000      0.0000
+     97.2100   1511.9100      0.0000      0.0000
+     97.8700   1511.8700      0.0000      0.0000
+     98.5300   1511.7800      0.0000      0.0000
+     99.2000   1511.6600      0.0000      0.0000
+     99.8600   1511.5800      0.0000      0.0000
+    100.5200   1511.6400      0.0000      0.0000
+    101.1800   1511.6800      0.0000      0.0000
+    101.8500   1511.6900      0.0000      0.0000
+    102.5100   1511.6000      0.0000      0.0000
+    103.1700   1511.5400      0.0000      0.0000
+    103.8300   1511.4700      0.0000      0.0000
+    104.4900   1511.4200      0.0000      0.0000
+    105.1600   1511.3200      0.0000      0.0000
+    105.8200   1511.1700      0.0000      0.0000
+    106.4800   1510.9900      0.0000      0.0000
+    107.1400   1510.8300      0.0000      0.0000
+    107.8000   1510.7100      0.0000      0.0000
+    108.4700   1510.6700      0.0000      0.0000
+    109.1300   1510.6400      0.0000      0.0000
+    109.7900   1510.6400      0.0000      0.0000
+    110.4500   1510.6700      0.0000      0.0000
+    111.1100   1510.6900      0.0000      0.0000
+    111.7700   1510.7100      0.0000      0.0000
+    112.4400   1510.7200      0.0000      0.0000
+    113.1000   1510.7400      0.0000      0.0000
+    113.7600   1510.7300      0.0000      0.0000
+    114.4200   1510.6900      0.0000      0.0000
+    115.0800   1510.7200      0.0000      0.0000
+    115.7400   1510.7600      0.0000      0.0000
+    116.4000   1510.7800      0.0000      0.0000
+    117.0600   1510.7900      0.0000      0.0000
+    117.7300   1510.8000      0.0000      0.0000
+    118.3900   1510.8000      0.0000      0.0000
+    119.0500   1510.8100      0.0000      0.0000
+    119.7100   1510.8300      0.0000      0.0000
+    120.3700   1510.8400      0.0000      0.0000
+    121.0300   1510.8500      0.0000      0.0000
+    121.6900   1510.8900      0.0000      0.0000
+    122.3500   1510.9300      0.0000      0.0000
+    123.0100   1510.9400      0.0000      0.0000
+    123.6700   1510.9600      0.0000      0.0000
+    124.3400   1510.9600      0.0000      0.0000
+    125.0000   1511.0000      0.0000      0.0000
+    125.6600   1511.0400      0.0000      0.0000
+    126.3200   1511.0700      0.0000      0.0000
+    126.9800   1511.0800      0.0000      0.0000
+    127.6400   1511.0700      0.0000      0.0000
+    128.3000   1511.0900      0.0000      0.0000
+    128.9600   1511.1000      0.0000      0.0000
+    129.6200   1511.1100      0.0000      0.0000
+    130.2800   1511.1000      0.0000      0.0000
+    130.9400   1511.1100      0.0000      0.0000
+    131.6000   1511.1100      0.0000      0.0000
+    132.2600   1511.1100      0.0000      0.0000
+    132.9200   1511.1300      0.0000      0.0000
+    133.5800   1511.1400      0.0000      0.0000
+    134.2400   1511.1400      0.0000      0.0000
+    134.9000   1511.1600      0.0000      0.0000
+    135.5600   1511.1700      0.0000      0.0000
+    136.2200   1511.1800      0.0000      0.0000
+    136.8800   1511.1800      0.0000      0.0000
+    137.5400   1511.2000      0.0000      0.0000
+    138.2000   1511.1900      0.0000      0.0000
+    138.8600   1511.1900      0.0000      0.0000
+    139.5200   1511.1900      0.0000      0.0000
+    140.1800   1511.2000      0.0000      0.0000
+    140.8400   1511.2000      0.0000      0.0000
+    141.5000   1511.2100      0.0000      0.0000
+    142.1600   1511.2300      0.0000      0.0000
+    142.8200   1511.2500      0.0000      0.0000
+    143.4800   1511.2900      0.0000      0.0000
+    144.1400   1511.3300      0.0000      0.0000
+    144.7900   1511.3900      0.0000      0.0000
+    145.4500   1511.4200      0.0000      0.0000
+    146.1100   1511.4400      0.0000      0.0000
+    146.7700   1511.4400      0.0000      0.0000
+    147.4300   1511.4100      0.0000      0.0000
+    148.0900   1511.4100      0.0000      0.0000
+    148.7500   1511.4000      0.0000      0.0000
+    149.4100   1511.4000      0.0000      0.0000
+    150.0700   1511.4200      0.0000      0.0000
+    150.7300   1511.4300      0.0000      0.0000
+    151.3900   1511.4500      0.0000      0.0000
+    152.0400   1511.4600      0.0000      0.0000
+    152.7000   1511.4800      0.0000      0.0000
+    153.3600   1511.5100      0.0000      0.0000
+    154.0200   1511.5400      0.0000      0.0000
+    154.6800   1511.5500      0.0000      0.0000
+    155.3400   1511.6100      0.0000      0.0000
+    156.0000   1511.6300      0.0000      0.0000
+    156.6500   1511.6000      0.0000      0.0000
+    157.3100   1511.6400      0.0000      0.0000
+    157.9700   1511.6700      0.0000      0.0000
+    158.6300   1511.6800      0.0000      0.0000
+    159.2900   1511.6500      0.0000      0.0000
+    159.9500   1511.6600      0.0000      0.0000
+    160.6000   1511.6700      0.0000      0.0000
+    161.2600   1511.7000      0.0000      0.0000
+    161.9200   1511.7100      0.0000      0.0000
+    162.5800   1511.7200      0.0000      0.0000
+    163.2400   1511.7400      0.0000      0.0000
+    163.9000   1511.7400      0.0000      0.0000
+    164.5500   1511.7500      0.0000      0.0000
+    165.2100   1511.7800      0.0000      0.0000
+    165.8700   1511.8100      0.0000      0.0000
+    166.5300   1511.8400      0.0000      0.0000
+    167.1800   1511.8500      0.0000      0.0000
+    167.8400   1511.8600      0.0000      0.0000
+    168.5000   1511.8700      0.0000      0.0000
+    169.1600   1511.8800      0.0000      0.0000
+    169.8200   1511.8900      0.0000      0.0000
+    170.4700   1511.9100      0.0000      0.0000
+    171.1300   1511.9100      0.0000      0.0000
+    171.7900   1511.9000      0.0000      0.0000
+    172.4500   1511.9100      0.0000      0.0000
+    173.1000   1511.9100      0.0000      0.0000
+    173.7600   1511.8900      0.0000      0.0000
+    174.4200   1511.8900      0.0000      0.0000
+    175.0700   1511.9100      0.0000      0.0000
+    175.7300   1511.9300      0.0000      0.0000
+    176.3900   1511.9500      0.0000      0.0000
+    177.0500   1511.9600      0.0000      0.0000
+    177.7000   1511.9800      0.0000      0.0000
+    178.3600   1511.9900      0.0000      0.0000
+    179.0200   1512.0200      0.0000      0.0000
+    179.6700   1512.0500      0.0000      0.0000
+    180.3300   1511.9800      0.0000      0.0000
+    180.9900   1511.8800      0.0000      0.0000
+    181.6400   1511.8600      0.0000      0.0000
+    182.3000   1511.8200      0.0000      0.0000
+    182.9600   1511.7700      0.0000      0.0000
+    183.6100   1511.7300      0.0000      0.0000
+    184.2700   1511.7000      0.0000      0.0000
+    184.9300   1511.7400      0.0000      0.0000
+    185.5800   1511.8000      0.0000      0.0000
+    186.2400   1511.8400      0.0000      0.0000
+    186.9000   1511.8700      0.0000      0.0000
+    187.5500   1511.9000      0.0000      0.0000
+    188.2100   1511.9600      0.0000      0.0000
+    188.8700   1512.0000      0.0000      0.0000
+    189.5200   1512.0400      0.0000      0.0000
+    190.1800   1512.0800      0.0000      0.0000
+    190.8400   1512.2100      0.0000      0.0000
+    191.4900   1512.3100      0.0000      0.0000
+    192.1500   1512.4300      0.0000      0.0000
+    192.8000   1512.5500      0.0000      0.0000
+    193.4600   1512.5900      0.0000      0.0000
+    194.1200   1512.6200      0.0000      0.0000
+    194.7700   1512.6200      0.0000      0.0000
+    195.4300   1512.6100      0.0000      0.0000
+    196.0800   1512.6200      0.0000      0.0000
+    196.7400   1512.6400      0.0000      0.0000
+    197.3900   1512.6700      0.0000      0.0000
+    198.0500   1512.6800      0.0000      0.0000
+    198.7100   1512.6900      0.0000      0.0000
+    199.3600   1512.7000      0.0000      0.0000
+    200.0200   1512.7200      0.0000      0.0000
+    200.6700   1512.7500      0.0000      0.0000
+    201.3300   1512.7600      0.0000      0.0000
+    201.9800   1512.7700      0.0000      0.0000
+    202.6400   1512.7700      0.0000      0.0000
+    203.2900   1512.7800      0.0000      0.0000
+    203.9500   1512.7800      0.0000      0.0000
+    204.6000   1512.8000      0.0000      0.0000
+    205.2600   1512.8100      0.0000      0.0000
+    205.9100   1512.8100      0.0000      0.0000
+    206.5700   1512.8100      0.0000      0.0000
+    207.2200   1512.8300      0.0000      0.0000
+    207.8800   1512.8700      0.0000      0.0000
+    208.5300   1512.9200      0.0000      0.0000
+    209.1900   1512.9500      0.0000      0.0000
+    209.8400   1512.9600      0.0000      0.0000
+    210.5000   1512.9700      0.0000      0.0000
+    211.1500   1512.9800      0.0000      0.0000
+    211.8100   1513.0200      0.0000      0.0000
+    212.4600   1513.0900      0.0000      0.0000
+    213.1200   1513.1000      0.0000      0.0000
+    213.7700   1513.1200      0.0000      0.0000
+    214.4300   1513.1300      0.0000      0.0000
+    215.0800   1513.1500      0.0000      0.0000
+    215.7400   1513.1700      0.0000      0.0000
+    216.3900   1513.1800      0.0000      0.0000
+    217.0400   1513.2000      0.0000      0.0000
+    217.7000   1513.2100      0.0000      0.0000
+    218.3500   1513.2300      0.0000      0.0000
+    219.0100   1513.2300      0.0000      0.0000
+    219.6600   1513.2200      0.0000      0.0000
+    220.3200   1513.2000      0.0000      0.0000
+    220.9700   1513.1800      0.0000      0.0000
+    221.6200   1513.1500      0.0000      0.0000
+    222.2800   1513.1200      0.0000      0.0000
+    222.9300   1513.0900      0.0000      0.0000
+    223.5900   1513.0700      0.0000      0.0000
+    224.2400   1513.0700      0.0000      0.0000
+    224.8900   1513.0600      0.0000      0.0000
+    225.5500   1513.0700      0.0000      0.0000
+    226.2000   1513.0600      0.0000      0.0000
+    226.8500   1513.0400      0.0000      0.0000
+    227.5100   1512.9600      0.0000      0.0000
+    228.1600   1512.9100      0.0000      0.0000
+    228.8200   1512.8700      0.0000      0.0000
+    229.4700   1512.8400      0.0000      0.0000
+    230.1200   1512.7800      0.0000      0.0000
+    230.7800   1512.7200      0.0000      0.0000
+    231.4300   1512.6800      0.0000      0.0000
+    232.0800   1512.6000      0.0000      0.0000
+    232.7400   1512.5800      0.0000      0.0000
+    233.3900   1512.6200      0.0000      0.0000
+    234.0400   1512.6400      0.0000      0.0000
+    234.7000   1512.6500      0.0000      0.0000
+    235.3500   1512.6300      0.0000      0.0000
+    236.0000   1512.5600      0.0000      0.0000
+    236.6500   1512.5000      0.0000      0.0000
+    237.3100   1512.4600      0.0000      0.0000
+    237.9600   1512.4500      0.0000      0.0000
+    238.6100   1512.4400      0.0000      0.0000
+    239.2700   1512.4000      0.0000      0.0000
+    239.9200   1512.4000      0.0000      0.0000
+    240.5700   1512.4000      0.0000      0.0000
+    241.2200   1512.4100      0.0000      0.0000
+    241.8800   1512.4200      0.0000      0.0000
+    242.5300   1512.4000      0.0000      0.0000
+    243.1800   1512.4100      0.0000      0.0000
+    243.8300   1512.4000      0.0000      0.0000
+    244.4900   1512.4000      0.0000      0.0000
+    245.1400   1512.3700      0.0000      0.0000
+    245.7900   1512.3500      0.0000      0.0000
+    246.4400   1512.3400      0.0000      0.0000
+    247.1000   1512.3300      0.0000      0.0000
+    247.7500   1512.3300      0.0000      0.0000
+    248.4000   1512.3500      0.0000      0.0000
+    249.0500   1512.3300      0.0000      0.0000
+    249.7000   1512.3600      0.0000      0.0000
+    250.3600   1512.3700      0.0000      0.0000
+    251.0100   1512.3600      0.0000      0.0000
+    251.6600   1512.3500      0.0000      0.0000
+    252.3100   1512.3500      0.0000      0.0000
+    252.9600   1512.3300      0.0000      0.0000
+    253.6200   1512.3400      0.0000      0.0000
+    254.2700   1512.3500      0.0000      0.0000
+    254.9200   1512.3600      0.0000      0.0000
+    255.5700   1512.3600      0.0000      0.0000
+    256.2200   1512.3800      0.0000      0.0000
+    256.8800   1512.3700      0.0000      0.0000
+    257.5300   1512.3900      0.0000      0.0000
+    258.1800   1512.4000      0.0000      0.0000
+    258.8300   1512.4300      0.0000      0.0000
+    259.4800   1512.4600      0.0000      0.0000
+    260.1300   1512.4800      0.0000      0.0000
+    260.7800   1512.4800      0.0000      0.0000
+    261.4400   1512.4400      0.0000      0.0000
+    262.0900   1512.4200      0.0000      0.0000
+    262.7400   1512.4400      0.0000      0.0000
+    263.3900   1512.4500      0.0000      0.0000
+    264.0400   1512.4300      0.0000      0.0000
+    264.6900   1512.4200      0.0000      0.0000
+    265.3400   1512.3700      0.0000      0.0000
+    265.9900   1512.3200      0.0000      0.0000
+    266.6400   1512.3000      0.0000      0.0000
+    267.2900   1512.3100      0.0000      0.0000
+    267.9500   1512.3200      0.0000      0.0000
+    268.6000   1512.3100      0.0000      0.0000
+    269.2500   1512.3100      0.0000      0.0000
+    269.9000   1512.3000      0.0000      0.0000
+    270.5500   1512.2200      0.0000      0.0000
+    271.2000   1512.0900      0.0000      0.0000
+    271.8500   1511.9400      0.0000      0.0000
+    272.5000   1511.8900      0.0000      0.0000
+    273.1500   1511.8600      0.0000      0.0000
+    273.8000   1511.8200      0.0000      0.0000
+    274.4500   1511.8100      0.0000      0.0000
+    275.1000   1511.8100      0.0000      0.0000
+    275.7500   1511.8300      0.0000      0.0000
+    276.4000   1511.8300      0.0000      0.0000
+    277.0500   1511.8400      0.0000      0.0000
+    277.7000   1511.8400      0.0000      0.0000
+    278.3500   1511.8500      0.0000      0.0000
+    279.0000   1511.8600      0.0000      0.0000
+    279.6500   1511.8700      0.0000      0.0000
+    280.3000   1511.8900      0.0000      0.0000
+    280.9500   1511.8900      0.0000      0.0000
+    281.6000   1511.8800      0.0000      0.0000
+    282.2500   1511.8500      0.0000      0.0000
+    282.9000   1511.8700      0.0000      0.0000
+    283.5500   1511.8700      0.0000      0.0000
+    284.2000   1511.8900      0.0000      0.0000
+    284.8500   1511.9100      0.0000      0.0000
+    285.5000   1511.9200      0.0000      0.0000
+    286.1500   1511.9200      0.0000      0.0000
+    286.8000   1511.9300      0.0000      0.0000
+    287.4500   1511.9200      0.0000      0.0000
+    288.1000   1511.9100      0.0000      0.0000
+    288.7500   1511.9300      0.0000      0.0000
+    289.4000   1511.9400      0.0000      0.0000
+    290.0500   1511.9100      0.0000      0.0000
+    290.7000   1511.9200      0.0000      0.0000
+    291.3500   1511.9300      0.0000      0.0000
+    292.0000   1511.9300      0.0000      0.0000
+    292.6400   1511.9400      0.0000      0.0000
+    293.2900   1511.9400      0.0000      0.0000
+    293.9400   1511.9500      0.0000      0.0000
+    294.5900   1511.9600      0.0000      0.0000
+    295.2400   1511.9700      0.0000      0.0000
+    295.8900   1511.9800      0.0000      0.0000
+    296.5400   1511.9900      0.0000      0.0000
+    297.1900   1512.0000      0.0000      0.0000
+    297.8400   1512.0100      0.0000      0.0000
+    298.4800   1512.0300      0.0000      0.0000
+    299.1300   1512.0500      0.0000      0.0000
+    299.7800   1512.0500      0.0000      0.0000
+    300.4300   1512.0600      0.0000      0.0000
+    301.0800   1512.0700      0.0000      0.0000
+    301.7300   1512.0900      0.0000      0.0000
+    302.3800   1512.1100      0.0000      0.0000
+    303.0200   1512.1200      0.0000      0.0000
+    303.6700   1512.1200      0.0000      0.0000
+    304.3200   1512.1300      0.0000      0.0000
+    304.9700   1512.1400      0.0000      0.0000
+    305.6200   1512.1600      0.0000      0.0000
+    306.2700   1512.1800      0.0000      0.0000
+    306.9100   1512.1900      0.0000      0.0000
+    307.5600   1512.2000      0.0000      0.0000
+    308.2100   1512.2100      0.0000      0.0000
+    308.8600   1512.2300      0.0000      0.0000
+    309.5100   1512.2400      0.0000      0.0000
+    310.1500   1512.2400      0.0000      0.0000
+    310.8000   1512.2500      0.0000      0.0000
+    311.4500   1512.2500      0.0000      0.0000
+    312.1000   1512.2600      0.0000      0.0000
+    312.7400   1512.2800      0.0000      0.0000
+    313.3900   1512.2600      0.0000      0.0000
+    314.0400   1512.2600      0.0000      0.0000
+    314.6900   1512.2800      0.0000      0.0000
+    315.3400   1512.3000      0.0000      0.0000
+    315.9800   1512.3000      0.0000      0.0000
+    316.6300   1512.3000      0.0000      0.0000
+    317.2800   1512.3100      0.0000      0.0000
+    317.9300   1512.3200      0.0000      0.0000
+    318.5700   1512.3300      0.0000      0.0000
+    319.2200   1512.3400      0.0000      0.0000
+    319.8700   1512.3500      0.0000      0.0000
+    320.5100   1512.3600      0.0000      0.0000
+    321.1600   1512.3800      0.0000      0.0000
+    321.8100   1512.3900      0.0000      0.0000
+    322.4600   1512.3900      0.0000      0.0000
+    323.1000   1512.3800      0.0000      0.0000
+    323.7500   1512.4000      0.0000      0.0000
+    324.4000   1512.4100      0.0000      0.0000
+    325.0400   1512.4100      0.0000      0.0000
+    325.6900   1512.4200      0.0000      0.0000
+    326.3400   1512.4300      0.0000      0.0000
+    326.9800   1512.4500      0.0000      0.0000
+    327.6300   1512.4600      0.0000      0.0000
+    328.2800   1512.4700      0.0000      0.0000
+    328.9200   1512.4800      0.0000      0.0000
+    329.5700   1512.4900      0.0000      0.0000
+    330.2200   1512.5000      0.0000      0.0000
+    330.8600   1512.5000      0.0000      0.0000
+    331.5100   1512.5100      0.0000      0.0000
+    332.1600   1512.5200      0.0000      0.0000
+    332.8000   1512.5400      0.0000      0.0000
+    333.4500   1512.5600      0.0000      0.0000
+    334.1000   1512.5700      0.0000      0.0000
+    334.7400   1512.5700      0.0000      0.0000
+    335.3900   1512.5800      0.0000      0.0000
+    336.0300   1512.6000      0.0000      0.0000
+    336.6800   1512.6000      0.0000      0.0000
+    337.3300   1512.6200      0.0000      0.0000
+    337.9700   1512.6300      0.0000      0.0000
+    338.6200   1512.6300      0.0000      0.0000
+    339.2600   1512.6400      0.0000      0.0000
+    339.9100   1512.6500      0.0000      0.0000
+    340.5600   1512.6600      0.0000      0.0000
+    341.2000   1512.6800      0.0000      0.0000
+    341.8500   1512.6900      0.0000      0.0000
+    342.4900   1512.6900      0.0000      0.0000
+    343.1400   1512.7100      0.0000      0.0000
+    343.7800   1512.7300      0.0000      0.0000
+    344.4300   1512.7300      0.0000      0.0000
+    345.0700   1512.7500      0.0000      0.0000
+    345.7200   1512.7500      0.0000      0.0000
+    346.3700   1512.7600      0.0000      0.0000
+    347.0100   1512.7700      0.0000      0.0000
+    347.6600   1512.7800      0.0000      0.0000
+    348.3000   1512.8000      0.0000      0.0000
+    348.9500   1512.8100      0.0000      0.0000
+    349.5900   1512.8300      0.0000      0.0000
+    350.2400   1512.8200      0.0000      0.0000
+    350.8800   1512.8400      0.0000      0.0000
+    351.5300   1512.8500      0.0000      0.0000
+    352.1700   1512.8500      0.0000      0.0000
+    352.8200   1512.8500      0.0000      0.0000
+    353.4600   1512.8700      0.0000      0.0000
+    354.1100   1512.8800      0.0000      0.0000
+    354.7500   1512.8900      0.0000      0.0000
+    355.4000   1512.8800      0.0000      0.0000
+    356.0400   1512.9000      0.0000      0.0000
+    356.6900   1512.9100      0.0000      0.0000
+    357.3300   1512.9200      0.0000      0.0000
+    357.9700   1512.9300      0.0000      0.0000
+    358.6200   1512.9400      0.0000      0.0000
+    359.2600   1512.9500      0.0000      0.0000
+    359.9100   1512.9700      0.0000      0.0000
+    360.5500   1512.9800      0.0000      0.0000
+    361.2000   1512.9900      0.0000      0.0000
+    361.8400   1513.0000      0.0000      0.0000
+    362.4900   1513.0100      0.0000      0.0000
+    363.1300   1513.0200      0.0000      0.0000
+    363.7700   1513.0400      0.0000      0.0000
+    364.4200   1513.0500      0.0000      0.0000
+    365.0600   1513.0800      0.0000      0.0000
+    365.7100   1513.0800      0.0000      0.0000
+    366.3500   1513.0900      0.0000      0.0000
+    366.9900   1513.1100      0.0000      0.0000
+    367.6400   1513.1200      0.0000      0.0000
+    368.2800   1513.1200      0.0000      0.0000
+    368.9300   1513.1500      0.0000      0.0000
+    369.5700   1513.1600      0.0000      0.0000
+    370.2100   1513.1600      0.0000      0.0000
+    370.8600   1513.1800      0.0000      0.0000
+    371.5000   1513.1900      0.0000      0.0000
+    372.1400   1513.1900      0.0000      0.0000
+    372.7900   1513.2000      0.0000      0.0000
+    373.4300   1513.2100      0.0000      0.0000
+    374.0700   1513.2100      0.0000      0.0000
+    374.7200   1513.2300      0.0000      0.0000
+    375.3600   1513.2400      0.0000      0.0000
+    376.0000   1513.2600      0.0000      0.0000
+    376.6500   1513.2700      0.0000      0.0000
+    377.2900   1513.2800      0.0000      0.0000
+    377.9300   1513.2900      0.0000      0.0000
+    378.5800   1513.3000      0.0000      0.0000
+    379.2200   1513.3100      0.0000      0.0000
+    379.8600   1513.3400      0.0000      0.0000
+    380.5100   1513.3500      0.0000      0.0000
+    381.1500   1513.3600      0.0000      0.0000
+    381.7900   1513.3800      0.0000      0.0000
+    382.4400   1513.3900      0.0000      0.0000
+    383.0800   1513.4000      0.0000      0.0000
+    383.7200   1513.4100      0.0000      0.0000
+    384.3600   1513.4200      0.0000      0.0000
+    385.0100   1513.4100      0.0000      0.0000
+    385.6500   1513.4200      0.0000      0.0000
+    386.2900   1513.4300      0.0000      0.0000
+    386.9300   1513.4300      0.0000      0.0000
+    387.5800   1513.4400      0.0000      0.0000
+    388.2200   1513.4300      0.0000      0.0000
+    388.8600   1513.4300      0.0000      0.0000
+    389.5000   1513.4400      0.0000      0.0000
+    390.1500   1513.4300      0.0000      0.0000
+    390.7900   1513.4500      0.0000      0.0000
+    391.4300   1513.4600      0.0000      0.0000
+    392.0700   1513.4600      0.0000      0.0000
+    392.7200   1513.4700      0.0000      0.0000
+    393.3600   1513.4900      0.0000      0.0000
+    394.0000   1513.5000      0.0000      0.0000
+    394.6400   1513.5200      0.0000      0.0000
+    395.2800   1513.5300      0.0000      0.0000
+    395.9300   1513.5300      0.0000      0.0000
+    396.5700   1513.5600      0.0000      0.0000
+    397.2100   1513.5600      0.0000      0.0000
+    397.8500   1513.5700      0.0000      0.0000
+    398.4900   1513.5800      0.0000      0.0000
+    399.1300   1513.6000      0.0000      0.0000
+    399.7800   1513.6000      0.0000      0.0000
+    400.4200   1513.6100      0.0000      0.0000
+    401.0600   1513.6200      0.0000      0.0000
+    401.7000   1513.6200      0.0000      0.0000
+    402.3400   1513.6300      0.0000      0.0000
+    402.9800   1513.6400      0.0000      0.0000
+    403.6300   1513.6600      0.0000      0.0000
+    404.2700   1513.6700      0.0000      0.0000
+    404.9100   1513.6900      0.0000      0.0000
+    405.5500   1513.7000      0.0000      0.0000
+    406.1900   1513.7100      0.0000      0.0000
+    406.8300   1513.7200      0.0000      0.0000
+    407.4700   1513.7300      0.0000      0.0000
+    408.1100   1513.7400      0.0000      0.0000
+    408.7600   1513.7500      0.0000      0.0000
+    409.4000   1513.7700      0.0000      0.0000
+    410.0400   1513.7800      0.0000      0.0000
+    410.6800   1513.7800      0.0000      0.0000
+    411.3200   1513.8000      0.0000      0.0000
+    411.9600   1513.8100      0.0000      0.0000
+    412.6000   1513.8200      0.0000      0.0000
+    413.2400   1513.8300      0.0000      0.0000
+    413.8800   1513.8400      0.0000      0.0000
+    414.5200   1513.8500      0.0000      0.0000
+    415.1600   1513.8700      0.0000      0.0000
+    415.8000   1513.8800      0.0000      0.0000
+    416.4400   1513.8900      0.0000      0.0000
+    417.0800   1513.9000      0.0000      0.0000
+    417.7200   1513.9000      0.0000      0.0000
+    418.3700   1513.9200      0.0000      0.0000
+    419.0100   1513.9300      0.0000      0.0000
+    419.6500   1513.9400      0.0000      0.0000
+    420.2900   1513.9500      0.0000      0.0000
+    420.9300   1513.9600      0.0000      0.0000
+    421.5700   1513.9600      0.0000      0.0000
+    422.2100   1513.9800      0.0000      0.0000
+    422.8500   1514.2100      0.0000      0.0000
+    423.4900   1514.1800      0.0000      0.0000
+    424.1300   1514.1800      0.0000      0.0000
+    424.7700   1514.1900      0.0000      0.0000
+    425.4100   1514.1900      0.0000      0.0000
+    426.0500   1514.2000      0.0000      0.0000
+    426.6900   1514.2100      0.0000      0.0000
+    427.3300   1514.2100      0.0000      0.0000
+    427.9700   1514.2300      0.0000      0.0000
+    428.6000   1514.2300      0.0000      0.0000
+    429.2400   1514.2500      0.0000      0.0000
+    429.8800   1514.2600      0.0000      0.0000
+    430.5200   1514.2600      0.0000      0.0000
+    431.1600   1514.2700      0.0000      0.0000
+    431.8000   1514.2700      0.0000      0.0000
+    432.4400   1514.2800      0.0000      0.0000
+    433.0800   1514.2900      0.0000      0.0000
+    433.7200   1514.3000      0.0000      0.0000
+    434.3600   1514.3100      0.0000      0.0000
+    435.0000   1514.3200      0.0000      0.0000
+    435.6400   1514.3200      0.0000      0.0000
+    436.2800   1514.3400      0.0000      0.0000
+    436.9200   1514.3500      0.0000      0.0000
+    437.5500   1514.3600      0.0000      0.0000
+    438.1900   1514.3700      0.0000      0.0000
+    438.8300   1514.3800      0.0000      0.0000
+    439.4700   1514.3900      0.0000      0.0000
+    440.1100   1514.4000      0.0000      0.0000
+    440.7500   1514.4100      0.0000      0.0000
+    441.3900   1514.4300      0.0000      0.0000
+    442.0300   1514.4300      0.0000      0.0000
+    442.6700   1514.4400      0.0000      0.0000
+    443.3000   1514.4600      0.0000      0.0000
+    443.9400   1514.4600      0.0000      0.0000
+    444.5800   1514.4800      0.0000      0.0000
+    445.2200   1514.4900      0.0000      0.0000
+    445.8600   1514.5000      0.0000      0.0000
+    446.5000   1514.5100      0.0000      0.0000
+    447.1300   1514.5200      0.0000      0.0000
+    447.7700   1514.5300      0.0000      0.0000
+    448.4100   1514.5400      0.0000      0.0000
+    449.0500   1514.5600      0.0000      0.0000
+    449.6900   1514.5600      0.0000      0.0000
+    450.3300   1514.5700      0.0000      0.0000
+    450.9600   1514.5800      0.0000      0.0000
+    451.6000   1514.5900      0.0000      0.0000
+    452.2400   1514.6100      0.0000      0.0000
+    452.8800   1514.6100      0.0000      0.0000
+    453.5200   1514.6300      0.0000      0.0000
+    454.1500   1514.6500      0.0000      0.0000
+    454.7900   1514.6600      0.0000      0.0000
+    455.4300   1514.6800      0.0000      0.0000
+    456.0700   1514.6800      0.0000      0.0000
+    456.7000   1514.7000      0.0000      0.0000
+    457.3400   1514.7100      0.0000      0.0000
+    457.9800   1514.7100      0.0000      0.0000
+    458.6200   1514.7100      0.0000      0.0000
+    459.2500   1514.7200      0.0000      0.0000
+    459.8900   1514.7300      0.0000      0.0000
+    460.5300   1514.7400      0.0000      0.0000
+    461.1700   1514.7500      0.0000      0.0000
+    461.8000   1514.7600      0.0000      0.0000
+    462.4400   1514.7800      0.0000      0.0000
+    463.0800   1514.7800      0.0000      0.0000
+    463.7200   1514.7900      0.0000      0.0000
+    464.3500   1514.8100      0.0000      0.0000
+    464.9900   1514.8200      0.0000      0.0000
+    465.6300   1514.8300      0.0000      0.0000
+    466.2600   1514.8400      0.0000      0.0000
+    466.9000   1514.8500      0.0000      0.0000
+    467.5400   1514.8700      0.0000      0.0000
+    468.1700   1514.8800      0.0000      0.0000
+    468.8100   1514.8900      0.0000      0.0000
+    469.4500   1514.9000      0.0000      0.0000
+    470.0800   1514.9100      0.0000      0.0000
+    470.7200   1514.9200      0.0000      0.0000
+    471.3600   1514.9300      0.0000      0.0000
+    471.9900   1514.9400      0.0000      0.0000
+    472.6300   1514.9500      0.0000      0.0000
+    473.2700   1514.9600      0.0000      0.0000
+    473.9000   1514.9600      0.0000      0.0000
+    474.5400   1514.9800      0.0000      0.0000
+    475.1800   1514.9900      0.0000      0.0000
+    475.8100   1515.0000      0.0000      0.0000
+    476.4500   1515.0200      0.0000      0.0000
+    477.0900   1515.0300      0.0000      0.0000
+    477.7200   1515.0500      0.0000      0.0000
+    478.3600   1515.0500      0.0000      0.0000
+    478.9900   1515.0600      0.0000      0.0000
+    479.6300   1515.0700      0.0000      0.0000
+    480.2700   1515.0800      0.0000      0.0000
+    480.9000   1515.1000      0.0000      0.0000
+    481.5400   1515.1000      0.0000      0.0000
+    482.1700   1515.1200      0.0000      0.0000
+    482.8100   1515.1200      0.0000      0.0000
+    483.4500   1515.1400      0.0000      0.0000
+    484.0800   1515.1500      0.0000      0.0000
+    484.7200   1515.1600      0.0000      0.0000
+    485.3500   1515.1800      0.0000      0.0000
+    485.9900   1515.1900      0.0000      0.0000
+    486.6200   1515.2000      0.0000      0.0000
+    487.2600   1515.2000      0.0000      0.0000
+    487.8900   1515.2100      0.0000      0.0000
+    488.5300   1515.2300      0.0000      0.0000
+    489.1700   1515.2300      0.0000      0.0000
+    489.8000   1515.2500      0.0000      0.0000
+    490.4400   1515.2500      0.0000      0.0000
+    491.0700   1515.2700      0.0000      0.0000
+    491.7100   1515.2800      0.0000      0.0000
+    492.3400   1515.2900      0.0000      0.0000
+    492.9800   1515.3100      0.0000      0.0000
+    493.6100   1515.3200      0.0000      0.0000
+    494.2500   1515.3300      0.0000      0.0000
+    494.8800   1515.3400      0.0000      0.0000
+    495.5200   1515.3500      0.0000      0.0000
+    496.1500   1515.3500      0.0000      0.0000
+    496.7900   1515.3600      0.0000      0.0000
+    497.4200   1515.3600      0.0000      0.0000
+    498.0600   1515.3800      0.0000      0.0000
+    498.6900   1515.3800      0.0000      0.0000
+    499.3200   1515.4000      0.0000      0.0000
+    499.9600   1515.4000      0.0000      0.0000
+    500.5900   1515.4200      0.0000      0.0000
+    501.2300   1515.4400      0.0000      0.0000
+    501.8600   1515.4400      0.0000      0.0000
+    502.5000   1515.4500      0.0000      0.0000
+    503.1300   1515.4700      0.0000      0.0000
+    503.7700   1515.4800      0.0000      0.0000
+    504.4000   1515.4900      0.0000      0.0000
+    505.0300   1515.5100      0.0000      0.0000
+    505.6700   1515.5200      0.0000      0.0000
+    506.3000   1515.5300      0.0000      0.0000
+    506.9400   1515.5300      0.0000      0.0000
+    507.5700   1515.5500      0.0000      0.0000
+    508.2100   1515.5600      0.0000      0.0000
+    508.8400   1515.5500      0.0000      0.0000
+    509.4700   1515.5700      0.0000      0.0000
+    510.1100   1515.5800      0.0000      0.0000
+    510.7400   1515.5900      0.0000      0.0000
+    511.3700   1515.6100      0.0000      0.0000
+    512.0100   1515.6200      0.0000      0.0000
+    512.6400   1515.6200      0.0000      0.0000
+    513.2800   1515.6400      0.0000      0.0000
+    513.9100   1515.6500      0.0000      0.0000
+    514.5400   1515.6600      0.0000      0.0000
+    515.1800   1515.6700      0.0000      0.0000
+    515.8100   1515.6800      0.0000      0.0000
+    516.4400   1515.6900      0.0000      0.0000
+    517.0800   1515.7100      0.0000      0.0000
+    517.7100   1515.7100      0.0000      0.0000
+    518.3400   1515.7200      0.0000      0.0000
+    518.9800   1515.7300      0.0000      0.0000
+    519.6100   1515.7500      0.0000      0.0000
+    520.2400   1515.7600      0.0000      0.0000
+    520.8800   1515.7700      0.0000      0.0000
+    521.5100   1515.7800      0.0000      0.0000
+    522.1400   1515.7900      0.0000      0.0000
+    522.7700   1515.8000      0.0000      0.0000
+    523.4100   1515.8000      0.0000      0.0000
+    524.0400   1515.8200      0.0000      0.0000
+    524.6700   1515.8300      0.0000      0.0000
+    525.3100   1515.8400      0.0000      0.0000
+    525.9400   1515.8400      0.0000      0.0000
+    526.5700   1515.8600      0.0000      0.0000
+    527.2000   1515.8700      0.0000      0.0000
+    527.8400   1515.8800      0.0000      0.0000
+    528.4700   1515.8900      0.0000      0.0000
+    529.1000   1515.9100      0.0000      0.0000
+    529.7300   1515.9200      0.0000      0.0000
+    530.3700   1515.9200      0.0000      0.0000
+    531.0000   1515.9400      0.0000      0.0000
+    531.6300   1515.9400      0.0000      0.0000
+    532.2600   1515.9500      0.0000      0.0000
+    532.9000   1515.9700      0.0000      0.0000
+    533.5300   1515.9800      0.0000      0.0000
+    534.1600   1515.9800      0.0000      0.0000
+    534.7900   1515.9800      0.0000      0.0000
+    535.4300   1515.9900      0.0000      0.0000
+    536.0600   1516.0000      0.0000      0.0000
+    536.6900   1516.0100      0.0000      0.0000
+    537.3200   1516.0200      0.0000      0.0000
+    537.9500   1516.0400      0.0000      0.0000
+    538.5800   1516.0500      0.0000      0.0000
+    539.2200   1516.0700      0.0000      0.0000
+    539.8500   1516.0600      0.0000      0.0000
+    540.4800   1516.0800      0.0000      0.0000
+    541.1100   1516.0800      0.0000      0.0000
+    541.7400   1516.1000      0.0000      0.0000
+    542.3700   1516.1100      0.0000      0.0000
+    543.0100   1516.1400      0.0000      0.0000
+    543.6400   1516.1400      0.0000      0.0000
+    544.2700   1516.1400      0.0000      0.0000
+    544.9000   1516.1600      0.0000      0.0000
+    545.5300   1516.1700      0.0000      0.0000
+    546.1600   1516.1800      0.0000      0.0000
+    546.7900   1516.1800      0.0000      0.0000
+    547.4300   1516.2000      0.0000      0.0000
+    548.0600   1516.2100      0.0000      0.0000
+    548.6900   1516.2200      0.0000      0.0000
+    549.3200   1516.2300      0.0000      0.0000
+    549.9500   1516.2500      0.0000      0.0000
+    550.5800   1516.2600      0.0000      0.0000
+    551.2100   1516.2700      0.0000      0.0000
+    551.8400   1516.2800      0.0000      0.0000
+    552.4700   1516.2900      0.0000      0.0000
+    553.1000   1516.3100      0.0000      0.0000
+    553.7400   1516.3100      0.0000      0.0000
+    554.3700   1516.3200      0.0000      0.0000
+    555.0000   1516.3300      0.0000      0.0000
+    555.6300   1516.3400      0.0000      0.0000
+    556.2600   1516.3600      0.0000      0.0000
+    556.8900   1516.3700      0.0000      0.0000
+    557.5200   1516.3700      0.0000      0.0000
+    558.1500   1516.3900      0.0000      0.0000
+    558.7800   1516.4000      0.0000      0.0000
+    559.4100   1516.4000      0.0000      0.0000
+    560.0400   1516.4200      0.0000      0.0000
+    560.6700   1516.4300      0.0000      0.0000
+    561.3000   1516.4300      0.0000      0.0000
+    561.9300   1516.4500      0.0000      0.0000
+    562.5600   1516.4600      0.0000      0.0000
+    563.1900   1516.4700      0.0000      0.0000
+    563.8200   1516.4800      0.0000      0.0000
+    564.4500   1516.4700      0.0000      0.0000
+    565.0800   1516.5000      0.0000      0.0000
+    565.7100   1516.5000      0.0000      0.0000
+    566.3400   1516.5100      0.0000      0.0000
+    566.9700   1516.5100      0.0000      0.0000
+    567.6000   1516.5300      0.0000      0.0000
+    568.2300   1516.5400      0.0000      0.0000
+    568.8600   1516.5600      0.0000      0.0000
+    569.4900   1516.5700      0.0000      0.0000
+    570.1200   1516.5800      0.0000      0.0000
+    570.7500   1516.5900      0.0000      0.0000
+    571.3800   1516.6000      0.0000      0.0000
+    572.0100   1516.6100      0.0000      0.0000
+    572.6400   1516.6200      0.0000      0.0000
+    573.2700   1516.6200      0.0000      0.0000
+    573.9000   1516.6300      0.0000      0.0000
+    574.5300   1516.6400      0.0000      0.0000
+    575.1600   1516.6500      0.0000      0.0000
+    575.7800   1516.6600      0.0000      0.0000
+    576.4100   1516.6600      0.0000      0.0000
+    577.0400   1516.6800      0.0000      0.0000
+    577.6700   1516.6900      0.0000      0.0000
+    578.3000   1516.7000      0.0000      0.0000
+    578.9300   1516.7100      0.0000      0.0000
+    579.5600   1516.7300      0.0000      0.0000
+    580.1900   1516.7400      0.0000      0.0000
+    580.8200   1516.7600      0.0000      0.0000
+    581.4500   1516.7600      0.0000      0.0000
+    582.0700   1516.7800      0.0000      0.0000
+    582.7000   1516.7900      0.0000      0.0000
+    583.3300   1516.8000      0.0000      0.0000
+    583.9600   1516.8200      0.0000      0.0000
+    584.5900   1516.8200      0.0000      0.0000
+    585.2200   1516.8300      0.0000      0.0000
+    585.8500   1516.8500      0.0000      0.0000
+    586.4700   1516.8600      0.0000      0.0000
+    587.1000   1516.8600      0.0000      0.0000
+    587.7300   1516.8700      0.0000      0.0000
+    588.3600   1516.8800      0.0000      0.0000
+    588.9900   1516.9000      0.0000      0.0000
+    589.6200   1516.9000      0.0000      0.0000
+    590.2400   1516.9000      0.0000      0.0000
+    590.8700   1516.9100      0.0000      0.0000
+    591.5000   1516.9300      0.0000      0.0000
+    592.1300   1516.9300      0.0000      0.0000
+    592.7600   1516.9500      0.0000      0.0000
+    593.3800   1516.9700      0.0000      0.0000
+    594.0100   1516.9800      0.0000      0.0000
+    594.6400   1516.9800      0.0000      0.0000
+    595.2700   1516.9900      0.0000      0.0000
+    595.9000   1517.0100      0.0000      0.0000
+    596.5200   1517.0200      0.0000      0.0000
+    597.1500   1517.0200      0.0000      0.0000
+    597.7800   1517.0300      0.0000      0.0000
+    598.4100   1517.0400      0.0000      0.0000
+    599.0300   1517.0400      0.0000      0.0000
+    599.6600   1517.0500      0.0000      0.0000
+    600.2900   1517.0600      0.0000      0.0000
+    600.9200   1517.0800      0.0000      0.0000
+    601.5400   1517.0900      0.0000      0.0000
+    602.1700   1517.1000      0.0000      0.0000
+    602.8000   1517.1100      0.0000      0.0000
+    603.4200   1517.1200      0.0000      0.0000
+    604.0500   1517.1300      0.0000      0.0000
+    604.6800   1517.1300      0.0000      0.0000
+    605.3100   1517.1500      0.0000      0.0000
+    605.9300   1517.1500      0.0000      0.0000
+    606.5600   1517.1600      0.0000      0.0000
+    607.1900   1517.1700      0.0000      0.0000
+    607.8100   1517.1800      0.0000      0.0000
+    608.4400   1517.2000      0.0000      0.0000
+    609.0700   1517.2100      0.0000      0.0000
+    609.6900   1517.2300      0.0000      0.0000
+    610.3200   1517.2400      0.0000      0.0000
+    610.9500   1517.2600      0.0000      0.0000
+    611.5700   1517.2700      0.0000      0.0000
+    612.2000   1517.2800      0.0000      0.0000
+    612.8300   1517.2900      0.0000      0.0000
+    613.4500   1517.3000      0.0000      0.0000
+    614.0800   1517.3000      0.0000      0.0000
+    614.7100   1517.3200      0.0000      0.0000
+    615.3300   1517.3100      0.0000      0.0000
+    615.9600   1517.3300      0.0000      0.0000
+    616.5900   1517.3300      0.0000      0.0000
+    617.2100   1517.3400      0.0000      0.0000
+    617.8400   1517.3500      0.0000      0.0000
+    618.4600   1517.3800      0.0000      0.0000
+    619.0900   1517.3800      0.0000      0.0000
+    619.7200   1517.4000      0.0000      0.0000
+    620.3400   1517.4100      0.0000      0.0000
+    620.9700   1517.4300      0.0000      0.0000
+    621.5900   1517.4300      0.0000      0.0000
+    622.2200   1517.4400      0.0000      0.0000
+    622.8500   1517.4600      0.0000      0.0000
+    623.4700   1517.4500      0.0000      0.0000
+    624.1000   1517.4700      0.0000      0.0000
+    624.7200   1517.4700      0.0000      0.0000
+    625.3500   1517.4800      0.0000      0.0000
+    625.9700   1517.4800      0.0000      0.0000
+    626.6000   1517.5000      0.0000      0.0000
+    627.2300   1517.5100      0.0000      0.0000
+    627.8500   1517.5200      0.0000      0.0000
+    628.4800   1517.5400      0.0000      0.0000
+    629.1000   1517.5400      0.0000      0.0000
+    629.7300   1517.5500      0.0000      0.0000
+    630.3500   1517.5600      0.0000      0.0000
+    630.9800   1517.5700      0.0000      0.0000
+    631.6000   1517.5800      0.0000      0.0000
+    632.2300   1517.5900      0.0000      0.0000
+    632.8500   1517.6100      0.0000      0.0000
+    633.4800   1517.6200      0.0000      0.0000
+    634.1000   1517.6300      0.0000      0.0000
+    634.7300   1517.6400      0.0000      0.0000
+    635.3500   1517.6600      0.0000      0.0000
+    635.9800   1517.6700      0.0000      0.0000
+    636.6000   1517.6800      0.0000      0.0000
+    637.2300   1517.6800      0.0000      0.0000
+    637.8500   1517.6900      0.0000      0.0000
+    638.4800   1517.6900      0.0000      0.0000
+    639.1000   1517.7100      0.0000      0.0000
+    639.7300   1517.7300      0.0000      0.0000
+    640.3500   1517.7200      0.0000      0.0000
+    640.9800   1517.7300      0.0000      0.0000
+    641.6000   1517.7400      0.0000      0.0000
+    642.2200   1517.7500      0.0000      0.0000
+    642.8500   1517.7600      0.0000      0.0000
+    643.4700   1517.7700      0.0000      0.0000
+    644.1000   1517.7800      0.0000      0.0000
+    644.7200   1517.8000      0.0000      0.0000
+    645.3500   1517.8100      0.0000      0.0000
+    645.9700   1517.8300      0.0000      0.0000
+    646.5900   1517.8400      0.0000      0.0000
+    647.2200   1517.8600      0.0000      0.0000
+    647.8400   1517.8600      0.0000      0.0000
+    648.4700   1517.8800      0.0000      0.0000
+    649.0900   1517.8800      0.0000      0.0000
+    649.7100   1517.8900      0.0000      0.0000
+    650.3400   1517.9000      0.0000      0.0000
+    650.9600   1517.9200      0.0000      0.0000
+    651.5900   1517.9100      0.0000      0.0000
+    652.2100   1517.9200      0.0000      0.0000
+    652.8300   1517.9300      0.0000      0.0000
+    653.4600   1517.9500      0.0000      0.0000
+    654.0800   1517.9600      0.0000      0.0000
+    654.7000   1517.9700      0.0000      0.0000
+    655.3300   1517.9700      0.0000      0.0000
+    655.9500   1517.9800      0.0000      0.0000
+    656.5700   1518.0100      0.0000      0.0000
+    657.2000   1518.0100      0.0000      0.0000
+    657.8200   1518.0200      0.0000      0.0000
+    658.4400   1518.0300      0.0000      0.0000
+    659.0700   1518.0500      0.0000      0.0000
+    659.6900   1518.0400      0.0000      0.0000
+    660.3100   1518.0600      0.0000      0.0000
+    660.9400   1518.0600      0.0000      0.0000
+    661.5600   1518.0700      0.0000      0.0000
+    662.1800   1518.0800      0.0000      0.0000
+    662.8100   1518.0900      0.0000      0.0000
+    663.4300   1518.1000      0.0000      0.0000
+    664.0500   1518.1100      0.0000      0.0000
+    664.6700   1518.1200      0.0000      0.0000
+    665.3000   1518.1400      0.0000      0.0000
+    665.9200   1518.1400      0.0000      0.0000
+    666.5400   1518.1600      0.0000      0.0000
+    667.1600   1518.1700      0.0000      0.0000
+    667.7900   1518.1700      0.0000      0.0000
+    668.4100   1518.1800      0.0000      0.0000
+    669.0300   1518.1900      0.0000      0.0000
+    669.6500   1518.2100      0.0000      0.0000
+    670.2800   1518.2200      0.0000      0.0000
+    670.9000   1518.2200      0.0000      0.0000
+    671.5200   1518.2400      0.0000      0.0000
+    672.1400   1518.2500      0.0000      0.0000
+    672.7700   1518.2600      0.0000      0.0000
+    673.3900   1518.2700      0.0000      0.0000
+    674.0100   1518.2800      0.0000      0.0000
+    674.6300   1518.2900      0.0000      0.0000
+    675.2500   1518.3000      0.0000      0.0000
+    675.8800   1518.3000      0.0000      0.0000
+    676.5000   1518.3200      0.0000      0.0000
+    677.1200   1518.3300      0.0000      0.0000
+    677.7400   1518.3400      0.0000      0.0000
+    678.3600   1518.3500      0.0000      0.0000
+    678.9900   1518.3700      0.0000      0.0000
+    679.6100   1518.3900      0.0000      0.0000
+    680.2300   1518.3900      0.0000      0.0000
+    680.8500   1518.4100      0.0000      0.0000
+    681.4700   1518.4100      0.0000      0.0000
+    682.0900   1518.4400      0.0000      0.0000
+    682.7200   1518.4400      0.0000      0.0000
+    683.3400   1518.4400      0.0000      0.0000
+    683.9600   1518.4600      0.0000      0.0000
+    684.5800   1518.4600      0.0000      0.0000
+    685.2000   1518.4600      0.0000      0.0000
+    685.8200   1518.4800      0.0000      0.0000
+    686.4400   1518.4800      0.0000      0.0000
+    687.0600   1518.5000      0.0000      0.0000
+    687.6900   1518.5100      0.0000      0.0000
+    688.3100   1518.5200      0.0000      0.0000
+    688.9300   1518.5300      0.0000      0.0000
+    689.5500   1518.5400      0.0000      0.0000
+    690.1700   1518.5400      0.0000      0.0000
+    690.7900   1518.5600      0.0000      0.0000
+    691.4100   1518.5700      0.0000      0.0000
+    692.0300   1518.5800      0.0000      0.0000
+    692.6500   1518.5800      0.0000      0.0000
+    693.2700   1518.6000      0.0000      0.0000
+    693.9000   1518.6100      0.0000      0.0000
+    694.5200   1518.6100      0.0000      0.0000
+    695.1400   1518.6300      0.0000      0.0000
+    695.7600   1518.6400      0.0000      0.0000
+    696.3800   1518.6500      0.0000      0.0000
+    697.0000   1518.6600      0.0000      0.0000
+    697.6200   1518.6700      0.0000      0.0000
+    698.2400   1518.6800      0.0000      0.0000
+    698.8600   1518.6800      0.0000      0.0000
+    699.4800   1518.6900      0.0000      0.0000
+    700.1000   1518.7100      0.0000      0.0000
+    700.7200   1518.7100      0.0000      0.0000
+    701.3400   1518.7300      0.0000      0.0000
+    701.9600   1518.7400      0.0000      0.0000
+    702.5800   1518.7500      0.0000      0.0000
+    703.2000   1518.7600      0.0000      0.0000
+    703.8200   1518.7700      0.0000      0.0000
+    704.4400   1518.7800      0.0000      0.0000
+    705.0600   1518.7900      0.0000      0.0000
+    705.6800   1518.8000      0.0000      0.0000
+    706.3000   1518.8200      0.0000      0.0000
+    706.9200   1518.8200      0.0000      0.0000
+    707.5400   1518.8300      0.0000      0.0000
+    708.1600   1518.8400      0.0000      0.0000
+    708.7800   1518.8500      0.0000      0.0000
+    709.4000   1518.8600      0.0000      0.0000
+    710.0200   1518.8700      0.0000      0.0000
+    710.6400   1518.8900      0.0000      0.0000
+    711.2600   1518.8900      0.0000      0.0000
+    711.8800   1518.9100      0.0000      0.0000
+    712.4900   1518.9200      0.0000      0.0000
+    713.1100   1518.9300      0.0000      0.0000
+    713.7300   1518.9400      0.0000      0.0000
+    714.3500   1518.9500      0.0000      0.0000
+    714.9700   1518.9600      0.0000      0.0000
+    715.5900   1518.9600      0.0000      0.0000
+    716.2100   1518.9700      0.0000      0.0000
+    716.8300   1518.9800      0.0000      0.0000
+    717.4500   1518.9900      0.0000      0.0000
+    718.0700   1519.0100      0.0000      0.0000
+    718.6900   1519.0200      0.0000      0.0000
+    719.3000   1519.0300      0.0000      0.0000
+    719.9200   1519.0400      0.0000      0.0000
+    720.5400   1519.0500      0.0000      0.0000
+    721.1600   1519.0600      0.0000      0.0000
+    721.7800   1519.0800      0.0000      0.0000
+    722.4000   1519.0800      0.0000      0.0000
+    723.0200   1519.1000      0.0000      0.0000
+    723.6400   1519.1100      0.0000      0.0000
+    724.2500   1519.1100      0.0000      0.0000
+    724.8700   1519.1200      0.0000      0.0000
+    725.4900   1519.1300      0.0000      0.0000
+    726.1100   1519.1400      0.0000      0.0000
+    726.7300   1519.1500      0.0000      0.0000
+    727.3500   1519.1600      0.0000      0.0000
+    727.9600   1519.1700      0.0000      0.0000
+    728.5800   1519.1800      0.0000      0.0000
+    729.2000   1519.1900      0.0000      0.0000
+    729.8200   1519.2000      0.0000      0.0000
+    730.4400   1519.2100      0.0000      0.0000
+    731.0500   1519.2200      0.0000      0.0000
+    731.6700   1519.2300      0.0000      0.0000
+    732.2900   1519.2400      0.0000      0.0000
+    732.9100   1519.2400      0.0000      0.0000
+    733.5300   1519.2600      0.0000      0.0000
+    734.1400   1519.2800      0.0000      0.0000
+    734.7600   1519.2800      0.0000      0.0000
+    735.3800   1519.2900      0.0000      0.0000
+    736.0000   1519.3100      0.0000      0.0000
+    736.6100   1519.3100      0.0000      0.0000
+    737.2300   1519.3200      0.0000      0.0000
+    737.8500   1519.3300      0.0000      0.0000
+    738.4700   1519.3400      0.0000      0.0000
+    739.0800   1519.3500      0.0000      0.0000
+    739.7000   1519.3700      0.0000      0.0000
+    740.3200   1519.3700      0.0000      0.0000
+    740.9400   1519.3900      0.0000      0.0000
+    741.5500   1519.3900      0.0000      0.0000
+    742.1700   1519.4000      0.0000      0.0000
+    742.7900   1519.4100      0.0000      0.0000
+    743.4000   1519.4100      0.0000      0.0000
+    744.0200   1519.4300      0.0000      0.0000
+    744.6400   1519.4400      0.0000      0.0000
+    745.2600   1519.4600      0.0000      0.0000
+    745.8700   1519.4700      0.0000      0.0000
+    746.4900   1519.4800      0.0000      0.0000
+    747.1100   1519.4900      0.0000      0.0000
+    747.7200   1519.5000      0.0000      0.0000
+    748.3400   1519.5100      0.0000      0.0000
+    748.9600   1519.5200      0.0000      0.0000
+    749.5700   1519.5300      0.0000      0.0000
+    750.1900   1519.5400      0.0000      0.0000
+    750.8100   1519.5500      0.0000      0.0000
+    751.4200   1519.5600      0.0000      0.0000
+    752.0400   1519.5700      0.0000      0.0000
+    752.6600   1519.5800      0.0000      0.0000
+    753.2700   1519.5800      0.0000      0.0000
+    753.8900   1519.6000      0.0000      0.0000
+    754.5000   1519.6100      0.0000      0.0000
+    755.1200   1519.6100      0.0000      0.0000
+    755.7400   1519.6300      0.0000      0.0000
+    756.3500   1519.6400      0.0000      0.0000
+    756.9700   1519.6500      0.0000      0.0000
+    757.5900   1519.6600      0.0000      0.0000
+    758.2000   1519.6700      0.0000      0.0000
+    758.8200   1519.6700      0.0000      0.0000
+    759.4300   1519.6900      0.0000      0.0000
+    760.0500   1519.7000      0.0000      0.0000
+    760.6700   1519.7100      0.0000      0.0000
+    761.2800   1519.7100      0.0000      0.0000
+    761.9000   1519.7200      0.0000      0.0000
+    762.5100   1519.7200      0.0000      0.0000
+    763.1300   1519.7400      0.0000      0.0000
+    763.7400   1519.7600      0.0000      0.0000
+    764.3600   1519.7600      0.0000      0.0000
+    764.9700   1519.7800      0.0000      0.0000
+    765.5900   1519.7900      0.0000      0.0000
+    766.2100   1519.8000      0.0000      0.0000
+    766.8200   1519.8100      0.0000      0.0000
+    767.4400   1519.8300      0.0000      0.0000
+    768.0500   1519.8400      0.0000      0.0000
+    768.6700   1519.8500      0.0000      0.0000
+    769.2800   1519.8600      0.0000      0.0000
+    769.9000   1519.8600      0.0000      0.0000
+    770.5100   1519.8700      0.0000      0.0000
+    771.1300   1519.8800      0.0000      0.0000
+    771.7400   1519.8900      0.0000      0.0000
+    772.3600   1519.9000      0.0000      0.0000
+    772.9700   1519.9100      0.0000      0.0000
+    773.5900   1519.9300      0.0000      0.0000
+    774.2000   1519.9300      0.0000      0.0000
+    774.8200   1519.9500      0.0000      0.0000
+    775.4300   1519.9600      0.0000      0.0000
+    776.0500   1519.9700      0.0000      0.0000
+    776.6600   1519.9800      0.0000      0.0000
+    777.2800   1519.9900      0.0000      0.0000
+    777.8900   1520.0000      0.0000      0.0000
+    778.5000   1520.0100      0.0000      0.0000
+    779.1200   1520.0200      0.0000      0.0000
+    779.7300   1520.0200      0.0000      0.0000
+    780.3500   1520.0300      0.0000      0.0000
+    780.9600   1520.0300      0.0000      0.0000
+    781.5800   1520.0500      0.0000      0.0000
+    782.1900   1520.0600      0.0000      0.0000
+    782.8100   1520.0600      0.0000      0.0000
+    783.4200   1520.0900      0.0000      0.0000
+    784.0300   1520.0900      0.0000      0.0000
+    784.6500   1520.1100      0.0000      0.0000
+    785.2600   1520.1200      0.0000      0.0000
+    785.8800   1520.1300      0.0000      0.0000
+    786.4900   1520.1400      0.0000      0.0000
+    787.1000   1520.1500      0.0000      0.0000
+    787.7200   1520.1600      0.0000      0.0000
+    788.3300   1520.1600      0.0000      0.0000
+    788.9400   1520.1700      0.0000      0.0000
+    789.5600   1520.1900      0.0000      0.0000
+    790.1700   1520.2000      0.0000      0.0000
+    790.7900   1520.2100      0.0000      0.0000
+    791.4000   1520.2200      0.0000      0.0000
+    792.0100   1520.2200      0.0000      0.0000
+    792.6300   1520.2300      0.0000      0.0000
+    793.2400   1520.2400      0.0000      0.0000
+    793.8500   1520.2600      0.0000      0.0000
+    794.4700   1520.2600      0.0000      0.0000
+    795.0800   1520.2700      0.0000      0.0000
+    795.6900   1520.2800      0.0000      0.0000
+    796.3100   1520.2900      0.0000      0.0000
+    796.9200   1520.3000      0.0000      0.0000
+    797.5300   1520.3100      0.0000      0.0000
+    798.1500   1520.3300      0.0000      0.0000
+    798.7600   1520.3400      0.0000      0.0000
+    799.3700   1520.3500      0.0000      0.0000
+    799.9800   1520.3600      0.0000      0.0000
+    800.6000   1520.3700      0.0000      0.0000
+    801.2100   1520.3800      0.0000      0.0000
+    801.8200   1520.3800      0.0000      0.0000
+    802.4400   1520.3900      0.0000      0.0000
+    803.0500   1520.4100      0.0000      0.0000
+    803.6600   1520.4100      0.0000      0.0000
+    804.2700   1520.4200      0.0000      0.0000
+    804.8900   1520.4300      0.0000      0.0000
+    805.5000   1520.4400      0.0000      0.0000
+    806.1100   1520.4500      0.0000      0.0000
+    806.7200   1520.4600      0.0000      0.0000
+    807.3400   1520.4800      0.0000      0.0000
+    807.9500   1520.4900      0.0000      0.0000
+    808.5600   1520.5000      0.0000      0.0000
+    809.1700   1520.5100      0.0000      0.0000
+    809.7900   1520.5300      0.0000      0.0000
+    810.4000   1520.5400      0.0000      0.0000
+    811.0100   1520.5500      0.0000      0.0000
+    811.6200   1520.5600      0.0000      0.0000
+    812.2300   1520.5700      0.0000      0.0000
+    812.8500   1520.5700      0.0000      0.0000
+    813.4600   1520.5800      0.0000      0.0000
+    814.0700   1520.5900      0.0000      0.0000
+    814.6800   1520.5800      0.0000      0.0000
+    815.2900   1520.6000      0.0000      0.0000
+    815.9100   1520.6100      0.0000      0.0000
+    816.5200   1520.6300      0.0000      0.0000
+    817.1300   1520.6400      0.0000      0.0000
+    817.7400   1520.6500      0.0000      0.0000
+    818.3500   1520.6600      0.0000      0.0000
+    818.9600   1520.6800      0.0000      0.0000
+    819.5800   1520.6800      0.0000      0.0000
+    820.1900   1520.6900      0.0000      0.0000
+    820.8000   1520.7000      0.0000      0.0000
+    821.4100   1520.7100      0.0000      0.0000
+    822.0200   1520.7300      0.0000      0.0000
+    822.6300   1520.7300      0.0000      0.0000
+    823.2400   1520.7300      0.0000      0.0000
+    823.8600   1520.7400      0.0000      0.0000
+    824.4700   1520.7500      0.0000      0.0000
+    825.0800   1520.7600      0.0000      0.0000
+    825.6900   1520.7700      0.0000      0.0000
+    826.3000   1520.7900      0.0000      0.0000
+    826.9100   1520.7900      0.0000      0.0000
+    827.5200   1520.8000      0.0000      0.0000
+    828.1300   1520.8200      0.0000      0.0000
+    828.7400   1520.8200      0.0000      0.0000
+    829.3500   1520.8400      0.0000      0.0000
+    829.9700   1520.8600      0.0000      0.0000
+    830.5800   1520.8700      0.0000      0.0000
+    831.1900   1520.8800      0.0000      0.0000
+    831.8000   1520.8900      0.0000      0.0000
+    832.4100   1520.9000      0.0000      0.0000
+    833.0200   1520.9100      0.0000      0.0000
+    833.6300   1520.9200      0.0000      0.0000
+    834.2400   1520.9300      0.0000      0.0000
+    834.8500   1520.9400      0.0000      0.0000
+    835.4600   1520.9400      0.0000      0.0000
+    836.0700   1520.9600      0.0000      0.0000
+    836.6800   1520.9600      0.0000      0.0000
+    837.2900   1520.9800      0.0000      0.0000
+    837.9000   1520.9800      0.0000      0.0000
+    838.5100   1520.9800      0.0000      0.0000
+    839.1200   1521.0000      0.0000      0.0000
+    839.7300   1521.0100      0.0000      0.0000
+    840.3400   1521.0100      0.0000      0.0000
+    840.9500   1521.0200      0.0000      0.0000
+    841.5600   1521.0300      0.0000      0.0000
+    842.1700   1521.0500      0.0000      0.0000
+    842.7800   1521.0600      0.0000      0.0000
+    843.3900   1521.0700      0.0000      0.0000
+    844.0000   1521.0700      0.0000      0.0000
+    844.6100   1521.0900      0.0000      0.0000
+    845.2200   1521.1100      0.0000      0.0000
+    845.8300   1521.1200      0.0000      0.0000
+    846.4400   1521.1200      0.0000      0.0000
+    847.0500   1521.1400      0.0000      0.0000
+    847.6600   1521.1500      0.0000      0.0000
+    848.2700   1521.1600      0.0000      0.0000
+    848.8800   1521.1700      0.0000      0.0000
+    849.4900   1521.1900      0.0000      0.0000
+    850.1000   1521.1900      0.0000      0.0000
+    850.7100   1521.2000      0.0000      0.0000
+    851.3100   1521.2100      0.0000      0.0000
+    851.9200   1521.2000      0.0000      0.0000
+    852.5300   1521.2200      0.0000      0.0000
+    853.1400   1521.2200      0.0000      0.0000
+    853.7500   1521.2300      0.0000      0.0000
+    854.3600   1521.2500      0.0000      0.0000
+    854.9700   1521.2500      0.0000      0.0000
+    855.5800   1521.2600      0.0000      0.0000
+    856.1900   1521.2800      0.0000      0.0000
+    856.8000   1521.2800      0.0000      0.0000
+    857.4000   1521.2900      0.0000      0.0000
+    858.0100   1521.3000      0.0000      0.0000
+    858.6200   1521.3200      0.0000      0.0000
+    859.2300   1521.3200      0.0000      0.0000
+    859.8400   1521.3300      0.0000      0.0000
+    860.4500   1521.3400      0.0000      0.0000
+    861.0600   1521.3500      0.0000      0.0000
+    861.6600   1521.3600      0.0000      0.0000
+    862.2700   1521.3700      0.0000      0.0000
+    862.8800   1521.4000      0.0000      0.0000
+    863.4900   1521.4100      0.0000      0.0000
+    864.1000   1521.4200      0.0000      0.0000
+    864.7100   1521.4400      0.0000      0.0000
+    865.3100   1521.4400      0.0000      0.0000
+    865.9200   1521.4600      0.0000      0.0000
+    866.5300   1521.4700      0.0000      0.0000
+    867.1400   1521.4800      0.0000      0.0000
+    867.7500   1521.4900      0.0000      0.0000
+    868.3500   1521.5000      0.0000      0.0000
+    868.9600   1521.5200      0.0000      0.0000
+    869.5700   1521.5200      0.0000      0.0000
+    870.1800   1521.5300      0.0000      0.0000
+    870.7900   1521.5100      0.0000      0.0000
+    871.3900   1521.5200      0.0000      0.0000
+    872.0000   1521.5400      0.0000      0.0000
+    872.6100   1521.5500      0.0000      0.0000
+    873.2200   1521.5600      0.0000      0.0000
+    873.8200   1521.5800      0.0000      0.0000
+    874.4300   1521.5800      0.0000      0.0000
+    875.0400   1521.6000      0.0000      0.0000
+    875.6500   1521.6000      0.0000      0.0000
+    876.2500   1521.6100      0.0000      0.0000
+    876.8600   1521.6200      0.0000      0.0000
+    877.4700   1521.6200      0.0000      0.0000
+    878.0800   1521.6300      0.0000      0.0000
+    878.6800   1521.6500      0.0000      0.0000
+    879.2900   1521.6500      0.0000      0.0000
+    879.9000   1521.6600      0.0000      0.0000
+    880.5000   1521.6800      0.0000      0.0000
+    881.1100   1521.6800      0.0000      0.0000
+    881.7200   1521.6900      0.0000      0.0000
+    882.3300   1521.7000      0.0000      0.0000
+    882.9300   1521.7200      0.0000      0.0000
+    883.5400   1521.7200      0.0000      0.0000
+    884.1500   1521.7600      0.0000      0.0000
+    884.7500   1521.7700      0.0000      0.0000
+    885.3600   1521.7800      0.0000      0.0000
+    885.9700   1521.7900      0.0000      0.0000
+    886.5700   1521.8000      0.0000      0.0000
+    887.1800   1521.8000      0.0000      0.0000
+    887.7900   1521.8100      0.0000      0.0000
+    888.3900   1521.8100      0.0000      0.0000
+    889.0000   1521.8200      0.0000      0.0000
+    889.6000   1521.8200      0.0000      0.0000
+    890.2100   1521.8300      0.0000      0.0000
+    890.8200   1521.8500      0.0000      0.0000
+    891.4200   1521.8600      0.0000      0.0000
+    892.0300   1521.8600      0.0000      0.0000
+    892.6400   1521.8700      0.0000      0.0000
+    893.2400   1521.8900      0.0000      0.0000
+    893.8500   1521.8900      0.0000      0.0000
+    894.4500   1521.9200      0.0000      0.0000
+    895.0600   1521.9200      0.0000      0.0000
+    895.6700   1521.9500      0.0000      0.0000
+    896.2700   1521.9600      0.0000      0.0000
+    896.8800   1521.9600      0.0000      0.0000
+    897.4800   1521.9800      0.0000      0.0000
+    898.0900   1521.9900      0.0000      0.0000
+    898.7000   1522.0000      0.0000      0.0000
+    899.3000   1522.0100      0.0000      0.0000
+    899.9100   1522.0200      0.0000      0.0000
+    900.5100   1522.0300      0.0000      0.0000
+    901.1200   1522.0400      0.0000      0.0000
+    901.7200   1522.0400      0.0000      0.0000
+    902.3300   1522.0600      0.0000      0.0000
+    902.9300   1522.0500      0.0000      0.0000
+    903.5400   1522.0600      0.0000      0.0000
+    904.1400   1522.0600      0.0000      0.0000
+    904.7500   1522.0800      0.0000      0.0000
+    905.3500   1522.0800      0.0000      0.0000
+    905.9600   1522.1000      0.0000      0.0000
+    906.5700   1522.1100      0.0000      0.0000
+    907.1700   1522.1300      0.0000      0.0000
+    907.7800   1522.1300      0.0000      0.0000
+    908.3800   1522.1500      0.0000      0.0000
+    908.9900   1522.1400      0.0000      0.0000
+    909.5900   1522.1600      0.0000      0.0000
+    910.2000   1522.1700      0.0000      0.0000
+    910.8000   1522.1800      0.0000      0.0000
+    911.4000   1522.1800      0.0000      0.0000
+    912.0100   1522.1900      0.0000      0.0000
+    912.6100   1522.2100      0.0000      0.0000
+    913.2200   1522.2200      0.0000      0.0000
+    913.8200   1522.2500      0.0000      0.0000
+    914.4300   1522.2600      0.0000      0.0000
+    915.0300   1522.2700      0.0000      0.0000
+    915.6400   1522.2800      0.0000      0.0000
+    916.2400   1522.2800      0.0000      0.0000
+    916.8500   1522.2800      0.0000      0.0000
+    917.4500   1522.2900      0.0000      0.0000
+    918.0500   1522.3100      0.0000      0.0000
+    918.6600   1522.3100      0.0000      0.0000
+    919.2600   1522.3300      0.0000      0.0000
+    919.8700   1522.3400      0.0000      0.0000
+    920.4700   1522.3400      0.0000      0.0000
+    921.0700   1522.3500      0.0000      0.0000
+    921.6800   1522.3600      0.0000      0.0000
+    922.2800   1522.3800      0.0000      0.0000
+    922.8900   1522.3800      0.0000      0.0000
+    923.4900   1522.4000      0.0000      0.0000
+    924.0900   1522.4200      0.0000      0.0000
+    924.7000   1522.4300      0.0000      0.0000
+    925.3000   1522.4300      0.0000      0.0000
+    925.9100   1522.4500      0.0000      0.0000
+    926.5100   1522.4600      0.0000      0.0000
+    927.1100   1522.4700      0.0000      0.0000
+    927.7200   1522.4700      0.0000      0.0000
+    928.3200   1522.4900      0.0000      0.0000
+    928.9200   1522.4900      0.0000      0.0000
+    929.5300   1522.5000      0.0000      0.0000
+    930.1300   1522.5100      0.0000      0.0000
+    930.7300   1522.5000      0.0000      0.0000
+    931.3400   1522.5100      0.0000      0.0000
+    931.9400   1522.5200      0.0000      0.0000
+    932.5400   1522.5300      0.0000      0.0000
+    933.1500   1522.5400      0.0000      0.0000
+    933.7500   1522.5600      0.0000      0.0000
+    934.3500   1522.5600      0.0000      0.0000
+    934.9600   1522.5800      0.0000      0.0000
+    935.5600   1522.6000      0.0000      0.0000
+    936.1600   1522.6000      0.0000      0.0000
+    936.7600   1522.6200      0.0000      0.0000
+    937.3700   1522.6300      0.0000      0.0000
+    937.9700   1522.6500      0.0000      0.0000
+    938.5700   1522.6600      0.0000      0.0000
+    939.1800   1522.6600      0.0000      0.0000
+    939.7800   1522.6800      0.0000      0.0000
+    940.3800   1522.6800      0.0000      0.0000
+    940.9800   1522.6800      0.0000      0.0000
+    941.5900   1522.6900      0.0000      0.0000
+    942.1900   1522.6900      0.0000      0.0000
+    942.7900   1522.7000      0.0000      0.0000
+    943.3900   1522.7100      0.0000      0.0000
+    944.0000   1522.7200      0.0000      0.0000
+    944.6000   1522.7300      0.0000      0.0000
+    945.2000   1522.7400      0.0000      0.0000
+    945.8000   1522.7500      0.0000      0.0000
+    946.4000   1522.7700      0.0000      0.0000
+    947.0100   1522.7700      0.0000      0.0000
+    947.6100   1522.7800      0.0000      0.0000
+    948.2100   1522.8000      0.0000      0.0000
+    948.8100   1522.8100      0.0000      0.0000
+    949.4100   1522.8200      0.0000      0.0000
+    950.0200   1522.8300      0.0000      0.0000
+    950.6200   1522.8500      0.0000      0.0000
+    951.2200   1522.8500      0.0000      0.0000
+    951.8200   1522.8800      0.0000      0.0000
+    952.4200   1522.8700      0.0000      0.0000
+    953.0200   1522.8800      0.0000      0.0000
+    953.6300   1522.9100      0.0000      0.0000
+    954.2300   1522.9100      0.0000      0.0000
+    954.8300   1522.9100      0.0000      0.0000
+    955.4300   1522.9200      0.0000      0.0000
+    956.0300   1522.9500      0.0000      0.0000
+    956.6300   1522.9600      0.0000      0.0000
+    957.2400   1522.9600      0.0000      0.0000
+    957.8400   1522.9800      0.0000      0.0000
+    958.4400   1522.9800      0.0000      0.0000
+    959.0400   1522.9800      0.0000      0.0000
+    959.6400   1522.9900      0.0000      0.0000
+    960.2400   1522.9900      0.0000      0.0000
+    960.8400   1523.0000      0.0000      0.0000
+    961.4400   1523.0100      0.0000      0.0000
+    962.0400   1523.0200      0.0000      0.0000
+    962.6500   1523.0300      0.0000      0.0000
+    963.2500   1523.0500      0.0000      0.0000
+    963.8500   1523.0600      0.0000      0.0000
+    964.4500   1523.0600      0.0000      0.0000
+    965.0500   1523.0700      0.0000      0.0000
+    965.6500   1523.0900      0.0000      0.0000
+    966.2500   1523.0900      0.0000      0.0000
+    966.8500   1523.1000      0.0000      0.0000
+    967.4500   1523.1100      0.0000      0.0000
+    968.0500   1523.1200      0.0000      0.0000
+    968.6500   1523.1300      0.0000      0.0000
+    969.2500   1523.1500      0.0000      0.0000
+    969.8500   1523.1600      0.0000      0.0000
+    970.4500   1523.1700      0.0000      0.0000
+    971.0500   1523.1900      0.0000      0.0000
+    971.6500   1523.2100      0.0000      0.0000
+    972.2500   1523.2100      0.0000      0.0000
+    972.8500   1523.2100      0.0000      0.0000
+    973.4500   1523.2200      0.0000      0.0000
+    974.0500   1523.2200      0.0000      0.0000
+    974.6500   1523.2400      0.0000      0.0000
+    975.2500   1523.2400      0.0000      0.0000
+    975.8500   1523.2500      0.0000      0.0000
+    976.4500   1523.2600      0.0000      0.0000
+    977.0500   1523.2700      0.0000      0.0000
+    977.6500   1523.2900      0.0000      0.0000
+    978.2500   1523.3000      0.0000      0.0000
+    978.8500   1523.3200      0.0000      0.0000
+    979.4500   1523.3200      0.0000      0.0000
+    980.0500   1523.3300      0.0000      0.0000
+    980.6500   1523.3500      0.0000      0.0000
+    981.2500   1523.3700      0.0000      0.0000
+    981.8500   1523.3700      0.0000      0.0000
+    982.4500   1523.3900      0.0000      0.0000
+    983.0500   1523.3800      0.0000      0.0000
+    983.6500   1523.4100      0.0000      0.0000
+    984.2500   1523.4100      0.0000      0.0000
+    984.8500   1523.4300      0.0000      0.0000
+    985.4500   1523.4300      0.0000      0.0000
+    986.0500   1523.4300      0.0000      0.0000
+    986.6500   1523.4400      0.0000      0.0000
+    987.2400   1523.4400      0.0000      0.0000
+    987.8400   1523.4500      0.0000      0.0000
+    988.4400   1523.4600      0.0000      0.0000
+    989.0400   1523.4700      0.0000      0.0000
+    989.6400   1523.4800      0.0000      0.0000
+    990.2400   1523.4900      0.0000      0.0000
+    990.8400   1523.4900      0.0000      0.0000
+    991.4400   1523.5100      0.0000      0.0000
+    992.0400   1523.5100      0.0000      0.0000
+    992.6300   1523.5300      0.0000      0.0000
+    993.2300   1523.5400      0.0000      0.0000
+    993.8300   1523.5500      0.0000      0.0000
+    994.4300   1523.5500      0.0000      0.0000
+    995.0300   1523.5700      0.0000      0.0000
+    995.6300   1523.5800      0.0000      0.0000
+    996.2300   1523.6000      0.0000      0.0000
+    996.8200   1523.6200      0.0000      0.0000
+    997.4200   1523.6300      0.0000      0.0000
+    998.0200   1523.6500      0.0000      0.0000
+    998.6200   1523.6500      0.0000      0.0000
+    999.2200   1523.6500      0.0000      0.0000
+    999.8200   1523.6700      0.0000      0.0000
+   1000.4100   1523.6600      0.0000      0.0000
+   2000.0000   1540.6500      0.0000      0.0000
@@ -0,0 +1,212 @@
+test_read_store_and_write
+11/7/2013
+12:49:0
+Probe: SBE
+Source: /root/package/data/input/seabird/2013_192_124923test.cnv
+     -0.0210   1498.3300      0.4061     25.4410
+     -0.0190   1498.3101      0.3922     25.4397
+     -0.0180   1498.2800      0.3646     25.4394
+     -0.0150   1498.2700      0.3542     25.4393
+     -0.0140   1498.1600      0.2852     25.4279
+      0.0030   1501.0900      3.7610     25.0900
+      0.0760   1506.6600      7.8941     25.5085
+      0.1670   1511.2900     10.7463     26.1284
+      0.2560   1513.8199     12.1881     26.5269
+      0.3680   1514.3500     12.1458     26.7616
+      0.4850   1514.6600     12.1188     26.8975
+      0.5740   1514.8199     12.0887     26.9746
+      0.6330   1514.8900     12.0679     27.0134
+      0.6630   1514.9000     12.0432     27.0285
+      0.6730   1514.8700     12.0510     27.0140
+      0.7170   1514.8300     12.0249     27.0082
+      0.7540   1514.8000     12.0033     27.0033
+      0.7850   1514.7900     12.0051     26.9994
+      0.7960   1514.7500     12.0145     26.9791
+      0.7970   1514.5900     12.0211     26.9101
+      0.8010   1514.3500     12.0467     26.8026
+      0.8060   1514.3600     12.0595     26.8001
+      0.8160   1514.4500     12.0607     26.8333
+      0.8190   1514.5300     12.0550     26.8708
+      0.8200   1514.5900     12.0534     26.8939
+      0.8340   1514.7000     12.0571     26.9405
+      0.8360   1514.7000     12.0141     26.9587
+      0.8690   1514.8600     12.0485     27.0081
+      0.8880   1514.8101     12.0036     27.0082
+      0.8890   1514.8101     11.9958     27.0095
+      0.8990   1514.8600     12.0502     27.0056
+      0.9070   1514.8500     12.0315     27.0102
+      0.9090   1514.7800     11.9743     27.0085
+      0.9190   1514.5100     12.0430     26.8686
+      0.9370   1514.5100     12.0136     26.8774
+      0.9510   1515.1200     12.0962     27.0947
+      0.9520   1515.1200     12.0955     27.0953
+      0.9790   1515.1200     12.0956     27.0949
+      0.9910   1515.1200     12.0957     27.0951
+      1.0220   1515.1200     12.0948     27.0950
+      1.0970   1515.1200     12.0904     27.0942
+      1.1890   1515.1200     12.0913     27.0922
+      1.2760   1515.1100     12.0916     27.0904
+      1.3730   1515.1100     12.0901     27.0893
+      1.4900   1515.1100     12.0875     27.0886
+      1.5890   1515.1100     12.0895     27.0879
+      1.6580   1515.1100     12.0893     27.0883
+      1.7280   1515.1100     12.0902     27.0885
+      1.8240   1515.1200     12.0921     27.0895
+      1.9370   1515.1300     12.0919     27.0909
+      2.0720   1515.1300     12.0944     27.0918
+      2.2110   1515.1400     12.0912     27.0933
+      2.3110   1515.1400     12.0902     27.0938
+      2.3400   1515.1400     12.0923     27.0933
+      2.3500   1515.1400     12.0927     27.0938
+      2.3960   1515.1400     12.0947     27.0943
+      2.4670   1515.1500     12.0944     27.0951
+      2.5350   1515.1500     12.0935     27.0958
+      2.6160   1515.1600     12.0982     27.0960
+      2.7250   1515.1801     12.1122     27.0988
+      2.8360   1515.1899     12.1058     27.1061
+      2.9440   1515.1899     12.0979     27.1087
+      3.0360   1515.2000     12.1035     27.1073
+      3.0780   1515.1899     12.0990     27.1069
+      3.0970   1515.1899     12.0997     27.1060
+      3.1490   1515.1899     12.1018     27.1056
+      3.2110   1515.2000     12.1055     27.1063
+      3.2640   1515.2200     12.1142     27.1087
+      3.3220   1515.2200     12.1084     27.1129
+      3.3940   1515.2400     12.1191     27.1148
+      3.4570   1515.2500     12.1168     27.1193
+      3.4860   1515.2500     12.1114     27.1225
+      3.5090   1515.2500     12.1154     27.1223
+      3.5590   1515.2600     12.1155     27.1232
+      3.6300   1515.2600     12.1174     27.1241
+      3.7080   1515.2700     12.1198     27.1255
+      3.7920   1515.2800     12.1215     27.1278
+      3.8900   1515.2900     12.1280     27.1302
+      3.9900   1515.3101     12.1369     27.1347
+      4.0870   1515.3300     12.1377     27.1405
+      4.1560   1515.3400     12.1376     27.1448
+      4.1760   1515.3500     12.1343     27.1476
+      4.1950   1515.3400     12.1308     27.1479
+      4.2870   1515.3400     12.1278     27.1466
+      4.4590   1515.3300     12.1218     27.1445
+      4.6320   1515.3400     12.1323     27.1418
+      4.7610   1515.3500     12.1370     27.1423
+      4.8650   1515.3600     12.1380     27.1450
+      4.9470   1515.3600     12.1360     27.1474
+      5.0210   1515.3600     12.1345     27.1486
+      5.0910   1515.3700     12.1360     27.1482
+      5.1760   1515.3700     12.1417     27.1484
+      5.2720   1515.4200     12.1714     27.1520
+      5.3910   1515.4399     12.1717     27.1622
+      5.5470   1515.4700     12.1764     27.1685
+      5.6970   1515.4800     12.1846     27.1715
+      5.8130   1515.5000     12.1870     27.1749
+      5.9120   1515.5100     12.1884     27.1777
+      6.0140   1515.5100     12.1881     27.1796
+      6.1230   1515.5200     12.1894     27.1809
+      6.2510   1515.5200     12.1887     27.1815
+      6.3980   1515.5300     12.1907     27.1821
+      6.5630   1515.5400     12.1947     27.1823
+      6.6970   1515.5400     12.2011     27.1812
+      6.7970   1515.5400     12.2038     27.1789
+      6.8790   1515.5400     12.2065     27.1766
+      6.9520   1515.5400     12.2076     27.1743
+      7.0100   1515.5300     12.2077     27.1728
+      7.0450   1515.5300     12.2080     27.1720
+      7.0510   1515.5300     12.2079     27.1720
+      7.0550   1515.5300     12.2077     27.1721
+      7.0990   1515.5300     12.2077     27.1722
+      7.1880   1515.5400     12.2079     27.1722
+      7.3460   1515.5400     12.2086     27.1718
+      7.5490   1515.5400     12.2093     27.1714
+      7.7210   1515.5400     12.2095     27.1706
+      7.8650   1515.5400     12.2112     27.1700
+      7.9900   1515.5500     12.2125     27.1693
+      8.0840   1515.5500     12.2138     27.1679
+      8.1450   1515.5500     12.2152     27.1666
+      8.2070   1515.5400     12.2160     27.1654
+      8.2750   1515.5400     12.2169     27.1642
+      8.3490   1515.5400     12.2172     27.1635
+      8.4120   1515.5400     12.2176     27.1631
+      8.4490   1515.5500     12.2196     27.1626
+      8.4600   1515.5400     12.2203     27.1614
+      8.4920   1515.5400     12.2197     27.1606
+      8.5870   1515.5400     12.2206     27.1602
+      8.7470   1515.5500     12.2225     27.1596
+      8.9390   1515.5500     12.2245     27.1585
+      9.1270   1515.5500     12.2256     27.1570
+      9.3040   1515.5500     12.2288     27.1550
+      9.4530   1515.5500     12.2316     27.1522
+      9.5850   1515.5500     12.2336     27.1495
+      9.7000   1515.5500     12.2355     27.1471
+      9.8100   1515.5400     12.2367     27.1451
+      9.9120   1515.5500     12.2380     27.1441
+     10.0100   1515.5500     12.2399     27.1427
+     10.0870   1515.5500     12.2411     27.1417
+     10.1590   1515.5500     12.2424     27.1407
+     10.2500   1515.5500     12.2440     27.1396
+     10.3680   1515.5500     12.2461     27.1392
+     10.5010   1515.5500     12.2476     27.1381
+     10.6340   1515.5500     12.2490     27.1369
+     10.7740   1515.5500     12.2511     27.1357
+     10.9100   1515.5500     12.2535     27.1344
+     11.0320   1515.5500     12.2545     27.1331
+     11.1190   1515.5500     12.2552     27.1321
+     11.1570   1515.5500     12.2558     27.1309
+     11.1610   1515.5500     12.2557     27.1305
+     11.1810   1515.5500     12.2557     27.1305
+     11.2420   1515.5500     12.2555     27.1302
+     11.3500   1515.5500     12.2561     27.1300
+     11.4800   1515.5601     12.2560     27.1299
+     11.6220   1515.5601     12.2566     27.1298
+     11.7520   1515.5601     12.2582     27.1296
+     11.8540   1515.5699     12.2624     27.1289
+     11.9250   1515.5699     12.2653     27.1273
+     11.9610   1515.5601     12.2657     27.1255
+     11.9770   1515.5601     12.2649     27.1246
+     11.9910   1515.5601     12.2661     27.1242
+     12.0230   1515.5601     12.2660     27.1237
+     12.1040   1515.5601     12.2681     27.1233
+     12.2350   1515.5699     12.2700     27.1225
+     12.4250   1515.5699     12.2728     27.1211
+     12.6420   1515.5699     12.2760     27.1190
+     12.8620   1515.5699     12.2816     27.1168
+     13.0370   1515.5800     12.2851     27.1143
+     13.1900   1515.5800     12.2940     27.1115
+     13.3420   1515.5800     12.3008     27.1065
+     13.4990   1515.5800     12.3207     27.0987
+     13.6420   1515.5601     12.3292     27.0852
+     13.8030   1515.5400     12.3335     27.0715
+     13.9720   1515.5100     12.3373     27.0600
+     14.0950   1515.5000     12.3422     27.0494
+     14.1740   1515.4700     12.3460     27.0382
+     14.2030   1515.4600     12.3485     27.0293
+     14.2190   1515.4399     12.3509     27.0233
+     14.2730   1515.4301     12.3522     27.0180
+     14.3830   1515.4301     12.3561     27.0139
+     14.5080   1515.4301     12.3734     27.0057
+     14.6240   1515.4301     12.4138     26.9862
+     14.7200   1515.3600     12.4318     26.9519
+     14.7910   1515.3000     12.4396     26.9235
+     14.8500   1515.2800     12.4498     26.9073
+     14.8980   1515.2600     12.4558     26.8971
+     14.9310   1515.2500     12.4593     26.8904
+     14.9420   1515.2400     12.4617     26.8861
+     14.9680   1515.2300     12.4642     26.8828
+     15.0430   1515.2300     12.4669     26.8805
+     15.1610   1515.2400     12.4748     26.8776
+     15.2970   1515.2500     12.4942     26.8727
+     15.4310   1515.2400     12.5130     26.8629
+     15.5320   1515.2400     12.5347     26.8490
+     15.6090   1515.2100     12.5461     26.8342
+     15.6690   1515.1899     12.5589     26.8210
+     15.7240   1515.1700     12.5622     26.8091
+     15.7890   1515.1600     12.5666     26.8024
+     15.8580   1515.1500     12.5713     26.7972
+     15.9240   1515.1500     12.5749     26.7927
+     15.9570   1514.3000     11.7885     26.7865
+     15.9700   1513.1700     10.8276     26.7404
+     15.9750   1513.1600     11.0247     26.6539
+     15.9780   1512.8500     10.9217     26.5724
+     15.9970   1512.5800     10.8189     26.5069
+     16.0570   1512.1400     10.5007     26.4642
+     16.0880   1511.9100     10.3640     26.4316
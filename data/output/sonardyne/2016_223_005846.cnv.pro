@@ -0,0 +1,782 @@
+test_read_store_and_write
+10/8/2016
+:58:0
+Probe: SBE
+Source: /root/package/data/input/seabird/2016_223_005846.cnv
+      0.0080   1459.5400      0.0069     13.2091
+      0.0100   1459.5300      0.0069     13.2078
+      0.2050   1494.1899     29.1337     13.2782
+      0.5440   1494.1700     30.4426     12.8111
+      0.8650   1493.0300     31.1921     12.2146
+      1.1210   1492.3700     31.6316     11.8685
+      1.2960   1492.0699     31.8661     11.7008
+      1.4340   1491.9399     31.9727     11.6262
+      1.5170   1491.8900     32.0110     11.5986
+      1.5380   1491.8101     31.9513     11.5972
+      1.5630   1491.9301     32.0929     11.5817
+      1.5990   1492.0200     32.0746     11.6140
+      1.6070   1492.1100     32.0752     11.6399
+      1.6390   1491.9700     31.9799     11.6310
+      1.6930   1491.9200     32.0092     11.6075
+      1.7350   1491.9800     32.0960     11.5924
+      1.7560   1491.9900     32.1220     11.5864
+      1.7690   1492.0000     32.1401     11.5831
+      1.8300   1491.9000     32.0141     11.5980
+      1.9310   1491.8800     32.0132     11.5934
+      2.0270   1491.8900     32.0294     11.5891
+      2.1240   1491.9200     32.0574     11.5880
+      2.2240   1491.9301     32.0622     11.5898
+      2.3160   1491.9700     32.0991     11.5878
+      2.3790   1492.0000     32.1290     11.5865
+      2.4130   1492.0200     32.1404     11.5865
+      2.4390   1492.0699     32.1359     11.6024
+      2.4550   1492.1300     32.1192     11.6262
+      2.4730   1492.1500     32.0845     11.6430
+      2.4850   1492.1600     32.0723     11.6488
+      2.6260   1491.7800     32.0027     11.5636
+      2.7140   1491.7700     32.0052     11.5605
+      2.7540   1491.7700     32.0142     11.5578
+      2.7950   1491.6500     32.0061     11.5254
+      2.9910   1491.6500     32.0055     11.5235
+      3.1810   1491.6500     32.0094     11.5209
+      3.3610   1491.6500     32.0110     11.5201
+      3.5360   1491.6400     32.0022     11.5205
+      3.7150   1491.6600     32.0109     11.5210
+      3.8880   1491.6600     32.0119     11.5214
+      4.0630   1491.6700     32.0124     11.5226
+      4.2370   1491.6700     32.0098     11.5238
+      4.4120   1491.6801     32.0087     11.5239
+      4.6060   1491.6801     32.0099     11.5232
+      4.7960   1491.6801     32.0116     11.5231
+      4.9820   1491.6899     32.0107     11.5239
+      5.1570   1491.6899     32.0102     11.5241
+      5.3250   1491.7000     32.0104     11.5243
+      5.4740   1491.7000     32.0107     11.5246
+      5.6300   1491.7000     32.0099     11.5251
+      5.7920   1491.7100     32.0103     11.5253
+      5.9810   1491.7100     32.0095     11.5252
+      6.1840   1491.7100     32.0096     11.5253
+      6.4270   1491.7100     32.0096     11.5250
+      6.7090   1491.7200     32.0107     11.5250
+      7.0210   1491.7300     32.0115     11.5255
+      7.3420   1491.7400     32.0098     11.5264
+      7.6890   1491.7400     32.0098     11.5267
+      8.0390   1491.7500     32.0096     11.5268
+      8.3690   1491.7500     32.0102     11.5269
+      8.6790   1491.7600     32.0110     11.5270
+      8.9660   1491.7600     32.0080     11.5275
+      9.2390   1491.7500     31.9970     11.5267
+      9.4840   1491.6500     31.9375     11.5158
+      9.7060   1491.5500     31.9783     11.4733
+      9.9210   1491.4700     32.0017     11.4414
+     10.1210   1491.3800     31.9751     11.4230
+     10.3270   1491.2400     31.9638     11.3849
+     10.5310   1491.0601     31.9858     11.3248
+     10.7400   1490.8800     32.0549     11.2510
+     10.9420   1490.7400     32.1299     11.1846
+     11.1640   1490.6899     32.1868     11.1481
+     11.3830   1490.6400     32.1980     11.1298
+     11.6060   1490.6000     32.2052     11.1138
+     11.8340   1490.5300     32.1954     11.0976
+     12.0610   1490.4700     32.2048     11.0768
+     12.2960   1490.4399     32.2239     11.0584
+     12.5320   1490.4301     32.2475     11.0478
+     12.7990   1490.4700     32.2764     11.0468
+     13.0700   1490.5100     32.2840     11.0568
+     13.3640   1490.5400     32.2649     11.0695
+     13.6390   1490.5500     32.2545     11.0732
+     13.9200   1490.5400     32.2527     11.0705
+     14.1960   1490.5300     32.2529     11.0663
+     14.4690   1490.5100     32.2468     11.0623
+     14.7180   1490.4301     32.1945     11.0554
+     14.9790   1490.2900     32.1516     11.0283
+     15.2190   1490.1400     32.1663     10.9800
+     15.4670   1490.0300     32.1964     10.9375
+     15.7140   1489.9600     32.2184     10.9101
+     15.9450   1489.9200     32.2281     10.8948
+     16.1790   1489.8800     32.2207     10.8838
+     16.4050   1489.8400     32.2220     10.8699
+     16.6360   1489.8101     32.2324     10.8575
+     16.8600   1489.7800     32.2303     10.8488
+     17.0870   1489.7400     32.2178     10.8402
+     17.3310   1489.6899     32.2168     10.8273
+     17.5910   1489.6300     32.2009     10.8134
+     17.8560   1489.5601     32.1978     10.7941
+     18.1140   1489.4900     32.1961     10.7733
+     18.3900   1489.3500     32.1407     10.7518
+     18.6660   1489.1500     32.1004     10.7079
+     18.9480   1488.9600     32.1286     10.6436
+     19.2290   1488.8199     32.1726     10.5887
+     19.5040   1488.7400     32.1942     10.5565
+     19.7780   1488.7000     32.2136     10.5382
+     20.0430   1488.7000     32.2307     10.5300
+     20.2940   1488.6899     32.2222     10.5300
+     20.5320   1488.6600     32.2017     10.5275
+     20.7690   1488.6000     32.1849     10.5153
+     20.9820   1488.5100     32.1645     10.4955
+     21.2050   1488.3500     32.1187     10.4639
+     21.4260   1488.2100     32.1514     10.4150
+     21.6400   1488.1200     32.1743     10.3799
+     21.8730   1488.0601     32.1821     10.3584
+     22.0970   1488.0100     32.1855     10.3431
+     22.3240   1487.9700     32.1909     10.3308
+     22.5570   1487.9399     32.1894     10.3216
+     22.7850   1487.7800     32.0897     10.3095
+     23.0010   1487.3400     31.9038     10.2488
+     23.2030   1486.8700     31.9302     10.1076
+     23.4110   1486.5000     32.0295      9.9717
+     23.6180   1486.2800     32.1017      9.8847
+     23.8150   1486.1600     32.1361      9.8392
+     24.0240   1486.0900     32.1429      9.8168
+     24.2300   1486.0800     32.1638      9.8068
+     24.4270   1486.0500     32.1528      9.8015
+     24.6700   1486.0000     32.1358      9.7931
+     24.9520   1485.9600     32.1379      9.7780
+     25.2640   1485.9100     32.1437      9.7632
+     25.6180   1485.8600     32.1316      9.7517
+     25.9950   1485.8000     32.1165      9.7367
+     26.3830   1485.7400     32.1284      9.7142
+     26.7870   1485.6700     32.1280      9.6955
+     27.1610   1485.6100     32.1241      9.6778
+     27.5000   1485.5200     32.1082      9.6578
+     27.7920   1485.3900     32.0850      9.6283
+     28.0310   1485.2400     32.0910      9.5834
+     28.2180   1485.1100     32.1207      9.5375
+     28.3610   1485.0200     32.1445      9.5041
+     28.4640   1484.9500     32.1542      9.4819
+     28.5380   1484.9200     32.1741      9.4661
+     28.6130   1484.9000     32.1746      9.4594
+     28.6960   1484.8700     32.1638      9.4549
+     28.7940   1484.8300     32.1641      9.4441
+     28.9330   1484.7900     32.1682      9.4316
+     29.1310   1484.7500     32.1602      9.4204
+     29.4000   1484.6700     32.1385      9.4046
+     29.7140   1484.5300     32.1141      9.3747
+     30.0700   1484.3700     32.1187      9.3279
+     30.4180   1484.1200     32.0725      9.2734
+     30.7720   1483.8500     32.0875      9.1944
+     31.1380   1483.5900     32.1227      9.1091
+     31.4560   1483.3800     32.1685      9.0366
+     31.7500   1483.2200     32.1935      8.9833
+     32.0110   1483.0900     32.2084      8.9425
+     32.2440   1482.9800     32.2263      8.9071
+     32.4480   1482.9000     32.2399      8.8797
+     32.6290   1482.8400     32.2529      8.8596
+     32.7890   1482.7700     32.2384      8.8437
+     32.9530   1482.6801     32.2370      8.8207
+     33.1320   1482.6000     32.2467      8.7945
+     33.3400   1482.5500     32.2685      8.7723
+     33.5420   1482.5100     32.2749      8.7595
+     33.7660   1482.4900     32.2770      8.7519
+     34.0020   1482.4700     32.2750      8.7454
+     34.2490   1482.4301     32.2627      8.7385
+     34.5040   1482.3500     32.2368      8.7235
+     34.7510   1482.2200     32.2314      8.6913
+     34.9930   1482.0900     32.2347      8.6523
+     35.2450   1481.9100     32.2165      8.6090
+     35.4890   1481.7300     32.2355      8.5541
+     35.7350   1481.5601     32.2532      8.5020
+     36.0040   1481.4301     32.2750      8.4583
+     36.2830   1481.3300     32.2967      8.4239
+     36.5630   1481.2500     32.2976      8.4005
+     36.8530   1481.1500     32.2846      8.3772
+     37.1400   1480.9500     32.2310      8.3418
+     37.4290   1480.7200     32.2466      8.2746
+     37.7020   1480.5100     32.2926      8.2017
+     37.9560   1480.3400     32.3227      8.1463
+     38.1890   1480.2000     32.3331      8.1055
+     38.3980   1480.1000     32.3548      8.0694
+     38.5810   1479.9900     32.3569      8.0409
+     38.7500   1479.8900     32.3617      8.0126
+     38.9040   1479.8000     32.3716      7.9840
+     39.0590   1479.6700     32.3580      7.9549
+     39.2090   1479.5800     32.3827      7.9210
+     39.3780   1479.4900     32.3889      7.8948
+     39.5460   1479.3800     32.3710      7.8715
+     39.7340   1479.2800     32.3911      7.8374
+     39.9380   1479.1899     32.4070      7.8092
+     40.1560   1479.1300     32.4134      7.7895
+     40.3930   1479.0699     32.4185      7.7712
+     40.6490   1479.0100     32.4201      7.7538
+     40.9070   1478.9500     32.4204      7.7366
+     41.1900   1478.8700     32.4132      7.7177
+     41.4740   1478.7800     32.4136      7.6921
+     41.7660   1478.6801     32.4183      7.6632
+     42.0710   1478.5900     32.4298      7.6357
+     42.3920   1478.5200     32.4385      7.6110
+     42.7030   1478.4500     32.4523      7.5893
+     43.0020   1478.4100     32.4647      7.5734
+     43.3050   1478.3900     32.4720      7.5632
+     43.5690   1478.3800     32.4775      7.5569
+     43.8130   1478.3700     32.4819      7.5540
+     44.0470   1478.3700     32.4827      7.5528
+     44.2550   1478.3700     32.4812      7.5524
+     44.4320   1478.3800     32.4814      7.5518
+     44.6050   1478.3800     32.4849      7.5513
+     44.7750   1478.3800     32.4815      7.5522
+     44.9420   1478.3800     32.4788      7.5525
+     45.1010   1478.3800     32.4764      7.5514
+     45.2690   1478.3800     32.4807      7.5491
+     45.4480   1478.3800     32.4799      7.5484
+     45.6500   1478.3700     32.4747      7.5480
+     45.8680   1478.3600     32.4707      7.5451
+     46.1140   1478.3300     32.4610      7.5384
+     46.3770   1478.2900     32.4692      7.5262
+     46.6840   1478.2500     32.4663      7.5152
+     46.9870   1478.1899     32.4515      7.5028
+     47.2980   1478.1000     32.4451      7.4803
+     47.5950   1477.9900     32.4487      7.4495
+     47.8970   1477.9000     32.4719      7.4170
+     48.1820   1477.8000     32.4653      7.3911
+     48.4710   1477.6899     32.4667      7.3613
+     48.7520   1477.5800     32.4826      7.3264
+     49.0280   1477.5000     32.5053      7.2963
+     49.3080   1477.4500     32.5241      7.2767
+     49.5640   1477.4200     32.5277      7.2665
+     49.8300   1477.4000     32.5309      7.2598
+     50.0790   1477.3900     32.5337      7.2546
+     50.3060   1477.3800     32.5363      7.2504
+     50.5210   1477.3700     32.5365      7.2475
+     50.7170   1477.3600     32.5366      7.2447
+     50.8930   1477.3600     32.5360      7.2422
+     51.0550   1477.3300     32.5231      7.2385
+     51.2080   1477.2900     32.5195      7.2289
+     51.3690   1477.2200     32.5102      7.2143
+     51.5490   1477.1700     32.5267      7.1934
+     51.7300   1477.1200     32.5344      7.1777
+     51.9500   1477.0900     32.5432      7.1673
+     52.2060   1477.0800     32.5474      7.1610
+     52.4880   1477.0601     32.5435      7.1566
+     52.7840   1477.0400     32.5423      7.1513
+     53.0930   1477.0300     32.5464      7.1451
+     53.3990   1477.0200     32.5495      7.1397
+     53.7030   1477.0100     32.5521      7.1360
+     54.0010   1477.0100     32.5531      7.1338
+     54.2970   1477.0100     32.5532      7.1327
+     54.5800   1477.0100     32.5526      7.1314
+     54.8670   1477.0100     32.5541      7.1299
+     55.1360   1477.0100     32.5521      7.1291
+     55.4140   1477.0000     32.5488      7.1275
+     55.6860   1476.9900     32.5484      7.1244
+     55.9700   1476.9900     32.5512      7.1210
+     56.2530   1476.9900     32.5533      7.1188
+     56.5310   1476.9900     32.5545      7.1180
+     56.7890   1476.9900     32.5525      7.1176
+     57.0430   1476.9900     32.5504      7.1169
+     57.2830   1476.9900     32.5531      7.1143
+     57.4960   1476.9800     32.5519      7.1122
+     57.6590   1476.9700     32.5521      7.1098
+     57.8160   1476.9700     32.5540      7.1068
+     57.9510   1476.9399     32.5411      7.1035
+     58.0830   1476.9200     32.5536      7.0944
+     58.2060   1476.9000     32.5505      7.0879
+     58.3430   1476.8700     32.5450      7.0813
+     58.5180   1476.8400     32.5513      7.0713
+     58.7290   1476.8101     32.5546      7.0622
+     58.9780   1476.7900     32.5550      7.0551
+     59.2490   1476.7600     32.5532      7.0472
+     59.5500   1476.7300     32.5537      7.0372
+     59.8810   1476.6899     32.5560      7.0256
+     60.2220   1476.6600     32.5655      7.0141
+     60.5570   1476.6400     32.5712      7.0065
+     60.8910   1476.6300     32.5717      7.0014
+     61.2340   1476.6200     32.5712      6.9964
+     61.5460   1476.6000     32.5744      6.9899
+     61.8260   1476.5800     32.5716      6.9837
+     62.0810   1476.5400     32.5683      6.9744
+     62.3240   1476.5100     32.5773      6.9617
+     62.5270   1476.4700     32.5812      6.9512
+     62.7050   1476.4500     32.5853      6.9425
+     62.8750   1476.4301     32.5896      6.9351
+     63.0460   1476.4100     32.5922      6.9296
+     63.2230   1476.3800     32.5809      6.9240
+     63.4090   1476.3400     32.5809      6.9125
+     63.6080   1476.3000     32.5934      6.8981
+     63.8120   1476.2800     32.6032      6.8891
+     64.0160   1476.2700     32.6040      6.8850
+     64.2180   1476.2600     32.6041      6.8821
+     64.4290   1476.2600     32.6059      6.8794
+     64.6420   1476.2500     32.6058      6.8774
+     64.8820   1476.2500     32.6055      6.8757
+     65.1290   1476.2200     32.5921      6.8726
+     65.3960   1476.1801     32.5903      6.8620
+     65.6530   1476.1400     32.5990      6.8476
+     65.9450   1476.1100     32.6061      6.8363
+     66.2300   1476.0800     32.6036      6.8283
+     66.5260   1476.0601     32.6075      6.8190
+     66.8080   1476.0300     32.6146      6.8098
+     67.0820   1476.0200     32.6196      6.8034
+     67.3530   1476.0000     32.6149      6.7996
+     67.6050   1475.9900     32.6183      6.7936
+     67.8330   1475.9700     32.6205      6.7881
+     68.0440   1475.9500     32.6178      6.7833
+     68.2660   1475.9301     32.6194      6.7766
+     68.4770   1475.9200     32.6255      6.7696
+     68.6780   1475.9000     32.6277      6.7646
+     68.8890   1475.9000     32.6307      6.7611
+     69.1140   1475.9000     32.6312      6.7595
+     69.3580   1475.8900     32.6308      6.7584
+     69.5840   1475.9000     32.6319      6.7571
+     69.8220   1475.8900     32.6298      6.7562
+     70.0730   1475.8900     32.6273      6.7543
+     70.3070   1475.8700     32.6229      6.7505
+     70.5490   1475.8500     32.6262      6.7439
+     70.7930   1475.8400     32.6312      6.7375
+     71.0220   1475.8199     32.6302      6.7330
+     71.2680   1475.8101     32.6331      6.7281
+     71.5170   1475.8000     32.6356      6.7241
+     71.7730   1475.8000     32.6374      6.7211
+     72.0290   1475.7900     32.6382      6.7191
+     72.2840   1475.7900     32.6382      6.7174
+     72.5470   1475.7900     32.6379      6.7158
+     72.7930   1475.7800     32.6351      6.7134
+     73.0280   1475.7700     32.6377      6.7091
+     73.2480   1475.7600     32.6384      6.7056
+     73.4680   1475.7600     32.6424      6.7023
+     73.6740   1475.7500     32.6410      6.7003
+     73.8630   1475.7400     32.6419      6.6975
+     74.0470   1475.7300     32.6390      6.6945
+     74.2400   1475.7200     32.6390      6.6901
+     74.4150   1475.7000     32.6411      6.6848
+     74.5910   1475.6899     32.6418      6.6798
+     74.7820   1475.6801     32.6458      6.6750
+     74.9790   1475.6700     32.6466      6.6718
+     75.1860   1475.6600     32.6430      6.6689
+     75.4140   1475.6400     32.6414      6.6641
+     75.6630   1475.6200     32.6466      6.6576
+     75.9280   1475.6000     32.6443      6.6524
+     76.2020   1475.5699     32.6345      6.6463
+     76.5070   1475.5400     32.6371      6.6346
+     76.8270   1475.5000     32.6468      6.6213
+     77.1720   1475.4800     32.6533      6.6117
+     77.5070   1475.4600     32.6578      6.6050
+     77.8410   1475.4399     32.6501      6.6000
+     78.1680   1475.4000     32.6445      6.5906
+     78.4640   1475.3600     32.6545      6.5759
+     78.7490   1475.3300     32.6637      6.5644
+     78.9860   1475.3101     32.6701      6.5571
+     79.2060   1475.3101     32.6729      6.5533
+     79.4060   1475.3000     32.6742      6.5511
+     79.5830   1475.3000     32.6754      6.5495
+     79.7440   1475.3000     32.6755      6.5486
+     79.8950   1475.3000     32.6781      6.5477
+     80.0400   1475.3000     32.6758      6.5471
+     80.1890   1475.3000     32.6759      6.5468
+     80.3500   1475.3000     32.6744      6.5460
+     80.5410   1475.2900     32.6755      6.5443
+     80.7540   1475.2900     32.6764      6.5430
+     80.9890   1475.2900     32.6745      6.5422
+     81.2400   1475.2900     32.6768      6.5406
+     81.4950   1475.2900     32.6761      6.5396
+     81.7530   1475.2900     32.6752      6.5382
+     82.0110   1475.2900     32.6751      6.5362
+     82.2740   1475.2800     32.6770      6.5340
+     82.5140   1475.2800     32.6771      6.5323
+     82.7560   1475.2800     32.6776      6.5308
+     83.0050   1475.2800     32.6786      6.5293
+     83.2540   1475.2700     32.6746      6.5277
+     83.5400   1475.2700     32.6754      6.5243
+     83.8360   1475.2600     32.6775      6.5206
+     84.1430   1475.2600     32.6805      6.5178
+     84.4640   1475.2600     32.6797      6.5164
+     84.7940   1475.2400     32.6729      6.5143
+     85.1320   1475.2300     32.6743      6.5084
+     85.4510   1475.2100     32.6802      6.5013
+     85.7630   1475.2000     32.6835      6.4968
+     86.0490   1475.2000     32.6840      6.4937
+     86.2960   1475.1899     32.6850      6.4903
+     86.5030   1475.1801     32.6873      6.4870
+     86.6880   1475.1801     32.6898      6.4845
+     86.8370   1475.1801     32.6902      6.4828
+     86.9600   1475.1700     32.6919      6.4812
+     87.0670   1475.1700     32.6934      6.4803
+     87.1770   1475.1700     32.6936      6.4799
+     87.3140   1475.1700     32.6932      6.4798
+     87.4730   1475.1801     32.6938      6.4795
+     87.6530   1475.1801     32.6911      6.4796
+     87.8660   1475.1700     32.6881      6.4787
+     88.1460   1475.1700     32.6901      6.4764
+     88.4400   1475.1700     32.6888      6.4749
+     88.7400   1475.1700     32.6896      6.4729
+     89.0490   1475.1600     32.6894      6.4711
+     89.3640   1475.1600     32.6907      6.4694
+     89.6660   1475.1600     32.6912      6.4679
+     89.9380   1475.1600     32.6892      6.4666
+     90.1800   1475.1600     32.6916      6.4639
+     90.3970   1475.1600     32.6931      6.4622
+     90.5970   1475.1600     32.6932      6.4612
+     90.7850   1475.1600     32.6951      6.4606
+     90.9510   1475.1600     32.6939      6.4608
+     91.1460   1475.1600     32.6915      6.4603
+     91.3660   1475.1600     32.6931      6.4588
+     91.6040   1475.1600     32.6926      6.4574
+     91.8550   1475.1600     32.6930      6.4559
+     92.1190   1475.1600     32.6939      6.4546
+     92.3920   1475.1600     32.6949      6.4537
+     92.6530   1475.1600     32.6957      6.4531
+     92.8860   1475.1700     32.6969      6.4531
+     93.1140   1475.1700     32.6977      6.4535
+     93.3300   1475.1801     32.6976      6.4538
+     93.5450   1475.1801     32.6956      6.4544
+     93.7470   1475.1899     32.6967      6.4545
+     93.9310   1475.1899     32.6965      6.4547
+     94.1350   1475.1899     32.6977      6.4549
+     94.3370   1475.2000     32.6964      6.4553
+     94.5540   1475.2000     32.6972      6.4555
+     94.7810   1475.2100     32.6954      6.4555
+     95.0250   1475.2100     32.6961      6.4552
+     95.2960   1475.2100     32.6960      6.4550
+     95.5490   1475.2100     32.6964      6.4545
+     95.8030   1475.2200     32.6967      6.4544
+     96.0410   1475.2200     32.6975      6.4545
+     96.2720   1475.2300     32.6974      6.4546
+     96.4930   1475.2300     32.6977      6.4545
+     96.7020   1475.2400     32.6977      6.4546
+     96.8970   1475.2400     32.6989      6.4547
+     97.0900   1475.2500     32.6987      6.4554
+     97.2850   1475.2500     32.6972      6.4559
+     97.4750   1475.2500     32.6967      6.4561
+     97.6710   1475.2600     32.6974      6.4560
+     97.8610   1475.2600     32.6961      6.4561
+     98.0590   1475.2600     32.6968      6.4564
+     98.2670   1475.2700     32.6970      6.4567
+     98.4780   1475.2700     32.6962      6.4573
+     98.6910   1475.2800     32.6963      6.4573
+     98.9170   1475.2800     32.6950      6.4574
+     99.1500   1475.2800     32.6939      6.4566
+     99.3880   1475.2800     32.6955      6.4540
+     99.6210   1475.2700     32.6973      6.4515
+     99.8560   1475.2700     32.6981      6.4494
+    100.0990   1475.2700     32.7000      6.4479
+    100.3390   1475.2600     32.6949      6.4459
+    100.5850   1475.2400     32.6928      6.4408
+    100.8500   1475.2200     32.6954      6.4338
+    101.1120   1475.2000     32.7006      6.4269
+    101.3970   1475.1899     32.7022      6.4218
+    101.6880   1475.1801     32.7050      6.4171
+    101.9640   1475.1700     32.7078      6.4135
+    102.2530   1475.1700     32.7078      6.4114
+    102.5340   1475.1600     32.7072      6.4092
+    102.8050   1475.1600     32.7076      6.4064
+    103.0470   1475.1500     32.7080      6.4037
+    103.2620   1475.1400     32.7098      6.4003
+    103.4500   1475.1400     32.7120      6.3981
+    103.6260   1475.1400     32.7153      6.3968
+    103.7690   1475.1400     32.7135      6.3969
+    103.9040   1475.1400     32.7138      6.3963
+    104.0310   1475.1500     32.7154      6.3960
+    104.1730   1475.1500     32.7146      6.3963
+    104.3300   1475.1500     32.7147      6.3963
+    104.5020   1475.1600     32.7154      6.3968
+    104.6930   1475.1600     32.7138      6.3972
+    104.9150   1475.1600     32.7126      6.3971
+    105.1430   1475.1600     32.7125      6.3961
+    105.3720   1475.1600     32.7099      6.3944
+    105.6100   1475.1500     32.7114      6.3914
+    105.8320   1475.1400     32.7111      6.3882
+    106.0670   1475.1300     32.7141      6.3842
+    106.3050   1475.1300     32.7163      6.3806
+    106.5540   1475.1200     32.7185      6.3779
+    106.8210   1475.1200     32.7211      6.3752
+    107.0800   1475.1200     32.7219      6.3736
+    107.3400   1475.1200     32.7234      6.3718
+    107.5940   1475.1100     32.7238      6.3696
+    107.8520   1475.1100     32.7244      6.3667
+    108.1000   1475.1000     32.7293      6.3628
+    108.3520   1475.1000     32.7317      6.3598
+    108.5910   1475.1000     32.7335      6.3580
+    108.8380   1475.1000     32.7344      6.3571
+    109.0890   1475.1000     32.7346      6.3566
+    109.3470   1475.1000     32.7348      6.3563
+    109.5870   1475.1100     32.7347      6.3561
+    109.8310   1475.1100     32.7352      6.3562
+    110.0580   1475.1100     32.7348      6.3560
+    110.2820   1475.1200     32.7344      6.3561
+    110.4860   1475.1100     32.7312      6.3556
+    110.6970   1475.1100     32.7326      6.3537
+    110.9100   1475.1100     32.7329      6.3521
+    111.1200   1475.1100     32.7350      6.3505
+    111.3420   1475.1100     32.7351      6.3491
+    111.5580   1475.1100     32.7350      6.3475
+    111.7930   1475.1100     32.7382      6.3457
+    112.0480   1475.1100     32.7387      6.3451
+    112.3220   1475.1100     32.7397      6.3448
+    112.6070   1475.1200     32.7400      6.3449
+    112.8890   1475.1200     32.7383      6.3449
+    113.1360   1475.1200     32.7375      6.3444
+    113.3670   1475.1200     32.7385      6.3432
+    113.5800   1475.1200     32.7394      6.3421
+    113.7640   1475.1200     32.7400      6.3414
+    113.9210   1475.1300     32.7415      6.3411
+    114.0440   1475.1300     32.7419      6.3413
+    114.1630   1475.1300     32.7420      6.3419
+    114.2820   1475.1400     32.7418      6.3424
+    114.4140   1475.1400     32.7418      6.3428
+    114.5480   1475.1400     32.7384      6.3431
+    114.7250   1475.1400     32.7395      6.3425
+    114.9380   1475.1400     32.7396      6.3412
+    115.1980   1475.1400     32.7402      6.3405
+    115.4810   1475.1400     32.7371      6.3396
+    115.7830   1475.1400     32.7347      6.3376
+    116.1070   1475.1300     32.7363      6.3338
+    116.4430   1475.1200     32.7385      6.3301
+    116.7680   1475.1200     32.7397      6.3274
+    117.0880   1475.1100     32.7373      6.3248
+    117.3960   1475.1000     32.7383      6.3211
+    117.6940   1475.0900     32.7407      6.3173
+    117.9610   1475.0900     32.7422      6.3142
+    118.2180   1475.0800     32.7405      6.3119
+    118.4710   1475.0699     32.7375      6.3089
+    118.7140   1475.0500     32.7364      6.3033
+    118.9330   1475.0300     32.7395      6.2960
+    119.1350   1475.0100     32.7452      6.2893
+    119.3240   1475.0000     32.7479      6.2850
+    119.5010   1475.0000     32.7496      6.2820
+    119.6560   1474.9900     32.7520      6.2796
+    119.7940   1474.9900     32.7524      6.2784
+    119.9330   1474.9900     32.7508      6.2773
+    120.0750   1474.9800     32.7526      6.2753
+    120.2160   1474.9800     32.7523      6.2738
+    120.3480   1474.9800     32.7541      6.2724
+    120.4850   1474.9700     32.7523      6.2714
+    120.6420   1474.9700     32.7539      6.2699
+    120.8230   1474.9700     32.7551      6.2687
+    121.0230   1474.9700     32.7554      6.2681
+    121.2490   1474.9800     32.7563      6.2679
+    121.4960   1474.9800     32.7546      6.2681
+    121.7790   1474.9800     32.7532      6.2679
+    122.0850   1474.9800     32.7531      6.2669
+    122.4000   1474.9800     32.7529      6.2658
+    122.7270   1474.9800     32.7536      6.2645
+    123.0450   1474.9900     32.7546      6.2632
+    123.3720   1474.9900     32.7550      6.2622
+    123.6970   1474.9900     32.7548      6.2616
+    124.0090   1474.9900     32.7539      6.2608
+    124.3070   1474.9900     32.7536      6.2593
+    124.5850   1474.9800     32.7521      6.2572
+    124.8360   1474.9800     32.7536      6.2541
+    125.0630   1474.9800     32.7570      6.2515
+    125.2670   1474.9800     32.7587      6.2503
+    125.4600   1474.9800     32.7577      6.2502
+    125.6350   1474.9800     32.7587      6.2496
+    125.8020   1474.9800     32.7575      6.2491
+    125.9640   1474.9800     32.7558      6.2482
+    126.1260   1474.9700     32.7551      6.2461
+    126.2780   1474.9600     32.7577      6.2433
+    126.4420   1474.9600     32.7609      6.2413
+    126.6270   1474.9600     32.7616      6.2409
+    126.8360   1474.9700     32.7604      6.2412
+    127.0530   1474.9700     32.7599      6.2407
+    127.2930   1474.9700     32.7592      6.2398
+    127.5510   1474.9700     32.7601      6.2390
+    127.8420   1474.9700     32.7590      6.2383
+    128.1300   1474.9700     32.7595      6.2370
+    128.4120   1474.9700     32.7597      6.2357
+    128.6720   1474.9700     32.7603      6.2348
+    128.9360   1474.9700     32.7593      6.2340
+    129.1880   1474.9700     32.7601      6.2323
+    129.4270   1474.9700     32.7587      6.2308
+    129.6580   1474.9600     32.7549      6.2285
+    129.8800   1474.9500     32.7597      6.2238
+    130.1110   1474.9399     32.7620      6.2203
+    130.3240   1474.9399     32.7641      6.2184
+    130.5440   1474.9399     32.7655      6.2172
+    130.7640   1474.9500     32.7665      6.2171
+    130.9920   1474.9500     32.7643      6.2174
+    131.2190   1474.9500     32.7625      6.2167
+    131.4700   1474.9500     32.7653      6.2151
+    131.7320   1474.9500     32.7651      6.2145
+    132.0050   1474.9500     32.7647      6.2142
+    132.2790   1474.9500     32.7637      6.2134
+    132.5550   1474.9500     32.7642      6.2120
+    132.8410   1474.9500     32.7615      6.2106
+    133.1310   1474.9399     32.7630      6.2077
+    133.3980   1474.9399     32.7650      6.2050
+    133.6640   1474.9301     32.7647      6.2030
+    133.8910   1474.9301     32.7635      6.2010
+    134.1080   1474.9200     32.7620      6.1980
+    134.3100   1474.9100     32.7667      6.1941
+    134.4780   1474.9100     32.7692      6.1916
+    134.6240   1474.9100     32.7703      6.1908
+    134.7740   1474.9100     32.7701      6.1903
+    134.9280   1474.9100     32.7703      6.1901
+    135.0950   1474.9100     32.7709      6.1897
+    135.2690   1474.9200     32.7720      6.1897
+    135.4530   1474.9200     32.7706      6.1904
+    135.6690   1474.9200     32.7697      6.1905
+    135.9130   1474.9301     32.7702      6.1903
+    136.1620   1474.9301     32.7682      6.1899
+    136.4290   1474.9301     32.7693      6.1889
+    136.7060   1474.9301     32.7692      6.1881
+    136.9800   1474.9301     32.7684      6.1873
+    137.2530   1474.9301     32.7690      6.1859
+    137.5330   1474.9301     32.7700      6.1846
+    137.7890   1474.9301     32.7707      6.1836
+    138.0380   1474.9399     32.7718      6.1832
+    138.2760   1474.9399     32.7721      6.1831
+    138.5180   1474.9500     32.7712      6.1834
+    138.7490   1474.9500     32.7706      6.1831
+    138.9910   1474.9500     32.7706      6.1830
+    139.2310   1474.9500     32.7704      6.1824
+    139.4840   1474.9500     32.7701      6.1818
+    139.7260   1474.9600     32.7709      6.1810
+    139.9700   1474.9500     32.7653      6.1805
+    140.2100   1474.9600     32.7722      6.1805
+    140.4390   1474.9700     32.7716      6.1806
+    140.6700   1474.9700     32.7712      6.1806
+    140.8980   1474.9700     32.7720      6.1803
+    141.1110   1474.9800     32.7718      6.1803
+    141.3270   1474.9800     32.7712      6.1802
+    141.5330   1474.9800     32.7721      6.1800
+    141.7460   1474.9900     32.7720      6.1799
+    141.9630   1474.9900     32.7717      6.1799
+    142.1810   1474.9900     32.7718      6.1798
+    142.4000   1475.0000     32.7719      6.1798
+    142.6260   1475.0000     32.7720      6.1796
+    142.8530   1475.0000     32.7715      6.1794
+    143.0680   1475.0000     32.7718      6.1792
+    143.2840   1475.0100     32.7718      6.1792
+    143.4870   1475.0100     32.7718      6.1790
+    143.6830   1475.0100     32.7719      6.1791
+    143.8690   1475.0200     32.7720      6.1791
+    144.0540   1475.0200     32.7719      6.1793
+    144.2450   1475.0200     32.7716      6.1794
+    144.4490   1475.0300     32.7718      6.1792
+    144.6730   1475.0300     32.7724      6.1790
+    144.9070   1475.0300     32.7722      6.1791
+    145.1530   1475.0400     32.7715      6.1792
+    145.4090   1475.0400     32.7700      6.1790
+    145.6710   1475.0400     32.7706      6.1780
+    145.9400   1475.0400     32.7716      6.1770
+    146.2090   1475.0500     32.7723      6.1765
+    146.4710   1475.0500     32.7705      6.1763
+    146.7450   1475.0500     32.7713      6.1755
+    147.0070   1475.0500     32.7700      6.1743
+    147.2490   1475.0500     32.7720      6.1729
+    147.4690   1475.0500     32.7702      6.1718
+    147.6640   1475.0300     32.7646      6.1696
+    147.8400   1475.0100     32.7597      6.1635
+    147.9970   1474.9700     32.7633      6.1528
+    148.1460   1474.9500     32.7757      6.1421
+    148.2910   1474.9301     32.7781      6.1367
+    148.4550   1474.9200     32.7800      6.1325
+    148.6160   1474.9100     32.7790      6.1289
+    148.7760   1474.8900     32.7812      6.1247
+    148.9530   1474.8900     32.7857      6.1209
+    149.1300   1474.8900     32.7862      6.1196
+    149.3220   1474.8800     32.7853      6.1184
+    149.5260   1474.8800     32.7867      6.1169
+    149.7530   1474.8800     32.7872      6.1160
+    150.0080   1474.8800     32.7869      6.1154
+    150.2750   1474.8900     32.7891      6.1148
+    150.5440   1474.8900     32.7862      6.1147
+    150.8270   1474.8900     32.7848      6.1137
+    151.1040   1474.8900     32.7891      6.1117
+    151.3800   1474.8900     32.7883      6.1114
+    151.6360   1474.8900     32.7867      6.1112
+    151.8870   1474.8900     32.7869      6.1100
+    152.1090   1474.8900     32.7877      6.1085
+    152.3260   1474.8900     32.7892      6.1074
+    152.5230   1474.8900     32.7897      6.1067
+    152.7000   1474.9000     32.7899      6.1067
+    152.8670   1474.9000     32.7906      6.1067
+    153.0280   1474.9000     32.7875      6.1066
+    153.1890   1474.9000     32.7879      6.1051
+    153.3620   1474.8900     32.7894      6.1033
+    153.5440   1474.8900     32.7905      6.1021
+    153.7580   1474.9000     32.7911      6.1015
+    153.9740   1474.9000     32.7910      6.1014
+    154.1980   1474.9000     32.7907      6.1010
+    154.4200   1474.9000     32.7890      6.1005
+    154.6400   1474.9000     32.7907      6.0990
+    154.8680   1474.9000     32.7910      6.0982
+    155.0900   1474.9000     32.7920      6.0975
+    155.3010   1474.9000     32.7916      6.0971
+    155.5290   1474.9100     32.7921      6.0967
+    155.7440   1474.9100     32.7922      6.0966
+    155.9640   1474.9100     32.7916      6.0965
+    156.1820   1474.9200     32.7914      6.0964
+    156.3850   1474.9200     32.7917      6.0958
+    156.5850   1474.9200     32.7928      6.0955
+    156.7840   1474.9200     32.7923      6.0956
+    156.9860   1474.9301     32.7922      6.0956
+    157.1750   1474.9301     32.7915      6.0955
+    157.3870   1474.9301     32.7923      6.0950
+    157.6000   1474.9399     32.7926      6.0951
+    157.8380   1474.9399     32.7925      6.0952
+    158.0820   1474.9399     32.7922      6.0951
+    158.3150   1474.9500     32.7919      6.0950
+    158.5460   1474.9500     32.7921      6.0949
+    158.8020   1474.9500     32.7928      6.0945
+    159.0510   1474.9600     32.7917      6.0947
+    159.3170   1474.9600     32.7917      6.0945
+    159.5750   1474.9600     32.7925      6.0940
+    159.8260   1474.9700     32.7924      6.0938
+    160.0590   1474.9700     32.7929      6.0936
+    160.2790   1474.9700     32.7926      6.0935
+    160.4900   1474.9800     32.7925      6.0935
+    160.7010   1474.9800     32.7927      6.0932
+    160.8960   1474.9800     32.7927      6.0931
+    161.0790   1474.9900     32.7927      6.0930
+    161.2470   1474.9900     32.7926      6.0928
+    161.4130   1474.9900     32.7930      6.0926
+    161.5700   1474.9900     32.7931      6.0924
+    161.7320   1475.0000     32.7936      6.0925
+    161.8980   1475.0000     32.7929      6.0927
+    162.0840   1475.0000     32.7930      6.0924
+    162.2780   1475.0000     32.7919      6.0920
+    162.4910   1475.0000     32.7932      6.0913
+    162.7020   1475.0000     32.7928      6.0908
+    162.9310   1475.0000     32.7921      6.0900
+    163.1690   1475.0000     32.7920      6.0892
+    163.4020   1475.0100     32.7933      6.0881
+    163.6390   1475.0000     32.7893      6.0873
+    163.8700   1474.9900     32.7895      6.0844
+    164.1010   1474.9900     32.7942      6.0805
+    164.3180   1474.9900     32.7953      6.0788
+    164.5230   1474.9800     32.7950      6.0777
+    164.7180   1474.9800     32.7950      6.0767
+    164.9210   1474.9800     32.7958      6.0754
+    165.1120   1474.9800     32.7962      6.0743
+    165.3000   1474.9800     32.7968      6.0731
+    165.4790   1474.9800     32.7969      6.0723
+    165.6470   1474.9800     32.7989      6.0715
+    165.8110   1474.9900     32.7999      6.0716
+    165.9680   1474.9900     32.7973      6.0720
+    166.1340   1474.9900     32.7971      6.0716
+    166.3060   1474.9900     32.7980      6.0710
+    166.4920   1474.9900     32.7997      6.0706
+    166.7030   1475.0000     32.8004      6.0716
+    166.9300   1475.0100     32.7973      6.0729
+    167.1940   1475.0100     32.7955      6.0728
+    167.4830   1475.0100     32.7960      6.0716
+    167.7770   1475.0100     32.7981      6.0704
+    168.0990   1475.0100     32.7966      6.0699
+    168.4110   1475.0200     32.7982      6.0692
+    168.7090   1475.0200     32.7967      6.0686
+    168.9740   1475.0200     32.7946      6.0673
+    169.2140   1475.0100     32.7966      6.0646
+    169.4110   1475.0100     32.7988      6.0621
+    169.5630   1475.0100     32.7995      6.0607
+    169.6910   1475.0100     32.8017      6.0598
+    169.7880   1475.0100     32.8028      6.0598
+    169.8810   1475.0100     32.8031      6.0604
+    169.9760   1475.0200     32.8021      6.0614
+    170.0970   1475.0200     32.8006      6.0621
+    170.2380   1475.0200     32.8010      6.0622
+    170.4090   1475.0300     32.8002      6.0623
+    170.5880   1475.0200     32.7979      6.0618
+    170.7900   1475.0300     32.7998      6.0604
+    170.9980   1475.0200     32.8001      6.0594
+    171.2170   1475.0300     32.8012      6.0586
+    171.4260   1475.0300     32.8002      6.0583
+    171.6260   1475.0300     32.7998      6.0574
+    171.8210   1475.0200     32.7990      6.0560
+    172.0060   1475.0200     32.7997      6.0537
+    172.1900   1475.0100     32.8007      6.0516
+    172.3780   1475.0100     32.8017      6.0497
+    172.5280   1475.0100     32.8034      6.0484
+    172.5960   1475.0100     32.8043      6.0479
+    172.6300   1475.0200     32.8039      6.0491
+    172.6450   1475.0100     32.8023      6.0477
+    172.6630   1475.0100     32.8032      6.0468
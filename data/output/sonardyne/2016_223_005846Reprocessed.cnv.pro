@@ -0,0 +1,782 @@
+test_read_store_and_write
+10/8/2016
+:58:0
+Probe: SBE
+Source: /root/package/data/input/seabird/2016_223_005846Reprocessed.cnv
+      0.0079   1459.2763      0.0069     13.1383
+      0.0099   1459.2240      0.0068     13.1241
+      0.2044   1491.7086     31.8251     11.6160
+      0.5436   1491.7692     31.9230     11.5981
+      0.8650   1491.7860     31.9723     11.5844
+      1.1210   1491.7779     31.9771     11.5792
+      1.2956   1491.7371     31.9444     11.5779
+      1.4325   1491.7143     31.9325     11.5748
+      1.5158   1491.4472     31.7035     11.5765
+      1.5376   1491.7988     31.9441     11.5946
+      1.5624   1492.0340     32.0960     11.6098
+      1.5991   1491.9656     32.0607     11.6021
+      1.6061   1491.8772     32.0039     11.5962
+      1.6388   1491.9732     32.1045     11.5890
+      1.6924   1491.9878     32.1209     11.5873
+      1.7340   1491.9948     32.1285     11.5865
+      1.7559   1491.9928     32.1079     11.5929
+      1.7688   1492.0063     32.0639     11.6119
+      1.8293   1492.0570     31.9931     11.6506
+      1.9304   1492.0714     32.0064     11.6497
+      2.0267   1492.1167     32.0397     11.6508
+      2.1239   1492.1368     32.0693     11.6459
+      2.2231   1492.1311     32.0875     11.6375
+      2.3144   1492.1364     32.0982     11.6349
+      2.3778   1492.1405     32.0964     11.6364
+      2.4126   1492.1168     32.0802     11.6350
+      2.4374   1492.0956     32.0874     11.6263
+      2.4542   1492.0920     32.1236     11.6127
+      2.4721   1492.0789     32.1487     11.6002
+      2.4840   1492.0628     32.1612     11.5912
+      2.6248   1491.8186     32.0437     11.5608
+      2.7131   1491.8155     32.0480     11.5580
+      2.7528   1491.8138     32.0481     11.5573
+      2.7935   1491.6492     32.0058     11.5244
+      2.9899   1491.6474     32.0004     11.5248
+      3.1794   1491.6607     32.0077     11.5252
+      3.3599   1491.6656     32.0090     11.5253
+      3.5345   1491.6694     32.0100     11.5252
+      3.7131   1491.6705     32.0085     11.5252
+      3.8867   1491.6721     32.0080     11.5250
+      4.0613   1491.6765     32.0087     11.5252
+      4.2349   1491.6826     32.0093     11.5259
+      4.4095   1491.6867     32.0086     11.5265
+      4.6049   1491.6902     32.0082     11.5267
+      4.7943   1491.6942     32.0086     11.5268
+      4.9798   1491.6978     32.0088     11.5269
+      5.1544   1491.7013     32.0084     11.5272
+      5.3221   1491.7044     32.0087     11.5272
+      5.4719   1491.6939     32.0121     11.5223
+      5.6276   1491.6381     32.0317     11.4988
+      5.7893   1491.5455     32.0636     11.4605
+      5.9788   1491.4840     32.0868     11.4340
+      6.1811   1491.4232     32.1096     11.4078
+      6.4242   1491.3096     32.1481     11.3609
+      6.7059   1491.1510     32.2033     11.2953
+      7.0184   1490.9794     32.2630     11.2244
+      7.3388   1490.8501     32.3098     11.1700
+      7.6850   1490.7834     32.3348     11.1408
+      8.0351   1490.7409     32.3455     11.1234
+      8.3655   1490.6783     32.3360     11.1073
+      8.6760   1490.5727     32.2966     11.0893
+      8.9626   1490.5310     32.3162     11.0694
+      9.2354   1490.4836     32.3175     11.0542
+      9.4804   1490.4188     32.2802     11.0474
+      9.7026   1490.3812     32.2360     11.0508
+      9.9169   1490.3853     32.2039     11.0619
+     10.1173   1490.4209     32.2041     11.0710
+     10.3226   1490.4501     32.2223     11.0721
+     10.5270   1490.4686     32.2445     11.0688
+     10.7363   1490.4559     32.2431     11.0647
+     10.9376   1490.4343     32.2376     11.0595
+     11.1598   1490.3757     32.2295     11.0446
+     11.3781   1490.2825     32.2533     11.0090
+     11.6013   1490.1774     32.2977     10.9630
+     11.8294   1490.1105     32.3460     10.9265
+     12.0566   1490.0894     32.3913     10.9040
+     12.2907   1490.0735     32.4148     10.8904
+     12.5268   1490.0380     32.4179     10.8782
+     12.7936   1490.0016     32.4230     10.8649
+     13.0644   1489.9743     32.4286     10.8540
+     13.3590   1489.9523     32.4316     10.8454
+     13.6328   1489.9077     32.4214     10.8350
+     13.9145   1489.8066     32.3727     10.8217
+     14.1903   1489.6999     32.3275     10.8057
+     14.4630   1489.6261     32.3211     10.7858
+     14.7110   1489.5702     32.3333     10.7647
+     14.9729   1489.4951     32.3572     10.7342
+     15.2129   1489.3605     32.3954     10.6822
+     15.4599   1489.1928     32.4316     10.6216
+     15.7069   1489.0709     32.4623     10.5758
+     15.9380   1489.0052     32.4832     10.5492
+     16.1721   1488.9592     32.4841     10.5349
+     16.3983   1488.9287     32.4702     10.5300
+     16.6294   1488.9119     32.4561     10.5290
+     16.8526   1488.8678     32.4355     10.5226
+     17.0798   1488.8092     32.4288     10.5074
+     17.3238   1488.7142     32.4192     10.4829
+     17.5837   1488.5293     32.3769     10.4443
+     17.8485   1488.3402     32.3451     10.4010
+     18.1064   1488.2408     32.3473     10.3713
+     18.3822   1488.1920     32.3594     10.3523
+     18.6579   1488.1554     32.3672     10.3382
+     18.9396   1488.1381     32.3819     10.3271
+     19.2213   1488.1250     32.3977     10.3168
+     19.4951   1488.0358     32.4139     10.2852
+     19.7699   1487.7749     32.4703     10.1923
+     20.0347   1487.3880     32.5608     10.0532
+     20.2857   1487.0395     32.6165      9.9369
+     20.5237   1486.7885     32.6165      9.8665
+     20.7598   1486.6880     32.6389      9.8302
+     20.9731   1486.6371     32.6461      9.8128
+     21.1962   1486.6078     32.6431      9.8047
+     21.4164   1486.5843     32.6405      9.7981
+     21.6317   1486.5529     32.6446      9.7871
+     21.8638   1486.4825     32.6284      9.7721
+     22.0880   1486.2840     32.5027      9.7586
+     22.3151   1485.9946     32.3007      9.7457
+     22.5472   1485.8511     32.2336      9.7277
+     22.7753   1485.7797     32.2347      9.7067
+     22.9916   1485.7304     32.2460      9.6884
+     23.1939   1485.6774     32.2554      9.6698
+     23.4012   1485.6100     32.2685      9.6460
+     23.6085   1485.5297     32.3067      9.6103
+     23.8049   1485.3947     32.3291      9.5650
+     24.0142   1485.2660     32.3434      9.5241
+     24.2196   1485.1823     32.3587      9.4952
+     24.4169   1485.1229     32.3662      9.4756
+     24.6600   1485.0673     32.3540      9.4634
+     24.9417   1485.0280     32.3354      9.4576
+     25.2531   1485.0038     32.3324      9.4506
+     25.6072   1484.9592     32.3256      9.4391
+     25.9841   1484.9075     32.3142      9.4271
+     26.3720   1484.8355     32.2891      9.4141
+     26.7757   1484.7298     32.2617      9.3926
+     27.1496   1484.6048     32.2644      9.3560
+     27.4888   1484.4680     32.2980      9.3061
+     27.7804   1484.2967     32.3476      9.2418
+     28.0185   1484.0792     32.4123      9.1603
+     28.2059   1483.8772     32.4868      9.0801
+     28.3488   1483.7014     32.5371      9.0153
+     28.4519   1483.5604     32.5667      8.9670
+     28.5253   1483.4501     32.5928      8.9283
+     28.6017   1483.3565     32.6129      8.8961
+     28.6840   1483.2683     32.6138      8.8717
+     28.7822   1483.1740     32.5917      8.8532
+     28.9211   1483.0680     32.5602      8.8345
+     29.1195   1482.9475     32.5331      8.8102
+     29.3883   1482.7795     32.4674      8.7856
+     29.7017   1482.6712     32.4309      8.7672
+     30.0568   1482.6039     32.4038      8.7565
+     30.4049   1482.5667     32.3907      8.7493
+     30.7590   1482.5276     32.3745      8.7426
+     31.1250   1482.4825     32.3636      8.7325
+     31.4424   1482.4141     32.3702      8.7106
+     31.7360   1482.3149     32.3916      8.6757
+     31.9978   1482.1998     32.4182      8.6350
+     32.2309   1482.0431     32.4337      8.5870
+     32.4343   1481.8791     32.4612      8.5333
+     32.6148   1481.7398     32.4943      8.4845
+     32.7755   1481.6374     32.5310      8.4445
+     32.9401   1481.5550     32.5534      8.4145
+     33.1186   1481.4906     32.5698      8.3912
+     33.3259   1481.4076     32.5858      8.3630
+     33.5283   1481.2555     32.6066      8.3149
+     33.7514   1481.0265     32.6305      8.2454
+     33.9875   1480.8127     32.6558      8.1795
+     34.2355   1480.6388     32.6633      8.1300
+     34.4894   1480.4747     32.6463      8.0911
+     34.7363   1480.3526     32.6458      8.0580
+     34.9784   1480.2474     32.6446      8.0296
+     35.2303   1480.1560     32.6545      8.0012
+     35.4743   1480.0691     32.6694      7.9724
+     35.7193   1479.9618     32.6750      7.9413
+     35.9880   1479.8287     32.6586      7.9105
+     36.2677   1479.6695     32.6032      7.8855
+     36.5474   1479.5497     32.5877      7.8579
+     36.8381   1479.4438     32.5962      7.8261
+     37.1247   1479.3551     32.5972      7.8013
+     37.4133   1479.2796     32.5913      7.7822
+     37.6861   1479.2192     32.5944      7.7642
+     37.9400   1479.1483     32.5872      7.7469
+     38.1731   1479.0795     32.5838      7.7290
+     38.3823   1478.9994     32.5827      7.7075
+     38.5648   1478.8882     32.5740      7.6805
+     38.7344   1478.8045     32.5916      7.6522
+     38.8872   1478.7088     32.5940      7.6258
+     39.0429   1478.6064     32.5821      7.6023
+     39.1927   1478.5434     32.5893      7.5829
+     39.3623   1478.4974     32.5920      7.5693
+     39.5299   1478.4633     32.5889      7.5607
+     39.7173   1478.4386     32.5820      7.5557
+     39.9207   1478.4189     32.5703      7.5535
+     40.1398   1478.3994     32.5545      7.5526
+     40.3759   1478.3729     32.5313      7.5522
+     40.6318   1478.3477     32.5095      7.5516
+     40.8897   1478.3279     32.4898      7.5517
+     41.1733   1478.3176     32.4759      7.5523
+     41.4560   1478.3070     32.4643      7.5521
+     41.7486   1478.3015     32.4609      7.5505
+     42.0531   1478.3000     32.4609      7.5488
+     42.3744   1478.3023     32.4603      7.5482
+     42.6848   1478.3046     32.4624      7.5468
+     42.9844   1478.3001     32.4684      7.5424
+     43.2869   1478.2810     32.4765      7.5335
+     43.5507   1478.2523     32.4861      7.5218
+     43.7947   1478.2259     32.4975      7.5102
+     44.0287   1478.1883     32.5149      7.4938
+     44.2360   1478.1190     32.5362      7.4680
+     44.4126   1478.0336     32.5627      7.4365
+     44.5861   1477.9527     32.5880      7.4066
+     44.7557   1477.8834     32.6149      7.3792
+     44.9233   1477.7971     32.6422      7.3473
+     45.0820   1477.7034     32.6669      7.3144
+     45.2496   1477.6256     32.6825      7.2885
+     45.4291   1477.5693     32.6843      7.2726
+     45.6305   1477.5431     32.6879      7.2638
+     45.8487   1477.5111     32.6783      7.2577
+     46.0946   1477.4697     32.6567      7.2529
+     46.3575   1477.4309     32.6336      7.2492
+     46.6639   1477.4021     32.6152      7.2464
+     46.9674   1477.3856     32.6063      7.2437
+     47.2778   1477.3457     32.5795      7.2407
+     47.5754   1477.3041     32.5609      7.2347
+     47.8769   1477.2598     32.5574      7.2231
+     48.1615   1477.2127     32.5693      7.2059
+     48.4501   1477.1655     32.5860      7.1871
+     48.7318   1477.1268     32.5935      7.1735
+     49.0075   1477.1047     32.5992      7.1648
+     49.2872   1477.0922     32.6029      7.1592
+     49.5431   1477.0824     32.6062      7.1545
+     49.8088   1477.0686     32.6094      7.1488
+     50.0578   1477.0540     32.6127      7.1429
+     50.2849   1477.0385     32.6119      7.1382
+     50.5001   1477.0146     32.5996      7.1351
+     50.6965   1476.9954     32.5869      7.1334
+     50.8710   1476.9719     32.5695      7.1322
+     51.0337   1476.9664     32.5673      7.1308
+     51.1874   1476.9591     32.5631      7.1296
+     51.3471   1476.9578     32.5634      7.1285
+     51.5276   1476.9517     32.5630      7.1263
+     51.7081   1476.9368     32.5589      7.1230
+     51.9283   1476.9264     32.5567      7.1201
+     52.1841   1476.9245     32.5568      7.1185
+     52.4658   1476.9257     32.5562      7.1178
+     52.7623   1476.9286     32.5561      7.1173
+     53.0708   1476.9290     32.5567      7.1159
+     53.3772   1476.9265     32.5581      7.1135
+     53.6807   1476.9239     32.5592      7.1112
+     53.9782   1476.9216     32.5615      7.1086
+     54.2738   1476.9144     32.5615      7.1055
+     54.5574   1476.8985     32.5624      7.0999
+     54.8440   1476.8779     32.5673      7.0918
+     55.1128   1476.8646     32.5733      7.0853
+     55.3905   1476.8478     32.5811      7.0773
+     55.6632   1476.8261     32.5900      7.0677
+     55.9458   1476.8053     32.5954      7.0594
+     56.2295   1476.7870     32.6004      7.0519
+     56.5072   1476.7675     32.6082      7.0432
+     56.7650   1476.7392     32.6151      7.0326
+     57.0199   1476.7096     32.6242      7.0210
+     57.2599   1476.6817     32.6295      7.0111
+     57.4721   1476.6525     32.6239      7.0045
+     57.6348   1476.6431     32.6301      6.9994
+     57.7915   1476.6183     32.6257      6.9938
+     57.9273   1476.5909     32.6219      6.9874
+     58.0582   1476.5686     32.6254      6.9800
+     58.1812   1476.5347     32.6300      6.9693
+     58.3181   1476.4962     32.6342      6.9575
+     58.4936   1476.4610     32.6343      6.9477
+     58.7048   1476.4313     32.6333      6.9395
+     58.9538   1476.4086     32.6324      6.9329
+     59.2245   1476.3966     32.6364      6.9274
+     59.5250   1476.3773     32.6420      6.9194
+     59.8552   1476.3425     32.6494      6.9067
+     60.1964   1476.3088     32.6560      6.8945
+     60.5316   1476.2904     32.6587      6.8875
+     60.8658   1476.2743     32.6530      6.8838
+     61.2089   1476.2598     32.6456      6.8810
+     61.5203   1476.2542     32.6445      6.8786
+     61.8000   1476.2467     32.6408      6.8767
+     62.0549   1476.2402     32.6391      6.8745
+     62.2978   1476.2244     32.6423      6.8684
+     62.5002   1476.1876     32.6483      6.8562
+     62.6787   1476.1353     32.6451      6.8431
+     62.8482   1476.0997     32.6456      6.8331
+     63.0198   1476.0784     32.6529      6.8246
+     63.1963   1476.0566     32.6622      6.8153
+     63.3828   1476.0339     32.6669      6.8072
+     63.5811   1476.0199     32.6697      6.8019
+     63.7854   1476.0094     32.6733      6.7972
+     63.9887   1475.9947     32.6770      6.7914
+     64.1910   1475.9780     32.6772      6.7862
+     64.4022   1475.9471     32.6673      6.7806
+     64.6145   1475.9190     32.6633      6.7738
+     64.8545   1475.9003     32.6646      6.7676
+     65.1024   1475.8864     32.6640      6.7632
+     65.3691   1475.8723     32.6577      6.7605
+     65.6250   1475.8677     32.6550      6.7591
+     65.9176   1475.8677     32.6549      6.7579
+     66.2022   1475.8662     32.6537      6.7567
+     66.4987   1475.8590     32.6481      6.7554
+     66.7793   1475.8535     32.6482      6.7528
+     67.0540   1475.8400     32.6491      6.7479
+     67.3248   1475.8179     32.6485      6.7413
+     67.5776   1475.8018     32.6499      6.7357
+     67.8047   1475.7917     32.6535      6.7310
+     68.0160   1475.7804     32.6558      6.7265
+     68.2371   1475.7740     32.6590      6.7229
+     68.4483   1475.7690     32.6604      6.7203
+     68.6487   1475.7659     32.6612      6.7184
+     68.8599   1475.7645     32.6623      6.7168
+     69.0850   1475.7589     32.6611      6.7148
+     69.3289   1475.7482     32.6591      6.7117
+     69.5541   1475.7324     32.6560      6.7077
+     69.7931   1475.7238     32.6567      6.7043
+     70.0440   1475.7180     32.6575      6.7015
+     70.2780   1475.7100     32.6552      6.6992
+     70.5200   1475.7042     32.6565      6.6963
+     70.7629   1475.6969     32.6587      6.6927
+     70.9920   1475.6866     32.6622      6.6880
+     71.2379   1475.6750     32.6660      6.6828
+     71.4868   1475.6637     32.6690      6.6779
+     71.7427   1475.6534     32.6706      6.6737
+     71.9995   1475.6437     32.6692      6.6706
+     72.2534   1475.6360     32.6710      6.6670
+     72.5172   1475.6228     32.6742      6.6615
+     72.7621   1475.6105     32.6799      6.6555
+     72.9971   1475.5956     32.6822      6.6500
+     73.2173   1475.5729     32.6875      6.6416
+     73.4374   1475.5358     32.6935      6.6293
+     73.6427   1475.5017     32.7006      6.6175
+     73.8321   1475.4774     32.7054      6.6090
+     74.0165   1475.4598     32.7077      6.6030
+     74.2089   1475.4433     32.7133      6.5962
+     74.3845   1475.4106     32.7210      6.5847
+     74.5590   1475.3686     32.7272      6.5713
+     74.7504   1475.3382     32.7312      6.5615
+     74.9467   1475.3226     32.7347      6.5556
+     75.1550   1475.3063     32.7290      6.5524
+     75.3820   1475.2872     32.7168      6.5505
+     75.6310   1475.2784     32.7109      6.5491
+     75.8957   1475.2768     32.7090      6.5482
+     76.1704   1475.2766     32.7074      6.5475
+     76.4749   1475.2755     32.7041      6.5470
+     76.7952   1475.2635     32.6919      6.5465
+     77.1392   1475.2504     32.6807      6.5453
+     77.4744   1475.2474     32.6786      6.5438
+     77.8086   1475.2482     32.6783      6.5427
+     78.1348   1475.2500     32.6789      6.5416
+     78.4314   1475.2501     32.6795      6.5402
+     78.7159   1475.2507     32.6800      6.5390
+     78.9529   1475.2499     32.6812      6.5374
+     79.1731   1475.2475     32.6830      6.5353
+     79.3724   1475.2466     32.6859      6.5333
+     79.5499   1475.2423     32.6852      6.5317
+     79.7105   1475.2402     32.6861      6.5302
+     79.8623   1475.2363     32.6857      6.5287
+     80.0061   1475.2316     32.6876      6.5263
+     80.1558   1475.2235     32.6902      6.5228
+     80.3164   1475.2148     32.6915      6.5195
+     80.5078   1475.2121     32.6940      6.5172
+     80.7210   1475.2090     32.6938      6.5156
+     80.9550   1475.2002     32.6953      6.5119
+     81.2059   1475.1848     32.6995      6.5056
+     81.4608   1475.1717     32.7049      6.4995
+     81.7186   1475.1635     32.7072      6.4956
+     81.9764   1475.1576     32.7095      6.4923
+     82.2402   1475.1511     32.7112      6.4890
+     82.4801   1475.1409     32.7093      6.4860
+     82.7221   1475.1361     32.7092      6.4838
+     82.9710   1475.1345     32.7097      6.4822
+     83.2199   1475.1348     32.7111      6.4808
+     83.5045   1475.1334     32.7084      6.4801
+     83.8010   1475.1281     32.7009      6.4799
+     84.1074   1475.1282     32.6976      6.4797
+     84.4286   1475.1320     32.6970      6.4795
+     84.7589   1475.1350     32.6960      6.4792
+     85.0960   1475.1338     32.6950      6.4778
+     85.4153   1475.1311     32.6950      6.4758
+     85.7276   1475.1308     32.6960      6.4741
+     86.0122   1475.1301     32.6976      6.4722
+     86.2601   1475.1281     32.6984      6.4704
+     86.4674   1475.1274     32.7002      6.4688
+     86.6508   1475.1272     32.7020      6.4674
+     86.8006   1475.1242     32.7036      6.4655
+     86.9235   1475.1197     32.7056      6.4632
+     87.0306   1475.1173     32.7067      6.4618
+     87.1407   1475.1134     32.7047      6.4610
+     87.2775   1475.1111     32.7020      6.4607
+     87.4362   1475.1128     32.7016      6.4606
+     87.6166   1475.1105     32.7002      6.4597
+     87.8298   1475.1085     32.7005      6.4582
+     88.1095   1475.1073     32.7003      6.4568
+     88.4030   1475.1077     32.7011      6.4554
+     88.7024   1475.1077     32.7010      6.4542
+     89.0108   1475.1076     32.6990      6.4535
+     89.3271   1475.1116     32.6993      6.4531
+     89.6286   1475.1170     32.6990      6.4533
+     89.9012   1475.1218     32.6983      6.4536
+     90.1422   1475.1280     32.6988      6.4540
+     90.3593   1475.1310     32.6971      6.4544
+     90.5596   1475.1321     32.6947      6.4546
+     90.7471   1475.1356     32.6944      6.4548
+     90.9126   1475.1372     32.6926      6.4551
+     91.1080   1475.1403     32.6915      6.4554
+     91.3281   1475.1440     32.6913      6.4555
+     91.5661   1475.1480     32.6916      6.4554
+     91.8170   1475.1518     32.6923      6.4551
+     92.0807   1475.1569     32.6938      6.4548
+     92.3524   1475.1619     32.6952      6.4545
+     92.6142   1475.1659     32.6952      6.4544
+     92.8472   1475.1688     32.6942      6.4545
+     93.0743   1475.1741     32.6951      6.4546
+     93.2914   1475.1778     32.6955      6.4545
+     93.5056   1475.1829     32.6964      6.4546
+     93.7079   1475.1867     32.6955      6.4550
+     93.8923   1475.1921     32.6955      6.4556
+     94.0956   1475.1950     32.6939      6.4560
+     94.2978   1475.1990     32.6941      6.4561
+     94.5140   1475.2020     32.6940      6.4560
+     94.7421   1475.2064     32.6938      6.4562
+     94.9850   1475.2118     32.6940      6.4565
+     95.2557   1475.2182     32.6943      6.4569
+     95.5085   1475.2236     32.6940      6.4573
+     95.7634   1475.2282     32.6943      6.4573
+     96.0013   1475.2321     32.6949      6.4571
+     96.2324   1475.2331     32.6974      6.4556
+     96.4525   1475.2296     32.6999      6.4530
+     96.6617   1475.2257     32.7012      6.4507
+     96.8560   1475.2234     32.7028      6.4488
+     97.0494   1475.2221     32.7046      6.4471
+     97.2447   1475.2155     32.7068      6.4439
+     97.4341   1475.2034     32.7132      6.4380
+     97.6304   1475.1877     32.7201      6.4310
+     97.8198   1475.1736     32.7256      6.4249
+     98.0181   1475.1627     32.7300      6.4199
+     98.2263   1475.1529     32.7327      6.4157
+     98.4366   1475.1461     32.7339      6.4127
+     98.6497   1475.1424     32.7351      6.4105
+     98.8758   1475.1387     32.7367      6.4081
+     99.1078   1475.1337     32.7385      6.4053
+     99.3468   1475.1279     32.7402      6.4023
+     99.5788   1475.1150     32.7360      6.3994
+     99.8138   1475.1059     32.7313      6.3976
+    100.0577   1475.1033     32.7286      6.3968
+    100.2977   1475.1048     32.7269      6.3967
+    100.5426   1475.1038     32.7245      6.3962
+    100.8083   1475.1063     32.7233      6.3961
+    101.0701   1475.1100     32.7222      6.3963
+    101.3546   1475.1126     32.7199      6.3965
+    101.6451   1475.1155     32.7168      6.3970
+    101.9208   1475.1180     32.7145      6.3972
+    102.2103   1475.1187     32.7129      6.3967
+    102.4919   1475.1184     32.7130      6.3954
+    102.7616   1475.1173     32.7155      6.3932
+    103.0035   1475.1143     32.7197      6.3901
+    103.2187   1475.1063     32.7215      6.3866
+    103.4061   1475.0988     32.7250      6.3828
+    103.5826   1475.0938     32.7291      6.3795
+    103.7253   1475.0881     32.7312      6.3768
+    103.8612   1475.0848     32.7337      6.3746
+    103.9871   1475.0831     32.7360      6.3729
+    104.1299   1475.0785     32.7368      6.3709
+    104.2865   1475.0726     32.7379      6.3684
+    104.4581   1475.0642     32.7393      6.3651
+    104.6494   1475.0532     32.7391      6.3616
+    104.8715   1475.0476     32.7396      6.3591
+    105.0986   1475.0437     32.7382      6.3576
+    105.3276   1475.0445     32.7380      6.3569
+    105.5656   1475.0461     32.7374      6.3565
+    105.7877   1475.0485     32.7374      6.3562
+    106.0227   1475.0521     32.7375      6.3561
+    106.2606   1475.0553     32.7369      6.3561
+    106.5095   1475.0587     32.7366      6.3560
+    106.7772   1475.0605     32.7349      6.3559
+    107.0350   1475.0598     32.7344      6.3548
+    107.2947   1475.0605     32.7369      6.3531
+    107.5496   1475.0599     32.7381      6.3515
+    107.8073   1475.0599     32.7397      6.3499
+    108.0542   1475.0600     32.7410      6.3485
+    108.3071   1475.0593     32.7424      6.3468
+    108.5450   1475.0596     32.7436      6.3455
+    108.7919   1475.0620     32.7439      6.3450
+    109.0427   1475.0661     32.7445      6.3448
+    109.3015   1475.0701     32.7439      6.3449
+    109.5415   1475.0722     32.7431      6.3447
+    109.7853   1475.0704     32.7410      6.3439
+    110.0124   1475.0705     32.7415      6.3428
+    110.2365   1475.0702     32.7415      6.3418
+    110.4397   1475.0725     32.7422      6.3413
+    110.6509   1475.0742     32.7411      6.3412
+    110.8641   1475.0773     32.7398      6.3415
+    111.0733   1475.0838     32.7404      6.3421
+    111.2954   1475.0891     32.7401      6.3426
+    111.5115   1475.0945     32.7406      6.3429
+    111.7465   1475.0984     32.7406      6.3429
+    112.0003   1475.0981     32.7399      6.3420
+    112.2749   1475.0982     32.7398      6.3409
+    112.5605   1475.1006     32.7405      6.3401
+    112.8411   1475.1015     32.7416      6.3388
+    113.0889   1475.0983     32.7443      6.3361
+    113.3200   1475.0928     32.7488      6.3323
+    113.5321   1475.0877     32.7524      6.3290
+    113.7165   1475.0844     32.7555      6.3264
+    113.8732   1475.0787     32.7587      6.3233
+    113.9961   1475.0701     32.7619      6.3196
+    114.1151   1475.0594     32.7628      6.3161
+    114.2341   1475.0537     32.7655      6.3133
+    114.3659   1475.0477     32.7672      6.3107
+    114.4998   1475.0377     32.7701      6.3067
+    114.6763   1475.0182     32.7721      6.3004
+    114.8894   1474.9970     32.7748      6.2933
+    115.1492   1474.9831     32.7783      6.2876
+    115.4327   1474.9755     32.7805      6.2838
+    115.7341   1474.9700     32.7810      6.2810
+    116.0593   1474.9646     32.7784      6.2791
+    116.3945   1474.9642     32.7772      6.2780
+    116.7197   1474.9639     32.7774      6.2765
+    117.0389   1474.9618     32.7772      6.2747
+    117.3472   1474.9573     32.7743      6.2732
+    117.6447   1474.9513     32.7694      6.2720
+    117.9124   1474.9450     32.7647      6.2708
+    118.1682   1474.9413     32.7628      6.2694
+    118.4210   1474.9419     32.7628      6.2685
+    118.6649   1474.9428     32.7619      6.2680
+    118.8830   1474.9454     32.7611      6.2680
+    119.0852   1474.9486     32.7610      6.2680
+    119.2746   1474.9489     32.7603      6.2675
+    119.4511   1474.9465     32.7592      6.2665
+    119.6067   1474.9452     32.7599      6.2653
+    119.7435   1474.9421     32.7598      6.2640
+    119.8823   1474.9408     32.7607      6.2628
+    120.0251   1474.9384     32.7594      6.2620
+    120.1659   1474.9390     32.7603      6.2613
+    120.2978   1474.9383     32.7614      6.2602
+    120.4346   1474.9357     32.7629      6.2585
+    120.5912   1474.9319     32.7657      6.2560
+    120.7717   1474.9249     32.7669      6.2531
+    120.9719   1474.9206     32.7675      6.2510
+    121.1980   1474.9210     32.7671      6.2503
+    121.4448   1474.9231     32.7664      6.2500
+    121.7284   1474.9255     32.7665      6.2494
+    122.0337   1474.9283     32.7669      6.2487
+    122.3490   1474.9292     32.7676      6.2474
+    122.6762   1474.9267     32.7689      6.2450
+    122.9934   1474.9229     32.7696      6.2425
+    123.3196   1474.9217     32.7688      6.2411
+    123.6448   1474.9231     32.7659      6.2410
+    123.9571   1474.9270     32.7649      6.2410
+    124.2545   1474.9309     32.7663      6.2403
+    124.5331   1474.9336     32.7673      6.2395
+    124.7839   1474.9345     32.7673      6.2387
+    125.0110   1474.9358     32.7682      6.2378
+    125.2152   1474.9332     32.7675      6.2365
+    125.4075   1474.9298     32.7661      6.2353
+    125.5830   1474.9278     32.7647      6.2345
+    125.7486   1474.9274     32.7660      6.2333
+    125.9111   1474.9271     32.7687      6.2317
+    126.0737   1474.9248     32.7704      6.2299
+    126.2254   1474.9170     32.7726      6.2266
+    126.3890   1474.9067     32.7755      6.2224
+    126.5734   1474.9003     32.7771      6.2195
+    126.7826   1474.8989     32.7783      6.2179
+    126.9997   1474.8987     32.7775      6.2172
+    127.2396   1474.9018     32.7768      6.2172
+    127.4974   1474.9047     32.7761      6.2171
+    127.7879   1474.9061     32.7765      6.2161
+    128.0764   1474.9056     32.7761      6.2149
+    128.3579   1474.9072     32.7753      6.2144
+    128.6177   1474.9058     32.7723      6.2139
+    128.8814   1474.9012     32.7687      6.2128
+    129.1342   1474.9016     32.7701      6.2114
+    129.3721   1474.8988     32.7711      6.2094
+    129.6031   1474.8952     32.7740      6.2066
+    129.8252   1474.8926     32.7766      6.2042
+    130.0562   1474.8914     32.7789      6.2022
+    130.2693   1474.8856     32.7791      6.1998
+    130.4894   1474.8778     32.7807      6.1964
+    130.7095   1474.8732     32.7846      6.1931
+    130.9375   1474.8710     32.7855      6.1913
+    131.1645   1474.8718     32.7854      6.1906
+    131.4153   1474.8730     32.7843      6.1902
+    131.6771   1474.8746     32.7831      6.1899
+    131.9497   1474.8743     32.7799      6.1897
+    132.2233   1474.8782     32.7785      6.1900
+    132.4999   1474.8829     32.7773      6.1904
+    132.7844   1474.8846     32.7749      6.1904
+    133.0759   1474.8843     32.7718      6.1901
+    133.3426   1474.8829     32.7691      6.1895
+    133.6082   1474.8857     32.7707      6.1886
+    133.8353   1474.8874     32.7716      6.1878
+    134.0514   1474.8882     32.7728      6.1867
+    134.2536   1474.8871     32.7734      6.1854
+    134.4221   1474.8866     32.7746      6.1842
+    134.5679   1474.8875     32.7759      6.1834
+    134.7176   1474.8903     32.7768      6.1832
+    134.8712   1474.8920     32.7761      6.1832
+    135.0388   1474.8944     32.7755      6.1833
+    135.2123   1474.8966     32.7756      6.1831
+    135.3957   1474.8964     32.7740      6.1828
+    135.6128   1474.8983     32.7746      6.1822
+    135.8567   1474.8992     32.7743      6.1815
+    136.1055   1474.8995     32.7735      6.1808
+    136.3722   1474.9024     32.7732      6.1805
+    136.6487   1474.9067     32.7730      6.1805
+    136.9224   1474.9115     32.7729      6.1806
+    137.1950   1474.9165     32.7736      6.1805
+    137.4745   1474.9207     32.7739      6.1803
+    137.7313   1474.9240     32.7732      6.1803
+    137.9801   1474.9269     32.7728      6.1801
+    138.2180   1474.9301     32.7726      6.1800
+    138.4599   1474.9330     32.7720      6.1799
+    138.6909   1474.9359     32.7713      6.1799
+    138.9328   1474.9381     32.7702      6.1798
+    139.1727   1474.9375     32.7669      6.1797
+    139.4255   1474.9480     32.7725      6.1795
+    139.6674   1474.9508     32.7722      6.1793
+    139.9113   1474.9543     32.7721      6.1792
+    140.1512   1474.9585     32.7726      6.1791
+    140.3802   1474.9616     32.7724      6.1790
+    140.6111   1474.9654     32.7720      6.1791
+    140.8391   1474.9699     32.7723      6.1792
+    141.0513   1474.9735     32.7721      6.1793
+    141.2684   1474.9769     32.7719      6.1793
+    141.4736   1474.9796     32.7720      6.1791
+    141.6867   1474.9830     32.7722      6.1790
+    141.9038   1474.9866     32.7719      6.1791
+    142.1219   1474.9897     32.7715      6.1791
+    142.3400   1474.9921     32.7721      6.1786
+    142.5660   1474.9930     32.7730      6.1776
+    142.7930   1474.9944     32.7737      6.1768
+    143.0082   1474.9970     32.7742      6.1764
+    143.2243   1474.9996     32.7747      6.1760
+    143.4265   1475.0001     32.7756      6.1750
+    143.6238   1474.9996     32.7767      6.1737
+    143.8092   1474.9994     32.7779      6.1725
+    143.9935   1474.9984     32.7797      6.1709
+    144.1849   1474.9910     32.7830      6.1672
+    144.3881   1474.9709     32.7896      6.1592
+    144.6121   1474.9429     32.7982      6.1485
+    144.8470   1474.9222     32.8058      6.1399
+    145.0919   1474.9127     32.8105      6.1350
+    145.3486   1474.9058     32.8140      6.1311
+    145.6104   1474.8972     32.8160      6.1272
+    145.8790   1474.8900     32.8194      6.1232
+    146.1476   1474.8843     32.8202      6.1204
+    146.4094   1474.8849     32.8214      6.1191
+    146.6839   1474.8810     32.8188      6.1178
+    146.9456   1474.8712     32.8117      6.1165
+    147.1875   1474.8607     32.8024      6.1158
+    147.4076   1474.8564     32.7980      6.1152
+    147.6029   1474.8600     32.7996      6.1148
+    147.7773   1474.8582     32.7974      6.1143
+    147.9350   1474.8535     32.7961      6.1129
+    148.0846   1474.8476     32.7935      6.1116
+    148.2284   1474.8474     32.7924      6.1113
+    148.3929   1474.8493     32.7937      6.1107
+    148.5535   1474.8471     32.7939      6.1094
+    148.7141   1474.8440     32.7935      6.1081
+    148.8906   1474.8442     32.7945      6.1071
+    149.0680   1474.8456     32.7945      6.1067
+    149.2593   1474.8482     32.7941      6.1067
+    149.4635   1474.8526     32.7949      6.1067
+    149.6905   1474.8509     32.7928      6.1060
+    149.9453   1474.8489     32.7929      6.1044
+    150.2120   1474.8510     32.7961      6.1028
+    150.4806   1474.8514     32.7958      6.1019
+    150.7641   1474.8530     32.7946      6.1015
+    151.0407   1474.8556     32.7940      6.1012
+    151.3162   1474.8585     32.7939      6.1008
+    151.5730   1474.8607     32.7951      6.0999
+    151.8238   1474.8613     32.7961      6.0987
+    152.0458   1474.8632     32.7972      6.0979
+    152.2619   1474.8649     32.7976      6.0973
+    152.4592   1474.8636     32.7953      6.0969
+    152.6356   1474.8650     32.7947      6.0967
+    152.8032   1474.8672     32.7946      6.0966
+    152.9637   1474.8697     32.7948      6.0965
+    153.1243   1474.8716     32.7951      6.0962
+    153.2978   1474.8727     32.7953      6.0957
+    153.4802   1474.8739     32.7945      6.0955
+    153.6933   1474.8757     32.7928      6.0956
+    153.9094   1474.8795     32.7930      6.0956
+    154.1334   1474.8820     32.7930      6.0953
+    154.3555   1474.8850     32.7934      6.0950
+    154.5755   1474.8881     32.7927      6.0951
+    154.8026   1474.8924     32.7928      6.0952
+    155.0246   1474.8957     32.7928      6.0951
+    155.2357   1474.8982     32.7923      6.0950
+    155.4637   1474.9006     32.7922      6.0947
+    155.6778   1474.9039     32.7923      6.0946
+    155.8989   1474.9083     32.7929      6.0946
+    156.1170   1474.9107     32.7929      6.0943
+    156.3192   1474.9126     32.7930      6.0939
+    156.5194   1474.9147     32.7927      6.0937
+    156.7177   1474.9182     32.7932      6.0936
+    156.9199   1474.9217     32.7936      6.0935
+    157.1092   1474.9244     32.7936      6.0934
+    157.3203   1474.9268     32.7934      6.0932
+    157.5335   1474.9298     32.7933      6.0931
+    157.7713   1474.9335     32.7937      6.0929
+    158.0152   1474.9370     32.7939      6.0927
+    158.2481   1474.9393     32.7933      6.0925
+    158.4791   1474.9428     32.7934      6.0924
+    158.7358   1474.9478     32.7934      6.0926
+    158.9846   1474.9518     32.7933      6.0926
+    159.2503   1474.9553     32.7938      6.0922
+    159.5080   1474.9578     32.7940      6.0917
+    159.7588   1474.9602     32.7945      6.0911
+    159.9917   1474.9621     32.7949      6.0905
+    160.2118   1474.9635     32.7956      6.0897
+    160.4229   1474.9643     32.7963      6.0888
+    160.6340   1474.9647     32.7970      6.0878
+    160.8293   1474.9633     32.7987      6.0861
+    161.0117   1474.9570     32.8018      6.0828
+    161.1792   1474.9519     32.8050      6.0798
+    161.3448   1474.9502     32.8059      6.0784
+    161.5024   1474.9493     32.8066      6.0773
+    161.6649   1474.9476     32.8066      6.0762
+    161.8305   1474.9473     32.8080      6.0750
+    162.0168   1474.9459     32.8082      6.0738
+    162.2091   1474.9447     32.8079      6.0728
+    162.4222   1474.9452     32.8080      6.0720
+    162.6334   1474.9463     32.8077      6.0715
+    162.8633   1474.9455     32.8031      6.0718
+    163.1012   1474.9470     32.8012      6.0718
+    163.3342   1474.9507     32.8023      6.0714
+    163.5701   1474.9519     32.8021      6.0708
+    163.8010   1474.9548     32.8007      6.0710
+    164.0320   1474.9606     32.7988      6.0721
+    164.2491   1474.9657     32.7975      6.0729
+    164.4542   1474.9667     32.7975      6.0723
+    164.6495   1474.9659     32.7981      6.0711
+    164.8517   1474.9663     32.7986      6.0702
+    165.0430   1474.9693     32.8004      6.0696
+    165.2304   1474.9713     32.8014      6.0690
+    165.4098   1474.9694     32.8004      6.0681
+    165.5773   1474.9664     32.8018      6.0662
+    165.7418   1474.9625     32.8048      6.0636
+    165.8984   1474.9609     32.8081      6.0615
+    166.0650   1474.9616     32.8102      6.0603
+    166.2365   1474.9608     32.8089      6.0598
+    166.4218   1474.9623     32.8071      6.0600
+    166.6329   1474.9678     32.8061      6.0608
+    166.8599   1474.9745     32.8056      6.0617
+    167.1236   1474.9784     32.8040      6.0621
+    167.4130   1474.9838     32.8042      6.0622
+    167.7074   1474.9855     32.8020      6.0621
+    168.0285   1474.9847     32.8000      6.0612
+    168.3408   1474.9858     32.8006      6.0600
+    168.6381   1474.9878     32.8011      6.0591
+    168.9038   1474.9902     32.8014      6.0585
+    169.1436   1474.9940     32.8032      6.0579
+    169.3399   1474.9954     32.8052      6.0568
+    169.4915   1474.9941     32.8075      6.0551
+    169.6204   1474.9897     32.8093      6.0529
+    169.7175   1474.9848     32.8108      6.0508
+    169.8097   1474.9823     32.8126      6.0492
+    169.9049   1474.9796     32.8124      6.0482
+    170.0258   1474.9780     32.8108      6.0478
+    170.1665   1474.9807     32.8111      6.0478
+    170.3380   1474.9841     32.8103      6.0482
+    170.5164   1474.9883     32.8100      6.0486
+    170.7186   1474.9909     32.8085      6.0489
+    170.9268   1474.9931     32.8069      6.0491
+    171.1448   1474.9941     32.8048      6.0491
+    171.3540   1474.9962     32.8034      6.0492
+    171.5542   1474.9990     32.8021      6.0495
+    171.7495   1475.0030     32.8011      6.0500
+    171.9338   1475.0069     32.8015      6.0501
+    172.1182   1475.0089     32.8016      6.0498
+    172.3055   1475.0094     32.8008      6.0494
+    172.4552   1475.0131     32.8037      6.0488
+    172.5236   1475.0125     32.8042      6.0482
+    172.5583         nan     -0.0000     -0.0000
+    172.5721         nan     -0.0000     -0.0000
+    172.5900         nan     -0.0000     -0.0000
@@ -0,0 +1,38 @@
+test_read_store_and_write
+9/9/2016
+19:41:29
+Probe: MIDAS SVX2 1000
+Source: /root/package/data/input/valeport/midas/svx2/6291663_718905_160909_1941_34_59.000
+      0.2680   1480.9720      6.9220     17.0550
+      0.6800   1481.0430      6.9260     17.0570
+      1.0160   1481.0370      6.9260     17.0540
+      1.5210   1481.0580      6.9250     17.0530
+      2.0080   1481.0630      6.9250     17.0520
+      2.4920   1481.0690      6.9250     17.0550
+      3.1020   1481.0740      6.9230     17.0550
+      3.5330   1481.0730      6.9240     17.0560
+      3.9800   1481.0790      6.9250     17.0530
+      4.5270   1481.0850      6.9250     17.0530
+      4.9950   1481.0920      6.9250     17.0510
+      5.5590   1481.1040      6.9250     17.0500
+      6.0270   1481.1130      6.9250     17.0500
+      6.5130   1481.0980      6.9220     17.0510
+      6.9670   1480.9690      6.9140     17.0440
+      7.5550   1480.6260      6.9000     17.0160
+      7.9950   1480.3290      6.8880     16.9770
+      8.5590   1480.0540      6.8860     16.9120
+      8.9740   1479.8910      6.8900     16.8590
+      9.5400   1479.8190      6.8960     16.7950
+      9.9490   1479.8210      6.9040     16.7590
+     10.5320   1479.8400      6.9140     16.7190
+     10.9990   1479.8100      6.9160     16.6990
+     11.4620   1479.7560      6.9180     16.6790
+     12.0680   1479.7540      6.9290     16.6570
+     12.5250   1479.7520      6.9330     16.6420
+     12.9300   1479.7570      6.9340     16.6310
+     13.4610   1479.7620      6.9360     16.6210
+     14.0180   1479.7500      6.9370     16.6150
+     14.4580   1479.7450      6.9370     16.6070
+     14.9450   1479.7420      6.9380     16.6020
+     15.4430   1479.4570      6.9160     16.5890
+     15.9770   1473.3890      6.7720     16.2370
@@ -0,0 +1,68 @@
+test_read_store_and_write
+30/7/2013
+8:57:31
+Probe: DigibarS
+Source: /root/package/data/input/digibars/7-30cast1.csv
+      0.8000   1503.5000     28.4447     16.4000
+      1.3000   1503.4000     28.3501     16.4000
+      1.8000   1503.3000     28.3096     16.3800
+      2.3000   1503.3000     28.3028     16.3800
+      2.8000   1503.0000     28.0334     16.3800
+      3.3000   1503.0000     28.0807     16.3600
+      3.8000   1502.9000     27.9861     16.3600
+      4.3000   1502.9000     27.9785     16.3600
+      4.8000   1502.9000     28.0258     16.3400
+      5.3000   1502.8000     27.9312     16.3400
+      5.8000   1502.5000     27.7168     16.3200
+      6.3000   1502.5000     27.8183     16.2800
+      6.8000   1502.5000     27.8656     16.2600
+      7.3000   1502.5000     27.9129     16.2400
+      7.8000   1502.6000     28.0746     16.2100
+      8.3000   1502.7000     28.2089     16.1900
+      8.8000   1502.6000     28.1967     16.1600
+      9.3000   1502.6000     28.2433     16.1400
+      9.8000   1502.5000     28.1494     16.1400
+     10.3000   1502.0000     27.7611     16.1200
+     10.8000   1501.8000     27.6344     16.1000
+     11.3000   1501.7000     27.5948     16.0800
+     11.8000   1501.7000     27.6428     16.0600
+     12.3000   1501.7000     27.7176     16.0300
+     12.8000   1501.7000     27.8198     15.9900
+     13.3000   1501.3000     27.5742     15.9500
+     13.8000   1501.4000     27.7084     15.9300
+     14.3000   1501.3000     27.6970     15.9000
+     14.8000   1501.3000     27.6894     15.9000
+     15.3000   1501.0000     27.4765     15.8800
+     15.8000   1501.0000     27.6062     15.8300
+     16.3000   1500.7000     27.3392     15.8300
+     16.8000   1500.2000     27.0073     15.7900
+     17.3000   1499.6000     26.5343     15.7700
+     17.8000   1499.4000     26.4084     15.7500
+     18.3000   1499.2000     26.3382     15.7100
+     18.8000   1498.2000     25.6851     15.6300
+     19.3000   1498.1000     25.7576     15.5700
+     19.8000   1498.1000     25.9171     15.5100
+     20.3000   1497.9000     25.9865     15.4200
+     20.8000   1497.9000     26.3695     15.2800
+     21.3000   1497.9000     26.5854     15.2000
+     21.8000   1497.9000     26.6335     15.1800
+     22.3000   1497.9000     26.7654     15.1300
+     22.8000   1497.4000     26.4664     15.0800
+     23.3000   1497.5000     26.6014     15.0600
+     23.8000   1497.5000     26.7624     15.0000
+     24.3000   1497.4000     26.7807     14.9600
+     24.8000   1497.2000     26.8524     14.8700
+     25.3000   1497.2000     26.9295     14.8400
+     25.8000   1497.1000     27.0042     14.7800
+     26.3000   1497.0000     27.1072     14.7100
+     26.8000   1497.0000     27.2125     14.6700
+     27.3000   1496.7000     27.0599     14.6300
+     27.8000   1495.3000     26.0185     14.5700
+     28.3000   1495.3000     26.1803     14.5100
+     28.8000   1494.9000     26.1978     14.3800
+     29.3000   1494.8000     26.4725     14.2500
+     29.8000   1494.5000     26.4359     14.1700
+     30.3000   1494.4000     26.5129     14.1100
+     30.8000   1494.4000     26.7334     14.0300
+     31.3000   1494.3000     26.8112     13.9700
+     31.8000   1494.3000     26.9180     13.9300
@@ -0,0 +1,53 @@
+test_read_store_and_write
+30/7/2013
+9:26:2
+Probe: DigibarS
+Source: /root/package/data/input/digibars/7-30cast2.csv
+      0.9000   1504.3000     29.1946     16.3800
+      1.4000   1504.2000     29.1000     16.3800
+      1.9000   1504.0000     28.9185     16.3800
+      2.4000   1503.7000     28.6499     16.3800
+      2.9000   1503.4000     28.3813     16.3800
+      3.4000   1503.3000     28.3409     16.3600
+      3.9000   1502.9000     27.9305     16.3800
+      4.4000   1502.7000     27.8030     16.3600
+      4.9000   1502.5000     27.6215     16.3600
+      5.4000   1502.4000     27.5810     16.3400
+      5.9000   1502.2000     27.4536     16.3200
+      6.4000   1502.1000     27.3598     16.3200
+      6.9000   1501.7000     27.4948     16.1400
+      7.4000   1501.6000     27.5650     16.0800
+      7.9000   1501.5000     27.6070     16.0300
+      8.4000   1501.0000     27.2202     16.0100
+      8.9000   1500.7000     26.9516     16.0100
+      9.4000   1500.2000     26.6190     15.9700
+      9.9000   1500.1000     26.6350     15.9300
+     10.4000   1500.1000     26.7654     15.8800
+     10.9000   1499.7000     26.4107     15.8800
+     11.4000   1499.4000     26.2802     15.8300
+     11.9000   1499.2000     26.2100     15.7900
+     12.4000   1499.0000     26.1398     15.7500
+     12.9000   1499.0000     26.2428     15.7100
+     13.4000   1499.0000     26.3741     15.6600
+     13.9000   1498.9000     26.4183     15.6100
+     14.4000   1499.0000     26.5533     15.5900
+     14.9000   1498.9000     26.5701     15.5500
+     15.4000   1499.0000     26.8433     15.4800
+     15.9000   1499.0000     26.9470     15.4400
+     16.4000   1499.0000     26.9402     15.4400
+     16.9000   1499.0000     27.1271     15.3700
+     17.4000   1498.6000     26.8288     15.3500
+     17.9000   1498.6000     26.9608     15.3000
+     18.4000   1498.5000     27.0340     15.2400
+     18.9000   1498.2000     26.9348     15.1800
+     19.4000   1498.1000     26.8967     15.1600
+     19.9000   1498.1000     27.0569     15.1000
+     20.4000   1498.1000     27.1049     15.0800
+     20.9000   1498.1000     27.2095     15.0400
+     21.4000   1498.1000     27.3697     14.9800
+     21.9000   1498.2000     27.6443     14.9100
+     22.4000   1498.2000     27.7489     14.8700
+     22.9000   1498.1000     27.7390     14.8400
+     23.4000   1498.0000     27.7016     14.8200
+     23.9000   1497.6000     27.4620     14.7800
+     24.4000   1497.4000     27.2827     14.7800
@@ -0,0 +1,68 @@
+test_read_store_and_write
+30/7/2013
+9:52:54
+Probe: DigibarS
+Source: /root/package/data/input/digibars/7-30cast3.csv
+      0.5000   1504.0000     27.7229     16.8300
+      1.0000   1503.4000     27.1904     16.8300
+      1.5000   1501.3000     25.5875     16.7400
+      2.0000   1501.0000     25.6172     16.6300
+      2.5000   1501.1000     25.9430     16.5400
+      3.0000   1501.1000     25.9903     16.5200
+      3.5000   1501.0000     26.0048     16.4800
+      4.0000   1500.9000     25.9651     16.4600
+      4.5000   1500.8000     25.9521     16.4300
+      5.0000   1500.7000     25.9399     16.4000
+      5.5000   1500.6000     25.9544     16.3600
+      6.0000   1500.5000     25.9148     16.3400
+      6.5000   1500.2000     25.7553     16.3000
+      7.0000   1500.0000     25.7378     16.2400
+      7.5000   1499.9000     25.7812     16.1900
+      8.0000   1499.6000     25.6500     16.1400
+      8.5000   1499.2000     25.4036     16.1000
+      9.0000   1498.8000     25.1587     16.0600
+      9.5000   1498.5000     25.0832     15.9900
+     10.0000   1498.1000     24.8383     15.9500
+     10.5000   1497.9000     24.7955     15.9000
+     11.0000   1497.7000     24.8085     15.8300
+     11.5000   1497.2000     24.5888     15.7500
+     12.0000   1497.1000     24.5499     15.7300
+     12.5000   1496.6000     24.4431     15.6100
+     13.0000   1496.3000     24.2874     15.5700
+     13.5000   1495.5000     23.8373     15.4800
+     14.0000   1495.4000     23.9120     15.4200
+     14.5000   1494.9000     23.6679     15.3500
+     15.0000   1494.8000     23.7701     15.2800
+     15.5000   1494.4000     23.5855     15.2200
+     16.0000   1494.4000     23.6908     15.1800
+     16.5000   1494.4000     23.9090     15.1000
+     17.0000   1493.4000     23.3200     15.0000
+     17.5000   1491.6000     22.0711     14.8900
+     18.0000   1491.2000     22.4030     14.6500
+     18.5000   1491.0000     22.5090     14.5500
+     19.0000   1491.1000     22.8165     14.4700
+     19.5000   1490.8000     22.8661     14.3600
+     20.0000   1490.7000     23.0316     14.2700
+     20.5000   1490.7000     23.4253     14.1300
+     21.0000   1490.4000     23.5062     14.0100
+     21.5000   1490.3000     23.7297     13.9000
+     22.0000   1490.1000     24.3011     13.6400
+     22.5000   1490.0000     24.7284     13.4600
+     23.0000   1489.9000     25.0122     13.3300
+     23.5000   1490.0000     25.4951     13.1900
+     24.0000   1489.9000     25.8667     13.0300
+     24.5000   1489.9000     26.0918     12.9500
+     25.0000   1489.9000     26.4038     12.8400
+     25.5000   1488.8000     26.1070     12.6200
+     26.0000   1487.9000     25.6897     12.5000
+     26.5000   1487.7000     25.7187     12.4300
+     27.0000   1487.5000     26.6289     12.0600
+     27.5000   1487.4000     26.7441     11.9900
+     28.0000   1487.4000     27.0020     11.9000
+     28.5000   1487.4000     27.3476     11.7800
+     29.0000   1487.3000     27.9053     11.5600
+     29.5000   1487.4000     28.2768     11.4600
+     30.0000   1487.4000     28.3882     11.4200
+     30.5000   1487.4000     28.4698     11.3900
+     31.0000   1487.4000     28.5805     11.3500
+     31.5000   1487.4000     28.5736     11.3500
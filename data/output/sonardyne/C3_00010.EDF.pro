@@ -0,0 +1,9987 @@
+test_read_store_and_write
+1/1/2015
+2:0:15
+Probe: XCTD-1
+Source: /root/package/data/input/sippican/C3_00010.EDF
+      0.9629   1542.5900     34.3800     28.8800
+      1.1004   1542.9500     34.6300     28.9200
+      1.2380   1543.2700     34.8700     28.9500
+      1.3755   1543.5800     35.1200     28.9700
+      1.5131   1543.9000     35.4100     28.9800
+      1.6506   1543.3400     34.8500     28.9900
+      1.7882   1543.6300     35.1100     29.0000
+      1.9257   1543.9400     35.4000     29.0000
+      2.0633   1544.1800     35.6200     29.0000
+      2.2008   1544.3700     35.8000     29.0000
+      2.3384   1544.4900     35.9100     29.0100
+      2.4759   1544.5700     35.9800     29.0100
+      2.6134   1544.6000     36.0100     29.0100
+      2.7510   1544.6300     36.0200     29.0100
+      2.8885   1544.6500     36.0400     29.0100
+      3.0261   1544.6600     36.0500     29.0100
+      3.1636   1544.6700     36.0600     29.0100
+      3.3011   1544.6800     36.0600     29.0100
+      3.4387   1544.6900     36.0700     29.0100
+      3.5762   1544.7000     36.0700     29.0100
+      3.7137   1544.7000     36.0800     29.0100
+      3.8513   1544.7100     36.0800     29.0100
+      3.9888   1544.7100     36.0800     29.0100
+      4.1263   1544.7200     36.0800     29.0100
+      4.2639   1544.7200     36.0900     29.0100
+      4.4014   1544.7200     36.0900     29.0100
+      4.5389   1544.7300     36.0900     29.0100
+      4.6764   1544.7300     36.0900     29.0100
+      4.8140   1544.7400     36.0900     29.0100
+      4.9515   1544.7400     36.0900     29.0100
+      5.0890   1544.7400     36.0900     29.0100
+      5.2265   1544.7500     36.1000     29.0100
+      5.3641   1544.7500     36.1000     29.0100
+      5.5016   1544.7600     36.1000     29.0100
+      5.6391   1544.7600     36.1000     29.0100
+      5.7766   1544.7600     36.1000     29.0100
+      5.9141   1544.7600     36.1000     29.0100
+      6.0516   1544.7600     36.1000     29.0100
+      6.1892   1544.7700     36.1000     29.0100
+      6.3267   1544.7700     36.1000     29.0100
+      6.4642   1544.7700     36.1000     29.0100
+      6.6017   1544.7700     36.1000     29.0100
+      6.7392   1544.7800     36.1000     29.0100
+      6.8767   1544.7800     36.1000     29.0100
+      7.0142   1544.7800     36.1000     29.0100
+      7.1517   1544.7900     36.1000     29.0100
+      7.2892   1544.7900     36.1000     29.0100
+      7.4268   1544.7900     36.1000     29.0100
+      7.5643   1544.8000     36.1100     29.0100
+      7.7018   1544.8000     36.1100     29.0100
+      7.8393   1544.8100     36.1100     29.0100
+      7.9768   1544.8100     36.1100     29.0100
+      8.1143   1544.8100     36.1100     29.0100
+      8.2518   1544.8200     36.1100     29.0100
+      8.3893   1544.8200     36.1100     29.0100
+      8.5268   1544.8200     36.1100     29.0100
+      8.6643   1544.8200     36.1100     29.0100
+      8.8018   1544.8100     36.1100     29.0100
+      8.9393   1544.8100     36.1100     29.0000
+      9.0767   1544.8100     36.1100     29.0000
+      9.2142   1544.8000     36.1100     28.9900
+      9.3517   1544.7900     36.1100     28.9900
+      9.4892   1544.7700     36.1100     28.9800
+      9.6267   1544.7400     36.1100     28.9700
+      9.7642   1544.7100     36.1100     28.9500
+      9.9017   1544.6800     36.1200     28.9300
+     10.0392   1544.6400     36.1200     28.9100
+     10.1767   1544.5900     36.1200     28.8900
+     10.3141   1544.5400     36.1100     28.8600
+     10.4516   1544.4900     36.1100     28.8400
+     10.5891   1544.4400     36.1100     28.8200
+     10.7266   1544.4000     36.1000     28.8000
+     10.8641   1544.3600     36.1000     28.7800
+     11.0016   1544.3400     36.1000     28.7700
+     11.1390   1544.3200     36.1000     28.7600
+     11.2765   1544.3000     36.0900     28.7600
+     11.4140   1544.2900     36.0900     28.7500
+     11.5515   1544.2900     36.1000     28.7500
+     11.6889   1544.2900     36.1000     28.7500
+     11.8264   1544.2900     36.1000     28.7400
+     11.9639   1544.2900     36.1000     28.7400
+     12.1014   1544.3000     36.1000     28.7400
+     12.2388   1544.3000     36.1100     28.7400
+     12.3763   1544.3000     36.1100     28.7400
+     12.5138   1544.3100     36.1100     28.7400
+     12.6512   1544.3200     36.1100     28.7400
+     12.7887   1544.3200     36.1100     28.7400
+     12.9262   1544.3300     36.1100     28.7500
+     13.0636   1544.3300     36.1200     28.7500
+     13.2011   1544.3400     36.1200     28.7500
+     13.3386   1544.3500     36.1200     28.7500
+     13.4760   1544.3500     36.1200     28.7500
+     13.6135   1544.3600     36.1200     28.7500
+     13.7510   1544.3600     36.1200     28.7500
+     13.8884   1544.3700     36.1200     28.7500
+     14.0259   1544.3800     36.1300     28.7500
+     14.1633   1544.3800     36.1300     28.7500
+     14.3008   1544.3900     36.1300     28.7500
+     14.4382   1544.3900     36.1300     28.7500
+     14.5757   1544.4000     36.1400     28.7500
+     14.7132   1544.4000     36.1400     28.7500
+     14.8506   1544.4100     36.1400     28.7500
+     14.9881   1544.4100     36.1400     28.7500
+     15.1255   1544.4100     36.1400     28.7500
+     15.2630   1544.4200     36.1400     28.7500
+     15.4004   1544.4200     36.1500     28.7500
+     15.5379   1544.4200     36.1500     28.7500
+     15.6753   1544.4200     36.1500     28.7500
+     15.8127   1544.4300     36.1500     28.7500
+     15.9502   1544.4300     36.1500     28.7500
+     16.0876   1544.4300     36.1500     28.7500
+     16.2251   1544.4400     36.1500     28.7500
+     16.3625   1544.4400     36.1500     28.7500
+     16.5000   1544.4500     36.1500     28.7500
+     16.6374   1544.4500     36.1600     28.7500
+     16.7748   1544.4500     36.1600     28.7500
+     16.9123   1544.4500     36.1600     28.7500
+     17.0497   1544.4500     36.1600     28.7500
+     17.1871   1544.4500     36.1600     28.7500
+     17.3246   1544.4500     36.1600     28.7500
+     17.4620   1544.4600     36.1600     28.7500
+     17.5995   1544.4600     36.1600     28.7400
+     17.7369   1544.4600     36.1600     28.7400
+     17.8743   1544.4600     36.1700     28.7400
+     18.0117   1544.4600     36.1700     28.7400
+     18.1492   1544.4600     36.1700     28.7400
+     18.2866   1544.4600     36.1700     28.7400
+     18.4240   1544.4600     36.1700     28.7400
+     18.5615   1544.4600     36.1700     28.7400
+     18.6989   1544.4600     36.1700     28.7400
+     18.8363   1544.4600     36.1700     28.7300
+     18.9737   1544.4600     36.1700     28.7300
+     19.1111   1544.4600     36.1700     28.7300
+     19.2486   1544.4600     36.1700     28.7300
+     19.3860   1544.4600     36.1700     28.7300
+     19.5234   1544.4600     36.1600     28.7300
+     19.6608   1544.4600     36.1600     28.7300
+     19.7982   1544.4600     36.1600     28.7300
+     19.9357   1544.4600     36.1600     28.7300
+     20.0731   1544.4600     36.1600     28.7300
+     20.2105   1544.4700     36.1600     28.7300
+     20.3479   1544.4700     36.1600     28.7300
+     20.4853   1544.4700     36.1600     28.7300
+     20.6227   1544.4700     36.1600     28.7200
+     20.7601   1544.4700     36.1600     28.7200
+     20.8975   1544.4600     36.1600     28.7200
+     21.0349   1544.4600     36.1600     28.7200
+     21.1724   1544.4700     36.1600     28.7200
+     21.3098   1544.4700     36.1600     28.7200
+     21.4472   1544.4600     36.1600     28.7200
+     21.5846   1544.4600     36.1600     28.7200
+     21.7220   1544.4600     36.1600     28.7200
+     21.8594   1544.4600     36.1600     28.7100
+     21.9968   1544.4600     36.1600     28.7100
+     22.1342   1544.4700     36.1700     28.7100
+     22.2716   1544.4700     36.1600     28.7100
+     22.4090   1544.4700     36.1600     28.7100
+     22.5464   1544.4700     36.1700     28.7100
+     22.6838   1544.4700     36.1700     28.7100
+     22.8212   1544.4800     36.1700     28.7100
+     22.9586   1544.4800     36.1700     28.7100
+     23.0959   1544.4800     36.1700     28.7100
+     23.2333   1544.4800     36.1700     28.7100
+     23.3707   1544.4800     36.1700     28.7100
+     23.5081   1544.4900     36.1700     28.7100
+     23.6455   1544.4900     36.1700     28.7100
+     23.7829   1544.4900     36.1700     28.7100
+     23.9203   1544.4900     36.1700     28.7100
+     24.0577   1544.5000     36.1700     28.7100
+     24.1951   1544.5000     36.1700     28.7100
+     24.3324   1544.5000     36.1700     28.7100
+     24.4698   1544.5000     36.1700     28.7100
+     24.6072   1544.5000     36.1700     28.7100
+     24.7446   1544.5000     36.1700     28.7100
+     24.8820   1544.5000     36.1700     28.7100
+     25.0193   1544.5000     36.1700     28.7000
+     25.1567   1544.5000     36.1700     28.7000
+     25.2941   1544.5000     36.1700     28.7000
+     25.4315   1544.5000     36.1700     28.7000
+     25.5689   1544.5100     36.1700     28.7000
+     25.7062   1544.5000     36.1700     28.7000
+     25.8436   1544.5000     36.1700     28.7000
+     25.9810   1544.5000     36.1700     28.7000
+     26.1183   1544.5000     36.1700     28.7000
+     26.2557   1544.5000     36.1700     28.6900
+     26.3931   1544.5000     36.1700     28.6900
+     26.5304   1544.5000     36.1700     28.6900
+     26.6678   1544.5000     36.1700     28.6900
+     26.8052   1544.5000     36.1700     28.6900
+     26.9425   1544.5100     36.1700     28.6900
+     27.0799   1544.5100     36.1700     28.6900
+     27.2173   1544.5100     36.1700     28.6900
+     27.3546   1544.5100     36.1700     28.6900
+     27.4920   1544.5100     36.1700     28.6900
+     27.6294   1544.5200     36.1700     28.6900
+     27.7667   1544.5200     36.1700     28.6900
+     27.9041   1544.5200     36.1700     28.6900
+     28.0414   1544.5200     36.1700     28.6900
+     28.1788   1544.5300     36.1700     28.6900
+     28.3161   1544.5300     36.1700     28.6900
+     28.4535   1544.5300     36.1700     28.6900
+     28.5909   1544.5300     36.1700     28.6900
+     28.7282   1544.5300     36.1700     28.6900
+     28.8656   1544.5300     36.1700     28.6900
+     29.0029   1544.5300     36.1700     28.6900
+     29.1403   1544.5300     36.1700     28.6800
+     29.2776   1544.5300     36.1700     28.6800
+     29.4150   1544.5300     36.1700     28.6800
+     29.5523   1544.5300     36.1700     28.6800
+     29.6896   1544.5400     36.1800     28.6800
+     29.8270   1544.5400     36.1800     28.6800
+     29.9643   1544.5400     36.1800     28.6800
+     30.1017   1544.5400     36.1800     28.6800
+     30.2390   1544.5400     36.1800     28.6800
+     30.3764   1544.5500     36.1800     28.6800
+     30.5137   1544.5500     36.1800     28.6800
+     30.6510   1544.5500     36.1800     28.6800
+     30.7884   1544.5500     36.1800     28.6800
+     30.9257   1544.5500     36.1800     28.6800
+     31.0630   1544.5500     36.1800     28.6700
+     31.2004   1544.5500     36.1800     28.6700
+     31.3377   1544.5500     36.1800     28.6700
+     31.4750   1544.5500     36.1800     28.6700
+     31.6124   1544.5500     36.1800     28.6700
+     31.7497   1544.5600     36.1800     28.6700
+     31.8870   1544.5500     36.1800     28.6700
+     32.0244   1544.5600     36.1800     28.6700
+     32.1617   1544.5600     36.1800     28.6700
+     32.2990   1544.5600     36.1800     28.6700
+     32.4363   1544.5600     36.1800     28.6700
+     32.5737   1544.5600     36.1900     28.6600
+     32.7110   1544.5600     36.1900     28.6600
+     32.8483   1544.5600     36.1900     28.6600
+     32.9856   1544.5600     36.1900     28.6600
+     33.1230   1544.5700     36.1900     28.6600
+     33.2603   1544.5700     36.1900     28.6600
+     33.3976   1544.5700     36.1900     28.6600
+     33.5349   1544.5700     36.1900     28.6600
+     33.6722   1544.5700     36.1900     28.6600
+     33.8095   1544.5700     36.1900     28.6600
+     33.9469   1544.5700     36.1900     28.6600
+     34.0842   1544.5700     36.1900     28.6500
+     34.2215   1544.5700     36.1900     28.6500
+     34.3588   1544.5600     36.2000     28.6500
+     34.4961   1544.5600     36.2000     28.6500
+     34.6334   1544.5600     36.2000     28.6400
+     34.7707   1544.5600     36.2000     28.6400
+     34.9080   1544.5500     36.2000     28.6400
+     35.0453   1544.5400     36.2000     28.6300
+     35.1826   1544.5300     36.2100     28.6200
+     35.3200   1544.5200     36.2100     28.6100
+     35.4573   1544.5000     36.2100     28.6000
+     35.5946   1544.4800     36.2100     28.5900
+     35.7319   1544.4600     36.2200     28.5800
+     35.8692   1544.4300     36.2200     28.5600
+     36.0065   1544.4000     36.2200     28.5500
+     36.1438   1544.3700     36.2300     28.5300
+     36.2811   1544.3500     36.2300     28.5200
+     36.4184   1544.3200     36.2300     28.5000
+     36.5557   1544.2800     36.2400     28.4800
+     36.6929   1544.2400     36.2400     28.4600
+     36.8302   1544.1900     36.2500     28.4300
+     36.9675   1544.1400     36.2600     28.4000
+     37.1048   1544.0700     36.2700     28.3600
+     37.2421   1543.9900     36.2800     28.3200
+     37.3794   1543.8900     36.2900     28.2700
+     37.5167   1543.7900     36.3000     28.2200
+     37.6540   1543.6800     36.3000     28.1600
+     37.7913   1543.5700     36.3100     28.1100
+     37.9286   1543.4600     36.3200     28.0500
+     38.0658   1543.3500     36.3200     28.0000
+     38.2031   1543.2600     36.3200     27.9600
+     38.3404   1543.1700     36.3100     27.9200
+     38.4777   1543.1000     36.3100     27.8900
+     38.6150   1543.0400     36.3100     27.8600
+     38.7523   1542.9800     36.3100     27.8300
+     38.8895   1542.9300     36.3100     27.8100
+     39.0268   1542.8900     36.3100     27.7900
+     39.1641   1542.8400     36.3100     27.7700
+     39.3014   1542.7900     36.3100     27.7400
+     39.4386   1542.7300     36.3100     27.7100
+     39.5759   1542.6600     36.3100     27.6800
+     39.7132   1542.5900     36.3200     27.6500
+     39.8505   1542.5200     36.3200     27.6100
+     39.9877   1542.4500     36.3200     27.5800
+     40.1250   1542.3700     36.3200     27.5500
+     40.2623   1542.3000     36.3100     27.5100
+     40.3995   1542.2400     36.3100     27.4900
+     40.5368   1542.1900     36.3100     27.4600
+     40.6741   1542.1400     36.3100     27.4400
+     40.8113   1542.1000     36.3200     27.4200
+     40.9486   1542.0600     36.3200     27.4000
+     41.0859   1542.0100     36.3200     27.3700
+     41.2231   1541.9600     36.3200     27.3500
+     41.3604   1541.9000     36.3300     27.3200
+     41.4976   1541.8500     36.3300     27.2900
+     41.6349   1541.7800     36.3400     27.2600
+     41.7722   1541.7100     36.3400     27.2200
+     41.9094   1541.6200     36.3500     27.1800
+     42.0467   1541.5400     36.3500     27.1400
+     42.1839   1541.4500     36.3600     27.1000
+     42.3212   1541.3600     36.3600     27.0500
+     42.4584   1541.2400     36.3700     27.0000
+     42.5957   1541.1300     36.3800     26.9400
+     42.7329   1541.0000     36.3900     26.8800
+     42.8702   1540.8500     36.3900     26.8100
+     43.0074   1540.7100     36.3900     26.7500
+     43.1447   1540.5600     36.3900     26.6800
+     43.2819   1540.4200     36.4000     26.6200
+     43.4192   1540.2700     36.4000     26.5500
+     43.5564   1540.1300     36.4100     26.4900
+     43.6937   1540.0100     36.4100     26.4300
+     43.8309   1539.8900     36.4100     26.3800
+     43.9682   1539.7900     36.4000     26.3400
+     44.1054   1539.7000     36.4100     26.2900
+     44.2426   1539.6200     36.4100     26.2600
+     44.3799   1539.5300     36.4100     26.2200
+     44.5171   1539.4600     36.4100     26.1800
+     44.6544   1539.3800     36.4100     26.1500
+     44.7916   1539.3100     36.4100     26.1200
+     44.9288   1539.2500     36.4100     26.1000
+     45.0661   1539.2000     36.4100     26.0700
+     45.2033   1539.1400     36.4100     26.0500
+     45.3405   1539.0800     36.4100     26.0200
+     45.4778   1539.0300     36.4100     26.0000
+     45.6150   1538.9800     36.4100     25.9700
+     45.7522   1538.9200     36.4100     25.9400
+     45.8894   1538.8600     36.4200     25.9200
+     46.0267   1538.8000     36.4200     25.8900
+     46.1639   1538.7300     36.4300     25.8500
+     46.3011   1538.6700     36.4400     25.8200
+     46.4383   1538.6000     36.4400     25.7900
+     46.5756   1538.5200     36.4500     25.7500
+     46.7128   1538.4500     36.4500     25.7200
+     46.8500   1538.3800     36.4600     25.6900
+     46.9872   1538.3200     36.4700     25.6500
+     47.1245   1538.2500     36.4700     25.6200
+     47.2617   1538.1900     36.4800     25.5900
+     47.3989   1538.1200     36.4900     25.5600
+     47.5361   1538.0600     36.4900     25.5300
+     47.6733   1537.9900     36.4900     25.5000
+     47.8105   1537.9400     36.4900     25.4700
+     47.9477   1537.8800     36.4900     25.4500
+     48.0850   1537.8200     36.4900     25.4200
+     48.2222   1537.7800     36.5000     25.4000
+     48.3594   1537.7300     36.5000     25.3800
+     48.4966   1537.7000     36.5000     25.3700
+     48.6338   1537.6700     36.5000     25.3500
+     48.7710   1537.6400     36.5000     25.3400
+     48.9082   1537.6300     36.5000     25.3300
+     49.0454   1537.6100     36.5000     25.3300
+     49.1826   1537.6000     36.5000     25.3200
+     49.3198   1537.6000     36.5100     25.3100
+     49.4570   1537.5800     36.5100     25.3100
+     49.5942   1537.5700     36.5100     25.3000
+     49.7314   1537.5500     36.5100     25.2900
+     49.8686   1537.5400     36.5100     25.2800
+     50.0058   1537.5200     36.5100     25.2700
+     50.1430   1537.4900     36.5100     25.2600
+     50.2802   1537.4700     36.5200     25.2500
+     50.4174   1537.4300     36.5200     25.2300
+     50.5546   1537.4000     36.5200     25.2200
+     50.6918   1537.3600     36.5200     25.2000
+     50.8290   1537.3200     36.5200     25.1800
+     50.9662   1537.2700     36.5200     25.1600
+     51.1034   1537.2300     36.5300     25.1400
+     51.2406   1537.1900     36.5300     25.1200
+     51.3778   1537.1500     36.5300     25.1000
+     51.5149   1537.1100     36.5300     25.0800
+     51.6521   1537.0700     36.5300     25.0700
+     51.7893   1537.0400     36.5300     25.0500
+     51.9265   1537.0200     36.5300     25.0400
+     52.0637   1537.0000     36.5400     25.0300
+     52.2009   1536.9800     36.5400     25.0200
+     52.3381   1536.9700     36.5400     25.0200
+     52.4752   1536.9600     36.5400     25.0100
+     52.6124   1536.9500     36.5400     25.0100
+     52.7496   1536.9500     36.5400     25.0000
+     52.8868   1536.9400     36.5400     25.0000
+     53.0239   1536.9400     36.5400     25.0000
+     53.1611   1536.9300     36.5400     24.9900
+     53.2983   1536.9200     36.5400     24.9900
+     53.4355   1536.9200     36.5400     24.9900
+     53.5726   1536.9200     36.5400     24.9900
+     53.7098   1536.9100     36.5400     24.9800
+     53.8470   1536.9100     36.5400     24.9800
+     53.9842   1536.9100     36.5400     24.9800
+     54.1213   1536.9000     36.5400     24.9800
+     54.2585   1536.9000     36.5400     24.9700
+     54.3957   1536.8900     36.5400     24.9700
+     54.5328   1536.8900     36.5400     24.9700
+     54.6700   1536.8800     36.5400     24.9600
+     54.8072   1536.8700     36.5400     24.9600
+     54.9443   1536.8600     36.5400     24.9500
+     55.0815   1536.8400     36.5400     24.9400
+     55.2186   1536.8300     36.5400     24.9400
+     55.3558   1536.8100     36.5400     24.9300
+     55.4930   1536.7900     36.5400     24.9200
+     55.6301   1536.7700     36.5400     24.9100
+     55.7673   1536.7600     36.5400     24.9000
+     55.9044   1536.7400     36.5400     24.8900
+     56.0416   1536.7200     36.5500     24.8800
+     56.1787   1536.7000     36.5400     24.8800
+     56.3159   1536.6800     36.5500     24.8700
+     56.4530   1536.6600     36.5500     24.8500
+     56.5902   1536.6400     36.5500     24.8400
+     56.7273   1536.6100     36.5500     24.8300
+     56.8645   1536.5900     36.5500     24.8200
+     57.0016   1536.5600     36.5500     24.8100
+     57.1388   1536.5400     36.5500     24.8000
+     57.2759   1536.5100     36.5600     24.7800
+     57.4131   1536.4900     36.5600     24.7700
+     57.5502   1536.4800     36.5700     24.7600
+     57.6874   1536.4600     36.5700     24.7600
+     57.8245   1536.4500     36.5700     24.7500
+     57.9617   1536.4400     36.5700     24.7400
+     58.0988   1536.4400     36.5800     24.7400
+     58.2359   1536.4300     36.5800     24.7300
+     58.3731   1536.4200     36.5800     24.7300
+     58.5102   1536.4200     36.5800     24.7200
+     58.6473   1536.4100     36.5800     24.7200
+     58.7845   1536.4100     36.5800     24.7200
+     58.9216   1536.4000     36.5900     24.7100
+     59.0587   1536.3900     36.5900     24.7100
+     59.1959   1536.3700     36.5900     24.7000
+     59.3330   1536.3500     36.5900     24.6900
+     59.4701   1536.3300     36.5900     24.6800
+     59.6073   1536.3000     36.5900     24.6700
+     59.7444   1536.2700     36.5800     24.6500
+     59.8815   1536.2300     36.5800     24.6400
+     60.0187   1536.1800     36.5800     24.6200
+     60.1558   1536.1300     36.5800     24.5900
+     60.2929   1536.0700     36.5800     24.5700
+     60.4300   1536.0100     36.5700     24.5500
+     60.5671   1535.9500     36.5600     24.5200
+     60.7043   1535.8900     36.5600     24.5000
+     60.8414   1535.8300     36.5600     24.4800
+     60.9785   1535.7700     36.5600     24.4500
+     61.1156   1535.7200     36.5500     24.4300
+     61.2527   1535.6700     36.5500     24.4100
+     61.3899   1535.6300     36.5500     24.4000
+     61.5270   1535.5900     36.5500     24.3800
+     61.6641   1535.5500     36.5500     24.3600
+     61.8012   1535.5100     36.5500     24.3400
+     61.9383   1535.4700     36.5500     24.3200
+     62.0754   1535.4300     36.5500     24.3100
+     62.2125   1535.3900     36.5500     24.2900
+     62.3496   1535.3600     36.5500     24.2700
+     62.4868   1535.3200     36.5600     24.2600
+     62.6239   1535.2900     36.5600     24.2500
+     62.7610   1535.2700     36.5600     24.2300
+     62.8981   1535.2500     36.5600     24.2200
+     63.0352   1535.2300     36.5600     24.2200
+     63.1723   1535.2100     36.5600     24.2100
+     63.3094   1535.2000     36.5600     24.2000
+     63.4465   1535.1900     36.5600     24.1900
+     63.5836   1535.1800     36.5700     24.1900
+     63.7207   1535.1700     36.5700     24.1900
+     63.8578   1535.1700     36.5700     24.1800
+     63.9949   1535.1600     36.5700     24.1800
+     64.1320   1535.1600     36.5700     24.1800
+     64.2691   1535.1600     36.5700     24.1700
+     64.4062   1535.1500     36.5700     24.1700
+     64.5433   1535.1500     36.5700     24.1700
+     64.6804   1535.1500     36.5700     24.1600
+     64.8174   1535.1400     36.5800     24.1600
+     64.9545   1535.1400     36.5700     24.1600
+     65.0916   1535.1300     36.5800     24.1500
+     65.2287   1535.1200     36.5800     24.1500
+     65.3658   1535.1200     36.5800     24.1500
+     65.5029   1535.1100     36.5800     24.1400
+     65.6400   1535.1000     36.5800     24.1400
+     65.7771   1535.0900     36.5800     24.1300
+     65.9141   1535.0800     36.5800     24.1300
+     66.0512   1535.0700     36.5800     24.1200
+     66.1883   1535.0600     36.5800     24.1200
+     66.3254   1535.0500     36.5800     24.1100
+     66.4625   1535.0400     36.5800     24.1100
+     66.5995   1535.0200     36.5700     24.1000
+     66.7366   1535.0100     36.5800     24.1000
+     66.8737   1535.0000     36.5800     24.0900
+     67.0108   1534.9900     36.5800     24.0800
+     67.1478   1534.9700     36.5800     24.0700
+     67.2849   1534.9500     36.5800     24.0700
+     67.4220   1534.9300     36.5800     24.0600
+     67.5591   1534.9200     36.5800     24.0500
+     67.6961   1534.9000     36.5800     24.0400
+     67.8332   1534.8700     36.5800     24.0300
+     67.9703   1534.8400     36.5800     24.0100
+     68.1073   1534.8100     36.5900     24.0000
+     68.2444   1534.7800     36.5900     23.9800
+     68.3815   1534.7400     36.5900     23.9700
+     68.5185   1534.7000     36.5900     23.9500
+     68.6556   1534.6600     36.5900     23.9300
+     68.7927   1534.6200     36.5900     23.9200
+     68.9297   1534.5800     36.5900     23.9000
+     69.0668   1534.5400     36.5900     23.8800
+     69.2038   1534.5100     36.5900     23.8700
+     69.3409   1534.4800     36.5900     23.8500
+     69.4780   1534.4500     36.5900     23.8400
+     69.6150   1534.4200     36.5900     23.8300
+     69.7521   1534.3900     36.5900     23.8100
+     69.8891   1534.3600     36.5900     23.8000
+     70.0262   1534.3200     36.5900     23.7900
+     70.1632   1534.2900     36.5900     23.7700
+     70.3003   1534.2600     36.5900     23.7600
+     70.4373   1534.2200     36.5900     23.7400
+     70.5744   1534.1900     36.5900     23.7300
+     70.7114   1534.1600     36.5900     23.7200
+     70.8485   1534.1400     36.5900     23.7100
+     70.9855   1534.1100     36.5900     23.7000
+     71.1226   1534.0800     36.5900     23.6800
+     71.2596   1534.0600     36.5900     23.6700
+     71.3967   1534.0300     36.5900     23.6600
+     71.5337   1534.0100     36.5900     23.6500
+     71.6707   1533.9700     36.6000     23.6300
+     71.8078   1533.9300     36.6000     23.6200
+     71.9448   1533.8900     36.6000     23.6000
+     72.0819   1533.8300     36.5900     23.5700
+     72.2189   1533.7800     36.5900     23.5500
+     72.3559   1533.7300     36.5900     23.5300
+     72.4930   1533.6700     36.5900     23.5100
+     72.6300   1533.6300     36.5900     23.4900
+     72.7671   1533.5800     36.5900     23.4700
+     72.9041   1533.5400     36.5900     23.4600
+     73.0411   1533.5200     36.5900     23.4500
+     73.1781   1533.4900     36.5800     23.4400
+     73.3152   1533.4800     36.5800     23.4300
+     73.4522   1533.4700     36.5800     23.4300
+     73.5892   1533.4700     36.5900     23.4200
+     73.7263   1533.4600     36.5900     23.4200
+     73.8633   1533.4600     36.5900     23.4100
+     74.0003   1533.4500     36.5900     23.4100
+     74.1373   1533.4500     36.5900     23.4100
+     74.2744   1533.4300     36.6000     23.4000
+     74.4114   1533.4000     36.6000     23.3800
+     74.5484   1533.3600     36.6100     23.3600
+     74.6854   1533.3100     36.6100     23.3400
+     74.8224   1452.5100     36.6100      0.0000
+     76.3296   1492.7500      0.0000     23.1000
+     76.4666   1492.7300      0.0000     23.0900
+     76.6036   1492.7100      0.0100     23.0800
+     76.7406   1532.6300     36.5800     23.0700
+     76.8776   1532.6100     36.5800     23.0600
+     77.0146   1532.5800     36.5800     23.0500
+     77.1516   1532.5500     36.5800     23.0400
+     77.2886   1532.5100     36.5800     23.0200
+     77.4256   1532.4600     36.5800     23.0000
+     77.5626   1532.4100     36.5700     22.9800
+     77.6996   1532.3600     36.5700     22.9600
+     77.8366   1532.3000     36.5700     22.9400
+     77.9736   1532.2500     36.5700     22.9200
+     78.1106   1532.2100     36.5700     22.9000
+     78.2476   1532.1600     36.5700     22.8800
+     78.3846   1532.1300     36.5600     22.8700
+     78.5216   1532.1000     36.5600     22.8600
+     78.6586   1532.0800     36.5600     22.8500
+     78.7956   1532.0600     36.5600     22.8400
+     78.9325   1532.0600     36.5600     22.8400
+     79.0695   1532.0500     36.5600     22.8400
+     79.2065   1532.0500     36.5700     22.8300
+     79.3435   1532.0400     36.5700     22.8300
+     79.4805   1532.0400     36.5700     22.8300
+     79.6175   1532.0300     36.5700     22.8200
+     79.7545   1532.0300     36.5700     22.8200
+     79.8914   1532.0200     36.5700     22.8200
+     80.0284   1532.0100     36.5700     22.8100
+     80.1654   1531.9900     36.5700     22.8000
+     80.3024   1531.9600     36.5700     22.7900
+     80.4394   1531.9400     36.5700     22.7800
+     80.5763   1531.9100     36.5700     22.7700
+     80.7133   1531.8700     36.5700     22.7500
+     80.8503   1531.8400     36.5700     22.7400
+     80.9873   1531.8000     36.5700     22.7200
+     81.1242   1531.7700     36.5700     22.7100
+     81.2612   1531.7300     36.5700     22.7000
+     81.3982   1531.7100     36.5700     22.6800
+     81.5352   1531.6800     36.5700     22.6800
+     81.6721   1531.6600     36.5700     22.6700
+     81.8091   1531.6400     36.5600     22.6600
+     81.9461   1531.6200     36.5700     22.6500
+     82.0830   1531.6100     36.5700     22.6400
+     82.2200   1531.5900     36.5700     22.6300
+     82.3570   1531.5700     36.5700     22.6200
+     82.4939   1531.5400     36.5700     22.6100
+     82.6309   1531.5200     36.5700     22.6000
+     82.7679   1531.4900     36.5700     22.5900
+     82.9048   1531.4600     36.5700     22.5800
+     83.0418   1531.4400     36.5600     22.5700
+     83.1787   1531.4100     36.5600     22.5600
+     83.3157   1531.3900     36.5600     22.5500
+     83.4526   1452.5900     36.5600      0.0000
+     84.8222   1491.0400      0.0000     22.4500
+     84.9591   1491.0100      0.0000     22.4400
+     85.0960   1491.0100      0.0100     22.4300
+     85.2330   1531.1000     36.5600     22.4300
+     85.3699   1531.0800     36.5600     22.4200
+     85.5069   1531.0700     36.5600     22.4100
+     85.6438   1531.0600     36.5600     22.4100
+     85.7807   1531.0400     36.5600     22.4000
+     85.9177   1531.0400     36.5600     22.4000
+     86.0546   1531.0300     36.5600     22.3900
+     86.1916   1531.0300     36.5600     22.3900
+     86.3285   1531.0200     36.5600     22.3900
+     86.4654   1531.0300     36.5600     22.3900
+     86.6024   1531.0200     36.5700     22.3900
+     86.7393   1452.6500     36.5700      0.0000
+     87.9716   1490.6800      0.0000     22.3100
+     88.1086   1490.6600      0.0000     22.3000
+     88.2455   1490.6600      0.0100     22.3000
+     88.3824   1530.8100     36.5600     22.2900
+     88.5193   1530.8000     36.5600     22.2900
+     88.6563   1530.7900     36.5700     22.2800
+     88.7932   1452.6800     36.5700      0.0000
+     90.1623   1490.5000      0.0000     22.2400
+     90.2992   1490.4900      0.0000     22.2300
+     90.4361   1490.4900      0.0100     22.2200
+     90.5730   1530.6600     36.5700     22.2200
+     90.7099   1530.6500     36.5700     22.2100
+     90.8468   1530.6400     36.5700     22.2100
+     90.9837   1530.6300     36.5700     22.2000
+     91.1206   1530.6200     36.5700     22.2000
+     91.2575   1530.6200     36.5700     22.2000
+     91.3944   1530.6100     36.5700     22.1900
+     91.5313   1530.6100     36.5700     22.1900
+     91.6682   1530.6000     36.5700     22.1900
+     91.8051   1530.5900     36.5700     22.1800
+     91.9420   1530.5800     36.5800     22.1800
+     92.0789   1530.5700     36.5800     22.1700
+     92.2158   1530.5500     36.5800     22.1600
+     92.3527   1530.5400     36.5800     22.1500
+     92.4896   1530.5100     36.5800     22.1400
+     92.6265   1530.4900     36.5800     22.1400
+     92.7634   1530.4700     36.5800     22.1300
+     92.9002   1530.4500     36.5800     22.1200
+     93.0371   1452.7700     36.5800      0.0000
+     94.2691   1490.0500      0.0000     22.0600
+     94.4060   1490.0400      0.0000     22.0500
+     94.5428   1490.0400      0.0100     22.0500
+     94.6797   1530.2900     36.5800     22.0400
+     94.8166   1530.2800     36.5800     22.0400
+     94.9535   1530.2700     36.5800     22.0300
+     95.0903   1530.2600     36.5800     22.0300
+     95.2272   1530.2600     36.5800     22.0300
+     95.3641   1530.2500     36.5800     22.0200
+     95.5009   1530.2400     36.5800     22.0200
+     95.6378   1530.2300     36.5800     22.0100
+     95.7747   1530.2300     36.5800     22.0100
+     95.9115   1530.2200     36.5800     22.0100
+     96.0484   1530.2100     36.5800     22.0000
+     96.1853   1530.2000     36.5800     22.0000
+     96.3221   1530.2000     36.5800     22.0000
+     96.4590   1530.2000     36.5800     22.0000
+     96.5958   1530.1900     36.5800     22.0000
+     96.7327   1530.1900     36.5800     21.9900
+     96.8696   1530.1900     36.5800     21.9900
+     97.0064   1530.1900     36.5800     21.9900
+     97.1433   1530.1800     36.5800     21.9900
+     97.2801   1530.1900     36.5800     21.9900
+     97.4170   1530.1800     36.5800     21.9800
+     97.5539   1530.1800     36.5800     21.9800
+     97.6907   1530.1800     36.5800     21.9800
+     97.8276   1530.1700     36.5800     21.9800
+     97.9644   1530.1700     36.5800     21.9800
+     98.1013   1530.1700     36.5800     21.9700
+     98.2381   1530.1700     36.5800     21.9700
+     98.3750   1530.1700     36.5800     21.9700
+     98.5118   1530.1600     36.5800     21.9700
+     98.6487   1530.1600     36.5900     21.9700
+     98.7855   1530.1500     36.5900     21.9600
+     98.9223   1530.1400     36.5900     21.9600
+     99.0592   1530.1300     36.5900     21.9500
+     99.1960   1530.1100     36.5800     21.9400
+     99.3329   1530.0900     36.5800     21.9400
+     99.4697   1530.0600     36.5800     21.9300
+     99.6066   1530.0400     36.5800     21.9200
+     99.7434   1530.0100     36.5800     21.9100
+     99.8802   1529.9900     36.5800     21.8900
+    100.0171   1529.9600     36.5800     21.8900
+    100.1539   1529.9400     36.5800     21.8700
+    100.2907   1529.9100     36.5800     21.8600
+    100.4276   1529.8800     36.5800     21.8500
+    100.5644   1529.8600     36.5800     21.8400
+    100.7012   1529.9300     36.5800     21.8700
+    100.8381   1529.8800     36.5600     21.8600
+    100.9749   1529.8400     36.5500     21.8500
+    101.1117   1529.8200     36.5600     21.8300
+    101.2486   1529.7900     36.5600     21.8200
+    101.3854   1529.7600     36.5600     21.8100
+    101.5222   1529.8100     36.5600     21.8300
+    101.6590   1529.7600     36.5400     21.8100
+    101.7958   1529.7100     36.5200     21.8000
+    101.9327   1529.5800     36.5200     21.7500
+    102.0695   1529.5700     36.5400     21.7400
+    102.2063   1529.5600     36.5600     21.7300
+    102.3431   1529.5200     36.5400     21.7200
+    102.4799   1529.5000     36.5400     21.7100
+    102.6168   1529.4800     36.5400     21.7000
+    102.7536   1529.3800     36.5400     21.6600
+    102.8904   1529.3800     36.5600     21.6500
+    103.0272   1529.3900     36.5700     21.6500
+    103.1640   1529.3800     36.5700     21.6400
+    103.3008   1529.3600     36.5700     21.6400
+    103.4377   1529.3400     36.5700     21.6300
+    103.5745   1529.3300     36.5700     21.6200
+    103.7113   1529.3100     36.5700     21.6200
+    103.8481   1529.2900     36.5700     21.6100
+    103.9849   1529.2700     36.5700     21.6000
+    104.1217   1529.2500     36.5700     21.5900
+    104.2585   1529.2200     36.5700     21.5800
+    104.3953   1529.2000     36.5700     21.5700
+    104.5321   1529.1800     36.5700     21.5700
+    104.6689   1529.1700     36.5700     21.5600
+    104.8057   1529.1500     36.5700     21.5500
+    104.9425   1529.1400     36.5700     21.5500
+    105.0793   1529.1300     36.5700     21.5400
+    105.2161   1529.1100     36.5700     21.5300
+    105.3529   1452.9600     36.5700      0.0000
+    106.5840   1488.4400      0.0000     21.4400
+    106.7208   1488.4100      0.0000     21.4300
+    106.8576   1488.4000      0.0100     21.4200
+    106.9944   1528.8200     36.5700     21.4100
+    107.1312   1528.8000     36.5700     21.4000
+    107.2680   1528.7800     36.5700     21.4000
+    107.4048   1528.7700     36.5700     21.3900
+    107.5415   1528.7500     36.5700     21.3800
+    107.6783   1528.7200     36.5700     21.3700
+    107.8151   1528.6900     36.5700     21.3500
+    107.9519   1528.6700     36.5800     21.3500
+    108.0887   1528.6500     36.5800     21.3400
+    108.2254   1528.6200     36.5800     21.3300
+    108.3622   1528.5900     36.5800     21.3100
+    108.4990   1528.5700     36.5800     21.3000
+    108.6358   1528.5400     36.5800     21.2900
+    108.7725   1528.5200     36.5700     21.2800
+    108.9093   1528.5000     36.5700     21.2800
+    109.0461   1528.4700     36.5700     21.2700
+    109.1829   1528.4600     36.5700     21.2600
+    109.3196   1528.4500     36.5700     21.2600
+    109.4564   1528.4300     36.5700     21.2500
+    109.5931   1528.4200     36.5700     21.2500
+    109.7299   1528.4200     36.5700     21.2400
+    109.8667   1528.4100     36.5700     21.2400
+    110.0035   1528.4000     36.5700     21.2300
+    110.1402   1528.4000     36.5700     21.2300
+    110.2770   1528.3900     36.5700     21.2300
+    110.4137   1528.3900     36.5700     21.2300
+    110.5505   1528.3800     36.5700     21.2200
+    110.6872   1528.3800     36.5700     21.2200
+    110.8240   1528.3800     36.5700     21.2200
+    110.9608   1528.3800     36.5700     21.2200
+    111.0975   1528.3700     36.5700     21.2200
+    111.2343   1528.3700     36.5700     21.2200
+    111.3710   1528.3700     36.5700     21.2100
+    111.5078   1528.3700     36.5800     21.2100
+    111.6445   1528.3700     36.5800     21.2100
+    111.7813   1528.3700     36.5800     21.2100
+    111.9180   1528.3700     36.5800     21.2100
+    112.0548   1528.3700     36.5800     21.2000
+    112.1915   1528.3600     36.5800     21.2000
+    112.3283   1528.3500     36.5800     21.2000
+    112.4650   1528.3500     36.5800     21.1900
+    112.6018   1528.3400     36.5800     21.1900
+    112.7385   1528.3300     36.5800     21.1900
+    112.8753   1528.3200     36.5800     21.1800
+    113.0120   1528.3100     36.5800     21.1800
+    113.1488   1528.3000     36.5800     21.1700
+    113.2855   1528.2900     36.5800     21.1700
+    113.4222   1453.1000     36.5800      0.0000
+    114.7896   1487.6200      0.0000     21.1200
+    114.9263   1487.6200      0.0000     21.1100
+    115.0630   1487.6200      0.0100     21.1100
+    115.1997   1528.1600     36.5700     21.1100
+    115.3365   1528.1600     36.5700     21.1100
+    115.4732   1528.1600     36.5700     21.1100
+    115.6099   1528.1600     36.5700     21.1100
+    115.7466   1528.1600     36.5700     21.1100
+    115.8834   1528.1600     36.5700     21.1100
+    116.0201   1528.1700     36.5700     21.1100
+    116.1568   1528.1700     36.5700     21.1100
+    116.2935   1528.1700     36.5700     21.1100
+    116.4302   1528.1700     36.5700     21.1100
+    116.5670   1528.1800     36.5700     21.1100
+    116.7037   1528.1800     36.5700     21.1100
+    116.8404   1528.1800     36.5700     21.1100
+    116.9771   1528.1800     36.5700     21.1100
+    117.1138   1528.1700     36.5800     21.1000
+    117.2505   1528.1600     36.5800     21.1000
+    117.3872   1528.1500     36.5800     21.0900
+    117.5239   1528.1500     36.5800     21.0900
+    117.6607   1528.1400     36.5800     21.0800
+    117.7974   1528.1200     36.5800     21.0800
+    117.9341   1528.1100     36.5800     21.0700
+    118.0708   1528.1000     36.5800     21.0700
+    118.2075   1528.1000     36.5800     21.0700
+    118.3442   1528.0900     36.5800     21.0600
+    118.4809   1528.0900     36.5800     21.0600
+    118.6176   1528.0900     36.5800     21.0600
+    118.7543   1528.0900     36.5800     21.0600
+    118.8910   1528.1000     36.5800     21.0600
+    119.0277   1528.1000     36.5800     21.0600
+    119.1644   1528.1000     36.5800     21.0600
+    119.3011   1528.1100     36.5800     21.0600
+    119.4378   1528.1100     36.5900     21.0600
+    119.5745   1528.1000     36.5900     21.0600
+    119.7112   1528.1000     36.5900     21.0500
+    119.8479   1528.1000     36.5900     21.0500
+    119.9846   1528.0900     36.5900     21.0500
+    120.1212   1528.0800     36.6000     21.0400
+    120.2579   1528.0700     36.6000     21.0400
+    120.3946   1528.0700     36.6000     21.0300
+    120.5313   1528.0600     36.6000     21.0300
+    120.6680   1528.0500     36.6000     21.0300
+    120.8047   1528.0500     36.6000     21.0200
+    120.9414   1528.0400     36.6000     21.0200
+    121.0780   1528.0400     36.6000     21.0200
+    121.2147   1528.0300     36.6000     21.0100
+    121.3514   1528.0200     36.6000     21.0100
+    121.4881   1528.0200     36.6000     21.0100
+    121.6248   1528.0000     36.6000     21.0000
+    121.7615   1527.9800     36.6000     20.9900
+    121.8981   1527.9600     36.6000     20.9800
+    122.0348   1527.9400     36.6000     20.9700
+    122.1715   1527.9100     36.6000     20.9600
+    122.3082   1527.8900     36.6000     20.9500
+    122.4448   1527.8700     36.6000     20.9500
+    122.5815   1527.8500     36.6000     20.9400
+    122.7182   1527.8300     36.6000     20.9300
+    122.8549   1527.8100     36.6000     20.9200
+    122.9915   1527.7900     36.6000     20.9100
+    123.1282   1527.7700     36.6000     20.9100
+    123.2648   1527.7500     36.6000     20.9000
+    123.4015   1527.7300     36.6000     20.8900
+    123.5382   1527.7100     36.6000     20.8800
+    123.6749   1527.6900     36.6000     20.8700
+    123.8115   1527.6700     36.5900     20.8700
+    123.9482   1453.2900     36.5900      0.0000
+    125.1781   1486.9500      0.0000     20.8400
+    125.3148   1486.9500      0.0000     20.8300
+    125.4514   1486.9500      0.0100     20.8300
+    125.5881   1527.5900     36.5900     20.8300
+    125.7247   1527.5800     36.6000     20.8200
+    125.8614   1527.5700     36.6000     20.8100
+    125.9980   1527.5600     36.6000     20.8100
+    126.1346   1527.5400     36.6000     20.8000
+    126.2713   1527.5200     36.5900     20.8000
+    126.4079   1527.5100     36.5900     20.7900
+    126.5446   1527.4900     36.5900     20.7900
+    126.6812   1527.4700     36.5900     20.7800
+    126.8179   1527.4600     36.5900     20.7700
+    126.9545   1527.4400     36.5900     20.7700
+    127.0912   1527.4300     36.5900     20.7600
+    127.2278   1527.4200     36.5900     20.7600
+    127.3644   1527.4100     36.5900     20.7500
+    127.5011   1527.4000     36.5900     20.7500
+    127.6377   1527.3900     36.5900     20.7400
+    127.7743   1527.3800     36.5800     20.7400
+    127.9110   1527.3800     36.5900     20.7400
+    128.0476   1527.3700     36.5900     20.7300
+    128.1842   1527.3600     36.5900     20.7300
+    128.3209   1527.3500     36.5900     20.7200
+    128.4575   1527.3800     36.5900     20.7300
+    128.5941   1527.3500     36.5800     20.7300
+    128.7308   1527.3300     36.5700     20.7200
+    128.8674   1527.3100     36.5700     20.7100
+    129.0040   1527.2900     36.5700     20.7100
+    129.1406   1527.2700     36.5700     20.7000
+    129.2773   1527.2600     36.5600     20.6900
+    129.4139   1527.2400     36.5600     20.6900
+    129.5505   1527.2300     36.5600     20.6800
+    129.6871   1527.1700     36.5600     20.6600
+    129.8237   1527.1700     36.5700     20.6500
+    129.9604   1527.1700     36.5800     20.6500
+    130.0970   1527.1600     36.5800     20.6500
+    130.2336   1527.1600     36.5800     20.6400
+    130.3702   1527.1500     36.5800     20.6400
+    130.5068   1527.1500     36.5800     20.6400
+    130.6434   1527.1400     36.5800     20.6400
+    130.7801   1527.1400     36.5800     20.6300
+    130.9167   1527.1300     36.5800     20.6300
+    131.0533   1527.1200     36.5800     20.6200
+    131.1899   1527.1100     36.5800     20.6200
+    131.3265   1527.1000     36.5800     20.6100
+    131.4631   1527.0800     36.5800     20.6100
+    131.5997   1527.0700     36.5800     20.6000
+    131.7363   1527.0500     36.5700     20.6000
+    131.8729   1527.0400     36.5700     20.5900
+    132.0095   1527.0300     36.5700     20.5900
+    132.1461   1527.0100     36.5700     20.5800
+    132.2827   1527.0000     36.5700     20.5800
+    132.4193   1526.9900     36.5700     20.5700
+    132.5559   1526.9800     36.5700     20.5700
+    132.6926   1526.9700     36.5700     20.5600
+    132.8291   1526.9600     36.5700     20.5600
+    132.9657   1526.9500     36.5700     20.5500
+    133.1023   1526.9300     36.5700     20.5400
+    133.2389   1526.9100     36.5700     20.5400
+    133.3755   1526.8900     36.5700     20.5300
+    133.5121   1526.9200     36.6200     20.5200
+    133.6487   1526.9000     36.6100     20.5100
+    133.7853   1526.8800     36.6100     20.5100
+    133.9219   1526.9100     36.6500     20.5000
+    134.0585   1526.9500     36.7000     20.4900
+    134.1951   1526.9300     36.7000     20.4900
+    134.3317   1526.9200     36.7000     20.4800
+    134.4682   1526.9000     36.7000     20.4700
+    134.6048   1526.8900     36.7000     20.4700
+    134.7414   1526.8200     36.6600     20.4600
+    134.8780   1526.8100     36.6600     20.4600
+    135.0146   1526.8000     36.6600     20.4500
+    135.1512   1526.7300     36.6100     20.4400
+    135.2877   1526.6700     36.5700     20.4400
+    135.4243   1526.6500     36.5600     20.4300
+    135.5609   1526.6400     36.5600     20.4300
+    135.6975   1526.6300     36.5600     20.4200
+    135.8340   1526.6100     36.5600     20.4200
+    135.9706   1526.6000     36.5600     20.4100
+    136.1072   1526.5900     36.5600     20.4100
+    136.2438   1526.5900     36.5600     20.4000
+    136.3804   1526.5800     36.5600     20.4000
+    136.5169   1526.5800     36.5600     20.4000
+    136.6535   1526.5700     36.5600     20.4000
+    136.7901   1526.5700     36.5600     20.3900
+    136.9266   1526.5700     36.5600     20.3900
+    137.0632   1526.5600     36.5600     20.3900
+    137.1998   1526.5600     36.5600     20.3900
+    137.3363   1526.5600     36.5600     20.3900
+    137.4729   1526.5600     36.5600     20.3900
+    137.6095   1526.5600     36.5600     20.3900
+    137.7460   1526.5600     36.5600     20.3800
+    137.8826   1526.5600     36.5600     20.3800
+    138.0191   1526.5600     36.5600     20.3800
+    138.1557   1526.5600     36.5600     20.3800
+    138.2923   1526.5600     36.5600     20.3800
+    138.4288   1526.5600     36.5600     20.3800
+    138.5654   1526.5600     36.5600     20.3800
+    138.7019   1526.5600     36.5600     20.3800
+    138.8385   1526.5600     36.5600     20.3800
+    138.9751   1526.5600     36.5600     20.3800
+    139.1116   1526.5600     36.5600     20.3800
+    139.2482   1526.5600     36.5600     20.3700
+    139.3847   1526.5600     36.5600     20.3700
+    139.5213   1526.5600     36.5700     20.3700
+    139.6578   1526.5500     36.5700     20.3700
+    139.7943   1526.5500     36.5700     20.3700
+    139.9309   1526.5500     36.5700     20.3600
+    140.0674   1526.5400     36.5700     20.3600
+    140.2040   1526.5300     36.5700     20.3600
+    140.3405   1526.5300     36.5700     20.3600
+    140.4771   1526.5200     36.5600     20.3500
+    140.6136   1526.5200     36.5700     20.3500
+    140.7502   1526.5100     36.5600     20.3500
+    140.8867   1526.5000     36.5600     20.3400
+    141.0232   1526.4900     36.5600     20.3400
+    141.1598   1526.4900     36.5600     20.3400
+    141.2963   1526.4800     36.5700     20.3300
+    141.4328   1526.4800     36.5700     20.3300
+    141.5694   1526.4800     36.5700     20.3300
+    141.7059   1526.4700     36.5700     20.3300
+    141.8425   1526.4700     36.5700     20.3200
+    141.9790   1526.4700     36.5700     20.3200
+    142.1155   1526.4700     36.5700     20.3200
+    142.2520   1526.4600     36.5700     20.3200
+    142.3886   1526.4600     36.5700     20.3200
+    142.5251   1526.4600     36.5700     20.3100
+    142.6616   1526.4500     36.5700     20.3100
+    142.7981   1526.4400     36.5700     20.3100
+    142.9347   1526.4400     36.5700     20.3000
+    143.0712   1526.4300     36.5700     20.3000
+    143.2077   1526.4200     36.5700     20.3000
+    143.3442   1526.4200     36.5700     20.2900
+    143.4808   1526.4100     36.5700     20.2900
+    143.6173   1526.4000     36.5700     20.2900
+    143.7538   1526.3900     36.5700     20.2800
+    143.8903   1526.3800     36.5700     20.2800
+    144.0268   1526.3700     36.5700     20.2800
+    144.1634   1526.3600     36.5600     20.2700
+    144.2999   1526.3600     36.5600     20.2700
+    144.4364   1526.3500     36.5600     20.2700
+    144.5729   1526.3500     36.5600     20.2600
+    144.7094   1526.3400     36.5600     20.2600
+    144.8459   1526.3400     36.5600     20.2600
+    144.9824   1526.3300     36.5600     20.2600
+    145.1189   1526.3300     36.5600     20.2500
+    145.2554   1526.3200     36.5700     20.2500
+    145.3920   1526.3200     36.5700     20.2500
+    145.5285   1526.3200     36.5700     20.2500
+    145.6650   1526.3100     36.5700     20.2400
+    145.8015   1526.3100     36.5700     20.2400
+    145.9380   1526.3000     36.5700     20.2400
+    146.0745   1526.3000     36.5700     20.2400
+    146.2110   1526.3000     36.5700     20.2300
+    146.3475   1526.2900     36.5700     20.2300
+    146.4840   1526.2900     36.5700     20.2300
+    146.6205   1526.2800     36.5700     20.2300
+    146.7570   1526.2800     36.5700     20.2200
+    146.8935   1526.2800     36.5700     20.2200
+    147.0300   1526.2700     36.5700     20.2200
+    147.1665   1526.2700     36.5700     20.2200
+    147.3029   1526.2700     36.5700     20.2200
+    147.4394   1526.2700     36.5700     20.2200
+    147.5759   1526.2600     36.5700     20.2100
+    147.7124   1526.2500     36.5700     20.2100
+    147.8489   1526.2400     36.5700     20.2000
+    147.9854   1526.2300     36.5700     20.2000
+    148.1219   1526.2200     36.5700     20.1900
+    148.2584   1526.2100     36.5700     20.1900
+    148.3949   1526.1900     36.5700     20.1800
+    148.5313   1526.1700     36.5600     20.1800
+    148.6678   1526.1500     36.5600     20.1700
+    148.8043   1526.1400     36.5600     20.1600
+    148.9408   1526.1200     36.5600     20.1600
+    149.0773   1526.1000     36.5600     20.1500
+    149.2138   1526.0900     36.5600     20.1400
+    149.3502   1526.0800     36.5600     20.1400
+    149.4867   1526.0600     36.5600     20.1300
+    149.6232   1526.0400     36.5600     20.1300
+    149.7597   1526.0300     36.5600     20.1200
+    149.8961   1526.0200     36.5600     20.1200
+    150.0326   1526.0100     36.5600     20.1100
+    150.1691   1526.0000     36.5600     20.1100
+    150.3056   1525.9900     36.5600     20.1000
+    150.4420   1525.9900     36.5600     20.1000
+    150.5785   1525.9700     36.5600     20.0900
+    150.7150   1525.9700     36.5600     20.0900
+    150.8514   1525.9600     36.5600     20.0900
+    150.9879   1525.9600     36.5600     20.0900
+    151.1244   1525.9500     36.5600     20.0800
+    151.2608   1525.9400     36.5600     20.0800
+    151.3973   1525.9400     36.5600     20.0800
+    151.5338   1525.9400     36.5600     20.0800
+    151.6702   1525.9300     36.5500     20.0700
+    151.8067   1525.9300     36.5500     20.0700
+    151.9431   1525.9200     36.5500     20.0700
+    152.0796   1525.9200     36.5500     20.0700
+    152.2160   1525.9200     36.5500     20.0600
+    152.3525   1525.9100     36.5500     20.0600
+    152.4890   1525.9100     36.5500     20.0600
+    152.6254   1525.9000     36.5500     20.0600
+    152.7619   1525.9000     36.5500     20.0600
+    152.8983   1525.9000     36.5500     20.0500
+    153.0348   1525.8900     36.5500     20.0500
+    153.1712   1525.8900     36.5500     20.0500
+    153.3077   1525.8800     36.5500     20.0500
+    153.4441   1525.8800     36.5500     20.0400
+    153.5806   1525.8700     36.5500     20.0400
+    153.7170   1525.8600     36.5500     20.0400
+    153.8535   1525.8500     36.5500     20.0300
+    153.9899   1525.8400     36.5500     20.0300
+    154.1263   1525.8200     36.5500     20.0200
+    154.2628   1525.8100     36.5500     20.0200
+    154.3992   1525.8000     36.5500     20.0100
+    154.5357   1525.7900     36.5500     20.0100
+    154.6721   1525.7900     36.5500     20.0000
+    154.8086   1525.7900     36.5500     20.0000
+    154.9450   1525.7800     36.5500     20.0000
+    155.0814   1525.7800     36.5500     20.0000
+    155.2179   1525.7800     36.5500     20.0000
+    155.3543   1525.7700     36.5500     19.9900
+    155.4907   1525.7700     36.5500     19.9900
+    155.6272   1525.7600     36.5500     19.9900
+    155.7636   1525.7500     36.5500     19.9800
+    155.9000   1525.7500     36.5600     19.9800
+    156.0365   1525.7400     36.5600     19.9800
+    156.1729   1453.7800     36.5600      0.0000
+    157.4007   1484.8000      0.0000     19.9500
+    157.5371   1484.8100      0.0000     19.9600
+    157.6735   1484.8400      0.0100     19.9600
+    157.8100   1525.7900     36.6000     19.9600
+    157.9464   1525.7900     36.6000     19.9700
+    158.0828   1525.7900     36.5900     19.9700
+    158.2192   1525.7900     36.5800     19.9700
+    158.3556   1525.7900     36.5700     19.9800
+    158.4920   1525.8000     36.5700     19.9800
+    158.6284   1525.8100     36.5700     19.9800
+    158.7648   1525.8200     36.5700     19.9800
+    158.9013   1525.8300     36.5800     19.9800
+    159.0377   1525.8400     36.5800     19.9900
+    159.1741   1525.8500     36.5800     19.9900
+    159.3105   1525.8500     36.5800     19.9900
+    159.4469   1525.8600     36.5800     19.9900
+    159.5833   1525.8600     36.5800     19.9900
+    159.7197   1525.8700     36.5800     19.9900
+    159.8561   1525.8800     36.5800     19.9900
+    159.9925   1525.8800     36.5800     19.9900
+    160.1289   1525.8900     36.5800     19.9900
+    160.2653   1525.8900     36.5800     19.9900
+    160.4017   1525.8900     36.5800     19.9900
+    160.5381   1525.8900     36.5800     19.9900
+    160.6745   1525.8900     36.5900     19.9900
+    160.8109   1525.8800     36.5900     19.9900
+    160.9473   1525.8700     36.5800     19.9800
+    161.0837   1525.8600     36.5800     19.9800
+    161.2201   1525.8500     36.5800     19.9800
+    161.3564   1525.8400     36.5800     19.9700
+    161.4928   1525.8300     36.5800     19.9700
+    161.6292   1525.8200     36.5800     19.9600
+    161.7656   1525.8200     36.5800     19.9600
+    161.9020   1525.8200     36.5800     19.9600
+    162.0384   1525.8200     36.5800     19.9600
+    162.1748   1525.8300     36.5800     19.9600
+    162.3112   1525.8400     36.5800     19.9600
+    162.4475   1525.8500     36.5800     19.9700
+    162.5839   1525.8600     36.5900     19.9700
+    162.7203   1525.8800     36.5900     19.9700
+    162.8567   1525.8900     36.6000     19.9700
+    162.9931   1525.9000     36.6000     19.9800
+    163.1294   1525.9200     36.6000     19.9800
+    163.2658   1525.9300     36.6100     19.9800
+    163.4022   1525.9400     36.6100     19.9800
+    163.5386   1525.9400     36.6100     19.9800
+    163.6749   1525.9500     36.6100     19.9800
+    163.8113   1525.9500     36.6100     19.9900
+    163.9477   1525.9500     36.6100     19.9900
+    164.0841   1525.9500     36.6100     19.9900
+    164.2204   1525.9600     36.6100     19.9900
+    164.3568   1525.9700     36.6100     19.9900
+    164.4932   1525.9700     36.6100     19.9900
+    164.6295   1525.9800     36.6100     19.9900
+    164.7659   1525.9900     36.6100     19.9900
+    164.9023   1526.0000     36.6100     19.9900
+    165.0386   1526.0100     36.6200     20.0000
+    165.1750   1526.0200     36.6200     20.0000
+    165.3114   1526.0300     36.6200     20.0000
+    165.4477   1526.0300     36.6200     20.0000
+    165.5841   1526.0400     36.6200     20.0000
+    165.7204   1526.0400     36.6200     20.0000
+    165.8568   1526.0400     36.6200     20.0000
+    165.9931   1526.0400     36.6200     20.0000
+    166.1295   1526.0400     36.6200     20.0000
+    166.2659   1526.0400     36.6200     20.0000
+    166.4022   1526.0300     36.6200     19.9900
+    166.5386   1526.0300     36.6200     19.9900
+    166.6749   1526.0200     36.6200     19.9900
+    166.8113   1526.0200     36.6200     19.9900
+    166.9476   1526.0100     36.6200     19.9800
+    167.0840   1526.0000     36.6200     19.9800
+    167.2203   1526.0000     36.6200     19.9800
+    167.3567   1525.9900     36.6200     19.9700
+    167.4930   1525.9800     36.6200     19.9700
+    167.6294   1525.9800     36.6200     19.9700
+    167.7657   1525.9700     36.6200     19.9600
+    167.9021   1525.9700     36.6200     19.9600
+    168.0384   1525.9600     36.6200     19.9600
+    168.1747   1525.9600     36.6200     19.9600
+    168.3111   1525.9600     36.6200     19.9600
+    168.4474   1525.9500     36.6200     19.9500
+    168.5838   1525.9500     36.6200     19.9500
+    168.7201   1525.9400     36.6200     19.9500
+    168.8564   1525.9300     36.6200     19.9400
+    168.9928   1525.9200     36.6200     19.9400
+    169.1291   1525.9100     36.6200     19.9300
+    169.2654   1525.8900     36.6200     19.9300
+    169.4018   1525.8700     36.6200     19.9200
+    169.5381   1525.8600     36.6200     19.9100
+    169.6744   1525.8400     36.6200     19.9100
+    169.8108   1525.8200     36.6100     19.9000
+    169.9471   1525.8000     36.6100     19.8900
+    170.0834   1525.7900     36.6100     19.8900
+    170.2197   1454.0700     36.6100      0.0000
+    171.5829   1484.6300      0.0000     19.8200
+    171.7193   1484.6200      0.0000     19.8200
+    171.8556   1484.6200      0.0100     19.8100
+    171.9919   1525.6000     36.6000     19.8100
+    172.1282   1525.5900     36.6000     19.8100
+    172.2645   1525.5800     36.6000     19.8000
+    172.4008   1525.5700     36.6000     19.8000
+    172.5372   1525.5600     36.6000     19.7900
+    172.6734   1525.5500     36.6000     19.7900
+    172.8098   1525.5500     36.6000     19.7900
+    172.9461   1525.5400     36.6000     19.7900
+    173.0824   1525.5300     36.6000     19.7800
+    173.2187   1525.5200     36.6000     19.7800
+    173.3550   1525.5200     36.6000     19.7700
+    173.4913   1525.5100     36.6000     19.7700
+    173.6276   1525.5000     36.6000     19.7700
+    173.7639   1525.4800     36.6000     19.7600
+    173.9002   1525.4700     36.6000     19.7500
+    174.0365   1525.4600     36.6000     19.7500
+    174.1728   1525.4400     36.6000     19.7400
+    174.3091   1525.4300     36.6000     19.7400
+    174.4454   1525.4200     36.6000     19.7300
+    174.5817   1525.4000     36.5900     19.7300
+    174.7180   1525.3900     36.5900     19.7200
+    174.8543   1525.3800     36.5900     19.7200
+    174.9905   1525.3800     36.5900     19.7200
+    175.1268   1525.3700     36.5900     19.7100
+    175.2631   1525.3600     36.5900     19.7100
+    175.3994   1525.3500     36.5900     19.7100
+    175.5357   1525.3500     36.5900     19.7000
+    175.6720   1525.3400     36.5900     19.7000
+    175.8083   1525.3300     36.5900     19.7000
+    175.9446   1525.3200     36.5900     19.6900
+    176.0808   1525.3100     36.5900     19.6900
+    176.2171   1525.3000     36.5900     19.6800
+    176.3534   1525.2900     36.5900     19.6800
+    176.4897   1525.2800     36.5900     19.6700
+    176.6260   1525.2700     36.5900     19.6700
+    176.7623   1525.2600     36.5900     19.6700
+    176.8985   1525.2400     36.5900     19.6600
+    177.0348   1525.2200     36.5900     19.6500
+    177.1711   1525.2100     36.5900     19.6500
+    177.3074   1525.1900     36.5900     19.6400
+    177.4436   1525.1700     36.5900     19.6300
+    177.5799   1525.1500     36.5800     19.6200
+    177.7162   1525.1400     36.5800     19.6200
+    177.8524   1525.1100     36.5800     19.6100
+    177.9887   1525.1000     36.5800     19.6000
+    178.1250   1525.0900     36.5800     19.6000
+    178.2613   1525.0800     36.5800     19.6000
+    178.3975   1525.0700     36.5800     19.5900
+    178.5338   1525.0600     36.5700     19.5900
+    178.6701   1525.0500     36.5800     19.5900
+    178.8063   1525.0500     36.5800     19.5800
+    178.9426   1525.0400     36.5800     19.5800
+    179.0788   1525.0400     36.5800     19.5800
+    179.2151   1525.0400     36.5800     19.5800
+    179.3514   1525.0300     36.5800     19.5700
+    179.4876   1525.0300     36.5800     19.5700
+    179.6239   1525.0300     36.5800     19.5700
+    179.7601   1525.0300     36.5800     19.5700
+    179.8964   1525.0200     36.5800     19.5700
+    180.0327   1525.0200     36.5800     19.5600
+    180.1689   1525.0100     36.5800     19.5600
+    180.3052   1525.0100     36.5800     19.5600
+    180.4414   1525.0000     36.5800     19.5500
+    180.5777   1524.9900     36.5700     19.5500
+    180.7139   1524.9800     36.5700     19.5500
+    180.8502   1524.9700     36.5700     19.5400
+    180.9864   1524.9700     36.5700     19.5400
+    181.1227   1524.9600     36.5700     19.5400
+    181.2589   1524.9500     36.5700     19.5300
+    181.3952   1524.9400     36.5700     19.5300
+    181.5314   1524.9300     36.5700     19.5300
+    181.6676   1524.9200     36.5700     19.5200
+    181.8039   1524.9000     36.5700     19.5100
+    181.9401   1524.8900     36.5700     19.5100
+    182.0764   1524.8800     36.5700     19.5000
+    182.2126   1524.8600     36.5700     19.5000
+    182.3488   1524.8400     36.5700     19.4900
+    182.4851   1524.8300     36.5700     19.4800
+    182.6213   1524.8100     36.5700     19.4800
+    182.7576   1524.7900     36.5700     19.4700
+    182.8938   1524.7800     36.5700     19.4700
+    183.0300   1524.7700     36.5700     19.4600
+    183.1662   1524.7500     36.5700     19.4500
+    183.3025   1524.7400     36.5600     19.4500
+    183.4387   1524.7200     36.5600     19.4400
+    183.5749   1524.7100     36.5600     19.4400
+    183.7112   1524.6900     36.5600     19.4300
+    183.8474   1524.6800     36.5600     19.4300
+    183.9836   1524.6700     36.5600     19.4200
+    184.1198   1524.6500     36.5600     19.4200
+    184.2561   1524.6400     36.5600     19.4100
+    184.3923   1524.6300     36.5600     19.4100
+    184.5285   1524.6200     36.5600     19.4000
+    184.6647   1524.6100     36.5600     19.4000
+    184.8010   1524.6100     36.5600     19.4000
+    184.9372   1524.6000     36.5600     19.3900
+    185.0734   1524.6000     36.5600     19.3900
+    185.2096   1524.6000     36.5600     19.3900
+    185.3458   1524.6000     36.5600     19.3900
+    185.4821   1524.6000     36.5600     19.3900
+    185.6183   1524.6000     36.5600     19.3900
+    185.7545   1524.6000     36.5600     19.3900
+    185.8907   1524.6000     36.5600     19.3900
+    186.0269   1524.6000     36.5600     19.3900
+    186.1631   1524.6000     36.5600     19.3800
+    186.2993   1524.5900     36.5600     19.3800
+    186.4355   1524.5900     36.5600     19.3800
+    186.5717   1524.5900     36.5600     19.3800
+    186.7079   1524.5800     36.5600     19.3700
+    186.8441   1524.5700     36.5600     19.3700
+    186.9803   1524.5700     36.5600     19.3700
+    187.1166   1524.5600     36.5600     19.3700
+    187.2528   1524.5500     36.5600     19.3600
+    187.3890   1524.5500     36.5600     19.3600
+    187.5252   1524.5400     36.5600     19.3600
+    187.6614   1524.5400     36.5600     19.3500
+    187.7976   1524.5300     36.5600     19.3500
+    187.9337   1524.5200     36.5600     19.3500
+    188.0699   1524.5100     36.5600     19.3400
+    188.2061   1524.5100     36.5600     19.3400
+    188.3423   1524.5000     36.5600     19.3400
+    188.4785   1524.4900     36.5600     19.3400
+    188.6147   1524.4900     36.5500     19.3300
+    188.7509   1524.4800     36.5600     19.3300
+    188.8871   1524.4800     36.5600     19.3300
+    189.0233   1524.4700     36.5600     19.3200
+    189.1595   1524.4700     36.5600     19.3200
+    189.2957   1524.4600     36.5600     19.3200
+    189.4319   1524.4600     36.5600     19.3200
+    189.5681   1524.4500     36.5600     19.3100
+    189.7042   1524.4400     36.5600     19.3100
+    189.8404   1524.4300     36.5500     19.3100
+    189.9766   1524.4200     36.5500     19.3000
+    190.1128   1524.4100     36.5500     19.3000
+    190.2490   1524.4000     36.5500     19.2900
+    190.3851   1524.3900     36.5500     19.2900
+    190.5213   1524.3800     36.5500     19.2900
+    190.6575   1524.3700     36.5500     19.2800
+    190.7937   1524.3600     36.5500     19.2800
+    190.9299   1524.3600     36.5500     19.2700
+    191.0660   1524.3400     36.5500     19.2700
+    191.2022   1524.3300     36.5500     19.2700
+    191.3384   1524.3200     36.5500     19.2600
+    191.4745   1524.3200     36.5500     19.2600
+    191.6107   1524.3100     36.5500     19.2600
+    191.7469   1524.3100     36.5500     19.2500
+    191.8831   1524.3000     36.5500     19.2500
+    192.0192   1454.3400     36.5500      0.0000
+    193.2447   1483.1300      0.0000     19.2300
+    193.3809   1483.1300      0.0000     19.2200
+    193.5170   1483.1300      0.0100     19.2200
+    193.6532   1524.2300     36.5400     19.2200
+    193.7893   1524.2200     36.5400     19.2100
+    193.9255   1524.2100     36.5400     19.2100
+    194.0616   1524.2000     36.5400     19.2000
+    194.1978   1524.1900     36.5400     19.2000
+    194.3339   1524.1800     36.5400     19.1900
+    194.4701   1524.1700     36.5400     19.1900
+    194.6062   1524.1600     36.5400     19.1900
+    194.7424   1524.1600     36.5400     19.1800
+    194.8785   1524.1500     36.5400     19.1800
+    195.0147   1524.1500     36.5400     19.1800
+    195.1508   1524.1400     36.5400     19.1800
+    195.2870   1524.1400     36.5400     19.1800
+    195.4231   1524.1400     36.5400     19.1700
+    195.5592   1524.1400     36.5400     19.1700
+    195.6954   1524.1300     36.5400     19.1700
+    195.8315   1524.1300     36.5400     19.1700
+    195.9677   1524.1300     36.5400     19.1700
+    196.1038   1524.1300     36.5400     19.1700
+    196.2399   1524.1300     36.5400     19.1700
+    196.3761   1524.1200     36.5400     19.1600
+    196.5122   1524.1200     36.5400     19.1600
+    196.6483   1524.1100     36.5400     19.1600
+    196.7845   1524.1100     36.5400     19.1600
+    196.9206   1524.1100     36.5400     19.1600
+    197.0567   1524.1100     36.5300     19.1600
+    197.1929   1524.1100     36.5300     19.1500
+    197.3290   1524.1000     36.5300     19.1500
+    197.4651   1524.1000     36.5300     19.1500
+    197.6013   1524.1000     36.5300     19.1500
+    197.7374   1524.1100     36.5300     19.1500
+    197.8735   1524.1100     36.5300     19.1500
+    198.0096   1524.1100     36.5300     19.1500
+    198.1458   1524.1100     36.5400     19.1500
+    198.2819   1524.1100     36.5400     19.1500
+    198.4180   1524.1100     36.5400     19.1500
+    198.5541   1524.1100     36.5400     19.1500
+    198.6902   1524.1100     36.5400     19.1400
+    198.8264   1524.1000     36.5400     19.1400
+    198.9625   1524.0900     36.5400     19.1400
+    199.0986   1524.0800     36.5400     19.1300
+    199.2347   1524.0700     36.5400     19.1300
+    199.3708   1524.0600     36.5300     19.1300
+    199.5069   1524.0500     36.5300     19.1200
+    199.6431   1524.0400     36.5300     19.1200
+    199.7792   1524.0200     36.5300     19.1100
+    199.9153   1524.0100     36.5300     19.1100
+    200.0514   1524.0000     36.5300     19.1000
+    200.1875   1523.9800     36.5300     19.0900
+    200.3236   1523.9700     36.5300     19.0900
+    200.4597   1523.9500     36.5300     19.0800
+    200.5958   1523.9400     36.5300     19.0800
+    200.7319   1523.9300     36.5300     19.0700
+    200.8680   1523.9100     36.5300     19.0700
+    201.0041   1523.8900     36.5200     19.0600
+    201.1402   1523.8800     36.5200     19.0600
+    201.2763   1523.8700     36.5200     19.0500
+    201.4124   1523.8600     36.5200     19.0500
+    201.5485   1523.8500     36.5200     19.0400
+    201.6846   1523.8500     36.5200     19.0400
+    201.8207   1523.8400     36.5200     19.0400
+    201.9568   1523.8400     36.5200     19.0400
+    202.0929   1523.8300     36.5200     19.0300
+    202.2290   1523.8300     36.5200     19.0300
+    202.3651   1523.8200     36.5200     19.0300
+    202.5012   1523.8200     36.5200     19.0300
+    202.6373   1523.8100     36.5200     19.0200
+    202.7733   1523.8000     36.5200     19.0200
+    202.9094   1523.7900     36.5200     19.0100
+    203.0455   1523.7800     36.5200     19.0100
+    203.1816   1523.7600     36.5200     19.0000
+    203.3177   1523.7500     36.5100     19.0000
+    203.4538   1523.7400     36.5100     18.9900
+    203.5899   1523.7200     36.5100     18.9900
+    203.7260   1523.7100     36.5100     18.9800
+    203.8620   1523.7000     36.5100     18.9800
+    203.9981   1523.6900     36.5100     18.9800
+    204.1342   1523.6900     36.5100     18.9700
+    204.2703   1523.6800     36.5100     18.9700
+    204.4064   1523.6800     36.5100     18.9700
+    204.5424   1523.6700     36.5100     18.9700
+    204.6785   1523.6700     36.5100     18.9600
+    204.8146   1523.6600     36.5100     18.9600
+    204.9507   1523.6600     36.5100     18.9600
+    205.0867   1523.6500     36.5100     18.9600
+    205.2228   1523.6500     36.5100     18.9500
+    205.3589   1523.6500     36.5100     18.9500
+    205.4949   1523.6400     36.5100     18.9500
+    205.6310   1523.6300     36.5100     18.9500
+    205.7671   1523.6300     36.5100     18.9400
+    205.9032   1523.6300     36.5100     18.9400
+    206.0392   1523.6200     36.5100     18.9400
+    206.1753   1523.6200     36.5100     18.9400
+    206.3113   1523.6200     36.5100     18.9400
+    206.4474   1523.6200     36.5100     18.9400
+    206.5835   1523.6200     36.5100     18.9400
+    206.7195   1523.6200     36.5100     18.9300
+    206.8556   1523.6100     36.5100     18.9300
+    206.9916   1523.6100     36.5100     18.9300
+    207.1277   1523.6100     36.5100     18.9300
+    207.2637   1523.6000     36.5100     18.9300
+    207.3998   1523.7900     36.5100     18.9900
+    207.5359   1523.9400     36.4800     19.0600
+    207.6719   1524.0600     36.4200     19.1200
+    207.8080   1524.1800     36.3700     19.1900
+    207.9440   1524.3100     36.3100     19.2500
+    208.0801   1454.2100     36.2500      0.0000
+    209.3045   1482.3300      0.0000     18.8900
+    209.4405   1482.3200      0.0000     18.8900
+    209.5766   1482.5400      0.0100     18.9500
+    209.7126   1523.8600     36.4800     19.0200
+    209.8486   1523.9800     36.4200     19.0800
+    209.9847   1524.1000     36.3600     19.1400
+    210.1207   1524.1200     36.3000     19.1700
+    210.2568   1524.1600     36.2600     19.2000
+    210.3928   1524.1200     36.2300     19.2000
+    210.5288   1524.1000     36.2100     19.2000
+    210.6649   1524.0900     36.2100     19.2000
+    210.8009   1523.9000     36.2100     19.1300
+    210.9369   1523.7300     36.2400     19.0600
+    211.0730   1523.6100     36.3000     18.9900
+    211.2090   1523.4800     36.3600     18.9200
+    211.3450   1523.4500     36.4200     18.8900
+    211.4810   1523.4100     36.4600     18.8500
+    211.6171   1523.4400     36.4900     18.8500
+    211.7531   1523.4500     36.5100     18.8500
+    211.8891   1523.4500     36.5100     18.8500
+    212.0251   1523.4500     36.5100     18.8500
+    212.1611   1523.4500     36.5100     18.8500
+    212.2972   1523.4400     36.5100     18.8400
+    212.4332   1523.4400     36.5100     18.8400
+    212.5692   1523.4400     36.5100     18.8400
+    212.7052   1523.4300     36.5100     18.8400
+    212.8412   1523.4300     36.5100     18.8400
+    212.9772   1523.4300     36.5100     18.8300
+    213.1133   1523.4300     36.5100     18.8300
+    213.2493   1523.4200     36.5100     18.8300
+    213.3853   1523.4200     36.5100     18.8300
+    213.5213   1523.4200     36.5100     18.8300
+    213.6573   1523.4100     36.5100     18.8200
+    213.7933   1523.4100     36.5000     18.8200
+    213.9293   1523.4000     36.5000     18.8200
+    214.0653   1523.4000     36.5000     18.8200
+    214.2013   1523.3900     36.5000     18.8100
+    214.3373   1523.3900     36.5100     18.8100
+    214.4734   1523.3900     36.5100     18.8100
+    214.6093   1523.3800     36.5100     18.8100
+    214.7453   1523.3800     36.5100     18.8100
+    214.8814   1523.3800     36.5100     18.8100
+    215.0174   1523.3800     36.5100     18.8000
+    215.1534   1523.3700     36.5100     18.8000
+    215.2894   1523.3700     36.5100     18.8000
+    215.4254   1523.3700     36.5100     18.8000
+    215.5614   1523.3700     36.5100     18.8000
+    215.6973   1523.3600     36.5000     18.7900
+    215.8333   1523.3600     36.5100     18.7900
+    215.9693   1523.3500     36.5000     18.7900
+    216.1053   1523.3400     36.5000     18.7800
+    216.2413   1523.3300     36.5000     18.7800
+    216.3773   1523.3200     36.5000     18.7800
+    216.5133   1523.3100     36.5000     18.7700
+    216.6493   1523.3000     36.5100     18.7700
+    216.7853   1523.2800     36.5100     18.7600
+    216.9212   1523.2700     36.5000     18.7500
+    217.0572   1523.2500     36.5000     18.7500
+    217.1932   1523.2400     36.5000     18.7400
+    217.3292   1523.2300     36.5000     18.7400
+    217.4652   1523.2200     36.5000     18.7400
+    217.6012   1523.2100     36.5000     18.7300
+    217.7372   1523.2000     36.5000     18.7300
+    217.8731   1523.2000     36.5000     18.7200
+    218.0091   1523.1900     36.5000     18.7200
+    218.1451   1523.1900     36.5000     18.7200
+    218.2811   1523.1800     36.5000     18.7200
+    218.4170   1523.1800     36.5000     18.7200
+    218.5530   1523.1700     36.5000     18.7100
+    218.6890   1523.1700     36.5000     18.7100
+    218.8250   1523.1700     36.5000     18.7100
+    218.9609   1523.1700     36.5000     18.7100
+    219.0969   1523.1700     36.5000     18.7100
+    219.2329   1523.1700     36.5000     18.7100
+    219.3689   1523.1700     36.5000     18.7100
+    219.5048   1523.1700     36.5000     18.7100
+    219.6408   1523.1700     36.5000     18.7000
+    219.7767   1523.1700     36.5000     18.7000
+    219.9127   1523.1700     36.5000     18.7000
+    220.0487   1523.1700     36.5000     18.7000
+    220.1846   1523.1700     36.5000     18.7000
+    220.3206   1523.1700     36.5000     18.7000
+    220.4566   1523.1700     36.5000     18.7000
+    220.5925   1523.1700     36.5000     18.7000
+    220.7285   1523.1700     36.5000     18.7000
+    220.8644   1523.1700     36.5000     18.7000
+    221.0004   1523.1700     36.5000     18.7000
+    221.1363   1523.1700     36.5000     18.7000
+    221.2723   1523.1700     36.5000     18.7000
+    221.4082   1523.1800     36.5000     18.7000
+    221.5442   1523.1800     36.5000     18.7000
+    221.6801   1523.1800     36.5000     18.7000
+    221.8161   1523.1800     36.5000     18.7000
+    221.9520   1523.1800     36.5000     18.7000
+    222.0880   1523.1900     36.5000     18.7000
+    222.2240   1523.1800     36.5000     18.7000
+    222.3599   1523.1800     36.5000     18.7000
+    222.4958   1523.1800     36.5000     18.7000
+    222.6318   1523.1800     36.5000     18.6900
+    222.7677   1523.1800     36.5000     18.6900
+    222.9037   1523.1800     36.5000     18.6900
+    223.0396   1523.1700     36.5000     18.6900
+    223.1756   1523.1600     36.5000     18.6800
+    223.3115   1523.1600     36.5000     18.6800
+    223.4474   1523.1500     36.5000     18.6800
+    223.5834   1523.1400     36.5000     18.6700
+    223.7193   1523.1300     36.5000     18.6700
+    223.8553   1523.1300     36.5000     18.6700
+    223.9912   1523.1200     36.5000     18.6600
+    224.1271   1523.1100     36.5000     18.6600
+    224.2630   1523.1100     36.5000     18.6600
+    224.3990   1523.1000     36.5000     18.6500
+    224.5349   1523.0900     36.5000     18.6500
+    224.6708   1523.0900     36.5000     18.6500
+    224.8068   1523.0800     36.5000     18.6500
+    224.9427   1523.0800     36.5000     18.6400
+    225.0786   1523.0700     36.5000     18.6400
+    225.2145   1523.0700     36.5000     18.6400
+    225.3505   1523.0600     36.5000     18.6400
+    225.4864   1523.0600     36.5000     18.6400
+    225.6223   1523.0600     36.5000     18.6300
+    225.7582   1523.0600     36.5000     18.6300
+    225.8942   1523.0500     36.5000     18.6300
+    226.0301   1523.0600     36.5000     18.6300
+    226.1660   1523.0500     36.5000     18.6300
+    226.3019   1523.0500     36.5000     18.6300
+    226.4378   1523.0500     36.5000     18.6300
+    226.5737   1523.0500     36.5000     18.6300
+    226.7097   1523.0500     36.5000     18.6200
+    226.8456   1523.0500     36.5000     18.6200
+    226.9815   1523.0500     36.5000     18.6200
+    227.1174   1523.0500     36.5000     18.6200
+    227.2533   1523.0500     36.5000     18.6200
+    227.3892   1523.0400     36.5000     18.6200
+    227.5251   1523.0400     36.5000     18.6200
+    227.6610   1523.0300     36.5000     18.6100
+    227.7970   1523.0300     36.5000     18.6100
+    227.9329   1523.0200     36.5000     18.6100
+    228.0688   1523.0200     36.4900     18.6100
+    228.2047   1523.0100     36.5000     18.6000
+    228.3406   1523.0100     36.5000     18.6000
+    228.4765   1523.0100     36.5000     18.6000
+    228.6124   1523.0100     36.5000     18.6000
+    228.7483   1523.0100     36.5000     18.6000
+    228.8842   1523.0100     36.5000     18.6000
+    229.0201   1523.0100     36.5000     18.6000
+    229.1560   1523.0100     36.5000     18.5900
+    229.2919   1523.0000     36.5000     18.5900
+    229.4278   1523.0000     36.5000     18.5900
+    229.5637   1522.9900     36.5000     18.5900
+    229.6995   1522.9900     36.5000     18.5900
+    229.8354   1522.9800     36.4900     18.5800
+    229.9713   1522.9700     36.5000     18.5800
+    230.1072   1522.9700     36.5000     18.5800
+    230.2431   1522.9600     36.5000     18.5700
+    230.3790   1522.9600     36.4900     18.5700
+    230.5149   1522.9500     36.4900     18.5700
+    230.6508   1522.9500     36.4900     18.5700
+    230.7866   1522.9500     36.4900     18.5700
+    230.9225   1522.9400     36.4900     18.5600
+    231.0584   1522.9400     36.4900     18.5600
+    231.1943   1522.9400     36.4900     18.5600
+    231.3302   1522.9400     36.4900     18.5600
+    231.4661   1522.9400     36.4900     18.5600
+    231.6020   1522.9300     36.5000     18.5600
+    231.7378   1522.9300     36.5000     18.5500
+    231.8737   1522.9300     36.5000     18.5500
+    232.0096   1522.9300     36.5000     18.5500
+    232.1454   1522.9200     36.5000     18.5500
+    232.2813   1522.9200     36.5000     18.5500
+    232.4172   1522.9100     36.4900     18.5400
+    232.5531   1522.9100     36.4900     18.5400
+    232.6889   1522.9100     36.4900     18.5400
+    232.8248   1522.9100     36.4900     18.5400
+    232.9607   1522.9000     36.4900     18.5400
+    233.0965   1522.9000     36.4900     18.5400
+    233.2324   1522.9000     36.4900     18.5400
+    233.3683   1522.9000     36.4900     18.5300
+    233.5042   1522.8900     36.4900     18.5300
+    233.6400   1522.8900     36.4900     18.5300
+    233.7759   1522.8900     36.4900     18.5300
+    233.9117   1522.8900     36.4900     18.5300
+    234.0476   1522.8900     36.4900     18.5300
+    234.1835   1522.8800     36.4900     18.5300
+    234.3193   1522.8800     36.4900     18.5300
+    234.4552   1522.8800     36.4900     18.5200
+    234.5910   1522.8800     36.4900     18.5200
+    234.7269   1522.8800     36.4900     18.5200
+    234.8627   1522.8700     36.4900     18.5200
+    234.9986   1522.8700     36.4900     18.5200
+    235.1345   1522.8700     36.4900     18.5100
+    235.2703   1522.8600     36.4900     18.5100
+    235.4062   1522.8600     36.4900     18.5100
+    235.5420   1522.8600     36.4900     18.5100
+    235.6779   1522.8500     36.4900     18.5100
+    235.8137   1522.8500     36.4900     18.5000
+    235.9496   1522.8500     36.4900     18.5000
+    236.0854   1522.8500     36.4900     18.5000
+    236.2213   1522.8400     36.4900     18.5000
+    236.3571   1522.8400     36.4900     18.5000
+    236.4929   1522.8400     36.4900     18.5000
+    236.6288   1522.8300     36.4900     18.4900
+    236.7646   1522.8300     36.4900     18.4900
+    236.9005   1522.8200     36.4900     18.4900
+    237.0363   1522.8200     36.4900     18.4900
+    237.1721   1522.8100     36.4900     18.4800
+    237.3080   1522.8100     36.4900     18.4800
+    237.4438   1522.8100     36.4900     18.4800
+    237.5796   1522.8000     36.4900     18.4800
+    237.7155   1522.8000     36.4900     18.4800
+    237.8513   1522.8000     36.4900     18.4800
+    237.9872   1522.7900     36.4900     18.4700
+    238.1230   1522.7900     36.4900     18.4700
+    238.2588   1522.7900     36.4900     18.4700
+    238.3947   1522.7900     36.4900     18.4700
+    238.5305   1522.7800     36.4800     18.4700
+    238.6663   1522.7800     36.4800     18.4700
+    238.8021   1522.7700     36.4800     18.4600
+    238.9379   1522.7700     36.4800     18.4600
+    239.0738   1522.7700     36.4800     18.4600
+    239.2096   1522.7700     36.4800     18.4600
+    239.3454   1522.7700     36.4800     18.4600
+    239.4812   1522.7600     36.4800     18.4600
+    239.6171   1522.7600     36.4800     18.4600
+    239.7529   1522.7700     36.4800     18.4600
+    239.8887   1522.7600     36.4800     18.4500
+    240.0245   1522.7600     36.4800     18.4500
+    240.1603   1522.7600     36.4800     18.4500
+    240.2962   1522.7600     36.4800     18.4500
+    240.4320   1522.7600     36.4800     18.4500
+    240.5678   1522.7600     36.4800     18.4500
+    240.7036   1522.7600     36.4800     18.4500
+    240.8394   1522.7600     36.4800     18.4500
+    240.9752   1522.7600     36.4800     18.4500
+    241.1110   1522.7600     36.4800     18.4400
+    241.2468   1522.7500     36.4800     18.4400
+    241.3826   1522.7500     36.4800     18.4400
+    241.5184   1522.7500     36.4800     18.4400
+    241.6543   1522.7500     36.4800     18.4400
+    241.7901   1522.7500     36.4800     18.4400
+    241.9259   1522.7500     36.4800     18.4400
+    242.0617   1522.7500     36.4900     18.4400
+    242.1975   1522.7500     36.4900     18.4400
+    242.3333   1522.7500     36.4900     18.4400
+    242.4691   1522.7600     36.4800     18.4400
+    242.6049   1522.7500     36.4800     18.4300
+    242.7407   1522.7500     36.4800     18.4300
+    242.8765   1522.7500     36.4800     18.4300
+    243.0123   1522.7500     36.4800     18.4300
+    243.1481   1522.7500     36.4800     18.4300
+    243.2838   1522.7400     36.4800     18.4300
+    243.4196   1522.7400     36.4800     18.4300
+    243.5554   1522.7400     36.4800     18.4200
+    243.6912   1522.7300     36.4800     18.4200
+    243.8270   1522.7300     36.4800     18.4200
+    243.9628   1522.7300     36.4800     18.4200
+    244.0986   1522.7300     36.4800     18.4200
+    244.2344   1522.7300     36.4800     18.4200
+    244.3701   1522.7300     36.4800     18.4100
+    244.5059   1522.7300     36.4800     18.4100
+    244.6417   1522.7200     36.4800     18.4100
+    244.7775   1522.7200     36.4800     18.4100
+    244.9133   1522.7200     36.4800     18.4100
+    245.0491   1522.7200     36.4900     18.4100
+    245.1849   1522.7100     36.4800     18.4100
+    245.3206   1522.7100     36.4800     18.4000
+    245.4564   1522.7000     36.4800     18.4000
+    245.5922   1522.7000     36.4800     18.4000
+    245.7280   1522.6900     36.4800     18.4000
+    245.8637   1522.6900     36.4800     18.3900
+    245.9995   1522.6800     36.4800     18.3900
+    246.1353   1522.6800     36.4800     18.3900
+    246.2711   1522.6700     36.4800     18.3900
+    246.4068   1522.6700     36.4800     18.3800
+    246.5426   1522.6600     36.4800     18.3800
+    246.6784   1522.6600     36.4800     18.3800
+    246.8141   1522.6500     36.4800     18.3800
+    246.9499   1522.6500     36.4800     18.3800
+    247.0857   1522.6500     36.4800     18.3700
+    247.2215   1522.6500     36.4800     18.3700
+    247.3572   1522.6400     36.4800     18.3700
+    247.4930   1522.6400     36.4800     18.3700
+    247.6287   1522.6400     36.4800     18.3700
+    247.7645   1522.6400     36.4800     18.3700
+    247.9002   1522.6400     36.4800     18.3600
+    248.0360   1522.6400     36.4800     18.3600
+    248.1718   1522.6400     36.4800     18.3600
+    248.3075   1522.6400     36.4800     18.3600
+    248.4433   1522.6300     36.4800     18.3600
+    248.5790   1522.6300     36.4800     18.3600
+    248.7148   1522.6300     36.4800     18.3600
+    248.8505   1522.6300     36.4800     18.3600
+    248.9863   1522.6300     36.4800     18.3600
+    249.1220   1522.6300     36.4800     18.3600
+    249.2578   1522.6200     36.4800     18.3500
+    249.3936   1522.6200     36.4700     18.3500
+    249.5293   1522.6100     36.4700     18.3500
+    249.6651   1522.6100     36.4700     18.3500
+    249.8008   1522.6100     36.4700     18.3500
+    249.9366   1522.6100     36.4700     18.3400
+    250.0723   1522.6000     36.4700     18.3400
+    250.2080   1522.6000     36.4700     18.3400
+    250.3438   1522.6000     36.4700     18.3400
+    250.4795   1522.6100     36.4700     18.3400
+    250.6152   1522.6100     36.4800     18.3400
+    250.7510   1522.6100     36.4700     18.3400
+    250.8867   1522.6100     36.4800     18.3400
+    251.0225   1522.6100     36.4800     18.3400
+    251.1582   1522.6100     36.4800     18.3400
+    251.2939   1522.6100     36.4800     18.3400
+    251.4297   1522.6100     36.4800     18.3400
+    251.5654   1522.6100     36.4800     18.3300
+    251.7011   1522.6100     36.4800     18.3300
+    251.8369   1522.6000     36.4800     18.3300
+    251.9726   1522.6100     36.4800     18.3300
+    252.1083   1522.6000     36.4800     18.3300
+    252.2440   1522.6000     36.4800     18.3300
+    252.3798   1522.6000     36.4800     18.3300
+    252.5155   1522.6000     36.4800     18.3300
+    252.6512   1522.6000     36.4800     18.3200
+    252.7870   1522.5900     36.4800     18.3200
+    252.9227   1522.5900     36.4800     18.3200
+    253.0584   1522.5900     36.4800     18.3200
+    253.1941   1522.5800     36.4700     18.3200
+    253.3299   1522.5800     36.4700     18.3200
+    253.4656   1522.5800     36.4700     18.3200
+    253.6013   1522.5800     36.4700     18.3200
+    253.7370   1522.5800     36.4700     18.3100
+    253.8727   1522.5800     36.4700     18.3100
+    254.0084   1522.5800     36.4700     18.3100
+    254.1441   1522.5800     36.4700     18.3100
+    254.2799   1522.5900     36.4700     18.3100
+    254.4156   1522.5900     36.4700     18.3100
+    254.5513   1522.5900     36.4700     18.3100
+    254.6870   1522.5900     36.4700     18.3100
+    254.8227   1522.5900     36.4700     18.3100
+    254.9584   1522.6000     36.4700     18.3100
+    255.0941   1522.6000     36.4700     18.3100
+    255.2298   1522.6000     36.4700     18.3100
+    255.3655   1522.6000     36.4700     18.3100
+    255.5013   1522.6000     36.4700     18.3100
+    255.6369   1522.5900     36.4800     18.3100
+    255.7726   1522.5900     36.4800     18.3000
+    255.9083   1522.5900     36.4800     18.3000
+    256.0440   1522.5800     36.4800     18.3000
+    256.1797   1522.5800     36.4800     18.3000
+    256.3155   1522.5800     36.4800     18.3000
+    256.4511   1522.5800     36.4800     18.3000
+    256.5869   1522.5800     36.4800     18.3000
+    256.7226   1522.5800     36.4800     18.2900
+    256.8582   1522.5700     36.4700     18.2900
+    256.9939   1522.5700     36.4700     18.2900
+    257.1296   1522.5700     36.4800     18.2900
+    257.2653   1522.5700     36.4800     18.2900
+    257.4010   1522.5700     36.4800     18.2900
+    257.5367   1522.5700     36.4800     18.2900
+    257.6724   1522.5700     36.4800     18.2900
+    257.8081   1522.6200     36.4800     18.3000
+    257.9438   1522.6600     36.4700     18.3200
+    258.0794   1522.6500     36.4600     18.3200
+    258.2151   1522.6400     36.4500     18.3200
+    258.3508   1522.6400     36.4500     18.3200
+    258.4865   1522.6400     36.4500     18.3200
+    258.6222   1522.6400     36.4400     18.3200
+    258.7579   1522.6400     36.4400     18.3200
+    258.8936   1522.6400     36.4400     18.3200
+    259.0292   1522.5900     36.4400     18.3000
+    259.1649   1522.5500     36.4500     18.2800
+    259.3006   1522.5700     36.4600     18.2800
+    259.4362   1522.5800     36.4700     18.2800
+    259.5719   1522.5700     36.4700     18.2800
+    259.7076   1522.5700     36.4700     18.2800
+    259.8433   1522.5700     36.4800     18.2700
+    259.9789   1522.5600     36.4800     18.2700
+    260.1146   1522.5600     36.4800     18.2700
+    260.2503   1522.5500     36.4800     18.2700
+    260.3860   1522.5500     36.4800     18.2600
+    260.5216   1522.5400     36.4800     18.2600
+    260.6573   1522.5300     36.4800     18.2600
+    260.7929   1522.5200     36.4700     18.2500
+    260.9286   1522.5100     36.4700     18.2500
+    261.0643   1522.5100     36.4700     18.2500
+    261.2000   1522.5000     36.4700     18.2400
+    261.3356   1522.4900     36.4700     18.2400
+    261.4713   1522.4900     36.4700     18.2400
+    261.6069   1522.4800     36.4700     18.2300
+    261.7426   1522.4800     36.4700     18.2300
+    261.8782   1522.4700     36.4700     18.2300
+    262.0139   1522.4800     36.4700     18.2300
+    262.1496   1522.4800     36.4700     18.2300
+    262.2852   1522.4800     36.4700     18.2300
+    262.4208   1522.4800     36.4700     18.2300
+    262.5565   1522.4800     36.4600     18.2300
+    262.6922   1522.4800     36.4600     18.2300
+    262.8278   1522.4800     36.4600     18.2300
+    262.9635   1522.4800     36.4600     18.2300
+    263.0991   1522.4800     36.4600     18.2300
+    263.2348   1522.4800     36.4700     18.2300
+    263.3704   1522.4700     36.4700     18.2200
+    263.5061   1522.4600     36.4700     18.2200
+    263.6417   1522.4500     36.4700     18.2200
+    263.7773   1522.4500     36.4700     18.2100
+    263.9130   1522.4400     36.4700     18.2100
+    264.0486   1522.4300     36.4700     18.2100
+    264.1843   1522.4300     36.4700     18.2000
+    264.3199   1522.4200     36.4700     18.2000
+    264.4556   1522.4200     36.4700     18.2000
+    264.5912   1522.4200     36.4700     18.2000
+    264.7268   1522.4200     36.4700     18.2000
+    264.8625   1522.4100     36.4700     18.2000
+    264.9981   1522.4100     36.4700     18.1900
+    265.1337   1522.4100     36.4700     18.1900
+    265.2694   1522.4100     36.4700     18.1900
+    265.4050   1522.4000     36.4700     18.1900
+    265.5406   1522.4000     36.4700     18.1900
+    265.6763   1522.4000     36.4700     18.1800
+    265.8119   1522.3900     36.4700     18.1800
+    265.9475   1522.3900     36.4700     18.1800
+    266.0831   1522.3800     36.4600     18.1800
+    266.2188   1522.3700     36.4600     18.1700
+    266.3544   1522.3700     36.4600     18.1700
+    266.4900   1522.3700     36.4600     18.1700
+    266.6256   1522.3600     36.4600     18.1700
+    266.7613   1522.3600     36.4600     18.1700
+    266.8969   1522.3500     36.4600     18.1600
+    267.0325   1522.3500     36.4600     18.1600
+    267.1681   1522.3500     36.4600     18.1600
+    267.3037   1522.3400     36.4600     18.1600
+    267.4394   1522.3400     36.4600     18.1600
+    267.5750   1522.3300     36.4600     18.1500
+    267.7106   1522.3200     36.4600     18.1500
+    267.8462   1522.3200     36.4600     18.1500
+    267.9818   1522.3100     36.4600     18.1400
+    268.1174   1522.3100     36.4600     18.1400
+    268.2531   1522.3200     36.4600     18.1500
+    268.3886   1522.3200     36.4600     18.1500
+    268.5243   1522.3200     36.4500     18.1500
+    268.6599   1522.3200     36.4500     18.1500
+    268.7955   1522.3300     36.4400     18.1500
+    268.9311   1522.3300     36.4400     18.1500
+    269.0667   1522.3400     36.4400     18.1600
+    269.2023   1522.3400     36.4400     18.1600
+    269.3379   1522.3300     36.4300     18.1500
+    269.4735   1522.3300     36.4300     18.1500
+    269.6091   1522.3200     36.4300     18.1500
+    269.7447   1522.3200     36.4300     18.1500
+    269.8803   1522.3100     36.4400     18.1400
+    270.0159   1522.3100     36.4400     18.1400
+    270.1515   1522.3100     36.4400     18.1400
+    270.2871   1522.3100     36.4400     18.1400
+    270.4227   1522.3000     36.4400     18.1400
+    270.5583   1522.3000     36.4400     18.1400
+    270.6939   1522.3000     36.4400     18.1300
+    270.8295   1522.3100     36.4400     18.1400
+    270.9651   1522.3100     36.4400     18.1300
+    271.1007   1522.3000     36.4400     18.1300
+    271.2363   1522.2900     36.4400     18.1300
+    271.3719   1522.2900     36.4400     18.1200
+    271.5074   1522.2800     36.4400     18.1200
+    271.6430   1522.2800     36.4500     18.1200
+    271.7786   1522.2700     36.4500     18.1100
+    271.9142   1522.2600     36.4500     18.1100
+    272.0498   1522.2500     36.4500     18.1000
+    272.1854   1522.2500     36.4600     18.1000
+    272.3210   1522.2500     36.4600     18.1000
+    272.4565   1522.2400     36.4600     18.1000
+    272.5921   1522.2400     36.4600     18.0900
+    272.7277   1522.2300     36.4600     18.0900
+    272.8633   1522.2300     36.4600     18.0900
+    272.9988   1522.2300     36.4600     18.0900
+    273.1344   1522.2200     36.4600     18.0800
+    273.2700   1522.2100     36.4500     18.0800
+    273.4055   1522.2000     36.4500     18.0800
+    273.5411   1522.1900     36.4500     18.0800
+    273.6767   1522.1800     36.4500     18.0700
+    273.8123   1522.1800     36.4500     18.0700
+    273.9478   1522.1700     36.4500     18.0700
+    274.0834   1522.1600     36.4500     18.0600
+    274.2190   1522.1500     36.4500     18.0600
+    274.3546   1522.1500     36.4500     18.0600
+    274.4901   1522.1400     36.4500     18.0500
+    274.6257   1522.1400     36.4500     18.0500
+    274.7612   1522.1300     36.4500     18.0500
+    274.8968   1522.1300     36.4500     18.0500
+    275.0323   1522.1200     36.4500     18.0400
+    275.1679   1522.1200     36.4500     18.0400
+    275.3035   1522.1200     36.4500     18.0400
+    275.4390   1522.1200     36.4500     18.0400
+    275.5746   1522.1200     36.4500     18.0400
+    275.7101   1522.1200     36.4500     18.0400
+    275.8457   1522.1200     36.4400     18.0400
+    275.9813   1522.1200     36.4400     18.0400
+    276.1168   1522.1200     36.4400     18.0400
+    276.2523   1522.1300     36.4400     18.0400
+    276.3879   1522.1300     36.4500     18.0400
+    276.5235   1522.1300     36.4500     18.0400
+    276.6590   1522.1300     36.4500     18.0400
+    276.7946   1522.1200     36.4500     18.0300
+    276.9301   1522.1200     36.4500     18.0300
+    277.0657   1522.1200     36.4500     18.0300
+    277.2012   1522.1100     36.4500     18.0300
+    277.3368   1522.1100     36.4500     18.0300
+    277.4723   1522.1000     36.4500     18.0200
+    277.6078   1522.1000     36.4500     18.0200
+    277.7434   1522.0900     36.4500     18.0200
+    277.8789   1522.0900     36.4400     18.0200
+    278.0145   1522.0800     36.4400     18.0200
+    278.1500   1522.0800     36.4400     18.0100
+    278.2855   1522.0800     36.4400     18.0100
+    278.4211   1522.0800     36.4400     18.0100
+    278.5566   1522.0800     36.4400     18.0100
+    278.6921   1522.0900     36.4400     18.0100
+    278.8277   1522.0900     36.4400     18.0100
+    278.9632   1522.0900     36.4400     18.0100
+    279.0988   1522.0900     36.4400     18.0100
+    279.2343   1522.0900     36.4400     18.0100
+    279.3698   1522.0900     36.4500     18.0100
+    279.5053   1522.0900     36.4500     18.0100
+    279.6409   1522.0900     36.4500     18.0100
+    279.7764   1522.0900     36.4500     18.0100
+    279.9119   1522.0900     36.4500     18.0000
+    280.0475   1522.0900     36.4500     18.0000
+    280.1830   1522.0900     36.4500     18.0000
+    280.3185   1522.0800     36.4500     18.0000
+    280.4540   1522.0800     36.4500     18.0000
+    280.5895   1522.0800     36.4500     18.0000
+    280.7250   1522.0800     36.4500     18.0000
+    280.8606   1522.0800     36.4500     18.0000
+    280.9961   1522.0700     36.4500     17.9900
+    281.1316   1522.0700     36.4400     17.9900
+    281.2671   1522.0700     36.4400     17.9900
+    281.4026   1522.0700     36.4500     17.9900
+    281.5382   1522.0700     36.4500     17.9900
+    281.6736   1522.0700     36.4500     17.9900
+    281.8092   1522.0700     36.4500     17.9900
+    281.9447   1522.0600     36.4500     17.9900
+    282.0802   1522.0700     36.4500     17.9900
+    282.2157   1522.0700     36.4400     17.9900
+    282.3512   1522.0700     36.4400     17.9800
+    282.4867   1522.0700     36.4400     17.9800
+    282.6223   1522.0700     36.4400     17.9800
+    282.7577   1522.0700     36.4400     17.9800
+    282.8932   1522.0700     36.4400     17.9800
+    283.0287   1522.0700     36.4400     17.9800
+    283.1642   1522.0800     36.4400     17.9800
+    283.2997   1522.0800     36.4400     17.9800
+    283.4352   1522.0800     36.4400     17.9800
+    283.5708   1522.0800     36.4500     17.9800
+    283.7063   1522.0800     36.4500     17.9800
+    283.8418   1522.0800     36.4500     17.9800
+    283.9772   1522.0700     36.4500     17.9800
+    284.1127   1522.0700     36.4500     17.9700
+    284.2482   1522.0600     36.4500     17.9700
+    284.3837   1522.0600     36.4400     17.9700
+    284.5192   1522.0600     36.4500     17.9700
+    284.6547   1522.0500     36.4500     17.9700
+    284.7902   1522.0500     36.4400     17.9600
+    284.9257   1522.0400     36.4400     17.9600
+    285.0612   1522.0400     36.4400     17.9600
+    285.1967   1522.0400     36.4400     17.9600
+    285.3322   1522.0400     36.4400     17.9600
+    285.4676   1522.0300     36.4400     17.9600
+    285.6031   1522.0300     36.4400     17.9500
+    285.7386   1522.0300     36.4400     17.9500
+    285.8741   1522.0300     36.4400     17.9500
+    286.0096   1522.0200     36.4400     17.9500
+    286.1451   1522.0200     36.4400     17.9500
+    286.2805   1522.0200     36.4400     17.9500
+    286.4160   1522.0100     36.4400     17.9400
+    286.5515   1522.0100     36.4400     17.9400
+    286.6870   1522.0100     36.4400     17.9400
+    286.8224   1522.0100     36.4400     17.9400
+    286.9579   1522.0000     36.4400     17.9400
+    287.0934   1522.0000     36.4400     17.9400
+    287.2289   1521.9900     36.4400     17.9300
+    287.3643   1521.9900     36.4400     17.9300
+    287.4998   1521.9900     36.4400     17.9300
+    287.6353   1521.9900     36.4400     17.9300
+    287.7707   1521.9800     36.4400     17.9300
+    287.9062   1521.9800     36.4400     17.9300
+    288.0417   1521.9800     36.4400     17.9300
+    288.1772   1521.9800     36.4400     17.9200
+    288.3126   1521.9700     36.4400     17.9200
+    288.4481   1521.9700     36.4400     17.9200
+    288.5835   1521.9600     36.4400     17.9200
+    288.7190   1521.9600     36.4400     17.9100
+    288.8545   1521.9500     36.4400     17.9100
+    288.9899   1521.9500     36.4400     17.9100
+    289.1254   1521.9400     36.4400     17.9100
+    289.2608   1521.9300     36.4400     17.9000
+    289.3963   1521.9300     36.4300     17.9000
+    289.5317   1521.9200     36.4300     17.9000
+    289.6672   1521.9200     36.4300     17.9000
+    289.8026   1521.9200     36.4400     17.8900
+    289.9381   1521.9200     36.4400     17.8900
+    290.0735   1521.9100     36.4300     17.8900
+    290.2090   1521.9100     36.4300     17.8900
+    290.3445   1521.9000     36.4300     17.8900
+    290.4799   1521.9000     36.4300     17.8900
+    290.6154   1521.9000     36.4400     17.8800
+    290.7508   1521.9000     36.4400     17.8800
+    290.8862   1521.9000     36.4300     17.8800
+    291.0217   1521.9000     36.4300     17.8800
+    291.1571   1521.9000     36.4300     17.8800
+    291.2926   1521.9000     36.4300     17.8800
+    291.4280   1521.9000     36.4300     17.8800
+    291.5635   1521.9100     36.4300     17.8800
+    291.6989   1521.9100     36.4300     17.8800
+    291.8343   1521.9100     36.4300     17.8800
+    291.9698   1521.9100     36.4300     17.8800
+    292.1052   1521.9200     36.4300     17.8800
+    292.2406   1521.9200     36.4400     17.8800
+    292.3761   1521.9200     36.4400     17.8800
+    292.5115   1521.9200     36.4300     17.8800
+    292.6469   1521.9200     36.4300     17.8800
+    292.7824   1521.9300     36.4300     17.8800
+    292.9178   1521.9300     36.4300     17.8800
+    293.0532   1521.9300     36.4300     17.8800
+    293.1887   1521.9300     36.4300     17.8800
+    293.3241   1521.9300     36.4300     17.8800
+    293.4595   1521.9400     36.4300     17.8800
+    293.5949   1521.9400     36.4300     17.8800
+    293.7304   1521.9400     36.4400     17.8800
+    293.8658   1521.9400     36.4400     17.8800
+    294.0012   1521.9400     36.4400     17.8800
+    294.1366   1521.9400     36.4400     17.8800
+    294.2721   1521.9400     36.4400     17.8800
+    294.4075   1521.9400     36.4400     17.8800
+    294.5429   1521.9400     36.4400     17.8700
+    294.6783   1521.9300     36.4400     17.8700
+    294.8138   1521.9300     36.4400     17.8700
+    294.9492   1521.9300     36.4400     17.8700
+    295.0846   1521.9200     36.4400     17.8700
+    295.2200   1521.9200     36.4400     17.8600
+    295.3554   1521.9100     36.4300     17.8600
+    295.4908   1521.9100     36.4300     17.8600
+    295.6262   1521.9000     36.4300     17.8600
+    295.7616   1521.8900     36.4300     17.8500
+    295.8970   1521.8900     36.4300     17.8500
+    296.0324   1521.8800     36.4300     17.8500
+    296.1678   1521.8800     36.4300     17.8500
+    296.3033   1521.8700     36.4300     17.8400
+    296.4387   1521.8700     36.4300     17.8400
+    296.5741   1521.8600     36.4300     17.8400
+    296.7095   1521.8600     36.4300     17.8400
+    296.8449   1521.8600     36.4300     17.8400
+    296.9803   1521.8600     36.4300     17.8400
+    297.1157   1521.8600     36.4300     17.8300
+    297.2511   1521.8500     36.4300     17.8300
+    297.3865   1521.8500     36.4300     17.8300
+    297.5219   1521.8500     36.4300     17.8300
+    297.6573   1521.8500     36.4300     17.8300
+    297.7927   1521.8500     36.4300     17.8300
+    297.9280   1521.8500     36.4300     17.8300
+    298.0634   1521.8500     36.4300     17.8300
+    298.1989   1521.8400     36.4300     17.8200
+    298.3342   1521.8400     36.4300     17.8200
+    298.4696   1521.8400     36.4300     17.8200
+    298.6050   1521.8400     36.4300     17.8200
+    298.7404   1521.8400     36.4300     17.8200
+    298.8758   1521.8400     36.4300     17.8200
+    299.0112   1521.8300     36.4300     17.8100
+    299.1465   1521.8300     36.4300     17.8100
+    299.2820   1521.8200     36.4300     17.8100
+    299.4173   1521.8200     36.4300     17.8100
+    299.5527   1521.8100     36.4300     17.8100
+    299.6881   1521.8100     36.4300     17.8000
+    299.8235   1521.8100     36.4300     17.8000
+    299.9588   1521.8000     36.4300     17.8000
+    300.0942   1521.8000     36.4300     17.8000
+    300.2296   1521.8000     36.4300     17.8000
+    300.3650   1521.8000     36.4300     17.8000
+    300.5004   1521.8000     36.4300     17.8000
+    300.6357   1521.8000     36.4300     17.8000
+    300.7711   1521.8000     36.4300     17.8000
+    300.9065   1521.8100     36.4300     17.8000
+    301.0418   1521.8100     36.4300     17.8000
+    301.1772   1521.8100     36.4300     17.8000
+    301.3126   1521.8000     36.4200     17.7900
+    301.4480   1521.8000     36.4200     17.7900
+    301.5833   1521.8000     36.4200     17.7900
+    301.7187   1521.8000     36.4200     17.7900
+    301.8541   1521.8000     36.4200     17.7900
+    301.9894   1521.8000     36.4200     17.7900
+    302.1248   1521.8000     36.4200     17.7900
+    302.2601   1521.7900     36.4200     17.7900
+    302.3955   1521.7900     36.4200     17.7800
+    302.5309   1521.7900     36.4200     17.7800
+    302.6662   1521.7900     36.4200     17.7800
+    302.8016   1521.7900     36.4200     17.7800
+    302.9370   1521.7800     36.4200     17.7800
+    303.0723   1521.7800     36.4200     17.7800
+    303.2076   1521.7700     36.4200     17.7700
+    303.3430   1521.7600     36.4200     17.7700
+    303.4784   1521.7600     36.4200     17.7700
+    303.6137   1521.7500     36.4200     17.7600
+    303.7491   1521.7400     36.4200     17.7600
+    303.8844   1521.7300     36.4200     17.7600
+    304.0198   1521.7300     36.4200     17.7600
+    304.1551   1521.7200     36.4200     17.7500
+    304.2904   1521.7200     36.4200     17.7500
+    304.4258   1521.7200     36.4200     17.7500
+    304.5612   1521.7100     36.4200     17.7500
+    304.6965   1521.7100     36.4200     17.7500
+    304.8318   1521.7100     36.4200     17.7500
+    304.9672   1521.7100     36.4200     17.7400
+    305.1025   1521.7100     36.4200     17.7400
+    305.2379   1521.7100     36.4200     17.7400
+    305.3732   1521.7100     36.4200     17.7400
+    305.5085   1521.7100     36.4200     17.7400
+    305.6439   1521.7100     36.4200     17.7400
+    305.7792   1521.7100     36.4200     17.7400
+    305.9146   1521.7100     36.4100     17.7400
+    306.0499   1521.7000     36.4100     17.7400
+    306.1852   1521.7000     36.4100     17.7400
+    306.3206   1521.7000     36.4100     17.7300
+    306.4559   1521.7000     36.4100     17.7300
+    306.5912   1521.6900     36.4100     17.7300
+    306.7265   1521.6900     36.4100     17.7300
+    306.8619   1521.6800     36.4100     17.7300
+    306.9972   1521.6700     36.4100     17.7200
+    307.1325   1521.6700     36.4100     17.7200
+    307.2679   1521.6600     36.4100     17.7200
+    307.4032   1521.6600     36.4100     17.7200
+    307.5385   1521.6600     36.4100     17.7100
+    307.6738   1521.6500     36.4100     17.7100
+    307.8091   1521.6500     36.4100     17.7100
+    307.9445   1521.6400     36.4100     17.7100
+    308.0798   1521.6400     36.4100     17.7100
+    308.2151   1521.6300     36.4100     17.7000
+    308.3504   1521.6300     36.4100     17.7000
+    308.4857   1521.6300     36.4100     17.7000
+    308.6211   1521.6200     36.4100     17.7000
+    308.7563   1521.6200     36.4100     17.7000
+    308.8917   1521.6200     36.4100     17.6900
+    309.0270   1521.6100     36.4100     17.6900
+    309.1623   1521.6100     36.4100     17.6900
+    309.2976   1521.6100     36.4100     17.6900
+    309.4329   1521.6000     36.4100     17.6900
+    309.5682   1521.6000     36.4100     17.6800
+    309.7036   1521.5900     36.4100     17.6800
+    309.8388   1521.5900     36.4100     17.6800
+    309.9742   1521.5800     36.4000     17.6800
+    310.1095   1521.5800     36.4000     17.6700
+    310.2448   1521.5700     36.4100     17.6700
+    310.3801   1521.5700     36.4100     17.6700
+    310.5154   1521.5700     36.4100     17.6700
+    310.6507   1521.5600     36.4000     17.6700
+    310.7860   1521.5600     36.4000     17.6600
+    310.9213   1521.5600     36.4000     17.6600
+    311.0565   1521.5500     36.4100     17.6600
+    311.1919   1521.5500     36.4100     17.6600
+    311.3271   1521.5400     36.4100     17.6500
+    311.4625   1521.5300     36.4000     17.6500
+    311.5977   1521.5200     36.4000     17.6500
+    311.7331   1521.5000     36.4000     17.6400
+    311.8683   1521.4900     36.4000     17.6400
+    312.0036   1521.4800     36.4000     17.6300
+    312.1389   1521.4700     36.4000     17.6300
+    312.2742   1521.4600     36.4000     17.6300
+    312.4095   1521.4500     36.4000     17.6200
+    312.5448   1521.4500     36.4000     17.6200
+    312.6801   1521.4400     36.4000     17.6200
+    312.8154   1521.4400     36.4000     17.6200
+    312.9507   1521.4500     36.4000     17.6200
+    313.0859   1521.4500     36.4000     17.6200
+    313.2212   1521.4500     36.4000     17.6200
+    313.3565   1521.4600     36.4000     17.6200
+    313.4918   1521.4600     36.4000     17.6200
+    313.6270   1521.4600     36.4000     17.6200
+    313.7623   1521.4600     36.4000     17.6200
+    313.8976   1521.4600     36.4000     17.6200
+    314.0329   1521.4700     36.4000     17.6200
+    314.1682   1521.4700     36.4000     17.6200
+    314.3034   1521.4700     36.4000     17.6200
+    314.4387   1521.4700     36.4000     17.6200
+    314.5740   1521.4700     36.4000     17.6100
+    314.7092   1521.4600     36.4000     17.6100
+    314.8445   1521.4600     36.4000     17.6100
+    314.9798   1521.4500     36.4000     17.6100
+    315.1151   1521.4400     36.4000     17.6000
+    315.2503   1521.4300     36.4000     17.6000
+    315.3856   1521.4200     36.4000     17.5900
+    315.5208   1521.4000     36.3900     17.5900
+    315.6561   1521.3900     36.3900     17.5900
+    315.7914   1521.3800     36.3900     17.5800
+    315.9266   1521.3700     36.3900     17.5800
+    316.0619   1521.3700     36.3800     17.5800
+    316.1972   1521.3600     36.3800     17.5800
+    316.3324   1521.3600     36.3800     17.5800
+    316.4677   1521.3600     36.3800     17.5700
+    316.6029   1521.3600     36.3800     17.5700
+    316.7382   1521.3600     36.3800     17.5700
+    316.8734   1521.3600     36.3800     17.5700
+    317.0087   1521.3600     36.3900     17.5700
+    317.1440   1521.3700     36.3900     17.5700
+    317.2792   1521.3700     36.3900     17.5700
+    317.4145   1521.3700     36.3900     17.5700
+    317.5497   1521.3700     36.3900     17.5700
+    317.6850   1521.3800     36.3900     17.5700
+    317.8202   1521.3800     36.3900     17.5700
+    317.9554   1521.3800     36.3900     17.5700
+    318.0907   1521.3800     36.3900     17.5700
+    318.2260   1521.3800     36.3900     17.5700
+    318.3612   1521.3700     36.3900     17.5700
+    318.4964   1521.3700     36.3900     17.5600
+    318.6317   1521.3600     36.3800     17.5600
+    318.7669   1521.3500     36.3800     17.5600
+    318.9021   1521.3500     36.3800     17.5600
+    319.0374   1521.3400     36.3800     17.5500
+    319.1726   1521.3300     36.3800     17.5500
+    319.3079   1521.3200     36.3800     17.5500
+    319.4431   1521.3200     36.3800     17.5400
+    319.5783   1521.3200     36.3800     17.5400
+    319.7136   1521.3100     36.3800     17.5400
+    319.8488   1521.3000     36.3800     17.5300
+    319.9840   1521.2900     36.3800     17.5300
+    320.1193   1521.2900     36.3800     17.5300
+    320.2545   1521.2800     36.3800     17.5200
+    320.3897   1521.2700     36.3800     17.5200
+    320.5250   1521.2600     36.3800     17.5200
+    320.6602   1521.2600     36.3800     17.5200
+    320.7954   1521.2500     36.3700     17.5200
+    320.9307   1521.2500     36.3700     17.5100
+    321.0659   1521.2500     36.3700     17.5100
+    321.2011   1521.2500     36.3700     17.5100
+    321.3363   1521.2600     36.3800     17.5100
+    321.4715   1521.2600     36.3800     17.5100
+    321.6068   1521.2600     36.3800     17.5100
+    321.7420   1521.2700     36.3800     17.5100
+    321.8772   1521.2700     36.3800     17.5100
+    322.0124   1521.2800     36.3800     17.5100
+    322.1476   1521.2800     36.3800     17.5100
+    322.2828   1521.2800     36.3800     17.5100
+    322.4181   1521.2800     36.3800     17.5100
+    322.5533   1521.2800     36.3800     17.5100
+    322.6885   1521.2900     36.3800     17.5100
+    322.8237   1521.2900     36.3800     17.5100
+    322.9589   1521.2900     36.3800     17.5100
+    323.0941   1521.2900     36.3800     17.5100
+    323.2293   1521.2900     36.3800     17.5100
+    323.3645   1521.2900     36.3800     17.5100
+    323.4997   1521.2800     36.3800     17.5100
+    323.6349   1521.2800     36.3800     17.5100
+    323.7701   1521.2800     36.3800     17.5100
+    323.9054   1521.2800     36.3800     17.5100
+    324.0406   1521.2700     36.3800     17.5000
+    324.1758   1521.2700     36.3800     17.5000
+    324.3110   1521.2700     36.3800     17.5000
+    324.4462   1521.2700     36.3800     17.5000
+    324.5813   1521.2600     36.3800     17.5000
+    324.7166   1521.2600     36.3800     17.5000
+    324.8517   1521.2500     36.3800     17.4900
+    324.9869   1521.2500     36.3800     17.4900
+    325.1221   1521.2400     36.3800     17.4900
+    325.2573   1521.2300     36.3800     17.4800
+    325.3925   1521.2200     36.3700     17.4800
+    325.5277   1521.2200     36.3700     17.4800
+    325.6629   1521.2100     36.3700     17.4700
+    325.7981   1521.2100     36.3700     17.4700
+    325.9333   1521.2000     36.3700     17.4700
+    326.0685   1521.2000     36.3700     17.4700
+    326.2037   1521.2000     36.3700     17.4700
+    326.3388   1521.2000     36.3700     17.4700
+    326.4740   1521.2000     36.3700     17.4700
+    326.6092   1521.2000     36.3700     17.4700
+    326.7444   1521.2000     36.3700     17.4700
+    326.8796   1521.2000     36.3700     17.4700
+    327.0147   1521.2000     36.3700     17.4600
+    327.1499   1521.2000     36.3700     17.4600
+    327.2851   1521.2000     36.3700     17.4600
+    327.4203   1521.2000     36.3700     17.4600
+    327.5555   1521.2000     36.3700     17.4600
+    327.6907   1521.2000     36.3700     17.4600
+    327.8258   1521.2000     36.3700     17.4600
+    327.9610   1521.2000     36.3700     17.4600
+    328.0962   1521.2100     36.3700     17.4600
+    328.2314   1521.2100     36.3800     17.4600
+    328.3665   1521.2100     36.3700     17.4600
+    328.5017   1521.2100     36.3800     17.4600
+    328.6369   1521.2100     36.3700     17.4600
+    328.7720   1521.2100     36.3700     17.4600
+    328.9072   1521.2100     36.3700     17.4600
+    329.0424   1521.2000     36.3700     17.4500
+    329.1775   1521.2000     36.3700     17.4500
+    329.3127   1521.1900     36.3700     17.4500
+    329.4478   1521.1800     36.3700     17.4400
+    329.5830   1521.1700     36.3700     17.4400
+    329.7182   1521.1600     36.3700     17.4400
+    329.8533   1521.1500     36.3600     17.4300
+    329.9885   1521.1400     36.3600     17.4300
+    330.1236   1521.1200     36.3600     17.4200
+    330.2588   1521.1100     36.3600     17.4200
+    330.3940   1521.1000     36.3600     17.4200
+    330.5291   1521.0900     36.3600     17.4100
+    330.6643   1521.0900     36.3600     17.4100
+    330.7994   1521.0800     36.3600     17.4100
+    330.9346   1521.0700     36.3600     17.4000
+    331.0697   1521.0700     36.3600     17.4000
+    331.2049   1521.0600     36.3600     17.4000
+    331.3400   1521.0600     36.3600     17.4000
+    331.4752   1521.0600     36.3600     17.4000
+    331.6103   1521.0500     36.3600     17.3900
+    331.7455   1521.0500     36.3600     17.3900
+    331.8806   1521.0400     36.3600     17.3900
+    332.0157   1521.0400     36.3600     17.3900
+    332.1509   1521.0400     36.3600     17.3900
+    332.2860   1521.0400     36.3600     17.3900
+    332.4212   1521.0400     36.3600     17.3900
+    332.5563   1521.0400     36.3600     17.3800
+    332.6915   1521.0400     36.3600     17.3800
+    332.8266   1521.0400     36.3600     17.3800
+    332.9617   1521.0500     36.3600     17.3800
+    333.0969   1521.0500     36.3600     17.3800
+    333.2320   1521.0500     36.3600     17.3800
+    333.3672   1521.0500     36.3600     17.3800
+    333.5023   1521.0600     36.3600     17.3800
+    333.6374   1521.0600     36.3600     17.3800
+    333.7725   1521.0600     36.3600     17.3800
+    333.9077   1521.0600     36.3600     17.3800
+    334.0428   1521.0600     36.3600     17.3800
+    334.1779   1521.0700     36.3600     17.3800
+    334.3130   1521.0700     36.3600     17.3800
+    334.4482   1521.0700     36.3600     17.3800
+    334.5833   1521.0700     36.3600     17.3800
+    334.7184   1521.0700     36.3600     17.3800
+    334.8535   1521.0700     36.3600     17.3800
+    334.9887   1521.0700     36.3600     17.3800
+    335.1238   1521.0600     36.3600     17.3800
+    335.2589   1521.0600     36.3600     17.3800
+    335.3940   1521.0500     36.3500     17.3700
+    335.5292   1521.0400     36.3500     17.3700
+    335.6643   1521.0300     36.3500     17.3700
+    335.7994   1521.0200     36.3500     17.3600
+    335.9345   1521.0100     36.3500     17.3600
+    336.0696   1521.0000     36.3500     17.3500
+    336.2047   1520.9800     36.3500     17.3500
+    336.3398   1520.9600     36.3500     17.3400
+    336.4750   1456.4400     36.3500      0.0000
+    337.6909   1479.3200      0.0000     17.3100
+    337.8260   1479.3100      0.0000     17.3100
+    337.9611   1479.3200      0.0100     17.3100
+    338.0962   1520.8700     36.3400     17.3100
+    338.2313   1520.8700     36.3400     17.3000
+    338.3664   1520.8700     36.3400     17.3000
+    338.5015   1520.8700     36.3400     17.3000
+    338.6366   1520.8700     36.3400     17.3000
+    338.7717   1520.8700     36.3400     17.3000
+    338.9068   1520.8700     36.3400     17.3000
+    339.0419   1520.8700     36.3400     17.3000
+    339.1770   1520.8600     36.3400     17.2900
+    339.3121   1520.8600     36.3400     17.2900
+    339.4471   1520.8500     36.3400     17.2900
+    339.5822   1520.8500     36.3400     17.2900
+    339.7173   1520.8400     36.3400     17.2800
+    339.8524   1520.8300     36.3400     17.2800
+    339.9875   1520.8200     36.3400     17.2800
+    340.1226   1456.4900     36.3400      0.0000
+    341.3383   1479.1900      0.0000     17.2500
+    341.4734   1479.1900      0.0000     17.2500
+    341.6085   1479.1900      0.0100     17.2500
+    341.7435   1520.7600     36.3300     17.2500
+    341.8786   1520.7600     36.3300     17.2500
+    342.0137   1520.7500     36.3300     17.2400
+    342.1487   1520.7400     36.3300     17.2400
+    342.2838   1520.7300     36.3300     17.2400
+    342.4189   1520.7200     36.3300     17.2300
+    342.5539   1520.7100     36.3300     17.2300
+    342.6890   1520.7100     36.3300     17.2300
+    342.8241   1520.7000     36.3300     17.2200
+    342.9591   1456.5200     36.3300      0.0000
+    344.1747   1479.0600      0.0000     17.2000
+    344.3097   1479.0600      0.0000     17.2000
+    344.4448   1479.0700      0.0100     17.2000
+    344.5798   1520.6500     36.3300     17.2000
+    344.7149   1520.6500     36.3300     17.2000
+    344.8499   1520.6400     36.3300     17.1900
+    344.9850   1520.6400     36.3300     17.1900
+    345.1200   1520.6400     36.3300     17.1900
+    345.2551   1520.6400     36.3300     17.1900
+    345.3901   1520.6400     36.3300     17.1900
+    345.5252   1520.6400     36.3200     17.1900
+    345.6602   1520.6300     36.3200     17.1900
+    345.7953   1520.6200     36.3200     17.1800
+    345.9303   1520.6100     36.3200     17.1800
+    346.0653   1520.6100     36.3200     17.1800
+    346.2004   1520.6100     36.3200     17.1800
+    346.3354   1520.6000     36.3200     17.1700
+    346.4705   1520.5900     36.3200     17.1700
+    346.6055   1520.5900     36.3200     17.1700
+    346.7405   1520.5800     36.3200     17.1700
+    346.8756   1520.5700     36.3200     17.1600
+    347.0106   1520.5700     36.3200     17.1600
+    347.1456   1520.5600     36.3200     17.1600
+    347.2806   1520.5600     36.3200     17.1500
+    347.4157   1520.5400     36.3200     17.1500
+    347.5507   1520.5300     36.3200     17.1400
+    347.6858   1520.5100     36.3200     17.1400
+    347.8208   1456.5800     36.3100      0.0000
+    349.0360   1478.7400      0.0000     17.0800
+    349.1710   1478.7300      0.0000     17.0800
+    349.3060   1478.7300      0.0100     17.0700
+    349.4410   1520.3200     36.3000     17.0700
+    349.5760   1520.3200     36.3000     17.0700
+    349.7111   1520.3200     36.3000     17.0700
+    349.8461   1520.3200     36.3000     17.0700
+    349.9811   1520.3200     36.3000     17.0700
+    350.1161   1520.3200     36.3000     17.0700
+    350.2511   1520.3200     36.3000     17.0600
+    350.3861   1520.3200     36.3000     17.0600
+    350.5211   1520.3300     36.3100     17.0600
+    350.6561   1520.3300     36.3000     17.0600
+    350.7911   1520.3300     36.3000     17.0600
+    350.9261   1520.3300     36.3000     17.0600
+    351.0612   1520.3300     36.3000     17.0600
+    351.1962   1520.3300     36.3000     17.0600
+    351.3312   1520.3300     36.3000     17.0600
+    351.4662   1520.3300     36.3000     17.0600
+    351.6012   1520.3300     36.3000     17.0600
+    351.7361   1520.3300     36.3000     17.0600
+    351.8712   1520.3300     36.3000     17.0600
+    352.0062   1520.3200     36.3000     17.0600
+    352.1411   1520.3200     36.3000     17.0600
+    352.2762   1520.3100     36.3000     17.0500
+    352.4112   1520.3000     36.3000     17.0500
+    352.5461   1520.2900     36.3000     17.0400
+    352.6811   1520.2800     36.3000     17.0400
+    352.8161   1520.2800     36.3000     17.0400
+    352.9511   1520.2600     36.2900     17.0300
+    353.0861   1520.2500     36.2900     17.0300
+    353.2211   1520.2400     36.2900     17.0300
+    353.3561   1520.2400     36.2900     17.0200
+    353.4911   1520.2300     36.2900     17.0200
+    353.6261   1520.2300     36.2900     17.0200
+    353.7610   1520.2300     36.2900     17.0200
+    353.8960   1520.2300     36.2900     17.0200
+    354.0310   1520.2300     36.2900     17.0200
+    354.1660   1520.2300     36.2900     17.0200
+    354.3010   1520.2300     36.2900     17.0200
+    354.4359   1520.2300     36.2900     17.0200
+    354.5709   1520.2300     36.2900     17.0100
+    354.7059   1456.6600     36.2900      0.0000
+    355.9207   1478.6000      0.0000     17.0000
+    356.0556   1478.5900      0.0000     17.0000
+    356.1906   1478.6000      0.0100     17.0000
+    356.3255   1520.2000     36.2900     17.0000
+    356.4605   1520.2000     36.2900     16.9900
+    356.5955   1520.1900     36.2900     16.9900
+    356.7304   1520.1800     36.2900     16.9900
+    356.8654   1520.1800     36.2900     16.9900
+    357.0004   1520.1700     36.2800     16.9900
+    357.1353   1520.1700     36.2900     16.9800
+    357.2703   1520.1700     36.2800     16.9800
+    357.4052   1520.1600     36.2800     16.9800
+    357.5402   1520.1500     36.2800     16.9800
+    357.6751   1520.1500     36.2800     16.9700
+    357.8101   1520.1500     36.2800     16.9700
+    357.9451   1520.1500     36.2800     16.9700
+    358.0800   1520.1500     36.2800     16.9700
+    358.2150   1520.1500     36.2800     16.9700
+    358.3499   1520.1400     36.2800     16.9700
+    358.4849   1520.1400     36.2800     16.9700
+    358.6198   1520.1400     36.2800     16.9700
+    358.7548   1520.1400     36.2800     16.9700
+    358.8897   1520.1400     36.2800     16.9700
+    359.0247   1520.1400     36.2800     16.9600
+    359.1596   1520.1400     36.2800     16.9600
+    359.2946   1520.1400     36.2800     16.9600
+    359.4295   1520.1400     36.2800     16.9600
+    359.5644   1520.1400     36.2800     16.9600
+    359.6994   1520.1400     36.2800     16.9600
+    359.8343   1520.1400     36.2800     16.9600
+    359.9692   1520.1400     36.2800     16.9600
+    360.1042   1520.1400     36.2800     16.9600
+    360.2391   1520.1400     36.2800     16.9600
+    360.3741   1520.1400     36.2800     16.9600
+    360.5090   1520.1400     36.2800     16.9600
+    360.6439   1520.1400     36.2800     16.9600
+    360.7788   1520.1400     36.2800     16.9600
+    360.9138   1520.1400     36.2800     16.9500
+    361.0487   1520.1300     36.2800     16.9500
+    361.1837   1520.1300     36.2800     16.9500
+    361.3186   1520.1300     36.2800     16.9500
+    361.4535   1520.1300     36.2800     16.9500
+    361.5884   1520.1200     36.2800     16.9500
+    361.7234   1520.1200     36.2800     16.9400
+    361.8583   1520.1200     36.2800     16.9400
+    361.9932   1520.1100     36.2800     16.9400
+    362.1281   1520.1000     36.2800     16.9400
+    362.2631   1520.0900     36.2800     16.9300
+    362.3980   1520.0800     36.2800     16.9300
+    362.5329   1520.0700     36.2800     16.9200
+    362.6678   1520.0500     36.2800     16.9200
+    362.8027   1520.0300     36.2700     16.9100
+    362.9377   1520.0200     36.2700     16.9100
+    363.0726   1520.0000     36.2700     16.9000
+    363.2075   1519.9900     36.2700     16.8900
+    363.3424   1519.9700     36.2700     16.8900
+    363.4773   1456.7700     36.2700      0.0000
+    365.2311   1478.1200      0.0000     16.8200
+    365.3660   1478.1100      0.0000     16.8100
+    365.5009   1478.1100      0.0100     16.8100
+    365.6358   1519.7300     36.2500     16.8000
+    365.7707   1519.7200     36.2500     16.8000
+    365.9056   1519.7000     36.2500     16.7900
+    366.0405   1519.6900     36.2500     16.7900
+    366.1754   1519.6900     36.2500     16.7900
+    366.3102   1519.6800     36.2500     16.7800
+    366.4451   1519.6600     36.2500     16.7800
+    366.5800   1519.6500     36.2400     16.7700
+    366.7149   1519.6300     36.2400     16.7700
+    366.8498   1519.6100     36.2400     16.7600
+    366.9847   1519.5900     36.2400     16.7500
+    367.1196   1519.5700     36.2400     16.7500
+    367.2545   1519.5500     36.2400     16.7400
+    367.3893   1519.5400     36.2300     16.7300
+    367.5242   1519.5200     36.2300     16.7300
+    367.6591   1519.5100     36.2300     16.7200
+    367.7940   1519.5000     36.2300     16.7200
+    367.9289   1519.4900     36.2300     16.7200
+    368.0638   1519.4900     36.2300     16.7200
+    368.1986   1519.4800     36.2300     16.7100
+    368.3335   1519.4800     36.2300     16.7100
+    368.4684   1519.4800     36.2300     16.7100
+    368.6033   1519.4800     36.2300     16.7100
+    368.7381   1519.4800     36.2300     16.7100
+    368.8730   1456.8100     36.2300      0.0000
+    370.0868   1477.8300      0.0000     16.7000
+    370.2217   1477.8300      0.0000     16.7000
+    370.3566   1477.8300      0.0100     16.7000
+    370.4914   1456.8300     36.2300      0.0000
+    371.7051   1477.7300      0.0000     16.6700
+    371.8400   1477.7200      0.0000     16.6600
+    371.9748   1477.7100      0.0100     16.6600
+    372.1097   1456.8500     36.2200      0.0000
+    373.3233   1477.6000      0.0000     16.6200
+    373.4581   1477.5900      0.0000     16.6200
+    373.5930   1477.5900      0.0100     16.6100
+    373.7278   1519.2400     36.2200     16.6100
+    373.8626   1519.2300     36.2100     16.6000
+    373.9975   1519.2200     36.2100     16.6000
+    374.1323   1519.2100     36.2100     16.6000
+    374.2671   1519.2000     36.2100     16.5900
+    374.4020   1519.2000     36.2100     16.5900
+    374.5368   1519.1900     36.2100     16.5900
+    374.6716   1519.1900     36.2100     16.5900
+    374.8065   1519.1900     36.2100     16.5900
+    374.9413   1519.1900     36.2100     16.5800
+    375.0761   1519.1900     36.2200     16.5800
+    375.2109   1519.1800     36.2200     16.5800
+    375.3458   1519.1800     36.2100     16.5800
+    375.4806   1519.1700     36.2100     16.5800
+    375.6154   1519.1600     36.2100     16.5700
+    375.7502   1519.1500     36.2100     16.5700
+    375.8851   1519.1400     36.2100     16.5600
+    376.0199   1519.1200     36.2100     16.5600
+    376.1547   1519.1100     36.2100     16.5600
+    376.2895   1519.0900     36.2100     16.5500
+    376.4243   1519.0800     36.2100     16.5500
+    376.5591   1519.0700     36.2100     16.5400
+    376.6940   1519.0500     36.2000     16.5300
+    376.8288   1519.0300     36.2000     16.5300
+    376.9636   1519.0200     36.2000     16.5200
+    377.0984   1519.0100     36.2000     16.5200
+    377.2332   1518.9900     36.2000     16.5100
+    377.3680   1518.9800     36.2000     16.5100
+    377.5028   1518.9600     36.2000     16.5000
+    377.6376   1518.9500     36.2000     16.5000
+    377.7725   1518.9400     36.2000     16.5000
+    377.9073   1518.9300     36.2000     16.4900
+    378.0421   1518.9100     36.2000     16.4800
+    378.1769   1518.9000     36.1900     16.4800
+    378.3117   1518.8800     36.1900     16.4700
+    378.4465   1518.8700     36.1900     16.4700
+    378.5813   1518.8500     36.1900     16.4600
+    378.7161   1518.8400     36.1900     16.4600
+    378.8509   1518.8300     36.1900     16.4600
+    378.9857   1518.8300     36.1900     16.4500
+    379.1205   1518.8200     36.1900     16.4500
+    379.2553   1518.8100     36.1900     16.4500
+    379.3901   1518.8100     36.1900     16.4500
+    379.5249   1518.8100     36.1900     16.4500
+    379.6597   1518.8000     36.1800     16.4400
+    379.7945   1518.8000     36.1900     16.4400
+    379.9293   1518.8000     36.1900     16.4400
+    380.0641   1518.7900     36.1800     16.4400
+    380.1988   1518.7800     36.1800     16.4400
+    380.3336   1518.7800     36.1800     16.4300
+    380.4684   1518.7700     36.1800     16.4300
+    380.6032   1518.7600     36.1800     16.4300
+    380.7380   1518.7600     36.1800     16.4200
+    380.8728   1518.7500     36.1800     16.4200
+    381.0075   1518.7400     36.1800     16.4200
+    381.1423   1518.7400     36.1800     16.4200
+    381.2771   1518.7300     36.1800     16.4100
+    381.4119   1456.9400     36.1800      0.0000
+    382.6249   1476.9900      0.0000     16.4000
+    382.7597   1476.9800      0.0000     16.3900
+    382.8944   1476.9900      0.0100     16.3900
+    383.0292   1518.6800     36.1800     16.3900
+    383.1640   1518.6800     36.1800     16.3900
+    383.2987   1518.6700     36.1800     16.3800
+    383.4335   1518.6700     36.1800     16.3800
+    383.5683   1518.6600     36.1800     16.3800
+    383.7030   1518.6500     36.1800     16.3800
+    383.8378   1518.6400     36.1800     16.3700
+    383.9726   1518.6400     36.1800     16.3700
+    384.1073   1518.6300     36.1800     16.3700
+    384.2421   1456.9800     36.1700      0.0000
+    385.4549   1476.8000      0.0000     16.3300
+    385.5896   1476.8000      0.0000     16.3200
+    385.7244   1476.8000      0.0100     16.3200
+    385.8591   1518.5000     36.1600     16.3200
+    385.9939   1518.5000     36.1600     16.3200
+    386.1286   1518.4900     36.1600     16.3200
+    386.2634   1518.4900     36.1600     16.3200
+    386.3981   1518.4900     36.1600     16.3200
+    386.5328   1518.4900     36.1600     16.3200
+    386.6676   1518.4900     36.1600     16.3100
+    386.8023   1518.4900     36.1600     16.3100
+    386.9371   1518.4900     36.1600     16.3100
+    387.0718   1518.4900     36.1600     16.3100
+    387.2065   1518.4900     36.1600     16.3100
+    387.3413   1518.4900     36.1600     16.3100
+    387.4760   1518.4800     36.1600     16.3000
+    387.6107   1518.4700     36.1600     16.3000
+    387.7455   1518.4600     36.1600     16.3000
+    387.8802   1518.4500     36.1600     16.2900
+    388.0150   1518.4300     36.1600     16.2900
+    388.1497   1518.4200     36.1600     16.2800
+    388.2844   1518.4000     36.1600     16.2800
+    388.4192   1518.3800     36.1600     16.2700
+    388.5539   1518.3700     36.1600     16.2600
+    388.6886   1518.3600     36.1500     16.2600
+    388.8233   1518.3500     36.1500     16.2600
+    388.9581   1518.3400     36.1500     16.2500
+    389.0928   1518.3300     36.1500     16.2500
+    389.2275   1518.3300     36.1500     16.2500
+    389.3622   1518.3200     36.1500     16.2500
+    389.4969   1518.3100     36.1500     16.2400
+    389.6317   1518.3100     36.1500     16.2400
+    389.7664   1518.3000     36.1500     16.2400
+    389.9011   1518.3000     36.1500     16.2400
+    390.0358   1518.2900     36.1500     16.2300
+    390.1705   1518.2800     36.1400     16.2300
+    390.3053   1518.2800     36.1400     16.2300
+    390.4400   1518.2700     36.1400     16.2300
+    390.5747   1518.2700     36.1400     16.2300
+    390.7094   1518.2700     36.1400     16.2200
+    390.8441   1518.2700     36.1400     16.2200
+    390.9788   1518.2700     36.1400     16.2200
+    391.1135   1457.0600     36.1400      0.0000
+    392.3259   1476.4900      0.0000     16.2000
+    392.4606   1476.4800      0.0000     16.2000
+    392.5953   1476.4800      0.0100     16.2000
+    392.7300   1518.2000     36.1400     16.1900
+    392.8647   1518.2000     36.1400     16.1900
+    392.9994   1518.1800     36.1400     16.1800
+    393.1341   1518.1700     36.1400     16.1800
+    393.2687   1518.1600     36.1400     16.1800
+    393.4034   1518.1500     36.1400     16.1700
+    393.5381   1518.1400     36.1400     16.1700
+    393.6728   1518.1300     36.1400     16.1700
+    393.8075   1518.1200     36.1400     16.1600
+    393.9422   1518.1100     36.1400     16.1600
+    394.0769   1518.1000     36.1300     16.1500
+    394.2116   1518.0900     36.1300     16.1500
+    394.3463   1518.0900     36.1300     16.1500
+    394.4810   1518.0700     36.1300     16.1400
+    394.6156   1518.0700     36.1300     16.1400
+    394.7503   1457.1000     36.1300      0.0000
+    395.9624   1476.2100      0.0000     16.1000
+    396.0971   1476.2000      0.0000     16.1000
+    396.2318   1476.2000      0.0100     16.0900
+    396.3665   1517.9300     36.1300     16.0900
+    396.5011   1517.9200     36.1300     16.0900
+    396.6358   1517.9100     36.1200     16.0800
+    396.7704   1517.9000     36.1200     16.0800
+    396.9051   1517.8900     36.1200     16.0800
+    397.0398   1517.8800     36.1200     16.0700
+    397.1744   1517.8700     36.1200     16.0700
+    397.3091   1517.8600     36.1200     16.0600
+    397.4438   1517.8500     36.1200     16.0600
+    397.5784   1517.8400     36.1200     16.0600
+    397.7131   1517.8300     36.1200     16.0500
+    397.8477   1517.8200     36.1200     16.0500
+    397.9824   1517.8100     36.1200     16.0400
+    398.1171   1517.8000     36.1200     16.0400
+    398.2517   1517.7800     36.1100     16.0400
+    398.3864   1517.7700     36.1100     16.0300
+    398.5211   1517.7600     36.1100     16.0300
+    398.6557   1517.7500     36.1100     16.0200
+    398.7903   1517.7300     36.1100     16.0200
+    398.9250   1517.7200     36.1100     16.0100
+    399.0596   1517.7000     36.1100     16.0100
+    399.1943   1517.6900     36.1100     16.0000
+    399.3289   1517.6700     36.1100     16.0000
+    399.4636   1517.6600     36.1100     15.9900
+    399.5983   1517.6500     36.1100     15.9900
+    399.7329   1517.6400     36.1100     15.9800
+    399.8675   1517.6300     36.1000     15.9800
+    400.0022   1517.6200     36.1000     15.9800
+    400.1368   1517.6100     36.1000     15.9700
+    400.2715   1517.6000     36.1000     15.9700
+    400.4061   1457.1500     36.1000      0.0000
+    402.4256   1475.6100      0.0000     15.9000
+    402.5602   1475.6000      0.0000     15.8900
+    402.6949   1475.6000      0.0100     15.8900
+    402.8295   1517.3700     36.0900     15.8900
+    402.9641   1517.3600     36.0900     15.8800
+    403.0987   1517.3500     36.0900     15.8800
+    403.2333   1517.3500     36.0900     15.8800
+    403.3680   1517.3500     36.0900     15.8800
+    403.5026   1517.3400     36.0900     15.8800
+    403.6372   1517.3500     36.0800     15.8800
+    403.7718   1517.3500     36.0900     15.8700
+    403.9064   1517.3500     36.0900     15.8700
+    404.0410   1517.3500     36.0900     15.8700
+    404.1757   1517.3400     36.0900     15.8700
+    404.3103   1517.3300     36.0900     15.8700
+    404.4449   1517.3200     36.0800     15.8600
+    404.5795   1517.3100     36.0800     15.8600
+    404.7141   1517.3000     36.0800     15.8600
+    404.8487   1517.2900     36.0800     15.8500
+    404.9833   1517.2700     36.0800     15.8500
+    405.1179   1517.2600     36.0800     15.8400
+    405.2525   1517.2300     36.0800     15.8300
+    405.3871   1517.2200     36.0800     15.8300
+    405.5217   1517.2100     36.0700     15.8200
+    405.6563   1517.2000     36.0700     15.8200
+    405.7909   1517.1900     36.0700     15.8200
+    405.9255   1517.1800     36.0700     15.8100
+    406.0602   1517.1800     36.0700     15.8100
+    406.1947   1517.1800     36.0700     15.8100
+    406.3293   1517.1700     36.0700     15.8100
+    406.4640   1517.1700     36.0700     15.8100
+    406.5985   1517.1800     36.0700     15.8100
+    406.7331   1517.1800     36.0700     15.8100
+    406.8677   1517.1800     36.0700     15.8100
+    407.0023   1517.1800     36.0700     15.8100
+    407.1369   1517.1800     36.0700     15.8100
+    407.2715   1517.1800     36.0700     15.8100
+    407.4061   1517.1700     36.0700     15.8000
+    407.5407   1517.1700     36.0700     15.8000
+    407.6752   1517.1600     36.0700     15.8000
+    407.8098   1517.1400     36.0700     15.7900
+    407.9444   1517.1200     36.0700     15.7800
+    408.0790   1517.1000     36.0700     15.7800
+    408.2136   1517.0700     36.0700     15.7700
+    408.3482   1517.0400     36.0700     15.7600
+    408.4828   1517.0200     36.0700     15.7500
+    408.6173   1516.9900     36.0600     15.7400
+    408.7519   1516.9700     36.0600     15.7400
+    408.8865   1516.9500     36.0600     15.7300
+    409.0211   1516.9400     36.0600     15.7300
+    409.1556   1516.9300     36.0600     15.7200
+    409.2902   1516.9200     36.0500     15.7200
+    409.4248   1516.9100     36.0500     15.7200
+    409.5594   1516.9000     36.0500     15.7100
+    409.6940   1516.8900     36.0500     15.7100
+    409.8286   1516.8800     36.0500     15.7000
+    409.9631   1517.1000     36.2500     15.7000
+    410.0977   1517.0900     36.2500     15.7000
+    410.2322   1517.0700     36.2500     15.6900
+    410.3668   1517.0700     36.2500     15.6900
+    410.5014   1517.0600     36.2500     15.6900
+    410.6360   1517.0500     36.2500     15.6800
+    410.7705   1517.0500     36.2500     15.6800
+    410.9051   1517.0400     36.2400     15.6800
+    411.0396   1517.0400     36.2400     15.6800
+    411.1742   1516.8100     36.0500     15.6700
+    411.3087   1516.8000     36.0500     15.6700
+    411.4433   1516.8000     36.0500     15.6700
+    411.5779   1516.8000     36.0500     15.6700
+    411.7124   1516.7900     36.0500     15.6700
+    411.8470   1516.7900     36.0500     15.6700
+    411.9815   1516.7900     36.0500     15.6600
+    412.1161   1516.7800     36.0500     15.6600
+    412.2506   1516.7700     36.0500     15.6600
+    412.3852   1516.9900     36.2400     15.6600
+    412.5197   1517.2100     36.4400     15.6500
+    412.6543   1517.4300     36.6400     15.6500
+    412.7888   1517.4200     36.6400     15.6400
+    412.9234   1458.0800     36.6400      0.0000
+    414.1343   1474.7600      0.0000     15.6000
+    414.2689   1474.7400      0.0000     15.5900
+    414.4034   1474.7300      0.0100     15.5800
+    414.5379   1516.5500     36.0400     15.5800
+    414.6725   1516.5200     36.0300     15.5700
+    414.8070   1516.7300     36.2300     15.5600
+    414.9415   1457.7000     36.3300      0.0000
+    416.1523   1474.5200      0.0000     15.5200
+    416.2868   1474.5200      0.0000     15.5200
+    416.4213   1474.5200      0.0100     15.5100
+    416.5559   1516.3600     36.0200     15.5100
+    416.6904   1516.3600     36.0200     15.5100
+    416.8249   1516.3600     36.0200     15.5100
+    416.9594   1516.3500     36.0200     15.5100
+    417.0939   1516.3500     36.0200     15.5100
+    417.2285   1516.3500     36.0200     15.5000
+    417.3630   1516.3500     36.0200     15.5000
+    417.4975   1516.3500     36.0200     15.5000
+    417.6320   1516.3400     36.0200     15.5000
+    417.7665   1516.3300     36.0200     15.5000
+    417.9010   1516.3300     36.0200     15.4900
+    418.0355   1516.4300     36.1200     15.4900
+    418.1700   1457.7300     36.3200      0.0000
+    420.5911   1474.1600      0.0000     15.3900
+    420.7256   1474.1400      0.0000     15.3900
+    420.8600   1474.1300      0.0100     15.3800
+    420.9945   1515.9800     36.0100     15.3700
+    421.1290   1515.9600     36.0000     15.3700
+    421.2635   1515.9400     36.0000     15.3600
+    421.3980   1515.9200     36.0000     15.3500
+    421.5325   1515.9000     36.0000     15.3500
+    421.6670   1515.8800     36.0000     15.3400
+    421.8015   1515.9800     36.1000     15.3400
+    421.9359   1515.9700     36.0900     15.3300
+    422.0704   1515.9600     36.0900     15.3300
+    422.2049   1515.9500     36.0900     15.3200
+    422.3394   1515.9400     36.0900     15.3200
+    422.4738   1515.9400     36.0900     15.3200
+    422.6083   1515.9300     36.0900     15.3100
+    422.7428   1515.9200     36.0900     15.3100
+    422.8773   1515.9200     36.0900     15.3100
+    423.0117   1516.0400     36.1900     15.3100
+    423.1462   1516.0400     36.1900     15.3100
+    423.2807   1516.0400     36.1900     15.3100
+    423.4152   1516.0400     36.1900     15.3100
+    423.5496   1516.0300     36.1900     15.3100
+    423.6841   1516.0200     36.1900     15.3000
+    423.8186   1516.0200     36.1800     15.3000
+    423.9530   1516.0100     36.1800     15.3000
+    424.0875   1516.2300     36.3800     15.3000
+    424.2220   1516.2200     36.3800     15.2900
+    424.3564   1516.4500     36.5900     15.2900
+    424.4909   1516.6500     36.7900     15.2800
+    424.6254   1516.6300     36.7900     15.2700
+    424.7598   1516.6100     36.7900     15.2600
+    424.8943   1516.5900     36.7900     15.2500
+    425.0287   1516.7900     36.9900     15.2400
+    425.1632   1516.8700     37.0800     15.2300
+    425.2977   1516.6100     36.8800     15.2200
+    425.4321   1516.4700     36.7800     15.2200
+    425.5666   1516.3200     36.6700     15.2100
+    425.7010   1516.1800     36.5700     15.2000
+    425.8355   1516.1700     36.5700     15.2000
+    425.9699   1516.1500     36.5700     15.1900
+    426.1044   1516.1400     36.5700     15.1900
+    426.2388   1515.9000     36.3700     15.1800
+    426.3733   1515.7800     36.2700     15.1800
+    426.5078   1516.0000     36.4700     15.1800
+    426.6422   1515.8700     36.3700     15.1700
+    426.7766   1515.7400     36.2700     15.1700
+    426.9111   1515.6200     36.1700     15.1600
+    427.0455   1515.6000     36.1700     15.1600
+    427.1800   1515.5900     36.1700     15.1600
+    427.3144   1515.5800     36.1700     15.1500
+    427.4489   1515.5700     36.1600     15.1500
+    427.5833   1515.5600     36.1600     15.1400
+    427.7177   1515.3200     35.9600     15.1400
+    427.8522   1515.3100     35.9600     15.1400
+    427.9866   1515.3000     35.9600     15.1300
+    428.1210   1515.2900     35.9700     15.1300
+    428.2555   1515.2800     35.9700     15.1300
+    428.3899   1515.2700     35.9600     15.1200
+    428.5244   1515.3700     36.0600     15.1200
+    428.6588   1515.4800     36.1600     15.1100
+    428.7932   1515.5900     36.2600     15.1100
+    428.9277   1515.6900     36.3600     15.1100
+    429.0621   1515.8000     36.4600     15.1000
+    429.1965   1516.0100     36.6600     15.1000
+    429.3309   1516.2300     36.8500     15.0900
+    429.4654   1516.2200     36.8500     15.0900
+    429.5998   1516.2100     36.8500     15.0900
+    429.7342   1516.0800     36.7500     15.0800
+    429.8687   1515.9500     36.6500     15.0800
+    430.0031   1515.8300     36.5500     15.0700
+    430.1375   1515.7100     36.4500     15.0700
+    430.2719   1515.5800     36.3500     15.0700
+    430.4063   1515.3500     36.1500     15.0700
+    430.5407   1515.1100     35.9500     15.0600
+    430.6752   1515.1000     35.9500     15.0600
+    430.8096   1515.0900     35.9500     15.0600
+    430.9440   1515.0800     35.9500     15.0500
+    431.0784   1515.0800     35.9500     15.0500
+    431.2128   1515.0600     35.9500     15.0500
+    431.3472   1515.0500     35.9500     15.0400
+    431.4816   1515.0400     35.9500     15.0400
+    431.6161   1515.0200     35.9500     15.0300
+    431.7505   1515.0100     35.9500     15.0300
+    431.8849   1515.0000     35.9500     15.0200
+    432.0193   1514.9800     35.9500     15.0200
+    432.1537   1514.9700     35.9500     15.0100
+    432.2881   1514.9500     35.9400     15.0100
+    432.4225   1514.9400     35.9400     15.0000
+    432.5569   1514.9300     35.9400     15.0000
+    432.6913   1514.9200     35.9400     15.0000
+    432.8257   1514.9000     35.9400     14.9900
+    432.9601   1514.9000     35.9400     14.9900
+    433.0945   1514.8900     35.9400     14.9900
+    433.2289   1514.8800     35.9400     14.9800
+    433.3633   1514.8800     35.9400     14.9800
+    433.4977   1457.4700     35.9400      0.0000
+    434.7072   1472.9300      0.0000     14.9800
+    434.8416   1472.9300      0.0000     14.9800
+    434.9760   1472.9400      0.0100     14.9700
+    435.1104   1515.1100     36.1400     14.9700
+    435.2448   1515.2300     36.2400     14.9700
+    435.3792   1515.3400     36.3400     14.9700
+    435.5135   1458.1800     36.4400      0.0000
+    436.7229   1472.8300      0.0000     14.9400
+    436.8573   1472.8300      0.0000     14.9400
+    436.9917   1472.8300      0.0100     14.9300
+    437.1261   1457.5300     35.9300      0.0000
+    438.3354   1472.8000      0.0000     14.9200
+    438.4697   1472.8000      0.0000     14.9200
+    438.6040   1472.8100      0.0100     14.9200
+    438.7384   1514.7600     35.9300     14.9200
+    438.8728   1514.7600     35.9300     14.9200
+    439.0071   1514.7600     35.9300     14.9200
+    439.1415   1514.7500     35.9300     14.9100
+    439.2759   1514.7500     35.9300     14.9100
+    439.4102   1514.7300     35.9300     14.9100
+    439.5446   1514.7200     35.9300     14.9000
+    439.6789   1514.7000     35.9300     14.8900
+    439.8132   1514.6700     35.9300     14.8900
+    439.9476   1514.6400     35.9300     14.8800
+    440.0819   1514.6100     35.9300     14.8700
+    440.2163   1514.5800     35.9300     14.8600
+    440.3506   1514.5600     35.9400     14.8500
+    440.4850   1514.5500     35.9500     14.8400
+    440.6194   1514.5300     35.9500     14.8300
+    440.7537   1514.5100     35.9500     14.8200
+    440.8880   1514.5000     35.9600     14.8100
+    441.0223   1514.4900     35.9600     14.8100
+    441.1567   1514.4900     35.9700     14.8100
+    441.2910   1514.4900     35.9700     14.8000
+    441.4254   1514.4900     35.9800     14.8000
+    441.5597   1457.6500     35.9800      0.0000
+    442.7687   1472.3800      0.0000     14.7800
+    442.9031   1472.3700      0.0000     14.7800
+    443.0374   1472.3600      0.0100     14.7700
+    443.1717   1514.3300     35.9100     14.7700
+    443.3060   1514.3100     35.9100     14.7600
+    443.4403   1514.2900     35.9100     14.7500
+    443.5747   1514.2600     35.9100     14.7400
+    443.7090   1514.2400     35.9000     14.7400
+    443.8433   1514.2100     35.9000     14.7300
+    443.9776   1514.1900     35.9000     14.7200
+    444.1119   1514.1700     35.9000     14.7100
+    444.2463   1514.1600     35.9100     14.7100
+    444.3806   1514.1400     35.9100     14.7000
+    444.5149   1514.1300     35.9100     14.7000
+    444.6492   1514.1200     35.9100     14.7000
+    444.7835   1514.1100     35.9000     14.6900
+    444.9178   1514.1000     35.9000     14.6900
+    445.0522   1514.1000     35.9000     14.6900
+    445.1865   1457.6200     35.9000      0.0000
+    448.2753   1472.0200      0.0000     14.6600
+    448.4097   1472.0200      0.0000     14.6500
+    448.5439   1472.0200      0.0100     14.6500
+    448.6782   1514.0200     35.8900     14.6500
+    448.8125   1514.0100     35.8900     14.6500
+    448.9467   1514.0000     35.8900     14.6400
+    449.0811   1514.0000     35.8900     14.6400
+    449.2153   1513.9900     35.8900     14.6400
+    449.3496   1513.9800     35.8900     14.6300
+    449.4839   1513.9600     35.8900     14.6300
+    449.6182   1513.9500     35.8900     14.6200
+    449.7524   1513.9300     35.8900     14.6200
+    449.8867   1513.9100     35.8800     14.6100
+    450.0210   1513.8900     35.8800     14.6000
+    450.1553   1513.8700     35.8800     14.6000
+    450.2896   1513.8500     35.8800     14.5900
+    450.4238   1513.8200     35.8800     14.5800
+    450.5581   1513.8000     35.8800     14.5700
+    450.6924   1513.7700     35.8800     14.5600
+    450.8266   1513.7500     35.8800     14.5600
+    450.9609   1513.7200     35.8700     14.5500
+    451.0952   1513.7000     35.8700     14.5400
+    451.2294   1513.6800     35.8700     14.5400
+    451.3637   1457.6700     35.8700      0.0000
+    453.1091   1471.5200      0.0000     14.4900
+    453.2433   1471.5100      0.0000     14.4900
+    453.3776   1471.5100      0.0100     14.4900
+    453.5118   1513.5500     35.8700     14.4800
+    453.6461   1457.7100     35.8700      0.0000
+    456.0624   1471.3700      0.0000     14.4400
+    456.1966   1471.3600      0.0000     14.4400
+    456.3308   1471.3700      0.0100     14.4300
+    456.4651   1457.7300     35.8500      0.0000
+    457.6731   1471.2400      0.0000     14.3900
+    457.8073   1471.2200      0.0000     14.3900
+    457.9415   1471.2100      0.0100     14.3800
+    458.0757   1457.7500     35.8400      0.0000
+    459.2836   1470.8900      0.0000     14.2900
+    459.4178   1470.8600      0.0000     14.2800
+    459.5520   1470.8300      0.0100     14.2700
+    459.6862   1512.8900     35.8300     14.2600
+    459.8204   1512.8700     35.8200     14.2600
+    459.9546   1512.8500     35.8200     14.2500
+    460.0888   1512.8300     35.8200     14.2400
+    460.2230   1512.8200     35.8200     14.2400
+    460.3572   1512.8100     35.8200     14.2400
+    460.4914   1512.8100     35.8200     14.2300
+    460.6256   1512.8100     35.8200     14.2300
+    460.7598   1512.8100     35.8200     14.2300
+    460.8940   1512.8100     35.8200     14.2300
+    461.0282   1512.8100     35.8200     14.2300
+    461.1624   1512.8100     35.8200     14.2300
+    461.2966   1512.8000     35.8200     14.2300
+    461.4308   1512.8000     35.8200     14.2300
+    461.5650   1512.8000     35.8200     14.2300
+    461.6991   1512.7900     35.8200     14.2200
+    461.8333   1512.7900     35.8200     14.2200
+    461.9675   1512.7700     35.8200     14.2200
+    462.1017   1512.7600     35.8200     14.2100
+    462.2359   1512.7400     35.8200     14.2100
+    462.3701   1512.7300     35.8200     14.2000
+    462.5043   1512.7200     35.8200     14.2000
+    462.6384   1512.7100     35.8200     14.1900
+    462.7726   1512.7000     35.8100     14.1900
+    462.9068   1512.6900     35.8100     14.1900
+    463.0410   1512.6800     35.8100     14.1800
+    463.1752   1512.6700     35.8100     14.1800
+    463.3093   1512.6700     35.8100     14.1800
+    463.4435   1512.6700     35.8100     14.1800
+    463.5777   1512.6600     35.8100     14.1800
+    463.7119   1512.6600     35.8100     14.1700
+    463.8460   1512.6600     35.8100     14.1700
+    463.9802   1512.6500     35.8100     14.1700
+    464.1144   1512.6500     35.8100     14.1700
+    464.2485   1512.6400     35.8100     14.1700
+    464.3827   1512.6400     35.8100     14.1600
+    464.5169   1512.6300     35.8100     14.1600
+    464.6511   1512.6300     35.8100     14.1600
+    464.7852   1512.6200     35.8100     14.1600
+    464.9194   1512.6200     35.8100     14.1600
+    465.0535   1512.6200     35.8100     14.1600
+    465.1877   1512.6200     35.8100     14.1600
+    465.3219   1512.6200     35.8100     14.1600
+    465.4560   1512.6200     35.8000     14.1600
+    465.5902   1512.6200     35.8000     14.1500
+    465.7243   1512.6200     35.8100     14.1500
+    465.8585   1512.6200     35.8100     14.1500
+    465.9926   1512.6200     35.8100     14.1500
+    466.1268   1512.6100     35.8000     14.1500
+    466.2610   1512.6100     35.8000     14.1500
+    466.3951   1512.6000     35.8000     14.1500
+    466.5293   1512.6000     35.8100     14.1400
+    466.6634   1512.5900     35.8000     14.1400
+    466.7976   1512.5800     35.8000     14.1400
+    466.9317   1512.5800     35.8000     14.1400
+    467.0659   1512.5600     35.8000     14.1300
+    467.2000   1512.5400     35.8000     14.1200
+    467.3342   1512.5100     35.8000     14.1100
+    467.4683   1512.4900     35.8000     14.1100
+    467.6024   1512.4500     35.8000     14.0900
+    467.7366   1512.4100     35.8000     14.0800
+    467.8708   1512.3700     35.8000     14.0700
+    468.0049   1512.3300     35.7900     14.0600
+    468.1390   1512.2900     35.7900     14.0400
+    468.2732   1512.2500     35.7900     14.0300
+    468.4073   1512.2300     35.7900     14.0300
+    468.5415   1512.2000     35.7900     14.0200
+    468.6756   1512.1800     35.7800     14.0100
+    468.8097   1512.1700     35.7800     14.0100
+    468.9439   1512.1600     35.7800     14.0000
+    469.0780   1512.1500     35.7800     14.0000
+    469.2122   1512.1400     35.7800     14.0000
+    469.3463   1512.1300     35.7800     13.9900
+    469.4804   1512.1200     35.7800     13.9900
+    469.6145   1512.1200     35.7800     13.9900
+    469.7487   1512.1100     35.7800     13.9900
+    469.8828   1512.1000     35.7800     13.9800
+    470.0169   1512.0900     35.7800     13.9800
+    470.1511   1512.0900     35.7800     13.9800
+    470.2852   1512.0800     35.7800     13.9700
+    470.4193   1512.0700     35.7800     13.9700
+    470.5534   1512.0600     35.7800     13.9700
+    470.6876   1512.0500     35.7800     13.9600
+    470.8217   1512.0500     35.7800     13.9600
+    470.9557   1512.0400     35.7700     13.9600
+    471.0899   1512.0300     35.7700     13.9600
+    471.2240   1512.0300     35.7800     13.9500
+    471.3582   1457.8700     35.7800      0.0000
+    472.5652   1469.7900      0.0000     13.9200
+    472.6992   1469.7800      0.0000     13.9200
+    472.8334   1469.7700      0.0100     13.9200
+    472.9675   1457.8900     35.7700      0.0000
+    474.1744   1469.5200      0.0000     13.8400
+    474.3084   1469.4900      0.0000     13.8300
+    474.4426   1469.4700      0.0100     13.8200
+    474.5766   1511.6000     35.7500     13.8200
+    474.7108   1511.5800     35.7500     13.8100
+    474.8448   1511.5500     35.7500     13.8000
+    474.9789   1511.5200     35.7500     13.7900
+    475.1130   1511.5000     35.7500     13.7800
+    475.2471   1511.4700     35.7500     13.7700
+    475.3812   1511.4500     35.7400     13.7700
+    475.5153   1511.4300     35.7400     13.7600
+    475.6494   1511.4200     35.7400     13.7600
+    475.7834   1511.4100     35.7400     13.7500
+    475.9175   1511.4000     35.7400     13.7500
+    476.0516   1511.3900     35.7400     13.7500
+    476.1857   1457.9000     35.7400      0.0000
+    477.3924   1469.1300      0.0000     13.7200
+    477.5265   1469.1200      0.0000     13.7200
+    477.6605   1469.1200      0.0100     13.7200
+    477.7946   1511.3000     35.7300     13.7100
+    477.9286   1511.3000     35.7300     13.7100
+    478.0627   1511.2900     35.7300     13.7100
+    478.1968   1511.2900     35.7300     13.7100
+    478.3309   1511.2800     35.7300     13.7100
+    478.4649   1511.2800     35.7300     13.7000
+    478.5990   1511.2800     35.7300     13.7000
+    478.7331   1511.2800     35.7300     13.7000
+    478.8671   1511.2800     35.7300     13.7000
+    479.0012   1511.2800     35.7300     13.7000
+    479.1352   1511.2800     35.7300     13.7000
+    479.2693   1511.2800     35.7400     13.7000
+    479.4034   1511.2800     35.7400     13.7000
+    479.5374   1511.2900     35.7400     13.7000
+    479.6715   1511.2900     35.7400     13.7000
+    479.8056   1511.2900     35.7400     13.7000
+    479.9396   1511.2900     35.7400     13.7000
+    480.0736   1511.2900     35.7400     13.7000
+    480.2077   1511.2900     35.7400     13.7000
+    480.3417   1511.2900     35.7300     13.6900
+    480.4758   1511.2800     35.7300     13.6900
+    480.6098   1511.2600     35.7300     13.6900
+    480.7439   1511.2400     35.7300     13.6800
+    480.8779   1511.2500     35.7600     13.6700
+    481.0120   1511.2900     35.8100     13.6700
+    481.1460   1511.3200     35.8500     13.6600
+    481.2801   1511.3300     35.8800     13.6500
+    481.4141   1511.3300     35.9000     13.6400
+    481.5482   1511.3700     35.9500     13.6400
+    481.6822   1511.3800     35.9800     13.6300
+    481.8162   1511.3700     35.9700     13.6300
+    481.9503   1511.3600     35.9700     13.6200
+    482.0843   1511.3200     35.9500     13.6200
+    482.2183   1511.3200     35.9500     13.6200
+    482.3524   1511.3100     35.9500     13.6200
+    482.4864   1511.3400     35.9700     13.6100
+    482.6205   1458.3600     36.0000      0.0000
+    483.8268   1469.2600      0.0000     13.7300
+    483.9608   1469.2500      0.0000     13.7200
+    484.0948   1469.2400      0.0100     13.7200
+    484.2288   1457.9800     35.6900      0.0000
+    485.4349   1468.6600      0.0000     13.5600
+    485.5689   1468.6600      0.0000     13.5600
+    485.7030   1468.6700      0.0100     13.5500
+    485.8370   1511.2200     35.9900     13.5500
+    485.9710   1511.2200     35.9900     13.5500
+    486.1050   1511.1600     35.9400     13.5500
+    486.2390   1511.1000     35.8900     13.5500
+    486.3730   1511.0300     35.8400     13.5500
+    486.5070   1511.0300     35.8400     13.5500
+    486.6410   1511.0300     35.8400     13.5500
+    486.7750   1511.0400     35.8400     13.5500
+    486.9090   1511.0100     35.8100     13.5500
+    487.0430   1510.9700     35.7900     13.5500
+    487.1770   1511.0000     35.8100     13.5500
+    487.3110   1511.0300     35.8300     13.5500
+    487.4450   1511.0600     35.8600     13.5400
+    487.5790   1511.1200     35.9100     13.5400
+    487.7130   1511.1500     35.9400     13.5400
+    487.8470   1511.1500     35.9400     13.5400
+    487.9810   1511.1500     35.9400     13.5400
+    488.1150   1511.1700     35.9600     13.5400
+    488.2490   1511.2000     35.9900     13.5400
+    488.3830   1511.2000     35.9900     13.5400
+    488.5170   1511.2000     35.9900     13.5300
+    488.6510   1458.4400     35.9900      0.0000
+    490.2588   1470.6200      0.0000     14.0700
+    490.3927   1470.3600      0.0000     14.0000
+    490.5267   1470.1200      0.0100     13.9300
+    490.6607   1511.5800     35.3900     13.8600
+    490.7947   1511.1700     35.4200     13.7200
+    490.9286   1510.8000     35.4900     13.5800
+    491.0626   1510.9000     35.5800     13.5800
+    491.1966   1510.4900     35.6200     13.4400
+    491.3305   1510.5200     35.6600     13.4300
+    491.4645   1510.5500     35.6900     13.4300
+    491.5985   1510.5400     35.7000     13.4200
+    491.7325   1510.5300     35.7000     13.4200
+    491.8664   1510.5200     35.6900     13.4200
+    492.0004   1510.5100     35.6900     13.4100
+    492.1343   1510.5000     35.6900     13.4100
+    492.2683   1510.4900     35.6900     13.4100
+    492.4023   1458.1100     35.6900      0.0000
+    494.1437   1469.8400      0.0000     13.8400
+    494.2776   1469.3400      0.0000     13.7000
+    494.4116   1468.8500      0.0100     13.5700
+    494.5455   1510.5100     35.4300     13.5000
+    494.6794   1457.9200     35.5200      0.0000
+    496.2867   1468.0100      0.0000     13.3300
+    496.4207   1468.0000      0.0000     13.3300
+    496.5546   1468.0000      0.0100     13.3200
+    496.6885   1510.2600     35.6700     13.3200
+    496.8224   1510.2600     35.6700     13.3200
+    496.9564   1510.2600     35.6700     13.3200
+    497.0903   1510.2500     35.6700     13.3200
+    497.2242   1510.2500     35.6700     13.3200
+    497.3582   1510.2500     35.6700     13.3200
+    497.4921   1510.2400     35.6700     13.3100
+    497.6260   1510.2400     35.6700     13.3100
+    497.7599   1510.2400     35.6700     13.3100
+    497.8939   1510.2400     35.6700     13.3100
+    498.0277   1510.2400     35.6700     13.3100
+    498.1617   1510.2400     35.6700     13.3100
+    498.2956   1510.2300     35.6700     13.3100
+    498.4295   1510.2300     35.6700     13.3100
+    498.5634   1510.2300     35.6700     13.3100
+    498.6974   1458.1800     35.6700      0.0000
+    501.1076   1468.9000      0.0000     13.5500
+    501.2415   1468.3900      0.0000     13.4100
+    501.3754   1467.9000      0.0100     13.2800
+    501.5094   1510.0000     35.5300     13.2700
+    501.6432   1510.0600     35.5900     13.2600
+    501.7772   1510.0400     35.5900     13.2600
+    501.9110   1509.8000     35.5900     13.1900
+    502.0449   1509.8200     35.6200     13.1800
+    502.1788   1509.8400     35.6500     13.1700
+    502.3127   1509.8200     35.6500     13.1700
+    502.4466   1509.8000     35.6500     13.1600
+    502.5804   1509.7800     35.6500     13.1600
+    502.7144   1509.7600     35.6500     13.1500
+    502.8482   1509.7400     35.6500     13.1400
+    502.9821   1509.7400     35.6600     13.1400
+    503.1160   1509.7300     35.6700     13.1300
+    503.2499   1509.7200     35.6800     13.1200
+    503.3838   1509.7100     35.6900     13.1200
+    503.5176   1509.6900     35.6900     13.1100
+    503.6515   1509.6800     35.7000     13.1000
+    503.7854   1510.1100     35.7000     13.2300
+    503.9193   1510.4600     35.6500     13.3600
+    504.0531   1510.7500     35.5300     13.4900
+    504.1870   1511.0300     35.4000     13.6200
+    504.3209   1511.3100     35.2700     13.7500
+    504.4547   1511.1500     35.1400     13.7500
+    504.5887   1457.4800     35.0800      0.0000
+    506.3289   1467.1600      0.0000     13.0500
+    506.4627   1467.1400      0.0000     13.0500
+    506.5966   1467.1400      0.0100     13.0500
+    506.7304   1509.4500     35.6300     13.0400
+    506.8643   1509.4400     35.6300     13.0400
+    506.9982   1509.4400     35.6300     13.0400
+    507.1320   1509.4300     35.6300     13.0300
+    507.2659   1509.4200     35.6300     13.0300
+    507.3997   1509.4200     35.6300     13.0300
+    507.5336   1509.4100     35.6300     13.0300
+    507.6674   1509.4100     35.6300     13.0200
+    507.8012   1509.4000     35.6300     13.0200
+    507.9351   1509.3900     35.6300     13.0200
+    508.0689   1509.3800     35.6300     13.0200
+    508.2028   1509.3600     35.6200     13.0100
+    508.3366   1509.3500     35.6200     13.0100
+    508.4705   1509.3400     35.6200     13.0000
+    508.6043   1509.3600     35.6200     13.0100
+    508.7382   1509.3700     35.6200     13.0100
+    508.8720   1509.3800     35.6100     13.0200
+    509.0058   1509.3900     35.6100     13.0200
+    509.1397   1509.4000     35.6000     13.0300
+    509.2735   1458.2500     35.5900      0.0000
+    511.5486   1466.6000      0.0000     12.8800
+    511.6824   1466.5800      0.0000     12.8700
+    511.8163   1466.5700      0.0100     12.8700
+    511.9500   1508.9200     35.6100     12.8700
+    512.0839   1508.9100     35.6100     12.8600
+    512.2177   1508.9000     35.6100     12.8600
+    512.3514   1508.8900     35.6000     12.8600
+    512.4853   1508.8900     35.6000     12.8500
+    512.6191   1508.8800     35.6100     12.8500
+    512.7529   1508.8700     35.6100     12.8500
+    512.8867   1508.8600     35.6100     12.8400
+    513.0206   1508.8400     35.6000     12.8400
+    513.1544   1508.8200     35.6000     12.8300
+    513.2882   1508.8000     35.6000     12.8300
+    513.4219   1508.7900     35.6000     12.8200
+    513.5557   1508.7700     35.6000     12.8200
+    513.6896   1508.7600     35.6000     12.8100
+    513.8234   1508.7500     35.6000     12.8100
+    513.9572   1508.7300     35.6000     12.8000
+    514.0909   1508.7200     35.6000     12.8000
+    514.2248   1508.7200     35.6000     12.8000
+    514.3586   1508.7100     35.5900     12.7900
+    514.4924   1508.7000     35.5900     12.7900
+    514.6262   1508.7000     35.5900     12.7900
+    514.7599   1508.6900     35.5900     12.7900
+    514.8938   1508.6800     35.5900     12.7800
+    515.0275   1508.6700     35.5900     12.7800
+    515.1614   1508.6600     35.5900     12.7800
+    515.2951   1508.6600     35.5900     12.7800
+    515.4290   1508.6500     35.6000     12.7700
+    515.5627   1508.6400     35.6000     12.7700
+    515.6965   1508.6400     35.6000     12.7700
+    515.8303   1508.6200     35.6000     12.7600
+    515.9641   1458.3600     35.6000      0.0000
+    518.3721   1465.9500      0.0000     12.6800
+    518.5059   1465.9300      0.0000     12.6700
+    518.6396   1465.9200      0.0100     12.6700
+    518.7734   1508.3200     35.5800     12.6600
+    518.9072   1508.3000     35.5800     12.6600
+    519.0409   1508.2800     35.5800     12.6500
+    519.1747   1508.2700     35.5800     12.6500
+    519.3084   1508.2500     35.5800     12.6400
+    519.4422   1508.2400     35.5700     12.6400
+    519.5759   1508.2300     35.5700     12.6300
+    519.7097   1508.2100     35.5700     12.6300
+    519.8434   1508.2000     35.5700     12.6200
+    519.9772   1508.1900     35.5700     12.6200
+    520.1110   1508.1800     35.5700     12.6200
+    520.2448   1508.1800     35.5700     12.6200
+    520.3785   1508.1800     35.5700     12.6100
+    520.5123   1508.1700     35.5700     12.6100
+    520.6460   1508.1700     35.5700     12.6100
+    520.7797   1458.4100     35.5700      0.0000
+    521.9835   1465.7200      0.0000     12.6000
+    522.1172   1465.7200      0.0000     12.6000
+    522.2510   1465.7200      0.0100     12.6000
+    522.3847   1508.1400     35.5700     12.6000
+    522.5184   1508.1400     35.5700     12.5900
+    522.6522   1508.1300     35.5700     12.5900
+    522.7859   1508.1300     35.5700     12.5900
+    522.9196   1508.1200     35.5700     12.5900
+    523.0534   1508.1100     35.5600     12.5800
+    523.1871   1508.1000     35.5600     12.5800
+    523.3209   1508.0900     35.5600     12.5800
+    523.4546   1508.0700     35.5600     12.5700
+    523.5883   1508.0700     35.5600     12.5700
+    523.7220   1508.0600     35.5600     12.5700
+    523.8558   1508.0500     35.5600     12.5600
+    523.9895   1508.0400     35.5600     12.5600
+    524.1232   1508.0300     35.5600     12.5600
+    524.2570   1508.0200     35.5600     12.5500
+    524.3907   1508.0100     35.5600     12.5500
+    524.5244   1508.0100     35.5600     12.5500
+    524.6581   1508.0000     35.5600     12.5500
+    524.7918   1507.9900     35.5600     12.5400
+    524.9256   1507.9800     35.5600     12.5400
+    525.0593   1507.9600     35.5600     12.5300
+    525.1930   1507.9400     35.5600     12.5300
+    525.3267   1507.9200     35.5600     12.5200
+    525.4604   1507.8900     35.5600     12.5100
+    525.5942   1507.8600     35.5500     12.5000
+    525.7278   1507.8300     35.5500     12.4900
+    525.8616   1507.8000     35.5500     12.4800
+    525.9953   1507.7700     35.5500     12.4700
+    526.1290   1507.7500     35.5500     12.4700
+    526.2627   1507.7200     35.5400     12.4600
+    526.3964   1507.7000     35.5400     12.4500
+    526.5302   1507.6800     35.5400     12.4500
+    526.6639   1507.6600     35.5400     12.4400
+    526.7975   1507.6500     35.5400     12.4400
+    526.9312   1507.6400     35.5400     12.4300
+    527.0649   1507.6300     35.5400     12.4300
+    527.1987   1507.6200     35.5400     12.4300
+    527.3324   1507.6100     35.5400     12.4200
+    527.4661   1507.6000     35.5400     12.4200
+    527.5998   1507.5900     35.5400     12.4100
+    527.7335   1507.5700     35.5400     12.4100
+    527.8671   1507.5600     35.5400     12.4100
+    528.0009   1507.5500     35.5400     12.4000
+    528.1345   1507.5300     35.5400     12.4000
+    528.2682   1507.5100     35.5300     12.3900
+    528.4019   1507.4900     35.5300     12.3800
+    528.5356   1507.4700     35.5300     12.3800
+    528.6693   1507.4500     35.5300     12.3700
+    528.8030   1507.4300     35.5300     12.3700
+    528.9367   1507.4100     35.5300     12.3600
+    529.0704   1507.4000     35.5300     12.3600
+    529.2041   1507.3800     35.5300     12.3500
+    529.3378   1507.3800     35.5300     12.3500
+    529.4715   1507.3700     35.5300     12.3500
+    529.6052   1507.3600     35.5300     12.3400
+    529.7389   1507.3600     35.5300     12.3400
+    529.8725   1507.3600     35.5300     12.3400
+    530.0062   1507.3600     35.5200     12.3400
+    530.1399   1507.3600     35.5300     12.3400
+    530.2736   1507.3700     35.5300     12.3400
+    530.4073   1507.3700     35.5300     12.3400
+    530.5409   1507.3700     35.5300     12.3400
+    530.6746   1507.3700     35.5300     12.3400
+    530.8083   1507.3700     35.5300     12.3400
+    530.9420   1507.3600     35.5300     12.3400
+    531.0756   1507.3600     35.5300     12.3400
+    531.2093   1507.3600     35.5300     12.3300
+    531.3430   1507.3600     35.5300     12.3300
+    531.4766   1507.3600     35.5300     12.3300
+    531.6104   1507.3500     35.5200     12.3300
+    531.7440   1507.3600     35.5200     12.3300
+    531.8777   1508.2500     35.5200     12.6000
+    532.0114   1508.9900     35.4000     12.8600
+    532.1450   1509.5800     35.1500     13.1300
+    532.2787   1510.1700     34.9000     13.3900
+    532.4123   1510.7600     34.6600     13.6600
+    532.5460   1510.4700     34.4200     13.6600
+    532.6796   1510.3300     34.3000     13.6600
+    532.8134   1456.9000     34.3000      0.0000
+    534.8181   1464.7600      0.0000     12.2900
+    534.9518   1464.7500      0.0000     12.2900
+    535.0854   1464.7500      0.0100     12.2800
+    535.2191   1508.1400     35.5200     12.5500
+    535.3527   1507.9800     35.3900     12.5500
+    535.4864   1507.8200     35.2700     12.5400
+    535.6200   1507.8100     35.2700     12.5400
+    535.7536   1507.7900     35.2700     12.5300
+    535.8873   1507.7800     35.2800     12.5200
+    536.0209   1507.7500     35.2800     12.5100
+    536.1545   1507.7200     35.2800     12.5100
+    536.2882   1507.6900     35.2800     12.4900
+    536.4219   1506.7400     35.2700     12.2200
+    536.5555   1506.8500     35.4000     12.2000
+    536.6891   1506.9600     35.5200     12.1900
+    536.8228   1506.9100     35.5200     12.1800
+    536.9564   1506.8700     35.5100     12.1700
+    537.0900   1506.8200     35.5000     12.1600
+    537.2236   1507.8100     35.5000     12.4500
+    537.3572   1458.3900     35.3500      0.0000
+    539.3615   1470.2100      0.0000     13.7400
+    539.4952   1469.1600      0.0000     13.4500
+    539.6288   1468.1100      0.0100     13.1600
+    539.7624   1457.1700     34.4200      0.0000
+    541.0984   1466.1500      0.0000     12.6300
+    541.2320   1465.6100      0.0000     12.4900
+    541.3657   1465.5800      0.0100     12.4800
+    541.4992   1506.4200     34.9700     12.2000
+    541.6328   1506.5400     35.0900     12.2000
+    541.7664   1506.6700     35.2100     12.1900
+    541.9000   1505.7500     35.2100     11.9200
+    542.0336   1505.8800     35.3400     11.9100
+    542.1672   1506.0300     35.4600     11.9100
+    542.3008   1506.0200     35.4600     11.9100
+    542.4344   1506.0100     35.4600     11.9100
+    542.5680   1506.0000     35.4600     11.9000
+    542.7015   1505.9900     35.4600     11.9000
+    542.8351   1505.9900     35.4600     11.9000
+    542.9688   1505.9800     35.4600     11.9000
+    543.1024   1505.9800     35.4600     11.8900
+    543.2359   1505.9700     35.4600     11.8900
+    543.3695   1505.9700     35.4600     11.8900
+    543.5031   1505.9600     35.4600     11.8900
+    543.6367   1505.9600     35.4600     11.8900
+    543.7703   1505.9600     35.4600     11.8800
+    543.9038   1505.9600     35.4600     11.8800
+    544.0374   1505.9600     35.4600     11.8800
+    544.1710   1505.9500     35.4600     11.8800
+    544.3046   1505.9600     35.4600     11.8800
+    544.4381   1505.9600     35.4600     11.8800
+    544.5717   1505.9600     35.4600     11.8800
+    544.7053   1505.9500     35.4600     11.8800
+    544.8388   1505.9500     35.4600     11.8800
+    544.9724   1505.9500     35.4600     11.8800
+    545.1060   1505.9400     35.4600     11.8700
+    545.2396   1458.6600     35.4600      0.0000
+    547.6437   1463.1900      0.0000     11.8200
+    547.7772   1463.1700      0.0000     11.8200
+    547.9107   1463.6800      0.0100     11.9500
+    548.0443   1506.5900     35.3900     12.0800
+    548.1779   1506.8800     35.2600     12.2000
+    548.3114   1507.1700     35.1300     12.3300
+    548.4449   1507.4600     35.0100     12.4600
+    548.5785   1507.3000     34.8800     12.4600
+    548.7120   1507.2100     34.8200     12.4500
+    548.8456   1507.1900     34.8200     12.4500
+    548.9791   1507.1800     34.8200     12.4400
+    549.1126   1506.7100     34.8200     12.3000
+    549.2462   1506.3100     34.8800     12.1600
+    549.3797   1506.8900     35.0100     12.2900
+    549.5133   1507.3300     35.0100     12.4200
+    549.6468   1506.7200     34.8800     12.2800
+    549.7804   1506.7000     34.8800     12.2800
+    549.9139   1506.7700     34.9400     12.2700
+    550.0474   1506.7600     34.9400     12.2700
+    550.1810   1506.7500     34.9400     12.2700
+    550.3145   1506.7400     34.9400     12.2700
+    550.4480   1506.7400     34.9400     12.2600
+    550.5815   1505.8300     34.9400     12.0000
+    550.7151   1505.0600     35.0700     11.7300
+    550.8486   1505.3600     35.3200     11.7300
+    550.9822   1505.5100     35.4400     11.7200
+    551.1157   1505.5000     35.4400     11.7200
+    551.2491   1505.4900     35.4400     11.7200
+    551.3827   1505.4900     35.4400     11.7200
+    551.5162   1505.4900     35.4400     11.7200
+    551.6498   1505.4900     35.4400     11.7200
+    551.7833   1505.4800     35.4400     11.7100
+    551.9168   1505.4800     35.4400     11.7100
+    552.0503   1505.4700     35.4400     11.7100
+    552.1838   1505.4600     35.4400     11.7100
+    552.3173   1505.4600     35.4400     11.7100
+    552.4509   1505.4500     35.4400     11.7000
+    552.5844   1505.4400     35.4400     11.7000
+    552.7179   1505.4300     35.4400     11.6900
+    552.8514   1505.8700     35.4400     11.8200
+    552.9849   1506.2300     35.3700     11.9500
+    553.1185   1506.5200     35.2500     12.0800
+    553.2520   1458.3400     35.1200      0.0000
+    555.6550   1462.4000      0.0000     11.5800
+    555.7885   1462.3800      0.0000     11.5800
+    555.9219   1462.3600      0.0100     11.5700
+    556.0554   1505.0200     35.4300     11.5600
+    556.1889   1505.0100     35.4300     11.5600
+    556.3224   1505.0000     35.4200     11.5600
+    556.4559   1504.9800     35.4200     11.5500
+    556.5894   1504.9600     35.4200     11.5500
+    556.7229   1504.9400     35.4100     11.5400
+    556.8563   1504.9200     35.4100     11.5400
+    556.9898   1504.8900     35.4100     11.5300
+    557.1233   1504.8600     35.4100     11.5200
+    557.2568   1504.8400     35.4100     11.5100
+    557.3903   1504.8000     35.4100     11.5000
+    557.5237   1504.7700     35.4100     11.4900
+    557.6572   1504.7400     35.4100     11.4800
+    557.7907   1504.7200     35.4100     11.4800
+    557.9241   1504.7100     35.4100     11.4700
+    558.0577   1504.6900     35.4100     11.4700
+    558.1911   1504.6900     35.4100     11.4600
+    558.3246   1504.6700     35.4100     11.4600
+    558.4581   1504.6700     35.4100     11.4600
+    558.5916   1504.6700     35.4100     11.4600
+    558.7250   1504.6600     35.4100     11.4500
+    558.8585   1504.6600     35.4100     11.4500
+    558.9919   1504.6600     35.4100     11.4500
+    559.1254   1504.6600     35.4100     11.4500
+    559.2589   1504.6500     35.4000     11.4500
+    559.3923   1504.6500     35.4000     11.4500
+    559.5258   1504.6500     35.4100     11.4500
+    559.6592   1458.8200     35.4000      0.0000
+    560.8604   1461.9600      0.0000     11.4500
+    560.9939   1461.9600      0.0000     11.4400
+    561.1273   1461.9600      0.0100     11.4400
+    561.2607   1504.6600     35.4100     11.4400
+    561.3942   1504.6600     35.4100     11.4400
+    561.5276   1504.6600     35.4100     11.4400
+    561.6611   1504.6600     35.4100     11.4400
+    561.7946   1504.6600     35.4100     11.4400
+    561.9280   1504.6600     35.4100     11.4400
+    562.0614   1504.6600     35.4100     11.4400
+    562.1949   1504.6600     35.4100     11.4400
+    562.3283   1504.6600     35.4100     11.4400
+    562.4617   1504.6600     35.4000     11.4400
+    562.5952   1505.5800     35.4000     11.7000
+    562.7286   1506.3400     35.2800     11.9700
+    562.8621   1458.3600     35.0200      0.0000
+    564.0630   1461.8900      0.0000     11.4200
+    564.1964   1461.8800      0.0000     11.4100
+    564.3299   1461.8700      0.0100     11.4100
+    564.4633   1504.5700     35.4000     11.4000
+    564.5967   1504.5600     35.4000     11.4000
+    564.7301   1504.5500     35.4000     11.4000
+    564.8635   1504.5400     35.4000     11.3900
+    564.9970   1504.5300     35.4000     11.3900
+    565.1304   1504.5200     35.4000     11.3900
+    565.2639   1504.5000     35.4000     11.3800
+    565.3972   1505.4000     35.4000     11.6400
+    565.5307   1505.2200     35.2700     11.6300
+    565.6641   1505.0400     35.1400     11.6200
+    565.7975   1505.0000     35.1400     11.6100
+    565.9309   1504.9700     35.1400     11.6000
+    566.0643   1504.9300     35.1400     11.5900
+    566.1978   1504.9000     35.1400     11.5800
+    566.3311   1504.8700     35.1400     11.5700
+    566.4646   1458.5700     35.1400      0.0000
+    569.6661   1460.9800      0.0000     11.1600
+    569.7996   1460.9500      0.0000     11.1500
+    569.9329   1460.9300      0.0100     11.1400
+    570.0663   1503.6800     35.3600     11.1300
+    570.1997   1503.6500     35.3600     11.1300
+    570.3331   1503.6400     35.3600     11.1200
+    570.4665   1503.6600     35.3600     11.1300
+    570.5999   1503.6900     35.3500     11.1400
+    570.7332   1458.9200     35.3400      0.0000
+    572.8672   1460.5700      0.0000     11.0400
+    573.0005   1460.5700      0.0000     11.0400
+    573.1339   1460.5600      0.0100     11.0300
+    573.2673   1503.3500     35.3500     11.0300
+    573.4006   1503.3400     35.3500     11.0300
+    573.5340   1458.9800     35.3500      0.0000
+    575.6676   1460.1900      0.0000     10.9300
+    575.8009   1460.1600      0.0000     10.9200
+    575.9343   1460.1400      0.0100     10.9100
+    576.0676   1502.9400     35.3300     10.9100
+    576.2010   1502.9300     35.3300     10.9000
+    576.3343   1502.9100     35.3300     10.9000
+    576.4677   1502.8900     35.3300     10.8900
+    576.6010   1502.8800     35.3200     10.8900
+    576.7343   1502.8700     35.3200     10.8800
+    576.8677   1502.8600     35.3200     10.8800
+    577.0010   1502.8500     35.3200     10.8800
+    577.1343   1502.8500     35.3200     10.8800
+    577.2676   1459.0000     35.3200      0.0000
+    578.4676   1459.8100      0.0000     10.8200
+    580.0674   1459.2100      0.0000     10.6600
+    580.2007   1459.1700      0.0000     10.6500
+    580.3340   1459.1400      0.0100     10.6400
+    580.4673   1501.9900     35.2900     10.6300
+    580.6006   1501.9600     35.2800     10.6200
+    580.7339   1501.9400     35.2800     10.6200
+    580.8672   1459.0100     35.2800      0.0000
+    582.0669   1458.8000      0.0000     10.5500
+    582.2003   1458.7700      0.0000     10.5400
+    582.3335   1458.7600      0.0100     10.5400
+    582.4668   1501.6500     35.2700     10.5300
+    582.6001   1501.6400     35.2700     10.5300
+    582.7334   1501.6300     35.2700     10.5200
+    582.8667   1501.6300     35.2700     10.5200
+    582.9999   1501.6200     35.2700     10.5200
+    583.1333   1501.6200     35.2700     10.5200
+    583.2665   1501.6100     35.2700     10.5200
+    583.3998   1501.6100     35.2700     10.5200
+    583.5331   1501.6100     35.2700     10.5100
+    583.6664   1501.6100     35.2700     10.5100
+    583.7997   1501.6000     35.2700     10.5100
+    583.9330   1501.5900     35.2700     10.5100
+    584.0663   1501.5800     35.2700     10.5100
+    584.1995   1501.5700     35.2700     10.5000
+    584.3328   1501.5500     35.2600     10.5000
+    584.4661   1501.5400     35.2600     10.4900
+    584.5994   1501.5200     35.2600     10.4900
+    584.7327   1501.5000     35.2600     10.4800
+    584.8659   1501.4700     35.2600     10.4700
+    584.9992   1501.4300     35.2600     10.4600
+    585.1324   1501.4100     35.2600     10.4500
+    585.2657   1501.3700     35.2600     10.4400
+    585.3990   1501.3300     35.2500     10.4300
+    585.5323   1501.2900     35.2500     10.4200
+    585.6655   1501.2200     35.2500     10.4000
+    585.7988   1501.1200     35.2500     10.3700
+    585.9321   1501.0100     35.2600     10.3400
+    586.0653   1500.8800     35.2600     10.3000
+    586.1986   1500.7400     35.2500     10.2600
+    586.3318   1500.5800     35.2400     10.2200
+    586.4651   1500.4200     35.2300     10.1800
+    586.5984   1500.2600     35.2200     10.1400
+    586.7317   1500.1000     35.2200     10.0900
+    586.8649   1499.9500     35.2100     10.0500
+    586.9982   1499.8400     35.2000     10.0200
+    587.1315   1499.7300     35.1800     10.0000
+    587.2647   1499.6400     35.1700      9.9800
+    587.3979   1499.5800     35.1700      9.9600
+    587.5312   1499.5300     35.1700      9.9500
+    587.6645   1499.4900     35.1800      9.9300
+    587.7977   1499.4500     35.1700      9.9200
+    587.9310   1499.4300     35.1700      9.9200
+    588.0642   1499.4100     35.1700      9.9100
+    588.1974   1499.4000     35.1700      9.9100
+    588.3307   1499.3900     35.1700      9.9000
+    588.4640   1499.3900     35.1700      9.9000
+    588.5972   1499.3800     35.1700      9.9000
+    588.7305   1499.3800     35.1700      9.9000
+    588.8637   1499.3800     35.1700      9.9000
+    588.9969   1499.3700     35.1700      9.9000
+    589.1302   1499.3700     35.1700      9.9000
+    589.2634   1499.3700     35.1700      9.8900
+    589.3967   1499.3700     35.1700      9.8900
+    589.5300   1499.3600     35.1700      9.8900
+    589.6631   1499.3600     35.1700      9.8900
+    589.7964   1499.3500     35.1700      9.8900
+    589.9296   1499.3400     35.1700      9.8800
+    590.0629   1499.3300     35.1700      9.8800
+    590.1961   1499.3100     35.1700      9.8700
+    590.3293   1499.2900     35.1700      9.8700
+    590.4626   1499.2600     35.1700      9.8600
+    590.5958   1499.2300     35.1700      9.8500
+    590.7291   1499.2000     35.1700      9.8400
+    590.8622   1499.1700     35.1700      9.8300
+    590.9955   1499.1300     35.1700      9.8200
+    591.1287   1499.0900     35.1600      9.8100
+    591.2620   1499.0500     35.1600      9.8000
+    591.3952   1499.0200     35.1600      9.7900
+    591.5284   1498.9900     35.1600      9.7800
+    591.6617   1498.9600     35.1500      9.7800
+    591.7949   1498.9400     35.1500      9.7700
+    591.9281   1498.9200     35.1500      9.7600
+    592.0613   1498.9000     35.1500      9.7600
+    592.1946   1498.8800     35.1500      9.7500
+    592.3278   1498.8700     35.1500      9.7500
+    592.4609   1498.8500     35.1500      9.7400
+    592.5942   1498.8300     35.1500      9.7400
+    592.7274   1498.8100     35.1500      9.7300
+    592.8607   1498.8000     35.1500      9.7300
+    592.9938   1498.7800     35.1500      9.7200
+    593.1271   1498.7700     35.1500      9.7200
+    593.2603   1498.7600     35.1500      9.7200
+    593.3935   1498.7500     35.1500      9.7100
+    593.5267   1498.7500     35.1500      9.7100
+    593.6599   1498.7400     35.1500      9.7100
+    593.7931   1498.7300     35.1500      9.7000
+    593.9263   1498.7200     35.1500      9.7000
+    594.0595   1498.7100     35.1500      9.7000
+    594.1927   1498.7100     35.1500      9.7000
+    594.3259   1498.7000     35.1500      9.6900
+    594.4591   1498.6900     35.1500      9.6900
+    594.5923   1498.6800     35.1400      9.6900
+    594.7255   1498.6700     35.1400      9.6800
+    594.8587   1498.6600     35.1400      9.6800
+    594.9919   1498.6500     35.1400      9.6800
+    595.1251   1498.6400     35.1400      9.6800
+    595.2584   1498.6400     35.1400      9.6700
+    595.3915   1498.6300     35.1400      9.6700
+    595.5247   1498.6300     35.1400      9.6700
+    595.6579   1498.6200     35.1400      9.6700
+    595.7911   1498.6200     35.1400      9.6700
+    595.9243   1498.6100     35.1400      9.6600
+    596.0575   1498.6000     35.1400      9.6600
+    596.1907   1498.5900     35.1400      9.6600
+    596.3239   1498.5800     35.1400      9.6500
+    596.4571   1498.5700     35.1400      9.6500
+    596.5903   1498.5600     35.1400      9.6500
+    596.7234   1498.5500     35.1400      9.6400
+    596.8566   1498.5400     35.1400      9.6400
+    596.9898   1498.5300     35.1400      9.6400
+    597.1230   1498.5200     35.1400      9.6300
+    597.2562   1498.5100     35.1400      9.6300
+    597.3894   1498.5000     35.1400      9.6300
+    597.5225   1498.4900     35.1400      9.6200
+    597.6558   1498.4900     35.1400      9.6200
+    597.7889   1498.4800     35.1400      9.6200
+    597.9221   1498.4800     35.1400      9.6200
+    598.0552   1498.4800     35.1400      9.6200
+    598.1884   1498.4800     35.1400      9.6200
+    598.3216   1498.4900     35.1400      9.6200
+    598.4548   1498.4900     35.1400      9.6200
+    598.5880   1498.4900     35.1400      9.6200
+    598.7211   1498.4900     35.1400      9.6200
+    598.8543   1498.5000     35.1400      9.6200
+    598.9875   1498.4900     35.1400      9.6200
+    599.1206   1498.4900     35.1400      9.6200
+    599.2538   1498.4900     35.1400      9.6200
+    599.3870   1498.4900     35.1400      9.6100
+    599.5201   1498.4800     35.1400      9.6100
+    599.6533   1498.4700     35.1500      9.6100
+    599.7865   1498.4500     35.1500      9.6000
+    599.9196   1498.4300     35.1500      9.5900
+    600.0528   1498.4100     35.1500      9.5900
+    600.1860   1498.4000     35.1500      9.5800
+    600.3191   1498.3800     35.1500      9.5800
+    600.4523   1498.5000     35.2600      9.5700
+    600.5854   1498.6300     35.3800      9.5700
+    600.7186   1498.6800     35.4300      9.5600
+    600.8517   1498.6800     35.4300      9.5600
+    600.9849   1498.6700     35.4300      9.5600
+    601.1180   1498.6600     35.4300      9.5600
+    601.2512   1498.6600     35.4400      9.5500
+    601.3843   1498.6500     35.4400      9.5500
+    601.5175   1498.6300     35.4400      9.5400
+    601.6507   1498.4800     35.3200      9.5400
+    601.7838   1498.3300     35.2100      9.5400
+    601.9170   1498.2500     35.1500      9.5300
+    602.0501   1498.3800     35.2700      9.5300
+    602.1833   1498.5000     35.3800      9.5200
+    602.3164   1498.6300     35.4900      9.5200
+    602.4495   1498.6200     35.4900      9.5200
+    602.5827   1498.6200     35.5000      9.5100
+    602.7158   1498.6400     35.5200      9.5100
+    602.8490   1498.6500     35.5300      9.5100
+    602.9821   1498.6600     35.5500      9.5100
+    603.1153   1498.6600     35.5500      9.5000
+    603.2484   1498.5100     35.4400      9.5000
+    603.3815   1498.3700     35.3300      9.5000
+    603.5146   1498.3900     35.3400      9.5000
+    603.6478   1498.5300     35.4600      9.5000
+    603.7809   1498.6600     35.5600      9.5000
+    603.9141   1498.7800     35.6700      9.5000
+    604.0472   1498.9000     35.7800      9.4900
+    604.1803   1499.0300     35.8800      9.4900
+    604.3135   1499.1700     36.0000      9.4900
+    604.4466   1460.5200     36.1200      0.0000
+    605.6447   1454.9100      0.0000      9.4800
+    608.9724   1454.5800      0.0000      9.3800
+    609.1055   1454.6600      0.0000      9.4000
+    609.2386   1454.8800      0.0000      9.4600
+    609.3716   1498.1300     35.1300      9.4800
+    609.5048   1497.9400     35.0200      9.4600
+    609.6379   1497.8700     35.0000      9.4500
+    609.7710   1497.8100     34.9900      9.4300
+    609.9041   1497.7700     34.9900      9.4200
+    610.0372   1497.7200     34.9900      9.4000
+    610.1702   1497.5500     34.9900      9.3600
+    610.3033   1497.2800     35.0100      9.2800
+    610.4364   1496.9200     34.9400      9.2000
+    610.5695   1496.8500     35.0000      9.1600
+    610.7026   1496.7600     35.0500      9.1200
+    610.8356   1496.7900     35.0900      9.1100
+    610.9688   1496.7800     35.1000      9.1100
+    611.1018   1496.7500     35.1000      9.1000
+    611.2349   1496.7100     35.1000      9.0900
+    611.3680   1496.6600     35.1000      9.0700
+    611.5010   1496.6100     35.1000      9.0600
+    611.6341   1496.5400     35.0900      9.0400
+    611.7672   1496.4800     35.0900      9.0300
+    611.9003   1496.4100     35.0900      9.0100
+    612.0333   1459.2500     35.0800      0.0000
+    613.2310   1452.5000      0.0000      8.8600
+    613.3640   1452.4800      0.0000      8.8500
+    613.4971   1452.4600      0.0000      8.8500
+    613.6301   1495.8000     35.0600      8.8400
+    613.7632   1495.7900     35.0600      8.8400
+    613.8962   1495.7900     35.0700      8.8400
+    614.0293   1495.7900     35.0700      8.8400
+    614.1624   1495.7900     35.0700      8.8300
+    614.2954   1495.7900     35.0700      8.8300
+    614.4285   1495.7800     35.0700      8.8300
+    614.5615   1495.7800     35.0700      8.8300
+    614.6946   1495.7800     35.0700      8.8300
+    614.8276   1459.2800     35.0700      0.0000
+    616.0250   1452.3500      0.0000      8.8100
+    616.1581   1452.3500      0.0000      8.8100
+    616.2911   1452.3500      0.0000      8.8100
+    616.4242   1495.7200     35.0700      8.8100
+    616.5572   1495.7100     35.0700      8.8000
+    616.6903   1495.7100     35.0700      8.8000
+    616.8233   1495.7000     35.0700      8.8000
+    616.9563   1495.6900     35.0700      8.8000
+    617.0894   1495.6900     35.0700      8.7900
+    617.2224   1459.3200     35.0700      0.0000
+    619.2178   1452.2400      0.0000      8.7700
+    619.3508   1452.2300      0.0000      8.7700
+    619.4838   1452.2200      0.0000      8.7600
+    619.6168   1495.6100     35.0700      8.7600
+    619.7499   1495.6000     35.0700      8.7600
+    619.8829   1495.5800     35.0700      8.7500
+    620.0159   1459.3700     35.0700      0.0000
+    621.2130   1452.0000      0.0000      8.7100
+    621.3459   1451.9600      0.0000      8.7000
+    621.4789   1451.9300      0.0000      8.6900
+    621.6120   1495.3100     35.0700      8.6700
+    621.7449   1495.2800     35.0700      8.6600
+    621.8780   1495.2400     35.0700      8.6500
+    622.0110   1495.2100     35.0600      8.6400
+    622.1440   1495.1900     35.0600      8.6400
+    622.2770   1495.1600     35.0600      8.6300
+    622.4099   1495.1300     35.0600      8.6200
+    622.5430   1495.1100     35.0600      8.6200
+    622.6759   1495.0900     35.0600      8.6100
+    622.8090   1459.4000     35.0600      0.0000
+    624.0059   1451.4800      0.0000      8.5700
+    624.1388   1451.4700      0.0000      8.5700
+    624.2718   1451.4600      0.0000      8.5600
+    624.4048   1494.9300     35.0600      8.5600
+    624.5377   1494.9200     35.0600      8.5600
+    624.6707   1494.9100     35.0600      8.5500
+    624.8037   1494.9000     35.0600      8.5500
+    624.9367   1494.8900     35.0600      8.5500
+    625.0696   1494.8800     35.0600      8.5500
+    625.2026   1494.8700     35.0600      8.5400
+    625.3356   1494.8700     35.0600      8.5400
+    625.4686   1494.8600     35.0600      8.5400
+    625.6016   1494.8500     35.0600      8.5300
+    625.7345   1494.8400     35.0600      8.5300
+    625.8675   1494.8300     35.0600      8.5300
+    626.0004   1494.8200     35.0600      8.5200
+    626.1334   1494.8100     35.0600      8.5200
+    626.2664   1494.8000     35.0600      8.5200
+    626.3994   1459.4500     35.0600      0.0000
+    631.5843   1450.6400      0.0000      8.3400
+    631.7172   1450.6400      0.0000      8.3400
+    631.8501   1450.6400      0.0000      8.3400
+    631.9830   1494.2100     35.0600      8.3300
+    632.1160   1494.2000     35.0600      8.3300
+    632.2488   1494.2000     35.0600      8.3300
+    632.3818   1494.2000     35.0600      8.3300
+    632.5147   1494.2000     35.0600      8.3300
+    632.6476   1494.2000     35.0600      8.3300
+    632.7806   1494.2000     35.0600      8.3300
+    632.9135   1494.2000     35.0600      8.3300
+    633.0464   1494.2000     35.0600      8.3300
+    633.1793   1494.2000     35.0600      8.3300
+    633.3123   1494.2000     35.0600      8.3300
+    633.4451   1494.2000     35.0600      8.3300
+    633.5780   1494.2100     35.0600      8.3300
+    633.7109   1494.2100     35.0600      8.3300
+    633.8439   1494.2100     35.0600      8.3200
+    633.9768   1459.5900     35.0600      0.0000
+    635.1729   1450.6000      0.0000      8.3200
+    635.3058   1450.6000      0.0000      8.3200
+    635.4387   1450.6100      0.0000      8.3200
+    635.5716   1494.2000     35.0600      8.3100
+    635.7045   1494.1900     35.0600      8.3100
+    635.8374   1494.2300     35.0900      8.3100
+    635.9703   1494.2600     35.1200      8.3100
+    636.1032   1494.2600     35.1200      8.3100
+    636.2361   1494.2600     35.1200      8.3100
+    636.3690   1494.2600     35.1200      8.3100
+    636.5018   1494.2600     35.1200      8.3100
+    636.6348   1494.2600     35.1200      8.3100
+    636.7676   1494.2600     35.1200      8.3100
+    636.9005   1494.2600     35.1200      8.3100
+    637.0334   1494.2300     35.0900      8.3100
+    637.1663   1494.1900     35.0600      8.3100
+    637.2992   1494.2000     35.0600      8.3100
+    637.4321   1494.2000     35.0600      8.3100
+    637.5649   1494.2000     35.0600      8.3100
+    637.6978   1494.2000     35.0600      8.3100
+    637.8307   1494.2000     35.0600      8.3000
+    637.9636   1494.2000     35.0600      8.3000
+    638.0964   1494.2000     35.0700      8.3000
+    638.2294   1494.2000     35.0700      8.3000
+    638.3622   1494.2000     35.0700      8.3000
+    638.4951   1494.2000     35.0700      8.3000
+    638.6279   1494.2000     35.0700      8.3000
+    638.7609   1494.2100     35.0700      8.3000
+    638.8937   1494.2100     35.0700      8.3000
+    639.0266   1494.2100     35.0700      8.3000
+    639.1595   1494.2100     35.0700      8.3000
+    639.2923   1494.2100     35.0700      8.3000
+    639.4252   1494.2200     35.0700      8.3000
+    639.5580   1494.2200     35.0700      8.3000
+    639.6909   1494.2200     35.0700      8.3000
+    639.8238   1494.2200     35.0700      8.3000
+    639.9567   1494.2200     35.0700      8.3000
+    640.0895   1494.2200     35.0700      8.3000
+    640.2224   1494.2200     35.0700      8.3000
+    640.3552   1494.2300     35.0700      8.3000
+    640.4881   1494.2300     35.0700      8.3000
+    640.6210   1494.2300     35.0700      8.3000
+    640.7538   1494.2300     35.0700      8.3000
+    640.8867   1494.2300     35.0700      8.3000
+    641.0195   1494.2300     35.0700      8.3000
+    641.1523   1494.2400     35.0700      8.3000
+    641.2853   1494.2300     35.0700      8.3000
+    641.4181   1494.2400     35.0700      8.3000
+    641.5510   1494.2400     35.0700      8.3000
+    641.6838   1494.2400     35.0700      8.3000
+    641.8167   1494.2400     35.0700      8.3000
+    641.9495   1494.2500     35.0700      8.3000
+    642.0824   1494.2500     35.0700      8.3000
+    642.2152   1494.2500     35.0700      8.3000
+    642.3480   1459.7700     35.1000      0.0000
+    643.5436   1450.6600      0.0000      8.3000
+    643.6765   1450.6600      0.0000      8.3000
+    643.8093   1450.6700      0.0000      8.3000
+    643.9421   1494.2800     35.0700      8.3000
+    644.0750   1494.2800     35.0700      8.3000
+    644.2078   1494.2800     35.0700      8.3000
+    644.3406   1494.2800     35.0700      8.3000
+    644.4734   1494.2900     35.0700      8.3000
+    644.6063   1494.2900     35.0700      8.3000
+    644.7391   1494.2900     35.0700      8.3000
+    644.8719   1494.2900     35.0700      8.3000
+    645.0048   1494.3000     35.0700      8.3000
+    645.1376   1494.3000     35.0700      8.3000
+    645.2704   1494.3000     35.0700      8.3000
+    645.4033   1494.3000     35.0700      8.3000
+    645.5361   1494.3000     35.0700      8.3000
+    645.6689   1494.3100     35.0700      8.3000
+    645.8017   1494.3100     35.0700      8.3000
+    645.9345   1494.3100     35.0700      8.3000
+    646.0674   1494.3000     35.0700      8.2900
+    646.2001   1494.3000     35.0700      8.2900
+    646.3330   1494.3000     35.0700      8.2900
+    646.4658   1494.3000     35.0700      8.2900
+    646.5986   1494.3000     35.0700      8.2900
+    646.7314   1494.3000     35.0700      8.2900
+    646.8642   1494.3000     35.0700      8.2900
+    646.9971   1494.2900     35.0700      8.2900
+    647.1299   1494.3000     35.0700      8.2900
+    647.2627   1494.3000     35.0700      8.2900
+    647.3955   1494.3000     35.0700      8.2900
+    647.5283   1494.2900     35.0700      8.2900
+    647.6611   1494.2900     35.0600      8.2900
+    647.7939   1494.2900     35.0600      8.2800
+    647.9267   1494.2800     35.0600      8.2800
+    648.0595   1494.2800     35.0600      8.2800
+    648.1923   1494.2800     35.0700      8.2800
+    648.3251   1494.2800     35.0700      8.2800
+    648.4579   1494.2800     35.0700      8.2800
+    648.5907   1494.2700     35.0700      8.2800
+    648.7236   1494.2700     35.0700      8.2700
+    648.8563   1494.2700     35.0700      8.2700
+    648.9891   1494.2700     35.0700      8.2700
+    649.1219   1494.2700     35.0700      8.2700
+    649.2547   1494.2600     35.0700      8.2700
+    649.3875   1494.2600     35.0700      8.2700
+    649.5203   1494.2500     35.0700      8.2700
+    649.6531   1494.2500     35.0600      8.2700
+    649.7859   1494.2500     35.0600      8.2700
+    649.9187   1494.2500     35.0700      8.2600
+    650.0515   1494.2500     35.0700      8.2600
+    650.1842   1494.2500     35.0700      8.2600
+    650.3170   1494.2500     35.0700      8.2600
+    650.4498   1494.2400     35.0700      8.2600
+    650.5826   1494.2400     35.0700      8.2600
+    650.7154   1494.2400     35.0700      8.2600
+    650.8482   1494.2400     35.0700      8.2600
+    650.9810   1494.2400     35.0700      8.2600
+    651.1137   1494.2400     35.0700      8.2500
+    651.2465   1494.2300     35.0700      8.2500
+    651.3793   1494.2300     35.0700      8.2500
+    651.5121   1494.2200     35.0700      8.2500
+    651.6448   1494.2200     35.0700      8.2500
+    651.7776   1494.2200     35.0700      8.2500
+    651.9104   1494.2100     35.0700      8.2400
+    652.0432   1494.2100     35.0700      8.2400
+    652.1760   1494.2000     35.0700      8.2400
+    652.3087   1494.1900     35.0700      8.2400
+    652.4415   1494.1700     35.0700      8.2300
+    652.5742   1494.1500     35.0700      8.2200
+    652.7070   1494.1300     35.0700      8.2200
+    652.8398   1494.1100     35.0700      8.2100
+    652.9726   1494.0800     35.0700      8.2100
+    653.1053   1494.0600     35.0700      8.2000
+    653.2381   1494.0300     35.0700      8.1900
+    653.3708   1494.0100     35.0700      8.1800
+    653.5036   1459.9100     35.0700      0.0000
+    657.0878   1449.7500      0.0000      8.0300
+    657.2206   1449.7400      0.0000      8.0200
+    657.3533   1449.7300      0.0000      8.0200
+    657.4861   1493.4300     35.0600      8.0200
+    657.6188   1493.4100     35.0500      8.0100
+    657.7515   1493.3900     35.0500      8.0100
+    657.8843   1493.3800     35.0500      8.0000
+    658.0170   1493.3600     35.0500      8.0000
+    658.1497   1493.3400     35.0500      7.9900
+    658.2824   1493.3300     35.0500      7.9900
+    658.4152   1493.3100     35.0500      7.9800
+    658.5479   1493.3000     35.0500      7.9800
+    658.6807   1493.2800     35.0500      7.9700
+    658.8134   1493.2700     35.0500      7.9700
+    658.9460   1493.2600     35.0500      7.9700
+    659.0788   1459.9800     35.0500      0.0000
+    661.4677   1448.8900      0.0000      7.8100
+    661.6003   1448.8500      0.0000      7.8000
+    661.7330   1448.8300      0.0000      7.7900
+    661.8657   1492.5900     35.0300      7.7800
+    661.9984   1492.5700     35.0300      7.7800
+    662.1311   1492.5500     35.0300      7.7700
+    662.2638   1492.5300     35.0300      7.7700
+    662.3965   1492.5200     35.0300      7.7600
+    662.5292   1492.5100     35.0300      7.7600
+    662.6619   1492.5000     35.0300      7.7600
+    662.7946   1492.4900     35.0400      7.7500
+    662.9273   1492.4700     35.0300      7.7500
+    663.0600   1492.4600     35.0300      7.7400
+    663.1927   1492.4400     35.0400      7.7400
+    663.3254   1492.4300     35.0300      7.7300
+    663.4580   1492.4100     35.0300      7.7300
+    663.5908   1492.3900     35.0300      7.7200
+    663.7234   1492.3700     35.0300      7.7200
+    663.8561   1492.3500     35.0300      7.7100
+    663.9888   1492.3400     35.0300      7.7100
+    664.1215   1492.3200     35.0300      7.7000
+    664.2542   1492.3100     35.0400      7.7000
+    664.3868   1492.2900     35.0400      7.6900
+    664.5195   1492.2800     35.0400      7.6900
+    664.6522   1492.2700     35.0400      7.6900
+    664.7849   1492.2600     35.0400      7.6800
+    664.9175   1492.2500     35.0400      7.6800
+    665.0502   1460.0600     35.0400      0.0000
+    666.2443   1448.3500      0.0000      7.6600
+    666.3770   1448.3300      0.0000      7.6600
+    666.5096   1448.3200      0.0000      7.6500
+    666.6423   1492.1600     35.0500      7.6400
+    666.7750   1492.1300     35.0500      7.6400
+    666.9077   1492.1000     35.0500      7.6300
+    667.0403   1492.0700     35.0500      7.6200
+    667.1730   1492.0300     35.0500      7.6100
+    667.3056   1491.9900     35.0500      7.6000
+    667.4383   1491.9600     35.0500      7.5900
+    667.5709   1491.9300     35.0500      7.5800
+    667.7036   1491.9000     35.0500      7.5700
+    667.8362   1491.8700     35.0500      7.5600
+    667.9689   1491.8400     35.0500      7.5600
+    668.1016   1491.8200     35.0500      7.5500
+    668.2342   1491.8000     35.0500      7.5400
+    668.3669   1491.7800     35.0500      7.5400
+    668.4995   1491.7700     35.0500      7.5300
+    668.6322   1491.7600     35.0500      7.5300
+    668.7648   1491.7400     35.0500      7.5300
+    668.8974   1491.7300     35.0500      7.5200
+    669.0301   1491.7200     35.0500      7.5200
+    669.1627   1491.7100     35.0500      7.5100
+    669.2954   1491.7000     35.0500      7.5100
+    669.4280   1491.6800     35.0500      7.5000
+    669.5607   1491.6600     35.0500      7.5000
+    669.6933   1491.6400     35.0500      7.5000
+    669.8260   1491.6300     35.0500      7.4900
+    669.9586   1491.6100     35.0500      7.4900
+    670.0912   1491.5900     35.0500      7.4800
+    670.2239   1491.5800     35.0500      7.4800
+    670.3565   1491.5600     35.0500      7.4700
+    670.4891   1491.5500     35.0500      7.4700
+    670.6218   1491.5400     35.0500      7.4600
+    670.7545   1491.5300     35.0500      7.4600
+    670.8870   1491.5300     35.0500      7.4600
+    671.0197   1491.5100     35.0500      7.4600
+    671.1523   1491.5100     35.0500      7.4500
+    671.2849   1491.5100     35.0500      7.4500
+    671.4176   1491.5000     35.0500      7.4500
+    671.5502   1491.5000     35.0500      7.4500
+    671.6829   1491.5000     35.0500      7.4500
+    671.8154   1460.1900     35.0500      0.0000
+    673.0090   1447.4700      0.0000      7.4300
+    673.1417   1447.4600      0.0000      7.4200
+    673.2743   1447.4400      0.0000      7.4200
+    673.4069   1491.3900     35.0500      7.4100
+    673.5396   1491.3800     35.0500      7.4100
+    673.6721   1491.3600     35.0500      7.4000
+    673.8047   1491.3400     35.0500      7.4000
+    673.9373   1491.3200     35.0500      7.3900
+    674.0700   1491.3000     35.0500      7.3900
+    674.2026   1491.2800     35.0500      7.3800
+    674.3351   1491.2600     35.0600      7.3700
+    674.4678   1491.2400     35.0600      7.3700
+    674.6003   1491.2200     35.0500      7.3600
+    674.7330   1491.2000     35.0500      7.3600
+    674.8656   1491.1800     35.0500      7.3500
+    674.9982   1491.1600     35.0500      7.3500
+    675.1308   1491.1400     35.0500      7.3400
+    675.2634   1491.1200     35.0500      7.3300
+    675.3960   1460.2500     35.0500      0.0000
+    679.3735   1446.6500      0.0000      7.2100
+    679.5061   1446.6200      0.0000      7.2000
+    679.6387   1446.5900      0.0000      7.1900
+    679.7712   1460.3200     35.0500      0.0000
+    680.9643   1446.3900      0.0000      7.1400
+    681.0969   1446.3800      0.0000      7.1400
+    681.2294   1446.3800      0.0000      7.1400
+    681.3620   1490.4600     35.0400      7.1400
+    681.4945   1490.4600     35.0400      7.1400
+    681.6271   1490.4500     35.0400      7.1400
+    681.7596   1490.4500     35.0400      7.1400
+    681.8922   1490.4500     35.0400      7.1300
+    682.0247   1490.4500     35.0400      7.1300
+    682.1572   1490.4400     35.0400      7.1300
+    682.2898   1490.4400     35.0400      7.1300
+    682.4224   1490.4300     35.0400      7.1300
+    682.5549   1490.4300     35.0400      7.1300
+    682.6874   1490.4200     35.0400      7.1200
+    682.8200   1490.4200     35.0400      7.1200
+    682.9525   1490.4100     35.0400      7.1200
+    683.0851   1490.4100     35.0400      7.1200
+    683.2177   1490.4100     35.0400      7.1200
+    683.3502   1490.4000     35.0400      7.1200
+    683.4827   1490.4000     35.0400      7.1200
+    683.6152   1490.4000     35.0400      7.1200
+    683.7478   1490.4000     35.0400      7.1100
+    683.8803   1490.4000     35.0400      7.1100
+    684.0129   1490.4000     35.0500      7.1100
+    684.1454   1490.4000     35.0500      7.1100
+    684.2779   1490.4000     35.0500      7.1100
+    684.4105   1490.3900     35.0400      7.1100
+    684.5430   1490.3800     35.0400      7.1100
+    684.6755   1490.3700     35.0400      7.1000
+    684.8080   1490.3700     35.0500      7.1000
+    684.9406   1490.3600     35.0400      7.1000
+    685.0731   1490.3400     35.0400      7.0900
+    685.2056   1490.3300     35.0400      7.0900
+    685.3381   1490.3200     35.0400      7.0900
+    685.4706   1490.3100     35.0400      7.0800
+    685.6032   1490.3100     35.0500      7.0800
+    685.7357   1490.3000     35.0500      7.0800
+    685.8682   1490.3000     35.0500      7.0800
+    686.0007   1490.3000     35.0500      7.0800
+    686.1333   1490.3000     35.0500      7.0800
+    686.2658   1490.3100     35.0500      7.0800
+    686.3983   1490.3100     35.0500      7.0800
+    686.5308   1490.3100     35.0500      7.0800
+    686.6633   1490.3100     35.0500      7.0800
+    686.7959   1490.3100     35.0500      7.0800
+    686.9283   1490.3000     35.0400      7.0700
+    687.0609   1490.3000     35.0400      7.0700
+    687.1934   1490.2900     35.0400      7.0700
+    687.3259   1460.4400     35.0400      0.0000
+    688.5185   1446.0400      0.0000      7.0400
+    688.6509   1446.0300      0.0000      7.0300
+    688.7834   1446.0200      0.0000      7.0300
+    688.9160   1460.4700     35.0500      0.0000
+    690.1084   1445.9500      0.0000      7.0100
+    690.2408   1445.9500      0.0000      7.0100
+    690.3734   1445.9500      0.0000      7.0100
+    690.5059   1490.0900     35.0500      7.0000
+    690.6384   1490.0900     35.0400      7.0000
+    690.7708   1490.0900     35.0400      7.0000
+    690.9033   1490.0800     35.0400      7.0000
+    691.0358   1490.0800     35.0400      7.0000
+    691.1683   1490.0800     35.0400      7.0000
+    691.3008   1490.0800     35.0400      7.0000
+    691.4332   1490.0800     35.0400      7.0000
+    691.5657   1490.0900     35.0400      7.0000
+    691.6982   1490.0900     35.0400      7.0000
+    691.8307   1490.0900     35.0400      7.0000
+    691.9631   1490.0800     35.0400      7.0000
+    692.0956   1490.0800     35.0400      7.0000
+    692.2281   1490.0800     35.0400      6.9900
+    692.3605   1490.0700     35.0400      6.9900
+    692.4930   1490.0600     35.0400      6.9900
+    692.6255   1490.0500     35.0400      6.9800
+    692.7580   1490.0400     35.0400      6.9800
+    692.8904   1490.0200     35.0400      6.9800
+    693.0229   1490.0100     35.0400      6.9700
+    693.1554   1490.0000     35.0400      6.9700
+    693.2878   1489.9900     35.0400      6.9700
+    693.4203   1489.9800     35.0400      6.9700
+    693.5528   1489.9700     35.0400      6.9600
+    693.6852   1489.9700     35.0400      6.9600
+    693.8177   1489.9600     35.0400      6.9600
+    693.9502   1489.9500     35.0400      6.9600
+    694.0826   1489.9400     35.0400      6.9500
+    694.2151   1489.9700     35.0400      6.9600
+    694.3475   1489.9900     35.0400      6.9600
+    694.4800   1490.0000     35.0300      6.9700
+    694.6125   1490.0100     35.0200      6.9700
+    694.7449   1489.9900     35.0100      6.9700
+    694.8774   1460.5100     35.0100      0.0000
+    696.0694   1445.5300      0.0000      6.8900
+    696.2018   1445.5000      0.0000      6.8800
+    696.3343   1445.4800      0.0000      6.8700
+    696.4667   1489.6600     35.0400      6.8700
+    696.5992   1489.6300     35.0400      6.8600
+    696.7316   1489.6000     35.0400      6.8500
+    696.8640   1489.5800     35.0400      6.8500
+    696.9965   1489.5500     35.0400      6.8400
+    697.1289   1489.5300     35.0400      6.8300
+    697.2614   1489.5000     35.0400      6.8300
+    697.3938   1489.4800     35.0400      6.8200
+    697.5262   1489.4600     35.0400      6.8100
+    697.6587   1489.4500     35.0400      6.8100
+    697.7911   1489.4400     35.0400      6.8100
+    697.9235   1489.4300     35.0400      6.8100
+    698.0560   1489.4200     35.0300      6.8000
+    698.1884   1489.4200     35.0400      6.8000
+    698.3208   1489.4200     35.0400      6.8000
+    698.4532   1489.4100     35.0300      6.8000
+    698.5857   1489.4100     35.0400      6.8000
+    698.7181   1489.4100     35.0400      6.8000
+    698.8505   1489.4100     35.0400      6.7900
+    698.9829   1489.4000     35.0400      6.7900
+    699.1154   1489.4000     35.0400      6.7900
+    699.2478   1489.3900     35.0400      6.7900
+    699.3802   1489.3900     35.0400      6.7900
+    699.5126   1489.3800     35.0400      6.7900
+    699.6451   1489.3800     35.0400      6.7800
+    699.7775   1489.3700     35.0400      6.7800
+    699.9099   1489.3700     35.0400      6.7800
+    700.0423   1489.3600     35.0400      6.7800
+    700.1747   1489.3600     35.0400      6.7800
+    700.3071   1489.3500     35.0400      6.7700
+    700.4395   1489.3500     35.0400      6.7700
+    700.5720   1489.3400     35.0400      6.7700
+    700.7043   1489.3300     35.0400      6.7700
+    700.8367   1489.3200     35.0400      6.7600
+    700.9692   1489.3100     35.0400      6.7600
+    701.1016   1489.3000     35.0400      6.7600
+    701.2340   1489.2900     35.0400      6.7500
+    701.3664   1489.2700     35.0400      6.7500
+    701.4988   1489.2600     35.0400      6.7400
+    701.6312   1489.2400     35.0400      6.7400
+    701.7636   1489.2300     35.0400      6.7400
+    701.8960   1489.2200     35.0400      6.7300
+    702.0284   1460.6700     35.0400      0.0000
+    703.2199   1444.8700      0.0000      6.7100
+    703.3524   1444.8700      0.0000      6.7100
+    703.4847   1444.8700      0.0000      6.7100
+    703.6171   1489.1500     35.0400      6.7100
+    703.7495   1489.1500     35.0400      6.7100
+    703.8819   1489.1400     35.0400      6.7000
+    704.0143   1460.7100     35.0400      0.0000
+    705.2057   1444.8300      0.0000      6.6900
+    705.3381   1444.8200      0.0000      6.6900
+    705.4705   1444.8200      0.0000      6.6900
+    705.6028   1489.1000     35.0400      6.6900
+    705.7352   1489.1000     35.0500      6.6900
+    705.8676   1489.1000     35.0400      6.6800
+    705.9999   1460.7500     35.0400      0.0000
+    707.1913   1444.7500      0.0000      6.6700
+    707.3236   1444.7400      0.0000      6.6700
+    707.4559   1444.7400      0.0000      6.6600
+    707.5883   1460.7700     35.0400      0.0000
+    708.7795   1444.6500      0.0000      6.6400
+    708.9118   1444.6500      0.0000      6.6400
+    709.0442   1444.6500      0.0000      6.6400
+    709.1765   1488.9500     35.0400      6.6300
+    709.3089   1488.9500     35.0400      6.6300
+    709.4412   1488.9400     35.0400      6.6300
+    709.5736   1488.9300     35.0400      6.6300
+    709.7059   1488.9300     35.0400      6.6200
+    709.8383   1488.9100     35.0400      6.6200
+    709.9706   1460.8000     35.0400      0.0000
+    711.1616   1444.4400      0.0000      6.5800
+    711.2939   1444.4300      0.0000      6.5800
+    711.4263   1444.4300      0.0000      6.5800
+    711.5586   1488.7400     35.0300      6.5700
+    711.6910   1488.7400     35.0300      6.5700
+    711.8232   1488.7300     35.0300      6.5700
+    711.9556   1488.7300     35.0300      6.5700
+    712.0880   1488.7300     35.0300      6.5700
+    712.2202   1488.7200     35.0300      6.5700
+    712.3526   1488.7200     35.0300      6.5600
+    712.4849   1488.7100     35.0300      6.5600
+    712.6172   1488.7100     35.0300      6.5600
+    712.7495   1488.7100     35.0300      6.5600
+    712.8819   1488.7000     35.0300      6.5600
+    713.0142   1488.6900     35.0300      6.5500
+    713.1465   1488.6800     35.0300      6.5500
+    713.2788   1488.6700     35.0300      6.5500
+    713.4111   1488.6700     35.0300      6.5500
+    713.5435   1488.6600     35.0300      6.5400
+    713.6757   1488.6500     35.0300      6.5400
+    713.8080   1488.6400     35.0300      6.5400
+    713.9404   1488.6300     35.0300      6.5400
+    714.0726   1488.6300     35.0300      6.5300
+    714.2050   1488.6200     35.0300      6.5300
+    714.3373   1488.6200     35.0300      6.5300
+    714.4696   1488.6100     35.0300      6.5300
+    714.6019   1488.6100     35.0300      6.5300
+    714.7343   1488.6000     35.0300      6.5200
+    714.8665   1488.5900     35.0300      6.5200
+    714.9988   1488.5900     35.0300      6.5200
+    715.1311   1488.5900     35.0300      6.5200
+    715.2634   1488.5900     35.0300      6.5200
+    715.3958   1488.5900     35.0300      6.5200
+    715.5280   1488.5900     35.0300      6.5200
+    715.6603   1488.5900     35.0300      6.5200
+    715.7926   1488.5900     35.0300      6.5200
+    715.9249   1488.5900     35.0300      6.5200
+    716.0572   1488.6000     35.0300      6.5200
+    716.1895   1488.6000     35.0300      6.5200
+    716.3218   1488.6000     35.0300      6.5200
+    716.4540   1488.6000     35.0300      6.5200
+    716.5864   1488.5900     35.0300      6.5100
+    716.7186   1488.5900     35.0300      6.5100
+    716.8510   1488.5900     35.0300      6.5100
+    716.9832   1488.5900     35.0300      6.5100
+    717.1155   1488.5800     35.0300      6.5100
+    717.2478   1488.5800     35.0300      6.5100
+    717.3801   1488.5700     35.0300      6.5000
+    717.5124   1488.5600     35.0300      6.5000
+    717.6447   1488.5600     35.0300      6.5000
+    717.7770   1488.5600     35.0300      6.5000
+    717.9092   1460.9200     35.0300      0.0000
+    719.0997   1444.1600      0.0000      6.4900
+    719.2320   1444.1500      0.0000      6.4900
+    719.3643   1444.1500      0.0000      6.4800
+    719.4966   1488.5200     35.0300      6.4800
+    719.6288   1488.5100     35.0300      6.4800
+    719.7610   1488.5100     35.0300      6.4800
+    719.8934   1488.5100     35.0300      6.4800
+    720.0256   1488.5100     35.0300      6.4800
+    720.1579   1488.5000     35.0300      6.4800
+    720.2901   1488.5000     35.0300      6.4700
+    720.4224   1488.4900     35.0300      6.4700
+    720.5546   1488.4900     35.0300      6.4700
+    720.6869   1488.4800     35.0300      6.4700
+    720.8192   1488.4800     35.0300      6.4700
+    720.9514   1488.4700     35.0300      6.4700
+    721.0837   1460.9700     35.0200      0.0000
+    722.2740   1444.0200      0.0000      6.4400
+    722.4062   1444.0200      0.0000      6.4400
+    722.5385   1444.0100      0.0000      6.4400
+    722.6707   1488.3900     35.0200      6.4400
+    722.8030   1488.3900     35.0200      6.4400
+    722.9352   1488.3800     35.0200      6.4400
+    723.0674   1488.3800     35.0200      6.4300
+    723.1997   1488.3800     35.0200      6.4300
+    723.3319   1488.3800     35.0200      6.4300
+    723.4642   1488.3700     35.0200      6.4300
+    723.5964   1488.3700     35.0200      6.4300
+    723.7286   1488.3800     35.0300      6.4300
+    723.8608   1488.3800     35.0300      6.4300
+    723.9931   1488.3700     35.0300      6.4300
+    724.1254   1488.3700     35.0300      6.4300
+    724.2576   1488.3700     35.0300      6.4300
+    724.3898   1488.3700     35.0300      6.4300
+    724.5220   1488.3600     35.0300      6.4200
+    724.6543   1488.3600     35.0200      6.4200
+    724.7865   1488.3600     35.0200      6.4200
+    724.9188   1488.3500     35.0200      6.4200
+    725.0510   1488.3400     35.0200      6.4200
+    725.1832   1488.3400     35.0200      6.4200
+    725.3154   1488.3400     35.0200      6.4200
+    725.4476   1488.3300     35.0200      6.4100
+    725.5798   1488.3300     35.0200      6.4100
+    725.7120   1488.3200     35.0200      6.4100
+    725.8443   1461.0500     35.0200      0.0000
+    727.0342   1443.8200      0.0000      6.3800
+    727.1664   1443.8100      0.0000      6.3800
+    727.2986   1443.8100      0.0000      6.3800
+    727.4309   1488.2200     35.0200      6.3800
+    727.5630   1488.2100     35.0200      6.3700
+    727.6953   1488.2100     35.0200      6.3700
+    727.8275   1488.2100     35.0200      6.3700
+    727.9597   1488.2000     35.0200      6.3700
+    728.0919   1488.2000     35.0200      6.3700
+    728.2241   1488.2100     35.0200      6.3700
+    728.3563   1488.2000     35.0200      6.3700
+    728.4885   1488.2100     35.0200      6.3700
+    728.6207   1461.0800     35.0200      0.0000
+    730.6036   1443.7800      0.0000      6.3600
+    730.7358   1443.7800      0.0000      6.3600
+    730.8680   1443.7800      0.0000      6.3600
+    731.0002   1488.2000     35.0200      6.3500
+    731.1323   1488.1900     35.0200      6.3500
+    731.2645   1488.1900     35.0200      6.3500
+    731.3967   1488.1900     35.0200      6.3500
+    731.5289   1488.1900     35.0200      6.3500
+    731.6611   1488.1900     35.0200      6.3500
+    731.7932   1488.1800     35.0200      6.3500
+    731.9254   1488.1800     35.0200      6.3500
+    732.0576   1488.1800     35.0200      6.3500
+    732.1898   1488.1800     35.0200      6.3500
+    732.3220   1488.1800     35.0200      6.3400
+    732.4542   1488.1700     35.0200      6.3400
+    732.5863   1488.1600     35.0200      6.3400
+    732.7185   1488.1600     35.0200      6.3400
+    732.8506   1488.1600     35.0200      6.3400
+    732.9828   1488.1500     35.0200      6.3300
+    733.1150   1488.1400     35.0200      6.3300
+    733.2471   1488.1400     35.0200      6.3300
+    733.3793   1488.1300     35.0200      6.3300
+    733.5115   1488.1300     35.0200      6.3300
+    733.6436   1488.1200     35.0200      6.3200
+    733.7758   1461.1700     35.0200      0.0000
+    734.9652   1443.6200      0.0000      6.3100
+    735.0974   1443.6200      0.0000      6.3000
+    735.2295   1443.6100      0.0000      6.3000
+    735.3616   1488.0500     35.0200      6.3000
+    735.4938   1488.0500     35.0200      6.3000
+    735.6259   1488.0400     35.0200      6.3000
+    735.7581   1488.0400     35.0200      6.3000
+    735.8903   1488.0400     35.0200      6.3000
+    736.0224   1488.0400     35.0200      6.2900
+    736.1545   1488.0400     35.0200      6.2900
+    736.2867   1488.0400     35.0200      6.2900
+    736.4188   1488.0400     35.0200      6.2900
+    736.5510   1461.2200     35.0200      0.0000
+    737.7402   1443.5800      0.0000      6.2900
+    737.8723   1443.5800      0.0000      6.2800
+    738.0045   1443.5800      0.0000      6.2800
+    738.1366   1488.0300     35.0200      6.2800
+    738.2687   1488.0300     35.0200      6.2800
+    738.4008   1488.0300     35.0200      6.2800
+    738.5330   1488.0300     35.0200      6.2800
+    738.6651   1488.0300     35.0200      6.2800
+    738.7972   1488.0400     35.0200      6.2800
+    738.9293   1488.0300     35.0200      6.2800
+    739.0615   1488.0300     35.0200      6.2800
+    739.1936   1488.0300     35.0200      6.2800
+    739.3257   1488.0300     35.0200      6.2800
+    739.4578   1488.0300     35.0200      6.2800
+    739.5899   1488.0200     35.0200      6.2800
+    739.7220   1488.0100     35.0200      6.2700
+    739.8542   1488.0000     35.0200      6.2700
+    739.9863   1487.9900     35.0200      6.2700
+    740.1184   1487.9800     35.0200      6.2600
+    740.2505   1487.9700     35.0200      6.2600
+    740.3826   1487.9600     35.0200      6.2600
+    740.5147   1487.9400     35.0200      6.2500
+    740.6469   1461.2800     35.0200      0.0000
+    742.8926   1443.3600      0.0000      6.2200
+    743.0247   1443.3600      0.0000      6.2200
+    743.1567   1443.3600      0.0000      6.2200
+    743.2889   1487.8500     35.0200      6.2200
+    743.4210   1487.8500     35.0200      6.2200
+    743.5530   1487.8500     35.0200      6.2200
+    743.6851   1487.8500     35.0200      6.2200
+    743.8172   1487.8500     35.0100      6.2200
+    743.9493   1487.8500     35.0100      6.2200
+    744.0814   1487.8500     35.0100      6.2200
+    744.2135   1487.8500     35.0100      6.2100
+    744.3455   1487.8500     35.0100      6.2100
+    744.4777   1487.8500     35.0100      6.2100
+    744.6097   1487.8500     35.0200      6.2100
+    744.7418   1487.8500     35.0200      6.2100
+    744.8738   1487.8500     35.0200      6.2100
+    745.0059   1487.8400     35.0100      6.2100
+    745.1380   1487.8400     35.0100      6.2100
+    745.2701   1487.8400     35.0100      6.2100
+    745.4022   1487.8400     35.0100      6.2100
+    745.5342   1487.8400     35.0100      6.2100
+    745.6663   1487.8400     35.0100      6.2100
+    745.7984   1487.8400     35.0100      6.2100
+    745.9305   1487.8300     35.0100      6.2000
+    746.0626   1487.8300     35.0100      6.2000
+    746.1946   1487.8300     35.0100      6.2000
+    746.3267   1487.8300     35.0100      6.2000
+    746.4587   1487.8300     35.0100      6.2000
+    746.5908   1487.8300     35.0100      6.2000
+    746.7228   1487.8200     35.0100      6.2000
+    746.8550   1487.8200     35.0100      6.2000
+    746.9870   1487.8200     35.0100      6.2000
+    747.1190   1487.8200     35.0100      6.2000
+    747.2511   1487.8200     35.0200      6.1900
+    747.3832   1487.8200     35.0100      6.1900
+    747.5153   1487.8200     35.0200      6.1900
+    747.6473   1487.8200     35.0200      6.1900
+    747.7794   1487.8100     35.0200      6.1900
+    747.9114   1487.8000     35.0200      6.1900
+    748.0435   1487.8000     35.0200      6.1800
+    748.1755   1487.7900     35.0200      6.1800
+    748.3076   1487.7800     35.0200      6.1800
+    748.4396   1487.7800     35.0200      6.1800
+    748.5717   1487.7700     35.0200      6.1800
+    748.7037   1487.7600     35.0200      6.1700
+    748.8358   1487.7500     35.0100      6.1700
+    748.9678   1487.7500     35.0100      6.1700
+    749.0999   1487.7400     35.0200      6.1700
+    749.2319   1487.7300     35.0200      6.1600
+    749.3640   1487.7300     35.0200      6.1600
+    749.4960   1487.7300     35.0200      6.1600
+    749.6281   1487.7200     35.0200      6.1600
+    749.7601   1487.7200     35.0100      6.1600
+    749.8922   1487.7100     35.0200      6.1600
+    750.0242   1487.7100     35.0200      6.1500
+    750.1562   1487.7100     35.0200      6.1500
+    750.2883   1487.7000     35.0200      6.1500
+    750.4203   1487.7000     35.0100      6.1500
+    750.5523   1487.6900     35.0100      6.1500
+    750.6843   1487.6800     35.0100      6.1500
+    750.8164   1487.6800     35.0100      6.1400
+    750.9484   1487.6700     35.0100      6.1400
+    751.0805   1487.6600     35.0100      6.1400
+    751.2125   1487.6600     35.0100      6.1400
+    751.3445   1487.6500     35.0100      6.1300
+    751.4766   1487.6500     35.0100      6.1300
+    751.6086   1487.6400     35.0100      6.1300
+    751.7406   1487.6400     35.0100      6.1300
+    751.8726   1487.6300     35.0100      6.1300
+    752.0047   1461.4600     35.0100      0.0000
+    753.1929   1443.0900      0.0000      6.1200
+    753.3248   1443.0900      0.0000      6.1200
+    753.4569   1443.1000      0.0000      6.1200
+    753.5889   1487.6200     35.0100      6.1200
+    753.7209   1487.6100     35.0100      6.1200
+    753.8529   1487.6200     35.0100      6.1200
+    753.9849   1487.6100     35.0100      6.1200
+    754.1169   1487.6100     35.0100      6.1200
+    754.2489   1487.6100     35.0100      6.1100
+    754.3810   1487.6100     35.0100      6.1100
+    754.5129   1487.6100     35.0100      6.1100
+    754.6450   1487.6100     35.0100      6.1100
+    754.7770   1487.6100     35.0100      6.1100
+    754.9089   1487.6100     35.0100      6.1100
+    755.0410   1487.6100     35.0100      6.1100
+    755.1730   1487.6100     35.0100      6.1100
+    755.3050   1487.6200     35.0100      6.1100
+    755.4370   1487.6200     35.0100      6.1100
+    755.5690   1487.6200     35.0100      6.1100
+    755.7010   1487.6200     35.0100      6.1100
+    755.8330   1487.6200     35.0100      6.1100
+    755.9650   1487.6300     35.0100      6.1100
+    756.0969   1487.6200     35.0100      6.1100
+    756.2289   1487.6200     35.0200      6.1100
+    756.3609   1487.6200     35.0100      6.1100
+    756.4929   1487.6200     35.0200      6.1000
+    756.6249   1487.6200     35.0100      6.1000
+    756.7570   1461.5400     35.0100      0.0000
+    757.9448   1443.0200      0.0000      6.0900
+    758.0767   1443.0100      0.0000      6.0800
+    758.2087   1443.0000      0.0000      6.0800
+    758.3407   1487.5300     35.0100      6.0800
+    758.4727   1487.5200     35.0100      6.0700
+    758.6047   1487.5100     35.0100      6.0700
+    758.7366   1487.5000     35.0100      6.0700
+    758.8687   1487.4900     35.0100      6.0600
+    759.0005   1487.4900     35.0100      6.0600
+    759.1326   1487.4900     35.0100      6.0600
+    759.2645   1487.4800     35.0100      6.0600
+    759.3965   1487.4800     35.0100      6.0600
+    759.5284   1487.4800     35.0100      6.0600
+    759.6604   1487.4700     35.0100      6.0600
+    759.7924   1487.4700     35.0100      6.0500
+    759.9244   1487.4700     35.0100      6.0500
+    760.0563   1487.4600     35.0100      6.0500
+    760.1883   1487.4600     35.0100      6.0500
+    760.3203   1461.5900     35.0100      0.0000
+    761.5079   1442.8900      0.0000      6.0400
+    761.6398   1442.8900      0.0000      6.0400
+    761.7718   1442.8900      0.0000      6.0400
+    761.9037   1487.4500     35.0100      6.0400
+    762.0356   1487.4500     35.0100      6.0400
+    762.1677   1487.4600     35.0100      6.0400
+    762.2996   1487.4600     35.0100      6.0400
+    762.4315   1487.4600     35.0100      6.0400
+    762.5635   1487.4600     35.0100      6.0400
+    762.6954   1487.4600     35.0100      6.0400
+    762.8274   1487.4700     35.0100      6.0400
+    762.9593   1487.4700     35.0100      6.0400
+    763.0912   1487.4700     35.0100      6.0400
+    763.2232   1487.4700     35.0100      6.0400
+    763.3552   1487.4800     35.0100      6.0400
+    763.4871   1487.4800     35.0100      6.0400
+    763.6190   1487.4800     35.0100      6.0400
+    763.7509   1487.4700     35.0100      6.0400
+    763.8829   1487.4700     35.0100      6.0400
+    764.0148   1487.4600     35.0100      6.0400
+    764.1467   1487.4600     35.0100      6.0300
+    764.2787   1461.6600     35.0100      0.0000
+    765.4661   1442.8300      0.0000      6.0100
+    765.5980   1442.8200      0.0000      6.0100
+    765.7299   1442.8200      0.0000      6.0100
+    765.8618   1487.3900     35.0100      6.0100
+    765.9937   1487.4000     35.0100      6.0100
+    766.1257   1487.4000     35.0100      6.0100
+    766.2576   1487.4000     35.0100      6.0100
+    766.3895   1487.4000     35.0100      6.0100
+    766.5214   1487.4000     35.0100      6.0100
+    766.6533   1487.4100     35.0100      6.0100
+    766.7852   1487.4000     35.0100      6.0100
+    766.9171   1487.4000     35.0100      6.0100
+    767.0491   1487.4000     35.0100      6.0100
+    767.1809   1487.4000     35.0100      6.0100
+    767.3129   1487.4000     35.0100      6.0000
+    767.4448   1487.3900     35.0100      6.0000
+    767.5767   1487.3800     35.0100      6.0000
+    767.7086   1487.3800     35.0100      6.0000
+    767.8405   1487.3700     35.0100      6.0000
+    767.9724   1487.3700     35.0100      6.0000
+    768.1043   1487.3600     35.0100      5.9900
+    768.2362   1487.3600     35.0100      5.9900
+    768.3681   1487.3500     35.0100      5.9900
+    768.5000   1487.3500     35.0100      5.9900
+    768.6319   1487.3400     35.0100      5.9900
+    768.7639   1487.3400     35.0100      5.9900
+    768.8957   1487.3400     35.0100      5.9800
+    769.0276   1487.3400     35.0100      5.9800
+    769.1595   1487.3300     35.0100      5.9800
+    769.2914   1487.3300     35.0100      5.9800
+    769.4233   1461.7400     35.0100      0.0000
+    771.7972   1442.6600      0.0000      5.9500
+    771.9291   1442.6600      0.0000      5.9500
+    772.0610   1442.6600      0.0000      5.9500
+    772.1929   1487.2600     35.0100      5.9500
+    772.3248   1487.2600     35.0100      5.9500
+    772.4566   1487.2600     35.0100      5.9500
+    772.5884   1487.2500     35.0100      5.9500
+    772.7203   1487.2500     35.0100      5.9500
+    772.8522   1487.2400     35.0100      5.9400
+    772.9841   1487.2300     35.0100      5.9400
+    773.1159   1487.2300     35.0100      5.9400
+    773.2478   1487.2300     35.0100      5.9400
+    773.3796   1487.2300     35.0100      5.9400
+    773.5115   1487.2200     35.0100      5.9400
+    773.6434   1487.2200     35.0100      5.9400
+    773.7752   1487.2200     35.0100      5.9300
+    773.9071   1487.2100     35.0000      5.9300
+    774.0389   1487.2100     35.0000      5.9300
+    774.1708   1487.2000     35.0000      5.9300
+    774.3027   1487.2000     35.0000      5.9300
+    774.4346   1487.2000     35.0000      5.9300
+    774.5664   1487.2000     35.0000      5.9300
+    774.6982   1487.1900     35.0000      5.9300
+    774.8301   1487.1900     35.0000      5.9200
+    774.9620   1461.8300     35.0000      0.0000
+    776.1486   1442.5700      0.0000      5.9200
+    776.2805   1442.5600      0.0000      5.9100
+    776.4123   1442.5600      0.0000      5.9100
+    776.5441   1461.8700     35.0100      0.0000
+    777.7307   1442.4200      0.0000      5.8800
+    777.8625   1442.4100      0.0000      5.8700
+    777.9943   1442.3900      0.0000      5.8700
+    778.1262   1487.0200     35.0000      5.8700
+    778.2579   1487.0100     35.0000      5.8600
+    778.3898   1487.0000     35.0000      5.8600
+    778.5216   1486.9900     35.0000      5.8600
+    778.6534   1486.9900     35.0000      5.8600
+    778.7853   1486.9900     35.0000      5.8600
+    778.9171   1486.9900     35.0000      5.8600
+    779.0489   1486.9900     35.0000      5.8600
+    779.1807   1486.9900     35.0000      5.8600
+    779.3126   1486.9900     35.0000      5.8600
+    779.4443   1486.9900     35.0000      5.8500
+    779.5762   1486.9900     35.0000      5.8500
+    779.7080   1486.9900     35.0000      5.8500
+    779.8398   1486.9800     35.0000      5.8500
+    779.9716   1486.9800     35.0000      5.8500
+    780.1034   1486.9800     35.0000      5.8500
+    780.2353   1486.9800     35.0000      5.8500
+    780.3671   1486.9700     35.0000      5.8500
+    780.4989   1486.9700     35.0000      5.8500
+    780.6307   1486.9800     35.0000      5.8500
+    780.7625   1486.9800     35.0000      5.8500
+    780.8943   1486.9800     35.0000      5.8500
+    781.0261   1486.9800     35.0000      5.8500
+    781.1579   1486.9800     35.0000      5.8500
+    781.2897   1486.9800     35.0000      5.8500
+    781.4215   1486.9800     35.0000      5.8500
+    781.5533   1486.9900     35.0000      5.8500
+    781.6851   1486.9900     35.0000      5.8500
+    781.8170   1486.9800     35.0000      5.8400
+    781.9487   1486.9800     35.0000      5.8400
+    782.0805   1486.9800     35.0000      5.8400
+    782.2123   1486.9800     35.0000      5.8400
+    782.3441   1486.9800     35.0000      5.8400
+    782.4759   1486.9700     35.0000      5.8400
+    782.6077   1486.9600     35.0000      5.8400
+    782.7395   1486.9600     35.0000      5.8300
+    782.8713   1486.9500     35.0000      5.8300
+    783.0031   1486.9500     35.0000      5.8300
+    783.1349   1486.9400     35.0000      5.8300
+    783.2667   1486.9400     35.0000      5.8300
+    783.3984   1486.9300     35.0000      5.8200
+    783.5303   1486.9200     35.0000      5.8200
+    783.6620   1461.9700     35.0000      0.0000
+    784.8481   1442.2300      0.0000      5.8100
+    784.9799   1442.2300      0.0000      5.8100
+    785.1116   1442.2300      0.0000      5.8100
+    785.2434   1486.8900     35.0000      5.8100
+    785.3752   1486.8900     35.0000      5.8100
+    785.5070   1486.8900     35.0000      5.8100
+    785.6387   1486.8900     35.0000      5.8000
+    785.7705   1486.8900     35.0000      5.8000
+    785.9023   1486.8900     35.0000      5.8000
+    786.0341   1462.0100     35.0000      0.0000
+    788.4057   1442.0800      0.0000      5.7600
+    788.5375   1442.0700      0.0000      5.7600
+    788.6693   1442.0700      0.0000      5.7600
+    788.8010   1486.7400     35.0000      5.7600
+    788.9327   1486.7400     35.0000      5.7500
+    789.0645   1486.7400     35.0000      5.7500
+    789.1962   1486.7400     35.0000      5.7500
+    789.3279   1486.7400     35.0000      5.7500
+    789.4597   1486.7400     35.0000      5.7500
+    789.5914   1486.7400     35.0000      5.7500
+    789.7232   1486.7400     35.0000      5.7500
+    789.8549   1486.7400     35.0100      5.7500
+    789.9866   1486.7400     35.0100      5.7500
+    790.1184   1486.7500     35.0100      5.7500
+    790.2501   1486.7500     35.0100      5.7500
+    790.3819   1486.7500     35.0100      5.7500
+    790.5136   1486.7500     35.0100      5.7500
+    790.6454   1486.7500     35.0000      5.7500
+    790.7771   1486.7500     35.0000      5.7500
+    790.9088   1486.7600     35.0000      5.7500
+    791.0405   1486.7600     35.0000      5.7500
+    791.1722   1486.7600     35.0000      5.7500
+    791.3040   1486.7500     35.0000      5.7500
+    791.4357   1486.7500     35.0000      5.7500
+    791.5675   1486.7500     35.0000      5.7400
+    791.6992   1486.7400     35.0000      5.7400
+    791.8309   1486.7400     35.0000      5.7400
+    791.9626   1486.7400     35.0000      5.7400
+    792.0944   1486.7400     35.0000      5.7400
+    792.2261   1486.7300     35.0000      5.7400
+    792.3578   1486.7300     35.0000      5.7400
+    792.4896   1486.7400     35.0000      5.7400
+    792.6212   1486.7400     35.0000      5.7400
+    792.7530   1486.7400     35.0000      5.7400
+    792.8847   1486.7400     35.0000      5.7400
+    793.0164   1486.7400     35.0000      5.7400
+    793.1481   1486.7300     35.0000      5.7300
+    793.2798   1486.7300     35.0000      5.7300
+    793.4116   1486.7300     35.0000      5.7300
+    793.5433   1486.7300     35.0000      5.7300
+    793.6750   1486.7300     35.0000      5.7300
+    793.8067   1486.7300     35.0000      5.7300
+    793.9384   1486.7300     35.0100      5.7300
+    794.0701   1486.7300     35.0000      5.7300
+    794.2018   1486.7300     35.0000      5.7300
+    794.3335   1486.7300     35.0000      5.7300
+    794.4652   1486.7300     35.0000      5.7300
+    794.5969   1486.7300     35.0000      5.7300
+    794.7286   1486.7300     35.0000      5.7300
+    794.8604   1486.7300     34.9900      5.7300
+    794.9920   1486.7300     34.9900      5.7300
+    795.1238   1486.7300     34.9900      5.7300
+    795.2554   1486.7300     34.9900      5.7300
+    795.3871   1486.7200     34.9900      5.7300
+    795.5189   1486.7300     34.9900      5.7300
+    795.6505   1486.7300     34.9900      5.7200
+    795.7822   1486.7200     34.9900      5.7200
+    795.9139   1486.7200     35.0000      5.7200
+    796.0457   1486.7200     34.9900      5.7200
+    796.1773   1486.7200     35.0000      5.7200
+    796.3090   1486.7200     35.0000      5.7200
+    796.4407   1486.7300     35.0000      5.7200
+    796.5724   1486.7300     35.0000      5.7200
+    796.7041   1486.7300     35.0000      5.7200
+    796.8358   1486.7300     35.0000      5.7200
+    796.9675   1486.7300     35.0000      5.7200
+    797.0991   1486.7300     35.0000      5.7200
+    797.2308   1486.7400     35.0000      5.7200
+    797.3625   1486.7400     35.0000      5.7200
+    797.4942   1486.7400     35.0000      5.7200
+    797.6259   1486.7400     35.0000      5.7200
+    797.7575   1486.7400     35.0000      5.7200
+    797.8892   1486.7500     35.0000      5.7200
+    798.0209   1486.7500     35.0000      5.7200
+    798.1526   1486.7500     35.0000      5.7200
+    798.2842   1486.7500     35.0000      5.7200
+    798.4160   1486.7500     35.0000      5.7200
+    798.5476   1486.7500     35.0000      5.7200
+    798.6793   1486.7500     35.0000      5.7200
+    798.8110   1486.7500     35.0000      5.7200
+    798.9426   1486.7500     35.0000      5.7100
+    799.0743   1486.7500     35.0000      5.7100
+    799.2060   1486.7500     35.0000      5.7100
+    799.3376   1486.7500     35.0000      5.7100
+    799.4693   1486.7500     35.0000      5.7100
+    799.6010   1486.7400     35.0000      5.7100
+    799.7327   1486.7400     35.0000      5.7100
+    799.8643   1486.7300     35.0000      5.7100
+    799.9960   1486.7300     35.0000      5.7000
+    800.1276   1486.7300     35.0000      5.7000
+    800.2593   1486.7200     35.0000      5.7000
+    800.3909   1486.7200     35.0000      5.7000
+    800.5226   1486.7200     35.0000      5.7000
+    800.6543   1486.7100     35.0000      5.7000
+    800.7859   1486.7200     35.0000      5.7000
+    800.9176   1486.7200     35.0000      5.7000
+    801.0493   1486.7200     35.0000      5.7000
+    801.1809   1486.7200     35.0000      5.7000
+    801.3126   1486.7300     35.0000      5.7000
+    801.4442   1486.7300     35.0000      5.7000
+    801.5759   1486.7300     35.0000      5.7000
+    801.7075   1486.7200     35.0000      5.7000
+    801.8392   1486.7200     35.0000      5.7000
+    801.9708   1486.7200     35.0000      5.6900
+    802.1025   1486.7200     35.0000      5.6900
+    802.2341   1486.7200     35.0000      5.6900
+    802.3658   1486.7200     35.0000      5.6900
+    802.4974   1486.7100     35.0000      5.6900
+    802.6291   1486.7000     35.0000      5.6900
+    802.7607   1486.7000     35.0000      5.6900
+    802.8923   1486.7000     35.0000      5.6800
+    803.0240   1486.7000     35.0000      5.6800
+    803.1556   1486.6900     35.0000      5.6800
+    803.2873   1486.6900     35.0000      5.6800
+    803.4189   1486.6900     35.0000      5.6800
+    803.5505   1486.6800     35.0000      5.6800
+    803.6822   1486.6900     35.0000      5.6800
+    803.8138   1486.6900     35.0000      5.6800
+    803.9454   1486.6900     35.0000      5.6800
+    804.0771   1486.7000     35.0000      5.6800
+    804.2087   1486.7000     35.0000      5.6800
+    804.3403   1486.7000     35.0000      5.6800
+    804.4720   1486.7000     35.0000      5.6800
+    804.6036   1486.7000     35.0000      5.6800
+    804.7352   1462.3100     35.0000      0.0000
+    806.5779   1441.9300      0.0000      5.6600
+    806.7095   1441.9300      0.0000      5.6600
+    806.8412   1441.9200      0.0000      5.6600
+    806.9728   1486.6600     35.0000      5.6600
+    807.1044   1486.6600     35.0000      5.6600
+    807.2360   1486.6600     35.0000      5.6600
+    807.3676   1486.6500     35.0000      5.6600
+    807.4992   1486.6500     35.0000      5.6500
+    807.6308   1486.6500     35.0000      5.6500
+    807.7624   1486.6400     35.0000      5.6500
+    807.8940   1486.6400     35.0000      5.6500
+    808.0256   1486.6400     35.0000      5.6500
+    808.1572   1462.3700     35.0000      0.0000
+    810.1312   1441.9000      0.0000      5.6400
+    810.2627   1441.9000      0.0000      5.6400
+    810.3943   1441.9000      0.0000      5.6400
+    810.5259   1486.6400     35.0000      5.6400
+    810.6575   1486.6400     35.0000      5.6400
+    810.7891   1486.6400     35.0000      5.6400
+    810.9207   1462.4100     35.0000      0.0000
+    812.1048   1441.8800      0.0000      5.6300
+    812.2365   1441.8800      0.0000      5.6300
+    812.3680   1441.8800      0.0000      5.6300
+    812.4996   1462.4400     35.0000      0.0000
+    813.6837   1441.9000      0.0000      5.6300
+    813.8152   1441.9000      0.0000      5.6300
+    813.9468   1441.9100      0.0000      5.6300
+    814.0783   1486.6600     34.9900      5.6300
+    814.2098   1486.6600     34.9900      5.6300
+    814.3414   1486.6600     34.9900      5.6300
+    814.4730   1486.6600     34.9900      5.6300
+    814.6046   1486.6600     34.9900      5.6300
+    814.7361   1486.6700     34.9900      5.6300
+    814.8677   1486.6700     34.9900      5.6300
+    814.9992   1486.6700     34.9900      5.6300
+    815.1308   1486.6700     34.9900      5.6300
+    815.2623   1486.6700     34.9900      5.6300
+    815.3938   1486.6700     34.9900      5.6300
+    815.5254   1486.6700     34.9900      5.6300
+    815.6569   1486.6700     35.0000      5.6300
+    815.7885   1486.6700     35.0000      5.6300
+    815.9200   1486.6700     35.0000      5.6300
+    816.0516   1486.6700     35.0000      5.6200
+    816.1831   1486.6700     35.0000      5.6200
+    816.3146   1486.6700     35.0000      5.6200
+    816.4462   1486.6700     35.0000      5.6200
+    816.5777   1486.6700     35.0000      5.6200
+    816.7093   1486.6700     35.0000      5.6200
+    816.8408   1486.6800     35.0000      5.6200
+    816.9724   1486.6700     35.0000      5.6200
+    817.1039   1486.6800     35.0000      5.6200
+    817.2354   1486.6800     35.0000      5.6200
+    817.3669   1486.6800     35.0000      5.6200
+    817.4985   1486.6800     35.0000      5.6200
+    817.6300   1486.6800     35.0000      5.6200
+    817.7615   1486.6900     35.0000      5.6200
+    817.8931   1486.6900     35.0000      5.6200
+    818.0246   1486.6900     35.0000      5.6200
+    818.1561   1486.6900     35.0000      5.6200
+    818.2877   1486.6900     35.0000      5.6200
+    818.4192   1486.7000     35.0000      5.6200
+    818.5507   1486.7000     35.0000      5.6200
+    818.6822   1486.7000     35.0000      5.6200
+    818.8138   1486.7000     35.0000      5.6200
+    818.9453   1486.7000     35.0000      5.6200
+    819.0768   1486.7100     35.0000      5.6200
+    819.2083   1486.7100     35.0000      5.6200
+    819.3398   1486.7100     35.0000      5.6200
+    819.4714   1486.7100     35.0000      5.6200
+    819.6028   1486.7200     35.0000      5.6200
+    819.7344   1486.7200     35.0000      5.6200
+    819.8659   1486.7200     35.0000      5.6200
+    819.9974   1462.5600     35.0000      0.0000
+    822.3645   1441.9500      0.0000      5.6100
+    822.4960   1441.9500      0.0000      5.6100
+    822.6275   1441.9500      0.0000      5.6100
+    822.7590   1486.7100     35.0000      5.6100
+    822.8904   1486.7000     35.0000      5.6100
+    823.0220   1486.7000     35.0000      5.6000
+    823.1534   1486.7000     35.0000      5.6000
+    823.2849   1486.7000     35.0000      5.6000
+    823.4164   1486.7100     35.0000      5.6000
+    823.5479   1486.7000     35.0000      5.6000
+    823.6794   1486.7100     35.0000      5.6000
+    823.8109   1486.7100     35.0000      5.6000
+    823.9423   1486.7100     35.0000      5.6000
+    824.0738   1486.7100     35.0000      5.6000
+    824.2053   1486.7000     35.0000      5.6000
+    824.3368   1486.7000     35.0000      5.6000
+    824.4683   1486.7000     35.0000      5.6000
+    824.5997   1486.6900     35.0000      5.5900
+    824.7313   1486.6900     35.0000      5.5900
+    824.8627   1486.6900     35.0000      5.5900
+    824.9942   1486.6800     35.0000      5.5900
+    825.1257   1486.6800     35.0000      5.5900
+    825.2571   1486.6800     34.9900      5.5900
+    825.3886   1486.6800     34.9900      5.5900
+    825.5201   1462.6500     34.9900      0.0000
+    826.7032   1441.9000      0.0000      5.5800
+    826.8348   1441.9000      0.0000      5.5800
+    826.9662   1441.9100      0.0000      5.5800
+    827.0977   1486.6900     35.0000      5.5800
+    827.2291   1486.6900     35.0000      5.5800
+    827.3605   1486.6900     35.0000      5.5800
+    827.4921   1486.6900     35.0000      5.5800
+    827.6235   1486.6900     35.0000      5.5800
+    827.7549   1486.7000     35.0000      5.5800
+    827.8864   1486.7000     35.0000      5.5800
+    828.0179   1486.7000     35.0000      5.5800
+    828.1493   1486.6900     35.0000      5.5800
+    828.2808   1486.6900     35.0000      5.5800
+    828.4122   1486.6900     35.0000      5.5800
+    828.5436   1486.6800     35.0000      5.5800
+    828.6751   1486.6800     34.9900      5.5800
+    828.8065   1486.6800     34.9900      5.5800
+    828.9380   1486.6700     34.9900      5.5700
+    829.0695   1486.6700     34.9900      5.5700
+    829.2009   1486.6700     34.9900      5.5700
+    829.3323   1486.6700     34.9900      5.5700
+    829.4637   1486.6800     34.9900      5.5700
+    829.5952   1486.6800     34.9900      5.5700
+    829.7266   1486.6800     34.9900      5.5700
+    829.8581   1486.6800     34.9900      5.5700
+    829.9895   1486.6800     34.9900      5.5700
+    830.1210   1486.6800     35.0000      5.5700
+    830.2524   1486.6700     35.0000      5.5700
+    830.3839   1486.6700     35.0000      5.5700
+    830.5153   1486.6700     35.0000      5.5700
+    830.6467   1462.7400     35.0000      0.0000
+    831.8295   1441.8700      0.0000      5.5600
+    831.9610   1441.8700      0.0000      5.5600
+    832.0924   1441.8700      0.0000      5.5600
+    832.2238   1486.6500     34.9900      5.5500
+    832.3552   1486.6500     34.9900      5.5500
+    832.4867   1486.6500     34.9900      5.5500
+    832.6181   1486.6500     35.0000      5.5500
+    832.7495   1486.6500     35.0000      5.5500
+    832.8809   1486.6500     35.0000      5.5500
+    833.0123   1462.7800     35.0000      0.0000
+    834.1950   1441.8400      0.0000      5.5400
+    834.3264   1441.8400      0.0000      5.5400
+    834.4578   1441.8400      0.0000      5.5400
+    834.5892   1486.6300     35.0000      5.5400
+    834.7206   1486.6300     35.0000      5.5400
+    834.8521   1486.6300     35.0000      5.5400
+    834.9835   1486.6200     34.9900      5.5300
+    835.1148   1486.6100     34.9900      5.5300
+    835.2462   1486.6100     34.9900      5.5300
+    835.3776   1486.6000     34.9900      5.5300
+    835.5090   1486.5900     34.9900      5.5300
+    835.6404   1486.5900     34.9900      5.5300
+    835.7719   1486.5900     34.9900      5.5300
+    835.9032   1486.5900     34.9900      5.5200
+    836.0346   1486.5800     34.9900      5.5200
+    836.1660   1486.5800     34.9900      5.5200
+    836.2974   1486.5800     34.9900      5.5200
+    836.4288   1486.5800     34.9900      5.5200
+    836.5602   1486.5800     34.9900      5.5200
+    836.6916   1486.5800     35.0000      5.5200
+    836.8229   1486.5800     35.0000      5.5200
+    836.9543   1486.5800     35.0000      5.5200
+    837.0857   1486.5800     35.0000      5.5100
+    837.2170   1486.5800     35.0000      5.5100
+    837.3485   1486.5800     35.0000      5.5100
+    837.4799   1486.5800     35.0000      5.5100
+    837.6113   1486.5800     35.0000      5.5100
+    837.7426   1486.5800     35.0000      5.5100
+    837.8740   1486.5800     35.0000      5.5100
+    838.0054   1486.5700     35.0000      5.5100
+    838.1368   1486.5800     35.0000      5.5100
+    838.2681   1486.5800     35.0000      5.5100
+    838.3995   1486.5700     35.0000      5.5100
+    838.5309   1462.8700     35.0000      0.0000
+    840.1073   1441.7600      0.0000      5.5000
+    840.2386   1441.7600      0.0000      5.5000
+    840.3700   1441.7700      0.0000      5.5000
+    840.5013   1486.5800     34.9900      5.5000
+    840.6328   1486.5800     34.9900      5.5000
+    840.7640   1486.5800     34.9900      5.5000
+    840.8954   1486.5800     34.9900      5.5000
+    841.0268   1486.5800     34.9900      5.5000
+    841.1581   1486.5800     34.9900      5.5000
+    841.2895   1486.5800     34.9900      5.5000
+    841.4208   1486.5800     34.9900      5.5000
+    841.5522   1486.5700     34.9900      5.5000
+    841.6835   1486.5700     35.0000      5.5000
+    841.8149   1486.5700     35.0000      5.4900
+    841.9462   1486.5700     35.0000      5.4900
+    842.0776   1462.9300     35.0000      0.0000
+    843.2597   1441.7400      0.0000      5.4900
+    843.3910   1441.7300      0.0000      5.4900
+    843.5223   1441.7400      0.0000      5.4900
+    843.6537   1486.5600     34.9900      5.4900
+    843.7850   1486.5600     34.9900      5.4900
+    843.9163   1486.5600     34.9900      5.4800
+    844.0477   1486.5600     34.9900      5.4800
+    844.1790   1486.5600     34.9900      5.4800
+    844.3103   1486.5700     34.9900      5.4800
+    844.4417   1486.5700     34.9900      5.4800
+    844.5730   1486.5700     34.9900      5.4800
+    844.7043   1486.5700     34.9900      5.4800
+    844.8356   1486.5800     34.9900      5.4800
+    844.9669   1486.5800     34.9900      5.4800
+    845.0983   1486.5800     34.9900      5.4800
+    845.2296   1486.5800     34.9900      5.4800
+    845.3610   1486.5900     34.9900      5.4800
+    845.4922   1486.5800     34.9900      5.4800
+    845.6236   1486.5800     34.9900      5.4800
+    845.7549   1486.5900     34.9900      5.4800
+    845.8862   1486.5900     34.9900      5.4800
+    846.0175   1486.5900     34.9900      5.4800
+    846.1488   1486.5900     34.9900      5.4800
+    846.2802   1486.5900     34.9900      5.4800
+    846.4114   1462.9900     34.9900      0.0000
+    847.5933   1441.7400      0.0000      5.4700
+    847.7245   1441.7500      0.0000      5.4700
+    847.8558   1441.7500      0.0000      5.4700
+    847.9872   1486.5800     34.9900      5.4700
+    848.1185   1486.5700     34.9900      5.4700
+    848.2498   1486.5700     34.9900      5.4700
+    848.3811   1486.5700     34.9900      5.4700
+    848.5123   1486.5600     34.9900      5.4700
+    848.6437   1486.5600     34.9900      5.4700
+    848.7750   1486.5600     34.9900      5.4700
+    848.9062   1486.5600     34.9900      5.4600
+    849.0375   1486.5600     34.9900      5.4600
+    849.1688   1486.5700     34.9900      5.4600
+    849.3001   1486.5700     34.9900      5.4600
+    849.4314   1486.5700     34.9900      5.4600
+    849.5627   1463.0400     34.9900      0.0000
+    850.7443   1441.7600      0.0000      5.4600
+    850.8755   1441.7500      0.0000      5.4600
+    851.0068   1441.7600      0.0000      5.4600
+    851.1381   1486.5900     34.9900      5.4600
+    851.2694   1486.5900     34.9900      5.4600
+    851.4007   1486.5900     34.9900      5.4600
+    851.5319   1486.5900     34.9900      5.4600
+    851.6632   1486.5900     35.0000      5.4600
+    851.7945   1486.5800     35.0000      5.4600
+    851.9258   1486.5800     35.0000      5.4600
+    852.0570   1486.5800     35.0000      5.4600
+    852.1884   1486.5800     35.0000      5.4500
+    852.3196   1486.5700     34.9900      5.4500
+    852.4508   1486.5700     34.9900      5.4500
+    852.5821   1486.5700     34.9900      5.4500
+    852.7134   1486.5600     34.9900      5.4500
+    852.8447   1486.5500     34.9900      5.4400
+    852.9759   1486.5300     34.9900      5.4400
+    853.1072   1486.5200     34.9900      5.4400
+    853.2384   1486.5000     34.9900      5.4300
+    853.3698   1486.4900     34.9900      5.4300
+    853.5010   1486.4700     34.9900      5.4200
+    853.6322   1486.4600     34.9900      5.4200
+    853.7635   1486.4400     35.0000      5.4100
+    853.8947   1486.4300     35.0000      5.4100
+    854.0260   1486.4300     34.9900      5.4100
+    854.1572   1486.4200     34.9900      5.4100
+    854.2885   1486.4100     34.9900      5.4100
+    854.4197   1486.4100     34.9900      5.4100
+    854.5510   1486.4100     34.9900      5.4100
+    854.6823   1486.4100     34.9900      5.4000
+    854.8135   1486.4000     34.9800      5.4000
+    854.9448   1486.4000     34.9800      5.4000
+    855.0760   1486.4000     34.9800      5.4000
+    855.2073   1486.4000     34.9800      5.4000
+    855.3385   1486.4000     34.9800      5.4000
+    855.4698   1486.4000     34.9800      5.4000
+    855.6010   1486.4000     34.9900      5.4000
+    855.7322   1486.4000     34.9900      5.4000
+    855.8635   1486.4000     34.9900      5.4000
+    855.9947   1486.4000     34.9900      5.4000
+    856.1260   1486.4000     34.9900      5.4000
+    856.2572   1486.4000     34.9900      5.4000
+    856.3884   1486.4100     34.9900      5.4000
+    856.5197   1486.4100     34.9900      5.4000
+    856.6509   1486.4100     34.9900      5.4000
+    856.7822   1486.4100     34.9900      5.4000
+    856.9134   1486.4100     34.9900      5.4000
+    857.0446   1486.4200     34.9900      5.4000
+    857.1758   1486.4200     34.9900      5.4000
+    857.3071   1486.4200     34.9900      5.4000
+    857.4383   1486.4200     34.9900      5.4000
+    857.5696   1486.4200     34.9900      5.4000
+    857.7007   1486.4300     34.9900      5.4000
+    857.8320   1486.4300     34.9900      5.4000
+    857.9633   1486.4300     34.9900      5.4000
+    858.0944   1486.4300     34.9900      5.3900
+    858.2257   1486.4300     34.9900      5.3900
+    858.3569   1486.4300     34.9900      5.3900
+    858.4882   1486.4300     34.9900      5.3900
+    858.6193   1486.4300     34.9900      5.3900
+    858.7506   1486.4300     34.9900      5.3900
+    858.8818   1486.4300     34.9900      5.3900
+    859.0130   1486.4300     34.9900      5.3900
+    859.1442   1486.4300     34.9900      5.3900
+    859.2755   1486.4300     34.9900      5.3900
+    859.4067   1486.4300     35.0000      5.3900
+    859.5378   1486.4300     35.0000      5.3900
+    859.6691   1486.4300     35.0000      5.3900
+    859.8003   1486.4300     35.0000      5.3900
+    859.9315   1486.4400     35.0000      5.3900
+    860.0627   1486.4400     35.0000      5.3900
+    860.1940   1486.4400     35.0000      5.3900
+    860.3251   1486.4400     35.0000      5.3900
+    860.4564   1486.4400     35.0000      5.3800
+    860.5876   1486.4400     34.9900      5.3800
+    860.7188   1486.4300     34.9900      5.3800
+    860.8499   1486.4300     34.9900      5.3800
+    860.9811   1486.4300     34.9900      5.3800
+    861.1124   1486.4200     34.9900      5.3800
+    861.2435   1486.4200     34.9900      5.3800
+    861.3748   1486.4200     34.9900      5.3800
+    861.5060   1486.4100     34.9900      5.3800
+    861.6372   1486.4200     34.9900      5.3800
+    861.7683   1486.4100     34.9900      5.3700
+    861.8995   1486.4100     34.9900      5.3700
+    862.0308   1486.4100     34.9900      5.3700
+    862.1620   1486.4100     34.9900      5.3700
+    862.2932   1486.4100     34.9900      5.3700
+    862.4244   1486.4100     34.9900      5.3700
+    862.5555   1486.4100     34.9900      5.3700
+    862.6867   1486.4100     34.9900      5.3700
+    862.8179   1486.4100     35.0000      5.3700
+    862.9491   1486.4200     35.0000      5.3700
+    863.0803   1486.4200     34.9900      5.3700
+    863.2114   1486.4200     34.9900      5.3700
+    863.3427   1486.4200     34.9900      5.3700
+    863.4739   1486.4300     34.9900      5.3700
+    863.6050   1486.4200     34.9800      5.3700
+    863.7362   1486.4200     34.9800      5.3700
+    863.8674   1486.4100     34.9800      5.3700
+    863.9986   1486.4100     34.9800      5.3700
+    864.1298   1463.2700     34.9800      0.0000
+    865.3104   1441.5000      0.0000      5.3500
+    865.4416   1441.5000      0.0000      5.3500
+    865.5726   1441.5000      0.0000      5.3500
+    865.7039   1486.3900     34.9900      5.3500
+    865.8350   1486.3900     34.9900      5.3500
+    865.9661   1486.3900     34.9900      5.3500
+    866.0974   1486.3900     34.9900      5.3500
+    866.2285   1486.3900     34.9900      5.3500
+    866.3597   1486.3900     34.9900      5.3500
+    866.4908   1463.3200     34.9900      0.0000
+    868.8516   1441.5200      0.0000      5.3500
+    868.9827   1441.5200      0.0000      5.3500
+    869.1139   1441.5300      0.0000      5.3500
+    869.2450   1486.4100     34.9900      5.3500
+    869.3762   1486.4200     34.9900      5.3500
+    869.5073   1486.4100     34.9900      5.3400
+    869.6385   1486.4100     34.9900      5.3400
+    869.7695   1486.4200     34.9900      5.3400
+    869.9007   1486.4200     34.9900      5.3400
+    870.0319   1486.4100     34.9900      5.3400
+    870.1630   1486.4100     34.9800      5.3400
+    870.2941   1486.4100     34.9900      5.3400
+    870.4252   1486.4100     34.9900      5.3400
+    870.5564   1486.4100     34.9900      5.3400
+    870.6875   1486.4100     34.9900      5.3400
+    870.8186   1486.4100     34.9900      5.3400
+    870.9498   1486.4100     34.9900      5.3400
+    871.0809   1486.4100     34.9900      5.3400
+    871.2120   1486.4100     34.9900      5.3400
+    871.3431   1486.4200     34.9900      5.3400
+    871.4743   1486.4200     34.9900      5.3400
+    871.6053   1486.4200     34.9900      5.3400
+    871.7365   1486.4200     34.9900      5.3400
+    871.8677   1486.4300     34.9900      5.3400
+    871.9988   1486.4300     34.9900      5.3400
+    872.1299   1486.4300     34.9900      5.3400
+    872.2610   1486.4300     34.9900      5.3400
+    872.3922   1486.4300     34.9900      5.3400
+    872.5232   1486.4400     34.9900      5.3400
+    872.6544   1486.4400     34.9900      5.3400
+    872.7855   1486.4400     34.9900      5.3400
+    872.9166   1486.4400     34.9900      5.3400
+    873.0477   1486.4400     34.9900      5.3400
+    873.1788   1486.4500     34.9900      5.3400
+    873.3099   1486.4500     34.9900      5.3400
+    873.4410   1486.4500     34.9900      5.3400
+    873.5721   1486.4500     34.9900      5.3400
+    873.7032   1486.4500     34.9900      5.3400
+    873.8344   1486.4600     34.9900      5.3400
+    873.9654   1486.4600     34.9900      5.3400
+    874.0966   1486.4600     34.9900      5.3400
+    874.2277   1486.4600     34.9900      5.3400
+    874.3587   1486.4600     34.9900      5.3400
+    874.4899   1486.4700     34.9900      5.3400
+    874.6210   1486.4700     34.9900      5.3400
+    874.7521   1486.4700     34.9900      5.3400
+    874.8831   1486.4700     34.9900      5.3300
+    875.0142   1486.4600     34.9900      5.3300
+    875.1454   1486.4600     34.9900      5.3300
+    875.2765   1486.4600     34.9900      5.3300
+    875.4075   1486.4600     34.9900      5.3300
+    875.5386   1486.4600     34.9900      5.3300
+    875.6697   1486.4500     34.9900      5.3300
+    875.8008   1486.4500     34.9900      5.3300
+    875.9319   1486.4400     34.9900      5.3200
+    876.0630   1486.4400     34.9900      5.3200
+    876.1942   1486.4400     34.9900      5.3200
+    876.3251   1486.4400     34.9900      5.3200
+    876.4563   1486.4300     34.9900      5.3200
+    876.5874   1486.4300     34.9900      5.3200
+    876.7184   1486.4300     34.9900      5.3200
+    876.8495   1486.4300     34.9900      5.3200
+    876.9806   1486.4300     34.9900      5.3200
+    877.1118   1486.4300     34.9900      5.3200
+    877.2427   1486.4400     34.9900      5.3200
+    877.3738   1486.4400     34.9900      5.3200
+    877.5049   1486.4400     34.9900      5.3200
+    877.6360   1486.4400     34.9900      5.3200
+    877.7671   1486.4400     34.9900      5.3200
+    877.8982   1463.5100     34.9900      0.0000
+    879.8642   1441.5500      0.0000      5.3100
+    879.9952   1441.5500      0.0000      5.3100
+    880.1263   1441.5600      0.0000      5.3100
+    880.2574   1486.4800     34.9900      5.3100
+    880.3884   1486.4800     34.9900      5.3100
+    880.5195   1486.4800     34.9900      5.3100
+    880.6505   1486.4800     34.9900      5.3100
+    880.7816   1486.4800     34.9900      5.3100
+    880.9126   1486.4800     34.9900      5.3100
+    881.0436   1486.4900     34.9900      5.3100
+    881.1747   1486.4900     34.9900      5.3100
+    881.3058   1486.4900     34.9900      5.3100
+    881.4368   1486.4900     34.9900      5.3100
+    881.5679   1486.5000     34.9900      5.3100
+    881.6990   1486.5000     34.9900      5.3100
+    881.8300   1486.5000     34.9900      5.3100
+    881.9610   1486.5000     34.9900      5.3100
+    882.0921   1486.5000     34.9900      5.3100
+    882.2231   1486.5100     34.9900      5.3100
+    882.3541   1486.5000     34.9900      5.3100
+    882.4852   1486.5000     34.9900      5.3100
+    882.6163   1486.5000     34.9900      5.3100
+    882.7473   1486.5000     34.9900      5.3100
+    882.8783   1486.5100     34.9900      5.3100
+    883.0093   1486.5100     34.9900      5.3100
+    883.1404   1486.5100     34.9900      5.3100
+    883.2714   1486.5100     34.9900      5.3100
+    883.4025   1463.6000     34.9900      0.0000
+    885.3679   1441.6100      0.0000      5.3100
+    885.4989   1441.6100      0.0000      5.3100
+    885.6298   1441.6200      0.0000      5.3100
+    885.7609   1486.5500     35.0000      5.3100
+    885.8919   1486.5500     35.0000      5.3100
+    886.0229   1486.5500     35.0000      5.3100
+    886.1539   1486.5500     35.0000      5.3100
+    886.2850   1486.5600     34.9900      5.3100
+    886.4160   1486.5600     34.9900      5.3100
+    886.5469   1486.5600     34.9900      5.3100
+    886.6780   1486.5600     34.9900      5.3100
+    886.8090   1486.5600     34.9900      5.3100
+    886.9401   1486.5700     34.9900      5.3100
+    887.0710   1486.5700     34.9900      5.3100
+    887.2020   1486.5700     34.9900      5.3100
+    887.3331   1486.5700     34.9900      5.3100
+    887.4640   1486.5700     34.9900      5.3100
+    887.5950   1486.5700     34.9900      5.3100
+    887.7260   1486.5700     34.9900      5.3100
+    887.8571   1486.5700     34.9900      5.3100
+    887.9880   1486.5800     34.9900      5.3100
+    888.1190   1486.5800     34.9900      5.3100
+    888.2501   1486.5800     34.9900      5.3100
+    888.3810   1486.5800     34.9900      5.3100
+    888.5120   1486.5800     34.9900      5.3100
+    888.6430   1486.5800     34.9900      5.3100
+    888.7740   1486.5800     34.9900      5.3100
+    888.9050   1486.5800     34.9900      5.3100
+    889.0360   1486.5800     34.9800      5.3100
+    889.1670   1486.5800     34.9900      5.3100
+    889.2980   1486.5800     34.9800      5.3100
+    889.4290   1486.5800     34.9800      5.3000
+    889.5599   1486.5800     34.9900      5.3000
+    889.6910   1486.5700     34.9900      5.3000
+    889.8219   1486.5700     34.9900      5.3000
+    889.9529   1486.5700     34.9800      5.3000
+    890.0839   1486.5700     34.9900      5.3000
+    890.2149   1486.5700     34.9900      5.3000
+    890.3458   1486.5700     34.9800      5.3000
+    890.4768   1486.5600     34.9800      5.3000
+    890.6078   1486.5600     34.9900      5.3000
+    890.7388   1486.5600     34.9900      5.2900
+    890.8698   1486.5600     34.9800      5.2900
+    891.0007   1486.5500     34.9800      5.2900
+    891.1318   1486.5500     34.9800      5.2900
+    891.2626   1486.5500     34.9800      5.2900
+    891.3937   1486.5500     34.9800      5.2900
+    891.5247   1486.5500     34.9800      5.2900
+    891.6556   1486.5500     34.9900      5.2900
+    891.7866   1486.5500     34.9900      5.2900
+    891.9175   1486.5600     34.9900      5.2900
+    892.0486   1486.5600     34.9900      5.2900
+    892.1794   1486.5600     34.9900      5.2900
+    892.3104   1486.5600     34.9900      5.2900
+    892.4415   1486.5600     34.9900      5.2900
+    892.5724   1486.5600     34.9900      5.2900
+    892.7033   1486.5600     34.9900      5.2900
+    892.8343   1486.5500     34.9900      5.2800
+    892.9653   1486.5500     34.9800      5.2800
+    893.0962   1486.5500     34.9800      5.2800
+    893.2272   1463.7500     34.9800      0.0000
+    895.1915   1441.5600      0.0000      5.2600
+    895.3224   1441.5500      0.0000      5.2600
+    895.4533   1441.5500      0.0000      5.2600
+    895.5843   1486.4900     34.9900      5.2600
+    895.7153   1486.4900     34.9900      5.2500
+    895.8463   1486.4900     34.9900      5.2500
+    895.9771   1486.4800     34.9900      5.2500
+    896.1081   1486.4800     34.9900      5.2500
+    896.2390   1486.4800     34.9900      5.2500
+    896.3699   1486.4800     34.9900      5.2500
+    896.5009   1486.4700     34.9900      5.2500
+    896.6318   1486.4700     34.9900      5.2500
+    896.7628   1463.8100     34.9900      0.0000
+    899.3812   1441.5300      0.0000      5.2400
+    899.5121   1441.5300      0.0000      5.2400
+    899.6430   1441.5300      0.0000      5.2400
+    899.7739   1486.4900     34.9900      5.2400
+    899.9048   1486.4900     34.9900      5.2400
+    900.0358   1486.4900     34.9900      5.2400
+    900.1666   1486.4800     34.9800      5.2400
+    900.2975   1486.4800     34.9800      5.2400
+    900.4285   1486.4800     34.9800      5.2300
+    900.5593   1486.4800     34.9900      5.2300
+    900.6902   1486.4800     34.9900      5.2300
+    900.8212   1486.4700     34.9900      5.2300
+    900.9521   1486.4700     34.9900      5.2300
+    901.0829   1486.4700     34.9800      5.2300
+    901.2139   1486.4700     34.9800      5.2300
+    901.3448   1486.4700     34.9800      5.2300
+    901.4757   1486.4700     34.9800      5.2300
+    901.6066   1486.4700     34.9800      5.2300
+    901.7375   1486.4700     34.9800      5.2300
+    901.8684   1486.4700     34.9800      5.2300
+    901.9992   1486.4800     34.9800      5.2300
+    902.1301   1486.4800     34.9800      5.2300
+    902.2610   1486.4800     34.9800      5.2300
+    902.3920   1486.4800     34.9800      5.2300
+    902.5228   1486.4800     34.9800      5.2300
+    902.6537   1486.4800     34.9800      5.2300
+    902.7846   1486.4800     34.9800      5.2300
+    902.9155   1486.4800     34.9800      5.2200
+    903.0463   1486.4800     34.9800      5.2200
+    903.1772   1486.4800     34.9900      5.2200
+    903.3082   1486.4700     34.9900      5.2200
+    903.4390   1486.4800     34.9900      5.2200
+    903.5699   1486.4800     34.9900      5.2200
+    903.7008   1486.4800     34.9900      5.2200
+    903.8316   1486.4800     34.9900      5.2200
+    903.9625   1486.4800     34.9900      5.2200
+    904.0934   1486.4800     34.9900      5.2200
+    904.2243   1486.4800     34.9900      5.2200
+    904.3552   1486.4800     34.9900      5.2200
+    904.4860   1486.4700     34.9900      5.2200
+    904.6169   1486.4700     34.9900      5.2100
+    904.7479   1486.4700     34.9900      5.2100
+    904.8787   1486.4600     34.9900      5.2100
+    905.0095   1486.4600     34.9800      5.2100
+    905.1404   1486.4600     34.9800      5.2100
+    905.2712   1486.4600     34.9800      5.2100
+    905.4021   1486.4600     34.9800      5.2100
+    905.5330   1486.4600     34.9800      5.2100
+    905.6639   1486.4600     34.9800      5.2100
+    905.7947   1486.4600     34.9800      5.2100
+    905.9256   1486.4600     34.9800      5.2100
+    906.0565   1486.4700     34.9800      5.2100
+    906.1873   1486.4600     34.9800      5.2100
+    906.3182   1486.4700     34.9800      5.2100
+    906.4490   1486.4700     34.9800      5.2100
+    906.5800   1486.4700     34.9800      5.2100
+    906.7108   1486.4600     34.9800      5.2100
+    906.8416   1486.4600     34.9800      5.2000
+    906.9725   1486.4600     34.9900      5.2000
+    907.1033   1486.4700     34.9900      5.2000
+    907.2342   1486.4600     34.9900      5.2000
+    907.3651   1486.4700     34.9900      5.2000
+    907.4959   1486.4700     34.9900      5.2000
+    907.6267   1486.4600     34.9900      5.2000
+    907.7576   1486.4700     34.9900      5.2000
+    907.8884   1486.4700     34.9900      5.2000
+    908.0193   1486.4700     34.9900      5.2000
+    908.1501   1486.4800     34.9900      5.2000
+    908.2810   1486.4700     34.9900      5.2000
+    908.4119   1486.4700     34.9900      5.2000
+    908.5426   1486.4700     34.9900      5.2000
+    908.6735   1486.4800     34.9900      5.2000
+    908.8044   1486.4800     34.9900      5.2000
+    908.9352   1486.4800     34.9900      5.2000
+    909.0660   1486.4800     34.9900      5.2000
+    909.1969   1486.4800     34.9900      5.2000
+    909.3278   1486.4900     34.9900      5.2000
+    909.4585   1486.4900     34.9900      5.2000
+    909.5894   1486.4900     34.9900      5.2000
+    909.7202   1486.5000     34.9900      5.2000
+    909.8511   1486.5000     34.9900      5.2000
+    909.9819   1486.5000     34.9900      5.2000
+    910.1127   1486.5000     34.9900      5.2000
+    910.2436   1486.5000     34.9900      5.2000
+    910.3743   1486.5100     34.9900      5.2000
+    910.5052   1486.5100     34.9900      5.2000
+    910.6360   1486.5100     34.9900      5.2000
+    910.7669   1486.5100     34.9900      5.2000
+    910.8976   1486.5100     34.9900      5.2000
+    911.0285   1486.5200     34.9900      5.2000
+    911.1594   1486.5200     34.9900      5.2000
+    911.2902   1486.5200     34.9900      5.2000
+    911.4210   1486.5200     34.9900      5.2000
+    911.5518   1486.5300     34.9900      5.2000
+    911.6827   1486.5300     34.9900      5.2000
+    911.8134   1486.5300     34.9900      5.2000
+    911.9443   1486.5200     34.9900      5.2000
+    912.0751   1464.0700     34.9900      0.0000
+    913.2524   1441.5300      0.0000      5.1900
+    913.3832   1441.5300      0.0000      5.1900
+    913.5140   1441.5400      0.0000      5.1900
+    913.6448   1486.5100     34.9800      5.1900
+    913.7756   1486.5100     34.9800      5.1900
+    913.9064   1486.5100     34.9800      5.1900
+    914.0372   1486.5200     34.9800      5.1900
+    914.1680   1486.5200     34.9800      5.1900
+    914.2988   1486.5200     34.9800      5.1900
+    914.4296   1486.5200     34.9800      5.1900
+    914.5605   1486.5200     34.9800      5.1900
+    914.6912   1486.5300     34.9800      5.1900
+    914.8220   1486.5300     34.9800      5.1900
+    914.9528   1486.5300     34.9800      5.1900
+    915.0836   1486.5300     34.9800      5.1900
+    915.2144   1486.5400     34.9800      5.1900
+    915.3452   1486.5400     34.9800      5.1900
+    915.4760   1486.5400     34.9800      5.1900
+    915.6068   1486.5400     34.9800      5.1900
+    915.7375   1486.5400     34.9800      5.1900
+    915.8683   1486.5500     34.9800      5.1900
+    915.9991   1486.5500     34.9800      5.1900
+    916.1299   1486.5500     34.9800      5.1900
+    916.2607   1486.5500     34.9800      5.1900
+    916.3915   1486.5500     34.9800      5.1900
+    916.5222   1486.5600     34.9800      5.1900
+    916.6530   1486.5600     34.9800      5.1900
+    916.7839   1464.1400     34.9800      0.0000
+    917.9608   1441.6000      0.0000      5.1900
+    918.0916   1441.6100      0.0000      5.1900
+    918.2224   1441.6100      0.0000      5.1900
+    918.3531   1486.5900     34.9800      5.1900
+    918.4839   1486.5900     34.9800      5.1900
+    918.6147   1486.5900     34.9800      5.1900
+    918.7455   1486.5900     34.9800      5.1900
+    918.8762   1486.5900     34.9800      5.1900
+    919.0070   1486.5900     34.9800      5.1900
+    919.1378   1486.5900     34.9800      5.1900
+    919.2684   1486.5900     34.9800      5.1900
+    919.3992   1486.5900     34.9800      5.1900
+    919.5300   1486.5900     34.9800      5.1800
+    919.6608   1486.5900     34.9800      5.1800
+    919.7915   1486.5900     34.9800      5.1800
+    919.9223   1486.5800     34.9900      5.1800
+    920.0530   1486.5800     34.9900      5.1800
+    920.1838   1486.5800     34.9900      5.1800
+    920.3145   1486.5800     34.9900      5.1800
+    920.4453   1486.5800     34.9900      5.1800
+    920.5761   1486.5700     34.9900      5.1800
+    920.7068   1486.5700     34.9900      5.1700
+    920.8375   1486.5700     34.9900      5.1700
+    920.9683   1486.5600     34.9800      5.1700
+    921.0991   1486.5600     34.9800      5.1700
+    921.2298   1486.5600     34.9800      5.1700
+    921.3605   1486.5600     34.9800      5.1700
+    921.4913   1486.5600     34.9800      5.1700
+    921.6220   1486.5700     34.9800      5.1700
+    921.7527   1486.5700     34.9900      5.1700
+    921.8835   1464.2300     34.9900      0.0000
+    923.0601   1441.5500      0.0000      5.1600
+    923.1909   1441.5600      0.0000      5.1600
+    923.3217   1441.5600      0.0000      5.1600
+    923.4523   1486.5600     34.9800      5.1600
+    923.5831   1486.5700     34.9800      5.1600
+    923.7138   1486.5800     34.9800      5.1700
+    923.8446   1464.2600     34.9800      0.0000
+    925.0211   1441.6300      0.0000      5.1700
+    925.1518   1441.6300      0.0000      5.1700
+    925.2825   1441.6400      0.0000      5.1700
+    925.4131   1486.6400     34.9900      5.1700
+    925.5439   1486.6400     34.9900      5.1700
+    925.6747   1486.6500     34.9900      5.1700
+    925.8053   1486.6500     34.9900      5.1700
+    925.9360   1486.6500     34.9900      5.1700
+    926.0668   1486.6500     34.9900      5.1700
+    926.1975   1486.6500     34.9900      5.1700
+    926.3282   1486.6500     34.9900      5.1700
+    926.4589   1486.6600     34.9900      5.1700
+    926.5896   1486.6600     34.9900      5.1700
+    926.7203   1486.6600     34.9900      5.1700
+    926.8510   1486.6600     34.9900      5.1700
+    926.9818   1486.6700     34.9900      5.1700
+    927.1124   1486.6700     34.9900      5.1700
+    927.2431   1486.6700     34.9900      5.1700
+    927.3738   1486.6700     34.9900      5.1700
+    927.5045   1486.6800     34.9900      5.1700
+    927.6353   1486.6800     34.9900      5.1700
+    927.7659   1464.3400     34.9900      0.0000
+    928.9422   1441.6900      0.0000      5.1700
+    929.0728   1441.6900      0.0000      5.1700
+    929.2035   1441.7000      0.0000      5.1700
+    929.3342   1486.7100     34.9900      5.1700
+    929.4650   1486.7100     34.9900      5.1700
+    929.5956   1486.7100     34.9900      5.1700
+    929.7263   1486.7100     34.9900      5.1700
+    929.8570   1486.7100     34.9900      5.1700
+    929.9876   1486.7200     34.9900      5.1700
+    930.1183   1486.7100     34.9900      5.1700
+    930.2490   1486.7100     34.9900      5.1700
+    930.3797   1486.7100     34.9900      5.1700
+    930.5103   1486.7100     34.9900      5.1700
+    930.6410   1486.7100     34.9900      5.1700
+    930.7717   1486.7000     34.9900      5.1600
+    930.9024   1486.7000     34.9900      5.1600
+    931.0330   1486.7000     34.9900      5.1600
+    931.1637   1486.7000     34.9900      5.1600
+    931.2944   1486.7000     34.9900      5.1600
+    931.4250   1486.7100     34.9900      5.1600
+    931.5557   1486.7000     34.9900      5.1600
+    931.6864   1486.7000     34.9900      5.1600
+    931.8171   1486.7000     34.9900      5.1600
+    931.9477   1486.6900     34.9900      5.1600
+    932.0784   1486.6900     34.9900      5.1500
+    932.2091   1486.6800     34.9900      5.1500
+    932.3397   1486.6800     34.9900      5.1500
+    932.4704   1486.6700     34.9900      5.1500
+    932.6011   1486.6700     34.9900      5.1500
+    932.7318   1486.6700     34.9900      5.1500
+    932.8624   1486.6600     34.9900      5.1500
+    932.9930   1486.6600     34.9900      5.1400
+    933.1237   1486.6600     34.9900      5.1400
+    933.2543   1486.6500     34.9900      5.1400
+    933.3849   1486.6500     34.9900      5.1400
+    933.5157   1486.6500     34.9900      5.1400
+    933.6464   1486.6400     34.9900      5.1400
+    933.7769   1486.6500     34.9900      5.1400
+    933.9076   1486.6500     34.9900      5.1400
+    934.0383   1486.6500     34.9900      5.1400
+    934.1689   1486.6400     34.9900      5.1400
+    934.2996   1486.6400     34.9900      5.1300
+    934.4302   1486.6400     34.9900      5.1300
+    934.5609   1486.6400     34.9900      5.1300
+    934.6915   1486.6400     34.9900      5.1300
+    934.8221   1486.6400     34.9900      5.1300
+    934.9528   1486.6400     34.9900      5.1300
+    935.0835   1486.6400     34.9900      5.1300
+    935.2141   1486.6500     34.9900      5.1300
+    935.3447   1486.6500     34.9900      5.1300
+    935.4754   1486.6500     34.9900      5.1300
+    935.6060   1486.6500     34.9900      5.1300
+    935.7366   1486.6500     34.9900      5.1300
+    935.8672   1486.6600     35.0000      5.1300
+    935.9979   1486.6600     34.9900      5.1300
+    936.1285   1486.6600     34.9900      5.1300
+    936.2592   1486.6600     34.9900      5.1300
+    936.3898   1486.6600     34.9900      5.1300
+    936.5204   1486.6600     34.9900      5.1300
+    936.6511   1486.6600     34.9900      5.1300
+    936.7817   1486.6500     34.9900      5.1300
+    936.9124   1486.6500     34.9900      5.1300
+    937.0429   1486.6500     34.9900      5.1300
+    937.1736   1486.6500     34.9900      5.1300
+    937.3042   1486.6400     34.9900      5.1200
+    937.4349   1486.6400     34.9900      5.1200
+    937.5654   1486.6400     34.9900      5.1200
+    937.6960   1486.6400     34.9900      5.1200
+    937.8267   1486.6400     34.9900      5.1200
+    937.9573   1486.6400     34.9900      5.1200
+    938.0879   1486.6400     34.9900      5.1200
+    938.2186   1486.6500     34.9900      5.1200
+    938.3492   1486.6500     34.9900      5.1200
+    938.4797   1486.6500     34.9900      5.1200
+    938.6104   1486.6500     34.9900      5.1200
+    938.7410   1486.6500     34.9900      5.1200
+    938.8716   1486.6600     34.9900      5.1200
+    939.0022   1486.6600     34.9900      5.1200
+    939.1329   1486.6600     34.9900      5.1200
+    939.2635   1486.6600     34.9900      5.1200
+    939.3940   1486.6600     34.9900      5.1200
+    939.5247   1486.6600     34.9900      5.1200
+    939.6553   1486.6600     34.9900      5.1200
+    939.7858   1486.6500     34.9900      5.1200
+    939.9165   1486.6500     34.9900      5.1100
+    940.0471   1486.6500     34.9900      5.1100
+    940.1777   1486.6500     34.9900      5.1100
+    940.3083   1486.6400     34.9900      5.1100
+    940.4389   1486.6400     34.9900      5.1100
+    940.5695   1486.6400     34.9900      5.1100
+    940.7001   1486.6400     34.9900      5.1100
+    940.8307   1486.6400     34.9800      5.1100
+    940.9613   1486.6400     34.9800      5.1100
+    941.0919   1486.6400     34.9800      5.1100
+    941.2225   1486.6400     34.9800      5.1100
+    941.3531   1486.6500     34.9800      5.1100
+    941.4837   1486.6500     34.9800      5.1100
+    941.6143   1486.6500     34.9800      5.1100
+    941.7449   1486.6600     34.9800      5.1100
+    941.8755   1486.6600     34.9800      5.1100
+    942.0061   1486.6600     34.9800      5.1100
+    942.1366   1486.6600     34.9800      5.1100
+    942.2672   1486.6600     34.9800      5.1100
+    942.3978   1486.6600     34.9800      5.1100
+    942.5284   1486.6500     34.9800      5.1100
+    942.6589   1486.6600     34.9900      5.1100
+    942.7896   1486.6600     34.9900      5.1100
+    942.9202   1486.6600     34.9800      5.1100
+    943.0507   1464.5800     34.9800      0.0000
+    945.0093   1441.6400      0.0000      5.1000
+    945.1399   1441.6400      0.0000      5.1000
+    945.2705   1441.6500      0.0000      5.1000
+    945.4010   1486.6900     34.9900      5.1000
+    945.5316   1486.6900     34.9900      5.1000
+    945.6622   1486.6800     34.9900      5.1000
+    945.7928   1486.6800     34.9900      5.1000
+    945.9233   1486.6800     34.9900      5.1000
+    946.0538   1486.6800     34.9900      5.1000
+    946.1844   1486.6800     34.9900      5.1000
+    946.3149   1486.6800     34.9900      5.0900
+    946.4455   1486.6800     34.9900      5.0900
+    946.5761   1486.6700     34.9900      5.0900
+    946.7067   1486.6700     34.9900      5.0900
+    946.8372   1486.6700     34.9900      5.0900
+    946.9677   1486.6700     34.9900      5.0900
+    947.0983   1486.6700     34.9900      5.0900
+    947.2289   1486.6700     34.9900      5.0900
+    947.3594   1486.6700     34.9800      5.0900
+    947.4899   1486.6700     34.9800      5.0900
+    947.6205   1486.6700     34.9800      5.0900
+    947.7510   1486.6700     34.9800      5.0900
+    947.8816   1486.6700     34.9800      5.0900
+    948.0121   1486.6700     34.9800      5.0900
+    948.1427   1486.6700     34.9800      5.0900
+    948.2732   1486.6700     34.9800      5.0900
+    948.4037   1486.6700     34.9800      5.0900
+    948.5343   1486.6700     34.9900      5.0800
+    948.6648   1486.6600     34.9900      5.0800
+    948.7953   1486.6600     34.9900      5.0800
+    948.9259   1486.6500     34.9900      5.0800
+    949.0565   1486.6500     34.9900      5.0800
+    949.1870   1486.6500     34.9900      5.0800
+    949.3175   1464.6900     34.9900      0.0000
+    950.4923   1441.6000      0.0000      5.0700
+    950.6228   1441.6000      0.0000      5.0700
+    950.7534   1441.6000      0.0000      5.0700
+    950.8839   1486.6600     34.9900      5.0700
+    951.0143   1486.6600     34.9900      5.0700
+    951.1449   1486.6600     34.9900      5.0700
+    951.2755   1486.6700     34.9900      5.0700
+    951.4059   1486.6700     34.9900      5.0700
+    951.5364   1486.6700     34.9900      5.0700
+    951.6669   1486.6700     34.9900      5.0700
+    951.7975   1486.6700     34.9900      5.0700
+    951.9279   1486.6700     34.9900      5.0700
+    952.0585   1486.6800     34.9900      5.0700
+    952.1890   1486.6800     34.9900      5.0700
+    952.3196   1486.6800     34.9900      5.0700
+    952.4500   1486.6800     34.9900      5.0700
+    952.5806   1486.6800     34.9900      5.0700
+    952.7111   1486.6800     34.9900      5.0700
+    952.8415   1486.6800     34.9900      5.0700
+    952.9720   1486.6800     34.9900      5.0700
+    953.1026   1486.6800     34.9900      5.0700
+    953.2331   1486.6700     34.9900      5.0700
+    953.3635   1486.6700     34.9900      5.0600
+    953.4941   1486.6600     34.9800      5.0600
+    953.6246   1486.6600     34.9900      5.0600
+    953.7551   1486.6600     34.9900      5.0600
+    953.8856   1486.6600     34.9900      5.0600
+    954.0161   1486.6600     34.9900      5.0600
+    954.1466   1486.6600     34.9900      5.0600
+    954.2770   1486.6500     34.9900      5.0600
+    954.4076   1486.6500     34.9900      5.0600
+    954.5381   1486.6500     34.9900      5.0500
+    954.6686   1486.6400     34.9900      5.0500
+    954.7990   1486.6300     34.9900      5.0500
+    954.9296   1486.6300     34.9900      5.0500
+    955.0601   1486.6300     34.9900      5.0500
+    955.1905   1464.7900     34.9900      0.0000
+    956.3649   1441.5600      0.0000      5.0400
+    956.4954   1441.5600      0.0000      5.0400
+    956.6258   1441.5600      0.0000      5.0400
+    956.7563   1486.6400     34.9900      5.0400
+    956.8868   1486.6400     34.9900      5.0400
+    957.0173   1486.6400     34.9900      5.0400
+    957.1477   1486.6400     34.9900      5.0400
+    957.2783   1486.6400     34.9900      5.0400
+    957.4088   1486.6500     34.9900      5.0400
+    957.5391   1486.6500     34.9900      5.0400
+    957.6696   1486.6500     34.9900      5.0400
+    957.8001   1486.6500     34.9900      5.0400
+    957.9306   1486.6600     34.9900      5.0400
+    958.0610   1486.6600     34.9900      5.0400
+    958.1915   1486.6600     34.9900      5.0400
+    958.3220   1486.6600     34.9900      5.0400
+    958.4524   1486.6600     34.9900      5.0400
+    958.5829   1486.6600     34.9900      5.0400
+    958.7134   1486.6600     34.9900      5.0400
+    958.8439   1486.6600     34.9900      5.0400
+    958.9742   1486.6600     34.9900      5.0400
+    959.1047   1486.6600     34.9900      5.0400
+    959.2352   1486.6500     34.9900      5.0400
+    959.3656   1486.6500     34.9900      5.0300
+    959.4961   1486.6500     34.9900      5.0300
+    959.6266   1486.6500     34.9900      5.0300
+    959.7571   1486.6500     34.9900      5.0300
+    959.8875   1486.6500     34.9900      5.0300
+    960.0179   1486.6500     34.9900      5.0300
+    960.1484   1486.6500     34.9900      5.0300
+    960.2789   1486.6500     34.9900      5.0300
+    960.4093   1486.6600     34.9900      5.0300
+    960.5397   1486.6600     34.9900      5.0300
+    960.6702   1486.6600     34.9900      5.0300
+    960.8006   1486.6600     34.9900      5.0300
+    960.9311   1486.6600     34.9900      5.0300
+    961.0616   1486.6700     34.9900      5.0300
+    961.1920   1486.6700     34.9900      5.0300
+    961.3224   1486.6600     34.9800      5.0300
+    961.4529   1464.8800     34.9800      0.0000
+    962.6268   1441.5700      0.0000      5.0200
+    962.7572   1441.5700      0.0000      5.0200
+    962.8877   1441.5800      0.0000      5.0200
+    963.0181   1486.6600     34.9900      5.0200
+    963.1485   1486.6600     34.9900      5.0200
+    963.2789   1486.6600     34.9900      5.0200
+    963.4094   1486.6700     34.9900      5.0200
+    963.5399   1486.6700     34.9900      5.0200
+    963.6702   1486.6700     34.9900      5.0200
+    963.8007   1486.6700     34.9900      5.0200
+    963.9311   1486.6700     34.9900      5.0200
+    964.0615   1486.6700     34.9900      5.0200
+    964.1919   1486.6700     34.9900      5.0200
+    964.3224   1486.6700     34.9900      5.0200
+    964.4528   1486.6700     34.9900      5.0200
+    964.5831   1486.6700     34.9900      5.0200
+    964.7136   1486.6700     34.9900      5.0200
+    964.8441   1486.6700     34.9900      5.0200
+    964.9744   1486.6700     34.9900      5.0100
+    965.1049   1486.6600     34.9900      5.0100
+    965.2353   1486.6600     34.9900      5.0100
+    965.3657   1486.6600     34.9900      5.0100
+    965.4960   1486.6600     34.9900      5.0100
+    965.6265   1486.6600     34.9900      5.0100
+    965.7569   1486.6600     34.9800      5.0100
+    965.8873   1486.6600     34.9800      5.0100
+    966.0177   1486.6600     34.9800      5.0100
+    966.1481   1486.6600     34.9800      5.0100
+    966.2786   1486.6600     34.9800      5.0100
+    966.4089   1486.6600     34.9800      5.0100
+    966.5393   1486.6600     34.9800      5.0100
+    966.6697   1486.6600     34.9800      5.0100
+    966.8002   1486.6600     34.9800      5.0100
+    966.9305   1486.6600     34.9800      5.0100
+    967.0610   1486.6500     34.9900      5.0100
+    967.1913   1486.6600     34.9900      5.0100
+    967.3217   1486.6600     34.9900      5.0000
+    967.4521   1486.6500     34.9900      5.0000
+    967.5825   1486.6500     34.9900      5.0000
+    967.7130   1486.6600     34.9900      5.0000
+    967.8433   1486.6600     34.9900      5.0000
+    967.9737   1486.6600     34.9900      5.0000
+    968.1041   1486.6600     34.9900      5.0000
+    968.2344   1486.6700     34.9900      5.0000
+    968.3649   1486.6700     34.9900      5.0000
+    968.4953   1486.6700     34.9900      5.0000
+    968.6257   1486.6700     34.9900      5.0000
+    968.7560   1486.6700     34.9900      5.0000
+    968.8864   1486.6800     34.9900      5.0000
+    969.0168   1486.6800     34.9900      5.0000
+    969.1472   1486.6800     34.9900      5.0000
+    969.2776   1486.6800     34.9900      5.0000
+    969.4080   1486.6800     34.9900      5.0000
+    969.5384   1486.6800     34.9900      5.0000
+    969.6687   1486.6900     34.9900      5.0000
+    969.7991   1486.6900     34.9900      5.0000
+    969.9295   1486.6900     34.9900      5.0000
+    970.0599   1486.6900     34.9900      5.0000
+    970.1902   1486.7000     34.9900      5.0000
+    970.3206   1486.7000     34.9900      5.0000
+    970.4510   1465.0400     34.9900      0.0000
+    971.6243   1441.6200      0.0000      5.0000
+    971.7547   1441.6300      0.0000      5.0000
+    971.8851   1441.6300      0.0000      5.0000
+    972.0154   1486.7200     34.9900      5.0000
+    972.1458   1486.7200     34.9900      5.0000
+    972.2761   1486.7200     34.9900      5.0000
+    972.4064   1486.7200     34.9900      5.0000
+    972.5368   1486.7100     34.9900      5.0000
+    972.6672   1486.7100     34.9900      4.9900
+    972.7975   1486.7100     34.9900      4.9900
+    972.9279   1486.7000     34.9900      4.9900
+    973.0582   1486.7000     34.9900      4.9900
+    973.1886   1486.7000     34.9900      4.9900
+    973.3190   1486.7000     34.9800      4.9900
+    973.4493   1486.7000     34.9800      4.9900
+    973.5797   1486.7000     34.9800      4.9900
+    973.7100   1486.7000     34.9800      4.9900
+    973.8403   1486.7100     34.9800      4.9900
+    973.9707   1486.7100     34.9800      4.9900
+    974.1011   1486.7100     34.9800      4.9900
+    974.2314   1486.7100     34.9800      4.9900
+    974.3617   1486.7100     34.9800      4.9900
+    974.4921   1486.7200     34.9800      4.9900
+    974.6224   1486.7200     34.9800      4.9900
+    974.7527   1486.7200     34.9800      4.9900
+    974.8831   1486.7200     34.9800      4.9900
+    975.0134   1486.7200     34.9800      4.9900
+    975.1438   1486.7200     34.9800      4.9900
+    975.2740   1486.7100     34.9800      4.9900
+    975.4044   1486.7100     34.9800      4.9900
+    975.5348   1486.7100     34.9800      4.9900
+    975.6650   1486.7100     34.9900      4.9900
+    975.7954   1486.7100     34.9900      4.9800
+    975.9258   1486.7100     34.9900      4.9800
+    976.0562   1486.7100     34.9900      4.9800
+    976.1864   1486.7100     34.9900      4.9800
+    976.3168   1486.7100     34.9800      4.9800
+    976.4471   1486.7200     34.9800      4.9800
+    976.5775   1486.7200     34.9800      4.9800
+    976.7077   1486.7200     34.9800      4.9800
+    976.8381   1486.7200     34.9800      4.9800
+    976.9684   1486.7200     34.9800      4.9800
+    977.0987   1465.1400     34.9800      0.0000
+    979.8353   1441.6200      0.0000      4.9700
+    979.9656   1441.6200      0.0000      4.9700
+    980.0959   1441.6300      0.0000      4.9700
+    980.2262   1486.7400     34.9800      4.9700
+    980.3564   1486.7300     34.9800      4.9700
+    980.4868   1486.7400     34.9800      4.9700
+    980.6171   1465.1900     34.9800      0.0000
+    981.7897   1441.6500      0.0000      4.9700
+    981.9200   1441.6600      0.0000      4.9700
+    982.0503   1441.6600      0.0000      4.9700
+    982.1805   1486.7600     34.9800      4.9700
+    982.3108   1486.7600     34.9800      4.9700
+    982.4411   1486.7600     34.9800      4.9700
+    982.5714   1486.7700     34.9800      4.9700
+    982.7017   1486.7700     34.9800      4.9700
+    982.8320   1486.7700     34.9800      4.9700
+    982.9623   1486.7700     34.9800      4.9700
+    983.0925   1486.7700     34.9800      4.9700
+    983.2228   1486.7600     34.9800      4.9700
+    983.3531   1486.7600     34.9800      4.9700
+    983.4833   1486.7700     34.9800      4.9700
+    983.6136   1486.7700     34.9800      4.9700
+    983.7439   1486.7600     34.9800      4.9700
+    983.8741   1486.7600     34.9900      4.9600
+    984.0045   1486.7600     34.9900      4.9600
+    984.1346   1486.7700     34.9900      4.9600
+    984.2650   1486.7700     34.9900      4.9600
+    984.3953   1486.7700     34.9900      4.9600
+    984.5255   1486.7700     34.9900      4.9600
+    984.6558   1486.7800     34.9900      4.9600
+    984.7860   1486.7800     34.9900      4.9600
+    984.9163   1486.7800     34.9900      4.9600
+    985.0465   1486.7800     34.9900      4.9600
+    985.1768   1486.7800     34.9900      4.9600
+    985.3071   1486.7800     34.9900      4.9600
+    985.4373   1486.7700     34.9900      4.9600
+    985.5676   1486.7700     34.9900      4.9600
+    985.6979   1486.7700     34.9900      4.9600
+    985.8281   1486.7600     34.9800      4.9600
+    985.9583   1486.7600     34.9800      4.9600
+    986.0886   1486.7600     34.9800      4.9500
+    986.2189   1486.7500     34.9800      4.9500
+    986.3492   1486.7500     34.9800      4.9500
+    986.4794   1486.7500     34.9800      4.9500
+    986.6096   1486.7500     34.9800      4.9500
+    986.7399   1486.7400     34.9800      4.9500
+    986.8701   1486.7400     34.9800      4.9500
+    987.0004   1486.7400     34.9800      4.9500
+    987.1306   1486.7300     34.9800      4.9400
+    987.2609   1486.7200     34.9800      4.9400
+    987.3911   1486.7200     34.9800      4.9400
+    987.5214   1486.7100     34.9800      4.9400
+    987.6516   1486.7100     34.9800      4.9300
+    987.7818   1486.7000     34.9800      4.9300
+    987.9120   1486.6900     34.9800      4.9300
+    988.0423   1465.3200     34.9800      0.0000
+    990.3865   1441.5200      0.0000      4.9100
+    990.5167   1441.5300      0.0000      4.9100
+    990.6469   1441.5300      0.0000      4.9100
+    990.7771   1486.6700     34.9800      4.9100
+    990.9073   1486.6700     34.9800      4.9100
+    991.0375   1486.6700     34.9800      4.9100
+    991.1677   1486.6700     34.9800      4.9100
+    991.2980   1486.6800     34.9800      4.9100
+    991.4282   1486.6700     34.9800      4.9100
+    991.5584   1486.6800     34.9800      4.9100
+    991.6886   1486.6800     34.9800      4.9100
+    991.8188   1486.6800     34.9800      4.9100
+    991.9490   1486.6800     34.9800      4.9100
+    992.0792   1486.6900     34.9800      4.9100
+    992.2095   1486.6900     34.9800      4.9100
+    992.3397   1486.6900     34.9800      4.9100
+    992.4698   1486.6900     34.9800      4.9100
+    992.6001   1486.7000     34.9800      4.9100
+    992.7303   1486.7000     34.9800      4.9100
+    992.8605   1486.7000     34.9800      4.9100
+    992.9907   1486.7000     34.9800      4.9100
+    993.1209   1486.7100     34.9800      4.9100
+    993.2511   1486.7100     34.9800      4.9100
+    993.3812   1486.7100     34.9800      4.9100
+    993.5115   1486.7100     34.9800      4.9100
+    993.6417   1486.7200     34.9800      4.9100
+    993.7719   1486.7200     34.9800      4.9100
+    993.9020   1486.7200     34.9800      4.9100
+    994.0323   1486.7200     34.9800      4.9100
+    994.1625   1486.7200     34.9800      4.9100
+    994.2926   1486.7300     34.9800      4.9100
+    994.4229   1486.7200     34.9800      4.9100
+    994.5530   1486.7200     34.9800      4.9100
+    994.6833   1465.4300     34.9800      0.0000
+    995.8549   1441.5700      0.0000      4.9000
+    995.9851   1441.5700      0.0000      4.9000
+    996.1153   1441.5700      0.0000      4.9000
+    996.2454   1486.7100     34.9700      4.9000
+    996.3756   1486.7100     34.9700      4.9000
+    996.5058   1486.7100     34.9700      4.9000
+    996.6359   1486.7100     34.9700      4.9000
+    996.7661   1486.7200     34.9700      4.9000
+    996.8963   1486.7100     34.9700      4.9000
+    997.0265   1486.7200     34.9700      4.9000
+    997.1566   1486.7200     34.9700      4.9000
+    997.2868   1486.7200     34.9700      4.9000
+    997.4170   1486.7100     34.9700      4.9000
+    997.5471   1486.7100     34.9700      4.9000
+    997.6773   1486.7100     34.9800      4.9000
+    997.8075   1486.7100     34.9800      4.9000
+    997.9377   1486.7100     34.9800      4.9000
+    998.0677   1486.7100     34.9800      4.9000
+    998.1979   1486.7100     34.9800      4.9000
+    998.3281   1486.7100     34.9800      4.8900
+    998.4583   1486.7100     34.9800      4.8900
+    998.5884   1486.7100     34.9800      4.8900
+    998.7186   1486.7100     34.9800      4.8900
+    998.8488   1486.7200     34.9800      4.8900
+    998.9789   1486.7200     34.9800      4.8900
+    999.1091   1486.7200     34.9800      4.8900
+    999.2393   1486.7200     34.9800      4.8900
+    999.3694   1486.7200     34.9800      4.8900
+    999.4995   1486.7200     34.9800      4.8900
+    999.6297   1486.7200     34.9700      4.8900
+    999.7599   1465.5100     34.9800      0.0000
+   1000.9311   1441.5900      0.0000      4.8900
+   1001.0613   1441.5900      0.0000      4.8900
+   1001.1915   1441.5900      0.0000      4.8900
+   1001.3215   1486.7500     34.9800      4.8900
+   1001.4517   1486.7400     34.9800      4.8900
+   1001.5818   1486.7400     34.9800      4.8900
+   1001.7119   1486.7400     34.9800      4.8900
+   1001.8421   1486.7400     34.9800      4.8900
+   1001.9722   1486.7400     34.9800      4.8900
+   1002.1024   1486.7300     34.9800      4.8900
+   1002.2325   1486.7300     34.9800      4.8800
+   1002.3626   1486.7300     34.9800      4.8800
+   1002.4928   1486.7300     34.9800      4.8800
+   1002.6229   1486.7300     34.9700      4.8800
+   1002.7530   1486.7400     34.9700      4.8800
+   1002.8831   1486.7400     34.9700      4.8800
+   1003.0133   1486.7400     34.9700      4.8800
+   1003.1434   1486.7400     34.9700      4.8800
+   1003.2735   1486.7400     34.9700      4.8800
+   1003.4036   1486.7400     34.9700      4.8800
+   1003.5338   1486.7500     34.9700      4.8800
+   1003.6639   1486.7500     34.9700      4.8800
+   1003.7940   1486.7500     34.9700      4.8800
+   1003.9241   1486.7500     34.9700      4.8800
+   1004.0542   1486.7500     34.9700      4.8800
+   1004.1843   1486.7600     34.9700      4.8800
+   1004.3145   1486.7600     34.9700      4.8800
+   1004.4446   1486.7600     34.9700      4.8800
+   1004.5746   1486.7700     34.9700      4.8800
+   1004.7048   1486.7700     34.9700      4.8800
+   1004.8350   1486.7700     34.9700      4.8800
+   1004.9650   1486.7700     34.9700      4.8800
+   1005.0951   1486.7700     34.9700      4.8800
+   1005.2253   1465.5900     34.9700      0.0000
+   1006.3961   1441.6000      0.0000      4.8700
+   1006.5262   1441.6100      0.0000      4.8700
+   1006.6564   1441.6100      0.0000      4.8700
+   1006.7865   1486.7600     34.9800      4.8700
+   1006.9166   1486.7600     34.9800      4.8700
+   1007.0467   1486.7500     34.9800      4.8700
+   1007.1768   1486.7500     34.9800      4.8700
+   1007.3068   1486.7500     34.9800      4.8700
+   1007.4370   1486.7400     34.9700      4.8700
+   1007.5671   1486.7400     34.9700      4.8700
+   1007.6971   1486.7400     34.9700      4.8600
+   1007.8272   1486.7400     34.9700      4.8600
+   1007.9573   1486.7400     34.9700      4.8600
+   1008.0874   1486.7400     34.9700      4.8600
+   1008.2174   1486.7400     34.9700      4.8600
+   1008.3475   1486.7500     34.9700      4.8600
+   1008.4777   1486.7500     34.9700      4.8600
+   1008.6078   1486.7500     34.9700      4.8600
+   1008.7378   1486.7500     34.9700      4.8600
+   1008.8679   1486.7500     34.9700      4.8600
+   1008.9980   1486.7600     34.9700      4.8600
+   1009.1281   1486.7600     34.9700      4.8600
+   1009.2581   1486.7600     34.9700      4.8600
+   1009.3882   1486.7600     34.9700      4.8600
+   1009.5183   1486.7600     34.9700      4.8600
+   1009.6483   1486.7600     34.9700      4.8600
+   1009.7784   1486.7500     34.9700      4.8600
+   1009.9085   1486.7500     34.9800      4.8600
+   1010.0386   1486.7500     34.9800      4.8600
+   1010.1686   1486.7500     34.9800      4.8600
+   1010.2987   1486.7500     34.9800      4.8600
+   1010.4288   1486.7500     34.9800      4.8500
+   1010.5588   1486.7500     34.9800      4.8500
+   1010.6889   1486.7500     34.9800      4.8500
+   1010.8190   1486.7600     34.9800      4.8500
+   1010.9491   1486.7600     34.9800      4.8500
+   1011.0791   1486.7600     34.9800      4.8500
+   1011.2092   1486.7600     34.9800      4.8500
+   1011.3393   1486.7600     34.9800      4.8500
+   1011.4692   1486.7600     34.9800      4.8500
+   1011.5994   1486.7600     34.9700      4.8500
+   1011.7294   1486.7600     34.9700      4.8500
+   1011.8595   1486.7600     34.9700      4.8500
+   1011.9895   1486.7600     34.9700      4.8500
+   1012.1196   1486.7600     34.9700      4.8500
+   1012.2497   1486.7600     34.9700      4.8500
+   1012.3798   1486.7700     34.9700      4.8500
+   1012.5098   1486.7700     34.9700      4.8500
+   1012.6398   1486.7700     34.9600      4.8500
+   1012.7699   1486.7700     34.9600      4.8500
+   1012.8999   1486.7700     34.9600      4.8500
+   1013.0300   1486.7700     34.9600      4.8500
+   1013.1600   1486.7700     34.9600      4.8500
+   1013.2901   1486.7700     34.9600      4.8500
+   1013.4201   1486.7700     34.9700      4.8500
+   1013.5502   1486.7700     34.9700      4.8500
+   1013.6802   1486.7700     34.9700      4.8500
+   1013.8102   1486.7700     34.9700      4.8500
+   1013.9402   1486.7600     34.9700      4.8500
+   1014.0703   1486.7600     34.9700      4.8500
+   1014.2004   1486.7600     34.9700      4.8400
+   1014.3304   1486.7600     34.9700      4.8400
+   1014.4604   1486.7600     34.9700      4.8400
+   1014.5905   1486.7600     34.9700      4.8400
+   1014.7205   1486.7600     34.9700      4.8400
+   1014.8505   1486.7600     34.9800      4.8400
+   1014.9806   1486.7600     34.9700      4.8400
+   1015.1107   1486.7600     34.9700      4.8400
+   1015.2406   1486.7600     34.9700      4.8400
+   1015.3707   1486.7600     34.9800      4.8400
+   1015.5007   1486.7600     34.9800      4.8400
+   1015.6308   1486.7600     34.9800      4.8400
+   1015.7607   1486.7700     34.9800      4.8400
+   1015.8908   1486.7600     34.9800      4.8400
+   1016.0209   1486.7700     34.9800      4.8400
+   1016.1508   1486.7700     34.9800      4.8400
+   1016.2809   1486.7600     34.9800      4.8400
+   1016.4109   1486.7500     34.9700      4.8300
+   1016.5410   1486.7500     34.9700      4.8300
+   1016.6709   1486.7500     34.9700      4.8300
+   1016.8010   1486.7400     34.9700      4.8300
+   1016.9310   1486.7400     34.9700      4.8300
+   1017.0610   1486.7400     34.9700      4.8300
+   1017.1910   1486.7300     34.9700      4.8300
+   1017.3210   1486.7300     34.9700      4.8300
+   1017.4511   1486.7400     34.9700      4.8300
+   1017.5811   1486.7400     34.9700      4.8300
+   1017.7111   1486.7400     34.9700      4.8300
+   1017.8411   1486.7400     34.9700      4.8300
+   1017.9711   1486.7500     34.9700      4.8300
+   1018.1011   1486.7500     34.9700      4.8300
+   1018.2311   1486.7500     34.9700      4.8300
+   1018.3611   1486.7500     34.9700      4.8200
+   1018.4911   1486.7500     34.9700      4.8200
+   1018.6212   1486.7500     34.9700      4.8200
+   1018.7512   1486.7500     34.9700      4.8200
+   1018.8812   1486.7500     34.9700      4.8200
+   1019.0111   1486.7500     34.9700      4.8200
+   1019.1412   1486.7500     34.9700      4.8200
+   1019.2712   1486.7500     34.9700      4.8200
+   1019.4011   1486.7500     34.9700      4.8200
+   1019.5311   1486.7500     34.9700      4.8200
+   1019.6612   1486.7500     34.9700      4.8200
+   1019.7912   1486.7500     34.9700      4.8200
+   1019.9211   1486.7500     34.9700      4.8200
+   1020.0511   1486.7500     34.9800      4.8200
+   1020.1812   1486.7500     34.9700      4.8200
+   1020.3111   1486.7500     34.9800      4.8200
+   1020.4411   1486.7600     34.9800      4.8200
+   1020.5711   1486.7600     34.9800      4.8200
+   1020.7012   1486.7600     34.9800      4.8200
+   1020.8311   1486.7600     34.9800      4.8200
+   1020.9611   1486.7600     34.9800      4.8200
+   1021.0911   1486.7700     34.9800      4.8200
+   1021.2210   1486.7700     34.9800      4.8200
+   1021.3510   1486.7700     34.9800      4.8200
+   1021.4810   1486.7700     34.9800      4.8200
+   1021.6111   1486.7700     34.9800      4.8200
+   1021.7410   1486.7700     34.9800      4.8200
+   1021.8710   1486.7700     34.9800      4.8200
+   1022.0010   1486.7800     34.9800      4.8200
+   1022.1310   1486.7800     34.9800      4.8200
+   1022.2609   1486.7800     34.9700      4.8200
+   1022.3909   1486.7800     34.9700      4.8200
+   1022.5209   1486.7800     34.9700      4.8200
+   1022.6508   1486.7800     34.9700      4.8200
+   1022.7808   1486.7800     34.9700      4.8200
+   1022.9108   1486.7700     34.9700      4.8100
+   1023.0408   1486.7700     34.9700      4.8100
+   1023.1707   1486.7700     34.9600      4.8100
+   1023.3007   1486.7700     34.9700      4.8100
+   1023.4307   1486.7700     34.9700      4.8100
+   1023.5606   1486.7600     34.9700      4.8100
+   1023.6906   1486.7600     34.9700      4.8100
+   1023.8206   1486.7600     34.9700      4.8100
+   1023.9506   1486.7600     34.9700      4.8100
+   1024.0804   1486.7700     34.9700      4.8100
+   1024.2104   1486.7700     34.9700      4.8100
+   1024.3405   1465.9100     34.9700      0.0000
+   1025.5100   1441.5900      0.0000      4.8000
+   1025.6400   1441.5900      0.0000      4.8000
+   1025.7700   1441.5900      0.0000      4.8000
+   1025.8999   1486.7900     34.9700      4.8000
+   1026.0299   1486.7900     34.9700      4.8000
+   1026.1598   1486.7900     34.9800      4.8000
+   1026.2898   1486.7800     34.9800      4.8000
+   1026.4197   1486.7900     34.9800      4.8000
+   1026.5497   1486.7800     34.9800      4.8000
+   1026.6797   1486.7900     34.9800      4.8000
+   1026.8096   1486.7900     34.9800      4.8000
+   1026.9395   1486.7900     34.9800      4.8000
+   1027.0695   1486.7900     34.9800      4.8000
+   1027.1995   1486.7900     34.9800      4.8000
+   1027.3293   1486.7900     34.9800      4.8000
+   1027.4592   1486.7900     34.9800      4.8000
+   1027.5892   1486.7900     34.9700      4.8000
+   1027.7191   1486.7900     34.9800      4.8000
+   1027.8490   1486.7900     34.9700      4.8000
+   1027.9790   1486.7900     34.9700      4.8000
+   1028.1090   1486.7800     34.9700      4.7900
+   1028.2389   1486.7800     34.9700      4.7900
+   1028.3688   1486.7800     34.9700      4.7900
+   1028.4988   1486.7800     34.9600      4.7900
+   1028.6287   1486.7800     34.9700      4.7900
+   1028.7585   1486.7800     34.9700      4.7900
+   1028.8885   1486.7800     34.9700      4.7900
+   1029.0184   1486.7700     34.9700      4.7900
+   1029.1483   1486.7700     34.9700      4.7900
+   1029.2783   1486.7800     34.9700      4.7900
+   1029.4082   1486.7800     34.9700      4.7900
+   1029.5382   1486.7700     34.9700      4.7900
+   1029.6681   1486.7800     34.9700      4.7900
+   1029.7980   1486.7800     34.9700      4.7900
+   1029.9280   1486.7800     34.9700      4.7900
+   1030.0577   1486.7800     34.9700      4.7900
+   1030.1877   1486.7900     34.9700      4.7900
+   1030.3176   1486.7900     34.9700      4.7900
+   1030.4476   1486.7900     34.9700      4.7900
+   1030.5775   1486.7900     34.9700      4.7900
+   1030.7074   1486.7900     34.9700      4.7900
+   1030.8374   1486.7900     34.9700      4.7900
+   1030.9672   1486.8000     34.9700      4.7900
+   1031.0972   1486.8000     34.9700      4.7900
+   1031.2271   1486.8000     34.9700      4.7900
+   1031.3571   1466.0200     34.9700      0.0000
+   1032.5261   1441.5800      0.0000      4.7800
+   1032.6560   1441.5800      0.0000      4.7800
+   1032.7860   1441.5800      0.0000      4.7800
+   1032.9158   1486.7800     34.9600      4.7800
+   1033.0457   1486.7800     34.9600      4.7700
+   1033.1757   1486.7800     34.9600      4.7700
+   1033.3054   1486.7800     34.9600      4.7700
+   1033.4354   1486.7800     34.9600      4.7700
+   1033.5653   1486.7900     34.9600      4.7700
+   1033.6952   1486.7900     34.9600      4.7700
+   1033.8251   1486.7900     34.9600      4.7700
+   1033.9550   1486.7900     34.9600      4.7700
+   1034.0848   1486.8000     34.9600      4.7700
+   1034.2147   1486.8000     34.9600      4.7800
+   1034.3446   1486.8000     34.9600      4.7800
+   1034.4745   1486.8000     34.9600      4.7800
+   1034.6044   1486.8000     34.9600      4.7700
+   1034.7343   1486.8000     34.9600      4.7700
+   1034.8641   1486.8100     34.9600      4.7700
+   1034.9940   1486.8100     34.9600      4.7700
+   1035.1240   1486.8000     34.9600      4.7700
+   1035.2538   1466.0800     34.9700      0.0000
+   1036.4227   1441.6000      0.0000      4.7700
+   1036.5525   1441.6100      0.0000      4.7700
+   1036.6824   1441.6100      0.0000      4.7700
+   1036.8123   1486.8300     34.9700      4.7700
+   1036.9421   1486.8300     34.9700      4.7700
+   1037.0720   1486.8300     34.9700      4.7700
+   1037.2019   1486.8300     34.9700      4.7700
+   1037.3318   1486.8300     34.9700      4.7700
+   1037.4615   1486.8300     34.9700      4.7700
+   1037.5914   1486.8400     34.9700      4.7700
+   1037.7213   1486.8400     34.9700      4.7700
+   1037.8512   1486.8400     34.9700      4.7700
+   1037.9810   1486.8300     34.9700      4.7700
+   1038.1108   1486.8300     34.9700      4.7700
+   1038.2407   1486.8300     34.9700      4.7700
+   1038.3706   1486.8400     34.9700      4.7700
+   1038.5005   1486.8400     34.9700      4.7700
+   1038.6304   1486.8400     34.9700      4.7700
+   1038.7603   1486.8400     34.9700      4.7700
+   1038.8900   1486.8400     34.9700      4.7600
+   1039.0199   1486.8400     34.9700      4.7600
+   1039.1498   1486.8400     34.9700      4.7600
+   1039.2797   1486.8500     34.9700      4.7600
+   1039.4094   1486.8500     34.9700      4.7600
+   1039.5393   1486.8500     34.9700      4.7600
+   1039.6692   1486.8500     34.9700      4.7600
+   1039.7990   1486.8500     34.9700      4.7600
+   1039.9288   1486.8500     34.9700      4.7600
+   1040.0587   1486.8600     34.9700      4.7600
+   1040.1885   1486.8600     34.9700      4.7600
+   1040.3184   1486.8700     34.9700      4.7600
+   1040.4481   1486.8700     34.9700      4.7600
+   1040.5780   1486.8700     34.9700      4.7600
+   1040.7078   1486.8800     34.9700      4.7700
+   1040.8376   1486.8800     34.9700      4.7700
+   1040.9675   1486.8800     34.9700      4.7700
+   1041.0974   1466.1800     34.9700      0.0000
+   1042.2659   1441.6900      0.0000      4.7700
+   1042.3956   1441.7000      0.0000      4.7700
+   1042.5255   1441.7000      0.0000      4.7700
+   1042.6553   1486.9100     34.9700      4.7700
+   1042.7852   1486.9100     34.9700      4.7700
+   1042.9149   1486.9100     34.9700      4.7700
+   1043.0447   1486.9200     34.9700      4.7700
+   1043.1746   1486.9200     34.9700      4.7700
+   1043.3044   1486.9200     34.9700      4.7700
+   1043.4342   1486.9200     34.9700      4.7700
+   1043.5640   1486.9200     34.9700      4.7700
+   1043.6938   1486.9200     34.9700      4.7600
+   1043.8237   1486.9200     34.9700      4.7600
+   1043.9534   1486.9200     34.9700      4.7600
+   1044.0833   1486.9200     34.9700      4.7600
+   1044.2131   1486.9200     34.9700      4.7600
+   1044.3429   1486.9200     34.9700      4.7600
+   1044.4727   1486.9200     34.9700      4.7600
+   1044.6025   1486.9200     34.9700      4.7600
+   1044.7323   1486.9100     34.9800      4.7600
+   1044.8622   1486.9200     34.9800      4.7600
+   1044.9919   1486.9200     34.9800      4.7600
+   1045.1217   1486.9200     34.9800      4.7600
+   1045.2516   1486.9200     34.9800      4.7600
+   1045.3813   1486.9200     34.9800      4.7600
+   1045.5111   1486.9300     34.9800      4.7600
+   1045.6410   1486.9300     34.9800      4.7600
+   1045.7708   1486.9300     34.9800      4.7600
+   1045.9005   1486.9300     34.9700      4.7600
+   1046.0304   1486.9300     34.9700      4.7600
+   1046.1602   1486.9300     34.9700      4.7600
+   1046.2899   1486.9300     34.9700      4.7600
+   1046.4197   1486.9300     34.9700      4.7600
+   1046.5496   1486.9300     34.9700      4.7600
+   1046.6793   1486.9300     34.9700      4.7600
+   1046.8091   1486.9400     34.9700      4.7600
+   1046.9388   1466.2800     34.9700      0.0000
+   1048.8856   1441.7100      0.0000      4.7500
+   1049.0155   1441.7100      0.0000      4.7500
+   1049.1451   1441.7100      0.0000      4.7500
+   1049.2749   1486.9400     34.9700      4.7500
+   1049.4048   1486.9400     34.9700      4.7500
+   1049.5344   1486.9400     34.9700      4.7500
+   1049.6643   1486.9400     34.9700      4.7500
+   1049.7941   1486.9400     34.9700      4.7500
+   1049.9238   1486.9500     34.9700      4.7500
+   1050.0536   1486.9500     34.9700      4.7500
+   1050.1833   1486.9500     34.9700      4.7500
+   1050.3131   1486.9500     34.9700      4.7500
+   1050.4429   1486.9500     34.9700      4.7500
+   1050.5726   1486.9600     34.9700      4.7500
+   1050.7024   1486.9600     34.9700      4.7500
+   1050.8322   1486.9600     34.9700      4.7500
+   1050.9619   1486.9600     34.9700      4.7500
+   1051.0917   1486.9600     34.9700      4.7500
+   1051.2214   1486.9700     34.9700      4.7500
+   1051.3512   1486.9700     34.9700      4.7500
+   1051.4810   1486.9700     34.9700      4.7500
+   1051.6107   1486.9700     34.9700      4.7500
+   1051.7405   1486.9800     34.9700      4.7500
+   1051.8701   1486.9800     34.9700      4.7500
+   1052.0000   1486.9800     34.9700      4.7500
+   1052.1298   1486.9800     34.9700      4.7500
+   1052.2595   1486.9800     34.9700      4.7500
+   1052.3892   1466.3700     34.9700      0.0000
+   1053.5569   1441.7700      0.0000      4.7400
+   1053.6866   1441.7700      0.0000      4.7400
+   1053.8164   1441.7700      0.0000      4.7400
+   1053.9462   1486.9900     34.9700      4.7400
+   1054.0759   1486.9900     34.9700      4.7400
+   1054.2056   1486.9900     34.9700      4.7400
+   1054.3353   1486.9900     34.9700      4.7400
+   1054.4651   1486.9900     34.9800      4.7400
+   1054.5948   1486.9900     34.9800      4.7400
+   1054.7245   1487.0000     34.9800      4.7400
+   1054.8542   1487.0000     34.9800      4.7400
+   1054.9840   1487.0000     34.9800      4.7400
+   1055.1136   1487.0000     34.9800      4.7400
+   1055.2434   1487.0000     34.9800      4.7400
+   1055.3732   1487.0100     34.9800      4.7400
+   1055.5029   1487.0100     34.9800      4.7400
+   1055.6326   1487.0100     34.9800      4.7400
+   1055.7623   1487.0100     34.9800      4.7400
+   1055.8921   1487.0100     34.9800      4.7400
+   1056.0217   1487.0200     34.9800      4.7400
+   1056.1515   1487.0200     34.9800      4.7400
+   1056.2812   1487.0200     34.9800      4.7400
+   1056.4110   1487.0200     34.9700      4.7400
+   1056.5406   1487.0200     34.9700      4.7400
+   1056.6703   1487.0200     34.9700      4.7400
+   1056.8000   1487.0200     34.9700      4.7400
+   1056.9297   1487.0200     34.9700      4.7400
+   1057.0594   1487.0200     34.9700      4.7400
+   1057.1892   1487.0200     34.9700      4.7400
+   1057.3190   1487.0200     34.9600      4.7400
+   1057.4486   1487.0200     34.9600      4.7400
+   1057.5784   1487.0300     34.9600      4.7400
+   1057.7080   1487.0300     34.9600      4.7400
+   1057.8378   1487.0300     34.9600      4.7400
+   1057.9674   1487.0300     34.9600      4.7400
+   1058.0972   1487.0300     34.9600      4.7400
+   1058.2269   1487.0300     34.9600      4.7400
+   1058.3566   1487.0300     34.9600      4.7400
+   1058.4862   1487.0300     34.9600      4.7300
+   1058.6160   1487.0300     34.9600      4.7300
+   1058.7457   1487.0300     34.9600      4.7300
+   1058.8754   1487.0300     34.9600      4.7300
+   1059.0051   1487.0300     34.9700      4.7300
+   1059.1348   1487.0200     34.9700      4.7300
+   1059.2644   1487.0200     34.9700      4.7300
+   1059.3942   1487.0200     34.9700      4.7300
+   1059.5238   1487.0200     34.9700      4.7300
+   1059.6536   1487.0300     34.9700      4.7300
+   1059.7832   1487.0300     34.9700      4.7300
+   1059.9130   1487.0300     34.9700      4.7300
+   1060.0426   1487.0300     34.9700      4.7300
+   1060.1722   1487.0300     34.9700      4.7300
+   1060.3020   1487.0300     34.9700      4.7300
+   1060.4316   1487.0400     34.9700      4.7300
+   1060.5614   1487.0400     34.9700      4.7300
+   1060.6910   1487.0400     34.9700      4.7300
+   1060.8207   1487.0400     34.9700      4.7300
+   1060.9504   1487.0400     34.9700      4.7300
+   1061.0802   1487.0500     34.9700      4.7300
+   1061.2097   1487.0500     34.9700      4.7300
+   1061.3395   1487.0500     34.9700      4.7300
+   1061.4691   1487.0500     34.9700      4.7300
+   1061.5988   1487.0600     34.9700      4.7300
+   1061.7285   1487.0600     34.9700      4.7300
+   1061.8582   1487.0600     34.9700      4.7300
+   1061.9879   1487.0600     34.9700      4.7300
+   1062.1176   1487.0600     34.9700      4.7300
+   1062.2472   1487.0700     34.9700      4.7300
+   1062.3770   1487.0700     34.9700      4.7300
+   1062.5065   1487.0700     34.9700      4.7300
+   1062.6362   1487.0700     34.9700      4.7300
+   1062.7659   1487.0700     34.9700      4.7300
+   1062.8956   1487.0800     34.9700      4.7300
+   1063.0251   1487.0800     34.9700      4.7300
+   1063.1549   1487.0800     34.9700      4.7300
+   1063.2845   1487.0800     34.9600      4.7300
+   1063.4142   1487.0800     34.9600      4.7300
+   1063.5438   1487.0900     34.9600      4.7300
+   1063.6736   1487.0900     34.9600      4.7300
+   1063.8032   1487.0900     34.9600      4.7300
+   1063.9329   1487.0900     34.9600      4.7300
+   1064.0625   1487.0900     34.9600      4.7300
+   1064.1923   1487.1000     34.9600      4.7300
+   1064.3219   1487.1000     34.9600      4.7300
+   1064.4514   1487.1000     34.9600      4.7300
+   1064.5812   1487.1000     34.9600      4.7300
+   1064.7108   1487.1000     34.9600      4.7300
+   1064.8405   1487.1000     34.9600      4.7200
+   1064.9701   1487.1000     34.9700      4.7200
+   1065.0997   1487.0900     34.9600      4.7200
+   1065.2295   1466.5800     34.9700      0.0000
+   1066.3962   1441.8500      0.0000      4.7200
+   1066.5259   1441.8600      0.0000      4.7200
+   1066.6554   1441.8600      0.0000      4.7200
+   1066.7852   1487.0900     34.9600      4.7200
+   1066.9148   1487.0900     34.9600      4.7200
+   1067.0444   1487.0900     34.9600      4.7200
+   1067.1741   1487.1000     34.9600      4.7200
+   1067.3037   1487.1000     34.9600      4.7200
+   1067.4333   1487.1000     34.9600      4.7200
+   1067.5630   1487.1000     34.9600      4.7200
+   1067.6925   1487.1100     34.9600      4.7200
+   1067.8223   1487.1100     34.9600      4.7200
+   1067.9519   1487.1100     34.9600      4.7200
+   1068.0814   1487.1100     34.9600      4.7200
+   1068.2111   1487.1100     34.9600      4.7100
+   1068.3407   1487.1100     34.9600      4.7100
+   1068.4703   1487.1100     34.9600      4.7100
+   1068.6000   1487.1000     34.9600      4.7100
+   1068.7296   1487.1000     34.9600      4.7100
+   1068.8593   1487.1000     34.9600      4.7100
+   1068.9888   1487.1000     34.9600      4.7100
+   1069.1184   1487.1000     34.9600      4.7100
+   1069.2480   1487.1000     34.9600      4.7100
+   1069.3777   1487.1000     34.9600      4.7100
+   1069.5073   1487.1000     34.9600      4.7100
+   1069.6370   1487.1100     34.9600      4.7100
+   1069.7666   1487.1100     34.9600      4.7100
+   1069.8961   1487.1100     34.9600      4.7100
+   1070.0258   1487.1100     34.9600      4.7100
+   1070.1554   1487.1100     34.9600      4.7100
+   1070.2850   1487.1200     34.9600      4.7100
+   1070.4146   1487.1200     34.9600      4.7100
+   1070.5442   1487.1200     34.9600      4.7100
+   1070.6738   1487.1200     34.9600      4.7100
+   1070.8035   1487.1200     34.9600      4.7100
+   1070.9330   1487.1300     34.9600      4.7100
+   1071.0626   1487.1300     34.9600      4.7100
+   1071.1923   1487.1300     34.9600      4.7100
+   1071.3218   1487.1300     34.9600      4.7100
+   1071.4514   1487.1300     34.9600      4.7100
+   1071.5811   1487.1300     34.9600      4.7000
+   1071.7107   1487.1300     34.9700      4.7000
+   1071.8402   1487.1300     34.9700      4.7000
+   1071.9698   1487.1300     34.9700      4.7000
+   1072.0995   1487.1200     34.9700      4.7000
+   1072.2290   1487.1200     34.9700      4.7000
+   1072.3586   1487.1200     34.9700      4.7000
+   1072.4883   1487.1300     34.9700      4.7000
+   1072.6179   1487.1200     34.9700      4.7000
+   1072.7474   1487.1300     34.9700      4.7000
+   1072.8771   1487.1300     34.9700      4.7000
+   1073.0066   1487.1300     34.9700      4.7000
+   1073.1361   1487.1300     34.9700      4.7000
+   1073.2657   1487.1400     34.9700      4.7000
+   1073.3954   1487.1400     34.9700      4.7000
+   1073.5250   1487.1400     34.9700      4.7000
+   1073.6545   1487.1400     34.9700      4.7000
+   1073.7842   1487.1500     34.9700      4.7000
+   1073.9137   1487.1500     34.9700      4.7000
+   1074.0433   1487.1500     34.9700      4.7000
+   1074.1729   1487.1500     34.9700      4.7000
+   1074.3025   1487.1500     34.9700      4.7000
+   1074.4321   1487.1500     34.9700      4.7000
+   1074.5616   1487.1500     34.9700      4.7000
+   1074.6912   1487.1600     34.9700      4.7000
+   1074.8208   1487.1600     34.9700      4.7000
+   1074.9504   1487.1600     34.9700      4.7000
+   1075.0800   1466.7500     34.9700      0.0000
+   1078.0599   1441.9100      0.0000      4.6900
+   1078.1895   1441.9100      0.0000      4.6900
+   1078.3190   1441.9100      0.0000      4.6900
+   1078.4486   1487.1700     34.9600      4.6900
+   1078.5781   1487.1700     34.9600      4.6900
+   1078.7076   1487.1700     34.9600      4.6900
+   1078.8372   1487.1800     34.9600      4.6900
+   1078.9668   1487.1800     34.9600      4.6900
+   1079.0963   1487.1800     34.9600      4.6900
+   1079.2258   1487.1800     34.9600      4.6900
+   1079.3553   1487.1800     34.9600      4.6900
+   1079.4850   1487.1900     34.9600      4.6900
+   1079.6144   1487.1900     34.9600      4.6900
+   1079.7440   1487.1900     34.9600      4.6900
+   1079.8735   1487.1900     34.9600      4.6900
+   1080.0031   1487.1900     34.9600      4.6900
+   1080.1326   1487.2000     34.9600      4.6900
+   1080.2621   1487.2000     34.9600      4.6900
+   1080.3917   1487.2000     34.9600      4.6900
+   1080.5212   1487.2000     34.9600      4.6900
+   1080.6508   1487.2000     34.9600      4.6900
+   1080.7803   1466.8300     34.9600      0.0000
+   1081.9459   1441.9500      0.0000      4.6800
+   1082.0756   1441.9600      0.0000      4.6800
+   1082.2051   1441.9700      0.0000      4.6800
+   1082.3346   1487.2200     34.9600      4.6800
+   1082.4641   1487.2200     34.9600      4.6800
+   1082.5936   1487.2200     34.9600      4.6800
+   1082.7231   1487.2200     34.9700      4.6800
+   1082.8525   1487.2200     34.9700      4.6800
+   1082.9822   1487.2200     34.9700      4.6800
+   1083.1117   1487.2200     34.9700      4.6800
+   1083.2412   1487.2200     34.9700      4.6800
+   1083.3706   1487.2200     34.9700      4.6800
+   1083.5002   1487.2200     34.9700      4.6800
+   1083.6298   1487.2200     34.9700      4.6800
+   1083.7593   1487.2300     34.9700      4.6800
+   1083.8887   1487.2300     34.9700      4.6800
+   1084.0182   1487.2300     34.9700      4.6800
+   1084.1478   1487.2300     34.9700      4.6800
+   1084.2772   1487.2300     34.9700      4.6800
+   1084.4067   1487.2400     34.9700      4.6800
+   1084.5363   1487.2400     34.9700      4.6800
+   1084.6658   1487.2400     34.9700      4.6800
+   1084.7952   1487.2400     34.9700      4.6800
+   1084.9248   1487.2500     34.9700      4.6800
+   1085.0543   1487.2500     34.9700      4.6800
+   1085.1837   1487.2500     34.9700      4.6800
+   1085.3132   1487.2500     34.9700      4.6800
+   1085.4427   1487.2500     34.9700      4.6800
+   1085.5723   1487.2600     34.9700      4.6800
+   1085.7017   1487.2600     34.9700      4.6800
+   1085.8312   1487.2600     34.9700      4.6800
+   1085.9607   1487.2600     34.9700      4.6800
+   1086.0902   1487.2600     34.9700      4.6800
+   1086.2197   1487.2700     34.9700      4.6800
+   1086.3492   1487.2700     34.9700      4.6800
+   1086.4788   1487.2700     34.9700      4.6800
+   1086.6082   1487.2700     34.9700      4.6800
+   1086.7377   1487.2700     34.9700      4.6800
+   1086.8672   1487.2700     34.9700      4.6800
+   1086.9967   1487.2700     34.9700      4.6800
+   1087.1261   1487.2700     34.9600      4.6800
+   1087.2556   1487.2700     34.9600      4.6800
+   1087.3851   1487.2700     34.9600      4.6800
+   1087.5145   1487.2700     34.9600      4.6800
+   1087.6440   1487.2800     34.9600      4.6800
+   1087.7736   1487.2800     34.9600      4.6800
+   1087.9030   1487.2800     34.9600      4.6800
+   1088.0325   1487.2800     34.9600      4.6800
+   1088.1619   1487.2800     34.9600      4.6800
+   1088.2914   1487.2900     34.9600      4.6800
+   1088.4208   1487.2900     34.9600      4.6700
+   1088.5503   1487.2900     34.9700      4.6700
+   1088.6798   1487.2900     34.9700      4.6700
+   1088.8093   1487.2900     34.9700      4.6700
+   1088.9387   1487.2900     34.9700      4.6700
+   1089.0682   1487.3000     34.9700      4.6700
+   1089.1978   1487.3000     34.9700      4.6700
+   1089.3271   1487.3000     34.9700      4.6700
+   1089.4565   1487.3000     34.9700      4.6700
+   1089.5861   1487.3100     34.9700      4.6700
+   1089.7156   1487.3000     34.9700      4.6700
+   1089.8450   1487.3000     34.9700      4.6700
+   1089.9745   1487.3100     34.9700      4.6700
+   1090.1040   1487.3100     34.9700      4.6700
+   1090.2334   1487.3100     34.9700      4.6700
+   1090.3628   1487.3100     34.9700      4.6700
+   1090.4923   1487.3000     34.9600      4.6700
+   1090.6218   1487.3100     34.9700      4.6700
+   1090.7512   1487.3000     34.9600      4.6700
+   1090.8806   1487.3100     34.9700      4.6700
+   1091.0101   1487.3100     34.9700      4.6700
+   1091.1396   1487.3000     34.9700      4.6700
+   1091.2690   1487.3100     34.9700      4.6700
+   1091.3984   1487.3100     34.9700      4.6700
+   1091.5280   1487.3100     34.9700      4.6700
+   1091.6573   1487.3200     34.9700      4.6700
+   1091.7867   1487.3200     34.9700      4.6700
+   1091.9163   1487.3200     34.9700      4.6700
+   1092.0458   1467.0300     34.9700      0.0000
+   1093.9872   1442.0500      0.0000      4.6600
+   1094.1167   1442.0500      0.0000      4.6600
+   1094.2461   1442.0400      0.0000      4.6600
+   1094.3756   1487.3200     34.9700      4.6600
+   1094.5050   1487.3200     34.9700      4.6600
+   1094.6344   1487.3200     34.9700      4.6600
+   1094.7638   1487.3200     34.9700      4.6600
+   1094.8932   1487.3300     34.9700      4.6600
+   1095.0227   1487.3300     34.9700      4.6600
+   1095.1521   1487.3300     34.9700      4.6600
+   1095.2815   1487.3300     34.9700      4.6600
+   1095.4109   1487.3400     34.9700      4.6600
+   1095.5404   1487.3400     34.9700      4.6600
+   1095.6698   1487.3400     34.9700      4.6600
+   1095.7992   1487.3400     34.9700      4.6600
+   1095.9286   1487.3400     34.9700      4.6600
+   1096.0580   1487.3500     34.9700      4.6600
+   1096.1875   1487.3500     34.9700      4.6600
+   1096.3168   1487.3500     34.9700      4.6600
+   1096.4463   1487.3500     34.9700      4.6600
+   1096.5757   1487.3500     34.9700      4.6600
+   1096.7051   1487.3600     34.9700      4.6600
+   1096.8345   1487.3600     34.9700      4.6600
+   1096.9639   1487.3600     34.9700      4.6600
+   1097.0934   1487.3600     34.9700      4.6600
+   1097.2227   1487.3600     34.9700      4.6600
+   1097.3521   1487.3700     34.9700      4.6600
+   1097.4816   1487.3700     34.9700      4.6600
+   1097.6110   1487.3700     34.9700      4.6600
+   1097.7402   1487.3700     34.9700      4.6600
+   1097.8698   1487.3700     34.9700      4.6600
+   1097.9991   1487.3800     34.9700      4.6600
+   1098.1284   1487.3800     34.9700      4.6600
+   1098.2579   1487.3800     34.9700      4.6600
+   1098.3873   1487.3800     34.9700      4.6600
+   1098.5167   1487.3800     34.9700      4.6600
+   1098.6461   1467.1300     34.9700      0.0000
+   1099.8107   1442.1200      0.0000      4.6600
+   1099.9401   1442.1200      0.0000      4.6600
+   1100.0693   1442.1300      0.0000      4.6600
+   1100.1987   1487.4100     34.9700      4.6600
+   1100.3281   1487.4100     34.9700      4.6600
+   1100.4575   1487.4100     34.9700      4.6600
+   1100.5869   1487.4100     34.9700      4.6500
+   1100.7163   1487.4000     34.9700      4.6500
+   1100.8457   1487.4000     34.9700      4.6500
+   1100.9750   1487.4000     34.9700      4.6500
+   1101.1044   1487.3900     34.9700      4.6500
+   1101.2338   1487.3900     34.9600      4.6500
+   1101.3632   1487.3900     34.9600      4.6500
+   1101.4926   1487.3900     34.9600      4.6500
+   1101.6219   1487.3900     34.9600      4.6500
+   1101.7513   1487.3800     34.9600      4.6500
+   1101.8806   1487.3800     34.9600      4.6500
+   1102.0100   1487.3800     34.9600      4.6400
+   1102.1394   1487.3800     34.9600      4.6400
+   1102.2687   1487.3900     34.9600      4.6400
+   1102.3981   1487.3800     34.9600      4.6400
+   1102.5275   1487.3900     34.9600      4.6400
+   1102.6569   1487.3800     34.9600      4.6400
+   1102.7861   1487.3800     34.9600      4.6400
+   1102.9155   1467.2000     34.9600      0.0000
+   1104.0798   1442.0800      0.0000      4.6300
+   1104.2091   1442.0800      0.0000      4.6300
+   1104.3385   1442.0800      0.0000      4.6300
+   1104.4679   1467.2300     34.9700      0.0000
+   1105.6320   1442.0800      0.0000      4.6300
+   1105.7612   1442.0700      0.0000      4.6300
+   1105.8906   1442.0700      0.0000      4.6200
+   1106.0199   1487.3600     34.9600      4.6200
+   1106.1493   1487.3600     34.9600      4.6200
+   1106.2787   1487.3600     34.9600      4.6200
+   1106.4080   1487.3600     34.9600      4.6200
+   1106.5372   1487.3600     34.9700      4.6200
+   1106.6666   1487.3600     34.9700      4.6200
+   1106.7960   1487.3600     34.9700      4.6200
+   1106.9253   1487.3600     34.9700      4.6200
+   1107.0546   1487.3700     34.9700      4.6200
+   1107.1840   1487.3700     34.9700      4.6200
+   1107.3134   1487.3700     34.9700      4.6200
+   1107.4426   1487.3700     34.9700      4.6200
+   1107.5719   1487.3700     34.9700      4.6200
+   1107.7013   1487.3800     34.9700      4.6200
+   1107.8306   1487.3800     34.9700      4.6200
+   1107.9598   1487.3800     34.9700      4.6200
+   1108.0892   1487.3800     34.9700      4.6200
+   1108.2186   1487.3800     34.9700      4.6200
+   1108.3478   1487.3900     34.9700      4.6200
+   1108.4772   1487.3900     34.9700      4.6200
+   1108.6066   1487.3900     34.9700      4.6200
+   1108.7357   1487.3900     34.9700      4.6200
+   1108.8651   1487.3900     34.9700      4.6200
+   1108.9945   1487.4000     34.9700      4.6200
+   1109.1238   1487.4000     34.9700      4.6200
+   1109.2531   1487.4000     34.9700      4.6200
+   1109.3823   1487.4000     34.9700      4.6200
+   1109.5117   1487.4100     34.9700      4.6200
+   1109.6410   1487.4100     34.9700      4.6200
+   1109.7703   1487.4100     34.9700      4.6200
+   1109.8997   1487.4100     34.9700      4.6200
+   1110.0289   1487.4100     34.9700      4.6200
+   1110.1582   1487.4200     34.9700      4.6200
+   1110.2875   1487.4200     34.9700      4.6200
+   1110.4169   1487.4200     34.9700      4.6200
+   1110.5461   1487.4200     34.9700      4.6200
+   1110.6754   1487.4200     34.9700      4.6200
+   1110.8048   1487.4300     34.9700      4.6200
+   1110.9341   1487.4300     34.9700      4.6200
+   1111.0634   1487.4300     34.9700      4.6200
+   1111.1926   1487.4300     34.9700      4.6200
+   1111.3219   1487.4300     34.9700      4.6200
+   1111.4513   1487.4400     34.9700      4.6200
+   1111.5806   1487.4400     34.9700      4.6200
+   1111.7098   1487.4400     34.9700      4.6200
+   1111.8391   1487.4400     34.9700      4.6200
+   1111.9684   1487.4400     34.9700      4.6200
+   1112.0977   1487.4500     34.9700      4.6200
+   1112.2271   1487.4500     34.9700      4.6200
+   1112.3563   1487.4500     34.9700      4.6200
+   1112.4856   1487.4500     34.9700      4.6200
+   1112.6149   1487.4500     34.9700      4.6200
+   1112.7441   1487.4600     34.9600      4.6200
+   1112.8735   1487.4600     34.9600      4.6200
+   1113.0027   1487.4600     34.9600      4.6200
+   1113.1320   1487.4600     34.9600      4.6200
+   1113.2614   1487.4600     34.9600      4.6200
+   1113.3905   1487.4700     34.9600      4.6200
+   1113.5198   1487.4700     34.9600      4.6200
+   1113.6492   1487.4700     34.9600      4.6200
+   1113.7784   1487.4700     34.9600      4.6200
+   1113.9077   1487.4800     34.9600      4.6200
+   1114.0370   1487.4800     34.9600      4.6200
+   1114.1663   1487.4800     34.9600      4.6200
+   1114.2954   1487.4800     34.9600      4.6200
+   1114.4248   1487.4800     34.9600      4.6200
+   1114.5541   1487.4900     34.9600      4.6200
+   1114.6833   1487.4900     34.9600      4.6200
+   1114.8126   1487.4900     34.9600      4.6200
+   1114.9419   1487.4900     34.9600      4.6200
+   1115.0712   1487.4900     34.9600      4.6200
+   1115.2003   1487.5000     34.9600      4.6200
+   1115.3296   1487.5000     34.9600      4.6200
+   1115.4590   1487.5000     34.9600      4.6200
+   1115.5883   1487.5000     34.9600      4.6200
+   1115.7174   1487.5000     34.9600      4.6200
+   1115.8467   1487.5100     34.9600      4.6200
+   1115.9760   1487.5100     34.9600      4.6200
+   1116.1053   1487.5100     34.9600      4.6200
+   1116.2345   1487.5100     34.9600      4.6200
+   1116.3638   1487.5100     34.9600      4.6200
+   1116.4930   1487.5200     34.9600      4.6200
+   1116.6222   1487.5200     34.9600      4.6200
+   1116.7515   1487.5200     34.9600      4.6200
+   1116.8809   1487.5200     34.9600      4.6200
+   1117.0101   1487.5200     34.9600      4.6200
+   1117.1393   1487.5200     34.9600      4.6200
+   1117.2686   1487.5200     34.9600      4.6100
+   1117.3978   1487.5200     34.9700      4.6100
+   1117.5270   1487.5200     34.9700      4.6100
+   1117.6562   1487.5100     34.9700      4.6100
+   1117.7855   1487.5100     34.9700      4.6100
+   1117.9148   1487.5100     34.9700      4.6100
+   1118.0441   1487.5200     34.9700      4.6100
+   1118.1733   1487.5100     34.9700      4.6100
+   1118.3026   1487.5200     34.9700      4.6100
+   1118.4318   1487.5200     34.9700      4.6100
+   1118.5610   1487.5200     34.9700      4.6100
+   1118.6903   1487.5200     34.9700      4.6100
+   1118.8196   1487.5300     34.9700      4.6100
+   1118.9487   1487.5300     34.9700      4.6100
+   1119.0780   1487.5300     34.9700      4.6100
+   1119.2073   1487.5300     34.9700      4.6100
+   1119.3365   1487.5300     34.9700      4.6100
+   1119.4657   1487.5300     34.9700      4.6100
+   1119.5950   1487.5300     34.9700      4.6100
+   1119.7241   1487.5300     34.9700      4.6100
+   1119.8534   1487.5400     34.9700      4.6100
+   1119.9825   1487.5300     34.9600      4.6100
+   1120.1118   1487.5300     34.9600      4.6100
+   1120.2411   1487.5400     34.9600      4.6100
+   1120.3702   1487.5400     34.9600      4.6100
+   1120.4995   1487.5400     34.9600      4.6100
+   1120.6288   1487.5400     34.9600      4.6100
+   1120.7579   1487.5300     34.9600      4.6100
+   1120.8872   1487.5400     34.9600      4.6100
+   1121.0165   1487.5400     34.9600      4.6100
+   1121.1456   1487.5400     34.9600      4.6100
+   1121.2748   1487.5400     34.9600      4.6000
+   1121.4041   1487.5300     34.9600      4.6000
+   1121.5333   1487.5300     34.9600      4.6000
+   1121.6625   1487.5300     34.9600      4.6000
+   1121.7917   1487.5300     34.9600      4.6000
+   1121.9209   1487.5300     34.9600      4.6000
+   1122.0502   1487.5300     34.9600      4.6000
+   1122.1793   1487.5300     34.9600      4.6000
+   1122.3086   1487.5300     34.9600      4.6000
+   1122.4379   1487.5300     34.9600      4.6000
+   1122.5670   1487.5400     34.9600      4.6000
+   1122.6962   1487.5400     34.9600      4.6000
+   1122.8254   1487.5400     34.9600      4.6000
+   1122.9547   1487.5400     34.9600      4.6000
+   1123.0839   1487.5400     34.9600      4.6000
+   1123.2130   1487.5400     34.9600      4.6000
+   1123.3423   1487.5500     34.9600      4.6000
+   1123.4716   1487.5500     34.9600      4.6000
+   1123.6006   1487.5500     34.9600      4.6000
+   1123.7299   1487.5500     34.9600      4.6000
+   1123.8591   1487.5500     34.9600      4.6000
+   1123.9883   1487.5600     34.9600      4.6000
+   1124.1174   1487.5600     34.9600      4.6000
+   1124.2467   1487.5600     34.9600      4.6000
+   1124.3759   1487.5600     34.9600      4.6000
+   1124.5050   1487.5600     34.9600      4.6000
+   1124.6343   1487.5700     34.9600      4.6000
+   1124.7634   1487.5700     34.9600      4.6000
+   1124.8926   1487.5700     34.9600      4.6000
+   1125.0219   1467.5700     34.9600      0.0000
+   1126.9596   1442.2200      0.0000      4.5800
+   1127.0887   1442.2200      0.0000      4.5800
+   1127.2179   1442.2200      0.0000      4.5800
+   1127.3472   1487.5400     34.9600      4.5800
+   1127.4763   1487.5400     34.9600      4.5800
+   1127.6055   1487.5400     34.9600      4.5800
+   1127.7346   1487.5400     34.9600      4.5800
+   1127.8638   1487.5400     34.9600      4.5800
+   1127.9930   1487.5400     34.9600      4.5800
+   1128.1221   1487.5500     34.9600      4.5800
+   1128.2513   1487.5500     34.9600      4.5800
+   1128.3805   1487.5500     34.9600      4.5800
+   1128.5096   1487.5500     34.9600      4.5800
+   1128.6388   1487.5600     34.9600      4.5800
+   1128.7679   1487.5600     34.9600      4.5800
+   1128.8972   1487.5500     34.9600      4.5800
+   1129.0264   1487.5600     34.9600      4.5800
+   1129.1554   1487.5600     34.9600      4.5800
+   1129.2847   1487.5600     34.9600      4.5800
+   1129.4138   1487.5600     34.9600      4.5800
+   1129.5428   1487.5600     34.9600      4.5800
+   1129.6721   1487.5700     34.9600      4.5800
+   1129.8013   1487.5600     34.9600      4.5800
+   1129.9304   1467.6400     34.9600      0.0000
+   1132.7715   1442.2500      0.0000      4.5700
+   1132.9006   1442.2500      0.0000      4.5700
+   1133.0298   1442.2500      0.0000      4.5700
+   1133.1589   1487.5900     34.9600      4.5700
+   1133.2881   1487.5900     34.9600      4.5700
+   1133.4172   1487.5900     34.9600      4.5700
+   1133.5464   1487.5900     34.9600      4.5700
+   1133.6754   1487.6000     34.9600      4.5700
+   1133.8046   1487.5900     34.9600      4.5700
+   1133.9337   1487.6000     34.9600      4.5700
+   1134.0629   1487.6000     34.9600      4.5700
+   1134.1919   1487.6000     34.9600      4.5700
+   1134.3210   1487.6000     34.9600      4.5700
+   1134.4502   1487.6100     34.9600      4.5700
+   1134.5792   1487.6000     34.9600      4.5700
+   1134.7084   1487.6000     34.9600      4.5700
+   1134.8375   1487.6000     34.9600      4.5700
+   1134.9667   1487.6000     34.9600      4.5700
+   1135.0957   1487.6000     34.9600      4.5700
+   1135.2249   1487.6000     34.9500      4.5700
+   1135.3540   1487.6000     34.9500      4.5600
+   1135.4832   1487.6000     34.9500      4.5600
+   1135.6122   1487.6100     34.9600      4.5600
+   1135.7413   1467.7300     34.9600      0.0000
+   1138.1942   1442.3400      0.0000      4.5700
+   1138.3232   1442.3400      0.0000      4.5700
+   1138.4524   1442.3400      0.0000      4.5700
+   1138.5815   1487.6800     34.9600      4.5700
+   1138.7106   1487.6800     34.9600      4.5700
+   1138.8396   1487.6900     34.9600      4.5700
+   1138.9688   1487.6800     34.9600      4.5700
+   1139.0979   1487.6900     34.9600      4.5700
+   1139.2269   1487.6900     34.9600      4.5700
+   1139.3560   1487.6900     34.9600      4.5700
+   1139.4851   1487.7000     34.9700      4.5700
+   1139.6143   1487.7000     34.9700      4.5700
+   1139.7432   1487.7000     34.9700      4.5700
+   1139.8723   1487.7000     34.9700      4.5700
+   1140.0015   1487.7100     34.9700      4.5700
+   1140.1304   1487.7100     34.9700      4.5700
+   1140.2595   1487.7100     34.9700      4.5700
+   1140.3887   1487.7100     34.9700      4.5700
+   1140.5177   1487.7100     34.9700      4.5700
+   1140.6467   1487.7100     34.9600      4.5700
+   1140.7759   1467.8300     34.9600      0.0000
+   1143.2280   1442.3700      0.0000      4.5600
+   1143.3571   1442.3700      0.0000      4.5600
+   1143.4861   1442.3700      0.0000      4.5600
+   1143.6151   1487.7100     34.9600      4.5600
+   1143.7443   1487.7100     34.9600      4.5600
+   1143.8732   1487.7100     34.9600      4.5600
+   1144.0023   1487.7100     34.9600      4.5600
+   1144.1313   1487.7100     34.9600      4.5600
+   1144.2604   1487.7100     34.9600      4.5500
+   1144.3894   1487.7100     34.9600      4.5500
+   1144.5184   1487.7100     34.9600      4.5500
+   1144.6476   1487.7100     34.9600      4.5500
+   1144.7765   1487.7100     34.9600      4.5500
+   1144.9056   1487.7100     34.9700      4.5500
+   1145.0347   1487.7100     34.9700      4.5500
+   1145.1637   1487.7200     34.9700      4.5500
+   1145.2927   1487.7100     34.9700      4.5500
+   1145.4218   1487.7200     34.9700      4.5500
+   1145.5508   1487.7200     34.9700      4.5500
+   1145.6798   1487.7200     34.9700      4.5500
+   1145.8088   1487.7200     34.9700      4.5500
+   1145.9379   1487.7300     34.9700      4.5500
+   1146.0669   1487.7300     34.9700      4.5500
+   1146.1959   1487.7300     34.9700      4.5500
+   1146.3250   1487.7300     34.9700      4.5500
+   1146.4540   1487.7300     34.9700      4.5500
+   1146.5830   1487.7400     34.9700      4.5500
+   1146.7120   1487.7400     34.9700      4.5500
+   1146.8411   1487.7400     34.9700      4.5500
+   1146.9701   1487.7400     34.9700      4.5500
+   1147.0991   1467.9400     34.9700      0.0000
+   1148.2603   1442.4100      0.0000      4.5500
+   1148.3893   1442.4100      0.0000      4.5500
+   1148.5183   1442.4100      0.0000      4.5500
+   1148.6473   1487.7700     34.9700      4.5500
+   1148.7764   1487.7700     34.9700      4.5500
+   1148.9053   1487.7700     34.9700      4.5500
+   1149.0343   1487.7800     34.9700      4.5500
+   1149.1633   1487.7800     34.9700      4.5500
+   1149.2924   1487.7800     34.9700      4.5500
+   1149.4213   1487.7800     34.9700      4.5500
+   1149.5503   1487.7800     34.9700      4.5500
+   1149.6793   1487.7900     34.9700      4.5500
+   1149.8083   1487.7900     34.9600      4.5500
+   1149.9374   1487.7900     34.9600      4.5500
+   1150.0664   1487.7900     34.9600      4.5500
+   1150.1954   1487.7900     34.9600      4.5500
+   1150.3243   1487.7900     34.9600      4.5500
+   1150.4534   1487.7900     34.9600      4.5500
+   1150.5824   1487.7900     34.9600      4.5500
+   1150.7113   1487.7900     34.9600      4.5500
+   1150.8403   1487.7900     34.9600      4.5500
+   1150.9694   1487.8000     34.9600      4.5500
+   1151.0984   1487.8000     34.9600      4.5500
+   1151.2273   1487.8000     34.9600      4.5500
+   1151.3563   1487.8100     34.9600      4.5500
+   1151.4854   1487.8100     34.9600      4.5500
+   1151.6144   1487.8200     34.9600      4.5500
+   1151.7433   1487.8200     34.9700      4.5500
+   1151.8722   1487.8200     34.9600      4.5500
+   1152.0012   1487.8200     34.9600      4.5500
+   1152.1301   1487.8200     34.9600      4.5500
+   1152.2592   1487.8200     34.9600      4.5500
+   1152.3882   1487.8300     34.9600      4.5500
+   1152.5172   1487.8300     34.9600      4.5500
+   1152.6461   1487.8300     34.9600      4.5500
+   1152.7751   1487.8300     34.9600      4.5500
+   1152.9042   1468.0300     34.9600      0.0000
+   1154.0648   1442.4900      0.0000      4.5500
+   1154.1938   1442.4900      0.0000      4.5500
+   1154.3229   1442.4900      0.0000      4.5500
+   1154.4517   1487.8500     34.9700      4.5500
+   1154.5807   1487.8600     34.9700      4.5500
+   1154.7097   1487.8600     34.9700      4.5500
+   1154.8387   1487.8500     34.9700      4.5400
+   1154.9675   1487.8500     34.9700      4.5400
+   1155.0966   1487.8500     34.9700      4.5400
+   1155.2256   1487.8600     34.9700      4.5400
+   1155.3545   1487.8600     34.9700      4.5400
+   1155.4834   1487.8600     34.9700      4.5400
+   1155.6124   1487.8600     34.9700      4.5400
+   1155.7415   1487.8600     34.9700      4.5400
+   1155.8702   1487.8600     34.9700      4.5400
+   1155.9993   1487.8600     34.9700      4.5400
+   1156.1283   1487.8600     34.9700      4.5400
+   1156.2571   1487.8700     34.9700      4.5400
+   1156.3861   1487.8600     34.9700      4.5400
+   1156.5151   1487.8600     34.9700      4.5400
+   1156.6440   1487.8600     34.9700      4.5400
+   1156.7729   1487.8600     34.9600      4.5400
+   1156.9020   1487.8600     34.9600      4.5400
+   1157.0309   1487.8600     34.9600      4.5400
+   1157.1598   1487.8600     34.9600      4.5400
+   1157.2887   1487.8600     34.9600      4.5400
+   1157.4177   1487.8600     34.9500      4.5400
+   1157.5466   1487.8600     34.9500      4.5400
+   1157.6755   1487.8600     34.9500      4.5400
+   1157.8046   1487.8700     34.9500      4.5400
+   1157.9335   1487.8600     34.9500      4.5400
+   1158.0625   1487.8600     34.9500      4.5400
+   1158.1913   1487.8600     34.9600      4.5400
+   1158.3203   1487.8600     34.9600      4.5300
+   1158.4492   1487.8600     34.9600      4.5300
+   1158.5781   1487.8600     34.9600      4.5300
+   1158.7070   1487.8600     34.9600      4.5300
+   1158.8361   1487.8500     34.9600      4.5300
+   1158.9650   1487.8500     34.9600      4.5300
+   1159.0939   1487.8600     34.9600      4.5300
+   1159.2228   1487.8600     34.9600      4.5300
+   1159.3518   1487.8600     34.9600      4.5300
+   1159.4806   1487.8600     34.9600      4.5300
+   1159.6096   1487.8700     34.9600      4.5300
+   1159.7385   1487.8700     34.9600      4.5300
+   1159.8674   1468.1500     34.9600      0.0000
+   1161.0277   1442.5200      0.0000      4.5300
+   1161.1566   1442.5300      0.0000      4.5300
+   1161.2855   1442.5300      0.0000      4.5300
+   1161.4144   1487.8900     34.9600      4.5300
+   1161.5433   1487.8900     34.9600      4.5300
+   1161.6722   1487.9000     34.9600      4.5300
+   1161.8011   1487.9000     34.9600      4.5300
+   1161.9301   1487.9000     34.9600      4.5300
+   1162.0590   1487.9000     34.9600      4.5300
+   1162.1880   1487.9100     34.9600      4.5300
+   1162.3168   1487.9100     34.9600      4.5300
+   1162.4457   1487.9100     34.9600      4.5300
+   1162.5746   1487.9100     34.9600      4.5300
+   1162.7035   1487.9100     34.9600      4.5300
+   1162.8324   1487.9200     34.9600      4.5300
+   1162.9613   1487.9200     34.9600      4.5300
+   1163.0902   1487.9200     34.9600      4.5300
+   1163.2191   1487.9200     34.9600      4.5300
+   1163.3480   1487.9200     34.9600      4.5300
+   1163.4769   1487.9200     34.9600      4.5300
+   1163.6057   1487.9300     34.9600      4.5300
+   1163.7347   1487.9300     34.9600      4.5300
+   1163.8636   1487.9200     34.9600      4.5300
+   1163.9926   1487.9200     34.9600      4.5300
+   1164.1213   1487.9200     34.9600      4.5200
+   1164.2502   1487.9200     34.9600      4.5200
+   1164.3792   1487.9100     34.9600      4.5200
+   1164.5081   1468.2200     34.9600      0.0000
+   1165.6680   1442.5500      0.0000      4.5200
+   1165.7969   1442.5600      0.0000      4.5200
+   1165.9257   1442.5600      0.0000      4.5200
+   1166.0546   1487.9300     34.9600      4.5200
+   1166.1835   1487.9300     34.9600      4.5200
+   1166.3124   1487.9300     34.9600      4.5200
+   1166.4413   1487.9400     34.9600      4.5200
+   1166.5701   1487.9300     34.9600      4.5200
+   1166.6990   1487.9400     34.9600      4.5200
+   1166.8279   1487.9400     34.9600      4.5200
+   1166.9567   1487.9400     34.9600      4.5200
+   1167.0856   1487.9400     34.9600      4.5200
+   1167.2145   1487.9500     34.9600      4.5200
+   1167.3433   1487.9400     34.9600      4.5200
+   1167.4722   1487.9500     34.9600      4.5200
+   1167.6011   1487.9500     34.9500      4.5200
+   1167.7300   1487.9500     34.9500      4.5200
+   1167.8588   1487.9500     34.9500      4.5200
+   1167.9877   1487.9500     34.9500      4.5200
+   1168.1166   1487.9500     34.9500      4.5200
+   1168.2454   1487.9500     34.9500      4.5200
+   1168.3743   1487.9600     34.9500      4.5200
+   1168.5032   1487.9600     34.9500      4.5200
+   1168.6320   1487.9600     34.9500      4.5200
+   1168.7607   1487.9600     34.9500      4.5200
+   1168.8896   1487.9600     34.9500      4.5200
+   1169.0186   1487.9700     34.9500      4.5200
+   1169.1473   1487.9700     34.9500      4.5200
+   1169.2762   1487.9700     34.9500      4.5200
+   1169.4052   1487.9800     34.9500      4.5200
+   1169.5339   1487.9800     34.9500      4.5200
+   1169.6627   1487.9800     34.9500      4.5200
+   1169.7916   1487.9800     34.9500      4.5200
+   1169.9205   1487.9800     34.9500      4.5200
+   1170.0493   1487.9900     34.9500      4.5200
+   1170.1781   1487.9800     34.9500      4.5200
+   1170.3070   1487.9900     34.9500      4.5200
+   1170.4359   1487.9900     34.9500      4.5200
+   1170.5647   1487.9900     34.9500      4.5200
+   1170.6935   1468.3100     34.9500      0.0000
+   1172.6261   1442.6200      0.0000      4.5100
+   1172.7549   1442.6200      0.0000      4.5100
+   1172.8837   1442.6300      0.0000      4.5100
+   1173.0125   1488.0000     34.9600      4.5100
+   1173.1414   1488.0000     34.9600      4.5100
+   1173.2701   1488.0100     34.9600      4.5100
+   1173.3989   1488.0100     34.9600      4.5100
+   1173.5278   1488.0100     34.9600      4.5100
+   1173.6566   1488.0100     34.9600      4.5100
+   1173.7854   1488.0200     34.9600      4.5100
+   1173.9142   1488.0200     34.9600      4.5100
+   1174.0431   1488.0200     34.9600      4.5100
+   1174.1719   1488.0200     34.9600      4.5100
+   1174.3007   1488.0200     34.9600      4.5100
+   1174.4294   1488.0300     34.9600      4.5100
+   1174.5583   1488.0300     34.9600      4.5100
+   1174.6871   1488.0300     34.9600      4.5100
+   1174.8159   1488.0300     34.9600      4.5100
+   1174.9447   1488.0300     34.9600      4.5100
+   1175.0736   1488.0400     34.9600      4.5100
+   1175.2023   1488.0400     34.9600      4.5100
+   1175.3312   1488.0400     34.9600      4.5100
+   1175.4600   1488.0400     34.9600      4.5100
+   1175.5887   1488.0400     34.9600      4.5100
+   1175.7175   1488.0400     34.9600      4.5100
+   1175.8463   1488.0400     34.9600      4.5100
+   1175.9752   1488.0500     34.9600      4.5100
+   1176.1039   1488.0500     34.9600      4.5100
+   1176.2328   1488.0500     34.9600      4.5100
+   1176.3616   1488.0500     34.9600      4.5100
+   1176.4904   1488.0600     34.9600      4.5100
+   1176.6191   1488.0600     34.9600      4.5100
+   1176.7479   1488.0600     34.9600      4.5100
+   1176.8768   1488.0600     34.9600      4.5100
+   1177.0055   1488.0600     34.9600      4.5100
+   1177.1343   1488.0600     34.9600      4.5100
+   1177.2632   1488.0600     34.9600      4.5000
+   1177.3920   1488.0600     34.9600      4.5000
+   1177.5206   1488.0500     34.9600      4.5000
+   1177.6495   1488.0500     34.9600      4.5000
+   1177.7783   1488.0500     34.9600      4.5000
+   1177.9070   1488.0500     34.9700      4.5000
+   1178.0358   1488.0500     34.9700      4.5000
+   1178.1647   1488.0600     34.9700      4.5000
+   1178.2935   1488.0600     34.9700      4.5000
+   1178.4221   1488.0600     34.9700      4.5000
+   1178.5509   1488.0600     34.9600      4.5000
+   1178.6798   1488.0600     34.9600      4.5000
+   1178.8085   1488.0600     34.9600      4.5000
+   1178.9373   1488.0600     34.9600      4.5000
+   1179.0660   1488.0700     34.9600      4.5000
+   1179.1949   1488.0700     34.9600      4.5000
+   1179.3236   1488.0700     34.9600      4.5000
+   1179.4524   1488.0700     34.9600      4.5000
+   1179.5812   1488.0700     34.9600      4.5000
+   1179.7098   1488.0700     34.9600      4.5000
+   1179.8387   1488.0700     34.9600      4.5000
+   1179.9675   1488.0700     34.9600      4.5000
+   1180.0963   1488.0700     34.9500      4.5000
+   1180.2250   1488.0700     34.9500      4.5000
+   1180.3538   1488.0700     34.9500      4.5000
+   1180.4825   1488.0800     34.9500      4.5000
+   1180.6113   1488.0800     34.9500      4.5000
+   1180.7401   1488.0800     34.9500      4.5000
+   1180.8689   1488.0900     34.9500      4.5000
+   1180.9977   1488.0900     34.9500      4.5000
+   1181.1263   1488.0800     34.9500      4.5000
+   1181.2551   1488.0800     34.9500      4.5000
+   1181.3839   1488.0800     34.9600      4.5000
+   1181.5127   1488.0800     34.9500      4.4900
+   1181.6414   1488.0800     34.9600      4.4900
+   1181.7701   1488.0700     34.9600      4.4900
+   1181.8989   1488.0700     34.9500      4.4900
+   1182.0276   1488.0700     34.9600      4.4900
+   1182.1564   1488.0700     34.9600      4.4900
+   1182.2852   1488.0700     34.9600      4.4900
+   1182.4139   1488.0700     34.9600      4.4900
+   1182.5426   1488.0800     34.9600      4.4900
+   1182.6714   1488.0800     34.9600      4.4900
+   1182.8002   1488.0800     34.9600      4.4900
+   1182.9288   1488.0800     34.9600      4.4900
+   1183.0576   1488.0900     34.9600      4.4900
+   1183.1864   1488.0900     34.9600      4.4900
+   1183.3152   1488.0900     34.9600      4.4900
+   1183.4438   1488.0900     34.9600      4.4900
+   1183.5726   1488.0900     34.9600      4.4900
+   1183.7014   1488.1000     34.9600      4.4900
+   1183.8302   1488.1000     34.9600      4.4900
+   1183.9589   1488.1000     34.9600      4.4900
+   1184.0876   1488.1000     34.9600      4.4900
+   1184.2163   1488.1000     34.9600      4.4900
+   1184.3450   1488.1100     34.9600      4.4900
+   1184.4738   1488.1100     34.9600      4.4900
+   1184.6025   1488.1100     34.9600      4.4900
+   1184.7313   1488.1100     34.9600      4.4900
+   1184.8600   1488.1100     34.9600      4.4900
+   1184.9888   1468.5500     34.9600      0.0000
+   1186.1472   1442.7500      0.0000      4.4900
+   1186.2760   1442.7500      0.0000      4.4900
+   1186.4047   1442.7500      0.0000      4.4900
+   1186.5334   1488.1400     34.9600      4.4900
+   1186.6621   1488.1400     34.9600      4.4900
+   1186.7909   1488.1400     34.9600      4.4900
+   1186.9196   1488.1500     34.9600      4.4900
+   1187.0483   1488.1500     34.9600      4.4900
+   1187.1770   1488.1500     34.9600      4.4900
+   1187.3057   1488.1500     34.9600      4.4900
+   1187.4344   1488.1600     34.9600      4.4900
+   1187.5631   1488.1600     34.9600      4.4900
+   1187.6918   1488.1600     34.9600      4.4900
+   1187.8206   1488.1600     34.9600      4.4900
+   1187.9493   1488.1600     34.9600      4.4900
+   1188.0779   1488.1700     34.9600      4.4900
+   1188.2067   1488.1700     34.9600      4.4900
+   1188.3354   1488.1700     34.9600      4.4900
+   1188.4640   1488.1700     34.9600      4.4900
+   1188.5928   1488.1700     34.9500      4.4900
+   1188.7214   1488.1800     34.9500      4.4900
+   1188.8502   1488.1700     34.9500      4.4900
+   1188.9789   1488.1800     34.9600      4.4900
+   1189.1075   1488.1800     34.9600      4.4900
+   1189.2363   1488.1800     34.9600      4.4900
+   1189.3650   1488.1800     34.9600      4.4900
+   1189.4937   1488.1800     34.9600      4.4900
+   1189.6224   1488.1800     34.9600      4.4900
+   1189.7511   1488.1800     34.9600      4.4900
+   1189.8798   1488.1800     34.9600      4.4900
+   1190.0084   1468.6400     34.9600      0.0000
+   1191.1666   1442.7900      0.0000      4.4800
+   1191.2953   1442.7900      0.0000      4.4800
+   1191.4240   1442.7900      0.0000      4.4800
+   1191.5527   1488.1900     34.9600      4.4800
+   1191.6813   1488.2000     34.9600      4.4800
+   1191.8101   1488.2000     34.9600      4.4800
+   1191.9387   1488.2000     34.9600      4.4800
+   1192.0674   1488.2000     34.9600      4.4800
+   1192.1960   1488.2000     34.9600      4.4800
+   1192.3247   1488.2100     34.9600      4.4800
+   1192.4535   1488.2100     34.9600      4.4800
+   1192.5820   1488.2100     34.9600      4.4800
+   1192.7107   1488.2100     34.9600      4.4800
+   1192.8395   1488.2100     34.9600      4.4800
+   1192.9681   1488.2200     34.9600      4.4800
+   1193.0967   1488.2200     34.9600      4.4800
+   1193.2255   1488.2200     34.9600      4.4800
+   1193.3541   1488.2200     34.9600      4.4800
+   1193.4828   1488.2200     34.9600      4.4800
+   1193.6115   1488.2100     34.9600      4.4800
+   1193.7401   1488.2100     34.9600      4.4800
+   1193.8688   1488.2200     34.9600      4.4800
+   1193.9974   1488.2100     34.9500      4.4800
+   1194.1261   1468.7000     34.9500      0.0000
+   1196.5704   1442.8700      0.0000      4.4800
+   1196.6991   1442.8700      0.0000      4.4800
+   1196.8276   1442.8700      0.0000      4.4800
+   1196.9564   1488.2700     34.9600      4.4800
+   1197.0851   1488.2800     34.9600      4.4800
+   1197.2136   1488.2700     34.9600      4.4800
+   1197.3423   1488.2700     34.9600      4.4800
+   1197.4709   1488.2700     34.9600      4.4700
+   1197.5996   1488.2700     34.9600      4.4700
+   1197.7281   1488.2600     34.9600      4.4700
+   1197.8568   1488.2600     34.9600      4.4700
+   1197.9855   1488.2600     34.9600      4.4700
+   1198.1140   1488.2600     34.9600      4.4700
+   1198.2427   1488.2500     34.9600      4.4700
+   1198.3713   1488.2600     34.9600      4.4700
+   1198.5000   1488.2600     34.9600      4.4700
+   1198.6285   1488.2600     34.9600      4.4700
+   1198.7572   1488.2600     34.9500      4.4700
+   1198.8859   1468.7800     34.9500      0.0000
+   1202.7440   1442.9100      0.0000      4.4700
+   1202.8727   1442.9100      0.0000      4.4600
+   1203.0012   1442.9100      0.0000      4.4600
+   1203.1299   1488.3100     34.9600      4.4600
+   1203.2584   1488.3100     34.9600      4.4600
+   1203.3871   1488.3100     34.9600      4.4600
+   1203.5156   1488.3100     34.9600      4.4600
+   1203.6442   1488.3100     34.9600      4.4600
+   1203.7728   1488.3100     34.9600      4.4600
+   1203.9014   1488.3100     34.9600      4.4600
+   1204.0300   1488.3100     34.9600      4.4600
+   1204.1586   1488.3200     34.9600      4.4600
+   1204.2871   1488.3200     34.9600      4.4600
+   1204.4158   1488.3200     34.9600      4.4600
+   1204.5442   1488.3200     34.9600      4.4600
+   1204.6729   1488.3300     34.9600      4.4600
+   1204.8014   1488.3300     34.9600      4.4600
+   1204.9301   1488.3300     34.9600      4.4600
+   1205.0586   1488.3300     34.9600      4.4600
+   1205.1871   1488.3300     34.9600      4.4600
+   1205.3158   1488.3400     34.9600      4.4600
+   1205.4442   1488.3400     34.9600      4.4600
+   1205.5729   1488.3400     34.9600      4.4600
+   1205.7014   1488.3400     34.9600      4.4600
+   1205.8301   1488.3400     34.9600      4.4600
+   1205.9586   1488.3500     34.9600      4.4600
+   1206.0872   1488.3500     34.9600      4.4600
+   1206.2157   1488.3500     34.9600      4.4600
+   1206.3444   1488.3500     34.9600      4.4600
+   1206.4729   1488.3500     34.9600      4.4600
+   1206.6014   1488.3600     34.9600      4.4600
+   1206.7300   1488.3600     34.9600      4.4600
+   1206.8585   1488.3500     34.9600      4.4600
+   1206.9871   1468.9200     34.9600      0.0000
+   1208.1442   1442.9200      0.0000      4.4500
+   1208.2726   1442.9100      0.0000      4.4500
+   1208.4012   1442.9100      0.0000      4.4500
+   1208.5298   1488.3200     34.9600      4.4500
+   1208.6583   1488.3200     34.9600      4.4400
+   1208.7869   1488.3200     34.9600      4.4400
+   1208.9154   1488.3200     34.9600      4.4400
+   1209.0439   1488.3200     34.9600      4.4400
+   1209.1725   1488.3200     34.9600      4.4400
+   1209.3010   1488.3200     34.9600      4.4400
+   1209.4296   1488.3200     34.9600      4.4400
+   1209.5582   1488.3300     34.9600      4.4400
+   1209.6866   1488.3200     34.9600      4.4400
+   1209.8152   1488.3300     34.9600      4.4400
+   1209.9437   1488.3300     34.9600      4.4400
+   1210.0723   1488.3300     34.9500      4.4400
+   1210.2008   1488.3300     34.9500      4.4400
+   1210.3293   1488.3300     34.9500      4.4400
+   1210.4579   1488.3300     34.9500      4.4400
+   1210.5864   1488.3300     34.9500      4.4400
+   1210.7150   1488.3200     34.9500      4.4400
+   1210.8435   1488.3200     34.9500      4.4400
+   1210.9719   1488.3200     34.9500      4.4400
+   1211.1006   1488.3100     34.9500      4.4300
+   1211.2291   1488.3100     34.9500      4.4300
+   1211.3577   1488.3100     34.9500      4.4300
+   1211.4861   1488.3100     34.9500      4.4300
+   1211.6146   1488.3100     34.9500      4.4300
+   1211.7432   1488.3100     34.9500      4.4300
+   1211.8717   1488.3100     34.9500      4.4300
+   1212.0002   1488.3100     34.9500      4.4300
+   1212.1288   1488.3200     34.9500      4.4300
+   1212.2573   1488.3200     34.9600      4.4300
+   1212.3857   1488.3200     34.9600      4.4300
+   1212.5143   1488.3300     34.9600      4.4300
+   1212.6428   1488.3300     34.9600      4.4300
+   1212.7714   1488.3300     34.9600      4.4300
+   1212.8998   1488.3300     34.9600      4.4300
+   1213.0283   1488.3700     34.9600      4.4400
+   1213.1569   1469.0200     34.9500      0.0000
+   1215.0845   1442.9400      0.0000      4.4300
+   1215.2130   1442.9500      0.0000      4.4300
+   1215.3414   1442.9500      0.0000      4.4300
+   1215.4700   1488.3700     34.9500      4.4300
+   1215.5984   1488.3700     34.9500      4.4300
+   1215.7269   1488.3700     34.9500      4.4300
+   1215.8555   1488.3800     34.9500      4.4300
+   1215.9840   1488.3800     34.9500      4.4300
+   1216.1124   1488.3800     34.9500      4.4300
+   1216.2410   1488.3800     34.9500      4.4300
+   1216.3694   1488.3900     34.9500      4.4300
+   1216.4978   1488.3900     34.9500      4.4300
+   1216.6263   1488.3900     34.9500      4.4300
+   1216.7549   1488.4000     34.9600      4.4300
+   1216.8834   1488.4000     34.9600      4.4300
+   1217.0118   1488.4000     34.9600      4.4300
+   1217.1404   1488.4100     34.9600      4.4300
+   1217.2688   1488.4100     34.9600      4.4300
+   1217.3972   1488.4200     34.9600      4.4300
+   1217.5258   1488.4200     34.9600      4.4300
+   1217.6543   1488.4200     34.9600      4.4300
+   1217.7827   1488.4200     34.9600      4.4300
+   1217.9111   1488.4300     34.9600      4.4300
+   1218.0397   1488.4300     34.9600      4.4300
+   1218.1682   1488.4300     34.9600      4.4300
+   1218.2966   1488.4300     34.9600      4.4300
+   1218.4250   1488.4300     34.9600      4.4300
+   1218.5536   1488.4400     34.9600      4.4300
+   1218.6821   1488.4400     34.9600      4.4300
+   1218.8104   1488.4400     34.9600      4.4300
+   1218.9390   1488.4400     34.9600      4.4300
+   1219.0675   1488.4400     34.9600      4.4300
+   1219.1959   1488.4500     34.9600      4.4300
+   1219.3243   1488.4500     34.9600      4.4300
+   1219.4529   1488.4500     34.9600      4.4300
+   1219.5813   1488.4600     34.9700      4.4300
+   1219.7097   1488.4500     34.9600      4.4300
+   1219.8383   1488.4500     34.9600      4.4300
+   1219.9667   1488.4400     34.9600      4.4300
+   1220.0952   1488.4400     34.9600      4.4300
+   1220.2236   1488.4400     34.9600      4.4200
+   1220.3521   1488.4300     34.9600      4.4200
+   1220.4806   1488.4300     34.9600      4.4200
+   1220.6089   1488.4200     34.9600      4.4200
+   1220.7374   1488.4100     34.9500      4.4200
+   1220.8658   1488.4000     34.9500      4.4200
+   1220.9944   1488.4000     34.9500      4.4100
+   1221.1228   1488.4000     34.9500      4.4100
+   1221.2512   1488.3900     34.9500      4.4100
+   1221.3798   1488.3900     34.9500      4.4100
+   1221.5081   1488.3900     34.9500      4.4100
+   1221.6366   1488.3900     34.9500      4.4100
+   1221.7650   1488.3900     34.9500      4.4100
+   1221.8936   1488.4000     34.9500      4.4100
+   1222.0219   1488.4000     34.9500      4.4100
+   1222.1504   1488.4000     34.9500      4.4100
+   1222.2788   1488.4000     34.9500      4.4100
+   1222.4073   1488.4000     34.9500      4.4100
+   1222.5356   1488.4000     34.9500      4.4100
+   1222.6642   1488.4100     34.9500      4.4100
+   1222.7926   1488.4100     34.9500      4.4100
+   1222.9210   1488.4100     34.9500      4.4100
+   1223.0494   1488.4100     34.9500      4.4100
+   1223.1779   1488.4100     34.9500      4.4100
+   1223.3064   1488.4200     34.9500      4.4100
+   1223.4347   1488.4200     34.9500      4.4100
+   1223.5632   1488.4200     34.9500      4.4100
+   1223.6917   1488.4200     34.9500      4.4100
+   1223.8201   1488.4200     34.9500      4.4100
+   1223.9485   1469.1900     34.9500      0.0000
+   1225.1044   1442.9800      0.0000      4.4000
+   1225.2327   1442.9900      0.0000      4.4000
+   1225.3612   1442.9900      0.0000      4.4000
+   1225.4896   1488.4300     34.9600      4.4000
+   1225.6180   1488.4400     34.9600      4.4000
+   1225.7463   1488.4400     34.9500      4.4000
+   1225.8749   1488.4500     34.9500      4.4100
+   1226.0033   1488.4500     34.9500      4.4100
+   1226.1316   1488.4500     34.9500      4.4100
+   1226.2600   1488.4600     34.9500      4.4100
+   1226.3885   1488.4600     34.9500      4.4100
+   1226.5170   1488.4700     34.9500      4.4100
+   1226.6453   1488.4700     34.9500      4.4100
+   1226.7737   1488.4700     34.9500      4.4100
+   1226.9021   1488.4700     34.9500      4.4100
+   1227.0305   1488.4800     34.9500      4.4100
+   1227.1589   1488.4800     34.9500      4.4100
+   1227.2874   1488.4800     34.9500      4.4100
+   1227.4158   1488.4800     34.9500      4.4100
+   1227.5441   1488.4900     34.9500      4.4100
+   1227.6725   1488.4900     34.9500      4.4100
+   1227.8010   1488.4900     34.9500      4.4100
+   1227.9293   1488.4900     34.9500      4.4100
+   1228.0577   1488.4900     34.9500      4.4100
+   1228.1862   1488.4900     34.9500      4.4100
+   1228.3146   1488.4900     34.9500      4.4100
+   1228.4429   1488.4900     34.9500      4.4100
+   1228.5713   1488.4900     34.9500      4.4100
+   1228.6997   1488.4800     34.9500      4.4000
+   1228.8281   1488.4800     34.9500      4.4000
+   1228.9564   1488.4800     34.9500      4.4000
+   1229.0848   1488.4800     34.9500      4.4000
+   1229.2133   1488.4900     34.9500      4.4000
+   1229.3417   1469.2900     34.9600      0.0000
+   1230.4972   1443.0300      0.0000      4.3900
+   1230.6255   1443.0300      0.0000      4.3900
+   1230.7539   1443.0300      0.0000      4.3900
+   1230.8822   1488.4700     34.9500      4.3900
+   1231.0106   1488.4600     34.9500      4.3900
+   1231.1389   1488.4600     34.9500      4.3900
+   1231.2673   1488.4600     34.9500      4.3900
+   1231.3958   1488.4700     34.9500      4.3900
+   1231.5242   1488.4700     34.9500      4.3900
+   1231.6525   1488.4700     34.9500      4.3900
+   1231.7809   1488.4700     34.9500      4.3900
+   1231.9093   1488.4800     34.9500      4.3900
+   1232.0376   1488.4800     34.9500      4.3900
+   1232.1659   1488.4700     34.9500      4.3900
+   1232.2943   1488.4700     34.9500      4.3900
+   1232.4227   1488.4800     34.9500      4.3900
+   1232.5510   1488.4700     34.9500      4.3900
+   1232.6794   1488.4700     34.9500      4.3900
+   1232.8079   1488.4700     34.9500      4.3800
+   1232.9362   1488.4700     34.9500      4.3800
+   1233.0645   1488.4700     34.9500      4.3800
+   1233.1929   1488.4700     34.9500      4.3800
+   1233.3213   1488.4700     34.9600      4.3800
+   1233.4496   1488.4800     34.9600      4.3800
+   1233.5779   1488.4700     34.9600      4.3800
+   1233.7063   1488.4800     34.9600      4.3800
+   1233.8347   1488.4800     34.9600      4.3800
+   1233.9630   1488.4800     34.9600      4.3800
+   1234.0913   1488.4800     34.9600      4.3800
+   1234.2197   1488.4800     34.9600      4.3800
+   1234.3480   1488.4900     34.9600      4.3800
+   1234.4764   1488.4900     34.9600      4.3800
+   1234.6047   1488.4900     34.9600      4.3800
+   1234.7332   1488.4900     34.9600      4.3800
+   1234.8615   1488.4900     34.9600      4.3800
+   1234.9897   1488.5000     34.9600      4.3800
+   1235.1182   1469.3900     34.9600      0.0000
+   1236.2732   1443.0600      0.0000      4.3800
+   1236.4015   1443.0600      0.0000      4.3800
+   1236.5299   1443.0700      0.0000      4.3800
+   1236.6582   1488.5200     34.9500      4.3800
+   1236.7865   1488.5200     34.9600      4.3800
+   1236.9149   1488.5200     34.9500      4.3800
+   1237.0432   1488.5200     34.9500      4.3800
+   1237.1715   1488.5100     34.9500      4.3800
+   1237.2998   1488.5100     34.9500      4.3800
+   1237.4282   1488.5100     34.9500      4.3700
+   1237.5564   1488.5000     34.9500      4.3700
+   1237.6848   1488.5000     34.9500      4.3700
+   1237.8131   1488.5000     34.9500      4.3700
+   1237.9415   1488.4900     34.9500      4.3700
+   1238.0697   1488.4900     34.9500      4.3700
+   1238.1981   1488.5000     34.9500      4.3700
+   1238.3264   1488.5000     34.9500      4.3700
+   1238.4548   1488.5000     34.9500      4.3700
+   1238.5830   1488.5100     34.9500      4.3700
+   1238.7114   1488.5100     34.9500      4.3700
+   1238.8397   1488.5100     34.9500      4.3700
+   1238.9679   1488.5200     34.9500      4.3700
+   1239.0963   1488.5200     34.9500      4.3700
+   1239.2246   1488.5200     34.9500      4.3700
+   1239.3530   1488.5200     34.9500      4.3700
+   1239.4812   1488.5200     34.9500      4.3700
+   1239.6095   1488.5200     34.9500      4.3700
+   1239.7379   1469.4500     34.9500      0.0000
+   1240.8926   1443.0900      0.0000      4.3700
+   1241.0209   1443.0900      0.0000      4.3700
+   1241.1492   1443.0900      0.0000      4.3700
+   1241.2775   1488.5500     34.9500      4.3700
+   1241.4058   1488.5500     34.9500      4.3700
+   1241.5341   1488.5500     34.9500      4.3700
+   1241.6624   1488.5600     34.9500      4.3700
+   1241.7906   1488.5600     34.9500      4.3700
+   1241.9189   1488.5600     34.9500      4.3700
+   1242.0472   1488.5600     34.9500      4.3700
+   1242.1755   1488.5600     34.9500      4.3700
+   1242.3038   1488.5600     34.9500      4.3700
+   1242.4321   1488.5700     34.9500      4.3700
+   1242.5604   1488.5700     34.9500      4.3700
+   1242.6886   1488.5700     34.9500      4.3700
+   1242.8170   1488.5700     34.9500      4.3700
+   1242.9453   1488.5700     34.9500      4.3700
+   1243.0735   1488.5800     34.9500      4.3700
+   1243.2018   1488.5800     34.9500      4.3700
+   1243.3301   1488.5800     34.9500      4.3700
+   1243.4584   1488.5800     34.9500      4.3700
+   1243.5867   1488.5800     34.9400      4.3700
+   1243.7150   1488.5900     34.9400      4.3700
+   1243.8433   1488.5900     34.9400      4.3700
+   1243.9714   1488.5900     34.9400      4.3700
+   1244.0997   1488.5900     34.9400      4.3700
+   1244.2280   1488.5900     34.9400      4.3700
+   1244.3563   1488.6000     34.9400      4.3700
+   1244.4845   1488.6000     34.9400      4.3700
+   1244.6128   1488.6000     34.9400      4.3700
+   1244.7411   1488.6000     34.9400      4.3700
+   1244.8694   1488.6000     34.9400      4.3700
+   1244.9977   1488.6100     34.9400      4.3700
+   1245.1259   1469.5400     34.9400      0.0000
+   1246.2803   1443.1800      0.0000      4.3700
+   1246.4084   1443.1800      0.0000      4.3700
+   1246.5367   1443.1800      0.0000      4.3700
+   1246.6650   1488.6300     34.9400      4.3700
+   1246.7932   1488.6300     34.9400      4.3700
+   1246.9215   1488.6400     34.9400      4.3700
+   1247.0498   1488.6400     34.9400      4.3700
+   1247.1780   1488.6400     34.9400      4.3700
+   1247.3063   1488.6400     34.9400      4.3700
+   1247.4346   1488.6500     34.9400      4.3700
+   1247.5629   1488.6500     34.9400      4.3700
+   1247.6910   1488.6500     34.9400      4.3700
+   1247.8192   1488.6500     34.9400      4.3700
+   1247.9475   1488.6500     34.9400      4.3700
+   1248.0758   1488.6600     34.9400      4.3700
+   1248.2040   1488.6600     34.9400      4.3700
+   1248.3323   1488.6600     34.9400      4.3700
+   1248.4606   1488.6600     34.9400      4.3700
+   1248.5887   1488.6600     34.9400      4.3700
+   1248.7169   1488.6600     34.9500      4.3700
+   1248.8452   1488.6700     34.9500      4.3700
+   1248.9735   1488.6700     34.9500      4.3700
+   1249.1017   1488.6700     34.9500      4.3700
+   1249.2300   1488.6700     34.9400      4.3700
+   1249.3582   1488.6600     34.9400      4.3700
+   1249.4863   1488.6600     34.9400      4.3700
+   1249.6146   1488.6600     34.9500      4.3600
+   1249.7429   1488.6700     34.9500      4.3600
+   1249.8711   1488.6600     34.9500      4.3600
+   1249.9993   1488.6600     34.9500      4.3600
+   1250.1276   1488.6600     34.9500      4.3600
+   1250.2557   1488.6600     34.9500      4.3600
+   1250.3839   1488.6600     34.9500      4.3600
+   1250.5122   1488.6700     34.9500      4.3600
+   1250.6405   1488.6700     34.9500      4.3600
+   1250.7687   1488.6700     34.9500      4.3600
+   1250.8969   1469.6400     34.9500      0.0000
+   1252.0509   1443.2200      0.0000      4.3600
+   1252.1791   1443.2300      0.0000      4.3600
+   1252.3073   1443.2300      0.0000      4.3600
+   1252.4354   1488.7000     34.9500      4.3600
+   1252.5637   1488.7000     34.9500      4.3600
+   1252.6919   1488.7000     34.9500      4.3600
+   1252.8201   1488.7000     34.9500      4.3600
+   1252.9484   1488.7100     34.9500      4.3600
+   1253.0765   1488.7100     34.9500      4.3600
+   1253.2047   1488.7100     34.9500      4.3600
+   1253.3329   1488.7100     34.9500      4.3600
+   1253.4612   1488.7100     34.9500      4.3600
+   1253.5892   1488.7200     34.9500      4.3600
+   1253.7175   1488.7200     34.9500      4.3600
+   1253.8457   1488.7200     34.9500      4.3600
+   1253.9740   1488.7200     34.9500      4.3600
+   1254.1021   1488.7200     34.9500      4.3600
+   1254.2303   1488.7300     34.9500      4.3600
+   1254.3585   1488.7300     34.9500      4.3600
+   1254.4867   1488.7300     34.9500      4.3600
+   1254.6149   1488.7300     34.9500      4.3600
+   1254.7430   1488.7300     34.9500      4.3600
+   1254.8713   1488.7400     34.9500      4.3600
+   1254.9994   1488.7400     34.9500      4.3600
+   1255.1277   1488.7400     34.9500      4.3600
+   1255.2559   1488.7400     34.9500      4.3600
+   1255.3840   1488.7400     34.9500      4.3600
+   1255.5122   1488.7500     34.9500      4.3600
+   1255.6404   1488.7500     34.9500      4.3600
+   1255.7686   1488.7500     34.9500      4.3600
+   1255.8967   1488.7500     34.9500      4.3600
+   1256.0249   1488.7600     34.9500      4.3600
+   1256.1532   1488.7600     34.9500      4.3600
+   1256.2814   1469.7300     34.9500      0.0000
+   1257.4349   1443.3200      0.0000      4.3600
+   1257.5631   1443.3300      0.0000      4.3600
+   1257.6913   1443.3400      0.0000      4.3600
+   1257.8193   1488.8100     34.9500      4.3700
+   1257.9475   1488.8200     34.9500      4.3700
+   1258.0758   1488.8200     34.9500      4.3700
+   1258.2039   1488.8300     34.9600      4.3700
+   1258.3320   1488.8400     34.9600      4.3700
+   1258.4602   1488.8300     34.9600      4.3700
+   1258.5884   1488.8300     34.9500      4.3700
+   1258.7166   1488.8200     34.9500      4.3600
+   1258.8447   1488.8200     34.9500      4.3600
+   1258.9729   1488.8200     34.9500      4.3600
+   1259.1010   1488.8200     34.9500      4.3600
+   1259.2291   1488.8200     34.9500      4.3600
+   1259.3573   1488.8200     34.9500      4.3600
+   1259.4856   1488.8100     34.9500      4.3600
+   1259.6136   1488.8100     34.9500      4.3600
+   1259.7418   1488.8200     34.9500      4.3600
+   1259.8700   1488.8200     34.9500      4.3600
+   1259.9980   1488.8300     34.9500      4.3600
+   1260.1262   1488.8300     34.9500      4.3600
+   1260.2544   1488.8300     34.9500      4.3600
+   1260.3826   1488.8300     34.9500      4.3600
+   1260.5106   1488.8300     34.9500      4.3600
+   1260.6388   1488.8400     34.9500      4.3600
+   1260.7670   1488.8400     34.9500      4.3600
+   1260.8951   1488.8400     34.9500      4.3600
+   1261.0233   1488.8400     34.9500      4.3600
+   1261.1515   1488.8400     34.9500      4.3600
+   1261.2797   1488.8400     34.9500      4.3600
+   1261.4077   1488.8400     34.9500      4.3600
+   1261.5359   1488.8400     34.9500      4.3600
+   1261.6641   1488.8500     34.9500      4.3600
+   1261.7921   1488.8500     34.9500      4.3600
+   1261.9203   1488.8500     34.9500      4.3600
+   1262.0483   1469.8200     34.9500      0.0000
+   1263.2015   1443.3700      0.0000      4.3500
+   1263.3297   1443.3700      0.0000      4.3500
+   1263.4579   1443.3600      0.0000      4.3500
+   1263.5859   1488.8500     34.9600      4.3500
+   1263.7140   1488.8500     34.9600      4.3500
+   1263.8422   1488.8500     34.9600      4.3500
+   1263.9703   1488.8500     34.9600      4.3500
+   1264.0985   1488.8600     34.9600      4.3500
+   1264.2266   1488.8600     34.9600      4.3500
+   1264.3547   1488.8600     34.9600      4.3500
+   1264.4828   1488.8600     34.9600      4.3500
+   1264.6108   1488.8600     34.9500      4.3500
+   1264.7390   1488.8600     34.9500      4.3500
+   1264.8672   1488.8600     34.9500      4.3500
+   1264.9952   1488.8600     34.9500      4.3500
+   1265.1233   1488.8700     34.9500      4.3500
+   1265.2515   1488.8700     34.9500      4.3500
+   1265.3796   1488.8700     34.9500      4.3500
+   1265.5077   1488.8700     34.9500      4.3500
+   1265.6357   1488.8700     34.9500      4.3500
+   1265.7639   1488.8800     34.9500      4.3500
+   1265.8921   1488.8700     34.9500      4.3500
+   1266.0201   1488.8700     34.9500      4.3500
+   1266.1482   1488.8700     34.9500      4.3500
+   1266.2764   1488.8700     34.9500      4.3500
+   1266.4044   1488.8600     34.9500      4.3400
+   1266.5325   1488.8600     34.9500      4.3400
+   1266.6606   1488.8600     34.9500      4.3400
+   1266.7888   1488.8600     34.9500      4.3400
+   1266.9167   1488.8600     34.9500      4.3400
+   1267.0449   1488.8600     34.9500      4.3400
+   1267.1730   1488.8600     34.9500      4.3400
+   1267.3011   1488.8600     34.9500      4.3400
+   1267.4292   1469.9200     34.9500      0.0000
+   1268.5820   1443.4000      0.0000      4.3400
+   1268.7101   1443.3900      0.0000      4.3400
+   1268.8381   1443.4000      0.0000      4.3400
+   1268.9663   1488.8800     34.9500      4.3400
+   1269.0944   1488.8700     34.9500      4.3400
+   1269.2224   1488.8700     34.9500      4.3400
+   1269.3505   1488.8700     34.9500      4.3300
+   1269.4786   1488.8700     34.9500      4.3300
+   1269.6066   1488.8800     34.9500      4.3300
+   1269.7347   1488.8800     34.9500      4.3300
+   1269.8628   1488.8900     34.9500      4.3400
+   1269.9910   1488.8900     34.9500      4.3400
+   1270.1189   1488.8900     34.9500      4.3400
+   1270.2471   1488.9000     34.9500      4.3400
+   1270.3751   1488.9000     34.9500      4.3400
+   1270.5032   1488.9100     34.9500      4.3400
+   1270.6312   1488.9100     34.9500      4.3400
+   1270.7593   1488.9200     34.9500      4.3400
+   1270.8875   1488.9200     34.9500      4.3400
+   1271.0154   1488.9200     34.9500      4.3400
+   1271.1434   1488.9200     34.9500      4.3400
+   1271.2716   1488.9200     34.9500      4.3400
+   1271.3997   1488.9300     34.9500      4.3400
+   1271.5277   1488.9300     34.9500      4.3400
+   1271.6558   1488.9300     34.9500      4.3400
+   1271.7838   1488.9300     34.9500      4.3400
+   1271.9119   1488.9300     34.9500      4.3400
+   1272.0399   1488.9400     34.9500      4.3400
+   1272.1680   1488.9400     34.9500      4.3400
+   1272.2960   1488.9400     34.9500      4.3400
+   1272.4241   1470.0000     34.9500      0.0000
+   1274.3448   1443.4900      0.0000      4.3400
+   1274.4729   1443.5000      0.0000      4.3400
+   1274.6010   1443.5000      0.0000      4.3400
+   1274.7289   1488.9900     34.9500      4.3400
+   1274.8569   1488.9900     34.9500      4.3400
+   1274.9850   1488.9900     34.9500      4.3400
+   1275.1130   1488.9900     34.9500      4.3400
+   1275.2411   1488.9900     34.9500      4.3400
+   1275.3691   1489.0000     34.9500      4.3400
+   1275.4972   1489.0000     34.9500      4.3400
+   1275.6251   1489.0000     34.9500      4.3400
+   1275.7532   1489.0000     34.9500      4.3400
+   1275.8812   1489.0100     34.9500      4.3400
+   1276.0092   1489.0100     34.9500      4.3400
+   1276.1372   1489.0100     34.9500      4.3400
+   1276.2653   1489.0100     34.9500      4.3400
+   1276.3933   1489.0100     34.9500      4.3400
+   1276.5214   1489.0100     34.9500      4.3400
+   1276.6494   1489.0200     34.9500      4.3400
+   1276.7775   1489.0200     34.9500      4.3400
+   1276.9054   1489.0200     34.9500      4.3400
+   1277.0334   1489.0200     34.9500      4.3400
+   1277.1615   1489.0200     34.9500      4.3400
+   1277.2896   1489.0300     34.9500      4.3400
+   1277.4175   1489.0300     34.9500      4.3400
+   1277.5455   1489.0300     34.9500      4.3400
+   1277.6736   1489.0300     34.9500      4.3400
+   1277.8015   1470.0800     34.9500      0.0000
+   1279.7216   1443.5400      0.0000      4.3300
+   1279.8496   1443.5400      0.0000      4.3300
+   1279.9777   1443.5400      0.0000      4.3300
+   1280.1056   1489.0400     34.9500      4.3300
+   1280.2335   1489.0400     34.9500      4.3300
+   1280.3616   1489.0400     34.9500      4.3300
+   1280.4896   1489.0400     34.9500      4.3300
+   1280.6176   1489.0400     34.9500      4.3300
+   1280.7456   1489.0400     34.9500      4.3300
+   1280.8735   1489.0500     34.9500      4.3300
+   1281.0016   1489.0500     34.9500      4.3300
+   1281.1295   1489.0500     34.9500      4.3300
+   1281.2576   1489.0500     34.9500      4.3300
+   1281.3855   1489.0500     34.9500      4.3300
+   1281.5134   1489.0600     34.9500      4.3300
+   1281.6415   1489.0600     34.9500      4.3300
+   1281.7694   1489.0600     34.9500      4.3300
+   1281.8975   1489.0600     34.9500      4.3300
+   1282.0254   1489.0600     34.9500      4.3300
+   1282.1534   1489.0700     34.9500      4.3300
+   1282.2814   1489.0700     34.9500      4.3300
+   1282.4093   1489.0700     34.9500      4.3300
+   1282.5374   1489.0700     34.9500      4.3300
+   1282.6653   1489.0700     34.9500      4.3300
+   1282.7933   1489.0800     34.9500      4.3300
+   1282.9213   1489.0800     34.9500      4.3300
+   1283.0492   1489.0800     34.9500      4.3300
+   1283.1772   1489.0800     34.9500      4.3300
+   1283.3052   1489.0900     34.9500      4.3300
+   1283.4331   1489.0900     34.9500      4.3300
+   1283.5612   1489.1000     34.9500      4.3300
+   1283.6891   1489.1100     34.9500      4.3300
+   1283.8170   1489.1200     34.9500      4.3400
+   1283.9449   1489.1200     34.9400      4.3400
+   1284.0730   1489.1300     34.9400      4.3400
+   1284.2009   1489.1400     34.9400      4.3400
+   1284.3289   1470.1800     34.9400      0.0000
+   1285.4806   1443.5800      0.0000      4.3200
+   1285.6084   1443.5900      0.0000      4.3200
+   1285.7365   1443.5900      0.0000      4.3200
+   1285.8644   1489.1000     34.9600      4.3200
+   1285.9924   1489.1000     34.9600      4.3200
+   1286.1202   1489.1000     34.9600      4.3200
+   1286.2482   1489.1000     34.9600      4.3200
+   1286.3762   1489.1100     34.9600      4.3200
+   1286.5042   1489.1100     34.9600      4.3200
+   1286.6321   1489.1100     34.9600      4.3200
+   1286.7600   1489.1100     34.9600      4.3200
+   1286.8879   1489.1100     34.9600      4.3200
+   1287.0159   1489.1100     34.9600      4.3200
+   1287.1438   1489.1200     34.9600      4.3200
+   1287.2719   1489.1200     34.9600      4.3200
+   1287.3998   1489.1200     34.9500      4.3200
+   1287.5276   1489.1200     34.9500      4.3200
+   1287.6556   1489.1200     34.9500      4.3200
+   1287.7836   1489.1300     34.9600      4.3200
+   1287.9114   1489.1300     34.9500      4.3200
+   1288.0394   1489.1300     34.9500      4.3200
+   1288.1674   1489.1300     34.9500      4.3200
+   1288.2953   1489.1300     34.9500      4.3200
+   1288.4232   1489.1300     34.9500      4.3200
+   1288.5511   1489.1400     34.9500      4.3200
+   1288.6791   1489.1400     34.9500      4.3200
+   1288.8069   1489.1400     34.9500      4.3200
+   1288.9349   1489.1300     34.9500      4.3200
+   1289.0629   1489.1400     34.9500      4.3200
+   1289.1908   1489.1400     34.9500      4.3200
+   1289.3186   1489.1400     34.9500      4.3200
+   1289.4467   1489.1400     34.9500      4.3200
+   1289.5746   1489.1300     34.9400      4.3200
+   1289.7025   1489.1400     34.9400      4.3200
+   1289.8303   1489.4200     34.9400      4.3900
+   1289.9583   1489.6700     34.9100      4.4600
+   1290.0863   1489.7200     34.8300      4.4900
+   1290.2141   1489.8000     34.7800      4.5300
+   1290.3420   1490.0400     34.7400      4.6000
+   1290.4700   1490.1100     34.6900      4.6300
+   1290.5979   1490.3300     34.6300      4.7000
+   1290.7258   1490.4100     34.5800      4.7400
+   1290.8538   1490.4800     34.5200      4.7700
+   1290.9817   1490.2900     34.4900      4.7400
+   1291.1095   1490.1500     34.4900      4.7000
+   1291.2374   1490.1900     34.5200      4.7000
+   1291.3654   1490.2200     34.5400      4.7000
+   1291.4933   1490.0800     34.5400      4.6700
+   1291.6211   1490.1100     34.5600      4.6700
+   1291.7490   1489.9800     34.5800      4.6300
+   1291.8770   1490.0100     34.6000      4.6300
+   1292.0049   1469.8700     34.6200      0.0000
+   1293.1560   1443.6600      0.0000      4.3100
+   1293.2839   1443.6600      0.0000      4.3100
+   1293.4117   1443.6700      0.0000      4.3100
+   1293.5397   1489.1700     34.9500      4.3100
+   1293.6676   1489.1800     34.9500      4.3100
+   1293.7954   1489.1700     34.9500      4.3100
+   1293.9233   1489.1800     34.9500      4.3100
+   1294.0511   1489.1800     34.9500      4.3100
+   1294.1791   1489.1800     34.9500      4.3100
+   1294.3069   1489.1900     34.9500      4.3100
+   1294.4348   1489.1900     34.9500      4.3100
+   1294.5627   1489.1900     34.9500      4.3100
+   1294.6907   1489.1900     34.9500      4.3100
+   1294.8185   1489.1900     34.9500      4.3100
+   1294.9464   1489.2000     34.9500      4.3100
+   1295.0743   1489.2000     34.9500      4.3100
+   1295.2021   1489.2000     34.9500      4.3100
+   1295.3300   1489.2000     34.9500      4.3100
+   1295.4579   1489.2000     34.9500      4.3100
+   1295.5858   1489.2100     34.9500      4.3100
+   1295.7136   1489.5000     34.9500      4.3800
+   1295.8416   1489.6000     34.9100      4.4200
+   1295.9694   1489.6700     34.8600      4.4500
+   1296.0973   1489.7700     34.8200      4.4900
+   1296.2251   1489.8700     34.7800      4.5200
+   1296.3530   1489.9700     34.7400      4.5600
+   1296.4810   1490.0700     34.7100      4.5900
+   1296.6088   1490.1700     34.6700      4.6300
+   1296.7366   1490.2700     34.6300      4.6600
+   1296.8645   1490.0800     34.6000      4.6300
+   1296.9924   1469.9300     34.6000      0.0000
+   1298.1431   1443.7400      0.0000      4.3100
+   1298.2710   1443.7400      0.0000      4.3100
+   1298.3988   1443.7500      0.0000      4.3100
+   1298.5266   1489.2600     34.9500      4.3100
+   1298.6545   1489.2600     34.9500      4.3100
+   1298.7823   1489.2600     34.9500      4.3100
+   1298.9102   1489.2600     34.9500      4.3100
+   1299.0381   1489.2600     34.9500      4.3100
+   1299.1659   1489.2600     34.9500      4.3100
+   1299.2938   1489.2700     34.9500      4.3100
+   1299.4215   1489.2700     34.9500      4.3100
+   1299.5494   1489.2700     34.9400      4.3100
+   1299.6774   1489.2700     34.9400      4.3100
+   1299.8051   1489.2700     34.9400      4.3100
+   1299.9330   1489.2700     34.9400      4.3100
+   1300.0608   1489.2700     34.9400      4.3100
+   1300.1887   1489.2800     34.9400      4.3100
+   1300.3164   1489.2800     34.9400      4.3100
+   1300.4443   1489.2800     34.9400      4.3100
+   1300.5721   1489.2800     34.9400      4.3100
+   1300.7000   1489.2900     34.9400      4.3100
+   1300.8278   1489.2900     34.9400      4.3100
+   1300.9557   1489.2900     34.9400      4.3100
+   1301.0835   1489.5800     34.9400      4.3800
+   1301.2113   1489.8300     34.9100      4.4500
+   1301.3391   1489.8800     34.8300      4.4900
+   1301.4670   1490.1000     34.7800      4.5600
+   1301.5947   1490.1800     34.7200      4.5900
+   1301.7227   1490.1100     34.6700      4.5900
+   1301.8505   1490.3700     34.6500      4.6600
+   1301.9784   1470.0400     34.6100      0.0000
+   1303.8955   1443.8400      0.0000      4.3100
+   1304.0233   1443.8400      0.0000      4.3100
+   1304.1512   1443.8400      0.0000      4.3100
+   1304.2791   1489.3500     34.9500      4.3100
+   1304.4067   1489.3500     34.9500      4.3100
+   1304.5347   1489.3500     34.9500      4.3100
+   1304.6625   1489.3600     34.9500      4.3100
+   1304.7902   1489.3600     34.9500      4.3100
+   1304.9180   1489.3600     34.9500      4.3100
+   1305.0459   1489.3600     34.9500      4.3100
+   1305.1737   1489.3600     34.9500      4.3100
+   1305.3014   1489.3600     34.9500      4.3100
+   1305.4292   1489.3700     34.9500      4.3100
+   1305.5570   1489.3700     34.9500      4.3100
+   1305.6848   1489.3700     34.9400      4.3100
+   1305.8126   1489.3700     34.9400      4.3100
+   1305.9404   1489.3700     34.9400      4.3100
+   1306.0682   1489.3800     34.9500      4.3100
+   1306.1959   1489.3800     34.9500      4.3100
+   1306.3237   1489.3800     34.9500      4.3100
+   1306.4517   1489.3800     34.9500      4.3100
+   1306.5795   1489.3800     34.9400      4.3100
+   1306.7072   1489.3900     34.9500      4.3100
+   1306.8350   1489.3900     34.9500      4.3100
+   1306.9628   1470.5700     34.9500      0.0000
+   1308.1128   1443.9000      0.0000      4.3100
+   1308.2406   1443.9100      0.0000      4.3100
+   1308.3684   1443.9100      0.0000      4.3100
+   1308.4961   1489.4300     34.9500      4.3100
+   1308.6239   1489.4300     34.9500      4.3100
+   1308.7517   1489.4300     34.9500      4.3100
+   1308.8795   1489.4300     34.9500      4.3100
+   1309.0072   1489.4300     34.9500      4.3100
+   1309.1350   1489.4300     34.9500      4.3100
+   1309.2628   1489.4300     34.9500      4.3100
+   1309.3905   1489.4300     34.9500      4.3100
+   1309.5183   1470.6200     34.9500      0.0000
+   1315.2668   1443.9300      0.0000      4.2900
+   1315.3945   1443.9300      0.0000      4.2900
+   1315.5222   1443.9400      0.0000      4.2900
+   1315.6500   1489.4700     34.9600      4.2900
+   1315.7777   1489.4700     34.9600      4.2900
+   1315.9054   1489.4700     34.9600      4.2900
+   1316.0331   1489.4800     34.9600      4.2900
+   1316.1609   1489.4800     34.9600      4.2900
+   1316.2886   1489.4800     34.9600      4.2900
+   1316.4163   1489.4800     34.9600      4.2900
+   1316.5441   1489.4800     34.9600      4.2900
+   1316.6716   1489.4900     34.9600      4.2900
+   1316.7994   1489.4900     34.9600      4.2900
+   1316.9271   1470.7500     34.9600      0.0000
+   1318.0764   1443.9700      0.0000      4.2900
+   1318.2041   1443.9800      0.0000      4.2900
+   1318.3319   1443.9800      0.0000      4.2900
+   1318.4596   1489.5000     34.9500      4.2900
+   1318.5873   1489.5000     34.9500      4.2900
+   1318.7150   1489.5100     34.9500      4.2900
+   1318.8427   1489.5100     34.9500      4.2900
+   1318.9703   1489.5100     34.9500      4.2900
+   1319.0980   1489.5200     34.9500      4.2900
+   1319.2257   1489.5200     34.9500      4.2900
+   1319.3535   1489.5200     34.9500      4.2900
+   1319.4811   1489.5300     34.9500      4.2900
+   1319.6088   1489.5200     34.9500      4.2900
+   1319.7366   1489.5300     34.9500      4.2900
+   1319.8641   1489.5300     34.9500      4.2900
+   1319.9918   1489.5300     34.9500      4.2900
+   1320.1195   1489.5300     34.9500      4.2900
+   1320.2473   1489.5300     34.9500      4.2900
+   1320.3749   1489.5300     34.9500      4.2900
+   1320.5026   1489.5300     34.9500      4.2900
+   1320.6302   1489.5300     34.9400      4.2900
+   1320.7579   1489.5300     34.9500      4.2900
+   1320.8856   1489.5300     34.9400      4.2900
+   1321.0133   1489.5400     34.9500      4.2900
+   1321.1410   1489.5400     34.9500      4.2900
+   1321.2687   1489.5400     34.9500      4.2900
+   1321.3964   1489.5500     34.9500      4.2900
+   1321.5240   1470.8200     34.9500      0.0000
+   1323.4391   1444.0300      0.0000      4.2800
+   1323.5667   1444.0300      0.0000      4.2800
+   1323.6943   1444.0300      0.0000      4.2800
+   1323.8220   1489.5600     34.9500      4.2800
+   1323.9496   1489.5600     34.9500      4.2800
+   1324.0773   1489.5600     34.9500      4.2800
+   1324.2050   1489.5600     34.9500      4.2800
+   1324.3326   1489.5600     34.9500      4.2800
+   1324.4602   1489.5600     34.9500      4.2800
+   1324.5879   1489.5700     34.9500      4.2800
+   1324.7156   1489.5700     34.9500      4.2800
+   1324.8433   1489.5700     34.9500      4.2800
+   1324.9708   1489.5700     34.9500      4.2800
+   1325.0985   1489.5700     34.9500      4.2800
+   1325.2262   1489.5800     34.9500      4.2800
+   1325.3538   1489.5800     34.9500      4.2800
+   1325.4814   1489.5800     34.9500      4.2800
+   1325.6091   1489.5800     34.9500      4.2800
+   1325.7368   1489.5800     34.9500      4.2800
+   1325.8644   1489.5800     34.9500      4.2800
+   1325.9919   1489.5900     34.9500      4.2800
+   1326.1196   1489.5900     34.9500      4.2800
+   1326.2472   1489.5900     34.9500      4.2800
+   1326.3749   1489.5900     34.9400      4.2800
+   1326.5026   1489.5900     34.9400      4.2800
+   1326.6302   1489.5900     34.9400      4.2800
+   1326.7578   1489.5900     34.9400      4.2800
+   1326.8855   1489.5900     34.9400      4.2800
+   1327.0131   1489.6000     34.9400      4.2800
+   1327.1406   1489.6000     34.9400      4.2800
+   1327.2683   1489.6000     34.9400      4.2800
+   1327.3960   1489.6000     34.9400      4.2800
+   1327.5237   1489.6100     34.9400      4.2800
+   1327.6512   1489.6100     34.9400      4.2800
+   1327.7788   1489.6100     34.9400      4.2800
+   1327.9065   1489.6100     34.9400      4.2800
+   1328.0342   1489.6100     34.9400      4.2800
+   1328.1617   1489.6100     34.9400      4.2800
+   1328.2893   1489.6100     34.9400      4.2800
+   1328.4170   1489.6200     34.9500      4.2800
+   1328.5446   1489.6200     34.9500      4.2800
+   1328.6722   1489.6200     34.9500      4.2800
+   1328.7998   1489.6200     34.9500      4.2800
+   1328.9275   1489.6200     34.9500      4.2800
+   1329.0551   1489.6300     34.9500      4.2800
+   1329.1826   1489.6200     34.9500      4.2800
+   1329.3103   1489.6300     34.9500      4.2800
+   1329.4379   1489.6300     34.9500      4.2800
+   1329.5656   1489.6300     34.9500      4.2800
+   1329.6931   1489.6300     34.9500      4.2800
+   1329.8208   1489.6400     34.9500      4.2800
+   1329.9484   1489.6400     34.9500      4.2800
+   1330.0759   1489.6400     34.9400      4.2800
+   1330.2036   1489.6400     34.9400      4.2800
+   1330.3311   1489.6500     34.9500      4.2800
+   1330.4587   1489.6500     34.9400      4.2800
+   1330.5864   1489.6600     34.9400      4.2800
+   1330.7140   1489.6600     34.9400      4.2800
+   1330.8416   1489.6600     34.9400      4.2800
+   1330.9691   1489.6600     34.9400      4.2800
+   1331.0968   1489.6600     34.9400      4.2800
+   1331.2244   1489.6700     34.9400      4.2800
+   1331.3519   1489.6700     34.9400      4.2800
+   1331.4796   1489.6700     34.9400      4.2800
+   1331.6072   1489.6700     34.9400      4.2800
+   1331.7347   1489.6700     34.9400      4.2800
+   1331.8623   1489.6800     34.9400      4.2800
+   1331.9900   1489.6800     34.9400      4.2800
+   1332.1176   1489.6800     34.9400      4.2800
+   1332.2451   1489.6900     34.9400      4.2800
+   1332.3727   1489.6900     34.9400      4.2800
+   1332.5004   1489.6900     34.9400      4.2800
+   1332.6278   1489.6900     34.9400      4.2800
+   1332.7555   1489.6900     34.9400      4.2800
+   1332.8831   1489.7000     34.9400      4.2800
+   1333.0107   1489.7000     34.9400      4.2800
+   1333.1382   1489.7000     34.9400      4.2800
+   1333.2659   1489.7100     34.9400      4.2800
+   1333.3934   1489.7100     34.9400      4.2800
+   1333.5210   1489.7100     34.9400      4.2800
+   1333.6486   1489.7100     34.9500      4.2800
+   1333.7761   1489.7200     34.9500      4.2800
+   1333.9038   1489.7200     34.9500      4.2800
+   1334.0312   1489.7200     34.9500      4.2800
+   1334.1588   1489.8700     34.9500      4.3200
+   1334.2865   1490.0000     34.9300      4.3500
+   1334.4141   1490.1000     34.8900      4.3900
+   1334.5416   1490.2000     34.8600      4.4200
+   1334.6692   1490.3000     34.8300      4.4600
+   1334.7968   1490.2600     34.7900      4.4600
+   1334.9243   1490.2300     34.7700      4.4600
+   1335.0519   1490.2400     34.7700      4.4600
+   1335.1794   1490.2400     34.7700      4.4600
+   1335.3070   1490.1000     34.7700      4.4200
+   1335.4346   1489.9800     34.7900      4.3900
+   1335.5621   1489.8800     34.8300      4.3500
+   1335.6897   1489.7900     34.8600      4.3200
+   1335.8173   1489.6900     34.9000      4.2800
+   1335.9448   1489.7300     34.9300      4.2800
+   1336.0724   1489.7600     34.9500      4.2800
+   1336.2000   1489.7600     34.9500      4.2800
+   1336.3275   1489.7700     34.9500      4.2800
+   1336.4551   1489.7700     34.9500      4.2800
+   1336.5826   1489.7700     34.9500      4.2800
+   1336.7102   1489.7700     34.9500      4.2800
+   1336.8378   1489.7800     34.9500      4.2800
+   1336.9653   1489.7800     34.9500      4.2800
+   1337.0929   1489.7800     34.9600      4.2800
+   1337.2203   1489.7900     34.9600      4.2800
+   1337.3479   1489.7900     34.9600      4.2800
+   1337.4756   1489.7900     34.9600      4.2800
+   1337.6031   1489.7900     34.9600      4.2800
+   1337.7306   1489.7900     34.9600      4.2800
+   1337.8582   1489.8000     34.9600      4.2800
+   1337.9857   1489.8000     34.9600      4.2800
+   1338.1132   1489.8000     34.9600      4.2800
+   1338.2407   1489.8000     34.9600      4.2800
+   1338.3684   1489.8000     34.9600      4.2800
+   1338.4960   1489.8100     34.9600      4.2800
+   1338.6234   1489.8100     34.9600      4.2800
+   1338.7510   1489.8100     34.9600      4.2800
+   1338.8785   1489.8100     34.9500      4.2800
+   1339.0060   1489.8100     34.9500      4.2800
+   1339.1335   1489.8100     34.9500      4.2800
+   1339.2611   1489.8100     34.9500      4.2800
+   1339.3887   1489.8100     34.9500      4.2800
+   1339.5161   1471.1200     34.9500      0.0000
+   1340.6639   1444.2500      0.0000      4.2700
+   1340.7915   1444.2500      0.0000      4.2700
+   1340.9189   1444.2600      0.0000      4.2700
+   1341.0465   1489.8000     34.9500      4.2700
+   1341.1741   1489.8000     34.9500      4.2700
+   1341.3015   1489.8000     34.9500      4.2700
+   1341.4291   1489.8000     34.9500      4.2700
+   1341.5566   1489.8100     34.9500      4.2700
+   1341.6842   1489.8100     34.9500      4.2700
+   1341.8116   1489.8100     34.9500      4.2700
+   1341.9392   1489.8100     34.9500      4.2700
+   1342.0667   1489.8100     34.9500      4.2700
+   1342.1941   1489.8200     34.9500      4.2700
+   1342.3217   1489.8200     34.9500      4.2700
+   1342.4492   1489.8200     34.9500      4.2700
+   1342.5768   1489.8200     34.9500      4.2700
+   1342.7042   1489.8200     34.9500      4.2700
+   1342.8318   1489.8300     34.9500      4.2700
+   1342.9592   1489.8300     34.9500      4.2700
+   1343.0867   1489.8300     34.9500      4.2700
+   1343.2142   1489.8300     34.9500      4.2700
+   1343.3418   1489.8300     34.9500      4.2700
+   1343.4692   1489.8400     34.9500      4.2700
+   1343.5967   1489.8400     34.9500      4.2700
+   1343.7242   1489.8400     34.9500      4.2700
+   1343.8518   1489.8400     34.9500      4.2700
+   1343.9794   1489.8400     34.9500      4.2700
+   1344.1067   1489.8500     34.9500      4.2700
+   1344.2343   1489.8500     34.9500      4.2700
+   1344.3618   1489.8500     34.9500      4.2700
+   1344.4893   1489.8500     34.9500      4.2700
+   1344.6167   1489.8500     34.9500      4.2700
+   1344.7443   1489.8600     34.9500      4.2700
+   1344.8718   1489.8600     34.9500      4.2700
+   1344.9991   1489.8600     34.9500      4.2700
+   1345.1267   1489.8600     34.9500      4.2700
+   1345.2543   1471.2100     34.9500      0.0000
+   1346.4016   1444.3200      0.0000      4.2700
+   1346.5291   1444.3200      0.0000      4.2700
+   1346.6566   1444.3200      0.0000      4.2600
+   1346.7839   1489.8700     34.9500      4.2600
+   1346.9115   1489.8700     34.9500      4.2600
+   1347.0389   1489.8700     34.9500      4.2600
+   1347.1665   1489.8700     34.9500      4.2600
+   1347.2939   1489.8700     34.9500      4.2600
+   1347.4214   1489.8700     34.9500      4.2600
+   1347.5490   1489.8800     34.9500      4.2600
+   1347.6763   1489.8800     34.9500      4.2600
+   1347.8038   1489.8800     34.9500      4.2600
+   1347.9313   1489.8800     34.9500      4.2600
+   1348.0588   1489.8800     34.9500      4.2600
+   1348.1862   1489.8800     34.9500      4.2600
+   1348.3137   1489.8900     34.9500      4.2600
+   1348.4412   1489.8900     34.9500      4.2600
+   1348.5686   1489.8900     34.9500      4.2600
+   1348.6960   1489.8900     34.9500      4.2600
+   1348.8235   1489.8900     34.9500      4.2600
+   1348.9510   1489.9000     34.9500      4.2600
+   1349.0784   1489.9000     34.9500      4.2600
+   1349.2059   1489.9100     34.9500      4.2600
+   1349.3334   1489.9100     34.9500      4.2600
+   1349.4608   1489.9200     34.9500      4.2700
+   1349.5883   1489.9200     34.9500      4.2700
+   1349.7157   1489.9300     34.9500      4.2700
+   1349.8433   1471.2900     34.9500      0.0000
+   1351.7549   1444.3800      0.0000      4.2600
+   1351.8823   1444.3900      0.0000      4.2600
+   1352.0098   1444.3900      0.0000      4.2600
+   1352.1372   1489.9500     34.9500      4.2600
+   1352.2646   1489.9500     34.9500      4.2600
+   1352.3921   1489.9500     34.9500      4.2600
+   1352.5195   1489.9500     34.9500      4.2600
+   1352.6469   1489.9500     34.9500      4.2600
+   1352.7743   1489.9600     34.9500      4.2600
+   1352.9019   1489.9600     34.9500      4.2600
+   1353.0293   1489.9600     34.9500      4.2600
+   1353.1566   1489.9600     34.9500      4.2600
+   1353.2841   1489.9700     34.9500      4.2600
+   1353.4115   1489.9700     34.9500      4.2600
+   1353.5389   1489.9700     34.9500      4.2600
+   1353.6664   1489.9700     34.9500      4.2600
+   1353.7938   1489.9700     34.9500      4.2600
+   1353.9213   1489.9800     34.9500      4.2600
+   1354.0486   1489.9800     34.9500      4.2600
+   1354.1760   1489.9800     34.9500      4.2600
+   1354.3035   1489.9800     34.9500      4.2600
+   1354.4309   1489.9900     34.9500      4.2600
+   1354.5582   1489.9900     34.9500      4.2600
+   1354.6857   1490.0000     34.9500      4.2600
+   1354.8131   1490.0000     34.9500      4.2700
+   1354.9406   1490.0100     34.9500      4.2700
+   1355.0680   1490.0100     34.9500      4.2700
+   1355.1954   1490.0200     34.9400      4.2700
+   1355.3229   1490.0200     34.9400      4.2700
+   1355.4502   1490.0300     34.9400      4.2700
+   1355.5776   1490.0300     34.9400      4.2700
+   1355.7051   1490.0300     34.9400      4.2700
+   1355.8324   1490.0300     34.9400      4.2700
+   1355.9598   1471.3800     34.9400      0.0000
+   1357.1064   1444.4700      0.0000      4.2600
+   1357.2338   1444.4700      0.0000      4.2600
+   1357.3612   1444.4800      0.0000      4.2600
+   1357.4886   1490.0300     34.9500      4.2600
+   1357.6161   1490.0300     34.9500      4.2600
+   1357.7434   1490.0400     34.9500      4.2600
+   1357.8708   1490.0300     34.9500      4.2600
+   1357.9982   1490.0400     34.9500      4.2600
+   1358.1255   1490.0400     34.9500      4.2600
+   1358.2529   1490.0400     34.9500      4.2600
+   1358.3804   1490.0400     34.9500      4.2600
+   1358.5078   1490.0400     34.9500      4.2600
+   1358.6351   1490.0400     34.9500      4.2600
+   1358.7625   1490.0400     34.9500      4.2600
+   1358.8899   1490.0300     34.9500      4.2600
+   1359.0172   1490.0400     34.9500      4.2600
+   1359.1447   1490.0400     34.9500      4.2500
+   1359.2721   1490.0300     34.9500      4.2500
+   1359.3994   1490.0300     34.9500      4.2500
+   1359.5267   1490.0300     34.9500      4.2500
+   1359.6542   1490.0300     34.9500      4.2500
+   1359.7816   1490.0300     34.9500      4.2500
+   1359.9089   1490.0300     34.9500      4.2500
+   1360.0363   1490.0300     34.9500      4.2500
+   1360.1637   1471.4600     34.9500      0.0000
+   1362.0742   1444.5100      0.0000      4.2500
+   1362.2015   1444.5100      0.0000      4.2500
+   1362.3289   1444.5100      0.0000      4.2500
+   1362.4563   1471.5100     34.9500      0.0000
+   1363.6024   1444.5300      0.0000      4.2500
+   1363.7297   1444.5300      0.0000      4.2500
+   1363.8571   1444.5300      0.0000      4.2500
+   1363.9845   1471.5200     34.9500      0.0000
+   1365.8944   1444.5200      0.0000      4.2400
+   1366.0219   1444.5200      0.0000      4.2400
+   1366.1492   1444.5300      0.0000      4.2400
+   1366.2765   1490.1000     34.9500      4.2400
+   1366.4038   1490.1000     34.9500      4.2400
+   1366.5311   1490.1000     34.9500      4.2400
+   1366.6584   1490.1100     34.9500      4.2400
+   1366.7858   1490.1100     34.9500      4.2400
+   1366.9131   1490.1100     34.9500      4.2400
+   1367.0404   1490.1100     34.9500      4.2400
+   1367.1677   1490.1100     34.9500      4.2400
+   1367.2950   1490.1200     34.9500      4.2400
+   1367.4224   1490.1200     34.9500      4.2400
+   1367.5497   1490.1100     34.9500      4.2400
+   1367.6769   1490.1200     34.9500      4.2400
+   1367.8043   1490.1200     34.9500      4.2400
+   1367.9316   1490.1200     34.9500      4.2400
+   1368.0590   1490.1200     34.9500      4.2400
+   1368.1862   1490.1300     34.9500      4.2400
+   1368.3136   1490.1300     34.9500      4.2400
+   1368.4409   1490.1300     34.9500      4.2400
+   1368.5681   1490.1300     34.9500      4.2400
+   1368.6954   1490.1300     34.9500      4.2400
+   1368.8228   1490.1400     34.9500      4.2400
+   1368.9501   1490.1400     34.9500      4.2400
+   1369.0774   1490.1400     34.9500      4.2400
+   1369.2047   1471.6100     34.9500      0.0000
+   1371.6233   1444.6200      0.0000      4.2400
+   1371.7505   1444.6200      0.0000      4.2400
+   1371.8778   1444.6200      0.0000      4.2400
+   1372.0051   1490.1900     34.9500      4.2400
+   1372.1324   1490.1900     34.9500      4.2400
+   1372.2596   1490.1900     34.9500      4.2400
+   1372.3870   1490.2000     34.9500      4.2400
+   1372.5143   1490.2000     34.9500      4.2400
+   1372.6416   1490.2000     34.9500      4.2400
+   1372.7688   1490.2000     34.9500      4.2400
+   1372.8961   1490.2000     34.9500      4.2400
+   1373.0233   1490.2000     34.9400      4.2400
+   1373.1505   1490.2000     34.9400      4.2400
+   1373.2778   1490.2100     34.9400      4.2400
+   1373.4052   1490.2100     34.9400      4.2400
+   1373.5325   1490.2100     34.9400      4.2400
+   1373.6597   1490.2100     34.9400      4.2400
+   1373.7870   1490.2100     34.9400      4.2400
+   1373.9142   1490.2200     34.9400      4.2400
+   1374.0414   1490.2200     34.9400      4.2400
+   1374.1687   1490.2200     34.9400      4.2400
+   1374.2960   1490.2200     34.9400      4.2400
+   1374.4233   1490.2300     34.9400      4.2400
+   1374.5505   1490.2300     34.9400      4.2400
+   1374.6777   1490.2300     34.9400      4.2400
+   1374.8051   1471.7000     34.9400      0.0000
+   1376.9683   1444.7000      0.0000      4.2400
+   1377.0956   1444.7000      0.0000      4.2400
+   1377.2228   1444.7000      0.0000      4.2400
+   1377.3500   1490.2700     34.9500      4.2400
+   1377.4773   1490.2700     34.9400      4.2400
+   1377.6046   1490.2700     34.9400      4.2400
+   1377.7317   1490.2700     34.9500      4.2400
+   1377.8590   1490.2700     34.9500      4.2400
+   1377.9862   1490.2700     34.9500      4.2400
+   1378.1134   1490.2800     34.9500      4.2400
+   1378.2407   1490.2700     34.9500      4.2400
+   1378.3679   1490.2800     34.9500      4.2400
+   1378.4952   1490.2800     34.9500      4.2400
+   1378.6223   1490.2700     34.9500      4.2400
+   1378.7496   1490.2800     34.9500      4.2400
+   1378.8768   1490.2800     34.9500      4.2400
+   1379.0042   1490.2800     34.9500      4.2400
+   1379.1312   1490.2800     34.9500      4.2300
+   1379.2585   1490.2800     34.9500      4.2300
+   1379.3857   1490.2800     34.9500      4.2300
+   1379.5129   1490.2800     34.9500      4.2300
+   1379.6401   1490.2800     34.9500      4.2300
+   1379.7675   1490.2900     34.9500      4.2300
+   1379.8947   1490.2800     34.9500      4.2300
+   1380.0219   1490.2900     34.9500      4.2300
+   1380.1490   1490.2900     34.9500      4.2300
+   1380.2764   1490.2900     34.9500      4.2300
+   1380.4034   1490.2900     34.9500      4.2300
+   1380.5308   1490.3000     34.9500      4.2300
+   1380.6580   1490.3000     34.9500      4.2300
+   1380.7852   1490.3000     34.9500      4.2300
+   1380.9124   1490.3000     34.9500      4.2300
+   1381.0396   1490.3000     34.9500      4.2300
+   1381.1667   1471.8100     34.9500      0.0000
+   1382.3116   1444.7400      0.0000      4.2300
+   1382.4388   1444.7500      0.0000      4.2300
+   1382.5660   1444.7500      0.0000      4.2300
+   1382.6932   1490.3300     34.9500      4.2300
+   1382.8204   1490.3300     34.9500      4.2300
+   1382.9476   1490.3300     34.9500      4.2300
+   1383.0748   1490.3400     34.9500      4.2300
+   1383.2020   1490.3400     34.9500      4.2300
+   1383.3292   1490.3400     34.9500      4.2300
+   1383.4564   1490.3400     34.9500      4.2300
+   1383.5835   1490.3400     34.9500      4.2300
+   1383.7108   1490.3500     34.9500      4.2300
+   1383.8380   1490.3500     34.9500      4.2300
+   1383.9652   1490.3500     34.9500      4.2300
+   1384.0923   1490.3500     34.9500      4.2300
+   1384.2195   1490.3500     34.9500      4.2300
+   1384.3467   1490.3600     34.9500      4.2300
+   1384.4739   1490.3600     34.9500      4.2300
+   1384.6011   1490.3600     34.9500      4.2300
+   1384.7283   1490.3600     34.9500      4.2300
+   1384.8555   1490.3600     34.9500      4.2300
+   1384.9825   1490.3700     34.9500      4.2300
+   1385.1097   1490.3700     34.9500      4.2300
+   1385.2371   1490.3700     34.9500      4.2300
+   1385.3643   1490.3700     34.9500      4.2300
+   1385.4913   1490.3700     34.9500      4.2300
+   1385.6185   1490.3800     34.9500      4.2300
+   1385.7457   1490.3800     34.9500      4.2300
+   1385.8728   1490.3800     34.9500      4.2300
+   1386.0000   1490.3800     34.9500      4.2300
+   1386.1272   1490.3800     34.9500      4.2300
+   1386.2544   1490.3900     34.9500      4.2300
+   1386.3815   1490.3900     34.9500      4.2300
+   1386.5087   1471.9000     34.9500      0.0000
+   1387.6531   1444.8300      0.0000      4.2300
+   1387.7803   1444.8300      0.0000      4.2300
+   1387.9075   1444.8400      0.0000      4.2300
+   1388.0347   1490.4200     34.9500      4.2300
+   1388.1617   1490.4200     34.9500      4.2300
+   1388.2889   1490.4200     34.9500      4.2300
+   1388.4161   1490.4200     34.9500      4.2300
+   1388.5433   1490.4200     34.9500      4.2300
+   1388.6704   1490.4300     34.9500      4.2300
+   1388.7976   1490.4300     34.9500      4.2300
+   1388.9248   1490.4300     34.9500      4.2300
+   1389.0519   1490.4300     34.9500      4.2300
+   1389.1790   1490.4300     34.9500      4.2300
+   1389.3062   1490.4300     34.9500      4.2300
+   1389.4333   1490.4300     34.9500      4.2300
+   1389.5604   1490.4400     34.9500      4.2300
+   1389.6876   1490.4300     34.9500      4.2300
+   1389.8148   1490.4400     34.9500      4.2300
+   1389.9419   1490.4400     34.9500      4.2300
+   1390.0690   1490.4400     34.9500      4.2300
+   1390.1962   1490.4400     34.9500      4.2300
+   1390.3234   1490.4400     34.9500      4.2300
+   1390.4504   1490.4400     34.9500      4.2300
+   1390.5775   1490.4400     34.9500      4.2300
+   1390.7047   1490.4400     34.9500      4.2300
+   1390.8318   1490.4500     34.9500      4.2300
+   1390.9590   1490.4500     34.9500      4.2300
+   1391.0862   1490.4500     34.9500      4.2300
+   1391.2133   1490.4500     34.9500      4.2300
+   1391.3403   1490.4600     34.9500      4.2300
+   1391.4675   1490.4600     34.9500      4.2300
+   1391.5946   1490.4600     34.9500      4.2300
+   1391.7218   1490.4700     34.9500      4.2300
+   1391.8489   1490.4700     34.9500      4.2300
+   1391.9761   1490.4700     34.9500      4.2300
+   1392.1031   1490.4800     34.9500      4.2300
+   1392.2302   1472.0000     34.9500      0.0000
+   1394.8997   1444.9200      0.0000      4.2300
+   1395.0267   1444.9200      0.0000      4.2200
+   1395.1538   1444.9200      0.0000      4.2200
+   1395.2810   1490.5100     34.9500      4.2200
+   1395.4080   1490.5100     34.9500      4.2200
+   1395.5352   1490.5100     34.9500      4.2200
+   1395.6622   1490.5100     34.9500      4.2200
+   1395.7894   1490.5100     34.9500      4.2200
+   1395.9164   1490.5100     34.9500      4.2200
+   1396.0436   1490.5200     34.9500      4.2200
+   1396.1707   1490.5200     34.9500      4.2200
+   1396.2976   1490.5200     34.9500      4.2200
+   1396.4248   1490.5200     34.9500      4.2200
+   1396.5519   1490.5200     34.9500      4.2200
+   1396.6790   1490.5300     34.9500      4.2200
+   1396.8060   1490.5300     34.9500      4.2200
+   1396.9331   1490.5300     34.9500      4.2200
+   1397.0603   1490.5300     34.9500      4.2200
+   1397.1873   1490.5300     34.9500      4.2200
+   1397.3143   1490.5400     34.9500      4.2200
+   1397.4415   1490.5400     34.9500      4.2200
+   1397.5686   1490.5400     34.9500      4.2200
+   1397.6957   1490.5400     34.9500      4.2200
+   1397.8228   1490.5400     34.9500      4.2200
+   1397.9498   1490.5500     34.9500      4.2200
+   1398.0769   1490.5500     34.9500      4.2200
+   1398.2040   1490.5500     34.9500      4.2200
+   1398.3311   1490.5500     34.9500      4.2200
+   1398.4581   1490.5500     34.9500      4.2200
+   1398.5852   1490.5600     34.9500      4.2200
+   1398.7123   1490.5600     34.9500      4.2200
+   1398.8394   1490.5600     34.9500      4.2200
+   1398.9664   1490.5600     34.9500      4.2200
+   1399.0935   1472.1200     34.9500      0.0000
+   1400.2371   1444.9900      0.0000      4.2200
+   1400.3641   1444.9900      0.0000      4.2200
+   1400.4912   1445.0000      0.0000      4.2200
+   1400.6183   1490.5900     34.9500      4.2200
+   1400.7454   1490.5900     34.9500      4.2200
+   1400.8723   1490.5900     34.9500      4.2200
+   1400.9994   1490.5900     34.9500      4.2200
+   1401.1265   1490.5900     34.9500      4.2200
+   1401.2535   1490.6000     34.9500      4.2200
+   1401.3805   1490.6000     34.9500      4.2200
+   1401.5077   1490.6000     34.9500      4.2200
+   1401.6348   1490.6000     34.9500      4.2200
+   1401.7617   1490.6000     34.9500      4.2200
+   1401.8888   1490.6100     34.9500      4.2200
+   1402.0159   1490.6100     34.9500      4.2200
+   1402.1429   1490.6100     34.9500      4.2200
+   1402.2699   1490.6100     34.9500      4.2200
+   1402.3970   1490.6100     34.9500      4.2200
+   1402.5240   1490.6200     34.9500      4.2200
+   1402.6510   1490.6200     34.9500      4.2200
+   1402.7781   1490.6200     34.9500      4.2200
+   1402.9052   1490.6200     34.9500      4.2200
+   1403.0322   1490.6200     34.9500      4.2200
+   1403.1592   1490.6300     34.9500      4.2200
+   1403.2863   1490.6200     34.9500      4.2200
+   1403.4133   1490.6300     34.9500      4.2200
+   1403.5403   1490.6300     34.9500      4.2200
+   1403.6674   1472.1900     34.9500      0.0000
+   1404.8107   1445.0300      0.0000      4.2100
+   1404.9376   1445.0200      0.0000      4.2100
+   1405.0647   1445.0300      0.0000      4.2100
+   1405.1917   1490.6300     34.9500      4.2100
+   1405.3187   1490.6300     34.9500      4.2100
+   1405.4457   1490.6300     34.9600      4.2100
+   1405.5728   1490.6300     34.9500      4.2100
+   1405.6998   1490.6400     34.9500      4.2100
+   1405.8268   1490.6400     34.9600      4.2100
+   1405.9537   1490.6400     34.9600      4.2100
+   1406.0808   1490.6400     34.9500      4.2100
+   1406.2079   1490.6400     34.9500      4.2100
+   1406.3348   1490.6400     34.9500      4.2100
+   1406.4619   1490.6400     34.9500      4.2100
+   1406.5889   1490.6400     34.9500      4.2100
+   1406.7158   1490.6500     34.9500      4.2100
+   1406.8429   1490.6500     34.9500      4.2100
+   1406.9698   1490.6500     34.9500      4.2100
+   1407.0969   1472.2400     34.9500      0.0000
+   1409.7639   1445.1000      0.0000      4.2100
+   1409.8907   1445.1000      0.0000      4.2100
+   1410.0178   1445.1000      0.0000      4.2100
+   1410.1448   1490.7000     34.9400      4.2100
+   1410.2719   1490.7000     34.9400      4.2100
+   1410.3987   1490.7000     34.9500      4.2100
+   1410.5258   1490.7000     34.9500      4.2100
+   1410.6527   1490.7100     34.9500      4.2100
+   1410.7798   1490.7100     34.9500      4.2100
+   1410.9066   1490.7100     34.9500      4.2100
+   1411.0337   1490.7200     34.9500      4.2100
+   1411.1606   1490.7200     34.9500      4.2100
+   1411.2876   1490.7100     34.9500      4.2100
+   1411.4146   1490.7200     34.9500      4.2100
+   1411.5416   1490.7100     34.9500      4.2100
+   1411.6686   1490.7200     34.9500      4.2100
+   1411.7955   1490.7100     34.9500      4.2100
+   1411.9225   1490.7100     34.9400      4.2100
+   1412.0494   1472.3200     34.9400      0.0000
+   1413.1921   1445.1100      0.0000      4.2000
+   1413.3191   1445.1100      0.0000      4.2000
+   1413.4460   1445.1100      0.0000      4.2000
+   1413.5730   1490.7200     34.9500      4.2000
+   1413.7000   1490.7200     34.9500      4.2000
+   1413.8269   1490.7200     34.9500      4.2000
+   1413.9539   1490.7200     34.9500      4.2000
+   1414.0808   1490.7300     34.9500      4.2000
+   1414.2078   1490.7300     34.9500      4.2000
+   1414.3347   1490.7300     34.9500      4.2000
+   1414.4617   1490.7300     34.9500      4.2000
+   1414.5886   1490.7300     34.9500      4.2000
+   1414.7156   1490.7400     34.9500      4.2000
+   1414.8425   1490.7400     34.9500      4.2000
+   1414.9695   1490.7400     34.9500      4.2000
+   1415.0964   1490.7400     34.9500      4.2000
+   1415.2234   1490.7400     34.9500      4.2000
+   1415.3502   1490.7500     34.9500      4.2000
+   1415.4772   1490.7500     34.9500      4.2000
+   1415.6041   1490.7500     34.9500      4.2000
+   1415.7312   1490.7500     34.9500      4.2000
+   1415.8580   1490.7500     34.9500      4.2000
+   1415.9850   1490.7600     34.9500      4.2000
+   1416.1119   1490.7600     34.9500      4.2000
+   1416.2388   1490.7600     34.9500      4.2000
+   1416.3657   1490.7600     34.9500      4.2000
+   1416.4928   1490.7600     34.9500      4.2000
+   1416.6198   1490.7600     34.9500      4.2000
+   1416.7466   1490.7600     34.9500      4.2000
+   1416.8735   1490.7600     34.9500      4.2000
+   1417.0005   1490.7700     34.9500      4.2000
+   1417.1274   1490.7600     34.9500      4.2000
+   1417.2543   1490.7600     34.9500      4.2000
+   1417.3812   1490.7700     34.9500      4.2000
+   1417.5082   1490.7700     34.9500      4.2000
+   1417.6350   1490.7700     34.9500      4.2000
+   1417.7620   1490.7700     34.9500      4.2000
+   1417.8889   1490.7700     34.9500      4.1900
+   1418.0159   1490.7700     34.9500      4.1900
+   1418.1428   1490.7600     34.9500      4.1900
+   1418.2697   1490.7700     34.9500      4.1900
+   1418.3966   1490.7700     34.9600      4.1900
+   1418.5236   1472.4400     34.9600      0.0000
+   1419.6658   1445.1700      0.0000      4.1900
+   1419.7927   1445.1700      0.0000      4.1900
+   1419.9196   1445.1700      0.0000      4.1900
+   1420.0465   1490.7900     34.9500      4.1900
+   1420.1735   1490.7900     34.9500      4.1900
+   1420.3003   1490.8000     34.9500      4.1900
+   1420.4271   1490.8000     34.9500      4.1900
+   1420.5541   1490.8000     34.9500      4.1900
+   1420.6810   1490.8000     34.9500      4.1900
+   1420.8079   1490.8000     34.9500      4.1900
+   1420.9348   1490.8000     34.9500      4.1900
+   1421.0618   1490.8000     34.9500      4.1900
+   1421.1886   1490.8100     34.9500      4.1900
+   1421.3154   1490.8100     34.9500      4.1900
+   1421.4424   1490.8100     34.9500      4.1900
+   1421.5693   1490.8100     34.9500      4.1900
+   1421.6962   1490.8200     34.9500      4.1900
+   1421.8231   1490.8200     34.9500      4.1900
+   1421.9500   1490.8200     34.9500      4.1900
+   1422.0769   1490.8200     34.9500      4.1900
+   1422.2037   1490.8300     34.9500      4.1900
+   1422.3307   1490.8300     34.9500      4.1900
+   1422.4575   1490.8300     34.9500      4.1900
+   1422.5844   1490.8300     34.9500      4.1900
+   1422.7113   1490.8400     34.9500      4.1900
+   1422.8381   1490.8400     34.9500      4.1900
+   1422.9651   1490.8400     34.9500      4.1900
+   1423.0919   1490.8400     34.9500      4.1900
+   1423.2189   1490.8400     34.9500      4.1900
+   1423.3457   1490.8500     34.9500      4.1900
+   1423.4727   1490.8500     34.9500      4.1900
+   1423.5995   1490.8500     34.9500      4.1900
+   1423.7263   1490.8500     34.9500      4.1900
+   1423.8533   1472.5300     34.9500      0.0000
+   1424.9951   1445.2500      0.0000      4.1900
+   1425.1219   1445.2600      0.0000      4.1900
+   1425.2489   1445.2600      0.0000      4.1900
+   1425.3756   1490.8800     34.9500      4.1900
+   1425.5026   1490.8800     34.9500      4.1900
+   1425.6294   1490.8800     34.9500      4.1900
+   1425.7562   1490.8900     34.9500      4.1900
+   1425.8831   1490.8900     34.9500      4.1900
+   1426.0100   1490.8900     34.9500      4.1900
+   1426.1368   1490.8900     34.9500      4.1900
+   1426.2637   1490.8900     34.9500      4.1900
+   1426.3905   1490.9000     34.9500      4.1900
+   1426.5175   1490.9000     34.9500      4.1900
+   1426.6443   1490.9000     34.9500      4.1900
+   1426.7711   1490.9000     34.9500      4.1900
+   1426.8979   1490.9000     34.9500      4.1900
+   1427.0249   1490.9000     34.9500      4.1900
+   1427.1516   1490.9100     34.9500      4.1900
+   1427.2786   1490.9100     34.9500      4.1900
+   1427.4054   1490.9100     34.9500      4.1900
+   1427.5322   1490.9100     34.9500      4.1900
+   1427.6591   1490.9100     34.9500      4.1900
+   1427.7859   1490.9200     34.9500      4.1900
+   1427.9128   1490.9200     34.9500      4.1900
+   1428.0396   1490.9200     34.9500      4.1900
+   1428.1664   1490.9200     34.9500      4.1900
+   1428.2933   1490.9300     34.9500      4.1900
+   1428.4202   1490.9300     34.9500      4.1900
+   1428.5470   1490.9300     34.9500      4.1900
+   1428.6738   1490.9300     34.9500      4.1900
+   1428.8007   1490.9300     34.9500      4.1900
+   1428.9275   1490.9400     34.9500      4.1900
+   1429.0543   1490.9300     34.9500      4.1900
+   1429.1812   1490.9400     34.9500      4.1900
+   1429.3080   1490.9300     34.9500      4.1900
+   1429.4348   1490.9300     34.9500      4.1900
+   1429.5616   1490.9300     34.9500      4.1900
+   1429.6885   1490.9200     34.9500      4.1900
+   1429.8154   1490.9200     34.9500      4.1900
+   1429.9421   1472.6300     34.9500      0.0000
+   1431.0836   1445.3100      0.0000      4.1800
+   1431.2103   1445.3100      0.0000      4.1800
+   1431.3372   1445.3100      0.0000      4.1800
+   1431.4640   1490.9400     34.9500      4.1800
+   1431.5908   1490.9400     34.9500      4.1800
+   1431.7177   1490.9400     34.9500      4.1800
+   1431.8445   1490.9500     34.9500      4.1800
+   1431.9713   1490.9500     34.9500      4.1800
+   1432.0980   1490.9500     34.9600      4.1800
+   1432.2249   1490.9600     34.9600      4.1800
+   1432.3517   1490.9600     34.9600      4.1800
+   1432.4785   1490.9700     34.9600      4.1800
+   1432.6053   1490.9700     34.9600      4.1800
+   1432.7322   1490.9700     34.9600      4.1800
+   1432.8590   1490.9700     34.9600      4.1800
+   1432.9858   1490.9700     34.9600      4.1800
+   1433.1125   1490.9700     34.9500      4.1800
+   1433.2394   1490.9700     34.9500      4.1800
+   1433.3662   1490.9700     34.9500      4.1800
+   1433.4929   1490.9700     34.9500      4.1800
+   1433.6198   1490.9700     34.9500      4.1800
+   1433.7466   1490.9700     34.9400      4.1800
+   1433.8734   1490.9700     34.9500      4.1800
+   1434.0001   1490.9700     34.9500      4.1800
+   1434.1270   1490.9700     34.9400      4.1800
+   1434.2538   1490.9700     34.9400      4.1800
+   1434.3805   1490.9800     34.9400      4.1800
+   1434.5073   1490.9800     34.9400      4.1800
+   1434.6342   1490.9800     34.9400      4.1800
+   1434.7610   1490.9800     34.9400      4.1800
+   1434.8877   1490.9900     34.9400      4.1800
+   1435.0145   1490.9900     34.9400      4.1800
+   1435.1414   1490.9900     34.9400      4.1800
+   1435.2681   1472.7100     34.9400      0.0000
+   1436.4092   1445.3900      0.0000      4.1800
+   1436.5359   1445.4000      0.0000      4.1800
+   1436.6626   1445.4000      0.0000      4.1800
+   1436.7894   1491.0300     34.9500      4.1800
+   1436.9163   1491.0300     34.9500      4.1800
+   1437.0431   1491.0300     34.9500      4.1800
+   1437.1698   1491.0300     34.9500      4.1800
+   1437.2965   1491.0300     34.9500      4.1800
+   1437.4233   1491.0300     34.9400      4.1800
+   1437.5500   1491.0300     34.9400      4.1800
+   1437.6769   1491.0300     34.9400      4.1800
+   1437.8036   1491.0300     34.9400      4.1800
+   1437.9304   1491.0300     34.9400      4.1800
+   1438.0571   1491.0200     34.9400      4.1800
+   1438.1840   1491.0200     34.9400      4.1800
+   1438.3107   1491.0200     34.9400      4.1800
+   1438.4374   1491.0200     34.9400      4.1800
+   1438.5642   1491.0200     34.9400      4.1800
+   1438.6910   1491.0300     34.9400      4.1800
+   1438.8177   1491.0200     34.9400      4.1700
+   1438.9445   1491.0300     34.9500      4.1700
+   1439.0713   1491.0300     34.9500      4.1800
+   1439.1980   1491.0400     34.9500      4.1800
+   1439.3248   1491.0400     34.9400      4.1800
+   1439.4515   1472.7800     34.9400      0.0000
+   1441.7329   1445.4800      0.0000      4.1800
+   1441.8596   1445.4800      0.0000      4.1800
+   1441.9865   1445.4900      0.0000      4.1800
+   1442.1132   1491.1200     34.9600      4.1800
+   1442.2399   1491.1200     34.9600      4.1800
+   1442.3666   1491.1200     34.9600      4.1800
+   1442.4934   1491.1300     34.9600      4.1800
+   1442.6200   1491.1300     34.9600      4.1800
+   1442.7468   1491.1300     34.9500      4.1800
+   1442.8735   1491.1300     34.9500      4.1800
+   1443.0002   1491.1300     34.9500      4.1800
+   1443.1270   1491.1400     34.9500      4.1800
+   1443.2537   1491.1400     34.9500      4.1800
+   1443.3805   1491.1400     34.9500      4.1800
+   1443.5071   1491.1400     34.9500      4.1800
+   1443.6339   1491.1400     34.9500      4.1800
+   1443.7606   1491.1500     34.9500      4.1800
+   1443.8873   1491.1400     34.9500      4.1800
+   1444.0140   1491.1500     34.9500      4.1800
+   1444.1407   1491.1400     34.9500      4.1800
+   1444.2675   1491.1400     34.9500      4.1800
+   1444.3942   1491.1400     34.9500      4.1800
+   1444.5209   1491.1300     34.9500      4.1800
+   1444.6476   1491.1300     34.9500      4.1700
+   1444.7743   1472.8800     34.9500      0.0000
+   1447.8152   1445.4900      0.0000      4.1600
+   1447.9418   1445.4900      0.0000      4.1600
+   1448.0685   1445.4900      0.0000      4.1600
+   1448.1952   1491.1400     34.9600      4.1600
+   1448.3219   1491.1400     34.9500      4.1600
+   1448.4485   1491.1400     34.9500      4.1600
+   1448.5752   1491.1400     34.9500      4.1600
+   1448.7019   1491.1400     34.9500      4.1600
+   1448.8286   1491.1400     34.9500      4.1600
+   1448.9553   1491.1400     34.9500      4.1600
+   1449.0820   1491.1500     34.9500      4.1600
+   1449.2087   1491.1500     34.9500      4.1600
+   1449.3353   1491.1500     34.9500      4.1600
+   1449.4620   1491.1500     34.9500      4.1600
+   1449.5887   1491.1500     34.9500      4.1600
+   1449.7155   1491.1600     34.9500      4.1600
+   1449.8420   1491.1600     34.9500      4.1600
+   1449.9688   1491.1600     34.9500      4.1600
+   1450.0955   1491.1600     34.9500      4.1600
+   1450.2220   1491.1600     34.9400      4.1600
+   1450.3488   1491.1600     34.9400      4.1600
+   1450.4753   1491.1600     34.9400      4.1600
+   1450.6021   1491.1600     34.9400      4.1600
+   1450.7286   1491.1600     34.9400      4.1600
+   1450.8553   1491.1600     34.9400      4.1600
+   1450.9821   1491.1600     34.9400      4.1600
+   1451.1086   1491.1700     34.9400      4.1600
+   1451.2354   1472.9700     34.9400      0.0000
+   1453.5151   1445.5700      0.0000      4.1600
+   1453.6418   1445.5700      0.0000      4.1600
+   1453.7684   1445.5700      0.0000      4.1600
+   1453.8950   1491.2100     34.9500      4.1600
+   1454.0217   1491.2100     34.9400      4.1600
+   1454.1483   1491.2000     34.9400      4.1600
+   1454.2749   1491.2000     34.9400      4.1600
+   1454.4016   1491.2000     34.9400      4.1600
+   1454.5283   1491.2000     34.9400      4.1600
+   1454.6549   1491.2000     34.9400      4.1500
+   1454.7815   1491.1900     34.9400      4.1500
+   1454.9082   1491.2000     34.9400      4.1500
+   1455.0348   1491.2000     34.9400      4.1500
+   1455.1615   1491.2000     34.9400      4.1500
+   1455.2881   1491.2000     34.9400      4.1500
+   1455.4147   1491.2000     34.9400      4.1500
+   1455.5414   1491.2100     34.9400      4.1500
+   1455.6678   1491.2100     34.9400      4.1500
+   1455.7946   1491.2100     34.9400      4.1500
+   1455.9213   1491.2100     34.9400      4.1500
+   1456.0479   1491.2100     34.9400      4.1500
+   1456.1744   1491.2200     34.9400      4.1500
+   1456.3010   1491.2400     34.9400      4.1600
+   1456.4277   1491.2500     34.9400      4.1600
+   1456.5543   1491.2500     34.9400      4.1600
+   1456.6809   1491.2500     34.9400      4.1600
+   1456.8076   1491.2600     34.9400      4.1600
+   1456.9342   1491.2800     34.9400      4.1600
+   1457.0608   1491.2900     34.9400      4.1700
+   1457.1874   1491.3100     34.9300      4.1700
+   1457.3141   1491.3200     34.9300      4.1800
+   1457.4406   1491.3200     34.9300      4.1800
+   1457.5673   1491.3200     34.9200      4.1800
+   1457.6938   1473.0500     34.9200      0.0000
+   1458.8333   1445.6200      0.0000      4.1500
+   1458.9600   1445.6200      0.0000      4.1500
+   1459.0865   1445.6300      0.0000      4.1500
+   1459.2131   1491.2700     34.9400      4.1500
+   1459.3397   1491.2700     34.9400      4.1500
+   1459.4663   1491.2700     34.9400      4.1500
+   1459.5929   1491.2700     34.9400      4.1500
+   1459.7195   1491.2800     34.9400      4.1500
+   1459.8461   1491.2800     34.9400      4.1500
+   1459.9727   1491.2800     34.9400      4.1500
+   1460.0994   1491.2800     34.9400      4.1500
+   1460.2258   1491.2800     34.9400      4.1500
+   1460.3524   1491.2800     34.9400      4.1500
+   1460.4791   1491.2800     34.9400      4.1500
+   1460.6056   1491.2900     34.9400      4.1500
+   1460.7322   1491.2900     34.9400      4.1500
+   1460.8589   1491.2900     34.9400      4.1500
+   1460.9855   1491.2900     34.9400      4.1500
+   1461.1119   1491.2900     34.9400      4.1500
+   1461.2385   1491.2900     34.9400      4.1500
+   1461.3652   1491.2800     34.9400      4.1500
+   1461.4918   1491.2800     34.9500      4.1500
+   1461.6183   1491.2800     34.9500      4.1500
+   1461.7449   1491.2800     34.9500      4.1400
+   1461.8716   1491.2800     34.9500      4.1400
+   1461.9980   1491.2800     34.9500      4.1400
+   1462.1246   1491.2700     34.9500      4.1400
+   1462.2512   1491.2700     34.9500      4.1400
+   1462.3778   1491.2700     34.9500      4.1400
+   1462.5044   1491.2900     34.9600      4.1400
+   1462.6310   1473.1800     34.9500      0.0000
+   1463.7700   1445.6600      0.0000      4.1400
+   1463.8966   1445.6600      0.0000      4.1400
+   1464.0232   1445.6600      0.0000      4.1400
+   1464.1498   1491.3200     34.9500      4.1400
+   1464.2762   1491.3200     34.9500      4.1400
+   1464.4028   1491.3200     34.9500      4.1400
+   1464.5294   1491.3200     34.9500      4.1400
+   1464.6560   1491.3200     34.9500      4.1400
+   1464.7825   1491.3300     34.9500      4.1400
+   1464.9091   1491.3300     34.9500      4.1400
+   1465.0356   1491.3300     34.9500      4.1400
+   1465.1621   1491.3300     34.9500      4.1400
+   1465.2887   1491.3300     34.9500      4.1400
+   1465.4153   1491.3300     34.9500      4.1400
+   1465.5419   1491.3400     34.9500      4.1400
+   1465.6683   1491.3400     34.9500      4.1400
+   1465.7949   1491.3400     34.9500      4.1400
+   1465.9215   1491.3400     34.9500      4.1400
+   1466.0480   1491.3400     34.9500      4.1400
+   1466.1746   1491.3500     34.9500      4.1400
+   1466.3011   1491.3500     34.9500      4.1400
+   1466.4277   1491.3500     34.9500      4.1400
+   1466.5542   1491.3500     34.9500      4.1400
+   1466.6808   1491.3600     34.9500      4.1400
+   1466.8074   1491.3600     34.9500      4.1400
+   1466.9338   1491.3600     34.9500      4.1400
+   1467.0604   1491.3600     34.9500      4.1400
+   1467.1869   1491.3600     34.9500      4.1400
+   1467.3135   1491.3700     34.9500      4.1400
+   1467.4399   1491.3700     34.9500      4.1400
+   1467.5665   1491.3700     34.9500      4.1400
+   1467.6931   1491.3600     34.9500      4.1400
+   1467.8197   1491.3600     34.9500      4.1400
+   1467.9462   1473.2700     34.9500      0.0000
+   1469.0848   1445.7400      0.0000      4.1400
+   1469.2113   1445.7400      0.0000      4.1400
+   1469.3379   1445.7500      0.0000      4.1400
+   1469.4645   1491.4000     34.9500      4.1400
+   1469.5909   1491.4000     34.9500      4.1400
+   1469.7174   1491.4100     34.9500      4.1400
+   1469.8440   1491.4100     34.9500      4.1400
+   1469.9706   1491.4100     34.9500      4.1400
+   1470.0969   1491.4100     34.9500      4.1400
+   1470.2235   1491.4100     34.9500      4.1400
+   1470.3501   1491.4100     34.9500      4.1400
+   1470.4766   1491.4100     34.9500      4.1400
+   1470.6030   1491.4100     34.9500      4.1400
+   1470.7296   1491.4100     34.9500      4.1400
+   1470.8561   1491.4100     34.9500      4.1400
+   1470.9827   1491.4100     34.9500      4.1400
+   1471.1091   1491.4100     34.9500      4.1400
+   1471.2356   1491.4100     34.9500      4.1300
+   1471.3622   1491.4100     34.9500      4.1400
+   1471.4885   1491.4100     34.9500      4.1300
+   1471.6151   1491.4100     34.9500      4.1300
+   1471.7416   1491.4100     34.9500      4.1300
+   1471.8682   1491.4100     34.9600      4.1300
+   1471.9946   1491.4200     34.9600      4.1300
+   1472.1211   1491.4200     34.9600      4.1300
+   1472.2477   1491.4200     34.9500      4.1300
+   1472.3740   1491.4200     34.9500      4.1300
+   1472.5006   1491.4200     34.9500      4.1300
+   1472.6271   1491.4200     34.9500      4.1300
+   1472.7537   1491.4200     34.9500      4.1300
+   1472.8800   1491.4200     34.9500      4.1300
+   1473.0066   1491.4200     34.9500      4.1300
+   1473.1331   1491.4200     34.9500      4.1300
+   1473.2595   1491.4200     34.9500      4.1300
+   1473.3860   1491.4300     34.9500      4.1300
+   1473.5126   1491.4300     34.9500      4.1300
+   1473.6390   1491.4300     34.9500      4.1300
+   1473.7655   1491.4300     34.9500      4.1300
+   1473.8920   1491.4300     34.9400      4.1300
+   1474.0186   1491.4300     34.9400      4.1300
+   1474.1450   1491.4400     34.9500      4.1300
+   1474.2715   1491.4300     34.9400      4.1300
+   1474.3979   1491.4300     34.9400      4.1300
+   1474.5244   1491.4400     34.9400      4.1300
+   1474.6509   1491.4400     34.9400      4.1300
+   1474.7773   1473.3700     34.9400      0.0000
+   1475.9156   1445.8000      0.0000      4.1300
+   1476.0421   1445.8000      0.0000      4.1300
+   1476.1686   1445.8000      0.0000      4.1300
+   1476.2950   1491.4500     34.9400      4.1300
+   1476.4214   1491.4600     34.9400      4.1300
+   1476.5480   1491.4600     34.9400      4.1300
+   1476.6744   1491.4600     34.9400      4.1300
+   1476.8009   1491.4600     34.9400      4.1300
+   1476.9274   1491.4500     34.9400      4.1300
+   1477.0538   1491.4500     34.9400      4.1300
+   1477.1803   1491.4500     34.9500      4.1200
+   1477.3068   1491.4600     34.9500      4.1200
+   1477.4331   1491.4500     34.9500      4.1200
+   1477.5597   1491.4500     34.9400      4.1200
+   1477.6862   1491.4500     34.9500      4.1200
+   1477.8125   1491.4600     34.9500      4.1200
+   1477.9390   1491.4600     34.9500      4.1200
+   1478.0654   1491.4600     34.9500      4.1200
+   1478.1919   1491.4600     34.9500      4.1200
+   1478.3184   1491.4600     34.9500      4.1200
+   1478.4448   1491.4700     34.9500      4.1200
+   1478.5713   1491.4700     34.9500      4.1200
+   1478.6976   1491.4700     34.9500      4.1200
+   1478.8241   1491.4700     34.9500      4.1200
+   1478.9506   1473.4400     34.9500      0.0000
+   1480.0885   1445.8300      0.0000      4.1200
+   1480.2150   1445.8300      0.0000      4.1200
+   1480.3414   1445.8400      0.0000      4.1200
+   1480.4679   1491.5000     34.9500      4.1200
+   1480.5942   1491.5000     34.9500      4.1200
+   1480.7207   1491.5000     34.9500      4.1200
+   1480.8472   1491.5000     34.9500      4.1200
+   1480.9735   1491.5100     34.9400      4.1200
+   1481.1000   1491.5100     34.9400      4.1200
+   1481.2264   1491.5100     34.9400      4.1200
+   1481.3529   1491.5100     34.9400      4.1200
+   1481.4792   1491.5100     34.9400      4.1200
+   1481.6057   1491.5200     34.9400      4.1200
+   1481.7322   1491.5200     34.9400      4.1200
+   1481.8585   1491.5200     34.9400      4.1200
+   1481.9850   1491.5200     34.9400      4.1200
+   1482.1115   1491.5300     34.9400      4.1200
+   1482.2379   1491.5300     34.9400      4.1200
+   1482.3643   1491.5300     34.9400      4.1200
+   1482.4906   1491.5300     34.9400      4.1200
+   1482.6171   1491.5300     34.9400      4.1200
+   1482.7434   1491.5400     34.9400      4.1200
+   1482.8699   1491.5400     34.9400      4.1200
+   1482.9963   1491.5400     34.9400      4.1200
+   1483.1228   1491.5400     34.9400      4.1200
+   1483.2491   1491.5400     34.9400      4.1200
+   1483.3755   1491.5500     34.9400      4.1200
+   1483.5020   1491.5500     34.9400      4.1200
+   1483.6284   1491.5500     34.9400      4.1200
+   1483.7548   1491.5500     34.9400      4.1200
+   1483.8812   1491.5500     34.9400      4.1200
+   1484.0076   1491.5600     34.9400      4.1200
+   1484.1339   1491.5600     34.9400      4.1200
+   1484.2604   1473.5300     34.9400      0.0000
+   1485.3981   1445.9000      0.0000      4.1200
+   1485.5243   1445.9100      0.0000      4.1200
+   1485.6508   1445.9100      0.0000      4.1200
+   1485.7772   1491.5800     34.9500      4.1200
+   1485.9036   1491.5800     34.9400      4.1200
+   1486.0299   1491.5800     34.9400      4.1200
+   1486.1564   1491.5800     34.9400      4.1200
+   1486.2827   1491.5800     34.9400      4.1200
+   1486.4091   1491.5800     34.9500      4.1200
+   1486.5355   1491.5900     34.9500      4.1200
+   1486.6619   1491.5900     34.9500      4.1200
+   1486.7883   1491.5900     34.9500      4.1200
+   1486.9147   1491.5900     34.9500      4.1200
+   1487.0410   1491.5900     34.9500      4.1200
+   1487.1675   1491.5900     34.9500      4.1200
+   1487.2937   1491.5900     34.9500      4.1200
+   1487.4202   1491.5900     34.9500      4.1200
+   1487.5465   1491.5900     34.9500      4.1100
+   1487.6730   1491.5900     34.9500      4.1100
+   1487.7993   1491.5900     34.9500      4.1100
+   1487.9257   1491.5900     34.9500      4.1100
+   1488.0521   1491.5900     34.9500      4.1100
+   1488.1783   1491.5900     34.9500      4.1100
+   1488.3048   1491.5900     34.9500      4.1100
+   1488.4312   1491.5900     34.9500      4.1100
+   1488.5576   1491.6000     34.9500      4.1100
+   1488.6838   1491.6000     34.9500      4.1100
+   1488.8103   1491.6000     34.9500      4.1100
+   1488.9366   1491.6000     34.9500      4.1100
+   1489.0630   1491.6000     34.9500      4.1100
+   1489.1893   1491.6100     34.9500      4.1100
+   1489.3158   1491.6100     34.9500      4.1100
+   1489.4421   1491.6100     34.9500      4.1100
+   1489.5684   1473.6300     34.9500      0.0000
+   1490.7057   1445.9600      0.0000      4.1100
+   1490.8320   1445.9600      0.0000      4.1100
+   1490.9584   1445.9600      0.0000      4.1100
+   1491.0847   1491.6400     34.9500      4.1100
+   1491.2111   1491.6400     34.9500      4.1100
+   1491.3374   1491.6400     34.9500      4.1100
+   1491.4637   1491.6400     34.9500      4.1100
+   1491.5901   1491.6400     34.9500      4.1100
+   1491.7166   1491.6500     34.9500      4.1100
+   1491.8428   1491.6500     34.9500      4.1100
+   1491.9691   1491.6500     34.9500      4.1100
+   1492.0955   1491.6500     34.9500      4.1100
+   1492.2218   1491.6500     34.9400      4.1100
+   1492.3481   1491.6500     34.9400      4.1100
+   1492.4745   1491.6600     34.9400      4.1100
+   1492.6008   1491.6600     34.9400      4.1100
+   1492.7272   1491.6600     34.9500      4.1100
+   1492.8535   1491.6600     34.9400      4.1100
+   1492.9799   1491.6600     34.9400      4.1100
+   1493.1062   1491.6600     34.9400      4.1100
+   1493.2325   1491.6700     34.9400      4.1100
+   1493.3589   1491.6700     34.9400      4.1100
+   1493.4852   1491.6700     34.9500      4.1100
+   1493.6115   1491.6700     34.9500      4.1100
+   1493.7378   1491.6700     34.9500      4.1100
+   1493.8641   1491.6800     34.9500      4.1100
+   1493.9906   1491.6800     34.9500      4.1100
+   1494.1168   1491.6800     34.9500      4.1100
+   1494.2432   1491.6800     34.9500      4.1100
+   1494.3695   1491.6800     34.9400      4.1100
+   1494.4957   1491.6800     34.9400      4.1100
+   1494.6221   1491.6800     34.9400      4.1100
+   1494.7484   1491.6800     34.9400      4.1100
+   1494.8748   1491.6800     34.9400      4.1100
+   1495.0011   1491.6800     34.9400      4.1100
+   1495.1274   1491.6800     34.9300      4.1100
+   1495.2538   1491.6800     34.9300      4.1100
+   1495.3800   1491.6900     34.9300      4.1100
+   1495.5063   1491.6900     34.9300      4.1100
+   1495.6327   1491.6900     34.9300      4.1100
+   1495.7590   1491.7000     34.9300      4.1100
+   1495.8853   1491.7000     34.9300      4.1100
+   1496.0116   1491.7000     34.9300      4.1100
+   1496.1379   1491.7000     34.9300      4.1100
+   1496.2643   1491.7000     34.9300      4.1100
+   1496.3905   1491.7000     34.9300      4.1100
+   1496.5168   1491.7000     34.9300      4.1100
+   1496.6432   1491.7100     34.9300      4.1100
+   1496.7694   1473.7200     34.9300      0.0000
+   1497.9061   1446.0500      0.0000      4.1100
+   1498.0325   1446.0600      0.0000      4.1100
+   1498.1587   1446.0700      0.0000      4.1100
+   1498.2850   1491.7300     34.9300      4.1100
+   1498.4114   1491.7300     34.9300      4.1100
+   1498.5376   1491.7400     34.9300      4.1100
+   1498.6639   1491.7400     34.9300      4.1100
+   1498.7902   1491.7400     34.9300      4.1100
+   1498.9165   1491.7400     34.9300      4.1100
+   1499.0427   1491.7500     34.9300      4.1100
+   1499.1691   1491.7500     34.9300      4.1100
+   1499.2954   1491.7500     34.9300      4.1100
+   1499.4216   1491.7500     34.9300      4.1100
+   1499.5479   1491.7500     34.9300      4.1100
+   1499.6742   1491.7600     34.9300      4.1100
+   1499.8005   1491.7600     34.9300      4.1100
+   1499.9268   1491.7600     34.9300      4.1100
+   1500.0530   1491.7600     34.9300      4.1100
+   1500.1793   1491.7600     34.9300      4.1100
+   1500.3057   1491.7700     34.9300      4.1100
+   1500.4319   1491.7700     34.9300      4.1100
+   1500.5581   1491.7600     34.9300      4.1100
+   1500.6844   1491.7600     34.9300      4.1100
+   1500.8107   1491.7700     34.9300      4.1100
+   1500.9370   1491.7700     34.9300      4.1100
+   1501.0632   1491.7700     34.9300      4.1100
+   1501.1896   1491.7600     34.9300      4.1100
+   1501.3158   1491.7700     34.9300      4.1100
+   1501.4420   1491.7600     34.9300      4.1100
+   1501.5684   1491.7700     34.9300      4.1100
+   1501.6946   1473.8100     34.9300      0.0000
+   1502.8309   1446.1200      0.0000      4.1000
+   1502.9573   1446.1300      0.0000      4.1100
+   1503.0834   1446.1300      0.0000      4.1100
+   1503.2097   1491.7900     34.9300      4.1100
+   1503.3359   1491.7900     34.9300      4.1000
+   1503.4623   1491.7800     34.9300      4.1000
+   1503.5885   1491.7900     34.9400      4.1000
+   1503.7147   1491.7800     34.9400      4.1000
+   1503.8409   1491.7800     34.9400      4.1000
+   1503.9672   1491.7800     34.9400      4.1000
+   1504.0935   1491.7700     34.9400      4.0900
+   1504.2197   1491.7800     34.9400      4.0900
+   1504.3459   1491.7800     34.9400      4.0900
+   1504.4722   1491.7800     34.9400      4.0900
+   1504.5984   1491.7900     34.9400      4.0900
+   1504.7247   1491.7800     34.9400      4.0900
+   1504.8508   1491.7800     34.9500      4.0900
+   1504.9772   1491.7900     34.9500      4.0900
+   1505.1034   1491.7900     34.9500      4.0900
+   1505.2297   1491.7900     34.9500      4.0900
+   1505.3558   1491.7900     34.9500      4.0900
+   1505.4822   1491.7900     34.9500      4.0900
+   1505.6084   1491.8000     34.9500      4.0900
+   1505.7346   1491.8000     34.9500      4.0900
+   1505.8608   1491.8000     34.9500      4.0900
+   1505.9871   1491.8000     34.9500      4.0900
+   1506.1133   1491.8000     34.9500      4.0900
+   1506.2395   1491.8100     34.9500      4.0900
+   1506.3657   1491.8100     34.9500      4.0900
+   1506.4919   1491.8100     34.9500      4.0900
+   1506.6183   1491.8100     34.9500      4.0900
+   1506.7444   1491.8100     34.9500      4.0900
+   1506.8707   1491.8200     34.9500      4.0900
+   1506.9969   1491.8200     34.9500      4.0900
+   1507.1230   1491.8200     34.9500      4.0900
+   1507.2493   1491.8200     34.9500      4.0900
+   1507.3756   1491.8200     34.9500      4.0900
+   1507.5018   1491.8300     34.9500      4.0900
+   1507.6279   1491.8300     34.9500      4.0900
+   1507.7543   1491.8300     34.9500      4.0900
+   1507.8805   1491.8300     34.9500      4.0900
+   1508.0066   1491.8300     34.9500      4.0900
+   1508.1328   1491.8400     34.9500      4.0900
+   1508.2592   1491.8400     34.9400      4.0900
+   1508.3854   1491.8400     34.9400      4.0900
+   1508.5115   1491.8400     34.9400      4.0900
+   1508.6377   1491.8400     34.9400      4.0900
+   1508.7639   1491.8500     34.9400      4.0900
+   1508.8903   1491.8500     34.9400      4.0900
+   1509.0164   1491.8500     34.9400      4.0900
+   1509.1426   1491.8500     34.9400      4.0900
+   1509.2688   1491.8500     34.9400      4.0900
+   1509.3949   1491.8500     34.9400      4.0900
+   1509.5211   1491.8500     34.9400      4.0900
+   1509.6475   1491.8500     34.9500      4.0900
+   1509.7737   1491.8600     34.9500      4.0900
+   1509.8998   1491.8600     34.9500      4.0900
+   1510.0260   1491.8500     34.9400      4.0900
+   1510.1522   1491.8500     34.9400      4.0900
+   1510.2783   1491.8500     34.9500      4.0900
+   1510.4045   1491.8500     34.9500      4.0900
+   1510.5308   1491.8500     34.9500      4.0900
+   1510.6570   1491.8500     34.9500      4.0800
+   1510.7832   1473.9700     34.9500      0.0000
+   1513.4330   1446.1900      0.0000      4.0800
+   1513.5592   1446.1900      0.0000      4.0800
+   1513.6854   1446.1900      0.0000      4.0800
+   1513.8116   1491.8900     34.9400      4.0800
+   1513.9377   1491.8900     34.9400      4.0800
+   1514.0640   1491.8900     34.9400      4.0800
+   1514.1901   1491.8900     34.9400      4.0800
+   1514.3162   1491.9000     34.9500      4.0800
+   1514.4424   1491.9000     34.9500      4.0800
+   1514.5686   1491.9000     34.9500      4.0800
+   1514.6948   1491.9100     34.9500      4.0800
+   1514.8209   1491.9100     34.9500      4.0800
+   1514.9470   1491.9100     34.9500      4.0800
+   1515.0732   1491.9100     34.9500      4.0800
+   1515.1995   1491.9200     34.9500      4.0800
+   1515.3256   1491.9200     34.9500      4.0800
+   1515.4517   1491.9200     34.9500      4.0800
+   1515.5779   1491.9200     34.9500      4.0800
+   1515.7040   1491.9200     34.9400      4.0800
+   1515.8302   1491.9200     34.9400      4.0800
+   1515.9563   1491.9300     34.9500      4.0800
+   1516.0825   1491.9300     34.9500      4.0800
+   1516.2086   1491.9300     34.9500      4.0800
+   1516.3348   1491.9300     34.9500      4.0800
+   1516.4609   1474.0600     34.9400      0.0000
+   1519.1099   1446.2800      0.0000      4.0800
+   1519.2361   1446.2800      0.0000      4.0800
+   1519.3621   1446.2900      0.0000      4.0800
+   1519.4883   1491.9800     34.9400      4.0800
+   1519.6144   1491.9800     34.9400      4.0800
+   1519.7405   1491.9800     34.9400      4.0800
+   1519.8666   1491.9900     34.9400      4.0800
+   1519.9928   1491.9900     34.9400      4.0800
+   1520.1189   1491.9900     34.9400      4.0800
+   1520.2450   1491.9900     34.9400      4.0800
+   1520.3711   1491.9900     34.9400      4.0800
+   1520.4973   1492.0000     34.9400      4.0800
+   1520.6233   1492.0000     34.9400      4.0800
+   1520.7495   1491.9900     34.9400      4.0800
+   1520.8756   1491.9900     34.9400      4.0800
+   1521.0017   1492.0000     34.9400      4.0800
+   1521.1278   1492.0000     34.9400      4.0800
+   1521.2539   1492.0000     34.9400      4.0800
+   1521.3801   1492.0100     34.9400      4.0800
+   1521.5062   1492.0100     34.9400      4.0800
+   1521.6322   1492.0100     34.9400      4.0800
+   1521.7584   1492.0100     34.9400      4.0800
+   1521.8845   1474.1500     34.9400      0.0000
+   1524.4065   1446.3700      0.0000      4.0800
+   1524.5326   1446.3700      0.0000      4.0800
+   1524.6587   1446.3700      0.0000      4.0800
+   1524.7847   1492.0700     34.9400      4.0800
+   1524.9108   1492.0700     34.9400      4.0800
+   1525.0369   1492.0800     34.9500      4.0800
+   1525.1630   1492.0800     34.9500      4.0800
+   1525.2891   1492.0800     34.9500      4.0800
+   1525.4152   1492.0800     34.9500      4.0800
+   1525.5413   1492.0900     34.9500      4.0800
+   1525.6672   1492.0900     34.9500      4.0800
+   1525.7933   1492.0900     34.9400      4.0800
+   1525.9194   1492.0900     34.9400      4.0800
+   1526.0454   1492.0900     34.9400      4.0800
+   1526.1715   1492.0900     34.9400      4.0800
+   1526.2976   1492.1000     34.9400      4.0800
+   1526.4237   1492.1000     34.9400      4.0800
+   1526.5498   1492.1000     34.9400      4.0800
+   1526.6759   1492.1000     34.9400      4.0800
+   1526.8020   1492.1000     34.9400      4.0800
+   1526.9280   1492.1100     34.9500      4.0800
+   1527.0541   1492.1000     34.9500      4.0800
+   1527.1802   1492.1000     34.9500      4.0800
+   1527.3063   1492.1000     34.9500      4.0800
+   1527.4323   1492.1000     34.9500      4.0800
+   1527.5583   1492.0900     34.9500      4.0800
+   1527.6844   1492.0900     34.9500      4.0700
+   1527.8105   1492.0900     34.9500      4.0700
+   1527.9365   1492.0900     34.9500      4.0700
+   1528.0626   1492.0900     34.9500      4.0700
+   1528.1887   1492.0900     34.9500      4.0700
+   1528.3147   1492.0900     34.9500      4.0700
+   1528.4407   1492.1000     34.9500      4.0700
+   1528.5668   1492.1000     34.9500      4.0700
+   1528.6929   1492.1000     34.9500      4.0700
+   1528.8188   1492.1000     34.9500      4.0700
+   1528.9449   1492.1000     34.9500      4.0700
+   1529.0710   1492.1100     34.9500      4.0700
+   1529.1970   1492.1100     34.9500      4.0700
+   1529.3231   1492.1100     34.9500      4.0700
+   1529.4492   1492.1100     34.9500      4.0700
+   1529.5752   1492.1100     34.9500      4.0700
+   1529.7012   1492.1100     34.9400      4.0700
+   1529.8273   1492.1100     34.9400      4.0700
+   1529.9534   1492.1100     34.9400      4.0700
+   1530.0793   1492.1200     34.9400      4.0700
+   1530.2054   1492.1200     34.9400      4.0700
+   1530.3314   1492.1200     34.9400      4.0700
+   1530.4575   1492.1200     34.9400      4.0700
+   1530.5835   1492.1200     34.9400      4.0700
+   1530.7096   1492.1200     34.9400      4.0700
+   1530.8357   1492.1200     34.9400      4.0700
+   1530.9617   1492.1300     34.9400      4.0700
+   1531.0876   1492.1300     34.9400      4.0700
+   1531.2137   1492.1300     34.9400      4.0700
+   1531.3398   1492.1300     34.9400      4.0700
+   1531.4658   1492.1300     34.9400      4.0700
+   1531.5918   1492.1400     34.9400      4.0700
+   1531.7179   1492.1400     34.9400      4.0700
+   1531.8440   1492.1400     34.9400      4.0700
+   1531.9698   1492.1400     34.9400      4.0700
+   1532.0959   1492.1400     34.9400      4.0700
+   1532.2220   1492.1300     34.9400      4.0700
+   1532.3479   1492.1300     34.9400      4.0700
+   1532.4740   1492.1300     34.9400      4.0700
+   1532.6001   1492.1300     34.9400      4.0700
+   1532.7261   1492.1300     34.9400      4.0700
+   1532.8521   1492.1300     34.9400      4.0600
+   1532.9781   1492.1300     34.9400      4.0600
+   1533.1041   1492.1300     34.9400      4.0600
+   1533.2301   1492.1300     34.9500      4.0600
+   1533.3562   1492.1300     34.9500      4.0600
+   1533.4822   1492.1400     34.9500      4.0600
+   1533.6083   1492.1400     34.9500      4.0600
+   1533.7341   1492.1400     34.9500      4.0600
+   1533.8602   1492.1400     34.9500      4.0600
+   1533.9862   1492.1400     34.9500      4.0600
+   1534.1123   1492.1500     34.9500      4.0600
+   1534.2383   1474.3600     34.9500      0.0000
+   1535.3723   1446.4500      0.0000      4.0600
+   1535.4983   1446.4600      0.0000      4.0600
+   1535.6243   1446.4600      0.0000      4.0600
+   1535.7504   1492.1700     34.9400      4.0600
+   1535.8763   1492.1700     34.9400      4.0600
+   1536.0023   1492.1700     34.9400      4.0600
+   1536.1283   1492.1700     34.9400      4.0600
+   1536.2543   1492.1700     34.9400      4.0600
+   1536.3802   1492.1700     34.9400      4.0600
+   1536.5062   1492.1800     34.9400      4.0600
+   1536.6323   1492.1800     34.9400      4.0600
+   1536.7583   1492.1700     34.9400      4.0600
+   1536.8843   1492.1800     34.9400      4.0600
+   1537.0103   1492.1700     34.9400      4.0600
+   1537.1362   1492.1700     34.9400      4.0600
+   1537.2623   1492.1700     34.9400      4.0600
+   1537.3882   1492.1700     34.9500      4.0600
+   1537.5142   1492.1800     34.9500      4.0600
+   1537.6403   1492.1800     34.9500      4.0600
+   1537.7661   1492.1800     34.9500      4.0600
+   1537.8921   1492.1800     34.9400      4.0600
+   1538.0182   1492.1800     34.9400      4.0600
+   1538.1442   1492.1800     34.9400      4.0600
+   1538.2700   1492.1800     34.9400      4.0600
+   1538.3961   1492.1800     34.9400      4.0600
+   1538.5221   1492.1900     34.9400      4.0600
+   1538.6479   1492.1800     34.9400      4.0500
+   1538.7739   1474.4300     34.9400      0.0000
+   1539.9077   1446.4800      0.0000      4.0500
+   1540.0337   1446.4800      0.0000      4.0500
+   1540.1597   1446.4900      0.0000      4.0500
+   1540.2856   1492.2000     34.9400      4.0500
+   1540.4116   1492.2000     34.9400      4.0500
+   1540.5375   1492.2000     34.9400      4.0500
+   1540.6635   1492.2000     34.9400      4.0500
+   1540.7896   1492.2000     34.9400      4.0500
+   1540.9154   1492.2100     34.9400      4.0500
+   1541.0414   1492.2100     34.9400      4.0500
+   1541.1674   1492.2100     34.9400      4.0500
+   1541.2933   1492.2100     34.9400      4.0500
+   1541.4192   1492.2200     34.9400      4.0500
+   1541.5452   1492.2200     34.9400      4.0500
+   1541.6711   1492.2200     34.9400      4.0500
+   1541.7971   1492.2200     34.9400      4.0500
+   1541.9231   1492.2300     34.9400      4.0500
+   1542.0491   1492.2300     34.9400      4.0500
+   1542.1750   1492.2300     34.9400      4.0500
+   1542.3009   1492.2400     34.9400      4.0500
+   1542.4269   1492.2400     34.9400      4.0500
+   1542.5529   1492.2400     34.9400      4.0500
+   1542.6787   1492.2400     34.9400      4.0500
+   1542.8047   1492.2400     34.9400      4.0500
+   1542.9307   1492.2500     34.9400      4.0500
+   1543.0566   1492.2500     34.9400      4.0500
+   1543.1825   1492.2500     34.9400      4.0500
+   1543.3085   1474.5100     34.9400      0.0000
+   1544.4419   1446.5600      0.0000      4.0500
+   1544.5677   1446.5600      0.0000      4.0500
+   1544.6937   1446.5600      0.0000      4.0500
+   1544.8197   1492.2700     34.9400      4.0500
+   1544.9456   1492.2700     34.9400      4.0500
+   1545.0715   1492.2800     34.9400      4.0500
+   1545.1974   1492.2800     34.9400      4.0500
+   1545.3234   1492.2800     34.9400      4.0500
+   1545.4492   1492.2800     34.9400      4.0500
+   1545.5752   1492.2800     34.9400      4.0500
+   1545.7012   1492.2800     34.9300      4.0500
+   1545.8270   1492.2900     34.9300      4.0500
+   1545.9529   1492.2800     34.9300      4.0500
+   1546.0789   1492.2800     34.9300      4.0500
+   1546.2048   1492.2900     34.9300      4.0500
+   1546.3307   1492.2900     34.9300      4.0500
+   1546.4565   1492.2900     34.9300      4.0500
+   1546.5825   1492.2900     34.9300      4.0500
+   1546.7085   1492.2900     34.9300      4.0500
+   1546.8344   1492.3000     34.9300      4.0500
+   1546.9602   1492.3000     34.9300      4.0500
+   1547.0862   1492.3000     34.9300      4.0500
+   1547.2120   1492.3100     34.9300      4.0500
+   1547.3380   1492.3100     34.9300      4.0500
+   1547.4639   1492.3100     34.9300      4.0500
+   1547.5898   1492.3100     34.9300      4.0500
+   1547.7157   1492.3200     34.9300      4.0500
+   1547.8416   1492.3200     34.9300      4.0500
+   1547.9675   1492.3200     34.9300      4.0500
+   1548.0934   1492.3200     34.9300      4.0500
+   1548.2192   1492.3200     34.9300      4.0500
+   1548.3452   1492.3300     34.9300      4.0500
+   1548.4712   1492.3300     34.9300      4.0500
+   1548.5969   1492.3300     34.9300      4.0500
+   1548.7229   1492.3300     34.9300      4.0500
+   1548.8489   1492.3300     34.9300      4.0500
+   1548.9746   1474.5900     34.9300      0.0000
+   1550.1077   1446.6500      0.0000      4.0500
+   1550.2336   1446.6500      0.0000      4.0500
+   1550.3594   1446.6500      0.0000      4.0500
+   1550.4854   1492.3600     34.9400      4.0500
+   1550.6112   1492.3600     34.9400      4.0500
+   1550.7372   1492.3600     34.9400      4.0500
+   1550.8629   1492.3600     34.9400      4.0500
+   1550.9889   1492.3600     34.9400      4.0500
+   1551.1147   1492.3600     34.9400      4.0500
+   1551.2406   1492.3600     34.9400      4.0500
+   1551.3665   1492.3500     34.9400      4.0500
+   1551.4924   1492.3600     34.9400      4.0500
+   1551.6183   1492.3500     34.9400      4.0400
+   1551.7441   1492.3600     34.9400      4.0400
+   1551.8700   1492.3500     34.9400      4.0400
+   1551.9958   1492.3500     34.9400      4.0400
+   1552.1217   1492.3600     34.9400      4.0400
+   1552.2476   1492.3600     34.9400      4.0400
+   1552.3735   1492.3600     34.9400      4.0400
+   1552.4994   1492.3600     34.9400      4.0400
+   1552.6251   1492.3600     34.9400      4.0400
+   1552.7511   1492.3700     34.9400      4.0400
+   1552.8770   1492.3700     34.9400      4.0400
+   1553.0028   1492.3700     34.9400      4.0400
+   1553.1287   1492.3700     34.9400      4.0400
+   1553.2545   1492.3700     34.9400      4.0400
+   1553.3804   1492.3800     34.9400      4.0400
+   1553.5062   1492.3800     34.9400      4.0400
+   1553.6321   1492.3800     34.9400      4.0400
+   1553.7579   1492.3800     34.9400      4.0400
+   1553.8839   1474.6800     34.9400      0.0000
+   1555.0165   1446.6800      0.0000      4.0400
+   1555.1423   1446.6800      0.0000      4.0400
+   1555.2681   1446.6900      0.0000      4.0400
+   1555.3940   1492.4100     34.9400      4.0400
+   1555.5199   1492.4100     34.9400      4.0400
+   1555.6458   1492.4100     34.9400      4.0400
+   1555.7715   1492.4100     34.9400      4.0400
+   1555.8973   1492.4200     34.9400      4.0400
+   1556.0232   1492.4200     34.9400      4.0400
+   1556.1490   1492.4200     34.9400      4.0400
+   1556.2749   1492.4200     34.9400      4.0400
+   1556.4008   1492.4200     34.9400      4.0400
+   1556.5266   1492.4300     34.9400      4.0400
+   1556.6523   1492.4300     34.9400      4.0400
+   1556.7782   1492.4300     34.9400      4.0400
+   1556.9041   1492.4300     34.9400      4.0400
+   1557.0299   1492.4300     34.9400      4.0400
+   1557.1556   1492.4400     34.9400      4.0400
+   1557.2815   1492.4300     34.9400      4.0400
+   1557.4073   1492.4400     34.9400      4.0400
+   1557.5332   1492.4400     34.9400      4.0400
+   1557.6591   1492.4400     34.9400      4.0400
+   1557.7849   1492.4400     34.9400      4.0400
+   1557.9108   1492.4400     34.9400      4.0400
+   1558.0365   1492.4400     34.9400      4.0400
+   1558.1624   1492.4400     34.9400      4.0400
+   1558.2882   1492.4400     34.9400      4.0400
+   1558.4139   1474.7600     34.9400      0.0000
+   1560.6785   1446.7800      0.0000      4.0400
+   1560.8043   1446.7800      0.0000      4.0400
+   1560.9302   1446.7800      0.0000      4.0400
+   1561.0560   1492.5000     34.9400      4.0400
+   1561.1818   1492.5000     34.9400      4.0400
+   1561.3076   1492.5000     34.9400      4.0400
+   1561.4333   1492.5000     34.9400      4.0400
+   1561.5591   1492.5000     34.9400      4.0400
+   1561.6849   1492.5100     34.9400      4.0400
+   1561.8108   1492.5100     34.9400      4.0400
+   1561.9365   1492.5100     34.9400      4.0400
+   1562.0623   1492.5100     34.9400      4.0400
+   1562.1881   1492.5200     34.9400      4.0400
+   1562.3140   1492.5200     34.9400      4.0400
+   1562.4397   1492.5200     34.9300      4.0400
+   1562.5654   1492.5200     34.9300      4.0400
+   1562.6913   1492.5300     34.9300      4.0400
+   1562.8171   1492.5300     34.9300      4.0400
+   1562.9427   1492.5300     34.9300      4.0400
+   1563.0686   1492.5300     34.9300      4.0400
+   1563.1945   1492.5300     34.9300      4.0400
+   1563.3202   1492.5300     34.9300      4.0400
+   1563.4459   1492.5300     34.9400      4.0400
+   1563.5718   1492.5300     34.9400      4.0400
+   1563.6975   1492.5300     34.9400      4.0400
+   1563.8232   1492.5300     34.9400      4.0400
+   1563.9491   1492.5400     34.9400      4.0400
+   1564.0748   1474.8500     34.9400      0.0000
+   1565.9614   1446.8600      0.0000      4.0400
+   1566.0872   1446.8600      0.0000      4.0400
+   1566.2129   1446.8700      0.0000      4.0400
+   1566.3386   1492.5900     34.9400      4.0400
+   1566.4645   1492.5900     34.9400      4.0400
+   1566.5901   1492.6000     34.9400      4.0400
+   1566.7159   1492.6000     34.9400      4.0400
+   1566.8417   1492.6000     34.9400      4.0400
+   1566.9674   1492.6000     34.9400      4.0400
+   1567.0931   1492.6100     34.9400      4.0400
+   1567.2190   1492.6100     34.9400      4.0400
+   1567.3447   1492.6100     34.9400      4.0400
+   1567.4703   1492.6200     34.9400      4.0400
+   1567.5962   1492.6100     34.9400      4.0400
+   1567.7219   1492.6200     34.9400      4.0400
+   1567.8477   1492.6200     34.9400      4.0400
+   1567.9734   1492.6200     34.9400      4.0400
+   1568.0991   1492.6300     34.9400      4.0400
+   1568.2250   1492.6300     34.9400      4.0400
+   1568.3506   1492.6300     34.9400      4.0400
+   1568.4763   1492.6300     34.9400      4.0400
+   1568.6022   1492.6300     34.9400      4.0400
+   1568.7279   1492.6400     34.9400      4.0400
+   1568.8536   1492.6400     34.9400      4.0400
+   1568.9794   1474.9400     34.9400      0.0000
+   1571.2424   1446.9500      0.0000      4.0400
+   1571.3682   1446.9500      0.0000      4.0400
+   1571.4939   1446.9500      0.0000      4.0400
+   1571.6196   1492.6900     34.9500      4.0400
+   1571.7454   1492.6900     34.9500      4.0400
+   1571.8711   1492.6900     34.9500      4.0400
+   1571.9967   1492.6900     34.9400      4.0400
+   1572.1224   1492.7000     34.9400      4.0400
+   1572.2482   1492.7000     34.9400      4.0400
+   1572.3738   1492.7000     34.9400      4.0400
+   1572.4995   1492.7000     34.9400      4.0400
+   1572.6252   1492.7000     34.9400      4.0400
+   1572.7510   1492.6900     34.9400      4.0400
+   1572.8767   1492.7000     34.9400      4.0400
+   1573.0024   1492.7000     34.9400      4.0400
+   1573.1282   1492.7000     34.9400      4.0400
+   1573.2538   1492.7000     34.9300      4.0400
+   1573.3795   1492.7000     34.9300      4.0400
+   1573.5052   1492.7000     34.9300      4.0400
+   1573.6310   1492.7000     34.9300      4.0400
+   1573.7566   1492.7100     34.9300      4.0400
+   1573.8823   1492.7100     34.9300      4.0400
+   1574.0081   1492.7100     34.9300      4.0400
+   1574.1337   1492.7200     34.9400      4.0400
+   1574.2594   1492.7200     34.9400      4.0400
+   1574.3851   1492.7200     34.9400      4.0400
+   1574.5109   1492.7200     34.9400      4.0400
+   1574.6365   1475.0400     34.9400      0.0000
+   1575.7677   1447.0100      0.0000      4.0400
+   1575.8934   1447.0100      0.0000      4.0400
+   1576.0190   1447.0200      0.0000      4.0400
+   1576.1447   1492.7400     34.9400      4.0400
+   1576.2704   1492.7400     34.9300      4.0400
+   1576.3960   1492.7400     34.9400      4.0400
+   1576.5217   1492.7500     34.9400      4.0400
+   1576.6475   1492.7600     34.9400      4.0400
+   1576.7732   1492.7500     34.9400      4.0400
+   1576.8987   1492.7500     34.9400      4.0400
+   1577.0244   1492.7600     34.9400      4.0400
+   1577.1501   1492.7600     34.9400      4.0400
+   1577.2758   1492.7700     34.9400      4.0400
+   1577.4015   1492.7700     34.9500      4.0400
+   1577.5271   1492.7700     34.9500      4.0400
+   1577.6528   1492.7600     34.9400      4.0400
+   1577.7784   1492.7600     34.9400      4.0400
+   1577.9042   1492.7700     34.9500      4.0400
+   1578.0298   1492.7700     34.9500      4.0400
+   1578.1555   1492.7600     34.9400      4.0300
+   1578.2811   1492.7700     34.9400      4.0300
+   1578.4067   1492.7600     34.9500      4.0300
+   1578.5325   1492.7700     34.9500      4.0300
+   1578.6581   1492.7700     34.9400      4.0300
+   1578.7838   1492.7700     34.9400      4.0300
+   1578.9094   1492.7700     34.9400      4.0300
+   1579.0352   1492.7700     34.9500      4.0300
+   1579.1608   1492.7800     34.9500      4.0300
+   1579.2864   1492.7800     34.9500      4.0300
+   1579.4121   1492.7800     34.9500      4.0300
+   1579.5377   1475.1300     34.9500      0.0000
+   1581.4224   1447.0700      0.0000      4.0300
+   1581.5481   1447.0700      0.0000      4.0300
+   1581.6737   1447.0700      0.0000      4.0300
+   1581.7993   1492.8000     34.9400      4.0300
+   1581.9249   1492.8000     34.9400      4.0300
+   1582.0505   1492.8000     34.9400      4.0300
+   1582.1763   1492.8000     34.9400      4.0300
+   1582.3018   1492.7900     34.9400      4.0300
+   1582.4275   1492.7900     34.9400      4.0300
+   1582.5531   1492.7900     34.9400      4.0200
+   1582.6787   1492.7900     34.9400      4.0200
+   1582.8043   1492.7900     34.9400      4.0200
+   1582.9301   1492.7900     34.9500      4.0200
+   1583.0557   1492.8000     34.9500      4.0200
+   1583.1812   1492.8000     34.9500      4.0200
+   1583.3069   1492.8000     34.9500      4.0200
+   1583.4325   1492.8000     34.9500      4.0200
+   1583.5581   1492.8100     34.9500      4.0200
+   1583.6837   1492.8100     34.9500      4.0200
+   1583.8093   1492.8100     34.9500      4.0200
+   1583.9351   1492.8100     34.9500      4.0200
+   1584.0605   1492.8100     34.9500      4.0200
+   1584.1862   1492.8200     34.9500      4.0200
+   1584.3119   1492.8200     34.9500      4.0200
+   1584.4375   1492.8200     34.9400      4.0200
+   1584.5630   1492.8200     34.9400      4.0200
+   1584.6887   1492.8200     34.9400      4.0200
+   1584.8143   1492.8300     34.9400      4.0200
+   1584.9398   1492.8300     34.9400      4.0200
+   1585.0654   1492.8300     34.9400      4.0200
+   1585.1912   1492.8300     34.9400      4.0200
+   1585.3168   1492.8300     34.9400      4.0200
+   1585.4423   1492.8400     34.9400      4.0200
+   1585.5679   1492.8400     34.9400      4.0200
+   1585.6936   1492.8400     34.9400      4.0200
+   1585.8191   1492.8400     34.9400      4.0200
+   1585.9447   1492.8400     34.9400      4.0200
+   1586.0703   1475.2300     34.9400      0.0000
+   1587.4519   1447.1200      0.0000      4.0200
+   1587.5775   1447.1200      0.0000      4.0200
+   1587.7030   1447.1300      0.0000      4.0200
+   1587.8286   1492.8700     34.9400      4.0200
+   1587.9542   1492.8800     34.9400      4.0200
+   1588.0798   1492.8700     34.9400      4.0200
+   1588.2054   1492.8800     34.9400      4.0200
+   1588.3311   1492.8800     34.9400      4.0200
+   1588.4567   1492.8800     34.9400      4.0200
+   1588.5822   1492.8800     34.9400      4.0200
+   1588.7078   1492.8800     34.9400      4.0200
+   1588.8334   1492.8800     34.9400      4.0200
+   1588.9589   1492.8800     34.9500      4.0200
+   1589.0845   1492.8800     34.9500      4.0200
+   1589.2101   1492.8900     34.9500      4.0200
+   1589.3357   1492.8800     34.9500      4.0200
+   1589.4612   1492.8800     34.9500      4.0200
+   1589.5868   1492.8800     34.9500      4.0100
+   1589.7124   1492.8700     34.9500      4.0100
+   1589.8379   1492.8800     34.9500      4.0100
+   1589.9635   1492.8800     34.9500      4.0100
+   1590.0891   1492.8800     34.9500      4.0100
+   1590.2147   1492.8800     34.9500      4.0100
+   1590.3402   1492.8900     34.9500      4.0100
+   1590.4658   1492.8800     34.9400      4.0100
+   1590.5913   1492.8900     34.9400      4.0200
+   1590.7169   1492.9000     34.9400      4.0200
+   1590.8424   1492.9000     34.9400      4.0200
+   1590.9680   1492.9000     34.9300      4.0200
+   1591.0936   1492.9100     34.9300      4.0200
+   1591.2191   1492.9100     34.9300      4.0200
+   1591.3447   1492.9100     34.9300      4.0200
+   1591.4703   1492.9100     34.9300      4.0200
+   1591.5959   1492.9100     34.9300      4.0200
+   1591.7214   1492.9100     34.9300      4.0200
+   1591.8469   1492.9100     34.9300      4.0200
+   1591.9725   1492.9200     34.9300      4.0200
+   1592.0980   1492.9200     34.9300      4.0200
+   1592.2236   1492.9100     34.9300      4.0200
+   1592.3492   1475.3100     34.9300      0.0000
+   1593.4791   1447.1700      0.0000      4.0100
+   1593.6046   1447.1700      0.0000      4.0100
+   1593.7302   1447.1800      0.0000      4.0100
+   1593.8558   1492.9300     34.9400      4.0100
+   1593.9812   1492.9300     34.9400      4.0100
+   1594.1068   1492.9300     34.9400      4.0100
+   1594.2324   1492.9300     34.9400      4.0100
+   1594.3578   1492.9300     34.9400      4.0100
+   1594.4834   1492.9300     34.9400      4.0100
+   1594.6090   1492.9300     34.9400      4.0100
+   1594.7345   1492.9300     34.9400      4.0100
+   1594.8600   1492.9300     34.9400      4.0100
+   1594.9856   1492.9300     34.9400      4.0100
+   1595.1111   1492.9400     34.9400      4.0100
+   1595.2366   1492.9400     34.9400      4.0100
+   1595.3622   1492.9500     34.9400      4.0100
+   1595.4877   1492.9500     34.9400      4.0100
+   1595.6133   1492.9600     34.9400      4.0100
+   1595.7386   1492.9600     34.9300      4.0100
+   1595.8643   1492.9700     34.9300      4.0200
+   1595.9897   1492.9800     34.9300      4.0200
+   1596.1152   1492.9900     34.9300      4.0200
+   1596.2408   1492.9900     34.9300      4.0200
+   1596.3663   1492.9900     34.9200      4.0200
+   1596.4919   1492.9900     34.9200      4.0200
+   1596.6173   1492.9900     34.9200      4.0200
+   1596.7429   1492.9900     34.9200      4.0200
+   1596.8684   1492.9900     34.9200      4.0200
+   1596.9940   1492.9900     34.9200      4.0200
+   1597.1194   1492.9900     34.9200      4.0200
+   1597.2450   1492.9900     34.9300      4.0200
+   1597.3705   1492.9900     34.9300      4.0200
+   1597.4960   1492.9900     34.9300      4.0200
+   1597.6215   1493.0000     34.9300      4.0200
+   1597.7471   1493.0100     34.9300      4.0200
+   1597.8726   1493.0100     34.9300      4.0200
+   1597.9980   1475.4100     34.9300      0.0000
+   1600.6334   1447.2500      0.0000      4.0000
+   1600.7589   1447.2600      0.0000      4.0100
+   1600.8844   1447.2600      0.0000      4.0100
+   1601.0099   1475.4700     34.9400      0.0000
+   1603.5194   1447.2900      0.0000      4.0000
+   1603.6449   1447.2900      0.0000      4.0000
+   1603.7703   1447.3000      0.0000      4.0000
+   1603.8958   1475.5200     34.9400      0.0000
+   1605.1503   1447.3200      0.0000      4.0000
+   1606.4048   1447.3400      0.0000      4.0000
+   1606.5302   1447.3400      0.0000      4.0000
+   1606.6556   1447.3400      0.0000      4.0000
+   1606.7811   1493.1000     34.9400      4.0000
+   1606.9065   1493.1000     34.9400      4.0000
+   1607.0320   1493.1000     34.9400      4.0000
+   1607.1575   1493.1000     34.9400      4.0000
+   1607.2828   1493.1100     34.9400      4.0000
+   1607.4082   1493.1100     34.9400      4.0000
+   1607.5337   1493.1100     34.9400      4.0000
+   1607.6592   1493.1100     34.9400      4.0000
+   1607.7845   1493.1200     34.9400      4.0000
+   1607.9100   1493.1200     34.9400      4.0000
+   1608.0354   1493.1200     34.9400      4.0000
+   1608.1609   1475.5900     34.9400      0.0000
+   1610.6692   1447.4100      0.0000      4.0000
+   1610.7947   1447.4100      0.0000      4.0000
+   1610.9199   1447.4100      0.0000      4.0000
+   1611.0454   1493.1700     34.9400      4.0000
+   1611.1708   1493.1700     34.9300      4.0000
+   1611.2963   1493.1700     34.9300      4.0000
+   1611.4216   1493.1700     34.9300      4.0000
+   1611.5470   1493.1800     34.9300      4.0000
+   1611.6725   1493.1800     34.9300      4.0000
+   1611.7977   1493.1800     34.9300      4.0000
+   1611.9232   1493.1800     34.9300      4.0000
+   1612.0486   1493.1800     34.9400      4.0000
+   1612.1741   1493.1800     34.9400      4.0000
+   1612.2993   1493.1800     34.9400      4.0000
+   1612.4248   1493.1900     34.9400      4.0000
+   1612.5502   1493.1800     34.9400      4.0000
+   1612.6757   1493.1800     34.9400      4.0000
+   1612.8009   1493.1800     34.9400      4.0000
+   1612.9264   1493.1800     34.9400      4.0000
+   1613.0518   1493.1900     34.9400      4.0000
+   1613.1771   1493.1900     34.9400      4.0000
+   1613.3025   1493.1800     34.9400      4.0000
+   1613.4280   1493.1800     34.9400      3.9900
+   1613.5533   1493.1800     34.9400      3.9900
+   1613.6787   1493.1800     34.9400      3.9900
+   1613.8041   1475.6900     34.9400      0.0000
+   1614.9324   1447.4300      0.0000      3.9900
+   1615.0579   1447.4300      0.0000      3.9900
+   1615.1832   1447.4400      0.0000      3.9900
+   1615.3086   1493.2100     34.9400      3.9900
+   1615.4340   1493.2100     34.9400      3.9900
+   1615.5593   1493.2100     34.9400      3.9900
+   1615.6847   1493.2100     34.9400      3.9900
+   1615.8101   1493.2200     34.9400      3.9900
+   1615.9354   1493.2200     34.9400      3.9900
+   1616.0608   1493.2200     34.9400      3.9900
+   1616.1862   1493.2200     34.9400      3.9900
+   1616.3115   1493.2200     34.9400      3.9900
+   1616.4369   1493.2300     34.9400      3.9900
+   1616.5623   1493.2300     34.9400      3.9900
+   1616.6876   1493.2300     34.9400      3.9900
+   1616.8130   1493.2300     34.9400      3.9900
+   1616.9384   1493.2300     34.9400      3.9900
+   1617.0637   1493.2400     34.9400      3.9900
+   1617.1890   1493.2400     34.9400      3.9900
+   1617.3143   1493.2400     34.9400      3.9900
+   1617.4397   1493.2400     34.9400      3.9900
+   1617.5652   1493.2400     34.9400      3.9900
+   1617.6904   1493.2500     34.9400      3.9900
+   1617.8158   1493.2500     34.9400      3.9900
+   1617.9412   1493.2500     34.9400      3.9900
+   1618.0664   1493.2500     34.9400      3.9900
+   1618.1918   1493.2500     34.9400      3.9900
+   1618.3173   1493.2600     34.9400      3.9900
+   1618.4426   1493.2600     34.9400      3.9900
+   1618.5679   1493.2600     34.9400      3.9900
+   1618.6932   1493.2600     34.9400      3.9900
+   1618.8186   1493.2600     34.9400      3.9900
+   1618.9440   1493.2700     34.9400      3.9900
+   1619.0692   1475.7800     34.9400      0.0000
+   1620.1973   1447.4800      0.0000      3.9800
+   1620.3226   1447.4800      0.0000      3.9800
+   1620.4479   1447.4800      0.0000      3.9800
+   1620.5732   1493.2600     34.9500      3.9800
+   1620.6986   1493.2700     34.9500      3.9800
+   1620.8239   1493.2700     34.9500      3.9800
+   1620.9492   1493.2700     34.9500      3.9800
+   1621.0746   1493.2700     34.9500      3.9800
+   1621.1998   1493.2700     34.9500      3.9800
+   1621.3252   1493.2700     34.9500      3.9800
+   1621.4506   1493.2700     34.9500      3.9800
+   1621.5759   1493.2800     34.9500      3.9800
+   1621.7012   1493.2800     34.9500      3.9800
+   1621.8265   1493.2800     34.9500      3.9800
+   1621.9519   1493.2800     34.9500      3.9800
+   1622.0771   1493.2800     34.9500      3.9800
+   1622.2024   1493.2900     34.9500      3.9800
+   1622.3278   1493.2900     34.9500      3.9800
+   1622.4531   1493.2900     34.9500      3.9800
+   1622.5784   1493.2900     34.9500      3.9800
+   1622.7037   1493.2900     34.9500      3.9800
+   1622.8291   1493.3000     34.9500      3.9800
+   1622.9543   1493.3000     34.9500      3.9800
+   1623.0796   1493.3000     34.9500      3.9800
+   1623.2050   1493.3000     34.9500      3.9800
+   1623.3303   1493.3000     34.9500      3.9800
+   1623.4556   1493.3100     34.9500      3.9800
+   1623.5808   1475.8600     34.9500      0.0000
+   1625.4603   1447.5600      0.0000      3.9800
+   1625.5857   1447.5600      0.0000      3.9800
+   1625.7109   1447.5600      0.0000      3.9800
+   1625.8362   1493.3400     34.9400      3.9800
+   1625.9615   1493.3400     34.9400      3.9800
+   1626.0868   1493.3400     34.9400      3.9800
+   1626.2120   1493.3400     34.9400      3.9800
+   1626.3374   1493.3400     34.9400      3.9800
+   1626.4626   1493.3400     34.9400      3.9800
+   1626.5879   1493.3400     34.9400      3.9800
+   1626.7131   1493.3400     34.9400      3.9800
+   1626.8385   1493.3400     34.9400      3.9800
+   1626.9637   1493.3400     34.9400      3.9800
+   1627.0890   1493.3400     34.9300      3.9800
+   1627.2144   1493.3400     34.9400      3.9800
+   1627.3396   1493.3300     34.9300      3.9800
+   1627.4648   1493.3400     34.9400      3.9800
+   1627.5901   1493.3400     34.9400      3.9800
+   1627.7155   1475.9200     34.9400      0.0000
+   1628.8428   1447.5700      0.0000      3.9700
+   1628.9680   1447.5700      0.0000      3.9700
+   1629.0934   1447.5700      0.0000      3.9700
+   1629.2186   1493.3500     34.9400      3.9700
+   1629.3439   1493.3500     34.9400      3.9700
+   1629.4691   1493.3600     34.9400      3.9700
+   1629.5944   1493.3600     34.9400      3.9700
+   1629.7196   1493.3600     34.9400      3.9700
+   1629.8448   1493.3600     34.9400      3.9700
+   1629.9702   1493.3600     34.9400      3.9700
+   1630.0955   1493.3700     34.9400      3.9700
+   1630.2206   1493.3700     34.9400      3.9700
+   1630.3459   1493.3700     34.9400      3.9700
+   1630.4712   1475.9700     34.9400      0.0000
+   1632.9760   1447.5900      0.0000      3.9600
+   1633.1012   1447.5900      0.0000      3.9600
+   1633.2264   1447.5900      0.0000      3.9600
+   1633.3516   1493.3900     34.9500      3.9600
+   1633.4769   1493.3900     34.9500      3.9600
+   1633.6022   1493.3900     34.9500      3.9600
+   1633.7273   1493.3900     34.9500      3.9600
+   1633.8525   1476.0400     34.9500      0.0000
+   1638.9860   1447.6600      0.0000      3.9600
+   1639.1111   1447.6600      0.0000      3.9600
+   1639.2362   1447.6600      0.0000      3.9600
+   1639.3615   1493.4500     34.9400      3.9500
+   1639.4867   1493.4400     34.9400      3.9500
+   1639.6118   1493.4500     34.9400      3.9500
+   1639.7369   1493.4500     34.9400      3.9500
+   1639.8622   1493.4400     34.9400      3.9500
+   1639.9873   1493.4500     34.9400      3.9500
+   1640.1124   1493.4500     34.9400      3.9500
+   1640.2377   1493.4500     34.9400      3.9500
+   1640.3629   1493.4500     34.9400      3.9500
+   1640.4880   1493.4500     34.9400      3.9500
+   1640.6132   1493.4600     34.9400      3.9500
+   1640.7384   1493.4600     34.9400      3.9500
+   1640.8635   1493.4600     34.9400      3.9500
+   1640.9886   1493.4600     34.9400      3.9500
+   1641.1139   1493.4600     34.9400      3.9500
+   1641.2390   1493.4700     34.9400      3.9500
+   1641.3641   1493.4700     34.9400      3.9500
+   1641.4894   1493.4700     34.9400      3.9500
+   1641.6145   1493.4700     34.9400      3.9500
+   1641.7397   1493.4800     34.9400      3.9500
+   1641.8649   1493.4800     34.9400      3.9500
+   1641.9900   1493.4800     34.9400      3.9500
+   1642.1152   1493.4900     34.9400      3.9500
+   1642.2402   1493.4900     34.9400      3.9500
+   1642.3655   1493.4900     34.9400      3.9500
+   1642.4906   1493.4900     34.9400      3.9500
+   1642.6158   1493.4900     34.9400      3.9500
+   1642.7410   1493.4900     34.9400      3.9500
+   1642.8661   1493.5000     34.9400      3.9500
+   1642.9912   1493.4900     34.9400      3.9500
+   1643.1163   1493.5000     34.9400      3.9500
+   1643.2416   1493.5000     34.9400      3.9500
+   1643.3667   1493.5000     34.9400      3.9500
+   1643.4918   1493.5000     34.9400      3.9500
+   1643.6169   1493.5000     34.9400      3.9500
+   1643.7421   1493.5100     34.9400      3.9500
+   1643.8673   1476.1900     34.9400      0.0000
+   1644.9935   1447.7400      0.0000      3.9500
+   1645.1187   1447.7400      0.0000      3.9500
+   1645.2438   1447.7400      0.0000      3.9500
+   1645.3689   1493.5300     34.9400      3.9500
+   1645.4940   1493.5300     34.9300      3.9500
+   1645.6193   1493.5400     34.9300      3.9500
+   1645.7444   1493.5400     34.9300      3.9500
+   1645.8694   1493.5400     34.9400      3.9500
+   1645.9946   1493.5500     34.9400      3.9500
+   1646.1198   1493.5500     34.9400      3.9500
+   1646.2448   1493.5500     34.9400      3.9500
+   1646.3700   1493.5500     34.9400      3.9500
+   1646.4951   1493.5500     34.9400      3.9500
+   1646.6202   1493.5600     34.9400      3.9500
+   1646.7452   1493.5600     34.9400      3.9500
+   1646.8705   1493.5600     34.9400      3.9500
+   1646.9956   1493.5600     34.9300      3.9500
+   1647.1207   1493.5600     34.9300      3.9500
+   1647.2457   1493.5600     34.9300      3.9500
+   1647.3710   1493.5600     34.9300      3.9500
+   1647.4961   1493.5600     34.9300      3.9500
+   1647.6211   1493.5600     34.9300      3.9500
+   1647.7462   1493.5600     34.9400      3.9500
+   1647.8715   1493.5600     34.9400      3.9500
+   1647.9966   1493.5600     34.9400      3.9500
+   1648.1216   1493.5700     34.9400      3.9500
+   1648.2467   1493.5700     34.9400      3.9500
+   1648.3718   1493.5700     34.9400      3.9500
+   1648.4969   1476.2700     34.9400      0.0000
+   1649.8730   1447.7800      0.0000      3.9400
+   1649.9982   1447.7800      0.0000      3.9400
+   1650.1233   1447.7800      0.0000      3.9400
+   1650.2484   1493.5900     34.9400      3.9400
+   1650.3734   1493.5800     34.9400      3.9400
+   1650.4985   1493.5900     34.9400      3.9400
+   1650.6237   1493.5900     34.9400      3.9400
+   1650.7487   1493.5900     34.9400      3.9400
+   1650.8738   1493.5900     34.9400      3.9400
+   1650.9989   1493.6000     34.9400      3.9400
+   1651.1240   1493.6000     34.9400      3.9400
+   1651.2490   1493.6000     34.9400      3.9400
+   1651.3741   1493.6000     34.9400      3.9400
+   1651.4993   1493.6000     34.9400      3.9400
+   1651.6243   1493.6100     34.9400      3.9400
+   1651.7494   1493.6100     34.9400      3.9400
+   1651.8745   1493.6100     34.9400      3.9400
+   1651.9996   1493.6100     34.9400      3.9400
+   1652.1246   1493.6100     34.9400      3.9400
+   1652.2498   1493.6200     34.9400      3.9400
+   1652.3749   1493.6200     34.9400      3.9400
+   1652.4999   1493.6200     34.9400      3.9400
+   1652.6249   1493.6200     34.9400      3.9400
+   1652.7500   1493.6200     34.9400      3.9400
+   1652.8751   1493.6300     34.9400      3.9400
+   1653.0001   1493.6300     34.9400      3.9400
+   1653.1252   1493.6300     34.9400      3.9400
+   1653.2504   1476.3500     34.9400      0.0000
+   1654.3759   1447.8400      0.0000      3.9400
+   1654.5010   1447.8500      0.0000      3.9400
+   1654.6261   1447.8500      0.0000      3.9400
+   1654.7510   1493.6600     34.9400      3.9400
+   1654.8761   1493.6600     34.9400      3.9400
+   1655.0012   1493.6600     34.9400      3.9400
+   1655.1263   1493.6600     34.9400      3.9400
+   1655.2512   1493.6600     34.9400      3.9400
+   1655.3763   1493.6700     34.9400      3.9400
+   1655.5015   1493.6700     34.9400      3.9400
+   1655.6265   1493.6700     34.9400      3.9400
+   1655.7515   1493.6700     34.9400      3.9400
+   1655.8766   1493.6700     34.9400      3.9400
+   1656.0016   1493.6800     34.9400      3.9400
+   1656.1266   1493.6800     34.9400      3.9400
+   1656.2517   1493.6800     34.9400      3.9400
+   1656.3767   1493.6800     34.9400      3.9400
+   1656.5018   1493.6800     34.9400      3.9400
+   1656.6268   1493.6900     34.9400      3.9400
+   1656.7518   1493.6900     34.9400      3.9400
+   1656.8770   1493.6900     34.9400      3.9400
+   1657.0020   1493.6900     34.9400      3.9400
+   1657.1270   1493.6900     34.9400      3.9400
+   1657.2521   1493.7000     34.9400      3.9400
+   1657.3771   1493.7000     34.9400      3.9400
+   1657.5021   1493.7000     34.9400      3.9400
+   1657.6272   1493.7000     34.9400      3.9400
+   1657.7522   1493.7000     34.9400      3.9400
+   1657.8772   1476.4300     34.9400      0.0000
+   1659.6277   1447.9300      0.0000      3.9400
+   1659.7526   1447.9300      0.0000      3.9400
+   1659.8777   1447.9400      0.0000      3.9400
+   1660.0027   1493.7400     34.9400      3.9400
+   1660.1276   1493.7400     34.9400      3.9400
+   1660.2527   1493.7400     34.9400      3.9400
+   1660.3777   1493.7500     34.9400      3.9400
+   1660.5027   1493.7500     34.9400      3.9400
+   1660.6277   1493.7500     34.9400      3.9400
+   1660.7527   1493.7500     34.9400      3.9400
+   1660.8778   1493.7500     34.9400      3.9400
+   1661.0027   1493.7600     34.9400      3.9400
+   1661.1277   1493.7600     34.9400      3.9400
+   1661.2528   1493.7600     34.9400      3.9400
+   1661.3778   1493.7600     34.9400      3.9400
+   1661.5027   1493.7600     34.9400      3.9400
+   1661.6278   1493.7600     34.9400      3.9400
+   1661.7528   1493.7600     34.9400      3.9400
+   1661.8777   1493.7600     34.9400      3.9400
+   1662.0028   1493.7500     34.9400      3.9400
+   1662.1278   1493.7500     34.9400      3.9400
+   1662.2528   1493.7500     34.9400      3.9300
+   1662.3777   1493.7600     34.9400      3.9300
+   1662.5028   1493.7600     34.9400      3.9300
+   1662.6278   1493.7600     34.9400      3.9300
+   1662.7528   1493.7600     34.9500      3.9300
+   1662.8777   1493.7700     34.9500      3.9300
+   1663.0028   1493.7700     34.9400      3.9300
+   1663.1278   1493.7700     34.9400      3.9300
+   1663.2527   1493.7700     34.9400      3.9300
+   1663.3777   1493.7700     34.9400      3.9300
+   1663.5027   1493.7700     34.9400      3.9300
+   1663.6277   1493.7700     34.9400      3.9300
+   1663.7527   1476.5300     34.9500      0.0000
+   1664.8776   1447.9700      0.0000      3.9300
+   1665.0024   1447.9700      0.0000      3.9300
+   1665.1274   1447.9800      0.0000      3.9300
+   1665.2524   1493.8000     34.9500      3.9300
+   1665.3774   1493.8000     34.9500      3.9300
+   1665.5023   1493.8000     34.9500      3.9300
+   1665.6273   1493.8000     34.9500      3.9300
+   1665.7523   1493.8000     34.9500      3.9300
+   1665.8773   1493.8100     34.9500      3.9300
+   1666.0023   1493.8100     34.9500      3.9300
+   1666.1272   1493.8100     34.9500      3.9300
+   1666.2522   1493.8100     34.9500      3.9300
+   1666.3772   1493.8100     34.9500      3.9300
+   1666.5022   1493.8200     34.9500      3.9300
+   1666.6271   1493.8200     34.9500      3.9300
+   1666.7521   1493.8200     34.9500      3.9300
+   1666.8770   1493.8200     34.9500      3.9300
+   1667.0020   1493.8200     34.9500      3.9300
+   1667.1270   1493.8300     34.9400      3.9300
+   1667.2518   1493.8300     34.9400      3.9300
+   1667.3768   1493.8300     34.9400      3.9300
+   1667.5018   1493.8300     34.9400      3.9300
+   1667.6268   1493.8300     34.9400      3.9300
+   1667.7517   1493.8300     34.9400      3.9300
+   1667.8767   1493.8400     34.9400      3.9300
+   1668.0017   1493.8400     34.9400      3.9300
+   1668.1266   1493.8400     34.9400      3.9300
+   1668.2516   1476.6100     34.9400      0.0000
+   1670.5005   1448.0600      0.0000      3.9300
+   1670.6255   1448.0600      0.0000      3.9300
+   1670.7504   1448.0700      0.0000      3.9300
+   1670.8752   1493.8900     34.9400      3.9300
+   1671.0002   1493.8900     34.9400      3.9300
+   1671.1252   1493.8900     34.9400      3.9300
+   1671.2500   1493.8900     34.9400      3.9300
+   1671.3750   1493.9000     34.9400      3.9300
+   1671.5000   1493.9000     34.9400      3.9300
+   1671.6249   1493.9000     34.9400      3.9300
+   1671.7498   1493.9000     34.9400      3.9300
+   1671.8748   1493.9000     34.9400      3.9300
+   1671.9996   1493.9100     34.9400      3.9300
+   1672.1246   1493.9100     34.9400      3.9300
+   1672.2495   1493.9100     34.9400      3.9300
+   1672.3744   1493.9100     34.9400      3.9300
+   1672.4994   1493.9100     34.9400      3.9300
+   1672.6241   1493.9200     34.9400      3.9300
+   1672.7491   1493.9200     34.9400      3.9300
+   1672.8740   1493.9200     34.9400      3.9300
+   1672.9990   1493.9200     34.9400      3.9300
+   1673.1239   1493.9200     34.9400      3.9300
+   1673.2488   1493.9300     34.9400      3.9300
+   1673.3738   1476.6900     34.9400      0.0000
+   1676.1216   1448.1500      0.0000      3.9300
+   1676.2463   1448.1500      0.0000      3.9300
+   1676.3712   1448.1500      0.0000      3.9300
+   1676.4962   1493.9800     34.9400      3.9300
+   1676.6210   1493.9800     34.9400      3.9300
+   1676.7458   1493.9800     34.9400      3.9300
+   1676.8708   1493.9800     34.9400      3.9300
+   1676.9957   1493.9900     34.9400      3.9300
+   1677.1205   1493.9900     34.9400      3.9300
+   1677.2455   1493.9900     34.9400      3.9300
+   1677.3704   1493.9900     34.9400      3.9300
+   1677.4951   1493.9900     34.9400      3.9300
+   1677.6201   1494.0000     34.9400      3.9300
+   1677.7450   1494.0000     34.9400      3.9300
+   1677.8699   1493.9900     34.9400      3.9300
+   1677.9946   1494.0000     34.9400      3.9300
+   1678.1196   1494.0000     34.9400      3.9300
+   1678.2445   1494.0000     34.9400      3.9300
+   1678.3694   1494.0000     34.9400      3.9300
+   1678.4941   1494.0000     34.9400      3.9300
+   1678.6190   1494.0000     34.9400      3.9300
+   1678.7440   1494.0000     34.9400      3.9300
+   1678.8688   1494.0000     34.9400      3.9300
+   1678.9937   1494.0100     34.9400      3.9300
+   1679.1185   1494.0100     34.9400      3.9300
+   1679.2434   1494.0100     34.9400      3.9300
+   1679.3683   1494.0200     34.9400      3.9300
+   1679.4932   1476.8000     34.9400      0.0000
+   1680.6168   1448.2200      0.0000      3.9300
+   1680.7418   1448.2200      0.0000      3.9300
+   1680.8666   1448.2300      0.0000      3.9300
+   1680.9913   1494.0500     34.9400      3.9300
+   1681.1163   1476.8200     34.9400      0.0000
@@ -0,0 +1,7717 @@
+test_read_store_and_write
+1/1/2015
+2:13:33
+Probe: XCTD-1
+Source: /root/package/data/input/sippican/C3_00011.EDF
+      0.9629   1543.8000     35.5500     28.8700
+      1.1004   1544.0500     35.7500     28.8900
+      1.2380   1544.1900     35.8600     28.9000
+      1.3755   1544.2900     35.9400     28.9100
+      1.5131   1544.3500     35.9800     28.9100
+      1.6506   1544.2200     35.8500     28.9100
+      1.7882   1544.3100     35.9300     28.9100
+      1.9257   1544.3600     35.9800     28.9100
+      2.0633   1544.3800     36.0100     28.9100
+      2.2008   1544.3900     36.0300     28.9000
+      2.3384   1544.4000     36.0300     28.9000
+      2.4759   1544.4000     36.0400     28.9000
+      2.6134   1544.3900     36.0400     28.8900
+      2.7510   1544.3800     36.0400     28.8900
+      2.8885   1544.3800     36.0400     28.8900
+      3.0261   1544.3800     36.0400     28.8900
+      3.1636   1544.3800     36.0300     28.8900
+      3.3011   1544.3900     36.0300     28.8900
+      3.4387   1544.4000     36.0400     28.8900
+      3.5762   1544.4200     36.0400     28.9000
+      3.7137   1544.4400     36.0500     28.9000
+      3.8513   1544.4500     36.0600     28.9000
+      3.9888   1544.4700     36.0600     28.9100
+      4.1263   1544.4900     36.0700     28.9100
+      4.2639   1544.5000     36.0700     28.9200
+      4.4014   1544.5100     36.0700     28.9200
+      4.5389   1544.5200     36.0800     28.9200
+      4.6764   1544.5300     36.0800     28.9200
+      4.8140   1544.5400     36.0800     28.9200
+      4.9515   1544.5400     36.0800     28.9200
+      5.0890   1544.5500     36.0800     28.9300
+      5.2265   1544.5600     36.0900     28.9300
+      5.3641   1544.5700     36.0900     28.9300
+      5.5016   1544.5700     36.0900     28.9300
+      5.6391   1544.5800     36.0900     28.9300
+      5.7766   1544.5800     36.0900     28.9300
+      5.9141   1544.5900     36.0900     28.9300
+      6.0516   1544.5900     36.0900     28.9300
+      6.1892   1544.5900     36.0900     28.9300
+      6.3267   1544.5900     36.0900     28.9300
+      6.4642   1544.6000     36.0900     28.9300
+      6.6017   1544.6000     36.0900     28.9300
+      6.7392   1544.6000     36.0900     28.9300
+      6.8767   1544.6000     36.1000     28.9300
+      7.0142   1544.6000     36.0900     28.9300
+      7.1517   1544.6000     36.1000     28.9300
+      7.2892   1544.6000     36.1000     28.9200
+      7.4268   1544.5900     36.1000     28.9200
+      7.5643   1544.5900     36.1000     28.9200
+      7.7018   1544.5900     36.1000     28.9100
+      7.8393   1544.5800     36.1000     28.9100
+      7.9768   1544.5700     36.1000     28.9000
+      8.1143   1544.5600     36.1000     28.9000
+      8.2518   1544.5500     36.1000     28.8900
+      8.3893   1544.5400     36.1000     28.8900
+      8.5268   1544.5200     36.1000     28.8800
+      8.6643   1544.5000     36.1000     28.8700
+      8.8018   1544.4900     36.1000     28.8600
+      8.9393   1544.4700     36.1000     28.8500
+      9.0767   1544.4500     36.1000     28.8400
+      9.2142   1544.4300     36.1000     28.8300
+      9.3517   1544.4100     36.1000     28.8200
+      9.4892   1544.3900     36.1000     28.8100
+      9.6267   1544.3700     36.1000     28.8000
+      9.7642   1544.3400     36.1000     28.7900
+      9.9017   1544.3300     36.1000     28.7800
+     10.0392   1544.3100     36.0900     28.7700
+     10.1767   1544.2900     36.0900     28.7600
+     10.3141   1544.2700     36.0900     28.7500
+     10.4516   1544.2600     36.0800     28.7500
+     10.5891   1544.2500     36.0800     28.7400
+     10.7266   1544.2400     36.0800     28.7300
+     10.8641   1544.2300     36.0800     28.7300
+     11.0016   1544.2300     36.0800     28.7300
+     11.1390   1544.2300     36.0800     28.7300
+     11.2765   1544.2300     36.0800     28.7300
+     11.4140   1544.2300     36.0900     28.7300
+     11.5515   1544.2400     36.0900     28.7300
+     11.6889   1544.2400     36.0900     28.7300
+     11.8264   1544.2500     36.0900     28.7300
+     11.9639   1544.2600     36.0900     28.7300
+     12.1014   1544.2700     36.1000     28.7300
+     12.2388   1544.2700     36.1000     28.7300
+     12.3763   1544.2800     36.1000     28.7300
+     12.5138   1544.2900     36.1000     28.7400
+     12.6512   1544.3000     36.1000     28.7400
+     12.7887   1544.3100     36.1100     28.7400
+     12.9262   1544.3200     36.1100     28.7400
+     13.0636   1544.3300     36.1100     28.7400
+     13.2011   1544.3400     36.1200     28.7500
+     13.3386   1544.3400     36.1200     28.7500
+     13.4760   1544.3500     36.1200     28.7500
+     13.6135   1544.3600     36.1300     28.7500
+     13.7510   1544.3600     36.1300     28.7500
+     13.8884   1544.3700     36.1300     28.7500
+     14.0259   1544.3700     36.1300     28.7500
+     14.1633   1544.3700     36.1300     28.7500
+     14.3008   1544.3800     36.1300     28.7500
+     14.4382   1544.3800     36.1300     28.7500
+     14.5757   1544.3800     36.1300     28.7500
+     14.7132   1544.3900     36.1300     28.7500
+     14.8506   1544.3900     36.1400     28.7500
+     14.9881   1544.3900     36.1400     28.7500
+     15.1255   1544.4000     36.1400     28.7500
+     15.2630   1544.4000     36.1400     28.7500
+     15.4004   1544.4000     36.1400     28.7500
+     15.5379   1544.4100     36.1400     28.7500
+     15.6753   1544.4100     36.1400     28.7500
+     15.8127   1544.4200     36.1400     28.7500
+     15.9502   1544.4100     36.1400     28.7500
+     16.0876   1544.4200     36.1400     28.7500
+     16.2251   1544.4200     36.1500     28.7500
+     16.3625   1544.4200     36.1500     28.7400
+     16.5000   1544.4200     36.1500     28.7400
+     16.6374   1544.4200     36.1500     28.7400
+     16.7748   1544.4200     36.1500     28.7400
+     16.9123   1544.4300     36.1600     28.7400
+     17.0497   1544.4300     36.1600     28.7400
+     17.1871   1544.4300     36.1600     28.7400
+     17.3246   1544.4400     36.1600     28.7400
+     17.4620   1544.4400     36.1600     28.7400
+     17.5995   1544.4400     36.1700     28.7300
+     17.7369   1544.4400     36.1600     28.7300
+     17.8743   1544.4400     36.1700     28.7300
+     18.0117   1544.4400     36.1700     28.7300
+     18.1492   1544.4400     36.1700     28.7300
+     18.2866   1544.4300     36.1700     28.7300
+     18.4240   1544.4300     36.1700     28.7200
+     18.5615   1544.4300     36.1700     28.7200
+     18.6989   1544.4300     36.1700     28.7200
+     18.8363   1544.4300     36.1700     28.7200
+     18.9737   1544.4200     36.1700     28.7200
+     19.1111   1544.4200     36.1700     28.7100
+     19.2486   1544.4200     36.1700     28.7100
+     19.3860   1544.4200     36.1700     28.7100
+     19.5234   1544.4200     36.1700     28.7100
+     19.6608   1544.4200     36.1700     28.7100
+     19.7982   1544.4200     36.1700     28.7100
+     19.9357   1544.4300     36.1700     28.7100
+     20.0731   1544.4300     36.1700     28.7100
+     20.2105   1544.4300     36.1700     28.7100
+     20.3479   1544.4300     36.1700     28.7100
+     20.4853   1544.4300     36.1700     28.7100
+     20.6227   1544.4400     36.1700     28.7100
+     20.7601   1544.4400     36.1700     28.7100
+     20.8975   1544.4300     36.1700     28.7000
+     21.0349   1544.4400     36.1700     28.7000
+     21.1724   1544.4400     36.1700     28.7000
+     21.3098   1544.4400     36.1700     28.7000
+     21.4472   1544.4400     36.1700     28.7000
+     21.5846   1544.4400     36.1700     28.7000
+     21.7220   1544.4400     36.1700     28.7000
+     21.8594   1544.4400     36.1700     28.7000
+     21.9968   1544.4400     36.1700     28.7000
+     22.1342   1544.4400     36.1700     28.7000
+     22.2716   1544.4400     36.1700     28.6900
+     22.4090   1544.4400     36.1700     28.6900
+     22.5464   1544.4400     36.1700     28.6900
+     22.6838   1544.4400     36.1700     28.6900
+     22.8212   1544.4400     36.1700     28.6900
+     22.9586   1544.4400     36.1700     28.6900
+     23.0959   1544.4400     36.1700     28.6900
+     23.2333   1544.4400     36.1800     28.6900
+     23.3707   1544.4400     36.1800     28.6900
+     23.5081   1544.4500     36.1800     28.6900
+     23.6455   1544.4500     36.1800     28.6900
+     23.7829   1544.4500     36.1800     28.6900
+     23.9203   1544.4500     36.1800     28.6900
+     24.0577   1544.4500     36.1800     28.6800
+     24.1951   1544.4500     36.1800     28.6800
+     24.3324   1544.4500     36.1800     28.6800
+     24.4698   1544.4500     36.1800     28.6800
+     24.6072   1544.4500     36.1800     28.6800
+     24.7446   1544.4500     36.1800     28.6800
+     24.8820   1544.4500     36.1800     28.6800
+     25.0193   1544.4500     36.1800     28.6800
+     25.1567   1544.4500     36.1800     28.6700
+     25.2941   1544.4500     36.1800     28.6700
+     25.4315   1544.4500     36.1800     28.6700
+     25.5689   1544.4500     36.1800     28.6700
+     25.7062   1544.4500     36.1800     28.6700
+     25.8436   1544.4500     36.1800     28.6700
+     25.9810   1544.4500     36.1800     28.6700
+     26.1183   1544.4500     36.1800     28.6700
+     26.2557   1544.4500     36.1800     28.6600
+     26.3931   1544.4500     36.1800     28.6600
+     26.5304   1544.4500     36.1800     28.6600
+     26.6678   1544.4500     36.1800     28.6600
+     26.8052   1544.4600     36.1800     28.6600
+     26.9425   1544.4600     36.1800     28.6600
+     27.0799   1544.4600     36.1800     28.6600
+     27.2173   1544.4600     36.1800     28.6600
+     27.3546   1544.4600     36.1800     28.6600
+     27.4920   1544.4700     36.1800     28.6600
+     27.6294   1544.4700     36.1800     28.6600
+     27.7667   1544.4800     36.1900     28.6600
+     27.9041   1544.4800     36.1900     28.6600
+     28.0414   1544.4900     36.1900     28.6700
+     28.1788   1544.5000     36.1900     28.6700
+     28.3161   1544.5000     36.1900     28.6700
+     28.4535   1544.5100     36.1900     28.6700
+     28.5909   1544.5200     36.1900     28.6700
+     28.7282   1544.5300     36.2000     28.6700
+     28.8656   1544.5300     36.2000     28.6700
+     29.0029   1544.5400     36.2000     28.6800
+     29.1403   1544.5500     36.2000     28.6800
+     29.2776   1544.5500     36.2000     28.6800
+     29.4150   1544.5500     36.2000     28.6800
+     29.5523   1544.5600     36.2100     28.6800
+     29.6896   1544.5600     36.2100     28.6800
+     29.8270   1544.5600     36.2100     28.6700
+     29.9643   1544.5600     36.2100     28.6700
+     30.1017   1544.5500     36.2100     28.6700
+     30.2390   1544.5500     36.2100     28.6600
+     30.3764   1544.5300     36.2200     28.6500
+     30.5137   1544.5200     36.2100     28.6500
+     30.6510   1544.5100     36.2100     28.6400
+     30.7884   1544.5000     36.2100     28.6400
+     30.9257   1544.4800     36.2100     28.6300
+     31.0630   1544.4700     36.2100     28.6200
+     31.2004   1544.4600     36.2100     28.6200
+     31.3377   1544.4500     36.2100     28.6100
+     31.4750   1544.4300     36.2100     28.6000
+     31.6124   1544.4200     36.2100     28.5900
+     31.7497   1544.3900     36.2100     28.5800
+     31.8870   1544.3600     36.2100     28.5700
+     32.0244   1544.3200     36.2100     28.5400
+     32.1617   1544.2600     36.2200     28.5100
+     32.2990   1544.2000     36.2300     28.4800
+     32.4363   1544.1200     36.2400     28.4400
+     32.5737   1544.0400     36.2400     28.3900
+     32.7110   1543.9500     36.2500     28.3500
+     32.8483   1543.8600     36.2600     28.3000
+     32.9856   1543.7900     36.2700     28.2600
+     33.1230   1543.7100     36.2700     28.2300
+     33.2603   1543.6500     36.2800     28.2000
+     33.3976   1543.6100     36.2800     28.1700
+     33.5349   1543.5700     36.2800     28.1500
+     33.6722   1543.5500     36.2900     28.1400
+     33.8095   1543.5200     36.2900     28.1300
+     33.9469   1543.5100     36.2900     28.1200
+     34.0842   1543.4900     36.2900     28.1100
+     34.2215   1543.4800     36.2900     28.1000
+     34.3588   1543.4600     36.3000     28.0900
+     34.4961   1543.4400     36.3000     28.0800
+     34.6334   1543.4200     36.3000     28.0700
+     34.7707   1543.4000     36.3000     28.0600
+     34.9080   1543.3600     36.3000     28.0400
+     35.0453   1543.3200     36.3000     28.0200
+     35.1826   1543.2700     36.3000     27.9900
+     35.3200   1543.2100     36.3000     27.9600
+     35.4573   1543.1400     36.3000     27.9300
+     35.5946   1543.0700     36.3000     27.9000
+     35.7319   1542.9900     36.3000     27.8600
+     35.8692   1542.9100     36.3000     27.8300
+     36.0065   1542.8300     36.3100     27.7900
+     36.1438   1542.7500     36.3100     27.7500
+     36.2811   1542.6700     36.3100     27.7100
+     36.4184   1542.6100     36.3100     27.6800
+     36.5557   1542.5400     36.3100     27.6500
+     36.6929   1542.4800     36.3100     27.6200
+     36.8302   1542.4200     36.3100     27.5900
+     36.9675   1542.3600     36.3100     27.5600
+     37.1048   1542.2900     36.3200     27.5300
+     37.2421   1542.2100     36.3200     27.4900
+     37.3794   1542.1200     36.3300     27.4500
+     37.5167   1542.0300     36.3300     27.4000
+     37.6540   1541.9400     36.3400     27.3600
+     37.7913   1541.8400     36.3400     27.3100
+     37.9286   1541.7200     36.3400     27.2600
+     38.0658   1541.6000     36.3500     27.2000
+     38.2031   1541.4800     36.3700     27.1400
+     38.3404   1541.3600     36.3700     27.0800
+     38.4777   1541.2400     36.3700     27.0200
+     38.6150   1541.1200     36.3800     26.9700
+     38.7523   1541.0200     36.3800     26.9200
+     38.8895   1540.9100     36.3800     26.8700
+     39.0268   1540.8200     36.3900     26.8300
+     39.1641   1540.7400     36.3900     26.7900
+     39.3014   1540.6700     36.3900     26.7600
+     39.4386   1540.6100     36.3900     26.7300
+     39.5759   1540.5600     36.3900     26.7100
+     39.7132   1540.5200     36.3900     26.6900
+     39.8505   1540.4800     36.4000     26.6700
+     39.9877   1540.4400     36.4000     26.6500
+     40.1250   1540.4000     36.4000     26.6300
+     40.2623   1540.3500     36.4000     26.6100
+     40.3995   1540.3100     36.4100     26.5900
+     40.5368   1540.2500     36.4100     26.5600
+     40.6741   1540.1900     36.4100     26.5300
+     40.8113   1540.1200     36.4200     26.5000
+     40.9486   1540.0200     36.4200     26.4500
+     41.0859   1539.9200     36.4300     26.4000
+     41.2231   1539.8000     36.4300     26.3500
+     41.3604   1539.6700     36.4300     26.2900
+     41.4976   1539.5400     36.4300     26.2400
+     41.6349   1539.4000     36.4200     26.1800
+     41.7722   1539.2700     36.4200     26.1200
+     41.9094   1539.1400     36.4200     26.0600
+     42.0467   1539.0200     36.4200     26.0100
+     42.1839   1538.9100     36.4200     25.9600
+     42.3212   1538.8200     36.4200     25.9200
+     42.4584   1538.7500     36.4300     25.8900
+     42.5957   1538.6900     36.4300     25.8600
+     42.7329   1538.6400     36.4400     25.8300
+     42.8702   1538.5900     36.4500     25.8100
+     43.0074   1538.5300     36.4600     25.7800
+     43.1447   1538.4700     36.4700     25.7500
+     43.2819   1538.4100     36.4800     25.7100
+     43.4192   1538.3400     36.4800     25.6800
+     43.5564   1538.2700     36.4900     25.6500
+     43.6937   1538.2000     36.5000     25.6100
+     43.8309   1538.1300     36.5000     25.5800
+     43.9682   1538.0700     36.5100     25.5500
+     44.1054   1538.0100     36.5100     25.5200
+     44.2426   1537.9600     36.5200     25.5000
+     44.3799   1537.9200     36.5200     25.4800
+     44.5171   1537.8900     36.5200     25.4700
+     44.6544   1537.8700     36.5200     25.4600
+     44.7916   1537.8600     36.5200     25.4500
+     44.9288   1537.8400     36.5300     25.4400
+     45.0661   1537.8300     36.5300     25.4300
+     45.2033   1537.8100     36.5300     25.4200
+     45.3405   1537.8000     36.5300     25.4200
+     45.4778   1537.7900     36.5300     25.4100
+     45.6150   1537.7800     36.5300     25.4000
+     45.7522   1537.7700     36.5300     25.4000
+     45.8894   1537.7600     36.5300     25.4000
+     46.0267   1537.7500     36.5400     25.3900
+     46.1639   1537.7500     36.5300     25.3900
+     46.3011   1537.7400     36.5300     25.3800
+     46.4383   1537.7200     36.5300     25.3800
+     46.5756   1537.7000     36.5300     25.3600
+     46.7128   1537.6600     36.5400     25.3500
+     46.8500   1537.6200     36.5400     25.3300
+     46.9872   1537.5800     36.5400     25.3100
+     47.1245   1537.5300     36.5400     25.2900
+     47.2617   1537.4800     36.5400     25.2600
+     47.3989   1537.4200     36.5400     25.2400
+     47.5361   1537.3700     36.5400     25.2200
+     47.6733   1537.3200     36.5400     25.2000
+     47.8105   1537.2800     36.5400     25.1800
+     47.9477   1537.2500     36.5400     25.1600
+     48.0850   1537.2200     36.5300     25.1500
+     48.2222   1537.1900     36.5400     25.1400
+     48.3594   1537.1800     36.5400     25.1300
+     48.4966   1537.1600     36.5400     25.1200
+     48.6338   1537.1400     36.5400     25.1200
+     48.7710   1537.1300     36.5400     25.1100
+     48.9082   1537.1100     36.5400     25.1000
+     49.0454   1537.1100     36.5400     25.1000
+     49.1826   1537.1000     36.5400     25.0900
+     49.3198   1537.0900     36.5400     25.0900
+     49.4570   1537.0800     36.5400     25.0800
+     49.5942   1537.0700     36.5400     25.0800
+     49.7314   1537.0600     36.5400     25.0700
+     49.8686   1537.0600     36.5400     25.0700
+     50.0058   1537.0500     36.5500     25.0600
+     50.1430   1537.0400     36.5500     25.0600
+     50.2802   1537.0300     36.5500     25.0500
+     50.4174   1537.0100     36.5500     25.0400
+     50.5546   1537.0000     36.5500     25.0300
+     50.6918   1536.9800     36.5600     25.0300
+     50.8290   1536.9700     36.5600     25.0200
+     50.9662   1536.9500     36.5600     25.0100
+     51.1034   1536.9300     36.5600     25.0000
+     51.2406   1536.9100     36.5600     24.9900
+     51.3778   1536.8900     36.5600     24.9800
+     51.5149   1536.8800     36.5600     24.9700
+     51.6521   1536.8600     36.5600     24.9600
+     51.7893   1536.8400     36.5600     24.9600
+     51.9265   1536.8300     36.5600     24.9500
+     52.0637   1536.8100     36.5700     24.9400
+     52.2009   1536.7900     36.5700     24.9300
+     52.3381   1536.7700     36.5700     24.9200
+     52.4752   1536.7500     36.5700     24.9100
+     52.6124   1536.7200     36.5700     24.9000
+     52.7496   1536.7000     36.5800     24.8800
+     52.8868   1536.6700     36.5800     24.8700
+     53.0239   1536.6400     36.5800     24.8600
+     53.1611   1536.6000     36.5800     24.8400
+     53.2983   1536.5600     36.5800     24.8200
+     53.4355   1536.5100     36.5800     24.8000
+     53.5726   1536.4600     36.5800     24.7800
+     53.7098   1536.4000     36.5800     24.7500
+     53.8470   1536.3500     36.5800     24.7300
+     53.9842   1536.2800     36.5700     24.7000
+     54.1213   1536.2100     36.5700     24.6700
+     54.2585   1536.1400     36.5700     24.6400
+     54.3957   1536.0600     36.5700     24.6100
+     54.5328   1535.9900     36.5600     24.5900
+     54.6700   1535.9300     36.5600     24.5600
+     54.8072   1535.8800     36.5600     24.5400
+     54.9443   1535.8300     36.5500     24.5200
+     55.0815   1535.7900     36.5500     24.5000
+     55.2186   1535.7600     36.5500     24.4900
+     55.3558   1535.7400     36.5500     24.4800
+     55.4930   1535.7300     36.5500     24.4800
+     55.6301   1535.7300     36.5500     24.4700
+     55.7673   1535.7200     36.5500     24.4700
+     55.9044   1535.7200     36.5500     24.4700
+     56.0416   1535.7200     36.5500     24.4700
+     56.1787   1535.7200     36.5500     24.4700
+     56.3159   1535.7200     36.5500     24.4700
+     56.4530   1535.7200     36.5500     24.4600
+     56.5902   1535.7200     36.5600     24.4600
+     56.7273   1535.7200     36.5600     24.4600
+     56.8645   1535.7200     36.5600     24.4600
+     57.0016   1535.7300     36.5600     24.4600
+     57.1388   1535.7300     36.5600     24.4600
+     57.2759   1535.7300     36.5600     24.4600
+     57.4131   1535.7400     36.5600     24.4600
+     57.5502   1535.7400     36.5600     24.4600
+     57.6874   1535.7400     36.5600     24.4600
+     57.8245   1535.7400     36.5600     24.4600
+     57.9617   1535.7300     36.5600     24.4500
+     58.0988   1535.7200     36.5700     24.4500
+     58.2359   1535.7100     36.5700     24.4400
+     58.3731   1535.6800     36.5700     24.4300
+     58.5102   1535.6400     36.5700     24.4100
+     58.6473   1535.6000     36.5700     24.3900
+     58.7845   1535.5500     36.5800     24.3700
+     58.9216   1535.4900     36.5800     24.3400
+     59.0587   1535.4300     36.5700     24.3200
+     59.1959   1535.3700     36.5700     24.3000
+     59.3330   1535.3200     36.5700     24.2700
+     59.4701   1535.2600     36.5700     24.2500
+     59.6073   1535.2200     36.5700     24.2300
+     59.7444   1535.1800     36.5700     24.2200
+     59.8815   1535.1500     36.5600     24.2000
+     60.0187   1535.1300     36.5600     24.1900
+     60.1558   1535.1100     36.5600     24.1900
+     60.2929   1535.1000     36.5600     24.1800
+     60.4300   1535.0800     36.5600     24.1700
+     60.5671   1535.0700     36.5700     24.1600
+     60.7043   1535.0600     36.5700     24.1600
+     60.8414   1535.0500     36.5700     24.1500
+     60.9785   1535.0400     36.5700     24.1500
+     61.1156   1535.0400     36.5700     24.1500
+     61.2527   1535.0300     36.5700     24.1400
+     61.3899   1535.0200     36.5700     24.1400
+     61.5270   1535.0100     36.5700     24.1300
+     61.6641   1535.0000     36.5700     24.1300
+     61.8012   1534.9900     36.5700     24.1200
+     61.9383   1534.9700     36.5700     24.1100
+     62.0754   1534.9400     36.5700     24.1000
+     62.2125   1534.9100     36.5800     24.0800
+     62.3496   1534.8700     36.5800     24.0700
+     62.4868   1534.8400     36.5800     24.0500
+     62.6239   1534.8000     36.5800     24.0300
+     62.7610   1534.7500     36.5900     24.0100
+     62.8981   1534.7100     36.5900     23.9900
+     63.0352   1534.6700     36.5900     23.9800
+     63.1723   1534.6400     36.5900     23.9600
+     63.3094   1534.6000     36.5900     23.9500
+     63.4465   1534.5600     36.5900     23.9300
+     63.5836   1534.5300     36.5900     23.9100
+     63.7207   1534.5000     36.5900     23.9000
+     63.8578   1534.4700     36.5900     23.8900
+     63.9949   1452.3100     36.5900      0.0000
+     65.2287   1494.4900      0.0000     23.7900
+     65.3658   1494.4600      0.0000     23.7800
+     65.5029   1494.4400      0.0100     23.7700
+     65.6400   1534.1600     36.6000     23.7500
+     65.7771   1534.1200     36.6000     23.7300
+     65.9141   1534.0900     36.6000     23.7200
+     66.0512   1534.0600     36.6000     23.7000
+     66.1883   1534.0300     36.5900     23.6900
+     66.3254   1534.0000     36.5900     23.6800
+     66.4625   1533.9700     36.5900     23.6700
+     66.5995   1533.9500     36.5900     23.6600
+     66.7366   1533.9300     36.5900     23.6500
+     66.8737   1533.9100     36.5900     23.6400
+     67.0108   1533.8900     36.5900     23.6300
+     67.1478   1533.8600     36.5900     23.6200
+     67.2849   1533.8300     36.5900     23.6100
+     67.4220   1533.8000     36.5900     23.5900
+     67.5591   1533.7700     36.5900     23.5800
+     67.6961   1533.7400     36.5900     23.5700
+     67.8332   1533.7100     36.5900     23.5500
+     67.9703   1533.6700     36.5900     23.5400
+     68.1073   1533.6400     36.5900     23.5200
+     68.2444   1533.6000     36.5900     23.5100
+     68.3815   1533.5700     36.5900     23.5000
+     68.5185   1533.5300     36.5900     23.4800
+     68.6556   1533.5000     36.5900     23.4700
+     68.7927   1533.4700     36.5900     23.4500
+     68.9297   1533.4300     36.5800     23.4400
+     69.0668   1533.4000     36.5800     23.4300
+     69.2038   1533.3600     36.5800     23.4100
+     69.3409   1533.3200     36.5800     23.3900
+     69.4780   1533.2800     36.5800     23.3800
+     69.6150   1533.2400     36.5800     23.3600
+     69.7521   1533.2000     36.5800     23.3400
+     69.8891   1533.1500     36.5800     23.3300
+     70.0262   1533.1200     36.5800     23.3100
+     70.1632   1533.0800     36.5800     23.3000
+     70.3003   1533.0500     36.5800     23.2800
+     70.4373   1533.0200     36.5800     23.2700
+     70.5744   1532.9900     36.5700     23.2600
+     70.7114   1532.9700     36.5700     23.2500
+     70.8485   1532.9500     36.5700     23.2400
+     70.9855   1532.9400     36.5800     23.2300
+     71.1226   1532.9200     36.5800     23.2300
+     71.2596   1532.9000     36.5800     23.2200
+     71.3967   1532.8900     36.5800     23.2100
+     71.5337   1532.8700     36.5700     23.2000
+     71.6707   1532.8500     36.5700     23.2000
+     71.8078   1532.8300     36.5700     23.1900
+     71.9448   1532.8100     36.5700     23.1800
+     72.0819   1532.7900     36.5700     23.1700
+     72.2189   1532.7600     36.5700     23.1600
+     72.3559   1532.7400     36.5700     23.1500
+     72.4930   1452.4300     36.5800      0.0000
+     76.3296   1492.1600      0.0000     22.8900
+     76.4666   1492.1400      0.0000     22.8900
+     76.6036   1492.1400      0.0100     22.8800
+     76.7406   1532.1300     36.5800     22.8800
+     76.8776   1532.1100     36.5700     22.8700
+     77.0146   1532.4500     36.5700     23.0000
+     77.1516   1532.3700     36.5100     22.9900
+     77.2886   1532.4600     36.4600     23.0500
+     77.4256   1532.4100     36.4300     23.0400
+     77.5626   1452.2800     36.4000      0.0000
+     78.7956   1491.7300      0.0000     22.7300
+     78.9325   1491.7100      0.0000     22.7200
+     79.0695   1491.7000      0.0100     22.7100
+     79.2065   1531.7400     36.5800     22.7100
+     79.3435   1531.7300     36.5800     22.7000
+     79.4805   1531.7200     36.5800     22.6900
+     79.6175   1531.7000     36.5800     22.6900
+     79.7545   1531.6900     36.5800     22.6800
+     79.8914   1531.6800     36.5800     22.6800
+     80.0284   1531.6800     36.5800     22.6800
+     80.1654   1531.6700     36.5800     22.6700
+     80.3024   1531.6800     36.5800     22.6700
+     80.4394   1531.6800     36.5900     22.6700
+     80.5763   1531.6700     36.5900     22.6700
+     80.7133   1531.6700     36.5900     22.6600
+     80.8503   1531.6700     36.5900     22.6600
+     80.9873   1531.6700     36.6000     22.6600
+     81.1242   1531.6600     36.6000     22.6500
+     81.2612   1452.6100     36.6000      0.0000
+     85.0960   1491.0600      0.0000     22.4600
+     85.2330   1491.0600      0.0000     22.4600
+     85.3699   1491.0700      0.0100     22.4600
+     85.5069   1531.2100     36.5800     22.4600
+     85.6438   1531.2100     36.5800     22.4600
+     85.7807   1531.2100     36.5800     22.4600
+     85.9177   1531.2100     36.5900     22.4500
+     86.0546   1531.2000     36.5900     22.4500
+     86.1916   1531.2000     36.5900     22.4500
+     86.3285   1531.1900     36.5900     22.4400
+     86.4654   1531.1800     36.5900     22.4400
+     86.6024   1531.1700     36.6000     22.4300
+     86.7393   1531.1600     36.6000     22.4300
+     86.8762   1531.1400     36.6000     22.4200
+     87.0132   1531.1300     36.6000     22.4100
+     87.1501   1531.1200     36.6000     22.4000
+     87.2870   1531.1000     36.6000     22.4000
+     87.4240   1531.0800     36.6000     22.3900
+     87.5609   1531.0600     36.6000     22.3800
+     87.6978   1531.0400     36.6000     22.3700
+     87.8347   1531.0200     36.6000     22.3600
+     87.9716   1531.0000     36.6000     22.3500
+     88.1086   1530.9800     36.6000     22.3400
+     88.2455   1530.9600     36.6000     22.3300
+     88.3824   1530.9400     36.6000     22.3300
+     88.5193   1530.9200     36.6000     22.3200
+     88.6563   1530.9000     36.6000     22.3100
+     88.7932   1530.8900     36.6000     22.3100
+     88.9301   1530.8800     36.6000     22.3000
+     89.0670   1530.8700     36.6000     22.3000
+     89.2039   1530.8600     36.6000     22.2900
+     89.3408   1530.8500     36.6000     22.2900
+     89.4777   1452.7400     36.6000      0.0000
+     91.3944   1490.3800      0.0000     22.1900
+     91.5313   1490.3700      0.0000     22.1800
+     91.6682   1490.3600      0.0100     22.1700
+     91.8051   1530.5700     36.5900     22.1700
+     91.9420   1530.5600     36.5900     22.1600
+     92.0789   1530.5500     36.5900     22.1600
+     92.2158   1530.5400     36.5900     22.1500
+     92.3527   1530.5300     36.5900     22.1500
+     92.4896   1530.5200     36.5900     22.1400
+     92.6265   1530.5100     36.5900     22.1400
+     92.7634   1530.4900     36.5900     22.1300
+     92.9002   1530.4800     36.5900     22.1300
+     93.0371   1530.4700     36.5900     22.1200
+     93.1740   1530.4500     36.5900     22.1100
+     93.3109   1530.4400     36.5900     22.1100
+     93.4478   1530.4200     36.5900     22.1000
+     93.5847   1530.4000     36.5900     22.0900
+     93.7216   1530.3900     36.5900     22.0800
+     93.8584   1530.3700     36.5900     22.0800
+     93.9953   1530.3600     36.5900     22.0700
+     94.1322   1530.3400     36.5900     22.0600
+     94.2691   1530.3300     36.5900     22.0600
+     94.4060   1530.3100     36.5900     22.0500
+     94.5428   1530.3000     36.5900     22.0500
+     94.6797   1530.2900     36.5900     22.0400
+     94.8166   1530.2800     36.5900     22.0400
+     94.9535   1530.2700     36.5900     22.0300
+     95.0903   1530.2600     36.5900     22.0300
+     95.2272   1530.2600     36.5800     22.0300
+     95.3641   1452.8200     36.5900      0.0000
+     97.4170   1489.9000      0.0000     21.9900
+     97.5539   1489.9000      0.0000     21.9900
+     97.6907   1403.9100      0.0100      0.0000
+     98.9223   1489.8000      0.0000     21.9400
+    101.3854   1489.2500      0.0000     21.7400
+    101.5222   1489.3100      0.0000     21.7600
+    101.6590   1489.3400      0.0100     21.7700
+    101.7958   1529.6500     36.5500     21.7700
+    101.9327   1529.9800     36.8800     21.7600
+    102.0695   1530.7000     37.5600     21.7400
+    102.2063   1455.1600     38.2500      0.0000
+    115.0630   1487.4600      0.0000     21.0600
+    115.1997   1487.4400      0.0000     21.0500
+    115.3365   1487.4300      0.0100     21.0400
+    115.4732   1528.3600     36.9200     21.0400
+    115.6099   1528.3500     36.9200     21.0400
+    115.7466   1527.9600     36.5700     21.0300
+    115.8834   1527.9600     36.5700     21.0300
+    116.0201   1527.9600     36.5700     21.0300
+    116.1568   1527.9600     36.5800     21.0300
+    116.2935   1527.9600     36.5800     21.0300
+    116.4302   1527.9600     36.5800     21.0300
+    116.5670   1527.9600     36.5800     21.0300
+    116.7037   1527.9600     36.5800     21.0300
+    116.8404   1527.9600     36.5800     21.0200
+    116.9771   1527.9500     36.5800     21.0200
+    117.1138   1527.9500     36.5800     21.0200
+    117.2505   1527.9400     36.5800     21.0200
+    117.3872   1527.9300     36.5800     21.0100
+    117.5239   1453.1700     36.5800      0.0000
+    119.0277   1487.1400      0.0000     20.9300
+    119.1644   1487.1300      0.0000     20.9300
+    119.3011   1487.1200      0.0100     20.9200
+    119.4378   1527.7100     36.5800     20.9100
+    119.5745   1527.6900     36.5800     20.9000
+    119.7112   1527.6700     36.5800     20.8900
+    119.8479   1527.6500     36.5800     20.8900
+    119.9846   1527.6200     36.5800     20.8800
+    120.1212   1527.6000     36.5800     20.8700
+    120.2579   1527.5800     36.5800     20.8600
+    120.3946   1527.5600     36.5800     20.8500
+    120.5313   1527.5400     36.5800     20.8400
+    120.6680   1527.5200     36.5800     20.8400
+    120.8047   1527.5100     36.5700     20.8300
+    120.9414   1527.4900     36.5700     20.8300
+    121.0780   1527.4700     36.5700     20.8200
+    121.2147   1527.4600     36.5700     20.8100
+    121.3514   1453.2200     36.5700      0.0000
+    123.5382   1486.4900      0.0000     20.6900
+    123.6749   1486.4800      0.0000     20.6900
+    123.8115   1486.4700      0.0100     20.6800
+    123.9482   1527.1300     36.5700     20.6700
+    124.0848   1527.1100     36.5700     20.6700
+    124.2215   1527.1000     36.5700     20.6600
+    124.3582   1527.0900     36.5700     20.6600
+    124.4948   1527.0800     36.5700     20.6600
+    124.6315   1527.0800     36.5700     20.6500
+    124.7681   1527.0700     36.5700     20.6500
+    124.9048   1527.0600     36.5700     20.6400
+    125.0414   1527.0600     36.5700     20.6400
+    125.1781   1527.0500     36.5700     20.6400
+    125.3148   1527.0400     36.5700     20.6300
+    125.4514   1527.0400     36.5700     20.6300
+    125.5881   1527.0300     36.5700     20.6300
+    125.7247   1527.0300     36.5700     20.6300
+    125.8614   1527.0200     36.5700     20.6200
+    125.9980   1527.0200     36.5700     20.6200
+    126.1346   1527.0200     36.5700     20.6200
+    126.2713   1527.0200     36.5700     20.6200
+    126.4079   1527.0200     36.5700     20.6200
+    126.5446   1527.0200     36.5700     20.6200
+    126.6812   1527.0200     36.5700     20.6200
+    126.8179   1527.0200     36.5700     20.6200
+    126.9545   1527.0200     36.5700     20.6200
+    127.0912   1527.0300     36.5800     20.6200
+    127.2278   1527.0300     36.5800     20.6100
+    127.3644   1527.0300     36.5800     20.6100
+    127.5011   1527.0300     36.5800     20.6100
+    127.6377   1527.0300     36.5800     20.6100
+    127.7743   1527.0300     36.5800     20.6100
+    127.9110   1527.0300     36.5800     20.6100
+    128.0476   1527.0200     36.5800     20.6000
+    128.1842   1527.0000     36.5800     20.6000
+    128.3209   1526.9900     36.5800     20.5900
+    128.4575   1526.9800     36.5800     20.5900
+    128.5941   1526.9600     36.5800     20.5800
+    128.7308   1526.9400     36.5800     20.5700
+    128.8674   1526.9300     36.5800     20.5700
+    129.0040   1526.9100     36.5800     20.5600
+    129.1406   1526.9000     36.5800     20.5500
+    129.2773   1526.8900     36.5800     20.5500
+    129.4139   1526.8700     36.5800     20.5400
+    129.5505   1526.8600     36.5800     20.5400
+    129.6871   1526.8500     36.5800     20.5400
+    129.8237   1526.8500     36.5800     20.5300
+    129.9604   1526.8400     36.5800     20.5300
+    130.0970   1527.2200     36.9300     20.5200
+    130.2336   1527.6100     37.2800     20.5200
+    130.3702   1527.9900     37.6300     20.5200
+    130.5068   1527.9900     37.6300     20.5200
+    130.6434   1527.9900     37.6300     20.5100
+    130.7801   1527.9800     37.6300     20.5100
+    130.9167   1527.9800     37.6300     20.5100
+    131.0533   1527.9700     37.6300     20.5100
+    131.1899   1527.9800     37.6300     20.5100
+    131.3265   1527.5800     37.2800     20.5000
+    131.4631   1527.1800     36.9300     20.5000
+    131.5997   1526.7900     36.5800     20.5000
+    131.7363   1526.7800     36.5800     20.4900
+    131.8729   1526.7700     36.5800     20.4900
+    132.0095   1526.7600     36.5800     20.4800
+    132.1461   1526.7400     36.5800     20.4800
+    132.2827   1526.7300     36.5800     20.4700
+    132.4193   1526.7100     36.5800     20.4700
+    132.5559   1526.7000     36.5800     20.4600
+    132.6926   1526.6900     36.5800     20.4500
+    132.8291   1526.6700     36.5800     20.4500
+    132.9657   1526.6600     36.5800     20.4400
+    133.1023   1526.6400     36.5800     20.4300
+    133.2389   1526.6300     36.5800     20.4300
+    133.3755   1526.6100     36.5800     20.4200
+    133.5121   1526.6000     36.5800     20.4100
+    133.6487   1526.5800     36.5800     20.4100
+    133.7853   1526.5600     36.5800     20.4000
+    133.9219   1526.5500     36.5800     20.4000
+    134.0585   1526.5300     36.5800     20.3900
+    134.1951   1526.5200     36.5800     20.3800
+    134.3317   1526.5100     36.5800     20.3800
+    134.4682   1526.5100     36.5800     20.3800
+    134.6048   1526.5000     36.5800     20.3800
+    134.7414   1526.5000     36.5800     20.3700
+    134.8780   1526.5000     36.5800     20.3700
+    135.0146   1526.5000     36.5800     20.3700
+    135.1512   1526.4900     36.5800     20.3700
+    135.2877   1526.4800     36.5800     20.3600
+    135.4243   1526.4700     36.5800     20.3600
+    135.5609   1526.4600     36.5800     20.3500
+    135.6975   1526.4400     36.5800     20.3500
+    135.8340   1526.4200     36.5800     20.3400
+    135.9706   1526.4000     36.5800     20.3300
+    136.1072   1526.3800     36.5700     20.3200
+    136.2438   1526.3600     36.5700     20.3200
+    136.3804   1526.3400     36.5700     20.3100
+    136.5169   1526.3200     36.5700     20.3000
+    136.6535   1526.3100     36.5700     20.3000
+    136.7901   1526.3000     36.5700     20.2900
+    136.9266   1526.2900     36.5700     20.2900
+    137.0632   1526.2800     36.5700     20.2800
+    137.1998   1526.2700     36.5700     20.2800
+    137.3363   1526.2600     36.5700     20.2700
+    137.4729   1526.2500     36.5700     20.2700
+    137.6095   1526.2400     36.5700     20.2700
+    137.7460   1526.2400     36.5700     20.2600
+    137.8826   1526.2300     36.5700     20.2600
+    138.0191   1526.2300     36.5700     20.2600
+    138.1557   1526.2200     36.5700     20.2500
+    138.2923   1526.2200     36.5700     20.2500
+    138.4288   1526.2200     36.5700     20.2500
+    138.5654   1526.2100     36.5700     20.2500
+    138.7019   1526.2100     36.5700     20.2500
+    138.8385   1526.2000     36.5700     20.2400
+    138.9751   1526.2000     36.5700     20.2400
+    139.1116   1526.2000     36.5700     20.2400
+    139.2482   1526.1900     36.5700     20.2400
+    139.3847   1526.1900     36.5700     20.2400
+    139.5213   1526.1900     36.5700     20.2400
+    139.6578   1526.2000     36.5700     20.2400
+    139.7943   1526.2100     36.5700     20.2400
+    139.9309   1526.2100     36.5700     20.2400
+    140.0674   1526.2200     36.5800     20.2400
+    140.2040   1526.2300     36.5800     20.2400
+    140.3405   1526.2300     36.5800     20.2400
+    140.4771   1526.2400     36.5800     20.2400
+    140.6136   1526.2500     36.5800     20.2500
+    140.7502   1526.2600     36.5800     20.2500
+    140.8867   1526.2700     36.5900     20.2500
+    141.0232   1526.2800     36.5900     20.2500
+    141.1598   1526.2900     36.5900     20.2500
+    141.2963   1526.3000     36.5900     20.2600
+    141.4328   1526.3200     36.5900     20.2600
+    141.5694   1526.3300     36.5900     20.2600
+    141.7059   1526.3400     36.5900     20.2700
+    141.8425   1526.3500     36.6000     20.2700
+    141.9790   1526.3500     36.6000     20.2700
+    142.1155   1526.3600     36.6000     20.2700
+    142.2520   1526.3600     36.6000     20.2700
+    142.3886   1526.3600     36.6000     20.2700
+    142.5251   1526.3600     36.6000     20.2700
+    142.6616   1526.3500     36.6000     20.2600
+    142.7981   1526.3500     36.6000     20.2600
+    142.9347   1526.3400     36.6000     20.2600
+    143.0712   1526.3400     36.6000     20.2500
+    143.2077   1526.3300     36.6000     20.2500
+    143.3442   1526.3300     36.6000     20.2500
+    143.4808   1526.3300     36.6000     20.2500
+    143.6173   1526.3300     36.6000     20.2500
+    143.7538   1526.3300     36.6000     20.2500
+    143.8903   1526.3300     36.6000     20.2500
+    144.0268   1526.3200     36.6000     20.2400
+    144.1634   1526.3200     36.6000     20.2400
+    144.2999   1526.3200     36.6000     20.2400
+    144.4364   1526.3200     36.6000     20.2400
+    144.5729   1526.3200     36.6000     20.2400
+    144.7094   1526.3200     36.6000     20.2400
+    144.8459   1526.3100     36.6000     20.2400
+    144.9824   1526.3100     36.6000     20.2300
+    145.1189   1526.3100     36.6000     20.2300
+    145.2554   1526.3100     36.6000     20.2300
+    145.3920   1526.3000     36.6000     20.2300
+    145.5285   1526.3000     36.6000     20.2300
+    145.6650   1526.2900     36.6000     20.2200
+    145.8015   1526.2900     36.6000     20.2200
+    145.9380   1526.2900     36.6000     20.2200
+    146.0745   1526.2900     36.6000     20.2200
+    146.2110   1526.2900     36.6000     20.2200
+    146.3475   1526.2800     36.5900     20.2200
+    146.4840   1526.2900     36.5900     20.2200
+    146.6205   1526.3000     36.5900     20.2200
+    146.7570   1526.3200     36.5900     20.2300
+    146.8935   1526.3500     36.5900     20.2400
+    147.0300   1526.3800     36.6000     20.2500
+    147.1665   1526.4100     36.6000     20.2600
+    147.3029   1526.4500     36.6100     20.2700
+    147.4394   1526.4800     36.6200     20.2800
+    147.5759   1526.5200     36.6200     20.2900
+    147.7124   1526.5500     36.6300     20.2900
+    147.8489   1526.5700     36.6300     20.3000
+    147.9854   1526.5900     36.6400     20.3000
+    148.1219   1526.6000     36.6500     20.3000
+    148.2584   1526.6100     36.6500     20.3000
+    148.3949   1526.6100     36.6500     20.3000
+    148.5313   1526.6200     36.6500     20.3000
+    148.6678   1526.6200     36.6500     20.3100
+    148.8043   1526.6300     36.6500     20.3100
+    148.9408   1526.6400     36.6500     20.3100
+    149.0773   1526.6400     36.6500     20.3100
+    149.2138   1526.6500     36.6500     20.3100
+    149.3502   1526.6500     36.6600     20.3100
+    149.4867   1526.6500     36.6600     20.3100
+    149.6232   1526.6400     36.6600     20.3000
+    149.7597   1526.6300     36.6600     20.3000
+    149.8961   1526.6200     36.6600     20.2900
+    150.0326   1526.6000     36.6600     20.2900
+    150.1691   1526.5900     36.6600     20.2800
+    150.3056   1526.5700     36.6500     20.2700
+    150.4420   1526.5500     36.6600     20.2600
+    150.5785   1526.5200     36.6500     20.2500
+    150.7150   1526.5000     36.6500     20.2500
+    150.8514   1526.4700     36.6500     20.2400
+    150.9879   1526.4500     36.6500     20.2300
+    151.1244   1526.4200     36.6500     20.2200
+    151.2608   1526.4000     36.6500     20.2100
+    151.3973   1526.3800     36.6500     20.2000
+    151.5338   1526.3600     36.6500     20.1900
+    151.6702   1526.3400     36.6400     20.1900
+    151.8067   1526.3300     36.6400     20.1800
+    151.9431   1526.3200     36.6400     20.1800
+    152.0796   1526.3100     36.6400     20.1700
+    152.2160   1526.3000     36.6400     20.1700
+    152.3525   1526.3000     36.6400     20.1700
+    152.4890   1526.3000     36.6400     20.1700
+    152.6254   1526.2900     36.6400     20.1600
+    152.7619   1526.2900     36.6400     20.1600
+    152.8983   1526.2800     36.6400     20.1600
+    153.0348   1526.2700     36.6400     20.1500
+    153.1712   1526.2600     36.6400     20.1500
+    153.3077   1526.2500     36.6400     20.1400
+    153.4441   1526.2400     36.6400     20.1400
+    153.5806   1526.2200     36.6400     20.1300
+    153.7170   1526.2100     36.6400     20.1300
+    153.8535   1526.1900     36.6400     20.1200
+    153.9899   1526.1800     36.6400     20.1100
+    154.1263   1526.1600     36.6400     20.1100
+    154.2628   1526.1500     36.6400     20.1000
+    154.3992   1526.1400     36.6400     20.1000
+    154.5357   1526.1200     36.6400     20.0900
+    154.6721   1526.1100     36.6400     20.0900
+    154.8086   1526.0900     36.6400     20.0800
+    154.9450   1526.0800     36.6400     20.0700
+    155.0814   1526.0700     36.6300     20.0700
+    155.2179   1526.0500     36.6300     20.0600
+    155.3543   1526.0400     36.6300     20.0600
+    155.4907   1526.0300     36.6300     20.0500
+    155.6272   1526.0200     36.6300     20.0500
+    155.7636   1526.0100     36.6300     20.0500
+    155.9000   1526.0000     36.6300     20.0400
+    156.0365   1526.0000     36.6300     20.0400
+    156.1729   1526.0000     36.6300     20.0400
+    156.3093   1525.9900     36.6300     20.0400
+    156.4457   1525.9900     36.6200     20.0400
+    156.5822   1525.9900     36.6200     20.0400
+    156.7186   1525.9800     36.6200     20.0300
+    156.8550   1525.9800     36.6200     20.0300
+    156.9914   1525.9800     36.6200     20.0300
+    157.1279   1525.9800     36.6200     20.0300
+    157.2643   1525.9800     36.6200     20.0300
+    157.4007   1525.9800     36.6200     20.0300
+    157.5371   1525.9800     36.6200     20.0300
+    157.6735   1525.9700     36.6200     20.0200
+    157.8100   1525.9700     36.6200     20.0200
+    157.9464   1525.9700     36.6200     20.0200
+    158.0828   1525.9600     36.6200     20.0200
+    158.2192   1525.9600     36.6200     20.0100
+    158.3556   1525.9500     36.6200     20.0100
+    158.4920   1525.9400     36.6200     20.0100
+    158.6284   1525.9200     36.6200     20.0000
+    158.7648   1525.9100     36.6200     19.9900
+    158.9013   1525.8900     36.6200     19.9900
+    159.0377   1525.8600     36.6200     19.9800
+    159.1741   1525.8400     36.6200     19.9700
+    159.3105   1525.8200     36.6200     19.9600
+    159.4469   1525.7900     36.6200     19.9500
+    159.5833   1525.7700     36.6200     19.9400
+    159.7197   1525.7500     36.6200     19.9300
+    159.8561   1525.7200     36.6100     19.9200
+    159.9925   1525.6900     36.6100     19.9100
+    160.1289   1525.6700     36.6100     19.9000
+    160.2653   1525.6500     36.6100     19.9000
+    160.4017   1525.6200     36.6100     19.8900
+    160.5381   1525.6000     36.6100     19.8800
+    160.6745   1525.5800     36.6000     19.8700
+    160.8109   1525.5600     36.6000     19.8600
+    160.9473   1525.5500     36.6000     19.8600
+    161.0837   1525.5400     36.6000     19.8600
+    161.2201   1525.5300     36.6000     19.8500
+    161.3564   1525.5300     36.6000     19.8500
+    161.4928   1525.5200     36.6000     19.8500
+    161.6292   1525.5200     36.6000     19.8500
+    161.7656   1525.5200     36.6000     19.8400
+    161.9020   1525.5100     36.6000     19.8400
+    162.0384   1525.5500     36.6400     19.8400
+    162.1748   1525.5500     36.6400     19.8300
+    162.3112   1525.5400     36.6500     19.8300
+    162.4475   1525.5300     36.6500     19.8300
+    162.5839   1525.5200     36.6400     19.8200
+    162.7203   1525.5100     36.6400     19.8200
+    162.8567   1525.5100     36.6400     19.8200
+    162.9931   1525.5100     36.6400     19.8200
+    163.1294   1525.5100     36.6400     19.8100
+    163.2658   1525.4600     36.6000     19.8100
+    163.4022   1525.4600     36.6000     19.8100
+    163.5386   1525.4600     36.6000     19.8100
+    163.6749   1525.4700     36.6000     19.8100
+    163.8113   1525.4600     36.6000     19.8100
+    163.9477   1525.4600     36.6100     19.8100
+    164.0841   1525.4500     36.6100     19.8000
+    164.2204   1525.4400     36.6100     19.8000
+    164.3568   1525.4200     36.6100     19.7900
+    164.4932   1525.4000     36.6100     19.7800
+    164.6295   1525.3800     36.6000     19.7800
+    164.7659   1525.3600     36.6000     19.7700
+    164.9023   1525.3800     36.6500     19.7600
+    165.0386   1525.3500     36.6400     19.7500
+    165.1750   1525.3300     36.6400     19.7400
+    165.3114   1525.3100     36.6400     19.7300
+    165.4477   1525.2800     36.6300     19.7200
+    165.5841   1525.2600     36.6300     19.7100
+    165.7204   1525.2400     36.6300     19.7100
+    165.8568   1525.2200     36.6300     19.7000
+    165.9931   1525.2100     36.6300     19.6900
+    166.1295   1525.1400     36.5800     19.6900
+    166.2659   1525.1200     36.5800     19.6800
+    166.4022   1525.1600     36.6200     19.6800
+    166.5386   1525.1900     36.6700     19.6700
+    166.6749   1525.1700     36.6700     19.6600
+    166.8113   1525.1600     36.6600     19.6600
+    166.9476   1525.1500     36.6600     19.6500
+    167.0840   1525.1400     36.6600     19.6500
+    167.2203   1525.1200     36.6600     19.6400
+    167.3567   1525.1100     36.6600     19.6400
+    167.4930   1525.1100     36.6600     19.6400
+    167.6294   1525.0500     36.6100     19.6300
+    167.7657   1524.9900     36.5700     19.6300
+    167.9021   1524.9900     36.5700     19.6300
+    168.0384   1524.9800     36.5700     19.6300
+    168.1747   1524.9800     36.5700     19.6300
+    168.3111   1524.9800     36.5700     19.6200
+    168.4474   1524.9700     36.5700     19.6200
+    168.5838   1524.9700     36.5700     19.6200
+    168.7201   1524.9600     36.5700     19.6100
+    168.8564   1524.9500     36.5700     19.6100
+    168.9928   1524.9400     36.5700     19.6100
+    169.1291   1524.9300     36.5700     19.6000
+    169.2654   1524.9200     36.5700     19.6000
+    169.4018   1524.9100     36.5700     19.5900
+    169.5381   1524.8900     36.5700     19.5900
+    169.6744   1524.8800     36.5700     19.5800
+    169.8108   1524.8700     36.5600     19.5800
+    169.9471   1524.8500     36.5600     19.5700
+    170.0834   1524.8400     36.5600     19.5700
+    170.2197   1524.8300     36.5600     19.5600
+    170.3561   1524.8200     36.5600     19.5600
+    170.4924   1524.8200     36.5600     19.5600
+    170.6287   1524.8200     36.5600     19.5500
+    170.7650   1524.8100     36.5600     19.5500
+    170.9014   1524.8100     36.5600     19.5500
+    171.0377   1524.8200     36.5600     19.5500
+    171.1740   1524.8200     36.5600     19.5500
+    171.3103   1524.8200     36.5600     19.5500
+    171.4466   1524.8200     36.5600     19.5500
+    171.5829   1524.8100     36.5600     19.5500
+    171.7193   1524.8000     36.5600     19.5400
+    171.8556   1524.7900     36.5600     19.5400
+    171.9919   1524.7700     36.5600     19.5300
+    172.1282   1524.7600     36.5600     19.5300
+    172.2645   1524.7400     36.5600     19.5200
+    172.4008   1524.7300     36.5600     19.5100
+    172.5372   1524.7200     36.5600     19.5100
+    172.6734   1524.7000     36.5500     19.5000
+    172.8098   1524.7000     36.5500     19.5000
+    172.9461   1524.7000     36.5500     19.5000
+    173.0824   1524.7000     36.5500     19.5000
+    173.2187   1524.7000     36.5500     19.5000
+    173.3550   1524.7100     36.5500     19.5000
+    173.4913   1524.7100     36.5500     19.5000
+    173.6276   1524.7200     36.5600     19.5000
+    173.7639   1524.7200     36.5600     19.5000
+    173.9002   1524.7300     36.5600     19.5000
+    174.0365   1524.7200     36.5600     19.5000
+    174.1728   1524.7200     36.5600     19.5000
+    174.3091   1524.7100     36.5600     19.5000
+    174.4454   1524.7000     36.5600     19.4900
+    174.5817   1524.6900     36.5500     19.4900
+    174.7180   1524.6800     36.5500     19.4900
+    174.8543   1524.6700     36.5500     19.4800
+    174.9905   1524.6600     36.5500     19.4800
+    175.1268   1524.6500     36.5500     19.4700
+    175.2631   1524.6500     36.5500     19.4700
+    175.3994   1524.6400     36.5500     19.4700
+    175.5357   1524.6400     36.5500     19.4700
+    175.6720   1524.6400     36.5500     19.4700
+    175.8083   1524.6300     36.5500     19.4600
+    175.9446   1524.6300     36.5500     19.4600
+    176.0808   1524.6300     36.5500     19.4600
+    176.2171   1524.6300     36.5500     19.4600
+    176.3534   1524.6300     36.5500     19.4600
+    176.4897   1524.6300     36.5500     19.4600
+    176.6260   1524.6300     36.5500     19.4500
+    176.7623   1524.6300     36.5500     19.4500
+    176.8985   1524.6300     36.5500     19.4500
+    177.0348   1524.6300     36.5500     19.4500
+    177.1711   1524.6200     36.5500     19.4500
+    177.3074   1524.6200     36.5500     19.4500
+    177.4436   1524.6200     36.5500     19.4500
+    177.5799   1524.6200     36.5500     19.4500
+    177.7162   1524.6100     36.5500     19.4500
+    177.8524   1524.6100     36.5500     19.4400
+    177.9887   1524.6100     36.5500     19.4400
+    178.1250   1524.6100     36.5500     19.4400
+    178.2613   1524.6100     36.5500     19.4400
+    178.3975   1524.6000     36.5500     19.4400
+    178.5338   1524.6000     36.5500     19.4300
+    178.6701   1524.6000     36.5500     19.4300
+    178.8063   1524.5900     36.5500     19.4300
+    178.9426   1524.5900     36.5500     19.4300
+    179.0788   1524.5800     36.5500     19.4300
+    179.2151   1524.5700     36.5400     19.4200
+    179.3514   1524.5700     36.5400     19.4200
+    179.4876   1524.5700     36.5400     19.4200
+    179.6239   1524.5600     36.5400     19.4200
+    179.7601   1524.5600     36.5400     19.4200
+    179.8964   1524.5600     36.5400     19.4100
+    180.0327   1524.5600     36.5400     19.4100
+    180.1689   1454.1400     36.5400      0.0000
+    181.3952   1483.4500      0.0000     19.3900
+    181.5314   1483.4500      0.0000     19.3900
+    181.6676   1483.4600      0.0100     19.3900
+    181.8039   1524.5100     36.5400     19.3900
+    181.9401   1524.5100     36.5400     19.3900
+    182.0764   1524.5200     36.5400     19.3900
+    182.2126   1524.5100     36.5400     19.3800
+    182.3488   1524.5200     36.5400     19.3900
+    182.4851   1524.5200     36.5400     19.3800
+    182.6213   1524.5200     36.5400     19.3900
+    182.7576   1524.5300     36.5500     19.3900
+    182.8938   1524.5300     36.5500     19.3900
+    183.0300   1524.5400     36.5500     19.3900
+    183.1662   1524.5400     36.5500     19.3900
+    183.3025   1524.5500     36.5500     19.3900
+    183.4387   1524.5500     36.5500     19.3900
+    183.5749   1524.5500     36.5500     19.3900
+    183.7112   1524.5500     36.5500     19.3900
+    183.8474   1524.5400     36.5500     19.3800
+    183.9836   1524.5400     36.5500     19.3800
+    184.1198   1524.5300     36.5500     19.3800
+    184.2561   1524.5200     36.5500     19.3700
+    184.3923   1524.5100     36.5500     19.3700
+    184.5285   1524.4900     36.5500     19.3600
+    184.6647   1524.4800     36.5500     19.3600
+    184.8010   1524.4600     36.5500     19.3500
+    184.9372   1524.4500     36.5500     19.3500
+    185.0734   1524.4500     36.5400     19.3400
+    185.2096   1524.4300     36.5400     19.3400
+    185.3458   1524.4300     36.5400     19.3400
+    185.4821   1524.4200     36.5400     19.3300
+    185.6183   1524.4200     36.5400     19.3300
+    185.7545   1524.4200     36.5400     19.3300
+    185.8907   1524.4200     36.5400     19.3300
+    186.0269   1524.4100     36.5400     19.3200
+    186.1631   1524.4900     36.5400     19.3500
+    186.2993   1524.4700     36.5400     19.3500
+    186.4355   1524.4500     36.5300     19.3400
+    186.5717   1524.4500     36.5300     19.3400
+    186.7079   1524.4300     36.5300     19.3300
+    186.8441   1524.4200     36.5300     19.3300
+    186.9803   1524.4000     36.5300     19.3200
+    187.1166   1524.3900     36.5300     19.3200
+    187.2528   1524.3800     36.5300     19.3100
+    187.3890   1524.2800     36.5300     19.2800
+    187.5252   1524.2800     36.5300     19.2700
+    187.6614   1524.2800     36.5400     19.2700
+    187.7976   1524.2700     36.5400     19.2700
+    187.9337   1524.2500     36.5400     19.2600
+    188.0699   1524.2400     36.5400     19.2600
+    188.2061   1524.2300     36.5400     19.2500
+    188.3423   1524.2100     36.5400     19.2400
+    188.4785   1524.2000     36.5400     19.2400
+    188.6147   1524.1800     36.5300     19.2300
+    188.7509   1524.1700     36.5300     19.2300
+    188.8871   1524.1500     36.5300     19.2200
+    189.0233   1524.1400     36.5300     19.2200
+    189.1595   1524.1300     36.5300     19.2100
+    189.2957   1524.1300     36.5300     19.2100
+    189.4319   1524.1200     36.5300     19.2100
+    189.5681   1524.1200     36.5300     19.2100
+    189.7042   1524.1200     36.5300     19.2000
+    189.8404   1524.1100     36.5300     19.2000
+    189.9766   1524.1100     36.5300     19.2000
+    190.1128   1524.1100     36.5300     19.2000
+    190.2490   1524.1100     36.5300     19.2000
+    190.3851   1524.1000     36.5300     19.2000
+    190.5213   1524.1000     36.5300     19.1900
+    190.6575   1524.0900     36.5300     19.1900
+    190.7937   1524.0900     36.5300     19.1900
+    190.9299   1524.0800     36.5300     19.1800
+    191.0660   1524.0800     36.5300     19.1800
+    191.2022   1524.0700     36.5300     19.1800
+    191.3384   1524.0700     36.5300     19.1800
+    191.4745   1524.0600     36.5300     19.1700
+    191.6107   1524.0500     36.5300     19.1700
+    191.7469   1524.0500     36.5200     19.1700
+    191.8831   1524.0500     36.5200     19.1700
+    192.0192   1524.0400     36.5200     19.1700
+    192.1554   1524.0400     36.5200     19.1700
+    192.2916   1524.0400     36.5200     19.1600
+    192.4277   1524.0400     36.5200     19.1600
+    192.5639   1524.0400     36.5300     19.1600
+    192.7001   1524.0400     36.5300     19.1600
+    192.8362   1524.0400     36.5300     19.1600
+    192.9724   1524.0400     36.5300     19.1600
+    193.1085   1524.0400     36.5300     19.1600
+    193.2447   1524.0400     36.5300     19.1600
+    193.3809   1524.0300     36.5300     19.1500
+    193.5170   1524.0300     36.5300     19.1500
+    193.6532   1524.0300     36.5300     19.1500
+    193.7893   1524.0300     36.5300     19.1500
+    193.9255   1524.0200     36.5300     19.1500
+    194.0616   1524.0200     36.5300     19.1400
+    194.1978   1524.0100     36.5300     19.1400
+    194.3339   1524.0100     36.5300     19.1400
+    194.4701   1524.0100     36.5300     19.1400
+    194.6062   1524.0000     36.5300     19.1400
+    194.7424   1524.0000     36.5300     19.1300
+    194.8785   1523.9900     36.5200     19.1300
+    195.0147   1523.9900     36.5200     19.1300
+    195.1508   1523.9900     36.5200     19.1300
+    195.2870   1523.9900     36.5200     19.1300
+    195.4231   1523.9800     36.5200     19.1300
+    195.5592   1523.9800     36.5200     19.1200
+    195.6954   1523.9800     36.5200     19.1200
+    195.8315   1523.9700     36.5200     19.1200
+    195.9677   1523.9600     36.5200     19.1200
+    196.1038   1523.9600     36.5300     19.1100
+    196.2399   1523.9500     36.5300     19.1100
+    196.3761   1523.9400     36.5200     19.1000
+    196.5122   1523.9200     36.5200     19.1000
+    196.6483   1523.9100     36.5200     19.0900
+    196.7845   1523.9000     36.5200     19.0900
+    196.9206   1523.8900     36.5200     19.0900
+    197.0567   1523.8900     36.5200     19.0800
+    197.1929   1523.8800     36.5200     19.0800
+    197.3290   1523.8800     36.5200     19.0800
+    197.4651   1523.8800     36.5200     19.0800
+    197.6013   1523.8800     36.5200     19.0800
+    197.7374   1523.8800     36.5200     19.0800
+    197.8735   1523.8700     36.5200     19.0700
+    198.0096   1523.8700     36.5200     19.0700
+    198.1458   1523.8600     36.5200     19.0700
+    198.2819   1523.8600     36.5200     19.0700
+    198.4180   1523.8500     36.5200     19.0600
+    198.5541   1523.8400     36.5200     19.0600
+    198.6902   1523.8400     36.5200     19.0600
+    198.8264   1523.8300     36.5200     19.0500
+    198.9625   1523.8200     36.5200     19.0500
+    199.0986   1523.8200     36.5200     19.0500
+    199.2347   1523.8200     36.5200     19.0500
+    199.3708   1523.8100     36.5200     19.0400
+    199.5069   1524.0000     36.5200     19.1100
+    199.6431   1524.1600     36.4900     19.1800
+    199.7792   1524.0900     36.4300     19.1800
+    199.9153   1524.0700     36.4000     19.1800
+    200.0514   1524.0700     36.4000     19.1800
+    200.1875   1524.0700     36.4000     19.1800
+    200.3236   1524.0700     36.4000     19.1800
+    200.4597   1524.0700     36.4000     19.1800
+    200.5958   1524.0800     36.4000     19.1800
+    200.7319   1523.8900     36.4000     19.1100
+    200.8680   1523.7400     36.4300     19.0400
+    201.0041   1523.8000     36.4900     19.0400
+    201.1402   1523.8400     36.5200     19.0400
+    201.2763   1523.8300     36.5200     19.0400
+    201.4124   1523.8300     36.5200     19.0400
+    201.5485   1523.8200     36.5200     19.0300
+    201.6846   1523.8200     36.5200     19.0300
+    201.8207   1523.8100     36.5200     19.0300
+    201.9568   1523.8000     36.5200     19.0200
+    202.0929   1523.7900     36.5200     19.0200
+    202.2290   1523.7800     36.5200     19.0100
+    202.3651   1523.7700     36.5200     19.0100
+    202.5012   1523.7600     36.5200     19.0100
+    202.6373   1523.7600     36.5200     19.0100
+    202.7733   1523.7500     36.5200     19.0000
+    202.9094   1523.7500     36.5200     19.0000
+    203.0455   1523.7400     36.5200     19.0000
+    203.1816   1523.7400     36.5200     19.0000
+    203.3177   1523.7400     36.5200     18.9900
+    203.4538   1523.7300     36.5200     18.9900
+    203.5899   1523.7300     36.5200     18.9900
+    203.7260   1523.7300     36.5200     18.9900
+    203.8620   1523.9100     36.5200     19.0500
+    203.9981   1524.0600     36.4900     19.1200
+    204.1342   1524.0000     36.4300     19.1200
+    204.2703   1523.9600     36.4000     19.1100
+    204.4064   1523.9600     36.4000     19.1100
+    204.5424   1523.9500     36.4000     19.1100
+    204.6785   1523.9400     36.4000     19.1100
+    204.8146   1523.9400     36.4000     19.1000
+    204.9507   1523.9300     36.4000     19.1000
+    205.0867   1523.7300     36.4000     19.0300
+    205.2228   1523.5700     36.4300     18.9600
+    205.3589   1523.6200     36.4900     18.9500
+    205.4949   1523.6500     36.5200     18.9500
+    205.6310   1523.6500     36.5200     18.9500
+    205.7671   1523.6400     36.5200     18.9500
+    205.9032   1523.6400     36.5200     18.9500
+    206.0392   1523.6400     36.5200     18.9400
+    206.1753   1523.6400     36.5200     18.9400
+    206.3113   1523.6400     36.5200     18.9400
+    206.4474   1523.6300     36.5200     18.9400
+    206.5835   1523.6300     36.5200     18.9400
+    206.7195   1523.6300     36.5100     18.9400
+    206.8556   1523.6300     36.5200     18.9400
+    206.9916   1523.6300     36.5200     18.9400
+    207.1277   1523.6300     36.5200     18.9400
+    207.2637   1523.6300     36.5200     18.9400
+    207.3998   1523.6300     36.5200     18.9300
+    207.5359   1523.8200     36.5200     19.0000
+    207.6719   1523.9700     36.4900     19.0600
+    207.8080   1524.0800     36.4300     19.1300
+    207.9440   1524.0100     36.3700     19.1200
+    208.0801   1523.9700     36.3400     19.1200
+    208.2161   1523.9600     36.3400     19.1200
+    208.3522   1523.9600     36.3400     19.1100
+    208.4882   1523.9500     36.3400     19.1100
+    208.6243   1523.9500     36.3400     19.1100
+    208.7603   1523.7500     36.3400     19.0400
+    208.8964   1523.5900     36.3700     18.9700
+    209.0324   1523.4700     36.4200     18.9000
+    209.1684   1523.5300     36.4800     18.9000
+    209.3045   1523.5700     36.5100     18.9000
+    209.4405   1523.5700     36.5100     18.9000
+    209.5766   1523.5700     36.5100     18.9000
+    209.7126   1523.5700     36.5100     18.9000
+    209.8486   1523.5700     36.5100     18.9000
+    209.9847   1523.5700     36.5100     18.9000
+    210.1207   1523.5800     36.5100     18.9000
+    210.2568   1523.5800     36.5100     18.9000
+    210.3928   1523.5800     36.5100     18.9000
+    210.5288   1523.5800     36.5100     18.9000
+    210.6649   1523.5800     36.5100     18.9000
+    210.8009   1523.5800     36.5100     18.9000
+    210.9369   1523.5800     36.5100     18.9000
+    211.0730   1523.5800     36.5100     18.9000
+    211.2090   1523.5800     36.5100     18.8900
+    211.3450   1523.5800     36.5200     18.8900
+    211.4810   1523.5700     36.5200     18.8900
+    211.6171   1523.5800     36.5200     18.8900
+    211.7531   1523.5700     36.5200     18.8900
+    211.8891   1523.5700     36.5200     18.8800
+    212.0251   1523.7600     36.5200     18.9500
+    212.1611   1523.9100     36.4900     19.0100
+    212.2972   1524.0300     36.4300     19.0800
+    212.4332   1523.9600     36.3700     19.0800
+    212.5692   1523.9200     36.3400     19.0700
+    212.7052   1523.9100     36.3400     19.0700
+    212.8412   1524.0000     36.3400     19.1000
+    212.9772   1523.9700     36.3200     19.1000
+    213.1133   1524.0500     36.3100     19.1300
+    213.2493   1523.8300     36.2900     19.0600
+    213.3853   1523.6500     36.3100     18.9900
+    213.5213   1523.5200     36.3700     18.9200
+    213.6573   1523.5800     36.4200     18.9200
+    213.7933   1523.6100     36.4500     18.9100
+    213.9293   1523.6000     36.4500     18.9100
+    214.0653   1523.5000     36.4500     18.8800
+    214.2013   1523.5200     36.4700     18.8700
+    214.3373   1523.4400     36.4800     18.8400
+    214.4734   1523.4500     36.5000     18.8400
+    214.6093   1523.4700     36.5100     18.8300
+    214.7453   1523.4600     36.5100     18.8300
+    214.8814   1523.4600     36.5100     18.8300
+    215.0174   1523.4600     36.5100     18.8300
+    215.1534   1523.4500     36.5100     18.8300
+    215.2894   1523.4500     36.5100     18.8300
+    215.4254   1523.4500     36.5100     18.8200
+    215.5614   1523.4400     36.5100     18.8200
+    215.6973   1523.4400     36.5100     18.8200
+    215.8333   1523.4400     36.5100     18.8200
+    215.9693   1523.4300     36.5100     18.8200
+    216.1053   1523.4300     36.5100     18.8100
+    216.2413   1523.4300     36.5100     18.8100
+    216.3773   1523.4300     36.5100     18.8100
+    216.5133   1523.4300     36.5100     18.8100
+    216.6493   1523.4200     36.5100     18.8100
+    216.7853   1523.4200     36.5100     18.8100
+    216.9212   1523.4200     36.5100     18.8100
+    217.0572   1523.4200     36.5100     18.8000
+    217.1932   1523.4200     36.5100     18.8000
+    217.3292   1523.4200     36.5100     18.8000
+    217.4652   1523.4200     36.5100     18.8000
+    217.6012   1523.4200     36.5100     18.8000
+    217.7372   1523.4200     36.5100     18.8000
+    217.8731   1523.4100     36.5100     18.8000
+    218.0091   1523.4100     36.5100     18.8000
+    218.1451   1523.4200     36.5100     18.8000
+    218.2811   1523.4100     36.5100     18.8000
+    218.4170   1523.4100     36.5100     18.7900
+    218.5530   1523.4100     36.5100     18.7900
+    218.6890   1523.4100     36.5100     18.7900
+    218.8250   1523.4100     36.5100     18.7900
+    218.9609   1523.4000     36.5100     18.7900
+    219.0969   1523.4000     36.5100     18.7800
+    219.2329   1523.3900     36.5100     18.7800
+    219.3689   1523.3900     36.5200     18.7800
+    219.5048   1523.3800     36.5200     18.7700
+    219.6408   1523.3700     36.5200     18.7700
+    219.7767   1523.3600     36.5200     18.7700
+    219.9127   1523.3500     36.5100     18.7600
+    220.0487   1523.3400     36.5100     18.7600
+    220.1846   1523.3300     36.5100     18.7500
+    220.3206   1523.3200     36.5100     18.7500
+    220.4566   1523.3100     36.5100     18.7500
+    220.5925   1523.3000     36.5100     18.7400
+    220.7285   1523.2900     36.5100     18.7400
+    220.8644   1523.2800     36.5100     18.7400
+    221.0004   1523.2800     36.5100     18.7300
+    221.1363   1523.2800     36.5100     18.7300
+    221.2723   1523.2700     36.5100     18.7300
+    221.4082   1523.2700     36.5100     18.7300
+    221.5442   1523.2600     36.5100     18.7200
+    221.6801   1523.2600     36.5100     18.7200
+    221.8161   1523.2600     36.5100     18.7200
+    221.9520   1523.2500     36.5100     18.7200
+    222.0880   1523.2400     36.5100     18.7100
+    222.2240   1523.2400     36.5100     18.7100
+    222.3599   1523.2400     36.5100     18.7100
+    222.4958   1523.2300     36.5100     18.7100
+    222.6318   1523.2300     36.5100     18.7100
+    222.7677   1523.2200     36.5100     18.7000
+    222.9037   1523.2200     36.5100     18.7000
+    223.0396   1523.2200     36.5100     18.7000
+    223.1756   1523.2200     36.5100     18.7000
+    223.3115   1523.2200     36.5100     18.7000
+    223.4474   1523.2200     36.5100     18.7000
+    223.5834   1523.2100     36.5100     18.7000
+    223.7193   1523.2100     36.5100     18.7000
+    223.8553   1523.2100     36.5100     18.6900
+    223.9912   1523.2100     36.5100     18.6900
+    224.1271   1523.2000     36.5100     18.6900
+    224.2630   1523.2000     36.5100     18.6900
+    224.3990   1523.2000     36.5100     18.6900
+    224.5349   1523.1900     36.5100     18.6800
+    224.6708   1523.1800     36.5100     18.6800
+    224.8068   1523.1700     36.5100     18.6700
+    224.9427   1523.1700     36.5100     18.6700
+    225.0786   1523.1600     36.5100     18.6700
+    225.2145   1523.1500     36.5100     18.6600
+    225.3505   1523.1300     36.5100     18.6600
+    225.4864   1523.1200     36.5100     18.6500
+    225.6223   1523.1200     36.5100     18.6500
+    225.7582   1523.1100     36.5000     18.6500
+    225.8942   1523.1100     36.5000     18.6500
+    226.0301   1523.1000     36.5000     18.6500
+    226.1660   1523.1000     36.5000     18.6400
+    226.3019   1523.1000     36.5000     18.6400
+    226.4378   1523.1000     36.5000     18.6400
+    226.5737   1523.1100     36.5000     18.6400
+    226.7097   1523.1100     36.5000     18.6400
+    226.8456   1523.1100     36.5000     18.6400
+    226.9815   1523.1100     36.5000     18.6400
+    227.1174   1523.1100     36.5000     18.6400
+    227.2533   1523.1100     36.5000     18.6400
+    227.3892   1523.1100     36.5000     18.6400
+    227.5251   1523.1100     36.5000     18.6400
+    227.6610   1523.1100     36.5000     18.6400
+    227.7970   1523.1100     36.5100     18.6400
+    227.9329   1523.1100     36.5100     18.6400
+    228.0688   1523.1200     36.5100     18.6400
+    228.2047   1523.1200     36.5100     18.6400
+    228.3406   1523.1200     36.5100     18.6400
+    228.4765   1523.1200     36.5100     18.6300
+    228.6124   1523.1200     36.5100     18.6300
+    228.7483   1523.1200     36.5100     18.6300
+    228.8842   1523.1200     36.5100     18.6300
+    229.0201   1523.1100     36.5100     18.6300
+    229.1560   1523.1100     36.5100     18.6300
+    229.2919   1523.1100     36.5100     18.6300
+    229.4278   1523.1000     36.5100     18.6200
+    229.5637   1523.1000     36.5100     18.6200
+    229.6995   1523.1000     36.5100     18.6200
+    229.8354   1523.1000     36.5100     18.6200
+    229.9713   1523.0900     36.5100     18.6200
+    230.1072   1523.0900     36.5100     18.6200
+    230.2431   1523.0800     36.5100     18.6100
+    230.3790   1523.0800     36.5100     18.6100
+    230.5149   1523.0700     36.5100     18.6100
+    230.6508   1523.0700     36.5100     18.6000
+    230.7866   1523.0600     36.5100     18.6000
+    230.9225   1523.0500     36.5000     18.6000
+    231.0584   1523.0400     36.5000     18.5900
+    231.1943   1523.0300     36.5000     18.5900
+    231.3302   1523.0200     36.5000     18.5900
+    231.4661   1523.0200     36.5000     18.5800
+    231.6020   1523.0100     36.5000     18.5800
+    231.7378   1523.0100     36.5000     18.5800
+    231.8737   1523.0100     36.5000     18.5800
+    232.0096   1523.0000     36.5000     18.5800
+    232.1454   1523.0000     36.5000     18.5700
+    232.2813   1523.0000     36.5000     18.5700
+    232.4172   1523.0000     36.5000     18.5700
+    232.5531   1523.0000     36.5000     18.5700
+    232.6889   1523.0000     36.5000     18.5700
+    232.8248   1523.0000     36.5000     18.5700
+    232.9607   1523.0000     36.5000     18.5700
+    233.0965   1523.0000     36.5000     18.5700
+    233.2324   1523.0000     36.5000     18.5700
+    233.3683   1523.0000     36.5000     18.5700
+    233.5042   1523.0000     36.5000     18.5700
+    233.6400   1523.0000     36.5000     18.5700
+    233.7759   1523.0000     36.5000     18.5700
+    233.9117   1523.0000     36.5000     18.5700
+    234.0476   1523.0000     36.5000     18.5600
+    234.1835   1523.0000     36.5000     18.5600
+    234.3193   1522.9900     36.5000     18.5600
+    234.4552   1522.9900     36.5000     18.5600
+    234.5910   1522.9900     36.5000     18.5600
+    234.7269   1522.9900     36.5000     18.5500
+    234.8627   1522.9900     36.5000     18.5500
+    234.9986   1522.9900     36.5000     18.5500
+    235.1345   1522.9900     36.5000     18.5500
+    235.2703   1522.9800     36.5000     18.5500
+    235.4062   1522.9900     36.5000     18.5500
+    235.5420   1522.9900     36.5000     18.5500
+    235.6779   1522.9900     36.5000     18.5500
+    235.8137   1522.9900     36.5000     18.5500
+    235.9496   1522.9800     36.5000     18.5500
+    236.0854   1522.9800     36.5000     18.5400
+    236.2213   1522.9700     36.5000     18.5400
+    236.3571   1522.9700     36.5000     18.5400
+    236.4929   1522.9700     36.5000     18.5400
+    236.6288   1522.9600     36.5000     18.5300
+    236.7646   1522.9600     36.5000     18.5300
+    236.9005   1522.9500     36.5000     18.5300
+    237.0363   1522.9500     36.5000     18.5300
+    237.1721   1522.9500     36.5000     18.5300
+    237.3080   1522.9500     36.5000     18.5300
+    237.4438   1522.9500     36.5000     18.5300
+    237.5796   1522.9400     36.5000     18.5200
+    237.7155   1522.9400     36.5000     18.5200
+    237.8513   1522.9400     36.5000     18.5200
+    237.9872   1522.9400     36.5000     18.5200
+    238.1230   1522.9300     36.5000     18.5200
+    238.2588   1522.9300     36.5000     18.5100
+    238.3947   1522.9200     36.5000     18.5100
+    238.5305   1522.9100     36.5000     18.5100
+    238.6663   1522.9000     36.5000     18.5000
+    238.8021   1522.8900     36.5000     18.5000
+    238.9379   1522.8800     36.5000     18.4900
+    239.0738   1522.8700     36.5000     18.4900
+    239.2096   1522.8600     36.5000     18.4900
+    239.3454   1522.8500     36.5000     18.4800
+    239.4812   1522.8400     36.5000     18.4800
+    239.6171   1522.8400     36.5000     18.4800
+    239.7529   1522.8300     36.5000     18.4700
+    239.8887   1522.8300     36.5000     18.4700
+    240.0245   1522.8200     36.5000     18.4700
+    240.1603   1522.8200     36.5000     18.4700
+    240.2962   1522.8200     36.5000     18.4700
+    240.4320   1522.8200     36.5000     18.4600
+    240.5678   1522.8200     36.5000     18.4600
+    240.7036   1522.8200     36.5000     18.4600
+    240.8394   1522.8200     36.5000     18.4600
+    240.9752   1522.8100     36.4900     18.4600
+    241.1110   1522.8100     36.4900     18.4600
+    241.2468   1522.8100     36.4900     18.4600
+    241.3826   1522.8000     36.4900     18.4600
+    241.5184   1522.8000     36.4900     18.4500
+    241.6543   1522.8000     36.4900     18.4500
+    241.7901   1522.8000     36.4900     18.4500
+    241.9259   1522.8000     36.4900     18.4500
+    242.0617   1522.8000     36.5000     18.4500
+    242.1975   1522.8000     36.5000     18.4500
+    242.3333   1522.7900     36.5000     18.4500
+    242.4691   1522.8000     36.4900     18.4500
+    242.6049   1522.8000     36.4900     18.4500
+    242.7407   1522.8000     36.5000     18.4400
+    242.8765   1522.8000     36.4900     18.4400
+    243.0123   1522.8000     36.4900     18.4400
+    243.1481   1522.8000     36.5000     18.4400
+    243.2838   1522.8000     36.4900     18.4400
+    243.4196   1522.8000     36.4900     18.4400
+    243.5554   1522.8100     36.4900     18.4400
+    243.6912   1522.8100     36.4900     18.4400
+    243.8270   1522.8000     36.5000     18.4400
+    243.9628   1522.8100     36.4900     18.4400
+    244.0986   1522.8100     36.5000     18.4400
+    244.2344   1522.8100     36.5000     18.4400
+    244.3701   1522.8100     36.4900     18.4400
+    244.5059   1522.8100     36.5000     18.4400
+    244.6417   1522.8100     36.5000     18.4400
+    244.7775   1522.8100     36.5000     18.4400
+    244.9133   1522.8100     36.5000     18.4400
+    245.0491   1522.8100     36.5000     18.4400
+    245.1849   1522.8100     36.5000     18.4300
+    245.3206   1522.8100     36.5000     18.4300
+    245.4564   1522.8000     36.5000     18.4300
+    245.5922   1522.8000     36.5000     18.4300
+    245.7280   1522.7900     36.5000     18.4200
+    245.8637   1522.7800     36.5000     18.4200
+    245.9995   1522.7800     36.5000     18.4200
+    246.1353   1522.7700     36.5000     18.4100
+    246.2711   1522.7600     36.4900     18.4100
+    246.4068   1522.7500     36.4900     18.4100
+    246.5426   1522.7400     36.4900     18.4000
+    246.6784   1522.7400     36.4900     18.4000
+    246.8141   1522.7300     36.4900     18.4000
+    246.9499   1522.7300     36.4900     18.4000
+    247.0857   1522.7200     36.4900     18.3900
+    247.2215   1522.7200     36.4900     18.3900
+    247.3572   1522.7100     36.4900     18.3900
+    247.4930   1522.7100     36.4900     18.3900
+    247.6287   1522.7100     36.4900     18.3900
+    247.7645   1522.7100     36.4900     18.3900
+    247.9002   1522.7100     36.4900     18.3800
+    248.0360   1522.7000     36.4900     18.3800
+    248.1718   1522.7000     36.4900     18.3800
+    248.3075   1522.7100     36.4900     18.3800
+    248.4433   1522.7100     36.4900     18.3800
+    248.5790   1522.7100     36.4900     18.3800
+    248.7148   1522.7100     36.4900     18.3800
+    248.8505   1522.7100     36.4900     18.3800
+    248.9863   1522.7000     36.4900     18.3800
+    249.1220   1522.7000     36.4900     18.3800
+    249.2578   1522.7000     36.4900     18.3800
+    249.3936   1522.7000     36.4900     18.3700
+    249.5293   1522.7000     36.4900     18.3700
+    249.6651   1522.7000     36.4900     18.3700
+    249.8008   1522.7000     36.4900     18.3700
+    249.9366   1522.7000     36.4900     18.3700
+    250.0723   1522.7100     36.4900     18.3700
+    250.2080   1522.7000     36.4900     18.3700
+    250.3438   1522.7000     36.4900     18.3700
+    250.4795   1522.7000     36.4900     18.3700
+    250.6152   1522.7000     36.4900     18.3700
+    250.7510   1522.7000     36.4900     18.3700
+    250.8867   1522.7000     36.4900     18.3700
+    251.0225   1522.7000     36.4900     18.3600
+    251.1582   1522.6900     36.4900     18.3600
+    251.2939   1522.6900     36.4900     18.3600
+    251.4297   1522.6900     36.4900     18.3600
+    251.5654   1522.6900     36.4900     18.3600
+    251.7011   1522.6800     36.4900     18.3500
+    251.8369   1522.6800     36.4900     18.3500
+    251.9726   1522.6700     36.4900     18.3500
+    252.1083   1522.6700     36.4900     18.3500
+    252.2440   1522.6700     36.4900     18.3500
+    252.3798   1522.6600     36.4900     18.3400
+    252.5155   1522.6600     36.4900     18.3400
+    252.6512   1522.6500     36.4900     18.3400
+    252.7870   1522.6500     36.4900     18.3400
+    252.9227   1522.6400     36.4900     18.3300
+    253.0584   1522.6300     36.4900     18.3300
+    253.1941   1522.6300     36.4800     18.3300
+    253.3299   1522.6200     36.4800     18.3300
+    253.4656   1522.6100     36.4800     18.3200
+    253.6013   1522.6000     36.4800     18.3200
+    253.7370   1522.6000     36.4800     18.3200
+    253.8727   1522.5900     36.4800     18.3100
+    254.0084   1522.5900     36.4800     18.3100
+    254.1441   1522.5900     36.4800     18.3100
+    254.2799   1522.5800     36.4800     18.3100
+    254.4156   1522.5800     36.4800     18.3100
+    254.5513   1522.5800     36.4800     18.3100
+    254.6870   1522.5800     36.4800     18.3000
+    254.8227   1522.5800     36.4800     18.3000
+    254.9584   1522.5700     36.4800     18.3000
+    255.0941   1522.5700     36.4800     18.3000
+    255.2298   1522.5700     36.4800     18.3000
+    255.3655   1522.5600     36.4800     18.2900
+    255.5013   1522.5500     36.4800     18.2900
+    255.6369   1522.5500     36.4900     18.2900
+    255.7726   1522.5400     36.4900     18.2800
+    255.9083   1522.5400     36.4900     18.2800
+    256.0440   1522.5300     36.4800     18.2800
+    256.1797   1522.5300     36.4800     18.2800
+    256.3155   1522.5300     36.4800     18.2800
+    256.4511   1522.5300     36.4800     18.2800
+    256.5869   1522.5300     36.4800     18.2800
+    256.7226   1522.5300     36.4800     18.2800
+    256.8582   1522.5300     36.4800     18.2800
+    256.9939   1522.5700     36.4800     18.2900
+    257.1296   1522.6100     36.4700     18.3100
+    257.2653   1522.6400     36.4600     18.3200
+    257.4010   1522.6700     36.4400     18.3400
+    257.5367   1522.7000     36.4300     18.3500
+    257.6724   1522.6900     36.4100     18.3500
+    257.8081   1522.6800     36.4000     18.3500
+    257.9438   1522.6800     36.4000     18.3500
+    258.0794   1522.6800     36.4000     18.3500
+    258.2151   1522.6300     36.4000     18.3300
+    258.3508   1522.5900     36.4100     18.3200
+    258.4865   1522.5600     36.4300     18.3000
+    258.6222   1522.5200     36.4400     18.2800
+    258.7579   1522.4900     36.4600     18.2600
+    258.8936   1522.5300     36.4700     18.2700
+    259.0292   1522.5500     36.4700     18.2700
+    259.1649   1522.5700     36.4700     18.2800
+    259.3006   1522.6100     36.4800     18.2900
+    259.4362   1455.3800     36.5000      0.0000
+    260.9286   1481.2100      0.0000     18.2800
+    261.0643   1481.2100      0.0000     18.2700
+    261.2000   1481.2200      0.0100     18.2700
+    261.3356   1522.5100     36.4500     18.2500
+    261.4713   1522.4600     36.4600     18.2400
+    261.6069   1522.4700     36.4700     18.2300
+    261.7426   1522.4800     36.4800     18.2300
+    261.8782   1522.4700     36.4800     18.2300
+    262.0139   1522.4700     36.4800     18.2300
+    262.1496   1522.4600     36.4800     18.2200
+    262.2852   1522.4600     36.4700     18.2200
+    262.4208   1522.4500     36.4700     18.2200
+    262.5565   1522.4400     36.4700     18.2200
+    262.6922   1522.4400     36.4700     18.2100
+    262.8278   1522.4400     36.4700     18.2100
+    262.9635   1522.4300     36.4700     18.2100
+    263.0991   1522.4300     36.4700     18.2100
+    263.2348   1522.4200     36.4700     18.2100
+    263.3704   1522.4200     36.4700     18.2000
+    263.5061   1522.4200     36.4700     18.2000
+    263.6417   1522.4200     36.4700     18.2000
+    263.7773   1522.4200     36.4800     18.2000
+    263.9130   1522.4200     36.4800     18.2000
+    264.0486   1522.4100     36.4700     18.2000
+    264.1843   1522.4100     36.4700     18.1900
+    264.3199   1522.4100     36.4800     18.1900
+    264.4556   1522.4000     36.4800     18.1900
+    264.5912   1522.4100     36.4800     18.1900
+    264.7268   1522.4000     36.4800     18.1900
+    264.8625   1522.4000     36.4800     18.1900
+    264.9981   1522.4000     36.4800     18.1900
+    265.1337   1522.4000     36.4700     18.1900
+    265.2694   1522.4000     36.4800     18.1900
+    265.4050   1522.4000     36.4700     18.1800
+    265.5406   1522.4000     36.4700     18.1800
+    265.6763   1522.4000     36.4700     18.1800
+    265.8119   1522.4000     36.4700     18.1800
+    265.9475   1522.4100     36.4700     18.1800
+    266.0831   1522.4100     36.4700     18.1800
+    266.2188   1522.4100     36.4700     18.1800
+    266.3544   1522.4200     36.4700     18.1800
+    266.4900   1522.4100     36.4700     18.1800
+    266.6256   1522.4100     36.4700     18.1800
+    266.7613   1522.4100     36.4700     18.1800
+    266.8969   1522.4100     36.4700     18.1800
+    267.0325   1522.4100     36.4800     18.1800
+    267.1681   1522.4100     36.4800     18.1800
+    267.3037   1522.4100     36.4700     18.1800
+    267.4394   1522.4000     36.4700     18.1700
+    267.5750   1522.4000     36.4700     18.1700
+    267.7106   1522.4000     36.4700     18.1700
+    267.8462   1522.4000     36.4700     18.1700
+    267.9818   1522.4000     36.4700     18.1700
+    268.1174   1522.4000     36.4700     18.1700
+    268.2531   1522.3900     36.4700     18.1700
+    268.3886   1522.4000     36.4700     18.1700
+    268.5243   1522.4000     36.4700     18.1700
+    268.6599   1522.4000     36.4700     18.1700
+    268.7955   1522.3900     36.4700     18.1600
+    268.9311   1522.4000     36.4700     18.1600
+    269.0667   1522.4000     36.4700     18.1600
+    269.2023   1522.4000     36.4700     18.1600
+    269.3379   1522.4000     36.4700     18.1600
+    269.4735   1522.4000     36.4700     18.1600
+    269.6091   1522.4000     36.4700     18.1600
+    269.7447   1522.4000     36.4800     18.1600
+    269.8803   1522.4000     36.4800     18.1600
+    270.0159   1522.4000     36.4800     18.1600
+    270.1515   1522.4000     36.4800     18.1600
+    270.2871   1522.4000     36.4800     18.1500
+    270.4227   1522.3900     36.4800     18.1500
+    270.5583   1522.3900     36.4800     18.1500
+    270.6939   1522.3900     36.4700     18.1500
+    270.8295   1522.3900     36.4700     18.1500
+    270.9651   1522.3800     36.4700     18.1500
+    271.1007   1522.3800     36.4700     18.1500
+    271.2363   1522.3700     36.4700     18.1400
+    271.3719   1522.3700     36.4700     18.1400
+    271.5074   1522.3600     36.4700     18.1400
+    271.6430   1522.3600     36.4700     18.1300
+    271.7786   1522.3500     36.4700     18.1300
+    271.9142   1522.3400     36.4700     18.1300
+    272.0498   1522.3300     36.4700     18.1200
+    272.1854   1522.3100     36.4700     18.1200
+    272.3210   1522.3000     36.4700     18.1100
+    272.4565   1522.2900     36.4700     18.1100
+    272.5921   1522.2800     36.4700     18.1000
+    272.7277   1522.2700     36.4700     18.1000
+    272.8633   1522.2600     36.4600     18.1000
+    272.9988   1522.2500     36.4600     18.0900
+    273.1344   1522.2400     36.4600     18.0900
+    273.2700   1522.2300     36.4600     18.0900
+    273.4055   1522.2300     36.4600     18.0800
+    273.5411   1522.2200     36.4600     18.0800
+    273.6767   1522.2100     36.4600     18.0800
+    273.8123   1522.2000     36.4600     18.0700
+    273.9478   1522.1900     36.4600     18.0700
+    274.0834   1522.1800     36.4600     18.0700
+    274.2190   1522.1700     36.4600     18.0600
+    274.3546   1522.1600     36.4600     18.0600
+    274.4901   1522.1600     36.4600     18.0500
+    274.6257   1522.1500     36.4600     18.0500
+    274.7612   1522.1500     36.4600     18.0500
+    274.8968   1522.1400     36.4600     18.0500
+    275.0323   1522.1300     36.4600     18.0400
+    275.1679   1522.1300     36.4600     18.0400
+    275.3035   1522.1200     36.4600     18.0400
+    275.4390   1522.1200     36.4600     18.0400
+    275.5746   1522.1200     36.4600     18.0400
+    275.7101   1522.1100     36.4500     18.0300
+    275.8457   1522.1100     36.4500     18.0300
+    275.9813   1522.1000     36.4500     18.0300
+    276.1168   1522.1000     36.4500     18.0300
+    276.2523   1522.1000     36.4500     18.0300
+    276.3879   1522.1000     36.4500     18.0300
+    276.5235   1522.1000     36.4500     18.0300
+    276.6590   1522.1000     36.4500     18.0200
+    276.7946   1522.1000     36.4500     18.0200
+    276.9301   1522.1000     36.4500     18.0200
+    277.0657   1522.1000     36.4500     18.0200
+    277.2012   1522.1100     36.4500     18.0200
+    277.3368   1522.1000     36.4500     18.0200
+    277.4723   1522.1100     36.4500     18.0200
+    277.6078   1522.1100     36.4500     18.0200
+    277.7434   1522.1100     36.4500     18.0200
+    277.8789   1522.1100     36.4500     18.0200
+    278.0145   1522.1100     36.4500     18.0200
+    278.1500   1522.1100     36.4500     18.0200
+    278.2855   1522.1000     36.4600     18.0200
+    278.4211   1522.1000     36.4600     18.0100
+    278.5566   1522.1000     36.4600     18.0100
+    278.6921   1522.1000     36.4600     18.0100
+    278.8277   1522.1000     36.4600     18.0100
+    278.9632   1522.0900     36.4600     18.0100
+    279.0988   1522.0900     36.4600     18.0100
+    279.2343   1522.0800     36.4600     18.0000
+    279.3698   1522.0700     36.4600     18.0000
+    279.5053   1522.0600     36.4500     18.0000
+    279.6409   1522.0500     36.4500     17.9900
+    279.7764   1522.0500     36.4500     17.9900
+    279.9119   1522.0400     36.4500     17.9900
+    280.0475   1522.0300     36.4500     17.9800
+    280.1830   1522.0200     36.4500     17.9800
+    280.3185   1522.0100     36.4500     17.9700
+    280.4540   1522.0000     36.4500     17.9700
+    280.5895   1522.0000     36.4500     17.9700
+    280.7250   1521.9900     36.4500     17.9600
+    280.8606   1521.9800     36.4500     17.9600
+    280.9961   1521.9700     36.4500     17.9600
+    281.1316   1521.9500     36.4500     17.9500
+    281.2671   1521.9400     36.4400     17.9500
+    281.4026   1521.9300     36.4400     17.9400
+    281.5382   1521.9200     36.4400     17.9400
+    281.6736   1521.9100     36.4400     17.9400
+    281.8092   1521.9000     36.4400     17.9300
+    281.9447   1521.8900     36.4400     17.9300
+    282.0802   1521.8900     36.4400     17.9300
+    282.2157   1521.8800     36.4400     17.9200
+    282.3512   1521.8700     36.4400     17.9200
+    282.4867   1521.8700     36.4400     17.9200
+    282.6223   1521.8700     36.4400     17.9200
+    282.7577   1521.8600     36.4400     17.9100
+    282.8932   1521.8600     36.4400     17.9100
+    283.0287   1521.8600     36.4400     17.9100
+    283.1642   1521.8600     36.4400     17.9100
+    283.2997   1521.8600     36.4400     17.9100
+    283.4352   1521.8600     36.4400     17.9100
+    283.5708   1521.8600     36.4300     17.9100
+    283.7063   1521.8700     36.4300     17.9100
+    283.8418   1521.8700     36.4300     17.9100
+    283.9772   1521.8700     36.4300     17.9100
+    284.1127   1521.8700     36.4400     17.9100
+    284.2482   1521.8800     36.4300     17.9100
+    284.3837   1521.8800     36.4300     17.9100
+    284.5192   1521.8800     36.4300     17.9100
+    284.6547   1521.8800     36.4400     17.9100
+    284.7902   1521.8900     36.4400     17.9100
+    284.9257   1521.8900     36.4400     17.9100
+    285.0612   1521.8900     36.4400     17.9100
+    285.1967   1521.8900     36.4400     17.9100
+    285.3322   1521.8900     36.4400     17.9100
+    285.4676   1521.8800     36.4400     17.9100
+    285.6031   1521.8800     36.4400     17.9000
+    285.7386   1521.8700     36.4400     17.9000
+    285.8741   1521.8600     36.4400     17.9000
+    286.0096   1521.8600     36.4400     17.8900
+    286.1451   1521.8500     36.4400     17.8900
+    286.2805   1521.8400     36.4400     17.8900
+    286.4160   1521.8400     36.4300     17.8900
+    286.5515   1521.8300     36.4300     17.8900
+    286.6870   1521.8300     36.4300     17.8800
+    286.8224   1521.8300     36.4300     17.8800
+    286.9579   1521.8300     36.4300     17.8800
+    287.0934   1521.8300     36.4300     17.8800
+    287.2289   1521.8400     36.4300     17.8800
+    287.3643   1521.8400     36.4300     17.8800
+    287.4998   1521.8400     36.4300     17.8800
+    287.6353   1521.8300     36.4300     17.8800
+    287.7707   1521.8300     36.4300     17.8800
+    287.9062   1521.8300     36.4300     17.8800
+    288.0417   1521.8300     36.4300     17.8800
+    288.1772   1521.8200     36.4300     17.8700
+    288.3126   1521.8200     36.4300     17.8700
+    288.4481   1521.8200     36.4300     17.8700
+    288.5835   1521.8200     36.4300     17.8700
+    288.7190   1521.8200     36.4300     17.8700
+    288.8545   1521.8200     36.4300     17.8700
+    288.9899   1521.8200     36.4300     17.8700
+    289.1254   1521.8200     36.4300     17.8600
+    289.2608   1521.8200     36.4300     17.8600
+    289.3963   1521.8200     36.4300     17.8600
+    289.5317   1521.8200     36.4300     17.8600
+    289.6672   1521.8300     36.4300     17.8600
+    289.8026   1521.8200     36.4300     17.8600
+    289.9381   1521.8200     36.4300     17.8600
+    290.0735   1521.8200     36.4300     17.8600
+    290.2090   1521.8200     36.4300     17.8600
+    290.3445   1521.8200     36.4300     17.8600
+    290.4799   1521.8100     36.4300     17.8600
+    290.6154   1521.8100     36.4300     17.8600
+    290.7508   1521.8000     36.4300     17.8500
+    290.8862   1521.8000     36.4300     17.8500
+    291.0217   1521.7900     36.4300     17.8500
+    291.1571   1521.7900     36.4300     17.8400
+    291.2926   1521.7800     36.4300     17.8400
+    291.4280   1521.7700     36.4300     17.8400
+    291.5635   1521.7600     36.4300     17.8400
+    291.6989   1521.7600     36.4300     17.8300
+    291.8343   1521.7500     36.4300     17.8300
+    291.9698   1521.7500     36.4300     17.8300
+    292.1052   1521.7500     36.4300     17.8300
+    292.2406   1521.7500     36.4300     17.8300
+    292.3761   1521.7500     36.4300     17.8200
+    292.5115   1521.7400     36.4300     17.8200
+    292.6469   1521.7400     36.4300     17.8200
+    292.7824   1521.7400     36.4300     17.8200
+    292.9178   1521.7300     36.4300     17.8200
+    293.0532   1521.7300     36.4300     17.8100
+    293.1887   1521.7200     36.4200     17.8100
+    293.3241   1521.7200     36.4300     17.8100
+    293.4595   1521.7100     36.4200     17.8100
+    293.5949   1521.7100     36.4200     17.8100
+    293.7304   1521.7000     36.4200     17.8000
+    293.8658   1521.7000     36.4200     17.8000
+    294.0012   1521.7000     36.4200     17.8000
+    294.1366   1521.7000     36.4200     17.8000
+    294.2721   1521.7000     36.4200     17.8000
+    294.4075   1521.7000     36.4200     17.8000
+    294.5429   1521.7000     36.4200     17.8000
+    294.6783   1521.7000     36.4200     17.8000
+    294.8138   1521.7000     36.4200     17.7900
+    294.9492   1521.7000     36.4200     17.7900
+    295.0846   1521.7000     36.4200     17.7900
+    295.2200   1521.6900     36.4200     17.7900
+    295.3554   1521.6900     36.4200     17.7900
+    295.4908   1521.6900     36.4200     17.7900
+    295.6262   1521.6900     36.4200     17.7900
+    295.7616   1521.6900     36.4200     17.7900
+    295.8970   1521.7000     36.4200     17.7900
+    296.0324   1521.7000     36.4200     17.7900
+    296.1678   1521.7000     36.4200     17.7900
+    296.3033   1521.7100     36.4200     17.7900
+    296.4387   1521.7100     36.4200     17.7900
+    296.5741   1521.7200     36.4300     17.7900
+    296.7095   1521.7200     36.4300     17.7900
+    296.8449   1521.7300     36.4300     17.7900
+    296.9803   1521.7300     36.4300     17.7900
+    297.1157   1521.7400     36.4300     17.7900
+    297.2511   1521.7400     36.4300     17.8000
+    297.3865   1521.7500     36.4300     17.8000
+    297.5219   1521.7600     36.4300     17.8000
+    297.6573   1521.7600     36.4300     17.8000
+    297.7927   1521.7600     36.4300     17.8000
+    297.9280   1521.7600     36.4300     17.8000
+    298.0634   1521.7600     36.4300     17.8000
+    298.1989   1521.7600     36.4300     17.8000
+    298.3342   1521.7600     36.4300     17.7900
+    298.4696   1521.7500     36.4300     17.7900
+    298.6050   1521.7500     36.4300     17.7900
+    298.7404   1521.7400     36.4300     17.7900
+    298.8758   1521.7300     36.4300     17.7800
+    299.0112   1521.7300     36.4300     17.7800
+    299.1465   1521.7200     36.4300     17.7800
+    299.2820   1521.7100     36.4300     17.7700
+    299.4173   1521.7100     36.4300     17.7700
+    299.5527   1521.7000     36.4200     17.7700
+    299.6881   1521.7000     36.4300     17.7700
+    299.8235   1521.7000     36.4300     17.7700
+    299.9588   1521.7000     36.4300     17.7600
+    300.0942   1521.7000     36.4300     17.7600
+    300.2296   1521.6900     36.4300     17.7600
+    300.3650   1521.6900     36.4300     17.7600
+    300.5004   1521.7000     36.4300     17.7600
+    300.6357   1521.7000     36.4300     17.7600
+    300.7711   1521.7000     36.4300     17.7600
+    300.9065   1521.7000     36.4300     17.7600
+    301.0418   1521.7000     36.4300     17.7600
+    301.1772   1521.7000     36.4200     17.7600
+    301.3126   1521.6900     36.4200     17.7600
+    301.4480   1521.6900     36.4300     17.7600
+    301.5833   1521.6900     36.4300     17.7500
+    301.7187   1521.6800     36.4200     17.7500
+    301.8541   1521.6800     36.4200     17.7500
+    301.9894   1521.6700     36.4200     17.7500
+    302.1248   1521.6700     36.4200     17.7500
+    302.2601   1521.6700     36.4200     17.7400
+    302.3955   1521.6700     36.4200     17.7400
+    302.5309   1521.6700     36.4200     17.7400
+    302.6662   1521.6600     36.4200     17.7400
+    302.8016   1521.6600     36.4200     17.7400
+    302.9370   1521.6600     36.4200     17.7400
+    303.0723   1521.6600     36.4200     17.7400
+    303.2076   1521.6600     36.4200     17.7400
+    303.3430   1521.6500     36.4200     17.7300
+    303.4784   1521.6500     36.4200     17.7300
+    303.6137   1521.6500     36.4200     17.7300
+    303.7491   1521.6500     36.4200     17.7300
+    303.8844   1521.6500     36.4200     17.7300
+    304.0198   1521.6500     36.4200     17.7300
+    304.1551   1521.6500     36.4200     17.7300
+    304.2904   1521.6500     36.4200     17.7300
+    304.4258   1521.6400     36.4200     17.7200
+    304.5612   1521.6400     36.4200     17.7200
+    304.6965   1521.6400     36.4200     17.7200
+    304.8318   1521.6400     36.4200     17.7200
+    304.9672   1521.6300     36.4200     17.7200
+    305.1025   1521.6300     36.4200     17.7200
+    305.2379   1521.6200     36.4200     17.7100
+    305.3732   1521.6200     36.4100     17.7100
+    305.5085   1521.6100     36.4200     17.7100
+    305.6439   1521.6100     36.4200     17.7100
+    305.7792   1521.6100     36.4200     17.7100
+    305.9146   1521.6100     36.4100     17.7100
+    306.0499   1521.6100     36.4100     17.7000
+    306.1852   1521.6000     36.4100     17.7000
+    306.3206   1521.6100     36.4200     17.7000
+    306.4559   1521.6000     36.4100     17.7000
+    306.5912   1521.6000     36.4100     17.7000
+    306.7265   1521.5900     36.4100     17.6900
+    306.8619   1521.5800     36.4100     17.6900
+    306.9972   1521.5800     36.4100     17.6900
+    307.1325   1521.5700     36.4100     17.6800
+    307.2679   1521.5600     36.4100     17.6800
+    307.4032   1521.5500     36.4100     17.6800
+    307.5385   1521.5400     36.4100     17.6700
+    307.6738   1521.5300     36.4100     17.6700
+    307.8091   1521.5300     36.4100     17.6700
+    307.9445   1521.5200     36.4100     17.6700
+    308.0798   1521.5200     36.4100     17.6600
+    308.2151   1521.5100     36.4100     17.6600
+    308.3504   1521.5100     36.4100     17.6600
+    308.4857   1521.5100     36.4100     17.6600
+    308.6211   1521.5100     36.4100     17.6600
+    308.7563   1521.5100     36.4100     17.6600
+    308.8917   1521.5100     36.4100     17.6600
+    309.0270   1521.5100     36.4100     17.6600
+    309.1623   1521.5100     36.4000     17.6600
+    309.2976   1521.5100     36.4000     17.6600
+    309.4329   1521.5100     36.4000     17.6600
+    309.5682   1521.5100     36.4000     17.6500
+    309.7036   1521.5100     36.4000     17.6500
+    309.8388   1521.5000     36.4000     17.6500
+    309.9742   1521.5000     36.4000     17.6500
+    310.1095   1521.5000     36.4000     17.6500
+    310.2448   1521.5000     36.4000     17.6500
+    310.3801   1521.5000     36.4000     17.6500
+    310.5154   1521.4900     36.4000     17.6500
+    310.6507   1521.4900     36.4000     17.6400
+    310.7860   1521.4900     36.4000     17.6400
+    310.9213   1521.4900     36.4000     17.6400
+    311.0565   1521.4900     36.4000     17.6400
+    311.1919   1521.4900     36.4000     17.6400
+    311.3271   1521.4900     36.4000     17.6400
+    311.4625   1521.4900     36.4000     17.6400
+    311.5977   1521.5000     36.4000     17.6400
+    311.7331   1521.5000     36.4000     17.6400
+    311.8683   1521.5000     36.4000     17.6400
+    312.0036   1521.5000     36.4000     17.6400
+    312.1389   1521.5000     36.4000     17.6400
+    312.2742   1521.4900     36.4000     17.6400
+    312.4095   1521.4900     36.4000     17.6300
+    312.5448   1521.4900     36.4000     17.6300
+    312.6801   1521.4900     36.4000     17.6300
+    312.8154   1521.4800     36.4000     17.6300
+    312.9507   1521.4800     36.4000     17.6300
+    313.0859   1521.4800     36.4000     17.6300
+    313.2212   1521.4700     36.4000     17.6200
+    313.3565   1521.4700     36.4000     17.6200
+    313.4918   1521.4700     36.4000     17.6200
+    313.6270   1521.4600     36.4000     17.6200
+    313.7623   1521.4600     36.4000     17.6200
+    313.8976   1521.4600     36.4000     17.6100
+    314.0329   1521.4500     36.4000     17.6100
+    314.1682   1521.4500     36.4000     17.6100
+    314.3034   1521.4400     36.4000     17.6100
+    314.4387   1521.4400     36.4000     17.6100
+    314.5740   1521.4300     36.4000     17.6000
+    314.7092   1521.4300     36.4000     17.6000
+    314.8445   1521.4200     36.4000     17.6000
+    314.9798   1521.4100     36.4000     17.5900
+    315.1151   1521.4100     36.4000     17.5900
+    315.2503   1521.4000     36.4000     17.5900
+    315.3856   1521.4000     36.4000     17.5900
+    315.5208   1521.3900     36.4000     17.5800
+    315.6561   1521.3800     36.4000     17.5800
+    315.7914   1521.3800     36.4000     17.5800
+    315.9266   1521.3700     36.3900     17.5800
+    316.0619   1521.3700     36.3900     17.5700
+    316.1972   1521.3700     36.3900     17.5700
+    316.3324   1521.3600     36.3900     17.5700
+    316.4677   1521.3600     36.3900     17.5700
+    316.6029   1521.3600     36.3900     17.5700
+    316.7382   1521.3600     36.3900     17.5700
+    316.8734   1521.3600     36.3900     17.5700
+    317.0087   1521.3600     36.3900     17.5700
+    317.1440   1521.3600     36.3900     17.5700
+    317.2792   1521.3600     36.3900     17.5700
+    317.4145   1521.3600     36.3900     17.5700
+    317.5497   1521.3600     36.3900     17.5600
+    317.6850   1521.3600     36.3900     17.5600
+    317.8202   1521.3600     36.3900     17.5600
+    317.9554   1521.3700     36.3900     17.5600
+    318.0907   1521.3700     36.3900     17.5600
+    318.2260   1521.3700     36.3900     17.5600
+    318.3612   1521.3700     36.3900     17.5600
+    318.4964   1521.3700     36.3900     17.5600
+    318.6317   1521.3800     36.3900     17.5600
+    318.7669   1521.3800     36.3900     17.5600
+    318.9021   1521.3800     36.3900     17.5600
+    319.0374   1521.3800     36.3900     17.5600
+    319.1726   1521.3800     36.3900     17.5600
+    319.3079   1521.3800     36.3900     17.5600
+    319.4431   1521.3800     36.3900     17.5600
+    319.5783   1521.3700     36.3900     17.5600
+    319.7136   1521.3700     36.3900     17.5600
+    319.8488   1521.3600     36.3900     17.5500
+    319.9840   1521.3600     36.3900     17.5500
+    320.1193   1521.3500     36.3900     17.5500
+    320.2545   1521.3400     36.3900     17.5500
+    320.3897   1521.3400     36.3900     17.5400
+    320.5250   1521.3400     36.3900     17.5400
+    320.6602   1521.3300     36.3900     17.5400
+    320.7954   1521.3300     36.3900     17.5400
+    320.9307   1521.3200     36.3900     17.5300
+    321.0659   1521.3200     36.3900     17.5300
+    321.2011   1521.3100     36.3800     17.5300
+    321.3363   1521.3100     36.3800     17.5300
+    321.4715   1521.3100     36.3800     17.5300
+    321.6068   1521.3100     36.3800     17.5300
+    321.7420   1521.3000     36.3800     17.5200
+    321.8772   1521.3000     36.3800     17.5200
+    322.0124   1521.3000     36.3800     17.5200
+    322.1476   1521.2900     36.3800     17.5200
+    322.2828   1521.2900     36.3800     17.5200
+    322.4181   1521.2800     36.3800     17.5200
+    322.5533   1521.2800     36.3800     17.5100
+    322.6885   1521.2700     36.3800     17.5100
+    322.8237   1521.2700     36.3800     17.5100
+    322.9589   1521.2600     36.3800     17.5000
+    323.0941   1521.2500     36.3800     17.5000
+    323.2293   1521.2500     36.3800     17.5000
+    323.3645   1521.2400     36.3800     17.5000
+    323.4997   1521.2400     36.3800     17.5000
+    323.6349   1521.2300     36.3800     17.4900
+    323.7701   1521.2300     36.3800     17.4900
+    323.9054   1521.2200     36.3800     17.4900
+    324.0406   1521.2200     36.3800     17.4800
+    324.1758   1521.2200     36.3800     17.4800
+    324.3110   1521.2100     36.3800     17.4800
+    324.4462   1521.2100     36.3800     17.4800
+    324.5813   1521.2000     36.3800     17.4800
+    324.7166   1521.1900     36.3700     17.4700
+    324.8517   1521.1900     36.3700     17.4700
+    324.9869   1521.1800     36.3700     17.4700
+    325.1221   1521.1700     36.3700     17.4700
+    325.2573   1521.1600     36.3700     17.4600
+    325.3925   1521.1500     36.3700     17.4600
+    325.5277   1521.1500     36.3700     17.4600
+    325.6629   1521.1400     36.3700     17.4500
+    325.7981   1521.1400     36.3700     17.4500
+    325.9333   1521.1400     36.3700     17.4500
+    326.0685   1521.1400     36.3700     17.4500
+    326.2037   1521.1400     36.3700     17.4500
+    326.3388   1521.1400     36.3700     17.4500
+    326.4740   1521.1500     36.3700     17.4500
+    326.6092   1521.1400     36.3700     17.4500
+    326.7444   1521.1400     36.3700     17.4500
+    326.8796   1521.1400     36.3700     17.4500
+    327.0147   1521.1400     36.3700     17.4500
+    327.1499   1521.1400     36.3700     17.4400
+    327.2851   1521.1400     36.3700     17.4400
+    327.4203   1521.1300     36.3700     17.4400
+    327.5555   1521.1300     36.3700     17.4400
+    327.6907   1521.1300     36.3700     17.4400
+    327.8258   1521.1300     36.3700     17.4400
+    327.9610   1521.1300     36.3700     17.4400
+    328.0962   1521.1300     36.3700     17.4400
+    328.2314   1521.1300     36.3700     17.4300
+    328.3665   1521.1200     36.3600     17.4300
+    328.5017   1521.1200     36.3700     17.4300
+    328.6369   1521.1300     36.3700     17.4300
+    328.7720   1521.1300     36.3700     17.4300
+    328.9072   1521.1300     36.3700     17.4300
+    329.0424   1521.1300     36.3600     17.4300
+    329.1775   1521.1300     36.3600     17.4300
+    329.3127   1521.1300     36.3600     17.4300
+    329.4478   1521.1300     36.3600     17.4300
+    329.5830   1521.1300     36.3700     17.4300
+    329.7182   1521.1300     36.3600     17.4300
+    329.8533   1521.1300     36.3600     17.4300
+    329.9885   1521.1300     36.3600     17.4300
+    330.1236   1521.1200     36.3600     17.4200
+    330.2588   1521.1200     36.3600     17.4200
+    330.3940   1521.1100     36.3600     17.4200
+    330.5291   1521.1100     36.3600     17.4200
+    330.6643   1521.1000     36.3600     17.4100
+    330.7994   1521.0900     36.3600     17.4100
+    330.9346   1521.0800     36.3600     17.4100
+    331.0697   1521.0600     36.3600     17.4000
+    331.2049   1521.0500     36.3600     17.4000
+    331.3400   1521.0400     36.3600     17.3900
+    331.4752   1521.0200     36.3600     17.3800
+    331.6103   1521.0100     36.3600     17.3800
+    331.7455   1520.9900     36.3600     17.3700
+    331.8806   1520.9800     36.3600     17.3700
+    332.0157   1520.9700     36.3600     17.3600
+    332.1509   1520.9500     36.3600     17.3600
+    332.2860   1520.9400     36.3600     17.3500
+    332.4212   1520.9300     36.3500     17.3500
+    332.5563   1520.9200     36.3500     17.3500
+    332.6915   1520.9200     36.3500     17.3500
+    332.8266   1520.9100     36.3500     17.3400
+    332.9617   1520.9100     36.3500     17.3400
+    333.0969   1520.9100     36.3500     17.3400
+    333.2320   1520.9100     36.3500     17.3400
+    333.3672   1520.9100     36.3500     17.3400
+    333.5023   1520.9100     36.3500     17.3400
+    333.6374   1520.9100     36.3500     17.3400
+    333.7725   1520.9100     36.3500     17.3400
+    333.9077   1520.9100     36.3500     17.3400
+    334.0428   1520.9200     36.3500     17.3400
+    334.1779   1520.9100     36.3500     17.3400
+    334.3130   1520.9200     36.3500     17.3400
+    334.4482   1520.9100     36.3500     17.3400
+    334.5833   1520.9200     36.3500     17.3400
+    334.7184   1520.9200     36.3500     17.3400
+    334.8535   1520.9200     36.3500     17.3300
+    334.9887   1520.9200     36.3500     17.3300
+    335.1238   1520.9200     36.3500     17.3300
+    335.2589   1520.9200     36.3500     17.3300
+    335.3940   1520.9200     36.3500     17.3300
+    335.5292   1520.9200     36.3500     17.3300
+    335.6643   1520.9200     36.3500     17.3300
+    335.7994   1520.9100     36.3500     17.3300
+    335.9345   1520.9000     36.3500     17.3200
+    336.0696   1520.9000     36.3500     17.3200
+    336.2047   1520.8900     36.3500     17.3200
+    336.3398   1520.8900     36.3500     17.3100
+    336.4750   1520.8700     36.3500     17.3100
+    336.6101   1520.8600     36.3500     17.3100
+    336.7452   1520.8600     36.3500     17.3000
+    336.8803   1520.8500     36.3500     17.3000
+    337.0154   1520.8400     36.3500     17.3000
+    337.1505   1520.8300     36.3500     17.2900
+    337.2856   1520.8300     36.3400     17.2900
+    337.4207   1520.8200     36.3400     17.2900
+    337.5558   1520.8100     36.3400     17.2900
+    337.6909   1520.8100     36.3400     17.2900
+    337.8260   1520.8100     36.3400     17.2800
+    337.9611   1520.8100     36.3400     17.2800
+    338.0962   1520.8100     36.3400     17.2800
+    338.2313   1520.8100     36.3400     17.2800
+    338.3664   1520.8100     36.3400     17.2800
+    338.5015   1520.8100     36.3400     17.2800
+    338.6366   1520.8200     36.3400     17.2800
+    338.7717   1520.8200     36.3400     17.2800
+    338.9068   1520.8200     36.3400     17.2800
+    339.0419   1520.8200     36.3400     17.2800
+    339.1770   1520.8100     36.3400     17.2800
+    339.3121   1520.8100     36.3400     17.2800
+    339.4471   1520.8100     36.3400     17.2800
+    339.5822   1520.8100     36.3400     17.2700
+    339.7173   1520.8100     36.3400     17.2700
+    339.8524   1520.8000     36.3400     17.2700
+    339.9875   1520.7900     36.3400     17.2700
+    340.1226   1520.7900     36.3400     17.2600
+    340.2577   1520.7800     36.3400     17.2600
+    340.3928   1520.7700     36.3400     17.2600
+    340.5278   1520.7600     36.3400     17.2500
+    340.6629   1520.7600     36.3300     17.2500
+    340.7980   1520.7500     36.3300     17.2500
+    340.9331   1520.7400     36.3300     17.2500
+    341.0682   1520.7400     36.3300     17.2500
+    341.2032   1520.7400     36.3300     17.2400
+    341.3383   1520.7300     36.3300     17.2400
+    341.4734   1520.7300     36.3300     17.2400
+    341.6085   1520.7300     36.3300     17.2400
+    341.7435   1520.7300     36.3300     17.2400
+    341.8786   1520.7200     36.3300     17.2400
+    342.0137   1520.7200     36.3300     17.2300
+    342.1487   1520.7200     36.3300     17.2300
+    342.2838   1520.7100     36.3300     17.2300
+    342.4189   1520.7100     36.3300     17.2300
+    342.5539   1520.7100     36.3300     17.2300
+    342.6890   1520.7000     36.3300     17.2300
+    342.8241   1520.7000     36.3300     17.2200
+    342.9591   1520.6900     36.3300     17.2200
+    343.0942   1520.6900     36.3300     17.2200
+    343.2293   1520.6900     36.3300     17.2200
+    343.3643   1520.6800     36.3300     17.2100
+    343.4994   1520.6800     36.3300     17.2100
+    343.6344   1520.6800     36.3300     17.2100
+    343.7695   1520.6800     36.3300     17.2100
+    343.9045   1520.6700     36.3300     17.2100
+    344.0396   1520.6700     36.3300     17.2100
+    344.1747   1520.6700     36.3300     17.2100
+    344.3097   1520.6600     36.3300     17.2000
+    344.4448   1520.6600     36.3200     17.2000
+    344.5798   1520.6600     36.3200     17.2000
+    344.7149   1520.6600     36.3200     17.2000
+    344.8499   1520.6600     36.3200     17.2000
+    344.9850   1520.6500     36.3200     17.2000
+    345.1200   1520.6500     36.3200     17.2000
+    345.2551   1520.6500     36.3200     17.2000
+    345.3901   1520.6500     36.3200     17.1900
+    345.5252   1520.6500     36.3200     17.1900
+    345.6602   1520.6400     36.3200     17.1900
+    345.7953   1520.6400     36.3200     17.1900
+    345.9303   1520.6400     36.3200     17.1900
+    346.0653   1520.6400     36.3200     17.1900
+    346.2004   1520.6400     36.3200     17.1900
+    346.3354   1520.6500     36.3200     17.1900
+    346.4705   1520.6500     36.3200     17.1900
+    346.6055   1520.6500     36.3200     17.1900
+    346.7405   1520.6500     36.3200     17.1900
+    346.8756   1520.6600     36.3200     17.1900
+    347.0106   1520.6600     36.3200     17.1900
+    347.1456   1520.6600     36.3200     17.1900
+    347.2806   1520.6600     36.3200     17.1900
+    347.4157   1520.6600     36.3200     17.1900
+    347.5507   1520.6600     36.3200     17.1800
+    347.6858   1520.6500     36.3200     17.1800
+    347.8208   1520.6400     36.3200     17.1800
+    347.9558   1520.6300     36.3200     17.1700
+    348.0909   1520.6200     36.3200     17.1700
+    348.2258   1520.6100     36.3200     17.1700
+    348.3609   1520.6000     36.3200     17.1600
+    348.4959   1520.5900     36.3200     17.1600
+    348.6309   1520.5800     36.3200     17.1500
+    348.7660   1520.5700     36.3200     17.1500
+    348.9010   1520.5600     36.3200     17.1500
+    349.0360   1520.5600     36.3200     17.1500
+    349.1710   1520.5500     36.3200     17.1400
+    349.3060   1520.5500     36.3100     17.1400
+    349.4410   1520.5400     36.3100     17.1400
+    349.5760   1520.5400     36.3200     17.1400
+    349.7111   1520.5400     36.3100     17.1400
+    349.8461   1520.5400     36.3100     17.1400
+    349.9811   1520.5400     36.3100     17.1300
+    350.1161   1520.5300     36.3200     17.1300
+    350.2511   1520.5300     36.3100     17.1300
+    350.3861   1520.5300     36.3100     17.1300
+    350.5211   1520.5300     36.3100     17.1300
+    350.6561   1520.5200     36.3100     17.1300
+    350.7911   1520.5200     36.3100     17.1200
+    350.9261   1520.5100     36.3100     17.1200
+    351.0612   1520.5000     36.3100     17.1200
+    351.1962   1520.5000     36.3100     17.1200
+    351.3312   1520.4900     36.3100     17.1100
+    351.4662   1520.4900     36.3100     17.1100
+    351.6012   1520.4800     36.3100     17.1100
+    351.7361   1520.4700     36.3100     17.1000
+    351.8712   1520.4600     36.3100     17.1000
+    352.0062   1520.4500     36.3100     17.1000
+    352.1411   1520.4400     36.3100     17.0900
+    352.2762   1520.4300     36.3100     17.0900
+    352.4112   1520.4200     36.3100     17.0800
+    352.5461   1520.4100     36.3100     17.0800
+    352.6811   1520.4400     36.3100     17.0900
+    352.8161   1520.4700     36.3000     17.1000
+    352.9511   1520.4900     36.2900     17.1100
+    353.0861   1520.4700     36.2700     17.1100
+    353.2211   1520.4500     36.2700     17.1100
+    353.3561   1520.4500     36.2700     17.1000
+    353.4911   1520.4400     36.2700     17.1000
+    353.6261   1520.4400     36.2700     17.1000
+    353.7610   1520.4300     36.2600     17.1000
+    353.8960   1520.3800     36.2600     17.0800
+    354.0310   1520.3300     36.2700     17.0600
+    354.1660   1520.3000     36.2800     17.0400
+    354.3010   1520.3100     36.3000     17.0400
+    354.4359   1520.3200     36.3000     17.0400
+    354.5709   1520.3100     36.3000     17.0400
+    354.7059   1520.3100     36.3000     17.0400
+    354.8409   1520.3100     36.2900     17.0400
+    354.9758   1520.3100     36.3000     17.0400
+    355.1108   1520.3100     36.3000     17.0400
+    355.2458   1520.3100     36.3000     17.0400
+    355.3808   1520.3100     36.3000     17.0400
+    355.5157   1520.3100     36.3000     17.0300
+    355.6507   1520.3100     36.2900     17.0300
+    355.7857   1520.3100     36.2900     17.0300
+    355.9207   1520.3000     36.2900     17.0300
+    356.0556   1520.3000     36.2900     17.0300
+    356.1906   1520.3000     36.2900     17.0300
+    356.3255   1520.2900     36.2900     17.0300
+    356.4605   1520.2900     36.2900     17.0200
+    356.5955   1520.2800     36.2900     17.0200
+    356.7304   1520.2700     36.2900     17.0200
+    356.8654   1520.2700     36.2900     17.0100
+    357.0004   1520.2600     36.2900     17.0100
+    357.1353   1520.2500     36.2900     17.0100
+    357.2703   1520.2500     36.2900     17.0100
+    357.4052   1520.2500     36.2900     17.0000
+    357.5402   1520.2400     36.2900     17.0000
+    357.6751   1520.2400     36.2900     17.0000
+    357.8101   1520.2400     36.2900     17.0000
+    357.9451   1520.2400     36.2900     17.0000
+    358.0800   1520.2400     36.2900     17.0000
+    358.2150   1520.2400     36.2900     17.0000
+    358.3499   1520.2400     36.2900     17.0000
+    358.4849   1520.2400     36.2900     17.0000
+    358.6198   1520.2400     36.2900     17.0000
+    358.7548   1520.2400     36.2900     16.9900
+    358.8897   1520.2400     36.2900     16.9900
+    359.0247   1520.2400     36.2900     16.9900
+    359.1596   1520.2300     36.2900     16.9900
+    359.2946   1520.2300     36.2900     16.9900
+    359.4295   1520.2200     36.2900     16.9900
+    359.5644   1520.2200     36.2900     16.9800
+    359.6994   1520.2200     36.2900     16.9800
+    359.8343   1520.2100     36.2900     16.9800
+    359.9692   1520.2100     36.2900     16.9800
+    360.1042   1520.2000     36.2900     16.9800
+    360.2391   1520.2000     36.2900     16.9700
+    360.3741   1520.1900     36.2900     16.9700
+    360.5090   1520.1900     36.2900     16.9700
+    360.6439   1520.1800     36.2900     16.9700
+    360.7788   1520.1700     36.2900     16.9600
+    360.9138   1520.1600     36.2900     16.9600
+    361.0487   1520.1600     36.2900     16.9600
+    361.1837   1520.1500     36.2900     16.9500
+    361.3186   1520.1400     36.2800     16.9500
+    361.4535   1520.1300     36.2800     16.9500
+    361.5884   1520.1200     36.2800     16.9400
+    361.7234   1520.1100     36.2800     16.9400
+    361.8583   1520.1000     36.2800     16.9400
+    361.9932   1520.1000     36.2800     16.9300
+    362.1281   1520.1000     36.2800     16.9300
+    362.2631   1520.0900     36.2800     16.9300
+    362.3980   1520.0900     36.2800     16.9300
+    362.5329   1520.0900     36.2800     16.9300
+    362.6678   1520.0800     36.2800     16.9200
+    362.8027   1520.0700     36.2800     16.9200
+    362.9377   1520.0700     36.2800     16.9200
+    363.0726   1520.0600     36.2800     16.9100
+    363.2075   1520.0500     36.2800     16.9100
+    363.3424   1520.0400     36.2800     16.9100
+    363.4773   1520.0300     36.2700     16.9000
+    363.6122   1520.0200     36.2700     16.9000
+    363.7471   1520.0100     36.2700     16.9000
+    363.8820   1520.0000     36.2700     16.8900
+    364.0169   1519.9800     36.2700     16.8900
+    364.1519   1519.9700     36.2700     16.8800
+    364.2868   1519.9600     36.2700     16.8800
+    364.4217   1519.9400     36.2700     16.8700
+    364.5566   1519.9300     36.2700     16.8700
+    364.6915   1519.9200     36.2700     16.8600
+    364.8264   1519.9000     36.2700     16.8600
+    364.9613   1519.8900     36.2700     16.8500
+    365.0962   1519.8800     36.2600     16.8500
+    365.2311   1519.8700     36.2600     16.8500
+    365.3660   1519.8600     36.2600     16.8400
+    365.5009   1519.8500     36.2600     16.8400
+    365.6358   1456.8000     36.2600      0.0000
+    366.8498   1478.0800      0.0000     16.8000
+    366.9847   1478.0700      0.0000     16.7900
+    367.1196   1478.0700      0.0100     16.7900
+    367.2545   1519.7000     36.2600     16.7800
+    367.3893   1519.6900     36.2500     16.7800
+    367.5242   1519.6700     36.2500     16.7700
+    367.6591   1519.6600     36.2500     16.7700
+    367.7940   1519.6400     36.2500     16.7600
+    367.9289   1519.6300     36.2500     16.7600
+    368.0638   1519.6100     36.2500     16.7500
+    368.1986   1519.6000     36.2500     16.7500
+    368.3335   1519.5800     36.2500     16.7400
+    368.4684   1456.8200     36.2500      0.0000
+    369.6822   1477.8300      0.0000     16.7100
+    369.8171   1477.8300      0.0000     16.7100
+    369.9520   1477.8400      0.0100     16.7100
+    370.0868   1519.5000     36.2400     16.7000
+    370.2217   1519.4900     36.2400     16.7000
+    370.3566   1519.4900     36.2400     16.7000
+    370.4914   1519.4900     36.2400     16.7000
+    370.6263   1519.4900     36.2400     16.7000
+    370.7611   1519.4800     36.2400     16.7000
+    370.8960   1519.4800     36.2400     16.6900
+    371.0309   1519.4700     36.2400     16.6900
+    371.1657   1519.4700     36.2400     16.6900
+    371.3006   1519.4600     36.2400     16.6900
+    371.4354   1519.4600     36.2400     16.6900
+    371.5703   1519.4600     36.2400     16.6900
+    371.7051   1519.4600     36.2400     16.6800
+    371.8400   1519.4600     36.2300     16.6800
+    371.9748   1519.4600     36.2300     16.6800
+    372.1097   1519.4600     36.2400     16.6800
+    372.2445   1519.4600     36.2300     16.6800
+    372.3794   1519.4600     36.2300     16.6800
+    372.5142   1519.4600     36.2300     16.6800
+    372.6491   1519.4600     36.2300     16.6800
+    372.7839   1519.4600     36.2300     16.6800
+    372.9187   1519.4700     36.2300     16.6800
+    373.0536   1519.4700     36.2300     16.6800
+    373.1884   1519.4700     36.2300     16.6800
+    373.3233   1519.4700     36.2300     16.6800
+    373.4581   1519.4700     36.2300     16.6800
+    373.5930   1519.4700     36.2300     16.6800
+    373.7278   1519.4600     36.2300     16.6800
+    373.8626   1519.4600     36.2400     16.6700
+    373.9975   1519.4500     36.2300     16.6700
+    374.1323   1519.4300     36.2300     16.6600
+    374.2671   1519.4200     36.2300     16.6600
+    374.4020   1519.4000     36.2300     16.6500
+    374.5368   1519.3800     36.2300     16.6500
+    374.6716   1519.3700     36.2300     16.6400
+    374.8065   1519.3500     36.2300     16.6300
+    374.9413   1456.9000     36.2300      0.0000
+    376.1547   1477.5700      0.0000     16.6000
+    376.2895   1477.5600      0.0000     16.6000
+    376.4243   1477.5700      0.0100     16.5900
+    376.5591   1519.2400     36.2200     16.5900
+    376.6940   1519.2300     36.2200     16.5900
+    376.8288   1519.2300     36.2100     16.5900
+    376.9636   1519.2300     36.2100     16.5900
+    377.0984   1519.2300     36.2100     16.5900
+    377.2332   1519.2300     36.2100     16.5900
+    377.3680   1519.2400     36.2100     16.5900
+    377.5028   1519.2400     36.2100     16.5900
+    377.6376   1519.2400     36.2100     16.5900
+    377.7725   1519.2500     36.2200     16.5900
+    377.9073   1519.2600     36.2200     16.5900
+    378.0421   1519.2700     36.2200     16.5900
+    378.1769   1519.2700     36.2200     16.5900
+    378.3117   1519.2800     36.2200     16.6000
+    378.4465   1519.2800     36.2200     16.6000
+    378.5813   1519.2900     36.2200     16.6000
+    378.7161   1519.2900     36.2200     16.6000
+    378.8509   1519.2900     36.2200     16.6000
+    378.9857   1519.2900     36.2200     16.6000
+    379.1205   1519.2900     36.2200     16.6000
+    379.2553   1519.2900     36.2200     16.6000
+    379.3901   1519.2900     36.2200     16.5900
+    379.5249   1519.2900     36.2200     16.5900
+    379.6597   1519.2900     36.2200     16.5900
+    379.7945   1519.2900     36.2200     16.5900
+    379.9293   1519.2900     36.2200     16.5900
+    380.0641   1519.2900     36.2200     16.5900
+    380.1988   1519.2900     36.2200     16.5900
+    380.3336   1519.2800     36.2200     16.5800
+    380.4684   1519.2700     36.2200     16.5800
+    380.6032   1519.2700     36.2200     16.5800
+    380.7380   1519.2600     36.2200     16.5800
+    380.8728   1519.2600     36.2200     16.5800
+    381.0075   1519.2500     36.2100     16.5700
+    381.1423   1519.2500     36.2200     16.5700
+    381.2771   1519.2400     36.2100     16.5700
+    381.4119   1519.2300     36.2100     16.5700
+    381.5467   1519.2300     36.2100     16.5600
+    381.6815   1519.2200     36.2100     16.5600
+    381.8163   1519.2100     36.2100     16.5600
+    381.9510   1519.2000     36.2100     16.5500
+    382.0858   1519.1900     36.2100     16.5500
+    382.2206   1519.1800     36.2100     16.5500
+    382.3553   1519.1700     36.2100     16.5400
+    382.4901   1519.1600     36.2100     16.5400
+    382.6249   1519.1500     36.2100     16.5300
+    382.7597   1519.1400     36.2100     16.5300
+    382.8944   1519.1400     36.2100     16.5300
+    383.0292   1519.1400     36.2100     16.5300
+    383.1640   1519.1300     36.2100     16.5300
+    383.2987   1519.1300     36.2100     16.5200
+    383.4335   1519.1300     36.2100     16.5200
+    383.5683   1519.1300     36.2100     16.5200
+    383.7030   1519.1200     36.2100     16.5200
+    383.8378   1519.1200     36.2100     16.5200
+    383.9726   1519.1200     36.2100     16.5200
+    384.1073   1519.1100     36.2000     16.5100
+    384.2421   1519.1000     36.2000     16.5100
+    384.3768   1519.0900     36.2000     16.5000
+    384.5116   1519.0700     36.2000     16.5000
+    384.6464   1519.0600     36.2000     16.5000
+    384.7811   1519.0500     36.2000     16.4900
+    384.9159   1519.0400     36.2000     16.4900
+    385.0506   1519.0300     36.2000     16.4800
+    385.1854   1519.0200     36.2000     16.4800
+    385.3201   1519.0000     36.2000     16.4700
+    385.4549   1518.9900     36.2000     16.4700
+    385.5896   1518.9800     36.2000     16.4700
+    385.7244   1518.9700     36.2000     16.4600
+    385.8591   1518.9700     36.1900     16.4600
+    385.9939   1518.9600     36.1900     16.4600
+    386.1286   1518.9500     36.1900     16.4600
+    386.2634   1518.9500     36.1900     16.4500
+    386.3981   1518.9400     36.1900     16.4500
+    386.5328   1518.9300     36.1900     16.4500
+    386.6676   1518.9200     36.1900     16.4400
+    386.8023   1518.9100     36.1900     16.4400
+    386.9371   1518.9000     36.1900     16.4300
+    387.0718   1518.8800     36.1900     16.4300
+    387.2065   1518.8700     36.1900     16.4200
+    387.3413   1518.8500     36.1900     16.4200
+    387.4760   1518.8400     36.1900     16.4100
+    387.6107   1518.8200     36.1900     16.4100
+    387.7455   1518.8100     36.1800     16.4000
+    387.8802   1518.8000     36.1800     16.4000
+    388.0150   1518.8000     36.1800     16.4000
+    388.1497   1518.7900     36.1800     16.3900
+    388.2844   1518.7900     36.1800     16.3900
+    388.4192   1518.7800     36.1800     16.3900
+    388.5539   1518.7800     36.1800     16.3900
+    388.6886   1518.7800     36.1800     16.3900
+    388.8233   1518.7800     36.1800     16.3900
+    388.9581   1518.7700     36.1800     16.3800
+    389.0928   1518.7700     36.1800     16.3800
+    389.2275   1518.7700     36.1800     16.3800
+    389.3622   1518.7700     36.1800     16.3800
+    389.4969   1518.7600     36.1800     16.3800
+    389.6317   1518.7600     36.1800     16.3800
+    389.7664   1518.7600     36.1800     16.3800
+    389.9011   1518.7600     36.1800     16.3700
+    390.0358   1518.7600     36.1800     16.3700
+    390.1705   1518.7500     36.1800     16.3700
+    390.3053   1518.7600     36.1800     16.3700
+    390.4400   1518.7500     36.1800     16.3700
+    390.5747   1518.7500     36.1800     16.3700
+    390.7094   1518.7500     36.1800     16.3700
+    390.8441   1518.7500     36.1800     16.3700
+    390.9788   1518.7500     36.1800     16.3700
+    391.1135   1518.7500     36.1800     16.3700
+    391.2482   1518.7500     36.1800     16.3700
+    391.3830   1518.7500     36.1800     16.3700
+    391.5177   1518.7400     36.1800     16.3600
+    391.6524   1518.7400     36.1800     16.3600
+    391.7871   1518.7400     36.1800     16.3600
+    391.9218   1518.7400     36.1700     16.3600
+    392.0565   1518.7400     36.1700     16.3600
+    392.1912   1518.7300     36.1700     16.3500
+    392.3259   1518.7200     36.1700     16.3500
+    392.4606   1518.7100     36.1800     16.3500
+    392.5953   1518.7000     36.1800     16.3400
+    392.7300   1518.7000     36.1800     16.3400
+    392.8647   1518.6900     36.1800     16.3400
+    392.9994   1518.6700     36.1800     16.3300
+    393.1341   1518.6600     36.1800     16.3300
+    393.2687   1518.6500     36.1700     16.3200
+    393.4034   1518.6500     36.1700     16.3200
+    393.5381   1518.6400     36.1700     16.3200
+    393.6728   1518.6300     36.1700     16.3200
+    393.8075   1518.6200     36.1700     16.3100
+    393.9422   1518.6100     36.1700     16.3100
+    394.0769   1518.6000     36.1700     16.3000
+    394.2116   1518.5800     36.1700     16.3000
+    394.3463   1518.5500     36.1700     16.2900
+    394.4810   1518.5300     36.1700     16.2800
+    394.6156   1518.5000     36.1600     16.2700
+    394.7503   1518.4800     36.1600     16.2600
+    394.8850   1518.4500     36.1600     16.2500
+    395.0197   1518.4200     36.1600     16.2500
+    395.1544   1518.4000     36.1600     16.2400
+    395.2891   1518.3700     36.1500     16.2300
+    395.4237   1518.3500     36.1500     16.2200
+    395.5584   1518.3200     36.1500     16.2100
+    395.6931   1518.3100     36.1500     16.2100
+    395.8278   1518.2800     36.1500     16.2000
+    395.9624   1518.2600     36.1400     16.1900
+    396.0971   1518.2500     36.1400     16.1900
+    396.2318   1518.2400     36.1400     16.1800
+    396.3665   1518.2300     36.1400     16.1800
+    396.5011   1518.2100     36.1400     16.1800
+    396.6358   1518.2100     36.1400     16.1700
+    396.7704   1518.2000     36.1400     16.1700
+    396.9051   1518.1900     36.1400     16.1700
+    397.0398   1518.1900     36.1400     16.1700
+    397.1744   1457.1500     36.1400      0.0000
+    398.3864   1476.4100      0.0000     16.1500
+    398.5211   1476.4000      0.0000     16.1500
+    398.6557   1476.4100      0.0100     16.1500
+    398.7903   1457.1700     36.1300      0.0000
+    400.0022   1476.3900      0.0000     16.1400
+    400.1368   1476.3900      0.0000     16.1400
+    400.2715   1476.4000      0.0100     16.1300
+    400.4061   1518.1400     36.1300     16.1300
+    400.5407   1518.1400     36.1300     16.1300
+    400.6754   1518.1300     36.1300     16.1300
+    400.8100   1518.1300     36.1300     16.1300
+    400.9446   1518.1200     36.1300     16.1300
+    401.0793   1518.1200     36.1300     16.1200
+    401.2139   1518.1100     36.1300     16.1200
+    401.3486   1518.1100     36.1300     16.1200
+    401.4832   1518.1000     36.1300     16.1100
+    401.6178   1518.0900     36.1300     16.1100
+    401.7525   1518.0800     36.1300     16.1100
+    401.8871   1518.0700     36.1300     16.1000
+    402.0217   1518.0600     36.1300     16.1000
+    402.1563   1518.0500     36.1300     16.1000
+    402.2910   1518.0400     36.1300     16.0900
+    402.4256   1518.0300     36.1300     16.0900
+    402.5602   1518.0200     36.1300     16.0800
+    402.6949   1518.0000     36.1300     16.0800
+    402.8295   1517.9900     36.1200     16.0700
+    402.9641   1517.9700     36.1200     16.0700
+    403.0987   1517.9500     36.1200     16.0600
+    403.2333   1517.9200     36.1200     16.0500
+    403.3680   1517.9000     36.1200     16.0400
+    403.5026   1517.8700     36.1200     16.0300
+    403.6372   1517.8500     36.1200     16.0300
+    403.7718   1517.8200     36.1100     16.0200
+    403.9064   1517.8000     36.1100     16.0100
+    404.0410   1517.7700     36.1100     16.0000
+    404.1757   1517.7500     36.1100     15.9900
+    404.3103   1517.7300     36.1100     15.9900
+    404.4449   1517.7100     36.1000     15.9800
+    404.5795   1517.6900     36.1000     15.9700
+    404.7141   1517.6700     36.1000     15.9700
+    404.8487   1517.6600     36.1000     15.9700
+    404.9833   1517.6500     36.1000     15.9600
+    405.1179   1517.6400     36.1000     15.9600
+    405.2525   1517.6300     36.1000     15.9500
+    405.3871   1517.6200     36.1000     15.9500
+    405.5217   1517.6100     36.1000     15.9500
+    405.6563   1517.6000     36.1000     15.9400
+    405.7909   1517.5900     36.1000     15.9400
+    405.9255   1517.5800     36.1000     15.9300
+    406.0602   1517.5700     36.0900     15.9300
+    406.1947   1517.5600     36.0900     15.9300
+    406.3293   1457.2400     36.0900      0.0000
+    407.8098   1475.7100      0.0000     15.9000
+    407.9444   1475.7100      0.0000     15.9000
+    408.0790   1475.7200      0.0100     15.9000
+    408.2136   1517.5000     36.0900     15.9000
+    408.3482   1517.4900     36.0900     15.9000
+    408.4828   1517.4900     36.0900     15.8900
+    408.6173   1517.4800     36.0900     15.8900
+    408.7519   1517.4800     36.0900     15.8900
+    408.8865   1517.4800     36.0900     15.8900
+    409.0211   1517.4700     36.0900     15.8900
+    409.1556   1517.4600     36.0900     15.8800
+    409.2902   1517.4500     36.0900     15.8800
+    409.4248   1517.4300     36.0900     15.8700
+    409.5594   1517.4200     36.0900     15.8700
+    409.6940   1517.4000     36.0800     15.8600
+    409.8286   1517.3900     36.0800     15.8600
+    409.9631   1517.3800     36.0800     15.8500
+    410.0977   1517.3600     36.0800     15.8500
+    410.2322   1517.3500     36.0800     15.8400
+    410.3668   1517.3400     36.0800     15.8400
+    410.5014   1517.3300     36.0800     15.8400
+    410.6360   1517.3200     36.0800     15.8300
+    410.7705   1517.3200     36.0800     15.8300
+    410.9051   1517.3200     36.0800     15.8300
+    411.0396   1517.3100     36.0800     15.8300
+    411.1742   1517.3100     36.0800     15.8300
+    411.3087   1517.3100     36.0800     15.8200
+    411.4433   1517.3000     36.0800     15.8200
+    411.5779   1517.2900     36.0800     15.8200
+    411.7124   1517.2800     36.0800     15.8100
+    411.8470   1517.2600     36.0800     15.8100
+    411.9815   1517.2400     36.0800     15.8000
+    412.1161   1457.3100     36.0800      0.0000
+    413.3270   1475.1500      0.0000     15.7100
+    413.4616   1475.1300      0.0000     15.7100
+    413.5961   1475.1300      0.0100     15.7000
+    413.7307   1516.9200     36.0500     15.7000
+    413.8652   1516.9100     36.0500     15.6900
+    413.9998   1516.9000     36.0500     15.6900
+    414.1343   1516.9000     36.0500     15.6900
+    414.2689   1516.8900     36.0500     15.6800
+    414.4034   1516.8900     36.0500     15.6800
+    414.5379   1516.8900     36.0500     15.6800
+    414.6725   1516.8900     36.0500     15.6800
+    414.8070   1516.8900     36.0500     15.6800
+    414.9415   1516.8900     36.0500     15.6800
+    415.0760   1516.8800     36.0500     15.6800
+    415.2106   1516.8800     36.0500     15.6800
+    415.3451   1516.8800     36.0500     15.6700
+    415.4796   1516.8800     36.0500     15.6700
+    415.6142   1516.8800     36.0500     15.6700
+    415.7487   1516.8700     36.0500     15.6700
+    415.8832   1516.8600     36.0500     15.6700
+    416.0178   1516.8600     36.0500     15.6600
+    416.1523   1516.8500     36.0500     15.6600
+    416.2868   1516.8500     36.0500     15.6600
+    416.4213   1516.8300     36.0400     15.6600
+    416.5559   1516.8200     36.0500     15.6500
+    416.6904   1516.8000     36.0500     15.6400
+    416.8249   1516.7800     36.0500     15.6400
+    416.9594   1516.7600     36.0500     15.6300
+    417.0939   1516.7400     36.0500     15.6200
+    417.2285   1516.7100     36.0500     15.6100
+    417.3630   1516.6900     36.0500     15.6000
+    417.4975   1516.6600     36.0500     15.5900
+    417.6320   1516.6400     36.0500     15.5900
+    417.7665   1516.6200     36.0400     15.5800
+    417.9010   1516.6000     36.0400     15.5700
+    418.0355   1516.5800     36.0400     15.5700
+    418.1700   1516.5700     36.0400     15.5700
+    418.3045   1516.5700     36.0400     15.5600
+    418.4391   1516.5500     36.0400     15.5600
+    418.5736   1516.5400     36.0400     15.5500
+    418.7081   1516.5400     36.0400     15.5500
+    418.8426   1516.5300     36.0300     15.5500
+    418.9771   1516.5200     36.0300     15.5500
+    419.1116   1516.5100     36.0300     15.5400
+    419.2461   1516.5100     36.0300     15.5400
+    419.3806   1516.5000     36.0300     15.5400
+    419.5151   1516.5000     36.0300     15.5400
+    419.6496   1516.5000     36.0300     15.5300
+    419.7841   1457.3800     36.0300      0.0000
+    420.9945   1474.5600      0.0000     15.5000
+    421.1290   1474.5400      0.0000     15.5000
+    421.2635   1474.5500      0.0100     15.5000
+    421.3980   1516.3900     36.0300     15.4900
+    421.5325   1516.3800     36.0300     15.4900
+    421.6670   1516.3700     36.0300     15.4900
+    421.8015   1457.4000     36.0300      0.0000
+    423.0117   1474.3100      0.0000     15.4300
+    423.1462   1474.3000      0.0000     15.4200
+    423.2807   1474.2900      0.0100     15.4200
+    423.4152   1516.1500     36.0200     15.4100
+    423.5496   1516.1400     36.0100     15.4100
+    423.6841   1516.1300     36.0100     15.4000
+    423.8186   1516.1200     36.0100     15.4000
+    423.9530   1516.1200     36.0100     15.4000
+    424.0875   1516.1100     36.0100     15.4000
+    424.2220   1516.1100     36.0100     15.3900
+    424.3564   1516.1000     36.0100     15.3900
+    424.4909   1516.1000     36.0100     15.3900
+    424.6254   1516.1000     36.0100     15.3900
+    424.7598   1516.0900     36.0100     15.3900
+    424.8943   1516.0900     36.0100     15.3800
+    425.0287   1516.0900     36.0100     15.3800
+    425.1632   1516.0800     36.0100     15.3800
+    425.2977   1516.0700     36.0100     15.3800
+    425.4321   1516.0600     36.0100     15.3700
+    425.5666   1516.0600     36.0100     15.3700
+    425.7010   1516.0500     36.0100     15.3700
+    425.8355   1516.0400     36.0100     15.3700
+    425.9699   1516.0400     36.0100     15.3600
+    426.1044   1516.0300     36.0100     15.3600
+    426.2388   1516.0300     36.0100     15.3600
+    426.3733   1516.0300     36.0100     15.3600
+    426.5078   1516.0200     36.0100     15.3600
+    426.6422   1516.0200     36.0100     15.3600
+    426.7766   1516.0200     36.0100     15.3500
+    426.9111   1516.0100     36.0100     15.3500
+    427.0455   1516.0100     36.0100     15.3500
+    427.1800   1516.0100     36.0100     15.3500
+    427.3144   1516.0100     36.0000     15.3500
+    427.4489   1516.0000     36.0000     15.3500
+    427.5833   1516.0000     36.0000     15.3400
+    427.7177   1516.0000     36.0000     15.3400
+    427.8522   1515.9900     36.0000     15.3400
+    427.9866   1515.9900     36.0000     15.3400
+    428.1210   1515.9900     36.0000     15.3400
+    428.2555   1515.9900     36.0000     15.3400
+    428.3899   1515.9800     36.0000     15.3400
+    428.5244   1515.9800     36.0000     15.3300
+    428.6588   1515.9800     36.0000     15.3300
+    428.7932   1515.9800     36.0000     15.3300
+    428.9277   1515.9700     36.0000     15.3300
+    429.0621   1515.9700     36.0000     15.3300
+    429.1965   1515.9700     36.0000     15.3300
+    429.3309   1515.9700     36.0000     15.3300
+    429.4654   1457.4900     36.0000      0.0000
+    430.6752   1473.8700      0.0000     15.2600
+    430.8096   1473.8400      0.0000     15.2500
+    430.9440   1473.8100      0.0100     15.2400
+    431.0784   1515.6900     35.9900     15.2300
+    431.2128   1515.6700     35.9900     15.2300
+    431.3472   1515.6500     35.9900     15.2200
+    431.4816   1515.6300     35.9800     15.2100
+    431.6161   1515.6200     35.9800     15.2100
+    431.7505   1515.6100     35.9800     15.2100
+    431.8849   1515.6000     35.9800     15.2000
+    432.0193   1515.5900     35.9800     15.2000
+    432.1537   1515.5800     35.9800     15.1900
+    432.2881   1515.7900     36.1800     15.1900
+    432.4225   1515.7800     36.1700     15.1900
+    432.5569   1515.7700     36.1700     15.1800
+    432.6913   1515.7600     36.1700     15.1800
+    432.8257   1515.7500     36.1700     15.1700
+    432.9601   1515.9700     36.3600     15.1700
+    433.0945   1515.9600     36.3700     15.1700
+    433.2289   1515.9500     36.3600     15.1600
+    433.3633   1515.9400     36.3700     15.1600
+    433.4977   1515.7100     36.1700     15.1600
+    433.6321   1515.7000     36.1700     15.1600
+    433.7665   1515.7000     36.1700     15.1500
+    433.9009   1515.6900     36.1700     15.1500
+    434.0353   1515.6900     36.1700     15.1500
+    434.1697   1515.4600     35.9700     15.1500
+    434.3041   1515.4500     35.9700     15.1500
+    434.4385   1515.4500     35.9700     15.1500
+    434.5728   1515.4500     35.9700     15.1400
+    434.7072   1515.4400     35.9700     15.1400
+    434.8416   1515.4300     35.9700     15.1400
+    434.9760   1515.4300     35.9700     15.1300
+    435.1104   1515.4200     35.9700     15.1300
+    435.2448   1515.4100     35.9700     15.1300
+    435.3792   1515.4000     35.9700     15.1200
+    435.5135   1515.3900     35.9700     15.1200
+    435.6479   1515.3800     35.9700     15.1200
+    435.7823   1515.3700     35.9700     15.1100
+    435.9167   1515.3600     35.9700     15.1100
+    436.0511   1515.3500     35.9700     15.1100
+    436.1855   1515.5700     36.1600     15.1000
+    436.3198   1515.7900     36.3600     15.1000
+    436.4542   1515.7800     36.3600     15.1000
+    436.5886   1515.7700     36.3600     15.0900
+    436.7229   1515.7600     36.3600     15.0900
+    436.8573   1515.7600     36.3600     15.0900
+    436.9917   1515.7500     36.3600     15.0800
+    437.1261   1515.7400     36.3600     15.0800
+    437.2604   1515.7400     36.3600     15.0800
+    437.3948   1515.5100     36.1600     15.0800
+    437.5292   1515.2800     35.9700     15.0800
+    437.6635   1515.2800     35.9600     15.0700
+    437.7979   1515.5000     36.1600     15.0700
+    437.9323   1515.4900     36.1600     15.0700
+    438.0667   1515.4900     36.1600     15.0700
+    438.2010   1515.4900     36.1600     15.0700
+    438.3354   1515.4800     36.1600     15.0700
+    438.4697   1515.4800     36.1600     15.0600
+    438.6040   1515.4700     36.1600     15.0600
+    438.7384   1515.4600     36.1500     15.0600
+    438.8728   1515.4600     36.1600     15.0600
+    439.0071   1515.2200     35.9600     15.0500
+    439.1415   1515.2100     35.9600     15.0500
+    439.2759   1515.2000     35.9600     15.0500
+    439.4102   1515.2000     35.9600     15.0400
+    439.5446   1515.1900     35.9600     15.0400
+    439.6789   1515.1700     35.9600     15.0300
+    439.8132   1515.1700     35.9600     15.0300
+    439.9476   1515.1500     35.9600     15.0300
+    440.0819   1515.1400     35.9600     15.0200
+    440.2163   1515.1200     35.9500     15.0200
+    440.3506   1515.1100     35.9500     15.0100
+    440.4850   1515.1000     35.9500     15.0100
+    440.6194   1515.0800     35.9500     15.0000
+    440.7537   1515.0700     35.9500     15.0000
+    440.8880   1515.2800     36.1400     14.9900
+    441.0223   1515.2600     36.1400     14.9900
+    441.1567   1457.8700     36.1400      0.0000
+    442.3658   1472.9900      0.0000     14.9600
+    442.5001   1472.9900      0.0000     14.9600
+    442.6344   1473.0000      0.0100     14.9600
+    442.7687   1515.1900     36.1300     14.9600
+    442.9031   1515.1900     36.1300     14.9600
+    443.0374   1515.1800     36.1300     14.9500
+    443.1717   1515.4100     36.3300     14.9500
+    443.3060   1515.4000     36.3300     14.9500
+    443.4403   1515.6300     36.5300     14.9500
+    443.5747   1458.5700     36.6300      0.0000
+    444.7835   1472.7900      0.0000     14.8900
+    444.9178   1472.7800      0.0000     14.8900
+    445.0522   1472.7800      0.0100     14.8800
+    445.1865   1514.7500     35.9300     14.8800
+    445.3208   1514.7400     35.9300     14.8800
+    445.4551   1514.7400     35.9300     14.8800
+    445.5894   1514.7400     35.9300     14.8800
+    445.7237   1514.7300     35.9300     14.8700
+    445.8580   1514.7300     35.9300     14.8700
+    445.9923   1457.6600     35.9300      0.0000
+    447.2010   1472.6700      0.0000     14.8500
+    447.3353   1472.6600      0.0000     14.8400
+    447.4696   1472.6600      0.0100     14.8400
+    447.6039   1514.6200     35.9200     14.8300
+    447.7382   1514.6100     35.9200     14.8300
+    447.8725   1514.5900     35.9200     14.8200
+    448.0067   1514.5800     35.9200     14.8200
+    448.1411   1514.5800     35.9200     14.8200
+    448.2753   1514.5700     35.9200     14.8100
+    448.4097   1514.5600     35.9100     14.8100
+    448.5439   1514.5500     35.9100     14.8100
+    448.6782   1514.5300     35.9100     14.8000
+    448.8125   1514.5200     35.9100     14.8000
+    448.9467   1514.5100     35.9100     14.7900
+    449.0811   1514.4900     35.9100     14.7900
+    449.2153   1514.4800     35.9100     14.7800
+    449.3496   1514.4500     35.9100     14.7700
+    449.4839   1514.4300     35.9100     14.7700
+    449.6182   1514.4100     35.9100     14.7600
+    449.7524   1514.3900     35.9100     14.7500
+    449.8867   1514.3700     35.9100     14.7500
+    450.0210   1514.3500     35.9100     14.7400
+    450.1553   1514.3300     35.9100     14.7300
+    450.2896   1514.3100     35.9000     14.7300
+    450.4238   1514.2900     35.9000     14.7200
+    450.5581   1514.5000     36.1000     14.7100
+    450.6924   1514.7100     36.2900     14.7100
+    450.8266   1514.7000     36.2900     14.7000
+    450.9609   1514.6800     36.2900     14.6900
+    451.0952   1514.6600     36.2900     14.6900
+    451.2294   1514.7600     36.3900     14.6800
+    451.3637   1514.8600     36.4900     14.6800
+    451.4980   1514.9600     36.5900     14.6700
+    451.6322   1458.6400     36.5900      0.0000
+    452.8405   1472.0700      0.0000     14.6500
+    452.9748   1472.0500      0.0000     14.6400
+    453.1091   1472.0400      0.0100     14.6400
+    453.2433   1514.0400     35.8900     14.6300
+    453.3776   1514.0100     35.8900     14.6200
+    453.5118   1513.9800     35.8900     14.6100
+    453.6461   1513.9500     35.8800     14.6000
+    453.7803   1513.9300     35.8800     14.6000
+    453.9146   1513.9000     35.8800     14.5900
+    454.0488   1513.8800     35.8800     14.5800
+    454.1830   1513.8600     35.8700     14.5700
+    454.3173   1513.8400     35.8700     14.5700
+    454.4515   1513.8200     35.8700     14.5600
+    454.5858   1513.8200     35.8700     14.5600
+    454.7200   1513.8000     35.8700     14.5600
+    454.8543   1513.8000     35.8700     14.5500
+    454.9885   1513.7900     35.8700     14.5500
+    455.1227   1513.7800     35.8700     14.5500
+    455.2570   1513.7700     35.8700     14.5500
+    455.3912   1457.7400     35.8700      0.0000
+    458.0757   1471.2300      0.0000     14.3900
+    458.2099   1471.2100      0.0000     14.3800
+    458.3441   1471.2000      0.0100     14.3800
+    458.4784   1513.2400     35.8400     14.3700
+    458.6125   1513.2300     35.8400     14.3700
+    458.7467   1513.2100     35.8400     14.3600
+    458.8810   1513.2000     35.8400     14.3600
+    459.0152   1513.1900     35.8400     14.3600
+    459.1494   1513.1800     35.8400     14.3500
+    459.2836   1513.1800     35.8400     14.3500
+    459.4178   1513.1700     35.8400     14.3500
+    459.5520   1513.1700     35.8400     14.3500
+    459.6862   1513.1700     35.8400     14.3400
+    459.8204   1513.1600     35.8400     14.3400
+    459.9546   1513.1600     35.8400     14.3400
+    460.0888   1457.7700     35.8400      0.0000
+    461.2966   1471.0700      0.0000     14.3300
+    461.4308   1471.0600      0.0000     14.3300
+    461.5650   1471.0700      0.0100     14.3300
+    461.6991   1513.1400     35.8400     14.3200
+    461.8333   1513.1400     35.8500     14.3200
+    461.9675   1513.1400     35.8500     14.3200
+    462.1017   1457.8400     35.8600      0.0000
+    464.1144   1470.9700      0.0000     14.2900
+    464.2485   1470.9700      0.0000     14.2900
+    464.3827   1470.9800      0.0100     14.2900
+    464.5169   1513.1200     35.8800     14.2900
+    464.6511   1513.1300     35.8900     14.2900
+    464.7852   1513.1500     35.9000     14.2900
+    464.9194   1513.1500     35.9000     14.2900
+    465.0535   1513.1500     35.9100     14.2900
+    465.1877   1513.1600     35.9100     14.2900
+    465.3219   1513.1700     35.9200     14.2900
+    465.4560   1513.1600     35.9200     14.2800
+    465.5902   1513.1600     35.9100     14.2800
+    465.7243   1513.1500     35.9000     14.2800
+    465.8585   1513.1400     35.9000     14.2800
+    465.9926   1513.1300     35.8900     14.2800
+    466.1268   1513.1200     35.8800     14.2800
+    466.2610   1513.1200     35.8800     14.2800
+    466.3951   1513.1000     35.8700     14.2800
+    466.5293   1513.1000     35.8600     14.2800
+    466.6634   1513.0900     35.8600     14.2800
+    466.7976   1513.0700     35.8500     14.2700
+    466.9317   1513.0600     35.8400     14.2700
+    467.0659   1513.0500     35.8300     14.2700
+    467.2000   1513.0300     35.8300     14.2700
+    467.3342   1513.0200     35.8300     14.2600
+    467.4683   1513.0200     35.8300     14.2600
+    467.6024   1513.0100     35.8300     14.2600
+    467.7366   1513.0000     35.8300     14.2500
+    467.8708   1513.0000     35.8300     14.2500
+    468.0049   1512.9900     35.8300     14.2500
+    468.1390   1512.9900     35.8300     14.2500
+    468.2732   1512.9900     35.8300     14.2500
+    468.4073   1512.9800     35.8300     14.2500
+    468.5415   1512.9800     35.8300     14.2400
+    468.6756   1512.9800     35.8300     14.2400
+    468.8097   1512.9700     35.8300     14.2400
+    468.9439   1512.9700     35.8300     14.2400
+    469.0780   1512.9600     35.8300     14.2400
+    469.2122   1512.9600     35.8300     14.2300
+    469.3463   1512.9500     35.8300     14.2300
+    469.4804   1512.9400     35.8200     14.2300
+    469.6145   1512.9300     35.8200     14.2200
+    469.7487   1512.9100     35.8200     14.2200
+    469.8828   1512.9000     35.8200     14.2100
+    470.0169   1512.8900     35.8200     14.2100
+    470.1511   1512.8700     35.8200     14.2000
+    470.2852   1512.8500     35.8200     14.2000
+    470.4193   1512.8400     35.8200     14.1900
+    470.5534   1512.8200     35.8200     14.1900
+    470.6876   1512.8100     35.8200     14.1800
+    470.8217   1512.8000     35.8200     14.1800
+    470.9557   1457.9300     35.8200      0.0000
+    472.9675   1470.5700      0.0000     14.1400
+    473.1016   1470.5600      0.0000     14.1300
+    473.2357   1470.5600      0.0100     14.1300
+    473.3698   1512.6700     35.8100     14.1300
+    473.5039   1512.6600     35.8100     14.1300
+    473.6380   1457.9500     35.8100      0.0000
+    476.1857   1470.3400      0.0000     14.0600
+    476.3198   1470.3400      0.0000     14.0600
+    476.4539   1470.3400      0.0100     14.0600
+    476.5880   1512.4700     35.8000     14.0600
+    476.7220   1512.4700     35.8000     14.0600
+    476.8561   1512.4700     35.8000     14.0500
+    476.9902   1512.4700     35.8000     14.0500
+    477.1243   1512.4700     35.7900     14.0500
+    477.2583   1512.4600     35.7900     14.0500
+    477.3924   1512.4600     35.7900     14.0500
+    477.5265   1512.4600     35.7900     14.0500
+    477.6605   1512.4500     35.8000     14.0500
+    477.7946   1512.4500     35.8000     14.0400
+    477.9286   1512.4500     35.8000     14.0400
+    478.0627   1512.4400     35.8000     14.0400
+    478.1968   1512.4400     35.8000     14.0400
+    478.3309   1512.4300     35.8000     14.0400
+    478.4649   1512.4200     35.8000     14.0300
+    478.5990   1512.4200     35.8000     14.0300
+    478.7331   1512.4100     35.8000     14.0300
+    478.8671   1512.4100     35.7900     14.0200
+    479.0012   1512.4000     35.7900     14.0200
+    479.1352   1512.3900     35.7900     14.0200
+    479.2693   1512.3900     35.7900     14.0200
+    479.4034   1458.0300     35.7900      0.0000
+    480.6098   1470.1700      0.0000     13.9900
+    480.7439   1470.1600      0.0000     13.9900
+    480.8779   1470.1700      0.0100     13.9900
+    481.0120   1512.3100     35.7900     13.9900
+    481.1460   1512.3000     35.7900     13.9800
+    481.2801   1512.2900     35.7900     13.9800
+    481.4141   1512.2800     35.7900     13.9800
+    481.5482   1512.2800     35.7900     13.9700
+    481.6822   1512.2700     35.7900     13.9700
+    481.8162   1512.2600     35.7900     13.9700
+    481.9503   1512.2600     35.7900     13.9700
+    482.0843   1512.2400     35.7900     13.9600
+    482.2183   1512.2300     35.7900     13.9600
+    482.3524   1512.2200     35.7800     13.9500
+    482.4864   1512.2000     35.7800     13.9500
+    482.6205   1512.1800     35.7800     13.9400
+    482.7545   1512.1600     35.7800     13.9300
+    482.8885   1512.1300     35.7800     13.9300
+    483.0226   1512.1100     35.7800     13.9200
+    483.1566   1512.0900     35.7800     13.9100
+    483.2906   1512.0800     35.7800     13.9100
+    483.4246   1512.0600     35.7800     13.9000
+    483.5587   1512.0400     35.7800     13.8900
+    483.6927   1512.0200     35.7800     13.8900
+    483.8268   1512.0100     35.7800     13.8800
+    483.9608   1511.9800     35.7700     13.8800
+    484.0948   1511.9700     35.7700     13.8700
+    484.2288   1511.9500     35.7700     13.8700
+    484.3628   1511.9300     35.7700     13.8600
+    484.4968   1511.9200     35.7700     13.8600
+    484.6308   1511.9000     35.7600     13.8500
+    484.7649   1511.8900     35.7600     13.8500
+    484.8989   1511.8800     35.7600     13.8500
+    485.0329   1511.8700     35.7600     13.8400
+    485.1669   1511.8700     35.7600     13.8400
+    485.3010   1511.8600     35.7600     13.8400
+    485.4349   1511.8600     35.7600     13.8400
+    485.5689   1511.8500     35.7600     13.8300
+    485.7030   1511.8500     35.7600     13.8300
+    485.8370   1511.8400     35.7600     13.8300
+    485.9710   1511.8400     35.7600     13.8300
+    486.1050   1511.8400     35.7600     13.8300
+    486.2390   1511.8300     35.7600     13.8200
+    486.3730   1511.8300     35.7600     13.8200
+    486.5070   1511.8300     35.7600     13.8200
+    486.6410   1511.8200     35.7600     13.8200
+    486.7750   1511.8200     35.7600     13.8200
+    486.9090   1511.8200     35.7600     13.8200
+    487.0430   1511.8100     35.7600     13.8100
+    487.1770   1511.8000     35.7600     13.8100
+    487.3110   1511.7900     35.7600     13.8100
+    487.4450   1511.7900     35.7500     13.8000
+    487.5790   1511.7700     35.7500     13.8000
+    487.7130   1511.7700     35.7500     13.8000
+    487.8470   1511.7600     35.7500     13.7900
+    487.9810   1511.7500     35.7500     13.7900
+    488.1150   1511.7400     35.7500     13.7900
+    488.2490   1511.7300     35.7500     13.7800
+    488.3830   1511.7200     35.7500     13.7800
+    488.5170   1511.7100     35.7500     13.7800
+    488.6510   1511.7000     35.7500     13.7700
+    488.7850   1511.6900     35.7500     13.7700
+    488.9189   1511.6700     35.7500     13.7600
+    489.0529   1511.6600     35.7500     13.7600
+    489.1869   1511.6400     35.7500     13.7500
+    489.3209   1511.6300     35.7500     13.7500
+    489.4549   1511.6300     35.7500     13.7500
+    489.5889   1511.6200     35.7500     13.7400
+    489.7228   1511.6100     35.7500     13.7400
+    489.8568   1511.6100     35.7500     13.7400
+    489.9908   1511.6100     35.7500     13.7400
+    490.1248   1511.6000     35.7500     13.7400
+    490.2588   1511.6000     35.7500     13.7400
+    490.3927   1511.6000     35.7500     13.7400
+    490.5267   1511.6000     35.7400     13.7400
+    490.6607   1511.6000     35.7400     13.7400
+    490.7947   1511.6000     35.7400     13.7300
+    490.9286   1511.6000     35.7400     13.7300
+    491.0626   1511.5900     35.7400     13.7300
+    491.1966   1511.5900     35.7400     13.7300
+    491.3305   1511.5800     35.7400     13.7300
+    491.4645   1458.1600     35.7400      0.0000
+    492.6702   1469.3000      0.0000     13.7000
+    492.8041   1469.3000      0.0000     13.7000
+    492.9381   1469.3000      0.0100     13.7000
+    493.0721   1511.5000     35.7400     13.6900
+    493.2061   1511.5000     35.7400     13.6900
+    493.3400   1511.5000     35.7400     13.6900
+    493.4739   1511.4900     35.7300     13.6900
+    493.6079   1511.4900     35.7300     13.6900
+    493.7418   1511.4800     35.7400     13.6900
+    493.8758   1511.4800     35.7300     13.6900
+    494.0097   1511.4800     35.7300     13.6900
+    494.1437   1511.4800     35.7300     13.6800
+    494.2776   1511.4700     35.7300     13.6800
+    494.4116   1511.4600     35.7300     13.6800
+    494.5455   1511.4500     35.7300     13.6700
+    494.6794   1458.2000     35.7400      0.0000
+    495.8849   1469.1100      0.0000     13.6300
+    496.0189   1469.1000      0.0000     13.6300
+    496.1528   1469.1000      0.0100     13.6200
+    496.2867   1511.3000     35.7300     13.6200
+    496.4207   1511.2900     35.7300     13.6200
+    496.5546   1511.2800     35.7300     13.6100
+    496.6885   1511.2700     35.7300     13.6100
+    496.8224   1511.2600     35.7200     13.6100
+    496.9564   1511.2500     35.7200     13.6000
+    497.0903   1511.2400     35.7200     13.6000
+    497.2242   1511.2300     35.7200     13.6000
+    497.3582   1511.2200     35.7200     13.5900
+    497.4921   1511.2000     35.7200     13.5900
+    497.6260   1511.1900     35.7200     13.5800
+    497.7599   1511.1700     35.7200     13.5800
+    497.8939   1511.1500     35.7200     13.5700
+    498.0277   1511.1300     35.7200     13.5600
+    498.1617   1511.1100     35.7200     13.5600
+    498.2956   1511.0900     35.7200     13.5500
+    498.4295   1511.0700     35.7200     13.5400
+    498.5634   1511.0500     35.7200     13.5400
+    498.6974   1511.0300     35.7100     13.5300
+    498.8313   1511.0200     35.7100     13.5300
+    498.9651   1511.0000     35.7100     13.5200
+    499.0991   1510.9900     35.7100     13.5200
+    499.2330   1510.9800     35.7100     13.5100
+    499.3669   1510.9700     35.7100     13.5100
+    499.5008   1510.9600     35.7100     13.5100
+    499.6348   1510.9500     35.7100     13.5100
+    499.7686   1510.9500     35.7100     13.5000
+    499.9026   1510.9400     35.7100     13.5000
+    500.0365   1510.9400     35.7100     13.5000
+    500.1703   1510.9300     35.7100     13.5000
+    500.3043   1510.9300     35.7100     13.5000
+    500.4381   1510.9200     35.7100     13.4900
+    500.5721   1510.9100     35.7100     13.4900
+    500.7060   1510.9000     35.7100     13.4800
+    500.8399   1510.9000     35.7100     13.4800
+    500.9738   1510.8900     35.7100     13.4800
+    501.1076   1510.8700     35.7100     13.4700
+    501.2415   1510.8600     35.7100     13.4700
+    501.3754   1510.8500     35.7100     13.4600
+    501.5094   1510.8400     35.7100     13.4600
+    501.6432   1510.8200     35.7100     13.4600
+    501.7772   1510.8100     35.7000     13.4500
+    501.9110   1510.8000     35.7000     13.4500
+    502.0449   1510.7800     35.7000     13.4400
+    502.1788   1510.7600     35.7000     13.4400
+    502.3127   1510.7400     35.7000     13.4300
+    502.4466   1510.7100     35.7000     13.4200
+    502.5804   1510.6900     35.7000     13.4100
+    502.7144   1458.2800     35.7000      0.0000
+    503.9193   1468.2000      0.0000     13.3500
+    504.0531   1468.1900      0.0000     13.3400
+    504.1870   1468.1900      0.0100     13.3400
+    504.3209   1510.4600     35.6900     13.3400
+    504.4547   1510.4600     35.6900     13.3400
+    504.5887   1510.4600     35.6900     13.3400
+    504.7225   1510.4600     35.6900     13.3400
+    504.8564   1510.4500     35.6900     13.3300
+    504.9902   1510.4500     35.6900     13.3300
+    505.1241   1510.4400     35.6800     13.3300
+    505.2580   1510.4400     35.6800     13.3300
+    505.3919   1510.4300     35.6800     13.3300
+    505.5257   1510.4300     35.6800     13.3200
+    505.6595   1510.4200     35.6800     13.3200
+    505.7935   1510.4100     35.6800     13.3200
+    505.9273   1510.4000     35.6800     13.3200
+    506.0612   1510.3900     35.6800     13.3100
+    506.1950   1510.3800     35.6800     13.3100
+    506.3289   1510.3700     35.6800     13.3000
+    506.4627   1458.3200     35.6800      0.0000
+    509.9427   1467.6900      0.0000     13.1800
+    510.0765   1467.6800      0.0000     13.1800
+    510.2103   1467.6700      0.0100     13.1700
+    510.3442   1509.9700     35.6600     13.1700
+    510.4780   1509.9600     35.6600     13.1700
+    510.6118   1509.9400     35.6600     13.1600
+    510.7456   1509.9600     35.6800     13.1600
+    510.8795   1510.0100     35.7300     13.1500
+    511.0133   1510.0200     35.7600     13.1500
+    511.1471   1510.0700     35.8100     13.1400
+    511.2809   1510.1200     35.8600     13.1400
+    511.4147   1510.1700     35.9100     13.1300
+    511.5486   1458.7500     35.9400      0.0000
+    512.7529   1467.3700      0.0000     13.0900
+    512.8867   1467.3700      0.0000     13.0800
+    513.0206   1467.3600      0.0100     13.0800
+    513.1544   1458.4900     35.7200      0.0000
+    514.3586   1467.2600      0.0000     13.0500
+    514.4924   1467.2600      0.0000     13.0500
+    514.6262   1467.2600      0.0100     13.0400
+    514.7599   1509.9300     35.9200     13.0400
+    514.8938   1509.9600     35.9500     13.0400
+    515.0275   1509.9300     35.9200     13.0400
+    515.1614   1509.9000     35.8900     13.0400
+    515.2951   1509.9000     35.9000     13.0400
+    515.4290   1509.9000     35.9000     13.0400
+    515.5627   1509.9000     35.9000     13.0400
+    515.6965   1509.8600     35.8700     13.0400
+    515.8303   1509.8600     35.8700     13.0400
+    515.9641   1509.8600     35.8700     13.0300
+    516.0979   1509.8600     35.8700     13.0300
+    516.2316   1509.8600     35.8700     13.0300
+    516.3655   1509.8600     35.8700     13.0300
+    516.4992   1509.8500     35.8700     13.0300
+    516.6331   1509.8500     35.8700     13.0300
+    516.7668   1458.7400     35.8700      0.0000
+    517.9708   1467.0700      0.0000     12.9800
+    518.1046   1467.0500      0.0000     12.9800
+    518.2383   1467.0400      0.0100     12.9700
+    518.3721   1509.5800     35.8100     12.9600
+    518.5059   1509.5600     35.8100     12.9500
+    518.6396   1509.5400     35.8100     12.9500
+    518.7734   1509.5200     35.8100     12.9400
+    518.9072   1509.5000     35.8100     12.9300
+    519.0409   1509.4200     35.7500     12.9300
+    519.1747   1509.3700     35.7300     12.9200
+    519.3084   1509.2900     35.6800     12.9100
+    519.4422   1509.2500     35.6500     12.9100
+    519.5759   1458.4600     35.6300      0.0000
+    521.8497   1466.4700      0.0000     12.8000
+    521.9835   1466.4500      0.0000     12.8000
+    522.1172   1466.4400      0.0100     12.7900
+    522.2510   1508.8200     35.6000     12.7900
+    522.3847   1508.8100     35.6000     12.7800
+    522.5184   1508.8000     35.6000     12.7800
+    522.6522   1508.7900     35.6000     12.7800
+    522.7859   1508.7800     35.6000     12.7700
+    522.9196   1508.7700     35.6000     12.7700
+    523.0534   1508.7700     35.6000     12.7700
+    523.1871   1508.7700     35.6000     12.7700
+    523.3209   1508.7600     35.5900     12.7700
+    523.4546   1508.7500     35.5900     12.7600
+    523.5883   1508.7500     35.5900     12.7600
+    523.7220   1508.7500     35.5900     12.7600
+    523.8558   1508.7400     35.6000     12.7600
+    523.9895   1508.7400     35.6000     12.7500
+    524.1232   1508.7300     35.6000     12.7500
+    524.2570   1508.7300     35.6000     12.7500
+    524.3907   1508.7200     35.6000     12.7500
+    524.5244   1508.7200     35.6000     12.7500
+    524.6581   1508.7100     35.6000     12.7400
+    524.7918   1508.7100     35.6000     12.7400
+    524.9256   1508.7000     35.6000     12.7400
+    525.0593   1508.7000     35.6000     12.7400
+    525.1930   1508.6900     35.6000     12.7300
+    525.3267   1508.6800     35.6000     12.7300
+    525.4604   1508.6700     35.6000     12.7300
+    525.5942   1508.6600     35.6000     12.7200
+    525.7278   1508.6500     35.6000     12.7200
+    525.8616   1508.6400     35.5900     12.7200
+    525.9953   1508.6200     35.5900     12.7100
+    526.1290   1508.6100     35.5900     12.7100
+    526.2627   1508.5900     35.5900     12.7000
+    526.3964   1508.5800     35.5900     12.7000
+    526.5302   1508.5700     35.5900     12.7000
+    526.6639   1508.5700     35.5900     12.6900
+    526.7975   1508.5600     35.5900     12.6900
+    526.9312   1508.5600     35.5900     12.6900
+    527.0649   1508.5500     35.5900     12.6900
+    527.1987   1508.5400     35.5900     12.6800
+    527.3324   1508.5300     35.5900     12.6800
+    527.4661   1508.5100     35.5900     12.6700
+    527.5998   1508.4800     35.5900     12.6600
+    527.7335   1508.4500     35.5900     12.6500
+    527.8671   1508.4300     35.5900     12.6400
+    528.0009   1508.4000     35.6000     12.6300
+    528.1345   1508.3700     35.6100     12.6200
+    528.2682   1508.3400     35.6100     12.6100
+    528.4019   1458.5900     35.6100      0.0000
+    530.0062   1465.6000      0.0000     12.5300
+    530.1399   1465.5900      0.0000     12.5300
+    530.2736   1465.5800      0.0100     12.5300
+    530.4073   1508.0200     35.5600     12.5200
+    530.5409   1508.0100     35.5600     12.5200
+    530.6746   1508.0000     35.5600     12.5200
+    530.8083   1507.9900     35.5600     12.5100
+    530.9420   1507.9900     35.5600     12.5100
+    531.0756   1507.9700     35.5600     12.5100
+    531.2093   1507.9700     35.5600     12.5000
+    531.3430   1507.9600     35.5600     12.5000
+    531.4766   1507.9600     35.5600     12.5000
+    531.6104   1507.9500     35.5600     12.5000
+    531.7440   1507.9400     35.5500     12.4900
+    531.8777   1507.9400     35.5500     12.4900
+    532.0114   1458.5700     35.5600      0.0000
+    536.8228   1465.0200      0.0000     12.3500
+    536.9564   1465.0100      0.0000     12.3500
+    537.0900   1465.0000      0.0100     12.3400
+    537.2236   1507.4900     35.5400     12.3400
+    537.3572   1507.4800     35.5300     12.3400
+    537.4908   1507.4700     35.5300     12.3300
+    537.6245   1458.6300     35.5300      0.0000
+    538.8271   1464.8700      0.0000     12.3000
+    538.9607   1464.8500      0.0000     12.3000
+    539.0943   1464.8400      0.0100     12.2900
+    539.2280   1508.2200     35.5300     12.5500
+    539.3615   1458.4900     35.4000      0.0000
+    540.8312   1464.5100      0.0000     12.2000
+    540.9648   1464.4900      0.0000     12.1900
+    541.0984   1464.4900      0.0100     12.1900
+    541.2320   1507.0000     35.5100     12.1800
+    541.3657   1507.8900     35.5100     12.4500
+    541.4992   1508.1800     35.3800     12.5800
+    541.6328   1507.9500     35.2000     12.5700
+    541.7664   1507.8600     35.1300     12.5700
+    541.9000   1507.8300     35.1300     12.5600
+    542.0336   1507.8100     35.1300     12.5500
+    542.1672   1507.7700     35.1300     12.5400
+    542.3008   1508.6300     35.1300     12.8000
+    542.4344   1458.0100     35.0100      0.0000
+    544.8388   1463.8200      0.0000     12.0000
+    544.9724   1463.8200      0.0000     12.0000
+    545.1060   1463.8200      0.0100     12.0000
+    545.2396   1506.3800     35.4800     11.9900
+    545.3731   1506.3700     35.4800     11.9900
+    545.5067   1506.3700     35.4800     11.9900
+    545.6403   1458.7000     35.4800      0.0000
+    546.8423   1463.7700      0.0000     11.9800
+    546.9759   1463.7700      0.0000     11.9800
+    547.1094   1463.7800      0.0100     11.9800
+    547.2430   1506.3500     35.4800     11.9800
+    547.3766   1506.3500     35.4800     11.9800
+    547.5101   1506.3500     35.4800     11.9800
+    547.6437   1506.3500     35.4800     11.9800
+    547.7772   1506.3500     35.4800     11.9800
+    547.9107   1506.3600     35.4800     11.9800
+    548.0443   1506.3500     35.4800     11.9700
+    548.1779   1506.3600     35.4800     11.9700
+    548.3114   1506.3600     35.4800     11.9700
+    548.4449   1506.3600     35.4800     11.9700
+    548.5785   1506.3500     35.4800     11.9700
+    548.7120   1506.3500     35.4800     11.9700
+    548.8456   1506.3500     35.4800     11.9700
+    548.9791   1506.3500     35.4800     11.9700
+    549.1126   1506.3400     35.4800     11.9700
+    549.2462   1506.7900     35.4800     12.1000
+    549.3797   1507.1600     35.4200     12.2300
+    549.5133   1507.4500     35.2900     12.3600
+    549.6468   1458.3300     35.1600      0.0000
+    553.2520   1463.2500      0.0000     11.8100
+    553.3855   1463.2300      0.0000     11.8100
+    553.5190   1463.2100      0.0100     11.8000
+    553.6525   1505.8100     35.4600     11.7900
+    553.7860   1505.7900     35.4600     11.7900
+    553.9195   1505.7700     35.4600     11.7800
+    554.0530   1505.7500     35.4600     11.7800
+    554.1865   1505.7400     35.4600     11.7700
+    554.3200   1505.7200     35.4600     11.7700
+    554.4535   1505.7000     35.4600     11.7600
+    554.5870   1505.6900     35.4600     11.7500
+    554.7205   1505.6700     35.4600     11.7500
+    554.8539   1505.6500     35.4600     11.7400
+    554.9875   1505.6300     35.4500     11.7400
+    555.1210   1505.6100     35.4500     11.7300
+    555.2545   1458.8200     35.4500      0.0000
+    558.8585   1463.0900      0.0000     11.7500
+    558.9919   1463.5900      0.0000     11.8800
+    559.1254   1464.0900      0.0100     12.0100
+    559.2589   1506.2400     35.1400     12.0000
+    559.3923   1506.1700     35.0900     12.0000
+    559.5258   1506.1800     35.1000     12.0000
+    559.6592   1506.1800     35.1100     12.0000
+    559.7927   1506.1700     35.1100     11.9900
+    559.9262   1506.1700     35.1100     11.9900
+    560.0597   1505.7100     35.1100     11.8600
+    560.1931   1505.3300     35.1700     11.7200
+    560.3265   1505.0200     35.3000     11.5900
+    560.4600   1458.8800     35.4300      0.0000
+    565.2639   1461.9900      0.0000     11.4400
+    565.3972   1461.9900      0.0000     11.4300
+    565.5307   1461.9900      0.0100     11.4300
+    565.6641   1504.7000     35.4200     11.4300
+    565.7975   1504.6900     35.4200     11.4300
+    565.9309   1505.6100     35.4200     11.6900
+    566.0643   1458.7700     35.2900      0.0000
+    567.2650   1461.8500      0.0000     11.3900
+    567.3984   1461.8300      0.0000     11.3800
+    567.5318   1461.8200      0.0100     11.3800
+    567.6652   1504.5300     35.4000     11.3800
+    567.7986   1504.5200     35.4000     11.3700
+    567.9320   1504.5100     35.4000     11.3700
+    568.0654   1505.4200     35.4000     11.6300
+    568.1988   1505.7100     35.2800     11.7600
+    568.3322   1505.9300     35.0900     11.8900
+    568.4656   1458.3700     34.9600      0.0000
+    570.8666   1461.0800      0.0000     11.1800
+    571.0000   1461.0700      0.0000     11.1700
+    571.1334   1461.0600      0.0100     11.1700
+    571.2667   1503.8300     35.3700     11.1700
+    571.4001   1503.8200     35.3700     11.1600
+    571.5334   1503.8200     35.3700     11.1600
+    571.6669   1503.8100     35.3700     11.1600
+    571.8002   1503.8100     35.3700     11.1600
+    571.9336   1503.8000     35.3700     11.1600
+    572.0670   1503.8000     35.3700     11.1600
+    572.2004   1503.8000     35.3700     11.1600
+    572.3337   1503.7900     35.3700     11.1500
+    572.4670   1503.7900     35.3700     11.1500
+    572.6005   1503.7800     35.3700     11.1500
+    572.7338   1503.7700     35.3700     11.1500
+    572.8672   1503.7600     35.3700     11.1400
+    573.0005   1503.7600     35.3700     11.1400
+    573.1339   1503.7600     35.3700     11.1400
+    573.2673   1503.7500     35.3700     11.1400
+    573.4006   1503.7400     35.3700     11.1300
+    573.5340   1503.7400     35.3700     11.1300
+    573.6673   1459.0000     35.3700      0.0000
+    574.8675   1460.9000      0.0000     11.1100
+    575.0009   1460.9000      0.0000     11.1100
+    575.1342   1460.9000      0.0100     11.1100
+    575.2676   1503.6800     35.3700     11.1100
+    575.4009   1503.6700     35.3600     11.1100
+    575.5343   1503.6700     35.3600     11.1000
+    575.6676   1503.6600     35.3600     11.1000
+    575.8009   1503.6600     35.3600     11.1000
+    575.9343   1503.6600     35.3600     11.1000
+    576.0676   1503.6600     35.3600     11.1000
+    576.2010   1503.6500     35.3600     11.1000
+    576.3343   1503.6500     35.3600     11.1000
+    576.4677   1503.6400     35.3600     11.0900
+    576.6010   1503.6400     35.3600     11.0900
+    576.7343   1503.6300     35.3600     11.0900
+    576.8677   1503.6300     35.3600     11.0900
+    577.0010   1503.6200     35.3600     11.0800
+    577.1343   1503.6600     35.3600     11.1000
+    577.2676   1503.6700     35.3500     11.1000
+    577.4010   1503.6600     35.3400     11.1000
+    577.5343   1459.0200     35.3300      0.0000
+    579.2675   1460.2700      0.0000     10.9300
+    579.4008   1460.2400      0.0000     10.9300
+    579.5341   1460.2200      0.0100     10.9200
+    579.6674   1459.0600     35.3300      0.0000
+    581.6671   1459.7600      0.0000     10.7900
+    581.8004   1459.7300      0.0000     10.7900
+    581.9337   1459.7100      0.0100     10.7800
+    582.0669   1502.5400     35.3100     10.7700
+    582.2003   1502.5100     35.3100     10.7600
+    582.3335   1502.4800     35.3100     10.7500
+    582.4668   1459.0700     35.3100      0.0000
+    583.6664   1459.3100      0.0000     10.6700
+    583.7997   1459.2800      0.0000     10.6600
+    583.9330   1459.2700      0.0100     10.6600
+    584.0663   1502.1400     35.3000     10.6500
+    584.1995   1502.1200     35.2900     10.6500
+    584.3328   1502.1100     35.2900     10.6400
+    584.4661   1502.0900     35.2900     10.6400
+    584.5994   1502.0800     35.2900     10.6400
+    584.7327   1502.0700     35.2900     10.6300
+    584.8659   1502.0600     35.2900     10.6300
+    584.9992   1502.0500     35.2900     10.6300
+    585.1324   1502.0400     35.2800     10.6200
+    585.2657   1502.0400     35.2900     10.6200
+    585.3990   1502.0300     35.2900     10.6200
+    585.5323   1502.0200     35.2900     10.6200
+    585.6655   1502.0200     35.2900     10.6100
+    585.7988   1502.0100     35.2900     10.6100
+    585.9321   1502.0000     35.2900     10.6100
+    586.0653   1459.1000     35.2900      0.0000
+    587.2647   1458.9900      0.0000     10.5700
+    587.3979   1458.9800      0.0000     10.5700
+    587.5312   1458.9700      0.0100     10.5700
+    587.6645   1459.1200     35.2800      0.0000
+    588.8637   1458.7600      0.0000     10.5100
+    588.9969   1458.7400      0.0000     10.5000
+    589.1302   1458.7300      0.0100     10.5000
+    589.2634   1501.6200     35.2700     10.4900
+    589.3967   1501.6000     35.2700     10.4800
+    589.5300   1501.5700     35.2700     10.4800
+    589.6631   1459.1300     35.2600      0.0000
+    591.6617   1457.2200      0.0000     10.1100
+    591.7949   1457.2000      0.0000     10.1000
+    591.9281   1457.1900      0.0100     10.1000
+    592.0613   1500.1800     35.2100     10.1000
+    592.1946   1500.1700     35.2100     10.0900
+    592.3278   1500.1700     35.2100     10.0900
+    592.4609   1500.1600     35.2100     10.0900
+    592.5942   1500.1600     35.2100     10.0900
+    592.7274   1500.1600     35.2100     10.0900
+    592.8607   1500.1600     35.2100     10.0900
+    592.9938   1500.1600     35.2000     10.0900
+    593.1271   1500.1600     35.2100     10.0800
+    593.2603   1500.1600     35.2100     10.0800
+    593.3935   1500.1600     35.2100     10.0800
+    593.5267   1500.1500     35.2100     10.0800
+    593.6599   1500.1500     35.2000     10.0800
+    593.7931   1500.1500     35.2000     10.0800
+    593.9263   1500.1400     35.2000     10.0800
+    594.0595   1500.1400     35.2000     10.0800
+    594.1927   1500.1400     35.2000     10.0800
+    594.3259   1500.1400     35.2000     10.0800
+    594.4591   1500.1400     35.2000     10.0800
+    594.5923   1500.1400     35.2000     10.0800
+    594.7255   1500.1400     35.2000     10.0700
+    594.8587   1500.1400     35.2000     10.0700
+    594.9919   1500.1400     35.2000     10.0700
+    595.1251   1500.1300     35.2000     10.0700
+    595.2584   1500.1300     35.2000     10.0700
+    595.3915   1500.1200     35.2000     10.0700
+    595.5247   1500.1200     35.2000     10.0600
+    595.6579   1459.1400     35.2000      0.0000
+    598.4548   1456.7800      0.0000      9.9700
+    598.5880   1456.7400      0.0000      9.9600
+    598.7211   1456.7000      0.0100      9.9500
+    598.8543   1499.7100     35.1900      9.9400
+    598.9875   1499.6700     35.1900      9.9300
+    599.1206   1499.6300     35.1900      9.9100
+    599.2538   1499.5900     35.1900      9.9000
+    599.3870   1499.5600     35.1800      9.9000
+    599.5201   1499.5300     35.1800      9.8900
+    599.6533   1499.5100     35.1800      9.8800
+    599.7865   1499.4900     35.1800      9.8800
+    599.9196   1499.4800     35.1800      9.8700
+    600.0528   1499.4600     35.1800      9.8700
+    600.1860   1499.4500     35.1800      9.8600
+    600.3191   1499.4500     35.1800      9.8600
+    600.4523   1499.4400     35.1800      9.8600
+    600.5854   1499.4400     35.1800      9.8600
+    600.7186   1499.4400     35.1800      9.8600
+    600.8517   1499.4300     35.1700      9.8600
+    600.9849   1499.4300     35.1700      9.8600
+    601.1180   1499.4300     35.1700      9.8600
+    601.2512   1459.2000     35.1700      0.0000
+    602.4495   1456.3500      0.0000      9.8500
+    602.5827   1456.3600      0.0000      9.8500
+    602.7158   1456.3600      0.0100      9.8500
+    602.8490   1499.4300     35.1800      9.8500
+    602.9821   1499.4200     35.1800      9.8400
+    603.1153   1499.4000     35.1800      9.8400
+    603.2484   1499.3700     35.1800      9.8300
+    603.3815   1499.3400     35.1800      9.8200
+    603.5146   1499.2900     35.1800      9.8000
+    603.6478   1499.2500     35.1800      9.7900
+    603.7809   1499.2000     35.1800      9.7800
+    603.9141   1499.1600     35.1800      9.7700
+    604.0472   1499.1200     35.1700      9.7600
+    604.1803   1499.0900     35.1700      9.7500
+    604.3135   1499.0700     35.1700      9.7400
+    604.4466   1499.0500     35.1700      9.7400
+    604.5797   1499.0500     35.1700      9.7400
+    604.7128   1499.0600     35.1700      9.7400
+    604.8459   1499.0700     35.1700      9.7400
+    604.9791   1499.0900     35.1700      9.7400
+    605.1122   1499.1100     35.1800      9.7500
+    605.2454   1499.1200     35.1800      9.7500
+    605.3785   1499.1400     35.1800      9.7500
+    605.5116   1499.1500     35.1900      9.7500
+    605.6447   1499.1600     35.1900      9.7600
+    605.7778   1499.1600     35.1900      9.7500
+    605.9109   1499.1600     35.1900      9.7500
+    606.0441   1499.1400     35.1900      9.7500
+    606.1772   1499.1200     35.2000      9.7400
+    606.3103   1499.0900     35.1900      9.7300
+    606.4434   1499.0700     35.1900      9.7200
+    606.5765   1499.0400     35.1900      9.7200
+    606.7097   1499.0100     35.1900      9.7100
+    606.8428   1498.9700     35.1900      9.7000
+    606.9758   1498.9500     35.1900      9.6900
+    607.1089   1498.9200     35.1800      9.6800
+    607.2421   1498.9000     35.1800      9.6800
+    607.3752   1498.8800     35.1800      9.6700
+    607.5083   1498.8700     35.1800      9.6700
+    607.6414   1498.8600     35.1800      9.6600
+    607.7745   1498.8500     35.1800      9.6600
+    607.9076   1498.8400     35.1800      9.6600
+    608.0407   1498.8400     35.1800      9.6600
+    608.1738   1498.8300     35.1800      9.6600
+    608.3069   1498.8300     35.1800      9.6600
+    608.4400   1498.8300     35.1800      9.6500
+    608.5731   1498.8300     35.1800      9.6500
+    608.7062   1498.8300     35.1800      9.6500
+    608.8394   1498.8200     35.1800      9.6500
+    608.9724   1498.8100     35.1800      9.6500
+    609.1055   1498.8100     35.1800      9.6400
+    609.2386   1498.8100     35.1800      9.6400
+    609.3716   1498.8100     35.1800      9.6400
+    609.5048   1498.8000     35.1800      9.6400
+    609.6379   1498.8000     35.1800      9.6400
+    609.7710   1498.8000     35.1800      9.6400
+    609.9041   1498.7900     35.1800      9.6400
+    610.0372   1459.3500     35.1800      0.0000
+    611.2349   1455.4400      0.0000      9.5900
+    611.3680   1455.4200      0.0000      9.5800
+    611.5010   1411.9000      0.0100      0.0000
+    613.6301   1455.2200      0.0000      9.5200
+    613.7632   1455.2100      0.0000      9.5200
+    613.8962   1455.2000      0.0000      9.5200
+    614.0293   1459.5100     35.2500      0.0000
+    615.2268   1455.0700      0.0000      9.4800
+    615.3598   1455.3200      0.0000      9.5400
+    615.4929   1455.5600      0.0000      9.6000
+    615.6259   1498.8100     35.0600      9.6600
+    615.7590   1498.9300     34.9900      9.7100
+    615.8920   1499.1400     34.9800      9.7700
+    616.0250   1459.0900     34.9100      0.0000
+    617.2224   1454.2800      0.0000      9.2800
+    617.3555   1454.2200      0.0000      9.2600
+    617.4885   1454.1700      0.0000      9.2500
+    617.6215   1497.3900     35.1200      9.2400
+    617.7545   1497.3400     35.1200      9.2200
+    617.8875   1497.2900     35.1200      9.2100
+    618.0206   1497.2400     35.1200      9.1900
+    618.1536   1497.1900     35.1200      9.1800
+    618.2866   1497.1500     35.1200      9.1700
+    618.4196   1497.1000     35.1200      9.1600
+    618.5527   1497.0600     35.1100      9.1500
+    618.6857   1497.0400     35.1100      9.1400
+    618.8187   1497.0100     35.1100      9.1300
+    618.9517   1496.9700     35.1100      9.1200
+    619.0848   1497.0700     35.2200      9.1100
+    619.2178   1497.0400     35.2200      9.1000
+    619.3508   1497.0100     35.2100      9.1000
+    619.4838   1496.9900     35.2100      9.0900
+    619.6168   1496.9700     35.2100      9.0800
+    619.7499   1497.0800     35.3200      9.0800
+    619.8829   1497.0400     35.3200      9.0600
+    620.0159   1497.0100     35.3200      9.0600
+    620.1489   1497.0000     35.3200      9.0500
+    620.2819   1496.9900     35.3200      9.0500
+    620.4149   1497.1300     35.4400      9.0500
+    620.5479   1497.1900     35.5000      9.0400
+    620.6810   1497.3200     35.6100      9.0400
+    620.8140   1497.4600     35.7300      9.0400
+    620.9470   1497.4800     35.7400      9.0400
+    621.0800   1497.5600     35.8100      9.0400
+    621.2130   1460.4700     35.8800      0.0000
+    622.4099   1453.3100      0.0000      9.0200
+    622.5430   1453.3000      0.0000      9.0200
+    622.6759   1412.0800      0.0000      0.0000
+    624.0059   1452.9700      0.0000      8.9300
+    624.1388   1452.9300      0.0000      8.9200
+    624.2718   1452.9000      0.0000      8.9100
+    624.4048   1459.8500     35.3700      0.0000
+    627.1971   1452.5000      0.0000      8.8000
+    627.3301   1452.4900      0.0000      8.8000
+    627.4630   1452.4800      0.0000      8.8000
+    627.5960   1495.8800     35.0800      8.8000
+    627.7289   1495.8700     35.0800      8.7900
+    627.8619   1495.8600     35.0800      8.7900
+    627.9949   1495.8600     35.0800      8.7900
+    628.1278   1496.0000     35.1900      8.7900
+    628.2608   1495.9900     35.1900      8.7900
+    628.3937   1496.1300     35.3100      8.7800
+    628.5267   1496.2700     35.4200      8.7800
+    628.6596   1496.3300     35.4700      8.7800
+    628.7926   1460.0600     35.4700      0.0000
+    629.9891   1452.3000      0.0000      8.7400
+    630.1220   1452.2700      0.0000      8.7400
+    630.2549   1452.2500      0.0000      8.7300
+    630.3879   1495.6600     35.0800      8.7200
+    630.5208   1495.6300     35.0800      8.7100
+    630.6537   1495.6000     35.0800      8.7100
+    630.7867   1495.5800     35.0800      8.7000
+    630.9196   1495.5600     35.0800      8.6900
+    631.0526   1495.5400     35.0700      8.6900
+    631.1854   1495.6000     35.0700      8.7100
+    631.3184   1495.6400     35.0700      8.7200
+    631.4513   1495.6800     35.0500      8.7300
+    631.5843   1495.7100     35.0300      8.7500
+    631.7172   1495.7500     35.0200      8.7600
+    631.8501   1495.7800     35.0000      8.7800
+    631.9830   1495.8100     34.9800      8.7900
+    632.1160   1495.7800     34.9700      8.7800
+    632.2488   1495.7800     34.9600      8.7900
+    632.3818   1459.4200     34.9600      0.0000
+    633.5780   1451.5300      0.0000      8.5500
+    633.7109   1451.4900      0.0000      8.5300
+    633.8439   1451.4600      0.0000      8.5300
+    633.9768   1494.9300     35.0700      8.5100
+    634.1097   1494.8900     35.0700      8.5100
+    634.2426   1494.8600     35.0700      8.5000
+    634.3755   1459.6000     35.0700      0.0000
+    635.5716   1451.2000      0.0000      8.4600
+    635.7045   1451.2000      0.0000      8.4600
+    635.8374   1451.2000      0.0000      8.4600
+    635.9703   1494.7200     35.0700      8.4500
+    636.1032   1494.7100     35.0700      8.4500
+    636.2361   1494.7000     35.0700      8.4400
+    636.3690   1494.6900     35.0700      8.4400
+    636.5018   1494.6800     35.0700      8.4400
+    636.6348   1494.6600     35.0700      8.4300
+    636.7676   1494.6500     35.0700      8.4300
+    636.9005   1494.6400     35.0700      8.4200
+    637.0334   1494.6200     35.0700      8.4200
+    637.1663   1494.6000     35.0700      8.4100
+    637.2992   1494.5900     35.0700      8.4100
+    637.4321   1494.5800     35.0700      8.4100
+    637.5649   1494.5700     35.0800      8.4000
+    637.6978   1494.5600     35.0800      8.4000
+    637.8307   1494.5500     35.0800      8.3900
+    637.9636   1494.5400     35.0800      8.3900
+    638.0964   1494.5300     35.0700      8.3900
+    638.2294   1494.5300     35.0700      8.3900
+    638.3622   1494.5300     35.0800      8.3900
+    638.4951   1494.5300     35.0700      8.3900
+    638.6279   1494.5200     35.0700      8.3800
+    638.7609   1459.6800     35.0700      0.0000
+    639.9567   1450.9200      0.0000      8.3700
+    640.0895   1450.9200      0.0000      8.3700
+    640.2224   1450.9300      0.0000      8.3700
+    640.3552   1494.5000     35.0700      8.3700
+    640.4881   1494.5000     35.0700      8.3700
+    640.6210   1494.5000     35.0700      8.3700
+    640.7538   1494.5000     35.0700      8.3700
+    640.8867   1494.5100     35.0700      8.3700
+    641.0195   1494.5100     35.0700      8.3700
+    641.1523   1494.5100     35.0700      8.3700
+    641.2853   1494.5200     35.0700      8.3700
+    641.4181   1494.5100     35.0700      8.3700
+    641.5510   1494.5200     35.0700      8.3700
+    641.6838   1494.5300     35.0700      8.3700
+    641.8167   1494.5300     35.0700      8.3700
+    641.9495   1494.5300     35.0700      8.3700
+    642.0824   1494.5200     35.0700      8.3700
+    642.2152   1494.5300     35.0700      8.3700
+    642.3480   1494.5200     35.0700      8.3700
+    642.4809   1494.5200     35.0700      8.3700
+    642.6137   1494.5300     35.0700      8.3700
+    642.7466   1459.7300     35.0600      0.0000
+    643.9421   1450.9000      0.0000      8.3500
+    644.0750   1450.9000      0.0000      8.3500
+    644.2078   1450.9000      0.0000      8.3500
+    644.3406   1459.7700     35.0800      0.0000
+    645.5361   1450.8700      0.0000      8.3400
+    645.6689   1450.8600      0.0000      8.3400
+    645.8017   1450.8600      0.0000      8.3300
+    645.9345   1494.4500     35.0800      8.3300
+    646.0674   1494.4500     35.0800      8.3300
+    646.2001   1494.4500     35.0800      8.3300
+    646.3330   1494.4500     35.0800      8.3300
+    646.4658   1494.4400     35.0800      8.3300
+    646.5986   1494.4400     35.0800      8.3300
+    646.7314   1494.4500     35.0800      8.3300
+    646.8642   1459.8200     35.0800      0.0000
+    648.3251   1450.8200      0.0000      8.3200
+    648.4579   1450.8200      0.0000      8.3200
+    648.5907   1450.8300      0.0000      8.3200
+    648.7236   1494.4400     35.0700      8.3200
+    648.8563   1494.4400     35.0700      8.3200
+    648.9891   1494.4400     35.0700      8.3200
+    649.1219   1494.4400     35.0700      8.3200
+    649.2547   1494.4500     35.0800      8.3200
+    649.3875   1494.4500     35.0800      8.3200
+    649.5203   1459.8600     35.0800      0.0000
+    650.7154   1450.8600      0.0000      8.3200
+    650.8482   1450.8700      0.0000      8.3200
+    650.9810   1450.8800      0.0000      8.3200
+    651.1137   1494.4900     35.0800      8.3200
+    651.2465   1494.5000     35.0800      8.3200
+    651.3793   1494.5000     35.0900      8.3200
+    651.5121   1459.9000     35.0900      0.0000
+    652.7070   1450.8900      0.0000      8.3200
+    652.8398   1450.9000      0.0000      8.3200
+    652.9726   1450.9000      0.0000      8.3200
+    653.1053   1494.5200     35.0800      8.3200
+    653.2381   1494.5200     35.0900      8.3200
+    653.3708   1494.5200     35.0900      8.3200
+    653.5036   1494.5200     35.0900      8.3100
+    653.6364   1494.5200     35.0800      8.3100
+    653.7692   1494.5100     35.0800      8.3100
+    653.9019   1494.5100     35.0800      8.3100
+    654.0347   1494.5000     35.0800      8.3100
+    654.1675   1494.5000     35.0800      8.3100
+    654.3002   1494.4900     35.0800      8.3000
+    654.4329   1494.4900     35.0800      8.3000
+    654.5657   1494.4900     35.0800      8.3000
+    654.6984   1494.4900     35.0800      8.3000
+    654.8312   1494.4800     35.0800      8.3000
+    654.9639   1494.4700     35.0800      8.3000
+    655.0967   1494.4700     35.0800      8.2900
+    655.2294   1494.4700     35.0800      8.2900
+    655.3622   1494.4700     35.0800      8.2900
+    655.4949   1494.4600     35.0800      8.2900
+    655.6277   1494.4500     35.0800      8.2900
+    655.7604   1494.4500     35.0800      8.2900
+    655.8932   1494.4400     35.0800      8.2800
+    656.0259   1494.4400     35.0800      8.2800
+    656.1587   1494.4400     35.0800      8.2800
+    656.2914   1459.9800     35.0800      0.0000
+    657.4861   1450.7600      0.0000      8.2700
+    657.6188   1450.7600      0.0000      8.2700
+    657.7515   1450.7600      0.0000      8.2700
+    657.8843   1494.4000     35.0900      8.2600
+    658.0170   1494.3900     35.0800      8.2600
+    658.1497   1494.3900     35.0900      8.2600
+    658.2824   1494.3800     35.0800      8.2600
+    658.4152   1494.3700     35.0800      8.2500
+    658.5479   1494.3600     35.0800      8.2500
+    658.6807   1494.3500     35.0800      8.2500
+    658.8134   1494.3400     35.0800      8.2400
+    658.9460   1494.3200     35.0800      8.2400
+    659.0788   1460.0200     35.0800      0.0000
+    661.0695   1450.3200      0.0000      8.1500
+    661.2022   1450.3100      0.0000      8.1400
+    661.3349   1450.3000      0.0000      8.1400
+    661.4677   1493.9800     35.0800      8.1400
+    661.6003   1460.0600     35.0700      0.0000
+    663.0600   1449.9400      0.0000      8.0500
+    663.1927   1449.9000      0.0000      8.0400
+    663.3254   1449.8700      0.0000      8.0300
+    663.4580   1493.5600     35.0700      8.0200
+    663.5908   1493.5200     35.0600      8.0100
+    663.7234   1493.4900     35.0600      8.0000
+    663.8561   1493.4600     35.0600      8.0000
+    663.9888   1493.4400     35.0600      7.9900
+    664.1215   1493.4100     35.0600      7.9800
+    664.2542   1493.3800     35.0600      7.9700
+    664.3868   1493.3600     35.0600      7.9700
+    664.5195   1493.3300     35.0600      7.9600
+    664.6522   1460.0800     35.0600      0.0000
+    665.8463   1449.0400      0.0000      7.8300
+    665.9789   1448.9700      0.0000      7.8100
+    666.1116   1448.9100      0.0000      7.7900
+    666.2443   1492.6900     35.0700      7.7800
+    666.3770   1492.6500     35.0700      7.7700
+    666.5096   1492.6000     35.0700      7.7600
+    666.6423   1460.1300     35.0700      0.0000
+    667.8362   1448.6300      0.0000      7.7200
+    667.9689   1448.6300      0.0000      7.7200
+    668.1016   1448.6300      0.0000      7.7200
+    668.2342   1492.4600     35.0500      7.7200
+    668.3669   1492.4600     35.0500      7.7200
+    668.4995   1492.4600     35.0500      7.7100
+    668.6322   1492.4600     35.0500      7.7100
+    668.7648   1492.4600     35.0500      7.7100
+    668.8974   1492.4600     35.0500      7.7100
+    669.0301   1492.4600     35.0500      7.7100
+    669.1627   1492.4700     35.0500      7.7100
+    669.2954   1492.4700     35.0500      7.7100
+    669.4280   1492.4700     35.0500      7.7100
+    669.5607   1492.4700     35.0500      7.7100
+    669.6933   1492.4700     35.0500      7.7100
+    669.8260   1492.4800     35.0500      7.7100
+    669.9586   1492.4800     35.0500      7.7100
+    670.0912   1492.4800     35.0500      7.7100
+    670.2239   1492.4800     35.0500      7.7100
+    670.3565   1492.4900     35.0500      7.7100
+    670.4891   1492.4900     35.0500      7.7100
+    670.6218   1492.4900     35.0500      7.7100
+    670.7545   1492.4900     35.0500      7.7100
+    670.8870   1492.4900     35.0500      7.7100
+    671.0197   1492.5000     35.0500      7.7100
+    671.1523   1492.5000     35.0500      7.7100
+    671.2849   1492.5000     35.0500      7.7100
+    671.4176   1492.5000     35.0500      7.7100
+    671.5502   1492.5000     35.0500      7.7100
+    671.6829   1492.5000     35.0500      7.7100
+    671.8154   1492.4900     35.0500      7.7100
+    671.9481   1492.4900     35.0500      7.7100
+    672.0807   1492.4800     35.0500      7.7000
+    672.2133   1492.4700     35.0500      7.7000
+    672.3459   1492.4500     35.0500      7.7000
+    672.4786   1492.4400     35.0500      7.6900
+    672.6112   1492.4300     35.0500      7.6900
+    672.7438   1492.4100     35.0500      7.6800
+    672.8765   1492.3900     35.0500      7.6800
+    673.0090   1460.2100     35.0500      0.0000
+    676.1916   1447.9800      0.0000      7.5300
+    676.3242   1447.9700      0.0000      7.5300
+    676.4568   1447.9500      0.0000      7.5300
+    676.5894   1491.8900     35.0700      7.5200
+    676.7219   1491.8700     35.0600      7.5200
+    676.8546   1491.8500     35.0600      7.5200
+    676.9871   1491.8400     35.0600      7.5100
+    677.1197   1491.8300     35.0600      7.5100
+    677.2523   1491.8200     35.0600      7.5000
+    677.3849   1491.8100     35.0600      7.5000
+    677.5175   1491.8000     35.0600      7.5000
+    677.6500   1491.8000     35.0600      7.5000
+    677.7827   1491.7900     35.0600      7.5000
+    677.9152   1491.7900     35.0600      7.5000
+    678.0478   1491.7900     35.0600      7.4900
+    678.1804   1491.7800     35.0600      7.4900
+    678.3130   1491.7800     35.0600      7.4900
+    678.4455   1491.7800     35.0600      7.4900
+    678.5781   1491.7700     35.0600      7.4900
+    678.7107   1491.7800     35.0600      7.4900
+    678.8432   1491.7800     35.0600      7.4900
+    678.9758   1491.7800     35.0600      7.4900
+    679.1084   1491.7700     35.0600      7.4900
+    679.2410   1491.7700     35.0600      7.4800
+    679.3735   1491.7700     35.0600      7.4800
+    679.5061   1491.7600     35.0600      7.4800
+    679.6387   1491.7500     35.0600      7.4800
+    679.7712   1460.3400     35.0600      0.0000
+    680.9643   1447.6200      0.0000      7.4300
+    681.0969   1447.6000      0.0000      7.4300
+    681.2294   1447.5900      0.0000      7.4200
+    681.3620   1491.5600     35.0700      7.4200
+    681.4945   1491.5400     35.0600      7.4100
+    681.6271   1491.5200     35.0600      7.4100
+    681.7596   1491.5000     35.0600      7.4000
+    681.8922   1491.4800     35.0600      7.4000
+    682.0247   1491.4600     35.0600      7.3900
+    682.1572   1491.4400     35.0600      7.3800
+    682.2898   1491.4200     35.0700      7.3800
+    682.4224   1491.4000     35.0600      7.3700
+    682.5549   1491.3800     35.0700      7.3700
+    682.6874   1491.3600     35.0700      7.3600
+    682.8200   1491.3400     35.0700      7.3600
+    682.9525   1491.3300     35.0700      7.3500
+    683.0851   1491.3100     35.0600      7.3500
+    683.2177   1491.3000     35.0600      7.3400
+    683.3502   1491.2900     35.0600      7.3400
+    683.4827   1491.2800     35.0600      7.3400
+    683.6152   1491.2800     35.0600      7.3300
+    683.7478   1491.2600     35.0600      7.3300
+    683.8803   1491.2600     35.0600      7.3300
+    684.0129   1491.2500     35.0600      7.3300
+    684.1454   1491.2400     35.0600      7.3300
+    684.2779   1460.4100     35.0600      0.0000
+    686.5308   1447.1800      0.0000      7.3100
+    686.6633   1447.1800      0.0000      7.3100
+    686.7959   1447.1900      0.0000      7.3100
+    686.9283   1491.2200     35.0600      7.3100
+    687.0609   1491.2100     35.0600      7.3100
+    687.1934   1491.2100     35.0600      7.3100
+    687.3259   1460.4500     35.0600      0.0000
+    688.5185   1447.1500      0.0000      7.3000
+    688.6509   1447.1500      0.0000      7.2900
+    688.7834   1447.1500      0.0000      7.2900
+    688.9160   1491.1900     35.0600      7.2900
+    689.0485   1491.1800     35.0600      7.2900
+    689.1810   1491.1800     35.0600      7.2900
+    689.3134   1491.1800     35.0600      7.2900
+    689.4460   1491.1700     35.0600      7.2800
+    689.5784   1491.1600     35.0600      7.2800
+    689.7109   1491.1500     35.0600      7.2800
+    689.8434   1491.1400     35.0600      7.2700
+    689.9759   1491.1300     35.0600      7.2700
+    690.1084   1460.5100     35.0600      0.0000
+    691.3008   1446.8100      0.0000      7.2000
+    691.4332   1446.7700      0.0000      7.1900
+    691.5657   1446.7300      0.0000      7.1800
+    691.6982   1490.7800     35.0600      7.1700
+    691.8307   1490.7500     35.0600      7.1600
+    691.9631   1490.7100     35.0600      7.1600
+    692.0956   1490.6800     35.0600      7.1500
+    692.2281   1490.6700     35.0600      7.1400
+    692.3605   1490.6500     35.0500      7.1400
+    692.4930   1490.6400     35.0500      7.1400
+    692.6255   1490.6400     35.0500      7.1400
+    692.7580   1490.6500     35.0500      7.1400
+    692.8904   1460.5400     35.0500      0.0000
+    694.0826   1446.5200      0.0000      7.1300
+    694.2151   1446.5200      0.0000      7.1200
+    694.3475   1446.5100      0.0000      7.1200
+    694.4800   1460.5800     35.0600      0.0000
+    695.6721   1446.4300      0.0000      7.1000
+    695.8045   1446.4300      0.0000      7.1000
+    695.9370   1446.4200      0.0000      7.1000
+    696.0694   1490.5400     35.0600      7.0900
+    696.2018   1490.5400     35.0600      7.0900
+    696.3343   1490.5300     35.0600      7.0900
+    696.4667   1490.5300     35.0500      7.0900
+    696.5992   1490.5200     35.0500      7.0900
+    696.7316   1490.5200     35.0600      7.0900
+    696.8640   1490.5200     35.0600      7.0800
+    696.9965   1490.5200     35.0600      7.0800
+    697.1289   1490.5100     35.0600      7.0800
+    697.2614   1490.5100     35.0600      7.0800
+    697.3938   1490.5000     35.0600      7.0800
+    697.5262   1490.5000     35.0500      7.0800
+    697.6587   1490.5000     35.0600      7.0800
+    697.7911   1490.5000     35.0600      7.0700
+    697.9235   1490.4900     35.0600      7.0700
+    698.0560   1490.4800     35.0600      7.0700
+    698.1884   1490.4700     35.0500      7.0700
+    698.3208   1490.4500     35.0600      7.0600
+    698.4532   1490.4400     35.0600      7.0600
+    698.5857   1490.4200     35.0600      7.0500
+    698.7181   1490.4000     35.0600      7.0500
+    698.8505   1490.3800     35.0600      7.0400
+    698.9829   1490.3500     35.0600      7.0300
+    699.1154   1490.3300     35.0600      7.0300
+    699.2478   1460.6500     35.0600      0.0000
+    700.4395   1445.8300      0.0000      6.9400
+    700.5720   1445.8000      0.0000      6.9300
+    700.7043   1445.8200      0.0000      6.9400
+    700.8367   1489.9800     35.0400      6.9300
+    700.9692   1489.9600     35.0400      6.9300
+    701.1016   1489.9500     35.0400      6.9200
+    701.2340   1489.9400     35.0400      6.9200
+    701.3664   1489.9200     35.0400      6.9200
+    701.4988   1489.9100     35.0400      6.9100
+    701.6312   1489.8900     35.0400      6.9100
+    701.7636   1489.8900     35.0400      6.9100
+    701.8960   1489.8400     35.0400      6.8900
+    702.0284   1489.8400     35.0400      6.8900
+    702.1608   1489.8300     35.0400      6.8900
+    702.2932   1489.8200     35.0500      6.8800
+    702.4256   1489.8200     35.0500      6.8800
+    702.5580   1489.8100     35.0500      6.8800
+    702.6904   1489.7900     35.0500      6.8800
+    702.8228   1489.7800     35.0500      6.8700
+    702.9552   1489.7700     35.0500      6.8700
+    703.0876   1489.7500     35.0500      6.8600
+    703.2199   1489.7300     35.0500      6.8600
+    703.3524   1489.7100     35.0500      6.8500
+    703.4847   1489.6900     35.0500      6.8500
+    703.6171   1489.6800     35.0500      6.8400
+    703.7495   1489.6600     35.0500      6.8400
+    703.8819   1489.6500     35.0500      6.8300
+    704.0143   1489.6500     35.0500      6.8300
+    704.1467   1489.6400     35.0500      6.8300
+    704.2791   1489.6500     35.0500      6.8300
+    704.4114   1489.6500     35.0500      6.8300
+    704.5438   1489.6500     35.0500      6.8300
+    704.6762   1489.6500     35.0500      6.8300
+    704.8086   1489.6500     35.0400      6.8300
+    704.9410   1489.6500     35.0400      6.8300
+    705.0734   1489.6500     35.0400      6.8300
+    705.2057   1489.6500     35.0400      6.8300
+    705.3381   1489.6600     35.0400      6.8300
+    705.4705   1489.6500     35.0400      6.8300
+    705.6028   1489.6600     35.0400      6.8300
+    705.7352   1489.6600     35.0400      6.8300
+    705.8676   1489.6600     35.0400      6.8300
+    705.9999   1489.6700     35.0400      6.8300
+    706.1323   1489.6700     35.0400      6.8300
+    706.2647   1489.6700     35.0400      6.8300
+    706.3970   1489.6700     35.0400      6.8300
+    706.5294   1489.6700     35.0400      6.8300
+    706.6618   1489.6800     35.0400      6.8300
+    706.7941   1489.6700     35.0400      6.8300
+    706.9265   1489.6700     35.0400      6.8300
+    707.0589   1489.6700     35.0400      6.8300
+    707.1913   1460.7600     35.0400      0.0000
+    708.3824   1445.3300      0.0000      6.8000
+    708.5148   1445.3300      0.0000      6.8000
+    708.6472   1445.3200      0.0000      6.7900
+    708.7795   1489.5800     35.0500      6.7900
+    708.9118   1489.5800     35.0500      6.7900
+    709.0442   1489.5800     35.0500      6.7900
+    709.1765   1489.5800     35.0500      6.7900
+    709.3089   1489.5800     35.0500      6.7900
+    709.4412   1489.5800     35.0600      6.7900
+    709.5736   1489.5800     35.0600      6.7900
+    709.7059   1489.5800     35.0600      6.7900
+    709.8383   1489.5800     35.0600      6.7900
+    709.9706   1489.5800     35.0600      6.7900
+    710.1029   1489.5800     35.0600      6.7800
+    710.2353   1489.5800     35.0600      6.7800
+    710.3676   1460.8400     35.0600      0.0000
+    711.5586   1445.1900      0.0000      6.7500
+    711.6910   1445.1700      0.0000      6.7500
+    711.8232   1445.1600      0.0000      6.7400
+    711.9556   1489.4300     35.0600      6.7400
+    712.0880   1489.4200     35.0600      6.7400
+    712.2202   1489.4100     35.0600      6.7300
+    712.3526   1489.4000     35.0600      6.7300
+    712.4849   1489.3800     35.0600      6.7300
+    712.6172   1489.3700     35.0600      6.7200
+    712.7495   1489.3700     35.0600      6.7200
+    712.8819   1489.3600     35.0500      6.7200
+    713.0142   1489.3500     35.0500      6.7200
+    713.1465   1489.3500     35.0500      6.7100
+    713.2788   1489.3400     35.0500      6.7100
+    713.4111   1489.3400     35.0500      6.7100
+    713.5435   1489.3300     35.0500      6.7100
+    713.6757   1489.3300     35.0500      6.7100
+    713.8080   1489.3300     35.0500      6.7100
+    713.9404   1489.3300     35.0500      6.7100
+    714.0726   1489.3200     35.0500      6.7000
+    714.2050   1489.3200     35.0500      6.7000
+    714.3373   1489.3100     35.0500      6.7000
+    714.4696   1489.3100     35.0500      6.7000
+    714.6019   1489.3100     35.0500      6.7000
+    714.7343   1489.3000     35.0500      6.7000
+    714.8665   1489.3000     35.0500      6.6900
+    714.9988   1489.2900     35.0500      6.6900
+    715.1311   1460.9000     35.0500      0.0000
+    719.4966   1444.4900      0.0000      6.5600
+    719.6288   1444.4800      0.0000      6.5600
+    719.7610   1444.4800      0.0000      6.5600
+    719.8934   1488.8300     35.0400      6.5600
+    720.0256   1488.8200     35.0400      6.5600
+    720.1579   1488.8200     35.0400      6.5500
+    720.2901   1488.8100     35.0400      6.5500
+    720.4224   1488.8100     35.0400      6.5500
+    720.5546   1488.8100     35.0400      6.5500
+    720.6869   1488.8100     35.0400      6.5500
+    720.8192   1488.8100     35.0400      6.5500
+    720.9514   1488.8000     35.0400      6.5400
+    721.0837   1488.8000     35.0400      6.5400
+    721.2159   1488.7900     35.0400      6.5400
+    721.3482   1488.7900     35.0400      6.5400
+    721.4805   1488.7900     35.0400      6.5400
+    721.6127   1488.7900     35.0400      6.5400
+    721.7449   1488.7800     35.0400      6.5400
+    721.8772   1488.7800     35.0400      6.5400
+    722.0095   1488.7800     35.0400      6.5400
+    722.1417   1488.7800     35.0400      6.5400
+    722.2740   1461.0100     35.0400      0.0000
+    723.4642   1444.3600      0.0000      6.5200
+    723.5964   1444.3400      0.0000      6.5100
+    723.7286   1444.3300      0.0000      6.5100
+    723.8608   1488.6900     35.0400      6.5000
+    723.9931   1488.6800     35.0400      6.5000
+    724.1254   1488.6600     35.0400      6.5000
+    724.2576   1461.0400     35.0400      0.0000
+    726.6376   1444.1700      0.0000      6.4600
+    726.7698   1444.1600      0.0000      6.4600
+    726.9020   1444.1500      0.0000      6.4600
+    727.0342   1488.5300     35.0400      6.4500
+    727.1664   1488.5100     35.0400      6.4500
+    727.2986   1488.5000     35.0400      6.4400
+    727.4309   1488.4900     35.0400      6.4400
+    727.5630   1488.4800     35.0400      6.4400
+    727.6953   1488.4700     35.0400      6.4300
+    727.8275   1488.4600     35.0400      6.4300
+    727.9597   1488.4500     35.0400      6.4300
+    728.0919   1488.4400     35.0400      6.4200
+    728.2241   1488.4300     35.0400      6.4200
+    728.3563   1488.4200     35.0400      6.4200
+    728.4885   1488.4100     35.0400      6.4100
+    728.6207   1488.4000     35.0400      6.4100
+    728.7529   1488.3900     35.0400      6.4100
+    728.8851   1488.3800     35.0400      6.4100
+    729.0173   1488.3800     35.0400      6.4000
+    729.1495   1488.3700     35.0300      6.4000
+    729.2817   1488.3600     35.0300      6.4000
+    729.4139   1488.3500     35.0300      6.4000
+    729.5461   1488.3500     35.0300      6.4000
+    729.6783   1488.3500     35.0300      6.4000
+    729.8105   1488.3400     35.0300      6.3900
+    729.9427   1488.3400     35.0300      6.3900
+    730.0749   1488.3300     35.0300      6.3900
+    730.2070   1488.3300     35.0300      6.3900
+    730.3393   1488.3300     35.0400      6.3900
+    730.4714   1488.3200     35.0400      6.3900
+    730.6036   1488.3200     35.0400      6.3800
+    730.7358   1488.3100     35.0300      6.3800
+    730.8680   1488.3100     35.0300      6.3800
+    731.0002   1488.3100     35.0300      6.3800
+    731.1323   1488.3000     35.0300      6.3800
+    731.2645   1488.3000     35.0300      6.3800
+    731.3967   1488.2900     35.0300      6.3700
+    731.5289   1488.2900     35.0300      6.3700
+    731.6611   1488.2800     35.0300      6.3700
+    731.7932   1488.2800     35.0300      6.3700
+    731.9254   1488.2800     35.0300      6.3700
+    732.0576   1488.2700     35.0300      6.3700
+    732.1898   1488.2700     35.0300      6.3600
+    732.3220   1488.2600     35.0300      6.3600
+    732.4542   1488.2500     35.0300      6.3600
+    732.5863   1488.2500     35.0300      6.3600
+    732.7185   1488.2500     35.0300      6.3600
+    732.8506   1488.2400     35.0300      6.3600
+    732.9828   1488.2400     35.0300      6.3500
+    733.1150   1488.2400     35.0300      6.3500
+    733.2471   1488.2400     35.0300      6.3500
+    733.3793   1461.1800     35.0300      0.0000
+    734.5687   1443.8000      0.0000      6.3500
+    734.7009   1443.8000      0.0000      6.3500
+    734.8331   1443.8000      0.0000      6.3500
+    734.9652   1488.2500     35.0300      6.3500
+    735.0974   1488.2400     35.0300      6.3500
+    735.2295   1488.2500     35.0300      6.3500
+    735.3616   1488.2500     35.0300      6.3500
+    735.4938   1488.2600     35.0300      6.3500
+    735.6259   1488.2600     35.0300      6.3500
+    735.7581   1488.2600     35.0300      6.3500
+    735.8903   1488.2700     35.0300      6.3500
+    736.0224   1488.2700     35.0300      6.3500
+    736.1545   1488.2700     35.0300      6.3500
+    736.2867   1488.2800     35.0300      6.3500
+    736.4188   1488.2700     35.0300      6.3500
+    736.5510   1488.2800     35.0300      6.3500
+    736.6831   1488.2800     35.0300      6.3500
+    736.8152   1488.2800     35.0300      6.3500
+    736.9474   1488.2900     35.0400      6.3500
+    737.0795   1488.2900     35.0300      6.3500
+    737.2116   1488.2900     35.0300      6.3500
+    737.3438   1488.2900     35.0300      6.3500
+    737.4759   1488.2900     35.0400      6.3500
+    737.6081   1488.2900     35.0300      6.3500
+    737.7402   1488.2900     35.0300      6.3500
+    737.8723   1488.2900     35.0300      6.3500
+    738.0045   1488.2900     35.0300      6.3500
+    738.1366   1488.2900     35.0400      6.3400
+    738.2687   1488.2900     35.0400      6.3400
+    738.4008   1488.2900     35.0400      6.3400
+    738.5330   1488.3000     35.0400      6.3400
+    738.6651   1488.3000     35.0300      6.3400
+    738.7972   1488.2900     35.0300      6.3400
+    738.9293   1488.2900     35.0300      6.3400
+    739.0615   1488.2900     35.0300      6.3400
+    739.1936   1488.2900     35.0300      6.3400
+    739.3257   1488.2900     35.0300      6.3400
+    739.4578   1488.3000     35.0300      6.3400
+    739.5899   1488.3000     35.0300      6.3400
+    739.7220   1488.2900     35.0300      6.3400
+    739.8542   1488.3000     35.0300      6.3400
+    739.9863   1488.3000     35.0300      6.3400
+    740.1184   1488.2900     35.0300      6.3400
+    740.2505   1488.2900     35.0300      6.3400
+    740.3826   1488.2900     35.0300      6.3400
+    740.5147   1488.2900     35.0300      6.3400
+    740.6469   1488.2900     35.0300      6.3400
+    740.7789   1488.2900     35.0300      6.3300
+    740.9111   1488.2900     35.0300      6.3300
+    741.0432   1488.2900     35.0300      6.3300
+    741.1753   1488.2800     35.0300      6.3300
+    741.3074   1461.3100     35.0300      0.0000
+    742.4963   1443.7900      0.0000      6.3200
+    742.6284   1443.7800      0.0000      6.3100
+    742.7605   1443.7800      0.0000      6.3100
+    742.8926   1461.3400     35.0300      0.0000
+    744.0814   1443.7500      0.0000      6.3000
+    744.2135   1443.7400      0.0000      6.3000
+    744.3455   1443.7400      0.0000      6.3000
+    744.4777   1488.1900     35.0200      6.3000
+    744.6097   1488.1800     35.0200      6.2900
+    744.7418   1488.1800     35.0200      6.2900
+    744.8738   1488.1800     35.0200      6.2900
+    745.0059   1488.1800     35.0200      6.2900
+    745.1380   1488.1800     35.0300      6.2900
+    745.2701   1488.1800     35.0300      6.2900
+    745.4022   1488.1800     35.0300      6.2900
+    745.5342   1488.1800     35.0300      6.2900
+    745.6663   1488.1700     35.0300      6.2800
+    745.7984   1488.1700     35.0300      6.2800
+    745.9305   1488.1600     35.0300      6.2800
+    746.0626   1488.1500     35.0300      6.2800
+    746.1946   1488.1500     35.0300      6.2800
+    746.3267   1488.1400     35.0300      6.2700
+    746.4587   1461.3900     35.0300      0.0000
+    748.8358   1443.4700      0.0000      6.2200
+    748.9678   1443.4700      0.0000      6.2200
+    749.0999   1443.4700      0.0000      6.2200
+    749.2319   1487.9600     35.0300      6.2200
+    749.3640   1487.9600     35.0300      6.2200
+    749.4960   1487.9600     35.0300      6.2200
+    749.6281   1487.9600     35.0300      6.2100
+    749.7601   1487.9600     35.0300      6.2100
+    749.8922   1487.9500     35.0300      6.2100
+    750.0242   1487.9500     35.0300      6.2100
+    750.1562   1487.9500     35.0300      6.2100
+    750.2883   1487.9400     35.0200      6.2100
+    750.4203   1487.9400     35.0200      6.2100
+    750.5523   1487.9400     35.0200      6.2100
+    750.6843   1487.9400     35.0200      6.2100
+    750.8164   1487.9400     35.0200      6.2100
+    750.9484   1487.9500     35.0200      6.2100
+    751.0805   1487.9500     35.0200      6.2100
+    751.2125   1487.9500     35.0200      6.2100
+    751.3445   1487.9500     35.0300      6.2100
+    751.4766   1487.9500     35.0300      6.2000
+    751.6086   1487.9500     35.0300      6.2000
+    751.7406   1487.9400     35.0300      6.2000
+    751.8726   1487.9400     35.0300      6.2000
+    752.0047   1487.9400     35.0300      6.2000
+    752.1367   1487.9400     35.0300      6.2000
+    752.2687   1487.9400     35.0300      6.2000
+    752.4007   1461.4900     35.0300      0.0000
+    753.5889   1443.3800      0.0000      6.1800
+    753.7209   1443.3700      0.0000      6.1800
+    753.8529   1443.3800      0.0000      6.1800
+    753.9849   1487.8900     35.0300      6.1800
+    754.1169   1487.8900     35.0300      6.1800
+    754.2489   1487.8800     35.0300      6.1800
+    754.3810   1487.8800     35.0300      6.1800
+    754.5129   1487.8800     35.0200      6.1800
+    754.6450   1487.8800     35.0200      6.1800
+    754.7770   1487.8800     35.0200      6.1800
+    754.9089   1487.8800     35.0200      6.1700
+    755.0410   1487.8800     35.0200      6.1700
+    755.1730   1487.8800     35.0200      6.1700
+    755.3050   1487.8800     35.0200      6.1700
+    755.4370   1487.8800     35.0200      6.1700
+    755.5690   1487.8800     35.0200      6.1700
+    755.7010   1487.8800     35.0200      6.1700
+    755.8330   1487.8800     35.0300      6.1700
+    755.9650   1461.5400     35.0300      0.0000
+    757.1529   1443.3200      0.0000      6.1600
+    757.2849   1443.3200      0.0000      6.1600
+    757.4169   1443.3300      0.0000      6.1600
+    757.5488   1487.8500     35.0200      6.1600
+    757.6808   1487.8500     35.0200      6.1500
+    757.8128   1487.8400     35.0200      6.1500
+    757.9448   1487.8400     35.0300      6.1500
+    758.0767   1487.8500     35.0300      6.1500
+    758.2087   1487.8500     35.0300      6.1500
+    758.3407   1487.8500     35.0300      6.1500
+    758.4727   1487.8500     35.0300      6.1500
+    758.6047   1487.8500     35.0300      6.1500
+    758.7366   1487.8500     35.0300      6.1500
+    758.8687   1487.8500     35.0300      6.1500
+    759.0005   1487.8500     35.0300      6.1500
+    759.1326   1487.8400     35.0300      6.1500
+    759.2645   1487.8400     35.0300      6.1500
+    759.3965   1487.8400     35.0200      6.1400
+    759.5284   1487.8300     35.0200      6.1400
+    759.6604   1487.8300     35.0200      6.1400
+    759.7924   1487.8300     35.0200      6.1400
+    759.9244   1487.8200     35.0200      6.1400
+    760.0563   1487.8300     35.0200      6.1400
+    760.1883   1487.8200     35.0200      6.1400
+    760.3203   1461.6100     35.0200      0.0000
+    761.5079   1443.2800      0.0000      6.1300
+    761.6398   1443.2800      0.0000      6.1300
+    761.7718   1443.2800      0.0000      6.1300
+    761.9037   1487.8200     35.0300      6.1300
+    762.0356   1487.8200     35.0200      6.1300
+    762.1677   1487.8200     35.0200      6.1300
+    762.2996   1487.8200     35.0200      6.1300
+    762.4315   1487.8100     35.0200      6.1300
+    762.5635   1487.8100     35.0200      6.1300
+    762.6954   1487.8100     35.0200      6.1200
+    762.8274   1487.8100     35.0200      6.1200
+    762.9593   1487.8100     35.0200      6.1200
+    763.0912   1487.8000     35.0200      6.1200
+    763.2232   1487.8000     35.0200      6.1200
+    763.3552   1487.8100     35.0200      6.1200
+    763.4871   1461.6600     35.0200      0.0000
+    764.6745   1443.2200      0.0000      6.1100
+    764.8064   1443.2100      0.0000      6.1000
+    764.9384   1443.2200      0.0000      6.1000
+    765.0703   1487.7600     35.0200      6.1000
+    765.2022   1487.7600     35.0200      6.1000
+    765.3341   1487.7600     35.0200      6.1000
+    765.4661   1487.7600     35.0300      6.1000
+    765.5980   1487.7600     35.0200      6.1000
+    765.7299   1487.7500     35.0300      6.1000
+    765.8618   1487.7500     35.0200      6.1000
+    765.9937   1487.7500     35.0200      6.0900
+    766.1257   1487.7400     35.0200      6.0900
+    766.2576   1487.7400     35.0200      6.0900
+    766.3895   1487.7400     35.0200      6.0900
+    766.5214   1487.7400     35.0200      6.0900
+    766.6533   1487.7400     35.0200      6.0900
+    766.7852   1487.7400     35.0200      6.0900
+    766.9171   1487.7400     35.0200      6.0900
+    767.0491   1487.7400     35.0200      6.0900
+    767.1809   1487.7400     35.0200      6.0900
+    767.3129   1487.7400     35.0200      6.0900
+    767.4448   1487.7400     35.0200      6.0900
+    767.5767   1487.7400     35.0200      6.0900
+    767.7086   1487.7400     35.0200      6.0900
+    767.8405   1487.7400     35.0200      6.0900
+    767.9724   1487.7400     35.0200      6.0800
+    768.1043   1487.7400     35.0200      6.0800
+    768.2362   1487.7400     35.0200      6.0800
+    768.3681   1487.7400     35.0200      6.0800
+    768.5000   1487.7400     35.0200      6.0800
+    768.6319   1487.7400     35.0300      6.0800
+    768.7639   1487.7400     35.0300      6.0800
+    768.8957   1487.7400     35.0300      6.0800
+    769.0276   1487.7500     35.0300      6.0800
+    769.1595   1487.7500     35.0300      6.0800
+    769.2914   1487.7500     35.0300      6.0800
+    769.4233   1487.7500     35.0300      6.0800
+    769.5552   1487.7500     35.0300      6.0800
+    769.6871   1487.7500     35.0300      6.0800
+    769.8190   1487.7500     35.0300      6.0800
+    769.9509   1487.7500     35.0300      6.0800
+    770.0828   1487.7400     35.0300      6.0800
+    770.2146   1461.7800     35.0300      0.0000
+    771.4016   1443.0800      0.0000      6.0500
+    771.5334   1443.0800      0.0000      6.0500
+    771.6653   1443.0800      0.0000      6.0500
+    771.7972   1487.6600     35.0200      6.0500
+    771.9291   1487.6600     35.0300      6.0500
+    772.0610   1487.6500     35.0300      6.0400
+    772.1929   1487.6500     35.0300      6.0400
+    772.3248   1487.6500     35.0300      6.0400
+    772.4566   1487.6500     35.0300      6.0400
+    772.5884   1487.6500     35.0300      6.0400
+    772.7203   1487.6500     35.0300      6.0400
+    772.8522   1487.6500     35.0200      6.0400
+    772.9841   1487.6500     35.0200      6.0400
+    773.1159   1487.6400     35.0200      6.0400
+    773.2478   1487.6400     35.0200      6.0400
+    773.3796   1487.6400     35.0200      6.0400
+    773.5115   1487.6400     35.0200      6.0400
+    773.6434   1487.6300     35.0200      6.0300
+    773.7752   1487.6200     35.0200      6.0300
+    773.9071   1487.6200     35.0200      6.0300
+    774.0389   1487.6100     35.0200      6.0300
+    774.1708   1487.6000     35.0200      6.0200
+    774.3027   1487.6000     35.0200      6.0200
+    774.4346   1487.5900     35.0200      6.0200
+    774.5664   1487.5900     35.0300      6.0200
+    774.6982   1487.5700     35.0200      6.0100
+    774.8301   1487.5700     35.0200      6.0100
+    774.9620   1487.5600     35.0200      6.0100
+    775.0938   1487.5500     35.0200      6.0100
+    775.2256   1487.5500     35.0200      6.0100
+    775.3575   1487.5500     35.0200      6.0100
+    775.4894   1487.5400     35.0200      6.0000
+    775.6212   1487.5400     35.0200      6.0000
+    775.7531   1487.5300     35.0200      6.0000
+    775.8849   1487.5400     35.0200      6.0000
+    776.0168   1487.5400     35.0200      6.0000
+    776.1486   1487.5300     35.0200      6.0000
+    776.2805   1487.5300     35.0200      6.0000
+    776.4123   1487.5300     35.0200      6.0000
+    776.5441   1487.5300     35.0200      6.0000
+    776.6760   1487.5300     35.0200      5.9900
+    776.8078   1487.5300     35.0200      5.9900
+    776.9396   1487.5300     35.0200      5.9900
+    777.0715   1487.5300     35.0200      5.9900
+    777.2033   1487.5300     35.0200      5.9900
+    777.3351   1487.5300     35.0200      5.9900
+    777.4670   1487.5300     35.0200      5.9900
+    777.5988   1487.5200     35.0200      5.9900
+    777.7307   1487.5200     35.0200      5.9900
+    777.8625   1487.5200     35.0200      5.9900
+    777.9943   1487.5100     35.0200      5.9900
+    778.1262   1487.5100     35.0200      5.9900
+    778.2579   1487.5100     35.0200      5.9800
+    778.3898   1487.5000     35.0200      5.9800
+    778.5216   1487.5000     35.0200      5.9800
+    778.6534   1487.5000     35.0200      5.9800
+    778.7853   1487.5000     35.0200      5.9800
+    778.9171   1487.4900     35.0200      5.9800
+    779.0489   1487.4900     35.0200      5.9800
+    779.1807   1487.4900     35.0200      5.9800
+    779.3126   1487.4800     35.0200      5.9700
+    779.4443   1487.4800     35.0200      5.9700
+    779.5762   1487.4700     35.0200      5.9700
+    779.7080   1487.4800     35.0200      5.9700
+    779.8398   1487.4800     35.0200      5.9700
+    779.9716   1487.4700     35.0200      5.9700
+    780.1034   1487.4700     35.0200      5.9700
+    780.2353   1487.4700     35.0200      5.9700
+    780.3671   1487.4700     35.0200      5.9700
+    780.4989   1487.4700     35.0200      5.9700
+    780.6307   1487.4700     35.0200      5.9700
+    780.7625   1487.4800     35.0200      5.9700
+    780.8943   1487.4700     35.0200      5.9600
+    781.0261   1487.4600     35.0200      5.9600
+    781.1579   1487.4700     35.0200      5.9600
+    781.2897   1487.4600     35.0200      5.9600
+    781.4215   1487.4600     35.0200      5.9600
+    781.5533   1487.4500     35.0200      5.9600
+    781.6851   1487.4500     35.0200      5.9500
+    781.8170   1487.4500     35.0200      5.9500
+    781.9487   1487.4400     35.0200      5.9500
+    782.0805   1487.4400     35.0200      5.9500
+    782.2123   1487.4300     35.0200      5.9500
+    782.3441   1487.4300     35.0200      5.9500
+    782.4759   1487.4300     35.0200      5.9500
+    782.6077   1487.4300     35.0200      5.9500
+    782.7395   1487.4300     35.0200      5.9500
+    782.8713   1487.4300     35.0200      5.9500
+    783.0031   1487.4300     35.0200      5.9400
+    783.1349   1487.4300     35.0200      5.9400
+    783.2667   1487.4400     35.0200      5.9400
+    783.3984   1487.4400     35.0200      5.9400
+    783.5303   1487.4400     35.0200      5.9400
+    783.6620   1487.4400     35.0200      5.9400
+    783.7938   1487.4400     35.0200      5.9400
+    783.9256   1487.4400     35.0200      5.9400
+    784.0574   1487.4300     35.0200      5.9400
+    784.1892   1487.4300     35.0200      5.9400
+    784.3210   1487.4300     35.0200      5.9400
+    784.4528   1462.0100     35.0200      0.0000
+    785.6387   1442.7700      0.0000      5.9300
+    785.7705   1442.7700      0.0000      5.9300
+    785.9023   1442.7600      0.0000      5.9200
+    786.0341   1487.4000     35.0200      5.9200
+    786.1658   1487.3900     35.0200      5.9200
+    786.2975   1487.3900     35.0200      5.9200
+    786.4294   1487.3800     35.0200      5.9200
+    786.5611   1487.3800     35.0200      5.9200
+    786.6929   1487.3700     35.0200      5.9100
+    786.8246   1487.3600     35.0200      5.9100
+    786.9564   1487.3600     35.0200      5.9100
+    787.0882   1487.3600     35.0200      5.9100
+    787.2199   1487.3500     35.0200      5.9100
+    787.3517   1487.3400     35.0200      5.9100
+    787.4835   1487.3400     35.0200      5.9000
+    787.6152   1487.3300     35.0200      5.9000
+    787.7469   1487.3300     35.0200      5.9000
+    787.8787   1487.3300     35.0200      5.9000
+    788.0105   1487.3200     35.0200      5.9000
+    788.1422   1487.3200     35.0200      5.9000
+    788.2740   1487.3100     35.0200      5.8900
+    788.4057   1487.3100     35.0200      5.8900
+    788.5375   1487.3100     35.0200      5.8900
+    788.6693   1487.3000     35.0200      5.8900
+    788.8010   1462.0800     35.0200      0.0000
+    791.1722   1442.5100      0.0000      5.8500
+    791.3040   1442.5100      0.0000      5.8500
+    791.4357   1442.5000      0.0000      5.8500
+    791.5675   1487.1700     35.0200      5.8400
+    791.6992   1487.1700     35.0200      5.8400
+    791.8309   1487.1700     35.0200      5.8400
+    791.9626   1487.1700     35.0200      5.8400
+    792.0944   1487.1600     35.0200      5.8400
+    792.2261   1487.1600     35.0200      5.8400
+    792.3578   1487.1600     35.0200      5.8400
+    792.4896   1487.1600     35.0200      5.8400
+    792.6212   1487.1700     35.0300      5.8400
+    792.7530   1487.1700     35.0300      5.8400
+    792.8847   1487.1700     35.0300      5.8400
+    793.0164   1487.1700     35.0200      5.8400
+    793.1481   1487.1700     35.0200      5.8400
+    793.2798   1487.1700     35.0200      5.8400
+    793.4116   1487.1800     35.0200      5.8400
+    793.5433   1487.1800     35.0200      5.8400
+    793.6750   1487.1800     35.0200      5.8400
+    793.8067   1487.1800     35.0200      5.8400
+    793.9384   1487.1800     35.0200      5.8400
+    794.0701   1487.1800     35.0200      5.8400
+    794.2018   1487.1900     35.0200      5.8400
+    794.3335   1487.1900     35.0200      5.8400
+    794.4652   1487.1900     35.0200      5.8400
+    794.5969   1487.1900     35.0200      5.8400
+    794.7286   1487.1900     35.0200      5.8400
+    794.8604   1487.1900     35.0200      5.8400
+    794.9920   1487.1900     35.0200      5.8300
+    795.1238   1487.1800     35.0200      5.8300
+    795.2554   1487.1800     35.0200      5.8300
+    795.3871   1487.1700     35.0200      5.8300
+    795.5189   1487.1700     35.0100      5.8300
+    795.6505   1487.1600     35.0200      5.8300
+    795.7822   1487.1500     35.0200      5.8200
+    795.9139   1462.1900     35.0200      0.0000
+    798.6793   1442.3900      0.0000      5.7900
+    798.8110   1442.3900      0.0000      5.7900
+    798.9426   1442.3900      0.0000      5.7900
+    799.0743   1487.0800     35.0200      5.7900
+    799.2060   1487.0800     35.0200      5.7900
+    799.3376   1487.0700     35.0200      5.7900
+    799.4693   1487.0700     35.0200      5.7900
+    799.6010   1487.0700     35.0200      5.7900
+    799.7327   1487.0700     35.0200      5.7800
+    799.8643   1462.2600     35.0200      0.0000
+    801.0493   1442.3600      0.0000      5.7800
+    801.1809   1442.3600      0.0000      5.7800
+    801.3126   1442.3600      0.0000      5.7800
+    801.4442   1487.0600     35.0200      5.7800
+    801.5759   1487.0600     35.0200      5.7800
+    801.7075   1487.0600     35.0200      5.7700
+    801.8392   1487.0600     35.0200      5.7700
+    801.9708   1487.0500     35.0200      5.7700
+    802.1025   1487.0500     35.0200      5.7700
+    802.2341   1487.0500     35.0200      5.7700
+    802.3658   1487.0400     35.0200      5.7700
+    802.4974   1487.0400     35.0200      5.7700
+    802.6291   1487.0400     35.0200      5.7600
+    802.7607   1487.0300     35.0200      5.7600
+    802.8923   1487.0200     35.0200      5.7600
+    803.0240   1487.0200     35.0200      5.7600
+    803.1556   1487.0100     35.0200      5.7600
+    803.2873   1487.0000     35.0100      5.7500
+    803.4189   1486.9900     35.0100      5.7500
+    803.5505   1486.9800     35.0100      5.7500
+    803.6822   1486.9700     35.0100      5.7500
+    803.8138   1486.9700     35.0100      5.7400
+    803.9454   1486.9600     35.0100      5.7400
+    804.0771   1486.9600     35.0200      5.7400
+    804.2087   1486.9600     35.0200      5.7400
+    804.3403   1486.9600     35.0200      5.7400
+    804.4720   1486.9600     35.0200      5.7400
+    804.6036   1486.9700     35.0200      5.7400
+    804.7352   1486.9700     35.0200      5.7400
+    804.8668   1486.9700     35.0200      5.7400
+    804.9985   1486.9700     35.0200      5.7400
+    805.1301   1486.9700     35.0200      5.7400
+    805.2618   1486.9700     35.0200      5.7400
+    805.3934   1486.9700     35.0200      5.7400
+    805.5250   1486.9700     35.0200      5.7400
+    805.6566   1486.9700     35.0200      5.7400
+    805.7882   1486.9700     35.0200      5.7400
+    805.9199   1486.9600     35.0100      5.7300
+    806.0515   1486.9600     35.0200      5.7300
+    806.1831   1486.9600     35.0100      5.7300
+    806.3147   1486.9600     35.0100      5.7300
+    806.4463   1486.9600     35.0100      5.7300
+    806.5779   1486.9600     35.0100      5.7300
+    806.7095   1486.9500     35.0100      5.7300
+    806.8412   1486.9500     35.0100      5.7300
+    806.9728   1486.9500     35.0100      5.7300
+    807.1044   1486.9600     35.0100      5.7300
+    807.2360   1486.9500     35.0100      5.7300
+    807.3676   1486.9600     35.0100      5.7300
+    807.4992   1486.9600     35.0100      5.7300
+    807.6308   1486.9600     35.0100      5.7300
+    807.7624   1486.9600     35.0100      5.7300
+    807.8940   1486.9600     35.0100      5.7200
+    808.0256   1486.9600     35.0200      5.7200
+    808.1572   1462.3900     35.0200      0.0000
+    809.3416   1442.2300      0.0000      5.7200
+    809.4732   1442.2300      0.0000      5.7200
+    809.6048   1442.2400      0.0000      5.7200
+    809.7363   1486.9700     35.0200      5.7200
+    809.8680   1486.9700     35.0200      5.7200
+    809.9995   1486.9700     35.0200      5.7200
+    810.1312   1486.9800     35.0200      5.7200
+    810.2627   1486.9800     35.0200      5.7200
+    810.3943   1486.9800     35.0200      5.7200
+    810.5259   1486.9800     35.0200      5.7200
+    810.6575   1486.9800     35.0200      5.7200
+    810.7891   1486.9800     35.0200      5.7200
+    810.9207   1486.9700     35.0200      5.7100
+    811.0522   1486.9700     35.0200      5.7100
+    811.1838   1486.9600     35.0200      5.7100
+    811.3154   1486.9600     35.0200      5.7100
+    811.4470   1486.9500     35.0200      5.7100
+    811.5786   1462.4500     35.0200      0.0000
+    814.2098   1442.1100      0.0000      5.6800
+    814.3414   1442.1100      0.0000      5.6800
+    814.4730   1442.1100      0.0000      5.6700
+    814.6046   1486.8600     35.0200      5.6700
+    814.7361   1486.8600     35.0200      5.6700
+    814.8677   1486.8600     35.0200      5.6700
+    814.9992   1486.8500     35.0200      5.6700
+    815.1308   1486.8500     35.0200      5.6700
+    815.2623   1486.8500     35.0200      5.6700
+    815.3938   1486.8500     35.0200      5.6700
+    815.5254   1486.8500     35.0200      5.6600
+    815.6569   1486.8400     35.0200      5.6600
+    815.7885   1486.8300     35.0200      5.6600
+    815.9200   1486.8300     35.0200      5.6600
+    816.0516   1486.8300     35.0200      5.6600
+    816.1831   1486.8300     35.0100      5.6600
+    816.3146   1486.8200     35.0100      5.6600
+    816.4462   1486.8200     35.0100      5.6600
+    816.5777   1486.8200     35.0100      5.6500
+    816.7093   1486.8200     35.0200      5.6500
+    816.8408   1462.5400     35.0200      0.0000
+    818.8138   1442.0100      0.0000      5.6400
+    818.9453   1442.0100      0.0000      5.6300
+    819.0768   1442.0000      0.0000      5.6300
+    819.2083   1486.7700     35.0200      5.6300
+    819.3398   1486.7700     35.0200      5.6300
+    819.4714   1486.7600     35.0200      5.6300
+    819.6028   1486.7500     35.0200      5.6200
+    819.7344   1486.7400     35.0200      5.6200
+    819.8659   1486.7300     35.0100      5.6200
+    819.9974   1486.7100     35.0100      5.6100
+    820.1289   1486.7000     35.0100      5.6100
+    820.2604   1486.6900     35.0100      5.6100
+    820.3919   1486.6900     35.0100      5.6100
+    820.5235   1486.6800     35.0100      5.6000
+    820.6550   1486.6800     35.0100      5.6000
+    820.7864   1486.6700     35.0100      5.6000
+    820.9180   1486.6800     35.0100      5.6000
+    821.0494   1486.6700     35.0100      5.6000
+    821.1810   1486.6800     35.0100      5.6000
+    821.3125   1486.6800     35.0100      5.6000
+    821.4440   1486.6800     35.0100      5.6000
+    821.5755   1486.6800     35.0100      5.6000
+    821.7070   1486.6700     35.0100      5.6000
+    821.8385   1486.6700     35.0100      5.6000
+    821.9700   1486.6700     35.0100      5.6000
+    822.1015   1486.6700     35.0100      5.6000
+    822.2330   1486.6800     35.0100      5.6000
+    822.3645   1486.6700     35.0100      5.6000
+    822.4960   1486.6700     35.0100      5.5900
+    822.6275   1486.6800     35.0100      5.6000
+    822.7590   1486.6800     35.0100      5.5900
+    822.8904   1486.6800     35.0100      5.5900
+    823.0220   1486.6800     35.0100      5.5900
+    823.1534   1486.6800     35.0100      5.5900
+    823.2849   1486.6800     35.0100      5.5900
+    823.4164   1486.6800     35.0100      5.5900
+    823.5479   1486.6800     35.0100      5.5900
+    823.6794   1486.6900     35.0100      5.5900
+    823.8109   1486.6800     35.0100      5.5900
+    823.9423   1486.6800     35.0100      5.5900
+    824.0738   1486.6800     35.0100      5.5900
+    824.2053   1486.6800     35.0100      5.5900
+    824.3368   1486.6800     35.0100      5.5900
+    824.4683   1486.6800     35.0100      5.5900
+    824.5997   1486.6800     35.0100      5.5900
+    824.7313   1486.6800     35.0100      5.5900
+    824.8627   1486.6800     35.0100      5.5900
+    824.9942   1486.6800     35.0100      5.5800
+    825.1257   1486.6800     35.0100      5.5800
+    825.2571   1486.6800     35.0200      5.5800
+    825.3886   1486.6800     35.0200      5.5800
+    825.5201   1486.6800     35.0200      5.5800
+    825.6516   1486.6900     35.0200      5.5800
+    825.7830   1486.6900     35.0200      5.5800
+    825.9145   1486.6900     35.0200      5.5800
+    826.0460   1486.6900     35.0200      5.5800
+    826.1774   1486.7000     35.0200      5.5800
+    826.3089   1486.7000     35.0200      5.5800
+    826.4403   1486.7000     35.0200      5.5800
+    826.5718   1486.7000     35.0200      5.5800
+    826.7032   1486.7000     35.0200      5.5800
+    826.8348   1486.7100     35.0200      5.5800
+    826.9662   1486.7000     35.0200      5.5800
+    827.0977   1486.7100     35.0200      5.5800
+    827.2291   1486.7100     35.0200      5.5800
+    827.3605   1486.7100     35.0100      5.5800
+    827.4921   1486.7100     35.0100      5.5800
+    827.6235   1486.7100     35.0100      5.5800
+    827.7549   1486.7200     35.0100      5.5800
+    827.8864   1486.7200     35.0100      5.5800
+    828.0179   1486.7200     35.0100      5.5800
+    828.1493   1486.7200     35.0100      5.5800
+    828.2808   1486.7200     35.0100      5.5800
+    828.4122   1486.7200     35.0100      5.5800
+    828.5436   1486.7300     35.0100      5.5800
+    828.6751   1462.7300     35.0100      0.0000
+    829.8581   1441.9100      0.0000      5.5700
+    829.9895   1441.9000      0.0000      5.5700
+    830.1210   1441.9100      0.0000      5.5700
+    830.2524   1462.7500     35.0100      0.0000
+    833.0123   1441.7900      0.0000      5.5400
+    833.1437   1441.7900      0.0000      5.5300
+    833.2751   1441.7900      0.0000      5.5300
+    833.4066   1486.6100     35.0100      5.5300
+    833.5380   1486.6100     35.0100      5.5300
+    833.6694   1486.6100     35.0100      5.5300
+    833.8008   1462.8100     35.0100      0.0000
+    834.9835   1441.8100      0.0000      5.5300
+    835.1148   1441.8200      0.0000      5.5300
+    835.2462   1441.8200      0.0000      5.5300
+    835.3776   1486.6400     35.0100      5.5300
+    835.5090   1486.6400     35.0100      5.5300
+    835.6404   1486.6500     35.0100      5.5300
+    835.7719   1486.6500     35.0100      5.5300
+    835.9032   1486.6500     35.0100      5.5300
+    836.0346   1486.6500     35.0100      5.5300
+    836.1660   1486.6500     35.0100      5.5300
+    836.2974   1486.6600     35.0100      5.5300
+    836.4288   1486.6600     35.0100      5.5300
+    836.5602   1486.6600     35.0100      5.5300
+    836.6916   1486.6600     35.0100      5.5300
+    836.8229   1486.6600     35.0100      5.5300
+    836.9543   1486.6500     35.0100      5.5300
+    837.0857   1486.6500     35.0100      5.5300
+    837.2170   1486.6500     35.0100      5.5300
+    837.3485   1486.6500     35.0100      5.5300
+    837.4799   1486.6500     35.0100      5.5300
+    837.6113   1486.6500     35.0100      5.5300
+    837.7426   1486.6500     35.0100      5.5300
+    837.8740   1486.6500     35.0100      5.5200
+    838.0054   1486.6500     35.0100      5.5200
+    838.1368   1486.6500     35.0100      5.5200
+    838.2681   1486.6500     35.0100      5.5200
+    838.3995   1486.6500     35.0100      5.5200
+    838.5309   1486.6500     35.0100      5.5200
+    838.6622   1486.6500     35.0100      5.5200
+    838.7936   1486.6600     35.0100      5.5200
+    838.9250   1486.6600     35.0100      5.5200
+    839.0564   1486.6600     35.0100      5.5200
+    839.1877   1486.6600     35.0100      5.5200
+    839.3191   1486.6600     35.0100      5.5200
+    839.4504   1486.6600     35.0100      5.5200
+    839.5818   1486.6700     35.0100      5.5200
+    839.7132   1486.6700     35.0100      5.5200
+    839.8445   1486.6600     35.0000      5.5200
+    839.9760   1486.6600     35.0000      5.5200
+    840.1073   1486.6600     35.0000      5.5200
+    840.2386   1486.6600     35.0000      5.5200
+    840.3700   1486.6600     35.0100      5.5200
+    840.5013   1486.6600     35.0100      5.5200
+    840.6328   1486.6500     35.0100      5.5200
+    840.7640   1486.6500     35.0100      5.5200
+    840.8954   1462.9200     35.0100      0.0000
+    842.0776   1441.8300      0.0000      5.5100
+    842.2089   1441.8300      0.0000      5.5100
+    842.3403   1441.8300      0.0000      5.5100
+    842.4716   1486.6600     35.0100      5.5100
+    842.6030   1486.6600     35.0100      5.5100
+    842.7343   1486.6600     35.0100      5.5100
+    842.8656   1486.6700     35.0100      5.5100
+    842.9970   1486.6700     35.0100      5.5100
+    843.1283   1486.6700     35.0100      5.5100
+    843.2597   1462.9700     35.0100      0.0000
+    844.4417   1441.8300      0.0000      5.5000
+    844.5730   1441.8400      0.0000      5.5000
+    844.7043   1441.8400      0.0000      5.5000
+    844.8356   1486.6700     35.0100      5.5000
+    844.9669   1486.6700     35.0100      5.5000
+    845.0983   1486.6700     35.0100      5.5000
+    845.2296   1486.6600     35.0100      5.5000
+    845.3610   1486.6600     35.0100      5.5000
+    845.4922   1486.6600     35.0100      5.5000
+    845.6236   1486.6600     35.0100      5.5000
+    845.7549   1486.6600     35.0100      5.4900
+    845.8862   1463.0100     35.0100      0.0000
+    847.0680   1441.8000      0.0000      5.4900
+    847.1993   1441.8000      0.0000      5.4900
+    847.3306   1441.8000      0.0000      5.4800
+    847.4620   1486.6400     35.0100      5.4800
+    847.5933   1486.6400     35.0100      5.4800
+    847.7245   1486.6400     35.0000      5.4800
+    847.8558   1486.6400     35.0000      5.4800
+    847.9872   1486.6400     35.0000      5.4800
+    848.1185   1486.6400     35.0100      5.4800
+    848.2498   1486.6400     35.0100      5.4800
+    848.3811   1486.6400     35.0100      5.4800
+    848.5123   1486.6400     35.0100      5.4800
+    848.6437   1486.6400     35.0100      5.4800
+    848.7750   1463.0500     35.0100      0.0000
+    849.9565   1441.7900      0.0000      5.4700
+    850.0879   1441.7900      0.0000      5.4700
+    850.2192   1441.8000      0.0000      5.4700
+    850.3504   1486.6500     35.0100      5.4700
+    850.4818   1486.6500     35.0100      5.4700
+    850.6130   1486.6500     35.0100      5.4700
+    850.7443   1486.6400     35.0100      5.4700
+    850.8755   1486.6400     35.0100      5.4700
+    851.0068   1486.6300     35.0100      5.4700
+    851.1381   1486.6300     35.0100      5.4700
+    851.2694   1486.6200     35.0100      5.4600
+    851.4007   1486.6100     35.0100      5.4600
+    851.5319   1486.6100     35.0100      5.4600
+    851.6632   1486.6100     35.0100      5.4600
+    851.7945   1486.6000     35.0100      5.4600
+    851.9258   1486.6000     35.0000      5.4600
+    852.0570   1486.6000     35.0100      5.4600
+    852.1884   1486.6000     35.0000      5.4600
+    852.3196   1486.5900     35.0000      5.4500
+    852.4508   1486.5900     35.0000      5.4500
+    852.5821   1486.5900     35.0000      5.4500
+    852.7134   1486.5800     35.0000      5.4500
+    852.8447   1486.5800     35.0000      5.4500
+    852.9759   1486.5800     35.0000      5.4500
+    853.1072   1486.5800     35.0100      5.4500
+    853.2384   1486.5700     35.0000      5.4500
+    853.3698   1486.5700     35.0100      5.4400
+    853.5010   1486.5700     35.0100      5.4400
+    853.6322   1486.5600     35.0100      5.4400
+    853.7635   1486.5500     35.0100      5.4400
+    853.8947   1486.5500     35.0100      5.4400
+    854.0260   1486.5400     35.0100      5.4300
+    854.1572   1486.5300     35.0000      5.4300
+    854.2885   1486.5200     35.0000      5.4300
+    854.4197   1486.5200     35.0100      5.4300
+    854.5510   1486.5200     35.0200      5.4200
+    854.6823   1486.5300     35.0200      5.4200
+    854.8135   1486.5300     35.0200      5.4200
+    854.9448   1486.5300     35.0300      5.4200
+    855.0760   1463.2000     35.0400      0.0000
+    856.2572   1441.6200      0.0000      5.4200
+    856.3884   1441.6300      0.0000      5.4200
+    856.5197   1441.6300      0.0000      5.4100
+    856.6509   1486.5000     35.0000      5.4100
+    856.7822   1486.5000     35.0000      5.4100
+    856.9134   1486.5000     35.0100      5.4100
+    857.0446   1486.4900     35.0000      5.4100
+    857.1758   1486.4900     35.0100      5.4100
+    857.3071   1486.4900     35.0100      5.4100
+    857.4383   1486.4900     35.0100      5.4100
+    857.5696   1486.4900     35.0100      5.4100
+    857.7007   1486.5000     35.0100      5.4100
+    857.8320   1486.5000     35.0100      5.4100
+    857.9633   1486.5000     35.0100      5.4100
+    858.0944   1486.5000     35.0100      5.4100
+    858.2257   1486.5000     35.0100      5.4100
+    858.3569   1486.5000     35.0100      5.4100
+    858.4882   1486.5100     35.0100      5.4100
+    858.6193   1486.5100     35.0100      5.4100
+    858.7506   1486.5100     35.0100      5.4100
+    858.8818   1486.5100     35.0000      5.4100
+    859.0130   1463.2200     35.0000      0.0000
+    860.1940   1441.6500      0.0000      5.4100
+    860.3251   1441.6500      0.0000      5.4100
+    860.4564   1441.6600      0.0000      5.4100
+    860.5876   1486.5400     35.0100      5.4100
+    860.7188   1486.5400     35.0100      5.4100
+    860.8499   1486.5500     35.0100      5.4100
+    860.9811   1486.5500     35.0100      5.4100
+    861.1124   1486.5500     35.0100      5.4100
+    861.2435   1486.5500     35.0100      5.4100
+    861.3748   1486.5600     35.0100      5.4100
+    861.5060   1486.5500     35.0100      5.4100
+    861.6372   1486.5500     35.0100      5.4100
+    861.7683   1486.5500     35.0100      5.4000
+    861.8995   1486.5500     35.0100      5.4000
+    862.0308   1486.5600     35.0100      5.4000
+    862.1620   1486.5500     35.0100      5.4000
+    862.2932   1486.5500     35.0000      5.4000
+    862.4244   1486.5500     35.0100      5.4000
+    862.5555   1486.5400     35.0000      5.4000
+    862.6867   1486.5500     35.0100      5.4000
+    862.8179   1486.5600     35.0000      5.4000
+    862.9491   1486.5800     35.0000      5.4100
+    863.0803   1486.5900     35.0000      5.4100
+    863.2114   1486.5900     34.9900      5.4100
+    863.3427   1486.6200     34.9900      5.4200
+    863.4739   1486.6400     35.0000      5.4200
+    863.6050   1486.6700     35.0000      5.4300
+    863.7362   1486.6900     35.0000      5.4300
+    863.8674   1486.7100     35.0100      5.4400
+    863.9986   1486.7200     35.0100      5.4400
+    864.1298   1486.7300     35.0100      5.4400
+    864.2609   1486.7300     35.0200      5.4400
+    864.3922   1486.7400     35.0200      5.4400
+    864.5233   1486.7400     35.0200      5.4400
+    864.6545   1486.7400     35.0100      5.4400
+    864.7856   1486.7300     35.0100      5.4400
+    864.9169   1463.3200     35.0100      0.0000
+    866.0974   1441.6900      0.0000      5.4000
+    866.2285   1441.7000      0.0000      5.4000
+    866.3597   1441.7000      0.0000      5.4000
+    866.4908   1486.5900     35.0000      5.4000
+    866.6220   1486.5900     35.0000      5.4000
+    866.7532   1486.5900     35.0000      5.3900
+    866.8843   1486.5900     35.0000      5.3900
+    867.0154   1486.5900     35.0000      5.3900
+    867.1467   1486.5900     35.0000      5.3900
+    867.2778   1486.5900     35.0000      5.3900
+    867.4089   1486.5900     35.0000      5.3900
+    867.5401   1486.6000     35.0000      5.3900
+    867.6713   1486.6100     35.0000      5.4000
+    867.8024   1486.6300     35.0000      5.4000
+    867.9335   1486.6500     35.0000      5.4100
+    868.0647   1486.6500     34.9900      5.4100
+    868.1959   1486.6700     34.9900      5.4100
+    868.3270   1486.6800     34.9900      5.4100
+    868.4581   1486.7100     35.0000      5.4200
+    868.5893   1486.7300     34.9900      5.4200
+    868.7205   1486.7300     34.9900      5.4200
+    868.8516   1486.7300     34.9900      5.4300
+    868.9827   1486.7300     34.9900      5.4200
+    869.1139   1486.7400     35.0000      5.4200
+    869.2450   1463.3900     35.0100      0.0000
+    870.4252   1441.7400      0.0000      5.3900
+    870.5564   1441.7400      0.0000      5.3900
+    870.6875   1441.7500      0.0000      5.3900
+    870.8186   1486.6400     35.0100      5.3900
+    870.9498   1486.6400     35.0000      5.3900
+    871.0809   1486.6400     35.0000      5.3900
+    871.2120   1486.6400     35.0100      5.3900
+    871.3431   1486.6400     35.0100      5.3900
+    871.4743   1486.6500     35.0100      5.3900
+    871.6053   1486.6400     35.0100      5.3900
+    871.7365   1486.6600     35.0100      5.3900
+    871.8677   1486.6600     35.0100      5.3900
+    871.9988   1486.6600     35.0000      5.3900
+    872.1299   1486.6700     35.0000      5.3900
+    872.2610   1486.6900     35.0000      5.4000
+    872.3922   1486.7100     35.0000      5.4000
+    872.5232   1486.6900     34.9900      5.4000
+    872.6544   1463.4200     34.9900      0.0000
+    874.7521   1441.6700      0.0000      5.3600
+    874.8831   1441.6700      0.0000      5.3600
+    875.0142   1441.6700      0.0000      5.3600
+    875.1454   1486.5800     35.0000      5.3600
+    875.2765   1486.5800     35.0000      5.3600
+    875.4075   1486.5800     35.0000      5.3600
+    875.5386   1486.5800     35.0000      5.3600
+    875.6697   1486.5800     35.0000      5.3600
+    875.8008   1486.5900     35.0000      5.3600
+    875.9319   1486.5800     35.0000      5.3600
+    876.0630   1486.5800     35.0000      5.3500
+    876.1942   1486.5800     35.0000      5.3500
+    876.3251   1463.5000     35.0100      0.0000
+    877.5049   1441.6500      0.0000      5.3400
+    877.6360   1441.6500      0.0000      5.3400
+    877.7671   1441.6500      0.0000      5.3400
+    877.8982   1486.5700     35.0100      5.3400
+    878.0293   1486.5600     35.0100      5.3400
+    878.1603   1486.5600     35.0100      5.3400
+    878.2914   1486.5600     35.0100      5.3400
+    878.4225   1486.5600     35.0000      5.3400
+    878.5536   1463.5400     35.0000      0.0000
+    880.2574   1441.6200      0.0000      5.3300
+    880.3884   1441.6200      0.0000      5.3300
+    880.5195   1441.6200      0.0000      5.3300
+    880.6505   1486.5400     35.0000      5.3300
+    880.7816   1486.5400     35.0000      5.3300
+    880.9126   1486.5400     35.0000      5.3300
+    881.0436   1486.5400     35.0000      5.3200
+    881.1747   1486.5400     35.0000      5.3200
+    881.3058   1486.5400     35.0000      5.3200
+    881.4368   1486.5300     35.0000      5.3200
+    881.5679   1486.5300     35.0000      5.3200
+    881.6990   1486.5400     35.0000      5.3200
+    881.8300   1486.5300     35.0000      5.3200
+    881.9610   1486.5300     35.0000      5.3200
+    882.0921   1486.5300     35.0000      5.3200
+    882.2231   1486.5300     35.0100      5.3200
+    882.3541   1486.5300     35.0100      5.3100
+    882.4852   1486.5300     35.0100      5.3100
+    882.6163   1463.6100     35.0100      0.0000
+    883.7955   1441.5400      0.0000      5.3000
+    883.9266   1441.5300      0.0000      5.3000
+    884.0576   1441.5300      0.0000      5.2900
+    884.1886   1486.4600     35.0000      5.2900
+    884.3196   1486.4600     35.0000      5.2900
+    884.4507   1486.4500     35.0000      5.2900
+    884.5817   1486.4600     35.0000      5.2900
+    884.7127   1486.4500     35.0000      5.2900
+    884.8438   1486.4600     35.0000      5.2900
+    884.9748   1486.4600     35.0000      5.2900
+    885.1058   1486.4600     35.0000      5.2900
+    885.2368   1486.4600     35.0000      5.2900
+    885.3679   1486.4700     35.0000      5.2900
+    885.4989   1486.4700     35.0000      5.2900
+    885.6298   1486.4700     35.0000      5.2900
+    885.7609   1486.4700     35.0000      5.2900
+    885.8919   1486.4700     35.0000      5.2900
+    886.0229   1486.4700     35.0000      5.2900
+    886.1539   1486.4700     35.0000      5.2900
+    886.2850   1486.4700     35.0000      5.2900
+    886.4160   1486.4700     35.0000      5.2900
+    886.5469   1486.4700     35.0000      5.2800
+    886.6780   1486.4700     35.0000      5.2800
+    886.8090   1486.4700     35.0000      5.2800
+    886.9401   1486.4700     35.0000      5.2800
+    887.0710   1486.4700     35.0000      5.2800
+    887.2020   1486.4700     35.0000      5.2800
+    887.3331   1486.4700     35.0000      5.2800
+    887.4640   1486.4700     35.0000      5.2800
+    887.5950   1486.4700     35.0100      5.2800
+    887.7260   1486.4700     35.0000      5.2800
+    887.8571   1486.4700     35.0000      5.2800
+    887.9880   1486.4700     35.0000      5.2800
+    888.1190   1486.4700     35.0000      5.2800
+    888.2501   1486.4700     35.0000      5.2800
+    888.3810   1486.4700     35.0000      5.2800
+    888.5120   1486.4700     35.0000      5.2800
+    888.6430   1486.4700     35.0000      5.2800
+    888.7740   1486.4700     35.0000      5.2800
+    888.9050   1486.4600     35.0000      5.2700
+    889.0360   1486.4600     35.0000      5.2700
+    889.1670   1486.4600     35.0000      5.2700
+    889.2980   1486.4500     35.0000      5.2700
+    889.4290   1486.4500     35.0000      5.2700
+    889.5599   1486.4500     35.0000      5.2700
+    889.6910   1486.4500     35.0000      5.2700
+    889.8219   1486.4500     35.0000      5.2600
+    889.9529   1486.4400     35.0000      5.2600
+    890.0839   1463.7200     35.0000      0.0000
+    891.2626   1441.4800      0.0000      5.2600
+    891.3937   1441.4800      0.0000      5.2600
+    891.5247   1441.4800      0.0000      5.2500
+    891.6556   1486.4300     35.0000      5.2500
+    891.7866   1486.4300     35.0000      5.2500
+    891.9175   1486.4300     35.0000      5.2500
+    892.0486   1486.4200     35.0000      5.2500
+    892.1794   1486.4300     35.0000      5.2500
+    892.3104   1486.4200     35.0000      5.2500
+    892.4415   1486.4300     35.0000      5.2500
+    892.5724   1486.4300     35.0000      5.2500
+    892.7033   1486.4200     35.0000      5.2500
+    892.8343   1486.4200     35.0000      5.2500
+    892.9653   1486.4200     35.0000      5.2500
+    893.0962   1486.4200     35.0000      5.2400
+    893.2272   1486.4200     35.0000      5.2400
+    893.3582   1486.4100     35.0000      5.2400
+    893.4891   1486.4100     35.0000      5.2400
+    893.6201   1486.4100     35.0000      5.2400
+    893.7510   1486.4100     35.0000      5.2400
+    893.8820   1486.4100     35.0000      5.2400
+    894.0129   1486.4100     35.0000      5.2400
+    894.1439   1486.4100     35.0000      5.2400
+    894.2748   1486.4100     35.0000      5.2400
+    894.4058   1486.4200     35.0000      5.2400
+    894.5367   1486.4200     35.0000      5.2400
+    894.6677   1486.4200     35.0000      5.2400
+    894.7986   1486.4200     35.0000      5.2400
+    894.9296   1486.4200     35.0000      5.2400
+    895.0605   1486.4200     34.9900      5.2400
+    895.1915   1486.4200     34.9900      5.2400
+    895.3224   1486.4200     34.9900      5.2400
+    895.4533   1486.4200     34.9900      5.2400
+    895.5843   1486.4100     35.0000      5.2400
+    895.7153   1486.4100     35.0000      5.2300
+    895.8463   1486.4100     35.0000      5.2300
+    895.9771   1486.4100     35.0000      5.2300
+    896.1081   1486.4100     35.0000      5.2300
+    896.2390   1486.4100     35.0000      5.2300
+    896.3699   1486.4100     35.0000      5.2300
+    896.5009   1486.4200     35.0000      5.2300
+    896.6318   1486.4200     35.0000      5.2300
+    896.7628   1486.4200     35.0000      5.2300
+    896.8936   1486.4200     35.0000      5.2300
+    897.0246   1486.4200     35.0000      5.2300
+    897.1556   1486.4200     35.0000      5.2300
+    897.2864   1486.4200     35.0000      5.2300
+    897.4174   1486.4100     35.0000      5.2300
+    897.5483   1486.4100     35.0000      5.2200
+    897.6793   1486.4100     35.0000      5.2200
+    897.8101   1486.4100     35.0000      5.2200
+    897.9411   1463.8600     35.0000      0.0000
+    899.1194   1441.4400      0.0000      5.2200
+    899.2502   1441.4400      0.0000      5.2200
+    899.3812   1441.4400      0.0000      5.2200
+    899.5121   1486.4200     35.0000      5.2200
+    899.6430   1486.4200     35.0000      5.2200
+    899.7739   1486.4200     35.0000      5.2200
+    899.9048   1486.4200     35.0000      5.2200
+    900.0358   1486.4300     35.0000      5.2200
+    900.1666   1486.4300     35.0000      5.2200
+    900.2975   1486.4300     34.9900      5.2200
+    900.4285   1486.4300     34.9900      5.2200
+    900.5593   1486.4300     34.9900      5.2200
+    900.6902   1486.4300     34.9900      5.2200
+    900.8212   1486.4400     34.9900      5.2200
+    900.9521   1486.4400     34.9900      5.2200
+    901.0829   1486.4400     34.9900      5.2200
+    901.2139   1486.4500     34.9900      5.2200
+    901.3448   1486.4500     34.9900      5.2200
+    901.4757   1486.4500     34.9900      5.2200
+    901.6066   1486.4500     34.9900      5.2200
+    901.7375   1486.4500     34.9900      5.2200
+    901.8684   1486.4600     34.9900      5.2200
+    901.9992   1486.4600     35.0000      5.2200
+    902.1301   1486.4600     35.0000      5.2200
+    902.2610   1486.4600     35.0000      5.2200
+    902.3920   1486.4600     34.9900      5.2200
+    902.5228   1486.4700     34.9900      5.2200
+    902.6537   1486.4700     34.9900      5.2200
+    902.7846   1486.4700     34.9900      5.2200
+    902.9155   1486.4700     34.9900      5.2200
+    903.0463   1486.4700     34.9900      5.2200
+    903.1772   1486.4700     34.9900      5.2200
+    903.3082   1486.4800     34.9900      5.2200
+    903.4390   1486.4800     34.9900      5.2200
+    903.5699   1486.4800     34.9900      5.2200
+    903.7008   1486.4800     34.9900      5.2200
+    903.8316   1486.4800     34.9900      5.2200
+    903.9625   1486.4900     34.9900      5.2200
+    904.0934   1486.4900     34.9900      5.2200
+    904.2243   1486.4900     34.9900      5.2200
+    904.3552   1486.5000     34.9900      5.2200
+    904.4860   1486.5000     34.9900      5.2200
+    904.6169   1486.5000     34.9900      5.2200
+    904.7479   1486.5000     34.9900      5.2200
+    904.8787   1486.5000     34.9900      5.2200
+    905.0095   1486.5000     34.9900      5.2200
+    905.1404   1486.5000     34.9900      5.2200
+    905.2712   1486.5100     34.9900      5.2200
+    905.4021   1486.5000     34.9900      5.2200
+    905.5330   1486.5100     34.9900      5.2200
+    905.6639   1486.5000     34.9900      5.2200
+    905.7947   1486.5100     34.9900      5.2200
+    905.9256   1486.5100     34.9900      5.2200
+    906.0565   1486.5100     34.9900      5.2200
+    906.1873   1463.9800     34.9900      0.0000
+    907.3651   1441.5300      0.0000      5.2100
+    907.4959   1441.5300      0.0000      5.2100
+    907.6267   1441.5300      0.0000      5.2100
+    907.7576   1486.5200     35.0000      5.2100
+    907.8884   1486.5200     35.0000      5.2100
+    908.0193   1486.5200     35.0000      5.2100
+    908.1501   1486.5300     35.0000      5.2100
+    908.2810   1486.5300     35.0000      5.2100
+    908.4119   1486.5300     35.0000      5.2100
+    908.5426   1486.5300     35.0000      5.2100
+    908.6735   1486.5300     35.0000      5.2100
+    908.8044   1486.5400     35.0000      5.2100
+    908.9352   1486.5400     35.0000      5.2100
+    909.0660   1486.5400     35.0000      5.2100
+    909.1969   1486.5400     35.0000      5.2100
+    909.3278   1486.5400     35.0000      5.2100
+    909.4585   1486.5400     35.0000      5.2100
+    909.5894   1486.5400     35.0000      5.2100
+    909.7202   1486.5400     35.0000      5.2100
+    909.8511   1486.5500     35.0000      5.2100
+    909.9819   1486.5500     35.0000      5.2100
+    910.1127   1464.0600     35.0000      0.0000
+    911.2902   1441.5500      0.0000      5.2000
+    911.4210   1441.5500      0.0000      5.2000
+    911.5518   1441.5500      0.0000      5.2000
+    911.6827   1486.5500     35.0000      5.2000
+    911.8134   1486.5500     35.0000      5.2000
+    911.9443   1486.5600     35.0100      5.2000
+    912.0751   1486.5600     35.0100      5.2000
+    912.2059   1486.5600     35.0100      5.2000
+    912.3367   1486.5700     35.0100      5.2000
+    912.4675   1486.5700     35.0100      5.2000
+    912.5984   1486.5700     35.0100      5.2000
+    912.7291   1486.5700     35.0100      5.2000
+    912.8599   1486.5700     35.0100      5.2000
+    912.9908   1486.5700     35.0000      5.2000
+    913.1216   1486.5700     35.0000      5.2000
+    913.2524   1464.1100     35.0000      0.0000
+    914.4296   1441.6000      0.0000      5.2000
+    914.5605   1441.5900      0.0000      5.2000
+    914.6912   1441.6000      0.0000      5.2000
+    914.8220   1486.5900     35.0000      5.2000
+    914.9528   1486.5800     35.0000      5.2000
+    915.0836   1486.5800     35.0000      5.2000
+    915.2144   1486.5800     35.0000      5.1900
+    915.3452   1486.5700     35.0000      5.1900
+    915.4760   1486.5700     35.0000      5.1900
+    915.6068   1486.5700     35.0000      5.1900
+    915.7375   1486.5700     35.0000      5.1900
+    915.8683   1486.5700     35.0000      5.1900
+    915.9991   1486.5800     35.0000      5.1900
+    916.1299   1486.5800     35.0000      5.1900
+    916.2607   1486.5800     35.0000      5.1900
+    916.3915   1486.5800     35.0000      5.1900
+    916.5222   1486.5800     35.0000      5.1900
+    916.6530   1486.5900     35.0000      5.1900
+    916.7839   1486.5800     35.0000      5.1900
+    916.9146   1486.5800     35.0000      5.1900
+    917.0453   1486.5800     35.0000      5.1900
+    917.1761   1464.1700     35.0000      0.0000
+    918.3531   1441.5700      0.0000      5.1800
+    918.4839   1441.5700      0.0000      5.1800
+    918.6147   1441.5700      0.0000      5.1800
+    918.7455   1486.5700     34.9900      5.1800
+    918.8762   1486.5600     34.9900      5.1800
+    919.0070   1486.5600     34.9900      5.1800
+    919.1378   1486.5600     34.9900      5.1800
+    919.2684   1486.5600     35.0000      5.1700
+    919.3992   1486.5600     35.0000      5.1700
+    919.5300   1486.5600     35.0000      5.1700
+    919.6608   1486.5600     35.0000      5.1700
+    919.7915   1486.5600     35.0000      5.1700
+    919.9223   1486.5700     35.0000      5.1700
+    920.0530   1486.5700     35.0000      5.1700
+    920.1838   1486.5700     35.0000      5.1700
+    920.3145   1464.2200     35.0000      0.0000
+    921.4913   1441.6200      0.0000      5.1800
+    921.6220   1441.6300      0.0000      5.1800
+    921.7527   1441.6400      0.0000      5.1800
+    921.8835   1486.6500     35.0000      5.1800
+    922.0143   1486.6500     35.0000      5.1800
+    922.1450   1486.6600     35.0000      5.1800
+    922.2758   1486.6700     35.0000      5.1900
+    922.4065   1486.6700     35.0000      5.1900
+    922.5372   1486.6800     35.0000      5.1900
+    922.6680   1486.6800     35.0000      5.1900
+    922.7987   1486.6800     35.0000      5.1900
+    922.9294   1486.6900     35.0000      5.1900
+    923.0601   1486.6900     35.0000      5.1900
+    923.1909   1486.6900     35.0000      5.1900
+    923.3217   1486.6900     35.0000      5.1900
+    923.4523   1486.6900     35.0000      5.1900
+    923.5831   1486.6900     35.0000      5.1900
+    923.7138   1486.6900     35.0000      5.1900
+    923.8446   1486.6900     35.0000      5.1900
+    923.9752   1486.6900     35.0000      5.1900
+    924.1060   1486.7000     35.0000      5.1900
+    924.2368   1486.7000     35.0000      5.1900
+    924.3675   1486.7000     35.0000      5.1900
+    924.4982   1486.7100     35.0000      5.1900
+    924.6289   1486.7000     35.0000      5.1900
+    924.7596   1486.7100     35.0000      5.1900
+    924.8903   1486.7100     35.0000      5.1900
+    925.0211   1486.7100     35.0000      5.1900
+    925.1518   1486.7200     35.0000      5.1900
+    925.2825   1486.7200     35.0000      5.1900
+    925.4131   1486.7200     35.0000      5.1900
+    925.5439   1486.7200     35.0000      5.1900
+    925.6747   1486.7200     35.0000      5.1900
+    925.8053   1486.7300     35.0000      5.1900
+    925.9360   1486.7300     35.0000      5.1900
+    926.0668   1486.7300     35.0000      5.1900
+    926.1975   1486.7400     35.0000      5.1900
+    926.3282   1486.7400     35.0000      5.1900
+    926.4589   1486.7400     35.0000      5.1900
+    926.5896   1486.7400     35.0000      5.1900
+    926.7203   1486.7400     35.0000      5.1900
+    926.8510   1486.7400     35.0000      5.1800
+    926.9818   1464.3400     35.0000      0.0000
+    928.1580   1441.7300      0.0000      5.1800
+    928.2887   1441.7300      0.0000      5.1800
+    928.4194   1441.7400      0.0000      5.1800
+    928.5501   1486.7500     35.0000      5.1800
+    928.6807   1486.7500     35.0000      5.1800
+    928.8115   1486.7500     35.0000      5.1800
+    928.9422   1486.7500     35.0000      5.1800
+    929.0728   1486.7500     35.0000      5.1800
+    929.2035   1486.7500     35.0000      5.1800
+    929.3342   1486.7500     35.0000      5.1800
+    929.4650   1486.7500     35.0000      5.1800
+    929.5956   1486.7500     35.0100      5.1800
+    929.7263   1486.7500     35.0100      5.1800
+    929.8570   1486.7500     35.0100      5.1700
+    929.9876   1486.7500     35.0100      5.1700
+    930.1183   1486.7600     35.0100      5.1700
+    930.2490   1486.7500     35.0100      5.1700
+    930.3797   1486.7600     35.0100      5.1700
+    930.5103   1486.7500     35.0100      5.1700
+    930.6410   1486.7600     35.0100      5.1700
+    930.7717   1486.7600     35.0100      5.1700
+    930.9024   1486.7600     35.0100      5.1700
+    931.0330   1486.7600     35.0100      5.1700
+    931.1637   1486.7600     35.0100      5.1700
+    931.2944   1464.4100     35.0100      0.0000
+    932.4704   1441.7500      0.0000      5.1700
+    932.6011   1441.7600      0.0000      5.1700
+    932.7318   1441.7600      0.0000      5.1700
+    932.8624   1486.7800     35.0000      5.1700
+    932.9930   1486.7700     35.0000      5.1700
+    933.1237   1486.7700     35.0000      5.1700
+    933.2543   1486.7700     35.0000      5.1700
+    933.3849   1486.7700     35.0100      5.1700
+    933.5157   1486.7600     35.0000      5.1600
+    933.6464   1486.7500     35.0000      5.1600
+    933.7769   1486.7200     34.9800      5.1600
+    933.9076   1486.7100     34.9800      5.1600
+    934.0383   1486.7000     34.9800      5.1500
+    934.1689   1486.6900     34.9800      5.1500
+    934.2996   1486.6900     34.9800      5.1500
+    934.4302   1486.6800     34.9800      5.1500
+    934.5609   1486.6700     34.9800      5.1500
+    934.6915   1486.6700     34.9800      5.1400
+    934.8221   1486.6700     34.9800      5.1400
+    934.9528   1486.6900     35.0000      5.1400
+    935.0835   1486.6900     35.0000      5.1400
+    935.2141   1486.7000     35.0000      5.1400
+    935.3447   1486.7000     35.0000      5.1400
+    935.4754   1486.6900     35.0000      5.1400
+    935.6060   1486.6900     35.0000      5.1400
+    935.7366   1486.6900     35.0000      5.1400
+    935.8672   1486.6900     35.0000      5.1400
+    935.9979   1486.6900     35.0000      5.1300
+    936.1285   1486.6900     35.0000      5.1300
+    936.2592   1486.6800     35.0000      5.1300
+    936.3898   1486.6800     35.0000      5.1300
+    936.5204   1486.6800     35.0000      5.1300
+    936.6511   1486.6800     35.0000      5.1300
+    936.7817   1486.6800     35.0000      5.1300
+    936.9124   1486.6800     35.0000      5.1300
+    937.0429   1486.6900     35.0000      5.1300
+    937.1736   1486.6900     35.0000      5.1300
+    937.3042   1486.6900     35.0000      5.1300
+    937.4349   1486.6900     35.0000      5.1300
+    937.5654   1486.6900     35.0000      5.1300
+    937.6960   1486.6900     35.0000      5.1300
+    937.8267   1486.7000     35.0000      5.1300
+    937.9573   1464.5100     35.0000      0.0000
+    939.1329   1441.6600      0.0000      5.1300
+    939.2635   1441.6600      0.0000      5.1300
+    939.3940   1441.6600      0.0000      5.1200
+    939.5247   1486.7100     35.0000      5.1200
+    939.6553   1486.7000     35.0000      5.1200
+    939.7858   1486.7000     35.0000      5.1200
+    939.9165   1486.7000     35.0000      5.1200
+    940.0471   1486.7100     35.0100      5.1200
+    940.1777   1486.7100     35.0100      5.1200
+    940.3083   1486.7100     35.0100      5.1200
+    940.4389   1486.7100     35.0100      5.1200
+    940.5695   1486.7100     35.0100      5.1200
+    940.7001   1486.7100     35.0100      5.1200
+    940.8307   1486.7100     35.0100      5.1200
+    940.9613   1486.7100     35.0100      5.1200
+    941.0919   1486.7100     35.0100      5.1200
+    941.2225   1486.7200     35.0100      5.1200
+    941.3531   1486.7200     35.0100      5.1200
+    941.4837   1486.7100     35.0100      5.1200
+    941.6143   1486.7100     35.0100      5.1200
+    941.7449   1486.7100     35.0100      5.1200
+    941.8755   1486.7100     35.0100      5.1200
+    942.0061   1486.7000     35.0000      5.1100
+    942.1366   1486.7000     35.0000      5.1100
+    942.2672   1486.7000     35.0000      5.1100
+    942.3978   1486.6900     35.0000      5.1100
+    942.5284   1486.6900     35.0000      5.1100
+    942.6589   1464.6000     35.0000      0.0000
+    943.8342   1441.5900      0.0000      5.0900
+    943.9648   1441.5800      0.0000      5.0900
+    944.0953   1441.5900      0.0000      5.0900
+    944.2260   1486.6400     35.0000      5.0900
+    944.3566   1486.6400     35.0000      5.0900
+    944.4871   1486.6400     35.0000      5.0900
+    944.6176   1486.6400     35.0000      5.0900
+    944.7482   1486.6400     35.0000      5.0900
+    944.8788   1486.6400     35.0100      5.0900
+    945.0093   1486.6300     35.0000      5.0800
+    945.1399   1486.6400     35.0100      5.0800
+    945.2705   1486.6400     35.0100      5.0800
+    945.4010   1486.6400     35.0100      5.0800
+    945.5316   1486.6400     35.0100      5.0800
+    945.6622   1486.6400     35.0000      5.0800
+    945.7928   1486.6400     35.0000      5.0800
+    945.9233   1486.6400     35.0000      5.0800
+    946.0538   1486.6400     35.0000      5.0800
+    946.1844   1486.6300     35.0000      5.0800
+    946.3149   1486.6300     35.0000      5.0800
+    946.4455   1486.6200     35.0000      5.0800
+    946.5761   1464.6500     35.0000      0.0000
+    947.7510   1441.4700      0.0000      5.0500
+    947.8816   1441.4700      0.0000      5.0500
+    948.0121   1441.4700      0.0000      5.0500
+    948.1427   1486.5600     35.0100      5.0500
+    948.2732   1486.5600     35.0000      5.0500
+    948.4037   1486.5600     35.0000      5.0500
+    948.5343   1486.5600     35.0000      5.0500
+    948.6648   1486.5600     35.0000      5.0500
+    948.7953   1486.5600     35.0000      5.0500
+    948.9259   1486.5700     35.0000      5.0500
+    949.0565   1486.5700     35.0000      5.0500
+    949.1870   1486.5700     35.0000      5.0500
+    949.3175   1486.5800     35.0000      5.0500
+    949.4481   1486.5800     35.0000      5.0500
+    949.5786   1486.5800     35.0000      5.0500
+    949.7091   1486.5800     35.0000      5.0500
+    949.8397   1486.5900     35.0000      5.0500
+    949.9702   1486.5900     35.0000      5.0500
+    950.1006   1464.7200     35.0000      0.0000
+    951.2755   1441.4600      0.0000      5.0400
+    951.4059   1441.4600      0.0000      5.0400
+    951.5364   1441.4500      0.0000      5.0400
+    951.6669   1486.5400     35.0000      5.0300
+    951.7975   1486.5300     35.0000      5.0300
+    951.9279   1486.5300     35.0000      5.0300
+    952.0585   1486.5300     35.0000      5.0300
+    952.1890   1486.5300     35.0000      5.0300
+    952.3196   1486.5300     35.0000      5.0300
+    952.4500   1486.5300     35.0000      5.0300
+    952.5806   1486.5300     34.9900      5.0300
+    952.7111   1486.5300     34.9900      5.0300
+    952.8415   1486.5300     34.9900      5.0300
+    952.9720   1486.5200     34.9900      5.0300
+    953.1026   1486.5200     34.9900      5.0300
+    953.2331   1486.5200     34.9900      5.0300
+    953.3635   1486.5200     34.9900      5.0300
+    953.4941   1486.5200     34.9900      5.0300
+    953.6246   1486.5200     34.9900      5.0300
+    953.7551   1486.5200     35.0000      5.0200
+    953.8856   1486.5200     35.0000      5.0200
+    954.0161   1486.5200     35.0000      5.0200
+    954.1466   1486.5200     35.0000      5.0200
+    954.2770   1486.5100     35.0000      5.0200
+    954.4076   1486.5100     35.0000      5.0200
+    954.5381   1486.5100     35.0000      5.0200
+    954.6686   1486.5000     35.0000      5.0100
+    954.7990   1464.7900     35.0000      0.0000
+    957.1477   1441.4400      0.0000      5.0100
+    957.2783   1441.4400      0.0000      5.0100
+    957.4088   1441.4500      0.0000      5.0100
+    957.5391   1486.5500     35.0000      5.0100
+    957.6696   1486.5500     35.0000      5.0100
+    957.8001   1486.5500     35.0000      5.0200
+    957.9306   1486.5600     35.0000      5.0200
+    958.0610   1486.5700     35.0000      5.0200
+    958.1915   1486.5700     35.0000      5.0200
+    958.3220   1486.5700     35.0000      5.0200
+    958.4524   1486.5800     35.0000      5.0200
+    958.5829   1486.5900     35.0000      5.0200
+    958.7134   1486.5900     35.0000      5.0200
+    958.8439   1486.5900     35.0000      5.0200
+    958.9742   1486.5900     35.0000      5.0200
+    959.1047   1486.6000     35.0000      5.0200
+    959.2352   1486.6000     35.0000      5.0200
+    959.3656   1486.6000     35.0000      5.0200
+    959.4961   1464.8700     35.0000      0.0000
+    960.6702   1441.5000      0.0000      5.0100
+    960.8006   1441.5000      0.0000      5.0100
+    960.9311   1441.5000      0.0000      5.0100
+    961.0616   1486.6100     35.0000      5.0100
+    961.1920   1486.6100     35.0000      5.0100
+    961.3224   1486.6100     35.0000      5.0100
+    961.4529   1486.6100     35.0000      5.0100
+    961.5833   1486.6200     35.0000      5.0100
+    961.7137   1486.6200     35.0000      5.0100
+    961.8442   1486.6200     35.0000      5.0100
+    961.9747   1486.6200     35.0000      5.0100
+    962.1051   1486.6200     35.0000      5.0100
+    962.2355   1486.6300     35.0000      5.0100
+    962.3659   1486.6300     35.0000      5.0100
+    962.4964   1486.6300     35.0000      5.0100
+    962.6268   1486.6400     35.0000      5.0100
+    962.7572   1486.6400     35.0000      5.0100
+    962.8877   1486.6400     35.0000      5.0100
+    963.0181   1486.6400     35.0000      5.0100
+    963.1485   1486.6400     35.0000      5.0100
+    963.2789   1486.6500     35.0000      5.0100
+    963.4094   1486.6500     35.0000      5.0100
+    963.5399   1486.6500     35.0000      5.0100
+    963.6702   1486.6500     35.0000      5.0100
+    963.8007   1486.6500     35.0000      5.0100
+    963.9311   1486.6600     35.0000      5.0100
+    964.0615   1486.6600     35.0000      5.0100
+    964.1919   1464.9500     35.0000      0.0000
+    965.3657   1441.5600      0.0000      5.0100
+    965.4960   1441.5600      0.0000      5.0100
+    965.6265   1441.5600      0.0000      5.0100
+    965.7569   1486.6700     35.0000      5.0100
+    965.8873   1486.6800     35.0000      5.0100
+    966.0177   1486.6800     35.0000      5.0100
+    966.1481   1486.6800     35.0000      5.0100
+    966.2786   1486.6800     35.0000      5.0100
+    966.4089   1486.6800     35.0100      5.0100
+    966.5393   1486.6800     35.0000      5.0100
+    966.6697   1486.6700     35.0000      5.0100
+    966.8002   1486.6600     35.0000      5.0000
+    966.9305   1486.6600     35.0000      5.0000
+    967.0610   1486.6500     35.0000      5.0000
+    967.1913   1486.6500     35.0000      5.0000
+    967.3217   1486.6400     35.0000      5.0000
+    967.4521   1486.6400     35.0000      5.0000
+    967.5825   1486.6400     35.0000      4.9900
+    967.7130   1486.6400     35.0000      4.9900
+    967.8433   1486.6400     35.0000      4.9900
+    967.9737   1486.6400     35.0000      4.9900
+    968.1041   1465.0200     35.0000      0.0000
+    969.2776   1441.5100      0.0000      4.9900
+    969.4080   1441.5100      0.0000      4.9800
+    969.5384   1441.5100      0.0000      4.9800
+    969.6687   1486.6200     35.0000      4.9800
+    969.7991   1486.6200     35.0000      4.9800
+    969.9295   1486.6300     35.0000      4.9800
+    970.0599   1486.6300     35.0000      4.9800
+    970.1902   1486.6300     35.0000      4.9800
+    970.3206   1486.6400     35.0000      4.9800
+    970.4510   1486.6400     35.0000      4.9900
+    970.5813   1486.6500     34.9900      4.9900
+    970.7117   1486.6600     34.9900      4.9900
+    970.8421   1486.6700     35.0000      4.9900
+    970.9725   1486.6800     35.0000      4.9900
+    971.1028   1486.6800     35.0000      4.9900
+    971.2332   1486.6900     35.0000      4.9900
+    971.3636   1486.7000     35.0000      5.0000
+    971.4939   1486.7000     35.0000      5.0000
+    971.6243   1486.7000     35.0000      4.9900
+    971.7547   1486.7000     35.0000      4.9900
+    971.8851   1486.7000     35.0000      4.9900
+    972.0154   1486.6900     35.0000      4.9900
+    972.1458   1486.6800     35.0000      4.9900
+    972.2761   1486.6800     35.0000      4.9900
+    972.4064   1486.6800     35.0000      4.9900
+    972.5368   1486.6800     34.9900      4.9900
+    972.6672   1486.6700     34.9900      4.9800
+    972.7975   1486.6700     34.9900      4.9800
+    972.9279   1486.6800     34.9900      4.9800
+    973.0582   1486.6700     34.9900      4.9800
+    973.1886   1486.6700     34.9900      4.9800
+    973.3190   1486.6700     34.9900      4.9800
+    973.4493   1486.6700     35.0000      4.9800
+    973.5797   1465.1000     35.0000      0.0000
+    975.5348   1441.5500      0.0000      4.9700
+    975.6650   1441.5500      0.0000      4.9700
+    975.7954   1441.5500      0.0000      4.9700
+    975.9258   1486.6800     35.0000      4.9700
+    976.0562   1486.6800     35.0000      4.9700
+    976.1864   1486.6800     35.0000      4.9700
+    976.3168   1486.6800     34.9900      4.9700
+    976.4471   1486.6900     35.0000      4.9700
+    976.5775   1486.6800     34.9900      4.9700
+    976.7077   1486.6900     35.0000      4.9700
+    976.8381   1486.6900     35.0000      4.9700
+    976.9684   1486.6900     35.0000      4.9700
+    977.0987   1486.6900     35.0000      4.9700
+    977.2290   1486.6900     35.0000      4.9700
+    977.3594   1486.6900     35.0000      4.9700
+    977.4897   1486.6900     35.0000      4.9700
+    977.6200   1486.6900     35.0000      4.9700
+    977.7503   1486.6900     35.0000      4.9700
+    977.8807   1486.6900     34.9900      4.9700
+    978.0109   1486.6900     34.9900      4.9700
+    978.1412   1486.6900     35.0000      4.9700
+    978.2716   1486.6900     35.0000      4.9700
+    978.4019   1486.6900     35.0000      4.9700
+    978.5322   1486.6900     35.0000      4.9700
+    978.6625   1486.6900     35.0000      4.9700
+    978.7928   1486.7000     35.0000      4.9700
+    978.9231   1486.6900     35.0000      4.9600
+    979.0534   1486.6900     35.0000      4.9600
+    979.1838   1486.6900     34.9900      4.9600
+    979.3141   1486.6900     35.0000      4.9600
+    979.4443   1486.6900     35.0000      4.9600
+    979.5746   1486.6900     35.0000      4.9600
+    979.7050   1486.6800     35.0000      4.9600
+    979.8353   1486.6800     35.0000      4.9600
+    979.9656   1486.6800     35.0000      4.9600
+    980.0959   1486.6700     34.9900      4.9500
+    980.2262   1486.6700     35.0000      4.9500
+    980.3564   1486.6700     35.0000      4.9500
+    980.4868   1486.6700     34.9900      4.9500
+    980.6171   1486.6600     34.9900      4.9500
+    980.7474   1486.6600     34.9900      4.9500
+    980.8776   1486.6600     34.9900      4.9500
+    981.0079   1486.6600     34.9900      4.9500
+    981.1382   1486.6600     34.9900      4.9500
+    981.2685   1486.6600     35.0000      4.9500
+    981.3988   1486.6600     34.9900      4.9500
+    981.5291   1486.6600     34.9900      4.9400
+    981.6594   1486.6600     35.0000      4.9400
+    981.7897   1486.6600     35.0000      4.9400
+    981.9200   1486.6600     35.0000      4.9400
+    982.0503   1486.6700     35.0000      4.9400
+    982.1805   1486.6700     35.0000      4.9400
+    982.3108   1486.6700     35.0000      4.9400
+    982.4411   1486.6700     35.0000      4.9400
+    982.5714   1486.6700     35.0000      4.9400
+    982.7017   1486.6700     35.0000      4.9400
+    982.8320   1486.6700     35.0000      4.9400
+    982.9623   1486.6800     35.0000      4.9400
+    983.0925   1486.6700     35.0000      4.9400
+    983.2228   1486.6700     35.0000      4.9400
+    983.3531   1465.2700     35.0000      0.0000
+    984.5255   1441.5200      0.0000      4.9300
+    984.6558   1441.5200      0.0000      4.9300
+    984.7860   1441.5200      0.0000      4.9300
+    984.9163   1486.6500     34.9900      4.9300
+    985.0465   1486.6500     34.9900      4.9300
+    985.1768   1486.6500     34.9900      4.9300
+    985.3071   1465.2900     34.9900      0.0000
+    986.4794   1441.5000      0.0000      4.9200
+    986.6096   1441.4900      0.0000      4.9200
+    986.7399   1441.4900      0.0000      4.9200
+    986.8701   1486.6400     34.9900      4.9200
+    987.0004   1486.6300     34.9900      4.9200
+    987.1306   1486.6400     34.9900      4.9200
+    987.2609   1486.6300     34.9900      4.9200
+    987.3911   1486.6300     34.9900      4.9100
+    987.5214   1486.6300     34.9900      4.9100
+    987.6516   1465.3300     34.9900      0.0000
+    988.8237   1441.4900      0.0000      4.9100
+    988.9540   1441.4900      0.0000      4.9100
+    989.0842   1441.4900      0.0000      4.9100
+    989.2144   1486.6400     34.9900      4.9100
+    989.3447   1486.6400     34.9900      4.9100
+    989.4749   1486.6400     34.9900      4.9100
+    989.6052   1486.6400     35.0000      4.9100
+    989.7353   1486.6400     35.0000      4.9100
+    989.8656   1486.6400     35.0000      4.9100
+    989.9958   1486.6400     35.0000      4.9100
+    990.1260   1486.6400     35.0000      4.9100
+    990.2562   1486.6400     35.0000      4.9100
+    990.3865   1486.6500     35.0000      4.9100
+    990.5167   1486.6500     35.0000      4.9100
+    990.6469   1486.6500     35.0000      4.9100
+    990.7771   1486.6500     35.0000      4.9100
+    990.9073   1486.6500     35.0000      4.9100
+    991.0375   1486.6600     35.0000      4.9100
+    991.1677   1486.6600     35.0000      4.9100
+    991.2980   1486.6600     35.0000      4.9100
+    991.4282   1486.6600     35.0000      4.9100
+    991.5584   1486.6700     35.0000      4.9100
+    991.6886   1486.6700     35.0000      4.9100
+    991.8188   1486.6700     35.0000      4.9100
+    991.9490   1486.6700     35.0000      4.9100
+    992.0792   1486.6700     35.0000      4.9100
+    992.2095   1486.6800     35.0000      4.9100
+    992.3397   1486.6800     35.0000      4.9100
+    992.4698   1486.6800     35.0000      4.9100
+    992.6001   1486.6800     35.0000      4.9100
+    992.7303   1486.6800     35.0000      4.9100
+    992.8605   1486.6900     35.0000      4.9100
+    992.9907   1486.6900     35.0000      4.9100
+    993.1209   1465.4200     35.0000      0.0000
+    994.2926   1441.5500      0.0000      4.9100
+    994.4229   1441.5500      0.0000      4.9100
+    994.5530   1441.5500      0.0000      4.9100
+    994.6833   1486.7200     35.0000      4.9100
+    994.8134   1486.7200     35.0000      4.9100
+    994.9436   1486.7200     35.0000      4.9100
+    995.0738   1486.7200     35.0000      4.9100
+    995.2039   1486.7200     35.0000      4.9100
+    995.3341   1486.7300     35.0000      4.9100
+    995.4644   1486.7300     35.0000      4.9100
+    995.5945   1486.7300     35.0000      4.9100
+    995.7247   1486.7300     35.0000      4.9100
+    995.8549   1486.7300     35.0000      4.9100
+    995.9851   1486.7400     35.0000      4.9100
+    996.1153   1486.7400     35.0000      4.9100
+    996.2454   1486.7400     35.0000      4.9100
+    996.3756   1486.7400     35.0000      4.9100
+    996.5058   1486.7400     35.0000      4.9100
+    996.6359   1486.7500     34.9900      4.9100
+    996.7661   1486.7500     34.9900      4.9100
+    996.8963   1486.7500     34.9900      4.9100
+    997.0265   1486.7500     34.9900      4.9000
+    997.1566   1486.7500     35.0000      4.9000
+    997.2868   1486.7500     35.0000      4.9000
+    997.4170   1486.7500     35.0000      4.9000
+    997.5471   1486.7500     35.0000      4.9000
+    997.6773   1486.7500     35.0000      4.9000
+    997.8075   1465.5000     35.0000      0.0000
+    998.9789   1441.5500      0.0000      4.8900
+    999.1091   1441.5500      0.0000      4.8900
+    999.2393   1441.5500      0.0000      4.8900
+    999.3694   1486.7100     34.9900      4.8900
+    999.4995   1486.7200     34.9900      4.8900
+    999.6297   1486.7200     35.0000      4.8900
+    999.7599   1486.7200     35.0000      4.8900
+    999.8900   1486.7200     35.0000      4.8900
+   1000.0201   1486.7200     34.9900      4.8800
+   1000.1503   1486.7200     34.9900      4.8800
+   1000.2805   1486.7200     35.0000      4.8800
+   1000.4105   1486.7200     35.0000      4.8800
+   1000.5407   1486.7200     34.9900      4.8800
+   1000.6709   1486.7200     34.9900      4.8800
+   1000.8010   1486.7200     34.9900      4.8800
+   1000.9311   1486.7200     34.9900      4.8800
+   1001.0613   1486.7200     34.9900      4.8800
+   1001.1915   1486.7300     35.0000      4.8800
+   1001.3215   1486.7300     34.9900      4.8800
+   1001.4517   1486.7300     34.9900      4.8800
+   1001.5818   1486.7300     34.9900      4.8800
+   1001.7119   1486.7300     34.9900      4.8800
+   1001.8421   1486.7400     35.0000      4.8800
+   1001.9722   1486.7400     34.9900      4.8800
+   1002.1024   1486.7500     34.9900      4.8800
+   1002.2325   1486.7400     34.9900      4.8800
+   1002.3626   1486.7500     34.9900      4.8800
+   1002.4928   1465.5800     35.0000      0.0000
+   1003.6639   1441.5900      0.0000      4.8800
+   1003.7940   1441.6000      0.0000      4.8800
+   1003.9241   1441.6000      0.0000      4.8800
+   1004.0542   1486.7800     35.0000      4.8800
+   1004.1843   1486.7800     35.0000      4.8800
+   1004.3145   1486.7800     35.0000      4.8800
+   1004.4446   1486.7800     35.0000      4.8800
+   1004.5746   1486.7800     34.9900      4.8800
+   1004.7048   1486.7900     34.9900      4.8800
+   1004.8350   1486.7800     34.9900      4.8800
+   1004.9650   1486.7800     34.9900      4.8800
+   1005.0951   1486.7900     34.9900      4.8800
+   1005.2253   1486.7900     34.9900      4.8800
+   1005.3554   1486.8000     34.9900      4.8800
+   1005.4854   1486.8000     35.0000      4.8800
+   1005.6155   1486.8000     35.0000      4.8800
+   1005.7457   1486.8100     35.0000      4.8800
+   1005.8759   1486.8000     35.0000      4.8800
+   1006.0059   1486.8000     35.0000      4.8800
+   1006.1360   1486.8000     35.0000      4.8800
+   1006.2661   1486.8000     34.9900      4.8800
+   1006.3961   1486.8000     34.9900      4.8800
+   1006.5262   1486.7900     34.9900      4.8800
+   1006.6564   1486.8000     34.9900      4.8800
+   1006.7865   1486.7900     34.9900      4.8800
+   1006.9166   1486.7900     34.9900      4.8800
+   1007.0467   1486.7900     34.9900      4.8800
+   1007.1768   1465.6500     34.9900      0.0000
+   1008.3475   1441.6400      0.0000      4.8800
+   1008.4777   1441.6400      0.0000      4.8700
+   1008.6078   1441.6400      0.0000      4.8700
+   1008.7378   1486.8100     34.9900      4.8700
+   1008.8679   1486.8100     34.9900      4.8700
+   1008.9980   1486.8100     34.9900      4.8700
+   1009.1281   1486.8100     34.9900      4.8700
+   1009.2581   1486.8000     34.9900      4.8700
+   1009.3882   1486.8000     34.9900      4.8700
+   1009.5183   1486.8000     34.9900      4.8700
+   1009.6483   1486.8100     34.9900      4.8700
+   1009.7784   1486.8000     34.9900      4.8700
+   1009.9085   1486.8100     34.9900      4.8700
+   1010.0386   1486.8000     34.9900      4.8600
+   1010.1686   1486.8000     34.9900      4.8600
+   1010.2987   1486.8100     35.0000      4.8600
+   1010.4288   1486.8100     35.0000      4.8600
+   1010.5588   1486.8100     35.0000      4.8600
+   1010.6889   1486.8100     35.0000      4.8600
+   1010.8190   1486.8100     35.0000      4.8600
+   1010.9491   1486.8100     34.9900      4.8600
+   1011.0791   1486.8000     34.9900      4.8600
+   1011.2092   1486.8000     34.9900      4.8600
+   1011.3393   1486.8000     34.9900      4.8600
+   1011.4692   1486.8000     34.9900      4.8600
+   1011.5994   1486.8000     34.9900      4.8600
+   1011.7294   1486.7900     34.9900      4.8600
+   1011.8595   1486.7900     34.9900      4.8600
+   1011.9895   1486.7900     34.9900      4.8600
+   1012.1196   1486.7900     34.9900      4.8600
+   1012.2497   1465.7300     34.9900      0.0000
+   1013.4201   1441.6000      0.0000      4.8500
+   1013.5502   1441.6000      0.0000      4.8500
+   1013.6802   1441.6000      0.0000      4.8500
+   1013.8102   1486.7900     34.9900      4.8500
+   1013.9402   1486.7900     34.9900      4.8500
+   1014.0703   1486.7900     35.0000      4.8500
+   1014.2004   1486.7900     34.9900      4.8500
+   1014.3304   1486.7900     34.9900      4.8500
+   1014.4604   1486.7900     34.9900      4.8500
+   1014.5905   1486.7900     34.9900      4.8500
+   1014.7205   1486.7900     34.9900      4.8500
+   1014.8505   1486.7900     34.9800      4.8500
+   1014.9806   1486.7900     34.9800      4.8500
+   1015.1107   1486.8000     34.9800      4.8500
+   1015.2406   1486.8000     34.9800      4.8500
+   1015.3707   1486.8000     34.9800      4.8500
+   1015.5007   1486.8000     34.9900      4.8500
+   1015.6308   1486.8000     34.9900      4.8400
+   1015.7607   1486.8100     34.9900      4.8400
+   1015.8908   1486.8100     34.9900      4.8400
+   1016.0209   1486.8100     34.9900      4.8400
+   1016.1508   1486.8100     34.9900      4.8400
+   1016.2809   1486.8100     34.9900      4.8400
+   1016.4109   1486.8100     34.9900      4.8400
+   1016.5410   1486.8100     34.9900      4.8400
+   1016.6709   1486.8100     34.9900      4.8400
+   1016.8010   1486.8200     34.9800      4.8400
+   1016.9310   1486.8100     34.9800      4.8400
+   1017.0610   1486.8100     34.9800      4.8400
+   1017.1910   1486.8100     34.9800      4.8400
+   1017.3210   1486.8100     34.9800      4.8400
+   1017.4511   1486.8100     34.9900      4.8400
+   1017.5811   1486.8100     34.9900      4.8400
+   1017.7111   1486.8100     34.9900      4.8400
+   1017.8411   1486.8100     34.9900      4.8400
+   1017.9711   1486.8100     34.9900      4.8400
+   1018.1011   1486.8100     34.9900      4.8400
+   1018.2311   1486.8200     34.9900      4.8400
+   1018.3611   1486.8200     34.9900      4.8400
+   1018.4911   1486.8200     34.9900      4.8400
+   1018.6212   1486.8200     34.9900      4.8400
+   1018.7512   1486.8200     34.9900      4.8400
+   1018.8812   1486.8200     34.9900      4.8400
+   1019.0111   1486.8200     34.9900      4.8400
+   1019.1412   1486.8300     34.9900      4.8400
+   1019.2712   1486.8300     34.9900      4.8400
+   1019.4011   1486.8300     34.9900      4.8400
+   1019.5311   1486.8300     34.9900      4.8300
+   1019.6612   1486.8300     34.9900      4.8300
+   1019.7912   1486.8300     34.9900      4.8300
+   1019.9211   1486.8300     34.9900      4.8300
+   1020.0511   1486.8300     34.9900      4.8300
+   1020.1812   1486.8300     34.9900      4.8300
+   1020.3111   1486.8300     34.9900      4.8300
+   1020.4411   1486.8300     34.9900      4.8300
+   1020.5711   1486.8300     34.9900      4.8300
+   1020.7012   1486.8300     34.9900      4.8300
+   1020.8311   1486.8300     34.9900      4.8300
+   1020.9611   1486.8300     34.9900      4.8300
+   1021.0911   1486.8300     34.9900      4.8300
+   1021.2210   1486.8200     34.9900      4.8300
+   1021.3510   1486.8200     34.9900      4.8300
+   1021.4810   1486.8200     34.9900      4.8200
+   1021.6111   1465.8900     34.9900      0.0000
+   1022.7808   1441.5900      0.0000      4.8100
+   1022.9108   1441.6000      0.0000      4.8100
+   1023.0408   1441.6000      0.0000      4.8100
+   1023.1707   1486.8000     34.9900      4.8100
+   1023.3007   1486.8000     34.9900      4.8100
+   1023.4307   1486.8000     34.9900      4.8100
+   1023.5606   1486.8000     34.9900      4.8100
+   1023.6906   1486.8000     34.9900      4.8100
+   1023.8206   1486.8000     34.9900      4.8100
+   1023.9506   1486.8000     34.9900      4.8100
+   1024.0804   1486.8000     34.9900      4.8100
+   1024.2104   1486.8000     34.9900      4.8100
+   1024.3405   1486.7900     34.9900      4.8100
+   1024.4703   1486.7900     34.9900      4.8100
+   1024.6003   1486.7900     34.9900      4.8000
+   1024.7303   1486.7800     34.9900      4.8000
+   1024.8604   1486.7800     34.9900      4.8000
+   1024.9902   1486.7800     34.9800      4.8000
+   1025.1202   1486.7700     34.9800      4.8000
+   1025.2502   1486.7700     34.9900      4.8000
+   1025.3801   1486.7700     34.9900      4.8000
+   1025.5100   1486.7800     34.9900      4.8000
+   1025.6400   1486.7700     34.9900      4.8000
+   1025.7700   1486.7800     34.9900      4.8000
+   1025.8999   1486.7800     34.9900      4.8000
+   1026.0299   1486.7800     34.9900      4.8000
+   1026.1598   1486.7800     34.9900      4.8000
+   1026.2898   1486.7900     34.9900      4.8000
+   1026.4197   1486.7900     34.9900      4.8000
+   1026.5497   1486.7900     34.9900      4.8000
+   1026.6797   1486.7900     34.9900      4.8000
+   1026.8096   1486.7900     34.9900      4.8000
+   1026.9395   1486.8000     34.9900      4.8000
+   1027.0695   1486.8000     34.9900      4.8000
+   1027.1995   1486.8000     34.9900      4.8000
+   1027.3293   1486.8000     34.9900      4.8000
+   1027.4592   1486.8000     34.9900      4.8000
+   1027.5892   1486.8100     34.9900      4.8000
+   1027.7191   1486.8100     34.9900      4.8000
+   1027.8490   1486.8100     34.9900      4.8000
+   1027.9790   1486.8100     34.9900      4.8000
+   1028.1090   1486.8200     34.9900      4.8000
+   1028.2389   1486.8200     34.9900      4.8000
+   1028.3688   1486.8200     34.9900      4.8000
+   1028.4988   1486.8200     34.9900      4.8000
+   1028.6287   1486.8200     34.9900      4.8000
+   1028.7585   1486.8300     34.9900      4.8000
+   1028.8885   1486.8300     34.9900      4.8000
+   1029.0184   1486.8300     34.9900      4.8000
+   1029.1483   1486.8300     34.9900      4.8000
+   1029.2783   1486.8300     34.9900      4.8000
+   1029.4082   1486.8400     34.9900      4.8000
+   1029.5382   1486.8400     34.9900      4.8000
+   1029.6681   1486.8400     34.9900      4.8000
+   1029.7980   1486.8400     34.9900      4.8000
+   1029.9280   1486.8400     34.9900      4.8000
+   1030.0577   1486.8500     34.9900      4.8000
+   1030.1877   1486.8500     34.9900      4.8000
+   1030.3176   1486.8500     34.9900      4.8000
+   1030.4476   1486.8500     34.9900      4.8000
+   1030.5775   1486.8500     34.9900      4.8000
+   1030.7074   1486.8600     34.9900      4.8000
+   1030.8374   1486.8600     34.9900      4.8000
+   1030.9672   1486.8600     34.9900      4.8000
+   1031.0972   1486.8600     34.9900      4.8000
+   1031.2271   1486.8600     34.9900      4.8000
+   1031.3571   1486.8700     34.9900      4.8000
+   1031.4868   1486.8700     34.9900      4.8000
+   1031.6168   1486.8700     34.9900      4.8000
+   1031.7467   1486.8700     34.9900      4.8000
+   1031.8767   1486.8800     34.9900      4.8000
+   1032.0065   1486.8800     34.9900      4.8000
+   1032.1365   1486.8800     34.9900      4.8000
+   1032.2664   1486.8800     34.9900      4.8000
+   1032.3961   1486.8800     34.9900      4.8000
+   1032.5261   1486.8900     34.9900      4.8000
+   1032.6560   1486.8900     34.9900      4.8000
+   1032.7860   1486.8900     34.9900      4.8000
+   1032.9158   1486.8900     34.9900      4.8000
+   1033.0457   1486.8900     34.9900      4.8000
+   1033.1757   1486.9000     34.9900      4.8000
+   1033.3054   1486.9000     34.9900      4.8000
+   1033.4354   1486.9000     34.9900      4.8000
+   1033.5653   1486.9000     34.9800      4.8000
+   1033.6952   1486.9000     34.9800      4.8000
+   1033.8251   1486.9100     34.9800      4.8000
+   1033.9550   1486.9100     34.9800      4.8000
+   1034.0848   1486.9100     34.9800      4.8000
+   1034.2147   1486.9100     34.9800      4.8000
+   1034.3446   1486.9100     34.9800      4.8000
+   1034.4745   1486.9200     34.9800      4.8000
+   1034.6044   1486.9200     34.9800      4.8000
+   1034.7343   1486.9200     34.9800      4.8000
+   1034.8641   1486.9200     34.9800      4.8000
+   1034.9940   1486.9200     34.9800      4.8000
+   1035.1240   1486.9300     34.9800      4.8000
+   1035.2538   1486.9300     34.9800      4.8000
+   1035.3837   1486.9300     34.9800      4.8000
+   1035.5135   1486.9300     34.9800      4.8000
+   1035.6434   1486.9400     34.9800      4.8000
+   1035.7733   1486.9300     34.9800      4.8000
+   1035.9032   1486.9400     34.9800      4.8000
+   1036.0331   1486.9400     34.9800      4.8000
+   1036.1628   1486.9400     34.9800      4.8000
+   1036.2928   1486.9400     34.9800      4.8000
+   1036.4227   1486.9400     34.9800      4.8000
+   1036.5525   1486.9500     34.9800      4.8000
+   1036.6824   1486.9400     34.9800      4.7900
+   1036.8123   1486.9500     34.9900      4.7900
+   1036.9421   1486.9500     34.9900      4.7900
+   1037.0720   1486.9500     34.9900      4.7900
+   1037.2019   1466.1400     34.9900      0.0000
+   1038.3706   1441.6900      0.0000      4.7800
+   1038.5005   1441.6900      0.0000      4.7800
+   1038.6304   1441.6900      0.0000      4.7800
+   1038.7603   1486.9100     34.9800      4.7800
+   1038.8900   1486.9100     34.9800      4.7800
+   1039.0199   1486.9100     34.9900      4.7800
+   1039.1498   1486.9100     34.9900      4.7800
+   1039.2797   1486.9100     34.9900      4.7700
+   1039.4094   1486.9100     34.9900      4.7700
+   1039.5393   1486.9100     34.9900      4.7700
+   1039.6692   1486.9100     34.9900      4.7700
+   1039.7990   1486.9100     34.9900      4.7700
+   1039.9288   1486.9000     34.9900      4.7700
+   1040.0587   1486.9000     34.9900      4.7700
+   1040.1885   1486.9100     34.9900      4.7700
+   1040.3184   1486.9000     34.9900      4.7700
+   1040.4481   1486.9100     34.9900      4.7700
+   1040.5780   1486.9000     34.9900      4.7700
+   1040.7078   1486.9000     34.9900      4.7700
+   1040.8376   1486.9000     34.9900      4.7700
+   1040.9675   1486.9000     34.9800      4.7700
+   1041.0974   1486.9100     34.9800      4.7700
+   1041.2272   1486.9000     34.9800      4.7700
+   1041.3571   1486.9000     34.9800      4.7700
+   1041.4868   1486.9000     34.9800      4.7700
+   1041.6167   1486.9000     34.9800      4.7600
+   1041.7465   1486.9000     34.9800      4.7600
+   1041.8763   1466.2100     34.9800      0.0000
+   1043.0447   1441.6700      0.0000      4.7600
+   1043.1746   1441.6600      0.0000      4.7600
+   1043.3044   1441.6700      0.0000      4.7600
+   1043.4342   1486.9100     34.9900      4.7600
+   1043.5640   1486.9100     34.9800      4.7600
+   1043.6938   1486.9200     34.9800      4.7600
+   1043.8237   1486.9200     34.9800      4.7600
+   1043.9534   1486.9200     34.9800      4.7600
+   1044.0833   1486.9300     34.9800      4.7600
+   1044.2131   1486.9300     34.9800      4.7600
+   1044.3429   1486.9300     34.9800      4.7600
+   1044.4727   1486.9300     34.9800      4.7600
+   1044.6025   1486.9300     34.9800      4.7600
+   1044.7323   1486.9400     34.9800      4.7600
+   1044.8622   1486.9300     34.9800      4.7600
+   1044.9919   1486.9400     34.9800      4.7600
+   1045.1217   1486.9400     34.9900      4.7600
+   1045.2516   1486.9400     34.9900      4.7600
+   1045.3813   1486.9500     34.9800      4.7600
+   1045.5111   1486.9500     34.9800      4.7600
+   1045.6410   1486.9600     34.9800      4.7600
+   1045.7708   1486.9600     34.9800      4.7600
+   1045.9005   1486.9600     34.9800      4.7600
+   1046.0304   1486.9600     34.9800      4.7600
+   1046.1602   1486.9600     34.9800      4.7600
+   1046.2899   1486.9700     34.9800      4.7600
+   1046.4197   1486.9600     34.9800      4.7600
+   1046.5496   1466.2900     34.9800      0.0000
+   1047.7175   1441.7400      0.0000      4.7600
+   1047.8474   1441.7400      0.0000      4.7600
+   1047.9772   1441.7400      0.0000      4.7600
+   1048.1071   1486.9800     34.9800      4.7600
+   1048.2367   1486.9800     34.9800      4.7600
+   1048.3666   1486.9800     34.9800      4.7600
+   1048.4963   1486.9900     34.9800      4.7600
+   1048.6261   1486.9900     34.9800      4.7600
+   1048.7559   1486.9900     34.9800      4.7600
+   1048.8856   1486.9900     34.9800      4.7600
+   1049.0155   1486.9900     34.9800      4.7600
+   1049.1451   1487.0000     34.9800      4.7600
+   1049.2749   1487.0000     34.9800      4.7600
+   1049.4048   1487.0000     34.9800      4.7600
+   1049.5344   1487.0000     34.9800      4.7600
+   1049.6643   1487.0100     34.9800      4.7600
+   1049.7941   1487.0100     34.9800      4.7600
+   1049.9238   1487.0100     34.9800      4.7600
+   1050.0536   1487.0100     34.9800      4.7600
+   1050.1833   1487.0100     34.9800      4.7600
+   1050.3131   1487.0200     34.9800      4.7600
+   1050.4429   1487.0200     34.9800      4.7600
+   1050.5726   1487.0200     34.9800      4.7600
+   1050.7024   1487.0200     34.9800      4.7600
+   1050.8322   1487.0200     34.9800      4.7600
+   1050.9619   1487.0300     34.9800      4.7600
+   1051.0917   1487.0300     34.9800      4.7600
+   1051.2214   1466.3700     34.9800      0.0000
+   1052.3892   1441.8000      0.0000      4.7500
+   1052.5189   1441.8000      0.0000      4.7500
+   1052.6487   1441.8000      0.0000      4.7500
+   1052.7784   1487.0400     34.9900      4.7500
+   1052.9082   1487.0400     34.9900      4.7500
+   1053.0380   1487.0400     34.9900      4.7500
+   1053.1677   1487.0400     34.9900      4.7500
+   1053.2974   1487.0400     34.9900      4.7500
+   1053.4271   1487.0400     34.9900      4.7500
+   1053.5569   1487.0400     34.9900      4.7500
+   1053.6866   1487.0400     34.9900      4.7500
+   1053.8164   1487.0400     34.9900      4.7500
+   1053.9462   1487.0400     34.9900      4.7500
+   1054.0759   1487.0500     34.9900      4.7500
+   1054.2056   1487.0500     34.9900      4.7500
+   1054.3353   1487.0500     34.9900      4.7500
+   1054.4651   1487.0500     34.9900      4.7500
+   1054.5948   1487.0500     34.9900      4.7500
+   1054.7245   1487.0500     34.9900      4.7500
+   1054.8542   1487.0600     34.9900      4.7500
+   1054.9840   1487.0600     34.9900      4.7500
+   1055.1136   1466.4400     34.9900      0.0000
+   1056.2812   1441.8100      0.0000      4.7400
+   1056.4110   1441.8100      0.0000      4.7400
+   1056.5406   1441.8100      0.0000      4.7400
+   1056.6703   1466.4600     34.9800      0.0000
+   1057.8378   1441.8000      0.0000      4.7400
+   1057.9674   1441.8000      0.0000      4.7300
+   1058.0972   1441.8000      0.0000      4.7300
+   1058.2269   1487.0500     34.9900      4.7300
+   1058.3566   1487.0400     34.9900      4.7300
+   1058.4862   1487.0400     34.9800      4.7300
+   1058.6160   1487.0400     34.9800      4.7300
+   1058.7457   1487.0400     34.9800      4.7300
+   1058.8754   1487.0400     34.9800      4.7300
+   1059.0051   1487.0400     34.9900      4.7300
+   1059.1348   1487.0400     34.9800      4.7300
+   1059.2644   1487.0400     34.9800      4.7300
+   1059.3942   1487.0500     34.9800      4.7300
+   1059.5238   1487.0500     34.9900      4.7300
+   1059.6536   1487.0600     34.9900      4.7300
+   1059.7832   1487.0600     34.9900      4.7300
+   1059.9130   1487.0700     34.9900      4.7300
+   1060.0426   1487.0700     34.9900      4.7300
+   1060.1722   1487.0700     34.9900      4.7300
+   1060.3020   1487.0800     34.9900      4.7300
+   1060.4316   1487.0800     34.9900      4.7300
+   1060.5614   1487.0900     34.9900      4.7300
+   1060.6910   1487.0900     34.9900      4.7300
+   1060.8207   1487.0900     34.9900      4.7300
+   1060.9504   1487.0900     34.9900      4.7300
+   1061.0802   1487.0900     34.9900      4.7300
+   1061.2097   1487.0900     34.9900      4.7300
+   1061.3395   1466.5400     34.9900      0.0000
+   1062.5065   1441.8300      0.0000      4.7300
+   1062.6362   1441.8300      0.0000      4.7200
+   1062.7659   1441.8300      0.0000      4.7200
+   1062.8956   1487.0800     34.9800      4.7200
+   1063.0251   1487.0700     34.9800      4.7200
+   1063.1549   1487.0800     34.9800      4.7200
+   1063.2845   1487.0800     34.9800      4.7200
+   1063.4142   1487.0700     34.9800      4.7200
+   1063.5438   1487.0800     34.9800      4.7200
+   1063.6736   1487.0800     34.9800      4.7200
+   1063.8032   1487.0800     34.9800      4.7200
+   1063.9329   1487.0800     34.9800      4.7200
+   1064.0625   1487.0800     34.9800      4.7200
+   1064.1923   1487.0800     34.9800      4.7200
+   1064.3219   1487.0900     34.9800      4.7200
+   1064.4514   1487.0900     34.9800      4.7200
+   1064.5812   1487.0900     34.9800      4.7200
+   1064.7108   1487.0900     34.9800      4.7200
+   1064.8405   1487.0900     34.9800      4.7200
+   1064.9701   1487.1000     34.9800      4.7200
+   1065.0997   1487.1000     34.9800      4.7200
+   1065.2295   1487.1000     34.9800      4.7200
+   1065.3590   1487.1000     34.9800      4.7200
+   1065.4888   1487.1000     34.9800      4.7200
+   1065.6184   1487.1100     34.9800      4.7200
+   1065.7479   1487.1100     34.9800      4.7200
+   1065.8777   1487.1100     34.9800      4.7200
+   1066.0073   1487.1100     34.9800      4.7200
+   1066.1370   1487.1100     34.9800      4.7200
+   1066.2666   1487.1100     34.9800      4.7200
+   1066.3962   1487.1100     34.9800      4.7200
+   1066.5259   1487.1100     34.9800      4.7100
+   1066.6554   1487.1100     34.9800      4.7100
+   1066.7852   1487.1200     34.9800      4.7100
+   1066.9148   1487.1100     34.9800      4.7100
+   1067.0444   1487.1200     34.9800      4.7100
+   1067.1741   1487.1200     34.9800      4.7100
+   1067.3037   1487.1200     34.9800      4.7100
+   1067.4333   1487.1300     34.9900      4.7100
+   1067.5630   1487.1200     34.9800      4.7100
+   1067.6925   1487.1300     34.9800      4.7100
+   1067.8223   1487.1300     34.9800      4.7100
+   1067.9519   1487.1300     34.9800      4.7100
+   1068.0814   1487.1400     34.9800      4.7100
+   1068.2111   1487.1300     34.9800      4.7100
+   1068.3407   1487.1400     34.9800      4.7100
+   1068.4703   1487.1300     34.9800      4.7100
+   1068.6000   1487.1300     34.9900      4.7100
+   1068.7296   1487.1400     34.9900      4.7100
+   1068.8593   1487.1300     34.9900      4.7100
+   1068.9888   1487.1400     34.9900      4.7100
+   1069.1184   1487.1300     34.9900      4.7100
+   1069.2480   1487.1300     34.9900      4.7100
+   1069.3777   1487.1400     34.9900      4.7100
+   1069.5073   1487.1400     34.9900      4.7100
+   1069.6370   1487.1400     34.9900      4.7100
+   1069.7666   1487.1400     34.9900      4.7100
+   1069.8961   1487.1400     34.9900      4.7100
+   1070.0258   1487.1500     34.9900      4.7100
+   1070.1554   1487.1500     34.9900      4.7100
+   1070.2850   1487.1500     34.9900      4.7100
+   1070.4146   1487.1500     34.9900      4.7100
+   1070.5442   1487.1500     34.9900      4.7100
+   1070.6738   1466.7000     34.9900      0.0000
+   1072.6179   1441.8900      0.0000      4.7000
+   1072.7474   1441.8900      0.0000      4.7000
+   1072.8771   1441.8900      0.0000      4.7000
+   1073.0066   1487.1500     34.9800      4.7000
+   1073.1361   1487.1500     34.9800      4.7000
+   1073.2657   1487.1600     34.9800      4.7000
+   1073.3954   1487.1500     34.9800      4.7000
+   1073.5250   1487.1600     34.9800      4.7000
+   1073.6545   1487.1600     34.9800      4.7000
+   1073.7842   1487.1600     34.9800      4.7000
+   1073.9137   1487.1600     34.9800      4.7000
+   1074.0433   1487.1600     34.9800      4.7000
+   1074.1729   1487.1700     34.9800      4.7000
+   1074.3025   1487.1700     34.9800      4.7000
+   1074.4321   1487.1700     34.9800      4.7000
+   1074.5616   1487.1700     34.9800      4.7000
+   1074.6912   1487.1700     34.9800      4.7000
+   1074.8208   1487.1800     34.9800      4.7000
+   1074.9504   1487.1700     34.9800      4.7000
+   1075.0800   1487.1800     34.9800      4.7000
+   1075.2095   1487.1800     34.9800      4.7000
+   1075.3391   1466.7700     34.9800      0.0000
+   1076.5051   1441.9500      0.0000      4.7000
+   1076.6348   1441.9500      0.0000      4.7000
+   1076.7644   1441.9600      0.0000      4.7000
+   1076.8938   1487.2300     34.9900      4.7000
+   1077.0234   1487.2400     34.9900      4.7000
+   1077.1531   1487.2500     34.9900      4.7000
+   1077.2826   1487.2400     34.9900      4.7000
+   1077.4121   1487.2500     34.9900      4.7000
+   1077.5417   1487.2500     34.9900      4.7000
+   1077.6713   1487.2400     34.9900      4.7000
+   1077.8008   1487.2500     34.9900      4.7000
+   1077.9303   1487.2400     34.9800      4.7000
+   1078.0599   1487.2400     34.9800      4.7000
+   1078.1895   1487.2400     34.9800      4.7000
+   1078.3190   1487.2400     34.9800      4.7000
+   1078.4486   1487.2400     34.9800      4.7000
+   1078.5781   1487.2300     34.9800      4.7000
+   1078.7076   1487.2300     34.9800      4.7000
+   1078.8372   1487.2300     34.9800      4.6900
+   1078.9668   1487.2300     34.9800      4.6900
+   1079.0963   1487.2300     34.9800      4.6900
+   1079.2258   1487.2300     34.9800      4.6900
+   1079.3553   1487.2200     34.9800      4.6900
+   1079.4850   1487.2200     34.9900      4.6900
+   1079.6144   1487.2200     34.9900      4.6900
+   1079.7440   1487.2300     34.9900      4.6900
+   1079.8735   1487.2300     34.9900      4.6900
+   1080.0031   1487.2300     34.9900      4.6900
+   1080.1326   1487.2300     34.9900      4.6900
+   1080.2621   1487.2400     34.9900      4.6900
+   1080.3917   1487.2400     34.9900      4.6900
+   1080.5212   1487.2400     34.9900      4.6900
+   1080.6508   1487.2600     35.0000      4.6900
+   1080.7803   1487.2800     35.0200      4.6900
+   1080.9098   1487.3100     35.0300      4.6900
+   1081.0393   1487.3300     35.0500      4.6900
+   1081.1688   1487.3500     35.0700      4.6900
+   1081.2983   1487.3600     35.0700      4.6900
+   1081.4280   1487.3700     35.0800      4.6900
+   1081.5574   1467.0200     35.0900      0.0000
+   1082.7231   1441.9600      0.0000      4.6800
+   1082.8525   1441.9600      0.0000      4.6800
+   1082.9822   1441.9600      0.0000      4.6800
+   1083.1117   1487.2400     34.9800      4.6800
+   1083.2412   1487.2400     34.9800      4.6800
+   1083.3706   1487.2400     34.9800      4.6800
+   1083.5002   1487.2400     34.9800      4.6800
+   1083.6298   1487.2400     34.9800      4.6800
+   1083.7593   1487.2400     34.9800      4.6800
+   1083.8887   1487.2400     34.9800      4.6800
+   1084.0182   1487.2500     34.9800      4.6800
+   1084.1478   1487.2500     34.9800      4.6800
+   1084.2772   1487.2500     34.9800      4.6800
+   1084.4067   1487.2500     34.9800      4.6800
+   1084.5363   1487.2500     34.9800      4.6800
+   1084.6658   1487.2600     34.9800      4.6800
+   1084.7952   1487.2600     34.9800      4.6800
+   1084.9248   1487.2600     34.9800      4.6800
+   1085.0543   1466.9200     34.9800      0.0000
+   1086.2197   1442.0000      0.0000      4.6800
+   1086.3492   1442.0000      0.0000      4.6800
+   1086.4788   1442.0000      0.0000      4.6800
+   1086.6082   1487.2900     34.9800      4.6800
+   1086.7377   1487.2900     34.9800      4.6800
+   1086.8672   1487.2900     34.9800      4.6800
+   1086.9967   1487.2900     34.9800      4.6800
+   1087.1261   1487.2900     34.9800      4.6800
+   1087.2556   1487.3000     34.9800      4.6800
+   1087.3851   1487.3000     34.9800      4.6800
+   1087.5145   1487.3000     34.9800      4.6800
+   1087.6440   1487.3000     34.9800      4.6800
+   1087.7736   1487.3100     34.9800      4.6800
+   1087.9030   1487.3100     34.9800      4.6800
+   1088.0325   1487.3100     34.9800      4.6800
+   1088.1619   1487.3100     34.9800      4.6800
+   1088.2914   1487.3100     34.9800      4.6800
+   1088.4208   1487.3200     34.9800      4.6800
+   1088.5503   1487.3200     34.9800      4.6800
+   1088.6798   1487.3200     34.9800      4.6800
+   1088.8093   1487.3200     34.9800      4.6800
+   1088.9387   1487.3200     34.9800      4.6800
+   1089.0682   1487.3300     34.9800      4.6800
+   1089.1978   1487.3300     34.9800      4.6800
+   1089.3271   1487.3300     34.9800      4.6800
+   1089.4565   1487.3300     34.9800      4.6800
+   1089.5861   1487.3300     34.9800      4.6800
+   1089.7156   1467.0000     34.9800      0.0000
+   1090.8806   1442.0300      0.0000      4.6700
+   1091.0101   1442.0300      0.0000      4.6700
+   1091.1396   1442.0300      0.0000      4.6700
+   1091.2690   1487.3300     34.9900      4.6700
+   1091.3984   1487.3400     34.9900      4.6700
+   1091.5280   1487.3300     34.9900      4.6700
+   1091.6573   1487.3400     34.9900      4.6700
+   1091.7867   1487.3300     34.9900      4.6700
+   1091.9163   1487.3300     34.9800      4.6600
+   1092.0458   1487.3300     34.9900      4.6600
+   1092.1752   1487.3200     34.9800      4.6600
+   1092.3046   1487.3100     34.9800      4.6600
+   1092.4341   1487.3100     34.9800      4.6600
+   1092.5635   1487.3000     34.9900      4.6500
+   1092.6929   1487.3000     34.9900      4.6500
+   1092.8224   1487.2900     34.9900      4.6500
+   1092.9518   1487.2900     34.9800      4.6500
+   1093.0812   1487.2900     34.9800      4.6500
+   1093.2107   1467.0700     34.9800      0.0000
+   1095.5404   1441.9900      0.0000      4.6400
+   1095.6698   1441.9900      0.0000      4.6400
+   1095.7992   1441.9900      0.0000      4.6400
+   1095.9286   1487.3000     34.9800      4.6400
+   1096.0580   1487.3000     34.9800      4.6400
+   1096.1875   1487.3000     34.9800      4.6400
+   1096.3168   1487.3000     34.9800      4.6400
+   1096.4463   1487.3000     34.9800      4.6400
+   1096.5757   1487.3100     34.9800      4.6400
+   1096.7051   1487.3000     34.9800      4.6400
+   1096.8345   1487.3100     34.9800      4.6400
+   1096.9639   1487.3100     34.9800      4.6400
+   1097.0934   1487.3100     34.9800      4.6400
+   1097.2227   1487.3100     34.9800      4.6400
+   1097.3521   1487.3200     34.9800      4.6400
+   1097.4816   1487.3200     34.9800      4.6400
+   1097.6110   1487.3200     34.9800      4.6400
+   1097.7402   1487.3200     34.9800      4.6400
+   1097.8698   1487.3200     34.9800      4.6400
+   1097.9991   1487.3100     34.9800      4.6400
+   1098.1284   1487.3200     34.9800      4.6400
+   1098.2579   1467.1500     34.9800      0.0000
+   1099.4225   1442.0300      0.0000      4.6400
+   1099.5518   1442.0300      0.0000      4.6400
+   1099.6812   1442.0400      0.0000      4.6400
+   1099.8107   1487.3500     34.9800      4.6400
+   1099.9401   1487.3500     34.9800      4.6400
+   1100.0693   1487.3500     34.9800      4.6400
+   1100.1987   1487.3500     34.9800      4.6400
+   1100.3281   1487.3600     34.9800      4.6400
+   1100.4575   1487.3600     34.9800      4.6400
+   1100.5869   1487.3600     34.9800      4.6400
+   1100.7163   1487.3600     34.9800      4.6400
+   1100.8457   1487.3600     34.9800      4.6400
+   1100.9750   1487.3600     34.9800      4.6400
+   1101.1044   1487.3700     34.9800      4.6400
+   1101.2338   1487.3700     34.9800      4.6400
+   1101.3632   1487.3700     34.9800      4.6400
+   1101.4926   1487.3700     34.9800      4.6400
+   1101.6219   1487.3700     34.9800      4.6400
+   1101.7513   1487.3700     34.9800      4.6400
+   1101.8806   1487.3800     34.9800      4.6400
+   1102.0100   1487.3800     34.9800      4.6400
+   1102.1394   1487.3800     34.9800      4.6400
+   1102.2687   1487.3800     34.9800      4.6400
+   1102.3981   1487.3900     34.9800      4.6400
+   1102.5275   1487.3900     34.9800      4.6400
+   1102.6569   1487.3900     34.9800      4.6400
+   1102.7861   1487.3900     34.9800      4.6400
+   1102.9155   1487.3900     34.9800      4.6400
+   1103.0449   1487.4000     34.9800      4.6400
+   1103.1743   1487.4000     34.9800      4.6400
+   1103.3036   1467.2300     34.9800      0.0000
+   1104.4679   1442.1100      0.0000      4.6400
+   1104.5972   1442.1100      0.0000      4.6400
+   1104.7264   1442.1200      0.0000      4.6400
+   1104.8558   1487.4400     34.9900      4.6400
+   1104.9852   1487.4400     34.9900      4.6400
+   1105.1145   1487.4500     34.9900      4.6400
+   1105.2439   1487.4500     34.9900      4.6400
+   1105.3733   1487.4500     34.9900      4.6400
+   1105.5026   1487.4500     34.9900      4.6400
+   1105.6320   1487.4600     34.9900      4.6400
+   1105.7612   1487.4600     34.9900      4.6400
+   1105.8906   1487.4700     34.9900      4.6400
+   1106.0199   1487.4700     34.9900      4.6400
+   1106.1493   1487.4700     34.9900      4.6400
+   1106.2787   1487.4700     34.9900      4.6400
+   1106.4080   1487.4700     34.9900      4.6400
+   1106.5372   1487.4800     34.9900      4.6400
+   1106.6666   1487.4700     34.9900      4.6400
+   1106.7960   1487.4700     34.9900      4.6400
+   1106.9253   1487.4700     34.9800      4.6400
+   1107.0546   1487.4700     34.9800      4.6400
+   1107.1840   1467.3000     34.9800      0.0000
+   1113.3905   1442.1700      0.0000      4.6200
+   1113.5198   1442.1700      0.0000      4.6200
+   1113.6492   1442.1700      0.0000      4.6200
+   1113.7784   1487.5000     34.9800      4.6200
+   1113.9077   1487.5000     34.9800      4.6200
+   1114.0370   1487.5000     34.9800      4.6200
+   1114.1663   1487.5000     34.9800      4.6200
+   1114.2954   1487.5000     34.9800      4.6200
+   1114.4248   1487.5000     34.9800      4.6200
+   1114.5541   1487.5100     34.9800      4.6200
+   1114.6833   1487.5100     34.9800      4.6200
+   1114.8126   1487.5000     34.9700      4.6200
+   1114.9419   1487.5000     34.9800      4.6200
+   1115.0712   1487.5000     34.9800      4.6200
+   1115.2003   1487.5000     34.9800      4.6100
+   1115.3296   1487.5000     34.9800      4.6100
+   1115.4590   1487.5000     34.9800      4.6100
+   1115.5883   1487.5000     34.9800      4.6100
+   1115.7174   1487.5000     34.9800      4.6100
+   1115.8467   1487.4900     34.9800      4.6100
+   1115.9760   1487.5000     34.9800      4.6100
+   1116.1053   1487.5000     34.9800      4.6100
+   1116.2345   1487.5000     34.9800      4.6100
+   1116.3638   1487.5000     34.9800      4.6100
+   1116.4930   1487.5000     34.9800      4.6100
+   1116.6222   1487.5000     34.9800      4.6100
+   1116.7515   1487.5000     34.9800      4.6100
+   1116.8809   1467.4600     34.9800      0.0000
+   1118.0441   1442.1500      0.0000      4.6000
+   1118.1733   1442.1500      0.0000      4.6000
+   1118.3026   1442.1600      0.0000      4.6000
+   1118.4318   1487.4900     34.9800      4.6000
+   1118.5610   1487.4900     34.9800      4.6000
+   1118.6903   1487.4900     34.9800      4.6000
+   1118.8196   1487.4900     34.9800      4.6000
+   1118.9487   1487.5000     34.9800      4.6000
+   1119.0780   1487.5000     34.9700      4.6000
+   1119.2073   1487.5000     34.9700      4.6000
+   1119.3365   1487.5000     34.9700      4.6000
+   1119.4657   1487.5000     34.9700      4.6000
+   1119.5950   1487.5000     34.9700      4.6000
+   1119.7241   1487.4900     34.9800      4.6000
+   1119.8534   1487.4900     34.9800      4.5900
+   1119.9825   1487.4900     34.9800      4.5900
+   1120.1118   1487.4900     34.9800      4.5900
+   1120.2411   1487.4900     34.9800      4.5900
+   1120.3702   1487.4900     34.9800      4.5900
+   1120.4995   1487.4900     34.9800      4.5900
+   1120.6288   1487.4900     34.9800      4.5900
+   1120.7579   1487.4900     34.9800      4.5900
+   1120.8872   1487.5000     34.9800      4.5900
+   1121.0165   1487.5000     34.9800      4.5900
+   1121.1456   1487.5000     34.9800      4.5900
+   1121.2748   1487.5000     34.9800      4.5900
+   1121.4041   1487.5100     34.9800      4.5900
+   1121.5333   1487.5100     34.9800      4.5900
+   1121.6625   1487.5100     34.9800      4.5900
+   1121.7917   1487.5100     34.9800      4.5900
+   1121.9209   1467.5400     34.9800      0.0000
+   1123.0839   1442.1600      0.0000      4.5800
+   1123.2130   1442.1500      0.0000      4.5800
+   1123.3423   1442.1600      0.0000      4.5800
+   1123.4716   1487.5000     34.9800      4.5800
+   1123.6006   1487.5000     34.9800      4.5800
+   1123.7299   1487.5000     34.9800      4.5800
+   1123.8591   1487.5000     34.9800      4.5800
+   1123.9883   1487.5000     34.9800      4.5800
+   1124.1174   1487.5000     34.9800      4.5800
+   1124.2467   1487.5100     34.9800      4.5800
+   1124.3759   1487.5100     34.9800      4.5800
+   1124.5050   1487.5200     34.9800      4.5800
+   1124.6343   1487.5200     34.9800      4.5800
+   1124.7634   1487.5200     34.9800      4.5800
+   1124.8926   1487.5200     34.9800      4.5800
+   1125.0219   1487.5300     34.9800      4.5800
+   1125.1510   1487.5300     34.9800      4.5800
+   1125.2803   1487.5300     34.9800      4.5800
+   1125.4094   1487.5300     34.9800      4.5800
+   1125.5386   1487.5300     34.9800      4.5800
+   1125.6678   1487.5400     34.9900      4.5800
+   1125.7970   1467.6100     34.9900      0.0000
+   1126.9596   1442.2000      0.0000      4.5800
+   1127.0887   1442.2100      0.0000      4.5800
+   1127.2179   1442.2100      0.0000      4.5800
+   1127.3472   1487.5700     34.9800      4.5800
+   1127.4763   1487.5700     34.9800      4.5800
+   1127.6055   1487.5700     34.9800      4.5800
+   1127.7346   1487.5700     34.9800      4.5800
+   1127.8638   1487.5700     34.9800      4.5800
+   1127.9930   1487.5700     34.9800      4.5800
+   1128.1221   1487.5700     34.9800      4.5800
+   1128.2513   1487.5700     34.9800      4.5800
+   1128.3805   1487.5700     34.9800      4.5800
+   1128.5096   1487.5800     34.9800      4.5800
+   1128.6388   1487.5800     34.9800      4.5800
+   1128.7679   1487.5800     34.9800      4.5800
+   1128.8972   1487.5800     34.9800      4.5800
+   1129.0264   1487.5800     34.9800      4.5800
+   1129.1554   1487.5900     34.9800      4.5800
+   1129.2847   1487.5900     34.9800      4.5800
+   1129.4138   1487.5900     34.9800      4.5800
+   1129.5428   1487.5900     34.9800      4.5800
+   1129.6721   1487.6000     34.9800      4.5800
+   1129.8013   1487.6000     34.9800      4.5800
+   1129.9304   1487.6000     34.9800      4.5800
+   1130.0596   1487.6000     34.9800      4.5800
+   1130.1887   1487.6000     34.9800      4.5800
+   1130.3179   1487.6000     34.9700      4.5800
+   1130.4470   1487.6000     34.9700      4.5800
+   1130.5762   1487.6000     34.9700      4.5800
+   1130.7053   1487.6000     34.9700      4.5800
+   1130.8345   1487.6100     34.9700      4.5800
+   1130.9636   1487.6100     34.9700      4.5800
+   1131.0928   1487.6100     34.9700      4.5800
+   1131.2219   1487.6100     34.9700      4.5800
+   1131.3510   1487.6200     34.9700      4.5800
+   1131.4801   1487.6200     34.9700      4.5800
+   1131.6094   1487.6200     34.9700      4.5800
+   1131.7385   1487.6200     34.9800      4.5800
+   1131.8676   1487.6200     34.9800      4.5800
+   1131.9967   1487.6300     34.9800      4.5800
+   1132.1259   1487.6300     34.9800      4.5800
+   1132.2550   1487.6300     34.9800      4.5800
+   1132.3842   1487.6200     34.9800      4.5700
+   1132.5133   1487.6200     34.9800      4.5700
+   1132.6425   1487.6200     34.9800      4.5700
+   1132.7715   1487.6300     34.9800      4.5700
+   1132.9006   1487.6200     34.9800      4.5700
+   1133.0298   1487.6200     34.9800      4.5700
+   1133.1589   1487.6200     34.9800      4.5700
+   1133.2881   1487.6200     34.9800      4.5700
+   1133.4172   1487.6200     34.9800      4.5700
+   1133.5464   1487.6200     34.9800      4.5700
+   1133.6754   1487.6300     34.9800      4.5700
+   1133.8046   1487.6200     34.9800      4.5700
+   1133.9337   1487.6300     34.9800      4.5700
+   1134.0629   1487.6300     34.9800      4.5700
+   1134.1919   1487.6300     34.9800      4.5700
+   1134.3210   1487.6300     34.9800      4.5700
+   1134.4502   1487.6400     34.9800      4.5700
+   1134.5792   1487.6400     34.9800      4.5700
+   1134.7084   1487.6400     34.9800      4.5700
+   1134.8375   1487.6400     34.9800      4.5700
+   1134.9667   1487.6400     34.9800      4.5700
+   1135.0957   1487.6500     34.9800      4.5700
+   1135.2249   1487.6500     34.9800      4.5700
+   1135.3540   1487.6500     34.9800      4.5700
+   1135.4832   1487.6500     34.9800      4.5700
+   1135.6122   1487.6500     34.9800      4.5700
+   1135.7413   1487.6600     34.9800      4.5700
+   1135.8705   1487.6600     34.9800      4.5700
+   1135.9995   1487.6600     34.9800      4.5700
+   1136.1287   1487.6600     34.9800      4.5700
+   1136.2578   1467.7700     34.9800      0.0000
+   1137.4197   1442.3300      0.0000      4.5700
+   1137.5487   1442.3300      0.0000      4.5700
+   1137.6779   1442.3300      0.0000      4.5700
+   1137.8069   1487.6900     34.9800      4.5700
+   1137.9360   1487.6900     34.9800      4.5700
+   1138.0652   1487.6900     34.9800      4.5700
+   1138.1942   1487.6900     34.9800      4.5700
+   1138.3232   1487.6900     34.9800      4.5700
+   1138.4524   1487.6900     34.9800      4.5700
+   1138.5815   1487.6900     34.9800      4.5600
+   1138.7106   1487.6900     34.9800      4.5600
+   1138.8396   1487.6900     34.9800      4.5600
+   1138.9688   1487.6900     34.9800      4.5600
+   1139.0979   1487.6900     34.9800      4.5600
+   1139.2269   1487.6900     34.9800      4.5600
+   1139.3560   1487.6900     34.9900      4.5600
+   1139.4851   1487.6900     34.9900      4.5600
+   1139.6143   1487.6900     34.9800      4.5600
+   1139.7432   1487.6900     34.9800      4.5600
+   1139.8723   1487.6900     34.9900      4.5600
+   1140.0015   1487.7000     34.9900      4.5600
+   1140.1304   1487.7000     34.9900      4.5600
+   1140.2595   1487.7000     34.9800      4.5600
+   1140.3887   1487.7000     34.9800      4.5600
+   1140.5177   1467.8500     34.9800      0.0000
+   1141.6793   1442.3500      0.0000      4.5600
+   1141.8083   1442.3500      0.0000      4.5600
+   1141.9375   1442.3600      0.0000      4.5600
+   1142.0665   1487.7300     34.9900      4.5600
+   1142.1956   1487.7300     34.9900      4.5600
+   1142.3247   1487.7300     34.9800      4.5600
+   1142.4536   1487.7300     34.9800      4.5600
+   1142.5828   1487.7300     34.9800      4.5600
+   1142.7118   1487.7300     34.9800      4.5600
+   1142.8409   1487.7200     34.9800      4.5600
+   1142.9698   1487.7200     34.9800      4.5600
+   1143.0990   1487.7200     34.9700      4.5600
+   1143.2280   1487.7200     34.9700      4.5600
+   1143.3571   1487.7100     34.9700      4.5500
+   1143.4861   1487.7100     34.9700      4.5500
+   1143.6151   1487.7100     34.9700      4.5500
+   1143.7443   1487.7200     34.9700      4.5500
+   1143.8732   1487.7100     34.9700      4.5500
+   1144.0023   1487.7200     34.9700      4.5500
+   1144.1313   1487.7200     34.9800      4.5500
+   1144.2604   1487.7100     34.9800      4.5500
+   1144.3894   1487.7200     34.9800      4.5500
+   1144.5184   1487.7200     34.9800      4.5500
+   1144.6476   1467.9100     34.9800      0.0000
+   1148.2603   1442.3200      0.0000      4.5300
+   1148.3893   1442.3200      0.0000      4.5300
+   1148.5183   1442.3300      0.0000      4.5300
+   1148.6473   1487.7200     34.9800      4.5300
+   1148.7764   1487.7100     34.9800      4.5300
+   1148.9053   1487.7100     34.9800      4.5300
+   1149.0343   1487.7100     34.9800      4.5300
+   1149.1633   1487.7200     34.9800      4.5300
+   1149.2924   1487.7200     34.9800      4.5300
+   1149.4213   1487.7200     34.9800      4.5300
+   1149.5503   1487.7200     34.9800      4.5300
+   1149.6793   1487.7200     34.9800      4.5300
+   1149.8083   1487.7200     34.9800      4.5300
+   1149.9374   1487.7300     34.9800      4.5300
+   1150.0664   1487.7300     34.9800      4.5300
+   1150.1954   1487.7300     34.9800      4.5300
+   1150.3243   1487.7400     34.9800      4.5300
+   1150.4534   1487.7400     34.9800      4.5300
+   1150.5824   1487.7500     34.9800      4.5300
+   1150.7113   1487.7500     34.9900      4.5300
+   1150.8403   1487.7600     34.9900      4.5300
+   1150.9694   1487.7600     34.9900      4.5300
+   1151.0984   1487.7600     34.9900      4.5300
+   1151.2273   1487.7600     34.9900      4.5300
+   1151.3563   1487.7600     34.9900      4.5300
+   1151.4854   1487.7600     34.9900      4.5300
+   1151.6144   1487.7600     34.9800      4.5300
+   1151.7433   1487.7600     34.9800      4.5300
+   1151.8722   1487.7600     34.9800      4.5300
+   1152.0012   1487.7600     34.9800      4.5300
+   1152.1301   1487.7600     34.9800      4.5300
+   1152.2592   1487.7600     34.9800      4.5300
+   1152.3882   1487.7600     34.9800      4.5300
+   1152.5172   1487.7600     34.9800      4.5300
+   1152.6461   1487.7700     34.9800      4.5300
+   1152.7751   1487.7700     34.9800      4.5300
+   1152.9042   1487.7700     34.9800      4.5300
+   1153.0331   1487.7700     34.9800      4.5300
+   1153.1620   1487.7700     34.9800      4.5300
+   1153.2910   1487.7700     34.9800      4.5300
+   1153.4200   1487.7800     34.9800      4.5300
+   1153.5490   1487.7800     34.9800      4.5300
+   1153.6780   1487.7800     34.9800      4.5300
+   1153.8069   1487.7800     34.9800      4.5200
+   1153.9358   1487.7800     34.9800      4.5200
+   1154.0648   1487.7800     34.9800      4.5300
+   1154.1938   1487.7800     34.9800      4.5200
+   1154.3229   1487.7900     34.9800      4.5200
+   1154.4517   1487.7800     34.9800      4.5200
+   1154.5807   1487.7900     34.9900      4.5200
+   1154.7097   1487.8000     34.9900      4.5200
+   1154.8387   1487.8000     34.9900      4.5200
+   1154.9675   1487.8100     34.9900      4.5300
+   1155.0966   1487.8100     34.9900      4.5200
+   1155.2256   1468.1100     35.0000      0.0000
+   1156.3861   1442.4100      0.0000      4.5200
+   1156.5151   1442.4100      0.0000      4.5200
+   1156.6440   1442.4100      0.0000      4.5200
+   1156.7729   1468.1300     34.9900      0.0000
+   1159.0939   1442.4500      0.0000      4.5200
+   1159.2228   1442.4500      0.0000      4.5200
+   1159.3518   1442.4600      0.0000      4.5200
+   1159.4806   1487.8600     34.9800      4.5200
+   1159.6096   1487.8600     34.9900      4.5200
+   1159.7385   1487.8600     34.9900      4.5200
+   1159.8674   1468.1800     34.9900      0.0000
+   1162.1880   1442.4900      0.0000      4.5200
+   1168.5032   1442.5100      0.0000      4.5000
+   1168.6320   1442.5100      0.0000      4.5000
+   1168.7607   1442.5200      0.0000      4.5000
+   1168.8896   1468.3200     34.9800      0.0000
+   1171.8531   1442.5200      0.0000      4.4900
+   1171.9818   1442.5200      0.0000      4.4900
+   1172.1107   1442.5300      0.0000      4.4900
+   1172.2396   1487.9300     34.9700      4.4900
+   1172.3683   1487.9300     34.9700      4.4900
+   1172.4972   1487.9300     34.9700      4.4900
+   1172.6261   1487.9400     34.9700      4.4900
+   1172.7549   1487.9400     34.9700      4.4900
+   1172.8837   1487.9400     34.9700      4.4900
+   1173.0125   1487.9400     34.9700      4.4900
+   1173.1414   1487.9400     34.9700      4.4900
+   1173.2701   1487.9400     34.9700      4.4900
+   1173.3989   1487.9500     34.9700      4.4900
+   1173.5278   1487.9400     34.9700      4.4900
+   1173.6566   1487.9500     34.9700      4.4900
+   1173.7854   1487.9500     34.9700      4.4900
+   1173.9142   1487.9500     34.9700      4.4900
+   1174.0431   1487.9500     34.9700      4.4900
+   1174.1719   1487.9500     34.9700      4.4900
+   1174.3007   1487.9600     34.9800      4.4900
+   1174.4294   1487.9600     34.9800      4.4900
+   1174.5583   1487.9600     34.9700      4.4900
+   1174.6871   1487.9700     34.9700      4.4900
+   1174.8159   1487.9600     34.9700      4.4900
+   1174.9447   1487.9700     34.9700      4.4900
+   1175.0736   1487.9600     34.9700      4.4900
+   1175.2023   1487.9700     34.9700      4.4900
+   1175.3312   1487.9700     34.9800      4.4900
+   1175.4600   1487.9700     34.9700      4.4900
+   1175.5887   1487.9700     34.9700      4.4900
+   1175.7175   1487.9700     34.9700      4.4900
+   1175.8463   1487.9700     34.9800      4.4900
+   1175.9752   1487.9800     34.9800      4.4900
+   1176.1039   1468.4300     34.9800      0.0000
+   1177.2632   1442.5900      0.0000      4.4900
+   1177.3920   1442.5900      0.0000      4.4900
+   1177.5206   1442.6000      0.0000      4.4900
+   1177.6495   1488.0000     34.9800      4.4900
+   1177.7783   1488.0100     34.9700      4.4900
+   1177.9070   1488.0100     34.9800      4.4900
+   1178.0358   1488.0100     34.9700      4.4900
+   1178.1647   1488.0200     34.9700      4.4900
+   1178.2935   1488.0100     34.9700      4.4900
+   1178.4221   1488.0200     34.9700      4.4900
+   1178.5509   1488.0200     34.9700      4.4900
+   1178.6798   1488.0200     34.9700      4.4900
+   1178.8085   1488.0200     34.9700      4.4900
+   1178.9373   1488.0200     34.9700      4.4800
+   1179.0660   1488.0200     34.9800      4.4800
+   1179.1949   1488.0300     34.9800      4.4800
+   1179.3236   1488.0200     34.9800      4.4800
+   1179.4524   1488.0300     34.9800      4.4800
+   1179.5812   1488.0200     34.9800      4.4800
+   1179.7098   1488.0200     34.9800      4.4800
+   1179.8387   1488.0300     34.9800      4.4800
+   1179.9675   1488.0300     34.9800      4.4800
+   1180.0963   1488.0300     34.9800      4.4800
+   1180.2250   1488.0300     34.9800      4.4800
+   1180.3538   1488.0400     34.9800      4.4800
+   1180.4825   1488.0400     34.9800      4.4800
+   1180.6113   1488.0400     34.9800      4.4800
+   1180.7401   1488.0400     34.9800      4.4800
+   1180.8689   1488.0400     34.9800      4.4800
+   1180.9977   1488.0500     34.9800      4.4800
+   1181.1263   1488.0500     34.9800      4.4800
+   1181.2551   1488.0500     34.9800      4.4800
+   1181.3839   1488.0500     34.9800      4.4800
+   1181.5127   1488.0500     34.9800      4.4800
+   1181.6414   1488.0500     34.9800      4.4800
+   1181.7701   1468.5300     34.9800      0.0000
+   1182.9288   1442.6600      0.0000      4.4800
+   1183.0576   1442.6600      0.0000      4.4800
+   1183.1864   1442.6600      0.0000      4.4800
+   1183.3152   1488.0800     34.9800      4.4800
+   1183.4438   1488.0800     34.9800      4.4800
+   1183.5726   1488.0800     34.9800      4.4800
+   1183.7014   1488.0900     34.9800      4.4800
+   1183.8302   1488.0900     34.9800      4.4800
+   1183.9589   1488.0900     34.9800      4.4800
+   1184.0876   1488.0900     34.9800      4.4800
+   1184.2163   1488.0900     34.9800      4.4800
+   1184.3450   1488.1000     34.9800      4.4800
+   1184.4738   1488.1000     34.9800      4.4800
+   1184.6025   1488.1000     34.9800      4.4800
+   1184.7313   1488.1000     34.9800      4.4800
+   1184.8600   1488.1000     34.9800      4.4800
+   1184.9888   1488.1100     34.9800      4.4800
+   1185.1174   1488.1100     34.9800      4.4800
+   1185.2461   1488.1100     34.9800      4.4800
+   1185.3749   1488.1100     34.9800      4.4800
+   1185.5037   1488.1100     34.9800      4.4800
+   1185.6324   1488.1100     34.9700      4.4800
+   1185.7611   1488.1200     34.9700      4.4800
+   1185.8898   1488.1200     34.9700      4.4800
+   1186.0186   1488.1200     34.9700      4.4800
+   1186.1472   1488.1200     34.9700      4.4800
+   1186.2760   1488.4200     34.9800      4.5500
+   1186.4047   1488.3700     34.9400      4.5500
+   1186.5334   1468.5100     34.9000      0.0000
+   1187.6918   1442.7300      0.0000      4.4800
+   1187.8206   1442.7300      0.0000      4.4800
+   1187.9493   1442.7400      0.0000      4.4800
+   1188.0779   1488.1600     34.9800      4.4800
+   1188.2067   1488.1600     34.9800      4.4800
+   1188.3354   1488.1600     34.9800      4.4800
+   1188.4640   1488.1600     34.9800      4.4800
+   1188.5928   1488.1600     34.9800      4.4800
+   1188.7214   1488.1700     34.9800      4.4800
+   1188.8502   1488.1700     34.9800      4.4800
+   1188.9789   1488.1700     34.9800      4.4800
+   1189.1075   1488.1700     34.9800      4.4800
+   1189.2363   1488.1700     34.9800      4.4800
+   1189.3650   1488.1800     34.9800      4.4800
+   1189.4937   1488.1800     34.9800      4.4800
+   1189.6224   1488.1800     34.9700      4.4800
+   1189.7511   1488.1800     34.9700      4.4800
+   1189.8798   1488.1800     34.9700      4.4800
+   1190.0084   1488.1900     34.9700      4.4800
+   1190.1372   1488.1900     34.9700      4.4800
+   1190.2659   1488.1900     34.9700      4.4800
+   1190.3945   1488.1900     34.9700      4.4800
+   1190.5232   1488.1900     34.9700      4.4800
+   1190.6520   1488.2000     34.9700      4.4800
+   1190.7805   1488.2000     34.9700      4.4800
+   1190.9093   1488.2000     34.9700      4.4800
+   1191.0380   1468.6800     34.9700      0.0000
+   1192.7107   1442.8100      0.0000      4.4800
+   1192.8395   1442.8100      0.0000      4.4800
+   1192.9681   1442.8100      0.0000      4.4800
+   1193.0967   1488.2300     34.9800      4.4800
+   1193.2255   1488.2300     34.9700      4.4800
+   1193.3541   1488.2300     34.9800      4.4800
+   1193.4828   1488.2200     34.9800      4.4700
+   1193.6115   1488.2200     34.9800      4.4700
+   1193.7401   1488.2200     34.9800      4.4700
+   1193.8688   1488.2200     34.9800      4.4700
+   1193.9974   1488.2200     34.9800      4.4700
+   1194.1261   1488.2200     34.9800      4.4700
+   1194.2548   1488.2200     34.9800      4.4700
+   1194.3834   1488.2200     34.9800      4.4700
+   1194.5121   1488.2300     34.9800      4.4700
+   1194.6407   1488.2300     34.9800      4.4700
+   1194.7694   1488.2200     34.9700      4.4700
+   1194.8979   1488.2300     34.9800      4.4700
+   1195.0266   1488.2300     34.9700      4.4700
+   1195.1554   1488.2300     34.9700      4.4700
+   1195.2841   1488.5200     34.9700      4.5400
+   1195.4126   1468.7000     34.9400      0.0000
+   1196.5704   1442.8300      0.0000      4.4700
+   1196.6991   1442.8300      0.0000      4.4700
+   1196.8276   1442.8400      0.0000      4.4700
+   1196.9564   1468.7900     34.9800      0.0000
+   1198.1140   1442.8600      0.0000      4.4700
+   1198.2427   1442.8600      0.0000      4.4700
+   1198.3713   1442.8700      0.0000      4.4700
+   1198.5000   1488.3000     34.9800      4.4700
+   1198.6285   1488.3000     34.9800      4.4700
+   1198.7572   1488.3000     34.9800      4.4700
+   1198.8859   1488.3000     34.9800      4.4700
+   1199.0144   1488.3000     34.9800      4.4700
+   1199.1431   1488.3000     34.9800      4.4700
+   1199.2717   1488.3100     34.9800      4.4700
+   1199.4004   1488.3100     34.9800      4.4700
+   1199.5289   1488.3100     34.9800      4.4700
+   1199.6575   1468.8300     34.9800      0.0000
+   1200.8151   1442.8500      0.0000      4.4600
+   1200.9436   1442.8500      0.0000      4.4600
+   1201.0723   1442.8500      0.0000      4.4600
+   1201.2009   1488.2700     34.9700      4.4600
+   1201.3295   1488.2700     34.9700      4.4500
+   1201.4581   1488.2600     34.9700      4.4500
+   1201.5867   1488.2600     34.9700      4.4500
+   1201.7153   1488.2600     34.9700      4.4500
+   1201.8439   1488.2500     34.9700      4.4500
+   1201.9725   1488.2600     34.9700      4.4500
+   1202.1011   1488.2600     34.9700      4.4500
+   1202.2296   1488.2600     34.9700      4.4500
+   1202.3583   1488.2700     34.9700      4.4500
+   1202.4869   1488.2700     34.9700      4.4500
+   1202.6155   1488.2800     34.9800      4.4500
+   1202.7440   1488.2800     34.9800      4.4500
+   1202.8727   1488.2800     34.9800      4.4500
+   1203.0012   1488.2900     34.9800      4.4500
+   1203.1299   1488.2900     34.9800      4.4500
+   1203.2584   1488.2900     34.9800      4.4500
+   1203.3871   1488.3000     34.9800      4.4500
+   1203.5156   1488.2900     34.9800      4.4500
+   1203.6442   1488.2900     34.9800      4.4500
+   1203.7728   1488.3000     34.9800      4.4500
+   1203.9014   1488.3000     34.9800      4.4500
+   1204.0300   1488.3000     34.9800      4.4500
+   1204.1586   1488.3000     34.9800      4.4500
+   1204.2871   1488.3100     34.9800      4.4500
+   1204.4158   1488.3100     34.9800      4.4500
+   1204.5442   1488.3100     34.9800      4.4500
+   1204.6729   1468.9200     34.9800      0.0000
+   1205.8301   1442.8900      0.0000      4.4500
+   1205.9586   1442.8900      0.0000      4.4500
+   1206.0872   1442.9000      0.0000      4.4500
+   1206.2157   1488.3400     34.9800      4.4500
+   1206.3444   1488.3300     34.9700      4.4500
+   1206.4729   1488.3300     34.9700      4.4500
+   1206.6014   1488.3300     34.9800      4.4500
+   1206.7300   1488.3300     34.9700      4.4500
+   1206.8585   1488.3300     34.9700      4.4500
+   1206.9871   1488.3300     34.9700      4.4500
+   1207.1157   1488.3300     34.9700      4.4500
+   1207.2443   1488.3200     34.9700      4.4500
+   1207.3728   1488.3300     34.9700      4.4500
+   1207.5013   1488.3400     34.9700      4.4500
+   1207.6299   1488.3300     34.9700      4.4500
+   1207.7584   1488.3400     34.9700      4.4500
+   1207.8870   1488.3300     34.9700      4.4500
+   1208.0156   1488.3400     34.9700      4.4500
+   1208.1442   1488.3400     34.9700      4.4500
+   1208.2726   1488.3400     34.9700      4.4500
+   1208.4012   1488.3500     34.9700      4.4500
+   1208.5298   1488.3400     34.9700      4.4500
+   1208.6583   1488.6400     34.9700      4.5200
+   1208.7869   1488.8900     34.9300      4.5900
+   1208.9154   1489.0800     34.8600      4.6600
+   1209.0439   1489.2800     34.7900      4.7300
+   1209.1725   1489.4700     34.7100      4.8000
+   1209.3010   1489.6600     34.6400      4.8700
+   1209.4296   1489.5800     34.5700      4.8700
+   1209.5582   1489.8200     34.5300      4.9400
+   1209.6866   1468.3400     34.5000      0.0000
+   1212.0002   1442.9400      0.0000      4.4400
+   1212.1288   1442.9500      0.0000      4.4400
+   1212.2573   1442.9500      0.0000      4.4400
+   1212.3857   1488.3900     34.9700      4.4400
+   1212.5143   1488.3900     34.9700      4.4400
+   1212.6428   1488.3900     34.9700      4.4400
+   1212.7714   1488.3900     34.9700      4.4400
+   1212.8998   1488.4000     34.9700      4.4400
+   1213.0283   1488.4000     34.9700      4.4400
+   1213.1569   1488.4000     34.9700      4.4400
+   1213.2854   1488.4000     34.9700      4.4400
+   1213.4139   1488.6900     34.9700      4.5100
+   1213.5425   1488.9400     34.9300      4.5800
+   1213.6710   1489.1300     34.8600      4.6500
+   1213.7994   1489.0400     34.7900      4.6500
+   1213.9280   1468.7600     34.7500      0.0000
+   1216.2410   1443.0100      0.0000      4.4400
+   1216.3694   1443.0100      0.0000      4.4400
+   1216.4978   1443.0200      0.0000      4.4400
+   1216.6263   1488.4600     34.9700      4.4400
+   1216.7549   1488.4600     34.9700      4.4400
+   1216.8834   1488.4600     34.9700      4.4400
+   1217.0118   1488.4600     34.9700      4.4400
+   1217.1404   1488.4600     34.9700      4.4400
+   1217.2688   1488.4700     34.9700      4.4400
+   1217.3972   1488.4700     34.9700      4.4400
+   1217.5258   1488.4700     34.9700      4.4400
+   1217.6543   1488.4700     34.9700      4.4400
+   1217.7827   1488.4700     34.9700      4.4400
+   1217.9111   1488.4800     34.9700      4.4400
+   1218.0397   1488.7700     34.9700      4.5100
+   1218.1682   1489.0100     34.9300      4.5800
+   1218.2966   1489.2000     34.8600      4.6500
+   1218.4250   1489.4000     34.7900      4.7200
+   1218.5536   1489.5900     34.7100      4.7900
+   1218.6821   1489.7800     34.6400      4.8600
+   1218.8104   1489.9700     34.5700      4.9300
+   1218.9390   1468.5000     34.5000      0.0000
+   1220.0952   1443.0000      0.0000      4.4200
+   1220.2236   1443.0000      0.0000      4.4200
+   1220.3521   1443.0000      0.0000      4.4200
+   1220.4806   1488.4500     34.9700      4.4200
+   1220.6089   1488.4500     34.9700      4.4200
+   1220.7374   1488.4400     34.9700      4.4200
+   1220.8658   1488.4500     34.9700      4.4200
+   1220.9944   1488.4500     34.9700      4.4200
+   1221.1228   1488.4500     34.9700      4.4200
+   1221.2512   1488.4500     34.9700      4.4200
+   1221.3798   1469.1800     34.9700      0.0000
+   1225.1044   1443.0200      0.0000      4.4100
+   1225.2327   1443.0200      0.0000      4.4100
+   1225.3612   1443.0300      0.0000      4.4100
+   1225.4896   1488.4900     34.9800      4.4100
+   1225.6180   1488.4900     34.9700      4.4100
+   1225.7463   1488.4900     34.9700      4.4100
+   1225.8749   1488.5000     34.9700      4.4100
+   1226.0033   1488.5000     34.9700      4.4100
+   1226.1316   1488.5000     34.9700      4.4100
+   1226.2600   1488.5000     34.9700      4.4100
+   1226.3885   1488.5000     34.9700      4.4100
+   1226.5170   1488.5000     34.9700      4.4100
+   1226.6453   1488.5000     34.9700      4.4100
+   1226.7737   1488.5100     34.9700      4.4100
+   1226.9021   1488.5100     34.9700      4.4100
+   1227.0305   1488.5100     34.9700      4.4100
+   1227.1589   1488.5100     34.9700      4.4100
+   1227.2874   1488.5100     34.9700      4.4100
+   1227.4158   1488.5200     34.9700      4.4100
+   1227.5441   1488.5100     34.9700      4.4100
+   1227.6725   1488.5100     34.9700      4.4100
+   1227.8010   1488.5100     34.9700      4.4100
+   1227.9293   1488.5100     34.9700      4.4100
+   1228.0577   1488.5100     34.9700      4.4100
+   1228.1862   1488.5100     34.9700      4.4100
+   1228.3146   1488.5100     34.9700      4.4100
+   1228.4429   1488.5000     34.9700      4.4000
+   1228.5713   1488.5000     34.9700      4.4000
+   1228.6997   1488.5000     34.9700      4.4000
+   1228.8281   1488.5000     34.9700      4.4000
+   1228.9564   1488.5100     34.9700      4.4000
+   1229.0848   1488.5000     34.9700      4.4000
+   1229.2133   1488.5000     34.9700      4.4000
+   1229.3417   1488.5000     34.9700      4.4000
+   1229.4701   1488.5100     34.9700      4.4000
+   1229.5985   1488.5100     34.9700      4.4000
+   1229.7269   1488.5100     34.9700      4.4000
+   1229.8552   1488.5100     34.9700      4.4000
+   1229.9836   1488.5100     34.9700      4.4000
+   1230.1121   1488.5200     34.9700      4.4000
+   1230.2404   1488.5200     34.9700      4.4000
+   1230.3688   1488.5300     34.9700      4.4000
+   1230.4972   1488.5300     34.9700      4.4000
+   1230.6255   1488.5400     34.9600      4.4100
+   1230.7539   1488.5300     34.9600      4.4000
+   1230.8822   1469.3300     34.9600      0.0000
+   1232.0376   1443.0400      0.0000      4.3900
+   1232.1659   1443.0400      0.0000      4.3900
+   1232.2943   1443.0500      0.0000      4.3900
+   1232.4227   1488.5200     34.9700      4.3900
+   1232.5510   1488.5200     34.9700      4.3900
+   1232.6794   1488.5200     34.9700      4.3900
+   1232.8079   1488.5300     34.9700      4.3900
+   1232.9362   1488.8200     34.9700      4.4600
+   1233.0645   1488.7800     34.9400      4.4600
+   1233.1929   1489.0200     34.9000      4.5300
+   1233.3213   1489.2600     34.8600      4.6000
+   1233.4496   1489.4600     34.7900      4.6700
+   1233.5779   1489.6500     34.7100      4.7400
+   1233.7063   1489.5600     34.6400      4.7400
+   1233.8347   1489.8000     34.6000      4.8100
+   1233.9630   1468.8400     34.5700      0.0000
+   1235.1182   1443.0900      0.0000      4.3900
+   1235.2466   1443.0900      0.0000      4.3900
+   1235.3748   1443.0900      0.0000      4.3900
+   1235.5032   1488.5600     34.9700      4.3900
+   1235.6316   1488.5600     34.9700      4.3900
+   1235.7598   1488.5600     34.9700      4.3900
+   1235.8882   1488.5500     34.9700      4.3900
+   1236.0165   1488.5600     34.9600      4.3900
+   1236.1449   1488.5500     34.9600      4.3900
+   1236.2732   1469.4200     34.9600      0.0000
+   1237.4282   1443.1100      0.0000      4.3900
+   1237.5564   1443.1000      0.0000      4.3900
+   1237.6848   1443.1100      0.0000      4.3900
+   1237.8131   1488.8600     34.9600      4.4500
+   1237.9415   1488.8200     34.9300      4.4500
+   1238.0697   1489.0600     34.8900      4.5200
+   1238.1981   1469.3000     34.8600      0.0000
+   1240.1228   1443.1300      0.0000      4.3800
+   1240.2511   1443.1300      0.0000      4.3800
+   1240.3794   1443.1300      0.0000      4.3800
+   1240.5077   1488.6100     34.9700      4.3800
+   1240.6360   1488.6100     34.9700      4.3800
+   1240.7643   1488.6100     34.9700      4.3800
+   1240.8926   1488.6100     34.9700      4.3800
+   1241.0209   1488.6100     34.9700      4.3800
+   1241.1492   1488.6100     34.9700      4.3800
+   1241.2775   1488.6200     34.9700      4.3800
+   1241.4058   1488.6200     34.9700      4.3800
+   1241.5341   1488.6200     34.9600      4.3800
+   1241.6624   1488.6200     34.9600      4.3800
+   1241.7906   1488.6200     34.9600      4.3800
+   1241.9189   1488.6300     34.9600      4.3800
+   1242.0472   1488.6300     34.9600      4.3800
+   1242.1755   1488.6300     34.9600      4.3800
+   1242.3038   1469.5200     34.9600      0.0000
+   1243.5867   1443.1800      0.0000      4.3800
+   1243.7150   1443.1800      0.0000      4.3800
+   1243.8433   1443.1800      0.0000      4.3800
+   1243.9714   1488.6500     34.9700      4.3800
+   1244.0997   1488.6500     34.9700      4.3800
+   1244.2280   1488.6500     34.9700      4.3800
+   1244.3563   1488.9400     34.9700      4.4500
+   1244.4845   1489.1800     34.9300      4.5200
+   1244.6128   1489.2300     34.8600      4.5500
+   1244.7411   1489.3100     34.8100      4.5800
+   1244.8694   1469.3000     34.7700      0.0000
+   1246.2803   1443.1800      0.0000      4.3700
+   1246.4084   1443.1800      0.0000      4.3700
+   1246.5367   1443.1900      0.0000      4.3700
+   1246.6650   1488.9600     34.9700      4.4400
+   1246.7932   1488.9100     34.9300      4.4400
+   1246.9215   1488.8600     34.8900      4.4400
+   1247.0498   1489.1500     34.8900      4.5100
+   1247.1780   1489.1100     34.8500      4.5100
+   1247.3063   1489.3500     34.8200      4.5800
+   1247.4346   1489.3100     34.7800      4.5800
+   1247.5629   1489.5500     34.7400      4.6500
+   1247.6910   1489.8000     34.7100      4.7200
+   1247.8192   1489.7100     34.6400      4.7200
+   1247.9475   1489.9500     34.6000      4.7900
+   1248.0758   1490.1800     34.5600      4.8600
+   1248.2040   1489.8100     34.4900      4.7900
+   1248.3323   1489.8100     34.4900      4.7900
+   1248.4606   1489.5700     34.5200      4.7200
+   1248.5887   1489.9000     34.5600      4.7900
+   1248.7169   1489.9100     34.5600      4.7900
+   1248.8452   1489.8600     34.5300      4.7900
+   1248.9735   1469.0400     34.5300      0.0000
+   1251.6663   1443.2700      0.0000      4.3700
+   1251.7943   1443.2700      0.0000      4.3700
+   1251.9226   1443.6000      0.0000      4.4400
+   1252.0509   1489.0000     34.9300      4.4400
+   1252.1791   1488.9500     34.8900      4.4400
+   1252.3073   1489.2400     34.8900      4.5100
+   1252.4354   1489.2000     34.8600      4.5100
+   1252.5637   1489.4400     34.8200      4.5800
+   1252.6919   1489.6900     34.7900      4.6500
+   1252.8201   1489.8800     34.7100      4.7200
+   1252.9484   1490.0800     34.6400      4.7900
+   1253.0765   1489.9800     34.5700      4.7900
+   1253.2047   1490.2300     34.5300      4.8600
+   1253.3329   1490.4800     34.5000      4.9300
+   1253.4612   1490.3900     34.4300      4.9300
+   1253.5892   1490.6300     34.3900      5.0000
+   1253.7175   1490.5800     34.3500      5.0000
+   1253.8457   1490.5400     34.3200      5.0000
+   1253.9740   1490.5500     34.3200      5.0000
+   1254.1021   1490.5500     34.3200      5.0000
+   1254.2303   1490.5500     34.3100      5.0000
+   1254.3585   1490.5500     34.3100      5.0000
+   1254.4867   1490.4100     34.3100      4.9700
+   1254.6149   1468.8700     34.3300      0.0000
+   1256.6659   1443.3300      0.0000      4.3700
+   1256.7939   1443.3400      0.0000      4.3700
+   1256.9221   1443.3400      0.0000      4.3700
+   1257.0504   1488.8400     34.9700      4.3700
+   1257.1786   1489.1300     34.9700      4.4400
+   1257.3066   1489.3800     34.9300      4.5100
+   1257.4349   1489.5700     34.8600      4.5800
+   1257.5631   1489.7700     34.7900      4.6500
+   1257.6913   1489.9600     34.7100      4.7200
+   1257.8193   1490.1600     34.6400      4.7900
+   1257.9475   1490.3600     34.5700      4.8600
+   1258.0758   1490.5600     34.4900      4.9300
+   1258.2039   1490.7500     34.4200      5.0000
+   1258.3320   1490.6600     34.3500      5.0000
+   1258.4602   1490.6200     34.3100      5.0000
+   1258.5884   1490.6100     34.3100      5.0000
+   1258.7166   1490.6200     34.3200      5.0000
+   1258.8447   1490.6200     34.3200      5.0000
+   1258.9729   1490.6200     34.3200      5.0000
+   1259.1010   1490.6200     34.3200      5.0000
+   1259.2291   1468.9200     34.3200      0.0000
+   1261.2797   1443.4000      0.0000      4.3700
+   1261.4077   1443.4100      0.0000      4.3700
+   1261.5359   1443.4100      0.0000      4.3700
+   1261.6641   1488.9100     34.9700      4.3700
+   1261.7921   1488.9000     34.9700      4.3700
+   1261.9203   1488.9100     34.9700      4.3700
+   1262.0483   1489.2000     34.9700      4.4400
+   1262.1765   1489.4400     34.9300      4.5100
+   1262.3046   1489.6400     34.8600      4.5800
+   1262.4327   1489.8400     34.7900      4.6500
+   1262.5609   1490.0400     34.7100      4.7200
+   1262.6891   1489.9500     34.6400      4.7200
+   1262.8171   1490.1900     34.6000      4.7900
+   1262.9453   1490.4400     34.5700      4.8600
+   1263.0735   1490.3500     34.5000      4.8600
+   1263.2015   1490.3000     34.4600      4.8600
+   1263.3297   1490.3100     34.4600      4.8600
+   1263.4579   1490.3100     34.4600      4.8600
+   1263.5859   1490.3100     34.4600      4.8600
+   1263.7140   1490.3200     34.4600      4.8600
+   1263.8422   1490.3200     34.4600      4.8600
+   1263.9703   1490.3200     34.4600      4.8600
+   1264.0985   1490.3200     34.4600      4.8600
+   1264.2266   1490.6100     34.4600      4.9300
+   1264.3547   1469.1500     34.4200      0.0000
+   1266.2764   1443.5000      0.0000      4.3700
+   1266.4044   1443.5100      0.0000      4.3700
+   1266.5325   1443.5100      0.0000      4.3700
+   1266.6606   1489.0000     34.9700      4.3700
+   1266.7888   1489.0000     34.9700      4.3700
+   1266.9167   1489.3000     34.9700      4.4400
+   1267.0449   1489.2500     34.9300      4.4400
+   1267.1730   1489.5000     34.9000      4.5100
+   1267.3011   1489.7400     34.8600      4.5800
+   1267.4292   1489.6400     34.7800      4.5800
+   1267.5573   1489.8900     34.7400      4.6500
+   1267.6854   1490.1300     34.7100      4.7200
+   1267.8135   1490.3300     34.6400      4.7900
+   1267.9415   1490.5200     34.5700      4.8600
+   1268.0697   1490.4300     34.4900      4.8600
+   1268.1978   1490.6800     34.4600      4.9300
+   1268.3258   1490.3400     34.4200      4.8600
+   1268.4540   1490.3500     34.4200      4.8600
+   1268.5820   1469.2700     34.4600      0.0000
+   1270.5032   1443.5300      0.0000      4.3600
+   1270.6312   1443.5300      0.0000      4.3600
+   1270.7593   1443.5300      0.0000      4.3600
+   1270.8875   1489.0400     34.9700      4.3600
+   1271.0154   1489.0400     34.9700      4.3600
+   1271.1434   1489.3300     34.9700      4.4300
+   1271.2716   1489.5700     34.9300      4.5000
+   1271.3997   1489.7700     34.8600      4.5700
+   1271.5277   1489.9600     34.7900      4.6400
+   1271.6558   1490.1500     34.7100      4.7100
+   1271.7838   1490.3400     34.6400      4.7800
+   1271.9119   1490.5300     34.5700      4.8500
+   1272.0399   1490.7200     34.4900      4.9200
+   1272.1680   1490.9100     34.4200      4.9900
+   1272.2960   1490.8100     34.3500      4.9800
+   1272.4241   1490.7600     34.3100      4.9800
+   1272.5521   1490.7700     34.3100      4.9800
+   1272.6802   1490.6200     34.3100      4.9500
+   1272.8082   1490.5100     34.3300      4.9100
+   1272.9363   1490.4100     34.3600      4.8800
+   1273.0643   1490.3200     34.4000      4.8400
+   1273.1924   1469.3200     34.4400      0.0000
+   1274.3448   1443.5400      0.0000      4.3500
+   1274.4729   1443.5500      0.0000      4.3500
+   1274.6010   1443.5500      0.0000      4.3500
+   1274.7289   1489.0500     34.9700      4.3500
+   1274.8569   1489.0500     34.9700      4.3500
+   1274.9850   1489.0500     34.9600      4.3500
+   1275.1130   1489.0500     34.9600      4.3500
+   1275.2411   1489.0500     34.9600      4.3500
+   1275.3691   1489.0600     34.9600      4.3500
+   1275.4972   1489.0600     34.9600      4.3500
+   1275.6251   1489.0600     34.9600      4.3500
+   1275.7532   1489.3500     34.9600      4.4200
+   1275.8812   1489.6000     34.9300      4.4900
+   1276.0092   1489.5100     34.8600      4.4900
+   1276.1372   1489.4600     34.8200      4.4900
+   1276.2653   1489.7600     34.8200      4.5600
+   1276.3933   1489.7100     34.7800      4.5600
+   1276.5214   1489.9600     34.7500      4.6300
+   1276.6494   1469.7500     34.7100      0.0000
+   1278.9536   1443.6200      0.0000      4.3500
+   1279.0817   1443.6200      0.0000      4.3500
+   1279.2096   1443.6300      0.0000      4.3500
+   1279.3376   1489.1300     34.9700      4.3500
+   1279.4656   1489.1300     34.9700      4.3500
+   1279.5936   1489.1300     34.9700      4.3500
+   1279.7216   1489.1400     34.9700      4.3500
+   1279.8496   1489.1400     34.9700      4.3500
+   1279.9777   1489.1400     34.9700      4.3500
+   1280.1056   1489.1300     34.9700      4.3500
+   1280.2335   1489.1400     34.9600      4.3500
+   1280.3616   1489.1400     34.9600      4.3500
+   1280.4896   1489.1400     34.9600      4.3500
+   1280.6176   1489.4300     34.9700      4.4200
+   1280.7456   1489.6700     34.9300      4.4900
+   1280.8735   1489.5800     34.8500      4.4900
+   1281.0016   1489.8200     34.8200      4.5600
+   1281.1295   1490.0600     34.7800      4.6300
+   1281.2576   1490.2700     34.7100      4.7000
+   1281.3855   1490.4600     34.6400      4.7700
+   1281.5134   1490.6600     34.5700      4.8400
+   1281.6415   1490.8500     34.4900      4.9100
+   1281.7694   1490.7500     34.4200      4.9100
+   1281.8975   1490.7100     34.3900      4.9100
+   1282.0254   1490.9900     34.3900      4.9800
+   1282.1534   1490.9500     34.3500      4.9800
+   1282.2814   1490.9000     34.3100      4.9800
+   1282.4093   1469.3000     34.3100      0.0000
+   1283.5612   1443.6500      0.0000      4.3400
+   1283.6891   1443.6500      0.0000      4.3400
+   1283.8170   1443.6500      0.0000      4.3400
+   1283.9449   1489.1700     34.9700      4.3400
+   1284.0730   1489.1700     34.9700      4.3400
+   1284.2009   1489.1700     34.9700      4.3400
+   1284.3289   1489.1700     34.9700      4.3400
+   1284.4569   1489.1700     34.9700      4.3400
+   1284.5848   1489.1800     34.9700      4.3400
+   1284.7128   1489.1800     34.9700      4.3400
+   1284.8407   1489.1800     34.9700      4.3400
+   1284.9688   1489.1800     34.9700      4.3400
+   1285.0967   1489.1800     34.9700      4.3400
+   1285.2246   1489.1900     34.9700      4.3400
+   1285.3525   1489.4800     34.9700      4.4100
+   1285.4806   1489.7200     34.9300      4.4800
+   1285.6084   1489.9200     34.8600      4.5500
+   1285.7365   1490.1200     34.7800      4.6200
+   1285.8644   1490.3100     34.7100      4.6900
+   1285.9924   1490.5100     34.6400      4.7600
+   1286.1202   1490.7100     34.5700      4.8300
+   1286.2482   1490.9000     34.4900      4.9000
+   1286.3762   1491.1000     34.4200      4.9700
+   1286.5042   1491.0100     34.3500      4.9700
+   1286.6321   1490.9600     34.3100      4.9700
+   1286.7600   1490.9700     34.3100      4.9700
+   1286.8879   1490.9700     34.3100      4.9700
+   1287.0159   1469.3800     34.3100      0.0000
+   1288.1674   1443.7200      0.0000      4.3400
+   1288.2953   1443.7200      0.0000      4.3400
+   1288.4232   1443.7200      0.0000      4.3400
+   1288.5511   1489.2400     34.9700      4.3400
+   1288.6791   1489.2400     34.9700      4.3400
+   1288.8069   1489.2400     34.9700      4.3400
+   1288.9349   1489.2500     34.9700      4.3400
+   1289.0629   1489.2400     34.9700      4.3400
+   1289.1908   1489.2500     34.9700      4.3400
+   1289.3186   1489.2400     34.9700      4.3400
+   1289.4467   1489.2500     34.9700      4.3400
+   1289.5746   1489.2500     34.9700      4.3400
+   1289.7025   1489.2500     34.9700      4.3400
+   1289.8303   1489.2500     34.9700      4.3400
+   1289.9583   1489.1000     34.9700      4.3000
+   1290.0863   1489.2700     34.9900      4.3400
+   1290.2141   1489.4200     34.9900      4.3700
+   1290.3420   1489.5100     34.9500      4.4100
+   1290.4700   1470.2600     34.9200      0.0000
+   1291.6211   1443.7300      0.0000      4.3300
+   1291.7490   1443.7300      0.0000      4.3300
+   1291.8770   1443.7300      0.0000      4.3300
+   1292.0049   1489.2500     34.9700      4.3300
+   1292.1328   1489.2500     34.9700      4.3300
+   1292.2607   1489.2500     34.9600      4.3300
+   1292.3887   1489.2400     34.9600      4.3300
+   1292.5165   1489.2400     34.9600      4.3300
+   1292.6444   1489.2400     34.9600      4.3300
+   1292.7723   1489.2400     34.9600      4.3300
+   1292.9003   1489.2400     34.9600      4.3200
+   1293.0281   1489.2400     34.9600      4.3200
+   1293.1560   1489.2400     34.9600      4.3200
+   1293.2839   1489.2400     34.9700      4.3200
+   1293.4117   1489.2400     34.9700      4.3200
+   1293.5397   1489.2500     34.9700      4.3200
+   1293.6676   1489.2500     34.9700      4.3200
+   1293.7954   1489.2500     34.9700      4.3200
+   1293.9233   1489.2500     34.9700      4.3200
+   1294.0511   1489.2500     34.9700      4.3200
+   1294.1791   1489.2500     34.9700      4.3200
+   1294.3069   1489.2500     34.9700      4.3200
+   1294.4348   1489.2500     34.9700      4.3200
+   1294.5627   1489.2500     34.9700      4.3200
+   1294.6907   1489.2500     34.9700      4.3200
+   1294.8185   1489.2500     34.9700      4.3200
+   1294.9464   1489.2500     34.9700      4.3200
+   1295.0743   1489.2500     34.9700      4.3200
+   1295.2021   1489.2500     34.9700      4.3200
+   1295.3300   1489.2600     34.9700      4.3200
+   1295.4579   1489.2600     34.9700      4.3200
+   1295.5858   1489.2700     34.9700      4.3200
+   1295.7136   1489.2700     34.9700      4.3200
+   1295.8416   1489.2800     34.9700      4.3200
+   1295.9694   1489.2900     34.9700      4.3200
+   1296.0973   1489.2900     34.9600      4.3200
+   1296.2251   1489.3000     34.9600      4.3300
+   1296.3530   1489.3100     34.9600      4.3300
+   1296.4810   1489.3200     34.9600      4.3300
+   1296.6088   1489.3200     34.9600      4.3300
+   1296.7366   1489.3200     34.9600      4.3300
+   1296.8645   1489.3200     34.9500      4.3300
+   1296.9924   1489.3200     34.9500      4.3300
+   1297.1202   1489.3300     34.9500      4.3300
+   1297.2480   1489.3300     34.9500      4.3300
+   1297.3760   1489.3300     34.9500      4.3300
+   1297.5038   1489.3300     34.9500      4.3300
+   1297.6316   1489.3300     34.9500      4.3300
+   1297.7595   1470.4200     34.9500      0.0000
+   1298.9102   1443.7800      0.0000      4.3200
+   1299.0381   1443.7900      0.0000      4.3200
+   1299.1659   1443.8000      0.0000      4.3200
+   1299.2938   1489.3200     34.9700      4.3200
+   1299.4215   1489.3200     34.9700      4.3200
+   1299.5494   1489.3200     34.9700      4.3200
+   1299.6774   1489.3200     34.9700      4.3100
+   1299.8051   1489.3200     34.9700      4.3100
+   1299.9330   1489.3200     34.9700      4.3100
+   1300.0608   1489.3200     34.9700      4.3100
+   1300.1887   1489.3200     34.9700      4.3100
+   1300.3164   1489.3300     34.9700      4.3100
+   1300.4443   1489.3400     34.9700      4.3200
+   1300.5721   1489.3500     34.9700      4.3200
+   1300.7000   1489.3500     34.9700      4.3200
+   1300.8278   1489.3600     34.9600      4.3200
+   1300.9557   1489.3700     34.9600      4.3200
+   1301.0835   1489.3800     34.9600      4.3300
+   1301.2113   1489.3900     34.9600      4.3300
+   1301.3391   1489.3900     34.9500      4.3300
+   1301.4670   1489.3900     34.9500      4.3300
+   1301.5947   1470.4900     34.9500      0.0000
+   1302.7452   1443.8500      0.0000      4.3200
+   1302.8730   1443.8500      0.0000      4.3200
+   1303.0009   1443.8500      0.0000      4.3200
+   1303.1287   1489.3700     34.9700      4.3100
+   1303.2565   1489.3800     34.9700      4.3100
+   1303.3844   1489.3700     34.9700      4.3100
+   1303.5121   1489.3700     34.9700      4.3100
+   1303.6399   1489.3700     34.9700      4.3100
+   1303.7678   1489.3700     34.9700      4.3100
+   1303.8955   1489.3600     34.9700      4.3100
+   1304.0233   1489.3600     34.9700      4.3100
+   1304.1512   1489.3600     34.9700      4.3100
+   1304.2791   1489.3500     34.9700      4.3100
+   1304.4067   1489.3500     34.9700      4.3000
+   1304.5347   1489.3500     34.9700      4.3000
+   1304.6625   1489.3500     34.9700      4.3000
+   1304.7902   1489.3500     34.9700      4.3000
+   1304.9180   1489.3500     34.9700      4.3000
+   1305.0459   1489.3600     34.9700      4.3000
+   1305.1737   1489.3600     34.9700      4.3000
+   1305.3014   1489.3600     34.9700      4.3000
+   1305.4292   1489.3600     34.9700      4.3000
+   1305.5570   1489.3700     34.9700      4.3000
+   1305.6848   1489.3600     34.9700      4.3000
+   1305.8126   1489.3700     34.9700      4.3000
+   1305.9404   1489.3700     34.9700      4.3000
+   1306.0682   1489.3700     34.9700      4.3000
+   1306.1959   1470.5900     34.9700      0.0000
+   1307.3461   1443.8700      0.0000      4.3100
+   1307.4739   1443.8700      0.0000      4.3100
+   1307.6017   1443.8700      0.0000      4.3100
+   1307.7295   1489.4200     34.9700      4.3100
+   1307.8573   1489.4300     34.9700      4.3100
+   1307.9850   1489.4300     34.9700      4.3100
+   1308.1128   1489.4300     34.9700      4.3100
+   1308.2406   1489.4300     34.9700      4.3100
+   1308.3684   1489.4300     34.9700      4.3100
+   1308.4961   1489.4300     34.9700      4.3100
+   1308.6239   1489.4400     34.9700      4.3100
+   1308.7517   1489.4400     34.9700      4.3100
+   1308.8795   1489.4400     34.9700      4.3100
+   1309.0072   1489.4400     34.9700      4.3100
+   1309.1350   1489.4400     34.9700      4.3100
+   1309.2628   1489.4400     34.9700      4.3100
+   1309.3905   1489.4500     34.9700      4.3100
+   1309.5183   1489.4500     34.9700      4.3100
+   1309.6461   1489.4500     34.9700      4.3100
+   1309.7738   1489.4500     34.9700      4.3100
+   1309.9016   1489.4500     34.9700      4.3100
+   1310.0293   1489.4500     34.9700      4.3100
+   1310.1571   1489.4500     34.9700      4.3000
+   1310.2848   1489.4500     34.9700      4.3000
+   1310.4126   1489.4500     34.9700      4.3000
+   1310.5404   1489.4500     34.9700      4.3000
+   1310.6682   1489.4500     34.9700      4.3000
+   1310.7959   1489.4500     34.9700      4.3000
+   1310.9237   1489.4500     34.9700      4.3000
+   1311.0514   1489.4600     34.9700      4.3000
+   1311.1791   1470.6700     34.9700      0.0000
+   1312.3290   1443.9300      0.0000      4.3000
+   1312.4567   1443.9300      0.0000      4.3000
+   1312.5844   1443.9400      0.0000      4.3000
+   1312.7122   1489.4900     34.9700      4.3000
+   1312.8400   1489.4900     34.9700      4.3000
+   1312.9677   1489.4900     34.9700      4.3000
+   1313.0953   1489.4900     34.9700      4.3000
+   1313.2231   1489.5000     34.9700      4.3000
+   1313.3508   1489.5000     34.9700      4.3000
+   1313.4785   1489.5000     34.9700      4.3000
+   1313.6063   1489.5000     34.9700      4.3000
+   1313.7341   1489.5000     34.9700      4.3000
+   1313.8618   1489.5100     34.9700      4.3000
+   1313.9895   1489.5100     34.9800      4.3000
+   1314.1173   1489.5100     34.9700      4.3000
+   1314.2450   1489.5100     34.9700      4.3000
+   1314.3727   1489.5100     34.9700      4.3000
+   1314.5005   1489.5200     34.9700      4.3000
+   1314.6282   1489.5200     34.9700      4.3000
+   1314.7560   1489.5200     34.9700      4.3000
+   1314.8835   1489.5200     34.9700      4.3000
+   1315.0114   1489.5200     34.9700      4.3000
+   1315.1392   1489.5200     34.9700      4.3000
+   1315.2668   1489.5200     34.9700      4.3000
+   1315.3945   1489.5200     34.9700      4.3000
+   1315.5222   1489.5200     34.9600      4.3000
+   1315.6500   1489.5200     34.9600      4.3000
+   1315.7777   1470.7400     34.9600      0.0000
+   1316.9271   1443.9900      0.0000      4.3000
+   1317.0548   1443.9900      0.0000      4.3000
+   1317.1825   1443.9900      0.0000      4.3000
+   1317.3102   1489.5200     34.9600      4.3000
+   1317.4380   1489.5200     34.9600      4.2900
+   1317.5656   1489.5200     34.9700      4.2900
+   1317.6934   1489.5200     34.9700      4.2900
+   1317.8210   1489.5200     34.9700      4.2900
+   1317.9489   1489.5300     34.9700      4.2900
+   1318.0764   1489.5300     34.9700      4.2900
+   1318.2041   1489.5300     34.9700      4.2900
+   1318.3319   1489.5300     34.9700      4.2900
+   1318.4596   1489.5300     34.9700      4.2900
+   1318.5873   1489.5400     34.9700      4.2900
+   1318.7150   1489.5400     34.9700      4.2900
+   1318.8427   1489.5400     34.9700      4.2900
+   1318.9703   1489.5400     34.9700      4.2900
+   1319.0980   1489.5400     34.9700      4.2900
+   1319.2257   1489.5500     34.9700      4.2900
+   1319.3535   1489.5500     34.9700      4.2900
+   1319.4811   1489.5500     34.9700      4.2900
+   1319.6088   1489.5500     34.9700      4.2900
+   1319.7366   1489.5500     34.9700      4.2900
+   1319.8641   1489.5600     34.9700      4.2900
+   1319.9918   1489.5600     34.9700      4.2900
+   1320.1195   1489.5600     34.9700      4.2900
+   1320.2473   1489.5600     34.9700      4.2900
+   1320.3749   1489.5600     34.9700      4.2900
+   1320.5026   1489.5700     34.9700      4.2900
+   1320.6302   1489.5700     34.9700      4.2900
+   1320.7579   1470.8300     34.9700      0.0000
+   1321.9070   1444.0400      0.0000      4.2900
+   1322.0348   1444.0400      0.0000      4.2900
+   1322.1624   1444.0500      0.0000      4.2900
+   1322.2900   1489.6000     34.9700      4.2900
+   1322.4177   1489.6000     34.9700      4.2900
+   1322.5454   1489.6000     34.9700      4.2900
+   1322.6730   1489.6000     34.9700      4.2900
+   1322.8007   1489.6000     34.9700      4.2900
+   1322.9283   1489.6100     34.9700      4.2900
+   1323.0560   1489.6100     34.9700      4.2900
+   1323.1837   1489.6100     34.9700      4.2900
+   1323.3114   1489.6100     34.9700      4.2900
+   1323.4391   1489.6100     34.9700      4.2900
+   1323.5667   1489.6200     34.9700      4.2900
+   1323.6943   1489.6200     34.9600      4.2900
+   1323.8220   1489.6200     34.9600      4.2900
+   1323.9496   1489.6200     34.9600      4.2900
+   1324.0773   1489.6200     34.9600      4.2900
+   1324.2050   1489.6300     34.9600      4.2900
+   1324.3326   1489.6300     34.9600      4.2900
+   1324.4602   1489.6300     34.9600      4.2900
+   1324.5879   1489.6300     34.9600      4.2900
+   1324.7156   1489.6300     34.9600      4.2900
+   1324.8433   1489.6400     34.9600      4.2900
+   1324.9708   1489.6400     34.9600      4.2900
+   1325.0985   1489.6400     34.9600      4.2900
+   1325.2262   1489.6400     34.9600      4.2900
+   1325.3538   1470.9000     34.9600      0.0000
+   1327.2683   1444.0800      0.0000      4.2800
+   1327.3960   1444.0800      0.0000      4.2800
+   1327.5237   1444.0900      0.0000      4.2800
+   1327.6512   1489.6500     34.9700      4.2800
+   1327.7788   1489.6600     34.9700      4.2800
+   1327.9065   1489.6600     34.9700      4.2800
+   1328.0342   1489.6600     34.9700      4.2800
+   1328.1617   1489.6700     34.9700      4.2800
+   1328.2893   1489.6700     34.9700      4.2800
+   1328.4170   1489.6800     34.9700      4.2900
+   1328.5446   1489.6800     34.9700      4.2900
+   1328.6722   1489.6800     34.9700      4.2900
+   1328.7998   1489.6900     34.9700      4.2900
+   1328.9275   1489.6900     34.9700      4.2900
+   1329.0551   1489.6900     34.9700      4.2900
+   1329.1826   1489.7000     34.9700      4.2900
+   1329.3103   1489.6900     34.9700      4.2900
+   1329.4379   1489.7000     34.9700      4.2900
+   1329.5656   1489.7000     34.9700      4.2900
+   1329.6931   1489.7000     34.9700      4.2900
+   1329.8208   1489.7000     34.9700      4.2900
+   1329.9484   1489.7000     34.9700      4.2900
+   1330.0759   1489.7000     34.9700      4.2900
+   1330.2036   1489.7000     34.9700      4.2900
+   1330.3311   1489.7000     34.9700      4.2800
+   1330.4587   1489.7000     34.9700      4.2800
+   1330.5864   1489.7000     34.9700      4.2800
+   1330.7140   1489.7000     34.9700      4.2800
+   1330.8416   1489.7100     34.9700      4.2800
+   1330.9691   1489.7100     34.9700      4.2800
+   1331.0968   1471.0100     34.9700      0.0000
+   1332.2451   1444.1600      0.0000      4.2800
+   1332.3727   1444.1700      0.0000      4.2800
+   1332.5004   1444.1700      0.0000      4.2800
+   1332.6278   1489.7300     34.9700      4.2800
+   1332.7555   1489.7300     34.9700      4.2800
+   1332.8831   1489.7300     34.9700      4.2800
+   1333.0107   1489.7400     34.9700      4.2800
+   1333.1382   1489.7400     34.9700      4.2800
+   1333.2659   1489.7400     34.9700      4.2800
+   1333.3934   1489.7400     34.9700      4.2800
+   1333.5210   1489.7400     34.9700      4.2800
+   1333.6486   1489.7500     34.9700      4.2800
+   1333.7761   1489.7500     34.9700      4.2800
+   1333.9038   1489.7500     34.9700      4.2800
+   1334.0312   1489.7600     34.9700      4.2800
+   1334.1588   1489.7600     34.9700      4.2800
+   1334.2865   1489.7600     34.9700      4.2800
+   1334.4141   1489.7600     34.9700      4.2800
+   1334.5416   1489.7600     34.9700      4.2800
+   1334.6692   1489.7700     34.9700      4.2800
+   1334.7968   1489.7700     34.9700      4.2800
+   1334.9243   1489.7700     34.9700      4.2800
+   1335.0519   1489.7700     34.9700      4.2800
+   1335.1794   1489.7700     34.9700      4.2800
+   1335.3070   1489.7700     34.9700      4.2800
+   1335.4346   1489.7700     34.9700      4.2800
+   1335.5621   1489.7700     34.9700      4.2800
+   1335.6897   1471.0800     34.9700      0.0000
+   1336.8378   1444.2200      0.0000      4.2800
+   1336.9653   1444.2100      0.0000      4.2800
+   1337.0929   1444.2200      0.0000      4.2800
+   1337.2203   1489.7900     34.9700      4.2800
+   1337.3479   1489.7800     34.9700      4.2700
+   1337.4756   1489.7900     34.9700      4.2700
+   1337.6031   1489.7800     34.9700      4.2700
+   1337.7306   1489.7900     34.9800      4.2700
+   1337.8582   1489.7800     34.9700      4.2700
+   1337.9857   1489.7900     34.9700      4.2700
+   1338.1132   1489.7900     34.9700      4.2700
+   1338.2407   1489.7900     34.9700      4.2700
+   1338.3684   1489.7900     34.9700      4.2700
+   1338.4960   1489.7900     34.9700      4.2700
+   1338.6234   1489.7900     34.9700      4.2700
+   1338.7510   1489.7900     34.9700      4.2700
+   1338.8785   1489.7900     34.9700      4.2700
+   1339.0060   1489.7900     34.9700      4.2700
+   1339.1335   1471.1300     34.9600      0.0000
+   1340.2814   1444.2500      0.0000      4.2700
+   1340.4088   1444.2500      0.0000      4.2700
+   1340.5364   1444.2500      0.0000      4.2700
+   1340.6639   1489.8100     34.9600      4.2700
+   1340.7915   1489.8100     34.9600      4.2700
+   1340.9189   1489.8200     34.9600      4.2700
+   1341.0465   1489.8200     34.9600      4.2700
+   1341.1741   1489.8200     34.9600      4.2700
+   1341.3015   1489.8200     34.9600      4.2700
+   1341.4291   1489.8200     34.9600      4.2700
+   1341.5566   1489.8300     34.9600      4.2700
+   1341.6842   1489.8300     34.9600      4.2700
+   1341.8116   1489.8300     34.9600      4.2700
+   1341.9392   1489.8300     34.9600      4.2700
+   1342.0667   1489.8300     34.9600      4.2700
+   1342.1941   1489.8400     34.9600      4.2700
+   1342.3217   1489.8400     34.9600      4.2700
+   1342.4492   1489.8400     34.9600      4.2700
+   1342.5768   1489.8400     34.9600      4.2700
+   1342.7042   1489.8400     34.9600      4.2700
+   1342.8318   1489.8400     34.9600      4.2700
+   1342.9592   1489.8500     34.9600      4.2700
+   1343.0867   1489.8500     34.9600      4.2700
+   1343.2142   1489.8500     34.9600      4.2700
+   1343.3418   1489.8500     34.9600      4.2700
+   1343.4692   1489.8500     34.9600      4.2700
+   1343.5967   1489.8600     34.9600      4.2700
+   1343.7242   1489.8600     34.9600      4.2700
+   1343.8518   1489.8700     34.9600      4.2700
+   1343.9794   1489.8600     34.9600      4.2700
+   1344.1067   1471.2100     34.9600      0.0000
+   1346.4016   1444.3000      0.0000      4.2600
+   1346.5291   1444.3000      0.0000      4.2600
+   1346.6566   1444.3100      0.0000      4.2600
+   1346.7839   1489.8800     34.9700      4.2600
+   1346.9115   1489.8800     34.9700      4.2600
+   1347.0389   1489.8900     34.9700      4.2600
+   1347.1665   1489.8900     34.9700      4.2600
+   1347.2939   1489.8900     34.9700      4.2600
+   1347.4214   1489.8900     34.9700      4.2600
+   1347.5490   1489.8900     34.9700      4.2600
+   1347.6763   1489.9000     34.9700      4.2600
+   1347.8038   1489.9000     34.9700      4.2600
+   1347.9313   1489.9000     34.9700      4.2600
+   1348.0588   1489.9000     34.9700      4.2600
+   1348.1862   1489.9000     34.9700      4.2600
+   1348.3137   1489.9100     34.9700      4.2600
+   1348.4412   1489.9000     34.9700      4.2600
+   1348.5686   1471.2900     34.9700      0.0000
+   1349.8433   1444.3200      0.0000      4.2500
+   1349.9706   1444.3200      0.0000      4.2500
+   1350.0980   1444.3200      0.0000      4.2500
+   1350.2256   1489.9100     34.9800      4.2500
+   1350.3530   1489.9100     34.9700      4.2500
+   1350.4805   1471.3300     34.9700      0.0000
+   1355.5776   1444.3900      0.0000      4.2500
+   1355.7051   1444.3900      0.0000      4.2500
+   1355.8324   1444.3900      0.0000      4.2500
+   1355.9598   1471.4200     34.9700      0.0000
+   1360.5458   1444.4600      0.0000      4.2500
+   1360.6732   1444.4600      0.0000      4.2500
+   1360.8005   1444.4700      0.0000      4.2500
+   1360.9279   1490.0500     34.9600      4.2500
+   1361.0553   1490.0500     34.9600      4.2500
+   1361.1826   1490.0500     34.9600      4.2500
+   1361.3099   1490.0600     34.9600      4.2500
+   1361.4374   1490.0600     34.9600      4.2500
+   1361.5647   1490.0600     34.9600      4.2500
+   1361.6921   1490.0600     34.9600      4.2500
+   1361.8195   1490.0600     34.9600      4.2500
+   1361.9468   1490.0700     34.9700      4.2500
+   1362.0742   1490.0700     34.9700      4.2500
+   1362.2015   1490.0800     34.9700      4.2500
+   1362.3289   1490.0900     34.9700      4.2500
+   1362.4563   1490.0900     34.9700      4.2500
+   1362.5836   1490.0900     34.9600      4.2500
+   1362.7109   1490.0800     34.9600      4.2500
+   1362.8383   1471.5200     34.9600      0.0000
+   1365.8944   1444.5000      0.0000      4.2400
+   1382.6932   1444.7100      0.0000      4.2200
+   1382.8204   1444.7100      0.0000      4.2200
+   1382.9476   1444.7100      0.0000      4.2200
+   1383.0748   1490.3200     34.9700      4.2200
+   1383.2020   1490.3100     34.9600      4.2200
+   1383.3292   1490.3200     34.9600      4.2200
+   1383.4564   1490.3200     34.9600      4.2200
+   1383.5835   1490.3200     34.9600      4.2200
+   1383.7108   1471.8700     34.9600      0.0000
+   1494.2432   1446.6600      0.0000      4.2500
+   1494.3695   1446.6700      0.0000      4.2500
+   1494.4957   1446.6700      0.0000      4.2500
+   1494.6221   1499.7000     40.6600      4.2500
+   1494.7484   1499.6200     40.6000      4.2500
+   1494.8748   1499.6200     40.5900      4.2500
+   1495.0011   1499.6200     40.5900      4.2500
+   1495.1274   1499.6200     40.5900      4.2500
+   1495.2538   1481.3900     40.5900      0.0000
+   1499.0427   1446.7400      0.0000      4.2500
+   1499.1691   1446.7400      0.0000      4.2500
+   1499.2954   1446.7500      0.0000      4.2500
+   1499.4216   1499.7000     40.5900      4.2500
+   1499.5479   1499.6900     40.5900      4.2500
+   1499.6742   1499.7000     40.5900      4.2500
+   1499.8005   1499.7000     40.5900      4.2500
+   1499.9268   1499.7000     40.5900      4.2500
+   1500.0530   1499.7000     40.5900      4.2500
+   1500.1793   1481.4700     40.5900      0.0000
+   1509.1426   1447.0700      0.0000      4.2900
+   1541.5452   1445.9600      0.0000      3.9300
+   1541.6711   1445.9600      0.0000      3.9300
+   1541.7971   1445.9600      0.0000      3.9300
+   1541.9231   1505.3600     45.3900      3.9300
+   1542.0491   1505.3400     45.3700      3.9300
+   1542.1750   1505.3400     45.3700      3.9300
+   1542.3009   1505.3400     45.3700      3.9300
+   1542.4269   1505.3400     45.3700      3.9300
+   1542.5529   1505.3400     45.3700      3.9300
+   1542.6787   1505.3500     45.3700      3.9300
+   1542.8047   1505.3500     45.3700      3.9300
+   1542.9307   1505.3500     45.3700      3.9300
+   1543.0566   1505.3500     45.3700      3.9300
+   1543.1825   1505.3500     45.3700      3.9300
+   1543.3085   1505.3600     45.3700      3.9300
+   1543.4344   1505.3600     45.3700      3.9300
+   1543.5604   1505.2200     45.3700      3.9000
+   1543.6863   1488.7300     45.3900      0.0000
@@ -0,0 +1,1470 @@
+test_read_store_and_write
+1/1/2012
+1:39:22
+Probe: XCTD-1
+Source: /root/package/data/input/sippican/C3_00172.EDF
+      0.0000   1444.8800     25.7500      1.7600
+      0.1000   1447.7700     27.6700      1.8400
+      0.3000   1448.2300     27.8500      1.8900
+      0.4000   1448.9800     28.3500      1.9100
+      0.5000   1449.3600     28.5700      1.9300
+      0.7000   1448.4300     27.8200      1.9400
+      0.8000   1449.0900     28.3200      1.9400
+      1.0000   1449.4000     28.5600      1.9400
+      1.1000   1450.7100     29.5200      1.9500
+      1.2000   1451.2900     30.0000      1.9400
+      1.4000   1451.5100     30.1300      1.9500
+      1.5000   1451.6300     30.2200      1.9500
+      1.6000   1451.6100     30.2400      1.9400
+      1.8000   1451.7600     30.3200      1.9500
+      1.9000   1451.7900     30.3300      1.9500
+      2.1000   1451.8300     30.3700      1.9500
+      2.2000   1451.8600     30.3800      1.9500
+      2.3000   1451.8800     30.4000      1.9500
+      2.5000   1451.8900     30.4000      1.9500
+      2.6000   1451.8900     30.4000      1.9500
+      2.7000   1451.8900     30.4000      1.9500
+      2.9000   1451.9200     30.4200      1.9500
+      3.0000   1451.9200     30.4200      1.9500
+      3.2000   1451.9200     30.4200      1.9500
+      3.3000   1451.9200     30.4200      1.9500
+      3.4000   1451.9300     30.4200      1.9500
+      3.6000   1451.9300     30.4200      1.9500
+      3.7000   1451.9100     30.4400      1.9400
+      3.8000   1451.9400     30.4300      1.9500
+      4.0000   1451.9600     30.4400      1.9500
+      4.1000   1451.9400     30.4200      1.9500
+      4.2000   1451.9600     30.4400      1.9500
+      4.4000   1451.9000     30.4200      1.9400
+      4.5000   1451.9700     30.4400      1.9500
+      4.7000   1451.9100     30.4300      1.9400
+      4.8000   1451.9800     30.4400      1.9500
+      4.9000   1451.9600     30.4300      1.9500
+      5.1000   1451.9300     30.4400      1.9400
+      5.2000   1451.9600     30.4300      1.9500
+      5.3000   1451.9200     30.4300      1.9400
+      5.5000   1451.9900     30.4400      1.9500
+      5.6000   1451.9900     30.4400      1.9500
+      5.8000   1451.9400     30.4400      1.9400
+      5.9000   1451.9900     30.4400      1.9500
+      6.0000   1451.9500     30.4400      1.9400
+      6.2000   1452.0000     30.4400      1.9500
+      6.3000   1451.9800     30.4200      1.9500
+      6.4000   1451.9500     30.4400      1.9400
+      6.6000   1452.0100     30.4400      1.9500
+      6.7000   1451.9400     30.4200      1.9400
+      6.8000   1451.9900     30.4200      1.9500
+      7.0000   1452.0100     30.4400      1.9500
+      7.1000   1452.0100     30.4400      1.9500
+      7.3000   1452.0300     30.4200      1.9600
+      7.4000   1452.0500     30.4300      1.9600
+      7.5000   1452.0500     30.4300      1.9600
+      7.7000   1452.0500     30.4300      1.9600
+      7.8000   1452.0100     30.4300      1.9500
+      7.9000   1452.0100     30.4300      1.9500
+      8.1000   1452.0200     30.4400      1.9500
+      8.2000   1452.0700     30.4400      1.9600
+      8.4000   1452.0700     30.4300      1.9600
+      8.5000   1452.0200     30.4300      1.9500
+      8.6000   1452.0700     30.4300      1.9600
+      8.8000   1452.0300     30.4300      1.9500
+      8.9000   1452.0700     30.4300      1.9600
+      9.0000   1452.0800     30.4300      1.9600
+      9.2000   1452.0300     30.4300      1.9500
+      9.3000   1452.0800     30.4300      1.9600
+      9.5000   1452.0800     30.4300      1.9600
+      9.6000   1452.0800     30.4300      1.9600
+      9.7000   1452.0800     30.4300      1.9600
+      9.9000   1452.1100     30.4500      1.9600
+     10.0000   1452.1100     30.4500      1.9600
+     10.1000   1452.1100     30.4500      1.9600
+     10.3000   1452.1100     30.4500      1.9600
+     10.4000   1452.0900     30.4300      1.9600
+     10.5000   1452.0500     30.4300      1.9500
+     10.7000   1452.0800     30.4500      1.9500
+     10.8000   1452.0900     30.4500      1.9500
+     11.0000   1452.1100     30.4400      1.9600
+     11.1000   1452.1100     30.4300      1.9600
+     11.2000   1452.0600     30.4300      1.9500
+     11.4000   1452.0900     30.4500      1.9500
+     11.5000   1452.0800     30.4400      1.9500
+     11.6000   1452.0800     30.4400      1.9500
+     11.8000   1452.0800     30.4400      1.9500
+     11.9000   1452.0800     30.4400      1.9500
+     12.1000   1452.0800     30.4400      1.9500
+     12.2000   1452.0900     30.4400      1.9500
+     12.3000   1452.0900     30.4400      1.9500
+     12.5000   1452.0900     30.4400      1.9500
+     12.6000   1452.0900     30.4400      1.9500
+     12.7000   1452.0900     30.4400      1.9500
+     12.9000   1452.1000     30.4300      1.9500
+     13.0000   1452.1000     30.4300      1.9500
+     13.1000   1452.1000     30.4300      1.9500
+     13.3000   1452.1000     30.4300      1.9500
+     13.4000   1452.1100     30.4300      1.9500
+     13.6000   1452.1100     30.4300      1.9500
+     13.7000   1452.1100     30.4300      1.9500
+     13.8000   1452.1100     30.4300      1.9500
+     14.0000   1452.1100     30.4300      1.9500
+     14.1000   1452.1200     30.4300      1.9500
+     14.2000   1452.1200     30.4300      1.9500
+     14.4000   1452.1200     30.4300      1.9500
+     14.5000   1452.1200     30.4300      1.9500
+     14.7000   1452.1200     30.4300      1.9500
+     14.8000   1452.1300     30.4300      1.9500
+     14.9000   1452.0800     30.4300      1.9400
+     15.1000   1452.1400     30.4400      1.9500
+     15.2000   1452.1400     30.4400      1.9500
+     15.3000   1452.1300     30.4300      1.9500
+     15.5000   1452.1400     30.4300      1.9500
+     15.6000   1452.0900     30.4300      1.9400
+     15.7000   1452.1000     30.4400      1.9400
+     15.9000   1452.1100     30.4400      1.9400
+     16.0000   1452.0700     30.4400      1.9300
+     16.2000   1452.1200     30.4500      1.9400
+     16.3000   1452.0500     30.4300      1.9300
+     16.4000   1452.1300     30.4500      1.9400
+     16.6000   1452.1300     30.4500      1.9400
+     16.7000   1452.0800     30.4400      1.9300
+     16.8000   1452.1300     30.4500      1.9400
+     17.0000   1452.0900     30.4500      1.9300
+     17.1000   1452.0900     30.4500      1.9300
+     17.3000   1452.1000     30.4500      1.9300
+     17.4000   1452.1000     30.4500      1.9300
+     17.5000   1452.0800     30.4300      1.9300
+     17.7000   1452.1100     30.4500      1.9300
+     17.8000   1452.0800     30.4300      1.9300
+     17.9000   1452.1300     30.4300      1.9400
+     18.1000   1452.0800     30.4300      1.9300
+     18.2000   1452.1100     30.4500      1.9300
+     18.3000   1452.1200     30.4500      1.9300
+     18.5000   1452.0500     30.4300      1.9200
+     18.6000   1452.0600     30.4400      1.9200
+     18.8000   1452.0200     30.4400      1.9100
+     18.9000   1452.0300     30.4500      1.9100
+     19.0000   1451.9900     30.4500      1.9000
+     19.2000   1451.9800     30.4400      1.9000
+     19.3000   1451.9800     30.4400      1.9000
+     19.4000   1451.9900     30.4400      1.9000
+     19.6000   1452.0300     30.4400      1.9100
+     19.7000   1451.9400     30.4400      1.8900
+     19.9000   1451.9000     30.4400      1.8800
+     20.0000   1451.9000     30.4800      1.8700
+     20.1000   1451.8400     30.4300      1.8700
+     20.3000   1451.8500     30.4400      1.8700
+     20.4000   1451.7900     30.4200      1.8600
+     20.5000   1451.7700     30.4400      1.8500
+     20.7000   1451.7200     30.4300      1.8400
+     20.8000   1451.7100     30.4600      1.8300
+     20.9000   1451.7500     30.4500      1.8400
+     21.1000   1451.6800     30.4300      1.8300
+     21.2000   1451.6800     30.4300      1.8300
+     21.4000   1451.7200     30.4600      1.8300
+     21.5000   1451.7200     30.4600      1.8300
+     21.6000   1451.7200     30.4600      1.8300
+     21.8000   1451.7000     30.4400      1.8300
+     21.9000   1451.7000     30.4400      1.8300
+     22.0000   1451.7500     30.4400      1.8400
+     22.2000   1451.7400     30.4300      1.8400
+     22.3000   1451.7600     30.4500      1.8400
+     22.5000   1451.6700     30.4500      1.8200
+     22.6000   1451.6900     30.4600      1.8200
+     22.7000   1451.6100     30.4600      1.8000
+     22.9000   1451.4900     30.4400      1.7800
+     23.0000   1451.5200     30.4600      1.7800
+     23.1000   1451.4600     30.4500      1.7700
+     23.3000   1451.4900     30.4300      1.7800
+     23.4000   1451.4500     30.4300      1.7700
+     23.5000   1451.4500     30.4300      1.7700
+     23.7000   1451.4600     30.4400      1.7700
+     23.8000   1451.4600     30.4400      1.7700
+     24.0000   1451.5300     30.4600      1.7800
+     24.1000   1451.4800     30.4500      1.7700
+     24.2000   1451.3900     30.4500      1.7500
+     24.4000   1451.3700     30.4700      1.7400
+     24.5000   1451.2300     30.4600      1.7000
+     24.6000   1451.1600     30.4500      1.6900
+     24.8000   1451.1200     30.4500      1.6800
+     24.9000   1451.0200     30.4400      1.6600
+     25.0000   1451.0900     30.4500      1.6700
+     25.2000   1451.0900     30.4600      1.6700
+     25.3000   1451.0200     30.4300      1.6600
+     25.5000   1450.9600     30.4600      1.6400
+     25.6000   1450.8000     30.4700      1.6000
+     25.7000   1450.5600     30.5000      1.5400
+     25.9000   1450.0500     30.5000      1.4300
+     26.0000   1449.5600     30.5400      1.3000
+     26.1000   1449.2400     30.5800      1.2200
+     26.3000   1448.9100     30.5100      1.1700
+     26.4000   1448.6900     30.4500      1.1400
+     26.6000   1448.5300     30.4700      1.1000
+     26.7000   1448.4600     30.4800      1.0700
+     26.8000   1448.4300     30.4900      1.0600
+     27.0000   1448.3300     30.4900      1.0400
+     27.1000   1448.2800     30.4900      1.0300
+     27.2000   1448.2800     30.4800      1.0300
+     27.4000   1448.2900     30.4900      1.0300
+     27.5000   1448.2900     30.4900      1.0300
+     27.6000   1448.2500     30.4900      1.0200
+     27.8000   1448.3000     30.4900      1.0300
+     27.9000   1448.2600     30.4900      1.0200
+     28.1000   1448.3100     30.4900      1.0300
+     28.2000   1448.3100     30.4900      1.0300
+     28.3000   1448.3000     30.4900      1.0300
+     28.5000   1448.3100     30.4900      1.0300
+     28.6000   1448.3500     30.4900      1.0400
+     28.7000   1448.4000     30.4800      1.0500
+     28.9000   1448.4600     30.4900      1.0600
+     29.0000   1448.4900     30.4800      1.0700
+     29.2000   1448.7400     30.4900      1.1300
+     29.3000   1449.0100     30.4800      1.1900
+     29.4000   1449.4100     30.4600      1.2800
+     29.6000   1449.7600     30.4400      1.3600
+     29.7000   1450.3400     30.5300      1.4700
+     29.8000   1451.0800     30.5300      1.6300
+     30.0000   1451.7300     30.5300      1.7800
+     30.1000   1452.2100     30.5500      1.8800
+     30.2000   1452.7000     30.7100      1.9400
+     30.4000   1453.1600     30.8600      2.0000
+     30.5000   1453.3600     30.8300      2.0500
+     30.7000   1453.5400     30.8000      2.1000
+     30.8000   1453.9400     30.8600      2.1800
+     30.9000   1454.2300     30.8700      2.2400
+     31.1000   1454.5100     30.8800      2.3000
+     31.2000   1454.8500     30.9400      2.3600
+     31.3000   1455.1200     31.0100      2.4000
+     31.5000   1455.4800     31.1400      2.4400
+     31.6000   1455.8400     31.2500      2.4900
+     31.7000   1456.1500     31.2800      2.5500
+     31.9000   1456.3700     31.2800      2.6000
+     32.0000   1456.5500     31.3100      2.6300
+     32.2000   1456.8600     31.4800      2.6500
+     32.3000   1456.9600     31.5200      2.6600
+     32.4000   1457.0200     31.5300      2.6700
+     32.6000   1457.0700     31.5400      2.6800
+     32.7000   1457.0400     31.5400      2.6700
+     32.8000   1457.0900     31.5400      2.6800
+     33.0000   1457.0900     31.5400      2.6800
+     33.1000   1457.0400     31.5400      2.6700
+     33.3000   1457.1200     31.5600      2.6800
+     33.4000   1457.1000     31.5800      2.6700
+     33.5000   1457.1500     31.5800      2.6800
+     33.7000   1457.0600     31.5800      2.6600
+     33.8000   1456.9800     31.5900      2.6400
+     33.9000   1456.8100     31.5900      2.6000
+     34.1000   1456.6500     31.6400      2.5500
+     34.2000   1456.6000     31.6600      2.5300
+     34.3000   1456.4700     31.6200      2.5100
+     34.5000   1456.4000     31.6100      2.5000
+     34.6000   1456.4200     31.6200      2.5000
+     34.8000   1456.4300     31.6300      2.5000
+     34.9000   1456.4300     31.6300      2.5000
+     35.0000   1456.4600     31.6500      2.5000
+     35.2000   1456.5300     31.6600      2.5100
+     35.3000   1456.5900     31.6800      2.5200
+     35.4000   1456.6100     31.6900      2.5200
+     35.6000   1456.6100     31.7200      2.5100
+     35.7000   1456.3500     31.7200      2.4500
+     35.8000   1456.2200     31.7600      2.4100
+     36.0000   1455.8200     31.8300      2.3000
+     36.1000   1455.8200     31.7900      2.3100
+     36.3000   1456.1700     31.9200      2.3500
+     36.4000   1455.9100     31.6500      2.3700
+     36.5000   1456.2800     31.8600      2.3900
+     36.7000   1456.4800     31.8800      2.4300
+     36.8000   1456.5500     31.8600      2.4500
+     36.9000   1456.8100     31.8500      2.5100
+     37.1000   1457.1400     31.9000      2.5700
+     37.2000   1457.2600     31.8600      2.6100
+     37.3000   1457.4500     31.8700      2.6500
+     37.5000   1457.6800     31.9700      2.6700
+     37.6000   1457.7300     31.9400      2.6900
+     37.8000   1457.7500     31.9600      2.6900
+     37.9000   1457.6300     31.9700      2.6600
+     38.0000   1457.3500     31.9800      2.5900
+     38.2000   1456.9000     32.0100      2.4800
+     38.3000   1456.5800     32.0700      2.3900
+     38.4000   1456.1500     32.0800      2.2900
+     38.6000   1455.5500     32.0300      2.1700
+     38.7000   1455.2200     32.0500      2.0800
+     38.9000   1454.8300     32.0600      1.9900
+     39.0000   1454.4100     32.0100      1.9100
+     39.1000   1454.1800     32.0500      1.8500
+     39.3000   1454.0900     32.0800      1.8200
+     39.4000   1453.9400     32.0300      1.8000
+     39.5000   1453.9600     32.0400      1.8000
+     39.7000   1453.8800     32.0500      1.7800
+     39.8000   1453.8100     32.0600      1.7600
+     39.9000   1453.7900     32.1200      1.7400
+     40.1000   1453.7300     32.1000      1.7300
+     40.2000   1453.7100     32.1200      1.7100
+     40.4000   1453.6500     32.1100      1.7000
+     40.5000   1453.6700     32.1200      1.7000
+     40.6000   1453.6300     32.1300      1.6900
+     40.8000   1453.6400     32.1300      1.6900
+     40.9000   1453.6000     32.1400      1.6800
+     41.0000   1453.6100     32.1400      1.6800
+     41.2000   1453.5500     32.1300      1.6700
+     41.3000   1453.5800     32.1500      1.6700
+     41.4000   1453.6400     32.1600      1.6800
+     41.6000   1453.5900     32.1500      1.6700
+     41.7000   1453.6600     32.1700      1.6800
+     41.9000   1453.6600     32.1700      1.6800
+     42.0000   1453.7000     32.1700      1.6900
+     42.1000   1453.7700     32.1800      1.7000
+     42.3000   1453.8500     32.1700      1.7300
+     42.4000   1453.9000     32.1700      1.7400
+     42.5000   1453.9800     32.1900      1.7500
+     42.7000   1454.0600     32.2200      1.7600
+     42.8000   1454.1600     32.2300      1.7800
+     42.9000   1454.1900     32.2100      1.7900
+     43.1000   1454.4000     32.2400      1.8300
+     43.2000   1454.4900     32.2300      1.8500
+     43.4000   1454.5000     32.2300      1.8500
+     43.5000   1454.5800     32.2600      1.8600
+     43.6000   1454.4900     32.2900      1.8300
+     43.8000   1454.3200     32.3000      1.7900
+     43.9000   1454.2400     32.3400      1.7600
+     44.0000   1454.2400     32.3400      1.7600
+     44.2000   1454.1600     32.2800      1.7600
+     44.3000   1454.1400     32.3000      1.7500
+     44.5000   1454.2500     32.3400      1.7600
+     44.6000   1454.2000     32.3400      1.7500
+     44.7000   1454.1600     32.3400      1.7400
+     44.9000   1454.0900     32.3500      1.7100
+     45.0000   1453.8400     32.3700      1.6500
+     45.1000   1453.6400     32.3900      1.6000
+     45.3000   1453.5100     32.4300      1.5600
+     45.4000   1453.1300     32.3800      1.4900
+     45.5000   1452.9300     32.4000      1.4400
+     45.7000   1452.7800     32.4300      1.4000
+     45.8000   1452.7000     32.4000      1.3900
+     46.0000   1452.6700     32.4100      1.3700
+     46.1000   1452.5900     32.4200      1.3500
+     46.2000   1452.5900     32.4200      1.3500
+     46.4000   1452.5600     32.4300      1.3400
+     46.5000   1452.5700     32.4300      1.3400
+     46.6000   1452.5500     32.4200      1.3400
+     46.8000   1452.5500     32.4200      1.3400
+     46.9000   1452.5800     32.4400      1.3400
+     47.0000   1452.5600     32.4200      1.3400
+     47.2000   1452.5600     32.4200      1.3400
+     47.3000   1452.5600     32.4200      1.3400
+     47.5000   1452.5200     32.4200      1.3300
+     47.6000   1452.5700     32.4200      1.3400
+     47.7000   1452.5300     32.4200      1.3300
+     47.9000   1452.5300     32.4200      1.3300
+     48.0000   1452.5400     32.4300      1.3300
+     48.1000   1452.5200     32.4100      1.3300
+     48.3000   1452.5400     32.4300      1.3300
+     48.4000   1452.5500     32.4300      1.3300
+     48.5000   1452.5500     32.4300      1.3300
+     48.7000   1452.5200     32.4100      1.3300
+     48.8000   1452.5100     32.4300      1.3200
+     49.0000   1452.5400     32.4100      1.3300
+     49.1000   1452.5200     32.4300      1.3200
+     49.2000   1452.5700     32.4300      1.3300
+     49.4000   1452.5700     32.4300      1.3300
+     49.5000   1452.5200     32.4300      1.3200
+     49.6000   1452.5300     32.4300      1.3200
+     49.8000   1452.5100     32.4200      1.3200
+     49.9000   1452.5100     32.4200      1.3200
+     50.0000   1452.5100     32.4200      1.3200
+     50.2000   1452.5200     32.4200      1.3200
+     50.3000   1452.5200     32.4200      1.3200
+     50.5000   1452.5200     32.4200      1.3200
+     50.6000   1452.5200     32.4200      1.3200
+     50.7000   1452.5200     32.4200      1.3200
+     50.9000   1452.4800     32.4200      1.3100
+     51.0000   1452.4900     32.4200      1.3100
+     51.1000   1452.5000     32.4300      1.3100
+     51.3000   1452.5500     32.4300      1.3200
+     51.4000   1452.5400     32.4200      1.3200
+     51.5000   1452.4900     32.4200      1.3100
+     51.7000   1452.5000     32.4200      1.3100
+     51.8000   1452.4600     32.4300      1.3000
+     52.0000   1452.4300     32.4300      1.2900
+     52.1000   1452.4200     32.4300      1.2900
+     52.2000   1452.3800     32.4300      1.2800
+     52.4000   1452.3900     32.4400      1.2800
+     52.5000   1452.4000     32.4400      1.2800
+     52.6000   1452.4000     32.4400      1.2800
+     52.8000   1452.3600     32.4400      1.2700
+     52.9000   1452.3700     32.4500      1.2700
+     53.0000   1452.3700     32.4500      1.2700
+     53.2000   1452.3300     32.4500      1.2600
+     53.3000   1452.3400     32.4600      1.2600
+     53.5000   1452.3500     32.4600      1.2600
+     53.6000   1452.3000     32.4600      1.2500
+     53.7000   1452.3600     32.4700      1.2600
+     53.9000   1452.3200     32.4700      1.2500
+     54.0000   1452.3600     32.4700      1.2600
+     54.1000   1452.3200     32.4700      1.2500
+     54.3000   1452.3200     32.4700      1.2500
+     54.4000   1452.3300     32.4700      1.2500
+     54.6000   1452.3300     32.4700      1.2500
+     54.7000   1452.3600     32.4900      1.2500
+     54.8000   1452.3600     32.4900      1.2500
+     55.0000   1452.3600     32.4900      1.2500
+     55.1000   1452.3700     32.4900      1.2500
+     55.2000   1452.3700     32.4900      1.2500
+     55.4000   1452.3700     32.4900      1.2500
+     55.5000   1452.3500     32.4700      1.2500
+     55.6000   1452.3800     32.4900      1.2500
+     55.8000   1452.3800     32.4900      1.2500
+     55.9000   1452.3300     32.4900      1.2400
+     56.1000   1452.3900     32.5000      1.2500
+     56.2000   1452.3700     32.4800      1.2500
+     56.3000   1452.3400     32.4900      1.2400
+     56.5000   1452.3500     32.5000      1.2400
+     56.6000   1452.3600     32.5000      1.2400
+     56.7000   1452.3300     32.4800      1.2400
+     56.9000   1452.3400     32.4800      1.2400
+     57.0000   1452.2900     32.4800      1.2300
+     57.1000   1452.3000     32.4900      1.2300
+     57.3000   1452.2600     32.4900      1.2200
+     57.4000   1452.2300     32.5000      1.2100
+     57.6000   1452.2000     32.5100      1.2000
+     57.7000   1452.1400     32.5000      1.1900
+     57.8000   1452.0900     32.4900      1.1800
+     58.0000   1452.0600     32.5000      1.1700
+     58.1000   1452.0000     32.4900      1.1600
+     58.2000   1452.0200     32.5000      1.1600
+     58.4000   1451.9500     32.4900      1.1500
+     58.5000   1451.9600     32.5000      1.1500
+     58.6000   1451.9700     32.5000      1.1500
+     58.8000   1451.9300     32.5000      1.1400
+     58.9000   1451.9400     32.5100      1.1400
+     59.1000   1451.9000     32.5100      1.1300
+     59.2000   1451.9100     32.5200      1.1300
+     59.3000   1451.8500     32.5000      1.1200
+     59.5000   1451.8600     32.5100      1.1200
+     59.6000   1451.8700     32.5100      1.1200
+     59.7000   1451.8700     32.5100      1.1200
+     59.9000   1451.8700     32.5100      1.1200
+     60.0000   1451.8700     32.5100      1.1200
+     60.1000   1451.8700     32.5100      1.1200
+     60.3000   1451.8800     32.5100      1.1200
+     60.4000   1451.8800     32.5100      1.1200
+     60.6000   1451.8800     32.5100      1.1200
+     60.7000   1451.8800     32.5100      1.1200
+     60.8000   1451.8800     32.5100      1.1200
+     61.0000   1451.9300     32.5100      1.1300
+     61.1000   1451.8800     32.5100      1.1200
+     61.2000   1451.9300     32.5100      1.1300
+     61.4000   1451.9300     32.5100      1.1300
+     61.5000   1451.9300     32.5000      1.1300
+     61.6000   1451.9500     32.5200      1.1300
+     61.8000   1451.9600     32.5200      1.1300
+     61.9000   1451.9600     32.5200      1.1300
+     62.1000   1451.9600     32.5200      1.1300
+     62.2000   1451.9800     32.5000      1.1400
+     62.3000   1451.9600     32.5100      1.1300
+     62.5000   1451.9600     32.5100      1.1300
+     62.6000   1451.9700     32.5200      1.1300
+     62.7000   1451.9700     32.5200      1.1300
+     62.9000   1451.9700     32.5200      1.1300
+     63.0000   1451.9800     32.5200      1.1300
+     63.1000   1451.9800     32.5200      1.1300
+     63.3000   1451.9800     32.5200      1.1300
+     63.4000   1451.9800     32.5200      1.1300
+     63.6000   1451.9800     32.5200      1.1300
+     63.7000   1451.9900     32.5200      1.1300
+     63.8000   1451.9600     32.5000      1.1300
+     64.0000   1451.9900     32.5200      1.1300
+     64.1000   1451.9500     32.5200      1.1200
+     64.2000   1451.9800     32.5100      1.1300
+     64.4000   1452.0000     32.5200      1.1300
+     64.5000   1451.9300     32.5000      1.1200
+     64.6000   1451.9800     32.5100      1.1300
+     64.8000   1452.0100     32.5200      1.1300
+     64.9000   1452.0100     32.5200      1.1300
+     65.0000   1451.9800     32.5000      1.1300
+     65.2000   1451.9600     32.5200      1.1200
+     65.3000   1452.0200     32.5200      1.1300
+     65.5000   1451.9700     32.5200      1.1200
+     65.6000   1452.0000     32.5000      1.1300
+     65.7000   1452.0000     32.5000      1.1300
+     65.9000   1451.9700     32.5200      1.1200
+     66.0000   1452.0300     32.5200      1.1300
+     66.1000   1451.9600     32.5000      1.1200
+     66.3000   1452.0100     32.5000      1.1300
+     66.4000   1452.0100     32.5000      1.1300
+     66.5000   1451.9600     32.5000      1.1200
+     66.7000   1452.0100     32.5000      1.1300
+     66.8000   1452.0000     32.5200      1.1200
+     67.0000   1452.0200     32.5000      1.1300
+     67.1000   1452.0200     32.5000      1.1300
+     67.2000   1451.9700     32.5000      1.1200
+     67.4000   1452.0500     32.5200      1.1300
+     67.5000   1452.0100     32.5200      1.1200
+     67.6000   1452.0500     32.5200      1.1300
+     67.8000   1452.0300     32.5000      1.1300
+     67.9000   1452.0100     32.5200      1.1200
+     68.0000   1452.0600     32.5200      1.1300
+     68.2000   1452.0200     32.5200      1.1200
+     68.3000   1452.0700     32.5200      1.1300
+     68.5000   1452.0400     32.5000      1.1300
+     68.6000   1452.0200     32.5200      1.1200
+     68.7000   1452.0700     32.5200      1.1300
+     68.9000   1452.0300     32.5200      1.1200
+     69.0000   1452.0800     32.5200      1.1300
+     69.1000   1452.0500     32.5000      1.1300
+     69.3000   1452.0300     32.5200      1.1200
+     69.4000   1452.0800     32.5200      1.1300
+     69.5000   1452.0400     32.5200      1.1200
+     69.7000   1452.0900     32.5200      1.1300
+     69.8000   1452.0600     32.5000      1.1300
+     70.0000   1452.0400     32.5200      1.1200
+     70.1000   1452.0900     32.5200      1.1300
+     70.2000   1452.0500     32.5200      1.1200
+     70.4000   1452.0700     32.5000      1.1300
+     70.5000   1452.1000     32.5200      1.1300
+     70.6000   1452.0500     32.5200      1.1200
+     70.8000   1452.0800     32.5000      1.1300
+     70.9000   1452.0600     32.5200      1.1200
+     71.0000   1452.0600     32.5200      1.1200
+     71.2000   1452.0700     32.5300      1.1200
+     71.3000   1452.0000     32.5100      1.1100
+     71.5000   1452.0100     32.5100      1.1100
+     71.6000   1451.9500     32.5000      1.1000
+     71.7000   1451.9100     32.5000      1.0900
+     71.9000   1451.8800     32.5100      1.0700
+     72.0000   1451.8000     32.5300      1.0500
+     72.1000   1451.8000     32.5200      1.0500
+     72.3000   1451.7400     32.5100      1.0400
+     72.4000   1451.7500     32.5200      1.0400
+     72.5000   1451.7200     32.5200      1.0300
+     72.7000   1451.7000     32.5100      1.0300
+     72.8000   1451.7100     32.5200      1.0300
+     73.0000   1451.6600     32.5200      1.0200
+     73.1000   1451.7200     32.5200      1.0300
+     73.2000   1451.7200     32.5200      1.0300
+     73.4000   1451.6700     32.5200      1.0200
+     73.5000   1451.6800     32.5200      1.0200
+     73.6000   1451.6900     32.5300      1.0200
+     73.8000   1451.6900     32.5300      1.0200
+     73.9000   1451.6900     32.5300      1.0200
+     74.0000   1451.7000     32.5300      1.0200
+     74.2000   1451.7000     32.5300      1.0200
+     74.3000   1451.7000     32.5300      1.0200
+     74.5000   1451.7000     32.5300      1.0200
+     74.6000   1451.7000     32.5300      1.0200
+     74.7000   1451.7100     32.5300      1.0200
+     74.9000   1451.7100     32.5300      1.0200
+     75.0000   1451.6600     32.5300      1.0100
+     75.1000   1451.7200     32.5300      1.0200
+     75.3000   1451.7200     32.5300      1.0200
+     75.4000   1451.6700     32.5300      1.0100
+     75.5000   1451.6800     32.5300      1.0100
+     75.7000   1451.6900     32.5400      1.0100
+     75.8000   1451.6400     32.5400      1.0000
+     75.9000   1451.5800     32.5200      0.9900
+     76.1000   1451.5500     32.5300      0.9800
+     76.2000   1451.5700     32.5400      0.9800
+     76.4000   1451.5000     32.5300      0.9700
+     76.5000   1451.5100     32.5300      0.9700
+     76.6000   1451.5200     32.5400      0.9700
+     76.8000   1451.4800     32.5400      0.9600
+     76.9000   1451.4900     32.5500      0.9600
+     77.0000   1451.4200     32.5300      0.9500
+     77.2000   1451.4300     32.5400      0.9500
+     77.3000   1451.4000     32.5400      0.9400
+     77.4000   1451.3300     32.5300      0.9300
+     77.6000   1451.3500     32.5400      0.9300
+     77.7000   1451.3600     32.5400      0.9300
+     77.9000   1451.3600     32.5400      0.9300
+     78.0000   1451.3600     32.5400      0.9300
+     78.1000   1451.3200     32.5400      0.9200
+     78.3000   1451.3700     32.5500      0.9300
+     78.4000   1451.3000     32.5300      0.9200
+     78.5000   1451.3800     32.5500      0.9300
+     78.7000   1451.3800     32.5500      0.9300
+     78.8000   1451.3300     32.5400      0.9200
+     78.9000   1451.3100     32.5300      0.9200
+     79.1000   1451.3200     32.5400      0.9200
+     79.2000   1451.4000     32.5500      0.9300
+     79.4000   1451.3600     32.5300      0.9300
+     79.5000   1451.3100     32.5200      0.9200
+     79.6000   1451.3500     32.5500      0.9200
+     79.8000   1451.3100     32.5500      0.9100
+     79.9000   1451.2900     32.5400      0.9100
+     80.0000   1451.3000     32.5500      0.9100
+     80.2000   1451.3100     32.5500      0.9100
+     80.3000   1451.3100     32.5500      0.9100
+     80.4000   1451.3100     32.5500      0.9100
+     80.6000   1451.3100     32.5500      0.9100
+     80.7000   1451.3100     32.5500      0.9100
+     80.9000   1451.3200     32.5500      0.9100
+     81.0000   1451.3200     32.5400      0.9100
+     81.1000   1451.3200     32.5400      0.9100
+     81.3000   1451.3200     32.5400      0.9100
+     81.4000   1451.3200     32.5400      0.9100
+     81.5000   1451.3300     32.5400      0.9100
+     81.7000   1451.3300     32.5400      0.9100
+     81.8000   1451.2800     32.5400      0.9000
+     81.9000   1451.2900     32.5500      0.9000
+     82.1000   1451.3000     32.5600      0.9000
+     82.2000   1451.2600     32.5600      0.8900
+     82.3000   1451.2400     32.5400      0.8900
+     82.5000   1451.1600     32.5500      0.8700
+     82.6000   1451.1700     32.5600      0.8700
+     82.8000   1451.1200     32.5500      0.8600
+     82.9000   1451.0300     32.5500      0.8400
+     83.0000   1451.0600     32.5700      0.8400
+     83.2000   1451.0500     32.5600      0.8400
+     83.3000   1451.0500     32.5600      0.8400
+     83.4000   1451.0500     32.5600      0.8400
+     83.6000   1451.0100     32.5600      0.8300
+     83.7000   1451.0100     32.5700      0.8300
+     83.8000   1451.0000     32.5500      0.8300
+     84.0000   1451.0000     32.5500      0.8300
+     84.1000   1451.0300     32.5700      0.8300
+     84.3000   1450.9600     32.5500      0.8100
+     84.4000   1451.0100     32.5600      0.8300
+     84.5000   1450.9700     32.5600      0.8100
+     84.7000   1450.9700     32.5600      0.8100
+     84.8000   1450.9800     32.5600      0.8100
+     84.9000   1450.9400     32.5600      0.8000
+     85.1000   1450.9400     32.5700      0.8000
+     85.2000   1450.8800     32.5500      0.7900
+     85.3000   1450.8900     32.5600      0.7900
+     85.5000   1450.9000     32.5700      0.7900
+     85.6000   1450.9000     32.5700      0.7900
+     85.8000   1450.9000     32.5700      0.7900
+     85.9000   1450.9100     32.5700      0.7900
+     86.0000   1450.9100     32.5700      0.7900
+     86.2000   1450.9100     32.5700      0.7900
+     86.3000   1450.8700     32.5700      0.7800
+     86.4000   1450.9200     32.5700      0.7900
+     86.6000   1450.8800     32.5700      0.7800
+     86.7000   1450.9300     32.5700      0.7900
+     86.8000   1450.9300     32.5700      0.7900
+     87.0000   1450.8800     32.5600      0.7800
+     87.1000   1450.8900     32.5700      0.7800
+     87.2000   1450.8900     32.5800      0.7800
+     87.4000   1450.9000     32.5800      0.7800
+     87.5000   1450.9000     32.5800      0.7800
+     87.7000   1450.8500     32.5800      0.7700
+     87.8000   1450.8400     32.5600      0.7700
+     87.9000   1450.8500     32.5700      0.7700
+     88.1000   1450.8500     32.5700      0.7700
+     88.2000   1450.8000     32.5700      0.7600
+     88.3000   1450.8100     32.5700      0.7600
+     88.5000   1450.7700     32.5800      0.7500
+     88.6000   1450.7400     32.5800      0.7400
+     88.7000   1450.7500     32.5900      0.7400
+     88.9000   1450.7400     32.5800      0.7400
+     89.0000   1450.6900     32.5800      0.7300
+     89.2000   1450.7000     32.5900      0.7300
+     89.3000   1450.6600     32.5900      0.7200
+     89.4000   1450.6700     32.6000      0.7200
+     89.6000   1450.6600     32.5800      0.7200
+     89.7000   1450.6100     32.5800      0.7100
+     89.8000   1450.6200     32.5900      0.7100
+     90.0000   1450.6300     32.5900      0.7100
+     90.1000   1450.6300     32.5900      0.7100
+     90.2000   1450.5900     32.5900      0.7000
+     90.4000   1450.6000     32.6000      0.7000
+     90.5000   1450.5800     32.5800      0.7000
+     90.6000   1450.5300     32.5800      0.6900
+     90.8000   1450.5400     32.5900      0.6900
+     90.9000   1450.5500     32.5900      0.6900
+     91.1000   1450.5100     32.5900      0.6800
+     91.2000   1450.4700     32.6000      0.6700
+     91.3000   1450.4400     32.6100      0.6600
+     91.5000   1450.3800     32.6000      0.6500
+     91.6000   1450.3700     32.5900      0.6500
+     91.7000   1450.3400     32.6000      0.6400
+     91.9000   1450.3900     32.6000      0.6500
+     92.0000   1450.3900     32.6000      0.6500
+     92.1000   1450.4400     32.6000      0.6600
+     92.3000   1450.4600     32.6100      0.6600
+     92.4000   1450.4500     32.6100      0.6600
+     92.6000   1450.5000     32.6100      0.6700
+     92.7000   1450.5000     32.6000      0.6700
+     92.8000   1450.5600     32.6200      0.6800
+     93.0000   1450.5600     32.6100      0.6800
+     93.1000   1450.5100     32.6000      0.6700
+     93.2000   1450.5900     32.6300      0.6800
+     93.4000   1450.5200     32.6100      0.6700
+     93.5000   1450.5200     32.6100      0.6700
+     93.6000   1450.5300     32.6200      0.6700
+     93.8000   1450.5300     32.6200      0.6700
+     93.9000   1450.5300     32.6100      0.6700
+     94.0000   1450.4900     32.6100      0.6600
+     94.2000   1450.5500     32.6200      0.6700
+     94.3000   1450.5500     32.6200      0.6700
+     94.5000   1450.4900     32.6100      0.6600
+     94.6000   1450.5000     32.6200      0.6600
+     94.7000   1450.4700     32.6300      0.6500
+     94.9000   1450.4800     32.6300      0.6500
+     95.0000   1450.4600     32.6200      0.6500
+     95.1000   1450.4400     32.6400      0.6400
+     95.3000   1450.4500     32.6400      0.6400
+     95.4000   1450.3900     32.6300      0.6300
+     95.5000   1450.3700     32.6100      0.6300
+     95.7000   1450.3300     32.6200      0.6200
+     95.8000   1450.3400     32.6200      0.6200
+     96.0000   1450.3000     32.6300      0.6100
+     96.1000   1450.2600     32.6400      0.6000
+     96.2000   1450.2800     32.6500      0.6000
+     96.4000   1450.2600     32.6300      0.6000
+     96.5000   1450.2200     32.6300      0.5900
+     96.6000   1450.2000     32.6200      0.5900
+     96.8000   1450.1900     32.6400      0.5700
+     96.9000   1450.1300     32.6300      0.5600
+     97.0000   1450.0900     32.6400      0.5500
+     97.2000   1450.0400     32.6300      0.5400
+     97.3000   1450.0500     32.6400      0.5400
+     97.4000   1449.9900     32.6300      0.5300
+     97.6000   1449.9500     32.6300      0.5200
+     97.7000   1449.9400     32.6300      0.5200
+     97.9000   1449.9000     32.6300      0.5100
+     98.0000   1449.9100     32.6400      0.5100
+     98.1000   1449.9200     32.6400      0.5100
+     98.3000   1449.9300     32.6400      0.5100
+     98.4000   1449.8500     32.6200      0.5000
+     98.5000   1449.8200     32.6300      0.4900
+     98.7000   1449.8300     32.6400      0.4900
+     98.8000   1449.7900     32.6400      0.4800
+     98.9000   1449.7800     32.6300      0.4800
+     99.1000   1449.7900     32.6400      0.4800
+     99.2000   1449.7400     32.6400      0.4700
+     99.3000   1449.7500     32.6400      0.4700
+     99.5000   1449.6900     32.6300      0.4600
+     99.6000   1449.7000     32.6300      0.4600
+     99.8000   1449.7100     32.6400      0.4600
+     99.9000   1449.7100     32.6400      0.4600
+    100.0000   1449.7100     32.6400      0.4600
+    100.2000   1449.6400     32.6200      0.4500
+    100.3000   1449.6700     32.6400      0.4500
+    100.4000   1449.6800     32.6500      0.4500
+    100.6000   1449.6100     32.6300      0.4400
+    100.7000   1449.6700     32.6300      0.4500
+    100.8000   1449.6200     32.6300      0.4400
+    101.0000   1449.6200     32.6300      0.4400
+    101.1000   1449.6300     32.6400      0.4400
+    101.3000   1449.6400     32.6400      0.4400
+    101.4000   1449.6400     32.6400      0.4400
+    101.5000   1449.5900     32.6400      0.4300
+    101.7000   1449.5800     32.6200      0.4300
+    101.8000   1449.5900     32.6300      0.4300
+    101.9000   1449.5400     32.6300      0.4200
+    102.1000   1449.6000     32.6400      0.4300
+    102.2000   1449.5500     32.6400      0.4200
+    102.3000   1449.5500     32.6400      0.4200
+    102.5000   1449.5600     32.6400      0.4200
+    102.6000   1449.5200     32.6400      0.4100
+    102.7000   1449.5300     32.6500      0.4100
+    102.9000   1449.5400     32.6500      0.4100
+    103.0000   1449.5100     32.6300      0.4100
+    103.2000   1449.4700     32.6300      0.4000
+    103.3000   1449.4800     32.6400      0.4000
+    103.4000   1449.4800     32.6400      0.4000
+    103.6000   1449.4900     32.6400      0.4000
+    103.7000   1449.4900     32.6400      0.4000
+    103.8000   1449.4400     32.6400      0.3900
+    104.0000   1449.4500     32.6500      0.3900
+    104.1000   1449.4600     32.6500      0.3900
+    104.2000   1449.4200     32.6500      0.3800
+    104.4000   1449.4000     32.6400      0.3800
+    104.5000   1449.4100     32.6500      0.3800
+    104.6000   1449.3900     32.6600      0.3700
+    104.8000   1449.3700     32.6500      0.3700
+    104.9000   1449.3300     32.6600      0.3500
+    105.1000   1449.3400     32.6600      0.3500
+    105.2000   1449.3000     32.6700      0.3400
+    105.3000   1449.2400     32.6500      0.3300
+    105.5000   1449.2600     32.6600      0.3300
+    105.6000   1449.2200     32.6700      0.3200
+    105.7000   1449.2300     32.6700      0.3200
+    105.9000   1449.1600     32.6600      0.3100
+    106.0000   1449.1700     32.6700      0.3100
+    106.1000   1449.1800     32.6700      0.3100
+    106.3000   1449.1400     32.6700      0.3000
+    106.4000   1449.1000     32.6800      0.2900
+    106.6000   1449.1100     32.6900      0.2900
+    106.7000   1449.0500     32.6700      0.2800
+    106.8000   1449.0600     32.6800      0.2800
+    107.0000   1448.9900     32.6700      0.2700
+    107.1000   1449.0000     32.6700      0.2700
+    107.2000   1448.9700     32.6800      0.2600
+    107.4000   1448.9300     32.6800      0.2500
+    107.5000   1448.8700     32.6700      0.2400
+    107.6000   1448.8400     32.6800      0.2300
+    107.8000   1448.8100     32.7000      0.2200
+    107.9000   1448.7500     32.6900      0.2100
+    108.0000   1448.6900     32.6800      0.2000
+    108.2000   1448.7100     32.6900      0.2000
+    108.3000   1448.6400     32.6800      0.1900
+    108.5000   1448.6500     32.6800      0.1900
+    108.6000   1448.6600     32.6900      0.1900
+    108.7000   1448.6200     32.6900      0.1800
+    108.9000   1448.6500     32.6700      0.1900
+    109.0000   1448.6000     32.6700      0.1800
+    109.1000   1448.6300     32.6900      0.1800
+    109.3000   1448.6100     32.6800      0.1800
+    109.4000   1448.6100     32.6800      0.1800
+    109.5000   1448.6200     32.6800      0.1800
+    109.7000   1448.6200     32.6800      0.1800
+    109.8000   1448.6200     32.6800      0.1800
+    109.9000   1448.6200     32.6800      0.1800
+    110.1000   1448.6700     32.6800      0.1900
+    110.2000   1448.6900     32.6900      0.1900
+    110.4000   1448.6900     32.6900      0.1900
+    110.5000   1448.7400     32.6900      0.2000
+    110.6000   1448.7600     32.7000      0.2000
+    110.8000   1448.7100     32.6900      0.1900
+    110.9000   1448.7700     32.7000      0.2000
+    111.0000   1448.6900     32.6800      0.1900
+    111.2000   1448.7200     32.7000      0.1900
+    111.3000   1448.7000     32.6800      0.1900
+    111.4000   1448.7300     32.7000      0.1900
+    111.6000   1448.6600     32.6800      0.1800
+    111.7000   1448.6700     32.6900      0.1800
+    111.8000   1448.6300     32.7000      0.1700
+    112.0000   1448.6400     32.7000      0.1700
+    112.1000   1448.6000     32.7100      0.1500
+    112.3000   1448.5800     32.6900      0.1500
+    112.4000   1448.5500     32.7000      0.1400
+    112.5000   1448.5100     32.7000      0.1300
+    112.7000   1448.5000     32.6900      0.1300
+    112.8000   1448.4600     32.7000      0.1200
+    112.9000   1448.4700     32.7100      0.1200
+    113.1000   1448.4800     32.7100      0.1200
+    113.2000   1448.4800     32.7100      0.1200
+    113.3000   1448.4800     32.7100      0.1200
+    113.5000   1448.4400     32.7100      0.1100
+    113.6000   1448.4500     32.7200      0.1100
+    113.7000   1448.4100     32.7200      0.1000
+    113.9000   1448.3900     32.7100      0.1000
+    114.0000   1448.4000     32.7100      0.1000
+    114.2000   1448.3500     32.7100      0.0900
+    114.3000   1448.4100     32.7200      0.1000
+    114.4000   1448.3600     32.7200      0.0900
+    114.6000   1448.3700     32.7200      0.0900
+    114.7000   1448.3800     32.7200      0.0900
+    114.8000   1448.3300     32.7200      0.0800
+    115.0000   1448.2900     32.7300      0.0700
+    115.1000   1448.2300     32.7200      0.0600
+    115.2000   1448.2000     32.7300      0.0500
+    115.4000   1448.0900     32.7200      0.0300
+    115.5000   1447.9900     32.7200      0.0100
+    115.6000   1448.0300     32.7400      0.0100
+    115.8000   1447.9400     32.7200      0.0000
+    115.9000   1447.9500     32.7200      0.0000
+    116.1000   1447.9600     32.7300      0.0000
+    116.2000   1447.9200     32.7300     -0.0100
+    116.3000   1447.9000     32.7100     -0.0100
+    116.5000   1447.9100     32.7200     -0.0100
+    116.6000   1447.9100     32.7200     -0.0100
+    116.7000   1447.8600     32.7200     -0.0200
+    116.9000   1447.8700     32.7200     -0.0200
+    117.0000   1447.8800     32.7300     -0.0200
+    117.1000   1447.8400     32.7300     -0.0400
+    117.3000   1447.8500     32.7300     -0.0400
+    117.4000   1447.8300     32.7200     -0.0400
+    117.5000   1447.7800     32.7200     -0.0500
+    117.7000   1447.7600     32.7100     -0.0500
+    117.8000   1447.8000     32.7300     -0.0500
+    118.0000   1447.8000     32.7300     -0.0500
+    118.1000   1447.7300     32.7100     -0.0600
+    118.2000   1447.7400     32.7200     -0.0600
+    118.4000   1447.7500     32.7200     -0.0600
+    118.5000   1447.6500     32.7200     -0.0800
+    118.6000   1447.6700     32.7300     -0.0800
+    118.8000   1447.6900     32.7400     -0.0800
+    118.9000   1447.6100     32.7200     -0.0900
+    119.0000   1447.6000     32.7100     -0.0900
+    119.2000   1447.6300     32.7400     -0.0900
+    119.3000   1447.6400     32.7400     -0.0900
+    119.4000   1447.6400     32.7400     -0.0900
+    119.6000   1447.6400     32.7400     -0.0900
+    119.7000   1447.6400     32.7400     -0.0900
+    119.9000   1447.6400     32.7400     -0.0900
+    120.0000   1447.6500     32.7300     -0.0900
+    120.1000   1447.6500     32.7300     -0.0900
+    120.3000   1447.6500     32.7300     -0.0900
+    120.4000   1447.6500     32.7300     -0.0900
+    120.5000   1447.5800     32.7100     -0.1000
+    120.7000   1447.6600     32.7400     -0.0900
+    120.8000   1447.6700     32.7400     -0.0900
+    120.9000   1447.6600     32.7300     -0.0900
+    121.1000   1447.6400     32.7100     -0.0900
+    121.2000   1447.6700     32.7300     -0.0900
+    121.3000   1447.6700     32.7300     -0.0900
+    121.5000   1447.6700     32.7300     -0.0900
+    121.6000   1447.6700     32.7300     -0.0900
+    121.8000   1447.7200     32.7300     -0.0800
+    121.9000   1447.6700     32.7300     -0.0900
+    122.0000   1447.7500     32.7500     -0.0800
+    122.2000   1447.7500     32.7500     -0.0800
+    122.3000   1447.7400     32.7400     -0.0800
+    122.4000   1447.7400     32.7400     -0.0800
+    122.6000   1447.8000     32.7400     -0.0700
+    122.7000   1447.8400     32.7400     -0.0600
+    122.8000   1447.8300     32.7200     -0.0600
+    123.0000   1447.8500     32.7400     -0.0600
+    123.1000   1447.8500     32.7400     -0.0600
+    123.2000   1447.7500     32.7400     -0.0800
+    123.4000   1447.7200     32.7500     -0.0900
+    123.5000   1447.6500     32.7700     -0.1100
+    123.7000   1447.6000     32.7600     -0.1200
+    123.8000   1447.5000     32.7600     -0.1400
+    123.9000   1447.3700     32.7400     -0.1600
+    124.1000   1447.3100     32.7600     -0.1800
+    124.2000   1447.2100     32.7600     -0.2000
+    124.3000   1447.0400     32.7500     -0.2400
+    124.5000   1446.9600     32.7500     -0.2600
+    124.6000   1446.8700     32.7600     -0.2800
+    124.7000   1446.7600     32.7500     -0.3000
+    124.9000   1446.6600     32.7500     -0.3200
+    125.0000   1446.5700     32.7500     -0.3400
+    125.1000   1446.5000     32.7700     -0.3600
+    125.3000   1446.3300     32.7600     -0.4000
+    125.4000   1446.1700     32.7500     -0.4300
+    125.6000   1445.9900     32.7600     -0.4700
+    125.7000   1445.7700     32.7800     -0.5200
+    125.8000   1445.6100     32.7700     -0.5600
+    126.0000   1445.4700     32.7800     -0.5900
+    126.1000   1445.2600     32.7300     -0.6200
+    126.2000   1445.0900     32.7400     -0.6600
+    126.4000   1444.8600     32.7700     -0.7200
+    126.5000   1444.7100     32.8000     -0.7600
+    126.6000   1444.5500     32.7900     -0.7900
+    126.8000   1444.2900     32.7500     -0.8300
+    126.9000   1443.8400     32.7500     -0.9300
+    127.0000   1443.4900     32.8200     -1.0300
+    127.2000   1443.2200     32.8500     -1.0900
+    127.3000   1442.8600     32.7700     -1.1400
+    127.5000   1442.6600     32.7300     -1.1800
+    127.6000   1442.4600     32.7400     -1.2200
+    127.7000   1442.3400     32.7600     -1.2500
+    127.9000   1442.2400     32.7600     -1.2700
+    128.0000   1442.1200     32.7500     -1.3000
+    128.1000   1442.0200     32.7500     -1.3200
+    128.3000   1441.9800     32.7500     -1.3300
+    128.4000   1441.9300     32.7500     -1.3400
+    128.5000   1441.9200     32.7400     -1.3400
+    128.7000   1441.8800     32.7500     -1.3500
+    128.8000   1441.8900     32.7500     -1.3500
+    128.9000   1441.9000     32.7600     -1.3500
+    129.1000   1441.8200     32.7400     -1.3600
+    129.2000   1441.8300     32.7500     -1.3600
+    129.4000   1441.8400     32.7500     -1.3600
+    129.5000   1441.7800     32.6700     -1.3500
+    129.6000   1441.8900     32.7500     -1.3500
+    129.8000   1441.8800     32.7400     -1.3500
+    129.9000   1441.9100     32.7600     -1.3500
+    130.0000   1441.8600     32.7600     -1.3600
+    130.2000   1441.8700     32.7700     -1.3600
+    130.3000   1441.8800     32.7700     -1.3600
+    130.4000   1441.8300     32.7700     -1.3700
+    130.6000   1441.8100     32.7600     -1.3700
+    130.7000   1441.8000     32.7800     -1.3800
+    130.8000   1441.7800     32.7700     -1.3800
+    131.0000   1441.7900     32.7700     -1.3800
+    131.1000   1441.7400     32.7700     -1.3900
+    131.2000   1441.7500     32.7800     -1.3900
+    131.4000   1441.7600     32.7900     -1.3900
+    131.5000   1441.7600     32.7900     -1.3900
+    131.7000   1441.7700     32.7900     -1.3900
+    131.8000   1441.7700     32.7900     -1.3900
+    131.9000   1441.7700     32.7900     -1.3900
+    132.1000   1441.7200     32.7900     -1.4000
+    132.2000   1441.7800     32.7900     -1.3900
+    132.3000   1441.7300     32.7900     -1.4000
+    132.5000   1441.7400     32.7900     -1.4000
+    132.6000   1441.7500     32.8000     -1.4000
+    132.7000   1441.7500     32.8000     -1.4000
+    132.9000   1441.8000     32.8000     -1.3900
+    133.0000   1441.8500     32.7900     -1.3800
+    133.1000   1441.8300     32.7800     -1.3800
+    133.3000   1441.9100     32.7900     -1.3700
+    133.4000   1441.8500     32.7900     -1.3800
+    133.6000   1441.9300     32.8100     -1.3700
+    133.7000   1441.9300     32.8100     -1.3700
+    133.8000   1441.9300     32.8000     -1.3700
+    134.0000   1441.9300     32.8000     -1.3700
+    134.1000   1441.9300     32.8000     -1.3700
+    134.2000   1441.9300     32.8000     -1.3700
+    134.4000   1441.9400     32.8000     -1.3700
+    134.5000   1441.9400     32.8000     -1.3700
+    134.6000   1441.9400     32.8000     -1.3700
+    134.8000   1441.9400     32.8000     -1.3700
+    134.9000   1441.9400     32.8000     -1.3700
+    135.0000   1441.9500     32.8000     -1.3700
+    135.2000   1441.9800     32.8200     -1.3700
+    135.3000   1441.9500     32.8000     -1.3700
+    135.5000   1441.9500     32.8000     -1.3700
+    135.6000   1441.9800     32.8200     -1.3700
+    135.7000   1441.9800     32.8200     -1.3700
+    135.9000   1441.9600     32.8000     -1.3700
+    136.0000   1441.9900     32.8200     -1.3700
+    136.1000   1441.9400     32.8200     -1.3800
+    136.3000   1441.9500     32.8300     -1.3800
+    136.4000   1441.9300     32.8100     -1.3800
+    136.5000   1441.9900     32.8100     -1.3700
+    136.7000   1442.0800     32.8100     -1.3500
+    136.8000   1442.1400     32.8100     -1.3400
+    136.9000   1442.2300     32.8300     -1.3300
+    137.1000   1442.2600     32.8200     -1.3200
+    137.2000   1442.2800     32.8300     -1.3200
+    137.3000   1442.3500     32.8400     -1.3100
+    137.5000   1442.3400     32.8400     -1.3100
+    137.6000   1442.4200     32.8500     -1.3000
+    137.8000   1442.3600     32.8500     -1.3100
+    137.9000   1442.3600     32.8500     -1.3100
+    138.0000   1442.5300     32.8500     -1.2700
+    138.2000   1442.6800     32.8100     -1.2300
+    138.3000   1443.0200     32.7900     -1.1600
+    138.4000   1443.3900     32.7700     -1.0700
+    138.6000   1443.6700     32.7800     -1.0200
+    138.7000   1443.9400     32.8300     -0.9700
+    138.8000   1444.1400     32.9000     -0.9500
+    139.0000   1444.2200     32.8800     -0.9300
+    139.1000   1444.2700     32.8800     -0.9200
+    139.2000   1444.3200     32.8800     -0.9100
+    139.4000   1444.3900     32.8900     -0.9000
+    139.5000   1444.2700     32.8800     -0.9200
+    139.7000   1444.1300     32.8900     -0.9500
+    139.8000   1444.0000     32.9400     -0.9900
+    139.9000   1443.8500     32.9400     -1.0300
+    140.1000   1443.7200     32.9200     -1.0500
+    140.2000   1443.6100     32.9000     -1.0700
+    140.3000   1443.4800     32.8900     -1.0900
+    140.5000   1443.4400     32.8900     -1.1000
+    140.6000   1443.4400     32.8900     -1.1000
+    140.7000   1443.4500     32.8900     -1.1000
+    140.9000   1443.4000     32.8900     -1.1100
+    141.0000   1443.4600     32.9000     -1.1000
+    141.1000   1443.4600     32.9000     -1.1000
+    141.3000   1443.4800     32.9100     -1.1000
+    141.4000   1443.4800     32.9100     -1.1000
+    141.5000   1443.4900     32.9100     -1.1000
+    141.7000   1443.4900     32.9100     -1.1000
+    141.8000   1443.4900     32.9100     -1.1000
+    142.0000   1443.4900     32.9100     -1.1000
+    142.1000   1443.4900     32.9100     -1.1000
+    142.2000   1443.5000     32.9100     -1.1000
+    142.4000   1443.5000     32.9100     -1.1000
+    142.5000   1443.5000     32.9100     -1.1000
+    142.6000   1443.5000     32.9100     -1.1000
+    142.8000   1443.5100     32.9100     -1.1000
+    142.9000   1443.5100     32.9100     -1.1000
+    143.0000   1443.5100     32.9100     -1.1000
+    143.2000   1443.5100     32.9100     -1.1000
+    143.3000   1443.4600     32.9100     -1.1100
+    143.4000   1443.4700     32.9200     -1.1100
+    143.6000   1443.4800     32.9200     -1.1100
+    143.7000   1443.4800     32.9200     -1.1100
+    143.9000   1443.4900     32.9200     -1.1100
+    144.0000   1443.4400     32.9200     -1.1200
+    144.1000   1443.4500     32.9300     -1.1200
+    144.3000   1443.4600     32.9300     -1.1200
+    144.4000   1443.4100     32.9300     -1.1300
+    144.5000   1443.4200     32.9400     -1.1300
+    144.7000   1443.3500     32.9300     -1.1400
+    144.8000   1443.3600     32.9300     -1.1400
+    144.9000   1443.3200     32.9400     -1.1600
+    145.1000   1443.2800     32.9400     -1.1700
+    145.2000   1443.2700     32.9300     -1.1700
+    145.3000   1443.2300     32.9400     -1.1800
+    145.5000   1443.2400     32.9500     -1.1800
+    145.6000   1443.2200     32.9300     -1.1800
+    145.7000   1443.2200     32.9300     -1.1800
+    145.9000   1443.2000     32.9500     -1.1900
+    146.0000   1443.1800     32.9400     -1.1900
+    146.2000   1443.1400     32.9400     -1.2000
+    146.3000   1443.1500     32.9500     -1.2000
+    146.4000   1443.1600     32.9500     -1.2000
+    146.6000   1443.1100     32.9500     -1.2100
+    146.7000   1443.1200     32.9600     -1.2100
+    146.8000   1443.1300     32.9700     -1.2100
+    147.0000   1443.0800     32.9700     -1.2200
+    147.1000   1443.0900     32.9700     -1.2200
+    147.2000   1443.1000     32.9800     -1.2200
+    147.4000   1443.0000     32.9800     -1.2400
+    147.5000   1442.9700     32.9900     -1.2500
+    147.6000   1442.9200     32.9900     -1.2600
+    147.8000   1442.8600     32.9800     -1.2700
+    147.9000   1442.8700     32.9900     -1.2700
+    148.0000   1442.8000     32.9700     -1.2800
+    148.2000   1442.8200     32.9800     -1.2800
+    148.3000   1442.7700     32.9900     -1.3000
+    148.5000   1442.7800     32.9900     -1.3000
+    148.6000   1442.7900     33.0000     -1.3000
+    148.7000   1442.7700     32.9800     -1.3000
+    148.9000   1442.7700     32.9800     -1.3000
+    149.0000   1442.7700     32.9800     -1.3000
+    149.1000   1442.8000     33.0000     -1.3000
+    149.3000   1442.8600     33.0000     -1.2800
+    149.4000   1442.8500     32.9900     -1.2800
+    149.5000   1442.8400     32.9900     -1.2800
+    149.7000   1442.9000     32.9900     -1.2700
+    149.8000   1442.9700     33.0000     -1.2600
+    149.9000   1443.0100     32.9900     -1.2500
+    150.1000   1443.0500     32.9800     -1.2400
+    150.2000   1443.0600     32.9800     -1.2400
+    150.3000   1443.0800     33.0000     -1.2400
+    150.5000   1443.1300     33.0000     -1.2300
+    150.6000   1443.1300     32.9900     -1.2300
+    150.8000   1443.1500     33.0100     -1.2300
+    150.9000   1443.1200     32.9900     -1.2300
+    151.0000   1443.1500     33.0100     -1.2300
+    151.2000   1443.1600     33.0100     -1.2300
+    151.3000   1443.1600     33.0100     -1.2300
+    151.4000   1443.1600     33.0100     -1.2300
+    151.6000   1443.1600     33.0100     -1.2300
+    151.7000   1443.1400     32.9900     -1.2300
+    151.8000   1443.1700     33.0100     -1.2300
+    152.0000   1443.1400     32.9900     -1.2300
+    152.1000   1443.1700     33.0100     -1.2300
+    152.2000   1443.1700     33.0100     -1.2300
+    152.4000   1443.1500     32.9900     -1.2300
+    152.5000   1443.1800     33.0100     -1.2300
+    152.7000   1443.1800     33.0100     -1.2300
+    152.8000   1443.1800     33.0100     -1.2300
+    152.9000   1443.1800     33.0100     -1.2300
+    153.1000   1443.1600     32.9900     -1.2300
+    153.2000   1443.1900     33.0100     -1.2300
+    153.3000   1443.1900     33.0100     -1.2300
+    153.5000   1443.1900     33.0100     -1.2300
+    153.6000   1443.1900     33.0100     -1.2300
+    153.7000   1443.2000     33.0100     -1.2300
+    153.9000   1443.2000     33.0100     -1.2300
+    154.0000   1443.2000     33.0100     -1.2300
+    154.1000   1443.2000     33.0100     -1.2300
+    154.3000   1443.2000     33.0100     -1.2300
+    154.4000   1443.1600     33.0100     -1.2400
+    154.5000   1443.1700     33.0100     -1.2400
+    154.7000   1443.1800     33.0200     -1.2400
+    154.8000   1443.1800     33.0200     -1.2400
+    155.0000   1443.1800     33.0200     -1.2400
+    155.1000   1443.1000     33.0000     -1.2500
+    155.2000   1443.1400     33.0200     -1.2500
+    155.4000   1443.1500     33.0300     -1.2500
+    155.5000   1443.0700     33.0100     -1.2600
+    155.6000   1443.0800     33.0100     -1.2600
+    155.8000   1443.0900     33.0200     -1.2600
+    155.9000   1443.1000     33.0200     -1.2600
+    156.0000   1443.1000     33.0200     -1.2600
+    156.2000   1443.0500     33.0200     -1.2700
+    156.3000   1443.0600     33.0300     -1.2700
+    156.4000   1443.0200     33.0300     -1.2800
+    156.6000   1443.0800     33.0400     -1.2700
+    156.7000   1443.0000     33.0200     -1.2800
+    156.8000   1443.0000     33.0200     -1.2800
+    157.0000   1443.0100     33.0200     -1.2800
+    157.1000   1442.9700     33.0200     -1.3000
+    157.3000   1442.9500     33.0100     -1.3000
+    157.4000   1442.9600     33.0100     -1.3000
+    157.5000   1442.9900     33.0300     -1.3000
+    157.7000   1442.9600     33.0100     -1.3000
+    157.8000   1442.9100     33.0100     -1.3100
+    157.9000   1442.9200     33.0200     -1.3100
+    158.1000   1442.9300     33.0300     -1.3100
+    158.2000   1442.8800     33.0300     -1.3200
+    158.3000   1442.8900     33.0300     -1.3200
+    158.5000   1442.8200     33.0200     -1.3300
+    158.6000   1442.8100     33.0400     -1.3400
+    158.7000   1442.8000     33.0300     -1.3400
+    158.9000   1442.7600     33.0400     -1.3500
+    159.0000   1442.8200     33.0500     -1.3400
+    159.1000   1442.8200     33.0500     -1.3400
+    159.3000   1442.8700     33.0400     -1.3300
+    159.4000   1442.8600     33.0300     -1.3300
+    159.6000   1442.8800     33.0500     -1.3300
+    159.7000   1442.8900     33.0500     -1.3300
+    159.8000   1442.8900     33.0500     -1.3300
+    160.0000   1442.8900     33.0500     -1.3300
+    160.1000   1442.8900     33.0500     -1.3300
+    160.2000   1442.9200     33.0700     -1.3300
+    160.4000   1442.9000     33.0500     -1.3300
+    160.5000   1442.9000     33.0500     -1.3300
+    160.6000   1442.9000     33.0500     -1.3300
+    160.8000   1442.9000     33.0500     -1.3300
+    160.9000   1442.9300     33.0700     -1.3300
+    161.0000   1442.9100     33.0500     -1.3300
+    161.2000   1442.9100     33.0500     -1.3300
+    161.3000   1442.9100     33.0500     -1.3300
+    161.4000   1442.9100     33.0500     -1.3300
+    161.6000   1442.9400     33.0700     -1.3300
+    161.7000   1442.9500     33.0700     -1.3300
+    161.8000   1442.9200     33.0500     -1.3300
+    162.0000   1442.9500     33.0700     -1.3300
+    162.1000   1442.9500     33.0700     -1.3300
+    162.3000   1442.9500     33.0700     -1.3300
+    162.4000   1442.9300     33.0500     -1.3300
+    162.5000   1442.9300     33.0500     -1.3300
+    162.7000   1442.9600     33.0700     -1.3300
+    162.8000   1443.0100     33.0700     -1.3200
+    162.9000   1442.9600     33.0600     -1.3300
+    163.1000   1442.9800     33.0400     -1.3200
+    163.2000   1442.9600     33.0600     -1.3300
+    163.3000   1443.0100     33.0600     -1.3200
+    163.5000   1443.0200     33.0600     -1.3200
+    163.6000   1442.9600     33.0500     -1.3300
+    163.7000   1443.0200     33.0600     -1.3200
+    163.9000   1443.0200     33.0600     -1.3200
+    164.0000   1443.0200     33.0500     -1.3200
+    164.1000   1443.0200     33.0500     -1.3200
+    164.3000   1442.9700     33.0500     -1.3300
+    164.4000   1443.0300     33.0600     -1.3200
+    164.6000   1442.9800     33.0600     -1.3300
+    164.7000   1443.0400     33.0600     -1.3200
+    164.8000   1443.0400     33.0600     -1.3200
+    165.0000   1443.0300     33.0500     -1.3200
+    165.1000   1443.0300     33.0500     -1.3200
+    165.2000   1443.0400     33.0500     -1.3200
+    165.4000   1443.0400     33.0500     -1.3200
+    165.5000   1443.0400     33.0500     -1.3200
+    165.6000   1443.0400     33.0500     -1.3200
+    165.8000   1443.0400     33.0500     -1.3200
+    165.9000   1443.0500     33.0500     -1.3200
+    166.0000   1443.0500     33.0500     -1.3200
+    166.2000   1443.0500     33.0500     -1.3200
+    166.3000   1443.0500     33.0500     -1.3200
+    166.4000   1443.0500     33.0500     -1.3200
+    166.6000   1443.0600     33.0500     -1.3200
+    166.7000   1443.0600     33.0500     -1.3200
+    166.9000   1443.0600     33.0500     -1.3200
+    167.0000   1443.0600     33.0500     -1.3200
+    167.1000   1443.0600     33.0500     -1.3200
+    167.3000   1443.0700     33.0500     -1.3200
+    167.4000   1443.0700     33.0500     -1.3200
+    167.5000   1443.0700     33.0500     -1.3200
+    167.7000   1443.0700     33.0500     -1.3200
+    167.8000   1443.0800     33.0500     -1.3200
+    167.9000   1443.0300     33.0500     -1.3300
+    168.1000   1443.0900     33.0600     -1.3200
+    168.2000   1443.0900     33.0600     -1.3200
+    168.3000   1443.0800     33.0500     -1.3200
+    168.5000   1443.0900     33.0500     -1.3200
+    168.6000   1443.0900     33.0500     -1.3200
+    168.7000   1443.0900     33.0500     -1.3200
+    168.9000   1443.0900     33.0500     -1.3200
+    169.0000   1443.0900     33.0500     -1.3200
+    169.1000   1443.1000     33.0500     -1.3200
+    169.3000   1443.0500     33.0500     -1.3300
+    169.4000   1443.1100     33.0600     -1.3200
+    169.6000   1443.0600     33.0600     -1.3300
+    169.7000   1443.0600     33.0600     -1.3300
+    169.8000   1443.0700     33.0600     -1.3300
+    170.0000   1443.0700     33.0600     -1.3300
+    170.1000   1443.1000     33.0800     -1.3300
+    170.2000   1443.0800     33.0600     -1.3300
+    170.4000   1443.0800     33.0600     -1.3300
+    170.5000   1443.1100     33.0800     -1.3300
+    170.6000   1443.1100     33.0800     -1.3300
+    170.8000   1443.1100     33.0800     -1.3300
+    170.9000   1443.1200     33.0800     -1.3300
+    171.0000   1443.1200     33.0800     -1.3300
+    171.2000   1438.4200     29.6200     -1.3300
+    171.3000   1435.2200     27.2500     -1.3300
+    171.4000   1433.9400     26.2700     -1.3200
+    171.6000   1433.6300     26.0400     -1.3200
+    171.7000   1433.5200     25.9600     -1.3200
+    171.9000   1433.4700     25.9200     -1.3200
+    172.0000   1433.4400     25.9000     -1.3200
+    172.1000   1433.4700     25.8800     -1.3100
+    172.3000   1433.4900     25.8900     -1.3100
+    172.4000   1433.4600     25.8700     -1.3100
+    172.5000   1433.4700     25.8700     -1.3100
+    172.7000   1433.4700     25.8700     -1.3100
+    172.8000   1433.5500     25.8900     -1.3000
+    172.9000   1433.5700     25.9000     -1.3000
+    173.1000   1433.5900     25.9200     -1.3000
+    173.2000   1433.6200     25.9400     -1.3000
+    173.3000   1433.6300     25.9400     -1.3000
+    173.5000   1433.6300     25.9400     -1.3000
+    173.6000   1433.6600     25.9200     -1.2800
+    173.7000   1433.6000     25.9100     -1.3000
+    173.9000   1433.6000     25.8700     -1.2800
+    174.0000   1433.6000     25.8700     -1.2800
+    174.1000   1433.6000     25.8700     -1.2800
+    174.3000   1433.6000     25.8700     -1.2800
+    174.4000   1433.6000     25.8700     -1.2800
+    174.6000   1433.6600     25.8700     -1.2700
+    174.7000   1433.6000     25.8600     -1.2800
+    174.8000   1433.6800     25.8800     -1.2700
+    175.0000   1433.6800     25.8800     -1.2700
+    175.1000   1433.6800     25.8800     -1.2700
+    175.2000   1433.6800     25.8800     -1.2700
+    175.4000   1433.6800     25.8800     -1.2700
+    175.5000   1433.7600     25.9000     -1.2600
+    175.6000   1433.7600     25.8900     -1.2600
+    175.8000   1433.7000     25.8900     -1.2700
+    175.9000   1433.7600     25.8900     -1.2600
+    176.0000   1433.7700     25.8900     -1.2600
+    176.2000   1433.7600     25.8900     -1.2600
+    176.3000   1433.7900     25.9100     -1.2600
+    176.4000   1433.7900     25.9100     -1.2600
+    176.6000   1433.8000     25.9100     -1.2600
+    176.7000   1433.8000     25.9100     -1.2600
+    176.9000   1433.8500     25.9100     -1.2500
+    177.0000   1433.8700     25.9200     -1.2500
+    177.1000   1433.8200     25.9200     -1.2600
+    177.3000   1433.8800     25.9200     -1.2500
+    177.4000   1433.8800     25.9200     -1.2500
+    177.5000   1433.8800     25.9200     -1.2500
+    177.7000   1433.8800     25.9200     -1.2500
+    177.8000   1433.8800     25.9200     -1.2500
+    177.9000   1433.8800     25.9200     -1.2500
+    178.1000   1433.8800     25.9200     -1.2500
+    178.2000   1433.9700     25.9400     -1.2400
+    178.3000   1433.9600     25.9300     -1.2400
+    178.5000   1433.9100     25.9300     -1.2500
+    178.6000   1433.9700     25.9300     -1.2400
+    178.7000   1433.9700     25.9300     -1.2400
+    178.9000   1433.9600     25.9300     -1.2400
+    179.0000   1433.9700     25.9300     -1.2400
+    179.1000   1433.9700     25.9300     -1.2400
+    179.3000   1433.9700     25.9300     -1.2400
+    179.4000   1433.9700     25.9300     -1.2400
+    179.6000   1434.0300     25.9300     -1.2300
+    179.7000   1434.0200     25.9200     -1.2300
+    179.8000   1433.9900     25.9400     -1.2400
+    180.0000   1434.0500     25.9400     -1.2300
+    180.1000   1434.0600     25.9400     -1.2300
+    180.2000   1434.0500     25.9400     -1.2300
+    180.4000   1434.0500     25.9400     -1.2300
+    180.5000   1434.0600     25.9400     -1.2300
+    180.6000   1434.0600     25.9400     -1.2300
+    180.8000   1434.0600     25.9400     -1.2300
+    180.9000   1434.1100     25.9400     -1.2200
+    181.0000   1434.1100     25.9300     -1.2200
+    181.2000   1434.1100     25.9300     -1.2200
+    181.3000   1434.1100     25.9300     -1.2200
+    181.4000   1434.1100     25.9300     -1.2200
+    181.6000   1434.1600     25.9300     -1.2100
+    181.7000   1434.1600     25.9200     -1.2100
+    181.8000   1434.1000     25.9200     -1.2200
+    182.0000   1434.1900     25.9400     -1.2100
+    182.1000   1434.1700     25.9200     -1.2100
+    182.3000   1434.1900     25.9400     -1.2100
+    182.4000   1434.1900     25.9400     -1.2100
+    182.5000   1434.1900     25.9400     -1.2100
+    182.7000   1434.2000     25.9400     -1.2100
+    182.8000   1434.2000     25.9400     -1.2100
+    182.9000   1434.2500     25.9400     -1.2000
+    183.1000   1434.2500     25.9300     -1.2000
+    183.2000   1434.2400     25.9300     -1.2000
+    183.3000   1434.2500     25.9300     -1.2000
+    183.5000   1434.2500     25.9300     -1.2000
+    183.6000   1434.2500     25.9300     -1.2000
+    183.7000   1434.2500     25.9300     -1.2000
+    183.9000   1434.2500     25.9300     -1.2000
+    184.0000   1434.3100     25.9300     -1.1900
+    184.1000   1434.2500     25.9200     -1.2000
+    184.3000   1434.3300     25.9400     -1.1900
+    184.4000   1434.3100     25.9200     -1.1900
+    184.5000   1434.3300     25.9400     -1.1900
+    184.7000   1434.3300     25.9400     -1.1900
+    184.8000   1434.3300     25.9400     -1.1900
+    185.0000   1434.3900     25.9400     -1.1800
+    185.1000   1434.3900     25.9300     -1.1800
+    185.2000   1434.3800     25.9300     -1.1800
+    185.4000   1434.3800     25.9300     -1.1800
+    185.5000   1434.3900     25.9300     -1.1800
+    185.6000   1434.3900     25.9300     -1.1800
+    185.8000   1434.3900     25.9300     -1.1800
+    185.9000   1434.3900     25.9300     -1.1800
+    186.0000   1434.4500     25.9300     -1.1700
+    186.2000   1434.3900     25.9200     -1.1800
+    186.3000   1434.4700     25.9400     -1.1700
+    186.4000   1434.4700     25.9400     -1.1700
+    186.6000   1434.4700     25.9400     -1.1700
+    186.7000   1434.4700     25.9400     -1.1700
+    186.8000   1434.4700     25.9400     -1.1700
+    187.0000   1434.5300     25.9400     -1.1600
+    187.1000   1434.5200     25.9300     -1.1600
+    187.2000   1434.4700     25.9300     -1.1700
+    187.4000   1434.5300     25.9300     -1.1600
+    187.5000   1434.5300     25.9300     -1.1600
+    187.7000   1434.5200     25.9300     -1.1600
+    187.8000   1434.5300     25.9300     -1.1600
+    187.9000   1434.5300     25.9300     -1.1600
+    188.1000   1434.5600     25.9500     -1.1600
+    188.2000   1434.5300     25.9300     -1.1600
+    188.3000   1434.6100     25.9500     -1.1400
+    188.5000   1434.5800     25.9200     -1.1400
+    188.6000   1434.6100     25.9400     -1.1400
+    188.7000   1434.6100     25.9400     -1.1400
+    188.9000   1434.6100     25.9400     -1.1400
+    189.0000   1434.6100     25.9400     -1.1400
+    189.1000   1434.6700     25.9400     -1.1300
+    189.3000   1434.6100     25.9300     -1.1400
+    189.4000   1434.6600     25.9300     -1.1300
+    189.5000   1434.6700     25.9300     -1.1300
+    189.7000   1434.6600     25.9300     -1.1300
+    189.8000   1434.6600     25.9300     -1.1300
+    189.9000   1434.6700     25.9300     -1.1300
+    190.1000   1434.6700     25.9300     -1.1300
+    190.2000   1434.6700     25.9300     -1.1300
+    190.3000   1434.7200     25.9300     -1.1200
+    190.5000   1434.7500     25.9400     -1.1200
+    190.6000   1434.7400     25.9400     -1.1200
+    190.8000   1434.7400     25.9400     -1.1200
+    190.9000   1434.7500     25.9400     -1.1200
+    191.0000   1434.7500     25.9400     -1.1200
+    191.2000   1434.7500     25.9400     -1.1200
+    191.3000   1434.7500     25.9400     -1.1200
+    191.4000   1434.8100     25.9400     -1.1100
+    191.6000   1434.7500     25.9300     -1.1200
+    191.7000   1434.8100     25.9300     -1.1100
+    191.8000   1434.8100     25.9300     -1.1100
+    192.0000   1434.8000     25.9300     -1.1100
+    192.1000   1434.8100     25.9300     -1.1100
+    192.2000   1434.8100     25.9300     -1.1100
+    192.4000   1434.8100     25.9300     -1.1100
+    192.5000   1434.8600     25.9300     -1.1000
+    192.6000   1434.8900     25.9400     -1.1000
+    192.8000   1434.8800     25.9400     -1.1000
+    192.9000   1434.8800     25.9400     -1.1000
+    193.0000   1434.8900     25.9400     -1.1000
+    193.2000   1434.8900     25.9400     -1.1000
+    193.3000   1434.8900     25.9400     -1.1000
+    193.5000   1434.9400     25.9400     -1.0900
+    193.6000   1434.8900     25.9300     -1.1000
+    193.7000   1434.9400     25.9300     -1.0900
+    193.9000   1434.9400     25.9300     -1.0900
+    194.0000   1434.9400     25.9300     -1.0900
+    194.1000   1434.9400     25.9300     -1.0900
+    194.3000   1434.9400     25.9300     -1.0900
+    194.4000   1434.9500     25.9300     -1.0900
+    194.5000   1435.0000     25.9300     -1.0800
+    194.7000   1434.9700     25.9400     -1.0900
+    194.8000   1435.0000     25.9200     -1.0800
+    194.9000   1435.0300     25.9400     -1.0800
+    195.1000   1435.0200     25.9400     -1.0800
+    195.2000   1435.0300     25.9400     -1.0800
+    195.3000   1435.0300     25.9400     -1.0800
+    195.5000   1435.0300     25.9400     -1.0800
+    195.6000   1435.0000     25.9200     -1.0800
+    195.7000   1435.0900     25.9400     -1.0700
+    195.9000   1435.0800     25.9300     -1.0700
+    196.0000   1435.0800     25.9300     -1.0700
+    196.1000   1435.0800     25.9300     -1.0700
+    196.3000   1435.0800     25.9300     -1.0700
+    196.4000   1435.0800     25.9300     -1.0700
+    196.6000   1435.0900     25.9300     -1.0700
+    196.7000   1435.0900     25.9300     -1.0700
+    196.8000   1435.1400     25.9300     -1.0600
+    197.0000   1435.0900     25.9200     -1.0700
+    197.1000   1435.1400     25.9200     -1.0600
+    197.2000   1435.1400     25.9200     -1.0600
+    197.4000   1435.1600     25.9400     -1.0600
+    197.5000   1435.1700     25.9400     -1.0600
+    197.6000   1435.1400     25.9200     -1.0600
+    197.8000   1435.1400     25.9200     -1.0600
+    197.9000   1435.2200     25.9400     -1.0500
+    198.0000   1435.1700     25.9300     -1.0600
+    198.2000   1435.2200     25.9300     -1.0500
+    198.3000   1435.2200     25.9300     -1.0500
+    198.4000   1435.2200     25.9300     -1.0500
+    198.6000   1435.2200     25.9300     -1.0500
+    198.7000   1435.2200     25.9300     -1.0500
+    198.8000   1435.2800     25.9300     -1.0400
+    199.0000   1435.2200     25.9300     -1.0500
@@ -0,0 +1,14180 @@
+test_read_store_and_write
+1/1/2012
+16:12:57
+Probe: XCTD-2
+Source: /root/package/data/input/sippican/C4_00003.EDF
+      0.0000   1437.9500     16.9900      2.7500
+      0.1000   1441.5200     22.8200      1.8600
+      0.3000   1440.1500     23.5300      1.3500
+      0.4000   1439.6400     24.1600      1.0600
+      0.6000   1439.3100     24.4900      0.9000
+      0.7000   1438.0400     23.8200      0.8100
+      0.8000   1438.4200     24.3200      0.7500
+      1.0000   1438.6200     24.5800      0.7200
+      1.1000   1438.7200     24.7300      0.7000
+      1.2000   1438.7800     24.8100      0.6900
+      1.4000   1438.8400     24.8600      0.6900
+      1.5000   1438.8800     24.8800      0.6900
+      1.7000   1438.9000     24.9000      0.6900
+      1.8000   1438.8800     24.9200      0.6800
+      1.9000   1438.9100     24.9400      0.6800
+      2.1000   1438.9200     24.9400      0.6800
+      2.2000   1438.9200     24.9400      0.6800
+      2.3000   1438.9500     24.9600      0.6800
+      2.5000   1438.9500     24.9600      0.6800
+      2.6000   1438.9600     24.9600      0.6800
+      2.8000   1438.9600     24.9600      0.6800
+      2.9000   1438.9600     24.9600      0.6800
+      3.0000   1438.9600     24.9600      0.6800
+      3.2000   1438.9600     24.9600      0.6800
+      3.3000   1438.9700     24.9600      0.6800
+      3.4000   1438.9700     24.9600      0.6800
+      3.6000   1438.9700     24.9600      0.6800
+      3.7000   1438.9700     24.9600      0.6800
+      3.9000   1438.9700     24.9600      0.6800
+      4.0000   1438.9800     24.9600      0.6800
+      4.1000   1438.9800     24.9600      0.6800
+      4.3000   1438.9800     24.9600      0.6800
+      4.4000   1438.9800     24.9600      0.6800
+      4.5000   1438.9800     24.9600      0.6800
+      4.7000   1438.9900     24.9600      0.6800
+      4.8000   1438.9900     24.9600      0.6800
+      5.0000   1438.9900     24.9600      0.6800
+      5.1000   1438.9900     24.9600      0.6800
+      5.2000   1439.0000     24.9600      0.6800
+      5.4000   1439.0000     24.9600      0.6800
+      5.5000   1439.0000     24.9600      0.6800
+      5.6000   1438.9500     24.9600      0.6700
+      5.8000   1439.0100     24.9600      0.6800
+      5.9000   1439.0100     24.9600      0.6800
+      6.1000   1439.0100     24.9600      0.6800
+      6.2000   1439.0100     24.9600      0.6800
+      6.3000   1438.9600     24.9600      0.6700
+      6.5000   1439.0200     24.9600      0.6800
+      6.6000   1439.0200     24.9600      0.6800
+      6.7000   1439.0200     24.9600      0.6800
+      6.9000   1439.0200     24.9600      0.6800
+      7.0000   1438.9700     24.9600      0.6700
+      7.2000   1439.0300     24.9600      0.6800
+      7.3000   1438.9800     24.9600      0.6700
+      7.4000   1439.0400     24.9600      0.6800
+      7.6000   1439.0400     24.9600      0.6800
+      7.7000   1438.9900     24.9600      0.6700
+      7.8000   1439.0400     24.9600      0.6800
+      8.0000   1439.0000     24.9600      0.6700
+      8.1000   1439.0500     24.9600      0.6800
+      8.3000   1439.0500     24.9600      0.6800
+      8.4000   1439.0000     24.9600      0.6700
+      8.5000   1439.0500     24.9600      0.6800
+      8.7000   1439.0100     24.9600      0.6700
+      8.8000   1439.0600     24.9600      0.6800
+      8.9000   1439.0100     24.9600      0.6700
+      9.1000   1439.0100     24.9600      0.6700
+      9.2000   1439.0200     24.9700      0.6700
+      9.4000   1439.0200     24.9700      0.6700
+      9.5000   1439.0700     24.9700      0.6800
+      9.6000   1439.0200     24.9600      0.6700
+      9.8000   1439.0200     24.9600      0.6700
+      9.9000   1439.0300     24.9700      0.6700
+     10.0000   1439.0300     24.9700      0.6700
+     10.2000   1439.0300     24.9700      0.6700
+     10.3000   1439.0400     24.9700      0.6700
+     10.5000   1439.0400     24.9700      0.6700
+     10.6000   1439.0900     24.9700      0.6800
+     10.7000   1439.0400     24.9600      0.6700
+     10.9000   1439.0400     24.9600      0.6700
+     11.0000   1439.0500     24.9700      0.6700
+     11.1000   1439.0500     24.9700      0.6700
+     11.3000   1439.0500     24.9700      0.6700
+     11.4000   1439.0500     24.9700      0.6700
+     11.6000   1439.0600     24.9700      0.6700
+     11.7000   1439.0600     24.9700      0.6700
+     11.8000   1439.0600     24.9700      0.6700
+     12.0000   1439.0600     24.9700      0.6700
+     12.1000   1439.0600     24.9700      0.6700
+     12.2000   1439.0700     24.9700      0.6700
+     12.4000   1439.0700     24.9700      0.6700
+     12.5000   1439.0700     24.9700      0.6700
+     12.7000   1439.0700     24.9700      0.6700
+     12.8000   1439.0800     24.9700      0.6700
+     12.9000   1439.0800     24.9700      0.6700
+     13.1000   1439.0800     24.9700      0.6700
+     13.2000   1439.0800     24.9700      0.6700
+     13.3000   1439.0800     24.9600      0.6700
+     13.5000   1439.0900     24.9600      0.6700
+     13.6000   1439.0900     24.9600      0.6700
+     13.8000   1439.0900     24.9600      0.6700
+     13.9000   1439.0900     24.9600      0.6700
+     14.0000   1439.0900     24.9600      0.6700
+     14.2000   1439.1200     24.9800      0.6700
+     14.3000   1439.1000     24.9600      0.6700
+     14.4000   1439.1000     24.9600      0.6700
+     14.6000   1439.1000     24.9600      0.6700
+     14.7000   1439.1000     24.9600      0.6700
+     14.9000   1439.1100     24.9600      0.6700
+     15.0000   1439.1100     24.9600      0.6700
+     15.1000   1439.1100     24.9600      0.6700
+     15.3000   1439.0600     24.9600      0.6600
+     15.4000   1439.0700     24.9700      0.6600
+     15.5000   1439.0800     24.9700      0.6600
+     15.7000   1439.0800     24.9700      0.6600
+     15.8000   1439.0800     24.9700      0.6600
+     16.0000   1439.0400     24.9700      0.6500
+     16.1000   1439.0900     24.9800      0.6600
+     16.2000   1439.0700     25.0000      0.6500
+     16.4000   1439.0500     24.9800      0.6500
+     16.5000   1439.0600     24.9800      0.6500
+     16.6000   1439.0600     24.9800      0.6500
+     16.8000   1439.0600     24.9800      0.6500
+     16.9000   1439.0600     24.9800      0.6500
+     17.0000   1439.0700     24.9800      0.6500
+     17.2000   1439.0700     24.9800      0.6500
+     17.3000   1439.0700     24.9800      0.6500
+     17.5000   1439.0700     24.9800      0.6500
+     17.6000   1439.0300     24.9800      0.6400
+     17.7000   1439.0300     24.9800      0.6400
+     17.9000   1439.0400     24.9900      0.6400
+     18.0000   1439.0400     24.9900      0.6400
+     18.1000   1439.0500     24.9900      0.6400
+     18.3000   1439.0000     24.9900      0.6300
+     18.4000   1439.0600     24.9900      0.6400
+     18.6000   1439.0100     24.9900      0.6300
+     18.7000   1439.0100     24.9900      0.6300
+     18.8000   1439.0200     25.0000      0.6300
+     19.0000   1439.0200     25.0000      0.6300
+     19.1000   1439.0200     25.0000      0.6300
+     19.2000   1438.9800     25.0000      0.6200
+     19.4000   1438.9800     25.0000      0.6200
+     19.5000   1438.9900     25.0000      0.6200
+     19.7000   1438.9500     25.0000      0.6100
+     19.8000   1438.9500     25.0100      0.6100
+     19.9000   1438.9100     25.0100      0.5900
+     20.1000   1438.8700     25.0200      0.5800
+     20.2000   1438.7400     25.0300      0.5500
+     20.3000   1438.3200     25.0400      0.4600
+     20.5000   1437.5300     25.0700      0.2800
+     20.6000   1436.7700     25.1700      0.0900
+     20.8000   1436.2300     25.3200     -0.0700
+     20.9000   1435.7900     25.4400     -0.2000
+     21.0000   1435.3800     25.5400     -0.3100
+     21.2000   1435.2100     25.6500     -0.3800
+     21.3000   1435.0900     25.7000     -0.4200
+     21.4000   1434.9700     25.7300     -0.4500
+     21.6000   1434.9900     25.7800     -0.4600
+     21.7000   1435.0200     25.8400     -0.4700
+     21.9000   1435.0900     25.8800     -0.4700
+     22.0000   1435.2000     25.9300     -0.4600
+     22.1000   1435.2200     25.9400     -0.4600
+     22.3000   1435.3400     25.9600     -0.4400
+     22.4000   1435.4300     25.9900     -0.4300
+     22.5000   1435.6200     26.0500     -0.4100
+     22.7000   1435.7900     26.1300     -0.4000
+     22.8000   1436.0000     26.2500     -0.3900
+     23.0000   1436.3000     26.4000     -0.3700
+     23.1000   1436.5700     26.5600     -0.3500
+     23.2000   1436.7300     26.6800     -0.3500
+     23.4000   1436.8300     26.7900     -0.3700
+     23.5000   1436.9700     26.9300     -0.3800
+     23.6000   1437.0900     27.0200     -0.3800
+     23.8000   1437.1300     27.0800     -0.3900
+     23.9000   1437.1900     27.1700     -0.4000
+     24.1000   1437.2800     27.2400     -0.4000
+     24.2000   1437.3700     27.3000     -0.4000
+     24.3000   1437.4700     27.3400     -0.3900
+     24.5000   1437.5500     27.3500     -0.3800
+     24.6000   1437.6200     27.4400     -0.3900
+     24.7000   1437.6700     27.5200     -0.4000
+     24.9000   1437.6600     27.5500     -0.4100
+     25.0000   1437.7000     27.5800     -0.4100
+     25.2000   1437.7100     27.6200     -0.4200
+     25.3000   1437.7800     27.6600     -0.4200
+     25.4000   1437.7600     27.6900     -0.4300
+     25.6000   1437.7400     27.7100     -0.4400
+     25.7000   1437.7600     27.7200     -0.4400
+     25.8000   1437.7700     27.7600     -0.4500
+     26.0000   1437.7500     27.7900     -0.4600
+     26.1000   1437.7200     27.8000     -0.4700
+     26.3000   1437.7100     27.8300     -0.4800
+     26.4000   1437.6500     27.8600     -0.5000
+     26.5000   1437.6200     27.8700     -0.5100
+     26.7000   1437.5700     27.9100     -0.5400
+     26.8000   1437.5400     27.9200     -0.5500
+     26.9000   1437.4600     27.9400     -0.5700
+     27.1000   1437.4600     27.9300     -0.5700
+     27.2000   1437.3700     27.9400     -0.5900
+     27.4000   1437.2800     27.9500     -0.6100
+     27.5000   1437.2600     27.9700     -0.6200
+     27.6000   1437.1800     27.9800     -0.6400
+     27.8000   1437.1000     28.0000     -0.6600
+     27.9000   1437.0500     28.0000     -0.6700
+     28.0000   1436.9700     28.0100     -0.7000
+     28.2000   1436.8700     28.0100     -0.7200
+     28.3000   1436.8500     28.0300     -0.7300
+     28.5000   1436.8700     28.0400     -0.7300
+     28.6000   1436.8800     28.0500     -0.7300
+     28.7000   1436.8800     28.0500     -0.7300
+     28.9000   1436.8800     28.0500     -0.7300
+     29.0000   1436.8300     28.0500     -0.7400
+     29.1000   1436.8900     28.0500     -0.7300
+     29.3000   1436.8900     28.0500     -0.7300
+     29.4000   1436.9900     28.0500     -0.7100
+     29.6000   1437.0100     28.0600     -0.7100
+     29.7000   1437.1200     28.0700     -0.6900
+     29.8000   1437.1400     28.0800     -0.6900
+     30.0000   1437.1000     28.0900     -0.7000
+     30.1000   1437.0900     28.1100     -0.7100
+     30.2000   1437.0000     28.1200     -0.7300
+     30.4000   1436.9700     28.1400     -0.7400
+     30.5000   1437.0200     28.1300     -0.7300
+     30.7000   1437.0000     28.1100     -0.7300
+     30.8000   1437.0200     28.1300     -0.7300
+     30.9000   1437.0200     28.1300     -0.7300
+     31.1000   1437.0500     28.1500     -0.7300
+     31.2000   1437.1000     28.1500     -0.7200
+     31.3000   1437.0500     28.1400     -0.7300
+     31.5000   1437.0200     28.1600     -0.7400
+     31.6000   1436.9900     28.1700     -0.7500
+     31.7000   1436.9500     28.1800     -0.7600
+     31.9000   1436.8400     28.1700     -0.7800
+     32.0000   1436.8100     28.1900     -0.7900
+     32.2000   1436.9900     28.2000     -0.7600
+     32.3000   1437.1500     28.1700     -0.7200
+     32.4000   1437.2600     28.1400     -0.6900
+     32.6000   1437.4700     28.1800     -0.6500
+     32.7000   1437.5600     28.2100     -0.6400
+     32.8000   1437.6700     28.2500     -0.6300
+     33.0000   1437.7600     28.2800     -0.6200
+     33.1000   1437.7500     28.2700     -0.6200
+     33.3000   1437.7700     28.2800     -0.6200
+     33.4000   1437.8000     28.3000     -0.6200
+     33.5000   1437.9100     28.3400     -0.6100
+     33.7000   1437.9000     28.3400     -0.6100
+     33.8000   1437.9500     28.3700     -0.6100
+     33.9000   1438.0000     28.3700     -0.6000
+     34.1000   1437.9000     28.3600     -0.6200
+     34.2000   1437.7800     28.3900     -0.6500
+     34.4000   1437.6400     28.4300     -0.7000
+     34.5000   1437.7600     28.4500     -0.6700
+     34.6000   1438.2600     28.4000     -0.5600
+     34.8000   1438.5700     28.3000     -0.4600
+     34.9000   1438.8500     28.2700     -0.4000
+     35.0000   1439.1400     28.4500     -0.3900
+     35.2000   1439.1800     28.5200     -0.4000
+     35.3000   1439.0800     28.5600     -0.4300
+     35.5000   1438.8300     28.5600     -0.4800
+     35.6000   1438.5400     28.6000     -0.5600
+     35.7000   1438.3100     28.6200     -0.6100
+     35.9000   1438.2200     28.6200     -0.6300
+     36.0000   1438.1600     28.5800     -0.6300
+     36.1000   1438.1500     28.5700     -0.6300
+     36.3000   1438.2000     28.6000     -0.6300
+     36.4000   1438.1800     28.6200     -0.6400
+     36.6000   1438.1700     28.6500     -0.6500
+     36.7000   1438.2100     28.6800     -0.6500
+     36.8000   1438.2200     28.6800     -0.6500
+     37.0000   1438.2500     28.7000     -0.6500
+     37.1000   1438.2800     28.7200     -0.6500
+     37.2000   1438.3300     28.7600     -0.6500
+     37.4000   1438.4100     28.7800     -0.6400
+     37.5000   1438.4300     28.8000     -0.6400
+     37.7000   1438.4500     28.8100     -0.6400
+     37.8000   1438.4300     28.8300     -0.6500
+     37.9000   1438.4700     28.8600     -0.6500
+     38.1000   1438.4300     28.8600     -0.6600
+     38.2000   1438.4300     28.8700     -0.6600
+     38.3000   1438.4400     28.8700     -0.6600
+     38.5000   1438.5500     28.8700     -0.6400
+     38.6000   1438.7400     28.8600     -0.6000
+     38.8000   1439.2300     28.8500     -0.4900
+     38.9000   1439.5900     28.8200     -0.4100
+     39.0000   1439.8500     28.8200     -0.3500
+     39.2000   1439.9000     28.9400     -0.3800
+     39.3000   1439.4900     29.0000     -0.4800
+     39.4000   1439.1700     29.1000     -0.5800
+     39.6000   1438.9700     29.1400     -0.6300
+     39.7000   1438.6500     28.9700     -0.6500
+     39.9000   1438.5200     28.9500     -0.6700
+     40.0000   1438.4800     28.9900     -0.7000
+     40.1000   1438.5300     29.0300     -0.7000
+     40.3000   1438.4700     29.0200     -0.7100
+     40.4000   1438.4800     29.0200     -0.7100
+     40.5000   1438.5200     29.0500     -0.7100
+     40.7000   1438.4700     29.0500     -0.7200
+     40.8000   1438.4800     29.0500     -0.7200
+     40.9000   1438.4600     29.0800     -0.7300
+     41.1000   1438.4700     29.0800     -0.7300
+     41.2000   1438.4800     29.0900     -0.7300
+     41.4000   1438.4600     29.1100     -0.7400
+     41.5000   1438.4700     29.1100     -0.7400
+     41.6000   1438.5000     29.1400     -0.7400
+     41.8000   1438.5300     29.1600     -0.7400
+     41.9000   1438.4800     29.1600     -0.7500
+     42.0000   1438.5200     29.1800     -0.7500
+     42.2000   1438.5500     29.2100     -0.7500
+     42.3000   1438.5000     29.2100     -0.7600
+     42.5000   1438.5100     29.2100     -0.7600
+     42.6000   1438.5000     29.2400     -0.7700
+     42.7000   1438.4300     29.2600     -0.7900
+     42.9000   1438.4300     29.3000     -0.8000
+     43.0000   1438.3300     29.3300     -0.8300
+     43.1000   1438.2000     29.3500     -0.8700
+     43.3000   1438.1200     29.3700     -0.8900
+     43.4000   1437.9800     29.3700     -0.9200
+     43.6000   1437.9400     29.3800     -0.9300
+     43.7000   1437.8900     29.3800     -0.9400
+     43.8000   1437.9300     29.4100     -0.9400
+     44.0000   1437.8900     29.4100     -0.9500
+     44.1000   1437.9000     29.4200     -0.9500
+     44.2000   1437.9100     29.4300     -0.9500
+     44.4000   1437.9100     29.4300     -0.9500
+     44.5000   1437.9400     29.4500     -0.9500
+     44.7000   1437.9400     29.4500     -0.9500
+     44.8000   1437.9900     29.4400     -0.9400
+     44.9000   1438.1200     29.4600     -0.9200
+     45.1000   1438.3300     29.4600     -0.8800
+     45.2000   1438.5500     29.4300     -0.8200
+     45.3000   1438.6200     29.4400     -0.8100
+     45.5000   1438.5800     29.4900     -0.8300
+     45.6000   1438.6500     29.5800     -0.8500
+     45.8000   1438.4600     29.5500     -0.8800
+     45.9000   1438.3400     29.5300     -0.9000
+     46.0000   1438.2500     29.5400     -0.9200
+     46.2000   1438.2300     29.5600     -0.9300
+     46.3000   1438.2500     29.5800     -0.9300
+     46.4000   1438.3300     29.5600     -0.9100
+     46.6000   1438.3700     29.5500     -0.9000
+     46.7000   1438.3800     29.5600     -0.9000
+     46.9000   1438.4300     29.5900     -0.9000
+     47.0000   1438.5100     29.6100     -0.8900
+     47.1000   1438.5500     29.6100     -0.8800
+     47.3000   1438.5200     29.5700     -0.8800
+     47.4000   1438.5900     29.5900     -0.8700
+     47.5000   1438.7400     29.6200     -0.8500
+     47.7000   1438.7700     29.6100     -0.8300
+     47.8000   1439.0100     29.6300     -0.7900
+     47.9000   1439.5900     29.6400     -0.6700
+     48.1000   1440.3700     29.5900     -0.4900
+     48.2000   1440.9800     29.5200     -0.3400
+     48.4000   1441.4600     29.5700     -0.2600
+     48.5000   1441.9500     29.7500     -0.2100
+     48.6000   1442.1900     29.8200     -0.1700
+     48.8000   1442.2400     29.8200     -0.1600
+     48.9000   1441.7500     29.8600     -0.2800
+     49.0000   1441.1200     29.9500     -0.4400
+     49.2000   1440.8100     30.0900     -0.5500
+     49.3000   1440.3900     30.0000     -0.6100
+     49.5000   1440.3100     29.8300     -0.5800
+     49.6000   1440.6400     29.8000     -0.5000
+     49.7000   1440.7400     29.7700     -0.4700
+     49.9000   1440.9100     29.8600     -0.4600
+     50.0000   1440.9500     29.9900     -0.4900
+     50.1000   1440.8400     30.0200     -0.5200
+     50.3000   1440.7800     30.0200     -0.5400
+     50.4000   1440.7600     30.0000     -0.5400
+     50.6000   1440.7100     29.9200     -0.5200
+     50.7000   1441.3400     29.9800     -0.4100
+     50.8000   1441.9800     29.9300     -0.2600
+     51.0000   1442.3800     29.8200     -0.1400
+     51.1000   1442.8700     29.9300     -0.0700
+     51.2000   1443.3800     30.0900      0.0000
+     51.4000   1443.6200     30.1200      0.0400
+     51.5000   1443.7700     30.1200      0.0700
+     51.7000   1443.8500     30.1500      0.0800
+     51.8000   1443.9800     30.1600      0.1000
+     51.9000   1444.0300     30.1700      0.1100
+     52.1000   1444.0400     30.1700      0.1100
+     52.2000   1444.1100     30.1900      0.1200
+     52.3000   1444.1800     30.2000      0.1300
+     52.5000   1444.2700     30.2300      0.1400
+     52.6000   1444.2800     30.2400      0.1400
+     52.7000   1444.3100     30.2500      0.1400
+     52.9000   1444.3300     30.2700      0.1400
+     53.0000   1444.2900     30.2700      0.1300
+     53.2000   1444.2500     30.2800      0.1200
+     53.3000   1444.2100     30.2900      0.1100
+     53.4000   1444.1800     30.3000      0.1000
+     53.6000   1444.1500     30.3100      0.0900
+     53.7000   1444.1200     30.3200      0.0800
+     53.8000   1444.0800     30.3300      0.0700
+     54.0000   1444.0200     30.3200      0.0600
+     54.1000   1444.0400     30.3300      0.0600
+     54.3000   1444.0500     30.3300      0.0600
+     54.4000   1444.0000     30.3300      0.0500
+     54.5000   1444.0100     30.3400      0.0500
+     54.7000   1444.0500     30.3600      0.0500
+     54.8000   1444.0500     30.3600      0.0500
+     54.9000   1444.0000     30.3600      0.0400
+     55.1000   1444.0100     30.3700      0.0400
+     55.2000   1444.0200     30.3700      0.0400
+     55.4000   1444.0200     30.3700      0.0400
+     55.5000   1444.0000     30.3900      0.0300
+     55.6000   1443.9300     30.3800      0.0200
+     55.8000   1443.9000     30.3900      0.0100
+     55.9000   1443.8700     30.4000      0.0000
+     56.0000   1443.8800     30.4100      0.0000
+     56.2000   1443.8400     30.4100     -0.0200
+     56.3000   1443.8500     30.4200     -0.0200
+     56.5000   1443.8900     30.4400     -0.0200
+     56.6000   1443.9400     30.4400      0.0000
+     56.7000   1443.9400     30.4400      0.0000
+     56.9000   1444.0100     30.4500      0.0100
+     57.0000   1444.0300     30.4700      0.0100
+     57.1000   1444.0200     30.4600      0.0100
+     57.3000   1444.1000     30.4800      0.0200
+     57.4000   1444.1200     30.5000      0.0200
+     57.6000   1444.1200     30.4900      0.0200
+     57.7000   1444.1400     30.5100      0.0200
+     57.8000   1444.1500     30.5100      0.0200
+     58.0000   1444.2000     30.5100      0.0300
+     58.1000   1444.1700     30.5200      0.0200
+     58.2000   1444.2500     30.5400      0.0300
+     58.4000   1444.2000     30.5400      0.0200
+     58.5000   1444.2300     30.5600      0.0200
+     58.6000   1444.2400     30.5700      0.0200
+     58.8000   1444.2400     30.5700      0.0200
+     58.9000   1444.2700     30.5900      0.0200
+     59.1000   1444.2700     30.5900      0.0200
+     59.2000   1444.2200     30.5900      0.0100
+     59.3000   1444.2600     30.6100      0.0100
+     59.5000   1444.2900     30.6400      0.0100
+     59.6000   1444.2500     30.6400      0.0000
+     59.7000   1444.2500     30.6400      0.0000
+     59.9000   1444.2100     30.6500     -0.0200
+     60.0000   1444.1700     30.6500     -0.0300
+     60.2000   1444.1400     30.6600     -0.0400
+     60.3000   1444.1600     30.6700     -0.0400
+     60.4000   1444.1200     30.6800     -0.0500
+     60.6000   1444.0300     30.6800     -0.0700
+     60.7000   1444.0500     30.7000     -0.0700
+     60.8000   1444.0200     30.7100     -0.0800
+     61.0000   1444.0000     30.7000     -0.0800
+     61.1000   1444.0400     30.7200     -0.0800
+     61.3000   1444.0700     30.7400     -0.0800
+     61.4000   1444.0200     30.7400     -0.0900
+     61.5000   1444.0300     30.7400     -0.0900
+     61.7000   1444.0100     30.7700     -0.1000
+     61.8000   1444.0200     30.7800     -0.1000
+     61.9000   1444.0300     30.7800     -0.1000
+     62.1000   1444.0300     30.7800     -0.1000
+     62.2000   1444.0400     30.7800     -0.1000
+     62.3000   1444.1100     30.8000     -0.0900
+     62.5000   1444.1400     30.8100     -0.0900
+     62.6000   1444.1100     30.8300     -0.1000
+     62.8000   1444.1200     30.8300     -0.1000
+     62.9000   1444.0800     30.8400     -0.1100
+     63.0000   1444.0400     30.8400     -0.1200
+     63.2000   1444.0000     30.8500     -0.1300
+     63.3000   1443.9200     30.8700     -0.1500
+     63.4000   1443.8700     30.8600     -0.1600
+     63.6000   1443.8900     30.8800     -0.1600
+     63.7000   1443.8500     30.8400     -0.1600
+     63.9000   1443.8500     30.8400     -0.1600
+     64.0000   1443.8800     30.8600     -0.1600
+     64.1000   1443.9300     30.8600     -0.1500
+     64.3000   1443.9300     30.8600     -0.1500
+     64.4000   1444.0000     30.8700     -0.1400
+     64.5000   1444.0400     30.8700     -0.1300
+     64.7000   1444.1600     30.9100     -0.1200
+     64.8000   1444.2200     30.9200     -0.1100
+     65.0000   1444.2300     30.9300     -0.1100
+     65.1000   1444.2600     30.9500     -0.1100
+     65.2000   1444.1900     30.9700     -0.1300
+     65.4000   1444.2000     30.9800     -0.1300
+     65.5000   1444.1400     30.9700     -0.1400
+     65.6000   1444.1000     30.9700     -0.1500
+     65.8000   1444.1200     30.9800     -0.1500
+     65.9000   1444.1300     30.9900     -0.1500
+     66.1000   1444.1300     30.9900     -0.1500
+     66.2000   1444.1300     30.9900     -0.1500
+     66.3000   1444.1400     30.9900     -0.1500
+     66.5000   1444.2100     31.0100     -0.1400
+     66.6000   1444.2100     31.0000     -0.1400
+     66.7000   1444.2000     31.0000     -0.1400
+     66.9000   1444.2300     31.0200     -0.1400
+     67.0000   1444.2300     31.0200     -0.1400
+     67.1000   1444.2400     31.0200     -0.1400
+     67.3000   1444.2400     31.0200     -0.1400
+     67.4000   1444.1900     31.0200     -0.1500
+     67.6000   1444.2000     31.0200     -0.1500
+     67.7000   1444.2400     31.0500     -0.1500
+     67.8000   1444.2100     31.0300     -0.1500
+     68.0000   1444.2100     31.0300     -0.1500
+     68.1000   1444.1900     31.0500     -0.1600
+     68.2000   1444.2000     31.0500     -0.1600
+     68.4000   1444.2100     31.0600     -0.1600
+     68.5000   1444.2100     31.0600     -0.1600
+     68.7000   1444.1700     31.0600     -0.1700
+     68.8000   1444.1800     31.0600     -0.1700
+     68.9000   1444.1800     31.0700     -0.1700
+     69.1000   1444.1400     31.0700     -0.1800
+     69.2000   1444.1700     31.0900     -0.1800
+     69.3000   1444.1800     31.1000     -0.1800
+     69.5000   1444.1300     31.1000     -0.2000
+     69.6000   1444.0900     31.1000     -0.2100
+     69.8000   1444.1100     31.1100     -0.2100
+     69.9000   1444.1000     31.1400     -0.2200
+     70.0000   1444.0800     31.1200     -0.2200
+     70.2000   1444.0700     31.1500     -0.2300
+     70.3000   1444.0300     31.1500     -0.2400
+     70.4000   1443.9400     31.1700     -0.2600
+     70.6000   1443.8900     31.1600     -0.2700
+     70.7000   1443.8700     31.1800     -0.2800
+     70.8000   1443.7600     31.1700     -0.3000
+     71.0000   1443.7300     31.1900     -0.3100
+     71.1000   1443.7300     31.1800     -0.3100
+     71.3000   1443.6900     31.1900     -0.3200
+     71.4000   1443.6500     31.1900     -0.3300
+     71.5000   1443.6700     31.2000     -0.3300
+     71.7000   1443.6800     31.2100     -0.3300
+     71.8000   1443.6300     31.2100     -0.3400
+     71.9000   1443.6400     31.2100     -0.3400
+     72.1000   1443.6500     31.2200     -0.3400
+     72.2000   1443.6300     31.2400     -0.3500
+     72.4000   1443.6400     31.2400     -0.3500
+     72.5000   1443.6200     31.2700     -0.3700
+     72.6000   1443.5800     31.2700     -0.3800
+     72.8000   1443.5200     31.2700     -0.3900
+     72.9000   1443.4600     31.2600     -0.4000
+     73.0000   1443.4800     31.2700     -0.4000
+     73.2000   1443.4400     31.2700     -0.4100
+     73.3000   1443.5000     31.2800     -0.4000
+     73.5000   1443.5000     31.2800     -0.4000
+     73.6000   1443.5700     31.2900     -0.3900
+     73.7000   1443.6200     31.2900     -0.3800
+     73.9000   1443.7000     31.2800     -0.3500
+     74.0000   1443.8300     31.3000     -0.3300
+     74.1000   1443.8600     31.2800     -0.3200
+     74.3000   1443.9400     31.3000     -0.3100
+     74.4000   1443.9500     31.3100     -0.3100
+     74.5000   1443.9800     31.3200     -0.3100
+     74.7000   1443.9500     31.3400     -0.3200
+     74.8000   1443.9600     31.3500     -0.3200
+     75.0000   1443.9200     31.3500     -0.3300
+     75.1000   1443.9800     31.3600     -0.3200
+     75.2000   1443.9300     31.3600     -0.3300
+     75.4000   1443.8900     31.3600     -0.3400
+     75.5000   1443.8800     31.3900     -0.3500
+     75.6000   1443.8500     31.4000     -0.3700
+     75.8000   1443.8400     31.3900     -0.3700
+     75.9000   1443.8200     31.3800     -0.3700
+     76.1000   1443.7700     31.3800     -0.3800
+     76.2000   1443.7600     31.4000     -0.3900
+     76.3000   1443.7500     31.4300     -0.4000
+     76.5000   1443.6900     31.4200     -0.4100
+     76.6000   1443.6300     31.4200     -0.4200
+     76.7000   1443.6000     31.4300     -0.4300
+     76.9000   1443.6200     31.4400     -0.4300
+     77.0000   1443.6000     31.4200     -0.4300
+     77.2000   1443.5500     31.4200     -0.4400
+     77.3000   1443.5900     31.4500     -0.4400
+     77.4000   1443.6000     31.4500     -0.4400
+     77.6000   1443.6000     31.4500     -0.4400
+     77.7000   1443.6000     31.4500     -0.4400
+     77.8000   1443.6100     31.4500     -0.4400
+     78.0000   1443.6100     31.4500     -0.4400
+     78.1000   1443.6100     31.4500     -0.4400
+     78.2000   1443.6100     31.4500     -0.4400
+     78.4000   1443.5600     31.4500     -0.4500
+     78.5000   1443.5700     31.4600     -0.4500
+     78.7000   1443.6100     31.4800     -0.4500
+     78.8000   1443.6100     31.4800     -0.4500
+     78.9000   1443.5600     31.4800     -0.4600
+     79.1000   1443.5500     31.4700     -0.4600
+     79.2000   1443.5800     31.4900     -0.4600
+     79.3000   1443.5900     31.4900     -0.4600
+     79.5000   1443.5900     31.4900     -0.4600
+     79.6000   1443.5900     31.4900     -0.4600
+     79.8000   1443.5900     31.4900     -0.4600
+     79.9000   1443.5700     31.5100     -0.4700
+     80.0000   1443.5500     31.5000     -0.4700
+     80.2000   1443.5600     31.5000     -0.4700
+     80.3000   1443.5400     31.5200     -0.4800
+     80.4000   1443.5200     31.5100     -0.4800
+     80.6000   1443.5300     31.5200     -0.4800
+     80.7000   1443.5400     31.5200     -0.4800
+     80.9000   1443.5700     31.5400     -0.4800
+     81.0000   1443.5400     31.5200     -0.4800
+     81.1000   1443.5700     31.5400     -0.4800
+     81.3000   1443.6200     31.5400     -0.4700
+     81.4000   1443.6700     31.5300     -0.4600
+     81.5000   1443.6500     31.5200     -0.4600
+     81.7000   1443.7000     31.5500     -0.4600
+     81.8000   1443.7000     31.5500     -0.4600
+     81.9000   1443.7300     31.5700     -0.4600
+     82.1000   1443.6800     31.5700     -0.4700
+     82.2000   1443.6900     31.5800     -0.4700
+     82.4000   1443.6500     31.5800     -0.4800
+     82.5000   1443.6600     31.5900     -0.4800
+     82.6000   1443.6200     31.5900     -0.4900
+     82.8000   1443.5600     31.5800     -0.5000
+     82.9000   1443.5700     31.5900     -0.5000
+     83.0000   1443.5300     31.6000     -0.5100
+     83.2000   1443.4900     31.6000     -0.5200
+     83.3000   1443.4900     31.6300     -0.5400
+     83.5000   1443.3800     31.6200     -0.5600
+     83.6000   1443.3700     31.6200     -0.5600
+     83.7000   1443.3100     31.6100     -0.5700
+     83.9000   1443.2700     31.6200     -0.5800
+     84.0000   1443.2400     31.6300     -0.5900
+     84.1000   1443.2100     31.6400     -0.6000
+     84.3000   1443.2000     31.6300     -0.6000
+     84.4000   1443.2100     31.6400     -0.6000
+     84.5000   1443.1600     31.6400     -0.6100
+     84.7000   1443.1700     31.6400     -0.6100
+     84.8000   1443.1800     31.6500     -0.6100
+     85.0000   1443.1800     31.6500     -0.6100
+     85.1000   1443.1300     31.6500     -0.6200
+     85.2000   1443.1400     31.6500     -0.6200
+     85.4000   1443.1500     31.6600     -0.6200
+     85.5000   1443.1500     31.6600     -0.6200
+     85.6000   1443.1600     31.6600     -0.6200
+     85.8000   1443.1100     31.6600     -0.6300
+     85.9000   1443.1200     31.6600     -0.6300
+     86.1000   1443.1300     31.6700     -0.6300
+     86.2000   1443.0500     31.6500     -0.6400
+     86.3000   1443.0900     31.6700     -0.6400
+     86.5000   1443.0200     31.6600     -0.6500
+     86.6000   1443.0600     31.6800     -0.6500
+     86.7000   1443.0200     31.6900     -0.6600
+     86.9000   1443.0000     31.6800     -0.6600
+     87.0000   1443.0400     31.7000     -0.6600
+     87.2000   1443.0400     31.7000     -0.6600
+     87.3000   1443.0400     31.7000     -0.6600
+     87.4000   1443.0400     31.7000     -0.6600
+     87.6000   1443.0400     31.7000     -0.6600
+     87.7000   1443.0500     31.7000     -0.6600
+     87.8000   1443.0500     31.7000     -0.6600
+     88.0000   1443.0800     31.7200     -0.6600
+     88.1000   1443.0800     31.7200     -0.6600
+     88.2000   1443.0300     31.7200     -0.6700
+     88.4000   1443.0400     31.7300     -0.6700
+     88.5000   1443.0500     31.7300     -0.6700
+     88.7000   1443.0800     31.7500     -0.6700
+     88.8000   1443.0800     31.7500     -0.6700
+     88.9000   1443.0300     31.7500     -0.6900
+     89.1000   1443.0400     31.7600     -0.6900
+     89.2000   1443.0500     31.7600     -0.6900
+     89.3000   1443.0000     31.7600     -0.7000
+     89.5000   1443.0100     31.7700     -0.7000
+     89.6000   1442.9700     31.7700     -0.7100
+     89.8000   1442.9800     31.7800     -0.7100
+     89.9000   1442.8900     31.7800     -0.7300
+     90.0000   1442.8600     31.8000     -0.7400
+     90.2000   1442.8800     31.8100     -0.7400
+     90.3000   1442.8200     31.8000     -0.7500
+     90.4000   1442.7800     31.8000     -0.7600
+     90.6000   1442.7400     31.8100     -0.7700
+     90.7000   1442.6800     31.8100     -0.7800
+     90.8000   1442.6500     31.8200     -0.7900
+     91.0000   1442.6700     31.8300     -0.7900
+     91.1000   1442.6500     31.8100     -0.7900
+     91.3000   1442.6000     31.8100     -0.8000
+     91.4000   1442.6100     31.8200     -0.8000
+     91.5000   1442.6200     31.8300     -0.8000
+     91.7000   1442.6200     31.8200     -0.8000
+     91.8000   1442.6500     31.8400     -0.8000
+     91.9000   1442.6300     31.8200     -0.8000
+     92.1000   1442.6000     31.8400     -0.8100
+     92.2000   1442.6100     31.8500     -0.8100
+     92.4000   1442.6000     31.8400     -0.8100
+     92.5000   1442.6300     31.8600     -0.8100
+     92.6000   1442.5500     31.8400     -0.8200
+     92.8000   1442.5900     31.8600     -0.8200
+     92.9000   1442.6000     31.8700     -0.8200
+     93.0000   1442.5200     31.8500     -0.8300
+     93.2000   1442.5600     31.8700     -0.8300
+     93.3000   1442.5700     31.8800     -0.8300
+     93.4000   1442.5200     31.8800     -0.8500
+     93.6000   1442.5300     31.8800     -0.8500
+     93.7000   1442.5100     31.8700     -0.8500
+     93.9000   1442.5400     31.8900     -0.8500
+     94.0000   1442.5400     31.8900     -0.8500
+     94.1000   1442.4900     31.8900     -0.8600
+     94.3000   1442.5000     31.8900     -0.8600
+     94.4000   1442.5100     31.9000     -0.8600
+     94.5000   1442.5200     31.9000     -0.8600
+     94.7000   1442.4700     31.9000     -0.8700
+     94.8000   1442.4800     31.9100     -0.8700
+     95.0000   1442.4900     31.9100     -0.8700
+     95.1000   1442.4400     31.9100     -0.8800
+     95.2000   1442.4500     31.9200     -0.8800
+     95.4000   1442.4600     31.9200     -0.8800
+     95.5000   1442.4600     31.9200     -0.8800
+     95.6000   1442.4600     31.9200     -0.8800
+     95.8000   1442.4100     31.9200     -0.8900
+     95.9000   1442.4200     31.9300     -0.8900
+     96.0000   1442.3800     31.9300     -0.9000
+     96.2000   1442.3900     31.9400     -0.9000
+     96.3000   1442.3800     31.9200     -0.9000
+     96.5000   1442.3300     31.9200     -0.9100
+     96.6000   1442.3400     31.9300     -0.9100
+     96.7000   1442.3500     31.9400     -0.9100
+     96.9000   1442.3200     31.9600     -0.9200
+     97.0000   1442.3100     31.9400     -0.9200
+     97.1000   1442.2700     31.9500     -0.9300
+     97.3000   1442.2800     31.9500     -0.9300
+     97.4000   1442.2900     31.9600     -0.9300
+     97.6000   1442.2400     31.9600     -0.9400
+     97.7000   1442.2500     31.9600     -0.9400
+     97.8000   1442.2600     31.9700     -0.9400
+     98.0000   1442.2600     31.9700     -0.9400
+     98.1000   1442.2600     31.9700     -0.9400
+     98.2000   1442.2600     31.9700     -0.9400
+     98.4000   1442.3200     31.9700     -0.9300
+     98.5000   1442.2900     31.9800     -0.9400
+     98.6000   1442.3400     31.9800     -0.9300
+     98.8000   1442.2900     31.9800     -0.9400
+     98.9000   1442.2900     31.9800     -0.9400
+     99.1000   1442.2500     31.9900     -0.9500
+     99.2000   1442.2600     31.9900     -0.9500
+     99.3000   1442.1900     31.9800     -0.9600
+     99.5000   1442.2000     31.9900     -0.9600
+     99.6000   1442.1600     31.9900     -0.9700
+     99.7000   1442.1700     32.0000     -0.9700
+     99.9000   1442.1300     32.0000     -0.9900
+    100.0000   1442.1400     32.0100     -0.9900
+    100.2000   1442.1500     32.0100     -0.9900
+    100.3000   1442.1500     32.0100     -0.9900
+    100.4000   1442.1000     32.0100     -1.0000
+    100.6000   1442.1100     32.0200     -1.0000
+    100.7000   1442.1200     32.0200     -1.0000
+    100.8000   1442.0700     32.0200     -1.0100
+    101.0000   1442.0800     32.0300     -1.0100
+    101.1000   1442.0900     32.0400     -1.0100
+    101.2000   1442.0500     32.0400     -1.0200
+    101.4000   1442.0300     32.0200     -1.0200
+    101.5000   1442.0400     32.0300     -1.0200
+    101.7000   1442.0400     32.0300     -1.0200
+    101.8000   1442.0400     32.0300     -1.0200
+    101.9000   1442.0400     32.0300     -1.0200
+    102.1000   1442.0500     32.0300     -1.0200
+    102.2000   1442.0500     32.0300     -1.0200
+    102.3000   1442.0500     32.0300     -1.0200
+    102.5000   1442.1300     32.0500     -1.0100
+    102.6000   1442.1200     32.0400     -1.0100
+    102.8000   1442.1200     32.0300     -1.0100
+    102.9000   1442.1500     32.0500     -1.0100
+    103.0000   1442.1500     32.0500     -1.0100
+    103.2000   1442.1000     32.0500     -1.0200
+    103.3000   1442.1100     32.0600     -1.0200
+    103.4000   1442.0700     32.0700     -1.0300
+    103.6000   1442.0800     32.0700     -1.0300
+    103.7000   1442.0100     32.0600     -1.0400
+    103.8000   1442.0200     32.0600     -1.0400
+    104.0000   1441.9800     32.0700     -1.0500
+    104.1000   1441.9400     32.0700     -1.0600
+    104.3000   1441.9100     32.0900     -1.0700
+    104.4000   1441.8500     32.0800     -1.0800
+    104.5000   1441.8600     32.0900     -1.0800
+    104.7000   1441.7700     32.0900     -1.1000
+    104.8000   1441.7400     32.1100     -1.1100
+    104.9000   1441.7600     32.1200     -1.1100
+    105.1000   1441.7700     32.0900     -1.1000
+    105.2000   1441.8100     32.0800     -1.0900
+    105.4000   1441.8500     32.0700     -1.0800
+    105.5000   1441.8100     32.0800     -1.0900
+    105.6000   1441.8200     32.1200     -1.1000
+    105.8000   1441.8100     32.1500     -1.1100
+    105.9000   1441.7000     32.1400     -1.1400
+    106.0000   1441.7000     32.1400     -1.1400
+    106.2000   1441.6900     32.1300     -1.1400
+    106.3000   1441.6100     32.1100     -1.1500
+    106.4000   1441.6200     32.1200     -1.1500
+    106.6000   1441.6600     32.1400     -1.1500
+    106.7000   1441.7100     32.1400     -1.1400
+    106.9000   1441.7100     32.1400     -1.1400
+    107.0000   1441.6500     32.1300     -1.1500
+    107.1000   1441.6100     32.1400     -1.1600
+    107.3000   1441.6300     32.1500     -1.1600
+    107.4000   1441.5900     32.1500     -1.1700
+    107.5000   1441.5500     32.1600     -1.1800
+    107.7000   1441.5400     32.1500     -1.1800
+    107.8000   1441.5500     32.1600     -1.1800
+    108.0000   1441.5500     32.1600     -1.1800
+    108.1000   1441.5500     32.1600     -1.1800
+    108.2000   1441.5500     32.1600     -1.1800
+    108.4000   1441.5500     32.1600     -1.1800
+    108.5000   1441.5000     32.1500     -1.1900
+    108.6000   1441.5700     32.1600     -1.1800
+    108.8000   1441.5200     32.1600     -1.1900
+    108.9000   1441.5200     32.1600     -1.1900
+    109.0000   1441.5300     32.1700     -1.1900
+    109.2000   1441.5300     32.1700     -1.1900
+    109.3000   1441.5300     32.1700     -1.1900
+    109.5000   1441.5400     32.1700     -1.1900
+    109.6000   1441.5900     32.1700     -1.1800
+    109.7000   1441.5800     32.1600     -1.1800
+    109.9000   1441.6000     32.1700     -1.1800
+    110.0000   1441.6100     32.1700     -1.1800
+    110.1000   1441.6100     32.1700     -1.1800
+    110.3000   1441.6100     32.1700     -1.1800
+    110.4000   1441.6900     32.1900     -1.1700
+    110.6000   1441.6900     32.1900     -1.1700
+    110.7000   1441.6800     32.1800     -1.1700
+    110.8000   1441.6800     32.1800     -1.1700
+    111.0000   1441.7600     32.2000     -1.1600
+    111.1000   1441.7600     32.2000     -1.1600
+    111.2000   1441.7800     32.2100     -1.1600
+    111.4000   1441.7500     32.1900     -1.1600
+    111.5000   1441.7800     32.2100     -1.1600
+    111.6000   1441.7600     32.1900     -1.1600
+    111.8000   1441.7900     32.2100     -1.1600
+    111.9000   1441.7900     32.2100     -1.1600
+    112.1000   1441.7900     32.2100     -1.1600
+    112.2000   1441.7400     32.2100     -1.1700
+    112.3000   1441.7500     32.2200     -1.1700
+    112.5000   1441.7600     32.2200     -1.1700
+    112.6000   1441.7600     32.2200     -1.1700
+    112.7000   1441.7400     32.2000     -1.1700
+    112.9000   1441.7700     32.2200     -1.1700
+    113.0000   1441.7700     32.2200     -1.1700
+    113.1000   1441.7500     32.2000     -1.1700
+    113.3000   1441.7000     32.2000     -1.1800
+    113.4000   1441.7900     32.2300     -1.1700
+    113.6000   1441.7100     32.2100     -1.1800
+    113.7000   1441.7400     32.2300     -1.1800
+    113.8000   1441.7200     32.2100     -1.1800
+    114.0000   1441.7200     32.2100     -1.1800
+    114.1000   1441.7200     32.2100     -1.1800
+    114.2000   1441.7300     32.2100     -1.1800
+    114.4000   1441.7100     32.2300     -1.1900
+    114.5000   1441.6900     32.2200     -1.1900
+    114.7000   1441.7200     32.2400     -1.1900
+    114.8000   1441.7000     32.2200     -1.1900
+    114.9000   1441.7300     32.2400     -1.1900
+    115.1000   1441.7300     32.2400     -1.1900
+    115.2000   1441.6800     32.2400     -1.2000
+    115.3000   1441.6900     32.2500     -1.2000
+    115.5000   1441.7000     32.2600     -1.2000
+    115.6000   1441.7000     32.2600     -1.2000
+    115.7000   1441.7100     32.2500     -1.2000
+    115.9000   1441.6800     32.2300     -1.2000
+    116.0000   1441.6600     32.2500     -1.2100
+    116.2000   1441.6700     32.2600     -1.2100
+    116.3000   1441.6800     32.2700     -1.2100
+    116.4000   1441.6800     32.2700     -1.2100
+    116.6000   1441.6800     32.2700     -1.2100
+    116.7000   1441.6900     32.2700     -1.2100
+    116.8000   1441.7400     32.2700     -1.2000
+    117.0000   1441.6800     32.2600     -1.2100
+    117.1000   1441.7600     32.2800     -1.2000
+    117.3000   1441.7600     32.2800     -1.2000
+    117.4000   1441.7100     32.2700     -1.2100
+    117.5000   1441.7200     32.2800     -1.2100
+    117.7000   1441.7000     32.2700     -1.2100
+    117.8000   1441.7300     32.2900     -1.2100
+    117.9000   1441.7000     32.2700     -1.2100
+    118.1000   1441.6800     32.2900     -1.2200
+    118.2000   1441.6900     32.2900     -1.2200
+    118.3000   1441.6700     32.2800     -1.2200
+    118.5000   1441.6800     32.2800     -1.2200
+    118.6000   1441.6800     32.2800     -1.2200
+    118.8000   1441.6600     32.3000     -1.2300
+    118.9000   1441.6400     32.2800     -1.2300
+    119.0000   1441.6800     32.3100     -1.2300
+    119.2000   1441.6500     32.2900     -1.2300
+    119.3000   1441.6800     32.3100     -1.2300
+    119.4000   1441.6600     32.2900     -1.2300
+    119.6000   1441.6600     32.2900     -1.2300
+    119.7000   1441.6600     32.2900     -1.2300
+    119.8000   1441.7400     32.3100     -1.2200
+    120.0000   1441.6800     32.3000     -1.2300
+    120.1000   1441.6900     32.3000     -1.2300
+    120.3000   1441.7000     32.3100     -1.2300
+    120.4000   1441.7000     32.3100     -1.2300
+    120.5000   1441.7000     32.3100     -1.2300
+    120.7000   1441.7000     32.3100     -1.2300
+    120.8000   1441.7000     32.3100     -1.2300
+    120.9000   1441.7100     32.3100     -1.2300
+    121.1000   1441.7100     32.3100     -1.2300
+    121.2000   1441.7100     32.3100     -1.2300
+    121.4000   1441.7100     32.3100     -1.2300
+    121.5000   1441.6900     32.3300     -1.2400
+    121.6000   1441.7000     32.3300     -1.2400
+    121.8000   1441.7100     32.3400     -1.2400
+    121.9000   1441.7100     32.3400     -1.2400
+    122.0000   1441.6900     32.3200     -1.2400
+    122.2000   1441.6900     32.3200     -1.2400
+    122.3000   1441.6900     32.3200     -1.2400
+    122.4000   1441.7200     32.3400     -1.2400
+    122.6000   1441.7200     32.3400     -1.2400
+    122.7000   1441.7300     32.3400     -1.2400
+    122.9000   1441.7300     32.3400     -1.2400
+    123.0000   1441.7300     32.3400     -1.2400
+    123.1000   1441.7300     32.3400     -1.2400
+    123.3000   1441.7300     32.3400     -1.2400
+    123.4000   1441.7400     32.3400     -1.2400
+    123.5000   1441.7400     32.3400     -1.2400
+    123.7000   1441.7400     32.3400     -1.2400
+    123.8000   1441.6900     32.3400     -1.2500
+    123.9000   1441.7500     32.3400     -1.2400
+    124.1000   1441.7500     32.3400     -1.2400
+    124.2000   1441.7000     32.3400     -1.2500
+    124.4000   1441.7100     32.3400     -1.2500
+    124.5000   1441.7200     32.3500     -1.2500
+    124.6000   1441.7200     32.3500     -1.2500
+    124.8000   1441.7200     32.3500     -1.2500
+    124.9000   1441.7200     32.3500     -1.2500
+    125.0000   1441.7300     32.3500     -1.2500
+    125.2000   1441.7300     32.3500     -1.2500
+    125.3000   1441.7300     32.3500     -1.2500
+    125.5000   1441.7300     32.3500     -1.2500
+    125.6000   1441.6800     32.3500     -1.2700
+    125.7000   1441.6900     32.3500     -1.2700
+    125.9000   1441.7000     32.3600     -1.2700
+    126.0000   1441.6500     32.3600     -1.2800
+    126.1000   1441.6600     32.3700     -1.2800
+    126.3000   1441.6700     32.3700     -1.2800
+    126.4000   1441.6500     32.3500     -1.2800
+    126.5000   1441.6500     32.3500     -1.2800
+    126.7000   1441.6800     32.3700     -1.2800
+    126.8000   1441.6800     32.3700     -1.2800
+    127.0000   1441.6300     32.3700     -1.2900
+    127.1000   1441.6400     32.3800     -1.2900
+    127.2000   1441.6500     32.3800     -1.2900
+    127.4000   1441.6500     32.3800     -1.2900
+    127.5000   1441.6600     32.3800     -1.2900
+    127.6000   1441.6600     32.3800     -1.2900
+    127.8000   1441.6600     32.3800     -1.2900
+    127.9000   1441.6600     32.3800     -1.2900
+    128.0000   1441.6700     32.3800     -1.2900
+    128.2000   1441.6700     32.3800     -1.2900
+    128.3000   1441.6700     32.3800     -1.2900
+    128.5000   1441.7000     32.4000     -1.2900
+    128.6000   1441.7000     32.4000     -1.2900
+    128.7000   1441.7500     32.4000     -1.2800
+    128.9000   1441.7000     32.4000     -1.2900
+    129.0000   1441.7000     32.4000     -1.2900
+    129.1000   1441.7100     32.4000     -1.2900
+    129.3000   1441.7100     32.4000     -1.2900
+    129.4000   1441.7100     32.4000     -1.2900
+    129.6000   1441.7200     32.4000     -1.2900
+    129.7000   1441.7200     32.4000     -1.2900
+    129.8000   1441.7200     32.4000     -1.2900
+    130.0000   1441.6700     32.4000     -1.3000
+    130.1000   1441.6800     32.4100     -1.3000
+    130.2000   1441.6900     32.4100     -1.3000
+    130.4000   1441.6900     32.4100     -1.3000
+    130.5000   1441.6700     32.3900     -1.3000
+    130.6000   1441.7000     32.4100     -1.3000
+    130.8000   1441.6500     32.4100     -1.3100
+    130.9000   1441.7100     32.4200     -1.3000
+    131.1000   1441.6600     32.4200     -1.3100
+    131.2000   1441.7100     32.4200     -1.3000
+    131.3000   1441.7200     32.4200     -1.3000
+    131.5000   1441.7100     32.4100     -1.3000
+    131.6000   1441.7400     32.4300     -1.3000
+    131.7000   1441.7100     32.4100     -1.3000
+    131.9000   1441.6900     32.4300     -1.3100
+    132.0000   1441.6700     32.4200     -1.3100
+    132.1000   1441.6800     32.4200     -1.3100
+    132.3000   1441.7100     32.4400     -1.3100
+    132.4000   1441.7200     32.4400     -1.3100
+    132.6000   1441.7200     32.4400     -1.3100
+    132.7000   1441.7200     32.4400     -1.3100
+    132.8000   1441.7200     32.4400     -1.3100
+    133.0000   1441.7200     32.4400     -1.3100
+    133.1000   1441.7300     32.4400     -1.3100
+    133.2000   1441.7300     32.4400     -1.3100
+    133.4000   1441.6800     32.4400     -1.3200
+    133.5000   1441.7400     32.4500     -1.3100
+    133.6000   1441.7400     32.4500     -1.3100
+    133.8000   1441.6900     32.4400     -1.3200
+    133.9000   1441.7500     32.4500     -1.3100
+    134.1000   1441.7000     32.4500     -1.3200
+    134.2000   1441.7000     32.4500     -1.3200
+    134.3000   1441.7100     32.4500     -1.3200
+    134.5000   1441.7100     32.4500     -1.3200
+    134.6000   1441.6600     32.4500     -1.3300
+    134.7000   1441.6700     32.4600     -1.3300
+    134.9000   1441.6500     32.4400     -1.3300
+    135.0000   1441.6600     32.4400     -1.3300
+    135.2000   1441.7100     32.4400     -1.3200
+    135.3000   1441.7000     32.4400     -1.3200
+    135.4000   1441.7000     32.4300     -1.3200
+    135.6000   1441.7300     32.4500     -1.3200
+    135.7000   1441.7300     32.4500     -1.3200
+    135.8000   1441.7800     32.4500     -1.3100
+    136.0000   1441.8100     32.4700     -1.3100
+    136.1000   1441.8000     32.4600     -1.3100
+    136.2000   1441.8000     32.4600     -1.3100
+    136.4000   1441.8000     32.4600     -1.3100
+    136.5000   1441.8300     32.4800     -1.3100
+    136.7000   1441.8100     32.4600     -1.3100
+    136.8000   1441.8100     32.4600     -1.3100
+    136.9000   1441.8100     32.4600     -1.3100
+    137.1000   1441.8200     32.4600     -1.3100
+    137.2000   1441.8200     32.4600     -1.3100
+    137.3000   1441.8500     32.4800     -1.3100
+    137.5000   1441.7700     32.4600     -1.3200
+    137.6000   1441.8300     32.4700     -1.3100
+    137.7000   1441.8300     32.4700     -1.3100
+    137.9000   1441.7800     32.4600     -1.3200
+    138.0000   1441.8100     32.4900     -1.3200
+    138.2000   1441.8000     32.4700     -1.3200
+    138.3000   1441.8000     32.4700     -1.3200
+    138.4000   1441.8000     32.4700     -1.3200
+    138.6000   1441.7500     32.4700     -1.3300
+    138.7000   1441.7600     32.4800     -1.3300
+    138.8000   1441.7700     32.4800     -1.3300
+    139.0000   1441.7700     32.4800     -1.3300
+    139.1000   1441.8000     32.5000     -1.3300
+    139.2000   1441.7800     32.4800     -1.3300
+    139.4000   1441.7800     32.4800     -1.3300
+    139.5000   1441.7800     32.4800     -1.3300
+    139.7000   1441.7800     32.4800     -1.3300
+    139.8000   1441.8100     32.5000     -1.3300
+    139.9000   1441.7400     32.4800     -1.3400
+    140.1000   1441.7700     32.5100     -1.3400
+    140.2000   1441.7600     32.4900     -1.3400
+    140.3000   1441.7900     32.5100     -1.3400
+    140.5000   1441.7900     32.5100     -1.3400
+    140.6000   1441.7900     32.5100     -1.3400
+    140.8000   1441.7900     32.5100     -1.3400
+    140.9000   1441.7900     32.5100     -1.3400
+    141.0000   1441.8000     32.5100     -1.3400
+    141.2000   1441.8300     32.5300     -1.3400
+    141.3000   1441.7800     32.5300     -1.3500
+    141.4000   1441.8100     32.5200     -1.3400
+    141.6000   1441.7600     32.5200     -1.3500
+    141.7000   1441.7600     32.5200     -1.3500
+    141.8000   1441.8300     32.5300     -1.3400
+    142.0000   1441.8000     32.5400     -1.3500
+    142.1000   1441.8500     32.5400     -1.3400
+    142.3000   1441.7700     32.5200     -1.3500
+    142.4000   1441.8300     32.5200     -1.3400
+    142.5000   1441.8600     32.5400     -1.3400
+    142.7000   1441.8000     32.5300     -1.3500
+    142.8000   1441.8600     32.5400     -1.3400
+    142.9000   1441.8100     32.5400     -1.3500
+    143.1000   1441.8600     32.5400     -1.3400
+    143.2000   1441.8700     32.5400     -1.3400
+    143.3000   1441.8100     32.5300     -1.3500
+    143.5000   1441.8700     32.5400     -1.3400
+    143.6000   1441.8200     32.5400     -1.3500
+    143.8000   1441.8200     32.5400     -1.3500
+    143.9000   1441.8300     32.5400     -1.3500
+    144.0000   1441.8300     32.5400     -1.3500
+    144.2000   1441.8400     32.5400     -1.3500
+    144.3000   1441.8400     32.5400     -1.3500
+    144.4000   1441.8400     32.5400     -1.3500
+    144.6000   1441.8400     32.5400     -1.3500
+    144.7000   1441.8500     32.5400     -1.3500
+    144.8000   1441.8500     32.5400     -1.3500
+    145.0000   1441.8000     32.5400     -1.3600
+    145.1000   1441.8600     32.5500     -1.3500
+    145.3000   1441.8100     32.5500     -1.3600
+    145.4000   1441.8100     32.5500     -1.3600
+    145.5000   1441.8500     32.5800     -1.3600
+    145.7000   1441.8200     32.5600     -1.3600
+    145.8000   1441.8500     32.5800     -1.3600
+    145.9000   1441.8600     32.5800     -1.3600
+    146.1000   1441.8300     32.5500     -1.3600
+    146.2000   1441.8600     32.5800     -1.3600
+    146.3000   1441.8100     32.5800     -1.3700
+    146.5000   1441.8700     32.5800     -1.3600
+    146.6000   1441.8700     32.5800     -1.3600
+    146.8000   1441.8200     32.5700     -1.3700
+    146.9000   1441.8300     32.5800     -1.3700
+    147.0000   1441.8400     32.5900     -1.3700
+    147.2000   1441.8400     32.5900     -1.3700
+    147.3000   1441.8400     32.5900     -1.3700
+    147.4000   1441.8400     32.5900     -1.3700
+    147.6000   1441.8500     32.5900     -1.3700
+    147.7000   1441.8500     32.5900     -1.3700
+    147.8000   1441.8800     32.6100     -1.3700
+    148.0000   1441.8500     32.5900     -1.3700
+    148.1000   1441.8500     32.5900     -1.3700
+    148.3000   1441.8600     32.5900     -1.3700
+    148.4000   1441.8600     32.5900     -1.3700
+    148.5000   1441.8600     32.5900     -1.3700
+    148.7000   1441.8600     32.5900     -1.3700
+    148.8000   1441.8400     32.6100     -1.3800
+    148.9000   1441.9000     32.6100     -1.3700
+    149.1000   1441.9000     32.6100     -1.3700
+    149.2000   1441.9000     32.6100     -1.3700
+    149.4000   1441.9000     32.6100     -1.3700
+    149.5000   1441.8500     32.6100     -1.3800
+    149.6000   1441.9100     32.6100     -1.3700
+    149.8000   1441.8600     32.6100     -1.3800
+    149.9000   1441.8700     32.6100     -1.3800
+    150.0000   1441.8800     32.6200     -1.3800
+    150.2000   1441.8800     32.6200     -1.3800
+    150.3000   1441.8800     32.6200     -1.3800
+    150.4000   1441.8800     32.6200     -1.3800
+    150.6000   1441.8800     32.6200     -1.3800
+    150.7000   1441.8900     32.6200     -1.3800
+    150.9000   1441.8900     32.6200     -1.3800
+    151.0000   1441.8900     32.6200     -1.3800
+    151.1000   1441.8900     32.6200     -1.3800
+    151.3000   1441.8900     32.6200     -1.3800
+    151.4000   1441.9000     32.6200     -1.3800
+    151.5000   1441.9000     32.6200     -1.3800
+    151.7000   1441.9000     32.6200     -1.3800
+    151.8000   1441.9000     32.6200     -1.3800
+    151.9000   1441.9300     32.6400     -1.3800
+    152.1000   1441.9100     32.6200     -1.3800
+    152.2000   1441.8600     32.6200     -1.4000
+    152.4000   1441.9200     32.6200     -1.3800
+    152.5000   1441.8700     32.6200     -1.4000
+    152.6000   1441.9000     32.6400     -1.4000
+    152.8000   1441.8800     32.6300     -1.4000
+    152.9000   1441.9100     32.6500     -1.4000
+    153.0000   1441.9100     32.6500     -1.4000
+    153.2000   1441.8900     32.6300     -1.4000
+    153.3000   1441.9200     32.6500     -1.4000
+    153.4000   1441.9200     32.6500     -1.4000
+    153.6000   1441.9200     32.6500     -1.4000
+    153.7000   1441.9200     32.6500     -1.4000
+    153.9000   1441.9300     32.6500     -1.4000
+    154.0000   1441.9300     32.6500     -1.4000
+    154.1000   1441.9300     32.6500     -1.4000
+    154.3000   1441.9300     32.6500     -1.4000
+    154.4000   1441.9300     32.6500     -1.4000
+    154.5000   1441.9100     32.6300     -1.4000
+    154.7000   1441.9400     32.6500     -1.4000
+    154.8000   1441.9400     32.6500     -1.4000
+    154.9000   1441.9400     32.6500     -1.4000
+    155.1000   1441.9500     32.6500     -1.4000
+    155.2000   1441.9500     32.6500     -1.4000
+    155.4000   1441.9500     32.6500     -1.4000
+    155.5000   1441.9500     32.6500     -1.4000
+    155.6000   1441.9500     32.6500     -1.4000
+    155.8000   1441.9600     32.6500     -1.4000
+    155.9000   1441.9600     32.6500     -1.4000
+    156.0000   1441.9900     32.6700     -1.4000
+    156.2000   1441.9900     32.6700     -1.4000
+    156.3000   1441.9900     32.6700     -1.4000
+    156.4000   1441.9900     32.6700     -1.4000
+    156.6000   1442.0000     32.6700     -1.4000
+    156.7000   1442.0000     32.6700     -1.4000
+    156.9000   1442.0000     32.6700     -1.4000
+    157.0000   1442.0000     32.6700     -1.4000
+    157.1000   1442.0000     32.6700     -1.4000
+    157.3000   1441.9500     32.6700     -1.4100
+    157.4000   1442.0200     32.6700     -1.4000
+    157.5000   1441.9700     32.6700     -1.4100
+    157.7000   1441.9700     32.6700     -1.4100
+    157.8000   1441.9800     32.6800     -1.4100
+    157.9000   1441.9800     32.6800     -1.4100
+    158.1000   1441.9800     32.6800     -1.4100
+    158.2000   1441.9900     32.6800     -1.4100
+    158.4000   1441.9900     32.6800     -1.4100
+    158.5000   1442.0200     32.7000     -1.4100
+    158.6000   1441.9900     32.6800     -1.4100
+    158.8000   1442.0200     32.7000     -1.4100
+    158.9000   1442.0000     32.6800     -1.4100
+    159.0000   1442.0000     32.6800     -1.4100
+    159.2000   1442.0000     32.6800     -1.4100
+    159.3000   1442.0300     32.7000     -1.4100
+    159.4000   1442.0300     32.7000     -1.4100
+    159.6000   1441.9800     32.7000     -1.4200
+    159.7000   1441.9900     32.7000     -1.4200
+    159.9000   1442.0000     32.7100     -1.4200
+    160.0000   1441.9800     32.6900     -1.4200
+    160.1000   1442.0100     32.7100     -1.4200
+    160.3000   1442.0100     32.7100     -1.4200
+    160.4000   1442.0100     32.7100     -1.4200
+    160.5000   1442.0100     32.7100     -1.4200
+    160.7000   1442.0200     32.7100     -1.4200
+    160.8000   1442.0200     32.7100     -1.4200
+    160.9000   1442.0200     32.7100     -1.4200
+    161.1000   1442.0200     32.7100     -1.4200
+    161.2000   1442.0200     32.7100     -1.4200
+    161.4000   1442.0300     32.7100     -1.4200
+    161.5000   1442.0300     32.7100     -1.4200
+    161.6000   1442.0300     32.7100     -1.4200
+    161.8000   1442.0300     32.7100     -1.4200
+    161.9000   1442.0300     32.7100     -1.4200
+    162.0000   1442.0400     32.7100     -1.4200
+    162.2000   1442.0400     32.7100     -1.4200
+    162.3000   1442.0400     32.7100     -1.4200
+    162.4000   1441.9900     32.7100     -1.4300
+    162.6000   1442.0500     32.7100     -1.4200
+    162.7000   1442.0000     32.7100     -1.4300
+    162.9000   1442.0600     32.7100     -1.4200
+    163.0000   1442.0600     32.7100     -1.4200
+    163.1000   1442.0300     32.7300     -1.4300
+    163.3000   1442.0400     32.7300     -1.4300
+    163.4000   1442.0500     32.7400     -1.4300
+    163.5000   1442.0500     32.7400     -1.4300
+    163.7000   1442.0500     32.7400     -1.4300
+    163.8000   1442.0600     32.7400     -1.4300
+    163.9000   1442.0600     32.7400     -1.4300
+    164.1000   1442.0600     32.7400     -1.4300
+    164.2000   1442.0600     32.7400     -1.4300
+    164.4000   1442.0600     32.7400     -1.4300
+    164.5000   1442.0700     32.7400     -1.4300
+    164.6000   1442.0700     32.7400     -1.4300
+    164.8000   1442.0700     32.7400     -1.4300
+    164.9000   1442.0700     32.7400     -1.4300
+    165.0000   1442.0700     32.7400     -1.4300
+    165.2000   1442.0800     32.7400     -1.4300
+    165.3000   1442.0800     32.7400     -1.4300
+    165.4000   1442.0800     32.7400     -1.4300
+    165.6000   1442.0800     32.7400     -1.4300
+    165.7000   1442.0900     32.7400     -1.4300
+    165.9000   1442.0900     32.7400     -1.4300
+    166.0000   1442.0900     32.7400     -1.4300
+    166.1000   1442.0900     32.7400     -1.4300
+    166.3000   1442.0900     32.7400     -1.4300
+    166.4000   1442.1000     32.7400     -1.4300
+    166.5000   1442.0700     32.7600     -1.4400
+    166.7000   1442.1400     32.7600     -1.4300
+    166.8000   1442.0900     32.7600     -1.4400
+    166.9000   1442.1400     32.7600     -1.4300
+    167.1000   1442.1400     32.7600     -1.4300
+    167.2000   1442.0800     32.7600     -1.4400
+    167.4000   1442.0900     32.7600     -1.4400
+    167.5000   1442.1000     32.7700     -1.4400
+    167.6000   1442.1100     32.7700     -1.4400
+    167.8000   1442.1100     32.7700     -1.4400
+    167.9000   1442.1100     32.7700     -1.4400
+    168.0000   1442.1100     32.7700     -1.4400
+    168.2000   1442.1200     32.7700     -1.4400
+    168.3000   1442.2000     32.7900     -1.4300
+    168.4000   1442.1600     32.7600     -1.4300
+    168.6000   1442.1300     32.7800     -1.4400
+    168.7000   1442.1400     32.7800     -1.4400
+    168.9000   1442.1500     32.7900     -1.4400
+    169.0000   1442.1600     32.7900     -1.4400
+    169.1000   1442.1600     32.7900     -1.4400
+    169.3000   1442.1600     32.7900     -1.4400
+    169.4000   1442.2100     32.7900     -1.4300
+    169.5000   1442.2100     32.7800     -1.4300
+    169.7000   1442.2000     32.7800     -1.4300
+    169.8000   1442.1500     32.7800     -1.4400
+    169.9000   1442.1600     32.7800     -1.4400
+    170.1000   1442.1700     32.7900     -1.4400
+    170.2000   1442.1700     32.7900     -1.4400
+    170.4000   1442.1800     32.7900     -1.4400
+    170.5000   1442.1800     32.7900     -1.4400
+    170.6000   1442.1300     32.7900     -1.4500
+    170.8000   1442.1400     32.7900     -1.4500
+    170.9000   1442.1500     32.8000     -1.4500
+    171.0000   1442.1500     32.8000     -1.4500
+    171.2000   1442.1500     32.8000     -1.4500
+    171.3000   1442.1600     32.8000     -1.4500
+    171.4000   1442.1600     32.8000     -1.4500
+    171.6000   1442.1600     32.8000     -1.4500
+    171.7000   1442.1600     32.8000     -1.4500
+    171.9000   1442.1600     32.8000     -1.4500
+    172.0000   1442.1700     32.8000     -1.4500
+    172.1000   1442.1700     32.8000     -1.4500
+    172.3000   1442.1200     32.8000     -1.4600
+    172.4000   1442.1800     32.8000     -1.4500
+    172.5000   1442.1800     32.8000     -1.4500
+    172.7000   1442.1200     32.8000     -1.4600
+    172.8000   1442.1900     32.8000     -1.4500
+    172.9000   1442.1400     32.8000     -1.4600
+    173.1000   1442.1400     32.8000     -1.4600
+    173.2000   1442.1500     32.8100     -1.4600
+    173.4000   1442.1500     32.8100     -1.4600
+    173.5000   1442.1500     32.8100     -1.4600
+    173.6000   1442.1600     32.8100     -1.4600
+    173.8000   1442.1600     32.8100     -1.4600
+    173.9000   1442.1600     32.8100     -1.4600
+    174.0000   1442.1600     32.8100     -1.4600
+    174.2000   1442.1600     32.8100     -1.4600
+    174.3000   1442.1700     32.8100     -1.4600
+    174.4000   1442.2000     32.8300     -1.4600
+    174.6000   1442.2000     32.8300     -1.4600
+    174.7000   1442.2000     32.8300     -1.4600
+    174.9000   1442.2000     32.8300     -1.4600
+    175.0000   1442.2000     32.8300     -1.4600
+    175.1000   1442.2100     32.8300     -1.4600
+    175.3000   1442.2100     32.8300     -1.4600
+    175.4000   1442.1600     32.8300     -1.4700
+    175.5000   1442.2200     32.8300     -1.4600
+    175.7000   1442.1700     32.8300     -1.4700
+    175.8000   1442.2300     32.8300     -1.4600
+    175.9000   1442.2300     32.8300     -1.4600
+    176.1000   1442.1700     32.8300     -1.4700
+    176.2000   1442.1800     32.8300     -1.4700
+    176.4000   1442.1900     32.8400     -1.4700
+    176.5000   1442.1900     32.8400     -1.4700
+    176.6000   1442.1900     32.8400     -1.4700
+    176.8000   1442.2000     32.8400     -1.4700
+    176.9000   1442.2000     32.8400     -1.4700
+    177.0000   1442.2000     32.8400     -1.4700
+    177.2000   1442.2000     32.8400     -1.4700
+    177.3000   1442.2000     32.8400     -1.4700
+    177.4000   1442.2100     32.8400     -1.4700
+    177.6000   1442.2100     32.8400     -1.4700
+    177.7000   1442.2100     32.8400     -1.4700
+    177.9000   1442.2400     32.8600     -1.4700
+    178.0000   1442.2400     32.8600     -1.4700
+    178.1000   1442.2400     32.8600     -1.4700
+    178.3000   1442.2500     32.8600     -1.4700
+    178.4000   1442.2000     32.8600     -1.4800
+    178.5000   1442.2100     32.8600     -1.4800
+    178.7000   1442.2200     32.8700     -1.4800
+    178.8000   1442.2200     32.8700     -1.4800
+    178.9000   1442.2200     32.8700     -1.4800
+    179.1000   1442.2000     32.8500     -1.4800
+    179.2000   1442.2000     32.8500     -1.4800
+    179.4000   1442.2300     32.8700     -1.4800
+    179.5000   1442.1800     32.8700     -1.4900
+    179.6000   1442.2400     32.8800     -1.4800
+    179.8000   1442.2400     32.8800     -1.4800
+    179.9000   1442.2400     32.8700     -1.4800
+    180.0000   1442.2400     32.8700     -1.4800
+    180.2000   1442.1900     32.8700     -1.4900
+    180.3000   1442.2500     32.8800     -1.4800
+    180.4000   1442.2000     32.8800     -1.4900
+    180.6000   1442.2600     32.8800     -1.4800
+    180.7000   1442.2100     32.8700     -1.4900
+    180.9000   1442.2100     32.8700     -1.4900
+    181.0000   1442.2700     32.8800     -1.4800
+    181.1000   1442.2100     32.8700     -1.4900
+    181.3000   1442.2100     32.8700     -1.4900
+    181.4000   1442.2800     32.8800     -1.4800
+    181.5000   1442.2200     32.8700     -1.4900
+    181.7000   1442.2700     32.8700     -1.4800
+    181.8000   1442.2200     32.8700     -1.4900
+    181.9000   1442.2200     32.8700     -1.4900
+    182.1000   1442.2300     32.8800     -1.4900
+    182.2000   1442.2600     32.9000     -1.4900
+    182.3000   1442.2700     32.9000     -1.4900
+    182.5000   1442.2700     32.9000     -1.4900
+    182.6000   1442.2700     32.9000     -1.4900
+    182.8000   1442.2700     32.9000     -1.4900
+    182.9000   1442.2700     32.9000     -1.4900
+    183.0000   1442.2800     32.9000     -1.4900
+    183.2000   1442.2800     32.9000     -1.4900
+    183.3000   1442.2800     32.9000     -1.4900
+    183.4000   1442.2300     32.9000     -1.5000
+    183.6000   1442.2400     32.9100     -1.5000
+    183.7000   1442.3000     32.9100     -1.4900
+    183.8000   1442.2700     32.9300     -1.5000
+    184.0000   1442.2800     32.9300     -1.5000
+    184.1000   1442.2900     32.9300     -1.5000
+    184.3000   1442.2900     32.9300     -1.5000
+    184.4000   1442.3400     32.9300     -1.4900
+    184.5000   1442.2800     32.9300     -1.5000
+    184.7000   1442.2900     32.9300     -1.5000
+    184.8000   1442.3000     32.9300     -1.5000
+    184.9000   1442.3000     32.9300     -1.5000
+    185.1000   1442.3000     32.9300     -1.5000
+    185.2000   1442.3000     32.9300     -1.5000
+    185.3000   1442.3000     32.9300     -1.5000
+    185.5000   1442.3100     32.9300     -1.5000
+    185.6000   1442.3100     32.9300     -1.5000
+    185.8000   1442.3100     32.9300     -1.5000
+    185.9000   1442.3100     32.9300     -1.5000
+    186.0000   1442.3200     32.9300     -1.5000
+    186.2000   1442.3200     32.9300     -1.5000
+    186.3000   1442.3200     32.9300     -1.5000
+    186.4000   1442.3200     32.9300     -1.5000
+    186.6000   1442.3200     32.9300     -1.5000
+    186.7000   1442.3300     32.9300     -1.5000
+    186.8000   1442.3300     32.9300     -1.5000
+    187.0000   1442.3600     32.9500     -1.5000
+    187.1000   1442.3600     32.9500     -1.5000
+    187.3000   1442.3300     32.9300     -1.5000
+    187.4000   1442.3600     32.9500     -1.5000
+    187.5000   1442.3700     32.9500     -1.5000
+    187.7000   1442.3200     32.9500     -1.5100
+    187.8000   1442.3800     32.9600     -1.5000
+    187.9000   1442.3300     32.9600     -1.5100
+    188.1000   1442.3800     32.9600     -1.5000
+    188.2000   1442.3300     32.9600     -1.5100
+    188.3000   1442.3400     32.9600     -1.5100
+    188.5000   1442.4000     32.9600     -1.5000
+    188.6000   1442.3400     32.9600     -1.5100
+    188.8000   1442.3400     32.9600     -1.5100
+    188.9000   1442.3500     32.9600     -1.5100
+    189.0000   1442.3500     32.9600     -1.5100
+    189.2000   1442.3600     32.9600     -1.5100
+    189.3000   1442.3600     32.9600     -1.5100
+    189.4000   1442.3600     32.9600     -1.5100
+    189.6000   1442.3600     32.9600     -1.5100
+    189.7000   1442.3600     32.9600     -1.5100
+    189.8000   1442.3700     32.9600     -1.5100
+    190.0000   1442.3700     32.9600     -1.5100
+    190.1000   1442.4000     32.9800     -1.5100
+    190.2000   1442.4000     32.9800     -1.5100
+    190.4000   1442.4000     32.9800     -1.5100
+    190.5000   1442.4000     32.9800     -1.5100
+    190.7000   1442.4100     32.9800     -1.5100
+    190.8000   1442.4100     32.9800     -1.5100
+    190.9000   1442.4100     32.9800     -1.5100
+    191.1000   1442.4100     32.9800     -1.5100
+    191.2000   1442.4200     32.9800     -1.5100
+    191.3000   1442.4200     32.9800     -1.5100
+    191.5000   1442.4200     32.9800     -1.5100
+    191.6000   1442.4200     32.9800     -1.5100
+    191.7000   1442.4200     32.9800     -1.5100
+    191.9000   1442.4300     32.9800     -1.5100
+    192.0000   1442.3800     32.9800     -1.5300
+    192.2000   1442.4400     32.9900     -1.5100
+    192.3000   1442.4400     32.9900     -1.5100
+    192.4000   1442.3800     32.9800     -1.5300
+    192.6000   1442.4700     33.0100     -1.5100
+    192.7000   1442.4500     32.9900     -1.5100
+    192.8000   1442.4400     32.9800     -1.5100
+    193.0000   1442.4700     33.0000     -1.5100
+    193.1000   1442.4200     33.0000     -1.5300
+    193.2000   1442.4800     33.0100     -1.5100
+    193.4000   1442.4800     33.0100     -1.5100
+    193.5000   1442.4800     33.0000     -1.5100
+    193.7000   1442.4800     33.0000     -1.5100
+    193.8000   1442.4300     33.0000     -1.5300
+    193.9000   1442.4900     33.0100     -1.5100
+    194.1000   1442.4400     33.0100     -1.5300
+    194.2000   1442.4500     33.0100     -1.5300
+    194.3000   1442.4600     33.0100     -1.5300
+    194.5000   1442.4600     33.0100     -1.5300
+    194.6000   1442.4600     33.0100     -1.5300
+    194.7000   1442.4600     33.0100     -1.5300
+    194.9000   1442.4600     33.0100     -1.5300
+    195.0000   1442.4700     33.0100     -1.5300
+    195.2000   1442.4700     33.0100     -1.5300
+    195.3000   1442.5000     33.0300     -1.5300
+    195.4000   1442.5000     33.0300     -1.5300
+    195.6000   1442.4700     33.0100     -1.5300
+    195.7000   1442.4800     33.0100     -1.5300
+    195.8000   1442.5100     33.0300     -1.5300
+    196.0000   1442.5100     33.0300     -1.5300
+    196.1000   1442.5100     33.0300     -1.5300
+    196.2000   1442.5100     33.0300     -1.5300
+    196.4000   1442.5200     33.0300     -1.5300
+    196.5000   1442.5200     33.0300     -1.5300
+    196.6000   1442.5200     33.0300     -1.5300
+    196.8000   1442.5200     33.0300     -1.5300
+    196.9000   1442.5200     33.0300     -1.5300
+    197.1000   1442.5300     33.0300     -1.5300
+    197.2000   1442.5300     33.0300     -1.5300
+    197.3000   1442.5300     33.0300     -1.5300
+    197.5000   1442.5300     33.0300     -1.5300
+    197.6000   1442.5300     33.0300     -1.5300
+    197.7000   1442.5600     33.0500     -1.5300
+    197.9000   1442.5700     33.0500     -1.5300
+    198.0000   1442.5700     33.0500     -1.5300
+    198.1000   1442.5400     33.0300     -1.5300
+    198.3000   1442.5700     33.0500     -1.5300
+    198.4000   1442.5700     33.0500     -1.5300
+    198.6000   1442.5800     33.0500     -1.5300
+    198.7000   1442.5800     33.0500     -1.5300
+    198.8000   1442.5800     33.0500     -1.5300
+    199.0000   1442.5800     33.0500     -1.5300
+    199.1000   1442.5800     33.0500     -1.5300
+    199.2000   1442.5900     33.0500     -1.5300
+    199.4000   1442.5900     33.0500     -1.5300
+    199.5000   1442.5900     33.0500     -1.5300
+    199.6000   1442.5900     33.0500     -1.5300
+    199.8000   1442.6000     33.0500     -1.5300
+    199.9000   1442.6000     33.0500     -1.5300
+    200.1000   1442.6000     33.0500     -1.5300
+    200.2000   1442.6000     33.0500     -1.5300
+    200.3000   1442.6300     33.0700     -1.5300
+    200.5000   1442.6300     33.0700     -1.5300
+    200.6000   1442.6400     33.0700     -1.5300
+    200.7000   1442.6400     33.0700     -1.5300
+    200.9000   1442.6400     33.0700     -1.5300
+    201.0000   1442.6400     33.0700     -1.5300
+    201.1000   1442.6400     33.0700     -1.5300
+    201.3000   1442.6500     33.0700     -1.5300
+    201.4000   1442.6500     33.0700     -1.5300
+    201.5000   1442.6500     33.0700     -1.5300
+    201.7000   1442.6500     33.0700     -1.5300
+    201.8000   1442.6800     33.0900     -1.5300
+    202.0000   1442.6800     33.0900     -1.5300
+    202.1000   1442.6900     33.0900     -1.5300
+    202.2000   1442.6900     33.0900     -1.5300
+    202.4000   1442.6900     33.0900     -1.5300
+    202.5000   1442.6900     33.0900     -1.5300
+    202.6000   1442.7000     33.0900     -1.5300
+    202.8000   1442.7000     33.0900     -1.5300
+    202.9000   1442.7000     33.0900     -1.5300
+    203.0000   1442.7300     33.1100     -1.5300
+    203.2000   1442.7800     33.1100     -1.5100
+    203.3000   1442.7300     33.1000     -1.5300
+    203.5000   1442.7300     33.1000     -1.5300
+    203.6000   1442.7400     33.1100     -1.5300
+    203.7000   1442.7400     33.1100     -1.5300
+    203.9000   1442.7400     33.1100     -1.5300
+    204.0000   1442.7400     33.1100     -1.5300
+    204.1000   1442.7500     33.1100     -1.5300
+    204.3000   1442.7500     33.1100     -1.5300
+    204.4000   1442.7800     33.1300     -1.5300
+    204.5000   1442.7500     33.1100     -1.5300
+    204.7000   1442.7800     33.1300     -1.5300
+    204.8000   1442.7800     33.1300     -1.5300
+    205.0000   1442.7900     33.1300     -1.5300
+    205.1000   1442.8400     33.1300     -1.5100
+    205.2000   1442.7800     33.1200     -1.5300
+    205.4000   1442.7900     33.1200     -1.5300
+    205.5000   1442.8500     33.1300     -1.5100
+    205.6000   1442.7900     33.1200     -1.5300
+    205.8000   1442.8400     33.1200     -1.5100
+    205.9000   1442.8500     33.1200     -1.5100
+    206.0000   1442.7900     33.1200     -1.5300
+    206.2000   1442.8800     33.1400     -1.5100
+    206.3000   1442.8800     33.1400     -1.5100
+    206.4000   1442.8700     33.1400     -1.5100
+    206.6000   1442.8800     33.1400     -1.5100
+    206.7000   1442.8800     33.1400     -1.5100
+    206.9000   1442.8800     33.1400     -1.5100
+    207.0000   1442.8800     33.1400     -1.5100
+    207.1000   1442.9100     33.1600     -1.5100
+    207.3000   1442.9100     33.1600     -1.5100
+    207.4000   1442.9200     33.1600     -1.5100
+    207.5000   1442.9200     33.1600     -1.5100
+    207.7000   1442.8900     33.1300     -1.5100
+    207.8000   1442.9200     33.1600     -1.5100
+    207.9000   1442.9200     33.1600     -1.5100
+    208.1000   1442.9300     33.1600     -1.5100
+    208.2000   1442.9300     33.1500     -1.5100
+    208.4000   1442.9300     33.1500     -1.5100
+    208.5000   1442.9300     33.1500     -1.5100
+    208.6000   1442.9300     33.1500     -1.5100
+    208.8000   1442.9700     33.1800     -1.5100
+    208.9000   1442.9400     33.1500     -1.5100
+    209.0000   1442.9400     33.1500     -1.5100
+    209.2000   1442.9700     33.1700     -1.5100
+    209.3000   1442.9700     33.1700     -1.5100
+    209.4000   1442.9800     33.1700     -1.5100
+    209.6000   1442.9800     33.1700     -1.5100
+    209.7000   1442.9800     33.1700     -1.5100
+    209.8000   1442.9800     33.1700     -1.5100
+    210.0000   1442.9800     33.1700     -1.5100
+    210.1000   1442.9900     33.1700     -1.5100
+    210.3000   1443.0400     33.1700     -1.5000
+    210.4000   1442.9800     33.1700     -1.5100
+    210.5000   1443.0600     33.1900     -1.5000
+    210.7000   1443.0700     33.1900     -1.5000
+    210.8000   1443.0600     33.1800     -1.5000
+    210.9000   1443.0600     33.1800     -1.5000
+    211.1000   1443.0600     33.1800     -1.5000
+    211.2000   1443.0700     33.1800     -1.5000
+    211.3000   1443.0700     33.1800     -1.5000
+    211.5000   1443.0700     33.1800     -1.5000
+    211.6000   1443.0700     33.1800     -1.5000
+    211.8000   1443.1000     33.2000     -1.5000
+    211.9000   1443.1000     33.2000     -1.5000
+    212.0000   1443.1100     33.2000     -1.5000
+    212.2000   1443.1100     33.2000     -1.5000
+    212.3000   1443.1100     33.2000     -1.5000
+    212.4000   1443.1100     33.2000     -1.5000
+    212.6000   1443.1200     33.2000     -1.5000
+    212.7000   1443.1200     33.2000     -1.5000
+    212.8000   1443.1200     33.2000     -1.5000
+    213.0000   1443.1200     33.2000     -1.5000
+    213.1000   1443.1200     33.2000     -1.5000
+    213.2000   1443.1300     33.2000     -1.5000
+    213.4000   1443.1300     33.2000     -1.5000
+    213.5000   1443.1300     33.2000     -1.5000
+    213.7000   1443.1300     33.2000     -1.5000
+    213.8000   1443.1600     33.2200     -1.5000
+    213.9000   1443.1400     33.2000     -1.5000
+    214.1000   1443.1400     33.2000     -1.5000
+    214.2000   1443.1700     33.2200     -1.5000
+    214.3000   1443.1700     33.2200     -1.5000
+    214.5000   1443.1700     33.2200     -1.5000
+    214.6000   1443.1700     33.2200     -1.5000
+    214.7000   1443.1800     33.2200     -1.5000
+    214.9000   1443.1800     33.2200     -1.5000
+    215.0000   1443.2100     33.2400     -1.5000
+    215.2000   1443.1800     33.2200     -1.5000
+    215.3000   1443.2400     33.2200     -1.4900
+    215.4000   1443.2600     33.2400     -1.4900
+    215.6000   1443.2000     33.2300     -1.5000
+    215.7000   1443.2100     33.2300     -1.5000
+    215.8000   1443.2200     33.2400     -1.5000
+    216.0000   1443.2200     33.2400     -1.5000
+    216.1000   1443.3100     33.2600     -1.4900
+    216.2000   1443.2500     33.2600     -1.5000
+    216.4000   1443.2500     33.2600     -1.5000
+    216.5000   1443.3100     33.2600     -1.4900
+    216.6000   1443.3100     33.2500     -1.4900
+    216.8000   1443.3000     33.2500     -1.4900
+    216.9000   1443.3300     33.2700     -1.4900
+    217.1000   1443.3300     33.2700     -1.4900
+    217.2000   1443.3600     33.2900     -1.4900
+    217.3000   1443.3600     33.2900     -1.4900
+    217.5000   1443.4200     33.2900     -1.4800
+    217.6000   1443.3600     33.2800     -1.4900
+    217.7000   1443.4400     33.3000     -1.4800
+    217.9000   1443.4400     33.3000     -1.4800
+    218.0000   1443.4400     33.3000     -1.4800
+    218.1000   1443.4400     33.3000     -1.4800
+    218.3000   1443.4700     33.3200     -1.4800
+    218.4000   1443.4700     33.3200     -1.4800
+    218.6000   1443.4700     33.3200     -1.4800
+    218.7000   1443.4800     33.3200     -1.4800
+    218.8000   1443.4800     33.3200     -1.4800
+    219.0000   1443.4800     33.3200     -1.4800
+    219.1000   1443.4800     33.3200     -1.4800
+    219.2000   1443.4800     33.3200     -1.4800
+    219.4000   1443.5100     33.3400     -1.4800
+    219.5000   1443.5200     33.3400     -1.4800
+    219.6000   1443.5200     33.3400     -1.4800
+    219.8000   1443.5200     33.3400     -1.4800
+    219.9000   1443.5200     33.3400     -1.4800
+    220.0000   1443.6000     33.3600     -1.4700
+    220.2000   1443.6000     33.3500     -1.4700
+    220.3000   1443.6200     33.3700     -1.4700
+    220.5000   1443.6200     33.3700     -1.4700
+    220.6000   1443.6200     33.3700     -1.4700
+    220.7000   1443.7100     33.3900     -1.4600
+    220.9000   1443.7000     33.3800     -1.4600
+    221.0000   1443.6900     33.3700     -1.4600
+    221.1000   1443.7000     33.3700     -1.4600
+    221.3000   1443.7000     33.3700     -1.4600
+    221.4000   1443.7300     33.3900     -1.4600
+    221.5000   1443.7300     33.3900     -1.4600
+    221.7000   1443.7300     33.3900     -1.4600
+    221.8000   1443.7300     33.3900     -1.4600
+    222.0000   1443.7400     33.3900     -1.4600
+    222.1000   1443.8200     33.4100     -1.4500
+    222.2000   1443.8100     33.4100     -1.4500
+    222.4000   1443.7800     33.3800     -1.4500
+    222.5000   1443.8100     33.4000     -1.4500
+    222.6000   1443.8100     33.4000     -1.4500
+    222.8000   1443.8100     33.4000     -1.4500
+    222.9000   1443.8100     33.4000     -1.4500
+    223.0000   1443.8200     33.4000     -1.4500
+    223.2000   1443.8200     33.4000     -1.4500
+    223.3000   1443.8500     33.4200     -1.4500
+    223.4000   1443.8500     33.4200     -1.4500
+    223.6000   1443.8500     33.4200     -1.4500
+    223.7000   1443.8600     33.4200     -1.4500
+    223.9000   1443.8600     33.4200     -1.4500
+    224.0000   1443.8600     33.4200     -1.4500
+    224.1000   1443.8600     33.4200     -1.4500
+    224.3000   1443.9200     33.4200     -1.4400
+    224.4000   1443.8600     33.4200     -1.4500
+    224.5000   1443.9100     33.4200     -1.4400
+    224.7000   1443.9400     33.4400     -1.4400
+    224.8000   1443.9400     33.4300     -1.4400
+    224.9000   1443.9400     33.4300     -1.4400
+    225.1000   1443.9400     33.4300     -1.4400
+    225.2000   1443.9400     33.4300     -1.4400
+    225.4000   1443.9400     33.4300     -1.4400
+    225.5000   1443.9500     33.4300     -1.4400
+    225.6000   1443.9500     33.4300     -1.4400
+    225.8000   1443.9500     33.4300     -1.4400
+    225.9000   1443.9500     33.4300     -1.4400
+    226.0000   1443.9500     33.4300     -1.4400
+    226.2000   1443.9600     33.4300     -1.4400
+    226.3000   1443.9600     33.4300     -1.4400
+    226.4000   1443.9900     33.4500     -1.4400
+    226.6000   1444.0400     33.4500     -1.4300
+    226.7000   1443.9800     33.4400     -1.4400
+    226.8000   1444.0400     33.4400     -1.4300
+    227.0000   1444.0400     33.4400     -1.4300
+    227.1000   1444.0600     33.4600     -1.4300
+    227.3000   1444.0600     33.4600     -1.4300
+    227.4000   1444.0700     33.4600     -1.4300
+    227.5000   1444.1200     33.4600     -1.4200
+    227.7000   1444.0900     33.4700     -1.4300
+    227.8000   1444.1200     33.4500     -1.4200
+    227.9000   1444.1500     33.4700     -1.4200
+    228.1000   1444.1400     33.4600     -1.4200
+    228.2000   1444.1400     33.4600     -1.4200
+    228.3000   1444.1400     33.4600     -1.4200
+    228.5000   1444.1500     33.4600     -1.4200
+    228.6000   1444.1800     33.4800     -1.4200
+    228.7000   1444.1800     33.4800     -1.4200
+    228.9000   1444.2300     33.4800     -1.4100
+    229.0000   1444.2500     33.5000     -1.4100
+    229.2000   1444.2500     33.4900     -1.4100
+    229.3000   1444.2500     33.4900     -1.4100
+    229.4000   1444.2500     33.4900     -1.4100
+    229.6000   1444.2500     33.4900     -1.4100
+    229.7000   1444.2800     33.5100     -1.4100
+    229.8000   1444.2900     33.5100     -1.4100
+    230.0000   1444.3400     33.5100     -1.4000
+    230.1000   1444.3300     33.5100     -1.4000
+    230.2000   1444.3300     33.5000     -1.4000
+    230.4000   1444.3600     33.5200     -1.4000
+    230.5000   1444.3600     33.5200     -1.4000
+    230.7000   1444.3600     33.5200     -1.4000
+    230.8000   1444.3600     33.5200     -1.4000
+    230.9000   1444.4500     33.5400     -1.3800
+    231.1000   1444.4400     33.5400     -1.3800
+    231.2000   1444.4300     33.5300     -1.3800
+    231.3000   1444.4300     33.5300     -1.3800
+    231.5000   1444.4400     33.5300     -1.3800
+    231.6000   1444.4700     33.5500     -1.3800
+    231.7000   1444.4700     33.5500     -1.3800
+    231.9000   1444.4700     33.5500     -1.3800
+    232.0000   1444.5200     33.5500     -1.3700
+    232.1000   1444.5200     33.5400     -1.3700
+    232.3000   1444.5400     33.5600     -1.3700
+    232.4000   1444.5400     33.5600     -1.3700
+    232.6000   1444.5400     33.5600     -1.3700
+    232.7000   1444.5500     33.5600     -1.3700
+    232.8000   1444.5800     33.5800     -1.3700
+    233.0000   1444.6300     33.5800     -1.3600
+    233.1000   1444.6200     33.5700     -1.3600
+    233.2000   1444.6200     33.5600     -1.3600
+    233.4000   1444.6500     33.5900     -1.3600
+    233.5000   1444.6500     33.5900     -1.3600
+    233.6000   1444.7300     33.6100     -1.3500
+    233.8000   1444.7300     33.6000     -1.3500
+    233.9000   1444.7200     33.5900     -1.3500
+    234.0000   1444.7200     33.5900     -1.3500
+    234.2000   1444.7200     33.5900     -1.3500
+    234.3000   1444.7300     33.5900     -1.3500
+    234.5000   1444.7300     33.5900     -1.3500
+    234.6000   1444.7600     33.6100     -1.3500
+    234.7000   1444.7600     33.6100     -1.3500
+    234.9000   1444.7600     33.6100     -1.3500
+    235.0000   1444.8200     33.6100     -1.3400
+    235.1000   1444.8100     33.6100     -1.3400
+    235.3000   1444.8300     33.6200     -1.3400
+    235.4000   1444.8800     33.6200     -1.3300
+    235.5000   1444.8800     33.6100     -1.3300
+    235.7000   1444.9000     33.6300     -1.3300
+    235.8000   1444.9300     33.6500     -1.3300
+    235.9000   1444.9300     33.6500     -1.3300
+    236.1000   1444.9300     33.6500     -1.3300
+    236.2000   1444.9900     33.6500     -1.3200
+    236.4000   1444.9800     33.6400     -1.3200
+    236.5000   1445.0000     33.6600     -1.3200
+    236.6000   1445.0100     33.6600     -1.3200
+    236.8000   1445.0100     33.6600     -1.3200
+    236.9000   1445.0100     33.6600     -1.3200
+    237.0000   1445.0900     33.6800     -1.3100
+    237.2000   1445.0800     33.6700     -1.3100
+    237.3000   1445.0800     33.6700     -1.3100
+    237.4000   1445.0800     33.6700     -1.3100
+    237.6000   1445.1100     33.6900     -1.3100
+    237.7000   1445.1600     33.6900     -1.3000
+    237.9000   1445.1600     33.6800     -1.3000
+    238.0000   1445.1800     33.6900     -1.3000
+    238.1000   1445.1800     33.6900     -1.3000
+    238.3000   1445.1800     33.6900     -1.3000
+    238.4000   1445.2400     33.6900     -1.2900
+    238.5000   1445.2600     33.7100     -1.2900
+    238.7000   1445.2500     33.7000     -1.2900
+    238.8000   1445.2500     33.7000     -1.2900
+    238.9000   1445.2800     33.7200     -1.2900
+    239.1000   1445.2900     33.7200     -1.2900
+    239.2000   1445.2900     33.7200     -1.2900
+    239.3000   1445.2900     33.7200     -1.2900
+    239.5000   1445.3400     33.7200     -1.2800
+    239.6000   1445.3400     33.7200     -1.2800
+    239.8000   1445.3300     33.7100     -1.2800
+    239.9000   1445.4100     33.7300     -1.2700
+    240.0000   1445.3800     33.7400     -1.2800
+    240.2000   1445.4400     33.7400     -1.2700
+    240.3000   1445.4400     33.7400     -1.2700
+    240.4000   1445.4300     33.7400     -1.2700
+    240.6000   1445.4300     33.7400     -1.2700
+    240.7000   1445.4600     33.7600     -1.2700
+    240.8000   1445.5200     33.7600     -1.2500
+    241.0000   1445.5100     33.7500     -1.2500
+    241.1000   1445.5100     33.7500     -1.2500
+    241.2000   1445.5400     33.7700     -1.2500
+    241.4000   1445.5400     33.7700     -1.2500
+    241.5000   1445.5400     33.7700     -1.2500
+    241.7000   1445.5400     33.7700     -1.2500
+    241.8000   1445.6000     33.7700     -1.2400
+    241.9000   1445.5900     33.7600     -1.2400
+    242.1000   1445.5800     33.7500     -1.2400
+    242.2000   1445.6100     33.7700     -1.2400
+    242.3000   1445.6200     33.7700     -1.2400
+    242.5000   1445.6700     33.7700     -1.2300
+    242.6000   1445.6900     33.7900     -1.2300
+    242.7000   1445.6800     33.7800     -1.2300
+    242.9000   1445.6900     33.7800     -1.2300
+    243.0000   1445.6900     33.7800     -1.2300
+    243.1000   1445.6900     33.7800     -1.2300
+    243.3000   1445.7200     33.8000     -1.2300
+    243.4000   1445.7700     33.8000     -1.2200
+    243.6000   1445.7700     33.7900     -1.2200
+    243.7000   1445.7600     33.7900     -1.2200
+    243.8000   1445.7900     33.8100     -1.2200
+    244.0000   1445.7700     33.7900     -1.2200
+    244.1000   1445.8000     33.8100     -1.2200
+    244.2000   1445.8500     33.8100     -1.2100
+    244.4000   1445.8400     33.8000     -1.2100
+    244.5000   1445.8400     33.8000     -1.2100
+    244.6000   1445.8700     33.8200     -1.2100
+    244.8000   1445.8700     33.8200     -1.2100
+    244.9000   1445.8700     33.8200     -1.2100
+    245.0000   1445.8700     33.8200     -1.2100
+    245.2000   1445.9500     33.8400     -1.2000
+    245.3000   1445.9500     33.8300     -1.2000
+    245.5000   1445.9400     33.8200     -1.2000
+    245.6000   1445.9900     33.8200     -1.1900
+    245.7000   1446.0200     33.8400     -1.1900
+    245.9000   1446.0100     33.8300     -1.1900
+    246.0000   1446.0100     33.8300     -1.1900
+    246.1000   1446.0100     33.8300     -1.1900
+    246.3000   1446.0200     33.8300     -1.1900
+    246.4000   1446.0200     33.8300     -1.1900
+    246.5000   1446.0500     33.8500     -1.1900
+    246.7000   1446.0500     33.8500     -1.1900
+    246.8000   1446.1000     33.8500     -1.1800
+    246.9000   1446.1000     33.8500     -1.1800
+    247.1000   1446.1200     33.8600     -1.1800
+    247.2000   1446.1200     33.8600     -1.1800
+    247.4000   1446.1700     33.8600     -1.1700
+    247.5000   1446.2000     33.8700     -1.1700
+    247.6000   1446.1600     33.8500     -1.1700
+    247.8000   1446.2400     33.8700     -1.1600
+    247.9000   1446.2400     33.8600     -1.1600
+    248.0000   1446.3400     33.9000     -1.1500
+    248.2000   1446.3300     33.8900     -1.1500
+    248.3000   1446.4000     33.9000     -1.1400
+    248.4000   1446.4000     33.9000     -1.1400
+    248.6000   1446.3900     33.8900     -1.1400
+    248.7000   1446.4200     33.9100     -1.1400
+    248.9000   1446.4200     33.9100     -1.1400
+    249.0000   1446.5000     33.9300     -1.1300
+    249.1000   1446.4700     33.9100     -1.1300
+    249.3000   1446.4900     33.9200     -1.1300
+    249.4000   1446.5400     33.9200     -1.1100
+    249.5000   1446.5700     33.9300     -1.1100
+    249.7000   1446.6100     33.9300     -1.1000
+    249.8000   1446.6000     33.9200     -1.1000
+    249.9000   1446.6300     33.9400     -1.1000
+    250.1000   1446.6300     33.9400     -1.1000
+    250.2000   1446.6600     33.9600     -1.1000
+    250.3000   1446.7100     33.9600     -1.0900
+    250.5000   1446.7000     33.9500     -1.0900
+    250.6000   1446.7300     33.9600     -1.0900
+    250.8000   1446.7800     33.9600     -1.0800
+    250.9000   1446.7700     33.9600     -1.0800
+    251.0000   1446.7900     33.9700     -1.0800
+    251.2000   1446.8000     33.9700     -1.0800
+    251.3000   1446.8000     33.9700     -1.0800
+    251.4000   1446.8500     33.9700     -1.0700
+    251.6000   1446.8700     33.9900     -1.0700
+    251.7000   1446.8700     33.9800     -1.0700
+    251.8000   1446.8700     33.9800     -1.0700
+    252.0000   1446.9200     33.9800     -1.0600
+    252.1000   1446.9400     33.9900     -1.0600
+    252.2000   1446.9400     33.9900     -1.0600
+    252.4000   1446.9400     33.9900     -1.0600
+    252.5000   1446.9400     33.9900     -1.0600
+    252.7000   1447.0200     34.0100     -1.0500
+    252.8000   1447.0200     34.0000     -1.0500
+    252.9000   1447.0100     34.0000     -1.0500
+    253.1000   1447.0600     34.0000     -1.0400
+    253.2000   1447.0100     33.9900     -1.0500
+    253.3000   1447.0900     34.0100     -1.0400
+    253.5000   1447.0900     34.0100     -1.0400
+    253.6000   1447.1600     34.0200     -1.0300
+    253.7000   1447.1500     34.0200     -1.0300
+    253.9000   1447.1800     34.0300     -1.0300
+    254.0000   1447.1800     34.0300     -1.0300
+    254.1000   1447.1800     34.0300     -1.0300
+    254.3000   1447.1800     34.0300     -1.0300
+    254.4000   1447.1800     34.0300     -1.0300
+    254.6000   1447.1900     34.0300     -1.0300
+    254.7000   1447.1900     34.0300     -1.0300
+    254.8000   1447.2400     34.0300     -1.0200
+    255.0000   1447.2300     34.0200     -1.0200
+    255.1000   1447.2600     34.0400     -1.0200
+    255.2000   1447.2600     34.0400     -1.0200
+    255.4000   1447.2600     34.0400     -1.0200
+    255.5000   1447.2600     34.0400     -1.0200
+    255.6000   1447.2600     34.0400     -1.0200
+    255.8000   1447.2700     34.0400     -1.0200
+    255.9000   1447.2700     34.0400     -1.0200
+    256.0000   1447.2700     34.0400     -1.0200
+    256.2000   1447.2700     34.0400     -1.0200
+    256.3000   1447.3000     34.0600     -1.0200
+    256.5000   1447.2800     34.0400     -1.0200
+    256.6000   1447.2800     34.0400     -1.0200
+    256.7000   1447.3300     34.0400     -1.0100
+    256.9000   1447.3500     34.0500     -1.0100
+    257.0000   1447.3000     34.0500     -1.0200
+    257.1000   1447.3600     34.0500     -1.0100
+    257.3000   1447.3100     34.0500     -1.0200
+    257.4000   1447.3600     34.0500     -1.0100
+    257.5000   1447.3600     34.0500     -1.0100
+    257.7000   1447.3600     34.0500     -1.0100
+    257.8000   1447.3600     34.0500     -1.0100
+    257.9000   1447.3600     34.0500     -1.0100
+    258.1000   1447.3600     34.0500     -1.0100
+    258.2000   1447.3700     34.0500     -1.0100
+    258.4000   1447.4000     34.0700     -1.0100
+    258.5000   1447.4500     34.0700     -1.0000
+    258.6000   1447.4400     34.0600     -1.0000
+    258.8000   1447.4400     34.0500     -1.0000
+    258.9000   1447.4400     34.0500     -1.0000
+    259.0000   1447.4700     34.0700     -1.0000
+    259.2000   1447.5200     34.0700     -0.9900
+    259.3000   1447.5100     34.0700     -0.9900
+    259.4000   1447.5100     34.0600     -0.9900
+    259.6000   1447.5100     34.0600     -0.9900
+    259.7000   1447.5100     34.0600     -0.9900
+    259.8000   1447.5900     34.0800     -0.9700
+    260.0000   1447.5400     34.0700     -0.9900
+    260.1000   1447.5900     34.0700     -0.9700
+    260.3000   1447.5900     34.0700     -0.9700
+    260.4000   1447.6100     34.0900     -0.9700
+    260.5000   1447.6100     34.0900     -0.9700
+    260.7000   1447.5900     34.0700     -0.9700
+    260.8000   1447.6200     34.0900     -0.9700
+    260.9000   1447.6200     34.0900     -0.9700
+    261.1000   1447.6200     34.0900     -0.9700
+    261.2000   1447.6800     34.0900     -0.9600
+    261.3000   1447.6700     34.0800     -0.9600
+    261.5000   1447.6600     34.0800     -0.9600
+    261.6000   1447.7200     34.0800     -0.9500
+    261.7000   1447.7400     34.0900     -0.9500
+    261.9000   1447.7300     34.0800     -0.9500
+    262.0000   1447.7600     34.1000     -0.9500
+    262.1000   1447.8100     34.1000     -0.9400
+    262.3000   1447.8300     34.1200     -0.9400
+    262.4000   1447.8300     34.1100     -0.9400
+    262.6000   1447.8300     34.1100     -0.9400
+    262.7000   1447.8300     34.1100     -0.9400
+    262.8000   1447.8900     34.1100     -0.9300
+    263.0000   1447.9100     34.1300     -0.9300
+    263.1000   1447.9000     34.1200     -0.9300
+    263.2000   1447.9500     34.1200     -0.9200
+    263.4000   1447.9500     34.1100     -0.9200
+    263.5000   1448.0200     34.1300     -0.9100
+    263.6000   1448.0100     34.1200     -0.9100
+    263.8000   1448.0300     34.1400     -0.9100
+    263.9000   1448.0400     34.1400     -0.9100
+    264.0000   1448.0400     34.1400     -0.9100
+    264.2000   1448.0900     34.1300     -0.9000
+    264.3000   1448.1100     34.1500     -0.9000
+    264.5000   1448.1100     34.1400     -0.9000
+    264.6000   1448.1600     34.1400     -0.8900
+    264.7000   1448.1500     34.1400     -0.8900
+    264.9000   1448.1700     34.1500     -0.8900
+    265.0000   1448.1800     34.1500     -0.8900
+    265.1000   1448.1800     34.1500     -0.8900
+    265.3000   1448.2300     34.1500     -0.8800
+    265.4000   1448.2500     34.1600     -0.8800
+    265.5000   1448.2500     34.1600     -0.8800
+    265.7000   1448.2500     34.1600     -0.8800
+    265.8000   1448.2500     34.1600     -0.8800
+    265.9000   1448.3000     34.1600     -0.8700
+    266.1000   1448.3000     34.1500     -0.8700
+    266.2000   1448.3200     34.1700     -0.8700
+    266.4000   1448.3700     34.1700     -0.8600
+    266.5000   1448.4100     34.1600     -0.8500
+    266.6000   1448.4800     34.1700     -0.8300
+    266.8000   1448.5400     34.1800     -0.8200
+    266.9000   1448.5500     34.1800     -0.8200
+    267.0000   1448.6300     34.2000     -0.8100
+    267.2000   1448.6500     34.2100     -0.8100
+    267.3000   1448.6400     34.2100     -0.8100
+    267.4000   1448.6400     34.2100     -0.8100
+    267.6000   1448.6500     34.2100     -0.8100
+    267.7000   1448.7000     34.2100     -0.8000
+    267.8000   1448.7200     34.2200     -0.8000
+    268.0000   1448.7100     34.2100     -0.8000
+    268.1000   1448.7700     34.2100     -0.7900
+    268.3000   1448.7600     34.2100     -0.7900
+    268.4000   1448.8300     34.2200     -0.7800
+    268.5000   1448.8200     34.2200     -0.7800
+    268.7000   1448.8500     34.2300     -0.7800
+    268.8000   1448.9000     34.2300     -0.7700
+    268.9000   1448.8900     34.2200     -0.7700
+    269.1000   1448.9100     34.2400     -0.7700
+    269.2000   1448.9200     34.2400     -0.7700
+    269.3000   1448.9700     34.2400     -0.7600
+    269.5000   1448.9900     34.2500     -0.7600
+    269.6000   1448.9800     34.2400     -0.7600
+    269.7000   1449.0400     34.2400     -0.7500
+    269.9000   1449.0300     34.2400     -0.7500
+    270.0000   1449.0500     34.2500     -0.7500
+    270.2000   1449.0500     34.2500     -0.7500
+    270.3000   1449.0500     34.2500     -0.7500
+    270.4000   1449.1100     34.2500     -0.7400
+    270.6000   1449.1000     34.2500     -0.7400
+    270.7000   1449.0900     34.2400     -0.7400
+    270.8000   1449.1000     34.2400     -0.7400
+    271.0000   1449.1300     34.2600     -0.7400
+    271.1000   1449.1300     34.2600     -0.7400
+    271.2000   1449.1300     34.2600     -0.7400
+    271.4000   1449.1800     34.2600     -0.7300
+    271.5000   1449.1300     34.2500     -0.7400
+    271.6000   1449.1800     34.2500     -0.7300
+    271.8000   1449.1800     34.2500     -0.7300
+    271.9000   1449.1700     34.2500     -0.7300
+    272.0000   1449.2500     34.2700     -0.7200
+    272.2000   1449.2500     34.2600     -0.7200
+    272.3000   1449.2700     34.2800     -0.7200
+    272.5000   1449.3200     34.2700     -0.7100
+    272.6000   1449.3100     34.2700     -0.7100
+    272.7000   1449.3100     34.2600     -0.7100
+    272.9000   1449.3100     34.2600     -0.7100
+    273.0000   1449.3900     34.2800     -0.7000
+    273.1000   1449.3800     34.2800     -0.7000
+    273.3000   1449.3800     34.2700     -0.7000
+    273.4000   1449.4100     34.2900     -0.7000
+    273.5000   1449.4300     34.2700     -0.6900
+    273.7000   1449.4500     34.2800     -0.6900
+    273.8000   1449.4500     34.2800     -0.6900
+    273.9000   1449.4500     34.2800     -0.6900
+    274.1000   1449.5300     34.3000     -0.6700
+    274.2000   1449.5000     34.2700     -0.6700
+    274.4000   1449.5200     34.2900     -0.6700
+    274.5000   1449.5500     34.3100     -0.6700
+    274.6000   1449.5200     34.2900     -0.6700
+    274.8000   1449.5700     34.2900     -0.6600
+    274.9000   1449.5900     34.3000     -0.6600
+    275.0000   1449.5900     34.2900     -0.6600
+    275.2000   1449.6400     34.2900     -0.6500
+    275.3000   1449.6100     34.3100     -0.6600
+    275.4000   1449.6600     34.3100     -0.6500
+    275.6000   1449.6700     34.3100     -0.6500
+    275.7000   1449.6600     34.3000     -0.6500
+    275.8000   1449.6600     34.3000     -0.6500
+    276.0000   1449.6600     34.3000     -0.6500
+    276.1000   1449.7200     34.3000     -0.6400
+    276.3000   1449.7100     34.2900     -0.6400
+    276.4000   1449.7300     34.3100     -0.6400
+    276.5000   1449.7300     34.3100     -0.6400
+    276.7000   1449.7300     34.3100     -0.6400
+    276.8000   1449.7900     34.3100     -0.6300
+    276.9000   1449.7800     34.3000     -0.6300
+    277.1000   1449.8000     34.3200     -0.6300
+    277.2000   1449.8000     34.3200     -0.6300
+    277.3000   1449.8100     34.3200     -0.6300
+    277.5000   1449.8100     34.3200     -0.6300
+    277.6000   1449.7800     34.3000     -0.6300
+    277.7000   1449.8100     34.3200     -0.6300
+    277.9000   1449.8600     34.3200     -0.6200
+    278.0000   1449.8600     34.3100     -0.6200
+    278.2000   1449.9000     34.3000     -0.6100
+    278.3000   1449.9200     34.3200     -0.6100
+    278.4000   1449.9700     34.3100     -0.6000
+    278.6000   1450.0400     34.3300     -0.5900
+    278.7000   1450.0500     34.3300     -0.5900
+    278.8000   1450.0400     34.3300     -0.5900
+    279.0000   1450.0500     34.3300     -0.5900
+    279.1000   1450.0800     34.3500     -0.5900
+    279.2000   1450.1300     34.3500     -0.5800
+    279.4000   1450.1200     34.3400     -0.5800
+    279.5000   1450.1200     34.3300     -0.5800
+    279.6000   1450.1200     34.3300     -0.5800
+    279.8000   1450.2000     34.3500     -0.5700
+    279.9000   1450.1900     34.3500     -0.5700
+    280.0000   1450.1900     34.3400     -0.5700
+    280.2000   1450.1900     34.3400     -0.5700
+    280.3000   1450.1900     34.3400     -0.5700
+    280.5000   1450.2200     34.3600     -0.5700
+    280.6000   1450.2200     34.3600     -0.5700
+    280.7000   1450.2000     34.3400     -0.5700
+    280.9000   1450.2200     34.3600     -0.5700
+    281.0000   1450.2300     34.3600     -0.5700
+    281.1000   1450.2300     34.3600     -0.5700
+    281.3000   1450.2800     34.3600     -0.5600
+    281.4000   1450.2200     34.3600     -0.5700
+    281.5000   1450.2800     34.3600     -0.5600
+    281.7000   1450.2800     34.3600     -0.5600
+    281.8000   1450.2700     34.3500     -0.5600
+    281.9000   1450.2800     34.3500     -0.5600
+    282.1000   1450.3300     34.3500     -0.5500
+    282.2000   1450.3500     34.3600     -0.5500
+    282.4000   1450.3900     34.3600     -0.5400
+    282.5000   1450.3900     34.3500     -0.5400
+    282.6000   1450.4300     34.3400     -0.5200
+    282.8000   1450.4500     34.3600     -0.5200
+    282.9000   1450.4700     34.3700     -0.5200
+    283.0000   1450.5200     34.3700     -0.5100
+    283.2000   1450.5200     34.3700     -0.5100
+    283.3000   1450.5400     34.3800     -0.5100
+    283.4000   1450.5400     34.3800     -0.5100
+    283.6000   1450.5600     34.3600     -0.5000
+    283.7000   1450.5900     34.3700     -0.5000
+    283.8000   1450.5800     34.3700     -0.5000
+    284.0000   1450.6100     34.3900     -0.5000
+    284.1000   1450.6100     34.3900     -0.5000
+    284.2000   1450.6100     34.3900     -0.5000
+    284.4000   1450.6200     34.3900     -0.5000
+    284.5000   1450.6700     34.3900     -0.4900
+    284.7000   1450.6600     34.3800     -0.4900
+    284.8000   1450.6500     34.3800     -0.4900
+    284.9000   1450.6600     34.3800     -0.4900
+    285.1000   1450.6600     34.3700     -0.4900
+    285.2000   1450.6600     34.3700     -0.4900
+    285.3000   1450.6900     34.3900     -0.4900
+    285.5000   1450.6900     34.3900     -0.4900
+    285.6000   1450.7200     34.3700     -0.4800
+    285.7000   1450.7400     34.3900     -0.4800
+    285.9000   1450.7300     34.3800     -0.4800
+    286.0000   1450.7300     34.3800     -0.4800
+    286.1000   1450.7400     34.3800     -0.4800
+    286.3000   1450.7400     34.3800     -0.4800
+    286.4000   1450.7400     34.3800     -0.4800
+    286.6000   1450.8200     34.4000     -0.4700
+    286.7000   1450.8100     34.4000     -0.4700
+    286.8000   1450.8100     34.3900     -0.4700
+    287.0000   1450.8100     34.3900     -0.4700
+    287.1000   1450.8100     34.3900     -0.4700
+    287.2000   1450.8600     34.3900     -0.4600
+    287.4000   1450.8600     34.3800     -0.4600
+    287.5000   1450.8800     34.4000     -0.4600
+    287.6000   1450.9300     34.4000     -0.4500
+    287.8000   1450.9200     34.3900     -0.4500
+    287.9000   1450.9400     34.4100     -0.4500
+    288.0000   1450.9500     34.4000     -0.4500
+    288.2000   1450.9500     34.4000     -0.4500
+    288.3000   1451.0000     34.4000     -0.4400
+    288.4000   1450.9900     34.4000     -0.4400
+    288.6000   1451.0200     34.4100     -0.4400
+    288.7000   1450.9900     34.3900     -0.4400
+    288.9000   1451.0200     34.4100     -0.4400
+    289.0000   1451.0200     34.4100     -0.4400
+    289.1000   1451.0200     34.4100     -0.4400
+    289.3000   1451.0800     34.4100     -0.4300
+    289.4000   1451.1200     34.4100     -0.4200
+    289.5000   1451.1000     34.3900     -0.4200
+    289.7000   1451.1700     34.4100     -0.4100
+    289.8000   1451.2000     34.4200     -0.4100
+    289.9000   1451.2200     34.4400     -0.4100
+    290.1000   1451.2700     34.4400     -0.4000
+    290.2000   1451.2600     34.4300     -0.4000
+    290.3000   1451.2600     34.4200     -0.4000
+    290.5000   1451.2600     34.4200     -0.4000
+    290.6000   1451.2600     34.4200     -0.4000
+    290.8000   1451.2600     34.4200     -0.4000
+    290.9000   1451.2600     34.4200     -0.4000
+    291.0000   1451.2700     34.4200     -0.4000
+    291.2000   1451.3500     34.4400     -0.3900
+    291.3000   1451.3400     34.4400     -0.3900
+    291.4000   1451.3300     34.4300     -0.3900
+    291.6000   1451.3400     34.4300     -0.3900
+    291.7000   1451.3400     34.4300     -0.3900
+    291.8000   1451.3400     34.4300     -0.3900
+    292.0000   1451.3400     34.4300     -0.3900
+    292.1000   1451.3400     34.4300     -0.3900
+    292.2000   1451.4000     34.4300     -0.3800
+    292.4000   1451.4200     34.4400     -0.3800
+    292.5000   1451.4100     34.4400     -0.3800
+    292.6000   1451.4100     34.4400     -0.3800
+    292.8000   1451.4100     34.4400     -0.3800
+    292.9000   1451.4200     34.4400     -0.3800
+    293.1000   1451.4200     34.4400     -0.3800
+    293.2000   1451.3900     34.4200     -0.3800
+    293.3000   1451.4200     34.4400     -0.3800
+    293.5000   1451.4700     34.4400     -0.3700
+    293.6000   1451.4700     34.4300     -0.3700
+    293.7000   1451.4600     34.4300     -0.3700
+    293.9000   1451.4600     34.4200     -0.3700
+    294.0000   1451.4900     34.4400     -0.3700
+    294.1000   1451.5400     34.4400     -0.3500
+    294.3000   1451.5400     34.4400     -0.3500
+    294.4000   1451.5800     34.4300     -0.3400
+    294.5000   1451.6000     34.4500     -0.3400
+    294.7000   1451.6200     34.4600     -0.3400
+    294.8000   1451.6000     34.4400     -0.3400
+    294.9000   1451.6300     34.4600     -0.3400
+    295.1000   1451.6300     34.4600     -0.3400
+    295.2000   1451.6300     34.4600     -0.3400
+    295.4000   1451.6800     34.4600     -0.3300
+    295.5000   1451.6800     34.4500     -0.3300
+    295.6000   1451.6700     34.4500     -0.3300
+    295.8000   1451.6700     34.4500     -0.3300
+    295.9000   1451.6800     34.4500     -0.3300
+    296.0000   1451.6800     34.4500     -0.3300
+    296.2000   1451.6800     34.4500     -0.3300
+    296.3000   1451.6800     34.4500     -0.3300
+    296.4000   1451.6800     34.4500     -0.3300
+    296.6000   1451.6900     34.4500     -0.3300
+    296.7000   1451.6900     34.4500     -0.3300
+    296.8000   1451.7700     34.4700     -0.3200
+    297.0000   1451.7600     34.4600     -0.3200
+    297.1000   1451.7500     34.4500     -0.3200
+    297.3000   1451.7600     34.4500     -0.3200
+    297.4000   1451.7600     34.4500     -0.3200
+    297.5000   1451.7600     34.4500     -0.3200
+    297.7000   1451.7900     34.4700     -0.3200
+    297.8000   1451.8400     34.4700     -0.3100
+    297.9000   1451.8100     34.4500     -0.3100
+    298.1000   1451.8300     34.4600     -0.3100
+    298.2000   1451.8300     34.4600     -0.3100
+    298.3000   1451.8300     34.4600     -0.3100
+    298.5000   1451.8400     34.4600     -0.3100
+    298.6000   1451.8900     34.4600     -0.3000
+    298.7000   1451.9100     34.4800     -0.3000
+    298.9000   1451.9000     34.4700     -0.3000
+    299.0000   1451.9000     34.4700     -0.3000
+    299.1000   1451.9600     34.4700     -0.2900
+    299.3000   1451.9500     34.4600     -0.2900
+    299.4000   1451.9400     34.4600     -0.2900
+    299.6000   1452.0200     34.4800     -0.2800
+    299.7000   1452.0200     34.4700     -0.2800
+    299.8000   1452.0100     34.4600     -0.2800
+    300.0000   1452.0600     34.4600     -0.2700
+    300.1000   1452.0800     34.4800     -0.2700
+    300.2000   1452.0800     34.4700     -0.2700
+    300.4000   1452.1500     34.4900     -0.2600
+    300.5000   1452.1500     34.4900     -0.2600
+    300.6000   1452.1400     34.4800     -0.2600
+    300.8000   1452.1900     34.4800     -0.2500
+    300.9000   1452.1900     34.4700     -0.2500
+    301.0000   1452.2100     34.4900     -0.2500
+    301.2000   1452.2600     34.4900     -0.2400
+    301.3000   1452.2500     34.4800     -0.2400
+    301.4000   1452.2700     34.5000     -0.2400
+    301.6000   1452.2800     34.5000     -0.2400
+    301.7000   1452.2800     34.5000     -0.2400
+    301.9000   1452.3300     34.5000     -0.2300
+    302.0000   1452.2700     34.4900     -0.2400
+    302.1000   1452.3300     34.4900     -0.2300
+    302.3000   1452.3300     34.4900     -0.2300
+    302.4000   1452.3200     34.4800     -0.2300
+    302.5000   1452.3700     34.4800     -0.2200
+    302.7000   1452.3900     34.5000     -0.2200
+    302.8000   1452.4400     34.4900     -0.2100
+    302.9000   1452.4600     34.5000     -0.2100
+    303.1000   1452.4500     34.5000     -0.2100
+    303.2000   1452.5000     34.5000     -0.2000
+    303.3000   1452.5200     34.5100     -0.2000
+    303.5000   1452.5200     34.5100     -0.2000
+    303.6000   1452.5200     34.5100     -0.2000
+    303.7000   1452.5200     34.5100     -0.2000
+    303.9000   1452.5700     34.5100     -0.1800
+    304.0000   1452.5900     34.5200     -0.1800
+    304.2000   1452.5900     34.5100     -0.1800
+    304.3000   1452.6400     34.5100     -0.1700
+    304.4000   1452.6300     34.5100     -0.1700
+    304.6000   1452.6300     34.5000     -0.1700
+    304.7000   1452.6300     34.5000     -0.1700
+    304.8000   1452.7100     34.5200     -0.1600
+    305.0000   1452.7000     34.5100     -0.1600
+    305.1000   1452.6900     34.5100     -0.1600
+    305.2000   1452.7000     34.5100     -0.1600
+    305.4000   1452.7000     34.5100     -0.1600
+    305.5000   1452.7000     34.5100     -0.1600
+    305.6000   1452.7300     34.5300     -0.1600
+    305.8000   1452.7300     34.5300     -0.1600
+    305.9000   1452.7800     34.5300     -0.1500
+    306.0000   1452.7300     34.5200     -0.1600
+    306.2000   1452.7800     34.5200     -0.1500
+    306.3000   1452.7800     34.5200     -0.1500
+    306.5000   1452.7800     34.5200     -0.1500
+    306.6000   1452.7800     34.5200     -0.1500
+    306.7000   1452.7800     34.5200     -0.1500
+    306.9000   1452.7800     34.5200     -0.1500
+    307.0000   1452.8300     34.5200     -0.1400
+    307.1000   1452.8500     34.5300     -0.1400
+    307.3000   1452.8500     34.5200     -0.1400
+    307.4000   1452.8500     34.5200     -0.1400
+    307.5000   1452.8500     34.5200     -0.1400
+    307.7000   1452.8500     34.5200     -0.1400
+    307.8000   1452.8600     34.5200     -0.1400
+    307.9000   1452.8600     34.5200     -0.1400
+    308.1000   1452.8600     34.5200     -0.1400
+    308.2000   1452.8900     34.5400     -0.1400
+    308.4000   1452.9100     34.5200     -0.1300
+    308.5000   1452.9300     34.5400     -0.1300
+    308.6000   1452.9000     34.5100     -0.1300
+    308.8000   1452.9300     34.5300     -0.1300
+    308.9000   1452.9300     34.5300     -0.1300
+    309.0000   1452.9300     34.5300     -0.1300
+    309.2000   1452.9400     34.5300     -0.1300
+    309.3000   1452.9900     34.5300     -0.1200
+    309.4000   1452.9800     34.5200     -0.1200
+    309.6000   1453.0000     34.5400     -0.1200
+    309.7000   1453.0000     34.5400     -0.1200
+    309.8000   1453.0500     34.5400     -0.1100
+    310.0000   1453.0500     34.5300     -0.1100
+    310.1000   1453.0400     34.5300     -0.1100
+    310.2000   1453.1200     34.5400     -0.1000
+    310.4000   1453.1100     34.5400     -0.1000
+    310.5000   1453.1100     34.5300     -0.1000
+    310.7000   1453.1100     34.5300     -0.1000
+    310.8000   1453.1100     34.5300     -0.1000
+    310.9000   1453.1900     34.5500     -0.0900
+    311.1000   1453.1100     34.5300     -0.1000
+    311.2000   1453.1400     34.5500     -0.1000
+    311.3000   1453.1700     34.5300     -0.0900
+    311.5000   1453.1900     34.5500     -0.0900
+    311.6000   1453.1800     34.5400     -0.0900
+    311.7000   1453.1900     34.5400     -0.0900
+    311.9000   1453.1900     34.5400     -0.0900
+    312.0000   1453.2400     34.5400     -0.0800
+    312.1000   1453.1900     34.5300     -0.0900
+    312.3000   1453.2600     34.5500     -0.0800
+    312.4000   1453.2600     34.5500     -0.0800
+    312.5000   1453.2600     34.5500     -0.0800
+    312.7000   1453.3100     34.5500     -0.0700
+    312.8000   1453.2800     34.5600     -0.0800
+    313.0000   1453.3100     34.5400     -0.0700
+    313.1000   1453.3100     34.5400     -0.0700
+    313.2000   1453.3300     34.5500     -0.0700
+    313.4000   1453.3300     34.5500     -0.0700
+    313.5000   1453.3300     34.5500     -0.0700
+    313.6000   1453.3400     34.5500     -0.0700
+    313.8000   1453.3900     34.5500     -0.0600
+    313.9000   1453.3800     34.5500     -0.0600
+    314.0000   1453.3700     34.5400     -0.0600
+    314.2000   1453.4000     34.5600     -0.0600
+    314.3000   1453.4500     34.5600     -0.0500
+    314.4000   1453.4500     34.5600     -0.0500
+    314.6000   1453.4400     34.5500     -0.0500
+    314.7000   1453.4900     34.5500     -0.0400
+    314.8000   1453.4900     34.5400     -0.0400
+    315.0000   1453.5100     34.5600     -0.0400
+    315.1000   1453.5600     34.5600     -0.0300
+    315.3000   1453.5800     34.5700     -0.0300
+    315.4000   1453.5700     34.5600     -0.0300
+    315.5000   1453.5700     34.5600     -0.0300
+    315.7000   1453.6500     34.5800     -0.0200
+    315.8000   1453.6200     34.5600     -0.0200
+    315.9000   1453.6400     34.5700     -0.0200
+    316.1000   1453.6400     34.5700     -0.0200
+    316.2000   1453.6400     34.5700     -0.0200
+    316.3000   1453.6500     34.5700     -0.0200
+    316.5000   1453.6500     34.5700     -0.0200
+    316.6000   1453.6500     34.5700     -0.0200
+    316.7000   1453.7000     34.5700      0.0000
+    316.9000   1453.6500     34.5700     -0.0200
+    317.0000   1453.7000     34.5700      0.0000
+    317.1000   1453.7000     34.5700      0.0000
+    317.3000   1453.6900     34.5600      0.0000
+    317.4000   1453.7200     34.5800      0.0000
+    317.5000   1453.7000     34.5600      0.0000
+    317.7000   1453.7300     34.5800      0.0000
+    317.8000   1453.7300     34.5800      0.0000
+    318.0000   1453.7300     34.5800      0.0000
+    318.1000   1453.7800     34.5800      0.0100
+    318.2000   1453.7800     34.5700      0.0100
+    318.4000   1453.7700     34.5700      0.0100
+    318.5000   1453.7700     34.5700      0.0100
+    318.6000   1453.7700     34.5700      0.0100
+    318.8000   1453.8500     34.5900      0.0200
+    318.9000   1453.8500     34.5800      0.0200
+    319.0000   1453.8400     34.5700      0.0200
+    319.2000   1453.8400     34.5700      0.0200
+    319.3000   1453.8900     34.5700      0.0300
+    319.4000   1453.9100     34.5900      0.0300
+    319.6000   1453.9100     34.5800      0.0300
+    319.7000   1453.9600     34.5800      0.0400
+    319.8000   1453.9800     34.6000      0.0400
+    320.0000   1453.9700     34.5900      0.0400
+    320.1000   1453.9700     34.5900      0.0400
+    320.3000   1453.9800     34.5900      0.0400
+    320.4000   1454.0300     34.5900      0.0500
+    320.5000   1454.0200     34.5800      0.0500
+    320.7000   1454.0200     34.5800      0.0500
+    320.8000   1454.0400     34.6000      0.0500
+    320.9000   1454.0500     34.6000      0.0500
+    321.1000   1454.1000     34.6000      0.0600
+    321.2000   1454.0900     34.5900      0.0600
+    321.3000   1454.0800     34.5800      0.0600
+    321.5000   1454.1600     34.6000      0.0700
+    321.6000   1454.1600     34.6000      0.0700
+    321.7000   1454.1500     34.5900      0.0700
+    321.9000   1454.2000     34.5900      0.0800
+    322.0000   1454.1900     34.5900      0.0800
+    322.1000   1454.2200     34.6000      0.0800
+    322.3000   1454.2200     34.6000      0.0800
+    322.4000   1454.2200     34.6000      0.0800
+    322.6000   1454.2200     34.6000      0.0800
+    322.7000   1454.2200     34.6000      0.0800
+    322.8000   1454.3000     34.6200      0.0900
+    323.0000   1454.2700     34.5900      0.0900
+    323.1000   1454.2600     34.5900      0.0900
+    323.2000   1454.2900     34.6100      0.0900
+    323.4000   1454.2900     34.6100      0.0900
+    323.5000   1454.3000     34.6100      0.0900
+    323.6000   1454.3000     34.6100      0.0900
+    323.8000   1454.3500     34.6100      0.1000
+    323.9000   1454.3400     34.6000      0.1000
+    324.0000   1454.3400     34.5900      0.1000
+    324.2000   1454.3600     34.6100      0.1000
+    324.3000   1454.3700     34.6100      0.1000
+    324.4000   1454.3700     34.6100      0.1000
+    324.6000   1454.3700     34.6100      0.1000
+    324.7000   1454.3700     34.6100      0.1000
+    324.9000   1454.4200     34.6100      0.1100
+    325.0000   1454.4200     34.6100      0.1100
+    325.1000   1454.4600     34.6000      0.1200
+    325.3000   1454.4800     34.6200      0.1200
+    325.4000   1454.4800     34.6100      0.1200
+    325.5000   1454.5000     34.6300      0.1200
+    325.7000   1454.5100     34.6300      0.1200
+    325.8000   1454.5300     34.6100      0.1300
+    325.9000   1454.5500     34.6200      0.1300
+    326.1000   1454.5400     34.6200      0.1300
+    326.2000   1454.5500     34.6200      0.1300
+    326.3000   1454.5500     34.6200      0.1300
+    326.5000   1454.5500     34.6200      0.1300
+    326.6000   1454.5500     34.6200      0.1300
+    326.7000   1454.5500     34.6200      0.1300
+    326.9000   1454.6300     34.6400      0.1400
+    327.0000   1454.6000     34.6100      0.1400
+    327.1000   1454.6200     34.6200      0.1400
+    327.3000   1454.6200     34.6200      0.1400
+    327.4000   1454.6200     34.6200      0.1400
+    327.6000   1454.6700     34.6200      0.1500
+    327.7000   1454.6200     34.6200      0.1400
+    327.8000   1454.7000     34.6400      0.1500
+    328.0000   1454.6700     34.6200      0.1500
+    328.1000   1454.6700     34.6100      0.1500
+    328.2000   1454.6700     34.6100      0.1500
+    328.4000   1454.7000     34.6300      0.1500
+    328.5000   1454.6700     34.6100      0.1500
+    328.6000   1454.7000     34.6300      0.1500
+    328.8000   1454.7000     34.6300      0.1500
+    328.9000   1454.7100     34.6300      0.1500
+    329.0000   1454.7100     34.6300      0.1500
+    329.2000   1454.7100     34.6300      0.1500
+    329.3000   1454.7100     34.6300      0.1500
+    329.4000   1454.7100     34.6300      0.1500
+    329.6000   1454.7200     34.6300      0.1500
+    329.7000   1454.7200     34.6300      0.1500
+    329.9000   1454.7200     34.6300      0.1500
+    330.0000   1454.7700     34.6300      0.1600
+    330.1000   1454.7700     34.6200      0.1600
+    330.3000   1454.7600     34.6200      0.1600
+    330.4000   1454.7900     34.6400      0.1600
+    330.5000   1454.8100     34.6200      0.1700
+    330.7000   1454.8100     34.6100      0.1700
+    330.8000   1454.8300     34.6300      0.1700
+    330.9000   1454.8300     34.6300      0.1700
+    331.1000   1454.8300     34.6300      0.1700
+    331.2000   1454.9100     34.6400      0.1900
+    331.3000   1454.9000     34.6400      0.1900
+    331.5000   1454.9000     34.6300      0.1900
+    331.6000   1454.9000     34.6300      0.1900
+    331.7000   1454.9000     34.6300      0.1900
+    331.9000   1454.9000     34.6300      0.1900
+    332.0000   1454.9000     34.6300      0.1900
+    332.2000   1454.9100     34.6300      0.1900
+    332.3000   1454.9100     34.6300      0.1900
+    332.4000   1454.9600     34.6300      0.2000
+    332.6000   1454.9800     34.6500      0.2000
+    332.7000   1454.9700     34.6400      0.2000
+    332.8000   1454.9800     34.6400      0.2000
+    333.0000   1454.9800     34.6400      0.2000
+    333.1000   1454.9800     34.6400      0.2000
+    333.2000   1454.9800     34.6400      0.2000
+    333.4000   1455.0300     34.6400      0.2100
+    333.5000   1454.9800     34.6300      0.2000
+    333.6000   1455.0500     34.6500      0.2100
+    333.8000   1455.0600     34.6500      0.2100
+    333.9000   1455.0200     34.6300      0.2100
+    334.0000   1455.1000     34.6500      0.2200
+    334.2000   1455.1000     34.6400      0.2200
+    334.3000   1455.0900     34.6300      0.2200
+    334.4000   1455.1200     34.6500      0.2200
+    334.6000   1455.1700     34.6500      0.2300
+    334.7000   1455.1600     34.6500      0.2300
+    334.9000   1455.1600     34.6400      0.2300
+    335.0000   1455.1600     34.6400      0.2300
+    335.1000   1455.1600     34.6400      0.2300
+    335.3000   1455.2100     34.6400      0.2400
+    335.4000   1455.2300     34.6600      0.2400
+    335.5000   1455.2300     34.6500      0.2400
+    335.7000   1455.2800     34.6500      0.2500
+    335.8000   1455.2700     34.6400      0.2500
+    335.9000   1455.2900     34.6600      0.2500
+    336.1000   1455.2900     34.6600      0.2500
+    336.2000   1455.2900     34.6600      0.2500
+    336.3000   1455.3400     34.6600      0.2600
+    336.5000   1455.3400     34.6500      0.2600
+    336.6000   1455.3300     34.6400      0.2600
+    336.7000   1455.3600     34.6600      0.2600
+    336.9000   1455.4100     34.6600      0.2700
+    337.0000   1455.4100     34.6600      0.2700
+    337.2000   1455.4000     34.6500      0.2700
+    337.3000   1455.4300     34.6700      0.2700
+    337.4000   1455.4300     34.6700      0.2700
+    337.6000   1455.4800     34.6700      0.2800
+    337.7000   1455.4800     34.6700      0.2800
+    337.8000   1455.4700     34.6600      0.2800
+    338.0000   1455.4700     34.6600      0.2800
+    338.1000   1455.5200     34.6600      0.2900
+    338.2000   1455.5400     34.6700      0.2900
+    338.4000   1455.5400     34.6700      0.2900
+    338.5000   1455.5900     34.6700      0.3000
+    338.6000   1455.5800     34.6600      0.3000
+    338.8000   1455.6000     34.6700      0.3000
+    338.9000   1455.6000     34.6700      0.3000
+    339.0000   1455.6000     34.6700      0.3000
+    339.2000   1455.6100     34.6700      0.3000
+    339.3000   1455.6600     34.6700      0.3100
+    339.4000   1455.6500     34.6700      0.3100
+    339.6000   1455.6500     34.6600      0.3100
+    339.7000   1455.6500     34.6600      0.3100
+    339.9000   1455.6800     34.6800      0.3100
+    340.0000   1455.6800     34.6800      0.3100
+    340.1000   1455.6800     34.6800      0.3100
+    340.3000   1455.6800     34.6800      0.3100
+    340.4000   1455.6800     34.6800      0.3100
+    340.5000   1455.6900     34.6800      0.3100
+    340.7000   1455.6900     34.6800      0.3100
+    340.8000   1455.6900     34.6800      0.3100
+    340.9000   1455.6900     34.6800      0.3100
+    341.1000   1455.7400     34.6800      0.3200
+    341.2000   1455.7400     34.6800      0.3200
+    341.3000   1455.7300     34.6700      0.3200
+    341.5000   1455.7300     34.6700      0.3200
+    341.6000   1455.7400     34.6700      0.3200
+    341.7000   1455.7600     34.6900      0.3200
+    341.9000   1455.7400     34.6700      0.3200
+    342.0000   1455.7400     34.6700      0.3200
+    342.1000   1455.8200     34.6900      0.3300
+    342.3000   1455.7600     34.6800      0.3200
+    342.4000   1455.8100     34.6800      0.3300
+    342.6000   1455.8200     34.6800      0.3300
+    342.7000   1455.8100     34.6800      0.3300
+    342.8000   1455.8100     34.6800      0.3300
+    343.0000   1455.8100     34.6800      0.3300
+    343.1000   1455.8200     34.6800      0.3300
+    343.2000   1455.8200     34.6800      0.3300
+    343.4000   1455.8200     34.6800      0.3300
+    343.5000   1455.8200     34.6800      0.3300
+    343.6000   1455.9000     34.7000      0.3400
+    343.8000   1455.8900     34.6900      0.3400
+    343.9000   1455.8900     34.6800      0.3400
+    344.0000   1455.8900     34.6800      0.3400
+    344.2000   1455.8900     34.6800      0.3400
+    344.3000   1455.8900     34.6800      0.3400
+    344.4000   1455.9000     34.6800      0.3400
+    344.6000   1455.9000     34.6800      0.3400
+    344.7000   1455.9000     34.6800      0.3400
+    344.8000   1455.9300     34.7000      0.3400
+    345.0000   1455.9000     34.6800      0.3400
+    345.1000   1455.9100     34.6800      0.3400
+    345.3000   1455.9100     34.6800      0.3400
+    345.4000   1455.9600     34.6800      0.3500
+    345.5000   1455.9800     34.7000      0.3500
+    345.7000   1455.9700     34.6900      0.3500
+    345.8000   1455.9800     34.6900      0.3500
+    345.9000   1456.0300     34.6900      0.3600
+    346.1000   1456.0200     34.6800      0.3600
+    346.2000   1456.0100     34.6800      0.3600
+    346.3000   1456.0900     34.7000      0.3700
+    346.5000   1456.0800     34.6900      0.3700
+    346.6000   1456.1300     34.6900      0.3900
+    346.7000   1456.1900     34.7000      0.4000
+    346.9000   1456.1800     34.6900      0.4000
+    347.0000   1456.1800     34.6800      0.4000
+    347.1000   1456.2500     34.7000      0.4100
+    347.3000   1456.2200     34.7100      0.4000
+    347.4000   1456.2700     34.7100      0.4100
+    347.6000   1456.2800     34.7100      0.4100
+    347.7000   1456.2700     34.7100      0.4100
+    347.8000   1456.2700     34.7100      0.4100
+    348.0000   1456.2700     34.7100      0.4100
+    348.1000   1456.2800     34.7100      0.4100
+    348.2000   1456.2800     34.7100      0.4100
+    348.4000   1456.3300     34.7100      0.4200
+    348.5000   1456.3200     34.7000      0.4200
+    348.6000   1456.3400     34.7100      0.4200
+    348.8000   1456.3900     34.7100      0.4300
+    348.9000   1456.3900     34.7100      0.4300
+    349.0000   1456.3800     34.7000      0.4300
+    349.2000   1456.4100     34.7200      0.4300
+    349.3000   1456.3900     34.7000      0.4300
+    349.4000   1456.3900     34.7000      0.4300
+    349.6000   1456.4600     34.7200      0.4400
+    349.7000   1456.4100     34.7200      0.4300
+    349.8000   1456.4600     34.7200      0.4400
+    350.0000   1456.4600     34.7200      0.4400
+    350.1000   1456.4600     34.7100      0.4400
+    350.3000   1456.4600     34.7100      0.4400
+    350.4000   1456.4600     34.7100      0.4400
+    350.5000   1456.4600     34.7100      0.4400
+    350.7000   1456.4600     34.7100      0.4400
+    350.8000   1456.4700     34.7100      0.4400
+    350.9000   1456.4700     34.7100      0.4400
+    351.1000   1456.5000     34.7300      0.4400
+    351.2000   1456.4700     34.7100      0.4400
+    351.3000   1456.4700     34.7100      0.4400
+    351.5000   1456.4800     34.7100      0.4400
+    351.6000   1456.4800     34.7100      0.4400
+    351.7000   1456.4800     34.7100      0.4400
+    351.9000   1456.4800     34.7100      0.4400
+    352.0000   1456.4900     34.7100      0.4400
+    352.1000   1456.4900     34.7100      0.4400
+    352.3000   1456.5200     34.7300      0.4400
+    352.4000   1456.4900     34.7100      0.4400
+    352.5000   1456.4900     34.7100      0.4400
+    352.7000   1456.5200     34.7300      0.4400
+    352.8000   1456.5200     34.7300      0.4400
+    353.0000   1456.5300     34.7300      0.4400
+    353.1000   1456.5000     34.7100      0.4400
+    353.2000   1456.5800     34.7300      0.4500
+    353.4000   1456.5500     34.7000      0.4500
+    353.5000   1456.5700     34.7200      0.4500
+    353.6000   1456.5700     34.7200      0.4500
+    353.8000   1456.6200     34.7200      0.4600
+    353.9000   1456.6100     34.7100      0.4600
+    354.0000   1456.6300     34.7200      0.4600
+    354.2000   1456.6400     34.7200      0.4600
+    354.3000   1456.6800     34.7200      0.4700
+    354.4000   1456.6800     34.7200      0.4700
+    354.6000   1456.6700     34.7100      0.4700
+    354.7000   1456.7000     34.7300      0.4700
+    354.8000   1456.7500     34.7300      0.4800
+    355.0000   1456.7500     34.7200      0.4800
+    355.1000   1456.7400     34.7200      0.4800
+    355.2000   1456.7400     34.7200      0.4800
+    355.4000   1456.7400     34.7200      0.4800
+    355.5000   1456.7500     34.7200      0.4800
+    355.7000   1456.7700     34.7400      0.4800
+    355.8000   1456.7500     34.7200      0.4800
+    355.9000   1456.7500     34.7200      0.4800
+    356.1000   1456.7800     34.7400      0.4800
+    356.2000   1456.7600     34.7200      0.4800
+    356.3000   1456.7800     34.7400      0.4800
+    356.5000   1456.7900     34.7400      0.4800
+    356.6000   1456.7900     34.7400      0.4800
+    356.7000   1456.7900     34.7400      0.4800
+    356.9000   1456.8400     34.7400      0.4900
+    357.0000   1456.8400     34.7300      0.4900
+    357.1000   1456.8300     34.7200      0.4900
+    357.3000   1456.8300     34.7200      0.4900
+    357.4000   1456.8300     34.7200      0.4900
+    357.5000   1456.8400     34.7200      0.4900
+    357.7000   1456.8400     34.7200      0.4900
+    357.8000   1456.8400     34.7200      0.4900
+    357.9000   1456.8900     34.7200      0.5000
+    358.1000   1456.8400     34.7200      0.4900
+    358.2000   1456.9100     34.7400      0.5000
+    358.3000   1456.9100     34.7400      0.5000
+    358.5000   1456.9100     34.7300      0.5000
+    358.6000   1456.9100     34.7300      0.5000
+    358.8000   1456.9100     34.7300      0.5000
+    358.9000   1456.9100     34.7300      0.5000
+    359.0000   1456.9200     34.7300      0.5000
+    359.2000   1456.9200     34.7300      0.5000
+    359.3000   1456.9200     34.7300      0.5000
+    359.4000   1456.9200     34.7300      0.5000
+    359.6000   1456.9300     34.7300      0.5000
+    359.7000   1456.9300     34.7300      0.5000
+    359.8000   1456.9300     34.7300      0.5000
+    360.0000   1456.9300     34.7300      0.5000
+    360.1000   1456.9300     34.7300      0.5000
+    360.2000   1456.9400     34.7300      0.5000
+    360.4000   1456.9400     34.7300      0.5000
+    360.5000   1456.9400     34.7300      0.5000
+    360.6000   1456.9400     34.7300      0.5000
+    360.8000   1456.9400     34.7300      0.5000
+    360.9000   1456.9900     34.7300      0.5100
+    361.0000   1457.0100     34.7400      0.5100
+    361.2000   1457.0100     34.7400      0.5100
+    361.3000   1457.0100     34.7400      0.5100
+    361.5000   1457.0100     34.7400      0.5100
+    361.6000   1457.0100     34.7400      0.5100
+    361.7000   1457.0200     34.7400      0.5100
+    361.9000   1457.0200     34.7400      0.5100
+    362.0000   1457.0200     34.7400      0.5100
+    362.1000   1457.0200     34.7400      0.5100
+    362.3000   1457.0700     34.7400      0.5200
+    362.4000   1457.0700     34.7300      0.5200
+    362.5000   1457.0900     34.7400      0.5200
+    362.7000   1457.0600     34.7300      0.5200
+    362.8000   1457.0900     34.7400      0.5200
+    362.9000   1457.0900     34.7400      0.5200
+    363.1000   1457.1000     34.7400      0.5200
+    363.2000   1457.1000     34.7400      0.5200
+    363.3000   1457.1000     34.7400      0.5200
+    363.5000   1457.1000     34.7400      0.5200
+    363.6000   1457.1000     34.7400      0.5200
+    363.7000   1457.1100     34.7400      0.5200
+    363.9000   1457.1100     34.7400      0.5200
+    364.0000   1457.1100     34.7400      0.5200
+    364.2000   1457.1100     34.7400      0.5200
+    364.3000   1457.1600     34.7400      0.5300
+    364.4000   1457.1600     34.7400      0.5300
+    364.6000   1457.1500     34.7300      0.5300
+    364.7000   1457.1500     34.7300      0.5300
+    364.8000   1457.1800     34.7500      0.5300
+    365.0000   1457.2300     34.7500      0.5400
+    365.1000   1457.2200     34.7500      0.5400
+    365.2000   1457.2200     34.7400      0.5400
+    365.4000   1457.2200     34.7400      0.5400
+    365.5000   1457.2200     34.7400      0.5400
+    365.6000   1457.2300     34.7400      0.5400
+    365.8000   1457.2300     34.7400      0.5400
+    365.9000   1457.2300     34.7400      0.5400
+    366.0000   1457.2800     34.7400      0.5500
+    366.2000   1457.3000     34.7500      0.5500
+    366.3000   1457.2900     34.7500      0.5500
+    366.4000   1457.3000     34.7500      0.5500
+    366.6000   1457.3000     34.7500      0.5500
+    366.7000   1457.3500     34.7500      0.5600
+    366.8000   1457.3700     34.7600      0.5600
+    367.0000   1457.3600     34.7500      0.5600
+    367.1000   1457.3600     34.7500      0.5600
+    367.3000   1457.3700     34.7500      0.5600
+    367.4000   1457.3700     34.7500      0.5600
+    367.5000   1457.3700     34.7500      0.5600
+    367.7000   1457.3700     34.7500      0.5600
+    367.8000   1457.3700     34.7500      0.5600
+    367.9000   1457.3800     34.7500      0.5600
+    368.1000   1457.4300     34.7500      0.5700
+    368.2000   1457.3700     34.7500      0.5600
+    368.3000   1457.4200     34.7500      0.5700
+    368.5000   1457.4200     34.7500      0.5700
+    368.6000   1457.4400     34.7600      0.5700
+    368.7000   1457.4500     34.7600      0.5700
+    368.9000   1457.4500     34.7600      0.5700
+    369.0000   1457.4500     34.7600      0.5700
+    369.1000   1457.4500     34.7600      0.5700
+    369.3000   1457.4600     34.7600      0.5700
+    369.4000   1457.4600     34.7600      0.5700
+    369.5000   1457.4600     34.7600      0.5700
+    369.7000   1457.4600     34.7600      0.5700
+    369.8000   1457.4600     34.7600      0.5700
+    370.0000   1457.5100     34.7600      0.5800
+    370.1000   1457.5100     34.7500      0.5800
+    370.2000   1457.5000     34.7500      0.5800
+    370.4000   1457.5000     34.7500      0.5800
+    370.5000   1457.5100     34.7500      0.5800
+    370.6000   1457.5300     34.7700      0.5800
+    370.8000   1457.5400     34.7700      0.5800
+    370.9000   1457.5400     34.7700      0.5800
+    371.0000   1457.5400     34.7700      0.5800
+    371.2000   1457.5900     34.7700      0.5900
+    371.3000   1457.5400     34.7600      0.5800
+    371.4000   1457.5900     34.7600      0.5900
+    371.6000   1457.5900     34.7600      0.5900
+    371.7000   1457.5800     34.7500      0.5900
+    371.8000   1457.5800     34.7500      0.5900
+    372.0000   1457.5900     34.7500      0.5900
+    372.1000   1457.5900     34.7500      0.5900
+    372.2000   1457.5900     34.7500      0.5900
+    372.4000   1457.5900     34.7500      0.5900
+    372.5000   1457.6700     34.7700      0.6100
+    372.6000   1457.6600     34.7700      0.6100
+    372.8000   1457.6600     34.7600      0.6100
+    372.9000   1457.6600     34.7600      0.6100
+    373.1000   1457.6600     34.7600      0.6100
+    373.2000   1457.6900     34.7800      0.6100
+    373.3000   1457.6900     34.7800      0.6100
+    373.5000   1457.6700     34.7600      0.6100
+    373.6000   1457.6700     34.7600      0.6100
+    373.7000   1457.7200     34.7600      0.6200
+    373.9000   1457.7100     34.7500      0.6200
+    374.0000   1457.6900     34.7700      0.6100
+    374.1000   1457.7400     34.7700      0.6200
+    374.3000   1457.7500     34.7700      0.6200
+    374.4000   1457.7400     34.7700      0.6200
+    374.5000   1457.7400     34.7700      0.6200
+    374.7000   1457.7400     34.7700      0.6200
+    374.8000   1457.7500     34.7700      0.6200
+    374.9000   1457.7500     34.7700      0.6200
+    375.1000   1457.7500     34.7700      0.6200
+    375.2000   1457.7500     34.7700      0.6200
+    375.3000   1457.7500     34.7700      0.6200
+    375.5000   1457.7600     34.7700      0.6200
+    375.6000   1457.7600     34.7700      0.6200
+    375.8000   1457.7600     34.7700      0.6200
+    375.9000   1457.7600     34.7700      0.6200
+    376.0000   1457.7700     34.7700      0.6200
+    376.2000   1457.7900     34.7900      0.6200
+    376.3000   1457.7700     34.7700      0.6200
+    376.4000   1457.7700     34.7700      0.6200
+    376.6000   1457.7700     34.7700      0.6200
+    376.7000   1457.7800     34.7700      0.6200
+    376.8000   1457.8000     34.7900      0.6200
+    377.0000   1457.7800     34.7700      0.6200
+    377.1000   1457.8600     34.7900      0.6300
+    377.2000   1457.7800     34.7600      0.6200
+    377.4000   1457.7800     34.7600      0.6200
+    377.5000   1457.8600     34.7900      0.6300
+    377.6000   1457.8600     34.7800      0.6300
+    377.8000   1457.8500     34.7700      0.6300
+    377.9000   1457.8500     34.7700      0.6300
+    378.0000   1457.8500     34.7700      0.6300
+    378.2000   1457.8600     34.7700      0.6300
+    378.3000   1457.8600     34.7700      0.6300
+    378.4000   1457.8600     34.7700      0.6300
+    378.6000   1457.8600     34.7700      0.6300
+    378.7000   1457.8600     34.7700      0.6300
+    378.9000   1457.8700     34.7700      0.6300
+    379.0000   1457.8700     34.7700      0.6300
+    379.1000   1457.8700     34.7700      0.6300
+    379.3000   1457.8700     34.7700      0.6300
+    379.4000   1457.8800     34.7700      0.6300
+    379.5000   1457.8800     34.7700      0.6300
+    379.7000   1457.8800     34.7700      0.6300
+    379.8000   1457.8800     34.7700      0.6300
+    379.9000   1457.8800     34.7700      0.6300
+    380.1000   1457.8900     34.7700      0.6300
+    380.2000   1457.8900     34.7700      0.6300
+    380.3000   1457.8900     34.7700      0.6300
+    380.5000   1457.9400     34.7700      0.6400
+    380.6000   1457.9300     34.7700      0.6400
+    380.7000   1457.9500     34.7800      0.6400
+    380.9000   1458.0000     34.7800      0.6500
+    381.0000   1458.0000     34.7700      0.6500
+    381.1000   1457.9900     34.7700      0.6500
+    381.3000   1457.9900     34.7700      0.6500
+    381.4000   1458.0000     34.7700      0.6500
+    381.5000   1458.0200     34.7900      0.6500
+    381.7000   1458.0300     34.7900      0.6500
+    381.8000   1458.0300     34.7900      0.6500
+    382.0000   1458.0300     34.7900      0.6500
+    382.1000   1458.0300     34.7900      0.6500
+    382.2000   1458.0800     34.7900      0.6600
+    382.4000   1458.0800     34.7800      0.6600
+    382.5000   1458.0700     34.7700      0.6600
+    382.6000   1458.0700     34.7700      0.6600
+    382.8000   1458.0700     34.7700      0.6600
+    382.9000   1458.1000     34.7900      0.6600
+    383.0000   1458.1000     34.7900      0.6600
+    383.2000   1458.0800     34.7700      0.6600
+    383.3000   1458.0800     34.7700      0.6600
+    383.4000   1458.0900     34.7700      0.6600
+    383.6000   1458.0900     34.7700      0.6600
+    383.7000   1458.1200     34.7900      0.6600
+    383.8000   1458.0900     34.7700      0.6600
+    384.0000   1458.1200     34.7900      0.6600
+    384.1000   1458.1200     34.7900      0.6600
+    384.2000   1458.1200     34.7900      0.6600
+    384.4000   1458.1300     34.7900      0.6600
+    384.5000   1458.1300     34.7900      0.6600
+    384.6000   1458.1300     34.7900      0.6600
+    384.8000   1458.1300     34.7900      0.6600
+    384.9000   1458.1300     34.7900      0.6600
+    385.1000   1458.1400     34.7900      0.6600
+    385.2000   1458.1400     34.7900      0.6600
+    385.3000   1458.1400     34.7900      0.6600
+    385.5000   1458.1400     34.7900      0.6600
+    385.6000   1458.1400     34.7900      0.6600
+    385.7000   1458.1500     34.7900      0.6600
+    385.9000   1458.1500     34.7900      0.6600
+    386.0000   1458.1500     34.7900      0.6600
+    386.1000   1458.1500     34.7900      0.6600
+    386.3000   1458.2000     34.7900      0.6700
+    386.4000   1458.1500     34.7900      0.6600
+    386.5000   1458.1500     34.7900      0.6600
+    386.7000   1458.1600     34.7900      0.6600
+    386.8000   1458.1600     34.7900      0.6600
+    386.9000   1458.2100     34.7900      0.6700
+    387.1000   1458.1600     34.7900      0.6600
+    387.2000   1458.2100     34.7900      0.6700
+    387.3000   1458.2100     34.7900      0.6700
+    387.5000   1458.1600     34.7800      0.6600
+    387.6000   1458.2200     34.7900      0.6700
+    387.7000   1458.2200     34.7900      0.6700
+    387.9000   1458.2100     34.7800      0.6700
+    388.0000   1458.2400     34.8000      0.6700
+    388.1000   1458.2200     34.7800      0.6700
+    388.3000   1458.2200     34.7800      0.6700
+    388.4000   1458.2200     34.7800      0.6700
+    388.6000   1458.2200     34.7800      0.6700
+    388.7000   1458.2500     34.8000      0.6700
+    388.8000   1458.2300     34.7800      0.6700
+    389.0000   1458.2500     34.8000      0.6700
+    389.1000   1458.2300     34.7800      0.6700
+    389.2000   1458.2800     34.7800      0.6800
+    389.4000   1458.3000     34.7900      0.6800
+    389.5000   1458.2900     34.7900      0.6800
+    389.6000   1458.3000     34.7900      0.6800
+    389.8000   1458.3000     34.7900      0.6800
+    389.9000   1458.3000     34.7900      0.6800
+    390.0000   1458.3000     34.7900      0.6800
+    390.2000   1458.3100     34.7900      0.6800
+    390.3000   1458.3500     34.7900      0.6900
+    390.4000   1458.3800     34.8000      0.6900
+    390.6000   1458.3700     34.7900      0.6900
+    390.7000   1458.3700     34.7900      0.6900
+    390.8000   1458.3700     34.7900      0.6900
+    391.0000   1458.3800     34.7900      0.6900
+    391.1000   1458.3800     34.7900      0.6900
+    391.2000   1458.3800     34.7900      0.6900
+    391.4000   1458.3800     34.7900      0.6900
+    391.5000   1458.3800     34.7900      0.6900
+    391.7000   1458.4300     34.7900      0.7000
+    391.8000   1458.4300     34.7900      0.7000
+    391.9000   1458.4500     34.8000      0.7000
+    392.1000   1458.4500     34.8000      0.7000
+    392.2000   1458.4500     34.8000      0.7000
+    392.3000   1458.4300     34.7800      0.7000
+    392.5000   1458.4600     34.8000      0.7000
+    392.6000   1458.4600     34.8000      0.7000
+    392.7000   1458.4600     34.8000      0.7000
+    392.9000   1458.4600     34.8000      0.7000
+    393.0000   1458.4600     34.8000      0.7000
+    393.1000   1458.4700     34.8000      0.7000
+    393.3000   1458.4700     34.8000      0.7000
+    393.4000   1458.4700     34.8000      0.7000
+    393.5000   1458.4700     34.8000      0.7000
+    393.7000   1458.4700     34.8000      0.7000
+    393.8000   1458.4800     34.8000      0.7000
+    393.9000   1458.4800     34.8000      0.7000
+    394.1000   1458.4800     34.8000      0.7000
+    394.2000   1458.4800     34.8000      0.7000
+    394.3000   1458.4900     34.8000      0.7000
+    394.5000   1458.4900     34.8000      0.7000
+    394.6000   1458.4900     34.8000      0.7000
+    394.8000   1458.4900     34.8000      0.7000
+    394.9000   1458.4900     34.8000      0.7000
+    395.0000   1458.5000     34.8000      0.7000
+    395.2000   1458.5000     34.8000      0.7000
+    395.3000   1458.5500     34.8000      0.7100
+    395.4000   1458.5400     34.7900      0.7100
+    395.6000   1458.4900     34.7900      0.7000
+    395.7000   1458.5500     34.7900      0.7100
+    395.8000   1458.5500     34.7900      0.7100
+    396.0000   1458.5400     34.7900      0.7100
+    396.1000   1458.5400     34.7900      0.7100
+    396.2000   1458.5500     34.7900      0.7100
+    396.4000   1458.5700     34.8000      0.7100
+    396.5000   1458.5500     34.7900      0.7100
+    396.6000   1458.5500     34.7900      0.7100
+    396.8000   1458.5800     34.8000      0.7100
+    396.9000   1458.5800     34.8000      0.7100
+    397.0000   1458.5600     34.7900      0.7100
+    397.2000   1458.5600     34.7900      0.7100
+    397.3000   1458.5600     34.7800      0.7100
+    397.4000   1458.5900     34.8000      0.7100
+    397.6000   1458.5700     34.7800      0.7100
+    397.7000   1458.6000     34.8000      0.7100
+    397.8000   1458.6000     34.8000      0.7100
+    398.0000   1458.6000     34.8000      0.7100
+    398.1000   1458.6000     34.8000      0.7100
+    398.3000   1458.6000     34.8000      0.7100
+    398.4000   1458.6100     34.8000      0.7100
+    398.5000   1458.6100     34.8000      0.7100
+    398.7000   1458.6100     34.8000      0.7100
+    398.8000   1458.6100     34.8000      0.7100
+    398.9000   1458.6100     34.8000      0.7100
+    399.1000   1458.6200     34.8000      0.7100
+    399.2000   1458.6200     34.8000      0.7100
+    399.3000   1458.6700     34.8000      0.7200
+    399.5000   1458.6600     34.8000      0.7200
+    399.6000   1458.6100     34.7900      0.7100
+    399.7000   1458.6700     34.8000      0.7200
+    399.9000   1458.6200     34.8000      0.7100
+    400.0000   1458.6700     34.8000      0.7200
+    400.1000   1458.6700     34.8000      0.7200
+    400.3000   1458.6700     34.7900      0.7200
+    400.4000   1458.6700     34.7900      0.7200
+    400.5000   1458.6700     34.7900      0.7200
+    400.7000   1458.6700     34.7900      0.7200
+    400.8000   1458.6800     34.7900      0.7200
+    400.9000   1458.6800     34.7900      0.7200
+    401.1000   1458.7100     34.8100      0.7200
+    401.2000   1458.7100     34.8100      0.7200
+    401.3000   1458.7600     34.8100      0.7300
+    401.5000   1458.7500     34.8000      0.7300
+    401.6000   1458.7500     34.8000      0.7300
+    401.8000   1458.7500     34.8000      0.7300
+    401.9000   1458.7500     34.8000      0.7300
+    402.0000   1458.7500     34.8000      0.7300
+    402.2000   1458.7500     34.8000      0.7300
+    402.3000   1458.7600     34.8000      0.7300
+    402.4000   1458.7600     34.8000      0.7300
+    402.6000   1458.7600     34.8000      0.7300
+    402.7000   1458.7900     34.8200      0.7300
+    402.8000   1458.7600     34.8000      0.7300
+    403.0000   1458.7700     34.8000      0.7300
+    403.1000   1458.7700     34.8000      0.7300
+    403.2000   1458.7700     34.8000      0.7300
+    403.4000   1458.7700     34.8000      0.7300
+    403.5000   1458.8000     34.8200      0.7300
+    403.6000   1458.8000     34.8200      0.7300
+    403.8000   1458.8000     34.8200      0.7300
+    403.9000   1458.7800     34.8000      0.7300
+    404.0000   1458.7800     34.8000      0.7300
+    404.2000   1458.8100     34.8200      0.7300
+    404.3000   1458.7900     34.8000      0.7300
+    404.4000   1458.8200     34.8200      0.7300
+    404.6000   1458.7900     34.8000      0.7300
+    404.7000   1458.7900     34.8000      0.7300
+    404.8000   1458.8200     34.8200      0.7300
+    405.0000   1458.8200     34.8200      0.7300
+    405.1000   1458.8300     34.8200      0.7300
+    405.3000   1458.8300     34.8100      0.7300
+    405.4000   1458.8300     34.8100      0.7300
+    405.5000   1458.8300     34.8100      0.7300
+    405.7000   1458.8300     34.8100      0.7300
+    405.8000   1458.8400     34.8100      0.7300
+    405.9000   1458.8400     34.8100      0.7300
+    406.1000   1458.8400     34.8100      0.7300
+    406.2000   1458.8900     34.8100      0.7400
+    406.3000   1458.8400     34.8100      0.7300
+    406.5000   1458.8400     34.8100      0.7300
+    406.6000   1458.8500     34.8100      0.7300
+    406.7000   1458.9000     34.8100      0.7400
+    406.9000   1458.8900     34.8100      0.7400
+    407.0000   1458.8400     34.8000      0.7300
+    407.1000   1458.8500     34.8100      0.7300
+    407.3000   1458.8600     34.8100      0.7300
+    407.4000   1458.8600     34.8100      0.7300
+    407.5000   1458.9100     34.8100      0.7400
+    407.7000   1458.8600     34.8100      0.7300
+    407.8000   1458.9100     34.8100      0.7400
+    407.9000   1458.8600     34.8100      0.7300
+    408.1000   1458.9100     34.8100      0.7400
+    408.2000   1458.9100     34.8100      0.7400
+    408.3000   1458.8600     34.8000      0.7300
+    408.5000   1458.9200     34.8100      0.7400
+    408.6000   1458.8700     34.8100      0.7300
+    408.8000   1458.9200     34.8100      0.7400
+    408.9000   1458.9200     34.8100      0.7400
+    409.0000   1458.8700     34.8000      0.7300
+    409.2000   1458.9300     34.8100      0.7400
+    409.3000   1458.8800     34.8100      0.7300
+    409.4000   1458.9300     34.8100      0.7400
+    409.6000   1458.9300     34.8100      0.7400
+    409.7000   1458.8800     34.8000      0.7300
+    409.8000   1458.9400     34.8100      0.7400
+    410.0000   1458.8900     34.8100      0.7300
+    410.1000   1458.9000     34.8100      0.7300
+    410.2000   1458.9100     34.8100      0.7300
+    410.4000   1458.9100     34.8100      0.7300
+    410.5000   1458.9600     34.8100      0.7400
+    410.6000   1458.9000     34.8100      0.7300
+    410.8000   1458.9500     34.8100      0.7400
+    410.9000   1458.9600     34.8100      0.7400
+    411.0000   1458.9000     34.8000      0.7300
+    411.2000   1458.9600     34.8100      0.7400
+    411.3000   1458.9100     34.8100      0.7300
+    411.4000   1458.9600     34.8100      0.7400
+    411.6000   1458.9700     34.8100      0.7400
+    411.7000   1458.9100     34.8000      0.7300
+    411.8000   1458.9700     34.8100      0.7400
+    412.0000   1458.9700     34.8100      0.7400
+    412.1000   1458.9700     34.8000      0.7400
+    412.3000   1458.9700     34.8000      0.7400
+    412.4000   1458.9200     34.8000      0.7300
+    412.5000   1458.9800     34.8000      0.7400
+    412.7000   1458.9800     34.8000      0.7400
+    412.8000   1458.9800     34.8000      0.7400
+    412.9000   1458.9800     34.8000      0.7400
+    413.1000   1458.9300     34.8000      0.7300
+    413.2000   1458.9900     34.8000      0.7400
+    413.3000   1458.9900     34.8000      0.7400
+    413.5000   1458.9900     34.8000      0.7400
+    413.6000   1458.9900     34.8000      0.7400
+    413.7000   1458.9900     34.8000      0.7400
+    413.9000   1458.9900     34.8000      0.7400
+    414.0000   1459.0000     34.8000      0.7400
+    414.1000   1459.0000     34.8000      0.7400
+    414.3000   1459.0000     34.8000      0.7400
+    414.4000   1459.0000     34.8000      0.7400
+    414.5000   1459.0300     34.8200      0.7400
+    414.7000   1459.0100     34.8000      0.7400
+    414.8000   1459.0100     34.8000      0.7400
+    414.9000   1459.0400     34.8200      0.7400
+    415.1000   1459.0100     34.8000      0.7400
+    415.2000   1459.0400     34.8200      0.7400
+    415.3000   1459.0200     34.8000      0.7400
+    415.5000   1459.0200     34.8000      0.7400
+    415.6000   1459.0500     34.8200      0.7400
+    415.7000   1459.0200     34.8000      0.7400
+    415.9000   1459.0300     34.8000      0.7400
+    416.0000   1459.0500     34.8200      0.7400
+    416.2000   1459.0600     34.8200      0.7400
+    416.3000   1459.0600     34.8200      0.7400
+    416.4000   1459.0600     34.8200      0.7400
+    416.6000   1459.0600     34.8200      0.7400
+    416.7000   1459.0600     34.8200      0.7400
+    416.8000   1459.0700     34.8200      0.7400
+    417.0000   1459.1200     34.8200      0.7500
+    417.1000   1459.0600     34.8100      0.7400
+    417.2000   1459.1100     34.8100      0.7500
+    417.4000   1459.1100     34.8100      0.7500
+    417.5000   1459.1100     34.8000      0.7500
+    417.6000   1459.1100     34.8000      0.7500
+    417.8000   1459.0600     34.8000      0.7400
+    417.9000   1459.1200     34.8100      0.7500
+    418.0000   1459.1200     34.8100      0.7500
+    418.2000   1459.1200     34.8000      0.7500
+    418.3000   1459.1200     34.8000      0.7500
+    418.4000   1459.1200     34.8000      0.7500
+    418.6000   1459.1200     34.8000      0.7500
+    418.7000   1459.1300     34.8000      0.7500
+    418.8000   1459.1300     34.8000      0.7500
+    419.0000   1459.1300     34.8000      0.7500
+    419.1000   1459.1300     34.8000      0.7500
+    419.2000   1459.1400     34.8000      0.7500
+    419.4000   1459.1600     34.8200      0.7500
+    419.5000   1459.1400     34.8000      0.7500
+    419.6000   1459.1700     34.8200      0.7500
+    419.8000   1459.1400     34.8000      0.7500
+    419.9000   1459.1500     34.8000      0.7500
+    420.1000   1459.1500     34.8000      0.7500
+    420.2000   1459.1800     34.8200      0.7500
+    420.3000   1459.1800     34.8200      0.7500
+    420.5000   1459.1500     34.8000      0.7500
+    420.6000   1459.1800     34.8200      0.7500
+    420.7000   1459.1800     34.8200      0.7500
+    420.9000   1459.2300     34.8200      0.7600
+    421.0000   1459.2300     34.8200      0.7600
+    421.1000   1459.2200     34.8100      0.7600
+    421.3000   1459.2200     34.8100      0.7600
+    421.4000   1459.2300     34.8100      0.7600
+    421.5000   1459.2500     34.8300      0.7600
+    421.7000   1459.2300     34.8100      0.7600
+    421.8000   1459.2600     34.8300      0.7600
+    421.9000   1459.3100     34.8300      0.7700
+    422.1000   1459.3000     34.8200      0.7700
+    422.2000   1459.3000     34.8200      0.7700
+    422.3000   1459.3000     34.8200      0.7700
+    422.5000   1459.3000     34.8200      0.7700
+    422.6000   1459.3000     34.8200      0.7700
+    422.7000   1459.3000     34.8200      0.7700
+    422.9000   1459.3100     34.8200      0.7700
+    423.0000   1459.3100     34.8200      0.7700
+    423.1000   1459.3100     34.8200      0.7700
+    423.3000   1459.3100     34.8200      0.7700
+    423.4000   1459.3100     34.8200      0.7700
+    423.5000   1459.3400     34.8300      0.7700
+    423.7000   1459.3200     34.8200      0.7700
+    423.8000   1459.3500     34.8300      0.7700
+    424.0000   1459.3500     34.8300      0.7700
+    424.1000   1459.3500     34.8300      0.7700
+    424.2000   1459.3300     34.8200      0.7700
+    424.4000   1459.3600     34.8300      0.7700
+    424.5000   1459.3300     34.8100      0.7700
+    424.6000   1459.3800     34.8100      0.7800
+    424.8000   1459.3300     34.8100      0.7700
+    424.9000   1459.4000     34.8300      0.7800
+    425.0000   1459.4100     34.8300      0.7800
+    425.2000   1459.3300     34.8000      0.7700
+    425.3000   1459.4100     34.8300      0.7800
+    425.4000   1459.3600     34.8300      0.7700
+    425.6000   1459.4100     34.8300      0.7800
+    425.7000   1459.3900     34.8100      0.7800
+    425.8000   1459.3800     34.8000      0.7800
+    426.0000   1459.4100     34.8200      0.7800
+    426.1000   1459.4100     34.8200      0.7800
+    426.2000   1459.4200     34.8200      0.7800
+    426.4000   1459.4200     34.8200      0.7800
+    426.5000   1459.3900     34.8000      0.7800
+    426.6000   1459.4000     34.8000      0.7800
+    426.8000   1459.4200     34.8200      0.7800
+    426.9000   1459.4300     34.8200      0.7800
+    427.0000   1459.4300     34.8200      0.7800
+    427.2000   1459.4300     34.8200      0.7800
+    427.3000   1459.4300     34.8200      0.7800
+    427.4000   1459.4400     34.8200      0.7800
+    427.6000   1459.4400     34.8200      0.7800
+    427.7000   1459.4400     34.8200      0.7800
+    427.9000   1459.4400     34.8200      0.7800
+    428.0000   1459.4400     34.8200      0.7800
+    428.1000   1459.4500     34.8200      0.7800
+    428.3000   1459.4500     34.8200      0.7800
+    428.4000   1459.4500     34.8200      0.7800
+    428.5000   1459.4500     34.8200      0.7800
+    428.7000   1459.4500     34.8200      0.7800
+    428.8000   1459.4600     34.8200      0.7800
+    428.9000   1459.4600     34.8200      0.7800
+    429.1000   1459.4600     34.8200      0.7800
+    429.2000   1459.4600     34.8200      0.7800
+    429.3000   1459.4600     34.8200      0.7800
+    429.5000   1459.4700     34.8200      0.7800
+    429.6000   1459.4700     34.8200      0.7800
+    429.7000   1459.4700     34.8200      0.7800
+    429.9000   1459.4700     34.8200      0.7800
+    430.0000   1459.4800     34.8200      0.7800
+    430.1000   1459.4800     34.8200      0.7800
+    430.3000   1459.4800     34.8200      0.7800
+    430.4000   1459.4800     34.8200      0.7800
+    430.5000   1459.4800     34.8200      0.7800
+    430.7000   1459.4900     34.8200      0.7800
+    430.8000   1459.4900     34.8200      0.7800
+    430.9000   1459.4900     34.8200      0.7800
+    431.1000   1459.4900     34.8200      0.7800
+    431.2000   1459.4900     34.8200      0.7800
+    431.3000   1459.5000     34.8200      0.7800
+    431.5000   1459.5000     34.8200      0.7800
+    431.6000   1459.5000     34.8200      0.7800
+    431.8000   1459.5000     34.8200      0.7800
+    431.9000   1459.5000     34.8200      0.7800
+    432.0000   1459.5500     34.8200      0.7900
+    432.2000   1459.5700     34.8300      0.7900
+    432.3000   1459.5700     34.8300      0.7900
+    432.4000   1459.5700     34.8300      0.7900
+    432.6000   1459.5700     34.8300      0.7900
+    432.7000   1459.5700     34.8300      0.7900
+    432.8000   1459.5800     34.8300      0.7900
+    433.0000   1459.5800     34.8300      0.7900
+    433.1000   1459.5800     34.8300      0.7900
+    433.2000   1459.5800     34.8300      0.7900
+    433.4000   1459.5800     34.8200      0.7900
+    433.5000   1459.5900     34.8200      0.7900
+    433.6000   1459.6400     34.8200      0.8000
+    433.8000   1459.6600     34.8400      0.8000
+    433.9000   1459.6200     34.8100      0.8000
+    434.0000   1459.6300     34.8100      0.8000
+    434.2000   1459.6500     34.8300      0.8000
+    434.3000   1459.6600     34.8300      0.8000
+    434.4000   1459.6600     34.8300      0.8000
+    434.6000   1459.6600     34.8300      0.8000
+    434.7000   1459.6600     34.8300      0.8000
+    434.8000   1459.6700     34.8300      0.8000
+    435.0000   1459.6400     34.8100      0.8000
+    435.1000   1459.6700     34.8300      0.8000
+    435.2000   1459.6700     34.8300      0.8000
+    435.4000   1459.6700     34.8300      0.8000
+    435.5000   1459.6800     34.8300      0.8000
+    435.6000   1459.6800     34.8300      0.8000
+    435.8000   1459.6800     34.8300      0.8000
+    435.9000   1459.6800     34.8300      0.8000
+    436.1000   1459.6800     34.8300      0.8000
+    436.2000   1459.6900     34.8300      0.8000
+    436.3000   1459.6900     34.8300      0.8000
+    436.5000   1459.6900     34.8300      0.8000
+    436.6000   1459.6900     34.8300      0.8000
+    436.7000   1459.7400     34.8300      0.8100
+    436.9000   1459.6900     34.8200      0.8000
+    437.0000   1459.7400     34.8200      0.8100
+    437.1000   1459.7400     34.8200      0.8100
+    437.3000   1459.7300     34.8200      0.8100
+    437.4000   1459.7400     34.8200      0.8100
+    437.5000   1459.7400     34.8200      0.8100
+    437.7000   1459.7700     34.8400      0.8100
+    437.8000   1459.7400     34.8200      0.8100
+    437.9000   1459.7700     34.8400      0.8100
+    438.1000   1459.7700     34.8400      0.8100
+    438.2000   1459.7700     34.8400      0.8100
+    438.3000   1459.7800     34.8400      0.8100
+    438.5000   1459.7800     34.8400      0.8100
+    438.6000   1459.7800     34.8400      0.8100
+    438.7000   1459.7800     34.8400      0.8100
+    438.9000   1459.7900     34.8400      0.8100
+    439.0000   1459.7900     34.8400      0.8100
+    439.1000   1459.7900     34.8400      0.8100
+    439.3000   1459.7900     34.8400      0.8100
+    439.4000   1459.7700     34.8200      0.8100
+    439.5000   1459.8000     34.8400      0.8100
+    439.7000   1459.8000     34.8400      0.8100
+    439.8000   1459.8000     34.8400      0.8100
+    439.9000   1459.8000     34.8400      0.8100
+    440.1000   1459.8000     34.8400      0.8100
+    440.2000   1459.8100     34.8400      0.8100
+    440.4000   1459.8100     34.8400      0.8100
+    440.5000   1459.8100     34.8400      0.8100
+    440.6000   1459.8100     34.8400      0.8100
+    440.8000   1459.8100     34.8400      0.8100
+    440.9000   1459.8200     34.8400      0.8100
+    441.0000   1459.8200     34.8400      0.8100
+    441.2000   1459.8200     34.8400      0.8100
+    441.3000   1459.8200     34.8400      0.8100
+    441.4000   1459.8300     34.8400      0.8100
+    441.6000   1459.8300     34.8400      0.8100
+    441.7000   1459.8300     34.8400      0.8100
+    441.8000   1459.8300     34.8400      0.8100
+    442.0000   1459.8300     34.8400      0.8100
+    442.1000   1459.8400     34.8400      0.8100
+    442.2000   1459.8400     34.8400      0.8100
+    442.4000   1459.8400     34.8300      0.8100
+    442.5000   1459.8400     34.8300      0.8100
+    442.6000   1459.8400     34.8300      0.8100
+    442.8000   1459.8500     34.8300      0.8100
+    442.9000   1459.8500     34.8300      0.8100
+    443.0000   1459.8500     34.8300      0.8100
+    443.2000   1459.8500     34.8300      0.8100
+    443.3000   1459.8500     34.8300      0.8100
+    443.4000   1459.8600     34.8300      0.8100
+    443.6000   1459.8600     34.8300      0.8100
+    443.7000   1459.8600     34.8300      0.8100
+    443.8000   1459.8600     34.8300      0.8100
+    444.0000   1459.8600     34.8300      0.8100
+    444.1000   1459.8700     34.8300      0.8100
+    444.2000   1459.8700     34.8300      0.8100
+    444.4000   1459.8700     34.8300      0.8100
+    444.5000   1459.8700     34.8300      0.8100
+    444.6000   1459.8800     34.8300      0.8100
+    444.8000   1459.8800     34.8300      0.8100
+    444.9000   1459.8800     34.8300      0.8100
+    445.1000   1459.8800     34.8300      0.8100
+    445.2000   1459.8800     34.8300      0.8100
+    445.3000   1459.8900     34.8300      0.8100
+    445.5000   1459.8900     34.8300      0.8100
+    445.6000   1459.8900     34.8300      0.8100
+    445.7000   1459.8900     34.8300      0.8100
+    445.9000   1459.9400     34.8300      0.8200
+    446.0000   1459.8900     34.8300      0.8100
+    446.1000   1459.8900     34.8300      0.8100
+    446.3000   1459.9000     34.8300      0.8100
+    446.4000   1459.9500     34.8300      0.8200
+    446.5000   1459.9400     34.8300      0.8200
+    446.7000   1459.9400     34.8200      0.8200
+    446.8000   1459.9400     34.8200      0.8200
+    446.9000   1459.9200     34.8400      0.8100
+    447.1000   1459.9800     34.8500      0.8200
+    447.2000   1459.9800     34.8500      0.8200
+    447.3000   1459.9300     34.8400      0.8100
+    447.5000   1459.9800     34.8500      0.8200
+    447.6000   1459.9900     34.8500      0.8200
+    447.7000   1459.9800     34.8400      0.8200
+    447.9000   1459.9800     34.8400      0.8200
+    448.0000   1459.9900     34.8400      0.8200
+    448.1000   1459.9900     34.8400      0.8200
+    448.3000   1459.9900     34.8400      0.8200
+    448.4000   1459.9900     34.8400      0.8200
+    448.5000   1459.9900     34.8400      0.8200
+    448.7000   1460.0000     34.8400      0.8200
+    448.8000   1460.0000     34.8400      0.8200
+    448.9000   1459.9500     34.8400      0.8100
+    449.1000   1460.0100     34.8400      0.8200
+    449.2000   1460.0100     34.8400      0.8200
+    449.3000   1460.0100     34.8400      0.8200
+    449.5000   1460.0100     34.8400      0.8200
+    449.6000   1460.0100     34.8400      0.8200
+    449.8000   1460.0100     34.8400      0.8200
+    449.9000   1460.0100     34.8400      0.8200
+    450.0000   1459.9700     34.8400      0.8100
+    450.2000   1460.0300     34.8400      0.8200
+    450.3000   1459.9800     34.8400      0.8100
+    450.4000   1460.0300     34.8400      0.8200
+    450.6000   1460.0300     34.8400      0.8200
+    450.7000   1460.0300     34.8400      0.8200
+    450.8000   1460.0300     34.8400      0.8200
+    451.0000   1460.0300     34.8400      0.8200
+    451.1000   1460.0300     34.8400      0.8200
+    451.2000   1460.0400     34.8400      0.8200
+    451.4000   1460.0100     34.8200      0.8200
+    451.5000   1460.0400     34.8400      0.8200
+    451.6000   1460.0400     34.8400      0.8200
+    451.8000   1460.0400     34.8400      0.8200
+    451.9000   1460.0500     34.8400      0.8200
+    452.0000   1460.0500     34.8400      0.8200
+    452.2000   1460.0500     34.8400      0.8200
+    452.3000   1460.0100     34.8400      0.8100
+    452.4000   1460.0600     34.8400      0.8200
+    452.6000   1460.0600     34.8400      0.8200
+    452.7000   1460.0600     34.8400      0.8200
+    452.8000   1460.0600     34.8400      0.8200
+    453.0000   1460.0200     34.8400      0.8100
+    453.1000   1460.0700     34.8400      0.8200
+    453.2000   1460.0700     34.8400      0.8200
+    453.4000   1460.0700     34.8400      0.8200
+    453.5000   1460.0700     34.8400      0.8200
+    453.6000   1460.0700     34.8400      0.8200
+    453.8000   1460.0800     34.8400      0.8200
+    453.9000   1460.0800     34.8400      0.8200
+    454.0000   1460.0300     34.8400      0.8100
+    454.2000   1460.0900     34.8400      0.8200
+    454.3000   1460.0400     34.8400      0.8100
+    454.5000   1460.0900     34.8400      0.8200
+    454.6000   1460.1000     34.8400      0.8200
+    454.7000   1460.0400     34.8400      0.8100
+    454.9000   1460.1000     34.8400      0.8200
+    455.0000   1460.1000     34.8400      0.8200
+    455.1000   1460.1000     34.8400      0.8200
+    455.3000   1460.1000     34.8400      0.8200
+    455.4000   1460.1000     34.8400      0.8200
+    455.5000   1460.1000     34.8300      0.8200
+    455.7000   1460.1000     34.8300      0.8200
+    455.8000   1460.1100     34.8300      0.8200
+    455.9000   1460.1100     34.8300      0.8200
+    456.1000   1460.1100     34.8300      0.8200
+    456.2000   1460.1100     34.8300      0.8200
+    456.3000   1460.1200     34.8300      0.8200
+    456.5000   1460.1200     34.8300      0.8200
+    456.6000   1460.1200     34.8300      0.8200
+    456.7000   1460.1200     34.8300      0.8200
+    456.9000   1460.1200     34.8300      0.8200
+    457.0000   1460.1300     34.8300      0.8200
+    457.1000   1460.1300     34.8300      0.8200
+    457.3000   1460.1300     34.8300      0.8200
+    457.4000   1460.1300     34.8300      0.8200
+    457.5000   1460.1300     34.8300      0.8200
+    457.7000   1460.1400     34.8300      0.8200
+    457.8000   1460.1400     34.8300      0.8200
+    457.9000   1460.1400     34.8300      0.8200
+    458.1000   1460.1400     34.8300      0.8200
+    458.2000   1460.1400     34.8300      0.8200
+    458.3000   1460.1000     34.8300      0.8100
+    458.5000   1460.1600     34.8400      0.8200
+    458.6000   1460.1100     34.8400      0.8100
+    458.7000   1460.1100     34.8400      0.8100
+    458.9000   1460.1700     34.8400      0.8200
+    459.0000   1460.1600     34.8400      0.8200
+    459.1000   1460.1600     34.8300      0.8200
+    459.3000   1460.1600     34.8300      0.8200
+    459.4000   1460.1600     34.8300      0.8200
+    459.6000   1460.1700     34.8300      0.8200
+    459.7000   1460.1700     34.8300      0.8200
+    459.8000   1460.1700     34.8300      0.8200
+    460.0000   1460.2000     34.8500      0.8200
+    460.1000   1460.2000     34.8500      0.8200
+    460.2000   1460.1800     34.8300      0.8200
+    460.4000   1460.1800     34.8300      0.8200
+    460.5000   1460.1800     34.8300      0.8200
+    460.6000   1460.2100     34.8500      0.8200
+    460.8000   1460.2100     34.8500      0.8200
+    460.9000   1460.2100     34.8500      0.8200
+    461.0000   1460.1900     34.8300      0.8200
+    461.2000   1460.2200     34.8500      0.8200
+    461.3000   1460.2200     34.8500      0.8200
+    461.4000   1460.2200     34.8500      0.8200
+    461.6000   1460.2200     34.8500      0.8200
+    461.7000   1460.2200     34.8500      0.8200
+    461.8000   1460.2000     34.8300      0.8200
+    462.0000   1460.2000     34.8300      0.8200
+    462.1000   1460.2300     34.8500      0.8200
+    462.2000   1460.2300     34.8500      0.8200
+    462.4000   1460.2100     34.8300      0.8200
+    462.5000   1460.2400     34.8500      0.8200
+    462.6000   1460.2400     34.8500      0.8200
+    462.8000   1460.2200     34.8300      0.8200
+    462.9000   1460.2400     34.8500      0.8200
+    463.0000   1460.2200     34.8300      0.8200
+    463.2000   1460.2500     34.8500      0.8200
+    463.3000   1460.2500     34.8500      0.8200
+    463.4000   1460.2500     34.8500      0.8200
+    463.6000   1460.2500     34.8500      0.8200
+    463.7000   1460.2600     34.8500      0.8200
+    463.8000   1460.2600     34.8500      0.8200
+    464.0000   1460.2600     34.8500      0.8200
+    464.1000   1460.2600     34.8500      0.8200
+    464.2000   1460.2600     34.8500      0.8200
+    464.4000   1460.2700     34.8500      0.8200
+    464.5000   1460.2700     34.8500      0.8200
+    464.7000   1460.2700     34.8500      0.8200
+    464.8000   1460.2700     34.8500      0.8200
+    464.9000   1460.2800     34.8500      0.8200
+    465.1000   1460.2800     34.8500      0.8200
+    465.2000   1460.2800     34.8500      0.8200
+    465.3000   1460.2800     34.8500      0.8200
+    465.5000   1460.2800     34.8500      0.8200
+    465.6000   1460.2900     34.8500      0.8200
+    465.7000   1460.2600     34.8300      0.8200
+    465.9000   1460.2900     34.8500      0.8200
+    466.0000   1460.2900     34.8500      0.8200
+    466.1000   1460.2700     34.8300      0.8200
+    466.3000   1460.3000     34.8500      0.8200
+    466.4000   1460.3000     34.8500      0.8200
+    466.5000   1460.3000     34.8500      0.8200
+    466.7000   1460.3000     34.8500      0.8200
+    466.8000   1460.3000     34.8500      0.8200
+    466.9000   1460.3100     34.8500      0.8200
+    467.1000   1460.3100     34.8500      0.8200
+    467.2000   1460.3100     34.8500      0.8200
+    467.3000   1460.3100     34.8500      0.8200
+    467.5000   1460.3100     34.8500      0.8200
+    467.6000   1460.3200     34.8500      0.8200
+    467.7000   1460.3200     34.8500      0.8200
+    467.9000   1460.3200     34.8500      0.8200
+    468.0000   1460.3200     34.8500      0.8200
+    468.1000   1460.3300     34.8500      0.8200
+    468.3000   1460.3300     34.8500      0.8200
+    468.4000   1460.3300     34.8500      0.8200
+    468.5000   1460.3300     34.8500      0.8200
+    468.7000   1460.3300     34.8500      0.8200
+    468.8000   1460.3400     34.8500      0.8200
+    468.9000   1460.3400     34.8500      0.8200
+    469.1000   1460.3400     34.8500      0.8200
+    469.2000   1460.3400     34.8500      0.8200
+    469.3000   1460.3400     34.8500      0.8200
+    469.5000   1460.3500     34.8500      0.8200
+    469.6000   1460.3500     34.8500      0.8200
+    469.7000   1460.3500     34.8500      0.8200
+    469.9000   1460.3500     34.8500      0.8200
+    470.0000   1460.3500     34.8500      0.8200
+    470.2000   1460.3600     34.8500      0.8200
+    470.3000   1460.3600     34.8500      0.8200
+    470.4000   1460.3600     34.8500      0.8200
+    470.6000   1460.3600     34.8500      0.8200
+    470.7000   1460.3700     34.8500      0.8200
+    470.8000   1460.3700     34.8500      0.8200
+    471.0000   1460.3700     34.8500      0.8200
+    471.1000   1460.3700     34.8500      0.8200
+    471.2000   1460.3700     34.8500      0.8200
+    471.4000   1460.3800     34.8400      0.8200
+    471.5000   1460.3800     34.8400      0.8200
+    471.6000   1460.3800     34.8400      0.8200
+    471.8000   1460.3800     34.8400      0.8200
+    471.9000   1460.3800     34.8400      0.8200
+    472.0000   1460.3900     34.8400      0.8200
+    472.2000   1460.3900     34.8400      0.8200
+    472.3000   1460.3900     34.8400      0.8200
+    472.4000   1460.3900     34.8400      0.8200
+    472.6000   1460.3900     34.8400      0.8200
+    472.7000   1460.4000     34.8400      0.8200
+    472.8000   1460.4000     34.8400      0.8200
+    473.0000   1460.4000     34.8400      0.8200
+    473.1000   1460.4000     34.8400      0.8200
+    473.2000   1460.4100     34.8400      0.8200
+    473.4000   1460.4100     34.8400      0.8200
+    473.5000   1460.4100     34.8400      0.8200
+    473.6000   1460.4100     34.8400      0.8200
+    473.8000   1460.4100     34.8400      0.8200
+    473.9000   1460.4200     34.8400      0.8200
+    474.0000   1460.4200     34.8400      0.8200
+    474.2000   1460.4200     34.8400      0.8200
+    474.3000   1460.4200     34.8400      0.8200
+    474.4000   1460.4200     34.8400      0.8200
+    474.6000   1460.4300     34.8400      0.8200
+    474.7000   1460.4300     34.8400      0.8200
+    474.8000   1460.4300     34.8400      0.8200
+    475.0000   1460.4300     34.8400      0.8200
+    475.1000   1460.4300     34.8400      0.8200
+    475.2000   1460.4400     34.8400      0.8200
+    475.4000   1460.4400     34.8400      0.8200
+    475.5000   1460.4400     34.8400      0.8200
+    475.6000   1460.4400     34.8400      0.8200
+    475.8000   1460.4400     34.8400      0.8200
+    475.9000   1460.4500     34.8400      0.8200
+    476.1000   1460.4500     34.8400      0.8200
+    476.2000   1460.4500     34.8400      0.8200
+    476.3000   1460.4500     34.8400      0.8200
+    476.5000   1460.4600     34.8400      0.8200
+    476.6000   1460.4600     34.8400      0.8200
+    476.7000   1460.4600     34.8400      0.8200
+    476.9000   1460.4600     34.8400      0.8200
+    477.0000   1460.4600     34.8400      0.8200
+    477.1000   1460.4700     34.8400      0.8200
+    477.3000   1460.4700     34.8400      0.8200
+    477.4000   1460.4700     34.8400      0.8200
+    477.5000   1460.4700     34.8400      0.8200
+    477.7000   1460.4700     34.8400      0.8200
+    477.8000   1460.4800     34.8400      0.8200
+    477.9000   1460.4800     34.8400      0.8200
+    478.1000   1460.4800     34.8400      0.8200
+    478.2000   1460.4800     34.8400      0.8200
+    478.3000   1460.4800     34.8400      0.8200
+    478.5000   1460.4900     34.8400      0.8200
+    478.6000   1460.4900     34.8400      0.8200
+    478.7000   1460.4900     34.8400      0.8200
+    478.9000   1460.4500     34.8400      0.8100
+    479.0000   1460.5000     34.8500      0.8200
+    479.1000   1460.4600     34.8500      0.8100
+    479.3000   1460.5100     34.8500      0.8200
+    479.4000   1460.5100     34.8500      0.8200
+    479.5000   1460.5000     34.8400      0.8200
+    479.7000   1460.5100     34.8400      0.8200
+    479.8000   1460.4600     34.8400      0.8100
+    479.9000   1460.5200     34.8500      0.8200
+    480.1000   1460.5200     34.8500      0.8200
+    480.2000   1460.4700     34.8400      0.8100
+    480.3000   1460.5200     34.8500      0.8200
+    480.5000   1460.4800     34.8500      0.8100
+    480.6000   1460.4800     34.8500      0.8100
+    480.7000   1460.4900     34.8500      0.8100
+    480.9000   1460.4900     34.8500      0.8100
+    481.0000   1460.5400     34.8500      0.8200
+    481.1000   1460.4900     34.8500      0.8100
+    481.3000   1460.4900     34.8500      0.8100
+    481.4000   1460.5000     34.8500      0.8100
+    481.5000   1460.5000     34.8500      0.8100
+    481.7000   1460.5100     34.8500      0.8100
+    481.8000   1460.5100     34.8500      0.8100
+    482.0000   1460.5100     34.8500      0.8100
+    482.1000   1460.5100     34.8500      0.8100
+    482.2000   1460.5100     34.8500      0.8100
+    482.4000   1460.5200     34.8500      0.8100
+    482.5000   1460.5200     34.8500      0.8100
+    482.6000   1460.5700     34.8500      0.8200
+    482.8000   1460.5600     34.8400      0.8200
+    482.9000   1460.5100     34.8400      0.8100
+    483.0000   1460.5700     34.8400      0.8200
+    483.2000   1460.5200     34.8400      0.8100
+    483.3000   1460.6000     34.8600      0.8200
+    483.4000   1460.5700     34.8400      0.8200
+    483.6000   1460.5200     34.8400      0.8100
+    483.7000   1460.5800     34.8400      0.8200
+    483.8000   1460.5300     34.8400      0.8100
+    484.0000   1460.5800     34.8400      0.8200
+    484.1000   1460.5800     34.8400      0.8200
+    484.2000   1460.5600     34.8600      0.8100
+    484.4000   1460.5400     34.8400      0.8100
+    484.5000   1460.5500     34.8500      0.8100
+    484.6000   1460.5500     34.8500      0.8100
+    484.8000   1460.6000     34.8500      0.8200
+    484.9000   1460.5500     34.8400      0.8100
+    485.0000   1460.6000     34.8400      0.8200
+    485.2000   1460.5500     34.8400      0.8100
+    485.3000   1460.6000     34.8400      0.8200
+    485.4000   1460.5600     34.8400      0.8100
+    485.6000   1460.5600     34.8400      0.8100
+    485.7000   1460.5700     34.8500      0.8100
+    485.8000   1460.5700     34.8500      0.8100
+    486.0000   1460.5700     34.8500      0.8100
+    486.1000   1460.5700     34.8500      0.8100
+    486.2000   1460.5800     34.8500      0.8100
+    486.4000   1460.5800     34.8500      0.8100
+    486.5000   1460.5800     34.8500      0.8100
+    486.6000   1460.5800     34.8500      0.8100
+    486.8000   1460.5900     34.8500      0.8100
+    486.9000   1460.6100     34.8700      0.8100
+    487.0000   1460.5900     34.8500      0.8100
+    487.2000   1460.5900     34.8500      0.8100
+    487.3000   1460.6200     34.8700      0.8100
+    487.4000   1460.6000     34.8500      0.8100
+    487.6000   1460.6000     34.8500      0.8100
+    487.7000   1460.6000     34.8500      0.8100
+    487.8000   1460.6000     34.8500      0.8100
+    488.0000   1460.6000     34.8500      0.8100
+    488.1000   1460.6300     34.8700      0.8100
+    488.2000   1460.6100     34.8500      0.8100
+    488.4000   1460.6100     34.8500      0.8100
+    488.5000   1460.6100     34.8500      0.8100
+    488.7000   1460.6100     34.8500      0.8100
+    488.8000   1460.6200     34.8500      0.8100
+    488.9000   1460.6200     34.8500      0.8100
+    489.1000   1460.6200     34.8500      0.8100
+    489.2000   1460.6200     34.8500      0.8100
+    489.3000   1460.6300     34.8500      0.8100
+    489.5000   1460.6300     34.8500      0.8100
+    489.6000   1460.5800     34.8500      0.8000
+    489.7000   1460.6400     34.8500      0.8100
+    489.9000   1460.5900     34.8500      0.8000
+    490.0000   1460.6400     34.8500      0.8100
+    490.1000   1460.6500     34.8500      0.8100
+    490.3000   1460.5900     34.8500      0.8000
+    490.4000   1460.6000     34.8500      0.8000
+    490.5000   1460.6100     34.8600      0.8000
+    490.7000   1460.6100     34.8600      0.8000
+    490.8000   1460.6200     34.8600      0.8000
+    490.9000   1460.6200     34.8600      0.8000
+    491.1000   1460.6200     34.8600      0.8000
+    491.2000   1460.6200     34.8600      0.8000
+    491.3000   1460.6200     34.8600      0.8000
+    491.5000   1460.6300     34.8600      0.8000
+    491.6000   1460.6300     34.8600      0.8000
+    491.7000   1460.6300     34.8600      0.8000
+    491.9000   1460.6300     34.8600      0.8000
+    492.0000   1460.6400     34.8600      0.8000
+    492.1000   1460.6400     34.8600      0.8000
+    492.3000   1460.6400     34.8600      0.8000
+    492.4000   1460.6200     34.8400      0.8000
+    492.5000   1460.6400     34.8600      0.8000
+    492.7000   1460.6500     34.8600      0.8000
+    492.8000   1460.6500     34.8600      0.8000
+    492.9000   1460.6500     34.8600      0.8000
+    493.1000   1460.6500     34.8600      0.8000
+    493.2000   1460.6500     34.8600      0.8000
+    493.3000   1460.6600     34.8600      0.8000
+    493.5000   1460.6600     34.8600      0.8000
+    493.6000   1460.6600     34.8600      0.8000
+    493.7000   1460.6600     34.8600      0.8000
+    493.9000   1460.6600     34.8600      0.8000
+    494.0000   1460.6700     34.8600      0.8000
+    494.1000   1460.6700     34.8600      0.8000
+    494.3000   1460.6700     34.8500      0.8000
+    494.4000   1460.6700     34.8500      0.8000
+    494.5000   1460.6800     34.8500      0.8000
+    494.7000   1460.6800     34.8500      0.8000
+    494.8000   1460.6800     34.8500      0.8000
+    494.9000   1460.6800     34.8500      0.8000
+    495.1000   1460.6800     34.8500      0.8000
+    495.2000   1460.6900     34.8500      0.8000
+    495.3000   1460.6900     34.8500      0.8000
+    495.5000   1460.6900     34.8500      0.8000
+    495.6000   1460.6900     34.8500      0.8000
+    495.8000   1460.6900     34.8500      0.8000
+    495.9000   1460.7000     34.8500      0.8000
+    496.0000   1460.7000     34.8500      0.8000
+    496.2000   1460.6700     34.8300      0.8000
+    496.3000   1460.7000     34.8500      0.8000
+    496.4000   1460.7000     34.8500      0.8000
+    496.6000   1460.7100     34.8500      0.8000
+    496.7000   1460.7100     34.8500      0.8000
+    496.8000   1460.7100     34.8500      0.8000
+    497.0000   1460.6700     34.8500      0.7900
+    497.1000   1460.7200     34.8600      0.8000
+    497.2000   1460.7200     34.8600      0.8000
+    497.4000   1460.7200     34.8500      0.8000
+    497.5000   1460.7200     34.8500      0.8000
+    497.6000   1460.7200     34.8500      0.8000
+    497.8000   1460.7300     34.8500      0.8000
+    497.9000   1460.6800     34.8500      0.7900
+    498.0000   1460.6900     34.8600      0.7900
+    498.2000   1460.7500     34.8600      0.8000
+    498.3000   1460.6700     34.8400      0.7900
+    498.4000   1460.7400     34.8600      0.8000
+    498.6000   1460.7000     34.8600      0.7900
+    498.7000   1460.7000     34.8600      0.7900
+    498.8000   1460.7100     34.8600      0.7900
+    499.0000   1460.7100     34.8600      0.7900
+    499.1000   1460.7200     34.8600      0.7900
+    499.2000   1460.7200     34.8600      0.7900
+    499.4000   1460.7700     34.8600      0.8000
+    499.5000   1460.6900     34.8400      0.7900
+    499.6000   1460.7200     34.8600      0.7900
+    499.8000   1460.7300     34.8600      0.7900
+    499.9000   1460.7300     34.8600      0.7900
+    500.0000   1460.7800     34.8600      0.8000
+    500.2000   1460.7700     34.8600      0.8000
+    500.3000   1460.6900     34.8300      0.7900
+    500.4000   1460.7300     34.8600      0.7900
+    500.6000   1460.7400     34.8600      0.7900
+    500.7000   1460.7400     34.8600      0.7900
+    500.8000   1460.7400     34.8600      0.7900
+    501.0000   1460.7400     34.8600      0.7900
+    501.1000   1460.7500     34.8600      0.7900
+    501.2000   1460.7500     34.8600      0.7900
+    501.4000   1460.7200     34.8400      0.7900
+    501.5000   1460.7500     34.8600      0.7900
+    501.6000   1460.7500     34.8600      0.7900
+    501.8000   1460.7600     34.8600      0.7900
+    501.9000   1460.7600     34.8600      0.7900
+    502.0000   1460.7600     34.8600      0.7900
+    502.2000   1460.7600     34.8600      0.7900
+    502.3000   1460.7700     34.8600      0.7900
+    502.4000   1460.7700     34.8600      0.7900
+    502.6000   1460.7700     34.8600      0.7900
+    502.7000   1460.7700     34.8600      0.7900
+    502.8000   1460.7700     34.8600      0.7900
+    503.0000   1460.7800     34.8600      0.7900
+    503.1000   1460.7800     34.8600      0.7900
+    503.2000   1460.7500     34.8400      0.7900
+    503.4000   1460.7800     34.8600      0.7900
+    503.5000   1460.7800     34.8600      0.7900
+    503.7000   1460.7600     34.8400      0.7900
+    503.8000   1460.7600     34.8400      0.7900
+    503.9000   1460.7900     34.8600      0.7900
+    504.1000   1460.7900     34.8600      0.7900
+    504.2000   1460.7700     34.8400      0.7900
+    504.3000   1460.7700     34.8400      0.7900
+    504.5000   1460.8000     34.8600      0.7900
+    504.6000   1460.7800     34.8400      0.7900
+    504.7000   1460.8000     34.8600      0.7900
+    504.9000   1460.7800     34.8400      0.7900
+    505.0000   1460.7800     34.8400      0.7900
+    505.1000   1460.7800     34.8400      0.7900
+    505.3000   1460.7900     34.8400      0.7900
+    505.4000   1460.7900     34.8400      0.7900
+    505.5000   1460.7900     34.8400      0.7900
+    505.7000   1460.7900     34.8400      0.7900
+    505.8000   1460.8200     34.8600      0.7900
+    505.9000   1460.8200     34.8600      0.7900
+    506.1000   1460.8200     34.8600      0.7900
+    506.2000   1460.8300     34.8600      0.7900
+    506.3000   1460.8300     34.8600      0.7900
+    506.5000   1460.8000     34.8400      0.7900
+    506.6000   1460.8300     34.8600      0.7900
+    506.7000   1460.8300     34.8600      0.7900
+    506.9000   1460.8400     34.8600      0.7900
+    507.0000   1460.8400     34.8600      0.7900
+    507.1000   1460.8400     34.8600      0.7900
+    507.3000   1460.8400     34.8600      0.7900
+    507.4000   1460.8400     34.8600      0.7900
+    507.5000   1460.8500     34.8600      0.7900
+    507.7000   1460.8500     34.8600      0.7900
+    507.8000   1460.8500     34.8600      0.7900
+    507.9000   1460.8500     34.8600      0.7900
+    508.1000   1460.8600     34.8600      0.7900
+    508.2000   1460.8600     34.8600      0.7900
+    508.3000   1460.8600     34.8600      0.7900
+    508.5000   1460.9100     34.8600      0.8000
+    508.6000   1460.8600     34.8500      0.7900
+    508.7000   1460.9100     34.8500      0.8000
+    508.9000   1460.8600     34.8500      0.7900
+    509.0000   1460.8600     34.8500      0.7900
+    509.1000   1460.9200     34.8600      0.8000
+    509.3000   1460.8700     34.8500      0.7900
+    509.4000   1460.9200     34.8500      0.8000
+    509.5000   1460.9200     34.8500      0.8000
+    509.7000   1460.9100     34.8500      0.8000
+    509.8000   1460.9100     34.8500      0.8000
+    509.9000   1460.9200     34.8500      0.8000
+    510.1000   1460.9200     34.8500      0.8000
+    510.2000   1460.9200     34.8500      0.8000
+    510.3000   1460.9200     34.8500      0.8000
+    510.5000   1460.9500     34.8600      0.8000
+    510.6000   1460.9300     34.8500      0.8000
+    510.7000   1460.9300     34.8500      0.8000
+    510.9000   1460.9300     34.8500      0.8000
+    511.0000   1460.8900     34.8500      0.7900
+    511.1000   1460.9400     34.8500      0.8000
+    511.3000   1460.9000     34.8500      0.7900
+    511.4000   1460.9500     34.8500      0.8000
+    511.5000   1460.9500     34.8500      0.8000
+    511.7000   1460.9000     34.8400      0.7900
+    511.8000   1460.9500     34.8500      0.8000
+    512.0000   1460.9100     34.8500      0.7900
+    512.1000   1460.9600     34.8500      0.8000
+    512.2000   1460.9600     34.8500      0.8000
+    512.4000   1460.9100     34.8400      0.7900
+    512.5000   1460.9600     34.8500      0.8000
+    512.6000   1460.9200     34.8500      0.7900
+    512.8000   1460.9200     34.8500      0.7900
+    512.9000   1460.9300     34.8600      0.7900
+    513.0000   1460.9300     34.8600      0.7900
+    513.2000   1460.9300     34.8600      0.7900
+    513.3000   1460.9400     34.8600      0.7900
+    513.4000   1460.9400     34.8600      0.7900
+    513.6000   1460.9700     34.8700      0.7900
+    513.7000   1460.9400     34.8600      0.7900
+    513.8000   1460.9500     34.8600      0.7900
+    514.0000   1460.9500     34.8600      0.7900
+    514.1000   1460.9500     34.8600      0.7900
+    514.2000   1460.9500     34.8600      0.7900
+    514.4000   1460.9500     34.8500      0.7900
+    514.5000   1460.9600     34.8500      0.7900
+    514.6000   1460.9600     34.8500      0.7900
+    514.8000   1460.9600     34.8500      0.7900
+    514.9000   1460.9600     34.8500      0.7900
+    515.0000   1460.9600     34.8500      0.7900
+    515.2000   1460.9700     34.8500      0.7900
+    515.3000   1460.9700     34.8500      0.7900
+    515.4000   1460.9700     34.8500      0.7900
+    515.6000   1460.9700     34.8500      0.7900
+    515.7000   1460.9700     34.8500      0.7900
+    515.8000   1460.9800     34.8500      0.7900
+    516.0000   1460.9800     34.8500      0.7900
+    516.1000   1460.9800     34.8500      0.7900
+    516.2000   1460.9800     34.8500      0.7900
+    516.4000   1460.9900     34.8500      0.7900
+    516.5000   1460.9900     34.8500      0.7900
+    516.6000   1460.9900     34.8500      0.7900
+    516.8000   1460.9900     34.8500      0.7900
+    516.9000   1460.9900     34.8500      0.7900
+    517.0000   1461.0000     34.8500      0.7900
+    517.2000   1461.0000     34.8500      0.7900
+    517.3000   1461.0000     34.8500      0.7900
+    517.4000   1461.0000     34.8500      0.7900
+    517.6000   1461.0000     34.8500      0.7900
+    517.7000   1461.0100     34.8500      0.7900
+    517.8000   1461.0100     34.8500      0.7900
+    518.0000   1461.0100     34.8500      0.7900
+    518.1000   1461.0100     34.8500      0.7900
+    518.2000   1461.0100     34.8500      0.7900
+    518.4000   1460.9700     34.8500      0.7800
+    518.5000   1460.9800     34.8600      0.7800
+    518.6000   1460.9900     34.8600      0.7800
+    518.8000   1460.9900     34.8600      0.7800
+    518.9000   1460.9900     34.8600      0.7800
+    519.0000   1461.0000     34.8600      0.7800
+    519.2000   1461.0000     34.8600      0.7800
+    519.3000   1461.0000     34.8600      0.7800
+    519.4000   1461.0000     34.8600      0.7800
+    519.6000   1461.0000     34.8600      0.7800
+    519.7000   1461.0100     34.8600      0.7800
+    519.8000   1461.0100     34.8600      0.7800
+    520.0000   1461.0100     34.8600      0.7800
+    520.1000   1461.0100     34.8600      0.7800
+    520.2000   1461.0100     34.8600      0.7800
+    520.4000   1461.0200     34.8600      0.7800
+    520.5000   1461.0200     34.8600      0.7800
+    520.6000   1461.0200     34.8600      0.7800
+    520.8000   1461.0200     34.8600      0.7800
+    520.9000   1461.0200     34.8600      0.7800
+    521.0000   1461.0300     34.8600      0.7800
+    521.2000   1461.0300     34.8600      0.7800
+    521.3000   1461.0300     34.8600      0.7800
+    521.4000   1461.0300     34.8600      0.7800
+    521.6000   1461.0400     34.8600      0.7800
+    521.7000   1461.0400     34.8600      0.7800
+    521.8000   1461.0400     34.8600      0.7800
+    522.0000   1461.0400     34.8600      0.7800
+    522.1000   1461.0400     34.8600      0.7800
+    522.3000   1461.0500     34.8600      0.7800
+    522.4000   1461.0500     34.8600      0.7800
+    522.5000   1461.0500     34.8600      0.7800
+    522.7000   1461.0500     34.8600      0.7800
+    522.8000   1461.0500     34.8600      0.7800
+    522.9000   1461.0600     34.8600      0.7800
+    523.1000   1460.9900     34.8400      0.7700
+    523.2000   1461.0700     34.8700      0.7800
+    523.3000   1461.0200     34.8700      0.7700
+    523.5000   1461.0300     34.8700      0.7700
+    523.6000   1461.0400     34.8700      0.7700
+    523.7000   1461.0400     34.8700      0.7700
+    523.9000   1461.0400     34.8700      0.7700
+    524.0000   1461.0200     34.8500      0.7700
+    524.1000   1461.0400     34.8700      0.7700
+    524.3000   1461.0200     34.8500      0.7700
+    524.4000   1461.0200     34.8500      0.7700
+    524.5000   1461.0200     34.8500      0.7700
+    524.7000   1461.0300     34.8500      0.7700
+    524.8000   1461.0300     34.8500      0.7700
+    524.9000   1461.0300     34.8500      0.7700
+    525.1000   1461.0300     34.8500      0.7700
+    525.2000   1461.0600     34.8700      0.7700
+    525.3000   1461.0400     34.8500      0.7700
+    525.5000   1461.0400     34.8500      0.7700
+    525.6000   1461.0400     34.8500      0.7700
+    525.7000   1461.0400     34.8500      0.7700
+    525.9000   1461.0400     34.8500      0.7700
+    526.0000   1461.0000     34.8500      0.7600
+    526.1000   1461.0100     34.8600      0.7600
+    526.3000   1461.0200     34.8600      0.7600
+    526.4000   1461.0200     34.8600      0.7600
+    526.5000   1461.0200     34.8600      0.7600
+    526.7000   1461.0300     34.8600      0.7600
+    526.8000   1461.0300     34.8600      0.7600
+    526.9000   1461.0300     34.8600      0.7600
+    527.1000   1461.0300     34.8600      0.7600
+    527.2000   1461.0300     34.8600      0.7600
+    527.3000   1461.0400     34.8600      0.7600
+    527.5000   1461.0400     34.8600      0.7600
+    527.6000   1461.0400     34.8600      0.7600
+    527.7000   1461.0400     34.8600      0.7600
+    527.9000   1461.0400     34.8600      0.7600
+    528.0000   1461.0500     34.8600      0.7600
+    528.1000   1461.0500     34.8600      0.7600
+    528.3000   1461.0500     34.8600      0.7600
+    528.4000   1461.0100     34.8600      0.7500
+    528.5000   1461.0600     34.8700      0.7600
+    528.7000   1460.9900     34.8500      0.7500
+    528.8000   1461.0700     34.8700      0.7600
+    528.9000   1461.0700     34.8700      0.7600
+    529.1000   1461.0200     34.8600      0.7500
+    529.2000   1461.0700     34.8700      0.7600
+    529.3000   1461.0000     34.8500      0.7500
+    529.5000   1461.0300     34.8700      0.7500
+    529.6000   1461.0400     34.8700      0.7500
+    529.7000   1461.0200     34.8500      0.7500
+    529.9000   1461.0200     34.8500      0.7500
+    530.0000   1461.0200     34.8500      0.7500
+    530.1000   1461.0500     34.8700      0.7500
+    530.3000   1461.0500     34.8700      0.7500
+    530.4000   1461.0500     34.8700      0.7500
+    530.5000   1461.0300     34.8500      0.7500
+    530.7000   1461.0300     34.8500      0.7500
+    530.8000   1461.0300     34.8500      0.7500
+    530.9000   1461.0400     34.8500      0.7500
+    531.1000   1461.0600     34.8700      0.7500
+    531.2000   1461.0400     34.8500      0.7500
+    531.3000   1461.0700     34.8700      0.7500
+    531.5000   1461.0400     34.8500      0.7500
+    531.6000   1461.0500     34.8500      0.7500
+    531.7000   1461.0500     34.8500      0.7500
+    531.9000   1461.0500     34.8500      0.7500
+    532.0000   1461.0800     34.8700      0.7500
+    532.1000   1461.0500     34.8500      0.7500
+    532.3000   1461.0600     34.8500      0.7500
+    532.4000   1461.0600     34.8500      0.7500
+    532.5000   1461.0600     34.8500      0.7500
+    532.7000   1461.0600     34.8500      0.7500
+    532.8000   1461.0600     34.8500      0.7500
+    532.9000   1461.0700     34.8500      0.7500
+    533.1000   1461.0700     34.8500      0.7500
+    533.2000   1461.0700     34.8500      0.7500
+    533.3000   1461.0700     34.8500      0.7500
+    533.5000   1461.0800     34.8500      0.7500
+    533.6000   1461.0800     34.8500      0.7500
+    533.7000   1461.0800     34.8500      0.7500
+    533.9000   1461.0800     34.8500      0.7500
+    534.0000   1461.0400     34.8500      0.7400
+    534.1000   1461.0900     34.8600      0.7500
+    534.3000   1461.1000     34.8600      0.7500
+    534.4000   1461.0900     34.8500      0.7500
+    534.6000   1461.0900     34.8500      0.7500
+    534.7000   1461.0500     34.8500      0.7400
+    534.8000   1461.1000     34.8600      0.7500
+    535.0000   1461.1100     34.8600      0.7500
+    535.1000   1461.0500     34.8500      0.7400
+    535.2000   1461.1100     34.8600      0.7500
+    535.4000   1461.0700     34.8600      0.7400
+    535.5000   1461.0700     34.8600      0.7400
+    535.6000   1461.0800     34.8600      0.7400
+    535.8000   1461.0800     34.8600      0.7400
+    535.9000   1461.0800     34.8600      0.7400
+    536.0000   1461.0800     34.8600      0.7400
+    536.2000   1461.0900     34.8600      0.7400
+    536.3000   1461.0900     34.8600      0.7400
+    536.4000   1461.0900     34.8600      0.7400
+    536.6000   1461.0900     34.8600      0.7400
+    536.7000   1461.0900     34.8600      0.7400
+    536.8000   1461.1000     34.8600      0.7400
+    537.0000   1461.1000     34.8600      0.7400
+    537.1000   1461.1000     34.8600      0.7400
+    537.2000   1461.1000     34.8600      0.7400
+    537.4000   1461.1000     34.8600      0.7400
+    537.5000   1461.1100     34.8600      0.7400
+    537.6000   1461.1100     34.8600      0.7400
+    537.8000   1461.1100     34.8600      0.7400
+    537.9000   1461.1100     34.8600      0.7400
+    538.0000   1461.1100     34.8600      0.7400
+    538.2000   1461.1200     34.8600      0.7400
+    538.3000   1461.1200     34.8600      0.7400
+    538.4000   1461.1200     34.8600      0.7400
+    538.6000   1461.1200     34.8600      0.7400
+    538.7000   1461.1300     34.8600      0.7400
+    538.8000   1461.1300     34.8600      0.7400
+    539.0000   1461.1300     34.8600      0.7400
+    539.1000   1461.1300     34.8600      0.7400
+    539.2000   1461.1300     34.8600      0.7400
+    539.4000   1461.1400     34.8600      0.7400
+    539.5000   1461.1400     34.8600      0.7400
+    539.6000   1461.1400     34.8600      0.7400
+    539.8000   1461.0900     34.8600      0.7300
+    539.9000   1461.1500     34.8700      0.7400
+    540.0000   1461.1500     34.8700      0.7400
+    540.2000   1461.1500     34.8600      0.7400
+    540.3000   1461.1500     34.8600      0.7400
+    540.4000   1461.1500     34.8600      0.7400
+    540.6000   1461.1500     34.8600      0.7400
+    540.7000   1461.1600     34.8600      0.7400
+    540.8000   1461.1600     34.8600      0.7400
+    541.0000   1461.1600     34.8600      0.7400
+    541.1000   1461.1600     34.8600      0.7400
+    541.2000   1461.1700     34.8600      0.7400
+    541.4000   1461.1200     34.8600      0.7300
+    541.5000   1461.1800     34.8600      0.7400
+    541.6000   1461.1800     34.8600      0.7400
+    541.8000   1461.1300     34.8600      0.7300
+    541.9000   1461.1400     34.8600      0.7300
+    542.0000   1461.1500     34.8700      0.7300
+    542.2000   1461.1500     34.8700      0.7300
+    542.3000   1461.1500     34.8700      0.7300
+    542.4000   1461.1500     34.8700      0.7300
+    542.6000   1461.1500     34.8700      0.7300
+    542.7000   1461.1600     34.8700      0.7300
+    542.8000   1461.1600     34.8700      0.7300
+    543.0000   1461.1600     34.8700      0.7300
+    543.1000   1461.1600     34.8700      0.7300
+    543.2000   1461.1600     34.8700      0.7300
+    543.4000   1461.1700     34.8700      0.7300
+    543.5000   1461.1700     34.8700      0.7300
+    543.6000   1461.1700     34.8700      0.7300
+    543.8000   1461.1700     34.8700      0.7300
+    543.9000   1461.1800     34.8700      0.7300
+    544.0000   1461.1800     34.8700      0.7300
+    544.2000   1461.1800     34.8700      0.7300
+    544.3000   1461.1600     34.8500      0.7300
+    544.4000   1461.1600     34.8500      0.7300
+    544.6000   1461.1900     34.8700      0.7300
+    544.7000   1461.1600     34.8500      0.7300
+    544.8000   1461.1600     34.8500      0.7300
+    545.0000   1461.1900     34.8700      0.7300
+    545.1000   1461.1200     34.8500      0.7200
+    545.2000   1461.1300     34.8600      0.7200
+    545.4000   1461.1400     34.8600      0.7200
+    545.5000   1461.1400     34.8600      0.7200
+    545.6000   1461.1500     34.8600      0.7200
+    545.8000   1461.1500     34.8600      0.7200
+    545.9000   1461.1500     34.8600      0.7200
+    546.0000   1461.1500     34.8600      0.7200
+    546.2000   1461.1500     34.8600      0.7200
+    546.3000   1461.1600     34.8600      0.7200
+    546.4000   1461.1100     34.8600      0.7100
+    546.6000   1461.1700     34.8700      0.7200
+    546.7000   1461.1200     34.8700      0.7100
+    546.8000   1461.1200     34.8700      0.7100
+    547.0000   1461.1300     34.8700      0.7100
+    547.1000   1461.1400     34.8700      0.7100
+    547.2000   1461.1100     34.8500      0.7100
+    547.4000   1461.1400     34.8700      0.7100
+    547.5000   1461.1400     34.8700      0.7100
+    547.6000   1461.1400     34.8700      0.7100
+    547.8000   1461.1500     34.8700      0.7100
+    547.9000   1461.1500     34.8700      0.7100
+    548.0000   1461.1500     34.8700      0.7100
+    548.2000   1461.1300     34.8500      0.7100
+    548.3000   1461.1600     34.8700      0.7100
+    548.4000   1461.1300     34.8500      0.7100
+    548.6000   1461.1300     34.8500      0.7100
+    548.7000   1461.1600     34.8700      0.7100
+    548.8000   1461.1600     34.8700      0.7100
+    549.0000   1461.1400     34.8500      0.7100
+    549.1000   1461.1400     34.8500      0.7100
+    549.2000   1461.1700     34.8700      0.7100
+    549.4000   1461.1700     34.8700      0.7100
+    549.5000   1461.1700     34.8700      0.7100
+    549.6000   1461.1500     34.8500      0.7100
+    549.8000   1461.1500     34.8500      0.7100
+    549.9000   1461.1500     34.8500      0.7100
+    550.0000   1461.1800     34.8700      0.7100
+    550.2000   1461.1600     34.8500      0.7100
+    550.3000   1461.1600     34.8500      0.7100
+    550.4000   1461.1200     34.8500      0.7000
+    550.6000   1461.1700     34.8600      0.7100
+    550.7000   1461.1500     34.8800      0.7000
+    550.8000   1461.1600     34.8800      0.7000
+    551.0000   1461.1400     34.8600      0.7000
+    551.1000   1461.1400     34.8600      0.7000
+    551.2000   1461.1700     34.8800      0.7000
+    551.4000   1461.1500     34.8600      0.7000
+    551.5000   1461.1500     34.8600      0.7000
+    551.6000   1461.1500     34.8600      0.7000
+    551.8000   1461.1500     34.8600      0.7000
+    551.9000   1461.1500     34.8600      0.7000
+    552.1000   1461.1600     34.8600      0.7000
+    552.2000   1461.1600     34.8600      0.7000
+    552.3000   1461.1600     34.8600      0.7000
+    552.5000   1461.1600     34.8600      0.7000
+    552.6000   1461.1600     34.8600      0.7000
+    552.7000   1461.1700     34.8600      0.7000
+    552.9000   1461.1700     34.8600      0.7000
+    553.0000   1461.1700     34.8600      0.7000
+    553.1000   1461.1700     34.8600      0.7000
+    553.3000   1461.1800     34.8600      0.7000
+    553.4000   1461.1300     34.8600      0.6900
+    553.5000   1461.1900     34.8700      0.7000
+    553.7000   1461.1400     34.8700      0.6900
+    553.8000   1461.1400     34.8700      0.6900
+    553.9000   1461.1500     34.8700      0.6900
+    554.1000   1461.1600     34.8700      0.6900
+    554.2000   1461.1600     34.8700      0.6900
+    554.3000   1461.1600     34.8700      0.6900
+    554.5000   1461.1600     34.8700      0.6900
+    554.6000   1461.1600     34.8700      0.6900
+    554.7000   1461.1700     34.8700      0.6900
+    554.9000   1461.1700     34.8700      0.6900
+    555.0000   1461.1700     34.8700      0.6900
+    555.1000   1461.1700     34.8700      0.6900
+    555.3000   1461.1700     34.8700      0.6900
+    555.4000   1461.1800     34.8700      0.6900
+    555.5000   1461.1800     34.8700      0.6900
+    555.7000   1461.1800     34.8700      0.6900
+    555.8000   1461.1800     34.8700      0.6900
+    555.9000   1461.1900     34.8700      0.6900
+    556.1000   1461.1900     34.8700      0.6900
+    556.2000   1461.1600     34.8500      0.6900
+    556.3000   1461.1900     34.8700      0.6900
+    556.5000   1461.1900     34.8700      0.6900
+    556.6000   1461.2000     34.8700      0.6900
+    556.7000   1461.2000     34.8700      0.6900
+    556.9000   1461.2000     34.8700      0.6900
+    557.0000   1461.1800     34.8500      0.6900
+    557.1000   1461.1800     34.8500      0.6900
+    557.3000   1461.1800     34.8500      0.6900
+    557.4000   1461.2100     34.8700      0.6900
+    557.5000   1461.1800     34.8500      0.6900
+    557.7000   1461.1900     34.8500      0.6900
+    557.8000   1461.1400     34.8500      0.6800
+    557.9000   1461.2000     34.8600      0.6900
+    558.1000   1461.2300     34.8800      0.6900
+    558.2000   1461.2200     34.8700      0.6900
+    558.3000   1461.2200     34.8700      0.6900
+    558.5000   1461.1500     34.8500      0.6800
+    558.6000   1461.1600     34.8600      0.6800
+    558.7000   1461.1700     34.8600      0.6800
+    558.9000   1461.1700     34.8600      0.6800
+    559.0000   1461.1800     34.8600      0.6800
+    559.1000   1461.1800     34.8600      0.6800
+    559.3000   1461.1800     34.8600      0.6800
+    559.4000   1461.1800     34.8600      0.6800
+    559.5000   1461.1800     34.8600      0.6800
+    559.7000   1461.1900     34.8600      0.6800
+    559.8000   1461.1900     34.8600      0.6800
+    559.9000   1461.1900     34.8600      0.6800
+    560.1000   1461.1900     34.8600      0.6800
+    560.2000   1461.1900     34.8600      0.6800
+    560.3000   1461.2000     34.8600      0.6800
+    560.5000   1461.2000     34.8600      0.6800
+    560.6000   1461.2000     34.8600      0.6800
+    560.7000   1461.2000     34.8600      0.6800
+    560.9000   1461.2100     34.8600      0.6800
+    561.0000   1461.2100     34.8600      0.6800
+    561.1000   1461.2100     34.8600      0.6800
+    561.3000   1461.2100     34.8600      0.6800
+    561.4000   1461.2100     34.8600      0.6800
+    561.5000   1461.2200     34.8600      0.6800
+    561.7000   1461.2200     34.8600      0.6800
+    561.8000   1461.2200     34.8600      0.6800
+    561.9000   1461.2200     34.8600      0.6800
+    562.1000   1461.2200     34.8600      0.6800
+    562.2000   1461.2300     34.8600      0.6800
+    562.3000   1461.2300     34.8600      0.6800
+    562.5000   1461.1800     34.8600      0.6700
+    562.6000   1461.2400     34.8600      0.6800
+    562.7000   1461.2000     34.8600      0.6700
+    562.9000   1461.2400     34.8600      0.6800
+    563.0000   1461.2500     34.8600      0.6800
+    563.1000   1461.1900     34.8600      0.6700
+    563.3000   1461.2000     34.8600      0.6700
+    563.4000   1461.2100     34.8700      0.6700
+    563.5000   1461.2200     34.8700      0.6700
+    563.7000   1461.2200     34.8700      0.6700
+    563.8000   1461.2200     34.8700      0.6700
+    563.9000   1461.2200     34.8700      0.6700
+    564.1000   1461.2200     34.8700      0.6700
+    564.2000   1461.2300     34.8700      0.6700
+    564.3000   1461.2300     34.8700      0.6700
+    564.5000   1461.2300     34.8700      0.6700
+    564.6000   1461.2300     34.8700      0.6700
+    564.7000   1461.2300     34.8700      0.6700
+    564.9000   1461.2400     34.8700      0.6700
+    565.0000   1461.2400     34.8700      0.6700
+    565.1000   1461.2400     34.8700      0.6700
+    565.3000   1461.2400     34.8700      0.6700
+    565.4000   1461.2400     34.8700      0.6700
+    565.5000   1461.2500     34.8700      0.6700
+    565.7000   1461.2500     34.8700      0.6700
+    565.8000   1461.2500     34.8700      0.6700
+    565.9000   1461.2500     34.8700      0.6700
+    566.1000   1461.2600     34.8700      0.6700
+    566.2000   1461.2600     34.8700      0.6700
+    566.3000   1461.2600     34.8700      0.6700
+    566.5000   1461.2600     34.8700      0.6700
+    566.6000   1461.2600     34.8700      0.6700
+    566.7000   1461.2700     34.8700      0.6700
+    566.9000   1461.2700     34.8700      0.6700
+    567.0000   1461.2700     34.8700      0.6700
+    567.1000   1461.2700     34.8700      0.6700
+    567.3000   1461.2700     34.8700      0.6700
+    567.4000   1461.2800     34.8700      0.6700
+    567.5000   1461.2800     34.8700      0.6700
+    567.7000   1461.2800     34.8700      0.6700
+    567.8000   1461.2800     34.8700      0.6700
+    567.9000   1461.2800     34.8700      0.6700
+    568.1000   1461.2900     34.8700      0.6700
+    568.2000   1461.2900     34.8700      0.6700
+    568.3000   1461.2900     34.8700      0.6700
+    568.5000   1461.2700     34.8500      0.6700
+    568.6000   1461.2900     34.8700      0.6700
+    568.7000   1461.3000     34.8700      0.6700
+    568.9000   1461.3000     34.8700      0.6700
+    569.0000   1461.2300     34.8500      0.6600
+    569.1000   1461.2400     34.8500      0.6600
+    569.3000   1461.2500     34.8600      0.6600
+    569.4000   1461.2500     34.8600      0.6600
+    569.5000   1461.2800     34.8800      0.6600
+    569.7000   1461.2500     34.8600      0.6600
+    569.8000   1461.2600     34.8600      0.6600
+    569.9000   1461.2600     34.8600      0.6600
+    570.1000   1461.2600     34.8600      0.6600
+    570.2000   1461.2900     34.8800      0.6600
+    570.3000   1461.2600     34.8600      0.6600
+    570.5000   1461.2700     34.8600      0.6600
+    570.6000   1461.2700     34.8600      0.6600
+    570.7000   1461.2700     34.8600      0.6600
+    570.9000   1461.2700     34.8600      0.6600
+    571.0000   1461.2700     34.8600      0.6600
+    571.1000   1461.2800     34.8600      0.6600
+    571.3000   1461.2800     34.8600      0.6600
+    571.4000   1461.2800     34.8600      0.6600
+    571.5000   1461.2800     34.8600      0.6600
+    571.7000   1461.2900     34.8600      0.6600
+    571.8000   1461.2900     34.8600      0.6600
+    571.9000   1461.2900     34.8600      0.6600
+    572.1000   1461.2400     34.8600      0.6500
+    572.2000   1461.3000     34.8600      0.6600
+    572.3000   1461.3000     34.8600      0.6600
+    572.5000   1461.2500     34.8600      0.6500
+    572.6000   1461.3100     34.8600      0.6600
+    572.7000   1461.2600     34.8600      0.6500
+    572.9000   1461.2600     34.8600      0.6500
+    573.0000   1461.2700     34.8700      0.6500
+    573.1000   1461.2800     34.8700      0.6500
+    573.3000   1461.2800     34.8700      0.6500
+    573.4000   1461.2800     34.8700      0.6500
+    573.5000   1461.2800     34.8700      0.6500
+    573.7000   1461.2800     34.8700      0.6500
+    573.8000   1461.2900     34.8700      0.6500
+    573.9000   1461.2900     34.8700      0.6500
+    574.1000   1461.2900     34.8700      0.6500
+    574.2000   1461.2900     34.8700      0.6500
+    574.3000   1461.3000     34.8700      0.6500
+    574.5000   1461.3000     34.8700      0.6500
+    574.6000   1461.3000     34.8700      0.6500
+    574.7000   1461.3000     34.8700      0.6500
+    574.9000   1461.3000     34.8700      0.6500
+    575.0000   1461.3100     34.8700      0.6500
+    575.1000   1461.3100     34.8700      0.6500
+    575.3000   1461.3100     34.8700      0.6500
+    575.4000   1461.3100     34.8700      0.6500
+    575.5000   1461.3100     34.8700      0.6500
+    575.7000   1461.3200     34.8700      0.6500
+    575.8000   1461.3200     34.8700      0.6500
+    575.9000   1461.3200     34.8700      0.6500
+    576.1000   1461.3200     34.8700      0.6500
+    576.2000   1461.3200     34.8700      0.6500
+    576.3000   1461.3300     34.8700      0.6500
+    576.5000   1461.3300     34.8700      0.6500
+    576.6000   1461.3300     34.8700      0.6500
+    576.7000   1461.3300     34.8700      0.6500
+    576.9000   1461.3400     34.8700      0.6500
+    577.0000   1461.3400     34.8700      0.6500
+    577.1000   1461.2700     34.8500      0.6400
+    577.3000   1461.3500     34.8700      0.6500
+    577.4000   1461.3000     34.8700      0.6400
+    577.5000   1461.3500     34.8700      0.6500
+    577.7000   1461.3100     34.8700      0.6400
+    577.8000   1461.2800     34.8500      0.6400
+    577.9000   1461.3700     34.8800      0.6500
+    578.1000   1461.3100     34.8700      0.6400
+    578.2000   1461.3200     34.8700      0.6400
+    578.3000   1461.3300     34.8800      0.6400
+    578.5000   1461.3000     34.8600      0.6400
+    578.6000   1461.3000     34.8600      0.6400
+    578.7000   1461.3300     34.8800      0.6400
+    578.9000   1461.3100     34.8600      0.6400
+    579.0000   1461.3400     34.8800      0.6400
+    579.1000   1461.3400     34.8800      0.6400
+    579.3000   1461.3200     34.8600      0.6400
+    579.4000   1461.3200     34.8600      0.6400
+    579.5000   1461.3200     34.8600      0.6400
+    579.7000   1461.3200     34.8600      0.6400
+    579.8000   1461.3500     34.8800      0.6400
+    579.9000   1461.3300     34.8600      0.6400
+    580.1000   1461.3500     34.8800      0.6400
+    580.2000   1461.3600     34.8800      0.6400
+    580.3000   1461.3300     34.8600      0.6400
+    580.5000   1461.3600     34.8800      0.6400
+    580.6000   1461.3400     34.8600      0.6400
+    580.7000   1461.3400     34.8600      0.6400
+    580.9000   1461.3400     34.8600      0.6400
+    581.0000   1461.3400     34.8600      0.6400
+    581.1000   1461.3000     34.8600      0.6300
+    581.3000   1461.3500     34.8600      0.6400
+    581.4000   1461.3100     34.8600      0.6300
+    581.5000   1461.3100     34.8600      0.6300
+    581.7000   1461.3200     34.8700      0.6300
+    581.8000   1461.3200     34.8700      0.6300
+    581.9000   1461.3300     34.8700      0.6300
+    582.1000   1461.3300     34.8700      0.6300
+    582.2000   1461.3300     34.8700      0.6300
+    582.3000   1461.3300     34.8700      0.6300
+    582.5000   1461.3300     34.8700      0.6300
+    582.6000   1461.3400     34.8700      0.6300
+    582.7000   1461.3400     34.8700      0.6300
+    582.9000   1461.3400     34.8700      0.6300
+    583.0000   1461.3400     34.8700      0.6300
+    583.1000   1461.3400     34.8700      0.6300
+    583.3000   1461.3500     34.8700      0.6300
+    583.4000   1461.3500     34.8700      0.6300
+    583.5000   1461.3500     34.8700      0.6300
+    583.7000   1461.3500     34.8700      0.6300
+    583.8000   1461.3500     34.8700      0.6300
+    583.9000   1461.3600     34.8700      0.6300
+    584.1000   1461.3100     34.8700      0.6200
+    584.2000   1461.3700     34.8700      0.6300
+    584.3000   1461.3700     34.8700      0.6300
+    584.5000   1461.3200     34.8700      0.6200
+    584.6000   1461.3700     34.8700      0.6300
+    584.7000   1461.3300     34.8700      0.6200
+    584.9000   1461.3300     34.8700      0.6200
+    585.0000   1461.3400     34.8800      0.6200
+    585.1000   1461.3200     34.8600      0.6200
+    585.3000   1461.3200     34.8600      0.6200
+    585.4000   1461.3200     34.8600      0.6200
+    585.5000   1461.3200     34.8600      0.6200
+    585.7000   1461.3300     34.8600      0.6200
+    585.8000   1461.3300     34.8600      0.6200
+    585.9000   1461.3600     34.8800      0.6200
+    586.1000   1461.3600     34.8800      0.6200
+    586.2000   1461.3300     34.8600      0.6200
+    586.3000   1461.3400     34.8600      0.6200
+    586.5000   1461.3400     34.8600      0.6200
+    586.6000   1461.3700     34.8800      0.6200
+    586.7000   1461.3400     34.8600      0.6200
+    586.9000   1461.3400     34.8600      0.6200
+    587.0000   1461.3500     34.8600      0.6200
+    587.1000   1461.3500     34.8600      0.6200
+    587.3000   1461.3500     34.8600      0.6200
+    587.4000   1461.3100     34.8600      0.6100
+    587.5000   1461.3200     34.8600      0.6100
+    587.7000   1461.3700     34.8700      0.6200
+    587.8000   1461.3200     34.8600      0.6100
+    587.9000   1461.3200     34.8600      0.6100
+    588.1000   1461.3300     34.8700      0.6100
+    588.2000   1461.3300     34.8700      0.6100
+    588.3000   1461.3400     34.8700      0.6100
+    588.5000   1461.3400     34.8700      0.6100
+    588.6000   1461.3400     34.8700      0.6100
+    588.7000   1461.3400     34.8700      0.6100
+    588.9000   1461.3400     34.8700      0.6100
+    589.0000   1461.3500     34.8700      0.6100
+    589.1000   1461.3500     34.8700      0.6100
+    589.3000   1461.3500     34.8700      0.6100
+    589.4000   1461.3500     34.8700      0.6100
+    589.5000   1461.3500     34.8700      0.6100
+    589.7000   1461.3600     34.8700      0.6100
+    589.8000   1461.3600     34.8700      0.6100
+    589.9000   1461.3600     34.8700      0.6100
+    590.1000   1461.3600     34.8700      0.6100
+    590.2000   1461.3700     34.8700      0.6100
+    590.3000   1461.3700     34.8700      0.6100
+    590.5000   1461.3700     34.8700      0.6100
+    590.6000   1461.3700     34.8700      0.6100
+    590.7000   1461.3700     34.8700      0.6100
+    590.9000   1461.3800     34.8700      0.6100
+    591.0000   1461.3800     34.8700      0.6100
+    591.1000   1461.3800     34.8700      0.6100
+    591.3000   1461.3800     34.8700      0.6100
+    591.4000   1461.3800     34.8700      0.6100
+    591.5000   1461.3900     34.8700      0.6100
+    591.7000   1461.3900     34.8700      0.6100
+    591.8000   1461.3400     34.8700      0.5900
+    591.9000   1461.4000     34.8700      0.6100
+    592.1000   1461.3500     34.8700      0.5900
+    592.2000   1461.3300     34.8500      0.5900
+    592.3000   1461.3700     34.8800      0.5900
+    592.5000   1461.3400     34.8600      0.5900
+    592.6000   1461.3700     34.8800      0.5900
+    592.7000   1461.3500     34.8600      0.5900
+    592.9000   1461.3500     34.8600      0.5900
+    593.0000   1461.3500     34.8600      0.5900
+    593.1000   1461.3100     34.8600      0.5800
+    593.3000   1461.3200     34.8600      0.5800
+    593.4000   1461.3300     34.8700      0.5800
+    593.5000   1461.3300     34.8700      0.5800
+    593.7000   1461.3300     34.8700      0.5800
+    593.8000   1461.3300     34.8700      0.5800
+    593.9000   1461.3300     34.8700      0.5800
+    594.1000   1461.3400     34.8700      0.5800
+    594.2000   1461.3400     34.8700      0.5800
+    594.3000   1461.3400     34.8700      0.5800
+    594.5000   1461.3400     34.8700      0.5800
+    594.6000   1461.3400     34.8700      0.5800
+    594.7000   1461.3500     34.8700      0.5800
+    594.9000   1461.3500     34.8700      0.5800
+    595.0000   1461.3500     34.8700      0.5800
+    595.1000   1461.3500     34.8700      0.5800
+    595.3000   1461.3500     34.8700      0.5800
+    595.4000   1461.3600     34.8700      0.5800
+    595.5000   1461.3300     34.8500      0.5800
+    595.7000   1461.3600     34.8700      0.5800
+    595.8000   1461.3600     34.8700      0.5800
+    595.9000   1461.3700     34.8700      0.5800
+    596.1000   1461.3700     34.8700      0.5800
+    596.2000   1461.3400     34.8500      0.5800
+    596.3000   1461.3700     34.8700      0.5800
+    596.5000   1461.3700     34.8700      0.5800
+    596.6000   1461.3800     34.8700      0.5800
+    596.7000   1461.3300     34.8700      0.5700
+    596.9000   1461.3600     34.8500      0.5800
+    597.0000   1461.3600     34.8500      0.5800
+    597.1000   1461.3800     34.8700      0.5800
+    597.3000   1461.3900     34.8700      0.5800
+    597.4000   1461.3400     34.8700      0.5700
+    597.5000   1461.3700     34.8500      0.5800
+    597.7000   1461.4000     34.8700      0.5800
+    597.8000   1461.3500     34.8700      0.5700
+    597.9000   1461.4000     34.8700      0.5800
+    598.1000   1461.3600     34.8700      0.5700
+    598.2000   1461.3800     34.8500      0.5800
+    598.3000   1461.4100     34.8700      0.5800
+    598.5000   1461.4100     34.8700      0.5800
+    598.6000   1461.4100     34.8700      0.5800
+    598.7000   1461.3600     34.8700      0.5700
+    598.9000   1461.3700     34.8700      0.5700
+    599.0000   1461.4300     34.8800      0.5800
+    599.1000   1461.3800     34.8700      0.5700
+    599.3000   1461.3800     34.8700      0.5700
+    599.4000   1461.3900     34.8800      0.5700
+    599.5000   1461.3600     34.8600      0.5700
+    599.7000   1461.3900     34.8800      0.5700
+    599.8000   1461.3700     34.8600      0.5700
+    599.9000   1461.4000     34.8800      0.5700
+    600.1000   1461.4000     34.8800      0.5700
+    600.2000   1461.4000     34.8800      0.5700
+    600.3000   1461.4000     34.8800      0.5700
+    600.5000   1461.4000     34.8800      0.5700
+    600.6000   1461.4100     34.8800      0.5700
+    600.7000   1461.4100     34.8800      0.5700
+    600.9000   1461.4100     34.8800      0.5700
+    601.0000   1461.3900     34.8600      0.5700
+    601.1000   1461.3900     34.8600      0.5700
+    601.3000   1461.3900     34.8600      0.5700
+    601.4000   1461.3500     34.8600      0.5600
+    601.5000   1461.4000     34.8600      0.5700
+    601.7000   1461.4100     34.8600      0.5700
+    601.8000   1461.3500     34.8600      0.5600
+    601.9000   1461.4100     34.8600      0.5700
+    602.1000   1461.4100     34.8600      0.5700
+    602.2000   1461.4100     34.8600      0.5700
+    602.3000   1461.4100     34.8600      0.5700
+    602.4000   1461.4100     34.8600      0.5700
+    602.6000   1461.4100     34.8600      0.5700
+    602.7000   1461.3700     34.8600      0.5600
+    602.8000   1461.4200     34.8600      0.5700
+    603.0000   1461.4300     34.8600      0.5700
+    603.1000   1461.4200     34.8600      0.5700
+    603.2000   1461.4200     34.8600      0.5700
+    603.4000   1461.3800     34.8600      0.5600
+    603.5000   1461.4300     34.8600      0.5700
+    603.6000   1461.4400     34.8600      0.5700
+    603.8000   1461.3800     34.8600      0.5600
+    603.9000   1461.3900     34.8600      0.5600
+    604.0000   1461.4000     34.8700      0.5600
+    604.2000   1461.4100     34.8700      0.5600
+    604.3000   1461.4100     34.8700      0.5600
+    604.4000   1461.4100     34.8700      0.5600
+    604.6000   1461.4100     34.8700      0.5600
+    604.7000   1461.4100     34.8700      0.5600
+    604.8000   1461.4200     34.8700      0.5600
+    605.0000   1461.4200     34.8700      0.5600
+    605.1000   1461.4200     34.8700      0.5600
+    605.2000   1461.4200     34.8700      0.5600
+    605.4000   1461.4200     34.8700      0.5600
+    605.5000   1461.4300     34.8700      0.5600
+    605.6000   1461.4300     34.8700      0.5600
+    605.8000   1461.4300     34.8700      0.5600
+    605.9000   1461.4300     34.8700      0.5600
+    606.0000   1461.4300     34.8700      0.5600
+    606.2000   1461.4400     34.8700      0.5600
+    606.3000   1461.4400     34.8700      0.5600
+    606.4000   1461.4400     34.8700      0.5600
+    606.6000   1461.4400     34.8700      0.5600
+    606.7000   1461.4400     34.8700      0.5600
+    606.8000   1461.4500     34.8700      0.5600
+    607.0000   1461.4500     34.8700      0.5600
+    607.1000   1461.4500     34.8700      0.5600
+    607.2000   1461.4500     34.8700      0.5600
+    607.4000   1461.4600     34.8700      0.5600
+    607.5000   1461.4600     34.8600      0.5600
+    607.6000   1461.4600     34.8600      0.5600
+    607.8000   1461.4600     34.8600      0.5600
+    607.9000   1461.4600     34.8600      0.5600
+    608.0000   1461.4700     34.8600      0.5600
+    608.2000   1461.4700     34.8600      0.5600
+    608.3000   1461.4700     34.8600      0.5600
+    608.4000   1461.4700     34.8600      0.5600
+    608.6000   1461.4700     34.8600      0.5600
+    608.7000   1461.4800     34.8600      0.5600
+    608.8000   1461.4800     34.8600      0.5600
+    609.0000   1461.4800     34.8600      0.5600
+    609.1000   1461.4300     34.8600      0.5500
+    609.2000   1461.4900     34.8700      0.5600
+    609.4000   1461.4500     34.8700      0.5500
+    609.5000   1461.5000     34.8700      0.5600
+    609.6000   1461.5000     34.8700      0.5600
+    609.8000   1461.4500     34.8600      0.5500
+    609.9000   1461.5000     34.8700      0.5600
+    610.0000   1461.5000     34.8700      0.5600
+    610.2000   1461.4700     34.8400      0.5600
+    610.3000   1461.5000     34.8600      0.5600
+    610.4000   1461.5000     34.8600      0.5600
+    610.6000   1461.5100     34.8600      0.5600
+    610.7000   1461.4600     34.8600      0.5500
+    610.8000   1461.4900     34.8500      0.5600
+    611.0000   1461.4700     34.8700      0.5500
+    611.1000   1461.4700     34.8700      0.5500
+    611.2000   1461.4800     34.8700      0.5500
+    611.4000   1461.4900     34.8700      0.5500
+    611.5000   1461.4900     34.8700      0.5500
+    611.6000   1461.4900     34.8700      0.5500
+    611.8000   1461.4900     34.8700      0.5500
+    611.9000   1461.4900     34.8700      0.5500
+    612.0000   1461.4700     34.8500      0.5500
+    612.2000   1461.4700     34.8500      0.5500
+    612.3000   1461.5000     34.8700      0.5500
+    612.4000   1461.5000     34.8700      0.5500
+    612.6000   1461.5000     34.8700      0.5500
+    612.7000   1461.5100     34.8700      0.5500
+    612.8000   1461.4800     34.8500      0.5500
+    613.0000   1461.5100     34.8700      0.5500
+    613.1000   1461.5100     34.8700      0.5500
+    613.2000   1461.5200     34.8700      0.5500
+    613.4000   1461.5200     34.8700      0.5500
+    613.5000   1461.5200     34.8700      0.5500
+    613.6000   1461.5200     34.8700      0.5500
+    613.8000   1461.5200     34.8700      0.5500
+    613.9000   1461.5300     34.8700      0.5500
+    614.0000   1461.5000     34.8500      0.5500
+    614.2000   1461.5300     34.8700      0.5500
+    614.3000   1461.5300     34.8700      0.5500
+    614.4000   1461.5100     34.8500      0.5500
+    614.6000   1461.5400     34.8700      0.5500
+    614.7000   1461.5400     34.8700      0.5500
+    614.8000   1461.5400     34.8700      0.5500
+    615.0000   1461.5200     34.8500      0.5500
+    615.1000   1461.4700     34.8500      0.5400
+    615.2000   1461.5500     34.8800      0.5500
+    615.4000   1461.5300     34.8600      0.5500
+    615.5000   1461.4800     34.8500      0.5400
+    615.6000   1461.5300     34.8600      0.5500
+    615.8000   1461.5400     34.8600      0.5500
+    615.9000   1461.5600     34.8700      0.5500
+    616.0000   1461.5300     34.8500      0.5500
+    616.2000   1461.5400     34.8500      0.5500
+    616.3000   1461.5600     34.8700      0.5500
+    616.4000   1461.4900     34.8500      0.5400
+    616.6000   1461.5500     34.8600      0.5500
+    616.7000   1461.5500     34.8600      0.5500
+    616.8000   1461.5500     34.8500      0.5500
+    617.0000   1461.5700     34.8700      0.5500
+    617.1000   1461.5300     34.8700      0.5400
+    617.2000   1461.5900     34.8800      0.5500
+    617.4000   1461.5400     34.8800      0.5400
+    617.5000   1461.5600     34.8600      0.5500
+    617.6000   1461.5400     34.8800      0.5400
+    617.8000   1461.5500     34.8800      0.5400
+    617.9000   1461.6000     34.8800      0.5500
+    618.0000   1461.5200     34.8600      0.5400
+    618.2000   1461.5700     34.8600      0.5500
+    618.3000   1461.5800     34.8600      0.5500
+    618.4000   1461.5200     34.8500      0.5400
+    618.6000   1461.6100     34.8800      0.5500
+    618.7000   1461.5400     34.8600      0.5400
+    618.8000   1461.5800     34.8600      0.5500
+    619.0000   1461.6100     34.8800      0.5500
+    619.1000   1461.5300     34.8500      0.5400
+    619.2000   1461.5700     34.8800      0.5400
+    619.4000   1461.5800     34.8800      0.5400
+    619.5000   1461.5600     34.8600      0.5400
+    619.6000   1461.6100     34.8600      0.5500
+    619.7000   1461.5500     34.8600      0.5400
+    619.9000   1461.5500     34.8600      0.5400
+    620.0000   1461.5600     34.8600      0.5400
+    620.1000   1461.5700     34.8600      0.5400
+    620.3000   1461.5900     34.8800      0.5400
+    620.4000   1461.6000     34.8800      0.5400
+    620.5000   1461.6000     34.8800      0.5400
+    620.7000   1461.5700     34.8600      0.5400
+    620.8000   1461.5800     34.8600      0.5400
+    620.9000   1461.5800     34.8600      0.5400
+    621.1000   1461.5800     34.8600      0.5400
+    621.2000   1461.5800     34.8600      0.5400
+    621.3000   1461.5800     34.8600      0.5400
+    621.5000   1461.5900     34.8600      0.5400
+    621.6000   1461.5900     34.8600      0.5400
+    621.7000   1461.5900     34.8600      0.5400
+    621.9000   1461.5900     34.8600      0.5400
+    622.0000   1461.6000     34.8600      0.5400
+    622.1000   1461.6000     34.8600      0.5400
+    622.3000   1461.6000     34.8600      0.5400
+    622.4000   1461.6000     34.8600      0.5400
+    622.5000   1461.6000     34.8600      0.5400
+    622.7000   1461.6100     34.8600      0.5400
+    622.8000   1461.6100     34.8600      0.5400
+    622.9000   1461.6100     34.8600      0.5400
+    623.1000   1461.6100     34.8600      0.5400
+    623.2000   1461.6100     34.8600      0.5400
+    623.3000   1461.6200     34.8600      0.5400
+    623.5000   1461.6200     34.8600      0.5400
+    623.6000   1461.6200     34.8600      0.5400
+    623.7000   1461.5700     34.8600      0.5300
+    623.9000   1461.6300     34.8700      0.5400
+    624.0000   1461.5900     34.8700      0.5300
+    624.1000   1461.5900     34.8700      0.5300
+    624.3000   1461.6000     34.8700      0.5300
+    624.4000   1461.6000     34.8700      0.5300
+    624.5000   1461.6000     34.8700      0.5300
+    624.7000   1461.6000     34.8700      0.5300
+    624.8000   1461.6100     34.8700      0.5300
+    624.9000   1461.6100     34.8700      0.5300
+    625.1000   1461.6100     34.8700      0.5300
+    625.2000   1461.6100     34.8700      0.5300
+    625.3000   1461.6200     34.8700      0.5300
+    625.5000   1461.6200     34.8700      0.5300
+    625.6000   1461.6200     34.8700      0.5300
+    625.7000   1461.6200     34.8700      0.5300
+    625.9000   1461.6200     34.8700      0.5300
+    626.0000   1461.6300     34.8700      0.5300
+    626.1000   1461.6300     34.8700      0.5300
+    626.3000   1461.6300     34.8700      0.5300
+    626.4000   1461.6300     34.8700      0.5300
+    626.5000   1461.6300     34.8700      0.5300
+    626.7000   1461.6400     34.8700      0.5300
+    626.8000   1461.6400     34.8700      0.5300
+    626.9000   1461.6400     34.8700      0.5300
+    627.1000   1461.6400     34.8700      0.5300
+    627.2000   1461.6400     34.8700      0.5300
+    627.3000   1461.6500     34.8700      0.5300
+    627.5000   1461.6500     34.8700      0.5300
+    627.6000   1461.6500     34.8700      0.5300
+    627.7000   1461.6500     34.8700      0.5300
+    627.9000   1461.6600     34.8700      0.5300
+    628.0000   1461.6600     34.8700      0.5300
+    628.1000   1461.6600     34.8700      0.5300
+    628.3000   1461.6600     34.8700      0.5300
+    628.4000   1461.6600     34.8700      0.5300
+    628.5000   1461.6700     34.8700      0.5300
+    628.7000   1461.6200     34.8700      0.5200
+    628.8000   1461.6800     34.8700      0.5300
+    628.9000   1461.6800     34.8700      0.5300
+    629.1000   1461.6700     34.8700      0.5300
+    629.2000   1461.6800     34.8700      0.5300
+    629.3000   1461.6300     34.8700      0.5200
+    629.5000   1461.6900     34.8700      0.5300
+    629.6000   1461.6900     34.8700      0.5300
+    629.7000   1461.6400     34.8700      0.5200
+    629.9000   1461.6900     34.8700      0.5300
+    630.0000   1461.7000     34.8700      0.5300
+    630.1000   1461.6400     34.8700      0.5200
+    630.3000   1461.7000     34.8700      0.5300
+    630.4000   1461.6500     34.8700      0.5200
+    630.5000   1461.7000     34.8700      0.5300
+    630.7000   1461.6600     34.8700      0.5200
+    630.8000   1461.6600     34.8700      0.5200
+    630.9000   1461.6700     34.8800      0.5200
+    631.1000   1461.6500     34.8600      0.5200
+    631.2000   1461.6500     34.8600      0.5200
+    631.3000   1461.6500     34.8600      0.5200
+    631.5000   1461.6500     34.8600      0.5200
+    631.6000   1461.6800     34.8800      0.5200
+    631.7000   1461.6800     34.8800      0.5200
+    631.9000   1461.6900     34.8800      0.5200
+    632.0000   1461.6900     34.8800      0.5200
+    632.1000   1461.6600     34.8600      0.5200
+    632.2000   1461.6700     34.8600      0.5200
+    632.4000   1461.6700     34.8600      0.5200
+    632.5000   1461.7000     34.8800      0.5200
+    632.6000   1461.7000     34.8800      0.5200
+    632.8000   1461.6700     34.8600      0.5200
+    632.9000   1461.7000     34.8800      0.5200
+    633.0000   1461.6800     34.8600      0.5200
+    633.2000   1461.7100     34.8800      0.5200
+    633.3000   1461.6800     34.8600      0.5200
+    633.4000   1461.6800     34.8600      0.5200
+    633.6000   1461.6900     34.8600      0.5200
+    633.7000   1461.6900     34.8600      0.5200
+    633.8000   1461.6900     34.8600      0.5200
+    634.0000   1461.6900     34.8600      0.5200
+    634.1000   1461.7000     34.8600      0.5200
+    634.2000   1461.7000     34.8600      0.5200
+    634.4000   1461.7000     34.8600      0.5200
+    634.5000   1461.7000     34.8600      0.5200
+    634.6000   1461.7000     34.8600      0.5200
+    634.8000   1461.7100     34.8600      0.5200
+    634.9000   1461.7100     34.8600      0.5200
+    635.0000   1461.7100     34.8600      0.5200
+    635.2000   1461.7100     34.8600      0.5200
+    635.3000   1461.7100     34.8600      0.5200
+    635.4000   1461.7200     34.8600      0.5200
+    635.6000   1461.7200     34.8600      0.5200
+    635.7000   1461.7200     34.8600      0.5200
+    635.8000   1461.7200     34.8600      0.5200
+    636.0000   1461.7200     34.8600      0.5200
+    636.1000   1461.7300     34.8600      0.5200
+    636.2000   1461.7300     34.8600      0.5200
+    636.4000   1461.7300     34.8600      0.5200
+    636.5000   1461.7300     34.8600      0.5200
+    636.6000   1461.7300     34.8600      0.5200
+    636.8000   1461.7400     34.8600      0.5200
+    636.9000   1461.7400     34.8600      0.5200
+    637.0000   1461.7400     34.8600      0.5200
+    637.2000   1461.7700     34.8800      0.5200
+    637.3000   1461.7500     34.8600      0.5200
+    637.4000   1461.7700     34.8800      0.5200
+    637.6000   1461.7800     34.8800      0.5200
+    637.7000   1461.7500     34.8600      0.5200
+    637.8000   1461.7800     34.8700      0.5200
+    638.0000   1461.7800     34.8700      0.5200
+    638.1000   1461.7600     34.8600      0.5200
+    638.2000   1461.7600     34.8600      0.5200
+    638.4000   1461.7400     34.8700      0.5100
+    638.5000   1461.7700     34.8600      0.5200
+    638.6000   1461.7300     34.8600      0.5100
+    638.8000   1461.7300     34.8600      0.5100
+    638.9000   1461.7400     34.8700      0.5100
+    639.0000   1461.7400     34.8700      0.5100
+    639.2000   1461.7400     34.8700      0.5100
+    639.3000   1461.7400     34.8700      0.5100
+    639.4000   1461.7500     34.8700      0.5100
+    639.6000   1461.7500     34.8700      0.5100
+    639.7000   1461.7500     34.8700      0.5100
+    639.8000   1461.7500     34.8700      0.5100
+    640.0000   1461.7500     34.8700      0.5100
+    640.1000   1461.7600     34.8700      0.5100
+    640.2000   1461.7600     34.8700      0.5100
+    640.4000   1461.7600     34.8700      0.5100
+    640.5000   1461.7600     34.8700      0.5100
+    640.6000   1461.7700     34.8700      0.5100
+    640.8000   1461.7700     34.8700      0.5100
+    640.9000   1461.7700     34.8700      0.5100
+    641.0000   1461.7700     34.8700      0.5100
+    641.2000   1461.7700     34.8700      0.5100
+    641.3000   1461.7800     34.8700      0.5100
+    641.4000   1461.7800     34.8700      0.5100
+    641.6000   1461.7800     34.8700      0.5100
+    641.7000   1461.7800     34.8700      0.5100
+    641.8000   1461.7800     34.8700      0.5100
+    641.9000   1461.7900     34.8600      0.5100
+    642.1000   1461.7900     34.8600      0.5100
+    642.2000   1461.7900     34.8600      0.5100
+    642.3000   1461.7900     34.8600      0.5100
+    642.5000   1461.7900     34.8600      0.5100
+    642.6000   1461.8000     34.8600      0.5100
+    642.7000   1461.8000     34.8600      0.5100
+    642.9000   1461.8000     34.8600      0.5100
+    643.0000   1461.8000     34.8600      0.5100
+    643.1000   1461.8000     34.8600      0.5100
+    643.3000   1461.8100     34.8600      0.5100
+    643.4000   1461.8100     34.8600      0.5100
+    643.5000   1461.8100     34.8600      0.5100
+    643.7000   1461.8100     34.8600      0.5100
+    643.8000   1461.8200     34.8600      0.5100
+    643.9000   1461.7700     34.8600      0.5000
+    644.1000   1461.8300     34.8700      0.5100
+    644.2000   1461.8300     34.8700      0.5100
+    644.3000   1461.8200     34.8600      0.5100
+    644.5000   1461.8300     34.8600      0.5100
+    644.6000   1461.8300     34.8600      0.5100
+    644.7000   1461.8300     34.8600      0.5100
+    644.9000   1461.8300     34.8600      0.5100
+    645.0000   1461.7900     34.8600      0.5000
+    645.1000   1461.8400     34.8700      0.5100
+    645.3000   1461.8000     34.8700      0.5000
+    645.4000   1461.8000     34.8700      0.5000
+    645.5000   1461.8100     34.8700      0.5000
+    645.7000   1461.8100     34.8700      0.5000
+    645.8000   1461.8100     34.8700      0.5000
+    645.9000   1461.8200     34.8700      0.5000
+    646.1000   1461.8200     34.8700      0.5000
+    646.2000   1461.8200     34.8700      0.5000
+    646.3000   1461.8200     34.8700      0.5000
+    646.5000   1461.8300     34.8700      0.5000
+    646.6000   1461.8300     34.8700      0.5000
+    646.7000   1461.8300     34.8700      0.5000
+    646.9000   1461.8300     34.8700      0.5000
+    647.0000   1461.8300     34.8700      0.5000
+    647.1000   1461.8400     34.8700      0.5000
+    647.3000   1461.8400     34.8700      0.5000
+    647.4000   1461.8400     34.8700      0.5000
+    647.5000   1461.8200     34.8500      0.5000
+    647.7000   1461.7700     34.8500      0.4900
+    647.8000   1461.8500     34.8800      0.5000
+    647.9000   1461.7800     34.8600      0.4900
+    648.1000   1461.8600     34.8800      0.5000
+    648.2000   1461.8300     34.8600      0.5000
+    648.3000   1461.8100     34.8700      0.4900
+    648.5000   1461.8600     34.8800      0.5000
+    648.6000   1461.8200     34.8800      0.4900
+    648.7000   1461.8400     34.8600      0.5000
+    648.9000   1461.8400     34.8600      0.5000
+    649.0000   1461.7900     34.8500      0.4900
+    649.1000   1461.8300     34.8800      0.4900
+    649.3000   1461.8400     34.8800      0.4900
+    649.4000   1461.8100     34.8600      0.4900
+    649.5000   1461.8200     34.8600      0.4900
+    649.7000   1461.8200     34.8600      0.4900
+    649.8000   1461.8500     34.8800      0.4900
+    649.9000   1461.8200     34.8600      0.4900
+    650.1000   1461.8200     34.8600      0.4900
+    650.2000   1461.8300     34.8600      0.4900
+    650.3000   1461.8300     34.8600      0.4900
+    650.4000   1461.8300     34.8600      0.4900
+    650.6000   1461.8300     34.8600      0.4900
+    650.7000   1461.8300     34.8600      0.4900
+    650.8000   1461.8400     34.8600      0.4900
+    651.0000   1461.8400     34.8600      0.4900
+    651.1000   1461.8400     34.8600      0.4900
+    651.2000   1461.8700     34.8800      0.4900
+    651.4000   1461.8400     34.8600      0.4900
+    651.5000   1461.8700     34.8800      0.4900
+    651.6000   1461.8700     34.8800      0.4900
+    651.8000   1461.8500     34.8600      0.4900
+    651.9000   1461.8500     34.8600      0.4900
+    652.0000   1461.8500     34.8600      0.4900
+    652.2000   1461.8600     34.8600      0.4900
+    652.3000   1461.8600     34.8600      0.4900
+    652.4000   1461.8600     34.8600      0.4900
+    652.6000   1461.8600     34.8600      0.4900
+    652.7000   1461.8700     34.8600      0.4900
+    652.8000   1461.8700     34.8600      0.4900
+    653.0000   1461.8700     34.8600      0.4900
+    653.1000   1461.9000     34.8800      0.4900
+    653.2000   1461.8700     34.8600      0.4900
+    653.4000   1461.8800     34.8600      0.4900
+    653.5000   1461.8800     34.8600      0.4900
+    653.6000   1461.8800     34.8600      0.4900
+    653.8000   1461.9100     34.8800      0.4900
+    653.9000   1461.8800     34.8600      0.4900
+    654.0000   1461.8900     34.8600      0.4900
+    654.2000   1461.8900     34.8600      0.4900
+    654.3000   1461.8900     34.8600      0.4900
+    654.4000   1461.8900     34.8600      0.4900
+    654.6000   1461.8900     34.8600      0.4900
+    654.7000   1461.9200     34.8800      0.4900
+    654.8000   1461.9000     34.8600      0.4900
+    655.0000   1461.9000     34.8600      0.4900
+    655.1000   1461.9000     34.8600      0.4900
+    655.2000   1461.9000     34.8600      0.4900
+    655.4000   1461.9100     34.8600      0.4900
+    655.5000   1461.9100     34.8600      0.4900
+    655.6000   1461.9100     34.8600      0.4900
+    655.8000   1461.9100     34.8600      0.4900
+    655.9000   1461.9200     34.8600      0.4900
+    656.0000   1461.9200     34.8600      0.4900
+    656.2000   1461.9200     34.8600      0.4900
+    656.3000   1461.8700     34.8600      0.4800
+    656.4000   1461.9300     34.8700      0.4900
+    656.6000   1461.8900     34.8700      0.4800
+    656.7000   1461.8900     34.8700      0.4800
+    656.8000   1461.9000     34.8700      0.4800
+    657.0000   1461.9000     34.8700      0.4800
+    657.1000   1461.9000     34.8700      0.4800
+    657.2000   1461.9000     34.8700      0.4800
+    657.4000   1461.9100     34.8700      0.4800
+    657.5000   1461.9100     34.8700      0.4800
+    657.6000   1461.9100     34.8700      0.4800
+    657.8000   1461.9100     34.8700      0.4800
+    657.9000   1461.9100     34.8700      0.4800
+    658.0000   1461.9200     34.8700      0.4800
+    658.1000   1461.9200     34.8700      0.4800
+    658.3000   1461.9200     34.8700      0.4800
+    658.4000   1461.9200     34.8700      0.4800
+    658.5000   1461.9200     34.8700      0.4800
+    658.7000   1461.9300     34.8700      0.4800
+    658.8000   1461.9300     34.8700      0.4800
+    658.9000   1461.9300     34.8700      0.4800
+    659.1000   1461.9300     34.8700      0.4800
+    659.2000   1461.9400     34.8700      0.4800
+    659.3000   1461.9400     34.8700      0.4800
+    659.5000   1461.9400     34.8700      0.4800
+    659.6000   1461.9400     34.8700      0.4800
+    659.7000   1461.9400     34.8700      0.4800
+    659.9000   1461.9500     34.8700      0.4800
+    660.0000   1461.9500     34.8700      0.4800
+    660.1000   1461.9500     34.8700      0.4800
+    660.3000   1461.9500     34.8700      0.4800
+    660.4000   1461.9500     34.8700      0.4800
+    660.5000   1461.9600     34.8700      0.4800
+    660.7000   1461.9600     34.8700      0.4800
+    660.8000   1461.9600     34.8700      0.4800
+    660.9000   1461.9600     34.8700      0.4800
+    661.1000   1461.9600     34.8700      0.4800
+    661.2000   1461.9700     34.8700      0.4800
+    661.3000   1461.9700     34.8700      0.4800
+    661.5000   1461.9700     34.8700      0.4800
+    661.6000   1461.9700     34.8700      0.4800
+    661.7000   1461.9700     34.8700      0.4800
+    661.9000   1461.9800     34.8700      0.4800
+    662.0000   1461.9800     34.8700      0.4800
+    662.1000   1461.9800     34.8700      0.4800
+    662.3000   1461.9800     34.8700      0.4800
+    662.4000   1461.9900     34.8700      0.4800
+    662.5000   1461.9900     34.8700      0.4800
+    662.7000   1461.9900     34.8700      0.4800
+    662.8000   1461.9900     34.8700      0.4800
+    662.9000   1461.9900     34.8700      0.4800
+    663.1000   1462.0000     34.8700      0.4800
+    663.2000   1462.0000     34.8700      0.4800
+    663.3000   1462.0000     34.8700      0.4800
+    663.5000   1462.0000     34.8700      0.4800
+    663.6000   1462.0000     34.8700      0.4800
+    663.7000   1462.0100     34.8700      0.4800
+    663.9000   1462.0100     34.8700      0.4800
+    664.0000   1462.0100     34.8700      0.4800
+    664.1000   1462.0100     34.8700      0.4800
+    664.3000   1462.0100     34.8700      0.4800
+    664.4000   1462.0200     34.8700      0.4800
+    664.5000   1461.9700     34.8700      0.4700
+    664.7000   1462.0300     34.8700      0.4800
+    664.8000   1462.0300     34.8700      0.4800
+    664.9000   1461.9800     34.8700      0.4700
+    665.1000   1462.0300     34.8700      0.4800
+    665.2000   1461.9900     34.8700      0.4700
+    665.3000   1461.9900     34.8700      0.4700
+    665.4000   1462.0500     34.8800      0.4800
+    665.6000   1462.0000     34.8700      0.4700
+    665.7000   1462.0500     34.8700      0.4800
+    665.8000   1462.0000     34.8700      0.4700
+    666.0000   1462.0500     34.8700      0.4800
+    666.1000   1462.0000     34.8700      0.4700
+    666.2000   1462.0100     34.8700      0.4700
+    666.4000   1462.0600     34.8800      0.4800
+    666.5000   1462.0100     34.8700      0.4700
+    666.6000   1462.0100     34.8700      0.4700
+    666.8000   1462.0200     34.8800      0.4700
+    666.9000   1462.0200     34.8800      0.4700
+    667.0000   1462.0300     34.8800      0.4700
+    667.2000   1462.0300     34.8800      0.4700
+    667.3000   1462.0300     34.8800      0.4700
+    667.4000   1462.0300     34.8800      0.4700
+    667.6000   1462.0300     34.8800      0.4700
+    667.7000   1462.0400     34.8800      0.4700
+    667.8000   1462.0400     34.8800      0.4700
+    668.0000   1462.0400     34.8800      0.4700
+    668.1000   1462.0400     34.8800      0.4700
+    668.2000   1462.0400     34.8800      0.4700
+    668.4000   1462.0500     34.8800      0.4700
+    668.5000   1462.0500     34.8800      0.4700
+    668.6000   1462.0500     34.8800      0.4700
+    668.8000   1462.0500     34.8800      0.4700
+    668.9000   1462.0300     34.8600      0.4700
+    669.0000   1462.0600     34.8800      0.4700
+    669.2000   1462.0600     34.8800      0.4700
+    669.3000   1462.0600     34.8800      0.4700
+    669.4000   1462.0600     34.8800      0.4700
+    669.6000   1462.0700     34.8800      0.4700
+    669.7000   1462.0700     34.8800      0.4700
+    669.8000   1462.0700     34.8800      0.4700
+    670.0000   1462.0700     34.8800      0.4700
+    670.1000   1462.0700     34.8800      0.4700
+    670.2000   1462.0500     34.8600      0.4700
+    670.4000   1462.0800     34.8800      0.4700
+    670.5000   1462.0100     34.8600      0.4600
+    670.6000   1462.0900     34.8800      0.4700
+    670.8000   1462.0700     34.8600      0.4700
+    670.9000   1462.0100     34.8600      0.4600
+    671.0000   1462.0700     34.8600      0.4700
+    671.2000   1462.0200     34.8600      0.4600
+    671.3000   1462.0700     34.8600      0.4700
+    671.4000   1462.1000     34.8800      0.4700
+    671.6000   1462.0200     34.8600      0.4600
+    671.7000   1462.0600     34.8800      0.4600
+    671.8000   1462.0700     34.8900      0.4600
+    671.9000   1462.0500     34.8700      0.4600
+    672.1000   1462.0700     34.8900      0.4600
+    672.2000   1462.0500     34.8700      0.4600
+    672.3000   1462.0500     34.8700      0.4600
+    672.5000   1462.0500     34.8700      0.4600
+    672.6000   1462.0600     34.8700      0.4600
+    672.7000   1462.0600     34.8700      0.4600
+    672.9000   1462.0600     34.8700      0.4600
+    673.0000   1462.0600     34.8700      0.4600
+    673.1000   1462.0600     34.8700      0.4600
+    673.3000   1462.0700     34.8700      0.4600
+    673.4000   1462.0700     34.8700      0.4600
+    673.5000   1462.0700     34.8700      0.4600
+    673.7000   1462.0700     34.8700      0.4600
+    673.8000   1462.0700     34.8700      0.4600
+    673.9000   1462.0800     34.8700      0.4600
+    674.1000   1462.0800     34.8700      0.4600
+    674.2000   1462.0800     34.8700      0.4600
+    674.3000   1462.0800     34.8700      0.4600
+    674.5000   1462.0800     34.8700      0.4600
+    674.6000   1462.0900     34.8700      0.4600
+    674.7000   1462.0900     34.8700      0.4600
+    674.9000   1462.0400     34.8700      0.4500
+    675.0000   1462.1000     34.8700      0.4600
+    675.1000   1462.1000     34.8700      0.4600
+    675.3000   1462.1000     34.8700      0.4600
+    675.4000   1462.1000     34.8700      0.4600
+    675.5000   1462.0500     34.8700      0.4500
+    675.7000   1462.1100     34.8700      0.4600
+    675.8000   1462.0700     34.8700      0.4500
+    675.9000   1462.1200     34.8700      0.4600
+    676.1000   1462.1200     34.8700      0.4600
+    676.2000   1462.0600     34.8700      0.4500
+    676.3000   1462.1200     34.8700      0.4600
+    676.5000   1462.0800     34.8700      0.4500
+    676.6000   1462.0800     34.8700      0.4500
+    676.7000   1462.0900     34.8800      0.4500
+    676.9000   1462.0900     34.8800      0.4500
+    677.0000   1462.1400     34.8800      0.4600
+    677.1000   1462.0900     34.8700      0.4500
+    677.3000   1462.1400     34.8700      0.4600
+    677.4000   1462.1400     34.8700      0.4600
+    677.5000   1462.0800     34.8600      0.4500
+    677.7000   1462.1400     34.8700      0.4600
+    677.8000   1462.1000     34.8700      0.4500
+    677.9000   1462.1000     34.8700      0.4500
+    678.0000   1462.1600     34.8800      0.4600
+    678.2000   1462.1000     34.8700      0.4500
+    678.3000   1462.1500     34.8700      0.4600
+    678.4000   1462.1100     34.8700      0.4500
+    678.6000   1462.1100     34.8700      0.4500
+    678.7000   1462.1200     34.8800      0.4500
+    678.8000   1462.1200     34.8800      0.4500
+    679.0000   1462.1200     34.8800      0.4500
+    679.1000   1462.1300     34.8800      0.4500
+    679.2000   1462.1300     34.8800      0.4500
+    679.4000   1462.1300     34.8800      0.4500
+    679.5000   1462.1300     34.8700      0.4500
+    679.6000   1462.1300     34.8700      0.4500
+    679.8000   1462.1400     34.8700      0.4500
+    679.9000   1462.1400     34.8700      0.4500
+    680.0000   1462.1400     34.8700      0.4500
+    680.2000   1462.1400     34.8700      0.4500
+    680.3000   1462.1400     34.8700      0.4500
+    680.4000   1462.1500     34.8700      0.4500
+    680.6000   1462.1500     34.8700      0.4500
+    680.7000   1462.1500     34.8700      0.4500
+    680.8000   1462.1500     34.8700      0.4500
+    681.0000   1462.1500     34.8700      0.4500
+    681.1000   1462.1600     34.8700      0.4500
+    681.2000   1462.1600     34.8700      0.4500
+    681.4000   1462.1600     34.8700      0.4500
+    681.5000   1462.1600     34.8700      0.4500
+    681.6000   1462.1700     34.8700      0.4500
+    681.8000   1462.1700     34.8700      0.4500
+    681.9000   1462.1700     34.8700      0.4500
+    682.0000   1462.1700     34.8700      0.4500
+    682.2000   1462.1300     34.8700      0.4400
+    682.3000   1462.1800     34.8800      0.4500
+    682.4000   1462.1400     34.8800      0.4400
+    682.6000   1462.1400     34.8800      0.4400
+    682.7000   1462.1500     34.8800      0.4400
+    682.8000   1462.1500     34.8800      0.4400
+    683.0000   1462.1500     34.8800      0.4400
+    683.1000   1462.1300     34.8700      0.4400
+    683.2000   1462.1300     34.8700      0.4400
+    683.4000   1462.1600     34.8800      0.4400
+    683.5000   1462.1600     34.8800      0.4400
+    683.6000   1462.1600     34.8800      0.4400
+    683.7000   1462.1400     34.8600      0.4400
+    683.9000   1462.1400     34.8600      0.4400
+    684.0000   1462.1400     34.8600      0.4400
+    684.1000   1462.1500     34.8600      0.4400
+    684.3000   1462.1700     34.8800      0.4400
+    684.4000   1462.1800     34.8800      0.4400
+    684.5000   1462.1500     34.8600      0.4400
+    684.7000   1462.1800     34.8800      0.4400
+    684.8000   1462.1600     34.8600      0.4400
+    684.9000   1462.1900     34.8800      0.4400
+    685.1000   1462.1900     34.8800      0.4400
+    685.2000   1462.1600     34.8600      0.4400
+    685.3000   1462.1900     34.8800      0.4400
+    685.5000   1462.1900     34.8800      0.4400
+    685.6000   1462.2000     34.8800      0.4400
+    685.7000   1462.1700     34.8600      0.4400
+    685.9000   1462.1700     34.8600      0.4400
+    686.0000   1462.2000     34.8800      0.4400
+    686.1000   1462.2000     34.8800      0.4400
+    686.3000   1462.2100     34.8800      0.4400
+    686.4000   1462.2100     34.8800      0.4400
+    686.5000   1462.1800     34.8600      0.4400
+    686.7000   1462.1900     34.8600      0.4400
+    686.8000   1462.1900     34.8600      0.4400
+    686.9000   1462.2200     34.8800      0.4400
+    687.1000   1462.1900     34.8600      0.4400
+    687.2000   1462.1900     34.8600      0.4400
+    687.3000   1462.2200     34.8800      0.4400
+    687.5000   1462.2000     34.8600      0.4400
+    687.6000   1462.2000     34.8600      0.4400
+    687.7000   1462.2000     34.8600      0.4400
+    687.9000   1462.2300     34.8800      0.4400
+    688.0000   1462.2100     34.8600      0.4400
+    688.1000   1462.2100     34.8600      0.4400
+    688.3000   1462.2100     34.8600      0.4400
+    688.4000   1462.2100     34.8600      0.4400
+    688.5000   1462.2200     34.8600      0.4400
+    688.7000   1462.2400     34.8800      0.4400
+    688.8000   1462.2200     34.8600      0.4400
+    688.9000   1462.2500     34.8800      0.4400
+    689.0000   1462.2200     34.8600      0.4400
+    689.2000   1462.2300     34.8600      0.4400
+    689.3000   1462.2500     34.8800      0.4400
+    689.4000   1462.2300     34.8600      0.4400
+    689.6000   1462.2600     34.8800      0.4400
+    689.7000   1462.2300     34.8600      0.4400
+    689.8000   1462.2400     34.8600      0.4400
+    690.0000   1462.2400     34.8600      0.4400
+    690.1000   1462.1900     34.8600      0.4300
+    690.2000   1462.2500     34.8700      0.4400
+    690.4000   1462.2000     34.8700      0.4300
+    690.5000   1462.2500     34.8700      0.4400
+    690.6000   1462.2600     34.8700      0.4400
+    690.8000   1462.2300     34.8800      0.4300
+    690.9000   1462.2600     34.8700      0.4400
+    691.0000   1462.2100     34.8700      0.4300
+    691.2000   1462.2600     34.8700      0.4400
+    691.3000   1462.2700     34.8700      0.4400
+    691.4000   1462.2100     34.8600      0.4300
+    691.6000   1462.2200     34.8700      0.4300
+    691.7000   1462.2300     34.8700      0.4300
+    691.8000   1462.2400     34.8700      0.4300
+    692.0000   1462.2400     34.8700      0.4300
+    692.1000   1462.2400     34.8700      0.4300
+    692.2000   1462.2400     34.8700      0.4300
+    692.4000   1462.2400     34.8700      0.4300
+    692.5000   1462.2500     34.8700      0.4300
+    692.6000   1462.2500     34.8700      0.4300
+    692.8000   1462.2500     34.8700      0.4300
+    692.9000   1462.2500     34.8700      0.4300
+    693.0000   1462.2500     34.8700      0.4300
+    693.2000   1462.2600     34.8700      0.4300
+    693.3000   1462.2600     34.8700      0.4300
+    693.4000   1462.2600     34.8700      0.4300
+    693.6000   1462.2600     34.8700      0.4300
+    693.7000   1462.2600     34.8700      0.4300
+    693.8000   1462.2700     34.8700      0.4300
+    694.0000   1462.2700     34.8700      0.4300
+    694.1000   1462.2700     34.8700      0.4300
+    694.2000   1462.2700     34.8700      0.4300
+    694.3000   1462.2700     34.8700      0.4300
+    694.5000   1462.2800     34.8700      0.4300
+    694.6000   1462.2800     34.8700      0.4300
+    694.7000   1462.2300     34.8700      0.4200
+    694.9000   1462.2900     34.8800      0.4300
+    695.0000   1462.2500     34.8800      0.4200
+    695.1000   1462.3000     34.8800      0.4300
+    695.3000   1462.3000     34.8800      0.4300
+    695.4000   1462.2400     34.8700      0.4200
+    695.5000   1462.2500     34.8800      0.4200
+    695.7000   1462.2600     34.8800      0.4200
+    695.8000   1462.2700     34.8800      0.4200
+    695.9000   1462.2700     34.8800      0.4200
+    696.1000   1462.2700     34.8800      0.4200
+    696.2000   1462.2700     34.8800      0.4200
+    696.3000   1462.2700     34.8800      0.4200
+    696.5000   1462.2500     34.8600      0.4200
+    696.6000   1462.2800     34.8800      0.4200
+    696.7000   1462.2500     34.8600      0.4200
+    696.9000   1462.2600     34.8600      0.4200
+    697.0000   1462.2600     34.8600      0.4200
+    697.1000   1462.2900     34.8800      0.4200
+    697.3000   1462.2900     34.8800      0.4200
+    697.4000   1462.2900     34.8800      0.4200
+    697.5000   1462.2900     34.8800      0.4200
+    697.7000   1462.2700     34.8600      0.4200
+    697.8000   1462.2700     34.8600      0.4200
+    697.9000   1462.2700     34.8600      0.4200
+    698.1000   1462.3000     34.8800      0.4200
+    698.2000   1462.2800     34.8600      0.4200
+    698.3000   1462.2800     34.8600      0.4200
+    698.5000   1462.2800     34.8600      0.4200
+    698.6000   1462.2800     34.8600      0.4200
+    698.7000   1462.2900     34.8600      0.4200
+    698.9000   1462.3100     34.8800      0.4200
+    699.0000   1462.3200     34.8800      0.4200
+    699.1000   1462.3200     34.8800      0.4200
+    699.2000   1462.2900     34.8600      0.4200
+    699.4000   1462.3200     34.8800      0.4200
+    699.5000   1462.3000     34.8600      0.4200
+    699.6000   1462.3000     34.8600      0.4200
+    699.8000   1462.3000     34.8600      0.4200
+    699.9000   1462.3300     34.8800      0.4200
+    700.0000   1462.3100     34.8600      0.4200
+    700.2000   1462.3300     34.8800      0.4200
+    700.3000   1462.3100     34.8600      0.4200
+    700.4000   1462.3100     34.8600      0.4200
+    700.6000   1462.3100     34.8600      0.4200
+    700.7000   1462.3200     34.8600      0.4200
+    700.8000   1462.3400     34.8800      0.4200
+    701.0000   1462.3000     34.8800      0.4100
+    701.1000   1462.3300     34.8600      0.4200
+    701.2000   1462.3100     34.8800      0.4100
+    701.4000   1462.3100     34.8800      0.4100
+    701.5000   1462.3700     34.8900      0.4200
+    701.6000   1462.2900     34.8600      0.4100
+    701.8000   1462.2900     34.8600      0.4100
+    701.9000   1462.3000     34.8700      0.4100
+    702.0000   1462.3100     34.8700      0.4100
+    702.2000   1462.3100     34.8700      0.4100
+    702.3000   1462.3100     34.8700      0.4100
+    702.4000   1462.3100     34.8700      0.4100
+    702.6000   1462.3100     34.8700      0.4100
+    702.7000   1462.3200     34.8700      0.4100
+    702.8000   1462.3200     34.8700      0.4100
+    703.0000   1462.3200     34.8700      0.4100
+    703.1000   1462.3200     34.8700      0.4100
+    703.2000   1462.3200     34.8700      0.4100
+    703.4000   1462.3300     34.8700      0.4100
+    703.5000   1462.3300     34.8700      0.4100
+    703.6000   1462.3300     34.8700      0.4100
+    703.7000   1462.3300     34.8700      0.4100
+    703.9000   1462.3300     34.8700      0.4100
+    704.0000   1462.3400     34.8700      0.4100
+    704.1000   1462.3400     34.8700      0.4100
+    704.3000   1462.3400     34.8700      0.4100
+    704.4000   1462.3400     34.8700      0.4100
+    704.5000   1462.3400     34.8700      0.4100
+    704.7000   1462.3500     34.8700      0.4100
+    704.8000   1462.3500     34.8700      0.4100
+    704.9000   1462.3500     34.8700      0.4100
+    705.1000   1462.3500     34.8700      0.4100
+    705.2000   1462.3500     34.8700      0.4100
+    705.3000   1462.3600     34.8700      0.4100
+    705.5000   1462.3600     34.8700      0.4100
+    705.6000   1462.3600     34.8700      0.4100
+    705.7000   1462.3600     34.8700      0.4100
+    705.9000   1462.3700     34.8700      0.4100
+    706.0000   1462.3200     34.8700      0.4000
+    706.1000   1462.3800     34.8700      0.4100
+    706.3000   1462.3300     34.8700      0.4000
+    706.4000   1462.3800     34.8700      0.4100
+    706.5000   1462.3800     34.8700      0.4100
+    706.7000   1462.3300     34.8700      0.4000
+    706.8000   1462.3400     34.8700      0.4000
+    706.9000   1462.3500     34.8800      0.4000
+    707.1000   1462.3500     34.8800      0.4000
+    707.2000   1462.3500     34.8800      0.4000
+    707.3000   1462.3300     34.8600      0.4000
+    707.5000   1462.3600     34.8800      0.4000
+    707.6000   1462.3300     34.8600      0.4000
+    707.7000   1462.3600     34.8800      0.4000
+    707.9000   1462.3400     34.8600      0.4000
+    708.0000   1462.3400     34.8600      0.4000
+    708.1000   1462.3400     34.8600      0.4000
+    708.3000   1462.3700     34.8800      0.4000
+    708.4000   1462.3500     34.8600      0.4000
+    708.5000   1462.3000     34.8600      0.3900
+    708.6000   1462.3100     34.8600      0.3900
+    708.8000   1462.3200     34.8700      0.3900
+    708.9000   1462.3200     34.8700      0.3900
+    709.0000   1462.3300     34.8700      0.3900
+    709.2000   1462.3300     34.8700      0.3900
+    709.3000   1462.3300     34.8700      0.3900
+    709.4000   1462.3300     34.8700      0.3900
+    709.6000   1462.3300     34.8700      0.3900
+    709.7000   1462.3400     34.8700      0.3900
+    709.8000   1462.3400     34.8700      0.3900
+    710.0000   1462.3400     34.8700      0.3900
+    710.1000   1462.3400     34.8700      0.3900
+    710.2000   1462.3400     34.8700      0.3900
+    710.4000   1462.3500     34.8700      0.3900
+    710.5000   1462.3500     34.8700      0.3900
+    710.6000   1462.3500     34.8700      0.3900
+    710.8000   1462.3500     34.8700      0.3900
+    710.9000   1462.3500     34.8700      0.3900
+    711.0000   1462.3600     34.8700      0.3900
+    711.2000   1462.3600     34.8700      0.3900
+    711.3000   1462.3600     34.8700      0.3900
+    711.4000   1462.3600     34.8700      0.3900
+    711.6000   1462.3600     34.8700      0.3900
+    711.7000   1462.3700     34.8700      0.3900
+    711.8000   1462.3700     34.8700      0.3900
+    712.0000   1462.3700     34.8700      0.3900
+    712.1000   1462.3700     34.8700      0.3900
+    712.2000   1462.3800     34.8700      0.3900
+    712.4000   1462.3800     34.8700      0.3900
+    712.5000   1462.3800     34.8700      0.3900
+    712.6000   1462.3800     34.8700      0.3900
+    712.7000   1462.3800     34.8700      0.3900
+    712.9000   1462.3400     34.8700      0.3700
+    713.0000   1462.3500     34.8700      0.3700
+    713.1000   1462.3600     34.8800      0.3700
+    713.3000   1462.3600     34.8800      0.3700
+    713.4000   1462.3600     34.8800      0.3700
+    713.5000   1462.3600     34.8800      0.3700
+    713.7000   1462.3700     34.8800      0.3700
+    713.8000   1462.3700     34.8800      0.3700
+    713.9000   1462.3700     34.8800      0.3700
+    714.1000   1462.3700     34.8800      0.3700
+    714.2000   1462.3700     34.8800      0.3700
+    714.3000   1462.3800     34.8800      0.3700
+    714.5000   1462.3800     34.8800      0.3700
+    714.6000   1462.3800     34.8800      0.3700
+    714.7000   1462.3800     34.8800      0.3700
+    714.9000   1462.3800     34.8800      0.3700
+    715.0000   1462.3900     34.8800      0.3700
+    715.1000   1462.3900     34.8800      0.3700
+    715.3000   1462.3600     34.8600      0.3700
+    715.4000   1462.3900     34.8800      0.3700
+    715.5000   1462.3900     34.8800      0.3700
+    715.7000   1462.4000     34.8800      0.3700
+    715.8000   1462.4000     34.8800      0.3700
+    715.9000   1462.4000     34.8800      0.3700
+    716.1000   1462.4000     34.8800      0.3700
+    716.2000   1462.4100     34.8800      0.3700
+    716.3000   1462.4100     34.8800      0.3700
+    716.5000   1462.4100     34.8800      0.3700
+    716.6000   1462.4100     34.8800      0.3700
+    716.7000   1462.4100     34.8800      0.3700
+    716.9000   1462.4200     34.8800      0.3700
+    717.0000   1462.4200     34.8800      0.3700
+    717.1000   1462.4200     34.8800      0.3700
+    717.2000   1462.4200     34.8800      0.3700
+    717.4000   1462.4200     34.8800      0.3700
+    717.5000   1462.4300     34.8800      0.3700
+    717.6000   1462.4300     34.8800      0.3700
+    717.8000   1462.4300     34.8800      0.3700
+    717.9000   1462.4300     34.8800      0.3700
+    718.0000   1462.4300     34.8800      0.3700
+    718.2000   1462.4400     34.8800      0.3700
+    718.3000   1462.4400     34.8800      0.3700
+    718.4000   1462.4100     34.8600      0.3700
+    718.6000   1462.4400     34.8800      0.3700
+    718.7000   1462.4400     34.8800      0.3700
+    718.8000   1462.3700     34.8600      0.3600
+    719.0000   1462.4600     34.8800      0.3700
+    719.1000   1462.4600     34.8800      0.3700
+    719.2000   1462.4300     34.8600      0.3700
+    719.4000   1462.4600     34.8800      0.3700
+    719.5000   1462.4100     34.8800      0.3600
+    719.6000   1462.4400     34.8600      0.3700
+    719.8000   1462.4700     34.8800      0.3700
+    719.9000   1462.3900     34.8600      0.3600
+    720.0000   1462.4700     34.8800      0.3700
+    720.2000   1462.4300     34.8800      0.3600
+    720.3000   1462.4500     34.8600      0.3700
+    720.4000   1462.4300     34.8800      0.3600
+    720.6000   1462.4100     34.8600      0.3600
+    720.7000   1462.4200     34.8700      0.3600
+    720.8000   1462.4500     34.8900      0.3600
+    721.0000   1462.5000     34.8900      0.3700
+    721.1000   1462.4200     34.8600      0.3600
+    721.2000   1462.4400     34.8800      0.3600
+    721.3000   1462.4500     34.8900      0.3600
+    721.5000   1462.4600     34.8900      0.3600
+    721.6000   1462.4600     34.8900      0.3600
+    721.7000   1462.4300     34.8700      0.3600
+    721.9000   1462.4400     34.8700      0.3600
+    722.0000   1462.4400     34.8700      0.3600
+    722.1000   1462.4700     34.8900      0.3600
+    722.3000   1462.4700     34.8900      0.3600
+    722.4000   1462.4700     34.8900      0.3600
+    722.5000   1462.4500     34.8700      0.3600
+    722.7000   1462.4500     34.8700      0.3600
+    722.8000   1462.4500     34.8700      0.3600
+    722.9000   1462.4500     34.8700      0.3600
+    723.1000   1462.4800     34.8900      0.3600
+    723.2000   1462.4600     34.8700      0.3600
+    723.3000   1462.4600     34.8700      0.3600
+    723.5000   1462.4600     34.8700      0.3600
+    723.6000   1462.4600     34.8700      0.3600
+    723.7000   1462.4700     34.8700      0.3600
+    723.9000   1462.4700     34.8700      0.3600
+    724.0000   1462.4700     34.8700      0.3600
+    724.1000   1462.4700     34.8700      0.3600
+    724.3000   1462.4700     34.8700      0.3600
+    724.4000   1462.4800     34.8700      0.3600
+    724.5000   1462.4800     34.8700      0.3600
+    724.7000   1462.4800     34.8700      0.3600
+    724.8000   1462.4300     34.8700      0.3500
+    724.9000   1462.4900     34.8700      0.3600
+    725.1000   1462.4900     34.8700      0.3600
+    725.2000   1462.4400     34.8700      0.3500
+    725.3000   1462.4500     34.8700      0.3500
+    725.4000   1462.4600     34.8800      0.3500
+    725.6000   1462.4600     34.8800      0.3500
+    725.7000   1462.4600     34.8800      0.3500
+    725.8000   1462.4700     34.8800      0.3500
+    726.0000   1462.4700     34.8800      0.3500
+    726.1000   1462.4700     34.8800      0.3500
+    726.2000   1462.4700     34.8800      0.3500
+    726.4000   1462.4700     34.8800      0.3500
+    726.5000   1462.4500     34.8600      0.3500
+    726.6000   1462.4800     34.8800      0.3500
+    726.8000   1462.4800     34.8800      0.3500
+    726.9000   1462.4800     34.8800      0.3500
+    727.0000   1462.4900     34.8800      0.3500
+    727.2000   1462.4900     34.8800      0.3500
+    727.3000   1462.4900     34.8800      0.3500
+    727.4000   1462.4900     34.8800      0.3500
+    727.6000   1462.4900     34.8800      0.3500
+    727.7000   1462.5000     34.8800      0.3500
+    727.8000   1462.5000     34.8800      0.3500
+    728.0000   1462.5000     34.8800      0.3500
+    728.1000   1462.5000     34.8800      0.3500
+    728.2000   1462.5000     34.8800      0.3500
+    728.4000   1462.5100     34.8700      0.3500
+    728.5000   1462.4800     34.8600      0.3500
+    728.6000   1462.5100     34.8700      0.3500
+    728.8000   1462.5100     34.8700      0.3500
+    728.9000   1462.5100     34.8700      0.3500
+    729.0000   1462.5200     34.8700      0.3500
+    729.1000   1462.5200     34.8700      0.3500
+    729.3000   1462.5200     34.8700      0.3500
+    729.4000   1462.5000     34.8500      0.3500
+    729.5000   1462.5200     34.8700      0.3500
+    729.7000   1462.5300     34.8700      0.3500
+    729.8000   1462.5300     34.8700      0.3500
+    729.9000   1462.5300     34.8700      0.3500
+    730.1000   1462.5300     34.8700      0.3500
+    730.2000   1462.5400     34.8700      0.3500
+    730.3000   1462.5400     34.8700      0.3500
+    730.5000   1462.4900     34.8700      0.3400
+    730.6000   1462.5500     34.8800      0.3500
+    730.7000   1462.5000     34.8800      0.3400
+    730.9000   1462.5500     34.8800      0.3500
+    731.0000   1462.5600     34.8800      0.3500
+    731.1000   1462.5500     34.8700      0.3500
+    731.3000   1462.5500     34.8700      0.3500
+    731.4000   1462.5500     34.8700      0.3500
+    731.5000   1462.5600     34.8700      0.3500
+    731.7000   1462.5600     34.8700      0.3500
+    731.8000   1462.5100     34.8700      0.3400
+    731.9000   1462.5700     34.8800      0.3500
+    732.1000   1462.5200     34.8800      0.3400
+    732.2000   1462.5700     34.8800      0.3500
+    732.3000   1462.5800     34.8800      0.3500
+    732.5000   1462.5400     34.8500      0.3500
+    732.6000   1462.5700     34.8700      0.3500
+    732.7000   1462.5700     34.8700      0.3500
+    732.9000   1462.5800     34.8700      0.3500
+    733.0000   1462.5800     34.8700      0.3500
+    733.1000   1462.5300     34.8700      0.3400
+    733.2000   1462.5900     34.8800      0.3500
+    733.4000   1462.5400     34.8800      0.3400
+    733.5000   1462.5500     34.8800      0.3400
+    733.6000   1462.5600     34.8800      0.3400
+    733.8000   1462.5300     34.8600      0.3400
+    733.9000   1462.5400     34.8600      0.3400
+    734.0000   1462.5600     34.8800      0.3400
+    734.2000   1462.5700     34.8800      0.3400
+    734.3000   1462.5700     34.8800      0.3400
+    734.4000   1462.5700     34.8800      0.3400
+    734.6000   1462.5700     34.8800      0.3400
+    734.7000   1462.5500     34.8600      0.3400
+    734.8000   1462.5800     34.8800      0.3400
+    735.0000   1462.5800     34.8800      0.3400
+    735.1000   1462.5800     34.8800      0.3400
+    735.2000   1462.5800     34.8800      0.3400
+    735.4000   1462.5600     34.8600      0.3400
+    735.5000   1462.5600     34.8600      0.3400
+    735.6000   1462.5900     34.8800      0.3400
+    735.8000   1462.5600     34.8600      0.3400
+    735.9000   1462.5900     34.8800      0.3400
+    736.0000   1462.5900     34.8800      0.3400
+    736.2000   1462.5700     34.8600      0.3400
+    736.3000   1462.6000     34.8800      0.3400
+    736.4000   1462.5700     34.8600      0.3400
+    736.6000   1462.5800     34.8600      0.3400
+    736.7000   1462.5800     34.8600      0.3400
+    736.8000   1462.5800     34.8600      0.3400
+    736.9000   1462.6100     34.8800      0.3400
+    737.1000   1462.6100     34.8800      0.3400
+    737.2000   1462.5900     34.8600      0.3400
+    737.3000   1462.5900     34.8600      0.3400
+    737.5000   1462.5900     34.8600      0.3400
+    737.6000   1462.6200     34.8800      0.3400
+    737.7000   1462.6000     34.8600      0.3400
+    737.9000   1462.6000     34.8600      0.3400
+    738.0000   1462.5500     34.8600      0.3300
+    738.1000   1462.6100     34.8700      0.3400
+    738.3000   1462.5600     34.8700      0.3300
+    738.4000   1462.5700     34.8700      0.3300
+    738.5000   1462.5800     34.8700      0.3300
+    738.7000   1462.5800     34.8700      0.3300
+    738.8000   1462.5800     34.8700      0.3300
+    738.9000   1462.5800     34.8700      0.3300
+    739.1000   1462.5800     34.8700      0.3300
+    739.2000   1462.5900     34.8700      0.3300
+    739.3000   1462.5900     34.8700      0.3300
+    739.5000   1462.5900     34.8700      0.3300
+    739.6000   1462.5900     34.8700      0.3300
+    739.7000   1462.5900     34.8700      0.3300
+    739.9000   1462.6000     34.8700      0.3300
+    740.0000   1462.6000     34.8700      0.3300
+    740.1000   1462.6000     34.8700      0.3300
+    740.3000   1462.6000     34.8700      0.3300
+    740.4000   1462.6000     34.8700      0.3300
+    740.5000   1462.6100     34.8700      0.3300
+    740.6000   1462.5600     34.8700      0.3200
+    740.8000   1462.6200     34.8800      0.3300
+    740.9000   1462.5700     34.8800      0.3200
+    741.0000   1462.5700     34.8800      0.3200
+    741.2000   1462.5800     34.8800      0.3200
+    741.3000   1462.5900     34.8800      0.3200
+    741.4000   1462.5900     34.8800      0.3200
+    741.6000   1462.5900     34.8800      0.3200
+    741.7000   1462.5900     34.8800      0.3200
+    741.8000   1462.6000     34.8800      0.3200
+    742.0000   1462.6000     34.8800      0.3200
+    742.1000   1462.6000     34.8800      0.3200
+    742.2000   1462.6000     34.8800      0.3200
+    742.4000   1462.6000     34.8800      0.3200
+    742.5000   1462.6100     34.8800      0.3200
+    742.6000   1462.6100     34.8800      0.3200
+    742.8000   1462.6100     34.8800      0.3200
+    742.9000   1462.6100     34.8800      0.3200
+    743.0000   1462.6100     34.8800      0.3200
+    743.2000   1462.6200     34.8800      0.3200
+    743.3000   1462.6200     34.8800      0.3200
+    743.4000   1462.6200     34.8800      0.3200
+    743.6000   1462.6200     34.8800      0.3200
+    743.7000   1462.6200     34.8800      0.3200
+    743.8000   1462.6300     34.8800      0.3200
+    743.9000   1462.6300     34.8800      0.3200
+    744.1000   1462.6300     34.8800      0.3200
+    744.2000   1462.6300     34.8800      0.3200
+    744.3000   1462.6300     34.8800      0.3200
+    744.5000   1462.6400     34.8800      0.3200
+    744.6000   1462.6400     34.8800      0.3200
+    744.7000   1462.6400     34.8800      0.3200
+    744.9000   1462.6400     34.8800      0.3200
+    745.0000   1462.6500     34.8800      0.3200
+    745.1000   1462.6500     34.8800      0.3200
+    745.3000   1462.6500     34.8800      0.3200
+    745.4000   1462.6300     34.8600      0.3200
+    745.5000   1462.6500     34.8800      0.3200
+    745.7000   1462.6300     34.8600      0.3200
+    745.8000   1462.6600     34.8800      0.3200
+    745.9000   1462.6300     34.8600      0.3200
+    746.1000   1462.6400     34.8600      0.3200
+    746.2000   1462.6400     34.8600      0.3200
+    746.3000   1462.5900     34.8600      0.3100
+    746.5000   1462.6500     34.8700      0.3200
+    746.6000   1462.6000     34.8700      0.3100
+    746.7000   1462.6500     34.8700      0.3200
+    746.9000   1462.6600     34.8700      0.3200
+    747.0000   1462.6000     34.8600      0.3100
+    747.1000   1462.6600     34.8700      0.3200
+    747.3000   1462.6100     34.8700      0.3100
+    747.4000   1462.6600     34.8700      0.3200
+    747.5000   1462.6900     34.8900      0.3200
+    747.6000   1462.6100     34.8600      0.3100
+    747.8000   1462.7000     34.8900      0.3200
+    747.9000   1462.6500     34.8900      0.3100
+    748.0000   1462.6700     34.8700      0.3200
+    748.2000   1462.6800     34.8700      0.3200
+    748.3000   1462.6200     34.8600      0.3100
+    748.4000   1462.6300     34.8700      0.3100
+    748.6000   1462.6400     34.8700      0.3100
+    748.7000   1462.6900     34.8700      0.3200
+    748.8000   1462.6900     34.8700      0.3200
+    749.0000   1462.6300     34.8600      0.3100
+    749.1000   1462.7200     34.8800      0.3200
+    749.2000   1462.6500     34.8700      0.3100
+    749.4000   1462.6700     34.8800      0.3100
+    749.5000   1462.6600     34.8700      0.3100
+    749.6000   1462.6600     34.8700      0.3100
+    749.8000   1462.6600     34.8700      0.3100
+    749.9000   1462.6900     34.8900      0.3100
+    750.0000   1462.6700     34.8700      0.3100
+    750.2000   1462.6700     34.8700      0.3100
+    750.3000   1462.6700     34.8700      0.3100
+    750.4000   1462.7000     34.8900      0.3100
+    750.6000   1462.7000     34.8900      0.3100
+    750.7000   1462.6800     34.8700      0.3100
+    750.8000   1462.6800     34.8700      0.3100
+    750.9000   1462.6800     34.8700      0.3100
+    751.1000   1462.6800     34.8700      0.3100
+    751.2000   1462.6800     34.8700      0.3100
+    751.3000   1462.6900     34.8700      0.3100
+    751.5000   1462.6900     34.8700      0.3100
+    751.6000   1462.6900     34.8700      0.3100
+    751.7000   1462.6900     34.8700      0.3100
+    751.9000   1462.6900     34.8700      0.3100
+    752.0000   1462.7000     34.8700      0.3100
+    752.1000   1462.7000     34.8700      0.3100
+    752.3000   1462.7000     34.8700      0.3100
+    752.4000   1462.7000     34.8700      0.3100
+    752.5000   1462.7100     34.8700      0.3100
+    752.7000   1462.7100     34.8700      0.3100
+    752.8000   1462.7100     34.8700      0.3100
+    752.9000   1462.7100     34.8700      0.3100
+    753.1000   1462.7100     34.8700      0.3100
+    753.2000   1462.7200     34.8700      0.3100
+    753.3000   1462.7200     34.8700      0.3100
+    753.5000   1462.6700     34.8700      0.3000
+    753.6000   1462.6800     34.8700      0.3000
+    753.7000   1462.6900     34.8800      0.3000
+    753.9000   1462.6900     34.8800      0.3000
+    754.0000   1462.7000     34.8800      0.3000
+    754.1000   1462.7000     34.8800      0.3000
+    754.2000   1462.7000     34.8800      0.3000
+    754.4000   1462.7000     34.8800      0.3000
+    754.5000   1462.7000     34.8800      0.3000
+    754.6000   1462.7100     34.8800      0.3000
+    754.8000   1462.7100     34.8800      0.3000
+    754.9000   1462.7100     34.8800      0.3000
+    755.0000   1462.7100     34.8800      0.3000
+    755.2000   1462.7100     34.8800      0.3000
+    755.3000   1462.7200     34.8800      0.3000
+    755.4000   1462.7200     34.8800      0.3000
+    755.6000   1462.7200     34.8800      0.3000
+    755.7000   1462.7000     34.8600      0.3000
+    755.8000   1462.6500     34.8600      0.2900
+    756.0000   1462.7100     34.8700      0.3000
+    756.1000   1462.7400     34.8800      0.3000
+    756.2000   1462.6600     34.8600      0.2900
+    756.4000   1462.7100     34.8700      0.3000
+    756.5000   1462.7000     34.8800      0.2900
+    756.6000   1462.7500     34.8800      0.3000
+    756.8000   1462.7500     34.8800      0.3000
+    756.9000   1462.6700     34.8600      0.2900
+    757.0000   1462.7000     34.8800      0.2900
+    757.2000   1462.7100     34.8900      0.2900
+    757.3000   1462.7600     34.8900      0.3000
+    757.4000   1462.6800     34.8600      0.2900
+    757.5000   1462.6900     34.8600      0.2900
+    757.7000   1462.7200     34.8900      0.2900
+    757.8000   1462.7000     34.8700      0.2900
+    757.9000   1462.7000     34.8700      0.2900
+    758.1000   1462.7000     34.8700      0.2900
+    758.2000   1462.7000     34.8700      0.2900
+    758.3000   1462.7100     34.8700      0.2900
+    758.5000   1462.7100     34.8700      0.2900
+    758.6000   1462.7100     34.8700      0.2900
+    758.7000   1462.7100     34.8700      0.2900
+    758.9000   1462.7100     34.8700      0.2900
+    759.0000   1462.7400     34.8900      0.2900
+    759.1000   1462.7200     34.8700      0.2900
+    759.3000   1462.7200     34.8700      0.2900
+    759.4000   1462.7200     34.8700      0.2900
+    759.5000   1462.7200     34.8700      0.2900
+    759.7000   1462.7300     34.8700      0.2900
+    759.8000   1462.7300     34.8700      0.2900
+    759.9000   1462.7300     34.8700      0.2900
+    760.1000   1462.7300     34.8700      0.2900
+    760.2000   1462.7300     34.8700      0.2900
+    760.3000   1462.7400     34.8700      0.2900
+    760.5000   1462.7400     34.8700      0.2900
+    760.6000   1462.7400     34.8700      0.2900
+    760.7000   1462.7400     34.8700      0.2900
+    760.8000   1462.7500     34.8700      0.2900
+    761.0000   1462.7500     34.8700      0.2900
+    761.1000   1462.7500     34.8700      0.2900
+    761.2000   1462.7500     34.8700      0.2900
+    761.4000   1462.7500     34.8700      0.2900
+    761.5000   1462.7600     34.8700      0.2900
+    761.6000   1462.7600     34.8700      0.2900
+    761.8000   1462.7600     34.8700      0.2900
+    761.9000   1462.7600     34.8700      0.2900
+    762.0000   1462.7600     34.8700      0.2900
+    762.2000   1462.7700     34.8700      0.2900
+    762.3000   1462.7700     34.8700      0.2900
+    762.4000   1462.7700     34.8700      0.2900
+    762.6000   1462.7700     34.8700      0.2900
+    762.7000   1462.7700     34.8700      0.2900
+    762.8000   1462.7800     34.8700      0.2900
+    763.0000   1462.7800     34.8700      0.2900
+    763.1000   1462.7800     34.8700      0.2900
+    763.2000   1462.7800     34.8700      0.2900
+    763.4000   1462.7800     34.8700      0.2900
+    763.5000   1462.7900     34.8700      0.2900
+    763.6000   1462.7900     34.8700      0.2900
+    763.8000   1462.7900     34.8700      0.2900
+    763.9000   1462.7900     34.8700      0.2900
+    764.0000   1462.8000     34.8700      0.2900
+    764.1000   1462.7500     34.8700      0.2800
+    764.3000   1462.8100     34.8700      0.2900
+    764.4000   1462.7600     34.8700      0.2800
+    764.5000   1462.8100     34.8700      0.2900
+    764.7000   1462.7700     34.8700      0.2800
+    764.8000   1462.7700     34.8700      0.2800
+    764.9000   1462.8300     34.8800      0.2900
+    765.1000   1462.7700     34.8700      0.2800
+    765.2000   1462.7700     34.8700      0.2800
+    765.3000   1462.8300     34.8800      0.2900
+    765.5000   1462.7800     34.8700      0.2800
+    765.6000   1462.7800     34.8700      0.2800
+    765.7000   1462.7900     34.8800      0.2800
+    765.9000   1462.7900     34.8800      0.2800
+    766.0000   1462.7900     34.8800      0.2800
+    766.1000   1462.8000     34.8800      0.2800
+    766.3000   1462.8000     34.8800      0.2800
+    766.4000   1462.8000     34.8800      0.2800
+    766.5000   1462.8000     34.8800      0.2800
+    766.7000   1462.8000     34.8800      0.2800
+    766.8000   1462.8100     34.8800      0.2800
+    766.9000   1462.8100     34.8800      0.2800
+    767.0000   1462.8100     34.8800      0.2800
+    767.2000   1462.8100     34.8800      0.2800
+    767.3000   1462.8100     34.8800      0.2800
+    767.4000   1462.7700     34.8800      0.2700
+    767.6000   1462.8300     34.8800      0.2800
+    767.7000   1462.7800     34.8800      0.2700
+    767.8000   1462.8300     34.8800      0.2800
+    768.0000   1462.8300     34.8800      0.2800
+    768.1000   1462.8300     34.8800      0.2800
+    768.2000   1462.8300     34.8800      0.2800
+    768.4000   1462.8300     34.8800      0.2800
+    768.5000   1462.8300     34.8800      0.2800
+    768.6000   1462.8400     34.8800      0.2800
+    768.8000   1462.7900     34.8800      0.2700
+    768.9000   1462.8500     34.8800      0.2800
+    769.0000   1462.8000     34.8800      0.2700
+    769.2000   1462.8500     34.8800      0.2800
+    769.3000   1462.8500     34.8800      0.2800
+    769.4000   1462.8000     34.8800      0.2700
+    769.6000   1462.8600     34.8800      0.2800
+    769.7000   1462.7900     34.8600      0.2700
+    769.8000   1462.8100     34.8800      0.2700
+    770.0000   1462.8700     34.8900      0.2800
+    770.1000   1462.8200     34.8800      0.2700
+    770.2000   1462.8700     34.8800      0.2800
+    770.3000   1462.8200     34.8800      0.2700
+    770.5000   1462.8700     34.8800      0.2800
+    770.6000   1462.8700     34.8800      0.2800
+    770.7000   1462.8200     34.8700      0.2700
+    770.9000   1462.8800     34.8800      0.2800
+    771.0000   1462.8300     34.8800      0.2700
+    771.1000   1462.8800     34.8800      0.2800
+    771.3000   1462.8400     34.8800      0.2700
+    771.4000   1462.8100     34.8600      0.2700
+    771.5000   1462.9000     34.8900      0.2800
+    771.7000   1462.8400     34.8800      0.2700
+    771.8000   1462.8900     34.8800      0.2800
+    771.9000   1462.8500     34.8800      0.2700
+    772.1000   1462.8500     34.8800      0.2700
+    772.2000   1462.8600     34.8900      0.2700
+    772.3000   1462.8400     34.8700      0.2700
+    772.5000   1462.8600     34.8900      0.2700
+    772.6000   1462.8700     34.8900      0.2700
+    772.7000   1462.8700     34.8900      0.2700
+    772.9000   1462.8700     34.8900      0.2700
+    773.0000   1462.8700     34.8900      0.2700
+    773.1000   1462.8700     34.8900      0.2700
+    773.2000   1462.8800     34.8900      0.2700
+    773.4000   1462.8800     34.8900      0.2700
+    773.5000   1462.8800     34.8800      0.2700
+    773.6000   1462.8800     34.8800      0.2700
+    773.8000   1462.8800     34.8800      0.2700
+    773.9000   1462.8900     34.8800      0.2700
+    774.0000   1462.8600     34.8700      0.2700
+    774.2000   1462.8900     34.8800      0.2700
+    774.3000   1462.8900     34.8800      0.2700
+    774.4000   1462.8700     34.8600      0.2700
+    774.6000   1462.9000     34.8800      0.2700
+    774.7000   1462.9000     34.8800      0.2700
+    774.8000   1462.9000     34.8800      0.2700
+    775.0000   1462.9000     34.8800      0.2700
+    775.1000   1462.9000     34.8800      0.2700
+    775.2000   1462.9100     34.8800      0.2700
+    775.4000   1462.8800     34.8600      0.2700
+    775.5000   1462.8800     34.8600      0.2700
+    775.6000   1462.8900     34.8600      0.2700
+    775.8000   1462.8900     34.8600      0.2700
+    775.9000   1462.8900     34.8600      0.2700
+    776.0000   1462.8900     34.8600      0.2700
+    776.1000   1462.9000     34.8600      0.2700
+    776.3000   1462.9000     34.8600      0.2700
+    776.4000   1462.9000     34.8600      0.2700
+    776.5000   1462.9000     34.8600      0.2700
+    776.7000   1462.9000     34.8600      0.2700
+    776.8000   1462.9100     34.8600      0.2700
+    776.9000   1462.9100     34.8600      0.2700
+    777.1000   1462.9100     34.8600      0.2700
+    777.2000   1462.9100     34.8600      0.2700
+    777.3000   1462.8700     34.8600      0.2600
+    777.5000   1462.9200     34.8700      0.2700
+    777.6000   1462.8800     34.8700      0.2600
+    777.7000   1462.9300     34.8700      0.2700
+    777.9000   1462.8800     34.8700      0.2600
+    778.0000   1462.8800     34.8700      0.2600
+    778.1000   1462.8900     34.8700      0.2600
+    778.3000   1462.9000     34.8700      0.2600
+    778.4000   1462.9000     34.8700      0.2600
+    778.5000   1462.9000     34.8700      0.2600
+    778.7000   1462.9000     34.8700      0.2600
+    778.8000   1462.9000     34.8700      0.2600
+    778.9000   1462.9100     34.8700      0.2600
+    779.0000   1462.9100     34.8700      0.2600
+    779.2000   1462.9100     34.8700      0.2600
+    779.3000   1462.9100     34.8700      0.2600
+    779.4000   1462.9100     34.8700      0.2600
+    779.6000   1462.9200     34.8700      0.2600
+    779.7000   1462.9200     34.8700      0.2600
+    779.8000   1462.9200     34.8700      0.2600
+    780.0000   1462.9200     34.8700      0.2600
+    780.1000   1462.9300     34.8700      0.2600
+    780.2000   1462.9300     34.8700      0.2600
+    780.4000   1462.9300     34.8700      0.2600
+    780.5000   1462.9300     34.8700      0.2600
+    780.6000   1462.9300     34.8700      0.2600
+    780.8000   1462.9400     34.8700      0.2600
+    780.9000   1462.9400     34.8700      0.2600
+    781.0000   1462.9400     34.8700      0.2600
+    781.2000   1462.9400     34.8700      0.2600
+    781.3000   1462.9400     34.8700      0.2600
+    781.4000   1462.9500     34.8700      0.2600
+    781.6000   1462.9500     34.8700      0.2600
+    781.7000   1462.9500     34.8700      0.2600
+    781.8000   1462.9500     34.8700      0.2600
+    781.9000   1462.9500     34.8700      0.2600
+    782.1000   1462.9600     34.8700      0.2600
+    782.2000   1462.9600     34.8700      0.2600
+    782.3000   1462.9600     34.8700      0.2600
+    782.5000   1462.9600     34.8700      0.2600
+    782.6000   1462.9600     34.8700      0.2600
+    782.7000   1462.9700     34.8700      0.2600
+    782.9000   1462.9700     34.8700      0.2600
+    783.0000   1462.9700     34.8700      0.2600
+    783.1000   1462.9700     34.8700      0.2600
+    783.3000   1462.9300     34.8700      0.2500
+    783.4000   1462.9800     34.8800      0.2600
+    783.5000   1462.9400     34.8800      0.2500
+    783.7000   1462.9400     34.8800      0.2500
+    783.8000   1463.0000     34.8800      0.2600
+    783.9000   1462.9500     34.8800      0.2500
+    784.1000   1462.9500     34.8800      0.2500
+    784.2000   1462.9600     34.8800      0.2500
+    784.3000   1462.9600     34.8800      0.2500
+    784.5000   1462.9600     34.8800      0.2500
+    784.6000   1462.9600     34.8800      0.2500
+    784.7000   1462.9700     34.8800      0.2500
+    784.8000   1462.9700     34.8800      0.2500
+    785.0000   1462.9700     34.8800      0.2500
+    785.1000   1462.9500     34.8600      0.2500
+    785.2000   1462.9700     34.8800      0.2500
+    785.4000   1462.9800     34.8800      0.2500
+    785.5000   1462.9800     34.8800      0.2500
+    785.6000   1462.9800     34.8800      0.2500
+    785.8000   1462.9800     34.8800      0.2500
+    785.9000   1462.9800     34.8800      0.2500
+    786.0000   1462.9900     34.8800      0.2500
+    786.2000   1462.9900     34.8800      0.2500
+    786.3000   1462.9900     34.8800      0.2500
+    786.4000   1462.9700     34.8600      0.2500
+    786.6000   1462.9700     34.8600      0.2500
+    786.7000   1463.0000     34.8800      0.2500
+    786.8000   1463.0000     34.8800      0.2500
+    787.0000   1462.9700     34.8600      0.2500
+    787.1000   1463.0000     34.8800      0.2500
+    787.2000   1462.9800     34.8600      0.2500
+    787.4000   1463.0100     34.8800      0.2500
+    787.5000   1463.0100     34.8800      0.2500
+    787.6000   1462.9800     34.8600      0.2500
+    787.7000   1463.0100     34.8800      0.2500
+    787.9000   1463.0200     34.8800      0.2500
+    788.0000   1463.0200     34.8800      0.2500
+    788.1000   1462.9400     34.8600      0.2400
+    788.3000   1463.0300     34.8900      0.2500
+    788.4000   1462.9600     34.8700      0.2400
+    788.5000   1462.9600     34.8700      0.2400
+    788.7000   1462.9700     34.8700      0.2400
+    788.8000   1463.0000     34.8900      0.2400
+    788.9000   1462.9700     34.8700      0.2400
+    789.1000   1462.9800     34.8700      0.2400
+    789.2000   1462.9800     34.8700      0.2400
+    789.3000   1462.9800     34.8700      0.2400
+    789.5000   1462.9800     34.8700      0.2400
+    789.6000   1462.9800     34.8700      0.2400
+    789.7000   1462.9900     34.8700      0.2400
+    789.9000   1462.9900     34.8700      0.2400
+    790.0000   1462.9900     34.8700      0.2400
+    790.1000   1462.9900     34.8700      0.2400
+    790.3000   1462.9900     34.8700      0.2400
+    790.4000   1463.0000     34.8700      0.2400
+    790.5000   1463.0000     34.8700      0.2400
+    790.6000   1463.0000     34.8700      0.2400
+    790.8000   1463.0000     34.8700      0.2400
+    790.9000   1463.0000     34.8700      0.2400
+    791.0000   1463.0100     34.8700      0.2400
+    791.2000   1463.0100     34.8700      0.2400
+    791.3000   1463.0100     34.8700      0.2400
+    791.4000   1463.0100     34.8700      0.2400
+    791.6000   1463.0100     34.8700      0.2400
+    791.7000   1463.0200     34.8700      0.2400
+    791.8000   1463.0200     34.8700      0.2400
+    792.0000   1462.9700     34.8700      0.2300
+    792.1000   1462.9800     34.8800      0.2300
+    792.2000   1462.9900     34.8800      0.2300
+    792.4000   1462.9900     34.8800      0.2300
+    792.5000   1463.0000     34.8800      0.2300
+    792.6000   1463.0000     34.8800      0.2300
+    792.8000   1463.0000     34.8800      0.2300
+    792.9000   1463.0000     34.8800      0.2300
+    793.0000   1463.0100     34.8800      0.2300
+    793.1000   1463.0100     34.8800      0.2300
+    793.3000   1463.0100     34.8800      0.2300
+    793.4000   1463.0100     34.8800      0.2300
+    793.5000   1463.0100     34.8800      0.2300
+    793.7000   1463.0200     34.8800      0.2300
+    793.8000   1463.0200     34.8800      0.2300
+    793.9000   1463.0200     34.8800      0.2300
+    794.1000   1463.0200     34.8800      0.2300
+    794.2000   1463.0200     34.8800      0.2300
+    794.3000   1463.0300     34.8800      0.2300
+    794.5000   1463.0300     34.8800      0.2300
+    794.6000   1463.0300     34.8800      0.2300
+    794.7000   1463.0300     34.8800      0.2300
+    794.9000   1463.0300     34.8800      0.2300
+    795.0000   1463.0400     34.8800      0.2300
+    795.1000   1463.0400     34.8800      0.2300
+    795.3000   1463.0400     34.8800      0.2300
+    795.4000   1463.0400     34.8800      0.2300
+    795.5000   1463.0400     34.8800      0.2300
+    795.7000   1463.0500     34.8800      0.2300
+    795.8000   1463.0200     34.8600      0.2300
+    795.9000   1463.0500     34.8800      0.2300
+    796.0000   1463.0500     34.8800      0.2300
+    796.2000   1463.0500     34.8800      0.2300
+    796.3000   1463.0600     34.8800      0.2300
+    796.4000   1463.0600     34.8800      0.2300
+    796.6000   1463.0300     34.8600      0.2300
+    796.7000   1463.0600     34.8800      0.2300
+    796.8000   1463.0700     34.8800      0.2300
+    797.0000   1463.0700     34.8800      0.2300
+    797.1000   1463.0700     34.8800      0.2300
+    797.2000   1463.0500     34.8600      0.2300
+    797.4000   1463.0700     34.8800      0.2300
+    797.5000   1463.0800     34.8800      0.2300
+    797.6000   1463.0800     34.8800      0.2300
+    797.8000   1463.0300     34.8800      0.2200
+    797.9000   1463.0900     34.8900      0.2300
+    798.0000   1463.0400     34.8900      0.2200
+    798.2000   1463.0900     34.8900      0.2300
+    798.3000   1463.0700     34.8700      0.2300
+    798.4000   1463.0200     34.8600      0.2200
+    798.5000   1463.1000     34.8800      0.2300
+    798.7000   1463.0500     34.8800      0.2200
+    798.8000   1463.1000     34.8800      0.2300
+    798.9000   1463.1100     34.8800      0.2300
+    799.1000   1463.0300     34.8600      0.2200
+    799.2000   1463.0400     34.8600      0.2200
+    799.3000   1463.0700     34.8900      0.2200
+    799.5000   1463.0700     34.8900      0.2200
+    799.6000   1463.0800     34.8900      0.2200
+    799.7000   1463.0500     34.8700      0.2200
+    799.9000   1463.0500     34.8700      0.2200
+    800.0000   1463.0800     34.8900      0.2200
+    800.1000   1463.0600     34.8700      0.2200
+    800.3000   1463.0600     34.8700      0.2200
+    800.4000   1463.0600     34.8700      0.2200
+    800.5000   1463.0900     34.8900      0.2200
+    800.7000   1463.0700     34.8700      0.2200
+    800.8000   1463.0700     34.8700      0.2200
+    800.9000   1463.0700     34.8700      0.2200
+    801.0000   1463.0700     34.8700      0.2200
+    801.2000   1463.0800     34.8700      0.2200
+    801.3000   1463.0800     34.8700      0.2200
+    801.4000   1463.0800     34.8700      0.2200
+    801.6000   1463.0800     34.8700      0.2200
+    801.7000   1463.0800     34.8700      0.2200
+    801.8000   1463.0900     34.8700      0.2200
+    802.0000   1463.1100     34.8900      0.2200
+    802.1000   1463.0900     34.8700      0.2200
+    802.2000   1463.0900     34.8700      0.2200
+    802.4000   1463.0900     34.8700      0.2200
+    802.5000   1463.1000     34.8700      0.2200
+    802.6000   1463.1000     34.8700      0.2200
+    802.8000   1463.1300     34.8900      0.2200
+    802.9000   1463.1000     34.8700      0.2200
+    803.0000   1463.1000     34.8700      0.2200
+    803.2000   1463.1100     34.8700      0.2200
+    803.3000   1463.1100     34.8700      0.2200
+    803.4000   1463.1100     34.8700      0.2200
+    803.6000   1463.1100     34.8700      0.2200
+    803.7000   1463.1400     34.8900      0.2200
+    803.8000   1463.1200     34.8700      0.2200
+    803.9000   1463.1200     34.8700      0.2200
+    804.1000   1463.1200     34.8700      0.2200
+    804.2000   1463.1200     34.8700      0.2200
+    804.3000   1463.1200     34.8700      0.2200
+    804.5000   1463.1500     34.8900      0.2200
+    804.6000   1463.1300     34.8700      0.2200
+    804.7000   1463.1600     34.8900      0.2200
+    804.9000   1463.1300     34.8700      0.2200
+    805.0000   1463.1400     34.8700      0.2200
+    805.1000   1463.1400     34.8700      0.2200
+    805.3000   1463.0900     34.8700      0.2100
+    805.4000   1463.1500     34.8700      0.2200
+    805.5000   1463.1500     34.8700      0.2200
+    805.7000   1463.1000     34.8700      0.2100
+    805.8000   1463.1600     34.8700      0.2200
+    805.9000   1463.1100     34.8700      0.2100
+    806.1000   1463.1600     34.8700      0.2200
+    806.2000   1463.1600     34.8700      0.2200
+    806.3000   1463.1100     34.8700      0.2100
+    806.4000   1463.1200     34.8700      0.2100
+    806.6000   1463.1300     34.8800      0.2100
+    806.7000   1463.1300     34.8800      0.2100
+    806.8000   1463.1300     34.8800      0.2100
+    807.0000   1463.1300     34.8800      0.2100
+    807.1000   1463.1400     34.8800      0.2100
+    807.2000   1463.1400     34.8800      0.2100
+    807.4000   1463.1400     34.8800      0.2100
+    807.5000   1463.1400     34.8800      0.2100
+    807.6000   1463.1400     34.8800      0.2100
+    807.8000   1463.1500     34.8800      0.2100
+    807.9000   1463.1500     34.8800      0.2100
+    808.0000   1463.1500     34.8800      0.2100
+    808.2000   1463.1500     34.8800      0.2100
+    808.3000   1463.1500     34.8800      0.2100
+    808.4000   1463.1600     34.8800      0.2100
+    808.6000   1463.1100     34.8800      0.2000
+    808.7000   1463.1700     34.8800      0.2100
+    808.8000   1463.1700     34.8800      0.2100
+    808.9000   1463.1200     34.8800      0.2000
+    809.1000   1463.1800     34.8800      0.2100
+    809.2000   1463.1300     34.8800      0.2000
+    809.3000   1463.1300     34.8800      0.2000
+    809.5000   1463.1400     34.8900      0.2000
+    809.6000   1463.1400     34.8900      0.2000
+    809.7000   1463.1500     34.8900      0.2000
+    809.9000   1463.1500     34.8900      0.2000
+    810.0000   1463.1200     34.8700      0.2000
+    810.1000   1463.1500     34.8900      0.2000
+    810.3000   1463.1300     34.8700      0.2000
+    810.4000   1463.1600     34.8900      0.2000
+    810.5000   1463.1600     34.8900      0.2000
+    810.7000   1463.1300     34.8700      0.2000
+    810.8000   1463.1600     34.8900      0.2000
+    810.9000   1463.1600     34.8900      0.2000
+    811.1000   1463.1700     34.8900      0.2000
+    811.2000   1463.1700     34.8900      0.2000
+    811.3000   1463.1400     34.8700      0.2000
+    811.4000   1463.1700     34.8900      0.2000
+    811.6000   1463.1700     34.8900      0.2000
+    811.7000   1463.1500     34.8700      0.2000
+    811.8000   1463.1800     34.8900      0.2000
+    812.0000   1463.1800     34.8900      0.2000
+    812.1000   1463.1800     34.8900      0.2000
+    812.2000   1463.1600     34.8700      0.2000
+    812.4000   1463.1600     34.8700      0.2000
+    812.5000   1463.1600     34.8700      0.2000
+    812.6000   1463.1600     34.8700      0.2000
+    812.8000   1463.1700     34.8700      0.2000
+    812.9000   1463.1700     34.8700      0.2000
+    813.0000   1463.1700     34.8700      0.2000
+    813.2000   1463.1700     34.8700      0.2000
+    813.3000   1463.1700     34.8700      0.2000
+    813.4000   1463.1800     34.8700      0.2000
+    813.6000   1463.1300     34.8700      0.1900
+    813.7000   1463.1900     34.8700      0.2000
+    813.8000   1463.1400     34.8700      0.1900
+    813.9000   1463.1400     34.8700      0.1900
+    814.1000   1463.2000     34.8800      0.2000
+    814.2000   1463.1500     34.8700      0.1900
+    814.3000   1463.2000     34.8700      0.2000
+    814.5000   1463.1500     34.8700      0.1900
+    814.6000   1463.1600     34.8700      0.1900
+    814.7000   1463.1700     34.8800      0.1900
+    814.9000   1463.1700     34.8800      0.1900
+    815.0000   1463.1700     34.8800      0.1900
+    815.1000   1463.1700     34.8800      0.1900
+    815.3000   1463.1700     34.8800      0.1900
+    815.4000   1463.1800     34.8800      0.1900
+    815.5000   1463.1800     34.8800      0.1900
+    815.7000   1463.1800     34.8800      0.1900
+    815.8000   1463.1800     34.8800      0.1900
+    815.9000   1463.1800     34.8800      0.1900
+    816.1000   1463.1900     34.8800      0.1900
+    816.2000   1463.1900     34.8800      0.1900
+    816.3000   1463.1900     34.8800      0.1900
+    816.4000   1463.1900     34.8800      0.1900
+    816.6000   1463.1900     34.8800      0.1900
+    816.7000   1463.2000     34.8800      0.1900
+    816.8000   1463.2000     34.8800      0.1900
+    817.0000   1463.2000     34.8800      0.1900
+    817.1000   1463.2000     34.8800      0.1900
+    817.2000   1463.2000     34.8800      0.1900
+    817.4000   1463.2100     34.8800      0.1900
+    817.5000   1463.2100     34.8800      0.1900
+    817.6000   1463.2100     34.8800      0.1900
+    817.8000   1463.2100     34.8800      0.1900
+    817.9000   1463.2100     34.8800      0.1900
+    818.0000   1463.2200     34.8800      0.1900
+    818.2000   1463.2200     34.8800      0.1900
+    818.3000   1463.2200     34.8800      0.1900
+    818.4000   1463.2200     34.8800      0.1900
+    818.6000   1463.2300     34.8800      0.1900
+    818.7000   1463.2300     34.8800      0.1900
+    818.8000   1463.2300     34.8800      0.1900
+    818.9000   1463.2300     34.8800      0.1900
+    819.1000   1463.2300     34.8800      0.1900
+    819.2000   1463.2400     34.8800      0.1900
+    819.3000   1463.2400     34.8800      0.1900
+    819.5000   1463.1900     34.8800      0.1700
+    819.6000   1463.2500     34.8800      0.1900
+    819.7000   1463.2000     34.8800      0.1700
+    819.9000   1463.2500     34.8800      0.1900
+    820.0000   1463.2600     34.8800      0.1900
+    820.1000   1463.2000     34.8700      0.1700
+    820.3000   1463.2600     34.8800      0.1900
+    820.4000   1463.2600     34.8800      0.1900
+    820.5000   1463.2600     34.8700      0.1900
+    820.7000   1463.2600     34.8700      0.1900
+    820.8000   1463.2100     34.8700      0.1700
+    820.9000   1463.2200     34.8800      0.1700
+    821.0000   1463.2300     34.8900      0.1700
+    821.2000   1463.2800     34.8900      0.1900
+    821.3000   1463.2800     34.8800      0.1900
+    821.4000   1463.2200     34.8700      0.1700
+    821.6000   1463.2800     34.8800      0.1900
+    821.7000   1463.2300     34.8800      0.1700
+    821.8000   1463.2800     34.8800      0.1900
+    822.0000   1463.2900     34.8800      0.1900
+    822.1000   1463.2300     34.8700      0.1700
+    822.2000   1463.2400     34.8800      0.1700
+    822.4000   1463.2500     34.8900      0.1700
+    822.5000   1463.2600     34.8900      0.1700
+    822.6000   1463.3100     34.8900      0.1900
+    822.8000   1463.2500     34.8800      0.1700
+    822.9000   1463.3000     34.8800      0.1900
+    823.0000   1463.2600     34.8800      0.1700
+    823.2000   1463.2600     34.8800      0.1700
+    823.3000   1463.2700     34.8800      0.1700
+    823.4000   1463.2700     34.8800      0.1700
+    823.5000   1463.2700     34.8800      0.1700
+    823.7000   1463.2700     34.8800      0.1700
+    823.8000   1463.2800     34.8800      0.1700
+    823.9000   1463.2800     34.8800      0.1700
+    824.1000   1463.2800     34.8800      0.1700
+    824.2000   1463.2800     34.8800      0.1700
+    824.3000   1463.2800     34.8800      0.1700
+    824.5000   1463.2900     34.8800      0.1700
+    824.6000   1463.2900     34.8800      0.1700
+    824.7000   1463.2900     34.8800      0.1700
+    824.9000   1463.2900     34.8800      0.1700
+    825.0000   1463.2900     34.8800      0.1700
+    825.1000   1463.3000     34.8800      0.1700
+    825.3000   1463.3000     34.8800      0.1700
+    825.4000   1463.3000     34.8800      0.1700
+    825.5000   1463.3000     34.8800      0.1700
+    825.7000   1463.3000     34.8800      0.1700
+    825.8000   1463.3100     34.8800      0.1700
+    825.9000   1463.3100     34.8800      0.1700
+    826.0000   1463.3100     34.8800      0.1700
+    826.2000   1463.3100     34.8800      0.1700
+    826.3000   1463.3100     34.8800      0.1700
+    826.4000   1463.3200     34.8800      0.1700
+    826.6000   1463.3200     34.8800      0.1700
+    826.7000   1463.3200     34.8800      0.1700
+    826.8000   1463.3200     34.8800      0.1700
+    827.0000   1463.3300     34.8800      0.1700
+    827.1000   1463.3300     34.8800      0.1700
+    827.2000   1463.3300     34.8800      0.1700
+    827.4000   1463.3300     34.8800      0.1700
+    827.5000   1463.3300     34.8800      0.1700
+    827.6000   1463.3400     34.8800      0.1700
+    827.8000   1463.3400     34.8800      0.1700
+    827.9000   1463.3400     34.8800      0.1700
+    828.0000   1463.3400     34.8800      0.1700
+    828.1000   1463.3400     34.8800      0.1700
+    828.3000   1463.3500     34.8800      0.1700
+    828.4000   1463.3500     34.8800      0.1700
+    828.5000   1463.3500     34.8800      0.1700
+    828.7000   1463.3300     34.8600      0.1700
+    828.8000   1463.3500     34.8800      0.1700
+    828.9000   1463.3600     34.8800      0.1700
+    829.1000   1463.3600     34.8800      0.1700
+    829.2000   1463.3600     34.8800      0.1700
+    829.3000   1463.2900     34.8600      0.1600
+    829.5000   1463.3200     34.8900      0.1600
+    829.6000   1463.3100     34.8700      0.1600
+    829.7000   1463.3100     34.8700      0.1600
+    829.9000   1463.3100     34.8700      0.1600
+    830.0000   1463.3100     34.8700      0.1600
+    830.1000   1463.3200     34.8700      0.1600
+    830.3000   1463.3200     34.8700      0.1600
+    830.4000   1463.3200     34.8700      0.1600
+    830.5000   1463.3200     34.8700      0.1600
+    830.6000   1463.3200     34.8700      0.1600
+    830.8000   1463.3300     34.8700      0.1600
+    830.9000   1463.3300     34.8700      0.1600
+    831.0000   1463.3300     34.8700      0.1600
+    831.2000   1463.3300     34.8700      0.1600
+    831.3000   1463.3300     34.8700      0.1600
+    831.4000   1463.3400     34.8700      0.1600
+    831.6000   1463.3400     34.8700      0.1600
+    831.7000   1463.3400     34.8700      0.1600
+    831.8000   1463.3400     34.8700      0.1600
+    832.0000   1463.3500     34.8700      0.1600
+    832.1000   1463.3500     34.8700      0.1600
+    832.2000   1463.3500     34.8700      0.1600
+    832.4000   1463.3500     34.8700      0.1600
+    832.5000   1463.3500     34.8700      0.1600
+    832.6000   1463.3600     34.8700      0.1600
+    832.7000   1463.3600     34.8700      0.1600
+    832.9000   1463.3600     34.8700      0.1600
+    833.0000   1463.3900     34.8900      0.1600
+    833.1000   1463.3600     34.8700      0.1600
+    833.3000   1463.3700     34.8700      0.1600
+    833.4000   1463.3700     34.8700      0.1600
+    833.5000   1463.3700     34.8700      0.1600
+    833.7000   1463.3700     34.8700      0.1600
+    833.8000   1463.3700     34.8700      0.1600
+    833.9000   1463.3800     34.8700      0.1600
+    834.1000   1463.3800     34.8700      0.1600
+    834.2000   1463.3800     34.8700      0.1600
+    834.3000   1463.3800     34.8700      0.1600
+    834.5000   1463.3800     34.8700      0.1600
+    834.6000   1463.3900     34.8700      0.1600
+    834.7000   1463.3900     34.8700      0.1600
+    834.9000   1463.3900     34.8700      0.1600
+    835.0000   1463.3900     34.8700      0.1600
+    835.1000   1463.3900     34.8700      0.1600
+    835.2000   1463.4000     34.8700      0.1600
+    835.4000   1463.4000     34.8700      0.1600
+    835.5000   1463.4000     34.8700      0.1600
+    835.6000   1463.4000     34.8700      0.1600
+    835.8000   1463.4100     34.8700      0.1600
+    835.9000   1463.4100     34.8700      0.1600
+    836.0000   1463.4100     34.8700      0.1600
+    836.2000   1463.4100     34.8700      0.1600
+    836.3000   1463.4100     34.8700      0.1600
+    836.4000   1463.4400     34.8900      0.1600
+    836.6000   1463.4200     34.8700      0.1600
+    836.7000   1463.4200     34.8700      0.1600
+    836.8000   1463.4200     34.8700      0.1600
+    837.0000   1463.4200     34.8700      0.1600
+    837.1000   1463.4300     34.8700      0.1600
+    837.2000   1463.3800     34.8700      0.1500
+    837.3000   1463.3900     34.8700      0.1500
+    837.5000   1463.4000     34.8800      0.1500
+    837.6000   1463.4000     34.8800      0.1500
+    837.7000   1463.4000     34.8800      0.1500
+    837.9000   1463.4100     34.8800      0.1500
+    838.0000   1463.4100     34.8800      0.1500
+    838.1000   1463.4100     34.8800      0.1500
+    838.3000   1463.4100     34.8800      0.1500
+    838.4000   1463.4100     34.8800      0.1500
+    838.5000   1463.4200     34.8800      0.1500
+    838.7000   1463.4200     34.8800      0.1500
+    838.8000   1463.4200     34.8800      0.1500
+    838.9000   1463.4200     34.8800      0.1500
+    839.1000   1463.4200     34.8800      0.1500
+    839.2000   1463.4300     34.8800      0.1500
+    839.3000   1463.4300     34.8800      0.1500
+    839.5000   1463.4300     34.8800      0.1500
+    839.6000   1463.4300     34.8800      0.1500
+    839.7000   1463.4300     34.8800      0.1500
+    839.8000   1463.4400     34.8800      0.1500
+    840.0000   1463.4400     34.8800      0.1500
+    840.1000   1463.4400     34.8800      0.1500
+    840.2000   1463.4400     34.8800      0.1500
+    840.4000   1463.4500     34.8800      0.1500
+    840.5000   1463.4500     34.8800      0.1500
+    840.6000   1463.4500     34.8800      0.1500
+    840.8000   1463.4500     34.8800      0.1500
+    840.9000   1463.4500     34.8800      0.1500
+    841.0000   1463.4600     34.8800      0.1500
+    841.2000   1463.4100     34.8800      0.1400
+    841.3000   1463.4700     34.8800      0.1500
+    841.4000   1463.4200     34.8800      0.1400
+    841.6000   1463.4700     34.8800      0.1500
+    841.7000   1463.4300     34.8800      0.1400
+    841.8000   1463.4300     34.8800      0.1400
+    841.9000   1463.4900     34.8900      0.1500
+    842.1000   1463.4300     34.8800      0.1400
+    842.2000   1463.4300     34.8800      0.1400
+    842.3000   1463.4400     34.8900      0.1400
+    842.5000   1463.4500     34.8900      0.1400
+    842.6000   1463.4200     34.8700      0.1400
+    842.7000   1463.4500     34.8900      0.1400
+    842.9000   1463.4500     34.8900      0.1400
+    843.0000   1463.4300     34.8700      0.1400
+    843.1000   1463.4600     34.8900      0.1400
+    843.3000   1463.4300     34.8700      0.1400
+    843.4000   1463.4600     34.8900      0.1400
+    843.5000   1463.4600     34.8900      0.1400
+    843.7000   1463.4600     34.8900      0.1400
+    843.8000   1463.4700     34.8900      0.1400
+    843.9000   1463.4700     34.8900      0.1400
+    844.0000   1463.4700     34.8900      0.1400
+    844.2000   1463.4700     34.8900      0.1400
+    844.3000   1463.4700     34.8900      0.1400
+    844.4000   1463.4500     34.8700      0.1400
+    844.6000   1463.4800     34.8900      0.1400
+    844.7000   1463.4800     34.8900      0.1400
+    844.8000   1463.4800     34.8900      0.1400
+    845.0000   1463.4900     34.8900      0.1400
+    845.1000   1463.4600     34.8700      0.1400
+    845.2000   1463.4900     34.8900      0.1400
+    845.4000   1463.4700     34.8700      0.1400
+    845.5000   1463.4700     34.8700      0.1400
+    845.6000   1463.4700     34.8700      0.1400
+    845.8000   1463.4700     34.8700      0.1400
+    845.9000   1463.5000     34.8900      0.1400
+    846.0000   1463.4800     34.8700      0.1400
+    846.1000   1463.5000     34.8900      0.1400
+    846.3000   1463.5100     34.8900      0.1400
+    846.4000   1463.5100     34.8900      0.1400
+    846.5000   1463.4800     34.8700      0.1400
+    846.7000   1463.5100     34.8900      0.1400
+    846.8000   1463.5100     34.8900      0.1400
+    846.9000   1463.5200     34.8900      0.1400
+    847.1000   1463.5200     34.8900      0.1400
+    847.2000   1463.5200     34.8900      0.1400
+    847.3000   1463.5200     34.8900      0.1400
+    847.5000   1463.5000     34.8700      0.1400
+    847.6000   1463.5300     34.8900      0.1400
+    847.7000   1463.5000     34.8700      0.1400
+    847.9000   1463.5300     34.8900      0.1400
+    848.0000   1463.5100     34.8700      0.1400
+    848.1000   1463.5100     34.8700      0.1400
+    848.2000   1463.5100     34.8700      0.1400
+    848.4000   1463.5100     34.8700      0.1400
+    848.5000   1463.5100     34.8700      0.1400
+    848.6000   1463.5200     34.8700      0.1400
+    848.8000   1463.5500     34.8900      0.1400
+    848.9000   1463.5500     34.8900      0.1400
+    849.0000   1463.5200     34.8700      0.1400
+    849.2000   1463.5500     34.8900      0.1400
+    849.3000   1463.5500     34.8900      0.1400
+    849.4000   1463.5600     34.8900      0.1400
+    849.6000   1463.5600     34.8900      0.1400
+    849.7000   1463.5300     34.8700      0.1400
+    849.8000   1463.5600     34.8900      0.1400
+    850.0000   1463.5600     34.8900      0.1400
+    850.1000   1463.5400     34.8700      0.1400
+    850.2000   1463.5700     34.8900      0.1400
+    850.4000   1463.5400     34.8700      0.1400
+    850.5000   1463.5700     34.8900      0.1400
+    850.6000   1463.5700     34.8900      0.1400
+    850.7000   1463.5800     34.8900      0.1400
+    850.9000   1463.5500     34.8700      0.1400
+    851.0000   1463.5800     34.8800      0.1400
+    851.1000   1463.5800     34.8800      0.1400
+    851.3000   1463.5100     34.8700      0.1300
+    851.4000   1463.5700     34.8700      0.1400
+    851.5000   1463.6000     34.8900      0.1400
+    851.7000   1463.5200     34.8600      0.1300
+    851.8000   1463.5700     34.8700      0.1400
+    851.9000   1463.5500     34.8900      0.1300
+    852.1000   1463.5800     34.8700      0.1400
+    852.2000   1463.5800     34.8700      0.1400
+    852.3000   1463.5300     34.8600      0.1300
+    852.5000   1463.5800     34.8700      0.1400
+    852.6000   1463.6100     34.8900      0.1400
+    852.7000   1463.5800     34.8600      0.1400
+    852.8000   1463.5800     34.8600      0.1400
+    853.0000   1463.5800     34.8600      0.1400
+    853.1000   1463.6100     34.8800      0.1400
+    853.2000   1463.5700     34.8800      0.1300
+    853.4000   1463.6300     34.8900      0.1400
+    853.5000   1463.5800     34.8900      0.1300
+    853.6000   1463.5500     34.8700      0.1300
+    853.8000   1463.6100     34.8800      0.1400
+    853.9000   1463.5600     34.8700      0.1300
+    854.0000   1463.5600     34.8700      0.1300
+    854.2000   1463.6200     34.8800      0.1400
+    854.3000   1463.5700     34.8700      0.1300
+    854.4000   1463.5700     34.8700      0.1300
+    854.6000   1463.6000     34.8900      0.1300
+    854.7000   1463.5800     34.8800      0.1300
+    854.8000   1463.6100     34.8900      0.1300
+    854.9000   1463.5800     34.8700      0.1300
+    855.1000   1463.5900     34.8700      0.1300
+    855.2000   1463.5900     34.8700      0.1300
+    855.3000   1463.5900     34.8700      0.1300
+    855.5000   1463.5900     34.8700      0.1300
+    855.6000   1463.5900     34.8700      0.1300
+    855.7000   1463.6000     34.8700      0.1300
+    855.9000   1463.6000     34.8700      0.1300
+    856.0000   1463.6000     34.8700      0.1300
+    856.1000   1463.6000     34.8700      0.1300
+    856.3000   1463.6000     34.8700      0.1300
+    856.4000   1463.6100     34.8700      0.1300
+    856.5000   1463.6100     34.8700      0.1300
+    856.7000   1463.6100     34.8700      0.1300
+    856.8000   1463.6100     34.8700      0.1300
+    856.9000   1463.6100     34.8700      0.1300
+    857.0000   1463.6200     34.8700      0.1300
+    857.2000   1463.6200     34.8700      0.1300
+    857.3000   1463.6200     34.8700      0.1300
+    857.4000   1463.6200     34.8700      0.1300
+    857.6000   1463.6200     34.8700      0.1300
+    857.7000   1463.6300     34.8700      0.1300
+    857.8000   1463.6300     34.8700      0.1300
+    858.0000   1463.6300     34.8700      0.1300
+    858.1000   1463.6300     34.8700      0.1300
+    858.2000   1463.6400     34.8700      0.1300
+    858.4000   1463.6400     34.8700      0.1300
+    858.5000   1463.6400     34.8700      0.1300
+    858.6000   1463.6400     34.8700      0.1300
+    858.8000   1463.6400     34.8700      0.1300
+    858.9000   1463.6500     34.8700      0.1300
+    859.0000   1463.6500     34.8700      0.1300
+    859.1000   1463.6000     34.8700      0.1200
+    859.3000   1463.6100     34.8800      0.1200
+    859.4000   1463.6200     34.8800      0.1200
+    859.5000   1463.6700     34.8800      0.1300
+    859.7000   1463.6700     34.8800      0.1300
+    859.8000   1463.6100     34.8700      0.1200
+    859.9000   1463.6200     34.8800      0.1200
+    860.1000   1463.6300     34.8800      0.1200
+    860.2000   1463.6300     34.8800      0.1200
+    860.3000   1463.6400     34.8800      0.1200
+    860.5000   1463.6400     34.8800      0.1200
+    860.6000   1463.6400     34.8800      0.1200
+    860.7000   1463.6400     34.8800      0.1200
+    860.8000   1463.6400     34.8800      0.1200
+    861.0000   1463.6500     34.8800      0.1200
+    861.1000   1463.6500     34.8800      0.1200
+    861.2000   1463.6500     34.8800      0.1200
+    861.4000   1463.6500     34.8800      0.1200
+    861.5000   1463.6500     34.8800      0.1200
+    861.6000   1463.6600     34.8800      0.1200
+    861.8000   1463.6600     34.8800      0.1200
+    861.9000   1463.6600     34.8800      0.1200
+    862.0000   1463.6400     34.8600      0.1200
+    862.2000   1463.6600     34.8800      0.1200
+    862.3000   1463.6700     34.8800      0.1200
+    862.4000   1463.6700     34.8800      0.1200
+    862.6000   1463.6400     34.8600      0.1200
+    862.7000   1463.6500     34.8600      0.1200
+    862.8000   1463.6800     34.8800      0.1200
+    862.9000   1463.6500     34.8600      0.1200
+    863.1000   1463.6500     34.8600      0.1200
+    863.2000   1463.6800     34.8800      0.1200
+    863.3000   1463.6800     34.8800      0.1200
+    863.5000   1463.6100     34.8600      0.1100
+    863.6000   1463.6700     34.8700      0.1200
+    863.7000   1463.6500     34.8900      0.1100
+    863.9000   1463.7000     34.8900      0.1200
+    864.0000   1463.7000     34.8900      0.1200
+    864.1000   1463.6200     34.8600      0.1100
+    864.3000   1463.6300     34.8700      0.1100
+    864.4000   1463.6700     34.8900      0.1100
+    864.5000   1463.6400     34.8700      0.1100
+    864.7000   1463.6700     34.8900      0.1100
+    864.8000   1463.6500     34.8700      0.1100
+    864.9000   1463.6500     34.8700      0.1100
+    865.0000   1463.6500     34.8700      0.1100
+    865.2000   1463.6800     34.8900      0.1100
+    865.3000   1463.6600     34.8700      0.1100
+    865.4000   1463.6600     34.8700      0.1100
+    865.6000   1463.6600     34.8700      0.1100
+    865.7000   1463.6600     34.8700      0.1100
+    865.8000   1463.6600     34.8700      0.1100
+    866.0000   1463.6900     34.8900      0.1100
+    866.1000   1463.6900     34.8900      0.1100
+    866.2000   1463.7000     34.8900      0.1100
+    866.4000   1463.7000     34.8900      0.1100
+    866.5000   1463.6700     34.8700      0.1100
+    866.6000   1463.6800     34.8700      0.1100
+    866.8000   1463.7000     34.8900      0.1100
+    866.9000   1463.6800     34.8700      0.1100
+    867.0000   1463.6800     34.8700      0.1100
+    867.1000   1463.6800     34.8700      0.1100
+    867.3000   1463.7100     34.8900      0.1100
+    867.4000   1463.6900     34.8700      0.1100
+    867.5000   1463.6900     34.8700      0.1100
+    867.7000   1463.6900     34.8700      0.1100
+    867.8000   1463.6900     34.8700      0.1100
+    867.9000   1463.7000     34.8700      0.1100
+    868.1000   1463.7000     34.8700      0.1100
+    868.2000   1463.7300     34.8900      0.1100
+    868.3000   1463.7000     34.8700      0.1100
+    868.5000   1463.7300     34.8900      0.1100
+    868.6000   1463.7100     34.8700      0.1100
+    868.7000   1463.7100     34.8700      0.1100
+    868.9000   1463.7100     34.8700      0.1100
+    869.0000   1463.7100     34.8700      0.1100
+    869.1000   1463.7200     34.8700      0.1100
+    869.2000   1463.7200     34.8700      0.1100
+    869.4000   1463.7200     34.8700      0.1100
+    869.5000   1463.7200     34.8700      0.1100
+    869.6000   1463.7200     34.8700      0.1100
+    869.8000   1463.7300     34.8700      0.1100
+    869.9000   1463.7300     34.8700      0.1100
+    870.0000   1463.6800     34.8700      0.1000
+    870.2000   1463.7400     34.8800      0.1100
+    870.3000   1463.6900     34.8800      0.1000
+    870.4000   1463.7400     34.8800      0.1100
+    870.6000   1463.7500     34.8800      0.1100
+    870.7000   1463.7400     34.8700      0.1100
+    870.8000   1463.7400     34.8700      0.1100
+    870.9000   1463.7000     34.8700      0.1000
+    871.1000   1463.7100     34.8800      0.1000
+    871.2000   1463.7200     34.8800      0.1000
+    871.3000   1463.7200     34.8800      0.1000
+    871.5000   1463.7200     34.8800      0.1000
+    871.6000   1463.7200     34.8800      0.1000
+    871.7000   1463.7200     34.8800      0.1000
+    871.9000   1463.7300     34.8800      0.1000
+    872.0000   1463.7300     34.8800      0.1000
+    872.1000   1463.7300     34.8800      0.1000
+    872.3000   1463.7300     34.8800      0.1000
+    872.4000   1463.7300     34.8800      0.1000
+    872.5000   1463.7400     34.8800      0.1000
+    872.7000   1463.7400     34.8800      0.1000
+    872.8000   1463.7400     34.8800      0.1000
+    872.9000   1463.7400     34.8800      0.1000
+    873.0000   1463.7500     34.8800      0.1000
+    873.2000   1463.7500     34.8800      0.1000
+    873.3000   1463.7500     34.8800      0.1000
+    873.4000   1463.7500     34.8800      0.1000
+    873.6000   1463.7500     34.8800      0.1000
+    873.7000   1463.7600     34.8800      0.1000
+    873.8000   1463.7600     34.8800      0.1000
+    874.0000   1463.7600     34.8800      0.1000
+    874.1000   1463.7600     34.8800      0.1000
+    874.2000   1463.7600     34.8800      0.1000
+    874.4000   1463.7700     34.8800      0.1000
+    874.5000   1463.7700     34.8800      0.1000
+    874.6000   1463.7700     34.8800      0.1000
+    874.8000   1463.7700     34.8800      0.1000
+    874.9000   1463.7700     34.8800      0.1000
+    875.0000   1463.7800     34.8800      0.1000
+    875.1000   1463.7800     34.8800      0.1000
+    875.3000   1463.7800     34.8800      0.1000
+    875.4000   1463.7800     34.8800      0.1000
+    875.5000   1463.7800     34.8800      0.1000
+    875.7000   1463.7900     34.8800      0.1000
+    875.8000   1463.7900     34.8800      0.1000
+    875.9000   1463.7900     34.8800      0.1000
+    876.1000   1463.7900     34.8800      0.1000
+    876.2000   1463.7900     34.8800      0.1000
+    876.3000   1463.8000     34.8800      0.1000
+    876.5000   1463.8000     34.8800      0.1000
+    876.6000   1463.8000     34.8800      0.1000
+    876.7000   1463.8000     34.8800      0.1000
+    876.8000   1463.8100     34.8800      0.1000
+    877.0000   1463.8100     34.8800      0.1000
+    877.1000   1463.8100     34.8800      0.1000
+    877.2000   1463.8100     34.8800      0.1000
+    877.4000   1463.8100     34.8800      0.1000
+    877.5000   1463.8200     34.8800      0.1000
+    877.6000   1463.8200     34.8800      0.1000
+    877.8000   1463.8200     34.8800      0.1000
+    877.9000   1463.8200     34.8800      0.1000
+    878.0000   1463.8200     34.8800      0.1000
+    878.2000   1463.8300     34.8800      0.1000
+    878.3000   1463.8300     34.8800      0.1000
+    878.4000   1463.8300     34.8800      0.1000
+    878.6000   1463.8300     34.8800      0.1000
+    878.7000   1463.8300     34.8800      0.1000
+    878.8000   1463.8400     34.8800      0.1000
+    878.9000   1463.8400     34.8800      0.1000
+    879.1000   1463.8400     34.8800      0.1000
+    879.2000   1463.8400     34.8800      0.1000
+    879.3000   1463.8400     34.8800      0.1000
+    879.5000   1463.8500     34.8800      0.1000
+    879.6000   1463.8500     34.8800      0.1000
+    879.7000   1463.8000     34.8800      0.0900
+    879.9000   1463.8100     34.8800      0.0900
+    880.0000   1463.8200     34.8900      0.0900
+    880.1000   1463.8200     34.8900      0.0900
+    880.3000   1463.8300     34.8900      0.0900
+    880.4000   1463.8300     34.8900      0.0900
+    880.5000   1463.8300     34.8900      0.0900
+    880.7000   1463.8300     34.8900      0.0900
+    880.8000   1463.8300     34.8900      0.0900
+    880.9000   1463.8400     34.8900      0.0900
+    881.0000   1463.8400     34.8900      0.0900
+    881.2000   1463.8400     34.8900      0.0900
+    881.3000   1463.8400     34.8900      0.0900
+    881.4000   1463.8200     34.8700      0.0900
+    881.6000   1463.8500     34.8900      0.0900
+    881.7000   1463.8500     34.8900      0.0900
+    881.8000   1463.8500     34.8900      0.0900
+    882.0000   1463.8500     34.8900      0.0900
+    882.1000   1463.8600     34.8900      0.0900
+    882.2000   1463.8600     34.8900      0.0900
+    882.4000   1463.8600     34.8900      0.0900
+    882.5000   1463.8300     34.8700      0.0900
+    882.6000   1463.8600     34.8900      0.0900
+    882.7000   1463.8400     34.8700      0.0900
+    882.9000   1463.8700     34.8900      0.0900
+    883.0000   1463.8700     34.8900      0.0900
+    883.1000   1463.8700     34.8900      0.0900
+    883.3000   1463.8700     34.8900      0.0900
+    883.4000   1463.8800     34.8900      0.0900
+    883.5000   1463.8800     34.8900      0.0900
+    883.7000   1463.8800     34.8900      0.0900
+    883.8000   1463.8800     34.8900      0.0900
+    883.9000   1463.8600     34.8700      0.0900
+    884.1000   1463.8400     34.8900      0.0800
+    884.2000   1463.9000     34.8900      0.0900
+    884.3000   1463.9000     34.8900      0.0900
+    884.5000   1463.8700     34.8700      0.0900
+    884.6000   1463.8700     34.8700      0.0900
+    884.7000   1463.8200     34.8700      0.0800
+    884.8000   1463.8800     34.8700      0.0900
+    885.0000   1463.8800     34.8700      0.0900
+    885.1000   1463.8300     34.8700      0.0800
+    885.2000   1463.8900     34.8700      0.0900
+    885.4000   1463.8400     34.8700      0.0800
+    885.5000   1463.8900     34.8700      0.0900
+    885.6000   1463.8700     34.8900      0.0800
+    885.8000   1463.8700     34.8900      0.0800
+    885.9000   1463.9000     34.8800      0.0900
+    886.0000   1463.8500     34.8700      0.0800
+    886.2000   1463.8500     34.8700      0.0800
+    886.3000   1463.8600     34.8800      0.0800
+    886.4000   1463.8600     34.8800      0.0800
+    886.5000   1463.8700     34.8800      0.0800
+    886.7000   1463.8700     34.8800      0.0800
+    886.8000   1463.8700     34.8800      0.0800
+    886.9000   1463.8700     34.8800      0.0800
+    887.1000   1463.8700     34.8800      0.0800
+    887.2000   1463.8800     34.8800      0.0800
+    887.3000   1463.8800     34.8800      0.0800
+    887.5000   1463.8800     34.8800      0.0800
+    887.6000   1463.8800     34.8800      0.0800
+    887.7000   1463.8900     34.8800      0.0800
+    887.9000   1463.8900     34.8800      0.0800
+    888.0000   1463.8900     34.8800      0.0800
+    888.1000   1463.8900     34.8800      0.0800
+    888.3000   1463.8900     34.8800      0.0800
+    888.4000   1463.9000     34.8800      0.0800
+    888.5000   1463.9000     34.8800      0.0800
+    888.6000   1463.9000     34.8800      0.0800
+    888.8000   1463.9000     34.8800      0.0800
+    888.9000   1463.9000     34.8800      0.0800
+    889.0000   1463.8600     34.8800      0.0700
+    889.2000   1463.9200     34.8800      0.0800
+    889.3000   1463.8700     34.8800      0.0700
+    889.4000   1463.8700     34.8800      0.0700
+    889.6000   1463.8800     34.8900      0.0700
+    889.7000   1463.8800     34.8900      0.0700
+    889.8000   1463.8900     34.8900      0.0700
+    890.0000   1463.8900     34.8900      0.0700
+    890.1000   1463.8900     34.8900      0.0700
+    890.2000   1463.8900     34.8900      0.0700
+    890.3000   1463.8900     34.8900      0.0700
+    890.5000   1463.9000     34.8900      0.0700
+    890.6000   1463.9000     34.8900      0.0700
+    890.7000   1463.9000     34.8900      0.0700
+    890.9000   1463.9000     34.8900      0.0700
+    891.0000   1463.9000     34.8900      0.0700
+    891.1000   1463.9100     34.8900      0.0700
+    891.3000   1463.9100     34.8900      0.0700
+    891.4000   1463.9100     34.8900      0.0700
+    891.5000   1463.9100     34.8900      0.0700
+    891.7000   1463.9100     34.8900      0.0700
+    891.8000   1463.9200     34.8900      0.0700
+    891.9000   1463.9200     34.8900      0.0700
+    892.0000   1463.9200     34.8900      0.0700
+    892.2000   1463.9200     34.8900      0.0700
+    892.3000   1463.9200     34.8900      0.0700
+    892.4000   1463.9300     34.8900      0.0700
+    892.6000   1463.9300     34.8900      0.0700
+    892.7000   1463.9300     34.8900      0.0700
+    892.8000   1463.9300     34.8900      0.0700
+    893.0000   1463.9400     34.8900      0.0700
+    893.1000   1463.9400     34.8900      0.0700
+    893.2000   1463.9400     34.8900      0.0700
+    893.4000   1463.9400     34.8800      0.0700
+    893.5000   1463.9400     34.8800      0.0700
+    893.6000   1463.9200     34.8700      0.0700
+    893.8000   1463.9500     34.8800      0.0700
+    893.9000   1463.9500     34.8800      0.0700
+    894.0000   1463.9300     34.8600      0.0700
+    894.1000   1463.9500     34.8800      0.0700
+    894.3000   1463.9300     34.8600      0.0700
+    894.4000   1463.9600     34.8800      0.0700
+    894.5000   1463.9600     34.8800      0.0700
+    894.7000   1463.9600     34.8800      0.0700
+    894.8000   1463.9400     34.8600      0.0700
+    894.9000   1463.9700     34.8800      0.0700
+    895.1000   1463.9400     34.8600      0.0700
+    895.2000   1463.9700     34.8800      0.0700
+    895.3000   1463.9700     34.8800      0.0700
+    895.5000   1463.9700     34.8800      0.0700
+    895.6000   1463.9500     34.8600      0.0700
+    895.7000   1463.9800     34.8800      0.0700
+    895.8000   1463.9100     34.8600      0.0600
+    896.0000   1463.9600     34.8700      0.0700
+    896.1000   1463.9900     34.8900      0.0700
+    896.2000   1463.9100     34.8600      0.0600
+    896.4000   1463.9700     34.8700      0.0700
+    896.5000   1463.9500     34.8900      0.0600
+    896.6000   1463.9700     34.8700      0.0700
+    896.8000   1463.9800     34.8700      0.0700
+    896.9000   1463.9200     34.8600      0.0600
+    897.0000   1463.9600     34.8900      0.0600
+    897.2000   1463.9700     34.8900      0.0600
+    897.3000   1463.9400     34.8800      0.0600
+    897.4000   1463.9700     34.8900      0.0600
+    897.5000   1463.9500     34.8700      0.0600
+    897.7000   1464.0000     34.8700      0.0700
+    897.8000   1463.9400     34.8700      0.0600
+    897.9000   1463.9700     34.8900      0.0600
+    898.1000   1463.9800     34.8900      0.0600
+    898.2000   1463.9600     34.8700      0.0600
+    898.3000   1463.9900     34.8900      0.0600
+    898.5000   1463.9900     34.8900      0.0600
+    898.6000   1463.9900     34.8900      0.0600
+    898.7000   1463.9700     34.8700      0.0600
+    898.9000   1464.0000     34.8900      0.0600
+    899.0000   1463.9700     34.8700      0.0600
+    899.1000   1464.0000     34.8900      0.0600
+    899.3000   1463.9800     34.8700      0.0600
+    899.4000   1463.9800     34.8700      0.0600
+    899.5000   1464.0100     34.8900      0.0600
+    899.6000   1463.9800     34.8700      0.0600
+    899.8000   1464.0100     34.8900      0.0600
+    899.9000   1463.9900     34.8700      0.0600
+    900.0000   1464.0100     34.8900      0.0600
+    900.2000   1463.9900     34.8700      0.0600
+    900.3000   1463.9900     34.8700      0.0600
+    900.4000   1463.9900     34.8700      0.0600
+    900.6000   1464.0000     34.8700      0.0600
+    900.7000   1464.0000     34.8700      0.0600
+    900.8000   1464.0000     34.8700      0.0600
+    901.0000   1464.0000     34.8700      0.0600
+    901.1000   1464.0300     34.8900      0.0600
+    901.2000   1464.0100     34.8700      0.0600
+    901.3000   1464.0100     34.8700      0.0600
+    901.5000   1464.0100     34.8700      0.0600
+    901.6000   1464.0100     34.8700      0.0600
+    901.7000   1464.0100     34.8700      0.0600
+    901.9000   1464.0200     34.8700      0.0600
+    902.0000   1464.0200     34.8700      0.0600
+    902.1000   1464.0200     34.8700      0.0600
+    902.3000   1464.0200     34.8700      0.0600
+    902.4000   1464.0200     34.8700      0.0600
+    902.5000   1464.0300     34.8700      0.0600
+    902.7000   1464.0300     34.8700      0.0600
+    902.8000   1464.0300     34.8700      0.0600
+    902.9000   1464.0300     34.8700      0.0600
+    903.0000   1464.0400     34.8700      0.0600
+    903.2000   1464.0400     34.8700      0.0600
+    903.3000   1464.0400     34.8700      0.0600
+    903.4000   1464.0400     34.8700      0.0600
+    903.6000   1464.0400     34.8700      0.0600
+    903.7000   1464.0000     34.8700      0.0500
+    903.8000   1464.0600     34.8800      0.0600
+    904.0000   1464.0600     34.8800      0.0600
+    904.1000   1464.0000     34.8700      0.0500
+    904.2000   1464.0600     34.8800      0.0600
+    904.4000   1464.0200     34.8800      0.0500
+    904.5000   1464.0700     34.8800      0.0600
+    904.6000   1464.0200     34.8800      0.0500
+    904.7000   1464.0200     34.8800      0.0500
+    904.9000   1464.0300     34.8800      0.0500
+    905.0000   1464.0300     34.8800      0.0500
+    905.1000   1464.0400     34.8800      0.0500
+    905.3000   1464.0400     34.8800      0.0500
+    905.4000   1464.0400     34.8800      0.0500
+    905.5000   1464.0400     34.8800      0.0500
+    905.7000   1464.0400     34.8800      0.0500
+    905.8000   1464.0500     34.8800      0.0500
+    905.9000   1464.0500     34.8800      0.0500
+    906.1000   1464.0500     34.8800      0.0500
+    906.2000   1464.0500     34.8800      0.0500
+    906.3000   1464.0500     34.8800      0.0500
+    906.4000   1464.0600     34.8800      0.0500
+    906.6000   1464.0600     34.8800      0.0500
+    906.7000   1464.0600     34.8800      0.0500
+    906.8000   1464.0600     34.8800      0.0500
+    907.0000   1464.0600     34.8800      0.0500
+    907.1000   1464.0700     34.8800      0.0500
+    907.2000   1464.0700     34.8800      0.0500
+    907.4000   1464.0700     34.8800      0.0500
+    907.5000   1464.0700     34.8800      0.0500
+    907.6000   1464.0700     34.8800      0.0500
+    907.8000   1464.0800     34.8800      0.0500
+    907.9000   1464.0800     34.8800      0.0500
+    908.0000   1464.0800     34.8800      0.0500
+    908.2000   1464.0800     34.8800      0.0500
+    908.3000   1464.0900     34.8800      0.0500
+    908.4000   1464.0900     34.8800      0.0500
+    908.5000   1464.0900     34.8800      0.0500
+    908.7000   1464.0900     34.8800      0.0500
+    908.8000   1464.0900     34.8800      0.0500
+    908.9000   1464.1000     34.8800      0.0500
+    909.1000   1464.1000     34.8800      0.0500
+    909.2000   1464.1000     34.8800      0.0500
+    909.3000   1464.1000     34.8800      0.0500
+    909.5000   1464.1000     34.8800      0.0500
+    909.6000   1464.1100     34.8800      0.0500
+    909.7000   1464.1100     34.8800      0.0500
+    909.9000   1464.1100     34.8800      0.0500
+    910.0000   1464.1100     34.8800      0.0500
+    910.1000   1464.1100     34.8800      0.0500
+    910.2000   1464.1200     34.8800      0.0500
+    910.4000   1464.0700     34.8800      0.0400
+    910.5000   1464.1300     34.8900      0.0500
+    910.6000   1464.0800     34.8900      0.0400
+    910.8000   1464.0800     34.8900      0.0400
+    910.9000   1464.0900     34.8900      0.0400
+    911.0000   1464.0700     34.8700      0.0400
+    911.2000   1464.1000     34.8900      0.0400
+    911.3000   1464.1000     34.8900      0.0400
+    911.4000   1464.1000     34.8900      0.0400
+    911.6000   1464.1000     34.8900      0.0400
+    911.7000   1464.1100     34.8900      0.0400
+    911.8000   1464.1100     34.8900      0.0400
+    911.9000   1464.1100     34.8900      0.0400
+    912.1000   1464.1100     34.8900      0.0400
+    912.2000   1464.1100     34.8900      0.0400
+    912.3000   1464.0900     34.8700      0.0400
+    912.5000   1464.1200     34.8900      0.0400
+    912.6000   1464.1200     34.8900      0.0400
+    912.7000   1464.1200     34.8900      0.0400
+    912.9000   1464.1200     34.8900      0.0400
+    913.0000   1464.1000     34.8700      0.0400
+    913.1000   1464.1000     34.8700      0.0400
+    913.3000   1464.1000     34.8700      0.0400
+    913.4000   1464.1100     34.8700      0.0400
+    913.5000   1464.1400     34.8900      0.0400
+    913.6000   1464.1400     34.8900      0.0400
+    913.8000   1464.1400     34.8900      0.0400
+    913.9000   1464.1400     34.8900      0.0400
+    914.0000   1464.1200     34.8700      0.0400
+    914.2000   1464.1500     34.8900      0.0400
+    914.3000   1464.1500     34.8900      0.0400
+    914.4000   1464.1500     34.8900      0.0400
+    914.6000   1464.1500     34.8900      0.0400
+    914.7000   1464.1500     34.8900      0.0400
+    914.8000   1464.1300     34.8700      0.0400
+    915.0000   1464.1600     34.8900      0.0400
+    915.1000   1464.1600     34.8900      0.0400
+    915.2000   1464.1600     34.8900      0.0400
+    915.3000   1464.1600     34.8900      0.0400
+    915.5000   1464.1700     34.8900      0.0400
+    915.6000   1464.1400     34.8700      0.0400
+    915.7000   1464.1700     34.8900      0.0400
+    915.9000   1464.1700     34.8900      0.0400
+    916.0000   1464.1700     34.8900      0.0400
+    916.1000   1464.1800     34.8900      0.0400
+    916.3000   1464.1800     34.8900      0.0400
+    916.4000   1464.1800     34.8900      0.0400
+    916.5000   1464.1800     34.8900      0.0400
+    916.7000   1464.1800     34.8900      0.0400
+    916.8000   1464.1900     34.8900      0.0400
+    916.9000   1464.1900     34.8900      0.0400
+    917.0000   1464.1900     34.8900      0.0400
+    917.2000   1464.1900     34.8900      0.0400
+    917.3000   1464.1700     34.8700      0.0400
+    917.4000   1464.2000     34.8900      0.0400
+    917.6000   1464.2000     34.8900      0.0400
+    917.7000   1464.2000     34.8900      0.0400
+    917.8000   1464.2000     34.8900      0.0400
+    918.0000   1464.2100     34.8900      0.0400
+    918.1000   1464.2100     34.8900      0.0400
+    918.2000   1464.2100     34.8900      0.0400
+    918.4000   1464.2100     34.8900      0.0400
+    918.5000   1464.2100     34.8900      0.0400
+    918.6000   1464.2200     34.8900      0.0400
+    918.7000   1464.2200     34.8900      0.0400
+    918.9000   1464.2200     34.8900      0.0400
+    919.0000   1464.2200     34.8900      0.0400
+    919.1000   1464.2000     34.8700      0.0400
+    919.3000   1464.2300     34.8900      0.0400
+    919.4000   1464.2300     34.8900      0.0400
+    919.5000   1464.2300     34.8900      0.0400
+    919.7000   1464.2300     34.8900      0.0400
+    919.8000   1464.2300     34.8900      0.0400
+    919.9000   1464.2400     34.8900      0.0400
+    920.1000   1464.2400     34.8900      0.0400
+    920.2000   1464.2400     34.8900      0.0400
+    920.3000   1464.2400     34.8900      0.0400
+    920.4000   1464.2400     34.8900      0.0400
+    920.6000   1464.2500     34.8900      0.0400
+    920.7000   1464.2500     34.8900      0.0400
+    920.8000   1464.2500     34.8900      0.0400
+    921.0000   1464.2500     34.8900      0.0400
+    921.1000   1464.2500     34.8900      0.0400
+    921.2000   1464.2600     34.8900      0.0400
+    921.4000   1464.2600     34.8800      0.0400
+    921.5000   1464.2600     34.8800      0.0400
+    921.6000   1464.2600     34.8800      0.0400
+    921.8000   1464.2200     34.8800      0.0300
+    921.9000   1464.2800     34.8900      0.0400
+    922.0000   1464.2000     34.8700      0.0300
+    922.1000   1464.2300     34.8900      0.0300
+    922.3000   1464.2100     34.8800      0.0300
+    922.4000   1464.2200     34.8800      0.0300
+    922.5000   1464.2400     34.9000      0.0300
+    922.7000   1464.2200     34.8800      0.0300
+    922.8000   1464.2500     34.9000      0.0300
+    922.9000   1464.2200     34.8800      0.0300
+    923.1000   1464.2300     34.8800      0.0300
+    923.2000   1464.2600     34.9000      0.0300
+    923.3000   1464.2600     34.9000      0.0300
+    923.5000   1464.2300     34.8800      0.0300
+    923.6000   1464.2300     34.8800      0.0300
+    923.7000   1464.2400     34.8800      0.0300
+    923.8000   1464.2400     34.8800      0.0300
+    924.0000   1464.2700     34.9000      0.0300
+    924.1000   1464.2400     34.8800      0.0300
+    924.2000   1464.2700     34.9000      0.0300
+    924.4000   1464.2500     34.8800      0.0300
+    924.5000   1464.2500     34.8800      0.0300
+    924.6000   1464.2500     34.8800      0.0300
+    924.8000   1464.2500     34.8800      0.0300
+    924.9000   1464.2600     34.8800      0.0300
+    925.0000   1464.2600     34.8800      0.0300
+    925.2000   1464.2600     34.8800      0.0300
+    925.3000   1464.2600     34.8800      0.0300
+    925.4000   1464.2600     34.8700      0.0300
+    925.5000   1464.2700     34.8700      0.0300
+    925.7000   1464.2700     34.8700      0.0300
+    925.8000   1464.2700     34.8700      0.0300
+    925.9000   1464.3000     34.8900      0.0300
+    926.1000   1464.2700     34.8700      0.0300
+    926.2000   1464.2800     34.8700      0.0300
+    926.3000   1464.2800     34.8700      0.0300
+    926.5000   1464.2800     34.8700      0.0300
+    926.6000   1464.2300     34.8700      0.0200
+    926.7000   1464.2900     34.8800      0.0300
+    926.9000   1464.2500     34.8800      0.0200
+    927.0000   1464.2500     34.8800      0.0200
+    927.1000   1464.2600     34.8900      0.0200
+    927.2000   1464.2600     34.8900      0.0200
+    927.4000   1464.2600     34.8900      0.0200
+    927.5000   1464.2600     34.8900      0.0200
+    927.6000   1464.2700     34.8900      0.0200
+    927.8000   1464.2700     34.8900      0.0200
+    927.9000   1464.2700     34.8900      0.0200
+    928.0000   1464.2700     34.8900      0.0200
+    928.2000   1464.2700     34.8900      0.0200
+    928.3000   1464.2800     34.8900      0.0200
+    928.4000   1464.2800     34.8900      0.0200
+    928.6000   1464.2800     34.8900      0.0200
+    928.7000   1464.2800     34.8800      0.0200
+    928.8000   1464.2800     34.8800      0.0200
+    928.9000   1464.2900     34.8800      0.0200
+    929.1000   1464.2900     34.8800      0.0200
+    929.2000   1464.2900     34.8800      0.0200
+    929.3000   1464.2900     34.8800      0.0200
+    929.5000   1464.3000     34.8800      0.0200
+    929.6000   1464.3000     34.8800      0.0200
+    929.7000   1464.3000     34.8800      0.0200
+    929.9000   1464.3000     34.8800      0.0200
+    930.0000   1464.3000     34.8800      0.0200
+    930.1000   1464.3100     34.8800      0.0200
+    930.2000   1464.3100     34.8800      0.0200
+    930.4000   1464.3100     34.8800      0.0200
+    930.5000   1464.3100     34.8800      0.0200
+    930.6000   1464.3100     34.8800      0.0200
+    930.8000   1464.3200     34.8800      0.0200
+    930.9000   1464.3200     34.8800      0.0200
+    931.0000   1464.3200     34.8800      0.0200
+    931.2000   1464.3200     34.8800      0.0200
+    931.3000   1464.3200     34.8800      0.0200
+    931.4000   1464.3300     34.8800      0.0200
+    931.6000   1464.3300     34.8800      0.0200
+    931.7000   1464.3300     34.8800      0.0200
+    931.8000   1464.3300     34.8800      0.0200
+    931.9000   1464.3300     34.8800      0.0200
+    932.1000   1464.3400     34.8800      0.0200
+    932.2000   1464.3400     34.8800      0.0200
+    932.3000   1464.3400     34.8800      0.0200
+    932.5000   1464.3400     34.8800      0.0200
+    932.6000   1464.3400     34.8800      0.0200
+    932.7000   1464.3500     34.8800      0.0200
+    932.9000   1464.3500     34.8800      0.0200
+    933.0000   1464.3500     34.8800      0.0200
+    933.1000   1464.3500     34.8800      0.0200
+    933.3000   1464.3500     34.8800      0.0200
+    933.4000   1464.3600     34.8800      0.0200
+    933.5000   1464.3600     34.8800      0.0200
+    933.6000   1464.3600     34.8800      0.0200
+    933.8000   1464.3100     34.8800      0.0100
+    933.9000   1464.3700     34.8900      0.0200
+    934.0000   1464.3800     34.8900      0.0200
+    934.2000   1464.3200     34.8800      0.0100
+    934.3000   1464.3800     34.8900      0.0200
+    934.4000   1464.3300     34.8900      0.0100
+    934.6000   1464.3300     34.8900      0.0100
+    934.7000   1464.3500     34.8900      0.0100
+    934.8000   1464.3500     34.8900      0.0100
+    935.0000   1464.3500     34.8900      0.0100
+    935.1000   1464.3500     34.8900      0.0100
+    935.2000   1464.3500     34.8900      0.0100
+    935.3000   1464.3600     34.8900      0.0100
+    935.5000   1464.3600     34.8900      0.0100
+    935.6000   1464.3300     34.8700      0.0100
+    935.7000   1464.3600     34.8900      0.0100
+    935.9000   1464.3600     34.8900      0.0100
+    936.0000   1464.3400     34.8700      0.0100
+    936.1000   1464.3700     34.8900      0.0100
+    936.3000   1464.3400     34.8700      0.0100
+    936.4000   1464.3500     34.8700      0.0100
+    936.5000   1464.3500     34.8700      0.0100
+    936.7000   1464.3500     34.8700      0.0100
+    936.8000   1464.3800     34.8900      0.0100
+    936.9000   1464.3500     34.8700      0.0100
+    937.0000   1464.3600     34.8700      0.0100
+    937.2000   1464.3600     34.8700      0.0100
+    937.3000   1464.3900     34.8900      0.0100
+    937.4000   1464.3600     34.8700      0.0100
+    937.6000   1464.3600     34.8700      0.0100
+    937.7000   1464.3700     34.8700      0.0100
+    937.8000   1464.3700     34.8700      0.0100
+    938.0000   1464.4000     34.8900      0.0100
+    938.1000   1464.3200     34.8700      0.0000
+    938.2000   1464.4100     34.9000      0.0100
+    938.3000   1464.3400     34.8800      0.0000
+    938.5000   1464.3900     34.8800      0.0100
+    938.6000   1464.3900     34.8800      0.0100
+    938.7000   1464.3600     34.8900      0.0000
+    938.9000   1464.3900     34.8800      0.0100
+    939.0000   1464.3500     34.8800      0.0000
+    939.1000   1464.4000     34.8800      0.0100
+    939.3000   1464.4300     34.9000      0.0100
+    939.4000   1464.3400     34.8700      0.0000
+    939.5000   1464.4000     34.8800      0.0100
+    939.7000   1464.3600     34.8800      0.0000
+    939.8000   1464.4300     34.9000      0.0100
+    939.9000   1464.4400     34.9000      0.0100
+    940.0000   1464.3500     34.8700      0.0000
+    940.2000   1464.4100     34.8800      0.0100
+    940.3000   1464.3900     34.9000      0.0000
+    940.4000   1464.3700     34.8800      0.0000
+    940.6000   1464.4300     34.8800      0.0100
+    940.7000   1464.3700     34.8800      0.0000
+    940.8000   1464.3700     34.8800      0.0000
+    941.0000   1464.3800     34.8800      0.0000
+    941.1000   1464.3900     34.8800      0.0000
+    941.2000   1464.3900     34.8800      0.0000
+    941.4000   1464.4200     34.9000      0.0000
+    941.5000   1464.3900     34.8800      0.0000
+    941.6000   1464.4000     34.8800      0.0000
+    941.7000   1464.4200     34.9000      0.0000
+    941.9000   1464.4500     34.8800      0.0100
+    942.0000   1464.3900     34.8800      0.0000
+    942.1000   1464.4000     34.8800      0.0000
+    942.3000   1464.4100     34.8800      0.0000
+    942.4000   1464.4100     34.8800      0.0000
+    942.5000   1464.4100     34.8800      0.0000
+    942.7000   1464.4400     34.9000      0.0000
+    942.8000   1464.4400     34.9000      0.0000
+    942.9000   1464.4200     34.8800      0.0000
+    943.1000   1464.4200     34.8800      0.0000
+    943.2000   1464.4200     34.8800      0.0000
+    943.3000   1464.4200     34.8800      0.0000
+    943.4000   1464.4200     34.8800      0.0000
+    943.6000   1464.4300     34.8800      0.0000
+    943.7000   1464.4300     34.8800      0.0000
+    943.8000   1464.4300     34.8800      0.0000
+    944.0000   1464.4300     34.8800      0.0000
+    944.1000   1464.4300     34.8800      0.0000
+    944.2000   1464.4400     34.8800      0.0000
+    944.4000   1464.4400     34.8800      0.0000
+    944.5000   1464.4400     34.8800      0.0000
+    944.6000   1464.4400     34.8800      0.0000
+    944.7000   1464.4400     34.8800      0.0000
+    944.9000   1464.4700     34.9000      0.0000
+    945.0000   1464.4500     34.8800      0.0000
+    945.1000   1464.4800     34.9000      0.0000
+    945.3000   1464.4500     34.8800      0.0000
+    945.4000   1464.4500     34.8800      0.0000
+    945.5000   1464.4600     34.8800      0.0000
+    945.7000   1464.4900     34.9000      0.0000
+    945.8000   1464.4600     34.8800      0.0000
+    945.9000   1464.4600     34.8800      0.0000
+    946.1000   1464.4700     34.8800      0.0000
+    946.2000   1464.4700     34.8800      0.0000
+    946.3000   1464.4700     34.8800      0.0000
+    946.4000   1464.4700     34.8800      0.0000
+    946.6000   1464.4700     34.8800      0.0000
+    946.7000   1464.4800     34.8800      0.0000
+    946.8000   1464.4800     34.8800      0.0000
+    947.0000   1464.4800     34.8800      0.0000
+    947.1000   1464.4800     34.8800      0.0000
+    947.2000   1464.4800     34.8800      0.0000
+    947.4000   1464.5100     34.9000      0.0000
+    947.5000   1464.4900     34.8800      0.0000
+    947.6000   1464.4900     34.8800      0.0000
+    947.8000   1464.4900     34.8800      0.0000
+    947.9000   1464.4900     34.8800      0.0000
+    948.0000   1464.5000     34.8800      0.0000
+    948.1000   1464.5000     34.8800      0.0000
+    948.3000   1464.5000     34.8800      0.0000
+    948.4000   1464.5300     34.9000      0.0000
+    948.5000   1464.5000     34.8800      0.0000
+    948.7000   1464.5100     34.8800      0.0000
+    948.8000   1464.5100     34.8800      0.0000
+    948.9000   1464.5400     34.9000      0.0000
+    949.1000   1464.5100     34.8800      0.0000
+    949.2000   1464.5100     34.8800      0.0000
+    949.3000   1464.5200     34.8800      0.0000
+    949.4000   1464.5200     34.8800      0.0000
+    949.6000   1464.5200     34.8800      0.0000
+    949.7000   1464.5500     34.9000      0.0000
+    949.8000   1464.5500     34.9000      0.0000
+    950.0000   1464.5300     34.8800      0.0000
+    950.1000   1464.5300     34.8800      0.0000
+    950.2000   1464.5300     34.8800      0.0000
+    950.4000   1464.5300     34.8800      0.0000
+    950.5000   1464.5400     34.8800      0.0000
+    950.6000   1464.5600     34.9000      0.0000
+    950.8000   1464.5400     34.8800      0.0000
+    950.9000   1464.5400     34.8800      0.0000
+    951.0000   1464.5400     34.8800      0.0000
+    951.1000   1464.5500     34.8800      0.0000
+    951.3000   1464.5500     34.8800      0.0000
+    951.4000   1464.5800     34.9000      0.0000
+    951.5000   1464.5500     34.8800      0.0000
+    951.7000   1464.5500     34.8800      0.0000
+    951.8000   1464.5600     34.8800      0.0000
+    951.9000   1464.5600     34.8800      0.0000
+    952.1000   1464.5600     34.8800      0.0000
+    952.2000   1464.5600     34.8800      0.0000
+    952.3000   1464.5600     34.8800      0.0000
+    952.5000   1464.5700     34.8800      0.0000
+    952.6000   1464.5700     34.8800      0.0000
+    952.7000   1464.5200     34.8800     -0.0200
+    952.8000   1464.5300     34.8800     -0.0200
+    953.0000   1464.5900     34.8900      0.0000
+    953.1000   1464.5400     34.8800     -0.0200
+    953.2000   1464.5900     34.8800      0.0000
+    953.4000   1464.5400     34.8800     -0.0200
+    953.5000   1464.5900     34.8800      0.0000
+    953.6000   1464.5400     34.8800     -0.0200
+    953.8000   1464.5500     34.8800     -0.0200
+    953.9000   1464.5600     34.8900     -0.0200
+    954.0000   1464.5600     34.8900     -0.0200
+    954.1000   1464.5600     34.8900     -0.0200
+    954.3000   1464.6100     34.8900      0.0000
+    954.4000   1464.5600     34.8800     -0.0200
+    954.5000   1464.5600     34.8800     -0.0200
+    954.7000   1464.5700     34.8900     -0.0200
+    954.8000   1464.5700     34.8900     -0.0200
+    954.9000   1464.5700     34.8900     -0.0200
+    955.1000   1464.5700     34.8900     -0.0200
+    955.2000   1464.5800     34.8900     -0.0200
+    955.3000   1464.5800     34.8900     -0.0200
+    955.5000   1464.5800     34.8900     -0.0200
+    955.6000   1464.5800     34.8900     -0.0200
+    955.7000   1464.5800     34.8900     -0.0200
+    955.8000   1464.5900     34.8900     -0.0200
+    956.0000   1464.5900     34.8900     -0.0200
+    956.1000   1464.5900     34.8900     -0.0200
+    956.2000   1464.5900     34.8900     -0.0200
+    956.4000   1464.6000     34.8900     -0.0200
+    956.5000   1464.6000     34.8900     -0.0200
+    956.6000   1464.6000     34.8900     -0.0200
+    956.8000   1464.6000     34.8800     -0.0200
+    956.9000   1464.6000     34.8800     -0.0200
+    957.0000   1464.6100     34.8800     -0.0200
+    957.1000   1464.6100     34.8800     -0.0200
+    957.3000   1464.6100     34.8800     -0.0200
+    957.4000   1464.6100     34.8800     -0.0200
+    957.5000   1464.6100     34.8800     -0.0200
+    957.7000   1464.6200     34.8800     -0.0200
+    957.8000   1464.6200     34.8800     -0.0200
+    957.9000   1464.6200     34.8800     -0.0200
+    958.1000   1464.6200     34.8800     -0.0200
+    958.2000   1464.6200     34.8800     -0.0200
+    958.3000   1464.6300     34.8800     -0.0200
+    958.5000   1464.6300     34.8800     -0.0200
+    958.6000   1464.6300     34.8800     -0.0200
+    958.7000   1464.6300     34.8800     -0.0200
+    958.8000   1464.6300     34.8800     -0.0200
+    959.0000   1464.6400     34.8800     -0.0200
+    959.1000   1464.6400     34.8800     -0.0200
+    959.2000   1464.6400     34.8800     -0.0200
+    959.4000   1464.6400     34.8800     -0.0200
+    959.5000   1464.6400     34.8800     -0.0200
+    959.6000   1464.6500     34.8800     -0.0200
+    959.8000   1464.6500     34.8800     -0.0200
+    959.9000   1464.6500     34.8800     -0.0200
+    960.0000   1464.6500     34.8800     -0.0200
+    960.1000   1464.6600     34.8800     -0.0200
+    960.3000   1464.6600     34.8800     -0.0200
+    960.4000   1464.6600     34.8800     -0.0200
+    960.5000   1464.6600     34.8800     -0.0200
+    960.7000   1464.6600     34.8800     -0.0200
+    960.8000   1464.6700     34.8800     -0.0200
+    960.9000   1464.6700     34.8800     -0.0200
+    961.1000   1464.6700     34.8800     -0.0200
+    961.2000   1464.6700     34.8800     -0.0200
+    961.3000   1464.6700     34.8800     -0.0200
+    961.5000   1464.6800     34.8800     -0.0200
+    961.6000   1464.6800     34.8800     -0.0200
+    961.7000   1464.6800     34.8800     -0.0200
+    961.8000   1464.6800     34.8800     -0.0200
+    962.0000   1464.6800     34.8800     -0.0200
+    962.1000   1464.6900     34.8800     -0.0200
+    962.2000   1464.6900     34.8800     -0.0200
+    962.4000   1464.6900     34.8800     -0.0200
+    962.5000   1464.6900     34.8800     -0.0200
+    962.6000   1464.6900     34.8800     -0.0200
+    962.8000   1464.7000     34.8800     -0.0200
+    962.9000   1464.7000     34.8800     -0.0200
+    963.0000   1464.7000     34.8800     -0.0200
+    963.1000   1464.7000     34.8800     -0.0200
+    963.3000   1464.7000     34.8800     -0.0200
+    963.4000   1464.7100     34.8800     -0.0200
+    963.5000   1464.6600     34.8800     -0.0300
+    963.7000   1464.7200     34.8900     -0.0200
+    963.8000   1464.7200     34.8900     -0.0200
+    963.9000   1464.7100     34.8800     -0.0200
+    964.1000   1464.7200     34.8800     -0.0200
+    964.2000   1464.6700     34.8800     -0.0300
+    964.3000   1464.7300     34.8900     -0.0200
+    964.5000   1464.6800     34.8900     -0.0300
+    964.6000   1464.7300     34.8900     -0.0200
+    964.7000   1464.7400     34.8900     -0.0200
+    964.8000   1464.7300     34.8800     -0.0200
+    965.0000   1464.7300     34.8800     -0.0200
+    965.1000   1464.7300     34.8800     -0.0200
+    965.2000   1464.7400     34.8800     -0.0200
+    965.4000   1464.7400     34.8800     -0.0200
+    965.5000   1464.7400     34.8800     -0.0200
+    965.6000   1464.7400     34.8800     -0.0200
+    965.8000   1464.7400     34.8800     -0.0200
+    965.9000   1464.7500     34.8800     -0.0200
+    966.0000   1464.7500     34.8800     -0.0200
+    966.1000   1464.7000     34.8800     -0.0300
+    966.3000   1464.7600     34.8900     -0.0200
+    966.4000   1464.7100     34.8900     -0.0300
+    966.5000   1464.7600     34.8900     -0.0200
+    966.7000   1464.7700     34.8900     -0.0200
+    966.8000   1464.7600     34.8800     -0.0200
+    966.9000   1464.7600     34.8800     -0.0200
+    967.1000   1464.7600     34.8800     -0.0200
+    967.2000   1464.7700     34.8800     -0.0200
+    967.3000   1464.7700     34.8800     -0.0200
+    967.5000   1464.7700     34.8800     -0.0200
+    967.6000   1464.7700     34.8800     -0.0200
+    967.7000   1464.7700     34.8800     -0.0200
+    967.8000   1464.7800     34.8800     -0.0200
+    968.0000   1464.7800     34.8800     -0.0200
+    968.1000   1464.7800     34.8800     -0.0200
+    968.2000   1464.7800     34.8800     -0.0200
+    968.4000   1464.7800     34.8800     -0.0200
+    968.5000   1464.7900     34.8800     -0.0200
+    968.6000   1464.7900     34.8800     -0.0200
+    968.8000   1464.7900     34.8800     -0.0200
+    968.9000   1464.7900     34.8800     -0.0200
+    969.0000   1464.7500     34.8800     -0.0300
+    969.1000   1464.8100     34.8800     -0.0200
+    969.3000   1464.8100     34.8800     -0.0200
+    969.4000   1464.8000     34.8800     -0.0200
+    969.5000   1464.8000     34.8800     -0.0200
+    969.7000   1464.8100     34.8800     -0.0200
+    969.8000   1464.8100     34.8800     -0.0200
+    969.9000   1464.8100     34.8800     -0.0200
+    970.1000   1464.7600     34.8800     -0.0300
+    970.2000   1464.8200     34.8800     -0.0200
+    970.3000   1464.8200     34.8800     -0.0200
+    970.5000   1464.8200     34.8800     -0.0200
+    970.6000   1464.8200     34.8800     -0.0200
+    970.7000   1464.7700     34.8800     -0.0300
+    970.8000   1464.7800     34.8800     -0.0300
+    971.0000   1464.8400     34.8900     -0.0200
+    971.1000   1464.8400     34.8800     -0.0200
+    971.2000   1464.8300     34.8800     -0.0200
+    971.4000   1464.7800     34.8800     -0.0300
+    971.5000   1464.8400     34.8800     -0.0200
+    971.6000   1464.8000     34.8800     -0.0300
+    971.8000   1464.8500     34.8800     -0.0200
+    971.9000   1464.8500     34.8800     -0.0200
+    972.0000   1464.7900     34.8800     -0.0300
+    972.1000   1464.8500     34.8800     -0.0200
+    972.3000   1464.8100     34.8800     -0.0300
+    972.4000   1464.8600     34.8800     -0.0200
+    972.5000   1464.8600     34.8800     -0.0200
+    972.7000   1464.8000     34.8800     -0.0300
+    972.8000   1464.8600     34.8800     -0.0200
+    972.9000   1464.8200     34.8800     -0.0300
+    973.1000   1464.8700     34.8800     -0.0200
+    973.2000   1464.8200     34.8800     -0.0300
+    973.3000   1464.8200     34.8800     -0.0300
+    973.4000   1464.8300     34.8900     -0.0300
+    973.6000   1464.8300     34.8900     -0.0300
+    973.7000   1464.8400     34.8900     -0.0300
+    973.8000   1464.8400     34.8900     -0.0300
+    974.0000   1464.8400     34.8900     -0.0300
+    974.1000   1464.8400     34.8900     -0.0300
+    974.2000   1464.8400     34.8900     -0.0300
+    974.4000   1464.8500     34.8900     -0.0300
+    974.5000   1464.8500     34.8900     -0.0300
+    974.6000   1464.8500     34.8900     -0.0300
+    974.8000   1464.8500     34.8900     -0.0300
+    974.9000   1464.8500     34.8900     -0.0300
+    975.0000   1464.8600     34.8900     -0.0300
+    975.1000   1464.8600     34.8900     -0.0300
+    975.3000   1464.8600     34.8900     -0.0300
+    975.4000   1464.9100     34.8900     -0.0200
+    975.5000   1464.8600     34.8800     -0.0300
+    975.7000   1464.8600     34.8800     -0.0300
+    975.8000   1464.8700     34.8900     -0.0300
+    975.9000   1464.8700     34.8900     -0.0300
+    976.1000   1464.8700     34.8900     -0.0300
+    976.2000   1464.8800     34.8900     -0.0300
+    976.3000   1464.8800     34.8900     -0.0300
+    976.4000   1464.8800     34.8900     -0.0300
+    976.6000   1464.8800     34.8900     -0.0300
+    976.7000   1464.8800     34.8900     -0.0300
+    976.8000   1464.8900     34.8900     -0.0300
+    977.0000   1464.8900     34.8900     -0.0300
+    977.1000   1464.8900     34.8900     -0.0300
+    977.2000   1464.8900     34.8900     -0.0300
+    977.4000   1464.8900     34.8900     -0.0300
+    977.5000   1464.9000     34.8900     -0.0300
+    977.6000   1464.9000     34.8800     -0.0300
+    977.8000   1464.9000     34.8800     -0.0300
+    977.9000   1464.9000     34.8800     -0.0300
+    978.0000   1464.9000     34.8800     -0.0300
+    978.1000   1464.9100     34.8800     -0.0300
+    978.3000   1464.9100     34.8800     -0.0300
+    978.4000   1464.9100     34.8800     -0.0300
+    978.5000   1464.9100     34.8800     -0.0300
+    978.7000   1464.9100     34.8800     -0.0300
+    978.8000   1464.9200     34.8800     -0.0300
+    978.9000   1464.9200     34.8800     -0.0300
+    979.1000   1464.9200     34.8800     -0.0300
+    979.2000   1464.9200     34.8800     -0.0300
+    979.3000   1464.9200     34.8800     -0.0300
+    979.4000   1464.9300     34.8800     -0.0300
+    979.6000   1464.9300     34.8800     -0.0300
+    979.7000   1464.9300     34.8800     -0.0300
+    979.8000   1464.8800     34.8800     -0.0400
+    980.0000   1464.9400     34.8900     -0.0300
+    980.1000   1464.9500     34.8900     -0.0300
+    980.2000   1464.9400     34.8800     -0.0300
+    980.4000   1464.9400     34.8800     -0.0300
+    980.5000   1464.9400     34.8800     -0.0300
+    980.6000   1464.9500     34.8800     -0.0300
+    980.7000   1464.9000     34.8800     -0.0400
+    980.9000   1464.9600     34.8900     -0.0300
+    981.0000   1464.9600     34.8900     -0.0300
+    981.1000   1464.9500     34.8800     -0.0300
+    981.3000   1464.9600     34.8800     -0.0300
+    981.4000   1464.9100     34.8800     -0.0400
+    981.5000   1464.9700     34.8900     -0.0300
+    981.7000   1464.9200     34.8900     -0.0400
+    981.8000   1464.9200     34.8900     -0.0400
+    981.9000   1464.9800     34.8900     -0.0300
+    982.1000   1464.9300     34.8900     -0.0400
+    982.2000   1464.9800     34.8900     -0.0300
+    982.3000   1464.9800     34.8900     -0.0300
+    982.4000   1464.9300     34.8800     -0.0400
+    982.6000   1464.9800     34.8900     -0.0300
+    982.7000   1464.9400     34.8900     -0.0400
+    982.8000   1464.9900     34.8900     -0.0300
+    983.0000   1464.9900     34.8900     -0.0300
+    983.1000   1464.9400     34.8800     -0.0400
+    983.2000   1464.9900     34.8900     -0.0300
+    983.4000   1465.0000     34.8900     -0.0300
+    983.5000   1464.9900     34.8800     -0.0300
+    983.6000   1464.9900     34.8800     -0.0300
+    983.7000   1464.9500     34.8800     -0.0400
+    983.9000   1465.0000     34.8900     -0.0300
+    984.0000   1465.0100     34.8900     -0.0300
+    984.1000   1465.0000     34.8800     -0.0300
+    984.3000   1465.0000     34.8800     -0.0300
+    984.4000   1465.0100     34.8800     -0.0300
+    984.5000   1465.0100     34.8800     -0.0300
+    984.7000   1464.9600     34.8800     -0.0400
+    984.8000   1465.0200     34.8900     -0.0300
+    984.9000   1465.0200     34.8900     -0.0300
+    985.0000   1464.9700     34.8800     -0.0400
+    985.2000   1465.0300     34.8900     -0.0300
+    985.3000   1464.9800     34.8900     -0.0400
+    985.4000   1465.0300     34.8900     -0.0300
+    985.6000   1465.0300     34.8900     -0.0300
+    985.7000   1465.0300     34.8800     -0.0300
+    985.8000   1465.0300     34.8800     -0.0300
+    986.0000   1465.0300     34.8800     -0.0300
+    986.1000   1465.0300     34.8800     -0.0300
+    986.2000   1465.0300     34.8800     -0.0300
+    986.3000   1464.9900     34.8800     -0.0400
+    986.5000   1465.0500     34.8900     -0.0300
+    986.6000   1465.0500     34.8900     -0.0300
+    986.7000   1465.0400     34.8800     -0.0300
+    986.9000   1465.0400     34.8800     -0.0300
+    987.0000   1465.0000     34.8800     -0.0400
+    987.1000   1465.0600     34.8900     -0.0300
+    987.3000   1465.0600     34.8900     -0.0300
+    987.4000   1465.0500     34.8800     -0.0300
+    987.5000   1465.0500     34.8800     -0.0300
+    987.7000   1465.0100     34.8800     -0.0400
+    987.8000   1465.0700     34.8900     -0.0300
+    987.9000   1465.0200     34.8900     -0.0400
+    988.0000   1465.0700     34.8800     -0.0300
+    988.2000   1465.0700     34.8800     -0.0300
+    988.3000   1465.0200     34.8800     -0.0400
+    988.4000   1465.0800     34.8800     -0.0300
+    988.6000   1465.0300     34.8800     -0.0400
+    988.7000   1465.0800     34.8800     -0.0300
+    988.8000   1465.0300     34.8800     -0.0400
+    989.0000   1465.0400     34.8800     -0.0400
+    989.1000   1465.1000     34.8900     -0.0300
+    989.2000   1465.0400     34.8800     -0.0400
+    989.3000   1465.0900     34.8800     -0.0300
+    989.5000   1465.0900     34.8800     -0.0300
+    989.6000   1465.0400     34.8800     -0.0400
+    989.7000   1465.0500     34.8800     -0.0400
+    989.9000   1465.0600     34.8900     -0.0400
+    990.0000   1465.0600     34.8900     -0.0400
+    990.1000   1465.0600     34.8900     -0.0400
+    990.3000   1465.0700     34.8900     -0.0400
+    990.4000   1465.0700     34.8900     -0.0400
+    990.5000   1465.0700     34.8900     -0.0400
+    990.6000   1465.0700     34.8900     -0.0400
+    990.8000   1465.0700     34.8900     -0.0400
+    990.9000   1465.0800     34.8900     -0.0400
+    991.0000   1465.0800     34.8900     -0.0400
+    991.2000   1465.0800     34.8900     -0.0400
+    991.3000   1465.0800     34.8900     -0.0400
+    991.4000   1465.0800     34.8900     -0.0400
+    991.6000   1465.0900     34.8900     -0.0400
+    991.7000   1465.0900     34.8900     -0.0400
+    991.8000   1465.0900     34.8900     -0.0400
+    991.9000   1465.0900     34.8900     -0.0400
+    992.1000   1465.0900     34.8900     -0.0400
+    992.2000   1465.1000     34.8900     -0.0400
+    992.3000   1465.1000     34.8900     -0.0400
+    992.5000   1465.1000     34.8900     -0.0400
+    992.6000   1465.1000     34.8900     -0.0400
+    992.7000   1465.0800     34.8700     -0.0400
+    992.9000   1465.1100     34.8900     -0.0400
+    993.0000   1465.1100     34.8900     -0.0400
+    993.1000   1465.1100     34.8900     -0.0400
+    993.3000   1465.1100     34.8900     -0.0400
+    993.4000   1465.1100     34.8900     -0.0400
+    993.5000   1465.1200     34.8900     -0.0400
+    993.6000   1465.1200     34.8900     -0.0400
+    993.8000   1465.0700     34.8900     -0.0500
+    993.9000   1465.1300     34.8900     -0.0400
+    994.0000   1465.1300     34.8900     -0.0400
+    994.2000   1465.0800     34.8900     -0.0500
+    994.3000   1465.1400     34.8900     -0.0400
+    994.4000   1465.0900     34.8900     -0.0500
+    994.6000   1465.0900     34.8900     -0.0500
+    994.7000   1465.1000     34.9000     -0.0500
+    994.8000   1465.0800     34.8800     -0.0500
+    994.9000   1465.1100     34.9000     -0.0500
+    995.1000   1465.0800     34.8800     -0.0500
+    995.2000   1465.0800     34.8800     -0.0500
+    995.3000   1465.0900     34.8800     -0.0500
+    995.5000   1465.0900     34.8800     -0.0500
+    995.6000   1465.0900     34.8800     -0.0500
+    995.7000   1465.0900     34.8800     -0.0500
+    995.9000   1465.0900     34.8800     -0.0500
+    996.0000   1465.1200     34.9000     -0.0500
+    996.1000   1465.1000     34.8800     -0.0500
+    996.2000   1465.1000     34.8800     -0.0500
+    996.4000   1465.1000     34.8800     -0.0500
+    996.5000   1465.1300     34.9000     -0.0500
+    996.6000   1465.1300     34.9000     -0.0500
+    996.8000   1465.1100     34.8800     -0.0500
+    996.9000   1465.1100     34.8800     -0.0500
+    997.0000   1465.1100     34.8800     -0.0500
+    997.2000   1465.1100     34.8800     -0.0500
+    997.3000   1465.1400     34.9000     -0.0500
+    997.4000   1465.1500     34.9000     -0.0500
+    997.5000   1465.1200     34.8800     -0.0500
+    997.7000   1465.1200     34.8800     -0.0500
+    997.8000   1465.1300     34.8800     -0.0500
+    997.9000   1465.1300     34.8800     -0.0500
+    998.1000   1465.1300     34.8800     -0.0500
+    998.2000   1465.1600     34.9000     -0.0500
+    998.3000   1465.1300     34.8800     -0.0500
+    998.5000   1465.1400     34.8800     -0.0500
+    998.6000   1465.1400     34.8800     -0.0500
+    998.7000   1465.1400     34.8800     -0.0500
+    998.8000   1465.1400     34.8800     -0.0500
+    999.0000   1465.1400     34.8800     -0.0500
+    999.1000   1465.1500     34.8800     -0.0500
+    999.2000   1465.1700     34.9000     -0.0500
+    999.4000   1465.1500     34.8800     -0.0500
+    999.5000   1465.1800     34.9000     -0.0500
+    999.6000   1465.1100     34.8800     -0.0600
+    999.8000   1465.1200     34.8800     -0.0600
+    999.9000   1465.1300     34.8900     -0.0600
+   1000.0000   1465.1300     34.8900     -0.0600
+   1000.2000   1465.1300     34.8900     -0.0600
+   1000.3000   1465.1300     34.8900     -0.0600
+   1000.4000   1465.1300     34.8900     -0.0600
+   1000.5000   1465.1400     34.8900     -0.0600
+   1000.7000   1465.1400     34.8900     -0.0600
+   1000.8000   1465.1400     34.8900     -0.0600
+   1000.9000   1465.1400     34.8900     -0.0600
+   1001.1000   1465.1400     34.8900     -0.0600
+   1001.2000   1465.1500     34.8900     -0.0600
+   1001.3000   1465.1500     34.8900     -0.0600
+   1001.5000   1465.1500     34.8900     -0.0600
+   1001.6000   1465.1000     34.8900     -0.0700
+   1001.7000   1465.1600     34.8900     -0.0600
+   1001.8000   1465.1200     34.8900     -0.0700
+   1002.0000   1465.1200     34.8900     -0.0700
+   1002.1000   1465.1800     34.9000     -0.0600
+   1002.2000   1465.1200     34.8900     -0.0700
+   1002.4000   1465.1700     34.8900     -0.0600
+   1002.5000   1465.1700     34.8900     -0.0600
+   1002.6000   1465.1700     34.8900     -0.0600
+   1002.8000   1465.1700     34.8900     -0.0600
+   1002.9000   1465.1200     34.8900     -0.0700
+   1003.0000   1465.1300     34.8900     -0.0700
+   1003.1000   1465.1900     34.9000     -0.0600
+   1003.3000   1465.1400     34.8900     -0.0700
+   1003.4000   1465.1900     34.8900     -0.0600
+   1003.5000   1465.1400     34.8900     -0.0700
+   1003.7000   1465.1200     34.8700     -0.0700
+   1003.8000   1465.1500     34.9000     -0.0700
+   1003.9000   1465.1600     34.9000     -0.0700
+   1004.1000   1465.1600     34.9000     -0.0700
+   1004.2000   1465.1300     34.8800     -0.0700
+   1004.3000   1465.1400     34.8800     -0.0700
+   1004.4000   1465.1400     34.8800     -0.0700
+   1004.6000   1465.1400     34.8800     -0.0700
+   1004.7000   1465.1700     34.9000     -0.0700
+   1004.8000   1465.1400     34.8800     -0.0700
+   1005.0000   1465.1500     34.8800     -0.0700
+   1005.1000   1465.1500     34.8800     -0.0700
+   1005.2000   1465.1500     34.8800     -0.0700
+   1005.4000   1465.1500     34.8800     -0.0700
+   1005.5000   1465.1500     34.8800     -0.0700
+   1005.6000   1465.1600     34.8800     -0.0700
+   1005.7000   1465.1600     34.8800     -0.0700
+   1005.9000   1465.1600     34.8800     -0.0700
+   1006.0000   1465.1600     34.8800     -0.0700
+   1006.1000   1465.1200     34.8800     -0.0800
+   1006.3000   1465.1700     34.8800     -0.0700
+   1006.4000   1465.1800     34.8800     -0.0700
+   1006.5000   1465.1200     34.8800     -0.0800
+   1006.7000   1465.1800     34.8800     -0.0700
+   1006.8000   1465.1800     34.8800     -0.0700
+   1006.9000   1465.1800     34.8800     -0.0700
+   1007.0000   1465.1800     34.8800     -0.0700
+   1007.2000   1465.1300     34.8800     -0.0800
+   1007.3000   1465.1900     34.8800     -0.0700
+   1007.4000   1465.1400     34.8800     -0.0800
+   1007.6000   1465.2000     34.8800     -0.0700
+   1007.7000   1465.2000     34.8800     -0.0700
+   1007.8000   1465.1400     34.8800     -0.0800
+   1008.0000   1465.2000     34.8800     -0.0700
+   1008.1000   1465.1500     34.8800     -0.0800
+   1008.2000   1465.2100     34.8800     -0.0700
+   1008.3000   1465.2100     34.8800     -0.0700
+   1008.5000   1465.1500     34.8800     -0.0800
+   1008.6000   1465.2100     34.8800     -0.0700
+   1008.7000   1465.1700     34.8800     -0.0800
+   1008.9000   1465.2200     34.8800     -0.0700
+   1009.0000   1465.2200     34.8800     -0.0700
+   1009.1000   1465.1600     34.8800     -0.0800
+   1009.3000   1465.2200     34.8800     -0.0700
+   1009.4000   1465.2200     34.8800     -0.0700
+   1009.5000   1465.2200     34.8800     -0.0700
+   1009.6000   1465.2200     34.8800     -0.0700
+   1009.8000   1465.1700     34.8700     -0.0800
+   1009.9000   1465.2300     34.8800     -0.0700
+   1010.0000   1465.1900     34.8800     -0.0800
+   1010.2000   1465.2400     34.8800     -0.0700
+   1010.3000   1465.2400     34.8800     -0.0700
+   1010.4000   1465.2300     34.8700     -0.0700
+   1010.6000   1465.2300     34.8700     -0.0700
+   1010.7000   1465.1900     34.8700     -0.0800
+   1010.8000   1465.2500     34.8800     -0.0700
+   1010.9000   1465.2500     34.8800     -0.0700
+   1011.1000   1465.1900     34.8700     -0.0800
+   1011.2000   1465.2000     34.8800     -0.0800
+   1011.3000   1465.2100     34.8900     -0.0800
+   1011.5000   1465.2700     34.8900     -0.0700
+   1011.6000   1465.2600     34.8800     -0.0700
+   1011.7000   1465.2000     34.8700     -0.0800
+   1011.9000   1465.2600     34.8800     -0.0700
+   1012.0000   1465.2400     34.9000     -0.0800
+   1012.1000   1465.2200     34.8800     -0.0800
+   1012.2000   1465.2800     34.8900     -0.0700
+   1012.4000   1465.2500     34.9000     -0.0800
+   1012.5000   1465.2200     34.8800     -0.0800
+   1012.6000   1465.2300     34.8900     -0.0800
+   1012.8000   1465.2400     34.8900     -0.0800
+   1012.9000   1465.2900     34.8900     -0.0700
+   1013.0000   1465.2300     34.8800     -0.0800
+   1013.2000   1465.2800     34.8800     -0.0700
+   1013.3000   1465.2400     34.8800     -0.0800
+   1013.4000   1465.2900     34.8800     -0.0700
+   1013.6000   1465.2400     34.8800     -0.0800
+   1013.7000   1465.2400     34.8800     -0.0800
+   1013.8000   1465.2500     34.8800     -0.0800
+   1013.9000   1465.2600     34.8800     -0.0800
+   1014.1000   1465.3100     34.8800     -0.0700
+   1014.2000   1465.3000     34.8800     -0.0700
+   1014.3000   1465.2500     34.8700     -0.0800
+   1014.5000   1465.3300     34.9000     -0.0700
+   1014.6000   1465.2600     34.8800     -0.0800
+   1014.7000   1465.3100     34.8800     -0.0700
+   1014.9000   1465.3100     34.8800     -0.0700
+   1015.0000   1465.2800     34.8900     -0.0800
+   1015.1000   1465.3100     34.8800     -0.0700
+   1015.2000   1465.2900     34.9000     -0.0800
+   1015.4000   1465.3500     34.9000     -0.0700
+   1015.5000   1465.2700     34.8800     -0.0800
+   1015.6000   1465.3000     34.9000     -0.0800
+   1015.8000   1465.3600     34.9000     -0.0700
+   1015.9000   1465.2800     34.8800     -0.0800
+   1016.0000   1465.2800     34.8800     -0.0800
+   1016.2000   1465.2900     34.8800     -0.0800
+   1016.3000   1465.2900     34.8800     -0.0800
+   1016.4000   1465.3200     34.9000     -0.0800
+   1016.5000   1465.3000     34.8800     -0.0800
+   1016.7000   1465.3300     34.9000     -0.0800
+   1016.8000   1465.3800     34.9000     -0.0700
+   1016.9000   1465.3200     34.9000     -0.0800
+   1017.1000   1465.3200     34.9000     -0.0800
+   1017.2000   1465.3300     34.9000     -0.0800
+   1017.3000   1465.3600     34.8800     -0.0700
+   1017.5000   1465.3000     34.8800     -0.0800
+   1017.6000   1465.3300     34.9000     -0.0800
+   1017.7000   1465.3400     34.9000     -0.0800
+   1017.8000   1465.3400     34.9000     -0.0800
+   1018.0000   1465.3900     34.9000     -0.0700
+   1018.1000   1465.3600     34.8800     -0.0700
+   1018.2000   1465.3100     34.8700     -0.0800
+   1018.4000   1465.3400     34.9000     -0.0800
+   1018.5000   1465.3500     34.9000     -0.0800
+   1018.6000   1465.3300     34.8800     -0.0800
+   1018.8000   1465.3300     34.8800     -0.0800
+   1018.9000   1465.3600     34.9000     -0.0800
+   1019.0000   1465.3600     34.9000     -0.0800
+   1019.1000   1465.3600     34.9000     -0.0800
+   1019.3000   1465.3900     34.8800     -0.0700
+   1019.4000   1465.3600     34.9000     -0.0800
+   1019.5000   1465.3600     34.9000     -0.0800
+   1019.7000   1465.3700     34.9000     -0.0800
+   1019.8000   1465.3500     34.8800     -0.0800
+   1019.9000   1465.3500     34.8800     -0.0800
+   1020.1000   1465.4000     34.8800     -0.0700
+   1020.2000   1465.3700     34.8900     -0.0800
+   1020.3000   1465.3700     34.8900     -0.0800
+   1020.4000   1465.3800     34.9000     -0.0800
+   1020.6000   1465.3900     34.9000     -0.0800
+   1020.7000   1465.3600     34.8800     -0.0800
+   1020.8000   1465.3900     34.9000     -0.0800
+   1021.0000   1465.3900     34.9000     -0.0800
+   1021.1000   1465.4000     34.9000     -0.0800
+   1021.2000   1465.3700     34.8800     -0.0800
+   1021.4000   1465.4000     34.9000     -0.0800
+   1021.5000   1465.4000     34.9000     -0.0800
+   1021.6000   1465.4500     34.9000     -0.0700
+   1021.7000   1465.4000     34.8900     -0.0800
+   1021.9000   1465.4000     34.8900     -0.0800
+   1022.0000   1465.4100     34.9000     -0.0800
+   1022.1000   1465.4100     34.9000     -0.0800
+   1022.3000   1465.4100     34.9000     -0.0800
+   1022.4000   1465.4200     34.9000     -0.0800
+   1022.5000   1465.4200     34.9000     -0.0800
+   1022.7000   1465.4200     34.9000     -0.0800
+   1022.8000   1465.4200     34.9000     -0.0800
+   1022.9000   1465.4200     34.9000     -0.0800
+   1023.0000   1465.4300     34.9000     -0.0800
+   1023.2000   1465.4300     34.9000     -0.0800
+   1023.3000   1465.4000     34.8800     -0.0800
+   1023.4000   1465.4300     34.9000     -0.0800
+   1023.6000   1465.4300     34.9000     -0.0800
+   1023.7000   1465.4100     34.8800     -0.0800
+   1023.8000   1465.4400     34.9000     -0.0800
+   1024.0000   1465.4400     34.9000     -0.0800
+   1024.1000   1465.4200     34.8800     -0.0800
+   1024.2000   1465.4400     34.9000     -0.0800
+   1024.3000   1465.4200     34.8800     -0.0800
+   1024.5000   1465.4500     34.9000     -0.0800
+   1024.6000   1465.4200     34.8800     -0.0800
+   1024.7000   1465.4300     34.8800     -0.0800
+   1024.9000   1465.4300     34.8800     -0.0800
+   1025.0000   1465.4300     34.8800     -0.0800
+   1025.1000   1465.4300     34.8800     -0.0800
+   1025.3000   1465.4300     34.8800     -0.0800
+   1025.4000   1465.4400     34.8800     -0.0800
+   1025.5000   1465.4600     34.9000     -0.0800
+   1025.6000   1465.4400     34.8800     -0.0800
+   1025.8000   1465.4400     34.8800     -0.0800
+   1025.9000   1465.4400     34.8800     -0.0800
+   1026.0000   1465.4500     34.8800     -0.0800
+   1026.2000   1465.4500     34.8800     -0.0800
+   1026.3000   1465.4500     34.8800     -0.0800
+   1026.4000   1465.4800     34.9000     -0.0800
+   1026.5000   1465.4500     34.8800     -0.0800
+   1026.7000   1465.4800     34.9000     -0.0800
+   1026.8000   1465.4900     34.9000     -0.0800
+   1026.9000   1465.4600     34.8800     -0.0800
+   1027.1000   1465.4600     34.8800     -0.0800
+   1027.2000   1465.4600     34.8800     -0.0800
+   1027.3000   1465.4700     34.8800     -0.0800
+   1027.5000   1465.5000     34.9000     -0.0800
+   1027.6000   1465.4700     34.8800     -0.0800
+   1027.7000   1465.5000     34.9000     -0.0800
+   1027.8000   1465.5000     34.9000     -0.0800
+   1028.0000   1465.4800     34.8800     -0.0800
+   1028.1000   1465.5100     34.9000     -0.0800
+   1028.2000   1465.5100     34.9000     -0.0800
+   1028.4000   1465.5100     34.9000     -0.0800
+   1028.5000   1465.5100     34.9000     -0.0800
+   1028.6000   1465.5100     34.9000     -0.0800
+   1028.8000   1465.4900     34.8800     -0.0800
+   1028.9000   1465.4400     34.8800     -0.0900
+   1029.0000   1465.5000     34.8800     -0.0800
+   1029.1000   1465.5000     34.8800     -0.0800
+   1029.3000   1465.4500     34.8800     -0.0900
+   1029.4000   1465.5100     34.8800     -0.0800
+   1029.5000   1465.4900     34.9000     -0.0900
+   1029.7000   1465.5100     34.8800     -0.0800
+   1029.8000   1465.5100     34.8800     -0.0800
+   1029.9000   1465.4600     34.8800     -0.0900
+   1030.1000   1465.5200     34.8800     -0.0800
+   1030.2000   1465.4700     34.8800     -0.0900
+   1030.3000   1465.4700     34.8800     -0.0900
+   1030.4000   1465.4800     34.8900     -0.0900
+   1030.6000   1465.4900     34.8900     -0.0900
+   1030.7000   1465.5400     34.8900     -0.0800
+   1030.8000   1465.4800     34.8800     -0.0900
+   1031.0000   1465.4800     34.8800     -0.0900
+   1031.1000   1465.4900     34.8900     -0.0900
+   1031.2000   1465.5200     34.9100     -0.0900
+   1031.4000   1465.5200     34.9100     -0.0900
+   1031.5000   1465.5300     34.9100     -0.0900
+   1031.6000   1465.5000     34.8900     -0.0900
+   1031.7000   1465.5000     34.8900     -0.0900
+   1031.9000   1465.5100     34.8900     -0.0900
+   1032.0000   1465.5100     34.8900     -0.0900
+   1032.1000   1465.5100     34.8900     -0.0900
+   1032.3000   1465.5100     34.8900     -0.0900
+   1032.4000   1465.5600     34.8900     -0.0800
+   1032.5000   1465.5100     34.8800     -0.0900
+   1032.7000   1465.5600     34.8800     -0.0800
+   1032.8000   1465.5400     34.9000     -0.0900
+   1032.9000   1465.5600     34.8800     -0.0800
+   1033.0000   1465.5700     34.8800     -0.0800
+   1033.2000   1465.5400     34.8900     -0.0900
+   1033.3000   1465.5700     34.8800     -0.0800
+   1033.4000   1465.5200     34.8800     -0.0900
+   1033.6000   1465.5200     34.8800     -0.0900
+   1033.7000   1465.5300     34.8900     -0.0900
+   1033.8000   1465.5600     34.9000     -0.0900
+   1034.0000   1465.5700     34.9000     -0.0900
+   1034.1000   1465.5400     34.8800     -0.0900
+   1034.2000   1465.5900     34.8800     -0.0800
+   1034.3000   1465.5900     34.8800     -0.0800
+   1034.5000   1465.5600     34.8900     -0.0900
+   1034.6000   1465.6200     34.9000     -0.0800
+   1034.7000   1465.5700     34.9000     -0.0900
+   1034.9000   1465.5700     34.9000     -0.0900
+   1035.0000   1465.5600     34.8800     -0.0900
+   1035.1000   1465.5800     34.9000     -0.0900
+   1035.3000   1465.5900     34.9000     -0.0900
+   1035.4000   1465.5900     34.9000     -0.0900
+   1035.5000   1465.5600     34.8800     -0.0900
+   1035.6000   1465.5700     34.8800     -0.0900
+   1035.8000   1465.5700     34.8800     -0.0900
+   1035.9000   1465.5700     34.8800     -0.0900
+   1036.0000   1465.5700     34.8800     -0.0900
+   1036.2000   1465.5700     34.8800     -0.0900
+   1036.3000   1465.5800     34.8800     -0.0900
+   1036.4000   1465.5800     34.8800     -0.0900
+   1036.6000   1465.6100     34.9000     -0.0900
+   1036.7000   1465.5800     34.8800     -0.0900
+   1036.8000   1465.6100     34.9000     -0.0900
+   1036.9000   1465.5900     34.8800     -0.0900
+   1037.1000   1465.6100     34.9000     -0.0900
+   1037.2000   1465.6200     34.9000     -0.0900
+   1037.3000   1465.6200     34.9000     -0.0900
+   1037.5000   1465.5900     34.8800     -0.0900
+   1037.6000   1465.6200     34.9000     -0.0900
+   1037.7000   1465.6300     34.9000     -0.0900
+   1037.9000   1465.6500     34.8800     -0.0800
+   1038.0000   1465.6200     34.9000     -0.0900
+   1038.1000   1465.6200     34.9000     -0.0900
+   1038.2000   1465.6300     34.9000     -0.0900
+   1038.4000   1465.6400     34.9000     -0.0900
+   1038.5000   1465.6100     34.8800     -0.0900
+   1038.6000   1465.6400     34.9000     -0.0900
+   1038.8000   1465.6400     34.9000     -0.0900
+   1038.9000   1465.6900     34.9000     -0.0800
+   1039.0000   1465.6400     34.9000     -0.0900
+   1039.1000   1465.6400     34.9000     -0.0900
+   1039.3000   1465.6500     34.9000     -0.0900
+   1039.4000   1465.6500     34.9000     -0.0900
+   1039.5000   1465.6500     34.9000     -0.0900
+   1039.7000   1465.6600     34.9000     -0.0900
+   1039.8000   1465.6600     34.9000     -0.0900
+   1039.9000   1465.6600     34.9000     -0.0900
+   1040.1000   1465.7100     34.9000     -0.0800
+   1040.2000   1465.6800     34.8800     -0.0800
+   1040.3000   1465.6500     34.8900     -0.0900
+   1040.4000   1465.7100     34.8900     -0.0800
+   1040.6000   1465.6600     34.8900     -0.0900
+   1040.7000   1465.6600     34.8900     -0.0900
+   1040.8000   1465.6700     34.9000     -0.0900
+   1041.0000   1465.6800     34.9000     -0.0900
+   1041.1000   1465.7300     34.9000     -0.0800
+   1041.2000   1465.6700     34.8900     -0.0900
+   1041.4000   1465.7200     34.8900     -0.0800
+   1041.5000   1465.7000     34.8700     -0.0800
+   1041.6000   1465.6700     34.8900     -0.0900
+   1041.7000   1465.6800     34.8900     -0.0900
+   1041.9000   1465.6600     34.8800     -0.0900
+   1042.0000   1465.6900     34.9000     -0.0900
+   1042.1000   1465.7400     34.9000     -0.0800
+   1042.3000   1465.6900     34.8900     -0.0900
+   1042.4000   1465.6900     34.8900     -0.0900
+   1042.5000   1465.7000     34.9000     -0.0900
+   1042.7000   1465.7000     34.9000     -0.0900
+   1042.8000   1465.7100     34.9000     -0.0900
+   1042.9000   1465.7100     34.9000     -0.0900
+   1043.0000   1465.7100     34.9000     -0.0900
+   1043.2000   1465.7100     34.9000     -0.0900
+   1043.3000   1465.7100     34.9000     -0.0900
+   1043.4000   1465.7200     34.9000     -0.0900
+   1043.6000   1465.7200     34.9000     -0.0900
+   1043.7000   1465.7200     34.9000     -0.0900
+   1043.8000   1465.7200     34.9000     -0.0900
+   1044.0000   1465.7200     34.9000     -0.0900
+   1044.1000   1465.7700     34.9000     -0.0800
+   1044.2000   1465.7200     34.8900     -0.0900
+   1044.3000   1465.7200     34.8900     -0.0900
+   1044.5000   1465.7300     34.9000     -0.0900
+   1044.6000   1465.7300     34.9000     -0.0900
+   1044.7000   1465.7400     34.9000     -0.0900
+   1044.9000   1465.7400     34.9000     -0.0900
+   1045.0000   1465.7400     34.9000     -0.0900
+   1045.1000   1465.7400     34.9000     -0.0900
+   1045.3000   1465.7400     34.9000     -0.0900
+   1045.4000   1465.7500     34.9000     -0.0900
+   1045.5000   1465.7500     34.9000     -0.0900
+   1045.6000   1465.7500     34.9000     -0.0900
+   1045.8000   1465.7500     34.9000     -0.0900
+   1045.9000   1465.7500     34.9000     -0.0900
+   1046.0000   1465.7600     34.9000     -0.0900
+   1046.2000   1465.7600     34.9000     -0.0900
+   1046.3000   1465.7600     34.9000     -0.0900
+   1046.4000   1465.7600     34.9000     -0.0900
+   1046.5000   1465.7600     34.9000     -0.0900
+   1046.7000   1465.8200     34.9000     -0.0800
+   1046.8000   1465.7600     34.8900     -0.0900
+   1046.9000   1465.8100     34.8900     -0.0800
+   1047.1000   1465.7600     34.8900     -0.0900
+   1047.2000   1465.8200     34.8900     -0.0800
+   1047.3000   1465.7700     34.8900     -0.0900
+   1047.5000   1465.7700     34.8900     -0.0900
+   1047.6000   1465.8300     34.9000     -0.0800
+   1047.7000   1465.7800     34.8900     -0.0900
+   1047.8000   1465.7800     34.8900     -0.0900
+   1048.0000   1465.7900     34.9000     -0.0900
+   1048.1000   1465.7900     34.9000     -0.0900
+   1048.2000   1465.7900     34.9000     -0.0900
+   1048.4000   1465.7900     34.9000     -0.0900
+   1048.5000   1465.8000     34.9000     -0.0900
+   1048.6000   1465.8000     34.9000     -0.0900
+   1048.8000   1465.8000     34.9000     -0.0900
+   1048.9000   1465.8000     34.9000     -0.0900
+   1049.0000   1465.8000     34.9000     -0.0900
+   1049.1000   1465.8100     34.9000     -0.0900
+   1049.3000   1465.8100     34.9000     -0.0900
+   1049.4000   1465.8100     34.9000     -0.0900
+   1049.5000   1465.8100     34.9000     -0.0900
+   1049.7000   1465.8100     34.9000     -0.0900
+   1049.8000   1465.8200     34.9000     -0.0900
+   1049.9000   1465.8200     34.9000     -0.0900
+   1050.1000   1465.8200     34.9000     -0.0900
+   1050.2000   1465.8200     34.9000     -0.0900
+   1050.3000   1465.8200     34.9000     -0.0900
+   1050.4000   1465.8300     34.9000     -0.0900
+   1050.6000   1465.8300     34.9000     -0.0900
+   1050.7000   1465.8300     34.9000     -0.0900
+   1050.8000   1465.8300     34.9000     -0.0900
+   1051.0000   1465.8300     34.8900     -0.0900
+   1051.1000   1465.8400     34.8900     -0.0900
+   1051.2000   1465.8400     34.8900     -0.0900
+   1051.4000   1465.8400     34.8900     -0.0900
+   1051.5000   1465.8400     34.8900     -0.0900
+   1051.6000   1465.8400     34.8900     -0.0900
+   1051.7000   1465.8500     34.8900     -0.0900
+   1051.9000   1465.8500     34.8900     -0.0900
+   1052.0000   1465.8500     34.8900     -0.0900
+   1052.1000   1465.8500     34.8900     -0.0900
+   1052.3000   1465.8500     34.8900     -0.0900
+   1052.4000   1465.8600     34.8900     -0.0900
+   1052.5000   1465.8600     34.8900     -0.0900
+   1052.6000   1465.8600     34.8900     -0.0900
+   1052.8000   1465.8600     34.8900     -0.0900
+   1052.9000   1465.8700     34.8900     -0.0900
+   1053.0000   1465.8700     34.8900     -0.0900
+   1053.2000   1465.8700     34.8900     -0.0900
+   1053.3000   1465.8700     34.8900     -0.0900
+   1053.4000   1465.8700     34.8900     -0.0900
+   1053.6000   1465.8800     34.8900     -0.0900
+   1053.7000   1465.8800     34.8900     -0.0900
+   1053.8000   1465.8800     34.8900     -0.0900
+   1053.9000   1465.8800     34.8900     -0.0900
+   1054.1000   1465.8800     34.8900     -0.0900
+   1054.2000   1465.8900     34.8900     -0.0900
+   1054.3000   1465.8900     34.8900     -0.0900
+   1054.5000   1465.8900     34.8900     -0.0900
+   1054.6000   1465.8900     34.8900     -0.0900
+   1054.7000   1465.8900     34.8900     -0.0900
+   1054.9000   1465.9000     34.8900     -0.0900
+   1055.0000   1465.9000     34.8900     -0.0900
+   1055.1000   1465.9000     34.8900     -0.0900
+   1055.2000   1465.8500     34.8900     -0.1000
+   1055.4000   1465.8600     34.9000     -0.1000
+   1055.5000   1465.8700     34.9000     -0.1000
+   1055.6000   1465.8800     34.9000     -0.1000
+   1055.8000   1465.8800     34.9000     -0.1000
+   1055.9000   1465.8800     34.9000     -0.1000
+   1056.0000   1465.9300     34.9000     -0.0900
+   1056.2000   1465.8800     34.9000     -0.1000
+   1056.3000   1465.8800     34.9000     -0.1000
+   1056.4000   1465.8900     34.9000     -0.1000
+   1056.5000   1465.8900     34.9000     -0.1000
+   1056.7000   1465.8900     34.9000     -0.1000
+   1056.8000   1465.8900     34.9000     -0.1000
+   1056.9000   1465.9000     34.9000     -0.1000
+   1057.1000   1465.9000     34.9000     -0.1000
+   1057.2000   1465.9000     34.9000     -0.1000
+   1057.3000   1465.9000     34.9000     -0.1000
+   1057.4000   1465.9000     34.9000     -0.1000
+   1057.6000   1465.9100     34.9000     -0.1000
+   1057.7000   1465.8800     34.8800     -0.1000
+   1057.8000   1465.9100     34.9000     -0.1000
+   1058.0000   1465.9100     34.9000     -0.1000
+   1058.1000   1465.8900     34.8800     -0.1000
+   1058.2000   1465.8900     34.8800     -0.1000
+   1058.4000   1465.8900     34.8800     -0.1000
+   1058.5000   1465.9200     34.9000     -0.1000
+   1058.6000   1465.9000     34.8800     -0.1000
+   1058.7000   1465.9200     34.9000     -0.1000
+   1058.9000   1465.9000     34.8800     -0.1000
+   1059.0000   1465.9000     34.8800     -0.1000
+   1059.1000   1465.9000     34.8800     -0.1000
+   1059.3000   1465.9300     34.9000     -0.1000
+   1059.4000   1465.9400     34.9000     -0.1000
+   1059.5000   1465.9400     34.9000     -0.1000
+   1059.7000   1465.9100     34.8800     -0.1000
+   1059.8000   1465.9100     34.8800     -0.1000
+   1059.9000   1465.9400     34.9000     -0.1000
+   1060.0000   1465.9200     34.8800     -0.1000
+   1060.2000   1465.9200     34.8800     -0.1000
+   1060.3000   1465.9200     34.8800     -0.1000
+   1060.4000   1465.9200     34.8800     -0.1000
+   1060.6000   1465.9300     34.8800     -0.1000
+   1060.7000   1465.9300     34.8800     -0.1000
+   1060.8000   1465.9300     34.8800     -0.1000
+   1061.0000   1465.9300     34.8800     -0.1000
+   1061.1000   1465.8900     34.8800     -0.1100
+   1061.2000   1465.9000     34.8900     -0.1100
+   1061.3000   1465.9100     34.8900     -0.1100
+   1061.5000   1465.9100     34.8900     -0.1100
+   1061.6000   1465.9100     34.8900     -0.1100
+   1061.7000   1465.9100     34.8900     -0.1100
+   1061.9000   1465.9100     34.8900     -0.1100
+   1062.0000   1465.9200     34.8900     -0.1100
+   1062.1000   1465.9200     34.8900     -0.1100
+   1062.2000   1465.9200     34.8900     -0.1100
+   1062.4000   1465.9200     34.8900     -0.1100
+   1062.5000   1465.9300     34.8900     -0.1100
+   1062.6000   1465.9300     34.8900     -0.1100
+   1062.8000   1465.9300     34.8900     -0.1100
+   1062.9000   1465.9300     34.8900     -0.1100
+   1063.0000   1465.9300     34.8900     -0.1100
+   1063.2000   1465.9400     34.8900     -0.1100
+   1063.3000   1465.9400     34.8900     -0.1100
+   1063.4000   1465.9400     34.8900     -0.1100
+   1063.5000   1465.9400     34.8900     -0.1100
+   1063.7000   1465.9400     34.8900     -0.1100
+   1063.8000   1465.9500     34.8900     -0.1100
+   1063.9000   1465.9500     34.8900     -0.1100
+   1064.1000   1465.9500     34.8900     -0.1100
+   1064.2000   1465.9500     34.8900     -0.1100
+   1064.3000   1465.9500     34.8900     -0.1100
+   1064.5000   1465.9600     34.8900     -0.1100
+   1064.6000   1465.9600     34.8900     -0.1100
+   1064.7000   1465.9600     34.8900     -0.1100
+   1064.8000   1465.9600     34.8900     -0.1100
+   1065.0000   1465.9600     34.8900     -0.1100
+   1065.1000   1465.9700     34.8900     -0.1100
+   1065.2000   1465.9700     34.8900     -0.1100
+   1065.4000   1465.9700     34.8900     -0.1100
+   1065.5000   1465.9700     34.8900     -0.1100
+   1065.6000   1465.9700     34.8900     -0.1100
+   1065.7000   1465.9800     34.8900     -0.1100
+   1065.9000   1465.9800     34.8900     -0.1100
+   1066.0000   1465.9800     34.8900     -0.1100
+   1066.1000   1465.9800     34.8900     -0.1100
+   1066.3000   1465.9800     34.8900     -0.1100
+   1066.4000   1465.9900     34.8900     -0.1100
+   1066.5000   1465.9900     34.8900     -0.1100
+   1066.7000   1465.9900     34.8900     -0.1100
+   1066.8000   1465.9900     34.8900     -0.1100
+   1066.9000   1465.9900     34.8900     -0.1100
+   1067.0000   1466.0000     34.8900     -0.1100
+   1067.2000   1466.0000     34.8900     -0.1100
+   1067.3000   1466.0000     34.8900     -0.1100
+   1067.4000   1466.0000     34.8900     -0.1100
+   1067.6000   1465.9600     34.8900     -0.1200
+   1067.7000   1466.0200     34.9000     -0.1100
+   1067.8000   1465.9700     34.9000     -0.1200
+   1068.0000   1466.0200     34.9000     -0.1100
+   1068.1000   1466.0200     34.9000     -0.1100
+   1068.2000   1465.9700     34.8900     -0.1200
+   1068.3000   1465.9800     34.9000     -0.1200
+   1068.5000   1465.9900     34.9000     -0.1200
+   1068.6000   1465.9900     34.9000     -0.1200
+   1068.7000   1465.9900     34.9000     -0.1200
+   1068.9000   1465.9900     34.9000     -0.1200
+   1069.0000   1465.9900     34.9000     -0.1200
+   1069.1000   1466.0000     34.9000     -0.1200
+   1069.2000   1466.0000     34.9000     -0.1200
+   1069.4000   1466.0000     34.9000     -0.1200
+   1069.5000   1466.0000     34.9000     -0.1200
+   1069.6000   1466.0100     34.9000     -0.1200
+   1069.8000   1465.9800     34.8800     -0.1200
+   1069.9000   1466.0100     34.9000     -0.1200
+   1070.0000   1465.9800     34.8800     -0.1200
+   1070.2000   1466.0100     34.9000     -0.1200
+   1070.3000   1465.9900     34.8800     -0.1200
+   1070.4000   1465.9900     34.8800     -0.1200
+   1070.5000   1466.0200     34.9000     -0.1200
+   1070.7000   1465.9900     34.8800     -0.1200
+   1070.8000   1466.0200     34.9000     -0.1200
+   1070.9000   1466.0000     34.8800     -0.1200
+   1071.1000   1466.0000     34.8800     -0.1200
+   1071.2000   1466.0300     34.9000     -0.1200
+   1071.3000   1466.0300     34.9000     -0.1200
+   1071.5000   1466.0100     34.8800     -0.1200
+   1071.6000   1466.0100     34.8800     -0.1200
+   1071.7000   1466.0100     34.8800     -0.1200
+   1071.8000   1466.0100     34.8800     -0.1200
+   1072.0000   1466.0200     34.8800     -0.1200
+   1072.1000   1466.0200     34.8800     -0.1200
+   1072.2000   1466.0200     34.8800     -0.1200
+   1072.4000   1466.0200     34.8800     -0.1200
+   1072.5000   1466.0500     34.9000     -0.1200
+   1072.6000   1466.0300     34.8800     -0.1200
+   1072.7000   1466.0500     34.9000     -0.1200
+   1072.9000   1466.0600     34.9000     -0.1200
+   1073.0000   1466.0600     34.9000     -0.1200
+   1073.1000   1466.0300     34.8800     -0.1200
+   1073.3000   1466.0400     34.8800     -0.1200
+   1073.4000   1466.0600     34.9000     -0.1200
+   1073.5000   1466.0400     34.8800     -0.1200
+   1073.7000   1466.0400     34.8800     -0.1200
+   1073.8000   1466.0700     34.9000     -0.1200
+   1073.9000   1466.0500     34.8800     -0.1200
+   1074.0000   1466.0500     34.8800     -0.1200
+   1074.2000   1466.0500     34.8800     -0.1200
+   1074.3000   1466.0500     34.8800     -0.1200
+   1074.4000   1466.0800     34.9000     -0.1200
+   1074.6000   1466.0600     34.8800     -0.1200
+   1074.7000   1466.0900     34.9000     -0.1200
+   1074.8000   1466.0900     34.9000     -0.1200
+   1075.0000   1466.0900     34.9000     -0.1200
+   1075.1000   1466.0600     34.8800     -0.1200
+   1075.2000   1466.0700     34.8800     -0.1200
+   1075.3000   1466.0700     34.8800     -0.1200
+   1075.5000   1466.0700     34.8800     -0.1200
+   1075.6000   1466.0200     34.8800     -0.1300
+   1075.7000   1466.1100     34.9000     -0.1200
+   1075.9000   1466.0800     34.8800     -0.1200
+   1076.0000   1466.1100     34.9000     -0.1200
+   1076.1000   1466.1100     34.9000     -0.1200
+   1076.2000   1466.0300     34.8800     -0.1300
+   1076.4000   1466.0900     34.8800     -0.1200
+   1076.5000   1466.0500     34.8800     -0.1300
+   1076.6000   1466.0800     34.9000     -0.1300
+   1076.8000   1466.1100     34.8900     -0.1200
+   1076.9000   1466.0500     34.8800     -0.1300
+   1077.0000   1466.0500     34.8800     -0.1300
+   1077.2000   1466.1100     34.8900     -0.1200
+   1077.3000   1466.0600     34.8800     -0.1300
+   1077.4000   1466.0600     34.8800     -0.1300
+   1077.5000   1466.0700     34.8900     -0.1300
+   1077.7000   1466.1000     34.9100     -0.1300
+   1077.8000   1466.0700     34.8900     -0.1300
+   1077.9000   1466.0800     34.8900     -0.1300
+   1078.1000   1466.1300     34.8900     -0.1200
+   1078.2000   1466.0700     34.8800     -0.1300
+   1078.3000   1466.0700     34.8800     -0.1300
+   1078.4000   1466.0900     34.8900     -0.1300
+   1078.6000   1466.0900     34.8900     -0.1300
+   1078.7000   1466.1400     34.8900     -0.1200
+   1078.8000   1466.0800     34.8800     -0.1300
+   1079.0000   1466.1100     34.9000     -0.1300
+   1079.1000   1466.1000     34.8900     -0.1300
+   1079.2000   1466.1000     34.8900     -0.1300
+   1079.4000   1466.1000     34.8900     -0.1300
+   1079.5000   1466.1300     34.9100     -0.1300
+   1079.6000   1466.1000     34.8900     -0.1300
+   1079.7000   1466.1100     34.8900     -0.1300
+   1079.9000   1466.1100     34.8900     -0.1300
+   1080.0000   1466.1100     34.8900     -0.1300
+   1080.1000   1466.1100     34.8900     -0.1300
+   1080.3000   1466.1100     34.8900     -0.1300
+   1080.4000   1466.1200     34.8900     -0.1300
+   1080.5000   1466.1200     34.8900     -0.1300
+   1080.7000   1466.1200     34.8900     -0.1300
+   1080.8000   1466.1200     34.8900     -0.1300
+   1080.9000   1466.1200     34.8900     -0.1300
+   1081.0000   1466.1500     34.9100     -0.1300
+   1081.2000   1466.1300     34.8900     -0.1300
+   1081.3000   1466.1300     34.8900     -0.1300
+   1081.4000   1466.1300     34.8900     -0.1300
+   1081.6000   1466.1300     34.8900     -0.1300
+   1081.7000   1466.1400     34.8900     -0.1300
+   1081.8000   1466.1400     34.8900     -0.1300
+   1081.9000   1466.1400     34.8900     -0.1300
+   1082.1000   1466.1400     34.8900     -0.1300
+   1082.2000   1466.1400     34.8900     -0.1300
+   1082.3000   1466.1500     34.8900     -0.1300
+   1082.5000   1466.1500     34.8900     -0.1300
+   1082.6000   1466.1500     34.8900     -0.1300
+   1082.7000   1466.1500     34.8900     -0.1300
+   1082.9000   1466.1500     34.8900     -0.1300
+   1083.0000   1466.1600     34.8900     -0.1300
+   1083.1000   1466.1600     34.8900     -0.1300
+   1083.2000   1466.1600     34.8900     -0.1300
+   1083.4000   1466.1600     34.8800     -0.1300
+   1083.5000   1466.1700     34.8800     -0.1300
+   1083.6000   1466.1700     34.8800     -0.1300
+   1083.8000   1466.2000     34.9000     -0.1300
+   1083.9000   1466.1700     34.8800     -0.1300
+   1084.0000   1466.1700     34.8800     -0.1300
+   1084.1000   1466.1800     34.8800     -0.1300
+   1084.3000   1466.1800     34.8800     -0.1300
+   1084.4000   1466.1800     34.8800     -0.1300
+   1084.5000   1466.1800     34.8800     -0.1300
+   1084.7000   1466.1800     34.8800     -0.1300
+   1084.8000   1466.1900     34.8800     -0.1300
+   1084.9000   1466.1900     34.8800     -0.1300
+   1085.1000   1466.1900     34.8800     -0.1300
+   1085.2000   1466.1900     34.8800     -0.1300
+   1085.3000   1466.1900     34.8800     -0.1300
+   1085.4000   1466.2000     34.8800     -0.1300
+   1085.6000   1466.2000     34.8800     -0.1300
+   1085.7000   1466.2000     34.8800     -0.1300
+   1085.8000   1466.2000     34.8800     -0.1300
+   1086.0000   1466.2000     34.8800     -0.1300
+   1086.1000   1466.2100     34.8800     -0.1300
+   1086.2000   1466.2100     34.8800     -0.1300
+   1086.3000   1466.2100     34.8800     -0.1300
+   1086.5000   1466.2100     34.8800     -0.1300
+   1086.6000   1466.2100     34.8800     -0.1300
+   1086.7000   1466.2200     34.8800     -0.1300
+   1086.9000   1466.2200     34.8800     -0.1300
+   1087.0000   1466.2200     34.8800     -0.1300
+   1087.1000   1466.2200     34.8800     -0.1300
+   1087.3000   1466.2200     34.8800     -0.1300
+   1087.4000   1466.2300     34.8800     -0.1300
+   1087.5000   1466.2300     34.8800     -0.1300
+   1087.6000   1466.2300     34.8800     -0.1300
+   1087.8000   1466.2300     34.8800     -0.1300
+   1087.9000   1466.2300     34.8800     -0.1300
+   1088.0000   1466.2400     34.8800     -0.1300
+   1088.2000   1466.2700     34.9000     -0.1300
+   1088.3000   1466.2700     34.9000     -0.1300
+   1088.4000   1466.2700     34.9000     -0.1300
+   1088.6000   1466.2400     34.8800     -0.1300
+   1088.7000   1466.2500     34.8800     -0.1300
+   1088.8000   1466.2500     34.8800     -0.1300
+   1088.9000   1466.2800     34.9000     -0.1300
+   1089.1000   1466.2500     34.8800     -0.1300
+   1089.2000   1466.2600     34.8800     -0.1300
+   1089.3000   1466.2600     34.8800     -0.1300
+   1089.5000   1466.2600     34.8800     -0.1300
+   1089.6000   1466.2600     34.8800     -0.1300
+   1089.7000   1466.2600     34.8800     -0.1300
+   1089.8000   1466.2700     34.8800     -0.1300
+   1090.0000   1466.2700     34.8800     -0.1300
+   1090.1000   1466.2700     34.8800     -0.1300
+   1090.2000   1466.2700     34.8800     -0.1300
+   1090.4000   1466.2700     34.8800     -0.1300
+   1090.5000   1466.2800     34.8800     -0.1300
+   1090.6000   1466.2800     34.8800     -0.1300
+   1090.8000   1466.2800     34.8800     -0.1300
+   1090.9000   1466.2800     34.8800     -0.1300
+   1091.0000   1466.2800     34.8800     -0.1300
+   1091.1000   1466.2900     34.8800     -0.1300
+   1091.3000   1466.3100     34.9000     -0.1300
+   1091.4000   1466.3200     34.9000     -0.1300
+   1091.5000   1466.3200     34.9000     -0.1300
+   1091.7000   1466.2900     34.8800     -0.1300
+   1091.8000   1466.3000     34.8800     -0.1300
+   1091.9000   1466.3200     34.9000     -0.1300
+   1092.0000   1466.3000     34.8800     -0.1300
+   1092.2000   1466.3000     34.8800     -0.1300
+   1092.3000   1466.3000     34.8800     -0.1300
+   1092.4000   1466.3100     34.8800     -0.1300
+   1092.6000   1466.3100     34.8800     -0.1300
+   1092.7000   1466.3100     34.8800     -0.1300
+   1092.8000   1466.3100     34.8800     -0.1300
+   1093.0000   1466.3100     34.8800     -0.1300
+   1093.1000   1466.3200     34.8800     -0.1300
+   1093.2000   1466.3200     34.8800     -0.1300
+   1093.3000   1466.3200     34.8800     -0.1300
+   1093.5000   1466.3500     34.9000     -0.1300
+   1093.6000   1466.3200     34.8800     -0.1300
+   1093.7000   1466.3300     34.8800     -0.1300
+   1093.9000   1466.3600     34.9000     -0.1300
+   1094.0000   1466.3300     34.8800     -0.1300
+   1094.1000   1466.3300     34.8800     -0.1300
+   1094.2000   1466.3400     34.8800     -0.1300
+   1094.4000   1466.3400     34.8800     -0.1300
+   1094.5000   1466.3400     34.8800     -0.1300
+   1094.6000   1466.3700     34.9000     -0.1300
+   1094.8000   1466.3700     34.9000     -0.1300
+   1094.9000   1466.3700     34.9000     -0.1300
+   1095.0000   1466.3700     34.9000     -0.1300
+   1095.2000   1466.3500     34.8800     -0.1300
+   1095.3000   1466.3500     34.8800     -0.1300
+   1095.4000   1466.3500     34.8800     -0.1300
+   1095.5000   1466.3600     34.8800     -0.1300
+   1095.7000   1466.3800     34.9000     -0.1300
+   1095.8000   1466.3600     34.8800     -0.1300
+   1095.9000   1466.3600     34.8800     -0.1300
+   1096.1000   1466.3900     34.9000     -0.1300
+   1096.2000   1466.3900     34.9000     -0.1300
+   1096.3000   1466.3900     34.9000     -0.1300
+   1096.4000   1466.4000     34.9000     -0.1300
+   1096.6000   1466.3700     34.8800     -0.1300
+   1096.7000   1466.4000     34.9000     -0.1300
+   1096.8000   1466.4000     34.9000     -0.1300
+   1097.0000   1466.3800     34.8800     -0.1300
+   1097.1000   1466.3800     34.8800     -0.1300
+   1097.2000   1466.4100     34.9000     -0.1300
+   1097.4000   1466.4100     34.9000     -0.1300
+   1097.5000   1466.4100     34.9000     -0.1300
+   1097.6000   1466.4200     34.9000     -0.1300
+   1097.7000   1466.4200     34.9000     -0.1300
+   1097.9000   1466.4200     34.9000     -0.1300
+   1098.0000   1466.4200     34.9000     -0.1300
+   1098.1000   1466.4200     34.9000     -0.1300
+   1098.3000   1466.4000     34.8800     -0.1300
+   1098.4000   1466.4000     34.8800     -0.1300
+   1098.5000   1466.4300     34.9000     -0.1300
+   1098.6000   1466.4300     34.9000     -0.1300
+   1098.8000   1466.4300     34.9000     -0.1300
+   1098.9000   1466.4400     34.9000     -0.1300
+   1099.0000   1466.4400     34.9000     -0.1300
+   1099.2000   1466.4400     34.9000     -0.1300
+   1099.3000   1466.4400     34.9000     -0.1300
+   1099.4000   1466.4200     34.8800     -0.1300
+   1099.6000   1466.4200     34.8800     -0.1300
+   1099.7000   1466.4500     34.9000     -0.1300
+   1099.8000   1466.4500     34.9000     -0.1300
+   1099.9000   1466.4500     34.9000     -0.1300
+   1100.1000   1466.4500     34.9000     -0.1300
+   1100.2000   1466.4600     34.9000     -0.1300
+   1100.3000   1466.4600     34.8900     -0.1300
+   1100.5000   1466.4600     34.8900     -0.1300
+   1100.6000   1466.4600     34.8900     -0.1300
+   1100.7000   1466.4600     34.8900     -0.1300
+   1100.8000   1466.4700     34.8900     -0.1300
+   1101.0000   1466.4700     34.8900     -0.1300
+   1101.1000   1466.4700     34.8900     -0.1300
+   1101.2000   1466.4700     34.8900     -0.1300
+   1101.4000   1466.4700     34.8900     -0.1300
+   1101.5000   1466.4800     34.8900     -0.1300
+   1101.6000   1466.4800     34.8900     -0.1300
+   1101.8000   1466.4500     34.8700     -0.1300
+   1101.9000   1466.4300     34.8900     -0.1400
+   1102.0000   1466.4900     34.9000     -0.1300
+   1102.1000   1466.4500     34.9000     -0.1400
+   1102.3000   1466.5000     34.9000     -0.1300
+   1102.4000   1466.5000     34.9000     -0.1300
+   1102.5000   1466.4400     34.8900     -0.1400
+   1102.7000   1466.5000     34.9000     -0.1300
+   1102.8000   1466.4600     34.9000     -0.1400
+   1102.9000   1466.5100     34.9000     -0.1300
+   1103.0000   1466.4800     34.8800     -0.1300
+   1103.2000   1466.4300     34.8700     -0.1400
+   1103.3000   1466.4400     34.8800     -0.1400
+   1103.4000   1466.4700     34.9100     -0.1400
+   1103.6000   1466.5300     34.9100     -0.1300
+   1103.7000   1466.5200     34.9000     -0.1300
+   1103.8000   1466.4600     34.8900     -0.1400
+   1104.0000   1466.5200     34.9000     -0.1300
+   1104.1000   1466.4800     34.9000     -0.1400
+   1104.2000   1466.5300     34.9000     -0.1300
+   1104.3000   1466.5000     34.8800     -0.1300
+   1104.5000   1466.4500     34.8700     -0.1400
+   1104.6000   1466.5100     34.8800     -0.1300
+   1104.7000   1466.4600     34.8800     -0.1400
+   1104.9000   1466.5400     34.9000     -0.1300
+   1105.0000   1466.5400     34.9000     -0.1300
+   1105.1000   1466.4800     34.8900     -0.1400
+   1105.2000   1466.4900     34.9000     -0.1400
+   1105.4000   1466.5100     34.9000     -0.1400
+   1105.5000   1466.5600     34.9000     -0.1300
+   1105.6000   1466.5500     34.9000     -0.1300
+   1105.8000   1466.4900     34.8900     -0.1400
+   1105.9000   1466.5100     34.9000     -0.1400
+   1106.0000   1466.5200     34.9000     -0.1400
+   1106.1000   1466.5200     34.9000     -0.1400
+   1106.3000   1466.4900     34.8800     -0.1400
+   1106.4000   1466.5200     34.9000     -0.1400
+   1106.5000   1466.5700     34.9000     -0.1300
+   1106.7000   1466.5200     34.9000     -0.1400
+   1106.8000   1466.5200     34.9000     -0.1400
+   1106.9000   1466.5300     34.9000     -0.1400
+   1107.1000   1466.5300     34.9000     -0.1400
+   1107.2000   1466.5300     34.9000     -0.1400
+   1107.3000   1466.5400     34.9000     -0.1400
+   1107.4000   1466.5900     34.9000     -0.1300
+   1107.6000   1466.5300     34.9000     -0.1400
+   1107.7000   1466.5300     34.9000     -0.1400
+   1107.8000   1466.5900     34.9000     -0.1300
+   1108.0000   1466.5400     34.9000     -0.1400
+   1108.1000   1466.5900     34.9000     -0.1300
+   1108.2000   1466.5400     34.9000     -0.1400
+   1108.3000   1466.5400     34.9000     -0.1400
+   1108.5000   1466.6000     34.9000     -0.1300
+   1108.6000   1466.5500     34.9000     -0.1400
+   1108.7000   1466.6000     34.9000     -0.1300
+   1108.9000   1466.6000     34.9000     -0.1300
+   1109.0000   1466.5500     34.8900     -0.1400
+   1109.1000   1466.5600     34.9000     -0.1400
+   1109.3000   1466.5700     34.9000     -0.1400
+   1109.4000   1466.5700     34.9000     -0.1400
+   1109.5000   1466.6200     34.9000     -0.1300
+   1109.6000   1466.5600     34.9000     -0.1400
+   1109.8000   1466.6200     34.9000     -0.1300
+   1109.9000   1466.5700     34.9000     -0.1400
+   1110.0000   1466.6200     34.9000     -0.1300
+   1110.2000   1466.6200     34.9000     -0.1300
+   1110.3000   1466.5700     34.8900     -0.1400
+   1110.4000   1466.6300     34.9000     -0.1300
+   1110.5000   1466.5800     34.9000     -0.1400
+   1110.7000   1466.5800     34.9000     -0.1400
+   1110.8000   1466.6400     34.9000     -0.1300
+   1110.9000   1466.5900     34.8900     -0.1400
+   1111.1000   1466.5900     34.8900     -0.1400
+   1111.2000   1466.6000     34.9000     -0.1400
+   1111.3000   1466.6000     34.9000     -0.1400
+   1111.5000   1466.6000     34.9000     -0.1400
+   1111.6000   1466.6000     34.9000     -0.1400
+   1111.7000   1466.6100     34.9000     -0.1400
+   1111.8000   1466.6100     34.9000     -0.1400
+   1112.0000   1466.6100     34.9000     -0.1400
+   1112.1000   1466.6100     34.9000     -0.1400
+   1112.2000   1466.6100     34.9000     -0.1400
+   1112.4000   1466.6200     34.9000     -0.1400
+   1112.5000   1466.6200     34.9000     -0.1400
+   1112.6000   1466.6200     34.9000     -0.1400
+   1112.7000   1466.6200     34.9000     -0.1400
+   1112.9000   1466.6200     34.9000     -0.1400
+   1113.0000   1466.6300     34.9000     -0.1400
+   1113.1000   1466.6300     34.9000     -0.1400
+   1113.3000   1466.6000     34.8800     -0.1400
+   1113.4000   1466.6100     34.8800     -0.1400
+   1113.5000   1466.6300     34.9000     -0.1400
+   1113.6000   1466.6400     34.9000     -0.1400
+   1113.8000   1466.6100     34.8800     -0.1400
+   1113.9000   1466.6400     34.9000     -0.1400
+   1114.0000   1466.6400     34.9000     -0.1400
+   1114.2000   1466.6200     34.8800     -0.1400
+   1114.3000   1466.6200     34.8800     -0.1400
+   1114.4000   1466.6500     34.9000     -0.1400
+   1114.6000   1466.6500     34.9000     -0.1400
+   1114.7000   1466.6300     34.8800     -0.1400
+   1114.8000   1466.6300     34.8800     -0.1400
+   1114.9000   1466.6300     34.8800     -0.1400
+   1115.1000   1466.6600     34.9000     -0.1400
+   1115.2000   1466.6600     34.9000     -0.1400
+   1115.3000   1466.6600     34.9000     -0.1400
+   1115.5000   1466.6400     34.8800     -0.1400
+   1115.6000   1466.6400     34.8800     -0.1400
+   1115.7000   1466.6400     34.8800     -0.1400
+   1115.8000   1466.6700     34.9000     -0.1400
+   1116.0000   1466.6500     34.8800     -0.1400
+   1116.1000   1466.6000     34.8800     -0.1500
+   1116.2000   1466.6600     34.8800     -0.1400
+   1116.4000   1466.6100     34.8800     -0.1500
+   1116.5000   1466.6100     34.8800     -0.1500
+   1116.6000   1466.6700     34.8900     -0.1400
+   1116.8000   1466.6400     34.9000     -0.1500
+   1116.9000   1466.6200     34.8800     -0.1500
+   1117.0000   1466.6300     34.8900     -0.1500
+   1117.1000   1466.6300     34.8900     -0.1500
+   1117.3000   1466.6300     34.8900     -0.1500
+   1117.4000   1466.6400     34.8900     -0.1500
+   1117.5000   1466.6400     34.8900     -0.1500
+   1117.7000   1466.6400     34.8900     -0.1500
+   1117.8000   1466.6400     34.8900     -0.1500
+   1117.9000   1466.6400     34.8900     -0.1500
+   1118.0000   1466.6500     34.8900     -0.1500
+   1118.2000   1466.6500     34.8900     -0.1500
+   1118.3000   1466.6500     34.8900     -0.1500
+   1118.4000   1466.6500     34.8900     -0.1500
+   1118.6000   1466.6500     34.8900     -0.1500
+   1118.7000   1466.6600     34.8900     -0.1500
+   1118.8000   1466.6600     34.8900     -0.1500
+   1118.9000   1466.6600     34.8900     -0.1500
+   1119.1000   1466.6600     34.8900     -0.1500
+   1119.2000   1466.6600     34.8900     -0.1500
+   1119.3000   1466.6700     34.8900     -0.1500
+   1119.5000   1466.6700     34.8900     -0.1500
+   1119.6000   1466.6700     34.8900     -0.1500
+   1119.7000   1466.6700     34.8900     -0.1500
+   1119.9000   1466.6700     34.8900     -0.1500
+   1120.0000   1466.6800     34.8900     -0.1500
+   1120.1000   1466.6800     34.8900     -0.1500
+   1120.2000   1466.6800     34.8900     -0.1500
+   1120.4000   1466.6800     34.8900     -0.1500
+   1120.5000   1466.6900     34.8900     -0.1500
+   1120.6000   1466.6900     34.8900     -0.1500
+   1120.8000   1466.6900     34.8900     -0.1500
+   1120.9000   1466.6900     34.8900     -0.1500
+   1121.0000   1466.6900     34.8900     -0.1500
+   1121.1000   1466.7000     34.8900     -0.1500
+   1121.3000   1466.7000     34.8900     -0.1500
+   1121.4000   1466.7000     34.8900     -0.1500
+   1121.5000   1466.7000     34.8900     -0.1500
+   1121.7000   1466.7000     34.8900     -0.1500
+   1121.8000   1466.7100     34.8900     -0.1500
+   1121.9000   1466.7100     34.8900     -0.1500
+   1122.1000   1466.7100     34.8900     -0.1500
+   1122.2000   1466.7100     34.8900     -0.1500
+   1122.3000   1466.7100     34.8900     -0.1500
+   1122.4000   1466.7200     34.8900     -0.1500
+   1122.6000   1466.7200     34.8900     -0.1500
+   1122.7000   1466.7200     34.8900     -0.1500
+   1122.8000   1466.7200     34.8900     -0.1500
+   1123.0000   1466.7200     34.8900     -0.1500
+   1123.1000   1466.7300     34.8900     -0.1500
+   1123.2000   1466.7300     34.8900     -0.1500
+   1123.3000   1466.7300     34.8900     -0.1500
+   1123.5000   1466.6800     34.8900     -0.1600
+   1123.6000   1466.7400     34.8900     -0.1500
+   1123.7000   1466.7400     34.8900     -0.1500
+   1123.9000   1466.6900     34.8900     -0.1600
+   1124.0000   1466.7500     34.8900     -0.1500
+   1124.1000   1466.7500     34.8900     -0.1500
+   1124.2000   1466.7400     34.8900     -0.1500
+   1124.4000   1466.7500     34.8900     -0.1500
+   1124.5000   1466.7500     34.8900     -0.1500
+   1124.6000   1466.7500     34.8900     -0.1500
+   1124.8000   1466.7500     34.8900     -0.1500
+   1124.9000   1466.7500     34.8900     -0.1500
+   1125.0000   1466.7600     34.8900     -0.1500
+   1125.2000   1466.7600     34.8900     -0.1500
+   1125.3000   1466.7600     34.8800     -0.1500
+   1125.4000   1466.7600     34.8800     -0.1500
+   1125.5000   1466.7700     34.8800     -0.1500
+   1125.7000   1466.7700     34.8800     -0.1500
+   1125.8000   1466.7700     34.8800     -0.1500
+   1125.9000   1466.7700     34.8800     -0.1500
+   1126.1000   1466.7700     34.8800     -0.1500
+   1126.2000   1466.7800     34.8800     -0.1500
+   1126.3000   1466.7800     34.8800     -0.1500
+   1126.4000   1466.7800     34.8800     -0.1500
+   1126.6000   1466.7800     34.8800     -0.1500
+   1126.7000   1466.7300     34.8800     -0.1600
+   1126.8000   1466.7900     34.8900     -0.1500
+   1127.0000   1466.8000     34.8900     -0.1500
+   1127.1000   1466.7900     34.8800     -0.1500
+   1127.2000   1466.7900     34.8800     -0.1500
+   1127.3000   1466.7900     34.8800     -0.1500
+   1127.5000   1466.8000     34.8800     -0.1500
+   1127.6000   1466.8000     34.8800     -0.1500
+   1127.7000   1466.8000     34.8800     -0.1500
+   1127.9000   1466.8000     34.8800     -0.1500
+   1128.0000   1466.8000     34.8800     -0.1500
+   1128.1000   1466.8100     34.8800     -0.1500
+   1128.3000   1466.8100     34.8800     -0.1500
+   1128.4000   1466.7600     34.8800     -0.1600
+   1128.5000   1466.8200     34.8900     -0.1500
+   1128.6000   1466.8200     34.8900     -0.1500
+   1128.8000   1466.8200     34.8800     -0.1500
+   1128.9000   1466.8200     34.8800     -0.1500
+   1129.0000   1466.7700     34.8800     -0.1600
+   1129.2000   1466.8300     34.8900     -0.1500
+   1129.3000   1466.7800     34.8900     -0.1600
+   1129.4000   1466.8300     34.8900     -0.1500
+   1129.5000   1466.8400     34.8900     -0.1500
+   1129.7000   1466.7800     34.8800     -0.1600
+   1129.8000   1466.8400     34.8900     -0.1500
+   1129.9000   1466.8400     34.8900     -0.1500
+   1130.1000   1466.8400     34.8800     -0.1500
+   1130.2000   1466.8400     34.8800     -0.1500
+   1130.3000   1466.7900     34.8800     -0.1600
+   1130.4000   1466.8500     34.8900     -0.1500
+   1130.6000   1466.8000     34.8900     -0.1600
+   1130.7000   1466.8500     34.8900     -0.1500
+   1130.8000   1466.8600     34.8900     -0.1500
+   1131.0000   1466.8000     34.8800     -0.1600
+   1131.1000   1466.8600     34.8900     -0.1500
+   1131.2000   1466.8100     34.8900     -0.1600
+   1131.4000   1466.8200     34.8900     -0.1600
+   1131.5000   1466.8800     34.8900     -0.1500
+   1131.6000   1466.8200     34.8900     -0.1600
+   1131.7000   1466.8700     34.8900     -0.1500
+   1131.9000   1466.8200     34.8900     -0.1600
+   1132.0000   1466.8300     34.8900     -0.1600
+   1132.1000   1466.8900     34.8900     -0.1500
+   1132.3000   1466.8300     34.8900     -0.1600
+   1132.4000   1466.8300     34.8900     -0.1600
+   1132.5000   1466.8400     34.8900     -0.1600
+   1132.6000   1466.8400     34.8900     -0.1600
+   1132.8000   1466.8500     34.8900     -0.1600
+   1132.9000   1466.8500     34.8900     -0.1600
+   1133.0000   1466.8500     34.8900     -0.1600
+   1133.2000   1466.8500     34.8900     -0.1600
+   1133.3000   1466.8500     34.8900     -0.1600
+   1133.4000   1466.8800     34.9100     -0.1600
+   1133.5000   1466.8900     34.9100     -0.1600
+   1133.7000   1466.8600     34.8900     -0.1600
+   1133.8000   1466.8600     34.8900     -0.1600
+   1133.9000   1466.8700     34.8900     -0.1600
+   1134.1000   1466.8700     34.8900     -0.1600
+   1134.2000   1466.8700     34.8900     -0.1600
+   1134.3000   1466.8700     34.8900     -0.1600
+   1134.5000   1466.8700     34.8900     -0.1600
+   1134.6000   1466.8800     34.8900     -0.1600
+   1134.7000   1466.8800     34.8900     -0.1600
+   1134.8000   1466.8800     34.8900     -0.1600
+   1135.0000   1466.8800     34.8900     -0.1600
+   1135.1000   1466.8800     34.8900     -0.1600
+   1135.2000   1466.8900     34.8900     -0.1600
+   1135.4000   1466.8900     34.8900     -0.1600
+   1135.5000   1466.8900     34.8900     -0.1600
+   1135.6000   1466.8900     34.8900     -0.1600
+   1135.7000   1466.8900     34.8900     -0.1600
+   1135.9000   1466.9200     34.9100     -0.1600
+   1136.0000   1466.9000     34.8900     -0.1600
+   1136.1000   1466.9300     34.9100     -0.1600
+   1136.3000   1466.9300     34.9100     -0.1600
+   1136.4000   1466.9000     34.8900     -0.1600
+   1136.5000   1466.9300     34.9100     -0.1600
+   1136.6000   1466.9100     34.8900     -0.1600
+   1136.8000   1466.9100     34.8900     -0.1600
+   1136.9000   1466.9600     34.8900     -0.1500
+   1137.0000   1466.9100     34.8800     -0.1600
+   1137.2000   1466.9100     34.8800     -0.1600
+   1137.3000   1466.9700     34.8900     -0.1500
+   1137.4000   1466.9400     34.9000     -0.1600
+   1137.5000   1466.9400     34.9000     -0.1600
+   1137.7000   1466.9200     34.8900     -0.1600
+   1137.8000   1467.0000     34.9100     -0.1500
+   1137.9000   1466.9200     34.8800     -0.1600
+   1138.1000   1466.9200     34.8800     -0.1600
+   1138.2000   1466.9800     34.8900     -0.1500
+   1138.3000   1466.9300     34.8800     -0.1600
+   1138.5000   1467.0000     34.9000     -0.1500
+   1138.6000   1466.9300     34.8800     -0.1600
+   1138.7000   1466.9300     34.8800     -0.1600
+   1138.8000   1466.9900     34.8900     -0.1500
+   1139.0000   1466.9400     34.8800     -0.1600
+   1139.1000   1466.9900     34.8800     -0.1500
+   1139.2000   1467.0200     34.9000     -0.1500
+   1139.4000   1466.9600     34.9000     -0.1600
+   1139.5000   1467.0200     34.9000     -0.1500
+   1139.6000   1466.9700     34.9000     -0.1600
+   1139.7000   1467.0000     34.8800     -0.1500
+   1139.9000   1467.0300     34.9000     -0.1500
+   1140.0000   1467.0200     34.9000     -0.1500
+   1140.1000   1467.0200     34.9000     -0.1500
+   1140.3000   1467.0200     34.9000     -0.1500
+   1140.4000   1467.0300     34.9000     -0.1500
+   1140.5000   1467.0300     34.9000     -0.1500
+   1140.6000   1467.0300     34.9000     -0.1500
+   1140.8000   1467.0300     34.9000     -0.1500
+   1140.9000   1467.0400     34.9000     -0.1500
+   1141.0000   1467.0400     34.9000     -0.1500
+   1141.2000   1467.0400     34.9000     -0.1500
+   1141.3000   1467.0400     34.9000     -0.1500
+   1141.4000   1467.0400     34.9000     -0.1500
+   1141.6000   1467.0500     34.9000     -0.1500
+   1141.7000   1467.1200     34.9100     -0.1400
+   1141.8000   1467.0400     34.8900     -0.1500
+   1141.9000   1467.0400     34.8900     -0.1500
+   1142.1000   1467.0500     34.9000     -0.1500
+   1142.2000   1467.0800     34.9100     -0.1500
+   1142.3000   1467.1100     34.8900     -0.1400
+   1142.5000   1467.1000     34.8900     -0.1400
+   1142.6000   1467.0900     34.8800     -0.1400
+   1142.7000   1467.1200     34.9000     -0.1400
+   1142.8000   1467.1300     34.9000     -0.1400
+   1143.0000   1467.1300     34.9000     -0.1400
+   1143.1000   1467.1000     34.8800     -0.1400
+   1143.2000   1467.1300     34.9000     -0.1400
+   1143.4000   1467.1300     34.9000     -0.1400
+   1143.5000   1467.1400     34.9000     -0.1400
+   1143.6000   1467.1400     34.9000     -0.1400
+   1143.7000   1467.1400     34.9000     -0.1400
+   1143.9000   1467.1400     34.9000     -0.1400
+   1144.0000   1467.1400     34.9000     -0.1400
+   1144.1000   1467.1500     34.9000     -0.1400
+   1144.3000   1467.1500     34.9000     -0.1400
+   1144.4000   1467.1500     34.9000     -0.1400
+   1144.5000   1467.1500     34.9000     -0.1400
+   1144.6000   1467.1500     34.9000     -0.1400
+   1144.8000   1467.1600     34.9000     -0.1400
+   1144.9000   1467.1600     34.9000     -0.1400
+   1145.0000   1467.1600     34.9000     -0.1400
+   1145.2000   1467.1600     34.9000     -0.1400
+   1145.3000   1467.1600     34.9000     -0.1400
+   1145.4000   1467.1700     34.9000     -0.1400
+   1145.6000   1467.1700     34.9000     -0.1400
+   1145.7000   1467.1700     34.9000     -0.1400
+   1145.8000   1467.1700     34.9000     -0.1400
+   1145.9000   1467.1700     34.9000     -0.1400
+   1146.1000   1467.1800     34.9000     -0.1400
+   1146.2000   1467.1800     34.9000     -0.1400
+   1146.3000   1467.1800     34.9000     -0.1400
+   1146.5000   1467.1800     34.9000     -0.1400
+   1146.6000   1467.1800     34.9000     -0.1400
+   1146.7000   1467.1900     34.9000     -0.1400
+   1146.8000   1467.1900     34.9000     -0.1400
+   1147.0000   1467.1900     34.9000     -0.1400
+   1147.1000   1467.1900     34.9000     -0.1400
+   1147.2000   1467.1900     34.9000     -0.1400
+   1147.4000   1467.2000     34.9000     -0.1400
+   1147.5000   1467.2000     34.9000     -0.1400
+   1147.6000   1467.2000     34.9000     -0.1400
+   1147.7000   1467.2000     34.9000     -0.1400
+   1147.9000   1467.2500     34.9000     -0.1300
+   1148.0000   1467.2000     34.8900     -0.1400
+   1148.1000   1467.2000     34.8900     -0.1400
+   1148.3000   1467.2100     34.9000     -0.1400
+   1148.4000   1467.2100     34.9000     -0.1400
+   1148.5000   1467.2200     34.9000     -0.1400
+   1148.6000   1467.2200     34.9000     -0.1400
+   1148.8000   1467.2200     34.9000     -0.1400
+   1148.9000   1467.2200     34.9000     -0.1400
+   1149.0000   1467.2200     34.9000     -0.1400
+   1149.2000   1467.2300     34.9000     -0.1400
+   1149.3000   1467.2300     34.9000     -0.1400
+   1149.4000   1467.2300     34.9000     -0.1400
+   1149.6000   1467.2300     34.9000     -0.1400
+   1149.7000   1467.2300     34.9000     -0.1400
+   1149.8000   1467.2400     34.9000     -0.1400
+   1149.9000   1467.2400     34.9000     -0.1400
+   1150.1000   1467.2400     34.9000     -0.1400
+   1150.2000   1467.2400     34.9000     -0.1400
+   1150.3000   1467.2400     34.9000     -0.1400
+   1150.5000   1467.2500     34.9000     -0.1400
+   1150.6000   1467.2500     34.9000     -0.1400
+   1150.7000   1467.2500     34.9000     -0.1400
+   1150.8000   1467.2500     34.9000     -0.1400
+   1151.0000   1467.2500     34.9000     -0.1400
+   1151.1000   1467.2600     34.9000     -0.1400
+   1151.2000   1467.2600     34.9000     -0.1400
+   1151.4000   1467.2600     34.9000     -0.1400
+   1151.5000   1467.2600     34.9000     -0.1400
+   1151.6000   1467.2600     34.9000     -0.1400
+   1151.7000   1467.2700     34.9000     -0.1400
+   1151.9000   1467.2700     34.9000     -0.1400
+   1152.0000   1467.2700     34.9000     -0.1400
+   1152.1000   1467.2700     34.9000     -0.1400
+   1152.3000   1467.2700     34.9000     -0.1400
+   1152.4000   1467.2800     34.9000     -0.1400
+   1152.5000   1467.2800     34.9000     -0.1400
+   1152.6000   1467.2800     34.9000     -0.1400
+   1152.8000   1467.2800     34.9000     -0.1400
+   1152.9000   1467.2800     34.9000     -0.1400
+   1153.0000   1467.2900     34.9000     -0.1400
+   1153.2000   1467.2900     34.9000     -0.1400
+   1153.3000   1467.2900     34.9000     -0.1400
+   1153.4000   1467.2900     34.9000     -0.1400
+   1153.5000   1467.2900     34.9000     -0.1400
+   1153.7000   1467.3000     34.9000     -0.1400
+   1153.8000   1467.3000     34.9000     -0.1400
+   1153.9000   1467.3000     34.9000     -0.1400
+   1154.1000   1467.3000     34.9000     -0.1400
+   1154.2000   1467.3000     34.9000     -0.1400
+   1154.3000   1467.3100     34.9000     -0.1400
+   1154.5000   1467.3100     34.9000     -0.1400
+   1154.6000   1467.3100     34.9000     -0.1400
+   1154.7000   1467.3100     34.9000     -0.1400
+   1154.8000   1467.3200     34.9000     -0.1400
+   1155.0000   1467.3200     34.9000     -0.1400
+   1155.1000   1467.3200     34.9000     -0.1400
+   1155.2000   1467.3200     34.9000     -0.1400
+   1155.4000   1467.3200     34.9000     -0.1400
+   1155.5000   1467.3300     34.9000     -0.1400
+   1155.6000   1467.3300     34.9000     -0.1400
+   1155.7000   1467.3300     34.9000     -0.1400
+   1155.9000   1467.3300     34.8900     -0.1400
+   1156.0000   1467.3300     34.8900     -0.1400
+   1156.1000   1467.2900     34.8900     -0.1500
+   1156.3000   1467.3500     34.9000     -0.1400
+   1156.4000   1467.3000     34.9000     -0.1500
+   1156.5000   1467.3000     34.9000     -0.1500
+   1156.6000   1467.3600     34.9100     -0.1400
+   1156.8000   1467.3000     34.9000     -0.1500
+   1156.9000   1467.3600     34.9000     -0.1400
+   1157.0000   1467.3100     34.9000     -0.1500
+   1157.2000   1467.3600     34.9000     -0.1400
+   1157.3000   1467.3100     34.9000     -0.1500
+   1157.4000   1467.3200     34.9000     -0.1500
+   1157.5000   1467.3300     34.9100     -0.1500
+   1157.7000   1467.3300     34.9100     -0.1500
+   1157.8000   1467.3300     34.9100     -0.1500
+   1157.9000   1467.3300     34.9100     -0.1500
+   1158.1000   1467.3300     34.9100     -0.1500
+   1158.2000   1467.3400     34.9100     -0.1500
+   1158.3000   1467.3400     34.9100     -0.1500
+   1158.4000   1467.3400     34.9100     -0.1500
+   1158.6000   1467.3400     34.9100     -0.1500
+   1158.7000   1467.3400     34.9100     -0.1500
+   1158.8000   1467.3500     34.9100     -0.1500
+   1159.0000   1467.3500     34.9100     -0.1500
+   1159.1000   1467.3500     34.9100     -0.1500
+   1159.2000   1467.3500     34.9100     -0.1500
+   1159.4000   1467.3500     34.9000     -0.1500
+   1159.5000   1467.3600     34.9000     -0.1500
+   1159.6000   1467.3600     34.9000     -0.1500
+   1159.7000   1467.3600     34.9000     -0.1500
+   1159.9000   1467.3600     34.9000     -0.1500
+   1160.0000   1467.3600     34.9000     -0.1500
+   1160.1000   1467.3700     34.9000     -0.1500
+   1160.3000   1467.3700     34.9000     -0.1500
+   1160.4000   1467.3700     34.9000     -0.1500
+   1160.5000   1467.3700     34.9000     -0.1500
+   1160.6000   1467.3500     34.8800     -0.1500
+   1160.8000   1467.3800     34.9000     -0.1500
+   1160.9000   1467.3800     34.9000     -0.1500
+   1161.0000   1467.3800     34.9000     -0.1500
+   1161.2000   1467.3800     34.9000     -0.1500
+   1161.3000   1467.3600     34.8800     -0.1500
+   1161.4000   1467.3900     34.9000     -0.1500
+   1161.5000   1467.3600     34.8800     -0.1500
+   1161.7000   1467.3600     34.8800     -0.1500
+   1161.8000   1467.3900     34.9000     -0.1500
+   1161.9000   1467.3900     34.9000     -0.1500
+   1162.1000   1467.4000     34.9000     -0.1500
+   1162.2000   1467.4000     34.9000     -0.1500
+   1162.3000   1467.4000     34.9000     -0.1500
+   1162.4000   1467.4000     34.9000     -0.1500
+   1162.6000   1467.4100     34.9000     -0.1500
+   1162.7000   1467.4100     34.9000     -0.1500
+   1162.8000   1467.4100     34.9000     -0.1500
+   1163.0000   1467.4100     34.9000     -0.1500
+   1163.1000   1467.4100     34.9000     -0.1500
+   1163.2000   1467.4200     34.9000     -0.1500
+   1163.3000   1467.4200     34.9000     -0.1500
+   1163.5000   1467.4200     34.9000     -0.1500
+   1163.6000   1467.4200     34.9000     -0.1500
+   1163.7000   1467.4200     34.9000     -0.1500
+   1163.9000   1467.4300     34.9000     -0.1500
+   1164.0000   1467.4300     34.9000     -0.1500
+   1164.1000   1467.4300     34.9000     -0.1500
+   1164.3000   1467.4000     34.8800     -0.1500
+   1164.4000   1467.4100     34.8800     -0.1500
+   1164.5000   1467.4400     34.9000     -0.1500
+   1164.6000   1467.4400     34.9000     -0.1500
+   1164.8000   1467.4100     34.8800     -0.1500
+   1164.9000   1467.4400     34.9000     -0.1500
+   1165.0000   1467.4200     34.8800     -0.1500
+   1165.2000   1467.4500     34.9000     -0.1500
+   1165.3000   1467.4200     34.8800     -0.1500
+   1165.4000   1467.4500     34.9000     -0.1500
+   1165.5000   1467.4500     34.9000     -0.1500
+   1165.7000   1467.4500     34.9000     -0.1500
+   1165.8000   1467.4100     34.9000     -0.1600
+   1165.9000   1467.4700     34.9100     -0.1500
+   1166.1000   1467.4700     34.9100     -0.1500
+   1166.2000   1467.4600     34.9000     -0.1500
+   1166.3000   1467.4600     34.9000     -0.1500
+   1166.4000   1467.4700     34.9000     -0.1500
+   1166.6000   1467.4700     34.9000     -0.1500
+   1166.7000   1467.4700     34.9000     -0.1500
+   1166.8000   1467.4700     34.9000     -0.1500
+   1167.0000   1467.4700     34.9000     -0.1500
+   1167.1000   1467.4800     34.9000     -0.1500
+   1167.2000   1467.4800     34.9000     -0.1500
+   1167.3000   1467.4800     34.9000     -0.1500
+   1167.5000   1467.4800     34.9000     -0.1500
+   1167.6000   1467.4800     34.9000     -0.1500
+   1167.7000   1467.4400     34.9000     -0.1600
+   1167.9000   1467.5000     34.9100     -0.1500
+   1168.0000   1467.4500     34.9100     -0.1600
+   1168.1000   1467.4500     34.9100     -0.1600
+   1168.2000   1467.4600     34.9100     -0.1600
+   1168.4000   1467.4400     34.8900     -0.1600
+   1168.5000   1467.4400     34.8900     -0.1600
+   1168.6000   1467.4400     34.8900     -0.1600
+   1168.8000   1467.4400     34.8900     -0.1600
+   1168.9000   1467.4000     34.8900     -0.1700
+   1169.0000   1467.4100     34.9000     -0.1700
+   1169.1000   1467.4200     34.9000     -0.1700
+   1169.3000   1467.4200     34.9000     -0.1700
+   1169.4000   1467.4200     34.9000     -0.1700
+   1169.5000   1467.4700     34.9000     -0.1600
+   1169.7000   1467.4200     34.9000     -0.1700
+   1169.8000   1467.4200     34.9000     -0.1700
+   1169.9000   1467.4300     34.9000     -0.1700
+   1170.0000   1467.4800     34.9000     -0.1600
+   1170.2000   1467.4700     34.9000     -0.1600
+   1170.3000   1467.4200     34.8900     -0.1700
+   1170.4000   1467.4800     34.9000     -0.1600
+   1170.6000   1467.4800     34.9000     -0.1600
+   1170.7000   1467.4700     34.8900     -0.1600
+   1170.8000   1467.4800     34.8900     -0.1600
+   1171.0000   1467.4800     34.8900     -0.1600
+   1171.1000   1467.4800     34.8900     -0.1600
+   1171.2000   1467.4800     34.8900     -0.1600
+   1171.3000   1467.4800     34.8900     -0.1600
+   1171.5000   1467.4900     34.8900     -0.1600
+   1171.6000   1467.4900     34.8900     -0.1600
+   1171.7000   1467.5200     34.9100     -0.1600
+   1171.9000   1467.4900     34.8900     -0.1600
+   1172.0000   1467.4900     34.8900     -0.1600
+   1172.1000   1467.5000     34.8900     -0.1600
+   1172.2000   1467.5300     34.9100     -0.1600
+   1172.4000   1467.5300     34.9100     -0.1600
+   1172.5000   1467.5300     34.9100     -0.1600
+   1172.6000   1467.5000     34.8900     -0.1600
+   1172.8000   1467.5300     34.9100     -0.1600
+   1172.9000   1467.5400     34.9100     -0.1600
+   1173.0000   1467.5400     34.9100     -0.1600
+   1173.1000   1467.5100     34.8900     -0.1600
+   1173.3000   1467.5200     34.8900     -0.1600
+   1173.4000   1467.5200     34.8900     -0.1600
+   1173.5000   1467.5500     34.9100     -0.1600
+   1173.7000   1467.5200     34.8900     -0.1600
+   1173.8000   1467.5500     34.9100     -0.1600
+   1173.9000   1467.5500     34.9100     -0.1600
+   1174.0000   1467.5300     34.8900     -0.1600
+   1174.2000   1467.4800     34.8900     -0.1700
+   1174.3000   1467.5400     34.8900     -0.1600
+   1174.4000   1467.4900     34.8900     -0.1700
+   1174.6000   1467.5400     34.8900     -0.1600
+   1174.7000   1467.5000     34.8900     -0.1700
+   1174.8000   1467.5000     34.8900     -0.1700
+   1174.9000   1467.5100     34.9000     -0.1700
+   1175.1000   1467.5100     34.9000     -0.1700
+   1175.2000   1467.5100     34.9000     -0.1700
+   1175.3000   1467.5200     34.9000     -0.1700
+   1175.5000   1467.5200     34.9000     -0.1700
+   1175.6000   1467.5200     34.9000     -0.1700
+   1175.7000   1467.5200     34.9000     -0.1700
+   1175.8000   1467.5200     34.9000     -0.1700
+   1176.0000   1467.5300     34.9000     -0.1700
+   1176.1000   1467.5300     34.9000     -0.1700
+   1176.2000   1467.5300     34.9000     -0.1700
+   1176.4000   1467.5300     34.9000     -0.1700
+   1176.5000   1467.5300     34.9000     -0.1700
+   1176.6000   1467.5400     34.9000     -0.1700
+   1176.7000   1467.5400     34.9000     -0.1700
+   1176.9000   1467.5400     34.9000     -0.1700
+   1177.0000   1467.5400     34.9000     -0.1700
+   1177.1000   1467.5400     34.9000     -0.1700
+   1177.3000   1467.5500     34.9000     -0.1700
+   1177.4000   1467.5500     34.9000     -0.1700
+   1177.5000   1467.5500     34.9000     -0.1700
+   1177.6000   1467.5500     34.9000     -0.1700
+   1177.8000   1467.5500     34.9000     -0.1700
+   1177.9000   1467.5600     34.9000     -0.1700
+   1178.0000   1467.5600     34.9000     -0.1700
+   1178.2000   1467.5600     34.9000     -0.1700
+   1178.3000   1467.5600     34.9000     -0.1700
+   1178.4000   1467.5600     34.9000     -0.1700
+   1178.6000   1467.5700     34.9000     -0.1700
+   1178.7000   1467.5700     34.9000     -0.1700
+   1178.8000   1467.5700     34.9000     -0.1700
+   1178.9000   1467.5700     34.9000     -0.1700
+   1179.1000   1467.5700     34.9000     -0.1700
+   1179.2000   1467.5800     34.9000     -0.1700
+   1179.3000   1467.5800     34.9000     -0.1700
+   1179.5000   1467.5800     34.9000     -0.1700
+   1179.6000   1467.5800     34.9000     -0.1700
+   1179.7000   1467.6300     34.9000     -0.1600
+   1179.8000   1467.6300     34.8900     -0.1600
+   1180.0000   1467.6000     34.9100     -0.1700
+   1180.1000   1467.6300     34.8900     -0.1600
+   1180.2000   1467.5800     34.8900     -0.1700
+   1180.4000   1467.6400     34.8900     -0.1600
+   1180.5000   1467.6600     34.9100     -0.1600
+   1180.6000   1467.5800     34.8900     -0.1700
+   1180.7000   1467.6200     34.9100     -0.1700
+   1180.9000   1467.6000     34.9000     -0.1700
+   1181.0000   1467.6000     34.9000     -0.1700
+   1181.1000   1467.6100     34.9000     -0.1700
+   1181.3000   1467.6100     34.9000     -0.1700
+   1181.4000   1467.6100     34.9000     -0.1700
+   1181.5000   1467.6100     34.9000     -0.1700
+   1181.6000   1467.6200     34.9000     -0.1700
+   1181.8000   1467.6200     34.9000     -0.1700
+   1181.9000   1467.6200     34.9000     -0.1700
+   1182.0000   1467.6200     34.9000     -0.1700
+   1182.2000   1467.6200     34.9000     -0.1700
+   1182.3000   1467.6300     34.9000     -0.1700
+   1182.4000   1467.6300     34.9000     -0.1700
+   1182.5000   1467.6300     34.9000     -0.1700
+   1182.7000   1467.6300     34.9000     -0.1700
+   1182.8000   1467.5800     34.9000     -0.1800
+   1182.9000   1467.6400     34.9000     -0.1700
+   1183.1000   1467.6500     34.9000     -0.1700
+   1183.2000   1467.5900     34.9000     -0.1800
+   1183.3000   1467.6500     34.9000     -0.1700
+   1183.4000   1467.6000     34.9000     -0.1800
+   1183.6000   1467.6000     34.9000     -0.1800
+   1183.7000   1467.6600     34.9100     -0.1700
+   1183.8000   1467.6100     34.9000     -0.1800
+   1184.0000   1467.6600     34.9000     -0.1700
+   1184.1000   1467.6100     34.9000     -0.1800
+   1184.2000   1467.6600     34.9000     -0.1700
+   1184.3000   1467.6700     34.9000     -0.1700
+   1184.5000   1467.6600     34.8900     -0.1700
+   1184.6000   1467.7400     34.9100     -0.1600
+   1184.7000   1467.7300     34.9100     -0.1600
+   1184.9000   1467.7300     34.9000     -0.1600
+   1185.0000   1467.7300     34.9000     -0.1600
+   1185.1000   1467.7300     34.9000     -0.1600
+   1185.2000   1467.7300     34.9000     -0.1600
+   1185.4000   1467.7300     34.9000     -0.1600
+   1185.5000   1467.7400     34.9000     -0.1600
+   1185.6000   1467.7400     34.9000     -0.1600
+   1185.8000   1467.7400     34.9000     -0.1600
+   1185.9000   1467.7400     34.9000     -0.1600
+   1186.0000   1467.7400     34.9000     -0.1600
+   1186.1000   1467.7900     34.9000     -0.1500
+   1186.3000   1467.7900     34.9000     -0.1500
+   1186.4000   1467.7800     34.8900     -0.1500
+   1186.5000   1467.8100     34.9100     -0.1500
+   1186.7000   1467.7900     34.8900     -0.1500
+   1186.8000   1467.8200     34.9100     -0.1500
+   1186.9000   1467.8200     34.9100     -0.1500
+   1187.0000   1467.8200     34.9100     -0.1500
+   1187.2000   1467.8200     34.9100     -0.1500
+   1187.3000   1467.8000     34.8900     -0.1500
+   1187.4000   1467.8300     34.9100     -0.1500
+   1187.6000   1467.8300     34.9100     -0.1500
+   1187.7000   1467.8300     34.9100     -0.1500
+   1187.8000   1467.8300     34.9100     -0.1500
+   1187.9000   1467.8300     34.9100     -0.1500
+   1188.1000   1467.8900     34.9100     -0.1400
+   1188.2000   1467.8300     34.9000     -0.1500
+   1188.3000   1467.8300     34.9000     -0.1500
+   1188.5000   1467.8900     34.9100     -0.1400
+   1188.6000   1467.8400     34.9000     -0.1500
+   1188.7000   1467.8900     34.9000     -0.1400
+   1188.9000   1467.8400     34.9000     -0.1500
+   1189.0000   1467.8400     34.9000     -0.1500
+   1189.1000   1467.9000     34.9100     -0.1400
+   1189.2000   1467.8500     34.9000     -0.1500
+   1189.4000   1467.8500     34.9000     -0.1500
+   1189.5000   1467.8600     34.9100     -0.1500
+   1189.6000   1467.8600     34.9100     -0.1500
+   1189.8000   1467.8600     34.9100     -0.1500
+   1189.9000   1467.8600     34.9100     -0.1500
+   1190.0000   1467.8700     34.9100     -0.1500
+   1190.1000   1467.8700     34.9100     -0.1500
+   1190.3000   1467.8700     34.9100     -0.1500
+   1190.4000   1467.8700     34.9100     -0.1500
+   1190.5000   1467.8700     34.9100     -0.1500
+   1190.7000   1467.8800     34.9100     -0.1500
+   1190.8000   1467.8800     34.9100     -0.1500
+   1190.9000   1467.8800     34.9100     -0.1500
+   1191.0000   1467.8800     34.9100     -0.1500
+   1191.2000   1467.8900     34.9100     -0.1500
+   1191.3000   1467.8900     34.9100     -0.1500
+   1191.4000   1467.8900     34.9100     -0.1500
+   1191.6000   1467.8900     34.9100     -0.1500
+   1191.7000   1467.8900     34.9100     -0.1500
+   1191.8000   1467.9000     34.9100     -0.1500
+   1191.9000   1467.9000     34.9100     -0.1500
+   1192.1000   1467.9000     34.9100     -0.1500
+   1192.2000   1467.9000     34.9100     -0.1500
+   1192.3000   1467.9000     34.9100     -0.1500
+   1192.5000   1467.9100     34.9100     -0.1500
+   1192.6000   1467.9100     34.9100     -0.1500
+   1192.7000   1467.9100     34.9100     -0.1500
+   1192.8000   1467.9100     34.9100     -0.1500
+   1193.0000   1467.9100     34.9100     -0.1500
+   1193.1000   1467.8900     34.8900     -0.1500
+   1193.2000   1467.9200     34.9100     -0.1500
+   1193.4000   1467.9200     34.9100     -0.1500
+   1193.5000   1467.9200     34.9100     -0.1500
+   1193.6000   1467.9000     34.8900     -0.1500
+   1193.7000   1467.9000     34.8900     -0.1500
+   1193.9000   1467.9300     34.9100     -0.1500
+   1194.0000   1467.9300     34.9000     -0.1500
+   1194.1000   1467.9300     34.9000     -0.1500
+   1194.3000   1467.9300     34.9000     -0.1500
+   1194.4000   1467.9400     34.9000     -0.1500
+   1194.5000   1467.9400     34.9000     -0.1500
+   1194.6000   1467.9400     34.9000     -0.1500
+   1194.8000   1467.9400     34.9000     -0.1500
+   1194.9000   1467.9400     34.9000     -0.1500
+   1195.0000   1467.9200     34.8800     -0.1500
+   1195.2000   1467.9500     34.9000     -0.1500
+   1195.3000   1467.9500     34.9000     -0.1500
+   1195.4000   1467.9500     34.9000     -0.1500
+   1195.5000   1467.9500     34.9000     -0.1500
+   1195.7000   1467.9300     34.8800     -0.1500
+   1195.8000   1467.9600     34.9000     -0.1500
+   1195.9000   1467.9600     34.9000     -0.1500
+   1196.1000   1467.9600     34.9000     -0.1500
+   1196.2000   1467.9600     34.9000     -0.1500
+   1196.3000   1467.9700     34.9000     -0.1500
+   1196.4000   1467.9700     34.9000     -0.1500
+   1196.6000   1467.9700     34.9000     -0.1500
+   1196.7000   1467.9700     34.9000     -0.1500
+   1196.8000   1467.9700     34.9000     -0.1500
+   1197.0000   1467.9000     34.8800     -0.1600
+   1197.1000   1467.9900     34.9100     -0.1500
+   1197.2000   1467.9900     34.9100     -0.1500
+   1197.3000   1467.9800     34.9000     -0.1500
+   1197.5000   1467.9600     34.8800     -0.1500
+   1197.6000   1467.9600     34.8800     -0.1500
+   1197.7000   1467.9900     34.9000     -0.1500
+   1197.9000   1467.9900     34.9000     -0.1500
+   1198.0000   1467.9400     34.9000     -0.1600
+   1198.1000   1468.0000     34.9100     -0.1500
+   1198.2000   1467.9600     34.9100     -0.1600
+   1198.4000   1468.0100     34.9100     -0.1500
+   1198.5000   1468.0100     34.9100     -0.1500
+   1198.6000   1467.9500     34.9000     -0.1600
+   1198.8000   1468.0100     34.9100     -0.1500
+   1198.9000   1467.9700     34.9100     -0.1600
+   1199.0000   1468.0200     34.9100     -0.1500
+   1199.1000   1468.0200     34.9100     -0.1500
+   1199.3000   1467.9600     34.9000     -0.1600
+   1199.4000   1468.0200     34.9100     -0.1500
+   1199.5000   1467.9800     34.9100     -0.1600
+   1199.7000   1468.0300     34.9100     -0.1500
+   1199.8000   1468.0300     34.9100     -0.1500
+   1199.9000   1467.9700     34.9000     -0.1600
+   1200.0000   1468.0300     34.9100     -0.1500
+   1200.2000   1467.9900     34.9100     -0.1600
+   1200.3000   1467.9900     34.9100     -0.1600
+   1200.4000   1468.0500     34.9100     -0.1500
+   1200.6000   1467.9900     34.9100     -0.1600
+   1200.7000   1468.0400     34.9100     -0.1500
+   1200.8000   1468.0000     34.9100     -0.1600
+   1200.9000   1468.0000     34.9100     -0.1600
+   1201.1000   1468.0100     34.9100     -0.1600
+   1201.2000   1468.0100     34.9100     -0.1600
+   1201.3000   1468.0100     34.9100     -0.1600
+   1201.5000   1468.0200     34.9100     -0.1600
+   1201.6000   1468.0200     34.9100     -0.1600
+   1201.7000   1468.0200     34.9100     -0.1600
+   1201.8000   1468.0200     34.9100     -0.1600
+   1202.0000   1468.0000     34.8900     -0.1600
+   1202.1000   1468.0300     34.9100     -0.1600
+   1202.2000   1468.0300     34.9100     -0.1600
+   1202.4000   1468.0300     34.9100     -0.1600
+   1202.5000   1468.0300     34.9100     -0.1600
+   1202.6000   1468.0100     34.8900     -0.1600
+   1202.7000   1468.0400     34.9100     -0.1600
+   1202.9000   1468.0400     34.9100     -0.1600
+   1203.0000   1468.0400     34.9100     -0.1600
+   1203.1000   1468.0400     34.9100     -0.1600
+   1203.3000   1468.0200     34.8900     -0.1600
+   1203.4000   1468.0500     34.9100     -0.1600
+   1203.5000   1468.0500     34.9100     -0.1600
+   1203.6000   1468.0500     34.9100     -0.1600
+   1203.8000   1468.0500     34.9100     -0.1600
+   1203.9000   1468.0500     34.9100     -0.1600
+   1204.0000   1468.0600     34.9100     -0.1600
+   1204.2000   1468.0600     34.9100     -0.1600
+   1204.3000   1468.0600     34.9100     -0.1600
+   1204.4000   1468.0600     34.9100     -0.1600
+   1204.5000   1468.0600     34.9100     -0.1600
+   1204.7000   1468.0400     34.8900     -0.1600
+   1204.8000   1468.0700     34.9100     -0.1600
+   1204.9000   1468.0700     34.9100     -0.1600
+   1205.1000   1468.0500     34.8900     -0.1600
+   1205.2000   1468.0700     34.9100     -0.1600
+   1205.3000   1468.0800     34.9100     -0.1600
+   1205.4000   1468.0800     34.9100     -0.1600
+   1205.6000   1468.0800     34.9100     -0.1600
+   1205.7000   1468.0800     34.9100     -0.1600
+   1205.8000   1468.0800     34.9100     -0.1600
+   1206.0000   1468.0900     34.9100     -0.1600
+   1206.1000   1468.0900     34.9100     -0.1600
+   1206.2000   1468.0900     34.9100     -0.1600
+   1206.3000   1468.0900     34.9100     -0.1600
+   1206.5000   1468.1000     34.9100     -0.1600
+   1206.6000   1468.0700     34.8900     -0.1600
+   1206.7000   1468.1000     34.9100     -0.1600
+   1206.9000   1468.1000     34.9100     -0.1600
+   1207.0000   1468.1000     34.9100     -0.1600
+   1207.1000   1468.1100     34.9100     -0.1600
+   1207.2000   1468.1100     34.9100     -0.1600
+   1207.4000   1468.1600     34.9100     -0.1500
+   1207.5000   1468.1000     34.9000     -0.1600
+   1207.6000   1468.1100     34.9000     -0.1600
+   1207.8000   1468.1600     34.9100     -0.1500
+   1207.9000   1468.1100     34.9000     -0.1600
+   1208.0000   1468.1100     34.9000     -0.1600
+   1208.1000   1468.1200     34.9100     -0.1600
+   1208.3000   1468.1200     34.9100     -0.1600
+   1208.4000   1468.1300     34.9100     -0.1600
+   1208.5000   1468.1300     34.9100     -0.1600
+   1208.7000   1468.1300     34.9100     -0.1600
+   1208.8000   1468.1300     34.9100     -0.1600
+   1208.9000   1468.1300     34.9100     -0.1600
+   1209.0000   1468.1400     34.9100     -0.1600
+   1209.2000   1468.1400     34.9100     -0.1600
+   1209.3000   1468.1400     34.9100     -0.1600
+   1209.4000   1468.1400     34.9100     -0.1600
+   1209.6000   1468.1400     34.9100     -0.1600
+   1209.7000   1468.1500     34.9100     -0.1600
+   1209.8000   1468.1500     34.9100     -0.1600
+   1209.9000   1468.1500     34.9100     -0.1600
+   1210.1000   1468.1500     34.9100     -0.1600
+   1210.2000   1468.1500     34.9100     -0.1600
+   1210.3000   1468.2100     34.9100     -0.1500
+   1210.5000   1468.1500     34.9000     -0.1600
+   1210.6000   1468.1500     34.9000     -0.1600
+   1210.7000   1468.1600     34.9100     -0.1600
+   1210.8000   1468.1600     34.9100     -0.1600
+   1211.0000   1468.1700     34.9100     -0.1600
+   1211.1000   1468.1700     34.9100     -0.1600
+   1211.2000   1468.1700     34.9100     -0.1600
+   1211.4000   1468.1700     34.9100     -0.1600
+   1211.5000   1468.1700     34.9100     -0.1600
+   1211.6000   1468.1800     34.9100     -0.1600
+   1211.7000   1468.1800     34.9100     -0.1600
+   1211.9000   1468.1800     34.9100     -0.1600
+   1212.0000   1468.1800     34.9100     -0.1600
+   1212.1000   1468.1800     34.9100     -0.1600
+   1212.3000   1468.1900     34.9100     -0.1600
+   1212.4000   1468.1900     34.9100     -0.1600
+   1212.5000   1468.1900     34.9100     -0.1600
+   1212.6000   1468.1900     34.9100     -0.1600
+   1212.8000   1468.1900     34.9100     -0.1600
+   1212.9000   1468.2000     34.9100     -0.1600
+   1213.0000   1468.2000     34.9100     -0.1600
+   1213.2000   1468.2000     34.9100     -0.1600
+   1213.3000   1468.2000     34.9100     -0.1600
+   1213.4000   1468.2100     34.9100     -0.1600
+   1213.5000   1468.2100     34.9100     -0.1600
+   1213.7000   1468.2100     34.9100     -0.1600
+   1213.8000   1468.2100     34.9100     -0.1600
+   1213.9000   1468.2100     34.9100     -0.1600
+   1214.1000   1468.2200     34.9100     -0.1600
+   1214.2000   1468.2200     34.9100     -0.1600
+   1214.3000   1468.2200     34.9100     -0.1600
+   1214.4000   1468.2200     34.9100     -0.1600
+   1214.6000   1468.2200     34.9100     -0.1600
+   1214.7000   1468.2300     34.9100     -0.1600
+   1214.8000   1468.2300     34.9100     -0.1600
+   1215.0000   1468.2300     34.9100     -0.1600
+   1215.1000   1468.2300     34.9000     -0.1600
+   1215.2000   1468.2300     34.9000     -0.1600
+   1215.3000   1468.2400     34.9000     -0.1600
+   1215.5000   1468.2400     34.9000     -0.1600
+   1215.6000   1468.2400     34.9000     -0.1600
+   1215.7000   1468.2400     34.9000     -0.1600
+   1215.9000   1468.2400     34.9000     -0.1600
+   1216.0000   1468.2500     34.9000     -0.1600
+   1216.1000   1468.2500     34.9000     -0.1600
+   1216.2000   1468.2500     34.9000     -0.1600
+   1216.4000   1468.2500     34.9000     -0.1600
+   1216.5000   1468.2500     34.9000     -0.1600
+   1216.6000   1468.2600     34.9000     -0.1600
+   1216.8000   1468.2600     34.9000     -0.1600
+   1216.9000   1468.2600     34.9000     -0.1600
+   1217.0000   1468.2600     34.9000     -0.1600
+   1217.1000   1468.2600     34.9000     -0.1600
+   1217.3000   1468.2700     34.9000     -0.1600
+   1217.4000   1468.2700     34.9000     -0.1600
+   1217.5000   1468.2700     34.9000     -0.1600
+   1217.7000   1468.2700     34.9000     -0.1600
+   1217.8000   1468.2700     34.9000     -0.1600
+   1217.9000   1468.2800     34.9000     -0.1600
+   1218.0000   1468.2800     34.9000     -0.1600
+   1218.2000   1468.2800     34.9000     -0.1600
+   1218.3000   1468.2800     34.9000     -0.1600
+   1218.4000   1468.2800     34.9000     -0.1600
+   1218.6000   1468.2900     34.9000     -0.1600
+   1218.7000   1468.2900     34.9000     -0.1600
+   1218.8000   1468.2900     34.9000     -0.1600
+   1218.9000   1468.2900     34.9000     -0.1600
+   1219.1000   1468.2900     34.9000     -0.1600
+   1219.2000   1468.2500     34.9000     -0.1700
+   1219.3000   1468.3100     34.9100     -0.1600
+   1219.5000   1468.2300     34.8900     -0.1700
+   1219.6000   1468.2600     34.9100     -0.1700
+   1219.7000   1468.3200     34.9100     -0.1600
+   1219.8000   1468.2700     34.9100     -0.1700
+   1220.0000   1468.3200     34.9100     -0.1600
+   1220.1000   1468.2400     34.8900     -0.1700
+   1220.2000   1468.2700     34.9100     -0.1700
+   1220.4000   1468.3300     34.9100     -0.1600
+   1220.5000   1468.2800     34.9100     -0.1700
+   1220.6000   1468.3300     34.9100     -0.1600
+   1220.7000   1468.2800     34.9100     -0.1700
+   1220.9000   1468.3300     34.9100     -0.1600
+   1221.0000   1468.3300     34.9100     -0.1600
+   1221.1000   1468.3300     34.9000     -0.1600
+   1221.3000   1468.3300     34.9000     -0.1600
+   1221.4000   1468.3300     34.9000     -0.1600
+   1221.5000   1468.3300     34.9000     -0.1600
+   1221.6000   1468.3400     34.9000     -0.1600
+   1221.8000   1468.2900     34.9000     -0.1700
+   1221.9000   1468.3500     34.9100     -0.1600
+   1222.0000   1468.3500     34.9100     -0.1600
+   1222.2000   1468.3400     34.9000     -0.1600
+   1222.3000   1468.3500     34.9000     -0.1600
+   1222.4000   1468.3500     34.9000     -0.1600
+   1222.5000   1468.3500     34.9000     -0.1600
+   1222.7000   1468.3000     34.9000     -0.1700
+   1222.8000   1468.3600     34.9100     -0.1600
+   1222.9000   1468.3600     34.9100     -0.1600
+   1223.0000   1468.3100     34.9000     -0.1700
+   1223.2000   1468.3200     34.9100     -0.1700
+   1223.3000   1468.3300     34.9100     -0.1700
+   1223.4000   1468.3300     34.9100     -0.1700
+   1223.6000   1468.3300     34.9100     -0.1700
+   1223.7000   1468.3400     34.9100     -0.1700
+   1223.8000   1468.3100     34.8900     -0.1700
+   1223.9000   1468.3400     34.9100     -0.1700
+   1224.1000   1468.3400     34.9100     -0.1700
+   1224.2000   1468.3400     34.9100     -0.1700
+   1224.3000   1468.3500     34.9100     -0.1700
+   1224.5000   1468.3500     34.9100     -0.1700
+   1224.6000   1468.3500     34.9100     -0.1700
+   1224.7000   1468.3500     34.9100     -0.1700
+   1224.8000   1468.3500     34.9100     -0.1700
+   1225.0000   1468.3600     34.9100     -0.1700
+   1225.1000   1468.3600     34.9100     -0.1700
+   1225.2000   1468.3600     34.9100     -0.1700
+   1225.4000   1468.3600     34.9100     -0.1700
+   1225.5000   1468.3600     34.9100     -0.1700
+   1225.6000   1468.3700     34.9100     -0.1700
+   1225.7000   1468.3700     34.9100     -0.1700
+   1225.9000   1468.3400     34.8900     -0.1700
+   1226.0000   1468.3700     34.9100     -0.1700
+   1226.1000   1468.3700     34.9100     -0.1700
+   1226.3000   1468.3800     34.9100     -0.1700
+   1226.4000   1468.3800     34.9100     -0.1700
+   1226.5000   1468.3800     34.9100     -0.1700
+   1226.6000   1468.3800     34.9100     -0.1700
+   1226.8000   1468.3800     34.9100     -0.1700
+   1226.9000   1468.3900     34.9100     -0.1700
+   1227.0000   1468.3900     34.9100     -0.1700
+   1227.2000   1468.3900     34.9100     -0.1700
+   1227.3000   1468.3900     34.9100     -0.1700
+   1227.4000   1468.3900     34.9100     -0.1700
+   1227.5000   1468.4000     34.9100     -0.1700
+   1227.7000   1468.4000     34.9100     -0.1700
+   1227.8000   1468.4000     34.9100     -0.1700
+   1227.9000   1468.4000     34.9100     -0.1700
+   1228.1000   1468.4000     34.9100     -0.1700
+   1228.2000   1468.4100     34.9100     -0.1700
+   1228.3000   1468.4100     34.9100     -0.1700
+   1228.4000   1468.3800     34.8900     -0.1700
+   1228.6000   1468.4100     34.9100     -0.1700
+   1228.7000   1468.4200     34.9100     -0.1700
+   1228.8000   1468.3700     34.9100     -0.1800
+   1229.0000   1468.3500     34.9000     -0.1800
+   1229.1000   1468.3600     34.9000     -0.1800
+   1229.2000   1468.3600     34.9000     -0.1800
+   1229.3000   1468.3700     34.9000     -0.1800
+   1229.5000   1468.3700     34.9000     -0.1800
+   1229.6000   1468.3700     34.9000     -0.1800
+   1229.7000   1468.3700     34.9000     -0.1800
+   1229.9000   1468.3700     34.9000     -0.1800
+   1230.0000   1468.3800     34.9000     -0.1800
+   1230.1000   1468.3800     34.9000     -0.1800
+   1230.2000   1468.3800     34.9000     -0.1800
+   1230.4000   1468.3800     34.9000     -0.1800
+   1230.5000   1468.3800     34.9000     -0.1800
+   1230.6000   1468.3400     34.9000     -0.2000
+   1230.8000   1468.3500     34.9100     -0.2000
+   1230.9000   1468.3600     34.9100     -0.2000
+   1231.0000   1468.3600     34.9100     -0.2000
+   1231.1000   1468.3600     34.9100     -0.2000
+   1231.3000   1468.3600     34.9100     -0.2000
+   1231.4000   1468.3700     34.9100     -0.2000
+   1231.5000   1468.3700     34.9100     -0.2000
+   1231.7000   1468.3700     34.9100     -0.2000
+   1231.8000   1468.3700     34.9100     -0.2000
+   1231.9000   1468.3500     34.8900     -0.2000
+   1232.0000   1468.3800     34.9100     -0.2000
+   1232.2000   1468.3800     34.9100     -0.2000
+   1232.3000   1468.3800     34.9100     -0.2000
+   1232.4000   1468.3800     34.9100     -0.2000
+   1232.6000   1468.3800     34.9100     -0.2000
+   1232.7000   1468.3900     34.9100     -0.2000
+   1232.8000   1468.3900     34.9100     -0.2000
+   1232.9000   1468.3900     34.9100     -0.2000
+   1233.1000   1468.3900     34.9100     -0.2000
+   1233.2000   1468.3900     34.9100     -0.2000
+   1233.3000   1468.4000     34.9100     -0.2000
+   1233.4000   1468.4000     34.9100     -0.2000
+   1233.6000   1468.4000     34.9100     -0.2000
+   1233.7000   1468.4000     34.9100     -0.2000
+   1233.8000   1468.4000     34.9100     -0.2000
+   1234.0000   1468.4100     34.9100     -0.2000
+   1234.1000   1468.4100     34.9100     -0.2000
+   1234.2000   1468.4100     34.9100     -0.2000
+   1234.3000   1468.4100     34.9100     -0.2000
+   1234.5000   1468.4600     34.9100     -0.1800
+   1234.6000   1468.4100     34.9000     -0.2000
+   1234.7000   1468.4600     34.9000     -0.1800
+   1234.9000   1468.4100     34.9000     -0.2000
+   1235.0000   1468.4600     34.9000     -0.1800
+   1235.1000   1468.4700     34.9000     -0.1800
+   1235.2000   1468.4600     34.9000     -0.1800
+   1235.4000   1468.4600     34.9000     -0.1800
+   1235.5000   1468.4100     34.9000     -0.2000
+   1235.6000   1468.4700     34.9000     -0.1800
+   1235.8000   1468.4800     34.9000     -0.1800
+   1235.9000   1468.4200     34.9000     -0.2000
+   1236.0000   1468.4800     34.9000     -0.1800
+   1236.1000   1468.4300     34.9000     -0.2000
+   1236.3000   1468.4600     34.9200     -0.2000
+   1236.4000   1468.4900     34.9100     -0.1800
+   1236.5000   1468.4400     34.9000     -0.2000
+   1236.7000   1468.4400     34.9000     -0.2000
+   1236.8000   1468.4500     34.9100     -0.2000
+   1236.9000   1468.4500     34.9100     -0.2000
+   1237.0000   1468.4600     34.9100     -0.2000
+   1237.2000   1468.4600     34.9100     -0.2000
+   1237.3000   1468.4600     34.9100     -0.2000
+   1237.4000   1468.4600     34.9100     -0.2000
+   1237.6000   1468.4600     34.9100     -0.2000
+   1237.7000   1468.4700     34.9100     -0.2000
+   1237.8000   1468.4700     34.9100     -0.2000
+   1237.9000   1468.4700     34.9100     -0.2000
+   1238.1000   1468.4700     34.9100     -0.2000
+   1238.2000   1468.4700     34.9100     -0.2000
+   1238.3000   1468.4800     34.9100     -0.2000
+   1238.5000   1468.4800     34.9100     -0.2000
+   1238.6000   1468.4800     34.9100     -0.2000
+   1238.7000   1468.4800     34.9100     -0.2000
+   1238.8000   1468.4800     34.9100     -0.2000
+   1239.0000   1468.4900     34.9100     -0.2000
+   1239.1000   1468.4900     34.9100     -0.2000
+   1239.2000   1468.4900     34.9100     -0.2000
+   1239.4000   1468.4900     34.9100     -0.2000
+   1239.5000   1468.4900     34.9100     -0.2000
+   1239.6000   1468.5000     34.9100     -0.2000
+   1239.7000   1468.4700     34.8900     -0.2000
+   1239.9000   1468.5000     34.9100     -0.2000
+   1240.0000   1468.5000     34.9100     -0.2000
+   1240.1000   1468.5000     34.9100     -0.2000
+   1240.3000   1468.5100     34.9100     -0.2000
+   1240.4000   1468.5100     34.9100     -0.2000
+   1240.5000   1468.5100     34.9100     -0.2000
+   1240.6000   1468.5100     34.9100     -0.2000
+   1240.8000   1468.5100     34.9100     -0.2000
+   1240.9000   1468.5200     34.9100     -0.2000
+   1241.0000   1468.5200     34.9100     -0.2000
+   1241.1000   1468.5200     34.9100     -0.2000
+   1241.3000   1468.5200     34.9100     -0.2000
+   1241.4000   1468.5200     34.9100     -0.2000
+   1241.5000   1468.5300     34.9100     -0.2000
+   1241.7000   1468.5300     34.9100     -0.2000
+   1241.8000   1468.5300     34.9100     -0.2000
+   1241.9000   1468.5300     34.9100     -0.2000
+   1242.0000   1468.5300     34.9100     -0.2000
+   1242.2000   1468.5400     34.9100     -0.2000
+   1242.3000   1468.5400     34.9100     -0.2000
+   1242.4000   1468.5400     34.9100     -0.2000
+   1242.6000   1468.5400     34.9100     -0.2000
+   1242.7000   1468.5400     34.9100     -0.2000
+   1242.8000   1468.5500     34.9100     -0.2000
+   1242.9000   1468.5000     34.9100     -0.2100
+   1243.1000   1468.5600     34.9100     -0.2000
+   1243.2000   1468.5600     34.9100     -0.2000
+   1243.3000   1468.5600     34.9100     -0.2000
+   1243.5000   1468.5600     34.9100     -0.2000
+   1243.6000   1468.5600     34.9100     -0.2000
+   1243.7000   1468.5600     34.9100     -0.2000
+   1243.8000   1468.5600     34.9000     -0.2000
+   1244.0000   1468.5700     34.9000     -0.2000
+   1244.1000   1468.5700     34.9000     -0.2000
+   1244.2000   1468.5700     34.9000     -0.2000
+   1244.4000   1468.5700     34.9000     -0.2000
+   1244.5000   1468.5700     34.9000     -0.2000
+   1244.6000   1468.5800     34.9000     -0.2000
+   1244.7000   1468.5800     34.9000     -0.2000
+   1244.9000   1468.5800     34.9000     -0.2000
+   1245.0000   1468.5800     34.9000     -0.2000
+   1245.1000   1468.5800     34.9000     -0.2000
+   1245.3000   1468.5900     34.9000     -0.2000
+   1245.4000   1468.5900     34.9000     -0.2000
+   1245.5000   1468.5900     34.9000     -0.2000
+   1245.6000   1468.5900     34.9000     -0.2000
+   1245.8000   1468.5900     34.9000     -0.2000
+   1245.9000   1468.6000     34.9000     -0.2000
+   1246.0000   1468.6000     34.9000     -0.2000
+   1246.2000   1468.6000     34.9000     -0.2000
+   1246.3000   1468.6000     34.9000     -0.2000
+   1246.4000   1468.6000     34.9000     -0.2000
+   1246.5000   1468.6100     34.9000     -0.2000
+   1246.7000   1468.6100     34.9000     -0.2000
+   1246.8000   1468.6100     34.9000     -0.2000
+   1246.9000   1468.6100     34.9000     -0.2000
+   1247.0000   1468.6100     34.9000     -0.2000
+   1247.2000   1468.6200     34.9000     -0.2000
+   1247.3000   1468.6200     34.9000     -0.2000
+   1247.4000   1468.6200     34.9000     -0.2000
+   1247.6000   1468.6200     34.9000     -0.2000
+   1247.7000   1468.6500     34.9200     -0.2000
+   1247.8000   1468.6300     34.9000     -0.2000
+   1247.9000   1468.6300     34.9000     -0.2000
+   1248.1000   1468.6300     34.9000     -0.2000
+   1248.2000   1468.6300     34.9000     -0.2000
+   1248.3000   1468.6300     34.9000     -0.2000
+   1248.5000   1468.6400     34.9000     -0.2000
+   1248.6000   1468.6700     34.9200     -0.2000
+   1248.7000   1468.6700     34.9200     -0.2000
+   1248.8000   1468.6400     34.9000     -0.2000
+   1249.0000   1468.6400     34.9000     -0.2000
+   1249.1000   1468.6500     34.9000     -0.2000
+   1249.2000   1468.6500     34.9000     -0.2000
+   1249.4000   1468.6800     34.9200     -0.2000
+   1249.5000   1468.6500     34.9000     -0.2000
+   1249.6000   1468.6500     34.9000     -0.2000
+   1249.7000   1468.6600     34.9000     -0.2000
+   1249.9000   1468.6600     34.9000     -0.2000
+   1250.0000   1468.6600     34.9000     -0.2000
+   1250.1000   1468.6600     34.9000     -0.2000
+   1250.3000   1468.6700     34.9000     -0.2000
+   1250.4000   1468.6900     34.9200     -0.2000
+   1250.5000   1468.6700     34.9000     -0.2000
+   1250.6000   1468.6700     34.9000     -0.2000
+   1250.8000   1468.6700     34.9000     -0.2000
+   1250.9000   1468.6800     34.9000     -0.2000
+   1251.0000   1468.6800     34.9000     -0.2000
+   1251.2000   1468.6800     34.9000     -0.2000
+   1251.3000   1468.6800     34.9000     -0.2000
+   1251.4000   1468.7100     34.9200     -0.2000
+   1251.5000   1468.6900     34.9000     -0.2000
+   1251.7000   1468.6900     34.9000     -0.2000
+   1251.8000   1468.6900     34.9000     -0.2000
+   1251.9000   1468.6900     34.9000     -0.2000
+   1252.1000   1468.6900     34.9000     -0.2000
+   1252.2000   1468.7200     34.9200     -0.2000
+   1252.3000   1468.7200     34.9200     -0.2000
+   1252.4000   1468.7300     34.9200     -0.2000
+   1252.6000   1468.7300     34.9200     -0.2000
+   1252.7000   1468.7000     34.9000     -0.2000
+   1252.8000   1468.7100     34.9000     -0.2000
+   1252.9000   1468.7300     34.9200     -0.2000
+   1253.1000   1468.7100     34.9000     -0.2000
+   1253.2000   1468.7400     34.9200     -0.2000
+   1253.3000   1468.7100     34.9000     -0.2000
+   1253.5000   1468.7200     34.9000     -0.2000
+   1253.6000   1468.7400     34.9200     -0.2000
+   1253.7000   1468.7200     34.9000     -0.2000
+   1253.8000   1468.7200     34.9000     -0.2000
+   1254.0000   1468.7500     34.9200     -0.2000
+   1254.1000   1468.7300     34.9000     -0.2000
+   1254.2000   1468.7300     34.9000     -0.2000
+   1254.4000   1468.7300     34.9000     -0.2000
+   1254.5000   1468.7600     34.9200     -0.2000
+   1254.6000   1468.7300     34.9000     -0.2000
+   1254.7000   1468.7600     34.9200     -0.2000
+   1254.9000   1468.7400     34.9000     -0.2000
+   1255.0000   1468.7400     34.9000     -0.2000
+   1255.1000   1468.7700     34.9200     -0.2000
+   1255.3000   1468.7400     34.9000     -0.2000
+   1255.4000   1468.7700     34.9200     -0.2000
+   1255.5000   1468.7800     34.9200     -0.2000
+   1255.6000   1468.7800     34.9200     -0.2000
+   1255.8000   1468.7800     34.9200     -0.2000
+   1255.9000   1468.7500     34.9000     -0.2000
+   1256.0000   1468.7600     34.9000     -0.2000
+   1256.2000   1468.7900     34.9200     -0.2000
+   1256.3000   1468.7900     34.9200     -0.2000
+   1256.4000   1468.7900     34.9200     -0.2000
+   1256.5000   1468.7600     34.9000     -0.2000
+   1256.7000   1468.7900     34.9200     -0.2000
+   1256.8000   1468.8000     34.9200     -0.2000
+   1256.9000   1468.8000     34.9200     -0.2000
+   1257.1000   1468.7700     34.9000     -0.2000
+   1257.2000   1468.8000     34.9200     -0.2000
+   1257.3000   1468.8000     34.9200     -0.2000
+   1257.4000   1468.8100     34.9200     -0.2000
+   1257.6000   1468.8100     34.9200     -0.2000
+   1257.7000   1468.8100     34.9200     -0.2000
+   1257.8000   1468.7900     34.9000     -0.2000
+   1257.9000   1468.8100     34.9200     -0.2000
+   1258.1000   1468.8200     34.9200     -0.2000
+   1258.2000   1468.8200     34.9200     -0.2000
+   1258.3000   1468.8200     34.9200     -0.2000
+   1258.5000   1468.8200     34.9200     -0.2000
+   1258.6000   1468.8000     34.9000     -0.2000
+   1258.7000   1468.8300     34.9200     -0.2000
+   1258.8000   1468.8300     34.9200     -0.2000
+   1259.0000   1468.8300     34.9200     -0.2000
+   1259.1000   1468.8100     34.9000     -0.2000
+   1259.2000   1468.8300     34.9200     -0.2000
+   1259.4000   1468.8400     34.9200     -0.2000
+   1259.5000   1468.8400     34.9200     -0.2000
+   1259.6000   1468.8400     34.9200     -0.2000
+   1259.7000   1468.8400     34.9200     -0.2000
+   1259.9000   1468.8200     34.9000     -0.2000
+   1260.0000   1468.8500     34.9200     -0.2000
+   1260.1000   1468.8500     34.9200     -0.2000
+   1260.3000   1468.8500     34.9200     -0.2000
+   1260.4000   1468.8500     34.9200     -0.2000
+   1260.5000   1468.8500     34.9200     -0.2000
+   1260.6000   1468.8600     34.9200     -0.2000
+   1260.8000   1468.8600     34.9200     -0.2000
+   1260.9000   1468.8600     34.9200     -0.2000
+   1261.0000   1468.8600     34.9100     -0.2000
+   1261.2000   1468.8600     34.9100     -0.2000
+   1261.3000   1468.8700     34.9100     -0.2000
+   1261.4000   1468.8700     34.9100     -0.2000
+   1261.5000   1468.8700     34.9100     -0.2000
+   1261.7000   1468.8500     34.8900     -0.2000
+   1261.8000   1468.8800     34.9100     -0.2000
+   1261.9000   1468.8800     34.9100     -0.2000
+   1262.0000   1468.8800     34.9100     -0.2000
+   1262.2000   1468.8800     34.9100     -0.2000
+   1262.3000   1468.8800     34.9100     -0.2000
+   1262.4000   1468.8600     34.8900     -0.2000
+   1262.6000   1468.8900     34.9100     -0.2000
+   1262.7000   1468.8900     34.9100     -0.2000
+   1262.8000   1468.8900     34.9100     -0.2000
+   1262.9000   1468.8900     34.9100     -0.2000
+   1263.1000   1468.9000     34.9100     -0.2000
+   1263.2000   1468.9000     34.9100     -0.2000
+   1263.3000   1468.9000     34.9100     -0.2000
+   1263.5000   1468.9000     34.9100     -0.2000
+   1263.6000   1468.9000     34.9100     -0.2000
+   1263.7000   1468.9100     34.9100     -0.2000
+   1263.8000   1468.9100     34.9100     -0.2000
+   1264.0000   1468.9100     34.9100     -0.2000
+   1264.1000   1468.9100     34.9100     -0.2000
+   1264.2000   1468.9100     34.9100     -0.2000
+   1264.4000   1468.8900     34.8900     -0.2000
+   1264.5000   1468.9200     34.9100     -0.2000
+   1264.6000   1468.9200     34.9100     -0.2000
+   1264.7000   1468.9200     34.9100     -0.2000
+   1264.9000   1468.9200     34.9100     -0.2000
+   1265.0000   1468.9000     34.8900     -0.2000
+   1265.1000   1468.9300     34.9100     -0.2000
+   1265.3000   1468.9300     34.9100     -0.2000
+   1265.4000   1468.9300     34.9100     -0.2000
+   1265.5000   1468.9300     34.9100     -0.2000
+   1265.6000   1468.9400     34.9100     -0.2000
+   1265.8000   1468.9400     34.9100     -0.2000
+   1265.9000   1468.9400     34.9100     -0.2000
+   1266.0000   1468.9400     34.9100     -0.2000
+   1266.1000   1468.9400     34.9100     -0.2000
+   1266.3000   1468.9500     34.9100     -0.2000
+   1266.4000   1468.9500     34.9100     -0.2000
+   1266.5000   1468.9500     34.9100     -0.2000
+   1266.7000   1468.9500     34.9100     -0.2000
+   1266.8000   1468.9500     34.9100     -0.2000
+   1266.9000   1468.9600     34.9100     -0.2000
+   1267.0000   1468.9600     34.9100     -0.2000
+   1267.2000   1468.9600     34.9100     -0.2000
+   1267.3000   1468.9600     34.9100     -0.2000
+   1267.4000   1468.9600     34.9100     -0.2000
+   1267.6000   1468.9700     34.9100     -0.2000
+   1267.7000   1468.9700     34.9100     -0.2000
+   1267.8000   1468.9700     34.9100     -0.2000
+   1267.9000   1468.9700     34.9100     -0.2000
+   1268.1000   1468.9700     34.9100     -0.2000
+   1268.2000   1468.9500     34.8900     -0.2000
+   1268.3000   1468.9800     34.9100     -0.2000
+   1268.5000   1468.9800     34.9100     -0.2000
+   1268.6000   1468.9800     34.9100     -0.2000
+   1268.7000   1468.9800     34.9100     -0.2000
+   1268.8000   1468.9600     34.8900     -0.2000
+   1269.0000   1468.9900     34.9100     -0.2000
+   1269.1000   1468.9900     34.9100     -0.2000
+   1269.2000   1468.9900     34.9100     -0.2000
+   1269.4000   1468.9900     34.9100     -0.2000
+   1269.5000   1468.9700     34.8900     -0.2000
+   1269.6000   1469.0000     34.9100     -0.2000
+   1269.7000   1469.0000     34.9100     -0.2000
+   1269.9000   1469.0000     34.9100     -0.2000
+   1270.0000   1469.0100     34.9100     -0.2000
+   1270.1000   1469.0100     34.9100     -0.2000
+   1270.2000   1469.0100     34.9100     -0.2000
+   1270.4000   1469.0100     34.9100     -0.2000
+   1270.5000   1468.9600     34.9100     -0.2100
+   1270.6000   1469.0200     34.9200     -0.2000
+   1270.8000   1468.9800     34.9200     -0.2100
+   1270.9000   1469.0300     34.9200     -0.2000
+   1271.0000   1469.0300     34.9200     -0.2000
+   1271.1000   1468.9700     34.9100     -0.2100
+   1271.3000   1469.0300     34.9200     -0.2000
+   1271.4000   1468.9900     34.9200     -0.2100
+   1271.5000   1469.0400     34.9200     -0.2000
+   1271.7000   1469.0400     34.9100     -0.2000
+   1271.8000   1468.9800     34.9100     -0.2100
+   1271.9000   1469.0400     34.9100     -0.2000
+   1272.0000   1469.0500     34.9100     -0.2000
+   1272.2000   1469.0400     34.9100     -0.2000
+   1272.3000   1469.0400     34.9100     -0.2000
+   1272.4000   1469.0400     34.9100     -0.2000
+   1272.6000   1469.0500     34.9100     -0.2000
+   1272.7000   1469.0000     34.9100     -0.2100
+   1272.8000   1469.0600     34.9100     -0.2000
+   1272.9000   1469.0600     34.9100     -0.2000
+   1273.1000   1469.0100     34.9100     -0.2100
+   1273.2000   1469.0600     34.9100     -0.2000
+   1273.3000   1468.9900     34.8900     -0.2100
+   1273.4000   1469.0700     34.9100     -0.2000
+   1273.6000   1469.0700     34.9100     -0.2000
+   1273.7000   1469.0200     34.9100     -0.2100
+   1273.8000   1469.0700     34.9100     -0.2000
+   1274.0000   1469.0300     34.9100     -0.2100
+   1274.1000   1469.0800     34.9100     -0.2000
+   1274.2000   1469.0300     34.9100     -0.2100
+   1274.3000   1469.0300     34.9100     -0.2100
+   1274.5000   1469.0900     34.9200     -0.2000
+   1274.6000   1469.0400     34.9100     -0.2100
+   1274.7000   1469.0900     34.9100     -0.2000
+   1274.9000   1469.0900     34.9100     -0.2000
+   1275.0000   1469.0400     34.9100     -0.2100
+   1275.1000   1469.0900     34.9100     -0.2000
+   1275.2000   1469.0500     34.9100     -0.2100
+   1275.4000   1469.1000     34.9100     -0.2000
+   1275.5000   1469.1000     34.9100     -0.2000
+   1275.6000   1469.0500     34.9100     -0.2100
+   1275.8000   1469.1000     34.9100     -0.2000
+   1275.9000   1469.0600     34.9100     -0.2100
+   1276.0000   1469.1100     34.9100     -0.2000
+   1276.1000   1469.1100     34.9100     -0.2000
+   1276.3000   1469.0600     34.9100     -0.2100
+   1276.4000   1469.1100     34.9100     -0.2000
+   1276.5000   1469.0700     34.9100     -0.2100
+   1276.6000   1469.1200     34.9100     -0.2000
+   1276.8000   1469.1200     34.9100     -0.2000
+   1276.9000   1469.0700     34.9100     -0.2100
+   1277.0000   1469.1300     34.9100     -0.2000
+   1277.2000   1469.1300     34.9100     -0.2000
+   1277.3000   1469.1200     34.9100     -0.2000
+   1277.4000   1469.1200     34.9100     -0.2000
+   1277.5000   1469.1300     34.9100     -0.2000
+   1277.7000   1469.0800     34.9100     -0.2100
+   1277.8000   1469.0900     34.9100     -0.2100
+   1277.9000   1469.1500     34.9200     -0.2000
+   1278.1000   1469.1400     34.9100     -0.2000
+   1278.2000   1469.0900     34.9100     -0.2100
+   1278.3000   1469.1500     34.9100     -0.2000
+   1278.4000   1469.1000     34.9100     -0.2100
+   1278.6000   1469.1500     34.9100     -0.2000
+   1278.7000   1469.1500     34.9100     -0.2000
+   1278.8000   1469.1000     34.9000     -0.2100
+   1279.0000   1469.1100     34.9100     -0.2100
+   1279.1000   1469.1200     34.9200     -0.2100
+   1279.2000   1469.1200     34.9200     -0.2100
+   1279.3000   1469.1200     34.9200     -0.2100
+   1279.5000   1469.1200     34.9200     -0.2100
+   1279.6000   1469.1200     34.9200     -0.2100
+   1279.7000   1469.1300     34.9200     -0.2100
+   1279.8000   1469.1300     34.9200     -0.2100
+   1280.0000   1469.1300     34.9200     -0.2100
+   1280.1000   1469.1300     34.9200     -0.2100
+   1280.2000   1469.1400     34.9200     -0.2100
+   1280.4000   1469.1100     34.9000     -0.2100
+   1280.5000   1469.1400     34.9200     -0.2100
+   1280.6000   1469.1400     34.9200     -0.2100
+   1280.7000   1469.1400     34.9200     -0.2100
+   1280.9000   1469.1500     34.9200     -0.2100
+   1281.0000   1469.1500     34.9200     -0.2100
+   1281.1000   1469.1500     34.9200     -0.2100
+   1281.3000   1469.1500     34.9200     -0.2100
+   1281.4000   1469.1500     34.9200     -0.2100
+   1281.5000   1469.1600     34.9200     -0.2100
+   1281.6000   1469.1600     34.9200     -0.2100
+   1281.8000   1469.1600     34.9200     -0.2100
+   1281.9000   1469.1600     34.9200     -0.2100
+   1282.0000   1469.1600     34.9200     -0.2100
+   1282.2000   1469.1700     34.9200     -0.2100
+   1282.3000   1469.1700     34.9100     -0.2100
+   1282.4000   1469.1700     34.9100     -0.2100
+   1282.5000   1469.1700     34.9100     -0.2100
+   1282.7000   1469.1700     34.9100     -0.2100
+   1282.8000   1469.1800     34.9100     -0.2100
+   1282.9000   1469.1500     34.8900     -0.2100
+   1283.0000   1469.1800     34.9100     -0.2100
+   1283.2000   1469.1800     34.9100     -0.2100
+   1283.3000   1469.1800     34.9100     -0.2100
+   1283.4000   1469.1600     34.8900     -0.2100
+   1283.6000   1469.1900     34.9100     -0.2100
+   1283.7000   1469.1900     34.9100     -0.2100
+   1283.8000   1469.1900     34.9100     -0.2100
+   1283.9000   1469.1900     34.9100     -0.2100
+   1284.1000   1469.2000     34.9100     -0.2100
+   1284.2000   1469.2000     34.9100     -0.2100
+   1284.3000   1469.2000     34.9100     -0.2100
+   1284.5000   1469.2000     34.9100     -0.2100
+   1284.6000   1469.2000     34.9100     -0.2100
+   1284.7000   1469.2100     34.9100     -0.2100
+   1284.8000   1469.2100     34.9100     -0.2100
+   1285.0000   1469.2100     34.9100     -0.2100
+   1285.1000   1469.2100     34.9100     -0.2100
+   1285.2000   1469.2100     34.9100     -0.2100
+   1285.4000   1469.2200     34.9100     -0.2100
+   1285.5000   1469.2200     34.9100     -0.2100
+   1285.6000   1469.2200     34.9100     -0.2100
+   1285.7000   1469.2200     34.9100     -0.2100
+   1285.9000   1469.2200     34.9100     -0.2100
+   1286.0000   1469.2300     34.9100     -0.2100
+   1286.1000   1469.2300     34.9100     -0.2100
+   1286.2000   1469.2300     34.9100     -0.2100
+   1286.4000   1469.2300     34.9100     -0.2100
+   1286.5000   1469.2300     34.9100     -0.2100
+   1286.6000   1469.2400     34.9100     -0.2100
+   1286.8000   1469.2400     34.9100     -0.2100
+   1286.9000   1469.2400     34.9100     -0.2100
+   1287.0000   1469.2400     34.9100     -0.2100
+   1287.1000   1469.2400     34.9100     -0.2100
+   1287.3000   1469.2500     34.9100     -0.2100
+   1287.4000   1469.2500     34.9100     -0.2100
+   1287.5000   1469.2500     34.9100     -0.2100
+   1287.7000   1469.2500     34.9100     -0.2100
+   1287.8000   1469.2100     34.9100     -0.2200
+   1287.9000   1469.2700     34.9200     -0.2100
+   1288.0000   1469.2200     34.9200     -0.2200
+   1288.2000   1469.2200     34.9200     -0.2200
+   1288.3000   1469.2300     34.9200     -0.2200
+   1288.4000   1469.2300     34.9200     -0.2200
+   1288.6000   1469.2100     34.9000     -0.2200
+   1288.7000   1469.2100     34.9000     -0.2200
+   1288.8000   1469.2400     34.9200     -0.2200
+   1288.9000   1469.2400     34.9200     -0.2200
+   1289.1000   1469.2400     34.9200     -0.2200
+   1289.2000   1469.2400     34.9200     -0.2200
+   1289.3000   1469.2200     34.9000     -0.2200
+   1289.4000   1469.2500     34.9200     -0.2200
+   1289.6000   1469.2500     34.9200     -0.2200
+   1289.7000   1469.2500     34.9200     -0.2200
+   1289.8000   1469.2300     34.9000     -0.2200
+   1290.0000   1469.2600     34.9200     -0.2200
+   1290.1000   1469.2600     34.9200     -0.2200
+   1290.2000   1469.2300     34.9000     -0.2200
+   1290.3000   1469.2600     34.9200     -0.2200
+   1290.5000   1469.2400     34.9000     -0.2200
+   1290.6000   1469.2700     34.9200     -0.2200
+   1290.7000   1469.2700     34.9200     -0.2200
+   1290.9000   1469.2700     34.9200     -0.2200
+   1291.0000   1469.2700     34.9200     -0.2200
+   1291.1000   1469.2500     34.9000     -0.2200
+   1291.2000   1469.2800     34.9200     -0.2200
+   1291.4000   1469.2800     34.9200     -0.2200
+   1291.5000   1469.2800     34.9200     -0.2200
+   1291.6000   1469.2800     34.9200     -0.2200
+   1291.7000   1469.2600     34.9000     -0.2200
+   1291.9000   1469.2900     34.9200     -0.2200
+   1292.0000   1469.2900     34.9200     -0.2200
+   1292.1000   1469.2900     34.9200     -0.2200
+   1292.3000   1469.2900     34.9200     -0.2200
+   1292.4000   1469.3000     34.9200     -0.2200
+   1292.5000   1469.2700     34.9000     -0.2200
+   1292.6000   1469.2700     34.9000     -0.2200
+   1292.8000   1469.2700     34.9000     -0.2200
+   1292.9000   1469.2800     34.9000     -0.2200
+   1293.0000   1469.3100     34.9200     -0.2200
+   1293.2000   1469.2800     34.9000     -0.2200
+   1293.3000   1469.3100     34.9200     -0.2200
+   1293.4000   1469.2900     34.9000     -0.2200
+   1293.5000   1469.2900     34.9000     -0.2200
+   1293.7000   1469.3200     34.9200     -0.2200
+   1293.8000   1469.2900     34.9000     -0.2200
+   1293.9000   1469.3200     34.9200     -0.2200
+   1294.1000   1469.3000     34.9000     -0.2200
+   1294.2000   1469.3200     34.9200     -0.2200
+   1294.3000   1469.3000     34.9000     -0.2200
+   1294.4000   1469.3000     34.9000     -0.2200
+   1294.6000   1469.3300     34.9200     -0.2200
+   1294.7000   1469.3300     34.9200     -0.2200
+   1294.8000   1469.3300     34.9200     -0.2200
+   1294.9000   1469.3400     34.9200     -0.2200
+   1295.1000   1469.3100     34.9000     -0.2200
+   1295.2000   1469.3400     34.9200     -0.2200
+   1295.3000   1469.3400     34.9200     -0.2200
+   1295.5000   1469.3400     34.9200     -0.2200
+   1295.6000   1469.3500     34.9200     -0.2200
+   1295.7000   1469.3200     34.9000     -0.2200
+   1295.8000   1469.3500     34.9200     -0.2200
+   1296.0000   1469.3300     34.9000     -0.2200
+   1296.1000   1469.3500     34.9200     -0.2200
+   1296.2000   1469.3600     34.9200     -0.2200
+   1296.4000   1469.3300     34.9000     -0.2200
+   1296.5000   1469.3300     34.9000     -0.2200
+   1296.6000   1469.3400     34.9000     -0.2200
+   1296.7000   1469.3400     34.9000     -0.2200
+   1296.9000   1469.3700     34.9200     -0.2200
+   1297.0000   1469.2900     34.9000     -0.2300
+   1297.1000   1469.3800     34.9200     -0.2200
+   1297.2000   1469.3800     34.9200     -0.2200
+   1297.4000   1469.3500     34.9000     -0.2200
+   1297.5000   1469.3800     34.9200     -0.2200
+   1297.6000   1469.3500     34.9000     -0.2200
+   1297.8000   1469.3500     34.9000     -0.2200
+   1297.9000   1469.3600     34.9000     -0.2200
+   1298.0000   1469.3900     34.9200     -0.2200
+   1298.1000   1469.3600     34.9000     -0.2200
+   1298.3000   1469.3600     34.9000     -0.2200
+   1298.4000   1469.3900     34.9200     -0.2200
+   1298.5000   1469.3700     34.9000     -0.2200
+   1298.7000   1469.3200     34.9000     -0.2300
+   1298.8000   1469.3600     34.9200     -0.2300
+   1298.9000   1469.3400     34.9100     -0.2300
+   1299.0000   1469.3700     34.9300     -0.2300
+   1299.2000   1469.3400     34.9100     -0.2300
+   1299.3000   1469.3500     34.9100     -0.2300
+   1299.4000   1469.3700     34.9300     -0.2300
+   1299.5000   1469.3500     34.9100     -0.2300
+   1299.7000   1469.3500     34.9100     -0.2300
+   1299.8000   1469.3500     34.9100     -0.2300
+   1299.9000   1469.3600     34.9100     -0.2300
+   1300.1000   1469.3600     34.9100     -0.2300
+   1300.2000   1469.3600     34.9100     -0.2300
+   1300.3000   1469.3600     34.9100     -0.2300
+   1300.4000   1469.3600     34.9100     -0.2300
+   1300.6000   1469.3700     34.9100     -0.2300
+   1300.7000   1469.3700     34.9100     -0.2300
+   1300.8000   1469.3700     34.9100     -0.2300
+   1301.0000   1469.3700     34.9100     -0.2300
+   1301.1000   1469.3700     34.9100     -0.2300
+   1301.2000   1469.3800     34.9100     -0.2300
+   1301.3000   1469.3800     34.9100     -0.2300
+   1301.5000   1469.3300     34.9100     -0.2400
+   1301.6000   1469.3900     34.9100     -0.2300
+   1301.7000   1469.3900     34.9100     -0.2300
+   1301.9000   1469.3400     34.9100     -0.2400
+   1302.0000   1469.4000     34.9100     -0.2300
+   1302.1000   1469.4000     34.9100     -0.2300
+   1302.2000   1469.3900     34.9100     -0.2300
+   1302.4000   1469.3900     34.9100     -0.2300
+   1302.5000   1469.4000     34.9100     -0.2300
+   1302.6000   1469.4000     34.9100     -0.2300
+   1302.7000   1469.4000     34.9100     -0.2300
+   1302.9000   1469.4000     34.9100     -0.2300
+   1303.0000   1469.4000     34.9100     -0.2300
+   1303.1000   1469.4100     34.9100     -0.2300
+   1303.3000   1469.4100     34.9100     -0.2300
+   1303.4000   1469.4100     34.9100     -0.2300
+   1303.5000   1469.4100     34.9100     -0.2300
+   1303.6000   1469.4100     34.9100     -0.2300
+   1303.8000   1469.4200     34.9100     -0.2300
+   1303.9000   1469.4200     34.9100     -0.2300
+   1304.0000   1469.4200     34.9100     -0.2300
+   1304.2000   1469.4200     34.9100     -0.2300
+   1304.3000   1469.4200     34.9100     -0.2300
+   1304.4000   1469.4300     34.9100     -0.2300
+   1304.5000   1469.4300     34.9100     -0.2300
+   1304.7000   1469.4300     34.9100     -0.2300
+   1304.8000   1469.4300     34.9100     -0.2300
+   1304.9000   1469.4400     34.9100     -0.2300
+   1305.0000   1469.4400     34.9100     -0.2300
+   1305.2000   1469.4400     34.9100     -0.2300
+   1305.3000   1469.4400     34.9100     -0.2300
+   1305.4000   1469.4400     34.9100     -0.2300
+   1305.6000   1469.4500     34.9100     -0.2300
+   1305.7000   1469.4500     34.9100     -0.2300
+   1305.8000   1469.4500     34.9100     -0.2300
+   1305.9000   1469.4500     34.9100     -0.2300
+   1306.1000   1469.4500     34.9100     -0.2300
+   1306.2000   1469.4600     34.9100     -0.2300
+   1306.3000   1469.4600     34.9100     -0.2300
+   1306.5000   1469.4600     34.9100     -0.2300
+   1306.6000   1469.4100     34.9100     -0.2400
+   1306.7000   1469.4700     34.9100     -0.2300
+   1306.8000   1469.4200     34.9100     -0.2400
+   1307.0000   1469.4300     34.9100     -0.2400
+   1307.1000   1469.4400     34.9200     -0.2400
+   1307.2000   1469.4400     34.9200     -0.2400
+   1307.3000   1469.4400     34.9200     -0.2400
+   1307.5000   1469.4400     34.9200     -0.2400
+   1307.6000   1469.4400     34.9200     -0.2400
+   1307.7000   1469.4500     34.9200     -0.2400
+   1307.9000   1469.4200     34.9000     -0.2400
+   1308.0000   1469.4500     34.9200     -0.2400
+   1308.1000   1469.4500     34.9200     -0.2400
+   1308.2000   1469.4600     34.9200     -0.2400
+   1308.4000   1469.4600     34.9200     -0.2400
+   1308.5000   1469.4600     34.9200     -0.2400
+   1308.6000   1469.4600     34.9200     -0.2400
+   1308.8000   1469.4600     34.9200     -0.2400
+   1308.9000   1469.4700     34.9200     -0.2400
+   1309.0000   1469.4700     34.9200     -0.2400
+   1309.1000   1469.4700     34.9200     -0.2400
+   1309.3000   1469.4700     34.9200     -0.2400
+   1309.4000   1469.4700     34.9200     -0.2400
+   1309.5000   1469.4800     34.9200     -0.2400
+   1309.6000   1469.4800     34.9200     -0.2400
+   1309.8000   1469.4800     34.9200     -0.2400
+   1309.9000   1469.4800     34.9200     -0.2400
+   1310.0000   1469.4800     34.9200     -0.2400
+   1310.2000   1469.4900     34.9200     -0.2400
+   1310.3000   1469.4900     34.9200     -0.2400
+   1310.4000   1469.4900     34.9200     -0.2400
+   1310.5000   1469.4900     34.9200     -0.2400
+   1310.7000   1469.4900     34.9200     -0.2400
+   1310.8000   1469.5000     34.9200     -0.2400
+   1310.9000   1469.5000     34.9200     -0.2400
+   1311.1000   1469.5000     34.9200     -0.2400
+   1311.2000   1469.5000     34.9100     -0.2400
+   1311.3000   1469.5000     34.9100     -0.2400
+   1311.4000   1469.5100     34.9100     -0.2400
+   1311.6000   1469.5100     34.9100     -0.2400
+   1311.7000   1469.5100     34.9100     -0.2400
+   1311.8000   1469.5100     34.9100     -0.2400
+   1311.9000   1469.5100     34.9100     -0.2400
+   1312.1000   1469.5200     34.9100     -0.2400
+   1312.2000   1469.5200     34.9100     -0.2400
+   1312.3000   1469.5200     34.9100     -0.2400
+   1312.5000   1469.5200     34.9100     -0.2400
+   1312.6000   1469.5200     34.9100     -0.2400
+   1312.7000   1469.5300     34.9100     -0.2400
+   1312.8000   1469.5300     34.9100     -0.2400
+   1313.0000   1469.5300     34.9100     -0.2400
+   1313.1000   1469.5300     34.9100     -0.2400
+   1313.2000   1469.5300     34.9100     -0.2400
+   1313.4000   1469.5400     34.9100     -0.2400
+   1313.5000   1469.5400     34.9100     -0.2400
+   1313.6000   1469.5400     34.9100     -0.2400
+   1313.7000   1469.5400     34.9100     -0.2400
+   1313.9000   1469.5400     34.9100     -0.2400
+   1314.0000   1469.5500     34.9100     -0.2400
+   1314.1000   1469.5500     34.9100     -0.2400
+   1314.2000   1469.5500     34.9100     -0.2400
+   1314.4000   1469.5500     34.9100     -0.2400
+   1314.5000   1469.5500     34.9100     -0.2400
+   1314.6000   1469.5600     34.9100     -0.2400
+   1314.8000   1469.5600     34.9100     -0.2400
+   1314.9000   1469.5600     34.9100     -0.2400
+   1315.0000   1469.5600     34.9100     -0.2400
+   1315.1000   1469.5600     34.9100     -0.2400
+   1315.3000   1469.5700     34.9100     -0.2400
+   1315.4000   1469.5700     34.9100     -0.2400
+   1315.5000   1469.5700     34.9100     -0.2400
+   1315.7000   1469.5700     34.9100     -0.2400
+   1315.8000   1469.5700     34.9100     -0.2400
+   1315.9000   1469.5800     34.9100     -0.2400
+   1316.0000   1469.5800     34.9100     -0.2400
+   1316.2000   1469.5300     34.9100     -0.2500
+   1316.3000   1469.5900     34.9200     -0.2400
+   1316.4000   1469.5900     34.9200     -0.2400
+   1316.5000   1469.5400     34.9100     -0.2500
+   1316.7000   1469.6000     34.9200     -0.2400
+   1316.8000   1469.6000     34.9200     -0.2400
+   1316.9000   1469.5900     34.9100     -0.2400
+   1317.1000   1469.6000     34.9100     -0.2400
+   1317.2000   1469.5500     34.9100     -0.2500
+   1317.3000   1469.6100     34.9200     -0.2400
+   1317.4000   1469.5600     34.9200     -0.2500
+   1317.6000   1469.6100     34.9200     -0.2400
+   1317.7000   1469.6100     34.9200     -0.2400
+   1317.8000   1469.5600     34.9100     -0.2500
+   1317.9000   1469.6200     34.9200     -0.2400
+   1318.1000   1469.5700     34.9200     -0.2500
+   1318.2000   1469.6200     34.9200     -0.2400
+   1318.3000   1469.6200     34.9200     -0.2400
+   1318.5000   1469.5700     34.9100     -0.2500
+   1318.6000   1469.6300     34.9200     -0.2400
+   1318.7000   1469.5500     34.9000     -0.2500
+   1318.8000   1469.6300     34.9200     -0.2400
+   1319.0000   1469.6300     34.9200     -0.2400
+   1319.1000   1469.5500     34.8900     -0.2500
+   1319.2000   1469.6400     34.9200     -0.2400
+   1319.4000   1469.5900     34.9200     -0.2500
+   1319.5000   1469.6400     34.9200     -0.2400
+   1319.6000   1469.6400     34.9200     -0.2400
+   1319.7000   1469.5900     34.9100     -0.2500
+   1319.9000   1469.6000     34.9200     -0.2500
+   1320.0000   1469.6100     34.9200     -0.2500
+   1320.1000   1469.6600     34.9200     -0.2400
+   1320.2000   1469.6500     34.9200     -0.2400
+   1320.4000   1469.6000     34.9100     -0.2500
+   1320.5000   1469.6100     34.9200     -0.2500
+   1320.6000   1469.6200     34.9200     -0.2500
+   1320.8000   1469.6700     34.9200     -0.2400
+   1320.9000   1469.6600     34.9200     -0.2400
+   1321.0000   1469.6100     34.9100     -0.2500
+   1321.1000   1469.6700     34.9200     -0.2400
+   1321.3000   1469.6200     34.9200     -0.2500
+   1321.4000   1469.6200     34.9200     -0.2500
+   1321.5000   1469.6300     34.9200     -0.2500
+   1321.7000   1469.6400     34.9200     -0.2500
+   1321.8000   1469.6900     34.9200     -0.2400
+   1321.9000   1469.6300     34.9100     -0.2500
+   1322.0000   1469.6800     34.9100     -0.2400
+   1322.2000   1469.6800     34.9100     -0.2400
+   1322.3000   1469.6300     34.9100     -0.2500
+   1322.4000   1469.6900     34.9100     -0.2400
+   1322.5000   1469.6400     34.9100     -0.2500
+   1322.7000   1469.6900     34.9100     -0.2400
+   1322.8000   1469.6900     34.9100     -0.2400
+   1322.9000   1469.6900     34.9100     -0.2400
+   1323.1000   1469.6900     34.9100     -0.2400
+   1323.2000   1469.6400     34.9100     -0.2500
+   1323.3000   1469.7000     34.9100     -0.2400
+   1323.4000   1469.7000     34.9100     -0.2400
+   1323.6000   1469.7000     34.9100     -0.2400
+   1323.7000   1469.7000     34.9100     -0.2400
+   1323.8000   1469.6500     34.9100     -0.2500
+   1323.9000   1469.7100     34.9100     -0.2400
+   1324.1000   1469.7200     34.9100     -0.2400
+   1324.2000   1469.6600     34.9100     -0.2500
+   1324.3000   1469.7200     34.9100     -0.2400
+   1324.5000   1469.6700     34.9100     -0.2500
+   1324.6000   1469.7200     34.9100     -0.2400
+   1324.7000   1469.7300     34.9100     -0.2400
+   1324.8000   1469.7200     34.9100     -0.2400
+   1325.0000   1469.7200     34.9100     -0.2400
+   1325.1000   1469.7200     34.9100     -0.2400
+   1325.2000   1469.7300     34.9100     -0.2400
+   1325.4000   1469.7300     34.9100     -0.2400
+   1325.5000   1469.6800     34.9100     -0.2500
+   1325.6000   1469.7400     34.9100     -0.2400
+   1325.7000   1469.6900     34.9100     -0.2500
+   1325.9000   1469.7400     34.9100     -0.2400
+   1326.0000   1469.7500     34.9100     -0.2400
+   1326.1000   1469.7400     34.9100     -0.2400
+   1326.2000   1469.7400     34.9100     -0.2400
+   1326.4000   1469.7400     34.9100     -0.2400
+   1326.5000   1469.7500     34.9100     -0.2400
+   1326.6000   1469.7500     34.9100     -0.2400
+   1326.8000   1469.7000     34.9100     -0.2500
+   1326.9000   1469.7600     34.9100     -0.2400
+   1327.0000   1469.7100     34.9100     -0.2500
+   1327.1000   1469.7600     34.9100     -0.2400
+   1327.3000   1469.7700     34.9100     -0.2400
+   1327.4000   1469.7600     34.9100     -0.2400
+   1327.5000   1469.7600     34.9100     -0.2400
+   1327.7000   1469.7100     34.9100     -0.2500
+   1327.8000   1469.7200     34.9100     -0.2500
+   1327.9000   1469.7800     34.9200     -0.2400
+   1328.0000   1469.7300     34.9100     -0.2500
+   1328.2000   1469.7800     34.9100     -0.2400
+   1328.3000   1469.7300     34.9100     -0.2500
+   1328.4000   1469.7800     34.9100     -0.2400
+   1328.5000   1469.7900     34.9100     -0.2400
+   1328.7000   1469.7300     34.9100     -0.2500
+   1328.8000   1469.7900     34.9100     -0.2400
+   1328.9000   1469.7700     34.9300     -0.2500
+   1329.1000   1469.7900     34.9100     -0.2400
+   1329.2000   1469.8000     34.9100     -0.2400
+   1329.3000   1469.7900     34.9000     -0.2400
+   1329.4000   1469.7400     34.9000     -0.2500
+   1329.6000   1469.7500     34.9100     -0.2500
+   1329.7000   1469.8100     34.9200     -0.2400
+   1329.8000   1469.7600     34.9100     -0.2500
+   1329.9000   1469.7600     34.9100     -0.2500
+   1330.1000   1469.7700     34.9200     -0.2500
+   1330.2000   1469.7700     34.9200     -0.2500
+   1330.3000   1469.7700     34.9200     -0.2500
+   1330.5000   1469.7800     34.9200     -0.2500
+   1330.6000   1469.7800     34.9200     -0.2500
+   1330.7000   1469.7800     34.9200     -0.2500
+   1330.8000   1469.7800     34.9200     -0.2500
+   1331.0000   1469.7800     34.9200     -0.2500
+   1331.1000   1469.7900     34.9200     -0.2500
+   1331.2000   1469.7900     34.9200     -0.2500
+   1331.4000   1469.7900     34.9200     -0.2500
+   1331.5000   1469.7900     34.9200     -0.2500
+   1331.6000   1469.7900     34.9200     -0.2500
+   1331.7000   1469.8000     34.9200     -0.2500
+   1331.9000   1469.8000     34.9200     -0.2500
+   1332.0000   1469.8500     34.9200     -0.2400
+   1332.1000   1469.7900     34.9100     -0.2500
+   1332.2000   1469.8200     34.9300     -0.2500
+   1332.4000   1469.8100     34.9200     -0.2500
+   1332.5000   1469.8100     34.9100     -0.2500
+   1332.6000   1469.8100     34.9100     -0.2500
+   1332.8000   1469.8100     34.9100     -0.2500
+   1332.9000   1469.8100     34.9100     -0.2500
+   1333.0000   1469.8200     34.9100     -0.2500
+   1333.1000   1469.8200     34.9100     -0.2500
+   1333.3000   1469.8200     34.9100     -0.2500
+   1333.4000   1469.8200     34.9100     -0.2500
+   1333.5000   1469.8200     34.9100     -0.2500
+   1333.6000   1469.8300     34.9100     -0.2500
+   1333.8000   1469.8300     34.9100     -0.2500
+   1333.9000   1469.8300     34.9100     -0.2500
+   1334.0000   1469.8300     34.9100     -0.2500
+   1334.2000   1469.8300     34.9100     -0.2500
+   1334.3000   1469.8400     34.9100     -0.2500
+   1334.4000   1469.8400     34.9100     -0.2500
+   1334.5000   1469.8400     34.9100     -0.2500
+   1334.7000   1469.8400     34.9100     -0.2500
+   1334.8000   1469.8400     34.9100     -0.2500
+   1334.9000   1469.8500     34.9100     -0.2500
+   1335.1000   1469.8500     34.9100     -0.2500
+   1335.2000   1469.8500     34.9100     -0.2500
+   1335.3000   1469.8500     34.9100     -0.2500
+   1335.4000   1469.8500     34.9100     -0.2500
+   1335.6000   1469.8600     34.9100     -0.2500
+   1335.7000   1469.8600     34.9100     -0.2500
+   1335.8000   1469.8600     34.9100     -0.2500
+   1335.9000   1469.8600     34.9100     -0.2500
+   1336.1000   1469.8600     34.9100     -0.2500
+   1336.2000   1469.8700     34.9100     -0.2500
+   1336.3000   1469.8700     34.9100     -0.2500
+   1336.5000   1469.8700     34.9100     -0.2500
+   1336.6000   1469.8700     34.9100     -0.2500
+   1336.7000   1469.8800     34.9100     -0.2500
+   1336.8000   1469.8800     34.9100     -0.2500
+   1337.0000   1469.8800     34.9100     -0.2500
+   1337.1000   1469.8800     34.9100     -0.2500
+   1337.2000   1469.8800     34.9100     -0.2500
+   1337.3000   1469.8900     34.9100     -0.2500
+   1337.5000   1469.8900     34.9100     -0.2500
+   1337.6000   1469.8900     34.9100     -0.2500
+   1337.7000   1469.8900     34.9100     -0.2500
+   1337.9000   1469.8900     34.9100     -0.2500
+   1338.0000   1469.9000     34.9100     -0.2500
+   1338.1000   1469.9000     34.9100     -0.2500
+   1338.2000   1469.9000     34.9100     -0.2500
+   1338.4000   1469.9000     34.9100     -0.2500
+   1338.5000   1469.9000     34.9100     -0.2500
+   1338.6000   1469.9100     34.9100     -0.2500
+   1338.8000   1469.9100     34.9100     -0.2500
+   1338.9000   1469.9100     34.9100     -0.2500
+   1339.0000   1469.9100     34.9100     -0.2500
+   1339.1000   1469.9100     34.9100     -0.2500
+   1339.3000   1469.9200     34.9100     -0.2500
+   1339.4000   1469.9200     34.9100     -0.2500
+   1339.5000   1469.9200     34.9100     -0.2500
+   1339.6000   1469.9200     34.9100     -0.2500
+   1339.8000   1469.9200     34.9100     -0.2500
+   1339.9000   1469.9300     34.9100     -0.2500
+   1340.0000   1469.9300     34.9100     -0.2500
+   1340.2000   1469.9300     34.9100     -0.2500
+   1340.3000   1469.9300     34.9100     -0.2500
+   1340.4000   1469.9300     34.9100     -0.2500
+   1340.5000   1469.9400     34.9100     -0.2500
+   1340.7000   1469.9400     34.9100     -0.2500
+   1340.8000   1469.9400     34.9100     -0.2500
+   1340.9000   1469.9400     34.9100     -0.2500
+   1341.0000   1469.9400     34.9100     -0.2500
+   1341.2000   1469.9500     34.9100     -0.2500
+   1341.3000   1469.9500     34.9100     -0.2500
+   1341.4000   1469.9500     34.9100     -0.2500
+   1341.6000   1469.9500     34.9100     -0.2500
+   1341.7000   1469.9100     34.9100     -0.2600
+   1341.8000   1469.9600     34.9200     -0.2500
+   1341.9000   1469.9700     34.9200     -0.2500
+   1342.1000   1469.9600     34.9100     -0.2500
+   1342.2000   1469.9600     34.9100     -0.2500
+   1342.3000   1469.9600     34.9100     -0.2500
+   1342.4000   1469.9700     34.9100     -0.2500
+   1342.6000   1469.9700     34.9100     -0.2500
+   1342.7000   1469.9700     34.9100     -0.2500
+   1342.8000   1469.9700     34.9100     -0.2500
+   1343.0000   1469.9300     34.9100     -0.2600
+   1343.1000   1469.9800     34.9200     -0.2500
+   1343.2000   1469.9900     34.9100     -0.2500
+   1343.3000   1469.9300     34.9100     -0.2600
+   1343.5000   1469.9900     34.9100     -0.2500
+   1343.6000   1469.9400     34.9100     -0.2600
+   1343.7000   1469.9900     34.9100     -0.2500
+   1343.9000   1470.0000     34.9100     -0.2500
+   1344.0000   1469.9400     34.9100     -0.2600
+   1344.1000   1470.0000     34.9100     -0.2500
+   1344.2000   1469.9500     34.9100     -0.2600
+   1344.4000   1469.9600     34.9100     -0.2600
+   1344.5000   1470.0200     34.9200     -0.2500
+   1344.6000   1469.9600     34.9100     -0.2600
+   1344.7000   1470.0100     34.9100     -0.2500
+   1344.9000   1469.9600     34.9100     -0.2600
+   1345.0000   1470.0200     34.9100     -0.2500
+   1345.1000   1469.9700     34.9100     -0.2600
+   1345.3000   1469.9700     34.9100     -0.2600
+   1345.4000   1469.9800     34.9200     -0.2600
+   1345.5000   1469.9800     34.9200     -0.2600
+   1345.6000   1470.0300     34.9200     -0.2500
+   1345.8000   1470.0300     34.9100     -0.2500
+   1345.9000   1469.9700     34.9100     -0.2600
+   1346.0000   1470.0300     34.9100     -0.2500
+   1346.1000   1469.9800     34.9100     -0.2600
+   1346.3000   1469.9900     34.9100     -0.2600
+   1346.4000   1470.0500     34.9200     -0.2500
+   1346.5000   1469.9900     34.9100     -0.2600
+   1346.7000   1469.9900     34.9100     -0.2600
+   1346.8000   1470.0000     34.9200     -0.2600
+   1346.9000   1470.0000     34.9200     -0.2600
+   1347.0000   1470.0100     34.9200     -0.2600
+   1347.2000   1470.0100     34.9200     -0.2600
+   1347.3000   1470.0100     34.9200     -0.2600
+   1347.4000   1470.0100     34.9200     -0.2600
+   1347.5000   1470.0100     34.9200     -0.2600
+   1347.7000   1470.0200     34.9200     -0.2600
+   1347.8000   1470.0200     34.9200     -0.2600
+   1347.9000   1470.0200     34.9200     -0.2600
+   1348.1000   1470.0200     34.9200     -0.2600
+   1348.2000   1470.0200     34.9200     -0.2600
+   1348.3000   1470.0300     34.9200     -0.2600
+   1348.4000   1470.0300     34.9200     -0.2600
+   1348.6000   1470.0300     34.9200     -0.2600
+   1348.7000   1470.0300     34.9200     -0.2600
+   1348.8000   1470.0400     34.9200     -0.2600
+   1349.0000   1470.0400     34.9200     -0.2600
+   1349.1000   1470.0400     34.9200     -0.2600
+   1349.2000   1470.0400     34.9200     -0.2600
+   1349.3000   1470.0400     34.9200     -0.2600
+   1349.5000   1470.0500     34.9200     -0.2600
+   1349.6000   1470.0500     34.9200     -0.2600
+   1349.7000   1470.0500     34.9200     -0.2600
+   1349.8000   1470.0500     34.9200     -0.2600
+   1350.0000   1470.0500     34.9200     -0.2600
+   1350.1000   1470.0600     34.9200     -0.2600
+   1350.2000   1470.0600     34.9200     -0.2600
+   1350.4000   1470.0600     34.9200     -0.2600
+   1350.5000   1470.0600     34.9200     -0.2600
+   1350.6000   1470.0600     34.9200     -0.2600
+   1350.7000   1470.0700     34.9200     -0.2600
+   1350.9000   1470.0700     34.9200     -0.2600
+   1351.0000   1470.0700     34.9200     -0.2600
+   1351.1000   1470.0700     34.9200     -0.2600
+   1351.2000   1470.0700     34.9200     -0.2600
+   1351.4000   1470.0800     34.9200     -0.2600
+   1351.5000   1470.0800     34.9200     -0.2600
+   1351.6000   1470.0800     34.9200     -0.2600
+   1351.8000   1470.0800     34.9200     -0.2600
+   1351.9000   1470.0800     34.9200     -0.2600
+   1352.0000   1470.0900     34.9200     -0.2600
+   1352.1000   1470.0900     34.9200     -0.2600
+   1352.3000   1470.0900     34.9200     -0.2600
+   1352.4000   1470.0900     34.9200     -0.2600
+   1352.5000   1470.0900     34.9200     -0.2600
+   1352.6000   1470.1000     34.9200     -0.2600
+   1352.8000   1470.1000     34.9200     -0.2600
+   1352.9000   1470.1000     34.9200     -0.2600
+   1353.0000   1470.1000     34.9200     -0.2600
+   1353.2000   1470.1000     34.9200     -0.2600
+   1353.3000   1470.1100     34.9200     -0.2600
+   1353.4000   1470.1100     34.9200     -0.2600
+   1353.5000   1470.1100     34.9200     -0.2600
+   1353.7000   1470.1100     34.9200     -0.2600
+   1353.8000   1470.1100     34.9100     -0.2600
+   1353.9000   1470.1200     34.9100     -0.2600
+   1354.0000   1470.1200     34.9100     -0.2600
+   1354.2000   1470.1200     34.9100     -0.2600
+   1354.3000   1470.1200     34.9100     -0.2600
+   1354.4000   1470.1200     34.9100     -0.2600
+   1354.6000   1470.1300     34.9100     -0.2600
+   1354.7000   1470.1300     34.9100     -0.2600
+   1354.8000   1470.1300     34.9100     -0.2600
+   1354.9000   1470.1300     34.9100     -0.2600
+   1355.1000   1470.1300     34.9100     -0.2600
+   1355.2000   1470.1400     34.9100     -0.2600
+   1355.3000   1470.1400     34.9100     -0.2600
+   1355.5000   1470.1400     34.9100     -0.2600
+   1355.6000   1470.1400     34.9100     -0.2600
+   1355.7000   1470.1400     34.9100     -0.2600
+   1355.8000   1470.1500     34.9100     -0.2600
+   1356.0000   1470.1500     34.9100     -0.2600
+   1356.1000   1470.1500     34.9100     -0.2600
+   1356.2000   1470.1500     34.9100     -0.2600
+   1356.3000   1470.1100     34.9100     -0.2700
+   1356.5000   1470.1600     34.9200     -0.2600
+   1356.6000   1470.1700     34.9200     -0.2600
+   1356.7000   1470.1100     34.9100     -0.2700
+   1356.9000   1470.1700     34.9200     -0.2600
+   1357.0000   1470.1200     34.9200     -0.2700
+   1357.1000   1470.1700     34.9200     -0.2600
+   1357.2000   1470.1800     34.9200     -0.2600
+   1357.4000   1470.1200     34.9100     -0.2700
+   1357.5000   1470.1800     34.9200     -0.2600
+   1357.6000   1470.1300     34.9200     -0.2700
+   1357.7000   1470.1900     34.9200     -0.2600
+   1357.9000   1470.1400     34.9200     -0.2700
+   1358.0000   1470.1400     34.9200     -0.2700
+   1358.1000   1470.2000     34.9200     -0.2600
+   1358.3000   1470.1400     34.9200     -0.2700
+   1358.4000   1470.1500     34.9200     -0.2700
+   1358.5000   1470.1600     34.9200     -0.2700
+   1358.6000   1470.1600     34.9200     -0.2700
+   1358.8000   1470.1600     34.9200     -0.2700
+   1358.9000   1470.1600     34.9200     -0.2700
+   1359.0000   1470.1600     34.9200     -0.2700
+   1359.1000   1470.1700     34.9200     -0.2700
+   1359.3000   1470.1700     34.9200     -0.2700
+   1359.4000   1470.1700     34.9200     -0.2700
+   1359.5000   1470.1700     34.9200     -0.2700
+   1359.7000   1470.1700     34.9200     -0.2700
+   1359.8000   1470.1800     34.9200     -0.2700
+   1359.9000   1470.1800     34.9200     -0.2700
+   1360.0000   1470.1800     34.9200     -0.2700
+   1360.2000   1470.1800     34.9200     -0.2700
+   1360.3000   1470.1800     34.9200     -0.2700
+   1360.4000   1470.1900     34.9200     -0.2700
+   1360.5000   1470.1900     34.9200     -0.2700
+   1360.7000   1470.1900     34.9200     -0.2700
+   1360.8000   1470.1900     34.9200     -0.2700
+   1360.9000   1470.1900     34.9200     -0.2700
+   1361.1000   1470.2000     34.9200     -0.2700
+   1361.2000   1470.2000     34.9200     -0.2700
+   1361.3000   1470.2000     34.9200     -0.2700
+   1361.4000   1470.2000     34.9200     -0.2700
+   1361.6000   1470.2000     34.9200     -0.2700
+   1361.7000   1470.2100     34.9200     -0.2700
+   1361.8000   1470.2100     34.9200     -0.2700
+   1361.9000   1470.2100     34.9200     -0.2700
+   1362.1000   1470.2100     34.9200     -0.2700
+   1362.2000   1470.2200     34.9200     -0.2700
+   1362.3000   1470.2200     34.9200     -0.2700
+   1362.5000   1470.2200     34.9200     -0.2700
+   1362.6000   1470.2200     34.9200     -0.2700
+   1362.7000   1470.2200     34.9200     -0.2700
+   1362.8000   1470.2300     34.9200     -0.2700
+   1363.0000   1470.2300     34.9200     -0.2700
+   1363.1000   1470.2300     34.9200     -0.2700
+   1363.2000   1470.2300     34.9200     -0.2700
+   1363.3000   1470.2300     34.9200     -0.2700
+   1363.5000   1470.2400     34.9200     -0.2700
+   1363.6000   1470.2400     34.9200     -0.2700
+   1363.7000   1470.2400     34.9200     -0.2700
+   1363.9000   1470.2400     34.9200     -0.2700
+   1364.0000   1470.2400     34.9200     -0.2700
+   1364.1000   1470.2500     34.9200     -0.2700
+   1364.2000   1470.2500     34.9200     -0.2700
+   1364.4000   1470.2500     34.9200     -0.2700
+   1364.5000   1470.2500     34.9200     -0.2700
+   1364.6000   1470.2500     34.9200     -0.2700
+   1364.7000   1470.2600     34.9200     -0.2700
+   1364.9000   1470.2600     34.9200     -0.2700
+   1365.0000   1470.2600     34.9200     -0.2700
+   1365.1000   1470.2600     34.9200     -0.2700
+   1365.3000   1470.2600     34.9200     -0.2700
+   1365.4000   1470.2700     34.9200     -0.2700
+   1365.5000   1470.2700     34.9200     -0.2700
+   1365.6000   1470.2700     34.9200     -0.2700
+   1365.8000   1470.2700     34.9200     -0.2700
+   1365.9000   1470.2700     34.9200     -0.2700
+   1366.0000   1470.2800     34.9200     -0.2700
+   1366.1000   1470.2800     34.9200     -0.2700
+   1366.3000   1470.2800     34.9200     -0.2700
+   1366.4000   1470.2800     34.9200     -0.2700
+   1366.5000   1470.2800     34.9200     -0.2700
+   1366.7000   1470.2900     34.9200     -0.2700
+   1366.8000   1470.2900     34.9200     -0.2700
+   1366.9000   1470.2900     34.9200     -0.2700
+   1367.0000   1470.2900     34.9200     -0.2700
+   1367.2000   1470.2900     34.9200     -0.2700
+   1367.3000   1470.3000     34.9200     -0.2700
+   1367.4000   1470.3000     34.9200     -0.2700
+   1367.5000   1470.3000     34.9200     -0.2700
+   1367.7000   1470.3000     34.9200     -0.2700
+   1367.8000   1470.3000     34.9200     -0.2700
+   1367.9000   1470.3100     34.9200     -0.2700
+   1368.1000   1470.3100     34.9200     -0.2700
+   1368.2000   1470.3100     34.9200     -0.2700
+   1368.3000   1470.3100     34.9200     -0.2700
+   1368.4000   1470.3100     34.9200     -0.2700
+   1368.6000   1470.3200     34.9200     -0.2700
+   1368.7000   1470.3200     34.9200     -0.2700
+   1368.8000   1470.3200     34.9200     -0.2700
+   1369.0000   1470.3200     34.9200     -0.2700
+   1369.1000   1470.3200     34.9200     -0.2700
+   1369.2000   1470.3300     34.9200     -0.2700
+   1369.3000   1470.3300     34.9200     -0.2700
+   1369.5000   1470.3300     34.9200     -0.2700
+   1369.6000   1470.3300     34.9200     -0.2700
+   1369.7000   1470.3300     34.9200     -0.2700
+   1369.8000   1470.3400     34.9200     -0.2700
+   1370.0000   1470.3400     34.9200     -0.2700
+   1370.1000   1470.3400     34.9200     -0.2700
+   1370.2000   1470.3400     34.9200     -0.2700
+   1370.4000   1470.3400     34.9200     -0.2700
+   1370.5000   1470.3500     34.9200     -0.2700
+   1370.6000   1470.3500     34.9200     -0.2700
+   1370.7000   1470.3500     34.9200     -0.2700
+   1370.9000   1470.3500     34.9200     -0.2700
+   1371.0000   1470.3500     34.9200     -0.2700
+   1371.1000   1470.3600     34.9200     -0.2700
+   1371.2000   1470.3600     34.9200     -0.2700
+   1371.4000   1470.3600     34.9200     -0.2700
+   1371.5000   1470.3600     34.9200     -0.2700
+   1371.6000   1470.3600     34.9200     -0.2700
+   1371.8000   1470.3700     34.9200     -0.2700
+   1371.9000   1470.3700     34.9200     -0.2700
+   1372.0000   1470.3700     34.9200     -0.2700
+   1372.1000   1470.3700     34.9200     -0.2700
+   1372.3000   1470.3800     34.9200     -0.2700
+   1372.4000   1470.3800     34.9200     -0.2700
+   1372.5000   1470.3800     34.9200     -0.2700
+   1372.6000   1470.3800     34.9200     -0.2700
+   1372.8000   1470.3800     34.9200     -0.2700
+   1372.9000   1470.3900     34.9200     -0.2700
+   1373.0000   1470.3900     34.9200     -0.2700
+   1373.2000   1470.3900     34.9200     -0.2700
+   1373.3000   1470.3900     34.9200     -0.2700
+   1373.4000   1470.3900     34.9200     -0.2700
+   1373.5000   1470.4000     34.9200     -0.2700
+   1373.7000   1470.4000     34.9200     -0.2700
+   1373.8000   1470.4000     34.9200     -0.2700
+   1373.9000   1470.4000     34.9200     -0.2700
+   1374.0000   1470.4000     34.9200     -0.2700
+   1374.2000   1470.4100     34.9200     -0.2700
+   1374.3000   1470.4100     34.9200     -0.2700
+   1374.4000   1470.4100     34.9200     -0.2700
+   1374.6000   1470.4100     34.9200     -0.2700
+   1374.7000   1470.4100     34.9200     -0.2700
+   1374.8000   1470.4200     34.9200     -0.2700
+   1374.9000   1470.4200     34.9200     -0.2700
+   1375.1000   1470.4200     34.9200     -0.2700
+   1375.2000   1470.4200     34.9100     -0.2700
+   1375.3000   1470.4200     34.9100     -0.2700
+   1375.4000   1470.4300     34.9100     -0.2700
+   1375.6000   1470.4300     34.9100     -0.2700
+   1375.7000   1470.4300     34.9100     -0.2700
+   1375.8000   1470.4300     34.9100     -0.2700
+   1376.0000   1470.4300     34.9100     -0.2700
+   1376.1000   1470.4400     34.9100     -0.2700
+   1376.2000   1470.4400     34.9100     -0.2700
+   1376.3000   1470.4400     34.9100     -0.2700
+   1376.5000   1470.4400     34.9100     -0.2700
+   1376.6000   1470.4400     34.9100     -0.2700
+   1376.7000   1470.4500     34.9100     -0.2700
+   1376.8000   1470.4500     34.9100     -0.2700
+   1377.0000   1470.4500     34.9100     -0.2700
+   1377.1000   1470.4500     34.9100     -0.2700
+   1377.2000   1470.4500     34.9100     -0.2700
+   1377.3000   1470.4600     34.9100     -0.2700
+   1377.5000   1470.4600     34.9100     -0.2700
+   1377.6000   1470.4600     34.9100     -0.2700
+   1377.7000   1470.4600     34.9100     -0.2700
+   1377.9000   1470.4600     34.9100     -0.2700
+   1378.0000   1470.4200     34.9100     -0.2800
+   1378.1000   1470.5000     34.9400     -0.2700
+   1378.2000   1470.4800     34.9200     -0.2700
+   1378.4000   1470.4700     34.9100     -0.2700
+   1378.5000   1470.4700     34.9100     -0.2700
+   1378.6000   1470.4800     34.9100     -0.2700
+   1378.7000   1470.4800     34.9100     -0.2700
+   1378.9000   1470.4800     34.9100     -0.2700
+   1379.0000   1470.4800     34.9100     -0.2700
+   1379.1000   1470.4800     34.9100     -0.2700
+   1379.3000   1470.4900     34.9100     -0.2700
+   1379.4000   1470.4900     34.9100     -0.2700
+   1379.5000   1470.4900     34.9100     -0.2700
+   1379.6000   1470.4900     34.9100     -0.2700
+   1379.8000   1470.4900     34.9100     -0.2700
+   1379.9000   1470.5000     34.9100     -0.2700
+   1380.0000   1470.5000     34.9100     -0.2700
+   1380.1000   1470.5000     34.9100     -0.2700
+   1380.3000   1470.5000     34.9100     -0.2700
+   1380.4000   1470.5000     34.9100     -0.2700
+   1380.5000   1470.5100     34.9100     -0.2700
+   1380.7000   1470.5100     34.9100     -0.2700
+   1380.8000   1470.5100     34.9100     -0.2700
+   1380.9000   1470.5100     34.9100     -0.2700
+   1381.0000   1470.5400     34.9300     -0.2700
+   1381.2000   1470.5200     34.9100     -0.2700
+   1381.3000   1470.5200     34.9100     -0.2700
+   1381.4000   1470.5200     34.9100     -0.2700
+   1381.5000   1470.5200     34.9100     -0.2700
+   1381.7000   1470.5300     34.9100     -0.2700
+   1381.8000   1470.5300     34.9100     -0.2700
+   1381.9000   1470.5300     34.9100     -0.2700
+   1382.1000   1470.5300     34.9100     -0.2700
+   1382.2000   1470.5300     34.9100     -0.2700
+   1382.3000   1470.5400     34.9100     -0.2700
+   1382.4000   1470.5400     34.9100     -0.2700
+   1382.6000   1470.5400     34.9100     -0.2700
+   1382.7000   1470.5400     34.9100     -0.2700
+   1382.8000   1470.5400     34.9100     -0.2700
+   1382.9000   1470.5500     34.9100     -0.2700
+   1383.1000   1470.5500     34.9100     -0.2700
+   1383.2000   1470.5800     34.9300     -0.2700
+   1383.3000   1470.5500     34.9100     -0.2700
+   1383.5000   1470.5500     34.9100     -0.2700
+   1383.6000   1470.5600     34.9100     -0.2700
+   1383.7000   1470.5600     34.9100     -0.2700
+   1383.8000   1470.5600     34.9100     -0.2700
+   1384.0000   1470.5600     34.9100     -0.2700
+   1384.1000   1470.5600     34.9100     -0.2700
+   1384.2000   1470.5700     34.9100     -0.2700
+   1384.3000   1470.5700     34.9100     -0.2700
+   1384.5000   1470.5700     34.9100     -0.2700
+   1384.6000   1470.6000     34.9300     -0.2700
+   1384.7000   1470.5700     34.9100     -0.2700
+   1384.9000   1470.5800     34.9100     -0.2700
+   1385.0000   1470.5800     34.9100     -0.2700
+   1385.1000   1470.6100     34.9300     -0.2700
+   1385.2000   1470.5800     34.9100     -0.2700
+   1385.4000   1470.5800     34.9100     -0.2700
+   1385.5000   1470.5900     34.9100     -0.2700
+   1385.6000   1470.5900     34.9100     -0.2700
+   1385.7000   1470.5900     34.9100     -0.2700
+   1385.9000   1470.5900     34.9100     -0.2700
+   1386.0000   1470.5900     34.9100     -0.2700
+   1386.1000   1470.6000     34.9100     -0.2700
+   1386.3000   1470.6000     34.9100     -0.2700
+   1386.4000   1470.6000     34.9100     -0.2700
+   1386.5000   1470.6000     34.9100     -0.2700
+   1386.6000   1470.5500     34.9100     -0.2800
+   1386.8000   1470.6100     34.9100     -0.2700
+   1386.9000   1470.5700     34.9100     -0.2800
+   1387.0000   1470.6200     34.9100     -0.2700
+   1387.1000   1470.6200     34.9100     -0.2700
+   1387.3000   1470.5700     34.9100     -0.2800
+   1387.4000   1470.6200     34.9100     -0.2700
+   1387.5000   1470.5800     34.9100     -0.2800
+   1387.7000   1470.5800     34.9100     -0.2800
+   1387.8000   1470.5900     34.9200     -0.2800
+   1387.9000   1470.5900     34.9200     -0.2800
+   1388.0000   1470.6400     34.9200     -0.2700
+   1388.2000   1470.5900     34.9100     -0.2800
+   1388.3000   1470.5900     34.9100     -0.2800
+   1388.4000   1470.6000     34.9200     -0.2800
+   1388.5000   1470.6500     34.9200     -0.2700
+   1388.7000   1470.6400     34.9100     -0.2700
+   1388.8000   1470.5900     34.9100     -0.2800
+   1388.9000   1470.6500     34.9100     -0.2700
+   1389.1000   1470.6000     34.9100     -0.2800
+   1389.2000   1470.6000     34.9100     -0.2800
+   1389.3000   1470.6600     34.9200     -0.2700
+   1389.4000   1470.6100     34.9100     -0.2800
+   1389.6000   1470.6600     34.9100     -0.2700
+   1389.7000   1470.6600     34.9100     -0.2700
+   1389.8000   1470.6100     34.9100     -0.2800
+   1389.9000   1470.6600     34.9100     -0.2700
+   1390.1000   1470.6200     34.9100     -0.2800
+   1390.2000   1470.6200     34.9100     -0.2800
+   1390.3000   1470.6800     34.9200     -0.2700
+   1390.5000   1470.6200     34.9100     -0.2800
+   1390.6000   1470.6300     34.9100     -0.2800
+   1390.7000   1470.6400     34.9200     -0.2800
+   1390.8000   1470.6900     34.9200     -0.2700
+   1391.0000   1470.6300     34.9100     -0.2800
+   1391.1000   1470.6300     34.9100     -0.2800
+   1391.2000   1470.6400     34.9200     -0.2800
+   1391.3000   1470.6500     34.9200     -0.2800
+   1391.5000   1470.6500     34.9200     -0.2800
+   1391.6000   1470.6500     34.9200     -0.2800
+   1391.7000   1470.6500     34.9200     -0.2800
+   1391.8000   1470.6500     34.9200     -0.2800
+   1392.0000   1470.6600     34.9200     -0.2800
+   1392.1000   1470.6600     34.9200     -0.2800
+   1392.2000   1470.6600     34.9200     -0.2800
+   1392.4000   1470.6600     34.9200     -0.2800
+   1392.5000   1470.6600     34.9200     -0.2800
+   1392.6000   1470.6700     34.9200     -0.2800
+   1392.7000   1470.6700     34.9200     -0.2800
+   1392.9000   1470.6700     34.9200     -0.2800
+   1393.0000   1470.6700     34.9200     -0.2800
+   1393.1000   1470.6700     34.9200     -0.2800
+   1393.2000   1470.6800     34.9200     -0.2800
+   1393.4000   1470.6800     34.9200     -0.2800
+   1393.5000   1470.6800     34.9200     -0.2800
+   1393.6000   1470.6800     34.9200     -0.2800
+   1393.8000   1470.6800     34.9200     -0.2800
+   1393.9000   1470.6900     34.9200     -0.2800
+   1394.0000   1470.6900     34.9200     -0.2800
+   1394.1000   1470.6900     34.9200     -0.2800
+   1394.3000   1470.6900     34.9200     -0.2800
+   1394.4000   1470.6900     34.9200     -0.2800
+   1394.5000   1470.7000     34.9200     -0.2800
+   1394.6000   1470.7000     34.9200     -0.2800
+   1394.8000   1470.7000     34.9200     -0.2800
+   1394.9000   1470.7000     34.9200     -0.2800
+   1395.0000   1470.7000     34.9200     -0.2800
+   1395.2000   1470.7100     34.9200     -0.2800
+   1395.3000   1470.7100     34.9200     -0.2800
+   1395.4000   1470.7100     34.9200     -0.2800
+   1395.5000   1470.7100     34.9200     -0.2800
+   1395.7000   1470.7100     34.9200     -0.2800
+   1395.8000   1470.7200     34.9200     -0.2800
+   1395.9000   1470.7200     34.9200     -0.2800
+   1396.0000   1470.7200     34.9200     -0.2800
+   1396.2000   1470.7200     34.9200     -0.2800
+   1396.3000   1470.7300     34.9200     -0.2800
+   1396.4000   1470.7300     34.9200     -0.2800
+   1396.6000   1470.7300     34.9200     -0.2800
+   1396.7000   1470.7300     34.9100     -0.2800
+   1396.8000   1470.7300     34.9100     -0.2800
+   1396.9000   1470.7400     34.9100     -0.2800
+   1397.1000   1470.7400     34.9100     -0.2800
+   1397.2000   1470.7700     34.9300     -0.2800
+   1397.3000   1470.7400     34.9100     -0.2800
+   1397.4000   1470.7400     34.9100     -0.2800
+   1397.6000   1470.7500     34.9100     -0.2800
+   1397.7000   1470.7500     34.9100     -0.2800
+   1397.8000   1470.7500     34.9100     -0.2800
+   1397.9000   1470.7500     34.9100     -0.2800
+   1398.1000   1470.7500     34.9100     -0.2800
+   1398.2000   1470.7600     34.9100     -0.2800
+   1398.3000   1470.7800     34.9300     -0.2800
+   1398.5000   1470.7600     34.9100     -0.2800
+   1398.6000   1470.7600     34.9100     -0.2800
+   1398.7000   1470.7900     34.9300     -0.2800
+   1398.8000   1470.7700     34.9100     -0.2800
+   1399.0000   1470.7700     34.9100     -0.2800
+   1399.1000   1470.8000     34.9300     -0.2800
+   1399.2000   1470.7700     34.9100     -0.2800
+   1399.3000   1470.7700     34.9100     -0.2800
+   1399.5000   1470.7800     34.9100     -0.2800
+   1399.6000   1470.7800     34.9100     -0.2800
+   1399.7000   1470.8100     34.9300     -0.2800
+   1399.9000   1470.7800     34.9100     -0.2800
+   1400.0000   1470.7800     34.9100     -0.2800
+   1400.1000   1470.8100     34.9300     -0.2800
+   1400.2000   1470.7900     34.9100     -0.2800
+   1400.4000   1470.7900     34.9100     -0.2800
+   1400.5000   1470.7900     34.9100     -0.2800
+   1400.6000   1470.8200     34.9300     -0.2800
+   1400.7000   1470.8000     34.9100     -0.2800
+   1400.9000   1470.8000     34.9100     -0.2800
+   1401.0000   1470.8000     34.9100     -0.2800
+   1401.1000   1470.8000     34.9100     -0.2800
+   1401.3000   1470.8000     34.9100     -0.2800
+   1401.4000   1470.8100     34.9100     -0.2800
+   1401.5000   1470.8100     34.9100     -0.2800
+   1401.6000   1470.8100     34.9100     -0.2800
+   1401.8000   1470.8100     34.9100     -0.2800
+   1401.9000   1470.8100     34.9100     -0.2800
+   1402.0000   1470.8200     34.9100     -0.2800
+   1402.1000   1470.8200     34.9100     -0.2800
+   1402.3000   1470.8500     34.9300     -0.2800
+   1402.4000   1470.8200     34.9100     -0.2800
+   1402.5000   1470.8200     34.9100     -0.2800
+   1402.7000   1470.8300     34.9100     -0.2800
+   1402.8000   1470.8300     34.9100     -0.2800
+   1402.9000   1470.8600     34.9300     -0.2800
+   1403.0000   1470.8300     34.9100     -0.2800
+   1403.2000   1470.8300     34.9100     -0.2800
+   1403.3000   1470.8400     34.9100     -0.2800
+   1403.4000   1470.8400     34.9100     -0.2800
+   1403.5000   1470.8400     34.9100     -0.2800
+   1403.7000   1470.8400     34.9100     -0.2800
+   1403.8000   1470.8400     34.9100     -0.2800
+   1403.9000   1470.8500     34.9100     -0.2800
+   1404.0000   1470.8500     34.9100     -0.2800
+   1404.2000   1470.8800     34.9300     -0.2800
+   1404.3000   1470.8500     34.9100     -0.2800
+   1404.4000   1470.8500     34.9100     -0.2800
+   1404.6000   1470.8600     34.9100     -0.2800
+   1404.7000   1470.8600     34.9100     -0.2800
+   1404.8000   1470.8600     34.9100     -0.2800
+   1404.9000   1470.8600     34.9100     -0.2800
+   1405.1000   1470.8200     34.9100     -0.2900
+   1405.2000   1470.8300     34.9200     -0.2900
+   1405.3000   1470.8400     34.9200     -0.2900
+   1405.4000   1470.8400     34.9200     -0.2900
+   1405.6000   1470.8400     34.9200     -0.2900
+   1405.7000   1470.8400     34.9200     -0.2900
+   1405.8000   1470.8400     34.9200     -0.2900
+   1406.0000   1470.8500     34.9200     -0.2900
+   1406.1000   1470.8500     34.9200     -0.2900
+   1406.2000   1470.8500     34.9200     -0.2900
+   1406.3000   1470.8500     34.9200     -0.2900
+   1406.5000   1470.8500     34.9200     -0.2900
+   1406.6000   1470.8600     34.9200     -0.2900
+   1406.7000   1470.8600     34.9200     -0.2900
+   1406.8000   1470.8600     34.9200     -0.2900
+   1407.0000   1470.8600     34.9200     -0.2900
+   1407.1000   1470.8600     34.9200     -0.2900
+   1407.2000   1470.8700     34.9200     -0.2900
+   1407.4000   1470.8700     34.9200     -0.2900
+   1407.5000   1470.8700     34.9200     -0.2900
+   1407.6000   1470.8700     34.9200     -0.2900
+   1407.7000   1470.8700     34.9200     -0.2900
+   1407.9000   1470.8800     34.9200     -0.2900
+   1408.0000   1470.8800     34.9200     -0.2900
+   1408.1000   1470.8800     34.9200     -0.2900
+   1408.2000   1470.8800     34.9200     -0.2900
+   1408.4000   1470.8800     34.9200     -0.2900
+   1408.5000   1470.8900     34.9200     -0.2900
+   1408.6000   1470.8900     34.9200     -0.2900
+   1408.7000   1470.8900     34.9200     -0.2900
+   1408.9000   1470.8900     34.9200     -0.2900
+   1409.0000   1470.8900     34.9200     -0.2900
+   1409.1000   1470.9000     34.9200     -0.2900
+   1409.3000   1470.9000     34.9200     -0.2900
+   1409.4000   1470.9000     34.9200     -0.2900
+   1409.5000   1470.9000     34.9200     -0.2900
+   1409.6000   1470.9000     34.9200     -0.2900
+   1409.8000   1470.9100     34.9200     -0.2900
+   1409.9000   1470.9100     34.9200     -0.2900
+   1410.0000   1470.9100     34.9200     -0.2900
+   1410.1000   1470.9100     34.9200     -0.2900
+   1410.3000   1470.9100     34.9200     -0.2900
+   1410.4000   1470.9200     34.9200     -0.2900
+   1410.5000   1470.9200     34.9200     -0.2900
+   1410.7000   1470.9200     34.9200     -0.2900
+   1410.8000   1470.9200     34.9200     -0.2900
+   1410.9000   1470.9300     34.9200     -0.2900
+   1411.0000   1470.9300     34.9200     -0.2900
+   1411.2000   1470.9300     34.9200     -0.2900
+   1411.3000   1470.9300     34.9200     -0.2900
+   1411.4000   1470.9300     34.9200     -0.2900
+   1411.5000   1470.9400     34.9200     -0.2900
+   1411.7000   1470.9400     34.9200     -0.2900
+   1411.8000   1470.9400     34.9200     -0.2900
+   1411.9000   1470.9400     34.9200     -0.2900
+   1412.0000   1470.9400     34.9200     -0.2900
+   1412.2000   1470.9500     34.9200     -0.2900
+   1412.3000   1470.9500     34.9200     -0.2900
+   1412.4000   1470.9500     34.9200     -0.2900
+   1412.6000   1470.9500     34.9200     -0.2900
+   1412.7000   1470.9500     34.9200     -0.2900
+   1412.8000   1470.9600     34.9200     -0.2900
+   1412.9000   1470.9600     34.9200     -0.2900
+   1413.1000   1470.9600     34.9200     -0.2900
+   1413.2000   1470.9600     34.9200     -0.2900
+   1413.3000   1470.9600     34.9200     -0.2900
+   1413.4000   1470.9700     34.9200     -0.2900
+   1413.6000   1470.9700     34.9200     -0.2900
+   1413.7000   1470.9700     34.9200     -0.2900
+   1413.8000   1470.9700     34.9200     -0.2900
+   1414.0000   1470.9700     34.9200     -0.2900
+   1414.1000   1470.9800     34.9200     -0.2900
+   1414.2000   1470.9800     34.9200     -0.2900
+   1414.3000   1470.9800     34.9200     -0.2900
+   1414.5000   1470.9800     34.9200     -0.2900
+   1414.6000   1470.9800     34.9200     -0.2900
+   1414.7000   1470.9900     34.9200     -0.2900
+   1414.8000   1470.9900     34.9200     -0.2900
+   1415.0000   1470.9900     34.9200     -0.2900
+   1415.1000   1470.9900     34.9200     -0.2900
+   1415.2000   1470.9900     34.9200     -0.2900
+   1415.4000   1471.0000     34.9200     -0.2900
+   1415.5000   1471.0000     34.9200     -0.2900
+   1415.6000   1471.0000     34.9200     -0.2900
+   1415.7000   1471.0000     34.9200     -0.2900
+   1415.9000   1471.0000     34.9200     -0.2900
+   1416.0000   1471.0100     34.9200     -0.2900
+   1416.1000   1470.9600     34.9200     -0.3000
+   1416.2000   1471.0200     34.9200     -0.2900
+   1416.4000   1471.0200     34.9200     -0.2900
+   1416.5000   1471.0100     34.9200     -0.2900
+   1416.6000   1471.0200     34.9200     -0.2900
+   1416.7000   1471.0200     34.9200     -0.2900
+   1416.9000   1471.0200     34.9200     -0.2900
+   1417.0000   1471.0200     34.9200     -0.2900
+   1417.1000   1471.0200     34.9200     -0.2900
+   1417.3000   1471.0300     34.9200     -0.2900
+   1417.4000   1471.0300     34.9200     -0.2900
+   1417.5000   1471.0300     34.9200     -0.2900
+   1417.6000   1471.0300     34.9200     -0.2900
+   1417.8000   1471.0300     34.9200     -0.2900
+   1417.9000   1471.0400     34.9200     -0.2900
+   1418.0000   1471.0400     34.9200     -0.2900
+   1418.1000   1471.0400     34.9100     -0.2900
+   1418.3000   1471.0400     34.9100     -0.2900
+   1418.4000   1471.0400     34.9100     -0.2900
+   1418.5000   1471.0500     34.9100     -0.2900
+   1418.7000   1471.0500     34.9100     -0.2900
+   1418.8000   1471.0500     34.9100     -0.2900
+   1418.9000   1471.0500     34.9100     -0.2900
+   1419.0000   1471.0500     34.9100     -0.2900
+   1419.2000   1471.0600     34.9100     -0.2900
+   1419.3000   1471.0100     34.9100     -0.3000
+   1419.4000   1471.0700     34.9200     -0.2900
+   1419.5000   1471.0700     34.9200     -0.2900
+   1419.7000   1471.0200     34.9100     -0.3000
+   1419.8000   1471.0700     34.9200     -0.2900
+   1419.9000   1471.0300     34.9200     -0.3000
+   1420.0000   1471.0800     34.9200     -0.2900
+   1420.2000   1471.0800     34.9200     -0.2900
+   1420.3000   1471.0700     34.9100     -0.2900
+   1420.4000   1471.0800     34.9100     -0.2900
+   1420.6000   1471.0800     34.9100     -0.2900
+   1420.7000   1471.0800     34.9100     -0.2900
+   1420.8000   1471.0800     34.9100     -0.2900
+   1420.9000   1471.0800     34.9100     -0.2900
+   1421.1000   1471.0900     34.9100     -0.2900
+   1421.2000   1471.0900     34.9100     -0.2900
+   1421.3000   1471.0900     34.9100     -0.2900
+   1421.4000   1471.0900     34.9100     -0.2900
+   1421.6000   1471.0900     34.9100     -0.2900
+   1421.7000   1471.1000     34.9100     -0.2900
+   1421.8000   1471.1000     34.9100     -0.2900
+   1421.9000   1471.1000     34.9100     -0.2900
+   1422.1000   1471.1000     34.9100     -0.2900
+   1422.2000   1471.1100     34.9100     -0.2900
+   1422.3000   1471.1100     34.9100     -0.2900
+   1422.5000   1471.1100     34.9100     -0.2900
+   1422.6000   1471.1100     34.9100     -0.2900
+   1422.7000   1471.1100     34.9100     -0.2900
+   1422.8000   1471.1200     34.9100     -0.2900
+   1423.0000   1471.1200     34.9100     -0.2900
+   1423.1000   1471.1200     34.9100     -0.2900
+   1423.2000   1471.1200     34.9100     -0.2900
+   1423.3000   1471.1200     34.9100     -0.2900
+   1423.5000   1471.1300     34.9100     -0.2900
+   1423.6000   1471.1300     34.9100     -0.2900
+   1423.7000   1471.1300     34.9100     -0.2900
+   1423.9000   1471.1300     34.9100     -0.2900
+   1424.0000   1471.1300     34.9100     -0.2900
+   1424.1000   1471.1400     34.9100     -0.2900
+   1424.2000   1471.1400     34.9100     -0.2900
+   1424.4000   1471.1400     34.9100     -0.2900
+   1424.5000   1471.1400     34.9100     -0.2900
+   1424.6000   1471.1400     34.9100     -0.2900
+   1424.7000   1471.1500     34.9100     -0.2900
+   1424.9000   1471.1500     34.9100     -0.2900
+   1425.0000   1471.1500     34.9100     -0.2900
+   1425.1000   1471.1500     34.9100     -0.2900
+   1425.2000   1471.1500     34.9100     -0.2900
+   1425.4000   1471.1100     34.9100     -0.3000
+   1425.5000   1471.1700     34.9200     -0.2900
+   1425.6000   1471.1700     34.9200     -0.2900
+   1425.8000   1471.1600     34.9100     -0.2900
+   1425.9000   1471.1600     34.9100     -0.2900
+   1426.0000   1471.1700     34.9100     -0.2900
+   1426.1000   1471.1700     34.9100     -0.2900
+   1426.3000   1471.1200     34.9100     -0.3000
+   1426.4000   1471.1800     34.9200     -0.2900
+   1426.5000   1471.1800     34.9200     -0.2900
+   1426.6000   1471.1800     34.9100     -0.2900
+   1426.8000   1471.1800     34.9100     -0.2900
+   1426.9000   1471.1300     34.9100     -0.3000
+   1427.0000   1471.1900     34.9200     -0.2900
+   1427.2000   1471.1900     34.9200     -0.2900
+   1427.3000   1471.1900     34.9100     -0.2900
+   1427.4000   1471.1900     34.9100     -0.2900
+   1427.5000   1471.1400     34.9100     -0.3000
+   1427.7000   1471.2000     34.9200     -0.2900
+   1427.8000   1471.2000     34.9200     -0.2900
+   1427.9000   1471.2000     34.9100     -0.2900
+   1428.0000   1471.2000     34.9100     -0.2900
+   1428.2000   1471.1500     34.9100     -0.3000
+   1428.3000   1471.2100     34.9200     -0.2900
+   1428.4000   1471.2100     34.9200     -0.2900
+   1428.5000   1471.2100     34.9100     -0.2900
+   1428.7000   1471.2100     34.9100     -0.2900
+   1428.8000   1471.1600     34.9100     -0.3000
+   1428.9000   1471.2200     34.9100     -0.2900
+   1429.1000   1471.2200     34.9100     -0.2900
+   1429.2000   1471.2200     34.9100     -0.2900
+   1429.3000   1471.2200     34.9100     -0.2900
+   1429.4000   1471.1700     34.9100     -0.3000
+   1429.6000   1471.2300     34.9100     -0.2900
+   1429.7000   1471.2300     34.9100     -0.2900
+   1429.8000   1471.1800     34.9100     -0.3000
+   1429.9000   1471.2400     34.9100     -0.2900
+   1430.1000   1471.1900     34.9100     -0.3000
+   1430.2000   1471.2700     34.9300     -0.2900
+   1430.3000   1471.2400     34.9100     -0.2900
+   1430.4000   1471.1900     34.9100     -0.3000
+   1430.6000   1471.2500     34.9100     -0.2900
+   1430.7000   1471.2000     34.9100     -0.3000
+   1430.8000   1471.2800     34.9300     -0.2900
+   1431.0000   1471.2500     34.9100     -0.2900
+   1431.1000   1471.2000     34.9100     -0.3000
+   1431.2000   1471.2600     34.9100     -0.2900
+   1431.3000   1471.2600     34.9100     -0.2900
+   1431.5000   1471.2500     34.9100     -0.2900
+   1431.6000   1471.2100     34.9100     -0.3000
+   1431.7000   1471.2200     34.9100     -0.3000
+   1431.8000   1471.2800     34.9200     -0.2900
+   1432.0000   1471.2200     34.9100     -0.3000
+   1432.1000   1471.2200     34.9100     -0.3000
+   1432.2000   1471.2800     34.9200     -0.2900
+   1432.4000   1471.2300     34.9100     -0.3000
+   1432.5000   1471.2800     34.9100     -0.2900
+   1432.6000   1471.2300     34.9100     -0.3000
+   1432.7000   1471.2300     34.9100     -0.3000
+   1432.9000   1471.2400     34.9200     -0.3000
+   1433.0000   1471.2400     34.9200     -0.3000
+   1433.1000   1471.3200     34.9400     -0.2900
+   1433.2000   1471.2400     34.9100     -0.3000
+   1433.4000   1471.2400     34.9100     -0.3000
+   1433.5000   1471.2500     34.9200     -0.3000
+   1433.6000   1471.2800     34.9400     -0.3000
+   1433.7000   1471.2600     34.9200     -0.3000
+   1433.9000   1471.2600     34.9200     -0.3000
+   1434.0000   1471.2600     34.9200     -0.3000
+   1434.1000   1471.2600     34.9200     -0.3000
+   1434.3000   1471.2600     34.9200     -0.3000
+   1434.4000   1471.2900     34.9400     -0.3000
+   1434.5000   1471.2700     34.9200     -0.3000
+   1434.6000   1471.2700     34.9200     -0.3000
+   1434.8000   1471.2700     34.9200     -0.3000
+   1434.9000   1471.3000     34.9400     -0.3000
+   1435.0000   1471.2800     34.9200     -0.3000
+   1435.1000   1471.2800     34.9200     -0.3000
+   1435.3000   1471.2800     34.9200     -0.3000
+   1435.4000   1471.2800     34.9200     -0.3000
+   1435.5000   1471.2800     34.9200     -0.3000
+   1435.6000   1471.3400     34.9200     -0.2900
+   1435.8000   1471.3100     34.9300     -0.3000
+   1435.9000   1471.3300     34.9100     -0.2900
+   1436.0000   1471.2800     34.9100     -0.3000
+   1436.2000   1471.2900     34.9100     -0.3000
+   1436.3000   1471.3000     34.9200     -0.3000
+   1436.4000   1471.3000     34.9200     -0.3000
+   1436.5000   1471.3800     34.9400     -0.2900
+   1436.7000   1471.2900     34.9100     -0.3000
+   1436.8000   1471.3000     34.9100     -0.3000
+   1436.9000   1471.3300     34.9400     -0.3000
+   1437.0000   1471.3100     34.9200     -0.3000
+   1437.2000   1471.3400     34.9400     -0.3000
+   1437.3000   1471.3100     34.9200     -0.3000
+   1437.4000   1471.3100     34.9200     -0.3000
+   1437.6000   1471.3700     34.9200     -0.2900
+   1437.7000   1471.3100     34.9100     -0.3000
+   1437.8000   1471.3100     34.9100     -0.3000
+   1437.9000   1471.3500     34.9400     -0.3000
+   1438.1000   1471.3200     34.9200     -0.3000
+   1438.2000   1471.3500     34.9400     -0.3000
+   1438.3000   1471.3300     34.9200     -0.3000
+   1438.4000   1471.3300     34.9200     -0.3000
+   1438.6000   1471.3300     34.9200     -0.3000
+   1438.7000   1471.3300     34.9200     -0.3000
+   1438.8000   1471.3400     34.9200     -0.3000
+   1438.9000   1471.3400     34.9200     -0.3000
+   1439.1000   1471.3700     34.9300     -0.3000
+   1439.2000   1471.3400     34.9200     -0.3000
+   1439.3000   1471.3500     34.9200     -0.3000
+   1439.5000   1471.3500     34.9200     -0.3000
+   1439.6000   1471.3500     34.9100     -0.3000
+   1439.7000   1471.3800     34.9300     -0.3000
+   1439.8000   1471.3500     34.9100     -0.3000
+   1440.0000   1471.3800     34.9300     -0.3000
+   1440.1000   1471.3600     34.9100     -0.3000
+   1440.2000   1471.3600     34.9100     -0.3000
+   1440.3000   1471.3600     34.9100     -0.3000
+   1440.5000   1471.3900     34.9300     -0.3000
+   1440.6000   1471.3900     34.9300     -0.3000
+   1440.7000   1471.3700     34.9100     -0.3000
+   1440.8000   1471.4000     34.9300     -0.3000
+   1441.0000   1471.4000     34.9300     -0.3000
+   1441.1000   1471.3700     34.9100     -0.3000
+   1441.2000   1471.3800     34.9100     -0.3000
+   1441.4000   1471.4000     34.9300     -0.3000
+   1441.5000   1471.3800     34.9100     -0.3000
+   1441.6000   1471.4100     34.9300     -0.3000
+   1441.7000   1471.4100     34.9300     -0.3000
+   1441.9000   1471.3900     34.9100     -0.3000
+   1442.0000   1471.4100     34.9300     -0.3000
+   1442.1000   1471.3900     34.9100     -0.3000
+   1442.2000   1471.4200     34.9300     -0.3000
+   1442.4000   1471.4200     34.9300     -0.3000
+   1442.5000   1471.4200     34.9300     -0.3000
+   1442.6000   1471.4000     34.9100     -0.3000
+   1442.7000   1471.4000     34.9100     -0.3000
+   1442.9000   1471.4300     34.9300     -0.3000
+   1443.0000   1471.4300     34.9300     -0.3000
+   1443.1000   1471.4100     34.9100     -0.3000
+   1443.3000   1471.4100     34.9100     -0.3000
+   1443.4000   1471.4400     34.9300     -0.3000
+   1443.5000   1471.4400     34.9300     -0.3000
+   1443.6000   1471.4400     34.9300     -0.3000
+   1443.8000   1471.4400     34.9300     -0.3000
+   1443.9000   1471.4200     34.9100     -0.3000
+   1444.0000   1471.4200     34.9100     -0.3000
+   1444.1000   1471.4500     34.9300     -0.3000
+   1444.3000   1471.4500     34.9300     -0.3000
+   1444.4000   1471.4300     34.9100     -0.3000
+   1444.5000   1471.4300     34.9100     -0.3000
+   1444.6000   1471.4300     34.9100     -0.3000
+   1444.8000   1471.4600     34.9300     -0.3000
+   1444.9000   1471.4300     34.9100     -0.3000
+   1445.0000   1471.4600     34.9300     -0.3000
+   1445.2000   1471.4400     34.9100     -0.3000
+   1445.3000   1471.4400     34.9100     -0.3000
+   1445.4000   1471.4700     34.9300     -0.3000
+   1445.5000   1471.4700     34.9300     -0.3000
+   1445.7000   1471.4700     34.9300     -0.3000
+   1445.8000   1471.4500     34.9100     -0.3000
+   1445.9000   1471.4800     34.9300     -0.3000
+   1446.0000   1471.4500     34.9100     -0.3000
+   1446.2000   1471.4500     34.9100     -0.3000
+   1446.3000   1471.4600     34.9100     -0.3000
+   1446.4000   1471.4900     34.9300     -0.3000
+   1446.5000   1471.4600     34.9100     -0.3000
+   1446.7000   1471.4900     34.9300     -0.3000
+   1446.8000   1471.4900     34.9300     -0.3000
+   1446.9000   1471.4700     34.9100     -0.3000
+   1447.1000   1471.5000     34.9300     -0.3000
+   1447.2000   1471.4700     34.9100     -0.3000
+   1447.3000   1471.5000     34.9300     -0.3000
+   1447.4000   1471.5000     34.9300     -0.3000
+   1447.6000   1471.5000     34.9300     -0.3000
+   1447.7000   1471.4800     34.9100     -0.3000
+   1447.8000   1471.5100     34.9300     -0.3000
+   1447.9000   1471.5100     34.9300     -0.3000
+   1448.1000   1471.5100     34.9300     -0.3000
+   1448.2000   1471.5100     34.9300     -0.3000
+   1448.3000   1471.4900     34.9100     -0.3000
+   1448.4000   1471.5200     34.9300     -0.3000
+   1448.6000   1471.4900     34.9100     -0.3000
+   1448.7000   1471.4900     34.9100     -0.3000
+   1448.8000   1471.5200     34.9300     -0.3000
+   1449.0000   1471.5000     34.9100     -0.3000
+   1449.1000   1471.5300     34.9300     -0.3000
+   1449.2000   1471.5000     34.9100     -0.3000
+   1449.3000   1471.5000     34.9100     -0.3000
+   1449.5000   1471.5300     34.9300     -0.3000
+   1449.6000   1471.5400     34.9300     -0.3000
+   1449.7000   1471.5100     34.9100     -0.3000
+   1449.8000   1471.5400     34.9300     -0.3000
+   1450.0000   1471.5400     34.9300     -0.3000
+   1450.1000   1471.5400     34.9300     -0.3000
+   1450.2000   1471.5200     34.9100     -0.3000
+   1450.3000   1471.5500     34.9300     -0.3000
+   1450.5000   1471.5500     34.9300     -0.3000
+   1450.6000   1471.5500     34.9300     -0.3000
+   1450.7000   1471.5500     34.9300     -0.3000
+   1450.9000   1471.5300     34.9100     -0.3000
+   1451.0000   1471.5600     34.9300     -0.3000
+   1451.1000   1471.5600     34.9300     -0.3000
+   1451.2000   1471.5600     34.9300     -0.3000
+   1451.4000   1471.5600     34.9300     -0.3000
+   1451.5000   1471.5400     34.9100     -0.3000
+   1451.6000   1471.5700     34.9300     -0.3000
+   1451.7000   1471.5700     34.9300     -0.3000
+   1451.9000   1471.5700     34.9300     -0.3000
+   1452.0000   1471.5700     34.9300     -0.3000
+   1452.1000   1471.5500     34.9100     -0.3000
+   1452.2000   1471.5800     34.9300     -0.3000
+   1452.4000   1471.5800     34.9300     -0.3000
+   1452.5000   1471.5800     34.9300     -0.3000
+   1452.6000   1471.5800     34.9300     -0.3000
+   1452.8000   1471.5900     34.9300     -0.3000
+   1452.9000   1471.5600     34.9100     -0.3000
+   1453.0000   1471.5900     34.9300     -0.3000
+   1453.1000   1471.5900     34.9300     -0.3000
+   1453.3000   1471.5900     34.9300     -0.3000
+   1453.4000   1471.5700     34.9100     -0.3000
+   1453.5000   1471.6000     34.9300     -0.3000
+   1453.6000   1471.6000     34.9300     -0.3000
+   1453.8000   1471.6000     34.9300     -0.3000
+   1453.9000   1471.6000     34.9300     -0.3000
+   1454.0000   1471.6100     34.9300     -0.3000
+   1454.1000   1471.5800     34.9100     -0.3000
+   1454.3000   1471.5800     34.9100     -0.3000
+   1454.4000   1471.6100     34.9300     -0.3000
+   1454.5000   1471.6100     34.9300     -0.3000
+   1454.7000   1471.6200     34.9300     -0.3000
+   1454.8000   1471.6200     34.9300     -0.3000
+   1454.9000   1471.6200     34.9300     -0.3000
+   1455.0000   1471.6000     34.9100     -0.3000
+   1455.2000   1471.6200     34.9300     -0.3000
+   1455.3000   1471.6300     34.9300     -0.3000
+   1455.4000   1471.6300     34.9300     -0.3000
+   1455.5000   1471.6300     34.9300     -0.3000
+   1455.7000   1471.6300     34.9300     -0.3000
+   1455.8000   1471.6300     34.9300     -0.3000
+   1455.9000   1471.6400     34.9300     -0.3000
+   1456.0000   1471.6100     34.9100     -0.3000
+   1456.2000   1471.6400     34.9300     -0.3000
+   1456.3000   1471.6400     34.9300     -0.3000
+   1456.4000   1471.6400     34.9300     -0.3000
+   1456.6000   1471.6200     34.9100     -0.3000
+   1456.7000   1471.6500     34.9300     -0.3000
+   1456.8000   1471.6500     34.9300     -0.3000
+   1456.9000   1471.6500     34.9300     -0.3000
+   1457.1000   1471.6500     34.9200     -0.3000
+   1457.2000   1471.6300     34.9100     -0.3000
+   1457.3000   1471.6600     34.9200     -0.3000
+   1457.4000   1471.6600     34.9200     -0.3000
+   1457.6000   1471.6600     34.9200     -0.3000
+   1457.7000   1471.6600     34.9200     -0.3000
+   1457.8000   1471.6700     34.9200     -0.3000
+   1457.9000   1471.6400     34.9000     -0.3000
+   1458.1000   1471.6700     34.9200     -0.3000
+   1458.2000   1471.6700     34.9200     -0.3000
+   1458.3000   1471.6800     34.9200     -0.3000
+   1458.5000   1471.6500     34.9000     -0.3000
+   1458.6000   1471.6800     34.9200     -0.3000
+   1458.7000   1471.6800     34.9200     -0.3000
+   1458.8000   1471.6800     34.9200     -0.3000
+   1459.0000   1471.6900     34.9200     -0.3000
+   1459.1000   1471.6600     34.9000     -0.3000
+   1459.2000   1471.6900     34.9200     -0.3000
+   1459.3000   1471.6900     34.9200     -0.3000
+   1459.5000   1471.6900     34.9200     -0.3000
+   1459.6000   1471.7000     34.9200     -0.3000
+   1459.7000   1471.6700     34.9000     -0.3000
+   1459.8000   1471.7000     34.9200     -0.3000
+   1460.0000   1471.7000     34.9200     -0.3000
+   1460.1000   1471.7000     34.9200     -0.3000
+   1460.2000   1471.7100     34.9200     -0.3000
+   1460.4000   1471.7100     34.9200     -0.3000
+   1460.5000   1471.7100     34.9200     -0.3000
+   1460.6000   1471.7100     34.9200     -0.3000
+   1460.7000   1471.7100     34.9200     -0.3000
+   1460.9000   1471.7200     34.9200     -0.3000
+   1461.0000   1471.7200     34.9200     -0.3000
+   1461.1000   1471.7200     34.9200     -0.3000
+   1461.2000   1471.7200     34.9200     -0.3000
+   1461.4000   1471.7200     34.9200     -0.3000
+   1461.5000   1471.7300     34.9200     -0.3000
+   1461.6000   1471.7300     34.9200     -0.3000
+   1461.7000   1471.7300     34.9200     -0.3000
+   1461.9000   1471.7300     34.9200     -0.3000
+   1462.0000   1471.7300     34.9200     -0.3000
+   1462.1000   1471.7400     34.9200     -0.3000
+   1462.3000   1471.7400     34.9200     -0.3000
+   1462.4000   1471.7400     34.9200     -0.3000
+   1462.5000   1471.7400     34.9200     -0.3000
+   1462.6000   1471.7400     34.9200     -0.3000
+   1462.8000   1471.7500     34.9200     -0.3000
+   1462.9000   1471.7500     34.9200     -0.3000
+   1463.0000   1471.7500     34.9200     -0.3000
+   1463.1000   1471.7500     34.9200     -0.3000
+   1463.3000   1471.7500     34.9200     -0.3000
+   1463.4000   1471.7600     34.9200     -0.3000
+   1463.5000   1471.7600     34.9200     -0.3000
+   1463.6000   1471.7600     34.9200     -0.3000
+   1463.8000   1471.7600     34.9200     -0.3000
+   1463.9000   1471.7600     34.9200     -0.3000
+   1464.0000   1471.7200     34.9200     -0.3100
+   1464.1000   1471.7800     34.9300     -0.3000
+   1464.3000   1471.7800     34.9300     -0.3000
+   1464.4000   1471.7700     34.9200     -0.3000
+   1464.5000   1471.7700     34.9200     -0.3000
+   1464.7000   1471.7800     34.9200     -0.3000
+   1464.8000   1471.7800     34.9200     -0.3000
+   1464.9000   1471.7300     34.9200     -0.3100
+   1465.0000   1471.7900     34.9300     -0.3000
+   1465.2000   1471.7900     34.9300     -0.3000
+   1465.3000   1471.7900     34.9200     -0.3000
+   1465.4000   1471.7900     34.9200     -0.3000
+   1465.5000   1471.7900     34.9200     -0.3000
+   1465.7000   1471.7900     34.9200     -0.3000
+   1465.8000   1471.7900     34.9200     -0.3000
+   1465.9000   1471.7500     34.9200     -0.3100
+   1466.0000   1471.7800     34.9100     -0.3000
+   1466.2000   1471.7600     34.9300     -0.3100
+   1466.3000   1471.8100     34.9300     -0.3000
+   1466.4000   1471.8100     34.9300     -0.3000
+   1466.6000   1471.7600     34.9200     -0.3100
+   1466.7000   1471.8200     34.9300     -0.3000
+   1466.8000   1471.7700     34.9300     -0.3100
+   1466.9000   1471.8200     34.9300     -0.3000
+   1467.1000   1471.8200     34.9300     -0.3000
+   1467.2000   1471.8200     34.9200     -0.3000
+   1467.3000   1471.8200     34.9200     -0.3000
+   1467.4000   1471.7700     34.9200     -0.3100
+   1467.6000   1471.8300     34.9300     -0.3000
+   1467.7000   1471.8300     34.9300     -0.3000
+   1467.8000   1471.8300     34.9200     -0.3000
+   1467.9000   1471.8300     34.9200     -0.3000
+   1468.1000   1471.8300     34.9200     -0.3000
+   1468.2000   1471.8300     34.9200     -0.3000
+   1468.3000   1471.8300     34.9200     -0.3000
+   1468.5000   1471.8400     34.9200     -0.3000
+   1468.6000   1471.8400     34.9200     -0.3000
+   1468.7000   1471.8400     34.9200     -0.3000
+   1468.8000   1471.8400     34.9200     -0.3000
+   1469.0000   1471.8400     34.9200     -0.3000
+   1469.1000   1471.8500     34.9200     -0.3000
+   1469.2000   1471.8500     34.9200     -0.3000
+   1469.3000   1471.8500     34.9200     -0.3000
+   1469.5000   1471.8500     34.9200     -0.3000
+   1469.6000   1471.8500     34.9200     -0.3000
+   1469.7000   1471.8600     34.9200     -0.3000
+   1469.8000   1471.8600     34.9200     -0.3000
+   1470.0000   1471.8600     34.9200     -0.3000
+   1470.1000   1471.8600     34.9200     -0.3000
+   1470.2000   1471.8600     34.9200     -0.3000
+   1470.4000   1471.8700     34.9200     -0.3000
+   1470.5000   1471.8700     34.9200     -0.3000
+   1470.6000   1471.8700     34.9200     -0.3000
+   1470.7000   1471.8700     34.9200     -0.3000
+   1470.9000   1471.8700     34.9200     -0.3000
+   1471.0000   1471.8800     34.9200     -0.3000
+   1471.1000   1471.8800     34.9200     -0.3000
+   1471.2000   1471.8800     34.9200     -0.3000
+   1471.4000   1471.8800     34.9200     -0.3000
+   1471.5000   1471.8900     34.9200     -0.3000
+   1471.6000   1471.8900     34.9200     -0.3000
+   1471.7000   1471.8900     34.9200     -0.3000
+   1471.9000   1471.8900     34.9200     -0.3000
+   1472.0000   1471.8900     34.9200     -0.3000
+   1472.1000   1471.9000     34.9200     -0.3000
+   1472.2000   1471.8500     34.9200     -0.3100
+   1472.4000   1471.9100     34.9200     -0.3000
+   1472.5000   1471.9100     34.9200     -0.3000
+   1472.6000   1471.9000     34.9200     -0.3000
+   1472.8000   1471.9100     34.9200     -0.3000
+   1472.9000   1471.8600     34.9200     -0.3100
+   1473.0000   1471.9200     34.9200     -0.3000
+   1473.1000   1471.9200     34.9200     -0.3000
+   1473.3000   1471.9100     34.9200     -0.3000
+   1473.4000   1471.9200     34.9200     -0.3000
+   1473.5000   1471.9200     34.9200     -0.3000
+   1473.6000   1471.9200     34.9200     -0.3000
+   1473.8000   1471.9200     34.9200     -0.3000
+   1473.9000   1471.9200     34.9200     -0.3000
+   1474.0000   1471.9300     34.9200     -0.3000
+   1474.1000   1471.9300     34.9200     -0.3000
+   1474.3000   1471.9300     34.9200     -0.3000
+   1474.4000   1471.9300     34.9200     -0.3000
+   1474.5000   1471.9300     34.9200     -0.3000
+   1474.7000   1471.9400     34.9200     -0.3000
+   1474.8000   1471.9400     34.9200     -0.3000
+   1474.9000   1471.9400     34.9200     -0.3000
+   1475.0000   1471.8900     34.9100     -0.3100
+   1475.2000   1471.9500     34.9200     -0.3000
+   1475.3000   1471.9500     34.9200     -0.3000
+   1475.4000   1471.9500     34.9100     -0.3000
+   1475.5000   1471.9500     34.9100     -0.3000
+   1475.7000   1471.9500     34.9100     -0.3000
+   1475.8000   1471.9500     34.9100     -0.3000
+   1475.9000   1471.9600     34.9100     -0.3000
+   1476.0000   1471.9100     34.9100     -0.3100
+   1476.2000   1471.9700     34.9200     -0.3000
+   1476.3000   1471.9200     34.9200     -0.3100
+   1476.4000   1471.9200     34.9200     -0.3100
+   1476.5000   1471.9300     34.9300     -0.3100
+   1476.7000   1471.9300     34.9300     -0.3100
+   1476.8000   1471.9400     34.9300     -0.3100
+   1476.9000   1471.9400     34.9300     -0.3100
+   1477.1000   1471.9400     34.9300     -0.3100
+   1477.2000   1471.9400     34.9300     -0.3100
+   1477.3000   1471.9400     34.9300     -0.3100
+   1477.4000   1471.9500     34.9300     -0.3100
+   1477.6000   1471.9500     34.9300     -0.3100
+   1477.7000   1471.9500     34.9300     -0.3100
+   1477.8000   1471.9500     34.9300     -0.3100
+   1477.9000   1471.9600     34.9300     -0.3100
+   1478.1000   1471.9600     34.9300     -0.3100
+   1478.2000   1471.9300     34.9100     -0.3100
+   1478.3000   1471.9600     34.9300     -0.3100
+   1478.4000   1471.9600     34.9300     -0.3100
+   1478.6000   1471.9700     34.9200     -0.3100
+   1478.7000   1471.9700     34.9200     -0.3100
+   1478.8000   1471.9700     34.9200     -0.3100
+   1479.0000   1471.9700     34.9200     -0.3100
+   1479.1000   1471.9700     34.9200     -0.3100
+   1479.2000   1471.9800     34.9200     -0.3100
+   1479.3000   1471.9800     34.9200     -0.3100
+   1479.5000   1471.9800     34.9200     -0.3100
+   1479.6000   1471.9800     34.9200     -0.3100
+   1479.7000   1471.9800     34.9200     -0.3100
+   1479.8000   1471.9900     34.9200     -0.3100
+   1480.0000   1471.9900     34.9200     -0.3100
+   1480.1000   1471.9900     34.9200     -0.3100
+   1480.2000   1472.0200     34.9400     -0.3100
+   1480.3000   1471.9900     34.9200     -0.3100
+   1480.5000   1472.0000     34.9200     -0.3100
+   1480.6000   1472.0000     34.9200     -0.3100
+   1480.7000   1472.0000     34.9200     -0.3100
+   1480.8000   1472.0000     34.9200     -0.3100
+   1481.0000   1472.0800     34.9400     -0.3000
+   1481.1000   1472.0000     34.9200     -0.3100
+   1481.2000   1472.0500     34.9200     -0.3000
+   1481.4000   1472.0000     34.9200     -0.3100
+   1481.5000   1472.0000     34.9200     -0.3100
+   1481.6000   1472.0100     34.9200     -0.3100
+   1481.7000   1472.0200     34.9200     -0.3100
+   1481.9000   1472.0200     34.9200     -0.3100
+   1482.0000   1472.0200     34.9200     -0.3100
+   1482.1000   1472.0200     34.9200     -0.3100
+   1482.2000   1472.0200     34.9200     -0.3100
+   1482.4000   1472.0500     34.9400     -0.3100
+   1482.5000   1472.0800     34.9200     -0.3000
+   1482.6000   1472.0200     34.9200     -0.3100
+   1482.7000   1472.0200     34.9200     -0.3100
+   1482.9000   1472.0600     34.9400     -0.3100
+   1483.0000   1472.0400     34.9200     -0.3100
+   1483.1000   1472.0400     34.9200     -0.3100
+   1483.2000   1472.0400     34.9200     -0.3100
+   1483.4000   1472.0400     34.9200     -0.3100
+   1483.5000   1472.0400     34.9200     -0.3100
+   1483.6000   1472.0500     34.9200     -0.3100
+   1483.8000   1472.0500     34.9200     -0.3100
+   1483.9000   1472.0500     34.9200     -0.3100
+   1484.0000   1472.0500     34.9200     -0.3100
+   1484.1000   1472.0500     34.9200     -0.3100
+   1484.3000   1472.0600     34.9200     -0.3100
+   1484.4000   1472.0600     34.9200     -0.3100
+   1484.5000   1472.0600     34.9200     -0.3100
+   1484.6000   1472.0600     34.9200     -0.3100
+   1484.8000   1472.0600     34.9200     -0.3100
+   1484.9000   1472.0700     34.9200     -0.3100
+   1485.0000   1472.0700     34.9200     -0.3100
+   1485.1000   1472.0700     34.9200     -0.3100
+   1485.3000   1472.0700     34.9200     -0.3100
+   1485.4000   1472.0700     34.9200     -0.3100
+   1485.5000   1472.0800     34.9200     -0.3100
+   1485.7000   1472.0800     34.9200     -0.3100
+   1485.8000   1472.0800     34.9200     -0.3100
+   1485.9000   1472.0800     34.9200     -0.3100
+   1486.0000   1472.0800     34.9200     -0.3100
+   1486.2000   1472.0900     34.9200     -0.3100
+   1486.3000   1472.0900     34.9200     -0.3100
+   1486.4000   1472.0900     34.9200     -0.3100
+   1486.5000   1472.0900     34.9200     -0.3100
+   1486.7000   1472.0900     34.9200     -0.3100
+   1486.8000   1472.1000     34.9200     -0.3100
+   1486.9000   1472.1000     34.9200     -0.3100
+   1487.0000   1472.1000     34.9200     -0.3100
+   1487.2000   1472.1000     34.9200     -0.3100
+   1487.3000   1472.1000     34.9200     -0.3100
+   1487.4000   1472.1100     34.9200     -0.3100
+   1487.5000   1472.1100     34.9200     -0.3100
+   1487.7000   1472.0600     34.9200     -0.3200
+   1487.8000   1472.1200     34.9300     -0.3100
+   1487.9000   1472.1200     34.9300     -0.3100
+   1488.1000   1472.0700     34.9200     -0.3200
+   1488.2000   1472.1300     34.9300     -0.3100
+   1488.3000   1472.0800     34.9300     -0.3200
+   1488.4000   1472.1300     34.9300     -0.3100
+   1488.6000   1472.1300     34.9300     -0.3100
+   1488.7000   1472.1300     34.9200     -0.3100
+   1488.8000   1472.1300     34.9200     -0.3100
+   1488.9000   1472.0800     34.9200     -0.3200
+   1489.1000   1472.1400     34.9300     -0.3100
+   1489.2000   1472.1400     34.9300     -0.3100
+   1489.3000   1472.0900     34.9200     -0.3200
+   1489.4000   1472.1500     34.9200     -0.3100
+   1489.6000   1472.1000     34.9200     -0.3200
+   1489.7000   1472.1500     34.9200     -0.3100
+   1489.8000   1472.1500     34.9200     -0.3100
+   1489.9000   1472.1000     34.9200     -0.3200
+   1490.1000   1472.1600     34.9200     -0.3100
+   1490.2000   1472.1100     34.9200     -0.3200
+   1490.3000   1472.1100     34.9200     -0.3200
+   1490.5000   1472.1200     34.9300     -0.3200
+   1490.6000   1472.1200     34.9300     -0.3200
+   1490.7000   1472.1800     34.9300     -0.3100
+   1490.8000   1472.1200     34.9200     -0.3200
+   1491.0000   1472.1700     34.9200     -0.3100
+   1491.1000   1472.1700     34.9200     -0.3100
+   1491.2000   1472.1200     34.9200     -0.3200
+   1491.3000   1472.1300     34.9200     -0.3200
+   1491.5000   1472.1400     34.9300     -0.3200
+   1491.6000   1472.1900     34.9300     -0.3100
+   1491.7000   1472.1300     34.9200     -0.3200
+   1491.8000   1472.1400     34.9200     -0.3200
+   1492.0000   1472.1500     34.9300     -0.3200
+   1492.1000   1472.1500     34.9300     -0.3200
+   1492.2000   1472.2000     34.9300     -0.3100
+   1492.3000   1472.1900     34.9200     -0.3100
+   1492.5000   1472.1400     34.9200     -0.3200
+   1492.6000   1472.2000     34.9200     -0.3100
+   1492.7000   1472.1500     34.9200     -0.3200
+   1492.9000   1472.2000     34.9200     -0.3100
+   1493.0000   1472.2000     34.9200     -0.3100
+   1493.1000   1472.1500     34.9200     -0.3200
+   1493.2000   1472.2100     34.9200     -0.3100
+   1493.4000   1472.1600     34.9200     -0.3200
+   1493.5000   1472.2100     34.9200     -0.3100
+   1493.6000   1472.2100     34.9200     -0.3100
+   1493.7000   1472.1600     34.9200     -0.3200
+   1493.9000   1472.2200     34.9200     -0.3100
+   1494.0000   1472.1700     34.9200     -0.3200
+   1494.1000   1472.2200     34.9200     -0.3100
+   1494.2000   1472.1700     34.9200     -0.3200
+   1494.4000   1472.1800     34.9200     -0.3200
+   1494.5000   1472.1900     34.9300     -0.3200
+   1494.6000   1472.1900     34.9300     -0.3200
+   1494.7000   1472.1900     34.9300     -0.3200
+   1494.9000   1472.1900     34.9300     -0.3200
+   1495.0000   1472.1900     34.9300     -0.3200
+   1495.1000   1472.2500     34.9300     -0.3100
+   1495.3000   1472.1900     34.9200     -0.3200
+   1495.4000   1472.1900     34.9200     -0.3200
+   1495.5000   1472.2000     34.9300     -0.3200
+   1495.6000   1472.2000     34.9300     -0.3200
+   1495.8000   1472.2100     34.9300     -0.3200
+   1495.9000   1472.2100     34.9300     -0.3200
+   1496.0000   1472.2100     34.9300     -0.3200
+   1496.1000   1472.2100     34.9300     -0.3200
+   1496.3000   1472.2100     34.9300     -0.3200
+   1496.4000   1472.2200     34.9300     -0.3200
+   1496.5000   1472.2200     34.9300     -0.3200
+   1496.6000   1472.2200     34.9300     -0.3200
+   1496.8000   1472.2200     34.9300     -0.3200
+   1496.9000   1472.2200     34.9300     -0.3200
+   1497.0000   1472.2300     34.9300     -0.3200
+   1497.1000   1472.2300     34.9300     -0.3200
+   1497.3000   1472.2300     34.9300     -0.3200
+   1497.4000   1472.2300     34.9300     -0.3200
+   1497.5000   1472.2300     34.9300     -0.3200
+   1497.7000   1472.2900     34.9300     -0.3100
+   1497.8000   1472.2300     34.9200     -0.3200
+   1497.9000   1472.2300     34.9200     -0.3200
+   1498.0000   1472.2400     34.9300     -0.3200
+   1498.2000   1472.2400     34.9300     -0.3200
+   1498.3000   1472.2500     34.9300     -0.3200
+   1498.4000   1472.2500     34.9300     -0.3200
+   1498.5000   1472.2500     34.9300     -0.3200
+   1498.7000   1472.2500     34.9300     -0.3200
+   1498.8000   1472.2600     34.9300     -0.3200
+   1498.9000   1472.2600     34.9300     -0.3200
+   1499.0000   1472.2600     34.9300     -0.3200
+   1499.2000   1472.2600     34.9300     -0.3200
+   1499.3000   1472.2600     34.9300     -0.3200
+   1499.4000   1472.2700     34.9300     -0.3200
+   1499.5000   1472.3200     34.9300     -0.3100
+   1499.7000   1472.2600     34.9200     -0.3200
+   1499.8000   1472.2600     34.9200     -0.3200
+   1499.9000   1472.2700     34.9300     -0.3200
+   1500.1000   1472.2800     34.9300     -0.3200
+   1500.2000   1472.2800     34.9200     -0.3200
+   1500.3000   1472.2800     34.9200     -0.3200
+   1500.4000   1472.2800     34.9200     -0.3200
+   1500.6000   1472.2800     34.9200     -0.3200
+   1500.7000   1472.2900     34.9200     -0.3200
+   1500.8000   1472.2900     34.9200     -0.3200
+   1500.9000   1472.2900     34.9200     -0.3200
+   1501.1000   1472.2900     34.9200     -0.3200
+   1501.2000   1472.2900     34.9200     -0.3200
+   1501.3000   1472.3000     34.9200     -0.3200
+   1501.4000   1472.3000     34.9200     -0.3200
+   1501.6000   1472.3000     34.9200     -0.3200
+   1501.7000   1472.3000     34.9200     -0.3200
+   1501.8000   1472.3000     34.9200     -0.3200
+   1501.9000   1472.3100     34.9200     -0.3200
+   1502.1000   1472.3100     34.9200     -0.3200
+   1502.2000   1472.3100     34.9200     -0.3200
+   1502.3000   1472.3100     34.9200     -0.3200
+   1502.5000   1472.3600     34.9200     -0.3100
+   1502.6000   1472.3100     34.9200     -0.3200
+   1502.7000   1472.3600     34.9200     -0.3100
+   1502.8000   1472.3100     34.9200     -0.3200
+   1503.0000   1472.3100     34.9200     -0.3200
+   1503.1000   1472.4000     34.9400     -0.3100
+   1503.2000   1472.3200     34.9200     -0.3200
+   1503.3000   1472.3200     34.9200     -0.3200
+   1503.5000   1472.3300     34.9200     -0.3200
+   1503.6000   1472.3600     34.9400     -0.3200
+   1503.7000   1472.3300     34.9200     -0.3200
+   1503.8000   1472.3400     34.9200     -0.3200
+   1504.0000   1472.3900     34.9200     -0.3100
+   1504.1000   1472.3300     34.9200     -0.3200
+   1504.2000   1472.4100     34.9400     -0.3100
+   1504.3000   1472.3600     34.9400     -0.3200
+   1504.5000   1472.3400     34.9200     -0.3200
+   1504.6000   1472.3500     34.9200     -0.3200
+   1504.7000   1472.3500     34.9200     -0.3200
+   1504.9000   1472.3500     34.9200     -0.3200
+   1505.0000   1472.3500     34.9200     -0.3200
+   1505.1000   1472.3600     34.9200     -0.3200
+   1505.2000   1472.4100     34.9200     -0.3100
+   1505.4000   1472.3500     34.9200     -0.3200
+   1505.5000   1472.3800     34.9400     -0.3200
+   1505.6000   1472.3600     34.9200     -0.3200
+   1505.7000   1472.3700     34.9200     -0.3200
+   1505.9000   1472.3700     34.9200     -0.3200
+   1506.0000   1472.3700     34.9200     -0.3200
+   1506.1000   1472.3700     34.9200     -0.3200
+   1506.2000   1472.3700     34.9200     -0.3200
+   1506.4000   1472.3800     34.9200     -0.3200
+   1506.5000   1472.4300     34.9200     -0.3100
+   1506.6000   1472.3700     34.9200     -0.3200
+   1506.7000   1472.4000     34.9400     -0.3200
+   1506.9000   1472.3800     34.9200     -0.3200
+   1507.0000   1472.4100     34.9400     -0.3200
+   1507.1000   1472.3900     34.9200     -0.3200
+   1507.2000   1472.3900     34.9200     -0.3200
+   1507.4000   1472.3900     34.9200     -0.3200
+   1507.5000   1472.3900     34.9200     -0.3200
+   1507.6000   1472.4000     34.9200     -0.3200
+   1507.8000   1472.4500     34.9200     -0.3100
+   1507.9000   1472.3900     34.9100     -0.3200
+   1508.0000   1472.4700     34.9300     -0.3100
+   1508.1000   1472.4000     34.9100     -0.3200
+   1508.3000   1472.4200     34.9300     -0.3200
+   1508.4000   1472.4100     34.9200     -0.3200
+   1508.5000   1472.4100     34.9200     -0.3200
+   1508.6000   1472.4400     34.9400     -0.3200
+   1508.8000   1472.4400     34.9400     -0.3200
+   1508.9000   1472.4200     34.9200     -0.3200
+   1509.0000   1472.4500     34.9400     -0.3200
+   1509.1000   1472.4200     34.9200     -0.3200
+   1509.3000   1472.4500     34.9400     -0.3200
+   1509.4000   1472.4500     34.9400     -0.3200
+   1509.5000   1472.4300     34.9200     -0.3200
+   1509.6000   1472.4300     34.9200     -0.3200
+   1509.8000   1472.4300     34.9200     -0.3200
+   1509.9000   1472.4600     34.9400     -0.3200
+   1510.0000   1472.4600     34.9400     -0.3200
+   1510.2000   1472.4600     34.9400     -0.3200
+   1510.3000   1472.4900     34.9200     -0.3100
+   1510.4000   1472.4300     34.9100     -0.3200
+   1510.5000   1472.4600     34.9300     -0.3200
+   1510.7000   1472.4400     34.9200     -0.3200
+   1510.8000   1472.4700     34.9400     -0.3200
+   1510.9000   1472.4500     34.9200     -0.3200
+   1511.0000   1472.4500     34.9200     -0.3200
+   1511.2000   1472.4800     34.9400     -0.3200
+   1511.3000   1472.4800     34.9400     -0.3200
+   1511.4000   1472.4800     34.9400     -0.3200
+   1511.5000   1472.4900     34.9400     -0.3200
+   1511.7000   1472.4600     34.9200     -0.3200
+   1511.8000   1472.4900     34.9400     -0.3200
+   1511.9000   1472.4900     34.9400     -0.3200
+   1512.0000   1472.4700     34.9200     -0.3200
+   1512.2000   1472.4700     34.9200     -0.3200
+   1512.3000   1472.4700     34.9200     -0.3200
+   1512.4000   1472.5000     34.9400     -0.3200
+   1512.5000   1472.5000     34.9400     -0.3200
+   1512.7000   1472.4800     34.9200     -0.3200
+   1512.8000   1472.5100     34.9400     -0.3200
+   1512.9000   1472.4800     34.9200     -0.3200
+   1513.1000   1472.4800     34.9200     -0.3200
+   1513.2000   1472.5100     34.9400     -0.3200
+   1513.3000   1472.4900     34.9200     -0.3200
+   1513.4000   1472.4900     34.9200     -0.3200
+   1513.6000   1472.4900     34.9200     -0.3200
+   1513.7000   1472.5200     34.9400     -0.3200
+   1513.8000   1472.4900     34.9200     -0.3200
+   1513.9000   1472.5200     34.9400     -0.3200
+   1514.1000   1472.5000     34.9200     -0.3200
+   1514.2000   1472.5000     34.9200     -0.3200
+   1514.3000   1472.5300     34.9400     -0.3200
+   1514.4000   1472.5000     34.9200     -0.3200
+   1514.6000   1472.5300     34.9400     -0.3200
+   1514.7000   1472.5100     34.9200     -0.3200
+   1514.8000   1472.5400     34.9400     -0.3200
+   1514.9000   1472.5400     34.9400     -0.3200
+   1515.1000   1472.5400     34.9400     -0.3200
+   1515.2000   1472.5400     34.9400     -0.3200
+   1515.3000   1472.5200     34.9200     -0.3200
+   1515.5000   1472.5200     34.9200     -0.3200
+   1515.6000   1472.5500     34.9400     -0.3200
+   1515.7000   1472.5500     34.9400     -0.3200
+   1515.8000   1472.5300     34.9200     -0.3200
+   1516.0000   1472.5300     34.9200     -0.3200
+   1516.1000   1472.5300     34.9200     -0.3200
+   1516.2000   1472.5600     34.9400     -0.3200
+   1516.3000   1472.5600     34.9400     -0.3200
+   1516.5000   1472.5400     34.9200     -0.3200
+   1516.6000   1472.5700     34.9400     -0.3200
+   1516.7000   1472.5400     34.9200     -0.3200
+   1516.8000   1472.5400     34.9200     -0.3200
+   1517.0000   1472.5700     34.9400     -0.3200
+   1517.1000   1472.5700     34.9400     -0.3200
+   1517.2000   1472.5500     34.9200     -0.3200
+   1517.3000   1472.5500     34.9200     -0.3200
+   1517.5000   1472.5800     34.9400     -0.3200
+   1517.6000   1472.5800     34.9300     -0.3200
+   1517.7000   1472.5800     34.9300     -0.3200
+   1517.8000   1472.5900     34.9300     -0.3200
+   1518.0000   1472.5600     34.9200     -0.3200
+   1518.1000   1472.5900     34.9300     -0.3200
+   1518.2000   1472.5900     34.9300     -0.3200
+   1518.4000   1472.5900     34.9300     -0.3200
+   1518.5000   1472.6000     34.9300     -0.3200
+   1518.6000   1472.6000     34.9300     -0.3200
+   1518.7000   1472.6000     34.9300     -0.3200
+   1518.9000   1472.6000     34.9300     -0.3200
+   1519.0000   1472.6000     34.9300     -0.3200
+   1519.1000   1472.5800     34.9100     -0.3200
+   1519.2000   1472.5800     34.9100     -0.3200
+   1519.4000   1472.6100     34.9300     -0.3200
+   1519.5000   1472.6100     34.9300     -0.3200
+   1519.6000   1472.6100     34.9300     -0.3200
+   1519.7000   1472.5900     34.9100     -0.3200
+   1519.9000   1472.6200     34.9300     -0.3200
+   1520.0000   1472.6200     34.9300     -0.3200
+   1520.1000   1472.6200     34.9300     -0.3200
+   1520.2000   1472.6200     34.9300     -0.3200
+   1520.4000   1472.6000     34.9100     -0.3200
+   1520.5000   1472.6000     34.9100     -0.3200
+   1520.6000   1472.6300     34.9300     -0.3200
+   1520.7000   1472.6300     34.9300     -0.3200
+   1520.9000   1472.6300     34.9300     -0.3200
+   1521.0000   1472.6100     34.9100     -0.3200
+   1521.1000   1472.6100     34.9100     -0.3200
+   1521.3000   1472.6400     34.9300     -0.3200
+   1521.4000   1472.6200     34.9100     -0.3200
+   1521.5000   1472.6400     34.9300     -0.3200
+   1521.6000   1472.6200     34.9100     -0.3200
+   1521.8000   1472.6200     34.9100     -0.3200
+   1521.9000   1472.6500     34.9300     -0.3200
+   1522.0000   1472.6500     34.9300     -0.3200
+   1522.1000   1472.6500     34.9300     -0.3200
+   1522.3000   1472.6600     34.9300     -0.3200
+   1522.4000   1472.6600     34.9300     -0.3200
+   1522.5000   1472.6600     34.9300     -0.3200
+   1522.6000   1472.6600     34.9300     -0.3200
+   1522.8000   1472.6600     34.9300     -0.3200
+   1522.9000   1472.6400     34.9100     -0.3200
+   1523.0000   1472.6400     34.9100     -0.3200
+   1523.1000   1472.6700     34.9300     -0.3200
+   1523.3000   1472.6700     34.9300     -0.3200
+   1523.4000   1472.6500     34.9100     -0.3200
+   1523.5000   1472.6800     34.9300     -0.3200
+   1523.6000   1472.6500     34.9100     -0.3200
+   1523.8000   1472.6800     34.9300     -0.3200
+   1523.9000   1472.6800     34.9300     -0.3200
+   1524.0000   1472.6800     34.9300     -0.3200
+   1524.2000   1472.6600     34.9100     -0.3200
+   1524.3000   1472.6600     34.9100     -0.3200
+   1524.4000   1472.6900     34.9300     -0.3200
+   1524.5000   1472.6900     34.9300     -0.3200
+   1524.7000   1472.6900     34.9300     -0.3200
+   1524.8000   1472.6700     34.9100     -0.3200
+   1524.9000   1472.6700     34.9100     -0.3200
+   1525.0000   1472.7000     34.9300     -0.3200
+   1525.2000   1472.6800     34.9100     -0.3200
+   1525.3000   1472.7100     34.9300     -0.3200
+   1525.4000   1472.6800     34.9100     -0.3200
+   1525.5000   1472.6800     34.9100     -0.3200
+   1525.7000   1472.6800     34.9100     -0.3200
+   1525.8000   1472.7100     34.9300     -0.3200
+   1525.9000   1472.7200     34.9300     -0.3200
+   1526.0000   1472.6900     34.9100     -0.3200
+   1526.2000   1472.6900     34.9100     -0.3200
+   1526.3000   1472.7200     34.9300     -0.3200
+   1526.4000   1472.7200     34.9300     -0.3200
+   1526.5000   1472.7000     34.9100     -0.3200
+   1526.7000   1472.7000     34.9100     -0.3200
+   1526.8000   1472.7300     34.9300     -0.3200
+   1526.9000   1472.7300     34.9300     -0.3200
+   1527.1000   1472.7300     34.9300     -0.3200
+   1527.2000   1472.7400     34.9300     -0.3200
+   1527.3000   1472.7100     34.9100     -0.3200
+   1527.4000   1472.7100     34.9100     -0.3200
+   1527.6000   1472.7400     34.9300     -0.3200
+   1527.7000   1472.7400     34.9300     -0.3200
+   1527.8000   1472.7500     34.9300     -0.3200
+   1527.9000   1472.7200     34.9100     -0.3200
+   1528.1000   1472.7200     34.9100     -0.3200
+   1528.2000   1472.7500     34.9300     -0.3200
+   1528.3000   1472.7500     34.9300     -0.3200
+   1528.4000   1472.7600     34.9300     -0.3200
+   1528.6000   1472.7300     34.9100     -0.3200
+   1528.7000   1472.7300     34.9100     -0.3200
+   1528.8000   1472.7600     34.9300     -0.3200
+   1528.9000   1472.7600     34.9300     -0.3200
+   1529.1000   1472.7200     34.9300     -0.3300
+   1529.2000   1472.7500     34.9100     -0.3200
+   1529.3000   1472.7800     34.9300     -0.3200
+   1529.4000   1472.7700     34.9300     -0.3200
+   1529.6000   1472.7700     34.9300     -0.3200
+   1529.7000   1472.7800     34.9300     -0.3200
+   1529.8000   1472.7500     34.9100     -0.3200
+   1530.0000   1472.7500     34.9100     -0.3200
+   1530.1000   1472.7800     34.9300     -0.3200
+   1530.2000   1472.7800     34.9300     -0.3200
+   1530.3000   1472.7400     34.9300     -0.3300
+   1530.5000   1472.8000     34.9300     -0.3200
+   1530.6000   1472.8000     34.9300     -0.3200
+   1530.7000   1472.7900     34.9300     -0.3200
+   1530.8000   1472.7900     34.9300     -0.3200
+   1531.0000   1472.7500     34.9300     -0.3300
+   1531.1000   1472.7800     34.9100     -0.3200
+   1531.2000   1472.7600     34.9300     -0.3300
+   1531.3000   1472.8100     34.9300     -0.3200
+   1531.5000   1472.8100     34.9300     -0.3200
+   1531.6000   1472.7300     34.9100     -0.3300
+   1531.7000   1472.8200     34.9300     -0.3200
+   1531.8000   1472.7700     34.9300     -0.3300
+   1532.0000   1472.8200     34.9300     -0.3200
+   1532.1000   1472.8200     34.9300     -0.3200
+   1532.2000   1472.7700     34.9300     -0.3300
+   1532.3000   1472.8000     34.9100     -0.3200
+   1532.5000   1472.7800     34.9300     -0.3300
+   1532.6000   1472.8300     34.9300     -0.3200
+   1532.7000   1472.8300     34.9300     -0.3200
+   1532.9000   1472.7800     34.9300     -0.3300
+   1533.0000   1472.8100     34.9100     -0.3200
+   1533.1000   1472.7600     34.9100     -0.3300
+   1533.2000   1472.8400     34.9300     -0.3200
+   1533.4000   1472.8400     34.9300     -0.3200
+   1533.5000   1472.7900     34.9300     -0.3300
+   1533.6000   1472.8200     34.9100     -0.3200
+   1533.7000   1472.8000     34.9300     -0.3300
+   1533.9000   1472.8000     34.9300     -0.3300
+   1534.0000   1472.8600     34.9400     -0.3200
+   1534.1000   1472.8000     34.9300     -0.3300
+   1534.2000   1472.7800     34.9100     -0.3300
+   1534.4000   1472.8200     34.9400     -0.3300
+   1534.5000   1472.8200     34.9400     -0.3300
+   1534.6000   1472.8200     34.9400     -0.3300
+   1534.7000   1472.8200     34.9400     -0.3300
+   1534.9000   1472.8500     34.9200     -0.3200
+   1535.0000   1472.8200     34.9300     -0.3300
+   1535.1000   1472.8200     34.9300     -0.3300
+   1535.2000   1472.8800     34.9400     -0.3200
+   1535.4000   1472.8300     34.9300     -0.3300
+   1535.5000   1472.8500     34.9100     -0.3200
+   1535.6000   1472.8300     34.9300     -0.3300
+   1535.8000   1472.8800     34.9300     -0.3200
+   1535.9000   1472.8300     34.9300     -0.3300
+   1536.0000   1472.8400     34.9300     -0.3300
+   1536.1000   1472.8900     34.9400     -0.3200
+   1536.3000   1472.8400     34.9300     -0.3300
+   1536.4000   1472.8900     34.9300     -0.3200
+   1536.5000   1472.8400     34.9300     -0.3300
+   1536.6000   1472.8500     34.9300     -0.3300
+   1536.8000   1472.8300     34.9200     -0.3300
+   1536.9000   1472.8300     34.9200     -0.3300
+   1537.0000   1472.8600     34.9400     -0.3300
+   1537.1000   1472.8600     34.9400     -0.3300
+   1537.3000   1472.8600     34.9400     -0.3300
+   1537.4000   1472.8700     34.9400     -0.3300
+   1537.5000   1472.8700     34.9400     -0.3300
+   1537.6000   1472.8700     34.9400     -0.3300
+   1537.8000   1472.9200     34.9400     -0.3200
+   1537.9000   1472.8700     34.9300     -0.3300
+   1538.0000   1472.8400     34.9100     -0.3300
+   1538.1000   1472.8800     34.9400     -0.3300
+   1538.3000   1472.8800     34.9400     -0.3300
+   1538.4000   1472.8800     34.9400     -0.3300
+   1538.5000   1472.8800     34.9400     -0.3300
+   1538.6000   1472.8900     34.9400     -0.3300
+   1538.8000   1472.8900     34.9400     -0.3300
+   1538.9000   1472.8900     34.9400     -0.3300
+   1539.0000   1472.8900     34.9400     -0.3300
+   1539.2000   1472.8900     34.9400     -0.3300
+   1539.3000   1472.9000     34.9300     -0.3300
+   1539.4000   1472.9000     34.9300     -0.3300
+   1539.5000   1472.9000     34.9300     -0.3300
+   1539.7000   1472.9000     34.9300     -0.3300
+   1539.8000   1472.9000     34.9300     -0.3300
+   1539.9000   1472.8800     34.9100     -0.3300
+   1540.0000   1472.9100     34.9300     -0.3300
+   1540.2000   1472.8800     34.9100     -0.3300
+   1540.3000   1472.9100     34.9300     -0.3300
+   1540.4000   1472.9100     34.9300     -0.3300
+   1540.5000   1472.8900     34.9100     -0.3300
+   1540.7000   1472.8900     34.9100     -0.3300
+   1540.8000   1472.9200     34.9300     -0.3300
+   1540.9000   1472.9200     34.9300     -0.3300
+   1541.0000   1472.9200     34.9300     -0.3300
+   1541.2000   1472.9300     34.9300     -0.3300
+   1541.3000   1472.9300     34.9300     -0.3300
+   1541.4000   1472.9300     34.9300     -0.3300
+   1541.5000   1472.9300     34.9300     -0.3300
+   1541.7000   1472.9300     34.9300     -0.3300
+   1541.8000   1472.9400     34.9300     -0.3300
+   1541.9000   1472.9400     34.9300     -0.3300
+   1542.0000   1472.9400     34.9300     -0.3300
+   1542.2000   1472.9400     34.9300     -0.3300
+   1542.3000   1472.9400     34.9300     -0.3300
+   1542.4000   1472.9500     34.9300     -0.3300
+   1542.6000   1472.9500     34.9300     -0.3300
+   1542.7000   1472.9500     34.9300     -0.3300
+   1542.8000   1472.9500     34.9300     -0.3300
+   1542.9000   1472.9500     34.9300     -0.3300
+   1543.1000   1472.9300     34.9100     -0.3300
+   1543.2000   1472.9600     34.9300     -0.3300
+   1543.3000   1472.9600     34.9300     -0.3300
+   1543.4000   1472.9600     34.9300     -0.3300
+   1543.6000   1472.9600     34.9300     -0.3300
+   1543.7000   1472.9400     34.9100     -0.3300
+   1543.8000   1472.9700     34.9300     -0.3300
+   1543.9000   1472.9700     34.9300     -0.3300
+   1544.1000   1472.9700     34.9300     -0.3300
+   1544.2000   1472.9700     34.9300     -0.3300
+   1544.3000   1472.9800     34.9300     -0.3300
+   1544.4000   1472.9800     34.9300     -0.3300
+   1544.6000   1472.9800     34.9300     -0.3300
+   1544.7000   1472.9800     34.9300     -0.3300
+   1544.8000   1472.9800     34.9300     -0.3300
+   1544.9000   1472.9900     34.9300     -0.3300
+   1545.1000   1472.9900     34.9300     -0.3300
+   1545.2000   1472.9900     34.9300     -0.3300
+   1545.3000   1472.9900     34.9300     -0.3300
+   1545.4000   1472.9900     34.9300     -0.3300
+   1545.6000   1473.0000     34.9300     -0.3300
+   1545.7000   1473.0000     34.9300     -0.3300
+   1545.8000   1473.0000     34.9300     -0.3300
+   1546.0000   1473.0000     34.9300     -0.3300
+   1546.1000   1473.0000     34.9300     -0.3300
+   1546.2000   1473.0100     34.9300     -0.3300
+   1546.3000   1473.0100     34.9300     -0.3300
+   1546.5000   1473.0100     34.9300     -0.3300
+   1546.6000   1473.0100     34.9300     -0.3300
+   1546.7000   1473.0100     34.9300     -0.3300
+   1546.8000   1473.0200     34.9300     -0.3300
+   1547.0000   1473.0200     34.9300     -0.3300
+   1547.1000   1473.0200     34.9300     -0.3300
+   1547.2000   1473.0200     34.9300     -0.3300
+   1547.3000   1473.0200     34.9300     -0.3300
+   1547.5000   1473.0300     34.9300     -0.3300
+   1547.6000   1473.0300     34.9300     -0.3300
+   1547.7000   1473.0300     34.9300     -0.3300
+   1547.8000   1473.0300     34.9300     -0.3300
+   1548.0000   1473.0300     34.9300     -0.3300
+   1548.1000   1473.0400     34.9300     -0.3300
+   1548.2000   1473.0400     34.9300     -0.3300
+   1548.3000   1473.0400     34.9300     -0.3300
+   1548.5000   1473.0400     34.9300     -0.3300
+   1548.6000   1473.0400     34.9300     -0.3300
+   1548.7000   1473.0500     34.9300     -0.3300
+   1548.8000   1473.0500     34.9300     -0.3300
+   1549.0000   1473.0500     34.9300     -0.3300
+   1549.1000   1473.0500     34.9300     -0.3300
+   1549.2000   1473.0500     34.9300     -0.3300
+   1549.4000   1473.0600     34.9300     -0.3300
+   1549.5000   1473.0600     34.9300     -0.3300
+   1549.6000   1473.0600     34.9300     -0.3300
+   1549.7000   1473.0600     34.9300     -0.3300
+   1549.9000   1473.0600     34.9300     -0.3300
+   1550.0000   1473.0700     34.9300     -0.3300
+   1550.1000   1473.0700     34.9300     -0.3300
+   1550.2000   1473.0700     34.9300     -0.3300
+   1550.4000   1473.0700     34.9300     -0.3300
+   1550.5000   1473.0700     34.9300     -0.3300
+   1550.6000   1473.0800     34.9300     -0.3300
+   1550.7000   1473.0800     34.9300     -0.3300
+   1550.9000   1473.0800     34.9300     -0.3300
+   1551.0000   1473.0800     34.9300     -0.3300
+   1551.1000   1473.0800     34.9300     -0.3300
+   1551.2000   1473.0900     34.9300     -0.3300
+   1551.4000   1473.0900     34.9300     -0.3300
+   1551.5000   1473.0900     34.9300     -0.3300
+   1551.6000   1473.0900     34.9300     -0.3300
+   1551.7000   1473.0900     34.9300     -0.3300
+   1551.9000   1473.1000     34.9300     -0.3300
+   1552.0000   1473.1000     34.9300     -0.3300
+   1552.1000   1473.1000     34.9300     -0.3300
+   1552.2000   1473.1000     34.9300     -0.3300
+   1552.4000   1473.1000     34.9300     -0.3300
+   1552.5000   1473.1100     34.9300     -0.3300
+   1552.6000   1473.1100     34.9300     -0.3300
+   1552.8000   1473.1100     34.9300     -0.3300
+   1552.9000   1473.1100     34.9300     -0.3300
+   1553.0000   1473.1100     34.9300     -0.3300
+   1553.1000   1473.1200     34.9300     -0.3300
+   1553.3000   1473.1200     34.9300     -0.3300
+   1553.4000   1473.1200     34.9300     -0.3300
+   1553.5000   1473.1200     34.9300     -0.3300
+   1553.6000   1473.1300     34.9300     -0.3300
+   1553.8000   1473.1300     34.9300     -0.3300
+   1553.9000   1473.1300     34.9300     -0.3300
+   1554.0000   1473.1300     34.9300     -0.3300
+   1554.1000   1473.1300     34.9300     -0.3300
+   1554.3000   1473.1400     34.9300     -0.3300
+   1554.4000   1473.1400     34.9300     -0.3300
+   1554.5000   1473.1400     34.9300     -0.3300
+   1554.6000   1473.1400     34.9300     -0.3300
+   1554.8000   1473.1400     34.9300     -0.3300
+   1554.9000   1473.1500     34.9300     -0.3300
+   1555.0000   1473.1500     34.9300     -0.3300
+   1555.1000   1473.1500     34.9300     -0.3300
+   1555.3000   1473.1500     34.9300     -0.3300
+   1555.4000   1473.1500     34.9300     -0.3300
+   1555.5000   1473.1600     34.9300     -0.3300
+   1555.6000   1473.1600     34.9300     -0.3300
+   1555.8000   1473.1600     34.9300     -0.3300
+   1555.9000   1473.1600     34.9300     -0.3300
+   1556.0000   1473.1600     34.9300     -0.3300
+   1556.1000   1473.1700     34.9300     -0.3300
+   1556.3000   1473.1700     34.9300     -0.3300
+   1556.4000   1473.1700     34.9300     -0.3300
+   1556.5000   1473.1700     34.9300     -0.3300
+   1556.7000   1473.1700     34.9300     -0.3300
+   1556.8000   1473.1800     34.9300     -0.3300
+   1556.9000   1473.1800     34.9300     -0.3300
+   1557.0000   1473.1800     34.9300     -0.3300
+   1557.2000   1473.1800     34.9300     -0.3300
+   1557.3000   1473.1800     34.9300     -0.3300
+   1557.4000   1473.1900     34.9200     -0.3300
+   1557.5000   1473.1900     34.9200     -0.3300
+   1557.7000   1473.1900     34.9200     -0.3300
+   1557.8000   1473.1900     34.9200     -0.3300
+   1557.9000   1473.1900     34.9200     -0.3300
+   1558.0000   1473.2000     34.9200     -0.3300
+   1558.2000   1473.2000     34.9200     -0.3300
+   1558.3000   1473.2000     34.9200     -0.3300
+   1558.4000   1473.2000     34.9200     -0.3300
+   1558.5000   1473.2000     34.9200     -0.3300
+   1558.7000   1473.2100     34.9200     -0.3300
+   1558.8000   1473.2100     34.9200     -0.3300
+   1558.9000   1473.2100     34.9200     -0.3300
+   1559.0000   1473.2100     34.9200     -0.3300
+   1559.2000   1473.2100     34.9200     -0.3300
+   1559.3000   1473.2200     34.9200     -0.3300
+   1559.4000   1473.2200     34.9200     -0.3300
+   1559.5000   1473.2200     34.9200     -0.3300
+   1559.7000   1473.2200     34.9200     -0.3300
+   1559.8000   1473.2200     34.9200     -0.3300
+   1559.9000   1473.2300     34.9200     -0.3300
+   1560.0000   1473.2300     34.9200     -0.3300
+   1560.2000   1473.2300     34.9200     -0.3300
+   1560.3000   1473.2300     34.9200     -0.3300
+   1560.4000   1473.2300     34.9200     -0.3300
+   1560.6000   1473.2400     34.9200     -0.3300
+   1560.7000   1473.2400     34.9200     -0.3300
+   1560.8000   1473.2400     34.9200     -0.3300
+   1560.9000   1473.2400     34.9200     -0.3300
+   1561.1000   1473.2400     34.9200     -0.3300
+   1561.2000   1473.2500     34.9200     -0.3300
+   1561.3000   1473.2500     34.9200     -0.3300
+   1561.4000   1473.2500     34.9200     -0.3300
+   1561.6000   1473.2500     34.9200     -0.3300
+   1561.7000   1473.2500     34.9200     -0.3300
+   1561.8000   1473.2600     34.9200     -0.3300
+   1561.9000   1473.2600     34.9200     -0.3300
+   1562.1000   1473.2100     34.9200     -0.3400
+   1562.2000   1473.2200     34.9300     -0.3400
+   1562.3000   1473.2300     34.9300     -0.3400
+   1562.4000   1473.2300     34.9300     -0.3400
+   1562.6000   1473.2300     34.9300     -0.3400
+   1562.7000   1473.2400     34.9300     -0.3400
+   1562.8000   1473.2400     34.9300     -0.3400
+   1562.9000   1473.2400     34.9300     -0.3400
+   1563.1000   1473.2400     34.9300     -0.3400
+   1563.2000   1473.2400     34.9300     -0.3400
+   1563.3000   1473.2500     34.9300     -0.3400
+   1563.4000   1473.2500     34.9300     -0.3400
+   1563.6000   1473.2500     34.9300     -0.3400
+   1563.7000   1473.2500     34.9300     -0.3400
+   1563.8000   1473.2600     34.9300     -0.3400
+   1563.9000   1473.2600     34.9300     -0.3400
+   1564.1000   1473.2600     34.9300     -0.3400
+   1564.2000   1473.2600     34.9300     -0.3400
+   1564.3000   1473.2600     34.9300     -0.3400
+   1564.5000   1473.2700     34.9300     -0.3400
+   1564.6000   1473.2700     34.9300     -0.3400
+   1564.7000   1473.2700     34.9300     -0.3400
+   1564.8000   1473.2700     34.9300     -0.3400
+   1565.0000   1473.2700     34.9300     -0.3400
+   1565.1000   1473.2800     34.9300     -0.3400
+   1565.2000   1473.2800     34.9300     -0.3400
+   1565.3000   1473.2800     34.9300     -0.3400
+   1565.5000   1473.2800     34.9300     -0.3400
+   1565.6000   1473.2800     34.9300     -0.3400
+   1565.7000   1473.3300     34.9300     -0.3300
+   1565.8000   1473.2800     34.9300     -0.3400
+   1566.0000   1473.2800     34.9300     -0.3400
+   1566.1000   1473.2900     34.9300     -0.3400
+   1566.2000   1473.2900     34.9300     -0.3400
+   1566.3000   1473.3000     34.9300     -0.3400
+   1566.5000   1473.3000     34.9300     -0.3400
+   1566.6000   1473.3000     34.9300     -0.3400
+   1566.7000   1473.3000     34.9300     -0.3400
+   1566.8000   1473.3000     34.9300     -0.3400
+   1567.0000   1473.3100     34.9300     -0.3400
+   1567.1000   1473.3100     34.9300     -0.3400
+   1567.2000   1473.3100     34.9300     -0.3400
+   1567.3000   1473.3100     34.9300     -0.3400
+   1567.5000   1473.3100     34.9300     -0.3400
+   1567.6000   1473.3200     34.9300     -0.3400
+   1567.7000   1473.3200     34.9300     -0.3400
+   1567.8000   1473.3500     34.9500     -0.3400
+   1568.0000   1473.3700     34.9300     -0.3300
+   1568.1000   1473.3200     34.9300     -0.3400
+   1568.2000   1473.3700     34.9200     -0.3300
+   1568.4000   1473.3200     34.9200     -0.3400
+   1568.5000   1473.3700     34.9200     -0.3300
+   1568.6000   1473.3700     34.9200     -0.3300
+   1568.7000   1473.3200     34.9200     -0.3400
+   1568.9000   1473.3800     34.9200     -0.3300
+   1569.0000   1473.3300     34.9200     -0.3400
+   1569.1000   1473.3800     34.9200     -0.3300
+   1569.2000   1473.3800     34.9200     -0.3300
+   1569.4000   1473.3800     34.9200     -0.3300
+   1569.5000   1473.3800     34.9200     -0.3300
+   1569.6000   1473.3300     34.9200     -0.3400
+   1569.7000   1473.3900     34.9200     -0.3300
+   1569.9000   1473.3900     34.9200     -0.3300
+   1570.0000   1473.3900     34.9200     -0.3300
+   1570.1000   1473.3900     34.9200     -0.3300
+   1570.2000   1473.3900     34.9200     -0.3300
+   1570.4000   1473.3900     34.9200     -0.3300
+   1570.5000   1473.3900     34.9200     -0.3300
+   1570.6000   1473.3500     34.9200     -0.3400
+   1570.7000   1473.4100     34.9200     -0.3300
+   1570.9000   1473.3600     34.9200     -0.3400
+   1571.0000   1473.4400     34.9400     -0.3300
+   1571.1000   1473.4100     34.9200     -0.3300
+   1571.2000   1473.4300     34.9400     -0.3300
+   1571.4000   1473.4100     34.9200     -0.3300
+   1571.5000   1473.4100     34.9200     -0.3300
+   1571.6000   1473.4100     34.9200     -0.3300
+   1571.7000   1473.3700     34.9200     -0.3400
+   1571.9000   1473.3800     34.9200     -0.3400
+   1572.0000   1473.4400     34.9300     -0.3300
+   1572.1000   1473.3800     34.9200     -0.3400
+   1572.2000   1473.4300     34.9200     -0.3300
+   1572.4000   1473.3800     34.9200     -0.3400
+   1572.5000   1473.3900     34.9200     -0.3400
+   1572.6000   1473.4000     34.9300     -0.3400
+   1572.8000   1473.4000     34.9300     -0.3400
+   1572.9000   1473.4000     34.9300     -0.3400
+   1573.0000   1473.4000     34.9300     -0.3400
+   1573.1000   1473.4000     34.9300     -0.3400
+   1573.3000   1473.4100     34.9300     -0.3400
+   1573.4000   1473.4100     34.9300     -0.3400
+   1573.5000   1473.4100     34.9300     -0.3400
+   1573.6000   1473.4100     34.9300     -0.3400
+   1573.8000   1473.4100     34.9300     -0.3400
+   1573.9000   1473.4200     34.9300     -0.3400
+   1574.0000   1473.4200     34.9300     -0.3400
+   1574.1000   1473.4200     34.9300     -0.3400
+   1574.3000   1473.4200     34.9300     -0.3400
+   1574.4000   1473.4200     34.9300     -0.3400
+   1574.5000   1473.4300     34.9300     -0.3400
+   1574.6000   1473.4300     34.9300     -0.3400
+   1574.8000   1473.4300     34.9300     -0.3400
+   1574.9000   1473.4300     34.9300     -0.3400
+   1575.0000   1473.4300     34.9300     -0.3400
+   1575.1000   1473.4400     34.9300     -0.3400
+   1575.3000   1473.4400     34.9300     -0.3400
+   1575.4000   1473.4400     34.9300     -0.3400
+   1575.5000   1473.4400     34.9300     -0.3400
+   1575.6000   1473.4400     34.9300     -0.3400
+   1575.8000   1473.4500     34.9300     -0.3400
+   1575.9000   1473.4500     34.9300     -0.3400
+   1576.0000   1473.4500     34.9300     -0.3400
+   1576.1000   1473.4500     34.9300     -0.3400
+   1576.3000   1473.4500     34.9300     -0.3400
+   1576.4000   1473.4600     34.9300     -0.3400
+   1576.5000   1473.4600     34.9300     -0.3400
+   1576.6000   1473.4900     34.9500     -0.3400
+   1576.8000   1473.4600     34.9300     -0.3400
+   1576.9000   1473.4600     34.9300     -0.3400
+   1577.0000   1473.4700     34.9300     -0.3400
+   1577.2000   1473.4700     34.9300     -0.3400
+   1577.3000   1473.4700     34.9300     -0.3400
+   1577.4000   1473.4700     34.9300     -0.3400
+   1577.5000   1473.4700     34.9300     -0.3400
+   1577.7000   1473.4800     34.9300     -0.3400
+   1577.8000   1473.4800     34.9300     -0.3400
+   1577.9000   1473.4800     34.9300     -0.3400
+   1578.0000   1473.4800     34.9300     -0.3400
+   1578.2000   1473.4800     34.9300     -0.3400
+   1578.3000   1473.4900     34.9300     -0.3400
+   1578.4000   1473.4900     34.9300     -0.3400
+   1578.5000   1473.4900     34.9300     -0.3400
+   1578.7000   1473.4900     34.9300     -0.3400
+   1578.8000   1473.4900     34.9300     -0.3400
+   1578.9000   1473.5000     34.9300     -0.3400
+   1579.0000   1473.5000     34.9200     -0.3400
+   1579.2000   1473.5000     34.9200     -0.3400
+   1579.3000   1473.5000     34.9200     -0.3400
+   1579.4000   1473.5000     34.9200     -0.3400
+   1579.5000   1473.5100     34.9200     -0.3400
+   1579.7000   1473.5100     34.9200     -0.3400
+   1579.8000   1473.5100     34.9200     -0.3400
+   1579.9000   1473.5100     34.9200     -0.3400
+   1580.0000   1473.5100     34.9200     -0.3400
+   1580.2000   1473.5200     34.9200     -0.3400
+   1580.3000   1473.5200     34.9200     -0.3400
+   1580.4000   1473.5200     34.9200     -0.3400
+   1580.5000   1473.5200     34.9200     -0.3400
+   1580.7000   1473.5200     34.9200     -0.3400
+   1580.8000   1473.5300     34.9200     -0.3400
+   1580.9000   1473.5300     34.9200     -0.3400
+   1581.0000   1473.5300     34.9200     -0.3400
+   1581.2000   1473.5300     34.9200     -0.3400
+   1581.3000   1473.5300     34.9200     -0.3400
+   1581.4000   1473.5400     34.9200     -0.3400
+   1581.5000   1473.5400     34.9200     -0.3400
+   1581.7000   1473.5400     34.9200     -0.3400
+   1581.8000   1473.5400     34.9200     -0.3400
+   1581.9000   1473.5400     34.9200     -0.3400
+   1582.1000   1473.5500     34.9200     -0.3400
+   1582.2000   1473.5500     34.9200     -0.3400
+   1582.3000   1473.5500     34.9200     -0.3400
+   1582.4000   1473.5500     34.9200     -0.3400
+   1582.6000   1473.5500     34.9200     -0.3400
+   1582.7000   1473.5600     34.9200     -0.3400
+   1582.8000   1473.5600     34.9200     -0.3400
+   1582.9000   1473.5600     34.9200     -0.3400
+   1583.1000   1473.5600     34.9200     -0.3400
+   1583.2000   1473.5600     34.9200     -0.3400
+   1583.3000   1473.5700     34.9200     -0.3400
+   1583.4000   1473.5700     34.9200     -0.3400
+   1583.6000   1473.5700     34.9200     -0.3400
+   1583.7000   1473.5700     34.9200     -0.3400
+   1583.8000   1473.5700     34.9200     -0.3400
+   1583.9000   1473.5800     34.9200     -0.3400
+   1584.1000   1473.5800     34.9200     -0.3400
+   1584.2000   1473.5800     34.9200     -0.3400
+   1584.3000   1473.5800     34.9200     -0.3400
+   1584.4000   1473.5800     34.9200     -0.3400
+   1584.6000   1473.5900     34.9200     -0.3400
+   1584.7000   1473.5900     34.9200     -0.3400
+   1584.8000   1473.5900     34.9200     -0.3400
+   1584.9000   1473.5900     34.9200     -0.3400
+   1585.1000   1473.5900     34.9200     -0.3400
+   1585.2000   1473.6000     34.9200     -0.3400
+   1585.3000   1473.6000     34.9200     -0.3400
+   1585.4000   1473.6000     34.9200     -0.3400
+   1585.6000   1473.6000     34.9200     -0.3400
+   1585.7000   1473.6000     34.9200     -0.3400
+   1585.8000   1473.6100     34.9200     -0.3400
+   1585.9000   1473.6100     34.9200     -0.3400
+   1586.1000   1473.6100     34.9200     -0.3400
+   1586.2000   1473.6100     34.9200     -0.3400
+   1586.3000   1473.6100     34.9200     -0.3400
+   1586.4000   1473.6200     34.9200     -0.3400
+   1586.6000   1473.6200     34.9200     -0.3400
+   1586.7000   1473.6200     34.9200     -0.3400
+   1586.8000   1473.6200     34.9200     -0.3400
+   1586.9000   1473.6200     34.9200     -0.3400
+   1587.1000   1473.6300     34.9200     -0.3400
+   1587.2000   1473.6300     34.9200     -0.3400
+   1587.3000   1473.6300     34.9200     -0.3400
+   1587.5000   1473.6600     34.9400     -0.3400
+   1587.6000   1473.6400     34.9200     -0.3400
+   1587.7000   1473.6400     34.9200     -0.3400
+   1587.8000   1473.6400     34.9200     -0.3400
+   1588.0000   1473.6700     34.9400     -0.3400
+   1588.1000   1473.6400     34.9200     -0.3400
+   1588.2000   1473.6500     34.9200     -0.3400
+   1588.3000   1473.6500     34.9200     -0.3400
+   1588.5000   1473.6500     34.9200     -0.3400
+   1588.6000   1473.6500     34.9200     -0.3400
+   1588.7000   1473.6500     34.9200     -0.3400
+   1588.8000   1473.6600     34.9200     -0.3400
+   1589.0000   1473.6600     34.9200     -0.3400
+   1589.1000   1473.6600     34.9200     -0.3400
+   1589.2000   1473.6900     34.9400     -0.3400
+   1589.3000   1473.6600     34.9200     -0.3400
+   1589.5000   1473.6700     34.9200     -0.3400
+   1589.6000   1473.6700     34.9200     -0.3400
+   1589.7000   1473.6700     34.9200     -0.3400
+   1589.8000   1473.6700     34.9200     -0.3400
+   1590.0000   1473.7000     34.9400     -0.3400
+   1590.1000   1473.7000     34.9400     -0.3400
+   1590.2000   1473.7000     34.9400     -0.3400
+   1590.3000   1473.7100     34.9400     -0.3400
+   1590.5000   1473.6800     34.9200     -0.3400
+   1590.6000   1473.6800     34.9200     -0.3400
+   1590.7000   1473.6900     34.9200     -0.3400
+   1590.8000   1473.6900     34.9200     -0.3400
+   1591.0000   1473.6900     34.9200     -0.3400
+   1591.1000   1473.6900     34.9200     -0.3400
+   1591.2000   1473.7200     34.9400     -0.3400
+   1591.3000   1473.7200     34.9400     -0.3400
+   1591.5000   1473.7000     34.9200     -0.3400
+   1591.6000   1473.7000     34.9200     -0.3400
+   1591.7000   1473.7000     34.9200     -0.3400
+   1591.8000   1473.7300     34.9400     -0.3400
+   1592.0000   1473.7100     34.9200     -0.3400
+   1592.1000   1473.7100     34.9200     -0.3400
+   1592.2000   1473.7400     34.9400     -0.3400
+   1592.3000   1473.7400     34.9400     -0.3400
+   1592.5000   1473.7100     34.9200     -0.3400
+   1592.6000   1473.7400     34.9400     -0.3400
+   1592.7000   1473.7400     34.9400     -0.3400
+   1592.9000   1473.7500     34.9400     -0.3400
+   1593.0000   1473.7200     34.9200     -0.3400
+   1593.1000   1473.7500     34.9400     -0.3400
+   1593.2000   1473.7500     34.9400     -0.3400
+   1593.4000   1473.7500     34.9400     -0.3400
+   1593.5000   1473.6800     34.9200     -0.3500
+   1593.6000   1473.7700     34.9400     -0.3400
+   1593.7000   1473.7400     34.9200     -0.3400
+   1593.9000   1473.7400     34.9200     -0.3400
+   1594.0000   1473.7400     34.9200     -0.3400
+   1594.1000   1473.6900     34.9200     -0.3500
+   1594.2000   1473.7500     34.9200     -0.3400
+   1594.4000   1473.7500     34.9200     -0.3400
+   1594.5000   1473.7200     34.9400     -0.3500
+   1594.6000   1473.7600     34.9200     -0.3400
+   1594.7000   1473.7100     34.9200     -0.3500
+   1594.9000   1473.7600     34.9200     -0.3400
+   1595.0000   1473.7600     34.9200     -0.3400
+   1595.1000   1473.7100     34.9200     -0.3500
+   1595.2000   1473.7700     34.9200     -0.3400
+   1595.4000   1473.7200     34.9200     -0.3500
+   1595.5000   1473.8000     34.9400     -0.3400
+   1595.6000   1473.7700     34.9200     -0.3400
+   1595.7000   1473.7200     34.9200     -0.3500
+   1595.9000   1473.7800     34.9200     -0.3400
+   1596.0000   1473.7300     34.9200     -0.3500
+   1596.1000   1473.8100     34.9400     -0.3400
+   1596.2000   1473.8100     34.9400     -0.3400
+   1596.4000   1473.7500     34.9400     -0.3500
+   1596.5000   1473.8100     34.9400     -0.3400
+   1596.6000   1473.7700     34.9400     -0.3500
+   1596.7000   1473.8200     34.9400     -0.3400
+   1596.9000   1473.8200     34.9400     -0.3400
+   1597.0000   1473.7600     34.9300     -0.3500
+   1597.1000   1473.8200     34.9400     -0.3400
+   1597.2000   1473.8200     34.9400     -0.3400
+   1597.4000   1473.8200     34.9300     -0.3400
+   1597.5000   1473.7900     34.9100     -0.3400
+   1597.6000   1473.7700     34.9300     -0.3500
+   1597.7000   1473.8300     34.9400     -0.3400
+   1597.9000   1473.7900     34.9400     -0.3500
+   1598.0000   1473.8400     34.9400     -0.3400
+   1598.1000   1473.8100     34.9200     -0.3400
+   1598.2000   1473.7800     34.9300     -0.3500
+   1598.4000   1473.8200     34.9200     -0.3400
+   1598.5000   1473.7700     34.9200     -0.3500
+   1598.6000   1473.8000     34.9400     -0.3500
+   1598.8000   1473.7800     34.9300     -0.3500
+   1598.9000   1473.7800     34.9300     -0.3500
+   1599.0000   1473.8300     34.9300     -0.3400
+   1599.1000   1473.7800     34.9200     -0.3500
+   1599.3000   1473.8100     34.9400     -0.3500
+   1599.4000   1473.7900     34.9300     -0.3500
+   1599.5000   1473.8200     34.9500     -0.3500
+   1599.6000   1473.8700     34.9500     -0.3400
+   1599.8000   1473.8200     34.9400     -0.3500
+   1599.9000   1473.8700     34.9400     -0.3400
+   1600.0000   1473.8400     34.9200     -0.3400
+   1600.1000   1473.8100     34.9300     -0.3500
+   1600.3000   1473.8700     34.9400     -0.3400
+   1600.4000   1473.8300     34.9400     -0.3500
+   1600.5000   1473.8800     34.9400     -0.3400
+   1600.6000   1473.8800     34.9400     -0.3400
+   1600.8000   1473.8200     34.9300     -0.3500
+   1600.9000   1473.8600     34.9200     -0.3400
+   1601.0000   1473.8400     34.9400     -0.3500
+   1601.1000   1473.8400     34.9400     -0.3500
+   1601.3000   1473.9000     34.9400     -0.3400
+   1601.4000   1473.8900     34.9400     -0.3400
+   1601.5000   1473.8800     34.9300     -0.3400
+   1601.6000   1473.8400     34.9300     -0.3500
+   1601.8000   1473.9000     34.9400     -0.3400
+   1601.9000   1473.9000     34.9400     -0.3400
+   1602.0000   1473.8400     34.9300     -0.3500
+   1602.1000   1473.9000     34.9400     -0.3400
+   1602.3000   1473.8600     34.9400     -0.3500
+   1602.4000   1473.9100     34.9400     -0.3400
+   1602.5000   1473.9100     34.9400     -0.3400
+   1602.6000   1473.8500     34.9300     -0.3500
+   1602.8000   1473.9100     34.9400     -0.3400
+   1602.9000   1473.8700     34.9400     -0.3500
+   1603.0000   1473.9200     34.9400     -0.3400
+   1603.1000   1473.9200     34.9400     -0.3400
+   1603.3000   1473.8600     34.9300     -0.3500
+   1603.4000   1473.9200     34.9400     -0.3400
+   1603.5000   1473.8800     34.9400     -0.3500
+   1603.6000   1473.9300     34.9400     -0.3400
+   1603.8000   1473.8800     34.9400     -0.3500
+   1603.9000   1473.8800     34.9400     -0.3500
+   1604.0000   1473.9400     34.9400     -0.3400
+   1604.1000   1473.8900     34.9400     -0.3500
+   1604.3000   1473.8900     34.9400     -0.3500
+   1604.4000   1473.9500     34.9400     -0.3400
+   1604.5000   1473.8900     34.9400     -0.3500
+   1604.6000   1473.9400     34.9400     -0.3400
+   1604.8000   1473.9000     34.9400     -0.3500
+   1604.9000   1473.9000     34.9400     -0.3500
+   1605.0000   1473.9600     34.9400     -0.3400
+   1605.2000   1473.9000     34.9400     -0.3500
+   1605.3000   1473.9500     34.9400     -0.3400
+   1605.4000   1473.9100     34.9400     -0.3500
+   1605.5000   1473.9600     34.9400     -0.3400
+   1605.7000   1473.9100     34.9400     -0.3500
+   1605.8000   1473.9100     34.9400     -0.3500
+   1605.9000   1473.9700     34.9400     -0.3400
+   1606.0000   1473.9200     34.9400     -0.3500
+   1606.2000   1473.9700     34.9400     -0.3400
+   1606.3000   1473.9700     34.9400     -0.3400
+   1606.4000   1473.9100     34.9300     -0.3500
+   1606.5000   1473.9700     34.9400     -0.3400
+   1606.7000   1473.9300     34.9400     -0.3500
+   1606.8000   1473.9300     34.9400     -0.3500
+   1606.9000   1473.9400     34.9400     -0.3500
+   1607.0000   1473.9400     34.9400     -0.3500
+   1607.2000   1473.9900     34.9400     -0.3400
+   1607.3000   1473.9400     34.9400     -0.3500
+   1607.4000   1473.9400     34.9400     -0.3500
+   1607.5000   1473.9500     34.9400     -0.3500
+   1607.7000   1473.9500     34.9400     -0.3500
+   1607.8000   1473.9500     34.9400     -0.3500
+   1607.9000   1473.9500     34.9400     -0.3500
+   1608.0000   1473.9600     34.9400     -0.3500
+   1608.2000   1473.9600     34.9400     -0.3500
+   1608.3000   1473.9600     34.9400     -0.3500
+   1608.4000   1474.0100     34.9400     -0.3400
+   1608.5000   1473.9600     34.9300     -0.3500
+   1608.7000   1473.9600     34.9300     -0.3500
+   1608.8000   1473.9700     34.9400     -0.3500
+   1608.9000   1473.9700     34.9400     -0.3500
+   1609.0000   1473.9700     34.9400     -0.3500
+   1609.2000   1473.9700     34.9400     -0.3500
+   1609.3000   1473.9800     34.9400     -0.3500
+   1609.4000   1473.9800     34.9400     -0.3500
+   1609.5000   1473.9800     34.9400     -0.3500
+   1609.7000   1473.9800     34.9400     -0.3500
+   1609.8000   1473.9800     34.9400     -0.3500
+   1609.9000   1473.9900     34.9400     -0.3500
+   1610.0000   1473.9900     34.9400     -0.3500
+   1610.2000   1473.9900     34.9400     -0.3500
+   1610.3000   1473.9900     34.9400     -0.3500
+   1610.4000   1473.9900     34.9400     -0.3500
+   1610.5000   1474.0000     34.9400     -0.3500
+   1610.7000   1474.0000     34.9400     -0.3500
+   1610.8000   1474.0000     34.9400     -0.3500
+   1610.9000   1474.0000     34.9400     -0.3500
+   1611.0000   1474.0000     34.9400     -0.3500
+   1611.2000   1474.0100     34.9400     -0.3500
+   1611.3000   1474.0100     34.9400     -0.3500
+   1611.4000   1474.0100     34.9400     -0.3500
+   1611.5000   1474.0100     34.9400     -0.3500
+   1611.7000   1474.0100     34.9400     -0.3500
+   1611.8000   1474.0200     34.9400     -0.3500
+   1611.9000   1474.0200     34.9400     -0.3500
+   1612.0000   1474.0200     34.9400     -0.3500
+   1612.2000   1474.0200     34.9400     -0.3500
+   1612.3000   1474.0200     34.9400     -0.3500
+   1612.4000   1474.0300     34.9400     -0.3500
+   1612.6000   1474.0300     34.9400     -0.3500
+   1612.7000   1474.0300     34.9400     -0.3500
+   1612.8000   1474.0300     34.9400     -0.3500
+   1612.9000   1474.0300     34.9400     -0.3500
+   1613.1000   1474.0400     34.9400     -0.3500
+   1613.2000   1474.0400     34.9400     -0.3500
+   1613.3000   1474.0400     34.9400     -0.3500
+   1613.4000   1474.0400     34.9400     -0.3500
+   1613.6000   1474.0400     34.9400     -0.3500
+   1613.7000   1474.0500     34.9400     -0.3500
+   1613.8000   1474.0500     34.9400     -0.3500
+   1613.9000   1474.0500     34.9400     -0.3500
+   1614.1000   1474.0500     34.9400     -0.3500
+   1614.2000   1474.0500     34.9400     -0.3500
+   1614.3000   1474.0600     34.9400     -0.3500
+   1614.4000   1474.0600     34.9400     -0.3500
+   1614.6000   1474.0600     34.9400     -0.3500
+   1614.7000   1474.0600     34.9400     -0.3500
+   1614.8000   1474.0600     34.9400     -0.3500
+   1614.9000   1474.0700     34.9400     -0.3500
+   1615.1000   1474.0700     34.9400     -0.3500
+   1615.2000   1474.0700     34.9400     -0.3500
+   1615.3000   1474.0700     34.9400     -0.3500
+   1615.4000   1474.0700     34.9400     -0.3500
+   1615.6000   1474.0800     34.9400     -0.3500
+   1615.7000   1474.0800     34.9400     -0.3500
+   1615.8000   1474.0800     34.9400     -0.3500
+   1615.9000   1474.0800     34.9400     -0.3500
+   1616.1000   1474.0800     34.9400     -0.3500
+   1616.2000   1474.0900     34.9400     -0.3500
+   1616.3000   1474.0900     34.9400     -0.3500
+   1616.4000   1474.0900     34.9400     -0.3500
+   1616.6000   1474.0900     34.9400     -0.3500
+   1616.7000   1474.0900     34.9400     -0.3500
+   1616.8000   1474.1000     34.9400     -0.3500
+   1616.9000   1474.1000     34.9400     -0.3500
+   1617.1000   1474.1000     34.9400     -0.3500
+   1617.2000   1474.1000     34.9400     -0.3500
+   1617.3000   1474.1000     34.9400     -0.3500
+   1617.4000   1474.1100     34.9400     -0.3500
+   1617.6000   1474.1100     34.9400     -0.3500
+   1617.7000   1474.1100     34.9400     -0.3500
+   1617.8000   1474.1100     34.9400     -0.3500
+   1617.9000   1474.1100     34.9400     -0.3500
+   1618.1000   1474.1200     34.9400     -0.3500
+   1618.2000   1474.1200     34.9400     -0.3500
+   1618.3000   1474.1200     34.9400     -0.3500
+   1618.4000   1474.1200     34.9300     -0.3500
+   1618.6000   1474.1200     34.9300     -0.3500
+   1618.7000   1474.1300     34.9300     -0.3500
+   1618.8000   1474.1300     34.9300     -0.3500
+   1618.9000   1474.1300     34.9300     -0.3500
+   1619.1000   1474.1300     34.9300     -0.3500
+   1619.2000   1474.1300     34.9300     -0.3500
+   1619.3000   1474.1400     34.9300     -0.3500
+   1619.4000   1474.1400     34.9300     -0.3500
+   1619.6000   1474.1400     34.9300     -0.3500
+   1619.7000   1474.1400     34.9300     -0.3500
+   1619.8000   1474.1400     34.9300     -0.3500
+   1619.9000   1474.1500     34.9300     -0.3500
+   1620.1000   1474.1500     34.9300     -0.3500
+   1620.2000   1474.1500     34.9300     -0.3500
+   1620.3000   1474.1500     34.9300     -0.3500
+   1620.4000   1474.1600     34.9300     -0.3500
+   1620.6000   1474.1600     34.9300     -0.3500
+   1620.7000   1474.1600     34.9300     -0.3500
+   1620.8000   1474.1600     34.9300     -0.3500
+   1620.9000   1474.1600     34.9300     -0.3500
+   1621.1000   1474.1700     34.9300     -0.3500
+   1621.2000   1474.1700     34.9300     -0.3500
+   1621.3000   1474.1700     34.9300     -0.3500
+   1621.5000   1474.1700     34.9300     -0.3500
+   1621.6000   1474.1700     34.9300     -0.3500
+   1621.7000   1474.1800     34.9300     -0.3500
+   1621.8000   1474.1800     34.9300     -0.3500
+   1622.0000   1474.1800     34.9300     -0.3500
+   1622.1000   1474.1800     34.9300     -0.3500
+   1622.2000   1474.1800     34.9300     -0.3500
+   1622.3000   1474.1900     34.9300     -0.3500
+   1622.5000   1474.1900     34.9300     -0.3500
+   1622.6000   1474.1900     34.9300     -0.3500
+   1622.7000   1474.1900     34.9300     -0.3500
+   1622.8000   1474.1900     34.9300     -0.3500
+   1623.0000   1474.2000     34.9300     -0.3500
+   1623.1000   1474.2000     34.9300     -0.3500
+   1623.2000   1474.2000     34.9300     -0.3500
+   1623.3000   1474.2000     34.9300     -0.3500
+   1623.5000   1474.2000     34.9300     -0.3500
+   1623.6000   1474.2100     34.9300     -0.3500
+   1623.7000   1474.2100     34.9300     -0.3500
+   1623.8000   1474.2100     34.9300     -0.3500
+   1624.0000   1474.2100     34.9300     -0.3500
+   1624.1000   1474.2100     34.9300     -0.3500
+   1624.2000   1474.2200     34.9300     -0.3500
+   1624.3000   1474.2200     34.9300     -0.3500
+   1624.5000   1474.2200     34.9300     -0.3500
+   1624.6000   1474.2200     34.9300     -0.3500
+   1624.7000   1474.2200     34.9300     -0.3500
+   1624.8000   1474.2300     34.9300     -0.3500
+   1625.0000   1474.2300     34.9300     -0.3500
+   1625.1000   1474.2300     34.9300     -0.3500
+   1625.2000   1474.2300     34.9300     -0.3500
+   1625.3000   1474.2300     34.9300     -0.3500
+   1625.5000   1474.2400     34.9300     -0.3500
+   1625.6000   1474.2400     34.9300     -0.3500
+   1625.7000   1474.2400     34.9300     -0.3500
+   1625.8000   1474.2400     34.9300     -0.3500
+   1626.0000   1474.2400     34.9300     -0.3500
+   1626.1000   1474.2500     34.9300     -0.3500
+   1626.2000   1474.2500     34.9300     -0.3500
+   1626.3000   1474.2500     34.9300     -0.3500
+   1626.5000   1474.2500     34.9300     -0.3500
+   1626.6000   1474.2500     34.9300     -0.3500
+   1626.7000   1474.2600     34.9300     -0.3500
+   1626.8000   1474.2600     34.9300     -0.3500
+   1627.0000   1474.2600     34.9300     -0.3500
+   1627.1000   1474.2600     34.9300     -0.3500
+   1627.2000   1474.2600     34.9300     -0.3500
+   1627.3000   1474.2700     34.9300     -0.3500
+   1627.5000   1474.2700     34.9300     -0.3500
+   1627.6000   1474.2700     34.9300     -0.3500
+   1627.7000   1474.2700     34.9300     -0.3500
+   1627.8000   1474.2700     34.9300     -0.3500
+   1628.0000   1474.2800     34.9300     -0.3500
+   1628.1000   1474.2800     34.9300     -0.3500
+   1628.2000   1474.2800     34.9300     -0.3500
+   1628.3000   1474.2800     34.9300     -0.3500
+   1628.5000   1474.2800     34.9300     -0.3500
+   1628.6000   1474.2900     34.9300     -0.3500
+   1628.7000   1474.2900     34.9300     -0.3500
+   1628.8000   1474.2900     34.9300     -0.3500
+   1629.0000   1474.2900     34.9300     -0.3500
+   1629.1000   1474.2900     34.9300     -0.3500
+   1629.2000   1474.3000     34.9300     -0.3500
+   1629.3000   1474.3000     34.9300     -0.3500
+   1629.5000   1474.3000     34.9300     -0.3500
+   1629.6000   1474.3000     34.9300     -0.3500
+   1629.7000   1474.3300     34.9500     -0.3500
+   1629.8000   1474.3100     34.9300     -0.3500
+   1630.0000   1474.3100     34.9300     -0.3500
+   1630.1000   1474.3100     34.9300     -0.3500
+   1630.2000   1474.3100     34.9300     -0.3500
+   1630.3000   1474.3100     34.9300     -0.3500
+   1630.5000   1474.3200     34.9300     -0.3500
+   1630.6000   1474.3200     34.9300     -0.3500
+   1630.7000   1474.3200     34.9300     -0.3500
+   1630.8000   1474.3200     34.9300     -0.3500
+   1631.0000   1474.3200     34.9300     -0.3500
+   1631.1000   1474.3300     34.9300     -0.3500
+   1631.2000   1474.3300     34.9300     -0.3500
+   1631.3000   1474.3300     34.9300     -0.3500
+   1631.5000   1474.3300     34.9300     -0.3500
+   1631.6000   1474.3300     34.9300     -0.3500
+   1631.7000   1474.3400     34.9300     -0.3500
+   1631.8000   1474.3400     34.9300     -0.3500
+   1632.0000   1474.3400     34.9300     -0.3500
+   1632.1000   1474.3700     34.9500     -0.3500
+   1632.2000   1474.3400     34.9300     -0.3500
+   1632.3000   1474.3700     34.9500     -0.3500
+   1632.5000   1474.3700     34.9500     -0.3500
+   1632.6000   1474.3500     34.9300     -0.3500
+   1632.7000   1474.3800     34.9500     -0.3500
+   1632.9000   1474.3500     34.9300     -0.3500
+   1633.0000   1474.3600     34.9300     -0.3500
+   1633.1000   1474.3800     34.9500     -0.3500
+   1633.2000   1474.3600     34.9300     -0.3500
+   1633.4000   1474.3900     34.9500     -0.3500
+   1633.5000   1474.3600     34.9300     -0.3500
+   1633.6000   1474.3700     34.9300     -0.3500
+   1633.7000   1474.3700     34.9300     -0.3500
+   1633.9000   1474.3700     34.9300     -0.3500
+   1634.0000   1474.3700     34.9300     -0.3500
+   1634.1000   1474.3700     34.9300     -0.3500
+   1634.2000   1474.3800     34.9300     -0.3500
+   1634.4000   1474.3800     34.9300     -0.3500
+   1634.5000   1474.3800     34.9300     -0.3500
+   1634.6000   1474.3800     34.9300     -0.3500
+   1634.7000   1474.4100     34.9500     -0.3500
+   1634.9000   1474.3900     34.9300     -0.3500
+   1635.0000   1474.4100     34.9500     -0.3500
+   1635.1000   1474.3900     34.9300     -0.3500
+   1635.2000   1474.4200     34.9500     -0.3500
+   1635.4000   1474.3900     34.9300     -0.3500
+   1635.5000   1474.4200     34.9500     -0.3500
+   1635.6000   1474.4200     34.9500     -0.3500
+   1635.7000   1474.4300     34.9500     -0.3500
+   1635.9000   1474.4000     34.9300     -0.3500
+   1636.0000   1474.4000     34.9300     -0.3500
+   1636.1000   1474.4300     34.9400     -0.3500
+   1636.2000   1474.4300     34.9400     -0.3500
+   1636.4000   1474.4400     34.9400     -0.3500
+   1636.5000   1474.4400     34.9400     -0.3500
+   1636.6000   1474.4400     34.9400     -0.3500
+   1636.7000   1474.4400     34.9400     -0.3500
+   1636.9000   1474.4400     34.9400     -0.3500
+   1637.0000   1474.4500     34.9400     -0.3500
+   1637.1000   1474.4500     34.9400     -0.3500
+   1637.2000   1474.4500     34.9400     -0.3500
+   1637.4000   1474.4500     34.9400     -0.3500
+   1637.5000   1474.4500     34.9400     -0.3500
+   1637.6000   1474.4600     34.9400     -0.3500
+   1637.7000   1474.4600     34.9400     -0.3500
+   1637.9000   1474.4600     34.9400     -0.3500
+   1638.0000   1474.4400     34.9200     -0.3500
+   1638.1000   1474.4400     34.9200     -0.3500
+   1638.2000   1474.4700     34.9400     -0.3500
+   1638.4000   1474.4700     34.9400     -0.3500
+   1638.5000   1474.4700     34.9400     -0.3500
+   1638.6000   1474.4700     34.9400     -0.3500
+   1638.7000   1474.4700     34.9400     -0.3500
+   1638.9000   1474.4800     34.9400     -0.3500
+   1639.0000   1474.4800     34.9400     -0.3500
+   1639.1000   1474.4800     34.9400     -0.3500
+   1639.2000   1474.4600     34.9200     -0.3500
+   1639.4000   1474.4800     34.9400     -0.3500
+   1639.5000   1474.4600     34.9200     -0.3500
+   1639.6000   1474.4900     34.9400     -0.3500
+   1639.7000   1474.4900     34.9400     -0.3500
+   1639.9000   1474.4900     34.9400     -0.3500
+   1640.0000   1474.4900     34.9400     -0.3500
+   1640.1000   1474.5000     34.9400     -0.3500
+   1640.2000   1474.5000     34.9400     -0.3500
+   1640.4000   1474.5000     34.9400     -0.3500
+   1640.5000   1474.5000     34.9400     -0.3500
+   1640.6000   1474.5000     34.9400     -0.3500
+   1640.7000   1474.5100     34.9400     -0.3500
+   1640.9000   1474.5100     34.9400     -0.3500
+   1641.0000   1474.5100     34.9400     -0.3500
+   1641.1000   1474.5100     34.9400     -0.3500
+   1641.2000   1474.5100     34.9400     -0.3500
+   1641.4000   1474.5200     34.9400     -0.3500
+   1641.5000   1474.5200     34.9400     -0.3500
+   1641.6000   1474.5200     34.9400     -0.3500
+   1641.7000   1474.5200     34.9400     -0.3500
+   1641.9000   1474.5200     34.9400     -0.3500
+   1642.0000   1474.5300     34.9400     -0.3500
+   1642.1000   1474.5300     34.9400     -0.3500
+   1642.2000   1474.5300     34.9400     -0.3500
+   1642.4000   1474.5300     34.9400     -0.3500
+   1642.5000   1474.5300     34.9400     -0.3500
+   1642.6000   1474.5400     34.9400     -0.3500
+   1642.7000   1474.5400     34.9400     -0.3500
+   1642.9000   1474.5100     34.9200     -0.3500
+   1643.0000   1474.5400     34.9400     -0.3500
+   1643.1000   1474.5400     34.9400     -0.3500
+   1643.2000   1474.5500     34.9400     -0.3500
+   1643.4000   1474.5500     34.9400     -0.3500
+   1643.5000   1474.5500     34.9400     -0.3500
+   1643.6000   1474.5500     34.9400     -0.3500
+   1643.7000   1474.5500     34.9400     -0.3500
+   1643.9000   1474.5600     34.9400     -0.3500
+   1644.0000   1474.5600     34.9400     -0.3500
+   1644.1000   1474.5600     34.9400     -0.3500
+   1644.2000   1474.5600     34.9400     -0.3500
+   1644.4000   1474.5600     34.9400     -0.3500
+   1644.5000   1474.5700     34.9400     -0.3500
+   1644.6000   1474.5700     34.9400     -0.3500
+   1644.7000   1474.5700     34.9400     -0.3500
+   1644.9000   1474.5700     34.9400     -0.3500
+   1645.0000   1474.5700     34.9400     -0.3500
+   1645.1000   1474.5800     34.9400     -0.3500
+   1645.2000   1474.5800     34.9400     -0.3500
+   1645.4000   1474.5800     34.9400     -0.3500
+   1645.5000   1474.5800     34.9400     -0.3500
+   1645.6000   1474.5800     34.9400     -0.3500
+   1645.7000   1474.5900     34.9400     -0.3500
+   1645.9000   1474.5900     34.9400     -0.3500
+   1646.0000   1474.5900     34.9400     -0.3500
+   1646.1000   1474.5900     34.9400     -0.3500
+   1646.2000   1474.5900     34.9400     -0.3500
+   1646.4000   1474.6000     34.9400     -0.3500
+   1646.5000   1474.6000     34.9400     -0.3500
+   1646.6000   1474.6000     34.9400     -0.3500
+   1646.7000   1474.6000     34.9400     -0.3500
+   1646.9000   1474.6000     34.9400     -0.3500
+   1647.0000   1474.6100     34.9400     -0.3500
+   1647.1000   1474.6100     34.9400     -0.3500
+   1647.2000   1474.6100     34.9400     -0.3500
+   1647.4000   1474.6100     34.9400     -0.3500
+   1647.5000   1474.6100     34.9400     -0.3500
+   1647.6000   1474.6200     34.9400     -0.3500
+   1647.7000   1474.6200     34.9400     -0.3500
+   1647.9000   1474.6200     34.9400     -0.3500
+   1648.0000   1474.6200     34.9400     -0.3500
+   1648.1000   1474.6200     34.9400     -0.3500
+   1648.2000   1474.6300     34.9400     -0.3500
+   1648.4000   1474.6300     34.9400     -0.3500
+   1648.5000   1474.6300     34.9400     -0.3500
+   1648.6000   1474.6300     34.9400     -0.3500
+   1648.7000   1474.6400     34.9400     -0.3500
+   1648.9000   1474.6400     34.9400     -0.3500
+   1649.0000   1474.6400     34.9400     -0.3500
+   1649.1000   1474.6400     34.9400     -0.3500
+   1649.2000   1474.6400     34.9400     -0.3500
+   1649.4000   1474.6500     34.9400     -0.3500
+   1649.5000   1474.6500     34.9400     -0.3500
+   1649.6000   1474.6500     34.9400     -0.3500
+   1649.7000   1474.6500     34.9400     -0.3500
+   1649.9000   1474.6500     34.9400     -0.3500
+   1650.0000   1474.6600     34.9400     -0.3500
+   1650.1000   1474.6600     34.9400     -0.3500
+   1650.2000   1474.6600     34.9400     -0.3500
+   1650.4000   1474.6600     34.9400     -0.3500
+   1650.5000   1474.6600     34.9400     -0.3500
+   1650.6000   1474.6700     34.9400     -0.3500
+   1650.7000   1474.6700     34.9400     -0.3500
+   1650.9000   1474.6700     34.9400     -0.3500
+   1651.0000   1474.6700     34.9400     -0.3500
+   1651.1000   1474.6700     34.9400     -0.3500
+   1651.2000   1474.6800     34.9400     -0.3500
+   1651.4000   1474.6800     34.9400     -0.3500
+   1651.5000   1474.6800     34.9400     -0.3500
+   1651.6000   1474.6800     34.9400     -0.3500
+   1651.7000   1474.6800     34.9400     -0.3500
+   1651.9000   1474.6900     34.9400     -0.3500
+   1652.0000   1474.6900     34.9400     -0.3500
+   1652.1000   1474.6900     34.9400     -0.3500
+   1652.2000   1474.6900     34.9400     -0.3500
+   1652.4000   1474.6900     34.9400     -0.3500
+   1652.5000   1474.7000     34.9400     -0.3500
+   1652.6000   1474.7000     34.9400     -0.3500
+   1652.8000   1474.7000     34.9400     -0.3500
+   1652.9000   1474.7000     34.9400     -0.3500
+   1653.0000   1474.7000     34.9400     -0.3500
+   1653.1000   1474.7100     34.9400     -0.3500
+   1653.3000   1474.7100     34.9400     -0.3500
+   1653.4000   1474.7100     34.9400     -0.3500
+   1653.5000   1474.7100     34.9400     -0.3500
+   1653.6000   1474.7100     34.9400     -0.3500
+   1653.8000   1474.7200     34.9400     -0.3500
+   1653.9000   1474.7200     34.9400     -0.3500
+   1654.0000   1474.7200     34.9400     -0.3500
+   1654.1000   1474.7200     34.9400     -0.3500
+   1654.3000   1474.7200     34.9300     -0.3500
+   1654.4000   1474.7300     34.9300     -0.3500
+   1654.5000   1474.7300     34.9300     -0.3500
+   1654.6000   1474.7300     34.9300     -0.3500
+   1654.8000   1474.7300     34.9300     -0.3500
+   1654.9000   1474.7300     34.9300     -0.3500
+   1655.0000   1474.7400     34.9300     -0.3500
+   1655.1000   1474.7400     34.9300     -0.3500
+   1655.3000   1474.7400     34.9300     -0.3500
+   1655.4000   1474.7400     34.9300     -0.3500
+   1655.5000   1474.7400     34.9300     -0.3500
+   1655.6000   1474.7500     34.9300     -0.3500
+   1655.8000   1474.7500     34.9300     -0.3500
+   1655.9000   1474.7500     34.9300     -0.3500
+   1656.0000   1474.7500     34.9300     -0.3500
+   1656.1000   1474.7500     34.9300     -0.3500
+   1656.3000   1474.7600     34.9300     -0.3500
+   1656.4000   1474.7600     34.9300     -0.3500
+   1656.5000   1474.7600     34.9300     -0.3500
+   1656.6000   1474.7600     34.9300     -0.3500
+   1656.8000   1474.7600     34.9300     -0.3500
+   1656.9000   1474.7700     34.9300     -0.3500
+   1657.0000   1474.7700     34.9300     -0.3500
+   1657.1000   1474.7700     34.9300     -0.3500
+   1657.3000   1474.7700     34.9300     -0.3500
+   1657.4000   1474.7700     34.9300     -0.3500
+   1657.5000   1474.7800     34.9300     -0.3500
+   1657.6000   1474.7800     34.9300     -0.3500
+   1657.8000   1474.7800     34.9300     -0.3500
+   1657.9000   1474.7800     34.9300     -0.3500
+   1658.0000   1474.7800     34.9300     -0.3500
+   1658.1000   1474.7900     34.9300     -0.3500
+   1658.3000   1474.7900     34.9300     -0.3500
+   1658.4000   1474.7900     34.9300     -0.3500
+   1658.5000   1474.7900     34.9300     -0.3500
+   1658.6000   1474.7900     34.9300     -0.3500
+   1658.8000   1474.8000     34.9300     -0.3500
+   1658.9000   1474.8000     34.9300     -0.3500
+   1659.0000   1474.8000     34.9300     -0.3500
+   1659.1000   1474.8000     34.9300     -0.3500
+   1659.3000   1474.8000     34.9300     -0.3500
+   1659.4000   1474.8100     34.9300     -0.3500
+   1659.5000   1474.8100     34.9300     -0.3500
+   1659.6000   1474.8100     34.9300     -0.3500
+   1659.8000   1474.8100     34.9300     -0.3500
+   1659.9000   1474.8400     34.9500     -0.3500
+   1660.0000   1474.8200     34.9300     -0.3500
+   1660.1000   1474.8200     34.9300     -0.3500
+   1660.3000   1474.8200     34.9300     -0.3500
+   1660.4000   1474.8200     34.9300     -0.3500
+   1660.5000   1474.8200     34.9300     -0.3500
+   1660.6000   1474.8300     34.9300     -0.3500
+   1660.8000   1474.8300     34.9300     -0.3500
+   1660.9000   1474.8300     34.9300     -0.3500
+   1661.0000   1474.8300     34.9300     -0.3500
+   1661.1000   1474.8300     34.9300     -0.3500
+   1661.3000   1474.8400     34.9300     -0.3500
+   1661.4000   1474.8400     34.9300     -0.3500
+   1661.5000   1474.8400     34.9300     -0.3500
+   1661.6000   1474.8400     34.9300     -0.3500
+   1661.8000   1474.8700     34.9500     -0.3500
+   1661.9000   1474.8500     34.9300     -0.3500
+   1662.0000   1474.8500     34.9300     -0.3500
+   1662.1000   1474.8500     34.9300     -0.3500
+   1662.3000   1474.8500     34.9300     -0.3500
+   1662.4000   1474.8500     34.9300     -0.3500
+   1662.5000   1474.8800     34.9500     -0.3500
+   1662.6000   1474.8600     34.9300     -0.3500
+   1662.8000   1474.8600     34.9300     -0.3500
+   1662.9000   1474.8600     34.9300     -0.3500
+   1663.0000   1474.8600     34.9300     -0.3500
+   1663.1000   1474.8700     34.9300     -0.3500
+   1663.3000   1474.8700     34.9300     -0.3500
+   1663.4000   1474.9000     34.9500     -0.3500
+   1663.5000   1474.8700     34.9300     -0.3500
+   1663.6000   1474.8700     34.9300     -0.3500
+   1663.8000   1474.8800     34.9300     -0.3500
+   1663.9000   1474.8800     34.9300     -0.3500
+   1664.0000   1474.8800     34.9300     -0.3500
+   1664.1000   1474.8800     34.9300     -0.3500
+   1664.3000   1474.8800     34.9300     -0.3500
+   1664.4000   1474.8900     34.9300     -0.3500
+   1664.5000   1474.8900     34.9300     -0.3500
+   1664.6000   1474.8900     34.9300     -0.3500
+   1664.8000   1474.8900     34.9300     -0.3500
+   1664.9000   1474.8900     34.9300     -0.3500
+   1665.0000   1474.9000     34.9300     -0.3500
+   1665.1000   1474.9000     34.9300     -0.3500
+   1665.3000   1474.9000     34.9300     -0.3500
+   1665.4000   1474.9000     34.9300     -0.3500
+   1665.5000   1474.9300     34.9500     -0.3500
+   1665.6000   1474.9100     34.9300     -0.3500
+   1665.8000   1474.9100     34.9300     -0.3500
+   1665.9000   1474.9400     34.9500     -0.3500
+   1666.0000   1474.9100     34.9300     -0.3500
+   1666.1000   1474.9100     34.9300     -0.3500
+   1666.3000   1474.9200     34.9300     -0.3500
+   1666.4000   1474.9200     34.9300     -0.3500
+   1666.5000   1474.9500     34.9500     -0.3500
+   1666.6000   1474.9200     34.9300     -0.3500
+   1666.8000   1474.9200     34.9300     -0.3500
+   1666.9000   1474.9500     34.9500     -0.3500
+   1667.0000   1474.9300     34.9300     -0.3500
+   1667.1000   1474.9300     34.9300     -0.3500
+   1667.3000   1474.9300     34.9300     -0.3500
+   1667.4000   1474.9300     34.9300     -0.3500
+   1667.5000   1474.9600     34.9500     -0.3500
+   1667.6000   1474.9400     34.9300     -0.3500
+   1667.8000   1474.9400     34.9300     -0.3500
+   1667.9000   1474.9400     34.9300     -0.3500
+   1668.0000   1474.9200     34.9500     -0.3700
+   1668.1000   1474.9800     34.9500     -0.3500
+   1668.3000   1474.9600     34.9300     -0.3500
+   1668.4000   1474.9500     34.9300     -0.3500
+   1668.5000   1474.9800     34.9500     -0.3500
+   1668.6000   1474.9500     34.9300     -0.3500
+   1668.8000   1474.9800     34.9500     -0.3500
+   1668.9000   1474.9600     34.9300     -0.3500
+   1669.0000   1474.9600     34.9300     -0.3500
+   1669.1000   1474.9600     34.9300     -0.3500
+   1669.3000   1474.9600     34.9300     -0.3500
+   1669.4000   1474.9700     34.9300     -0.3500
+   1669.5000   1474.9700     34.9300     -0.3500
+   1669.6000   1474.9700     34.9300     -0.3500
+   1669.8000   1474.9700     34.9300     -0.3500
+   1669.9000   1474.9200     34.9300     -0.3700
+   1670.0000   1475.0100     34.9500     -0.3500
+   1670.1000   1474.9900     34.9300     -0.3500
+   1670.3000   1474.9300     34.9300     -0.3700
+   1670.4000   1474.9900     34.9300     -0.3500
+   1670.5000   1474.9900     34.9300     -0.3500
+   1670.6000   1474.9900     34.9300     -0.3500
+   1670.8000   1474.9900     34.9300     -0.3500
+   1670.9000   1475.0200     34.9500     -0.3500
+   1671.0000   1474.9900     34.9300     -0.3500
+   1671.1000   1474.9700     34.9500     -0.3700
+   1671.2000   1475.0300     34.9500     -0.3500
+   1671.4000   1475.0100     34.9300     -0.3500
+   1671.5000   1475.0000     34.9300     -0.3500
+   1671.6000   1475.0000     34.9300     -0.3500
+   1671.7000   1475.0000     34.9300     -0.3500
+   1671.9000   1475.0300     34.9400     -0.3500
+   1672.0000   1475.0100     34.9300     -0.3500
+   1672.1000   1475.0400     34.9400     -0.3500
+   1672.2000   1475.0100     34.9300     -0.3500
+   1672.4000   1474.9600     34.9300     -0.3700
+   1672.5000   1475.0200     34.9300     -0.3500
+   1672.6000   1475.0300     34.9300     -0.3500
+   1672.7000   1474.9700     34.9200     -0.3700
+   1672.9000   1475.0300     34.9300     -0.3500
+   1673.0000   1474.9800     34.9300     -0.3700
+   1673.1000   1475.0300     34.9300     -0.3500
+   1673.2000   1475.0400     34.9300     -0.3500
+   1673.4000   1475.0100     34.9400     -0.3700
+   1673.5000   1475.0400     34.9300     -0.3500
+   1673.6000   1474.9900     34.9300     -0.3700
+   1673.7000   1475.0700     34.9500     -0.3500
+   1673.9000   1475.0700     34.9500     -0.3500
+   1674.0000   1474.9900     34.9200     -0.3700
+   1674.1000   1475.0500     34.9300     -0.3500
+   1674.2000   1475.0300     34.9500     -0.3700
+   1674.4000   1475.0500     34.9300     -0.3500
+   1674.5000   1475.0800     34.9500     -0.3500
+   1674.6000   1475.0000     34.9200     -0.3700
+   1674.7000   1475.0600     34.9300     -0.3500
+   1674.9000   1475.0100     34.9300     -0.3700
+   1675.0000   1475.0400     34.9500     -0.3700
+   1675.1000   1475.0200     34.9400     -0.3700
+   1675.2000   1475.0300     34.9400     -0.3700
+   1675.4000   1475.0300     34.9400     -0.3700
+   1675.5000   1475.0300     34.9400     -0.3700
+   1675.6000   1475.1100     34.9500     -0.3500
+   1675.7000   1475.0800     34.9300     -0.3500
+   1675.9000   1475.0200     34.9200     -0.3700
+   1676.0000   1475.0800     34.9300     -0.3500
+   1676.1000   1475.0600     34.9500     -0.3700
+   1676.2000   1475.0600     34.9500     -0.3700
+   1676.4000   1475.0400     34.9300     -0.3700
+   1676.5000   1475.0500     34.9300     -0.3700
+   1676.6000   1475.1200     34.9500     -0.3500
+   1676.7000   1475.0400     34.9300     -0.3700
+   1676.9000   1475.0400     34.9300     -0.3700
+   1677.0000   1475.1300     34.9500     -0.3500
+   1677.1000   1475.0500     34.9300     -0.3700
+   1677.2000   1475.0500     34.9300     -0.3700
+   1677.4000   1475.0600     34.9300     -0.3700
+   1677.5000   1475.0900     34.9500     -0.3700
+   1677.6000   1475.1400     34.9500     -0.3500
+   1677.7000   1475.0600     34.9300     -0.3700
+   1677.9000   1475.0600     34.9300     -0.3700
+   1678.0000   1475.0700     34.9300     -0.3700
+   1678.1000   1475.1000     34.9500     -0.3700
+   1678.2000   1475.1000     34.9500     -0.3700
+   1678.4000   1475.1000     34.9500     -0.3700
+   1678.5000   1475.0800     34.9300     -0.3700
+   1678.6000   1475.0800     34.9300     -0.3700
+   1678.7000   1475.1100     34.9500     -0.3700
+   1678.9000   1475.1100     34.9500     -0.3700
+   1679.0000   1475.1100     34.9500     -0.3700
+   1679.1000   1475.0900     34.9300     -0.3700
+   1679.2000   1475.0900     34.9300     -0.3700
+   1679.4000   1475.1200     34.9500     -0.3700
+   1679.5000   1475.1200     34.9500     -0.3700
+   1679.6000   1475.1000     34.9300     -0.3700
+   1679.7000   1475.1000     34.9300     -0.3700
+   1679.9000   1475.1000     34.9300     -0.3700
+   1680.0000   1475.1300     34.9500     -0.3700
+   1680.1000   1475.1300     34.9500     -0.3700
+   1680.2000   1475.1100     34.9300     -0.3700
+   1680.4000   1475.1100     34.9300     -0.3700
+   1680.5000   1475.1100     34.9300     -0.3700
+   1680.6000   1475.1400     34.9500     -0.3700
+   1680.7000   1475.1100     34.9300     -0.3700
+   1680.9000   1475.1200     34.9300     -0.3700
+   1681.0000   1475.1200     34.9300     -0.3700
+   1681.1000   1475.1500     34.9500     -0.3700
+   1681.2000   1475.1500     34.9500     -0.3700
+   1681.4000   1475.1200     34.9300     -0.3700
+   1681.5000   1475.1500     34.9500     -0.3700
+   1681.6000   1475.1300     34.9300     -0.3700
+   1681.7000   1475.1300     34.9300     -0.3700
+   1681.9000   1475.1300     34.9300     -0.3700
+   1682.0000   1475.1300     34.9300     -0.3700
+   1682.1000   1475.1600     34.9500     -0.3700
+   1682.2000   1475.1400     34.9300     -0.3700
+   1682.4000   1475.1700     34.9500     -0.3700
+   1682.5000   1475.1400     34.9300     -0.3700
+   1682.6000   1475.1400     34.9300     -0.3700
+   1682.7000   1475.1500     34.9300     -0.3700
+   1682.9000   1475.1500     34.9300     -0.3700
+   1683.0000   1475.1500     34.9300     -0.3700
+   1683.1000   1475.1800     34.9500     -0.3700
+   1683.2000   1475.1800     34.9500     -0.3700
+   1683.4000   1475.1800     34.9500     -0.3700
+   1683.5000   1475.1600     34.9300     -0.3700
+   1683.6000   1475.1900     34.9500     -0.3700
+   1683.7000   1475.1900     34.9500     -0.3700
+   1683.9000   1475.1600     34.9300     -0.3700
+   1684.0000   1475.1900     34.9500     -0.3700
+   1684.1000   1475.1700     34.9300     -0.3700
+   1684.2000   1475.1700     34.9300     -0.3700
+   1684.4000   1475.2000     34.9500     -0.3700
+   1684.5000   1475.2000     34.9500     -0.3700
+   1684.6000   1475.2000     34.9500     -0.3700
+   1684.7000   1475.1800     34.9300     -0.3700
+   1684.9000   1475.2100     34.9500     -0.3700
+   1685.0000   1475.2100     34.9500     -0.3700
+   1685.1000   1475.2100     34.9500     -0.3700
+   1685.2000   1475.1900     34.9300     -0.3700
+   1685.4000   1475.2200     34.9500     -0.3700
+   1685.5000   1475.1900     34.9300     -0.3700
+   1685.6000   1475.2200     34.9500     -0.3700
+   1685.7000   1475.1900     34.9300     -0.3700
+   1685.9000   1475.2200     34.9500     -0.3700
+   1686.0000   1475.2000     34.9300     -0.3700
+   1686.1000   1475.2300     34.9500     -0.3700
+   1686.2000   1475.2300     34.9500     -0.3700
+   1686.4000   1475.2300     34.9500     -0.3700
+   1686.5000   1475.2100     34.9300     -0.3700
+   1686.6000   1475.2400     34.9500     -0.3700
+   1686.7000   1475.2100     34.9300     -0.3700
+   1686.9000   1475.2400     34.9500     -0.3700
+   1687.0000   1475.2400     34.9500     -0.3700
+   1687.1000   1475.2400     34.9500     -0.3700
+   1687.2000   1475.2200     34.9300     -0.3700
+   1687.4000   1475.2500     34.9500     -0.3700
+   1687.5000   1475.2200     34.9300     -0.3700
+   1687.6000   1475.2500     34.9500     -0.3700
+   1687.7000   1475.2500     34.9500     -0.3700
+   1687.9000   1475.2300     34.9300     -0.3700
+   1688.0000   1475.2600     34.9500     -0.3700
+   1688.1000   1475.2600     34.9500     -0.3700
+   1688.2000   1475.2600     34.9500     -0.3700
+   1688.4000   1475.2600     34.9500     -0.3700
+   1688.5000   1475.2400     34.9300     -0.3700
+   1688.6000   1475.2400     34.9300     -0.3700
+   1688.7000   1475.2700     34.9500     -0.3700
+   1688.9000   1475.2700     34.9500     -0.3700
+   1689.0000   1475.2700     34.9500     -0.3700
+   1689.1000   1475.2800     34.9500     -0.3700
+   1689.2000   1475.2500     34.9300     -0.3700
+   1689.4000   1475.2800     34.9500     -0.3700
+   1689.5000   1475.2800     34.9500     -0.3700
+   1689.6000   1475.2800     34.9500     -0.3700
+   1689.7000   1475.2900     34.9500     -0.3700
+   1689.9000   1475.2600     34.9300     -0.3700
+   1690.0000   1475.2900     34.9500     -0.3700
+   1690.1000   1475.2900     34.9500     -0.3700
+   1690.2000   1475.2900     34.9500     -0.3700
+   1690.4000   1475.2700     34.9300     -0.3700
+   1690.5000   1475.3000     34.9500     -0.3700
+   1690.6000   1475.3000     34.9500     -0.3700
+   1690.7000   1475.3000     34.9500     -0.3700
+   1690.9000   1475.3000     34.9500     -0.3700
+   1691.0000   1475.2800     34.9300     -0.3700
+   1691.1000   1475.3100     34.9500     -0.3700
+   1691.2000   1475.3100     34.9500     -0.3700
+   1691.4000   1475.2800     34.9300     -0.3700
+   1691.5000   1475.3100     34.9500     -0.3700
+   1691.6000   1475.2900     34.9300     -0.3700
+   1691.7000   1475.3200     34.9500     -0.3700
+   1691.8000   1475.3200     34.9500     -0.3700
+   1692.0000   1475.3200     34.9500     -0.3700
+   1692.1000   1475.3200     34.9500     -0.3700
+   1692.2000   1475.3000     34.9300     -0.3700
+   1692.3000   1475.3300     34.9500     -0.3700
+   1692.5000   1475.3300     34.9500     -0.3700
+   1692.6000   1475.3300     34.9500     -0.3700
+   1692.7000   1475.3300     34.9500     -0.3700
+   1692.8000   1475.3100     34.9300     -0.3700
+   1693.0000   1475.3100     34.9300     -0.3700
+   1693.1000   1475.3400     34.9500     -0.3700
+   1693.2000   1475.3400     34.9500     -0.3700
+   1693.3000   1475.3400     34.9500     -0.3700
+   1693.5000   1475.3500     34.9500     -0.3700
+   1693.6000   1475.3500     34.9500     -0.3700
+   1693.7000   1475.3500     34.9400     -0.3700
+   1693.8000   1475.3500     34.9400     -0.3700
+   1694.0000   1475.3500     34.9400     -0.3700
+   1694.1000   1475.3600     34.9400     -0.3700
+   1694.2000   1475.3300     34.9300     -0.3700
+   1694.3000   1475.3600     34.9400     -0.3700
+   1694.5000   1475.3600     34.9400     -0.3700
+   1694.6000   1475.3600     34.9400     -0.3700
+   1694.7000   1475.3400     34.9200     -0.3700
+   1694.8000   1475.3700     34.9400     -0.3700
+   1695.0000   1475.3700     34.9400     -0.3700
+   1695.1000   1475.3700     34.9400     -0.3700
+   1695.2000   1475.3700     34.9400     -0.3700
+   1695.3000   1475.3500     34.9200     -0.3700
+   1695.5000   1475.3800     34.9400     -0.3700
+   1695.6000   1475.3800     34.9400     -0.3700
+   1695.7000   1475.3800     34.9400     -0.3700
+   1695.8000   1475.3800     34.9400     -0.3700
+   1696.0000   1475.3900     34.9400     -0.3700
+   1696.1000   1475.3900     34.9400     -0.3700
+   1696.2000   1475.3900     34.9400     -0.3700
+   1696.3000   1475.3900     34.9400     -0.3700
+   1696.5000   1475.3900     34.9400     -0.3700
+   1696.6000   1475.3700     34.9200     -0.3700
+   1696.7000   1475.4000     34.9400     -0.3700
+   1696.8000   1475.4000     34.9400     -0.3700
+   1697.0000   1475.4000     34.9400     -0.3700
+   1697.1000   1475.4000     34.9400     -0.3700
+   1697.2000   1475.4100     34.9400     -0.3700
+   1697.3000   1475.4100     34.9400     -0.3700
+   1697.5000   1475.4100     34.9400     -0.3700
+   1697.6000   1475.4100     34.9400     -0.3700
+   1697.7000   1475.4100     34.9400     -0.3700
+   1697.8000   1475.4200     34.9400     -0.3700
+   1698.0000   1475.4200     34.9400     -0.3700
+   1698.1000   1475.4200     34.9400     -0.3700
+   1698.2000   1475.4200     34.9400     -0.3700
+   1698.3000   1475.4200     34.9400     -0.3700
+   1698.5000   1475.4300     34.9400     -0.3700
+   1698.6000   1475.4300     34.9400     -0.3700
+   1698.7000   1475.4300     34.9400     -0.3700
+   1698.8000   1475.4300     34.9400     -0.3700
+   1699.0000   1475.4300     34.9400     -0.3700
+   1699.1000   1475.4400     34.9400     -0.3700
+   1699.2000   1475.4400     34.9400     -0.3700
+   1699.3000   1475.4400     34.9400     -0.3700
+   1699.5000   1475.4400     34.9400     -0.3700
+   1699.6000   1475.4400     34.9400     -0.3700
+   1699.7000   1475.4500     34.9400     -0.3700
+   1699.8000   1475.4500     34.9400     -0.3700
+   1700.0000   1475.4500     34.9400     -0.3700
+   1700.1000   1475.4500     34.9400     -0.3700
+   1700.2000   1475.4500     34.9400     -0.3700
+   1700.3000   1475.4300     34.9200     -0.3700
+   1700.5000   1475.4600     34.9400     -0.3700
+   1700.6000   1475.4600     34.9400     -0.3700
+   1700.7000   1475.4600     34.9400     -0.3700
+   1700.8000   1475.4600     34.9400     -0.3700
+   1701.0000   1475.4400     34.9200     -0.3700
+   1701.1000   1475.4700     34.9400     -0.3700
+   1701.2000   1475.4700     34.9400     -0.3700
+   1701.3000   1475.4700     34.9400     -0.3700
+   1701.5000   1475.4700     34.9400     -0.3700
+   1701.6000   1475.4800     34.9400     -0.3700
+   1701.7000   1475.4800     34.9400     -0.3700
+   1701.8000   1475.4800     34.9400     -0.3700
+   1702.0000   1475.4800     34.9400     -0.3700
+   1702.1000   1475.4800     34.9400     -0.3700
+   1702.2000   1475.4600     34.9200     -0.3700
+   1702.3000   1475.4900     34.9400     -0.3700
+   1702.5000   1475.4900     34.9400     -0.3700
+   1702.6000   1475.4900     34.9400     -0.3700
+   1702.7000   1475.4900     34.9400     -0.3700
+   1702.8000   1475.5000     34.9400     -0.3700
+   1702.9000   1475.5000     34.9400     -0.3700
+   1703.1000   1475.5000     34.9400     -0.3700
+   1703.2000   1475.5000     34.9400     -0.3700
+   1703.3000   1475.5000     34.9400     -0.3700
+   1703.4000   1475.5100     34.9400     -0.3700
+   1703.6000   1475.5100     34.9400     -0.3700
+   1703.7000   1475.5100     34.9400     -0.3700
+   1703.8000   1475.5100     34.9400     -0.3700
+   1703.9000   1475.5100     34.9400     -0.3700
+   1704.1000   1475.5200     34.9400     -0.3700
+   1704.2000   1475.5200     34.9400     -0.3700
+   1704.3000   1475.5200     34.9400     -0.3700
+   1704.4000   1475.5200     34.9400     -0.3700
+   1704.6000   1475.5200     34.9400     -0.3700
+   1704.7000   1475.5300     34.9400     -0.3700
+   1704.8000   1475.5300     34.9400     -0.3700
+   1704.9000   1475.5300     34.9400     -0.3700
+   1705.1000   1475.5300     34.9400     -0.3700
+   1705.2000   1475.5300     34.9400     -0.3700
+   1705.3000   1475.5400     34.9400     -0.3700
+   1705.4000   1475.5400     34.9400     -0.3700
+   1705.6000   1475.5400     34.9400     -0.3700
+   1705.7000   1475.5400     34.9400     -0.3700
+   1705.8000   1475.5400     34.9400     -0.3700
+   1705.9000   1475.5500     34.9400     -0.3700
+   1706.1000   1475.5500     34.9400     -0.3700
+   1706.2000   1475.5500     34.9400     -0.3700
+   1706.3000   1475.5500     34.9400     -0.3700
+   1706.4000   1475.5500     34.9400     -0.3700
+   1706.6000   1475.5600     34.9400     -0.3700
+   1706.7000   1475.5600     34.9400     -0.3700
+   1706.8000   1475.5600     34.9400     -0.3700
+   1706.9000   1475.5600     34.9400     -0.3700
+   1707.1000   1475.5600     34.9400     -0.3700
+   1707.2000   1475.5700     34.9400     -0.3700
+   1707.3000   1475.5700     34.9400     -0.3700
+   1707.4000   1475.5700     34.9400     -0.3700
+   1707.6000   1475.5700     34.9400     -0.3700
+   1707.7000   1475.5700     34.9400     -0.3700
+   1707.8000   1475.5800     34.9400     -0.3700
+   1707.9000   1475.5800     34.9400     -0.3700
+   1708.1000   1475.5800     34.9400     -0.3700
+   1708.2000   1475.5800     34.9400     -0.3700
+   1708.3000   1475.5800     34.9400     -0.3700
+   1708.4000   1475.5900     34.9400     -0.3700
+   1708.6000   1475.5900     34.9400     -0.3700
+   1708.7000   1475.5900     34.9400     -0.3700
+   1708.8000   1475.5900     34.9400     -0.3700
+   1708.9000   1475.5900     34.9400     -0.3700
+   1709.1000   1475.6000     34.9400     -0.3700
+   1709.2000   1475.6000     34.9400     -0.3700
+   1709.3000   1475.6000     34.9400     -0.3700
+   1709.4000   1475.6000     34.9400     -0.3700
+   1709.6000   1475.6000     34.9400     -0.3700
+   1709.7000   1475.6100     34.9400     -0.3700
+   1709.8000   1475.6100     34.9400     -0.3700
+   1709.9000   1475.6100     34.9400     -0.3700
+   1710.1000   1475.6100     34.9400     -0.3700
+   1710.2000   1475.6100     34.9400     -0.3700
+   1710.3000   1475.6200     34.9400     -0.3700
+   1710.4000   1475.6200     34.9400     -0.3700
+   1710.6000   1475.6200     34.9400     -0.3700
+   1710.7000   1475.6200     34.9400     -0.3700
+   1710.8000   1475.6200     34.9400     -0.3700
+   1710.9000   1475.6300     34.9400     -0.3700
+   1711.1000   1475.6300     34.9400     -0.3700
+   1711.2000   1475.6300     34.9400     -0.3700
+   1711.3000   1475.6300     34.9400     -0.3700
+   1711.4000   1475.6300     34.9400     -0.3700
+   1711.5000   1475.6400     34.9400     -0.3700
+   1711.7000   1475.6400     34.9400     -0.3700
+   1711.8000   1475.6400     34.9400     -0.3700
+   1711.9000   1475.6400     34.9400     -0.3700
+   1712.0000   1475.6400     34.9300     -0.3700
+   1712.2000   1475.6500     34.9300     -0.3700
+   1712.3000   1475.6500     34.9300     -0.3700
+   1712.4000   1475.6500     34.9300     -0.3700
+   1712.5000   1475.6500     34.9300     -0.3700
+   1712.7000   1475.6500     34.9300     -0.3700
+   1712.8000   1475.6600     34.9300     -0.3700
+   1712.9000   1475.6600     34.9300     -0.3700
+   1713.0000   1475.6600     34.9300     -0.3700
+   1713.2000   1475.6600     34.9300     -0.3700
+   1713.3000   1475.6600     34.9300     -0.3700
+   1713.4000   1475.6700     34.9300     -0.3700
+   1713.5000   1475.6700     34.9300     -0.3700
+   1713.7000   1475.6700     34.9300     -0.3700
+   1713.8000   1475.6700     34.9300     -0.3700
+   1713.9000   1475.6200     34.9300     -0.3800
+   1714.0000   1475.6800     34.9400     -0.3700
+   1714.2000   1475.6900     34.9400     -0.3700
+   1714.3000   1475.6800     34.9300     -0.3700
+   1714.4000   1475.6800     34.9300     -0.3700
+   1714.5000   1475.6300     34.9300     -0.3800
+   1714.7000   1475.6900     34.9400     -0.3700
+   1714.8000   1475.7000     34.9400     -0.3700
+   1714.9000   1475.6900     34.9300     -0.3700
+   1715.0000   1475.6900     34.9300     -0.3700
+   1715.2000   1475.6900     34.9300     -0.3700
+   1715.3000   1475.7000     34.9300     -0.3700
+   1715.4000   1475.7000     34.9300     -0.3700
+   1715.5000   1475.7000     34.9300     -0.3700
+   1715.7000   1475.7000     34.9300     -0.3700
+   1715.8000   1475.7000     34.9300     -0.3700
+   1715.9000   1475.7100     34.9300     -0.3700
+   1716.0000   1475.7100     34.9300     -0.3700
+   1716.2000   1475.7100     34.9300     -0.3700
+   1716.3000   1475.7100     34.9300     -0.3700
+   1716.4000   1475.7100     34.9300     -0.3700
+   1716.5000   1475.7200     34.9300     -0.3700
+   1716.7000   1475.7200     34.9300     -0.3700
+   1716.8000   1475.7200     34.9300     -0.3700
+   1716.9000   1475.7200     34.9300     -0.3700
+   1717.0000   1475.7200     34.9300     -0.3700
+   1717.2000   1475.7300     34.9300     -0.3700
+   1717.3000   1475.7300     34.9300     -0.3700
+   1717.4000   1475.7300     34.9300     -0.3700
+   1717.5000   1475.7300     34.9300     -0.3700
+   1717.7000   1475.7300     34.9300     -0.3700
+   1717.8000   1475.7400     34.9300     -0.3700
+   1717.9000   1475.7400     34.9300     -0.3700
+   1718.0000   1475.7400     34.9300     -0.3700
+   1718.2000   1475.7400     34.9300     -0.3700
+   1718.3000   1475.7400     34.9300     -0.3700
+   1718.4000   1475.7500     34.9300     -0.3700
+   1718.5000   1475.7500     34.9300     -0.3700
+   1718.7000   1475.7500     34.9300     -0.3700
+   1718.8000   1475.7500     34.9300     -0.3700
+   1718.9000   1475.7500     34.9300     -0.3700
+   1719.0000   1475.7600     34.9300     -0.3700
+   1719.1000   1475.7100     34.9300     -0.3800
+   1719.3000   1475.7700     34.9400     -0.3700
+   1719.4000   1475.7700     34.9400     -0.3700
+   1719.5000   1475.7600     34.9300     -0.3700
+   1719.6000   1475.7700     34.9300     -0.3700
+   1719.8000   1475.7200     34.9300     -0.3800
+   1719.9000   1475.7800     34.9400     -0.3700
+   1720.0000   1475.7800     34.9400     -0.3700
+   1720.1000   1475.7700     34.9300     -0.3700
+   1720.3000   1475.7800     34.9300     -0.3700
+   1720.4000   1475.7800     34.9300     -0.3700
+   1720.5000   1475.7800     34.9300     -0.3700
+   1720.6000   1475.7800     34.9300     -0.3700
+   1720.8000   1475.7800     34.9300     -0.3700
+   1720.9000   1475.7900     34.9300     -0.3700
+   1721.0000   1475.7400     34.9300     -0.3800
+   1721.1000   1475.8000     34.9400     -0.3700
+   1721.3000   1475.8000     34.9400     -0.3700
+   1721.4000   1475.7700     34.9500     -0.3800
+   1721.5000   1475.8000     34.9400     -0.3700
+   1721.6000   1475.8100     34.9400     -0.3700
+   1721.8000   1475.8000     34.9300     -0.3700
+   1721.9000   1475.8000     34.9300     -0.3700
+   1722.0000   1475.7500     34.9300     -0.3800
+   1722.1000   1475.8100     34.9400     -0.3700
+   1722.3000   1475.8200     34.9400     -0.3700
+   1722.4000   1475.8100     34.9300     -0.3700
+   1722.5000   1475.8100     34.9300     -0.3700
+   1722.6000   1475.7900     34.9500     -0.3800
+   1722.8000   1475.8200     34.9400     -0.3700
+   1722.9000   1475.7800     34.9400     -0.3800
+   1723.0000   1475.8300     34.9300     -0.3700
+   1723.1000   1475.8300     34.9300     -0.3700
+   1723.3000   1475.8200     34.9300     -0.3700
+   1723.4000   1475.8300     34.9300     -0.3700
+   1723.5000   1475.7800     34.9300     -0.3800
+   1723.6000   1475.8600     34.9500     -0.3700
+   1723.8000   1475.8400     34.9300     -0.3700
+   1723.9000   1475.8100     34.9500     -0.3800
+   1724.0000   1475.8400     34.9300     -0.3700
+   1724.1000   1475.8000     34.9300     -0.3800
+   1724.3000   1475.8500     34.9300     -0.3700
+   1724.4000   1475.8500     34.9300     -0.3700
+   1724.5000   1475.7900     34.9300     -0.3800
+   1724.6000   1475.8500     34.9300     -0.3700
+   1724.8000   1475.8100     34.9300     -0.3800
+   1724.9000   1475.8800     34.9500     -0.3700
+   1725.0000   1475.8100     34.9300     -0.3800
+   1725.1000   1475.8100     34.9300     -0.3800
+   1725.3000   1475.8700     34.9400     -0.3700
+   1725.4000   1475.8200     34.9300     -0.3800
+   1725.5000   1475.8200     34.9300     -0.3800
+   1725.6000   1475.9000     34.9600     -0.3700
+   1725.7000   1475.8500     34.9500     -0.3800
+   1725.9000   1475.8700     34.9300     -0.3700
+   1726.0000   1475.8300     34.9300     -0.3800
+   1726.1000   1475.8800     34.9300     -0.3700
+   1726.2000   1475.8300     34.9300     -0.3800
+   1726.4000   1475.8600     34.9500     -0.3800
+   1726.5000   1475.8900     34.9400     -0.3700
+   1726.6000   1475.8400     34.9300     -0.3800
+   1726.7000   1475.8900     34.9300     -0.3700
+   1726.9000   1475.9200     34.9500     -0.3700
+   1727.0000   1475.8600     34.9500     -0.3800
+   1727.1000   1475.8700     34.9500     -0.3800
+   1727.2000   1475.8500     34.9400     -0.3800
+   1727.4000   1475.8800     34.9600     -0.3800
+   1727.5000   1475.8900     34.9600     -0.3800
+   1727.6000   1475.8600     34.9400     -0.3800
+   1727.7000   1475.9100     34.9400     -0.3700
+   1727.9000   1475.8600     34.9300     -0.3800
+   1728.0000   1475.9300     34.9500     -0.3700
+   1728.1000   1475.9400     34.9500     -0.3700
+   1728.2000   1475.8800     34.9500     -0.3800
+   1728.4000   1475.8600     34.9300     -0.3800
+   1728.5000   1475.8700     34.9400     -0.3800
+   1728.6000   1475.9300     34.9400     -0.3700
+   1728.7000   1475.9000     34.9500     -0.3800
+   1728.9000   1475.8700     34.9300     -0.3800
+   1729.0000   1475.8800     34.9400     -0.3800
+   1729.1000   1475.8800     34.9400     -0.3800
+   1729.2000   1475.9100     34.9600     -0.3800
+   1729.4000   1475.9200     34.9600     -0.3800
+   1729.5000   1475.9200     34.9600     -0.3800
+   1729.6000   1475.9200     34.9600     -0.3800
+   1729.7000   1475.8900     34.9400     -0.3800
+   1729.9000   1475.9200     34.9600     -0.3800
+   1730.0000   1475.9700     34.9600     -0.3700
+   1730.1000   1475.9200     34.9500     -0.3800
+   1730.2000   1475.8900     34.9300     -0.3800
+   1730.4000   1475.9000     34.9400     -0.3800
+   1730.5000   1475.9300     34.9600     -0.3800
+   1730.6000   1475.9400     34.9600     -0.3800
+   1730.7000   1475.9400     34.9600     -0.3800
+   1730.9000   1475.9100     34.9400     -0.3800
+   1731.0000   1475.9100     34.9400     -0.3800
+   1731.1000   1475.9200     34.9400     -0.3800
+   1731.2000   1475.9500     34.9600     -0.3800
+   1731.3000   1475.9200     34.9400     -0.3800
+   1731.5000   1475.9200     34.9400     -0.3800
+   1731.6000   1475.9200     34.9400     -0.3800
+   1731.7000   1475.9500     34.9600     -0.3800
+   1731.8000   1475.9300     34.9400     -0.3800
+   1732.0000   1475.9300     34.9400     -0.3800
+   1732.1000   1475.9300     34.9400     -0.3800
+   1732.2000   1475.9300     34.9400     -0.3800
+   1732.3000   1475.9600     34.9600     -0.3800
+   1732.5000   1476.0100     34.9600     -0.3700
+   1732.6000   1475.9300     34.9300     -0.3800
+   1732.7000   1475.9300     34.9300     -0.3800
+   1732.8000   1475.9400     34.9400     -0.3800
+   1733.0000   1475.9700     34.9600     -0.3800
+   1733.1000   1475.9800     34.9600     -0.3800
+   1733.2000   1475.9800     34.9600     -0.3800
+   1733.3000   1475.9800     34.9500     -0.3800
+   1733.5000   1475.9500     34.9400     -0.3800
+   1733.6000   1475.9800     34.9500     -0.3800
+   1733.7000   1475.9600     34.9400     -0.3800
+   1733.8000   1475.9900     34.9500     -0.3800
+   1734.0000   1475.9900     34.9500     -0.3800
+   1734.1000   1475.9600     34.9300     -0.3800
+   1734.2000   1475.9900     34.9500     -0.3800
+   1734.3000   1476.0000     34.9500     -0.3800
+   1734.5000   1476.0000     34.9500     -0.3800
+   1734.6000   1475.9700     34.9300     -0.3800
+   1734.7000   1475.9700     34.9300     -0.3800
+   1734.8000   1475.9800     34.9300     -0.3800
+   1735.0000   1476.0100     34.9500     -0.3800
+   1735.1000   1476.0100     34.9500     -0.3800
+   1735.2000   1475.9800     34.9300     -0.3800
+   1735.3000   1475.9800     34.9300     -0.3800
+   1735.5000   1476.0100     34.9500     -0.3800
+   1735.6000   1476.0200     34.9500     -0.3800
+   1735.7000   1475.9900     34.9300     -0.3800
+   1735.8000   1475.9900     34.9300     -0.3800
+   1736.0000   1475.9900     34.9300     -0.3800
+   1736.1000   1476.0200     34.9500     -0.3800
+   1736.2000   1476.0300     34.9500     -0.3800
+   1736.3000   1476.0300     34.9500     -0.3800
+   1736.5000   1476.0300     34.9500     -0.3800
+   1736.6000   1476.0300     34.9500     -0.3800
+   1736.7000   1476.0300     34.9500     -0.3800
+   1736.8000   1476.0400     34.9500     -0.3800
+   1736.9000   1476.0100     34.9300     -0.3800
+   1737.1000   1476.0400     34.9500     -0.3800
+   1737.2000   1476.0100     34.9300     -0.3800
+   1737.3000   1476.0400     34.9500     -0.3800
+   1737.4000   1476.0500     34.9500     -0.3800
+   1737.6000   1476.0500     34.9500     -0.3800
+   1737.7000   1476.0500     34.9500     -0.3800
+   1737.8000   1476.0500     34.9500     -0.3800
+   1737.9000   1476.0500     34.9500     -0.3800
+   1738.1000   1476.0300     34.9300     -0.3800
+   1738.2000   1476.0600     34.9500     -0.3800
+   1738.3000   1476.0600     34.9500     -0.3800
+   1738.4000   1476.0600     34.9500     -0.3800
+   1738.6000   1476.0600     34.9500     -0.3800
+   1738.7000   1476.0700     34.9500     -0.3800
+   1738.8000   1476.0700     34.9500     -0.3800
+   1738.9000   1476.0700     34.9500     -0.3800
+   1739.1000   1476.0700     34.9500     -0.3800
+   1739.2000   1476.0700     34.9500     -0.3800
+   1739.3000   1476.0800     34.9500     -0.3800
+   1739.4000   1476.0800     34.9500     -0.3800
+   1739.6000   1476.0800     34.9500     -0.3800
+   1739.7000   1476.0800     34.9500     -0.3800
+   1739.8000   1476.0800     34.9500     -0.3800
+   1739.9000   1476.0900     34.9500     -0.3800
+   1740.1000   1476.0900     34.9500     -0.3800
+   1740.2000   1476.0900     34.9500     -0.3800
+   1740.3000   1476.0900     34.9500     -0.3800
+   1740.4000   1476.0900     34.9500     -0.3800
+   1740.6000   1476.1000     34.9500     -0.3800
+   1740.7000   1476.1000     34.9500     -0.3800
+   1740.8000   1476.1000     34.9500     -0.3800
+   1740.9000   1476.1000     34.9500     -0.3800
+   1741.1000   1476.1000     34.9500     -0.3800
+   1741.2000   1476.1100     34.9500     -0.3800
+   1741.3000   1476.0800     34.9300     -0.3800
+   1741.4000   1476.0800     34.9300     -0.3800
+   1741.6000   1476.0800     34.9300     -0.3800
+   1741.7000   1476.1100     34.9500     -0.3800
+   1741.8000   1476.1200     34.9500     -0.3800
+   1741.9000   1476.1200     34.9500     -0.3800
+   1742.0000   1476.1200     34.9500     -0.3800
+   1742.2000   1476.1200     34.9500     -0.3800
+   1742.3000   1476.1200     34.9500     -0.3800
+   1742.4000   1476.1300     34.9500     -0.3800
+   1742.5000   1476.1300     34.9500     -0.3800
+   1742.7000   1476.1300     34.9500     -0.3800
+   1742.8000   1476.1300     34.9500     -0.3800
+   1742.9000   1476.1300     34.9500     -0.3800
+   1743.0000   1476.1400     34.9500     -0.3800
+   1743.2000   1476.1400     34.9500     -0.3800
+   1743.3000   1476.1400     34.9500     -0.3800
+   1743.4000   1476.1400     34.9500     -0.3800
+   1743.5000   1476.1400     34.9500     -0.3800
+   1743.7000   1476.1500     34.9500     -0.3800
+   1743.8000   1476.1500     34.9500     -0.3800
+   1743.9000   1476.1500     34.9500     -0.3800
+   1744.0000   1476.1500     34.9500     -0.3800
+   1744.2000   1476.1500     34.9500     -0.3800
+   1744.3000   1476.1600     34.9500     -0.3800
+   1744.4000   1476.1600     34.9500     -0.3800
+   1744.5000   1476.1600     34.9500     -0.3800
+   1744.7000   1476.1600     34.9500     -0.3800
+   1744.8000   1476.1600     34.9500     -0.3800
+   1744.9000   1476.1700     34.9500     -0.3800
+   1745.0000   1476.1700     34.9500     -0.3800
+   1745.2000   1476.1700     34.9500     -0.3800
+   1745.3000   1476.1700     34.9500     -0.3800
+   1745.4000   1476.1700     34.9500     -0.3800
+   1745.5000   1476.1800     34.9500     -0.3800
+   1745.7000   1476.1800     34.9500     -0.3800
+   1745.8000   1476.1800     34.9500     -0.3800
+   1745.9000   1476.1800     34.9500     -0.3800
+   1746.0000   1476.1800     34.9500     -0.3800
+   1746.2000   1476.1900     34.9500     -0.3800
+   1746.3000   1476.1900     34.9500     -0.3800
+   1746.4000   1476.1900     34.9500     -0.3800
+   1746.5000   1476.1900     34.9500     -0.3800
+   1746.6000   1476.1900     34.9500     -0.3800
+   1746.8000   1476.1900     34.9500     -0.3800
+   1746.9000   1476.2000     34.9500     -0.3800
+   1747.0000   1476.2000     34.9500     -0.3800
+   1747.1000   1476.2000     34.9500     -0.3800
+   1747.3000   1476.2000     34.9500     -0.3800
+   1747.4000   1476.2000     34.9500     -0.3800
+   1747.5000   1476.2100     34.9500     -0.3800
+   1747.6000   1476.2100     34.9500     -0.3800
+   1747.8000   1476.2100     34.9500     -0.3800
+   1747.9000   1476.2100     34.9500     -0.3800
+   1748.0000   1476.2100     34.9500     -0.3800
+   1748.1000   1476.2200     34.9500     -0.3800
+   1748.3000   1476.2200     34.9500     -0.3800
+   1748.4000   1476.2200     34.9500     -0.3800
+   1748.5000   1476.2200     34.9500     -0.3800
+   1748.6000   1476.2200     34.9500     -0.3800
+   1748.8000   1476.2300     34.9500     -0.3800
+   1748.9000   1476.2300     34.9500     -0.3800
+   1749.0000   1476.2300     34.9500     -0.3800
+   1749.1000   1476.2300     34.9500     -0.3800
+   1749.3000   1476.2300     34.9500     -0.3800
+   1749.4000   1476.2400     34.9500     -0.3800
+   1749.5000   1476.2400     34.9500     -0.3800
+   1749.6000   1476.2400     34.9500     -0.3800
+   1749.8000   1476.2400     34.9500     -0.3800
+   1749.9000   1476.2400     34.9500     -0.3800
+   1750.0000   1476.2500     34.9500     -0.3800
+   1750.1000   1476.2500     34.9500     -0.3800
+   1750.3000   1476.2500     34.9500     -0.3800
+   1750.4000   1476.2500     34.9500     -0.3800
+   1750.5000   1476.2500     34.9500     -0.3800
+   1750.6000   1476.2600     34.9500     -0.3800
+   1750.8000   1476.2600     34.9500     -0.3800
+   1750.9000   1476.2600     34.9500     -0.3800
+   1751.0000   1476.2600     34.9500     -0.3800
+   1751.1000   1476.2600     34.9500     -0.3800
+   1751.2000   1476.2700     34.9500     -0.3800
+   1751.4000   1476.2700     34.9500     -0.3800
+   1751.5000   1476.2700     34.9500     -0.3800
+   1751.6000   1476.2700     34.9500     -0.3800
+   1751.7000   1476.2700     34.9400     -0.3800
+   1751.9000   1476.2800     34.9400     -0.3800
+   1752.0000   1476.2800     34.9400     -0.3800
+   1752.1000   1476.2800     34.9400     -0.3800
+   1752.2000   1476.2800     34.9400     -0.3800
+   1752.4000   1476.2800     34.9400     -0.3800
+   1752.5000   1476.2900     34.9400     -0.3800
+   1752.6000   1476.2900     34.9400     -0.3800
+   1752.7000   1476.2900     34.9400     -0.3800
+   1752.9000   1476.2900     34.9400     -0.3800
+   1753.0000   1476.2900     34.9400     -0.3800
+   1753.1000   1476.3000     34.9400     -0.3800
+   1753.2000   1476.3000     34.9400     -0.3800
+   1753.4000   1476.3000     34.9400     -0.3800
+   1753.5000   1476.3000     34.9400     -0.3800
+   1753.6000   1476.3000     34.9400     -0.3800
+   1753.7000   1476.3100     34.9400     -0.3800
+   1753.9000   1476.3100     34.9400     -0.3800
+   1754.0000   1476.3100     34.9400     -0.3800
+   1754.1000   1476.3100     34.9400     -0.3800
+   1754.2000   1476.3100     34.9400     -0.3800
+   1754.4000   1476.3200     34.9400     -0.3800
+   1754.5000   1476.3200     34.9400     -0.3800
+   1754.6000   1476.3200     34.9400     -0.3800
+   1754.7000   1476.3200     34.9400     -0.3800
+   1754.9000   1476.3200     34.9400     -0.3800
+   1755.0000   1476.3300     34.9400     -0.3800
+   1755.1000   1476.3300     34.9400     -0.3800
+   1755.2000   1476.3300     34.9400     -0.3800
+   1755.3000   1476.3300     34.9400     -0.3800
+   1755.5000   1476.3300     34.9400     -0.3800
+   1755.6000   1476.3400     34.9400     -0.3800
+   1755.7000   1476.3400     34.9400     -0.3800
+   1755.8000   1476.3400     34.9400     -0.3800
+   1756.0000   1476.3400     34.9400     -0.3800
+   1756.1000   1476.3400     34.9400     -0.3800
+   1756.2000   1476.3500     34.9400     -0.3800
+   1756.3000   1476.3500     34.9400     -0.3800
+   1756.5000   1476.3500     34.9400     -0.3800
+   1756.6000   1476.3500     34.9400     -0.3800
+   1756.7000   1476.3500     34.9400     -0.3800
+   1756.8000   1476.3600     34.9400     -0.3800
+   1757.0000   1476.3600     34.9400     -0.3800
+   1757.1000   1476.3600     34.9400     -0.3800
+   1757.2000   1476.3600     34.9400     -0.3800
+   1757.3000   1476.3600     34.9400     -0.3800
+   1757.5000   1476.3700     34.9400     -0.3800
+   1757.6000   1476.3700     34.9400     -0.3800
+   1757.7000   1476.3700     34.9400     -0.3800
+   1757.8000   1476.3700     34.9400     -0.3800
+   1758.0000   1476.3700     34.9400     -0.3800
+   1758.1000   1476.3800     34.9400     -0.3800
+   1758.2000   1476.3800     34.9400     -0.3800
+   1758.3000   1476.3800     34.9400     -0.3800
+   1758.5000   1476.3800     34.9400     -0.3800
+   1758.6000   1476.3800     34.9400     -0.3800
+   1758.7000   1476.3900     34.9400     -0.3800
+   1758.8000   1476.3900     34.9400     -0.3800
+   1759.0000   1476.3900     34.9400     -0.3800
+   1759.1000   1476.3900     34.9400     -0.3800
+   1759.2000   1476.3900     34.9400     -0.3800
+   1759.3000   1476.4000     34.9400     -0.3800
+   1759.4000   1476.4000     34.9400     -0.3800
+   1759.6000   1476.4000     34.9400     -0.3800
+   1759.7000   1476.4000     34.9400     -0.3800
+   1759.8000   1476.4000     34.9400     -0.3800
+   1759.9000   1476.4100     34.9400     -0.3800
+   1760.1000   1476.4100     34.9400     -0.3800
+   1760.2000   1476.4100     34.9400     -0.3800
+   1760.3000   1476.4100     34.9400     -0.3800
+   1760.4000   1476.4100     34.9400     -0.3800
+   1760.6000   1476.4200     34.9400     -0.3800
+   1760.7000   1476.4200     34.9400     -0.3800
+   1760.8000   1476.4200     34.9400     -0.3800
+   1760.9000   1476.4200     34.9400     -0.3800
+   1761.1000   1476.4200     34.9400     -0.3800
+   1761.2000   1476.4300     34.9400     -0.3800
+   1761.3000   1476.4300     34.9400     -0.3800
+   1761.4000   1476.4300     34.9400     -0.3800
+   1761.6000   1476.4300     34.9400     -0.3800
+   1761.7000   1476.4300     34.9400     -0.3800
+   1761.8000   1476.4400     34.9400     -0.3800
+   1761.9000   1476.4400     34.9400     -0.3800
+   1762.1000   1476.4400     34.9400     -0.3800
+   1762.2000   1476.4400     34.9400     -0.3800
+   1762.3000   1476.4400     34.9400     -0.3800
+   1762.4000   1476.4500     34.9400     -0.3800
+   1762.6000   1476.4500     34.9400     -0.3800
+   1762.7000   1476.4500     34.9400     -0.3800
+   1762.8000   1476.4500     34.9400     -0.3800
+   1762.9000   1476.4500     34.9400     -0.3800
+   1763.1000   1476.4600     34.9400     -0.3800
+   1763.2000   1476.4600     34.9400     -0.3800
+   1763.3000   1476.4600     34.9400     -0.3800
+   1763.4000   1476.4600     34.9400     -0.3800
+   1763.5000   1476.4600     34.9400     -0.3800
+   1763.7000   1476.4700     34.9400     -0.3800
+   1763.8000   1476.4700     34.9400     -0.3800
+   1763.9000   1476.4700     34.9400     -0.3800
+   1764.0000   1476.4700     34.9400     -0.3800
+   1764.2000   1476.4700     34.9400     -0.3800
+   1764.3000   1476.4800     34.9400     -0.3800
+   1764.4000   1476.4800     34.9400     -0.3800
+   1764.5000   1476.4800     34.9400     -0.3800
+   1764.7000   1476.4800     34.9400     -0.3800
+   1764.8000   1476.4800     34.9400     -0.3800
+   1764.9000   1476.4900     34.9400     -0.3800
+   1765.0000   1476.4900     34.9400     -0.3800
+   1765.2000   1476.4900     34.9400     -0.3800
+   1765.3000   1476.4900     34.9400     -0.3800
+   1765.4000   1476.4900     34.9400     -0.3800
+   1765.5000   1476.5000     34.9400     -0.3800
+   1765.7000   1476.5000     34.9400     -0.3800
+   1765.8000   1476.5000     34.9400     -0.3800
+   1765.9000   1476.5000     34.9400     -0.3800
+   1766.0000   1476.5000     34.9400     -0.3800
+   1766.2000   1476.5100     34.9400     -0.3800
+   1766.3000   1476.5100     34.9400     -0.3800
+   1766.4000   1476.5100     34.9400     -0.3800
+   1766.5000   1476.5100     34.9400     -0.3800
+   1766.7000   1476.5100     34.9400     -0.3800
+   1766.8000   1476.4700     34.9400     -0.3900
+   1766.9000   1476.5300     34.9400     -0.3800
+   1767.0000   1476.5300     34.9400     -0.3800
+   1767.1000   1476.5200     34.9400     -0.3800
+   1767.3000   1476.5200     34.9400     -0.3800
+   1767.4000   1476.5300     34.9400     -0.3800
+   1767.5000   1476.5300     34.9400     -0.3800
+   1767.6000   1476.5300     34.9400     -0.3800
+   1767.8000   1476.5300     34.9400     -0.3800
+   1767.9000   1476.5300     34.9400     -0.3800
+   1768.0000   1476.5400     34.9400     -0.3800
+   1768.1000   1476.5400     34.9400     -0.3800
+   1768.3000   1476.5400     34.9400     -0.3800
+   1768.4000   1476.5400     34.9400     -0.3800
+   1768.5000   1476.5400     34.9400     -0.3800
+   1768.6000   1476.5500     34.9400     -0.3800
+   1768.8000   1476.5500     34.9400     -0.3800
+   1768.9000   1476.5500     34.9400     -0.3800
+   1769.0000   1476.5500     34.9400     -0.3800
+   1769.1000   1476.5500     34.9400     -0.3800
+   1769.3000   1476.5600     34.9400     -0.3800
+   1769.4000   1476.5600     34.9400     -0.3800
+   1769.5000   1476.5900     34.9500     -0.3800
+   1769.6000   1476.5600     34.9400     -0.3800
+   1769.8000   1476.5600     34.9400     -0.3800
+   1769.9000   1476.5200     34.9400     -0.3900
+   1770.0000   1476.5800     34.9400     -0.3800
+   1770.1000   1476.5800     34.9400     -0.3800
+   1770.3000   1476.5700     34.9300     -0.3800
+   1770.4000   1476.5700     34.9300     -0.3800
+   1770.5000   1476.5800     34.9300     -0.3800
+   1770.6000   1476.5800     34.9300     -0.3800
+   1770.8000   1476.5300     34.9300     -0.3900
+   1770.9000   1476.5900     34.9400     -0.3800
+   1771.0000   1476.5900     34.9400     -0.3800
+   1771.1000   1476.5400     34.9300     -0.3900
+   1771.2000   1476.6000     34.9400     -0.3800
+   1771.4000   1476.6000     34.9400     -0.3800
+   1771.5000   1476.5900     34.9300     -0.3800
+   1771.6000   1476.5900     34.9300     -0.3800
+   1771.7000   1476.6000     34.9300     -0.3800
+   1771.9000   1476.6000     34.9300     -0.3800
+   1772.0000   1476.6000     34.9300     -0.3800
+   1772.1000   1476.6000     34.9300     -0.3800
+   1772.2000   1476.6000     34.9300     -0.3800
+   1772.4000   1476.6100     34.9300     -0.3800
+   1772.5000   1476.6100     34.9300     -0.3800
+   1772.6000   1476.5900     34.9500     -0.3900
+   1772.7000   1476.6200     34.9400     -0.3800
+   1772.9000   1476.6200     34.9400     -0.3800
+   1773.0000   1476.5700     34.9300     -0.3900
+   1773.1000   1476.6300     34.9400     -0.3800
+   1773.2000   1476.6300     34.9400     -0.3800
+   1773.4000   1476.6200     34.9300     -0.3800
+   1773.5000   1476.6200     34.9300     -0.3800
+   1773.6000   1476.6300     34.9300     -0.3800
+   1773.7000   1476.6300     34.9300     -0.3800
+   1773.9000   1476.6300     34.9300     -0.3800
+   1774.0000   1476.6300     34.9300     -0.3800
+   1774.1000   1476.6300     34.9300     -0.3800
+   1774.2000   1476.6400     34.9300     -0.3800
+   1774.3000   1476.6400     34.9300     -0.3800
+   1774.5000   1476.6200     34.9500     -0.3900
+   1774.6000   1476.6800     34.9600     -0.3800
+   1774.7000   1476.6500     34.9400     -0.3800
+   1774.8000   1476.6200     34.9500     -0.3900
+   1775.0000   1476.6600     34.9400     -0.3800
+   1775.1000   1476.6800     34.9600     -0.3800
+   1775.2000   1476.6500     34.9300     -0.3800
+   1775.3000   1476.6500     34.9300     -0.3800
+   1775.5000   1476.6100     34.9300     -0.3900
+   1775.6000   1476.6700     34.9400     -0.3800
+   1775.7000   1476.6200     34.9400     -0.3900
+   1775.8000   1476.6700     34.9400     -0.3800
+   1776.0000   1476.7000     34.9600     -0.3800
+   1776.1000   1476.6200     34.9300     -0.3900
+   1776.2000   1476.6800     34.9400     -0.3800
+   1776.3000   1476.6800     34.9400     -0.3800
+   1776.5000   1476.6700     34.9300     -0.3800
+   1776.6000   1476.6700     34.9300     -0.3800
+   1776.7000   1476.6300     34.9300     -0.3900
+   1776.8000   1476.6900     34.9400     -0.3800
+   1777.0000   1476.6900     34.9400     -0.3800
+   1777.1000   1476.6600     34.9500     -0.3900
+   1777.2000   1476.6900     34.9400     -0.3800
+   1777.3000   1476.6400     34.9400     -0.3900
+   1777.5000   1476.7000     34.9400     -0.3800
+   1777.6000   1476.6800     34.9600     -0.3900
+   1777.7000   1476.7300     34.9600     -0.3800
+   1777.8000   1476.7300     34.9600     -0.3800
+   1777.9000   1476.6500     34.9300     -0.3900
+   1778.1000   1476.7300     34.9600     -0.3800
+   1778.2000   1476.6600     34.9400     -0.3900
+   1778.3000   1476.7400     34.9600     -0.3800
+   1778.4000   1476.7100     34.9400     -0.3800
+   1778.6000   1476.6600     34.9300     -0.3900
+   1778.7000   1476.7200     34.9400     -0.3800
+   1778.8000   1476.7000     34.9600     -0.3900
+   1778.9000   1476.7500     34.9600     -0.3800
+   1779.1000   1476.7500     34.9600     -0.3800
+   1779.2000   1476.6700     34.9300     -0.3900
+   1779.3000   1476.7300     34.9400     -0.3800
+   1779.4000   1476.7100     34.9600     -0.3900
+   1779.6000   1476.7300     34.9400     -0.3800
+   1779.7000   1476.7300     34.9400     -0.3800
+   1779.8000   1476.6800     34.9300     -0.3900
+   1779.9000   1476.7600     34.9600     -0.3800
+   1780.1000   1476.6900     34.9400     -0.3900
+   1780.2000   1476.7700     34.9600     -0.3800
+   1780.3000   1476.7400     34.9400     -0.3800
+   1780.4000   1476.6900     34.9300     -0.3900
+   1780.6000   1476.7500     34.9400     -0.3800
+   1780.7000   1476.7300     34.9500     -0.3900
+   1780.8000   1476.7500     34.9400     -0.3800
+   1780.9000   1476.7800     34.9500     -0.3800
+   1781.0000   1476.7000     34.9300     -0.3900
+   1781.2000   1476.7600     34.9300     -0.3800
+   1781.3000   1476.7400     34.9500     -0.3900
+   1781.4000   1476.7400     34.9500     -0.3900
+   1781.5000   1476.7700     34.9400     -0.3800
+   1781.7000   1476.7400     34.9500     -0.3900
+   1781.8000   1476.7700     34.9300     -0.3800
+   1781.9000   1476.7500     34.9500     -0.3900
+   1782.0000   1476.8000     34.9500     -0.3800
+   1782.2000   1476.8000     34.9500     -0.3800
+   1782.3000   1476.7200     34.9300     -0.3900
+   1782.4000   1476.8000     34.9500     -0.3800
+   1782.5000   1476.7300     34.9300     -0.3900
+   1782.7000   1476.7600     34.9500     -0.3900
+   1782.8000   1476.7400     34.9400     -0.3900
+   1782.9000   1476.7400     34.9400     -0.3900
+   1783.0000   1476.7700     34.9600     -0.3900
+   1783.2000   1476.7700     34.9600     -0.3900
+   1783.3000   1476.8200     34.9600     -0.3800
+   1783.4000   1476.8200     34.9500     -0.3800
+   1783.5000   1476.7400     34.9300     -0.3900
+   1783.7000   1476.8200     34.9500     -0.3800
+   1783.8000   1476.7500     34.9300     -0.3900
+   1783.9000   1476.8300     34.9500     -0.3800
+   1784.0000   1476.8000     34.9300     -0.3800
+   1784.2000   1476.7700     34.9500     -0.3900
+   1784.3000   1476.7600     34.9300     -0.3900
+   1784.4000   1476.7900     34.9600     -0.3900
+   1784.5000   1476.8000     34.9600     -0.3900
+   1784.6000   1476.8500     34.9600     -0.3800
+   1784.8000   1476.7900     34.9500     -0.3900
+   1784.9000   1476.7700     34.9300     -0.3900
+   1785.0000   1476.8000     34.9600     -0.3900
+   1785.1000   1476.8100     34.9600     -0.3900
+   1785.3000   1476.8600     34.9600     -0.3800
+   1785.4000   1476.8000     34.9500     -0.3900
+   1785.5000   1476.8300     34.9300     -0.3800
+   1785.6000   1476.8000     34.9500     -0.3900
+   1785.8000   1476.8100     34.9500     -0.3900
+   1785.9000   1476.8700     34.9600     -0.3800
+   1786.0000   1476.8100     34.9500     -0.3900
+   1786.1000   1476.7900     34.9300     -0.3900
+   1786.3000   1476.8200     34.9600     -0.3900
+   1786.4000   1476.8700     34.9600     -0.3800
+   1786.5000   1476.8200     34.9500     -0.3900
+   1786.6000   1476.8200     34.9500     -0.3900
+   1786.8000   1476.8500     34.9400     -0.3800
+   1786.9000   1476.8000     34.9300     -0.3900
+   1787.0000   1476.8300     34.9500     -0.3900
+   1787.1000   1476.8900     34.9600     -0.3800
+   1787.3000   1476.8300     34.9500     -0.3900
+   1787.4000   1476.8100     34.9300     -0.3900
+   1787.5000   1476.8400     34.9600     -0.3900
+   1787.6000   1476.8900     34.9600     -0.3800
+   1787.7000   1476.8400     34.9500     -0.3900
+   1787.9000   1476.8400     34.9500     -0.3900
+   1788.0000   1476.8200     34.9400     -0.3900
+   1788.1000   1476.8500     34.9600     -0.3900
+   1788.2000   1476.8500     34.9600     -0.3900
+   1788.4000   1476.9100     34.9600     -0.3800
+   1788.5000   1476.8500     34.9500     -0.3900
+   1788.6000   1476.8300     34.9300     -0.3900
+   1788.7000   1476.8600     34.9600     -0.3900
+   1788.9000   1476.8600     34.9600     -0.3900
+   1789.0000   1476.8700     34.9600     -0.3900
+   1789.1000   1476.8700     34.9600     -0.3900
+   1789.2000   1476.8700     34.9600     -0.3900
+   1789.4000   1476.8700     34.9600     -0.3900
+   1789.5000   1476.8700     34.9600     -0.3900
+   1789.6000   1476.8800     34.9600     -0.3900
+   1789.7000   1476.8500     34.9400     -0.3900
+   1789.9000   1476.8500     34.9400     -0.3900
+   1790.0000   1476.8800     34.9600     -0.3900
+   1790.1000   1476.8800     34.9600     -0.3900
+   1790.2000   1476.8900     34.9600     -0.3900
+   1790.4000   1476.8900     34.9600     -0.3900
+   1790.5000   1476.8900     34.9600     -0.3900
+   1790.6000   1476.8700     34.9400     -0.3900
+   1790.7000   1476.8900     34.9600     -0.3900
+   1790.8000   1476.9000     34.9600     -0.3900
+   1791.0000   1476.9000     34.9600     -0.3900
+   1791.1000   1476.9000     34.9600     -0.3900
+   1791.2000   1476.8800     34.9400     -0.3900
+   1791.3000   1476.9000     34.9600     -0.3900
+   1791.5000   1476.9100     34.9600     -0.3900
+   1791.6000   1476.9100     34.9500     -0.3900
+   1791.7000   1476.8800     34.9400     -0.3900
+   1791.8000   1476.9100     34.9500     -0.3900
+   1792.0000   1476.9100     34.9500     -0.3900
+   1792.1000   1476.9200     34.9500     -0.3900
+   1792.2000   1476.9200     34.9500     -0.3900
+   1792.3000   1476.8900     34.9300     -0.3900
+   1792.5000   1476.9200     34.9500     -0.3900
+   1792.6000   1476.9200     34.9500     -0.3900
+   1792.7000   1476.9300     34.9500     -0.3900
+   1792.8000   1476.9300     34.9500     -0.3900
+   1793.0000   1476.9300     34.9500     -0.3900
+   1793.1000   1476.9300     34.9500     -0.3900
+   1793.2000   1476.9300     34.9500     -0.3900
+   1793.3000   1476.9400     34.9500     -0.3900
+   1793.5000   1476.9400     34.9500     -0.3900
+   1793.6000   1476.9400     34.9500     -0.3900
+   1793.7000   1476.9400     34.9500     -0.3900
+   1793.8000   1476.9400     34.9500     -0.3900
+   1793.9000   1476.9500     34.9500     -0.3900
+   1794.1000   1476.9500     34.9500     -0.3900
+   1794.2000   1476.9500     34.9500     -0.3900
+   1794.3000   1476.9500     34.9500     -0.3900
+   1794.4000   1476.9500     34.9500     -0.3900
+   1794.6000   1476.9600     34.9500     -0.3900
+   1794.7000   1476.9600     34.9500     -0.3900
+   1794.8000   1476.9600     34.9500     -0.3900
+   1794.9000   1476.9600     34.9500     -0.3900
+   1795.1000   1476.9600     34.9500     -0.3900
+   1795.2000   1476.9700     34.9500     -0.3900
+   1795.3000   1476.9700     34.9500     -0.3900
+   1795.4000   1476.9700     34.9500     -0.3900
+   1795.6000   1476.9700     34.9500     -0.3900
+   1795.7000   1476.9700     34.9500     -0.3900
+   1795.8000   1476.9800     34.9500     -0.3900
+   1795.9000   1476.9800     34.9500     -0.3900
+   1796.1000   1476.9800     34.9500     -0.3900
+   1796.2000   1476.9800     34.9500     -0.3900
+   1796.3000   1476.9800     34.9500     -0.3900
+   1796.4000   1476.9900     34.9500     -0.3900
+   1796.5000   1476.9900     34.9500     -0.3900
+   1796.7000   1476.9900     34.9500     -0.3900
+   1796.8000   1476.9700     34.9300     -0.3900
+   1796.9000   1476.9900     34.9500     -0.3900
+   1797.0000   1477.0000     34.9500     -0.3900
+   1797.2000   1477.0000     34.9500     -0.3900
+   1797.3000   1477.0000     34.9500     -0.3900
+   1797.4000   1477.0000     34.9500     -0.3900
+   1797.5000   1477.0000     34.9500     -0.3900
+   1797.7000   1477.0100     34.9500     -0.3900
+   1797.8000   1477.0100     34.9500     -0.3900
+   1797.9000   1477.0100     34.9500     -0.3900
+   1798.0000   1477.0100     34.9500     -0.3900
+   1798.2000   1477.0100     34.9500     -0.3900
+   1798.3000   1477.0200     34.9500     -0.3900
+   1798.4000   1477.0200     34.9500     -0.3900
+   1798.5000   1477.0200     34.9500     -0.3900
+   1798.7000   1477.0200     34.9500     -0.3900
+   1798.8000   1477.0200     34.9500     -0.3900
+   1798.9000   1477.0300     34.9500     -0.3900
+   1799.0000   1477.0300     34.9500     -0.3900
+   1799.2000   1477.0000     34.9300     -0.3900
+   1799.3000   1477.0300     34.9500     -0.3900
+   1799.4000   1477.0300     34.9500     -0.3900
+   1799.5000   1477.0400     34.9500     -0.3900
+   1799.6000   1477.0400     34.9500     -0.3900
+   1799.8000   1477.0400     34.9500     -0.3900
+   1799.9000   1477.0400     34.9500     -0.3900
+   1800.0000   1477.0400     34.9500     -0.3900
+   1800.1000   1477.0500     34.9500     -0.3900
+   1800.3000   1477.0500     34.9500     -0.3900
+   1800.4000   1477.0500     34.9500     -0.3900
+   1800.5000   1477.0500     34.9500     -0.3900
+   1800.6000   1477.0500     34.9500     -0.3900
+   1800.8000   1477.0600     34.9500     -0.3900
+   1800.9000   1477.0600     34.9500     -0.3900
+   1801.0000   1477.0600     34.9500     -0.3900
+   1801.1000   1477.0600     34.9500     -0.3900
+   1801.3000   1477.0600     34.9500     -0.3900
+   1801.4000   1477.0700     34.9500     -0.3900
+   1801.5000   1477.0700     34.9500     -0.3900
+   1801.6000   1477.0700     34.9500     -0.3900
+   1801.8000   1477.0700     34.9500     -0.3900
+   1801.9000   1477.0700     34.9500     -0.3900
+   1802.0000   1477.0800     34.9500     -0.3900
+   1802.1000   1477.0800     34.9500     -0.3900
+   1802.2000   1477.0800     34.9500     -0.3900
+   1802.4000   1477.0800     34.9500     -0.3900
+   1802.5000   1477.0800     34.9500     -0.3900
+   1802.6000   1477.0900     34.9500     -0.3900
+   1802.7000   1477.0900     34.9500     -0.3900
+   1802.9000   1477.0900     34.9500     -0.3900
+   1803.0000   1477.0900     34.9500     -0.3900
+   1803.1000   1477.0900     34.9500     -0.3900
+   1803.2000   1477.1000     34.9500     -0.3900
+   1803.4000   1477.1000     34.9500     -0.3900
+   1803.5000   1477.1000     34.9500     -0.3900
+   1803.6000   1477.1000     34.9500     -0.3900
+   1803.7000   1477.1000     34.9500     -0.3900
+   1803.9000   1477.1100     34.9500     -0.3900
+   1804.0000   1477.1100     34.9500     -0.3900
+   1804.1000   1477.1100     34.9500     -0.3900
+   1804.2000   1477.1100     34.9500     -0.3900
+   1804.4000   1477.1100     34.9500     -0.3900
+   1804.5000   1477.1200     34.9500     -0.3900
+   1804.6000   1477.1200     34.9500     -0.3900
+   1804.7000   1477.1200     34.9500     -0.3900
+   1804.8000   1477.1200     34.9500     -0.3900
+   1805.0000   1477.1200     34.9500     -0.3900
+   1805.1000   1477.1300     34.9500     -0.3900
+   1805.2000   1477.1300     34.9500     -0.3900
+   1805.3000   1477.1300     34.9500     -0.3900
+   1805.5000   1477.1300     34.9500     -0.3900
+   1805.6000   1477.1300     34.9500     -0.3900
+   1805.7000   1477.1400     34.9500     -0.3900
+   1805.8000   1477.1400     34.9500     -0.3900
+   1806.0000   1477.1400     34.9500     -0.3900
+   1806.1000   1477.1400     34.9500     -0.3900
+   1806.2000   1477.1400     34.9500     -0.3900
+   1806.3000   1477.1500     34.9500     -0.3900
+   1806.5000   1477.1500     34.9500     -0.3900
+   1806.6000   1477.1500     34.9500     -0.3900
+   1806.7000   1477.1500     34.9500     -0.3900
+   1806.8000   1477.1500     34.9500     -0.3900
+   1807.0000   1477.1600     34.9500     -0.3900
+   1807.1000   1477.1600     34.9500     -0.3900
+   1807.2000   1477.1600     34.9500     -0.3900
+   1807.3000   1477.1600     34.9500     -0.3900
+   1807.5000   1477.1600     34.9500     -0.3900
+   1807.6000   1477.1700     34.9500     -0.3900
+   1807.7000   1477.1700     34.9500     -0.3900
+   1807.8000   1477.1700     34.9500     -0.3900
+   1807.9000   1477.1700     34.9500     -0.3900
+   1808.1000   1477.1700     34.9500     -0.3900
+   1808.2000   1477.1800     34.9500     -0.3900
+   1808.3000   1477.1800     34.9500     -0.3900
+   1808.4000   1477.1800     34.9500     -0.3900
+   1808.6000   1477.1800     34.9500     -0.3900
+   1808.7000   1477.1800     34.9500     -0.3900
+   1808.8000   1477.1900     34.9500     -0.3900
+   1808.9000   1477.1900     34.9500     -0.3900
+   1809.1000   1477.1900     34.9500     -0.3900
+   1809.2000   1477.1900     34.9500     -0.3900
+   1809.3000   1477.1900     34.9500     -0.3900
+   1809.4000   1477.2000     34.9500     -0.3900
+   1809.6000   1477.2000     34.9500     -0.3900
+   1809.7000   1477.2000     34.9500     -0.3900
+   1809.8000   1477.2000     34.9500     -0.3900
+   1809.9000   1477.2000     34.9500     -0.3900
+   1810.1000   1477.2100     34.9400     -0.3900
+   1810.2000   1477.2100     34.9400     -0.3900
+   1810.3000   1477.2100     34.9400     -0.3900
+   1810.4000   1477.2100     34.9400     -0.3900
+   1810.5000   1477.2100     34.9400     -0.3900
+   1810.7000   1477.2200     34.9400     -0.3900
+   1810.8000   1477.2200     34.9400     -0.3900
+   1810.9000   1477.2200     34.9400     -0.3900
+   1811.0000   1477.2200     34.9400     -0.3900
+   1811.2000   1477.2200     34.9400     -0.3900
+   1811.3000   1477.2300     34.9400     -0.3900
+   1811.4000   1477.2300     34.9400     -0.3900
+   1811.5000   1477.2300     34.9400     -0.3900
+   1811.7000   1477.2300     34.9400     -0.3900
+   1811.8000   1477.2300     34.9400     -0.3900
+   1811.9000   1477.2400     34.9400     -0.3900
+   1812.0000   1477.2400     34.9400     -0.3900
+   1812.2000   1477.2400     34.9400     -0.3900
+   1812.3000   1477.2400     34.9400     -0.3900
+   1812.4000   1477.2400     34.9400     -0.3900
+   1812.5000   1477.2500     34.9400     -0.3900
+   1812.7000   1477.2500     34.9400     -0.3900
+   1812.8000   1477.2500     34.9400     -0.3900
+   1812.9000   1477.2500     34.9400     -0.3900
+   1813.0000   1477.2500     34.9400     -0.3900
+   1813.1000   1477.2600     34.9400     -0.3900
+   1813.3000   1477.2600     34.9400     -0.3900
+   1813.4000   1477.2600     34.9400     -0.3900
+   1813.5000   1477.2600     34.9400     -0.3900
+   1813.6000   1477.2600     34.9400     -0.3900
+   1813.8000   1477.2700     34.9400     -0.3900
+   1813.9000   1477.2700     34.9400     -0.3900
+   1814.0000   1477.2700     34.9400     -0.3900
+   1814.1000   1477.2700     34.9400     -0.3900
+   1814.3000   1477.2700     34.9400     -0.3900
+   1814.4000   1477.2800     34.9400     -0.3900
+   1814.5000   1477.2800     34.9400     -0.3900
+   1814.6000   1477.2800     34.9400     -0.3900
+   1814.8000   1477.2800     34.9400     -0.3900
+   1814.9000   1477.2800     34.9400     -0.3900
+   1815.0000   1477.2900     34.9400     -0.3900
+   1815.1000   1477.2900     34.9400     -0.3900
+   1815.3000   1477.2900     34.9400     -0.3900
+   1815.4000   1477.2900     34.9400     -0.3900
+   1815.5000   1477.2900     34.9400     -0.3900
+   1815.6000   1477.3000     34.9400     -0.3900
+   1815.7000   1477.3000     34.9400     -0.3900
+   1815.9000   1477.3000     34.9400     -0.3900
+   1816.0000   1477.3000     34.9400     -0.3900
+   1816.1000   1477.3000     34.9400     -0.3900
+   1816.2000   1477.3100     34.9400     -0.3900
+   1816.4000   1477.3100     34.9400     -0.3900
+   1816.5000   1477.3100     34.9400     -0.3900
+   1816.6000   1477.3100     34.9400     -0.3900
+   1816.7000   1477.3100     34.9400     -0.3900
+   1816.9000   1477.3100     34.9400     -0.3900
+   1817.0000   1477.3200     34.9400     -0.3900
+   1817.1000   1477.3200     34.9400     -0.3900
+   1817.2000   1477.3200     34.9400     -0.3900
+   1817.4000   1477.3500     34.9600     -0.3900
+   1817.5000   1477.3200     34.9400     -0.3900
+   1817.6000   1477.3300     34.9400     -0.3900
+   1817.7000   1477.3300     34.9400     -0.3900
+   1817.8000   1477.3300     34.9400     -0.3900
+   1818.0000   1477.3300     34.9400     -0.3900
+   1818.1000   1477.3300     34.9400     -0.3900
+   1818.2000   1477.3400     34.9400     -0.3900
+   1818.3000   1477.3400     34.9400     -0.3900
+   1818.5000   1477.3400     34.9400     -0.3900
+   1818.6000   1477.3400     34.9400     -0.3900
+   1818.7000   1477.3400     34.9400     -0.3900
+   1818.8000   1477.3500     34.9400     -0.3900
+   1819.0000   1477.3500     34.9400     -0.3900
+   1819.1000   1477.3500     34.9400     -0.3900
+   1819.2000   1477.3500     34.9400     -0.3900
+   1819.3000   1477.3500     34.9400     -0.3900
+   1819.5000   1477.3600     34.9400     -0.3900
+   1819.6000   1477.3600     34.9400     -0.3900
+   1819.7000   1477.3600     34.9400     -0.3900
+   1819.8000   1477.3600     34.9400     -0.3900
+   1820.0000   1477.3600     34.9400     -0.3900
+   1820.1000   1477.3700     34.9400     -0.3900
+   1820.2000   1477.3700     34.9400     -0.3900
+   1820.3000   1477.3700     34.9400     -0.3900
+   1820.4000   1477.3700     34.9400     -0.3900
+   1820.6000   1477.3700     34.9400     -0.3900
+   1820.7000   1477.3800     34.9400     -0.3900
+   1820.8000   1477.3800     34.9400     -0.3900
+   1820.9000   1477.3800     34.9400     -0.3900
+   1821.1000   1477.3800     34.9400     -0.3900
+   1821.2000   1477.3800     34.9400     -0.3900
+   1821.3000   1477.3900     34.9400     -0.3900
+   1821.4000   1477.3900     34.9400     -0.3900
+   1821.6000   1477.3900     34.9400     -0.3900
+   1821.7000   1477.3900     34.9400     -0.3900
+   1821.8000   1477.4200     34.9600     -0.3900
+   1821.9000   1477.4000     34.9400     -0.3900
+   1822.1000   1477.4000     34.9400     -0.3900
+   1822.2000   1477.4000     34.9400     -0.3900
+   1822.3000   1477.4000     34.9400     -0.3900
+   1822.4000   1477.4000     34.9400     -0.3900
+   1822.6000   1477.4100     34.9400     -0.3900
+   1822.7000   1477.4100     34.9400     -0.3900
+   1822.8000   1477.4100     34.9400     -0.3900
+   1822.9000   1477.4400     34.9600     -0.3900
+   1823.0000   1477.4100     34.9400     -0.3900
+   1823.2000   1477.4200     34.9400     -0.3900
+   1823.3000   1477.4200     34.9400     -0.3900
+   1823.4000   1477.4200     34.9400     -0.3900
+   1823.5000   1477.4200     34.9400     -0.3900
+   1823.7000   1477.4200     34.9400     -0.3900
+   1823.8000   1477.4300     34.9400     -0.3900
+   1823.9000   1477.4600     34.9600     -0.3900
+   1824.0000   1477.4300     34.9400     -0.3900
+   1824.2000   1477.4600     34.9600     -0.3900
+   1824.3000   1477.4300     34.9400     -0.3900
+   1824.4000   1477.4600     34.9600     -0.3900
+   1824.5000   1477.4400     34.9400     -0.3900
+   1824.7000   1477.4700     34.9600     -0.3900
+   1824.8000   1477.4400     34.9400     -0.3900
+   1824.9000   1477.4700     34.9600     -0.3900
+   1825.0000   1477.4500     34.9400     -0.3900
+   1825.1000   1477.4500     34.9400     -0.3900
+   1825.3000   1477.4500     34.9400     -0.3900
+   1825.4000   1477.4500     34.9400     -0.3900
+   1825.5000   1477.4500     34.9400     -0.3900
+   1825.6000   1477.4800     34.9600     -0.3900
+   1825.8000   1477.4600     34.9400     -0.3900
+   1825.9000   1477.4600     34.9400     -0.3900
+   1826.0000   1477.4600     34.9400     -0.3900
+   1826.1000   1477.4600     34.9400     -0.3900
+   1826.3000   1477.4700     34.9400     -0.3900
+   1826.4000   1477.4700     34.9400     -0.3900
+   1826.5000   1477.4700     34.9400     -0.3900
+   1826.6000   1477.4700     34.9400     -0.3900
+   1826.8000   1477.5000     34.9600     -0.3900
+   1826.9000   1477.5000     34.9600     -0.3900
+   1827.0000   1477.4800     34.9400     -0.3900
+   1827.1000   1477.4800     34.9400     -0.3900
+   1827.3000   1477.5100     34.9600     -0.3900
+   1827.4000   1477.4800     34.9400     -0.3900
+   1827.5000   1477.4900     34.9400     -0.3900
+   1827.6000   1477.4900     34.9400     -0.3900
+   1827.7000   1477.4900     34.9400     -0.3900
+   1827.9000   1477.4900     34.9400     -0.3900
+   1828.0000   1477.4900     34.9400     -0.3900
+   1828.1000   1477.5200     34.9500     -0.3900
+   1828.2000   1477.5000     34.9400     -0.3900
+   1828.4000   1477.5000     34.9400     -0.3900
+   1828.5000   1477.5000     34.9300     -0.3900
+   1828.6000   1477.5300     34.9500     -0.3900
+   1828.7000   1477.5100     34.9300     -0.3900
+   1828.9000   1477.5100     34.9300     -0.3900
+   1829.0000   1477.5100     34.9300     -0.3900
+   1829.1000   1477.5400     34.9500     -0.3900
+   1829.2000   1477.5400     34.9500     -0.3900
+   1829.4000   1477.5200     34.9300     -0.3900
+   1829.5000   1477.5200     34.9300     -0.3900
+   1829.6000   1477.5200     34.9300     -0.3900
+   1829.7000   1477.5200     34.9300     -0.3900
+   1829.8000   1477.5500     34.9500     -0.3900
+   1830.0000   1477.5300     34.9300     -0.3900
+   1830.1000   1477.5300     34.9300     -0.3900
+   1830.2000   1477.5600     34.9500     -0.3900
+   1830.3000   1477.5600     34.9500     -0.3900
+   1830.5000   1477.5600     34.9500     -0.3900
+   1830.6000   1477.5400     34.9300     -0.3900
+   1830.7000   1477.5400     34.9300     -0.3900
+   1830.8000   1477.5400     34.9300     -0.3900
+   1831.0000   1477.5700     34.9500     -0.3900
+   1831.1000   1477.5700     34.9500     -0.3900
+   1831.2000   1477.5700     34.9500     -0.3900
+   1831.3000   1477.5500     34.9300     -0.3900
+   1831.5000   1477.5500     34.9300     -0.3900
+   1831.6000   1477.5800     34.9500     -0.3900
+   1831.7000   1477.5800     34.9500     -0.3900
+   1831.8000   1477.5600     34.9300     -0.3900
+   1832.0000   1477.5600     34.9300     -0.3900
+   1832.1000   1477.5900     34.9500     -0.3900
+   1832.2000   1477.5900     34.9500     -0.3900
+   1832.3000   1477.5900     34.9500     -0.3900
+   1832.4000   1477.5700     34.9300     -0.3900
+   1832.6000   1477.5700     34.9300     -0.3900
+   1832.7000   1477.6000     34.9500     -0.3900
+   1832.8000   1477.6000     34.9500     -0.3900
+   1832.9000   1477.6000     34.9500     -0.3900
+   1833.1000   1477.6000     34.9500     -0.3900
+   1833.2000   1477.5800     34.9300     -0.3900
+   1833.3000   1477.6100     34.9500     -0.3900
+   1833.4000   1477.6100     34.9500     -0.3900
+   1833.6000   1477.6100     34.9500     -0.3900
+   1833.7000   1477.6100     34.9500     -0.3900
+   1833.8000   1477.6100     34.9500     -0.3900
+   1833.9000   1477.5900     34.9300     -0.3900
+   1834.1000   1477.6200     34.9500     -0.3900
+   1834.2000   1477.6200     34.9500     -0.3900
+   1834.3000   1477.6000     34.9300     -0.3900
+   1834.4000   1477.6200     34.9500     -0.3900
+   1834.5000   1477.6300     34.9500     -0.3900
+   1834.7000   1477.6300     34.9500     -0.3900
+   1834.8000   1477.6300     34.9500     -0.3900
+   1834.9000   1477.6300     34.9500     -0.3900
+   1835.0000   1477.6300     34.9500     -0.3900
+   1835.2000   1477.6100     34.9300     -0.3900
+   1835.3000   1477.6400     34.9500     -0.3900
+   1835.4000   1477.6400     34.9500     -0.3900
+   1835.5000   1477.6200     34.9300     -0.3900
+   1835.7000   1477.6200     34.9300     -0.3900
+   1835.8000   1477.6500     34.9500     -0.3900
+   1835.9000   1477.6500     34.9500     -0.3900
+   1836.0000   1477.6500     34.9500     -0.3900
+   1836.2000   1477.6500     34.9500     -0.3900
+   1836.3000   1477.6500     34.9500     -0.3900
+   1836.4000   1477.6600     34.9500     -0.3900
+   1836.5000   1477.6600     34.9500     -0.3900
+   1836.6000   1477.6600     34.9500     -0.3900
+   1836.8000   1477.6400     34.9300     -0.3900
+   1836.9000   1477.6600     34.9500     -0.3900
+   1837.0000   1477.6400     34.9300     -0.3900
+   1837.1000   1477.6700     34.9500     -0.3900
+   1837.3000   1477.6700     34.9500     -0.3900
+   1837.4000   1477.6500     34.9300     -0.3900
+   1837.5000   1477.6500     34.9300     -0.3900
+   1837.6000   1477.6800     34.9500     -0.3900
+   1837.8000   1477.6800     34.9500     -0.3900
+   1837.9000   1477.6800     34.9500     -0.3900
+   1838.0000   1477.6800     34.9500     -0.3900
+   1838.1000   1477.6800     34.9500     -0.3900
+   1838.3000   1477.6600     34.9300     -0.3900
+   1838.4000   1477.6900     34.9500     -0.3900
+   1838.5000   1477.6900     34.9500     -0.3900
+   1838.6000   1477.6900     34.9500     -0.3900
+   1838.8000   1477.6900     34.9500     -0.3900
+   1838.9000   1477.6700     34.9300     -0.3900
+   1839.0000   1477.7000     34.9500     -0.3900
+   1839.1000   1477.7000     34.9500     -0.3900
+   1839.2000   1477.7000     34.9500     -0.3900
+   1839.4000   1477.7000     34.9500     -0.3900
+   1839.5000   1477.7100     34.9500     -0.3900
+   1839.6000   1477.7100     34.9500     -0.3900
+   1839.7000   1477.7100     34.9500     -0.3900
+   1839.9000   1477.7100     34.9500     -0.3900
+   1840.0000   1477.7100     34.9500     -0.3900
+   1840.1000   1477.7200     34.9500     -0.3900
+   1840.2000   1477.7200     34.9500     -0.3900
+   1840.4000   1477.7200     34.9500     -0.3900
+   1840.5000   1477.7200     34.9500     -0.3900
+   1840.6000   1477.7200     34.9500     -0.3900
+   1840.7000   1477.7300     34.9500     -0.3900
+   1840.9000   1477.7300     34.9500     -0.3900
+   1841.0000   1477.7300     34.9500     -0.3900
+   1841.1000   1477.7300     34.9500     -0.3900
+   1841.2000   1477.7100     34.9300     -0.3900
+   1841.3000   1477.7400     34.9500     -0.3900
+   1841.5000   1477.7400     34.9500     -0.3900
+   1841.6000   1477.7400     34.9500     -0.3900
+   1841.7000   1477.7400     34.9500     -0.3900
+   1841.8000   1477.7400     34.9500     -0.3900
+   1842.0000   1477.7500     34.9500     -0.3900
+   1842.1000   1477.7500     34.9500     -0.3900
+   1842.2000   1477.7500     34.9500     -0.3900
+   1842.3000   1477.7500     34.9500     -0.3900
+   1842.5000   1477.7500     34.9500     -0.3900
+   1842.6000   1477.7600     34.9500     -0.3900
+   1842.7000   1477.7600     34.9500     -0.3900
+   1842.8000   1477.7600     34.9500     -0.3900
+   1843.0000   1477.7600     34.9500     -0.3900
+   1843.1000   1477.7600     34.9500     -0.3900
+   1843.2000   1477.7700     34.9500     -0.3900
+   1843.3000   1477.7700     34.9500     -0.3900
+   1843.4000   1477.7700     34.9500     -0.3900
+   1843.6000   1477.7200     34.9500     -0.4000
+   1843.7000   1477.7800     34.9500     -0.3900
+   1843.8000   1477.7800     34.9500     -0.3900
+   1843.9000   1477.7800     34.9500     -0.3900
+   1844.1000   1477.7800     34.9500     -0.3900
+   1844.2000   1477.7800     34.9500     -0.3900
+   1844.3000   1477.7800     34.9500     -0.3900
+   1844.4000   1477.7900     34.9500     -0.3900
+   1844.6000   1477.7900     34.9500     -0.3900
+   1844.7000   1477.7900     34.9500     -0.3900
+   1844.8000   1477.7900     34.9500     -0.3900
+   1844.9000   1477.7900     34.9500     -0.3900
+   1845.1000   1477.8000     34.9500     -0.3900
+   1845.2000   1477.8000     34.9500     -0.3900
+   1845.3000   1477.8000     34.9500     -0.3900
+   1845.4000   1477.8000     34.9500     -0.3900
+   1845.5000   1477.8000     34.9500     -0.3900
+   1845.7000   1477.8100     34.9500     -0.3900
+   1845.8000   1477.8100     34.9500     -0.3900
+   1845.9000   1477.8100     34.9500     -0.3900
+   1846.0000   1477.8100     34.9500     -0.3900
+   1846.2000   1477.8100     34.9500     -0.3900
+   1846.3000   1477.8200     34.9400     -0.3900
+   1846.4000   1477.8200     34.9400     -0.3900
+   1846.5000   1477.8200     34.9400     -0.3900
+   1846.7000   1477.8200     34.9400     -0.3900
+   1846.8000   1477.8200     34.9400     -0.3900
+   1846.9000   1477.7800     34.9400     -0.4000
+   1847.0000   1477.8400     34.9500     -0.3900
+   1847.2000   1477.8400     34.9500     -0.3900
+   1847.3000   1477.8300     34.9400     -0.3900
+   1847.4000   1477.8300     34.9400     -0.3900
+   1847.5000   1477.8400     34.9400     -0.3900
+   1847.6000   1477.8400     34.9400     -0.3900
+   1847.8000   1477.8400     34.9400     -0.3900
+   1847.9000   1477.7900     34.9400     -0.4000
+   1848.0000   1477.8500     34.9500     -0.3900
+   1848.1000   1477.8500     34.9500     -0.3900
+   1848.3000   1477.8500     34.9400     -0.3900
+   1848.4000   1477.8500     34.9400     -0.3900
+   1848.5000   1477.8000     34.9400     -0.4000
+   1848.6000   1477.8600     34.9500     -0.3900
+   1848.8000   1477.8600     34.9500     -0.3900
+   1848.9000   1477.8600     34.9400     -0.3900
+   1849.0000   1477.8600     34.9400     -0.3900
+   1849.1000   1477.8600     34.9400     -0.3900
+   1849.3000   1477.8600     34.9400     -0.3900
+   1849.4000   1477.8600     34.9400     -0.3900
+   1849.5000   1477.8700     34.9400     -0.3900
+   1849.6000   1477.8700     34.9400     -0.3900
+   1849.7000   1477.8700     34.9400     -0.3900
+   1849.9000   1477.8700     34.9400     -0.3900
+   1850.0000   1477.8700     34.9400     -0.3900
+   1850.1000   1477.8800     34.9400     -0.3900
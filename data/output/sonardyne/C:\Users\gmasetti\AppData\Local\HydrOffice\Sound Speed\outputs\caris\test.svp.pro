@@ -0,0 +1,1231 @@
+test_read_store_and_write
+1/1/2012
+3:1:1
+Probe: CARIS
+Source: C:\Users\gmasetti\AppData\Local\HydrOffice\Sound Speed\outputs\caris\test.svp
+      0.0000   1530.4900      0.0000      0.0000
+      0.6000   1530.7000      0.0000      0.0000
+      1.3000   1530.7700      0.0000      0.0000
+      1.9000   1530.7900      0.0000      0.0000
+      2.6000   1530.8000      0.0000      0.0000
+      3.2000   1530.7800      0.0000      0.0000
+      3.9000   1530.8000      0.0000      0.0000
+      4.5000   1530.8100      0.0000      0.0000
+      5.2000   1530.8100      0.0000      0.0000
+      5.8000   1530.8400      0.0000      0.0000
+      6.5000   1530.8500      0.0000      0.0000
+      7.1000   1530.8400      0.0000      0.0000
+      7.8000   1530.8500      0.0000      0.0000
+      8.4000   1530.8600      0.0000      0.0000
+      9.1000   1530.8600      0.0000      0.0000
+      9.7000   1530.8700      0.0000      0.0000
+     10.3000   1530.8800      0.0000      0.0000
+     11.0000   1530.9100      0.0000      0.0000
+     11.6000   1530.9100      0.0000      0.0000
+     12.3000   1530.9200      0.0000      0.0000
+     12.9000   1530.9300      0.0000      0.0000
+     13.6000   1530.9300      0.0000      0.0000
+     14.2000   1530.9500      0.0000      0.0000
+     14.9000   1530.9700      0.0000      0.0000
+     15.5000   1530.9800      0.0000      0.0000
+     16.2000   1530.9900      0.0000      0.0000
+     16.8000   1531.0000      0.0000      0.0000
+     17.5000   1531.0300      0.0000      0.0000
+     18.1000   1531.0200      0.0000      0.0000
+     18.8000   1531.0300      0.0000      0.0000
+     19.4000   1531.0300      0.0000      0.0000
+     20.0000   1531.0400      0.0000      0.0000
+     20.7000   1531.0600      0.0000      0.0000
+     21.3000   1531.0800      0.0000      0.0000
+     22.0000   1531.0900      0.0000      0.0000
+     22.6000   1531.1000      0.0000      0.0000
+     23.3000   1531.1000      0.0000      0.0000
+     23.9000   1531.0900      0.0000      0.0000
+     24.6000   1531.1100      0.0000      0.0000
+     25.2000   1531.1300      0.0000      0.0000
+     25.9000   1531.1300      0.0000      0.0000
+     26.5000   1531.1500      0.0000      0.0000
+     27.1000   1531.1600      0.0000      0.0000
+     27.8000   1531.1500      0.0000      0.0000
+     28.4000   1531.1600      0.0000      0.0000
+     29.1000   1531.1800      0.0000      0.0000
+     29.7000   1531.1700      0.0000      0.0000
+     30.4000   1531.2000      0.0000      0.0000
+     31.0000   1531.2200      0.0000      0.0000
+     31.7000   1531.2200      0.0000      0.0000
+     32.3000   1531.2300      0.0000      0.0000
+     33.0000   1531.2500      0.0000      0.0000
+     33.6000   1531.2500      0.0000      0.0000
+     34.2000   1531.2800      0.0000      0.0000
+     34.9000   1531.2800      0.0000      0.0000
+     35.5000   1531.2900      0.0000      0.0000
+     36.2000   1531.3000      0.0000      0.0000
+     36.8000   1531.3100      0.0000      0.0000
+     37.5000   1531.3200      0.0000      0.0000
+     38.1000   1531.3200      0.0000      0.0000
+     38.8000   1531.3200      0.0000      0.0000
+     39.4000   1531.3400      0.0000      0.0000
+     40.0000   1531.3500      0.0000      0.0000
+     40.7000   1531.3400      0.0000      0.0000
+     41.3000   1531.3500      0.0000      0.0000
+     42.0000   1531.3500      0.0000      0.0000
+     42.6000   1531.3600      0.0000      0.0000
+     43.3000   1531.3800      0.0000      0.0000
+     43.9000   1531.3800      0.0000      0.0000
+     44.6000   1531.4000      0.0000      0.0000
+     45.2000   1531.4200      0.0000      0.0000
+     45.8000   1531.4400      0.0000      0.0000
+     46.5000   1531.4400      0.0000      0.0000
+     47.1000   1531.4500      0.0000      0.0000
+     47.8000   1531.4600      0.0000      0.0000
+     48.4000   1531.4900      0.0000      0.0000
+     49.1000   1531.5300      0.0000      0.0000
+     49.7000   1531.5400      0.0000      0.0000
+     50.4000   1531.5200      0.0000      0.0000
+     51.0000   1531.5300      0.0000      0.0000
+     51.6000   1531.5400      0.0000      0.0000
+     52.3000   1531.5600      0.0000      0.0000
+     52.9000   1531.5900      0.0000      0.0000
+     53.6000   1531.5900      0.0000      0.0000
+     54.2000   1531.6000      0.0000      0.0000
+     54.9000   1531.6000      0.0000      0.0000
+     55.5000   1531.6100      0.0000      0.0000
+     56.1000   1531.6200      0.0000      0.0000
+     56.8000   1531.6300      0.0000      0.0000
+     57.4000   1531.6400      0.0000      0.0000
+     58.1000   1531.6500      0.0000      0.0000
+     58.7000   1531.6600      0.0000      0.0000
+     59.4000   1531.6800      0.0000      0.0000
+     60.0000   1531.6900      0.0000      0.0000
+     60.6000   1531.6900      0.0000      0.0000
+     61.3000   1531.7100      0.0000      0.0000
+     61.9000   1531.7300      0.0000      0.0000
+     62.6000   1531.7400      0.0000      0.0000
+     63.2000   1531.7500      0.0000      0.0000
+     63.9000   1531.7600      0.0000      0.0000
+     64.5000   1531.7600      0.0000      0.0000
+     65.1000   1531.7800      0.0000      0.0000
+     65.8000   1531.7900      0.0000      0.0000
+     66.4000   1531.7900      0.0000      0.0000
+     67.1000   1531.8000      0.0000      0.0000
+     67.7000   1531.8100      0.0000      0.0000
+     68.4000   1531.8300      0.0000      0.0000
+     69.0000   1531.8400      0.0000      0.0000
+     69.6000   1531.8700      0.0000      0.0000
+     70.3000   1531.8600      0.0000      0.0000
+     70.9000   1531.8600      0.0000      0.0000
+     71.6000   1531.8700      0.0000      0.0000
+     72.2000   1531.8700      0.0000      0.0000
+     72.9000   1531.8800      0.0000      0.0000
+     73.5000   1531.8800      0.0000      0.0000
+     74.1000   1531.8800      0.0000      0.0000
+     74.8000   1531.8700      0.0000      0.0000
+     75.4000   1531.8900      0.0000      0.0000
+     76.1000   1531.9100      0.0000      0.0000
+     76.7000   1531.9100      0.0000      0.0000
+     77.4000   1531.9200      0.0000      0.0000
+     78.0000   1531.9300      0.0000      0.0000
+     78.6000   1531.9500      0.0000      0.0000
+     79.3000   1531.9600      0.0000      0.0000
+     79.9000   1531.9800      0.0000      0.0000
+     80.6000   1531.9900      0.0000      0.0000
+     81.2000   1532.0200      0.0000      0.0000
+     81.8000   1532.0300      0.0000      0.0000
+     82.5000   1532.0400      0.0000      0.0000
+     83.1000   1532.0500      0.0000      0.0000
+     83.8000   1532.0500      0.0000      0.0000
+     84.4000   1532.0500      0.0000      0.0000
+     85.1000   1532.0400      0.0000      0.0000
+     85.7000   1532.0200      0.0000      0.0000
+     86.3000   1532.0100      0.0000      0.0000
+     87.0000   1532.0000      0.0000      0.0000
+     87.6000   1532.0100      0.0000      0.0000
+     88.3000   1532.0100      0.0000      0.0000
+     88.9000   1532.0200      0.0000      0.0000
+     89.5000   1532.0300      0.0000      0.0000
+     90.2000   1532.0400      0.0000      0.0000
+     90.8000   1532.0400      0.0000      0.0000
+     91.5000   1532.0300      0.0000      0.0000
+     92.1000   1532.0500      0.0000      0.0000
+     92.7000   1532.0500      0.0000      0.0000
+     93.4000   1532.0100      0.0000      0.0000
+     94.0000   1531.9900      0.0000      0.0000
+     94.7000   1531.9500      0.0000      0.0000
+     95.3000   1531.9200      0.0000      0.0000
+     96.0000   1531.9000      0.0000      0.0000
+     96.6000   1531.9000      0.0000      0.0000
+     97.2000   1531.9100      0.0000      0.0000
+     97.9000   1531.9100      0.0000      0.0000
+     98.5000   1531.9400      0.0000      0.0000
+     99.2000   1531.9300      0.0000      0.0000
+     99.8000   1531.9300      0.0000      0.0000
+    100.4000   1531.9100      0.0000      0.0000
+    101.1000   1531.8800      0.0000      0.0000
+    101.7000   1531.8200      0.0000      0.0000
+    102.4000   1531.8100      0.0000      0.0000
+    103.0000   1531.7800      0.0000      0.0000
+    103.6000   1531.7500      0.0000      0.0000
+    104.3000   1531.7300      0.0000      0.0000
+    104.9000   1531.6900      0.0000      0.0000
+    105.6000   1531.6200      0.0000      0.0000
+    106.2000   1531.5700      0.0000      0.0000
+    106.8000   1531.5200      0.0000      0.0000
+    107.5000   1531.5000      0.0000      0.0000
+    108.1000   1531.4700      0.0000      0.0000
+    108.8000   1531.4600      0.0000      0.0000
+    109.4000   1531.4400      0.0000      0.0000
+    110.0000   1531.4400      0.0000      0.0000
+    110.7000   1531.4200      0.0000      0.0000
+    111.3000   1531.3800      0.0000      0.0000
+    112.0000   1531.3400      0.0000      0.0000
+    112.6000   1531.2600      0.0000      0.0000
+    113.2000   1531.1300      0.0000      0.0000
+    113.9000   1530.9800      0.0000      0.0000
+    114.5000   1530.8500      0.0000      0.0000
+    115.2000   1530.7300      0.0000      0.0000
+    115.8000   1530.6400      0.0000      0.0000
+    116.4000   1530.5900      0.0000      0.0000
+    117.1000   1530.5500      0.0000      0.0000
+    117.7000   1530.4800      0.0000      0.0000
+    118.4000   1530.3800      0.0000      0.0000
+    119.0000   1530.3100      0.0000      0.0000
+    119.6000   1530.2500      0.0000      0.0000
+    120.3000   1530.1600      0.0000      0.0000
+    120.9000   1530.0900      0.0000      0.0000
+    121.5000   1530.0500      0.0000      0.0000
+    122.2000   1530.0500      0.0000      0.0000
+    122.8000   1529.9600      0.0000      0.0000
+    123.5000   1529.8200      0.0000      0.0000
+    124.1000   1529.7300      0.0000      0.0000
+    124.7000   1529.6700      0.0000      0.0000
+    125.4000   1529.5300      0.0000      0.0000
+    126.0000   1529.4700      0.0000      0.0000
+    126.7000   1529.4700      0.0000      0.0000
+    127.3000   1529.4600      0.0000      0.0000
+    127.9000   1529.4600      0.0000      0.0000
+    128.6000   1529.4700      0.0000      0.0000
+    129.2000   1529.4800      0.0000      0.0000
+    129.9000   1529.5000      0.0000      0.0000
+    130.5000   1529.5200      0.0000      0.0000
+    131.1000   1529.5600      0.0000      0.0000
+    131.8000   1529.5800      0.0000      0.0000
+    132.4000   1529.6100      0.0000      0.0000
+    133.0000   1529.6800      0.0000      0.0000
+    133.7000   1529.7400      0.0000      0.0000
+    134.3000   1529.7800      0.0000      0.0000
+    135.0000   1529.8600      0.0000      0.0000
+    135.6000   1529.9000      0.0000      0.0000
+    136.2000   1529.9300      0.0000      0.0000
+    136.9000   1529.9700      0.0000      0.0000
+    137.5000   1530.0000      0.0000      0.0000
+    138.1000   1530.0600      0.0000      0.0000
+    138.8000   1530.0900      0.0000      0.0000
+    139.4000   1530.0800      0.0000      0.0000
+    140.1000   1530.0800      0.0000      0.0000
+    140.7000   1530.0900      0.0000      0.0000
+    141.3000   1530.0900      0.0000      0.0000
+    142.0000   1530.0600      0.0000      0.0000
+    142.6000   1529.9900      0.0000      0.0000
+    143.3000   1529.8900      0.0000      0.0000
+    143.9000   1529.8100      0.0000      0.0000
+    144.5000   1529.7400      0.0000      0.0000
+    145.2000   1529.6500      0.0000      0.0000
+    145.8000   1529.5800      0.0000      0.0000
+    146.4000   1529.5200      0.0000      0.0000
+    147.1000   1529.4900      0.0000      0.0000
+    147.7000   1529.4600      0.0000      0.0000
+    148.4000   1529.4200      0.0000      0.0000
+    149.0000   1529.3600      0.0000      0.0000
+    149.6000   1529.3000      0.0000      0.0000
+    150.3000   1529.2000      0.0000      0.0000
+    150.9000   1529.0900      0.0000      0.0000
+    151.5000   1528.9700      0.0000      0.0000
+    152.2000   1528.8800      0.0000      0.0000
+    152.8000   1528.7800      0.0000      0.0000
+    153.4000   1528.7200      0.0000      0.0000
+    154.1000   1528.6600      0.0000      0.0000
+    154.7000   1528.5800      0.0000      0.0000
+    155.4000   1528.4500      0.0000      0.0000
+    156.0000   1528.3500      0.0000      0.0000
+    156.6000   1528.3000      0.0000      0.0000
+    157.3000   1528.2400      0.0000      0.0000
+    157.9000   1528.1900      0.0000      0.0000
+    158.5000   1528.1000      0.0000      0.0000
+    159.2000   1528.0100      0.0000      0.0000
+    159.8000   1527.9200      0.0000      0.0000
+    160.4000   1527.8700      0.0000      0.0000
+    161.1000   1527.8300      0.0000      0.0000
+    161.7000   1527.8300      0.0000      0.0000
+    162.4000   1527.7700      0.0000      0.0000
+    163.0000   1527.5800      0.0000      0.0000
+    163.6000   1527.4200      0.0000      0.0000
+    164.3000   1527.2700      0.0000      0.0000
+    164.9000   1527.1300      0.0000      0.0000
+    165.5000   1527.0700      0.0000      0.0000
+    166.2000   1527.0700      0.0000      0.0000
+    166.8000   1527.0500      0.0000      0.0000
+    167.4000   1527.0000      0.0000      0.0000
+    168.1000   1526.9500      0.0000      0.0000
+    168.7000   1526.8700      0.0000      0.0000
+    169.4000   1526.7700      0.0000      0.0000
+    170.0000   1526.6800      0.0000      0.0000
+    170.6000   1526.5700      0.0000      0.0000
+    171.3000   1526.4900      0.0000      0.0000
+    171.9000   1526.4100      0.0000      0.0000
+    172.5000   1526.3600      0.0000      0.0000
+    173.2000   1526.3400      0.0000      0.0000
+    173.8000   1526.3000      0.0000      0.0000
+    174.4000   1526.2500      0.0000      0.0000
+    175.1000   1526.1400      0.0000      0.0000
+    175.7000   1526.0400      0.0000      0.0000
+    176.3000   1525.9300      0.0000      0.0000
+    177.0000   1525.8300      0.0000      0.0000
+    177.6000   1525.7000      0.0000      0.0000
+    178.3000   1525.3400      0.0000      0.0000
+    178.9000   1524.8600      0.0000      0.0000
+    179.5000   1524.5700      0.0000      0.0000
+    180.2000   1524.4200      0.0000      0.0000
+    180.8000   1524.3300      0.0000      0.0000
+    181.4000   1524.2600      0.0000      0.0000
+    182.1000   1524.2100      0.0000      0.0000
+    182.7000   1524.1700      0.0000      0.0000
+    183.3000   1524.1200      0.0000      0.0000
+    184.0000   1524.0600      0.0000      0.0000
+    184.6000   1523.9900      0.0000      0.0000
+    185.2000   1523.9200      0.0000      0.0000
+    185.9000   1523.8600      0.0000      0.0000
+    186.5000   1523.8000      0.0000      0.0000
+    187.1000   1523.7400      0.0000      0.0000
+    187.8000   1523.6800      0.0000      0.0000
+    188.4000   1523.6200      0.0000      0.0000
+    189.0000   1523.5700      0.0000      0.0000
+    189.7000   1523.4900      0.0000      0.0000
+    190.3000   1523.3100      0.0000      0.0000
+    190.9000   1523.1300      0.0000      0.0000
+    191.6000   1523.0200      0.0000      0.0000
+    192.2000   1522.9400      0.0000      0.0000
+    192.9000   1522.8200      0.0000      0.0000
+    193.5000   1522.6600      0.0000      0.0000
+    194.1000   1522.5600      0.0000      0.0000
+    194.8000   1522.4400      0.0000      0.0000
+    195.4000   1522.2200      0.0000      0.0000
+    196.0000   1521.9600      0.0000      0.0000
+    196.7000   1521.7700      0.0000      0.0000
+    197.3000   1521.6500      0.0000      0.0000
+    197.9000   1521.5000      0.0000      0.0000
+    198.6000   1521.2200      0.0000      0.0000
+    199.2000   1520.9200      0.0000      0.0000
+    199.8000   1520.7100      0.0000      0.0000
+    200.5000   1520.5800      0.0000      0.0000
+    201.1000   1520.4800      0.0000      0.0000
+    201.7000   1520.4200      0.0000      0.0000
+    202.4000   1520.4200      0.0000      0.0000
+    203.0000   1520.4700      0.0000      0.0000
+    203.6000   1520.5200      0.0000      0.0000
+    204.3000   1520.5700      0.0000      0.0000
+    204.9000   1520.6200      0.0000      0.0000
+    205.5000   1520.6800      0.0000      0.0000
+    206.2000   1520.7200      0.0000      0.0000
+    206.8000   1520.7600      0.0000      0.0000
+    207.4000   1520.7200      0.0000      0.0000
+    208.1000   1520.6600      0.0000      0.0000
+    208.7000   1520.6000      0.0000      0.0000
+    209.3000   1520.5300      0.0000      0.0000
+    210.0000   1520.4700      0.0000      0.0000
+    210.6000   1520.3600      0.0000      0.0000
+    211.2000   1520.0900      0.0000      0.0000
+    211.9000   1519.6600      0.0000      0.0000
+    212.5000   1519.2400      0.0000      0.0000
+    213.1000   1518.9100      0.0000      0.0000
+    213.8000   1518.7200      0.0000      0.0000
+    214.4000   1518.6000      0.0000      0.0000
+    215.0000   1518.4800      0.0000      0.0000
+    215.7000   1518.4000      0.0000      0.0000
+    216.3000   1518.3700      0.0000      0.0000
+    216.9000   1518.3600      0.0000      0.0000
+    217.6000   1518.3500      0.0000      0.0000
+    218.2000   1518.3400      0.0000      0.0000
+    218.8000   1518.3400      0.0000      0.0000
+    219.4000   1518.3500      0.0000      0.0000
+    220.1000   1518.3400      0.0000      0.0000
+    220.7000   1518.3200      0.0000      0.0000
+    221.3000   1518.2900      0.0000      0.0000
+    222.0000   1518.2400      0.0000      0.0000
+    222.6000   1518.1600      0.0000      0.0000
+    223.2000   1518.0800      0.0000      0.0000
+    223.9000   1518.0000      0.0000      0.0000
+    224.5000   1517.8800      0.0000      0.0000
+    225.1000   1517.6700      0.0000      0.0000
+    225.8000   1517.2600      0.0000      0.0000
+    226.4000   1516.6700      0.0000      0.0000
+    227.0000   1516.1900      0.0000      0.0000
+    227.7000   1515.9600      0.0000      0.0000
+    228.3000   1515.8500      0.0000      0.0000
+    228.9000   1515.7900      0.0000      0.0000
+    229.6000   1515.8100      0.0000      0.0000
+    230.2000   1515.9800      0.0000      0.0000
+    230.8000   1516.2000      0.0000      0.0000
+    231.5000   1516.3000      0.0000      0.0000
+    232.1000   1516.2700      0.0000      0.0000
+    232.7000   1516.1800      0.0000      0.0000
+    233.4000   1516.0100      0.0000      0.0000
+    234.0000   1515.7600      0.0000      0.0000
+    234.6000   1515.4300      0.0000      0.0000
+    235.2000   1515.1700      0.0000      0.0000
+    235.9000   1515.0100      0.0000      0.0000
+    236.5000   1514.9300      0.0000      0.0000
+    237.1000   1514.9000      0.0000      0.0000
+    237.8000   1514.8600      0.0000      0.0000
+    238.4000   1514.8200      0.0000      0.0000
+    239.0000   1514.7700      0.0000      0.0000
+    239.7000   1514.7200      0.0000      0.0000
+    240.3000   1514.6300      0.0000      0.0000
+    240.9000   1514.5600      0.0000      0.0000
+    241.6000   1514.5300      0.0000      0.0000
+    242.2000   1514.5100      0.0000      0.0000
+    242.8000   1514.4400      0.0000      0.0000
+    243.4000   1514.3100      0.0000      0.0000
+    244.1000   1514.1700      0.0000      0.0000
+    244.7000   1513.9800      0.0000      0.0000
+    245.3000   1513.7500      0.0000      0.0000
+    246.0000   1513.5600      0.0000      0.0000
+    246.6000   1513.4200      0.0000      0.0000
+    247.2000   1513.3400      0.0000      0.0000
+    247.9000   1513.3300      0.0000      0.0000
+    248.5000   1513.3300      0.0000      0.0000
+    249.1000   1513.2900      0.0000      0.0000
+    249.8000   1513.2200      0.0000      0.0000
+    250.4000   1513.1400      0.0000      0.0000
+    251.0000   1513.0800      0.0000      0.0000
+    251.6000   1513.0500      0.0000      0.0000
+    252.3000   1513.0200      0.0000      0.0000
+    252.9000   1512.9000      0.0000      0.0000
+    253.5000   1512.6200      0.0000      0.0000
+    254.2000   1512.2900      0.0000      0.0000
+    254.8000   1511.9400      0.0000      0.0000
+    255.4000   1511.5800      0.0000      0.0000
+    256.1000   1511.3800      0.0000      0.0000
+    256.7000   1511.2700      0.0000      0.0000
+    257.3000   1511.1900      0.0000      0.0000
+    257.9000   1511.1300      0.0000      0.0000
+    258.6000   1511.0700      0.0000      0.0000
+    259.2000   1511.0200      0.0000      0.0000
+    259.8000   1510.9100      0.0000      0.0000
+    260.5000   1510.7900      0.0000      0.0000
+    261.1000   1510.6300      0.0000      0.0000
+    261.7000   1510.4100      0.0000      0.0000
+    262.4000   1510.1500      0.0000      0.0000
+    263.0000   1509.9700      0.0000      0.0000
+    263.6000   1509.7900      0.0000      0.0000
+    264.2000   1509.6100      0.0000      0.0000
+    264.9000   1509.4600      0.0000      0.0000
+    265.5000   1509.2900      0.0000      0.0000
+    266.1000   1509.1000      0.0000      0.0000
+    266.8000   1508.9400      0.0000      0.0000
+    267.4000   1508.8100      0.0000      0.0000
+    268.0000   1508.7000      0.0000      0.0000
+    268.6000   1508.6300      0.0000      0.0000
+    269.3000   1508.5600      0.0000      0.0000
+    269.9000   1508.5300      0.0000      0.0000
+    270.5000   1508.5000      0.0000      0.0000
+    271.2000   1508.4600      0.0000      0.0000
+    271.8000   1508.4300      0.0000      0.0000
+    272.4000   1508.4100      0.0000      0.0000
+    273.0000   1508.3600      0.0000      0.0000
+    273.7000   1508.3300      0.0000      0.0000
+    274.3000   1508.2600      0.0000      0.0000
+    274.9000   1508.1300      0.0000      0.0000
+    275.6000   1508.0100      0.0000      0.0000
+    276.2000   1507.8200      0.0000      0.0000
+    276.8000   1507.6000      0.0000      0.0000
+    277.4000   1507.4000      0.0000      0.0000
+    278.1000   1507.1000      0.0000      0.0000
+    278.7000   1506.8100      0.0000      0.0000
+    279.3000   1506.6100      0.0000      0.0000
+    280.0000   1506.4400      0.0000      0.0000
+    280.6000   1506.3200      0.0000      0.0000
+    281.2000   1506.2200      0.0000      0.0000
+    281.8000   1506.1400      0.0000      0.0000
+    282.5000   1506.0700      0.0000      0.0000
+    283.1000   1506.0300      0.0000      0.0000
+    283.7000   1506.0000      0.0000      0.0000
+    284.4000   1505.9700      0.0000      0.0000
+    285.0000   1505.8500      0.0000      0.0000
+    285.6000   1505.7300      0.0000      0.0000
+    286.2000   1505.6600      0.0000      0.0000
+    286.9000   1505.6500      0.0000      0.0000
+    287.5000   1505.6300      0.0000      0.0000
+    288.1000   1505.6000      0.0000      0.0000
+    288.7000   1505.5400      0.0000      0.0000
+    289.4000   1505.4500      0.0000      0.0000
+    290.0000   1505.3500      0.0000      0.0000
+    290.6000   1505.2500      0.0000      0.0000
+    291.3000   1505.2000      0.0000      0.0000
+    291.9000   1505.1600      0.0000      0.0000
+    292.5000   1505.1000      0.0000      0.0000
+    293.1000   1505.0200      0.0000      0.0000
+    293.8000   1504.9600      0.0000      0.0000
+    294.4000   1504.9400      0.0000      0.0000
+    295.0000   1504.9000      0.0000      0.0000
+    295.7000   1504.8000      0.0000      0.0000
+    296.3000   1504.5800      0.0000      0.0000
+    296.9000   1504.3300      0.0000      0.0000
+    297.5000   1504.1600      0.0000      0.0000
+    298.2000   1504.0100      0.0000      0.0000
+    298.8000   1503.7800      0.0000      0.0000
+    299.4000   1503.4800      0.0000      0.0000
+    300.0000   1503.2300      0.0000      0.0000
+    300.7000   1503.0500      0.0000      0.0000
+    301.3000   1502.8000      0.0000      0.0000
+    301.9000   1502.4400      0.0000      0.0000
+    302.5000   1502.2000      0.0000      0.0000
+    303.2000   1502.0600      0.0000      0.0000
+    303.8000   1501.8600      0.0000      0.0000
+    304.4000   1501.5700      0.0000      0.0000
+    305.1000   1501.3400      0.0000      0.0000
+    305.7000   1501.1900      0.0000      0.0000
+    306.3000   1501.1100      0.0000      0.0000
+    306.9000   1501.0300      0.0000      0.0000
+    307.6000   1500.9700      0.0000      0.0000
+    308.2000   1500.9000      0.0000      0.0000
+    308.8000   1500.8600      0.0000      0.0000
+    309.4000   1500.8200      0.0000      0.0000
+    310.1000   1500.8100      0.0000      0.0000
+    310.7000   1500.8100      0.0000      0.0000
+    311.3000   1500.8100      0.0000      0.0000
+    311.9000   1500.8100      0.0000      0.0000
+    312.6000   1500.7900      0.0000      0.0000
+    313.2000   1500.7600      0.0000      0.0000
+    313.8000   1500.7200      0.0000      0.0000
+    314.4000   1500.6500      0.0000      0.0000
+    315.1000   1500.5900      0.0000      0.0000
+    315.7000   1500.5600      0.0000      0.0000
+    316.3000   1500.5300      0.0000      0.0000
+    316.9000   1500.5100      0.0000      0.0000
+    317.6000   1500.4800      0.0000      0.0000
+    318.2000   1500.4300      0.0000      0.0000
+    318.8000   1500.3700      0.0000      0.0000
+    319.5000   1500.3300      0.0000      0.0000
+    320.1000   1500.2900      0.0000      0.0000
+    320.7000   1500.2300      0.0000      0.0000
+    321.3000   1500.1600      0.0000      0.0000
+    322.0000   1500.0700      0.0000      0.0000
+    322.6000   1499.9500      0.0000      0.0000
+    323.2000   1499.8300      0.0000      0.0000
+    323.8000   1499.7100      0.0000      0.0000
+    324.5000   1499.6100      0.0000      0.0000
+    325.1000   1499.5500      0.0000      0.0000
+    325.7000   1499.5300      0.0000      0.0000
+    326.3000   1499.4800      0.0000      0.0000
+    327.0000   1499.4100      0.0000      0.0000
+    327.6000   1499.3300      0.0000      0.0000
+    328.2000   1499.2200      0.0000      0.0000
+    328.8000   1499.1100      0.0000      0.0000
+    329.5000   1498.9900      0.0000      0.0000
+    330.1000   1498.9200      0.0000      0.0000
+    330.7000   1498.9000      0.0000      0.0000
+    331.3000   1498.8900      0.0000      0.0000
+    332.0000   1498.8800      0.0000      0.0000
+    332.6000   1498.8500      0.0000      0.0000
+    333.2000   1498.8100      0.0000      0.0000
+    333.8000   1498.8000      0.0000      0.0000
+    334.5000   1498.7700      0.0000      0.0000
+    335.1000   1498.7300      0.0000      0.0000
+    335.7000   1498.7100      0.0000      0.0000
+    336.3000   1498.6900      0.0000      0.0000
+    336.9000   1498.6900      0.0000      0.0000
+    337.6000   1498.6700      0.0000      0.0000
+    338.2000   1498.6400      0.0000      0.0000
+    338.8000   1498.5900      0.0000      0.0000
+    339.4000   1498.5000      0.0000      0.0000
+    340.1000   1498.3100      0.0000      0.0000
+    340.7000   1498.0100      0.0000      0.0000
+    341.3000   1497.7900      0.0000      0.0000
+    341.9000   1497.6800      0.0000      0.0000
+    342.6000   1497.6000      0.0000      0.0000
+    343.2000   1497.5400      0.0000      0.0000
+    343.8000   1497.4900      0.0000      0.0000
+    344.4000   1497.4400      0.0000      0.0000
+    345.1000   1497.4200      0.0000      0.0000
+    345.7000   1497.4000      0.0000      0.0000
+    346.3000   1497.4000      0.0000      0.0000
+    346.9000   1497.3900      0.0000      0.0000
+    347.6000   1497.3400      0.0000      0.0000
+    348.2000   1497.3100      0.0000      0.0000
+    348.8000   1497.2500      0.0000      0.0000
+    349.4000   1497.1600      0.0000      0.0000
+    350.0000   1497.0300      0.0000      0.0000
+    350.7000   1496.9500      0.0000      0.0000
+    351.3000   1496.9100      0.0000      0.0000
+    351.9000   1496.8900      0.0000      0.0000
+    352.5000   1496.8700      0.0000      0.0000
+    353.2000   1496.8800      0.0000      0.0000
+    353.8000   1496.8800      0.0000      0.0000
+    354.4000   1496.8800      0.0000      0.0000
+    355.0000   1496.8700      0.0000      0.0000
+    355.7000   1496.8800      0.0000      0.0000
+    356.3000   1496.9000      0.0000      0.0000
+    356.9000   1496.9000      0.0000      0.0000
+    357.5000   1496.8900      0.0000      0.0000
+    358.1000   1496.8800      0.0000      0.0000
+    358.8000   1496.8800      0.0000      0.0000
+    359.4000   1496.9000      0.0000      0.0000
+    360.0000   1496.9000      0.0000      0.0000
+    360.6000   1496.9000      0.0000      0.0000
+    361.3000   1496.8900      0.0000      0.0000
+    361.9000   1496.8900      0.0000      0.0000
+    362.5000   1496.9000      0.0000      0.0000
+    363.1000   1496.8900      0.0000      0.0000
+    363.8000   1496.8800      0.0000      0.0000
+    364.4000   1496.8700      0.0000      0.0000
+    365.0000   1496.8500      0.0000      0.0000
+    365.6000   1496.8300      0.0000      0.0000
+    366.2000   1496.8100      0.0000      0.0000
+    366.9000   1496.7800      0.0000      0.0000
+    367.5000   1496.7800      0.0000      0.0000
+    368.1000   1496.7200      0.0000      0.0000
+    368.7000   1496.6200      0.0000      0.0000
+    369.4000   1496.5200      0.0000      0.0000
+    370.0000   1496.4600      0.0000      0.0000
+    370.6000   1496.4100      0.0000      0.0000
+    371.2000   1496.3800      0.0000      0.0000
+    371.8000   1496.3500      0.0000      0.0000
+    372.5000   1496.2400      0.0000      0.0000
+    373.1000   1496.0700      0.0000      0.0000
+    373.7000   1495.9500      0.0000      0.0000
+    374.3000   1495.8500      0.0000      0.0000
+    375.0000   1495.7900      0.0000      0.0000
+    375.6000   1495.7700      0.0000      0.0000
+    376.2000   1495.7500      0.0000      0.0000
+    376.8000   1495.7600      0.0000      0.0000
+    377.4000   1495.7500      0.0000      0.0000
+    378.1000   1495.7500      0.0000      0.0000
+    378.7000   1495.7700      0.0000      0.0000
+    379.3000   1495.7800      0.0000      0.0000
+    379.9000   1495.7900      0.0000      0.0000
+    380.5000   1495.8100      0.0000      0.0000
+    381.2000   1495.8100      0.0000      0.0000
+    381.8000   1495.8100      0.0000      0.0000
+    382.4000   1495.8100      0.0000      0.0000
+    383.0000   1495.8100      0.0000      0.0000
+    383.6000   1495.8000      0.0000      0.0000
+    384.3000   1495.7700      0.0000      0.0000
+    384.9000   1495.7200      0.0000      0.0000
+    385.5000   1495.6400      0.0000      0.0000
+    386.1000   1495.5400      0.0000      0.0000
+    386.8000   1495.4700      0.0000      0.0000
+    387.4000   1495.4300      0.0000      0.0000
+    388.0000   1495.4200      0.0000      0.0000
+    388.6000   1495.4100      0.0000      0.0000
+    389.2000   1495.4000      0.0000      0.0000
+    389.9000   1495.4000      0.0000      0.0000
+    390.5000   1495.3900      0.0000      0.0000
+    391.1000   1495.3900      0.0000      0.0000
+    391.7000   1495.4000      0.0000      0.0000
+    392.3000   1495.4200      0.0000      0.0000
+    393.0000   1495.4300      0.0000      0.0000
+    393.6000   1495.4100      0.0000      0.0000
+    394.2000   1495.4100      0.0000      0.0000
+    394.8000   1495.4100      0.0000      0.0000
+    395.4000   1495.4000      0.0000      0.0000
+    396.1000   1495.4000      0.0000      0.0000
+    396.7000   1495.4000      0.0000      0.0000
+    397.3000   1495.3800      0.0000      0.0000
+    397.9000   1495.3600      0.0000      0.0000
+    398.5000   1495.3500      0.0000      0.0000
+    399.2000   1495.3700      0.0000      0.0000
+    399.8000   1495.3600      0.0000      0.0000
+    400.4000   1495.3600      0.0000      0.0000
+    401.0000   1495.3700      0.0000      0.0000
+    401.6000   1495.3700      0.0000      0.0000
+    402.3000   1495.3900      0.0000      0.0000
+    402.9000   1495.3600      0.0000      0.0000
+    403.5000   1495.2200      0.0000      0.0000
+    404.1000   1494.9900      0.0000      0.0000
+    404.7000   1494.7400      0.0000      0.0000
+    405.4000   1494.5100      0.0000      0.0000
+    406.0000   1494.3600      0.0000      0.0000
+    406.6000   1494.2700      0.0000      0.0000
+    407.2000   1494.2300      0.0000      0.0000
+    407.8000   1494.1900      0.0000      0.0000
+    408.5000   1494.1100      0.0000      0.0000
+    409.1000   1494.0400      0.0000      0.0000
+    409.7000   1493.9800      0.0000      0.0000
+    410.3000   1493.9600      0.0000      0.0000
+    410.9000   1493.9500      0.0000      0.0000
+    411.6000   1493.9400      0.0000      0.0000
+    412.2000   1493.9400      0.0000      0.0000
+    412.8000   1493.8900      0.0000      0.0000
+    413.4000   1493.7800      0.0000      0.0000
+    414.0000   1493.7000      0.0000      0.0000
+    414.6000   1493.6500      0.0000      0.0000
+    415.3000   1493.5800      0.0000      0.0000
+    415.9000   1493.5100      0.0000      0.0000
+    416.5000   1493.4600      0.0000      0.0000
+    417.1000   1493.4300      0.0000      0.0000
+    417.7000   1493.4000      0.0000      0.0000
+    418.4000   1493.3800      0.0000      0.0000
+    419.0000   1493.3800      0.0000      0.0000
+    419.6000   1493.3700      0.0000      0.0000
+    420.2000   1493.3600      0.0000      0.0000
+    420.8000   1493.3300      0.0000      0.0000
+    421.5000   1493.3200      0.0000      0.0000
+    422.1000   1493.3100      0.0000      0.0000
+    422.7000   1493.2600      0.0000      0.0000
+    423.3000   1493.2300      0.0000      0.0000
+    423.9000   1493.2200      0.0000      0.0000
+    424.5000   1493.2000      0.0000      0.0000
+    425.2000   1493.1800      0.0000      0.0000
+    425.8000   1493.1400      0.0000      0.0000
+    426.4000   1493.0700      0.0000      0.0000
+    427.0000   1492.9900      0.0000      0.0000
+    427.6000   1492.9400      0.0000      0.0000
+    428.3000   1492.8900      0.0000      0.0000
+    428.9000   1492.8500      0.0000      0.0000
+    429.5000   1492.8000      0.0000      0.0000
+    430.1000   1492.7800      0.0000      0.0000
+    430.7000   1492.7600      0.0000      0.0000
+    431.3000   1492.7400      0.0000      0.0000
+    432.0000   1492.7300      0.0000      0.0000
+    432.6000   1492.7200      0.0000      0.0000
+    433.2000   1492.7100      0.0000      0.0000
+    433.8000   1492.7100      0.0000      0.0000
+    434.4000   1492.7100      0.0000      0.0000
+    435.0000   1492.7000      0.0000      0.0000
+    435.7000   1492.7000      0.0000      0.0000
+    436.3000   1492.7000      0.0000      0.0000
+    436.9000   1492.6900      0.0000      0.0000
+    437.5000   1492.6800      0.0000      0.0000
+    438.1000   1492.6600      0.0000      0.0000
+    438.8000   1492.6300      0.0000      0.0000
+    439.4000   1492.6300      0.0000      0.0000
+    440.0000   1492.6200      0.0000      0.0000
+    440.6000   1492.5800      0.0000      0.0000
+    441.2000   1492.4900      0.0000      0.0000
+    441.8000   1492.4200      0.0000      0.0000
+    442.5000   1492.3400      0.0000      0.0000
+    443.1000   1492.3000      0.0000      0.0000
+    443.7000   1492.2600      0.0000      0.0000
+    444.3000   1492.2000      0.0000      0.0000
+    444.9000   1492.1400      0.0000      0.0000
+    445.5000   1492.1200      0.0000      0.0000
+    446.2000   1492.1000      0.0000      0.0000
+    446.8000   1492.0800      0.0000      0.0000
+    447.4000   1492.0700      0.0000      0.0000
+    448.0000   1492.0700      0.0000      0.0000
+    448.6000   1492.0100      0.0000      0.0000
+    449.2000   1491.9600      0.0000      0.0000
+    449.9000   1491.9100      0.0000      0.0000
+    450.5000   1491.8400      0.0000      0.0000
+    451.1000   1491.7300      0.0000      0.0000
+    451.7000   1491.6600      0.0000      0.0000
+    452.3000   1491.6400      0.0000      0.0000
+    452.9000   1491.6300      0.0000      0.0000
+    453.6000   1491.6400      0.0000      0.0000
+    454.2000   1491.6500      0.0000      0.0000
+    454.8000   1491.6500      0.0000      0.0000
+    455.4000   1491.6400      0.0000      0.0000
+    456.0000   1491.6200      0.0000      0.0000
+    456.6000   1491.5900      0.0000      0.0000
+    457.3000   1491.5400      0.0000      0.0000
+    457.9000   1491.4900      0.0000      0.0000
+    458.5000   1491.4100      0.0000      0.0000
+    459.1000   1491.3200      0.0000      0.0000
+    459.7000   1491.2000      0.0000      0.0000
+    460.3000   1491.0800      0.0000      0.0000
+    460.9000   1491.0100      0.0000      0.0000
+    461.6000   1490.9600      0.0000      0.0000
+    462.2000   1490.8900      0.0000      0.0000
+    462.8000   1490.7600      0.0000      0.0000
+    463.4000   1490.6300      0.0000      0.0000
+    464.0000   1490.5300      0.0000      0.0000
+    464.6000   1490.4500      0.0000      0.0000
+    465.3000   1490.4200      0.0000      0.0000
+    465.9000   1490.4000      0.0000      0.0000
+    466.5000   1490.3400      0.0000      0.0000
+    467.1000   1490.2400      0.0000      0.0000
+    467.7000   1490.1500      0.0000      0.0000
+    468.3000   1490.0700      0.0000      0.0000
+    468.9000   1489.9900      0.0000      0.0000
+    469.6000   1489.9300      0.0000      0.0000
+    470.2000   1489.9000      0.0000      0.0000
+    470.8000   1489.8700      0.0000      0.0000
+    471.4000   1489.8500      0.0000      0.0000
+    472.0000   1489.8000      0.0000      0.0000
+    472.6000   1489.7400      0.0000      0.0000
+    473.2000   1489.6900      0.0000      0.0000
+    473.9000   1489.6400      0.0000      0.0000
+    474.5000   1489.5800      0.0000      0.0000
+    475.1000   1489.5500      0.0000      0.0000
+    475.7000   1489.5400      0.0000      0.0000
+    476.3000   1489.5500      0.0000      0.0000
+    476.9000   1489.5500      0.0000      0.0000
+    477.6000   1489.5500      0.0000      0.0000
+    478.2000   1489.5200      0.0000      0.0000
+    478.8000   1489.4500      0.0000      0.0000
+    479.4000   1489.3800      0.0000      0.0000
+    480.0000   1489.3200      0.0000      0.0000
+    480.6000   1489.2800      0.0000      0.0000
+    481.2000   1489.2300      0.0000      0.0000
+    481.9000   1489.2100      0.0000      0.0000
+    482.5000   1489.2000      0.0000      0.0000
+    483.1000   1489.1900      0.0000      0.0000
+    483.7000   1489.1500      0.0000      0.0000
+    484.3000   1489.1200      0.0000      0.0000
+    484.9000   1489.0400      0.0000      0.0000
+    485.5000   1488.9400      0.0000      0.0000
+    486.2000   1488.8900      0.0000      0.0000
+    486.8000   1488.8800      0.0000      0.0000
+    487.4000   1488.8600      0.0000      0.0000
+    488.0000   1488.8000      0.0000      0.0000
+    488.6000   1488.7100      0.0000      0.0000
+    489.2000   1488.6200      0.0000      0.0000
+    489.8000   1488.5400      0.0000      0.0000
+    490.4000   1488.4700      0.0000      0.0000
+    491.1000   1488.4200      0.0000      0.0000
+    491.7000   1488.3800      0.0000      0.0000
+    492.3000   1488.3300      0.0000      0.0000
+    492.9000   1488.2800      0.0000      0.0000
+    493.5000   1488.2200      0.0000      0.0000
+    494.1000   1488.1900      0.0000      0.0000
+    494.7000   1488.1600      0.0000      0.0000
+    495.4000   1488.1400      0.0000      0.0000
+    496.0000   1488.1200      0.0000      0.0000
+    496.6000   1488.0900      0.0000      0.0000
+    497.2000   1488.0900      0.0000      0.0000
+    497.8000   1488.0900      0.0000      0.0000
+    498.4000   1488.1000      0.0000      0.0000
+    499.0000   1488.0900      0.0000      0.0000
+    499.6000   1488.0900      0.0000      0.0000
+    500.3000   1488.0900      0.0000      0.0000
+    500.9000   1488.0500      0.0000      0.0000
+    501.5000   1487.9500      0.0000      0.0000
+    502.1000   1487.8700      0.0000      0.0000
+    502.7000   1487.8000      0.0000      0.0000
+    503.3000   1487.8000      0.0000      0.0000
+    503.9000   1487.7800      0.0000      0.0000
+    504.5000   1487.7300      0.0000      0.0000
+    505.2000   1487.6900      0.0000      0.0000
+    505.8000   1487.6800      0.0000      0.0000
+    506.4000   1487.6500      0.0000      0.0000
+    507.0000   1487.6000      0.0000      0.0000
+    507.6000   1487.5800      0.0000      0.0000
+    508.2000   1487.5400      0.0000      0.0000
+    508.8000   1487.4600      0.0000      0.0000
+    509.4000   1487.3900      0.0000      0.0000
+    510.1000   1487.2800      0.0000      0.0000
+    510.7000   1487.1800      0.0000      0.0000
+    511.3000   1487.1200      0.0000      0.0000
+    511.9000   1487.0600      0.0000      0.0000
+    512.5000   1486.9800      0.0000      0.0000
+    513.1000   1486.9000      0.0000      0.0000
+    513.7000   1486.7900      0.0000      0.0000
+    514.3000   1486.7000      0.0000      0.0000
+    515.0000   1486.6100      0.0000      0.0000
+    515.6000   1486.5200      0.0000      0.0000
+    516.2000   1486.4200      0.0000      0.0000
+    516.8000   1486.3300      0.0000      0.0000
+    517.4000   1486.2500      0.0000      0.0000
+    518.0000   1486.1700      0.0000      0.0000
+    518.6000   1486.0800      0.0000      0.0000
+    519.2000   1485.9900      0.0000      0.0000
+    519.9000   1485.9200      0.0000      0.0000
+    520.5000   1485.8600      0.0000      0.0000
+    521.1000   1485.7900      0.0000      0.0000
+    521.7000   1485.7500      0.0000      0.0000
+    522.3000   1485.7100      0.0000      0.0000
+    522.9000   1485.6800      0.0000      0.0000
+    523.5000   1485.6400      0.0000      0.0000
+    524.1000   1485.6100      0.0000      0.0000
+    524.7000   1485.5800      0.0000      0.0000
+    525.4000   1485.5700      0.0000      0.0000
+    526.0000   1485.5600      0.0000      0.0000
+    526.6000   1485.5500      0.0000      0.0000
+    527.2000   1485.5300      0.0000      0.0000
+    527.8000   1485.5100      0.0000      0.0000
+    528.4000   1485.5000      0.0000      0.0000
+    529.0000   1485.4900      0.0000      0.0000
+    529.6000   1485.4800      0.0000      0.0000
+    530.2000   1485.4600      0.0000      0.0000
+    530.9000   1485.4600      0.0000      0.0000
+    531.5000   1485.4400      0.0000      0.0000
+    532.1000   1485.4400      0.0000      0.0000
+    532.7000   1485.4400      0.0000      0.0000
+    533.3000   1485.4200      0.0000      0.0000
+    533.9000   1485.3900      0.0000      0.0000
+    534.5000   1485.3600      0.0000      0.0000
+    535.1000   1485.3100      0.0000      0.0000
+    535.7000   1485.2300      0.0000      0.0000
+    536.3000   1485.1500      0.0000      0.0000
+    537.0000   1485.1000      0.0000      0.0000
+    537.6000   1485.0400      0.0000      0.0000
+    538.2000   1484.9900      0.0000      0.0000
+    538.8000   1484.9700      0.0000      0.0000
+    539.4000   1484.9600      0.0000      0.0000
+    540.0000   1484.9400      0.0000      0.0000
+    540.6000   1484.9100      0.0000      0.0000
+    541.2000   1484.9100      0.0000      0.0000
+    541.8000   1484.8900      0.0000      0.0000
+    542.4000   1484.8800      0.0000      0.0000
+    543.1000   1484.8900      0.0000      0.0000
+    543.7000   1484.8900      0.0000      0.0000
+    544.3000   1484.8800      0.0000      0.0000
+    544.9000   1484.8700      0.0000      0.0000
+    545.5000   1484.8800      0.0000      0.0000
+    546.1000   1484.8800      0.0000      0.0000
+    546.7000   1484.8800      0.0000      0.0000
+    547.3000   1484.8900      0.0000      0.0000
+    547.9000   1484.8800      0.0000      0.0000
+    548.5000   1484.8800      0.0000      0.0000
+    549.2000   1484.8600      0.0000      0.0000
+    549.8000   1484.8100      0.0000      0.0000
+    550.4000   1484.7700      0.0000      0.0000
+    551.0000   1484.7600      0.0000      0.0000
+    551.6000   1484.7600      0.0000      0.0000
+    552.2000   1484.7400      0.0000      0.0000
+    552.8000   1484.7000      0.0000      0.0000
+    553.4000   1484.6500      0.0000      0.0000
+    554.0000   1484.6200      0.0000      0.0000
+    554.6000   1484.6100      0.0000      0.0000
+    555.2000   1484.6100      0.0000      0.0000
+    555.9000   1484.6200      0.0000      0.0000
+    556.5000   1484.6300      0.0000      0.0000
+    557.1000   1484.6400      0.0000      0.0000
+    557.7000   1484.6300      0.0000      0.0000
+    558.3000   1484.6100      0.0000      0.0000
+    558.9000   1484.5500      0.0000      0.0000
+    559.5000   1484.5200      0.0000      0.0000
+    560.1000   1484.4900      0.0000      0.0000
+    560.7000   1484.4500      0.0000      0.0000
+    561.3000   1484.3600      0.0000      0.0000
+    561.9000   1484.2700      0.0000      0.0000
+    562.6000   1484.2500      0.0000      0.0000
+    563.2000   1484.2400      0.0000      0.0000
+    563.8000   1484.2400      0.0000      0.0000
+    564.4000   1484.2500      0.0000      0.0000
+    565.0000   1484.2600      0.0000      0.0000
+    565.6000   1484.2400      0.0000      0.0000
+    566.2000   1484.2100      0.0000      0.0000
+    566.8000   1484.1900      0.0000      0.0000
+    567.4000   1484.1700      0.0000      0.0000
+    568.0000   1484.1500      0.0000      0.0000
+    568.6000   1484.1200      0.0000      0.0000
+    569.2000   1484.0900      0.0000      0.0000
+    569.8000   1484.0900      0.0000      0.0000
+    570.5000   1484.0900      0.0000      0.0000
+    571.1000   1484.1000      0.0000      0.0000
+    571.7000   1484.1000      0.0000      0.0000
+    572.3000   1484.0900      0.0000      0.0000
+    572.9000   1484.0700      0.0000      0.0000
+    573.5000   1484.0400      0.0000      0.0000
+    574.1000   1484.0200      0.0000      0.0000
+    574.7000   1483.9700      0.0000      0.0000
+    575.3000   1483.8800      0.0000      0.0000
+    575.9000   1483.8100      0.0000      0.0000
+    576.5000   1483.7700      0.0000      0.0000
+    577.1000   1483.7600      0.0000      0.0000
+    577.7000   1483.7400      0.0000      0.0000
+    578.4000   1483.7100      0.0000      0.0000
+    579.0000   1483.6800      0.0000      0.0000
+    579.6000   1483.6400      0.0000      0.0000
+    580.2000   1483.6100      0.0000      0.0000
+    580.8000   1483.5900      0.0000      0.0000
+    581.4000   1483.5600      0.0000      0.0000
+    582.0000   1483.5600      0.0000      0.0000
+    582.6000   1483.5400      0.0000      0.0000
+    583.2000   1483.5300      0.0000      0.0000
+    583.8000   1483.5300      0.0000      0.0000
+    584.4000   1483.5200      0.0000      0.0000
+    585.0000   1483.5200      0.0000      0.0000
+    585.6000   1483.5200      0.0000      0.0000
+    586.2000   1483.5100      0.0000      0.0000
+    586.9000   1483.4800      0.0000      0.0000
+    587.5000   1483.4500      0.0000      0.0000
+    588.1000   1483.4000      0.0000      0.0000
+    588.7000   1483.3600      0.0000      0.0000
+    589.3000   1483.3000      0.0000      0.0000
+    589.9000   1483.2600      0.0000      0.0000
+    590.5000   1483.2400      0.0000      0.0000
+    591.1000   1483.2100      0.0000      0.0000
+    591.7000   1483.2000      0.0000      0.0000
+    592.3000   1483.1800      0.0000      0.0000
+    592.9000   1483.1600      0.0000      0.0000
+    593.5000   1483.1300      0.0000      0.0000
+    594.1000   1483.1000      0.0000      0.0000
+    594.7000   1483.0600      0.0000      0.0000
+    595.3000   1483.0400      0.0000      0.0000
+    596.0000   1483.0200      0.0000      0.0000
+    596.6000   1483.0100      0.0000      0.0000
+    597.2000   1483.0200      0.0000      0.0000
+    597.8000   1483.0300      0.0000      0.0000
+    598.4000   1483.0500      0.0000      0.0000
+    599.0000   1483.0500      0.0000      0.0000
+    599.6000   1483.0700      0.0000      0.0000
+    600.2000   1483.0700      0.0000      0.0000
+    600.8000   1483.0800      0.0000      0.0000
+    601.4000   1483.0900      0.0000      0.0000
+    602.0000   1483.0900      0.0000      0.0000
+    602.6000   1483.0600      0.0000      0.0000
+    603.2000   1483.0200      0.0000      0.0000
+    603.8000   1483.0000      0.0000      0.0000
+    604.4000   1482.9800      0.0000      0.0000
+    605.0000   1482.9600      0.0000      0.0000
+    605.6000   1482.9500      0.0000      0.0000
+    606.2000   1482.9300      0.0000      0.0000
+    606.9000   1482.9200      0.0000      0.0000
+    607.5000   1482.9200      0.0000      0.0000
+    608.1000   1482.9300      0.0000      0.0000
+    608.7000   1482.9100      0.0000      0.0000
+    609.3000   1482.8900      0.0000      0.0000
+    609.9000   1482.8800      0.0000      0.0000
+    610.5000   1482.8700      0.0000      0.0000
+    611.1000   1482.8500      0.0000      0.0000
+    611.7000   1482.8300      0.0000      0.0000
+    612.3000   1482.8000      0.0000      0.0000
+    612.9000   1482.7700      0.0000      0.0000
+    613.5000   1482.7700      0.0000      0.0000
+    614.1000   1482.7700      0.0000      0.0000
+    614.7000   1482.7600      0.0000      0.0000
+    615.3000   1482.7400      0.0000      0.0000
+    615.9000   1482.6700      0.0000      0.0000
+    616.5000   1482.6400      0.0000      0.0000
+    617.1000   1482.6200      0.0000      0.0000
+    617.7000   1482.6100      0.0000      0.0000
+    618.3000   1482.5900      0.0000      0.0000
+    619.0000   1482.5800      0.0000      0.0000
+    619.6000   1482.5800      0.0000      0.0000
+    620.2000   1482.5400      0.0000      0.0000
+    620.8000   1482.4800      0.0000      0.0000
+    621.4000   1482.4500      0.0000      0.0000
+    622.0000   1482.4500      0.0000      0.0000
+    622.6000   1482.4300      0.0000      0.0000
+    623.2000   1482.4000      0.0000      0.0000
+    623.8000   1482.3700      0.0000      0.0000
+    624.4000   1482.3800      0.0000      0.0000
+    625.0000   1482.4000      0.0000      0.0000
+    625.6000   1482.4200      0.0000      0.0000
+    626.2000   1482.4000      0.0000      0.0000
+    626.8000   1482.3300      0.0000      0.0000
+    627.4000   1482.2500      0.0000      0.0000
+    628.0000   1482.1800      0.0000      0.0000
+    628.6000   1482.1600      0.0000      0.0000
+    629.2000   1482.1400      0.0000      0.0000
+    629.8000   1482.1500      0.0000      0.0000
+    630.4000   1482.1500      0.0000      0.0000
+    631.0000   1482.1500      0.0000      0.0000
+    631.6000   1482.1400      0.0000      0.0000
+    632.2000   1482.1300      0.0000      0.0000
+    632.8000   1482.1300      0.0000      0.0000
+    633.4000   1482.1300      0.0000      0.0000
+    634.1000   1482.1300      0.0000      0.0000
+    634.7000   1482.1100      0.0000      0.0000
+    635.3000   1482.1100      0.0000      0.0000
+    635.9000   1482.1100      0.0000      0.0000
+    636.5000   1482.0900      0.0000      0.0000
+    637.1000   1482.1000      0.0000      0.0000
+    637.7000   1482.1000      0.0000      0.0000
+    638.3000   1482.1000      0.0000      0.0000
+    638.9000   1482.1000      0.0000      0.0000
+    639.5000   1482.1000      0.0000      0.0000
+    640.1000   1482.1000      0.0000      0.0000
+    640.7000   1482.1100      0.0000      0.0000
+    641.3000   1482.1000      0.0000      0.0000
+    641.9000   1482.0900      0.0000      0.0000
+    642.5000   1482.0900      0.0000      0.0000
+    643.1000   1482.1100      0.0000      0.0000
+    643.7000   1482.1000      0.0000      0.0000
+    644.3000   1482.1000      0.0000      0.0000
+    644.9000   1482.0900      0.0000      0.0000
+    645.5000   1482.0500      0.0000      0.0000
+    646.1000   1482.0000      0.0000      0.0000
+    646.7000   1481.9600      0.0000      0.0000
+    647.3000   1481.9300      0.0000      0.0000
+    647.9000   1481.9200      0.0000      0.0000
+    648.5000   1481.9200      0.0000      0.0000
+    649.1000   1481.9100      0.0000      0.0000
+    649.7000   1481.9000      0.0000      0.0000
+    650.3000   1481.9000      0.0000      0.0000
+    650.9000   1481.8900      0.0000      0.0000
+    651.5000   1481.8800      0.0000      0.0000
+    652.1000   1481.8800      0.0000      0.0000
+    652.7000   1481.8700      0.0000      0.0000
+    653.3000   1481.8600      0.0000      0.0000
+    653.9000   1481.8700      0.0000      0.0000
+    654.5000   1481.8700      0.0000      0.0000
+    655.1000   1481.8700      0.0000      0.0000
+    655.7000   1481.8700      0.0000      0.0000
+    656.3000   1481.8800      0.0000      0.0000
+    656.9000   1481.8800      0.0000      0.0000
+    657.6000   1481.8700      0.0000      0.0000
+    658.2000   1481.8600      0.0000      0.0000
+    658.8000   1481.8400      0.0000      0.0000
+    659.4000   1481.7900      0.0000      0.0000
+    660.0000   1481.7400      0.0000      0.0000
+    660.6000   1481.7100      0.0000      0.0000
+    661.2000   1481.7000      0.0000      0.0000
+    661.8000   1481.7000      0.0000      0.0000
+    662.4000   1481.7000      0.0000      0.0000
+    663.0000   1481.7100      0.0000      0.0000
+    663.6000   1481.7000      0.0000      0.0000
+    664.2000   1481.7000      0.0000      0.0000
+    664.8000   1481.7000      0.0000      0.0000
+    665.4000   1481.7000      0.0000      0.0000
+    666.0000   1481.7000      0.0000      0.0000
+    666.6000   1481.6900      0.0000      0.0000
+    667.2000   1481.6800      0.0000      0.0000
+    667.8000   1481.6700      0.0000      0.0000
+    668.4000   1481.6900      0.0000      0.0000
+    669.0000   1481.7300      0.0000      0.0000
+    669.6000   1481.7500      0.0000      0.0000
+    670.2000   1481.7500      0.0000      0.0000
+    670.8000   1481.7300      0.0000      0.0000
+    671.4000   1481.7200      0.0000      0.0000
+    672.0000   1481.7200      0.0000      0.0000
+    672.6000   1481.7300      0.0000      0.0000
+    673.2000   1481.7300      0.0000      0.0000
+    673.8000   1481.7100      0.0000      0.0000
+    674.4000   1481.7000      0.0000      0.0000
+    675.0000   1481.7000      0.0000      0.0000
+    675.6000   1481.7000      0.0000      0.0000
+    676.2000   1481.7000      0.0000      0.0000
+    676.8000   1481.7000      0.0000      0.0000
+    677.4000   1481.7200      0.0000      0.0000
+    678.0000   1481.7200      0.0000      0.0000
+    678.6000   1481.7300      0.0000      0.0000
+    679.2000   1481.7100      0.0000      0.0000
+    679.8000   1481.7200      0.0000      0.0000
+    680.4000   1481.7400      0.0000      0.0000
+    681.0000   1481.7200      0.0000      0.0000
+    681.6000   1481.7000      0.0000      0.0000
+    682.2000   1481.7000      0.0000      0.0000
+    682.8000   1481.6900      0.0000      0.0000
+    683.4000   1481.6900      0.0000      0.0000
+    684.0000   1481.6800      0.0000      0.0000
+    684.6000   1481.7000      0.0000      0.0000
+    685.2000   1481.6900      0.0000      0.0000
+    685.8000   1481.7000      0.0000      0.0000
+    686.4000   1481.6900      0.0000      0.0000
+    687.0000   1481.7000      0.0000      0.0000
+    687.6000   1481.7100      0.0000      0.0000
+    688.2000   1481.7100      0.0000      0.0000
+    688.8000   1481.7200      0.0000      0.0000
+    689.4000   1481.7100      0.0000      0.0000
+    690.0000   1481.7000      0.0000      0.0000
+    690.6000   1481.7200      0.0000      0.0000
+    691.2000   1481.7300      0.0000      0.0000
+    691.8000   1481.7300      0.0000      0.0000
+    692.4000   1481.7300      0.0000      0.0000
+    693.0000   1481.7400      0.0000      0.0000
+    693.6000   1481.7300      0.0000      0.0000
+    694.2000   1481.7200      0.0000      0.0000
+    694.8000   1481.7200      0.0000      0.0000
+    695.4000   1481.7400      0.0000      0.0000
+    696.0000   1481.7700      0.0000      0.0000
+    696.6000   1481.7800      0.0000      0.0000
+    697.2000   1481.7900      0.0000      0.0000
+    697.8000   1481.7900      0.0000      0.0000
+    698.4000   1481.8000      0.0000      0.0000
+    699.0000   1481.8000      0.0000      0.0000
+    699.6000   1481.8000      0.0000      0.0000
+    700.2000   1481.8000      0.0000      0.0000
+    700.8000   1481.7900      0.0000      0.0000
+    701.4000   1481.7800      0.0000      0.0000
+    702.0000   1481.7700      0.0000      0.0000
+    702.6000   1481.7800      0.0000      0.0000
+    703.2000   1481.7900      0.0000      0.0000
+    703.8000   1481.8000      0.0000      0.0000
+    704.4000   1481.8000      0.0000      0.0000
+    705.0000   1481.8100      0.0000      0.0000
+    705.5000   1481.8000      0.0000      0.0000
+    706.1000   1481.8000      0.0000      0.0000
+    706.7000   1481.8100      0.0000      0.0000
+    707.3000   1481.8000      0.0000      0.0000
+    707.9000   1481.8000      0.0000      0.0000
+    708.5000   1481.8100      0.0000      0.0000
+    709.1000   1481.8200      0.0000      0.0000
+    709.7000   1481.8300      0.0000      0.0000
+    710.3000   1481.8400      0.0000      0.0000
+    710.9000   1481.8600      0.0000      0.0000
+    711.5000   1481.8700      0.0000      0.0000
+    712.1000   1481.8700      0.0000      0.0000
+    712.7000   1481.8900      0.0000      0.0000
+    713.3000   1481.9100      0.0000      0.0000
+    713.9000   1481.9200      0.0000      0.0000
+    714.5000   1481.9300      0.0000      0.0000
+    715.1000   1481.9500      0.0000      0.0000
+    715.7000   1481.9400      0.0000      0.0000
+    716.3000   1481.9400      0.0000      0.0000
+    716.9000   1481.9700      0.0000      0.0000
+    717.5000   1481.9800      0.0000      0.0000
+    718.1000   1481.9900      0.0000      0.0000
+    718.7000   1482.0100      0.0000      0.0000
+    719.3000   1482.0200      0.0000      0.0000
+    719.9000   1482.0100      0.0000      0.0000
+    720.5000   1482.0200      0.0000      0.0000
+    721.1000   1482.0200      0.0000      0.0000
+    721.7000   1482.0300      0.0000      0.0000
+    722.3000   1482.0600      0.0000      0.0000
+    722.9000   1482.1300      0.0000      0.0000
+    723.5000   1482.2200      0.0000      0.0000
+    724.1000   1482.2900      0.0000      0.0000
+    724.7000   1482.3700      0.0000      0.0000
+    725.3000   1482.4500      0.0000      0.0000
+    725.9000   1482.5100      0.0000      0.0000
+    726.5000   1482.5800      0.0000      0.0000
+    727.1000   1482.6000      0.0000      0.0000
+    727.7000   1482.6200      0.0000      0.0000
+    728.3000   1482.6600      0.0000      0.0000
+    728.8000   1482.6900      0.0000      0.0000
+    729.4000   1482.7100      0.0000      0.0000
+    730.0000   1482.7400      0.0000      0.0000
+    730.6000   1482.7700      0.0000      0.0000
+    731.2000   1482.7900      0.0000      0.0000
+    731.8000   1482.7900      0.0000      0.0000
+    732.4000   1482.7900      0.0000      0.0000
+    733.0000   1482.8200      0.0000      0.0000
+    733.6000   1482.8400      0.0000      0.0000
+    734.2000   1482.8600      0.0000      0.0000
+    734.8000   1482.8700      0.0000      0.0000
+    735.4000   1482.8800      0.0000      0.0000
+    736.0000   1482.9000      0.0000      0.0000
+    736.6000   1482.9100      0.0000      0.0000
+    737.2000   1482.9100      0.0000      0.0000
+    737.8000   1482.9000      0.0000      0.0000
+    738.4000   1482.8900      0.0000      0.0000
+    739.0000   1482.9000      0.0000      0.0000
+    739.6000   1482.9000      0.0000      0.0000
+    740.2000   1482.9100      0.0000      0.0000
+    740.8000   1482.9400      0.0000      0.0000
+    741.4000   1482.9800      0.0000      0.0000
+    742.0000   1483.0300      0.0000      0.0000
+    742.6000   1483.0500      0.0000      0.0000
+    743.2000   1483.0500      0.0000      0.0000
+    743.7000   1483.0600      0.0000      0.0000
+    744.3000   1483.0900      0.0000      0.0000
+    744.9000   1483.1000      0.0000      0.0000
+    745.5000   1483.1000      0.0000      0.0000
+    746.1000   1483.1100      0.0000      0.0000
+    746.7000   1483.1300      0.0000      0.0000
+    747.3000   1483.1400      0.0000      0.0000
+    747.9000   1483.1500      0.0000      0.0000
+    748.5000   1483.1400      0.0000      0.0000
+    749.1000   1483.1500      0.0000      0.0000
+    749.7000   1483.1500      0.0000      0.0000
+    750.3000   1483.1700      0.0000      0.0000
+    750.9000   1483.1700      0.0000      0.0000
+    751.5000   1483.1900      0.0000      0.0000
+    752.1000   1483.2000      0.0000      0.0000
+    752.7000   1483.2000      0.0000      0.0000
+    753.3000   1483.2000      0.0000      0.0000
+    753.9000   1483.1700      0.0000      0.0000
+    754.5000   1483.1600      0.0000      0.0000
+    755.1000   1483.1500      0.0000      0.0000
+    755.7000   1483.1600      0.0000      0.0000
+    756.2000   1483.1700      0.0000      0.0000
+    756.8000   1483.2000      0.0000      0.0000
+    757.4000   1483.2100      0.0000      0.0000
+    758.0000   1483.2200      0.0000      0.0000
+    758.6000   1483.2300      0.0000      0.0000
+    759.2000   1483.2500      0.0000      0.0000
+    759.8000   1483.2600      0.0000      0.0000
+    760.4000   1483.2600      0.0000      0.0000
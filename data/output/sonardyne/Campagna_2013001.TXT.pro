@@ -0,0 +1,269 @@
+test_read_store_and_write
+14/6/2013
+18:52:11
+Probe: Idronaut
+Source: /root/package/data/input/idronaut/Campagna_2013001.TXT
+      1.0000   1525.7770     37.6450     20.4901
+      2.0000   1525.2380     37.6450     20.2889
+      3.0000   1525.1410     37.6531     20.2467
+      4.0000   1525.0200     37.6598     20.1966
+      5.0000   1525.0620     37.6618     20.2080
+      6.0000   1525.1070     37.6627     20.2210
+      7.0000   1525.1370     37.6635     20.2288
+      8.0000   1525.1570     37.6638     20.2328
+      9.0000   1525.1600     37.6642     20.2305
+     10.0000   1525.1390     37.6611     20.2211
+     11.0000   1525.0020     37.6640     20.1635
+     12.0000   1524.9700     37.6668     20.1447
+     13.0000   1524.9130     37.6671     20.1175
+     14.0000   1524.8840     37.6663     20.1013
+     15.0000   1524.7980     37.6666     20.0637
+     16.0000   1524.7030     37.6671     20.0227
+     17.0000   1524.6100     37.6675     19.9825
+     18.0000   1524.5210     37.6683     19.9434
+     19.0000   1524.4440     37.6688     19.9089
+     20.0000   1524.3890     37.6727     19.8812
+     21.0000   1524.3810     37.6730     19.8723
+     22.0000   1524.3720     37.6737     19.8624
+     23.0000   1524.3610     37.6749     19.8518
+     24.0000   1524.3500     37.6760     19.8413
+     25.0000   1524.3380     37.6769     19.8307
+     26.0000   1524.3210     37.6775     19.8180
+     27.0000   1524.2820     37.6772     19.7981
+     28.0000   1524.1960     37.6714     19.7631
+     29.0000   1524.0200     37.6659     19.6961
+     30.0000   1523.8130     37.6653     19.6160
+     31.0000   1523.5850     37.6611     19.5299
+     32.0000   1523.2710     37.6514     19.4158
+     33.0000   1522.9120     37.6447     19.2847
+     34.0000   1522.5250     37.6384     19.1439
+     35.0000   1522.1360     37.6329     19.0019
+     36.0000   1521.7450     37.6270     18.8597
+     37.0000   1521.3440     37.6157     18.7160
+     38.0000   1520.9340     37.6136     18.5666
+     39.0000   1520.5820     37.6115     18.4381
+     40.0000   1520.2560     37.6044     18.3213
+     41.0000   1519.9390     37.5988     18.2071
+     42.0000   1519.6830     37.5977     18.1126
+     43.0000   1519.4440     37.5958     18.0251
+     44.0000   1519.2010     37.5918     17.9371
+     45.0000   1518.9370     37.5904     17.8409
+     46.0000   1518.6610     37.5903     17.7406
+     47.0000   1518.3910     37.5953     17.6404
+     48.0000   1518.1360     37.5981     17.5464
+     49.0000   1517.8710     37.6001     17.4496
+     50.0000   1517.5350     37.5997     17.3303
+     51.0000   1517.1810     37.6046     17.2031
+     52.0000   1516.8280     37.6090     17.0769
+     53.0000   1516.4740     37.6108     16.9515
+     54.0000   1516.1080     37.6142     16.8223
+     55.0000   1515.7300     37.6170     16.6894
+     56.0000   1515.3570     37.6191     16.5587
+     57.0000   1515.0010     37.6228     16.4331
+     58.0000   1514.6610     37.6263     16.3135
+     59.0000   1514.3540     37.6311     16.2042
+     60.0000   1514.1060     37.6391     16.1140
+     61.0000   1513.8730     37.6447     16.0299
+     62.0000   1513.6370     37.6521     15.9442
+     63.0000   1513.3900     37.6614     15.8545
+     64.0000   1513.1570     37.6713     15.7695
+     65.0000   1512.9440     37.6789     15.6918
+     66.0000   1512.7350     37.6863     15.6159
+     67.0000   1512.5520     37.6964     15.5471
+     68.0000   1512.3720     37.7030     15.4811
+     69.0000   1512.2260     37.7131     15.4246
+     70.0000   1512.0940     37.7228     15.3725
+     71.0000   1511.9980     37.7354     15.3315
+     72.0000   1511.9450     37.7492     15.3036
+     73.0000   1511.9570     37.7667     15.2955
+     74.0000   1512.0050     37.7831     15.2994
+     75.0000   1512.0700     37.7979     15.3096
+     76.0000   1512.1340     37.8137     15.3189
+     77.0000   1512.1900     37.8277     15.3262
+     78.0000   1512.2600     37.8416     15.3382
+     79.0000   1512.3010     37.8527     15.3418
+     80.0000   1512.3460     37.8643     15.3466
+     81.0000   1512.3830     37.8742     15.3496
+     82.0000   1512.3860     37.8703     15.3466
+     83.0000   1512.3340     37.8666     15.3259
+     84.0000   1512.2930     37.8746     15.3042
+     85.0000   1512.2680     37.8814     15.2883
+     86.0000   1512.2120     37.8727     15.2681
+     87.0000   1512.0950     37.8701     15.2261
+     88.0000   1511.9790     37.8719     15.1829
+     89.0000   1511.8540     37.8698     15.1384
+     90.0000   1511.7070     37.8708     15.0858
+     91.0000   1511.5470     37.8672     15.0306
+     92.0000   1511.3980     37.8753     14.9745
+     93.0000   1511.2660     37.8776     14.9262
+     94.0000   1511.1230     37.8723     14.8772
+     95.0000   1510.9730     37.8689     14.8255
+     96.0000   1510.9720     37.8914     14.8112
+     97.0000   1511.0320     37.9055     14.8198
+     98.0000   1511.1340     37.9270     14.8391
+     99.0000   1511.2750     37.9447     14.8723
+    100.0000   1511.4900     37.9721     14.9255
+    101.0000   1511.7580     38.0033     14.9943
+    102.0000   1512.0430     38.0336     15.0691
+    103.0000   1512.3410     38.0645     15.1476
+    104.0000   1512.6140     38.0891     15.2203
+    105.0000   1512.8910     38.1198     15.2921
+    106.0000   1513.0420     38.1360     15.3293
+    107.0000   1513.1930     38.1548     15.3654
+    108.0000   1513.2430     38.1468     15.3789
+    109.0000   1513.0850     38.1444     15.3244
+    110.0000   1512.8590     38.1297     15.2524
+    111.0000   1512.5960     38.1174     15.1673
+    112.0000   1512.3350     38.1063     15.0826
+    113.0000   1512.0610     38.0941     14.9942
+    114.0000   1511.7940     38.0843     14.9072
+    115.0000   1511.5130     38.0713     14.8169
+    116.0000   1511.2550     38.0630     14.7322
+    117.0000   1510.9920     38.0534     14.6466
+    118.0000   1510.7950     38.0614     14.5754
+    119.0000   1510.7870     38.0719     14.5638
+    120.0000   1510.8000     38.0827     14.5585
+    121.0000   1510.8070     38.0903     14.5528
+    122.0000   1510.8170     38.0995     14.5472
+    123.0000   1510.8530     38.1114     14.5488
+    124.0000   1510.9080     38.1256     14.5557
+    125.0000   1510.9710     38.1386     14.5657
+    126.0000   1511.0370     38.1518     14.5764
+    127.0000   1511.1150     38.1678     14.5898
+    128.0000   1511.1960     38.1842     14.6041
+    129.0000   1511.2720     38.1993     14.6173
+    130.0000   1511.3420     38.2132     14.6289
+    131.0000   1511.4110     38.2275     14.6401
+    132.0000   1511.4940     38.2453     14.6545
+    133.0000   1511.5740     38.2627     14.6682
+    134.0000   1511.6510     38.2794     14.6811
+    135.0000   1511.7260     38.2958     14.6935
+    136.0000   1511.7990     38.3120     14.7053
+    137.0000   1511.8630     38.3261     14.7150
+    138.0000   1511.9240     38.3399     14.7241
+    139.0000   1511.9920     38.3551     14.7348
+    140.0000   1512.0670     38.3714     14.7472
+    141.0000   1512.1420     38.3873     14.7598
+    142.0000   1512.2000     38.3989     14.7686
+    143.0000   1512.2520     38.4092     14.7759
+    144.0000   1512.3060     38.4198     14.7837
+    145.0000   1512.3600     38.4300     14.7918
+    146.0000   1512.4110     38.4396     14.7993
+    147.0000   1512.4590     38.4489     14.8058
+    148.0000   1512.5060     38.4589     14.8117
+    149.0000   1512.5480     38.4677     14.8165
+    150.0000   1512.5890     38.4760     14.8209
+    151.0000   1512.6350     38.4862     14.8265
+    152.0000   1512.6870     38.4988     14.8331
+    153.0000   1512.7430     38.5132     14.8403
+    154.0000   1512.7960     38.5274     14.8464
+    155.0000   1512.8450     38.5421     14.8515
+    156.0000   1512.8950     38.5575     14.8563
+    157.0000   1512.9470     38.5734     14.8616
+    158.0000   1513.0000     38.5885     14.8673
+    159.0000   1513.0530     38.6048     14.8730
+    160.0000   1513.1030     38.6202     14.8780
+    161.0000   1513.1460     38.6332     14.8814
+    162.0000   1513.1820     38.6436     14.8834
+    163.0000   1513.2120     38.6527     14.8845
+    164.0000   1513.2420     38.6620     14.8852
+    165.0000   1513.2690     38.6709     14.8853
+    166.0000   1513.2940     38.6794     14.8846
+    167.0000   1513.3150     38.6878     14.8830
+    168.0000   1513.3340     38.6961     14.8805
+    169.0000   1513.3470     38.7034     14.8767
+    170.0000   1513.3600     38.7110     14.8726
+    171.0000   1513.3690     38.7192     14.8671
+    172.0000   1513.3770     38.7270     14.8615
+    173.0000   1513.3830     38.7343     14.8553
+    174.0000   1513.3870     38.7409     14.8487
+    175.0000   1513.3910     38.7468     14.8425
+    176.0000   1513.3960     38.7518     14.8369
+    177.0000   1513.4010     38.7563     14.8314
+    178.0000   1513.4060     38.7607     14.8261
+    179.0000   1513.4110     38.7651     14.8206
+    180.0000   1513.4150     38.7695     14.8151
+    181.0000   1513.4220     38.7729     14.8108
+    182.0000   1513.4290     38.7765     14.8063
+    183.0000   1513.4380     38.7799     14.8024
+    184.0000   1513.4470     38.7825     14.7991
+    185.0000   1513.4560     38.7852     14.7955
+    186.0000   1513.4610     38.7885     14.7907
+    187.0000   1513.4670     38.7916     14.7862
+    188.0000   1513.4730     38.7944     14.7817
+    189.0000   1513.4790     38.7966     14.7775
+    190.0000   1513.4850     38.7986     14.7734
+    191.0000   1513.4910     38.8007     14.7690
+    192.0000   1513.4950     38.8021     14.7646
+    193.0000   1513.4970     38.8042     14.7591
+    194.0000   1513.4970     38.8069     14.7526
+    195.0000   1513.4960     38.8098     14.7460
+    196.0000   1513.4970     38.8120     14.7401
+    197.0000   1513.4970     38.8141     14.7340
+    198.0000   1513.4950     38.8165     14.7272
+    199.0000   1513.4930     38.8190     14.7205
+    200.0000   1513.4920     38.8215     14.7138
+    201.0000   1513.4910     38.8241     14.7071
+    202.0000   1513.4890     38.8269     14.7001
+    203.0000   1513.4870     38.8291     14.6934
+    204.0000   1513.4860     38.8309     14.6873
+    205.0000   1513.4850     38.8326     14.6811
+    206.0000   1513.4840     38.8344     14.6746
+    207.0000   1513.4820     38.8362     14.6680
+    208.0000   1513.4820     38.8377     14.6621
+    209.0000   1513.4840     38.8390     14.6569
+    210.0000   1513.4850     38.8400     14.6518
+    211.0000   1513.4860     38.8411     14.6462
+    212.0000   1513.4880     38.8425     14.6412
+    213.0000   1513.4940     38.8432     14.6373
+    214.0000   1513.5000     38.8442     14.6336
+    215.0000   1513.5050     38.8447     14.6296
+    216.0000   1513.5090     38.8454     14.6255
+    217.0000   1513.5150     38.8462     14.6218
+    218.0000   1513.5190     38.8466     14.6176
+    219.0000   1513.5170     38.8473     14.6115
+    220.0000   1513.5120     38.8481     14.6043
+    221.0000   1513.5080     38.8488     14.5975
+    222.0000   1513.5050     38.8494     14.5908
+    223.0000   1513.5000     38.8502     14.5839
+    224.0000   1513.4970     38.8510     14.5771
+    225.0000   1513.4960     38.8517     14.5713
+    226.0000   1513.4970     38.8521     14.5661
+    227.0000   1513.4980     38.8525     14.5609
+    228.0000   1513.5010     38.8530     14.5566
+    229.0000   1513.5110     38.8531     14.5544
+    230.0000   1513.5160     38.8529     14.5508
+    231.0000   1513.5160     38.8528     14.5454
+    232.0000   1513.5150     38.8526     14.5400
+    233.0000   1513.5140     38.8525     14.5343
+    234.0000   1513.5100     38.8523     14.5281
+    235.0000   1513.5060     38.8524     14.5213
+    236.0000   1513.5010     38.8525     14.5144
+    237.0000   1513.4960     38.8525     14.5075
+    238.0000   1513.4890     38.8525     14.5001
+    239.0000   1513.4790     38.8527     14.4916
+    240.0000   1513.4760     38.8531     14.4851
+    241.0000   1513.4750     38.8534     14.4794
+    242.0000   1513.4670     38.8534     14.4716
+    243.0000   1513.4570     38.8537     14.4631
+    244.0000   1513.4480     38.8538     14.4550
+    245.0000   1513.4400     38.8539     14.4473
+    246.0000   1513.4330     38.8540     14.4396
+    247.0000   1513.4260     38.8541     14.4322
+    248.0000   1513.4190     38.8542     14.4246
+    249.0000   1513.4140     38.8543     14.4178
+    250.0000   1513.4110     38.8543     14.4115
+    251.0000   1513.4110     38.8543     14.4063
+    252.0000   1513.4180     38.8544     14.4032
+    253.0000   1513.4260     38.8544     14.4005
+    254.0000   1513.4340     38.8544     14.3978
+    255.0000   1513.4420     38.8544     14.3948
+    256.0000   1513.4490     38.8544     14.3919
+    257.0000   1513.4550     38.8543     14.3886
+    258.0000   1513.4600     38.8542     14.3849
+    259.0000   1513.4640     38.8541     14.3810
+    260.0000   1513.4680     38.8540     14.3770
+    261.0000   1513.4720     38.8541     14.3730
+    262.0000   1513.4780     38.8542     14.3694
+    263.0000   1513.4850     38.8547     14.3662
+    264.0000   1513.4930     38.8547     14.3633
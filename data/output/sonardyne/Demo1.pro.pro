@@ -0,0 +1,851 @@
+test_read_store_and_write
+7/8/2002
+12:30:0
+Probe: Sonardyne
+Source: /root/package/data/input/sonardyne/Demo1.pro
+      0.0000   1550.3500      0.0000      0.0000
+      3.3000   1549.5800      0.0000      0.0000
+      3.9000   1549.4400      0.0000      0.0000
+      4.4000   1549.3300      0.0000      0.0000
+      5.0000   1549.4700      0.0000      0.0000
+      5.5000   1549.4300      0.0000      0.0000
+      6.1000   1549.4000      0.0000      0.0000
+      6.7000   1549.2700      0.0000      0.0000
+      7.2000   1549.3100      0.0000      0.0000
+      7.8000   1549.2600      0.0000      0.0000
+      8.3000   1549.0800      0.0000      0.0000
+      8.9000   1548.0800      0.0000      0.0000
+      9.4000   1547.6400      0.0000      0.0000
+     10.0000   1547.2600      0.0000      0.0000
+     10.6000   1547.0900      0.0000      0.0000
+     11.1000   1546.5600      0.0000      0.0000
+     11.7000   1545.1800      0.0000      0.0000
+     12.2000   1543.9500      0.0000      0.0000
+     12.8000   1543.2400      0.0000      0.0000
+     13.4000   1542.4800      0.0000      0.0000
+     13.9000   1542.3900      0.0000      0.0000
+     14.5000   1542.0600      0.0000      0.0000
+     15.0000   1541.3100      0.0000      0.0000
+     15.6000   1540.4300      0.0000      0.0000
+     16.1000   1539.9600      0.0000      0.0000
+     16.7000   1539.5300      0.0000      0.0000
+     17.3000   1539.5000      0.0000      0.0000
+     17.8000   1539.4100      0.0000      0.0000
+     18.4000   1538.7500      0.0000      0.0000
+     18.9000   1538.2100      0.0000      0.0000
+     19.5000   1537.7800      0.0000      0.0000
+     20.1000   1537.5900      0.0000      0.0000
+     20.6000   1537.1500      0.0000      0.0000
+     21.2000   1536.7900      0.0000      0.0000
+     21.7000   1536.3500      0.0000      0.0000
+     22.3000   1536.1200      0.0000      0.0000
+     22.8000   1535.9100      0.0000      0.0000
+     23.4000   1535.5100      0.0000      0.0000
+     24.0000   1535.3100      0.0000      0.0000
+     24.5000   1535.0600      0.0000      0.0000
+     25.1000   1534.8600      0.0000      0.0000
+     25.6000   1534.7000      0.0000      0.0000
+     26.2000   1534.6000      0.0000      0.0000
+     26.7000   1534.5400      0.0000      0.0000
+     27.3000   1534.4500      0.0000      0.0000
+     27.9000   1534.4400      0.0000      0.0000
+     28.4000   1534.4100      0.0000      0.0000
+     29.0000   1534.3200      0.0000      0.0000
+     29.5000   1534.1100      0.0000      0.0000
+     30.1000   1533.8300      0.0000      0.0000
+     30.6000   1533.7300      0.0000      0.0000
+     31.2000   1533.5800      0.0000      0.0000
+     31.8000   1533.5600      0.0000      0.0000
+     32.3000   1533.5400      0.0000      0.0000
+     32.9000   1533.4200      0.0000      0.0000
+     33.4000   1533.4100      0.0000      0.0000
+     34.0000   1533.3600      0.0000      0.0000
+     34.5000   1533.2700      0.0000      0.0000
+     35.1000   1533.2000      0.0000      0.0000
+     35.7000   1533.1600      0.0000      0.0000
+     36.2000   1533.1700      0.0000      0.0000
+     36.8000   1533.1700      0.0000      0.0000
+     37.3000   1533.1600      0.0000      0.0000
+     37.9000   1533.1700      0.0000      0.0000
+     38.4000   1533.1300      0.0000      0.0000
+     39.0000   1533.0800      0.0000      0.0000
+     39.6000   1533.0400      0.0000      0.0000
+     40.1000   1533.0500      0.0000      0.0000
+     40.7000   1533.0200      0.0000      0.0000
+     41.2000   1532.9900      0.0000      0.0000
+     41.8000   1532.9600      0.0000      0.0000
+     42.3000   1532.8800      0.0000      0.0000
+     42.9000   1532.8700      0.0000      0.0000
+     43.5000   1532.8400      0.0000      0.0000
+     44.0000   1532.8200      0.0000      0.0000
+     44.6000   1532.8200      0.0000      0.0000
+     45.1000   1532.7400      0.0000      0.0000
+     45.7000   1532.6600      0.0000      0.0000
+     46.2000   1532.6500      0.0000      0.0000
+     46.8000   1532.6500      0.0000      0.0000
+     47.4000   1532.6300      0.0000      0.0000
+     47.9000   1532.5800      0.0000      0.0000
+     48.5000   1532.5600      0.0000      0.0000
+     49.0000   1532.5500      0.0000      0.0000
+     49.6000   1532.5300      0.0000      0.0000
+     50.1000   1532.4700      0.0000      0.0000
+     50.7000   1532.4600      0.0000      0.0000
+     51.2000   1532.3600      0.0000      0.0000
+     51.8000   1532.3300      0.0000      0.0000
+     52.4000   1532.2800      0.0000      0.0000
+     52.9000   1532.2100      0.0000      0.0000
+     53.5000   1532.1500      0.0000      0.0000
+     54.0000   1532.1100      0.0000      0.0000
+     54.6000   1532.0600      0.0000      0.0000
+     55.1000   1532.0600      0.0000      0.0000
+     55.7000   1532.0500      0.0000      0.0000
+     56.3000   1532.0700      0.0000      0.0000
+     56.8000   1532.0400      0.0000      0.0000
+     57.4000   1532.0100      0.0000      0.0000
+     57.9000   1532.0000      0.0000      0.0000
+     58.5000   1531.9000      0.0000      0.0000
+     59.0000   1531.8600      0.0000      0.0000
+     59.6000   1531.8800      0.0000      0.0000
+     60.1000   1531.8800      0.0000      0.0000
+     60.7000   1531.9000      0.0000      0.0000
+     61.3000   1531.9100      0.0000      0.0000
+     61.8000   1531.8900      0.0000      0.0000
+     62.4000   1531.8700      0.0000      0.0000
+     62.9000   1531.8700      0.0000      0.0000
+     63.5000   1531.8900      0.0000      0.0000
+     64.0000   1531.8800      0.0000      0.0000
+     64.6000   1531.8200      0.0000      0.0000
+     65.1000   1531.8200      0.0000      0.0000
+     65.7000   1531.7900      0.0000      0.0000
+     66.3000   1531.7800      0.0000      0.0000
+     66.8000   1531.7400      0.0000      0.0000
+     67.4000   1531.7000      0.0000      0.0000
+     67.9000   1531.6900      0.0000      0.0000
+     68.5000   1531.6600      0.0000      0.0000
+     69.0000   1531.6600      0.0000      0.0000
+     69.6000   1531.6200      0.0000      0.0000
+     70.1000   1531.5700      0.0000      0.0000
+     70.7000   1531.5600      0.0000      0.0000
+     71.3000   1531.5200      0.0000      0.0000
+     71.8000   1531.4900      0.0000      0.0000
+     72.4000   1531.4400      0.0000      0.0000
+     72.9000   1531.3200      0.0000      0.0000
+     73.5000   1531.3100      0.0000      0.0000
+     74.0000   1531.3500      0.0000      0.0000
+     74.6000   1531.2700      0.0000      0.0000
+     75.1000   1531.2000      0.0000      0.0000
+     75.7000   1531.1300      0.0000      0.0000
+     76.2000   1531.0400      0.0000      0.0000
+     76.8000   1530.9900      0.0000      0.0000
+     77.4000   1530.9700      0.0000      0.0000
+     77.9000   1531.0900      0.0000      0.0000
+     78.5000   1531.0700      0.0000      0.0000
+     79.0000   1530.9000      0.0000      0.0000
+     79.6000   1530.7400      0.0000      0.0000
+     80.1000   1530.5700      0.0000      0.0000
+     80.7000   1530.5800      0.0000      0.0000
+     81.2000   1530.5700      0.0000      0.0000
+     81.8000   1530.5300      0.0000      0.0000
+     82.4000   1530.4400      0.0000      0.0000
+     82.9000   1530.2600      0.0000      0.0000
+     83.5000   1530.2300      0.0000      0.0000
+     84.0000   1530.2600      0.0000      0.0000
+     84.6000   1530.2500      0.0000      0.0000
+     85.1000   1530.2500      0.0000      0.0000
+     85.7000   1530.1800      0.0000      0.0000
+     86.2000   1530.1000      0.0000      0.0000
+     86.8000   1529.8700      0.0000      0.0000
+     87.3000   1529.7300      0.0000      0.0000
+     87.9000   1529.6700      0.0000      0.0000
+     88.5000   1529.5400      0.0000      0.0000
+     89.0000   1529.5200      0.0000      0.0000
+     89.6000   1529.5400      0.0000      0.0000
+     90.1000   1529.5600      0.0000      0.0000
+     90.7000   1529.5700      0.0000      0.0000
+     91.2000   1529.5500      0.0000      0.0000
+     91.8000   1529.5500      0.0000      0.0000
+     92.3000   1529.5400      0.0000      0.0000
+     92.9000   1529.4600      0.0000      0.0000
+     93.4000   1529.3500      0.0000      0.0000
+     94.0000   1529.3200      0.0000      0.0000
+     94.5000   1529.3200      0.0000      0.0000
+     95.1000   1529.3000      0.0000      0.0000
+     95.7000   1529.3000      0.0000      0.0000
+     96.2000   1529.3000      0.0000      0.0000
+     96.8000   1529.2600      0.0000      0.0000
+     97.3000   1529.3700      0.0000      0.0000
+     97.9000   1529.4900      0.0000      0.0000
+     98.4000   1529.5400      0.0000      0.0000
+     99.0000   1529.5500      0.0000      0.0000
+     99.5000   1529.4600      0.0000      0.0000
+    100.1000   1529.2300      0.0000      0.0000
+    100.6000   1529.0600      0.0000      0.0000
+    101.2000   1528.7800      0.0000      0.0000
+    101.7000   1528.5800      0.0000      0.0000
+    102.3000   1528.6200      0.0000      0.0000
+    102.9000   1528.6600      0.0000      0.0000
+    103.4000   1528.6900      0.0000      0.0000
+    104.0000   1528.6900      0.0000      0.0000
+    104.5000   1528.7300      0.0000      0.0000
+    105.1000   1528.7600      0.0000      0.0000
+    105.6000   1528.7700      0.0000      0.0000
+    106.2000   1528.8500      0.0000      0.0000
+    106.7000   1528.8500      0.0000      0.0000
+    107.3000   1528.8000      0.0000      0.0000
+    107.8000   1528.5500      0.0000      0.0000
+    108.4000   1528.3600      0.0000      0.0000
+    108.9000   1527.8900      0.0000      0.0000
+    109.5000   1527.6900      0.0000      0.0000
+    110.0000   1527.7100      0.0000      0.0000
+    110.6000   1527.7000      0.0000      0.0000
+    111.2000   1527.8700      0.0000      0.0000
+    111.7000   1527.8500      0.0000      0.0000
+    112.3000   1527.8300      0.0000      0.0000
+    112.8000   1527.6200      0.0000      0.0000
+    113.4000   1527.4500      0.0000      0.0000
+    113.9000   1527.6200      0.0000      0.0000
+    114.5000   1527.5900      0.0000      0.0000
+    115.0000   1527.5000      0.0000      0.0000
+    115.6000   1527.4600      0.0000      0.0000
+    116.1000   1527.4000      0.0000      0.0000
+    116.7000   1527.3300      0.0000      0.0000
+    117.2000   1527.2400      0.0000      0.0000
+    117.8000   1527.1900      0.0000      0.0000
+    118.3000   1527.1700      0.0000      0.0000
+    118.9000   1527.0900      0.0000      0.0000
+    119.4000   1527.0500      0.0000      0.0000
+    120.0000   1527.0000      0.0000      0.0000
+    120.6000   1526.9800      0.0000      0.0000
+    121.1000   1526.9500      0.0000      0.0000
+    121.7000   1526.9500      0.0000      0.0000
+    122.2000   1526.9500      0.0000      0.0000
+    122.8000   1526.9600      0.0000      0.0000
+    123.3000   1526.9300      0.0000      0.0000
+    123.9000   1526.9300      0.0000      0.0000
+    124.4000   1526.6900      0.0000      0.0000
+    125.0000   1526.6300      0.0000      0.0000
+    125.5000   1526.6200      0.0000      0.0000
+    126.1000   1526.6100      0.0000      0.0000
+    126.6000   1526.5900      0.0000      0.0000
+    127.2000   1526.5800      0.0000      0.0000
+    127.7000   1526.6100      0.0000      0.0000
+    128.3000   1526.3900      0.0000      0.0000
+    128.8000   1525.9600      0.0000      0.0000
+    129.4000   1525.7700      0.0000      0.0000
+    129.9000   1525.6300      0.0000      0.0000
+    130.5000   1525.5300      0.0000      0.0000
+    131.0000   1525.5000      0.0000      0.0000
+    131.6000   1525.4700      0.0000      0.0000
+    132.1000   1525.3400      0.0000      0.0000
+    132.7000   1525.2100      0.0000      0.0000
+    133.3000   1525.1200      0.0000      0.0000
+    133.8000   1525.0900      0.0000      0.0000
+    134.4000   1525.0200      0.0000      0.0000
+    134.9000   1524.9000      0.0000      0.0000
+    135.5000   1524.8800      0.0000      0.0000
+    136.0000   1524.9000      0.0000      0.0000
+    136.6000   1524.8800      0.0000      0.0000
+    137.1000   1524.8500      0.0000      0.0000
+    137.7000   1524.8100      0.0000      0.0000
+    138.2000   1524.7800      0.0000      0.0000
+    138.8000   1524.7400      0.0000      0.0000
+    139.3000   1524.6200      0.0000      0.0000
+    139.9000   1524.4600      0.0000      0.0000
+    140.4000   1524.4200      0.0000      0.0000
+    141.0000   1524.4000      0.0000      0.0000
+    141.5000   1524.3000      0.0000      0.0000
+    142.1000   1524.2000      0.0000      0.0000
+    142.6000   1524.1200      0.0000      0.0000
+    143.2000   1524.0100      0.0000      0.0000
+    143.7000   1523.8800      0.0000      0.0000
+    144.3000   1523.7900      0.0000      0.0000
+    144.8000   1523.7200      0.0000      0.0000
+    145.4000   1523.6400      0.0000      0.0000
+    145.9000   1523.5500      0.0000      0.0000
+    146.5000   1523.5400      0.0000      0.0000
+    147.0000   1523.4800      0.0000      0.0000
+    147.6000   1523.4700      0.0000      0.0000
+    148.1000   1523.4600      0.0000      0.0000
+    148.7000   1523.4400      0.0000      0.0000
+    149.2000   1523.4900      0.0000      0.0000
+    149.8000   1523.9000      0.0000      0.0000
+    150.3000   1524.0400      0.0000      0.0000
+    150.9000   1524.0700      0.0000      0.0000
+    151.4000   1524.0700      0.0000      0.0000
+    152.0000   1523.8500      0.0000      0.0000
+    152.6000   1523.5000      0.0000      0.0000
+    153.1000   1523.2400      0.0000      0.0000
+    153.7000   1522.8900      0.0000      0.0000
+    154.2000   1522.7900      0.0000      0.0000
+    154.8000   1522.8000      0.0000      0.0000
+    155.3000   1522.8800      0.0000      0.0000
+    155.9000   1523.1100      0.0000      0.0000
+    156.4000   1523.4300      0.0000      0.0000
+    157.0000   1523.4400      0.0000      0.0000
+    157.5000   1523.2700      0.0000      0.0000
+    158.1000   1523.2700      0.0000      0.0000
+    158.6000   1523.2600      0.0000      0.0000
+    159.2000   1523.2600      0.0000      0.0000
+    159.7000   1524.0100      0.0000      0.0000
+    160.3000   1524.3100      0.0000      0.0000
+    160.8000   1524.6100      0.0000      0.0000
+    161.4000   1524.8600      0.0000      0.0000
+    161.9000   1525.0600      0.0000      0.0000
+    162.5000   1525.0800      0.0000      0.0000
+    163.0000   1525.0700      0.0000      0.0000
+    163.6000   1525.0400      0.0000      0.0000
+    164.1000   1524.9700      0.0000      0.0000
+    164.7000   1524.8100      0.0000      0.0000
+    165.2000   1524.8000      0.0000      0.0000
+    165.8000   1524.7800      0.0000      0.0000
+    166.3000   1524.4000      0.0000      0.0000
+    166.9000   1523.9400      0.0000      0.0000
+    167.4000   1523.8000      0.0000      0.0000
+    168.0000   1523.6600      0.0000      0.0000
+    168.5000   1523.5000      0.0000      0.0000
+    169.1000   1523.3900      0.0000      0.0000
+    169.6000   1523.3800      0.0000      0.0000
+    170.2000   1523.3800      0.0000      0.0000
+    170.7000   1523.3400      0.0000      0.0000
+    171.3000   1523.3200      0.0000      0.0000
+    171.8000   1523.3300      0.0000      0.0000
+    172.4000   1523.0300      0.0000      0.0000
+    172.9000   1522.9500      0.0000      0.0000
+    173.5000   1522.9100      0.0000      0.0000
+    174.0000   1522.8700      0.0000      0.0000
+    174.6000   1523.0400      0.0000      0.0000
+    175.1000   1523.0500      0.0000      0.0000
+    175.7000   1523.1000      0.0000      0.0000
+    176.2000   1523.1500      0.0000      0.0000
+    176.8000   1523.1500      0.0000      0.0000
+    177.3000   1523.1700      0.0000      0.0000
+    177.9000   1523.2500      0.0000      0.0000
+    178.4000   1523.4500      0.0000      0.0000
+    179.0000   1523.5600      0.0000      0.0000
+    179.5000   1523.8000      0.0000      0.0000
+    180.1000   1523.9000      0.0000      0.0000
+    180.6000   1523.9200      0.0000      0.0000
+    181.2000   1523.9300      0.0000      0.0000
+    181.7000   1523.9700      0.0000      0.0000
+    182.3000   1524.0800      0.0000      0.0000
+    182.8000   1524.2200      0.0000      0.0000
+    183.4000   1524.5000      0.0000      0.0000
+    183.9000   1524.8700      0.0000      0.0000
+    184.4000   1525.0000      0.0000      0.0000
+    185.0000   1525.0300      0.0000      0.0000
+    185.5000   1524.6800      0.0000      0.0000
+    186.1000   1523.6900      0.0000      0.0000
+    186.6000   1523.4000      0.0000      0.0000
+    187.2000   1523.0800      0.0000      0.0000
+    187.7000   1522.5100      0.0000      0.0000
+    188.3000   1521.8500      0.0000      0.0000
+    188.8000   1521.3100      0.0000      0.0000
+    189.4000   1520.9100      0.0000      0.0000
+    189.9000   1520.8700      0.0000      0.0000
+    190.5000   1520.8400      0.0000      0.0000
+    191.0000   1520.8300      0.0000      0.0000
+    191.6000   1520.8100      0.0000      0.0000
+    192.1000   1520.7900      0.0000      0.0000
+    192.7000   1520.7400      0.0000      0.0000
+    193.2000   1520.8300      0.0000      0.0000
+    193.8000   1521.0900      0.0000      0.0000
+    194.3000   1521.1300      0.0000      0.0000
+    194.9000   1521.3600      0.0000      0.0000
+    195.4000   1521.6600      0.0000      0.0000
+    196.0000   1522.1600      0.0000      0.0000
+    196.5000   1522.2100      0.0000      0.0000
+    197.1000   1522.4500      0.0000      0.0000
+    197.6000   1522.9700      0.0000      0.0000
+    198.2000   1522.9500      0.0000      0.0000
+    198.7000   1522.9800      0.0000      0.0000
+    199.3000   1522.9900      0.0000      0.0000
+    199.8000   1523.2700      0.0000      0.0000
+    200.4000   1524.1200      0.0000      0.0000
+    200.9000   1524.1300      0.0000      0.0000
+    201.5000   1524.7500      0.0000      0.0000
+    202.0000   1525.5900      0.0000      0.0000
+    202.6000   1526.9700      0.0000      0.0000
+    203.1000   1526.9900      0.0000      0.0000
+    203.6000   1526.9600      0.0000      0.0000
+    204.2000   1527.2900      0.0000      0.0000
+    204.7000   1527.9000      0.0000      0.0000
+    205.3000   1528.1200      0.0000      0.0000
+    205.8000   1528.1200      0.0000      0.0000
+    206.4000   1528.1300      0.0000      0.0000
+    206.9000   1528.0200      0.0000      0.0000
+    207.5000   1528.0200      0.0000      0.0000
+    208.0000   1528.4400      0.0000      0.0000
+    208.6000   1528.8100      0.0000      0.0000
+    209.1000   1528.8600      0.0000      0.0000
+    209.7000   1528.9600      0.0000      0.0000
+    210.2000   1529.0600      0.0000      0.0000
+    210.8000   1529.1900      0.0000      0.0000
+    211.3000   1529.2500      0.0000      0.0000
+    211.9000   1529.2500      0.0000      0.0000
+    212.4000   1529.5200      0.0000      0.0000
+    213.0000   1529.8300      0.0000      0.0000
+    213.5000   1530.0000      0.0000      0.0000
+    214.1000   1530.2600      0.0000      0.0000
+    214.6000   1530.6800      0.0000      0.0000
+    215.2000   1530.8900      0.0000      0.0000
+    215.7000   1531.0500      0.0000      0.0000
+    216.2000   1531.5300      0.0000      0.0000
+    216.8000   1531.7500      0.0000      0.0000
+    217.3000   1531.7800      0.0000      0.0000
+    217.9000   1531.8900      0.0000      0.0000
+    218.4000   1532.2700      0.0000      0.0000
+    219.0000   1532.5100      0.0000      0.0000
+    219.5000   1532.7600      0.0000      0.0000
+    220.1000   1532.8200      0.0000      0.0000
+    220.6000   1532.7900      0.0000      0.0000
+    221.2000   1532.6200      0.0000      0.0000
+    221.7000   1532.6100      0.0000      0.0000
+    222.3000   1532.7000      0.0000      0.0000
+    222.8000   1532.7100      0.0000      0.0000
+    223.4000   1532.8200      0.0000      0.0000
+    223.9000   1532.8700      0.0000      0.0000
+    224.5000   1532.8700      0.0000      0.0000
+    225.0000   1532.9400      0.0000      0.0000
+    225.5000   1533.2100      0.0000      0.0000
+    226.1000   1533.3300      0.0000      0.0000
+    226.6000   1533.3400      0.0000      0.0000
+    227.2000   1533.3600      0.0000      0.0000
+    227.7000   1533.3600      0.0000      0.0000
+    228.3000   1533.3900      0.0000      0.0000
+    228.8000   1533.4700      0.0000      0.0000
+    229.4000   1533.5100      0.0000      0.0000
+    229.9000   1533.4900      0.0000      0.0000
+    230.5000   1533.4800      0.0000      0.0000
+    231.0000   1533.4800      0.0000      0.0000
+    231.6000   1533.4600      0.0000      0.0000
+    232.1000   1533.4000      0.0000      0.0000
+    232.7000   1533.3600      0.0000      0.0000
+    233.2000   1533.3400      0.0000      0.0000
+    233.7000   1533.3100      0.0000      0.0000
+    234.3000   1533.2900      0.0000      0.0000
+    234.8000   1533.2400      0.0000      0.0000
+    235.4000   1533.1000      0.0000      0.0000
+    235.9000   1533.0000      0.0000      0.0000
+    236.5000   1532.9300      0.0000      0.0000
+    237.0000   1532.9100      0.0000      0.0000
+    237.6000   1533.0000      0.0000      0.0000
+    238.1000   1533.0800      0.0000      0.0000
+    238.7000   1533.0900      0.0000      0.0000
+    239.2000   1533.1200      0.0000      0.0000
+    239.8000   1533.1400      0.0000      0.0000
+    240.3000   1533.1300      0.0000      0.0000
+    240.9000   1532.8200      0.0000      0.0000
+    241.4000   1532.5300      0.0000      0.0000
+    241.9000   1532.3200      0.0000      0.0000
+    242.5000   1532.1000      0.0000      0.0000
+    243.0000   1531.9100      0.0000      0.0000
+    243.6000   1531.8400      0.0000      0.0000
+    244.1000   1531.6700      0.0000      0.0000
+    244.7000   1531.7100      0.0000      0.0000
+    245.2000   1531.6800      0.0000      0.0000
+    245.8000   1531.6400      0.0000      0.0000
+    246.3000   1531.6300      0.0000      0.0000
+    246.9000   1531.7400      0.0000      0.0000
+    247.4000   1531.9300      0.0000      0.0000
+    247.9000   1532.0100      0.0000      0.0000
+    248.5000   1532.1200      0.0000      0.0000
+    249.0000   1532.2400      0.0000      0.0000
+    249.6000   1532.2700      0.0000      0.0000
+    250.1000   1532.3100      0.0000      0.0000
+    250.7000   1532.3600      0.0000      0.0000
+    251.2000   1532.4100      0.0000      0.0000
+    251.8000   1532.4500      0.0000      0.0000
+    252.3000   1532.4900      0.0000      0.0000
+    252.9000   1532.5700      0.0000      0.0000
+    253.4000   1532.6100      0.0000      0.0000
+    253.9000   1532.5900      0.0000      0.0000
+    254.5000   1532.5700      0.0000      0.0000
+    255.0000   1532.5500      0.0000      0.0000
+    255.6000   1532.5600      0.0000      0.0000
+    256.1000   1532.5600      0.0000      0.0000
+    256.7000   1532.5600      0.0000      0.0000
+    257.2000   1532.6100      0.0000      0.0000
+    257.8000   1532.6100      0.0000      0.0000
+    258.3000   1532.6100      0.0000      0.0000
+    258.9000   1532.5900      0.0000      0.0000
+    259.4000   1532.5700      0.0000      0.0000
+    259.9000   1532.5600      0.0000      0.0000
+    260.5000   1532.5600      0.0000      0.0000
+    261.0000   1532.5100      0.0000      0.0000
+    261.6000   1532.5000      0.0000      0.0000
+    262.1000   1532.5000      0.0000      0.0000
+    262.7000   1532.5000      0.0000      0.0000
+    263.2000   1532.5000      0.0000      0.0000
+    263.8000   1532.4800      0.0000      0.0000
+    264.3000   1532.4500      0.0000      0.0000
+    264.9000   1532.3700      0.0000      0.0000
+    265.4000   1532.3000      0.0000      0.0000
+    265.9000   1532.3100      0.0000      0.0000
+    266.5000   1532.3000      0.0000      0.0000
+    267.0000   1532.2900      0.0000      0.0000
+    267.6000   1532.2400      0.0000      0.0000
+    268.1000   1532.2300      0.0000      0.0000
+    268.7000   1532.2200      0.0000      0.0000
+    269.2000   1532.2200      0.0000      0.0000
+    269.8000   1532.2000      0.0000      0.0000
+    270.3000   1532.2100      0.0000      0.0000
+    270.8000   1532.1100      0.0000      0.0000
+    271.4000   1532.0200      0.0000      0.0000
+    271.9000   1531.9200      0.0000      0.0000
+    272.5000   1531.9400      0.0000      0.0000
+    273.0000   1531.9800      0.0000      0.0000
+    273.6000   1532.0300      0.0000      0.0000
+    274.1000   1532.0400      0.0000      0.0000
+    274.7000   1532.0300      0.0000      0.0000
+    275.2000   1532.0400      0.0000      0.0000
+    275.7000   1532.0200      0.0000      0.0000
+    276.3000   1532.0200      0.0000      0.0000
+    276.8000   1532.0500      0.0000      0.0000
+    277.4000   1532.0100      0.0000      0.0000
+    277.9000   1532.0200      0.0000      0.0000
+    278.5000   1532.0300      0.0000      0.0000
+    279.0000   1532.0300      0.0000      0.0000
+    279.5000   1532.0500      0.0000      0.0000
+    280.1000   1532.0300      0.0000      0.0000
+    280.6000   1532.0200      0.0000      0.0000
+    281.2000   1532.0200      0.0000      0.0000
+    281.7000   1532.0100      0.0000      0.0000
+    282.3000   1532.0100      0.0000      0.0000
+    282.8000   1532.0200      0.0000      0.0000
+    283.4000   1532.0100      0.0000      0.0000
+    283.9000   1532.0100      0.0000      0.0000
+    284.4000   1532.0200      0.0000      0.0000
+    285.0000   1532.0200      0.0000      0.0000
+    285.5000   1532.0200      0.0000      0.0000
+    286.1000   1532.0300      0.0000      0.0000
+    286.6000   1532.0200      0.0000      0.0000
+    287.2000   1532.0200      0.0000      0.0000
+    287.7000   1532.0300      0.0000      0.0000
+    288.2000   1532.0300      0.0000      0.0000
+    288.8000   1532.0400      0.0000      0.0000
+    289.3000   1532.0300      0.0000      0.0000
+    289.9000   1532.0200      0.0000      0.0000
+    290.4000   1532.0400      0.0000      0.0000
+    291.0000   1532.0400      0.0000      0.0000
+    291.5000   1532.0500      0.0000      0.0000
+    292.1000   1532.0300      0.0000      0.0000
+    292.6000   1532.0400      0.0000      0.0000
+    293.1000   1532.0400      0.0000      0.0000
+    293.7000   1532.0500      0.0000      0.0000
+    294.2000   1532.0500      0.0000      0.0000
+    294.8000   1532.0500      0.0000      0.0000
+    295.3000   1532.0400      0.0000      0.0000
+    295.9000   1532.0500      0.0000      0.0000
+    296.4000   1532.0400      0.0000      0.0000
+    296.9000   1532.0500      0.0000      0.0000
+    297.5000   1532.0500      0.0000      0.0000
+    298.0000   1532.0500      0.0000      0.0000
+    298.6000   1532.0600      0.0000      0.0000
+    299.1000   1532.0600      0.0000      0.0000
+    299.7000   1532.0500      0.0000      0.0000
+    300.2000   1532.0600      0.0000      0.0000
+    300.7000   1532.0500      0.0000      0.0000
+    301.3000   1532.0600      0.0000      0.0000
+    301.8000   1532.0600      0.0000      0.0000
+    302.4000   1532.0500      0.0000      0.0000
+    302.9000   1532.0800      0.0000      0.0000
+    303.5000   1532.0600      0.0000      0.0000
+    304.0000   1532.0500      0.0000      0.0000
+    304.5000   1532.0600      0.0000      0.0000
+    305.1000   1532.0500      0.0000      0.0000
+    305.6000   1532.0800      0.0000      0.0000
+    306.2000   1532.0700      0.0000      0.0000
+    306.7000   1532.0500      0.0000      0.0000
+    307.3000   1532.0700      0.0000      0.0000
+    307.8000   1532.0700      0.0000      0.0000
+    308.3000   1532.0700      0.0000      0.0000
+    308.9000   1532.0700      0.0000      0.0000
+    309.4000   1532.0700      0.0000      0.0000
+    310.0000   1532.0700      0.0000      0.0000
+    310.5000   1532.0600      0.0000      0.0000
+    311.1000   1532.0700      0.0000      0.0000
+    311.6000   1532.0800      0.0000      0.0000
+    312.1000   1532.0700      0.0000      0.0000
+    312.7000   1532.0700      0.0000      0.0000
+    313.2000   1532.0800      0.0000      0.0000
+    313.8000   1532.0800      0.0000      0.0000
+    314.3000   1532.0900      0.0000      0.0000
+    314.8000   1532.0800      0.0000      0.0000
+    315.4000   1532.0800      0.0000      0.0000
+    315.9000   1532.0700      0.0000      0.0000
+    316.5000   1532.0800      0.0000      0.0000
+    317.0000   1532.0800      0.0000      0.0000
+    317.6000   1532.0700      0.0000      0.0000
+    318.1000   1532.0900      0.0000      0.0000
+    318.6000   1532.0800      0.0000      0.0000
+    319.2000   1532.0900      0.0000      0.0000
+    319.7000   1532.0800      0.0000      0.0000
+    320.3000   1532.0900      0.0000      0.0000
+    320.8000   1532.0800      0.0000      0.0000
+    321.3000   1532.0900      0.0000      0.0000
+    321.9000   1532.1000      0.0000      0.0000
+    322.4000   1532.1000      0.0000      0.0000
+    323.0000   1532.0900      0.0000      0.0000
+    323.5000   1532.0900      0.0000      0.0000
+    324.1000   1532.0900      0.0000      0.0000
+    324.6000   1532.1000      0.0000      0.0000
+    325.1000   1532.0900      0.0000      0.0000
+    325.7000   1532.0900      0.0000      0.0000
+    326.2000   1532.1000      0.0000      0.0000
+    326.8000   1532.1100      0.0000      0.0000
+    327.3000   1532.1000      0.0000      0.0000
+    327.8000   1532.1100      0.0000      0.0000
+    328.4000   1532.1000      0.0000      0.0000
+    328.9000   1532.1000      0.0000      0.0000
+    329.5000   1532.1100      0.0000      0.0000
+    330.0000   1532.1000      0.0000      0.0000
+    330.6000   1532.1000      0.0000      0.0000
+    331.1000   1532.1000      0.0000      0.0000
+    331.6000   1532.1200      0.0000      0.0000
+    332.2000   1532.1100      0.0000      0.0000
+    332.7000   1532.1100      0.0000      0.0000
+    333.3000   1532.1100      0.0000      0.0000
+    333.8000   1532.1200      0.0000      0.0000
+    334.3000   1532.1200      0.0000      0.0000
+    334.9000   1532.1300      0.0000      0.0000
+    335.4000   1532.1100      0.0000      0.0000
+    336.0000   1532.1200      0.0000      0.0000
+    336.5000   1532.1100      0.0000      0.0000
+    337.0000   1532.1200      0.0000      0.0000
+    337.6000   1532.1200      0.0000      0.0000
+    338.1000   1532.1100      0.0000      0.0000
+    338.7000   1532.1300      0.0000      0.0000
+    339.2000   1532.1200      0.0000      0.0000
+    339.7000   1532.1200      0.0000      0.0000
+    340.3000   1532.1200      0.0000      0.0000
+    340.8000   1532.1400      0.0000      0.0000
+    341.4000   1532.1300      0.0000      0.0000
+    341.9000   1532.1300      0.0000      0.0000
+    342.5000   1532.1200      0.0000      0.0000
+    343.0000   1532.1400      0.0000      0.0000
+    343.5000   1532.1300      0.0000      0.0000
+    344.1000   1532.1300      0.0000      0.0000
+    344.6000   1532.1400      0.0000      0.0000
+    345.2000   1532.1400      0.0000      0.0000
+    345.7000   1532.1400      0.0000      0.0000
+    346.2000   1532.1300      0.0000      0.0000
+    346.8000   1532.1300      0.0000      0.0000
+    347.3000   1532.1500      0.0000      0.0000
+    347.9000   1532.1400      0.0000      0.0000
+    348.4000   1532.1400      0.0000      0.0000
+    348.9000   1532.1600      0.0000      0.0000
+    349.5000   1532.1300      0.0000      0.0000
+    350.0000   1532.1500      0.0000      0.0000
+    350.6000   1532.1500      0.0000      0.0000
+    351.1000   1532.1400      0.0000      0.0000
+    351.6000   1532.1400      0.0000      0.0000
+    352.2000   1532.1500      0.0000      0.0000
+    352.7000   1532.1300      0.0000      0.0000
+    353.3000   1532.1500      0.0000      0.0000
+    353.8000   1532.1400      0.0000      0.0000
+    354.3000   1532.1500      0.0000      0.0000
+    354.9000   1532.1400      0.0000      0.0000
+    355.4000   1532.1500      0.0000      0.0000
+    356.0000   1532.1500      0.0000      0.0000
+    356.5000   1532.1600      0.0000      0.0000
+    357.0000   1532.1500      0.0000      0.0000
+    357.6000   1532.1600      0.0000      0.0000
+    358.1000   1532.1700      0.0000      0.0000
+    358.7000   1532.1600      0.0000      0.0000
+    359.2000   1532.1500      0.0000      0.0000
+    359.7000   1532.1600      0.0000      0.0000
+    360.3000   1532.1700      0.0000      0.0000
+    360.8000   1532.1700      0.0000      0.0000
+    361.4000   1532.1700      0.0000      0.0000
+    361.9000   1532.1700      0.0000      0.0000
+    362.4000   1532.1700      0.0000      0.0000
+    363.0000   1532.1600      0.0000      0.0000
+    363.5000   1532.1600      0.0000      0.0000
+    364.1000   1532.1500      0.0000      0.0000
+    364.6000   1532.1700      0.0000      0.0000
+    365.1000   1532.1700      0.0000      0.0000
+    365.7000   1532.1700      0.0000      0.0000
+    366.2000   1532.1800      0.0000      0.0000
+    366.7000   1532.1700      0.0000      0.0000
+    367.3000   1532.1700      0.0000      0.0000
+    367.8000   1532.1900      0.0000      0.0000
+    368.4000   1532.1800      0.0000      0.0000
+    368.9000   1532.1800      0.0000      0.0000
+    369.4000   1532.1800      0.0000      0.0000
+    370.0000   1532.1700      0.0000      0.0000
+    370.5000   1532.1900      0.0000      0.0000
+    371.1000   1532.1900      0.0000      0.0000
+    371.6000   1532.1800      0.0000      0.0000
+    372.1000   1532.1900      0.0000      0.0000
+    372.7000   1532.1900      0.0000      0.0000
+    373.2000   1532.2000      0.0000      0.0000
+    373.8000   1532.1900      0.0000      0.0000
+    374.3000   1532.1900      0.0000      0.0000
+    374.8000   1532.1900      0.0000      0.0000
+    375.4000   1532.1800      0.0000      0.0000
+    375.9000   1532.2000      0.0000      0.0000
+    376.4000   1532.2000      0.0000      0.0000
+    377.0000   1532.2000      0.0000      0.0000
+    377.5000   1532.2000      0.0000      0.0000
+    378.1000   1532.2000      0.0000      0.0000
+    378.6000   1532.2000      0.0000      0.0000
+    379.1000   1532.2000      0.0000      0.0000
+    379.7000   1532.2000      0.0000      0.0000
+    380.2000   1532.2000      0.0000      0.0000
+    380.8000   1532.2100      0.0000      0.0000
+    381.3000   1532.2100      0.0000      0.0000
+    381.8000   1532.2100      0.0000      0.0000
+    382.4000   1532.2100      0.0000      0.0000
+    382.9000   1532.2100      0.0000      0.0000
+    383.4000   1532.2000      0.0000      0.0000
+    384.0000   1532.2100      0.0000      0.0000
+    384.5000   1532.2200      0.0000      0.0000
+    385.1000   1532.2000      0.0000      0.0000
+    385.6000   1532.2200      0.0000      0.0000
+    386.1000   1532.2100      0.0000      0.0000
+    386.7000   1532.2200      0.0000      0.0000
+    387.2000   1532.2100      0.0000      0.0000
+    387.8000   1532.2300      0.0000      0.0000
+    388.3000   1532.2100      0.0000      0.0000
+    388.8000   1532.2200      0.0000      0.0000
+    389.4000   1532.2400      0.0000      0.0000
+    389.9000   1532.2200      0.0000      0.0000
+    390.4000   1532.2300      0.0000      0.0000
+    391.0000   1532.2300      0.0000      0.0000
+    391.5000   1532.2300      0.0000      0.0000
+    392.1000   1532.2400      0.0000      0.0000
+    392.6000   1532.2500      0.0000      0.0000
+    393.1000   1532.2300      0.0000      0.0000
+    393.7000   1532.2400      0.0000      0.0000
+    394.2000   1532.2300      0.0000      0.0000
+    394.7000   1532.2300      0.0000      0.0000
+    395.3000   1532.2400      0.0000      0.0000
+    395.8000   1532.2500      0.0000      0.0000
+    396.4000   1532.2400      0.0000      0.0000
+    396.9000   1532.2400      0.0000      0.0000
+    397.4000   1532.2300      0.0000      0.0000
+    398.0000   1532.2700      0.0000      0.0000
+    398.5000   1532.2500      0.0000      0.0000
+    399.0000   1532.2500      0.0000      0.0000
+    399.6000   1532.2600      0.0000      0.0000
+    400.1000   1532.2500      0.0000      0.0000
+    400.7000   1532.2500      0.0000      0.0000
+    401.2000   1532.2600      0.0000      0.0000
+    401.7000   1532.2600      0.0000      0.0000
+    402.3000   1532.2500      0.0000      0.0000
+    402.8000   1532.2600      0.0000      0.0000
+    403.3000   1532.2500      0.0000      0.0000
+    403.9000   1532.2600      0.0000      0.0000
+    404.4000   1532.2600      0.0000      0.0000
+    405.0000   1532.2700      0.0000      0.0000
+    405.5000   1532.2700      0.0000      0.0000
+    406.0000   1532.2700      0.0000      0.0000
+    406.6000   1532.2700      0.0000      0.0000
+    407.1000   1532.2700      0.0000      0.0000
+    407.6000   1532.2600      0.0000      0.0000
+    408.2000   1532.2700      0.0000      0.0000
+    408.7000   1532.2700      0.0000      0.0000
+    409.3000   1532.2700      0.0000      0.0000
+    409.8000   1532.2700      0.0000      0.0000
+    410.3000   1532.2800      0.0000      0.0000
+    410.9000   1532.2900      0.0000      0.0000
+    411.4000   1532.2800      0.0000      0.0000
+    411.9000   1532.2900      0.0000      0.0000
+    412.5000   1532.2800      0.0000      0.0000
+    413.0000   1532.3000      0.0000      0.0000
+    413.5000   1532.2900      0.0000      0.0000
+    414.1000   1532.2900      0.0000      0.0000
+    414.6000   1532.3000      0.0000      0.0000
+    415.2000   1532.2900      0.0000      0.0000
+    415.7000   1532.2900      0.0000      0.0000
+    416.2000   1532.3000      0.0000      0.0000
+    416.8000   1532.3000      0.0000      0.0000
+    417.3000   1532.2900      0.0000      0.0000
+    417.8000   1532.3100      0.0000      0.0000
+    418.4000   1532.3100      0.0000      0.0000
+    418.9000   1532.3000      0.0000      0.0000
+    419.5000   1532.3000      0.0000      0.0000
+    420.0000   1532.3100      0.0000      0.0000
+    420.5000   1532.3200      0.0000      0.0000
+    421.1000   1532.3100      0.0000      0.0000
+    421.6000   1532.3100      0.0000      0.0000
+    422.1000   1532.3200      0.0000      0.0000
+    422.7000   1532.3100      0.0000      0.0000
+    423.2000   1532.3100      0.0000      0.0000
+    423.7000   1532.3100      0.0000      0.0000
+    424.3000   1532.3100      0.0000      0.0000
+    424.8000   1532.3200      0.0000      0.0000
+    425.3000   1532.3100      0.0000      0.0000
+    425.9000   1532.3300      0.0000      0.0000
+    426.4000   1532.3200      0.0000      0.0000
+    427.0000   1532.3200      0.0000      0.0000
+    427.5000   1532.3200      0.0000      0.0000
+    428.0000   1532.3100      0.0000      0.0000
+    428.6000   1532.3300      0.0000      0.0000
+    429.1000   1532.3300      0.0000      0.0000
+    429.6000   1532.3200      0.0000      0.0000
+    430.2000   1532.3300      0.0000      0.0000
+    430.7000   1532.3300      0.0000      0.0000
+    431.2000   1532.3200      0.0000      0.0000
+    431.8000   1532.3400      0.0000      0.0000
+    432.3000   1532.3300      0.0000      0.0000
+    432.8000   1532.3300      0.0000      0.0000
+    433.4000   1532.3300      0.0000      0.0000
+    433.9000   1532.3500      0.0000      0.0000
+    434.5000   1532.3400      0.0000      0.0000
+    435.0000   1532.3500      0.0000      0.0000
+    435.5000   1532.3600      0.0000      0.0000
+    436.1000   1532.3500      0.0000      0.0000
+    436.6000   1532.3500      0.0000      0.0000
+    437.1000   1532.3500      0.0000      0.0000
+    437.7000   1532.3500      0.0000      0.0000
+    438.2000   1532.3600      0.0000      0.0000
+    438.7000   1532.3500      0.0000      0.0000
+    439.3000   1532.3400      0.0000      0.0000
+    439.8000   1532.3500      0.0000      0.0000
+    440.3000   1532.3600      0.0000      0.0000
+    440.9000   1532.3700      0.0000      0.0000
+    441.4000   1532.3600      0.0000      0.0000
+    442.0000   1532.3500      0.0000      0.0000
+    442.5000   1532.3700      0.0000      0.0000
+    443.0000   1532.3700      0.0000      0.0000
+    443.6000   1532.3600      0.0000      0.0000
+    444.1000   1532.3700      0.0000      0.0000
+    444.6000   1532.3600      0.0000      0.0000
+    445.2000   1532.3700      0.0000      0.0000
+    445.7000   1532.3800      0.0000      0.0000
+    446.2000   1532.3800      0.0000      0.0000
+    446.8000   1532.3700      0.0000      0.0000
+    447.3000   1532.3700      0.0000      0.0000
+    447.8000   1532.3800      0.0000      0.0000
+    448.4000   1532.3900      0.0000      0.0000
+    448.9000   1532.3800      0.0000      0.0000
+    449.4000   1532.3700      0.0000      0.0000
+    450.0000   1532.3900      0.0000      0.0000
+    450.5000   1532.3800      0.0000      0.0000
+    451.0000   1532.3900      0.0000      0.0000
+    451.6000   1532.3900      0.0000      0.0000
+    452.1000   1532.3900      0.0000      0.0000
+    452.6000   1532.3900      0.0000      0.0000
+    453.2000   1532.3800      0.0000      0.0000
+    453.7000   1532.4000      0.0000      0.0000
+    454.2000   1532.3900      0.0000      0.0000
+    454.8000   1532.3900      0.0000      0.0000
+    455.3000   1532.4000      0.0000      0.0000
+    455.9000   1532.3900      0.0000      0.0000
+    456.4000   1532.4000      0.0000      0.0000
+    456.9000   1532.4100      0.0000      0.0000
+    457.5000   1532.4000      0.0000      0.0000
+    458.0000   1532.4100      0.0000      0.0000
+    458.5000   1532.4200      0.0000      0.0000
+    459.1000   1532.4100      0.0000      0.0000
+    459.6000   1532.4100      0.0000      0.0000
+    460.1000   1532.4200      0.0000      0.0000
+    460.7000   1532.4100      0.0000      0.0000
+    461.2000   1532.4200      0.0000      0.0000
+    461.7000   1532.4300      0.0000      0.0000
+    462.3000   1532.4200      0.0000      0.0000
+    462.8000   1532.4200      0.0000      0.0000
+    463.3000   1532.4300      0.0000      0.0000
+    463.9000   1532.4100      0.0000      0.0000
+    464.4000   1532.4300      0.0000      0.0000
@@ -0,0 +1,2731 @@
+test_read_store_and_write
+7/8/2002
+12:30:0
+Probe: Sonardyne
+Source: /root/package/data/input/sonardyne/Demo2.pro
+      0.0000   1498.5400      0.0000      0.0000
+      3.0900   1498.6100     33.4400     13.0677
+      3.5400   1498.6200     33.4400     13.0668
+      4.4300   1498.6400     33.4400     13.0695
+      4.8800   1498.6500     33.4400     13.0686
+      5.7700   1498.6700     33.4500     13.0695
+      6.2100   1498.6800     33.4500     13.0723
+      6.6600   1498.7000     33.4500     13.0750
+      7.1100   1498.8200     33.5300     13.0786
+      7.5500   1498.9100     33.4500     13.1287
+      8.0000   1498.9400     33.4900     13.1232
+      8.8900   1499.0900     33.5300     13.1515
+      9.3400   1499.2000     33.5000     13.1924
+     10.2300   1499.2700     33.4900     13.2106
+     10.6800   1499.3200     33.5000     13.2206
+     11.5700   1499.3700     33.5100     13.2278
+     12.0200   1499.4200     33.5100     13.2405
+     12.4600   1499.4500     33.5100     13.2469
+     12.9100   1499.5200     33.5400     13.2542
+     13.8000   1499.6400     33.5700     13.2778
+     14.7000   1499.8500     33.6400     13.3123
+     15.5900   1500.3100     33.7600     13.4030
+     16.0300   1500.5900     33.6900     13.5080
+     16.9300   1500.6400     33.6800     13.5261
+     17.3700   1500.6100     33.6600     13.5225
+     18.2700   1500.5400     33.6600     13.4945
+     18.7100   1500.4900     33.6800     13.4709
+     19.6000   1500.4300     33.6700     13.4483
+     20.0500   1500.3500     33.6900     13.4184
+     20.9400   1500.3000     33.6900     13.3975
+     21.3900   1500.3800     33.7900     13.3839
+     22.2800   1500.8000     33.8300     13.4908
+     22.7300   1501.0600     33.8400     13.5659
+     23.6200   1501.3000     33.8600     13.6283
+     24.5100   1501.5200     33.8700     13.6842
+     24.9600   1501.8500     33.9700     13.7465
+     25.8500   1502.1400     33.9400     13.8420
+     26.3000   1502.2900     33.9100     13.8978
+     27.1900   1502.3400     33.9000     13.9113
+     28.0800   1502.3600     33.9000     13.9149
+     28.5300   1502.5000     33.9800     13.9266
+     28.9800   1502.6700     33.9300     13.9931
+     29.8700   1502.7700     33.9700     14.0065
+     30.3100   1502.9700     33.9800     14.0595
+     30.7600   1502.9400     34.0100     14.0406
+     32.1000   1503.1100     34.1400     14.0362
+     32.9900   1503.3500     34.1200     14.1151
+     33.4400   1503.4200     34.0700     14.1510
+     34.3300   1503.4900     34.0900     14.1608
+     35.2200   1503.5400     34.0800     14.1752
+     35.6700   1503.5800     34.0900     14.1805
+     36.5600   1503.6200     34.0800     14.1931
+     37.0100   1503.6200     34.0700     14.1948
+     37.9000   1503.6300     34.0900     14.1859
+     38.7900   1503.6700     34.1000     14.1922
+     39.6900   1503.7300     34.1100     14.2020
+     40.1300   1504.0300     34.2600     14.2351
+     41.0200   1504.5100     34.3100     14.3603
+     41.4700   1504.8100     34.1700     14.5049
+     42.3600   1504.4000     33.9800     14.4416
+     42.8100   1503.8700     34.0500     14.2503
+     43.7000   1503.3000     33.9400     14.1061
+     44.1500   1502.5200     33.9400     13.8662
+     45.0400   1502.1500     34.0800     13.6986
+     45.9300   1502.0200     34.0800     13.6534
+     46.8300   1501.7100     34.0500     13.5658
+     47.2700   1501.4500     34.1000     13.4663
+     48.1600   1501.4200     34.1700     13.4282
+     48.6100   1501.4900     34.2000     13.4355
+     49.5000   1502.3400     34.8000     13.4753
+     50.3900   1504.5700     35.0100     14.0792
+     50.8400   1505.9400     34.8900     14.5449
+     51.2900   1506.6900     34.7900     14.8152
+     52.1800   1507.1200     34.7700     14.9544
+     53.0700   1507.0400     34.4900     15.0270
+     53.9600   1506.6200     34.5100     14.8809
+     54.4100   1506.2100     34.5000     14.7549
+     55.3000   1506.2900     34.8000     14.6633
+     56.2000   1506.9500     35.0000     14.7948
+     56.6400   1507.9400     35.3100     14.9916
+     57.5300   1508.8200     35.1700     15.3173
+     57.9800   1509.8200     35.5100     15.5081
+     58.8700   1511.1600     35.7100     15.8611
+     59.3200   1513.0000     36.0500     16.3303
+     60.2100   1513.6300     35.5700     16.7170
+     61.1000   1513.6700     35.6900     16.6773
+     61.9900   1513.6200     35.6300     16.6807
+     62.4400   1513.3600     35.7200     16.5572
+     63.3300   1513.2500     35.7400     16.5099
+     63.7800   1513.1300     35.7500     16.4626
+     64.6700   1513.0200     35.7700     16.4153
+     65.1200   1512.9800     35.8100     16.3867
+     66.0100   1513.0400     35.8500     16.3849
+     66.9000   1513.1800     35.9000     16.4048
+     67.8000   1513.2900     35.9100     16.4326
+     68.6900   1513.2600     35.8800     16.4317
+     69.1300   1513.1300     35.8900     16.3814
+     69.5800   1513.0400     35.9300     16.3355
+     70.4700   1513.0000     35.9400     16.3103
+     70.9200   1512.9600     35.9400     16.2964
+     71.8100   1512.9300     35.9400     16.2834
+     72.2600   1512.8600     35.9400     16.2556
+     73.1500   1512.7900     35.9500     16.2217
+     74.0400   1512.7200     35.9600     16.1957
+     74.9300   1512.6100     35.9600     16.1522
+     75.3800   1512.3600     35.8800     16.1000
+     76.2700   1512.0000     35.9200     15.9632
+     76.7200   1511.8600     35.9800     15.8907
+     77.6100   1511.8600     35.9900     15.8829
+     78.5000   1511.8400     35.9700     15.8776
+     78.9500   1511.7700     35.9600     15.8584
+     79.8400   1511.7300     35.9700     15.8339
+     80.2900   1511.7200     35.9700     15.8269
+     81.6300   1511.7300     35.9700     15.8226
+     82.0700   1511.7200     35.9700     15.8191
+     82.9600   1511.7100     35.9700     15.8129
+     83.4100   1511.6800     35.9700     15.7990
+     84.3000   1511.7000     35.9800     15.7981
+     85.1900   1511.6400     35.9400     15.7893
+     85.6400   1511.4000     35.9300     15.7097
+     86.5300   1511.1700     35.9300     15.6317
+     86.9800   1510.9300     35.8800     15.5703
+     87.4300   1510.6700     35.8800     15.4843
+     88.7600   1510.5000     35.9200     15.4087
+     89.6600   1510.3700     35.9100     15.3656
+     90.1000   1510.2800     35.9200     15.3304
+     90.5500   1510.2000     35.9100     15.3057
+     91.4400   1510.0800     35.8900     15.2722
+     92.3300   1509.9600     35.8800     15.2308
+     93.2200   1509.7800     35.8400     15.1832
+     93.6700   1509.5100     35.8000     15.1108
+     94.1200   1509.1900     35.7900     15.0100
+     95.4500   1508.8200     35.7500     14.9019
+     96.3500   1508.5600     35.8000     14.7973
+     96.7900   1508.4300     35.8000     14.7529
+     97.2400   1508.3600     35.8200     14.7218
+     98.1300   1508.3500     35.8300     14.7076
+     99.0200   1508.2800     35.7900     14.6969
+     99.4700   1508.1900     35.8200     14.6569
+    100.3600   1508.1900     35.8200     14.6489
+    101.2600   1508.1900     35.8200     14.6435
+    101.7000   1508.1900     35.8300     14.6409
+    102.5900   1508.2000     35.8200     14.6444
+    103.4900   1508.2000     35.8300     14.6355
+    103.9300   1508.2000     35.8200     14.6346
+    104.8200   1508.1900     35.8200     14.6275
+    105.2700   1508.1100     35.8100     14.6053
+    106.1600   1508.1200     35.8400     14.5919
+    107.0500   1508.1500     35.8300     14.5999
+    107.5000   1508.1300     35.8300     14.5928
+    108.3900   1508.1000     35.8300     14.5768
+    109.2800   1508.0600     35.8300     14.5589
+    110.1800   1508.0400     35.8300     14.5483
+    110.6200   1508.0000     35.8300     14.5340
+    111.5100   1507.9200     35.8000     14.5162
+    111.9600   1507.8000     35.7900     14.4760
+    112.8500   1507.7400     35.8200     14.4439
+    113.7400   1507.7300     35.8200     14.4377
+    114.1900   1507.6500     35.8000     14.4163
+    115.0800   1507.4000     35.6900     14.3716
+    115.5300   1507.1200     35.7600     14.2616
+    116.4200   1507.0000     35.7600     14.2178
+    117.3100   1506.8200     35.7000     14.1793
+    118.2100   1506.6400     35.7400     14.1031
+    118.6500   1506.5500     35.7600     14.0627
+    119.1000   1506.4800     35.7500     14.0439
+    119.9900   1506.4000     35.7300     14.0214
+    120.8800   1506.3300     35.7300     13.9963
+    121.7700   1506.2400     35.7300     13.9639
+    122.2200   1506.1900     35.7500     13.9387
+    122.6700   1506.1500     35.7500     13.9261
+    124.0000   1506.1000     35.7300     13.9081
+    124.4500   1506.0600     35.7500     13.8857
+    125.3400   1506.0400     35.7300     13.8830
+    126.2300   1505.9900     35.7200     13.8704
+    126.6800   1505.8700     35.7200     13.8316
+    127.5700   1505.7800     35.7200     13.7965
+    128.0200   1505.7300     35.7300     13.7749
+    128.9100   1505.7200     35.7300     13.7668
+    129.8000   1505.7300     35.7400     13.7640
+    130.2500   1505.7200     35.7300     13.7622
+    131.1400   1505.7000     35.7300     13.7487
+    132.0300   1505.6900     35.7300     13.7442
+    132.4800   1505.6700     35.7200     13.7370
+    133.3700   1505.6300     35.7100     13.7235
+    133.8200   1505.5900     35.7200     13.7063
+    134.7100   1505.5800     35.7200     13.7000
+    135.6000   1505.5800     35.7200     13.6955
+    136.0400   1505.5700     35.7100     13.6901
+    136.9400   1505.5600     35.7200     13.6819
+    137.8300   1505.5600     35.7200     13.6783
+    138.7200   1505.5700     35.7200     13.6765
+    139.6100   1505.5900     35.7200     13.6738
+    140.0600   1505.5400     35.6900     13.6684
+    140.5100   1505.4700     35.7000     13.6440
+    141.4000   1505.3700     35.6700     13.6169
+    142.2900   1505.2600     35.6800     13.5771
+    143.1800   1505.1900     35.7000     13.5464
+    143.6300   1505.1100     35.6900     13.5220
+    144.0700   1504.9900     35.6500     13.4948
+    144.5200   1504.8400     35.6600     13.4423
+    145.4100   1504.7600     35.6800     13.4088
+    146.7500   1504.7400     35.6900     13.3906
+    147.1900   1504.7200     35.6800     13.3861
+    148.0900   1504.7000     35.6800     13.3761
+    148.9800   1504.6700     35.6700     13.3652
+    149.4200   1504.6100     35.6700     13.3453
+    150.3200   1504.5600     35.6600     13.3289
+    151.2100   1504.4300     35.6600     13.2841
+    151.6500   1504.2900     35.6600     13.2393
+    152.5500   1504.1500     35.6600     13.1945
+    153.4400   1504.0900     35.6600     13.1709
+    153.8800   1504.0200     35.6600     13.1472
+    154.7800   1504.0000     35.6700     13.1354
+    155.6700   1503.9900     35.6700     13.1281
+    156.1100   1503.9800     35.6600     13.1245
+    157.0100   1503.9900     35.6600     13.1208
+    157.4500   1503.9800     35.6600     13.1172
+    158.3400   1503.9900     35.6600     13.1144
+    158.7900   1503.9800     35.6600     13.1117
+    159.6800   1503.9800     35.6600     13.1090
+    160.5700   1503.9900     35.6600     13.1053
+    161.4700   1503.9800     35.6500     13.1008
+    161.9100   1503.9800     35.6500     13.0971
+    162.8000   1503.9400     35.6400     13.0880
+    163.2500   1503.9000     35.6400     13.0698
+    164.1400   1503.8700     35.6400     13.0580
+    165.0300   1503.8400     35.6400     13.0452
+    165.4800   1503.8000     35.6400     13.0316
+    166.3700   1503.7800     35.6500     13.0170
+    167.2600   1503.7600     35.6400     13.0088
+    168.1500   1503.7300     35.6300     12.9996
+    168.6000   1503.6800     35.6200     12.9841
+    169.4900   1503.6000     35.6100     12.9622
+    169.9400   1503.4900     35.6200     12.9203
+    170.8300   1503.4000     35.6100     12.8938
+    171.2800   1503.3100     35.6100     12.8636
+    172.1700   1503.2600     35.6200     12.8435
+    172.6100   1503.2300     35.6100     12.8344
+    173.5000   1503.1900     35.6100     12.8188
+    174.4000   1503.1500     35.6100     12.8005
+    175.2900   1503.1100     35.6000     12.7859
+    175.7300   1503.0000     35.5700     12.7621
+    176.6300   1502.9000     35.6000     12.7191
+    177.5200   1502.8600     35.6100     12.6971
+    177.9600   1502.8400     35.6100     12.6898
+    178.8500   1502.8400     35.6100     12.6870
+    179.7500   1502.7900     35.6000     12.6705
+    180.1900   1502.7500     35.6000     12.6540
+    181.5300   1502.7300     35.6000     12.6430
+    181.9800   1502.6700     35.5800     12.6274
+    182.8700   1502.6100     35.5900     12.6054
+    183.3100   1502.5600     35.5900     12.5889
+    184.2100   1502.5300     35.5800     12.5770
+    184.6500   1502.4200     35.5600     12.5513
+    185.1000   1502.3000     35.5600     12.5118
+    185.9900   1502.2000     35.5600     12.4778
+    186.8800   1502.1400     35.5700     12.4530
+    187.7700   1502.1100     35.5700     12.4383
+    188.2200   1502.0600     35.5600     12.4235
+    189.1100   1502.0100     35.5600     12.4061
+    190.0000   1501.8700     35.5200     12.3729
+    190.4500   1501.7600     35.5500     12.3287
+    191.3400   1501.6700     35.5500     12.2992
+    192.2300   1501.6200     35.5400     12.2808
+    192.6800   1501.5600     35.5500     12.2605
+    193.1200   1501.5400     35.5500     12.2485
+    194.0100   1501.5100     35.5400     12.2411
+    194.9100   1501.4700     35.5400     12.2255
+    195.8000   1501.4600     35.5500     12.2135
+    196.6900   1501.4400     35.5500     12.2051
+    197.1300   1501.4200     35.5400     12.1987
+    198.0300   1501.4200     35.5400     12.1941
+    198.4700   1501.4200     35.5400     12.1904
+    199.3600   1501.4100     35.5400     12.1839
+    200.2600   1501.4000     35.5400     12.1802
+    200.7000   1501.4000     35.5400     12.1765
+    201.1500   1501.3900     35.5300     12.1728
+    202.0400   1501.3500     35.5300     12.1599
+    203.3800   1501.3200     35.5200     12.1451
+    203.8200   1501.2900     35.5200     12.1350
+    204.7100   1501.2400     35.5100     12.1211
+    205.1600   1501.2100     35.5200     12.1035
+    206.0500   1501.1800     35.5100     12.0952
+    206.9400   1501.1400     35.5100     12.0786
+    207.8400   1501.0600     35.4900     12.0582
+    208.2800   1500.9600     35.5000     12.0240
+    209.1700   1500.9000     35.5000     11.9999
+    210.0600   1500.8300     35.5000     11.9758
+    210.9600   1500.7900     35.5100     11.9564
+    211.4000   1500.7700     35.5100     11.9490
+    212.2900   1500.7600     35.5100     11.9406
+    213.1900   1500.7500     35.5000     11.9351
+    213.6300   1500.7300     35.5100     11.9277
+    214.5200   1500.7300     35.5100     11.9230
+    214.9700   1500.7100     35.5000     11.9156
+    215.8600   1500.6800     35.5000     11.9026
+    216.7500   1500.6500     35.5000     11.8906
+    217.6400   1500.6000     35.4900     11.8757
+    218.5300   1500.5400     35.4900     11.8525
+    218.9800   1500.4600     35.4800     11.8312
+    219.8700   1500.4100     35.4800     11.8098
+    220.7600   1500.3400     35.4700     11.7894
+    222.1000   1500.2400     35.4700     11.7550
+    222.5500   1500.2000     35.4800     11.7383
+    223.4400   1500.1600     35.4700     11.7244
+    224.3300   1500.1200     35.4600     11.7141
+    225.2200   1500.0600     35.4600     11.6927
+    225.6700   1499.9900     35.4500     11.6723
+    226.1100   1499.7700     35.4000     11.6239
+    227.0000   1499.6000     35.4400     11.5558
+    227.9000   1499.5000     35.4300     11.5260
+    228.7900   1499.3700     35.4100     11.4924
+    229.2300   1499.2400     35.4100     11.4485
+    229.6800   1499.1000     35.4100     11.4084
+    230.5700   1499.0100     35.4100     11.3775
+    231.4600   1498.9000     35.4100     11.3411
+    232.3500   1498.7900     35.4000     11.3102
+    232.8000   1498.6700     35.4000     11.2737
+    233.2400   1498.5900     35.4100     11.2428
+    234.1400   1498.5300     35.4100     11.2222
+    235.0300   1498.4800     35.4000     11.2072
+    235.9200   1498.4300     35.4000     11.1912
+    236.3700   1498.3700     35.4000     11.1678
+    237.2600   1498.3200     35.4000     11.1519
+    238.1500   1498.1800     35.3600     11.1181
+    239.0400   1498.0100     35.3500     11.0711
+    239.4900   1497.9100     35.3600     11.0383
+    240.3800   1497.8200     35.3600     11.0054
+    240.8200   1497.7200     35.3700     10.9724
+    241.7100   1497.6800     35.3800     10.9527
+    242.1600   1497.6400     35.3700     10.9423
+    243.0500   1497.5300     35.3400     10.9179
+    243.9400   1497.4600     35.3600     10.8849
+    244.3900   1497.3900     35.3600     10.8651
+    245.2800   1497.3400     35.3500     10.8472
+    246.1700   1497.2900     35.3500     10.8293
+    247.0600   1497.2600     35.3500     10.8189
+    247.5100   1497.1700     35.3100     10.8067
+    248.4000   1496.7800     35.2500     10.7114
+    249.2900   1496.2100     35.1800     10.5667
+    249.7400   1495.7900     35.2400     10.4255
+    250.6300   1495.5800     35.2600     10.3562
+    251.0700   1495.3900     35.2600     10.3011
+    252.4100   1495.3100     35.2600     10.2716
+    253.3000   1495.0500     35.1900     10.2193
+    253.7500   1494.8000     35.2100     10.1431
+    254.6400   1494.6800     35.2100     10.1050
+    255.5300   1494.5900     35.2300     10.0668
+    255.9800   1494.4400     35.2000     10.0354
+    256.4200   1494.2900     35.2000      9.9905
+    257.3100   1494.2300     35.2000      9.9695
+    258.2000   1494.2200     35.2000      9.9599
+    259.5400   1494.0800     35.1700      9.9255
+    260.8800   1494.0200     35.1800      9.9006
+    261.3200   1493.9700     35.1800      9.8844
+    261.7700   1493.9400     35.1800      9.8729
+    262.6600   1493.9200     35.1700      9.8672
+    263.5500   1493.8400     35.1400      9.8509
+    264.0000   1493.6800     35.1300      9.8107
+    264.8900   1493.5000     35.1200      9.7589
+    265.3300   1493.3000     35.1000      9.7052
+    266.2300   1493.0900     35.0900      9.6486
+    267.1200   1492.8700     35.0700      9.5881
+    267.5600   1492.6500     35.0700      9.5275
+    268.4500   1492.4700     35.0900      9.4678
+    268.9000   1492.3800     35.1200      9.4303
+    269.7900   1492.4300     35.1500      9.4293
+    270.6800   1492.5300     35.1600      9.4486
+    271.1300   1492.5900     35.1400      9.4707
+    271.5700   1492.6900     35.1800      9.4833
+    272.4700   1492.8000     35.1600      9.5169
+    273.3600   1492.9600     35.2000      9.5410
+    273.8000   1493.0700     35.1700      9.5823
+    274.6900   1493.1500     35.1900      9.5910
+    275.5800   1493.4200     35.2600      9.6390
+    276.0300   1493.6100     35.2100      9.7072
+    276.9200   1493.6800     35.1900      9.7273
+    277.8100   1493.7100     35.1900      9.7331
+    278.2600   1493.7300     35.1900      9.7369
+    279.1500   1493.7500     35.2000      9.7359
+    279.6000   1493.8600     35.2400      9.7474
+    280.4900   1494.0700     35.2600      9.7954
+    281.3800   1494.2300     35.2300      9.8461
+    282.2700   1494.2900     35.2200      9.8633
+    282.7100   1494.3400     35.2300      9.8700
+    283.6100   1494.4000     35.2300      9.8834
+    284.0500   1494.4400     35.2300      9.8930
+    284.9400   1494.4600     35.2200      9.8968
+    285.8300   1494.4700     35.2200      9.8978
+    286.2800   1494.4700     35.2200      9.8940
+    286.7300   1494.4500     35.2200      9.8873
+    287.6200   1494.3700     35.1900      9.8720
+    288.5100   1494.2200     35.1700      9.8327
+    289.4000   1494.0100     35.1900      9.7628
+    289.8500   1493.7600     35.1400      9.7091
+    290.7400   1493.4900     35.1300      9.6313
+    291.6300   1493.3200     35.1500      9.5766
+    292.0700   1493.1300     35.1300      9.5295
+    292.9600   1492.9900     35.1500      9.4775
+    293.4100   1492.8600     35.1500      9.4380
+    294.3000   1492.7700     35.1700      9.4052
+    295.1900   1492.7300     35.1600      9.3927
+    296.0800   1492.6100     35.1500      9.3590
+    296.9800   1492.5100     35.1600      9.3262
+    297.4200   1492.4600     35.1600      9.3117
+    298.3100   1492.4000     35.1500      9.2914
+    298.7600   1492.3500     35.1600      9.2731
+    299.2000   1492.2600     35.1300      9.2537
+    300.0900   1492.1500     35.1500      9.2180
+    300.9900   1492.1000     35.1500      9.1977
+    301.4300   1492.0200     35.1400      9.1764
+    302.3200   1491.8800     35.1300      9.1377
+    303.2100   1491.8000     35.1400      9.1096
+    304.1000   1491.7900     35.1400      9.1019
+    304.5500   1491.7300     35.1300      9.0893
+    305.4400   1491.7000     35.1400      9.0728
+    306.3300   1491.6800     35.1400      9.0612
+    306.7800   1491.6100     35.1300      9.0457
+    307.2200   1491.5200     35.1400      9.0156
+    308.1100   1491.4300     35.1300      8.9914
+    309.0100   1491.3700     35.1500      8.9633
+    309.9000   1491.3100     35.1400      8.9468
+    310.3400   1491.2100     35.1200      8.9225
+    311.2300   1491.1100     35.1200      8.8904
+    311.6800   1491.0100     35.1400      8.8593
+    312.5700   1490.9800     35.1400      8.8467
+    313.4600   1490.9500     35.1300      8.8360
+    313.9100   1490.9100     35.1300      8.8214
+    314.3500   1490.8000     35.1100      8.7971
+    315.2400   1490.6700     35.1200      8.7543
+    315.6900   1490.5800     35.1200      8.7309
+    317.0200   1490.5300     35.1100      8.7133
+    317.4700   1490.4100     35.1000      8.6841
+    318.3600   1490.3400     35.1100      8.6539
+    318.8100   1490.2500     35.1100      8.6295
+    319.7000   1490.1600     35.1000      8.6061
+    320.5900   1490.0200     35.0800      8.5690
+    321.4800   1489.8100     35.0800      8.5074
+    321.9300   1489.7100     35.1000      8.4742
+    322.3700   1489.6600     35.1000      8.4595
+    323.7100   1489.6400     35.1000      8.4488
+    324.6000   1489.6100     35.0900      8.4390
+    325.0500   1489.5400     35.0800      8.4214
+    325.9400   1489.4800     35.0900      8.3979
+    326.3800   1489.4500     35.1000      8.3851
+    327.2700   1489.4300     35.0900      8.3770
+    328.1600   1489.4100     35.0900      8.3688
+    328.6100   1489.3800     35.0900      8.3607
+    329.5000   1489.3300     35.0700      8.3489
+    329.9400   1489.2700     35.0800      8.3283
+    331.2800   1489.2200     35.0700      8.3117
+    332.1700   1489.1600     35.0700      8.2921
+    332.6200   1489.1300     35.0800      8.2783
+    333.5100   1489.1200     35.0700      8.2724
+    333.9500   1489.0900     35.0800      8.2617
+    334.8500   1489.0800     35.0800      8.2528
+    335.7400   1489.0800     35.0800      8.2509
+    336.1800   1489.0800     35.0800      8.2489
+    336.6300   1489.0900     35.0800      8.2489
+    337.5200   1489.1100     35.0800      8.2479
+    338.4100   1489.1100     35.0800      8.2480
+    339.3000   1489.0300     35.0300      8.2372
+    339.7500   1488.8700     35.0500      8.1871
+    340.6400   1488.8000     35.0700      8.1586
+    341.0800   1488.7700     35.0800      8.1458
+    341.9700   1488.7600     35.0700      8.1389
+    342.8600   1488.7400     35.0800      8.1291
+    343.3100   1488.7300     35.0700      8.1252
+    343.7600   1488.7100     35.0700      8.1222
+    344.6500   1488.7100     35.0700      8.1144
+    345.5400   1488.7000     35.0700      8.1114
+    346.4300   1488.6900     35.0700      8.1036
+    346.8700   1488.6500     35.0700      8.0908
+    347.7600   1488.6300     35.0700      8.0800
+    348.6500   1488.6200     35.0600      8.0750
+    349.1000   1488.5600     35.0600      8.0593
+    349.9900   1488.5100     35.0600      8.0426
+    350.4400   1488.4700     35.0700      8.0268
+    351.3300   1488.4600     35.0700      8.0199
+    351.7700   1488.4600     35.0700      8.0160
+    352.6700   1488.4500     35.0700      8.0111
+    353.5600   1488.4400     35.0700      8.0052
+    354.0000   1488.4300     35.0600      8.0022
+    354.8900   1488.4200     35.0600      7.9963
+    355.3400   1488.4000     35.0600      7.9894
+    356.2300   1488.3800     35.0600      7.9815
+    357.1200   1488.3200     35.0500      7.9658
+    358.0100   1488.2200     35.0500      7.9352
+    358.4500   1488.1100     35.0400      7.9046
+    359.3500   1488.0300     35.0500      7.8770
+    360.2400   1487.9600     35.0600      7.8543
+    361.1300   1487.8900     35.0500      7.8326
+    361.5700   1487.8000     35.0400      7.8089
+    362.4600   1487.7500     35.0600      7.7881
+    362.9100   1487.7400     35.0600      7.7822
+    363.8000   1487.7500     35.0600      7.7802
+    364.6900   1487.7600     35.0600      7.7792
+    365.1400   1487.7500     35.0600      7.7773
+    366.0300   1487.7600     35.0600      7.7753
+    366.9200   1487.7200     35.0500      7.7614
+    367.3600   1487.6900     35.0600      7.7496
+    368.2600   1487.6300     35.0400      7.7367
+    369.1400   1487.5900     35.0500      7.7179
+    369.5900   1487.5400     35.0600      7.7001
+    370.4800   1487.5300     35.0500      7.6962
+    370.9300   1487.5100     35.0500      7.6892
+    371.8200   1487.5000     35.0500      7.6823
+    372.2600   1487.4900     35.0600      7.6774
+    372.7100   1487.4600     35.0500      7.6684
+    373.6000   1487.4500     35.0500      7.6615
+    374.4900   1487.4200     35.0500      7.6496
+    375.3800   1487.3900     35.0500      7.6387
+    375.8300   1487.3400     35.0500      7.6239
+    376.7200   1487.3200     35.0500      7.6150
+    377.6100   1487.3200     35.0500      7.6100
+    378.0500   1487.3100     35.0500      7.6051
+    378.9400   1487.3000     35.0500      7.5991
+    379.3900   1487.2700     35.0500      7.5912
+    380.2800   1487.2500     35.0500      7.5803
+    381.1700   1487.2400     35.0500      7.5753
+    382.0600   1487.2300     35.0400      7.5694
+    382.5100   1487.1600     35.0400      7.5505
+    383.4000   1487.1000     35.0300      7.5327
+    383.8400   1487.0300     35.0500      7.5079
+    384.7300   1487.0000     35.0400      7.5009
+    385.6300   1486.9200     35.0300      7.4761
+    386.0700   1486.8500     35.0400      7.4532
+    386.9600   1486.8200     35.0400      7.4423
+    387.4100   1486.8000     35.0300      7.4354
+    388.7400   1486.7200     35.0000      7.4204
+    389.1900   1486.5100     35.0000      7.3628
+    390.0800   1486.3900     35.0200      7.3249
+    390.5200   1486.2400     34.9900      7.2921
+    391.4100   1486.0100     35.0000      7.2233
+    391.8600   1485.8900     35.0200      7.1844
+    392.7500   1485.8300     35.0200      7.1654
+    393.2000   1485.8000     35.0200      7.1564
+    394.0900   1485.8100     35.0300      7.1524
+    394.9800   1485.8000     35.0200      7.1494
+    395.8700   1485.7700     35.0100      7.1395
+    396.3100   1485.7300     35.0200      7.1255
+    397.2000   1485.6900     35.0000      7.1185
+    398.1000   1485.6300     35.0000      7.0985
+    398.5400   1485.6000     35.0100      7.0855
+    399.4300   1485.6000     35.0100      7.0805
+    399.8800   1485.5900     35.0100      7.0755
+    400.7700   1485.6000     35.0200      7.0715
+    401.2100   1485.6500     35.0300      7.0795
+    402.5500   1485.7100     35.0300      7.0905
+    402.9900   1485.7500     35.0300      7.0985
+    403.8800   1485.8000     35.0300      7.1085
+    404.3300   1485.9000     35.0500      7.1215
+    405.2200   1485.9200     35.0100      7.1395
+    406.1100   1485.8200     34.9800      7.1185
+    406.5600   1485.6900     35.0100      7.0756
+    407.0000   1485.5900     35.0100      7.0466
+    407.8900   1485.4500     34.9900      7.0116
+    408.7800   1485.2800     34.9700      6.9695
+    409.2300   1485.1300     35.0000      6.9214
+    410.1200   1485.1000     35.0200      6.9034
+    411.0100   1485.1200     35.0200      6.9024
+    411.4500   1485.1400     35.0300      6.9064
+    412.3500   1485.1700     35.0200      6.9124
+    412.7900   1485.1800     35.0200      6.9124
+    413.6800   1485.1900     35.0200      6.9114
+    414.5700   1485.2000     35.0200      6.9094
+    415.0200   1485.2000     35.0200      6.9074
+    415.9100   1485.2000     35.0200      6.9054
+    416.8000   1485.1600     35.0100      6.8944
+    417.2400   1485.0700     35.0000      6.8713
+    418.1300   1484.9700     34.9900      6.8433
+    418.5800   1484.9000     35.0100      6.8192
+    419.4700   1484.8800     35.0100      6.8071
+    420.3600   1484.8600     35.0000      6.8021
+    420.8100   1484.8000     35.0100      6.7840
+    421.7000   1484.7700     35.0100      6.7710
+    422.1400   1484.7100     34.9900      6.7630
+    423.0300   1484.6500     35.0000      6.7378
+    423.9200   1484.6500     35.0100      6.7308
+    424.8100   1484.6600     35.0100      6.7278
+    425.2600   1484.6600     35.0100      6.7288
+    425.7000   1484.6300     35.0000      6.7198
+    426.5900   1484.6200     35.0000      6.7127
+    427.0400   1484.5700     35.0000      6.7017
+    427.9300   1484.5300     35.0000      6.6846
+    428.8200   1484.5100     35.0000      6.6765
+    429.2600   1484.4900     35.0000      6.6685
+    429.7100   1484.4700     35.0000      6.6635
+    431.0500   1484.4700     34.9900      6.6594
+    431.9400   1484.4600     34.9900      6.6534
+    432.3800   1484.4100     34.9900      6.6403
+    433.2700   1484.3800     35.0000      6.6252
+    433.7200   1484.3600     35.0000      6.6172
+    434.6100   1484.3400     34.9900      6.6132
+    435.5000   1484.2600     34.9700      6.5960
+    435.9400   1484.1900     34.9800      6.5729
+    436.8300   1484.1400     34.9800      6.5567
+    437.2800   1484.1000     34.9700      6.5436
+    438.6200   1484.0900     34.9800      6.5325
+    439.0600   1484.1100     35.0000      6.5305
+    439.5100   1484.1400     35.0000      6.5396
+    440.4000   1484.1600     34.9900      6.5416
+    440.8400   1484.1400     34.9900      6.5356
+    441.7300   1484.1300     34.9900      6.5285
+    442.6200   1484.1300     34.9900      6.5245
+    443.0700   1484.0900     34.9800      6.5164
+    443.9600   1484.0500     34.9800      6.5023
+    444.4000   1484.0100     34.9700      6.4912
+    445.2900   1483.9300     34.9600      6.4700
+    446.1800   1483.8400     34.9800      6.4408
+    447.0700   1483.7600     34.9700      6.4175
+    447.5200   1483.6800     34.9800      6.3913
+    448.4100   1483.6700     34.9900      6.3822
+    448.8600   1483.6500     34.9900      6.3771
+    449.7500   1483.6400     34.9900      6.3721
+    450.1900   1483.6400     34.9900      6.3670
+    450.6400   1483.6400     34.9900      6.3660
+    451.5300   1483.6400     34.9800      6.3630
+    452.4200   1483.6300     34.9800      6.3579
+    453.3100   1483.6100     34.9800      6.3499
+    453.7500   1483.6000     34.9800      6.3438
+    454.6400   1483.6000     34.9800      6.3397
+    455.0900   1483.5700     34.9700      6.3337
+    455.9800   1483.5300     34.9700      6.3205
+    456.8700   1483.5100     34.9800      6.3094
+    457.7600   1483.4900     34.9800      6.3003
+    458.2000   1483.4900     34.9800      6.2983
+    458.6500   1483.4900     34.9800      6.2953
+    459.9900   1483.5100     34.9800      6.2953
+    460.4300   1483.5100     34.9800      6.2953
+    461.3200   1483.5200     34.9800      6.2932
+    461.7700   1483.5200     34.9800      6.2922
+    462.6600   1483.5300     34.9800      6.2902
+    463.1000   1483.5200     34.9800      6.2862
+    463.9900   1483.4900     34.9700      6.2771
+    464.4400   1483.4300     34.9700      6.2629
+    465.3300   1483.3700     34.9700      6.2426
+    466.2200   1483.3500     34.9800      6.2315
+    467.1100   1483.3500     34.9800      6.2264
+    467.5500   1483.3500     34.9800      6.2254
+    468.0000   1483.3300     34.9700      6.2194
+    468.8900   1483.2900     34.9700      6.2052
+    469.7800   1483.2600     34.9800      6.1940
+    470.2200   1483.2300     34.9800      6.1839
+    471.1200   1483.2200     34.9800      6.1768
+    471.5600   1483.2000     34.9800      6.1707
+    472.4500   1483.1900     34.9700      6.1646
+    472.8900   1483.1800     34.9800      6.1596
+    474.2300   1483.2000     34.9800      6.1575
+    474.6800   1483.2000     34.9800      6.1565
+    475.1200   1483.2100     34.9800      6.1565
+    475.5700   1483.2100     34.9800      6.1565
+    476.4600   1483.2300     34.9800      6.1565
+    477.3500   1483.2400     34.9800      6.1565
+    477.7900   1483.2500     34.9800      6.1555
+    478.6800   1483.2600     34.9700      6.1566
+    479.1300   1483.2600     34.9700      6.1556
+    480.4600   1483.2700     34.9700      6.1535
+    480.9100   1483.2600     34.9700      6.1464
+    481.8000   1483.2600     34.9700      6.1444
+    482.2400   1483.2400     34.9700      6.1383
+    483.1300   1483.2100     34.9700      6.1261
+    484.0200   1483.1900     34.9700      6.1170
+    484.4700   1483.1800     34.9800      6.1109
+    485.3600   1483.1700     34.9700      6.1059
+    485.8000   1483.1400     34.9800      6.0947
+    486.2500   1483.1200     34.9700      6.0906
+    487.1400   1483.0800     34.9800      6.0744
+    488.0300   1483.0600     34.9800      6.0663
+    488.9200   1483.0600     34.9800      6.0592
+    489.3700   1483.0400     34.9800      6.0551
+    490.2600   1483.0400     34.9800      6.0500
+    491.1500   1483.0400     34.9800      6.0460
+    491.5900   1483.0300     34.9800      6.0419
+    492.4800   1483.0300     34.9700      6.0389
+    493.3700   1483.0100     34.9700      6.0338
+    493.8200   1482.9300     34.9500      6.0175
+    494.7100   1482.8200     34.9500      5.9860
+    495.6000   1482.6800     34.9400      5.9473
+    496.0400   1482.4500     34.9300      5.8934
+    496.9300   1482.2500     34.9400      5.8373
+    497.3800   1482.1200     34.9600      5.7965
+    498.2700   1482.0900     34.9600      5.7853
+    499.1600   1482.0800     34.9600      5.7792
+    499.6000   1482.0700     34.9600      5.7751
+    500.0500   1482.0600     34.9500      5.7724
+    500.9400   1482.0600     34.9400      5.7696
+    501.8300   1482.0500     34.9400      5.7669
+    502.7200   1481.9900     34.9400      5.7475
+    503.6100   1481.9300     34.9400      5.7271
+    504.0500   1481.8800     34.9400      5.7159
+    504.9400   1481.8300     34.9300      5.6995
+    505.8300   1481.7900     34.9400      5.6852
+    506.2800   1481.7400     34.9300      5.6719
+    507.1700   1481.6300     34.9200      5.6453
+    507.6100   1481.5500     34.9300      5.6177
+    508.5000   1481.5200     34.9400      5.6044
+    509.3900   1481.5000     34.9400      5.5973
+    510.2800   1481.5200     34.9500      5.5952
+    510.7300   1481.5700     34.9500      5.6044
+    511.6200   1481.6300     34.9500      5.6157
+    512.0600   1481.6600     34.9500      5.6239
+    513.4000   1481.6800     34.9300      5.6259
+    514.2900   1481.6500     34.9400      5.6137
+    514.7400   1481.6400     34.9400      5.6085
+    515.6300   1481.6300     34.9400      5.6034
+    516.5100   1481.6500     34.9500      5.6014
+    517.4000   1481.6600     34.9500      5.6014
+    517.8500   1481.6800     34.9500      5.6045
+    518.7400   1481.7100     34.9500      5.6065
+    519.6300   1481.7400     34.9600      5.6096
+    520.0800   1481.7700     34.9500      5.6157
+    520.9700   1481.8200     34.9600      5.6219
+    521.8600   1481.8600     34.9600      5.6280
+    522.3000   1481.8900     34.9600      5.6331
+    523.1900   1481.9100     34.9600      5.6352
+    524.0800   1481.9500     34.9600      5.6403
+    524.5200   1481.9800     34.9600      5.6454
+    525.4100   1482.0000     34.9600      5.6485
+    525.8600   1482.0100     34.9600      5.6495
+    526.7500   1482.0300     34.9600      5.6495
+    527.2000   1482.0400     34.9600      5.6506
+    528.0900   1482.0500     34.9600      5.6506
+    528.5300   1482.0500     34.9600      5.6475
+    529.4200   1482.0100     34.9300      5.6444
+    530.3100   1481.9200     34.9300      5.6168
+    531.2000   1481.8600     34.9500      5.5933
+    531.6500   1481.8100     34.9300      5.5841
+    532.5400   1481.7400     34.9400      5.5605
+    533.4300   1481.6700     34.9300      5.5431
+    533.8700   1481.5900     34.9300      5.5185
+    534.3200   1481.5200     34.9400      5.4980
+    535.2100   1481.5000     34.9500      5.4878
+    536.1000   1481.5000     34.9500      5.4816
+    536.5400   1481.5200     34.9600      5.4837
+    537.4300   1481.5500     34.9600      5.4867
+    538.3200   1481.5800     34.9600      5.4909
+    538.7600   1481.6200     34.9700      5.4939
+    539.2100   1481.6900     34.9800      5.5073
+    540.1000   1481.7800     34.9700      5.5298
+    540.9900   1481.8400     34.9700      5.5401
+    541.4300   1481.9200     34.9800      5.5544
+    542.3300   1481.9800     34.9800      5.5667
+    542.7700   1482.0100     34.9700      5.5749
+    543.2200   1482.1000     35.0000      5.5862
+    544.5500   1482.2200     34.9900      5.6159
+    545.0000   1482.2700     34.9800      5.6282
+    545.8800   1482.3000     34.9800      5.6312
+    546.7700   1482.3900     34.9900      5.6456
+    547.2200   1482.4500     35.0000      5.6589
+    548.1100   1482.4900     34.9900      5.6671
+    548.5500   1482.5900     35.0300      5.6773
+    549.4500   1482.7000     35.0100      5.7059
+    550.3400   1482.7600     35.0000      5.7212
+    550.7800   1482.7700     35.0000      5.7233
+    551.6700   1482.7800     35.0000      5.7223
+    552.5600   1482.7900     35.0000      5.7202
+    553.4500   1482.7800     35.0000      5.7151
+    553.8900   1482.7900     35.0000      5.7141
+    554.7800   1482.7800     35.0000      5.7080
+    555.2300   1482.7900     35.0000      5.7080
+    556.1200   1482.7900     35.0000      5.7049
+    556.5600   1482.7800     35.0000      5.7008
+    557.4500   1482.7800     35.0000      5.6968
+    558.3400   1482.7900     35.0000      5.6947
+    558.7900   1482.7800     35.0000      5.6917
+    560.1200   1482.7900     35.0000      5.6866
+    560.5700   1482.7700     35.0100      5.6804
+    561.4600   1482.7700     35.0000      5.6784
+    561.9000   1482.7600     35.0000      5.6733
+    562.7900   1482.7500     35.0000      5.6661
+    563.2400   1482.7200     35.0000      5.6569
+    564.1300   1482.7000     35.0100      5.6487
+    564.5700   1482.6900     35.0000      5.6447
+    565.9100   1482.7000     35.0000      5.6416
+    566.3500   1482.6900     35.0000      5.6365
+    567.2400   1482.6900     35.0100      5.6324
+    567.6900   1482.7000     35.0000      5.6334
+    568.5800   1482.7100     35.0000      5.6314
+    569.0200   1482.7000     35.0000      5.6283
+    569.9100   1482.6700     35.0000      5.6171
+    570.8000   1482.6500     35.0000      5.6089
+    571.2500   1482.6400     35.0000      5.6038
+    571.6900   1482.6300     35.0000      5.5997
+    573.0300   1482.6500     35.0100      5.5976
+    573.4700   1482.6500     35.0000      5.5976
+    574.3600   1482.6600     35.0000      5.5966
+    574.8100   1482.6400     34.9900      5.5905
+    575.7000   1482.5800     34.9900      5.5741
+    576.5900   1482.5400     35.0000      5.5567
+    577.0300   1482.5100     35.0000      5.5485
+    577.9200   1482.5000     35.0000      5.5423
+    578.3700   1482.5000     35.0000      5.5382
+    579.2600   1482.5000     35.0000      5.5362
+    580.1400   1482.5100     35.0000      5.5352
+    580.5900   1482.4800     35.0000      5.5260
+    581.4800   1482.4500     35.0000      5.5147
+    582.3700   1482.4100     35.0000      5.5014
+    582.8100   1482.3900     35.0000      5.4942
+    583.7000   1482.3900     35.0000      5.4901
+    584.1500   1482.3800     35.0000      5.4870
+    585.0400   1482.4000     35.0000      5.4870
+    585.4800   1482.4000     35.0000      5.4850
+    586.3700   1482.4200     35.0000      5.4860
+    587.2600   1482.4400     35.0000      5.4884
+    588.1500   1482.4600     35.0000      5.4908
+    589.0400   1482.4800     35.0000      5.4932
+    589.4900   1482.4700     35.0000      5.4871
+    590.3800   1482.4300     34.9800      5.4778
+    590.8200   1482.3700     34.9900      5.4594
+    591.7100   1482.3500     34.9900      5.4501
+    592.1600   1482.3400     35.0000      5.4450
+    593.0500   1482.3200     34.9900      5.4378
+    593.9300   1482.3000     34.9900      5.4296
+    594.8300   1482.2500     34.9800      5.4173
+    595.2700   1482.2000     34.9800      5.4029
+    595.7200   1482.1600     34.9900      5.3886
+    596.6000   1482.1500     34.9900      5.3814
+    597.4900   1482.1500     34.9900      5.3783
+    598.3800   1482.1600     34.9900      5.3773
+    598.8300   1482.1600     34.9900      5.3763
+    599.7200   1482.1400     34.9800      5.3680
+    600.1600   1482.1200     34.9900      5.3609
+    600.6100   1482.1200     34.9900      5.3578
+    601.9400   1482.1300     34.9900      5.3537
+    602.3900   1482.1200     34.9800      5.3506
+    603.2800   1482.1100     34.9900      5.3455
+    603.7200   1482.1100     34.9900      5.3434
+    604.6100   1482.1300     34.9900      5.3424
+    605.5000   1482.1400     34.9900      5.3424
+    606.3900   1482.1500     34.9900      5.3424
+    606.8400   1482.1600     34.9900      5.3434
+    607.2800   1482.1700     34.9800      5.3434
+    608.1700   1482.1700     34.9800      5.3414
+    609.0600   1482.1900     34.9900      5.3404
+    609.9500   1482.1900     34.9800      5.3373
+    610.8400   1482.2000     34.9800      5.3373
+    611.2800   1482.1900     34.9900      5.3322
+    611.7300   1482.1900     34.9800      5.3311
+    612.6200   1482.2000     34.9800      5.3291
+    613.5100   1482.2000     34.9800      5.3260
+    614.4000   1482.2100     34.9800      5.3229
+    615.7300   1482.1800     34.9800      5.3126
+    616.1800   1482.1600     34.9800      5.3054
+    617.0700   1482.1500     34.9800      5.3013
+    617.9600   1482.1500     34.9800      5.2952
+    618.8500   1482.1300     34.9700      5.2900
+    619.2900   1482.0700     34.9700      5.2736
+    620.1800   1481.9900     34.9600      5.2540
+    620.6200   1481.9200     34.9700      5.2303
+    621.5100   1481.8800     34.9700      5.2159
+    621.9600   1481.8600     34.9700      5.2098
+    622.8500   1481.8700     34.9800      5.2067
+    623.7400   1481.8900     34.9700      5.2087
+    624.6300   1481.9000     34.9800      5.2077
+    625.0700   1481.9100     34.9700      5.2087
+    625.9600   1481.9100     34.9700      5.2067
+    626.4100   1481.9000     34.9700      5.2026
+    627.3000   1481.8900     34.9700      5.1964
+    627.7400   1481.8900     34.9700      5.1923
+    628.6300   1481.8900     34.9700      5.1892
+    629.0800   1481.8900     34.9700      5.1871
+    629.9600   1481.9000     34.9700      5.1871
+    631.3000   1481.9100     34.9700      5.1841
+    631.7400   1481.9200     34.9700      5.1830
+    632.1900   1481.9200     34.9700      5.1830
+    633.0800   1481.9200     34.9700      5.1800
+    633.5200   1481.9000     34.9600      5.1748
+    634.4100   1481.8800     34.9700      5.1655
+    634.8600   1481.8500     34.9700      5.1552
+    635.7500   1481.8600     34.9700      5.1532
+    636.6400   1481.8600     34.9700      5.1501
+    637.5200   1481.8800     34.9700      5.1501
+    637.9700   1481.8800     34.9700      5.1491
+    638.8600   1481.8800     34.9700      5.1460
+    639.3000   1481.8800     34.9700      5.1429
+    640.1900   1481.8700     34.9700      5.1388
+    641.0800   1481.8700     34.9700      5.1357
+    641.5300   1481.8600     34.9700      5.1285
+    641.9700   1481.8400     34.9700      5.1243
+    642.8600   1481.8500     34.9700      5.1223
+    643.7500   1481.8600     34.9700      5.1202
+    644.2000   1481.8600     34.9700      5.1182
+    645.5300   1481.8600     34.9700      5.1151
+    645.9800   1481.8600     34.9700      5.1130
+    646.8700   1481.8700     34.9700      5.1099
+    647.3100   1481.8800     34.9700      5.1110
+    648.2000   1481.8900     34.9700      5.1089
+    648.6400   1481.8900     34.9700      5.1079
+    649.5300   1481.8900     34.9700      5.1048
+    649.9800   1481.9000     34.9700      5.1038
+    651.3100   1481.9100     34.9700      5.1027
+    651.7600   1481.9100     34.9700      5.0996
+    652.6500   1481.9200     34.9700      5.0996
+    653.0900   1481.9300     34.9700      5.0997
+    653.9800   1481.9400     34.9700      5.0976
+    654.8700   1481.9400     34.9700      5.0966
+    655.3100   1481.9500     34.9700      5.0955
+    655.7600   1481.9500     34.9700      5.0935
+    656.6500   1481.9500     34.9700      5.0914
+    657.0900   1481.9500     34.9700      5.0883
+    657.5400   1481.9500     34.9700      5.0873
+    658.8700   1481.9700     34.9700      5.0863
+    659.7600   1481.9800     34.9700      5.0863
+    660.2100   1481.9800     34.9700      5.0832
+    661.1000   1481.9800     34.9700      5.0801
+    661.5400   1481.9700     34.9700      5.0760
+    662.4300   1481.9700     34.9700      5.0729
+    663.3200   1481.9800     34.9700      5.0708
+    663.7600   1481.9900     34.9700      5.0719
+    664.2100   1481.9800     34.9700      5.0667
+    665.5400   1481.9700     34.9600      5.0615
+    665.9900   1481.9500     34.9600      5.0543
+    666.8800   1481.9400     34.9600      5.0481
+    667.3200   1481.9100     34.9600      5.0409
+    668.2100   1481.8800     34.9600      5.0295
+    668.6500   1481.8700     34.9700      5.0223
+    669.5400   1481.8600     34.9600      5.0172
+    670.4300   1481.8700     34.9700      5.0141
+    670.8800   1481.8600     34.9700      5.0120
+    671.3200   1481.8400     34.9600      5.0068
+    672.2100   1481.8300     34.9600      4.9986
+    673.1000   1481.8300     34.9700      4.9944
+    673.9900   1481.8400     34.9600      4.9931
+    674.4300   1481.8400     34.9600      4.9917
+    675.3200   1481.8400     34.9600      4.9903
+    675.7700   1481.8400     34.9600      4.9862
+    676.6600   1481.8400     34.9600      4.9841
+    677.1000   1481.8400     34.9600      4.9810
+    677.9900   1481.8400     34.9700      4.9779
+    678.4400   1481.8500     34.9700      4.9758
+    679.7700   1481.8600     34.9700      4.9748
+    680.2200   1481.8600     34.9600      4.9748
+    681.1100   1481.8600     34.9600      4.9707
+    681.5500   1481.8700     34.9600      4.9696
+    682.4400   1481.8900     34.9700      4.9696
+    682.8800   1481.8900     34.9700      4.9696
+    683.7700   1481.9100     34.9700      4.9696
+    684.6600   1481.9200     34.9700      4.9696
+    685.1100   1481.9300     34.9700      4.9696
+    685.5500   1481.9500     34.9700      4.9707
+    686.4400   1481.9700     34.9700      4.9727
+    687.3300   1481.9900     34.9700      4.9738
+    687.7700   1482.0000     34.9700      4.9758
+    688.6600   1482.0200     34.9700      4.9769
+    689.1100   1482.0300     34.9700      4.9779
+    690.0000   1482.0500     34.9700      4.9779
+    690.8900   1482.0700     34.9700      4.9779
+    691.3300   1482.0700     34.9700      4.9769
+    692.2200   1482.0800     34.9700      4.9758
+    693.1100   1482.1000     34.9700      4.9769
+    693.5500   1482.1000     34.9700      4.9758
+    694.4400   1482.0900     34.9600      4.9727
+    695.3300   1482.0900     34.9700      4.9665
+    695.7800   1482.0800     34.9800      4.9603
+    696.2200   1482.0900     34.9800      4.9603
+    697.1100   1482.1200     34.9800      4.9624
+    698.0000   1482.2200     35.0100      4.9748
+    698.4500   1482.3400     34.9900      5.0058
+    699.3300   1482.3900     34.9900      5.0172
+    699.7800   1482.3900     34.9800      5.0182
+    700.6700   1482.4000     34.9800      5.0151
+    701.5600   1482.4100     34.9900      5.0131
+    702.4500   1482.4200     34.9900      5.0131
+    702.8900   1482.4300     34.9900      5.0131
+    703.7800   1482.4400     34.9900      5.0131
+    704.2200   1482.4500     34.9900      5.0120
+    705.1100   1482.4600     34.9900      5.0110
+    705.5600   1482.4700     34.9900      5.0110
+    706.4500   1482.4800     34.9900      5.0110
+    706.8900   1482.4900     34.9900      5.0100
+    707.7800   1482.4800     34.9800      5.0069
+    708.6700   1482.4800     34.9900      5.0017
+    709.5600   1482.4800     34.9900      4.9976
+    710.0000   1482.4800     34.9900      4.9945
+    710.8900   1482.4900     34.9900      4.9934
+    711.3400   1482.4800     34.9900      4.9914
+    712.2300   1482.4900     34.9900      4.9883
+    713.1200   1482.4600     34.9800      4.9800
+    713.5600   1482.4300     34.9900      4.9686
+    714.0100   1482.4000     34.9900      4.9603
+    715.3400   1482.4100     34.9900      4.9572
+    715.7800   1482.4100     34.9900      4.9552
+    716.6700   1482.4200     34.9900      4.9531
+    717.1200   1482.4200     34.9900      4.9521
+    718.0100   1482.4300     34.9900      4.9500
+    718.8900   1482.4400     34.9900      4.9490
+    719.3400   1482.4500     34.9900      4.9490
+    720.2300   1482.4600     34.9900      4.9479
+    721.1200   1482.4600     34.9900      4.9448
+    721.5600   1482.4500     34.9900      4.9417
+    722.4500   1482.4600     34.9900      4.9407
+    723.3400   1482.4600     34.9900      4.9376
+    723.7800   1482.4700     34.9900      4.9365
+    724.6700   1482.4800     34.9900      4.9355
+    725.1200   1482.4800     34.9900      4.9345
+    726.0100   1482.4900     34.9900      4.9334
+    726.9000   1482.5100     34.9900      4.9324
+    727.3400   1482.5000     34.9900      4.9303
+    728.2300   1482.5100     34.9800      4.9293
+    728.6700   1482.4700     34.9800      4.9210
+    729.5600   1482.4400     34.9800      4.9076
+    730.4500   1482.4200     34.9800      4.8993
+    731.3400   1482.3900     34.9800      4.8889
+    731.7900   1482.3600     34.9800      4.8775
+    732.2300   1482.3600     34.9900      4.8744
+    733.1200   1482.3700     34.9900      4.8734
+    734.0100   1482.3700     34.9900      4.8713
+    734.4500   1482.3700     34.9900      4.8682
+    735.3400   1482.3500     34.9800      4.8620
+    736.2300   1482.3100     34.9800      4.8485
+    736.6700   1482.3100     34.9900      4.8444
+    737.5600   1482.3100     34.9800      4.8423
+    738.4500   1482.3100     34.9800      4.8392
+    738.9000   1482.2900     34.9800      4.8351
+    739.7900   1482.2700     34.9700      4.8257
+    740.6800   1482.2600     34.9800      4.8195
+    741.1200   1482.2200     34.9700      4.8091
+    741.5700   1482.1600     34.9700      4.7936
+    742.4500   1482.1200     34.9700      4.7811
+    743.3400   1482.0700     34.9600      4.7677
+    743.7900   1482.0200     34.9700      4.7510
+    744.6800   1482.0000     34.9700      4.7407
+    745.5700   1481.9900     34.9700      4.7344
+    746.0100   1481.9800     34.9700      4.7293
+    746.9000   1481.9800     34.9700      4.7282
+    747.7900   1481.9900     34.9700      4.7272
+    748.2300   1482.0000     34.9700      4.7261
+    749.1200   1482.0000     34.9700      4.7241
+    750.0100   1482.0100     34.9700      4.7230
+    750.9000   1482.0200     34.9700      4.7220
+    751.7900   1482.0200     34.9700      4.7189
+    752.2300   1482.0300     34.9700      4.7178
+    753.1200   1482.0400     34.9700      4.7168
+    754.0100   1482.0500     34.9700      4.7158
+    754.4500   1482.0400     34.9700      4.7126
+    754.9000   1482.0400     34.9700      4.7116
+    755.7900   1482.0500     34.9600      4.7106
+    756.6800   1482.0300     34.9600      4.7033
+    757.1200   1482.0100     34.9600      4.6971
+    758.0100   1482.0000     34.9600      4.6898
+    758.9000   1482.0100     34.9700      4.6867
+    759.7900   1482.0200     34.9700      4.6856
+    760.2300   1482.0200     34.9700      4.6846
+    761.1200   1482.0300     34.9600      4.6836
+    761.5700   1482.0300     34.9600      4.6825
+    762.4500   1482.0300     34.9700      4.6794
+    763.3400   1482.0500     34.9700      4.6794
+    763.7900   1482.0600     34.9700      4.6805
+    764.6800   1482.0700     34.9700      4.6795
+    765.5700   1482.0800     34.9600      4.6795
+    766.0100   1482.0900     34.9600      4.6795
+    766.9000   1482.1000     34.9600      4.6774
+    767.7900   1482.1000     34.9600      4.6753
+    768.2300   1482.1000     34.9600      4.6733
+    769.1200   1482.1000     34.9600      4.6702
+    769.5700   1482.0900     34.9600      4.6660
+    770.4500   1482.0700     34.9600      4.6577
+    770.9000   1482.0600     34.9600      4.6535
+    772.2300   1482.0500     34.9600      4.6463
+    772.6800   1482.0400     34.9600      4.6400
+    773.5700   1482.0400     34.9600      4.6369
+    774.4500   1482.0500     34.9600      4.6349
+    774.9000   1482.0500     34.9600      4.6338
+    775.7900   1482.0600     34.9600      4.6318
+    776.2300   1482.0600     34.9600      4.6307
+    777.1200   1482.0700     34.9600      4.6297
+    778.0100   1482.0800     34.9600      4.6297
+    778.4500   1482.0800     34.9600      4.6276
+    779.3400   1482.0800     34.9600      4.6256
+    780.2300   1482.0900     34.9600      4.6225
+    781.1200   1482.0900     34.9600      4.6193
+    781.5600   1482.0800     34.9600      4.6152
+    782.4500   1482.0900     34.9600      4.6142
+    783.3400   1482.1000     34.9600      4.6142
+    783.7900   1482.1000     34.9600      4.6121
+    784.6700   1482.1100     34.9600      4.6100
+    785.1200   1482.0900     34.9500      4.6059
+    786.0100   1482.0800     34.9500      4.5986
+    786.9000   1482.0800     34.9500      4.5945
+    787.7800   1482.0900     34.9600      4.5913
+    788.2300   1482.0900     34.9600      4.5903
+    789.1200   1482.1200     34.9600      4.5934
+    790.0100   1482.1400     34.9600      4.5955
+    790.4500   1482.1200     34.9500      4.5903
+    791.3400   1482.0900     34.9400      4.5820
+    791.7800   1482.0500     34.9500      4.5706
+    792.6700   1482.0400     34.9500      4.5623
+    793.5600   1482.0400     34.9500      4.5581
+    794.4500   1482.0300     34.9500      4.5539
+    794.8900   1482.0200     34.9500      4.5487
+    795.7800   1482.0200     34.9500      4.5436
+    796.6700   1482.0300     34.9500      4.5425
+    797.1200   1482.0300     34.9500      4.5415
+    798.0100   1482.0400     34.9500      4.5405
+    798.4500   1482.0500     34.9500      4.5394
+    799.3400   1482.0500     34.9500      4.5384
+    800.2300   1482.0700     34.9500      4.5394
+    800.6700   1482.0700     34.9500      4.5374
+    801.5600   1482.0700     34.9500      4.5342
+    802.4500   1482.0600     34.9500      4.5270
+    802.8900   1482.0500     34.9500      4.5249
+    803.7800   1482.0600     34.9500      4.5218
+    804.6700   1482.0700     34.9500      4.5207
+    805.1200   1482.0800     34.9500      4.5208
+    806.0000   1482.1000     34.9500      4.5228
+    806.4500   1482.1100     34.9500      4.5229
+    807.3400   1482.1200     34.9500      4.5229
+    807.7800   1482.1400     34.9500      4.5250
+    808.6700   1482.1500     34.9500      4.5239
+    809.5600   1482.1700     34.9500      4.5250
+    810.0000   1482.1800     34.9500      4.5250
+    810.8900   1482.1900     34.9500      4.5250
+    811.3400   1482.2000     34.9500      4.5250
+    812.2200   1482.2100     34.9500      4.5240
+    812.6700   1482.2100     34.9500      4.5219
+    813.1100   1482.2100     34.9500      4.5219
+    814.0000   1482.2200     34.9500      4.5198
+    814.8900   1482.2300     34.9500      4.5177
+    815.7800   1482.2500     34.9500      4.5178
+    816.2200   1482.2500     34.9500      4.5167
+    817.1100   1482.2600     34.9500      4.5178
+    818.0000   1482.2700     34.9500      4.5157
+    818.4400   1482.2700     34.9500      4.5136
+    818.8900   1482.2800     34.9500      4.5136
+    819.7800   1482.2800     34.9500      4.5116
+    820.6700   1482.3000     34.9500      4.5105
+    821.5500   1482.3100     34.9500      4.5105
+    822.0000   1482.3200     34.9500      4.5105
+    822.8900   1482.3300     34.9500      4.5106
+    823.7800   1482.3500     34.9500      4.5106
+    824.2200   1482.3500     34.9500      4.5095
+    824.6600   1482.3300     34.9500      4.5043
+    825.5500   1482.3400     34.9500      4.5033
+    826.4400   1482.3400     34.9500      4.4981
+    826.8800   1482.3200     34.9400      4.4939
+    827.7700   1482.3000     34.9400      4.4856
+    829.1100   1482.2300     34.9500      4.4627
+    830.0000   1482.2300     34.9400      4.4585
+    830.4400   1482.2200     34.9500      4.4533
+    831.3300   1482.2300     34.9400      4.4533
+    831.7700   1482.2200     34.9400      4.4492
+    832.6600   1482.2200     34.9500      4.4450
+    833.5500   1482.2300     34.9400      4.4440
+    833.9900   1482.2300     34.9500      4.4419
+    834.8800   1482.2400     34.9500      4.4419
+    835.7700   1482.2500     34.9400      4.4419
+    836.6600   1482.2500     34.9400      4.4367
+    837.1000   1482.2400     34.9400      4.4346
+    837.9900   1482.2300     34.9400      4.4284
+    838.8800   1482.2200     34.9400      4.4221
+    839.3300   1482.2000     34.9400      4.4159
+    840.2100   1482.1900     34.9400      4.4086
+    840.6600   1482.1800     34.9400      4.4054
+    841.5500   1482.1700     34.9400      4.3992
+    841.9900   1482.1400     34.9300      4.3919
+    842.8800   1482.1200     34.9400      4.3825
+    843.3200   1482.1000     34.9400      4.3752
+    844.2100   1482.0900     34.9400      4.3700
+    845.1000   1482.0900     34.9400      4.3658
+    845.5400   1482.1000     34.9400      4.3658
+    846.4300   1482.1100     34.9400      4.3638
+    847.3200   1482.1200     34.9400      4.3634
+    847.7600   1482.1200     34.9400      4.3631
+    848.2100   1482.1300     34.9400      4.3627
+    849.1000   1482.1300     34.9400      4.3596
+    849.9900   1482.1300     34.9400      4.3564
+    850.4300   1482.1400     34.9400      4.3554
+    851.3200   1482.1500     34.9400      4.3554
+    852.2100   1482.1500     34.9300      4.3533
+    852.6500   1482.1600     34.9400      4.3512
+    853.5400   1482.1700     34.9400      4.3512
+    854.4300   1482.1800     34.9400      4.3502
+    854.8700   1482.1800     34.9300      4.3491
+    855.7600   1482.1800     34.9400      4.3449
+    856.2100   1482.1800     34.9300      4.3449
+    856.6500   1482.1900     34.9400      4.3428
+    857.9800   1482.2100     34.9300      4.3428
+    858.4300   1482.2000     34.9400      4.3397
+    859.3200   1482.2200     34.9400      4.3407
+    859.7600   1482.2200     34.9400      4.3386
+    860.6500   1482.2300     34.9300      4.3376
+    861.5300   1482.2400     34.9400      4.3355
+    862.4200   1482.2500     34.9300      4.3345
+    862.8700   1482.2500     34.9300      4.3345
+    863.3100   1482.2600     34.9300      4.3334
+    864.2000   1482.2700     34.9400      4.3313
+    865.0900   1482.2700     34.9400      4.3303
+    865.9800   1482.2900     34.9300      4.3303
+    866.4200   1482.3000     34.9400      4.3303
+    867.3100   1482.3100     34.9400      4.3292
+    868.2000   1482.3200     34.9300      4.3292
+    868.6400   1482.3300     34.9400      4.3282
+    869.5300   1482.3400     34.9300      4.3282
+    869.9800   1482.3400     34.9400      4.3261
+    870.8600   1482.3500     34.9300      4.3261
+    871.7500   1482.3600     34.9300      4.3261
+    872.6400   1482.3600     34.9300      4.3229
+    873.0800   1482.3600     34.9300      4.3198
+    873.9700   1482.3600     34.9200      4.3177
+    874.4200   1482.3400     34.9200      4.3114
+    875.3000   1482.3000     34.9300      4.2989
+    875.7500   1482.2800     34.9300      4.2905
+    876.6400   1482.2700     34.9300      4.2842
+    877.5300   1482.2500     34.9300      4.2769
+    877.9700   1482.2500     34.9300      4.2738
+    879.3000   1482.2600     34.9300      4.2706
+    879.7500   1482.2500     34.9300      4.2675
+    880.6300   1482.2600     34.9300      4.2654
+    881.0800   1482.2500     34.9300      4.2623
+    881.9700   1482.2600     34.9300      4.2602
+    882.8600   1482.2700     34.9300      4.2591
+    883.3000   1482.2700     34.9300      4.2570
+    884.1900   1482.2800     34.9300      4.2560
+    884.6300   1482.2700     34.9300      4.2539
+    885.0800   1482.2600     34.9200      4.2497
+    886.4100   1482.2600     34.9300      4.2424
+    886.8500   1482.2600     34.9300      4.2413
+    887.7400   1482.2500     34.9200      4.2361
+    888.6300   1482.2500     34.9200      4.2319
+    889.0700   1482.2400     34.9300      4.2277
+    889.9600   1482.2500     34.9300      4.2277
+    890.4000   1482.2500     34.9300      4.2256
+    891.2900   1482.2600     34.9300      4.2245
+    892.1800   1482.2700     34.9200      4.2235
+    893.0700   1482.2900     34.9300      4.2224
+    893.5100   1482.2900     34.9300      4.2224
+    894.4000   1482.3000     34.9200      4.2224
+    894.8500   1482.3000     34.9200      4.2214
+    895.7400   1482.3100     34.9200      4.2193
+    896.6200   1482.3100     34.9200      4.2172
+    897.0700   1482.3000     34.9200      4.2109
+    897.9600   1482.3000     34.9200      4.2088
+    898.4000   1482.3000     34.9200      4.2046
+    899.2900   1482.2900     34.9200      4.2015
+    900.1800   1482.2800     34.9200      4.1931
+    901.0600   1482.2700     34.9200      4.1889
+    901.5100   1482.2600     34.9200      4.1837
+    902.4000   1482.2500     34.9200      4.1784
+    903.2800   1482.2500     34.9200      4.1753
+    903.7300   1482.2500     34.9200      4.1721
+    904.1700   1482.2500     34.9200      4.1700
+    905.0600   1482.2600     34.9200      4.1690
+    905.9500   1482.2700     34.9200      4.1679
+    906.3900   1482.2700     34.9200      4.1669
+    907.7300   1482.2900     34.9200      4.1658
+    908.1700   1482.2900     34.9200      4.1637
+    909.0600   1482.2800     34.9200      4.1585
+    909.5000   1482.2800     34.9200      4.1564
+    910.3900   1482.2800     34.9200      4.1543
+    911.2800   1482.2900     34.9200      4.1522
+    912.1700   1482.3000     34.9200      4.1522
+    912.6100   1482.3000     34.9200      4.1491
+    913.5000   1482.3200     34.9200      4.1491
+    913.9400   1482.3200     34.9200      4.1480
+    914.8300   1482.3200     34.9200      4.1449
+    915.7200   1482.3400     34.9200      4.1459
+    916.1600   1482.3300     34.9200      4.1428
+    917.0500   1482.3500     34.9200      4.1417
+    917.9400   1482.3500     34.9200      4.1407
+    918.8300   1482.3600     34.9200      4.1407
+    919.2700   1482.3600     34.9200      4.1386
+    920.1600   1482.3800     34.9200      4.1375
+    921.0500   1482.3900     34.9200      4.1365
+    921.9300   1482.4100     34.9200      4.1385
+    922.3800   1482.4100     34.9200      4.1364
+    923.2700   1482.4300     34.9200      4.1375
+    924.1500   1482.4400     34.9200      4.1364
+    924.6000   1482.4400     34.9200      4.1364
+    925.4900   1482.4600     34.9200      4.1343
+    925.9300   1482.4600     34.9200      4.1354
+    926.8200   1482.4700     34.9200      4.1343
+    927.2600   1482.4700     34.9200      4.1322
+    928.1500   1482.4900     34.9200      4.1322
+    929.0400   1482.4900     34.9200      4.1301
+    929.9300   1482.5100     34.9200      4.1301
+    930.8200   1482.5200     34.9200      4.1291
+    931.2600   1482.5200     34.9200      4.1280
+    932.1500   1482.5300     34.9200      4.1270
+    932.5900   1482.5300     34.9200      4.1259
+    933.4800   1482.5500     34.9200      4.1259
+    934.3700   1482.5600     34.9200      4.1238
+    934.8100   1482.5600     34.9200      4.1238
+    935.7000   1482.5800     34.9200      4.1238
+    936.5900   1482.5900     34.9100      4.1238
+    937.4800   1482.6000     34.9200      4.1217
+    937.9200   1482.6000     34.9200      4.1207
+    938.8100   1482.6200     34.9200      4.1207
+    939.7000   1482.6300     34.9200      4.1197
+    940.1400   1482.6400     34.9200      4.1207
+    940.5800   1482.6400     34.9200      4.1186
+    941.4700   1482.6500     34.9100      4.1197
+    942.3600   1482.6700     34.9200      4.1186
+    943.2500   1482.6800     34.9200      4.1186
+    943.6900   1482.6900     34.9200      4.1176
+    944.5800   1482.7000     34.9200      4.1165
+    945.4700   1482.7200     34.9200      4.1176
+    945.9100   1482.7200     34.9200      4.1155
+    946.8000   1482.7300     34.9200      4.1155
+    947.6900   1482.7500     34.9200      4.1155
+    948.1300   1482.7500     34.9200      4.1155
+    949.0200   1482.7700     34.9200      4.1155
+    949.9100   1482.7800     34.9200      4.1145
+    950.7900   1482.7900     34.9200      4.1134
+    951.2400   1482.8000     34.9200      4.1145
+    952.1300   1482.8100     34.9200      4.1135
+    953.0100   1482.8300     34.9200      4.1145
+    953.4600   1482.8400     34.9200      4.1135
+    954.3500   1482.8600     34.9200      4.1145
+    954.7900   1482.8600     34.9200      4.1145
+    955.6800   1482.8800     34.9200      4.1145
+    956.5700   1482.8900     34.9200      4.1145
+    957.0100   1482.9000     34.9200      4.1145
+    958.3400   1482.9200     34.9200      4.1145
+    958.7900   1482.9300     34.9200      4.1145
+    959.2300   1482.9400     34.9200      4.1156
+    960.1200   1482.9500     34.9200      4.1146
+    961.0100   1482.9700     34.9200      4.1156
+    961.4500   1482.9700     34.9200      4.1146
+    962.3400   1482.9900     34.9200      4.1135
+    962.7800   1482.9900     34.9200      4.1125
+    963.6700   1483.0000     34.9200      4.1114
+    964.5600   1483.0200     34.9200      4.1125
+    965.4500   1483.0300     34.9200      4.1104
+    965.8900   1483.0300     34.9200      4.1093
+    966.7800   1483.0500     34.9200      4.1115
+    967.2200   1483.0500     34.9200      4.1104
+    968.1100   1483.0700     34.9200      4.1104
+    969.0000   1483.0800     34.9200      4.1094
+    969.4400   1483.0900     34.9200      4.1094
+    969.8800   1483.1000     34.9200      4.1094
+    970.7700   1483.1100     34.9200      4.1083
+    971.2200   1483.1100     34.9200      4.1073
+    972.5500   1483.1300     34.9200      4.1062
+    972.9900   1483.1300     34.9200      4.1052
+    973.4400   1483.1300     34.9200      4.1042
+    974.7700   1483.1400     34.9200      4.1021
+    975.2100   1483.1400     34.9200      4.1000
+    976.1000   1483.1500     34.9200      4.0979
+    976.5400   1483.1600     34.9200      4.0968
+    976.9900   1483.1600     34.9200      4.0958
+    977.8800   1483.1700     34.9200      4.0947
+    979.2100   1483.1900     34.9200      4.0948
+    979.6500   1483.2000     34.9200      4.0948
+    980.1000   1483.2000     34.9200      4.0937
+    980.9800   1483.2100     34.9200      4.0937
+    981.8700   1483.2300     34.9200      4.0927
+    982.3100   1483.2300     34.9200      4.0916
+    983.2000   1483.2500     34.9200      4.0916
+    984.0900   1483.2600     34.9200      4.0927
+    984.9800   1483.2800     34.9200      4.0916
+    985.4200   1483.2800     34.9200      4.0906
+    986.3100   1483.2900     34.9200      4.0906
+    986.7500   1483.3000     34.9200      4.0906
+    987.6400   1483.3100     34.9200      4.0906
+    988.0900   1483.3200     34.9200      4.0896
+    989.4200   1483.3400     34.9200      4.0896
+    989.8600   1483.3500     34.9200      4.0885
+    990.3000   1483.3500     34.9200      4.0896
+    991.1900   1483.3600     34.9200      4.0875
+    992.0800   1483.3800     34.9200      4.0875
+    992.5200   1483.3800     34.9200      4.0865
+    993.8600   1483.4100     34.9200      4.0875
+    994.3000   1483.4100     34.9200      4.0875
+    994.7400   1483.4200     34.9200      4.0865
+    995.6300   1483.4300     34.9200      4.0865
+    996.5200   1483.4400     34.9200      4.0854
+    996.9600   1483.4500     34.9200      4.0865
+    997.8500   1483.4700     34.9200      4.0854
+    998.2900   1483.4700     34.9200      4.0844
+    999.1800   1483.4800     34.9200      4.0833
+   1000.0700   1483.5000     34.9200      4.0844
+   1000.9600   1483.5100     34.9200      4.0834
+   1001.4000   1483.5100     34.9200      4.0823
+   1001.8500   1483.5200     34.9200      4.0823
+   1002.7300   1483.5300     34.9200      4.0802
+   1003.6200   1483.5300     34.9200      4.0781
+   1004.5100   1483.5400     34.9200      4.0771
+   1004.9500   1483.5500     34.9200      4.0771
+   1005.4000   1483.5500     34.9200      4.0760
+   1006.2800   1483.5700     34.9200      4.0761
+   1007.1700   1483.5800     34.9200      4.0750
+   1008.0600   1483.6000     34.9200      4.0750
+   1008.5000   1483.6100     34.9200      4.0761
+   1009.3900   1483.6200     34.9200      4.0750
+   1009.8300   1483.6200     34.9200      4.0750
+   1010.7200   1483.6400     34.9200      4.0750
+   1011.6100   1483.6500     34.9200      4.0740
+   1012.0500   1483.6500     34.9200      4.0729
+   1012.9400   1483.6700     34.9200      4.0730
+   1013.8300   1483.6800     34.9200      4.0719
+   1014.7200   1483.6900     34.9200      4.0719
+   1015.6000   1483.7000     34.9200      4.0709
+   1016.0500   1483.7100     34.9200      4.0709
+   1016.4900   1483.7200     34.9200      4.0698
+   1016.9300   1483.7300     34.9200      4.0709
+   1017.8200   1483.7400     34.9200      4.0688
+   1018.7100   1483.7600     34.9200      4.0709
+   1019.6000   1483.7700     34.9200      4.0709
+   1020.0400   1483.7700     34.9200      4.0688
+   1020.9300   1483.7800     34.9200      4.0688
+   1021.8200   1483.7900     34.9200      4.0667
+   1022.2600   1483.7900     34.9200      4.0664
+   1023.1500   1483.8100     34.9200      4.0660
+   1023.5900   1483.8100     34.9200      4.0657
+   1024.4800   1483.8100     34.9200      4.0615
+   1024.9200   1483.8100     34.9200      4.0594
+   1025.8100   1483.8300     34.9200      4.0583
+   1026.7000   1483.8400     34.9200      4.0594
+   1028.0300   1483.8700     34.9200      4.0604
+   1028.4700   1483.8700     34.9200      4.0594
+   1029.3600   1483.8900     34.9200      4.0594
+   1029.8000   1483.9000     34.9200      4.0605
+   1030.6900   1483.9100     34.9200      4.0594
+   1031.5800   1483.9300     34.9200      4.0605
+   1032.0200   1483.9200     34.9200      4.0584
+   1032.9100   1483.9200     34.9200      4.0552
+   1033.3600   1483.9100     34.9200      4.0489
+   1034.2400   1483.9100     34.9200      4.0458
+   1035.1300   1483.9200     34.9200      4.0458
+   1036.0200   1483.9400     34.9200      4.0447
+   1036.4600   1483.9300     34.9200      4.0416
+   1036.9100   1483.9400     34.9200      4.0406
+   1037.7900   1483.9500     34.9200      4.0395
+   1038.2400   1483.9500     34.9200      4.0385
+   1039.1200   1483.9700     34.9200      4.0395
+   1040.0100   1483.9800     34.9200      4.0395
+   1040.4500   1483.9800     34.9200      4.0385
+   1041.3400   1484.0000     34.9200      4.0374
+   1041.7900   1484.0000     34.9200      4.0374
+   1042.6700   1484.0100     34.9200      4.0353
+   1043.5600   1484.0200     34.9200      4.0343
+   1044.4500   1484.0300     34.9200      4.0322
+   1045.3400   1484.0300     34.9200      4.0311
+   1046.2200   1484.0300     34.9200      4.0280
+   1047.1100   1484.0300     34.9200      4.0228
+   1047.5600   1484.0300     34.9200      4.0207
+   1048.4400   1484.0300     34.9200      4.0175
+   1049.3300   1484.0400     34.9200      4.0154
+   1049.7700   1484.0400     34.9200      4.0154
+   1050.6600   1484.0500     34.9200      4.0133
+   1051.5500   1484.0600     34.9200      4.0133
+   1052.4400   1484.0800     34.9200      4.0133
+   1053.3200   1484.0800     34.9200      4.0102
+   1054.2100   1484.0900     34.9200      4.0091
+   1055.1000   1484.1000     34.9200      4.0060
+   1055.5400   1484.1000     34.9200      4.0060
+   1055.9800   1484.1000     34.9200      4.0039
+   1056.8700   1484.1100     34.9200      4.0028
+   1057.7600   1484.1200     34.9200      4.0028
+   1058.6500   1484.1200     34.9200      3.9986
+   1059.0900   1484.1200     34.9200      3.9976
+   1059.9800   1484.1300     34.9200      3.9966
+   1060.8700   1484.1400     34.9200      3.9945
+   1061.3100   1484.1400     34.9200      3.9924
+   1061.7500   1484.1300     34.9200      3.9892
+   1063.0900   1484.1400     34.9200      3.9850
+   1063.9700   1484.1500     34.9200      3.9840
+   1064.4200   1484.1500     34.9200      3.9819
+   1065.3000   1484.1600     34.9200      3.9819
+   1065.7500   1484.1700     34.9200      3.9808
+   1066.6300   1484.1800     34.9200      3.9808
+   1067.0800   1484.1900     34.9200      3.9808
+   1067.9600   1484.2000     34.9200      3.9808
+   1068.4100   1484.2000     34.9200      3.9787
+   1069.3000   1484.2200     34.9200      3.9798
+   1070.1800   1484.2300     34.9200      3.9787
+   1071.0700   1484.2400     34.9100      3.9777
+   1071.9600   1484.2400     34.9200      3.9735
+   1072.4000   1484.2400     34.9200      3.9714
+   1072.8500   1484.2300     34.9200      3.9682
+   1073.7300   1484.2400     34.9200      3.9661
+   1074.6200   1484.2600     34.9200      3.9672
+   1075.0600   1484.2600     34.9200      3.9662
+   1075.9500   1484.2700     34.9100      3.9662
+   1076.4000   1484.2700     34.9200      3.9641
+   1077.7300   1484.2900     34.9200      3.9630
+   1078.1700   1484.2900     34.9200      3.9620
+   1079.0600   1484.3100     34.9200      3.9620
+   1079.5000   1484.3200     34.9200      3.9630
+   1080.3900   1484.3300     34.9200      3.9620
+   1080.8300   1484.3400     34.9200      3.9609
+   1081.7200   1484.3500     34.9200      3.9609
+   1082.6100   1484.3600     34.9200      3.9599
+   1083.0500   1484.3700     34.9200      3.9609
+   1083.4900   1484.3800     34.9200      3.9599
+   1084.3800   1484.3900     34.9200      3.9599
+   1085.2700   1484.4000     34.9200      3.9599
+   1086.1600   1484.4100     34.9200      3.9588
+   1087.0400   1484.4300     34.9200      3.9578
+   1087.4900   1484.4300     34.9200      3.9578
+   1088.3700   1484.4500     34.9200      3.9578
+   1089.2600   1484.4500     34.9200      3.9557
+   1089.7000   1484.4600     34.9100      3.9547
+   1090.5900   1484.4600     34.9200      3.9515
+   1091.0400   1484.4700     34.9200      3.9515
+   1091.9200   1484.4700     34.9100      3.9484
+   1092.8100   1484.4800     34.9100      3.9473
+   1093.2500   1484.4800     34.9200      3.9463
+   1094.1400   1484.4900     34.9200      3.9442
+   1095.0300   1484.5000     34.9200      3.9442
+   1095.4700   1484.5100     34.9200      3.9442
+   1096.3600   1484.5300     34.9200      3.9442
+   1096.8000   1484.5300     34.9200      3.9431
+   1097.6900   1484.5400     34.9100      3.9431
+   1098.5800   1484.5600     34.9100      3.9431
+   1099.0200   1484.5600     34.9200      3.9410
+   1099.9100   1484.5700     34.9100      3.9410
+   1100.8000   1484.5800     34.9100      3.9400
+   1101.2400   1484.5900     34.9100      3.9400
+   1102.1300   1484.6000     34.9200      3.9390
+   1103.0100   1484.6100     34.9100      3.9390
+   1103.4600   1484.6200     34.9100      3.9390
+   1104.3400   1484.6300     34.9200      3.9379
+   1104.7900   1484.6400     34.9100      3.9379
+   1105.6700   1484.6500     34.9200      3.9369
+   1106.5600   1484.6600     34.9100      3.9369
+   1107.0100   1484.6700     34.9100      3.9358
+   1107.8900   1484.6800     34.9100      3.9358
+   1108.3400   1484.6900     34.9100      3.9358
+   1109.2200   1484.7000     34.9100      3.9358
+   1110.1100   1484.7200     34.9100      3.9358
+   1110.5500   1484.7200     34.9200      3.9348
+   1111.4400   1484.7400     34.9100      3.9358
+   1111.8800   1484.7400     34.9100      3.9348
+   1112.7700   1484.7500     34.9100      3.9337
+   1113.6600   1484.7700     34.9200      3.9327
+   1114.5500   1484.7800     34.9100      3.9327
+   1114.9900   1484.7900     34.9100      3.9327
+   1115.8800   1484.8000     34.9100      3.9316
+   1116.3200   1484.8000     34.9200      3.9295
+   1117.2100   1484.8100     34.9100      3.9296
+   1118.0900   1484.8200     34.9100      3.9285
+   1118.5400   1484.8300     34.9100      3.9275
+   1119.4300   1484.8400     34.9100      3.9275
+   1120.3100   1484.8500     34.9100      3.9264
+   1120.7600   1484.8600     34.9100      3.9254
+   1121.6400   1484.8700     34.9200      3.9243
+   1122.0900   1484.8800     34.9100      3.9254
+   1122.9700   1484.8900     34.9100      3.9254
+   1123.4200   1484.9000     34.9100      3.9264
+   1124.3000   1484.9200     34.9100      3.9264
+   1125.1900   1484.9300     34.9100      3.9264
+   1125.6300   1484.9400     34.9100      3.9254
+   1126.0800   1484.9400     34.9100      3.9254
+   1126.9600   1484.9600     34.9100      3.9254
+   1127.8500   1484.9600     34.9100      3.9233
+   1128.7400   1484.9700     34.9100      3.9201
+   1129.6300   1484.9700     34.9100      3.9191
+   1130.0700   1484.9800     34.9100      3.9191
+   1130.9600   1484.9900     34.9100      3.9191
+   1131.4000   1485.0000     34.9200      3.9159
+   1132.2900   1485.0100     34.9100      3.9159
+   1132.7300   1485.0200     34.9100      3.9159
+   1133.6200   1485.0300     34.9100      3.9159
+   1134.5100   1485.0500     34.9100      3.9170
+   1135.3900   1485.0600     34.9200      3.9159
+   1135.8400   1485.0800     34.9100      3.9181
+   1136.2800   1485.0900     34.9200      3.9191
+   1137.1700   1485.1000     34.9200      3.9181
+   1138.0500   1485.1200     34.9100      3.9202
+   1138.5000   1485.1200     34.9200      3.9181
+   1139.3800   1485.1400     34.9100      3.9181
+   1139.8300   1485.1400     34.9100      3.9170
+   1140.7100   1485.1500     34.9100      3.9160
+   1141.6000   1485.1700     34.9100      3.9160
+   1142.4900   1485.1800     34.9100      3.9160
+   1142.9300   1485.1800     34.9100      3.9149
+   1143.8200   1485.2000     34.9100      3.9170
+   1144.2600   1485.2100     34.9200      3.9149
+   1145.1500   1485.2200     34.9200      3.9149
+   1146.0400   1485.2400     34.9100      3.9160
+   1146.4800   1485.2500     34.9100      3.9170
+   1146.9200   1485.2600     34.9200      3.9149
+   1147.8100   1485.2700     34.9100      3.9160
+   1149.1400   1485.2900     34.9200      3.9149
+   1149.5800   1485.3000     34.9100      3.9160
+   1150.0300   1485.3000     34.9100      3.9160
+   1150.4700   1485.3100     34.9100      3.9139
+   1151.3600   1485.3200     34.9100      3.9139
+   1152.2400   1485.3200     34.9100      3.9107
+   1152.6900   1485.3300     34.9100      3.9097
+   1153.5800   1485.3400     34.9100      3.9086
+   1154.4600   1485.3400     34.9100      3.9065
+   1155.3500   1485.3600     34.9100      3.9066
+   1156.2400   1485.3700     34.9100      3.9076
+   1156.6800   1485.3800     34.9100      3.9055
+   1157.1200   1485.3800     34.9100      3.9055
+   1158.0100   1485.3900     34.9100      3.9055
+   1158.9000   1485.4000     34.9100      3.9034
+   1159.3400   1485.4100     34.9100      3.9034
+   1160.2300   1485.4200     34.9200      3.9024
+   1160.6700   1485.4300     34.9100      3.9024
+   1161.5600   1485.4500     34.9100      3.9024
+   1162.4400   1485.4600     34.9100      3.9024
+   1163.3300   1485.4700     34.9100      3.9024
+   1163.7800   1485.4800     34.9100      3.9024
+   1164.6600   1485.4900     34.9100      3.9003
+   1165.5500   1485.4900     34.9100      3.8982
+   1165.9900   1485.4900     34.9100      3.8961
+   1166.8800   1485.5000     34.9100      3.8940
+   1167.7700   1485.5100     34.9100      3.8940
+   1168.2100   1485.5200     34.9100      3.8929
+   1168.6500   1485.5200     34.9100      3.8929
+   1169.9800   1485.5500     34.9100      3.8940
+   1170.4300   1485.5500     34.9100      3.8929
+   1171.3100   1485.5700     34.9100      3.8940
+   1171.7600   1485.5700     34.9100      3.8919
+   1172.6400   1485.5900     34.9100      3.8919
+   1173.5300   1485.6000     34.9100      3.8919
+   1173.9700   1485.6100     34.9100      3.8919
+   1174.8600   1485.6200     34.9100      3.8908
+   1175.7500   1485.6300     34.9100      3.8898
+   1176.1900   1485.6300     34.9100      3.8887
+   1177.5200   1485.6500     34.9100      3.8877
+   1177.9600   1485.6500     34.9100      3.8866
+   1178.4100   1485.6600     34.9100      3.8866
+   1179.3000   1485.6700     34.9100      3.8856
+   1180.1800   1485.6900     34.9100      3.8856
+   1180.6300   1485.6900     34.9100      3.8856
+   1181.5100   1485.7100     34.9100      3.8845
+   1181.9500   1485.7100     34.9100      3.8845
+   1182.8400   1485.7300     34.9100      3.8846
+   1183.7300   1485.7400     34.9100      3.8846
+   1184.6200   1485.7500     34.9100      3.8825
+   1185.0600   1485.7600     34.9100      3.8835
+   1185.9500   1485.7700     34.9100      3.8835
+   1186.3900   1485.7700     34.9100      3.8804
+   1187.2800   1485.7900     34.9100      3.8814
+   1188.1600   1485.8000     34.9100      3.8804
+   1188.6100   1485.8000     34.9100      3.8793
+   1189.4900   1485.8200     34.9100      3.8793
+   1189.9400   1485.8300     34.9100      3.8804
+   1191.2700   1485.8500     34.9100      3.8793
+   1191.7100   1485.8500     34.9100      3.8783
+   1192.6000   1485.8600     34.9100      3.8772
+   1193.0400   1485.8700     34.9100      3.8783
+   1193.9300   1485.8800     34.9100      3.8762
+   1194.3700   1485.8900     34.9100      3.8772
+   1195.2600   1485.9000     34.9100      3.8762
+   1196.1400   1485.9100     34.9100      3.8751
+   1196.5900   1485.9100     34.9100      3.8741
+   1197.0300   1485.9100     34.9100      3.8720
+   1197.9200   1485.9200     34.9100      3.8709
+   1198.8000   1485.9300     34.9100      3.8688
+   1199.6900   1485.9300     34.9100      3.8667
+   1200.1300   1485.9400     34.9100      3.8667
+   1201.0200   1485.9400     34.9100      3.8625
+   1201.4600   1485.9500     34.9100      3.8614
+   1202.3500   1485.9600     34.9100      3.8635
+   1203.2400   1485.9700     34.9100      3.8625
+   1203.6800   1485.9700     34.9000      3.8604
+   1204.5700   1485.9600     34.9100      3.8551
+   1205.4500   1485.9800     34.9100      3.8541
+   1205.9000   1485.9700     34.9100      3.8520
+   1206.7800   1485.9900     34.9100      3.8509
+   1207.2300   1485.9900     34.9100      3.8499
+   1208.1100   1486.0100     34.9100      3.8499
+   1208.5600   1486.0300     34.9100      3.8530
+   1209.4400   1486.0400     34.9100      3.8520
+   1209.8900   1486.0500     34.9100      3.8530
+   1210.7700   1486.0600     34.9100      3.8520
+   1211.6600   1486.0800     34.9100      3.8530
+   1212.1000   1486.0900     34.9100      3.8541
+   1212.9900   1486.1000     34.9100      3.8541
+   1213.8800   1486.1100     34.9100      3.8530
+   1214.3200   1486.1100     34.9000      3.8520
+   1215.2100   1486.1100     34.9100      3.8477
+   1216.0900   1486.1200     34.9100      3.8456
+   1216.5400   1486.1200     34.9100      3.8435
+   1217.4200   1486.1300     34.9000      3.8435
+   1217.8700   1486.1100     34.9100      3.8362
+   1218.3100   1486.1100     34.9100      3.8341
+   1219.6400   1486.1200     34.9100      3.8309
+   1220.0800   1486.1200     34.9100      3.8319
+   1220.9700   1486.1300     34.9100      3.8298
+   1221.4100   1486.1400     34.9100      3.8298
+   1222.3000   1486.1500     34.9100      3.8288
+   1222.7400   1486.1600     34.9100      3.8277
+   1223.6300   1486.1700     34.9100      3.8277
+   1224.5200   1486.1800     34.9100      3.8267
+   1225.4000   1486.2000     34.9100      3.8277
+   1225.8500   1486.2000     34.9100      3.8256
+   1226.7300   1486.2100     34.9100      3.8246
+   1227.6200   1486.2200     34.9100      3.8246
+   1228.0600   1486.2300     34.9100      3.8225
+   1228.5100   1486.2300     34.9100      3.8214
+   1229.3900   1486.2400     34.9100      3.8214
+   1230.2800   1486.2500     34.9100      3.8204
+   1230.7200   1486.2600     34.9100      3.8204
+   1231.6100   1486.2700     34.9100      3.8193
+   1232.0500   1486.2800     34.9100      3.8193
+   1232.9400   1486.2900     34.9100      3.8193
+   1233.8300   1486.3000     34.9100      3.8172
+   1234.7100   1486.3200     34.9100      3.8193
+   1235.1600   1486.3300     34.9100      3.8193
+   1236.0400   1486.3400     34.9100      3.8193
+   1236.4900   1486.3500     34.9100      3.8204
+   1237.3700   1486.3600     34.9000      3.8193
+   1237.8200   1486.3700     34.9100      3.8193
+   1238.7000   1486.3900     34.9100      3.8193
+   1239.5900   1486.4000     34.9100      3.8182
+   1240.0300   1486.4000     34.9100      3.8172
+   1240.9200   1486.4200     34.9100      3.8193
+   1241.8100   1486.4400     34.9100      3.8182
+   1242.2500   1486.4400     34.9100      3.8172
+   1243.1300   1486.4500     34.9100      3.8172
+   1244.0200   1486.4700     34.9100      3.8172
+   1244.4600   1486.4800     34.9100      3.8172
+   1245.3500   1486.4900     34.9100      3.8161
+   1246.2400   1486.5000     34.9100      3.8172
+   1246.6800   1486.5100     34.9100      3.8172
+   1247.5700   1486.5200     34.9100      3.8151
+   1248.4500   1486.5400     34.9100      3.8161
+   1248.9000   1486.5400     34.9100      3.8140
+   1249.7800   1486.5500     34.9000      3.8151
+   1250.2300   1486.5600     34.9100      3.8130
+   1251.1100   1486.5600     34.9000      3.8119
+   1251.5600   1486.5500     34.9000      3.8088
+   1252.4400   1486.5700     34.9100      3.8077
+   1253.3300   1486.5800     34.9000      3.8067
+   1253.7700   1486.5900     34.9000      3.8077
+   1254.6600   1486.6000     34.9000      3.8056
+   1255.1000   1486.6100     34.9100      3.8056
+   1255.9900   1486.6200     34.9000      3.8056
+   1256.8800   1486.6300     34.9100      3.8045
+   1257.3200   1486.6400     34.9000      3.8045
+   1258.2000   1486.6500     34.9000      3.8035
+   1259.0900   1486.6600     34.9000      3.8035
+   1259.5300   1486.6700     34.9100      3.8024
+   1260.4200   1486.6800     34.9000      3.8024
+   1260.8600   1486.6900     34.9000      3.8035
+   1261.7500   1486.7000     34.9000      3.8024
+   1263.0800   1486.7300     34.9100      3.8024
+   1263.5200   1486.7400     34.9000      3.8035
+   1263.9700   1486.7400     34.9100      3.8024
+   1264.8500   1486.7600     34.9000      3.8035
+   1265.3000   1486.7600     34.9000      3.8014
+   1266.1800   1486.7700     34.9100      3.8014
+   1266.6300   1486.7800     34.9000      3.8014
+   1267.5100   1486.7900     34.9100      3.8003
+   1268.4000   1486.8100     34.9000      3.8014
+   1268.8400   1486.8200     34.9000      3.8014
+   1269.7300   1486.8300     34.9100      3.8014
+   1270.6100   1486.8500     34.9000      3.8014
+   1271.5000   1486.8600     34.9000      3.8014
+   1271.9400   1486.8700     34.9000      3.8014
+   1272.3900   1486.8800     34.9000      3.8014
+   1273.2700   1486.8900     34.9100      3.8014
+   1273.7200   1486.9000     34.9100      3.8014
+   1274.6000   1486.9200     34.9000      3.8024
+   1275.4900   1486.9300     34.9000      3.8014
+   1275.9300   1486.9300     34.9100      3.8003
+   1276.8200   1486.9500     34.9000      3.8014
+   1277.7000   1486.9600     34.9000      3.8003
+   1278.1500   1486.9700     34.9000      3.8003
+   1279.0300   1486.9800     34.9000      3.8003
+   1279.9200   1487.0000     34.9000      3.8003
+   1280.3600   1487.0100     34.9100      3.7993
+   1281.2500   1487.0200     34.9000      3.7993
+   1282.1400   1487.0300     34.9000      3.7993
+   1282.5800   1487.0400     34.9000      3.7993
+   1283.4700   1487.0500     34.9000      3.7982
+   1284.3500   1487.0700     34.9100      3.7982
+   1284.8000   1487.0700     34.9000      3.7982
+   1285.2400   1487.0700     34.9100      3.7961
+   1286.1300   1487.0800     34.9000      3.7951
+   1287.0100   1487.1000     34.9000      3.7961
+   1287.9000   1487.1000     34.9000      3.7930
+   1288.3400   1487.1000     34.9000      3.7919
+   1288.7800   1487.1100     34.9000      3.7909
+   1289.6700   1487.1200     34.9100      3.7877
+   1290.5600   1487.1300     34.9000      3.7888
+   1291.4400   1487.1400     34.9000      3.7866
+   1291.8900   1487.1300     34.9000      3.7845
+   1292.7700   1487.1400     34.9000      3.7824
+   1293.6600   1487.1500     34.9000      3.7814
+   1294.1000   1487.1600     34.9100      3.7814
+   1294.9900   1487.1800     34.9100      3.7814
+   1295.4300   1487.1800     34.9100      3.7803
+   1296.3200   1487.2000     34.9000      3.7824
+   1297.2000   1487.2100     34.9100      3.7814
+   1297.6500   1487.2200     34.9000      3.7814
+   1298.5300   1487.2400     34.9000      3.7814
+   1298.9800   1487.2400     34.9100      3.7814
+   1299.8600   1487.2600     34.9000      3.7814
+   1300.7500   1487.2800     34.9000      3.7824
+   1301.1900   1487.2800     34.9100      3.7814
+   1302.0800   1487.3000     34.9000      3.7814
+   1302.9600   1487.3100     34.9100      3.7803
+   1303.4100   1487.3100     34.9100      3.7803
+   1304.2900   1487.3300     34.9100      3.7814
+   1305.1800   1487.3400     34.9000      3.7803
+   1305.6200   1487.3400     34.9000      3.7782
+   1306.5100   1487.3500     34.9000      3.7761
+   1306.9500   1487.3400     34.9000      3.7740
+   1307.8400   1487.3500     34.9000      3.7708
+   1308.7200   1487.3500     34.9000      3.7677
+   1309.6100   1487.3500     34.9000      3.7656
+   1310.0500   1487.3500     34.9000      3.7624
+   1310.9400   1487.3500     34.9000      3.7582
+   1311.3800   1487.3500     34.9000      3.7571
+   1312.2700   1487.3600     34.9100      3.7540
+   1313.1600   1487.3700     34.9100      3.7540
+   1314.0400   1487.3900     34.9000      3.7561
+   1314.4800   1487.3900     34.9100      3.7550
+   1314.9300   1487.4100     34.9100      3.7561
+   1315.8100   1487.4200     34.9000      3.7561
+   1316.7000   1487.4300     34.9000      3.7561
+   1317.5900   1487.4500     34.9100      3.7550
+   1318.0300   1487.4600     34.9100      3.7561
+   1318.9200   1487.4700     34.9000      3.7561
+   1319.8000   1487.4900     34.9100      3.7550
+   1320.2400   1487.5000     34.9100      3.7561
+   1321.1300   1487.5100     34.9000      3.7550
+   1322.0200   1487.5200     34.9100      3.7540
+   1322.9000   1487.5400     34.9000      3.7561
+   1323.3500   1487.5400     34.9000      3.7550
+   1323.7900   1487.5500     34.9000      3.7561
+   1324.6800   1487.5700     34.9000      3.7551
+   1325.5600   1487.5800     34.9100      3.7551
+   1326.4500   1487.6000     34.9100      3.7551
+   1327.3300   1487.6100     34.9000      3.7551
+   1327.7800   1487.6200     34.9000      3.7572
+   1328.6600   1487.6400     34.9000      3.7561
+   1329.1100   1487.6400     34.9000      3.7561
+   1329.9900   1487.6600     34.9100      3.7551
+   1330.4300   1487.6600     34.9100      3.7551
+   1331.3200   1487.6800     34.9000      3.7551
+   1331.7600   1487.6800     34.9000      3.7540
+   1332.6500   1487.6900     34.9000      3.7530
+   1333.5400   1487.7100     34.9000      3.7540
+   1334.4200   1487.7200     34.9000      3.7519
+   1334.8700   1487.7200     34.9000      3.7508
+   1335.7500   1487.7300     34.9000      3.7508
+   1336.1900   1487.7300     34.9000      3.7487
+   1337.0800   1487.7400     34.9000      3.7477
+   1337.9700   1487.7500     34.9000      3.7456
+   1338.4100   1487.7600     34.9100      3.7445
+   1339.3000   1487.7700     34.9000      3.7445
+   1340.1800   1487.7800     34.9000      3.7445
+   1341.0700   1487.8000     34.9000      3.7456
+   1341.5100   1487.8000     34.9000      3.7445
+   1342.4000   1487.8200     34.9000      3.7445
+   1342.8400   1487.8300     34.9000      3.7445
+   1343.7200   1487.8400     34.9000      3.7445
+   1344.6100   1487.8600     34.9100      3.7435
+   1345.0500   1487.8600     34.9000      3.7445
+   1345.9400   1487.8800     34.9100      3.7435
+   1346.8300   1487.8900     34.9000      3.7435
+   1347.7100   1487.9000     34.9000      3.7435
+   1348.1600   1487.9100     34.9000      3.7424
+   1349.0400   1487.9100     34.9000      3.7403
+   1349.9300   1487.9300     34.9000      3.7403
+   1350.3700   1487.9300     34.9000      3.7393
+   1351.2600   1487.9300     34.9000      3.7361
+   1352.1400   1487.9500     34.9000      3.7350
+   1352.5900   1487.9500     34.9100      3.7340
+   1353.4700   1487.9600     34.9000      3.7340
+   1354.3600   1487.9700     34.9000      3.7319
+   1354.8000   1487.9800     34.9000      3.7329
+   1355.6900   1487.9900     34.9100      3.7298
+   1356.1300   1488.0000     34.9000      3.7308
+   1357.0200   1488.0100     34.9000      3.7308
+   1357.9000   1488.0200     34.9000      3.7308
+   1358.3400   1488.0300     34.9000      3.7308
+   1359.2300   1488.0500     34.9000      3.7308
+   1359.6700   1488.0500     34.9000      3.7308
+   1360.5600   1488.0700     34.9000      3.7298
+   1361.4400   1488.0700     34.9000      3.7287
+   1362.3300   1488.0900     34.9000      3.7287
+   1362.7700   1488.0900     34.9000      3.7266
+   1363.6600   1488.1000     34.9000      3.7266
+   1364.1000   1488.1100     34.9100      3.7245
+   1364.9900   1488.1300     34.9000      3.7266
+   1365.8700   1488.1400     34.9000      3.7256
+   1366.3200   1488.1400     34.9000      3.7256
+   1367.2000   1488.1600     34.9000      3.7245
+   1367.6500   1488.1500     34.9000      3.7224
+   1368.5300   1488.1700     34.9000      3.7220
+   1369.4200   1488.1800     34.9000      3.7217
+   1370.3000   1488.1900     34.9000      3.7214
+   1370.7500   1488.1900     34.9000      3.7203
+   1371.6300   1488.2000     34.9000      3.7171
+   1372.5200   1488.2100     34.9000      3.7161
+   1372.9600   1488.2100     34.9000      3.7150
+   1373.8500   1488.2200     34.9100      3.7129
+   1374.2900   1488.2200     34.9000      3.7119
+   1375.1800   1488.2300     34.9000      3.7108
+   1376.0600   1488.2500     34.9000      3.7108
+   1376.9500   1488.2600     34.9000      3.7108
+   1377.8300   1488.2800     34.9000      3.7119
+   1378.2800   1488.2800     34.9000      3.7108
+   1378.7200   1488.2900     34.9000      3.7108
+   1379.6100   1488.3000     34.9000      3.7098
+   1380.4900   1488.3100     34.9000      3.7087
+   1381.3800   1488.3200     34.9000      3.7066
+   1381.8200   1488.3200     34.9100      3.7056
+   1382.7000   1488.3400     34.9000      3.7056
+   1383.5900   1488.3500     34.9000      3.7045
+   1384.4800   1488.3600     34.9000      3.7045
+   1384.9200   1488.3600     34.9000      3.7035
+   1385.8100   1488.3700     34.9000      3.7013
+   1386.2500   1488.3800     34.9000      3.7024
+   1387.1300   1488.4000     34.9000      3.7024
+   1387.5800   1488.4000     34.9000      3.7014
+   1388.4600   1488.4100     34.9000      3.6992
+   1389.3500   1488.4200     34.9000      3.6992
+   1390.2300   1488.4300     34.9000      3.6971
+   1390.6800   1488.4300     34.9000      3.6971
+   1391.5600   1488.4500     34.9000      3.6961
+   1392.4500   1488.4600     34.9000      3.6950
+   1392.8900   1488.4600     34.9000      3.6950
+   1393.7800   1488.4800     34.9000      3.6950
+   1394.6600   1488.4900     34.9000      3.6940
+   1395.1100   1488.5000     34.9000      3.6940
+   1395.9900   1488.5100     34.9000      3.6940
+   1396.8800   1488.5200     34.9000      3.6929
+   1397.7600   1488.5400     34.9000      3.6940
+   1398.2100   1488.5500     34.9000      3.6940
+   1398.6500   1488.5600     34.9000      3.6929
+   1399.5400   1488.5700     34.9000      3.6919
+   1400.4200   1488.5800     34.9000      3.6929
+   1400.8600   1488.5900     34.9000      3.6919
+   1401.7500   1488.6000     34.9000      3.6930
+   1402.6400   1488.6100     34.9000      3.6898
+   1403.0800   1488.6100     34.9000      3.6898
+   1403.9600   1488.6300     34.9000      3.6898
+   1404.8500   1488.6400     34.9000      3.6877
+   1405.7300   1488.6600     34.9000      3.6887
+   1406.1800   1488.6600     34.9000      3.6877
+   1407.0600   1488.6700     34.9000      3.6877
+   1407.5100   1488.6700     34.9000      3.6856
+   1408.3900   1488.6900     34.9000      3.6856
+   1408.8400   1488.6900     34.9000      3.6835
+   1410.1600   1488.7100     34.9000      3.6835
+   1410.6100   1488.7100     34.9000      3.6824
+   1411.4900   1488.7200     34.9000      3.6814
+   1412.3800   1488.7300     34.9000      3.6803
+   1412.8200   1488.7400     34.9100      3.6793
+   1413.7100   1488.7600     34.9000      3.6814
+   1414.1500   1488.7700     34.9000      3.6814
+   1415.0400   1488.7800     34.9100      3.6803
+   1415.9200   1488.8000     34.9000      3.6814
+   1416.3600   1488.8100     34.9000      3.6814
+   1417.2500   1488.8200     34.9000      3.6814
+   1418.5800   1488.8400     34.9000      3.6814
+   1419.0200   1488.8500     34.9000      3.6825
+   1419.4600   1488.8500     34.9000      3.6803
+   1420.3500   1488.8600     34.9000      3.6793
+   1421.2300   1488.8800     34.9000      3.6803
+   1421.6800   1488.8900     34.9000      3.6814
+   1422.5600   1488.9100     34.9000      3.6804
+   1423.4500   1488.9200     34.9000      3.6804
+   1423.8900   1488.9200     34.9000      3.6793
+   1424.7800   1488.9400     34.9000      3.6793
+   1425.6600   1488.9500     34.9000      3.6793
+   1426.1100   1488.9600     34.9000      3.6783
+   1426.9900   1488.9800     34.9000      3.6793
+   1427.8800   1488.9900     34.9000      3.6793
+   1428.3200   1488.9900     34.9000      3.6783
+   1429.2000   1489.0000     34.9000      3.6772
+   1430.0900   1489.0000     34.9000      3.6730
+   1430.9800   1489.0000     34.9000      3.6698
+   1431.4200   1489.0000     34.9000      3.6667
+   1432.3100   1489.0000     34.9000      3.6645
+   1433.1900   1489.0100     34.9000      3.6635
+   1434.0800   1489.0200     34.9000      3.6624
+   1434.5200   1489.0300     34.9000      3.6624
+   1435.4000   1489.0500     34.9000      3.6624
+   1436.2900   1489.0600     34.9000      3.6624
+   1436.7300   1489.0700     34.9000      3.6614
+   1437.1800   1489.0700     34.9000      3.6603
+   1438.0600   1489.0800     34.9000      3.6593
+   1438.9500   1489.0800     34.9000      3.6572
+   1439.8300   1489.0900     34.9000      3.6561
+   1440.7200   1489.1000     34.9000      3.6551
+   1441.1600   1489.1100     34.9000      3.6551
+   1442.0500   1489.1300     34.9000      3.6561
+   1442.9300   1489.1400     34.9000      3.6551
+   1443.3700   1489.1400     34.9000      3.6530
+   1444.2600   1489.1400     34.9000      3.6508
+   1444.7000   1489.1400     34.9000      3.6477
+   1445.5900   1489.1300     34.9000      3.6435
+   1446.4700   1489.1400     34.9000      3.6403
+   1447.3600   1489.1500     34.9000      3.6392
+   1448.2400   1489.1600     34.9000      3.6392
+   1448.6900   1489.1700     34.9000      3.6371
+   1449.5700   1489.1700     34.9000      3.6361
+   1450.0200   1489.1800     34.9000      3.6361
+   1450.9000   1489.1900     34.9000      3.6361
+   1451.7900   1489.2100     34.9000      3.6350
+   1452.2300   1489.2100     34.9000      3.6340
+   1453.1200   1489.2100     34.9000      3.6308
+   1454.0000   1489.2300     34.9000      3.6308
+   1454.4400   1489.2400     34.9000      3.6319
+   1455.3300   1489.2500     34.9000      3.6319
+   1456.2100   1489.2700     34.9000      3.6308
+   1456.6600   1489.2700     34.9000      3.6308
+   1457.5400   1489.2900     34.9000      3.6315
+   1457.9800   1489.3000     34.9000      3.6322
+   1458.8700   1489.3200     34.9000      3.6329
+   1459.3100   1489.3200     34.9000      3.6319
+   1460.6400   1489.3400     34.9000      3.6308
+   1461.0800   1489.3500     34.9000      3.6319
+   1461.9700   1489.3700     34.9000      3.6319
+   1462.4100   1489.3700     34.9000      3.6319
+   1463.3000   1489.3900     34.9000      3.6308
+   1463.7400   1489.3900     34.9000      3.6308
+   1464.6300   1489.4100     34.9000      3.6319
+   1465.5100   1489.4200     34.9000      3.6308
+   1465.9500   1489.4300     34.9000      3.6308
+   1466.8400   1489.4400     34.9000      3.6308
+   1467.7200   1489.4600     34.9000      3.6298
+   1468.6100   1489.4600     34.9000      3.6287
+   1469.0500   1489.4600     34.9000      3.6266
+   1469.9400   1489.4700     34.9000      3.6245
+   1470.8200   1489.4800     34.9000      3.6224
+   1471.2700   1489.4800     34.9000      3.6224
+   1472.1500   1489.4900     34.9000      3.6202
+   1472.5900   1489.4900     34.9000      3.6192
+   1473.4800   1489.5000     34.9000      3.6181
+   1474.3700   1489.5000     34.9000      3.6150
+   1475.2500   1489.5100     34.9000      3.6139
+   1475.6900   1489.5100     34.9000      3.6118
+   1476.5800   1489.5200     34.9000      3.6097
+   1477.0200   1489.5100     34.9000      3.6065
+   1477.9100   1489.5200     34.9000      3.6054
+   1478.7900   1489.5400     34.9000      3.6054
+   1479.2300   1489.5500     34.9000      3.6054
+   1480.1200   1489.5600     34.9000      3.6054
+   1480.5600   1489.5700     34.9000      3.6054
+   1481.4500   1489.5800     34.9000      3.6054
+   1482.3300   1489.6000     34.9000      3.6054
+   1483.2200   1489.6100     34.9000      3.6044
+   1483.6600   1489.6100     34.9000      3.6044
+   1484.5500   1489.6300     34.9000      3.6054
+   1484.9900   1489.6400     34.9000      3.6044
+   1485.8800   1489.6500     34.9000      3.6044
+   1486.7600   1489.6700     34.9000      3.6054
+   1487.2000   1489.6800     34.9000      3.6044
+   1488.0900   1489.6900     34.9000      3.6044
+   1488.9700   1489.7100     34.9000      3.6044
+   1489.4200   1489.7200     34.9000      3.6044
+   1490.3000   1489.7300     34.9000      3.6044
+   1491.1900   1489.7500     34.9000      3.6054
+   1491.6300   1489.7500     34.9000      3.6044
+   1492.5100   1489.7700     34.9000      3.6054
+   1492.9600   1489.7800     34.9000      3.6054
+   1493.8400   1489.7900     34.9000      3.6044
+   1494.7300   1489.8100     34.9000      3.6044
+   1495.6100   1489.8200     34.9000      3.6044
+   1496.0600   1489.8200     34.9000      3.6033
+   1496.9400   1489.8400     34.9000      3.6033
+   1497.8300   1489.8400     34.9000      3.6012
+   1498.2700   1489.8500     34.9000      3.6002
+   1499.1500   1489.8600     34.9000      3.5991
+   1499.6000   1489.8600     34.9000      3.5991
+   1500.4800   1489.8700     34.9000      3.5980
+   1500.9300   1489.8800     34.9000      3.5980
+   1501.8100   1489.8900     34.9000      3.5970
+   1502.6900   1489.9000     34.9000      3.5970
+   1503.5800   1489.9100     34.9000      3.5949
+   1504.0200   1489.9300     34.9000      3.5959
+   1504.9100   1489.9300     34.9000      3.5949
+   1505.7900   1489.9400     34.9000      3.5938
+   1506.2400   1489.9500     34.9000      3.5928
+   1507.1200   1489.9700     34.9000      3.5938
+   1508.0100   1489.9800     34.9000      3.5928
+   1508.4500   1489.9900     34.9000      3.5928
+   1509.3300   1490.0000     34.9000      3.5928
+   1509.7800   1490.0100     34.9000      3.5938
+   1510.2200   1490.0200     34.9000      3.5928
+   1511.1100   1490.0300     34.9000      3.5928
+   1511.9900   1490.0400     34.9000      3.5917
+   1512.4300   1490.0500     34.9000      3.5917
+   1513.3200   1490.0600     34.9000      3.5917
+   1514.2000   1490.0700     34.9000      3.5917
+   1514.6500   1490.0800     34.9000      3.5896
+   1515.0900   1490.0700     34.9000      3.5864
+   1515.9700   1490.0900     34.9000      3.5864
+   1516.8600   1490.1000     34.9000      3.5864
+   1517.7400   1490.1100     34.9000      3.5854
+   1518.1900   1490.1200     34.9000      3.5854
+   1519.0700   1490.1200     34.9000      3.5822
+   1519.9600   1490.1300     34.9000      3.5801
+   1520.4000   1490.1400     34.9000      3.5811
+   1521.2800   1490.1500     34.9000      3.5811
+   1522.1700   1490.1600     34.9000      3.5790
+   1522.6100   1490.1700     34.9000      3.5790
+   1523.5000   1490.1900     34.9000      3.5801
+   1523.9400   1490.1900     34.9000      3.5780
+   1524.8300   1490.2000     34.9000      3.5780
+   1525.7100   1490.2100     34.9000      3.5769
+   1526.1500   1490.2200     34.9000      3.5758
+   1527.0400   1490.2300     34.9000      3.5758
+   1527.4800   1490.2400     34.9000      3.5758
+   1528.3700   1490.2500     34.9000      3.5758
+   1529.2500   1490.2700     34.9000      3.5758
+   1529.6900   1490.2700     34.9000      3.5758
+   1530.5800   1490.2900     34.9000      3.5758
+   1531.4600   1490.3000     34.9000      3.5758
+   1532.3500   1490.3200     34.9000      3.5758
+   1532.7900   1490.3200     34.9000      3.5748
+   1533.6800   1490.3400     34.9000      3.5758
+   1534.5600   1490.3500     34.9000      3.5737
+   1535.0000   1490.3600     34.9000      3.5737
+   1535.8900   1490.3700     34.9000      3.5737
+   1536.3300   1490.3800     34.9000      3.5737
+   1537.2200   1490.3900     34.9000      3.5737
+   1538.1000   1490.4100     34.9000      3.5737
+   1538.9900   1490.4200     34.9000      3.5716
+   1539.8700   1490.4300     34.9000      3.5737
+   1540.3100   1490.4400     34.9000      3.5716
+   1540.7600   1490.4400     34.9000      3.5695
+   1541.6400   1490.4500     34.9000      3.5695
+   1542.5300   1490.4500     34.9000      3.5674
+   1542.9700   1490.4500     34.9000      3.5642
+   1543.8500   1490.4600     34.9000      3.5621
+   1544.3000   1490.4600     34.9000      3.5610
+   1545.1800   1490.4700     34.9000      3.5600
+   1546.0700   1490.4800     34.9000      3.5589
+   1546.9500   1490.4900     34.9000      3.5579
+   1547.8400   1490.5100     34.9000      3.5589
+   1548.2800   1490.5200     34.9000      3.5589
+   1549.1600   1490.5300     34.9000      3.5579
+   1550.0500   1490.5400     34.9000      3.5579
+   1550.4900   1490.5500     34.9000      3.5568
+   1551.3800   1490.5700     34.9000      3.5579
+   1552.2600   1490.5800     34.9000      3.5568
+   1552.7000   1490.5900     34.9000      3.5568
+   1553.5900   1490.6000     34.9000      3.5558
+   1554.0300   1490.6000     34.9000      3.5547
+   1554.9200   1490.5900     34.9000      3.5494
+   1555.8000   1490.5900     34.9000      3.5452
+   1556.2400   1490.5800     34.9000      3.5420
+   1557.1300   1490.5900     34.9000      3.5410
+   1557.5700   1490.5900     34.9000      3.5389
+   1558.4600   1490.6100     34.9000      3.5399
+   1559.3400   1490.6200     34.9000      3.5389
+   1560.2300   1490.6300     34.9000      3.5378
+   1561.1100   1490.6400     34.9000      3.5357
+   1561.5500   1490.6400     34.9000      3.5357
+   1562.4400   1490.6600     34.9000      3.5346
+   1562.8800   1490.6600     34.9000      3.5336
+   1563.7700   1490.6700     34.9000      3.5336
+   1564.6500   1490.6900     34.9000      3.5336
+   1565.0900   1490.6900     34.9000      3.5325
+   1565.9800   1490.7100     34.9000      3.5336
+   1566.8600   1490.7200     34.9000      3.5315
+   1567.7500   1490.7300     34.9000      3.5325
+   1568.1900   1490.7400     34.9000      3.5325
+   1568.6300   1490.7400     34.9000      3.5294
+   1569.9600   1490.7600     34.9000      3.5304
+   1570.4000   1490.7700     34.9000      3.5294
+   1570.8500   1490.7800     34.9000      3.5304
+   1571.7300   1490.7900     34.9000      3.5283
+   1572.1700   1490.8000     34.9000      3.5304
+   1573.0600   1490.8100     34.9000      3.5294
+   1574.3900   1490.8400     34.9000      3.5294
+   1574.8300   1490.8500     34.9000      3.5304
+   1575.2700   1490.8500     34.9000      3.5294
+   1576.1600   1490.8700     34.9000      3.5294
+   1576.6000   1490.8700     34.9000      3.5283
+   1577.4800   1490.8700     34.8900      3.5273
+   1577.9300   1490.8700     34.9000      3.5241
+   1578.8100   1490.8800     34.9000      3.5220
+   1579.6900   1490.8900     34.9000      3.5209
+   1580.5800   1490.9000     34.9000      3.5188
+   1581.4600   1490.9100     34.9000      3.5178
+   1581.9100   1490.9100     34.9000      3.5167
+   1582.3500   1490.9100     34.9000      3.5157
+   1583.2300   1490.9300     34.9000      3.5157
+   1584.1200   1490.9400     34.9000      3.5157
+   1584.5600   1490.9400     34.9000      3.5135
+   1585.4500   1490.9500     34.9000      3.5114
+   1586.3300   1490.9700     34.9000      3.5125
+   1586.7700   1490.9600     34.9000      3.5104
+   1587.6600   1490.9600     34.8900      3.5072
+   1588.5400   1490.9700     34.9000      3.5040
+   1588.9900   1490.9700     34.9000      3.5030
+   1589.8700   1490.9900     34.9000      3.5030
+   1590.7600   1491.0000     34.9000      3.5030
+   1591.2000   1491.0100     34.9000      3.5030
+   1592.0800   1491.0300     34.9000      3.5030
+   1592.9700   1491.0400     34.9000      3.5030
+   1593.4100   1491.0500     34.9000      3.5030
+   1594.2900   1491.0600     34.9000      3.5019
+   1595.1800   1491.0800     34.9000      3.5030
+   1596.0600   1491.0900     34.9000      3.5030
+   1596.5100   1491.1000     34.9000      3.5030
+   1597.3900   1491.1100     34.9000      3.5009
+   1598.2800   1491.1300     34.9000      3.5019
+   1598.7200   1491.1300     34.9000      3.5019
+   1599.6000   1491.1500     34.9000      3.5019
+   1600.0500   1491.1600     34.9000      3.5019
+   1600.9300   1491.1700     34.9000      3.5019
+   1601.8200   1491.1800     34.9000      3.5009
+   1602.7000   1491.2000     34.9000      3.5020
+   1603.5900   1491.2200     34.9000      3.5020
+   1604.0300   1491.2200     34.9000      3.5020
+   1604.9100   1491.2300     34.9000      3.4998
+   1605.8000   1491.2500     34.9000      3.4998
+   1606.2400   1491.2500     34.9000      3.5009
+   1607.1200   1491.2600     34.9000      3.4988
+   1608.0100   1491.2800     34.9000      3.4988
+   1608.4500   1491.2800     34.9000      3.4988
+   1609.3400   1491.2900     34.9000      3.4967
+   1610.2200   1491.3000     34.9000      3.4946
+   1610.6600   1491.3000     34.9000      3.4925
+   1611.5500   1491.3100     34.9000      3.4914
+   1612.4300   1491.3100     34.9000      3.4893
+   1612.8700   1491.3200     34.9000      3.4882
+   1613.7600   1491.3300     34.9000      3.4872
+   1614.2000   1491.3300     34.9000      3.4861
+   1615.0900   1491.3400     34.9000      3.4861
+   1615.9700   1491.3400     34.9000      3.4829
+   1616.8600   1491.3500     34.9000      3.4798
+   1617.7400   1491.3600     34.9000      3.4798
+   1618.1800   1491.3700     34.9000      3.4798
+   1618.6300   1491.3700     34.9000      3.4787
+   1619.5100   1491.3800     34.9000      3.4766
+   1620.3900   1491.3800     34.8900      3.4734
+   1621.2800   1491.3800     34.9000      3.4702
+   1621.7200   1491.3800     34.9000      3.4692
+   1622.6100   1491.3900     34.9000      3.4681
+   1623.4900   1491.4100     34.9000      3.4671
+   1624.3800   1491.4300     34.9000      3.4681
+   1624.8200   1491.4300     34.9000      3.4671
+   1625.7000   1491.4400     34.9000      3.4671
+   1626.1400   1491.4500     34.9000      3.4671
+   1627.0300   1491.4700     34.9000      3.4671
+   1627.9100   1491.4800     34.9000      3.4671
+   1628.3600   1491.4900     34.9000      3.4671
+   1629.2400   1491.5000     34.9000      3.4660
+   1629.6800   1491.5100     34.9000      3.4671
+   1630.5700   1491.5200     34.9000      3.4671
+   1631.4500   1491.5400     34.9000      3.4671
+   1632.3400   1491.5500     34.9000      3.4660
+   1632.7800   1491.5600     34.9000      3.4671
+   1633.6600   1491.5800     34.9000      3.4682
+   1634.5500   1491.6000     34.9000      3.4692
+   1635.4300   1491.6100     34.9000      3.4671
+   1635.8800   1491.6100     34.9000      3.4660
+   1636.3200   1491.6200     34.9000      3.4671
+   1637.2000   1491.6400     34.9000      3.4671
+   1638.0900   1491.6500     34.9000      3.4671
+   1638.9700   1491.6700     34.9000      3.4671
+   1639.4100   1491.6700     34.9000      3.4671
+   1640.3000   1491.6900     34.9000      3.4671
+   1641.1800   1491.7000     34.9000      3.4650
+   1641.6300   1491.7100     34.9000      3.4660
+   1642.5100   1491.7200     34.9000      3.4650
+   1642.9500   1491.7200     34.9000      3.4639
+   1643.8400   1491.7400     34.9000      3.4639
+   1644.7200   1491.7500     34.9000      3.4628
+   1645.6100   1491.7700     34.9000      3.4639
+   1646.0500   1491.7700     34.9000      3.4628
+   1646.4900   1491.7800     34.9000      3.4628
+   1647.3700   1491.7900     34.9000      3.4628
+   1648.2600   1491.8100     34.9000      3.4639
+   1649.1400   1491.8200     34.9000      3.4628
+   1649.5900   1491.8300     34.9000      3.4628
+   1650.4700   1491.8400     34.9000      3.4618
+   1651.3600   1491.8600     34.9000      3.4618
+   1651.8000   1491.8700     34.9000      3.4639
+   1652.6800   1491.8900     34.9000      3.4639
+   1653.1200   1491.8900     34.9000      3.4639
+   1654.0100   1491.9100     34.9000      3.4639
+   1654.8900   1491.9300     34.8900      3.4649
+   1655.3400   1491.9300     34.9000      3.4628
+   1656.2200   1491.9300     34.8900      3.4607
+   1657.1000   1491.9400     34.9000      3.4586
+   1657.5500   1491.9400     34.9000      3.4575
+   1658.4300   1491.9500     34.9000      3.4565
+   1659.3200   1491.9700     34.9000      3.4554
+   1660.2000   1491.9800     34.9000      3.4554
+   1660.6400   1491.9800     34.9000      3.4543
+   1661.5300   1492.0000     34.9000      3.4543
+   1661.9700   1492.0000     34.9000      3.4533
+   1662.8500   1492.0200     34.9000      3.4543
+   1663.7400   1492.0300     34.9000      3.4533
+   1664.1800   1492.0400     34.9000      3.4533
+   1665.0600   1492.0500     34.9000      3.4533
+   1665.5100   1492.0600     34.9000      3.4533
+   1666.3900   1492.0700     34.9000      3.4522
+   1667.2800   1492.0900     34.9000      3.4522
+   1667.7200   1492.0900     34.9000      3.4522
+   1668.6000   1492.1100     34.9000      3.4533
+   1669.0400   1492.1100     34.9000      3.4511
+   1669.9300   1492.1300     34.9000      3.4522
+   1670.8100   1492.1500     34.9000      3.4522
+   1671.2600   1492.1600     34.9000      3.4532
+   1672.1400   1492.1600     34.8900      3.4522
+   1673.0200   1492.1700     34.8900      3.4501
+   1673.9100   1492.1800     34.8900      3.4479
+   1674.3500   1492.1700     34.8900      3.4448
+   1675.2300   1492.1800     34.9000      3.4426
+   1675.6800   1492.1800     34.9000      3.4416
+   1676.5600   1492.2000     34.9000      3.4426
+   1677.0000   1492.2000     34.9000      3.4405
+   1677.8900   1492.2200     34.9000      3.4405
+   1678.7700   1492.2300     34.9000      3.4405
+   1679.2100   1492.2400     34.9000      3.4405
+   1680.1000   1492.2500     34.9000      3.4405
+   1680.9800   1492.2700     34.9000      3.4405
+   1681.4300   1492.2800     34.9000      3.4405
+   1682.3100   1492.2900     34.9000      3.4405
+   1683.1900   1492.3100     34.9000      3.4405
+   1683.6400   1492.3200     34.9000      3.4416
+   1684.5200   1492.3300     34.9000      3.4405
+   1685.4100   1492.3500     34.8900      3.4416
+   1685.8500   1492.3500     34.9000      3.4405
+   1686.7300   1492.3700     34.9000      3.4405
+   1687.6200   1492.3800     34.9000      3.4405
+   1688.5000   1492.4000     34.9000      3.4405
+   1688.9400   1492.4100     34.9000      3.4405
+   1689.8300   1492.4200     34.9000      3.4405
+   1690.2700   1492.4300     34.9000      3.4416
+   1691.1500   1492.4500     34.9000      3.4415
+   1692.0400   1492.4600     34.9000      3.4405
+   1692.4800   1492.4700     34.9000      3.4415
+   1693.3700   1492.4900     34.9000      3.4426
+   1693.8100   1492.4900     34.9000      3.4415
+   1695.1300   1492.5100     34.9000      3.4415
+   1695.5800   1492.5200     34.8900      3.4426
+   1696.4600   1492.5400     34.9000      3.4426
+   1696.9000   1492.5400     34.9000      3.4405
+   1697.7900   1492.5600     34.9000      3.4415
+   1698.6700   1492.5800     34.8900      3.4426
+   1699.1100   1492.5800     34.9000      3.4415
+   1699.5600   1492.5900     34.9000      3.4415
+   1700.8800   1492.6100     34.9000      3.4415
+   1701.7700   1492.6200     34.9000      3.4405
+   1702.2100   1492.6300     34.9000      3.4405
+   1702.6500   1492.6300     34.9000      3.4394
+   1703.5300   1492.6500     34.9000      3.4394
+   1704.4200   1492.6600     34.9000      3.4383
+   1705.3000   1492.6700     34.9000      3.4373
+   1705.7400   1492.6800     34.9000      3.4373
+   1706.6300   1492.6900     34.9000      3.4383
+   1707.5100   1492.7100     34.9000      3.4362
+   1707.9500   1492.7100     34.9000      3.4373
+   1708.8400   1492.7200     34.9000      3.4362
+   1709.7200   1492.7300     34.9000      3.4352
+   1710.1700   1492.7400     34.9000      3.4341
+   1711.0500   1492.7500     34.9000      3.4330
+   1711.9300   1492.7600     34.9000      3.4330
+   1712.3800   1492.7700     34.9000      3.4320
+   1713.2600   1492.7800     34.9000      3.4309
+   1713.7000   1492.7900     34.9000      3.4309
+   1714.5900   1492.8000     34.9000      3.4309
+   1715.4700   1492.8200     34.9000      3.4309
+   1716.3600   1492.8300     34.9000      3.4320
+   1716.8000   1492.8400     34.9000      3.4309
+   1717.6800   1492.8500     34.9000      3.4309
+   1718.5700   1492.8700     34.9000      3.4309
+   1719.0100   1492.8800     34.9000      3.4320
+   1719.8900   1492.8900     34.9000      3.4309
+   1720.3300   1492.9000     34.9000      3.4312
+   1721.2200   1492.9200     34.9000      3.4316
+   1722.1000   1492.9300     34.8900      3.4320
+   1722.9900   1492.9500     34.9000      3.4320
+   1723.8700   1492.9600     34.9000      3.4309
+   1724.3100   1492.9700     34.9000      3.4309
+   1725.2000   1492.9800     34.9000      3.4309
+   1725.6400   1492.9800     34.9000      3.4298
+   1726.5200   1493.0000     34.9000      3.4298
+   1727.4100   1493.0100     34.9000      3.4299
+   1727.8500   1493.0200     34.9000      3.4299
+   1728.7300   1493.0400     34.9000      3.4299
+   1729.1800   1493.0400     34.8900      3.4299
+   1730.0600   1493.0500     34.9000      3.4267
+   1730.9400   1493.0600     34.8900      3.4267
+   1731.3900   1493.0600     34.9000      3.4256
+   1732.2700   1493.0800     34.9000      3.4256
+   1733.1600   1493.1000     34.9000      3.4256
+   1733.6000   1493.1000     34.9000      3.4256
+   1734.4800   1493.1100     34.9000      3.4235
+   1735.3700   1493.1300     34.9000      3.4246
+   1735.8100   1493.1300     34.9000      3.4246
+   1737.1300   1493.1500     34.9000      3.4235
+   1738.0200   1493.1700     34.9000      3.4235
+   1738.9000   1493.1800     34.9000      3.4225
+   1739.3400   1493.1900     34.9000      3.4225
+   1740.2300   1493.2000     34.8900      3.4235
+   1740.6700   1493.2100     34.9000      3.4235
+   1741.5500   1493.2200     34.9000      3.4225
+   1742.4400   1493.2400     34.8900      3.4225
+   1742.8800   1493.2400     34.8900      3.4225
+   1743.7600   1493.2600     34.8900      3.4225
+   1744.6500   1493.2700     34.8900      3.4225
+   1745.0900   1493.2800     34.9000      3.4225
+   1745.9700   1493.2900     34.9000      3.4214
+   1746.4200   1493.3000     34.9000      3.4214
+   1747.3000   1493.3200     34.9000      3.4214
+   1748.1800   1493.3400     34.9000      3.4225
+   1749.0700   1493.3500     34.9000      3.4225
+   1749.5100   1493.3500     34.9000      3.4214
+   1749.9500   1493.3600     34.9000      3.4225
+   1750.8400   1493.3800     34.9000      3.4214
+   1751.7200   1493.3900     34.9000      3.4214
+   1752.6000   1493.4000     34.8900      3.4214
+   1753.0500   1493.4100     34.9000      3.4204
+   1753.9300   1493.4300     34.8900      3.4214
+   1754.8100   1493.4400     34.8900      3.4204
+   1755.2600   1493.4500     34.8900      3.4214
+   1755.7000   1493.4500     34.9000      3.4193
+   1756.5800   1493.4600     34.8900      3.4193
+   1757.4700   1493.4800     34.8900      3.4204
+   1758.3500   1493.4900     34.8900      3.4193
+   1759.2300   1493.5000     34.9000      3.4172
+   1759.6800   1493.5100     34.9000      3.4172
+   1760.5600   1493.5300     34.8900      3.4183
+   1761.0000   1493.5300     34.9000      3.4162
+   1761.8900   1493.5400     34.8900      3.4172
+   1762.3300   1493.5500     34.9000      3.4162
+   1763.2100   1493.5600     34.8900      3.4151
+   1764.1000   1493.5700     34.9000      3.4130
+   1764.5400   1493.5800     34.9000      3.4141
+   1765.4200   1493.5900     34.9000      3.4130
+   1765.8600   1493.5900     34.9000      3.4119
+   1766.7500   1493.6000     34.8900      3.4119
+   1767.6300   1493.6200     34.8900      3.4109
+   1768.0700   1493.6200     34.9000      3.4098
+   1768.9600   1493.6400     34.9000      3.4119
+   1769.4000   1493.6500     34.9000      3.4109
+   1770.2800   1493.6600     34.8900      3.4109
+   1771.1700   1493.6700     34.8900      3.4109
+   1771.6100   1493.6800     34.8900      3.4098
+   1772.4900   1493.7000     34.9000      3.4098
+   1773.3800   1493.7100     34.9000      3.4098
+   1773.8200   1493.7100     34.9000      3.4088
+   1774.7000   1493.7200     34.8900      3.4077
+   1775.1500   1493.7300     34.8900      3.4077
+   1776.0300   1493.7400     34.8900      3.4056
+   1776.4700   1493.7400     34.9000      3.4035
+   1777.8000   1493.7500     34.8900      3.4024
+   1778.2400   1493.7500     34.8900      3.3992
+   1779.1200   1493.7600     34.8900      3.3992
+   1779.5700   1493.7700     34.8900      3.3982
+   1780.4500   1493.7800     34.8900      3.3982
+   1780.8900   1493.7800     34.9000      3.3961
+   1781.7800   1493.8000     34.8900      3.3971
+   1782.6600   1493.8100     34.9000      3.3961
+   1783.1000   1493.8200     34.9000      3.3961
+   1783.9800   1493.8300     34.9000      3.3950
+   1784.8700   1493.8500     34.9000      3.3961
+   1785.3100   1493.8600     34.9000      3.3961
+   1786.1900   1493.8700     34.8900      3.3961
+   1787.0800   1493.8700     34.8900      3.3929
+   1787.5200   1493.8800     34.8900      3.3929
+   1788.4000   1493.8900     34.9000      3.3918
+   1788.8500   1493.9000     34.9000      3.3918
+   1789.7300   1493.9100     34.8900      3.3918
+   1790.6100   1493.9300     34.9000      3.3918
+   1791.5000   1493.9400     34.8900      3.3908
+   1792.3800   1493.9500     34.9000      3.3897
+   1792.8200   1493.9500     34.9000      3.3887
+   1793.2700   1493.9600     34.9000      3.3887
+   1794.1500   1493.9700     34.8900      3.3887
+   1794.5900   1493.9800     34.9000      3.3887
+   1795.4700   1493.9900     34.9000      3.3876
+   1796.3600   1494.0100     34.9000      3.3866
+   1796.8000   1494.0200     34.9000      3.3876
+   1797.6800   1494.0300     34.9000      3.3866
+   1798.5700   1494.0400     34.9000      3.3866
+   1799.0100   1494.0500     34.8900      3.3876
+   1799.8900   1494.0700     34.8900      3.3887
+   1800.7800   1494.0800     34.9000      3.3876
+   1801.2200   1494.0900     34.9000      3.3866
+   1802.1000   1494.1100     34.8900      3.3876
+   1802.9900   1494.1100     34.8900      3.3866
+   1803.4300   1494.1300     34.8900      3.3876
+   1804.3100   1494.1400     34.9000      3.3855
+   1804.7600   1494.1500     34.8900      3.3866
+   1805.6400   1494.1600     34.9000      3.3866
+   1806.5200   1494.1700     34.8900      3.3866
+   1807.4100   1494.1900     34.8900      3.3855
+   1807.8500   1494.1900     34.8900      3.3855
+   1808.7300   1494.2100     34.8900      3.3855
+   1809.1700   1494.2200     34.8900      3.3855
+   1810.0600   1494.2300     34.9000      3.3845
+   1810.9400   1494.2400     34.8900      3.3845
+   1811.3800   1494.2400     34.9000      3.3823
+   1812.2700   1494.2500     34.8900      3.3823
+   1813.1500   1494.2700     34.8900      3.3813
+   1813.5900   1494.2700     34.8900      3.3802
+   1814.4800   1494.2800     34.9000      3.3781
+   1815.3600   1494.2900     34.8900      3.3781
+   1816.2400   1494.3100     34.9000      3.3781
+   1816.6800   1494.3100     34.9000      3.3770
+   1817.5700   1494.3300     34.9000      3.3781
+   1818.0100   1494.3300     34.8900      3.3781
+   1818.9000   1494.3500     34.9000      3.3770
+   1819.3400   1494.3600     34.9000      3.3770
+   1820.2200   1494.3700     34.9000      3.3770
+   1821.1000   1494.3800     34.9000      3.3770
+   1821.5500   1494.3900     34.8900      3.3770
+   1822.4300   1494.4100     34.8900      3.3770
+   1823.3100   1494.4200     34.8900      3.3770
+   1823.7600   1494.4300     34.9000      3.3760
+   1824.6400   1494.4400     34.9000      3.3760
+   1825.0800   1494.4500     34.9000      3.3760
+   1825.9600   1494.4600     34.9000      3.3760
+   1826.8500   1494.4800     34.9000      3.3760
+   1827.7300   1494.4900     34.9000      3.3749
+   1828.6200   1494.5100     34.8900      3.3770
+   1829.0600   1494.5100     34.8900      3.3760
+   1829.9400   1494.5300     34.8900      3.3760
+   1830.8200   1494.5400     34.8900      3.3749
+   1831.2700   1494.5500     34.9000      3.3749
+   1831.7100   1494.5600     34.9000      3.3749
+   1832.5900   1494.5700     34.9000      3.3749
+   1833.4700   1494.5900     34.9000      3.3749
+   1834.3600   1494.6000     34.9000      3.3738
+   1834.8000   1494.6100     34.9000      3.3738
+   1835.6800   1494.6200     34.8900      3.3738
+   1836.5700   1494.6300     34.8900      3.3728
+   1837.0100   1494.6400     34.8900      3.3728
+   1837.8900   1494.6400     34.9000      3.3706
+   1838.3400   1494.6500     34.9000      3.3696
+   1839.2200   1494.6600     34.9000      3.3685
+   1840.1000   1494.6800     34.9000      3.3696
+   1840.5400   1494.6800     34.8900      3.3685
+   1841.4300   1494.7000     34.9000      3.3685
+   1842.3100   1494.7100     34.9000      3.3675
+   1842.7500   1494.7200     34.8900      3.3685
+   1843.6400   1494.7200     34.9000      3.3664
+   1844.5200   1494.7400     34.9000      3.3653
+   1845.4000   1494.7400     34.9000      3.3632
+   1845.8500   1494.7500     34.9000      3.3621
+   1846.2900   1494.7500     34.9000      3.3621
+   1847.1700   1494.7700     34.9000      3.3621
+   1848.0600   1494.7800     34.9000      3.3621
+   1848.9400   1494.7900     34.9000      3.3611
+   1849.3800   1494.8000     34.9000      3.3611
+   1850.2600   1494.8100     34.9000      3.3611
+   1850.7000   1494.8200     34.8900      3.3611
+   1852.0300   1494.8300     34.9000      3.3579
+   1852.4700   1494.8300     34.9000      3.3568
+   1853.3600   1494.8500     34.8900      3.3568
+   1853.8000   1494.8600     34.9000      3.3568
+   1854.6800   1494.8700     34.9000      3.3568
+   1855.5700   1494.8900     34.9000      3.3568
+   1856.0100   1494.8900     34.9000      3.3568
+   1856.8900   1494.9100     34.9000      3.3558
+   1857.7700   1494.9200     34.9000      3.3547
+   1858.2200   1494.9300     34.9000      3.3558
+   1859.1000   1494.9400     34.9000      3.3547
+   1859.9800   1494.9500     34.9000      3.3536
+   1860.4200   1494.9600     34.8900      3.3536
+   1861.3100   1494.9700     34.9000      3.3526
+   1861.7500   1494.9700     34.9000      3.3515
+   1862.6300   1494.9900     34.9000      3.3515
+   1863.5200   1495.0000     34.9000      3.3515
+   1863.9600   1495.0000     34.9000      3.3505
+   1864.8400   1495.0200     34.9000      3.3494
+   1865.7200   1495.0300     34.9000      3.3483
+   1866.1700   1495.0400     34.9000      3.3494
+   1867.0500   1495.0500     34.9000      3.3494
+   1867.4900   1495.0600     34.9000      3.3494
+   1868.3800   1495.0800     34.9000      3.3494
+   1869.2600   1495.0900     34.9000      3.3504
+   1870.1400   1495.1100     34.9000      3.3494
+   1870.5800   1495.1000     34.8900      3.3473
+   1871.4700   1495.1200     34.8900      3.3473
+   1872.3500   1495.1300     34.9000      3.3462
+   1872.7900   1495.1200     34.9000      3.3430
+   1873.6800   1495.1400     34.9000      3.3441
+   1874.5600   1495.1500     34.9000      3.3419
+   1875.0000   1495.1600     34.9000      3.3430
+   1875.4400   1495.1700     34.9000      3.3430
+   1876.3300   1495.1800     34.9000      3.3409
+   1877.2100   1495.2000     34.9000      3.3409
+   1877.6500   1495.2000     34.9000      3.3419
+   1878.5400   1495.2100     34.9000      3.3409
+   1878.9800   1495.2200     34.9000      3.3409
+   1879.8600   1495.2300     34.9000      3.3398
+   1880.7400   1495.2500     34.9000      3.3409
+   1881.1900   1495.2500     34.9000      3.3398
+   1882.0700   1495.2700     34.9000      3.3398
+   1882.9500   1495.2800     34.8900      3.3398
+   1883.3900   1495.2900     34.9000      3.3388
+   1884.2800   1495.3000     34.9000      3.3388
+   1885.1600   1495.3200     34.9000      3.3388
+   1885.6000   1495.3300     34.9000      3.3388
+   1886.0400   1495.3300     34.9000      3.3377
+   1887.3700   1495.3500     34.9000      3.3377
+   1887.8100   1495.3600     34.9000      3.3377
+   1888.6900   1495.3700     34.9000      3.3366
+   1889.1400   1495.3700     34.9000      3.3345
+   1890.0200   1495.3900     34.9000      3.3356
+   1890.9000   1495.4000     34.9000      3.3345
+   1891.7900   1495.4000     34.9000      3.3313
+   1892.2300   1495.4000     34.9000      3.3292
+   1893.1100   1495.4100     34.9000      3.3292
+   1893.9900   1495.4300     34.9000      3.3281
+   1894.4400   1495.4300     34.9000      3.3281
+   1895.3200   1495.4400     34.8900      3.3285
+   1895.7600   1495.4500     34.8900      3.3288
+   1896.6500   1495.4700     34.8900      3.3292
+   1897.5300   1495.4800     34.9000      3.3271
+   1897.9700   1495.4900     34.9000      3.3271
+   1898.8500   1495.5000     34.9000      3.3260
+   1899.7400   1495.5100     34.9000      3.3260
+   1900.1800   1495.5200     34.9000      3.3260
+   1901.0600   1495.5300     34.9000      3.3250
+   1901.9400   1495.5500     34.9000      3.3260
+   1902.3900   1495.5600     34.9000      3.3250
+   1903.2700   1495.5700     34.9000      3.3260
+   1903.7100   1495.5800     34.9000      3.3250
+   1904.6000   1495.5900     34.9000      3.3239
+   1905.4800   1495.6000     34.9000      3.3239
+   1906.3600   1495.6200     34.9000      3.3239
+   1907.2400   1495.6300     34.9000      3.3229
+   1907.6900   1495.6300     34.8900      3.3229
+   1908.1300   1495.6400     34.9000      3.3218
+   1909.0100   1495.6600     34.9000      3.3229
+   1909.8900   1495.6600     34.9000      3.3207
+   1910.3400   1495.6800     34.9000      3.3218
+   1911.2200   1495.6900     34.9000      3.3218
+   1912.1000   1495.7000     34.9000      3.3208
+   1912.5400   1495.7100     34.9000      3.3208
+   1913.4300   1495.7200     34.9000      3.3197
+   1914.3100   1495.7300     34.9000      3.3197
+   1914.7500   1495.7400     34.9000      3.3197
+   1915.6400   1495.7500     34.8900      3.3197
+   1916.0800   1495.7600     34.9000      3.3197
+   1916.9600   1495.7700     34.9000      3.3176
+   1917.4000   1495.7800     34.9000      3.3176
+   1918.2900   1495.7900     34.9000      3.3155
+   1918.7300   1495.7900     34.9000      3.3155
+   1919.6100   1495.8000     34.9000      3.3144
+   1920.4900   1495.8200     34.9000      3.3144
+   1921.3800   1495.8300     34.9000      3.3144
+   1921.8200   1495.8300     34.9000      3.3134
+   1922.7000   1495.8500     34.9000      3.3123
+   1923.1400   1495.8600     34.9000      3.3123
+   1924.0300   1495.8700     34.9000      3.3134
+   1924.4700   1495.8700     34.9000      3.3112
+   1925.3500   1495.8900     34.9000      3.3113
+   1926.2300   1495.9000     34.9000      3.3102
+   1926.6800   1495.9100     34.9000      3.3113
+   1927.5600   1495.9200     34.9000      3.3102
+   1928.4400   1495.9300     34.9000      3.3102
+   1929.3300   1495.9500     34.9000      3.3102
+   1929.7700   1495.9600     34.9000      3.3091
+   1930.6500   1495.9700     34.9000      3.3091
+   1931.0900   1495.9800     34.9000      3.3102
+   1931.9700   1495.9900     34.9000      3.3092
+   1932.8600   1496.0100     34.9000      3.3092
+   1933.3000   1496.0200     34.9000      3.3102
+   1934.1800   1496.0300     34.9000      3.3102
+   1934.6200   1496.0400     34.9000      3.3092
+   1935.5100   1496.0500     34.9000      3.3092
+   1936.3900   1496.0600     34.9000      3.3081
+   1936.8300   1496.0700     34.9000      3.3081
+   1937.7100   1496.0900     34.9000      3.3092
+   1938.1600   1496.1000     34.9000      3.3081
+   1939.0400   1496.1100     34.9000      3.3081
+   1939.9200   1496.1300     34.9000      3.3081
+   1940.3700   1496.1400     34.9000      3.3081
+   1941.2500   1496.1500     34.9000      3.3092
+   1941.6900   1496.1500     34.9000      3.3081
+   1942.5700   1496.1700     34.9000      3.3092
+   1943.4500   1496.1900     34.9000      3.3092
+   1944.3400   1496.1900     34.9000      3.3071
+   1944.7800   1496.1900     34.9000      3.3050
+   1945.6600   1496.2000     34.9000      3.3028
+   1946.1100   1496.2100     34.9000      3.3028
+   1946.9900   1496.2200     34.9000      3.3028
+   1947.8700   1496.2400     34.9000      3.3018
+   1948.7500   1496.2500     34.9000      3.3029
+   1949.2000   1496.2600     34.9000      3.3018
+   1950.0800   1496.2700     34.9000      3.3018
+   1950.5200   1496.2800     34.9000      3.3007
+   1951.4000   1496.2900     34.9000      3.3007
+   1952.2900   1496.3000     34.9000      3.3007
+   1953.1700   1496.3200     34.9000      3.3007
+   1953.6100   1496.3300     34.9000      3.3018
+   1954.4900   1496.3400     34.9000      3.3018
+   1954.9400   1496.3500     34.9000      3.3008
+   1955.8200   1496.3700     34.9000      3.3008
+   1956.7000   1496.3800     34.9000      3.3018
+   1957.5900   1496.4000     34.9000      3.3018
+   1958.0300   1496.4100     34.9000      3.3018
+   1958.9100   1496.4200     34.9000      3.3018
+   1959.7900   1496.4300     34.9000      3.3008
+   1960.2300   1496.4500     34.9000      3.3029
+   1961.1200   1496.4600     34.9000      3.3018
+   1962.0000   1496.4800     34.9000      3.3029
+   1962.8800   1496.4900     34.9000      3.3029
+   1963.7700   1496.5000     34.9000      3.3019
+   1964.2100   1496.5100     34.9000      3.3019
+   1965.0900   1496.5300     34.9000      3.3019
+   1965.5300   1496.5300     34.9000      3.3008
+   1966.4200   1496.5500     34.9000      3.3008
+   1967.3000   1496.5600     34.9000      3.3008
+   1967.7400   1496.5700     34.9000      3.3008
+   1968.6200   1496.5800     34.9000      3.2998
+   1969.5100   1496.6000     34.9000      3.2998
+   1969.9500   1496.6100     34.9000      3.3008
+   1970.8300   1496.6200     34.9000      3.3008
+   1971.2700   1496.6200     34.9000      3.2998
+   1972.1500   1496.6500     34.9000      3.3008
+   1973.0400   1496.6600     34.9000      3.3008
+   1973.4800   1496.6700     34.9000      3.3008
+   1974.3600   1496.6800     34.9000      3.3008
+   1974.8000   1496.6900     34.9000      3.2998
+   1975.6900   1496.7000     34.9000      3.2998
+   1976.5700   1496.7100     34.9000      3.2987
+   1977.0100   1496.7200     34.9000      3.2987
+   1977.8900   1496.7400     34.9000      3.2998
+   1978.7800   1496.7500     34.9000      3.2998
+   1979.2200   1496.7600     34.9000      3.2998
+   1980.1000   1496.7800     34.9000      3.2998
+   1980.9800   1496.7900     34.9000      3.2987
+   1981.4300   1496.8000     34.9000      3.2995
+   1981.8700   1496.8100     34.9000      3.3002
+   1983.1900   1496.8300     34.9000      3.3009
+   1984.0700   1496.8400     34.9000      3.2987
+   1984.5200   1496.8500     34.9000      3.2987
+   1984.9600   1496.8500     34.9000      3.2987
+   1985.8400   1496.8700     34.9000      3.2998
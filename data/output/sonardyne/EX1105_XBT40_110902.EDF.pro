@@ -0,0 +1,1189 @@
+test_read_store_and_write
+1/1/2011
+23:35:54
+Probe: Deep Blue
+Source: /root/package/data/input/sippican/EX1105_XBT40_110902.EDF
+      0.0000   1540.7400     32.2000     29.0800
+      0.7000   1542.2700     32.2000     29.8000
+      1.3000   1542.7200     32.2000     30.0100
+      2.0000   1542.8600     32.2000     30.0700
+      2.7000   1542.9100     32.2000     30.0900
+      3.3000   1542.9300     32.2000     30.0900
+      4.0000   1542.9400     32.2000     30.0900
+      4.7000   1542.9500     32.2000     30.0900
+      5.4000   1542.9500     32.2000     30.0900
+      6.0000   1542.9600     32.2000     30.0900
+      6.7000   1542.9800     32.2000     30.0900
+      7.4000   1542.9800     32.2000     30.0800
+      8.0000   1542.9900     32.2000     30.0800
+      8.7000   1543.0000     32.2000     30.0800
+      9.4000   1543.0100     32.2000     30.0800
+     10.0000   1543.0300     32.2000     30.0800
+     10.7000   1543.0300     32.2000     30.0800
+     11.4000   1543.0300     32.2000     30.0800
+     12.0000   1543.0500     32.2000     30.0800
+     12.7000   1543.0000     32.2000     30.0500
+     13.4000   1542.9000     32.2000     30.0000
+     14.0000   1542.8200     32.2000     29.9500
+     14.7000   1542.7800     32.2000     29.9300
+     15.4000   1542.7600     32.2000     29.9100
+     16.0000   1542.7500     32.2000     29.9000
+     16.7000   1542.7600     32.2000     29.9000
+     17.4000   1542.7600     32.2000     29.9000
+     18.0000   1542.7500     32.2000     29.8900
+     18.7000   1542.8900     32.2000     29.9500
+     19.4000   1543.5100     32.2000     30.2400
+     20.1000   1543.8900     32.2000     30.4200
+     20.7000   1543.9300     32.2000     30.4300
+     21.4000   1543.8000     32.2000     30.3600
+     22.1000   1543.6800     32.2000     30.3000
+     22.7000   1543.4900     32.2000     30.2000
+     23.4000   1543.2400     32.2000     30.0800
+     24.1000   1543.0200     32.2000     29.9700
+     24.7000   1542.7500     32.2000     29.8300
+     25.4000   1542.5200     32.2000     29.7200
+     26.1000   1542.2900     32.2000     29.6000
+     26.7000   1542.0400     32.2000     29.4800
+     27.4000   1541.8000     32.2000     29.3600
+     28.1000   1541.6200     32.2000     29.2700
+     28.7000   1541.4900     32.2000     29.2100
+     29.4000   1541.2700     32.2000     29.1000
+     30.1000   1540.9500     32.2000     28.9500
+     30.7000   1540.4500     32.2000     28.7100
+     31.4000   1539.9800     32.2000     28.4900
+     32.1000   1539.6800     32.2000     28.3500
+     32.7000   1539.4900     32.2000     28.2600
+     33.4000   1539.3500     32.2000     28.1900
+     34.1000   1539.1800     32.2000     28.1100
+     34.7000   1539.1000     32.2000     28.0700
+     35.4000   1539.2200     32.2000     28.1200
+     36.1000   1539.3000     32.2000     28.1500
+     36.7000   1539.1900     32.2000     28.1000
+     37.4000   1538.9900     32.2000     28.0000
+     38.1000   1538.6700     32.2000     27.8500
+     38.7000   1538.1600     32.2000     27.6200
+     39.4000   1537.6500     32.2000     27.3900
+     40.1000   1537.1800     32.2000     27.1800
+     40.7000   1536.7300     32.2000     26.9700
+     41.4000   1536.3300     32.2000     26.7900
+     42.1000   1535.9300     32.2000     26.6200
+     42.7000   1535.6100     32.2000     26.4800
+     43.4000   1535.3200     32.2000     26.3500
+     44.1000   1535.0800     32.2000     26.2400
+     44.7000   1534.9700     32.2000     26.1900
+     45.4000   1534.8000     32.2000     26.1100
+     46.1000   1534.4700     32.2000     25.9700
+     46.7000   1534.0800     32.2000     25.8000
+     47.4000   1533.5200     32.2000     25.5600
+     48.1000   1532.7800     32.2000     25.2500
+     48.7000   1532.2000     32.2000     25.0000
+     49.4000   1531.8900     32.2000     24.8700
+     50.1000   1531.7500     32.2000     24.8100
+     50.7000   1531.6800     32.2000     24.7700
+     51.4000   1531.6000     32.2000     24.7400
+     52.1000   1531.5100     32.2000     24.7000
+     52.7000   1531.4600     32.2000     24.6700
+     53.4000   1531.3700     32.2000     24.6300
+     54.0000   1531.1800     32.2000     24.5500
+     54.7000   1531.0400     32.2000     24.4900
+     55.4000   1530.9300     32.2000     24.4400
+     56.0000   1530.8000     32.2000     24.3800
+     56.7000   1530.5700     32.2000     24.2800
+     57.4000   1530.2600     32.2000     24.1500
+     58.0000   1529.7700     32.2000     23.9500
+     58.7000   1529.2900     32.2000     23.7600
+     59.4000   1528.9900     32.2000     23.6300
+     60.0000   1528.7200     32.2000     23.5200
+     60.7000   1528.3800     32.2000     23.3800
+     61.4000   1527.7700     32.2000     23.1400
+     62.0000   1527.1800     32.2000     22.9100
+     62.7000   1526.8800     32.2000     22.7900
+     63.4000   1526.6800     32.2000     22.7100
+     64.0000   1526.3300     32.2000     22.5700
+     64.7000   1525.8600     32.2000     22.3800
+     65.4000   1525.4100     32.2000     22.2100
+     66.0000   1524.9200     32.2000     22.0200
+     66.7000   1524.4800     32.2000     21.8500
+     67.3000   1524.1600     32.2000     21.7200
+     68.0000   1523.9700     32.2000     21.6500
+     68.7000   1523.7500     32.2000     21.5600
+     69.3000   1523.5300     32.2000     21.4700
+     70.0000   1523.3300     32.2000     21.4000
+     70.7000   1523.1900     32.2000     21.3400
+     71.3000   1523.0900     32.2000     21.3000
+     72.0000   1523.0000     32.2000     21.2600
+     72.7000   1522.9000     32.2000     21.2200
+     73.3000   1522.8000     32.2000     21.1800
+     74.0000   1522.7000     32.2000     21.1400
+     74.7000   1522.6500     32.2000     21.1100
+     75.3000   1522.6300     32.2000     21.1100
+     76.0000   1522.5300     32.2000     21.0600
+     76.6000   1522.3900     32.2000     21.0100
+     77.3000   1522.2500     32.2000     20.9500
+     78.0000   1522.0900     32.2000     20.8900
+     78.6000   1521.8000     32.2000     20.7800
+     79.3000   1521.5000     32.2000     20.6700
+     80.0000   1521.3000     32.2000     20.5900
+     80.6000   1521.1300     32.2000     20.5200
+     81.3000   1521.0100     32.2000     20.4800
+     82.0000   1520.9400     32.2000     20.4500
+     82.6000   1520.8600     32.2000     20.4100
+     83.3000   1520.8000     32.2000     20.3900
+     83.9000   1520.7200     32.2000     20.3600
+     84.6000   1520.6300     32.2000     20.3200
+     85.3000   1520.5500     32.2000     20.2900
+     85.9000   1520.4500     32.2000     20.2500
+     86.6000   1520.3400     32.2000     20.2000
+     87.3000   1520.2800     32.2000     20.1700
+     87.9000   1520.2600     32.2000     20.1700
+     88.6000   1520.2600     32.2000     20.1600
+     89.3000   1520.2600     32.2000     20.1600
+     89.9000   1520.2700     32.2000     20.1600
+     90.6000   1520.2700     32.2000     20.1500
+     91.2000   1520.1600     32.2000     20.1100
+     91.9000   1520.0200     32.2000     20.0600
+     92.6000   1519.9100     32.2000     20.0100
+     93.2000   1519.7800     32.2000     19.9600
+     93.9000   1519.6200     32.2000     19.9000
+     94.6000   1519.4800     32.2000     19.8500
+     95.2000   1519.4000     32.2000     19.8200
+     95.9000   1519.3500     32.2000     19.7900
+     96.5000   1519.2800     32.2000     19.7600
+     97.2000   1519.1600     32.2000     19.7200
+     97.9000   1518.9800     32.2000     19.6500
+     98.5000   1518.7200     32.2000     19.5500
+     99.2000   1518.4600     32.2000     19.4600
+     99.9000   1518.3000     32.2000     19.4000
+    100.5000   1518.2200     32.2000     19.3700
+    101.2000   1518.1800     32.2000     19.3500
+    101.8000   1518.1600     32.2000     19.3400
+    102.5000   1518.1500     32.2000     19.3300
+    103.2000   1518.0800     32.2000     19.3000
+    103.8000   1517.9700     32.2000     19.2600
+    104.5000   1517.8200     32.2000     19.2000
+    105.2000   1517.6000     32.2000     19.1200
+    105.8000   1517.2900     32.2000     19.0100
+    106.5000   1516.9200     32.2000     18.8800
+    107.1000   1516.6900     32.2000     18.7900
+    107.8000   1516.6000     32.2000     18.7600
+    108.5000   1516.5900     32.2000     18.7500
+    109.1000   1516.5700     32.2000     18.7400
+    109.8000   1516.4600     32.2000     18.7000
+    110.5000   1516.1800     32.2000     18.6000
+    111.1000   1515.8800     32.2000     18.4900
+    111.8000   1515.6300     32.2000     18.4000
+    112.4000   1515.4400     32.2000     18.3300
+    113.1000   1515.3300     32.2000     18.2900
+    113.8000   1515.2700     32.2000     18.2700
+    114.4000   1515.2000     32.2000     18.2400
+    115.1000   1515.1400     32.2000     18.2200
+    115.7000   1515.1200     32.2000     18.2000
+    116.4000   1515.0900     32.2000     18.1900
+    117.1000   1515.0800     32.2000     18.1800
+    117.7000   1515.0600     32.2000     18.1700
+    118.4000   1515.0300     32.2000     18.1600
+    119.0000   1515.0400     32.2000     18.1600
+    119.7000   1515.0400     32.2000     18.1500
+    120.4000   1515.0100     32.2000     18.1400
+    121.0000   1514.9800     32.2000     18.1200
+    121.7000   1514.9600     32.2000     18.1100
+    122.4000   1514.9500     32.2000     18.1100
+    123.0000   1514.9200     32.2000     18.1000
+    123.7000   1514.8700     32.2000     18.0700
+    124.3000   1514.8100     32.2000     18.0500
+    125.0000   1514.7700     32.2000     18.0300
+    125.7000   1514.7300     32.2000     18.0200
+    126.3000   1514.7000     32.2000     18.0000
+    127.0000   1514.6700     32.2000     17.9900
+    127.6000   1514.6500     32.2000     17.9800
+    128.3000   1514.6200     32.2000     17.9600
+    129.0000   1514.5900     32.2000     17.9500
+    129.6000   1514.4900     32.2000     17.9100
+    130.3000   1514.4000     32.2000     17.8800
+    130.9000   1514.3500     32.2000     17.8600
+    131.6000   1514.3200     32.2000     17.8400
+    132.3000   1514.2900     32.2000     17.8300
+    132.9000   1514.2500     32.2000     17.8100
+    133.6000   1514.2000     32.2000     17.7900
+    134.2000   1514.1500     32.2000     17.7700
+    134.9000   1514.0700     32.2000     17.7400
+    135.6000   1513.9600     32.2000     17.7000
+    136.2000   1513.8800     32.2000     17.6700
+    136.9000   1513.8000     32.2000     17.6400
+    137.5000   1513.7100     32.2000     17.6000
+    138.2000   1513.5800     32.2000     17.5600
+    138.9000   1513.4500     32.2000     17.5100
+    139.5000   1513.3200     32.2000     17.4600
+    140.2000   1513.2300     32.2000     17.4300
+    140.8000   1513.1400     32.2000     17.4000
+    141.5000   1513.0800     32.2000     17.3700
+    142.2000   1513.0600     32.2000     17.3600
+    142.8000   1513.0100     32.2000     17.3400
+    143.5000   1512.9400     32.2000     17.3100
+    144.1000   1512.8600     32.2000     17.2800
+    144.8000   1512.7400     32.2000     17.2400
+    145.5000   1512.5900     32.2000     17.1900
+    146.1000   1512.5200     32.2000     17.1600
+    146.8000   1512.4800     32.2000     17.1400
+    147.4000   1512.4100     32.2000     17.1200
+    148.1000   1512.3200     32.2000     17.0800
+    148.7000   1512.2500     32.2000     17.0600
+    149.4000   1512.1900     32.2000     17.0300
+    150.1000   1512.1300     32.2000     17.0100
+    150.7000   1512.1000     32.2000     16.9900
+    151.4000   1512.0900     32.2000     16.9900
+    152.0000   1512.0500     32.2000     16.9700
+    152.7000   1512.0100     32.2000     16.9600
+    153.4000   1511.9600     32.2000     16.9400
+    154.0000   1511.8900     32.2000     16.9100
+    154.7000   1511.8100     32.2000     16.8800
+    155.3000   1511.7700     32.2000     16.8600
+    156.0000   1511.7300     32.2000     16.8500
+    156.7000   1511.6800     32.2000     16.8200
+    157.3000   1511.6200     32.2000     16.8000
+    158.0000   1511.5700     32.2000     16.7800
+    158.6000   1511.5200     32.2000     16.7600
+    159.3000   1511.4800     32.2000     16.7500
+    159.9000   1511.4400     32.2000     16.7300
+    160.6000   1511.3500     32.2000     16.6900
+    161.3000   1511.2700     32.2000     16.6600
+    161.9000   1511.2000     32.2000     16.6400
+    162.6000   1511.1400     32.2000     16.6100
+    163.2000   1511.0700     32.2000     16.5900
+    163.9000   1511.0200     32.2000     16.5700
+    164.6000   1510.9800     32.2000     16.5500
+    165.2000   1510.9300     32.2000     16.5300
+    165.9000   1510.8500     32.2000     16.5000
+    166.5000   1510.7500     32.2000     16.4700
+    167.2000   1510.6900     32.2000     16.4400
+    167.8000   1510.6600     32.2000     16.4300
+    168.5000   1510.6500     32.2000     16.4200
+    169.2000   1510.6000     32.2000     16.4100
+    169.8000   1510.4800     32.2000     16.3600
+    170.5000   1510.3800     32.2000     16.3200
+    171.1000   1510.3000     32.2000     16.3000
+    171.8000   1510.2500     32.2000     16.2800
+    172.4000   1510.2000     32.2000     16.2600
+    173.1000   1510.1100     32.2000     16.2200
+    173.8000   1510.0100     32.2000     16.1900
+    174.4000   1509.9400     32.2000     16.1600
+    175.1000   1509.9100     32.2000     16.1500
+    175.7000   1509.8700     32.2000     16.1300
+    176.4000   1509.8500     32.2000     16.1200
+    177.0000   1509.8300     32.2000     16.1100
+    177.7000   1509.7700     32.2000     16.0900
+    178.4000   1509.6800     32.2000     16.0600
+    179.0000   1509.6100     32.2000     16.0300
+    179.7000   1509.5500     32.2000     16.0100
+    180.3000   1509.4800     32.2000     15.9800
+    181.0000   1509.4300     32.2000     15.9600
+    181.6000   1509.4100     32.2000     15.9500
+    182.3000   1509.3900     32.2000     15.9400
+    183.0000   1509.3900     32.2000     15.9400
+    183.6000   1509.3900     32.2000     15.9300
+    184.3000   1509.3200     32.2000     15.9100
+    184.9000   1509.2200     32.2000     15.8700
+    185.6000   1509.1300     32.2000     15.8400
+    186.2000   1509.0800     32.2000     15.8200
+    186.9000   1509.0700     32.2000     15.8100
+    187.6000   1509.0500     32.2000     15.8100
+    188.2000   1509.0600     32.2000     15.8000
+    188.9000   1509.0600     32.2000     15.8000
+    189.5000   1509.0500     32.2000     15.7900
+    190.2000   1509.0400     32.2000     15.7900
+    190.8000   1508.9900     32.2000     15.7700
+    191.5000   1508.9200     32.2000     15.7400
+    192.1000   1508.8600     32.2000     15.7200
+    192.8000   1508.8200     32.2000     15.7000
+    193.5000   1508.8000     32.2000     15.6900
+    194.1000   1508.7300     32.2000     15.6700
+    194.8000   1508.6300     32.2000     15.6300
+    195.4000   1508.5400     32.2000     15.6000
+    196.1000   1508.4600     32.2000     15.5700
+    196.7000   1508.4200     32.2000     15.5500
+    197.4000   1508.3900     32.2000     15.5400
+    198.0000   1508.3300     32.2000     15.5200
+    198.7000   1508.2300     32.2000     15.4800
+    199.4000   1508.1200     32.2000     15.4500
+    200.0000   1508.0400     32.2000     15.4200
+    200.7000   1507.9800     32.2000     15.3900
+    201.3000   1507.8800     32.2000     15.3600
+    202.0000   1507.7400     32.2000     15.3100
+    202.6000   1507.6200     32.2000     15.2700
+    203.3000   1507.5500     32.2000     15.2500
+    203.9000   1507.5200     32.2000     15.2300
+    204.6000   1507.5000     32.2000     15.2200
+    205.3000   1507.4800     32.2000     15.2100
+    205.9000   1507.3900     32.2000     15.1800
+    206.6000   1507.2700     32.2000     15.1400
+    207.2000   1507.1200     32.2000     15.0900
+    207.9000   1506.9500     32.2000     15.0300
+    208.5000   1506.7800     32.2000     14.9800
+    209.2000   1506.6600     32.2000     14.9300
+    209.8000   1506.5200     32.2000     14.8900
+    210.5000   1506.4200     32.2000     14.8500
+    211.2000   1506.3300     32.2000     14.8200
+    211.8000   1506.2100     32.2000     14.7800
+    212.5000   1506.0400     32.2000     14.7300
+    213.1000   1505.8900     32.2000     14.6800
+    213.8000   1505.7600     32.2000     14.6300
+    214.4000   1505.6700     32.2000     14.6000
+    215.1000   1505.5600     32.2000     14.5600
+    215.7000   1505.3900     32.2000     14.5100
+    216.4000   1505.2300     32.2000     14.4500
+    217.0000   1505.1000     32.2000     14.4100
+    217.7000   1505.0000     32.2000     14.3800
+    218.4000   1504.9500     32.2000     14.3600
+    219.0000   1504.8800     32.2000     14.3300
+    219.7000   1504.7600     32.2000     14.2900
+    220.3000   1504.6500     32.2000     14.2500
+    221.0000   1504.5800     32.2000     14.2300
+    221.6000   1504.5500     32.2000     14.2200
+    222.3000   1504.5100     32.2000     14.2000
+    222.9000   1504.4600     32.2000     14.1800
+    223.6000   1504.4200     32.2000     14.1700
+    224.2000   1504.4000     32.2000     14.1600
+    224.9000   1504.3600     32.2000     14.1400
+    225.5000   1504.3300     32.2000     14.1300
+    226.2000   1504.3000     32.2000     14.1200
+    226.9000   1504.3000     32.2000     14.1100
+    227.5000   1504.2800     32.2000     14.1000
+    228.2000   1504.2400     32.2000     14.0900
+    228.8000   1504.1900     32.2000     14.0700
+    229.5000   1504.1400     32.2000     14.0500
+    230.1000   1504.1100     32.2000     14.0400
+    230.8000   1504.0800     32.2000     14.0300
+    231.4000   1504.0200     32.2000     14.0100
+    232.1000   1503.9700     32.2000     13.9900
+    232.7000   1503.9100     32.2000     13.9600
+    233.4000   1503.8300     32.2000     13.9400
+    234.0000   1503.7500     32.2000     13.9100
+    234.7000   1503.6600     32.2000     13.8800
+    235.3000   1503.6000     32.2000     13.8600
+    236.0000   1503.5400     32.2000     13.8400
+    236.7000   1503.4800     32.2000     13.8200
+    237.3000   1503.4200     32.2000     13.7900
+    238.0000   1503.3800     32.2000     13.7800
+    238.6000   1503.3600     32.2000     13.7700
+    239.3000   1503.3100     32.2000     13.7500
+    239.9000   1503.2500     32.2000     13.7300
+    240.6000   1503.2100     32.2000     13.7100
+    241.2000   1503.1600     32.2000     13.6900
+    241.9000   1503.1100     32.2000     13.6800
+    242.5000   1503.0600     32.2000     13.6600
+    243.2000   1503.0500     32.2000     13.6500
+    243.8000   1503.0500     32.2000     13.6500
+    244.5000   1503.0300     32.2000     13.6400
+    245.1000   1503.0000     32.2000     13.6300
+    245.8000   1502.9700     32.2000     13.6100
+    246.4000   1502.9700     32.2000     13.6100
+    247.1000   1502.9600     32.2000     13.6000
+    247.7000   1502.9500     32.2000     13.6000
+    248.4000   1502.9400     32.2000     13.5900
+    249.1000   1502.9300     32.2000     13.5900
+    249.7000   1502.9100     32.2000     13.5800
+    250.4000   1502.8700     32.2000     13.5600
+    251.0000   1502.7800     32.2000     13.5300
+    251.7000   1502.6600     32.2000     13.4900
+    252.3000   1502.5600     32.2000     13.4600
+    253.0000   1502.5300     32.2000     13.4500
+    253.6000   1502.5000     32.2000     13.4300
+    254.3000   1502.4500     32.2000     13.4200
+    254.9000   1502.3800     32.2000     13.3900
+    255.6000   1502.3000     32.2000     13.3600
+    256.2000   1502.2400     32.2000     13.3400
+    256.9000   1502.1900     32.2000     13.3200
+    257.5000   1502.0800     32.2000     13.2900
+    258.2000   1501.9000     32.2000     13.2300
+    258.8000   1501.7900     32.2000     13.1900
+    259.5000   1501.7200     32.2000     13.1700
+    260.1000   1501.6900     32.2000     13.1600
+    260.8000   1501.6500     32.2000     13.1400
+    261.4000   1501.6100     32.2000     13.1300
+    262.1000   1501.6000     32.2000     13.1200
+    262.7000   1501.5900     32.2000     13.1200
+    263.4000   1501.6000     32.2000     13.1200
+    264.0000   1501.5900     32.2000     13.1100
+    264.7000   1501.5600     32.2000     13.1000
+    265.3000   1501.4900     32.2000     13.0700
+    266.0000   1501.4400     32.2000     13.0600
+    266.6000   1501.4200     32.2000     13.0400
+    267.3000   1501.3700     32.2000     13.0300
+    267.9000   1501.2400     32.2000     12.9900
+    268.6000   1501.1000     32.2000     12.9400
+    269.2000   1501.0100     32.2000     12.9100
+    269.9000   1500.9600     32.2000     12.8900
+    270.5000   1500.9000     32.2000     12.8700
+    271.2000   1500.7800     32.2000     12.8300
+    271.8000   1500.6800     32.2000     12.8000
+    272.5000   1500.6100     32.2000     12.7800
+    273.2000   1500.5800     32.2000     12.7600
+    273.8000   1500.5500     32.2000     12.7500
+    274.5000   1500.5300     32.2000     12.7400
+    275.1000   1500.4600     32.2000     12.7200
+    275.8000   1500.3400     32.2000     12.6800
+    276.4000   1500.2000     32.2000     12.6300
+    277.1000   1500.1000     32.2000     12.6000
+    277.7000   1500.0500     32.2000     12.5900
+    278.4000   1500.0300     32.2000     12.5800
+    279.0000   1500.0100     32.2000     12.5700
+    279.7000   1499.9600     32.2000     12.5500
+    280.3000   1499.8300     32.2000     12.5100
+    281.0000   1499.7300     32.2000     12.4700
+    281.6000   1499.6700     32.2000     12.4500
+    282.3000   1499.6200     32.2000     12.4400
+    282.9000   1499.5600     32.2000     12.4100
+    283.6000   1499.5200     32.2000     12.4000
+    284.2000   1499.4900     32.2000     12.3900
+    284.9000   1499.4500     32.2000     12.3700
+    285.5000   1499.4300     32.2000     12.3600
+    286.2000   1499.3900     32.2000     12.3500
+    286.8000   1499.3300     32.2000     12.3300
+    287.5000   1499.2200     32.2000     12.3000
+    288.1000   1499.1300     32.2000     12.2700
+    288.7000   1499.0900     32.2000     12.2500
+    289.4000   1499.0700     32.2000     12.2400
+    290.0000   1499.0300     32.2000     12.2300
+    290.7000   1498.9700     32.2000     12.2100
+    291.3000   1498.8900     32.2000     12.1800
+    292.0000   1498.8200     32.2000     12.1500
+    292.6000   1498.7700     32.2000     12.1400
+    293.3000   1498.7300     32.2000     12.1200
+    293.9000   1498.6800     32.2000     12.1100
+    294.6000   1498.6500     32.2000     12.0900
+    295.2000   1498.6400     32.2000     12.0900
+    295.9000   1498.6300     32.2000     12.0800
+    296.5000   1498.6200     32.2000     12.0800
+    297.2000   1498.6000     32.2000     12.0700
+    297.8000   1498.5500     32.2000     12.0500
+    298.5000   1498.5000     32.2000     12.0300
+    299.1000   1498.4800     32.2000     12.0200
+    299.8000   1498.4500     32.2000     12.0100
+    300.4000   1498.3900     32.2000     11.9900
+    301.1000   1498.3400     32.2000     11.9700
+    301.7000   1498.3100     32.2000     11.9600
+    302.4000   1498.2800     32.2000     11.9500
+    303.0000   1498.2300     32.2000     11.9300
+    303.7000   1498.1600     32.2000     11.9100
+    304.3000   1498.1000     32.2000     11.8900
+    305.0000   1498.0500     32.2000     11.8700
+    305.6000   1498.0200     32.2000     11.8600
+    306.3000   1497.9700     32.2000     11.8400
+    306.9000   1497.9300     32.2000     11.8300
+    307.6000   1497.8600     32.2000     11.8000
+    308.2000   1497.7800     32.2000     11.7800
+    308.9000   1497.7300     32.2000     11.7600
+    309.5000   1497.6800     32.2000     11.7400
+    310.2000   1497.6100     32.2000     11.7200
+    310.8000   1497.5600     32.2000     11.7000
+    311.5000   1497.5500     32.2000     11.7000
+    312.1000   1497.5400     32.2000     11.6900
+    312.7000   1497.5100     32.2000     11.6800
+    313.4000   1497.4900     32.2000     11.6700
+    314.0000   1497.4200     32.2000     11.6500
+    314.7000   1497.3400     32.2000     11.6200
+    315.3000   1497.3000     32.2000     11.6000
+    316.0000   1497.2700     32.2000     11.5900
+    316.6000   1497.2600     32.2000     11.5900
+    317.3000   1497.2400     32.2000     11.5800
+    317.9000   1497.1900     32.2000     11.5600
+    318.6000   1497.1300     32.2000     11.5400
+    319.2000   1497.0900     32.2000     11.5300
+    319.9000   1497.0700     32.2000     11.5200
+    320.5000   1497.0600     32.2000     11.5100
+    321.2000   1497.0300     32.2000     11.5000
+    321.8000   1496.9800     32.2000     11.4800
+    322.5000   1496.9200     32.2000     11.4600
+    323.1000   1496.8800     32.2000     11.4500
+    323.8000   1496.8300     32.2000     11.4300
+    324.4000   1496.7800     32.2000     11.4100
+    325.0000   1496.7600     32.2000     11.4000
+    325.7000   1496.7100     32.2000     11.3900
+    326.3000   1496.6700     32.2000     11.3700
+    327.0000   1496.6400     32.2000     11.3600
+    327.6000   1496.6300     32.2000     11.3500
+    328.3000   1496.6100     32.2000     11.3500
+    328.9000   1496.6000     32.2000     11.3400
+    329.6000   1496.5600     32.2000     11.3300
+    330.2000   1496.5200     32.2000     11.3100
+    330.9000   1496.4800     32.2000     11.3000
+    331.5000   1496.4400     32.2000     11.2800
+    332.2000   1496.4200     32.2000     11.2700
+    332.8000   1496.4100     32.2000     11.2700
+    333.5000   1496.4200     32.2000     11.2700
+    334.1000   1496.4200     32.2000     11.2600
+    334.7000   1496.4100     32.2000     11.2600
+    335.4000   1496.4000     32.2000     11.2500
+    336.0000   1496.3800     32.2000     11.2400
+    336.7000   1496.3300     32.2000     11.2300
+    337.3000   1496.2600     32.2000     11.2000
+    338.0000   1496.2000     32.2000     11.1800
+    338.6000   1496.1300     32.2000     11.1600
+    339.3000   1496.0600     32.2000     11.1400
+    339.9000   1496.0400     32.2000     11.1300
+    340.6000   1496.0300     32.2000     11.1200
+    341.2000   1496.0300     32.2000     11.1200
+    341.8000   1496.0400     32.2000     11.1200
+    342.5000   1496.0300     32.2000     11.1100
+    343.1000   1496.0400     32.2000     11.1100
+    343.8000   1496.0500     32.2000     11.1100
+    344.4000   1496.0600     32.2000     11.1100
+    345.1000   1496.0500     32.2000     11.1100
+    345.7000   1496.0100     32.2000     11.0900
+    346.4000   1495.9500     32.2000     11.0700
+    347.0000   1495.9100     32.2000     11.0600
+    347.7000   1495.8600     32.2000     11.0400
+    348.3000   1495.8200     32.2000     11.0300
+    348.9000   1495.7800     32.2000     11.0100
+    349.6000   1495.7500     32.2000     11.0000
+    350.2000   1495.7200     32.2000     10.9900
+    350.9000   1495.7100     32.2000     10.9800
+    351.5000   1495.6900     32.2000     10.9700
+    352.2000   1495.6500     32.2000     10.9600
+    352.8000   1495.6100     32.2000     10.9500
+    353.5000   1495.5400     32.2000     10.9200
+    354.1000   1495.4500     32.2000     10.9000
+    354.8000   1495.3900     32.2000     10.8800
+    355.4000   1495.3300     32.2000     10.8600
+    356.0000   1495.3100     32.2000     10.8500
+    356.7000   1495.2900     32.2000     10.8400
+    357.3000   1495.2400     32.2000     10.8200
+    358.0000   1495.1800     32.2000     10.8000
+    358.6000   1495.1000     32.2000     10.7700
+    359.3000   1495.0100     32.2000     10.7500
+    359.9000   1494.9700     32.2000     10.7300
+    360.6000   1494.9400     32.2000     10.7200
+    361.2000   1494.8900     32.2000     10.7000
+    361.8000   1494.8100     32.2000     10.6800
+    362.5000   1494.7400     32.2000     10.6600
+    363.1000   1494.6800     32.2000     10.6400
+    363.8000   1494.6400     32.2000     10.6200
+    364.4000   1494.5900     32.2000     10.6100
+    365.1000   1494.5200     32.2000     10.5800
+    365.7000   1494.4300     32.2000     10.5500
+    366.4000   1494.3600     32.2000     10.5300
+    367.0000   1494.3200     32.2000     10.5200
+    367.6000   1494.2800     32.2000     10.5000
+    368.3000   1494.2500     32.2000     10.4900
+    368.9000   1494.2400     32.2000     10.4900
+    369.6000   1494.1800     32.2000     10.4700
+    370.2000   1494.0800     32.2000     10.4400
+    370.9000   1494.0000     32.2000     10.4100
+    371.5000   1493.9500     32.2000     10.3900
+    372.1000   1493.8900     32.2000     10.3700
+    372.8000   1493.8200     32.2000     10.3500
+    373.4000   1493.7500     32.2000     10.3300
+    374.1000   1493.6900     32.2000     10.3100
+    374.7000   1493.6400     32.2000     10.2900
+    375.4000   1493.5600     32.2000     10.2700
+    376.0000   1493.4800     32.2000     10.2400
+    376.7000   1493.4200     32.2000     10.2200
+    377.3000   1493.3500     32.2000     10.2000
+    377.9000   1493.2900     32.2000     10.1800
+    378.6000   1493.2200     32.2000     10.1600
+    379.2000   1493.1700     32.2000     10.1400
+    379.9000   1493.1300     32.2000     10.1300
+    380.5000   1493.0800     32.2000     10.1100
+    381.2000   1493.0000     32.2000     10.0900
+    381.8000   1492.9200     32.2000     10.0600
+    382.4000   1492.9000     32.2000     10.0500
+    383.1000   1492.8800     32.2000     10.0400
+    383.7000   1492.8400     32.2000     10.0300
+    384.4000   1492.7800     32.2000     10.0100
+    385.0000   1492.7300     32.2000      9.9900
+    385.7000   1492.7000     32.2000      9.9800
+    386.3000   1492.6900     32.2000      9.9800
+    386.9000   1492.6800     32.2000      9.9700
+    387.6000   1492.6300     32.2000      9.9600
+    388.2000   1492.5900     32.2000      9.9400
+    388.9000   1492.5700     32.2000      9.9300
+    389.5000   1492.5600     32.2000      9.9300
+    390.1000   1492.5500     32.2000      9.9200
+    390.8000   1492.5400     32.2000      9.9100
+    391.4000   1492.5100     32.2000      9.9000
+    392.1000   1492.4800     32.2000      9.8900
+    392.7000   1492.4600     32.2000      9.8800
+    393.4000   1492.4400     32.2000      9.8800
+    394.0000   1492.4300     32.2000      9.8700
+    394.6000   1492.4300     32.2000      9.8700
+    395.3000   1492.4000     32.2000      9.8600
+    395.9000   1492.3700     32.2000      9.8500
+    396.6000   1492.3500     32.2000      9.8400
+    397.2000   1492.3300     32.2000      9.8300
+    397.9000   1492.3000     32.2000      9.8200
+    398.5000   1492.2700     32.2000      9.8100
+    399.1000   1492.2600     32.2000      9.8000
+    399.8000   1492.2400     32.2000      9.7900
+    400.4000   1492.2400     32.2000      9.7900
+    401.1000   1492.2400     32.2000      9.7900
+    401.7000   1492.2200     32.2000      9.7800
+    402.3000   1492.2000     32.2000      9.7700
+    403.0000   1492.1700     32.2000      9.7600
+    403.6000   1492.1300     32.2000      9.7400
+    404.3000   1492.1100     32.2000      9.7400
+    404.9000   1492.0900     32.2000      9.7300
+    405.6000   1492.0500     32.2000      9.7100
+    406.2000   1491.9700     32.2000      9.6900
+    406.8000   1491.8900     32.2000      9.6600
+    407.5000   1491.8300     32.2000      9.6500
+    408.1000   1491.8200     32.2000      9.6400
+    408.8000   1491.8100     32.2000      9.6300
+    409.4000   1491.8000     32.2000      9.6300
+    410.0000   1491.7700     32.2000      9.6200
+    410.7000   1491.7300     32.2000      9.6000
+    411.3000   1491.7000     32.2000      9.5900
+    412.0000   1491.6800     32.2000      9.5800
+    412.6000   1491.6400     32.2000      9.5700
+    413.2000   1491.5500     32.2000      9.5400
+    413.9000   1491.4700     32.2000      9.5200
+    414.5000   1491.4200     32.2000      9.5000
+    415.2000   1491.4000     32.2000      9.4900
+    415.8000   1491.3700     32.2000      9.4800
+    416.4000   1491.3100     32.2000      9.4600
+    417.1000   1491.2700     32.2000      9.4500
+    417.7000   1491.1900     32.2000      9.4200
+    418.4000   1491.1200     32.2000      9.4000
+    419.0000   1491.0800     32.2000      9.3900
+    419.6000   1491.0700     32.2000      9.3800
+    420.3000   1491.0500     32.2000      9.3800
+    420.9000   1491.0200     32.2000      9.3600
+    421.6000   1491.0000     32.2000      9.3600
+    422.2000   1490.9900     32.2000      9.3500
+    422.8000   1490.9800     32.2000      9.3500
+    423.5000   1490.9900     32.2000      9.3400
+    424.1000   1490.9800     32.2000      9.3400
+    424.8000   1490.9800     32.2000      9.3400
+    425.4000   1490.9800     32.2000      9.3300
+    426.0000   1490.9800     32.2000      9.3300
+    426.7000   1490.9800     32.2000      9.3300
+    427.3000   1490.9800     32.2000      9.3200
+    428.0000   1490.9700     32.2000      9.3200
+    428.6000   1490.9800     32.2000      9.3200
+    429.2000   1490.9800     32.2000      9.3200
+    429.9000   1490.9800     32.2000      9.3100
+    430.5000   1490.9800     32.2000      9.3100
+    431.2000   1490.9800     32.2000      9.3100
+    431.8000   1490.9900     32.2000      9.3100
+    432.4000   1491.0000     32.2000      9.3100
+    433.1000   1490.9900     32.2000      9.3000
+    433.7000   1490.9800     32.2000      9.2900
+    434.4000   1490.9700     32.2000      9.2900
+    435.0000   1490.9300     32.2000      9.2800
+    435.6000   1490.8900     32.2000      9.2600
+    436.3000   1490.8700     32.2000      9.2600
+    436.9000   1490.8500     32.2000      9.2500
+    437.6000   1490.8200     32.2000      9.2300
+    438.2000   1490.7900     32.2000      9.2200
+    438.8000   1490.7800     32.2000      9.2200
+    439.5000   1490.7500     32.2000      9.2100
+    440.1000   1490.7200     32.2000      9.2000
+    440.8000   1490.6900     32.2000      9.1900
+    441.4000   1490.6700     32.2000      9.1800
+    442.0000   1490.6500     32.2000      9.1700
+    442.7000   1490.6300     32.2000      9.1600
+    443.3000   1490.6300     32.2000      9.1600
+    443.9000   1490.6400     32.2000      9.1600
+    444.6000   1490.6300     32.2000      9.1500
+    445.2000   1490.6000     32.2000      9.1400
+    445.9000   1490.5600     32.2000      9.1300
+    446.5000   1490.5500     32.2000      9.1200
+    447.1000   1490.5200     32.2000      9.1100
+    447.8000   1490.4800     32.2000      9.1000
+    448.4000   1490.4700     32.2000      9.0900
+    449.1000   1490.4600     32.2000      9.0900
+    449.7000   1490.4000     32.2000      9.0700
+    450.3000   1490.3300     32.2000      9.0500
+    451.0000   1490.3000     32.2000      9.0300
+    451.6000   1490.2700     32.2000      9.0200
+    452.2000   1490.2400     32.2000      9.0100
+    452.9000   1490.2000     32.2000      9.0000
+    453.5000   1490.1700     32.2000      8.9900
+    454.2000   1490.1700     32.2000      8.9900
+    454.8000   1490.1600     32.2000      8.9800
+    455.4000   1490.1600     32.2000      8.9800
+    456.1000   1490.1300     32.2000      8.9700
+    456.7000   1490.1000     32.2000      8.9600
+    457.3000   1490.0800     32.2000      8.9500
+    458.0000   1490.0600     32.2000      8.9400
+    458.6000   1490.0500     32.2000      8.9400
+    459.3000   1490.0300     32.2000      8.9300
+    459.9000   1490.0200     32.2000      8.9200
+    460.5000   1489.9800     32.2000      8.9100
+    461.2000   1489.9400     32.2000      8.8900
+    461.8000   1489.8800     32.2000      8.8800
+    462.4000   1489.8400     32.2000      8.8600
+    463.1000   1489.7900     32.2000      8.8500
+    463.7000   1489.7600     32.2000      8.8300
+    464.4000   1489.7400     32.2000      8.8200
+    465.0000   1489.7200     32.2000      8.8200
+    465.6000   1489.7200     32.2000      8.8100
+    466.3000   1489.7100     32.2000      8.8100
+    466.9000   1489.6800     32.2000      8.8000
+    467.5000   1489.6600     32.2000      8.7900
+    468.2000   1489.5900     32.2000      8.7700
+    468.8000   1489.5000     32.2000      8.7400
+    469.5000   1489.4100     32.2000      8.7100
+    470.1000   1489.3400     32.2000      8.6900
+    470.7000   1489.3000     32.2000      8.6800
+    471.4000   1489.2800     32.2000      8.6700
+    472.0000   1489.2700     32.2000      8.6700
+    472.6000   1489.2700     32.2000      8.6600
+    473.3000   1489.2700     32.2000      8.6600
+    473.9000   1489.2600     32.2000      8.6600
+    474.5000   1489.2600     32.2000      8.6500
+    475.2000   1489.2500     32.2000      8.6500
+    475.8000   1489.2400     32.2000      8.6400
+    476.5000   1489.2400     32.2000      8.6400
+    477.1000   1489.2300     32.2000      8.6300
+    477.7000   1489.2200     32.2000      8.6300
+    478.4000   1489.2100     32.2000      8.6200
+    479.0000   1489.2000     32.2000      8.6200
+    479.6000   1489.1700     32.2000      8.6100
+    480.3000   1489.1200     32.2000      8.5900
+    480.9000   1489.0900     32.2000      8.5800
+    481.5000   1489.0800     32.2000      8.5700
+    482.2000   1489.0700     32.2000      8.5700
+    482.8000   1489.0500     32.2000      8.5600
+    483.4000   1489.0100     32.2000      8.5500
+    484.1000   1488.9600     32.2000      8.5300
+    484.7000   1488.9200     32.2000      8.5200
+    485.4000   1488.9000     32.2000      8.5100
+    486.0000   1488.8800     32.2000      8.5000
+    486.6000   1488.8700     32.2000      8.5000
+    487.3000   1488.8400     32.2000      8.4900
+    487.9000   1488.8300     32.2000      8.4800
+    488.5000   1488.8200     32.2000      8.4700
+    489.2000   1488.8200     32.2000      8.4700
+    489.8000   1488.8200     32.2000      8.4700
+    490.4000   1488.8200     32.2000      8.4700
+    491.1000   1488.8400     32.2000      8.4700
+    491.7000   1488.8400     32.2000      8.4700
+    492.3000   1488.8500     32.2000      8.4600
+    493.0000   1488.8500     32.2000      8.4600
+    493.6000   1488.8500     32.2000      8.4600
+    494.3000   1488.8400     32.2000      8.4600
+    494.9000   1488.8100     32.2000      8.4400
+    495.5000   1488.7700     32.2000      8.4300
+    496.2000   1488.7400     32.2000      8.4200
+    496.8000   1488.7300     32.2000      8.4100
+    497.4000   1488.7000     32.2000      8.4000
+    498.1000   1488.6200     32.2000      8.3800
+    498.7000   1488.5500     32.2000      8.3600
+    499.3000   1488.5300     32.2000      8.3500
+    500.0000   1488.5200     32.2000      8.3400
+    500.6000   1488.5100     32.2000      8.3400
+    501.2000   1488.4800     32.2000      8.3300
+    501.9000   1488.4300     32.2000      8.3100
+    502.5000   1488.3700     32.2000      8.2900
+    503.1000   1488.3300     32.2000      8.2800
+    503.8000   1488.3100     32.2000      8.2700
+    504.4000   1488.3000     32.2000      8.2700
+    505.0000   1488.3000     32.2000      8.2600
+    505.7000   1488.2800     32.2000      8.2600
+    506.3000   1488.2300     32.2000      8.2400
+    506.9000   1488.1600     32.2000      8.2200
+    507.6000   1488.1300     32.2000      8.2100
+    508.2000   1488.1200     32.2000      8.2000
+    508.8000   1488.1000     32.2000      8.1900
+    509.5000   1488.1000     32.2000      8.1900
+    510.1000   1488.1100     32.2000      8.1900
+    510.7000   1488.1100     32.2000      8.1900
+    511.4000   1488.1000     32.2000      8.1800
+    512.0000   1488.0800     32.2000      8.1800
+    512.6000   1488.0600     32.2000      8.1700
+    513.3000   1488.0300     32.2000      8.1600
+    513.9000   1488.0100     32.2000      8.1500
+    514.5000   1487.9700     32.2000      8.1400
+    515.2000   1487.9200     32.2000      8.1200
+    515.8000   1487.8600     32.2000      8.1000
+    516.4000   1487.8100     32.2000      8.0900
+    517.1000   1487.7800     32.2000      8.0700
+    517.7000   1487.7500     32.2000      8.0700
+    518.3000   1487.7300     32.2000      8.0600
+    519.0000   1487.7000     32.2000      8.0500
+    519.6000   1487.6700     32.2000      8.0400
+    520.2000   1487.6600     32.2000      8.0300
+    520.9000   1487.6500     32.2000      8.0200
+    521.5000   1487.6500     32.2000      8.0200
+    522.1000   1487.6400     32.2000      8.0200
+    522.8000   1487.6400     32.2000      8.0100
+    523.4000   1487.6400     32.2000      8.0100
+    524.0000   1487.6300     32.2000      8.0100
+    524.7000   1487.6400     32.2000      8.0000
+    525.3000   1487.6000     32.2000      7.9900
+    525.9000   1487.5700     32.2000      7.9800
+    526.6000   1487.5500     32.2000      7.9700
+    527.2000   1487.5300     32.2000      7.9600
+    527.8000   1487.5200     32.2000      7.9600
+    528.5000   1487.5000     32.2000      7.9500
+    529.1000   1487.4800     32.2000      7.9400
+    529.7000   1487.4500     32.2000      7.9300
+    530.4000   1487.4400     32.2000      7.9300
+    531.0000   1487.4100     32.2000      7.9200
+    531.6000   1487.4000     32.2000      7.9100
+    532.3000   1487.4000     32.2000      7.9100
+    532.9000   1487.3900     32.2000      7.9100
+    533.5000   1487.3900     32.2000      7.9000
+    534.2000   1487.3900     32.2000      7.9000
+    534.8000   1487.4000     32.2000      7.9000
+    535.4000   1487.4100     32.2000      7.9000
+    536.1000   1487.4000     32.2000      7.8900
+    536.7000   1487.4200     32.2000      7.9000
+    537.3000   1487.4300     32.2000      7.9000
+    538.0000   1487.4100     32.2000      7.8900
+    538.6000   1487.3700     32.2000      7.8700
+    539.2000   1487.3200     32.2000      7.8600
+    539.9000   1487.2800     32.2000      7.8500
+    540.5000   1487.2500     32.2000      7.8300
+    541.1000   1487.2100     32.2000      7.8200
+    541.7000   1487.2000     32.2000      7.8200
+    542.4000   1487.2000     32.2000      7.8100
+    543.0000   1487.1700     32.2000      7.8000
+    543.6000   1487.1400     32.2000      7.7900
+    544.3000   1487.1200     32.2000      7.7800
+    544.9000   1487.1000     32.2000      7.7800
+    545.5000   1487.0700     32.2000      7.7600
+    546.2000   1487.0000     32.2000      7.7400
+    546.8000   1486.9500     32.2000      7.7300
+    547.4000   1486.9300     32.2000      7.7200
+    548.1000   1486.9200     32.2000      7.7200
+    548.7000   1486.9000     32.2000      7.7100
+    549.3000   1486.8600     32.2000      7.6900
+    550.0000   1486.8000     32.2000      7.6800
+    550.6000   1486.7500     32.2000      7.6600
+    551.2000   1486.7100     32.2000      7.6500
+    551.8000   1486.6800     32.2000      7.6400
+    552.5000   1486.6700     32.2000      7.6300
+    553.1000   1486.6600     32.2000      7.6300
+    553.7000   1486.6500     32.2000      7.6200
+    554.4000   1486.6300     32.2000      7.6100
+    555.0000   1486.6200     32.2000      7.6100
+    555.6000   1486.6100     32.2000      7.6000
+    556.3000   1486.6100     32.2000      7.6000
+    556.9000   1486.6000     32.2000      7.5900
+    557.5000   1486.5800     32.2000      7.5900
+    558.2000   1486.5600     32.2000      7.5800
+    558.8000   1486.5800     32.2000      7.5800
+    559.4000   1486.6000     32.2000      7.5800
+    560.0000   1486.6100     32.2000      7.5800
+    560.7000   1486.6200     32.2000      7.5800
+    561.3000   1486.6200     32.2000      7.5800
+    561.9000   1486.6200     32.2000      7.5800
+    562.6000   1486.6300     32.2000      7.5800
+    563.2000   1486.6200     32.2000      7.5700
+    563.8000   1486.5900     32.2000      7.5600
+    564.5000   1486.5700     32.2000      7.5500
+    565.1000   1486.5600     32.2000      7.5500
+    565.7000   1486.5700     32.2000      7.5500
+    566.3000   1486.5600     32.2000      7.5400
+    567.0000   1486.5500     32.2000      7.5400
+    567.6000   1486.5300     32.2000      7.5300
+    568.2000   1486.4800     32.2000      7.5200
+    568.9000   1486.4100     32.2000      7.4900
+    569.5000   1486.3500     32.2000      7.4800
+    570.1000   1486.3300     32.2000      7.4700
+    570.8000   1486.3100     32.2000      7.4600
+    571.4000   1486.2700     32.2000      7.4500
+    572.0000   1486.2100     32.2000      7.4300
+    572.6000   1486.1400     32.2000      7.4100
+    573.3000   1486.1000     32.2000      7.4000
+    573.9000   1486.0700     32.2000      7.3800
+    574.5000   1486.0400     32.2000      7.3800
+    575.2000   1486.0200     32.2000      7.3700
+    575.8000   1486.0000     32.2000      7.3600
+    576.4000   1485.9800     32.2000      7.3500
+    577.0000   1485.9600     32.2000      7.3400
+    577.7000   1485.9800     32.2000      7.3400
+    578.3000   1485.9900     32.2000      7.3400
+    578.9000   1485.9900     32.2000      7.3400
+    579.6000   1486.0100     32.2000      7.3400
+    580.2000   1486.0200     32.2000      7.3400
+    580.8000   1486.0200     32.2000      7.3400
+    581.5000   1486.0300     32.2000      7.3400
+    582.1000   1486.0400     32.2000      7.3400
+    582.7000   1486.0300     32.2000      7.3400
+    583.3000   1486.0200     32.2000      7.3300
+    584.0000   1486.0000     32.2000      7.3200
+    584.6000   1485.9700     32.2000      7.3100
+    585.2000   1485.9100     32.2000      7.3000
+    585.9000   1485.8700     32.2000      7.2800
+    586.5000   1485.8500     32.2000      7.2700
+    587.1000   1485.8100     32.2000      7.2600
+    587.7000   1485.7900     32.2000      7.2500
+    588.4000   1485.7800     32.2000      7.2500
+    589.0000   1485.7700     32.2000      7.2400
+    589.6000   1485.7500     32.2000      7.2400
+    590.2000   1485.7200     32.2000      7.2300
+    590.9000   1485.6500     32.2000      7.2000
+    591.5000   1485.6200     32.2000      7.1900
+    592.1000   1485.6100     32.2000      7.1900
+    592.8000   1485.6200     32.2000      7.1900
+    593.4000   1485.6200     32.2000      7.1900
+    594.0000   1485.6300     32.2000      7.1900
+    594.6000   1485.6200     32.2000      7.1800
+    595.3000   1485.6000     32.2000      7.1700
+    595.9000   1485.5800     32.2000      7.1600
+    596.5000   1485.5700     32.2000      7.1600
+    597.2000   1485.5600     32.2000      7.1500
+    597.8000   1485.5300     32.2000      7.1500
+    598.4000   1485.5100     32.2000      7.1400
+    599.0000   1485.5000     32.2000      7.1300
+    599.7000   1485.5000     32.2000      7.1300
+    600.3000   1485.5000     32.2000      7.1300
+    600.9000   1485.5100     32.2000      7.1300
+    601.5000   1485.5100     32.2000      7.1200
+    602.2000   1485.5000     32.2000      7.1200
+    602.8000   1485.4900     32.2000      7.1100
+    603.4000   1485.4800     32.2000      7.1100
+    604.1000   1485.4700     32.2000      7.1000
+    604.7000   1485.4600     32.2000      7.1000
+    605.3000   1485.4500     32.2000      7.0900
+    605.9000   1485.4400     32.2000      7.0900
+    606.6000   1485.4300     32.2000      7.0800
+    607.2000   1485.4300     32.2000      7.0800
+    607.8000   1485.4400     32.2000      7.0800
+    608.4000   1485.4300     32.2000      7.0700
+    609.1000   1485.4200     32.2000      7.0700
+    609.7000   1485.4100     32.2000      7.0600
+    610.3000   1485.4100     32.2000      7.0600
+    611.0000   1485.4000     32.2000      7.0600
+    611.6000   1485.4100     32.2000      7.0600
+    612.2000   1485.4100     32.2000      7.0500
+    612.8000   1485.4100     32.2000      7.0500
+    613.5000   1485.4000     32.2000      7.0400
+    614.1000   1485.3900     32.2000      7.0400
+    614.7000   1485.3800     32.2000      7.0300
+    615.3000   1485.3600     32.2000      7.0300
+    616.0000   1485.3400     32.2000      7.0200
+    616.6000   1485.3200     32.2000      7.0100
+    617.2000   1485.2900     32.2000      7.0000
+    617.8000   1485.2700     32.2000      6.9900
+    618.5000   1485.2500     32.2000      6.9900
+    619.1000   1485.2400     32.2000      6.9800
+    619.7000   1485.2000     32.2000      6.9700
+    620.3000   1485.1800     32.2000      6.9600
+    621.0000   1485.1700     32.2000      6.9600
+    621.6000   1485.1700     32.2000      6.9500
+    622.2000   1485.1700     32.2000      6.9500
+    622.9000   1485.1800     32.2000      6.9500
+    623.5000   1485.1900     32.2000      6.9500
+    624.1000   1485.1800     32.2000      6.9400
+    624.7000   1485.1800     32.2000      6.9400
+    625.4000   1485.1700     32.2000      6.9400
+    626.0000   1485.1700     32.2000      6.9300
+    626.6000   1485.1700     32.2000      6.9300
+    627.2000   1485.1600     32.2000      6.9300
+    627.9000   1485.1700     32.2000      6.9200
+    628.5000   1485.1600     32.2000      6.9200
+    629.1000   1485.1500     32.2000      6.9100
+    629.7000   1485.1400     32.2000      6.9100
+    630.4000   1485.1300     32.2000      6.9100
+    631.0000   1485.1200     32.2000      6.9000
+    631.6000   1485.1100     32.2000      6.8900
+    632.2000   1485.1000     32.2000      6.8900
+    632.9000   1485.0800     32.2000      6.8800
+    633.5000   1485.0700     32.2000      6.8800
+    634.1000   1485.0500     32.2000      6.8700
+    634.7000   1485.0300     32.2000      6.8600
+    635.4000   1484.9900     32.2000      6.8500
+    636.0000   1484.9400     32.2000      6.8300
+    636.6000   1484.9100     32.2000      6.8200
+    637.2000   1484.8900     32.2000      6.8200
+    637.9000   1484.8800     32.2000      6.8100
+    638.5000   1484.8700     32.2000      6.8100
+    639.1000   1484.8700     32.2000      6.8000
+    639.7000   1484.8800     32.2000      6.8000
+    640.4000   1484.8700     32.2000      6.8000
+    641.0000   1484.8700     32.2000      6.7900
+    641.6000   1484.8700     32.2000      6.7900
+    642.2000   1484.8600     32.2000      6.7900
+    642.9000   1484.8700     32.2000      6.7900
+    643.5000   1484.8800     32.2000      6.7800
+    644.1000   1484.8700     32.2000      6.7800
+    644.7000   1484.8500     32.2000      6.7700
+    645.4000   1484.8400     32.2000      6.7700
+    646.0000   1484.8200     32.2000      6.7600
+    646.6000   1484.8100     32.2000      6.7500
+    647.2000   1484.8000     32.2000      6.7500
+    647.8000   1484.7900     32.2000      6.7400
+    648.5000   1484.7800     32.2000      6.7400
+    649.1000   1484.7800     32.2000      6.7400
+    649.7000   1484.7900     32.2000      6.7400
+    650.3000   1484.8000     32.2000      6.7400
+    651.0000   1484.8000     32.2000      6.7300
+    651.6000   1484.8000     32.2000      6.7300
+    652.2000   1484.7800     32.2000      6.7200
+    652.8000   1484.7800     32.2000      6.7200
+    653.5000   1484.7700     32.2000      6.7200
+    654.1000   1484.7700     32.2000      6.7100
+    654.7000   1484.7600     32.2000      6.7100
+    655.3000   1484.7600     32.2000      6.7100
+    656.0000   1484.7700     32.2000      6.7100
+    656.6000   1484.7700     32.2000      6.7000
+    657.2000   1484.7700     32.2000      6.7000
+    657.8000   1484.7600     32.2000      6.7000
+    658.4000   1484.7500     32.2000      6.6900
+    659.1000   1484.7300     32.2000      6.6800
+    659.7000   1484.7200     32.2000      6.6800
+    660.3000   1484.7100     32.2000      6.6700
+    660.9000   1484.7000     32.2000      6.6700
+    661.6000   1484.6600     32.2000      6.6500
+    662.2000   1484.6100     32.2000      6.6400
+    662.8000   1484.5900     32.2000      6.6300
+    663.4000   1484.6000     32.2000      6.6300
+    664.1000   1484.6000     32.2000      6.6300
+    664.7000   1484.5900     32.2000      6.6200
+    665.3000   1484.5800     32.2000      6.6200
+    665.9000   1484.5700     32.2000      6.6100
+    666.5000   1484.5800     32.2000      6.6100
+    667.2000   1484.5800     32.2000      6.6100
+    667.8000   1484.5800     32.2000      6.6100
+    668.4000   1484.5700     32.2000      6.6000
+    669.0000   1484.5600     32.2000      6.6000
+    669.7000   1484.5600     32.2000      6.6000
+    670.3000   1484.5600     32.2000      6.5900
+    670.9000   1484.5400     32.2000      6.5800
+    671.5000   1484.5100     32.2000      6.5700
+    672.2000   1484.5000     32.2000      6.5700
+    672.8000   1484.4900     32.2000      6.5700
+    673.4000   1484.4900     32.2000      6.5600
+    674.0000   1484.5000     32.2000      6.5600
+    674.6000   1484.5000     32.2000      6.5600
+    675.3000   1484.4900     32.2000      6.5500
+    675.9000   1484.4600     32.2000      6.5400
+    676.5000   1484.4600     32.2000      6.5400
+    677.1000   1484.4500     32.2000      6.5300
+    677.7000   1484.4300     32.2000      6.5300
+    678.4000   1484.4300     32.2000      6.5300
+    679.0000   1484.4300     32.2000      6.5200
+    679.6000   1484.4300     32.2000      6.5200
+    680.2000   1484.4300     32.2000      6.5200
+    680.9000   1484.4200     32.2000      6.5100
+    681.5000   1484.4200     32.2000      6.5100
+    682.1000   1484.4200     32.2000      6.5100
+    682.7000   1484.4100     32.2000      6.5000
+    683.3000   1484.4300     32.2000      6.5000
+    684.0000   1484.4300     32.2000      6.5000
+    684.6000   1484.4400     32.2000      6.5000
+    685.2000   1484.4400     32.2000      6.5000
+    685.8000   1484.4400     32.2000      6.5000
+    686.5000   1484.4400     32.2000      6.4900
+    687.1000   1484.4400     32.2000      6.4900
+    687.7000   1484.4400     32.2000      6.4900
+    688.3000   1484.4300     32.2000      6.4800
+    688.9000   1484.4300     32.2000      6.4800
+    689.6000   1484.4200     32.2000      6.4800
+    690.2000   1484.4100     32.2000      6.4700
+    690.8000   1484.4200     32.2000      6.4700
+    691.4000   1484.4200     32.2000      6.4700
+    692.0000   1484.4100     32.2000      6.4600
+    692.7000   1484.4000     32.2000      6.4600
+    693.3000   1484.3900     32.2000      6.4500
+    693.9000   1484.4000     32.2000      6.4500
+    694.5000   1484.3900     32.2000      6.4500
+    695.1000   1484.4000     32.2000      6.4500
+    695.8000   1484.3900     32.2000      6.4400
+    696.4000   1484.3700     32.2000      6.4400
+    697.0000   1484.3500     32.2000      6.4300
+    697.6000   1484.3300     32.2000      6.4200
+    698.2000   1484.3200     32.2000      6.4100
+    698.9000   1484.3100     32.2000      6.4100
+    699.5000   1484.3000     32.2000      6.4100
+    700.1000   1484.3100     32.2000      6.4100
+    700.7000   1484.3200     32.2000      6.4000
+    701.3000   1484.3100     32.2000      6.4000
+    702.0000   1484.3000     32.2000      6.4000
+    702.6000   1484.2800     32.2000      6.3900
+    703.2000   1484.2600     32.2000      6.3800
+    703.8000   1484.2500     32.2000      6.3700
+    704.4000   1484.2400     32.2000      6.3700
+    705.1000   1484.2400     32.2000      6.3700
+    705.7000   1484.2300     32.2000      6.3600
+    706.3000   1484.2300     32.2000      6.3600
+    706.9000   1484.2200     32.2000      6.3500
+    707.5000   1484.2100     32.2000      6.3500
+    708.2000   1484.2000     32.2000      6.3400
+    708.8000   1484.2000     32.2000      6.3400
+    709.4000   1484.2000     32.2000      6.3400
+    710.0000   1484.2000     32.2000      6.3400
+    710.6000   1484.2100     32.2000      6.3400
+    711.3000   1484.2000     32.2000      6.3300
+    711.9000   1484.1800     32.2000      6.3200
+    712.5000   1484.1600     32.2000      6.3200
+    713.1000   1484.1600     32.2000      6.3100
+    713.7000   1484.1500     32.2000      6.3100
+    714.4000   1484.1300     32.2000      6.3000
+    715.0000   1484.1400     32.2000      6.3000
+    715.6000   1484.1600     32.2000      6.3000
+    716.2000   1484.1700     32.2000      6.3000
+    716.8000   1484.1800     32.2000      6.3000
+    717.5000   1484.1800     32.2000      6.3000
+    718.1000   1484.1700     32.2000      6.2900
+    718.7000   1484.1600     32.2000      6.2900
+    719.3000   1484.1500     32.2000      6.2900
+    719.9000   1484.1600     32.2000      6.2800
+    720.5000   1484.1800     32.2000      6.2900
+    721.2000   1484.1900     32.2000      6.2900
+    721.8000   1484.1900     32.2000      6.2900
+    722.4000   1484.2000     32.2000      6.2900
+    723.0000   1484.2100     32.2000      6.2800
+    723.6000   1484.2100     32.2000      6.2800
+    724.3000   1484.2100     32.2000      6.2800
+    724.9000   1484.2100     32.2000      6.2800
+    725.5000   1484.2200     32.2000      6.2800
+    726.1000   1484.2300     32.2000      6.2800
+    726.7000   1484.2200     32.2000      6.2700
+    727.4000   1484.2100     32.2000      6.2700
+    728.0000   1484.2100     32.2000      6.2600
+    728.6000   1484.2000     32.2000      6.2600
+    729.2000   1484.2000     32.2000      6.2600
+    729.8000   1484.2000     32.2000      6.2500
+    730.4000   1484.1900     32.2000      6.2500
+    731.1000   1484.1600     32.2000      6.2400
+    731.7000   1484.1400     32.2000      6.2300
+    732.3000   1484.1200     32.2000      6.2200
+    732.9000   1484.0900     32.2000      6.2100
+    733.5000   1484.0800     32.2000      6.2100
+    734.2000   1484.0700     32.2000      6.2000
+    734.8000   1484.0700     32.2000      6.2000
+    735.4000   1484.0700     32.2000      6.2000
+    736.0000   1484.0700     32.2000      6.2000
+    736.6000   1484.0700     32.2000      6.1900
+    737.2000   1484.0800     32.2000      6.1900
+    737.9000   1484.0800     32.2000      6.1900
+    738.5000   1484.0600     32.2000      6.1800
+    739.1000   1484.0500     32.2000      6.1800
+    739.7000   1484.0500     32.2000      6.1700
+    740.3000   1484.0400     32.2000      6.1700
+    740.9000   1484.0100     32.2000      6.1600
+    741.6000   1484.0000     32.2000      6.1500
+    742.2000   1483.9900     32.2000      6.1500
+    742.8000   1484.0000     32.2000      6.1500
+    743.4000   1484.0100     32.2000      6.1500
+    744.0000   1484.0100     32.2000      6.1500
+    744.6000   1484.0100     32.2000      6.1400
+    745.3000   1484.0100     32.2000      6.1400
+    745.9000   1484.0000     32.2000      6.1400
+    746.5000   1484.0000     32.2000      6.1300
+    747.1000   1483.9900     32.2000      6.1300
+    747.7000   1483.9900     32.2000      6.1300
+    748.3000   1483.9900     32.2000      6.1200
+    749.0000   1483.9800     32.2000      6.1200
+    749.6000   1483.9600     32.2000      6.1100
+    750.2000   1483.9400     32.2000      6.1000
+    750.8000   1483.9300     32.2000      6.1000
+    751.4000   1483.9300     32.2000      6.1000
+    752.0000   1483.9300     32.2000      6.0900
+    752.7000   1483.9300     32.2000      6.0900
+    753.3000   1483.9400     32.2000      6.0900
+    753.9000   1483.9400     32.2000      6.0900
+    754.5000   1483.9300     32.2000      6.0800
+    755.1000   1483.9300     32.2000      6.0800
+    755.7000   1483.9300     32.2000      6.0800
+    756.4000   1483.9300     32.2000      6.0800
+    757.0000   1483.9400     32.2000      6.0800
+    757.6000   1483.9500     32.2000      6.0800
+    758.2000   1483.9500     32.2000      6.0700
+    758.8000   1483.9400     32.2000      6.0700
+    759.4000   1483.9300     32.2000      6.0600
+    760.1000   1483.9300     32.2000      6.0600
@@ -0,0 +1,2084 @@
+test_read_store_and_write
+13/3/2016
+21:53:2
+Probe: MIDAS SVX2 6000
+Source: /root/package/data/input/valeport/midas/svx2/FILE1.000
+      1.0090   1537.0350     31.1325     27.8930
+      1.9920   1537.0380     31.1172     27.8940
+      3.0810   1537.0390     31.0860     27.9010
+      3.9960   1537.0530     31.0822     27.9020
+      5.1830   1537.0520     31.0600     27.9030
+      6.0600   1537.0650     31.0753     27.8950
+      6.9690   1537.0540     31.0593     27.8910
+      7.9880   1537.0570     31.0562     27.8860
+      9.0710   1537.0040     31.0326     27.8650
+     10.0390   1536.9110     30.9952     27.8340
+     10.9650   1536.7910     30.9769     27.7820
+     12.0100   1536.9300     31.2050     27.7290
+     13.0010   1536.9380     31.1310     27.7600
+     13.9400   1536.7010     31.1409     27.6430
+     15.1030   1536.7580     31.3431     27.5650
+     16.0450   1537.0680     31.7162     27.5210
+     17.0180   1537.3490     31.8893     27.5570
+     18.0270   1537.4680     31.8771     27.6080
+     18.9850   1537.8390     32.0297     27.6940
+     19.9620   1537.9740     32.0457     27.7390
+     20.9860   1538.3930     32.3196     27.7890
+     22.0390   1538.5220     32.3257     27.8360
+     22.9850   1538.7240     32.4341     27.8680
+     23.9980   1538.7600     32.3586     27.9120
+     24.9320   1538.9260     32.4692     27.9270
+     25.9290   1539.3860     32.7148     28.0100
+     27.0940   1539.4970     32.6996     28.0580
+     27.9160   1539.7840     32.8369     28.1160
+     29.0080   1540.0660     32.9697     28.1720
+     30.0010   1540.5780     33.2321     28.2710
+     30.9690   1540.7510     33.2184     28.3490
+     31.8760   1540.8920     33.2230     28.4040
+     32.8480   1540.9870     33.2077     28.4470
+     33.8850   1541.2910     33.3992     28.4860
+     34.9190   1541.3410     33.3908     28.5050
+     35.9690   1541.4030     33.4328     28.5050
+     36.8430   1541.4240     33.4824     28.4840
+     37.8090   1541.4310     33.5312     28.4560
+     38.9020   1541.3230     33.5274     28.4000
+     39.9150   1541.2770     33.5861     28.3430
+     40.9870   1541.0810     33.5312     28.2720
+     41.9000   1540.6970     33.4969     28.1070
+     42.7520   1540.8330     33.7257     28.0530
+     43.7920   1540.8220     33.7029     28.0510
+     44.7480   1540.7040     33.6761     28.0030
+     45.7530   1540.5130     33.6983     27.8990
+     46.8440   1540.2790     33.6700     27.7990
+     47.8400   1540.0710     33.6853     27.6910
+     48.9000   1539.5700     33.6700     27.4670
+     49.7750   1539.4260     33.8608     27.3070
+     50.7490   1539.0790     33.8287     27.1620
+     51.7490   1538.7480     33.8310     27.0080
+     52.7910   1538.5600     33.9729     26.8520
+     53.7900   1538.0520     33.8669     26.6730
+     54.8530   1537.5310     33.8623     26.4420
+     55.6810   1537.4340     34.0698     26.2990
+     56.8670   1536.9380     33.9516     26.1320
+     57.9290   1536.5860     33.9233     25.9870
+     58.7650   1535.9780     33.6678     25.8390
+     59.7440   1535.2810     33.9088     25.4300
+     60.7240   1534.8600     34.0645     25.1780
+     61.8150   1534.0130     33.8890     24.8980
+     62.7570   1533.7930     34.1301     24.6940
+     63.6290   1533.5340     34.1461     24.5750
+     64.8470   1532.6680     33.8730     24.3340
+     65.8540   1532.2550     34.1667     24.0320
+     66.6830   1531.8810     34.0294     23.9360
+     67.7410   1531.1470     33.9981     23.6490
+     68.8390   1531.0770     34.2896     23.4880
+     69.6860   1530.4610     34.0569     23.3390
+     70.6820   1530.1040     34.2178     23.1230
+     71.8110   1529.9890     34.3262     23.0240
+     72.7300   1529.5640     34.1293     22.9360
+     73.6440   1529.0490     34.2056     22.6970
+     74.6980   1528.6560     34.1446     22.5640
+     75.6950   1528.2350     34.3376     22.3140
+     76.6570   1528.1030     34.4971     22.1900
+     77.7470   1527.5050     34.3178     22.0300
+     78.6560   1527.0740     34.2812     21.8760
+     79.6280   1526.7550     34.3361     21.7260
+     80.6030   1526.4990     34.3277     21.6270
+     81.6190   1526.2860     34.4131     21.5050
+     82.5430   1526.2280     34.4833     21.4480
+     83.6100   1525.9860     34.4368     21.3700
+     84.5250   1525.6170     34.3513     21.2620
+     85.5350   1524.9010     34.2529     21.0300
+     86.6650   1524.6980     34.4749     20.8570
+     87.6800   1524.3280     34.3857     20.7510
+     88.5430   1523.8420     34.2171     20.6360
+     89.7950   1523.4200     34.3727     20.4110
+     90.5280   1523.3200     34.5131     20.3130
+     91.6150   1522.7590     34.2880     20.1940
+     92.4590   1522.3970     34.3529     20.0320
+     93.6400   1521.7870     34.2697     19.8390
+     94.6640   1521.2650     34.2224     19.6650
+     95.4370   1520.7980     34.2224     19.4940
+     96.5500   1520.6910     34.5551     19.3170
+     97.5070   1520.6080     34.5978     19.2650
+     98.7290   1520.2270     34.4093     19.1980
+     99.4590   1519.9350     34.4116     19.0900
+    100.4300   1519.7680     34.5222     18.9820
+    101.4850   1519.7510     34.6611     18.9150
+    102.5840   1519.6250     34.6344     18.8750
+    103.4970   1519.5070     34.6405     18.8260
+    104.6350   1519.0560     34.5184     18.7100
+    105.5590   1518.3530     34.2697     18.5580
+    106.4120   1518.1380     34.5070     18.3860
+    107.5690   1517.8850     34.5612     18.2710
+    108.4000   1517.4840     34.4742     18.1620
+    109.5360   1517.1730     34.5543     18.0180
+    110.4550   1516.6350     34.4849     17.8560
+    111.5400   1516.1610     34.4902     17.6870
+    112.3820   1515.7590     34.4986     17.5430
+    113.5560   1515.5000     34.5612     17.4250
+    114.3970   1515.3780     34.6031     17.3630
+    115.3670   1515.1290     34.5512     17.2940
+    116.5150   1514.9290     34.6230     17.1930
+    117.4840   1514.6630     34.5703     17.1190
+    118.3480   1514.6170     34.7321     17.0370
+    119.4140   1514.3370     34.6031     16.9870
+    120.3710   1514.1570     34.6680     16.8970
+    121.3280   1513.9300     34.6008     16.8420
+    122.3810   1513.7130     34.7122     16.7220
+    123.3900   1513.4760     34.6176     16.6740
+    124.4960   1513.2300     34.5932     16.5960
+    125.2690   1512.8740     34.5215     16.5020
+    126.5180   1512.5680     34.6527     16.3450
+    127.2710   1512.4790     34.7000     16.2940
+    128.2590   1512.3270     34.7107     16.2350
+    129.2450   1512.1820     34.7305     16.1750
+    130.4620   1511.9320     34.6634     16.1120
+    131.3790   1511.7900     34.6977     16.0480
+    132.2700   1511.4750     34.6283     15.9670
+    133.3820   1511.1140     34.5993     15.8550
+    134.2800   1511.0470     34.7031     15.7900
+    135.3580   1510.7520     34.6069     15.7250
+    136.2310   1510.6200     34.6817     15.6500
+    137.3960   1510.5560     34.7679     15.5910
+    138.2120   1510.3410     34.7160     15.5370
+    139.3170   1510.1620     34.6855     15.4850
+    140.3210   1510.0550     34.6863     15.4450
+    141.2240   1509.6980     34.5711     15.3690
+    142.3780   1509.4750     34.6786     15.2520
+    143.1990   1509.0360     34.5306     15.1630
+    144.1490   1508.9600     34.7603     15.0490
+    145.1490   1508.8480     34.7694     15.0050
+    146.2250   1508.6720     34.7633     14.9460
+    147.3340   1508.5110     34.7504     14.8940
+    148.2680   1508.4170     34.7519     14.8590
+    149.2550   1508.1750     34.7343     14.7840
+    150.2520   1508.1320     34.7900     14.7450
+    151.1310   1507.9960     34.7343     14.7180
+    152.3220   1507.5490     34.5917     14.6240
+    153.1920   1507.0830     34.4902     14.5110
+    154.0680   1506.9170     34.6542     14.3950
+    155.0680   1506.9190     34.7786     14.3450
+    156.3130   1506.8560     34.8007     14.3110
+    157.1410   1506.7910     34.8183     14.2800
+    158.1040   1506.6860     34.8030     14.2480
+    159.1790   1506.4210     34.7687     14.1730
+    160.2060   1506.3360     34.7694     14.1410
+    161.1410   1506.1610     34.7534     14.0880
+    162.1320   1506.0870     34.8000     14.0430
+    163.0280   1506.0280     34.8145     14.0150
+    164.0070   1505.9910     34.8137     13.9990
+    165.0210   1505.9680     34.8373     13.9780
+    166.1360   1505.8630     34.8404     13.9390
+    167.0300   1505.8040     34.8328     13.9190
+    168.0380   1505.6530     34.8114     13.8750
+    169.1600   1505.5230     34.7824     13.8400
+    170.0130   1505.4230     34.7961     13.8000
+    171.1250   1505.3770     34.8328     13.7670
+    172.0720   1505.3360     34.8480     13.7440
+    173.0110   1505.3080     34.8412     13.7330
+    173.9910   1505.2340     34.8343     13.7080
+    174.9510   1505.0570     34.7672     13.6730
+    176.2190   1504.6960     34.7183     13.5740
+    177.1440   1504.6720     34.8106     13.5290
+    178.0530   1504.5660     34.8190     13.4890
+    178.9270   1504.5210     34.8358     13.4650
+    179.9050   1504.3240     34.7496     13.4310
+    181.1080   1504.2230     34.7977     13.3770
+    182.1690   1503.9750     34.7549     13.3120
+    183.0380   1503.8800     34.7855     13.2680
+    183.9180   1503.6960     34.7763     13.2110
+    185.1840   1503.5840     34.8267     13.1530
+    185.9870   1503.5670     34.8488     13.1360
+    187.0450   1503.4680     34.8114     13.1140
+    187.8900   1503.3880     34.8358     13.0770
+    189.0530   1503.3600     34.8633     13.0530
+    190.0470   1503.2640     34.8328     13.0300
+    190.9550   1503.1780     34.8236     13.0030
+    191.8750   1503.1640     34.8602     12.9810
+    193.1410   1503.0200     34.8000     12.9530
+    193.9910   1503.0280     34.8595     12.9300
+    194.9220   1502.9040     34.8404     12.8950
+    195.9690   1502.9020     34.8770     12.8760
+    196.9300   1502.8990     34.8862     12.8670
+    197.9200   1502.9110     34.8938     12.8630
+    199.0350   1502.8400     34.8663     12.8460
+    199.9260   1502.8050     34.8557     12.8350
+    200.8750   1502.6120     34.8007     12.7920
+    201.9740   1502.4360     34.8206     12.7270
+    202.8570   1502.0970     34.7092     12.6610
+    203.8060   1502.0860     34.8396     12.6070
+    204.9410   1502.0250     34.8572     12.5770
+    205.8520   1502.0010     34.8808     12.5570
+    206.7280   1501.9820     34.8923     12.5430
+    207.8700   1501.9910     34.8923     12.5400
+    209.0270   1501.9800     34.8946     12.5300
+    209.7280   1501.9950     34.9144     12.5240
+    210.8570   1501.9890     34.9022     12.5210
+    211.9070   1501.9910     34.8892     12.5210
+    212.8200   1501.8760     34.8595     12.4930
+    214.0200   1501.8430     34.8686     12.4740
+    214.9580   1501.7500     34.8396     12.4520
+    216.1100   1501.7220     34.8709     12.4270
+    216.7940   1501.7120     34.8953     12.4120
+    217.7490   1501.6960     34.8854     12.4060
+    218.7760   1501.6780     34.8816     12.3970
+    219.8830   1501.6040     34.8694     12.3740
+    220.7020   1501.6050     34.8869     12.3640
+    221.7730   1501.5960     34.9075     12.3490
+    222.7110   1501.5960     34.9052     12.3450
+    223.7290   1501.5290     34.8724     12.3320
+    224.6550   1501.4290     34.8381     12.3100
+    225.6160   1501.3950     34.8694     12.2840
+    226.6010   1501.3800     34.8801     12.2710
+    227.8830   1501.3940     34.8999     12.2620
+    228.8560   1501.3210     34.8618     12.2490
+    229.8760   1501.3160     34.8946     12.2310
+    230.5880   1501.2830     34.8938     12.2180
+    231.7510   1501.2630     34.9068     12.2020
+    232.6140   1501.2460     34.8999     12.1950
+    233.6160   1501.2130     34.8755     12.1890
+    234.8930   1501.2120     34.9030     12.1730
+    235.7770   1501.2160     34.8969     12.1720
+    236.8790   1501.2020     34.8862     12.1660
+    237.5940   1501.1190     34.8579     12.1480
+    238.5470   1501.0870     34.8724     12.1290
+    239.8330   1501.0430     34.8770     12.1080
+    240.8960   1501.0280     34.8900     12.0940
+    241.5120   1501.0220     34.8938     12.0880
+    242.7690   1501.0340     34.9113     12.0790
+    243.5500   1500.9460     34.8701     12.0640
+    244.7530   1500.8660     34.8465     12.0430
+    245.5400   1500.8330     34.8930     12.0130
+    246.5150   1500.7090     34.8534     11.9860
+    247.5730   1500.6710     34.8839     11.9590
+    248.7260   1500.5070     34.8076     11.9320
+    249.6350   1500.4730     34.8442     11.9050
+    250.4660   1500.4440     34.8907     11.8760
+    251.5840   1500.4510     34.8930     11.8720
+    252.6630   1500.3880     34.8824     11.8520
+    253.5200   1500.3630     34.8808     11.8410
+    254.4140   1500.3570     34.9037     11.8270
+    255.4170   1500.3220     34.8892     11.8170
+    256.5040   1500.3280     34.9075     11.8070
+    257.5290   1500.2760     34.8877     11.7940
+    258.5010   1500.2580     34.9014     11.7790
+    259.4640   1500.2450     34.9030     11.7700
+    260.6770   1500.2640     34.9197     11.7640
+    261.6620   1500.2660     34.9190     11.7600
+    262.4660   1500.2480     34.8953     11.7590
+    263.6260   1500.2160     34.8961     11.7440
+    264.4730   1500.2230     34.9213     11.7330
+    265.3380   1500.2260     34.9144     11.7320
+    266.3350   1500.2080     34.9030     11.7260
+    267.5630   1500.2030     34.9106     11.7160
+    268.3170   1500.1370     34.8793     11.7040
+    269.3760   1500.0990     34.8793     11.6880
+    270.6140   1500.1130     34.9022     11.6780
+    271.2980   1500.1060     34.9068     11.6710
+    272.4550   1500.0060     34.8648     11.6510
+    273.3470   1499.9840     34.8801     11.6350
+    274.3980   1499.9570     34.8801     11.6220
+    275.3600   1499.9670     34.9068     11.6110
+    276.4670   1499.9530     34.8801     11.6110
+    277.4120   1499.9620     34.9060     11.6000
+    278.4440   1499.9740     34.9190     11.5940
+    279.3860   1499.9770     34.9167     11.5910
+    280.3720   1499.9160     34.8724     11.5840
+    281.2480   1499.8450     34.8648     11.5620
+    282.4400   1499.8350     34.8999     11.5410
+    283.3890   1499.8150     34.8991     11.5310
+    284.2610   1499.7930     34.8999     11.5200
+    285.3800   1499.8000     34.9022     11.5160
+    286.2280   1499.7710     34.8953     11.5060
+    287.4580   1499.7620     34.8991     11.4960
+    288.2860   1499.7350     34.8885     11.4880
+    289.4510   1499.7100     34.8915     11.4740
+    290.3020   1499.6940     34.8892     11.4660
+    291.1670   1499.6840     34.9068     11.4530
+    292.3120   1499.6820     34.9037     11.4480
+    293.2050   1499.6640     34.9022     11.4390
+    294.3390   1499.6740     34.9091     11.4340
+    295.1870   1499.6860     34.9243     11.4280
+    296.1910   1499.6950     34.9213     11.4270
+    297.1600   1499.7060     34.9113     11.4290
+    298.4020   1499.7160     34.9106     11.4260
+    299.3130   1499.7200     34.9159     11.4210
+    300.2720   1499.7040     34.8892     11.4210
+    301.1740   1499.7150     34.9030     11.4150
+    302.2730   1499.6870     34.8991     11.4030
+    303.1950   1499.6880     34.9014     11.3980
+    304.3430   1499.6790     34.8930     11.3930
+    305.1560   1499.6770     34.9289     11.3760
+    306.2450   1499.6850     34.9060     11.3810
+    307.1710   1499.6910     34.9243     11.3720
+    308.0790   1499.7010     34.9052     11.3770
+    309.0510   1499.6300     34.8679     11.3650
+    310.2710   1499.5890     34.8717     11.3460
+    311.1590   1499.4730     34.8267     11.3240
+    312.0940   1499.4630     34.8801     11.2980
+    313.3100   1499.4060     34.8564     11.2840
+    314.2200   1499.3970     34.8824     11.2680
+    315.1910   1499.4010     34.8900     11.2620
+    316.1730   1499.4060     34.9236     11.2470
+    317.2750   1499.3930     34.9037     11.2450
+    318.0290   1499.3720     34.8816     11.2430
+    319.1740   1499.2860     34.8724     11.2160
+    319.9850   1499.2610     34.8724     11.2050
+    321.1930   1499.2580     34.8877     11.1930
+    322.2020   1499.2270     34.8770     11.1830
+    323.1030   1499.2310     34.8824     11.1780
+    324.1870   1499.2120     34.8892     11.1650
+    325.0340   1499.1920     34.8808     11.1580
+    326.0080   1499.1860     34.8915     11.1480
+    326.9570   1499.1860     34.8961     11.1420
+    327.9330   1499.1530     34.8839     11.1320
+    329.0780   1499.1180     34.8824     11.1170
+    330.0130   1499.1260     34.8907     11.1120
+    330.9320   1499.1390     34.9060     11.1060
+    331.8960   1499.1540     34.9136     11.1030
+    332.9490   1499.1530     34.9075     11.1000
+    334.0320   1499.1560     34.9091     11.0950
+    334.8610   1499.1340     34.8885     11.0920
+    336.1660   1499.1250     34.8946     11.0810
+    337.0500   1499.0870     34.8625     11.0770
+    338.0900   1499.0730     34.8915     11.0580
+    338.9930   1499.0420     34.8679     11.0530
+    339.9200   1499.0030     34.8724     11.0360
+    341.1240   1498.9990     34.8900     11.0230
+    341.9410   1498.9790     34.8770     11.0180
+    342.8590   1498.9450     34.8763     11.0040
+    343.8990   1498.9170     34.8854     10.9880
+    344.9000   1498.8440     34.8724     10.9670
+    345.9040   1498.8460     34.8892     10.9570
+    346.8520   1498.8390     34.8846     10.9520
+    347.8250   1498.8010     34.8801     10.9380
+    348.7630   1498.8070     34.9045     10.9270
+    349.9280   1498.8120     34.8984     10.9250
+    350.8820   1498.8080     34.8877     10.9230
+    351.7400   1498.8100     34.9091     10.9120
+    352.9540   1498.8020     34.8862     10.9120
+    353.8510   1498.8060     34.8885     10.9080
+    354.7430   1498.8150     34.9014     10.9020
+    355.9790   1498.8230     34.9052     10.8970
+    356.9270   1498.8400     34.8999     10.8990
+    357.8330   1498.8400     34.8991     10.8950
+    358.7000   1498.8490     34.9091     10.8900
+    359.7670   1498.8550     34.8969     10.8910
+    360.8630   1498.8530     34.9007     10.8840
+    361.6880   1498.8120     34.8549     10.8840
+    362.6550   1498.7530     34.8656     10.8590
+    363.8070   1498.7610     34.8885     10.8480
+    364.9260   1498.7620     34.8938     10.8410
+    365.8270   1498.7660     34.8907     10.8390
+    366.7660   1498.7630     34.8900     10.8340
+    367.8740   1498.7280     34.8747     10.8240
+    368.8580   1498.7250     34.8846     10.8150
+    369.7110   1498.7400     34.8976     10.8110
+    370.6340   1498.7270     34.8770     10.8100
+    371.6420   1498.6870     34.8587     10.8000
+    372.7660   1498.6540     34.8717     10.7810
+    373.6060   1498.6470     34.8778     10.7730
+    374.8070   1498.5380     34.8465     10.7470
+    375.6100   1498.5520     34.8877     10.7330
+    376.7420   1498.5120     34.8656     10.7240
+    377.7700   1498.5250     34.8915     10.7140
+    378.6060   1498.5170     34.8785     10.7120
+    379.7610   1498.4980     34.8907     10.6970
+    380.7350   1498.4980     34.8862     10.6940
+    381.6260   1498.4880     34.8778     10.6900
+    382.6080   1498.4890     34.8938     10.6800
+    383.5740   1498.4940     34.8938     10.6770
+    384.5290   1498.4900     34.9037     10.6680
+    385.5510   1498.4700     34.8785     10.6660
+    386.5730   1498.4790     34.8892     10.6600
+    387.5040   1498.4920     34.8907     10.6590
+    388.7930   1498.5110     34.8969     10.6560
+    389.6650   1498.5200     34.8953     10.6550
+    390.8430   1498.5290     34.8923     10.6530
+    391.6650   1498.5290     34.8930     10.6490
+    392.6330   1498.5320     34.8846     10.6480
+    393.6780   1498.4970     34.8709     10.6380
+    394.4300   1498.4920     34.8740     10.6320
+    395.4580   1498.4880     34.8854     10.6220
+    396.4510   1498.4960     34.8930     10.6170
+    397.5250   1498.5010     34.8999     10.6110
+    398.7560   1498.4900     34.8915     10.6050
+    399.6640   1498.4760     34.8938     10.5960
+    400.5020   1498.4690     34.8854     10.5930
+    401.3940   1498.4790     34.9014     10.5860
+    402.3770   1498.4840     34.8862     10.5880
+    403.5930   1498.4660     34.8808     10.5790
+    404.3650   1498.4700     34.8885     10.5740
+    405.5660   1498.4800     34.8892     10.5710
+    406.3360   1498.4780     34.8915     10.5660
+    407.5660   1498.4840     34.8877     10.5630
+    408.3380   1498.4890     34.8671     10.5680
+    409.6040   1498.4920     34.8900     10.5550
+    410.3670   1498.5010     34.8900     10.5540
+    411.3850   1498.4870     34.8785     10.5490
+    412.2950   1498.4710     34.8770     10.5410
+    413.5900   1498.4650     34.8770     10.5330
+    414.3620   1498.4180     34.8541     10.5240
+    415.4170   1498.4140     34.8770     10.5100
+    416.3610   1498.3780     34.8434     10.5070
+    417.5570   1498.3650     34.8572     10.4930
+    418.4510   1498.3420     34.8579     10.4820
+    419.3980   1498.3100     34.8625     10.4670
+    420.3350   1498.2990     34.8701     10.4570
+    421.3430   1498.3030     34.8831     10.4490
+    422.4620   1498.2680     34.8625     10.4410
+    423.4830   1498.2660     34.8755     10.4310
+    424.2710   1498.2620     34.8763     10.4260
+    425.3210   1498.2310     34.8602     10.4180
+    426.2340   1498.2320     34.8770     10.4080
+    427.2900   1498.2030     34.8595     10.4010
+    428.2570   1498.2010     34.8709     10.3920
+    429.1840   1498.2140     34.8839     10.3870
+    430.2640   1498.2250     34.8839     10.3850
+    431.2310   1498.2440     34.8923     10.3830
+    432.4320   1498.2480     34.8877     10.3800
+    433.2930   1498.2050     34.8663     10.3710
+    434.2400   1498.1890     34.8816     10.3570
+    435.2680   1498.1480     34.8511     10.3510
+    436.1810   1498.1530     34.8694     10.3420
+    437.3190   1498.0710     34.8274     10.3280
+    438.2540   1498.0730     34.8663     10.3110
+    439.3730   1498.0620     34.8679     10.3020
+    440.3950   1498.0650     34.8770     10.2950
+    441.3600   1498.0320     34.8717     10.2830
+    442.1330   1498.0410     34.8686     10.2830
+    443.2440   1498.0410     34.8709     10.2770
+    444.2370   1498.0430     34.8709     10.2730
+    445.2500   1498.0190     34.8549     10.2670
+    446.1420   1497.9950     34.8518     10.2570
+    447.1630   1497.9940     34.8785     10.2430
+    448.0580   1498.0060     34.8785     10.2420
+    449.1440   1498.0040     34.8740     10.2380
+    450.1190   1498.0180     34.8755     10.2370
+    451.1210   1498.0260     34.8801     10.2330
+    451.9970   1498.0130     34.8717     10.2280
+    452.9890   1497.9670     34.8442     10.2200
+    454.0370   1497.9350     34.8473     10.2050
+    455.2750   1497.9300     34.8587     10.1940
+    456.1120   1497.9450     34.8709     10.1900
+    457.2710   1497.9500     34.8770     10.1840
+    458.1530   1497.9580     34.8831     10.1800
+    459.0270   1497.9640     34.8763     10.1800
+    460.0430   1497.9730     34.8755     10.1780
+    460.9350   1497.9820     34.8740     10.1770
+    462.0280   1497.9970     34.8885     10.1710
+    462.9320   1498.0000     34.8785     10.1710
+    464.0460   1497.9920     34.8747     10.1650
+    465.0740   1497.9850     34.8663     10.1610
+    466.1110   1497.9800     34.8625     10.1560
+    467.0100   1497.9840     34.8770     10.1480
+    468.1730   1497.9690     34.8671     10.1420
+    469.0910   1497.9790     34.8740     10.1380
+    469.8720   1497.9700     34.8564     10.1380
+    471.0780   1497.9750     34.8671     10.1300
+    471.9420   1497.9760     34.8709     10.1250
+    473.1170   1497.9790     34.8717     10.1200
+    473.8670   1497.9880     34.8663     10.1210
+    474.9630   1497.9940     34.8709     10.1160
+    475.9290   1497.9870     34.8724     10.1090
+    477.0830   1497.9750     34.8671     10.1020
+    477.8280   1497.9790     34.8694     10.0990
+    478.9000   1497.9690     34.8724     10.0900
+    480.0140   1497.9810     34.8671     10.0900
+    480.8340   1497.9920     34.8801     10.0850
+    481.8850   1497.9910     34.8763     10.0810
+    482.8630   1497.9950     34.8663     10.0810
+    483.8900   1498.0070     34.8770     10.0760
+    484.9120   1498.0190     34.8724     10.0760
+    485.7820   1498.0210     34.8625     10.0760
+    486.7330   1498.0090     34.8602     10.0690
+    487.8420   1498.0100     34.8755     10.0590
+    488.9480   1498.0070     34.8610     10.0580
+    489.9630   1498.0150     34.8534     10.0580
+    490.9320   1497.9560     34.8244     10.0470
+    491.7170   1497.9430     34.8495     10.0310
+    492.8610   1497.9190     34.8381     10.0230
+    493.8040   1497.8850     34.8389     10.0090
+    494.7130   1497.8720     34.8450      9.9990
+    495.7940   1497.8550     34.8541      9.9860
+    496.7010   1497.7810     34.8198      9.9730
+    497.8400   1497.7340     34.8450      9.9460
+    498.6860   1497.7250     34.8473      9.9390
+    499.6610   1497.6970     34.8282      9.9330
+    500.8180   1497.6800     34.8488      9.9160
+    501.9060   1497.6330     34.8396      9.9010
+    502.8100   1497.6040     34.8366      9.8900
+    503.7050   1497.5590     34.8259      9.8770
+    504.7280   1497.5340     34.8206      9.8670
+    505.6960   1497.5140     34.8412      9.8500
+    506.5990   1497.5280     34.8671      9.8410
+    507.7750   1497.5190     34.8701      9.8320
+    508.6370   1497.5180     34.8549      9.8330
+    509.7340   1497.4870     34.8412      9.8240
+    510.5600   1497.4920     34.8511      9.8180
+    511.6210   1497.4890     34.8610      9.8090
+    512.5820   1497.4930     34.8572      9.8070
+    513.6910   1497.4730     34.8495      9.7990
+    514.6670   1497.4610     34.8526      9.7900
+    515.7230   1497.4720     34.8564      9.7870
+    516.5990   1497.4800     34.8595      9.7840
+    517.5620   1497.4730     34.8434      9.7830
+    518.5980   1497.4740     34.8633      9.7720
+    519.7810   1497.4810     34.8671      9.7670
+    520.5500   1497.4310     34.8190      9.7660
+    521.7270   1497.3950     34.8267      9.7480
+    522.4920   1497.3620     34.8305      9.7340
+    523.7130   1497.3360     34.8427      9.7170
+    524.7090   1497.3310     34.8404      9.7120
+    525.6190   1497.3260     34.8412      9.7060
+    526.4200   1497.3040     34.8335      9.6990
+    527.5640   1497.3150     34.8442      9.6930
+    528.4470   1497.3110     34.8526      9.6850
+    529.3990   1497.3160     34.8557      9.6810
+    530.5020   1497.2570     34.8160      9.6730
+    531.4190   1497.2590     34.8351      9.6630
+    532.5840   1497.2720     34.8503      9.6560
+    533.4280   1497.2780     34.8526      9.6530
+    534.5390   1497.2780     34.8434      9.6510
+    535.6600   1497.2930     34.8526      9.6470
+    536.5770   1497.3000     34.8602      9.6420
+    537.6510   1497.3000     34.8396      9.6440
+    538.3290   1497.2930     34.8427      9.6380
+    539.4640   1497.2910     34.8518      9.6290
+    540.3330   1497.3060     34.8640      9.6250
+    541.5360   1497.3090     34.8419      9.6280
+    542.3300   1497.3200     34.8488      9.6250
+    543.4550   1497.2930     34.8351      9.6170
+    544.3010   1497.2690     34.8335      9.6070
+    545.2940   1497.2590     34.8381      9.5980
+    546.4030   1497.2610     34.8396      9.5930
+    547.3210   1497.2600     34.8473      9.5860
+    548.2490   1497.2560     34.8488      9.5800
+    549.4770   1497.2590     34.8404      9.5780
+    550.4200   1497.2540     34.8267      9.5770
+    551.4270   1497.2580     34.8343      9.5710
+    552.3460   1497.2540     34.8389      9.5640
+    553.5360   1497.2350     34.8373      9.5540
+    554.3350   1497.2230     34.8312      9.5490
+    555.2570   1497.2030     34.8259      9.5410
+    556.2560   1497.1870     34.8320      9.5300
+    557.2170   1497.1050     34.7847      9.5190
+    558.3630   1497.0740     34.8183      9.4940
+    559.4980   1497.0180     34.7954      9.4810
+    560.3780   1497.0130     34.8244      9.4660
+    561.2090   1497.0210     34.8343      9.4610
+    562.1700   1496.9870     34.8145      9.4540
+    563.4880   1496.9830     34.8343      9.4400
+    564.2360   1496.9760     34.8305      9.4360
+    565.1120   1496.9720     34.8389      9.4280
+    566.1950   1496.9630     34.8228      9.4260
+    567.1130   1496.9600     34.8442      9.4140
+    568.1670   1496.9570     34.8297      9.4130
+    569.0910   1496.9540     34.8450      9.4030
+    570.1540   1496.9580     34.8366      9.4020
+    571.0810   1496.9610     34.8381      9.3980
+    572.1500   1496.9710     34.8412      9.3950
+    573.0780   1496.9660     34.8274      9.3940
+    574.0570   1496.9660     34.8312      9.3880
+    575.1520   1496.9630     34.8381      9.3800
+    576.0340   1496.9340     34.8351      9.3690
+    577.2370   1496.9470     34.8534      9.3610
+    578.0290   1496.9360     34.8305      9.3620
+    579.0370   1496.9320     34.8312      9.3560
+    580.1280   1496.9430     34.8404      9.3510
+    581.0230   1496.9430     34.8343      9.3490
+    582.0260   1496.9260     34.8190      9.3450
+    583.0330   1496.9360     34.8366      9.3370
+    584.0340   1496.9330     34.8328      9.3330
+    585.0880   1496.9140     34.8236      9.3260
+    586.1240   1496.9100     34.8183      9.3220
+    587.0860   1496.8840     34.8289      9.3070
+    588.0860   1496.8740     34.8282      9.3000
+    589.0670   1496.8540     34.8129      9.2950
+    590.1560   1496.8470     34.8137      9.2880
+    591.1810   1496.8370     34.8122      9.2810
+    591.9670   1496.8200     34.8297      9.2670
+    593.1130   1496.8270     34.8312      9.2630
+    594.1270   1496.8230     34.8175      9.2620
+    595.0930   1496.8020     34.8228      9.2500
+    595.9070   1496.7850     34.8129      9.2450
+    596.8520   1496.7840     34.8320      9.2340
+    597.9680   1496.7960     34.8267      9.2340
+    599.1060   1496.7880     34.8228      9.2280
+    600.0430   1496.7850     34.8167      9.2250
+    601.0530   1496.7690     34.8167      9.2160
+    601.8930   1496.7670     34.8190      9.2110
+    602.8160   1496.7670     34.8213      9.2060
+    603.8660   1496.7760     34.8320      9.2000
+    604.8020   1496.7840     34.8289      9.1990
+    605.7930   1496.7780     34.8221      9.1950
+    606.8690   1496.7090     34.7908      9.1820
+    607.8190   1496.6910     34.8198      9.1630
+    608.9660   1496.7030     34.8228      9.1600
+    609.9770   1496.7120     34.8221      9.1580
+    610.7410   1496.6980     34.8007      9.1580
+    611.7940   1496.6450     34.7939      9.1410
+    612.9290   1496.6590     34.8289      9.1280
+    613.8550   1496.6680     34.8358      9.1240
+    614.8570   1496.6720     34.8190      9.1260
+    615.7360   1496.6590     34.8053      9.1230
+    616.9420   1496.6440     34.8068      9.1130
+    617.8320   1496.6320     34.8122      9.1040
+    618.7230   1496.6240     34.8175      9.0960
+    619.8440   1496.6310     34.8106      9.0950
+    620.8570   1496.6020     34.8061      9.0840
+    621.6890   1496.5700     34.8053      9.0720
+    622.6810   1496.5590     34.8068      9.0640
+    623.7770   1496.5680     34.8167      9.0580
+    624.7230   1496.5890     34.8297      9.0550
+    625.6220   1496.5970     34.8244      9.0550
+    626.7290   1496.6190     34.8358      9.0520
+    627.7030   1496.6270     34.8206      9.0550
+    628.9040   1496.5810     34.7939      9.0460
+    629.8370   1496.5750     34.7946      9.0400
+    630.8320   1496.5810     34.8183      9.0290
+    631.6570   1496.5950     34.8244      9.0270
+    632.6680   1496.5940     34.8099      9.0270
+    633.7340   1496.6030     34.8183      9.0220
+    634.6680   1496.6140     34.8206      9.0200
+    635.5420   1496.6220     34.8297      9.0150
+    636.5890   1496.6360     34.8358      9.0120
+    637.8440   1496.6430     34.8213      9.0130
+    638.6400   1496.6480     34.8145      9.0130
+    639.8200   1496.6150     34.8106      9.0000
+    640.7800   1496.6090     34.8083      8.9950
+    641.7310   1496.6160     34.8221      8.9880
+    642.6920   1496.5580     34.7771      8.9830
+    643.6140   1496.5520     34.8015      8.9690
+    644.4910   1496.5620     34.8183      8.9620
+    645.5010   1496.5470     34.8015      8.9590
+    646.6810   1496.5430     34.8000      8.9530
+    647.5160   1496.5430     34.8099      8.9460
+    648.6330   1496.5540     34.8244      8.9390
+    649.4770   1496.5590     34.8206      8.9380
+    650.4790   1496.5560     34.8129      8.9350
+    651.6730   1496.5590     34.8022      8.9340
+    652.4250   1496.5540     34.8000      8.9300
+    653.5310   1496.5540     34.8000      8.9250
+    654.5490   1496.5330     34.8022      8.9140
+    655.5230   1496.5410     34.8045      8.9110
+    656.5300   1496.5390     34.8137      8.9030
+    657.5250   1496.5180     34.7885      8.9010
+    658.4250   1496.5220     34.8129      8.8900
+    659.5050   1496.5150     34.8015      8.8870
+    660.4010   1496.5050     34.7992      8.8810
+    661.4630   1496.5140     34.8076      8.8760
+    662.3110   1496.5100     34.7954      8.8750
+    663.4800   1496.4930     34.7992      8.8640
+    664.5700   1496.4570     34.7794      8.8560
+    665.4370   1496.4310     34.7733      8.8470
+    666.5390   1496.4320     34.7893      8.8370
+    667.4620   1496.4250     34.7885      8.8310
+    668.5800   1496.4330     34.7954      8.8260
+    669.4520   1496.4110     34.7839      8.8200
+    670.2420   1496.4000     34.7969      8.8090
+    671.5380   1496.3720     34.7961      8.7960
+    672.2610   1496.3160     34.7649      8.7880
+    673.2340   1496.3220     34.7893      8.7770
+    674.2480   1496.3180     34.7878      8.7720
+    675.3300   1496.3000     34.8030      8.7570
+    676.3130   1496.2700     34.7687      8.7560
+    677.1950   1496.2320     34.7771      8.7390
+    678.4170   1496.2170     34.7816      8.7280
+    679.2900   1496.1780     34.7740      8.7160
+    680.1890   1496.1630     34.7740      8.7080
+    681.3300   1496.1110     34.7679      8.6910
+    682.1430   1496.0920     34.7717      8.6810
+    683.3460   1496.0460     34.7633      8.6660
+    684.1620   1496.0520     34.7900      8.6550
+    685.3390   1495.9800     34.7610      8.6400
+    686.1980   1495.9860     34.7900      8.6280
+    687.1870   1495.9730     34.7786      8.6240
+    688.2600   1495.9580     34.7847      8.6130
+    689.1300   1495.9560     34.7923      8.6060
+    690.1920   1495.9590     34.7900      8.6030
+    691.2680   1495.9250     34.7870      8.5900
+    692.1630   1495.9200     34.7946      8.5820
+    693.2430   1495.9120     34.7771      8.5810
+    694.0850   1495.9010     34.7870      8.5710
+    695.0670   1495.9170     34.7893      8.5700
+    696.0390   1495.9140     34.7946      8.5630
+    697.0140   1495.9250     34.7878      8.5640
+    698.0500   1495.9080     34.7809      8.5570
+    699.0450   1495.8630     34.7763      8.5420
+    699.9960   1495.8270     34.7496      8.5370
+    701.1530   1495.7610     34.7557      8.5120
+    702.0610   1495.7400     34.7656      8.4990
+    703.0660   1495.7430     34.7816      8.4900
+    704.0160   1495.7250     34.7755      8.4830
+    705.2450   1495.7460     34.7916      8.4780
+    706.0700   1495.7330     34.7755      8.4760
+    706.9430   1495.7290     34.7847      8.4680
+    707.9930   1495.7200     34.7633      8.4680
+    708.9270   1495.7190     34.7893      8.4550
+    710.1440   1495.7150     34.7755      8.4530
+    710.9020   1495.7230     34.7900      8.4470
+    711.9800   1495.7320     34.7855      8.4460
+    712.9210   1495.7150     34.7771      8.4400
+    713.9360   1495.7030     34.7656      8.4360
+    714.8710   1495.7050     34.7702      8.4310
+    716.2090   1495.7080     34.7664      8.4270
+    717.0400   1495.7240     34.7923      8.4190
+    717.8850   1495.7230     34.7862      8.4170
+    719.0050   1495.7280     34.7748      8.4170
+    720.0540   1495.7340     34.7778      8.4130
+    720.9050   1495.7400     34.7801      8.4100
+    721.9770   1495.7300     34.7702      8.4060
+    723.0000   1495.7380     34.7809      8.4000
+    723.8060   1495.7280     34.7740      8.3960
+    724.9040   1495.7360     34.7809      8.3910
+    725.7740   1495.7000     34.7488      8.3880
+    726.8180   1495.7010     34.7809      8.3730
+    727.8900   1495.6760     34.7672      8.3660
+    728.9430   1495.6750     34.7672      8.3610
+    729.9870   1495.6690     34.7725      8.3530
+    730.9190   1495.6480     34.7641      8.3460
+    731.8810   1495.6330     34.7603      8.3390
+    732.7890   1495.5910     34.7450      8.3290
+    733.7600   1495.5630     34.7450      8.3170
+    734.7760   1495.5490     34.7534      8.3060
+    735.7340   1495.5430     34.7694      8.2950
+    736.7830   1495.5450     34.7839      8.2860
+    737.8930   1495.5090     34.7610      8.2790
+    738.7200   1495.5170     34.7595      8.2780
+    739.8430   1495.5230     34.7794      8.2680
+    740.6550   1495.5310     34.7809      8.2660
+    741.6680   1495.5070     34.7633      8.2610
+    742.8870   1495.5210     34.7672      8.2580
+    743.8640   1495.4940     34.7443      8.2540
+    744.8070   1495.4840     34.7534      8.2440
+    745.7150   1495.4870     34.7618      8.2380
+    746.8410   1495.5010     34.7794      8.2310
+    747.6240   1495.5110     34.7740      8.2320
+    748.6280   1495.5230     34.7702      8.2320
+    749.7900   1495.5270     34.7786      8.2250
+    750.6390   1495.5310     34.7763      8.2230
+    751.8280   1495.5090     34.7580      8.2180
+    752.6630   1495.5250     34.7626      8.2170
+    753.5540   1495.5140     34.7450      8.2160
+    754.7930   1495.4910     34.7488      8.2030
+    755.5580   1495.4820     34.7557      8.1950
+    756.7510   1495.4970     34.7702      8.1890
+    757.5230   1495.4940     34.7603      8.1880
+    758.5230   1495.4750     34.7404      8.1850
+    759.5740   1495.4620     34.7466      8.1750
+    760.5050   1495.4640     34.7656      8.1650
+    761.4750   1495.4660     34.7633      8.1620
+    762.5230   1495.4590     34.7527      8.1590
+    763.5920   1495.4370     34.7481      8.1500
+    764.4730   1495.4340     34.7519      8.1440
+    765.6630   1495.4420     34.7755      8.1330
+    766.5290   1495.4470     34.7618      8.1350
+    767.5450   1495.4480     34.7580      8.1320
+    768.4670   1495.4610     34.7771      8.1250
+    769.5460   1495.4740     34.7702      8.1260
+    770.4200   1495.4810     34.7641      8.1260
+    771.4120   1495.4840     34.7679      8.1210
+    772.5440   1495.4900     34.7580      8.1210
+    773.4520   1495.4710     34.7427      8.1170
+    774.3860   1495.4700     34.7565      8.1080
+    775.6220   1495.4620     34.7488      8.1030
+    776.3680   1495.4680     34.7588      8.0980
+    777.3330   1495.4440     34.7351      8.0950
+    778.3760   1495.4140     34.7549      8.0760
+    779.4110   1495.3770     34.7321      8.0690
+    780.3650   1495.3780     34.7389      8.0630
+    781.3940   1495.3860     34.7649      8.0520
+    782.3960   1495.3890     34.7534      8.0520
+    783.3370   1495.3890     34.7618      8.0450
+    784.3760   1495.3670     34.7397      8.0420
+    785.2890   1495.3720     34.7466      8.0370
+    786.2940   1495.3800     34.7664      8.0280
+    787.3880   1495.3970     34.7626      8.0290
+    788.3530   1495.4130     34.7626      8.0290
+    789.3160   1495.4260     34.7664      8.0270
+    790.4740   1495.4400     34.7618      8.0270
+    791.3570   1495.4490     34.7542      8.0280
+    792.1990   1495.4610     34.7527      8.0280
+    793.1780   1495.4540     34.7549      8.0210
+    794.3580   1495.4480     34.7404      8.0190
+    795.4100   1495.4550     34.7496      8.0130
+    796.2540   1495.4520     34.7511      8.0080
+    797.2140   1495.4410     34.7511      8.0010
+    798.2890   1495.4260     34.7397      7.9960
+    799.2770   1495.4360     34.7649      7.9860
+    800.1610   1495.4460     34.7488      7.9900
+    801.1310   1495.4380     34.7565      7.9810
+    802.0930   1495.4370     34.7610      7.9750
+    803.0860   1495.4420     34.7519      7.9750
+    804.0870   1495.4390     34.7542      7.9690
+    805.1910   1495.4580     34.7633      7.9660
+    806.2010   1495.4500     34.7527      7.9630
+    807.1960   1495.4540     34.7427      7.9630
+    808.0680   1495.4580     34.7496      7.9580
+    809.1290   1495.4590     34.7603      7.9500
+    810.1430   1495.4610     34.7481      7.9500
+    811.1250   1495.4600     34.7588      7.9420
+    812.0780   1495.4510     34.7443      7.9400
+    813.1190   1495.4480     34.7496      7.9330
+    814.0840   1495.4340     34.7343      7.9300
+    815.2220   1495.4360     34.7481      7.9210
+    815.9930   1495.4400     34.7565      7.9160
+    816.9780   1495.4490     34.7504      7.9160
+    818.0520   1495.4460     34.7610      7.9070
+    819.0190   1495.4090     34.7275      7.9040
+    820.0990   1495.4090     34.7458      7.8930
+    821.0120   1495.4130     34.7488      7.8890
+    821.9700   1495.4260     34.7496      7.8880
+    823.2220   1495.4250     34.7382      7.8860
+    823.9520   1495.4210     34.7496      7.8780
+    825.1840   1495.4330     34.7458      7.8770
+    825.8820   1495.4340     34.7496      7.8730
+    826.9780   1495.4350     34.7473      7.8690
+    828.0570   1495.4390     34.7427      7.8670
+    828.8660   1495.4390     34.7343      7.8660
+    830.0110   1495.4490     34.7427      7.8610
+    830.8780   1495.4630     34.7511      7.8580
+    831.9590   1495.4780     34.7519      7.8570
+    832.8500   1495.4850     34.7694      7.8490
+    833.8640   1495.4980     34.7450      7.8560
+    834.8300   1495.5130     34.7595      7.8510
+    835.7960   1495.5200     34.7549      7.8500
+    836.7830   1495.5220     34.7466      7.8490
+    837.8900   1495.5310     34.7389      7.8490
+    838.8010   1495.5460     34.7450      7.8470
+    839.9470   1495.5630     34.7488      7.8450
+    840.8590   1495.5690     34.7328      7.8480
+    842.0190   1495.5850     34.7481      7.8420
+    842.8680   1495.5950     34.7481      7.8410
+    843.9030   1495.5990     34.7404      7.8400
+    844.7220   1495.6030     34.7443      7.8360
+    845.8520   1495.6060     34.7321      7.8360
+    846.6850   1495.6080     34.7466      7.8280
+    847.7860   1495.6040     34.7282      7.8280
+    848.7380   1495.6100     34.7359      7.8230
+    849.8110   1495.6190     34.7374      7.8200
+    850.7980   1495.6240     34.7374      7.8170
+    851.6490   1495.6210     34.7481      7.8090
+    852.6980   1495.6290     34.7374      7.8100
+    853.7550   1495.6310     34.7282      7.8090
+    854.6670   1495.6360     34.7412      7.8020
+    855.8160   1495.6440     34.7351      7.8010
+    856.6030   1495.6490     34.7404      7.7970
+    857.8790   1495.6580     34.7214      7.8000
+    858.6660   1495.6610     34.7229      7.7970
+    859.7020   1495.6620     34.7397      7.7870
+    860.6350   1495.6610     34.7328      7.7850
+    861.5940   1495.6590     34.7214      7.7840
+    862.7710   1495.6440     34.7267      7.7730
+    863.5570   1495.6200     34.7183      7.7660
+    864.5990   1495.6230     34.7343      7.7570
+    865.5810   1495.6140     34.7321      7.7510
+    866.5910   1495.5990     34.7343      7.7420
+    867.6470   1495.6100     34.7443      7.7370
+    868.5160   1495.6180     34.7176      7.7440
+    869.5960   1495.6330     34.7397      7.7360
+    870.6390   1495.6450     34.7321      7.7370
+    871.4580   1495.6390     34.7343      7.7310
+    872.5180   1495.6370     34.7366      7.7250
+    873.5050   1495.6150     34.7183      7.7210
+    874.6280   1495.5940     34.7229      7.7090
+    875.4500   1495.5730     34.7260      7.6990
+    876.5540   1495.5660     34.7450      7.6860
+    877.5520   1495.5550     34.7290      7.6840
+    878.3920   1495.5030     34.7099      7.6730
+    879.4170   1495.4530     34.6954      7.6600
+    880.4640   1495.4550     34.7198      7.6480
+    881.3950   1495.4390     34.7130      7.6420
+    882.4320   1495.4440     34.7214      7.6360
+    883.4520   1495.4480     34.7321      7.6290
+    884.3560   1495.4170     34.7198      7.6210
+    885.4870   1495.3500     34.6970      7.6060
+    886.5110   1495.3660     34.7351      7.5930
+    887.6060   1495.3550     34.7214      7.5900
+    888.3740   1495.3690     34.7252      7.5890
+    889.4360   1495.3820     34.7366      7.5840
+    890.4920   1495.3860     34.7229      7.5850
+    891.3750   1495.3860     34.7321      7.5780
+    892.3160   1495.3870     34.7267      7.5760
+    893.2670   1495.3870     34.7198      7.5740
+    894.2670   1495.3830     34.7244      7.5670
+    895.3700   1495.3720     34.7099      7.5640
+    896.3350   1495.3520     34.7000      7.5580
+    897.2340   1495.3070     34.6855      7.5470
+    898.4900   1495.3040     34.7153      7.5310
+    899.3990   1495.2810     34.7061      7.5240
+    900.2810   1495.2800     34.7145      7.5170
+    901.4010   1495.2870     34.7206      7.5120
+    902.2700   1495.2920     34.7374      7.5040
+    903.3100   1495.2790     34.6977      7.5090
+    904.3630   1495.2380     34.6970      7.4940
+    905.1630   1495.1990     34.6916      7.4820
+    906.2850   1495.2090     34.7153      7.4720
+    907.2050   1495.1900     34.6939      7.4700
+    908.3280   1495.1910     34.7076      7.4610
+    909.2580   1495.1990     34.7229      7.4540
+    910.1910   1495.1940     34.7061      7.4540
+    911.2460   1495.1860     34.7069      7.4470
+    912.1370   1495.1720     34.7054      7.4400
+    913.2490   1495.1540     34.6977      7.4330
+    914.4210   1495.1260     34.7023      7.4190
+    915.1820   1495.1160     34.7092      7.4110
+    916.0900   1495.1020     34.7008      7.4060
+    917.1100   1495.0950     34.7122      7.3960
+    918.1550   1495.0950     34.7168      7.3900
+    919.2840   1495.0930     34.7122      7.3860
+    920.1470   1495.0290     34.6619      7.3820
+    921.1500   1495.0300     34.6954      7.3670
+    922.0780   1495.0190     34.6863      7.3630
+    923.0660   1494.9890     34.6832      7.3520
+    924.0610   1495.0100     34.7229      7.3400
+    925.1420   1494.9940     34.6992      7.3390
+    926.0720   1494.9930     34.7130      7.3300
+    926.9410   1494.9860     34.7054      7.3270
+    928.0400   1494.9440     34.7031      7.3120
+    928.9190   1494.9290     34.6886      7.3090
+    930.1830   1494.9170     34.7145      7.2920
+    930.9830   1494.9330     34.7382      7.2850
+    932.0490   1494.9410     34.7206      7.2880
+    933.0220   1494.8990     34.6802      7.2860
+    934.0300   1494.8760     34.6947      7.2710
+    934.9530   1494.8750     34.7031      7.2640
+    935.9910   1494.8890     34.7038      7.2630
+    936.8720   1494.8820     34.7046      7.2570
+    937.9180   1494.8930     34.7145      7.2520
+    939.0190   1494.9020     34.7008      7.2540
+    939.8840   1494.9040     34.7061      7.2490
+    940.8700   1494.9130     34.7099      7.2460
+    941.7930   1494.9120     34.7023      7.2440
+    942.8270   1494.8650     34.6977      7.2290
+    943.8250   1494.8590     34.7221      7.2150
+    944.8050   1494.8040     34.6931      7.2060
+    945.7850   1494.8020     34.7000      7.1990
+    946.7780   1494.7900     34.6954      7.1930
+    947.8970   1494.7600     34.6878      7.1830
+    948.7680   1494.7300     34.6886      7.1710
+    949.7800   1494.7280     34.6924      7.1650
+    950.8560   1494.7460     34.6924      7.1650
+    951.7350   1494.7530     34.7076      7.1580
+    952.7300   1494.7390     34.6985      7.1530
+    953.8580   1494.7350     34.7015      7.1460
+    954.8840   1494.7350     34.6970      7.1430
+    955.7980   1494.7300     34.6931      7.1390
+    956.8790   1494.7030     34.6825      7.1310
+    957.6470   1494.6930     34.6825      7.1250
+    958.8600   1494.6440     34.6642      7.1130
+    959.8550   1494.6120     34.6718      7.0980
+    960.6810   1494.6010     34.6764      7.0900
+    961.6080   1494.5710     34.6832      7.0760
+    962.7010   1494.5750     34.6901      7.0700
+    963.5920   1494.5800     34.7069      7.0620
+    964.6640   1494.5920     34.7023      7.0620
+    965.7240   1494.5740     34.6924      7.0560
+    966.6420   1494.5340     34.6703      7.0490
+    967.6510   1494.5290     34.6832      7.0390
+    968.6210   1494.5290     34.6886      7.0330
+    969.5450   1494.4820     34.6542      7.0280
+    970.5870   1494.4570     34.6764      7.0100
+    971.5460   1494.4290     34.6809      6.9970
+    972.5480   1494.4380     34.6748      6.9970
+    973.6310   1494.4180     34.6848      6.9840
+    974.6130   1494.4120     34.6703      6.9830
+    975.5620   1494.3940     34.6771      6.9720
+    976.5060   1494.3830     34.6893      6.9610
+    977.6150   1494.3940     34.6863      6.9600
+    978.5210   1494.3990     34.6939      6.9550
+    979.4660   1494.3880     34.6878      6.9500
+    980.4230   1494.3750     34.6680      6.9490
+    981.4880   1494.3630     34.6878      6.9350
+    982.5590   1494.3730     34.6809      6.9350
+    983.6360   1494.3600     34.6779      6.9280
+    984.4520   1494.3570     34.6802      6.9230
+    985.5020   1494.3490     34.6725      6.9190
+    986.3820   1494.2960     34.6527      6.9080
+    987.4750   1494.3010     34.6725      6.8980
+    988.3570   1494.2920     34.6786      6.8900
+    989.4950   1494.2940     34.6863      6.8830
+    990.4570   1494.2630     34.6680      6.8770
+    991.3820   1494.2540     34.6664      6.8710
+    992.3390   1494.2590     34.6703      6.8670
+    993.3830   1494.2020     34.6542      6.8530
+    994.3410   1494.2020     34.6756      6.8420
+    995.4130   1494.2040     34.6786      6.8370
+    996.2750   1494.2120     34.6764      6.8360
+    997.2670   1494.2160     34.6878      6.8290
+    998.3900   1494.2210     34.6741      6.8300
+    999.3130   1494.2260     34.6779      6.8260
+   1000.3670   1494.2330     34.6756      6.8240
+   1001.3640   1494.2390     34.6794      6.8200
+   1002.2470   1494.2520     34.6779      6.8200
+   1003.2370   1494.2410     34.6901      6.8090
+   1004.4300   1494.2330     34.6771      6.8060
+   1005.3210   1494.2380     34.6725      6.8050
+   1006.2310   1494.2420     34.6786      6.8000
+   1007.2880   1494.2430     34.6687      6.7990
+   1008.3750   1494.2610     34.6779      6.7960
+   1009.2310   1494.2690     34.6756      6.7950
+   1010.2520   1494.2770     34.6901      6.7880
+   1011.2290   1494.2900     34.6748      6.7920
+   1012.1110   1494.2990     34.6703      6.7920
+   1013.1130   1494.3040     34.6794      6.7860
+   1014.1830   1494.3130     34.6878      6.7810
+   1015.1060   1494.3110     34.6741      6.7810
+   1016.1880   1494.3000     34.6695      6.7750
+   1017.0870   1494.3000     34.6733      6.7700
+   1018.1550   1494.2510     34.6512      6.7600
+   1019.1270   1494.2390     34.6687      6.7470
+   1020.0520   1494.2240     34.6664      6.7400
+   1021.0170   1494.2140     34.6611      6.7350
+   1022.0820   1494.2120     34.6573      6.7310
+   1023.1270   1494.2340     34.6733      6.7270
+   1024.1940   1494.2450     34.6924      6.7190
+   1025.0980   1494.2540     34.6786      6.7220
+   1026.0320   1494.2420     34.6596      6.7210
+   1026.9870   1494.2260     34.6687      6.7100
+   1028.0940   1494.2330     34.6779      6.7040
+   1028.9680   1494.2360     34.6718      6.7030
+   1030.1140   1494.2340     34.6703      6.6980
+   1030.9860   1494.2340     34.6649      6.6960
+   1031.9150   1494.2400     34.6664      6.6930
+   1033.0270   1494.2370     34.6649      6.6880
+   1034.0770   1494.1970     34.6474      6.6790
+   1034.9830   1494.1950     34.6519      6.6730
+   1036.0110   1494.1840     34.6634      6.6620
+   1036.9510   1494.1800     34.6725      6.6540
+   1037.9610   1494.1580     34.6512      6.6510
+   1038.9220   1494.0770     34.6176      6.6370
+   1039.8340   1494.0620     34.6344      6.6240
+   1040.9730   1494.0660     34.6657      6.6100
+   1041.8960   1494.0710     34.6542      6.6110
+   1043.0570   1494.0460     34.6497      6.6010
+   1043.8950   1493.9850     34.6336      6.5870
+   1044.9200   1493.9830     34.6497      6.5770
+   1045.9790   1493.9720     34.6489      6.5700
+   1046.9760   1493.9710     34.6626      6.5610
+   1047.8010   1493.9490     34.6588      6.5530
+   1048.7430   1493.9460     34.6565      6.5490
+   1049.7390   1493.9410     34.6550      6.5440
+   1050.7920   1493.9240     34.6550      6.5350
+   1051.8530   1493.9390     34.6657      6.5310
+   1052.9100   1493.9410     34.6657      6.5270
+   1053.9120   1493.9520     34.6481      6.5310
+   1054.7830   1493.9510     34.6642      6.5220
+   1055.8790   1493.9530     34.6512      6.5220
+   1056.6720   1493.9480     34.6550      6.5160
+   1057.6560   1493.9410     34.6550      6.5100
+   1058.6850   1493.9360     34.6588      6.5030
+   1059.6680   1493.9070     34.6420      6.4970
+   1060.6230   1493.9020     34.6466      6.4900
+   1061.7170   1493.8770     34.6252      6.4860
+   1062.6640   1493.8900     34.6443      6.4790
+   1063.7950   1493.8970     34.6565      6.4720
+   1064.6430   1493.9070     34.6657      6.4680
+   1065.6430   1493.9270     34.6588      6.4710
+   1066.7030   1493.9300     34.6596      6.4670
+   1067.5910   1493.9330     34.6626      6.4630
+   1068.6830   1493.9380     34.6428      6.4660
+   1069.5700   1493.9440     34.6603      6.4580
+   1070.6330   1493.9610     34.6664      6.4560
+   1071.6000   1493.9760     34.6588      6.4580
+   1072.6900   1493.9750     34.6497      6.4560
+   1073.6760   1493.9670     34.6558      6.4480
+   1074.6040   1493.9580     34.6611      6.4400
+   1075.5010   1493.9420     34.6519      6.4350
+   1076.5750   1493.9430     34.6603      6.4280
+   1077.5350   1493.9510     34.6504      6.4290
+   1078.5590   1493.9670     34.6588      6.4260
+   1079.5160   1493.9740     34.6581      6.4240
+   1080.5800   1493.9730     34.6680      6.4160
+   1081.6150   1493.9740     34.6642      6.4130
+   1082.5170   1493.9600     34.6352      6.4150
+   1083.4100   1493.9560     34.6420      6.4080
+   1084.6730   1493.9450     34.6474      6.3980
+   1085.3920   1493.9450     34.6535      6.3930
+   1086.5050   1493.9220     34.6268      6.3910
+   1087.4980   1493.9070     34.6237      6.3840
+   1088.4840   1493.9020     34.6436      6.3720
+   1089.4690   1493.9000     34.6451      6.3670
+   1090.4060   1493.9150     34.6413      6.3680
+   1091.3760   1493.8960     34.6352      6.3610
+   1092.3170   1493.8920     34.6443      6.3530
+   1093.4880   1493.8830     34.6306      6.3500
+   1094.5130   1493.8820     34.6382      6.3430
+   1095.4160   1493.8800     34.6466      6.3360
+   1096.4310   1493.8770     34.6397      6.3330
+   1097.3500   1493.8690     34.6275      6.3310
+   1098.4020   1493.8800     34.6474      6.3230
+   1099.2540   1493.8890     34.6466      6.3220
+   1100.4220   1493.8850     34.6336      6.3200
+   1101.3580   1493.8890     34.6558      6.3100
+   1102.4700   1493.8910     34.6581      6.3050
+   1103.3250   1493.9040     34.6443      6.3090
+   1104.1940   1493.9160     34.6581      6.3040
+   1105.1680   1493.9130     34.6428      6.3040
+   1106.4060   1493.9100     34.6336      6.3010
+   1107.3080   1493.8900     34.6367      6.2910
+   1108.3000   1493.8860     34.6481      6.2820
+   1109.2110   1493.8970     34.6542      6.2790
+   1110.3260   1493.9140     34.6466      6.2810
+   1111.2650   1493.9310     34.6443      6.2820
+   1112.2690   1493.9370     34.6611      6.2740
+   1113.2490   1493.9420     34.6458      6.2760
+   1114.1910   1493.9550     34.6466      6.2750
+   1115.1220   1493.9430     34.6313      6.2730
+   1116.0770   1493.9420     34.6329      6.2680
+   1117.1250   1493.9310     34.6291      6.2620
+   1118.0390   1493.9340     34.6321      6.2580
+   1119.2520   1493.9420     34.6375      6.2530
+   1120.1550   1493.9480     34.6428      6.2490
+   1121.0410   1493.9510     34.6489      6.2440
+   1122.0490   1493.9520     34.6397      6.2430
+   1123.0680   1493.9520     34.6390      6.2390
+   1124.1780   1493.9580     34.6352      6.2370
+   1125.0280   1493.9490     34.6382      6.2300
+   1126.1230   1493.9430     34.6313      6.2260
+   1127.1040   1493.9460     34.6367      6.2210
+   1128.1120   1493.9520     34.6313      6.2200
+   1129.0200   1493.9550     34.6306      6.2170
+   1130.0230   1493.9610     34.6252      6.2160
+   1130.9490   1493.9710     34.6428      6.2090
+   1132.0390   1493.9770     34.6329      6.2090
+   1133.1490   1493.9910     34.6382      6.2060
+   1133.9050   1494.0010     34.6336      6.2070
+   1134.9580   1494.0190     34.6367      6.2060
+   1135.9700   1494.0330     34.6497      6.2010
+   1136.8670   1494.0430     34.6367      6.2040
+   1137.9330   1494.0490     34.6367      6.2010
+   1138.8750   1494.0560     34.6390      6.1980
+   1139.8510   1494.0580     34.6428      6.1930
+   1140.9440   1494.0780     34.6352      6.1960
+   1141.9380   1494.0860     34.6344      6.1940
+   1142.9560   1494.0990     34.6344      6.1930
+   1143.8650   1494.1080     34.6390      6.1900
+   1144.7790   1494.0940     34.6214      6.1880
+   1145.7590   1494.1010     34.6298      6.1830
+   1146.8200   1494.0990     34.6390      6.1750
+   1147.9060   1494.0990     34.6313      6.1730
+   1148.9530   1494.0880     34.6237      6.1680
+   1149.8190   1494.0860     34.6359      6.1600
+   1150.8220   1494.0850     34.6222      6.1600
+   1151.7320   1494.0700     34.6260      6.1510
+   1152.8270   1494.0630     34.6062      6.1510
+   1153.9740   1494.0520     34.6291      6.1360
+   1154.7340   1494.0170     34.5947      6.1350
+   1155.6720   1494.0180     34.6207      6.1230
+   1156.7310   1494.0260     34.6283      6.1180
+   1157.6920   1494.0390     34.6382      6.1140
+   1158.8000   1494.0460     34.6382      6.1110
+   1159.6100   1494.0490     34.6359      6.1090
+   1160.7290   1494.0550     34.6291      6.1080
+   1161.6300   1494.0550     34.6298      6.1040
+   1162.5970   1494.0340     34.6008      6.1040
+   1163.6350   1494.0380     34.6176      6.0950
+   1164.7320   1494.0250     34.6054      6.0910
+   1165.6730   1494.0220     34.6191      6.0820
+   1166.5630   1494.0180     34.6230      6.0760
+   1167.6840   1494.0290     34.6260      6.0730
+   1168.6200   1494.0420     34.6268      6.0720
+   1169.6630   1494.0510     34.6199      6.0720
+   1170.5100   1494.0550     34.6436      6.0620
+   1171.6510   1494.0550     34.6222      6.0640
+   1172.5180   1494.0580     34.6161      6.0630
+   1173.5770   1494.0560     34.6344      6.0520
+   1174.5660   1494.0560     34.6153      6.0540
+   1175.4660   1494.0530     34.6169      6.0490
+   1176.4280   1494.0610     34.6382      6.0400
+   1177.5090   1494.0430     34.6222      6.0360
+   1178.5680   1494.0310     34.6054      6.0340
+   1179.4290   1494.0410     34.6107      6.0310
+   1180.4490   1494.0350     34.6237      6.0210
+   1181.4310   1494.0460     34.6291      6.0180
+   1182.5010   1494.0010     34.5955      6.0130
+   1183.3940   1493.9790     34.6039      6.0010
+   1184.5440   1493.9690     34.5993      5.9950
+   1185.5420   1493.9440     34.6008      5.9840
+   1186.4990   1493.9400     34.6039      5.9780
+   1187.4160   1493.9510     34.6161      5.9730
+   1188.4280   1493.9600     34.6252      5.9680
+   1189.2980   1493.9720     34.6359      5.9640
+   1190.3660   1493.9010     34.5749      5.9610
+   1191.2890   1493.8810     34.5909      5.9470
+   1192.4870   1493.8690     34.6222      5.9290
+   1193.2590   1493.8700     34.6092      5.9300
+   1194.3510   1493.8690     34.6161      5.9230
+   1195.2980   1493.8760     34.6062      5.9240
+   1196.2430   1493.8730     34.6191      5.9150
+   1197.3020   1493.8690     34.6146      5.9110
+   1198.2870   1493.8370     34.6077      5.9010
+   1199.2870   1493.8450     34.6130      5.8970
+   1200.3210   1493.8480     34.6268      5.8890
+   1201.3050   1493.8520     34.6298      5.8850
+   1202.2300   1493.8430     34.6107      5.8850
+   1203.2530   1493.8310     34.6001      5.8810
+   1204.3220   1493.8210     34.6153      5.8690
+   1205.3760   1493.8270     34.6001      5.8710
+   1206.2320   1493.8330     34.6092      5.8660
+   1207.3010   1493.8310     34.6031      5.8630
+   1208.1150   1493.8290     34.6062      5.8580
+   1209.2110   1493.7960     34.6031      5.8460
+   1210.1870   1493.7980     34.6138      5.8390
+   1211.2370   1493.7750     34.6100      5.8300
+   1212.0680   1493.7830     34.6214      5.8250
+   1213.1400   1493.7700     34.5970      5.8250
+   1214.0830   1493.7370     34.5901      5.8150
+   1215.1340   1493.7350     34.5871      5.8110
+   1216.0300   1493.7390     34.6130      5.8000
+   1217.0760   1493.7330     34.5970      5.7990
+   1218.1660   1493.7440     34.6008      5.7960
+   1219.1700   1493.7370     34.6138      5.7860
+   1220.0810   1493.7450     34.6138      5.7840
+   1220.9770   1493.7510     34.6161      5.7810
+   1222.0290   1493.7410     34.5947      5.7810
+   1222.9780   1493.7460     34.6046      5.7750
+   1224.0410   1493.7530     34.6024      5.7730
+   1225.0850   1493.7540     34.6024      5.7690
+   1225.9070   1493.7530     34.5970      5.7670
+   1226.9520   1493.7270     34.5848      5.7600
+   1227.9500   1493.7130     34.5856      5.7520
+   1228.9850   1493.7210     34.5909      5.7480
+   1229.9680   1493.7360     34.6085      5.7420
+   1231.0410   1493.7360     34.5970      5.7410
+   1231.9470   1493.7350     34.6001      5.7360
+   1232.9750   1493.7230     34.5802      5.7350
+   1233.9530   1493.7190     34.5894      5.7270
+   1234.8610   1493.7150     34.6024      5.7180
+   1235.7960   1493.7080     34.6001      5.7130
+   1236.9890   1493.7210     34.6069      5.7090
+   1237.9010   1493.7240     34.5978      5.7090
+   1238.8900   1493.7010     34.5757      5.7060
+   1240.0080   1493.7120     34.6039      5.6950
+   1240.8880   1493.7110     34.6077      5.6900
+   1241.9380   1493.7110     34.6123      5.6840
+   1242.8790   1493.6890     34.5863      5.6830
+   1243.8420   1493.6570     34.5924      5.6690
+   1244.8410   1493.6370     34.5726      5.6660
+   1245.7270   1493.6330     34.5955      5.6540
+   1246.9110   1493.6360     34.5886      5.6520
+   1247.7910   1493.6380     34.5940      5.6470
+   1248.6620   1493.6240     34.5879      5.6420
+   1249.7350   1493.6140     34.5840      5.6360
+   1250.7140   1493.6070     34.6008      5.6250
+   1251.6920   1493.5990     34.5970      5.6200
+   1252.7190   1493.5830     34.6024      5.6100
+   1253.6990   1493.5860     34.6046      5.6060
+   1254.6660   1493.5840     34.5901      5.6060
+   1255.6470   1493.5870     34.5917      5.6020
+   1256.6930   1493.6030     34.6062      5.5970
+   1257.6170   1493.5970     34.5863      5.5980
+   1258.6660   1493.5830     34.5802      5.5920
+   1259.7190   1493.5470     34.5573      5.5860
+   1260.6680   1493.5530     34.5810      5.5760
+   1261.7960   1493.5330     34.5757      5.5680
+   1262.6060   1493.5390     34.5978      5.5590
+   1263.5350   1493.5480     34.5863      5.5610
+   1264.4810   1493.5290     34.5749      5.5560
+   1265.5890   1493.5320     34.5940      5.5460
+   1266.4600   1493.5260     34.5810      5.5450
+   1267.5280   1493.5400     34.5901      5.5410
+   1268.6070   1493.5250     34.5863      5.5340
+   1269.5630   1493.5130     34.5772      5.5300
+   1270.5940   1493.5060     34.5863      5.5210
+   1271.5230   1493.5060     34.5863      5.5170
+   1272.4250   1493.4940     34.5779      5.5130
+   1273.4360   1493.4880     34.5848      5.5050
+   1274.3800   1493.4950     34.5840      5.5030
+   1275.4730   1493.5050     34.5932      5.4980
+   1276.4770   1493.5180     34.5840      5.5000
+   1277.3550   1493.5280     34.5833      5.4990
+   1278.4540   1493.5320     34.5848      5.4950
+   1279.4830   1493.5420     34.5886      5.4920
+   1280.3630   1493.5520     34.5940      5.4890
+   1281.5140   1493.5540     34.5840      5.4880
+   1282.3770   1493.5580     34.5848      5.4850
+   1283.5090   1493.5430     34.5741      5.4800
+   1284.2690   1493.5420     34.5695      5.4780
+   1285.3010   1493.5210     34.5833      5.4640
+   1286.4290   1493.5190     34.5825      5.4590
+   1287.4460   1493.5140     34.5879      5.4520
+   1288.2440   1493.5260     34.5955      5.4490
+   1289.3730   1493.5360     34.5886      5.4490
+   1290.2770   1493.5470     34.5856      5.4490
+   1291.3010   1493.5550     34.5749      5.4500
+   1292.3510   1493.5640     34.5779      5.4470
+   1293.2910   1493.5530     34.5818      5.4390
+   1294.2470   1493.5320     34.5627      5.4360
+   1295.1960   1493.5460     34.5863      5.4280
+   1296.1540   1493.5330     34.5757      5.4240
+   1297.3120   1493.5430     34.5840      5.4190
+   1298.2550   1493.5310     34.5657      5.4180
+   1299.1530   1493.5530     34.5833      5.4140
+   1300.1150   1493.5430     34.5787      5.4090
+   1301.1070   1493.5430     34.5749      5.4060
+   1302.2310   1493.5130     34.5650      5.3970
+   1303.1210   1493.4980     34.5764      5.3860
+   1304.0580   1493.4990     34.5810      5.3810
+   1305.1100   1493.4880     34.5711      5.3770
+   1306.0800   1493.4680     34.5772      5.3660
+   1307.1280   1493.4410     34.5703      5.3570
+   1308.0120   1493.4330     34.5749      5.3500
+   1309.0580   1493.4390     34.5818      5.3450
+   1310.0430   1493.4380     34.5741      5.3430
+   1310.9710   1493.4160     34.5634      5.3370
+   1312.2310   1493.3900     34.5581      5.3270
+   1313.0060   1493.3970     34.5657      5.3230
+   1313.9430   1493.3760     34.5657      5.3140
+   1315.0040   1493.3910     34.5695      5.3120
+   1315.9920   1493.3740     34.5749      5.3020
+   1317.0990   1493.3700     34.5673      5.2990
+   1318.0690   1493.3640     34.5680      5.2930
+   1319.1050   1493.3670     34.5695      5.2890
+   1319.9370   1493.3600     34.5718      5.2830
+   1320.9790   1493.3740     34.5757      5.2810
+   1321.9820   1493.3800     34.5833      5.2760
+   1322.9860   1493.3620     34.5680      5.2720
+   1323.8320   1493.3470     34.5612      5.2670
+   1324.9920   1493.3610     34.5787      5.2600
+   1325.9410   1493.3620     34.5642      5.2610
+   1326.8330   1493.3680     34.5665      5.2580
+   1327.8970   1493.3690     34.5627      5.2550
+   1328.8510   1493.3780     34.5795      5.2480
+   1329.8840   1493.3700     34.5627      5.2470
+   1330.8200   1493.3740     34.5787      5.2390
+   1331.7510   1493.3630     34.5703      5.2350
+   1332.7640   1493.3330     34.5627      5.2260
+   1333.7960   1493.3290     34.5612      5.2210
+   1334.8050   1493.3250     34.5581      5.2170
+   1335.7280   1493.3190     34.5596      5.2110
+   1336.7980   1493.3180     34.5612      5.2060
+   1337.7670   1493.3200     34.5589      5.2030
+   1338.7940   1493.3010     34.5497      5.1970
+   1339.7170   1493.3030     34.5612      5.1900
+   1340.6510   1493.3030     34.5680      5.1840
+   1341.7620   1493.3110     34.5757      5.1790
+   1342.6700   1493.3200     34.5543      5.1840
+   1343.6670   1493.3320     34.5634      5.1800
+   1344.6100   1493.3420     34.5680      5.1770
+   1345.6520   1493.3570     34.5726      5.1750
+   1346.6560   1493.3610     34.5596      5.1760
+   1347.6420   1493.3640     34.5612      5.1720
+   1348.6800   1493.3730     34.5551      5.1720
+   1349.6400   1493.3610     34.5581      5.1640
+   1350.7080   1493.3650     34.5726      5.1560
+   1351.5410   1493.3740     34.5619      5.1580
+   1352.6410   1493.3800     34.5711      5.1520
+   1353.5130   1493.3840     34.5505      5.1560
+   1354.5520   1493.3820     34.5604      5.1480
+   1355.5180   1493.3830     34.5612      5.1440
+   1356.6000   1493.3860     34.5558      5.1420
+   1357.4890   1493.3740     34.5444      5.1390
+   1358.4370   1493.3740     34.5505      5.1330
+   1359.6190   1493.3900     34.5604      5.1290
+   1360.5760   1493.3880     34.5619      5.1240
+   1361.6310   1493.4060     34.5619      5.1240
+   1362.4940   1493.4190     34.5573      5.1250
+   1363.4330   1493.4330     34.5657      5.1220
+   1364.3940   1493.4360     34.5490      5.1240
+   1365.5230   1493.4300     34.5520      5.1170
+   1366.5470   1493.4260     34.5543      5.1110
+   1367.5510   1493.4160     34.5459      5.1070
+   1368.4550   1493.4110     34.5459      5.1020
+   1369.5060   1493.3900     34.5444      5.0930
+   1370.3220   1493.4000     34.5566      5.0880
+   1371.3490   1493.4110     34.5581      5.0860
+   1372.3340   1493.4150     34.5703      5.0790
+   1373.4050   1493.4180     34.5589      5.0790
+   1374.4150   1493.4180     34.5490      5.0780
+   1375.3530   1493.4250     34.5642      5.0710
+   1376.2720   1493.4300     34.5589      5.0700
+   1377.2440   1493.4440     34.5604      5.0690
+   1378.3510   1493.4160     34.5367      5.0650
+   1379.2520   1493.4030     34.5428      5.0560
+   1380.2810   1493.4020     34.5482      5.0500
+   1381.3280   1493.4070     34.5383      5.0500
+   1382.1960   1493.4090     34.5505      5.0430
+   1383.2000   1493.4020     34.5505      5.0370
+   1384.2730   1493.3950     34.5566      5.0290
+   1385.2630   1493.3310     34.5314      5.0170
+   1386.1310   1493.3290     34.5406      5.0100
+   1387.2980   1493.3290     34.5543      5.0010
+   1388.1810   1493.3330     34.5551      4.9980
+   1389.1780   1493.3500     34.5612      4.9960
+   1390.2000   1493.3630     34.5520      4.9980
+   1391.2760   1493.3650     34.5551      4.9930
+   1392.1480   1493.3360     34.5367      4.9880
+   1393.2200   1493.3450     34.5490      4.9820
+   1394.1870   1493.3510     34.5566      4.9770
+   1395.0710   1493.3370     34.5375      4.9760
+   1396.0310   1493.3220     34.5673      4.9590
+   1397.0310   1493.3150     34.5421      4.9610
+   1398.0590   1493.3200     34.5322      4.9610
+   1399.0230   1493.3300     34.5467      4.9550
+   1399.9870   1493.3390     34.5634      4.9480
+   1401.0380   1493.3480     34.5406      4.9530
+   1401.9480   1493.3430     34.5467      4.9460
+   1403.1650   1493.3360     34.5474      4.9390
+   1403.9430   1493.3310     34.5497      4.9340
+   1405.0160   1493.3130     34.5337      4.9300
+   1405.9200   1493.3130     34.5413      4.9240
+   1406.8980   1493.3060     34.5482      4.9160
+   1407.9620   1493.3070     34.5383      4.9150
+   1409.0290   1493.3080     34.5444      4.9090
+   1409.8930   1493.2980     34.5345      4.9060
+   1410.8390   1493.2860     34.5413      4.8970
+   1411.8720   1493.2420     34.5284      4.8860
+   1412.9900   1493.2480     34.5406      4.8790
+   1413.8880   1493.2370     34.5360      4.8740
+   1414.9470   1493.2070     34.5215      4.8670
+   1415.9630   1493.1850     34.5261      4.8560
+   1416.8180   1493.2010     34.5367      4.8530
+   1417.7780   1493.1940     34.5406      4.8460
+   1418.7980   1493.1740     34.5245      4.8420
+   1419.8580   1493.1730     34.5322      4.8350
+   1420.9580   1493.1400     34.5268      4.8240
+   1421.7250   1493.1360     34.5482      4.8130
+   1422.7160   1493.1540     34.5428      4.8150
+   1423.6960   1493.1200     34.5200      4.8100
+   1424.7610   1493.1340     34.5390      4.8030
+   1425.6800   1493.1460     34.5581      4.7960
+   1426.7600   1493.1600     34.5459      4.7990
+   1427.7150   1493.1650     34.5436      4.7970
+   1428.8670   1493.1750     34.5360      4.7970
+   1429.8250   1493.1870     34.5390      4.7950
+   1430.6820   1493.1870     34.5245      4.7960
+   1431.7240   1493.1960     34.5406      4.7890
+   1432.6960   1493.1920     34.5467      4.7820
+   1433.6170   1493.1980     34.5360      4.7830
+   1434.6770   1493.1920     34.5367      4.7770
+   1435.6610   1493.1920     34.5398      4.7720
+   1436.6710   1493.2010     34.5367      4.7710
+   1437.6480   1493.1940     34.5276      4.7680
+   1438.7220   1493.1820     34.5299      4.7600
+   1439.5770   1493.1670     34.5230      4.7550
+   1440.5150   1493.1640     34.5306      4.7480
+   1441.6780   1493.1480     34.5215      4.7420
+   1442.4830   1493.1360     34.5436      4.7290
+   1443.4990   1493.1360     34.5299      4.7290
+   1444.5290   1493.1350     34.5253      4.7260
+   1445.4930   1493.1380     34.5337      4.7200
+   1446.5480   1493.1430     34.5428      4.7140
+   1447.5350   1493.1530     34.5345      4.7150
+   1448.5300   1493.1640     34.5398      4.7120
+   1449.4610   1493.1690     34.5345      4.7110
+   1450.3920   1493.1740     34.5390      4.7070
+   1451.3880   1493.1930     34.5436      4.7060
+   1452.4140   1493.1930     34.5337      4.7050
+   1453.4680   1493.2030     34.5337      4.7030
+   1454.5610   1493.2060     34.5253      4.7020
+   1455.3890   1493.2060     34.5299      4.6970
+   1456.4260   1493.2130     34.5284      4.6950
+   1457.3460   1493.2240     34.5406      4.6900
+   1458.3300   1493.2110     34.5276      4.6870
+   1459.3830   1493.2070     34.5261      4.6820
+   1460.4030   1493.2000     34.5230      4.6770
+   1461.3210   1493.1970     34.5215      4.6730
+   1462.2760   1493.2000     34.5276      4.6680
+   1463.2600   1493.2130     34.5306      4.6660
+   1464.3380   1493.2270     34.5276      4.6660
+   1465.2990   1493.2250     34.5329      4.6600
+   1466.2780   1493.2230     34.5215      4.6590
+   1467.1900   1493.2090     34.5207      4.6520
+   1468.1900   1493.2190     34.5345      4.6460
+   1469.2520   1493.2110     34.5177      4.6450
+   1470.1490   1493.2190     34.5245      4.6410
+   1471.2470   1493.2160     34.5177      4.6380
+   1472.2500   1493.2180     34.5383      4.6280
+   1473.2690   1493.1670     34.5078      4.6210
+   1474.1230   1493.1500     34.5085      4.6130
+   1475.2220   1493.1180     34.5078      4.6010
+   1476.1420   1493.1040     34.5169      4.5910
+   1477.0700   1493.0790     34.5169      4.5810
+   1478.1290   1493.0850     34.5238      4.5760
+   1479.1230   1493.0930     34.5200      4.5750
+   1480.1410   1493.0980     34.5200      4.5720
+   1481.1390   1493.1090     34.5215      4.5700
+   1482.0330   1493.0850     34.5108      4.5640
+   1483.0260   1493.0470     34.5100      4.5510
+   1484.0420   1493.0400     34.5100      4.5450
+   1485.0380   1493.0210     34.5146      4.5350
+   1486.0730   1493.0200     34.5123      4.5310
+   1487.1060   1493.0110     34.5116      4.5250
+   1488.0190   1493.0080     34.5070      4.5220
+   1489.0750   1493.0040     34.5215      4.5120
+   1489.9360   1492.9750     34.5070      4.5060
+   1490.9670   1492.9790     34.5192      4.4990
+   1491.9310   1492.9280     34.4986      4.4890
+   1492.9100   1492.9110     34.5047      4.4790
+   1493.8850   1492.8990     34.5085      4.4710
+   1495.0060   1492.9100     34.5177      4.4660
+   1495.9390   1492.9040     34.5108      4.4630
+   1496.9700   1492.9070     34.5184      4.4570
+   1497.8500   1492.9160     34.5177      4.4560
+   1499.0060   1492.8970     34.5032      4.4510
+   1499.8800   1492.8600     34.5085      4.4370
+   1500.8740   1492.8580     34.5131      4.4310
+   1501.8660   1492.8640     34.5238      4.4250
+   1502.7720   1492.8610     34.5192      4.4220
+   1503.8010   1492.8260     34.5009      4.4150
+   1504.7990   1492.8070     34.5016      4.4060
+   1505.8280   1492.8100     34.5100      4.4000
+   1506.7860   1492.8140     34.5131      4.3960
+   1507.8030   1492.7790     34.4986      4.3880
+   1508.8700   1492.7840     34.5078      4.3820
+   1509.7580   1492.7770     34.5093      4.3760
+   1510.7960   1492.7850     34.5184      4.3710
+   1511.6840   1492.7560     34.4940      4.3680
+   1512.6680   1492.7580     34.5108      4.3590
+   1513.6380   1492.7510     34.5062      4.3550
+   1514.7660   1492.7500     34.5032      4.3510
+   1515.6460   1492.7320     34.4940      4.3460
+   1516.6630   1492.7350     34.5055      4.3390
+   1517.5940   1492.7190     34.5001      4.3330
+   1518.5970   1492.7190     34.5024      4.3280
+   1519.7240   1492.7270     34.5070      4.3240
+   1520.5920   1492.7240     34.4963      4.3230
+   1521.5380   1492.7340     34.5047      4.3190
+   1522.6870   1492.7290     34.5047      4.3130
+   1523.5920   1492.6990     34.4826      4.3090
+   1524.5360   1492.6990     34.4955      4.3010
+   1525.6040   1492.6870     34.5047      4.2910
+   1526.4990   1492.6800     34.4971      4.2880
+   1527.5890   1492.6820     34.4971      4.2840
+   1528.6550   1492.6800     34.5108      4.2750
+   1529.4990   1492.6860     34.5039      4.2750
+   1530.4480   1492.6940     34.5139      4.2700
+   1531.4980   1492.7010     34.5085      4.2690
+   1532.4720   1492.6970     34.4994      4.2670
+   1533.5170   1492.6800     34.4887      4.2620
+   1534.5400   1492.6690     34.4955      4.2530
+   1535.6010   1492.6820     34.4978      4.2510
+   1536.3790   1492.6910     34.5078      4.2470
+   1537.4230   1492.7020     34.4994      4.2480
+   1538.4530   1492.7160     34.5062      4.2450
+   1539.3450   1492.6730     34.4772      4.2400
+   1540.4870   1492.6560     34.4818      4.2300
+   1541.4070   1492.6540     34.4902      4.2230
+   1542.4030   1492.6440     34.4955      4.2150
+   1543.3110   1492.6540     34.4971      4.2130
+   1544.3080   1492.6550     34.4917      4.2110
+   1545.3900   1492.6660     34.5116      4.2030
+   1546.3220   1492.6480     34.4788      4.2050
+   1547.3440   1492.6160     34.4894      4.1900
+   1548.3210   1492.6050     34.4872      4.1840
+   1549.3100   1492.6010     34.4872      4.1790
+   1550.3540   1492.5920     34.4955      4.1700
+   1551.2130   1492.5780     34.4765      4.1690
+   1552.3570   1492.5740     34.4872      4.1600
+   1553.2770   1492.5740     34.4917      4.1550
+   1554.1560   1492.5800     34.4940      4.1520
+   1555.2740   1492.5770     34.4772      4.1520
+   1556.2160   1492.5650     34.4810      4.1440
+   1557.1990   1492.5590     34.4925      4.1350
+   1558.1060   1492.4990     34.4635      4.1260
+   1559.2050   1492.4670     34.4597      4.1150
+   1560.2100   1492.4590     34.4818      4.1020
+   1561.1590   1492.4660     34.4948      4.0960
+   1562.1140   1492.4630     34.4864      4.0940
+   1563.1260   1492.4590     34.4986      4.0850
+   1564.1130   1492.4530     34.4810      4.0850
+   1565.0280   1492.4560     34.5001      4.0760
+   1566.0400   1492.4640     34.4963      4.0750
+   1567.1420   1492.4440     34.4826      4.0700
+   1568.0840   1492.4190     34.4803      4.0610
+   1568.9830   1492.4170     34.4826      4.0560
+   1570.0290   1492.4250     34.4879      4.0520
+   1571.0380   1492.4340     34.4887      4.0500
+   1571.9430   1492.4450     34.4948      4.0470
+   1572.9460   1492.4590     34.4925      4.0470
+   1574.0410   1492.4650     34.5016      4.0410
+   1574.9450   1492.4760     34.4856      4.0450
+   1576.0350   1492.4870     34.4894      4.0420
+   1576.9270   1492.4880     34.4849      4.0400
+   1578.0200   1492.4920     34.4872      4.0360
+   1578.8900   1492.4930     34.4765      4.0360
+   1579.9760   1492.4940     34.4818      4.0300
+   1580.8460   1492.5000     34.4917      4.0250
+   1581.9510   1492.4990     34.4734      4.0260
+   1582.8440   1492.5010     34.4757      4.0220
+   1583.9070   1492.4900     34.4856      4.0120
+   1584.9410   1492.4780     34.4757      4.0080
+   1585.8180   1492.4440     34.4704      3.9980
+   1586.7610   1492.4530     34.4742      3.9950
+   1587.8910   1492.4600     34.4971      3.9850
+   1588.8940   1492.4770     34.4940      3.9860
+   1589.7410   1492.4870     34.4940      3.9850
+   1590.7960   1492.5050     34.4971      3.9840
+   1591.8140   1492.5190     34.4818      3.9880
+   1592.7610   1492.5130     34.4742      3.9850
+   1593.7960   1492.4540     34.4543      3.9730
+   1594.8310   1492.4480     34.4711      3.9620
+   1595.7360   1492.4250     34.4742      3.9520
+   1596.6700   1492.4350     34.4887      3.9460
+   1597.7560   1492.4300     34.4902      3.9400
+   1598.6930   1492.4430     34.4810      3.9420
+   1599.6910   1492.4320     34.4795      3.9360
+   1600.6980   1492.4260     34.4841      3.9290
+   1601.6320   1492.4250     34.4772      3.9270
+   1602.6650   1492.3910     34.4734      3.9160
+   1603.6360   1492.3660     34.4795      3.9040
+   1604.5790   1492.3100     34.4406      3.8990
+   1605.5830   1492.3070     34.4444      3.8930
+   1606.5370   1492.3170     34.4688      3.8840
+   1607.5770   1492.3260     34.4879      3.8760
+   1608.5980   1492.3340     34.4902      3.8730
+   1609.6260   1492.3330     34.4795      3.8720
+   1610.5070   1492.3270     34.4795      3.8670
+   1611.4470   1492.2800     34.4635      3.8570
+   1612.4560   1492.2780     34.4711      3.8500
+   1613.4670   1492.2830     34.4711      3.8470
+   1614.4300   1492.3010     34.4818      3.8440
+   1615.4970   1492.3130     34.4772      3.8440
+   1616.4350   1492.3120     34.4742      3.8410
+   1617.5490   1492.3110     34.4719      3.8370
+   1618.4610   1492.3130     34.4582      3.8380
+   1619.3560   1492.3280     34.4772      3.8320
+   1620.3440   1492.3390     34.4727      3.8320
+   1621.4120   1492.3500     34.4742      3.8300
+   1622.4060   1492.3450     34.4574      3.8300
+   1623.3150   1492.3510     34.4727      3.8230
+   1624.3180   1492.3500     34.4749      3.8180
+   1625.2960   1492.3540     34.4780      3.8140
+   1626.3090   1492.3540     34.4612      3.8150
+   1627.3450   1492.3630     34.4803      3.8070
+   1628.3020   1492.3700     34.4795      3.8050
+   1629.3190   1492.3740     34.4635      3.8070
+   1630.2650   1492.3840     34.4681      3.8040
+   1631.3400   1492.3920     34.4765      3.7990
+   1632.2040   1492.3650     34.4513      3.7970
+   1633.3310   1492.3190     34.4528      3.7810
+   1634.1940   1492.3120     34.4681      3.7710
+   1635.2140   1492.2910     34.4452      3.7690
+   1636.2820   1492.2840     34.4681      3.7560
+   1637.1820   1492.2950     34.4742      3.7530
+   1638.1570   1492.2920     34.4589      3.7530
+   1639.1790   1492.2510     34.4498      3.7420
+   1640.3010   1492.2470     34.4612      3.7330
+   1641.0980   1492.2490     34.4650      3.7290
+   1642.1640   1492.2450     34.4742      3.7210
+   1643.0600   1492.2390     34.4543      3.7220
+   1644.1610   1492.2320     34.4475      3.7180
+   1645.1310   1492.2340     34.4688      3.7080
+   1646.0330   1492.2360     34.4681      3.7050
+   1647.0250   1492.2400     34.4711      3.7010
+   1648.0130   1492.2420     34.4696      3.6980
+   1649.0150   1492.2540     34.4658      3.6980
+   1650.0710   1492.2700     34.4742      3.6950
+   1650.9860   1492.2880     34.4696      3.6970
+   1652.0430   1492.3020     34.4666      3.6970
+   1653.0000   1492.3030     34.4582      3.6960
+   1653.9680   1492.3050     34.4696      3.6890
+   1654.9750   1492.2830     34.4460      3.6870
+   1655.9380   1492.2570     34.4521      3.6750
+   1657.0360   1492.2360     34.4475      3.6670
+   1657.9550   1492.2310     34.4574      3.6590
+   1658.9340   1492.2140     34.4543      3.6520
+   1659.8930   1492.2090     34.4734      3.6410
+   1660.8470   1492.2000     34.4643      3.6380
+   1661.8560   1492.1960     34.4604      3.6340
+   1662.8870   1492.2080     34.4597      3.6330
+   1663.9340   1492.2130     34.4566      3.6310
+   1664.7940   1492.2090     34.4551      3.6270
+   1665.9180   1492.2130     34.4658      3.6200
+   1666.8090   1492.2140     34.4681      3.6160
+   1667.7500   1492.2120     34.4513      3.6170
+   1668.8430   1492.2160     34.4559      3.6120
+   1669.7920   1492.2280     34.4627      3.6090
+   1670.8540   1492.2250     34.4498      3.6080
+   1671.7340   1492.2410     34.4604      3.6050
+   1672.7640   1492.2510     34.4513      3.6060
+   1673.7930   1492.2540     34.4498      3.6030
+   1674.7750   1492.2600     34.4643      3.5960
+   1675.6630   1492.2640     34.4620      3.5940
+   1676.7060   1492.2570     34.4429      3.5940
+   1677.6890   1492.2280     34.4467      3.5820
+   1678.7500   1492.2390     34.4643      3.5750
+   1679.6770   1492.2370     34.4505      3.5750
+   1680.6240   1492.2400     34.4627      3.5680
+   1681.6650   1492.2380     34.4482      3.5680
+   1682.7440   1492.2250     34.4398      3.5630
+   1683.5980   1492.2270     34.4536      3.5560
+   1684.5820   1492.2220     34.4429      3.5540
+   1685.5370   1492.2130     34.4398      3.5490
+   1686.6070   1492.2090     34.4452      3.5420
+   1687.5790   1492.2060     34.4528      3.5350
+   1688.6080   1492.2100     34.4528      3.5320
+   1689.5020   1492.1880     34.4528      3.5230
+   1690.4710   1492.1640     34.4452      3.5160
+   1691.5380   1492.1680     34.4536      3.5100
+   1692.4640   1492.1790     34.4559      3.5080
+   1693.4220   1492.1900     34.4551      3.5070
+   1694.5510   1492.2040     34.4612      3.5040
+   1695.4130   1492.2150     34.4551      3.5050
+   1696.5170   1492.2140     34.4559      3.5000
+   1697.3810   1492.2040     34.4505      3.4960
+   1698.3770   1492.2070     34.4429      3.4950
+   1699.3980   1492.2110     34.4521      3.4890
+   1700.4930   1492.2020     34.4406      3.4860
+   1701.3670   1492.1960     34.4566      3.4760
+   1702.3380   1492.1910     34.4467      3.4740
+   1703.4070   1492.1930     34.4505      3.4690
+   1704.3330   1492.1810     34.4421      3.4650
+   1705.3630   1492.1900     34.4582      3.4580
+   1706.3190   1492.1960     34.4444      3.4600
+   1707.3910   1492.2130     34.4559      3.4560
+   1708.3440   1492.2230     34.4513      3.4560
+   1709.2540   1492.2410     34.4376      3.4610
+   1710.3070   1492.2600     34.4444      3.4590
+   1711.2740   1492.2750     34.4528      3.4560
+   1712.2570   1492.2720     34.4444      3.4540
+   1713.3230   1492.2350     34.4383      3.4430
+   1714.2970   1492.2080     34.4368      3.4330
+   1715.1470   1492.2150     34.4475      3.4280
+   1716.2230   1492.2280     34.4467      3.4270
+   1717.1340   1492.2450     34.4444      3.4280
+   1718.2000   1492.2560     34.4521      3.4240
+   1719.0930   1492.2700     34.4543      3.4230
+   1720.1090   1492.2870     34.4635      3.4200
+   1721.1340   1492.2970     34.4421      3.4250
+   1722.2060   1492.3100     34.4444      3.4230
+   1723.1040   1492.3140     34.4421      3.4210
+   1724.1050   1492.3050     34.4353      3.4170
+   1725.0650   1492.2460     34.4200      3.4040
+   1726.0720   1492.2250     34.4200      3.3950
+   1727.1320   1492.2220     34.4391      3.3840
+   1728.1010   1492.2140     34.4398      3.3780
+   1729.0370   1492.2120     34.4460      3.3720
+   1730.0000   1492.2160     34.4360      3.3720
+   1731.0100   1492.2180     34.4376      3.3680
+   1731.9370   1492.2200     34.4437      3.3630
+   1733.0450   1492.2290     34.4391      3.3620
+   1734.0390   1492.2300     34.4498      3.3550
+   1734.9810   1492.2140     34.4345      3.3520
+   1735.9210   1492.2080     34.4406      3.3450
+   1736.9280   1492.2120     34.4406      3.3420
+   1738.0360   1492.2160     34.4391      3.3390
+   1738.9280   1492.2330     34.4368      3.3400
+   1740.0080   1492.2470     34.4368      3.3390
+   1740.9650   1492.2650     34.4414      3.3380
+   1741.8810   1492.2700     34.4398      3.3360
+   1742.8500   1492.2870     34.4437      3.3350
+   1743.9770   1492.3020     34.4398      3.3350
+   1744.8540   1492.3090     34.4437      3.3320
+   1745.7480   1492.3230     34.4429      3.3320
+   1746.7970   1492.3360     34.4421      3.3310
+   1747.8960   1492.3480     34.4337      3.3320
+   1748.7560   1492.3560     34.4322      3.3310
+   1749.8040   1492.3490     34.4330      3.3250
+   1750.6880   1492.2480     34.3964      3.3090
+   1751.7420   1492.2060     34.4215      3.2870
+   1752.7550   1492.1810     34.4284      3.2750
+   1753.7850   1492.1490     34.4162      3.2670
+   1754.7170   1492.1470     34.4322      3.2580
+   1755.6730   1492.1360     34.4238      3.2540
+   1756.6540   1492.1090     34.4231      3.2440
+   1757.6370   1492.0960     34.4170      3.2390
+   1758.7430   1492.1080     34.4307      3.2330
+   1759.5950   1492.1170     34.4330      3.2310
+   1760.7540   1492.1260     34.4345      3.2280
+   1761.5910   1492.1380     34.4299      3.2290
+   1762.6820   1492.1520     34.4299      3.2280
+   1763.5550   1492.1650     34.4345      3.2260
+   1764.6350   1492.1820     34.4337      3.2260
+   1765.5300   1492.1930     34.4398      3.2230
+   1766.5030   1492.2050     34.4269      3.2260
+   1767.4890   1492.2180     34.4437      3.2200
+   1768.5260   1492.2300     34.4391      3.2200
+   1769.6070   1492.2410     34.4299      3.2210
+   1770.5700   1492.2450     34.4368      3.2160
+   1771.5120   1492.2440     34.4238      3.2160
+   1772.4440   1492.2500     34.4330      3.2110
+   1773.5880   1492.2540     34.4177      3.2120
+   1774.4590   1492.2620     34.4383      3.2040
+   1775.4830   1492.2740     34.4307      3.2050
+   1776.5890   1492.2890     34.4376      3.2020
+   1777.3600   1492.2920     34.4238      3.2040
+   1778.4410   1492.3070     34.4307      3.2010
+   1779.3550   1492.3040     34.4330      3.1960
+   1780.5040   1492.3090     34.4376      3.1910
+   1781.2860   1492.3200     34.4429      3.1890
+   1782.2790   1492.3360     34.4292      3.1930
+   1783.3220   1492.3530     34.4284      3.1930
+   1784.2630   1492.3610     34.4383      3.1880
+   1785.4680   1492.3800     34.4437      3.1860
+   1786.2590   1492.3910     34.4322      3.1890
+   1787.3490   1492.4040     34.4345      3.1870
+   1788.2140   1492.4030     34.4162      3.1890
+   1789.1980   1492.4080     34.4231      3.1840
+   1790.3870   1492.4200     34.4330      3.1790
+   1791.1840   1492.4130     34.4337      3.1740
+   1792.1600   1492.4240     34.4322      3.1730
+   1793.1480   1492.4320     34.4353      3.1700
+   1794.1480   1492.4440     34.4315      3.1700
+   1795.1720   1492.4500     34.4330      3.1670
+   1796.2660   1492.4640     34.4322      3.1660
+   1797.1310   1492.4530     34.4193      3.1640
+   1798.1950   1492.4330     34.4162      3.1560
+   1799.0740   1492.4380     34.4246      3.1510
+   1800.2140   1492.4480     34.4307      3.1470
+   1801.0580   1492.4420     34.4246      3.1440
+   1802.1710   1492.4270     34.4246      3.1360
+   1803.0180   1492.4240     34.4246      3.1320
+   1804.0660   1492.4200     34.4208      3.1280
+   1805.0560   1492.4250     34.4154      3.1270
+   1806.1430   1492.4350     34.4284      3.1210
+   1807.1250   1492.4470     34.4376      3.1170
+   1807.9630   1492.4570     34.4246      3.1200
+   1809.0180   1492.4460     34.4055      3.1190
+   1809.9340   1492.4510     34.4200      3.1120
+   1811.0330   1492.4590     34.4185      3.1100
+   1811.8840   1492.4670     34.4269      3.1060
+   1812.9870   1492.4690     34.4269      3.1020
+   1813.8790   1492.4680     34.4177      3.1010
+   1814.9570   1492.4710     34.4383      3.0910
+   1815.9470   1492.4810     34.4170      3.0960
+   1816.8700   1492.4840     34.4078      3.0960
+   1817.9800   1492.4850     34.4200      3.0880
+   1818.9310   1492.4760     34.4231      3.0810
+   1819.7970   1492.4870     34.4238      3.0800
+   1820.8960   1492.4850     34.4208      3.0760
+   1821.8400   1492.4910     34.4200      3.0740
+   1822.8550   1492.5030     34.4223      3.0720
+   1823.8430   1492.5180     34.4276      3.0700
+   1824.8280   1492.5300     34.4200      3.0710
+   1825.8630   1492.5390     34.4200      3.0690
+   1826.8670   1492.5170     34.4070      3.0640
+   1827.8150   1492.5040     34.4109      3.0560
+   1828.7340   1492.5090     34.4254      3.0490
+   1829.7010   1492.5230     34.4299      3.0470
+   1830.6530   1492.5340     34.4162      3.0500
+   1831.6680   1492.5490     34.4276      3.0460
+   1832.6880   1492.5620     34.4208      3.0470
+   1833.7910   1492.5620     34.4131      3.0450
+   1834.6840   1492.5370     34.4177      3.0340
+   1835.5760   1492.5280     34.4032      3.0330
+   1836.5940   1492.5370     34.4292      3.0230
+   1837.6230   1492.5500     34.4223      3.0240
+   1838.5790   1492.5620     34.4193      3.0240
+   1839.5340   1492.5770     34.4086      3.0270
+   1840.7300   1492.5910     34.4231      3.0210
+   1841.6520   1492.6030     34.4139      3.0230
+   1842.5150   1492.6060     34.4109      3.0210
+   1843.6020   1492.6060     34.4040      3.0190
+   1844.5930   1492.6090     34.4093      3.0140
+   1845.4650   1492.6160     34.4231      3.0080
+   1846.5590   1492.6210     34.4154      3.0070
+   1847.4520   1492.6260     34.4208      3.0030
+   1848.5120   1492.6250     34.4093      3.0020
+   1849.3970   1492.6320     34.4101      3.0000
+   1850.4360   1492.6440     34.4254      2.9940
+   1851.5110   1492.6570     34.4246      2.9930
+   1852.3640   1492.6710     34.4307      2.9910
+   1853.4070   1492.6830     34.4193      2.9930
+   1854.4130   1492.6990     34.4055      2.9970
+   1855.3080   1492.7070     34.4101      2.9940
+   1856.3920   1492.7270     34.4109      2.9940
+   1857.4050   1492.7410     34.4116      2.9930
+   1858.3570   1492.7550     34.4131      2.9920
+   1859.2810   1492.7560     34.4116      2.9890
+   1860.3160   1492.7610     34.4055      2.9880
+   1861.3570   1492.7680     34.4131      2.9830
+   1862.3460   1492.7780     34.4177      2.9800
+   1863.2500   1492.7940     34.4055      2.9840
+   1864.2450   1492.8120     34.4193      2.9800
+   1865.2840   1492.8290     34.4254      2.9780
+   1866.2510   1492.8460     34.4254      2.9780
+   1867.2720   1492.8640     34.4193      2.9800
+   1868.2220   1492.8780     34.4147      2.9810
+   1869.1430   1492.8700     34.4093      2.9770
+   1870.1700   1492.8680     34.3979      2.9760
+   1871.1050   1492.8850     34.4086      2.9730
+   1872.1530   1492.8910     34.4025      2.9720
+   1873.1320   1492.9030     34.4124      2.9680
+   1874.1240   1492.9120     34.4158      2.9650
+   1875.1470   1492.9230     34.4177      2.9630
+   1876.1730   1492.9120     34.4025      2.9610
+   1877.0610   1492.8900     34.4032      2.9520
+   1878.0330   1492.9030     34.4170      2.9470
+   1879.0120   1492.9120     34.4109      2.9470
+   1880.0210   1492.9250     34.4177      2.9440
+   1880.9920   1492.9370     34.4040      2.9470
+   1882.1390   1492.9570     34.4177      2.9430
+   1883.0870   1492.9710     34.4093      2.9450
+   1883.9290   1492.9820     34.4131      2.9430
+   1884.9810   1492.9880     34.4109      2.9410
+   1885.8970   1492.9930     34.4154      2.9370
+   1886.9930   1492.9950     34.4093      2.9350
+   1887.8910   1493.0050     34.3987      2.9370
+   1889.0850   1493.0210     34.4055      2.9340
+   1889.8670   1493.0290     34.4177      2.9290
+   1890.9230   1493.0400     34.4025      2.9320
+   1891.8910   1493.0440     34.4154      2.9250
+   1892.9120   1493.0440     34.4055      2.9240
+   1893.8780   1493.0380     34.4086      2.9180
+   1894.8780   1493.0520     34.4124      2.9160
+   1895.7720   1493.0540     34.4025      2.9160
+   1896.7570   1493.0670     34.4063      2.9140
+   1897.7500   1493.0720     34.3933      2.9150
+   1898.7570   1493.0830     34.4116      2.9080
+   1899.8300   1493.0770     34.3994      2.9060
+   1900.7920   1493.0670     34.4025      2.8990
+   1901.7150   1493.0800     34.4101      2.8960
+   1902.7130   1493.0860     34.3987      2.8970
+   1903.6610   1493.0950     34.4025      2.8940
+   1904.6600   1493.0990     34.4093      2.8890
+   1905.7040   1493.1110     34.4017      2.8900
+   1906.6400   1493.1170     34.4032      2.8870
+   1907.6710   1493.1290     34.4025      2.8860
+   1908.6460   1493.1460     34.3964      2.8880
+   1909.6260   1493.1590     34.3933      2.8880
+   1910.5950   1493.1660     34.3964      2.8850
+   1911.6030   1493.1670     34.4032      2.8790
+   1912.6260   1493.1750     34.4025      2.8770
+   1913.5770   1493.1890     34.4139      2.8730
+   1914.5250   1493.1990     34.4254      2.8680
+   1915.5190   1493.2030     34.4055      2.8710
+   1916.5180   1493.1920     34.4070      2.8640
+   1917.5220   1493.2060     34.3948      2.8670
+   1918.5200   1493.2250     34.4032      2.8650
+   1919.4950   1493.2430     34.4139      2.8620
+   1920.5820   1493.2600     34.4032      2.8650
+   1921.4600   1493.2760     34.4101      2.8630
+   1922.4420   1493.2930     34.4040      2.8650
+   1923.4480   1493.3080     34.4116      2.8620
+   1924.4160   1493.3250     34.4093      2.8630
+   1925.3710   1493.3320     34.4017      2.8630
+   1926.5350   1493.3470     34.4048      2.8610
+   1927.4410   1493.3590     34.4086      2.8590
+   1928.3840   1493.3660     34.4017      2.8590
+   1929.3580   1493.3610     34.3987      2.8550
+   1930.3320   1493.3610     34.4055      2.8490
+   1931.3620   1493.3680     34.3971      2.8490
+   1932.2890   1493.3750     34.3971      2.8470
+   1933.3390   1493.3740     34.3925      2.8440
+   1934.3340   1493.3800     34.4032      2.8380
+   1935.3170   1493.3910     34.3956      2.8390
+   1936.2800   1493.3970     34.4109      2.8320
+   1937.2430   1493.4060     34.4086      2.8310
+   1938.2840   1493.4230     34.4109      2.8300
+   1939.2790   1493.4380     34.4093      2.8300
+   1940.1930   1493.4530     34.4124      2.8290
+   1941.2270   1493.4600     34.4040      2.8290
+   1942.1670   1493.4720     34.4040      2.8280
+   1943.1550   1493.4850     34.4109      2.8250
+   1944.1710   1493.4840     34.4002      2.8240
+   1945.1080   1493.4900     34.3925      2.8240
+   1946.1150   1493.5020     34.4017      2.8200
+   1947.0740   1493.5130     34.4109      2.8160
+   1948.0840   1493.5260     34.4009      2.8180
+   1949.0410   1493.5370     34.4002      2.8170
+   1950.1840   1493.5440     34.3941      2.8160
+   1951.1230   1493.5470     34.4002      2.8110
+   1952.1170   1493.5610     34.4017      2.8100
+   1953.0060   1493.5680     34.3987      2.8090
+   1954.0370   1493.5810     34.3979      2.8080
+   1954.9990   1493.5890     34.3987      2.8060
+   1956.0280   1493.6050     34.4002      2.8050
+   1956.9480   1493.6130     34.4009      2.8030
+   1958.0220   1493.6180     34.3880      2.8040
+   1958.9000   1493.6210     34.3948      2.7990
+   1960.0560   1493.6170     34.3994      2.7920
+   1960.9350   1493.6280     34.3994      2.7910
+   1961.9220   1493.6270     34.3925      2.7890
+   1962.8710   1493.6200     34.3948      2.7830
+   1963.9050   1493.6350     34.3925      2.7830
+   1964.9010   1493.6520     34.3925      2.7830
+   1965.8130   1493.6670     34.3925      2.7830
+   1966.9220   1493.6850     34.3880      2.7840
+   1967.7840   1493.6940     34.3903      2.7820
+   1968.8310   1493.6660     34.3849      2.7730
+   1969.8760   1493.6590     34.3826      2.7680
+   1970.8380   1493.6690     34.3971      2.7620
+   1971.7530   1493.6850     34.3941      2.7630
+   1972.7660   1493.6940     34.3971      2.7600
+   1973.7650   1493.7050     34.3895      2.7610
+   1974.8420   1493.7160     34.3941      2.7580
+   1975.7400   1493.7250     34.4017      2.7540
+   1976.6620   1493.7410     34.3956      2.7560
+   1977.7110   1493.7560     34.4093      2.7510
+   1978.8490   1493.7680     34.3842      2.7570
+   1979.7730   1493.7830     34.4002      2.7520
+   1980.7330   1493.7950     34.4032      2.7500
+   1981.7760   1493.8070     34.3987      2.7500
+   1982.6870   1493.8230     34.3925      2.7520
+   1983.7380   1493.8220     34.3979      2.7460
+   1984.6930   1493.8210     34.3880      2.7450
+   1985.6720   1493.8320     34.3933      2.7420
+   1986.6610   1493.8460     34.3979      2.7400
+   1987.6360   1493.8640     34.3857      2.7440
+   1988.5700   1493.8670     34.3826      2.7420
+   1989.5930   1493.8810     34.3864      2.7400
+   1990.6200   1493.8900     34.3765      2.7410
+   1991.4900   1493.8880     34.3895      2.7330
+   1992.6320   1493.9010     34.3811      2.7340
+   1993.5340   1493.9040     34.3918      2.7280
+   1994.5360   1493.9130     34.3857      2.7280
+   1995.5730   1493.9210     34.3941      2.7230
+   1996.4300   1493.9320     34.3918      2.7230
+   1997.4400   1493.9430     34.3933      2.7210
+   1998.3760   1493.9520     34.4009      2.7170
+   1999.4230   1493.9670     34.3956      2.7180
+   2000.4870   1493.9710     34.3948      2.7150
+   2001.4440   1493.9710     34.3918      2.7120
+   2002.3950   1493.9740     34.3819      2.7120
+   2003.3590   1493.9820     34.3887      2.7080
+   2004.3020   1493.9920     34.3842      2.7080
+   2005.3620   1493.9970     34.3903      2.7030
+   2006.3020   1493.9740     34.3605      2.7030
+   2007.3450   1493.9750     34.3803      2.6930
+   2008.3030   1493.9800     34.3849      2.6890
+   2009.3010   1493.9780     34.3834      2.6850
+   2010.2660   1493.9930     34.3918      2.6820
+   2011.1920   1494.0000     34.3857      2.6820
+   2012.1640   1494.0130     34.3956      2.6780
+   2013.2330   1494.0230     34.3826      2.6800
+   2014.2620   1494.0290     34.3842      2.6770
+   2015.2340   1494.0410     34.3803      2.6770
+   2016.2520   1494.0570     34.3887      2.6740
+   2017.2080   1494.0680     34.3880      2.6730
+   2018.2200   1494.0680     34.3849      2.6700
+   2019.1860   1494.0760     34.3849      2.6680
+   2020.1460   1494.0850     34.3857      2.6660
+   2021.0660   1494.0920     34.3925      2.6620
+   2022.0840   1494.0990     34.3910      2.6600
+   2023.1080   1494.1070     34.3834      2.6600
+   2024.0320   1494.1150     34.3941      2.6550
+   2024.9830   1494.1150     34.3819      2.6550
+   2025.9880   1494.1200     34.3857      2.6510
+   2027.0780   1494.1340     34.3819      2.6510
+   2028.0100   1494.1490     34.3880      2.6490
+   2028.9840   1494.1650     34.3872      2.6490
+   2030.0240   1494.1710     34.3880      2.6460
+   2030.9990   1494.1830     34.3880      2.6450
+   2031.8920   1494.1930     34.3933      2.6420
+   2032.8870   1494.2030     34.3788      2.6450
+   2034.0030   1494.2200     34.3834      2.6430
+   2034.8410   1494.2270     34.3712      2.6450
+   2035.8370   1494.2440     34.3842      2.6410
+   2037.0030   1494.2560     34.3750      2.6420
+   2037.8440   1494.2640     34.3834      2.6380
+   2038.8400   1494.2730     34.3872      2.6350
+   2039.9020   1494.2860     34.3834      2.6350
+   2040.7630   1494.2960     34.3956      2.6300
+   2041.7520   1494.3050     34.3765      2.6340
+   2042.7870   1494.3190     34.3903      2.6290
+   2043.8350   1494.3300     34.3880      2.6280
+   2044.7350   1494.3360     34.3781      2.6290
+   2045.7990   1494.3420     34.3849      2.6240
+   2046.7150   1494.3470     34.3834      2.6220
+   2047.8720   1494.3660     34.3826      2.6220
+   2048.6510   1494.3780     34.3781      2.6230
+   2049.6930   1494.3970     34.3925      2.6190
+   2050.7020   1494.4050     34.3819      2.6200
+   2051.6390   1494.4160     34.3849      2.6180
+   2052.6190   1494.4270     34.3803      2.6180
+   2053.5780   1494.4390     34.3864      2.6150
+   2054.5610   1494.4510     34.3796      2.6160
+   2055.6860   1494.4650     34.3887      2.6120
+   2056.5530   1494.4730     34.3903      2.6100
+   2057.5610   1494.4800     34.3796      2.6110
+   2058.5060   1494.4890     34.3834      2.6080
@@ -0,0 +1,1003 @@
+test_read_store_and_write
+15/5/2012
+6:11:33
+Probe: MIDAS SVP 6000
+Source: /root/package/data/input/valeport/midas/svp/FILE10.000
+     -0.0930   1474.5270     24.1188      9.4380
+     -0.0290   1474.4360     23.6320      9.5710
+     -0.0090   1474.3890     23.3894      9.6370
+      0.0570   1474.4070     23.3047      9.6690
+      0.1390   1474.4050     23.2651      9.6810
+      0.2440   1474.3780     23.2132      9.6900
+      0.3580   1474.3810     23.2109      9.6910
+      0.4800   1474.3760     23.1934      9.6950
+      0.6510   1474.3440     23.1644      9.6950
+      0.7690   1474.3220     23.1445      9.6950
+      0.8620   1474.2920     23.1155      9.6960
+      0.8700   1474.2080     23.0309      9.7010
+      0.8730   1473.9820     22.8630      9.6950
+      0.8940   1473.9890     22.8745      9.6930
+      0.9060   1473.9830     22.8790      9.6900
+      0.9150   1474.2850     23.0904      9.7020
+      0.9310   1474.3610     23.1499      9.7030
+      0.9390   1474.0150     22.8363      9.7120
+      0.9410   1474.0880     22.9126      9.7070
+      0.9630   1474.0810     22.8996      9.7090
+      0.9750   1474.1900     23.0179      9.7000
+      1.0140   1474.2040     23.0347      9.6980
+      1.0330   1474.1510     22.9752      9.7030
+      1.0750   1474.1570     22.9919      9.6990
+      1.1200   1474.1460     22.9790      9.7000
+      1.1520   1474.1360     22.9675      9.7010
+      1.1990   1474.1500     22.9813      9.7000
+      1.2730   1474.0790     22.9279      9.6980
+      1.3110   1474.0310     22.8882      9.6980
+      1.4030   1474.0050     22.8653      9.6980
+      1.4710   1474.0070     22.8661      9.6980
+      1.5360   1474.0230     22.8905      9.6940
+      1.6190   1473.9950     22.8638      9.6950
+      1.6800   1473.9760     22.8348      9.6990
+      1.7290   1473.9860     22.8668      9.6910
+      1.7950   1473.9840     22.8615      9.6920
+      1.8550   1473.9960     22.8638      9.6940
+      1.9310   1474.0570     22.9164      9.6930
+      2.0390   1474.0130     22.8760      9.6940
+      2.1370   1474.0320     22.8897      9.6940
+      2.2370   1474.1110     22.9507      9.6950
+      2.3610   1474.2980     23.0911      9.6990
+      2.4250   1474.3810     23.1522      9.7010
+      2.5130   1474.3820     23.1552      9.7000
+      2.5600   1474.4190     23.1850      9.7000
+      2.6590   1474.5790     23.3246      9.6970
+      2.7380   1474.7880     23.4924      9.6980
+      2.8140   1474.7680     23.5001      9.6900
+      2.9250   1474.5770     23.3284      9.6940
+      3.0280   1474.4200     23.2040      9.6920
+      3.1380   1474.3990     23.1850      9.6920
+      3.2180   1474.3560     23.1392      9.6950
+      3.3000   1474.2710     23.0560      9.6990
+      3.3560   1474.2460     23.0347      9.6990
+      3.4310   1474.2260     23.0171      9.6990
+      3.5120   1474.2360     23.0331      9.6960
+      3.5900   1474.6040     23.3292      9.6980
+      3.6960   1474.4800     23.2414      9.6930
+      3.7720   1474.6020     23.3467      9.6910
+      3.8870   1474.5820     23.3261      9.6920
+      3.9610   1474.5020     23.2620      9.6910
+      4.0580   1474.5510     23.3101      9.6880
+      4.1540   1474.6220     23.3612      9.6900
+      4.2210   1474.7640     23.4650      9.6940
+      4.3010   1474.7570     23.4612      9.6930
+      4.3810   1474.6430     23.3757      9.6900
+      4.4510   1474.7340     23.4467      9.6910
+      4.5430   1474.8340     23.5397      9.6870
+      4.6090   1474.8800     23.5771      9.6870
+      4.7440   1475.0750     23.7450      9.6840
+      4.8240   1475.2410     23.8716      9.6870
+      4.9320   1475.2240     23.8533      9.6880
+      5.0030   1475.3950     24.0021      9.6850
+      5.0820   1475.4410     24.0265      9.6890
+      5.1540   1475.4810     24.0555      9.6900
+      5.2200   1475.3620     23.9571      9.6900
+      5.3020   1475.3180     23.9227      9.6890
+      5.3870   1475.2820     23.8945      9.6880
+      5.4660   1475.2720     23.8792      9.6900
+      5.5880   1475.3810     23.9647      9.6910
+      5.6890   1475.6490     24.1867      9.6900
+      5.7970   1476.0020     24.4797      9.6890
+      5.9010   1475.8050     24.3156      9.6890
+      5.9580   1475.8690     24.3645      9.6900
+      6.0340   1475.8560     24.3530      9.6900
+      6.0870   1476.0200     24.4873      9.6900
+      6.1620   1476.3550     24.7620      9.6900
+      6.2420   1476.7000     25.0481      9.6890
+      6.3520   1476.8020     25.1434      9.6850
+      6.4830   1477.0610     25.3609      9.6830
+      6.5840   1477.1550     25.4456      9.6800
+      6.6890   1477.3120     25.5829      9.6770
+      6.7780   1477.1770     25.4738      9.6760
+      6.8470   1477.1960     25.4913      9.6750
+      6.9260   1477.4960     25.7500      9.6710
+      7.0090   1477.7340     25.9537      9.6680
+      7.1050   1478.2790     26.4160      9.6630
+      7.1910   1478.1270     26.3115      9.6560
+      7.2930   1478.4300     26.5747      9.6510
+      7.4140   1478.5990     26.7273      9.6460
+      7.5430   1478.7220     26.8326      9.6440
+      7.6010   1478.8090     26.8944      9.6470
+      7.6960   1478.8940     26.9722      9.6440
+      7.7830   1479.0320     27.0660      9.6500
+      7.8480   1479.0370     27.0660      9.6510
+      7.9290   1479.1660     27.1652      9.6530
+      7.9950   1479.2390     27.2369      9.6490
+      8.1090   1479.6640     27.6787      9.6180
+      8.1970   1479.7360     27.8374      9.5850
+      8.3020   1479.8730     28.0098      9.5650
+      8.4170   1479.9110     28.1578      9.5260
+      8.5050   1479.9960     28.3089      9.4990
+      8.6080   1480.1650     28.5095      9.4780
+      8.6950   1480.2750     28.6812      9.4510
+      8.7670   1480.2670     28.7193      9.4360
+      8.8310   1480.3040     28.7605      9.4320
+      8.9170   1480.3380     28.7994      9.4280
+      8.9870   1480.3500     28.8361      9.4190
+      9.0780   1480.3880     28.8872      9.4120
+      9.2060   1480.3680     28.8780      9.4090
+      9.3080   1480.4150     28.9246      9.4060
+      9.3940   1480.4230     28.9421      9.4020
+      9.5130   1480.4530     28.9833      9.3960
+      9.5910   1480.4740     29.0054      9.3940
+      9.6650   1480.4720     29.0237      9.3870
+      9.7350   1480.4740     29.0398      9.3820
+      9.8050   1480.4780     29.0604      9.3760
+      9.8970   1480.4990     29.0733      9.3770
+      9.9900   1480.5150     29.0947      9.3740
+     10.0990   1480.5150     29.1077      9.3690
+     10.1940   1480.5060     29.1328      9.3580
+     10.2790   1480.4990     29.1718      9.3430
+     10.3160   1480.5000     29.1840      9.3390
+     10.3550   1480.5470     29.2404      9.3330
+     10.4180   1480.5840     29.2877      9.3270
+     10.4590   1480.6020     29.3022      9.3270
+     10.5000   1480.6120     29.3068      9.3280
+     10.5840   1480.6220     29.3259      9.3240
+     10.6360   1480.6430     29.3365      9.3260
+     10.6930   1480.6680     29.3625      9.3240
+     10.7280   1480.6820     29.3701      9.3250
+     10.7320   1480.6840     29.3655      9.3270
+     10.7340   1480.6820     29.3610      9.3280
+     10.7390   1480.6790     29.3495      9.3310
+     10.7400   1480.7090     29.3800      9.3290
+     10.9050   1480.5650     29.2145      9.3440
+     11.1490   1480.6010     29.2709      9.3340
+     11.3830   1480.7130     29.3594      9.3340
+     11.6100   1480.7460     29.3922      9.3310
+     11.8780   1480.7320     29.4136      9.3190
+     12.1220   1480.7100     29.4167      9.3110
+     12.3570   1480.8240     29.6165      9.2750
+     12.6000   1480.8690     29.7806      9.2320
+     12.8050   1480.9790     30.0316      9.1780
+     13.0670   1481.0530     30.2048      9.1400
+     13.2980   1481.1410     30.3398      9.1180
+     13.5410   1481.1930     30.4092      9.1080
+     13.7750   1481.1940     30.4283      9.1010
+     14.0040   1481.2010     30.4527      9.0940
+     14.2540   1481.1570     30.4253      9.0900
+     14.4690   1481.4310     30.7098      9.0690
+     14.7020   1481.5780     30.8540      9.0600
+     14.9460   1481.7210     31.0310      9.0390
+     15.2050   1481.7710     31.1867      9.0000
+     15.4470   1481.8250     31.3309      8.9660
+     15.7090   1481.8510     31.4217      8.9420
+     15.9560   1481.8680     31.4835      8.9250
+     16.1750   1481.9120     31.5468      8.9150
+     16.4040   1481.9230     31.5857      8.9040
+     16.6470   1481.8890     31.6010      8.8890
+     16.8760   1481.9640     31.7192      8.8690
+     17.1470   1481.7870     31.7444      8.8120
+     17.4000   1481.7710     31.9557      8.7370
+     17.6840   1482.1660     32.4188      8.6890
+     17.9900   1482.5200     32.8026      8.6560
+     18.2940   1482.6190     32.9094      8.6460
+     18.5900   1482.9220     33.1635      8.6420
+     18.8890   1483.0480     33.2588      8.6430
+     19.2060   1483.1770     33.3534      8.6450
+     19.5330   1483.2580     33.4084      8.6470
+     19.8360   1483.3060     33.4312      8.6510
+     20.1800   1483.3590     33.4633      8.6530
+     20.5040   1483.3840     33.4732      8.6550
+     20.8510   1483.4020     33.4740      8.6580
+     21.1740   1483.4400     33.5098      8.6550
+     21.5050   1483.5210     33.5709      8.6550
+     21.8240   1483.6070     33.6395      8.6540
+     22.1680   1483.6710     33.6990      8.6500
+     22.4840   1483.7190     33.7372      8.6490
+     22.8040   1483.7460     33.7547      8.6490
+     23.1500   1483.7570     33.7891      8.6390
+     23.4870   1483.7570     33.8181      8.6280
+     23.7970   1483.7710     33.8554      8.6180
+     24.1060   1483.7720     33.8791      8.6090
+     24.4630   1483.7330     33.8638      8.6020
+     24.7620   1483.7240     33.8799      8.5930
+     25.1050   1483.7430     33.9058      8.5880
+     25.4340   1483.8370     33.9836      8.5860
+     25.7810   1483.8780     33.9874      8.5940
+     26.0730   1483.8810     33.9836      8.5950
+     26.4260   1483.8720     33.9745      8.5940
+     26.7410   1483.8370     33.9569      8.5890
+     27.0790   1483.7930     33.9500      8.5780
+     27.4150   1483.6970     33.9249      8.5590
+     27.7410   1483.6620     33.9493      8.5400
+     28.0620   1483.7090     34.0286      8.5250
+     28.3630   1483.7260     34.0569      8.5190
+     28.7120   1483.7330     34.0546      8.5200
+     29.0340   1483.7290     34.0622      8.5150
+     29.3660   1483.7220     34.0523      8.5150
+     29.6970   1483.7050     34.0523      8.5090
+     30.0190   1483.6950     34.0637      8.5010
+     30.3540   1483.6940     34.0797      8.4940
+     30.6900   1483.6950     34.0881      8.4900
+     30.9880   1483.6950     34.0996      8.4850
+     31.3190   1483.7010     34.1118      8.4810
+     31.6460   1483.7130     34.1110      8.4830
+     31.9750   1483.7100     34.1194      8.4780
+     32.3150   1483.6920     34.1034      8.4770
+     32.6260   1483.6680     34.1011      8.4700
+     32.9660   1483.6340     34.1080      8.4570
+     33.2830   1483.6130     34.1171      8.4470
+     33.6040   1483.5810     34.1232      8.4350
+     33.9430   1483.5510     34.1461      8.4180
+     34.2740   1483.5250     34.1507      8.4080
+     34.6020   1483.5170     34.1759      8.3960
+     34.9140   1483.4800     34.1843      8.3820
+     35.2530   1483.4500     34.1980      8.3680
+     35.5840   1483.4130     34.2064      8.3540
+     35.9260   1483.4070     34.2270      8.3440
+     36.2560   1483.4050     34.2575      8.3320
+     36.5640   1483.3610     34.2331      8.3270
+     36.8930   1483.3430     34.2529      8.3140
+     37.2060   1483.3230     34.2628      8.3040
+     37.5360   1483.3220     34.2911      8.2930
+     37.8630   1483.3320     34.3163      8.2860
+     38.2020   1483.3310     34.3140      8.2850
+     38.5480   1483.3250     34.3193      8.2800
+     38.8880   1483.3130     34.3178      8.2760
+     39.2320   1483.2780     34.3208      8.2640
+     39.5230   1483.2650     34.3338      8.2550
+     39.8440   1483.2630     34.3460      8.2490
+     40.1710   1483.2650     34.3643      8.2420
+     40.5010   1483.2800     34.3964      8.2340
+     40.8360   1483.2770     34.3956      8.2320
+     41.1640   1483.2730     34.4063      8.2260
+     41.4790   1483.2880     34.4292      8.2210
+     41.8450   1483.2910     34.4421      8.2160
+     42.1800   1483.2880     34.4505      8.2110
+     42.4680   1483.2920     34.4467      8.2120
+     42.7950   1483.2870     34.4505      8.2080
+     43.1160   1483.2760     34.4345      8.2090
+     43.4370   1483.2650     34.4391      8.2030
+     43.7630   1483.2750     34.4704      8.1940
+     44.1070   1483.2930     34.4742      8.1960
+     44.4380   1483.3020     34.4894      8.1920
+     44.7990   1483.3050     34.4994      8.1880
+     45.1030   1483.3200     34.5100      8.1870
+     45.4370   1483.3280     34.5123      8.1870
+     45.7340   1483.3330     34.5123      8.1870
+     46.0720   1483.3370     34.5200      8.1840
+     46.3850   1483.3390     34.5177      8.1840
+     46.7170   1483.3440     34.5261      8.1810
+     47.0540   1483.3460     34.5230      8.1810
+     47.3710   1483.3430     34.5314      8.1760
+     47.6880   1483.3520     34.5345      8.1760
+     48.0100   1483.3610     34.5497      8.1720
+     48.3300   1483.3670     34.5596      8.1690
+     48.6360   1483.3740     34.5703      8.1660
+     48.9720   1483.3810     34.5772      8.1640
+     49.2730   1483.3870     34.5871      8.1610
+     49.5870   1483.3890     34.5879      8.1600
+     49.9270   1483.3920     34.6008      8.1550
+     50.2460   1483.3940     34.6069      8.1520
+     50.5840   1483.3940     34.6085      8.1500
+     50.9060   1483.3990     34.6176      8.1470
+     51.2410   1483.3730     34.5985      8.1450
+     51.5760   1483.3390     34.5848      8.1390
+     51.8840   1483.3370     34.6153      8.1270
+     52.2040   1483.3410     34.6268      8.1230
+     52.5260   1483.3400     34.6306      8.1200
+     52.8230   1483.3540     34.6466      8.1170
+     53.1600   1483.3680     34.6657      8.1130
+     53.4990   1483.3830     34.6764      8.1120
+     53.7990   1483.3880     34.6642      8.1160
+     54.1420   1483.3870     34.6741      8.1110
+     54.4670   1483.3850     34.6832      8.1060
+     54.7650   1483.3660     34.6733      8.1030
+     55.1020   1483.3600     34.6848      8.0960
+     55.4210   1483.3680     34.6962      8.0930
+     55.7140   1483.3770     34.7031      8.0920
+     56.0670   1483.3830     34.7031      8.0920
+     56.3780   1483.3920     34.7122      8.0900
+     56.7240   1483.3960     34.7198      8.0870
+     57.0570   1483.3950     34.7145      8.0870
+     57.3550   1483.3960     34.7267      8.0820
+     57.6760   1483.3970     34.7229      8.0820
+     58.0010   1483.3990     34.7237      8.0810
+     58.3230   1483.4040     34.7351      8.0770
+     58.6380   1483.4130     34.7412      8.0760
+     58.9420   1483.4240     34.7397      8.0780
+     59.2940   1483.4230     34.7435      8.0750
+     59.6220   1483.4210     34.7374      8.0750
+     59.9030   1483.4210     34.7488      8.0700
+     60.2050   1483.4180     34.7519      8.0670
+     60.5110   1483.4200     34.7580      8.0640
+     60.8240   1483.4330     34.7618      8.0650
+     61.1300   1483.4390     34.7656      8.0640
+     61.4310   1483.4420     34.7702      8.0620
+     61.7630   1483.4420     34.7687      8.0610
+     62.0540   1483.4470     34.7748      8.0590
+     62.3760   1483.4520     34.7717      8.0600
+     62.6860   1483.4560     34.7763      8.0580
+     62.9960   1483.4610     34.7794      8.0570
+     63.3080   1483.4610     34.7786      8.0560
+     63.6170   1483.4650     34.7839      8.0540
+     63.9310   1483.4590     34.7748      8.0540
+     64.2400   1483.4580     34.7755      8.0520
+     64.5560   1483.4570     34.7824      8.0480
+     64.8640   1483.4610     34.7847      8.0470
+     65.1750   1483.4630     34.7855      8.0460
+     65.5120   1483.4640     34.7878      8.0440
+     65.8000   1483.4640     34.7961      8.0400
+     66.0840   1483.4600     34.7832      8.0420
+     66.4010   1483.4610     34.8007      8.0350
+     66.7210   1483.4630     34.8106      8.0310
+     67.0330   1483.4650     34.7984      8.0340
+     67.3500   1483.4660     34.8076      8.0300
+     67.6550   1483.4700     34.8099      8.0290
+     67.9590   1483.4720     34.8099      8.0280
+     68.2990   1483.4740     34.8251      8.0220
+     68.5860   1483.4790     34.8137      8.0260
+     68.8970   1483.4830     34.8099      8.0270
+     69.1950   1483.4880     34.8129      8.0260
+     69.5040   1483.4900     34.8221      8.0220
+     69.7970   1483.4960     34.8236      8.0220
+     70.1320   1483.5000     34.8251      8.0210
+     70.4470   1483.5040     34.8244      8.0210
+     70.7400   1483.5120     34.8328      8.0190
+     71.0690   1483.5160     34.8251      8.0210
+     71.3700   1483.5190     34.8328      8.0180
+     71.6900   1483.5240     34.8297      8.0190
+     71.9940   1483.5270     34.8251      8.0200
+     72.2880   1483.5330     34.8228      8.0210
+     72.6040   1483.5390     34.8328      8.0180
+     72.9120   1483.5390     34.8343      8.0160
+     73.2380   1483.5440     34.8343      8.0160
+     73.5300   1483.5450     34.8282      8.0170
+     73.8580   1483.5480     34.8289      8.0160
+     74.1490   1483.5530     34.8412      8.0120
+     74.4550   1483.5550     34.8389      8.0120
+     74.7730   1483.5570     34.8427      8.0100
+     75.0780   1483.5600     34.8412      8.0100
+     75.3970   1483.5650     34.8404      8.0100
+     75.7090   1483.5690     34.8488      8.0070
+     76.0450   1483.5720     34.8434      8.0080
+     76.3290   1483.5760     34.8343      8.0110
+     76.6490   1483.5800     34.8419      8.0080
+     76.9520   1483.5800     34.8412      8.0070
+     77.2570   1483.5830     34.8366      8.0080
+     77.5710   1483.5880     34.8419      8.0060
+     77.8820   1483.5880     34.8442      8.0040
+     78.2070   1483.5900     34.8503      8.0010
+     78.5370   1483.5920     34.8480      8.0010
+     78.8450   1483.5950     34.8518      7.9990
+     79.1380   1483.5960     34.8427      8.0010
+     79.4480   1483.5940     34.8373      8.0010
+     79.7450   1483.5960     34.8381      8.0000
+     80.0420   1483.6000     34.8495      7.9960
+     80.3710   1483.6030     34.8503      7.9950
+     80.6820   1483.6040     34.8412      7.9970
+     81.0130   1483.6090     34.8526      7.9930
+     81.3330   1483.6110     34.8442      7.9950
+     81.6460   1483.6150     34.8640      7.9880
+     81.9360   1483.6180     34.8572      7.9900
+     82.2430   1483.6210     34.8579      7.9890
+     82.5470   1483.6270     34.8587      7.9890
+     82.8340   1483.6320     34.8648      7.9870
+     83.1680   1483.6370     34.8618      7.9880
+     83.4720   1483.6410     34.8671      7.9860
+     83.8170   1483.6380     34.8511      7.9890
+     84.1370   1483.6380     34.8618      7.9840
+     84.4520   1483.6410     34.8663      7.9820
+     84.7230   1483.6450     34.8656      7.9820
+     85.0050   1483.6490     34.8587      7.9840
+     85.2950   1483.6550     34.8633      7.9830
+     85.6100   1483.6670     34.8686      7.9830
+     85.9370   1483.6720     34.8679      7.9830
+     86.2450   1483.6780     34.8778      7.9800
+     86.5710   1483.6810     34.8793      7.9790
+     86.9010   1483.6850     34.8656      7.9830
+     87.1980   1483.6870     34.8755      7.9790
+     87.5120   1483.6870     34.8717      7.9790
+     87.8120   1483.6930     34.8755      7.9780
+     88.1350   1483.6970     34.8770      7.9770
+     88.4180   1483.7010     34.8801      7.9760
+     88.7280   1483.7050     34.8694      7.9790
+     89.0550   1483.7100     34.8785      7.9760
+     89.3630   1483.7100     34.8679      7.9780
+     89.6810   1483.7130     34.8816      7.9730
+     90.0070   1483.7180     34.8846      7.9720
+     90.2910   1483.7210     34.8770      7.9740
+     90.5940   1483.7160     34.8747      7.9720
+     90.8960   1483.7190     34.8793      7.9700
+     91.2100   1483.7240     34.8854      7.9680
+     91.5490   1483.7280     34.8869      7.9670
+     91.8610   1483.7170     34.8740      7.9670
+     92.1710   1483.7070     34.8831      7.9600
+     92.4770   1483.7050     34.8740      7.9610
+     92.7830   1483.7070     34.8869      7.9560
+     93.0650   1483.7100     34.8946      7.9530
+     93.3750   1483.7130     34.8930      7.9530
+     93.7150   1483.7160     34.8907      7.9530
+     94.0170   1483.7140     34.8946      7.9500
+     94.3520   1483.7130     34.9014      7.9460
+     94.6750   1483.7110     34.9014      7.9440
+     95.0000   1483.7130     34.8991      7.9440
+     95.3030   1483.7160     34.9030      7.9420
+     95.6100   1483.7180     34.9007      7.9420
+     95.9130   1483.7210     34.9052      7.9400
+     96.2320   1483.7200     34.8877      7.9440
+     96.5080   1483.7230     34.9022      7.9390
+     96.8450   1483.7180     34.8999      7.9370
+     97.1560   1483.7180     34.8984      7.9360
+     97.4850   1483.7190     34.9007      7.9340
+     97.7980   1483.7160     34.9007      7.9320
+     98.1060   1483.7180     34.8976      7.9320
+     98.4030   1483.7200     34.9014      7.9300
+     98.6820   1483.7210     34.9136      7.9250
+     99.0100   1483.7220     34.9014      7.9280
+     99.3230   1483.7270     34.9167      7.9230
+     99.6370   1483.7320     34.9129      7.9240
+     99.9540   1483.7360     34.9091      7.9250
+    100.2830   1483.7400     34.9136      7.9230
+    100.6070   1483.7380     34.9174      7.9200
+    100.9260   1483.7400     34.9083      7.9220
+    101.2110   1483.7440     34.9106      7.9210
+    101.4910   1483.7490     34.9083      7.9220
+    101.8230   1483.7530     34.9129      7.9200
+    102.1190   1483.7570     34.9182      7.9180
+    102.4250   1483.7580     34.9182      7.9170
+    102.7620   1483.7610     34.9037      7.9210
+    103.0820   1483.7640     34.9144      7.9170
+    103.4020   1483.7690     34.9197      7.9150
+    103.7370   1483.7710     34.9144      7.9160
+    104.0240   1483.7700     34.9190      7.9130
+    104.3260   1483.7690     34.9106      7.9140
+    104.6360   1483.7640     34.9060      7.9130
+    104.9200   1483.7570     34.9052      7.9100
+    105.2430   1483.7480     34.8999      7.9080
+    105.5490   1483.7520     34.9022      7.9070
+    105.8860   1483.7530     34.9197      7.9000
+    106.2030   1483.7520     34.9144      7.9000
+    106.5190   1483.7570     34.9236      7.8970
+    106.8160   1483.7580     34.9113      7.9000
+    107.1210   1483.7580     34.9319      7.8920
+    107.4260   1483.7630     34.9289      7.8930
+    107.7440   1483.7700     34.9266      7.8940
+    108.0590   1483.7750     34.9358      7.8910
+    108.3790   1483.7810     34.9274      7.8940
+    108.6870   1483.7880     34.9319      7.8930
+    108.9910   1483.7930     34.9350      7.8920
+    109.3050   1483.7980     34.9380      7.8910
+    109.5990   1483.8040     34.9266      7.8950
+    109.9290   1483.8090     34.9350      7.8920
+    110.2490   1483.8070     34.9327      7.8910
+    110.5440   1483.8060     34.9182      7.8940
+    110.8680   1483.8020     34.9258      7.8890
+    111.1960   1483.8040     34.9266      7.8880
+    111.5070   1483.8100     34.9365      7.8850
+    111.8530   1483.8100     34.9258      7.8870
+    112.1550   1483.7980     34.9152      7.8860
+    112.4870   1483.7970     34.9159      7.8840
+    112.8100   1483.7980     34.9365      7.8760
+    113.1500   1483.7990     34.9388      7.8740
+    113.4660   1483.8020     34.9312      7.8760
+    113.8130   1483.8050     34.9350      7.8740
+    114.1410   1483.8060     34.9403      7.8710
+    114.4640   1483.8100     34.9365      7.8720
+    114.7690   1483.8150     34.9457      7.8690
+    115.1150   1483.8190     34.9411      7.8700
+    115.4310   1483.8240     34.9350      7.8720
+    115.7470   1483.8290     34.9403      7.8700
+    116.0860   1483.8330     34.9487      7.8670
+    116.4150   1483.8380     34.9449      7.8680
+    116.7610   1483.8400     34.9358      7.8700
+    117.0700   1483.8390     34.9434      7.8660
+    117.3800   1483.8440     34.9464      7.8650
+    117.6930   1483.8470     34.9442      7.8650
+    118.0250   1483.8470     34.9342      7.8670
+    118.3410   1483.8500     34.9380      7.8650
+    118.6540   1483.8530     34.9457      7.8620
+    119.0030   1483.8590     34.9396      7.8640
+    119.3200   1483.8640     34.9426      7.8630
+    119.6470   1483.8670     34.9403      7.8630
+    119.9880   1483.8710     34.9396      7.8630
+    120.2940   1483.8750     34.9533      7.8580
+    120.6270   1483.8770     34.9419      7.8610
+    120.9390   1483.8800     34.9457      7.8590
+    121.2660   1483.8820     34.9434      7.8590
+    121.5930   1483.8830     34.9457      7.8570
+    121.9190   1483.8840     34.9388      7.8580
+    122.2580   1483.8850     34.9480      7.8540
+    122.5520   1483.8870     34.9518      7.8520
+    122.8910   1483.8940     34.9525      7.8520
+    123.2080   1483.8980     34.9396      7.8560
+    123.5390   1483.9030     34.9419      7.8550
+    123.8580   1483.9080     34.9480      7.8530
+    124.1680   1483.9150     34.9495      7.8530
+    124.5100   1483.9190     34.9419      7.8550
+    124.8130   1483.9240     34.9449      7.8540
+    125.1620   1483.9300     34.9480      7.8530
+    125.4750   1483.9350     34.9510      7.8520
+    125.8010   1483.9390     34.9564      7.8500
+    126.0980   1483.9450     34.9480      7.8530
+    126.4200   1483.9480     34.9457      7.8530
+    126.7230   1483.9520     34.9510      7.8510
+    127.0660   1483.9560     34.9586      7.8480
+    127.3910   1483.9600     34.9396      7.8540
+    127.7120   1483.9600     34.9472      7.8500
+    128.0340   1483.9610     34.9472      7.8490
+    128.3710   1483.9620     34.9464      7.8480
+    128.6740   1483.9610     34.9380      7.8490
+    128.9950   1483.9640     34.9457      7.8460
+    129.3080   1483.9680     34.9419      7.8470
+    129.6160   1483.9680     34.9525      7.8420
+    129.9440   1483.9710     34.9510      7.8420
+    130.2910   1483.9740     34.9487      7.8420
+    130.6190   1483.9760     34.9487      7.8410
+    130.9190   1483.9780     34.9617      7.8360
+    131.2540   1483.9790     34.9548      7.8370
+    131.5480   1483.9830     34.9510      7.8380
+    131.8690   1483.9840     34.9541      7.8360
+    132.1970   1483.9850     34.9564      7.8340
+    132.5210   1483.9880     34.9548      7.8340
+    132.8400   1483.9930     34.9541      7.8340
+    133.1760   1483.9940     34.9594      7.8310
+    133.4980   1483.9980     34.9525      7.8330
+    133.8280   1484.0010     34.9503      7.8330
+    134.1370   1484.0050     34.9586      7.8300
+    134.4750   1484.0080     34.9602      7.8290
+    134.7660   1484.0040     34.9556      7.8280
+    135.0650   1484.0050     34.9556      7.8270
+    135.4180   1484.0080     34.9533      7.8270
+    135.7210   1484.0130     34.9472      7.8290
+    136.0630   1484.0170     34.9640      7.8230
+    136.3790   1484.0220     34.9548      7.8260
+    136.7070   1484.0250     34.9617      7.8230
+    137.0160   1484.0300     34.9464      7.8280
+    137.3470   1484.0320     34.9564      7.8240
+    137.6840   1484.0350     34.9480      7.8260
+    138.0130   1484.0350     34.9617      7.8200
+    138.3370   1484.0340     34.9472      7.8230
+    138.6640   1484.0360     34.9571      7.8190
+    138.9900   1484.0390     34.9518      7.8200
+    139.3130   1484.0420     34.9564      7.8180
+    139.6310   1484.0440     34.9594      7.8160
+    139.9290   1484.0450     34.9655      7.8130
+    140.2530   1484.0460     34.9594      7.8140
+    140.5530   1484.0460     34.9487      7.8160
+    140.9070   1484.0440     34.9426      7.8160
+    141.2200   1484.0440     34.9449      7.8140
+    141.5630   1484.0470     34.9518      7.8110
+    141.8570   1484.0470     34.9449      7.8120
+    142.1850   1484.0520     34.9564      7.8080
+    142.4890   1484.0540     34.9602      7.8060
+    142.8240   1484.0600     34.9602      7.8060
+    143.1150   1484.0660     34.9678      7.8040
+    143.4190   1484.0690     34.9625      7.8050
+    143.7550   1484.0740     34.9564      7.8070
+    144.0630   1484.0790     34.9625      7.8050
+    144.3940   1484.0840     34.9586      7.8060
+    144.7100   1484.0880     34.9609      7.8050
+    145.0320   1484.0900     34.9609      7.8040
+    145.3270   1484.0940     34.9602      7.8040
+    145.6460   1484.0970     34.9617      7.8030
+    145.9600   1484.0990     34.9594      7.8030
+    146.2620   1484.1010     34.9533      7.8040
+    146.5670   1484.1030     34.9602      7.8010
+    146.8370   1484.1070     34.9663      7.7990
+    147.1350   1484.1110     34.9655      7.7990
+    147.4430   1484.1160     34.9655      7.7990
+    147.7810   1484.1210     34.9556      7.8020
+    148.0550   1484.1250     34.9518      7.8030
+    148.3750   1484.1310     34.9678      7.7980
+    148.6860   1484.1360     34.9648      7.7990
+    149.0090   1484.1410     34.9586      7.8010
+    149.3180   1484.1430     34.9617      7.7990
+    149.6560   1484.1460     34.9602      7.7990
+    149.9520   1484.1510     34.9632      7.7980
+    150.2580   1484.1540     34.9609      7.7980
+    150.5960   1484.1560     34.9464      7.8020
+    150.8860   1484.1570     34.9617      7.7960
+    151.2240   1484.1580     34.9670      7.7930
+    151.5530   1484.1610     34.9525      7.7970
+    151.8790   1484.1610     34.9602      7.7930
+    152.2000   1484.1620     34.9602      7.7920
+    152.4990   1484.1680     34.9670      7.7900
+    152.8160   1484.1740     34.9648      7.7910
+    153.1350   1484.1770     34.9625      7.7910
+    153.4640   1484.1820     34.9686      7.7890
+    153.7820   1484.1870     34.9594      7.7920
+    154.0940   1484.1910     34.9701      7.7880
+    154.4110   1484.1960     34.9640      7.7900
+    154.7320   1484.1960     34.9655      7.7880
+    155.0610   1484.1940     34.9693      7.7850
+    155.3830   1484.1910     34.9625      7.7850
+    155.6860   1484.1960     34.9625      7.7850
+    155.9790   1484.1960     34.9678      7.7820
+    156.3400   1484.1960     34.9625      7.7820
+    156.6280   1484.2000     34.9625      7.7820
+    156.9380   1484.2020     34.9655      7.7800
+    157.2660   1484.2070     34.9625      7.7810
+    157.5810   1484.2130     34.9754      7.7770
+    157.9100   1484.2170     34.9678      7.7790
+    158.2330   1484.2210     34.9701      7.7780
+    158.5180   1484.2240     34.9655      7.7790
+    158.8390   1484.2280     34.9670      7.7780
+    159.1540   1484.2340     34.9739      7.7760
+    159.4500   1484.2330     34.9754      7.7740
+    159.7870   1484.2290     34.9678      7.7740
+    160.1160   1484.2310     34.9617      7.7750
+    160.4540   1484.2330     34.9586      7.7750
+    160.7440   1484.2370     34.9648      7.7730
+    161.0620   1484.2380     34.9640      7.7720
+    161.3830   1484.2400     34.9678      7.7700
+    161.6830   1484.2390     34.9625      7.7700
+    161.9940   1484.2430     34.9678      7.7680
+    162.3200   1484.2480     34.9739      7.7660
+    162.6260   1484.2470     34.9716      7.7650
+    162.9220   1484.2510     34.9678      7.7660
+    163.2050   1484.2530     34.9594      7.7680
+    163.5170   1484.2570     34.9739      7.7630
+    163.8300   1484.2570     34.9640      7.7650
+    164.1110   1484.2610     34.9663      7.7640
+    164.3510   1484.2650     34.9754      7.7610
+    164.6400   1484.2690     34.9716      7.7620
+    164.9110   1484.2720     34.9678      7.7630
+    165.1890   1484.2760     34.9823      7.7580
+    165.4690   1484.2810     34.9731      7.7610
+    165.7230   1484.2830     34.9686      7.7620
+    166.0260   1484.2830     34.9709      7.7600
+    166.3060   1484.2840     34.9678      7.7600
+    166.6330   1484.2850     34.9579      7.7620
+    166.9550   1484.2900     34.9731      7.7570
+    167.2570   1484.2930     34.9716      7.7570
+    167.5960   1484.2980     34.9770      7.7550
+    167.9150   1484.3010     34.9724      7.7560
+    168.2320   1484.3060     34.9716      7.7560
+    168.5570   1484.3100     34.9739      7.7550
+    168.8310   1484.3150     34.9678      7.7570
+    169.1570   1484.3150     34.9640      7.7570
+    169.5000   1484.3180     34.9617      7.7570
+    169.7960   1484.3220     34.9670      7.7550
+    170.1180   1484.3270     34.9762      7.7520
+    170.4330   1484.3300     34.9770      7.7510
+    170.7800   1484.3330     34.9625      7.7550
+    171.0580   1484.3370     34.9716      7.7520
+    171.3680   1484.3410     34.9701      7.7520
+    171.6990   1484.3420     34.9762      7.7490
+    172.0270   1484.3450     34.9678      7.7510
+    172.3310   1484.3460     34.9617      7.7520
+    172.6310   1484.3500     34.9670      7.7500
+    172.9670   1484.3550     34.9693      7.7490
+    173.2860   1484.3610     34.9731      7.7480
+    173.5880   1484.3630     34.9648      7.7500
+    173.9280   1484.3660     34.9655      7.7490
+    174.2310   1484.3700     34.9739      7.7460
+    174.5350   1484.3730     34.9663      7.7480
+    174.8470   1484.3740     34.9686      7.7460
+    175.1740   1484.3780     34.9678      7.7460
+    175.4720   1484.3810     34.9663      7.7460
+    175.8020   1484.3870     34.9754      7.7430
+    176.1070   1484.3910     34.9686      7.7450
+    176.4390   1484.3960     34.9716      7.7440
+    176.7580   1484.4000     34.9609      7.7470
+    177.0440   1484.4030     34.9693      7.7440
+    177.3740   1484.4080     34.9655      7.7450
+    177.6860   1484.4120     34.9770      7.7410
+    178.0160   1484.4160     34.9724      7.7420
+    178.3250   1484.4200     34.9716      7.7420
+    178.6480   1484.4230     34.9701      7.7420
+    178.9490   1484.4260     34.9716      7.7410
+    179.2580   1484.4280     34.9716      7.7400
+    179.5810   1484.4260     34.9594      7.7420
+    179.8920   1484.4200     34.9541      7.7410
+    180.1960   1484.4150     34.9548      7.7380
+    180.4920   1484.4160     34.9609      7.7350
+    180.8450   1484.4170     34.9663      7.7320
+    181.1380   1484.4200     34.9678      7.7310
+    181.4730   1484.4250     34.9579      7.7340
+    181.8040   1484.4300     34.9701      7.7300
+    182.1080   1484.4340     34.9693      7.7300
+    182.4180   1484.4390     34.9724      7.7290
+    182.7300   1484.4450     34.9854      7.7250
+    183.0400   1484.4510     34.9762      7.7280
+    183.3590   1484.4570     34.9739      7.7290
+    183.6680   1484.4610     34.9701      7.7300
+    184.0020   1484.4690     34.9724      7.7300
+    184.3200   1484.4710     34.9754      7.7280
+    184.6290   1484.4790     34.9716      7.7300
+    184.9540   1484.4760     34.9770      7.7260
+    185.2750   1484.4770     34.9709      7.7270
+    185.5710   1484.4820     34.9678      7.7280
+    185.8850   1484.4870     34.9739      7.7260
+    186.1880   1484.4900     34.9747      7.7250
+    186.5040   1484.4940     34.9770      7.7240
+    186.8260   1484.5010     34.9693      7.7270
+    187.1430   1484.5040     34.9709      7.7260
+    187.4380   1484.5050     34.9701      7.7250
+    187.7690   1484.5100     34.9640      7.7270
+    188.0850   1484.5140     34.9724      7.7240
+    188.4190   1484.5190     34.9777      7.7220
+    188.7260   1484.5210     34.9754      7.7220
+    189.0240   1484.5180     34.9625      7.7240
+    189.3390   1484.5220     34.9739      7.7200
+    189.6590   1484.5250     34.9663      7.7220
+    189.9860   1484.5290     34.9739      7.7190
+    190.2890   1484.5340     34.9770      7.7180
+    190.6080   1484.5400     34.9686      7.7210
+    190.9240   1484.5460     34.9724      7.7200
+    191.2220   1484.5520     34.9762      7.7190
+    191.5610   1484.5570     34.9724      7.7200
+    191.8570   1484.5620     34.9724      7.7200
+    192.1750   1484.5650     34.9739      7.7190
+    192.4970   1484.5690     34.9724      7.7190
+    192.8170   1484.5710     34.9762      7.7170
+    193.1120   1484.5750     34.9754      7.7170
+    193.4490   1484.5750     34.9617      7.7200
+    193.7550   1484.5800     34.9709      7.7170
+    194.0580   1484.5840     34.9701      7.7170
+    194.3890   1484.5890     34.9785      7.7140
+    194.6880   1484.5910     34.9762      7.7140
+    195.0080   1484.5910     34.9754      7.7130
+    195.3370   1484.5930     34.9724      7.7130
+    195.6320   1484.5940     34.9663      7.7140
+    195.9470   1484.5990     34.9632      7.7150
+    196.2660   1484.6030     34.9800      7.7090
+    196.5900   1484.6070     34.9731      7.7110
+    196.9170   1484.6110     34.9716      7.7110
+    197.2000   1484.6120     34.9693      7.7110
+    197.4900   1484.6130     34.9754      7.7080
+    197.7910   1484.6140     34.9625      7.7110
+    198.1180   1484.6150     34.9716      7.7070
+    198.4220   1484.6170     34.9747      7.7050
+    198.7560   1484.6180     34.9655      7.7070
+    199.0480   1484.6200     34.9693      7.7050
+    199.3520   1484.6230     34.9648      7.7060
+    199.6600   1484.6240     34.9762      7.7010
+    199.9920   1484.6280     34.9785      7.7000
+    200.2840   1484.6310     34.9770      7.7000
+    200.5920   1484.6290     34.9739      7.6990
+    200.9230   1484.6250     34.9663      7.6990
+    201.2380   1484.6270     34.9670      7.6980
+    201.5570   1484.6290     34.9640      7.6980
+    201.8640   1484.6310     34.9678      7.6960
+    202.1770   1484.6340     34.9693      7.6950
+    202.4650   1484.6360     34.9731      7.6930
+    202.7710   1484.6410     34.9640      7.6960
+    203.0960   1484.6420     34.9754      7.6910
+    203.4100   1484.6450     34.9739      7.6910
+    203.7180   1484.6460     34.9770      7.6890
+    204.0490   1484.6490     34.9686      7.6910
+    204.3410   1484.6520     34.9731      7.6890
+    204.6420   1484.6500     34.9709      7.6880
+    204.9530   1484.6490     34.9716      7.6860
+    205.2480   1484.6530     34.9709      7.6860
+    205.5730   1484.6540     34.9739      7.6840
+    205.8630   1484.6550     34.9831      7.6800
+    206.1810   1484.6620     34.9777      7.6820
+    206.5230   1484.6680     34.9754      7.6830
+    206.8310   1484.6730     34.9754      7.6830
+    207.1620   1484.6770     34.9739      7.6830
+    207.4810   1484.6840     34.9785      7.6820
+    207.7970   1484.6880     34.9777      7.6820
+    208.0870   1484.6850     34.9678      7.6830
+    208.4060   1484.6890     34.9823      7.6780
+    208.7090   1484.6940     34.9823      7.6780
+    209.0190   1484.6960     34.9739      7.6800
+    209.3120   1484.7000     34.9701      7.6810
+    209.6440   1484.7000     34.9747      7.6780
+    209.9720   1484.7020     34.9686      7.6790
+    210.2920   1484.7020     34.9648      7.6790
+    210.6010   1484.7050     34.9686      7.6770
+    210.9030   1484.7080     34.9762      7.6740
+    211.2250   1484.7040     34.9693      7.6740
+    211.5100   1484.7020     34.9632      7.6740
+    211.8420   1484.7060     34.9716      7.6710
+    212.1540   1484.7120     34.9724      7.6710
+    212.4510   1484.7170     34.9693      7.6720
+    212.7650   1484.7230     34.9762      7.6700
+    213.0680   1484.7260     34.9808      7.6680
+    213.3820   1484.7250     34.9724      7.6690
+    213.7060   1484.7110     34.9632      7.6670
+    213.9910   1484.7030     34.9617      7.6640
+    214.3160   1484.7050     34.9594      7.6640
+    214.6380   1484.7120     34.9693      7.6610
+    214.9520   1484.7140     34.9701      7.6600
+    215.2650   1484.7190     34.9731      7.6590
+    215.5750   1484.7220     34.9808      7.6560
+    215.8930   1484.7270     34.9678      7.6600
+    216.1800   1484.7270     34.9762      7.6560
+    216.4770   1484.7270     34.9663      7.6580
+    216.8130   1484.7270     34.9678      7.6560
+    217.0980   1484.7280     34.9709      7.6540
+    217.4570   1484.7340     34.9739      7.6530
+    217.7540   1484.7360     34.9716      7.6530
+    218.0720   1484.7400     34.9800      7.6500
+    218.3860   1484.7440     34.9701      7.6530
+    218.6920   1484.7470     34.9716      7.6520
+    219.0000   1484.7500     34.9754      7.6500
+    219.3110   1484.7500     34.9655      7.6520
+    219.6150   1484.7520     34.9693      7.6500
+    219.9460   1484.7580     34.9693      7.6500
+    220.2410   1484.7590     34.9754      7.6470
+    220.5690   1484.7640     34.9754      7.6470
+    220.8640   1484.7680     34.9625      7.6510
+    221.1920   1484.7740     34.9777      7.6460
+    221.4720   1484.7770     34.9739      7.6470
+    221.7820   1484.7790     34.9678      7.6480
+    222.1060   1484.7840     34.9739      7.6460
+    222.4180   1484.7870     34.9785      7.6440
+    222.7230   1484.7890     34.9785      7.6430
+    223.0220   1484.7920     34.9709      7.6450
+    223.3490   1484.7960     34.9701      7.6450
+    223.6630   1484.7990     34.9770      7.6420
+    223.9690   1484.7990     34.9762      7.6410
+    224.2850   1484.8030     34.9754      7.6410
+    224.5950   1484.8060     34.9709      7.6420
+    224.8770   1484.8060     34.9670      7.6420
+    225.2130   1484.8100     34.9808      7.6370
+    225.5330   1484.8130     34.9823      7.6360
+    225.8520   1484.8160     34.9709      7.6390
+    226.1540   1484.8190     34.9724      7.6380
+    226.4590   1484.8220     34.9831      7.6340
+    226.7970   1484.8230     34.9731      7.6360
+    227.1070   1484.8270     34.9663      7.6380
+    227.4150   1484.8290     34.9731      7.6350
+    227.7090   1484.8340     34.9731      7.6350
+    228.0260   1484.8390     34.9693      7.6360
+    228.3480   1484.8430     34.9777      7.6330
+    228.6510   1484.8480     34.9747      7.6340
+    228.9320   1484.8550     34.9854      7.6310
+    229.2570   1484.8600     34.9792      7.6330
+    229.5640   1484.8640     34.9754      7.6340
+    229.8900   1484.8710     34.9792      7.6330
+    230.1890   1484.8730     34.9770      7.6330
+    230.5180   1484.8740     34.9709      7.6340
+    230.8350   1484.8760     34.9739      7.6320
+    231.1510   1484.8770     34.9770      7.6300
+    231.4510   1484.8790     34.9747      7.6300
+    231.7450   1484.8780     34.9701      7.6300
+    232.0420   1484.8770     34.9617      7.6310
+    232.3350   1484.8700     34.9648      7.6270
+    232.6130   1484.8680     34.9564      7.6280
+    232.8650   1484.8670     34.9640      7.6240
+    233.0930   1484.8680     34.9747      7.6200
+    233.3430   1484.8680     34.9678      7.6210
+    233.5240   1484.8700     34.9762      7.6180
+    233.7480   1484.8690     34.9754      7.6170
+    233.9570   1484.8700     34.9709      7.6180
+    234.1440   1484.8740     34.9777      7.6160
+    234.3660   1484.8770     34.9770      7.6160
+    234.5470   1484.8750     34.9640      7.6190
+    234.7520   1484.8770     34.9716      7.6160
+    234.9530   1484.8800     34.9716      7.6160
+    235.1440   1484.8820     34.9731      7.6150
+    235.3610   1484.8850     34.9701      7.6160
+    235.5550   1484.8870     34.9815      7.6120
+    235.7370   1484.8880     34.9823      7.6110
+    235.9460   1484.8850     34.9716      7.6130
+    236.1640   1484.8890     34.9747      7.6120
+    236.3600   1484.8900     34.9640      7.6150
+    236.5010   1484.8910     34.9686      7.6130
+    236.6100   1484.8900     34.9724      7.6110
+    236.7500   1484.8920     34.9754      7.6100
+    236.8750   1484.8920     34.9709      7.6110
+    237.0090   1484.8920     34.9686      7.6110
+    237.1350   1484.8950     34.9754      7.6090
+    237.2710   1484.8970     34.9724      7.6100
+    237.4050   1484.8980     34.9716      7.6100
+    237.5420   1484.9020     34.9823      7.6070
+    237.6860   1484.9040     34.9724      7.6100
+    237.8010   1484.9050     34.9747      7.6090
+    237.9290   1484.9070     34.9808      7.6070
+    238.0640   1484.9100     34.9724      7.6100
+    238.2000   1484.9120     34.9785      7.6080
+    238.3180   1484.9140     34.9846      7.6060
+    238.4730   1484.9180     34.9823      7.6070
+    238.6210   1484.9180     34.9838      7.6060
+    238.7630   1484.9210     34.9808      7.6070
+    238.8990   1484.9220     34.9800      7.6070
+    239.0610   1484.9240     34.9823      7.6060
+    239.1960   1484.9270     34.9800      7.6070
+    239.3230   1484.9270     34.9785      7.6070
+    239.5040   1484.9280     34.9800      7.6060
+    239.6280   1484.9290     34.9792      7.6060
+    239.7860   1484.9330     34.9800      7.6060
+    239.9130   1484.9340     34.9731      7.6080
+    240.0620   1484.9370     34.9823      7.6050
+    240.1950   1484.9390     34.9731      7.6080
+    240.3590   1484.9400     34.9716      7.6080
+    240.4790   1484.9390     34.9693      7.6080
+    240.6350   1484.9380     34.9731      7.6060
+    240.7750   1484.9390     34.9747      7.6050
+    240.9010   1484.9390     34.9792      7.6030
+    241.0480   1484.9410     34.9762      7.6040
+    241.1900   1484.9440     34.9792      7.6030
+    241.3220   1484.9470     34.9770      7.6040
+    241.4830   1484.9450     34.9762      7.6030
+    241.5950   1484.9470     34.9792      7.6020
+    241.7750   1484.9460     34.9701      7.6040
+    241.9140   1484.9430     34.9815      7.5990
+    242.0510   1484.9410     34.9747      7.6000
+    242.2010   1484.9430     34.9716      7.6010
+    242.3480   1484.9430     34.9693      7.6010
+    242.4480   1484.9470     34.9770      7.5990
+    242.6120   1484.9480     34.9792      7.5980
+    242.7850   1484.9500     34.9815      7.5970
+    242.8920   1484.9470     34.9747      7.5980
+    243.0390   1484.9500     34.9716      7.5990
+    243.1810   1484.9510     34.9739      7.5980
+    243.3330   1484.9500     34.9831      7.5940
+    243.4670   1484.9520     34.9800      7.5950
+    243.6290   1484.9520     34.9747      7.5960
+    243.7610   1484.9530     34.9739      7.5960
+    243.9120   1484.9550     34.9762      7.5950
+    244.0440   1484.9570     34.9731      7.5960
+    244.1740   1484.9600     34.9800      7.5940
+    244.3220   1484.9620     34.9831      7.5930
+    244.4690   1484.9650     34.9800      7.5940
+    244.6170   1484.9650     34.9724      7.5960
+    244.7450   1484.9650     34.9731      7.5950
+    244.8870   1484.9660     34.9785      7.5930
+    245.0430   1484.9650     34.9754      7.5930
+    245.1930   1484.9660     34.9747      7.5930
+    245.2820   1484.9660     34.9762      7.5920
+    245.3040   1484.9680     34.9747      7.5930
+    245.3650   1484.9660     34.9785      7.5910
+    245.4100   1484.9670     34.9785      7.5910
+    245.4440   1484.9680     34.9724      7.5930
+    245.5190   1484.9680     34.9747      7.5920
+    245.5670   1484.9680     34.9831      7.5890
+    245.5900   1484.9650     34.9777      7.5900
+    245.6820   1484.9590     34.9686      7.5910
+    245.7170   1484.9580     34.9701      7.5900
+    245.7710   1484.9580     34.9815      7.5860
+    245.7890   1484.9580     34.9724      7.5890
+    245.7950   1484.9590     34.9823      7.5860
+    245.8030   1484.9580     34.9785      7.5870
+    245.8050   1484.9570     34.9770      7.5870
+    245.8350   1484.9570     34.9739      7.5880
+    245.8450   1484.9620     34.9808      7.5870
+    245.8610   1484.9620     34.9838      7.5860
+    245.8870   1484.9590     34.9808      7.5860
+    245.8990   1484.9630     34.9777      7.5880
+    245.9080   1484.9620     34.9831      7.5860
+    245.9170   1484.9640     34.9754      7.5890
+    245.9270   1484.9640     34.9785      7.5880
+    245.9380   1484.9640     34.9838      7.5860
+    245.9450   1484.9640     34.9838      7.5860
+    245.9470   1484.9620     34.9731      7.5890
+    245.9580   1484.9620     34.9823      7.5860
+    245.9630   1484.9640     34.9808      7.5870
+    245.9660   1484.9640     34.9808      7.5870
+    245.9680   1484.9660     34.9915      7.5840
+    245.9710   1484.9650     34.9754      7.5890
+    245.9810   1484.9660     34.9762      7.5890
+    245.9890   1484.9640     34.9747      7.5890
+    245.9930   1484.9650     34.9846      7.5860
+    246.0090   1484.9650     34.9747      7.5890
+    246.0200   1484.9660     34.9754      7.5890
+    246.0340   1484.9650     34.9808      7.5870
+    246.0400   1484.9660     34.9815      7.5870
+    246.0450   1484.9660     34.9724      7.5900
+    246.0520   1484.9700     34.9693      7.5920
+    246.0700   1484.9680     34.9701      7.5910
+    246.0740   1484.9710     34.9785      7.5890
+    246.0870   1484.9690     34.9770      7.5890
+    246.0900   1484.9700     34.9686      7.5920
+    246.1070   1484.9690     34.9831      7.5870
+    246.1200   1484.9680     34.9731      7.5900
+    246.1280   1484.9730     34.9800      7.5890
+    246.1360   1484.9740     34.9747      7.5910
+    246.1450   1484.9820     34.9777      7.5920
+    246.1500   1484.9830     34.9815      7.5910
+    246.1530   1484.9820     34.9838      7.5900
+    246.1550   1484.9850     34.9800      7.5920
+    246.1580   1484.9820     34.9777      7.5920
+    246.1690   1484.9830     34.9686      7.5950
+    246.1760   1484.9860     34.9739      7.5940
+    246.1940   1484.9840     34.9693      7.5950
+    246.2070   1484.9860     34.9770      7.5930
+    246.2090   1484.9870     34.9777      7.5930
+    246.2110   1484.9880     34.9785      7.5930
+    246.2210   1484.9870     34.9777      7.5930
+    246.2220   1484.9870     34.9777      7.5930
+    246.2400   1484.9860     34.9701      7.5950
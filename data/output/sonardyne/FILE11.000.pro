@@ -0,0 +1,340 @@
+test_read_store_and_write
+3/4/2016
+20:34:37
+Probe: MIDAS SVX2 1000
+Source: /root/package/data/input/valeport/midas/svx2/FILE11.000
+      0.2120   1421.7040      4.9520      3.8520
+      0.3240   1421.8880      5.0950      2.9650
+      0.4650   1421.7270      5.2370      2.5860
+      0.5740   1421.5720      5.1400      2.4200
+      0.6610   1421.7030      5.6560      2.3710
+      0.7520   1420.2840      5.6060      2.1210
+      0.8690   1420.2280      5.6230      2.1090
+      1.0040   1420.1540      5.6240      2.1000
+      1.1220   1420.1350      5.6260      2.0910
+      1.2770   1420.1140      5.6250      2.0850
+      1.4050   1420.0460      5.6230      2.0800
+      1.5300   1420.0550      5.6250      2.0720
+      1.6720   1420.0440      5.6280      2.0660
+      1.8030   1420.0430      5.6290      2.0630
+      1.9210   1420.0460      5.6250      2.0610
+      2.0440   1420.0390      5.6310      2.0600
+      2.2060   1420.0360      5.6300      2.0570
+      2.3250   1420.0450      5.6250      2.0580
+      2.4430   1420.0450      5.6230      2.0580
+      2.6010   1420.0300      5.6250      2.0570
+      2.7130   1419.9530      5.6250      2.0580
+      2.8400   1419.8620      5.6270      2.0460
+      2.9630   1419.7660      5.6320      2.0320
+      3.1300   1419.6800      5.6380      2.0090
+      3.2590   1419.5730      5.6510      1.9860
+      3.3680   1419.5350      5.6590      1.9650
+      3.5060   1419.5380      5.6550      1.9480
+      3.6530   1419.5520      5.6580      1.9440
+      3.7730   1419.5370      5.6600      1.9460
+      3.8850   1419.5920      5.6600      1.9470
+      4.0510   1419.5880      5.6550      1.9480
+      4.1840   1419.5040      5.6550      1.9480
+      4.3040   1419.4560      5.6610      1.9400
+      4.4220   1419.2700      5.6690      1.9170
+      4.5710   1419.1580      5.6810      1.8850
+      4.6980   1419.1470      5.6880      1.8610
+      4.8130   1419.1350      5.6900      1.8500
+      4.9980   1419.1010      5.6910      1.8430
+      5.1060   1419.0730      5.6930      1.8300
+      5.2370   1419.0440      5.6980      1.8260
+      5.3590   1418.9760      5.7000      1.8150
+      5.5220   1418.8080      5.7070      1.8030
+      5.6460   1418.5790      5.7210      1.7610
+      5.7570   1418.5670      5.7350      1.7200
+      5.9260   1418.3080      5.7460      1.6830
+      6.0390   1417.9130      5.7770      1.6050
+      6.1690   1417.5170      5.8130      1.5180
+      6.2870   1417.2130      5.8420      1.4300
+      6.4510   1416.9860      5.8730      1.3650
+      6.5660   1416.8160      5.8940      1.3000
+      6.6830   1416.5890      5.9050      1.2440
+      6.8590   1416.2910      5.9220      1.1870
+      6.9770   1416.1060      5.9300      1.1370
+      7.0900   1415.9450      5.9340      1.1030
+      7.2200   1415.7730      5.9410      1.0660
+      7.3730   1415.7020      5.9420      1.0480
+      7.4880   1415.6660      5.9440      1.0370
+      7.6140   1415.6370      5.9480      1.0310
+      7.7880   1415.6250      5.9500      1.0290
+      7.9110   1415.6050      5.9510      1.0260
+      8.0270   1415.5910      5.9530      1.0260
+      8.1450   1415.5010      5.9500      1.0190
+      8.3160   1415.4460      5.9530      1.0010
+      8.4530   1415.3820      5.9570      0.9830
+      8.5680   1415.3470      5.9640      0.9700
+      8.7780   1415.3030      5.9580      0.9670
+      8.9200   1415.2940      5.9570      0.9610
+      9.0800   1415.3500      5.9660      0.9590
+      9.2420   1415.4470      5.9710      0.9910
+      9.4550   1415.5000      5.9750      1.0040
+      9.6180   1415.5030      5.9790      1.0050
+      9.7870   1415.4570      5.9790      0.9910
+      9.9360   1415.4080      5.9910      0.9780
+     10.1040   1415.4130      6.0000      0.9730
+     10.2940   1415.5570      5.9880      0.9820
+     10.4630   1415.7420      5.9860      1.0230
+     10.6780   1415.8450      5.9900      1.0590
+     10.8630   1415.9440      5.9890      1.0760
+     11.0710   1415.9840      5.9930      1.0860
+     11.2570   1416.1170      6.0000      1.1090
+     11.4940   1416.2230      5.9950      1.1340
+     11.6970   1416.3210      5.9990      1.1570
+     11.8670   1416.4140      6.0020      1.1760
+     12.1180   1416.4710      6.0040      1.1890
+     12.2900   1416.5680      6.0010      1.2050
+     12.4690   1416.6350      5.9990      1.2230
+     12.6710   1416.6840      6.0050      1.2380
+     12.9220   1416.7780      6.0080      1.2480
+     13.0930   1416.8090      5.9980      1.2550
+     13.3000   1416.8540      5.9980      1.2620
+     13.5290   1416.8790      6.0000      1.2650
+     13.7200   1416.8860      6.0010      1.2700
+     13.9090   1416.9260      5.9980      1.2720
+     14.0870   1416.9560      6.0010      1.2790
+     14.3630   1416.9950      6.0070      1.2860
+     14.5250   1417.0350      6.0100      1.2930
+     14.7250   1417.0660      6.0090      1.2960
+     14.9540   1417.1010      6.0050      1.3070
+     15.1320   1417.1240      6.0070      1.3080
+     15.3380   1417.1630      6.0110      1.3160
+     15.5190   1417.2160      6.0130      1.3310
+     15.7570   1417.3150      6.0150      1.3410
+     15.9490   1417.3400      6.0220      1.3530
+     16.1340   1417.3640      6.0250      1.3570
+     16.3690   1417.4210      6.0240      1.3650
+     16.5660   1417.4550      6.0290      1.3700
+     16.7580   1417.5620      6.0250      1.3900
+     16.9590   1417.6830      6.0270      1.4150
+     17.1750   1417.7910      6.0250      1.4360
+     17.3910   1417.8030      6.0250      1.4450
+     17.5540   1417.8280      6.0290      1.4490
+     17.7690   1417.8300      6.0320      1.4430
+     17.9840   1417.8020      6.0350      1.4380
+     18.1650   1417.7770      6.0360      1.4330
+     18.3790   1417.7540      6.0270      1.4230
+     18.6050   1417.7510      6.0310      1.4230
+     18.7860   1417.7650      6.0360      1.4220
+     18.9920   1417.7730      6.0370      1.4260
+     19.1800   1417.7840      6.0400      1.4230
+     19.4290   1417.7740      6.0440      1.4240
+     19.6050   1417.7570      6.0500      1.4150
+     19.8030   1417.7380      6.0520      1.4050
+     20.0420   1417.7330      6.0560      1.4060
+     20.2230   1417.7300      6.0630      1.4060
+     20.4240   1417.7330      6.0650      1.4050
+     20.5990   1417.7360      6.0690      1.4050
+     20.8350   1417.7230      6.0720      1.4030
+     21.0390   1417.7280      6.0700      1.4030
+     21.2370   1417.7180      6.0650      1.4040
+     21.4640   1417.6930      6.0720      1.3930
+     21.6560   1417.6770      6.0660      1.3880
+     21.8510   1417.6050      6.0680      1.3780
+     22.0340   1417.5550      6.0660      1.3630
+     22.2800   1417.5560      6.0690      1.3600
+     22.4580   1417.5420      6.0720      1.3570
+     22.6440   1417.5580      6.0700      1.3570
+     22.9040   1417.5510      6.0650      1.3600
+     23.0880   1417.5680      6.0690      1.3580
+     23.2800   1417.7250      6.0670      1.3910
+     23.4620   1417.7860      6.0660      1.4100
+     23.6880   1417.8300      6.0670      1.4150
+     23.9030   1417.8270      6.0690      1.4140
+     24.0850   1417.8010      6.0730      1.4070
+     24.3350   1417.7900      6.0720      1.4020
+     24.5160   1417.7230      6.0730      1.3940
+     24.7000   1417.6950      6.0750      1.3820
+     24.8910   1417.6670      6.0750      1.3710
+     25.1220   1417.6610      6.0850      1.3660
+     25.3090   1417.6700      6.0880      1.3710
+     25.5260   1417.6750      6.0900      1.3720
+     25.7340   1417.7090      6.0790      1.3740
+     25.9260   1417.7220      6.0860      1.3800
+     26.1210   1417.7290      6.0840      1.3840
+     26.3310   1417.7240      6.0890      1.3770
+     26.5520   1417.7310      6.0840      1.3790
+     26.7380   1417.7320      6.0890      1.3770
+     26.9340   1417.7280      6.0870      1.3780
+     27.1620   1417.7150      6.0900      1.3740
+     27.3700   1417.6950      6.0910      1.3690
+     27.5530   1417.6910      6.0930      1.3680
+     27.7510   1417.7100      6.0910      1.3670
+     27.9750   1417.7270      6.0980      1.3730
+     28.1630   1417.7460      6.0980      1.3740
+     28.3560   1417.7360      6.0940      1.3730
+     28.5520   1417.7310      6.0960      1.3720
+     28.7970   1417.7420      6.0970      1.3700
+     28.9790   1417.7610      6.0960      1.3730
+     29.1860   1417.7620      6.0940      1.3730
+     29.4130   1417.7760      6.0890      1.3780
+     29.5860   1417.7460      6.0980      1.3740
+     29.7620   1417.6930      6.0870      1.3640
+     29.9910   1417.6920      6.0860      1.3590
+     30.2080   1417.7000      6.0900      1.3580
+     30.3930   1417.7090      6.0940      1.3600
+     30.5930   1417.7450      6.0980      1.3630
+     30.8050   1417.7710      6.1010      1.3710
+     31.0010   1417.7770      6.1000      1.3750
+     31.1880   1417.7820      6.0990      1.3680
+     31.3430   1417.7880      6.0940      1.3730
+     31.5480   1417.7980      6.0950      1.3680
+     31.7480   1417.8140      6.0880      1.3710
+     31.9270   1417.8240      6.0860      1.3780
+     32.1570   1417.8130      6.0910      1.3750
+     32.3300   1417.7930      6.0960      1.3700
+     32.5480   1417.7920      6.0920      1.3680
+     32.7290   1417.7910      6.0930      1.3660
+     32.9850   1417.7920      6.0930      1.3660
+     33.1610   1417.7930      6.0970      1.3670
+     33.3420   1417.7990      6.0950      1.3650
+     33.5800   1417.8080      6.0950      1.3640
+     33.7650   1417.8120      6.0940      1.3680
+     33.9710   1417.8160      6.0950      1.3670
+     34.1650   1417.8160      6.0950      1.3650
+     34.3980   1417.8080      6.0970      1.3640
+     34.5710   1417.8090      6.0930      1.3630
+     34.6750   1417.7950      6.0880      1.3680
+     34.7620   1417.7930      6.0870      1.3700
+     34.8490   1417.7730      6.0920      1.3680
+     35.0030   1417.7630      6.0920      1.3590
+     35.2090   1417.7680      6.0820      1.3550
+     35.4440   1417.7720      6.0860      1.3550
+     35.6190   1417.7710      6.0880      1.3570
+     35.8180   1417.7660      6.0890      1.3510
+     36.0530   1417.7720      6.0930      1.3530
+     36.2410   1417.7710      6.0970      1.3550
+     36.4460   1417.7790      6.0930      1.3530
+     36.6230   1417.7840      6.0920      1.3550
+     36.8630   1417.7760      6.0970      1.3510
+     37.0540   1417.7730      6.1020      1.3510
+     37.2390   1417.7790      6.1040      1.3490
+     37.4460   1417.7770      6.1020      1.3490
+     37.6640   1417.7810      6.1040      1.3470
+     37.8650   1417.7860      6.1040      1.3490
+     38.0690   1417.7810      6.1040      1.3500
+     38.2800   1417.7900      6.1000      1.3490
+     38.4770   1417.7890      6.0980      1.3440
+     38.6660   1417.7940      6.0970      1.3500
+     38.8580   1417.7860      6.0980      1.3450
+     39.0790   1417.7650      6.0980      1.3450
+     39.2830   1417.7740      6.0940      1.3440
+     39.4780   1417.7770      6.0970      1.3420
+     39.7030   1417.7680      6.0980      1.3440
+     39.8940   1417.7670      6.0970      1.3410
+     40.0830   1417.7480      6.0850      1.3340
+     40.2690   1417.7370      6.0840      1.3280
+     40.4930   1417.7160      6.0820      1.3270
+     40.6990   1417.7000      6.0870      1.3230
+     40.9080   1417.6670      6.0970      1.3150
+     41.1190   1417.6490      6.0980      1.3120
+     41.3080   1417.6420      6.0850      1.3110
+     41.4940   1417.6700      6.0930      1.3170
+     41.6860   1417.6720      6.0950      1.3170
+     41.8910   1417.6790      6.0920      1.3170
+     42.0090   1417.6530      6.0920      1.3180
+     42.1590   1417.6350      6.0970      1.3050
+     42.3160   1417.6420      6.0900      1.3080
+     42.4020   1417.6200      6.0910      1.3040
+     42.5300   1417.6480      6.0980      1.3120
+     42.6430   1417.6060      6.0970      1.3060
+     42.7540   1417.5430      6.0970      1.2920
+     42.8590   1417.4230      6.0950      1.2830
+     42.9960   1417.3390      6.1050      1.2630
+     43.1150   1417.2200      6.1090      1.2330
+     43.2310   1417.0280      6.1140      1.1830
+     43.3740   1416.7850      6.1160      1.1290
+     43.4920   1416.6360      6.1270      1.0760
+     43.6020   1416.4790      6.1310      1.0440
+     43.7380   1416.3640      6.1350      1.0140
+     43.8840   1416.2760      6.1390      0.9900
+     43.9920   1416.1710      6.1440      0.9790
+     44.1190   1416.1370      6.1420      0.9660
+     44.2610   1416.0740      6.1350      0.9560
+     44.3810   1416.0070      6.1350      0.9470
+     44.4960   1415.9870      6.1290      0.9430
+     44.6180   1415.9560      6.1270      0.9400
+     44.7540   1415.8620      6.1230      0.9280
+     44.8790   1415.7990      6.1290      0.9070
+     45.0050   1415.7830      6.1240      0.9020
+     45.1340   1415.7560      6.1250      0.8950
+     45.2690   1415.7410      6.1240      0.8910
+     45.3970   1415.7370      6.1220      0.8880
+     45.5100   1415.7340      6.1220      0.8890
+     45.6510   1415.7330      6.1210      0.8910
+     45.7880   1415.7320      6.1240      0.8910
+     45.8950   1415.7290      6.1220      0.8870
+     46.0210   1415.7220      6.1200      0.8880
+     46.1720   1415.7270      6.1220      0.8870
+     46.2900   1415.7130      6.1220      0.8860
+     46.4140   1415.7010      6.1210      0.8810
+     46.5450   1415.7050      6.1210      0.8840
+     46.6580   1415.6970      6.1190      0.8790
+     46.7790   1415.6960      6.1170      0.8780
+     46.9000   1415.6940      6.1170      0.8770
+     47.0310   1415.6930      6.1240      0.8790
+     47.1550   1415.6910      6.1220      0.8760
+     47.3010   1415.6970      6.1220      0.8760
+     47.4300   1415.6880      6.1170      0.8780
+     47.5480   1415.6840      6.1180      0.8760
+     47.6780   1415.6660      6.1180      0.8750
+     47.7900   1415.6520      6.1160      0.8710
+     47.9320   1415.6360      6.1200      0.8660
+     48.0520   1415.6350      6.1180      0.8630
+     48.1780   1415.6330      6.1200      0.8620
+     48.3210   1415.6250      6.1220      0.8620
+     48.4610   1415.6110      6.1190      0.8580
+     48.5710   1415.6030      6.1220      0.8550
+     48.6820   1415.5990      6.1220      0.8550
+     48.8360   1415.5950      6.1200      0.8510
+     48.9520   1415.5960      6.1200      0.8520
+     49.0760   1415.5970      6.1220      0.8530
+     49.2120   1415.5960      6.1230      0.8500
+     49.3430   1415.5990      6.1240      0.8530
+     49.4580   1415.6000      6.1220      0.8530
+     49.5780   1415.6010      6.1190      0.8540
+     49.7130   1415.6030      6.1180      0.8490
+     49.8300   1415.6030      6.1200      0.8520
+     49.9630   1415.6050      6.1200      0.8500
+     50.0950   1415.6050      6.1200      0.8500
+     50.2260   1415.6090      6.1180      0.8500
+     50.3470   1415.6130      6.1200      0.8490
+     50.4710   1415.6140      6.1200      0.8520
+     50.6140   1415.6150      6.1220      0.8520
+     50.7330   1415.6170      6.1220      0.8520
+     50.8620   1415.6180      6.1200      0.8530
+     50.9750   1415.6210      6.1220      0.8500
+     51.1220   1415.6250      6.1220      0.8520
+     51.2460   1415.6240      6.1240      0.8500
+     51.3640   1415.6230      6.1240      0.8520
+     51.5090   1415.6260      6.1220      0.8500
+     51.6260   1415.6270      6.1240      0.8500
+     51.7570   1415.6360      6.1250      0.8480
+     51.8760   1415.6510      6.1260      0.8530
+     52.0100   1415.6420      6.1260      0.8530
+     52.1250   1415.6180      6.1270      0.8480
+     52.2470   1415.6050      6.1270      0.8480
+     52.3890   1415.5970      6.1290      0.8390
+     52.5090   1415.5700      6.1270      0.8350
+     52.6380   1415.5540      6.1300      0.8320
+     52.7530   1415.5060      6.1320      0.8230
+     52.9070   1415.4820      6.1350      0.8180
+     53.0120   1415.4630      6.1310      0.8140
+     53.1480   1415.4460      6.1340      0.8100
+     53.2750   1415.3920      6.1320      0.8020
+     53.3990   1415.3540      6.1340      0.7910
+     53.5290   1415.3300      6.1320      0.7880
+     53.6480   1415.3140      6.1360      0.7770
+     53.7860   1415.3060      6.1390      0.7750
+     53.9090   1415.2980      6.1370      0.7720
+     54.0290   1415.2850      6.1380      0.7700
+     54.1720   1415.2820      6.1410      0.7650
+     54.2840   1415.2770      6.1370      0.7650
+     54.4010   1415.2750      6.1390      0.7640
+     54.5260   1415.2770      6.1350      0.7640
+     54.6470   1415.2650      6.1390      0.7620
+     54.7040   1415.1980      6.1480      0.7750
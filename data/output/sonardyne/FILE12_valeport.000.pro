@@ -0,0 +1,33 @@
+test_read_store_and_write
+22/2/2012
+7:11:49
+Probe: MONITOR SVP 500
+Source: /root/package/data/input/valeport/monitor/FILE12_valeport.000
+      0.4630   1489.5170     35.0357      9.8980
+      0.5750   1488.8660     35.0769      9.7030
+      1.4880   1488.8470     35.0548      9.7010
+      2.8630   1488.8500     35.0296      9.7040
+      4.2380   1489.0190     35.0784      9.7280
+      5.2750   1489.0900     35.0456      9.7540
+      6.2500   1489.0990     35.0304      9.7570
+      7.2500   1489.1360     35.0388      9.7600
+      8.2380   1489.1550     35.0319      9.7630
+      9.2130   1489.1740     35.0250      9.7660
+     10.1880   1489.1990     35.0327      9.7660
+     11.1130   1489.2250     35.0349      9.7680
+     12.0000   1489.2720     35.0502      9.7720
+     12.9130   1489.3360     35.0662      9.7800
+     13.8500   1489.3580     35.0601      9.7840
+     14.6630   1489.3660     35.0494      9.7860
+     15.5500   1489.3860     35.0540      9.7860
+     16.4130   1489.4050     35.0548      9.7870
+     17.0750   1489.4100     35.0525      9.7860
+     17.7500   1489.4250     35.0555      9.7860
+     18.5880   1489.3960     35.0327      9.7820
+     19.4380   1489.3940     35.0395      9.7750
+     20.2500   1489.4240     35.0418      9.7790
+     21.1130   1489.4420     35.0449      9.7790
+     22.0000   1489.4430     35.0418      9.7760
+     22.8880   1489.4570     35.0357      9.7780
+     23.6630   1489.4510     35.0349      9.7730
+     24.0000   1489.4610     35.0357      9.7740
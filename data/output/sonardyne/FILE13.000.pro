@@ -0,0 +1,555 @@
+test_read_store_and_write
+5/5/2012
+11:19:50
+Probe: MIDAS SVP 6000
+Source: /root/package/data/input/valeport/midas/svp/FILE13.000
+      9.6960   1465.5200     17.1837      9.2460
+      9.7740   1465.4600     16.6145      9.4100
+      9.8610   1465.1970     16.0072      9.5330
+      9.9770   1465.1670     15.7570      9.6040
+     10.0270   1465.1450     15.5579      9.6610
+     10.0750   1465.1220     15.4373      9.6930
+     10.0920   1465.1330     15.3702      9.7170
+     10.1350   1465.1710     15.3503      9.7330
+     10.1920   1465.1520     15.3145      9.7390
+     10.2590   1465.1780     15.3069      9.7480
+     10.3220   1465.1760     15.2855      9.7540
+     10.3250   1465.1930     15.2740      9.7620
+     10.3600   1465.1860     15.2519      9.7670
+     10.3650   1465.1460     15.2191      9.7670
+     10.3710   1465.1620     15.2351      9.7660
+     10.3830   1465.2300     15.2405      9.7820
+     10.3960   1465.2230     15.2191      9.7870
+     10.4240   1465.0800     15.1573      9.7690
+     10.4720   1465.0840     15.1665      9.7670
+     10.5290   1465.0940     15.1772      9.7660
+     10.5620   1465.1150     15.2039      9.7630
+     10.5880   1465.1060     15.1993      9.7620
+     10.6220   1465.0990     15.1924      9.7620
+     10.6490   1465.0920     15.1772      9.7650
+     10.6900   1465.0770     15.1642      9.7650
+     10.7190   1465.0730     15.1573      9.7660
+     10.8010   1465.0710     15.1642      9.7630
+     10.8210   1465.0720     15.1642      9.7630
+     10.8880   1465.0810     15.1711      9.7630
+     10.9060   1465.0920     15.1512      9.7720
+     10.9160   1465.0930     15.1489      9.7730
+     10.9170   1465.1020     15.1627      9.7710
+     10.9660   1465.1230     15.1764      9.7720
+     11.0450   1465.1440     15.1802      9.7760
+     11.0900   1465.1470     15.1726      9.7790
+     11.1290   1465.1620     15.1527      9.7890
+     11.1310   1465.1550     15.1276      9.7950
+     11.1570   1465.1450     15.1413      9.7880
+     11.2000   1465.1810     15.1642      9.7900
+     11.2320   1465.2090     15.1711      9.7950
+     11.3130   1465.2070     15.1276      9.8080
+     11.3540   1465.2150     15.0826      9.8240
+     11.4320   1465.2190     15.0658      9.8300
+     11.5180   1465.1390     14.9643      9.8410
+     11.5850   1465.1650     14.9849      9.8410
+     11.7050   1465.1950     14.9986      9.8440
+     11.8290   1465.1540     14.9536      9.8470
+     11.9270   1465.0760     14.9094      9.8400
+     12.0610   1465.0700     14.9406      9.8280
+     12.1830   1465.0730     14.9857      9.8140
+     12.3190   1465.0450     14.9864      9.8060
+     12.4330   1465.0540     15.0459      9.7890
+     12.5550   1465.0430     15.0444      9.7860
+     12.6940   1465.0330     15.0467      9.7820
+     12.8300   1465.0400     15.0734      9.7750
+     12.9280   1465.0350     15.0681      9.7750
+     13.0570   1465.0310     15.0787      9.7700
+     13.1910   1465.0460     15.0955      9.7680
+     13.3250   1465.0560     15.0986      9.7690
+     13.4560   1465.0640     15.1001      9.7700
+     13.5800   1465.0930     15.1192      9.7710
+     13.7180   1465.0830     15.1062      9.7720
+     13.8590   1465.0750     15.1039      9.7700
+     13.9790   1465.0730     15.0978      9.7710
+     14.1000   1465.0890     15.0932      9.7760
+     14.2510   1465.1000     15.0818      9.7820
+     14.3770   1465.0870     15.0688      9.7820
+     14.4960   1465.1090     15.0826      9.7830
+     14.5740   1465.1260     15.0955      9.7830
+     14.7020   1465.0580     15.0375      9.7830
+     14.8030   1465.0700     15.0558      9.7800
+     14.8940   1465.0890     15.0543      9.7850
+     15.0110   1465.0570     15.0391      9.7810
+     15.0990   1465.0420     15.0345      9.7780
+     15.2070   1465.0570     15.0551      9.7750
+     15.3280   1465.0560     15.0749      9.7680
+     15.4000   1465.0590     15.0986      9.7610
+     15.4900   1465.0720     15.1077      9.7610
+     15.5830   1465.0230     15.1009      9.7500
+     15.6770   1465.0160     15.1512      9.7320
+     15.7910   1465.0170     15.1848      9.7210
+     15.8900   1465.0260     15.2130      9.7140
+     15.9900   1465.0380     15.2283      9.7120
+     16.0680   1465.0400     15.2542      9.7040
+     16.1880   1465.0430     15.2802      9.6960
+     16.3200   1465.0450     15.2992      9.6900
+     16.4050   1465.0440     15.3000      9.6890
+     16.5000   1465.0410     15.2840      9.6930
+     16.6270   1465.0490     15.2855      9.6940
+     16.7640   1465.0480     15.2733      9.6970
+     16.8440   1465.0770     15.3091      9.6930
+     16.9610   1465.0720     15.3160      9.6890
+     17.0440   1465.1420     15.3816      9.6860
+     17.1650   1465.1800     15.4175      9.6840
+     17.2380   1465.4690     15.6738      9.6780
+     17.3580   1465.4330     15.6715      9.6690
+     17.4410   1465.4350     15.7188      9.6540
+     17.5400   1465.5570     15.8310      9.6500
+     17.6210   1465.4520     15.7562      9.6460
+     17.7110   1465.3170     15.7005      9.6280
+     17.8030   1465.2580     16.3086      9.4200
+     17.8940   1465.3150     16.8007      9.2790
+     17.9820   1465.4590     17.0166      9.2480
+     18.0900   1465.4070     16.8900      9.2740
+     18.1730   1465.3840     16.7778      9.3030
+     18.2720   1465.4720     16.7633      9.3300
+     18.3540   1465.4480     16.6664      9.3540
+     18.4520   1465.4760     16.6786      9.3570
+     18.5260   1465.4800     16.6939      9.3530
+     18.6220   1465.4480     16.7259      9.3340
+     18.7010   1465.4420     16.8121      9.3050
+     18.7670   1465.4710     16.9365      9.2730
+     18.8630   1465.5590     17.0456      9.2610
+     18.9350   1465.5710     17.3714      9.1610
+     19.0160   1465.6110     18.0084      8.9700
+     19.0790   1465.6330     18.7813      8.7320
+     19.1700   1465.6520     19.7784      8.4230
+     19.2260   1465.6100     20.4987      8.1860
+     19.3290   1465.5810     20.9648      8.0320
+     19.3910   1465.5180     21.1807      7.9480
+     19.4300   1465.4770     21.2463      7.9170
+     19.5360   1465.4720     21.2311      7.9200
+     19.6270   1465.4620     21.2311      7.9170
+     19.6970   1465.4260     21.2746      7.8940
+     19.7650   1465.3930     21.4005      7.8460
+     19.8390   1465.3690     21.5332      7.7980
+     19.9320   1465.3460     21.5965      7.7720
+     20.0030   1465.3370     21.6652      7.7480
+     20.0890   1465.3500     21.7705      7.7180
+     20.1380   1465.3620     21.8979      7.6810
+     20.2230   1465.3190     21.9452      7.6550
+     20.2660   1465.2840     21.9131      7.6560
+     20.3610   1465.2670     21.9040      7.6540
+     20.4460   1465.2730     21.9879      7.6290
+     20.5170   1465.2620     22.0840      7.5960
+     20.5900   1465.2620     22.1886      7.5630
+     20.6690   1465.3110     22.2557      7.5540
+     20.7490   1465.3070     22.0947      7.6030
+     20.8280   1465.2700     21.7789      7.6920
+     20.8980   1465.2640     21.4661      7.7880
+     20.9620   1465.2620     21.2624      7.8510
+     21.0540   1465.3100     21.1113      7.9100
+     21.1270   1465.3370     20.8801      7.9890
+     21.2000   1465.2700     20.5467      8.0760
+     21.2780   1465.2980     20.3484      8.1450
+     21.3540   1465.2510     20.1653      8.1900
+     21.4200   1465.3340     20.2545      8.1830
+     21.4980   1465.2730     20.3888      8.1250
+     21.5750   1465.2390     20.5673      8.0600
+     21.6550   1465.2250     20.7405      8.0020
+     21.7210   1465.1860     20.8298      7.9640
+     21.7950   1465.2060     20.8862      7.9510
+     21.8700   1465.1840     20.8641      7.9520
+     21.9730   1465.0480     20.7176      7.9630
+     22.0400   1464.9440     20.6032      7.9720
+     22.1100   1465.0200     20.6573      7.9740
+     22.1900   1465.0130     20.6635      7.9700
+     22.2530   1464.7120     20.4346      7.9650
+     22.3220   1464.5610     20.3300      7.9590
+     22.3910   1464.6400     20.4605      7.9380
+     22.4710   1464.7430     20.6421      7.9070
+     22.5430   1464.7550     20.7436      7.8780
+     22.6230   1464.8040     20.8977      7.8420
+     22.6870   1464.9650     21.1876      7.7920
+     22.7740   1464.8970     21.2402      7.7580
+     22.8320   1464.8220     21.2006      7.7510
+     22.9120   1464.8100     21.2448      7.7340
+     23.0000   1464.7170     21.3478      7.6780
+     23.0500   1464.7590     21.6339      7.5990
+     23.1420   1464.7450     21.8071      7.5410
+     23.2060   1464.7290     21.7522      7.5540
+     23.2880   1464.8250     21.7384      7.5820
+     23.3560   1464.7380     21.5683      7.6130
+     23.4260   1465.0000     21.7216      7.6310
+     23.5020   1464.8330     21.5630      7.6380
+     23.5680   1464.7430     21.5149      7.6300
+     23.6530   1464.6160     21.5294      7.5930
+     23.7060   1464.2750     21.8506      7.4070
+     23.7970   1464.0880     22.3030      7.2190
+     23.8760   1464.1900     22.8439      7.0760
+     23.9510   1464.2110     23.1010      7.0010
+     24.0280   1464.3220     23.2536      6.9810
+     24.0740   1464.4260     23.5619      6.9110
+     24.1680   1464.2150     23.8846      6.7580
+     24.2510   1464.3120     24.5735      6.5680
+     24.3060   1464.2110     24.9855      6.4150
+     24.3950   1464.0670     25.3212      6.2750
+     24.4780   1464.0380     25.6012      6.1810
+     24.5390   1464.1040     25.8240      6.1280
+     24.6210   1463.8640     25.7324      6.0970
+     24.6940   1463.7260     25.6569      6.0860
+     24.7630   1463.7650     25.7095      6.0790
+     24.8320   1463.7790     25.8041      6.0530
+     24.9120   1463.7790     25.8514      6.0380
+     24.9910   1463.7720     25.8904      6.0240
+     25.0690   1463.8170     25.9415      6.0190
+     25.1330   1463.9260     26.0208      6.0210
+     25.2060   1463.8170     25.7904      6.0650
+     25.2760   1463.7650     25.6607      6.0920
+     25.3560   1463.7730     25.6401      6.1000
+     25.4400   1463.8130     25.7103      6.0880
+     25.4960   1463.8610     25.8476      6.0570
+     25.5760   1463.9240     25.9903      6.0280
+     25.6590   1463.8620     26.0796      5.9850
+     25.6980   1463.8740     26.2665      5.9300
+     25.7730   1463.9620     26.5686      5.8580
+     25.8670   1463.8850     26.7227      5.7910
+     25.9640   1463.8950     26.8982      5.7390
+     26.0030   1463.9010     27.0485      5.6940
+     26.0980   1463.9270     27.2232      5.6460
+     26.1730   1463.9180     27.3903      5.5920
+     26.2280   1463.9430     27.6230      5.5260
+     26.3090   1463.9600     27.8946      5.4460
+     26.3880   1463.9780     28.1929      5.3580
+     26.4900   1463.9890     28.4149      5.2920
+     26.5840   1464.0090     28.6041      5.2380
+     26.6570   1464.0110     28.7125      5.2050
+     26.7360   1464.0680     28.8109      5.1880
+     26.8150   1464.0990     28.8376      5.1870
+     26.8990   1464.1650     28.8788      5.1900
+     26.9650   1464.1540     28.7369      5.2310
+     27.0400   1464.2000     28.6324      5.2740
+     27.1210   1464.2430     28.5774      5.3010
+     27.2070   1464.2350     28.3981      5.3540
+     27.2800   1464.2710     28.1830      5.4290
+     27.3830   1464.2710     27.8931      5.5180
+     27.4460   1464.3750     27.7580      5.5850
+     27.5370   1464.4450     27.6894      5.6230
+     27.6280   1464.4930     27.7031      5.6300
+     27.7000   1464.4820     27.7321      5.6180
+     27.7930   1464.5240     27.8778      5.5830
+     27.8400   1464.5380     28.1021      5.5170
+     27.9240   1464.4640     28.2303      5.4590
+     28.0150   1464.5520     28.5019      5.3960
+     28.0970   1464.4940     28.6110      5.3480
+     28.1770   1464.5120     28.7437      5.3110
+     28.2590   1464.5350     28.7773      5.3060
+     28.3410   1464.6540     28.7048      5.3570
+     28.4130   1464.7960     28.6446      5.4100
+     28.4960   1464.8300     28.4958      5.4640
+     28.5850   1464.8640     28.3981      5.5020
+     28.6510   1464.9530     28.3737      5.5310
+     28.7190   1465.0230     28.3638      5.5510
+     28.8130   1465.0780     28.3516      5.5680
+     28.8930   1465.1040     28.4096      5.5560
+     28.9410   1465.1470     28.5072      5.5360
+     29.0360   1465.1120     28.6530      5.4820
+     29.1180   1465.0570     28.7415      5.4410
+     29.1890   1465.2580     28.9993      5.4100
+     29.2710   1465.2940     29.0977      5.3880
+     29.3720   1465.3240     29.1878      5.3670
+     29.4330   1465.4350     29.3358      5.3480
+     29.5220   1465.4610     29.3976      5.3350
+     29.6070   1465.4120     29.3930      5.3240
+     29.6770   1465.3880     29.4250      5.3080
+     29.7430   1465.4750     29.5120      5.3020
+     29.8380   1465.5510     29.6158      5.2880
+     29.9290   1465.5740     29.6494      5.2830
+     29.9920   1465.5620     29.6455      5.2810
+     30.0750   1465.5820     29.6539      5.2830
+     30.1460   1465.5650     29.6616      5.2760
+     30.2160   1465.5350     29.6661      5.2670
+     30.3040   1465.5970     29.7241      5.2640
+     30.4030   1465.5920     29.6638      5.2810
+     30.4800   1465.6090     29.5952      5.3060
+     30.5430   1465.6700     29.5784      5.3260
+     30.6040   1465.7110     29.5258      5.3520
+     30.7050   1465.7400     29.5380      5.3550
+     30.7760   1465.8010     29.6722      5.3280
+     30.8580   1465.8460     29.8164      5.2940
+     30.9430   1465.7970     29.8927      5.2580
+     30.9950   1465.7260     29.9202      5.2320
+     31.0600   1465.5890     29.8302      5.2260
+     31.1420   1465.5650     29.8103      5.2260
+     31.2560   1465.6700     29.8950      5.2250
+     31.3170   1465.6810     29.9194      5.2200
+     31.3960   1466.0330     30.1918      5.2210
+     31.4900   1466.1830     30.3474      5.2090
+     31.5470   1466.3110     30.4703      5.2020
+     31.6440   1466.2400     30.4420      5.1930
+     31.6880   1466.1480     30.4047      5.1820
+     31.7750   1466.0020     30.3108      5.1750
+     31.8470   1466.0330     30.3444      5.1720
+     31.9230   1465.8520     30.1941      5.1740
+     32.0000   1465.7490     30.1056      5.1760
+     32.0830   1465.9490     30.2330      5.1850
+     32.1920   1465.7030     30.0285      5.1880
+     32.2470   1465.7170     30.0293      5.1910
+     32.3350   1466.0330     30.2673      5.1940
+     32.3860   1465.7680     30.0354      5.2010
+     32.4530   1465.8420     30.0827      5.2040
+     32.5260   1466.1760     30.3452      5.2040
+     32.6100   1466.1770     30.3383      5.2060
+     32.6930   1466.0540     30.2368      5.2070
+     32.7720   1466.2670     30.3879      5.2120
+     32.8560   1466.2580     30.3665      5.2160
+     32.9190   1466.3470     30.4161      5.2220
+     33.0000   1466.3470     30.3925      5.2290
+     33.0830   1466.3580     30.3841      5.2340
+     33.1440   1466.2460     30.2727      5.2410
+     33.2330   1465.8120     29.9164      5.2450
+     33.3130   1465.8210     29.9225      5.2450
+     33.3800   1465.8490     29.9408      5.2460
+     33.4590   1466.1780     30.2086      5.2430
+     33.5360   1466.0720     30.1369      5.2390
+     33.6150   1465.9680     30.0575      5.2380
+     33.6730   1465.9400     30.0476      5.2340
+     33.7730   1465.8400     29.9606      5.2360
+     33.8360   1465.9870     30.0659      5.2390
+     33.9250   1466.1470     30.1941      5.2380
+     33.9740   1466.6630     30.5939      5.2400
+     34.0600   1466.6390     30.5862      5.2360
+     34.1340   1466.3310     30.3619      5.2300
+     34.2200   1466.2710     30.3398      5.2220
+     34.3030   1466.3290     30.4199      5.2110
+     34.3770   1466.3730     30.4695      5.2060
+     34.4540   1466.4900     30.5603      5.2060
+     34.5430   1466.7570     30.7693      5.2060
+     34.6040   1466.3350     30.4176      5.2120
+     34.6660   1466.1120     30.2444      5.2110
+     34.7350   1466.3570     30.4588      5.2040
+     34.8190   1466.3970     30.5283      5.1920
+     34.8820   1466.4430     30.6244      5.1730
+     34.9860   1466.4480     30.6496      5.1660
+     35.0510   1466.3030     30.5443      5.1630
+     35.1500   1466.1000     30.3833      5.1630
+     35.2160   1466.1610     30.4176      5.1670
+     35.2750   1465.9710     30.2574      5.1700
+     35.3670   1465.9640     30.2475      5.1710
+     35.4200   1466.3090     30.5023      5.1760
+     35.5200   1467.2410     31.2248      5.1790
+     35.5700   1467.3420     31.2813      5.1860
+     35.6710   1467.5520     31.4384      5.1880
+     35.7540   1467.7590     31.5941      5.1900
+     35.8200   1467.7940     31.6109      5.1930
+     35.9050   1467.6730     31.5048      5.1960
+     35.9740   1467.5060     31.3599      5.2000
+     36.0450   1467.3060     31.2141      5.1960
+     36.1440   1467.1080     31.0577      5.1960
+     36.2050   1466.6720     30.7198      5.1940
+     36.2890   1467.2940     31.2241      5.1890
+     36.3780   1467.8510     31.6803      5.1830
+     36.4480   1467.8750     31.7116      5.1790
+     36.5170   1467.9290     31.7726      5.1730
+     36.6060   1467.9750     31.7978      5.1760
+     36.6780   1467.9160     31.7345      5.1810
+     36.7460   1467.5290     31.4224      5.1830
+     36.8320   1467.3650     31.2698      5.1900
+     36.9000   1467.4610     31.3187      5.1980
+     36.9810   1467.7260     31.5231      5.1990
+     37.0590   1467.5640     31.3911      5.2000
+     37.1040   1467.4620     31.3171      5.1980
+     37.1850   1467.7290     31.5353      5.1950
+     37.2750   1467.5940     31.4125      5.2000
+     37.3590   1467.8910     31.6223      5.2070
+     37.4380   1468.0090     31.6788      5.2180
+     37.5130   1468.1780     31.8108      5.2180
+     37.5910   1467.8700     31.5742      5.2160
+     37.6780   1467.7540     31.4880      5.2140
+     37.7290   1467.7600     31.4857      5.2160
+     37.8320   1467.4620     31.2630      5.2120
+     37.9110   1467.8860     31.5987      5.2110
+     37.9870   1468.2800     31.8947      5.2150
+     38.0560   1468.1950     31.8268      5.2150
+     38.1270   1468.8610     32.3494      5.2150
+     38.2050   1468.4450     32.0152      5.2170
+     38.2740   1468.6890     32.2090      5.2160
+     38.3540   1469.1270     32.5562      5.2150
+     38.4020   1469.0440     32.4837      5.2170
+     38.4970   1469.1290     32.5233      5.2250
+     38.5830   1468.7950     32.2182      5.2380
+     38.6520   1468.1980     31.6864      5.2570
+     38.7330   1469.0750     32.2990      5.2810
+     38.8090   1468.9800     32.1335      5.3090
+     38.8700   1469.4940     32.4127      5.3480
+     38.9670   1469.8750     32.5264      5.4060
+     39.0300   1469.8560     32.3448      5.4580
+     39.1170   1470.0700     32.3784      5.5000
+     39.1910   1469.5200     31.8733      5.5220
+     39.2730   1469.4620     31.7978      5.5310
+     39.3500   1469.5410     31.9130      5.5140
+     39.4190   1469.9080     32.2914      5.4860
+     39.4960   1470.0210     32.4493      5.4640
+     39.5670   1469.8220     32.3174      5.4560
+     39.6610   1469.9950     32.4745      5.4490
+     39.7170   1470.6740     33.0406      5.4390
+     39.8060   1470.4890     32.9353      5.4260
+     39.8860   1470.0710     32.6462      5.4130
+     39.9430   1470.3030     32.8667      5.4010
+     40.0150   1470.7310     33.2153      5.3970
+     40.1010   1470.9300     33.3839      5.3930
+     40.1630   1471.0730     33.4824      5.3970
+     40.2480   1471.1400     33.5632      5.3880
+     40.3400   1471.2960     33.7067      5.3810
+     40.4090   1471.1040     33.5640      5.3780
+     40.4800   1471.6410     34.0141      5.3690
+     40.5420   1471.6440     34.0195      5.3680
+     40.6360   1471.3880     33.8135      5.3690
+     40.6880   1471.4370     33.8478      5.3700
+     40.7720   1470.8980     33.4358      5.3660
+     40.8560   1470.5750     33.1741      5.3680
+     40.9140   1470.0200     32.7202      5.3730
+     41.0150   1470.1710     32.8377      5.3730
+     41.0690   1470.6860     33.2458      5.3720
+     41.1370   1471.1360     33.6182      5.3660
+     41.2220   1470.8810     33.4358      5.3600
+     41.2940   1471.5400     33.9531      5.3600
+     41.3640   1471.7890     34.1576      5.3570
+     41.4340   1471.0500     33.5754      5.3570
+     41.5290   1470.6070     33.2092      5.3620
+     41.5700   1470.6900     33.2581      5.3670
+     41.6710   1470.9400     33.4381      5.3720
+     41.7440   1471.1530     33.5342      5.3940
+     41.8120   1471.3110     33.5594      5.4250
+     41.8850   1471.7570     33.7700      5.4690
+     41.9830   1471.9780     33.8036      5.5130
+     42.0420   1471.5690     33.2932      5.5720
+     42.1140   1471.7660     33.2191      5.6440
+     42.1940   1471.8970     33.1596      5.6950
+     42.2640   1471.8110     32.9956      5.7250
+     42.3300   1472.1600     33.2169      5.7420
+     42.4200   1472.5010     33.4656      5.7480
+     42.5000   1472.6850     33.5915      5.7540
+     42.5790   1472.8250     33.6945      5.7560
+     42.6440   1472.9680     33.8127      5.7540
+     42.7210   1472.8390     33.7761      5.7330
+     42.7800   1473.1030     34.0530      5.7110
+     42.8470   1473.1790     34.1629      5.6950
+     42.9350   1473.2590     34.2628      5.6830
+     43.0030   1473.6500     34.5955      5.6750
+     43.0740   1473.7980     34.6573      5.6920
+     43.1590   1473.6610     34.4574      5.7210
+     43.2170   1474.2380     34.7984      5.7570
+     43.2660   1473.6830     34.2430      5.7940
+     43.3820   1473.2690     33.7723      5.8390
+     43.4520   1473.5760     33.8913      5.8780
+     43.5220   1473.3100     33.5693      5.9130
+     43.5970   1473.0670     33.2756      5.9450
+     43.6630   1472.5920     32.7377      5.9960
+     43.7530   1473.3560     33.1833      6.0460
+     43.8250   1473.8490     33.4846      6.0740
+     43.8910   1474.3560     33.8669      6.0800
+     43.9690   1474.7940     34.2972      6.0530
+     44.0480   1474.5870     34.1171      6.0580
+     44.1060   1474.6620     34.0935      6.0840
+     44.1870   1474.5880     34.0530      6.0780
+     44.2510   1474.8060     34.3346      6.0430
+     44.3100   1475.2180     34.7382      6.0180
+     44.4050   1475.3660     34.9007      6.0030
+     44.4910   1475.7670     35.1791      6.0150
+     44.5330   1476.0760     35.2791      6.0610
+     44.6110   1475.9180     34.9342      6.1310
+     44.6990   1475.9680     34.7160      6.2130
+     44.7760   1475.8820     34.3941      6.2940
+     44.8260   1475.8680     34.1949      6.3540
+     44.8990   1475.7890     34.0401      6.3830
+     44.9670   1475.7210     33.9539      6.3930
+     45.0480   1475.8700     34.0652      6.3950
+     45.1300   1475.9040     34.1599      6.3730
+     45.1830   1475.9280     34.1309      6.3880
+     45.2680   1476.2430     34.2430      6.4320
+     45.3370   1476.3460     34.2300      6.4620
+     45.4260   1476.3790     34.2270      6.4710
+     45.4840   1476.5900     34.3719      6.4780
+     45.5690   1476.5880     34.3262      6.4920
+     45.6360   1476.5890     34.2415      6.5190
+     45.7090   1476.8010     34.3094      6.5510
+     45.7900   1476.8320     34.2552      6.5760
+     45.8560   1476.8630     34.2506      6.5850
+     45.9380   1477.0130     34.4002      6.5750
+     46.0070   1477.0360     34.3803      6.5870
+     46.0850   1477.1250     34.3628      6.6150
+     46.1570   1477.1490     34.2819      6.6470
+     46.2260   1477.0670     34.1377      6.6720
+     46.2820   1477.0350     34.0645      6.6870
+     46.3810   1477.0510     34.0515      6.6950
+     46.4760   1477.1140     34.0851      6.7000
+     46.5290   1477.1970     34.1530      6.6990
+     46.6000   1477.1760     34.1110      6.7070
+     46.6740   1477.1720     34.0912      6.7120
+     46.7370   1477.0980     34.0469      6.7070
+     46.7990   1477.1190     34.1682      6.6730
+     46.8930   1476.9990     34.2552      6.6140
+     46.9590   1477.0940     34.4948      6.5610
+     47.0300   1476.8470     34.4063      6.5260
+     47.1110   1476.9740     34.5871      6.5000
+     47.1810   1477.0690     34.6962      6.4890
+     47.2520   1477.0440     34.7191      6.4750
+     47.3430   1476.8900     34.6046      6.4720
+     47.4300   1476.9050     34.5779      6.4840
+     47.4830   1477.0160     34.6443      6.4910
+     47.5530   1477.1060     34.6962      6.4970
+     47.6480   1477.0730     34.6062      6.5170
+     47.6980   1477.1050     34.6153      6.5220
+     47.7950   1477.1620     34.6657      6.5200
+     47.8360   1477.3880     34.8198      6.5280
+     47.9260   1477.2840     34.6519      6.5550
+     47.9900   1477.3880     34.6626      6.5780
+     48.0770   1477.3330     34.5428      6.6020
+     48.1590   1477.2580     34.4139      6.6240
+     48.2080   1477.3220     34.4330      6.6340
+     48.2900   1477.2280     34.3224      6.6450
+     48.3760   1477.2630     34.3277      6.6520
+     48.4540   1477.3070     34.3369      6.6600
+     48.5400   1477.4670     34.4223      6.6730
+     48.6090   1477.3880     34.3277      6.6830
+     48.6820   1477.5040     34.3849      6.6940
+     48.7410   1477.5880     34.3948      6.7120
+     48.8360   1477.6810     34.4154      6.7290
+     48.9220   1477.7620     34.4322      6.7440
+     48.9670   1477.8560     34.4719      6.7550
+     49.0360   1477.8400     34.4177      6.7680
+     49.1220   1477.8460     34.3781      6.7820
+     49.2050   1477.8150     34.3056      6.7970
+     49.2830   1477.7730     34.2369      6.8080
+     49.3500   1478.0060     34.4193      6.8090
+     49.4310   1477.9340     34.3758      6.8040
+     49.5200   1478.0530     34.5253      6.7860
+     49.5760   1478.1030     34.6207      6.7680
+     49.6520   1478.0650     34.6298      6.7550
+     49.7270   1478.0620     34.6603      6.7440
+     49.7930   1478.0690     34.6680      6.7430
+     49.8640   1478.0320     34.6313      6.7450
+     49.9510   1478.0350     34.6107      6.7520
+     50.0230   1478.1860     34.7366      6.7500
+     50.0840   1478.1500     34.7069      6.7500
+     50.1610   1478.0930     34.6420      6.7560
+     50.2500   1478.0290     34.5406      6.7720
+     50.3260   1477.9740     34.4521      6.7860
+     50.4020   1478.1510     34.5703      6.7930
+     50.4720   1478.1710     34.6039      6.7870
+     50.5520   1478.0750     34.5543      6.7780
+     50.6280   1478.1670     34.6298      6.7770
+     50.6890   1478.2190     34.6489      6.7840
+     50.7620   1478.3900     34.7717      6.7880
+     50.8530   1478.4140     34.7954      6.7860
+     50.9300   1478.3700     34.7809      6.7790
+     50.9880   1478.4630     34.8328      6.7860
+     51.0620   1478.3100     34.6886      6.7930
+     51.1320   1478.3860     34.7137      6.8040
+     51.2000   1478.3860     34.6848      6.8130
+     51.2360   1478.6420     34.8450      6.8270
+     51.2390   1478.7010     34.2949      7.0200
+     51.2570   1478.5770     34.1217      7.0440
+     51.2680   1478.4570     34.0256      7.0440
+     51.2730   1478.4260     34.0904      7.0150
+     51.2760   1478.5500     34.3567      6.9610
+     51.2790   1479.0820     34.1698      7.1590
+     51.2810   1479.3580     34.2758      7.1960
+     51.2840   1479.4580     34.3132      7.2100
@@ -0,0 +1,643 @@
+test_read_store_and_write
+5/5/2012
+13:50:14
+Probe: MIDAS SVP 6000
+Source: /root/package/data/input/valeport/midas/svp/FILE14.000
+      9.7100   1465.6890     11.7897     11.0050
+      9.7400   1465.6320     13.4735     10.4520
+      9.7750   1465.6730     13.9900     10.2980
+      9.8250   1465.7190     14.3547     10.1940
+      9.8680   1465.6680     14.5317     10.1240
+      9.9040   1465.6090     14.6179     10.0810
+      9.9900   1465.6380     14.7507     10.0460
+     10.0760   1465.6490     14.8155     10.0280
+     10.0970   1465.6420     14.8689     10.0090
+     10.1540   1465.6840     14.9567      9.9920
+     10.1910   1465.6220     14.9239      9.9860
+     10.2340   1465.6170     14.9414      9.9790
+     10.2770   1465.6110     14.9612      9.9710
+     10.3480   1465.6090     14.9643      9.9690
+     10.4050   1465.6290     14.9933      9.9650
+     10.4440   1465.6230     14.9940      9.9630
+     10.4760   1465.7310     15.0917      9.9600
+     10.5030   1465.6580     15.0284      9.9610
+     10.5210   1465.6730     15.0810      9.9480
+     10.5620   1465.7130     15.1009      9.9520
+     10.5850   1465.7230     15.1093      9.9520
+     10.6090   1465.7320     15.0940      9.9590
+     10.6300   1465.7290     15.0787      9.9630
+     10.6390   1465.7100     15.0665      9.9620
+     10.6440   1465.7410     15.0787      9.9660
+     10.6660   1465.7450     15.0818      9.9660
+     10.6670   1465.7530     15.0917      9.9650
+     10.6690   1465.6940     14.9864      9.9830
+     10.6720   1465.6720     14.9872      9.9770
+     10.6870   1465.6360     14.9857      9.9680
+     10.7080   1465.6300     14.9925      9.9640
+     10.7430   1465.6640     15.0391      9.9580
+     10.8130   1465.6240     15.0085      9.9570
+     10.8670   1465.4930     14.9086      9.9540
+     10.9460   1465.4290     14.8613      9.9520
+     10.9790   1465.4170     14.8827      9.9420
+     11.0350   1465.3930     14.8994      9.9300
+     11.0780   1465.3730     14.9239      9.9170
+     11.1620   1465.3880     14.9635      9.9080
+     11.2250   1465.3910     14.9872      9.9010
+     11.2710   1465.3840     15.0124      9.8910
+     11.3170   1465.3660     15.0093      9.8870
+     11.3600   1465.3460     15.0017      9.8840
+     11.3970   1465.3220     15.0063      9.8760
+     11.4380   1465.3020     14.9986      9.8730
+     11.4820   1465.2700     14.9719      9.8730
+     11.5310   1465.2530     14.9948      9.8610
+     11.5710   1465.2380     15.0040      9.8540
+     11.6330   1465.2170     14.9956      9.8510
+     11.6800   1465.2190     15.0215      9.8430
+     11.7610   1465.1980     15.0131      9.8400
+     11.7710   1465.1590     15.0024      9.8330
+     11.8320   1465.1360     15.0078      9.8250
+     11.8880   1465.1260     15.0116      9.8210
+     11.9350   1465.1170     15.0253      9.8140
+     11.9670   1465.1070     15.0452      9.8050
+     12.0510   1465.0950     15.0436      9.8020
+     12.0700   1465.0560     15.0368      9.7940
+     12.1350   1464.9730     15.0146      9.7790
+     12.2300   1464.8710     14.9704      9.7660
+     12.3530   1464.8370     15.0101      9.7440
+     12.4420   1464.8100     15.0436      9.7260
+     12.5340   1464.8060     15.0703      9.7160
+     12.6310   1464.7940     15.0940      9.7050
+     12.6910   1464.7940     15.1184      9.6970
+     12.7530   1464.8030     15.1443      9.6910
+     12.8210   1464.8110     15.1466      9.6920
+     12.8730   1464.8090     15.1352      9.6950
+     12.9490   1464.8360     15.1558      9.6950
+     13.0020   1464.8260     15.1505      9.6940
+     13.0820   1464.8020     15.1360      9.6920
+     13.1270   1464.7760     15.1260      9.6880
+     13.1960   1464.7690     15.1321      9.6840
+     13.2580   1464.7620     15.1321      9.6820
+     13.3530   1464.7600     15.1421      9.6780
+     13.4120   1464.7880     15.1833      9.6720
+     13.4910   1464.8170     15.2092      9.6710
+     13.5610   1464.8260     15.2122      9.6720
+     13.6350   1464.8520     15.2199      9.6760
+     13.7120   1464.8660     15.2275      9.6770
+     13.8040   1464.8780     15.2328      9.6780
+     13.8680   1464.8920     15.2344      9.6810
+     13.9180   1464.9020     15.2199      9.6880
+     13.9190   1464.9160     15.2283      9.6890
+     13.9470   1464.9070     15.2016      9.6950
+     13.9820   1464.8770     15.1917      9.6900
+     14.0300   1464.8580     15.1848      9.6870
+     14.0980   1464.8330     15.1665      9.6860
+     14.1520   1464.8350     15.1802      9.6820
+     14.1900   1464.8140     15.1718      9.6790
+     14.2660   1464.7780     15.1474      9.6770
+     14.3150   1464.8160     15.1970      9.6710
+     14.3860   1464.8690     15.2428      9.6700
+     14.4560   1464.8920     15.2580      9.6710
+     14.4940   1464.8940     15.2466      9.6750
+     14.5720   1464.8930     15.2222      9.6820
+     14.6160   1464.8560     15.1848      9.6840
+     14.6980   1465.6990     16.1186      9.6080
+     14.7800   1466.0990     17.3317      9.3280
+     14.8300   1466.2520     18.5265      8.9900
+     14.8920   1466.2000     19.4153      8.6960
+     14.9590   1466.1030     20.2469      8.4090
+     15.0550   1466.0950     21.1647      8.1180
+     15.1060   1466.0790     21.8712      7.8920
+     15.1730   1466.0680     22.4136      7.7190
+     15.2510   1466.0750     22.8233      7.5920
+     15.3160   1466.0500     23.1026      7.4980
+     15.3310   1466.0430     23.3109      7.4310
+     15.3360   1466.0100     23.7289      7.2920
+     15.3460   1466.0290     23.8014      7.2740
+     15.3560   1466.0780     23.9212      7.2490
+     15.4110   1465.9700     23.8777      7.2350
+     15.4760   1465.9300     23.8770      7.2250
+     15.4880   1465.9410     23.9082      7.2180
+     15.4980   1465.9620     23.9052      7.2240
+     15.5020   1466.0020     23.9090      7.2330
+     15.5070   1466.1130     23.9632      7.2440
+     15.5130   1466.1180     23.9571      7.2470
+     15.5160   1466.1460     23.9380      7.2600
+     15.5320   1465.9530     23.6801      7.2920
+     15.5630   1465.9270     23.7259      7.2710
+     15.6360   1465.9080     23.7801      7.2490
+     15.6890   1465.8520     23.7923      7.2310
+     15.7730   1465.7690     23.8297      7.1980
+     15.8270   1465.6730     23.8411      7.1700
+     15.9060   1465.6010     23.8914      7.1360
+     15.9850   1465.5630     23.9754      7.1000
+     16.0130   1465.5740     24.0639      7.0750
+     16.0170   1465.5290     24.1074      7.0500
+     16.0250   1465.5130     24.1333      7.0380
+     16.0280   1465.5380     24.1592      7.0360
+     16.0350   1465.6180     24.3294      7.0030
+     16.0360   1465.5780     24.2844      7.0070
+     16.0470   1465.5410     24.2485      7.0090
+     16.1300   1465.4500     24.1966      7.0020
+     16.2240   1465.3990     24.2149      6.9830
+     16.3620   1465.3320     24.2493      6.9550
+     16.5110   1465.3700     24.3904      6.9200
+     16.7280   1465.3400     24.4148      6.9040
+     16.9810   1465.3100     24.4385      6.8880
+     17.1960   1465.3340     24.5094      6.8710
+     17.4330   1465.3150     24.5171      6.8630
+     17.6440   1465.3070     24.5369      6.8540
+     17.8110   1465.4280     24.6094      6.8610
+     17.8720   1465.4860     24.6712      6.8560
+     17.9250   1465.4670     24.6773      6.8490
+     17.9410   1465.4300     24.6864      6.8370
+     17.9590   1465.2300     24.9626      6.7010
+     17.9690   1465.1850     25.0069      6.6760
+     17.9850   1465.1360     24.9573      6.6790
+     18.0230   1465.1250     24.9802      6.6690
+     18.0520   1465.1340     25.0259      6.6570
+     18.0940   1465.1340     25.0542      6.6480
+     18.1240   1465.1220     25.0671      6.6410
+     18.1700   1465.1000     25.0740      6.6330
+     18.2070   1465.0900     25.0946      6.6240
+     18.2630   1465.0880     25.1183      6.6160
+     18.3070   1465.0790     25.1457      6.6050
+     18.3420   1465.0720     25.1526      6.6010
+     18.4020   1465.0630     25.1701      6.5930
+     18.4660   1465.0460     25.1816      6.5850
+     18.5340   1465.0360     25.2083      6.5740
+     18.6090   1465.0330     25.2434      6.5620
+     18.6710   1465.0260     25.2594      6.5550
+     18.7010   1465.0130     25.2777      6.5460
+     18.8080   1465.0060     25.3128      6.5330
+     18.8640   1464.9980     25.3372      6.5230
+     18.9340   1465.0130     25.3777      6.5140
+     18.9860   1465.0080     25.3860      6.5100
+     19.0360   1465.0080     25.4074      6.5030
+     19.0960   1465.0110     25.4219      6.4990
+     19.1590   1465.0020     25.4234      6.4960
+     19.2370   1464.9990     25.4364      6.4910
+     19.2860   1464.9840     25.4303      6.4890
+     19.3330   1464.9700     25.4250      6.4870
+     19.3430   1464.9420     25.4059      6.4860
+     19.3570   1465.1550     25.6561      6.4610
+     19.3740   1465.1110     25.6531      6.4510
+     19.3900   1465.1220     25.6905      6.4420
+     19.3910   1465.0720     25.6699      6.4360
+     19.4190   1465.0570     25.6828      6.4280
+     19.4610   1465.0210     25.6859      6.4180
+     19.4810   1465.0130     25.7248      6.4040
+     19.4910   1464.9680     25.7751      6.3770
+     19.5390   1464.8590     25.7492      6.3580
+     19.5540   1464.7330     25.6966      6.3430
+     19.5910   1464.7000     25.7050      6.3320
+     19.6160   1464.6460     25.6973      6.3210
+     19.6340   1464.6170     25.7286      6.3040
+     19.6810   1464.6030     25.7721      6.2870
+     19.7360   1464.5860     25.8347      6.2630
+     19.7490   1464.5700     25.8965      6.2400
+     19.8020   1464.5550     25.9644      6.2150
+     19.8440   1464.5320     26.0353      6.1870
+     19.8560   1464.5210     26.1108      6.1610
+     19.9190   1464.5100     26.1787      6.1370
+     19.9720   1464.4990     26.2398      6.1150
+     19.9930   1464.4880     26.2985      6.0940
+     20.0420   1464.4800     26.3596      6.0730
+     20.0980   1464.4870     26.4099      6.0590
+     20.1410   1464.4760     26.4328      6.0490
+     20.2020   1464.4560     26.4648      6.0340
+     20.2650   1464.4460     26.4915      6.0230
+     20.3020   1464.4300     26.5137      6.0120
+     20.3690   1464.4300     26.5480      6.0010
+     20.4340   1464.4420     26.5953      5.9890
+     20.4780   1464.4290     26.6136      5.9800
+     20.5670   1464.4290     26.6350      5.9730
+     20.6090   1464.4150     26.6434      5.9670
+     20.7120   1464.4060     26.6670      5.9570
+     20.7680   1464.4030     26.6602      5.9580
+     20.8430   1464.3990     26.6792      5.9510
+     20.8940   1464.3920     26.6891      5.9460
+     20.9670   1464.3710     26.7227      5.9300
+     21.0330   1464.3610     26.7303      5.9250
+     21.1090   1464.3530     26.7426      5.9190
+     21.1790   1464.2650     26.7395      5.8980
+     21.2520   1464.2200     26.7448      5.8850
+     21.3320   1464.1930     26.7677      5.8710
+     21.3900   1464.1740     26.8326      5.8460
+     21.4540   1464.1690     26.8860      5.8280
+     21.5240   1464.0840     26.8562      5.8160
+     21.6140   1464.0130     26.8990      5.7850
+     21.6800   1463.9840     26.9981      5.7470
+     21.7280   1463.9020     27.0264      5.7180
+     21.8290   1463.8890     27.1057      5.6900
+     21.8970   1463.8630     27.1912      5.6570
+     21.9750   1463.8120     27.2766      5.6180
+     22.0440   1463.7730     27.3483      5.5860
+     22.1250   1463.7490     27.4124      5.5600
+     22.1850   1463.7510     27.5169      5.5280
+     22.2680   1463.7270     27.5749      5.5040
+     22.3450   1463.7500     27.6344      5.4910
+     22.4170   1463.7760     27.6733      5.4850
+     22.5120   1463.7650     27.6825      5.4790
+     22.5640   1463.6270     27.6024      5.4700
+     22.6400   1463.5360     27.6360      5.4370
+     22.6980   1463.5000     27.6627      5.4200
+     22.7700   1463.4590     27.7657      5.3780
+     22.8270   1463.4700     27.9129      5.3350
+     22.9230   1463.4570     28.0472      5.2900
+     22.9980   1463.4520     28.1662      5.2520
+     23.0480   1463.4370     28.2509      5.2220
+     23.1420   1463.4070     28.2944      5.2010
+     23.2030   1463.3840     28.3180      5.1880
+     23.2840   1463.3040     28.3028      5.1730
+     23.3480   1463.2950     28.3760      5.1480
+     23.4150   1463.2770     28.4485      5.1210
+     23.5070   1463.3010     28.5248      5.1030
+     23.5890   1463.3230     28.6194      5.0790
+     23.6310   1463.2750     28.6423      5.0600
+     23.7160   1463.2160     28.6438      5.0450
+     23.7770   1463.1770     28.6903      5.0210
+     23.8610   1463.1680     28.7666      4.9950
+     23.9510   1463.1440     28.8025      4.9780
+     24.0230   1463.1140     28.8361      4.9600
+     24.0760   1463.0810     28.8651      4.9430
+     24.1540   1463.0660     28.8948      4.9300
+     24.2140   1463.0510     28.9635      4.9050
+     24.3040   1463.0500     29.0169      4.8880
+     24.3730   1463.0580     29.0810      4.8700
+     24.4920   1463.0590     29.1122      4.8600
+     24.5680   1463.0550     29.1573      4.8450
+     24.6360   1463.0490     29.2007      4.8300
+     24.7300   1463.0550     29.2366      4.8200
+     24.8090   1463.0530     29.2603      4.8120
+     24.9040   1463.0400     29.2976      4.7970
+     24.9980   1463.0580     29.3465      4.7860
+     25.0890   1463.0520     29.3503      4.7830
+     25.1640   1463.0610     29.4083      4.7670
+     25.2780   1463.0640     29.4319      4.7600
+     25.3240   1463.0860     29.4815      4.7500
+     25.4180   1463.1180     29.5250      4.7440
+     25.5140   1463.1580     29.5876      4.7340
+     25.5950   1463.2010     29.6524      4.7240
+     25.6790   1463.2350     29.6883      4.7210
+     25.7720   1463.2770     29.7295      4.7180
+     25.8560   1463.3310     29.7806      4.7150
+     25.9360   1463.4090     29.8439      4.7140
+     26.0140   1463.4860     29.9194      4.7090
+     26.0830   1463.5510     29.9629      4.7110
+     26.2020   1463.6060     29.9950      4.7140
+     26.3130   1463.6810     30.0430      4.7170
+     26.3990   1463.7540     30.0789      4.7230
+     26.4770   1463.8530     30.1460      4.7260
+     26.5810   1463.9570     30.2132      4.7300
+     26.6910   1464.0850     30.2696      4.7430
+     26.8030   1464.1400     30.2856      4.7510
+     26.8970   1464.2020     30.3009      4.7610
+     26.9860   1464.2770     30.3291      4.7700
+     27.0980   1464.3060     30.3307      4.7760
+     27.2260   1464.3490     30.3337      4.7850
+     27.3240   1464.4240     30.3818      4.7880
+     27.4090   1464.4970     30.4184      4.7940
+     27.5110   1464.4980     30.3947      4.8010
+     27.6070   1464.5540     30.4146      4.8080
+     27.7310   1464.6080     30.4398      4.8130
+     27.8240   1464.6800     30.4718      4.8200
+     27.9170   1464.7200     30.4863      4.8250
+     28.0090   1464.8050     30.5290      4.8320
+     28.1250   1464.9050     30.5832      4.8390
+     28.2220   1464.9630     30.6015      4.8470
+     28.3290   1465.0010     30.5939      4.8580
+     28.4450   1465.1110     30.6435      4.8690
+     28.5490   1465.1450     30.6526      4.8740
+     28.6110   1465.1980     30.6709      4.8810
+     28.6700   1465.2720     30.6923      4.8920
+     28.7010   1465.2930     30.6725      4.9030
+     28.7470   1465.2900     30.6602      4.9060
+     28.7490   1465.3820     30.6839      4.9210
+     28.7650   1465.3910     30.6709      4.9270
+     28.7750   1465.4110     30.6740      4.9310
+     28.7800   1465.4220     30.6854      4.9300
+     28.8190   1465.4570     30.7060      4.9320
+     28.8430   1465.4940     30.7320      4.9330
+     28.8740   1465.5210     30.7426      4.9360
+     28.9450   1465.6210     30.8044      4.9410
+     28.9860   1465.7160     30.8556      4.9480
+     29.0280   1465.7810     30.8769      4.9570
+     29.1010   1465.8430     30.9021      4.9640
+     29.1300   1465.9210     30.9532      4.9670
+     29.1840   1465.9960     30.9982      4.9710
+     29.2710   1466.0360     31.0028      4.9790
+     29.3360   1466.0820     30.9967      4.9920
+     29.4270   1466.1080     30.9769      5.0040
+     29.4680   1466.1320     30.9761      5.0100
+     29.5580   1466.1490     30.9464      5.0230
+     29.6160   1466.1750     30.9525      5.0270
+     29.6780   1466.1940     30.9441      5.0340
+     29.7710   1466.1910     30.9250      5.0390
+     29.8440   1466.2090     30.9250      5.0430
+     29.8980   1466.2440     30.9326      5.0490
+     29.9830   1466.2880     30.9662      5.0490
+     30.0540   1466.3150     30.9700      5.0540
+     30.1300   1466.3480     30.9883      5.0560
+     30.1940   1466.3660     30.9952      5.0580
+     30.2730   1466.3880     31.0081      5.0590
+     30.3510   1466.4250     31.0143      5.0660
+     30.4230   1466.4640     31.0242      5.0720
+     30.4860   1466.5100     31.0501      5.0750
+     30.5860   1466.5610     31.0661      5.0820
+     30.6680   1466.6260     31.0905      5.0900
+     30.7550   1466.6540     31.1081      5.0910
+     30.8710   1466.7100     31.1279      5.0980
+     30.9440   1466.7460     31.1394      5.1030
+     30.9990   1466.7510     31.1264      5.1080
+     31.1060   1466.7750     31.1378      5.1100
+     31.1800   1466.8040     31.1462      5.1140
+     31.2830   1466.8110     31.1600      5.1110
+     31.3680   1466.8240     31.1531      5.1160
+     31.4820   1466.8400     31.1577      5.1180
+     31.5630   1466.8800     31.1852      5.1190
+     31.6570   1466.9550     31.2233      5.1250
+     31.7420   1467.0140     31.2531      5.1300
+     31.8210   1467.0700     31.2698      5.1380
+     31.9120   1467.1160     31.2859      5.1440
+     31.9930   1467.1680     31.3126      5.1480
+     32.0990   1467.2100     31.3217      5.1550
+     32.1740   1467.2960     31.3629      5.1630
+     32.2620   1467.3760     31.3988      5.1710
+     32.3450   1467.4280     31.4034      5.1820
+     32.4450   1467.4920     31.4331      5.1880
+     32.5390   1467.5870     31.4743      5.1980
+     32.6050   1467.7090     31.5407      5.2070
+     32.6630   1467.9040     31.6391      5.2240
+     32.7730   1468.1470     31.7932      5.2350
+     32.8550   1468.3020     31.8375      5.2590
+     32.9590   1468.4370     31.8848      5.2770
+     33.0490   1468.5040     31.8657      5.2990
+     33.1240   1468.6140     31.9000      5.3150
+     33.2210   1468.7470     31.9618      5.3280
+     33.2940   1468.8220     31.9977      5.3350
+     33.3930   1468.8710     31.9931      5.3480
+     33.4890   1468.9400     32.0015      5.3620
+     33.5640   1469.1120     32.1068      5.3710
+     33.6280   1469.2350     32.1587      5.3850
+     33.7160   1469.3660     32.2128      5.4000
+     33.7870   1469.5360     32.2884      5.4180
+     33.8810   1469.5640     32.2609      5.4330
+     33.9660   1469.6570     32.2914      5.4460
+     34.0540   1469.6890     32.2678      5.4610
+     34.1640   1469.8300     32.3395      5.4730
+     34.2180   1469.8700     32.3479      5.4800
+     34.3400   1469.9350     32.3532      5.4940
+     34.4020   1469.9890     32.3532      5.5070
+     34.4910   1470.0280     32.3639      5.5130
+     34.5510   1470.0720     32.3753      5.5200
+     34.6330   1470.1180     32.3822      5.5290
+     34.6770   1470.1150     32.3532      5.5370
+     34.7500   1469.9740     32.2289      5.5410
+     34.8360   1470.1590     32.3860      5.5370
+     34.9290   1470.3580     32.5546      5.5330
+     35.0260   1470.4680     32.5989      5.5460
+     35.0970   1470.5460     32.6050      5.5630
+     35.1860   1470.4710     32.4936      5.5790
+     35.2770   1470.4700     32.4791      5.5830
+     35.3440   1470.4450     32.4234      5.5940
+     35.4340   1470.5910     32.5188      5.6000
+     35.5030   1470.7530     32.6263      5.6060
+     35.6040   1470.9280     32.7347      5.6150
+     35.6800   1471.1650     32.8568      5.6350
+     35.7650   1471.1960     32.8041      5.6590
+     35.8520   1471.2790     32.8079      5.6780
+     35.9320   1471.2790     32.7530      5.6950
+     36.0160   1471.3780     32.7888      5.7080
+     36.0960   1471.4870     32.8171      5.7260
+     36.1690   1471.6270     32.8857      5.7390
+     36.2560   1471.9410     33.0719      5.7580
+     36.3370   1472.1300     33.1314      5.7860
+     36.4410   1472.3410     33.2146      5.8120
+     36.5160   1472.4840     33.2321      5.8420
+     36.6020   1472.4930     33.1436      5.8720
+     36.6860   1472.5930     33.1451      5.8960
+     36.7910   1472.7270     33.1802      5.9180
+     36.8590   1472.8480     33.2214      5.9350
+     36.9460   1472.9700     33.2542      5.9550
+     37.0210   1473.0150     33.2321      5.9730
+     37.1150   1473.0500     33.2016      5.9910
+     37.2000   1473.1290     33.2092      6.0080
+     37.2710   1473.2170     33.2245      6.0250
+     37.3420   1473.2360     33.1947      6.0390
+     37.4110   1473.2840     33.2062      6.0470
+     37.5100   1473.5240     33.3923      6.0480
+     37.5950   1473.6750     33.4572      6.0650
+     37.6800   1473.8020     33.4648      6.0940
+     37.7480   1473.9290     33.4953      6.1160
+     37.8500   1474.0800     33.5228      6.1450
+     37.9310   1474.1370     33.4915      6.1690
+     37.9960   1474.2510     33.4961      6.1960
+     38.0750   1474.3440     33.4999      6.2180
+     38.1960   1474.4060     33.4717      6.2420
+     38.2520   1474.4700     33.4717      6.2580
+     38.3390   1474.6010     33.5091      6.2790
+     38.4250   1474.6950     33.5320      6.2950
+     38.5110   1474.7210     33.5205      6.3050
+     38.5900   1474.7270     33.4862      6.3170
+     38.6700   1474.7370     33.4587      6.3280
+     38.7580   1474.7570     33.4549      6.3340
+     38.8500   1474.7430     33.4328      6.3370
+     38.9190   1474.7560     33.4236      6.3430
+     39.0110   1474.7770     33.4236      6.3480
+     39.0960   1474.7820     33.4167      6.3510
+     39.1640   1474.7880     33.4175      6.3520
+     39.2270   1474.7900     33.4122      6.3540
+     39.3250   1474.8230     33.4335      6.3550
+     39.4130   1474.8520     33.4366      6.3610
+     39.4900   1474.8730     33.4526      6.3610
+     39.5920   1474.9390     33.4908      6.3650
+     39.6890   1475.0100     33.5182      6.3740
+     39.7760   1475.1870     33.6227      6.3850
+     39.8610   1475.2230     33.5976      6.4020
+     39.9620   1475.2440     33.5846      6.4110
+     40.0600   1475.3420     33.6456      6.4160
+     40.1720   1475.4210     33.6914      6.4210
+     40.2760   1475.4210     33.6617      6.4300
+     40.3680   1475.4740     33.6899      6.4340
+     40.4610   1475.5390     33.6998      6.4470
+     40.4690   1475.5820     33.6868      6.4620
+     40.4920   1475.5060     33.6044      6.4690
+     40.4940   1475.1980     33.3717      6.4650
+     40.5160   1475.6620     33.6151      6.5050
+     40.5270   1475.6670     33.6227      6.5040
+     40.5380   1475.6710     33.6159      6.5070
+     40.5940   1475.6800     33.6166      6.5090
+     40.6490   1475.7030     33.6342      6.5090
+     40.7160   1475.7520     33.6594      6.5130
+     40.7640   1475.7760     33.6716      6.5150
+     40.8120   1475.7950     33.6800      6.5170
+     40.8850   1475.8270     33.7013      6.5180
+     40.9440   1475.8450     33.7051      6.5210
+     40.9520   1475.8680     33.7173      6.5230
+     41.0330   1475.8960     33.7296      6.5260
+     41.0990   1475.9260     33.7303      6.5330
+     41.1550   1475.9610     33.7326      6.5410
+     41.1980   1475.9490     33.7036      6.5470
+     41.2330   1475.9420     33.6792      6.5530
+     41.3050   1475.9560     33.6769      6.5570
+     41.3370   1476.0280     33.7181      6.5620
+     41.3400   1476.0910     33.6929      6.5860
+     41.3850   1476.0950     33.6861      6.5890
+     41.4230   1476.0970     33.6906      6.5880
+     41.4920   1476.1290     33.7151      6.5880
+     41.6070   1476.1840     33.7509      6.5900
+     41.7860   1476.1990     33.7479      6.5940
+     41.8710   1476.1110     33.6617      6.5990
+     42.0130   1476.1590     33.6975      6.5990
+     42.1270   1476.2380     33.7746      6.5940
+     42.2030   1475.9590     33.5701      6.5880
+     42.2840   1475.9810     33.6121      6.5800
+     42.3500   1476.1570     33.7509      6.5800
+     42.4350   1476.0330     33.6639      6.5760
+     42.5140   1476.2760     33.8837      6.5670
+     42.6140   1476.3250     33.9279      6.5650
+     42.6900   1476.3570     33.9310      6.5720
+     42.7740   1476.4390     33.9355      6.5910
+     42.8520   1476.4180     33.8676      6.6070
+     42.9260   1476.5350     33.9134      6.6220
+     43.0280   1476.6450     33.9462      6.6390
+     43.1300   1476.7680     34.0088      6.6500
+     43.2040   1476.8420     34.0042      6.6700
+     43.2990   1476.8700     33.9661      6.6890
+     43.3870   1476.9290     33.9561      6.7070
+     43.4980   1476.9310     33.9005      6.7250
+     43.6080   1476.9810     33.8829      6.7430
+     43.6960   1477.0550     33.9188      6.7500
+     43.8130   1477.0790     33.8959      6.7630
+     43.9210   1477.1310     33.9111      6.7710
+     44.0040   1477.1840     33.9149      6.7830
+     44.0910   1477.2300     33.9317      6.7890
+     44.1980   1477.3170     33.9684      6.7990
+     44.3270   1477.3370     33.9584      6.8070
+     44.4160   1477.3700     33.9676      6.8120
+     44.5100   1477.4370     33.9890      6.8220
+     44.6190   1477.4270     33.9607      6.8280
+     44.7170   1477.4970     33.9905      6.8360
+     44.8230   1477.5410     33.9966      6.8450
+     44.9290   1477.5710     33.9935      6.8530
+     45.0440   1477.5930     33.9943      6.8580
+     45.1630   1477.6330     33.9966      6.8670
+     45.2450   1477.6210     33.9737      6.8710
+     45.3490   1477.6430     33.9714      6.8770
+     45.4680   1477.7070     33.9928      6.8860
+     45.5750   1477.7750     34.0302      6.8910
+     45.6630   1477.8300     34.0485      6.8990
+     45.7640   1477.9070     34.0805      6.9080
+     45.8770   1477.9450     34.0752      6.9190
+     45.9870   1477.9560     34.0607      6.9260
+     46.0660   1478.0010     34.0614      6.9370
+     46.1630   1478.0410     34.0706      6.9440
+     46.2880   1478.0840     34.0813      6.9510
+     46.3810   1478.1360     34.1003      6.9580
+     46.4890   1478.1700     34.0950      6.9680
+     46.5940   1478.2080     34.1049      6.9740
+     46.7040   1478.2450     34.0958      6.9860
+     46.8070   1478.3110     34.1316      6.9910
+     46.8960   1478.4510     34.2239      6.9970
+     47.0310   1478.5020     34.2072      7.0150
+     47.0990   1478.5380     34.1919      7.0290
+     47.2030   1478.6650     34.2674      7.0370
+     47.2910   1478.7150     34.2499      7.0550
+     47.4190   1478.7520     34.2499      7.0640
+     47.5280   1478.7690     34.2224      7.0770
+     47.6160   1478.8120     34.2369      7.0830
+     47.7360   1478.8320     34.2232      7.0920
+     47.8330   1478.8670     34.2285      7.0990
+     47.9420   1478.8950     34.2216      7.1080
+     48.0580   1478.9110     34.2300      7.1090
+     48.1550   1478.9390     34.2415      7.1120
+     48.2550   1478.9750     34.2445      7.1200
+     48.3420   1478.9940     34.2522      7.1220
+     48.4890   1479.0250     34.2781      7.1210
+     48.5890   1479.0550     34.2758      7.1290
+     48.6940   1479.0780     34.2812      7.1330
+     48.7660   1479.1080     34.2789      7.1410
+     48.8840   1479.1310     34.2804      7.1460
+     48.9820   1479.1470     34.2735      7.1520
+     49.0910   1479.1570     34.2705      7.1550
+     49.1990   1479.1710     34.2743      7.1570
+     49.3000   1479.1930     34.2812      7.1600
+     49.3950   1479.2250     34.2873      7.1660
+     49.4860   1479.2510     34.3010      7.1680
+     49.5680   1479.2600     34.2911      7.1730
+     49.6560   1479.2600     34.2873      7.1740
+     49.7350   1479.2530     34.2834      7.1730
+     49.8010   1479.2770     34.3018      7.1730
+     49.8540   1479.2640     34.3002      7.1700
+     49.9220   1479.2960     34.3185      7.1720
+     49.9730   1479.3280     34.3407      7.1730
+     50.0530   1479.3510     34.3391      7.1790
+     50.1150   1479.3830     34.3643      7.1790
+     50.1700   1479.4060     34.3536      7.1880
+     50.2310   1479.4430     34.3643      7.1940
+     50.2960   1479.4570     34.3620      7.1980
+     50.3560   1479.4600     34.3513      7.2020
+     50.3810   1479.4700     34.3407      7.2080
+     50.4640   1479.4730     34.3391      7.2090
+     50.5270   1479.4850     34.3384      7.2120
+     50.5940   1479.4960     34.3430      7.2130
+     50.6450   1479.5160     34.3460      7.2170
+     50.6990   1479.5330     34.3498      7.2200
+     50.7620   1479.5380     34.3468      7.2220
+     50.8110   1479.5460     34.3399      7.2260
+     50.8760   1479.5600     34.3536      7.2250
+     50.9530   1479.5710     34.3521      7.2280
+     50.9990   1479.5870     34.3552      7.2310
+     51.0720   1479.6030     34.3605      7.2330
+     51.1440   1479.6100     34.3559      7.2360
+     51.1840   1479.6220     34.3620      7.2370
+     51.2510   1479.6340     34.3681      7.2380
+     51.3100   1479.6430     34.3712      7.2390
+     51.3650   1479.6500     34.3727      7.2400
+     51.4190   1479.6610     34.3689      7.2440
+     51.4990   1479.6700     34.3689      7.2460
+     51.5650   1479.6770     34.3796      7.2440
+     51.6380   1479.6800     34.3781      7.2450
+     51.6940   1479.6910     34.3796      7.2470
+     51.7720   1479.6990     34.3819      7.2480
+     51.8000   1479.7120     34.3918      7.2480
+     51.8650   1479.7330     34.4017      7.2500
+     51.9250   1479.7440     34.3918      7.2560
+     52.0120   1479.7560     34.4124      7.2520
+     52.0200   1479.7720     34.4124      7.2560
+     52.0500   1479.8010     34.4292      7.2580
+     52.0690   1479.8020     34.4238      7.2600
+     52.0720   1479.8380     34.4276      7.2680
+     52.0930   1479.8380     34.4215      7.2700
+     52.0990   1479.8380     34.4246      7.2690
+     52.1180   1479.8400     34.4254      7.2690
+     52.1310   1479.8420     34.4360      7.2660
+     52.1460   1479.8420     34.4177      7.2720
+     52.1750   1479.8440     34.4223      7.2710
+     52.1810   1479.8440     34.4315      7.2680
+     52.2060   1479.8450     34.4315      7.2680
+     52.2240   1479.8440     34.4307      7.2680
+     52.2560   1479.8450     34.4368      7.2660
+     52.2650   1479.8450     34.4246      7.2700
+     52.2750   1479.8450     34.4246      7.2700
+     52.2820   1479.8440     34.4269      7.2690
+     52.3060   1479.8460     34.4345      7.2670
+     52.3240   1479.8470     34.4345      7.2670
+     52.3550   1479.8480     34.4322      7.2680
+     52.3870   1479.8500     34.4421      7.2650
+     52.4210   1479.8510     34.4276      7.2700
+     52.4250   1479.8520     34.4315      7.2690
+     52.4480   1479.8530     34.4284      7.2700
+     52.4540   1479.8530     34.4345      7.2680
+     52.4820   1479.8540     34.4322      7.2690
+     52.5100   1479.8560     34.4360      7.2680
+     52.5400   1479.8570     34.4337      7.2690
+     52.5420   1479.8580     34.4315      7.2700
+     52.5470   1479.8600     34.4360      7.2690
+     52.5840   1479.8610     34.4360      7.2690
+     52.6080   1479.8610     34.4391      7.2680
+     52.6120   1479.8620     34.4337      7.2700
+     52.6530   1479.8620     34.4330      7.2700
+     52.6700   1479.8620     34.4391      7.2680
+     52.6750   1479.8630     34.4398      7.2680
+     52.6780   1479.8600     34.4315      7.2700
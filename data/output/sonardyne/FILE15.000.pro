@@ -0,0 +1,315 @@
+test_read_store_and_write
+5/5/2012
+14:11:6
+Probe: MIDAS SVP 6000
+Source: /root/package/data/input/valeport/midas/svp/FILE15.000
+      9.7790   1465.3760     17.4065      9.1380
+      9.8400   1465.3950     16.7908      9.3370
+      9.8860   1465.4000     16.2849      9.4980
+      9.9530   1465.3950     15.9256      9.6100
+     10.0010   1465.3980     15.6815      9.6880
+     10.0180   1465.4140     15.5396      9.7370
+     10.0210   1465.3870     15.1604      9.8500
+     10.0250   1465.3830     15.1733      9.8450
+     10.0570   1465.3950     15.1291      9.8620
+     10.0990   1465.4150     15.1291      9.8670
+     10.1530   1465.4210     15.1268      9.8690
+     10.1960   1465.4350     15.1222      9.8740
+     10.2750   1465.4290     15.1039      9.8780
+     10.3910   1465.4290     15.0986      9.8790
+     10.4810   1465.4210     15.0879      9.8800
+     10.5800   1465.4220     15.0871      9.8800
+     10.6780   1465.4200     15.0848      9.8800
+     10.7830   1465.3930     15.0543      9.8820
+     10.9110   1465.4030     15.0734      9.8780
+     11.0460   1465.3680     15.0558      9.8740
+     11.1510   1465.3610     15.0482      9.8740
+     11.2730   1465.3510     15.0513      9.8700
+     11.3600   1465.3500     15.0681      9.8640
+     11.4720   1465.3280     15.0612      9.8600
+     11.5790   1465.3190     15.0612      9.8570
+     11.6970   1465.3220     15.0688      9.8550
+     11.8040   1465.2030     14.9971      9.8460
+     11.9230   1465.1970     15.0101      9.8400
+     12.0430   1465.2470     15.0871      9.8280
+     12.1560   1465.1840     15.0497      9.8230
+     12.2680   1465.1530     15.0444      9.8160
+     12.3740   1465.1800     15.1001      9.8050
+     12.4890   1465.2130     15.1482      9.7980
+     12.6170   1465.2100     15.1497      9.7960
+     12.7300   1465.1470     15.0993      9.7950
+     12.8400   1465.1120     15.0696      9.7950
+     12.9740   1464.8740     14.9185      9.7800
+     13.0840   1464.8320     14.9643      9.7540
+     13.1800   1464.8130     15.0139      9.7330
+     13.3130   1464.7930     15.0650      9.7110
+     13.4140   1464.8050     15.1367      9.6910
+     13.5460   1464.8000     15.1718      9.6780
+     13.6640   1464.7930     15.2031      9.6660
+     13.8060   1464.8050     15.2420      9.6560
+     13.9340   1464.8120     15.2657      9.6500
+     14.0730   1464.8130     15.2710      9.6480
+     14.2130   1464.8210     15.2657      9.6510
+     14.3390   1464.8060     15.2489      9.6520
+     14.4600   1464.8100     15.2596      9.6490
+     14.5800   1464.8100     15.2649      9.6470
+     14.7380   1464.8120     15.2611      9.6480
+     14.8720   1464.8230     15.2748      9.6460
+     15.0080   1464.8250     15.2779      9.6450
+     15.1040   1465.0610     15.5182      9.6300
+     15.2590   1465.6120     16.3399      9.5130
+     15.3910   1465.8960     17.2768      9.2900
+     15.5270   1465.8680     18.3136      8.9550
+     15.6430   1465.9780     19.1536      8.7180
+     15.7770   1465.9330     19.6014      8.5650
+     15.9070   1465.9600     19.8250      8.5010
+     16.0360   1465.9890     20.2034      8.3890
+     16.1690   1465.9490     20.9076      8.1570
+     16.3180   1465.9510     21.5248      7.9630
+     16.4640   1465.9030     21.9246      7.8250
+     16.6210   1465.8890     22.3328      7.6930
+     16.7760   1465.7930     22.6074      7.5820
+     16.9310   1465.7840     22.9141      7.4830
+     17.0740   1465.6720     23.1003      7.3960
+     17.2120   1465.7050     23.4680      7.2890
+     17.3480   1465.5040     23.4581      7.2410
+     17.5160   1465.5490     23.6427      7.1940
+     17.6940   1465.4770     23.7808      7.1320
+     17.8100   1465.3480     23.8998      7.0620
+     17.9540   1465.3470     24.1028      6.9980
+     18.1210   1465.2930     24.2050      6.9520
+     18.2380   1465.2750     24.3332      6.9070
+     18.3830   1465.2210     24.4102      6.8690
+     18.5390   1465.2280     24.5453      6.8280
+     18.6780   1465.1980     24.6765      6.7790
+     18.8320   1465.1150     24.7688      6.7290
+     18.9600   1465.1050     24.8459      6.7020
+     19.1040   1465.1060     24.9771      6.6610
+     19.2560   1465.1060     25.0679      6.6320
+     19.4000   1464.9880     25.0717      6.6010
+     19.5300   1464.9180     25.1068      6.5720
+     19.6680   1464.9460     25.2052      6.5480
+     19.8130   1464.8220     25.2068      6.5160
+     19.9450   1464.8810     25.3586      6.4830
+     20.0720   1464.7480     25.3952      6.4380
+     20.1920   1464.7240     25.4616      6.4110
+     20.2420   1465.0770     25.8430      6.3800
+     20.2440   1464.6470     26.2123      6.1590
+     20.2680   1464.6340     26.2085      6.1570
+     20.2860   1464.6170     26.1978      6.1560
+     20.3380   1464.5850     26.1749      6.1550
+     20.3940   1464.5510     26.1566      6.1520
+     20.4600   1464.5250     26.1612      6.1440
+     20.5400   1464.5190     26.1841      6.1350
+     20.6100   1464.5140     26.2276      6.1200
+     20.6830   1464.5040     26.2733      6.1030
+     20.7470   1464.5050     26.3382      6.0830
+     20.8270   1464.4860     26.3901      6.0620
+     20.9070   1464.4780     26.4465      6.0420
+     21.0200   1464.4430     26.4824      6.0220
+     21.1240   1464.4220     26.5091      6.0080
+     21.2400   1464.4040     26.5068      6.0040
+     21.3460   1464.4160     26.5472      5.9940
+     21.4540   1464.4080     26.5976      5.9760
+     21.5810   1464.3600     26.5961      5.9640
+     21.6720   1464.3900     26.6769      5.9460
+     21.8270   1464.3140     26.7021      5.9190
+     21.9350   1464.2930     26.7456      5.9000
+     22.0630   1464.3220     26.8349      5.8790
+     22.1820   1464.0820     26.6975      5.8620
+     22.3060   1464.0810     26.7761      5.8370
+     22.4580   1463.9520     26.8883      5.7700
+     22.6020   1463.8450     26.9928      5.7110
+     22.7180   1463.8210     27.1767      5.6480
+     22.8350   1463.8390     27.3804      5.5890
+     22.9850   1463.8320     27.4895      5.5530
+     23.1290   1463.8030     27.5650      5.5220
+     23.2890   1463.6590     27.5826      5.4810
+     23.4160   1463.6160     27.7252      5.4260
+     23.5750   1463.5190     27.8152      5.3740
+     23.6930   1463.4940     27.9694      5.3200
+     23.8740   1463.4580     28.0846      5.2750
+     24.0390   1463.3380     28.1013      5.2400
+     24.2000   1463.3680     28.2562      5.1990
+     24.3560   1463.3950     28.4218      5.1540
+     24.5360   1463.4130     28.5576      5.1160
+     24.7190   1463.3580     28.6064      5.0870
+     24.9010   1463.3510     28.6827      5.0610
+     25.0760   1463.2300     28.6728      5.0340
+     25.2280   1463.2260     28.7262      5.0160
+     25.4190   1463.1750     28.7651      4.9910
+     25.5890   1463.1400     28.8368      4.9600
+     25.7500   1463.1200     28.9719      4.9130
+     25.9330   1463.1000     29.0771      4.8750
+     26.1410   1463.1400     29.2168      4.8410
+     26.2930   1463.1720     29.3114      4.8190
+     26.4740   1463.2400     29.4342      4.7970
+     26.6420   1463.3470     29.5845      4.7760
+     26.8350   1463.5100     29.7585      4.7610
+     27.0280   1463.5960     29.8500      4.7530
+     27.2230   1463.7850     30.0049      4.7500
+     27.4000   1463.9060     30.0812      4.7550
+     27.6110   1464.0370     30.1651      4.7600
+     27.7710   1464.1530     30.2315      4.7670
+     27.9880   1464.2900     30.3200      4.7720
+     28.1680   1464.3750     30.3551      4.7810
+     28.3590   1464.6250     30.5222      4.7890
+     28.5560   1464.7350     30.5771      4.7980
+     28.7780   1464.7980     30.5618      4.8170
+     28.9750   1465.0740     30.7274      4.8320
+     29.1740   1465.4000     30.9189      4.8510
+     29.3920   1465.7340     31.1066      4.8730
+     29.5940   1465.8580     31.1241      4.8970
+     29.7850   1466.1260     31.2447      4.9240
+     29.9750   1466.1950     31.1996      4.9540
+     30.1980   1466.3510     31.2386      4.9790
+     30.4020   1466.3130     31.1348      5.0010
+     30.6060   1466.3880     31.1462      5.0150
+     30.8090   1466.4510     31.1417      5.0310
+     31.0110   1466.5210     31.1615      5.0410
+     31.2250   1466.5910     31.1844      5.0500
+     31.4250   1466.7520     31.2798      5.0590
+     31.6460   1466.8440     31.3042      5.0730
+     31.8380   1467.0600     31.4362      5.0840
+     32.0580   1467.1080     31.4224      5.0990
+     32.2490   1467.2510     31.4903      5.1120
+     32.4680   1467.3990     31.5620      5.1250
+     32.6720   1467.7450     31.7673      5.1450
+     32.8760   1467.8900     31.8016      5.1690
+     33.0820   1468.2750     32.0282      5.1920
+     33.2670   1468.4570     32.0915      5.2160
+     33.4790   1468.7190     32.1960      5.2470
+     33.6930   1468.8350     32.1976      5.2740
+     33.8730   1469.2180     32.4165      5.2990
+     34.0970   1469.4000     32.4707      5.3260
+     34.2800   1469.5380     32.4623      5.3620
+     34.5040   1469.7300     32.4799      5.4030
+     34.6970   1469.9020     32.5325      5.4280
+     34.9300   1469.9800     32.5371      5.4450
+     35.1170   1470.1740     32.5951      5.4740
+     35.3140   1470.4100     32.7209      5.4920
+     35.5260   1470.6060     32.7835      5.5200
+     35.7210   1470.7220     32.8316      5.5330
+     35.9360   1470.8830     32.9430      5.5370
+     36.1190   1471.0400     33.0040      5.5560
+     36.3460   1471.3080     33.1200      5.5850
+     36.5400   1471.3200     33.0696      5.6030
+     36.7460   1471.6910     33.2390      5.6410
+     36.9620   1471.8640     33.2870      5.6680
+     37.1650   1471.9200     33.2367      5.6970
+     37.3710   1471.9790     33.2115      5.7190
+     37.5670   1471.9570     33.1406      5.7350
+     37.7740   1472.2680     33.3138      5.7570
+     38.0020   1472.4320     33.3801      5.7760
+     38.1670   1472.5700     33.4305      5.7940
+     38.3770   1472.6690     33.3885      5.8310
+     38.5780   1472.7670     33.3786      5.8580
+     38.7820   1472.8500     33.3778      5.8780
+     38.9920   1473.0710     33.4679      5.9040
+     39.2140   1473.2180     33.4991      5.9300
+     39.3910   1473.6390     33.6975      5.9720
+     39.6060   1473.8350     33.7303      6.0100
+     39.8090   1474.0230     33.7601      6.0470
+     40.0150   1474.1040     33.7112      6.0820
+     40.2220   1474.2530     33.7204      6.1160
+     40.4230   1474.4900     33.7952      6.1510
+     40.6210   1474.4800     33.7029      6.1770
+     40.8360   1474.5700     33.6586      6.2130
+     41.0400   1474.8290     33.7891      6.2360
+     41.2510   1474.9210     33.7967      6.2560
+     41.4360   1475.1850     33.9005      6.2890
+     41.6340   1475.2310     33.8432      6.3180
+     41.8550   1475.2640     33.8135      6.3350
+     42.0540   1475.4210     33.9325      6.3360
+     42.2480   1475.2450     33.7685      6.3430
+     42.4440   1475.1730     33.6205      6.3710
+     42.6010   1474.9360     33.3771      6.3880
+     42.7840   1475.4430     33.8242      6.3730
+     42.9510   1475.6840     34.0103      6.3740
+     43.0630   1472.6870     31.6307      6.3730
+     43.1330   1473.3540     32.1693      6.3700
+     43.1760   1473.8230     32.5890      6.3550
+     43.1980   1473.1090     32.1625      6.3100
+     43.2020   1472.5590     32.1396      6.1790
+     43.2030   1473.6710     33.2321      6.1120
+     43.2050   1474.5280     34.0057      6.0820
+     43.2110   1474.9090     34.3323      6.0740
+     43.2190   1474.9140     34.3521      6.0690
+     43.2670   1475.7620     33.8966      6.4290
+     43.3400   1475.7140     33.7700      6.4570
+     43.4210   1475.0960     33.2458      6.4670
+     43.5320   1474.9230     33.1009      6.4690
+     43.6670   1474.4010     32.7652      6.4430
+     43.7840   1474.4490     32.9277      6.4030
+     43.9190   1474.5350     33.1100      6.3660
+     44.0520   1474.5950     33.2031      6.3510
+     44.2110   1474.6640     33.2466      6.3540
+     44.3480   1474.8040     33.3344      6.3610
+     44.4950   1474.9730     33.4503      6.3660
+     44.6240   1475.9880     34.1957      6.3850
+     44.7690   1476.3480     34.3201      6.4360
+     44.9320   1476.6450     34.3170      6.5120
+     45.0580   1476.9900     34.3872      6.5770
+     45.2140   1476.9770     34.2415      6.6200
+     45.3960   1476.9330     34.0729      6.6620
+     45.5430   1477.0860     34.1057      6.6900
+     45.7000   1477.2730     34.1812      6.7130
+     45.8660   1477.2540     34.0797      6.7400
+     46.0220   1477.4680     34.1766      6.7630
+     46.1580   1477.5150     34.1599      6.7800
+     46.3180   1477.6960     34.2461      6.7980
+     46.4440   1477.6880     34.1759      6.8180
+     46.6020   1477.7510     34.1591      6.8390
+     46.7790   1477.7740     34.1187      6.8570
+     46.9160   1477.8630     34.1232      6.8780
+     47.0700   1477.9050     34.1019      6.8950
+     47.2300   1477.9570     34.1042      6.9070
+     47.3460   1478.0770     34.1766      6.9140
+     47.5140   1478.1350     34.1896      6.9240
+     47.6690   1478.2060     34.1850      6.9430
+     47.8090   1478.2130     34.1393      6.9590
+     47.9670   1478.5400     34.3399      6.9780
+     48.1040   1478.5570     34.2987      6.9950
+     48.2620   1478.6070     34.2720      7.0160
+     48.4080   1478.6960     34.2941      7.0310
+     48.5700   1478.7690     34.2949      7.0490
+     48.7060   1478.8090     34.2819      7.0630
+     48.8440   1478.8230     34.2545      7.0750
+     48.9830   1478.8830     34.2697      7.0850
+     49.1430   1478.9010     34.2506      7.0950
+     49.2750   1478.9230     34.2293      7.1070
+     49.3830   1478.9900     34.2628      7.1130
+     49.4720   1478.9250     34.2133      7.1120
+     49.5840   1479.0340     34.2926      7.1140
+     49.6820   1479.1200     34.3353      7.1220
+     49.8050   1479.1020     34.3071      7.1260
+     49.9200   1479.1630     34.3170      7.1380
+     50.0030   1479.2600     34.3658      7.1470
+     50.1260   1479.2910     34.3674      7.1540
+     50.2240   1479.3360     34.3712      7.1640
+     50.3350   1479.3490     34.3582      7.1710
+     50.4480   1479.3850     34.3704      7.1760
+     50.5580   1479.4340     34.3773      7.1860
+     50.6530   1479.4700     34.3864      7.1920
+     50.7450   1479.4820     34.3765      7.1980
+     50.8700   1479.5180     34.3849      7.2040
+     50.9860   1479.5340     34.3742      7.2110
+     51.0660   1479.5320     34.3597      7.2150
+     51.1760   1479.5750     34.3895      7.2160
+     51.3050   1479.6190     34.4009      7.2230
+     51.4030   1479.6320     34.3948      7.2280
+     51.5040   1479.6520     34.4032      7.2300
+     51.5990   1479.6710     34.3987      7.2360
+     51.7210   1479.6790     34.4040      7.2360
+     51.8280   1479.6960     34.4162      7.2360
+     51.8880   1479.6970     34.4040      7.2400
+     51.9290   1479.6670     34.3697      7.2430
+     51.9530   1479.4460     34.1927      7.2430
+     51.9690   1479.5340     34.2628      7.2430
+     52.0230   1479.1830     34.1202      7.1980
+     52.0620   1479.3120     34.2445      7.1910
+     52.0690   1479.3510     34.2880      7.1870
+     52.0800   1479.2710     34.2331      7.1840
+     52.0820   1479.7090     34.4322      7.2330
+     52.0830   1479.7790     34.3925      7.2640
+     52.0890   1479.7870     34.4116      7.2600
@@ -0,0 +1,511 @@
+test_read_store_and_write
+5/5/2012
+14:21:58
+Probe: MIDAS SVP 6000
+Source: /root/package/data/input/valeport/midas/svp/FILE16.000
+      9.8170   1464.3610     18.2571      8.6090
+      9.8740   1464.3830     17.4080      8.8810
+      9.9370   1464.4070     16.7839      9.0830
+     10.0430   1464.4520     16.3879      9.2190
+     10.2020   1464.3940     15.9950      9.3270
+     10.3530   1464.3920     15.7722      9.3960
+     10.4770   1464.3680     15.5991      9.4440
+     10.6220   1464.3550     15.5006      9.4710
+     10.7350   1464.3420     15.4373      9.4870
+     10.8770   1464.3350     15.3984      9.4970
+     10.9970   1464.3250     15.3664      9.5040
+     11.1180   1464.3120     15.3503      9.5050
+     11.2590   1464.3010     15.3305      9.5080
+     11.3800   1464.2920     15.3084      9.5120
+     11.5110   1464.2780     15.2954      9.5120
+     11.6520   1464.2870     15.3069      9.5100
+     11.7600   1464.3590     15.3809      9.5050
+     11.9160   1464.3360     15.3534      9.5070
+     12.0430   1464.3250     15.3366      9.5090
+     12.1570   1464.3310     15.3336      9.5110
+     12.2860   1464.3490     15.3656      9.5050
+     12.4330   1464.3520     15.3656      9.5050
+     12.5640   1464.3600     15.3870      9.5000
+     12.6980   1464.3790     15.4037      9.4990
+     12.8290   1464.3750     15.3824      9.5040
+     12.9780   1464.4340     15.4259      9.5050
+     13.1080   1464.4350     15.4282      9.5040
+     13.2730   1464.4430     15.4198      9.5080
+     13.4470   1464.4420     15.4137      9.5090
+     13.6390   1464.4380     15.4015      9.5110
+     13.8140   1464.4320     15.3938      9.5110
+     14.0190   1464.4250     15.3824      9.5120
+     14.2670   1464.4430     15.4037      9.5090
+     14.4920   1464.4450     15.3992      9.5100
+     14.6820   1464.4290     15.3801      9.5110
+     14.9100   1464.4110     15.3778      9.5060
+     15.1390   1464.4070     15.3809      9.5030
+     15.3600   1464.4130     15.4053      9.4960
+     15.5700   1465.1320     16.0637      9.4740
+     15.7960   1465.5120     17.0387      9.2640
+     16.0340   1465.4940     18.2861      8.8650
+     16.2560   1465.6930     19.2467      8.6130
+     16.5080   1465.7980     20.2797      8.3140
+     16.7910   1465.7390     21.0564      8.0540
+     17.0530   1465.6050     21.6270      7.8400
+     17.3520   1465.5640     22.0886      7.6840
+     17.6160   1465.4020     22.2580      7.5890
+     17.8230   1465.2640     22.2427      7.5580
+     18.0050   1465.3910     22.2694      7.5810
+     18.1020   1465.3300     22.2153      7.5820
+     18.1490   1465.0740     22.0177      7.5790
+     18.1720   1465.2980     21.4241      7.8210
+     18.1740   1465.3560     21.2761      7.8820
+     18.1800   1465.4200     21.3219      7.8840
+     18.1830   1465.2190     23.1560      7.2600
+     18.1880   1465.2090     23.1644      7.2550
+     18.1900   1465.1040     20.6947      8.0000
+     18.1920   1465.0720     25.2319      6.5770
+     18.1930   1465.0740     25.2625      6.5680
+     18.2180   1465.0720     25.2602      6.5680
+     18.2600   1465.0750     25.2625      6.5680
+     18.2730   1465.0700     25.2609      6.5670
+     18.2960   1465.0690     25.2602      6.5670
+     18.3490   1465.0670     25.2579      6.5670
+     18.3680   1465.0610     25.2525      6.5670
+     18.4080   1465.0600     25.2579      6.5650
+     18.4500   1465.0560     25.2640      6.5620
+     18.5030   1465.0540     25.2708      6.5590
+     18.5460   1465.0500     25.2800      6.5550
+     18.6330   1465.0450     25.2914      6.5500
+     18.6760   1465.0480     25.3029      6.5470
+     18.7290   1465.0550     25.3204      6.5430
+     18.8210   1465.0660     25.3220      6.5450
+     18.9040   1465.0640     25.3090      6.5480
+     18.9670   1465.0360     25.2731      6.5520
+     19.0360   1465.0160     25.2373      6.5580
+     19.1080   1465.0030     25.2190      6.5600
+     19.1570   1465.0000     25.2098      6.5620
+     19.2330   1464.9720     25.1862      6.5620
+     19.3110   1464.9230     25.1526      6.5600
+     19.3750   1464.8930     25.1633      6.5490
+     19.4770   1464.9020     25.1976      6.5400
+     19.5650   1464.8540     25.2487      6.5120
+     19.6400   1464.7850     25.2823      6.4840
+     19.7110   1464.7600     25.3456      6.4580
+     19.7940   1464.7980     25.4517      6.4340
+     19.8970   1464.7810     25.4883      6.4180
+     19.9690   1464.7350     25.5188      6.3970
+     20.0130   1464.7410     25.5966      6.3740
+     20.1250   1464.7050     25.5859      6.3680
+     20.2080   1464.6430     25.6195      6.3420
+     20.2980   1464.6470     25.7179      6.3120
+     20.3870   1464.6660     25.8064      6.2890
+     20.4420   1464.6420     25.8316      6.2750
+     20.5330   1464.6370     25.8881      6.2560
+     20.6220   1464.6440     25.9308      6.2440
+     20.7170   1464.5840     25.8949      6.2400
+     20.7850   1464.5790     25.9644      6.2170
+     20.8790   1464.5520     26.0155      6.1940
+     20.9690   1464.5480     26.0468      6.1830
+     21.0540   1464.5160     26.0361      6.1780
+     21.1110   1464.5430     26.0666      6.1750
+     21.2080   1464.5540     26.1131      6.1630
+     21.2930   1464.5480     26.1391      6.1530
+     21.3650   1464.5240     26.1414      6.1460
+     21.4610   1464.5180     26.1909      6.1290
+     21.5190   1464.5000     26.2047      6.1200
+     21.6290   1464.5030     26.2444      6.1080
+     21.6940   1464.4300     26.2466      6.0890
+     21.7710   1464.4010     26.2611      6.0770
+     21.8670   1464.3930     26.3283      6.0540
+     21.9470   1464.3590     26.3840      6.0280
+     22.0080   1464.3690     26.4656      6.0050
+     22.1010   1464.3550     26.4915      5.9930
+     22.2110   1464.2650     26.4900      5.9710
+     22.3070   1464.2360     26.5205      5.9540
+     22.3780   1464.1900     26.5411      5.9360
+     22.4390   1464.1380     26.6708      5.8830
+     22.5340   1464.1230     26.7609      5.8510
+     22.6300   1464.1030     26.7632      5.8450
+     22.6830   1464.1380     26.8326      5.8320
+     22.7830   1464.1610     26.8913      5.8190
+     22.8590   1464.1250     26.9135      5.8030
+     22.9400   1464.0690     26.9333      5.7830
+     23.0320   1464.0530     26.9577      5.7710
+     23.1230   1464.0170     26.9699      5.7580
+     23.1810   1464.0220     27.0348      5.7390
+     23.2720   1464.0610     27.1133      5.7240
+     23.3490   1464.0730     27.1927      5.7020
+     23.4330   1464.0630     27.2392      5.6850
+     23.5180   1463.9490     27.1797      5.6750
+     23.5980   1463.8880     27.2308      5.6440
+     23.6870   1463.8410     27.2766      5.6180
+     23.7800   1463.7910     27.3140      5.5940
+     23.8620   1463.7440     27.3338      5.5760
+     23.9440   1463.7100     27.4033      5.5460
+     24.0300   1463.6300     27.4170      5.5220
+     24.1190   1463.6410     27.4925      5.5010
+     24.2100   1463.6440     27.5909      5.4710
+     24.2860   1463.6400     27.6611      5.4480
+     24.3590   1463.5570     27.6176      5.4410
+     24.4460   1463.5610     27.6329      5.4370
+     24.5550   1463.5450     27.6215      5.4360
+     24.6200   1463.5560     27.6878      5.4180
+     24.6990   1463.5360     27.7878      5.3820
+     24.7670   1463.5710     27.9709      5.3340
+     24.8580   1463.5610     28.1433      5.2780
+     24.9460   1463.5630     28.3195      5.2240
+     25.0250   1463.5340     28.4126      5.1880
+     25.1080   1463.4610     28.4615      5.1550
+     25.1900   1463.4930     28.5698      5.1290
+     25.2760   1463.4950     28.6415      5.1070
+     25.3620   1463.4450     28.6369      5.0960
+     25.4560   1463.4440     28.6514      5.0910
+     25.5410   1463.4400     28.6728      5.0830
+     25.5970   1463.3990     28.7079      5.0620
+     25.6990   1463.3720     28.7186      5.0520
+     25.7760   1463.3070     28.6987      5.0420
+     25.8800   1463.3130     28.7056      5.0410
+     25.9410   1463.3570     28.7682      5.0320
+     26.0310   1463.2940     28.7010      5.0370
+     26.1070   1463.3640     28.7392      5.0420
+     26.1790   1463.3480     28.7514      5.0340
+     26.2650   1463.3640     28.7827      5.0280
+     26.3410   1463.3880     28.8528      5.0120
+     26.4290   1463.2660     28.7880      5.0020
+     26.5130   1463.2610     28.9131      4.9620
+     26.5790   1463.3260     29.0771      4.9270
+     26.6960   1463.3320     29.1130      4.9170
+     26.7720   1463.3740     29.0993      4.9310
+     26.8490   1463.4510     29.1367      4.9380
+     26.9430   1463.4360     29.1557      4.9280
+     27.0360   1463.3730     29.0985      4.9300
+     27.1090   1463.4230     29.1237      4.9340
+     27.1950   1463.4740     29.1824      4.9280
+     27.2610   1463.4970     29.1832      4.9330
+     27.3500   1463.5050     29.1916      4.9320
+     27.4140   1463.5290     29.2030      4.9340
+     27.5150   1463.5530     29.2244      4.9330
+     27.5800   1463.5690     29.2946      4.9150
+     27.6580   1463.5850     29.3808      4.8920
+     27.7720   1463.6350     29.4281      4.8890
+     27.8330   1463.6560     29.4769      4.8790
+     27.9010   1463.6700     29.5616      4.8560
+     27.9840   1463.7250     29.6623      4.8380
+     28.0830   1463.7600     29.7211      4.8280
+     28.1630   1463.7690     29.7760      4.8130
+     28.2610   1463.8600     29.8584      4.8090
+     28.3180   1463.9070     29.9110      4.8040
+     28.4240   1463.9410     29.9591      4.7970
+     28.5140   1464.0690     30.0713      4.7930
+     28.5760   1464.0950     30.1010      4.7900
+     28.6610   1464.0160     30.0316      4.7920
+     28.7340   1464.0310     30.0354      4.7940
+     28.8300   1464.1020     30.0804      4.7970
+     28.9030   1464.2020     30.1613      4.7960
+     28.9600   1464.3690     30.2849      4.7980
+     29.0490   1464.4250     30.3177      4.8010
+     29.1380   1464.4490     30.3192      4.8060
+     29.2330   1464.4490     30.3085      4.8090
+     29.3180   1464.4130     30.2689      4.8120
+     29.4020   1464.5280     30.3551      4.8130
+     29.4730   1464.7080     30.4855      4.8160
+     29.5560   1464.8450     30.5885      4.8170
+     29.6420   1464.9620     30.6664      4.8210
+     29.7300   1465.0930     30.7419      4.8290
+     29.8190   1465.1810     30.7808      4.8380
+     29.8960   1465.3290     30.8411      4.8550
+     29.9560   1465.2330     30.7457      4.8610
+     30.0550   1465.3130     30.7877      4.8670
+     30.1430   1465.5980     30.9647      4.8810
+     30.2230   1465.6140     30.9052      4.9030
+     30.2950   1465.5630     30.8090      4.9200
+     30.3760   1465.6150     30.8037      4.9340
+     30.4540   1465.7770     30.8975      4.9440
+     30.5440   1465.8750     30.9410      4.9540
+     30.6190   1465.9730     31.0074      4.9570
+     30.7220   1465.8810     30.8983      4.9680
+     30.8180   1465.9380     30.9319      4.9710
+     30.8530   1465.9950     30.9662      4.9740
+     30.9530   1466.1310     31.0524      4.9800
+     31.0270   1466.1700     31.0471      4.9910
+     31.1290   1466.2960     31.1157      5.0000
+     31.1770   1466.3320     31.1272      5.0050
+     31.2800   1466.3300     31.0852      5.0170
+     31.3620   1466.3670     31.0974      5.0220
+     31.4590   1466.4100     31.0944      5.0330
+     31.5310   1466.4900     31.1302      5.0410
+     31.6270   1466.3980     31.0379      5.0470
+     31.7210   1466.3720     31.0028      5.0510
+     31.7900   1466.4180     31.0257      5.0550
+     31.8810   1466.4720     31.0631      5.0560
+     31.9570   1466.5710     31.1241      5.0610
+     32.0380   1466.5350     31.0822      5.0650
+     32.1070   1466.6220     31.1302      5.0710
+     32.2090   1466.7360     31.2019      5.0760
+     32.2930   1466.8040     31.2126      5.0890
+     32.3820   1466.6570     31.0768      5.0950
+     32.4670   1466.7440     31.1081      5.1060
+     32.5290   1466.8100     31.1470      5.1100
+     32.5950   1466.9690     31.2675      5.1110
+     32.6910   1467.1370     31.3789      5.1170
+     32.7910   1467.2450     31.4369      5.1250
+     32.8920   1467.1940     31.3759      5.1310
+     32.9480   1467.2710     31.4102      5.1390
+     33.0290   1467.4030     31.4903      5.1460
+     33.1150   1467.2190     31.3126      5.1560
+     33.1960   1467.3770     31.4102      5.1640
+     33.2830   1467.1700     31.2042      5.1770
+     33.3770   1467.5190     31.4552      5.1840
+     33.4440   1467.6970     31.5941      5.1840
+     33.5190   1467.9010     31.7245      5.1930
+     33.6060   1468.0550     31.8192      5.2010
+     33.6530   1468.1650     31.8924      5.2050
+     33.7610   1468.3860     32.0198      5.2190
+     33.8560   1468.3860     31.9771      5.2320
+     33.9030   1468.3650     31.9145      5.2460
+     34.0130   1468.5340     31.9695      5.2700
+     34.0820   1468.5040     31.8810      5.2900
+     34.1650   1468.6100     31.9214      5.3030
+     34.2670   1468.7440     31.9939      5.3130
+     34.3190   1468.9690     32.1220      5.3280
+     34.4200   1469.0860     32.1877      5.3360
+     34.5170   1469.3410     32.3196      5.3570
+     34.5840   1469.2940     32.2273      5.3740
+     34.6610   1469.3350     32.2235      5.3850
+     34.7590   1469.5180     32.3540      5.3890
+     34.8260   1469.5170     32.3105      5.4020
+     34.9260   1469.5810     32.3311      5.4110
+     35.0160   1469.6390     32.3662      5.4140
+     35.0950   1469.6660     32.3318      5.4310
+     35.1860   1469.6610     32.3044      5.4380
+     35.2670   1469.8950     32.4532      5.4490
+     35.3380   1469.9770     32.4524      5.4690
+     35.4110   1470.0880     32.4852      5.4860
+     35.5070   1470.0220     32.4066      5.4940
+     35.5770   1470.0820     32.4371      5.4990
+     35.6560   1470.1330     32.4348      5.5120
+     35.7380   1470.3090     32.5401      5.5220
+     35.8190   1470.4050     32.6149      5.5220
+     35.9000   1470.6360     32.7576      5.5340
+     35.9950   1470.6970     32.7446      5.5530
+     36.0690   1470.7270     32.7286      5.5650
+     36.1680   1470.8370     32.7827      5.5750
+     36.2390   1470.8400     32.7461      5.5870
+     36.3290   1470.9860     32.8278      5.5970
+     36.4160   1471.0300     32.7820      5.6220
+     36.4750   1471.1650     32.8369      5.6380
+     36.5770   1471.2470     32.8751      5.6460
+     36.6530   1471.3320     32.9285      5.6500
+     36.7360   1471.3900     32.9445      5.6590
+     36.8070   1471.4150     32.9346      5.6680
+     36.8990   1471.5700     33.0528      5.6690
+     36.9690   1471.5740     33.0139      5.6820
+     37.0770   1471.6370     33.0177      5.6960
+     37.1390   1471.6850     33.0139      5.7090
+     37.2320   1471.7660     33.0223      5.7260
+     37.3170   1471.7790     32.9872      5.7400
+     37.4220   1471.8620     32.9910      5.7590
+     37.4880   1471.9450     33.0246      5.7690
+     37.5720   1472.0190     33.0719      5.7720
+     37.6380   1472.0450     33.0383      5.7890
+     37.7330   1472.0110     32.9720      5.8010
+     37.8220   1472.0770     33.0261      5.8000
+     37.8880   1472.1000     32.9865      5.8180
+     37.9720   1472.2090     33.0208      5.8340
+     38.0360   1472.2530     33.0231      5.8440
+     38.1240   1472.3000     32.9964      5.8640
+     38.2160   1472.3490     33.0048      5.8730
+     38.2890   1472.4290     33.0643      5.8740
+     38.3720   1472.5240     33.1482      5.8710
+     38.4680   1472.6150     33.1841      5.8820
+     38.5380   1472.6920     33.1841      5.9010
+     38.6180   1472.7300     33.1810      5.9110
+     38.7300   1472.7440     33.1879      5.9120
+     38.7990   1472.8510     33.2901      5.9060
+     38.8830   1472.8980     33.3168      5.9090
+     38.9480   1472.9500     33.3290      5.9180
+     39.0590   1473.0570     33.4023      5.9210
+     39.1370   1473.0860     33.4053      5.9270
+     39.2210   1473.1070     33.3801      5.9400
+     39.2730   1473.3480     33.5289      5.9530
+     39.3840   1473.4640     33.6098      5.9560
+     39.4690   1473.3170     33.4450      5.9710
+     39.5420   1473.6200     33.6182      5.9920
+     39.6170   1473.7730     33.6815      6.0100
+     39.7030   1473.8710     33.7166      6.0230
+     39.7900   1473.7620     33.6136      6.0280
+     39.8560   1473.9550     33.7502      6.0330
+     39.9290   1474.0520     33.8165      6.0360
+     40.0310   1474.1390     33.8394      6.0500
+     40.1270   1474.1480     33.8013      6.0640
+     40.2000   1474.1510     33.7433      6.0830
+     40.2820   1474.2620     33.7418      6.1110
+     40.3710   1474.2780     33.6624      6.1400
+     40.4470   1474.3180     33.6334      6.1590
+     40.5360   1474.4040     33.6533      6.1740
+     40.6190   1474.3490     33.5770      6.1840
+     40.6980   1474.4820     33.6349      6.1990
+     40.7830   1474.6040     33.6678      6.2190
+     40.8660   1474.6730     33.6899      6.2290
+     40.9410   1474.7950     33.7730      6.2330
+     41.0180   1474.7850     33.7608      6.2340
+     41.0900   1474.8920     33.8478      6.2330
+     41.1810   1474.8130     33.7593      6.2410
+     41.2530   1474.9290     33.7906      6.2600
+     41.3500   1474.9680     33.7265      6.2900
+     41.4100   1474.9940     33.6647      6.3160
+     41.4810   1475.0500     33.6548      6.3330
+     41.5930   1475.1330     33.6594      6.3520
+     41.6690   1475.1130     33.6052      6.3640
+     41.7410   1475.1150     33.5686      6.3760
+     41.8150   1475.1920     33.5999      6.3850
+     41.8980   1475.0810     33.4793      6.3950
+     41.9780   1475.2330     33.5777      6.4020
+     42.0670   1475.3290     33.6334      6.4080
+     42.1620   1475.3290     33.6166      6.4130
+     42.2340   1475.2330     33.5175      6.4200
+     42.2980   1475.2410     33.5480      6.4120
+     42.3890   1475.4780     33.7257      6.4150
+     42.4690   1475.5370     33.7532      6.4210
+     42.5460   1475.6000     33.8051      6.4200
+     42.6230   1475.6280     33.8264      6.4200
+     42.7100   1475.7220     33.8470      6.4370
+     42.7760   1475.8390     33.9012      6.4490
+     42.8610   1475.8580     33.8875      6.4580
+     42.9220   1475.7800     33.7654      6.4770
+     43.0150   1475.7770     33.7181      6.4910
+     43.0720   1475.8880     33.7585      6.5060
+     43.1430   1475.8990     33.7288      6.5180
+     43.2340   1475.5690     33.4274      6.5300
+     43.2860   1475.1890     33.0933      6.5400
+     43.3510   1474.8960     32.8407      6.5460
+     43.4030   1474.5120     32.5623      6.5370
+     43.4600   1474.3680     32.4623      6.5320
+     43.5090   1474.1570     32.3570      6.5120
+     43.5310   1473.7060     32.0885      6.4830
+     43.5590   1474.1190     32.5142      6.4520
+     43.6050   1474.4570     32.8644      6.4260
+     43.6570   1474.3690     32.8156      6.4190
+     43.6790   1474.4500     32.9018      6.4120
+     43.6940   1474.4430     32.9117      6.4070
+     43.7520   1475.1290     33.5373      6.3810
+     43.7770   1475.3050     33.7585      6.3550
+     43.8120   1475.5700     34.0088      6.3420
+     43.8610   1476.0980     34.3651      6.3620
+     43.8790   1476.1560     34.3544      6.3800
+     43.9270   1475.9400     34.1164      6.4010
+     43.9710   1475.8990     34.0431      6.4140
+     44.0160   1475.9870     34.0057      6.4480
+     44.0360   1475.7260     33.6891      6.4830
+     44.0980   1475.7010     33.6090      6.5020
+     44.1090   1475.7020     33.5815      6.5110
+     44.1490   1475.7230     33.5976      6.5110
+     44.1920   1475.2480     33.2474      6.5020
+     44.2270   1475.0010     33.0688      6.4960
+     44.2440   1474.8560     32.9536      6.4960
+     44.2920   1475.0960     33.1566      6.4920
+     44.3290   1475.2240     33.2855      6.4830
+     44.3580   1475.3100     33.3542      6.4830
+     44.3800   1475.2070     33.2779      6.4810
+     44.4030   1475.2960     33.3580      6.4780
+     44.4480   1475.5150     33.5220      6.4810
+     44.4870   1475.7970     33.7082      6.4930
+     44.5190   1476.0360     33.8600      6.5050
+     44.5550   1476.2240     34.0027      6.5070
+     44.5870   1476.2820     34.0271      6.5140
+     44.6310   1476.3500     34.0614      6.5200
+     44.6780   1476.2190     33.9630      6.5180
+     44.7130   1476.3210     34.0996      6.5000
+     44.7430   1475.9890     33.9043      6.4780
+     44.7740   1475.4640     33.5426      6.4600
+     44.8080   1475.0640     33.2680      6.4460
+     44.8520   1475.2550     33.4351      6.4410
+     44.8650   1475.3020     33.4755      6.4400
+     44.9020   1475.3890     33.5533      6.4370
+     44.9190   1475.4200     33.5777      6.4370
+     44.9800   1475.5920     33.7013      6.4410
+     44.9960   1475.7190     33.7898      6.4450
+     45.0330   1475.9450     33.8966      6.4680
+     45.0740   1476.1820     34.0096      6.4920
+     45.0980   1476.4220     34.1499      6.5080
+     45.1410   1476.5510     34.2178      6.5190
+     45.1760   1476.5560     34.1934      6.5280
+     45.2150   1476.5720     34.1682      6.5400
+     45.2680   1476.5160     34.1103      6.5440
+     45.3180   1476.3770     33.9867      6.5480
+     45.3560   1476.4250     34.0088      6.5530
+     45.3860   1476.4470     33.9760      6.5690
+     45.4050   1476.4150     33.9005      6.5850
+     45.4430   1476.4550     33.8821      6.6010
+     45.4760   1476.3900     33.7799      6.6170
+     45.5240   1476.2800     33.6639      6.6260
+     45.5460   1476.2910     33.6655      6.6280
+     45.5680   1476.3520     33.6861      6.6370
+     45.6050   1476.3020     33.6143      6.6470
+     45.6120   1476.2130     33.5251      6.6530
+     45.6380   1476.4360     33.6899      6.6570
+     45.6920   1476.4840     33.7151      6.6610
+     45.7380   1476.8030     33.9684      6.6610
+     45.8030   1477.0800     34.1660      6.6680
+     45.8960   1477.3090     34.2628      6.6950
+     45.9610   1477.3700     34.1896      6.7340
+     46.0230   1477.2740     34.0126      6.7660
+     46.1240   1477.3320     33.9989      6.7850
+     46.1900   1477.3150     33.9470      6.7970
+     46.2610   1477.2880     33.9149      6.8000
+     46.3290   1477.4050     33.9890      6.8060
+     46.4020   1477.4900     34.0530      6.8070
+     46.4820   1477.5010     34.0637      6.8060
+     46.5170   1477.6010     34.1400      6.8070
+     46.6150   1477.6180     34.1553      6.8060
+     46.7060   1477.7330     34.3018      6.7880
+     46.8090   1477.8430     34.4002      6.7840
+     46.8890   1477.7880     34.2934      6.8040
+     47.0090   1477.8190     34.2232      6.8340
+     47.0580   1477.8940     34.2140      6.8560
+     47.1620   1477.8930     34.1652      6.8710
+     47.2670   1477.8890     34.1393      6.8780
+     47.3630   1478.0100     34.2216      6.8820
+     47.4740   1477.9580     34.1789      6.8820
+     47.5730   1478.0140     34.1850      6.8940
+     47.6700   1478.0220     34.1782      6.8980
+     47.7740   1478.0620     34.1713      6.9100
+     47.8520   1478.1020     34.1743      6.9190
+     47.9640   1478.2210     34.2400      6.9280
+     48.0620   1478.2030     34.1934      6.9380
+     48.1430   1478.2200     34.2278      6.9310
+     48.1790   1477.9600     34.0256      6.9290
+     48.2240   1477.2990     33.4785      6.9350
+     48.2550   1477.6350     33.7433      6.9360
+     48.2770   1477.5470     33.6700      6.9370
+     48.3060   1477.5130     33.6327      6.9400
+     48.3140   1477.6740     33.7555      6.9420
+     48.3460   1477.7300     33.8028      6.9410
+     48.3640   1477.6900     33.7608      6.9440
+     48.3890   1477.6950     33.8234      6.9250
+     48.4050   1477.7310     33.8959      6.9110
+     48.4370   1477.7840     33.9439      6.9090
+     48.4690   1477.7930     33.9165      6.9200
+     48.4950   1477.9960     34.0004      6.9450
+     48.5040   1478.0240     33.9828      6.9580
+     48.5410   1477.9430     33.8989      6.9640
+     48.5450   1477.8590     33.8226      6.9670
+     48.5770   1477.8150     33.7807      6.9690
+     48.5890   1477.7680     33.7334      6.9720
+     48.6050   1477.7660     33.7502      6.9660
+     48.6440   1477.6900     33.6922      6.9650
+     48.6610   1477.5960     33.6235      6.9630
+     48.6790   1477.6490     33.6716      6.9610
+     48.6850   1477.6760     33.7082      6.9560
+     48.7040   1477.6360     33.6731      6.9570
+     48.7300   1477.6800     33.7234      6.9520
+     48.7380   1477.6980     33.7502      6.9480
+     48.7710   1477.6310     33.6990      6.9470
+     48.7830   1477.6170     33.7189      6.9370
+     48.7880   1477.5510     33.7250      6.9180
+     48.8030   1477.4860     33.7753      6.8850
+     48.8060   1477.4780     33.8005      6.8750
+     48.8140   1477.4330     33.7677      6.8740
+     48.8340   1478.1610     34.2392      6.9090
+     48.8400   1478.0260     33.7532      7.0310
+     48.8490   1477.8420     33.5320      7.0550
+     48.8550   1477.8010     33.4839      7.0600
+     48.8600   1477.8020     33.4778      7.0620
+     48.8620   1478.2170     34.2773      6.9110
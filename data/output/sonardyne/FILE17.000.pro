@@ -0,0 +1,454 @@
+test_read_store_and_write
+5/5/2012
+14:33:12
+Probe: MIDAS SVP 6000
+Source: /root/package/data/input/valeport/midas/svp/FILE17.000
+      9.7730   1465.3370     17.6224      9.0600
+      9.7950   1465.3610     17.0395      9.2500
+      9.7980   1465.4010     16.1697      9.5350
+      9.8040   1465.3680     15.6654      9.6860
+      9.8190   1465.3780     15.6357      9.6980
+      9.8690   1465.3790     15.5823      9.7150
+      9.9130   1465.3750     15.5434      9.7260
+      9.9200   1465.3640     15.5251      9.7290
+      9.9510   1465.3750     15.5243      9.7320
+     10.0200   1465.3750     15.5266      9.7310
+     10.0980   1465.3870     15.5258      9.7340
+     10.1840   1465.3840     15.5251      9.7330
+     10.2360   1465.3820     15.5167      9.7350
+     10.2400   1465.3800     15.5212      9.7330
+     10.2690   1465.3820     15.5197      9.7340
+     10.2920   1465.3770     15.5182      9.7330
+     10.3800   1465.3560     15.4930      9.7350
+     10.4320   1465.3660     15.5006      9.7350
+     10.4940   1465.3820     15.5167      9.7340
+     10.5730   1465.3870     15.5228      9.7330
+     10.6240   1465.3880     15.5258      9.7320
+     10.6720   1465.3900     15.5266      9.7320
+     10.7500   1465.3910     15.5296      9.7310
+     10.8020   1465.3930     15.5334      9.7300
+     10.8600   1465.3910     15.5312      9.7300
+     10.9240   1465.3970     15.5388      9.7290
+     10.9670   1465.3930     15.5319      9.7300
+     10.9990   1465.3970     15.5251      9.7330
+     11.0460   1465.3990     15.5357      9.7300
+     11.1160   1465.4010     15.5365      9.7300
+     11.2060   1465.4330     15.5487      9.7340
+     11.2980   1465.4210     15.5342      9.7350
+     11.3430   1465.3930     15.5014      9.7380
+     11.4380   1465.4120     15.5128      9.7390
+     11.4850   1465.3990     15.4915      9.7420
+     11.5750   1465.3880     15.4877      9.7400
+     11.6230   1465.3850     15.4785      9.7420
+     11.7130   1465.3900     15.4907      9.7390
+     11.7530   1465.3980     15.4938      9.7400
+     11.8330   1465.4010     15.4953      9.7400
+     11.9150   1465.4230     15.5121      9.7400
+     11.9660   1465.4480     15.5449      9.7360
+     12.0700   1465.4510     15.5396      9.7380
+     12.1640   1465.4530     15.5396      9.7380
+     12.2450   1465.4540     15.5396      9.7380
+     12.3570   1465.4470     15.5350      9.7370
+     12.4230   1465.4360     15.5441      9.7310
+     12.5360   1465.4110     15.5289      9.7290
+     12.6110   1465.3820     15.5197      9.7240
+     12.7040   1465.3570     15.5228      9.7160
+     12.7870   1465.3530     15.5563      9.7040
+     12.8870   1465.3460     15.5869      9.6920
+     12.9770   1465.3420     15.6204      9.6800
+     13.0780   1465.3410     15.6403      9.6730
+     13.1550   1465.3400     15.6609      9.6660
+     13.2210   1465.3400     15.6723      9.6620
+     13.2920   1465.3340     15.6822      9.6570
+     13.3690   1465.3350     15.6914      9.6540
+     13.4190   1465.3380     15.7028      9.6510
+     13.4710   1465.3410     15.7043      9.6510
+     13.5390   1465.3350     15.7021      9.6500
+     13.6210   1465.3360     15.7013      9.6500
+     13.6740   1465.3410     15.7143      9.6470
+     13.7340   1465.3400     15.7066      9.6490
+     13.7980   1465.3330     15.7059      9.6470
+     13.8890   1465.3340     15.7089      9.6460
+     13.9270   1465.3420     15.7181      9.6450
+     13.9910   1465.3390     15.7181      9.6440
+     14.0540   1465.3190     15.7036      9.6430
+     14.1380   1465.2960     15.6929      9.6400
+     14.1830   1465.2920     15.6960      9.6380
+     14.2380   1465.3260     15.7295      9.6360
+     14.3320   1465.3400     15.7394      9.6360
+     14.3920   1465.3610     15.7593      9.6350
+     14.4550   1465.3530     15.7455      9.6370
+     14.5220   1465.3610     15.7547      9.6360
+     14.5860   1465.3540     15.7448      9.6370
+     14.6390   1465.3660     15.7471      9.6390
+     14.7250   1465.3750     15.7410      9.6430
+     14.7930   1465.3800     15.7539      9.6400
+     14.8630   1465.3760     15.7463      9.6410
+     14.9120   1465.4690     15.8287      9.6390
+     14.9610   1465.7450     16.1087      9.6220
+     15.0610   1465.9490     17.0242      9.3850
+     15.1210   1466.0380     18.5211      8.9350
+     15.2150   1466.0650     19.7800      8.5450
+     15.2690   1466.0680     20.8473      8.2100
+     15.3270   1466.0820     21.6827      7.9510
+     15.3720   1466.0560     22.2542      7.7650
+     15.4590   1466.0750     22.7089      7.6270
+     15.5360   1466.0390     22.9759      7.5340
+     15.5980   1466.0090     23.1712      7.4650
+     15.6620   1465.9490     23.3200      7.4030
+     15.7410   1465.8380     23.3864      7.3540
+     15.8150   1465.7790     23.4787      7.3100
+     15.8660   1465.6760     23.5550      7.2600
+     15.9230   1465.6370     23.6763      7.2120
+     16.0070   1465.5890     23.7747      7.1690
+     16.0650   1465.5710     23.8846      7.1300
+     16.1400   1465.5680     23.9868      7.0970
+     16.1980   1465.5550     24.0814      7.0640
+     16.2820   1465.5640     24.1608      7.0410
+     16.3510   1465.5520     24.2241      7.0180
+     16.4150   1465.5610     24.2752      7.0040
+     16.4870   1465.5640     24.3217      6.9900
+     16.5750   1465.5370     24.3378      6.9780
+     16.6700   1465.5610     24.3973      6.9650
+     16.7240   1465.5540     24.4293      6.9530
+     16.7870   1465.5670     24.4774      6.9410
+     16.8560   1465.5460     24.5110      6.9250
+     16.9260   1465.5240     24.5277      6.9140
+     17.0220   1465.5040     24.5461      6.9030
+     17.0880   1465.4830     24.5697      6.8900
+     17.1610   1465.4940     24.6422      6.8700
+     17.2390   1465.4720     24.6780      6.8530
+     17.2960   1465.4390     24.7017      6.8370
+     17.3760   1465.4060     24.7353      6.8180
+     17.4570   1465.3610     24.7498      6.8020
+     17.5080   1465.3310     24.7726      6.7870
+     17.5690   1465.3050     24.7963      6.7730
+     17.6380   1465.2840     24.8329      6.7560
+     17.6970   1465.2640     24.8550      6.7440
+     17.7870   1465.2370     24.8672      6.7330
+     17.8520   1465.2110     24.8970      6.7170
+     17.9220   1465.1980     24.9435      6.6990
+     17.9830   1465.1770     24.9741      6.6840
+     18.0730   1465.1650     25.0114      6.6690
+     18.1050   1465.1580     25.0443      6.6570
+     18.1860   1465.1590     25.0732      6.6480
+     18.2540   1465.1470     25.0916      6.6390
+     18.3380   1465.1430     25.1160      6.6300
+     18.3900   1465.1280     25.1358      6.6200
+     18.4610   1465.1230     25.1564      6.6120
+     18.5280   1465.1160     25.1884      6.6000
+     18.5760   1465.0980     25.2022      6.5910
+     18.6730   1465.0800     25.2289      6.5780
+     18.7170   1465.0650     25.2388      6.5710
+     18.7950   1465.0430     25.2518      6.5610
+     18.8820   1465.0290     25.2846      6.5470
+     18.9550   1465.0120     25.3059      6.5360
+     19.0210   1464.9990     25.3265      6.5260
+     19.0950   1465.0000     25.3456      6.5200
+     19.1600   1465.0030     25.3830      6.5090
+     19.2220   1465.0080     25.4051      6.5030
+     19.2820   1465.0100     25.4250      6.4970
+     19.3550   1465.0160     25.4326      6.4960
+     19.4210   1465.0110     25.4303      6.4950
+     19.4540   1465.0040     25.4250      6.4950
+     19.5260   1464.9970     25.4410      6.4880
+     19.5940   1464.9890     25.4494      6.4830
+     19.6520   1464.9720     25.4448      6.4800
+     19.7450   1464.9630     25.4494      6.4760
+     19.8060   1464.9520     25.4715      6.4660
+     19.8560   1464.9360     25.4845      6.4580
+     19.9340   1464.9190     25.5020      6.4480
+     20.0040   1464.9100     25.5165      6.4410
+     20.0740   1464.9130     25.5470      6.4320
+     20.1480   1464.9090     25.5653      6.4250
+     20.2110   1464.8680     25.5669      6.4140
+     20.2660   1464.7640     25.4990      6.4090
+     20.3290   1464.6650     25.4707      6.3930
+     20.4080   1464.5890     25.4997      6.3650
+     20.4820   1464.5480     25.5562      6.3370
+     20.5650   1464.5460     25.6630      6.3030
+     20.6190   1464.5550     25.8080      6.2600
+     20.7020   1464.5430     25.9171      6.2230
+     20.7660   1464.4910     26.0071      6.1820
+     20.8300   1464.4500     26.0735      6.1510
+     20.9160   1464.4560     26.1841      6.1180
+     20.9730   1464.4450     26.2619      6.0910
+     21.0370   1464.4380     26.3420      6.0640
+     21.1010   1464.4160     26.4084      6.0380
+     21.1700   1464.3800     26.4397      6.0190
+     21.2540   1464.3560     26.5099      5.9910
+     21.3020   1464.3230     26.5900      5.9580
+     21.3740   1464.3130     26.7036      5.9200
+     21.4660   1464.2780     26.7624      5.8930
+     21.5040   1464.2710     26.8402      5.8670
+     21.5800   1464.2460     26.8906      5.8450
+     21.6460   1464.2240     26.9432      5.8230
+     21.7290   1464.1810     26.9630      5.8060
+     21.8090   1464.1330     27.0149      5.7780
+     21.8830   1464.0530     27.0439      5.7490
+     21.9590   1463.9570     27.0866      5.7120
+     22.0350   1463.8890     27.1713      5.6690
+     22.1210   1463.9050     27.2896      5.6360
+     22.1920   1463.8800     27.3628      5.6070
+     22.2660   1463.8300     27.4132      5.5790
+     22.3330   1463.7990     27.4918      5.5470
+     22.3920   1463.7610     27.5322      5.5250
+     22.5220   1463.7570     27.5917      5.5050
+     22.5870   1463.7560     27.6260      5.4940
+     22.6440   1463.7520     27.6611      5.4820
+     22.7310   1463.7450     27.6642      5.4790
+     22.7880   1463.7560     27.6848      5.4750
+     22.8810   1463.7710     27.7153      5.4690
+     22.9660   1463.7840     27.7306      5.4670
+     23.0220   1463.8030     27.7519      5.4650
+     23.0710   1463.8340     27.7756      5.4650
+     23.1670   1463.8650     27.8084      5.4620
+     23.1980   1463.8590     27.8130      5.4590
+     23.3120   1463.8480     27.8290      5.4510
+     23.3950   1463.7640     27.8229      5.4320
+     23.4790   1463.7280     27.8709      5.4080
+     23.5610   1463.6410     27.9251      5.3700
+     23.6210   1463.5820     27.9778      5.3390
+     23.7080   1463.5830     28.0754      5.3090
+     23.7750   1463.5350     28.1342      5.2790
+     23.8660   1463.5410     28.2188      5.2540
+     23.9580   1463.4880     28.2761      5.2230
+     24.0820   1463.4060     28.3173      5.1900
+     24.1620   1463.3730     28.3783      5.1630
+     24.2560   1463.3500     28.4531      5.1340
+     24.3480   1463.3680     28.5378      5.1120
+     24.4520   1463.3730     28.5889      5.0970
+     24.5660   1463.3100     28.5347      5.0980
+     24.6360   1463.3220     28.5400      5.0990
+     24.7480   1463.3540     28.6186      5.0820
+     24.8410   1463.3470     28.6705      5.0640
+     24.9390   1463.2950     28.6743      5.0500
+     25.0490   1463.2250     28.6827      5.0300
+     25.1660   1463.1960     28.7102      5.0140
+     25.2670   1463.1630     28.7415      4.9960
+     25.3550   1463.1280     28.7979      4.9700
+     25.4500   1463.1130     28.8689      4.9440
+     25.5610   1463.0820     28.9085      4.9240
+     25.6490   1463.0810     28.9719      4.9040
+     25.7370   1463.0840     29.0154      4.8910
+     25.8480   1463.0960     29.0886      4.8710
+     25.9250   1463.0960     29.1298      4.8580
+     26.0260   1463.0890     29.1618      4.8460
+     26.1220   1463.0830     29.2145      4.8280
+     26.2310   1463.0800     29.2694      4.8100
+     26.3250   1463.0740     29.3159      4.7940
+     26.4230   1463.0780     29.3701      4.7780
+     26.5260   1463.0810     29.3999      4.7690
+     26.6360   1463.0940     29.4579      4.7540
+     26.7080   1463.1130     29.5105      4.7420
+     26.8180   1463.1440     29.5662      4.7320
+     26.9030   1463.2240     29.6638      4.7210
+     27.0050   1463.2930     29.7264      4.7180
+     27.1060   1463.3290     29.7661      4.7140
+     27.2000   1463.3690     29.8126      4.7090
+     27.2960   1463.4620     29.8874      4.7080
+     27.4170   1463.5600     29.9629      4.7080
+     27.5120   1463.6960     30.0453      4.7150
+     27.6090   1463.7990     30.0987      4.7230
+     27.7100   1463.8180     30.1064      4.7250
+     27.8150   1463.8840     30.1308      4.7330
+     27.8870   1464.1020     30.2711      4.7420
+     28.0100   1464.1750     30.2849      4.7550
+     28.1110   1464.3870     30.4199      4.7640
+     28.2280   1464.4460     30.4199      4.7780
+     28.3010   1464.4960     30.4413      4.7830
+     28.4110   1464.5350     30.4283      4.7960
+     28.5070   1464.6020     30.4474      4.8060
+     28.6120   1464.6420     30.4550      4.8130
+     28.6740   1464.6190     30.4100      4.8210
+     28.7860   1464.6160     30.3993      4.8230
+     28.8650   1464.6660     30.4283      4.8260
+     28.9630   1464.7690     30.4848      4.8330
+     29.0410   1464.7720     30.4573      4.8420
+     29.1420   1464.8220     30.4787      4.8470
+     29.2170   1464.8160     30.4665      4.8490
+     29.2910   1464.8580     30.4825      4.8540
+     29.3870   1464.9030     30.5000      4.8590
+     29.4590   1464.9650     30.5420      4.8610
+     29.5670   1465.0630     30.5977      4.8670
+     29.6500   1465.2080     30.6847      4.8750
+     29.7390   1465.4700     30.8632      4.8830
+     29.8090   1465.7300     31.0081      4.9010
+     29.9000   1465.7360     30.9212      4.9290
+     29.9890   1465.8170     30.9189      4.9490
+     30.0610   1465.9660     30.9898      4.9630
+     30.1490   1465.9940     30.9715      4.9750
+     30.2490   1466.0600     30.9799      4.9880
+     30.3320   1466.1050     30.9593      5.0050
+     30.4130   1466.0880     30.9158      5.0140
+     30.4920   1466.1770     30.9723      5.0180
+     30.5870   1466.2450     30.9982      5.0260
+     30.6770   1466.2570     31.0005      5.0280
+     30.7510   1466.3470     31.0608      5.0310
+     30.8430   1466.3660     31.0646      5.0340
+     30.9320   1466.4390     31.1172      5.0350
+     31.0140   1466.5250     31.1516      5.0450
+     31.1080   1466.5760     31.1554      5.0560
+     31.1980   1466.5840     31.1310      5.0650
+     31.2790   1466.6070     31.1256      5.0720
+     31.3950   1466.7060     31.1630      5.0840
+     31.4660   1466.7260     31.1653      5.0880
+     31.5600   1466.7170     31.1470      5.0910
+     31.6540   1466.7620     31.1684      5.0950
+     31.7320   1466.7780     31.1676      5.0990
+     31.8130   1466.8060     31.1653      5.1060
+     31.9140   1466.8570     31.1951      5.1090
+     32.0100   1466.9290     31.2408      5.1120
+     32.0970   1467.0040     31.2920      5.1140
+     32.1950   1467.0530     31.3133      5.1190
+     32.2960   1467.0510     31.2782      5.1290
+     32.4100   1467.0680     31.2836      5.1310
+     32.5040   1467.1070     31.3095      5.1320
+     32.6080   1467.1490     31.3416      5.1320
+     32.6960   1467.3420     31.4568      5.1430
+     32.7990   1467.4700     31.5399      5.1480
+     32.8830   1467.5820     31.5918      5.1590
+     32.9850   1467.6770     31.6040      5.1780
+     33.0900   1467.6160     31.5063      5.1930
+     33.1970   1467.9390     31.7169      5.2060
+     33.2880   1468.2480     31.8855      5.2290
+     33.4050   1468.4250     31.9427      5.2540
+     33.5030   1468.4760     31.9145      5.2750
+     33.5870   1468.7810     32.0892      5.2950
+     33.6970   1468.9020     32.1220      5.3140
+     33.7860   1469.1440     32.2220      5.3420
+     33.8840   1469.3840     32.3364      5.3650
+     33.9800   1469.4750     32.3273      5.3900
+     34.1010   1469.5020     32.2952      5.4060
+     34.1930   1469.6230     32.3418      5.4210
+     34.3080   1469.7360     32.3845      5.4350
+     34.4020   1469.7620     32.3624      5.4480
+     34.4990   1469.7820     32.3486      5.4570
+     34.5810   1469.8400     32.3547      5.4690
+     34.6960   1469.9010     32.3502      5.4850
+     34.7810   1469.9840     32.3730      5.4980
+     34.8820   1470.0560     32.3837      5.5120
+     34.9970   1470.1140     32.3997      5.5210
+     35.0890   1470.1670     32.4051      5.5320
+     35.2090   1470.2210     32.4173      5.5410
+     35.2890   1470.2500     32.4104      5.5500
+     35.3940   1470.3320     32.4577      5.5550
+     35.4760   1470.4320     32.5134      5.5620
+     35.5850   1470.5960     32.6035      5.5740
+     35.6980   1470.6530     32.6180      5.5830
+     35.7920   1470.8230     32.6744      5.6070
+     35.8970   1470.9930     32.7438      5.6270
+     36.0010   1471.0610     32.7393      5.6450
+     36.0810   1471.1200     32.7271      5.6630
+     36.2010   1471.1780     32.7271      5.6770
+     36.3010   1471.1760     32.6797      5.6910
+     36.3940   1471.2190     32.6775      5.7020
+     36.5000   1471.3280     32.7240      5.7140
+     36.6030   1471.3970     32.7682      5.7170
+     36.7200   1471.4700     32.7988      5.7250
+     36.8070   1471.5020     32.7812      5.7380
+     36.9260   1471.5710     32.7965      5.7500
+     37.0170   1471.6400     32.8087      5.7630
+     37.1190   1471.7260     32.8438      5.7730
+     37.2220   1471.7140     32.7911      5.7860
+     37.3320   1471.8060     32.8186      5.8000
+     37.4270   1472.0590     32.9788      5.8120
+     37.5260   1472.2160     33.0383      5.8320
+     37.6300   1472.3500     33.1306      5.8360
+     37.7290   1472.5950     33.2283      5.8660
+     37.8540   1472.6960     33.2115      5.8960
+     37.9680   1472.8400     33.2451      5.9210
+     38.0880   1472.9150     33.2115      5.9500
+     38.1980   1472.8360     33.0811      5.9710
+     38.3340   1472.8670     33.0406      5.9910
+     38.4360   1472.9330     33.0505      6.0040
+     38.5500   1473.0510     33.1169      6.0120
+     38.6720   1473.1270     33.1635      6.0160
+     38.8110   1473.1530     33.1535      6.0250
+     38.9190   1473.2150     33.1795      6.0320
+     39.0390   1473.2750     33.2092      6.0370
+     39.1770   1473.2930     33.2001      6.0440
+     39.2910   1473.3580     33.2344      6.0490
+     39.4100   1473.4610     33.2764      6.0610
+     39.5350   1473.4360     33.2329      6.0680
+     39.6470   1473.7170     33.4320      6.0750
+     39.7720   1473.9550     33.6128      6.0770
+     39.9000   1474.2230     33.7952      6.0860
+     40.0080   1474.3450     33.7738      6.1230
+     40.1410   1474.3960     33.7341      6.1480
+     40.2340   1474.4600     33.6731      6.1830
+     40.3650   1474.5430     33.6525      6.2100
+     40.5030   1474.5460     33.6098      6.2240
+     40.6060   1474.5780     33.5709      6.2440
+     40.7130   1474.6200     33.5464      6.2620
+     40.8110   1474.7460     33.6044      6.2750
+     40.9610   1474.8230     33.6128      6.2910
+     41.0620   1474.9010     33.6143      6.3100
+     41.1840   1474.9670     33.6143      6.3260
+     41.2930   1475.0820     33.6548      6.3420
+     41.4250   1475.1700     33.6693      6.3590
+     41.5570   1475.1970     33.6296      6.3780
+     41.6620   1475.2540     33.6357      6.3900
+     41.7880   1475.2860     33.6098      6.4060
+     41.9030   1475.3410     33.6296      6.4130
+     42.0250   1475.4140     33.6517      6.4240
+     42.1530   1475.4760     33.6647      6.4350
+     42.2670   1475.6340     33.7456      6.4490
+     42.3660   1475.7150     33.7929      6.4540
+     42.5140   1475.8120     33.8394      6.4630
+     42.6160   1475.8790     33.8478      6.4770
+     42.7410   1475.9310     33.8722      6.4820
+     42.8550   1476.0510     33.9096      6.5000
+     42.9860   1476.1260     33.9272      6.5130
+     43.0880   1476.1590     33.8959      6.5310
+     43.1960   1476.1820     33.8783      6.5420
+     43.3120   1476.1660     33.8234      6.5550
+     43.4670   1476.1850     33.7990      6.5670
+     43.5640   1476.2090     33.7830      6.5780
+     43.6950   1476.2320     33.7868      6.5820
+     43.8420   1476.2400     33.7723      6.5880
+     43.9380   1476.2430     33.7578      6.5930
+     44.0510   1476.2630     33.7692      6.5940
+     44.1660   1476.2950     33.7868      6.5960
+     44.2850   1476.3200     33.7929      6.6000
+     44.3860   1476.3810     33.8150      6.6080
+     44.5280   1476.4250     33.8173      6.6180
+     44.6540   1476.4770     33.8570      6.6180
+     44.7780   1476.5770     33.9005      6.6290
+     44.8900   1476.6260     33.9104      6.6380
+     44.9910   1476.6660     33.8997      6.6510
+     45.1230   1476.7150     33.8875      6.6670
+     45.2230   1476.8120     33.8951      6.6890
+     45.3620   1476.9190     33.9500      6.6980
+     45.4790   1477.0120     33.9981      6.7060
+     45.5970   1477.0410     34.0103      6.7090
+     45.7180   1477.0410     33.9653      6.7230
+     45.8080   1477.0590     33.9470      6.7330
+     45.9490   1477.0590     33.9233      6.7400
+     46.0680   1476.9810     33.8531      6.7420
+     46.1870   1477.0550     33.8890      6.7490
+     46.2880   1477.0700     33.8814      6.7550
+     46.4120   1477.1140     33.8989      6.7600
+     46.5490   1477.2120     33.9600      6.7650
+     46.6710   1477.2470     33.9676      6.7710
+     46.7570   1477.3160     33.9905      6.7810
+     46.8960   1477.3390     33.9943      6.7850
+     47.0360   1477.3840     34.0218      6.7870
+     47.1620   1477.4280     34.0240      6.7970
+     47.2760   1477.4620     34.0279      6.8040
+     47.3800   1477.4160     33.9684      6.8110
+     47.5090   1477.4610     33.9806      6.8180
+     47.6250   1477.5370     34.0279      6.8220
+     47.7270   1477.6220     34.0752      6.8280
+     47.8490   1477.6740     34.0813      6.8390
+     47.9560   1477.6830     34.0530      6.8500
+     48.0810   1477.7380     34.0729      6.8570
+     48.2130   1477.7680     34.0797      6.8620
+     48.3400   1477.8390     34.1003      6.8730
+     48.4650   1477.8270     34.0584      6.8830
+     48.5810   1477.8410     34.0492      6.8890
+     48.6920   1477.9210     34.1057      6.8910
+     48.8300   1477.9890     34.1209      6.9030
+     48.9100   1477.8340     33.9653      6.9130
+     48.9130   1477.5710     33.7585      6.9120
+     48.9140   1478.0430     33.9645      6.9670
@@ -0,0 +1,162 @@
+test_read_store_and_write
+5/5/2012
+19:52:14
+Probe: MIDAS SVP 6000
+Source: /root/package/data/input/valeport/midas/svp/FILE18.000
+      9.8680   1464.7580     20.1920      8.1040
+      9.8760   1464.6980     18.8789      8.5000
+      9.9710   1464.7430     17.9077      8.8160
+     10.0860   1464.7510     17.1532      9.0550
+     10.1750   1464.7510     16.5962      9.2300
+     10.2660   1464.7730     16.2170      9.3550
+     10.3620   1464.8030     15.9615      9.4430
+     10.4290   1464.8040     15.7837      9.4990
+     10.4890   1464.8040     15.6563      9.5390
+     10.5700   1464.8050     15.5800      9.5630
+     10.6360   1464.7780     15.4999      9.5810
+     10.7240   1464.7820     15.4800      9.5880
+     10.7940   1464.8040     15.4686      9.5970
+     10.8760   1464.8220     15.4510      9.6070
+     10.9710   1464.8250     15.4266      9.6150
+     11.0400   1464.8190     15.4022      9.6210
+     11.1050   1464.8240     15.3893      9.6260
+     11.1820   1464.7870     15.3481      9.6290
+     11.2360   1464.7610     15.3290      9.6280
+     11.3030   1464.7480     15.3145      9.6290
+     11.3670   1464.7670     15.3328      9.6280
+     11.4750   1464.7710     15.3343      9.6280
+     11.5430   1464.7740     15.3389      9.6270
+     11.6320   1464.7650     15.3397      9.6240
+     11.6790   1464.7570     15.3297      9.6250
+     11.7770   1464.7420     15.3061      9.6280
+     11.8290   1464.7280     15.3099      9.6230
+     11.9220   1464.7240     15.3053      9.6230
+     11.9900   1464.7550     15.3427      9.6190
+     12.0680   1464.7400     15.3259      9.6200
+     12.1550   1464.7540     15.3305      9.6220
+     12.2250   1464.7610     15.3412      9.6200
+     12.3130   1464.7630     15.3259      9.6250
+     12.3640   1464.7620     15.3336      9.6220
+     12.4230   1464.7670     15.3244      9.6260
+     12.5010   1464.7730     15.3381      9.6230
+     12.5930   1464.8000     15.3587      9.6230
+     12.6440   1464.7990     15.3702      9.6190
+     12.7420   1464.8100     15.3748      9.6200
+     12.8270   1464.8230     15.3908      9.6180
+     12.8820   1464.8520     15.4076      9.6200
+     12.9630   1464.8610     15.4106      9.6210
+     13.0570   1464.8830     15.4213      9.6230
+     13.1070   1464.8930     15.4221      9.6250
+     13.1780   1464.9000     15.4305      9.6240
+     13.2440   1464.8840     15.4068      9.6270
+     13.3200   1464.9290     15.4495      9.6250
+     13.3970   1464.9680     15.4900      9.6220
+     13.4700   1464.9930     15.5090      9.6220
+     13.5650   1465.0150     15.5197      9.6240
+     13.6440   1465.0380     15.5441      9.6220
+     13.7140   1465.0230     15.5312      9.6220
+     13.7680   1465.0590     15.5502      9.6250
+     13.8450   1465.2640     15.7814      9.6050
+     13.9320   1465.4800     16.3124      9.4930
+     13.9940   1465.8820     17.0471      9.3650
+     14.0820   1465.6400     17.6895      9.0990
+     14.1710   1465.6770     18.4669      8.8630
+     14.2290   1466.1280     19.3077      8.7140
+     14.3120   1466.2170     20.0943      8.4890
+     14.3930   1466.2720     20.9549      8.2320
+     14.4730   1466.2370     21.3295      8.1050
+     14.5320   1466.2420     21.4790      8.0590
+     14.6040   1466.2200     21.9444      7.9070
+     14.6820   1466.2280     22.4701      7.7440
+     14.7330   1466.1830     22.8348      7.6180
+     14.7540   1466.1490     23.0911      7.5290
+     14.7630   1466.1960     22.9179      7.5950
+     14.8100   1466.1130     22.6082      7.6710
+     14.8270   1466.1180     22.8256      7.6040
+     14.8990   1466.0640     22.9469      7.5520
+     14.9620   1466.0300     22.8424      7.5760
+     15.0120   1465.9840     22.7821      7.5830
+     15.0810   1465.9000     22.9240      7.5170
+     15.1540   1465.8730     23.1346      7.4440
+     15.2240   1465.8040     23.2666      7.3850
+     15.2830   1465.8040     23.4421      7.3300
+     15.3390   1465.8290     23.5413      7.3050
+     15.3940   1465.8090     23.6206      7.2750
+     15.4770   1465.7820     23.6107      7.2710
+     15.5400   1465.7550     23.6931      7.2380
+     15.6160   1465.7570     23.7610      7.2170
+     15.6820   1465.7360     23.8106      7.1960
+     15.7400   1465.7500     23.8663      7.1820
+     15.7860   1465.7030     23.9174      7.1540
+     15.8490   1465.7180     23.9990      7.1320
+     15.9240   1465.6910     23.9990      7.1250
+     15.9770   1465.6360     23.9861      7.1150
+     16.0380   1465.6280     24.0295      7.0990
+     16.1040   1465.6640     24.0898      7.0890
+     16.1470   1465.6570     24.0906      7.0870
+     16.2100   1465.6380     24.0356      7.0990
+     16.2910   1465.6180     24.0410      7.0920
+     16.3410   1465.6330     24.0974      7.0780
+     16.4140   1465.6550     24.1302      7.0730
+     16.5010   1465.6520     23.9914      7.1150
+     16.5720   1465.6430     23.9357      7.1300
+     16.6450   1465.6450     24.0257      7.1020
+     16.7140   1465.6610     24.1180      7.0770
+     16.7950   1465.6540     24.1081      7.0780
+     16.8330   1465.5990     24.0341      7.0870
+     16.9170   1465.6090     24.1310      7.0590
+     16.9730   1465.6030     24.2439      7.0220
+     17.0430   1465.5740     24.2455      7.0140
+     17.1320   1465.5490     24.3210      6.9840
+     17.1700   1465.5650     24.4675      6.9420
+     17.2840   1465.5700     24.5918      6.9040
+     17.3330   1465.5070     24.6048      6.8840
+     17.4180   1465.4380     24.6384      6.8560
+     17.4550   1465.4440     24.7391      6.8260
+     17.5140   1465.4230     24.8177      6.7960
+     17.5800   1465.3960     24.8856      6.7680
+     17.6510   1465.3660     24.9504      6.7400
+     17.6980   1465.3650     24.9969      6.7250
+     17.7770   1465.3440     25.0366      6.7070
+     17.8290   1465.3100     25.0572      6.6920
+     17.8980   1465.2940     25.1015      6.6740
+     17.9290   1465.2980     25.0977      6.6760
+     17.9650   1465.2870     25.0885      6.6760
+     17.9670   1465.5860     25.2251      6.7080
+     18.0180   1465.5660     25.0832      6.7470
+     18.0440   1465.5130     24.8764      6.7980
+     18.0710   1465.3510     24.5728      6.8520
+     18.1110   1465.2860     24.3790      6.8960
+     18.1290   1465.2430     24.2737      6.9180
+     18.1870   1465.2440     24.2317      6.9310
+     18.2140   1465.2360     24.2279      6.9300
+     18.2750   1465.2450     24.2928      6.9120
+     18.3270   1465.2550     24.3896      6.8840
+     18.3760   1465.2660     24.5102      6.8490
+     18.4140   1465.2600     24.6048      6.8180
+     18.4770   1465.2440     24.6941      6.7860
+     18.5270   1465.1940     24.7269      6.7630
+     18.5740   1465.1940     24.8322      6.7300
+     18.6350   1465.1670     24.9352      6.6910
+     18.6800   1465.1680     25.0542      6.6540
+     18.7590   1465.1730     25.1511      6.6250
+     18.8100   1465.1520     25.2037      6.6030
+     18.9000   1465.0690     25.2296      6.5740
+     18.9880   1464.9890     25.2678      6.5420
+     19.0700   1464.9790     25.3586      6.5110
+     19.1630   1464.9150     25.3960      6.4830
+     19.2380   1464.9490     25.4738      6.4670
+     19.3150   1464.9330     25.5112      6.4510
+     19.4170   1464.8640     25.5737      6.4140
+     19.4970   1464.8040     25.6378      6.3790
+     19.5860   1464.7620     25.7355      6.3380
+     19.6900   1464.6740     25.8606      6.2770
+     19.8070   1464.5280     25.9880      6.2010
+     19.8860   1464.4930     26.2589      6.1080
+     19.9710   1464.4090     26.3947      6.0450
+     19.9970   1464.4000     26.5129      6.0060
+     20.0020   1464.3380     26.8227      5.8950
+     20.0030   1464.3220     26.8585      5.8800
+     20.0050   1464.1900     26.9768      5.8110
+     20.0060   1464.1850     27.0370      5.7910
+     20.0100   1464.2150     27.1286      5.7700
@@ -0,0 +1,55 @@
+test_read_store_and_write
+5/4/2016
+16:28:42
+Probe: MIDAS SVX2 3000
+Source: /root/package/data/input/valeport/midas/svx2/FILE2.000
+      0.1390   1424.8240      3.5000      3.8370
+      0.2130   1424.5460      3.6610      3.7700
+      0.3260   1423.8620      3.8320      3.6170
+      0.4710   1423.2350      3.9600      3.4350
+      0.6250   1423.0360      3.9910      3.2990
+      0.7270   1423.0790      4.0110      3.2320
+      0.8010   1423.3220      4.0850      3.2450
+      0.8230   1423.3640      4.0900      3.2350
+      0.8270   1423.2150      4.1000      3.2230
+      0.8320   1423.2070      4.1310      3.2080
+      0.8340   1423.2440      4.1350      3.2260
+      0.8600   1423.4520      4.1240      3.2210
+      0.9120   1423.4300      4.1790      3.1630
+      0.9190   1423.2470      4.2200      3.2000
+      0.9260   1423.1190      4.2440      3.2020
+      0.9320   1423.1840      4.2800      3.2180
+      1.0020   1422.9300      4.0860      3.1870
+      1.1400   1422.9200      4.0350      3.1660
+      1.2790   1422.9320      4.0370      3.1500
+      1.4280   1422.9010      4.0540      3.1400
+      1.5940   1422.6260      4.0820      3.0960
+      1.7750   1421.4770      4.1900      2.9230
+      1.9460   1420.6820      4.4450      2.6430
+      2.0880   1419.9910      4.7470      2.4040
+      2.2630   1419.7710      4.9300      2.2520
+      2.4150   1419.4690      5.0960      2.1620
+      2.5960   1419.2190      5.2900      2.0760
+      2.7410   1419.1750      5.3510      2.0140
+      2.9220   1419.1050      5.3900      1.9700
+      3.0980   1418.7480      5.4140      1.9260
+      3.2340   1418.6330      5.4360      1.8750
+      3.4320   1418.5550      5.4490      1.8450
+      3.5770   1418.5310      5.4570      1.8250
+      3.7440   1418.5300      5.4670      1.8130
+      3.8820   1418.5350      5.4700      1.8000
+      4.0620   1418.5090      5.4770      1.7960
+      4.2250   1418.4800      5.4800      1.7880
+      4.3850   1418.3940      5.4870      1.7760
+      4.5680   1418.4060      5.4930      1.7640
+      4.7040   1418.3840      5.4910      1.7600
+      4.8850   1418.3580      5.4950      1.7520
+      5.0470   1418.3210      5.5030      1.7450
+      5.2310   1418.2200      5.5110      1.7320
+      5.3700   1418.2240      5.5200      1.7160
+      5.5500   1418.1550      5.5160      1.7050
+      5.7500   1418.1570      5.5270      1.7000
+      5.8600   1418.1580      5.4470      1.7000
+      5.9100   1418.0820      5.3960      1.7110
+      5.9180   1418.0870      5.4150      1.7210
+      5.9270   1418.0950      5.4280      1.7350
@@ -0,0 +1,3104 @@
+test_read_store_and_write
+11/5/2012
+6:29:14
+Probe: MIDAS SVP 6000
+Source: /root/package/data/input/valeport/midas/svp/FILE4.000
+      0.0860   1479.2480     31.1829      8.3950
+      0.1140   1479.5610     29.9713      8.8740
+      0.1170   1479.4350     28.7392      9.2440
+      0.1330   1479.5260     28.6789      9.2880
+      0.1370   1479.7100     28.8116      9.2940
+      0.1490   1479.8710     28.9406      9.2950
+      0.1680   1479.7550     28.8391      9.2970
+      0.1970   1479.7480     28.8513      9.2910
+      0.2020   1479.6280     28.7376      9.2960
+      0.3050   1479.6840     28.7697      9.3000
+      0.3920   1479.6810     28.7750      9.2970
+      0.4620   1479.6300     28.7323      9.2970
+      0.5490   1479.6310     28.7292      9.2980
+      0.5710   1479.6130     28.7140      9.2980
+      0.5840   1479.5550     28.6514      9.3030
+      0.5980   1479.8450     28.9192      9.2930
+      0.6120   1479.6440     28.7331      9.3000
+      0.6330   1479.6670     28.7575      9.2980
+      0.6940   1479.9940     29.0886      9.2770
+      0.7510   1479.9810     29.0863      9.2740
+      0.7890   1479.6660     28.8277      9.2740
+      0.8830   1479.5210     28.6957      9.2780
+      0.9980   1479.5740     28.7254      9.2820
+      1.0460   1479.5750     28.7102      9.2870
+      1.0820   1479.5380     28.6758      9.2880
+      1.1560   1479.5500     28.6880      9.2870
+      1.1660   1479.5010     28.6324      9.2920
+      1.2230   1479.5150     28.6308      9.2960
+      1.2540   1479.4880     28.6057      9.2970
+      1.2840   1479.5190     28.6270      9.2980
+      1.3100   1479.4980     28.6194      9.2950
+      1.4010   1479.4610     28.5873      9.2950
+      1.4600   1479.4630     28.5820      9.2970
+      1.5150   1479.5390     28.6407      9.2980
+      1.6100   1479.5550     28.6491      9.2990
+      1.7000   1479.5560     28.6491      9.2990
+      1.7830   1479.6750     28.7361      9.3020
+      1.8400   1479.7600     28.8055      9.3020
+      1.9080   1479.7250     28.7727      9.3030
+      1.9820   1479.6180     28.6804      9.3040
+      2.0480   1479.6120     28.6751      9.3040
+      2.1040   1479.5750     28.6407      9.3050
+      2.1440   1479.6000     28.6667      9.3030
+      2.2540   1479.6330     28.6896      9.3040
+      2.3470   1479.6910     28.7415      9.3020
+      2.4290   1479.7560     28.7910      9.3030
+      2.5130   1479.7970     28.8322      9.3000
+      2.6010   1479.8030     28.8269      9.3030
+      2.6670   1479.8160     28.8429      9.3010
+      2.7540   1479.8200     28.8391      9.3030
+      2.8170   1479.8240     28.8414      9.3030
+      2.9200   1479.8740     28.8780      9.3040
+      3.0470   1479.8820     28.8795      9.3050
+      3.1360   1479.8870     28.8826      9.3050
+      3.3220   1479.9300     28.9215      9.3030
+      3.4780   1479.9880     28.9665      9.3030
+      3.6980   1480.1060     29.0878      9.2940
+      3.9270   1480.2040     29.2015      9.2820
+      4.1470   1480.2230     29.2320      9.2760
+      4.3750   1480.2210     29.2488      9.2690
+      4.6020   1480.2320     29.2610      9.2670
+      4.8140   1480.1830     29.2122      9.2690
+      5.0000   1480.2170     29.2160      9.2760
+      5.2220   1480.2090     29.2122      9.2740
+      5.4360   1480.1960     29.1870      9.2780
+      5.6890   1480.2290     29.2191      9.2750
+      5.9750   1480.2150     29.2130      9.2720
+      6.2450   1480.2520     29.2427      9.2710
+      6.5220   1480.5680     29.5128      9.2660
+      6.8340   1480.4930     29.4930      9.2510
+      7.1730   1480.5570     29.5685      9.2420
+      7.4330   1480.6930     29.7066      9.2320
+      7.7080   1480.8130     29.8401      9.2190
+      8.0300   1480.8750     29.9446      9.2000
+      8.3520   1480.9980     30.1079      9.1780
+      8.6860   1481.0040     30.1903      9.1510
+      9.0250   1481.0310     30.2834      9.1260
+      9.3100   1481.0350     30.3711      9.0970
+      9.6470   1481.3200     30.7266      9.0550
+     10.0000   1481.3140     30.9235      8.9870
+     10.3160   1481.3260     31.0570      8.9450
+     10.6750   1481.3860     31.1226      8.9380
+     10.9910   1481.5300     31.3354      8.9050
+     11.3200   1481.6360     31.4781      8.8850
+     11.6260   1481.6770     31.5170      8.8820
+     11.9230   1481.8770     31.8001      8.8410
+     12.2640   1481.7510     31.8932      8.7750
+     12.6040   1481.9760     32.1144      8.7610
+     12.9370   1482.1520     32.3837      8.7180
+     13.3170   1482.1730     32.5928      8.6530
+     13.6600   1482.0740     32.6111      8.6190
+     13.9960   1482.1960     32.8178      8.5820
+     14.3290   1482.2430     32.9727      8.5420
+     14.6420   1482.1920     33.0093      8.5150
+     14.9100   1482.1800     32.9445      8.5320
+     15.2370   1482.1880     32.9498      8.5310
+     15.5560   1482.1580     33.0399      8.4920
+     15.8570   1482.1510     33.1055      8.4670
+     16.2690   1481.7930     32.9285      8.4280
+     16.7110   1481.7230     33.0788      8.3580
+     17.0770   1481.4090     33.0360      8.2870
+     17.4430   1480.7610     32.6630      8.2360
+     17.8020   1480.2680     32.6996      8.0920
+     18.1260   1480.6860     33.3176      7.9990
+     18.4690   1480.2190     33.1505      7.9290
+     18.8080   1480.4100     33.4984      7.8640
+     19.1340   1480.6650     33.7852      7.8360
+     19.4810   1481.1370     34.0355      7.8770
+     19.7860   1481.0090     33.7296      7.9420
+     20.1440   1480.9530     33.6800      7.9420
+     20.4630   1481.1150     33.8219      7.9370
+     20.8090   1481.1700     33.8188      7.9510
+     21.1640   1481.2620     33.8455      7.9650
+     21.5100   1481.2710     33.8692      7.9580
+     21.8620   1481.4810     34.0645      7.9480
+     22.1860   1481.5770     34.0919      7.9630
+     22.5110   1481.6090     34.0706      7.9770
+     22.8620   1481.6210     34.0599      7.9820
+     23.2160   1481.5440     33.9966      7.9810
+     23.5230   1481.5260     34.0233      7.9660
+     23.8750   1481.5520     34.0675      7.9570
+     24.2190   1481.6040     34.0927      7.9610
+     24.5480   1481.6950     34.1461      7.9660
+     24.8890   1481.5700     34.0347      7.9680
+     25.2140   1481.5210     34.0424      7.9510
+     25.5770   1481.5070     34.0874      7.9310
+     25.9150   1481.5730     34.1637      7.9220
+     26.2680   1481.6100     34.1827      7.9240
+     26.6300   1481.5940     34.1621      7.9250
+     26.9470   1481.4990     34.0935      7.9210
+     27.3020   1481.2710     33.9691      7.9000
+     27.6450   1481.1020     33.9478      7.8610
+     27.9540   1481.1130     34.0714      7.8220
+     28.2880   1481.2220     34.1888      7.8110
+     28.6410   1481.3500     34.2804      7.8130
+     28.9790   1481.4300     34.2766      7.8340
+     29.3450   1481.5370     34.2995      7.8530
+     29.6610   1481.6550     34.3353      7.8710
+     30.0120   1481.7670     34.3384      7.8980
+     30.3670   1481.8490     34.3330      7.9200
+     30.6930   1482.0350     34.4147      7.9410
+     31.0170   1482.1920     34.4299      7.9760
+     31.3560   1482.3960     34.4803      8.0120
+     31.6980   1482.5620     34.4879      8.0520
+     32.0510   1482.7060     34.4864      8.0890
+     32.3910   1482.8040     34.4666      8.1200
+     32.7260   1482.8790     34.4467      8.1450
+     33.0770   1482.9770     34.4727      8.1610
+     33.4340   1483.0800     34.4841      8.1830
+     33.7740   1483.1520     34.4772      8.2030
+     34.1100   1483.2300     34.4749      8.2230
+     34.4570   1483.2600     34.4582      8.2350
+     34.7660   1483.2880     34.4498      8.2440
+     35.1020   1483.3030     34.4391      8.2500
+     35.4560   1483.3390     34.4452      8.2560
+     35.7750   1483.5410     34.5795      8.2640
+     36.1140   1483.6150     34.5627      8.2880
+     36.4570   1483.8240     34.6603      8.3100
+     36.8210   1483.8920     34.6283      8.3370
+     37.1510   1483.9140     34.5871      8.3550
+     37.5120   1483.9340     34.5772      8.3620
+     37.8460   1483.9430     34.5558      8.3700
+     38.1730   1483.9590     34.5528      8.3740
+     38.5230   1483.9190     34.5123      8.3750
+     38.8700   1483.9870     34.5596      8.3760
+     39.2000   1484.0270     34.5787      8.3790
+     39.5470   1484.0490     34.5795      8.3830
+     39.8930   1484.0640     34.5840      8.3840
+     40.2210   1484.0710     34.5886      8.3830
+     40.5570   1484.0380     34.5604      8.3820
+     40.9120   1484.0060     34.5779      8.3660
+     41.2460   1484.0010     34.6054      8.3540
+     41.5860   1483.9890     34.6130      8.3470
+     41.9160   1483.9860     34.6329      8.3380
+     42.2750   1483.9790     34.6375      8.3330
+     42.5970   1483.9830     34.6550      8.3270
+     42.9410   1483.9850     34.6581      8.3250
+     43.2670   1483.9840     34.6558      8.3240
+     43.6120   1483.9860     34.6680      8.3190
+     43.9470   1483.9860     34.6664      8.3180
+     44.3040   1483.9880     34.6786      8.3130
+     44.6420   1483.9870     34.6703      8.3140
+     44.9790   1483.9900     34.6680      8.3140
+     45.3330   1483.9950     34.6825      8.3090
+     45.6490   1483.9990     34.6786      8.3100
+     45.9710   1484.0030     34.6741      8.3110
+     46.3520   1484.0070     34.6756      8.3100
+     46.6780   1484.0060     34.6764      8.3080
+     47.0100   1484.0110     34.6817      8.3060
+     47.3570   1483.9970     34.6687      8.3050
+     47.6740   1483.9990     34.6909      8.2970
+     47.9900   1483.9980     34.6886      8.2960
+     48.3470   1483.9910     34.6962      8.2900
+     48.6770   1483.9900     34.7000      8.2870
+     49.0210   1484.0120     34.7282      8.2820
+     49.3610   1483.9820     34.7153      8.2770
+     49.7100   1483.9840     34.7122      8.2770
+     50.0280   1483.9900     34.7366      8.2690
+     50.3580   1483.9470     34.7099      8.2650
+     50.7110   1483.9320     34.7137      8.2580
+     51.0280   1483.9230     34.7267      8.2500
+     51.3730   1483.9340     34.7458      8.2450
+     51.7230   1483.9120     34.7450      8.2380
+     52.0810   1483.9220     34.7572      8.2350
+     52.3920   1483.8860     34.7389      8.2300
+     52.7050   1483.8930     34.7649      8.2220
+     53.0180   1483.8590     34.7397      8.2200
+     53.3200   1483.7710     34.7038      8.2070
+     53.6450   1483.7790     34.7542      8.1910
+     53.9150   1483.7830     34.7809      8.1820
+     54.2360   1483.7720     34.7710      8.1810
+     54.5630   1483.7550     34.7771      8.1730
+     54.8830   1483.7620     34.7786      8.1730
+     55.2130   1483.7700     34.7931      8.1690
+     55.5320   1483.7710     34.7954      8.1670
+     55.8500   1483.7950     34.8045      8.1690
+     56.1730   1483.7910     34.8000      8.1680
+     56.4950   1483.7900     34.7916      8.1690
+     56.8260   1483.7930     34.7961      8.1670
+     57.1450   1483.7980     34.7923      8.1680
+     57.4620   1483.8010     34.8000      8.1650
+     57.7820   1483.8080     34.7984      8.1660
+     58.1040   1483.8110     34.7992      8.1650
+     58.4480   1483.8160     34.7984      8.1650
+     58.8230   1483.8220     34.8076      8.1620
+     59.2210   1483.8240     34.7977      8.1640
+     59.6080   1483.8280     34.8083      8.1600
+     60.0070   1483.8350     34.7992      8.1630
+     60.4090   1483.8420     34.8083      8.1600
+     60.7840   1483.8470     34.8045      8.1610
+     61.1700   1483.8540     34.8145      8.1580
+     61.5670   1483.8590     34.8129      8.1580
+     61.9570   1483.8800     34.8244      8.1580
+     62.3670   1483.9000     34.8236      8.1620
+     62.7450   1483.9550     34.8534      8.1650
+     63.1430   1483.9720     34.8404      8.1720
+     63.5390   1483.9800     34.8419      8.1720
+     63.9150   1483.9650     34.8213      8.1730
+     64.2590   1483.9940     34.8373      8.1740
+     64.6000   1484.0100     34.8427      8.1750
+     64.9050   1484.0060     34.8381      8.1740
+     65.2350   1483.9890     34.8267      8.1720
+     65.5600   1483.9900     34.8381      8.1670
+     65.8930   1483.9880     34.8412      8.1640
+     66.2150   1483.9900     34.8412      8.1630
+     66.5570   1483.9870     34.8526      8.1570
+     66.8890   1483.9940     34.8572      8.1560
+     67.1790   1483.9920     34.8541      8.1550
+     67.4930   1483.9870     34.8579      8.1510
+     67.8110   1483.9590     34.8312      8.1510
+     68.1520   1483.9680     34.8557      8.1440
+     68.4730   1483.9560     34.8534      8.1400
+     68.7840   1483.9420     34.8473      8.1370
+     69.1090   1483.9320     34.8587      8.1290
+     69.3940   1483.9320     34.8610      8.1270
+     69.7340   1483.9320     34.8686      8.1230
+     70.0340   1483.9330     34.8717      8.1210
+     70.3420   1483.9380     34.8839      8.1170
+     70.6480   1483.9470     34.8839      8.1180
+     70.9760   1483.9590     34.8862      8.1190
+     71.2860   1483.9720     34.8923      8.1190
+     71.5720   1483.9870     34.8915      8.1220
+     71.8710   1483.9900     34.8747      8.1270
+     72.1780   1483.9940     34.8862      8.1230
+     72.5020   1484.0040     34.8808      8.1260
+     72.9340   1483.9850     34.8717      8.1220
+     73.2910   1483.9900     34.8740      8.1210
+     73.6470   1484.0330     34.9075      8.1200
+     73.9750   1484.0080     34.8793      8.1210
+     74.1790   1483.9930     34.8709      8.1190
+     74.2070   1484.0240     34.8953      8.1190
+     74.2400   1484.0200     34.8946      8.1180
+     74.2670   1484.0250     34.8953      8.1190
+     74.3420   1484.0060     34.8671      8.1230
+     74.3990   1484.0100     34.8816      8.1190
+     74.4580   1483.9720     34.8717      8.1120
+     74.5820   1483.9600     34.8694      8.1090
+     74.7200   1483.9080     34.8618      8.0970
+     74.8960   1483.8850     34.8709      8.0870
+     75.0960   1483.8870     34.8915      8.0800
+     75.3290   1483.8810     34.8801      8.0810
+     75.5490   1483.8820     34.8969      8.0750
+     75.7960   1483.8790     34.8846      8.0770
+     76.0470   1483.8820     34.8839      8.0770
+     76.3190   1483.8850     34.8946      8.0730
+     76.6040   1483.9080     34.9068      8.0740
+     76.9220   1483.9580     34.9365      8.0760
+     77.2720   1483.9790     34.9274      8.0830
+     77.6420   1484.0000     34.9243      8.0880
+     77.9930   1484.0040     34.9106      8.0920
+     78.3420   1483.9930     34.9152      8.0860
+     78.6900   1483.9770     34.9068      8.0830
+     79.0230   1483.9360     34.8816      8.0790
+     79.3910   1483.9150     34.8869      8.0700
+     79.7280   1483.9020     34.8991      8.0610
+     80.0810   1483.9090     34.9121      8.0570
+     80.4350   1483.9140     34.9174      8.0550
+     80.7890   1483.9160     34.9113      8.0560
+     81.1410   1483.9200     34.9190      8.0530
+     81.4850   1483.9200     34.9236      8.0500
+     81.8730   1483.9180     34.9167      8.0500
+     82.2080   1483.9160     34.9197      8.0470
+     82.5690   1483.9200     34.9182      8.0470
+     82.9180   1483.9250     34.9358      8.0410
+     83.2950   1483.9290     34.9342      8.0410
+     83.6470   1483.9360     34.9319      8.0420
+     84.0110   1483.9450     34.9281      8.0440
+     84.3820   1483.9510     34.9312      8.0430
+     84.7390   1483.9570     34.9220      8.0460
+     85.0690   1483.9610     34.9335      8.0420
+     85.4410   1483.9680     34.9312      8.0430
+     85.8140   1483.9720     34.9289      8.0430
+     86.1620   1483.9790     34.9243      8.0450
+     86.5260   1483.9870     34.9289      8.0440
+     86.9010   1483.9930     34.9289      8.0440
+     87.2690   1484.0030     34.9350      8.0430
+     87.6160   1484.0110     34.9304      8.0450
+     87.9970   1484.0200     34.9327      8.0450
+     88.3580   1484.0250     34.9350      8.0440
+     88.7260   1484.0320     34.9327      8.0450
+     89.0750   1484.0380     34.9266      8.0470
+     89.4480   1484.0440     34.9266      8.0470
+     89.8130   1484.0520     34.9281      8.0470
+     90.1440   1484.0560     34.9327      8.0450
+     90.5330   1484.0610     34.9319      8.0450
+     90.8970   1484.0650     34.9365      8.0430
+     91.2470   1484.0650     34.9403      8.0400
+     91.5990   1484.0750     34.9289      8.0450
+     91.9760   1484.0830     34.9396      8.0420
+     92.3210   1484.1020     34.9411      8.0450
+     92.7030   1484.1120     34.9380      8.0470
+     93.0550   1484.1120     34.9419      8.0440
+     93.4200   1484.1040     34.9457      8.0390
+     93.7710   1484.0950     34.9312      8.0400
+     94.1270   1484.0880     34.9358      8.0350
+     94.5220   1484.0870     34.9449      8.0300
+     94.8700   1484.0950     34.9525      8.0280
+     95.2420   1484.1170     34.9655      8.0280
+     95.6030   1484.1190     34.9564      8.0300
+     95.9560   1484.1150     34.9579      8.0270
+     96.2970   1484.1180     34.9586      8.0260
+     96.6720   1484.1230     34.9632      8.0240
+     97.0340   1484.1260     34.9609      8.0240
+     97.4140   1484.1330     34.9586      8.0250
+     97.7640   1484.1260     34.9571      8.0220
+     98.1020   1484.1230     34.9594      8.0190
+     98.4620   1484.1080     34.9548      8.0150
+     98.8210   1484.0820     34.9503      8.0080
+     99.1650   1484.0780     34.9518      8.0050
+     99.4780   1484.0700     34.9533      8.0010
+     99.8080   1484.0710     34.9648      7.9960
+    100.1320   1484.0760     34.9739      7.9930
+    100.4780   1484.0820     34.9678      7.9950
+    100.8190   1484.0870     34.9731      7.9930
+    101.1690   1484.0900     34.9739      7.9920
+    101.4860   1484.0960     34.9777      7.9910
+    101.8030   1484.1020     34.9846      7.9890
+    102.1540   1484.1070     34.9747      7.9920
+    102.5010   1484.1120     34.9678      7.9940
+    102.8250   1484.1150     34.9693      7.9930
+    103.1520   1484.1190     34.9800      7.9890
+    103.5050   1484.1240     34.9701      7.9920
+    103.8410   1484.1280     34.9754      7.9900
+    104.1980   1484.1330     34.9747      7.9900
+    104.5310   1484.1370     34.9762      7.9890
+    104.8430   1484.1390     34.9770      7.9880
+    105.1850   1484.1390     34.9693      7.9890
+    105.5190   1484.1420     34.9701      7.9880
+    105.8720   1484.1450     34.9770      7.9850
+    106.2420   1484.1470     34.9709      7.9860
+    106.6370   1484.1510     34.9777      7.9830
+    107.0530   1484.1550     34.9754      7.9830
+    107.4590   1484.1630     34.9792      7.9820
+    107.8620   1484.1620     34.9701      7.9830
+    108.2660   1484.1620     34.9770      7.9790
+    108.6630   1484.1620     34.9777      7.9770
+    109.0590   1484.1630     34.9731      7.9770
+    109.4640   1484.1650     34.9754      7.9750
+    109.8530   1484.1690     34.9823      7.9720
+    110.2830   1484.1730     34.9770      7.9730
+    110.6780   1484.1760     34.9739      7.9730
+    111.0720   1484.1820     34.9831      7.9700
+    111.4600   1484.1870     34.9815      7.9700
+    111.9120   1484.1920     34.9739      7.9720
+    112.2540   1484.1960     34.9754      7.9710
+    112.5860   1484.2000     34.9861      7.9670
+    112.9350   1484.2040     34.9815      7.9680
+    113.2680   1484.2100     34.9884      7.9660
+    113.5860   1484.2140     34.9869      7.9660
+    113.9340   1484.2190     34.9899      7.9650
+    114.3030   1484.2240     34.9823      7.9670
+    114.6580   1484.2290     34.9762      7.9690
+    115.0110   1484.2290     34.9770      7.9670
+    115.3580   1484.2320     34.9777      7.9660
+    115.7020   1484.2340     34.9777      7.9650
+    116.0440   1484.2400     34.9846      7.9630
+    116.4030   1484.2450     34.9838      7.9630
+    116.7530   1484.2500     34.9770      7.9650
+    117.0920   1484.2500     34.9846      7.9610
+    117.4360   1484.2490     34.9823      7.9600
+    117.7860   1484.2520     34.9800      7.9600
+    118.1260   1484.2560     34.9846      7.9580
+    118.4730   1484.2610     34.9838      7.9580
+    118.8470   1484.2670     34.9838      7.9580
+    119.2090   1484.2710     34.9823      7.9580
+    119.5360   1484.2760     34.9823      7.9580
+    119.9080   1484.2810     34.9869      7.9560
+    120.2590   1484.2870     34.9937      7.9540
+    120.6140   1484.2920     34.9869      7.9560
+    120.9770   1484.2970     34.9922      7.9540
+    121.3450   1484.3020     34.9815      7.9570
+    121.6940   1484.3060     34.9899      7.9540
+    122.0380   1484.3130     34.9815      7.9570
+    122.3950   1484.3170     34.9831      7.9560
+    122.7620   1484.3220     34.9915      7.9530
+    123.1270   1484.3260     34.9899      7.9530
+    123.4660   1484.3300     34.9792      7.9560
+    123.8660   1484.3350     34.9869      7.9530
+    124.1970   1484.3390     34.9884      7.9520
+    124.5850   1484.3440     34.9815      7.9540
+    124.9210   1484.3490     34.9838      7.9530
+    125.2790   1484.3530     34.9854      7.9520
+    125.6070   1484.3530     34.9876      7.9500
+    125.9970   1484.3560     34.9785      7.9520
+    126.3600   1484.3560     34.9854      7.9480
+    126.7030   1484.3600     34.9754      7.9510
+    127.0570   1484.3640     34.9800      7.9490
+    127.4380   1484.3700     34.9854      7.9470
+    127.7840   1484.3750     34.9823      7.9480
+    128.1440   1484.3820     34.9770      7.9500
+    128.5010   1484.3860     34.9907      7.9450
+    128.8440   1484.3900     34.9861      7.9460
+    129.2210   1484.3750     34.9747      7.9440
+    129.5570   1484.3750     34.9709      7.9440
+    129.9360   1484.3780     34.9831      7.9390
+    130.2820   1484.3760     34.9739      7.9400
+    130.6520   1484.3710     34.9739      7.9370
+    131.0040   1484.3730     34.9770      7.9350
+    131.3490   1484.3740     34.9823      7.9320
+    131.7090   1484.3760     34.9762      7.9330
+    132.0560   1484.3760     34.9808      7.9300
+    132.4160   1484.3800     34.9823      7.9290
+    132.7560   1484.3840     34.9899      7.9260
+    133.1380   1484.3890     34.9884      7.9260
+    133.4950   1484.3930     34.9869      7.9260
+    133.8640   1484.3960     34.9907      7.9240
+    134.2190   1484.3960     34.9831      7.9250
+    134.5720   1484.4020     34.9831      7.9250
+    134.9370   1484.4060     34.9876      7.9230
+    135.2750   1484.4070     34.9869      7.9220
+    135.6330   1484.4070     34.9792      7.9230
+    135.9680   1484.4060     34.9800      7.9210
+    136.3420   1484.4040     34.9762      7.9200
+    136.6950   1484.4080     34.9838      7.9170
+    137.0610   1484.4110     34.9785      7.9180
+    137.4500   1484.4050     34.9838      7.9130
+    137.8200   1484.3990     34.9739      7.9130
+    138.1810   1484.3990     34.9785      7.9100
+    138.5250   1484.4050     34.9815      7.9090
+    138.9050   1484.4090     34.9854      7.9070
+    139.2520   1484.4080     34.9770      7.9080
+    139.6070   1484.4120     34.9785      7.9070
+    139.9500   1484.4160     34.9838      7.9050
+    140.2960   1484.4160     34.9937      7.9000
+    140.6720   1484.4230     34.9884      7.9020
+    141.0370   1484.4280     34.9846      7.9030
+    141.3920   1484.4340     34.9815      7.9040
+    141.7480   1484.4370     34.9854      7.9020
+    142.1080   1484.4420     34.9846      7.9020
+    142.4690   1484.4440     34.9815      7.9020
+    142.8180   1484.4340     34.9808      7.8980
+    143.1760   1484.4210     34.9686      7.8970
+    143.5380   1484.4230     34.9716      7.8950
+    143.9030   1484.4220     34.9754      7.8920
+    144.2790   1484.4160     34.9747      7.8890
+    144.6230   1484.4170     34.9800      7.8860
+    144.9690   1484.4220     34.9884      7.8830
+    145.3210   1484.4270     34.9907      7.8820
+    145.6830   1484.4320     34.9930      7.8810
+    146.0240   1484.4380     34.9838      7.8840
+    146.3870   1484.4400     34.9869      7.8820
+    146.7050   1484.4440     34.9922      7.8800
+    147.0150   1484.4450     34.9792      7.8830
+    147.3400   1484.4390     34.9823      7.8790
+    147.7020   1484.4390     34.9869      7.8760
+    148.0550   1484.4420     34.9846      7.8760
+    148.4190   1484.4450     34.9945      7.8720
+    148.8040   1484.4510     34.9907      7.8730
+    149.1400   1484.4530     34.9915      7.8720
+    149.4950   1484.4600     35.0014      7.8690
+    149.8660   1484.4600     34.9960      7.8690
+    150.2260   1484.4630     34.9937      7.8690
+    150.5770   1484.4590     34.9861      7.8690
+    150.9470   1484.4560     34.9815      7.8680
+    151.2980   1484.4550     34.9945      7.8620
+    151.6550   1484.4590     34.9869      7.8640
+    152.0220   1484.4620     34.9930      7.8610
+    152.4130   1484.4660     34.9884      7.8620
+    152.7880   1484.4710     34.9907      7.8610
+    153.1390   1484.4750     34.9953      7.8590
+    153.4910   1484.4780     34.9960      7.8580
+    153.8440   1484.4800     34.9960      7.8570
+    154.2100   1484.4850     34.9976      7.8560
+    154.5650   1484.4800     34.9892      7.8560
+    154.9490   1484.4790     34.9922      7.8530
+    155.2910   1484.4810     34.9922      7.8520
+    155.6470   1484.4890     34.9915      7.8530
+    156.0290   1484.4910     34.9968      7.8500
+    156.3820   1484.4940     34.9976      7.8490
+    156.7560   1484.4970     34.9945      7.8490
+    157.1230   1484.5020     34.9907      7.8500
+    157.4830   1484.5070     34.9960      7.8480
+    157.8390   1484.5090     34.9899      7.8490
+    158.1840   1484.5110     34.9991      7.8450
+    158.5350   1484.5150     34.9945      7.8460
+    158.9170   1484.5170     34.9976      7.8440
+    159.2590   1484.5220     34.9937      7.8450
+    159.6180   1484.5270     34.9960      7.8440
+    159.9830   1484.5300     34.9937      7.8440
+    160.3460   1484.5340     34.9983      7.8420
+    160.7030   1484.5380     34.9937      7.8430
+    161.0600   1484.5410     34.9976      7.8410
+    161.4280   1484.5440     34.9945      7.8410
+    161.7780   1484.5480     34.9991      7.8390
+    162.1150   1484.5450     34.9922      7.8390
+    162.4720   1484.5470     34.9922      7.8380
+    162.8380   1484.5520     34.9945      7.8370
+    163.1870   1484.5570     34.9937      7.8370
+    163.5460   1484.5600     34.9945      7.8360
+    163.9070   1484.5610     34.9907      7.8360
+    164.2790   1484.5660     34.9899      7.8360
+    164.6300   1484.5700     34.9945      7.8340
+    164.9600   1484.5750     34.9968      7.8330
+    165.3370   1484.5820     35.0006      7.8320
+    165.6860   1484.5880     34.9945      7.8340
+    166.0810   1484.5910     34.9976      7.8320
+    166.4360   1484.5930     34.9945      7.8320
+    166.7890   1484.5940     34.9907      7.8320
+    167.1560   1484.5900     34.9922      7.8290
+    167.4890   1484.5900     34.9937      7.8270
+    167.8700   1484.5910     34.9892      7.8270
+    168.2450   1484.5910     34.9968      7.8230
+    168.5800   1484.5900     34.9884      7.8240
+    168.9330   1484.5910     34.9846      7.8240
+    169.3000   1484.5950     34.9915      7.8210
+    169.6440   1484.5940     34.9953      7.8180
+    170.0260   1484.5990     34.9976      7.8170
+    170.3740   1484.6060     34.9983      7.8170
+    170.7210   1484.6100     34.9937      7.8180
+    171.0950   1484.6020     34.9915      7.8150
+    171.4560   1484.6030     34.9907      7.8140
+    171.8250   1484.6070     34.9983      7.8110
+    172.1790   1484.6110     34.9937      7.8120
+    172.5260   1484.6130     34.9998      7.8090
+    172.8890   1484.6170     34.9983      7.8090
+    173.2530   1484.6210     34.9968      7.8090
+    173.5940   1484.6260     34.9930      7.8100
+    173.9500   1484.6310     35.0075      7.8050
+    174.3200   1484.6350     34.9968      7.8080
+    174.6940   1484.6400     35.0075      7.8040
+    175.0650   1484.6450     35.0006      7.8060
+    175.4070   1484.6510     34.9945      7.8080
+    175.7650   1484.6570     34.9983      7.8070
+    176.1510   1484.6630     34.9976      7.8070
+    176.5020   1484.6660     35.0014      7.8050
+    176.8520   1484.6720     34.9922      7.8080
+    177.2170   1484.6760     35.0029      7.8040
+    177.5780   1484.6740     34.9968      7.8040
+    177.9520   1484.6770     34.9937      7.8040
+    178.2960   1484.6700     34.9930      7.8010
+    178.6870   1484.6690     34.9899      7.8000
+    179.0420   1484.6730     34.9945      7.7980
+    179.3910   1484.6760     34.9983      7.7960
+    179.7420   1484.6810     34.9945      7.7970
+    180.1100   1484.6860     35.0060      7.7930
+    180.4500   1484.6900     34.9953      7.7960
+    180.8110   1484.6900     34.9937      7.7950
+    181.1860   1484.6940     34.9953      7.7940
+    181.5600   1484.6960     34.9945      7.7930
+    181.9250   1484.6970     34.9998      7.7900
+    182.2940   1484.6930     34.9915      7.7900
+    182.6710   1484.6820     34.9838      7.7880
+    183.0310   1484.6760     34.9838      7.7850
+    183.3870   1484.6720     34.9876      7.7810
+    183.7550   1484.6720     34.9922      7.7780
+    184.1070   1484.6740     34.9892      7.7780
+    184.4480   1484.6700     34.9960      7.7730
+    184.8230   1484.6670     34.9922      7.7720
+    185.2000   1484.6650     34.9945      7.7690
+    185.5710   1484.6660     34.9899      7.7690
+    185.9330   1484.6660     34.9976      7.7650
+    186.2860   1484.6680     35.0037      7.7620
+    186.6380   1484.6750     35.0014      7.7630
+    186.9900   1484.6790     35.0090      7.7600
+    187.3690   1484.6830     35.0075      7.7600
+    187.7210   1484.6850     35.0014      7.7610
+    188.0850   1484.6890     35.0029      7.7600
+    188.4660   1484.6920     35.0029      7.7590
+    188.8490   1484.6990     35.0067      7.7580
+    189.2000   1484.6990     35.0021      7.7580
+    189.5740   1484.6990     34.9968      7.7580
+    189.9310   1484.6980     34.9915      7.7580
+    190.2910   1484.6980     35.0021      7.7530
+    190.6440   1484.6980     34.9976      7.7530
+    191.0010   1484.7010     34.9915      7.7540
+    191.3760   1484.6990     34.9945      7.7510
+    191.7400   1484.7020     34.9983      7.7490
+    192.0960   1484.7090     34.9960      7.7500
+    192.4480   1484.7160     35.0029      7.7480
+    192.8170   1484.7210     35.0052      7.7470
+    193.1530   1484.7270     34.9991      7.7490
+    193.5500   1484.7310     35.0090      7.7450
+    193.9040   1484.7370     35.0067      7.7460
+    194.2530   1484.7410     35.0052      7.7460
+    194.6100   1484.7470     35.0021      7.7470
+    194.9340   1484.7380     34.9876      7.7480
+    195.3090   1484.7240     34.9831      7.7440
+    195.6850   1484.7090     34.9754      7.7410
+    196.0390   1484.6970     34.9823      7.7340
+    196.4040   1484.6930     34.9838      7.7310
+    196.7630   1484.6780     34.9854      7.7250
+    197.1150   1484.6720     34.9907      7.7200
+    197.4780   1484.6700     34.9876      7.7190
+    197.8160   1484.6690     34.9915      7.7160
+    198.1720   1484.6690     34.9983      7.7120
+    198.5260   1484.6710     34.9922      7.7130
+    198.8710   1484.6720     34.9976      7.7100
+    199.2440   1484.6730     34.9968      7.7090
+    199.5840   1484.6740     35.0021      7.7060
+    199.9660   1484.6750     34.9945      7.7070
+    200.3550   1484.6680     34.9960      7.7030
+    200.6890   1484.6630     34.9968      7.7000
+    201.0760   1484.6590     34.9945      7.6980
+    201.4330   1484.6650     35.0006      7.6960
+    201.7940   1484.6660     34.9998      7.6950
+    202.1550   1484.6680     35.0029      7.6930
+    202.5080   1484.6740     35.0121      7.6900
+    202.8630   1484.6780     35.0044      7.6920
+    203.2270   1484.6860     35.0090      7.6910
+    203.6030   1484.6910     35.0082      7.6910
+    203.9450   1484.7030     35.0159      7.6900
+    204.3250   1484.7100     35.0075      7.6930
+    204.7050   1484.7180     35.0090      7.6930
+    205.0410   1484.7230     34.9991      7.6960
+    205.4220   1484.7250     35.0082      7.6920
+    205.7700   1484.7270     35.0082      7.6910
+    206.1210   1484.7300     35.0090      7.6900
+    206.4760   1484.7370     35.0128      7.6890
+    206.8710   1484.7420     35.0143      7.6880
+    207.2230   1484.7460     35.0067      7.6900
+    207.6070   1484.7520     35.0098      7.6890
+    207.9800   1484.7590     35.0105      7.6890
+    208.3640   1484.7630     35.0082      7.6890
+    208.7160   1484.7650     35.0021      7.6900
+    209.0890   1484.7660     34.9983      7.6900
+    209.4240   1484.7680     34.9983      7.6890
+    209.7880   1484.7690     35.0006      7.6870
+    210.1640   1484.7730     34.9991      7.6870
+    210.5040   1484.7770     35.0037      7.6850
+    210.8950   1484.7820     35.0052      7.6840
+    211.2440   1484.7890     35.0090      7.6830
+    211.6180   1484.7940     35.0143      7.6810
+    211.9650   1484.8010     35.0159      7.6810
+    212.3250   1484.8070     35.0159      7.6810
+    212.6840   1484.8070     35.0075      7.6820
+    213.0520   1484.8110     35.0090      7.6810
+    213.4040   1484.8170     35.0151      7.6790
+    213.7590   1484.8210     35.0105      7.6800
+    214.1290   1484.8270     35.0105      7.6800
+    214.4810   1484.8320     35.0037      7.6820
+    214.8460   1484.8380     35.0128      7.6790
+    215.2200   1484.8410     35.0105      7.6790
+    215.5570   1484.8450     35.0121      7.6780
+    215.9310   1484.8470     35.0090      7.6780
+    216.2770   1484.8490     35.0090      7.6770
+    216.6300   1484.8540     35.0113      7.6760
+    216.9910   1484.8590     35.0075      7.6770
+    217.3370   1484.8650     35.0044      7.6780
+    217.6970   1484.8730     35.0060      7.6780
+    218.0690   1484.8820     35.0143      7.6760
+    218.4360   1484.8900     35.0159      7.6760
+    218.7800   1484.8990     35.0159      7.6770
+    219.1480   1484.9000     35.0082      7.6780
+    219.5210   1484.9010     35.0075      7.6770
+    219.8650   1484.9070     35.0075      7.6770
+    220.2060   1484.9120     34.9976      7.6800
+    220.5710   1484.9180     35.0098      7.6760
+    220.9290   1484.9190     35.0090      7.6750
+    221.3040   1484.9240     35.0113      7.6740
+    221.6400   1484.9260     35.0082      7.6740
+    222.0000   1484.9290     35.0090      7.6730
+    222.3680   1484.9320     35.0037      7.6740
+    222.7240   1484.9280     35.0044      7.6710
+    223.0940   1484.9300     35.0075      7.6690
+    223.4630   1484.9350     35.0006      7.6710
+    223.8180   1484.9350     35.0021      7.6690
+    224.1610   1484.9400     35.0105      7.6660
+    224.5110   1484.9420     35.0075      7.6660
+    224.9090   1484.9390     35.0029      7.6650
+    225.2360   1484.9450     35.0029      7.6650
+    225.5930   1484.9480     35.0037      7.6640
+    225.9950   1484.9530     35.0082      7.6620
+    226.3370   1484.9580     35.0143      7.6600
+    226.7090   1484.9630     34.9976      7.6650
+    227.0640   1484.9570     34.9945      7.6630
+    227.4250   1484.9530     34.9960      7.6600
+    227.8040   1484.9460     34.9915      7.6580
+    228.1470   1484.9420     34.9922      7.6550
+    228.5010   1484.9420     35.0029      7.6500
+    228.8740   1484.9410     34.9976      7.6500
+    229.2190   1484.9420     34.9968      7.6490
+    229.5660   1484.9440     34.9968      7.6480
+    229.9430   1484.9470     35.0060      7.6440
+    230.3120   1484.9530     35.0060      7.6440
+    230.6710   1484.9530     35.0014      7.6440
+    231.0430   1484.9510     35.0006      7.6420
+    231.3880   1484.9480     34.9998      7.6400
+    231.7660   1484.9520     35.0014      7.6390
+    232.1100   1484.9540     35.0044      7.6370
+    232.4720   1484.9550     35.0037      7.6360
+    232.8160   1484.9530     35.0067      7.6330
+    233.1810   1484.9490     35.0014      7.6320
+    233.5590   1484.9510     34.9976      7.6320
+    233.9110   1484.9540     35.0014      7.6300
+    234.2870   1484.9590     34.9976      7.6310
+    234.6230   1484.9650     35.0197      7.6240
+    234.9940   1484.9680     35.0044      7.6280
+    235.3660   1484.9680     35.0060      7.6260
+    235.7250   1484.9680     35.0006      7.6260
+    236.0800   1484.9700     34.9945      7.6270
+    236.4270   1484.9700     34.9991      7.6240
+    236.8190   1484.9730     34.9968      7.6240
+    237.1800   1484.9770     34.9983      7.6230
+    237.5460   1484.9800     34.9983      7.6220
+    237.9060   1484.9850     34.9976      7.6220
+    238.2600   1484.9900     35.0121      7.6170
+    238.6210   1484.9940     35.0105      7.6170
+    238.9990   1484.9990     35.0098      7.6170
+    239.3340   1485.0040     34.9968      7.6210
+    239.7060   1485.0060     35.0060      7.6170
+    240.0790   1485.0120     35.0060      7.6170
+    240.4340   1485.0150     35.0037      7.6170
+    240.7980   1485.0210     35.0098      7.6150
+    241.1630   1485.0250     35.0052      7.6160
+    241.5330   1485.0280     35.0021      7.6160
+    241.8800   1485.0320     34.9945      7.6180
+    242.2480   1485.0360     34.9960      7.6170
+    242.6150   1485.0340     35.0021      7.6130
+    242.9550   1485.0280     34.9930      7.6130
+    243.3320   1485.0260     34.9953      7.6100
+    243.6680   1485.0290     34.9960      7.6090
+    244.0400   1485.0320     34.9998      7.6070
+    244.4140   1485.0360     35.0006      7.6060
+    244.7710   1485.0420     35.0075      7.6040
+    245.1560   1485.0460     35.0113      7.6020
+    245.5020   1485.0530     35.0029      7.6050
+    245.8850   1485.0570     35.0014      7.6050
+    246.2650   1485.0630     35.0044      7.6040
+    246.5990   1485.0680     34.9945      7.6070
+    246.9640   1485.0730     35.0060      7.6030
+    247.3100   1485.0730     34.9983      7.6040
+    247.6640   1485.0770     34.9998      7.6030
+    248.0330   1485.0800     34.9976      7.6030
+    248.3990   1485.0870     34.9953      7.6040
+    248.7730   1485.0900     35.0044      7.6000
+    249.1480   1485.0950     35.0067      7.5990
+    249.5050   1485.1000     35.0060      7.5990
+    249.8650   1485.1050     34.9991      7.6010
+    250.2240   1485.1100     35.0014      7.6000
+    250.5750   1485.1140     34.9998      7.6000
+    250.9170   1485.1170     35.0067      7.5970
+    251.2890   1485.1160     35.0014      7.5970
+    251.6690   1485.1180     34.9945      7.5980
+    252.0440   1485.1230     35.0029      7.5950
+    252.3980   1485.1230     34.9983      7.5950
+    252.7680   1485.1280     34.9968      7.5950
+    253.1350   1485.1320     34.9983      7.5940
+    253.4990   1485.1330     35.0067      7.5900
+    253.8660   1485.1290     34.9922      7.5920
+    254.2290   1485.1320     34.9899      7.5920
+    254.5680   1485.1360     34.9915      7.5910
+    254.9380   1485.1410     35.0121      7.5840
+    255.3040   1485.1460     34.9960      7.5890
+    255.6620   1485.1530     34.9998      7.5880
+    256.0420   1485.1580     34.9991      7.5880
+    256.4250   1485.1650     35.0029      7.5870
+    256.7780   1485.1700     35.0082      7.5850
+    257.1390   1485.1760     35.0082      7.5850
+    257.4830   1485.1820     35.0021      7.5870
+    257.8520   1485.1870     35.0044      7.5860
+    258.2210   1485.1930     35.0014      7.5870
+    258.6040   1485.2000     35.0136      7.5830
+    259.0000   1485.2050     35.0037      7.5860
+    259.3940   1485.2130     35.0105      7.5840
+    259.7600   1485.2170     34.9998      7.5870
+    260.0240   1485.2180     34.9937      7.5880
+    260.1920   1485.2180     35.0006      7.5850
+    260.4040   1485.2190     35.0021      7.5840
+    260.6400   1485.2240     35.0029      7.5840
+    260.8790   1485.2250     35.0006      7.5840
+    261.0860   1485.2270     35.0052      7.5820
+    261.3270   1485.2310     35.0052      7.5820
+    261.5220   1485.2340     35.0082      7.5810
+    261.7430   1485.2370     34.9983      7.5840
+    261.9760   1485.2410     35.0021      7.5830
+    262.2060   1485.2450     35.0052      7.5820
+    262.4340   1485.2450     34.9991      7.5830
+    262.6650   1485.2490     34.9991      7.5830
+    262.8810   1485.2520     34.9953      7.5840
+    263.0770   1485.2530     34.9937      7.5840
+    263.3160   1485.2570     35.0029      7.5810
+    263.5410   1485.2590     34.9922      7.5840
+    263.7720   1485.2620     34.9976      7.5820
+    263.9880   1485.2660     35.0014      7.5810
+    264.1900   1485.2700     34.9922      7.5840
+    264.4210   1485.2730     35.0044      7.5800
+    264.6590   1485.2750     35.0021      7.5800
+    264.9990   1485.2810     35.0029      7.5800
+    265.3050   1485.2850     34.9991      7.5810
+    265.5770   1485.2890     34.9922      7.5830
+    265.8750   1485.2920     34.9937      7.5820
+    266.2130   1485.2970     35.0021      7.5790
+    266.5970   1485.3000     34.9998      7.5790
+    266.9390   1485.3020     35.0029      7.5770
+    267.2770   1485.3030     34.9930      7.5790
+    267.5990   1485.3060     34.9884      7.5800
+    267.9470   1485.3080     34.9945      7.5770
+    268.2550   1485.3130     35.0037      7.5740
+    268.5920   1485.3180     34.9998      7.5750
+    268.9390   1485.3230     35.0021      7.5740
+    269.2670   1485.3290     35.0029      7.5740
+    269.6300   1485.3350     35.0029      7.5740
+    269.9890   1485.3390     34.9983      7.5750
+    270.3180   1485.3460     34.9991      7.5750
+    270.6690   1485.3500     35.0006      7.5740
+    270.9980   1485.3560     34.9953      7.5760
+    271.3270   1485.3630     34.9937      7.5770
+    271.6830   1485.3670     34.9953      7.5760
+    272.0270   1485.3730     35.0044      7.5730
+    272.3550   1485.3780     35.0037      7.5730
+    272.6950   1485.3830     34.9976      7.5750
+    273.0460   1485.3890     34.9945      7.5760
+    273.3810   1485.3930     35.0021      7.5730
+    273.7280   1485.4000     35.0006      7.5740
+    274.0670   1485.4050     34.9968      7.5750
+    274.4140   1485.4100     34.9991      7.5740
+    274.7570   1485.4140     34.9854      7.5780
+    275.1190   1485.4190     34.9937      7.5750
+    275.4530   1485.4230     34.9960      7.5740
+    275.7660   1485.4270     34.9976      7.5730
+    276.1170   1485.4320     34.9976      7.5730
+    276.4210   1485.4370     34.9976      7.5730
+    276.7750   1485.4410     34.9960      7.5730
+    277.1040   1485.4470     34.9960      7.5730
+    277.4320   1485.4490     34.9991      7.5710
+    277.8240   1485.4550     34.9899      7.5740
+    278.1370   1485.4600     35.0021      7.5700
+    278.5080   1485.4640     34.9968      7.5710
+    278.8400   1485.4670     34.9953      7.5710
+    279.1800   1485.4680     34.9884      7.5720
+    279.5040   1485.4720     34.9869      7.5720
+    279.8330   1485.4770     34.9960      7.5690
+    280.1140   1485.4800     34.9976      7.5680
+    280.4500   1485.4780     34.9884      7.5690
+    280.7550   1485.4800     34.9831      7.5700
+    281.0970   1485.4850     34.9884      7.5680
+    281.4120   1485.4890     34.9937      7.5660
+    281.7670   1485.4920     34.9976      7.5640
+    282.0740   1485.4950     34.9869      7.5670
+    282.4360   1485.4980     34.9937      7.5640
+    282.7430   1485.5010     35.0006      7.5610
+    283.0690   1485.5030     34.9953      7.5620
+    283.3580   1485.5050     34.9991      7.5600
+    283.6890   1485.5100     34.9922      7.5620
+    284.0000   1485.5150     34.9922      7.5620
+    284.3160   1485.5170     34.9930      7.5610
+    284.6620   1485.5230     34.9960      7.5600
+    284.9820   1485.5240     34.9960      7.5590
+    285.3070   1485.5270     34.9907      7.5600
+    285.6420   1485.5330     34.9976      7.5580
+    285.9420   1485.5340     34.9907      7.5590
+    286.2640   1485.5380     34.9930      7.5580
+    286.6260   1485.5410     34.9907      7.5580
+    286.9450   1485.5450     34.9953      7.5560
+    287.2840   1485.5490     35.0006      7.5540
+    287.6130   1485.5530     34.9930      7.5560
+    287.9530   1485.5560     34.9937      7.5550
+    288.2820   1485.5620     34.9976      7.5540
+    288.6240   1485.5660     34.9960      7.5540
+    288.9610   1485.5710     34.9991      7.5530
+    289.2850   1485.5760     34.9861      7.5570
+    289.6180   1485.5810     34.9892      7.5560
+    289.9530   1485.5890     35.0029      7.5520
+    290.2950   1485.5930     34.9922      7.5550
+    290.6240   1485.5970     34.9976      7.5530
+    290.9720   1485.6020     34.9968      7.5530
+    291.3040   1485.6060     34.9922      7.5540
+    291.6390   1485.6080     34.9960      7.5520
+    291.9790   1485.6020     34.9808      7.5540
+    292.3100   1485.6050     34.9968      7.5480
+    292.6490   1485.6080     34.9854      7.5510
+    292.9600   1485.6080     34.9907      7.5480
+    293.3210   1485.6110     34.9915      7.5470
+    293.6540   1485.6000     34.9838      7.5450
+    293.9820   1485.5990     34.9823      7.5440
+    294.3090   1485.5940     34.9922      7.5380
+    294.6630   1485.5990     34.9823      7.5410
+    294.9890   1485.6010     34.9945      7.5360
+    295.3120   1485.6040     34.9899      7.5370
+    295.6620   1485.6080     34.9945      7.5350
+    295.9920   1485.6120     34.9899      7.5360
+    296.3180   1485.6170     34.9930      7.5350
+    296.6510   1485.6210     34.9884      7.5360
+    297.0220   1485.6250     34.9930      7.5340
+    297.3340   1485.6280     34.9976      7.5320
+    297.6740   1485.6290     35.0029      7.5290
+    298.0100   1485.6300     34.9930      7.5310
+    298.3570   1485.6330     35.0029      7.5270
+    298.6750   1485.6390     34.9976      7.5290
+    299.0230   1485.6440     34.9937      7.5300
+    299.3260   1485.6460     34.9915      7.5300
+    299.6730   1485.6520     34.9976      7.5280
+    300.0070   1485.6590     34.9991      7.5280
+    300.3500   1485.6650     35.0021      7.5270
+    300.6980   1485.6690     34.9976      7.5280
+    301.0310   1485.6740     34.9937      7.5290
+    301.3470   1485.6810     34.9983      7.5280
+    301.7020   1485.6860     34.9976      7.5280
+    302.0310   1485.6920     35.0044      7.5260
+    302.3680   1485.6990     35.0052      7.5260
+    302.7050   1485.7040     34.9991      7.5280
+    303.0500   1485.7110     34.9937      7.5300
+    303.3690   1485.7160     35.0029      7.5270
+    303.7130   1485.7220     35.0029      7.5270
+    304.0550   1485.7270     34.9930      7.5300
+    304.3930   1485.7310     34.9983      7.5280
+    304.7260   1485.7260     34.9930      7.5270
+    305.0670   1485.7270     34.9861      7.5280
+    305.4130   1485.7290     34.9892      7.5260
+    305.7250   1485.7270     34.9953      7.5220
+    306.0650   1485.7200     34.9823      7.5230
+    306.3840   1485.7150     34.9831      7.5200
+    306.7160   1485.7160     34.9976      7.5140
+    307.0500   1485.7170     34.9884      7.5160
+    307.4000   1485.7200     34.9861      7.5160
+    307.7390   1485.7240     34.9937      7.5130
+    308.0760   1485.7270     34.9884      7.5140
+    308.3810   1485.7300     34.9991      7.5100
+    308.7340   1485.7360     34.9930      7.5120
+    309.0530   1485.7400     34.9983      7.5100
+    309.3860   1485.7450     34.9976      7.5100
+    309.7080   1485.7500     34.9915      7.5120
+    310.0570   1485.7560     34.9945      7.5110
+    310.3790   1485.7600     34.9876      7.5130
+    310.7110   1485.7650     34.9930      7.5110
+    311.0370   1485.7710     34.9907      7.5120
+    311.3680   1485.7760     34.9960      7.5100
+    311.7010   1485.7800     34.9922      7.5110
+    312.0210   1485.7840     34.9937      7.5100
+    312.3600   1485.7920     34.9991      7.5090
+    312.6810   1485.7970     34.9960      7.5100
+    313.0240   1485.8000     34.9876      7.5120
+    313.3670   1485.8050     34.9930      7.5100
+    313.7000   1485.8100     34.9953      7.5090
+    314.0260   1485.8150     34.9892      7.5110
+    314.3760   1485.8220     34.9960      7.5090
+    314.6780   1485.8250     34.9854      7.5120
+    315.0240   1485.8310     34.9915      7.5100
+    315.3590   1485.8340     34.9869      7.5110
+    315.6730   1485.8370     34.9876      7.5100
+    316.0060   1485.8420     34.9937      7.5080
+    316.3330   1485.8480     34.9907      7.5090
+    316.6570   1485.8530     34.9876      7.5100
+    316.9900   1485.8570     35.0044      7.5040
+    317.3150   1485.8640     34.9907      7.5090
+    317.6490   1485.8670     34.9854      7.5100
+    317.9750   1485.8720     34.9915      7.5080
+    318.3200   1485.8590     34.9731      7.5090
+    318.6240   1485.8580     34.9838      7.5040
+    318.9700   1485.8590     34.9800      7.5040
+    319.3110   1485.8620     34.9899      7.5000
+    319.6510   1485.8670     34.9831      7.5020
+    319.9900   1485.8720     34.9922      7.4990
+    320.3080   1485.8780     34.9930      7.4990
+    320.6310   1485.8840     34.9869      7.5010
+    320.9510   1485.8880     34.9953      7.4980
+    321.2840   1485.8980     34.9960      7.4990
+    321.6240   1485.9030     34.9892      7.5010
+    321.9400   1485.9080     34.9922      7.5000
+    322.2440   1485.9120     34.9945      7.4990
+    322.6110   1485.9180     34.9907      7.5000
+    322.9380   1485.9230     34.9846      7.5020
+    323.2820   1485.9360     34.9937      7.5010
+    323.6100   1485.9410     34.9960      7.5000
+    323.9530   1485.9480     35.0029      7.4980
+    324.2850   1485.9550     34.9892      7.5030
+    324.6210   1485.9600     35.0006      7.4990
+    324.9460   1485.9660     34.9953      7.5010
+    325.2690   1485.9720     34.9930      7.5020
+    325.5980   1485.9770     34.9953      7.5010
+    325.9440   1485.9830     34.9922      7.5020
+    326.2630   1485.9870     34.9884      7.5030
+    326.6200   1485.9950     34.9899      7.5030
+    326.9530   1486.0010     34.9968      7.5010
+    327.2770   1486.0100     34.9991      7.5010
+    327.6160   1486.0170     35.0037      7.5000
+    327.9410   1486.0240     35.0021      7.5010
+    328.2690   1486.0310     34.9907      7.5050
+    328.5890   1486.0340     34.9983      7.5020
+    328.9250   1486.0380     34.9907      7.5040
+    329.2610   1486.0430     34.9869      7.5050
+    329.6060   1486.0480     34.9838      7.5060
+    329.9380   1486.0550     34.9937      7.5030
+    330.2680   1486.0600     34.9998      7.5010
+    330.6120   1486.0650     34.9960      7.5020
+    330.9390   1486.0720     34.9945      7.5030
+    331.2600   1486.0740     34.9854      7.5050
+    331.5990   1486.0800     34.9953      7.5020
+    331.9420   1486.0810     34.9884      7.5030
+    332.2720   1486.0870     34.9884      7.5030
+    332.6080   1486.0890     34.9854      7.5030
+    332.9340   1486.0930     34.9907      7.5010
+    333.2700   1486.0990     34.9876      7.5020
+    333.5930   1486.1050     34.9915      7.5010
+    333.9460   1486.1090     34.9930      7.5000
+    334.2750   1486.1150     34.9998      7.4980
+    334.6060   1486.1130     34.9876      7.5000
+    334.9660   1486.1160     34.9915      7.4980
+    335.3000   1486.1190     34.9831      7.5000
+    335.6420   1486.1230     34.9815      7.5000
+    335.9790   1486.1280     34.9907      7.4970
+    336.3150   1486.1270     34.9884      7.4960
+    336.6470   1486.1290     34.9823      7.4970
+    336.9880   1486.1340     34.9785      7.4980
+    337.3250   1486.1380     34.9777      7.4980
+    337.6640   1486.1430     34.9861      7.4950
+    338.0070   1486.1490     34.9922      7.4930
+    338.3310   1486.1530     34.9823      7.4960
+    338.6680   1486.1580     34.9846      7.4950
+    339.0080   1486.1650     34.9800      7.4970
+    339.3530   1486.1690     34.9846      7.4950
+    339.6900   1486.1760     34.9854      7.4950
+    340.0300   1486.1810     34.9884      7.4940
+    340.3650   1486.1860     34.9907      7.4930
+    340.7150   1486.1880     34.9937      7.4910
+    341.0460   1486.1930     34.9869      7.4930
+    341.3820   1486.1970     34.9770      7.4960
+    341.7060   1486.2020     34.9854      7.4930
+    342.0350   1486.2060     34.9876      7.4920
+    342.3790   1486.2120     34.9846      7.4930
+    342.7170   1486.2130     34.9869      7.4910
+    343.0500   1486.2180     34.9899      7.4900
+    343.3890   1486.2240     34.9838      7.4920
+    343.7040   1486.2250     34.9869      7.4900
+    344.0510   1486.2290     34.9823      7.4910
+    344.3830   1486.2310     34.9701      7.4940
+    344.7080   1486.2350     34.9815      7.4900
+    345.0250   1486.2370     34.9907      7.4860
+    345.3700   1486.2380     34.9808      7.4880
+    345.6850   1486.2420     34.9831      7.4870
+    346.0190   1486.2470     34.9854      7.4860
+    346.3480   1486.2520     34.9792      7.4880
+    346.6670   1486.2560     34.9907      7.4840
+    346.9820   1486.2580     34.9815      7.4860
+    347.2920   1486.2600     34.9884      7.4830
+    347.6270   1486.2640     34.9838      7.4840
+    347.9580   1486.2690     34.9808      7.4850
+    348.2770   1486.2700     34.9709      7.4870
+    348.6070   1486.2710     34.9823      7.4820
+    348.9210   1486.2760     34.9823      7.4820
+    349.2580   1486.2810     34.9884      7.4800
+    349.6020   1486.2880     34.9861      7.4810
+    349.9230   1486.2920     34.9884      7.4800
+    350.2600   1486.2990     34.9922      7.4790
+    350.5920   1486.3010     34.9892      7.4790
+    350.9110   1486.3060     34.9892      7.4790
+    351.2230   1486.3100     34.9854      7.4800
+    351.5660   1486.3160     34.9792      7.4820
+    351.8900   1486.3190     34.9838      7.4800
+    352.2260   1486.3230     34.9854      7.4790
+    352.5620   1486.3260     34.9800      7.4800
+    352.9120   1486.3320     34.9831      7.4790
+    353.2330   1486.3330     34.9953      7.4740
+    353.5690   1486.3380     34.9823      7.4780
+    353.8900   1486.3410     34.9808      7.4780
+    354.2170   1486.3440     34.9907      7.4740
+    354.5650   1486.3470     34.9823      7.4760
+    354.8910   1486.3510     34.9876      7.4740
+    355.2120   1486.3530     34.9815      7.4750
+    355.5460   1486.3560     34.9770      7.4760
+    355.9100   1486.3590     34.9777      7.4750
+    356.2770   1486.3640     34.9854      7.4720
+    356.6500   1486.3690     34.9876      7.4710
+    357.0190   1486.3730     34.9800      7.4730
+    357.3480   1486.3780     34.9792      7.4730
+    357.6620   1486.3810     34.9869      7.4700
+    358.0110   1486.3850     34.9792      7.4720
+    358.3220   1486.3900     34.9731      7.4740
+    358.6820   1486.3960     34.9884      7.4690
+    359.0340   1486.4030     34.9831      7.4710
+    359.3600   1486.4070     34.9884      7.4690
+    359.6880   1486.4110     34.9777      7.4720
+    360.0180   1486.4150     34.9861      7.4690
+    360.3560   1486.4210     34.9800      7.4710
+    360.6660   1486.4250     34.9854      7.4690
+    360.9830   1486.4300     34.9823      7.4700
+    361.3290   1486.4340     34.9930      7.4660
+    361.6540   1486.4370     34.9846      7.4680
+    361.9940   1486.4380     34.9777      7.4690
+    362.3100   1486.4430     34.9838      7.4670
+    362.6630   1486.4490     34.9869      7.4660
+    362.9920   1486.4520     34.9792      7.4680
+    363.3100   1486.4580     34.9823      7.4670
+    363.6270   1486.4640     34.9800      7.4680
+    363.9520   1486.4670     34.9846      7.4660
+    364.3040   1486.4730     34.9846      7.4660
+    364.6220   1486.4790     34.9823      7.4670
+    364.9430   1486.4850     34.9792      7.4680
+    365.2960   1486.4880     34.9831      7.4660
+    365.6460   1486.4920     34.9785      7.4670
+    365.9700   1486.4990     34.9831      7.4660
+    366.2870   1486.5010     34.9869      7.4640
+    366.6370   1486.5070     34.9838      7.4650
+    366.9570   1486.5120     34.9861      7.4640
+    367.2890   1486.5170     34.9831      7.4650
+    367.6140   1486.5230     34.9838      7.4650
+    367.9390   1486.5290     34.9777      7.4670
+    368.2760   1486.5340     34.9777      7.4670
+    368.6180   1486.5400     34.9838      7.4650
+    368.9780   1486.5440     34.9823      7.4650
+    369.3020   1486.5500     34.9792      7.4660
+    369.6210   1486.5540     34.9846      7.4640
+    369.9330   1486.5600     34.9823      7.4650
+    370.2400   1486.5650     34.9792      7.4660
+    370.5830   1486.5700     34.9815      7.4650
+    370.8870   1486.5760     34.9823      7.4650
+    371.2020   1486.5790     34.9777      7.4660
+    371.5430   1486.5840     34.9800      7.4650
+    371.8890   1486.5880     34.9846      7.4630
+    372.1810   1486.5930     34.9724      7.4670
+    372.4890   1486.5970     34.9808      7.4640
+    372.7970   1486.6020     34.9777      7.4650
+    373.0940   1486.6060     34.9861      7.4620
+    373.4310   1486.6100     34.9846      7.4620
+    373.7240   1486.6140     34.9808      7.4630
+    374.0480   1486.6180     34.9770      7.4640
+    374.3760   1486.6240     34.9899      7.4600
+    374.6800   1486.6290     34.9831      7.4620
+    375.0010   1486.6320     34.9785      7.4630
+    375.3160   1486.6360     34.9747      7.4640
+    375.6330   1486.6400     34.9762      7.4630
+    375.9380   1486.6440     34.9785      7.4620
+    376.2700   1486.6510     34.9800      7.4620
+    376.5610   1486.6530     34.9808      7.4610
+    376.7970   1486.6590     34.9792      7.4620
+    377.0570   1486.6630     34.9762      7.4630
+    377.3460   1486.6680     34.9792      7.4620
+    377.6090   1486.6720     34.9724      7.4640
+    377.8740   1486.6760     34.9846      7.4600
+    378.1250   1486.6800     34.9785      7.4620
+    378.3830   1486.6840     34.9785      7.4620
+    378.6440   1486.6900     34.9792      7.4620
+    378.9150   1486.6940     34.9762      7.4630
+    379.1840   1486.6990     34.9792      7.4620
+    379.4490   1486.7020     34.9815      7.4610
+    379.7300   1486.7070     34.9846      7.4600
+    380.0020   1486.7110     34.9785      7.4620
+    380.3440   1486.7170     34.9693      7.4650
+    380.6720   1486.7230     34.9823      7.4610
+    380.9960   1486.7280     34.9815      7.4610
+    381.3390   1486.7340     34.9785      7.4620
+    381.6930   1486.7380     34.9770      7.4620
+    381.9970   1486.7440     34.9777      7.4620
+    382.3280   1486.7490     34.9777      7.4620
+    382.6650   1486.7530     34.9823      7.4600
+    382.9940   1486.7560     34.9808      7.4600
+    383.3210   1486.7610     34.9739      7.4620
+    383.6660   1486.7680     34.9808      7.4600
+    383.9960   1486.7700     34.9693      7.4630
+    384.3130   1486.7710     34.9808      7.4580
+    384.6590   1486.7750     34.9800      7.4580
+    385.0060   1486.7800     34.9792      7.4580
+    385.3050   1486.7830     34.9808      7.4570
+    385.6450   1486.7880     34.9648      7.4620
+    385.9940   1486.7930     34.9823      7.4560
+    386.3160   1486.7970     34.9754      7.4580
+    386.6420   1486.8010     34.9770      7.4570
+    386.9850   1486.8050     34.9754      7.4570
+    387.3190   1486.8100     34.9785      7.4560
+    387.6390   1486.8160     34.9762      7.4570
+    387.9700   1486.8210     34.9876      7.4530
+    388.3120   1486.8260     34.9716      7.4580
+    388.6410   1486.8290     34.9762      7.4560
+    388.9840   1486.8330     34.9777      7.4550
+    389.2900   1486.8360     34.9762      7.4550
+    389.6120   1486.8390     34.9800      7.4530
+    389.9630   1486.8380     34.9655      7.4560
+    390.3030   1486.8420     34.9701      7.4540
+    390.6280   1486.8440     34.9709      7.4530
+    390.9470   1486.8450     34.9731      7.4510
+    391.2960   1486.8520     34.9716      7.4520
+    391.6140   1486.8550     34.9754      7.4500
+    391.9430   1486.8630     34.9808      7.4490
+    392.2940   1486.8670     34.9762      7.4500
+    392.6200   1486.8710     34.9686      7.4520
+    392.9570   1486.8790     34.9831      7.4480
+    393.2710   1486.8810     34.9777      7.4490
+    393.6110   1486.8860     34.9800      7.4480
+    393.9470   1486.8900     34.9663      7.4520
+    394.2800   1486.8950     34.9724      7.4500
+    394.5960   1486.9020     34.9762      7.4490
+    394.9300   1486.9040     34.9800      7.4470
+    395.2560   1486.9120     34.9724      7.4500
+    395.5800   1486.9180     34.9792      7.4480
+    395.9270   1486.9240     34.9701      7.4510
+    396.2610   1486.9290     34.9762      7.4490
+    396.6110   1486.9350     34.9792      7.4480
+    396.9240   1486.9390     34.9754      7.4490
+    397.2590   1486.9450     34.9785      7.4480
+    397.5900   1486.9500     34.9724      7.4500
+    397.9210   1486.9570     34.9792      7.4480
+    398.2190   1486.9610     34.9846      7.4460
+    398.5710   1486.9660     34.9655      7.4520
+    398.9100   1486.9740     34.9709      7.4510
+    399.2230   1486.9770     34.9747      7.4490
+    399.5600   1486.9830     34.9815      7.4470
+    399.9130   1486.9870     34.9739      7.4490
+    400.2260   1486.9930     34.9838      7.4460
+    400.5520   1486.9990     34.9747      7.4490
+    400.8610   1487.0050     34.9693      7.4510
+    401.2190   1487.0100     34.9747      7.4490
+    401.5300   1487.0170     34.9884      7.4450
+    401.8500   1487.0230     34.9678      7.4520
+    402.1970   1487.0300     34.9838      7.4470
+    402.5260   1487.0340     34.9670      7.4520
+    402.8540   1487.0400     34.9770      7.4490
+    403.1920   1487.0480     34.9792      7.4490
+    403.5060   1487.0590     34.9808      7.4500
+    403.8290   1487.0660     34.9785      7.4510
+    404.1840   1487.0690     34.9731      7.4520
+    404.5030   1487.0740     34.9701      7.4530
+    404.8280   1487.0780     34.9716      7.4520
+    405.1340   1487.0840     34.9724      7.4520
+    405.4620   1487.0910     34.9739      7.4520
+    405.7780   1487.0970     34.9777      7.4510
+    406.1340   1487.1040     34.9846      7.4490
+    406.4550   1487.1090     34.9724      7.4530
+    406.7600   1487.1140     34.9747      7.4520
+    407.0660   1487.1240     34.9792      7.4520
+    407.3270   1487.1290     34.9762      7.4530
+    407.6050   1487.1350     34.9747      7.4540
+    407.8870   1487.1400     34.9747      7.4540
+    408.1380   1487.1450     34.9785      7.4530
+    408.4450   1487.1490     34.9747      7.4540
+    408.7050   1487.1520     34.9731      7.4540
+    408.9710   1487.1580     34.9808      7.4520
+    409.2600   1487.1640     34.9724      7.4550
+    409.5340   1487.1690     34.9762      7.4540
+    409.7960   1487.1730     34.9724      7.4550
+    410.0850   1487.1780     34.9731      7.4550
+    410.3700   1487.1830     34.9701      7.4560
+    410.6430   1487.1850     34.9678      7.4560
+    410.9090   1487.1900     34.9716      7.4550
+    411.1800   1487.1940     34.9739      7.4540
+    411.4470   1487.1990     34.9747      7.4540
+    411.7240   1487.2050     34.9754      7.4540
+    411.9850   1487.2090     34.9785      7.4530
+    412.2660   1487.2150     34.9731      7.4550
+    412.5350   1487.2210     34.9747      7.4550
+    412.8190   1487.2240     34.9701      7.4560
+    413.0860   1487.2290     34.9770      7.4540
+    413.3550   1487.2340     34.9800      7.4530
+    413.6300   1487.2390     34.9747      7.4550
+    413.9330   1487.2440     34.9808      7.4530
+    414.1990   1487.2480     34.9770      7.4540
+    414.4560   1487.2530     34.9747      7.4550
+    414.7380   1487.2570     34.9831      7.4520
+    415.0200   1487.2610     34.9854      7.4510
+    415.2860   1487.2660     34.9739      7.4550
+    415.5620   1487.2700     34.9762      7.4540
+    415.8180   1487.2740     34.9731      7.4550
+    416.1030   1487.2780     34.9754      7.4540
+    416.3710   1487.2820     34.9785      7.4530
+    416.6510   1487.2860     34.9777      7.4530
+    416.9240   1487.2900     34.9808      7.4520
+    417.1970   1487.2960     34.9846      7.4510
+    417.4830   1487.3010     34.9724      7.4550
+    417.7590   1487.3040     34.9838      7.4510
+    418.0160   1487.3090     34.9716      7.4550
+    418.3140   1487.3140     34.9716      7.4550
+    418.5810   1487.3190     34.9785      7.4530
+    418.8470   1487.3240     34.9854      7.4510
+    419.1180   1487.3280     34.9785      7.4530
+    419.4040   1487.3320     34.9716      7.4550
+    419.6650   1487.3360     34.9747      7.4540
+    419.9630   1487.3400     34.9739      7.4540
+    420.2300   1487.3450     34.9686      7.4560
+    420.4850   1487.3490     34.9709      7.4550
+    420.7740   1487.3540     34.9747      7.4540
+    421.0490   1487.3580     34.9770      7.4530
+    421.3140   1487.3630     34.9808      7.4520
+    421.5930   1487.3670     34.9739      7.4540
+    421.8610   1487.3730     34.9747      7.4540
+    422.1500   1487.3770     34.9747      7.4540
+    422.4520   1487.3810     34.9709      7.4550
+    422.7820   1487.3870     34.9739      7.4540
+    423.1490   1487.3920     34.9762      7.4530
+    423.4500   1487.3970     34.9792      7.4520
+    423.7510   1487.4010     34.9663      7.4560
+    424.0430   1487.4060     34.9693      7.4550
+    424.3530   1487.4100     34.9777      7.4520
+    424.6710   1487.4140     34.9701      7.4540
+    424.9940   1487.4180     34.9693      7.4540
+    425.3040   1487.4230     34.9724      7.4530
+    425.6140   1487.4270     34.9716      7.4530
+    425.9260   1487.4310     34.9701      7.4530
+    426.2400   1487.4340     34.9808      7.4490
+    426.5430   1487.4410     34.9762      7.4510
+    426.8820   1487.4440     34.9739      7.4510
+    427.2120   1487.4500     34.9777      7.4500
+    427.4980   1487.4540     34.9770      7.4500
+    427.8180   1487.4590     34.9648      7.4540
+    428.1610   1487.4630     34.9724      7.4510
+    428.4430   1487.4690     34.9792      7.4490
+    428.7500   1487.4720     34.9716      7.4510
+    429.0510   1487.4780     34.9663      7.4530
+    429.3400   1487.4820     34.9686      7.4520
+    429.6010   1487.4860     34.9655      7.4530
+    429.8920   1487.4910     34.9747      7.4500
+    430.2560   1487.4970     34.9716      7.4510
+    430.5940   1487.5030     34.9777      7.4490
+    430.9490   1487.5080     34.9678      7.4520
+    431.2920   1487.5130     34.9678      7.4520
+    431.6730   1487.5210     34.9686      7.4520
+    432.0120   1487.5240     34.9670      7.4520
+    432.3730   1487.5300     34.9792      7.4480
+    432.7140   1487.5350     34.9724      7.4500
+    433.0540   1487.5400     34.9716      7.4500
+    433.3960   1487.5460     34.9754      7.4490
+    433.7790   1487.5490     34.9693      7.4500
+    434.1120   1487.5550     34.9701      7.4500
+    434.4450   1487.5590     34.9777      7.4470
+    434.7990   1487.5630     34.9701      7.4490
+    435.1340   1487.5670     34.9686      7.4490
+    435.4850   1487.5730     34.9686      7.4490
+    435.8300   1487.5790     34.9724      7.4480
+    436.1750   1487.5850     34.9724      7.4480
+    436.5480   1487.5900     34.9747      7.4470
+    436.8820   1487.5940     34.9792      7.4450
+    437.2250   1487.6010     34.9678      7.4490
+    437.6080   1487.6050     34.9724      7.4470
+    437.9350   1487.6110     34.9670      7.4490
+    438.2660   1487.6150     34.9747      7.4460
+    438.6400   1487.6200     34.9678      7.4480
+    438.9910   1487.6260     34.9739      7.4460
+    439.3260   1487.6320     34.9648      7.4490
+    439.6760   1487.6380     34.9716      7.4470
+    439.9920   1487.6430     34.9739      7.4460
+    440.3370   1487.6480     34.9731      7.4460
+    440.6850   1487.6540     34.9709      7.4470
+    441.0390   1487.6570     34.9655      7.4480
+    441.3830   1487.6620     34.9709      7.4460
+    441.7310   1487.6670     34.9609      7.4490
+    442.0980   1487.6730     34.9762      7.4440
+    442.4410   1487.6770     34.9686      7.4460
+    442.7790   1487.6830     34.9724      7.4450
+    443.1170   1487.6870     34.9648      7.4470
+    443.4740   1487.6920     34.9670      7.4460
+    443.8240   1487.6970     34.9632      7.4470
+    444.1830   1487.7000     34.9670      7.4450
+    444.5310   1487.7060     34.9701      7.4440
+    444.8740   1487.7110     34.9724      7.4430
+    445.2080   1487.7160     34.9632      7.4460
+    445.5390   1487.7230     34.9640      7.4460
+    445.8960   1487.7290     34.9792      7.4410
+    446.2340   1487.7340     34.9701      7.4440
+    446.5850   1487.7380     34.9716      7.4430
+    446.9290   1487.7440     34.9777      7.4410
+    447.2720   1487.7500     34.9686      7.4440
+    447.6110   1487.7550     34.9655      7.4450
+    447.9590   1487.7620     34.9663      7.4450
+    448.3270   1487.7670     34.9686      7.4440
+    448.6470   1487.7720     34.9800      7.4400
+    449.0160   1487.7780     34.9709      7.4430
+    449.3710   1487.7840     34.9678      7.4440
+    449.7080   1487.7900     34.9655      7.4450
+    450.0440   1487.7960     34.9716      7.4430
+    450.3810   1487.8010     34.9686      7.4440
+    450.7380   1487.8070     34.9747      7.4420
+    451.0730   1487.8130     34.9747      7.4420
+    451.3970   1487.8190     34.9693      7.4440
+    451.7360   1487.8240     34.9655      7.4450
+    452.0580   1487.8300     34.9693      7.4440
+    452.4190   1487.8350     34.9747      7.4420
+    452.7620   1487.8390     34.9701      7.4430
+    453.1010   1487.8450     34.9670      7.4440
+    453.4420   1487.8500     34.9670      7.4440
+    453.8020   1487.8560     34.9670      7.4440
+    454.1410   1487.8610     34.9724      7.4420
+    454.4880   1487.8680     34.9670      7.4440
+    454.8450   1487.8740     34.9640      7.4450
+    455.1700   1487.8790     34.9762      7.4410
+    455.5320   1487.8850     34.9670      7.4440
+    455.8790   1487.8910     34.9640      7.4450
+    456.2190   1487.8950     34.9655      7.4440
+    456.5460   1487.8990     34.9648      7.4440
+    456.8990   1487.9040     34.9609      7.4450
+    457.2450   1487.9090     34.9632      7.4440
+    457.5930   1487.9140     34.9655      7.4430
+    457.9210   1487.9200     34.9693      7.4420
+    458.2710   1487.9240     34.9648      7.4430
+    458.6230   1487.9290     34.9640      7.4430
+    458.9550   1487.9330     34.9625      7.4430
+    459.2620   1487.9360     34.9670      7.4410
+    459.5860   1487.9390     34.9564      7.4440
+    459.9210   1487.9430     34.9670      7.4400
+    460.2390   1487.9460     34.9625      7.4410
+    460.5630   1487.9510     34.9648      7.4400
+    460.9070   1487.9540     34.9716      7.4370
+    461.2520   1487.9600     34.9655      7.4390
+    461.5820   1487.9630     34.9609      7.4400
+    461.9180   1487.9670     34.9655      7.4380
+    462.2280   1487.9720     34.9594      7.4400
+    462.5560   1487.9780     34.9724      7.4360
+    462.8850   1487.9820     34.9648      7.4380
+    463.2240   1487.9860     34.9632      7.4380
+    463.5410   1487.9910     34.9693      7.4360
+    463.8560   1487.9950     34.9594      7.4390
+    464.2080   1487.9980     34.9632      7.4370
+    464.5270   1488.0030     34.9655      7.4360
+    464.8660   1488.0070     34.9648      7.4360
+    465.1950   1488.0100     34.9564      7.4380
+    465.5230   1488.0150     34.9655      7.4350
+    465.8520   1488.0180     34.9602      7.4360
+    466.1970   1488.0240     34.9602      7.4360
+    466.5170   1488.0290     34.9571      7.4370
+    466.8420   1488.0340     34.9632      7.4350
+    467.1830   1488.0400     34.9693      7.4330
+    467.5170   1488.0450     34.9625      7.4350
+    467.8390   1488.0490     34.9648      7.4340
+    468.1740   1488.0550     34.9617      7.4350
+    468.4920   1488.0590     34.9609      7.4350
+    468.8440   1488.0640     34.9602      7.4350
+    469.1630   1488.0690     34.9632      7.4340
+    469.4820   1488.0750     34.9731      7.4310
+    469.8140   1488.0790     34.9655      7.4330
+    470.1560   1488.0840     34.9586      7.4350
+    470.4730   1488.0910     34.9632      7.4340
+    470.8170   1488.0970     34.9632      7.4340
+    471.1300   1488.1020     34.9571      7.4360
+    471.4730   1488.1080     34.9663      7.4330
+    471.7710   1488.1130     34.9632      7.4340
+    472.0950   1488.1190     34.9670      7.4330
+    472.4430   1488.1240     34.9602      7.4350
+    472.8040   1488.1290     34.9625      7.4340
+    473.1500   1488.1350     34.9655      7.4330
+    473.4800   1488.1390     34.9648      7.4330
+    473.8060   1488.1470     34.9693      7.4320
+    474.1290   1488.1520     34.9632      7.4340
+    474.4320   1488.1580     34.9609      7.4350
+    474.7530   1488.1610     34.9594      7.4350
+    475.1010   1488.1650     34.9640      7.4330
+    475.4330   1488.1700     34.9602      7.4340
+    475.7480   1488.1750     34.9602      7.4340
+    476.0860   1488.1790     34.9648      7.4320
+    476.3900   1488.1850     34.9655      7.4320
+    476.7440   1488.1890     34.9609      7.4330
+    477.0810   1488.1930     34.9655      7.4310
+    477.4130   1488.1950     34.9602      7.4320
+    477.7200   1488.2000     34.9602      7.4320
+    478.0350   1488.2050     34.9533      7.4340
+    478.3710   1488.2110     34.9632      7.4310
+    478.7190   1488.2150     34.9556      7.4330
+    479.0480   1488.2190     34.9571      7.4320
+    479.3720   1488.2190     34.9533      7.4320
+    479.7010   1488.2210     34.9533      7.4310
+    480.0070   1488.2180     34.9594      7.4270
+    480.3840   1488.2230     34.9609      7.4260
+    480.7820   1488.2270     34.9625      7.4250
+    481.2320   1488.2280     34.9510      7.4270
+    481.6180   1488.2370     34.9686      7.4220
+    481.9810   1488.2390     34.9617      7.4230
+    482.3040   1488.2410     34.9594      7.4230
+    482.6450   1488.2480     34.9571      7.4240
+    482.9980   1488.2530     34.9564      7.4240
+    483.3570   1488.2590     34.9533      7.4250
+    483.6870   1488.2630     34.9648      7.4210
+    484.0430   1488.2690     34.9556      7.4240
+    484.3910   1488.2750     34.9709      7.4190
+    484.7540   1488.2780     34.9625      7.4210
+    485.0870   1488.2830     34.9586      7.4220
+    485.4340   1488.2880     34.9548      7.4230
+    485.7910   1488.2940     34.9579      7.4220
+    486.1190   1488.2970     34.9594      7.4210
+    486.4670   1488.3000     34.9541      7.4220
+    486.8090   1488.3070     34.9609      7.4200
+    487.1690   1488.3120     34.9632      7.4190
+    487.5060   1488.3160     34.9564      7.4210
+    487.8620   1488.3220     34.9533      7.4220
+    488.2230   1488.3260     34.9518      7.4220
+    488.5520   1488.3320     34.9548      7.4210
+    488.9000   1488.3380     34.9609      7.4190
+    489.2650   1488.3430     34.9571      7.4200
+    489.6100   1488.3480     34.9564      7.4200
+    489.9400   1488.3530     34.9594      7.4190
+    490.2880   1488.3600     34.9541      7.4210
+    490.6390   1488.3640     34.9556      7.4200
+    490.9700   1488.3690     34.9678      7.4160
+    491.3210   1488.3750     34.9586      7.4190
+    491.6660   1488.3790     34.9571      7.4190
+    492.0240   1488.3840     34.9655      7.4160
+    492.3450   1488.3890     34.9564      7.4190
+    492.6960   1488.3920     34.9541      7.4190
+    493.0690   1488.3970     34.9586      7.4170
+    493.4050   1488.4020     34.9617      7.4160
+    493.7390   1488.4060     34.9541      7.4180
+    494.0630   1488.4130     34.9586      7.4170
+    494.4370   1488.4110     34.9579      7.4150
+    494.7850   1488.4120     34.9510      7.4160
+    495.1360   1488.4160     34.9464      7.4170
+    495.4850   1488.4210     34.9518      7.4150
+    495.8290   1488.4270     34.9556      7.4140
+    496.1710   1488.4320     34.9548      7.4140
+    496.5210   1488.4380     34.9548      7.4140
+    496.8560   1488.4420     34.9472      7.4160
+    497.2000   1488.4470     34.9503      7.4150
+    497.5660   1488.4530     34.9564      7.4130
+    497.8890   1488.4570     34.9487      7.4150
+    498.2440   1488.4640     34.9556      7.4130
+    498.5840   1488.4680     34.9579      7.4120
+    498.9220   1488.4730     34.9541      7.4130
+    499.2810   1488.4800     34.9579      7.4120
+    499.6270   1488.4850     34.9510      7.4140
+    499.9890   1488.4900     34.9503      7.4140
+    500.2990   1488.4950     34.9472      7.4150
+    500.6620   1488.4990     34.9487      7.4140
+    501.0170   1488.5050     34.9609      7.4100
+    501.3440   1488.5100     34.9510      7.4130
+    501.6950   1488.5160     34.9518      7.4130
+    502.0320   1488.5220     34.9548      7.4120
+    502.3870   1488.5270     34.9480      7.4140
+    502.7300   1488.5310     34.9464      7.4140
+    503.0810   1488.5350     34.9449      7.4140
+    503.4240   1488.5410     34.9487      7.4130
+    503.7600   1488.5460     34.9510      7.4120
+    504.0970   1488.5510     34.9503      7.4120
+    504.4370   1488.5560     34.9442      7.4140
+    504.7980   1488.5630     34.9510      7.4120
+    505.1420   1488.5700     34.9518      7.4120
+    505.4930   1488.5720     34.9457      7.4130
+    505.8340   1488.5780     34.9487      7.4120
+    506.1810   1488.5820     34.9472      7.4120
+    506.5260   1488.5840     34.9503      7.4100
+    506.8700   1488.5880     34.9525      7.4090
+    507.2050   1488.5890     34.9365      7.4130
+    507.5560   1488.5960     34.9373      7.4130
+    507.8850   1488.6020     34.9380      7.4130
+    508.2480   1488.6060     34.9480      7.4090
+    508.5820   1488.6090     34.9495      7.4080
+    508.9260   1488.6140     34.9457      7.4090
+    509.2580   1488.6190     34.9518      7.4070
+    509.6100   1488.6240     34.9419      7.4100
+    509.9480   1488.6310     34.9487      7.4080
+    510.3070   1488.6330     34.9457      7.4080
+    510.6480   1488.6380     34.9510      7.4060
+    510.9820   1488.6420     34.9472      7.4070
+    511.3420   1488.6460     34.9510      7.4050
+    511.6890   1488.6510     34.9541      7.4040
+    512.0210   1488.6570     34.9480      7.4060
+    512.3600   1488.6620     34.9503      7.4050
+    512.7080   1488.6660     34.9457      7.4060
+    513.0340   1488.6700     34.9419      7.4070
+    513.3950   1488.6740     34.9403      7.4070
+    513.7200   1488.6790     34.9487      7.4040
+    514.0950   1488.6840     34.9449      7.4050
+    514.4140   1488.6900     34.9457      7.4050
+    514.7620   1488.6950     34.9480      7.4040
+    515.1360   1488.6990     34.9525      7.4020
+    515.4700   1488.7030     34.9388      7.4060
+    515.8140   1488.7100     34.9518      7.4020
+    516.1490   1488.7140     34.9449      7.4040
+    516.4980   1488.7210     34.9518      7.4020
+    516.8320   1488.7240     34.9434      7.4040
+    517.2070   1488.7290     34.9426      7.4040
+    517.5430   1488.7360     34.9434      7.4040
+    517.8960   1488.7410     34.9464      7.4030
+    518.2200   1488.7460     34.9426      7.4040
+    518.5640   1488.7510     34.9388      7.4050
+    518.9270   1488.7540     34.9396      7.4040
+    519.2610   1488.7580     34.9411      7.4030
+    519.5660   1488.7620     34.9525      7.3990
+    519.9280   1488.7680     34.9464      7.4010
+    520.2820   1488.7730     34.9365      7.4040
+    520.6200   1488.7790     34.9434      7.4020
+    520.9550   1488.7800     34.9457      7.4000
+    521.3110   1488.7820     34.9396      7.4010
+    521.6440   1488.7860     34.9380      7.4010
+    521.9940   1488.7910     34.9464      7.3980
+    522.3340   1488.7950     34.9426      7.3990
+    522.6780   1488.8000     34.9510      7.3960
+    523.0090   1488.8060     34.9358      7.4010
+    523.3730   1488.8100     34.9403      7.3990
+    523.6970   1488.8150     34.9495      7.3960
+    524.0620   1488.8220     34.9503      7.3960
+    524.3980   1488.8270     34.9434      7.3980
+    524.7520   1488.8330     34.9434      7.3980
+    525.1040   1488.8390     34.9434      7.3980
+    525.4190   1488.8440     34.9495      7.3960
+    525.7430   1488.8480     34.9365      7.4000
+    526.0730   1488.8510     34.9342      7.4000
+    526.3920   1488.8560     34.9464      7.3960
+    526.7190   1488.8600     34.9327      7.4000
+    527.0560   1488.8670     34.9403      7.3980
+    527.4070   1488.8720     34.9426      7.3970
+    527.7250   1488.8760     34.9442      7.3960
+    528.0250   1488.8830     34.9365      7.3990
+    528.3700   1488.8870     34.9266      7.4020
+    528.6940   1488.8930     34.9480      7.3950
+    529.0130   1488.8960     34.9403      7.3970
+    529.3600   1488.9010     34.9426      7.3960
+    529.6750   1488.9060     34.9426      7.3960
+    530.0240   1488.9100     34.9442      7.3950
+    530.3290   1488.9170     34.9396      7.3970
+    530.6640   1488.9220     34.9297      7.4000
+    531.0270   1488.9250     34.9457      7.3940
+    531.3350   1488.9300     34.9457      7.3940
+    531.6750   1488.9350     34.9419      7.3950
+    532.0000   1488.9400     34.9297      7.3990
+    532.3330   1488.9390     34.9365      7.3950
+    532.6510   1488.9400     34.9365      7.3940
+    532.9890   1488.9440     34.9411      7.3920
+    533.3120   1488.9490     34.9403      7.3920
+    533.6150   1488.9540     34.9373      7.3930
+    533.9650   1488.9550     34.9396      7.3910
+    534.3020   1488.9500     34.9251      7.3930
+    534.5970   1488.9560     34.9411      7.3880
+    534.9630   1488.9590     34.9327      7.3900
+    535.2760   1488.9620     34.9403      7.3870
+    535.6050   1488.9640     34.9312      7.3890
+    535.9140   1488.9690     34.9403      7.3860
+    536.2540   1488.9710     34.9312      7.3880
+    536.5850   1488.9740     34.9419      7.3840
+    536.9160   1488.9770     34.9335      7.3860
+    537.2490   1488.9830     34.9335      7.3860
+    537.5940   1488.9870     34.9419      7.3830
+    537.9220   1488.9890     34.9419      7.3820
+    538.2420   1488.9930     34.9411      7.3820
+    538.5650   1488.9980     34.9342      7.3840
+    538.8930   1489.0030     34.9342      7.3840
+    539.2300   1489.0080     34.9335      7.3840
+    539.5400   1489.0140     34.9373      7.3830
+    539.8650   1489.0190     34.9426      7.3810
+    540.2010   1489.0210     34.9373      7.3820
+    540.5610   1489.0270     34.9342      7.3830
+    540.8590   1489.0320     34.9342      7.3830
+    541.1770   1489.0370     34.9396      7.3810
+    541.5040   1489.0430     34.9373      7.3820
+    541.8020   1489.0470     34.9365      7.3820
+    542.1210   1489.0490     34.9335      7.3820
+    542.4380   1489.0530     34.9327      7.3820
+    542.7870   1489.0570     34.9281      7.3830
+    543.1230   1489.0630     34.9289      7.3830
+    543.4330   1489.0680     34.9350      7.3810
+    543.7510   1489.0720     34.9365      7.3800
+    544.0800   1489.0780     34.9373      7.3800
+    544.3720   1489.0840     34.9350      7.3810
+    544.7060   1489.0880     34.9396      7.3790
+    545.0470   1489.0940     34.9373      7.3800
+    545.3730   1489.0970     34.9319      7.3810
+    545.6880   1489.1030     34.9297      7.3820
+    546.0060   1489.1070     34.9373      7.3790
+    546.3310   1489.1120     34.9434      7.3770
+    546.6410   1489.1180     34.9289      7.3820
+    546.9700   1489.1230     34.9342      7.3800
+    547.2810   1489.1270     34.9365      7.3790
+    547.5890   1489.1310     34.9388      7.3780
+    547.8580   1489.1350     34.9258      7.3820
+    548.1760   1489.1400     34.9197      7.3840
+    548.4640   1489.1450     34.9350      7.3790
+    548.7750   1489.1510     34.9358      7.3790
+    549.0820   1489.1540     34.9312      7.3800
+    549.3780   1489.1610     34.9388      7.3780
+    549.6560   1489.1650     34.9380      7.3780
+    549.9600   1489.1700     34.9289      7.3810
+    550.2340   1489.1750     34.9327      7.3800
+    550.5450   1489.1800     34.9358      7.3790
+    550.8450   1489.1850     34.9327      7.3800
+    551.1290   1489.1900     34.9358      7.3790
+    551.4280   1489.1950     34.9327      7.3800
+    551.7060   1489.2000     34.9358      7.3790
+    552.0150   1489.2040     34.9350      7.3790
+    552.3030   1489.2100     34.9327      7.3800
+    552.5970   1489.2140     34.9350      7.3790
+    552.8920   1489.2180     34.9373      7.3780
+    553.2030   1489.2230     34.9312      7.3800
+    553.5170   1489.2270     34.9304      7.3800
+    553.8510   1489.2330     34.9365      7.3780
+    554.1530   1489.2380     34.9335      7.3790
+    554.4670   1489.2450     34.9350      7.3790
+    554.7910   1489.2490     34.9281      7.3810
+    555.1210   1489.2560     34.9289      7.3810
+    555.4340   1489.2620     34.9327      7.3800
+    555.7640   1489.2680     34.9365      7.3790
+    556.1560   1489.2730     34.9319      7.3800
+    556.4930   1489.2790     34.9289      7.3810
+    556.7910   1489.2850     34.9274      7.3820
+    557.1020   1489.2890     34.9289      7.3810
+    557.4280   1489.2960     34.9396      7.3780
+    557.7750   1489.3000     34.9289      7.3810
+    558.0780   1489.3050     34.9289      7.3810
+    558.3840   1489.3100     34.9319      7.3800
+    558.7270   1489.3150     34.9312      7.3800
+    559.0460   1489.3190     34.9213      7.3830
+    559.3920   1489.3230     34.9319      7.3790
+    559.7070   1489.3290     34.9327      7.3790
+    560.0500   1489.3320     34.9335      7.3780
+    560.3730   1489.3370     34.9358      7.3770
+    560.6880   1489.3420     34.9266      7.3800
+    561.0020   1489.3470     34.9297      7.3790
+    561.3310   1489.3520     34.9319      7.3780
+    561.6410   1489.3570     34.9289      7.3790
+    561.9460   1489.3620     34.9289      7.3790
+    562.2700   1489.3670     34.9350      7.3770
+    562.6040   1489.3730     34.9289      7.3790
+    562.9330   1489.3770     34.9342      7.3770
+    563.2510   1489.3820     34.9335      7.3770
+    563.5630   1489.3880     34.9312      7.3780
+    563.8820   1489.3910     34.9297      7.3780
+    564.1950   1489.3960     34.9380      7.3750
+    564.5140   1489.4020     34.9327      7.3770
+    564.8520   1489.4010     34.9213      7.3790
+    565.1640   1489.4050     34.9236      7.3780
+    565.5270   1489.4090     34.9281      7.3760
+    565.8680   1489.4140     34.9274      7.3760
+    566.2190   1489.4190     34.9266      7.3760
+    566.5380   1489.4250     34.9243      7.3770
+    566.8550   1489.4310     34.9342      7.3740
+    567.1660   1489.4360     34.9213      7.3780
+    567.4920   1489.4410     34.9274      7.3760
+    567.8150   1489.4470     34.9281      7.3760
+    568.1550   1489.4540     34.9228      7.3780
+    568.4740   1489.4600     34.9266      7.3770
+    568.7950   1489.4620     34.9297      7.3750
+    569.1350   1489.4680     34.9274      7.3760
+    569.4520   1489.4730     34.9297      7.3750
+    569.7790   1489.4760     34.9251      7.3760
+    570.1250   1489.4810     34.9182      7.3780
+    570.4300   1489.4870     34.9251      7.3760
+    570.7530   1489.4900     34.9258      7.3750
+    571.0690   1489.4960     34.9266      7.3750
+    571.4030   1489.5010     34.9205      7.3770
+    571.7120   1489.5050     34.9251      7.3750
+    572.0500   1489.5110     34.9319      7.3730
+    572.3750   1489.5160     34.9251      7.3750
+    572.7080   1489.5190     34.9236      7.3750
+    573.0260   1489.5250     34.9266      7.3740
+    573.3540   1489.5300     34.9327      7.3720
+    573.6780   1489.5360     34.9213      7.3760
+    573.9890   1489.5410     34.9236      7.3750
+    574.3030   1489.5450     34.9289      7.3730
+    574.6380   1489.5480     34.9297      7.3720
+    574.9620   1489.5550     34.9281      7.3730
+    575.3070   1489.5580     34.9289      7.3720
+    575.6300   1489.5640     34.9266      7.3730
+    575.9520   1489.5680     34.9251      7.3730
+    576.2640   1489.5730     34.9312      7.3710
+    576.6030   1489.5780     34.9182      7.3750
+    576.8980   1489.5840     34.9289      7.3720
+    577.2480   1489.5880     34.9243      7.3730
+    577.5750   1489.5900     34.9243      7.3720
+    577.8980   1489.5960     34.9220      7.3730
+    578.2120   1489.5990     34.9258      7.3710
+    578.5450   1489.6030     34.9159      7.3740
+    578.8640   1489.6070     34.9205      7.3720
+    579.1900   1489.6130     34.9213      7.3720
+    579.5240   1489.6190     34.9274      7.3700
+    579.8430   1489.6240     34.9274      7.3700
+    580.1520   1489.6290     34.9365      7.3670
+    580.4930   1489.6320     34.9281      7.3690
+    580.8250   1489.6380     34.9258      7.3700
+    581.1470   1489.6420     34.9243      7.3700
+    581.4720   1489.6470     34.9213      7.3710
+    581.7920   1489.6520     34.9236      7.3700
+    582.1340   1489.6570     34.9236      7.3700
+    582.4540   1489.6610     34.9251      7.3690
+    582.7720   1489.6650     34.9304      7.3670
+    583.0930   1489.6680     34.9220      7.3690
+    583.4260   1489.6730     34.9190      7.3700
+    583.7490   1489.6790     34.9190      7.3700
+    584.0740   1489.6830     34.9152      7.3710
+    584.3990   1489.6870     34.9258      7.3670
+    584.7230   1489.6930     34.9205      7.3690
+    585.0370   1489.7000     34.9342      7.3650
+    585.3660   1489.7050     34.9213      7.3690
+    585.6890   1489.7110     34.9312      7.3660
+    586.0110   1489.7180     34.9327      7.3660
+    586.3230   1489.7200     34.9236      7.3680
+    586.6340   1489.7250     34.9205      7.3690
+    586.9850   1489.7310     34.9297      7.3660
+    587.3200   1489.7350     34.9136      7.3710
+    587.6330   1489.7380     34.9205      7.3680
+    587.9680   1489.7440     34.9274      7.3660
+    588.2790   1489.7520     34.9205      7.3690
+    588.6090   1489.7580     34.9266      7.3670
+    588.9320   1489.7630     34.9205      7.3690
+    589.2440   1489.7680     34.9236      7.3680
+    589.5920   1489.7730     34.9167      7.3700
+    589.9070   1489.7790     34.9266      7.3670
+    590.2450   1489.7840     34.9197      7.3690
+    590.5760   1489.7900     34.9258      7.3670
+    590.8920   1489.7950     34.9228      7.3680
+    591.2060   1489.7990     34.9190      7.3690
+    591.5650   1489.8050     34.9190      7.3690
+    591.8820   1489.8100     34.9251      7.3670
+    592.2040   1489.8160     34.9220      7.3680
+    592.5370   1489.8210     34.9251      7.3670
+    592.8690   1489.8260     34.9121      7.3710
+    593.2180   1489.8330     34.9159      7.3700
+    593.5320   1489.8370     34.9213      7.3680
+    593.8430   1489.8430     34.9190      7.3690
+    594.2010   1489.8510     34.9205      7.3690
+    594.5400   1489.8560     34.9197      7.3690
+    594.8550   1489.8620     34.9236      7.3680
+    595.2110   1489.8680     34.9266      7.3670
+    595.5280   1489.8740     34.9213      7.3690
+    595.8640   1489.8800     34.9213      7.3690
+    596.2280   1489.8850     34.9205      7.3690
+    596.5930   1489.8900     34.9258      7.3670
+    596.9070   1489.8940     34.9159      7.3700
+    597.2960   1489.8990     34.9174      7.3690
+    597.6120   1489.9040     34.9113      7.3710
+    597.9470   1489.9090     34.9167      7.3690
+    598.3030   1489.9170     34.9243      7.3670
+    598.6620   1489.9200     34.9220      7.3670
+    599.0100   1489.9230     34.9167      7.3680
+    599.3460   1489.9280     34.9258      7.3650
+    599.6860   1489.9320     34.9182      7.3670
+    600.0450   1489.9390     34.9190      7.3670
+    600.3990   1489.9440     34.9091      7.3700
+    600.7440   1489.9510     34.9251      7.3650
+    601.1090   1489.9550     34.9236      7.3650
+    601.4550   1489.9590     34.9159      7.3670
+    601.8070   1489.9650     34.9220      7.3650
+    602.1390   1489.9700     34.9220      7.3650
+    602.4830   1489.9750     34.9121      7.3680
+    602.8190   1489.9790     34.9075      7.3690
+    603.1840   1489.9850     34.9228      7.3640
+    603.5310   1489.9920     34.9213      7.3650
+    603.8640   1489.9980     34.9152      7.3670
+    604.2330   1490.0060     34.9075      7.3700
+    604.5810   1490.0120     34.9228      7.3650
+    604.9170   1490.0180     34.9113      7.3690
+    605.2530   1490.0240     34.9266      7.3640
+    605.6190   1490.0310     34.9243      7.3650
+    605.9690   1490.0370     34.9243      7.3650
+    606.3240   1490.0420     34.9174      7.3670
+    606.6380   1490.0450     34.9190      7.3660
+    607.0220   1490.0470     34.9152      7.3660
+    607.3520   1490.0520     34.9121      7.3670
+    607.7060   1490.0570     34.9236      7.3630
+    608.0510   1490.0630     34.9174      7.3650
+    608.3980   1490.0680     34.9167      7.3650
+    608.7280   1490.0730     34.9136      7.3660
+    609.0690   1490.0790     34.9228      7.3630
+    609.4400   1490.0830     34.9121      7.3660
+    609.7720   1490.0880     34.9236      7.3620
+    610.1090   1490.0930     34.9014      7.3690
+    610.4630   1490.0990     34.9205      7.3630
+    610.8230   1490.1050     34.9205      7.3630
+    611.1690   1490.1100     34.9167      7.3640
+    611.5220   1490.1150     34.9098      7.3660
+    611.8620   1490.1200     34.9182      7.3630
+    612.2140   1490.1270     34.9190      7.3630
+    612.5850   1490.1320     34.9091      7.3660
+    612.9000   1490.1370     34.9121      7.3650
+    613.2450   1490.1410     34.9167      7.3630
+    613.5850   1490.1480     34.9144      7.3640
+    613.9470   1490.1540     34.9174      7.3630
+    614.2990   1490.1600     34.9174      7.3630
+    614.6390   1490.1660     34.9213      7.3620
+    614.9870   1490.1720     34.9182      7.3630
+    615.3340   1490.1780     34.9152      7.3640
+    615.6850   1490.1850     34.9159      7.3640
+    616.0260   1490.1890     34.9213      7.3620
+    616.3840   1490.1950     34.9213      7.3620
+    616.7250   1490.1990     34.9136      7.3640
+    617.0560   1490.2050     34.9197      7.3620
+    617.4100   1490.2090     34.9121      7.3640
+    617.7420   1490.2150     34.9098      7.3650
+    618.1320   1490.2210     34.9121      7.3640
+    618.4670   1490.2260     34.9152      7.3630
+    618.8200   1490.2320     34.9121      7.3640
+    619.1640   1490.2360     34.9136      7.3630
+    619.5010   1490.2410     34.9129      7.3630
+    619.8580   1490.2460     34.9091      7.3640
+    620.2050   1490.2520     34.9030      7.3660
+    620.5540   1490.2580     34.9068      7.3650
+    620.8790   1490.2640     34.9068      7.3650
+    621.2330   1490.2700     34.9190      7.3610
+    621.5900   1490.2760     34.9129      7.3630
+    621.9320   1490.2790     34.9083      7.3640
+    622.2810   1490.2850     34.9174      7.3610
+    622.6100   1490.2890     34.9068      7.3640
+    622.9600   1490.2950     34.9129      7.3620
+    623.3370   1490.3010     34.9068      7.3640
+    623.6700   1490.3080     34.9113      7.3630
+    624.0030   1490.3120     34.9159      7.3610
+    624.3470   1490.3160     34.9144      7.3610
+    624.6950   1490.3230     34.9182      7.3600
+    625.0440   1490.3290     34.9129      7.3620
+    625.3880   1490.3350     34.9098      7.3630
+    625.7200   1490.3390     34.9083      7.3630
+    626.0730   1490.3460     34.9182      7.3600
+    626.4340   1490.3470     34.9052      7.3630
+    626.7700   1490.3530     34.9152      7.3600
+    627.1280   1490.3580     34.9075      7.3620
+    627.4530   1490.3620     34.9129      7.3600
+    627.8060   1490.3670     34.9152      7.3590
+    628.1670   1490.3700     34.9068      7.3610
+    628.5150   1490.3780     34.9113      7.3600
+    628.8400   1490.3810     34.9098      7.3600
+    629.1970   1490.3840     34.9075      7.3600
+    629.5490   1490.3900     34.9075      7.3600
+    629.8930   1490.3960     34.9106      7.3590
+    630.2350   1490.4000     34.9091      7.3590
+    630.6000   1490.4070     34.9068      7.3600
+    630.9330   1490.4120     34.9098      7.3590
+    631.2890   1490.4180     34.9098      7.3590
+    631.6500   1490.4250     34.9106      7.3590
+    631.9900   1490.4300     34.9159      7.3570
+    632.3300   1490.4360     34.9159      7.3570
+    632.6800   1490.4410     34.9152      7.3570
+    633.0160   1490.4470     34.9098      7.3590
+    633.3470   1490.4510     34.9083      7.3590
+    633.6990   1490.4570     34.9113      7.3580
+    634.0500   1490.4600     34.9121      7.3570
+    634.3870   1490.4650     34.9060      7.3590
+    634.7520   1490.4700     34.9144      7.3560
+    635.0830   1490.4760     34.9083      7.3580
+    635.4420   1490.4810     34.9136      7.3560
+    635.7850   1490.4830     34.9014      7.3590
+    636.1270   1490.4870     34.9091      7.3560
+    636.4780   1490.4930     34.9060      7.3570
+    636.8230   1490.4980     34.9060      7.3570
+    637.1560   1490.5020     34.9045      7.3570
+    637.4950   1490.5070     34.9068      7.3560
+    637.8440   1490.5140     34.9113      7.3550
+    638.1790   1490.5180     34.9129      7.3540
+    638.5390   1490.5230     34.8999      7.3580
+    638.8800   1490.5280     34.9052      7.3560
+    639.2330   1490.5350     34.9091      7.3550
+    639.5580   1490.5390     34.9083      7.3550
+    639.9110   1490.5440     34.9045      7.3560
+    640.2510   1490.5490     34.9129      7.3530
+    640.5960   1490.5550     34.9136      7.3530
+    640.9260   1490.5600     34.9037      7.3560
+    641.2810   1490.5650     34.9030      7.3560
+    641.6530   1490.5710     34.9091      7.3540
+    641.9770   1490.5770     34.9030      7.3560
+    642.3150   1490.5820     34.9091      7.3540
+    642.6730   1490.5860     34.9045      7.3550
+    643.0080   1490.5910     34.9098      7.3530
+    643.3630   1490.5950     34.9052      7.3540
+    643.6990   1490.6010     34.9083      7.3530
+    644.0540   1490.6070     34.9022      7.3550
+    644.4030   1490.6120     34.9022      7.3550
+    644.7430   1490.6170     34.9045      7.3540
+    645.0890   1490.6220     34.9068      7.3530
+    645.4460   1490.6260     34.9022      7.3540
+    645.7960   1490.6310     34.9045      7.3530
+    646.1400   1490.6360     34.9068      7.3520
+    646.5110   1490.6400     34.8930      7.3560
+    646.8580   1490.6450     34.9136      7.3490
+    647.2100   1490.6520     34.9091      7.3510
+    647.5740   1490.6560     34.8976      7.3540
+    647.9360   1490.6620     34.9037      7.3520
+    648.2980   1490.6670     34.9091      7.3500
+    648.6840   1490.6720     34.9174      7.3470
+    649.0350   1490.6780     34.8991      7.3530
+    649.3500   1490.6820     34.8976      7.3530
+    649.6960   1490.6880     34.9014      7.3520
+    650.0290   1490.6910     34.9052      7.3500
+    650.3840   1490.6970     34.9022      7.3510
+    650.7120   1490.7000     34.9037      7.3500
+    651.0600   1490.7050     34.8969      7.3520
+    651.3830   1490.7090     34.9014      7.3500
+    651.7150   1490.7140     34.9014      7.3500
+    652.0630   1490.7170     34.8991      7.3500
+    652.3650   1490.7230     34.9030      7.3490
+    652.7180   1490.7260     34.9068      7.3470
+    653.0580   1490.7300     34.8961      7.3500
+    653.4170   1490.7340     34.8976      7.3490
+    653.7320   1490.7380     34.9030      7.3470
+    654.0750   1490.7440     34.9060      7.3460
+    654.4150   1490.7510     34.8946      7.3500
+    654.7550   1490.7570     34.9045      7.3470
+    655.1050   1490.7620     34.8976      7.3490
+    655.4560   1490.7660     34.8991      7.3480
+    655.7930   1490.7700     34.8976      7.3480
+    656.1170   1490.7780     34.9030      7.3470
+    656.4670   1490.7820     34.9014      7.3470
+    656.7830   1490.7860     34.9030      7.3460
+    657.1220   1490.7870     34.8877      7.3500
+    657.4880   1490.7920     34.9014      7.3450
+    657.8260   1490.7960     34.9037      7.3440
+    658.1580   1490.8020     34.9007      7.3450
+    658.5030   1490.8070     34.8969      7.3460
+    658.8430   1490.8110     34.8930      7.3470
+    659.1840   1490.8160     34.8953      7.3460
+    659.5430   1490.8230     34.9052      7.3430
+    659.8740   1490.8280     34.8923      7.3470
+    660.2310   1490.8330     34.8976      7.3450
+    660.5690   1490.8380     34.8946      7.3460
+    660.9060   1490.8450     34.8984      7.3450
+    661.2560   1490.8510     34.9045      7.3430
+    661.6010   1490.8560     34.9045      7.3430
+    661.9380   1490.8610     34.9007      7.3440
+    662.2630   1490.8680     34.8991      7.3450
+    662.6060   1490.8730     34.8984      7.3450
+    662.9680   1490.8780     34.9068      7.3420
+    663.3010   1490.8840     34.9007      7.3440
+    663.6510   1490.8890     34.8999      7.3440
+    663.9850   1490.8940     34.8999      7.3440
+    664.3520   1490.9000     34.8999      7.3440
+    664.6830   1490.9070     34.9037      7.3430
+    665.0260   1490.9120     34.8999      7.3440
+    665.3580   1490.9170     34.8999      7.3440
+    665.7060   1490.9220     34.9052      7.3420
+    666.0600   1490.9260     34.8946      7.3450
+    666.3970   1490.9330     34.8953      7.3450
+    666.7340   1490.9360     34.8969      7.3440
+    667.0960   1490.9400     34.8976      7.3430
+    667.4390   1490.9450     34.8976      7.3430
+    667.7900   1490.9490     34.9022      7.3410
+    668.1210   1490.9550     34.8930      7.3440
+    668.4730   1490.9590     34.8976      7.3420
+    668.8060   1490.9640     34.9037      7.3400
+    669.1400   1490.9700     34.8976      7.3420
+    669.4780   1490.9760     34.8854      7.3460
+    669.8320   1490.9820     34.9014      7.3410
+    670.1750   1490.9880     34.8953      7.3430
+    670.5450   1490.9930     34.8976      7.3420
+    670.8910   1490.9970     34.8961      7.3420
+    671.2610   1491.0000     34.8938      7.3420
+    671.6320   1491.0060     34.8900      7.3430
+    672.0070   1491.0120     34.9052      7.3380
+    672.3610   1491.0190     34.8969      7.3410
+    672.7070   1491.0250     34.8969      7.3410
+    673.0490   1491.0310     34.9007      7.3400
+    673.4210   1491.0390     34.8961      7.3420
+    673.7870   1491.0440     34.8976      7.3410
+    674.1140   1491.0490     34.8976      7.3410
+    674.4910   1491.0500     34.8869      7.3430
+    674.8360   1491.0560     34.8999      7.3390
+    675.2010   1491.0610     34.8953      7.3400
+    675.5630   1491.0660     34.8976      7.3390
+    675.9180   1491.0710     34.9030      7.3370
+    676.2900   1491.0770     34.8907      7.3410
+    676.6280   1491.0810     34.8984      7.3380
+    676.9790   1491.0870     34.8869      7.3420
+    677.3300   1491.0940     34.8969      7.3390
+    677.7120   1491.0990     34.8923      7.3400
+    678.0490   1491.1060     34.8938      7.3400
+    678.3810   1491.1120     34.8999      7.3380
+    678.7330   1491.1170     34.8961      7.3390
+    679.0820   1491.1240     34.9068      7.3360
+    679.4230   1491.1290     34.8969      7.3390
+    679.7960   1491.1350     34.8877      7.3420
+    680.1360   1491.1370     34.8907      7.3400
+    680.4730   1491.1450     34.8892      7.3410
+    680.8360   1491.1500     34.8976      7.3380
+    681.1750   1491.1570     34.8892      7.3410
+    681.5060   1491.1610     34.8976      7.3380
+    681.8270   1491.1670     34.8953      7.3390
+    682.1820   1491.1740     34.8900      7.3410
+    682.5130   1491.1790     34.8923      7.3400
+    682.8390   1491.1850     34.8991      7.3380
+    683.1940   1491.1900     34.9014      7.3370
+    683.5280   1491.1960     34.8892      7.3410
+    683.8450   1491.2000     34.9068      7.3350
+    684.1900   1491.2060     34.8946      7.3390
+    684.4970   1491.2120     34.8892      7.3410
+    684.8450   1491.2180     34.8953      7.3390
+    685.1760   1491.2220     34.8915      7.3400
+    685.5280   1491.2270     34.8969      7.3380
+    685.8380   1491.2340     34.9014      7.3370
+    686.1970   1491.2380     34.8969      7.3380
+    686.5310   1491.2450     34.8915      7.3400
+    686.8640   1491.2500     34.8999      7.3370
+    687.2090   1491.2550     34.8999      7.3370
+    687.5250   1491.2620     34.8915      7.3400
+    687.8590   1491.2670     34.8976      7.3380
+    688.2020   1491.2730     34.8946      7.3390
+    688.5240   1491.2780     34.8915      7.3400
+    688.8580   1491.2840     34.8885      7.3410
+    689.2130   1491.2900     34.8946      7.3390
+    689.5370   1491.2970     34.8869      7.3420
+    689.8720   1491.3020     34.8831      7.3430
+    690.2040   1491.3090     34.8969      7.3390
+    690.5300   1491.3150     34.8938      7.3400
+    690.8960   1491.3210     34.8938      7.3400
+    691.2050   1491.3270     34.8915      7.3410
+    691.5650   1491.3340     34.8892      7.3420
+    691.8930   1491.3400     34.8961      7.3400
+    692.2330   1491.3470     34.8877      7.3430
+    692.5700   1491.3490     34.8816      7.3440
+    692.9080   1491.3580     34.8907      7.3420
+    693.2500   1491.3620     34.8831      7.3440
+    693.5770   1491.3680     34.8892      7.3420
+    693.9470   1491.3740     34.8953      7.3400
+    694.2340   1491.3790     34.8892      7.3420
+    694.5810   1491.3840     34.9014      7.3380
+    694.9320   1491.3890     34.8915      7.3410
+    695.2870   1491.3930     34.8900      7.3410
+    695.6450   1491.3950     34.8831      7.3420
+    696.0040   1491.4000     34.8892      7.3400
+    696.3530   1491.4050     34.8885      7.3400
+    696.6800   1491.4110     34.8885      7.3400
+    697.0250   1491.4150     34.8930      7.3380
+    697.3540   1491.4200     34.8930      7.3380
+    697.6840   1491.4260     34.8869      7.3400
+    698.0210   1491.4310     34.8869      7.3400
+    698.3670   1491.4380     34.8846      7.3410
+    698.6980   1491.4420     34.8892      7.3390
+    699.0620   1491.4480     34.8923      7.3380
+    699.3920   1491.4520     34.8824      7.3410
+    699.7290   1491.4590     34.8801      7.3420
+    700.0860   1491.4640     34.8824      7.3410
+    700.3950   1491.4700     34.8923      7.3380
+    700.7370   1491.4760     34.8953      7.3370
+    701.0790   1491.4820     34.8869      7.3400
+    701.4170   1491.4870     34.8801      7.3420
+    701.7390   1491.4930     34.8900      7.3390
+    702.0900   1491.4990     34.8839      7.3410
+    702.4110   1491.5050     34.8869      7.3400
+    702.7440   1491.5120     34.8854      7.3410
+    703.0650   1491.5170     34.8755      7.3440
+    703.3830   1491.5240     34.8862      7.3410
+    703.7320   1491.5300     34.8892      7.3400
+    704.0690   1491.5350     34.8862      7.3410
+    704.4120   1491.5420     34.8808      7.3430
+    704.7180   1491.5450     34.8976      7.3370
+    705.0070   1491.5510     34.8923      7.3390
+    705.3010   1491.5560     34.8923      7.3390
+    705.6290   1491.5620     34.8900      7.3400
+    705.9590   1491.5670     34.8862      7.3410
+    706.2740   1491.5730     34.8839      7.3420
+    706.6120   1491.5790     34.8839      7.3420
+    706.9400   1491.5840     34.8930      7.3390
+    707.2830   1491.5890     34.8862      7.3410
+    707.6150   1491.5950     34.8862      7.3410
+    707.9320   1491.6000     34.8801      7.3430
+    708.2800   1491.6070     34.8839      7.3420
+    708.6190   1491.6120     34.8900      7.3400
+    708.9610   1491.6160     34.8854      7.3410
+    709.3150   1491.6210     34.8816      7.3420
+    709.6290   1491.6280     34.8892      7.3400
+    709.9740   1491.6320     34.8907      7.3390
+    710.3160   1491.6370     34.8900      7.3390
+    710.6440   1491.6420     34.8930      7.3380
+    710.9760   1491.6480     34.8869      7.3400
+    711.3180   1491.6530     34.8923      7.3380
+    711.6400   1491.6590     34.8869      7.3400
+    711.9900   1491.6650     34.8839      7.3410
+    712.3440   1491.6690     34.8885      7.3390
+    712.6690   1491.6750     34.8862      7.3400
+    712.9890   1491.6810     34.8923      7.3380
+    713.3210   1491.6860     34.8923      7.3380
+    713.6820   1491.6910     34.8854      7.3400
+    714.0330   1491.6940     34.8862      7.3390
+    714.3520   1491.7000     34.8770      7.3420
+    714.6930   1491.7060     34.8778      7.3420
+    715.0410   1491.7120     34.8839      7.3400
+    715.3550   1491.7180     34.8846      7.3400
+    715.7000   1491.7220     34.8892      7.3380
+    716.0320   1491.7280     34.8892      7.3380
+    716.3770   1491.7340     34.8930      7.3370
+    716.7060   1491.7390     34.8862      7.3390
+    717.0560   1491.7440     34.8793      7.3410
+    717.3650   1491.7490     34.8824      7.3400
+    717.6970   1491.7540     34.8854      7.3390
+    718.0530   1491.7580     34.8801      7.3400
+    718.3940   1491.7630     34.8892      7.3370
+    718.7260   1491.7690     34.8892      7.3370
+    719.0680   1491.7730     34.8846      7.3380
+    719.3910   1491.7770     34.8808      7.3390
+    719.7150   1491.7810     34.8831      7.3380
+    720.0790   1491.7860     34.8816      7.3380
+    720.3900   1491.7910     34.8785      7.3390
+    720.7250   1491.7950     34.8869      7.3360
+    721.0800   1491.8000     34.8740      7.3400
+    721.4180   1491.8040     34.8846      7.3360
+    721.7610   1491.8090     34.8747      7.3390
+    722.0960   1491.8160     34.8785      7.3380
+    722.4300   1491.8210     34.8846      7.3360
+    722.7540   1491.8260     34.8907      7.3340
+    723.0980   1491.8310     34.8747      7.3390
+    723.4220   1491.8370     34.8869      7.3350
+    723.7540   1491.8430     34.8785      7.3380
+    724.0850   1491.8480     34.8869      7.3350
+    724.4150   1491.8540     34.8846      7.3360
+    724.7840   1491.8580     34.8824      7.3360
+    725.1080   1491.8640     34.8801      7.3370
+    725.4250   1491.8690     34.8862      7.3350
+    725.7760   1491.8750     34.8770      7.3380
+    726.1160   1491.8800     34.8824      7.3360
+    726.4420   1491.8860     34.8862      7.3350
+    726.7860   1491.8910     34.8824      7.3360
+    727.1330   1491.8960     34.8907      7.3330
+    727.4280   1491.9000     34.8778      7.3370
+    727.7640   1491.9070     34.8824      7.3360
+    728.1070   1491.9120     34.8724      7.3390
+    728.4490   1491.9170     34.8900      7.3330
+    728.7820   1491.9220     34.8770      7.3370
+    729.1170   1491.9260     34.8793      7.3360
+    729.4290   1491.9320     34.8770      7.3370
+    729.7840   1491.9390     34.8808      7.3360
+    730.1100   1491.9440     34.8770      7.3370
+    730.4520   1491.9500     34.8808      7.3360
+    730.7870   1491.9540     34.8763      7.3370
+    731.1220   1491.9610     34.8831      7.3350
+    731.4650   1491.9670     34.8778      7.3370
+    731.7880   1491.9730     34.8839      7.3350
+    732.0930   1491.9780     34.8778      7.3370
+    732.4520   1491.9830     34.8831      7.3350
+    732.7880   1491.9880     34.8793      7.3360
+    733.1200   1491.9950     34.8808      7.3360
+    733.4220   1491.9990     34.8862      7.3340
+    733.7680   1492.0040     34.8824      7.3350
+    734.0880   1492.0090     34.8793      7.3360
+    734.4450   1492.0150     34.8793      7.3360
+    734.7710   1492.0200     34.8846      7.3340
+    735.1000   1492.0250     34.8755      7.3370
+    735.4390   1492.0320     34.8793      7.3360
+    735.7920   1492.0380     34.8793      7.3360
+    736.0980   1492.0420     34.8694      7.3390
+    736.4330   1492.0480     34.8785      7.3360
+    736.7770   1492.0530     34.8755      7.3370
+    737.0810   1492.0580     34.8755      7.3370
+    737.4450   1492.0630     34.8740      7.3370
+    737.7620   1492.0690     34.8808      7.3350
+    738.0820   1492.0740     34.8839      7.3340
+    738.4340   1492.0810     34.8785      7.3360
+    738.7580   1492.0850     34.8709      7.3380
+    739.0850   1492.0900     34.8709      7.3380
+    739.4340   1492.0960     34.8740      7.3370
+    739.7610   1492.1020     34.8808      7.3350
+    740.1130   1492.1070     34.8770      7.3360
+    740.4480   1492.1120     34.8763      7.3360
+    740.7650   1492.1190     34.8808      7.3350
+    741.0850   1492.1240     34.8808      7.3350
+    741.3960   1492.1280     34.8793      7.3350
+    741.7040   1492.1330     34.8793      7.3350
+    742.0080   1492.1360     34.8717      7.3370
+    742.3100   1492.1410     34.8747      7.3360
+    742.6300   1492.1470     34.8877      7.3320
+    742.9550   1492.1530     34.8755      7.3360
+    743.2780   1492.1580     34.8755      7.3360
+    743.6300   1492.1630     34.8778      7.3350
+    743.9570   1492.1690     34.8717      7.3370
+    744.2750   1492.1730     34.8740      7.3360
+    744.5930   1492.1790     34.8686      7.3380
+    744.9280   1492.1860     34.8877      7.3320
+    745.2570   1492.1890     34.8740      7.3360
+    745.5710   1492.1950     34.8801      7.3340
+    745.9040   1492.1990     34.8732      7.3360
+    746.2360   1492.2050     34.8701      7.3370
+    746.5680   1492.2100     34.8732      7.3360
+    746.8710   1492.2160     34.8831      7.3330
+    747.1990   1492.2210     34.8732      7.3360
+    747.5220   1492.2270     34.8740      7.3360
+    747.8220   1492.2330     34.8778      7.3350
+    748.1590   1492.2390     34.8747      7.3360
+    748.4850   1492.2440     34.8778      7.3350
+    748.8420   1492.2480     34.8793      7.3340
+    749.1760   1492.2540     34.8732      7.3360
+    749.4840   1492.2600     34.8740      7.3360
+    749.8130   1492.2660     34.8770      7.3350
+    750.1290   1492.2700     34.8732      7.3360
+    750.4660   1492.2770     34.8747      7.3360
+    750.7900   1492.2820     34.8831      7.3330
+    751.0960   1492.2870     34.8679      7.3380
+    751.4350   1492.2930     34.8770      7.3350
+    751.7470   1492.3000     34.8785      7.3350
+    752.0630   1492.3050     34.8755      7.3360
+    752.4240   1492.3100     34.8808      7.3340
+    752.7400   1492.3150     34.8778      7.3350
+    753.0510   1492.3190     34.8732      7.3360
+    753.3940   1492.3270     34.8755      7.3360
+    753.7000   1492.3320     34.8816      7.3340
+    754.0300   1492.3370     34.8839      7.3330
+    754.3630   1492.3420     34.8770      7.3350
+    754.6860   1492.3480     34.8778      7.3350
+    755.0100   1492.3530     34.8717      7.3370
+    755.3360   1492.3590     34.8717      7.3370
+    755.6530   1492.3640     34.8808      7.3340
+    755.9880   1492.3680     34.8701      7.3370
+    756.2800   1492.3730     34.8824      7.3330
+    756.6050   1492.3800     34.8656      7.3390
+    756.9480   1492.3830     34.8694      7.3370
+    757.2660   1492.3880     34.8694      7.3370
+    757.5910   1492.3940     34.8694      7.3370
+    757.9230   1492.3980     34.8778      7.3340
+    758.2440   1492.4060     34.8793      7.3340
+    758.5580   1492.4100     34.8694      7.3370
+    758.9130   1492.4150     34.8686      7.3370
+    759.2290   1492.4210     34.8755      7.3350
+    759.5290   1492.4260     34.8755      7.3350
+    759.8820   1492.4310     34.8747      7.3350
+    760.2050   1492.4350     34.8732      7.3350
+    760.5150   1492.4400     34.8671      7.3370
+    760.8560   1492.4460     34.8679      7.3370
+    761.1590   1492.4520     34.8747      7.3350
+    761.5070   1492.4580     34.8808      7.3330
+    761.8080   1492.4630     34.8808      7.3330
+    762.1210   1492.4650     34.8625      7.3380
+    762.4540   1492.4700     34.8717      7.3350
+    762.7890   1492.4740     34.8701      7.3350
+    763.0880   1492.4790     34.8732      7.3340
+    763.4180   1492.4850     34.8679      7.3360
+    763.7400   1492.4900     34.8732      7.3340
+    764.0850   1492.4950     34.8602      7.3380
+    764.3920   1492.4990     34.8564      7.3390
+    764.7110   1492.5070     34.8648      7.3370
+    765.0430   1492.5120     34.8732      7.3340
+    765.3720   1492.5170     34.8763      7.3330
+    765.7020   1492.5220     34.8755      7.3330
+    766.0240   1492.5280     34.8701      7.3350
+    766.3340   1492.5330     34.8671      7.3360
+    766.6630   1492.5380     34.8724      7.3340
+    766.9780   1492.5440     34.8640      7.3370
+    767.3020   1492.5490     34.8602      7.3380
+    767.6140   1492.5540     34.8633      7.3370
+    767.9560   1492.5600     34.8732      7.3340
+    768.2630   1492.5650     34.8663      7.3360
+    768.6140   1492.5700     34.8694      7.3350
+    768.9280   1492.5770     34.8701      7.3350
+    769.2450   1492.5820     34.8701      7.3350
+    769.5600   1492.5870     34.8763      7.3330
+    769.8660   1492.5900     34.8686      7.3350
+    770.2010   1492.5970     34.8694      7.3350
+    770.5320   1492.6040     34.8740      7.3340
+    770.8290   1492.6080     34.8663      7.3360
+    771.1740   1492.6140     34.8732      7.3340
+    771.5050   1492.6190     34.8694      7.3350
+    771.8220   1492.6250     34.8640      7.3370
+    772.1420   1492.6300     34.8732      7.3340
+    772.4630   1492.6340     34.8747      7.3330
+    772.7790   1492.6420     34.8648      7.3370
+    773.1070   1492.6460     34.8694      7.3350
+    773.4180   1492.6520     34.8732      7.3340
+    773.7460   1492.6580     34.8770      7.3330
+    774.0490   1492.6630     34.8679      7.3360
+    774.3850   1492.6680     34.8640      7.3370
+    774.7200   1492.6720     34.8625      7.3370
+    775.0340   1492.6780     34.8694      7.3350
+    775.3540   1492.6840     34.8701      7.3350
+    775.6640   1492.6890     34.8763      7.3330
+    776.0070   1492.6940     34.8633      7.3370
+    776.3280   1492.6990     34.8694      7.3350
+    776.6600   1492.7050     34.8724      7.3340
+    776.9830   1492.7110     34.8701      7.3350
+    777.3000   1492.7160     34.8755      7.3330
+    777.6320   1492.7220     34.8671      7.3360
+    777.9470   1492.7270     34.8694      7.3350
+    778.2730   1492.7310     34.8656      7.3360
+    778.5740   1492.7370     34.8572      7.3390
+    778.8970   1492.7420     34.8663      7.3360
+    779.2230   1492.7450     34.8732      7.3330
+    779.5370   1492.7510     34.8679      7.3350
+    779.8780   1492.7560     34.8640      7.3360
+    780.1860   1492.7620     34.8740      7.3330
+    780.4990   1492.7680     34.8656      7.3360
+    780.8210   1492.7730     34.8709      7.3340
+    781.1560   1492.7800     34.8755      7.3330
+    781.4780   1492.7840     34.8709      7.3340
+    781.8120   1492.7910     34.8633      7.3370
+    782.1200   1492.7960     34.8694      7.3350
+    782.4580   1492.8000     34.8618      7.3370
+    782.7560   1492.8060     34.8717      7.3340
+    783.0740   1492.8100     34.8618      7.3370
+    783.3950   1492.8170     34.8686      7.3350
+    783.7030   1492.8230     34.8633      7.3370
+    784.0370   1492.8270     34.8740      7.3330
+    784.3320   1492.8330     34.8694      7.3350
+    784.6270   1492.8380     34.8663      7.3360
+    784.9570   1492.8430     34.8595      7.3380
+    785.2500   1492.8470     34.8618      7.3370
+    785.5530   1492.8520     34.8618      7.3370
+    785.8540   1492.8580     34.8595      7.3380
+    786.1550   1492.8630     34.8625      7.3370
+    786.4400   1492.8680     34.8595      7.3380
+    786.7370   1492.8730     34.8656      7.3360
+    787.0630   1492.8790     34.8724      7.3340
+    787.4360   1492.8850     34.8694      7.3350
+    787.8250   1492.8920     34.8633      7.3370
+    788.2140   1492.8990     34.8549      7.3400
+    788.5970   1492.9050     34.8663      7.3360
+    788.9670   1492.9100     34.8625      7.3370
+    789.3450   1492.9170     34.8602      7.3380
+    789.7150   1492.9230     34.8656      7.3360
+    790.1180   1492.9300     34.8663      7.3360
+    790.4790   1492.9350     34.8717      7.3340
+    790.8560   1492.9430     34.8663      7.3360
+    791.2210   1492.9470     34.8679      7.3350
+    791.5890   1492.9530     34.8587      7.3380
+    791.9630   1492.9580     34.8701      7.3340
+    792.3330   1492.9660     34.8717      7.3340
+    792.7040   1492.9700     34.8572      7.3380
+    793.0750   1492.9750     34.8595      7.3370
+    793.4590   1492.9830     34.8579      7.3380
+    793.8230   1492.9890     34.8640      7.3360
+    794.2250   1492.9960     34.8671      7.3350
+    794.5950   1493.0020     34.8640      7.3360
+    794.9710   1493.0070     34.8717      7.3330
+    795.3590   1493.0140     34.8633      7.3360
+    795.7150   1493.0200     34.8602      7.3370
+    796.1300   1493.0240     34.8579      7.3370
+    796.4920   1493.0310     34.8679      7.3340
+    796.8720   1493.0360     34.8633      7.3350
+    797.2490   1493.0420     34.8602      7.3360
+    797.6170   1493.0490     34.8640      7.3350
+    797.9790   1493.0570     34.8625      7.3360
+    798.3780   1493.0630     34.8618      7.3360
+    798.7300   1493.0700     34.8625      7.3360
+    799.1230   1493.0780     34.8640      7.3360
+    799.5030   1493.0860     34.8656      7.3360
+    799.8850   1493.0920     34.8587      7.3380
+    800.2660   1493.1000     34.8602      7.3380
+    800.6360   1493.1080     34.8648      7.3370
+    801.0220   1493.1140     34.8671      7.3360
+    801.4170   1493.1200     34.8671      7.3360
+    801.7730   1493.1260     34.8671      7.3360
+    802.1510   1493.1330     34.8671      7.3360
+    802.5240   1493.1400     34.8648      7.3370
+    802.8800   1493.1450     34.8640      7.3370
+    803.2830   1493.1540     34.8694      7.3360
+    803.6480   1493.1580     34.8518      7.3410
+    804.0240   1493.1650     34.8618      7.3380
+    804.4330   1493.1720     34.8679      7.3360
+    804.8090   1493.1780     34.8618      7.3380
+    805.1960   1493.1850     34.8587      7.3390
+    805.5840   1493.1920     34.8625      7.3380
+    805.9560   1493.1980     34.8625      7.3380
+    806.3260   1493.2030     34.8587      7.3390
+    806.7090   1493.2100     34.8587      7.3390
+    807.0640   1493.2160     34.8648      7.3370
+    807.4600   1493.2230     34.8625      7.3380
+    807.8420   1493.2280     34.8640      7.3370
+    808.2120   1493.2360     34.8595      7.3390
+    808.5860   1493.2420     34.8595      7.3390
+    808.9740   1493.2470     34.8579      7.3390
+    809.3490   1493.2530     34.8549      7.3400
+    809.7300   1493.2580     34.8503      7.3410
+    810.0990   1493.2660     34.8549      7.3400
+    810.4830   1493.2710     34.8602      7.3380
+    810.8560   1493.2770     34.8541      7.3400
+    811.2280   1493.2850     34.8579      7.3390
+    811.6060   1493.2900     34.8572      7.3390
+    811.9810   1493.2960     34.8663      7.3360
+    812.3760   1493.3040     34.8579      7.3390
+    812.7560   1493.3070     34.8526      7.3400
+    813.1150   1493.3140     34.8564      7.3390
+    813.5010   1493.3190     34.8549      7.3390
+    813.8880   1493.3260     34.8526      7.3400
+    814.2430   1493.3320     34.8587      7.3380
+    814.6320   1493.3380     34.8610      7.3370
+    814.9880   1493.3460     34.8595      7.3380
+    815.3870   1493.3520     34.8595      7.3380
+    815.7420   1493.3600     34.8610      7.3380
+    816.1210   1493.3660     34.8602      7.3380
+    816.4820   1493.3720     34.8572      7.3390
+    816.8630   1493.3790     34.8610      7.3380
+    817.2460   1493.3850     34.8549      7.3400
+    817.6240   1493.3900     34.8534      7.3400
+    817.9900   1493.3940     34.8579      7.3380
+    818.3400   1493.4010     34.8618      7.3370
+    818.7230   1493.4060     34.8549      7.3390
+    819.1130   1493.4120     34.8572      7.3380
+    819.4600   1493.4180     34.8602      7.3370
+    819.8160   1493.4240     34.8633      7.3360
+    820.1740   1493.4290     34.8595      7.3370
+    820.4760   1493.4350     34.8572      7.3380
+    820.8400   1493.4420     34.8579      7.3380
+    821.1910   1493.4480     34.8618      7.3370
+    821.5460   1493.4520     34.8473      7.3410
+    821.9120   1493.4560     34.8579      7.3370
+    822.2800   1493.4630     34.8557      7.3380
+    822.6150   1493.4670     34.8541      7.3380
+    822.9710   1493.4720     34.8534      7.3380
+    823.3040   1493.4770     34.8534      7.3380
+    823.6470   1493.4810     34.8610      7.3350
+    824.0100   1493.4870     34.8579      7.3360
+    824.3590   1493.4930     34.8610      7.3350
+    824.7160   1493.4990     34.8518      7.3380
+    825.0630   1493.5050     34.8579      7.3360
+    825.4190   1493.5090     34.8503      7.3380
+    825.7660   1493.5160     34.8579      7.3360
+    826.1070   1493.5230     34.8495      7.3390
+    826.4540   1493.5280     34.8549      7.3370
+    826.8170   1493.5340     34.8610      7.3350
+    827.1840   1493.5390     34.8541      7.3370
+    827.5120   1493.5460     34.8518      7.3380
+    827.8770   1493.5520     34.8610      7.3350
+    828.2250   1493.5570     34.8572      7.3360
+    828.5610   1493.5640     34.8587      7.3360
+    828.9100   1493.5690     34.8457      7.3400
+    829.2520   1493.5760     34.8587      7.3360
+    829.6180   1493.5820     34.8495      7.3390
+    829.9490   1493.5850     34.8503      7.3380
+    830.3120   1493.5920     34.8511      7.3380
+    830.6520   1493.5960     34.8534      7.3370
+    831.0160   1493.6040     34.8579      7.3360
+    831.3480   1493.6080     34.8534      7.3370
+    831.7080   1493.6150     34.8480      7.3390
+    832.0540   1493.6210     34.8572      7.3360
+    832.3880   1493.6290     34.8503      7.3390
+    832.7530   1493.6340     34.8557      7.3370
+    833.0820   1493.6380     34.8572      7.3360
+    833.4370   1493.6430     34.8412      7.3410
+    833.7960   1493.6490     34.8564      7.3360
+    834.1320   1493.6550     34.8534      7.3370
+    834.4730   1493.6610     34.8480      7.3390
+    834.8260   1493.6630     34.8541      7.3360
+    835.1620   1493.6710     34.8434      7.3400
+    835.5190   1493.6760     34.8488      7.3380
+    835.8680   1493.6810     34.8480      7.3380
+    836.2010   1493.6880     34.8495      7.3380
+    836.5620   1493.6940     34.8495      7.3380
+    836.8980   1493.6990     34.8488      7.3380
+    837.2490   1493.7060     34.8495      7.3380
+    837.6220   1493.7120     34.8495      7.3380
+    837.9590   1493.7180     34.8526      7.3370
+    838.2890   1493.7240     34.8564      7.3360
+    838.6320   1493.7290     34.8526      7.3370
+    838.9710   1493.7350     34.8434      7.3400
+    839.3320   1493.7400     34.8549      7.3360
+    839.6910   1493.7460     34.8549      7.3360
+    840.0270   1493.7520     34.8526      7.3370
+    840.3770   1493.7580     34.8434      7.3400
+    840.7290   1493.7640     34.8495      7.3380
+    841.0670   1493.7690     34.8579      7.3350
+    841.4080   1493.7760     34.8595      7.3350
+    841.7470   1493.7800     34.8518      7.3370
+    842.0840   1493.7860     34.8549      7.3360
+    842.4540   1493.7910     34.8541      7.3360
+    842.7710   1493.7970     34.8457      7.3390
+    843.1330   1493.8040     34.8495      7.3380
+    843.4890   1493.8100     34.8526      7.3370
+    843.8440   1493.8150     34.8488      7.3380
+    844.1730   1493.8210     34.8488      7.3380
+    844.5230   1493.8280     34.8495      7.3380
+    844.8800   1493.8350     34.8534      7.3370
+    845.2180   1493.8410     34.8572      7.3360
+    845.5480   1493.8460     34.8564      7.3360
+    845.9080   1493.8530     34.8602      7.3350
+    846.2520   1493.8570     34.8465      7.3390
+    846.6130   1493.8620     34.8549      7.3360
+    846.9520   1493.8670     34.8488      7.3380
+    847.2930   1493.8730     34.8427      7.3400
+    847.6480   1493.8790     34.8488      7.3380
+    847.9860   1493.8830     34.8381      7.3410
+    848.3120   1493.8890     34.8419      7.3400
+    848.6820   1493.8950     34.8511      7.3370
+    849.0300   1493.9010     34.8450      7.3390
+    849.3860   1493.9090     34.8557      7.3360
+    849.7310   1493.9140     34.8518      7.3370
+    850.0810   1493.9190     34.8511      7.3370
+    850.4460   1493.9250     34.8511      7.3370
+    850.7850   1493.9310     34.8480      7.3380
+    851.1100   1493.9360     34.8511      7.3370
+    851.4500   1493.9420     34.8480      7.3380
+    851.8020   1493.9480     34.8450      7.3390
+    852.1200   1493.9510     34.8434      7.3390
+    852.4820   1493.9570     34.8434      7.3390
+    852.8450   1493.9610     34.8450      7.3380
+    853.1750   1493.9680     34.8457      7.3380
+    853.5160   1493.9740     34.8526      7.3360
+    853.8800   1493.9780     34.8473      7.3370
+    854.2160   1493.9840     34.8511      7.3360
+    854.5810   1493.9900     34.8419      7.3390
+    854.9210   1493.9960     34.8389      7.3400
+    855.2810   1494.0020     34.8480      7.3370
+    855.6200   1494.0090     34.8549      7.3350
+    855.9620   1494.0130     34.8473      7.3370
+    856.2950   1494.0190     34.8419      7.3390
+    856.6530   1494.0240     34.8473      7.3370
+    857.0250   1494.0280     34.8488      7.3360
+    857.3360   1494.0330     34.8511      7.3350
+    857.6900   1494.0400     34.8396      7.3390
+    858.0310   1494.0440     34.8450      7.3370
+    858.3860   1494.0500     34.8541      7.3340
+    858.6960   1494.0540     34.8404      7.3380
+    859.0400   1494.0600     34.8473      7.3360
+    859.3530   1494.0640     34.8396      7.3380
+    859.7010   1494.0680     34.8511      7.3340
+    860.0390   1494.0750     34.8396      7.3380
+    860.3590   1494.0800     34.8488      7.3350
+    860.6830   1494.0850     34.8480      7.3350
+    861.0270   1494.0910     34.8511      7.3340
+    861.3590   1494.0970     34.8488      7.3350
+    861.6940   1494.1030     34.8457      7.3360
+    862.0190   1494.1080     34.8518      7.3340
+    862.3560   1494.1130     34.8480      7.3350
+    862.6760   1494.1180     34.8419      7.3370
+    863.0300   1494.1220     34.8495      7.3340
+    863.3540   1494.1290     34.8442      7.3360
+    863.7050   1494.1340     34.8495      7.3340
+    863.9790   1494.1370     34.8427      7.3360
+    864.2210   1494.1430     34.8442      7.3360
+    864.5090   1494.1460     34.8427      7.3360
+    864.8740   1494.1520     34.8396      7.3370
+    865.2820   1494.1580     34.8328      7.3390
+    865.6390   1494.1650     34.8457      7.3350
+    865.9580   1494.1690     34.8389      7.3370
+    866.2750   1494.1760     34.8518      7.3330
+    866.6160   1494.1810     34.8457      7.3350
+    866.9830   1494.1880     34.8457      7.3350
+    867.3670   1494.1950     34.8434      7.3360
+    867.7590   1494.2000     34.8419      7.3360
+    868.1290   1494.2060     34.8511      7.3330
+    868.5370   1494.2130     34.8450      7.3350
+    868.9040   1494.2200     34.8457      7.3350
+    869.2720   1494.2250     34.8450      7.3350
+    869.6620   1494.2320     34.8518      7.3330
+    870.0330   1494.2380     34.8511      7.3330
+    870.4130   1494.2440     34.8450      7.3350
+    870.8130   1494.2500     34.8442      7.3350
+    871.1870   1494.2580     34.8427      7.3360
+    871.5540   1494.2620     34.8381      7.3370
+    871.9170   1494.2700     34.8579      7.3310
+    872.3050   1494.2760     34.8450      7.3350
+    872.6630   1494.2830     34.8427      7.3360
+    873.0390   1494.2890     34.8457      7.3350
+    873.4170   1494.2950     34.8427      7.3360
+    873.7970   1494.3000     34.8412      7.3360
+    874.1690   1494.3080     34.8366      7.3380
+    874.5500   1494.3140     34.8427      7.3360
+    874.9250   1494.3200     34.8419      7.3360
+    875.2950   1494.3270     34.8335      7.3390
+    875.6750   1494.3340     34.8404      7.3370
+    876.0280   1494.3400     34.8495      7.3340
+    876.4140   1494.3460     34.8457      7.3350
+    876.8020   1494.3530     34.8434      7.3360
+    877.1450   1494.3610     34.8389      7.3380
+    877.5460   1494.3680     34.8518      7.3340
+    877.8860   1494.3750     34.8434      7.3370
+    878.2670   1494.3820     34.8473      7.3360
+    878.6670   1494.3890     34.8442      7.3370
+    879.0640   1494.3960     34.8412      7.3380
+    879.4770   1494.4020     34.8404      7.3380
+    879.8580   1494.4090     34.8412      7.3380
+    880.2260   1494.4150     34.8473      7.3360
+    880.6140   1494.4220     34.8351      7.3400
+    880.9830   1494.4260     34.8396      7.3380
+    881.3690   1494.4320     34.8389      7.3380
+    881.7500   1494.4380     34.8358      7.3390
+    882.1330   1494.4450     34.8488      7.3350
+    882.5000   1494.4530     34.8412      7.3380
+    882.8860   1494.4590     34.8343      7.3400
+    883.2540   1494.4650     34.8404      7.3380
+    883.6520   1494.4720     34.8434      7.3370
+    884.0310   1494.4770     34.8366      7.3390
+    884.4010   1494.4850     34.8412      7.3380
+    884.7900   1494.4910     34.8312      7.3410
+    885.1620   1494.4970     34.8404      7.3380
+    885.5550   1494.5020     34.8419      7.3370
+    885.9430   1494.5100     34.8434      7.3370
+    886.3130   1494.5150     34.8396      7.3380
+    886.6780   1494.5220     34.8465      7.3360
+    887.0660   1494.5280     34.8396      7.3380
+    887.4490   1494.5350     34.8495      7.3350
+    887.8360   1494.5400     34.8358      7.3390
+    888.2250   1494.5480     34.8373      7.3390
+    888.5680   1494.5540     34.8434      7.3370
+    888.9600   1494.5600     34.8396      7.3380
+    889.3500   1494.5670     34.8404      7.3380
+    889.7330   1494.5730     34.8366      7.3390
+    890.1160   1494.5780     34.8358      7.3390
+    890.5040   1494.5850     34.8419      7.3370
+    890.8760   1494.5910     34.8419      7.3370
+    891.2570   1494.5970     34.8389      7.3380
+    891.6470   1494.6040     34.8358      7.3390
+    892.0110   1494.6110     34.8427      7.3370
+    892.4010   1494.6180     34.8343      7.3400
+    892.7900   1494.6230     34.8358      7.3390
+    893.1430   1494.6280     34.8351      7.3390
+    893.5280   1494.6360     34.8396      7.3380
+    893.9170   1494.6430     34.8366      7.3390
+    894.2970   1494.6490     34.8366      7.3390
+    894.6830   1494.6560     34.8366      7.3390
+    895.0180   1494.6610     34.8427      7.3370
+    895.3330   1494.6660     34.8297      7.3410
+    895.6230   1494.6680     34.8282      7.3410
+    895.9140   1494.6740     34.8351      7.3390
+    896.2210   1494.6810     34.8366      7.3390
+    896.5300   1494.6870     34.8495      7.3350
+    896.8300   1494.6900     34.8320      7.3400
+    897.1340   1494.6950     34.8381      7.3380
+    897.4030   1494.6990     34.8381      7.3380
+    897.6860   1494.7010     34.8419      7.3360
+    897.9260   1494.7060     34.8366      7.3380
+    898.1470   1494.7090     34.8267      7.3410
+    898.3450   1494.7120     34.8328      7.3390
+    898.5520   1494.7150     34.8289      7.3400
+    898.7350   1494.7180     34.8412      7.3360
+    898.9700   1494.7220     34.8259      7.3410
+    899.1580   1494.7270     34.8396      7.3370
+    899.3730   1494.7310     34.8373      7.3380
+    899.5970   1494.7340     34.8274      7.3410
+    899.8180   1494.7360     34.8412      7.3360
+    900.0080   1494.7390     34.8320      7.3390
+    900.2200   1494.7440     34.8358      7.3380
+    900.4320   1494.7480     34.8366      7.3380
+    900.6560   1494.7520     34.8305      7.3400
+    900.8890   1494.7560     34.8335      7.3390
+    901.1370   1494.7600     34.8366      7.3380
+    901.4240   1494.7650     34.8366      7.3380
+    901.6970   1494.7690     34.8335      7.3390
+    902.0310   1494.7760     34.8343      7.3390
+    902.3270   1494.7800     34.8335      7.3390
+    902.6250   1494.7850     34.8335      7.3390
+    902.9280   1494.7910     34.8312      7.3400
+    903.2330   1494.7950     34.8305      7.3400
+    903.5340   1494.7990     34.8328      7.3390
+    903.8340   1494.8060     34.8343      7.3390
+    904.1330   1494.8110     34.8404      7.3370
+    904.4330   1494.8140     34.8328      7.3390
+    904.7380   1494.8210     34.8282      7.3410
+    905.0190   1494.8260     34.8343      7.3390
+    905.3340   1494.8310     34.8404      7.3370
+    905.6590   1494.8350     34.8358      7.3380
+    905.9830   1494.8440     34.8358      7.3390
+    906.3390   1494.8450     34.8351      7.3380
+    906.6610   1494.8530     34.8373      7.3380
+    906.9840   1494.8570     34.8358      7.3380
+    907.3300   1494.8630     34.8358      7.3380
+    907.6670   1494.8690     34.8305      7.3400
+    907.9990   1494.8750     34.8366      7.3380
+    908.3290   1494.8790     34.8381      7.3370
+    908.6600   1494.8850     34.8328      7.3390
+    908.9870   1494.8900     34.8320      7.3390
+    909.3110   1494.8970     34.8366      7.3380
+    909.6610   1494.9010     34.8351      7.3380
+    910.0160   1494.9060     34.8312      7.3390
+    910.3410   1494.9120     34.8259      7.3410
+    910.6970   1494.9170     34.8343      7.3380
+    911.0150   1494.9240     34.8289      7.3400
+    911.3370   1494.9290     34.8289      7.3400
+    911.6460   1494.9350     34.8389      7.3370
+    911.9580   1494.9380     34.8343      7.3380
+    912.2460   1494.9440     34.8351      7.3380
+    912.5140   1494.9490     34.8289      7.3400
+    912.7960   1494.9530     34.8282      7.3400
+    913.0800   1494.9590     34.8328      7.3390
+    913.3680   1494.9620     34.8312      7.3390
+    913.6410   1494.9680     34.8289      7.3400
+    913.9500   1494.9720     34.8312      7.3390
+    914.2380   1494.9760     34.8244      7.3410
+    914.5230   1494.9800     34.8328      7.3380
+    914.8090   1494.9860     34.8404      7.3360
+    915.1190   1494.9910     34.8404      7.3360
+    915.4940   1494.9960     34.8328      7.3380
+    915.8610   1495.0020     34.8267      7.3400
+    916.2360   1495.0100     34.8282      7.3400
+    916.6140   1495.0140     34.8289      7.3390
+    916.9670   1495.0210     34.8335      7.3380
+    917.3260   1495.0280     34.8282      7.3400
+    917.6730   1495.0340     34.8221      7.3420
+    918.0360   1495.0390     34.8305      7.3390
+    918.3860   1495.0440     34.8328      7.3380
+    918.7450   1495.0510     34.8366      7.3370
+    919.0780   1495.0560     34.8297      7.3390
+    919.4470   1495.0620     34.8358      7.3370
+    919.7900   1495.0680     34.8297      7.3390
+    920.1610   1495.0730     34.8289      7.3390
+    920.5070   1495.0780     34.8221      7.3410
+    920.8540   1495.0840     34.8373      7.3360
+    921.2160   1495.0890     34.8366      7.3360
+    921.5730   1495.0960     34.8251      7.3400
+    921.9310   1495.1020     34.8343      7.3370
+    922.3030   1495.1090     34.8320      7.3380
+    922.6540   1495.1140     34.8282      7.3390
+    923.0240   1495.1210     34.8228      7.3410
+    923.3630   1495.1250     34.8274      7.3390
+    923.7440   1495.1310     34.8274      7.3390
+    924.0830   1495.1350     34.8228      7.3400
+    924.4370   1495.1400     34.8190      7.3410
+    924.8090   1495.1460     34.8343      7.3360
+    925.1540   1495.1510     34.8244      7.3390
+    925.5220   1495.1580     34.8312      7.3370
+    925.8720   1495.1630     34.8244      7.3390
+    926.2310   1495.1690     34.8305      7.3370
+    926.5900   1495.1750     34.8244      7.3390
+    926.9320   1495.1800     34.8328      7.3360
+    927.3000   1495.1850     34.8289      7.3370
+    927.6520   1495.1920     34.8236      7.3390
+    928.0040   1495.1980     34.8328      7.3360
+    928.3770   1495.2030     34.8228      7.3390
+    928.7290   1495.2090     34.8228      7.3390
+    929.1180   1495.2140     34.8305      7.3360
+    929.4500   1495.2210     34.8228      7.3390
+    929.8330   1495.2280     34.8320      7.3360
+    930.1830   1495.2320     34.8282      7.3370
+    930.5300   1495.2380     34.8251      7.3380
+    930.8840   1495.2440     34.8282      7.3370
+    931.2320   1495.2480     34.8236      7.3380
+    931.6030   1495.2540     34.8267      7.3370
+    931.9630   1495.2600     34.8328      7.3350
+    932.3200   1495.2640     34.8251      7.3370
+    932.6680   1495.2700     34.8282      7.3360
+    933.0330   1495.2750     34.8236      7.3370
+    933.3970   1495.2810     34.8236      7.3370
+    933.7280   1495.2870     34.8274      7.3360
+    934.1110   1495.2930     34.8236      7.3370
+    934.4540   1495.2980     34.8236      7.3370
+    934.8220   1495.3080     34.8297      7.3360
+    935.1720   1495.3140     34.8236      7.3380
+    935.5190   1495.3180     34.8251      7.3370
+    935.8900   1495.3240     34.8221      7.3380
+    936.2260   1495.3290     34.8244      7.3370
+    936.6030   1495.3340     34.8236      7.3370
+    936.9660   1495.3400     34.8297      7.3350
+    937.3540   1495.3470     34.8236      7.3370
+    937.6940   1495.3520     34.8289      7.3350
+    938.0590   1495.3600     34.8305      7.3350
+    938.4120   1495.3650     34.8114      7.3410
+    938.7580   1495.3700     34.8289      7.3350
+    939.1280   1495.3760     34.8198      7.3380
+    939.4640   1495.3810     34.8289      7.3350
+    939.8170   1495.3890     34.8244      7.3370
+    940.1820   1495.3940     34.8236      7.3370
+    940.5330   1495.4000     34.8267      7.3360
+    940.9100   1495.4060     34.8228      7.3370
+    941.2650   1495.4130     34.8267      7.3360
+    941.6490   1495.4200     34.8274      7.3360
+    941.9990   1495.4240     34.8259      7.3360
+    942.3460   1495.4300     34.8289      7.3350
+    942.6930   1495.4350     34.8190      7.3380
+    943.0530   1495.4390     34.8175      7.3380
+    943.4270   1495.4450     34.8206      7.3370
+    943.7620   1495.4520     34.8274      7.3350
+    944.1190   1495.4580     34.8274      7.3350
+    944.4800   1495.4630     34.8236      7.3360
+    944.8390   1495.4680     34.8198      7.3370
+    945.1880   1495.4740     34.8198      7.3370
+    945.5610   1495.4810     34.8206      7.3370
+    945.9200   1495.4870     34.8236      7.3360
+    946.2880   1495.4920     34.8228      7.3360
+    946.6660   1495.4990     34.8297      7.3340
+    946.9930   1495.5050     34.8175      7.3380
+    947.3670   1495.5120     34.8152      7.3390
+    947.7130   1495.5170     34.8267      7.3350
+    948.0760   1495.5240     34.8244      7.3360
+    948.4210   1495.5290     34.8206      7.3370
+    948.7980   1495.5350     34.8236      7.3360
+    949.1230   1495.5410     34.8236      7.3360
+    949.4870   1495.5460     34.8289      7.3340
+    949.8620   1495.5510     34.8160      7.3380
+    950.2250   1495.5590     34.8267      7.3350
+    950.5730   1495.5660     34.8305      7.3340
+    950.9620   1495.5730     34.8221      7.3370
+    951.3160   1495.5810     34.8206      7.3380
+    951.6820   1495.5850     34.8221      7.3370
+    952.0400   1495.5920     34.8228      7.3370
+    952.3920   1495.5970     34.8129      7.3400
+    952.7300   1495.6040     34.8198      7.3380
+    953.0920   1495.6090     34.8190      7.3380
+    953.4590   1495.6160     34.8289      7.3350
+    953.8230   1495.6220     34.8137      7.3400
+    954.1770   1495.6280     34.8228      7.3370
+    954.5370   1495.6330     34.8221      7.3370
+    954.9130   1495.6400     34.8282      7.3350
+    955.2600   1495.6450     34.8221      7.3370
+    955.6280   1495.6510     34.8152      7.3390
+    955.9740   1495.6560     34.8244      7.3360
+    956.3210   1495.6620     34.8152      7.3390
+    956.7000   1495.6680     34.8236      7.3360
+    957.0530   1495.6760     34.8228      7.3370
+    957.4260   1495.6810     34.8213      7.3370
+    957.7650   1495.6880     34.8198      7.3380
+    958.1440   1495.6930     34.8152      7.3390
+    958.5040   1495.6990     34.8183      7.3380
+    958.8400   1495.7050     34.8251      7.3360
+    959.2170   1495.7110     34.8183      7.3380
+    959.5710   1495.7180     34.8099      7.3410
+    959.9410   1495.7230     34.8213      7.3370
+    960.2980   1495.7290     34.8183      7.3380
+    960.6720   1495.7360     34.8190      7.3380
+    961.0370   1495.7430     34.8198      7.3380
+    961.4010   1495.7480     34.8129      7.3400
+    961.7650   1495.7530     34.8114      7.3400
+    962.1050   1495.7590     34.8244      7.3360
+    962.4630   1495.7650     34.8183      7.3380
+    962.8470   1495.7700     34.8167      7.3380
+    963.1850   1495.7760     34.8236      7.3360
+    963.5640   1495.7830     34.8114      7.3400
+    963.9110   1495.7890     34.8206      7.3370
+    964.2650   1495.7950     34.8236      7.3360
+    964.6450   1495.8010     34.8114      7.3400
+    964.9990   1495.8070     34.8206      7.3370
+    965.3570   1495.8120     34.8137      7.3390
+    965.6960   1495.8200     34.8221      7.3370
+    966.0710   1495.8230     34.8190      7.3370
+    966.4390   1495.8290     34.8160      7.3380
+    966.8200   1495.8350     34.8190      7.3370
+    967.1560   1495.8420     34.8137      7.3390
+    967.5070   1495.8480     34.8106      7.3400
+    967.8800   1495.8540     34.8137      7.3390
+    968.2390   1495.8610     34.8236      7.3360
+    968.5830   1495.8670     34.8145      7.3390
+    968.9390   1495.8730     34.8145      7.3390
+    969.3360   1495.8790     34.8137      7.3390
+    969.6730   1495.8860     34.8183      7.3380
+    970.0540   1495.8910     34.8137      7.3390
+    970.4100   1495.8970     34.8198      7.3370
+    970.7420   1495.9030     34.8175      7.3380
+    971.1350   1495.9100     34.8206      7.3370
+    971.4740   1495.9150     34.8206      7.3370
+    971.8300   1495.9200     34.8160      7.3380
+    972.1830   1495.9260     34.8198      7.3370
+    972.5600   1495.9320     34.8190      7.3370
+    972.9260   1495.9380     34.8068      7.3410
+    973.2800   1495.9430     34.8122      7.3390
+    973.6480   1495.9490     34.8152      7.3380
+    973.9970   1495.9550     34.8183      7.3370
+    974.3510   1495.9610     34.8091      7.3400
+    974.7120   1495.9660     34.8053      7.3410
+    975.0570   1495.9730     34.8213      7.3360
+    975.4130   1495.9800     34.8190      7.3370
+    975.7750   1495.9860     34.8190      7.3370
+    976.1280   1495.9920     34.8129      7.3390
+    976.4950   1495.9980     34.8129      7.3390
+    976.8650   1496.0040     34.8129      7.3390
+    977.2320   1496.0100     34.8251      7.3350
+    977.6010   1496.0170     34.8137      7.3390
+    977.9340   1496.0220     34.8160      7.3380
+    978.3000   1496.0280     34.8129      7.3390
+    978.6520   1496.0340     34.8129      7.3390
+    979.0160   1496.0420     34.8206      7.3370
+    979.3850   1496.0470     34.8198      7.3370
+    979.7360   1496.0520     34.8099      7.3400
+    980.1010   1496.0590     34.8137      7.3390
+    980.4360   1496.0670     34.8152      7.3390
+    980.7970   1496.0710     34.8167      7.3380
+    981.1620   1496.0780     34.8053      7.3420
+    981.5320   1496.0820     34.8099      7.3400
+    981.8820   1496.0880     34.8129      7.3390
+    982.2710   1496.0940     34.8152      7.3380
+    982.6180   1496.1000     34.8091      7.3400
+    982.9780   1496.1040     34.8045      7.3410
+    983.3490   1496.1100     34.8198      7.3360
+    983.7040   1496.1150     34.8190      7.3360
+    984.0590   1496.1210     34.8099      7.3390
+    984.4090   1496.1270     34.8099      7.3390
+    984.7790   1496.1340     34.8137      7.3380
+    985.1360   1496.1400     34.8076      7.3400
+    985.4960   1496.1460     34.8137      7.3380
+    985.8590   1496.1530     34.8083      7.3400
+    986.2270   1496.1600     34.8122      7.3390
+    986.5740   1496.1640     34.7984      7.3430
+    986.9210   1496.1700     34.8076      7.3400
+    987.2730   1496.1770     34.8114      7.3390
+    987.6430   1496.1820     34.8076      7.3400
+    988.0010   1496.1890     34.8053      7.3410
+    988.3460   1496.1950     34.8114      7.3390
+    988.7260   1496.2000     34.8076      7.3400
+    989.0750   1496.2050     34.8129      7.3380
+    989.4500   1496.2130     34.8145      7.3380
+    989.7970   1496.2170     34.8038      7.3410
+    990.1600   1496.2230     34.8129      7.3380
+    990.5090   1496.2290     34.8038      7.3410
+    990.8760   1496.2350     34.8068      7.3400
+    991.2180   1496.2410     34.8099      7.3390
+    991.5990   1496.2460     34.8145      7.3370
+    991.9430   1496.2520     34.8091      7.3390
+    992.3110   1496.2580     34.8022      7.3410
+    992.6640   1496.2650     34.8099      7.3390
+    993.0360   1496.2710     34.8152      7.3370
+    993.3870   1496.2770     34.8129      7.3380
+    993.7690   1496.2830     34.8122      7.3380
+    994.1070   1496.2870     34.8106      7.3380
+    994.4690   1496.2940     34.8053      7.3400
+    994.8290   1496.3000     34.8053      7.3400
+    995.1990   1496.3060     34.8114      7.3380
+    995.5440   1496.3110     34.8106      7.3380
+    995.9120   1496.3170     34.8045      7.3400
+    996.2500   1496.3220     34.8068      7.3390
+    996.6020   1496.3270     34.8122      7.3370
+    996.9780   1496.3330     34.8091      7.3380
+    997.3340   1496.3400     34.8099      7.3380
+    997.6990   1496.3470     34.8045      7.3400
+    998.0610   1496.3530     34.8137      7.3370
+    998.4210   1496.3590     34.8106      7.3380
+    998.7830   1496.3640     34.8160      7.3360
+    999.1300   1496.3700     34.8038      7.3400
+    999.5030   1496.3760     34.8129      7.3370
+    999.8640   1496.3810     34.8000      7.3410
+   1000.2170   1496.3860     34.8114      7.3370
+   1000.5920   1496.3920     34.8076      7.3380
+   1000.9230   1496.3960     34.8068      7.3380
+   1001.2920   1496.4030     34.8137      7.3360
+   1001.6550   1496.4080     34.8030      7.3390
+   1001.9990   1496.4150     34.8015      7.3400
+   1002.3660   1496.4210     34.8099      7.3370
+   1002.7330   1496.4270     34.8099      7.3370
+   1003.0800   1496.4320     34.8030      7.3390
+   1003.4500   1496.4390     34.8099      7.3370
+   1003.8200   1496.4440     34.8061      7.3380
+   1004.1560   1496.4510     34.8038      7.3390
+   1004.5180   1496.4560     34.8152      7.3350
+   1004.8950   1496.4630     34.8099      7.3370
+   1005.2550   1496.4690     34.8038      7.3390
+   1005.6120   1496.4750     34.8099      7.3370
+   1005.9600   1496.4800     34.8091      7.3370
+   1006.3200   1496.4880     34.8045      7.3390
+   1006.6760   1496.4970     34.8129      7.3370
+   1007.0340   1496.5000     34.8076      7.3380
+   1007.4220   1496.5090     34.8068      7.3390
+   1007.7830   1496.5100     34.7992      7.3400
+   1008.1080   1496.5180     34.8076      7.3380
+   1008.4750   1496.5240     34.8076      7.3380
+   1008.8140   1496.5290     34.8068      7.3380
+   1009.1680   1496.5340     34.8091      7.3370
+   1009.5400   1496.5400     34.8091      7.3370
+   1009.8960   1496.5460     34.8091      7.3370
+   1010.2470   1496.5510     34.8053      7.3380
+   1010.6160   1496.5590     34.8068      7.3380
+   1010.9760   1496.5620     34.8045      7.3380
+   1011.3440   1496.5690     34.8083      7.3370
+   1011.7010   1496.5750     34.7992      7.3400
+   1012.0620   1496.5810     34.8022      7.3390
+   1012.4110   1496.5850     34.8038      7.3380
+   1012.7640   1496.5900     34.8000      7.3390
+   1013.1100   1496.5970     34.8099      7.3360
+   1013.4800   1496.6020     34.8061      7.3370
+   1013.8350   1496.6080     34.8030      7.3380
+   1014.2040   1496.6140     34.8091      7.3360
+   1014.5440   1496.6220     34.7954      7.3410
+   1014.8990   1496.6290     34.8053      7.3380
+   1015.2710   1496.6340     34.8076      7.3370
+   1015.6340   1496.6410     34.8083      7.3370
+   1015.9870   1496.6470     34.8114      7.3360
+   1016.3440   1496.6530     34.8114      7.3360
+   1016.6100   1496.6570     34.8045      7.3380
+   1016.7390   1496.6590     34.8076      7.3370
+   1016.7810   1496.6600     34.7984      7.3400
+   1016.8740   1496.6610     34.8137      7.3350
+   1016.9920   1496.6630     34.8015      7.3390
+   1017.1120   1496.6640     34.7977      7.3400
+   1017.2220   1496.6660     34.8007      7.3390
+   1017.3820   1496.6680     34.8030      7.3380
+   1017.5470   1496.6700     34.7961      7.3400
+   1017.6890   1496.6740     34.8099      7.3360
+   1017.8440   1496.6750     34.7992      7.3390
+   1017.9930   1496.6780     34.7969      7.3400
+   1018.1770   1496.6810     34.8000      7.3390
+   1018.3110   1496.6830     34.7939      7.3410
+   1018.4980   1496.6870     34.8000      7.3390
+   1018.6330   1496.6890     34.8000      7.3390
+   1018.8200   1496.6920     34.8000      7.3390
+   1018.9470   1496.6950     34.8038      7.3380
+   1019.1090   1496.6960     34.8053      7.3370
+   1019.2890   1496.6980     34.7954      7.3400
+   1019.4420   1496.7030     34.8099      7.3360
+   1019.6330   1496.7050     34.8022      7.3380
+   1019.8060   1496.7090     34.8038      7.3380
+   1019.9730   1496.7120     34.8038      7.3380
+   1020.1440   1496.7150     34.8007      7.3390
+   1020.3390   1496.7180     34.8007      7.3390
+   1020.4910   1496.7210     34.8068      7.3370
+   1020.6530   1496.7230     34.8061      7.3370
+   1020.8390   1496.7260     34.8000      7.3390
+   1021.0180   1496.7290     34.8000      7.3390
+   1021.1770   1496.7320     34.8007      7.3390
+   1021.3510   1496.7350     34.8007      7.3390
+   1021.5210   1496.7390     34.8045      7.3380
+   1021.6900   1496.7420     34.7984      7.3400
+   1021.8790   1496.7440     34.8038      7.3380
+   1022.0470   1496.7480     34.8015      7.3390
+   1022.2260   1496.7500     34.8068      7.3370
+   1022.3890   1496.7530     34.8068      7.3370
+   1022.5610   1496.7560     34.8007      7.3390
+   1022.7290   1496.7580     34.7908      7.3420
+   1022.8980   1496.7600     34.8030      7.3380
+   1023.1020   1496.7640     34.8061      7.3370
+   1023.2470   1496.7670     34.7977      7.3400
+   1023.3990   1496.7690     34.7969      7.3400
+   1023.6230   1496.7730     34.8061      7.3370
+   1023.7950   1496.7760     34.8068      7.3370
+   1023.9290   1496.7780     34.8000      7.3390
+   1024.0040   1496.7780     34.8022      7.3380
+   1024.0090   1496.7790     34.8091      7.3360
+   1024.0480   1496.7790     34.8022      7.3380
+   1024.0800   1496.7800     34.8000      7.3390
+   1024.1220   1496.7820     34.8038      7.3380
+   1024.1540   1496.7820     34.8068      7.3370
+   1024.2140   1496.7830     34.8068      7.3370
+   1024.2300   1496.7830     34.7969      7.3400
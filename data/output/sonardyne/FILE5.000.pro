@@ -0,0 +1,54 @@
+test_read_store_and_write
+7/4/2016
+6:21:58
+Probe: MIDAS SVX2 3000
+Source: /root/package/data/input/valeport/midas/svx2/FILE5.000
+      0.1000   1424.3140      3.7710      4.9630
+      0.2030   1424.4210      3.9430      3.6440
+      0.3050   1424.0580      3.9750      3.4300
+      0.3160   1423.9590      4.0000      3.3890
+      0.4160   1424.0240      3.9940      3.4000
+      0.4260   1424.0100      4.0160      3.4310
+      0.4570   1424.0670      4.0150      3.4910
+      0.4630   1424.0930      4.0280      3.4760
+      0.5060   1424.1730      4.0250      3.4580
+      0.5090   1424.3120      4.0270      3.4890
+      0.5110   1423.9970      4.0250      3.4840
+      0.5220   1424.0050      4.0220      3.4930
+      0.5320   1424.3210      4.0200      3.4800
+      0.5370   1424.0570      4.0220      3.4600
+      0.5400   1424.3020      4.0090      3.4420
+      0.6260   1423.9500      3.9930      3.4460
+      0.7120   1423.9310      3.9410      3.4160
+      0.8850   1423.8950      3.9400      3.3920
+      1.0350   1423.8950      3.9450      3.3800
+      1.1910   1423.8930      3.9560      3.3720
+      1.3320   1423.9000      3.9610      3.3670
+      1.5260   1423.9090      3.9510      3.3630
+      1.6900   1423.8930      3.9530      3.3620
+      1.8440   1423.9160      3.9600      3.3580
+      2.0300   1423.8980      3.9600      3.3570
+      2.1880   1423.9220      3.9640      3.3590
+      2.3480   1423.9370      3.9730      3.3610
+      2.4840   1423.9470      3.9950      3.3600
+      2.6900   1424.0170      4.0320      3.3340
+      2.8430   1424.0150      4.1230      3.3160
+      3.0060   1423.9390      4.2260      3.2770
+      3.1810   1423.7640      4.3950      3.2050
+      3.3290   1423.5080      4.5250      3.1370
+      3.4930   1422.8970      4.6660      3.0250
+      3.6270   1422.7980      4.8670      2.9370
+      3.8380   1422.7320      4.9730      2.8470
+      3.9950   1422.6090      5.0460      2.7970
+      4.1420   1422.4670      5.1000      2.7640
+      4.3270   1422.3440      5.1470      2.7060
+      4.4800   1422.0180      5.1800      2.6510
+      4.6450   1421.9580      5.2080      2.6080
+      4.8000   1421.7310      5.2310      2.5640
+      4.9870   1421.3720      5.2540      2.5130
+      5.1420   1421.1230      5.2780      2.4450
+      5.2970   1420.8970      5.3090      2.3590
+      5.4960   1420.6580      5.3340      2.2940
+      5.6530   1420.3500      5.3560      2.2270
+      5.7870   1419.9980      5.3850      2.1330
+      5.8370   1419.9040      5.3670      2.0740
@@ -0,0 +1,345 @@
+test_read_store_and_write
+3/4/2016
+17:9:45
+Probe: MIDAS SVX2 1000
+Source: /root/package/data/input/valeport/midas/svx2/FILE6.000
+      0.2140   1422.4000      5.6290      2.4860
+      0.3330   1422.0870      5.6300      2.4440
+      0.4740   1421.9100      5.6280      2.4310
+      0.5860   1422.3060      5.6400      2.4230
+      0.6670   1422.1790      5.6450      2.4530
+      0.7040   1422.2670      5.6410      2.4760
+      0.7100   1422.1380      5.6590      2.4830
+      0.7560   1421.7100      5.6240      2.4410
+      0.8680   1421.8790      5.6270      2.4400
+      1.0580   1421.5490      5.6140      2.4300
+      1.1730   1421.6630      5.6170      2.4010
+      1.2850   1421.4910      5.6250      2.3920
+      1.3920   1421.4740      5.6200      2.3720
+      1.5920   1421.6260      5.6220      2.3700
+      1.6930   1421.6050      5.6200      2.3840
+      1.7960   1421.4400      5.6160      2.3790
+      1.9840   1421.5010      5.6180      2.3710
+      2.0940   1421.6280      5.6220      2.3840
+      2.1980   1421.5040      5.6190      2.3870
+      2.3050   1421.5370      5.6200      2.3700
+      2.5040   1421.5520      5.6190      2.3740
+      2.6320   1421.5020      5.6260      2.3820
+      2.7320   1421.4400      5.6270      2.3760
+      2.8790   1421.3400      5.6270      2.3530
+      3.0350   1421.3190      5.6350      2.3420
+      3.1250   1421.4120      5.6450      2.3490
+      3.2230   1421.3930      5.6350      2.3540
+      3.4340   1421.3230      5.6290      2.3440
+      3.5250   1421.3750      5.6280      2.3380
+      3.6230   1420.7600      5.6110      2.3270
+      3.7320   1420.4290      5.6210      2.1990
+      3.9360   1420.0700      5.6350      2.1060
+      4.0270   1419.8880      5.6450      2.0550
+      4.1390   1419.6910      5.6490      2.0070
+      4.3400   1419.5640      5.6610      1.9650
+      4.4460   1419.5190      5.6640      1.9450
+      4.5470   1419.4490      5.6670      1.9320
+      4.6550   1419.4200      5.6710      1.9190
+      4.8450   1419.3910      5.6720      1.9110
+      4.9570   1419.3830      5.6730      1.9050
+      5.0540   1419.3610      5.6780      1.9020
+      5.2360   1419.3390      5.6830      1.8970
+      5.3570   1419.3140      5.6820      1.8940
+      5.4630   1419.2820      5.6810      1.8870
+      5.5690   1419.1970      5.6830      1.8780
+      5.7770   1419.1770      5.6870      1.8650
+      5.8790   1419.1770      5.6880      1.8600
+      5.9770   1419.1670      5.6880      1.8570
+      6.1650   1419.1480      5.6890      1.8510
+      6.2620   1419.1260      5.6920      1.8470
+      6.3680   1419.0340      5.6960      1.8400
+      6.4740   1418.8970      5.7040      1.8150
+      6.6560   1418.5930      5.7150      1.7680
+      6.7610   1418.3200      5.7370      1.7080
+      6.8660   1418.0910      5.7540      1.6490
+      7.0660   1417.9260      5.7700      1.5970
+      7.1770   1417.8740      5.7770      1.5710
+      7.3060   1417.7180      5.7830      1.5380
+      7.4010   1417.6330      5.7900      1.5110
+      7.5760   1417.5360      5.7990      1.4970
+      7.6790   1417.4030      5.8070      1.4670
+      7.7970   1417.3700      5.8160      1.4430
+      7.9920   1417.4080      5.8210      1.4390
+      8.0950   1417.5540      5.8300      1.4560
+      8.2130   1417.4930      5.8400      1.4640
+      8.3100   1417.1920      5.8540      1.4340
+      8.5350   1416.7210      5.8740      1.3630
+      8.6380   1416.4990      5.8990      1.2650
+      8.7440   1416.4210      5.9100      1.2280
+      8.9080   1416.3100      5.9210      1.2050
+      9.0350   1416.1220      5.9260      1.1670
+      9.1480   1415.9490      5.9360      1.1350
+      9.2530   1415.8430      5.9390      1.1000
+      9.4350   1415.8100      5.9450      1.0780
+      9.5420   1415.8000      5.9460      1.0730
+      9.6490   1415.7950      5.9500      1.0660
+      9.7650   1415.7900      5.9490      1.0680
+      9.9640   1415.7960      5.9470      1.0690
+     10.0760   1415.8040      5.9470      1.0690
+     10.1820   1415.7950      5.9470      1.0700
+     10.3820   1415.8090      5.9490      1.0710
+     10.4860   1415.8210      5.9460      1.0720
+     10.5890   1415.8270      5.9440      1.0720
+     10.6970   1415.8310      5.9440      1.0730
+     10.8850   1415.8320      5.9420      1.0730
+     10.9860   1415.8540      5.9430      1.0760
+     11.1030   1415.8670      5.9430      1.0760
+     11.2960   1415.8770      5.9400      1.0790
+     11.4130   1415.8680      5.9410      1.0770
+     11.5270   1415.8610      5.9420      1.0800
+     11.6350   1415.8760      5.9400      1.0790
+     11.8280   1415.8610      5.9410      1.0770
+     11.9430   1415.8240      5.9420      1.0720
+     12.0530   1415.8000      5.9450      1.0670
+     12.2340   1415.7980      5.9460      1.0610
+     12.3390   1415.8070      5.9500      1.0610
+     12.4490   1415.8200      5.9480      1.0590
+     12.5680   1415.7230      5.9580      1.0560
+     12.7440   1415.7050      5.9630      1.0380
+     12.8520   1415.7110      5.9690      1.0310
+     12.9600   1415.7090      5.9650      1.0290
+     13.1510   1415.6970      5.9670      1.0300
+     13.2660   1415.6820      5.9720      1.0260
+     13.3800   1415.6920      5.9700      1.0240
+     13.4930   1415.7050      5.9700      1.0250
+     13.6730   1415.7140      5.9700      1.0270
+     13.7800   1415.7050      5.9720      1.0270
+     13.8900   1415.6960      5.9740      1.0290
+     14.0770   1415.6900      5.9700      1.0270
+     14.1880   1415.6760      5.9720      1.0240
+     14.2950   1415.6650      5.9730      1.0220
+     14.4090   1415.6500      5.9730      1.0210
+     14.5990   1415.6360      5.9740      1.0140
+     14.7130   1415.6170      5.9790      1.0100
+     14.8210   1415.5800      5.9780      1.0050
+     14.9770   1415.5230      5.9790      1.0000
+     15.1240   1415.4620      5.9830      0.9890
+     15.2390   1415.4450      5.9860      0.9770
+     15.3520   1415.3800      5.9890      0.9620
+     15.5370   1415.3190      5.9900      0.9560
+     15.6440   1415.2610      5.9950      0.9390
+     15.7450   1415.2430      5.9970      0.9280
+     15.8600   1415.2640      6.0020      0.9240
+     16.0340   1415.2720      6.0050      0.9210
+     16.1590   1415.2810      6.0030      0.9220
+     16.2780   1415.2990      6.0020      0.9240
+     16.4560   1415.3200      6.0040      0.9260
+     16.5620   1415.3360      6.0030      0.9310
+     16.6790   1415.3350      6.0030      0.9340
+     16.7910   1415.3320      6.0030      0.9330
+     16.9610   1415.3450      6.0050      0.9350
+     17.0790   1415.3500      6.0050      0.9340
+     17.1870   1415.3580      6.0070      0.9330
+     17.3750   1415.3450      6.0060      0.9370
+     17.4760   1415.3270      6.0050      0.9310
+     17.6010   1415.2900      6.0060      0.9250
+     17.7110   1415.2750      6.0080      0.9170
+     17.8980   1415.2660      6.0060      0.9160
+     18.0080   1415.2480      6.0070      0.9110
+     18.1290   1415.2340      6.0080      0.9030
+     18.3020   1415.2180      6.0060      0.9060
+     18.4050   1415.1980      6.0090      0.9010
+     18.5120   1415.2010      6.0110      0.9000
+     18.6550   1415.2010      6.0090      0.8980
+     18.8390   1415.2030      6.0090      0.9010
+     18.9490   1415.2010      6.0110      0.8990
+     19.0680   1415.2250      6.0110      0.9000
+     19.2460   1415.2660      6.0130      0.9020
+     19.3520   1415.2650      6.0110      0.9130
+     19.4730   1415.3010      6.0120      0.9160
+     19.6050   1415.3660      6.0140      0.9210
+     19.7730   1415.4300      6.0120      0.9310
+     19.8960   1415.5430      6.0160      0.9530
+     20.0140   1415.6720      6.0180      0.9750
+     20.1820   1415.8240      6.0130      1.0040
+     20.2900   1415.9490      6.0160      1.0290
+     20.4140   1416.0830      6.0190      1.0630
+     20.5320   1416.2890      6.0190      1.0940
+     20.6990   1416.2840      6.0150      1.1160
+     20.8210   1416.2060      6.0180      1.1120
+     20.9460   1416.1700      6.0230      1.0940
+     21.0810   1416.3080      6.0300      1.0940
+     21.2240   1416.6130      6.0370      1.1350
+     21.3680   1416.4610      6.0290      1.1570
+     21.4770   1416.5850      6.0380      1.1550
+     21.6420   1416.6580      6.0350      1.1770
+     21.7530   1416.6730      6.0360      1.1840
+     21.8710   1416.6420      6.0380      1.1870
+     21.9920   1416.7030      6.0410      1.1810
+     22.1710   1416.9230      6.0520      1.2020
+     22.2940   1417.0890      6.0500      1.2450
+     22.4070   1417.2280      6.0520      1.2720
+     22.5740   1417.3090      6.0520      1.3050
+     22.6970   1417.3760      6.0500      1.3230
+     22.8130   1417.4120      6.0510      1.3310
+     22.9340   1417.4340      6.0520      1.3350
+     23.0990   1417.4690      6.0540      1.3360
+     23.2190   1417.5000      6.0520      1.3470
+     23.3330   1417.5110      6.0550      1.3520
+     23.5050   1417.4680      6.0590      1.3540
+     23.6260   1417.4870      6.0670      1.3460
+     23.7410   1417.5520      6.0700      1.3440
+     23.8630   1417.6110      6.0700      1.3570
+     24.0130   1417.6790      6.0700      1.3650
+     24.1430   1417.7840      6.0750      1.3820
+     24.2570   1417.6450      6.0810      1.3850
+     24.4250   1417.4620      6.0770      1.3650
+     24.5700   1416.5700      6.0730      1.3150
+     24.6800   1415.3480      6.0550      1.1770
+     24.7850   1415.1260      6.0700      0.9890
+     24.9610   1415.0590      6.0790      0.8950
+     25.0830   1414.9880      6.0860      0.8490
+     25.2020   1414.8530      6.0890      0.8260
+     25.3570   1414.9450      6.0920      0.8080
+     25.4770   1414.8790      6.0950      0.8030
+     25.6000   1414.7660      6.0940      0.7960
+     25.7150   1414.6790      6.0960      0.7650
+     25.8730   1414.6750      6.0990      0.7510
+     26.0020   1414.6640      6.0980      0.7450
+     26.1180   1414.6610      6.0980      0.7440
+     26.2710   1414.6490      6.0980      0.7420
+     26.3960   1414.6470      6.0990      0.7400
+     26.5040   1414.6420      6.0990      0.7370
+     26.6200   1414.6410      6.0970      0.7370
+     26.8070   1414.6410      6.0980      0.7340
+     26.9190   1414.6300      6.0970      0.7370
+     27.0290   1414.6260      6.0980      0.7330
+     27.1660   1414.6360      6.1000      0.7340
+     27.3130   1414.6300      6.0980      0.7330
+     27.4270   1414.6310      6.0980      0.7340
+     27.5500   1414.6360      6.0980      0.7340
+     27.7150   1414.6400      6.1000      0.7340
+     27.8410   1414.6450      6.0980      0.7320
+     27.9660   1414.6440      6.1000      0.7320
+     28.0810   1414.6400      6.0980      0.7320
+     28.2320   1414.6020      6.0980      0.7310
+     28.3530   1414.6010      6.0970      0.7280
+     28.4710   1414.6060      6.0990      0.7250
+     28.6220   1414.6110      6.0990      0.7240
+     28.7550   1414.6080      6.1000      0.7220
+     28.8850   1414.5780      6.1000      0.7210
+     29.0180   1414.5570      6.1030      0.7190
+     29.1650   1414.5380      6.1040      0.7110
+     29.2870   1414.5250      6.1050      0.7050
+     29.4090   1414.5170      6.1040      0.7030
+     29.5750   1414.5160      6.1040      0.7020
+     29.7100   1414.5230      6.1040      0.7020
+     29.8290   1414.5220      6.1040      0.7000
+     29.9490   1414.5240      6.1060      0.7010
+     30.1000   1414.5400      6.1060      0.6990
+     30.2240   1414.5950      6.1080      0.7020
+     30.3440   1414.6240      6.1090      0.7100
+     30.5080   1414.6350      6.1090      0.7170
+     30.6290   1414.6570      6.1060      0.7220
+     30.7580   1414.6860      6.1060      0.7250
+     30.8780   1414.6890      6.1060      0.7320
+     31.0190   1414.6640      6.1070      0.7310
+     31.1530   1414.6660      6.1050      0.7260
+     31.2760   1414.6540      6.1060      0.7250
+     31.4130   1414.6420      6.1090      0.7180
+     31.5280   1414.5870      6.1070      0.7180
+     31.6390   1414.5670      6.1090      0.7060
+     31.7680   1414.5440      6.1080      0.7010
+     31.9060   1414.5610      6.1080      0.6990
+     32.0230   1414.5570      6.1090      0.6980
+     32.1470   1414.5570      6.1080      0.6990
+     32.2770   1414.5480      6.1090      0.6960
+     32.4240   1414.5480      6.1090      0.6980
+     32.5340   1414.5490      6.1090      0.6960
+     32.6650   1414.5490      6.1090      0.6940
+     32.8190   1414.5510      6.1070      0.6940
+     32.9350   1414.5490      6.1090      0.6940
+     33.0670   1414.5510      6.1100      0.6920
+     33.1860   1414.5500      6.1090      0.6950
+     33.3360   1414.5530      6.1120      0.6930
+     33.4650   1414.5530      6.1120      0.6920
+     33.5790   1414.5530      6.1090      0.6930
+     33.7360   1414.5500      6.1120      0.6910
+     33.8530   1414.5500      6.1100      0.6910
+     33.9860   1414.5490      6.1120      0.6910
+     34.1050   1414.5510      6.1130      0.6880
+     34.2650   1414.5540      6.1120      0.6910
+     34.3760   1414.5570      6.1100      0.6910
+     34.4920   1414.5590      6.1120      0.6910
+     34.6490   1414.5570      6.1130      0.6870
+     34.7750   1414.5560      6.1120      0.6890
+     34.8990   1414.5500      6.1100      0.6890
+     35.0150   1414.5550      6.1130      0.6840
+     35.1690   1414.5600      6.1130      0.6870
+     35.2950   1414.5560      6.1130      0.6870
+     35.4250   1414.5490      6.1100      0.6870
+     35.5640   1414.5460      6.1130      0.6860
+     35.6970   1414.5460      6.1110      0.6830
+     35.8100   1414.5440      6.1110      0.6820
+     35.9330   1414.5460      6.1110      0.6820
+     36.0930   1414.5460      6.1110      0.6820
+     36.2160   1414.5460      6.1110      0.6840
+     36.3220   1414.5500      6.1130      0.6820
+     36.4700   1414.5530      6.1120      0.6790
+     36.5960   1414.5570      6.1110      0.6810
+     36.7330   1414.5610      6.1110      0.6820
+     36.8600   1414.5690      6.1110      0.6830
+     37.0210   1414.5790      6.1110      0.6820
+     37.1430   1414.5780      6.1150      0.6840
+     37.2520   1414.5840      6.1130      0.6850
+     37.3970   1414.5850      6.1130      0.6840
+     37.5380   1414.5870      6.1100      0.6880
+     37.6400   1414.5890      6.1150      0.6860
+     37.7590   1414.5900      6.1100      0.6870
+     37.9110   1414.5930      6.1120      0.6870
+     38.0410   1414.5960      6.1120      0.6860
+     38.1790   1414.6060      6.1130      0.6830
+     38.3080   1414.6120      6.1130      0.6850
+     38.4430   1414.6100      6.1120      0.6870
+     38.5730   1414.6070      6.1130      0.6850
+     38.6920   1414.6040      6.1130      0.6850
+     38.8370   1414.5850      6.1170      0.6830
+     38.9690   1414.5800      6.1180      0.6810
+     39.0790   1414.5800      6.1190      0.6760
+     39.2050   1414.5800      6.1180      0.6780
+     39.3470   1414.5790      6.1160      0.6760
+     39.4830   1414.5800      6.1180      0.6770
+     39.6350   1414.5750      6.1190      0.6750
+     39.7630   1414.5740      6.1190      0.6730
+     39.9110   1414.5790      6.1220      0.6720
+     40.0120   1414.5790      6.1220      0.6700
+     40.1380   1414.5800      6.1190      0.6740
+     40.2790   1414.5830      6.1190      0.6740
+     40.4050   1414.5850      6.1190      0.6750
+     40.5280   1414.5860      6.1190      0.6730
+     40.6850   1414.5800      6.1190      0.6730
+     40.7940   1414.6410      6.1210      0.6730
+     40.9440   1414.7070      6.1220      0.6800
+     41.0700   1414.7540      6.1220      0.6920
+     41.2100   1414.7860      6.1200      0.7000
+     41.3290   1414.8050      6.1230      0.7080
+     41.4450   1414.8350      6.1220      0.7130
+     41.6040   1414.8940      6.1230      0.7210
+     41.7210   1414.9590      6.1260      0.7290
+     41.8520   1414.9810      6.1260      0.7380
+     41.9670   1415.0040      6.1240      0.7460
+     42.1140   1415.0160      6.1230      0.7500
+     42.2370   1414.9810      6.1230      0.7540
+     42.3750   1414.9710      6.1240      0.7470
+     42.5050   1414.9810      6.1240      0.7480
+     42.6350   1414.9960      6.1220      0.7480
+     42.7600   1415.0150      6.1240      0.7450
+     42.8490   1415.0420      6.1250      0.7530
+     42.9160   1415.0590      6.1290      0.7560
+     43.0070   1415.0990      6.1360      0.7640
+     43.1020   1415.0940      6.1350      0.7680
+     43.2280   1415.1190      6.1310      0.7660
+     43.3300   1415.2120      6.1320      0.7720
+     43.4140   1415.2540      6.1340      0.7960
+     43.5390   1415.2550      6.1340      0.7980
+     43.6790   1415.2320      6.1320      0.7950
+     43.7940   1415.1050      6.1310      0.7870
+     43.9210   1415.1090      6.1350      0.7690
+     44.0500   1415.0790      6.1350      0.7660
+     44.1210   1414.6700      6.1340      0.7630
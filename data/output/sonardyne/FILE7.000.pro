@@ -0,0 +1,2548 @@
+test_read_store_and_write
+13/5/2012
+7:33:6
+Probe: MIDAS SVP 6000
+Source: /root/package/data/input/valeport/midas/svp/FILE7.000
+      0.0950   1479.6400     32.0122      8.2280
+      0.2350   1479.6620     31.8718      8.2790
+      0.2430   1479.6480     31.7932      8.3010
+      0.2930   1479.6550     31.7764      8.3080
+      0.4330   1479.6750     31.7665      8.3160
+      0.5260   1479.6590     31.7490      8.3170
+      0.5590   1479.6600     31.7123      8.3290
+      0.6710   1479.5700     31.6811      8.3150
+      0.7950   1479.5590     31.7871      8.2770
+      0.7980   1479.7260     31.7139      8.3450
+      0.8180   1479.6180     31.8130      8.2840
+      0.8300   1479.3970     32.1335      8.1210
+      0.8330   1479.3670     32.2472      8.0760
+      0.8500   1479.3750     32.2075      8.0910
+      0.8760   1479.1920     32.3936      7.9820
+      0.8810   1479.2420     32.4127      7.9890
+      0.8970   1479.2620     32.1396      8.0830
+      0.9100   1479.4550     32.2433      8.1000
+      0.9720   1479.2230     32.2151      8.0480
+      1.1070   1479.2370     32.2891      8.0270
+      1.3120   1479.2370     32.3135      8.0180
+      1.5030   1479.2460     32.3303      8.0140
+      1.6690   1479.2650     32.3250      8.0200
+      1.8650   1479.2570     32.3257      8.0170
+      2.0460   1479.2580     32.3212      8.0180
+      2.2450   1479.2650     32.3143      8.0210
+      2.4810   1479.2350     32.2937      8.0190
+      2.7290   1479.2270     32.3387      8.0010
+      2.9800   1479.2240     32.3547      7.9940
+      3.2010   1479.2290     32.3708      7.9890
+      3.4870   1479.2240     32.3509      7.9930
+      3.7520   1479.2320     32.3875      7.9820
+      4.0720   1479.2170     32.3463      7.9900
+      4.3580   1479.0860     32.3601      7.9500
+      4.6350   1479.2620     32.5844      7.9220
+      4.9210   1479.2310     32.4142      7.9680
+      5.2230   1479.0930     32.2525      7.9830
+      5.5190   1479.0180     32.3204      7.9400
+      5.8200   1478.9470     32.4158      7.8890
+      6.1670   1478.9740     32.5188      7.8610
+      6.5790   1478.8150     32.5264      7.8150
+      7.1460   1478.8950     32.7003      7.7770
+      7.8100   1478.5710     32.6492      7.7060
+      8.3070   1478.5280     32.8362      7.6320
+      8.6760   1478.5700     33.0528      7.5710
+      9.0360   1478.6150     33.2016      7.5330
+      9.3650   1478.6130     33.2321      7.5210
+      9.7190   1478.6290     33.2771      7.5090
+     10.0580   1478.6330     33.2794      7.5080
+     10.3630   1478.6370     33.2878      7.5050
+     10.7180   1478.6430     33.2939      7.5030
+     11.0510   1478.6590     33.3176      7.4980
+     11.3710   1478.6740     33.3252      7.4980
+     11.6850   1478.6940     33.3374      7.4980
+     12.0390   1478.7040     33.3466      7.4960
+     12.3960   1478.7100     33.3504      7.4950
+     12.7540   1478.7160     33.3443      7.4970
+     13.0580   1478.7230     33.3549      7.4940
+     13.3980   1478.7340     33.3496      7.4970
+     13.7170   1478.7650     33.3710      7.4970
+     14.0730   1478.7800     33.3778      7.4970
+     14.3890   1478.7760     33.3832      7.4930
+     14.7230   1478.8030     33.3969      7.4940
+     15.0790   1478.8320     33.4282      7.4900
+     15.4110   1478.8490     33.4312      7.4920
+     15.7040   1478.8590     33.4320      7.4930
+     16.0250   1478.8680     33.4381      7.4920
+     16.3550   1478.8870     33.4518      7.4910
+     16.6880   1478.9270     33.4801      7.4910
+     17.0100   1478.9650     33.5030      7.4920
+     17.3530   1478.9820     33.5121      7.4920
+     17.6760   1479.0090     33.5419      7.4880
+     17.9830   1479.0380     33.5640      7.4870
+     18.3300   1479.1110     33.6182      7.4870
+     18.6790   1479.1890     33.6639      7.4910
+     19.0020   1479.2250     33.6792      7.4940
+     19.3430   1479.2380     33.6884      7.4930
+     19.6440   1479.2490     33.6838      7.4960
+     19.9730   1479.2610     33.6830      7.4980
+     20.3170   1479.2770     33.6876      7.4990
+     20.6510   1479.2910     33.6914      7.5000
+     20.9550   1479.3180     33.7029      7.5020
+     21.2960   1479.3480     33.7135      7.5050
+     21.6280   1479.3410     33.7006      7.5060
+     21.9470   1479.3210     33.6952      7.5010
+     22.2630   1479.3040     33.6899      7.4970
+     22.5910   1479.2930     33.6891      7.4930
+     22.9280   1479.2870     33.7044      7.4850
+     23.2420   1479.3040     33.7570      7.4710
+     23.5910   1479.3480     33.7936      7.4690
+     23.8990   1479.3810     33.8196      7.4680
+     24.2490   1479.3700     33.7997      7.4700
+     24.5910   1479.3520     33.7990      7.4640
+     24.9030   1479.3650     33.8242      7.4580
+     25.2350   1479.3950     33.8470      7.4570
+     25.5800   1479.4040     33.8554      7.4550
+     25.8920   1479.4170     33.8585      7.4560
+     26.2040   1479.4480     33.8882      7.4530
+     26.5310   1479.4710     33.8966      7.4550
+     26.8440   1479.4970     33.9073      7.4570
+     27.1730   1479.5280     33.9279      7.4570
+     27.4950   1479.5520     33.9363      7.4590
+     27.8020   1479.5700     33.9348      7.4630
+     28.1270   1479.5930     33.9485      7.4630
+     28.4740   1479.6180     33.9645      7.4630
+     28.8280   1479.6520     33.9897      7.4620
+     29.1720   1479.6720     33.9920      7.4650
+     29.5020   1479.6960     34.0134      7.4630
+     29.8050   1479.7380     34.0271      7.4680
+     30.1460   1479.8130     34.0706      7.4720
+     30.4780   1479.8650     34.0866      7.4790
+     30.7870   1479.9400     34.1179      7.4870
+     31.0980   1479.9920     34.1278      7.4960
+     31.4190   1480.0410     34.1537      7.4990
+     31.7500   1480.1390     34.1942      7.5100
+     32.0640   1480.2220     34.2201      7.5220
+     32.3850   1480.2530     34.1972      7.5360
+     32.7240   1480.2700     34.1942      7.5400
+     33.0440   1480.2900     34.1942      7.5440
+     33.3790   1480.3760     34.2430      7.5490
+     33.7120   1480.4890     34.2896      7.5620
+     34.0610   1480.5450     34.2995      7.5720
+     34.3870   1480.5620     34.2903      7.5780
+     34.7130   1480.6000     34.3010      7.5830
+     35.0400   1480.6510     34.3193      7.5890
+     35.3600   1480.7020     34.3224      7.6000
+     35.6950   1480.7530     34.3407      7.6060
+     36.0230   1480.8960     34.4139      7.6180
+     36.3470   1481.1560     34.5360      7.6450
+     36.6620   1481.2750     34.5108      7.6830
+     36.9650   1481.3270     34.4666      7.7100
+     37.2990   1481.3420     34.4437      7.7200
+     37.6000   1481.3570     34.4238      7.7290
+     37.9560   1481.4050     34.4360      7.7360
+     38.2850   1481.4330     34.4360      7.7420
+     38.6140   1481.4660     34.4429      7.7470
+     38.9440   1481.5240     34.4696      7.7520
+     39.2790   1481.5860     34.4818      7.7630
+     39.6100   1481.6500     34.4894      7.7760
+     39.9490   1481.7110     34.4971      7.7880
+     40.2540   1481.7160     34.4818      7.7930
+     40.6010   1481.7650     34.4978      7.7990
+     40.9500   1481.8350     34.5314      7.8050
+     41.2930   1481.9130     34.5497      7.8180
+     41.6010   1482.0120     34.5856      7.8310
+     41.9310   1482.1720     34.6405      7.8540
+     42.2620   1482.5050     34.8000      7.8880
+     42.5700   1482.7370     34.8305      7.9380
+     42.8900   1482.9070     34.8236      7.9840
+     43.2170   1483.1080     34.8381      8.0310
+     43.5370   1483.2400     34.8129      8.0730
+     43.8840   1483.3620     34.7939      8.1100
+     44.2190   1483.4390     34.7633      8.1390
+     44.5570   1483.5150     34.7626      8.1580
+     44.8970   1483.5510     34.7298      8.1770
+     45.2390   1483.5720     34.7206      8.1840
+     45.5690   1483.5900     34.7099      8.1910
+     45.9010   1483.6130     34.7084      8.1960
+     46.2230   1483.6460     34.7221      8.1990
+     46.5410   1483.7020     34.7389      8.2070
+     46.8810   1483.7630     34.7443      8.2200
+     47.1970   1483.8090     34.7466      8.2300
+     47.5240   1483.8370     34.7466      8.2360
+     47.8260   1483.8760     34.7618      8.2400
+     48.1680   1483.9200     34.7656      8.2490
+     48.4730   1483.9810     34.7923      8.2550
+     48.8090   1484.0280     34.7961      8.2650
+     49.1070   1484.0790     34.8175      8.2700
+     49.4380   1484.0910     34.8022      8.2770
+     49.7810   1484.0960     34.7923      8.2800
+     50.1110   1484.0970     34.7824      8.2820
+     50.4310   1484.1020     34.7916      8.2790
+     50.7600   1484.1150     34.7946      8.2800
+     51.1140   1484.1220     34.7984      8.2790
+     51.4550   1484.1350     34.8015      8.2800
+     51.7730   1484.1410     34.7961      8.2820
+     52.1090   1484.1600     34.8099      8.2810
+     52.4490   1484.1740     34.8106      8.2830
+     52.7460   1484.1860     34.8129      8.2840
+     53.0700   1484.1970     34.8145      8.2850
+     53.3850   1484.2060     34.8083      8.2880
+     53.7290   1484.2180     34.8228      8.2850
+     54.0360   1484.2240     34.8236      8.2850
+     54.3850   1484.2310     34.8183      8.2870
+     54.7400   1484.2370     34.8244      8.2850
+     55.0470   1484.2420     34.8213      8.2860
+     55.3910   1484.2470     34.8274      8.2840
+     55.7150   1484.2530     34.8274      8.2840
+     56.0170   1484.2570     34.8267      8.2840
+     56.3290   1484.2630     34.8274      8.2840
+     56.6680   1484.2680     34.8297      8.2830
+     56.9680   1484.2740     34.8335      8.2820
+     57.2820   1484.2790     34.8244      8.2850
+     57.6220   1484.2840     34.8335      8.2820
+     57.9800   1484.2890     34.8419      8.2790
+     58.3330   1484.2930     34.8282      8.2830
+     58.6760   1484.2980     34.8335      8.2810
+     58.9920   1484.3020     34.8267      8.2830
+     59.3310   1484.3070     34.8381      8.2790
+     59.6600   1484.3100     34.8419      8.2770
+     59.9930   1484.3120     34.8450      8.2750
+     60.3070   1484.3160     34.8381      8.2770
+     60.6200   1484.3190     34.8427      8.2750
+     60.9370   1484.3180     34.8404      8.2740
+     61.2520   1484.3040     34.8404      8.2690
+     61.5740   1484.2820     34.8274      8.2660
+     61.8810   1484.2820     34.8381      8.2610
+     62.1970   1484.2830     34.8434      8.2580
+     62.5160   1484.2830     34.8396      8.2580
+     62.8650   1484.2810     34.8480      8.2530
+     63.1820   1484.2900     34.8633      8.2490
+     63.5300   1484.3010     34.8557      8.2530
+     63.8940   1484.3020     34.8518      8.2530
+     64.2200   1484.2460     34.8114      8.2500
+     64.5580   1484.2090     34.8190      8.2360
+     64.8910   1484.2000     34.8259      8.2300
+     65.2060   1484.1790     34.8259      8.2230
+     65.5250   1484.2030     34.8587      8.2170
+     65.8450   1484.2180     34.8610      8.2190
+     66.1690   1484.2240     34.8732      8.2150
+     66.4890   1484.2260     34.8854      8.2100
+     66.8160   1484.2310     34.8824      8.2110
+     67.1250   1484.2350     34.8785      8.2120
+     67.4520   1484.2400     34.8900      8.2080
+     67.7850   1484.2450     34.8808      8.2110
+     68.0950   1484.2470     34.8816      8.2100
+     68.4420   1484.2530     34.8816      8.2100
+     68.7910   1484.2580     34.8808      8.2100
+     69.0990   1484.2570     34.8785      8.2090
+     69.4350   1484.2610     34.8778      8.2090
+     69.7860   1484.2680     34.8846      8.2070
+     70.1280   1484.2760     34.8778      8.2100
+     70.4590   1484.2790     34.8816      8.2080
+     70.7960   1484.2760     34.8686      8.2100
+     71.0920   1484.2650     34.8709      8.2050
+     71.4020   1484.2260     34.8503      8.2000
+     71.7440   1484.2190     34.8671      8.1910
+     72.0610   1484.2200     34.8732      8.1880
+     72.3860   1484.2170     34.8816      8.1830
+     72.7070   1484.2000     34.8633      8.1830
+     73.0360   1484.1810     34.8709      8.1740
+     73.3800   1484.1750     34.8801      8.1680
+     73.6910   1484.1730     34.8862      8.1640
+     74.0270   1484.1740     34.8885      8.1620
+     74.3670   1484.1680     34.8946      8.1570
+     74.6670   1484.1590     34.8984      8.1520
+     74.9960   1484.1520     34.8938      8.1500
+     75.3510   1484.1520     34.9014      8.1460
+     75.6850   1484.1470     34.9022      8.1430
+     76.0130   1484.1470     34.9159      8.1370
+     76.3110   1484.1430     34.9121      8.1360
+     76.6430   1484.1410     34.9152      8.1330
+     76.9730   1484.1410     34.9136      8.1320
+     77.3060   1484.1450     34.9121      8.1320
+     77.6400   1484.1490     34.9228      8.1280
+     78.0050   1484.1550     34.9258      8.1270
+     78.3230   1484.1620     34.9213      8.1290
+     78.6470   1484.1670     34.9335      8.1250
+     78.9730   1484.1740     34.9312      8.1260
+     79.2910   1484.1810     34.9327      8.1260
+     79.6060   1484.1860     34.9266      8.1280
+     79.9260   1484.1920     34.9335      8.1260
+     80.2420   1484.1920     34.9258      8.1270
+     80.5790   1484.1840     34.9182      8.1260
+     80.9140   1484.1100     34.8694      8.1210
+     81.2250   1484.0790     34.8885      8.1050
+     81.5600   1484.0710     34.9052      8.0960
+     81.8720   1484.0670     34.9129      8.0910
+     82.2070   1484.0680     34.9213      8.0870
+     82.5570   1484.0740     34.9304      8.0840
+     82.8990   1484.0800     34.9304      8.0840
+     83.2620   1484.0810     34.9358      8.0810
+     83.5780   1484.0800     34.9365      8.0790
+     83.8930   1484.0810     34.9365      8.0780
+     84.2320   1484.0710     34.9266      8.0770
+     84.5220   1484.0650     34.9304      8.0730
+     84.8460   1484.0390     34.9144      8.0700
+     85.1360   1484.0350     34.9190      8.0660
+     85.4560   1484.0350     34.9304      8.0610
+     85.7930   1484.0330     34.9388      8.0560
+     86.1240   1484.0300     34.9319      8.0560
+     86.4620   1484.0380     34.9342      8.0560
+     86.7970   1484.0520     34.9503      8.0530
+     87.1530   1484.0590     34.9480      8.0540
+     87.4990   1484.0700     34.9617      8.0510
+     87.8190   1484.0720     34.9464      8.0550
+     88.1460   1484.0700     34.9525      8.0510
+     88.4370   1484.0720     34.9411      8.0540
+     88.7620   1484.0610     34.9464      8.0480
+     89.0950   1484.0400     34.9159      8.0510
+     89.4330   1484.0480     34.9510      8.0400
+     89.7430   1484.0560     34.9503      8.0410
+     90.0850   1484.0630     34.9518      8.0410
+     90.4020   1484.0710     34.9602      8.0390
+     90.7400   1484.0680     34.9556      8.0380
+     91.0630   1484.0680     34.9579      8.0360
+     91.4120   1484.0650     34.9472      8.0370
+     91.7220   1484.0670     34.9419      8.0380
+     92.0460   1484.0680     34.9472      8.0350
+     92.3720   1484.0580     34.9533      8.0290
+     92.7110   1484.0530     34.9510      8.0270
+     93.0390   1484.0420     34.9525      8.0220
+     93.3620   1484.0230     34.9396      8.0200
+     93.6950   1484.0130     34.9388      8.0160
+     94.0040   1483.9910     34.9319      8.0110
+     94.3220   1483.9630     34.9205      8.0060
+     94.6400   1483.9490     34.9358      7.9960
+     94.9930   1483.9320     34.9388      7.9890
+     95.3330   1483.9100     34.9403      7.9810
+     95.6600   1483.8960     34.9434      7.9750
+     96.0120   1483.8740     34.9266      7.9730
+     96.3420   1483.8520     34.9380      7.9620
+     96.6600   1483.8390     34.9419      7.9560
+     96.9950   1483.8320     34.9586      7.9470
+     97.2980   1483.8350     34.9632      7.9450
+     97.6370   1483.8430     34.9655      7.9450
+     97.9500   1483.8520     34.9686      7.9450
+     98.2730   1483.8570     34.9678      7.9450
+     98.5830   1483.8660     34.9770      7.9430
+     98.9030   1483.8780     34.9854      7.9420
+     99.2610   1483.8870     34.9792      7.9450
+     99.5860   1483.8930     34.9945      7.9400
+     99.9010   1483.8980     34.9792      7.9450
+    100.2370   1483.9010     34.9800      7.9440
+    100.5680   1483.9080     34.9754      7.9460
+    100.8850   1483.9130     34.9815      7.9440
+    101.1940   1483.9190     34.9854      7.9430
+    101.5390   1483.9260     34.9861      7.9430
+    101.8690   1483.9310     34.9739      7.9470
+    102.2060   1483.9360     34.9854      7.9430
+    102.5240   1483.9420     34.9861      7.9430
+    102.8470   1483.9380     34.9876      7.9400
+    103.1750   1483.9280     34.9808      7.9380
+    103.4950   1483.9230     34.9762      7.9370
+    103.8250   1483.9150     34.9770      7.9330
+    104.1670   1483.9070     34.9693      7.9320
+    104.4710   1483.9080     34.9754      7.9290
+    104.7830   1483.9080     34.9831      7.9250
+    105.0960   1483.8990     34.9808      7.9220
+    105.4380   1483.8850     34.9678      7.9210
+    105.7420   1483.8790     34.9777      7.9150
+    106.0550   1483.8780     34.9785      7.9130
+    106.3670   1483.8780     34.9716      7.9140
+    106.6660   1483.8790     34.9709      7.9130
+    106.9990   1483.8810     34.9777      7.9100
+    107.3000   1483.8830     34.9838      7.9070
+    107.5870   1483.8860     34.9739      7.9100
+    107.8810   1483.8870     34.9731      7.9090
+    108.1860   1483.8810     34.9739      7.9060
+    108.4840   1483.8840     34.9876      7.9010
+    108.8270   1483.8850     34.9869      7.9000
+    109.1430   1483.8840     34.9663      7.9050
+    109.4310   1483.8830     34.9709      7.9020
+    109.7320   1483.8850     34.9747      7.9000
+    110.0170   1483.8930     34.9831      7.8980
+    110.3200   1483.8960     34.9815      7.8980
+    110.6370   1483.9010     34.9785      7.8990
+    110.9290   1483.9030     34.9762      7.8990
+    111.2360   1483.9020     34.9808      7.8960
+    111.5610   1483.9040     34.9838      7.8940
+    111.8860   1483.9050     34.9831      7.8930
+    112.2150   1483.9030     34.9709      7.8950
+    112.5160   1483.9050     34.9869      7.8890
+    112.8260   1483.9050     34.9739      7.8920
+    113.1030   1483.9060     34.9861      7.8870
+    113.4090   1483.9050     34.9815      7.8870
+    113.7390   1483.8940     34.9739      7.8850
+    114.0550   1483.8860     34.9754      7.8810
+    114.3810   1483.8820     34.9800      7.8770
+    114.7140   1483.8750     34.9731      7.8760
+    115.0200   1483.8720     34.9762      7.8730
+    115.3350   1483.8680     34.9838      7.8680
+    115.6580   1483.8600     34.9823      7.8650
+    115.9780   1483.8600     34.9838      7.8630
+    116.3060   1483.8620     34.9930      7.8590
+    116.6080   1483.8630     34.9808      7.8620
+    116.9590   1483.8660     34.9876      7.8590
+    117.2770   1483.8690     34.9861      7.8590
+    117.5790   1483.8720     34.9968      7.8550
+    117.8820   1483.8770     34.9998      7.8540
+    118.2200   1483.8820     34.9991      7.8540
+    118.5280   1483.8870     34.9991      7.8540
+    118.8400   1483.8940     35.0067      7.8520
+    119.1610   1483.9010     35.0052      7.8530
+    119.4620   1483.9070     34.9937      7.8570
+    119.7870   1483.9120     35.0052      7.8530
+    120.1090   1483.9170     34.9869      7.8590
+    120.4490   1483.9220     34.9922      7.8570
+    120.7310   1483.9200     34.9899      7.8560
+    121.0590   1483.9230     34.9945      7.8540
+    121.3830   1483.9260     34.9983      7.8520
+    121.7060   1483.9310     35.0014      7.8510
+    122.0160   1483.9370     34.9930      7.8540
+    122.3440   1483.9410     34.9976      7.8520
+    122.6560   1483.9450     34.9998      7.8510
+    122.9990   1483.9480     34.9884      7.8540
+    123.3040   1483.9530     35.0067      7.8480
+    123.5800   1483.9570     34.9968      7.8510
+    123.8550   1483.9600     34.9960      7.8510
+    124.1870   1483.9650     34.9983      7.8500
+    124.4800   1483.9720     34.9998      7.8500
+    124.7860   1483.9760     35.0052      7.8480
+    125.0760   1483.9790     34.9945      7.8510
+    125.3890   1483.9820     34.9930      7.8510
+    125.7070   1483.9850     34.9945      7.8500
+    126.0090   1483.9790     34.9854      7.8500
+    126.3190   1483.9780     35.0021      7.8430
+    126.6230   1483.9820     34.9976      7.8440
+    126.9030   1483.9740     34.9846      7.8450
+    127.2380   1483.9620     34.9892      7.8390
+    127.5290   1483.9630     34.9831      7.8400
+    127.8340   1483.9640     34.9915      7.8360
+    128.1290   1483.9660     34.9953      7.8340
+    128.4470   1483.9700     35.0037      7.8310
+    128.7390   1483.9750     35.0037      7.8310
+    129.0370   1483.9790     34.9998      7.8320
+    129.3540   1483.9830     35.0052      7.8300
+    129.6730   1483.9880     35.0014      7.8310
+    129.9710   1483.9930     34.9953      7.8330
+    130.3130   1483.9990     34.9960      7.8330
+    130.6320   1484.0040     35.0044      7.8300
+    130.9310   1484.0090     35.0113      7.8280
+    131.2410   1484.0140     34.9953      7.8330
+    131.5670   1484.0190     35.0044      7.8300
+    131.8810   1484.0250     35.0021      7.8310
+    132.1790   1484.0290     34.9953      7.8330
+    132.4800   1484.0340     34.9953      7.8330
+    132.7850   1484.0380     35.0006      7.8310
+    133.0980   1484.0440     35.0044      7.8300
+    133.4030   1484.0460     34.9953      7.8320
+    133.7240   1484.0520     35.0052      7.8290
+    134.0240   1484.0560     34.9983      7.8310
+    134.3680   1484.0630     34.9991      7.8310
+    134.6690   1484.0700     35.0037      7.8300
+    134.9810   1484.0750     35.0006      7.8310
+    135.3020   1484.0800     34.9945      7.8330
+    135.6260   1484.0850     35.0037      7.8300
+    135.9320   1484.0910     34.9922      7.8340
+    136.2560   1484.0960     35.0037      7.8300
+    136.5790   1484.1010     35.0067      7.8290
+    136.8720   1484.1060     35.0037      7.8300
+    137.2050   1484.1110     35.0029      7.8300
+    137.5530   1484.1150     35.0021      7.8300
+    137.8460   1484.1200     35.0052      7.8290
+    138.1880   1484.1260     35.0113      7.8270
+    138.4960   1484.1310     34.9991      7.8310
+    138.7900   1484.1360     34.9960      7.8320
+    139.1210   1484.1400     35.0037      7.8290
+    139.4370   1484.1410     34.9976      7.8300
+    139.7130   1484.1400     34.9930      7.8300
+    140.0420   1484.1420     35.0021      7.8260
+    140.4140   1484.1420     35.0006      7.8250
+    140.7360   1484.1470     35.0067      7.8230
+    141.0320   1484.1500     34.9960      7.8260
+    141.3520   1484.1540     34.9976      7.8250
+    141.6650   1484.1560     34.9953      7.8250
+    141.9790   1484.1590     34.9960      7.8240
+    142.2740   1484.1570     34.9998      7.8210
+    142.5850   1484.1580     34.9998      7.8200
+    142.8910   1484.1610     35.0014      7.8190
+    143.2360   1484.1630     35.0075      7.8160
+    143.5640   1484.1650     35.0044      7.8160
+    143.8550   1484.1670     34.9960      7.8180
+    144.1550   1484.1670     34.9983      7.8160
+    144.4780   1484.1690     35.0105      7.8110
+    144.7920   1484.1730     35.0006      7.8140
+    145.1030   1484.1770     34.9998      7.8140
+    145.4290   1484.1820     34.9991      7.8140
+    145.7540   1484.1870     35.0174      7.8080
+    146.0570   1484.1920     35.0082      7.8110
+    146.3930   1484.1980     35.0113      7.8100
+    146.6210   1484.2030     35.0037      7.8130
+    146.8860   1484.2080     35.0037      7.8130
+    147.1860   1484.2080     34.9998      7.8130
+    147.5120   1484.2110     34.9983      7.8130
+    147.8120   1484.2140     35.0021      7.8110
+    148.0930   1484.2220     35.0143      7.8080
+    148.4180   1484.2250     35.0121      7.8080
+    148.7660   1484.2300     35.0060      7.8100
+    149.0870   1484.2350     35.0113      7.8080
+    149.4250   1484.2410     35.0090      7.8090
+    149.6990   1484.2470     35.0037      7.8110
+    150.0060   1484.2530     35.0105      7.8090
+    150.3230   1484.2590     35.0174      7.8070
+    150.6360   1484.2610     35.0029      7.8110
+    150.9470   1484.2590     35.0060      7.8080
+    151.2640   1484.2620     35.0136      7.8050
+    151.5790   1484.2630     34.9976      7.8090
+    151.8790   1484.2670     35.0029      7.8070
+    152.1880   1484.2710     35.0082      7.8050
+    152.5260   1484.2750     35.0067      7.8050
+    152.8340   1484.2770     35.0136      7.8020
+    153.1550   1484.2820     35.0105      7.8030
+    153.4790   1484.2850     35.0021      7.8050
+    153.7970   1484.2870     35.0121      7.8010
+    154.0900   1484.2920     35.0090      7.8020
+    154.4350   1484.2970     35.0143      7.8000
+    154.7130   1484.3010     35.0136      7.8000
+    155.0350   1484.3050     35.0128      7.8000
+    155.3820   1484.3110     35.0189      7.7980
+    155.6950   1484.3150     35.0151      7.7990
+    155.9940   1484.3210     35.0220      7.7970
+    156.3000   1484.3240     35.0113      7.8000
+    156.6020   1484.3300     35.0151      7.7990
+    156.9100   1484.3350     35.0182      7.7980
+    157.2630   1484.3400     35.0113      7.8000
+    157.5570   1484.3450     35.0204      7.7970
+    157.9010   1484.3490     35.0220      7.7960
+    158.2030   1484.3530     35.0121      7.7990
+    158.4990   1484.3590     34.9976      7.8040
+    158.8270   1484.3630     35.0182      7.7970
+    159.1440   1484.3670     35.0082      7.8000
+    159.4460   1484.3730     35.0151      7.7980
+    159.7650   1484.3770     35.0166      7.7970
+    160.0500   1484.3800     35.0090      7.7990
+    160.3710   1484.3850     35.0121      7.7980
+    160.6810   1484.3880     35.0105      7.7980
+    160.9870   1484.3890     35.0128      7.7960
+    161.2760   1484.3950     35.0143      7.7960
+    161.6090   1484.3980     35.0090      7.7970
+    161.9310   1484.4030     35.0060      7.7980
+    162.2510   1484.4080     35.0113      7.7960
+    162.5910   1484.4140     35.0182      7.7940
+    162.8950   1484.4170     35.0044      7.7980
+    163.1940   1484.4200     35.0182      7.7930
+    163.4770   1484.4230     35.0136      7.7940
+    163.7980   1484.4270     35.0121      7.7940
+    164.1420   1484.4320     35.0121      7.7940
+    164.4630   1484.4370     35.0082      7.7950
+    164.7540   1484.4420     35.0143      7.7930
+    165.0520   1484.4470     35.0151      7.7930
+    165.3670   1484.4520     35.0143      7.7930
+    165.6420   1484.4560     35.0113      7.7940
+    165.9620   1484.4610     35.0136      7.7930
+    166.2750   1484.4670     35.0052      7.7960
+    166.5890   1484.4710     35.0075      7.7950
+    166.9210   1484.4770     35.0113      7.7940
+    167.2380   1484.4830     35.0113      7.7940
+    167.5710   1484.4860     35.0159      7.7920
+    167.8760   1484.4920     35.0166      7.7920
+    168.1740   1484.4970     35.0197      7.7910
+    168.4760   1484.4990     35.0174      7.7910
+    168.7850   1484.5030     35.0037      7.7950
+    169.1020   1484.5050     35.0136      7.7910
+    169.4100   1484.5090     35.0098      7.7920
+    169.7140   1484.5130     35.0121      7.7910
+    170.0090   1484.5160     35.0136      7.7900
+    170.3180   1484.5220     35.0174      7.7890
+    170.6100   1484.5260     35.0105      7.7910
+    170.9220   1484.5300     35.0121      7.7900
+    171.2220   1484.5370     35.0143      7.7900
+    171.5410   1484.5420     35.0197      7.7880
+    171.8840   1484.5450     35.0235      7.7860
+    172.2010   1484.5520     35.0189      7.7880
+    172.5230   1484.5550     35.0143      7.7890
+    172.8200   1484.5590     35.0197      7.7870
+    173.1120   1484.5640     35.0166      7.7880
+    173.4270   1484.5690     35.0105      7.7900
+    173.7220   1484.5740     35.0136      7.7890
+    174.0230   1484.5760     35.0082      7.7900
+    174.3310   1484.5810     35.0174      7.7870
+    174.6480   1484.5850     35.0128      7.7880
+    174.9660   1484.5900     35.0128      7.7880
+    175.2870   1484.5970     35.0235      7.7850
+    175.6100   1484.5990     35.0204      7.7850
+    175.9180   1484.6060     35.0189      7.7860
+    176.2670   1484.6090     35.0105      7.7880
+    176.5810   1484.6160     35.0243      7.7840
+    176.9070   1484.6200     35.0113      7.7880
+    177.2130   1484.6240     35.0098      7.7880
+    177.5460   1484.6300     35.0197      7.7850
+    177.8380   1484.6350     35.0166      7.7860
+    178.1920   1484.6400     35.0098      7.7880
+    178.4890   1484.6450     35.0128      7.7870
+    178.8260   1484.6480     35.0174      7.7850
+    179.1320   1484.6500     35.0143      7.7850
+    179.4210   1484.6540     35.0113      7.7860
+    179.7240   1484.6590     35.0136      7.7850
+    180.0520   1484.6650     35.0204      7.7830
+    180.3800   1484.6680     35.0128      7.7850
+    180.6950   1484.6690     35.0090      7.7850
+    181.0090   1484.6710     35.0159      7.7820
+    181.3230   1484.6760     35.0090      7.7840
+    181.6670   1484.6810     35.0182      7.7810
+    181.9800   1484.6870     35.0128      7.7830
+    182.2890   1484.6920     35.0151      7.7820
+    182.6050   1484.6950     35.0136      7.7820
+    182.9220   1484.7010     35.0204      7.7800
+    183.2370   1484.7060     35.0174      7.7810
+    183.5460   1484.7130     35.0189      7.7810
+    183.8440   1484.7170     35.0204      7.7800
+    184.1690   1484.7210     35.0227      7.7790
+    184.5170   1484.7260     35.0128      7.7820
+    184.8350   1484.7300     35.0121      7.7820
+    185.1560   1484.7360     35.0159      7.7810
+    185.4590   1484.7430     35.0143      7.7820
+    185.7960   1484.7470     35.0220      7.7790
+    186.0980   1484.7510     35.0151      7.7810
+    186.3650   1484.7560     35.0128      7.7820
+    186.7000   1484.7600     35.0143      7.7810
+    186.9830   1484.7660     35.0090      7.7830
+    187.2990   1484.7690     35.0105      7.7820
+    187.6650   1484.7730     35.0121      7.7810
+    187.9760   1484.7760     35.0098      7.7810
+    188.2760   1484.7770     35.0098      7.7800
+    188.5900   1484.7780     35.0189      7.7760
+    188.8790   1484.7820     35.0121      7.7780
+    189.2170   1484.7860     35.0166      7.7760
+    189.5340   1484.7900     35.0189      7.7750
+    189.8670   1484.7960     35.0250      7.7730
+    190.2480   1484.8020     35.0189      7.7750
+    190.6050   1484.8070     35.0151      7.7760
+    190.9470   1484.8110     35.0227      7.7730
+    191.2970   1484.8150     35.0182      7.7740
+    191.6480   1484.8200     35.0212      7.7730
+    192.0150   1484.8240     35.0281      7.7700
+    192.3510   1484.8290     35.0128      7.7750
+    192.6930   1484.8340     35.0151      7.7740
+    193.0610   1484.8390     35.0174      7.7730
+    193.4120   1484.8450     35.0204      7.7720
+    193.7600   1484.8500     35.0227      7.7710
+    194.1040   1484.8550     35.0166      7.7730
+    194.4430   1484.8610     35.0258      7.7700
+    194.7960   1484.8680     35.0204      7.7720
+    195.1600   1484.8730     35.0349      7.7670
+    195.5160   1484.8780     35.0220      7.7710
+    195.8870   1484.8850     35.0197      7.7720
+    196.2520   1484.8900     35.0189      7.7720
+    196.6010   1484.8960     35.0250      7.7700
+    196.9570   1484.9000     35.0174      7.7720
+    197.2850   1484.9050     35.0235      7.7700
+    197.6230   1484.9100     35.0288      7.7680
+    197.9760   1484.9160     35.0166      7.7720
+    198.3140   1484.9210     35.0281      7.7680
+    198.6680   1484.9270     35.0258      7.7690
+    199.0230   1484.9300     35.0174      7.7710
+    199.3530   1484.9350     35.0227      7.7690
+    199.7040   1484.9410     35.0258      7.7680
+    200.0650   1484.9460     35.0189      7.7700
+    200.4030   1484.9520     35.0288      7.7670
+    200.7730   1484.9560     35.0174      7.7700
+    201.1300   1484.9620     35.0143      7.7710
+    201.4980   1484.9660     35.0189      7.7690
+    201.8440   1484.9680     35.0159      7.7690
+    202.1950   1484.9740     35.0159      7.7690
+    202.5260   1484.9790     35.0220      7.7670
+    202.8710   1484.9850     35.0159      7.7690
+    203.2230   1484.9900     35.0182      7.7680
+    203.5730   1484.9930     35.0189      7.7670
+    203.9340   1484.9990     35.0189      7.7670
+    204.2630   1485.0030     35.0212      7.7660
+    204.6080   1485.0040     35.0204      7.7650
+    204.9450   1485.0070     35.0182      7.7650
+    205.2670   1485.0110     35.0296      7.7610
+    205.6090   1485.0140     35.0182      7.7640
+    205.9640   1485.0170     35.0220      7.7620
+    206.2990   1485.0220     35.0304      7.7590
+    206.6810   1485.0250     35.0159      7.7630
+    207.0420   1485.0310     35.0220      7.7610
+    207.4070   1485.0370     35.0220      7.7610
+    207.7460   1485.0420     35.0212      7.7610
+    208.0980   1485.0460     35.0227      7.7600
+    208.4580   1485.0490     35.0266      7.7580
+    208.8130   1485.0530     35.0159      7.7610
+    209.1490   1485.0550     35.0220      7.7580
+    209.5000   1485.0600     35.0182      7.7590
+    209.8370   1485.0660     35.0311      7.7550
+    210.1930   1485.0700     35.0266      7.7560
+    210.5330   1485.0750     35.0166      7.7590
+    210.8740   1485.0800     35.0281      7.7550
+    211.2120   1485.0860     35.0197      7.7580
+    211.5590   1485.0920     35.0288      7.7550
+    211.9000   1485.0980     35.0227      7.7570
+    212.2200   1485.1020     35.0220      7.7570
+    212.5590   1485.1060     35.0174      7.7580
+    212.8880   1485.1120     35.0212      7.7570
+    213.2750   1485.1170     35.0227      7.7560
+    213.6040   1485.1230     35.0235      7.7560
+    214.0040   1485.1300     35.0235      7.7560
+    214.3500   1485.1350     35.0266      7.7550
+    214.7170   1485.1410     35.0258      7.7550
+    215.0410   1485.1450     35.0250      7.7550
+    215.3940   1485.1510     35.0250      7.7550
+    215.7280   1485.1560     35.0250      7.7550
+    216.0500   1485.1620     35.0281      7.7540
+    216.3730   1485.1660     35.0304      7.7530
+    216.7380   1485.1720     35.0182      7.7570
+    217.0800   1485.1780     35.0243      7.7550
+    217.4290   1485.1830     35.0174      7.7570
+    217.7560   1485.1880     35.0174      7.7570
+    218.1100   1485.1920     35.0220      7.7550
+    218.4730   1485.1980     35.0250      7.7540
+    218.8350   1485.2030     35.0212      7.7550
+    219.1900   1485.2090     35.0243      7.7540
+    219.5360   1485.2150     35.0273      7.7530
+    219.8920   1485.2210     35.0182      7.7560
+    220.2110   1485.2260     35.0212      7.7550
+    220.5000   1485.2310     35.0243      7.7540
+    220.8810   1485.2360     35.0235      7.7540
+    221.1990   1485.2430     35.0311      7.7520
+    221.5380   1485.2460     35.0227      7.7540
+    221.8820   1485.2500     35.0243      7.7530
+    222.2080   1485.2550     35.0204      7.7540
+    222.5350   1485.2590     35.0197      7.7540
+    222.8630   1485.2650     35.0235      7.7530
+    223.1980   1485.2700     35.0258      7.7520
+    223.5630   1485.2770     35.0204      7.7540
+    223.9140   1485.2810     35.0220      7.7530
+    224.2410   1485.2870     35.0197      7.7540
+    224.5690   1485.2930     35.0258      7.7520
+    224.9190   1485.2970     35.0273      7.7510
+    225.2470   1485.3020     35.0212      7.7530
+    225.5890   1485.3060     35.0227      7.7520
+    225.8950   1485.3120     35.0174      7.7540
+    226.2110   1485.3150     35.0250      7.7510
+    226.5460   1485.3210     35.0159      7.7540
+    226.8750   1485.3260     35.0250      7.7510
+    227.2100   1485.3310     35.0243      7.7510
+    227.5420   1485.3370     35.0250      7.7510
+    227.9030   1485.3430     35.0250      7.7510
+    228.2500   1485.3490     35.0250      7.7510
+    228.5910   1485.3520     35.0227      7.7510
+    228.9450   1485.3570     35.0250      7.7500
+    229.2920   1485.3640     35.0227      7.7510
+    229.6330   1485.3690     35.0227      7.7510
+    229.9490   1485.3720     35.0235      7.7500
+    230.2420   1485.3750     35.0159      7.7520
+    230.5770   1485.3750     35.0212      7.7490
+    230.8810   1485.3750     35.0227      7.7470
+    231.1930   1485.3750     35.0220      7.7460
+    231.5540   1485.3780     35.0075      7.7500
+    231.9010   1485.3810     35.0235      7.7440
+    232.2390   1485.3810     35.0189      7.7440
+    232.6090   1485.3810     35.0105      7.7450
+    232.9490   1485.3850     35.0281      7.7390
+    233.2760   1485.3880     35.0105      7.7440
+    233.6260   1485.3940     35.0258      7.7390
+    233.9450   1485.3980     35.0250      7.7390
+    234.2630   1485.4040     35.0166      7.7420
+    234.6310   1485.4070     35.0136      7.7420
+    234.9450   1485.4130     35.0174      7.7410
+    235.2790   1485.4180     35.0204      7.7400
+    235.6170   1485.4210     35.0212      7.7390
+    235.9280   1485.4270     35.0189      7.7400
+    236.2370   1485.4320     35.0281      7.7370
+    236.5510   1485.4360     35.0235      7.7380
+    236.9050   1485.4400     35.0189      7.7390
+    237.2600   1485.4390     35.0166      7.7380
+    237.5960   1485.4390     35.0212      7.7350
+    237.9530   1485.4420     35.0220      7.7340
+    238.2720   1485.4410     35.0174      7.7340
+    238.6380   1485.4460     35.0159      7.7340
+    238.9590   1485.4470     35.0189      7.7320
+    239.2780   1485.4490     35.0189      7.7310
+    239.5870   1485.4510     35.0227      7.7290
+    239.8980   1485.4530     35.0174      7.7300
+    240.1890   1485.4580     35.0174      7.7300
+    240.4930   1485.4590     35.0174      7.7290
+    240.8120   1485.4600     35.0227      7.7260
+    241.0990   1485.4620     35.0204      7.7260
+    241.4020   1485.4660     35.0136      7.7280
+    241.6750   1485.4690     35.0159      7.7270
+    241.9690   1485.4740     35.0159      7.7270
+    242.2640   1485.4790     35.0159      7.7270
+    242.5720   1485.4850     35.0258      7.7240
+    242.8720   1485.4890     35.0250      7.7240
+    243.2220   1485.4960     35.0197      7.7260
+    243.5590   1485.5010     35.0281      7.7230
+    243.8640   1485.5040     35.0174      7.7260
+    244.1900   1485.5090     35.0235      7.7240
+    244.4720   1485.5170     35.0166      7.7270
+    244.7730   1485.5220     35.0319      7.7220
+    245.0940   1485.5260     35.0189      7.7260
+    245.4360   1485.5310     35.0182      7.7260
+    245.7930   1485.5370     35.0273      7.7230
+    246.0940   1485.5440     35.0197      7.7260
+    246.4000   1485.5490     35.0227      7.7250
+    246.6870   1485.5530     35.0128      7.7280
+    247.0450   1485.5530     35.0204      7.7240
+    247.3330   1485.5540     35.0143      7.7250
+    247.6650   1485.5600     35.0243      7.7220
+    247.9800   1485.5630     35.0189      7.7230
+    248.3230   1485.5670     35.0204      7.7220
+    248.6430   1485.5720     35.0266      7.7200
+    248.9400   1485.5720     35.0227      7.7200
+    249.2550   1485.5740     35.0174      7.7210
+    249.5620   1485.5780     35.0189      7.7200
+    249.8590   1485.5830     35.0159      7.7210
+    250.2010   1485.5890     35.0258      7.7180
+    250.5170   1485.5950     35.0235      7.7190
+    250.8550   1485.6000     35.0197      7.7200
+    251.1760   1485.6050     35.0197      7.7200
+    251.4840   1485.6100     35.0281      7.7170
+    251.7790   1485.6130     35.0174      7.7200
+    252.0760   1485.6190     35.0250      7.7180
+    252.3940   1485.6250     35.0189      7.7200
+    252.7210   1485.6330     35.0212      7.7200
+    253.0580   1485.6380     35.0235      7.7190
+    253.3950   1485.6440     35.0182      7.7210
+    253.7270   1485.6500     35.0304      7.7170
+    254.0160   1485.6560     35.0166      7.7220
+    254.3060   1485.6590     35.0273      7.7180
+    254.6000   1485.6650     35.0250      7.7190
+    254.8810   1485.6690     35.0273      7.7180
+    255.2030   1485.6750     35.0281      7.7180
+    255.5110   1485.6800     35.0250      7.7190
+    255.8070   1485.6840     35.0212      7.7200
+    256.1220   1485.6900     35.0220      7.7200
+    256.4310   1485.6960     35.0220      7.7200
+    256.7370   1485.7030     35.0235      7.7200
+    257.0320   1485.7090     35.0250      7.7200
+    257.3710   1485.7140     35.0273      7.7190
+    257.6630   1485.7180     35.0296      7.7180
+    257.9890   1485.7220     35.0258      7.7190
+    258.3040   1485.7270     35.0250      7.7190
+    258.6200   1485.7300     35.0143      7.7220
+    258.9400   1485.7340     35.0197      7.7200
+    259.2130   1485.7390     35.0197      7.7200
+    259.5100   1485.7430     35.0220      7.7190
+    259.8140   1485.7510     35.0212      7.7200
+    260.0960   1485.7580     35.0266      7.7190
+    260.4180   1485.7630     35.0227      7.7200
+    260.7290   1485.7620     35.0182      7.7200
+    261.0480   1485.7650     35.0098      7.7220
+    261.3370   1485.7690     35.0250      7.7170
+    261.6550   1485.7740     35.0243      7.7170
+    261.9670   1485.7790     35.0212      7.7180
+    262.2770   1485.7830     35.0204      7.7180
+    262.6010   1485.7840     35.0044      7.7220
+    262.9300   1485.7850     35.0136      7.7180
+    263.2440   1485.7890     35.0121      7.7180
+    263.5680   1485.7920     35.0166      7.7160
+    263.8640   1485.7970     35.0197      7.7150
+    264.1230   1485.8000     35.0220      7.7140
+    264.4280   1485.8030     35.0258      7.7120
+    264.7150   1485.8090     35.0182      7.7150
+    265.0380   1485.8080     35.0189      7.7130
+    265.3530   1485.8100     35.0136      7.7140
+    265.6870   1485.8160     35.0075      7.7160
+    265.9870   1485.8210     35.0136      7.7140
+    266.2940   1485.8250     35.0128      7.7140
+    266.5880   1485.8290     35.0182      7.7120
+    266.9080   1485.8320     35.0220      7.7100
+    267.2200   1485.8410     35.0128      7.7140
+    267.5400   1485.8370     35.0121      7.7120
+    267.8340   1485.8420     35.0212      7.7090
+    268.1390   1485.8470     35.0182      7.7100
+    268.4790   1485.8480     35.0143      7.7100
+    268.7440   1485.8530     35.0204      7.7080
+    269.0760   1485.8580     35.0204      7.7080
+    269.3510   1485.8640     35.0128      7.7110
+    269.6850   1485.8680     35.0143      7.7100
+    269.9810   1485.8730     35.0235      7.7070
+    270.3000   1485.8790     35.0212      7.7080
+    270.6150   1485.8820     35.0098      7.7110
+    270.9160   1485.8860     35.0243      7.7060
+    271.2300   1485.8910     35.0151      7.7090
+    271.5240   1485.8970     35.0189      7.7080
+    271.8100   1485.9000     35.0204      7.7070
+    272.1310   1485.9070     35.0189      7.7080
+    272.4390   1485.9100     35.0113      7.7100
+    272.7710   1485.9150     35.0136      7.7090
+    273.0820   1485.9160     35.0105      7.7090
+    273.3850   1485.9180     35.0143      7.7070
+    273.6790   1485.9190     35.0052      7.7090
+    273.9660   1485.9200     35.0174      7.7040
+    274.2770   1485.9250     35.0174      7.7040
+    274.6110   1485.9300     35.0136      7.7050
+    274.9100   1485.9370     35.0121      7.7060
+    275.2240   1485.9410     35.0204      7.7030
+    275.5540   1485.9460     35.0227      7.7020
+    275.8420   1485.9480     35.0143      7.7040
+    276.1160   1485.9530     35.0182      7.7030
+    276.4220   1485.9580     35.0212      7.7020
+    276.7210   1485.9530     35.0189      7.7000
+    277.0270   1485.9520     35.0052      7.7030
+    277.3280   1485.9520     35.0075      7.7010
+    277.6650   1485.9530     35.0159      7.6970
+    277.9700   1485.9510     35.0128      7.6960
+    278.2630   1485.9380     35.0052      7.6940
+    278.5710   1485.9350     35.0014      7.6930
+    278.8620   1485.9430     35.0250      7.6860
+    279.1650   1485.9460     35.0174      7.6880
+    279.4800   1485.9410     35.0128      7.6870
+    279.8020   1485.9450     35.0174      7.6850
+    280.1180   1485.9490     35.0075      7.6880
+    280.4120   1485.9520     35.0151      7.6850
+    280.7280   1485.9540     35.0182      7.6830
+    281.0240   1485.9580     35.0143      7.6840
+    281.3210   1485.9620     35.0136      7.6840
+    281.6210   1485.9660     35.0128      7.6840
+    281.9390   1485.9730     35.0143      7.6840
+    282.2530   1485.9780     35.0113      7.6850
+    282.5980   1485.9830     35.0166      7.6830
+    282.8930   1485.9880     35.0136      7.6840
+    283.2100   1485.9930     35.0166      7.6830
+    283.4840   1485.9970     35.0189      7.6820
+    283.8040   1486.0000     35.0235      7.6800
+    284.1010   1486.0040     35.0166      7.6820
+    284.4140   1486.0070     35.0182      7.6810
+    284.7160   1486.0120     35.0090      7.6840
+    285.0520   1486.0160     35.0136      7.6820
+    285.3370   1486.0170     35.0105      7.6820
+    285.6470   1486.0180     35.0044      7.6830
+    285.9550   1486.0230     35.0075      7.6820
+    286.2510   1486.0240     35.0128      7.6790
+    286.5640   1486.0270     35.0174      7.6770
+    286.8840   1486.0280     35.0052      7.6800
+    287.2170   1486.0310     35.0090      7.6780
+    287.5190   1486.0350     35.0235      7.6730
+    287.7890   1486.0380     35.0098      7.6770
+    288.1190   1486.0400     35.0166      7.6740
+    288.4060   1486.0370     35.0159      7.6720
+    288.7140   1486.0450     35.0189      7.6720
+    289.0340   1486.0430     35.0128      7.6720
+    289.3450   1486.0470     35.0182      7.6700
+    289.6420   1486.0520     35.0121      7.6720
+    289.9620   1486.0550     35.0098      7.6720
+    290.2640   1486.0600     35.0128      7.6710
+    290.5670   1486.0600     35.0060      7.6720
+    290.8880   1486.0660     35.0159      7.6690
+    291.1860   1486.0740     35.0121      7.6710
+    291.5100   1486.0780     35.0166      7.6690
+    291.8080   1486.0800     35.0143      7.6690
+    292.1260   1486.0850     35.0113      7.6700
+    292.4440   1486.0900     35.0174      7.6680
+    292.7330   1486.0920     35.0121      7.6690
+    293.0410   1486.0950     35.0067      7.6700
+    293.3210   1486.0970     35.0113      7.6680
+    293.6430   1486.1000     34.9998      7.6710
+    293.9410   1486.1040     35.0052      7.6690
+    294.2570   1486.1100     35.0182      7.6650
+    294.5930   1486.1140     35.0075      7.6680
+    294.8930   1486.1150     35.0075      7.6670
+    295.1870   1486.1190     35.0067      7.6670
+    295.4890   1486.1240     35.0098      7.6660
+    295.7800   1486.1280     35.0090      7.6660
+    296.0910   1486.1340     35.0128      7.6650
+    296.4200   1486.1390     35.0098      7.6660
+    296.7270   1486.1350     35.0052      7.6650
+    297.0580   1486.1390     35.0044      7.6650
+    297.3760   1486.1430     35.0121      7.6620
+    297.6590   1486.1450     35.0067      7.6630
+    297.9620   1486.1510     35.0075      7.6630
+    298.2900   1486.1630     35.0128      7.6630
+    298.5790   1486.1630     35.0121      7.6620
+    298.9000   1486.1770     35.0189      7.6620
+    299.1900   1486.1740     35.0037      7.6650
+    299.5080   1486.1830     35.0067      7.6650
+    299.7900   1486.1870     35.0060      7.6650
+    300.0790   1486.1890     35.0098      7.6630
+    300.3780   1486.1870     34.9983      7.6650
+    300.7170   1486.1890     35.0044      7.6620
+    301.0120   1486.1990     35.0029      7.6640
+    301.3230   1486.1970     35.0029      7.6620
+    301.6370   1486.2170     35.0212      7.6600
+    301.9630   1486.2250     35.0166      7.6620
+    302.2770   1486.2300     35.0136      7.6630
+    302.6060   1486.2330     35.0174      7.6610
+    302.9080   1486.2350     34.9998      7.6660
+    303.2060   1486.2370     35.0006      7.6650
+    303.5050   1486.2400     35.0082      7.6620
+    303.7920   1486.2460     35.0090      7.6620
+    304.1010   1486.2580     35.0121      7.6630
+    304.4130   1486.2640     35.0037      7.6660
+    304.7290   1486.2700     35.0128      7.6630
+    305.0290   1486.2720     35.0044      7.6650
+    305.3420   1486.2810     35.0044      7.6660
+    305.6380   1486.2830     35.0082      7.6640
+    305.9280   1486.2660     34.9937      7.6630
+    306.2190   1486.2680     35.0037      7.6590
+    306.5160   1486.2710     35.0082      7.6570
+    306.8200   1486.2770     35.0090      7.6570
+    307.1620   1486.2760     35.0006      7.6580
+    307.4570   1486.2780     35.0075      7.6550
+    307.7600   1486.2840     35.0113      7.6540
+    308.0430   1486.2890     35.0021      7.6570
+    308.3150   1486.2950     35.0098      7.6550
+    308.6210   1486.3000     35.0098      7.6550
+    308.9300   1486.3060     35.0075      7.6560
+    309.2260   1486.3120     35.0082      7.6560
+    309.5080   1486.3160     35.0105      7.6550
+    309.8190   1486.3230     35.0029      7.6580
+    310.1280   1486.3270     35.0082      7.6560
+    310.4080   1486.3360     35.0113      7.6560
+    310.6890   1486.3520     35.0113      7.6590
+    311.0090   1486.3640     35.0166      7.6590
+    311.3340   1486.3730     35.0075      7.6630
+    311.6550   1486.3800     35.0060      7.6640
+    312.0100   1486.3850     35.0113      7.6620
+    312.2890   1486.3910     34.9998      7.6660
+    312.6170   1486.3970     35.0098      7.6630
+    312.9160   1486.4020     35.0159      7.6610
+    313.2260   1486.4080     35.0075      7.6640
+    313.5750   1486.4120     35.0029      7.6650
+    313.8800   1486.4140     35.0006      7.6650
+    314.2200   1486.4180     35.0021      7.6640
+    314.5070   1486.4210     35.0098      7.6610
+    314.8630   1486.4210     35.0113      7.6590
+    315.1700   1486.4110     34.9960      7.6600
+    315.5130   1486.4040     34.9922      7.6580
+    315.8240   1486.4040     34.9998      7.6540
+    316.1440   1486.3940     34.9907      7.6530
+    316.4420   1486.3900     34.9960      7.6490
+    316.7690   1486.4000     34.9998      7.6490
+    317.1040   1486.3940     34.9960      7.6470
+    317.4240   1486.3970     34.9915      7.6480
+    317.7630   1486.4030     34.9945      7.6470
+    318.0720   1486.4000     34.9976      7.6440
+    318.3890   1486.4040     35.0060      7.6410
+    318.7280   1486.4110     35.0037      7.6420
+    319.0310   1486.4190     35.0029      7.6430
+    319.3580   1486.4310     34.9991      7.6460
+    319.6900   1486.4310     35.0006      7.6440
+    319.9630   1486.4330     34.9991      7.6440
+    320.2710   1486.4320     34.9998      7.6420
+    320.5830   1486.4350     34.9983      7.6420
+    320.9080   1486.4250     34.9922      7.6400
+    321.2190   1486.4350     35.0052      7.6370
+    321.5660   1486.4210     34.9922      7.6360
+    321.9020   1486.4100     34.9854      7.6340
+    322.2100   1486.4040     34.9823      7.6320
+    322.5630   1486.3980     34.9907      7.6260
+    322.8660   1486.3950     34.9907      7.6240
+    323.1920   1486.3940     34.9823      7.6250
+    323.5060   1486.3800     34.9823      7.6200
+    323.8040   1486.3670     34.9831      7.6150
+    324.1080   1486.3600     34.9831      7.6120
+    324.3930   1486.3550     34.9869      7.6080
+    324.7100   1486.3570     34.9907      7.6060
+    325.0250   1486.3630     34.9915      7.6060
+    325.3640   1486.3650     34.9915      7.6050
+    325.7040   1486.3730     35.0052      7.6010
+    326.0270   1486.3750     34.9907      7.6050
+    326.3300   1486.3770     34.9915      7.6040
+    326.6490   1486.3770     34.9960      7.6010
+    326.9760   1486.3770     34.9915      7.6010
+    327.2960   1486.3810     34.9937      7.6000
+    327.5900   1486.3730     34.9838      7.6000
+    327.9390   1486.3750     34.9960      7.5950
+    328.2170   1486.3790     34.9953      7.5950
+    328.5020   1486.3830     34.9915      7.5960
+    328.7970   1486.3870     34.9968      7.5940
+    329.0760   1486.3890     34.9915      7.5950
+    329.3700   1486.3810     34.9846      7.5940
+    329.6960   1486.3710     34.9815      7.5910
+    330.0190   1486.3710     34.9861      7.5880
+    330.3630   1486.3730     34.9831      7.5880
+    330.6480   1486.3630     34.9869      7.5830
+    330.9680   1486.3560     34.9770      7.5830
+    331.2820   1486.3570     34.9823      7.5800
+    331.6050   1486.3580     34.9884      7.5770
+    331.9150   1486.3630     34.9884      7.5770
+    332.2130   1486.3630     34.9838      7.5770
+    332.5280   1486.3680     34.9869      7.5760
+    332.8320   1486.3630     34.9884      7.5730
+    333.1460   1486.3700     34.9960      7.5710
+    333.4630   1486.3740     34.9884      7.5730
+    333.7690   1486.3560     34.9701      7.5730
+    334.0560   1486.3550     34.9777      7.5690
+    334.3610   1486.3560     34.9838      7.5660
+    334.6950   1486.3580     34.9808      7.5660
+    335.0080   1486.3640     34.9846      7.5650
+    335.3320   1486.3690     34.9869      7.5640
+    335.6510   1486.3720     34.9823      7.5650
+    335.9300   1486.3780     34.9953      7.5610
+    336.2440   1486.3820     34.9915      7.5620
+    336.5450   1486.3830     34.9854      7.5630
+    336.8730   1486.3790     34.9777      7.5630
+    337.1820   1486.3730     34.9747      7.5610
+    337.5060   1486.3780     34.9808      7.5590
+    337.8460   1486.3690     34.9724      7.5580
+    338.1500   1486.3620     34.9777      7.5530
+    338.4650   1486.3640     34.9785      7.5520
+    338.7570   1486.3640     34.9808      7.5500
+    339.0600   1486.3690     34.9800      7.5500
+    339.3320   1486.3710     34.9785      7.5500
+    339.6280   1486.3740     34.9800      7.5490
+    339.9340   1486.3520     34.9640      7.5470
+    340.2620   1486.3340     34.9670      7.5400
+    340.5820   1486.3090     34.9579      7.5350
+    340.9090   1486.3060     34.9632      7.5310
+    341.2380   1486.3100     34.9777      7.5260
+    341.5660   1486.3130     34.9815      7.5240
+    341.8770   1486.3160     34.9892      7.5210
+    342.1850   1486.3170     34.9770      7.5240
+    342.4890   1486.3160     34.9838      7.5200
+    342.7710   1486.3200     34.9838      7.5200
+    343.0990   1486.3180     34.9747      7.5210
+    343.4080   1486.3230     34.9747      7.5210
+    343.7210   1486.3250     34.9777      7.5190
+    344.0240   1486.3280     34.9823      7.5170
+    344.3110   1486.3260     34.9770      7.5170
+    344.6240   1486.3280     34.9838      7.5140
+    344.9380   1486.3290     34.9800      7.5140
+    345.2400   1486.3260     34.9770      7.5130
+    345.5340   1486.3240     34.9716      7.5130
+    345.8400   1486.3220     34.9747      7.5100
+    346.1530   1486.3220     34.9739      7.5090
+    346.4620   1486.3280     34.9747      7.5090
+    346.7600   1486.3330     34.9777      7.5080
+    347.0700   1486.3360     34.9785      7.5070
+    347.3570   1486.3350     34.9770      7.5060
+    347.6580   1486.3330     34.9899      7.5000
+    347.9840   1486.3350     34.9777      7.5030
+    348.2850   1486.3280     34.9716      7.5020
+    348.5720   1486.3330     34.9777      7.5000
+    348.8590   1486.3360     34.9792      7.4990
+    349.1860   1486.3390     34.9838      7.4970
+    349.4870   1486.3420     34.9854      7.4960
+    349.7860   1486.3470     34.9792      7.4980
+    350.0780   1486.3510     34.9754      7.4990
+    350.3870   1486.3540     34.9770      7.4980
+    350.7030   1486.3560     34.9800      7.4960
+    351.0080   1486.3610     34.9800      7.4960
+    351.3230   1486.3660     34.9739      7.4980
+    351.6110   1486.3710     34.9831      7.4950
+    351.8700   1486.3690     34.9686      7.4980
+    352.1860   1486.3700     34.9686      7.4970
+    352.4900   1486.3710     34.9716      7.4950
+    352.8080   1486.3780     34.9792      7.4930
+    353.1200   1486.3790     34.9693      7.4950
+    353.4650   1486.3840     34.9747      7.4930
+    353.7910   1486.3870     34.9823      7.4900
+    354.1010   1486.3890     34.9709      7.4930
+    354.4000   1486.3940     34.9770      7.4910
+    354.7080   1486.3970     34.9747      7.4910
+    355.0030   1486.4010     34.9770      7.4900
+    355.2870   1486.4040     34.9792      7.4890
+    355.6110   1486.4030     34.9709      7.4900
+    355.9440   1486.4000     34.9701      7.4880
+    356.2850   1486.4010     34.9693      7.4870
+    356.6360   1486.4020     34.9655      7.4870
+    356.9590   1486.4070     34.9716      7.4850
+    357.2560   1486.4110     34.9648      7.4870
+    357.5760   1486.4130     34.9739      7.4830
+    357.8920   1486.4140     34.9709      7.4830
+    358.1890   1486.4180     34.9731      7.4820
+    358.5180   1486.4220     34.9686      7.4830
+    358.7940   1486.4230     34.9686      7.4820
+    359.1040   1486.4260     34.9731      7.4800
+    359.4290   1486.4290     34.9716      7.4800
+    359.7300   1486.4310     34.9663      7.4810
+    360.0570   1486.4330     34.9693      7.4790
+    360.3910   1486.4380     34.9716      7.4780
+    360.7010   1486.4370     34.9701      7.4770
+    361.0290   1486.4380     34.9663      7.4770
+    361.3310   1486.4420     34.9747      7.4740
+    361.6430   1486.4450     34.9701      7.4750
+    361.9320   1486.4500     34.9762      7.4730
+    362.2040   1486.4510     34.9701      7.4740
+    362.5130   1486.4520     34.9640      7.4750
+    362.8110   1486.4510     34.9686      7.4720
+    363.1320   1486.4490     34.9655      7.4710
+    363.4350   1486.4520     34.9731      7.4680
+    363.7340   1486.4550     34.9686      7.4690
+    364.0690   1486.4550     34.9701      7.4670
+    364.3570   1486.4490     34.9617      7.4670
+    364.6700   1486.4520     34.9632      7.4660
+    364.9600   1486.4500     34.9609      7.4650
+    365.2770   1486.4470     34.9602      7.4630
+    365.6220   1486.4480     34.9625      7.4610
+    365.9460   1486.4500     34.9686      7.4580
+    366.2660   1486.4550     34.9686      7.4580
+    366.6190   1486.4590     34.9701      7.4570
+    366.9620   1486.4630     34.9655      7.4580
+    367.2730   1486.4630     34.9739      7.4540
+    367.6280   1486.4670     34.9632      7.4570
+    367.9400   1486.4720     34.9724      7.4540
+    368.3070   1486.4760     34.9709      7.4540
+    368.6540   1486.4810     34.9701      7.4540
+    369.0150   1486.4840     34.9739      7.4520
+    369.3460   1486.4890     34.9701      7.4530
+    369.6750   1486.4940     34.9701      7.4530
+    370.0140   1486.5000     34.9701      7.4530
+    370.3310   1486.5040     34.9724      7.4520
+    370.6600   1486.5100     34.9754      7.4510
+    370.9700   1486.5130     34.9678      7.4530
+    371.3040   1486.5170     34.9754      7.4500
+    371.6420   1486.5210     34.9747      7.4500
+    371.9800   1486.5240     34.9663      7.4520
+    372.3090   1486.5290     34.9686      7.4510
+    372.6500   1486.5330     34.9678      7.4510
+    372.9800   1486.5390     34.9709      7.4500
+    373.3330   1486.5430     34.9693      7.4500
+    373.6850   1486.5470     34.9648      7.4510
+    374.0330   1486.5520     34.9640      7.4510
+    374.3450   1486.5580     34.9739      7.4480
+    374.6850   1486.5620     34.9670      7.4500
+    375.0310   1486.5680     34.9701      7.4490
+    375.3350   1486.5710     34.9686      7.4490
+    375.6770   1486.5760     34.9709      7.4480
+    376.0440   1486.5820     34.9678      7.4490
+    376.3690   1486.5850     34.9686      7.4480
+    376.7000   1486.5890     34.9617      7.4500
+    377.0450   1486.5900     34.9609      7.4490
+    377.3600   1486.5870     34.9632      7.4460
+    377.6960   1486.5900     34.9670      7.4440
+    378.0450   1486.5920     34.9670      7.4430
+    378.3480   1486.5970     34.9670      7.4430
+    378.6580   1486.6020     34.9701      7.4420
+    379.0050   1486.6080     34.9709      7.4420
+    379.3390   1486.6050     34.9670      7.4410
+    379.6710   1486.5940     34.9472      7.4430
+    380.0200   1486.5910     34.9556      7.4380
+    380.3570   1486.5880     34.9548      7.4360
+    380.6880   1486.5910     34.9625      7.4330
+    380.9950   1486.5920     34.9648      7.4310
+    381.3290   1486.5880     34.9571      7.4310
+    381.6640   1486.5850     34.9594      7.4280
+    381.9960   1486.5850     34.9648      7.4250
+    382.3460   1486.5850     34.9564      7.4260
+    382.6720   1486.5860     34.9625      7.4230
+    383.0000   1486.5930     34.9632      7.4230
+    383.3120   1486.5990     34.9670      7.4220
+    383.6560   1486.6030     34.9594      7.4240
+    383.9600   1486.6080     34.9655      7.4220
+    384.2870   1486.6110     34.9670      7.4210
+    384.6480   1486.6170     34.9609      7.4230
+    384.9990   1486.6200     34.9709      7.4190
+    385.3060   1486.6180     34.9586      7.4210
+    385.6550   1486.6020     34.9510      7.4180
+    385.9740   1486.5980     34.9556      7.4140
+    386.2850   1486.6000     34.9503      7.4150
+    386.6080   1486.6020     34.9564      7.4120
+    386.9280   1486.6050     34.9548      7.4120
+    387.2650   1486.5990     34.9518      7.4100
+    387.6100   1486.6000     34.9541      7.4080
+    387.9520   1486.6040     34.9586      7.4060
+    388.2820   1486.6080     34.9510      7.4080
+    388.6290   1486.6140     34.9579      7.4060
+    388.9380   1486.6190     34.9571      7.4060
+    389.2560   1486.6230     34.9655      7.4030
+    389.5890   1486.6280     34.9564      7.4060
+    389.9160   1486.6280     34.9548      7.4050
+    390.2110   1486.6310     34.9625      7.4020
+    390.5580   1486.6320     34.9495      7.4050
+    390.8740   1486.6350     34.9503      7.4040
+    391.2010   1486.6380     34.9640      7.3990
+    391.5380   1486.6450     34.9617      7.4000
+    391.8750   1486.6490     34.9579      7.4010
+    392.2230   1486.6550     34.9579      7.4010
+    392.5560   1486.6550     34.9564      7.4000
+    392.8780   1486.6610     34.9541      7.4010
+    393.2090   1486.6640     34.9487      7.4020
+    393.5040   1486.6690     34.9701      7.3950
+    393.8270   1486.6740     34.9609      7.3980
+    394.1470   1486.6790     34.9579      7.3990
+    394.4700   1486.6830     34.9503      7.4010
+    394.7890   1486.6850     34.9541      7.3990
+    395.1270   1486.6890     34.9525      7.3990
+    395.4600   1486.6940     34.9609      7.3960
+    395.7600   1486.7010     34.9571      7.3980
+    396.0710   1486.7040     34.9548      7.3980
+    396.3800   1486.7090     34.9579      7.3970
+    396.7170   1486.7120     34.9556      7.3970
+    397.0170   1486.7160     34.9518      7.3980
+    397.3650   1486.7200     34.9571      7.3960
+    397.6800   1486.7270     34.9640      7.3940
+    398.0130   1486.7300     34.9594      7.3950
+    398.3590   1486.7340     34.9548      7.3960
+    398.6880   1486.7360     34.9487      7.3970
+    399.0160   1486.7410     34.9548      7.3950
+    399.3090   1486.7310     34.9457      7.3940
+    399.6110   1486.7280     34.9518      7.3900
+    399.9410   1486.7350     34.9525      7.3900
+    400.2490   1486.7380     34.9602      7.3870
+    400.5670   1486.7430     34.9541      7.3890
+    400.8830   1486.7480     34.9571      7.3880
+    401.2180   1486.7520     34.9525      7.3890
+    401.5410   1486.7580     34.9625      7.3860
+    401.8450   1486.7630     34.9472      7.3910
+    402.1450   1486.7680     34.9564      7.3880
+    402.4710   1486.7740     34.9594      7.3870
+    402.8250   1486.7790     34.9586      7.3870
+    403.1820   1486.7830     34.9449      7.3910
+    403.4760   1486.7900     34.9525      7.3890
+    403.7960   1486.7940     34.9579      7.3870
+    404.0800   1486.8000     34.9586      7.3870
+    404.3930   1486.8040     34.9548      7.3880
+    404.7140   1486.8090     34.9548      7.3880
+    405.0320   1486.8150     34.9556      7.3880
+    405.3570   1486.8190     34.9510      7.3890
+    405.6770   1486.8170     34.9510      7.3870
+    406.0050   1486.8040     34.9396      7.3860
+    406.3130   1486.8060     34.9464      7.3830
+    406.6410   1486.8100     34.9541      7.3800
+    406.9640   1486.8140     34.9533      7.3800
+    407.2850   1486.8090     34.9449      7.3800
+    407.5930   1486.8130     34.9442      7.3800
+    407.9240   1486.8170     34.9518      7.3770
+    408.2320   1486.8210     34.9480      7.3780
+    408.5630   1486.8260     34.9480      7.3780
+    408.8710   1486.8300     34.9533      7.3760
+    409.1550   1486.8330     34.9609      7.3730
+    409.4670   1486.8370     34.9571      7.3740
+    409.7950   1486.8400     34.9548      7.3740
+    410.1200   1486.8440     34.9564      7.3730
+    410.4440   1486.8480     34.9495      7.3750
+    410.7540   1486.8510     34.9541      7.3730
+    411.0940   1486.8530     34.9510      7.3730
+    411.4190   1486.8560     34.9518      7.3720
+    411.7100   1486.8630     34.9571      7.3710
+    412.0150   1486.8670     34.9533      7.3720
+    412.3380   1486.8710     34.9548      7.3710
+    412.6380   1486.8760     34.9609      7.3690
+    412.9600   1486.8820     34.9556      7.3710
+    413.2850   1486.8870     34.9579      7.3700
+    413.5850   1486.8930     34.9495      7.3730
+    413.9100   1486.8980     34.9556      7.3710
+    414.2300   1486.9050     34.9449      7.3750
+    414.5490   1486.9090     34.9525      7.3720
+    414.8840   1486.9130     34.9548      7.3710
+    415.1830   1486.9160     34.9442      7.3740
+    415.5170   1486.9220     34.9533      7.3710
+    415.8260   1486.9240     34.9480      7.3720
+    416.1480   1486.9300     34.9548      7.3700
+    416.4570   1486.9350     34.9571      7.3690
+    416.7710   1486.9390     34.9533      7.3700
+    417.0610   1486.9420     34.9487      7.3710
+    417.3690   1486.9470     34.9609      7.3670
+    417.6930   1486.9510     34.9571      7.3680
+    417.9880   1486.9540     34.9495      7.3700
+    418.3170   1486.9590     34.9579      7.3670
+    418.6720   1486.9650     34.9548      7.3680
+    418.9770   1486.9710     34.9525      7.3690
+    419.3070   1486.9770     34.9594      7.3670
+    419.6220   1486.9810     34.9457      7.3710
+    419.9250   1486.9860     34.9548      7.3680
+    420.2180   1486.9880     34.9556      7.3670
+    420.5370   1486.9900     34.9411      7.3710
+    420.8640   1486.9960     34.9510      7.3680
+    421.1770   1487.0010     34.9503      7.3680
+    421.4790   1487.0050     34.9525      7.3670
+    421.7690   1487.0080     34.9510      7.3670
+    422.0660   1487.0130     34.9571      7.3650
+    422.3650   1487.0160     34.9464      7.3680
+    422.6410   1487.0190     34.9487      7.3670
+    422.9230   1487.0220     34.9472      7.3670
+    423.2540   1487.0250     34.9510      7.3650
+    423.5330   1487.0280     34.9533      7.3640
+    423.8350   1487.0320     34.9487      7.3650
+    424.1410   1487.0360     34.9449      7.3660
+    424.4140   1487.0400     34.9480      7.3650
+    424.6980   1487.0440     34.9533      7.3630
+    424.9920   1487.0500     34.9510      7.3640
+    425.3130   1487.0540     34.9564      7.3620
+    425.6160   1487.0580     34.9525      7.3630
+    425.9220   1487.0630     34.9495      7.3640
+    426.1950   1487.0670     34.9548      7.3620
+    426.5160   1487.0710     34.9419      7.3660
+    426.7780   1487.0760     34.9571      7.3610
+    427.0780   1487.0810     34.9480      7.3640
+    427.3630   1487.0860     34.9487      7.3640
+    427.6690   1487.0900     34.9533      7.3620
+    427.9390   1487.0950     34.9449      7.3650
+    428.2660   1487.0990     34.9464      7.3640
+    428.5590   1487.1030     34.9464      7.3640
+    428.8260   1487.1070     34.9487      7.3630
+    429.1510   1487.1120     34.9518      7.3620
+    429.4140   1487.1180     34.9464      7.3640
+    429.7290   1487.1220     34.9518      7.3620
+    430.0090   1487.1270     34.9548      7.3610
+    430.3210   1487.1300     34.9442      7.3640
+    430.5930   1487.1350     34.9510      7.3620
+    430.8840   1487.1400     34.9449      7.3640
+    431.1660   1487.1440     34.9472      7.3630
+    431.4600   1487.1480     34.9525      7.3610
+    431.7520   1487.1520     34.9457      7.3630
+    432.0320   1487.1580     34.9472      7.3630
+    432.3420   1487.1620     34.9518      7.3610
+    432.6450   1487.1650     34.9503      7.3610
+    432.9330   1487.1650     34.9403      7.3630
+    433.2200   1487.1680     34.9419      7.3620
+    433.4850   1487.1730     34.9457      7.3610
+    433.7810   1487.1780     34.9487      7.3600
+    434.0630   1487.1830     34.9426      7.3620
+    434.3360   1487.1840     34.9495      7.3590
+    434.6180   1487.1860     34.9442      7.3600
+    434.9320   1487.1870     34.9472      7.3580
+    435.2180   1487.1910     34.9403      7.3600
+    435.5210   1487.1900     34.9411      7.3580
+    435.8350   1487.1920     34.9327      7.3600
+    436.1150   1487.1960     34.9472      7.3550
+    436.4120   1487.1960     34.9373      7.3570
+    436.6550   1487.2030     34.9457      7.3550
+    436.9430   1487.2060     34.9472      7.3540
+    437.2200   1487.2110     34.9480      7.3540
+    437.5250   1487.2160     34.9541      7.3520
+    437.8130   1487.2220     34.9518      7.3530
+    438.0960   1487.2250     34.9411      7.3560
+    438.3900   1487.2310     34.9480      7.3540
+    438.6470   1487.2360     34.9518      7.3530
+    438.9690   1487.2390     34.9442      7.3550
+    439.2660   1487.2420     34.9487      7.3530
+    439.5290   1487.2440     34.9464      7.3530
+    439.8240   1487.2470     34.9419      7.3540
+    440.1020   1487.2520     34.9548      7.3500
+    440.3700   1487.2560     34.9480      7.3520
+    440.6220   1487.2590     34.9503      7.3510
+    440.9090   1487.2630     34.9464      7.3520
+    441.1510   1487.2660     34.9457      7.3520
+    441.4460   1487.2710     34.9426      7.3530
+    441.7490   1487.2740     34.9380      7.3540
+    442.0330   1487.2790     34.9380      7.3540
+    442.3030   1487.2830     34.9442      7.3520
+    442.5840   1487.2850     34.9419      7.3520
+    442.8430   1487.2880     34.9342      7.3540
+    443.0890   1487.2900     34.9449      7.3500
+    443.4080   1487.2950     34.9388      7.3520
+    443.7380   1487.2990     34.9403      7.3510
+    444.0430   1487.3050     34.9442      7.3500
+    444.3680   1487.3090     34.9403      7.3510
+    444.6610   1487.3140     34.9403      7.3510
+    445.0000   1487.3180     34.9419      7.3500
+    445.3130   1487.3220     34.9380      7.3510
+    445.6500   1487.3240     34.9472      7.3470
+    445.9800   1487.3270     34.9396      7.3490
+    446.3160   1487.3320     34.9449      7.3470
+    446.6840   1487.3380     34.9388      7.3490
+    447.0180   1487.3420     34.9525      7.3440
+    447.3550   1487.3480     34.9411      7.3480
+    447.7110   1487.3540     34.9289      7.3520
+    448.0650   1487.3570     34.9388      7.3480
+    448.3680   1487.3620     34.9419      7.3470
+    448.7040   1487.3660     34.9403      7.3470
+    449.0480   1487.3700     34.9419      7.3460
+    449.3980   1487.3730     34.9426      7.3450
+    449.7580   1487.3790     34.9457      7.3440
+    450.1010   1487.3830     34.9388      7.3460
+    450.4160   1487.3860     34.9335      7.3470
+    450.7450   1487.3920     34.9495      7.3420
+    451.0420   1487.3930     34.9373      7.3450
+    451.3780   1487.3950     34.9373      7.3440
+    451.7040   1487.3980     34.9472      7.3400
+    452.0530   1487.4010     34.9457      7.3400
+    452.4030   1487.4070     34.9396      7.3420
+    452.7150   1487.4070     34.9319      7.3430
+    453.0600   1487.4110     34.9304      7.3430
+    453.4030   1487.4170     34.9403      7.3400
+    453.7220   1487.4200     34.9472      7.3370
+    454.0740   1487.4240     34.9396      7.3390
+    454.4060   1487.4300     34.9434      7.3380
+    454.7450   1487.4360     34.9373      7.3400
+    455.0640   1487.4390     34.9358      7.3400
+    455.4030   1487.4430     34.9403      7.3380
+    455.7450   1487.4440     34.9335      7.3390
+    456.0590   1487.4430     34.9319      7.3380
+    456.3890   1487.4440     34.9312      7.3370
+    456.7500   1487.4490     34.9335      7.3360
+    457.0800   1487.4580     34.9457      7.3330
+    457.4210   1487.4620     34.9380      7.3350
+    457.7670   1487.4660     34.9426      7.3330
+    458.1010   1487.4690     34.9342      7.3350
+    458.4330   1487.4710     34.9319      7.3350
+    458.7530   1487.4760     34.9373      7.3330
+    459.0820   1487.4820     34.9411      7.3320
+    459.4220   1487.4870     34.9434      7.3310
+    459.7890   1487.4920     34.9335      7.3340
+    460.0990   1487.4980     34.9373      7.3330
+    460.4470   1487.5030     34.9426      7.3310
+    460.7850   1487.5090     34.9426      7.3310
+    461.1020   1487.5140     34.9457      7.3300
+    461.4610   1487.5200     34.9365      7.3330
+    461.7960   1487.5160     34.9319      7.3320
+    462.1350   1487.5180     34.9350      7.3300
+    462.4520   1487.5220     34.9281      7.3320
+    462.7910   1487.5280     34.9380      7.3290
+    463.1010   1487.5340     34.9442      7.3270
+    463.4580   1487.5390     34.9312      7.3310
+    463.7870   1487.5430     34.9304      7.3310
+    464.1360   1487.5490     34.9335      7.3300
+    464.4590   1487.5540     34.9396      7.3280
+    464.7940   1487.5590     34.9327      7.3300
+    465.1010   1487.5640     34.9358      7.3290
+    465.4370   1487.5690     34.9411      7.3270
+    465.7820   1487.5780     34.9350      7.3300
+    466.1230   1487.5800     34.9319      7.3300
+    466.4630   1487.5820     34.9442      7.3250
+    466.7960   1487.5860     34.9274      7.3300
+    467.1240   1487.5910     34.9304      7.3290
+    467.4770   1487.5950     34.9350      7.3270
+    467.8000   1487.6010     34.9358      7.3270
+    468.1300   1487.6040     34.9335      7.3270
+    468.4530   1487.6080     34.9258      7.3290
+    468.8160   1487.6130     34.9312      7.3270
+    469.1320   1487.6150     34.9319      7.3260
+    469.4540   1487.6190     34.9342      7.3250
+    469.8030   1487.6230     34.9236      7.3280
+    470.1300   1487.6260     34.9304      7.3250
+    470.4370   1487.6290     34.9350      7.3230
+    470.7590   1487.6310     34.9289      7.3240
+    471.1110   1487.6390     34.9342      7.3230
+    471.4430   1487.6420     34.9289      7.3240
+    471.7950   1487.6470     34.9342      7.3220
+    472.1580   1487.6510     34.9236      7.3250
+    472.4850   1487.6560     34.9358      7.3210
+    472.7990   1487.6620     34.9297      7.3230
+    473.1490   1487.6670     34.9327      7.3220
+    473.4690   1487.6720     34.9319      7.3220
+    473.8260   1487.6760     34.9274      7.3230
+    474.1900   1487.6830     34.9403      7.3190
+    474.5090   1487.6890     34.9319      7.3220
+    474.8500   1487.6920     34.9419      7.3180
+    475.1660   1487.6960     34.9289      7.3220
+    475.4880   1487.7010     34.9342      7.3200
+    475.7990   1487.7050     34.9365      7.3190
+    476.1250   1487.7040     34.9251      7.3210
+    476.4480   1487.7080     34.9304      7.3190
+    476.7980   1487.7090     34.9297      7.3180
+    477.1400   1487.7130     34.9312      7.3170
+    477.4870   1487.7190     34.9281      7.3180
+    477.8260   1487.7240     34.9342      7.3160
+    478.1560   1487.7300     34.9251      7.3190
+    478.4570   1487.7360     34.9258      7.3190
+    478.8020   1487.7390     34.9426      7.3130
+    479.1400   1487.7450     34.9274      7.3180
+    479.4960   1487.7510     34.9213      7.3200
+    479.8380   1487.7570     34.9274      7.3180
+    480.1610   1487.7630     34.9342      7.3160
+    480.4890   1487.7700     34.9258      7.3190
+    480.7980   1487.7730     34.9243      7.3190
+    481.1290   1487.7800     34.9258      7.3190
+    481.4480   1487.7840     34.9274      7.3180
+    481.7950   1487.7880     34.9327      7.3160
+    482.0990   1487.7910     34.9243      7.3180
+    482.4540   1487.7960     34.9335      7.3150
+    482.7820   1487.8000     34.9228      7.3180
+    483.1440   1487.8060     34.9197      7.3190
+    483.4590   1487.8130     34.9243      7.3180
+    483.8020   1487.8160     34.9281      7.3160
+    484.1120   1487.8220     34.9258      7.3170
+    484.4690   1487.8270     34.9190      7.3190
+    484.7990   1487.8290     34.9251      7.3160
+    485.1370   1487.8340     34.9274      7.3150
+    485.4830   1487.8420     34.9174      7.3190
+    485.7840   1487.8450     34.9190      7.3180
+    486.0800   1487.8500     34.9342      7.3130
+    486.4180   1487.8560     34.9220      7.3170
+    486.7480   1487.8610     34.9190      7.3180
+    487.0880   1487.8680     34.9258      7.3160
+    487.3880   1487.8730     34.9350      7.3130
+    487.7030   1487.8790     34.9297      7.3150
+    488.0370   1487.8830     34.9281      7.3150
+    488.3250   1487.8870     34.9365      7.3120
+    488.6150   1487.8930     34.9319      7.3140
+    488.8680   1487.8960     34.9274      7.3150
+    489.1280   1487.9030     34.9266      7.3160
+    489.4430   1487.9070     34.9289      7.3150
+    489.7240   1487.9110     34.9281      7.3150
+    490.0170   1487.9160     34.9281      7.3150
+    490.3170   1487.9230     34.9266      7.3160
+    490.5510   1487.9270     34.9266      7.3160
+    490.8410   1487.9310     34.9327      7.3140
+    491.1200   1487.9360     34.9205      7.3180
+    491.4270   1487.9400     34.9319      7.3140
+    491.6680   1487.9450     34.9297      7.3150
+    491.9600   1487.9470     34.9243      7.3160
+    492.2140   1487.9510     34.9304      7.3140
+    492.4860   1487.9540     34.9258      7.3150
+    492.7420   1487.9600     34.9213      7.3170
+    493.0130   1487.9640     34.9327      7.3130
+    493.2570   1487.9690     34.9274      7.3150
+    493.5440   1487.9740     34.9304      7.3140
+    493.8310   1487.9780     34.9274      7.3150
+    494.1190   1487.9830     34.9274      7.3150
+    494.4240   1487.9870     34.9205      7.3170
+    494.6990   1487.9890     34.9152      7.3180
+    494.9710   1487.9930     34.9205      7.3160
+    495.2250   1487.9950     34.9281      7.3130
+    495.4440   1487.9990     34.9289      7.3130
+    495.7250   1488.0040     34.9289      7.3130
+    495.9910   1488.0090     34.9350      7.3110
+    496.2530   1488.0130     34.9258      7.3140
+    496.5400   1488.0160     34.9213      7.3150
+    496.8180   1488.0200     34.9243      7.3140
+    497.1130   1488.0250     34.9274      7.3130
+    497.3690   1488.0290     34.9297      7.3120
+    497.6460   1488.0340     34.9274      7.3130
+    497.9170   1488.0390     34.9213      7.3150
+    498.1700   1488.0420     34.9236      7.3140
+    498.4120   1488.0470     34.9182      7.3160
+    498.6650   1488.0500     34.9236      7.3140
+    498.9300   1488.0550     34.9266      7.3130
+    499.2080   1488.0590     34.9236      7.3140
+    499.4740   1488.0640     34.9327      7.3110
+    499.6940   1488.0690     34.9220      7.3150
+    499.9480   1488.0720     34.9358      7.3100
+    500.2140   1488.0760     34.9205      7.3150
+    500.4760   1488.0810     34.9213      7.3150
+    500.7350   1488.0850     34.9297      7.3120
+    501.0100   1488.0890     34.9205      7.3150
+    501.2680   1488.0940     34.9236      7.3140
+    501.5210   1488.0970     34.9197      7.3150
+    501.7400   1488.1010     34.9258      7.3130
+    501.9730   1488.1040     34.9197      7.3150
+    502.1970   1488.1070     34.9281      7.3120
+    502.4280   1488.1100     34.9213      7.3140
+    502.6830   1488.1140     34.9152      7.3160
+    502.9400   1488.1160     34.9281      7.3110
+    503.2000   1488.1210     34.9228      7.3130
+    503.4400   1488.1240     34.9251      7.3120
+    503.6910   1488.1290     34.9197      7.3140
+    503.9390   1488.1340     34.9297      7.3110
+    504.1680   1488.1370     34.9228      7.3130
+    504.4250   1488.1390     34.9205      7.3130
+    504.6650   1488.1460     34.9327      7.3100
+    504.8970   1488.1490     34.9197      7.3140
+    505.1670   1488.1560     34.9182      7.3150
+    505.4160   1488.1580     34.9197      7.3140
+    505.6300   1488.1590     34.9205      7.3130
+    505.8730   1488.1630     34.9174      7.3140
+    506.0620   1488.1650     34.9228      7.3120
+    506.2710   1488.1690     34.9266      7.3110
+    506.5070   1488.1730     34.9236      7.3120
+    506.7360   1488.1770     34.9174      7.3140
+    507.0050   1488.1810     34.9167      7.3140
+    507.3590   1488.1860     34.9190      7.3130
+    507.6590   1488.1920     34.9228      7.3120
+    507.9540   1488.1970     34.9236      7.3120
+    508.2840   1488.2010     34.9220      7.3120
+    508.6130   1488.2060     34.9281      7.3100
+    508.9440   1488.2110     34.9243      7.3110
+    509.2620   1488.2150     34.9236      7.3110
+    509.6100   1488.2220     34.9152      7.3140
+    509.9700   1488.2280     34.9274      7.3100
+    510.2930   1488.2300     34.9152      7.3130
+    510.6020   1488.2350     34.9152      7.3130
+    510.9460   1488.2390     34.9197      7.3110
+    511.2580   1488.2450     34.9174      7.3120
+    511.6010   1488.2510     34.9213      7.3110
+    511.9170   1488.2560     34.9174      7.3120
+    512.2600   1488.2610     34.9075      7.3150
+    512.5830   1488.2660     34.9258      7.3090
+    512.8740   1488.2700     34.9190      7.3110
+    513.1760   1488.2760     34.9258      7.3090
+    513.4910   1488.2820     34.9144      7.3130
+    513.8220   1488.2870     34.9228      7.3100
+    514.1600   1488.2920     34.9197      7.3110
+    514.5040   1488.2970     34.9220      7.3100
+    514.8470   1488.3030     34.9159      7.3120
+    515.2000   1488.3070     34.9174      7.3110
+    515.5190   1488.3110     34.9106      7.3130
+    515.8570   1488.3120     34.9159      7.3100
+    516.1780   1488.3180     34.9167      7.3100
+    516.4800   1488.3230     34.9136      7.3110
+    516.8130   1488.3280     34.9190      7.3090
+    517.1130   1488.3350     34.9174      7.3100
+    517.4430   1488.3400     34.9144      7.3110
+    517.7560   1488.3440     34.9197      7.3090
+    518.0550   1488.3490     34.9197      7.3090
+    518.3780   1488.3550     34.9197      7.3090
+    518.6920   1488.3610     34.9266      7.3070
+    519.0070   1488.3670     34.9243      7.3080
+    519.3560   1488.3730     34.9182      7.3100
+    519.6710   1488.3780     34.9091      7.3130
+    519.9810   1488.3820     34.9167      7.3100
+    520.2730   1488.3860     34.9167      7.3100
+    520.6030   1488.3930     34.9266      7.3070
+    520.8860   1488.3990     34.9152      7.3110
+    521.2230   1488.4020     34.9106      7.3120
+    521.5270   1488.4060     34.9159      7.3100
+    521.8890   1488.4130     34.9197      7.3090
+    522.2390   1488.4180     34.9129      7.3110
+    522.5620   1488.4230     34.9213      7.3080
+    522.8590   1488.4270     34.9144      7.3100
+    523.1730   1488.4330     34.9182      7.3090
+    523.4880   1488.4380     34.9243      7.3070
+    523.8000   1488.4430     34.9182      7.3090
+    524.1130   1488.4450     34.9182      7.3080
+    524.4100   1488.4460     34.9091      7.3100
+    524.7030   1488.4500     34.9236      7.3050
+    524.9960   1488.4520     34.9121      7.3080
+    525.3020   1488.4570     34.9182      7.3060
+    525.5930   1488.4610     34.9174      7.3060
+    525.8910   1488.4660     34.9174      7.3060
+    526.1970   1488.4720     34.9213      7.3050
+    526.5200   1488.4750     34.9136      7.3070
+    526.8060   1488.4790     34.9190      7.3050
+    527.1080   1488.4830     34.9091      7.3080
+    527.3690   1488.4890     34.9106      7.3080
+    527.6470   1488.4950     34.9174      7.3060
+    527.9330   1488.5010     34.9213      7.3050
+    528.2270   1488.5040     34.9197      7.3050
+    528.5550   1488.5080     34.9159      7.3060
+    528.8150   1488.5120     34.9121      7.3070
+    529.1230   1488.5170     34.9182      7.3050
+    529.4150   1488.5220     34.9121      7.3070
+    529.6840   1488.5270     34.9129      7.3070
+    529.9840   1488.5320     34.9129      7.3070
+    530.2550   1488.5360     34.9121      7.3070
+    530.5860   1488.5410     34.9182      7.3050
+    530.8790   1488.5460     34.9152      7.3060
+    531.1860   1488.5510     34.9152      7.3060
+    531.4970   1488.5530     34.9129      7.3060
+    531.7950   1488.5560     34.9113      7.3060
+    532.0980   1488.5610     34.9045      7.3080
+    532.4090   1488.5640     34.9152      7.3040
+    532.6990   1488.5690     34.9091      7.3060
+    533.0120   1488.5710     34.9190      7.3020
+    533.2990   1488.5760     34.9129      7.3040
+    533.5770   1488.5800     34.9159      7.3030
+    533.8810   1488.5870     34.9113      7.3050
+    534.1450   1488.5890     34.9121      7.3040
+    534.4470   1488.5930     34.9113      7.3040
+    534.7430   1488.5970     34.9075      7.3050
+    535.0420   1488.6020     34.9167      7.3020
+    535.3100   1488.6060     34.9136      7.3030
+    535.6120   1488.6130     34.9121      7.3040
+    535.9750   1488.6180     34.9174      7.3020
+    536.3040   1488.6220     34.9159      7.3020
+    536.6270   1488.6270     34.9159      7.3020
+    536.9570   1488.6320     34.9121      7.3030
+    537.2890   1488.6380     34.9190      7.3010
+    537.5900   1488.6430     34.9129      7.3030
+    537.9100   1488.6490     34.9129      7.3030
+    538.2360   1488.6530     34.9121      7.3030
+    538.5600   1488.6580     34.9113      7.3030
+    538.8720   1488.6620     34.9045      7.3050
+    539.2080   1488.6680     34.9144      7.3020
+    539.5350   1488.6720     34.9129      7.3020
+    539.8740   1488.6770     34.9060      7.3040
+    540.1840   1488.6810     34.9144      7.3010
+    540.5260   1488.6880     34.9159      7.3010
+    540.8170   1488.6900     34.9136      7.3010
+    541.1220   1488.6940     34.9152      7.3000
+    541.3970   1488.6990     34.9098      7.3020
+    541.7110   1488.7040     34.9159      7.3000
+    542.0160   1488.7080     34.9113      7.3010
+    542.3370   1488.7150     34.9190      7.2990
+    542.6530   1488.7170     34.9106      7.3010
+    542.8970   1488.7200     34.9098      7.3010
+    543.2010   1488.7250     34.9129      7.3000
+    543.4960   1488.7310     34.9167      7.2990
+    543.7800   1488.7360     34.9197      7.2980
+    544.0940   1488.7400     34.9129      7.3000
+    544.3890   1488.7440     34.9152      7.2990
+    544.6610   1488.7490     34.9060      7.3020
+    544.9620   1488.7550     34.9098      7.3010
+    545.2420   1488.7610     34.9144      7.3000
+    545.5470   1488.7630     34.9083      7.3010
+    545.8370   1488.7670     34.9052      7.3020
+    546.1890   1488.7740     34.9121      7.3000
+    546.5480   1488.7800     34.9091      7.3010
+    546.9350   1488.7840     34.9098      7.3000
+    547.2660   1488.7900     34.9136      7.2990
+    547.5850   1488.7940     34.9091      7.3000
+    547.9190   1488.7990     34.9091      7.3000
+    548.2580   1488.8030     34.9045      7.3010
+    548.5930   1488.8090     34.9075      7.3000
+    548.9030   1488.8140     34.9106      7.2990
+    549.2300   1488.8180     34.9068      7.3000
+    549.4830   1488.8230     34.9075      7.3000
+    549.7940   1488.8280     34.9098      7.2990
+    550.0880   1488.8320     34.9091      7.2990
+    550.3640   1488.8380     34.9136      7.2980
+    550.6680   1488.8430     34.9136      7.2980
+    550.9740   1488.8470     34.9037      7.3010
+    551.3330   1488.8500     34.9014      7.3010
+    551.6670   1488.8560     34.9106      7.2980
+    551.9960   1488.8600     34.9060      7.2990
+    552.3070   1488.8610     34.9030      7.2990
+    552.6400   1488.8630     34.9060      7.2970
+    552.9420   1488.8640     34.9030      7.2970
+    553.2230   1488.8710     34.9022      7.2980
+    553.6050   1488.8820     34.9113      7.2960
+    553.8970   1488.8820     34.9075      7.2960
+    554.2330   1488.8870     34.9167      7.2930
+    554.5810   1488.8940     34.9083      7.2960
+    554.8820   1488.8980     34.9106      7.2950
+    555.2100   1488.9020     34.9121      7.2940
+    555.5400   1488.9090     34.9045      7.2970
+    555.8540   1488.9160     34.9121      7.2950
+    556.2030   1488.9200     34.9106      7.2950
+    556.5300   1488.9230     34.9083      7.2950
+    556.8450   1488.9290     34.9060      7.2960
+    557.1920   1488.9320     34.9007      7.2970
+    557.4940   1488.9370     34.9098      7.2940
+    557.7950   1488.9420     34.9037      7.2960
+    558.1090   1488.9490     34.9083      7.2950
+    558.4030   1488.9520     34.9129      7.2930
+    558.7380   1488.9570     34.9091      7.2940
+    559.0700   1488.9610     34.8961      7.2980
+    559.4070   1488.9690     34.9129      7.2930
+    559.7440   1488.9740     34.9068      7.2950
+    560.0740   1488.9790     34.9030      7.2960
+    560.4090   1488.9810     34.8999      7.2960
+    560.7250   1488.9870     34.9068      7.2940
+    561.0300   1488.9920     34.9068      7.2940
+    561.3430   1488.9970     34.9068      7.2940
+    561.6610   1489.0040     34.9052      7.2950
+    562.0010   1489.0070     34.9060      7.2940
+    562.3430   1489.0120     34.9022      7.2950
+    562.6590   1489.0170     34.9052      7.2940
+    562.9670   1489.0220     34.9022      7.2950
+    563.2750   1489.0270     34.9045      7.2940
+    563.6350   1489.0320     34.9068      7.2930
+    563.9350   1489.0370     34.9106      7.2920
+    564.2790   1489.0420     34.9037      7.2940
+    564.5680   1489.0480     34.9045      7.2940
+    564.9120   1489.0540     34.9045      7.2940
+    565.2410   1489.0560     34.9052      7.2930
+    565.5670   1489.0620     34.9022      7.2940
+    565.9050   1489.0670     34.9144      7.2900
+    566.2390   1489.0710     34.9129      7.2900
+    566.5570   1489.0770     34.9045      7.2930
+    566.9020   1489.0830     34.9014      7.2940
+    567.2230   1489.0870     34.9030      7.2930
+    567.5770   1489.0900     34.9007      7.2930
+    567.8990   1489.0950     34.9068      7.2910
+    568.2090   1489.1000     34.9037      7.2920
+    568.5290   1489.1050     34.9060      7.2910
+    568.8620   1489.1090     34.9052      7.2910
+    569.1580   1489.1170     34.9045      7.2920
+    569.4910   1489.1200     34.9022      7.2920
+    569.7950   1489.1230     34.8885      7.2960
+    570.1380   1489.1290     34.9014      7.2920
+    570.4660   1489.1350     34.9014      7.2920
+    570.7940   1489.1400     34.8984      7.2930
+    571.0900   1489.1450     34.8984      7.2930
+    571.4150   1489.1510     34.9075      7.2900
+    571.7500   1489.1560     34.9045      7.2910
+    572.0520   1489.1610     34.9045      7.2910
+    572.3910   1489.1670     34.9014      7.2920
+    572.7080   1489.1720     34.8953      7.2940
+    573.0440   1489.1780     34.9075      7.2900
+    573.3540   1489.1830     34.9014      7.2920
+    573.7000   1489.1890     34.9014      7.2920
+    574.0110   1489.1950     34.9083      7.2900
+    574.3520   1489.2000     34.9075      7.2900
+    574.6860   1489.2050     34.9014      7.2920
+    575.0130   1489.2100     34.8976      7.2930
+    575.3240   1489.2150     34.9037      7.2910
+    575.6250   1489.2210     34.9045      7.2910
+    575.9530   1489.2270     34.9052      7.2910
+    576.2610   1489.2320     34.9045      7.2910
+    576.5650   1489.2370     34.9075      7.2900
+    576.9350   1489.2430     34.9106      7.2890
+    577.2350   1489.2480     34.9014      7.2920
+    577.5560   1489.2530     34.8953      7.2940
+    577.9250   1489.2590     34.9014      7.2920
+    578.2560   1489.2650     34.8984      7.2930
+    578.5570   1489.2700     34.9045      7.2910
+    578.8780   1489.2760     34.9052      7.2910
+    579.1980   1489.2820     34.9022      7.2920
+    579.5140   1489.2860     34.8953      7.2940
+    579.8230   1489.2920     34.8991      7.2930
+    580.1760   1489.2980     34.9022      7.2920
+    580.5030   1489.3040     34.8969      7.2940
+    580.8000   1489.3080     34.9022      7.2920
+    581.1270   1489.3120     34.8915      7.2950
+    581.4460   1489.3190     34.8961      7.2940
+    581.7850   1489.3240     34.8953      7.2940
+    582.1410   1489.3300     34.9014      7.2920
+    582.4710   1489.3350     34.8984      7.2930
+    582.8090   1489.3400     34.9068      7.2900
+    583.1350   1489.3440     34.8969      7.2930
+    583.4200   1489.3500     34.9037      7.2910
+    583.7260   1489.3580     34.9060      7.2910
+    584.0310   1489.3660     34.8991      7.2940
+    584.3620   1489.3720     34.8900      7.2970
+    584.6890   1489.3750     34.8976      7.2940
+    585.0070   1489.3810     34.9014      7.2930
+    585.3460   1489.3870     34.9014      7.2930
+    585.6800   1489.3950     34.8999      7.2940
+    585.9830   1489.4010     34.8946      7.2960
+    586.3160   1489.4050     34.9030      7.2930
+    586.6180   1489.4100     34.9060      7.2920
+    586.9540   1489.4150     34.9022      7.2930
+    587.3140   1489.4190     34.8946      7.2950
+    587.6240   1489.4240     34.8885      7.2970
+    587.9490   1489.4310     34.8961      7.2950
+    588.2720   1489.4370     34.8991      7.2940
+    588.5900   1489.4420     34.8991      7.2940
+    588.8990   1489.4470     34.9022      7.2930
+    589.2340   1489.4530     34.8961      7.2950
+    589.5670   1489.4600     34.8946      7.2960
+    589.9010   1489.4640     34.9052      7.2920
+    590.2480   1489.4710     34.9030      7.2930
+    590.5830   1489.4780     34.8984      7.2950
+    590.9170   1489.4840     34.9014      7.2940
+    591.2530   1489.4880     34.9068      7.2920
+    591.5430   1489.4950     34.8961      7.2960
+    591.8540   1489.4980     34.8969      7.2950
+    592.1510   1489.5040     34.8953      7.2960
+    592.4570   1489.5100     34.9022      7.2940
+    592.7690   1489.5160     34.8991      7.2950
+    593.0910   1489.5210     34.8991      7.2950
+    593.4310   1489.5260     34.8984      7.2950
+    593.7790   1489.5320     34.9014      7.2940
+    594.1230   1489.5390     34.8938      7.2970
+    594.4260   1489.5440     34.8938      7.2970
+    594.7370   1489.5500     34.9007      7.2950
+    595.0900   1489.5550     34.8938      7.2970
+    595.4350   1489.5610     34.9030      7.2940
+    595.7910   1489.5670     34.9030      7.2940
+    596.1170   1489.5720     34.8930      7.2970
+    596.4450   1489.5760     34.8862      7.2990
+    596.7230   1489.5820     34.9022      7.2940
+    597.0320   1489.5870     34.8869      7.2990
+    597.3490   1489.5920     34.8930      7.2970
+    597.6780   1489.5970     34.8923      7.2970
+    597.9900   1489.6020     34.8984      7.2950
+    598.3150   1489.6070     34.8984      7.2950
+    598.6490   1489.6130     34.8953      7.2960
+    598.9790   1489.6180     34.8984      7.2950
+    599.2960   1489.6230     34.9007      7.2940
+    599.5960   1489.6270     34.8969      7.2950
+    599.9180   1489.6340     34.9014      7.2940
+    600.2730   1489.6390     34.8915      7.2970
+    600.5880   1489.6450     34.8953      7.2960
+    600.9190   1489.6500     34.8915      7.2970
+    601.2330   1489.6550     34.8915      7.2970
+    601.5390   1489.6590     34.8938      7.2960
+    601.8320   1489.6650     34.9037      7.2930
+    602.1470   1489.6710     34.8984      7.2950
+    602.4850   1489.6760     34.9007      7.2940
+    602.8450   1489.6810     34.8969      7.2950
+    603.1750   1489.6850     34.8892      7.2970
+    603.4830   1489.6910     34.8961      7.2950
+    603.7760   1489.6960     34.8869      7.2980
+    604.0630   1489.7000     34.8961      7.2950
+    604.3660   1489.7060     34.9091      7.2910
+    604.6870   1489.7110     34.8900      7.2970
+    604.9640   1489.7170     34.8885      7.2980
+    605.2900   1489.7220     34.8938      7.2960
+    605.6290   1489.7270     34.8938      7.2960
+    605.9190   1489.7330     34.8946      7.2960
+    606.2170   1489.7380     34.8976      7.2950
+    606.5240   1489.7430     34.8946      7.2960
+    606.8400   1489.7490     34.8976      7.2950
+    607.1230   1489.7530     34.8976      7.2950
+    607.4560   1489.7580     34.8907      7.2970
+    607.7570   1489.7640     34.8976      7.2950
+    608.0820   1489.7690     34.8854      7.2990
+    608.4040   1489.7730     34.8930      7.2960
+    608.6930   1489.7780     34.8930      7.2960
+    608.9490   1489.7830     34.8969      7.2950
+    609.1940   1489.7880     34.8915      7.2970
+    609.4790   1489.7930     34.8976      7.2950
+    609.7860   1489.7970     34.8877      7.2980
+    610.0890   1489.8030     34.9007      7.2940
+    610.4010   1489.8080     34.9007      7.2940
+    610.6930   1489.8140     34.8892      7.2980
+    611.0120   1489.8190     34.8923      7.2970
+    611.3190   1489.8240     34.8953      7.2960
+    611.6420   1489.8290     34.8915      7.2970
+    612.0460   1489.8360     34.8953      7.2960
+    612.4590   1489.8420     34.9037      7.2930
+    612.8200   1489.8480     34.8946      7.2960
+    613.1890   1489.8550     34.8946      7.2960
+    613.5620   1489.8610     34.8915      7.2970
+    613.9070   1489.8660     34.8907      7.2970
+    614.2680   1489.8740     34.8953      7.2960
+    614.6440   1489.8790     34.8885      7.2980
+    614.9900   1489.8850     34.8915      7.2970
+    615.3510   1489.8910     34.8946      7.2960
+    615.6940   1489.8960     34.8946      7.2960
+    616.0550   1489.9020     34.8885      7.2980
+    616.4230   1489.9090     34.8923      7.2970
+    616.7730   1489.9150     34.8923      7.2970
+    617.1090   1489.9200     34.9007      7.2940
+    617.4590   1489.9250     34.8938      7.2960
+    617.7860   1489.9310     34.8915      7.2970
+    618.1220   1489.9370     34.8915      7.2970
+    618.4250   1489.9420     34.8915      7.2970
+    618.7760   1489.9480     34.8915      7.2970
+    619.1200   1489.9530     34.8877      7.2980
+    619.4340   1489.9580     34.8877      7.2980
+    619.7650   1489.9620     34.8869      7.2980
+    620.0780   1489.9670     34.8923      7.2960
+    620.3980   1489.9720     34.8892      7.2970
+    620.7290   1489.9780     34.8831      7.2990
+    621.0570   1489.9830     34.8923      7.2960
+    621.3520   1489.9880     34.8831      7.2990
+    621.6970   1489.9950     34.8839      7.2990
+    622.0000   1490.0000     34.8839      7.2990
+    622.3600   1490.0060     34.8961      7.2950
+    622.6780   1490.0110     34.8900      7.2970
+    622.9940   1490.0170     34.8907      7.2970
+    623.2900   1490.0210     34.8930      7.2960
+    623.6100   1490.0280     34.8907      7.2970
+    623.9540   1490.0330     34.8938      7.2960
+    624.2800   1490.0380     34.8930      7.2960
+    624.6360   1490.0440     34.8961      7.2950
+    624.9680   1490.0500     34.8846      7.2990
+    625.2900   1490.0550     34.8839      7.2990
+    625.5910   1490.0600     34.8869      7.2980
+    625.9090   1490.0660     34.8907      7.2970
+    626.2400   1490.0720     34.8885      7.2980
+    626.5540   1490.0780     34.8915      7.2970
+    626.8880   1490.0830     34.8854      7.2990
+    627.2410   1490.0880     34.8877      7.2980
+    627.5690   1490.0940     34.8938      7.2960
+    627.8800   1490.0990     34.8877      7.2980
+    628.1900   1490.1040     34.8816      7.3000
+    628.5030   1490.1100     34.8915      7.2970
+    628.8510   1490.1150     34.8846      7.2990
+    629.1720   1490.1200     34.8877      7.2980
+    629.5320   1490.1280     34.8923      7.2970
+    629.8740   1490.1320     34.8846      7.2990
+    630.2100   1490.1380     34.8846      7.2990
+    630.5320   1490.1440     34.8854      7.2990
+    630.8230   1490.1480     34.8907      7.2970
+    631.1280   1490.1540     34.8915      7.2970
+    631.4520   1490.1590     34.8915      7.2970
+    631.7860   1490.1630     34.8778      7.3010
+    632.1220   1490.1690     34.8869      7.2980
+    632.4670   1490.1760     34.8946      7.2960
+    632.8060   1490.1800     34.8808      7.3000
+    633.1040   1490.1860     34.8846      7.2990
+    633.3880   1490.1910     34.8877      7.2980
+    633.7390   1490.1980     34.8915      7.2970
+    634.0910   1490.2020     34.8869      7.2980
+    634.4130   1490.2080     34.8907      7.2970
+    634.7570   1490.2140     34.8846      7.2990
+    635.0820   1490.2190     34.8877      7.2980
+    635.4210   1490.2230     34.8801      7.3000
+    635.7410   1490.2310     34.8915      7.2970
+    636.0500   1490.2350     34.8846      7.2990
+    636.3690   1490.2390     34.8801      7.3000
+    636.6900   1490.2440     34.8831      7.2990
+    636.9990   1490.2500     34.8839      7.2990
+    637.3400   1490.2550     34.8953      7.2950
+    637.6640   1490.2620     34.8877      7.2980
+    637.9920   1490.2670     34.8839      7.2990
+    638.3180   1490.2730     34.8816      7.3000
+    638.6180   1490.2790     34.8885      7.2980
+    638.9320   1490.2830     34.8816      7.3000
+    639.2440   1490.2890     34.8877      7.2980
+    639.5720   1490.2950     34.8946      7.2960
+    639.8930   1490.2990     34.8877      7.2980
+    640.2260   1490.3060     34.8885      7.2980
+    640.5510   1490.3120     34.8892      7.2980
+    640.8700   1490.3170     34.8854      7.2990
+    641.1950   1490.3220     34.8824      7.3000
+    641.5430   1490.3260     34.8869      7.2980
+    641.8860   1490.3320     34.8869      7.2980
+    642.2150   1490.3370     34.8808      7.3000
+    642.5250   1490.3430     34.8846      7.2990
+    642.8410   1490.3480     34.8869      7.2980
+    643.1680   1490.3530     34.8900      7.2970
+    643.5000   1490.3590     34.8839      7.2990
+    643.7900   1490.3630     34.8831      7.2990
+    644.0990   1490.3690     34.8839      7.2990
+    644.4050   1490.3740     34.8869      7.2980
+    644.7000   1490.3800     34.8846      7.2990
+    645.0250   1490.3850     34.8846      7.2990
+    645.3570   1490.3900     34.8869      7.2980
+    645.7030   1490.3960     34.8846      7.2990
+    646.0310   1490.4010     34.8808      7.3000
+    646.3460   1490.4060     34.8839      7.2990
+    646.6740   1490.4100     34.8824      7.2990
+    646.9880   1490.4170     34.8900      7.2970
+    647.3060   1490.4220     34.8747      7.3020
+    647.6100   1490.4280     34.8846      7.2990
+    647.9390   1490.4330     34.8808      7.3000
+    648.2630   1490.4380     34.8839      7.2990
+    648.6130   1490.4440     34.8839      7.2990
+    648.8970   1490.4490     34.8869      7.2980
+    649.2170   1490.4540     34.8869      7.2980
+    649.5190   1490.4590     34.8839      7.2990
+    649.8170   1490.4640     34.8839      7.2990
+    650.1390   1490.4690     34.8831      7.2990
+    650.4660   1490.4760     34.8877      7.2980
+    650.8030   1490.4800     34.8770      7.3010
+    651.1230   1490.4850     34.8770      7.3010
+    651.4670   1490.4910     34.8862      7.2980
+    651.7530   1490.4970     34.8778      7.3010
+    652.0880   1490.5010     34.8801      7.3000
+    652.3810   1490.5080     34.8785      7.3010
+    652.7150   1490.5130     34.8808      7.3000
+    653.0400   1490.5150     34.8785      7.3000
+    653.3720   1490.5220     34.8854      7.2980
+    653.7070   1490.5270     34.8763      7.3010
+    654.0120   1490.5320     34.8763      7.3010
+    654.3140   1490.5370     34.8793      7.3000
+    654.6130   1490.5420     34.8824      7.2990
+    654.8860   1490.5480     34.8831      7.2990
+    655.2090   1490.5550     34.8846      7.2990
+    655.5430   1490.5590     34.8892      7.2970
+    655.8890   1490.5650     34.8770      7.3010
+    656.2180   1490.5690     34.8854      7.2980
+    656.5160   1490.5740     34.8885      7.2970
+    656.8250   1490.5790     34.8885      7.2970
+    657.1640   1490.5860     34.8923      7.2960
+    657.4910   1490.5920     34.8839      7.2990
+    657.8160   1490.5990     34.8846      7.2990
+    658.1080   1490.6020     34.8770      7.3010
+    658.4270   1490.6080     34.8839      7.2990
+    658.7540   1490.6140     34.8724      7.3030
+    659.0520   1490.6190     34.8846      7.2990
+    659.3470   1490.6240     34.8816      7.3000
+    659.6500   1490.6290     34.8816      7.3000
+    659.9770   1490.6340     34.8808      7.3000
+    660.2720   1490.6390     34.8808      7.3000
+    660.6110   1490.6450     34.8846      7.2990
+    660.9370   1490.6510     34.8816      7.3000
+    661.2420   1490.6560     34.8755      7.3020
+    661.5690   1490.6620     34.8763      7.3020
+    661.9020   1490.6670     34.8755      7.3020
+    662.1980   1490.6700     34.8831      7.2990
+    662.4800   1490.6760     34.8747      7.3020
+    662.8010   1490.6800     34.8801      7.3000
+    663.0800   1490.6840     34.8763      7.3010
+    663.4160   1490.6890     34.8763      7.3010
+    663.7280   1490.6960     34.8862      7.2980
+    664.0580   1490.7020     34.8747      7.3020
+    664.3880   1490.7070     34.8831      7.2990
+    664.7110   1490.7110     34.8793      7.3000
+    664.9850   1490.7160     34.8763      7.3010
+    665.2890   1490.7220     34.8862      7.2980
+    665.6070   1490.7270     34.8770      7.3010
+    665.9280   1490.7320     34.8770      7.3010
+    666.2530   1490.7390     34.8808      7.3000
+    666.5920   1490.7430     34.8801      7.3000
+    666.9170   1490.7490     34.8801      7.3000
+    667.2370   1490.7540     34.8770      7.3010
+    667.5260   1490.7590     34.8801      7.3000
+    667.8150   1490.7640     34.8862      7.2980
+    668.1430   1490.7690     34.8770      7.3010
+    668.4510   1490.7730     34.8816      7.2990
+    668.7650   1490.7790     34.8793      7.3000
+    669.0790   1490.7850     34.8740      7.3020
+    669.4090   1490.7910     34.8808      7.3000
+    669.7130   1490.7940     34.8724      7.3020
+    670.0470   1490.7940     34.8747      7.3000
+    670.3410   1490.7990     34.8717      7.3010
+    670.6260   1490.8040     34.8747      7.3000
+    670.9420   1490.8090     34.8747      7.3000
+    671.2350   1490.8140     34.8747      7.3000
+    671.5600   1490.8190     34.8770      7.2990
+    671.8860   1490.8250     34.8808      7.2980
+    672.1930   1490.8310     34.8785      7.2990
+    672.5240   1490.8370     34.8724      7.3010
+    672.8220   1490.8430     34.8824      7.2980
+    673.1380   1490.8470     34.8755      7.3000
+    673.4720   1490.8530     34.8877      7.2960
+    673.7630   1490.8570     34.8724      7.3010
+    674.0710   1490.8630     34.8724      7.3010
+    674.3670   1490.8690     34.8770      7.3000
+    674.6850   1490.8730     34.8755      7.3000
+    674.9970   1490.8790     34.8732      7.3010
+    675.3280   1490.8840     34.8785      7.2990
+    675.6430   1490.8880     34.8747      7.3000
+    675.9740   1490.8930     34.8717      7.3010
+    676.2740   1490.8990     34.8724      7.3010
+    676.5760   1490.9050     34.8732      7.3010
+    676.8850   1490.9090     34.8747      7.3000
+    677.2000   1490.9150     34.8816      7.2980
+    677.5350   1490.9210     34.8793      7.2990
+    677.8900   1490.9250     34.8808      7.2980
+    678.1730   1490.9320     34.8824      7.2980
+    678.4750   1490.9350     34.8839      7.2970
+    678.7820   1490.9410     34.8846      7.2970
+    679.0580   1490.9460     34.8816      7.2980
+    679.3690   1490.9510     34.8724      7.3010
+    679.6960   1490.9550     34.8740      7.3000
+    680.0160   1490.9620     34.8755      7.3000
+    680.3680   1490.9670     34.8747      7.3000
+    680.6750   1490.9730     34.8755      7.3000
+    680.9860   1490.9770     34.8747      7.3000
+    681.2940   1490.9840     34.8732      7.3010
+    681.5760   1490.9880     34.8785      7.2990
+    681.8860   1490.9930     34.8816      7.2980
+    682.2000   1490.9990     34.8763      7.3000
+    682.5290   1491.0030     34.8717      7.3010
+    682.8450   1491.0100     34.8701      7.3020
+    683.1710   1491.0140     34.8747      7.3000
+    683.4840   1491.0210     34.8732      7.3010
+    683.7860   1491.0240     34.8747      7.3000
+    684.0840   1491.0310     34.8701      7.3020
+    684.4020   1491.0360     34.8701      7.3020
+    684.6950   1491.0410     34.8732      7.3010
+    685.0080   1491.0450     34.8755      7.3000
+    685.3450   1491.0510     34.8755      7.3000
+    685.6540   1491.0570     34.8793      7.2990
+    685.9560   1491.0630     34.8709      7.3020
+    686.2560   1491.0670     34.8732      7.3010
+    686.5650   1491.0710     34.8785      7.2990
+    686.8560   1491.0750     34.8747      7.3000
+    687.1690   1491.0800     34.8618      7.3040
+    687.4940   1491.0870     34.8694      7.3020
+    687.8260   1491.0920     34.8663      7.3030
+    688.1470   1491.0990     34.8610      7.3050
+    688.4630   1491.1060     34.8778      7.3000
+    688.7900   1491.1100     34.8679      7.3030
+    689.0660   1491.1160     34.8717      7.3020
+    689.3700   1491.1190     34.8732      7.3010
+    689.6570   1491.1240     34.8793      7.2990
+    689.9600   1491.1300     34.8679      7.3030
+    690.2760   1491.1350     34.8709      7.3020
+    690.5850   1491.1420     34.8724      7.3020
+    690.9280   1491.1470     34.8717      7.3020
+    691.2530   1491.1520     34.8740      7.3010
+    691.5610   1491.1580     34.8808      7.2990
+    691.8810   1491.1620     34.8770      7.3000
+    692.1930   1491.1670     34.8648      7.3040
+    692.5080   1491.1740     34.8686      7.3030
+    692.8350   1491.1800     34.8694      7.3030
+    693.1320   1491.1850     34.8755      7.3010
+    693.4680   1491.1890     34.8740      7.3010
+    693.7550   1491.1950     34.8694      7.3030
+    694.0550   1491.2000     34.8724      7.3020
+    694.3830   1491.2050     34.8686      7.3030
+    694.7050   1491.2100     34.8747      7.3010
+    695.0300   1491.2140     34.8671      7.3030
+    695.3390   1491.2200     34.8709      7.3020
+    695.6840   1491.2270     34.8686      7.3030
+    696.0330   1491.2310     34.8709      7.3020
+    696.3750   1491.2360     34.8671      7.3030
+    696.6550   1491.2420     34.8679      7.3030
+    696.9640   1491.2460     34.8671      7.3030
+    697.2870   1491.2500     34.8724      7.3010
+    697.6000   1491.2570     34.8763      7.3000
+    697.9400   1491.2630     34.8740      7.3010
+    698.2660   1491.2670     34.8633      7.3040
+    698.5900   1491.2720     34.8694      7.3020
+    698.9380   1491.2770     34.8717      7.3010
+    699.2320   1491.2820     34.8656      7.3030
+    699.5660   1491.2870     34.8679      7.3020
+    699.8910   1491.2940     34.8785      7.2990
+    700.1800   1491.2970     34.8587      7.3050
+    700.4860   1491.3030     34.8686      7.3020
+    700.8140   1491.3080     34.8618      7.3040
+    701.1100   1491.3150     34.8671      7.3030
+    701.4440   1491.3190     34.8656      7.3030
+    701.7290   1491.3230     34.8709      7.3010
+    702.0360   1491.3280     34.8648      7.3030
+    702.3630   1491.3350     34.8633      7.3040
+    702.6930   1491.3420     34.8701      7.3020
+    703.0260   1491.3460     34.8663      7.3030
+    703.3800   1491.3520     34.8694      7.3020
+    703.7050   1491.3560     34.8587      7.3050
+    704.0510   1491.3610     34.8640      7.3030
+    704.3240   1491.3670     34.8656      7.3030
+    704.6250   1491.3710     34.8709      7.3010
+    704.8890   1491.3770     34.8778      7.2990
+    705.1720   1491.3820     34.8694      7.3020
+    705.4410   1491.3870     34.8694      7.3020
+    705.7560   1491.3930     34.8671      7.3030
+    706.0620   1491.3990     34.8740      7.3010
+    706.3610   1491.4030     34.8701      7.3020
+    706.6780   1491.4090     34.8679      7.3030
+    707.0050   1491.4140     34.8671      7.3030
+    707.3160   1491.4200     34.8618      7.3050
+    707.6370   1491.4250     34.8740      7.3010
+    707.9800   1491.4290     34.8724      7.3010
+    708.3160   1491.4360     34.8701      7.3020
+    708.6360   1491.4400     34.8694      7.3020
+    708.9740   1491.4460     34.8694      7.3020
+    709.2710   1491.4510     34.8694      7.3020
+    709.5780   1491.4560     34.8633      7.3040
+    709.8780   1491.4610     34.8663      7.3030
+    710.2070   1491.4670     34.8671      7.3030
+    710.5300   1491.4730     34.8671      7.3030
+    710.8680   1491.4790     34.8709      7.3020
+    711.2000   1491.4830     34.8694      7.3020
+    711.5150   1491.4890     34.8763      7.3000
+    711.8150   1491.4940     34.8763      7.3000
+    712.1190   1491.4990     34.8732      7.3010
+    712.4400   1491.5040     34.8663      7.3030
+    712.7860   1491.5100     34.8724      7.3010
+    713.1140   1491.5150     34.8694      7.3020
+    713.4370   1491.5210     34.8732      7.3010
+    713.7540   1491.5250     34.8625      7.3040
+    714.0670   1491.5310     34.8663      7.3030
+    714.3890   1491.5370     34.8671      7.3030
+    714.7140   1491.5410     34.8656      7.3030
+    715.0190   1491.5460     34.8625      7.3040
+    715.3440   1491.5510     34.8656      7.3030
+    715.6780   1491.5550     34.8701      7.3010
+    716.0050   1491.5600     34.8602      7.3040
+    716.3300   1491.5660     34.8549      7.3060
+    716.6470   1491.5710     34.8610      7.3040
+    716.9400   1491.5770     34.8709      7.3010
+    717.2460   1491.5810     34.8701      7.3010
+    717.5610   1491.5870     34.8648      7.3030
+    717.8980   1491.5930     34.8740      7.3000
+    718.2180   1491.5980     34.8587      7.3050
+    718.5730   1491.6040     34.8679      7.3020
+    718.8910   1491.6080     34.8602      7.3040
+    719.2270   1491.6150     34.8648      7.3030
+    719.5210   1491.6210     34.8686      7.3020
+    719.8310   1491.6250     34.8618      7.3040
+    720.1270   1491.6280     34.8633      7.3030
+    720.4270   1491.6340     34.8610      7.3040
+    720.7460   1491.6400     34.8640      7.3030
+    721.0450   1491.6450     34.8671      7.3020
+    721.3740   1491.6500     34.8579      7.3050
+    721.7020   1491.6560     34.8640      7.3030
+    722.0050   1491.6620     34.8709      7.3010
+    722.2870   1491.6660     34.8648      7.3030
+    722.5930   1491.6730     34.8724      7.3010
+    722.9230   1491.6790     34.8602      7.3050
+    723.2600   1491.6850     34.8572      7.3060
+    723.5490   1491.6900     34.8541      7.3070
+    723.8760   1491.6940     34.8686      7.3020
+    724.1610   1491.7020     34.8679      7.3030
+    724.4690   1491.7070     34.8648      7.3040
+    724.7480   1491.7100     34.8602      7.3050
+    725.0530   1491.7170     34.8648      7.3040
+    725.3470   1491.7220     34.8625      7.3050
+    725.6320   1491.7280     34.8694      7.3030
+    725.9710   1491.7330     34.8625      7.3050
+    726.2470   1491.7400     34.8648      7.3050
+    726.5840   1491.7440     34.8663      7.3040
+    726.9070   1491.7500     34.8640      7.3050
+    727.2210   1491.7550     34.8633      7.3050
+    727.5000   1491.7600     34.8610      7.3060
+    727.7890   1491.7640     34.8663      7.3040
+    728.0890   1491.7710     34.8618      7.3060
+    728.3980   1491.7740     34.8572      7.3070
+    728.6880   1491.7810     34.8557      7.3080
+    728.9950   1491.7860     34.8648      7.3050
+    729.3050   1491.7900     34.8541      7.3080
+    729.6160   1491.7960     34.8671      7.3040
+    729.9270   1491.8020     34.8587      7.3070
+    730.2370   1491.8070     34.8587      7.3070
+    730.5220   1491.8120     34.8679      7.3040
+    730.8200   1491.8160     34.8579      7.3070
+    731.1100   1491.8220     34.8587      7.3070
+    731.4130   1491.8280     34.8656      7.3050
+    731.6860   1491.8320     34.8625      7.3060
+    731.9760   1491.8380     34.8572      7.3080
+    732.2840   1491.8440     34.8671      7.3050
+    732.5760   1491.8490     34.8640      7.3060
+    732.8480   1491.8540     34.8610      7.3070
+    733.1880   1491.8590     34.8610      7.3070
+    733.4740   1491.8640     34.8640      7.3060
+    733.8030   1491.8690     34.8602      7.3070
+    734.1040   1491.8740     34.8602      7.3070
+    734.3620   1491.8800     34.8679      7.3050
+    734.6880   1491.8850     34.8618      7.3070
+    734.9930   1491.8900     34.8648      7.3060
+    735.2980   1491.8940     34.8633      7.3060
+    735.5670   1491.9000     34.8618      7.3070
+    735.8750   1491.9050     34.8587      7.3080
+    736.1480   1491.9080     34.8663      7.3050
+    736.4220   1491.9130     34.8610      7.3070
+    736.7430   1491.9170     34.8595      7.3070
+    737.0210   1491.9220     34.8602      7.3070
+    737.3180   1491.9280     34.8579      7.3080
+    737.6360   1491.9320     34.8564      7.3080
+    737.9310   1491.9370     34.8595      7.3070
+    738.2380   1491.9410     34.8618      7.3060
+    738.5490   1491.9470     34.8625      7.3060
+    738.8410   1491.9510     34.8587      7.3070
+    739.1490   1491.9570     34.8656      7.3050
+    739.4280   1491.9610     34.8618      7.3060
+    739.7260   1491.9670     34.8595      7.3070
+    740.0030   1491.9710     34.8595      7.3070
+    740.3060   1491.9780     34.8671      7.3050
+    740.6020   1491.9820     34.8633      7.3060
+    740.8810   1491.9860     34.8534      7.3090
+    741.1780   1491.9910     34.8564      7.3080
+    741.4780   1491.9970     34.8633      7.3060
+    741.8030   1492.0020     34.8633      7.3060
+    742.1010   1492.0070     34.8602      7.3070
+    742.4100   1492.0120     34.8595      7.3070
+    742.6870   1492.0190     34.8648      7.3060
+    742.9650   1492.0230     34.8579      7.3080
+    743.2670   1492.0280     34.8579      7.3080
+    743.5790   1492.0330     34.8610      7.3070
+    743.8860   1492.0380     34.8610      7.3070
+    744.1740   1492.0430     34.8549      7.3090
+    744.4670   1492.0480     34.8549      7.3090
+    744.7360   1492.0530     34.8648      7.3060
+    745.0290   1492.0570     34.8579      7.3080
+    745.3330   1492.0620     34.8579      7.3080
+    745.6200   1492.0670     34.8579      7.3080
+    745.9390   1492.0710     34.8595      7.3070
+    746.2540   1492.0760     34.8595      7.3070
+    746.5560   1492.0830     34.8579      7.3080
+    746.8480   1492.0870     34.8572      7.3080
+    747.1400   1492.0920     34.8602      7.3070
+    747.4370   1492.0970     34.8663      7.3050
+    747.7240   1492.1020     34.8579      7.3080
+    748.0300   1492.1050     34.8465      7.3110
+    748.3080   1492.1100     34.8595      7.3070
+    748.6360   1492.1140     34.8610      7.3060
+    749.0090   1492.1210     34.8557      7.3080
+    749.3150   1492.1270     34.8625      7.3060
+    749.6290   1492.1310     34.8587      7.3070
+    749.9500   1492.1360     34.8579      7.3070
+    750.2670   1492.1410     34.8549      7.3080
+    750.5920   1492.1470     34.8587      7.3070
+    750.9360   1492.1530     34.8648      7.3050
+    751.2650   1492.1580     34.8549      7.3080
+    751.5940   1492.1640     34.8618      7.3060
+    751.9220   1492.1690     34.8579      7.3070
+    752.2510   1492.1740     34.8549      7.3080
+    752.5730   1492.1790     34.8572      7.3070
+    752.8830   1492.1850     34.8640      7.3050
+    753.2420   1492.1900     34.8572      7.3070
+    753.5610   1492.1960     34.8549      7.3080
+    753.9170   1492.2010     34.8572      7.3070
+    754.2460   1492.2060     34.8595      7.3060
+    754.5690   1492.2110     34.8564      7.3070
+    754.8970   1492.2160     34.8587      7.3060
+    755.2250   1492.2230     34.8511      7.3090
+    755.5320   1492.2280     34.8572      7.3070
+    755.8590   1492.2330     34.8534      7.3080
+    756.1980   1492.2380     34.8595      7.3060
+    756.5050   1492.2430     34.8625      7.3050
+    756.8240   1492.2490     34.8534      7.3080
+    757.1100   1492.2530     34.8526      7.3080
+    757.4340   1492.2590     34.8534      7.3080
+    757.7220   1492.2640     34.8595      7.3060
+    758.0820   1492.2690     34.8587      7.3060
+    758.4220   1492.2740     34.8549      7.3070
+    758.7630   1492.2800     34.8495      7.3090
+    759.0910   1492.2850     34.8579      7.3060
+    759.4360   1492.2910     34.8518      7.3080
+    759.7570   1492.2970     34.8648      7.3040
+    760.0410   1492.3020     34.8495      7.3090
+    760.3700   1492.3070     34.8526      7.3080
+    760.6670   1492.3100     34.8480      7.3090
+    760.9990   1492.3170     34.8488      7.3090
+    761.3420   1492.3220     34.8511      7.3080
+    761.6600   1492.3280     34.8579      7.3060
+    761.9760   1492.3330     34.8579      7.3060
+    762.2940   1492.3390     34.8557      7.3070
+    762.6410   1492.3440     34.8549      7.3070
+    762.9470   1492.3490     34.8549      7.3070
+    763.2870   1492.3540     34.8572      7.3060
+    763.5960   1492.3600     34.8610      7.3050
+    763.9160   1492.3650     34.8511      7.3080
+    764.2480   1492.3710     34.8518      7.3080
+    764.5550   1492.3760     34.8518      7.3080
+    764.8830   1492.3810     34.8541      7.3070
+    765.1980   1492.3870     34.8518      7.3080
+    765.5120   1492.3910     34.8511      7.3080
+    765.8290   1492.3960     34.8564      7.3060
+    766.1650   1492.4020     34.8541      7.3070
+    766.4910   1492.4070     34.8534      7.3070
+    766.8010   1492.4130     34.8511      7.3080
+    767.1290   1492.4190     34.8579      7.3060
+    767.4640   1492.4260     34.8526      7.3080
+    767.7840   1492.4310     34.8495      7.3090
+    768.0990   1492.4350     34.8511      7.3080
+    768.4000   1492.4410     34.8557      7.3070
+    768.7280   1492.4470     34.8495      7.3090
+    769.0930   1492.4510     34.8511      7.3080
+    769.4160   1492.4580     34.8518      7.3080
+    769.7450   1492.4630     34.8518      7.3080
+    770.0370   1492.4660     34.8534      7.3070
+    770.3470   1492.4710     34.8503      7.3080
+    770.6400   1492.4770     34.8541      7.3070
+    770.9830   1492.4830     34.8511      7.3080
+    771.2780   1492.4880     34.8511      7.3080
+    771.6040   1492.4920     34.8534      7.3070
+    771.9490   1492.4990     34.8541      7.3070
+    772.2810   1492.5050     34.8450      7.3100
+    772.5970   1492.5100     34.8541      7.3070
+    772.9190   1492.5170     34.8495      7.3090
+    773.2360   1492.5220     34.8618      7.3050
+    773.5570   1492.5260     34.8480      7.3090
+    773.8900   1492.5320     34.8488      7.3090
+    774.1950   1492.5380     34.8465      7.3100
+    774.5090   1492.5430     34.8518      7.3080
+    774.8360   1492.5480     34.8457      7.3100
+    775.1590   1492.5540     34.8488      7.3090
+    775.4740   1492.5590     34.8457      7.3100
+    775.7840   1492.5640     34.8457      7.3100
+    776.0940   1492.5690     34.8518      7.3080
+    776.4380   1492.5770     34.8473      7.3100
+    776.7450   1492.5800     34.8488      7.3090
+    777.0520   1492.5850     34.8549      7.3070
+    777.3570   1492.5910     34.8465      7.3100
+    777.6850   1492.5970     34.8526      7.3080
+    778.0270   1492.6030     34.8557      7.3070
+    778.3740   1492.6080     34.8495      7.3090
+    778.7120   1492.6140     34.8465      7.3100
+    779.0310   1492.6190     34.8526      7.3080
+    779.3480   1492.6250     34.8526      7.3080
+    779.6560   1492.6310     34.8442      7.3110
+    779.9470   1492.6350     34.8526      7.3080
+    780.2090   1492.6400     34.8564      7.3070
+    780.5000   1492.6450     34.8473      7.3100
+    780.7950   1492.6500     34.8534      7.3080
+    781.0800   1492.6550     34.8473      7.3100
+    781.3630   1492.6600     34.8511      7.3090
+    781.6290   1492.6640     34.8412      7.3120
+    781.9210   1492.6680     34.8526      7.3080
+    782.2380   1492.6720     34.8518      7.3080
+    782.5270   1492.6790     34.8442      7.3110
+    782.8020   1492.6840     34.8511      7.3090
+    783.1240   1492.6890     34.8534      7.3080
+    783.4200   1492.6930     34.8465      7.3100
+    783.7300   1492.6980     34.8495      7.3090
+    783.9980   1492.7050     34.8549      7.3080
+    784.3000   1492.7090     34.8450      7.3110
+    784.5740   1492.7150     34.8488      7.3100
+    784.8850   1492.7190     34.8541      7.3080
+    785.1800   1492.7250     34.8518      7.3090
+    785.4530   1492.7280     34.8473      7.3100
+    785.6390   1492.7310     34.8534      7.3080
+    785.7730   1492.7320     34.8465      7.3100
+    785.8140   1492.7330     34.8557      7.3070
+    785.8460   1492.7350     34.8480      7.3100
+    785.8930   1492.7350     34.8503      7.3090
+    785.9320   1492.7360     34.8412      7.3120
+    785.9380   1492.7370     34.8480      7.3100
+    785.9730   1492.7360     34.8404      7.3120
+    785.9790   1492.7360     34.8465      7.3100
+    785.9800   1492.7360     34.8495      7.3090
+    785.9810   1492.7350     34.8518      7.3080
+    786.0050   1492.7360     34.8465      7.3100
+    786.0110   1492.7370     34.8442      7.3110
+    786.0220   1492.7370     34.8412      7.3120
+    786.0230   1492.7370     34.8442      7.3110
+    786.0390   1492.7370     34.8526      7.3080
+    786.0420   1492.7380     34.8503      7.3090
+    786.0470   1492.7380     34.8473      7.3100
+    786.0530   1492.7370     34.8434      7.3110
+    786.0570   1492.7370     34.8465      7.3100
+    786.0730   1492.7380     34.8503      7.3090
+    786.0780   1492.7380     34.8503      7.3090
+    786.0800   1492.7380     34.8473      7.3100
+    786.1090   1492.7370     34.8427      7.3110
+    786.1120   1492.7370     34.8488      7.3090
+    786.1380   1492.7380     34.8495      7.3090
+    786.1400   1492.7380     34.8495      7.3090
+    786.1450   1492.7380     34.8526      7.3080
+    786.1640   1492.7400     34.8503      7.3090
+    786.1730   1492.7380     34.8549      7.3070
+    786.1800   1492.7400     34.8595      7.3060
+    786.1850   1492.7400     34.8534      7.3080
+    786.1910   1492.7390     34.8465      7.3100
+    786.2010   1492.7400     34.8442      7.3110
+    786.2030   1492.7400     34.8564      7.3070
+    786.2210   1492.7410     34.8503      7.3090
+    786.2220   1492.7410     34.8412      7.3120
+    786.2400   1492.7400     34.8495      7.3090
+    786.2470   1492.7400     34.8495      7.3090
+    786.2540   1492.7410     34.8473      7.3100
+    786.2640   1492.7410     34.8473      7.3100
+    786.2650   1492.7410     34.8503      7.3090
+    786.2720   1492.7420     34.8480      7.3100
+    786.2830   1492.7420     34.8442      7.3110
+    786.2900   1492.7410     34.8434      7.3110
+    786.3160   1492.7430     34.8450      7.3110
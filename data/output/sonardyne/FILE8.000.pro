@@ -0,0 +1,194 @@
+test_read_store_and_write
+3/4/2016
+18:1:8
+Probe: MIDAS SVX2 1000
+Source: /root/package/data/input/valeport/midas/svx2/FILE8.000
+      0.1440   1420.9230      2.2830      2.6660
+      0.2340   1420.6070      1.9050      2.3510
+      0.4220   1420.7780      3.2920      2.1430
+      0.5650   1420.6330      3.2150      2.1100
+      0.6730   1420.3350      4.1360      2.0930
+      0.7460   1420.3210      4.2900      2.0820
+      0.8010   1420.1760      4.3060      2.0900
+      0.9070   1420.1600      4.3100      2.0860
+      1.0010   1420.1820      4.2650      2.0860
+      1.1110   1420.1720      4.3030      2.0920
+      1.2580   1420.1610      4.3790      2.0860
+      1.3630   1420.2000      4.4410      2.0940
+      1.4740   1420.2510      4.6680      2.1010
+      1.6360   1420.3040      4.6400      2.1130
+      1.7570   1420.3450      4.6490      2.1210
+      1.8500   1420.3690      5.1390      2.1280
+      1.9090   1420.3720      5.5640      2.1290
+      2.0040   1420.3200      5.5750      2.1160
+      2.1040   1420.3030      5.5700      2.1220
+      2.2440   1420.3120      5.5680      2.1170
+      2.4490   1420.2810      5.5760      2.1100
+      2.6050   1420.2150      5.5710      2.1040
+      2.7540   1420.1610      5.5630      2.0850
+      2.8840   1419.8010      5.5770      2.0230
+      3.0910   1419.5930      5.5880      1.9600
+      3.2440   1419.5820      5.5910      1.9400
+      3.3840   1419.4110      5.6590      1.9290
+      3.4920   1419.3220      5.6670      1.9180
+      3.5110   1419.2340      5.6750      1.8970
+      3.6330   1419.1430      5.6680      1.8650
+      3.7640   1419.1050      5.6670      1.8480
+      3.9430   1419.1280      5.6660      1.8540
+      4.1470   1419.1020      5.6670      1.8460
+      4.3430   1418.9800      5.6680      1.8280
+      4.5330   1418.8350      5.6730      1.8010
+      4.7380   1418.8360      5.6790      1.7920
+      4.9530   1418.7640      5.6800      1.7850
+      5.1320   1418.7080      5.6800      1.7730
+      5.3500   1418.6900      5.6810      1.7570
+      5.5520   1418.6420      5.6870      1.7500
+      5.7520   1418.5220      5.6960      1.7330
+      5.9220   1418.4150      5.6990      1.7150
+      6.0960   1418.4080      5.7060      1.6880
+      6.3470   1418.3970      5.7220      1.6720
+      6.5310   1418.0370      5.7340      1.6530
+      6.7010   1417.8790      5.7470      1.5950
+      6.9120   1417.7950      5.7600      1.5580
+      7.1040   1417.6600      5.7760      1.5190
+      7.2890   1417.3060      5.8130      1.4700
+      7.4730   1417.1030      5.8330      1.4060
+      7.7180   1416.7390      5.8600      1.3200
+      7.8780   1416.6360      5.8750      1.2630
+      8.0720   1416.1940      5.9020      1.1930
+      8.2850   1416.0220      5.9180      1.1270
+      8.4810   1415.8910      5.9350      1.0880
+      8.6710   1415.7590      5.9420      1.0600
+      8.8480   1415.7040      5.9440      1.0410
+      9.0660   1415.6630      5.9440      1.0280
+      9.2430   1415.6250      5.9410      1.0210
+      9.4290   1415.5750      5.9400      1.0120
+      9.6390   1415.5430      5.9420      1.0050
+      9.8200   1415.5100      5.9420      1.0010
+     10.0050   1415.4940      5.9430      1.0000
+     10.1840   1415.5030      5.9450      0.9990
+     10.4290   1415.5180      5.9500      0.9970
+     10.6300   1415.5370      5.9490      1.0090
+     10.7850   1415.5590      5.9510      1.0100
+     11.0390   1415.5810      5.9560      1.0080
+     11.2170   1415.5900      5.9600      1.0120
+     11.4050   1415.5810      5.9590      1.0150
+     11.5660   1415.5590      5.9650      0.9970
+     11.7820   1415.5250      5.9690      0.9960
+     11.9450   1415.4930      5.9710      0.9880
+     12.0310   1415.4990      5.9680      0.9900
+     12.1690   1415.4800      5.9740      0.9850
+     12.3170   1415.5050      5.9760      0.9860
+     12.5080   1415.5110      5.9760      0.9930
+     12.7360   1415.4900      5.9730      0.9870
+     12.9780   1415.4870      5.9750      0.9780
+     13.2220   1415.4740      5.9740      0.9820
+     13.4130   1415.4720      5.9740      0.9820
+     13.6400   1415.4740      5.9680      0.9780
+     13.8840   1415.4670      5.9680      0.9770
+     14.1080   1415.4570      5.9710      0.9750
+     14.3070   1415.4480      5.9740      0.9680
+     14.5710   1415.4380      5.9720      0.9670
+     14.8020   1415.4260      5.9750      0.9670
+     15.0350   1415.4060      5.9780      0.9600
+     15.2470   1415.3660      5.9810      0.9450
+     15.5240   1415.3280      5.9880      0.9310
+     15.7520   1415.3000      5.9880      0.9290
+     15.9990   1415.2800      5.9890      0.9260
+     16.3160   1415.2690      5.9940      0.9230
+     16.5530   1415.2390      5.9990      0.9050
+     16.7990   1415.2750      6.0040      0.9130
+     17.0850   1415.3680      6.0050      0.9350
+     17.3830   1415.7850      6.0100      1.0070
+     17.6140   1416.0270      6.0120      1.0740
+     17.8620   1416.3410      6.0210      1.1300
+     18.0630   1416.7100      6.0350      1.2040
+     18.1770   1416.8590      6.0320      1.2540
+     18.3200   1417.1330      6.0300      1.2750
+     18.5010   1417.1800      6.0310      1.2940
+     18.8110   1417.1940      6.0340      1.2960
+     19.0840   1417.2540      6.0340      1.3070
+     19.3790   1417.3390      6.0340      1.3330
+     19.6840   1417.4050      6.0340      1.3420
+     19.9730   1417.4360      6.0340      1.3430
+     20.2690   1417.4500      6.0350      1.3500
+     20.5560   1417.4550      6.0420      1.3430
+     20.8670   1417.5290      6.0490      1.3540
+     21.1350   1417.6670      6.0520      1.3820
+     21.4820   1417.3810      6.0470      1.3650
+     21.7530   1416.4560      6.0600      1.1520
+     22.0200   1415.7420      6.0670      0.9620
+     22.2950   1415.1820      6.0750      0.8400
+     22.5890   1414.9440      6.0860      0.7940
+     22.9100   1414.7950      6.0840      0.7710
+     23.2000   1414.7550      6.0840      0.7730
+     23.4910   1414.7560      6.0830      0.7680
+     23.8310   1414.7320      6.0820      0.7600
+     24.1250   1414.6950      6.0880      0.7510
+     24.4110   1414.7070      6.0850      0.7550
+     24.6970   1414.7000      6.0880      0.7510
+     25.0310   1414.7080      6.0850      0.7530
+     25.3040   1414.6800      6.0860      0.7490
+     25.5850   1414.6880      6.0850      0.7450
+     25.9090   1414.6990      6.0840      0.7500
+     26.2160   1414.6790      6.0890      0.7470
+     26.4530   1414.6760      6.0870      0.7420
+     26.7540   1414.6680      6.0870      0.7430
+     27.0920   1414.6950      6.0890      0.7440
+     27.3760   1414.7130      6.0900      0.7390
+     27.6920   1414.7120      6.0830      0.7500
+     27.9460   1414.7110      6.0900      0.7390
+     28.2860   1414.6900      6.0900      0.7390
+     28.5630   1414.6720      6.0930      0.7360
+     28.8610   1414.6790      6.0970      0.7370
+     29.1880   1414.6920      6.0920      0.7380
+     29.4760   1414.7030      6.0980      0.7330
+     29.7490   1414.7050      6.0960      0.7390
+     30.0270   1414.7130      6.0990      0.7350
+     30.3470   1414.7230      6.0990      0.7360
+     30.6300   1414.7310      6.0980      0.7390
+     30.9280   1414.7370      6.0980      0.7400
+     31.2090   1414.7440      6.0980      0.7390
+     31.5020   1414.7400      6.0960      0.7400
+     31.8170   1414.7320      6.1020      0.7330
+     32.0740   1414.7340      6.0960      0.7280
+     32.3690   1414.7250      6.0950      0.7340
+     32.6670   1414.7400      6.0930      0.7340
+     32.9620   1414.7590      6.0940      0.7390
+     33.2910   1414.7640      6.0980      0.7390
+     33.5570   1414.7600      6.0990      0.7360
+     33.8380   1414.7530      6.0990      0.7350
+     34.1440   1414.7420      6.0990      0.7320
+     34.4390   1414.7370      6.1000      0.7200
+     34.7520   1414.7170      6.1000      0.7200
+     35.0050   1414.7100      6.1000      0.7160
+     35.3340   1414.6570      6.1040      0.7090
+     35.6020   1414.6320      6.1020      0.6980
+     35.9050   1414.5910      6.1040      0.6870
+     36.1880   1414.5890      6.1000      0.6930
+     36.5310   1414.5830      6.1030      0.6880
+     36.8030   1414.5710      6.1090      0.6820
+     37.1030   1414.5920      6.1100      0.6870
+     37.3880   1414.6090      6.1080      0.6870
+     37.7140   1414.6130      6.1070      0.6900
+     37.9690   1414.6030      6.1080      0.6840
+     38.2520   1414.5800      6.1110      0.6800
+     38.5680   1414.5480      6.1170      0.6740
+     38.8550   1414.5410      6.1110      0.6690
+     39.1150   1414.5380      6.1120      0.6640
+     39.4180   1414.5880      6.1140      0.6670
+     39.6920   1414.6230      6.1120      0.6860
+     40.0250   1414.6650      6.1140      0.6900
+     40.3160   1414.7360      6.1130      0.7050
+     40.6010   1414.8020      6.1170      0.7080
+     40.8940   1414.8560      6.1150      0.7260
+     41.1860   1414.9610      6.1130      0.7460
+     41.4580   1415.1720      6.1160      0.7760
+     41.7590   1415.2860      6.1160      0.8110
+     42.0510   1415.3360      6.1170      0.8150
+     42.3520   1415.3530      6.1110      0.8260
+     42.6310   1415.3230      6.1140      0.8090
+     42.9080   1415.3330      6.1150      0.8150
+     43.1980   1415.3630      6.1160      0.8210
+     43.5080   1415.2160      6.1260      0.7920
+     43.7390   1414.9330      5.8820      0.7920
@@ -0,0 +1,3714 @@
+test_read_store_and_write
+11/8/2015
+16:52:0
+Probe: MIDAS SVX2 6000
+Source: /root/package/data/input/valeport/midas/svx2/FILE8.6000.000
+      1.0070   1543.1500     33.1108     29.7540
+      2.0240   1543.1170     33.0605     29.7550
+      3.0030   1543.1160     33.0521     29.7510
+      3.0150   1543.0930     33.0338     29.7490
+      3.9790   1543.1370     33.0643     29.7470
+      4.9740   1543.1080     33.0139     29.7500
+      6.0340   1543.1330     33.0185     29.7510
+      6.9790   1543.1390     33.0170     29.7470
+      8.0140   1543.1530     33.0055     29.7510
+      8.9970   1543.1730     33.0086     29.7510
+     10.0280   1543.1910     33.0132     29.7490
+     11.0850   1543.2130     33.0147     29.7500
+     11.9340   1543.2270     33.0162     29.7490
+     13.0000   1543.2580     33.0223     29.7520
+     13.9370   1543.2710     33.0238     29.7500
+     14.9770   1543.2880     33.0147     29.7540
+     15.9400   1543.3060     33.0223     29.7510
+     17.0010   1543.3330     33.0292     29.7520
+     17.9070   1543.3510     33.0215     29.7570
+     18.9610   1543.3780     33.0338     29.7550
+     19.9140   1543.4180     33.0467     29.7600
+     20.9120   1543.4560     33.0589     29.7640
+     21.9300   1543.4750     33.0688     29.7600
+     22.9630   1543.4980     33.0673     29.7630
+     23.8970   1543.5280     33.0795     29.7640
+     24.9200   1543.5540     33.0811     29.7670
+     25.9080   1543.5830     33.0826     29.7720
+     26.9080   1543.6030     33.0841     29.7730
+     27.9360   1543.6230     33.0841     29.7740
+     28.8390   1543.6380     33.0879     29.7720
+     29.9470   1543.6490     33.0925     29.7660
+     30.8400   1543.6540     33.0948     29.7600
+     31.8970   1543.6630     33.0879     29.7590
+     32.9370   1543.6760     33.0894     29.7560
+     33.8840   1543.6830     33.1070     29.7430
+     34.8450   1543.6940     33.1017     29.7430
+     35.8960   1543.7070     33.0948     29.7440
+     36.8500   1543.7190     33.0994     29.7400
+     37.9110   1543.7300     33.0986     29.7370
+     38.7830   1543.7390     33.1047     29.7310
+     39.8140   1543.7470     33.1055     29.7260
+     40.9290   1543.7630     33.1055     29.7250
+     41.7570   1543.7780     33.1200     29.7180
+     42.9450   1543.7990     33.1146     29.7210
+     43.7690   1543.8100     33.1200     29.7170
+     44.7970   1543.8080     33.1009     29.7170
+     45.8260   1543.8000     33.1093     29.7010
+     46.7590   1543.8130     33.1123     29.6980
+     47.7630   1543.5950     32.9514     29.6660
+     48.8380   1542.9060     32.7126     29.4500
+     49.7590   1542.4290     32.7560     29.1980
+     50.7470   1541.6890     33.1848     28.6400
+     51.7000   1541.2920     33.1825     28.4520
+     52.8490   1540.9120     33.1558     28.2830
+     53.7380   1540.6760     33.2191     28.1390
+     54.8300   1540.0160     33.0086     27.9330
+     55.7280   1539.5720     33.2283     27.6240
+     56.7320   1539.0870     33.5106     27.2690
+     57.7560   1538.7910     33.4915     27.1400
+     58.6900   1538.5490     33.4335     27.0540
+     59.8230   1538.3560     33.4961     26.9320
+     60.7490   1538.3010     33.5785     26.8630
+     61.6600   1538.2130     33.5571     26.8280
+     62.6940   1538.0360     33.6227     26.7130
+     63.6650   1537.8130     33.5098     26.6610
+     64.7120   1537.4600     33.3984     26.5520
+     65.6710   1536.9830     33.2954     26.3870
+     66.7120   1536.0960     33.0986     26.0900
+     67.6940   1535.5200     33.2069     25.7900
+     68.6780   1534.4040     32.9552     25.4280
+     69.6960   1533.8750     33.2092     25.0880
+     70.5940   1533.5340     33.3672     24.8710
+     71.6800   1532.2520     32.8140     24.5830
+     72.7370   1531.6650     33.3908     24.0860
+     73.7030   1531.3510     33.6182     23.8550
+     74.7280   1530.9060     33.6823     23.6430
+     75.6810   1530.5240     33.6380     23.5040
+     76.5840   1530.0480     33.5541     23.3460
+     77.5880   1529.7100     33.6983     23.1450
+     78.6190   1529.5260     33.8860     22.9860
+     79.7010   1529.3610     33.9577     22.8840
+     80.6060   1529.2380     33.9767     22.8220
+     81.5800   1529.0980     34.0034     22.7500
+     82.5970   1528.8560     33.9035     22.6920
+     83.6270   1528.4680     33.8142     22.5730
+     84.5670   1528.3360     33.9920     22.4410
+     85.6360   1528.2320     34.0919     22.3520
+     86.6160   1528.0510     34.0645     22.2880
+     87.4940   1527.8380     34.0591     22.2030
+     88.5570   1527.6420     34.0477     22.1260
+     89.5400   1527.4080     34.0446     22.0320
+     90.4970   1527.3180     34.1133     21.9630
+     91.4590   1527.2770     34.1690     21.9180
+     92.4720   1527.2650     34.2117     21.8890
+     93.5410   1527.1890     34.2079     21.8550
+     94.4970   1527.0280     34.1843     21.7980
+     95.4610   1526.8600     34.1415     21.7460
+     96.5760   1526.7720     34.1911     21.6850
+     97.5080   1526.7280     34.2407     21.6420
+     98.5730   1526.6480     34.2270     21.6110
+     99.5490   1526.6460     34.2751     21.5840
+    100.4370   1526.5000     34.2300     21.5420
+    101.6170   1526.2620     34.2529     21.4360
+    102.4780   1526.1930     34.2834     21.3920
+    103.4370   1525.9850     34.2865     21.3070
+    104.4370   1525.8850     34.2804     21.2660
+    105.4380   1525.8630     34.2941     21.2460
+    106.5160   1525.8560     34.3292     21.2220
+    107.4170   1525.8140     34.3140     21.2070
+    108.4840   1525.7340     34.3231     21.1670
+    109.3600   1525.6980     34.3185     21.1500
+    110.3890   1525.4470     34.2514     21.0780
+    111.3860   1525.1360     34.2163     20.9710
+    112.3790   1524.8660     34.2514     20.8510
+    113.4760   1524.7200     34.2766     20.7800
+    114.4100   1524.6330     34.3216     20.7240
+    115.4400   1524.4650     34.3285     20.6530
+    116.4170   1524.3880     34.3529     20.6090
+    117.4220   1524.2750     34.3414     20.5660
+    118.4310   1524.1620     34.3575     20.5120
+    119.3020   1524.0910     34.3864     20.4690
+    120.3680   1524.0330     34.4070     20.4330
+    121.3760   1524.0210     34.3910     20.4290
+    122.5300   1524.0180     34.4223     20.4080
+    123.4710   1524.0250     34.4246     20.4040
+    124.3080   1523.9740     34.3956     20.3920
+    125.3830   1523.9400     34.4078     20.3680
+    126.2450   1523.8070     34.3422     20.3410
+    127.3060   1523.4490     34.2972     20.2230
+    128.2420   1523.1970     34.3216     20.1160
+    129.2710   1523.1360     34.3758     20.0660
+    130.4910   1523.0790     34.4284     20.0170
+    131.4130   1523.0030     34.4055     19.9930
+    132.2240   1522.8830     34.3536     19.9660
+    133.2120   1522.5810     34.2949     19.8750
+    134.2650   1522.2090     34.1858     19.7790
+    135.2220   1522.0220     34.2896     19.6650
+    136.3410   1521.7600     34.3422     19.5440
+    137.2860   1521.5310     34.3224     19.4650
+    138.2490   1521.3650     34.2903     19.4130
+    139.1970   1520.7320     34.2117     19.2150
+    140.1940   1520.3530     34.2896     19.0450
+    141.2140   1520.0020     34.3376     18.8970
+    142.2150   1519.8430     34.3620     18.8260
+    143.2800   1519.6040     34.3658     18.7350
+    144.2930   1519.5120     34.3788     18.6920
+    145.1480   1519.4080     34.3529     18.6610
+    146.1610   1519.2820     34.4482     18.5740
+    147.2050   1519.0750     34.3597     18.5310
+    148.2550   1519.0500     34.3826     18.5070
+    149.1300   1519.0510     34.4070     18.4930
+    150.1890   1519.0440     34.4078     18.4840
+    151.2580   1519.0400     34.4040     18.4780
+    152.0840   1519.0410     34.3971     18.4760
+    153.1700   1519.0250     34.4055     18.4610
+    154.1370   1518.9760     34.3834     18.4470
+    155.1660   1518.9450     34.3796     18.4320
+    156.0620   1518.9080     34.3895     18.4100
+    157.0760   1518.8960     34.4002     18.3960
+    158.0520   1518.7870     34.4093     18.3490
+    159.0610   1518.6770     34.3948     18.3110
+    160.0820   1518.4050     34.3353     18.2350
+    161.1470   1518.1950     34.3140     18.1650
+    162.1280   1517.9640     34.2682     18.0980
+    163.0380   1517.7610     34.3056     18.0090
+    164.0460   1517.3520     34.3933     17.8300
+    165.1460   1517.0960     34.4162     17.7280
+    166.1000   1517.0230     34.4055     17.7020
+    167.1130   1516.8740     34.3971     17.6490
+    168.1990   1516.8080     34.4193     17.6120
+    169.2250   1516.7710     34.4444     17.5840
+    169.9940   1516.7440     34.4376     17.5730
+    170.9900   1516.4630     34.3300     17.5140
+    172.0220   1516.4100     34.4376     17.4490
+    173.0450   1516.3250     34.4467     17.4110
+    174.0970   1516.2770     34.4551     17.3860
+    174.9840   1516.1970     34.4475     17.3570
+    175.9780   1516.0450     34.4299     17.3070
+    176.9920   1515.9330     34.4322     17.2630
+    177.9760   1515.7080     34.4902     17.1600
+    178.9140   1515.3710     34.4391     17.0620
+    180.0000   1515.1620     34.4505     16.9820
+    180.9080   1515.0150     34.4193     16.9400
+    181.9430   1514.8530     34.3971     16.8890
+    182.9020   1514.7200     34.4460     16.8210
+    184.0760   1514.5810     34.4315     16.7740
+    184.9070   1514.4600     34.4299     16.7300
+    185.9320   1514.3410     34.4276     16.6860
+    186.9140   1514.2300     34.4727     16.6270
+    187.9220   1513.8880     34.3185     16.5670
+    188.9060   1513.7270     34.4002     16.4780
+    189.9280   1513.6380     34.4406     16.4280
+    190.9630   1513.5520     34.4276     16.3990
+    191.8470   1513.5270     34.4330     16.3840
+    192.9690   1513.3490     34.3765     16.3410
+    193.8230   1513.1670     34.4131     16.2630
+    194.8640   1512.5060     34.2674     16.0970
+    195.8740   1512.4960     34.4124     16.0340
+    196.9350   1512.4670     34.4437     16.0070
+    197.8390   1512.4580     34.4444     15.9990
+    198.9490   1512.4280     34.4421     15.9840
+    199.7990   1512.3950     34.4498     15.9660
+    200.8020   1512.3270     34.4543     15.9370
+    201.7710   1512.2810     34.4620     15.9140
+    202.8910   1512.1310     34.4254     15.8730
+    203.8790   1512.1020     34.4421     15.8520
+    204.8950   1512.0290     34.4315     15.8270
+    205.8920   1511.8590     34.3933     15.7810
+    207.0130   1511.7600     34.3941     15.7430
+    207.8050   1511.6040     34.3582     15.7020
+    208.7260   1511.3450     34.4978     15.5620
+    209.7240   1510.9490     34.4193     15.4590
+    210.7300   1510.8600     34.4116     15.4280
+    211.7100   1510.7480     34.4093     15.3880
+    212.8110   1510.6880     34.4360     15.3530
+    213.8070   1510.6700     34.4391     15.3410
+    214.7800   1510.6180     34.4238     15.3250
+    215.8510   1510.5760     34.4208     15.3070
+    216.7670   1510.5140     34.4406     15.2750
+    217.6720   1510.4140     34.4688     15.2280
+    218.8200   1510.1860     34.3643     15.1880
+    219.8770   1510.0730     34.3796     15.1410
+    220.6790   1509.9840     34.4032     15.1000
+    221.6400   1509.7110     34.3208     15.0390
+    222.8340   1509.4130     34.3063     14.9440
+    223.6490   1509.1640     34.3048     14.8620
+    224.6650   1508.7270     34.4154     14.6790
+    225.6730   1508.5040     34.2705     14.6570
+    226.6490   1508.2210     34.3704     14.5270
+    227.6630   1508.1600     34.3834     14.4980
+    228.6520   1508.1080     34.4261     14.4610
+    229.7540   1507.9610     34.3452     14.4390
+    230.6920   1507.8780     34.3819     14.3950
+    231.5720   1507.7140     34.4025     14.3320
+    232.6190   1507.4700     34.4215     14.2440
+    233.5860   1507.2760     34.4162     14.1810
+    234.6840   1507.1450     34.3719     14.1510
+    235.7380   1507.1210     34.4276     14.1180
+    236.5930   1507.0310     34.3910     14.0990
+    237.5700   1506.9520     34.3872     14.0710
+    238.5550   1506.8780     34.3765     14.0470
+    239.5340   1506.8300     34.4269     14.0090
+    240.6190   1506.7700     34.4154     13.9890
+    241.7000   1506.7320     34.4070     13.9750
+    242.6230   1506.7100     34.3941     13.9680
+    243.7080   1506.6600     34.3918     13.9480
+    244.4840   1506.5960     34.4009     13.9210
+    245.5010   1506.4400     34.3369     13.8910
+    246.5670   1506.2410     34.3689     13.8130
+    247.4720   1506.0230     34.3269     13.7570
+    248.5440   1505.8970     34.3742     13.6960
+    249.6000   1505.7830     34.3849     13.6520
+    250.4520   1505.6670     34.3857     13.6120
+    251.6300   1505.5650     34.3521     13.5870
+    252.4820   1505.4840     34.3468     13.5600
+    253.4590   1505.3410     34.4208     13.4850
+    254.4270   1505.1460     34.2644     13.4770
+    255.5580   1505.1450     34.3788     13.4300
+    256.4990   1505.0390     34.3597     13.4000
+    257.5640   1504.9010     34.3346     13.3620
+    258.6260   1504.7980     34.3468     13.3210
+    259.6400   1504.7470     34.3620     13.2950
+    260.3940   1504.6080     34.3681     13.2470
+    261.3740   1504.4650     34.2873     13.2280
+    262.5570   1504.4880     34.3765     13.1970
+    263.4300   1504.4510     34.3697     13.1840
+    264.3650   1504.4450     34.3933     13.1690
+    265.5350   1504.4440     34.3758     13.1690
+    266.6010   1504.4560     34.3796     13.1660
+    267.3780   1504.4370     34.3750     13.1580
+    268.3530   1504.3880     34.3842     13.1350
+    269.3340   1504.1870     34.3079     13.0970
+    270.5550   1504.1440     34.3498     13.0630
+    271.3450   1504.0940     34.3552     13.0420
+    272.5650   1504.0470     34.3575     13.0210
+    273.4330   1503.9960     34.3613     13.0000
+    274.3520   1503.9260     34.3628     12.9740
+    275.2860   1503.8760     34.3498     12.9590
+    276.2780   1503.7790     34.3468     12.9260
+    277.3290   1503.6830     34.3445     12.8930
+    278.3550   1503.6650     34.3651     12.8750
+    279.5410   1503.5940     34.3399     12.8570
+    280.4500   1503.5100     34.3552     12.8220
+    281.3170   1503.4720     34.3529     12.8070
+    282.3510   1503.3700     34.3315     12.7790
+    283.2650   1503.3400     34.3445     12.7610
+    284.2330   1503.2790     34.3781     12.7260
+    285.3320   1503.1770     34.3819     12.6890
+    286.2490   1503.1040     34.3498     12.6740
+    287.2040   1503.0650     34.3636     12.6530
+    288.3560   1503.0040     34.3384     12.6380
+    289.4510   1502.9820     34.3636     12.6170
+    290.2540   1502.9400     34.3399     12.6090
+    291.2220   1502.7870     34.3201     12.5660
+    292.2410   1502.6650     34.3307     12.5210
+    293.2380   1502.3730     34.3498     12.4230
+    294.1440   1502.1370     34.3071     12.3640
+    295.1870   1501.8580     34.2949     12.2810
+    296.1590   1501.6870     34.3460     12.2080
+    297.1470   1501.5260     34.2941     12.1740
+    298.1910   1501.3140     34.2621     12.1180
+    299.1050   1501.2130     34.2964     12.0720
+    300.1830   1501.1550     34.3185     12.0420
+    301.1460   1501.0570     34.3605     11.9940
+    302.1140   1501.0530     34.3887     11.9780
+    303.1290   1501.0230     34.3529     11.9770
+    304.1710   1501.0170     34.3536     11.9700
+    305.1550   1500.9770     34.3323     11.9610
+    306.1520   1500.9170     34.3170     11.9440
+    307.1300   1500.8290     34.3323     11.9080
+    308.0510   1500.7930     34.3613     11.8830
+    309.0990   1500.7560     34.3788     11.8610
+    310.1210   1500.7360     34.3651     11.8550
+    311.0850   1500.7300     34.3468     11.8550
+    312.1150   1500.7290     34.3430     11.8510
+    313.0800   1500.7340     34.3536     11.8440
+    314.0770   1500.7310     34.3544     11.8380
+    315.0360   1500.7020     34.3513     11.8260
+    316.0460   1500.6540     34.3262     11.8160
+    317.0580   1500.5820     34.3155     11.7940
+    318.0890   1500.5070     34.3216     11.7650
+    318.9880   1500.4630     34.3269     11.7460
+    320.0220   1500.3990     34.3597     11.7110
+    321.0430   1500.3340     34.3376     11.6950
+    321.9690   1500.3140     34.3742     11.6720
+    323.0960   1500.2440     34.3262     11.6630
+    324.0790   1500.2100     34.3239     11.6490
+    324.9410   1500.1950     34.3483     11.6320
+    325.9730   1500.1920     34.3315     11.6320
+    327.0990   1500.1120     34.3216     11.6070
+    327.9640   1499.9810     34.3071     11.5700
+    328.9520   1499.8880     34.3140     11.5360
+    329.9610   1499.7100     34.3018     11.4840
+    330.9430   1499.5740     34.3132     11.4360
+    331.9560   1499.4860     34.3277     11.4010
+    333.0590   1499.3850     34.3208     11.3690
+    333.8610   1499.2970     34.2972     11.3480
+    334.9090   1499.2280     34.3002     11.3220
+    335.8910   1499.1740     34.3117     11.2980
+    336.9150   1499.0840     34.2834     11.2770
+    337.8880   1498.9990     34.3063     11.2400
+    338.9760   1498.9480     34.3269     11.2130
+    339.8410   1498.9200     34.3185     11.2040
+    340.9360   1498.8550     34.3185     11.1800
+    341.8920   1498.7860     34.3094     11.1590
+    342.8640   1498.7680     34.3384     11.1390
+    343.8670   1498.6900     34.3269     11.1160
+    344.8440   1498.6470     34.3300     11.0980
+    345.8530   1498.5860     34.3262     11.0770
+    346.7910   1498.5120     34.3246     11.0520
+    347.8870   1498.4670     34.3163     11.0370
+    348.7650   1498.4570     34.3307     11.0250
+    349.8000   1498.4220     34.3163     11.0150
+    350.9240   1498.3800     34.3040     11.0020
+    351.8180   1498.3580     34.3109     10.9890
+    352.8180   1498.3310     34.3216     10.9730
+    353.8350   1498.2750     34.3048     10.9580
+    354.8190   1498.1810     34.2949     10.9300
+    355.7290   1498.1060     34.3307     10.8920
+    356.7790   1498.0760     34.3384     10.8760
+    357.7340   1498.0350     34.3170     10.8670
+    358.7910   1497.9900     34.3124     10.8510
+    359.6940   1497.9390     34.3010     10.8360
+    360.8340   1497.8550     34.3002     10.8070
+    361.7000   1497.8410     34.3178     10.7930
+    362.7730   1497.8230     34.3468     10.7730
+    363.6650   1497.7120     34.3010     10.7530
+    364.6540   1497.6150     34.3094     10.7180
+    365.8080   1497.4780     34.3002     10.6770
+    366.7060   1497.3840     34.2979     10.6470
+    367.7030   1497.2850     34.2964     10.6150
+    368.7360   1497.1340     34.2834     10.5720
+    369.6400   1497.0410     34.2850     10.5410
+    370.7200   1496.9270     34.3315     10.4880
+    371.6400   1496.8720     34.2972     10.4800
+    372.6430   1496.8140     34.3262     10.4490
+    373.6580   1496.7850     34.3468     10.4290
+    374.6140   1496.7570     34.3193     10.4260
+    375.5730   1496.7480     34.3338     10.4140
+    376.6240   1496.6930     34.2918     10.4080
+    377.5580   1496.6430     34.3056     10.3850
+    378.5910   1496.6120     34.3361     10.3610
+    379.5350   1496.5540     34.3170     10.3470
+    380.6060   1496.5250     34.3079     10.3370
+    381.6170   1496.5000     34.3353     10.3160
+    382.6540   1496.4240     34.3079     10.2990
+    383.6130   1496.3690     34.2880     10.2860
+    384.5200   1496.3250     34.2834     10.2710
+    385.6110   1496.3050     34.2934     10.2570
+    386.4980   1496.2980     34.3048     10.2470
+    387.6120   1496.2860     34.3269     10.2310
+    388.4780   1496.2470     34.3155     10.2200
+    389.5260   1496.1690     34.3193     10.1920
+    390.5350   1496.1410     34.3033     10.1850
+    391.5180   1496.1070     34.3025     10.1710
+    392.5670   1496.0850     34.2941     10.1630
+    393.6130   1496.0470     34.2865     10.1500
+    394.5370   1495.9980     34.2896     10.1310
+    395.4630   1495.9570     34.2934     10.1140
+    396.5410   1495.9250     34.3147     10.0930
+    397.4370   1495.8860     34.3117     10.0790
+    398.4140   1495.8450     34.3086     10.0640
+    399.5290   1495.8210     34.3124     10.0510
+    400.5520   1495.7610     34.2903     10.0370
+    401.4000   1495.7110     34.2850     10.0210
+    402.4150   1495.6350     34.2705     10.0000
+    403.5720   1495.6000     34.2819      9.9810
+    404.5420   1495.5710     34.2896      9.9660
+    405.4170   1495.5510     34.3086      9.9500
+    406.4210   1495.4980     34.2896      9.9370
+    407.3660   1495.4430     34.2880      9.9180
+    408.3520   1495.4220     34.3224      9.8960
+    409.3500   1495.4010     34.2796      9.9000
+    410.3490   1495.3790     34.2865      9.8870
+    411.4150   1495.2900     34.2995      9.8530
+    412.3470   1495.2030     34.3079      9.8220
+    413.5240   1495.1160     34.3033      9.7940
+    414.4080   1495.0900     34.3086      9.7810
+    415.4500   1495.0610     34.3086      9.7680
+    416.3600   1495.0580     34.3033      9.7650
+    417.2870   1495.0660     34.2995      9.7640
+    418.3050   1495.0620     34.2941      9.7600
+    419.2380   1495.0420     34.2918      9.7510
+    420.2510   1495.0610     34.2972      9.7500
+    421.3840   1495.0510     34.3002      9.7410
+    422.3130   1495.0370     34.2903      9.7360
+    423.2660   1495.0340     34.2873      9.7320
+    424.3980   1495.0330     34.2888      9.7260
+    425.2180   1495.0430     34.3002      9.7210
+    426.2250   1495.0390     34.2979      9.7160
+    427.3590   1494.9940     34.2873      9.7020
+    428.2180   1494.9370     34.2972      9.6790
+    429.4950   1494.8790     34.2621      9.6690
+    430.3780   1494.8530     34.2766      9.6530
+    431.2990   1494.8250     34.2682      9.6440
+    432.2190   1494.8220     34.2827      9.6340
+    433.2070   1494.8040     34.2812      9.6250
+    434.1560   1494.7970     34.2979      9.6130
+    435.1420   1494.7900     34.2964      9.6070
+    436.1300   1494.7520     34.2880      9.5950
+    437.2040   1494.7630     34.3002      9.5890
+    438.2040   1494.7440     34.2827      9.5850
+    439.1420   1494.7330     34.2819      9.5780
+    440.3510   1494.7320     34.2827      9.5720
+    441.2120   1494.7330     34.2834      9.5680
+    442.1590   1494.7380     34.2804      9.5660
+    443.1470   1494.7160     34.2995      9.5490
+    444.0860   1494.7170     34.2995      9.5450
+    445.0660   1494.7240     34.2918      9.5450
+    446.1820   1494.6710     34.2606      9.5360
+    447.1250   1494.6400     34.2819      9.5160
+    448.1650   1494.5440     34.2545      9.4940
+    449.0580   1494.4770     34.2743      9.4650
+    450.0200   1494.4330     34.2819      9.4460
+    451.0130   1494.3290     34.2644      9.4190
+    452.0540   1494.2790     34.2957      9.3900
+    453.0830   1494.2200     34.2636      9.3800
+    454.0150   1494.1770     34.2606      9.3650
+    455.1530   1494.1610     34.2857      9.3470
+    456.0640   1494.0810     34.2735      9.3250
+    457.1490   1494.0380     34.3018      9.2990
+    458.0360   1493.9670     34.2880      9.2800
+    459.0590   1493.8820     34.3071      9.2460
+    460.0130   1493.8360     34.2773      9.2390
+    460.9650   1493.7640     34.2354      9.2290
+    461.9850   1493.7190     34.2659      9.2020
+    462.9270   1493.6380     34.2438      9.1830
+    463.9460   1493.5980     34.2873      9.1530
+    464.9300   1493.5610     34.2773      9.1420
+    465.8980   1493.5250     34.2796      9.1270
+    466.8830   1493.4980     34.2590      9.1220
+    468.0010   1493.4570     34.2705      9.1020
+    468.8820   1493.4320     34.2682      9.0920
+    469.9300   1493.4030     34.2636      9.0810
+    471.0710   1493.3700     34.2567      9.0690
+    471.8660   1493.3470     34.2636      9.0570
+    472.9610   1493.3380     34.2773      9.0450
+    473.8580   1493.3320     34.2812      9.0380
+    474.8320   1493.3300     34.2812      9.0330
+    475.8130   1493.2900     34.2690      9.0220
+    476.9480   1493.2960     34.2850      9.0130
+    477.8410   1493.2930     34.2796      9.0100
+    479.0770   1493.2930     34.2690      9.0080
+    479.8810   1493.3020     34.2773      9.0040
+    480.8160   1493.3110     34.2720      9.0040
+    481.8060   1493.3260     34.2827      9.0000
+    482.7620   1493.3450     34.2735      9.0040
+    483.8930   1493.3640     34.2766      9.0030
+    484.8180   1493.3800     34.2735      9.0040
+    485.8110   1493.3910     34.2697      9.0040
+    486.8410   1493.4070     34.2743      9.0020
+    487.7940   1493.4270     34.2834      9.0000
+    488.7230   1493.4390     34.2781      9.0010
+    489.7800   1493.4560     34.2773      9.0010
+    490.7350   1493.4670     34.2705      9.0020
+    491.7120   1493.4760     34.2705      9.0000
+    492.8010   1493.4880     34.2743      8.9970
+    493.7430   1493.4900     34.2781      8.9920
+    494.7520   1493.4670     34.2697      8.9840
+    495.7830   1493.3780     34.2621      8.9580
+    496.6640   1493.3140     34.2789      8.9310
+    497.7940   1493.2080     34.2682      8.9010
+    498.6770   1493.1830     34.2957      8.8810
+    499.7160   1493.1440     34.2804      8.8710
+    500.6990   1493.1400     34.2995      8.8590
+    501.6460   1493.1470     34.2896      8.8600
+    502.6600   1493.1580     34.2789      8.8620
+    503.6490   1493.1580     34.2773      8.8580
+    504.7670   1493.1590     34.2903      8.8490
+    505.6950   1493.1470     34.2621      8.8510
+    506.6570   1493.1410     34.2743      8.8410
+    507.6360   1493.1430     34.2651      8.8400
+    508.6100   1493.0640     34.2453      8.8210
+    509.5680   1493.0600     34.2682      8.8080
+    510.6310   1493.0650     34.2667      8.8050
+    511.7890   1493.0540     34.2545      8.8010
+    512.6200   1493.0500     34.2819      8.7870
+    513.6120   1493.0120     34.2857      8.7710
+    514.5260   1492.9750     34.3094      8.7490
+    515.5660   1492.9400     34.2888      8.7420
+    516.5000   1492.9140     34.2789      8.7340
+    517.5270   1492.8630     34.2842      8.7140
+    518.6510   1492.8360     34.2743      8.7050
+    519.4850   1492.8200     34.2682      8.6990
+    520.5650   1492.8130     34.2781      8.6890
+    521.6300   1492.7970     34.2712      8.6820
+    522.5210   1492.7550     34.2918      8.6600
+    523.4940   1492.6890     34.2255      8.6600
+    524.6350   1492.5920     34.2552      8.6190
+    525.4780   1492.5210     34.2285      8.6050
+    526.4180   1492.4910     34.2636      8.5810
+    527.4240   1492.4270     34.2407      8.5670
+    528.4580   1492.3210     34.2590      8.5280
+    529.4760   1492.2490     34.2384      8.5110
+    530.4100   1492.2340     34.2529      8.4980
+    531.3890   1492.2390     34.2529      8.4950
+    531.4170   1492.2390     34.2682      8.4900
+    531.4370   1492.2410     34.2659      8.4910
+    532.3910   1492.2400     34.2705      8.4850
+    533.3710   1492.2470     34.2567      8.4870
+    534.4250   1492.2460     34.2720      8.4770
+    535.3540   1492.2450     34.2621      8.4760
+    536.3660   1492.2170     34.2529      8.4670
+    537.4330   1492.1350     34.2331      8.4470
+    538.3380   1492.1220     34.2522      8.4330
+    539.3720   1492.0990     34.2468      8.4240
+    540.3090   1492.0870     34.2552      8.4140
+    541.3010   1492.0860     34.2560      8.4090
+    542.4160   1492.0560     34.2560      8.3960
+    543.3540   1492.0440     34.2491      8.3910
+    544.2800   1492.0410     34.2583      8.3830
+    545.3550   1492.0480     34.2766      8.3740
+    546.3170   1492.0410     34.2461      8.3780
+    547.2610   1492.0310     34.2644      8.3650
+    548.2480   1491.9620     34.2415      8.3500
+    549.4590   1491.9660     34.2522      8.3420
+    550.3240   1491.9750     34.2628      8.3370
+    551.2250   1491.9840     34.2674      8.3340
+    552.2650   1491.9880     34.2598      8.3330
+    553.2400   1491.9830     34.2545      8.3290
+    554.2180   1491.9950     34.2628      8.3250
+    555.2650   1491.9880     34.2552      8.3210
+    556.3000   1491.9850     34.2636      8.3130
+    557.3010   1491.9650     34.2613      8.3040
+    558.2130   1491.9200     34.2850      8.2800
+    559.2380   1491.7090     34.2499      8.2310
+    560.2920   1491.7040     34.2621      8.2210
+    561.1920   1491.6890     34.2560      8.2150
+    562.2210   1491.6710     34.2644      8.2030
+    563.1670   1491.6720     34.2613      8.2000
+    564.2010   1491.6640     34.2651      8.1920
+    565.1820   1491.6560     34.2552      8.1890
+    566.1540   1491.6380     34.2636      8.1770
+    567.2100   1491.6480     34.2636      8.1750
+    568.2960   1491.6540     34.2659      8.1710
+    569.2760   1491.6560     34.2514      8.1720
+    570.2440   1491.6500     34.2613      8.1630
+    571.0850   1491.6530     34.2674      8.1580
+    572.0740   1491.6480     34.2712      8.1510
+    573.1090   1491.6480     34.2667      8.1480
+    574.1650   1491.6590     34.2674      8.1460
+    575.0360   1491.6570     34.2659      8.1420
+    576.0700   1491.5690     34.2392      8.1230
+    577.0550   1491.4850     34.2316      8.0990
+    578.1270   1491.3830     34.2476      8.0620
+    579.0510   1491.3480     34.2407      8.0510
+    580.0760   1491.3600     34.2667      8.0410
+    581.1420   1491.3460     34.2529      8.0370
+    582.0930   1491.3050     34.2529      8.0220
+    582.9790   1491.2480     34.2293      8.0110
+    584.0530   1491.1500     34.2484      7.9740
+    584.9630   1491.0930     34.2514      7.9540
+    586.0100   1490.9910     34.2499      7.9230
+    586.9690   1490.9820     34.2453      7.9180
+    588.0490   1490.9850     34.2575      7.9100
+    588.9630   1490.9480     34.2522      7.8980
+    590.0280   1490.8900     34.2613      7.8750
+    590.9230   1490.8090     34.2361      7.8580
+    591.9680   1490.8020     34.2468      7.8480
+    592.9760   1490.7970     34.2567      7.8390
+    593.9650   1490.8060     34.2567      7.8370
+    594.9500   1490.8050     34.2491      7.8350
+    595.9140   1490.8070     34.2468      7.8320
+    596.8860   1490.7750     34.2422      7.8210
+    597.9730   1490.7410     34.2491      7.8050
+    598.8740   1490.6890     34.2346      7.7920
+    600.0010   1490.6630     34.2384      7.7790
+    600.9650   1490.6390     34.2461      7.7660
+    601.8470   1490.6240     34.2499      7.7570
+    602.8100   1490.6230     34.2575      7.7500
+    603.8970   1490.5170     34.2285      7.7270
+    604.8890   1490.4680     34.2308      7.7090
+    605.9180   1490.4150     34.2300      7.6910
+    606.8030   1490.3970     34.2400      7.6790
+    607.8610   1490.3620     34.2560      7.6600
+    608.7610   1490.3300     34.2552      7.6480
+    609.7650   1490.2710     34.2438      7.6320
+    610.8160   1490.2860     34.2567      7.6270
+    611.9010   1490.2890     34.2415      7.6280
+    612.8220   1490.2790     34.2361      7.6230
+    613.7950   1490.2670     34.2415      7.6140
+    614.7800   1490.2440     34.2499      7.6010
+    615.7630   1490.2060     34.2522      7.5860
+    616.7560   1490.2050     34.2499      7.5820
+    617.7540   1490.2070     34.2537      7.5770
+    618.7870   1490.1670     34.2293      7.5700
+    619.7610   1490.0860     34.1919      7.5570
+    620.7140   1490.0280     34.2552      7.5170
+    621.7020   1490.0020     34.2484      7.5080
+    622.6600   1490.0000     34.2529      7.5020
+    623.6470   1489.9880     34.2422      7.4980
+    624.7260   1489.9550     34.2323      7.4880
+    625.6520   1489.9180     34.2728      7.4610
+    626.7360   1489.9080     34.2690      7.4550
+    627.6520   1489.8990     34.2621      7.4510
+    628.7010   1489.9010     34.2583      7.4480
+    629.6110   1489.8810     34.2369      7.4460
+    630.6050   1489.8580     34.2476      7.4320
+    631.6340   1489.8270     34.2430      7.4210
+    632.6220   1489.7370     34.2781      7.3820
+    633.6410   1489.6470     34.2812      7.3530
+    634.5920   1489.5390     34.2346      7.3360
+    635.6510   1489.4210     34.2529      7.2950
+    636.6120   1489.3800     34.2560      7.2790
+    637.5480   1489.3660     34.2545      7.2720
+    638.5640   1489.3480     34.2606      7.2610
+    639.5120   1489.3210     34.2720      7.2460
+    640.4980   1489.2630     34.2468      7.2350
+    641.5000   1489.2590     34.2613      7.2250
+    642.6000   1489.2340     34.2484      7.2180
+    643.5990   1489.2140     34.2468      7.2090
+    644.5060   1489.1450     34.2659      7.1810
+    645.4500   1489.1270     34.2545      7.1760
+    646.4540   1489.0800     34.2560      7.1590
+    647.5210   1489.0700     34.2491      7.1540
+    648.5800   1489.0370     34.2361      7.1450
+    649.5700   1489.0110     34.2545      7.1280
+    650.4270   1488.9670     34.2606      7.1110
+    651.4430   1488.8990     34.2514      7.0920
+    652.4050   1488.8200     34.2529      7.0670
+    653.4200   1488.8140     34.2476      7.0630
+    654.4220   1488.8230     34.2377      7.0640
+    655.3910   1488.8180     34.2491      7.0550
+    656.3690   1488.8090     34.2384      7.0520
+    657.3960   1488.8010     34.2583      7.0390
+    658.3730   1488.7740     34.2331      7.0360
+    659.4280   1488.7360     34.2354      7.0210
+    660.4460   1488.7460     34.2453      7.0160
+    661.4380   1488.7500     34.2445      7.0130
+    662.4700   1488.7480     34.2506      7.0060
+    663.3430   1488.7240     34.2628      6.9920
+    664.3320   1488.7200     34.2377      6.9950
+    665.3620   1488.7170     34.2552      6.9840
+    666.3450   1488.7180     34.2522      6.9810
+    667.3720   1488.7180     34.2545      6.9760
+    668.3220   1488.7190     34.2545      6.9720
+    669.2900   1488.7240     34.2491      6.9710
+    670.2580   1488.7020     34.2430      6.9630
+    671.2830   1488.7170     34.2506      6.9600
+    672.2880   1488.7290     34.2499      6.9590
+    673.2780   1488.7350     34.2545      6.9550
+    674.2300   1488.7390     34.2506      6.9530
+    675.2770   1488.7380     34.2575      6.9460
+    676.3480   1488.7130     34.2331      6.9430
+    677.2340   1488.7120     34.2545      6.9320
+    678.3100   1488.6990     34.2514      6.9250
+    679.2700   1488.6770     34.2583      6.9130
+    680.2330   1488.6740     34.2461      6.9120
+    681.2720   1488.6650     34.2529      6.9030
+    682.2140   1488.6630     34.2545      6.8980
+    683.1570   1488.6640     34.2613      6.8920
+    684.1480   1488.6690     34.2583      6.8900
+    685.1870   1488.6790     34.2430      6.8930
+    686.2850   1488.6920     34.2575      6.8870
+    687.1020   1488.7000     34.2499      6.8880
+    688.1450   1488.6990     34.2506      6.8830
+    689.1500   1488.6880     34.2415      6.8790
+    690.2200   1488.6770     34.2400      6.8720
+    691.3130   1488.6710     34.2422      6.8650
+    692.1610   1488.6670     34.2468      6.8590
+    693.2450   1488.6420     34.2522      6.8460
+    694.0940   1488.6550     34.2545      6.8450
+    695.1010   1488.6550     34.2506      6.8420
+    696.1700   1488.6500     34.2545      6.8350
+    697.1760   1488.6410     34.2583      6.8270
+    698.0560   1488.6330     34.2499      6.8240
+    699.0060   1488.5920     34.2606      6.8060
+    700.0250   1488.5630     34.2270      6.8050
+    701.0020   1488.5520     34.2545      6.7890
+    702.0410   1488.5450     34.2636      6.7800
+    703.1570   1488.5340     34.2583      6.7740
+    703.9680   1488.5110     34.2415      6.7700
+    705.0870   1488.4790     34.2484      6.7550
+    706.0540   1488.4530     34.2453      6.7450
+    706.9380   1488.4510     34.2537      6.7380
+    707.9390   1488.4350     34.2743      6.7230
+    708.9660   1488.4140     34.2567      6.7190
+    710.0100   1488.3990     34.2499      6.7130
+    711.0310   1488.3910     34.2514      6.7060
+    712.0110   1488.3900     34.2529      6.7010
+    712.9140   1488.3940     34.2628      6.6950
+    713.9390   1488.3740     34.2430      6.6920
+    714.9640   1488.3500     34.2384      6.6830
+    715.9780   1488.3170     34.2422      6.6690
+    716.9460   1488.2960     34.2529      6.6560
+    717.8860   1488.2670     34.2606      6.6420
+    718.8730   1488.2350     34.2476      6.6340
+    719.9060   1488.2330     34.2537      6.6270
+    720.8620   1488.2160     34.2278      6.6270
+    721.8300   1488.1880     34.2270      6.6160
+    722.8360   1488.1660     34.2491      6.5990
+    723.8860   1488.1150     34.2384      6.5850
+    724.9590   1488.1020     34.2506      6.5730
+    725.8740   1488.0520     34.2461      6.5580
+    726.8640   1488.0320     34.2545      6.5460
+    727.7530   1488.0270     34.2506      6.5420
+    728.8250   1488.0140     34.2484      6.5350
+    729.9160   1487.9920     34.2415      6.5270
+    730.7420   1487.9610     34.2308      6.5190
+    731.7720   1487.9210     34.2323      6.5040
+    732.8030   1487.8570     34.2552      6.4760
+    733.7690   1487.7850     34.2690      6.4490
+    734.7940   1487.7630     34.2598      6.4420
+    735.7820   1487.7340     34.2522      6.4330
+    736.8970   1487.6750     34.2216      6.4230
+    737.7950   1487.6490     34.2300      6.4100
+    738.7230   1487.6310     34.2346      6.4000
+    739.6570   1487.6180     34.2560      6.3860
+    740.6760   1487.6180     34.2606      6.3800
+    741.6670   1487.5890     34.2278      6.3790
+    742.7140   1487.5650     34.2484      6.3620
+    743.8010   1487.5400     34.2422      6.3530
+    744.8440   1487.4930     34.2163      6.3450
+    745.6360   1487.4720     34.2484      6.3260
+    746.5850   1487.4190     34.2285      6.3150
+    747.5940   1487.4160     34.2438      6.3050
+    748.6380   1487.3270     34.2377      6.2800
+    749.6220   1487.3260     34.2400      6.2750
+    750.7150   1487.3170     34.2369      6.2690
+    751.5890   1487.3180     34.2445      6.2630
+    752.5620   1487.3120     34.2339      6.2610
+    753.6530   1487.3140     34.2583      6.2490
+    754.5520   1487.3220     34.2430      6.2520
+    755.6100   1487.3390     34.2461      6.2510
+    756.5900   1487.3480     34.2308      6.2540
+    757.6080   1487.3440     34.2422      6.2450
+    758.5460   1487.3220     34.2377      6.2370
+    759.5050   1487.2930     34.2331      6.2270
+    760.5240   1487.2750     34.2461      6.2140
+    761.4810   1487.2620     34.2384      6.2090
+    762.4590   1487.2420     34.2476      6.1970
+    763.4760   1487.2090     34.2392      6.1870
+    764.4280   1487.1980     34.2529      6.1760
+    765.5570   1487.1800     34.2392      6.1710
+    766.4250   1487.1370     34.2186      6.1630
+    767.4000   1487.0920     34.2209      6.1470
+    768.4290   1487.0600     34.2346      6.1300
+    769.4520   1487.0510     34.2453      6.1200
+    770.4790   1487.0360     34.2422      6.1130
+    771.3800   1487.0180     34.2407      6.1050
+    772.4540   1486.9870     34.2278      6.0970
+    773.3910   1486.9840     34.2438      6.0870
+    774.4050   1486.9810     34.2407      6.0830
+    775.3780   1486.9750     34.2361      6.0790
+    776.4520   1486.9670     34.2468      6.0690
+    777.3930   1486.9510     34.2407      6.0630
+    778.3270   1486.9330     34.2392      6.0550
+    779.3410   1486.9200     34.2468      6.0450
+    780.3390   1486.8800     34.2491      6.0300
+    781.2820   1486.8310     34.2514      6.0130
+    782.2990   1486.6370     34.2262      5.9680
+    783.3310   1486.5420     34.2667      5.9270
+    784.3310   1486.5000     34.2331      5.9230
+    785.2570   1486.4590     34.2453      5.9050
+    786.3940   1486.4070     34.2552      5.8840
+    787.2530   1486.3480     34.2537      5.8660
+    788.2170   1486.3220     34.2430      5.8590
+    789.3340   1486.3170     34.2491      5.8510
+    790.2180   1486.3220     34.2575      5.8460
+    791.1910   1486.2950     34.2514      5.8370
+    792.2870   1486.2890     34.2606      5.8280
+    793.2840   1486.2770     34.2476      5.8250
+    794.2050   1486.2500     34.2361      5.8180
+    795.2890   1486.2390     34.2415      5.8090
+    796.2160   1486.2360     34.2491      5.8020
+    797.2850   1486.2330     34.2453      5.7980
+    798.1330   1486.2340     34.2636      5.7890
+    799.1770   1486.2170     34.2522      5.7840
+    800.1580   1486.2100     34.2651      5.7740
+    801.1120   1486.1810     34.2361      5.7720
+    802.2420   1486.1800     34.2422      5.7650
+    803.1060   1486.1820     34.2484      5.7600
+    804.1230   1486.1780     34.2537      5.7530
+    805.1480   1486.1820     34.2499      5.7510
+    806.1090   1486.1930     34.2522      5.7490
+    807.0590   1486.2060     34.2499      5.7490
+    808.0370   1486.2130     34.2484      5.7470
+    809.0660   1486.2150     34.2590      5.7400
+    810.0670   1486.2130     34.2476      5.7390
+    811.1490   1486.1750     34.2316      5.7300
+    812.0600   1486.1620     34.2407      5.7200
+    813.0550   1486.1320     34.2392      5.7090
+    814.1710   1486.1110     34.2453      5.6970
+    815.0250   1486.1020     34.2552      5.6880
+    815.9670   1486.0850     34.2613      5.6780
+    816.9540   1486.0720     34.2667      5.6690
+    818.0060   1486.0720     34.2560      5.6680
+    819.0700   1486.0710     34.2476      5.6660
+    819.9670   1486.0640     34.2491      5.6600
+    821.0810   1486.0450     34.2575      5.6480
+    821.9290   1486.0400     34.2392      5.6490
+    822.9590   1486.0340     34.2461      5.6410
+    823.9350   1486.0370     34.2514      5.6360
+    825.0160   1486.0340     34.2537      5.6300
+    825.9240   1486.0360     34.2651      5.6230
+    827.0460   1486.0230     34.2499      5.6200
+    827.9140   1486.0150     34.2827      5.6040
+    828.8470   1485.9230     34.2018      5.6030
+    829.8390   1485.8670     34.2392      5.5730
+    830.8670   1485.8540     34.2468      5.5630
+    832.0100   1485.8390     34.2453      5.5550
+    832.8490   1485.8110     34.2598      5.5400
+    833.9420   1485.8170     34.2758      5.5320
+    834.8730   1485.7990     34.2522      5.5310
+    835.8130   1485.7940     34.2484      5.5270
+    836.8290   1485.7760     34.2430      5.5200
+    837.8360   1485.7670     34.2514      5.5110
+    838.7820   1485.7600     34.2529      5.5050
+    839.7910   1485.7430     34.2484      5.4980
+    840.8370   1485.7260     34.2461      5.4900
+    841.7810   1485.7190     34.2628      5.4790
+    842.8220   1485.7150     34.2560      5.4760
+    843.8050   1485.7030     34.2682      5.4650
+    844.8170   1485.7150     34.2484      5.4700
+    845.8480   1485.7080     34.2392      5.4670
+    846.7400   1485.7120     34.2499      5.4610
+    847.7670   1485.7090     34.2560      5.4540
+    848.8470   1485.6960     34.2506      5.4480
+    849.6630   1485.6920     34.2621      5.4400
+    850.6760   1485.6940     34.2567      5.4380
+    851.6460   1485.6670     34.2545      5.4280
+    852.7000   1485.6290     34.2583      5.4130
+    853.7410   1485.5760     34.2377      5.4020
+    854.6870   1485.5390     34.2407      5.3880
+    855.6020   1485.4930     34.2278      5.3770
+    856.6120   1485.4580     34.2567      5.3550
+    857.7270   1485.4490     34.2384      5.3540
+    858.7410   1485.4140     34.2453      5.3390
+    859.8000   1485.4030     34.2506      5.3300
+    860.6060   1485.3750     34.2499      5.3200
+    861.5530   1485.3770     34.2583      5.3140
+    862.5940   1485.3630     34.2720      5.3020
+    863.5350   1485.2990     34.2224      5.2980
+    864.5230   1485.2920     34.2384      5.2870
+    865.5110   1485.2970     34.2422      5.2830
+    866.6110   1485.2990     34.2484      5.2770
+    867.6570   1485.2950     34.2598      5.2680
+    868.5970   1485.2670     34.2575      5.2580
+    869.5380   1485.2670     34.2644      5.2520
+    870.4900   1485.2400     34.2468      5.2470
+    871.4920   1485.1950     34.2422      5.2330
+    872.4890   1485.2070     34.2613      5.2260
+    873.4630   1485.1930     34.2468      5.2230
+    874.6400   1485.1860     34.2606      5.2120
+    875.4480   1485.1790     34.2514      5.2100
+    876.4570   1485.1720     34.2545      5.2030
+    877.4330   1485.1830     34.2537      5.2020
+    878.4000   1485.1930     34.2651      5.1970
+    879.4180   1485.2010     34.2484      5.2000
+    880.4610   1485.2180     34.2445      5.2010
+    881.5120   1485.2310     34.2506      5.1980
+    882.3820   1485.2310     34.2522      5.1940
+    883.5690   1485.2440     34.2499      5.1930
+    884.4440   1485.2540     34.2491      5.1920
+    885.4180   1485.2670     34.2499      5.1910
+    886.3670   1485.2770     34.2545      5.1880
+    887.3500   1485.2840     34.2506      5.1870
+    888.3310   1485.2980     34.2422      5.1890
+    889.3920   1485.2300     34.2354      5.1700
+    890.2910   1485.2230     34.2499      5.1600
+    891.3800   1485.1750     34.2430      5.1460
+    892.2770   1485.1410     34.2461      5.1330
+    893.2690   1485.1180     34.2438      5.1240
+    894.2950   1485.1000     34.2636      5.1090
+    895.2590   1485.0760     34.2484      5.1040
+    896.2680   1485.0820     34.2491      5.1010
+    897.3160   1485.1000     34.2682      5.0950
+    898.3340   1485.1080     34.2453      5.1000
+    899.2350   1485.1130     34.2598      5.0930
+    900.2630   1485.1080     34.2461      5.0920
+    901.2260   1485.1110     34.2644      5.0830
+    902.2120   1485.0960     34.2552      5.0780
+    903.2040   1485.0980     34.2628      5.0720
+    904.1760   1485.0990     34.2514      5.0720
+    905.1620   1485.0890     34.2499      5.0660
+    906.1400   1485.0900     34.2598      5.0590
+    907.2500   1485.0640     34.2537      5.0500
+    908.2330   1485.0610     34.2415      5.0490
+    909.1890   1485.0350     34.2346      5.0410
+    910.3120   1485.0020     34.2514      5.0230
+    911.1780   1484.9920     34.2514      5.0170
+    912.0930   1484.9600     34.2590      5.0030
+    913.0890   1484.9370     34.2499      4.9960
+    914.1540   1484.9310     34.2667      4.9850
+    915.1570   1484.9350     34.2529      4.9860
+    916.0810   1484.9400     34.2575      4.9820
+    917.0570   1484.9460     34.2529      4.9810
+    918.1380   1484.9500     34.2514      4.9780
+    919.0490   1484.9510     34.2690      4.9690
+    920.1110   1484.9620     34.2606      4.9700
+    921.0120   1484.9570     34.2484      4.9690
+    922.0080   1484.9590     34.2522      4.9640
+    923.0430   1484.9630     34.2613      4.9580
+    924.0270   1484.9670     34.2484      4.9590
+    924.9740   1484.9670     34.2522      4.9540
+    926.0980   1484.9790     34.2529      4.9520
+    926.9620   1484.9780     34.2468      4.9500
+    928.0770   1484.9490     34.2453      4.9390
+    929.0420   1484.9040     34.2484      4.9230
+    929.9710   1484.8400     34.2598      4.9000
+    930.8980   1484.8480     34.2567      4.8990
+    931.9800   1484.8320     34.2400      4.8960
+    932.9900   1484.8190     34.2514      4.8850
+    933.9970   1484.8090     34.2499      4.8790
+    935.0420   1484.7990     34.2606      4.8690
+    935.9040   1484.7800     34.2690      4.8580
+    936.9600   1484.7770     34.2628      4.8550
+    937.8400   1484.7820     34.2491      4.8570
+    938.8810   1484.7830     34.2491      4.8530
+    939.9020   1484.7650     34.2407      4.8470
+    940.8750   1484.7520     34.2308      4.8430
+    941.8840   1484.7440     34.2461      4.8320
+    942.9390   1484.7250     34.2461      4.8230
+    943.8000   1484.7180     34.2583      4.8140
+    944.8060   1484.7100     34.2514      4.8100
+    945.8290   1484.6940     34.2674      4.7970
+    946.8400   1484.6670     34.2682      4.7860
+    947.7750   1484.6370     34.2491      4.7810
+    948.7360   1484.6210     34.2522      4.7720
+    949.7900   1484.5890     34.2422      4.7630
+    950.8460   1484.5590     34.2346      4.7540
+    951.7000   1484.4950     34.2369      4.7340
+    952.7940   1484.4650     34.2476      4.7190
+    953.7240   1484.4530     34.2545      4.7100
+    954.7220   1484.4420     34.2461      4.7060
+    955.7060   1484.4300     34.2560      4.6960
+    956.6850   1484.4020     34.2529      4.6860
+    957.6440   1484.3540     34.2453      4.6730
+    958.6580   1484.3280     34.2529      4.6600
+    959.7310   1484.2730     34.2285      4.6500
+    960.7030   1484.2290     34.2293      4.6350
+    961.6970   1484.1870     34.2575      4.6120
+    962.6710   1484.1630     34.2613      4.6010
+    963.6350   1484.1320     34.2567      4.5910
+    964.5800   1484.1130     34.2651      4.5800
+    965.5850   1484.0990     34.2567      4.5750
+    966.6520   1484.0900     34.2712      4.5640
+    967.6550   1484.0930     34.2735      4.5600
+    968.5830   1484.0950     34.2659      4.5590
+    969.5720   1484.1090     34.2705      4.5570
+    970.6230   1484.1200     34.2621      4.5580
+    971.5430   1484.1320     34.2690      4.5550
+    972.5060   1484.1390     34.2651      4.5540
+    973.5510   1484.1460     34.2476      4.5570
+    974.5320   1484.1520     34.2461      4.5550
+    975.5900   1484.1590     34.2499      4.5510
+    976.6790   1484.1640     34.2430      4.5500
+    977.5400   1484.1790     34.2690      4.5420
+    978.5430   1484.1800     34.2567      4.5420
+    979.4620   1484.1920     34.2705      4.5370
+    980.5260   1484.2060     34.2674      4.5370
+    981.5720   1484.2160     34.2514      4.5400
+    982.5830   1484.2170     34.2682      4.5310
+    983.4640   1484.2270     34.2705      4.5290
+    984.4490   1484.2270     34.2674      4.5260
+    985.3710   1484.2420     34.2575      4.5290
+    986.4580   1484.2540     34.2590      4.5270
+    987.3890   1484.2670     34.2606      4.5260
+    988.4530   1484.2780     34.2552      4.5260
+    989.4140   1484.2410     34.2361      4.5190
+    990.3730   1484.2280     34.2842      4.4970
+    991.3760   1484.2070     34.2552      4.4970
+    992.3370   1484.1980     34.2613      4.4890
+    993.4090   1484.1550     34.2583      4.4750
+    994.2930   1484.1480     34.2575      4.4700
+    995.4510   1484.1100     34.2484      4.4590
+    996.3560   1484.0840     34.2613      4.4450
+    997.3400   1484.0690     34.2529      4.4400
+    998.2700   1484.0670     34.2621      4.4330
+    999.3180   1484.0780     34.2598      4.4320
+   1000.3700   1484.0780     34.2621      4.4270
+   1001.2430   1484.0550     34.2590      4.4190
+   1002.2160   1484.0550     34.2682      4.4120
+   1003.1950   1484.0630     34.2751      4.4080
+   1004.2960   1484.0670     34.2575      4.4100
+   1005.1780   1484.0730     34.2598      4.4070
+   1006.1850   1484.0710     34.2743      4.3980
+   1007.2250   1484.0350     34.2873      4.3810
+   1008.2610   1483.9910     34.2751      4.3700
+   1009.2160   1483.9360     34.2522      4.3600
+   1010.2560   1483.9080     34.2461      4.3510
+   1011.1510   1483.8840     34.2575      4.3380
+   1012.1360   1483.8630     34.2506      4.3310
+   1013.1650   1483.7900     34.2354      4.3140
+   1014.1550   1483.8040     34.2621      4.3050
+   1015.1160   1483.8160     34.2529      4.3070
+   1016.1220   1483.8280     34.2621      4.3030
+   1017.1110   1483.8400     34.2682      4.3000
+   1018.0910   1483.8570     34.2621      4.3020
+   1019.1170   1483.8500     34.2621      4.2960
+   1020.0960   1483.8660     34.2621      4.2960
+   1021.0190   1483.8810     34.2583      4.2970
+   1022.0280   1483.8730     34.2583      4.2910
+   1023.2010   1483.8530     34.2598      4.2810
+   1024.0230   1483.8430     34.2735      4.2710
+   1024.9930   1483.8330     34.2659      4.2670
+   1026.0270   1483.8380     34.2567      4.2670
+   1026.9610   1483.8410     34.2407      4.2690
+   1028.0230   1483.8420     34.2560      4.2600
+   1029.0190   1483.8580     34.2491      4.2620
+   1029.9460   1483.8710     34.2636      4.2570
+   1031.0110   1483.8870     34.2651      4.2560
+   1031.9180   1483.9000     34.2567      4.2580
+   1032.9010   1483.9120     34.2438      4.2610
+   1034.0170   1483.8890     34.2216      4.2580
+   1034.8900   1483.8830     34.2377      4.2480
+   1035.9540   1483.8600     34.2316      4.2400
+   1036.9070   1483.8440     34.2484      4.2270
+   1037.8850   1483.8130     34.2377      4.2190
+   1038.9730   1483.8090     34.2850      4.1990
+   1039.8490   1483.7560     34.3033      4.1770
+   1040.8380   1483.7110     34.2331      4.1840
+   1041.8990   1483.6570     34.2514      4.1610
+   1042.8350   1483.6650     34.2613      4.1560
+   1043.8030   1483.6710     34.2636      4.1530
+   1044.8980   1483.6540     34.2712      4.1420
+   1045.7930   1483.6190     34.2491      4.1370
+   1046.8290   1483.5970     34.2735      4.1200
+   1047.9200   1483.5540     34.2804      4.1030
+   1048.7580   1483.4980     34.2461      4.0970
+   1049.7560   1483.5160     34.2728      4.0890
+   1050.8420   1483.5240     34.2712      4.0870
+   1051.7410   1483.5130     34.2415      4.0900
+   1052.8460   1483.5170     34.2690      4.0780
+   1053.7440   1483.5200     34.2720      4.0740
+   1054.7070   1483.5280     34.2659      4.0740
+   1055.7290   1483.5330     34.2659      4.0710
+   1056.6840   1483.5430     34.2712      4.0680
+   1057.7000   1483.5480     34.2522      4.0710
+   1058.7210   1483.5600     34.2644      4.0660
+   1059.7150   1483.5770     34.2644      4.0660
+   1060.6330   1483.5880     34.2644      4.0650
+   1061.6260   1483.6030     34.2537      4.0680
+   1062.7180   1483.6150     34.2613      4.0640
+   1063.6200   1483.6270     34.2651      4.0620
+   1064.6770   1483.6160     34.2468      4.0610
+   1065.7320   1483.6300     34.2529      4.0580
+   1066.6250   1483.6290     34.2606      4.0520
+   1067.5590   1483.6340     34.2583      4.0500
+   1068.6770   1483.6260     34.2537      4.0450
+   1069.6060   1483.6060     34.2842      4.0270
+   1070.6600   1483.5660     34.2659      4.0190
+   1071.5420   1483.5610     34.2758      4.0110
+   1072.5660   1483.5260     34.2712      4.0000
+   1073.5710   1483.5090     34.2552      3.9970
+   1074.4930   1483.4810     34.2598      3.9850
+   1075.4920   1483.4300     34.2499      3.9720
+   1076.5820   1483.4400     34.2628      3.9660
+   1077.7020   1483.4400     34.2453      3.9670
+   1078.5500   1483.4440     34.2690      3.9570
+   1079.5210   1483.4330     34.2545      3.9550
+   1080.5380   1483.4150     34.2728      3.9410
+   1081.4940   1483.4010     34.2720      3.9340
+   1082.4140   1483.4050     34.2606      3.9350
+   1083.4160   1483.3720     34.2606      3.9230
+   1084.3930   1483.3750     34.2598      3.9200
+   1085.4070   1483.3770     34.2644      3.9150
+   1086.4550   1483.3850     34.2697      3.9110
+   1087.6020   1483.3820     34.2659      3.9070
+   1088.3710   1483.3900     34.2621      3.9070
+   1089.3980   1483.3950     34.2621      3.9040
+   1090.4370   1483.3790     34.2621      3.8960
+   1091.3600   1483.3890     34.2674      3.8930
+   1092.3750   1483.3960     34.2628      3.8920
+   1093.4390   1483.4020     34.2735      3.8860
+   1094.3510   1483.4130     34.2636      3.8880
+   1095.3210   1483.4200     34.2628      3.8860
+   1096.2700   1483.4280     34.2628      3.8840
+   1097.3150   1483.4430     34.2613      3.8840
+   1098.3580   1483.4560     34.2606      3.8830
+   1099.3400   1483.4650     34.2552      3.8830
+   1100.2620   1483.4760     34.2644      3.8790
+   1101.3490   1483.4860     34.2552      3.8800
+   1102.2130   1483.4960     34.2644      3.8760
+   1103.3030   1483.5100     34.2804      3.8700
+   1104.1990   1483.5150     34.2499      3.8770
+   1105.2450   1483.5180     34.2522      3.8730
+   1106.1690   1483.5170     34.2682      3.8640
+   1107.2260   1483.5190     34.2621      3.8620
+   1108.2010   1483.5170     34.2644      3.8570
+   1109.1430   1483.5110     34.2667      3.8510
+   1110.1340   1483.5020     34.2728      3.8430
+   1111.1290   1483.4920     34.2651      3.8390
+   1112.1590   1483.4800     34.2621      3.8330
+   1113.1120   1483.4820     34.2743      3.8260
+   1114.1730   1483.4790     34.2613      3.8250
+   1115.2020   1483.4880     34.2583      3.8240
+   1116.1000   1483.4840     34.2400      3.8250
+   1117.0870   1483.4680     34.2575      3.8120
+   1118.0840   1483.4530     34.2743      3.7990
+   1119.0750   1483.4510     34.2697      3.7960
+   1120.0570   1483.4490     34.2651      3.7930
+   1121.0550   1483.4640     34.2674      3.7920
+   1122.0000   1483.4740     34.2659      3.7910
+   1123.0970   1483.4850     34.2606      3.7910
+   1123.9810   1483.4900     34.2621      3.7880
+   1125.0430   1483.4850     34.2644      3.7820
+   1125.9760   1483.4450     34.2506      3.7730
+   1127.0440   1483.4310     34.2583      3.7630
+   1127.9600   1483.4260     34.2651      3.7560
+   1129.0040   1483.4310     34.2590      3.7550
+   1129.9970   1483.4420     34.2674      3.7510
+   1130.9380   1483.4400     34.2697      3.7460
+   1131.9270   1483.4430     34.2690      3.7430
+   1133.0060   1483.4350     34.2682      3.7370
+   1133.9200   1483.4370     34.2644      3.7350
+   1135.0140   1483.4360     34.2659      3.7300
+   1135.8590   1483.4390     34.2667      3.7270
+   1136.8850   1483.4460     34.2690      3.7240
+   1137.8870   1483.4540     34.2621      3.7240
+   1138.8540   1483.4660     34.2651      3.7220
+   1139.8370   1483.4810     34.2766      3.7180
+   1140.8290   1483.4930     34.2636      3.7210
+   1141.8370   1483.5080     34.2651      3.7200
+   1142.8370   1483.5160     34.2552      3.7210
+   1143.8070   1483.5280     34.2712      3.7150
+   1144.8340   1483.5420     34.2529      3.7200
+   1145.8280   1483.5590     34.2720      3.7140
+   1146.7810   1483.5740     34.2743      3.7130
+   1147.7600   1483.5860     34.2613      3.7160
+   1148.8200   1483.5920     34.2621      3.7130
+   1149.7580   1483.5950     34.2682      3.7080
+   1150.7150   1483.5870     34.2789      3.6990
+   1151.7900   1483.5850     34.2697      3.6970
+   1152.7650   1483.5810     34.2735      3.6910
+   1153.8170   1483.5830     34.2751      3.6870
+   1154.6730   1483.5880     34.2644      3.6880
+   1155.6890   1483.5920     34.2545      3.6880
+   1156.6750   1483.6000     34.2705      3.6810
+   1157.6890   1483.6090     34.2735      3.6780
+   1158.6320   1483.6140     34.2590      3.6800
+   1159.7440   1483.6250     34.2499      3.6810
+   1160.6550   1483.6290     34.2606      3.6750
+   1161.6530   1483.6360     34.2690      3.6700
+   1162.5800   1483.6470     34.2590      3.6720
+   1163.5740   1483.6480     34.2506      3.6710
+   1164.7070   1483.6540     34.2529      3.6670
+   1165.5700   1483.6530     34.2575      3.6620
+   1166.7000   1483.6530     34.2590      3.6570
+   1167.6080   1483.6590     34.2651      3.6530
+   1168.5850   1483.6680     34.2621      3.6520
+   1169.5130   1483.6620     34.2621      3.6470
+   1170.6420   1483.6320     34.2667      3.6340
+   1171.5570   1483.6250     34.2560      3.6320
+   1172.5730   1483.6200     34.2514      3.6280
+   1173.5330   1483.6200     34.2422      3.6270
+   1174.4700   1483.6240     34.2659      3.6170
+   1175.4770   1483.6270     34.2583      3.6160
+   1176.5550   1483.6250     34.2491      3.6140
+   1177.4190   1483.6380     34.2712      3.6070
+   1178.4490   1483.6520     34.2682      3.6070
+   1179.6120   1483.6650     34.2636      3.6070
+   1180.5470   1483.6750     34.2720      3.6030
+   1181.5080   1483.6850     34.2575      3.6060
+   1182.3880   1483.6960     34.2773      3.5990
+   1183.3770   1483.6510     34.2300      3.5990
+   1184.5400   1483.6220     34.2476      3.5820
+   1185.3810   1483.6270     34.2667      3.5740
+   1186.4630   1483.6320     34.2659      3.5710
+   1187.4050   1483.6250     34.2712      3.5640
+   1188.3170   1483.6200     34.2522      3.5650
+   1189.3750   1483.6210     34.2560      3.5600
+   1190.2870   1483.6030     34.2369      3.5580
+   1191.3580   1483.5320     34.2369      3.5370
+   1192.2630   1483.5320     34.2636      3.5250
+   1193.3640   1483.5270     34.2682      3.5180
+   1194.2440   1483.5260     34.2628      3.5160
+   1195.4170   1483.5310     34.2743      3.5090
+   1196.2440   1483.5430     34.2628      3.5120
+   1197.3010   1483.5370     34.2445      3.5120
+   1198.3400   1483.5520     34.2491      3.5100
+   1199.3450   1483.5660     34.2697      3.5030
+   1200.1980   1483.5770     34.2705      3.5020
+   1201.3070   1483.5920     34.2545      3.5060
+   1202.2510   1483.6030     34.2636      3.5020
+   1203.1790   1483.6120     34.2552      3.5030
+   1204.2050   1483.6200     34.2583      3.5000
+   1205.1260   1483.6380     34.2628      3.4990
+   1206.2350   1483.6550     34.2552      3.5010
+   1207.1630   1483.6660     34.2651      3.4970
+   1208.1490   1483.6810     34.2537      3.5000
+   1209.1560   1483.6940     34.2476      3.5010
+   1210.1830   1483.7070     34.2476      3.5000
+   1211.1000   1483.7180     34.2697      3.4920
+   1212.1180   1483.7360     34.2613      3.4950
+   1213.0590   1483.7520     34.2644      3.4940
+   1214.0700   1483.7610     34.2552      3.4950
+   1215.0470   1483.7600     34.2613      3.4890
+   1216.0200   1483.7650     34.2621      3.4860
+   1217.0520   1483.7760     34.2567      3.4860
+   1218.1190   1483.7860     34.2575      3.4840
+   1219.0670   1483.7910     34.2552      3.4820
+   1219.9900   1483.7990     34.2690      3.4760
+   1221.0530   1483.7980     34.2583      3.4750
+   1222.0450   1483.8050     34.2567      3.4730
+   1223.1190   1483.8030     34.2613      3.4670
+   1224.0480   1483.8170     34.2438      3.4720
+   1224.9610   1483.8240     34.2537      3.4670
+   1225.9900   1483.8320     34.2590      3.4630
+   1226.8980   1483.8420     34.2583      3.4620
+   1227.9300   1483.8390     34.2560      3.4580
+   1228.9360   1483.8450     34.2766      3.4490
+   1229.9190   1483.8350     34.2628      3.4470
+   1231.0170   1483.8340     34.2476      3.4470
+   1231.9320   1483.8460     34.2682      3.4400
+   1233.0180   1483.8420     34.2506      3.4400
+   1233.8710   1483.8510     34.2697      3.4330
+   1234.8040   1483.8540     34.2499      3.4360
+   1235.8350   1483.8600     34.2705      3.4270
+   1236.8770   1483.8640     34.2796      3.4210
+   1237.9140   1483.8750     34.2712      3.4220
+   1238.8640   1483.8840     34.2690      3.4210
+   1239.9730   1483.8880     34.2583      3.4210
+   1240.9410   1483.8950     34.2636      3.4170
+   1241.7650   1483.8920     34.2804      3.4080
+   1242.7810   1483.8930     34.2613      3.4100
+   1243.7440   1483.8950     34.2636      3.4060
+   1244.8330   1483.8880     34.2476      3.4050
+   1245.7920   1483.8820     34.2628      3.3950
+   1246.8200   1483.8720     34.2674      3.3870
+   1247.7910   1483.8610     34.2567      3.3840
+   1248.6620   1483.8570     34.2712      3.3750
+   1249.6600   1483.8410     34.2720      3.3670
+   1250.6820   1483.8190     34.2651      3.3600
+   1251.6620   1483.8130     34.2644      3.3550
+   1252.6380   1483.8160     34.2567      3.3540
+   1253.6830   1483.8230     34.2621      3.3500
+   1254.6360   1483.8280     34.2697      3.3450
+   1255.6250   1483.8350     34.2590      3.3460
+   1256.5780   1483.8490     34.2606      3.3450
+   1257.6440   1483.8550     34.2613      3.3420
+   1258.5930   1483.8640     34.2590      3.3410
+   1259.6590   1483.8700     34.2659      3.3360
+   1260.5420   1483.8750     34.2461      3.3400
+   1261.6400   1483.8650     34.2468      3.3330
+   1262.5890   1483.8760     34.2590      3.3280
+   1263.5070   1483.8790     34.2690      3.3220
+   1264.5230   1483.8840     34.2628      3.3210
+   1265.5890   1483.8860     34.2636      3.3170
+   1266.5020   1483.8930     34.2705      3.3130
+   1267.5440   1483.8960     34.2529      3.3150
+   1268.4770   1483.9100     34.2545      3.3140
+   1269.5860   1483.9290     34.2613      3.3120
+   1270.5800   1483.9480     34.2537      3.3150
+   1271.4100   1483.9580     34.2636      3.3110
+   1272.4970   1483.9770     34.2575      3.3130
+   1273.5120   1483.9860     34.2476      3.3140
+   1274.4470   1484.0020     34.2644      3.3090
+   1275.4380   1484.0120     34.2529      3.3110
+   1276.5130   1484.0290     34.2583      3.3090
+   1277.4770   1484.0400     34.2606      3.3070
+   1278.4360   1484.0510     34.2628      3.3050
+   1279.3780   1484.0650     34.2621      3.3050
+   1280.3590   1484.0750     34.2567      3.3050
+   1281.3380   1484.0820     34.2659      3.3000
+   1282.3530   1484.0880     34.2636      3.2980
+   1283.3510   1484.0960     34.2636      3.2960
+   1284.2850   1484.0950     34.2606      3.2930
+   1285.3610   1484.1090     34.2636      3.2910
+   1286.3180   1484.1170     34.2575      3.2910
+   1287.2690   1484.1240     34.2537      3.2900
+   1288.2350   1484.1320     34.2537      3.2880
+   1289.2510   1484.1420     34.2651      3.2830
+   1290.2790   1484.1560     34.2621      3.2830
+   1291.2310   1484.1660     34.2575      3.2830
+   1292.2140   1484.1800     34.2621      3.2810
+   1293.3480   1484.1910     34.2590      3.2800
+   1294.1860   1484.1990     34.2575      3.2790
+   1295.1960   1484.2160     34.2705      3.2750
+   1296.1470   1484.2260     34.2628      3.2760
+   1297.1240   1484.2390     34.2667      3.2740
+   1298.1490   1484.2530     34.2575      3.2760
+   1299.1500   1484.2640     34.2567      3.2750
+   1300.1240   1484.2760     34.2659      3.2710
+   1301.1710   1484.2840     34.2583      3.2710
+   1302.2000   1484.2970     34.2522      3.2720
+   1303.1250   1484.3090     34.2651      3.2670
+   1304.1580   1484.3230     34.2567      3.2690
+   1305.1850   1484.3310     34.2621      3.2650
+   1306.0500   1484.3420     34.2560      3.2660
+   1307.1230   1484.3480     34.2636      3.2610
+   1308.0360   1484.3370     34.2499      3.2590
+   1309.0640   1484.3590     34.2567      3.2580
+   1309.9840   1484.3590     34.2476      3.2570
+   1311.1390   1484.3600     34.2567      3.2500
+   1311.9590   1484.3650     34.2728      3.2430
+   1313.0070   1484.3660     34.2598      3.2430
+   1313.9580   1484.3680     34.2621      3.2390
+   1314.9610   1484.3790     34.2506      3.2410
+   1316.0540   1484.3820     34.2522      3.2370
+   1317.1100   1484.3850     34.2506      3.2340
+   1318.0480   1484.3810     34.2644      3.2250
+   1318.9100   1484.3830     34.2651      3.2220
+   1319.8860   1484.3800     34.2468      3.2230
+   1320.9310   1484.3890     34.2529      3.2190
+   1321.8640   1484.3880     34.2537      3.2150
+   1322.9790   1484.3920     34.2552      3.2110
+   1323.8460   1484.3880     34.2606      3.2050
+   1324.8230   1484.3860     34.2560      3.2020
+   1325.8640   1484.3830     34.2598      3.1960
+   1326.8070   1484.3650     34.2438      3.1930
+   1327.8420   1484.3800     34.2484      3.1910
+   1328.8310   1484.3930     34.2621      3.1860
+   1330.0160   1484.4020     34.2468      3.1880
+   1330.8820   1484.4100     34.2613      3.1820
+   1331.8320   1484.4200     34.2537      3.1830
+   1332.8540   1484.4190     34.2621      3.1760
+   1333.7650   1484.4280     34.2506      3.1780
+   1334.8380   1484.4370     34.2472      3.1770
+   1335.7280   1484.4460     34.2560      3.1730
+   1336.8730   1484.4600     34.2644      3.1690
+   1337.7590   1484.4700     34.2575      3.1700
+   1338.7300   1484.4830     34.2514      3.1710
+   1339.6890   1484.4910     34.2484      3.1700
+   1340.6900   1484.5100     34.2537      3.1690
+   1341.7050   1484.5280     34.2606      3.1670
+   1342.7600   1484.5450     34.2506      3.1700
+   1343.8170   1484.5600     34.2514      3.1690
+   1344.5990   1484.5690     34.2445      3.1700
+   1345.6920   1484.5890     34.2560      3.1670
+   1346.6300   1484.5970     34.2560      3.1650
+   1347.6550   1484.6010     34.2461      3.1650
+   1348.5650   1484.6120     34.2621      3.1590
+   1349.6090   1484.6260     34.2628      3.1580
+   1350.7440   1484.6340     34.2644      3.1550
+   1351.5320   1484.6280     34.2560      3.1530
+   1352.5110   1484.6250     34.2735      3.1430
+   1353.5930   1484.6190     34.2682      3.1390
+   1354.5510   1484.6330     34.2628      3.1400
+   1355.5900   1484.6390     34.2514      3.1410
+   1356.4640   1484.6420     34.2484      3.1390
+   1357.5350   1484.6500     34.2506      3.1360
+   1358.5820   1484.6580     34.2529      3.1330
+   1359.5060   1484.6680     34.2552      3.1310
+   1360.4930   1484.6760     34.2583      3.1280
+   1361.4130   1484.6870     34.2484      3.1300
+   1362.5060   1484.7020     34.2522      3.1280
+   1363.3900   1484.7170     34.2491      3.1290
+   1364.4630   1484.7320     34.2438      3.1300
+   1365.4050   1484.7500     34.2583      3.1260
+   1366.5050   1484.7630     34.2567      3.1250
+   1367.3770   1484.7770     34.2438      3.1290
+   1368.3860   1484.7910     34.2476      3.1270
+   1369.3410   1484.8040     34.2453      3.1270
+   1370.3720   1484.8190     34.2529      3.1240
+   1371.3110   1484.8360     34.2606      3.1220
+   1372.3630   1484.8470     34.2522      3.1230
+   1373.2780   1484.8600     34.2468      3.1240
+   1374.3460   1484.8740     34.2567      3.1200
+   1375.3720   1484.8860     34.2499      3.1210
+   1376.2540   1484.9000     34.2522      3.1200
+   1377.3230   1484.9090     34.2484      3.1190
+   1378.2740   1484.9210     34.2392      3.1210
+   1379.2260   1484.9360     34.2415      3.1200
+   1380.2200   1484.9490     34.2514      3.1160
+   1381.2900   1484.9640     34.2491      3.1160
+   1382.3020   1484.9780     34.2529      3.1140
+   1383.1600   1484.9900     34.2514      3.1140
+   1384.2350   1485.0060     34.2628      3.1100
+   1385.2400   1485.0220     34.2453      3.1150
+   1386.1490   1485.0380     34.2690      3.1080
+   1387.2280   1485.0470     34.2491      3.1120
+   1388.2690   1485.0570     34.2491      3.1100
+   1389.1080   1485.0630     34.2400      3.1110
+   1390.1570   1485.0670     34.2552      3.1030
+   1391.1130   1485.0790     34.2720      3.0970
+   1392.1020   1485.0740     34.2422      3.1010
+   1393.0690   1485.0700     34.2430      3.0960
+   1394.1230   1485.0670     34.2308      3.0950
+   1395.0710   1485.0720     34.2484      3.0870
+   1396.0620   1485.0740     34.2468      3.0840
+   1397.0990   1485.0420     34.2354      3.0760
+   1398.0560   1485.0520     34.2499      3.0700
+   1399.1530   1485.0600     34.2484      3.0680
+   1400.1100   1485.0640     34.2552      3.0630
+   1401.0680   1485.0620     34.2545      3.0590
+   1402.0370   1485.0700     34.2514      3.0580
+   1402.9680   1485.0810     34.2476      3.0580
+   1403.9440   1485.0810     34.2453      3.0550
+   1404.9560   1485.0970     34.2506      3.0530
+   1406.0350   1485.1140     34.2461      3.0540
+   1407.0240   1485.1230     34.2667      3.0460
+   1407.9060   1485.1390     34.2415      3.0540
+   1408.9120   1485.1480     34.2545      3.0480
+   1409.8630   1485.1650     34.2392      3.0530
+   1410.8430   1485.1800     34.2545      3.0480
+   1411.9060   1485.1990     34.2484      3.0500
+   1412.9110   1485.2150     34.2506      3.0490
+   1413.9300   1485.2260     34.2499      3.0480
+   1414.8890   1485.2310     34.2537      3.0440
+   1415.7970   1485.2290     34.2438      3.0430
+   1416.8590   1485.2370     34.2690      3.0330
+   1417.7930   1485.2410     34.2468      3.0370
+   1418.8050   1485.2470     34.2453      3.0350
+   1419.7800   1485.2520     34.2430      3.0330
+   1420.8470   1485.2670     34.2468      3.0310
+   1421.8650   1485.2820     34.2484      3.0300
+   1422.8860   1485.3000     34.2461      3.0310
+   1423.6990   1485.3080     34.2545      3.0270
+   1424.7710   1485.3270     34.2651      3.0240
+   1425.8540   1485.3380     34.2430      3.0290
+   1426.7000   1485.3510     34.2453      3.0280
+   1427.6960   1485.3640     34.2422      3.0280
+   1428.7400   1485.3810     34.2453      3.0270
+   1429.7020   1485.3930     34.2422      3.0270
+   1430.6290   1485.4100     34.2491      3.0250
+   1431.8320   1485.4290     34.2484      3.0250
+   1432.7690   1485.4470     34.2628      3.0210
+   1433.6930   1485.4620     34.2491      3.0250
+   1434.5800   1485.4750     34.2476      3.0250
+   1435.6070   1485.4880     34.2445      3.0250
+   1436.6370   1485.5050     34.2506      3.0230
+   1437.7290   1485.5260     34.2491      3.0240
+   1438.6130   1485.5420     34.2537      3.0230
+   1439.5120   1485.5530     34.2506      3.0230
+   1440.6010   1485.5720     34.2506      3.0230
+   1441.5230   1485.5880     34.2545      3.0220
+   1442.4760   1485.6010     34.2484      3.0230
+   1443.5340   1485.6100     34.2453      3.0220
+   1444.4980   1485.6260     34.2484      3.0210
+   1445.5370   1485.6420     34.2567      3.0180
+   1446.4330   1485.6550     34.2384      3.0230
+   1447.5130   1485.6680     34.2510      3.0180
+   1448.4050   1485.6670     34.2484      3.0150
+   1449.4620   1485.6590     34.2453      3.0100
+   1450.4570   1485.6720     34.2522      3.0070
+   1451.3740   1485.6800     34.2430      3.0080
+   1452.3960   1485.6810     34.2369      3.0060
+   1453.3630   1485.6910     34.2453      3.0020
+   1454.5380   1485.6990     34.2560      2.9960
+   1455.4770   1485.7080     34.2438      2.9980
+   1456.4060   1485.7240     34.2407      2.9990
+   1457.3300   1485.7350     34.2506      2.9950
+   1458.4320   1485.7420     34.2484      2.9930
+   1459.4210   1485.7470     34.2361      2.9940
+   1460.3660   1485.7590     34.2522      2.9880
+   1461.3230   1485.7620     34.2453      2.9870
+   1462.3370   1485.7770     34.2476      2.9860
+   1463.2730   1485.7880     34.2499      2.9840
+   1464.3250   1485.8000     34.2392      2.9860
+   1465.2740   1485.8140     34.2377      2.9860
+   1466.2090   1485.8260     34.2415      2.9840
+   1467.3120   1485.8410     34.2415      2.9830
+   1468.2650   1485.8570     34.2484      2.9810
+   1469.1950   1485.8720     34.2445      2.9820
+   1470.1500   1485.8860     34.2461      2.9810
+   1471.2380   1485.9040     34.2522      2.9790
+   1472.1640   1485.9190     34.2545      2.9780
+   1473.3090   1485.9300     34.2323      2.9830
+   1474.1180   1485.9430     34.2384      2.9810
+   1475.1070   1485.9320     34.2361      2.9750
+   1476.1310   1485.9320     34.2491      2.9670
+   1477.0860   1485.9340     34.2514      2.9630
+   1478.0850   1485.9310     34.2430      2.9610
+   1479.0740   1485.9330     34.2575      2.9530
+   1480.0570   1485.9280     34.2445      2.9520
+   1481.0700   1485.9320     34.2415      2.9500
+   1482.0980   1485.9350     34.2560      2.9420
+   1483.0010   1485.9430     34.2445      2.9440
+   1484.0720   1485.9580     34.2613      2.9380
+   1485.0490   1485.9730     34.2407      2.9440
+   1485.9700   1485.9850     34.2476      2.9410
+   1487.0750   1485.9940     34.2468      2.9390
+   1487.9730   1486.0010     34.2506      2.9360
+   1488.9790   1486.0110     34.2453      2.9360
+   1489.9350   1486.0200     34.2461      2.9340
+   1490.9500   1486.0360     34.2484      2.9330
+   1491.9980   1486.0480     34.2537      2.9300
+   1492.9360   1486.0580     34.2491      2.9300
+   1494.0070   1486.0670     34.2392      2.9310
+   1494.9060   1486.0790     34.2300      2.9330
+   1495.8660   1486.0910     34.2430      2.9280
+   1496.9380   1486.1030     34.2484      2.9250
+   1497.8410   1486.1170     34.2438      2.9260
+   1498.9680   1486.1320     34.2537      2.9220
+   1499.8150   1486.1410     34.2400      2.9250
+   1500.8630   1486.1590     34.2438      2.9240
+   1501.8420   1486.1700     34.2461      2.9220
+   1502.8190   1486.1850     34.2514      2.9200
+   1503.7900   1486.1870     34.2308      2.9230
+   1504.7840   1486.2040     34.2438      2.9190
+   1505.8750   1486.2200     34.2384      2.9200
+   1506.8800   1486.2330     34.2514      2.9150
+   1507.7940   1486.2430     34.2407      2.9170
+   1508.7820   1486.2530     34.2323      2.9180
+   1509.7050   1486.2650     34.2430      2.9140
+   1510.7250   1486.2790     34.2499      2.9110
+   1511.6620   1486.2920     34.2316      2.9160
+   1512.7300   1486.3000     34.2400      2.9110
+   1513.7140   1486.3010     34.2285      2.9110
+   1514.7460   1486.3050     34.2308      2.9070
+   1515.6880   1486.3160     34.2468      2.9010
+   1516.7040   1486.3310     34.2422      2.9020
+   1517.7300   1486.3440     34.2422      2.9010
+   1518.6800   1486.3550     34.2545      2.8960
+   1519.6160   1486.3680     34.2422      2.8990
+   1520.5980   1486.3810     34.2331      2.9010
+   1521.5940   1486.3880     34.2354      2.8980
+   1522.6420   1486.3810     34.2361      2.8920
+   1523.7320   1486.3970     34.2438      2.8890
+   1524.6940   1486.4000     34.2339      2.8890
+   1525.5310   1486.4100     34.2438      2.8850
+   1526.5850   1486.4200     34.2346      2.8860
+   1527.5120   1486.4300     34.2331      2.8850
+   1528.5150   1486.4360     34.2346      2.8820
+   1529.4660   1486.4520     34.2545      2.8760
+   1530.4890   1486.4670     34.2361      2.8810
+   1531.5470   1486.4830     34.2415      2.8790
+   1532.4260   1486.4940     34.2415      2.8780
+   1533.5050   1486.5110     34.2278      2.8820
+   1534.4080   1486.5240     34.2453      2.8760
+   1535.4140   1486.5300     34.2339      2.8770
+   1536.4740   1486.5410     34.2415      2.8730
+   1537.3970   1486.5550     34.2567      2.8680
+   1538.3510   1486.5700     34.2461      2.8710
+   1539.3450   1486.5780     34.2453      2.8690
+   1540.3390   1486.5860     34.2484      2.8660
+   1541.4280   1486.5970     34.2400      2.8670
+   1542.3370   1486.6020     34.2384      2.8650
+   1543.3320   1486.6130     34.2407      2.8630
+   1544.3280   1486.6210     34.2369      2.8620
+   1545.4780   1486.6340     34.2384      2.8600
+   1546.3250   1486.6420     34.2468      2.8560
+   1547.3470   1486.6540     34.2361      2.8580
+   1548.2220   1486.6620     34.2407      2.8550
+   1549.2480   1486.6780     34.2461      2.8530
+   1550.2550   1486.6920     34.2407      2.8540
+   1551.3180   1486.7100     34.2373      2.8550
+   1552.2550   1486.7250     34.2430      2.8530
+   1553.2060   1486.7430     34.2445      2.8530
+   1554.2230   1486.7590     34.2468      2.8520
+   1555.3570   1486.7740     34.2339      2.8550
+   1556.1920   1486.7890     34.2407      2.8530
+   1557.1220   1486.8020     34.2323      2.8550
+   1558.1900   1486.8190     34.2316      2.8550
+   1559.1600   1486.8370     34.2422      2.8520
+   1560.2270   1486.8560     34.2331      2.8550
+   1561.1550   1486.8710     34.2262      2.8570
+   1562.0670   1486.8860     34.2453      2.8510
+   1563.0640   1486.9030     34.2392      2.8530
+   1564.0420   1486.9170     34.2400      2.8520
+   1565.0150   1486.9310     34.2445      2.8500
+   1566.1900   1486.9480     34.2361      2.8520
+   1567.1390   1486.9660     34.2438      2.8500
+   1568.1770   1486.9810     34.2453      2.8490
+   1569.0650   1486.9970     34.2430      2.8500
+   1570.1330   1487.0140     34.2453      2.8490
+   1571.0410   1487.0240     34.2476      2.8470
+   1571.9810   1487.0410     34.2384      2.8500
+   1572.9590   1487.0550     34.2468      2.8470
+   1573.9060   1487.0730     34.2384      2.8500
+   1574.9060   1487.0900     34.2445      2.8480
+   1576.0410   1487.1060     34.2491      2.8460
+   1577.0570   1487.1180     34.2445      2.8460
+   1577.9430   1487.1290     34.2484      2.8440
+   1578.9780   1487.1400     34.2560      2.8400
+   1579.8740   1487.1530     34.2316      2.8470
+   1580.8560   1487.1620     34.2323      2.8450
+   1581.8460   1487.1750     34.2331      2.8440
+   1582.8220   1487.1900     34.2514      2.8380
+   1583.8450   1487.2090     34.2392      2.8420
+   1584.7960   1487.2170     34.2430      2.8390
+   1585.7900   1487.2260     34.2239      2.8430
+   1586.7900   1487.2220     34.2339      2.8350
+   1587.8060   1487.2330     34.2392      2.8320
+   1588.7690   1487.2260     34.2316      2.8290
+   1589.8700   1487.2080     34.2293      2.8210
+   1590.8930   1487.2150     34.2445      2.8140
+   1591.7620   1487.2230     34.2361      2.8150
+   1592.8850   1487.2360     34.2545      2.8080
+   1593.7590   1487.2510     34.2445      2.8110
+   1594.6790   1487.2620     34.2346      2.8130
+   1595.6620   1487.2740     34.2476      2.8080
+   1596.6910   1487.2810     34.2361      2.8090
+   1597.7120   1487.2900     34.2461      2.8040
+   1598.6160   1487.2940     34.2407      2.8030
+   1599.7730   1487.3020     34.2453      2.7990
+   1600.6000   1487.3050     34.2201      2.8040
+   1601.6500   1487.3050     34.2491      2.7910
+   1602.6540   1487.3100     34.2468      2.7890
+   1603.6370   1487.3150     34.2377      2.7890
+   1604.6410   1487.3250     34.2453      2.7850
+   1605.5630   1487.3320     34.2224      2.7900
+   1606.5270   1487.3410     34.2400      2.7830
+   1607.5010   1487.3540     34.2369      2.7830
+   1608.5410   1487.3630     34.2369      2.7810
+   1609.5650   1487.3740     34.2392      2.7790
+   1610.6030   1487.3840     34.2400      2.7770
+   1611.5450   1487.3950     34.2453      2.7740
+   1612.5300   1487.3980     34.2186      2.7790
+   1613.6580   1487.4080     34.2346      2.7720
+   1614.4150   1487.4100     34.2331      2.7700
+   1615.4470   1487.4170     34.2384      2.7660
+   1616.3880   1487.4290     34.2384      2.7650
+   1617.4710   1487.4410     34.2300      2.7660
+   1618.3910   1487.4480     34.2270      2.7650
+   1619.4510   1487.4520     34.2194      2.7640
+   1620.4850   1487.4600     34.2323      2.7580
+   1621.4300   1487.4690     34.2232      2.7590
+   1622.3220   1487.4770     34.2278      2.7560
+   1623.3940   1487.4880     34.2453      2.7490
+   1624.3360   1487.5010     34.2331      2.7520
+   1625.4410   1487.5180     34.2415      2.7490
+   1626.4350   1487.5310     34.2323      2.7510
+   1627.3820   1487.5440     34.2361      2.7490
+   1628.2600   1487.5560     34.2506      2.7440
+   1629.2790   1487.5670     34.2224      2.7510
+   1630.3020   1487.5820     34.2308      2.7480
+   1631.3500   1487.6000     34.2377      2.7460
+   1632.3000   1487.6120     34.2377      2.7450
+   1633.2220   1487.6240     34.2377      2.7440
+   1634.1630   1487.6370     34.2323      2.7450
+   1635.1800   1487.6460     34.2323      2.7430
+   1636.1850   1487.6610     34.2377      2.7410
+   1637.1880   1487.6750     34.2484      2.7370
+   1638.1960   1487.6870     34.2346      2.7400
+   1639.3090   1487.6990     34.2422      2.7360
+   1640.0890   1487.7100     34.2278      2.7400
+   1641.1180   1487.7210     34.2361      2.7360
+   1642.1800   1487.7220     34.2422      2.7300
+   1643.1520   1487.7300     34.2361      2.7300
+   1644.1560   1487.7380     34.2392      2.7270
+   1645.1570   1487.7450     34.2377      2.7250
+   1646.1020   1487.7490     34.2384      2.7220
+   1647.1310   1487.7540     34.2392      2.7190
+   1648.0230   1487.7550     34.2415      2.7150
+   1649.0760   1487.7710     34.2400      2.7150
+   1650.0180   1487.7820     34.2422      2.7130
+   1651.0480   1487.7960     34.2300      2.7160
+   1652.0170   1487.8090     34.2377      2.7130
+   1653.0220   1487.8240     34.2323      2.7140
+   1653.9590   1487.8360     34.2392      2.7110
+   1655.0990   1487.8550     34.2422      2.7100
+   1656.0580   1487.8670     34.2422      2.7090
+   1657.0000   1487.8820     34.2316      2.7120
+   1657.9340   1487.8920     34.2339      2.7100
+   1658.9530   1487.9090     34.2369      2.7090
+   1659.9350   1487.9240     34.2384      2.7080
+   1660.8940   1487.9390     34.2377      2.7080
+   1661.8320   1487.9540     34.2400      2.7070
+   1662.8120   1487.9710     34.2339      2.7090
+   1663.8470   1487.9860     34.2453      2.7050
+   1664.8000   1487.9990     34.2262      2.7100
+   1665.7950   1488.0190     34.2354      2.7080
+   1666.8090   1488.0340     34.2430      2.7050
+   1667.7850   1488.0460     34.2232      2.7100
+   1668.8300   1488.0620     34.2323      2.7070
+   1669.8330   1488.0760     34.2331      2.7060
+   1670.7120   1488.0950     34.2293      2.7080
+   1671.7050   1488.1090     34.2369      2.7050
+   1672.6900   1488.1260     34.2339      2.7060
+   1673.7880   1488.1450     34.2407      2.7040
+   1674.7260   1488.1600     34.2369      2.7050
+   1675.7830   1488.1760     34.2415      2.7030
+   1676.7440   1488.1910     34.2247      2.7080
+   1677.6440   1488.2050     34.2300      2.7060
+   1678.7180   1488.2240     34.2369      2.7040
+   1679.7330   1488.2360     34.2361      2.7030
+   1680.7080   1488.2490     34.2339      2.7030
+   1681.7170   1488.2620     34.2308      2.7030
+   1682.5670   1488.2700     34.2289      2.7020
+   1683.5720   1488.2760     34.2270      2.7000
+   1684.6350   1488.2850     34.2331      2.6960
+   1685.6760   1488.3000     34.2308      2.6960
+   1686.5520   1488.3100     34.2506      2.6890
+   1687.5900   1488.3220     34.2300      2.6940
+   1688.5370   1488.3340     34.2461      2.6880
+   1689.6130   1488.3440     34.2270      2.6920
+   1690.4810   1488.3570     34.2354      2.6890
+   1691.5430   1488.3740     34.2316      2.6900
+   1692.4350   1488.3880     34.2339      2.6890
+   1693.4620   1488.4050     34.2400      2.6870
+   1694.4680   1488.4200     34.2346      2.6880
+   1695.4100   1488.4350     34.2339      2.6880
+   1696.4990   1488.4480     34.2331      2.6870
+   1697.5490   1488.4630     34.2278      2.6880
+   1698.3760   1488.4750     34.2262      2.6880
+   1699.3910   1488.4900     34.2346      2.6850
+   1700.4550   1488.5030     34.2339      2.6840
+   1701.4060   1488.5140     34.2392      2.6810
+   1702.3370   1488.5300     34.2331      2.6830
+   1703.3220   1488.5410     34.2255      2.6840
+   1704.3320   1488.5570     34.2377      2.6800
+   1705.4200   1488.5740     34.2400      2.6790
+   1706.3260   1488.5860     34.2407      2.6780
+   1707.2810   1488.6000     34.2384      2.6780
+   1708.2680   1488.6140     34.2400      2.6770
+   1709.3210   1488.6300     34.2316      2.6790
+   1710.3730   1488.6490     34.2327      2.6790
+   1711.3210   1488.6640     34.2316      2.6790
+   1712.2110   1488.6780     34.2247      2.6810
+   1713.2850   1488.6940     34.2262      2.6800
+   1714.1770   1488.7070     34.2278      2.6790
+   1715.2180   1488.7210     34.2346      2.6760
+   1716.3120   1488.7330     34.2293      2.6760
+   1717.2170   1488.7450     34.2339      2.6740
+   1718.1170   1488.7510     34.2331      2.6720
+   1719.1330   1488.7650     34.2369      2.6700
+   1720.1410   1488.7790     34.2316      2.6710
+   1721.1390   1488.7880     34.2285      2.6700
+   1722.0860   1488.8030     34.2377      2.6670
+   1723.0990   1488.8150     34.2369      2.6660
+   1724.0670   1488.8320     34.2369      2.6660
+   1725.0510   1488.8440     34.2270      2.6680
+   1726.0670   1488.8560     34.2331      2.6650
+   1727.0800   1488.8730     34.2392      2.6630
+   1728.0240   1488.8850     34.2262      2.6660
+   1729.0500   1488.8980     34.2361      2.6620
+   1729.9800   1488.9150     34.2270      2.6650
+   1731.0330   1488.9330     34.2308      2.6640
+   1731.9740   1488.9470     34.2323      2.6630
+   1733.1220   1488.9610     34.2346      2.6610
+   1733.9200   1488.9680     34.2293      2.6610
+   1734.9510   1488.9840     34.2285      2.6610
+   1735.8840   1488.9950     34.2346      2.6580
+   1736.9630   1489.0070     34.2361      2.6560
+   1737.8850   1489.0230     34.2331      2.6570
+   1738.8450   1489.0370     34.2216      2.6600
+   1740.0830   1489.0580     34.2346      2.6560
+   1740.8540   1489.0710     34.2308      2.6570
+   1741.9210   1489.0840     34.2400      2.6530
+   1742.8570   1489.0860     34.2262      2.6540
+   1743.8380   1489.0970     34.2354      2.6500
+   1744.7690   1489.1110     34.2438      2.6470
+   1745.8810   1489.1270     34.2415      2.6470
+   1746.7800   1489.1310     34.2331      2.6470
+   1747.8620   1489.1360     34.2323      2.6440
+   1748.8810   1489.1410     34.2201      2.6450
+   1749.7270   1489.1500     34.2255      2.6420
+   1750.6900   1489.1590     34.2232      2.6410
+   1751.6780   1489.1760     34.2270      2.6400
+   1752.8590   1489.1930     34.2239      2.6400
+   1753.6460   1489.2040     34.2384      2.6350
+   1754.6600   1489.2180     34.2300      2.6370
+   1755.6220   1489.2230     34.2308      2.6340
+   1756.6300   1489.2330     34.2285      2.6330
+   1757.6130   1489.2460     34.2323      2.6310
+   1758.6270   1489.2600     34.2232      2.6330
+   1759.5960   1489.2670     34.2262      2.6300
+   1760.6370   1489.2720     34.2331      2.6250
+   1761.5810   1489.2840     34.2201      2.6280
+   1762.5410   1489.2970     34.2239      2.6260
+   1763.6610   1489.3100     34.2262      2.6240
+   1764.5350   1489.3240     34.2285      2.6230
+   1765.6890   1489.3420     34.2438      2.6180
+   1766.6210   1489.3570     34.2300      2.6220
+   1767.5630   1489.3730     34.2392      2.6190
+   1768.4640   1489.3860     34.2216      2.6240
+   1769.4410   1489.4030     34.2377      2.6190
+   1770.4450   1489.4180     34.2171      2.6250
+   1771.4320   1489.4330     34.2354      2.6190
+   1772.5530   1489.4520     34.2186      2.6240
+   1773.4500   1489.4680     34.2323      2.6200
+   1774.3800   1489.4840     34.2392      2.6180
+   1775.4350   1489.5020     34.2262      2.6220
+   1776.4090   1489.5160     34.2171      2.6240
+   1777.4540   1489.5340     34.2178      2.6240
+   1778.4050   1489.5500     34.2270      2.6210
+   1779.4040   1489.5650     34.2224      2.6220
+   1780.3450   1489.5810     34.2285      2.6200
+   1781.4470   1489.5980     34.2339      2.6180
+   1782.3210   1489.6120     34.2232      2.6210
+   1783.3030   1489.6290     34.2339      2.6180
+   1784.3860   1489.6480     34.2209      2.6220
+   1785.3690   1489.6640     34.2369      2.6170
+   1786.3130   1489.6770     34.2346      2.6170
+   1787.2930   1489.6950     34.2255      2.6200
+   1788.3730   1489.7070     34.2239      2.6190
+   1789.2010   1489.7200     34.2293      2.6170
+   1790.2810   1489.7380     34.2163      2.6210
+   1791.2020   1489.7520     34.2346      2.6150
+   1792.1460   1489.7620     34.2331      2.6140
+   1793.1780   1489.7710     34.2201      2.6160
+   1794.2660   1489.7780     34.2308      2.6100
+   1795.1530   1489.7790     34.2201      2.6100
+   1796.1030   1489.7820     34.2270      2.6050
+   1797.1020   1489.7910     34.2339      2.6010
+   1798.1300   1489.8020     34.2354      2.5990
+   1799.0760   1489.8100     34.2262      2.6000
+   1800.2310   1489.8180     34.2300      2.5960
+   1801.2140   1489.8300     34.2262      2.5960
+   1802.0370   1489.8390     34.2323      2.5930
+   1803.1130   1489.8560     34.2285      2.5940
+   1804.0220   1489.8670     34.2278      2.5930
+   1804.9750   1489.8800     34.2384      2.5890
+   1806.0300   1489.8980     34.2354      2.5900
+   1806.9510   1489.9130     34.2316      2.5910
+   1807.9650   1489.9270     34.2262      2.5920
+   1809.0000   1489.9400     34.2285      2.5900
+   1810.0450   1489.9420     34.2331      2.5850
+   1810.9960   1489.9530     34.2293      2.5850
+   1811.8930   1489.9580     34.2346      2.5810
+   1812.8910   1489.9670     34.2155      2.5850
+   1813.8690   1489.9730     34.2300      2.5780
+   1814.8970   1489.9910     34.2308      2.5780
+   1815.9230   1490.0060     34.2323      2.5770
+   1816.9810   1490.0170     34.2171      2.5800
+   1817.9820   1490.0330     34.2293      2.5760
+   1818.9520   1490.0450     34.2194      2.5780
+   1819.8840   1490.0590     34.2239      2.5760
+   1820.7750   1490.0720     34.2323      2.5730
+   1821.7750   1490.0870     34.2278      2.5740
+   1822.7530   1490.1000     34.2278      2.5730
+   1823.8280   1490.1160     34.2163      2.5760
+   1824.7430   1490.1290     34.2178      2.5750
+   1825.7520   1490.1480     34.2293      2.5720
+   1826.8210   1490.1650     34.2346      2.5700
+   1827.7580   1490.1760     34.2178      2.5740
+   1828.6800   1490.1850     34.2155      2.5730
+   1829.6840   1490.1970     34.2186      2.5710
+   1830.7640   1490.2150     34.2346      2.5660
+   1831.6700   1490.2250     34.2209      2.5690
+   1832.7450   1490.2400     34.2178      2.5690
+   1833.7260   1490.2550     34.2232      2.5670
+   1834.7230   1490.2680     34.2201      2.5670
+   1835.5720   1490.2650     34.2201      2.5630
+   1836.6170   1490.2750     34.2209      2.5610
+   1837.7530   1490.2920     34.2224      2.5600
+   1838.7760   1490.3000     34.2316      2.5550
+   1839.7210   1490.3090     34.2224      2.5560
+   1840.5070   1490.3200     34.2209      2.5560
+   1841.5810   1490.3330     34.2171      2.5560
+   1842.5210   1490.3470     34.2155      2.5560
+   1843.5330   1490.3570     34.2232      2.5520
+   1844.4850   1490.3740     34.2171      2.5540
+   1845.4730   1490.3900     34.2262      2.5510
+   1846.4860   1490.4050     34.2247      2.5510
+   1847.5920   1490.4170     34.2255      2.5490
+   1848.4290   1490.4310     34.2224      2.5500
+   1849.4030   1490.4470     34.2117      2.5530
+   1850.4030   1490.4630     34.2239      2.5490
+   1851.3900   1490.4800     34.2247      2.5490
+   1852.3730   1490.4960     34.2300      2.5470
+   1853.4400   1490.5120     34.2285      2.5470
+   1854.3360   1490.5260     34.2339      2.5450
+   1855.3630   1490.5420     34.2133      2.5510
+   1856.3350   1490.5580     34.2293      2.5460
+   1857.3010   1490.5750     34.2163      2.5500
+   1858.3630   1490.5900     34.2209      2.5480
+   1859.3260   1490.6090     34.2194      2.5490
+   1860.2700   1490.6260     34.2201      2.5490
+   1861.3510   1490.6440     34.2201      2.5490
+   1862.3800   1490.6610     34.2194      2.5490
+   1863.3940   1490.6760     34.2140      2.5500
+   1864.3650   1490.6920     34.2239      2.5470
+   1865.1780   1490.7070     34.2278      2.5460
+   1866.3270   1490.7220     34.2247      2.5460
+   1867.1680   1490.7370     34.2247      2.5460
+   1868.1810   1490.7520     34.2262      2.5450
+   1869.1390   1490.7670     34.2255      2.5450
+   1870.1270   1490.7820     34.2209      2.5460
+   1871.1100   1490.7990     34.2369      2.5410
+   1872.1510   1490.8140     34.2255      2.5440
+   1873.0740   1490.8280     34.2270      2.5430
+   1874.1780   1490.8450     34.2194      2.5450
+   1875.1130   1490.8610     34.2125      2.5470
+   1876.0720   1490.8780     34.2201      2.5450
+   1877.0260   1490.8950     34.2270      2.5430
+   1878.0790   1490.9110     34.2285      2.5420
+   1879.0270   1490.9260     34.2308      2.5410
+   1880.0230   1490.9420     34.2171      2.5450
+   1881.0660   1490.9590     34.2201      2.5440
+   1882.0630   1490.9730     34.2178      2.5440
+   1883.0910   1490.9900     34.2171      2.5440
+   1883.9860   1491.0060     34.2209      2.5430
+   1884.9420   1491.0210     34.2300      2.5400
+   1885.9600   1491.0400     34.2209      2.5430
+   1887.0340   1491.0560     34.2194      2.5430
+   1887.9830   1491.0730     34.2232      2.5420
+   1888.9080   1491.0840     34.2323      2.5380
+   1889.9540   1491.0950     34.2239      2.5390
+   1890.8530   1491.1090     34.2163      2.5410
+   1892.0240   1491.1260     34.2278      2.5370
+   1892.8680   1491.1370     34.2186      2.5390
+   1893.8360   1491.1540     34.2216      2.5380
+   1894.7780   1491.1670     34.2262      2.5360
+   1895.7840   1491.1830     34.2186      2.5380
+   1896.8000   1491.2000     34.2186      2.5380
+   1897.8030   1491.2160     34.2209      2.5370
+   1898.8740   1491.2310     34.2247      2.5350
+   1899.8390   1491.2450     34.2133      2.5380
+   1900.7520   1491.2580     34.2239      2.5340
+   1901.7810   1491.2730     34.2194      2.5350
+   1902.7200   1491.2900     34.2232      2.5340
+   1903.7610   1491.3090     34.2239      2.5340
+   1904.7110   1491.3250     34.2209      2.5350
+   1905.6940   1491.3400     34.2194      2.5350
+   1906.6480   1491.3550     34.2182      2.5350
+   1907.6610   1491.3720     34.2247      2.5330
+   1908.7530   1491.3870     34.2155      2.5350
+   1909.6630   1491.4040     34.2262      2.5320
+   1910.8160   1491.4250     34.2209      2.5340
+   1911.5940   1491.4390     34.2278      2.5320
+   1912.6240   1491.4560     34.2171      2.5350
+   1913.5360   1491.4720     34.2178      2.5350
+   1914.5310   1491.4880     34.2072      2.5380
+   1915.5750   1491.5090     34.2224      2.5340
+   1916.5810   1491.5250     34.2247      2.5330
+   1917.4830   1491.5400     34.2148      2.5360
+   1918.5080   1491.5580     34.2285      2.5320
+   1919.5360   1491.5760     34.2255      2.5330
+   1920.4570   1491.5870     34.2155      2.5350
+   1921.4920   1491.6030     34.2239      2.5320
+   1922.4880   1491.6120     34.2178      2.5320
+   1923.4150   1491.6260     34.2194      2.5310
+   1924.4270   1491.6380     34.2087      2.5330
+   1925.4290   1491.6530     34.2171      2.5300
+   1926.4220   1491.6600     34.2094      2.5300
+   1927.4410   1491.6740     34.2201      2.5260
+   1928.3770   1491.6800     34.2255      2.5220
+   1929.3490   1491.6920     34.2224      2.5220
+   1930.2950   1491.6970     34.2300      2.5170
+   1931.3370   1491.7140     34.2293      2.5170
+   1932.3580   1491.7310     34.2163      2.5210
+   1933.2540   1491.7450     34.2216      2.5190
+   1934.2560   1491.7610     34.2239      2.5180
+   1935.2600   1491.7770     34.2232      2.5180
+   1936.2200   1491.7890     34.2201      2.5180
+   1937.2400   1491.8050     34.2255      2.5160
+   1938.2550   1491.8220     34.2117      2.5200
+   1939.2540   1491.8400     34.2255      2.5160
+   1940.2870   1491.8580     34.2163      2.5190
+   1941.1980   1491.8730     34.2224      2.5170
+   1942.2540   1491.8920     34.2163      2.5190
+   1943.1200   1491.9090     34.2278      2.5160
+   1944.1260   1491.9230     34.2255      2.5160
+   1945.1300   1491.9380     34.2140      2.5190
+   1946.1180   1491.9550     34.2209      2.5170
+   1947.1930   1491.9740     34.2110      2.5200
+   1948.2800   1491.9940     34.2285      2.5150
+   1949.2360   1492.0120     34.2171      2.5190
+   1950.0440   1492.0250     34.2224      2.5170
+   1951.0260   1492.0400     34.2178      2.5180
+   1952.0990   1492.0610     34.2201      2.5180
+   1953.1260   1492.0770     34.2323      2.5140
+   1954.0810   1492.0950     34.2201      2.5180
+   1955.0490   1492.1120     34.2339      2.5140
+   1955.9570   1492.1270     34.2270      2.5160
+   1956.9880   1492.1450     34.2171      2.5190
+   1958.0040   1492.1610     34.2224      2.5170
+   1958.9870   1492.1780     34.2194      2.5180
+   1959.9560   1492.1930     34.2148      2.5190
+   1960.9230   1492.2060     34.2186      2.5170
+   1961.8710   1492.2140     34.2354      2.5100
+   1963.0160   1492.2290     34.2194      2.5140
+   1963.9520   1492.2440     34.2216      2.5130
+   1964.8500   1492.2570     34.2262      2.5110
+   1965.8430   1492.2740     34.2262      2.5110
+   1966.8450   1492.2900     34.2255      2.5110
+   1967.8840   1492.3070     34.2186      2.5130
+   1968.8560   1492.3240     34.2117      2.5150
+   1969.9420   1492.3410     34.2239      2.5110
+   1970.8010   1492.3550     34.2232      2.5110
+   1971.7500   1492.3700     34.2194      2.5120
+   1972.7960   1492.3860     34.2110      2.5140
+   1973.7890   1492.4000     34.2125      2.5130
+   1974.7300   1492.4140     34.2205      2.5100
+   1975.6970   1492.4260     34.2171      2.5100
+   1976.7840   1492.4380     34.2117      2.5100
+   1977.7260   1492.4510     34.2163      2.5080
+   1978.6350   1492.4630     34.2201      2.5060
+   1979.6390   1492.4800     34.2102      2.5090
+   1980.6400   1492.4920     34.2194      2.5050
+   1981.6940   1492.5030     34.2079      2.5070
+   1982.6040   1492.5180     34.2102      2.5060
+   1983.5700   1492.5290     34.2163      2.5030
+   1984.5500   1492.5440     34.2148      2.5030
+   1985.5440   1492.5620     34.2155      2.5030
+   1986.5770   1492.5790     34.2247      2.5000
+   1987.5890   1492.5950     34.2239      2.5000
+   1988.5070   1492.6080     34.2117      2.5030
+   1989.4830   1492.6200     34.2117      2.5020
+   1990.6370   1492.6400     34.2316      2.4960
+   1991.5720   1492.6550     34.2140      2.5010
+   1992.4930   1492.6690     34.2033      2.5040
+   1993.5410   1492.6860     34.2216      2.4980
+   1994.5610   1492.7020     34.2079      2.5020
+   1995.3950   1492.7110     34.2232      2.4960
+   1996.4960   1492.7270     34.2216      2.4960
+   1997.4140   1492.7410     34.2171      2.4970
+   1998.5160   1492.7590     34.2194      2.4960
+   1999.3760   1492.7710     34.2209      2.4950
+   2000.3650   1492.7840     34.2140      2.4960
+   2001.3690   1492.7990     34.2125      2.4960
+   2002.3170   1492.8150     34.2155      2.4950
+   2003.3430   1492.8320     34.2125      2.4960
+   2004.2870   1492.8490     34.2194      2.4940
+   2005.4080   1492.8670     34.2247      2.4920
+   2006.3470   1492.8840     34.2155      2.4950
+   2007.3440   1492.8980     34.2072      2.4970
+   2008.2570   1492.9120     34.2186      2.4930
+   2009.2280   1492.9260     34.2041      2.4970
+   2010.2300   1492.9420     34.2125      2.4940
+   2011.1830   1492.9600     34.2110      2.4950
+   2012.2200   1492.9730     34.2171      2.4920
+   2013.1610   1492.9870     34.2087      2.4940
+   2014.1970   1492.9990     34.2178      2.4900
+   2015.1550   1493.0150     34.2171      2.4900
+   2016.2440   1493.0330     34.2232      2.4880
+   2017.1970   1493.0500     34.2041      2.4940
+   2018.1490   1493.0600     34.2224      2.4870
+   2019.1040   1493.0760     34.2056      2.4920
+   2020.1050   1493.0930     34.2155      2.4890
+   2021.1160   1493.1080     34.2102      2.4900
+   2022.0740   1493.1270     34.2056      2.4920
+   2023.0650   1493.1420     34.2110      2.4900
+   2024.0620   1493.1560     34.2148      2.4880
+   2024.9810   1493.1720     34.2056      2.4910
+   2026.0820   1493.1910     34.2117      2.4890
+   2027.0140   1493.2060     34.2110      2.4890
+   2028.1070   1493.2250     34.2148      2.4880
+   2028.9420   1493.2370     34.2194      2.4860
+   2029.9750   1493.2540     34.2155      2.4870
+   2030.9060   1493.2700     34.2094      2.4890
+   2031.9540   1493.2890     34.2133      2.4880
+   2032.9290   1493.3050     34.2125      2.4880
+   2033.9090   1493.3210     34.2186      2.4860
+   2034.9170   1493.3340     34.2125      2.4870
+   2035.8320   1493.3510     34.2102      2.4880
+   2036.8840   1493.3700     34.2171      2.4860
+   2037.8930   1493.3870     34.2171      2.4860
+   2038.9830   1493.4070     34.2049      2.4900
+   2039.9150   1493.4230     34.2247      2.4840
+   2040.7850   1493.4360     34.2201      2.4850
+   2041.8780   1493.4560     34.2239      2.4840
+   2042.7480   1493.4700     34.2140      2.4870
+   2043.8200   1493.4850     34.2110      2.4870
+   2044.7030   1493.5010     34.2186      2.4850
+   2045.7840   1493.5200     34.2125      2.4870
+   2046.9100   1493.5350     34.2087      2.4870
+   2047.7820   1493.5480     34.2110      2.4860
+   2048.6920   1493.5590     34.2102      2.4850
+   2049.7470   1493.5730     34.2140      2.4830
+   2050.6400   1493.5830     34.2163      2.4810
+   2051.7060   1493.6000     34.2026      2.4850
+   2052.6190   1493.6130     34.2133      2.4810
+   2053.6510   1493.6290     34.2087      2.4820
+   2054.5910   1493.6440     34.2079      2.4820
+   2055.5710   1493.6620     34.2056      2.4830
+   2056.5680   1493.6780     34.2148      2.4800
+   2057.7160   1493.6980     34.2148      2.4800
+   2058.5350   1493.7110     34.2178      2.4790
+   2059.5820   1493.7300     34.2018      2.4840
+   2060.5110   1493.7440     34.2102      2.4810
+   2061.5050   1493.7610     34.2171      2.4790
+   2062.5180   1493.7770     34.2155      2.4790
+   2063.4770   1493.7960     34.2110      2.4810
+   2064.5400   1493.8130     34.2041      2.4830
+   2065.4980   1493.8300     34.2072      2.4820
+   2066.4910   1493.8460     34.2102      2.4810
+   2067.3950   1493.8620     34.2003      2.4840
+   2068.4380   1493.8790     34.2163      2.4790
+   2069.3590   1493.8930     34.2216      2.4770
+   2070.4320   1493.9120     34.2155      2.4790
+   2071.4220   1493.9290     34.2186      2.4780
+   2072.3160   1493.9450     34.2125      2.4800
+   2073.4640   1493.9650     34.2125      2.4800
+   2074.3340   1493.9810     34.2140      2.4800
+   2075.3140   1493.9960     34.2125      2.4800
+   2076.3340   1494.0130     34.2056      2.4820
+   2077.2620   1494.0290     34.2155      2.4790
+   2078.2460   1494.0450     34.2079      2.4810
+   2079.2280   1494.0650     34.2232      2.4770
+   2080.4150   1494.0820     34.2148      2.4790
+   2081.3220   1494.0990     34.2056      2.4820
+   2082.2130   1494.1140     34.2056      2.4820
+   2083.2220   1494.1320     34.2155      2.4790
+   2084.2000   1494.1490     34.2125      2.4800
+   2085.2310   1494.1660     34.2155      2.4790
+   2086.2300   1494.1810     34.2110      2.4800
+   2087.1590   1494.1980     34.1988      2.4840
+   2088.1040   1494.2150     34.2026      2.4830
+   2089.1300   1494.2320     34.2148      2.4790
+   2090.1690   1494.2470     34.2064      2.4810
+   2091.1030   1494.2640     34.2171      2.4780
+   2092.0680   1494.2810     34.2072      2.4810
+   2093.1110   1494.2970     34.2056      2.4810
+   2094.1440   1494.3120     34.2140      2.4780
+   2094.9940   1494.3240     34.2117      2.4780
+   2096.0390   1494.3400     34.2041      2.4800
+   2096.9980   1494.3540     34.2087      2.4780
+   2098.0210   1494.3710     34.2079      2.4780
+   2099.0390   1494.3860     34.2194      2.4740
+   2099.9450   1494.3990     34.2010      2.4790
+   2101.0470   1494.4110     34.2087      2.4750
+   2101.9160   1494.4150     34.2072      2.4730
+   2102.9680   1494.4230     34.2125      2.4690
+   2103.9670   1494.4380     34.2079      2.4700
+   2104.9220   1494.4530     34.2064      2.4700
+   2105.8600   1494.4680     34.2094      2.4690
+   2106.9010   1494.4850     34.2087      2.4690
+   2108.0120   1494.5050     34.2056      2.4700
+   2108.8250   1494.5180     34.2087      2.4690
+   2109.8110   1494.5360     34.2094      2.4690
+   2110.7690   1494.5520     34.2087      2.4690
+   2111.7710   1494.5710     34.2133      2.4680
+   2112.8940   1494.5890     34.2255      2.4640
+   2113.7950   1494.6050     34.2133      2.4680
+   2114.7080   1494.6170     34.2072      2.4690
+   2115.7340   1494.6290     34.2026      2.4690
+   2116.7450   1494.6470     34.2163      2.4650
+   2117.7490   1494.6630     34.2155      2.4650
+   2118.6440   1494.6790     34.2094      2.4670
+   2119.7830   1494.6980     34.2026      2.4690
+   2120.7150   1494.7130     34.2049      2.4680
+   2121.7150   1494.7300     34.2117      2.4660
+   2122.5910   1494.7410     34.2087      2.4660
+   2123.6400   1494.7630     34.2079      2.4670
+   2124.6390   1494.7770     34.2026      2.4680
+   2125.6340   1494.7950     34.2163      2.4640
+   2126.5990   1494.8130     34.2072      2.4670
+   2127.6200   1494.8310     34.2079      2.4670
+   2128.5940   1494.8480     34.2148      2.4650
+   2129.5200   1494.8620     34.2163      2.4640
+   2130.5810   1494.8800     34.2003      2.4690
+   2131.5050   1494.8970     34.2110      2.4660
+   2132.4900   1494.9130     34.2133      2.4650
+   2133.5450   1494.9330     34.2117      2.4660
+   2134.5450   1494.9500     34.2110      2.4660
+   2135.5860   1494.9640     34.2049      2.4670
+   2136.5390   1494.9760     34.2087      2.4650
+   2137.4470   1494.9900     34.2072      2.4650
+   2138.4370   1495.0030     34.2072      2.4640
+   2139.3950   1495.0140     34.2133      2.4610
+   2140.3700   1495.0280     34.2041      2.4630
+   2141.4460   1495.0470     34.2117      2.4610
+   2142.5030   1495.0640     34.1972      2.4650
+   2143.3170   1495.0770     34.2003      2.4640
+   2144.2790   1495.0930     34.1995      2.4640
+   2145.3560   1495.1070     34.2064      2.4610
+   2146.3220   1495.1220     34.2079      2.4600
+   2147.3640   1495.1370     34.2056      2.4600
+   2148.3380   1495.1530     34.2087      2.4590
+   2149.2240   1495.1680     34.2018      2.4610
+   2150.2540   1495.1860     34.2117      2.4580
+   2151.1860   1495.2030     34.1995      2.4620
+   2152.2430   1495.2210     34.2194      2.4560
+   2153.2070   1495.2370     34.2026      2.4610
+   2154.2120   1495.2550     34.1995      2.4620
+   2155.1760   1495.2670     34.2094      2.4580
+   2156.2030   1495.2840     34.2087      2.4580
+   2157.3120   1495.3010     34.2140      2.4560
+   2158.1290   1495.3140     34.2098      2.4570
+   2159.1150   1495.3290     34.2117      2.4560
+   2160.0890   1495.3470     34.2094      2.4570
+   2161.0450   1495.3630     34.2056      2.4580
+   2162.0270   1495.3800     34.2224      2.4530
+   2163.0660   1495.4010     34.2117      2.4570
+   2164.1690   1495.4170     34.2026      2.4590
+   2165.0240   1495.4310     34.2117      2.4560
+   2166.0250   1495.4470     34.2079      2.4570
+   2166.9670   1495.4610     34.2163      2.4540
+   2167.9320   1495.4770     34.2125      2.4550
+   2168.9140   1495.4920     34.2140      2.4540
+   2169.9720   1495.5130     34.2094      2.4560
+   2170.9700   1495.5280     34.2148      2.4540
+   2171.8910   1495.5390     34.2079      2.4550
+   2172.8830   1495.5560     34.2178      2.4520
+   2173.9590   1495.5710     34.2087      2.4540
+   2174.8240   1495.5840     34.2133      2.4520
+   2175.8900   1495.6030     34.2010      2.4560
+   2176.9050   1495.6170     34.2018      2.4550
+   2177.8460   1495.6310     34.2163      2.4500
+   2178.8470   1495.6490     34.2072      2.4530
+   2179.8220   1495.6660     34.2201      2.4490
+   2180.7600   1495.6810     34.2064      2.4530
+   2181.8490   1495.7000     34.2064      2.4530
+   2182.7710   1495.7170     34.2079      2.4530
+   2183.7390   1495.7310     34.2125      2.4510
+   2184.7150   1495.7480     34.2094      2.4520
+   2185.6730   1495.7650     34.2064      2.4530
+   2186.6650   1495.7830     34.2033      2.4540
+   2187.7490   1495.8000     34.2026      2.4540
+   2188.6930   1495.8170     34.2033      2.4540
+   2189.6820   1495.8320     34.2110      2.4510
+   2190.6270   1495.8450     34.2026      2.4530
+   2191.6350   1495.8600     34.2072      2.4510
+   2192.7080   1495.8780     34.1972      2.4540
+   2193.6580   1495.8930     34.2026      2.4520
+   2194.6210   1495.9100     34.2026      2.4520
+   2195.5370   1495.9230     34.2010      2.4520
+   2196.6100   1495.9410     34.2102      2.4490
+   2197.6040   1495.9570     34.2224      2.4450
+   2198.5500   1495.9740     34.2072      2.4500
+   2199.4900   1495.9900     34.2003      2.4520
+   2200.4640   1496.0030     34.2003      2.4510
+   2201.4690   1496.0210     34.2079      2.4490
+   2202.5060   1496.0380     34.1904      2.4540
+   2203.5320   1496.0520     34.2079      2.4480
+   2204.4030   1496.0680     34.2117      2.4470
+   2205.4170   1496.0810     34.2117      2.4460
+   2206.3890   1496.0980     34.2148      2.4450
+   2207.3520   1496.1090     34.2110      2.4450
+   2208.3460   1496.1230     34.1988      2.4480
+   2209.3650   1496.1350     34.2010      2.4460
+   2210.4080   1496.1520     34.2133      2.4420
+   2211.3410   1496.1660     34.2087      2.4430
+   2212.3090   1496.1810     34.2010      2.4450
+   2213.3760   1496.1990     34.2102      2.4420
+   2214.3340   1496.2150     34.2072      2.4430
+   2215.3470   1496.2340     34.1949      2.4470
+   2216.2140   1496.2490     34.1980      2.4460
+   2217.2440   1496.2640     34.2026      2.4440
+   2218.3140   1496.2840     34.2010      2.4450
+   2219.2140   1496.2980     34.2094      2.4420
+   2220.2000   1496.3120     34.2003      2.4440
+   2221.2400   1496.3310     34.2018      2.4440
+   2222.1360   1496.3470     34.2018      2.4440
+   2223.1970   1496.3640     34.2041      2.4430
+   2224.1840   1496.3770     34.2049      2.4420
+   2225.1920   1496.3950     34.2087      2.4410
+   2226.2120   1496.4130     34.2087      2.4410
+   2227.1600   1496.4280     34.2041      2.4420
+   2228.2350   1496.4440     34.2026      2.4420
+   2229.1180   1496.4580     34.2018      2.4420
+   2230.0160   1496.4740     34.2117      2.4390
+   2231.0360   1496.4920     34.2056      2.4410
+   2232.1120   1496.5100     34.2117      2.4390
+   2232.9990   1496.5270     34.2102      2.4400
+   2234.0030   1496.5420     34.2117      2.4390
+   2234.9860   1496.5590     34.1949      2.4440
+   2235.9340   1496.5770     34.1995      2.4430
+   2237.0190   1496.5950     34.2087      2.4400
+   2237.9820   1496.6120     34.2026      2.4420
+   2238.9270   1496.6280     34.2125      2.4390
+   2239.9410   1496.6450     34.1988      2.4430
+   2240.9240   1496.6650     34.2049      2.4420
+   2241.9180   1496.6800     34.2094      2.4400
+   2242.8230   1496.6930     34.2010      2.4420
+   2243.9500   1496.7110     34.2133      2.4380
+   2244.8950   1496.7300     34.2087      2.4400
+   2245.8620   1496.7470     34.1995      2.4430
+   2246.8710   1496.7650     34.2094      2.4400
+   2247.7870   1496.7810     34.2163      2.4380
+   2248.7910   1496.7960     34.1919      2.4450
+   2249.7340   1496.8120     34.2178      2.4370
+   2250.7480   1496.8280     34.2033      2.4410
+   2251.7150   1496.8450     34.2003      2.4420
+   2252.7450   1496.8620     34.1999      2.4420
+   2253.8320   1496.8830     34.1984      2.4430
+   2254.6760   1496.8980     34.1988      2.4430
+   2255.7020   1496.9160     34.2026      2.4420
+   2256.6380   1496.9300     34.2102      2.4390
+   2257.6150   1496.9430     34.2079      2.4390
+   2258.6490   1496.9570     34.2018      2.4400
+   2259.6440   1496.9740     34.1949      2.4420
+   2260.5530   1496.9860     34.2018      2.4390
+   2261.6780   1497.0070     34.1904      2.4430
+   2262.5520   1497.0220     34.2064      2.4380
+   2263.5690   1497.0390     34.2026      2.4390
+   2264.5280   1497.0540     34.2079      2.4370
+   2265.5320   1497.0680     34.1995      2.4390
+   2266.5130   1497.0860     34.2003      2.4390
+   2267.5540   1497.1020     34.1988      2.4390
+   2268.4900   1497.1170     34.2010      2.4380
+   2269.4710   1497.1330     34.1972      2.4390
+   2270.5350   1497.1490     34.1988      2.4380
+   2271.5400   1497.1680     34.2094      2.4350
+   2272.4430   1497.1820     34.1957      2.4390
+   2273.3660   1497.1980     34.2018      2.4370
+   2274.4190   1497.2160     34.1957      2.4390
+   2275.3970   1497.2340     34.1965      2.4390
+   2276.3760   1497.2500     34.1988      2.4380
+   2277.4280   1497.2650     34.1965      2.4380
+   2278.2830   1497.2780     34.1988      2.4370
+   2279.4290   1497.2970     34.2010      2.4360
+   2280.3560   1497.3120     34.1911      2.4390
+   2281.2510   1497.3240     34.1881      2.4390
+   2282.2270   1497.3440     34.1972      2.4370
+   2283.3190   1497.3610     34.1988      2.4360
+   2284.2550   1497.3760     34.2049      2.4340
+   2285.2210   1497.3930     34.2117      2.4320
+   2286.2330   1497.4080     34.1934      2.4370
+   2287.1650   1497.4250     34.2010      2.4350
+   2288.2050   1497.4400     34.1988      2.4350
+   2289.2310   1497.4580     34.1988      2.4350
+   2290.2420   1497.4750     34.2018      2.4340
+   2291.1490   1497.4900     34.2010      2.4340
+   2292.2360   1497.5100     34.1957      2.4360
+   2293.1480   1497.5280     34.1972      2.4360
+   2294.0940   1497.5400     34.2072      2.4320
+   2295.1140   1497.5580     34.1980      2.4350
+   2296.0440   1497.5740     34.1942      2.4360
+   2297.0020   1497.5870     34.2079      2.4310
+   2298.0510   1497.6070     34.1995      2.4340
+   2299.0180   1497.6260     34.1888      2.4380
+   2299.9840   1497.6420     34.1850      2.4390
+   2300.9380   1497.6570     34.1965      2.4350
+   2302.0410   1497.6740     34.1957      2.4350
+   2302.9650   1497.6880     34.1972      2.4340
+   2304.0040   1497.7050     34.1995      2.4330
+   2304.9810   1497.7230     34.2102      2.4300
+   2306.0030   1497.7420     34.1988      2.4340
+   2306.9780   1497.7600     34.2026      2.4330
+   2307.8770   1497.7750     34.1957      2.4350
+   2308.8340   1497.7900     34.1980      2.4340
+   2309.8070   1497.8070     34.1919      2.4360
+   2310.8280   1497.8210     34.1919      2.4350
+   2311.7930   1497.8410     34.1980      2.4340
+   2312.8600   1497.8600     34.2018      2.4330
+   2313.7940   1497.8770     34.2026      2.4330
+   2314.7950   1497.8910     34.1904      2.4360
+   2315.7620   1497.9080     34.1972      2.4340
+   2316.7070   1497.9230     34.1995      2.4330
+   2317.7510   1497.9380     34.2003      2.4320
+   2318.7670   1497.9550     34.1965      2.4330
+   2319.7510   1497.9690     34.1976      2.4320
+   2320.6600   1497.9840     34.1942      2.4330
+   2321.6910   1498.0020     34.2072      2.4290
+   2322.6080   1498.0150     34.2018      2.4300
+   2323.6500   1498.0310     34.1972      2.4310
+   2324.6200   1498.0450     34.2018      2.4290
+   2325.6690   1498.0630     34.2049      2.4280
+   2326.6070   1498.0770     34.1995      2.4290
+   2327.5350   1498.0930     34.1965      2.4300
+   2328.5860   1498.1080     34.1972      2.4290
+   2329.5830   1498.1240     34.1965      2.4290
+   2330.6110   1498.1400     34.2018      2.4270
+   2331.5770   1498.1600     34.2140      2.4240
+   2332.4660   1498.1730     34.1961      2.4290
+   2333.4640   1498.1890     34.1949      2.4290
+   2334.6190   1498.2040     34.2010      2.4260
+   2335.4820   1498.2200     34.1957      2.4280
+   2336.4000   1498.2340     34.1972      2.4270
+   2337.3810   1498.2460     34.2072      2.4230
+   2338.5100   1498.2630     34.1888      2.4280
+   2339.5040   1498.2770     34.2026      2.4230
+   2340.3740   1498.2910     34.1888      2.4270
+   2341.3860   1498.3010     34.1896      2.4250
+   2342.3320   1498.3200     34.2018      2.4220
+   2343.4340   1498.3360     34.2026      2.4210
+   2344.2820   1498.3510     34.1965      2.4230
+   2345.2860   1498.3660     34.2041      2.4200
+   2346.2790   1498.3800     34.1927      2.4230
+   2347.2380   1498.3960     34.1949      2.4220
+   2348.2960   1498.4140     34.1919      2.4230
+   2349.3220   1498.4310     34.1980      2.4210
+   2350.2190   1498.4480     34.2018      2.4200
+   2351.2360   1498.4650     34.1949      2.4220
+   2352.1630   1498.4790     34.1934      2.4220
+   2353.2250   1498.4960     34.1957      2.4210
+   2354.2530   1498.5100     34.2033      2.4180
+   2355.3130   1498.5270     34.2018      2.4180
+   2356.1150   1498.5380     34.1965      2.4190
+   2357.0830   1498.5530     34.1988      2.4180
+   2358.2980   1498.5740     34.1988      2.4180
+   2359.0950   1498.5890     34.1995      2.4180
+   2360.0680   1498.6050     34.1988      2.4180
+   2361.0590   1498.6230     34.1965      2.4190
+   2362.0270   1498.6380     34.1988      2.4180
+   2362.9910   1498.6560     34.2064      2.4160
+   2364.0910   1498.6730     34.1949      2.4190
+   2364.9560   1498.6910     34.2003      2.4180
+   2365.9530   1498.7050     34.1980      2.4180
+   2366.9820   1498.7230     34.1949      2.4190
+   2367.9720   1498.7420     34.1866      2.4220
+   2369.0180   1498.7550     34.1927      2.4190
+   2369.9590   1498.7750     34.1957      2.4190
+   2370.9070   1498.7890     34.1904      2.4200
+   2371.8910   1498.8080     34.1888      2.4210
+   2372.8680   1498.8240     34.1881      2.4210
+   2373.8590   1498.8410     34.2010      2.4170
+   2374.8100   1498.8560     34.1835      2.4220
+   2375.8630   1498.8760     34.2079      2.4150
+   2376.8100   1498.8890     34.1957      2.4180
+   2377.8230   1498.9080     34.1904      2.4200
+   2378.7480   1498.9230     34.1927      2.4190
+   2379.8210   1498.9410     34.1927      2.4190
+   2380.8710   1498.9580     34.1949      2.4180
+   2381.7510   1498.9730     34.2010      2.4160
+   2382.7560   1498.9930     34.2003      2.4170
+   2383.6910   1499.0060     34.1911      2.4190
+   2384.7360   1499.0240     34.1843      2.4210
+   2385.7210   1499.0410     34.1980      2.4170
+   2386.6400   1499.0580     34.1949      2.4180
+   2387.6180   1499.0740     34.2010      2.4160
+   2388.6020   1499.0910     34.1949      2.4180
+   2389.6500   1499.1070     34.1995      2.4160
+   2390.5820   1499.1230     34.1927      2.4180
+   2391.5960   1499.1400     34.1995      2.4160
+   2392.6020   1499.1580     34.2026      2.4150
+   2393.5400   1499.1740     34.1896      2.4190
+   2394.5810   1499.1920     34.2026      2.4150
+   2395.5980   1499.2090     34.1988      2.4160
+   2396.5480   1499.2240     34.1949      2.4170
+   2397.4490   1499.2370     34.1965      2.4160
+   2398.4750   1499.2540     34.2018      2.4140
+   2399.5200   1499.2740     34.2033      2.4140
+   2400.4430   1499.2880     34.1927      2.4170
+   2401.4170   1499.3050     34.1957      2.4160
+   2402.4480   1499.3220     34.1919      2.4170
+   2403.5270   1499.3410     34.1888      2.4180
+   2404.4090   1499.3530     34.1995      2.4140
+   2405.3320   1499.3690     34.1995      2.4140
+   2406.3700   1499.3850     34.2079      2.4110
+   2407.4020   1499.4050     34.1965      2.4150
+   2408.3570   1499.4200     34.1888      2.4170
+   2409.2850   1499.4370     34.1930      2.4160
+   2410.2960   1499.4530     34.1888      2.4170
+   2411.2760   1499.4690     34.2010      2.4130
+   2412.2880   1499.4850     34.2003      2.4130
+   2413.2390   1499.5010     34.1965      2.4140
+   2414.2040   1499.5150     34.1881      2.4160
+   2415.2360   1499.5320     34.1934      2.4140
+   2416.2010   1499.5460     34.1980      2.4120
+   2417.1420   1499.5630     34.1988      2.4120
+   2418.1450   1499.5770     34.2094      2.4080
+   2419.1750   1499.5940     34.1988      2.4110
+   2420.1580   1499.6060     34.1919      2.4120
+   2421.0940   1499.6210     34.1881      2.4130
+   2422.2000   1499.6400     34.1911      2.4120
+   2423.0460   1499.6520     34.1927      2.4110
+   2424.0560   1499.6670     34.2003      2.4080
+   2425.2310   1499.6870     34.2003      2.4080
+   2426.0380   1499.7000     34.2056      2.4060
+   2427.0460   1499.7160     34.1949      2.4090
+   2427.9920   1499.7300     34.1904      2.4100
+   2428.9980   1499.7450     34.2049      2.4050
+   2429.9710   1499.7610     34.1942      2.4080
+   2431.1380   1499.7810     34.1972      2.4070
+   2431.9170   1499.7940     34.1942      2.4080
+   2433.0540   1499.8140     34.1942      2.4080
+   2433.9060   1499.8280     34.2033      2.4050
+   2434.8950   1499.8460     34.1972      2.4070
+   2435.9010   1499.8610     34.1896      2.4090
+   2436.8940   1499.8780     34.1957      2.4070
+   2437.8140   1499.8950     34.1904      2.4090
+   2438.8690   1499.9120     34.1927      2.4080
+   2440.0210   1499.9320     34.1927      2.4080
+   2440.8520   1499.9470     34.1995      2.4060
+   2441.8390   1499.9630     34.2018      2.4050
+   2442.7790   1499.9760     34.1927      2.4070
+   2443.8140   1499.9940     34.1965      2.4060
+   2444.7570   1500.0110     34.1972      2.4060
+   2445.7050   1500.0250     34.1949      2.4060
+   2446.7290   1500.0440     34.1965      2.4060
+   2447.8640   1500.0630     34.1988      2.4050
+   2448.6970   1500.0750     34.2003      2.4040
+   2449.6960   1500.0940     34.1988      2.4050
+   2450.6710   1500.1100     34.1850      2.4090
+   2451.6020   1500.1270     34.1858      2.4090
+   2452.6310   1500.1440     34.1911      2.4070
+   2453.5790   1500.1610     34.1988      2.4050
+   2454.6090   1500.1820     34.2041      2.4040
+   2455.5760   1500.1980     34.2003      2.4050
+   2456.5590   1500.2150     34.1942      2.4070
+   2457.5130   1500.2330     34.1980      2.4060
+   2458.5470   1500.2490     34.1904      2.4080
+   2459.4840   1500.2660     34.1873      2.4090
+   2460.5800   1500.2810     34.1942      2.4060
+   2461.4780   1500.2950     34.1965      2.4050
+   2462.4800   1500.3120     34.1896      2.4070
+   2463.5350   1500.3270     34.1904      2.4060
+   2464.4000   1500.3430     34.1911      2.4060
+   2465.4480   1500.3560     34.1911      2.4050
+   2466.4280   1500.3760     34.1995      2.4030
+   2467.4220   1500.3930     34.1965      2.4040
+   2468.3860   1500.4090     34.1896      2.4060
+   2469.3730   1500.4240     34.2010      2.4020
+   2470.3790   1500.4390     34.1896      2.4050
+   2471.4040   1500.4570     34.1995      2.4020
+   2472.2890   1500.4690     34.1965      2.4020
+   2473.3090   1500.4850     34.1927      2.4030
+   2474.2850   1500.5010     34.1949      2.4020
+   2475.3090   1500.5170     34.2102      2.3970
+   2476.3160   1500.5350     34.1972      2.4010
+   2477.2450   1500.5520     34.2049      2.3990
+   2478.1790   1500.5660     34.1900      2.4030
+   2479.2040   1500.5820     34.1949      2.4010
+   2480.2970   1500.6010     34.1988      2.4000
+   2481.1400   1500.6160     34.2018      2.3990
+   2482.1960   1500.6320     34.1972      2.4000
+   2483.1970   1500.6520     34.1995      2.4000
+   2484.1230   1500.6660     34.1911      2.4020
+   2485.1150   1500.6840     34.1888      2.4030
+   2486.0800   1500.7010     34.1919      2.4020
+   2487.0630   1500.7170     34.1949      2.4010
+   2488.1360   1500.7370     34.2026      2.3990
+   2489.0710   1500.7520     34.2049      2.3980
+   2490.0860   1500.7670     34.1866      2.4030
+   2491.0430   1500.7850     34.1942      2.4010
+   2492.0740   1500.8010     34.1957      2.4000
+   2493.0400   1500.8170     34.1919      2.4010
+   2493.9590   1500.8320     34.1919      2.4010
+   2495.0600   1500.8480     34.1957      2.3990
+   2496.0170   1500.8650     34.1965      2.3990
+   2496.9420   1500.8810     34.1927      2.4000
+   2497.8880   1500.8940     34.1969      2.3980
+   2498.9430   1500.9130     34.1873      2.4010
+   2499.9190   1500.9280     34.1927      2.3990
+   2500.8820   1500.9450     34.1934      2.3990
+   2501.8330   1500.9620     34.1934      2.3990
+   2502.8670   1500.9790     34.2056      2.3950
+   2503.8780   1500.9940     34.1942      2.3980
+   2504.8990   1501.0140     34.1995      2.3970
+   2505.8470   1501.0290     34.1919      2.3990
+   2506.7950   1501.0450     34.1980      2.3970
+   2507.8080   1501.0610     34.1934      2.3980
+   2508.7130   1501.0780     34.2010      2.3960
+   2509.7250   1501.0960     34.1980      2.3970
+   2510.8290   1501.1150     34.1980      2.3970
+   2511.7250   1501.1290     34.2003      2.3960
+   2512.7110   1501.1450     34.1797      2.4020
+   2513.6910   1501.1630     34.1972      2.3970
+   2514.5930   1501.1790     34.1942      2.3980
+   2515.5800   1501.1960     34.1942      2.3980
+   2516.5870   1501.2100     34.1949      2.3970
+   2517.5640   1501.2290     34.1934      2.3980
+   2518.5350   1501.2440     34.2049      2.3940
+   2519.5120   1501.2620     34.1896      2.3990
+   2520.5290   1501.2800     34.1927      2.3980
+   2521.6130   1501.3010     34.2041      2.3950
+   2522.5400   1501.3150     34.2026      2.3950
+   2523.4480   1501.3320     34.1873      2.4000
+   2524.4350   1501.3490     34.1904      2.3990
+   2525.5340   1501.3680     34.1873      2.4000
+   2526.5360   1501.3860     34.1942      2.3980
+   2527.4210   1501.3990     34.1927      2.3980
+   2528.4860   1501.4200     34.1881      2.4000
+   2529.4270   1501.4340     34.1995      2.3960
+   2530.3390   1501.4500     34.1934      2.3980
+   2531.3240   1501.4650     34.1949      2.3970
+   2532.3490   1501.4800     34.1896      2.3980
+   2533.3270   1501.4970     34.1866      2.3990
+   2534.3160   1501.5160     34.1911      2.3980
+   2535.3890   1501.5350     34.1881      2.3990
+   2536.2750   1501.5500     34.1980      2.3960
+   2537.2420   1501.5660     34.1942      2.3970
+   2538.2490   1501.5860     34.1927      2.3980
+   2539.3380   1501.6040     34.1949      2.3970
+   2540.2800   1501.6200     34.1919      2.3980
+   2541.2790   1501.6360     34.1812      2.4010
+   2542.1890   1501.6540     34.2026      2.3950
+   2543.1740   1501.6710     34.1888      2.3990
+   2544.2310   1501.6910     34.1972      2.3970
+   2545.2080   1501.7080     34.1942      2.3980
+   2546.1490   1501.7250     34.1942      2.3980
+   2547.0800   1501.7420     34.1888      2.4000
+   2548.0750   1501.7590     34.1949      2.3980
+   2549.0430   1501.7730     34.1927      2.3980
+   2550.0260   1501.7900     34.1896      2.3990
+   2551.0410   1501.8110     34.1957      2.3980
+   2551.9980   1501.8280     34.2087      2.3940
+   2553.1000   1501.8440     34.1866      2.4000
+   2554.1670   1501.8640     34.1782      2.4030
+   2554.9560   1501.8780     34.1980      2.3970
+   2555.9510   1501.8910     34.1881      2.3990
+   2556.9420   1501.9040     34.1919      2.3970
+   2557.8930   1501.9210     34.1957      2.3960
+   2559.0070   1501.9380     34.1843      2.3990
+   2559.9670   1501.9540     34.2033      2.3930
+   2560.8720   1501.9710     34.1942      2.3960
+   2561.8960   1501.9870     34.1934      2.3960
+   2562.8530   1502.0040     34.1904      2.3970
+   2563.9050   1502.0220     34.1896      2.3970
+   2564.8330   1502.0400     34.2010      2.3940
+   2565.7830   1502.0530     34.1957      2.3950
+   2566.8880   1502.0730     34.1827      2.3990
+   2567.8060   1502.0900     34.1934      2.3960
+   2568.7410   1502.1070     34.1911      2.3970
+   2569.7380   1502.1250     34.1850      2.3990
+   2570.7600   1502.1420     34.1911      2.3970
+   2571.6850   1502.1600     34.1927      2.3970
+   2572.6860   1502.1770     34.1988      2.3950
+   2573.6510   1502.1910     34.1835      2.3990
+   2574.6950   1502.2090     34.1934      2.3960
+   2575.6040   1502.2260     34.2010      2.3940
+   2576.6200   1502.2430     34.1942      2.3960
+   2577.6800   1502.2610     34.1904      2.3970
+   2578.5650   1502.2780     34.1888      2.3980
+   2579.7100   1502.2960     34.1972      2.3950
+   2580.5360   1502.3120     34.1850      2.3990
+   2581.5130   1502.3290     34.1980      2.3950
+   2582.5060   1502.3440     34.1965      2.3950
+   2583.5030   1502.3610     34.1965      2.3950
+   2584.4730   1502.3800     34.1919      2.3970
+   2585.4430   1502.3960     34.1972      2.3950
+   2586.5120   1502.4170     34.1896      2.3980
+   2587.4370   1502.4340     34.2033      2.3940
+   2588.4300   1502.4460     34.1896      2.3970
+   2589.4980   1502.4650     34.1965      2.3950
+   2590.4820   1502.4820     34.2033      2.3930
+   2591.5610   1502.5010     34.1965      2.3950
+   2592.3720   1502.5170     34.1949      2.3960
+   2593.3680   1502.5320     34.1904      2.3970
+   2594.3270   1502.5480     34.2026      2.3930
+   2595.3380   1502.5620     34.1965      2.3940
+   2596.4150   1502.5820     34.1782      2.4000
+   2597.2590   1502.5980     34.1988      2.3940
+   2598.3650   1502.6130     34.1957      2.3940
+   2599.2680   1502.6320     34.2110      2.3900
+   2600.2540   1502.6440     34.1881      2.3960
+   2601.1970   1502.6600     34.1942      2.3940
+   2602.2660   1502.6760     34.1927      2.3940
+   2603.2760   1502.6940     34.1927      2.3940
+   2604.1860   1502.7080     34.1980      2.3920
+   2605.1860   1502.7250     34.1980      2.3920
+   2606.1260   1502.7430     34.2018      2.3910
+   2607.0810   1502.7560     34.1965      2.3920
+   2608.0680   1502.7750     34.1942      2.3930
+   2609.1080   1502.7940     34.1888      2.3950
+   2610.0670   1502.8100     34.1980      2.3920
+   2611.0310   1502.8260     34.1881      2.3950
+   2612.0320   1502.8410     34.1888      2.3940
+   2613.0330   1502.8590     34.1896      2.3940
+   2614.0550   1502.8760     34.1957      2.3920
+   2614.9610   1502.8910     34.2018      2.3900
+   2616.0350   1502.9080     34.1873      2.3940
+   2617.0520   1502.9240     34.2026      2.3890
+   2617.9680   1502.9420     34.1911      2.3930
+   2618.9940   1502.9610     34.1919      2.3930
+   2619.9020   1502.9740     34.1934      2.3920
+   2620.9540   1502.9920     34.2026      2.3890
+   2621.8470   1503.0110     34.1927      2.3930
+   2622.8690   1503.0270     34.1911      2.3930
+   2623.9210   1503.0460     34.1949      2.3920
+   2624.8250   1503.0620     34.2018      2.3900
+   2625.8660   1503.0820     34.1965      2.3920
+   2626.8300   1503.1000     34.1911      2.3940
+   2627.7490   1503.1150     34.1904      2.3940
+   2628.7740   1503.1310     34.2056      2.3890
+   2629.8380   1503.1460     34.1835      2.3950
+   2630.8330   1503.1640     34.1934      2.3920
+   2631.7130   1503.1780     34.1995      2.3900
+   2632.6560   1503.1930     34.1919      2.3920
+   2633.7540   1503.2110     34.1881      2.3930
+   2634.7540   1503.2280     34.1843      2.3940
+   2635.6380   1503.2430     34.1972      2.3900
+   2636.6250   1503.2590     34.1927      2.3910
+   2637.6080   1503.2760     34.1995      2.3890
+   2638.6430   1503.2930     34.1888      2.3920
+   2639.6550   1503.3100     34.1789      2.3950
+   2640.6130   1503.3250     34.1812      2.3940
+   2641.6240   1503.3410     34.1995      2.3880
+   2642.6930   1503.3590     34.1888      2.3910
+   2643.5480   1503.3730     34.1919      2.3900
+   2644.4670   1503.3890     34.1820      2.3930
+   2645.4420   1503.4040     34.1934      2.3890
+   2646.5470   1503.4250     34.1980      2.3880
+   2647.4270   1503.4400     34.1980      2.3880
+   2648.4690   1503.4550     34.1927      2.3890
+   2649.3810   1503.4670     34.1866      2.3900
+   2650.4120   1503.4870     34.1812      2.3920
+   2651.4450   1503.5040     34.1843      2.3910
+   2652.3550   1503.5190     34.1934      2.3880
+   2653.3490   1503.5360     34.1965      2.3870
+   2654.3920   1503.5530     34.1957      2.3870
+   2655.3020   1503.5710     34.1972      2.3870
+   2656.3430   1503.5880     34.1900      2.3890
+   2657.3070   1503.6020     34.1850      2.3900
+   2658.3090   1503.6200     34.1980      2.3860
+   2659.3510   1503.6350     34.1991      2.3850
+   2660.2750   1503.6520     34.1934      2.3870
+   2661.1920   1503.6690     34.1942      2.3870
+   2662.2330   1503.6850     34.1896      2.3880
+   2663.3240   1503.7040     34.1957      2.3860
+   2664.2510   1503.7220     34.1972      2.3860
+   2665.1360   1503.7370     34.1904      2.3880
+   2666.1820   1503.7540     34.1896      2.3880
+   2667.1430   1503.7700     34.1766      2.3920
+   2668.1020   1503.7880     34.2064      2.3830
+   2669.0540   1503.8060     34.1820      2.3910
+   2670.1620   1503.8240     34.1904      2.3880
+   2671.0220   1503.8410     34.2049      2.3840
+   2672.0360   1503.8570     34.1942      2.3870
+   2673.0650   1503.8730     34.1827      2.3900
+   2673.9990   1503.8880     34.1858      2.3890
+   2675.0520   1503.9080     34.1904      2.3880
+   2676.0740   1503.9250     34.1866      2.3890
+   2677.0870   1503.9420     34.1888      2.3880
+   2677.9190   1503.9570     34.2026      2.3840
+   2678.9030   1503.9730     34.1888      2.3880
+   2679.9200   1503.9920     34.1927      2.3870
+   2681.0220   1504.0100     34.1888      2.3880
+   2681.8360   1504.0260     34.1965      2.3860
+   2682.8590   1504.0420     34.1957      2.3860
+   2683.8690   1504.0580     34.1843      2.3890
+   2684.8440   1504.0780     34.1965      2.3860
+   2685.8480   1504.0960     34.1873      2.3890
+   2686.7900   1504.1120     34.1805      2.3910
+   2687.9060   1504.1300     34.1927      2.3870
+   2688.8090   1504.1470     34.1972      2.3860
+   2689.7030   1504.1630     34.1873      2.3890
+   2690.7220   1504.1810     34.1881      2.3890
+   2691.7030   1504.1990     34.1980      2.3860
+   2692.6550   1504.2170     34.1965      2.3870
+   2693.7980   1504.2340     34.1843      2.3900
+   2694.7350   1504.2530     34.1827      2.3910
+   2695.6800   1504.2690     34.1858      2.3900
+   2696.7130   1504.2880     34.1995      2.3860
+   2697.6040   1504.3050     34.1942      2.3880
+   2698.6770   1504.3200     34.1888      2.3890
+   2699.6220   1504.3380     34.1927      2.3880
+   2700.6830   1504.3580     34.1911      2.3890
+   2701.5830   1504.3740     34.1911      2.3890
+   2702.5100   1504.3920     34.1866      2.3910
+   2703.4930   1504.4090     34.1927      2.3890
+   2704.5580   1504.4270     34.1888      2.3900
+   2705.4620   1504.4430     34.1858      2.3910
+   2706.4510   1504.4600     34.1858      2.3910
+   2707.4960   1504.4800     34.1873      2.3910
+   2708.4370   1504.4970     34.1942      2.3890
+   2709.3700   1504.5140     34.1888      2.3910
+   2710.4620   1504.5320     34.1911      2.3900
+   2711.3720   1504.5500     34.1957      2.3890
+   2712.3200   1504.5680     34.1904      2.3910
+   2713.3240   1504.5860     34.1942      2.3900
+   2714.3860   1504.6030     34.1866      2.3920
+   2715.3180   1504.6180     34.1827      2.3930
+   2716.3120   1504.6370     34.1774      2.3950
+   2717.2890   1504.6530     34.1835      2.3930
+   2718.2300   1504.6690     34.1896      2.3910
+   2719.3530   1504.6870     34.1881      2.3910
+   2720.3500   1504.7030     34.1873      2.3910
+   2721.2340   1504.7160     34.1957      2.3880
+   2722.2400   1504.7340     34.1927      2.3890
+   2723.2000   1504.7510     34.1896      2.3900
+   2724.1890   1504.7670     34.1988      2.3870
+   2725.2110   1504.7870     34.1934      2.3890
+   2726.1500   1504.8040     34.1972      2.3880
+   2727.2560   1504.8220     34.1866      2.3910
+   2728.0930   1504.8390     34.1919      2.3900
+   2729.0960   1504.8550     34.1911      2.3900
+   2730.0880   1504.8730     34.1820      2.3930
+   2731.0250   1504.8900     34.1888      2.3910
+   2732.0470   1504.9060     34.1873      2.3910
+   2733.1280   1504.9260     34.1980      2.3880
+   2734.0640   1504.9440     34.1896      2.3910
+   2734.9410   1504.9570     34.1942      2.3890
+   2736.0650   1504.9760     34.1942      2.3890
+   2737.0130   1504.9920     34.1934      2.3890
+   2737.9160   1505.0060     34.1858      2.3910
+   2738.8750   1505.0190     34.1896      2.3890
+   2739.8720   1505.0350     34.1949      2.3870
+   2740.8950   1505.0530     34.1827      2.3910
+   2741.8940   1505.0700     34.1919      2.3880
+   2742.8670   1505.0850     34.1843      2.3900
+   2743.8540   1505.1010     34.1705      2.3940
+   2744.8770   1505.1210     34.1881      2.3890
+   2745.8190   1505.1340     34.1858      2.3890
+   2746.7800   1505.1520     34.1995      2.3850
+   2747.7920   1505.1670     34.1881      2.3880
+   2748.7950   1505.1840     34.2041      2.3830
+   2749.7360   1505.2040     34.1873      2.3890
+   2750.8200   1505.2200     34.1980      2.3850
+   2751.7150   1505.2360     34.1980      2.3850
+   2752.7170   1505.2520     34.1812      2.3900
+   2753.6520   1505.2690     34.1911      2.3870
+   2754.6380   1505.2870     34.1888      2.3880
+   2755.6180   1505.3030     34.1782      2.3910
+   2756.6620   1505.3220     34.1888      2.3880
+   2757.6830   1505.3410     34.1866      2.3890
+   2758.5350   1505.3540     34.1820      2.3900
+   2759.6260   1505.3740     34.1858      2.3890
+   2760.5420   1505.3890     34.1850      2.3890
+   2761.6240   1505.4060     34.1965      2.3850
+   2762.4880   1505.4240     34.1957      2.3860
+   2763.4960   1505.4410     34.1957      2.3860
+   2764.4820   1505.4540     34.1797      2.3900
+   2765.4140   1505.4690     34.1881      2.3870
+   2766.4500   1505.4890     34.1927      2.3860
+   2767.4400   1505.5060     34.1827      2.3890
+   2768.4350   1505.5210     34.1843      2.3880
+   2769.3760   1505.5390     34.1858      2.3880
+   2770.3510   1505.5580     34.1942      2.3860
+   2771.3760   1505.5720     34.1812      2.3890
+   2772.4040   1505.5910     34.1888      2.3870
+   2773.2930   1505.6080     34.1835      2.3890
+   2774.3170   1505.6260     34.2064      2.3820
+   2775.2860   1505.6420     34.1766      2.3910
+   2776.2660   1505.6590     34.1927      2.3860
+   2777.2770   1505.6780     34.1873      2.3880
+   2778.1950   1505.6930     34.1797      2.3900
+   2779.2110   1505.7100     34.1896      2.3870
+   2780.2010   1505.7270     34.1827      2.3890
+   2781.2030   1505.7410     34.1866      2.3870
+   2782.2680   1505.7580     34.1919      2.3850
+   2783.2200   1505.7700     34.1888      2.3850
+   2784.0930   1505.7830     34.1835      2.3860
+   2785.1620   1505.7990     34.1911      2.3830
+   2786.0600   1505.8140     34.1881      2.3840
+   2787.1090   1505.8320     34.1911      2.3830
+   2788.0810   1505.8470     34.1927      2.3820
+   2789.1270   1505.8650     34.1927      2.3820
+   2789.9990   1505.8800     34.1858      2.3840
+   2791.0080   1505.8980     34.1866      2.3840
+   2792.0540   1505.9170     34.1869      2.3840
+   2793.0160   1505.9330     34.1896      2.3830
+   2794.0130   1505.9490     34.1949      2.3810
+   2794.9240   1505.9630     34.1774      2.3860
+   2795.9400   1505.9800     34.1995      2.3790
+   2797.0200   1505.9990     34.1904      2.3820
+   2798.0380   1506.0120     34.1835      2.3830
+   2798.8440   1506.0270     34.1904      2.3810
+   2799.8460   1506.0430     34.1835      2.3830
+   2800.8380   1506.0600     34.1866      2.3820
+   2801.8420   1506.0760     34.1919      2.3800
+   2802.8020   1506.0960     34.1873      2.3820
+   2803.8690   1506.1150     34.1942      2.3800
+   2804.8020   1506.1290     34.1827      2.3830
+   2805.8100   1506.1470     34.1866      2.3820
+   2806.7240   1506.1610     34.1888      2.3810
+   2807.6930   1506.1770     34.1812      2.3830
+   2808.7490   1506.1930     34.1957      2.3780
+   2809.6960   1506.2120     34.1911      2.3800
+   2810.6400   1506.2270     34.1965      2.3780
+   2811.6600   1506.2440     34.2026      2.3760
+   2812.6600   1506.2620     34.1995      2.3770
+   2813.6030   1506.2780     34.1866      2.3810
+   2814.5830   1506.2940     34.1827      2.3820
+   2815.5660   1506.3090     34.1873      2.3800
+   2816.5450   1506.3280     34.1858      2.3810
+   2817.5980   1506.3460     34.1888      2.3800
+   2818.5080   1506.3610     34.1911      2.3790
+   2819.5660   1506.3770     34.1896      2.3790
+   2820.4790   1506.3950     34.1942      2.3780
+   2821.4850   1506.4120     34.1972      2.3770
+   2822.5000   1506.4300     34.1942      2.3780
+   2823.4920   1506.4450     34.1797      2.3820
+   2824.5050   1506.4630     34.1896      2.3790
+   2825.4790   1506.4800     34.1835      2.3810
+   2826.4560   1506.4980     34.2003      2.3760
+   2827.3550   1506.5140     34.1843      2.3810
+   2828.3380   1506.5330     34.1888      2.3800
+   2829.4090   1506.5510     34.1919      2.3790
+   2830.2920   1506.5650     34.1942      2.3780
+   2831.2730   1506.5840     34.1759      2.3840
+   2832.3600   1506.6020     34.2010      2.3760
+   2833.3290   1506.6190     34.1881      2.3800
+   2834.3370   1506.6360     34.1911      2.3790
+   2835.2930   1506.6550     34.1934      2.3790
+   2836.2000   1506.6730     34.1850      2.3820
+   2837.1910   1506.6890     34.1904      2.3800
+   2838.2420   1506.7060     34.1896      2.3800
+   2839.1980   1506.7220     34.1957      2.3780
+   2840.1290   1506.7400     34.1805      2.3830
+   2841.1840   1506.7610     34.1927      2.3800
+   2842.1540   1506.7770     34.1888      2.3810
+   2843.1310   1506.7940     34.1820      2.3830
+   2844.0660   1506.8100     34.1820      2.3830
+   2845.0600   1506.8280     34.1957      2.3790
+   2846.0350   1506.8460     34.1927      2.3800
+   2847.0000   1506.8640     34.1972      2.3790
+   2848.0000   1506.8790     34.1858      2.3820
+   2849.0320   1506.8970     34.1888      2.3810
+   2850.0320   1506.9150     34.1858      2.3820
+   2850.9640   1506.9310     34.1858      2.3820
+   2851.9110   1506.9460     34.1980      2.3780
+   2852.9030   1506.9650     34.1797      2.3840
+   2853.9640   1506.9840     34.1835      2.3830
+   2854.9200   1507.0030     34.1919      2.3810
+   2855.8830   1507.0180     34.1805      2.3840
+   2856.8890   1507.0360     34.1873      2.3820
+   2857.8660   1507.0540     34.2045      2.3770
+   2858.8740   1507.0730     34.1957      2.3800
+   2859.9190   1507.0890     34.1942      2.3800
+   2860.9130   1507.1090     34.1896      2.3820
+   2861.7880   1507.1260     34.1881      2.3830
+   2862.8250   1507.1400     34.1881      2.3820
+   2863.7390   1507.1560     34.1911      2.3810
+   2864.6910   1507.1720     34.1782      2.3850
+   2865.7440   1507.1930     34.1766      2.3860
+   2866.7040   1507.2090     34.1858      2.3830
+   2867.6340   1507.2270     34.1843      2.3840
+   2868.6860   1507.2460     34.1911      2.3820
+   2869.6630   1507.2630     34.1881      2.3830
+   2870.5870   1507.2800     34.1888      2.3830
+   2871.6230   1507.2960     34.1934      2.3810
+   2872.6390   1507.3130     34.1835      2.3840
+   2873.5920   1507.3290     34.1858      2.3830
+   2874.5540   1507.3470     34.1873      2.3830
+   2875.5290   1507.3640     34.1835      2.3840
+   2876.6300   1507.3820     34.1766      2.3860
+   2877.5860   1507.4010     34.1942      2.3810
+   2878.5390   1507.4180     34.1919      2.3820
+   2879.4300   1507.4310     34.1927      2.3810
+   2880.5190   1507.4510     34.1843      2.3840
+   2881.4420   1507.4660     34.1835      2.3840
+   2882.4610   1507.4840     34.1866      2.3830
+   2883.4800   1507.5020     34.1866      2.3830
+   2884.3440   1507.5180     34.1873      2.3830
+   2885.4030   1507.5370     34.1850      2.3840
+   2886.3390   1507.5520     34.1904      2.3820
+   2887.3600   1507.5720     34.1858      2.3840
+   2888.3170   1507.5890     34.1919      2.3820
+   2889.2630   1507.6020     34.2026      2.3780
+   2890.2820   1507.6210     34.1904      2.3820
+   2891.2450   1507.6360     34.1827      2.3840
+   2892.1990   1507.6480     34.1888      2.3810
+   2893.2070   1507.6660     34.1797      2.3840
+   2894.3060   1507.6860     34.1866      2.3820
+   2895.1940   1507.7020     34.1972      2.3790
+   2896.1300   1507.7170     34.1927      2.3800
+   2897.1590   1507.7320     34.1843      2.3820
+   2898.1200   1507.7510     34.1789      2.3840
+   2899.1320   1507.7680     34.1789      2.3840
+   2900.1260   1507.7840     34.1873      2.3810
+   2901.1980   1507.8050     34.1896      2.3810
+   2902.1890   1507.8210     34.1850      2.3820
+   2903.1060   1507.8390     34.1995      2.3780
+   2904.0390   1507.8550     34.1835      2.3830
+   2904.9830   1507.8690     34.1846      2.3820
+   2905.9980   1507.8870     34.1850      2.3820
+   2907.0040   1507.9050     34.1949      2.3790
+   2908.0450   1507.9260     34.1812      2.3840
+   2909.0480   1507.9440     34.1911      2.3810
+   2909.9740   1507.9590     34.1904      2.3810
+   2910.9310   1507.9760     34.1904      2.3810
+   2911.8610   1507.9920     34.1969      2.3790
+   2912.8810   1508.0090     34.1896      2.3810
+   2913.8290   1508.0240     34.1789      2.3840
+   2914.8630   1508.0440     34.1904      2.3810
+   2915.9200   1508.0630     34.2033      2.3770
+   2916.9530   1508.0790     34.1827      2.3830
+   2917.7730   1508.0960     34.1911      2.3810
+   2918.7300   1508.1130     34.1850      2.3830
+   2919.7340   1508.1290     34.1934      2.3800
+   2920.7240   1508.1470     34.1812      2.3840
+   2921.7350   1508.1650     34.2010      2.3780
+   2922.6590   1508.1830     34.1858      2.3830
+   2923.7600   1508.2000     34.1843      2.3830
+   2924.7520   1508.2180     34.1881      2.3820
+   2925.6650   1508.2340     34.1919      2.3810
+   2926.6640   1508.2510     34.1850      2.3830
+   2927.6490   1508.2670     34.1873      2.3820
+   2928.7290   1508.2870     34.1881      2.3820
+   2929.7270   1508.3030     34.1934      2.3800
+   2930.5270   1508.3190     34.1820      2.3840
+   2931.5660   1508.3370     34.1919      2.3810
+   2932.6170   1508.3550     34.1980      2.3790
+   2933.5750   1508.3730     34.1797      2.3850
+   2934.5160   1508.3910     34.1972      2.3800
+   2935.4800   1508.4070     34.1835      2.3840
+   2936.4760   1508.4260     34.1850      2.3840
+   2937.4060   1508.4400     34.1927      2.3810
+   2938.3990   1508.4600     34.1919      2.3820
+   2939.4900   1508.4780     34.1942      2.3810
+   2940.4250   1508.4940     34.1873      2.3830
+   2941.3980   1508.5100     34.1866      2.3830
+   2942.3830   1508.5280     34.1904      2.3820
+   2943.4210   1508.5470     34.1911      2.3820
+   2944.3400   1508.5630     34.1812      2.3850
+   2945.3770   1508.5790     34.1736      2.3870
+   2946.2660   1508.5970     34.1919      2.3820
+   2947.2710   1508.6150     34.1858      2.3840
+   2948.2550   1508.6310     34.1812      2.3850
+   2949.2180   1508.6460     34.1835      2.3840
+   2950.1870   1508.6620     34.1888      2.3820
+   2951.1820   1508.6820     34.1812      2.3850
+   2952.3250   1508.7010     34.1873      2.3830
+   2953.2180   1508.7160     34.1866      2.3830
+   2954.1460   1508.7330     34.1843      2.3840
+   2955.1210   1508.7500     34.1812      2.3850
+   2956.1240   1508.7670     34.1805      2.3850
+   2957.1470   1508.7860     34.1850      2.3840
+   2958.1140   1508.8050     34.1995      2.3800
+   2959.1130   1508.8230     34.1805      2.3860
+   2960.1700   1508.8390     34.1782      2.3860
+   2960.9960   1508.8560     34.1835      2.3850
+   2961.9940   1508.8710     34.1919      2.3820
+   2962.9640   1508.8870     34.1873      2.3830
+   2964.0300   1508.9080     34.1896      2.3830
+   2964.9100   1508.9230     34.1927      2.3820
+   2965.8850   1508.9420     34.1904      2.3830
+   2966.9690   1508.9600     34.1866      2.3840
+   2967.9070   1508.9770     34.1873      2.3840
+   2968.8680   1508.9940     34.1774      2.3870
+   2969.9290   1509.0120     34.1873      2.3840
+   2970.9170   1509.0300     34.1942      2.3820
+   2971.8020   1509.0460     34.1881      2.3840
+   2972.8150   1509.0640     34.1949      2.3820
+   2973.7430   1509.0800     34.1919      2.3830
+   2974.7270   1509.0980     34.1919      2.3830
+   2975.7360   1509.1170     34.1904      2.3840
+   2976.7110   1509.1350     34.1812      2.3870
+   2977.6960   1509.1490     34.1820      2.3860
+   2978.7450   1509.1700     34.1873      2.3850
+   2979.7390   1509.1880     34.1812      2.3870
+   2980.7330   1509.2050     34.1873      2.3850
+   2981.6300   1509.2230     34.1858      2.3860
+   2982.5960   1509.2390     34.1789      2.3880
+   2983.6430   1509.2600     34.1843      2.3870
+   2984.6650   1509.2760     34.1896      2.3850
+   2985.5700   1509.2920     34.1866      2.3860
+   2986.5790   1509.3130     34.1759      2.3900
+   2987.5220   1509.3280     34.1747      2.3900
+   2988.5670   1509.3470     34.1949      2.3840
+   2989.4880   1509.3640     34.1827      2.3880
+   2990.4420   1509.3810     34.1927      2.3850
+   2991.4460   1509.3990     34.1835      2.3880
+   2992.4040   1509.4170     34.1904      2.3860
+   2993.4800   1509.4320     34.1812      2.3880
+   2994.3920   1509.4480     34.1881      2.3860
+   2995.4290   1509.4660     34.1843      2.3870
+   2996.4780   1509.4880     34.1843      2.3880
+   2997.3630   1509.5010     34.1888      2.3860
+   2998.4000   1509.5200     34.1827      2.3880
+   2999.3290   1509.5380     34.1873      2.3870
+   3000.2870   1509.5540     34.1904      2.3860
+   3001.3270   1509.5720     34.1873      2.3870
+   3002.2730   1509.5880     34.1934      2.3850
+   3003.2600   1509.6060     34.1873      2.3870
+   3004.2850   1509.6250     34.1850      2.3880
+   3005.2070   1509.6410     34.1850      2.3880
+   3006.2330   1509.6590     34.1816      2.3890
+   3007.3000   1509.6770     34.1812      2.3890
+   3008.1550   1509.6940     34.1759      2.3910
+   3009.1140   1509.7120     34.1934      2.3860
+   3010.0910   1509.7270     34.1759      2.3910
+   3011.1570   1509.7440     34.1904      2.3860
+   3012.2130   1509.7640     34.1850      2.3880
+   3013.0320   1509.7790     34.1888      2.3870
+   3014.0160   1509.7970     34.1805      2.3900
+   3015.0290   1509.8130     34.1759      2.3910
+   3016.0200   1509.8320     34.1866      2.3880
+   3017.0090   1509.8490     34.1797      2.3900
+   3017.9860   1509.8650     34.1827      2.3890
+   3019.0180   1509.8840     34.1766      2.3910
+   3019.9870   1509.9020     34.1873      2.3880
+   3020.9340   1509.9170     34.1858      2.3880
+   3021.9240   1509.9340     34.1988      2.3840
+   3022.8880   1509.9510     34.1957      2.3850
+   3023.9070   1509.9670     34.1942      2.3850
+   3024.8470   1509.9830     34.1843      2.3880
+   3025.8200   1509.9980     34.1827      2.3880
+   3026.8110   1510.0140     34.1789      2.3890
+   3027.7900   1510.0290     34.1995      2.3820
+   3028.7760   1510.0490     34.1888      2.3860
+   3029.7280   1510.0640     34.1843      2.3870
+   3030.7720   1510.0830     34.1820      2.3880
+   3031.6950   1510.1000     34.1858      2.3870
+   3032.7410   1510.1190     34.1866      2.3870
+   3033.7430   1510.1390     34.1850      2.3880
+   3034.6580   1510.1520     34.1927      2.3850
+   3035.7010   1510.1710     34.1835      2.3880
+   3036.6650   1510.1890     34.1812      2.3890
+   3037.7530   1510.2080     34.1911      2.3860
+   3038.6860   1510.2250     34.1850      2.3880
+   3039.6120   1510.2450     34.1972      2.3850
+   3040.6050   1510.2610     34.1805      2.3900
+   3041.5520   1510.2880     34.1881      2.3900
+   3042.4980   1510.3040     34.1942      2.3880
+   3043.4930   1510.3220     34.1911      2.3890
+   3044.5150   1510.3420     34.1934      2.3890
+   3045.4730   1510.3570     34.1820      2.3920
+   3046.4270   1510.3760     34.2064      2.3850
+   3047.4560   1510.3960     34.1988      2.3880
+   3048.4470   1510.4120     34.1911      2.3900
+   3049.4620   1510.4290     34.2003      2.3870
+   3050.4550   1510.4470     34.1911      2.3900
+   3051.3310   1510.4610     34.2064      2.3850
+   3052.3600   1510.4810     34.1980      2.3880
+   3053.3630   1510.4970     34.1904      2.3900
+   3054.3880   1510.5180     34.1927      2.3900
+   3055.3560   1510.5340     34.1949      2.3890
+   3056.2390   1510.5480     34.1942      2.3890
+   3057.2740   1510.5660     34.1812      2.3930
+   3058.3060   1510.5830     34.1835      2.3920
+   3059.3560   1510.5990     34.1919      2.3890
+   3060.2900   1510.6120     34.1858      2.3900
+   3061.2200   1510.6310     34.1911      2.3890
+   3062.1290   1510.6440     34.1927      2.3880
+   3063.1520   1510.6630     34.1934      2.3880
+   3064.1320   1510.6800     34.1896      2.3890
+   3065.1150   1510.6970     34.1797      2.3920
+   3066.0780   1510.7140     34.1805      2.3920
+   3067.1930   1510.7320     34.1858      2.3900
+   3068.1650   1510.7490     34.1789      2.3920
+   3069.0480   1510.7680     34.1850      2.3910
+   3070.0380   1510.7840     34.1774      2.3930
+   3070.9960   1510.8000     34.1934      2.3880
+   3071.9490   1510.8180     34.1782      2.3930
+   3072.9830   1510.8380     34.1858      2.3910
+   3073.9500   1510.8530     34.1881      2.3900
+   3074.8980   1510.8670     34.1888      2.3890
+   3075.9590   1510.8870     34.1873      2.3900
+   3076.9540   1510.9060     34.1949      2.3880
+   3078.0030   1510.9240     34.1850      2.3910
+   3078.9290   1510.9430     34.1835      2.3920
+   3079.9500   1510.9590     34.1789      2.3930
+   3080.8390   1510.9760     34.1896      2.3900
+   3081.8360   1510.9930     34.1797      2.3930
+   3082.7750   1511.0100     34.1934      2.3890
+   3083.7870   1511.0280     34.1934      2.3890
+   3084.8940   1511.0460     34.1827      2.3920
+   3085.7910   1511.0630     34.1873      2.3910
+   3086.7790   1511.0810     34.1743      2.3950
+   3087.6700   1511.0960     34.1843      2.3920
+   3088.7440   1511.1150     34.1972      2.3880
+   3089.6970   1511.1330     34.1850      2.3920
+   3090.6700   1511.1490     34.1782      2.3940
+   3091.6570   1511.1650     34.1904      2.3900
+   3092.5990   1511.1800     34.1858      2.3910
+   3093.5610   1511.1990     34.1812      2.3930
+   3094.5890   1511.2170     34.1942      2.3890
+   3095.6290   1511.2350     34.1873      2.3910
+   3096.5240   1511.2490     34.1858      2.3910
+   3097.5370   1511.2680     34.1873      2.3910
+   3098.5560   1511.2840     34.1759      2.3940
+   3099.5760   1511.3030     34.1835      2.3920
+   3100.5170   1511.3200     34.1904      2.3900
+   3101.4440   1511.3380     34.1820      2.3930
+   3102.4470   1511.3540     34.1843      2.3920
+   3103.3740   1511.3700     34.1904      2.3900
+   3104.4580   1511.3870     34.1789      2.3930
+   3105.4280   1511.4050     34.1835      2.3920
+   3106.3610   1511.4220     34.1965      2.3880
+   3107.4220   1511.4370     34.1812      2.3920
+   3108.3900   1511.4550     34.1881      2.3900
+   3109.2680   1511.4720     34.1866      2.3910
+   3110.3090   1511.4910     34.1774      2.3940
+   3111.2400   1511.5060     34.1827      2.3920
+   3112.2340   1511.5240     34.1896      2.3900
+   3113.3150   1511.5420     34.1858      2.3910
+   3114.2420   1511.5560     34.1812      2.3920
+   3115.1960   1511.5730     34.1812      2.3920
+   3116.2610   1511.5920     34.1812      2.3920
+   3117.1280   1511.6080     34.1820      2.3920
+   3118.1520   1511.6240     34.1774      2.3930
+   3119.1310   1511.6410     34.1904      2.3890
+   3120.1580   1511.6600     34.1782      2.3930
+   3121.1100   1511.6760     34.1904      2.3890
+   3122.1000   1511.6910     34.1919      2.3880
+   3123.1090   1511.7100     34.1770      2.3930
+   3123.9810   1511.7210     34.1805      2.3910
+   3124.9690   1511.7380     34.1866      2.3890
+   3126.0880   1511.7580     34.1934      2.3870
+   3127.0760   1511.7760     34.1904      2.3880
+   3127.9600   1511.7920     34.1812      2.3910
+   3128.9520   1511.8080     34.1774      2.3920
+   3129.9750   1511.8240     34.1858      2.3890
+   3130.8550   1511.8410     34.1835      2.3900
+   3131.9260   1511.8560     34.1805      2.3900
+   3132.8990   1511.8730     34.1774      2.3910
+   3133.8620   1511.8870     34.1820      2.3890
+   3134.8930   1511.9030     34.1866      2.3870
+   3135.8860   1511.9210     34.1713      2.3920
+   3136.7650   1511.9380     34.1690      2.3930
+   3137.8070   1511.9550     34.1873      2.3870
+   3138.7330   1511.9680     34.1789      2.3890
+   3139.7080   1511.9890     34.1911      2.3860
+   3140.7770   1512.0080     34.1751      2.3910
+   3141.7260   1512.0230     34.1843      2.3880
+   3142.7060   1512.0390     34.1896      2.3860
+   3143.6140   1512.0580     34.1820      2.3890
+   3144.6150   1512.0780     34.1942      2.3860
+   3145.7520   1512.0950     34.1850      2.3880
+   3146.6990   1512.1150     34.1782      2.3910
+   3147.5670   1512.1290     34.1904      2.3870
+   3148.5750   1512.1460     34.1866      2.3880
+   3149.5310   1512.1630     34.1805      2.3900
+   3150.5570   1512.1830     34.1850      2.3890
+   3151.5000   1512.1990     34.1911      2.3870
+   3152.4840   1512.2140     34.1827      2.3890
+   3153.4900   1512.2340     34.1911      2.3870
+   3154.4220   1512.2530     34.1934      2.3870
+   3155.4420   1512.2690     34.1888      2.3880
+   3156.4610   1512.2860     34.1881      2.3880
+   3157.4200   1512.3020     34.1873      2.3880
+   3158.3360   1512.3190     34.1911      2.3870
+   3159.5290   1512.3390     34.1873      2.3880
+   3160.3090   1512.3550     34.1858      2.3890
+   3161.3770   1512.3740     34.1866      2.3890
+   3162.3240   1512.3920     34.1904      2.3880
+   3163.3240   1512.4090     34.1873      2.3890
+   3164.2710   1512.4260     34.1713      2.3940
+   3165.2420   1512.4420     34.1896      2.3880
+   3166.3010   1512.4600     34.1736      2.3930
+   3167.2420   1512.4790     34.1751      2.3930
+   3168.2610   1512.4960     34.1782      2.3920
+   3169.2050   1512.5130     34.1812      2.3910
+   3170.1480   1512.5320     34.1805      2.3920
+   3171.1670   1512.5470     34.1942      2.3870
+   3172.2050   1512.5640     34.1835      2.3900
+   3173.1610   1512.5830     34.1850      2.3900
+   3174.0500   1512.5990     34.1827      2.3910
+   3175.1770   1512.6190     34.1728      2.3940
+   3176.1110   1512.6370     34.1805      2.3920
+   3177.0890   1512.6540     34.1873      2.3900
+   3177.9900   1512.6700     34.1843      2.3910
+   3178.9600   1512.6880     34.1782      2.3930
+   3180.0410   1512.7070     34.1850      2.3910
+   3180.9620   1512.7240     34.1949      2.3880
+   3181.9800   1512.7410     34.1751      2.3940
+   3182.9670   1512.7580     34.1850      2.3910
+   3183.9190   1512.7760     34.1827      2.3920
+   3184.8820   1512.7930     34.1927      2.3890
+   3185.8470   1512.8090     34.1789      2.3930
+   3186.8010   1512.8270     34.1827      2.3920
+   3187.8090   1512.8460     34.1873      2.3910
+   3188.8070   1512.8630     34.1835      2.3920
+   3189.7590   1512.8800     34.1843      2.3920
+   3190.7450   1512.8950     34.1858      2.3910
+   3191.7530   1512.9150     34.1843      2.3920
+   3192.6980   1512.9330     34.1850      2.3920
+   3193.8140   1512.9530     34.1820      2.3930
+   3194.7460   1512.9700     34.1858      2.3920
+   3195.6410   1512.9880     34.1911      2.3910
+   3196.6930   1513.0050     34.1866      2.3920
+   3197.7330   1513.0220     34.1827      2.3930
+   3198.6180   1513.0370     34.1789      2.3940
+   3199.7000   1513.0590     34.1843      2.3930
+   3200.6580   1513.0750     34.1805      2.3940
+   3201.6310   1513.0960     34.1805      2.3950
+   3202.5250   1513.1120     34.1904      2.3920
+   3203.5870   1513.1290     34.1827      2.3940
+   3204.5030   1513.1460     34.1835      2.3940
+   3205.5110   1513.1630     34.1896      2.3920
+   3206.4720   1513.1790     34.1919      2.3910
+   3207.5000   1513.1980     34.1835      2.3940
+   3208.4960   1513.2150     34.1827      2.3940
+   3209.3930   1513.2320     34.1873      2.3930
+   3210.3580   1513.2470     34.1919      2.3910
+   3211.3960   1513.2680     34.1881      2.3930
+   3212.4140   1513.2860     34.1850      2.3940
+   3213.3010   1513.2990     34.1827      2.3940
+   3214.2990   1513.3180     34.1774      2.3960
+   3215.3180   1513.3380     34.1888      2.3930
+   3216.2580   1513.3540     34.1820      2.3950
+   3217.3270   1513.3720     34.1782      2.3960
+   3218.2870   1513.3890     34.1850      2.3940
+   3219.2190   1513.4050     34.1881      2.3930
+   3220.2090   1513.4220     34.1843      2.3940
+   3221.1890   1513.4400     34.1881      2.3930
+   3222.2290   1513.4570     34.1904      2.3920
+   3223.1330   1513.4740     34.1881      2.3930
+   3224.1420   1513.4940     34.1904      2.3930
+   3225.1390   1513.5070     34.1835      2.3940
+   3226.1020   1513.5280     34.1896      2.3930
+   3227.0720   1513.5430     34.1820      2.3950
+   3228.0550   1513.5620     34.1927      2.3920
+   3229.0330   1513.5790     34.1896      2.3930
+   3230.0510   1513.5970     34.1805      2.3960
+   3231.0570   1513.6150     34.1805      2.3960
+   3232.0000   1513.6320     34.1805      2.3960
+   3232.9950   1513.6490     34.1774      2.3970
+   3233.9820   1513.6670     34.1812      2.3960
+   3234.8880   1513.6810     34.1858      2.3940
+   3235.8760   1513.7010     34.1850      2.3950
+   3236.9220   1513.7200     34.1850      2.3950
+   3237.9460   1513.7350     34.1995      2.3900
+   3238.8060   1513.7510     34.1904      2.3930
+   3239.8360   1513.7710     34.1789      2.3970
+   3240.8600   1513.7890     34.1888      2.3940
+   3241.7680   1513.8040     34.1850      2.3950
+   3242.7890   1513.8240     34.1797      2.3970
+   3243.7320   1513.8430     34.1785      2.3980
+   3244.7970   1513.8610     34.1881      2.3950
+   3245.6910   1513.8750     34.1896      2.3940
+   3246.7590   1513.8940     34.1805      2.3970
+   3247.6490   1513.9090     34.1866      2.3950
+   3248.7860   1513.9290     34.1866      2.3950
+   3249.8260   1513.9480     34.1835      2.3960
+   3250.5950   1513.9650     34.1835      2.3970
+   3251.6990   1513.9810     34.1873      2.3950
+   3252.5650   1513.9970     34.1782      2.3980
+   3253.6660   1514.0150     34.1835      2.3960
+   3254.5640   1514.0310     34.1774      2.3980
+   3255.4980   1514.0490     34.1751      2.3990
+   3256.5760   1514.0680     34.1789      2.3980
+   3257.5600   1514.0860     34.1759      2.3990
+   3258.5340   1514.1030     34.1988      2.3920
+   3259.4670   1514.1180     34.1751      2.3990
+   3260.4260   1514.1370     34.1896      2.3950
+   3261.4220   1514.1530     34.1789      2.3980
+   3262.4060   1514.1690     34.1873      2.3950
+   3263.4630   1514.1870     34.1843      2.3960
+   3264.5030   1514.2030     34.1888      2.3940
+   3265.3840   1514.2210     34.1904      2.3940
+   3266.3200   1514.2360     34.1965      2.3920
+   3267.3120   1514.2530     34.1797      2.3970
+   3268.3490   1514.2700     34.1820      2.3960
+   3269.3350   1514.2860     34.1812      2.3960
+   3270.2030   1514.3020     34.1820      2.3960
+   3271.1940   1514.3180     34.1705      2.3990
+   3272.2750   1514.3350     34.1888      2.3930
+   3273.1580   1514.3510     34.1858      2.3940
+   3274.1790   1514.3670     34.1812      2.3950
+   3275.1690   1514.3830     34.1835      2.3940
+   3276.1430   1514.4010     34.1812      2.3950
+   3277.1760   1514.4210     34.1789      2.3960
+   3278.1320   1514.4370     34.1820      2.3950
+   3279.1240   1514.4540     34.1820      2.3950
+   3280.1070   1514.4720     34.1858      2.3940
+   3281.0320   1514.4890     34.1896      2.3930
+   3282.0540   1514.5050     34.1881      2.3930
+   3283.0590   1514.5220     34.1812      2.3950
+   3283.9600   1514.5380     34.1843      2.3940
+   3285.0300   1514.5550     34.1797      2.3950
+   3285.9540   1514.5710     34.1927      2.3910
+   3286.9200   1514.5900     34.1942      2.3910
+   3287.9230   1514.6050     34.1793      2.3950
+   3288.8550   1514.6210     34.1789      2.3950
+   3289.9350   1514.6420     34.1904      2.3920
+   3290.8800   1514.6610     34.1827      2.3950
+   3291.8250   1514.6780     34.1766      2.3970
+   3292.8190   1514.6950     34.1858      2.3940
+   3293.8530   1514.7120     34.1820      2.3950
+   3294.7530   1514.7270     34.1873      2.3930
+   3295.7150   1514.7450     34.1919      2.3920
+   3296.8040   1514.7630     34.1873      2.3930
+   3297.7620   1514.7810     34.1850      2.3940
+   3298.6620   1514.7960     34.1911      2.3920
+   3299.6480   1514.8130     34.1843      2.3940
+   3300.6160   1514.8290     34.1835      2.3940
+   3301.7040   1514.8490     34.1911      2.3920
+   3302.5800   1514.8670     34.1965      2.3910
+   3303.6000   1514.8810     34.1866      2.3930
+   3304.6890   1514.8980     34.1820      2.3940
+   3305.5620   1514.9150     34.1866      2.3930
+   3306.5940   1514.9340     34.1805      2.3950
+   3307.5060   1514.9510     34.1942      2.3910
+   3308.5080   1514.9680     34.1812      2.3950
+   3309.5080   1514.9880     34.1896      2.3930
+   3310.5230   1515.0050     34.1820      2.3950
+   3311.4700   1515.0200     34.1873      2.3930
+   3312.4990   1515.0370     34.1866      2.3930
+   3313.3890   1515.0560     34.1927      2.3920
+   3314.4540   1515.0720     34.1843      2.3940
+   3315.4200   1515.0900     34.1850      2.3940
+   3316.3850   1515.1070     34.1850      2.3940
+   3317.3710   1515.1230     34.1805      2.3950
+   3318.3530   1515.1390     34.1835      2.3940
+   3319.3760   1515.1570     34.1927      2.3910
+   3320.3190   1515.1720     34.1919      2.3910
+   3321.3060   1515.1900     34.1827      2.3940
+   3322.2090   1515.2060     34.1797      2.3950
+   3323.2520   1515.2230     34.1949      2.3900
+   3324.1810   1515.2410     34.1827      2.3940
+   3325.1440   1515.2580     34.1766      2.3960
+   3326.1290   1515.2760     34.1866      2.3930
+   3327.2600   1515.2960     34.1904      2.3920
+   3328.0980   1515.3100     34.1797      2.3950
+   3329.0810   1515.3240     34.1774      2.3950
+   3330.0730   1515.3450     34.1736      2.3970
+   3331.1730   1515.3640     34.1934      2.3910
+   3332.0670   1515.3810     34.1873      2.3930
+   3333.1110   1515.4000     34.1782      2.3960
+   3334.0250   1515.4150     34.1774      2.3960
+   3334.9930   1515.4340     34.1919      2.3920
+   3335.9500   1515.4500     34.1850      2.3940
+   3336.9820   1515.4640     34.1660      2.3990
+   3337.9630   1515.4810     34.1820      2.3940
+   3338.9010   1515.4970     34.1782      2.3950
+   3339.9440   1515.5150     34.1881      2.3920
+   3340.8850   1515.5330     34.1858      2.3930
+   3341.9100   1515.5500     34.1911      2.3910
+   3342.8100   1515.5680     34.1896      2.3920
+   3343.8270   1515.5840     34.1820      2.3940
+   3344.8000   1515.6040     34.1774      2.3960
+   3345.7630   1515.6200     34.1766      2.3960
+   3346.7160   1515.6380     34.1911      2.3920
+   3347.7400   1515.6540     34.1896      2.3920
+   3348.7900   1515.6760     34.1789      2.3960
+   3349.6930   1515.6910     34.1789      2.3960
+   3350.6860   1515.7080     34.1881      2.3930
+   3351.6370   1515.7250     34.1782      2.3960
+   3352.6660   1515.7440     34.1888      2.3930
+   3353.5960   1515.7570     34.1797      2.3950
+   3354.6040   1515.7770     34.1782      2.3960
+   3355.5720   1515.7960     34.1927      2.3920
+   3356.5520   1515.8140     34.1835      2.3950
+   3357.5600   1515.8310     34.1896      2.3930
+   3358.5970   1515.8520     34.1789      2.3970
+   3359.4900   1515.8680     34.1888      2.3940
+   3360.5330   1515.8850     34.1850      2.3950
+   3361.4540   1515.9020     34.1789      2.3970
+   3362.4840   1515.9210     34.1896      2.3940
+   3363.4330   1515.9380     34.1797      2.3970
+   3364.4500   1515.9570     34.1904      2.3940
+   3365.3980   1515.9750     34.1850      2.3960
+   3366.3340   1515.9920     34.1858      2.3960
+   3367.3140   1516.0090     34.1820      2.3970
+   3368.3530   1516.0270     34.1820      2.3970
+   3369.3510   1516.0430     34.1843      2.3960
+   3370.2660   1516.0600     34.1850      2.3960
+   3371.3140   1516.0800     34.1827      2.3970
+   3372.2750   1516.0980     34.1774      2.3990
+   3373.2990   1516.1160     34.1835      2.3970
+   3374.1730   1516.1310     34.1866      2.3960
+   3375.2370   1516.1510     34.1782      2.3990
+   3376.2980   1516.1680     34.1835      2.3970
+   3377.2100   1516.1850     34.1743      2.4000
+   3378.1600   1516.2050     34.1797      2.3990
+   3379.0900   1516.2220     34.1805      2.3990
+   3380.1140   1516.2400     34.1934      2.3950
+   3381.1960   1516.2590     34.1705      2.4020
+   3382.1050   1516.2760     34.1881      2.3970
+   3383.0830   1516.2940     34.1820      2.3990
+   3384.0720   1516.3100     34.1812      2.3990
+   3385.0440   1516.3270     34.1812      2.3990
+   3386.0990   1516.3440     34.1896      2.3960
+   3387.0490   1516.3640     34.1888      2.3970
+   3387.9500   1516.3790     34.1850      2.3980
+   3388.9170   1516.3960     34.1782      2.4000
+   3389.9450   1516.4140     34.1942      2.3950
+   3390.8810   1516.4320     34.1827      2.3990
+   3391.9340   1516.4500     34.1888      2.3970
+   3392.8280   1516.4670     34.1835      2.3990
+   3393.7930   1516.4850     34.1904      2.3970
+   3394.7680   1516.4980     34.1682      2.4030
+   3395.7890   1516.5170     34.1949      2.3950
+   3396.7720   1516.5330     34.1904      2.3960
+   3397.8250   1516.5530     34.1888      2.3970
+   3398.7570   1516.5700     34.1957      2.3950
+   3399.7640   1516.5870     34.1850      2.3980
+   3400.7400   1516.6040     34.1850      2.3980
+   3401.6520   1516.6210     34.1797      2.4000
+   3402.7530   1516.6400     34.1858      2.3980
+   3403.5910   1516.6560     34.1896      2.3970
+   3404.6230   1516.6750     34.1812      2.4000
+   3405.5740   1516.6910     34.1736      2.4020
+   3406.5620   1516.7100     34.1850      2.3990
+   3407.5520   1516.7260     34.1904      2.3970
+   3408.5940   1516.7450     34.1942      2.3960
+   3409.5400   1516.7620     34.1782      2.4010
+   3410.5260   1516.7780     34.1835      2.3990
+   3411.4630   1516.7920     34.1850      2.3980
+   3412.4210   1516.8050     34.1759      2.4000
+   3413.5170   1516.8270     34.1812      2.3990
+   3414.4720   1516.8440     34.1881      2.3970
+   3415.3550   1516.8600     34.1850      2.3980
+   3416.4090   1516.8780     34.1812      2.3990
+   3417.3560   1516.8920     34.1789      2.3990
+   3418.3350   1516.9090     34.1888      2.3960
+   3419.3150   1516.9290     34.1911      2.3960
+   3420.2670   1516.9450     34.1969      2.3940
+   3421.3690   1516.9660     34.1881      2.3970
+   3422.2530   1516.9810     34.1782      2.4000
+   3423.2020   1516.9970     34.1713      2.4020
+   3424.1980   1517.0160     34.1820      2.3990
+   3425.2950   1517.0340     34.1812      2.3990
+   3426.2020   1517.0530     34.1736      2.4020
+   3427.1440   1517.0670     34.1782      2.4000
+   3428.1180   1517.0850     34.1789      2.4000
+   3429.1600   1517.1050     34.1774      2.4010
+   3430.2200   1517.1230     34.1927      2.3960
+   3431.1070   1517.1400     34.1904      2.3970
+   3432.0850   1517.1560     34.1736      2.4020
+   3433.0080   1517.1750     34.1820      2.4000
+   3434.0450   1517.1900     34.1797      2.4000
+   3434.9810   1517.2070     34.1675      2.4040
+   3436.0080   1517.2270     34.1850      2.3990
+   3436.9330   1517.2450     34.1827      2.4000
+   3437.9270   1517.2620     34.1858      2.3990
+   3438.9200   1517.2780     34.1911      2.3970
+   3439.8870   1517.2990     34.1751      2.4030
+   3440.9290   1517.3160     34.1774      2.4020
+   3441.8500   1517.3330     34.1873      2.3990
+   3442.8530   1517.3520     34.1789      2.4020
+   3443.8430   1517.3690     34.1881      2.3990
+   3444.7700   1517.3850     34.1812      2.4010
+   3445.7700   1517.4040     34.1858      2.4000
+   3446.7360   1517.4210     34.1927      2.3980
+   3447.7570   1517.4400     34.1736      2.4040
+   3448.6900   1517.4560     34.1866      2.4000
+   3449.7460   1517.4740     34.1927      2.3980
+   3450.6550   1517.4890     34.1850      2.4000
+   3451.6730   1517.5090     34.1866      2.4000
+   3452.6570   1517.5270     34.1774      2.4030
+   3453.5950   1517.5450     34.1820      2.4020
+   3454.5740   1517.5620     34.1881      2.4000
+   3455.5930   1517.5820     34.1866      2.4010
+   3456.5900   1517.5980     34.1789      2.4030
+   3457.5690   1517.6160     34.1896      2.4000
+   3458.5560   1517.6340     34.1805      2.4030
+   3459.5200   1517.6510     34.1736      2.4050
+   3460.5360   1517.6690     34.1835      2.4020
+   3461.4810   1517.6850     34.1896      2.4000
+   3462.4290   1517.7030     34.1843      2.4020
+   3463.5040   1517.7220     34.1812      2.4030
+   3464.5230   1517.7410     34.1820      2.4030
+   3465.5000   1517.7590     34.1827      2.4030
+   3466.3590   1517.7740     34.1888      2.4010
+   3467.3300   1517.7890     34.1873      2.4010
+   3468.3120   1517.8100     34.1805      2.4040
+   3469.3060   1517.8270     34.1736      2.4060
+   3470.2950   1517.8450     34.1835      2.4030
+   3471.3430   1517.8630     34.1965      2.3990
+   3472.2200   1517.8800     34.1812      2.4040
+   3473.2440   1517.8970     34.1873      2.4020
+   3474.2580   1517.9170     34.1858      2.4030
+   3475.1910   1517.9340     34.1858      2.4030
+   3476.1690   1517.9510     34.1927      2.4010
+   3477.1230   1517.9690     34.1736      2.4070
+   3478.1030   1517.9850     34.1797      2.4050
+   3479.1150   1518.0040     34.1866      2.4030
+   3480.0930   1518.0240     34.1827      2.4050
+   3481.1680   1518.0420     34.1751      2.4070
+   3482.0370   1518.0540     34.1927      2.4010
+   3483.0440   1518.0730     34.1866      2.4030
+   3483.9810   1518.0910     34.1812      2.4050
+   3484.9600   1518.1100     34.1827      2.4050
+   3485.9810   1518.1290     34.1995      2.4000
+   3486.9200   1518.1440     34.1888      2.4030
+   3487.9150   1518.1650     34.1789      2.4070
+   3488.9320   1518.1810     34.1743      2.4080
+   3489.8690   1518.1990     34.1782      2.4070
+   3490.8650   1518.2160     34.1881      2.4040
+   3491.9160   1518.2350     34.1782      2.4070
+   3492.8150   1518.2500     34.1782      2.4070
+   3493.7810   1518.2690     34.1858      2.4050
+   3494.7750   1518.2870     34.1896      2.4040
+   3495.8290   1518.3070     34.1873      2.4050
+   3496.8270   1518.3250     34.1782      2.4080
+   3497.7790   1518.3410     34.1934      2.4030
+   3498.6840   1518.3530     34.1743      2.4080
+   3499.7540   1518.3750     34.1866      2.4050
+   3500.6410   1518.3910     34.1774      2.4080
+   3501.6320   1518.4110     34.1789      2.4080
+   3502.6640   1518.4280     34.1782      2.4080
+   3503.6290   1518.4460     34.1789      2.4080
+   3504.6270   1518.4650     34.1866      2.4060
+   3505.5740   1518.4810     34.1896      2.4050
+   3506.5590   1518.4980     34.1667      2.4120
+   3507.5060   1518.5160     34.1835      2.4070
+   3508.5890   1518.5350     34.1774      2.4090
+   3509.5940   1518.5560     34.1862      2.4070
+   3510.5000   1518.5700     34.1881      2.4060
+   3511.4770   1518.5900     34.1904      2.4060
+   3512.5220   1518.6070     34.1888      2.4060
+   3513.4260   1518.6260     34.1850      2.4080
+   3514.4710   1518.6410     34.1827      2.4080
+   3515.4570   1518.6610     34.1843      2.4080
+   3516.3250   1518.6780     34.1827      2.4090
+   3517.3150   1518.6950     34.1820      2.4090
+   3518.2820   1518.7130     34.1896      2.4070
+   3519.3120   1518.7310     34.1797      2.4100
+   3520.4200   1518.7490     34.1850      2.4080
+   3521.3090   1518.7640     34.1843      2.4080
+   3522.2800   1518.7830     34.1888      2.4070
+   3523.2370   1518.7990     34.1919      2.4060
+   3524.1650   1518.8180     34.1843      2.4090
+   3525.1870   1518.8350     34.1805      2.4100
+   3526.1350   1518.8520     34.1835      2.4090
+   3527.1270   1518.8710     34.1782      2.4110
+   3528.2350   1518.8910     34.1751      2.4120
+   3529.0930   1518.9060     34.1850      2.4090
+   3530.1760   1518.9230     34.1805      2.4100
+   3531.0490   1518.9400     34.1850      2.4090
+   3532.0130   1518.9580     34.1820      2.4100
+   3533.0690   1518.9780     34.1835      2.4100
+   3534.0200   1518.9940     34.1858      2.4090
+   3535.0580   1519.0130     34.1835      2.4100
+   3536.0710   1519.0310     34.1904      2.4080
+   3536.9310   1519.0480     34.1881      2.4090
+   3537.9050   1519.0660     34.1858      2.4100
+   3538.8990   1519.0840     34.1957      2.4070
+   3539.9530   1519.1020     34.1827      2.4110
+   3541.0030   1519.1200     34.1820      2.4110
+   3541.9130   1519.1380     34.1866      2.4100
+   3542.9200   1519.1560     34.1904      2.4090
+   3543.7680   1519.1720     34.1812      2.4120
+   3544.7940   1519.1890     34.1805      2.4120
+   3545.8320   1519.2050     34.1789      2.4120
+   3546.7650   1519.2230     34.1927      2.4080
+   3547.6850   1519.2420     34.1820      2.4120
+   3548.7090   1519.2590     34.1812      2.4120
+   3549.6640   1519.2750     34.1805      2.4120
+   3550.7420   1519.2960     34.1759      2.4140
+   3551.6370   1519.3130     34.1835      2.4120
+   3552.6410   1519.3310     34.1774      2.4140
+   3553.5920   1519.3460     34.1949      2.4080
+   3554.6280   1519.3650     34.1896      2.4100
+   3555.5880   1519.3810     34.1759      2.4140
+   3556.6260   1519.3990     34.1789      2.4130
+   3557.5290   1519.4190     34.1820      2.4130
+   3558.5750   1519.4370     34.1911      2.4100
+   3559.5430   1519.4560     34.1827      2.4130
+   3560.5220   1519.4730     34.1827      2.4130
+   3561.4230   1519.4880     34.1850      2.4120
+   3562.4600   1519.5060     34.1789      2.4140
+   3563.4170   1519.5220     34.1843      2.4120
+   3564.3980   1519.5400     34.1751      2.4150
+   3565.3720   1519.5590     34.1766      2.4150
+   3566.3850   1519.5750     34.1820      2.4130
+   3567.3330   1519.5910     34.1843      2.4120
+   3568.3130   1519.6110     34.1835      2.4130
+   3569.2850   1519.6290     34.1843      2.4130
+   3570.3010   1519.6480     34.1911      2.4110
+   3571.2730   1519.6640     34.1812      2.4140
+   3572.2570   1519.6830     34.1728      2.4170
+   3573.2550   1519.7010     34.1789      2.4150
+   3574.1830   1519.7180     34.1766      2.4160
+   3575.1620   1519.7340     34.1820      2.4140
+   3576.1360   1519.7530     34.1805      2.4150
+   3577.1460   1519.7700     34.1858      2.4130
+   3578.1400   1519.7880     34.1736      2.4170
+   3579.1070   1519.8060     34.1843      2.4140
+   3580.0570   1519.8210     34.1858      2.4130
+   3581.0400   1519.8400     34.1805      2.4150
+   3582.0660   1519.8590     34.1850      2.4140
+   3582.9640   1519.8740     34.1843      2.4140
+   3584.0580   1519.8950     34.1888      2.4130
+   3584.9550   1519.9120     34.1797      2.4160
+   3585.9270   1519.9280     34.1820      2.4150
+   3586.9190   1519.9450     34.1820      2.4150
+   3587.9080   1519.9670     34.1759      2.4180
+   3588.9610   1519.9860     34.1858      2.4150
+   3589.8900   1520.0030     34.1766      2.4180
+   3590.8180   1520.0180     34.1885      2.4140
+   3591.8120   1520.0370     34.1797      2.4170
+   3592.8080   1520.0530     34.1820      2.4160
+   3593.9180   1520.0710     34.1805      2.4160
+   3594.8990   1520.0920     34.1774      2.4180
+   3595.8040   1520.1090     34.1873      2.4150
+   3596.6950   1520.1250     34.1881      2.4150
+   3597.6770   1520.1440     34.1888      2.4150
+   3598.6540   1520.1600     34.1751      2.4190
+   3599.8230   1520.1820     34.1827      2.4170
+   3600.5940   1520.1970     34.1873      2.4160
+   3601.6200   1520.2150     34.1934      2.4140
+   3602.5770   1520.2310     34.1835      2.4170
+   3603.5470   1520.2460     34.1721      2.4200
+   3604.5190   1520.2650     34.1896      2.4150
+   3605.5540   1520.2850     34.1782      2.4190
+   3606.5010   1520.3040     34.1866      2.4170
+   3607.5360   1520.3230     34.1805      2.4190
+   3608.4590   1520.3370     34.1850      2.4170
+   3609.4220   1520.3550     34.1888      2.4160
+   3610.4610   1520.3710     34.1812      2.4180
+   3611.4320   1520.3920     34.1873      2.4170
+   3612.3860   1520.4090     34.1774      2.4200
+   3613.4410   1520.4280     34.1873      2.4170
+   3614.3190   1520.4440     34.1850      2.4180
+   3615.3920   1520.4630     34.1911      2.4160
+   3616.3570   1520.4810     34.1858      2.4180
+   3617.3250   1520.4990     34.1766      2.4210
+   3618.2330   1520.5150     34.1766      2.4210
+   3619.2800   1520.5340     34.1835      2.4190
+   3620.2760   1520.5520     34.1904      2.4170
+   3621.2100   1520.5690     34.1743      2.4220
+   3622.1820   1520.5860     34.1873      2.4180
+   3623.1720   1520.6050     34.1919      2.4170
+   3624.1260   1520.6220     34.1820      2.4200
+   3625.1470   1520.6410     34.1797      2.4210
+   3626.0890   1520.6560     34.1789      2.4210
+   3627.0930   1520.6740     34.1789      2.4210
+   3628.1500   1520.6930     34.1824      2.4200
+   3629.0560   1520.7090     34.1698      2.4240
+   3630.0210   1520.7270     34.1766      2.4220
+   3630.9680   1520.7440     34.1835      2.4200
+   3632.0150   1520.7650     34.1789      2.4220
+   3632.9330   1520.7790     34.1743      2.4230
+   3633.9200   1520.7980     34.1850      2.4200
+   3634.9500   1520.8180     34.1736      2.4240
+   3635.9220   1520.8340     34.1789      2.4220
+   3636.8460   1520.8500     34.1789      2.4220
+   3637.8550   1520.8680     34.1820      2.4210
+   3638.8930   1520.8880     34.1805      2.4220
+   3639.8780   1520.9060     34.1774      2.4230
+   3640.7820   1520.9220     34.1873      2.4200
+   3641.8040   1520.9420     34.1888      2.4200
+   3642.7450   1520.9560     34.1736      2.4240
+   3643.7980   1520.9760     34.1850      2.4210
+   3644.7650   1520.9940     34.1820      2.4220
+   3645.6710   1521.0090     34.1911      2.4190
+   3646.6520   1521.0290     34.1934      2.4190
+   3647.6510   1521.0490     34.1850      2.4220
+   3648.6860   1521.0680     34.1797      2.4240
+   3649.6470   1521.0850     34.1797      2.4240
+   3650.6600   1521.1010     34.1812      2.4230
+   3651.5900   1521.1180     34.1850      2.4220
+   3652.5250   1521.1360     34.1858      2.4220
+   3653.5850   1521.1570     34.1972      2.4190
+   3654.5230   1521.1730     34.1904      2.4210
+   3655.4500   1521.1130     34.1267      2.4230
+   3656.4290   1521.1440     34.1339      2.4240
+   3656.4330   1521.1680     34.1553      2.4230
@@ -0,0 +1,3082 @@
+test_read_store_and_write
+13/5/2012
+16:25:46
+Probe: MIDAS SVP 6000
+Source: /root/package/data/input/valeport/midas/svp/FILE9.000
+      0.0390   1479.2210     32.8270      7.8520
+      0.1330   1479.2350     32.3280      8.0180
+      0.2280   1479.2260     32.0923      8.0920
+      0.3480   1479.2460     31.9962      8.1280
+      0.4170   1479.2580     31.9496      8.1460
+      0.4870   1479.2520     31.8947      8.1620
+      0.5570   1479.2540     31.8863      8.1650
+      0.5940   1479.2320     31.8771      8.1620
+      0.6010   1479.2950     31.8085      8.2010
+      0.6260   1479.3000     31.7818      8.2110
+      0.6300   1479.2960     31.7696      8.2140
+      0.6380   1479.3020     31.8108      8.2020
+      0.6660   1479.3200     31.8031      8.2090
+      0.6800   1479.3240     31.7818      8.2170
+      0.6860   1479.2830     31.7642      8.2120
+      0.6940   1479.1750     31.9923      8.1090
+      0.6960   1479.1540     32.0587      8.0820
+      0.7180   1479.0150     32.3082      7.9640
+      0.7280   1479.0190     32.4829      7.9080
+      0.7460   1479.1090     32.2243      8.0160
+      0.7670   1479.1080     32.2075      8.0210
+      0.7900   1478.9740     32.3936      7.9250
+      0.8410   1478.9880     32.4478      7.9110
+      0.9520   1478.9800     32.4608      7.9040
+      1.0590   1478.9790     32.4745      7.8990
+      1.1040   1478.9910     32.5050      7.8920
+      1.1340   1478.9860     32.5005      7.8920
+      1.2350   1478.9800     32.4913      7.8930
+      1.4070   1478.9810     32.5050      7.8880
+      1.6100   1479.0320     32.5218      7.8950
+      1.8140   1479.0410     32.4867      7.9080
+      2.0580   1479.0060     32.4486      7.9100
+      2.2700   1478.9590     32.4913      7.8830
+      2.4860   1478.9430     32.5645      7.8540
+      2.7240   1478.9490     32.6118      7.8390
+      2.9740   1479.0090     32.6569      7.8390
+      3.1990   1478.9800     32.6065      7.8470
+      3.3820   1478.9840     32.5981      7.8500
+      3.5630   1478.9640     32.5943      7.8450
+      3.7620   1478.9740     32.6309      7.8350
+      3.9450   1479.1460     32.6500      7.8730
+      4.0870   1479.1650     32.3936      7.9610
+      4.2590   1479.1620     32.2998      7.9900
+      4.4430   1479.1250     32.2578      7.9930
+      4.7160   1479.2700     32.2983      8.0170
+      5.0600   1479.3180     32.1419      8.0790
+      5.3800   1479.3370     31.9962      8.1300
+      5.6910   1479.2650     31.9527      8.1240
+      5.9760   1479.2880     32.0198      8.1070
+      6.2590   1479.3290     32.0305      8.1130
+      6.5430   1479.2020     31.9611      8.1010
+      6.8360   1479.2360     32.0915      8.0660
+      7.1170   1479.2230     32.0648      8.0700
+      7.4010   1479.1030     32.1793      8.0000
+      7.6350   1479.0820     32.2670      7.9650
+      7.9310   1478.9530     32.2021      7.9510
+      8.2550   1478.8700     32.5119      7.8270
+      8.6210   1478.8870     32.8156      7.7310
+      8.9390   1478.9020     32.9285      7.6970
+      9.3110   1478.9160     32.9720      7.6850
+      9.7080   1478.9370     32.9651      7.6910
+     10.0940   1478.9010     32.9247      7.6930
+     10.4510   1478.8760     33.0231      7.6530
+     10.8260   1478.9080     33.0742      7.6430
+     11.1880   1478.9140     33.0284      7.6580
+     11.5130   1478.8760     32.9842      7.6610
+     11.8580   1478.8750     33.0650      7.6330
+     12.1850   1478.8800     33.1200      7.6150
+     12.5110   1478.8840     33.1345      7.6100
+     12.8370   1478.8230     33.1673      7.5820
+     13.1750   1478.8240     33.2802      7.5440
+     13.5060   1478.8410     33.3450      7.5260
+     13.8720   1478.8450     33.3679      7.5180
+     14.2140   1478.8620     33.3618      7.5230
+     14.5490   1478.8700     33.3977      7.5120
+     14.8860   1478.9430     33.4579      7.5100
+     15.1630   1478.9740     33.4885      7.5070
+     15.4560   1479.0760     33.5724      7.5050
+     15.7720   1479.1450     33.5747      7.5210
+     16.0790   1479.1620     33.5808      7.5220
+     16.3860   1479.3400     33.7074      7.5260
+     16.7250   1479.3660     33.7212      7.5270
+     17.0960   1479.3820     33.7196      7.5300
+     17.4380   1479.3960     33.7234      7.5310
+     17.7810   1479.4090     33.7296      7.5310
+     18.1050   1479.4140     33.7410      7.5270
+     18.4390   1479.3830     33.7242      7.5230
+     18.7640   1479.3550     33.7280      7.5130
+     19.0710   1479.3120     33.7204      7.5030
+     19.3940   1479.2780     33.7196      7.4930
+     19.6950   1479.2790     33.7410      7.4850
+     20.0440   1479.2880     33.7685      7.4770
+     20.3540   1479.2950     33.7883      7.4710
+     20.7220   1479.3050     33.7944      7.4700
+     21.0840   1479.3580     33.8318      7.4700
+     21.4640   1479.3670     33.8188      7.4750
+     21.8340   1479.3710     33.8264      7.4720
+     22.1590   1479.3900     33.8310      7.4740
+     22.4830   1479.4050     33.8448      7.4720
+     22.7440   1479.4120     33.8379      7.4750
+     23.0380   1479.4160     33.8371      7.4750
+     23.3170   1479.4220     33.8356      7.4760
+     23.5810   1479.4270     33.8326      7.4770
+     23.8840   1479.4370     33.8402      7.4760
+     24.2030   1479.4880     33.8860      7.4730
+     24.5480   1479.6100     33.9851      7.4710
+     24.9080   1479.6470     33.9828      7.4800
+     25.2760   1479.6590     33.9783      7.4830
+     25.6280   1479.6640     33.9653      7.4870
+     25.9910   1479.6790     33.9874      7.4820
+     26.3050   1479.7010     33.9981      7.4830
+     26.5980   1479.7280     33.9973      7.4890
+     26.8300   1479.7680     34.0172      7.4920
+     27.1190   1479.7970     34.0363      7.4920
+     27.4060   1479.8270     34.0477      7.4950
+     27.7220   1479.8330     34.0393      7.4980
+     28.0490   1479.8430     34.0393      7.4990
+     28.3630   1479.8670     34.0576      7.4980
+     28.7230   1479.8700     34.0523      7.4990
+     29.1070   1479.8630     34.0416      7.4990
+     29.4240   1479.8310     34.0271      7.4940
+     29.7790   1479.8270     34.0469      7.4850
+     30.0770   1479.8140     34.0599      7.4760
+     30.3760   1479.8250     34.0744      7.4730
+     30.6510   1479.8370     34.0958      7.4680
+     30.9230   1479.8990     34.1354      7.4700
+     31.2160   1479.9310     34.1362      7.4770
+     31.5050   1479.9550     34.1484      7.4780
+     31.8440   1479.9670     34.1286      7.4860
+     32.2380   1479.9980     34.1484      7.4860
+     32.6120   1480.0110     34.1385      7.4910
+     32.9760   1480.0210     34.1324      7.4940
+     33.3250   1480.0260     34.1316      7.4940
+     33.6600   1480.0520     34.1515      7.4930
+     33.9520   1480.0640     34.1415      7.4980
+     34.2380   1480.1660     34.2041      7.5030
+     34.4950   1480.3520     34.2888      7.5230
+     34.7410   1480.4390     34.2850      7.5460
+     35.0380   1480.4890     34.2873      7.5570
+     35.3700   1480.5170     34.2720      7.5680
+     35.6700   1480.5460     34.2667      7.5760
+     36.0610   1480.5610     34.2644      7.5790
+     36.4330   1480.5690     34.2560      7.5820
+     36.7950   1480.6640     34.3246      7.5830
+     37.1640   1480.6930     34.3185      7.5910
+     37.5030   1480.7170     34.3117      7.5980
+     37.7940   1480.7840     34.3376      7.6060
+     38.0860   1480.8570     34.3643      7.6150
+     38.3580   1481.0000     34.4116      7.6360
+     38.6370   1481.1270     34.4543      7.6540
+     38.9500   1481.2240     34.4673      7.6740
+     39.2920   1481.2740     34.4604      7.6880
+     39.6330   1481.3620     34.4894      7.7000
+     40.0120   1481.4350     34.4818      7.7200
+     40.3610   1481.6610     34.5795      7.7460
+     40.6900   1481.7570     34.5642      7.7750
+     41.0080   1481.8610     34.5734      7.7980
+     41.3140   1481.9230     34.5520      7.8200
+     41.6010   1482.0240     34.5741      7.8380
+     41.8830   1482.0970     34.5650      7.8590
+     42.1540   1482.1460     34.5490      7.8760
+     42.4520   1482.2020     34.5535      7.8880
+     42.7880   1482.2610     34.5543      7.9020
+     43.1700   1482.3110     34.5650      7.9100
+     43.5490   1482.3460     34.5543      7.9210
+     43.9230   1482.3670     34.5543      7.9250
+     44.3100   1482.3930     34.5459      7.9330
+     44.6410   1482.4150     34.5589      7.9330
+     44.9790   1482.4770     34.5833      7.9400
+     45.2680   1482.6210     34.6527      7.9540
+     45.5400   1482.7900     34.7183      7.9760
+     45.8050   1482.9120     34.6939      8.0150
+     46.0750   1483.0120     34.7046      8.0370
+     46.3810   1483.0700     34.6893      8.0560
+     46.7250   1483.1020     34.6710      8.0690
+     47.0990   1483.1180     34.6481      8.0790
+     47.4660   1483.1930     34.6794      8.0870
+     47.8290   1483.2910     34.7298      8.0950
+     48.1760   1483.4210     34.7809      8.1110
+     48.5110   1483.5230     34.7893      8.1340
+     48.8180   1483.6400     34.8129      8.1560
+     49.1070   1483.7310     34.8221      8.1760
+     49.4020   1483.7820     34.7923      8.1980
+     49.7170   1483.8090     34.7763      8.2090
+     50.0550   1483.8290     34.7610      8.2180
+     50.3890   1483.8490     34.7603      8.2220
+     50.7440   1483.9210     34.7954      8.2280
+     51.1260   1483.9790     34.8099      8.2370
+     51.5160   1484.0120     34.7984      8.2480
+     51.8980   1484.0390     34.8030      8.2520
+     52.2250   1484.0800     34.8076      8.2600
+     52.5370   1484.1190     34.8221      8.2640
+     52.8260   1484.1310     34.8038      8.2720
+     53.0830   1484.1450     34.8000      8.2760
+     53.3630   1484.1640     34.7931      8.2820
+     53.6890   1484.1850     34.8000      8.2840
+     54.0150   1484.1970     34.7961      8.2870
+     54.3700   1484.2170     34.8045      8.2880
+     54.7650   1484.2340     34.7977      8.2930
+     55.1380   1484.2500     34.8022      8.2940
+     55.5240   1484.2560     34.8175      8.2890
+     55.8850   1484.2540     34.8114      8.2890
+     56.1850   1484.2580     34.8221      8.2850
+     56.4910   1484.2620     34.8183      8.2860
+     56.8190   1484.2630     34.8061      8.2890
+     57.1270   1484.2640     34.8175      8.2840
+     57.4370   1484.2140     34.7794      8.2820
+     57.7750   1484.1860     34.7855      8.2710
+     58.1030   1484.1870     34.8000      8.2650
+     58.4870   1484.1730     34.7984      8.2600
+     58.8600   1484.1540     34.7992      8.2530
+     59.2050   1484.1550     34.8228      8.2440
+     59.5540   1484.1600     34.8312      8.2410
+     59.8760   1484.1650     34.8343      8.2400
+     60.1630   1484.1700     34.8343      8.2400
+     60.4510   1484.1750     34.8404      8.2380
+     60.7340   1484.1810     34.8480      8.2360
+     61.0140   1484.1820     34.8450      8.2360
+     61.3700   1484.1650     34.8320      8.2340
+     61.7330   1484.1730     34.8427      8.2310
+     62.1510   1484.1760     34.8518      8.2270
+     62.5370   1484.2010     34.8701      8.2260
+     62.9500   1484.2250     34.8839      8.2260
+     63.3020   1484.2450     34.8892      8.2280
+     63.6000   1484.2440     34.8846      8.2280
+     63.9060   1484.2400     34.8770      8.2280
+     64.1900   1484.2380     34.8839      8.2240
+     64.4550   1484.2380     34.8831      8.2230
+     64.7250   1484.2310     34.8801      8.2210
+     65.0420   1484.2140     34.8740      8.2170
+     65.3920   1484.1910     34.8663      8.2120
+     65.7590   1484.1710     34.8663      8.2050
+     66.1690   1484.1720     34.8801      8.1990
+     66.5370   1484.1740     34.8915      8.1940
+     66.8730   1484.1690     34.8892      8.1920
+     67.1870   1484.1600     34.8869      8.1890
+     67.5180   1484.1670     34.8938      8.1870
+     67.8000   1484.1700     34.9106      8.1810
+     68.1070   1484.1760     34.9083      8.1820
+     68.4380   1484.1720     34.9037      8.1810
+     68.7590   1484.1690     34.9030      8.1790
+     69.1140   1484.1750     34.9152      8.1750
+     69.4710   1484.1900     34.9197      8.1760
+     69.8270   1484.2010     34.9274      8.1750
+     70.1660   1484.2120     34.9190      8.1790
+     70.5260   1484.2210     34.9243      8.1780
+     70.8330   1484.2210     34.9266      8.1760
+     71.1200   1484.2210     34.9167      8.1780
+     71.4200   1484.2140     34.9159      8.1750
+     71.7000   1484.2130     34.9266      8.1700
+     72.0090   1484.2160     34.9220      8.1710
+     72.3330   1484.2210     34.9365      8.1660
+     72.6510   1484.2270     34.9373      8.1660
+     73.0100   1484.2320     34.9335      8.1670
+     73.3660   1484.2380     34.9182      8.1720
+     73.7180   1484.2410     34.9312      8.1670
+     74.0530   1484.2460     34.9251      8.1690
+     74.3790   1484.2520     34.9312      8.1670
+     74.7370   1484.2570     34.9243      8.1690
+     75.0610   1484.2600     34.9319      8.1660
+     75.3700   1484.2620     34.9236      8.1680
+     75.7140   1484.2580     34.9274      8.1640
+     76.0600   1484.2400     34.9144      8.1620
+     76.3820   1484.2370     34.9136      8.1600
+     76.7070   1484.2300     34.9220      8.1540
+     77.0440   1484.2180     34.9106      8.1530
+     77.3690   1484.2050     34.9113      8.1480
+     77.6850   1484.1750     34.9037      8.1410
+     77.9780   1484.1500     34.9075      8.1320
+     78.3080   1484.1440     34.9190      8.1250
+     78.6370   1484.1410     34.9274      8.1200
+     79.0040   1484.1390     34.9335      8.1160
+     79.3840   1484.1330     34.9327      8.1130
+     79.7650   1484.1280     34.9350      8.1090
+     80.1730   1484.1130     34.9358      8.1030
+     80.6160   1484.1010     34.9358      8.0980
+     81.0360   1484.0850     34.9258      8.0950
+     81.4210   1484.0840     34.9327      8.0910
+     81.8200   1484.0690     34.9304      8.0860
+     82.2330   1484.0700     34.9312      8.0840
+     82.6150   1484.0570     34.9342      8.0780
+     83.0120   1484.0490     34.9373      8.0730
+     83.3220   1484.0480     34.9449      8.0690
+     83.7190   1484.0150     34.9190      8.0670
+     84.0570   1483.9870     34.9159      8.0590
+     84.4040   1483.9610     34.9091      8.0530
+     84.7040   1483.9540     34.9205      8.0460
+     85.0140   1483.9460     34.9281      8.0400
+     85.3210   1483.9470     34.9457      8.0330
+     85.6340   1483.9520     34.9487      8.0320
+     85.9740   1483.9540     34.9487      8.0310
+     86.3370   1483.9590     34.9480      8.0310
+     86.7030   1483.9640     34.9594      8.0270
+     87.0820   1483.9690     34.9525      8.0290
+     87.4980   1483.9730     34.9503      8.0290
+     87.8530   1483.9770     34.9579      8.0260
+     88.2020   1483.9820     34.9541      8.0270
+     88.5180   1483.9870     34.9510      8.0280
+     88.8520   1483.9920     34.9472      8.0290
+     89.1650   1483.9970     34.9533      8.0270
+     89.4760   1484.0020     34.9594      8.0250
+     89.8080   1484.0090     34.9602      8.0250
+     90.1830   1484.0140     34.9564      8.0260
+     90.5720   1484.0180     34.9480      8.0280
+     90.9310   1484.0300     34.9564      8.0270
+     91.2730   1484.0460     34.9709      8.0250
+     91.6100   1484.0510     34.9670      8.0260
+     91.9610   1484.0530     34.9548      8.0290
+     92.2540   1484.0590     34.9617      8.0270
+     92.6060   1484.0750     34.9640      8.0290
+     92.9280   1484.0710     34.9564      8.0290
+     93.2810   1484.0720     34.9556      8.0280
+     93.6490   1484.0770     34.9579      8.0270
+     94.0490   1484.0810     34.9525      8.0280
+     94.4590   1484.0690     34.9464      8.0250
+     94.8420   1484.0370     34.9312      8.0200
+     95.2170   1484.0460     34.9449      8.0160
+     95.5550   1484.0590     34.9541      8.0150
+     95.8860   1484.0700     34.9709      8.0110
+     96.2070   1484.0760     34.9686      8.0120
+     96.5080   1484.0910     34.9762      8.0120
+     96.8370   1484.0920     34.9640      8.0150
+     97.1870   1484.0970     34.9724      8.0120
+     97.5400   1484.0910     34.9686      8.0100
+     97.9190   1484.0810     34.9556      8.0100
+     98.2270   1484.0670     34.9586      8.0040
+     98.5750   1484.0590     34.9564      8.0010
+     98.9050   1484.0680     34.9716      7.9970
+     99.2020   1484.0710     34.9640      7.9990
+     99.5180   1484.0770     34.9709      7.9970
+     99.8480   1484.0790     34.9678      7.9970
+    100.1840   1484.0820     34.9716      7.9950
+    100.5210   1484.0850     34.9632      7.9970
+    100.8990   1484.0530     34.9358      7.9960
+    101.2570   1484.0300     34.9396      7.9870
+    101.6250   1484.0230     34.9442      7.9820
+    101.9680   1484.0200     34.9525      7.9770
+    102.3150   1484.0120     34.9510      7.9740
+    102.6080   1484.0090     34.9594      7.9690
+    102.9080   1484.0070     34.9602      7.9670
+    103.2460   1484.0100     34.9640      7.9650
+    103.5690   1484.0140     34.9663      7.9640
+    103.9240   1483.9930     34.9655      7.9570
+    104.2860   1483.9990     34.9747      7.9540
+    104.6390   1484.0010     34.9747      7.9530
+    104.9980   1484.0090     34.9762      7.9530
+    105.3560   1484.0130     34.9899      7.9480
+    105.6620   1484.0170     34.9739      7.9530
+    105.9610   1484.0210     34.9701      7.9540
+    106.2790   1484.0280     34.9747      7.9530
+    106.5900   1484.0350     34.9915      7.9480
+    106.9350   1484.0390     34.9747      7.9530
+    107.2810   1484.0320     34.9731      7.9500
+    107.6710   1484.0360     34.9686      7.9510
+    108.0350   1484.0510     34.9907      7.9460
+    108.4060   1484.0080     34.9541      7.9450
+    108.7540   1483.9960     34.9648      7.9370
+    109.0550   1483.9940     34.9648      7.9350
+    109.3600   1483.9980     34.9762      7.9310
+    109.6670   1484.0030     34.9731      7.9320
+    109.9590   1484.0060     34.9716      7.9320
+    110.2920   1484.0060     34.9823      7.9270
+    110.6690   1484.0040     34.9693      7.9290
+    111.0280   1484.0050     34.9716      7.9270
+    111.3950   1484.0020     34.9800      7.9220
+    111.7360   1483.9920     34.9640      7.9230
+    112.0870   1483.9660     34.9625      7.9150
+    112.4140   1483.9540     34.9579      7.9120
+    112.7500   1483.9450     34.9701      7.9040
+    113.0430   1483.9440     34.9777      7.9000
+    113.3720   1483.9420     34.9655      7.9020
+    113.7230   1483.9440     34.9747      7.8980
+    114.0620   1483.9490     34.9869      7.8940
+    114.4370   1483.9510     34.9770      7.8960
+    114.7850   1483.9560     34.9884      7.8920
+    115.1290   1483.9540     34.9915      7.8890
+    115.4380   1483.9550     34.9792      7.8920
+    115.7540   1483.9360     34.9808      7.8850
+    116.0600   1483.9360     34.9770      7.8850
+    116.3860   1483.9390     34.9777      7.8840
+    116.7360   1483.9450     34.9846      7.8820
+    117.0830   1483.9520     34.9915      7.8800
+    117.4490   1483.9570     34.9876      7.8810
+    117.8090   1483.9510     34.9808      7.8800
+    118.1560   1483.9560     34.9892      7.8770
+    118.4980   1483.9540     34.9770      7.8790
+    118.7910   1483.9580     34.9915      7.8740
+    119.1000   1483.9620     34.9907      7.8740
+    119.3930   1483.9660     34.9869      7.8750
+    119.7420   1483.9690     34.9937      7.8720
+    120.0960   1483.9740     34.9930      7.8720
+    120.4700   1483.9790     34.9861      7.8740
+    120.8290   1483.9860     34.9960      7.8710
+    121.1950   1483.9890     34.9937      7.8710
+    121.5240   1483.9930     34.9831      7.8740
+    121.8490   1484.0010     34.9945      7.8710
+    122.1600   1484.0060     34.9884      7.8730
+    122.4510   1484.0100     34.9876      7.8730
+    122.7770   1484.0100     34.9861      7.8720
+    123.1270   1484.0170     34.9937      7.8700
+    123.4930   1484.0240     34.9854      7.8730
+    123.8700   1484.0260     34.9785      7.8740
+    124.2150   1484.0310     34.9899      7.8700
+    124.5810   1484.0300     34.9815      7.8710
+    124.9260   1484.0280     34.9876      7.8670
+    125.2140   1484.0210     34.9808      7.8660
+    125.5280   1484.0160     34.9792      7.8640
+    125.8200   1484.0080     34.9869      7.8580
+    126.1530   1484.0080     34.9884      7.8560
+    126.4670   1484.0100     34.9983      7.8520
+    126.8680   1484.0100     34.9838      7.8550
+    127.2280   1484.0080     34.9861      7.8520
+    127.5910   1484.0110     34.9899      7.8500
+    127.9560   1484.0140     34.9937      7.8480
+    128.2900   1484.0150     34.9930      7.8470
+    128.6130   1484.0070     34.9884      7.8450
+    128.9100   1484.0080     34.9854      7.8450
+    129.2010   1484.0070     34.9899      7.8420
+    129.5040   1484.0050     34.9991      7.8370
+    129.8710   1484.0050     34.9976      7.8360
+    130.2180   1484.0100     34.9998      7.8350
+    130.5880   1484.0170     35.0037      7.8340
+    130.9510   1484.0240     34.9983      7.8360
+    131.3180   1484.0290     35.0067      7.8330
+    131.6750   1484.0330     34.9991      7.8350
+    132.0060   1484.0300     34.9953      7.8340
+    132.2960   1484.0250     34.9937      7.8320
+    132.6320   1484.0260     35.0021      7.8280
+    132.9500   1484.0280     34.9899      7.8310
+    133.2750   1484.0320     35.0044      7.8260
+    133.6110   1484.0350     34.9930      7.8290
+    133.9760   1484.0400     35.0044      7.8250
+    134.3140   1484.0450     35.0037      7.8250
+    134.6730   1484.0500     34.9998      7.8260
+    134.9830   1484.0520     34.9945      7.8270
+    135.3050   1484.0570     35.0128      7.8210
+    135.6470   1484.0600     35.0166      7.8190
+    135.9940   1484.0650     34.9976      7.8250
+    136.3380   1484.0670     35.0006      7.8230
+    136.6770   1484.0710     35.0021      7.8220
+    137.0750   1484.0760     35.0014      7.8220
+    137.4170   1484.0820     35.0044      7.8210
+    137.7810   1484.0850     35.0082      7.8190
+    138.1200   1484.0880     35.0090      7.8180
+    138.4750   1484.0910     34.9915      7.8230
+    138.7760   1484.0940     35.0052      7.8180
+    139.0900   1484.0980     35.0075      7.8170
+    139.4250   1484.1010     35.0052      7.8170
+    139.8030   1484.1010     34.9998      7.8170
+    140.1450   1484.1050     34.9991      7.8170
+    140.4950   1484.1070     35.0021      7.8150
+    140.8500   1484.1110     35.0037      7.8140
+    141.1820   1484.1150     35.0082      7.8120
+    141.5310   1484.1200     35.0105      7.8110
+    141.8450   1484.1260     35.0021      7.8140
+    142.2020   1484.1310     35.0136      7.8100
+    142.5190   1484.1360     35.0105      7.8110
+    142.8590   1484.1400     35.0060      7.8120
+    143.2330   1484.1400     35.0006      7.8120
+    143.5850   1484.1430     35.0052      7.8100
+    143.9180   1484.1470     35.0037      7.8100
+    144.2910   1484.1530     35.0098      7.8080
+    144.6180   1484.1570     34.9991      7.8110
+    144.9490   1484.1630     35.0182      7.8050
+    145.2650   1484.1690     35.0128      7.8070
+    145.5800   1484.1730     35.0021      7.8100
+    145.9100   1484.1760     35.0006      7.8100
+    146.2510   1484.1760     35.0082      7.8060
+    146.5670   1484.1830     35.0159      7.8040
+    146.8760   1484.1890     35.0098      7.8060
+    147.2250   1484.1940     35.0098      7.8060
+    147.5530   1484.2000     35.0098      7.8060
+    147.8810   1484.2060     35.0136      7.8050
+    148.2140   1484.2110     35.0189      7.8030
+    148.5590   1484.2160     35.0151      7.8040
+    148.8960   1484.2220     35.0159      7.8040
+    149.2300   1484.2290     35.0136      7.8050
+    149.5820   1484.2350     35.0143      7.8050
+    149.9170   1484.2380     35.0060      7.8070
+    150.2570   1484.2420     35.0044      7.8070
+    150.5800   1484.2470     35.0197      7.8020
+    150.9300   1484.2510     35.0121      7.8040
+    151.2870   1484.2560     35.0143      7.8030
+    151.6430   1484.2620     35.0143      7.8030
+    151.9810   1484.2670     35.0105      7.8040
+    152.3370   1484.2740     35.0121      7.8040
+    152.6830   1484.2780     35.0166      7.8020
+    153.0170   1484.2820     35.0060      7.8050
+    153.3460   1484.2840     35.0090      7.8030
+    153.6700   1484.2900     35.0098      7.8030
+    154.0080   1484.2950     35.0090      7.8030
+    154.3450   1484.3000     35.0151      7.8010
+    154.6920   1484.3040     35.0105      7.8020
+    155.0500   1484.3100     35.0197      7.7990
+    155.3990   1484.3150     35.0159      7.8000
+    155.7540   1484.3210     35.0098      7.8020
+    156.0780   1484.3250     35.0151      7.8000
+    156.4310   1484.3290     35.0166      7.7990
+    156.7530   1484.3320     35.0082      7.8010
+    157.0720   1484.3360     35.0075      7.8010
+    157.4310   1484.3410     35.0159      7.7980
+    157.7610   1484.3460     35.0128      7.7990
+    158.1390   1484.3520     35.0151      7.7980
+    158.5010   1484.3580     35.0212      7.7960
+    158.8460   1484.3630     35.0090      7.8000
+    159.1960   1484.3690     35.0182      7.7970
+    159.5080   1484.3730     35.0082      7.8000
+    159.8240   1484.3780     35.0136      7.7980
+    160.1230   1484.3830     35.0166      7.7970
+    160.4410   1484.3880     35.0166      7.7970
+    160.8000   1484.3950     35.0143      7.7980
+    161.1730   1484.3980     35.0121      7.7980
+    161.5380   1484.4030     35.0174      7.7960
+    161.9050   1484.4070     35.0060      7.7990
+    162.2450   1484.4090     35.0098      7.7970
+    162.5860   1484.4150     35.0128      7.7960
+    162.8980   1484.4170     35.0105      7.7960
+    163.2180   1484.4230     35.0227      7.7920
+    163.5400   1484.4250     35.0082      7.7960
+    163.8880   1484.4290     35.0128      7.7940
+    164.2600   1484.4340     35.0151      7.7930
+    164.6170   1484.4370     35.0098      7.7940
+    164.9590   1484.4410     35.0113      7.7930
+    165.3010   1484.4480     35.0182      7.7910
+    165.6540   1484.4530     35.0082      7.7940
+    165.9690   1484.4600     35.0189      7.7910
+    166.2820   1484.4630     35.0113      7.7930
+    166.6080   1484.4670     35.0159      7.7910
+    166.9560   1484.4710     35.0090      7.7930
+    167.2960   1484.4750     35.0166      7.7900
+    167.6610   1484.4800     35.0189      7.7890
+    168.0250   1484.4850     35.0090      7.7920
+    168.3680   1484.4900     35.0113      7.7910
+    168.7250   1484.4970     35.0121      7.7910
+    169.0310   1484.5000     35.0075      7.7920
+    169.3460   1484.5040     35.0189      7.7880
+    169.6790   1484.5080     35.0204      7.7870
+    170.0140   1484.5140     35.0235      7.7860
+    170.3760   1484.5170     35.0121      7.7890
+    170.7180   1484.5210     35.0227      7.7850
+    171.0830   1484.5270     35.0258      7.7840
+    171.4650   1484.5320     35.0220      7.7850
+    171.7970   1484.5370     35.0182      7.7860
+    172.1000   1484.5420     35.0182      7.7860
+    172.4120   1484.5460     35.0143      7.7870
+    172.7140   1484.5520     35.0182      7.7860
+    173.0290   1484.5570     35.0151      7.7870
+    173.3950   1484.5650     35.0166      7.7870
+    173.7720   1484.5680     35.0143      7.7870
+    174.1470   1484.5730     35.0128      7.7870
+    174.5310   1484.5780     35.0121      7.7870
+    174.8620   1484.5820     35.0166      7.7850
+    175.1940   1484.5830     35.0166      7.7840
+    175.4920   1484.5850     35.0166      7.7830
+    175.8000   1484.5900     35.0136      7.7840
+    176.1220   1484.5960     35.0174      7.7830
+    176.4590   1484.6000     35.0159      7.7830
+    176.8180   1484.6060     35.0159      7.7830
+    177.1680   1484.6120     35.0136      7.7840
+    177.5020   1484.6170     35.0250      7.7800
+    177.8730   1484.6200     35.0136      7.7830
+    178.1970   1484.6260     35.0197      7.7810
+    178.5300   1484.6310     35.0136      7.7830
+    178.8660   1484.6340     35.0113      7.7830
+    179.1890   1484.6390     35.0204      7.7800
+    179.4970   1484.6450     35.0182      7.7810
+    179.8650   1484.6490     35.0220      7.7790
+    180.2220   1484.6530     35.0235      7.7780
+    180.5590   1484.6580     35.0204      7.7790
+    180.8980   1484.6640     35.0204      7.7790
+    181.2230   1484.6700     35.0212      7.7790
+    181.5680   1484.6730     35.0128      7.7810
+    181.8870   1484.6780     35.0220      7.7780
+    182.2160   1484.6840     35.0159      7.7800
+    182.5250   1484.6910     35.0235      7.7780
+    182.8880   1484.6950     35.0220      7.7780
+    183.2560   1484.7000     35.0212      7.7780
+    183.5750   1484.7050     35.0182      7.7790
+    183.9160   1484.7110     35.0121      7.7810
+    184.2700   1484.7160     35.0204      7.7780
+    184.6280   1484.7210     35.0197      7.7780
+    184.9440   1484.7260     35.0227      7.7770
+    185.2660   1484.7320     35.0166      7.7790
+    185.5660   1484.7360     35.0250      7.7760
+    185.9000   1484.7420     35.0197      7.7780
+    186.2320   1484.7450     35.0204      7.7770
+    186.6000   1484.7500     35.0136      7.7790
+    186.9470   1484.7550     35.0189      7.7770
+    187.2840   1484.7610     35.0227      7.7760
+    187.6280   1484.7660     35.0281      7.7740
+    187.9970   1484.7730     35.0227      7.7760
+    188.3050   1484.7780     35.0166      7.7780
+    188.6470   1484.7820     35.0212      7.7760
+    188.9630   1484.7860     35.0204      7.7760
+    189.3000   1484.7910     35.0166      7.7770
+    189.6480   1484.7970     35.0227      7.7750
+    189.9600   1484.8010     35.0189      7.7760
+    190.3100   1484.8060     35.0212      7.7750
+    190.6620   1484.8120     35.0151      7.7770
+    190.9970   1484.8170     35.0182      7.7760
+    191.3330   1484.8220     35.0235      7.7740
+    191.6730   1484.8270     35.0174      7.7760
+    191.9800   1484.8320     35.0258      7.7730
+    192.3270   1484.8390     35.0273      7.7730
+    192.6560   1484.8420     35.0189      7.7750
+    192.9940   1484.8480     35.0197      7.7750
+    193.3700   1484.8530     35.0212      7.7740
+    193.7230   1484.8580     35.0143      7.7760
+    194.0720   1484.8600     35.0296      7.7700
+    194.4160   1484.8650     35.0174      7.7740
+    194.7470   1484.8660     35.0166      7.7730
+    195.0530   1484.8690     35.0212      7.7710
+    195.3580   1484.8720     35.0220      7.7700
+    195.6840   1484.8750     35.0204      7.7700
+    196.0280   1484.8810     35.0204      7.7700
+    196.3930   1484.8850     35.0189      7.7700
+    196.7650   1484.8900     35.0243      7.7680
+    197.0980   1484.8930     35.0189      7.7690
+    197.4360   1484.8970     35.0174      7.7690
+    197.7500   1484.9030     35.0121      7.7710
+    198.0650   1484.9030     35.0266      7.7650
+    198.4150   1484.9090     35.0204      7.7670
+    198.7540   1484.9140     35.0258      7.7650
+    199.1170   1484.9190     35.0250      7.7650
+    199.4900   1484.9250     35.0189      7.7670
+    199.8550   1484.9290     35.0235      7.7650
+    200.1980   1484.9340     35.0227      7.7650
+    200.5010   1484.9380     35.0189      7.7660
+    200.7890   1484.9420     35.0243      7.7640
+    201.0810   1484.9460     35.0235      7.7640
+    201.4230   1484.9510     35.0235      7.7640
+    201.7750   1484.9560     35.0227      7.7640
+    202.1240   1484.9590     35.0266      7.7620
+    202.4980   1484.9650     35.0174      7.7650
+    202.8450   1484.9700     35.0288      7.7610
+    203.1940   1484.9750     35.0220      7.7630
+    203.5570   1484.9790     35.0174      7.7640
+    203.8640   1484.9840     35.0204      7.7630
+    204.1820   1484.9900     35.0212      7.7630
+    204.5020   1484.9960     35.0182      7.7640
+    204.8420   1485.0010     35.0182      7.7640
+    205.1520   1485.0070     35.0281      7.7610
+    205.4900   1485.0120     35.0243      7.7620
+    205.8520   1485.0190     35.0311      7.7600
+    206.2250   1485.0220     35.0250      7.7610
+    206.6000   1485.0270     35.0243      7.7610
+    206.9520   1485.0330     35.0273      7.7600
+    207.3060   1485.0390     35.0281      7.7600
+    207.6690   1485.0420     35.0220      7.7610
+    207.9850   1485.0440     35.0197      7.7610
+    208.2960   1485.0500     35.0235      7.7600
+    208.6300   1485.0570     35.0243      7.7600
+    208.9380   1485.0590     35.0250      7.7590
+    209.2790   1485.0630     35.0143      7.7620
+    209.6010   1485.0680     35.0235      7.7590
+    209.9460   1485.0730     35.0288      7.7570
+    210.3120   1485.0730     35.0243      7.7570
+    210.6670   1485.0770     35.0136      7.7600
+    211.0180   1485.0810     35.0243      7.7560
+    211.3650   1485.0860     35.0266      7.7550
+    211.7220   1485.0920     35.0204      7.7570
+    212.0740   1485.0970     35.0288      7.7540
+    212.4190   1485.1040     35.0273      7.7550
+    212.7470   1485.1050     35.0235      7.7550
+    213.0960   1485.1050     35.0250      7.7530
+    213.4340   1485.1100     35.0212      7.7540
+    213.7320   1485.1140     35.0235      7.7530
+    214.0570   1485.1170     35.0189      7.7540
+    214.3600   1485.1200     35.0235      7.7520
+    214.7230   1485.1240     35.0243      7.7510
+    215.0480   1485.1300     35.0250      7.7510
+    215.4240   1485.1350     35.0243      7.7510
+    215.7910   1485.1380     35.0212      7.7510
+    216.1460   1485.1450     35.0227      7.7510
+    216.5170   1485.1510     35.0220      7.7510
+    216.8370   1485.1510     35.0151      7.7520
+    217.1560   1485.1570     35.0220      7.7500
+    217.4650   1485.1640     35.0204      7.7510
+    217.8070   1485.1720     35.0250      7.7500
+    218.1590   1485.1760     35.0204      7.7510
+    218.5210   1485.1820     35.0266      7.7490
+    218.8680   1485.1870     35.0197      7.7510
+    219.2120   1485.1940     35.0212      7.7510
+    219.5470   1485.2000     35.0243      7.7500
+    219.8760   1485.2060     35.0281      7.7490
+    220.2050   1485.2110     35.0212      7.7510
+    220.5610   1485.2160     35.0204      7.7510
+    220.8760   1485.2220     35.0212      7.7510
+    221.2100   1485.2280     35.0250      7.7500
+    221.5600   1485.2320     35.0235      7.7500
+    221.9020   1485.2390     35.0212      7.7510
+    222.2570   1485.2440     35.0266      7.7490
+    222.5910   1485.2470     35.0243      7.7490
+    222.9070   1485.2510     35.0204      7.7500
+    223.2360   1485.2550     35.0250      7.7480
+    223.5840   1485.2600     35.0250      7.7480
+    223.9410   1485.2620     35.0189      7.7490
+    224.2700   1485.2660     35.0113      7.7510
+    224.6070   1485.2690     35.0151      7.7490
+    224.9240   1485.2710     35.0220      7.7460
+    225.2600   1485.2750     35.0113      7.7490
+    225.5860   1485.2790     35.0197      7.7460
+    225.9250   1485.2810     35.0197      7.7450
+    226.2510   1485.2860     35.0189      7.7450
+    226.6010   1485.2940     35.0304      7.7420
+    226.9560   1485.3050     35.0250      7.7450
+    227.3020   1485.3120     35.0258      7.7450
+    227.6370   1485.3190     35.0273      7.7450
+    227.9400   1485.3230     35.0143      7.7490
+    228.2580   1485.3290     35.0182      7.7480
+    228.5670   1485.3330     35.0197      7.7470
+    228.8950   1485.3400     35.0212      7.7470
+    229.2510   1485.3450     35.0235      7.7460
+    229.5980   1485.3510     35.0204      7.7470
+    229.9540   1485.3570     35.0143      7.7490
+    230.3090   1485.3630     35.0243      7.7460
+    230.6360   1485.3690     35.0090      7.7510
+    230.9690   1485.3740     35.0243      7.7460
+    231.2980   1485.3800     35.0151      7.7490
+    231.6330   1485.3850     35.0212      7.7470
+    231.9480   1485.3880     35.0189      7.7470
+    232.3030   1485.3950     35.0197      7.7470
+    232.6340   1485.4010     35.0266      7.7450
+    232.9480   1485.4050     35.0166      7.7480
+    233.2810   1485.4110     35.0227      7.7460
+    233.6080   1485.4150     35.0220      7.7460
+    233.9440   1485.4210     35.0159      7.7480
+    234.2960   1485.4270     35.0159      7.7480
+    234.6470   1485.4320     35.0212      7.7460
+    234.9890   1485.4380     35.0128      7.7490
+    235.3090   1485.4440     35.0220      7.7460
+    235.6500   1485.4500     35.0258      7.7450
+    235.9640   1485.4540     35.0220      7.7460
+    236.2770   1485.4580     35.0327      7.7420
+    236.6390   1485.4630     35.0197      7.7460
+    236.9920   1485.4700     35.0235      7.7450
+    237.3580   1485.4760     35.0266      7.7440
+    237.7040   1485.4810     35.0204      7.7460
+    238.0480   1485.4860     35.0166      7.7470
+    238.3630   1485.4920     35.0266      7.7440
+    238.6940   1485.4990     35.0212      7.7460
+    239.0100   1485.5030     35.0235      7.7450
+    239.3770   1485.5090     35.0174      7.7470
+    239.7190   1485.5150     35.0235      7.7450
+    240.0990   1485.5210     35.0266      7.7440
+    240.4170   1485.5220     35.0166      7.7460
+    240.7200   1485.5250     35.0151      7.7460
+    241.0020   1485.5300     35.0128      7.7470
+    241.3430   1485.5350     35.0273      7.7420
+    241.6540   1485.5420     35.0258      7.7430
+    242.0010   1485.5490     35.0266      7.7430
+    242.3610   1485.5540     35.0227      7.7440
+    242.7220   1485.5570     35.0052      7.7490
+    243.0810   1485.5600     35.0212      7.7430
+    243.4160   1485.5660     35.0182      7.7440
+    243.7440   1485.5710     35.0212      7.7430
+    244.0960   1485.5760     35.0113      7.7460
+    244.4270   1485.5820     35.0266      7.7410
+    244.7760   1485.5890     35.0220      7.7430
+    245.1180   1485.5910     35.0159      7.7440
+    245.4690   1485.5960     35.0182      7.7430
+    245.7490   1485.6020     35.0220      7.7420
+    246.1030   1485.6060     35.0266      7.7400
+    246.4140   1485.6110     35.0235      7.7410
+    246.7670   1485.6160     35.0136      7.7440
+    247.0960   1485.6210     35.0166      7.7430
+    247.4230   1485.6260     35.0128      7.7440
+    247.7830   1485.6300     35.0204      7.7410
+    248.1020   1485.6350     35.0204      7.7410
+    248.4550   1485.6410     35.0174      7.7420
+    248.7680   1485.6450     35.0105      7.7440
+    249.1080   1485.6500     35.0189      7.7410
+    249.4370   1485.6560     35.0197      7.7410
+    249.7980   1485.6630     35.0204      7.7410
+    250.1180   1485.6660     35.0212      7.7400
+    250.4570   1485.6710     35.0151      7.7420
+    250.7850   1485.6760     35.0174      7.7410
+    251.0960   1485.6810     35.0204      7.7400
+    251.4150   1485.6850     35.0197      7.7400
+    251.7540   1485.6900     35.0189      7.7400
+    252.0780   1485.6960     35.0258      7.7380
+    252.4270   1485.7010     35.0281      7.7370
+    252.7630   1485.7050     35.0204      7.7390
+    253.0950   1485.7080     35.0151      7.7400
+    253.4110   1485.7120     35.0113      7.7410
+    253.7280   1485.7130     35.0204      7.7370
+    254.0610   1485.7180     35.0197      7.7370
+    254.4000   1485.7240     35.0174      7.7380
+    254.7350   1485.7280     35.0128      7.7390
+    255.0820   1485.7340     35.0189      7.7370
+    255.4440   1485.7400     35.0189      7.7370
+    255.8060   1485.7410     35.0212      7.7350
+    256.1440   1485.7430     35.0121      7.7370
+    256.4450   1485.7490     35.0250      7.7330
+    256.7350   1485.7530     35.0121      7.7370
+    257.0790   1485.7570     35.0227      7.7330
+    257.3640   1485.7620     35.0266      7.7320
+    257.6950   1485.7660     35.0220      7.7330
+    258.0480   1485.7690     35.0166      7.7340
+    258.3990   1485.7700     35.0159      7.7330
+    258.7700   1485.7750     35.0121      7.7340
+    259.0940   1485.7780     35.0098      7.7340
+    259.4140   1485.7800     35.0136      7.7320
+    259.7500   1485.7830     35.0143      7.7310
+    260.0700   1485.7860     35.0098      7.7320
+    260.4100   1485.7850     35.0075      7.7310
+    260.7570   1485.7890     35.0151      7.7280
+    261.1120   1485.7970     35.0136      7.7290
+    261.4490   1485.7980     35.0189      7.7260
+    261.7800   1485.8040     35.0105      7.7290
+    262.1150   1485.8070     35.0113      7.7280
+    262.4290   1485.8140     35.0128      7.7280
+    262.7740   1485.8190     35.0212      7.7250
+    263.1400   1485.8250     35.0121      7.7280
+    263.4720   1485.8300     35.0113      7.7280
+    263.8250   1485.8360     35.0212      7.7250
+    264.1390   1485.8400     35.0136      7.7270
+    264.4650   1485.8450     35.0197      7.7250
+    264.7970   1485.8520     35.0113      7.7280
+    265.1450   1485.8580     35.0243      7.7240
+    265.4940   1485.8630     35.0113      7.7280
+    265.8160   1485.8670     35.0159      7.7260
+    266.1730   1485.8730     35.0128      7.7270
+    266.5030   1485.8790     35.0105      7.7280
+    266.8330   1485.8810     35.0136      7.7260
+    267.1880   1485.8840     35.0113      7.7260
+    267.5100   1485.8840     35.0044      7.7270
+    267.8540   1485.8860     35.0166      7.7220
+    268.2060   1485.8890     35.0082      7.7240
+    268.5570   1485.8920     35.0121      7.7220
+    268.9120   1485.8980     35.0182      7.7200
+    269.2620   1485.9040     35.0090      7.7230
+    269.5960   1485.9080     35.0174      7.7200
+    269.9130   1485.9160     35.0220      7.7190
+    270.2360   1485.9210     35.0159      7.7210
+    270.5780   1485.9270     35.0128      7.7220
+    270.9230   1485.9350     35.0212      7.7200
+    271.2570   1485.9380     35.0159      7.7210
+    271.6070   1485.9410     35.0136      7.7210
+    271.9820   1485.9430     35.0166      7.7190
+    272.3190   1485.9460     35.0143      7.7190
+    272.6760   1485.9480     35.0113      7.7190
+    272.9990   1485.9520     35.0098      7.7190
+    273.3700   1485.9580     35.0159      7.7170
+    273.7290   1485.9640     35.0159      7.7170
+    274.0380   1485.9720     35.0212      7.7160
+    274.3830   1485.9790     35.0189      7.7170
+    274.7040   1485.9860     35.0143      7.7190
+    275.0430   1485.9890     35.0220      7.7160
+    275.3760   1485.9930     35.0143      7.7180
+    275.7280   1485.9970     35.0098      7.7190
+    276.0720   1486.0010     35.0174      7.7160
+    276.4030   1486.0030     35.0052      7.7190
+    276.7340   1486.0060     35.0128      7.7160
+    277.0990   1486.0150     35.0212      7.7140
+    277.4120   1486.0160     35.0174      7.7140
+    277.7740   1486.0180     35.0082      7.7160
+    278.1230   1486.0240     35.0082      7.7160
+    278.4760   1486.0260     35.0174      7.7120
+    278.8260   1486.0300     35.0128      7.7130
+    279.1500   1486.0340     35.0182      7.7110
+    279.4880   1486.0380     35.0105      7.7130
+    279.8290   1486.0410     35.0151      7.7110
+    280.1510   1486.0450     35.0136      7.7110
+    280.5070   1486.0500     35.0159      7.7100
+    280.8950   1486.0560     35.0128      7.7110
+    281.2230   1486.0590     35.0136      7.7100
+    281.5470   1486.0600     35.0067      7.7110
+    281.8710   1486.0560     35.0090      7.7080
+    282.2190   1486.0590     35.0159      7.7050
+    282.5560   1486.0620     35.0136      7.7050
+    282.8790   1486.0640     35.0136      7.7040
+    283.2470   1486.0690     35.0067      7.7060
+    283.6170   1486.0720     35.0136      7.7030
+    283.9800   1486.0740     35.0166      7.7010
+    284.3210   1486.0750     35.0128      7.7010
+    284.6710   1486.0760     35.0121      7.7000
+    284.9970   1486.0770     35.0082      7.7000
+    285.3560   1486.0800     35.0151      7.6970
+    285.6860   1486.0830     35.0159      7.6960
+    286.0180   1486.0880     35.0159      7.6960
+    286.3330   1486.0870     35.0136      7.6950
+    286.6990   1486.0930     35.0166      7.6940
+    287.0030   1486.0980     35.0075      7.6970
+    287.3540   1486.1020     35.0121      7.6950
+    287.6860   1486.1070     35.0151      7.6940
+    288.0790   1486.1130     35.0082      7.6960
+    288.3890   1486.1180     35.0143      7.6940
+    288.7430   1486.1220     35.0006      7.6980
+    289.1050   1486.1260     35.0143      7.6930
+    289.4520   1486.1300     35.0159      7.6920
+    289.7900   1486.1340     35.0204      7.6900
+    290.1500   1486.1400     35.0082      7.6940
+    290.4780   1486.1440     35.0197      7.6900
+    290.8430   1486.1500     35.0075      7.6940
+    291.1820   1486.1570     35.0204      7.6900
+    291.5510   1486.1610     35.0128      7.6920
+    291.8900   1486.1660     35.0121      7.6920
+    292.2370   1486.1700     35.0105      7.6920
+    292.5830   1486.1760     35.0082      7.6930
+    292.9290   1486.1780     35.0174      7.6890
+    293.2790   1486.1840     35.0143      7.6900
+    293.6390   1486.1870     35.0060      7.6920
+    293.9730   1486.1940     35.0098      7.6910
+    294.3360   1486.2010     35.0105      7.6910
+    294.6690   1486.2040     35.0060      7.6920
+    295.0220   1486.2010     35.0044      7.6900
+    295.3810   1486.2040     35.0052      7.6890
+    295.7690   1486.2110     35.0182      7.6850
+    296.1500   1486.2160     35.0136      7.6860
+    296.5160   1486.2140     35.0136      7.6840
+    296.9180   1486.2110     34.9998      7.6860
+    297.3130   1486.2130     35.0113      7.6810
+    297.6730   1486.2130     35.0128      7.6790
+    298.0820   1486.2170     35.0105      7.6790
+    298.4570   1486.2210     35.0113      7.6780
+    298.8360   1486.2250     35.0067      7.6790
+    299.2010   1486.2320     35.0105      7.6780
+    299.5360   1486.2340     35.0105      7.6770
+    299.9160   1486.2330     35.0105      7.6750
+    300.2870   1486.2300     35.0006      7.6760
+    300.6280   1486.2340     35.0082      7.6730
+    301.0080   1486.2360     35.0082      7.6720
+    301.4000   1486.2390     35.0052      7.6720
+    301.7580   1486.2430     35.0159      7.6680
+    302.1620   1486.2460     35.0128      7.6680
+    302.5190   1486.2480     35.0128      7.6670
+    302.8890   1486.2530     35.0029      7.6700
+    303.2670   1486.2580     35.0044      7.6690
+    303.6650   1486.2610     35.0044      7.6680
+    304.0660   1486.2670     35.0014      7.6690
+    304.4880   1486.2720     35.0029      7.6680
+    304.8880   1486.2740     35.0143      7.6630
+    305.2920   1486.2770     35.0052      7.6650
+    305.7200   1486.2790     35.0037      7.6640
+    306.1120   1486.2820     35.0044      7.6630
+    306.5120   1486.2870     35.0029      7.6630
+    306.8950   1486.2880     35.0044      7.6610
+    307.2950   1486.2930     35.0067      7.6600
+    307.6540   1486.2990     35.0037      7.6610
+    308.0280   1486.3010     35.0029      7.6600
+    308.3960   1486.3010     35.0014      7.6590
+    308.7710   1486.3020     35.0029      7.6570
+    309.2010   1486.2950     34.9915      7.6570
+    309.5940   1486.2940     34.9922      7.6550
+    310.0100   1486.2920     34.9937      7.6520
+    310.4420   1486.2920     34.9976      7.6490
+    310.8600   1486.2940     35.0021      7.6460
+    311.2390   1486.2940     34.9976      7.6460
+    311.6220   1486.2970     34.9976      7.6450
+    311.9770   1486.2960     34.9983      7.6430
+    312.3960   1486.2970     34.9968      7.6420
+    312.7660   1486.2930     34.9945      7.6400
+    313.1640   1486.2900     34.9899      7.6390
+    313.4870   1486.2860     34.9945      7.6350
+    313.8220   1486.2810     34.9922      7.6330
+    314.1390   1486.2790     34.9991      7.6290
+    314.4480   1486.2690     35.0021      7.6240
+    314.7440   1486.2590     34.9991      7.6210
+    315.0830   1486.2600     34.9953      7.6210
+    315.3840   1486.2640     34.9976      7.6200
+    315.6880   1486.2640     34.9968      7.6190
+    315.9840   1486.2710     34.9953      7.6200
+    316.3060   1486.2750     35.0067      7.6160
+    316.6240   1486.2780     34.9953      7.6190
+    316.9480   1486.2810     35.0029      7.6160
+    317.3160   1486.2880     35.0037      7.6160
+    317.6290   1486.2910     34.9953      7.6180
+    317.9540   1486.2910     34.9976      7.6160
+    318.2850   1486.2940     34.9983      7.6150
+    318.6090   1486.3010     34.9968      7.6160
+    318.9700   1486.3040     34.9998      7.6140
+    319.3430   1486.3090     34.9960      7.6150
+    319.7050   1486.3150     35.0052      7.6120
+    320.0220   1486.3180     35.0037      7.6120
+    320.3670   1486.3230     34.9968      7.6140
+    320.6680   1486.3260     35.0014      7.6120
+    320.9970   1486.3290     34.9991      7.6120
+    321.2960   1486.3340     34.9991      7.6120
+    321.6320   1486.3410     35.0037      7.6110
+    321.9760   1486.3440     34.9983      7.6120
+    322.3050   1486.3460     35.0014      7.6100
+    322.6840   1486.3480     34.9983      7.6100
+    323.0520   1486.3520     34.9937      7.6110
+    323.4010   1486.3500     34.9930      7.6090
+    323.7420   1486.3440     34.9930      7.6060
+    324.0690   1486.3430     34.9907      7.6050
+    324.4290   1486.3390     34.9892      7.6030
+    324.7600   1486.3330     34.9861      7.6010
+    325.1170   1486.3360     34.9930      7.5980
+    325.4610   1486.3430     34.9907      7.5990
+    325.8040   1486.3510     35.0021      7.5960
+    326.1350   1486.3560     34.9983      7.5970
+    326.4880   1486.3610     34.9915      7.5990
+    326.8390   1486.3660     35.0029      7.5950
+    327.1970   1486.3730     35.0006      7.5960
+    327.5190   1486.3610     34.9869      7.5960
+    327.8800   1486.3590     34.9869      7.5940
+    328.1980   1486.3670     34.9922      7.5930
+    328.5650   1486.3730     34.9976      7.5910
+    328.9050   1486.3780     34.9884      7.5940
+    329.2650   1486.3810     34.9953      7.5910
+    329.6240   1486.3770     34.9838      7.5920
+    329.9740   1486.3780     34.9892      7.5890
+    330.3130   1486.3810     34.9930      7.5870
+    330.6410   1486.3840     34.9945      7.5860
+    330.9990   1486.3830     34.9892      7.5860
+    331.3240   1486.3860     34.9960      7.5830
+    331.6690   1486.3920     34.9899      7.5850
+    332.0210   1486.3960     34.9976      7.5820
+    332.3940   1486.4010     34.9937      7.5830
+    332.7320   1486.3970     34.9953      7.5800
+    333.0930   1486.4030     34.9892      7.5820
+    333.4230   1486.3980     34.9808      7.5820
+    333.7830   1486.3990     34.9892      7.5780
+    334.1340   1486.4020     34.9838      7.5790
+    334.4770   1486.4010     34.9815      7.5780
+    334.8290   1486.4010     34.9861      7.5750
+    335.1800   1486.3970     34.9808      7.5740
+    335.5210   1486.3950     34.9838      7.5710
+    335.8630   1486.3950     34.9854      7.5690
+    336.2120   1486.4000     34.9884      7.5680
+    336.5420   1486.4000     34.9808      7.5690
+    336.8970   1486.4030     34.9907      7.5650
+    337.2310   1486.4070     34.9892      7.5650
+    337.5980   1486.3990     34.9808      7.5640
+    337.9370   1486.3980     34.9693      7.5660
+    338.3030   1486.4010     34.9792      7.5620
+    338.6470   1486.4030     34.9792      7.5610
+    338.9850   1486.4000     34.9815      7.5580
+    339.3390   1486.3970     34.9808      7.5560
+    339.6930   1486.3930     34.9854      7.5520
+    340.0590   1486.3950     34.9815      7.5520
+    340.4270   1486.3950     34.9770      7.5520
+    340.7550   1486.3930     34.9739      7.5510
+    341.0870   1486.3950     34.9831      7.5470
+    341.4200   1486.3990     34.9823      7.5470
+    341.7620   1486.4030     34.9777      7.5480
+    342.1010   1486.4070     34.9884      7.5440
+    342.4580   1486.4080     34.9937      7.5410
+    342.8170   1486.4110     34.9823      7.5440
+    343.1680   1486.4160     34.9876      7.5420
+    343.5450   1486.4200     34.9861      7.5420
+    343.8960   1486.4250     34.9884      7.5410
+    344.2010   1486.4250     34.9754      7.5440
+    344.5510   1486.4260     34.9838      7.5400
+    344.8370   1486.4230     34.9770      7.5400
+    345.2100   1486.4220     34.9777      7.5380
+    345.5360   1486.4230     34.9739      7.5380
+    345.8720   1486.4260     34.9899      7.5320
+    346.2350   1486.4290     34.9815      7.5340
+    346.5780   1486.4330     34.9777      7.5350
+    346.9020   1486.4360     34.9754      7.5350
+    347.2450   1486.4350     34.9762      7.5330
+    347.5660   1486.4280     34.9754      7.5300
+    347.9080   1486.4210     34.9686      7.5290
+    348.2690   1486.4110     34.9678      7.5250
+    348.6090   1486.4090     34.9709      7.5220
+    348.9370   1486.4090     34.9785      7.5180
+    349.2260   1486.4100     34.9754      7.5180
+    349.5750   1486.4110     34.9777      7.5160
+    349.9210   1486.4090     34.9747      7.5150
+    350.2430   1486.4150     34.9785      7.5140
+    350.6000   1486.4200     34.9777      7.5140
+    350.9300   1486.4190     34.9785      7.5120
+    351.2610   1486.4040     34.9686      7.5100
+    351.6270   1486.4030     34.9594      7.5110
+    351.9560   1486.3950     34.9670      7.5050
+    352.3010   1486.3860     34.9586      7.5040
+    352.6450   1486.3870     34.9731      7.4980
+    352.9790   1486.3940     34.9739      7.4980
+    353.3030   1486.3960     34.9747      7.4970
+    353.6870   1486.3930     34.9701      7.4960
+    354.0040   1486.3880     34.9648      7.4950
+    354.3540   1486.3960     34.9663      7.4950
+    354.6840   1486.3920     34.9686      7.4920
+    355.0160   1486.3910     34.9693      7.4900
+    355.3560   1486.3820     34.9632      7.4880
+    355.7260   1486.3780     34.9556      7.4880
+    356.0630   1486.3710     34.9579      7.4840
+    356.4350   1486.3730     34.9663      7.4800
+    356.8640   1486.3750     34.9686      7.4780
+    357.2020   1486.3850     34.9777      7.4760
+    357.5210   1486.3850     34.9617      7.4800
+    357.8540   1486.3890     34.9693      7.4770
+    358.1820   1486.3940     34.9663      7.4780
+    358.5120   1486.3990     34.9716      7.4760
+    358.8750   1486.4060     34.9724      7.4760
+    359.2310   1486.4130     34.9701      7.4770
+    359.5820   1486.4190     34.9709      7.4770
+    359.9230   1486.4230     34.9693      7.4770
+    360.2750   1486.4260     34.9701      7.4760
+    360.5830   1486.4270     34.9731      7.4740
+    360.8780   1486.4280     34.9701      7.4740
+    361.2170   1486.4240     34.9617      7.4740
+    361.5670   1486.4190     34.9533      7.4740
+    361.9040   1486.4150     34.9609      7.4690
+    362.2770   1486.4190     34.9655      7.4670
+    362.6140   1486.4230     34.9640      7.4670
+    362.9540   1486.4180     34.9648      7.4640
+    363.2820   1486.4090     34.9564      7.4630
+    363.6110   1486.4050     34.9579      7.4600
+    363.9340   1486.4040     34.9586      7.4580
+    364.2520   1486.4010     34.9556      7.4570
+    364.6080   1486.3980     34.9571      7.4540
+    364.9230   1486.4050     34.9678      7.4510
+    365.2300   1486.4020     34.9709      7.4480
+    365.5560   1486.4060     34.9632      7.4500
+    365.8920   1486.4080     34.9632      7.4490
+    366.2220   1486.4110     34.9678      7.4470
+    366.5770   1486.4170     34.9709      7.4460
+    366.9140   1486.4210     34.9693      7.4460
+    367.2720   1486.4270     34.9663      7.4470
+    367.6240   1486.4310     34.9709      7.4450
+    367.9490   1486.4360     34.9648      7.4470
+    368.2800   1486.4410     34.9609      7.4480
+    368.6240   1486.4450     34.9693      7.4450
+    368.9320   1486.4510     34.9670      7.4460
+    369.2630   1486.4510     34.9686      7.4440
+    369.6160   1486.4580     34.9754      7.4420
+    369.9710   1486.4620     34.9678      7.4440
+    370.3120   1486.4650     34.9625      7.4450
+    370.6340   1486.4720     34.9701      7.4430
+    370.9420   1486.4790     34.9716      7.4430
+    371.2610   1486.4840     34.9686      7.4440
+    371.6300   1486.4870     34.9655      7.4440
+    371.9380   1486.4930     34.9663      7.4440
+    372.2960   1486.4970     34.9678      7.4430
+    372.6310   1486.5020     34.9678      7.4430
+    372.9960   1486.5080     34.9701      7.4420
+    373.2890   1486.5120     34.9701      7.4420
+    373.6330   1486.5180     34.9640      7.4440
+    373.9360   1486.5230     34.9670      7.4430
+    374.2820   1486.5280     34.9724      7.4410
+    374.5810   1486.5330     34.9693      7.4420
+    374.9350   1486.5400     34.9701      7.4420
+    375.2740   1486.5450     34.9609      7.4450
+    375.6190   1486.5510     34.9701      7.4420
+    375.9730   1486.5550     34.9716      7.4410
+    376.3230   1486.5600     34.9739      7.4400
+    376.6510   1486.5640     34.9632      7.4430
+    377.0000   1486.5670     34.9709      7.4400
+    377.3270   1486.5710     34.9632      7.4420
+    377.6340   1486.5750     34.9625      7.4420
+    377.9600   1486.5780     34.9571      7.4430
+    378.2630   1486.5810     34.9556      7.4430
+    378.5970   1486.5850     34.9609      7.4410
+    378.9260   1486.5880     34.9617      7.4400
+    379.2470   1486.5930     34.9648      7.4390
+    379.5900   1486.5960     34.9686      7.4370
+    379.9330   1486.6010     34.9678      7.4370
+    380.2690   1486.6050     34.9693      7.4360
+    380.6150   1486.6100     34.9632      7.4380
+    380.9390   1486.6170     34.9670      7.4370
+    381.2640   1486.6190     34.9617      7.4380
+    381.6000   1486.6190     34.9602      7.4370
+    381.9440   1486.6230     34.9648      7.4350
+    382.2940   1486.6260     34.9655      7.4340
+    382.6250   1486.6290     34.9579      7.4360
+    382.9400   1486.6370     34.9564      7.4370
+    383.2480   1486.6420     34.9655      7.4340
+    383.5540   1486.6460     34.9648      7.4340
+    383.8720   1486.6510     34.9648      7.4340
+    384.1990   1486.6560     34.9579      7.4360
+    384.5740   1486.6610     34.9632      7.4340
+    384.9270   1486.6660     34.9655      7.4330
+    385.2570   1486.6700     34.9617      7.4340
+    385.5730   1486.6740     34.9632      7.4330
+    385.8780   1486.6770     34.9586      7.4340
+    386.2170   1486.6780     34.9609      7.4320
+    386.5480   1486.6810     34.9655      7.4300
+    386.9180   1486.6870     34.9625      7.4310
+    387.2420   1486.6910     34.9579      7.4320
+    387.5800   1486.6910     34.9594      7.4300
+    387.9010   1486.6910     34.9586      7.4290
+    388.2240   1486.6970     34.9648      7.4270
+    388.5520   1486.7010     34.9609      7.4280
+    388.8600   1486.7070     34.9678      7.4260
+    389.2120   1486.7110     34.9632      7.4270
+    389.5520   1486.7160     34.9655      7.4260
+    389.8820   1486.7210     34.9625      7.4270
+    390.2040   1486.7250     34.9640      7.4260
+    390.5260   1486.7300     34.9609      7.4270
+    390.8580   1486.7360     34.9609      7.4270
+    391.2140   1486.7410     34.9663      7.4250
+    391.5360   1486.7470     34.9670      7.4250
+    391.9030   1486.7520     34.9602      7.4270
+    392.2310   1486.7580     34.9571      7.4280
+    392.5460   1486.7640     34.9548      7.4290
+    392.8620   1486.7690     34.9670      7.4250
+    393.1960   1486.7730     34.9625      7.4260
+    393.4990   1486.7790     34.9602      7.4270
+    393.8260   1486.7840     34.9632      7.4260
+    394.1370   1486.7900     34.9640      7.4260
+    394.4830   1486.7950     34.9632      7.4260
+    394.8480   1486.8010     34.9602      7.4270
+    395.1530   1486.8060     34.9663      7.4250
+    395.4860   1486.8100     34.9586      7.4270
+    395.8220   1486.8180     34.9609      7.4270
+    396.1870   1486.8220     34.9686      7.4240
+    396.5540   1486.8260     34.9571      7.4270
+    396.9140   1486.8300     34.9617      7.4250
+    397.2210   1486.8330     34.9632      7.4240
+    397.5640   1486.8370     34.9586      7.4250
+    397.8570   1486.8420     34.9617      7.4240
+    398.1740   1486.8450     34.9632      7.4230
+    398.4750   1486.8470     34.9518      7.4260
+    398.7740   1486.8510     34.9602      7.4230
+    399.0820   1486.8420     34.9579      7.4200
+    399.4160   1486.8460     34.9533      7.4210
+    399.7690   1486.8450     34.9571      7.4180
+    400.1230   1486.8430     34.9541      7.4170
+    400.5030   1486.8470     34.9586      7.4150
+    400.8110   1486.8540     34.9632      7.4140
+    401.1820   1486.8590     34.9617      7.4140
+    401.5080   1486.8650     34.9625      7.4140
+    401.8510   1486.8670     34.9594      7.4140
+    402.1810   1486.8720     34.9625      7.4130
+    402.5240   1486.8750     34.9571      7.4140
+    402.8500   1486.8790     34.9648      7.4110
+    403.1790   1486.8850     34.9594      7.4130
+    403.4800   1486.8900     34.9594      7.4130
+    403.7790   1486.8930     34.9609      7.4120
+    404.0990   1486.8970     34.9533      7.4140
+    404.4280   1486.9000     34.9579      7.4120
+    404.7830   1486.9030     34.9525      7.4130
+    405.1530   1486.9040     34.9571      7.4100
+    405.5000   1486.9080     34.9525      7.4110
+    405.8440   1486.9070     34.9503      7.4100
+    406.1640   1486.9100     34.9548      7.4080
+    406.4880   1486.9210     34.9533      7.4100
+    406.8100   1486.9320     34.9579      7.4100
+    407.1140   1486.9110     34.9426      7.4080
+    407.4440   1486.9210     34.9525      7.4060
+    407.7810   1486.9070     34.9403      7.4050
+    408.1180   1486.9090     34.9525      7.4000
+    408.4500   1486.9100     34.9487      7.4000
+    408.7950   1486.9140     34.9472      7.4000
+    409.1120   1486.9150     34.9503      7.3980
+    409.4440   1486.9190     34.9518      7.3970
+    409.7960   1486.9230     34.9472      7.3980
+    410.1130   1486.9290     34.9510      7.3970
+    410.4510   1486.9310     34.9510      7.3960
+    410.7610   1486.9340     34.9525      7.3950
+    411.0880   1486.9390     34.9556      7.3940
+    411.3760   1486.9420     34.9480      7.3960
+    411.6830   1486.9450     34.9434      7.3970
+    411.9740   1486.9480     34.9510      7.3940
+    412.2730   1486.9500     34.9487      7.3940
+    412.5620   1486.9550     34.9609      7.3900
+    412.8900   1486.9600     34.9541      7.3920
+    413.2040   1486.9650     34.9541      7.3920
+    413.5690   1486.9700     34.9625      7.3890
+    413.8920   1486.9760     34.9510      7.3930
+    414.2430   1486.9800     34.9525      7.3920
+    414.5970   1486.9850     34.9579      7.3900
+    414.9140   1486.9900     34.9548      7.3910
+    415.2350   1486.9950     34.9571      7.3900
+    415.5420   1486.9980     34.9586      7.3890
+    415.8450   1487.0020     34.9457      7.3930
+    416.1560   1487.0040     34.9464      7.3920
+    416.4450   1487.0080     34.9609      7.3870
+    416.7310   1487.0110     34.9503      7.3900
+    417.0640   1487.0110     34.9518      7.3880
+    417.3920   1487.0150     34.9449      7.3900
+    417.7390   1487.0170     34.9510      7.3870
+    418.0800   1487.0180     34.9533      7.3850
+    418.4130   1487.0170     34.9510      7.3840
+    418.7500   1487.0200     34.9426      7.3860
+    419.0650   1487.0230     34.9503      7.3830
+    419.3460   1487.0240     34.9472      7.3830
+    419.6790   1487.0260     34.9442      7.3830
+    419.9610   1487.0270     34.9571      7.3780
+    420.2320   1487.0250     34.9426      7.3810
+    420.5360   1487.0240     34.9434      7.3790
+    420.8520   1487.0220     34.9472      7.3760
+    421.1930   1487.0250     34.9449      7.3760
+    421.5670   1487.0280     34.9548      7.3720
+    421.9440   1487.0330     34.9411      7.3760
+    422.3050   1487.0450     34.9556      7.3730
+    422.6170   1487.0570     34.9548      7.3750
+    422.9310   1487.0620     34.9510      7.3760
+    423.2300   1487.0670     34.9449      7.3780
+    423.5270   1487.0760     34.9518      7.3770
+    423.8300   1487.0830     34.9533      7.3770
+    424.1040   1487.0910     34.9586      7.3760
+    424.4180   1487.0980     34.9510      7.3790
+    424.7200   1487.1090     34.9586      7.3780
+    425.0330   1487.1210     34.9548      7.3810
+    425.3720   1487.1220     34.9518      7.3810
+    425.6880   1487.1110     34.9480      7.3780
+    426.0650   1487.1150     34.9396      7.3800
+    426.3980   1487.1210     34.9434      7.3790
+    426.7490   1487.1550     34.9716      7.3770
+    427.0520   1487.1740     34.9678      7.3820
+    427.3580   1487.1830     34.9586      7.3860
+    427.6570   1487.1930     34.9564      7.3880
+    427.9600   1487.2060     34.9625      7.3880
+    428.2600   1487.2130     34.9609      7.3890
+    428.5760   1487.2190     34.9525      7.3920
+    428.8820   1487.2250     34.9533      7.3920
+    429.1910   1487.2280     34.9518      7.3920
+    429.5340   1487.2310     34.9434      7.3940
+    429.8670   1487.2390     34.9640      7.3880
+    430.1920   1487.2360     34.9449      7.3920
+    430.5480   1487.2380     34.9449      7.3910
+    430.8600   1487.2440     34.9487      7.3900
+    431.1880   1487.2470     34.9556      7.3870
+    431.5010   1487.2500     34.9480      7.3890
+    431.7960   1487.2510     34.9510      7.3870
+    432.0860   1487.2560     34.9480      7.3880
+    432.3850   1487.2560     34.9442      7.3880
+    432.6820   1487.2570     34.9594      7.3820
+    433.0030   1487.2630     34.9503      7.3850
+    433.3060   1487.2630     34.9495      7.3840
+    433.6540   1487.2690     34.9525      7.3830
+    433.9950   1487.2710     34.9495      7.3830
+    434.3230   1487.2730     34.9503      7.3820
+    434.6470   1487.2740     34.9464      7.3820
+    434.9930   1487.2770     34.9442      7.3820
+    435.3050   1487.2830     34.9510      7.3800
+    435.6260   1487.2890     34.9487      7.3810
+    435.9370   1487.2930     34.9419      7.3830
+    436.2180   1487.2970     34.9472      7.3810
+    436.5220   1487.2980     34.9442      7.3810
+    436.8250   1487.3000     34.9472      7.3790
+    437.1580   1487.3000     34.9434      7.3790
+    437.4740   1487.2950     34.9319      7.3800
+    437.7910   1487.2960     34.9503      7.3730
+    438.1190   1487.2980     34.9442      7.3740
+    438.4300   1487.3020     34.9495      7.3720
+    438.7500   1487.3070     34.9518      7.3710
+    439.0560   1487.3110     34.9449      7.3730
+    439.3700   1487.3140     34.9464      7.3720
+    439.6830   1487.3180     34.9426      7.3730
+    440.0060   1487.3190     34.9419      7.3720
+    440.3100   1487.3050     34.9327      7.3700
+    440.6050   1487.3050     34.9350      7.3680
+    440.9450   1487.3070     34.9411      7.3650
+    441.2240   1487.3110     34.9472      7.3630
+    441.5370   1487.3170     34.9442      7.3640
+    441.8640   1487.3250     34.9525      7.3620
+    442.2070   1487.3330     34.9480      7.3640
+    442.5340   1487.3390     34.9487      7.3640
+    442.8530   1487.3450     34.9434      7.3660
+    443.1950   1487.3490     34.9480      7.3640
+    443.4870   1487.3540     34.9449      7.3650
+    443.8040   1487.3600     34.9487      7.3640
+    444.0810   1487.3640     34.9571      7.3610
+    444.3750   1487.3700     34.9457      7.3650
+    444.6790   1487.3740     34.9449      7.3650
+    445.0010   1487.3790     34.9510      7.3630
+    445.3140   1487.3830     34.9503      7.3630
+    445.6480   1487.3860     34.9449      7.3640
+    445.9750   1487.3850     34.9426      7.3630
+    446.2900   1487.3880     34.9442      7.3620
+    446.6020   1487.3900     34.9350      7.3640
+    446.9270   1487.3940     34.9525      7.3580
+    447.2090   1487.3940     34.9396      7.3610
+    447.5260   1487.3910     34.9365      7.3600
+    447.8360   1487.3950     34.9380      7.3590
+    448.1660   1487.3990     34.9434      7.3570
+    448.4830   1487.4010     34.9464      7.3550
+    448.8000   1487.4100     34.9403      7.3580
+    449.1210   1487.4160     34.9472      7.3560
+    449.4550   1487.4190     34.9388      7.3580
+    449.7750   1487.4230     34.9442      7.3560
+    450.1060   1487.4260     34.9449      7.3550
+    450.3940   1487.4310     34.9457      7.3550
+    450.6950   1487.4340     34.9464      7.3540
+    450.9860   1487.4360     34.9350      7.3570
+    451.2760   1487.4390     34.9426      7.3540
+    451.5550   1487.4430     34.9457      7.3530
+    451.8460   1487.4490     34.9495      7.3520
+    452.1680   1487.4530     34.9396      7.3550
+    452.4830   1487.4590     34.9487      7.3520
+    452.8030   1487.4640     34.9457      7.3530
+    453.1380   1487.4700     34.9426      7.3540
+    453.4760   1487.4790     34.9518      7.3520
+    453.8100   1487.4890     34.9495      7.3540
+    454.1550   1487.4960     34.9472      7.3550
+    454.4540   1487.5030     34.9426      7.3570
+    454.7300   1487.5090     34.9472      7.3560
+    455.0200   1487.5160     34.9426      7.3580
+    455.3260   1487.5220     34.9525      7.3550
+    455.6320   1487.5310     34.9434      7.3590
+    455.9660   1487.5400     34.9457      7.3590
+    456.3020   1487.5450     34.9365      7.3620
+    456.6220   1487.5490     34.9350      7.3620
+    456.9300   1487.5520     34.9487      7.3570
+    457.2260   1487.5540     34.9251      7.3640
+    457.5390   1487.5590     34.9495      7.3560
+    457.8460   1487.5630     34.9426      7.3580
+    458.1480   1487.5680     34.9396      7.3590
+    458.4810   1487.5730     34.9358      7.3600
+    458.8110   1487.5800     34.9403      7.3590
+    459.1100   1487.5870     34.9388      7.3600
+    459.4410   1487.5940     34.9426      7.3590
+    459.7440   1487.5960     34.9403      7.3590
+    460.0220   1487.6050     34.9472      7.3580
+    460.3250   1487.6120     34.9426      7.3600
+    460.6660   1487.6180     34.9426      7.3600
+    461.0150   1487.6220     34.9472      7.3580
+    461.3490   1487.6270     34.9442      7.3590
+    461.6380   1487.6190     34.9365      7.3580
+    461.9270   1487.6000     34.9205      7.3570
+    462.2550   1487.5980     34.9274      7.3530
+    462.5390   1487.6080     34.9342      7.3520
+    462.8530   1487.6140     34.9442      7.3490
+    463.1920   1487.6190     34.9373      7.3510
+    463.5320   1487.6240     34.9495      7.3470
+    463.8530   1487.6290     34.9457      7.3480
+    464.1610   1487.6320     34.9350      7.3510
+    464.4320   1487.6390     34.9434      7.3490
+    464.7600   1487.6430     34.9480      7.3470
+    465.0340   1487.6460     34.9442      7.3480
+    465.3620   1487.6490     34.9419      7.3480
+    465.6630   1487.6560     34.9434      7.3480
+    465.9520   1487.6470     34.9258      7.3500
+    466.2970   1487.6460     34.9426      7.3430
+    466.6080   1487.6430     34.9327      7.3440
+    466.9450   1487.6470     34.9312      7.3440
+    467.2570   1487.6540     34.9327      7.3440
+    467.5880   1487.6600     34.9365      7.3430
+    467.9140   1487.6580     34.9396      7.3400
+    468.2550   1487.6700     34.9449      7.3400
+    468.5420   1487.6730     34.9434      7.3400
+    468.8620   1487.6760     34.9228      7.3460
+    469.1480   1487.6780     34.9358      7.3410
+    469.4240   1487.6830     34.9335      7.3420
+    469.7190   1487.6880     34.9396      7.3400
+    469.9860   1487.6910     34.9380      7.3400
+    470.2800   1487.6850     34.9358      7.3380
+    470.6380   1487.6850     34.9342      7.3370
+    470.9470   1487.6860     34.9335      7.3360
+    471.3120   1487.6720     34.9182      7.3360
+    471.6420   1487.6750     34.9342      7.3300
+    471.9900   1487.6810     34.9281      7.3320
+    472.3050   1487.6830     34.9289      7.3310
+    472.6060   1487.6860     34.9365      7.3280
+    472.9370   1487.6910     34.9358      7.3280
+    473.2480   1487.6980     34.9281      7.3310
+    473.5930   1487.7030     34.9335      7.3290
+    473.8750   1487.7080     34.9312      7.3300
+    474.1610   1487.7140     34.9319      7.3300
+    474.4480   1487.7200     34.9297      7.3310
+    474.7740   1487.7210     34.9327      7.3290
+    475.0750   1487.7280     34.9312      7.3300
+    475.4250   1487.7330     34.9335      7.3290
+    475.7670   1487.7360     34.9342      7.3280
+    476.0810   1487.7390     34.9358      7.3270
+    476.3870   1487.7420     34.9304      7.3280
+    476.7070   1487.7420     34.9266      7.3280
+    477.0080   1487.7480     34.9335      7.3260
+    477.3270   1487.7530     34.9335      7.3260
+    477.6290   1487.7570     34.9258      7.3280
+    477.9450   1487.7630     34.9205      7.3300
+    478.2660   1487.7700     34.9403      7.3240
+    478.5770   1487.7720     34.9350      7.3250
+    478.8800   1487.7770     34.9228      7.3290
+    479.1970   1487.7810     34.9304      7.3260
+    479.5110   1487.7850     34.9419      7.3220
+    479.8060   1487.7910     34.9243      7.3280
+    480.1340   1487.7950     34.9266      7.3270
+    480.4720   1487.7990     34.9434      7.3210
+    480.8260   1487.8010     34.9281      7.3250
+    481.1520   1487.8050     34.9266      7.3250
+    481.4800   1487.8070     34.9182      7.3270
+    481.7890   1487.8110     34.9297      7.3230
+    482.1030   1487.8130     34.9236      7.3240
+    482.3860   1487.8180     34.9335      7.3210
+    482.6740   1487.8210     34.9228      7.3240
+    482.9470   1487.8270     34.9236      7.3240
+    483.2440   1487.8370     34.9365      7.3210
+    483.5490   1487.8360     34.9228      7.3240
+    483.8910   1487.8400     34.9304      7.3210
+    484.2070   1487.8390     34.9289      7.3200
+    484.5670   1487.8410     34.9289      7.3190
+    484.9080   1487.8450     34.9335      7.3170
+    485.2620   1487.8510     34.9182      7.3220
+    485.5810   1487.8560     34.9243      7.3200
+    485.8950   1487.8610     34.9236      7.3200
+    486.1620   1487.8670     34.9312      7.3180
+    486.4690   1487.8720     34.9312      7.3180
+    486.7560   1487.8760     34.9182      7.3220
+    487.0560   1487.8810     34.9213      7.3210
+    487.3940   1487.8860     34.9205      7.3210
+    487.6960   1487.8900     34.9258      7.3190
+    488.0210   1487.8960     34.9358      7.3160
+    488.3480   1487.8990     34.9274      7.3180
+    488.6720   1487.9030     34.9297      7.3170
+    488.9930   1487.9070     34.9289      7.3170
+    489.3360   1487.9110     34.9243      7.3180
+    489.6560   1487.9160     34.9304      7.3160
+    489.9720   1487.9190     34.9281      7.3160
+    490.2400   1487.9280     34.9319      7.3160
+    490.4980   1487.9320     34.9258      7.3180
+    490.8100   1487.9360     34.9304      7.3160
+    491.0970   1487.9370     34.9243      7.3170
+    491.3970   1487.9430     34.9190      7.3190
+    491.6830   1487.9480     34.9289      7.3160
+    492.0250   1487.9540     34.9258      7.3170
+    492.3580   1487.9590     34.9342      7.3140
+    492.6440   1487.9640     34.9258      7.3170
+    492.9830   1487.9690     34.9373      7.3130
+    493.2980   1487.9740     34.9220      7.3180
+    493.5950   1487.9790     34.9251      7.3170
+    493.8810   1487.9850     34.9228      7.3180
+    494.1590   1487.9880     34.9274      7.3160
+    494.4400   1487.9940     34.9197      7.3190
+    494.7700   1487.9980     34.9335      7.3140
+    495.0770   1488.0050     34.9258      7.3170
+    495.4050   1488.0100     34.9289      7.3160
+    495.7080   1488.0130     34.9274      7.3160
+    496.0140   1488.0180     34.9297      7.3150
+    496.2970   1488.0210     34.9319      7.3140
+    496.6040   1488.0260     34.9319      7.3140
+    496.9010   1488.0330     34.9304      7.3150
+    497.1800   1488.0370     34.9205      7.3180
+    497.5100   1488.0420     34.9258      7.3160
+    497.8260   1488.0470     34.9350      7.3130
+    498.1170   1488.0520     34.9258      7.3160
+    498.4190   1488.0570     34.9380      7.3120
+    498.7390   1488.0610     34.9251      7.3160
+    499.0160   1488.0650     34.9182      7.3180
+    499.3390   1488.0690     34.9297      7.3140
+    499.6560   1488.0720     34.9243      7.3150
+    499.9640   1488.0760     34.9205      7.3160
+    500.3080   1488.0810     34.9197      7.3160
+    500.6100   1488.0830     34.9205      7.3150
+    500.9000   1488.0890     34.9251      7.3140
+    501.2160   1488.0920     34.9258      7.3130
+    501.5240   1488.0980     34.9236      7.3140
+    501.8690   1488.1010     34.9213      7.3140
+    502.2020   1488.1030     34.9281      7.3110
+    502.5380   1488.1070     34.9205      7.3130
+    502.8700   1488.1120     34.9167      7.3140
+    503.2090   1488.1180     34.9358      7.3080
+    503.4870   1488.1220     34.9197      7.3130
+    503.7960   1488.1270     34.9228      7.3120
+    504.0890   1488.1260     34.9213      7.3110
+    504.4190   1488.1290     34.9190      7.3110
+    504.7000   1488.1330     34.9182      7.3110
+    505.0210   1488.1370     34.9205      7.3100
+    505.3660   1488.1440     34.9274      7.3080
+    505.6930   1488.1480     34.9205      7.3100
+    506.0320   1488.1550     34.9182      7.3110
+    506.3620   1488.1600     34.9213      7.3100
+    506.6510   1488.1650     34.9213      7.3100
+    506.9260   1488.1700     34.9182      7.3110
+    507.2230   1488.1750     34.9213      7.3100
+    507.5530   1488.1810     34.9312      7.3070
+    507.8770   1488.1860     34.9213      7.3100
+    508.2120   1488.1930     34.9167      7.3120
+    508.5610   1488.1980     34.9159      7.3120
+    508.8720   1488.2050     34.9266      7.3090
+    509.2240   1488.2080     34.9243      7.3090
+    509.5210   1488.2120     34.9144      7.3120
+    509.8290   1488.2160     34.9258      7.3080
+    510.1270   1488.2210     34.9228      7.3090
+    510.3890   1488.2260     34.9197      7.3100
+    510.6850   1488.2300     34.9197      7.3100
+    510.9910   1488.2330     34.9113      7.3120
+    511.3140   1488.2390     34.9304      7.3060
+    511.6460   1488.2430     34.9136      7.3110
+    512.0060   1488.2490     34.9075      7.3130
+    512.3440   1488.2540     34.9289      7.3060
+    512.6580   1488.2600     34.9174      7.3100
+    512.9660   1488.2640     34.9312      7.3050
+    513.2860   1488.2690     34.9220      7.3080
+    513.6040   1488.2730     34.9152      7.3100
+    513.9230   1488.2780     34.9174      7.3090
+    514.2150   1488.2830     34.9304      7.3050
+    514.5080   1488.2880     34.9243      7.3070
+    514.8270   1488.2900     34.9182      7.3080
+    515.1500   1488.2950     34.9152      7.3090
+    515.4880   1488.3000     34.9144      7.3090
+    515.8300   1488.3060     34.9205      7.3070
+    516.1660   1488.3120     34.9213      7.3070
+    516.4990   1488.3180     34.9243      7.3060
+    516.7720   1488.3240     34.9197      7.3080
+    517.0610   1488.3280     34.9220      7.3070
+    517.3530   1488.3340     34.9258      7.3060
+    517.6380   1488.3370     34.9152      7.3090
+    517.9660   1488.3430     34.9281      7.3050
+    518.2920   1488.3490     34.9190      7.3080
+    518.6440   1488.3540     34.9190      7.3080
+    518.9780   1488.3610     34.9197      7.3080
+    519.3460   1488.3660     34.9220      7.3070
+    519.6430   1488.3710     34.9190      7.3080
+    519.9380   1488.3760     34.9190      7.3080
+    520.2460   1488.3810     34.9159      7.3090
+    520.5470   1488.3860     34.9190      7.3080
+    520.8660   1488.3910     34.9121      7.3100
+    521.1630   1488.3960     34.9121      7.3100
+    521.4860   1488.4010     34.9091      7.3110
+    521.8070   1488.4050     34.9113      7.3100
+    522.1190   1488.4110     34.9213      7.3070
+    522.4400   1488.4150     34.9197      7.3070
+    522.7400   1488.4200     34.9197      7.3070
+    523.0470   1488.4250     34.9228      7.3060
+    523.3470   1488.4290     34.9190      7.3070
+    523.6470   1488.4340     34.9220      7.3060
+    523.9550   1488.4370     34.9113      7.3090
+    524.2530   1488.4420     34.9174      7.3070
+    524.5710   1488.4470     34.9106      7.3090
+    524.8850   1488.4510     34.9159      7.3070
+    525.2110   1488.4560     34.9159      7.3070
+    525.5310   1488.4610     34.9121      7.3080
+    525.8750   1488.4660     34.9213      7.3050
+    526.1700   1488.4720     34.9190      7.3060
+    526.4800   1488.4760     34.9152      7.3070
+    526.7610   1488.4790     34.9136      7.3070
+    527.0940   1488.4830     34.9182      7.3050
+    527.4190   1488.4870     34.9144      7.3060
+    527.7330   1488.4900     34.9152      7.3050
+    528.0680   1488.4960     34.9190      7.3040
+    528.3990   1488.5010     34.9182      7.3040
+    528.7110   1488.5050     34.9144      7.3050
+    529.0060   1488.5110     34.9121      7.3060
+    529.3510   1488.5170     34.9152      7.3050
+    529.6970   1488.5230     34.9190      7.3040
+    530.0210   1488.5280     34.9121      7.3060
+    530.3830   1488.5330     34.9113      7.3060
+    530.7230   1488.5400     34.9159      7.3050
+    531.0940   1488.5430     34.9190      7.3030
+    531.4880   1488.5490     34.9098      7.3060
+    531.8560   1488.5510     34.9213      7.3010
+    532.2260   1488.5540     34.9098      7.3040
+    532.5740   1488.5600     34.9159      7.3020
+    532.9220   1488.5640     34.9205      7.3000
+    533.2760   1488.5690     34.9167      7.3010
+    533.6050   1488.5730     34.9220      7.2990
+    533.9700   1488.5800     34.9106      7.3030
+    534.3080   1488.5850     34.9068      7.3040
+    534.6670   1488.5910     34.9129      7.3020
+    535.0350   1488.5980     34.9106      7.3030
+    535.4110   1488.6050     34.9205      7.3000
+    535.7810   1488.6110     34.9113      7.3030
+    536.1670   1488.6160     34.9129      7.3020
+    536.5070   1488.6220     34.9136      7.3020
+    536.8270   1488.6280     34.9106      7.3030
+    537.1380   1488.6320     34.9129      7.3020
+    537.4630   1488.6380     34.9136      7.3020
+    537.7920   1488.6430     34.9098      7.3030
+    538.1370   1488.6440     34.9030      7.3040
+    538.5120   1488.6500     34.9091      7.3020
+    538.9130   1488.6560     34.9144      7.3000
+    539.2930   1488.6600     34.9129      7.3000
+    539.7110   1488.6650     34.9052      7.3020
+    540.0560   1488.6720     34.9091      7.3010
+    540.4000   1488.6760     34.9167      7.2980
+    540.7010   1488.6820     34.9113      7.3000
+    540.9940   1488.6870     34.9113      7.3000
+    541.3280   1488.6900     34.9129      7.2990
+    541.6790   1488.6960     34.9129      7.2990
+    542.0380   1488.7040     34.9144      7.2990
+    542.4300   1488.7110     34.9144      7.2990
+    542.8390   1488.7140     34.9083      7.3000
+    543.2240   1488.7180     34.9129      7.2980
+    543.5540   1488.7230     34.9091      7.2990
+    543.8920   1488.7290     34.9098      7.2990
+    544.2560   1488.7340     34.9121      7.2980
+    544.5970   1488.7400     34.9091      7.2990
+    544.9040   1488.7450     34.9213      7.2950
+    545.2510   1488.7490     34.9045      7.3000
+    545.5730   1488.7560     34.9060      7.3000
+    545.9010   1488.7610     34.9144      7.2970
+    546.2850   1488.7670     34.8991      7.3020
+    546.6670   1488.7740     34.9113      7.2980
+    547.0340   1488.7790     34.9106      7.2980
+    547.4150   1488.7830     34.9060      7.2990
+    547.7910   1488.7870     34.9129      7.2960
+    548.1590   1488.7930     34.9037      7.2990
+    548.5160   1488.8000     34.9075      7.2980
+    548.8600   1488.8040     34.9098      7.2970
+    549.1860   1488.8090     34.9060      7.2980
+    549.5370   1488.8140     34.9052      7.2980
+    549.8720   1488.8190     34.9174      7.2940
+    550.2160   1488.8250     34.9022      7.2990
+    550.5700   1488.8330     34.9098      7.2970
+    550.8900   1488.8370     34.9030      7.2990
+    551.2420   1488.8420     34.9052      7.2980
+    551.5880   1488.8450     34.9091      7.2960
+    551.9580   1488.8510     34.9091      7.2960
+    552.3400   1488.8580     34.9091      7.2960
+    552.7150   1488.8650     34.9098      7.2960
+    553.0920   1488.8690     34.9022      7.2980
+    553.4610   1488.8770     34.9129      7.2950
+    553.8170   1488.8830     34.9068      7.2970
+    554.1600   1488.8890     34.9129      7.2950
+    554.4650   1488.8930     34.9060      7.2970
+    554.8220   1488.8980     34.8991      7.2990
+    555.1330   1488.9050     34.9098      7.2960
+    555.5370   1488.9100     34.9144      7.2940
+    555.9180   1488.9160     34.9052      7.2970
+    556.2590   1488.9210     34.9075      7.2960
+    556.6170   1488.9270     34.9075      7.2960
+    556.9620   1488.9320     34.9068      7.2960
+    557.3100   1488.9380     34.9129      7.2940
+    557.6430   1488.9430     34.9098      7.2950
+    557.9790   1488.9470     34.9052      7.2960
+    558.3140   1488.9550     34.9075      7.2960
+    558.6590   1488.9600     34.9098      7.2950
+    559.0410   1488.9660     34.9091      7.2950
+    559.3840   1488.9720     34.9037      7.2970
+    559.7520   1488.9780     34.9159      7.2930
+    560.0730   1488.9840     34.9068      7.2960
+    560.4130   1488.9880     34.9091      7.2950
+    560.7090   1488.9930     34.9060      7.2960
+    561.0130   1488.9980     34.9030      7.2970
+    561.2870   1489.0010     34.9045      7.2960
+    561.5860   1489.0070     34.9113      7.2940
+    561.8970   1489.0130     34.9060      7.2960
+    562.2250   1489.0180     34.9144      7.2930
+    562.5080   1489.0210     34.9045      7.2960
+    562.8440   1489.0240     34.9052      7.2950
+    563.1000   1489.0280     34.9083      7.2940
+    563.4120   1489.0340     34.9144      7.2920
+    563.7060   1489.0390     34.9060      7.2950
+    564.0020   1489.0440     34.9121      7.2930
+    564.3100   1489.0490     34.9083      7.2940
+    564.6230   1489.0540     34.9113      7.2930
+    564.9340   1489.0590     34.9052      7.2950
+    565.2710   1489.0640     34.9075      7.2940
+    565.5920   1489.0710     34.9121      7.2930
+    565.9390   1489.0750     34.9014      7.2960
+    566.2550   1489.0800     34.9075      7.2940
+    566.5750   1489.0830     34.9091      7.2930
+    566.8740   1489.0880     34.9060      7.2940
+    567.2030   1489.0950     34.9068      7.2940
+    567.5030   1489.1000     34.9068      7.2940
+    567.8330   1489.1050     34.9098      7.2930
+    568.1210   1489.1090     34.9060      7.2940
+    568.4550   1489.1160     34.9068      7.2940
+    568.7710   1489.1200     34.9060      7.2940
+    569.0960   1489.1230     34.9068      7.2930
+    569.4190   1489.1300     34.9113      7.2920
+    569.7200   1489.1340     34.9075      7.2930
+    570.0470   1489.1400     34.9052      7.2940
+    570.3710   1489.1440     34.9037      7.2940
+    570.7010   1489.1520     34.9091      7.2930
+    571.0360   1489.1560     34.9075      7.2930
+    571.3960   1489.1640     34.9060      7.2940
+    571.7480   1489.1690     34.8991      7.2960
+    572.0760   1489.1740     34.9022      7.2950
+    572.3480   1489.1780     34.8984      7.2960
+    572.6330   1489.1830     34.9014      7.2950
+    572.9270   1489.1870     34.8976      7.2960
+    573.2260   1489.1940     34.8999      7.2960
+    573.5180   1489.1990     34.9091      7.2930
+    573.8550   1489.2030     34.9045      7.2940
+    574.1990   1489.2100     34.9022      7.2950
+    574.5580   1489.2140     34.9037      7.2940
+    574.9020   1489.2200     34.9014      7.2950
+    575.2220   1489.2230     34.8991      7.2950
+    575.5340   1489.2270     34.9106      7.2910
+    575.8470   1489.2340     34.9030      7.2940
+    576.1380   1489.2380     34.9022      7.2940
+    576.4390   1489.2440     34.8999      7.2950
+    576.7740   1489.2490     34.9083      7.2920
+    577.1360   1489.2550     34.8961      7.2960
+    577.4840   1489.2620     34.9060      7.2930
+    577.8030   1489.2670     34.9030      7.2940
+    578.1460   1489.2720     34.9022      7.2940
+    578.4500   1489.2770     34.8930      7.2970
+    578.7520   1489.2830     34.8999      7.2950
+    579.0450   1489.2880     34.9091      7.2920
+    579.3250   1489.2930     34.9037      7.2940
+    579.6410   1489.2990     34.9037      7.2940
+    579.9750   1489.3050     34.9045      7.2940
+    580.3020   1489.3100     34.9037      7.2940
+    580.6290   1489.3150     34.8976      7.2960
+    580.9520   1489.3210     34.9014      7.2950
+    581.2710   1489.3240     34.8900      7.2980
+    581.5820   1489.3300     34.9030      7.2940
+    581.8870   1489.3360     34.9037      7.2940
+    582.2450   1489.3410     34.8999      7.2950
+    582.5830   1489.3470     34.9030      7.2940
+    582.9450   1489.3520     34.9052      7.2930
+    583.3000   1489.3590     34.8999      7.2950
+    583.5910   1489.3640     34.8969      7.2960
+    583.8900   1489.3680     34.9060      7.2930
+    584.1760   1489.3730     34.8999      7.2950
+    584.4890   1489.3780     34.8930      7.2970
+    584.7850   1489.3820     34.8984      7.2950
+    585.0870   1489.3880     34.9030      7.2940
+    585.3930   1489.3950     34.9045      7.2940
+    585.7420   1489.3980     34.8923      7.2970
+    586.0710   1489.4020     34.8976      7.2950
+    586.4110   1489.4070     34.8938      7.2960
+    586.7080   1489.4130     34.8946      7.2960
+    587.0540   1489.4170     34.8938      7.2960
+    587.3730   1489.4230     34.8969      7.2950
+    587.6900   1489.4270     34.9022      7.2930
+    587.9960   1489.4330     34.9030      7.2930
+    588.3040   1489.4390     34.8976      7.2950
+    588.6750   1489.4460     34.8923      7.2970
+    589.0070   1489.4500     34.9030      7.2930
+    589.3340   1489.4530     34.9037      7.2920
+    589.6420   1489.4600     34.8991      7.2940
+    589.9430   1489.4640     34.9014      7.2930
+    590.2420   1489.4690     34.9014      7.2930
+    590.5650   1489.4740     34.8984      7.2940
+    590.8930   1489.4810     34.9030      7.2930
+    591.2180   1489.4830     34.8877      7.2970
+    591.5310   1489.4880     34.9060      7.2910
+    591.8550   1489.4940     34.8969      7.2940
+    592.1990   1489.5000     34.8907      7.2960
+    592.5180   1489.5050     34.9121      7.2890
+    592.8370   1489.5110     34.8976      7.2940
+    593.1600   1489.5160     34.8969      7.2940
+    593.4580   1489.5230     34.8930      7.2960
+    593.8100   1489.5270     34.8946      7.2950
+    594.1520   1489.5320     34.8999      7.2930
+    594.4770   1489.5370     34.8999      7.2930
+    594.8080   1489.5430     34.8969      7.2940
+    595.1280   1489.5490     34.9068      7.2910
+    595.4150   1489.5540     34.9068      7.2910
+    595.7220   1489.5590     34.9037      7.2920
+    596.0170   1489.5630     34.8907      7.2960
+    596.3320   1489.5660     34.9014      7.2920
+    596.6400   1489.5740     34.8938      7.2950
+    596.9660   1489.5800     34.9068      7.2910
+    597.3230   1489.5850     34.9091      7.2900
+    597.6520   1489.5900     34.8999      7.2930
+    598.0130   1489.5940     34.8976      7.2930
+    598.3670   1489.6000     34.8953      7.2940
+    598.6620   1489.6040     34.8946      7.2940
+    598.9710   1489.6090     34.8999      7.2920
+    599.2670   1489.6140     34.8999      7.2920
+    599.5650   1489.6180     34.8900      7.2950
+    599.9000   1489.6250     34.9007      7.2920
+    600.1990   1489.6280     34.9022      7.2910
+    600.5320   1489.6340     34.8961      7.2930
+    600.8460   1489.6370     34.9037      7.2900
+    601.1500   1489.6420     34.8976      7.2920
+    601.4840   1489.6460     34.8900      7.2940
+    601.8260   1489.6520     34.8999      7.2910
+    602.1570   1489.6580     34.8969      7.2920
+    602.4860   1489.6630     34.8938      7.2930
+    602.8240   1489.6680     34.9022      7.2900
+    603.1500   1489.6730     34.8953      7.2920
+    603.4680   1489.6790     34.8991      7.2910
+    603.7650   1489.6830     34.8923      7.2930
+    604.0960   1489.6870     34.8915      7.2930
+    604.4100   1489.6920     34.8938      7.2920
+    604.7260   1489.6970     34.8907      7.2930
+    605.0710   1489.7030     34.8877      7.2940
+    605.4150   1489.7100     34.9014      7.2900
+    605.7450   1489.7150     34.8915      7.2930
+    606.0650   1489.7220     34.8869      7.2950
+    606.3750   1489.7260     34.8984      7.2910
+    606.6830   1489.7310     34.8946      7.2920
+    607.0250   1489.7370     34.8984      7.2910
+    607.3270   1489.7410     34.8946      7.2920
+    607.6620   1489.7480     34.8923      7.2930
+    608.0040   1489.7550     34.8961      7.2920
+    608.3440   1489.7600     34.8961      7.2920
+    608.7010   1489.7650     34.8923      7.2930
+    609.0250   1489.7720     34.8930      7.2930
+    609.3570   1489.7770     34.8991      7.2910
+    609.6500   1489.7820     34.8961      7.2920
+    609.9610   1489.7880     34.8877      7.2950
+    610.2660   1489.7930     34.8938      7.2930
+    610.5820   1489.7970     34.8953      7.2920
+    610.9060   1489.8030     34.8900      7.2940
+    611.2550   1489.8080     34.8984      7.2910
+    611.5790   1489.8150     34.8938      7.2930
+    611.9200   1489.8200     34.8900      7.2940
+    612.2740   1489.8270     34.8907      7.2940
+    612.6140   1489.8320     34.8869      7.2950
+    612.9520   1489.8380     34.8877      7.2950
+    613.2600   1489.8420     34.8900      7.2940
+    613.5390   1489.8480     34.9030      7.2900
+    613.8270   1489.8530     34.8877      7.2950
+    614.1130   1489.8570     34.8900      7.2940
+    614.4370   1489.8620     34.8961      7.2920
+    614.7500   1489.8690     34.8976      7.2920
+    615.0970   1489.8730     34.8900      7.2940
+    615.4000   1489.8790     34.8907      7.2940
+    615.7320   1489.8850     34.8976      7.2920
+    616.0460   1489.8890     34.8869      7.2950
+    616.3630   1489.8940     34.8900      7.2940
+    616.6440   1489.9000     34.8999      7.2910
+    616.9210   1489.9050     34.8976      7.2920
+    617.2330   1489.9090     34.9022      7.2900
+    617.5260   1489.9150     34.8915      7.2940
+    617.8410   1489.9210     34.8946      7.2930
+    618.1610   1489.9320     34.8961      7.2940
+    618.4670   1489.9380     34.9030      7.2920
+    618.7940   1489.9460     34.8961      7.2950
+    619.1050   1489.9520     34.8969      7.2950
+    619.4230   1489.9560     34.8892      7.2970
+    619.7680   1489.9630     34.8938      7.2960
+    620.0460   1489.9670     34.8930      7.2960
+    620.3530   1489.9720     34.8930      7.2960
+    620.6190   1489.9770     34.8839      7.2990
+    620.9010   1489.9820     34.8877      7.2980
+    621.2420   1489.9870     34.8839      7.2990
+    621.5330   1489.9940     34.8946      7.2960
+    621.8650   1490.0000     34.8862      7.2990
+    622.1810   1490.0020     34.8923      7.2960
+    622.5050   1490.0090     34.8907      7.2970
+    622.8000   1490.0140     34.8969      7.2950
+    623.1110   1490.0170     34.8923      7.2960
+    623.4160   1490.0220     34.8923      7.2960
+    623.7070   1490.0270     34.8892      7.2970
+    623.9930   1490.0310     34.8946      7.2950
+    624.3070   1490.0360     34.8885      7.2970
+    624.5890   1490.0420     34.8953      7.2950
+    624.9190   1490.0460     34.8877      7.2970
+    625.2210   1490.0510     34.8907      7.2960
+    625.5340   1490.0530     34.8885      7.2960
+    625.8670   1490.0580     34.8877      7.2960
+    626.1840   1490.0640     34.8854      7.2970
+    626.4920   1490.0710     34.8869      7.2970
+    626.8070   1490.0740     34.8915      7.2950
+    627.0970   1490.0800     34.8984      7.2930
+    627.4200   1490.0850     34.8923      7.2950
+    627.7540   1490.0890     34.8907      7.2950
+    628.0640   1490.0950     34.8854      7.2970
+    628.3770   1490.1010     34.8831      7.2980
+    628.6820   1490.1060     34.8923      7.2950
+    628.9790   1490.1110     34.8953      7.2940
+    629.2840   1490.1150     34.8907      7.2950
+    629.5960   1490.1210     34.8854      7.2970
+    629.9270   1490.1260     34.8946      7.2940
+    630.2540   1490.1320     34.8976      7.2930
+    630.5980   1490.1370     34.8785      7.2990
+    630.9210   1490.1420     34.8877      7.2960
+    631.2450   1490.1490     34.8953      7.2940
+    631.5690   1490.1540     34.8915      7.2950
+    631.9040   1490.1600     34.8923      7.2950
+    632.2250   1490.1650     34.8885      7.2960
+    632.5280   1490.1690     34.8907      7.2950
+    632.8350   1490.1750     34.8915      7.2950
+    633.1330   1490.1800     34.8824      7.2980
+    633.4520   1490.1830     34.8869      7.2960
+    633.7500   1490.1910     34.8923      7.2950
+    634.0630   1490.1930     34.8900      7.2950
+    634.3890   1490.2000     34.8877      7.2960
+    634.7150   1490.2060     34.8976      7.2930
+    635.0620   1490.2130     34.8953      7.2940
+    635.3930   1490.2160     34.8869      7.2960
+    635.7390   1490.2210     34.8900      7.2950
+    636.0450   1490.2280     34.8915      7.2950
+    636.3480   1490.2330     34.8877      7.2960
+    636.6600   1490.2370     34.8839      7.2970
+    636.9750   1490.2400     34.8885      7.2950
+    637.2730   1490.2440     34.8846      7.2960
+    637.6200   1490.2490     34.8869      7.2950
+    637.9330   1490.2550     34.8907      7.2940
+    638.2580   1490.2610     34.8816      7.2970
+    638.5560   1490.2650     34.8808      7.2970
+    638.8730   1490.2710     34.8846      7.2960
+    639.1790   1490.2770     34.8885      7.2950
+    639.4950   1490.2830     34.8801      7.2980
+    639.8170   1490.2890     34.8961      7.2930
+    640.1570   1490.2940     34.8801      7.2980
+    640.5010   1490.2990     34.8793      7.2980
+    640.8320   1490.3060     34.8930      7.2940
+    641.1230   1490.3120     34.8907      7.2950
+    641.4230   1490.3160     34.8869      7.2960
+    641.7450   1490.3220     34.8808      7.2980
+    642.0560   1490.3270     34.8900      7.2950
+    642.4060   1490.3320     34.8892      7.2950
+    642.7370   1490.3390     34.8969      7.2930
+    643.0620   1490.3480     34.8877      7.2970
+    643.3890   1490.3570     34.8930      7.2960
+    643.7020   1490.3610     34.8923      7.2960
+    644.0060   1490.3670     34.8839      7.2990
+    644.3140   1490.3750     34.8892      7.2980
+    644.6220   1490.3800     34.8862      7.2990
+    644.9500   1490.3870     34.8839      7.3000
+    645.2870   1490.3920     34.8839      7.3000
+    645.6110   1490.3980     34.8808      7.3010
+    645.9600   1490.4020     34.8824      7.3000
+    646.2620   1490.4080     34.8923      7.2970
+    646.5920   1490.4110     34.8816      7.3000
+    646.8900   1490.4170     34.8854      7.2990
+    647.2200   1490.4220     34.8907      7.2970
+    647.5120   1490.4300     34.8839      7.3000
+    647.8320   1490.4360     34.8907      7.2980
+    648.1580   1490.4420     34.8824      7.3010
+    648.4990   1490.4460     34.8839      7.3000
+    648.8140   1490.4540     34.8892      7.2990
+    649.1410   1490.4610     34.8969      7.2970
+    649.4620   1490.4660     34.8900      7.2990
+    649.7970   1490.4700     34.8885      7.2990
+    650.1090   1490.4760     34.8862      7.3000
+    650.4400   1490.4820     34.8869      7.3000
+    650.7520   1490.4860     34.8854      7.3000
+    651.0630   1490.4930     34.8869      7.3000
+    651.3570   1490.4980     34.8839      7.3010
+    651.6740   1490.5020     34.8740      7.3040
+    651.9830   1490.5090     34.8816      7.3020
+    652.3010   1490.5140     34.8877      7.3000
+    652.6580   1490.5170     34.8824      7.3010
+    652.9940   1490.5240     34.8831      7.3010
+    653.3450   1490.5290     34.8854      7.3000
+    653.6700   1490.5350     34.8831      7.3010
+    653.9720   1490.5420     34.8816      7.3020
+    654.2690   1490.5480     34.8763      7.3040
+    654.5630   1490.5520     34.8846      7.3010
+    654.8510   1490.5580     34.8885      7.3000
+    655.1630   1490.5620     34.8816      7.3020
+    655.5130   1490.5660     34.8770      7.3030
+    655.8530   1490.5720     34.8801      7.3020
+    656.2080   1490.5780     34.8831      7.3010
+    656.5440   1490.5850     34.8846      7.3010
+    656.8770   1490.5910     34.8846      7.3010
+    657.1820   1490.5950     34.8808      7.3020
+    657.4710   1490.6010     34.8907      7.2990
+    657.7890   1490.6070     34.8885      7.3000
+    658.1060   1490.6110     34.8846      7.3010
+    658.4180   1490.6180     34.8770      7.3040
+    658.7120   1490.6220     34.8793      7.3030
+    659.0340   1490.6280     34.8885      7.3000
+    659.3310   1490.6320     34.8785      7.3030
+    659.6420   1490.6390     34.8801      7.3030
+    659.9900   1490.6440     34.8793      7.3030
+    660.3230   1490.6510     34.8808      7.3030
+    660.6500   1490.6570     34.8930      7.2990
+    661.0000   1490.6620     34.8801      7.3030
+    661.3280   1490.6680     34.8778      7.3040
+    661.6620   1490.6740     34.8869      7.3010
+    661.9590   1490.6780     34.8801      7.3030
+    662.2800   1490.6840     34.8869      7.3010
+    662.5960   1490.6890     34.8839      7.3020
+    662.9130   1490.6960     34.8885      7.3010
+    663.2340   1490.7000     34.8900      7.3000
+    663.5410   1490.7070     34.8885      7.3010
+    663.8460   1490.7100     34.8869      7.3010
+    664.1300   1490.7150     34.8839      7.3020
+    664.4400   1490.7200     34.8778      7.3040
+    664.7480   1490.7260     34.8785      7.3040
+    665.0690   1490.7320     34.8793      7.3040
+    665.4100   1490.7370     34.8877      7.3010
+    665.7350   1490.7420     34.8808      7.3030
+    666.0850   1490.7490     34.8824      7.3030
+    666.4450   1490.7550     34.8854      7.3020
+    666.7700   1490.7600     34.8816      7.3030
+    667.0970   1490.7650     34.8816      7.3030
+    667.4260   1490.7700     34.8808      7.3030
+    667.7040   1490.7770     34.8801      7.3040
+    668.0230   1490.7820     34.8854      7.3020
+    668.3420   1490.7870     34.8732      7.3060
+    668.6500   1490.7910     34.8755      7.3050
+    668.9830   1490.7930     34.8755      7.3040
+    669.2700   1490.7990     34.8763      7.3040
+    669.5690   1490.8040     34.8824      7.3020
+    669.8790   1490.8100     34.8770      7.3040
+    670.2210   1490.8140     34.8785      7.3030
+    670.5380   1490.8210     34.8740      7.3050
+    670.8600   1490.8260     34.8770      7.3040
+    671.2210   1490.8320     34.8770      7.3040
+    671.5420   1490.8380     34.8709      7.3060
+    671.8340   1490.8420     34.8862      7.3010
+    672.1580   1490.8470     34.8763      7.3040
+    672.4800   1490.8510     34.8785      7.3030
+    672.8180   1490.8560     34.8778      7.3030
+    673.1740   1490.8600     34.8732      7.3040
+    673.5140   1490.8650     34.8816      7.3010
+    673.8430   1490.8710     34.8824      7.3010
+    674.1330   1490.8760     34.8793      7.3020
+    674.4300   1490.8810     34.8824      7.3010
+    674.7160   1490.8850     34.8785      7.3020
+    675.0170   1490.8890     34.8808      7.3010
+    675.3190   1490.8950     34.8785      7.3020
+    675.6160   1490.9020     34.8801      7.3020
+    675.9480   1490.9070     34.8740      7.3040
+    676.2910   1490.9130     34.8740      7.3040
+    676.6380   1490.9160     34.8717      7.3040
+    676.9850   1490.9230     34.8816      7.3010
+    677.3010   1490.9250     34.8701      7.3040
+    677.6230   1490.9300     34.8755      7.3020
+    677.9560   1490.9340     34.8686      7.3040
+    678.2950   1490.9390     34.8740      7.3020
+    678.5940   1490.9440     34.8709      7.3030
+    678.9100   1490.9480     34.8732      7.3020
+    679.1900   1490.9540     34.8831      7.2990
+    679.4980   1490.9580     34.8732      7.3020
+    679.7880   1490.9640     34.8770      7.3010
+    680.1140   1490.9700     34.8747      7.3020
+    680.4390   1490.9770     34.8785      7.3010
+    680.7770   1490.9830     34.8793      7.3010
+    681.1300   1490.9880     34.8755      7.3020
+    681.4420   1490.9930     34.8724      7.3030
+    681.7380   1490.9980     34.8816      7.3000
+    682.0570   1491.0040     34.8755      7.3020
+    682.3690   1491.0110     34.8770      7.3020
+    682.6950   1491.0140     34.8694      7.3040
+    683.0180   1491.0200     34.8755      7.3020
+    683.3470   1491.0260     34.8701      7.3040
+    683.6910   1491.0330     34.8770      7.3020
+    684.0130   1491.0400     34.8816      7.3010
+    684.3320   1491.0440     34.8740      7.3030
+    684.6190   1491.0490     34.8778      7.3020
+    684.9230   1491.0540     34.8709      7.3040
+    685.2260   1491.0580     34.8732      7.3030
+    685.5030   1491.0640     34.8717      7.3040
+    685.8410   1491.0700     34.8717      7.3040
+    686.1660   1491.0730     34.8793      7.3010
+    686.5040   1491.0790     34.8701      7.3040
+    686.8460   1491.0840     34.8755      7.3020
+    687.1630   1491.0900     34.8640      7.3060
+    687.5080   1491.0960     34.8763      7.3020
+    687.8360   1491.1010     34.8824      7.3000
+    688.1430   1491.1030     34.8671      7.3040
+    688.4510   1491.1060     34.8747      7.3010
+    688.7420   1491.1120     34.8755      7.3010
+    689.0380   1491.1160     34.8656      7.3040
+    689.3590   1491.1220     34.8755      7.3010
+    689.6790   1491.1260     34.8717      7.3020
+    690.0090   1491.1320     34.8717      7.3020
+    690.3250   1491.1370     34.8717      7.3020
+    690.6620   1491.1430     34.8778      7.3000
+    690.9700   1491.1490     34.8785      7.3000
+    691.2710   1491.1510     34.8701      7.3020
+    691.5930   1491.1580     34.8717      7.3020
+    691.9030   1491.1620     34.8740      7.3010
+    692.2590   1491.1710     34.8732      7.3020
+    692.5860   1491.1760     34.8785      7.3000
+    692.9160   1491.1840     34.8717      7.3030
+    693.2530   1491.1910     34.8663      7.3050
+    693.5510   1491.1940     34.8740      7.3020
+    693.8520   1491.1990     34.8709      7.3030
+    694.1750   1491.2060     34.8755      7.3020
+    694.4690   1491.2110     34.8724      7.3030
+    694.8080   1491.2160     34.8839      7.2990
+    695.1300   1491.2200     34.8679      7.3040
+    695.4500   1491.2250     34.8701      7.3030
+    695.7800   1491.2300     34.8671      7.3040
+    696.1220   1491.2350     34.8663      7.3040
+    696.4650   1491.2430     34.8679      7.3040
+    696.7710   1491.2470     34.8671      7.3040
+    697.1160   1491.2520     34.8763      7.3010
+    697.4380   1491.2590     34.8679      7.3040
+    697.7660   1491.2640     34.8740      7.3020
+    698.1040   1491.2670     34.8717      7.3020
+    698.4210   1491.2730     34.8663      7.3040
+    698.7370   1491.2770     34.8770      7.3000
+    698.9840   1491.2810     34.8679      7.3030
+    699.3100   1491.2880     34.8724      7.3020
+    699.6090   1491.2920     34.8717      7.3020
+    699.9390   1491.2970     34.8587      7.3060
+    700.2600   1491.3010     34.8701      7.3020
+    700.5990   1491.3090     34.8656      7.3040
+    700.9360   1491.3140     34.8686      7.3030
+    701.2530   1491.3190     34.8709      7.3020
+    701.5910   1491.3240     34.8679      7.3030
+    701.9120   1491.3290     34.8732      7.3010
+    702.1980   1491.3350     34.8778      7.3000
+    702.4860   1491.3400     34.8717      7.3020
+    702.8000   1491.3450     34.8740      7.3010
+    703.1100   1491.3500     34.8648      7.3040
+    703.3980   1491.3530     34.8785      7.2990
+    703.7230   1491.3590     34.8701      7.3020
+    704.0630   1491.3640     34.8633      7.3040
+    704.4010   1491.3690     34.8694      7.3020
+    704.7040   1491.3740     34.8656      7.3030
+    704.9800   1491.3790     34.8694      7.3020
+    705.2540   1491.3850     34.8732      7.3010
+    705.5730   1491.3930     34.8694      7.3030
+    705.8770   1491.3960     34.8740      7.3010
+    706.1570   1491.4030     34.8663      7.3040
+    706.4480   1491.4070     34.8694      7.3030
+    706.7280   1491.4120     34.8694      7.3030
+    707.0680   1491.4180     34.8663      7.3040
+    707.3790   1491.4240     34.8763      7.3010
+    707.6760   1491.4280     34.8663      7.3040
+    707.9940   1491.4350     34.8740      7.3020
+    708.3300   1491.4390     34.8755      7.3010
+    708.6520   1491.4450     34.8701      7.3030
+    709.0170   1491.4500     34.8663      7.3040
+    709.3490   1491.4560     34.8633      7.3050
+    709.6450   1491.4610     34.8633      7.3050
+    709.9560   1491.4670     34.8671      7.3040
+    710.2700   1491.4710     34.8663      7.3040
+    710.5860   1491.4780     34.8701      7.3030
+    710.8970   1491.4830     34.8763      7.3010
+    711.2130   1491.4890     34.8679      7.3040
+    711.5120   1491.4930     34.8701      7.3030
+    711.8290   1491.4980     34.8671      7.3040
+    712.1460   1491.5040     34.8701      7.3030
+    712.4610   1491.5080     34.8694      7.3030
+    712.7900   1491.5120     34.8679      7.3030
+    713.1040   1491.5180     34.8686      7.3030
+    713.4430   1491.5230     34.8717      7.3020
+    713.7940   1491.5290     34.8717      7.3020
+    714.1040   1491.5350     34.8755      7.3010
+    714.4390   1491.5400     34.8686      7.3030
+    714.7230   1491.5450     34.8778      7.3000
+    715.0350   1491.5500     34.8656      7.3040
+    715.3420   1491.5540     34.8648      7.3040
+    715.6390   1491.5590     34.8648      7.3040
+    715.9540   1491.5640     34.8618      7.3050
+    716.3050   1491.5690     34.8610      7.3050
+    716.6050   1491.5730     34.8694      7.3020
+    716.9110   1491.5800     34.8709      7.3020
+    717.2610   1491.5850     34.8671      7.3030
+    717.5800   1491.5910     34.8671      7.3030
+    717.9030   1491.5950     34.8663      7.3030
+    718.2450   1491.6000     34.8656      7.3030
+    718.5770   1491.6070     34.8732      7.3010
+    718.8790   1491.6130     34.8740      7.3010
+    719.1880   1491.6170     34.8602      7.3050
+    719.4940   1491.6220     34.8694      7.3020
+    719.7990   1491.6270     34.8663      7.3030
+    720.1310   1491.6310     34.8595      7.3050
+    720.4280   1491.6370     34.8694      7.3020
+    720.7590   1491.6410     34.8618      7.3040
+    721.0610   1491.6470     34.8656      7.3030
+    721.3660   1491.6520     34.8625      7.3040
+    721.6970   1491.6570     34.8618      7.3040
+    722.0130   1491.6630     34.8595      7.3050
+    722.3320   1491.6690     34.8663      7.3030
+    722.6820   1491.6750     34.8663      7.3030
+    723.0110   1491.6800     34.8656      7.3030
+    723.3440   1491.6860     34.8633      7.3040
+    723.6530   1491.6900     34.8686      7.3020
+    723.9620   1491.6960     34.8694      7.3020
+    724.2480   1491.7010     34.8633      7.3040
+    724.5650   1491.7060     34.8625      7.3040
+    724.8850   1491.7130     34.8671      7.3030
+    725.2050   1491.7170     34.8633      7.3040
+    725.5440   1491.7230     34.8602      7.3050
+    725.8280   1491.7280     34.8633      7.3040
+    726.1580   1491.7330     34.8724      7.3010
+    726.4350   1491.7390     34.8579      7.3060
+    726.7570   1491.7430     34.8694      7.3020
+    727.0780   1491.7490     34.8633      7.3040
+    727.4020   1491.7540     34.8633      7.3040
+    727.7450   1491.7600     34.8633      7.3040
+    728.0910   1491.7670     34.8648      7.3040
+    728.4220   1491.7710     34.8663      7.3030
+    728.7590   1491.7770     34.8694      7.3020
+    729.0580   1491.7820     34.8633      7.3040
+    729.3850   1491.7870     34.8663      7.3030
+    729.6740   1491.7920     34.8694      7.3020
+    730.0090   1491.7980     34.8602      7.3050
+    730.3240   1491.8030     34.8633      7.3040
+    730.6110   1491.8070     34.8656      7.3030
+    730.9120   1491.8130     34.8724      7.3010
+    731.2230   1491.8180     34.8572      7.3060
+    731.5220   1491.8240     34.8640      7.3040
+    731.8260   1491.8290     34.8579      7.3060
+    732.1810   1491.8330     34.8686      7.3020
+    732.5230   1491.8390     34.8656      7.3030
+    732.8400   1491.8450     34.8602      7.3050
+    733.1510   1491.8500     34.8633      7.3040
+    733.4570   1491.8540     34.8656      7.3030
+    733.7380   1491.8600     34.8663      7.3030
+    734.0430   1491.8650     34.8633      7.3040
+    734.3500   1491.8710     34.8610      7.3050
+    734.6540   1491.8740     34.8625      7.3040
+    734.9610   1491.8800     34.8572      7.3060
+    735.2700   1491.8850     34.8564      7.3060
+    735.5500   1491.8900     34.8633      7.3040
+    735.8700   1491.8970     34.8648      7.3040
+    736.1920   1491.9000     34.8625      7.3040
+    736.5100   1491.9070     34.8640      7.3040
+    736.8300   1491.9100     34.8587      7.3050
+    737.1570   1491.9150     34.8648      7.3030
+    737.4580   1491.9200     34.8618      7.3040
+    737.7630   1491.9250     34.8557      7.3060
+    738.0570   1491.9310     34.8656      7.3030
+    738.3750   1491.9360     34.8656      7.3030
+    738.6610   1491.9410     34.8595      7.3050
+    738.9890   1491.9480     34.8602      7.3050
+    739.2920   1491.9530     34.8572      7.3060
+    739.6090   1491.9580     34.8602      7.3050
+    739.8850   1491.9630     34.8541      7.3070
+    740.2070   1491.9680     34.8602      7.3050
+    740.5410   1491.9730     34.8564      7.3060
+    740.8470   1491.9780     34.8595      7.3050
+    741.1830   1491.9850     34.8640      7.3040
+    741.5040   1491.9900     34.8572      7.3060
+    741.8310   1491.9960     34.8671      7.3030
+    742.1480   1492.0000     34.8633      7.3040
+    742.4570   1492.0060     34.8602      7.3050
+    742.7650   1492.0120     34.8610      7.3050
+    743.0610   1492.0160     34.8572      7.3060
+    743.3730   1492.0220     34.8610      7.3050
+    743.6680   1492.0280     34.8618      7.3050
+    743.9740   1492.0320     34.8579      7.3060
+    744.2790   1492.0360     34.8633      7.3040
+    744.6210   1492.0420     34.8663      7.3030
+    744.9190   1492.0480     34.8701      7.3020
+    745.2100   1492.0540     34.8587      7.3060
+    745.5280   1492.0590     34.8679      7.3030
+    745.8640   1492.0630     34.8572      7.3060
+    746.1660   1492.0690     34.8579      7.3060
+    746.4990   1492.0750     34.8648      7.3040
+    746.8090   1492.0790     34.8549      7.3070
+    747.1100   1492.0860     34.8534      7.3080
+    747.4530   1492.0900     34.8579      7.3060
+    747.7490   1492.0960     34.8618      7.3050
+    748.0600   1492.1010     34.8587      7.3060
+    748.3570   1492.1070     34.8656      7.3040
+    748.6760   1492.1100     34.8663      7.3030
+    749.0080   1492.1140     34.8625      7.3040
+    749.2950   1492.1190     34.8534      7.3070
+    749.6040   1492.1250     34.8541      7.3070
+    749.8980   1492.1280     34.8618      7.3040
+    750.2300   1492.1350     34.8625      7.3040
+    750.5340   1492.1400     34.8595      7.3050
+    750.8460   1492.1460     34.8633      7.3040
+    751.1740   1492.1510     34.8633      7.3040
+    751.5140   1492.1570     34.8450      7.3100
+    751.8310   1492.1620     34.8572      7.3060
+    752.1370   1492.1660     34.8526      7.3070
+    752.4340   1492.1720     34.8625      7.3040
+    752.7110   1492.1770     34.8572      7.3060
+    752.9940   1492.1820     34.8572      7.3060
+    753.2980   1492.1870     34.8511      7.3080
+    753.6380   1492.1910     34.8557      7.3060
+    753.9910   1492.1960     34.8610      7.3040
+    754.3250   1492.2020     34.8557      7.3060
+    754.6470   1492.2080     34.8526      7.3070
+    754.9380   1492.2120     34.8518      7.3070
+    755.2620   1492.2190     34.8625      7.3040
+    755.5400   1492.2220     34.8549      7.3060
+    755.8440   1492.2280     34.8557      7.3060
+    756.1490   1492.2330     34.8557      7.3060
+    756.4490   1492.2390     34.8625      7.3040
+    756.7460   1492.2440     34.8595      7.3050
+    757.0610   1492.2490     34.8564      7.3060
+    757.3700   1492.2540     34.8564      7.3060
+    757.6820   1492.2590     34.8595      7.3050
+    758.0140   1492.2650     34.8534      7.3070
+    758.3480   1492.2720     34.8549      7.3070
+    758.6680   1492.2750     34.8587      7.3050
+    758.9940   1492.2820     34.8572      7.3060
+    759.3130   1492.2850     34.8549      7.3060
+    759.6410   1492.2920     34.8564      7.3060
+    759.9590   1492.2980     34.8602      7.3050
+    760.2520   1492.3030     34.8572      7.3060
+    760.5580   1492.3070     34.8526      7.3070
+    760.8410   1492.3130     34.8541      7.3070
+    761.1270   1492.3180     34.8572      7.3060
+    761.4560   1492.3240     34.8549      7.3070
+    761.7810   1492.3290     34.8511      7.3080
+    762.1240   1492.3340     34.8534      7.3070
+    762.4710   1492.3410     34.8549      7.3070
+    762.7890   1492.3460     34.8602      7.3050
+    763.0910   1492.3510     34.8572      7.3060
+    763.4220   1492.3560     34.8572      7.3060
+    763.7310   1492.3620     34.8579      7.3060
+    764.0520   1492.3670     34.8572      7.3060
+    764.3800   1492.3740     34.8587      7.3060
+    764.7490   1492.3800     34.8495      7.3090
+    765.0840   1492.3850     34.8518      7.3080
+    765.4180   1492.3900     34.8541      7.3070
+    765.7490   1492.3960     34.8549      7.3070
+    766.0770   1492.4020     34.8488      7.3090
+    766.4080   1492.4050     34.8503      7.3080
+    766.6910   1492.4110     34.8602      7.3050
+    766.9990   1492.4160     34.8572      7.3060
+    767.2980   1492.4210     34.8541      7.3070
+    767.6190   1492.4270     34.8541      7.3070
+    767.9300   1492.4320     34.8541      7.3070
+    768.2800   1492.4380     34.8450      7.3100
+    768.6290   1492.4440     34.8579      7.3060
+    768.9610   1492.4500     34.8518      7.3080
+    769.3070   1492.4570     34.8587      7.3060
+    769.6290   1492.4620     34.8495      7.3090
+    769.9620   1492.4670     34.8518      7.3080
+    770.2620   1492.4720     34.8488      7.3090
+    770.5720   1492.4760     34.8511      7.3080
+    770.8960   1492.4830     34.8526      7.3080
+    771.2120   1492.4880     34.8488      7.3090
+    771.5410   1492.4950     34.8625      7.3050
+    771.8910   1492.5010     34.8564      7.3070
+    772.1930   1492.5060     34.8534      7.3080
+    772.5540   1492.5110     34.8557      7.3070
+    772.9060   1492.5160     34.8488      7.3090
+    773.1890   1492.5230     34.8503      7.3090
+    773.5240   1492.5270     34.8495      7.3090
+    773.8330   1492.5330     34.8503      7.3090
+    774.1510   1492.5380     34.8495      7.3090
+    774.4570   1492.5440     34.8503      7.3090
+    774.7850   1492.5500     34.8511      7.3090
+    775.1440   1492.5560     34.8541      7.3080
+    775.4480   1492.5610     34.8541      7.3080
+    775.7910   1492.5670     34.8480      7.3100
+    776.1180   1492.5730     34.8511      7.3090
+    776.4520   1492.5790     34.8579      7.3070
+    776.7710   1492.5830     34.8541      7.3080
+    777.0710   1492.5880     34.8534      7.3080
+    777.4020   1492.5950     34.8518      7.3090
+    777.7090   1492.5990     34.8511      7.3090
+    778.0560   1492.6060     34.8488      7.3100
+    778.3620   1492.6120     34.8557      7.3080
+    778.6670   1492.6170     34.8495      7.3100
+    779.0100   1492.6210     34.8511      7.3090
+    779.3290   1492.6260     34.8511      7.3090
+    779.6480   1492.6320     34.8511      7.3090
+    779.9500   1492.6390     34.8526      7.3090
+    780.2790   1492.6430     34.8518      7.3090
+    780.6100   1492.6490     34.8518      7.3090
+    780.9260   1492.6550     34.8465      7.3110
+    781.2330   1492.6600     34.8526      7.3090
+    781.5680   1492.6660     34.8557      7.3080
+    781.8890   1492.6710     34.8557      7.3080
+    782.2320   1492.6760     34.8518      7.3090
+    782.5410   1492.6820     34.8434      7.3120
+    782.8620   1492.6870     34.8495      7.3100
+    783.1730   1492.6930     34.8526      7.3090
+    783.5030   1492.6980     34.8526      7.3090
+    783.8150   1492.7030     34.8526      7.3090
+    784.1280   1492.7090     34.8495      7.3100
+    784.4650   1492.7150     34.8564      7.3080
+    784.7450   1492.7180     34.8457      7.3110
+    785.0770   1492.7230     34.8450      7.3110
+    785.4190   1492.7300     34.8434      7.3120
+    785.7690   1492.7360     34.8495      7.3100
+    786.1070   1492.7410     34.8518      7.3090
+    786.4320   1492.7430     34.8434      7.3110
+    786.7540   1492.7510     34.8450      7.3110
+    787.0590   1492.7540     34.8404      7.3120
+    787.3730   1492.7590     34.8526      7.3080
+    787.6900   1492.7640     34.8495      7.3090
+    787.9870   1492.7710     34.8480      7.3100
+    788.3180   1492.7770     34.8541      7.3080
+    788.6150   1492.7820     34.8511      7.3090
+    788.9650   1492.7870     34.8503      7.3090
+    789.2790   1492.7930     34.8511      7.3090
+    789.5990   1492.7990     34.8457      7.3110
+    789.9280   1492.8040     34.8480      7.3100
+    790.2760   1492.8100     34.8488      7.3100
+    790.6060   1492.8160     34.8488      7.3100
+    790.9000   1492.8220     34.8495      7.3100
+    791.1990   1492.8260     34.8457      7.3110
+    791.5140   1492.8320     34.8495      7.3100
+    791.8560   1492.8360     34.8419      7.3120
+    792.1990   1492.8430     34.8518      7.3090
+    792.5220   1492.8480     34.8549      7.3080
+    792.8400   1492.8530     34.8549      7.3080
+    793.1490   1492.8580     34.8419      7.3120
+    793.4560   1492.8620     34.8503      7.3090
+    793.7560   1492.8690     34.8427      7.3120
+    794.0700   1492.8730     34.8419      7.3120
+    794.4090   1492.8790     34.8480      7.3100
+    794.7190   1492.8850     34.8549      7.3080
+    795.0600   1492.8920     34.8442      7.3120
+    795.3940   1492.8960     34.8366      7.3140
+    795.7060   1492.9010     34.8549      7.3080
+    796.0320   1492.9060     34.8450      7.3110
+    796.3240   1492.9120     34.8518      7.3090
+    796.6380   1492.9180     34.8465      7.3110
+    796.9620   1492.9220     34.8488      7.3100
+    797.2630   1492.9280     34.8465      7.3110
+    797.5980   1492.9340     34.8495      7.3100
+    797.9380   1492.9400     34.8465      7.3110
+    798.2620   1492.9460     34.8442      7.3120
+    798.6020   1492.9500     34.8457      7.3110
+    798.9360   1492.9560     34.8434      7.3120
+    799.1880   1492.9620     34.8450      7.3120
+    799.4930   1492.9660     34.8465      7.3110
+    799.8010   1492.9720     34.8442      7.3120
+    800.1030   1492.9780     34.8480      7.3110
+    800.4550   1492.9850     34.8396      7.3140
+    800.7600   1492.9900     34.8457      7.3120
+    801.0980   1492.9970     34.8473      7.3120
+    801.4150   1493.0020     34.8465      7.3120
+    801.7130   1493.0080     34.8442      7.3130
+    802.0280   1493.0130     34.8442      7.3130
+    802.3460   1493.0180     34.8503      7.3110
+    802.6640   1493.0240     34.8412      7.3140
+    802.9900   1493.0270     34.8366      7.3150
+    803.3030   1493.0330     34.8434      7.3130
+    803.6080   1493.0370     34.8427      7.3130
+    803.9140   1493.0440     34.8434      7.3130
+    804.2020   1493.0470     34.8457      7.3120
+    804.5030   1493.0520     34.8488      7.3110
+    804.8020   1493.0570     34.8396      7.3140
+    805.1260   1493.0630     34.8366      7.3150
+    805.4250   1493.0700     34.8412      7.3140
+    805.7040   1493.0740     34.8442      7.3130
+    806.0510   1493.0800     34.8381      7.3150
+    806.3350   1493.0850     34.8412      7.3140
+    806.6580   1493.0890     34.8404      7.3140
+    806.9640   1493.0950     34.8404      7.3140
+    807.2750   1493.1020     34.8419      7.3140
+    807.5980   1493.1070     34.8419      7.3140
+    807.9090   1493.1110     34.8412      7.3140
+    808.1860   1493.1160     34.8442      7.3130
+    808.5220   1493.1210     34.8404      7.3140
+    808.8240   1493.1250     34.8366      7.3150
+    809.1360   1493.1310     34.8465      7.3120
+    809.4460   1493.1360     34.8495      7.3110
+    809.7710   1493.1400     34.8480      7.3110
+    810.0760   1493.1470     34.8434      7.3130
+    810.3770   1493.1540     34.8511      7.3110
+    810.6730   1493.1610     34.8473      7.3130
+    810.9770   1493.1660     34.8465      7.3130
+    811.2740   1493.1720     34.8511      7.3120
+    811.5950   1493.1750     34.8457      7.3130
+    811.9230   1493.1790     34.8412      7.3140
+    812.2390   1493.1850     34.8419      7.3140
+    812.5720   1493.1900     34.8328      7.3170
+    812.9150   1493.1950     34.8381      7.3150
+    813.2390   1493.2020     34.8450      7.3130
+    813.5480   1493.2070     34.8419      7.3140
+    813.8480   1493.2130     34.8396      7.3150
+    814.1790   1493.2170     34.8480      7.3120
+    814.4630   1493.2220     34.8419      7.3140
+    814.7400   1493.2260     34.8503      7.3110
+    815.0730   1493.2300     34.8373      7.3150
+    815.3740   1493.2370     34.8419      7.3140
+    815.6870   1493.2420     34.8412      7.3140
+    816.0150   1493.2480     34.8450      7.3130
+    816.3690   1493.2530     34.8442      7.3130
+    816.6930   1493.2580     34.8473      7.3120
+    817.0240   1493.2650     34.8389      7.3150
+    817.3070   1493.2700     34.8419      7.3140
+    817.6200   1493.2750     34.8480      7.3120
+    817.9110   1493.2810     34.8457      7.3130
+    818.2030   1493.2860     34.8427      7.3140
+    818.5160   1493.2910     34.8427      7.3140
+    818.8580   1493.2970     34.8465      7.3130
+    819.1790   1493.3030     34.8434      7.3140
+    819.4940   1493.3060     34.8419      7.3140
+    819.8050   1493.3120     34.8366      7.3160
+    820.1460   1493.3170     34.8419      7.3140
+    820.4320   1493.3210     34.8381      7.3150
+    820.7400   1493.3270     34.8358      7.3160
+    821.0440   1493.3340     34.8404      7.3150
+    821.3600   1493.3380     34.8358      7.3160
+    821.6750   1493.3430     34.8389      7.3150
+    822.0090   1493.3500     34.8434      7.3140
+    822.3060   1493.3550     34.8373      7.3160
+    822.6260   1493.3600     34.8335      7.3170
+    822.9450   1493.3670     34.8442      7.3140
+    823.2620   1493.3710     34.8404      7.3150
+    823.5730   1493.3770     34.8351      7.3170
+    823.9140   1493.3830     34.8442      7.3140
+    824.1880   1493.3890     34.8358      7.3170
+    824.5040   1493.3940     34.8419      7.3150
+    824.8110   1493.3980     34.8412      7.3150
+    825.1060   1493.4040     34.8389      7.3160
+    825.4150   1493.4090     34.8419      7.3150
+    825.7280   1493.4150     34.8396      7.3160
+    826.0710   1493.4190     34.8351      7.3170
+    826.3900   1493.4250     34.8442      7.3140
+    826.7190   1493.4300     34.8381      7.3160
+    827.0290   1493.4350     34.8381      7.3160
+    827.3290   1493.4420     34.8396      7.3160
+    827.6320   1493.4460     34.8389      7.3160
+    827.9450   1493.4520     34.8419      7.3150
+    828.2420   1493.4570     34.8389      7.3160
+    828.5770   1493.4620     34.8419      7.3150
+    828.9030   1493.4680     34.8419      7.3150
+    829.1850   1493.4720     34.8328      7.3180
+    829.5090   1493.4780     34.8419      7.3150
+    829.8200   1493.4830     34.8297      7.3190
+    830.1290   1493.4890     34.8396      7.3160
+    830.4430   1493.4940     34.8366      7.3170
+    830.7540   1493.4990     34.8419      7.3150
+    831.0830   1493.5050     34.8427      7.3150
+    831.3910   1493.5090     34.8358      7.3170
+    831.7110   1493.5150     34.8358      7.3170
+    832.0200   1493.5200     34.8358      7.3170
+    832.3030   1493.5250     34.8389      7.3160
+    832.5860   1493.5300     34.8396      7.3160
+    832.8800   1493.5360     34.8373      7.3170
+    833.2080   1493.5420     34.8373      7.3170
+    833.5130   1493.5460     34.8335      7.3180
+    833.8300   1493.5520     34.8373      7.3170
+    834.1760   1493.5570     34.8427      7.3150
+    834.4580   1493.5630     34.8312      7.3190
+    834.8000   1493.5680     34.8373      7.3170
+    835.1060   1493.5740     34.8351      7.3180
+    835.4170   1493.5780     34.8335      7.3180
+    835.7460   1493.5840     34.8373      7.3170
+    836.0230   1493.5870     34.8328      7.3180
+    836.3340   1493.5920     34.8358      7.3170
+    836.6320   1493.5960     34.8412      7.3150
+    836.9430   1493.6030     34.8366      7.3170
+    837.2430   1493.6080     34.8427      7.3150
+    837.5370   1493.6130     34.8366      7.3170
+    837.8430   1493.6180     34.8305      7.3190
+    838.1360   1493.6230     34.8335      7.3180
+    838.4740   1493.6300     34.8373      7.3170
+    838.8290   1493.6360     34.8404      7.3160
+    839.1390   1493.6410     34.8343      7.3180
+    839.4650   1493.6460     34.8373      7.3170
+    839.7520   1493.6510     34.8312      7.3190
+    840.0810   1493.6580     34.8381      7.3170
+    840.3730   1493.6630     34.8320      7.3190
+    840.6360   1493.6660     34.8373      7.3170
+    840.9650   1493.6720     34.8343      7.3180
+    841.2730   1493.6770     34.8404      7.3160
+    841.5950   1493.6820     34.8373      7.3170
+    841.9590   1493.6890     34.8351      7.3180
+    842.3140   1493.6940     34.8373      7.3170
+    842.6920   1493.7000     34.8282      7.3200
+    843.0270   1493.7070     34.8381      7.3170
+    843.3630   1493.7120     34.8343      7.3180
+    843.7290   1493.7180     34.8343      7.3180
+    844.0880   1493.7250     34.8412      7.3160
+    844.4030   1493.7290     34.8373      7.3170
+    844.7570   1493.7350     34.8343      7.3180
+    845.0970   1493.7410     34.8404      7.3160
+    845.4050   1493.7460     34.8312      7.3190
+    845.7260   1493.7510     34.8312      7.3190
+    846.0350   1493.7570     34.8259      7.3210
+    846.3330   1493.7630     34.8358      7.3180
+    846.6940   1493.7700     34.8335      7.3190
+    847.0300   1493.7750     34.8389      7.3170
+    847.3940   1493.7810     34.8267      7.3210
+    847.7130   1493.7860     34.8297      7.3200
+    848.0250   1493.7910     34.8320      7.3190
+    848.3210   1493.7950     34.8373      7.3170
+    848.6320   1493.8000     34.8373      7.3170
+    848.9090   1493.8050     34.8282      7.3200
+    849.1910   1493.8090     34.8343      7.3180
+    849.4600   1493.8150     34.8412      7.3160
+    849.7140   1493.8170     34.8335      7.3180
+    849.9870   1493.8220     34.8335      7.3180
+    850.2550   1493.8270     34.8343      7.3180
+    850.5410   1493.8350     34.8335      7.3190
+    850.8450   1493.8420     34.8320      7.3200
+    851.1980   1493.8450     34.8328      7.3190
+    851.4920   1493.8530     34.8412      7.3170
+    851.8360   1493.8580     34.8289      7.3210
+    852.1540   1493.8630     34.8343      7.3190
+    852.4520   1493.8660     34.8328      7.3190
+    852.7440   1493.8720     34.8305      7.3200
+    853.0580   1493.8750     34.8289      7.3200
+    853.3770   1493.8820     34.8335      7.3190
+    853.7210   1493.8850     34.8282      7.3200
+    854.1250   1493.8930     34.8289      7.3200
+    854.5020   1493.9000     34.8297      7.3200
+    854.9040   1493.9080     34.8274      7.3210
+    855.2560   1493.9140     34.8396      7.3170
+    855.6120   1493.9200     34.8305      7.3200
+    855.9950   1493.9260     34.8274      7.3210
+    856.3700   1493.9350     34.8389      7.3180
+    856.7700   1493.9410     34.8351      7.3190
+    857.1770   1493.9490     34.8358      7.3190
+    857.5820   1493.9540     34.8282      7.3210
+    857.9720   1493.9610     34.8381      7.3180
+    858.3610   1493.9670     34.8373      7.3180
+    858.6930   1493.9740     34.8328      7.3200
+    859.0830   1493.9800     34.8259      7.3220
+    859.4550   1493.9860     34.8289      7.3210
+    859.8270   1493.9930     34.8419      7.3170
+    860.2200   1494.0000     34.8328      7.3200
+    860.5970   1494.0060     34.8328      7.3200
+    861.0020   1494.0130     34.8328      7.3200
+    861.3660   1494.0190     34.8358      7.3190
+    861.7720   1494.0240     34.8251      7.3220
+    862.1650   1494.0330     34.8335      7.3200
+    862.5700   1494.0400     34.8335      7.3200
+    862.9730   1494.0460     34.8358      7.3190
+    863.3860   1494.0530     34.8328      7.3200
+    863.7360   1494.0590     34.8267      7.3220
+    864.1030   1494.0650     34.8328      7.3200
+    864.4450   1494.0710     34.8328      7.3200
+    864.8090   1494.0780     34.8305      7.3210
+    865.2010   1494.0840     34.8305      7.3210
+    865.5750   1494.0910     34.8312      7.3210
+    865.9620   1494.0980     34.8282      7.3220
+    866.3810   1494.1040     34.8244      7.3230
+    866.7730   1494.1100     34.8206      7.3240
+    867.1620   1494.1180     34.8312      7.3210
+    867.5450   1494.1250     34.8259      7.3230
+    867.9260   1494.1310     34.8282      7.3220
+    868.3290   1494.1370     34.8335      7.3200
+    868.6990   1494.1430     34.8213      7.3240
+    869.1000   1494.1500     34.8343      7.3200
+    869.4930   1494.1550     34.8267      7.3220
+    869.8940   1494.1630     34.8305      7.3210
+    870.2780   1494.1700     34.8251      7.3230
+    870.6730   1494.1760     34.8274      7.3220
+    871.0770   1494.1830     34.8274      7.3220
+    871.4670   1494.1910     34.8289      7.3220
+    871.8950   1494.1970     34.8282      7.3220
+    872.2880   1494.2040     34.8282      7.3220
+    872.7040   1494.2120     34.8259      7.3230
+    873.0940   1494.2180     34.8259      7.3230
+    873.5080   1494.2250     34.8320      7.3210
+    873.9000   1494.2320     34.8289      7.3220
+    874.2910   1494.2370     34.8183      7.3250
+    874.6780   1494.2450     34.8289      7.3220
+    875.0750   1494.2520     34.8259      7.3230
+    875.4540   1494.2590     34.8267      7.3230
+    875.8440   1494.2650     34.8267      7.3230
+    876.2720   1494.2730     34.8267      7.3230
+    876.6810   1494.2800     34.8274      7.3230
+    877.0890   1494.2880     34.8312      7.3220
+    877.5010   1494.2930     34.8297      7.3220
+    877.8910   1494.3020     34.8312      7.3220
+    878.3100   1494.3090     34.8312      7.3220
+    878.6760   1494.3140     34.8274      7.3230
+    879.0490   1494.3200     34.8274      7.3230
+    879.4580   1494.3260     34.8297      7.3220
+    879.8690   1494.3340     34.8335      7.3210
+    880.2230   1494.3390     34.8297      7.3220
+    880.5430   1494.3440     34.8328      7.3210
+    880.8490   1494.3480     34.8259      7.3230
+    881.1720   1494.3550     34.8236      7.3240
+    881.5360   1494.3610     34.8236      7.3240
+    881.9080   1494.3680     34.8244      7.3240
+    882.3070   1494.3740     34.8297      7.3220
+    882.6960   1494.3830     34.8259      7.3240
+    883.1250   1494.3880     34.8305      7.3220
+    883.5210   1494.3960     34.8251      7.3240
+    883.9360   1494.4030     34.8221      7.3250
+    884.3280   1494.4090     34.8312      7.3220
+    884.7930   1494.4190     34.8267      7.3240
+    885.2790   1494.4230     34.8198      7.3250
+    885.7240   1494.4310     34.8267      7.3230
+    885.9760   1494.4330     34.8221      7.3240
+    886.0460   1494.4350     34.8228      7.3240
+    886.1500   1494.4360     34.8190      7.3250
+    886.3860   1494.4420     34.8267      7.3230
+    886.7560   1494.4490     34.8305      7.3220
+    887.1040   1494.4540     34.8236      7.3240
+    887.4420   1494.4610     34.8244      7.3240
+    887.6910   1494.4650     34.8213      7.3250
+    887.9680   1494.4690     34.8206      7.3250
+    888.2240   1494.4740     34.8274      7.3230
+    888.4940   1494.4770     34.8175      7.3260
+    888.7840   1494.4830     34.8213      7.3250
+    889.0890   1494.4880     34.8213      7.3250
+    889.3840   1494.4940     34.8221      7.3250
+    889.7080   1494.5000     34.8251      7.3240
+    890.0260   1494.5060     34.8228      7.3250
+    890.3050   1494.5100     34.8221      7.3250
+    890.5060   1494.5130     34.8251      7.3240
+    890.6830   1494.5150     34.8274      7.3230
+    890.8640   1494.5190     34.8251      7.3240
+    891.1580   1494.5250     34.8289      7.3230
+    891.5100   1494.5300     34.8251      7.3240
+    891.8220   1494.5350     34.8251      7.3240
+    892.1060   1494.5400     34.8221      7.3250
+    892.4240   1494.5450     34.8190      7.3260
+    892.7690   1494.5520     34.8198      7.3260
+    893.1160   1494.5580     34.8259      7.3240
+    893.4600   1494.5640     34.8236      7.3250
+    893.8220   1494.5700     34.8228      7.3250
+    894.1730   1494.5760     34.8236      7.3250
+    894.5420   1494.5820     34.8228      7.3250
+    894.8890   1494.5880     34.8175      7.3270
+    895.2540   1494.5950     34.8267      7.3240
+    895.6210   1494.6000     34.8167      7.3270
+    895.9600   1494.6050     34.8167      7.3270
+    896.3260   1494.6120     34.8297      7.3230
+    896.6640   1494.6180     34.8267      7.3240
+    896.9910   1494.6230     34.8228      7.3250
+    897.2990   1494.6280     34.8198      7.3260
+    897.6090   1494.6340     34.8236      7.3250
+    897.8770   1494.6380     34.8198      7.3260
+    898.1690   1494.6430     34.8175      7.3270
+    898.4680   1494.6470     34.8259      7.3240
+    898.7690   1494.6540     34.8274      7.3240
+    899.0310   1494.6570     34.8259      7.3240
+    899.3490   1494.6640     34.8274      7.3240
+    899.6400   1494.6680     34.8175      7.3270
+    899.9230   1494.6730     34.8206      7.3260
+    900.2230   1494.6780     34.8175      7.3270
+    900.4850   1494.6820     34.8206      7.3260
+    900.7960   1494.6870     34.8236      7.3250
+    901.0840   1494.6930     34.8213      7.3260
+    901.3980   1494.6980     34.8335      7.3220
+    901.6790   1494.7020     34.8175      7.3270
+    901.9640   1494.7050     34.8190      7.3260
+    902.2380   1494.7110     34.8259      7.3240
+    902.5390   1494.7150     34.8221      7.3250
+    902.8330   1494.7200     34.8221      7.3250
+    903.1500   1494.7250     34.8251      7.3240
+    903.4480   1494.7290     34.8152      7.3270
+    903.7290   1494.7350     34.8190      7.3260
+    904.0220   1494.7400     34.8129      7.3280
+    904.3120   1494.7460     34.8206      7.3260
+    904.5930   1494.7500     34.8228      7.3250
+    904.8640   1494.7560     34.8175      7.3270
+    905.1570   1494.7600     34.8198      7.3260
+    905.4470   1494.7650     34.8267      7.3240
+    905.7280   1494.7700     34.8145      7.3280
+    906.0210   1494.7750     34.8267      7.3240
+    906.3060   1494.7790     34.8228      7.3250
+    906.6120   1494.7860     34.8213      7.3260
+    906.8990   1494.7900     34.8236      7.3250
+    907.2130   1494.7950     34.8114      7.3290
+    907.5020   1494.8000     34.8206      7.3260
+    907.8140   1494.8040     34.8228      7.3250
+    908.1000   1494.8110     34.8183      7.3270
+    908.4030   1494.8150     34.8206      7.3260
+    908.6790   1494.8210     34.8190      7.3270
+    908.9610   1494.8250     34.8244      7.3250
+    909.2700   1494.8300     34.8152      7.3280
+    909.5640   1494.8350     34.8183      7.3270
+    909.8690   1494.8400     34.8244      7.3250
+    910.1450   1494.8440     34.8175      7.3270
+    910.4020   1494.8500     34.8251      7.3250
+    910.6590   1494.8540     34.8183      7.3270
+    910.9310   1494.8590     34.8221      7.3260
+    911.2710   1494.8630     34.8236      7.3250
+    911.5720   1494.8700     34.8221      7.3260
+    911.9050   1494.8760     34.8221      7.3260
+    912.2500   1494.8800     34.8152      7.3280
+    912.5710   1494.8860     34.8183      7.3270
+    912.8320   1494.8900     34.8152      7.3280
+    913.0720   1494.8950     34.8190      7.3270
+    913.3390   1494.8990     34.8183      7.3270
+    913.5990   1494.9040     34.8129      7.3290
+    913.9030   1494.9070     34.8175      7.3270
+    914.1880   1494.9130     34.8213      7.3260
+    914.4750   1494.9180     34.8244      7.3250
+    914.7880   1494.9230     34.8152      7.3280
+    915.0900   1494.9290     34.8190      7.3270
+    915.4080   1494.9330     34.8152      7.3280
+    915.7190   1494.9390     34.8183      7.3270
+    916.0330   1494.9450     34.8251      7.3250
+    916.3160   1494.9490     34.8213      7.3260
+    916.5870   1494.9540     34.8221      7.3260
+    916.8630   1494.9580     34.8152      7.3280
+    917.1440   1494.9630     34.8160      7.3280
+    917.4020   1494.9690     34.8167      7.3280
+    917.7020   1494.9730     34.8221      7.3260
+    917.9940   1494.9770     34.8091      7.3300
+    918.3040   1494.9810     34.8114      7.3290
+    918.6110   1494.9860     34.8175      7.3270
+    918.8990   1494.9910     34.8145      7.3280
+    919.1820   1494.9960     34.8145      7.3280
+    919.4740   1495.0010     34.8206      7.3260
+    919.7570   1495.0060     34.8152      7.3280
+    920.0210   1495.0110     34.8122      7.3290
+    920.3300   1495.0150     34.8145      7.3280
+    920.6440   1495.0220     34.8190      7.3270
+    920.9310   1495.0270     34.8160      7.3280
+    921.2440   1495.0320     34.8099      7.3300
+    921.5050   1495.0370     34.8228      7.3260
+    921.7840   1495.0410     34.8251      7.3250
+    922.0500   1495.0460     34.8190      7.3270
+    922.3460   1495.0510     34.8190      7.3270
+    922.6620   1495.0570     34.8106      7.3300
+    922.9960   1495.0620     34.8129      7.3290
+    923.2990   1495.0680     34.8167      7.3280
+    923.6340   1495.0730     34.8106      7.3300
+    923.9160   1495.0780     34.8198      7.3270
+    924.2000   1495.0830     34.8106      7.3300
+    924.4750   1495.0860     34.8160      7.3280
+    924.7410   1495.0920     34.8167      7.3280
+    925.0410   1495.0960     34.8160      7.3280
+    925.3310   1495.1010     34.8160      7.3280
+    925.6220   1495.1050     34.8213      7.3260
+    925.9290   1495.1120     34.8228      7.3260
+    926.2160   1495.1170     34.8145      7.3290
+    926.5390   1495.1230     34.8175      7.3280
+    926.8590   1495.1280     34.8175      7.3280
+    927.1490   1495.1320     34.8167      7.3280
+    927.4730   1495.1370     34.8099      7.3300
+    927.7720   1495.1440     34.8145      7.3290
+    928.0690   1495.1480     34.8137      7.3290
+    928.3420   1495.1540     34.8122      7.3300
+    928.6440   1495.1570     34.8167      7.3280
+    928.9460   1495.1630     34.8114      7.3300
+    929.1820   1495.1670     34.8114      7.3300
+    929.4490   1495.1700     34.8129      7.3290
+    929.6520   1495.1740     34.8137      7.3290
+    929.8920   1495.1790     34.8206      7.3270
+    930.1550   1495.1820     34.8160      7.3280
+    930.4220   1495.1880     34.8114      7.3300
+    930.7050   1495.1920     34.8198      7.3270
+    930.9930   1495.1970     34.8137      7.3290
+    931.2660   1495.2020     34.8145      7.3290
+    931.5310   1495.2060     34.8198      7.3270
+    931.8110   1495.2110     34.8114      7.3300
+    932.0660   1495.2160     34.8145      7.3290
+    932.3280   1495.2200     34.8114      7.3300
+    932.6370   1495.2250     34.8175      7.3280
+    932.9140   1495.2290     34.8137      7.3290
+    933.1900   1495.2350     34.8183      7.3280
+    933.4780   1495.2400     34.8122      7.3300
+    933.7590   1495.2440     34.8206      7.3270
+    934.0480   1495.2490     34.8145      7.3290
+    934.3390   1495.2550     34.8152      7.3290
+    934.6360   1495.2600     34.8122      7.3300
+    934.9380   1495.2630     34.8076      7.3310
+    935.2250   1495.2660     34.8061      7.3310
+    935.5260   1495.2710     34.8091      7.3300
+    935.7930   1495.2760     34.8129      7.3290
+    936.0720   1495.2810     34.8129      7.3290
+    936.3210   1495.2860     34.8137      7.3290
+    936.6210   1495.2910     34.8106      7.3300
+    936.8940   1495.2970     34.8183      7.3280
+    937.2090   1495.3000     34.8099      7.3300
+    937.4900   1495.3080     34.8160      7.3290
+    937.8030   1495.3130     34.8091      7.3310
+    938.1360   1495.3180     34.8152      7.3290
+    938.5390   1495.3240     34.8114      7.3300
+    938.9030   1495.3310     34.8091      7.3310
+    939.2510   1495.3370     34.8122      7.3300
+    939.5910   1495.3430     34.8152      7.3290
+    939.9370   1495.3490     34.8129      7.3300
+    940.2730   1495.3540     34.8122      7.3300
+    940.5610   1495.3600     34.8129      7.3300
+    940.9350   1495.3660     34.8129      7.3300
+    941.2700   1495.3720     34.8129      7.3300
+    941.6100   1495.3780     34.8137      7.3300
+    941.9840   1495.3820     34.8175      7.3280
+    942.3380   1495.3880     34.8114      7.3300
+    942.7080   1495.3960     34.8129      7.3300
+    943.0650   1495.4020     34.8160      7.3290
+    943.4190   1495.4080     34.8099      7.3310
+    943.7850   1495.4130     34.8122      7.3300
+    944.1280   1495.4190     34.8122      7.3300
+    944.4360   1495.4260     34.8167      7.3290
+    944.7830   1495.4310     34.8160      7.3290
+    945.1080   1495.4370     34.8137      7.3300
+    945.4360   1495.4420     34.8129      7.3300
+    945.7780   1495.4470     34.8129      7.3300
+    946.1430   1495.4530     34.8152      7.3290
+    946.5150   1495.4600     34.8099      7.3310
+    946.8640   1495.4650     34.8061      7.3320
+    947.2070   1495.4710     34.8099      7.3310
+    947.5360   1495.4780     34.8137      7.3300
+    947.8650   1495.4830     34.8137      7.3300
+    948.1770   1495.4880     34.8068      7.3320
+    948.5260   1495.4940     34.8137      7.3300
+    948.8750   1495.5000     34.8137      7.3300
+    949.2180   1495.5070     34.8114      7.3310
+    949.5770   1495.5120     34.8076      7.3320
+    949.9200   1495.5180     34.8137      7.3300
+    950.2620   1495.5220     34.8091      7.3310
+    950.5910   1495.5280     34.8129      7.3300
+    950.9590   1495.5350     34.8106      7.3310
+    951.2900   1495.5420     34.8114      7.3310
+    951.6460   1495.5460     34.8068      7.3320
+    951.9660   1495.5510     34.8099      7.3310
+    952.3140   1495.5560     34.8122      7.3300
+    952.6600   1495.5630     34.8099      7.3310
+    953.0210   1495.5670     34.8114      7.3300
+    953.3490   1495.5740     34.8068      7.3320
+    953.6790   1495.5790     34.8061      7.3320
+    954.0060   1495.5860     34.8015      7.3340
+    954.3380   1495.5910     34.8099      7.3310
+    954.6540   1495.5970     34.8076      7.3320
+    955.0130   1495.6020     34.8099      7.3310
+    955.3350   1495.6080     34.8068      7.3320
+    955.6860   1495.6150     34.8076      7.3320
+    956.0350   1495.6220     34.8091      7.3320
+    956.4080   1495.6290     34.8152      7.3300
+    956.7710   1495.6330     34.8076      7.3320
+    957.1130   1495.6380     34.8099      7.3310
+    957.4330   1495.6440     34.8106      7.3310
+    957.7360   1495.6500     34.8022      7.3340
+    958.0810   1495.6560     34.8206      7.3280
+    958.4120   1495.6620     34.8152      7.3300
+    958.7560   1495.6670     34.8114      7.3310
+    959.1120   1495.6730     34.8114      7.3310
+    959.4570   1495.6790     34.8145      7.3300
+    959.7880   1495.6850     34.8061      7.3330
+    960.0770   1495.6900     34.8122      7.3310
+    960.4170   1495.6960     34.8152      7.3300
+    960.7510   1495.7010     34.8091      7.3320
+    961.0850   1495.7060     34.8114      7.3310
+    961.4000   1495.7120     34.8122      7.3310
+    961.7280   1495.7180     34.8091      7.3320
+    962.0630   1495.7230     34.8122      7.3310
+    962.3680   1495.7270     34.8076      7.3320
+    962.6890   1495.7320     34.8106      7.3310
+    962.9570   1495.7380     34.8122      7.3310
+    963.2560   1495.7430     34.8083      7.3320
+    963.5790   1495.7480     34.8083      7.3320
+    963.9010   1495.7530     34.8053      7.3330
+    964.2360   1495.7580     34.8076      7.3320
+    964.5310   1495.7640     34.8053      7.3330
+    964.8200   1495.7690     34.8114      7.3310
+    965.1180   1495.7750     34.8091      7.3320
+    965.4470   1495.7790     34.8145      7.3300
+    965.7590   1495.7860     34.8038      7.3340
+    966.0480   1495.7910     34.8099      7.3320
+    966.3810   1495.7950     34.8114      7.3310
+    966.6960   1495.8010     34.8091      7.3320
+    967.0370   1495.8070     34.8091      7.3320
+    967.3380   1495.8110     34.8114      7.3310
+    967.6640   1495.8170     34.8000      7.3350
+    967.9970   1495.8210     34.8106      7.3310
+    968.3280   1495.8270     34.8106      7.3310
+    968.6380   1495.8320     34.8106      7.3310
+    968.9830   1495.8370     34.8007      7.3340
+    969.3150   1495.8440     34.8053      7.3330
+    969.6030   1495.8470     34.8007      7.3340
+    969.8800   1495.8530     34.8076      7.3320
+    970.1950   1495.8590     34.8114      7.3310
+    970.5100   1495.8650     34.8091      7.3320
+    970.8470   1495.8700     34.8114      7.3310
+    971.2080   1495.8780     34.8099      7.3320
+    971.5650   1495.8840     34.8099      7.3320
+    971.9230   1495.8900     34.8007      7.3350
+    972.2640   1495.8960     34.8068      7.3330
+    972.5990   1495.9010     34.7977      7.3360
+    972.9440   1495.9080     34.8106      7.3320
+    973.2810   1495.9120     34.8091      7.3320
+    973.5840   1495.9170     34.8091      7.3320
+    973.9320   1495.9230     34.8122      7.3310
+    974.2300   1495.9290     34.8038      7.3340
+    974.5610   1495.9330     34.8061      7.3330
+    974.8780   1495.9400     34.7984      7.3360
+    975.2170   1495.9460     34.8076      7.3330
+    975.5560   1495.9510     34.8099      7.3320
+    975.9130   1495.9590     34.8053      7.3340
+    976.2810   1495.9640     34.7984      7.3360
+    976.6020   1495.9690     34.8045      7.3340
+    976.9460   1495.9750     34.8076      7.3330
+    977.2820   1495.9800     34.8068      7.3330
+    977.6320   1495.9860     34.8099      7.3320
+    977.9440   1495.9920     34.8045      7.3340
+    978.2540   1495.9970     34.8076      7.3330
+    978.5240   1496.0010     34.8038      7.3340
+    978.6910   1496.0040     34.8015      7.3350
+    978.8170   1496.0060     34.8068      7.3330
+    978.9060   1496.0070     34.8068      7.3330
+    979.0540   1496.0100     34.8076      7.3330
+    979.1960   1496.0120     34.8068      7.3330
+    979.3430   1496.0150     34.8045      7.3340
+    979.4680   1496.0170     34.8015      7.3350
+    979.5770   1496.0190     34.8045      7.3340
+    979.7110   1496.0210     34.8007      7.3350
+    979.9130   1496.0240     34.8007      7.3350
+    980.0920   1496.0280     34.8045      7.3340
+    980.2970   1496.0310     34.8076      7.3330
+    980.4800   1496.0340     34.8015      7.3350
+    980.6730   1496.0370     34.8038      7.3340
+    980.8120   1496.0400     34.7984      7.3360
+    980.9480   1496.0420     34.8076      7.3330
+    981.0980   1496.0440     34.8099      7.3320
+    981.2610   1496.0470     34.8007      7.3350
+    981.4210   1496.0500     34.7984      7.3360
+    981.5760   1496.0520     34.8038      7.3340
+    981.7420   1496.0560     34.8045      7.3340
+    981.8560   1496.0570     34.8038      7.3340
+    981.9040   1496.0580     34.8045      7.3340
+    981.9260   1496.0580     34.8007      7.3350
+    982.0250   1496.0590     34.8038      7.3340
+    982.0800   1496.0610     34.7954      7.3370
+    982.1820   1496.0630     34.8045      7.3340
+    982.2530   1496.0640     34.8045      7.3340
+    982.3090   1496.0660     34.8053      7.3340
+    982.3930   1496.0670     34.8022      7.3350
+    982.4450   1496.0670     34.8106      7.3320
+    982.4950   1496.0680     34.8076      7.3330
+    982.5220   1496.0680     34.8038      7.3340
+    982.5900   1496.0680     34.8000      7.3350
+    982.6850   1496.0710     34.8045      7.3340
+    982.7480   1496.0720     34.8076      7.3330
+    982.8530   1496.0750     34.7961      7.3370
+    982.9310   1496.0760     34.8114      7.3320
+    982.9480   1496.0760     34.7984      7.3360
+    982.9550   1496.0750     34.8007      7.3350
+    982.9560   1496.0750     34.8007      7.3350
+    982.9750   1496.0760     34.8045      7.3340
+    982.9980   1496.0770     34.8015      7.3350
+    983.0210   1496.0760     34.8038      7.3340
+    983.0380   1496.0770     34.7984      7.3360
+    983.0420   1496.0770     34.8106      7.3320
+    983.0540   1496.0760     34.8030      7.3340
+    983.0780   1496.0770     34.8038      7.3340
+    983.0910   1496.0780     34.8076      7.3330
+    983.1270   1496.0790     34.8015      7.3350
+    983.1280   1496.0780     34.8007      7.3350
+    983.1310   1496.0800     34.8053      7.3340
+    983.1440   1496.0780     34.8038      7.3340
+    983.1660   1496.0800     34.8053      7.3340
+    983.1840   1496.0800     34.8076      7.3330
+    983.2080   1496.0800     34.7984      7.3360
+    983.2120   1496.0800     34.8045      7.3340
+    983.2380   1496.0800     34.8007      7.3350
+    983.2630   1496.0810     34.8045      7.3340
+    983.2710   1496.0800     34.8007      7.3350
@@ -0,0 +1,772 @@
+test_read_store_and_write
+6/5/2012
+16:21:51
+Probe: XBT
+Source: /root/package/data/input/turo/FK001_XBT001_may6.nc
+      0.6700   1482.6143     29.8538      9.7340
+      1.3400   1481.9508     29.9553      9.5170
+      2.0100   1481.8531     30.0568      9.4540
+      2.6800   1481.6887     30.1582      9.3730
+      3.3400   1481.5848     30.2582      9.3090
+      4.0100   1481.6420     30.3589      9.2880
+      4.6800   1481.7362     30.4604      9.2770
+      5.3500   1481.8564     30.5618      9.2730
+      6.0200   1481.9877     30.6633      9.2720
+      6.6900   1482.1265     30.7648      9.2730
+      7.3600   1482.2429     30.8662      9.2680
+      8.0300   1482.3188     30.9677      9.2520
+      8.6900   1482.4001     31.0677      9.2380
+      9.3600   1482.3723     31.1684      9.1940
+     10.0300   1482.2782     31.2706      9.1320
+     10.7000   1481.9572     31.3782      9.0070
+     11.3700   1481.5530     31.4857      8.8600
+     12.0400   1481.1921     31.5933      8.7250
+     12.7000   1480.7301     31.7001      8.5640
+     13.3700   1480.2758     31.8077      8.4050
+     14.0400   1479.9292     31.9153      8.2750
+     14.7100   1479.5244     32.0229      8.1300
+     15.3800   1479.1407     32.1304      7.9910
+     16.0500   1478.8512     32.2388      7.8770
+     16.7100   1478.6234     32.3448      7.7800
+     17.3800   1478.2516     32.4524      7.6450
+     18.0500   1477.7975     32.5600      7.4890
+     18.7200   1477.3030     32.6683      7.3230
+     19.3800   1477.1410     32.7744      7.2440
+     20.0500   1477.0367     32.8773      7.1810
+     20.7200   1476.6571     32.9216      7.0660
+     21.3900   1476.3427     32.9659      6.9680
+     22.0600   1476.2028     33.0101      6.9150
+     22.7200   1476.1395     33.0536      6.8820
+     23.3900   1476.0813     33.0978      6.8500
+     24.0600   1476.0620     33.1421      6.8280
+     24.7300   1476.0271     33.1863      6.8020
+     25.3900   1476.0184     33.2306      6.7830
+     26.0600   1476.0303     33.2748      6.7690
+     26.7300   1476.0579     33.3191      6.7590
+     27.4000   1476.0345     33.3633      6.7360
+     28.0600   1475.9750     33.4068      6.7040
+     28.7300   1475.9790     33.4511      6.6880
+     29.4000   1476.0497     33.4953      6.6890
+     30.0600   1476.0527     33.5358      6.6740
+     30.7300   1476.1189     33.5457      6.6850
+     31.4000   1476.1930     33.5548      6.6980
+     32.0600   1476.2041     33.5648      6.6950
+     32.7300   1476.2037     33.5739      6.6890
+     33.4000   1476.2269     33.5838      6.6890
+     34.0700   1476.3362     33.5938      6.7110
+     34.7300   1476.4918     33.6029      6.7450
+     35.4000   1476.9403     33.6128      6.8540
+     36.0700   1477.3059     33.6220      6.9420
+     36.7300   1477.4414     33.6319      6.9710
+     37.4000   1477.5267     33.6411      6.9870
+     38.0700   1477.6119     33.6510      7.0030
+     38.7300   1477.6348     33.6609      7.0030
+     39.4000   1477.6617     33.6700      7.0040
+     40.0600   1477.5448     33.6800      6.9680
+     40.7300   1477.4281     33.6891      6.9320
+     41.4000   1477.4979     33.6990      6.9440
+     42.0600   1477.5596     33.7082      6.9540
+     42.7300   1477.6177     33.7181      6.9630
+     43.4000   1478.0288     33.7280      7.0630
+     44.0600   1478.4695     33.7372      7.1710
+     44.7300   1478.7783     33.7471      7.2450
+     45.3900   1479.0247     33.7563      7.3030
+     46.0600   1479.2402     33.7662      7.3530
+     46.7300   1479.3940     33.7753      7.3870
+     47.3900   1479.5781     33.7852      7.4290
+     48.0600   1479.7585     33.7944      7.4700
+     48.7200   1479.9001     33.8043      7.5010
+     49.3900   1480.0765     33.8135      7.5410
+     50.0600   1480.2295     33.8234      7.5750
+     50.7200   1480.3872     33.8303      7.6110
+     51.3900   1480.4611     33.8379      7.6250
+     52.0500   1480.4965     33.8455      7.6290
+     52.7200   1480.5245     33.8531      7.6310
+     53.3800   1480.5293     33.8600      7.6270
+     54.0500   1480.5192     33.8676      7.6190
+     54.7100   1480.5546     33.8753      7.6230
+     55.3800   1480.5979     33.8829      7.6290
+     56.0500   1480.6947     33.8898      7.6490
+     56.7100   1480.7339     33.8974      7.6540
+     57.3800   1480.7505     33.9050      7.6530
+     58.0400   1480.7782     33.9127      7.6550
+     58.7100   1480.8253     33.9195      7.6620
+     59.3700   1480.8187     33.9272      7.6550
+     60.0400   1480.8125     33.9348      7.6480
+     60.7000   1480.8364     33.9424      7.6490
+     61.3700   1480.8568     33.9493      7.6490
+     62.0300   1480.8922     33.9569      7.6530
+     62.7000   1480.9049     33.9645      7.6510
+     63.3600   1480.9250     33.9714      7.6510
+     64.0300   1480.9034     33.9790      7.6400
+     64.6900   1480.9274     33.9867      7.6410
+     65.3600   1480.9592     33.9943      7.6440
+     66.0200   1480.9489     34.0012      7.6360
+     66.6800   1480.9537     34.0088      7.6320
+     67.3500   1480.9703     34.0164      7.6310
+     68.0100   1480.9943     34.0240      7.6320
+     68.6800   1481.0261     34.0309      7.6350
+     69.3400   1481.0463     34.0385      7.6350
+     70.0100   1481.0667     34.0462      7.6350
+     70.6700   1481.0944     34.0530      7.6370
+     71.3400   1481.1262     34.0607      7.6400
+     72.0000   1481.1158     34.0683      7.6320
+     72.6600   1481.0940     34.0759      7.6210
+     73.3300   1481.0609     34.0828      7.6070
+     73.9900   1481.0504     34.0904      7.5990
+     74.6600   1481.0480     34.0981      7.5930
+     75.3200   1481.0519     34.1049      7.5890
+     75.9800   1481.0355     34.1103      7.5800
+     76.6500   1481.0195     34.1164      7.5710
+     77.3100   1481.0033     34.1217      7.5620
+     77.9800   1480.9911     34.1278      7.5540
+     78.6400   1480.9939     34.1339      7.5500
+     79.3000   1480.9431     34.1393      7.5320
+     79.9700   1480.9232     34.1454      7.5220
+     80.6300   1480.8993     34.1507      7.5110
+     81.3000   1480.8679     34.1568      7.4980
+     81.9600   1480.8209     34.1621      7.4810
+     82.6200   1480.7969     34.1682      7.4700
+     83.2900   1480.8076     34.1743      7.4680
+     83.9500   1480.8258     34.1797      7.4680
+     84.6100   1480.8286     34.1858      7.4640
+     85.2800   1480.8431     34.1911      7.4630
+     85.9400   1480.8728     34.1972      7.4660
+     86.6000   1480.8986     34.2033      7.4680
+     87.2700   1480.9285     34.2087      7.4710
+     87.9300   1480.8623     34.2148      7.4490
+     88.5900   1480.7577     34.2201      7.4170
+     89.2600   1480.6686     34.2262      7.3890
+     89.9200   1480.6331     34.2323      7.3750
+     90.5800   1480.6089     34.2377      7.3640
+     91.2400   1480.6155     34.2438      7.3610
+     91.9100   1480.5571     34.2491      7.3410
+     92.5700   1480.5060     34.2552      7.3230
+     93.2300   1480.4319     34.2606      7.2990
+     93.9000   1480.3309     34.2667      7.2680
+     94.5600   1480.2413     34.2728      7.2400
+     95.2200   1480.1901     34.2781      7.2220
+     95.8800   1480.1504     34.2842      7.2070
+     96.5500   1480.1187     34.2896      7.1940
+     97.2100   1480.1136     34.2957      7.1880
+     97.8700   1480.0894     34.3010      7.1770
+     98.5300   1480.0806     34.3071      7.1700
+     99.2000   1480.0719     34.3132      7.1630
+     99.8600   1480.0824     34.3185      7.1610
+    100.5200   1480.1418     34.3239      7.1720
+    101.1800   1480.1932     34.3285      7.1810
+    101.8500   1480.2141     34.3330      7.1820
+    102.5100   1480.2155     34.3376      7.1780
+    103.1700   1480.1974     34.3422      7.1690
+    103.8300   1480.1987     34.3468      7.1650
+    104.4900   1480.1807     34.3513      7.1560
+    105.1600   1480.1669     34.3559      7.1480
+    105.8200   1480.1102     34.3605      7.1290
+    106.4800   1480.0381     34.3651      7.1060
+    107.1400   1479.9736     34.3704      7.0850
+    107.8000   1479.9247     34.3750      7.0680
+    108.4700   1479.9030     34.3796      7.0580
+    109.1300   1479.9042     34.3842      7.0540
+    109.7900   1479.9054     34.3887      7.0500
+    110.4500   1479.8409     34.3933      7.0290
+    111.1100   1479.7415     34.3979      6.9990
+    111.7700   1479.6962     34.4025      6.9830
+    112.4400   1479.6821     34.4070      6.9750
+    113.1000   1479.6796     34.4116      6.9700
+    113.7600   1479.7312     34.4162      6.9790
+    114.4200   1479.7324     34.4208      6.9750
+    115.0800   1479.7142     34.4254      6.9660
+    115.7400   1479.7504     34.4307      6.9710
+    116.4000   1479.7284     34.4353      6.9610
+    117.0600   1479.6986     34.4398      6.9490
+    117.7300   1479.6846     34.4444      6.9410
+    118.3900   1479.6547     34.4490      6.9290
+    119.0500   1479.6016     34.4536      6.9110
+    119.7100   1479.5679     34.4582      6.8980
+    120.3700   1479.5652     34.4627      6.8930
+    121.0300   1479.5509     34.4673      6.8850
+    121.6900   1479.5210     34.4719      6.8730
+    122.3500   1479.5028     34.4765      6.8640
+    123.0100   1479.5117     34.4810      6.8620
+    123.6700   1479.5208     34.4864      6.8600
+    124.3300   1479.5297     34.4910      6.8580
+    125.0000   1479.5623     34.4955      6.8620
+    125.6600   1479.5767     34.4978      6.8620
+    126.3200   1479.5834     34.5009      6.8600
+    126.9800   1479.5939     34.5039      6.8590
+    127.6400   1479.5967     34.5062      6.8560
+    128.3000   1479.6111     34.5093      6.8560
+    128.9600   1479.6217     34.5123      6.8550
+    129.6200   1479.6361     34.5146      6.8550
+    130.2800   1479.6544     34.5177      6.8560
+    130.9400   1479.6727     34.5200      6.8570
+    131.6000   1479.6794     34.5230      6.8550
+    132.2600   1479.6860     34.5261      6.8530
+    132.9200   1479.6888     34.5291      6.8500
+    133.5800   1479.6838     34.5314      6.8450
+    134.2400   1479.6594     34.5345      6.8350
+    134.9000   1479.6621     34.5367      6.8320
+    135.5600   1479.6532     34.5398      6.8260
+    136.2200   1479.6871     34.5428      6.8310
+    136.8800   1479.7094     34.5451      6.8330
+    137.5400   1479.7161     34.5482      6.8310
+    138.2000   1479.7266     34.5512      6.8300
+    138.8600   1479.7410     34.5535      6.8300
+    139.5200   1479.7321     34.5566      6.8240
+    140.1800   1479.7466     34.5596      6.8240
+    140.8400   1479.7649     34.5619      6.8250
+    141.5000   1479.7987     34.5650      6.8300
+    142.1600   1479.8209     34.5673      6.8320
+    142.8200   1479.8354     34.5703      6.8320
+    143.4800   1479.8459     34.5734      6.8310
+    144.1400   1479.8643     34.5757      6.8320
+    144.7900   1479.8864     34.5787      6.8340
+    145.4500   1479.9047     34.5818      6.8350
+    146.1100   1479.9308     34.5840      6.8380
+    146.7700   1479.9219     34.5871      6.8320
+    147.4300   1479.9285     34.5901      6.8300
+    148.0900   1479.9391     34.5924      6.8290
+    148.7500   1479.9691     34.5955      6.8330
+    149.4100   1479.9796     34.5985      6.8320
+    150.0700   1479.9784     34.6008      6.8280
+    150.7300   1479.9956     34.6031      6.8290
+    151.3900   1480.0090     34.6046      6.8290
+    152.0400   1480.0183     34.6069      6.8280
+    152.7000   1480.0123     34.6085      6.8230
+    153.3600   1480.0295     34.6107      6.8240
+    154.0200   1480.0508     34.6123      6.8260
+    154.6800   1480.0525     34.6146      6.8230
+    155.3400   1480.1086     34.6169      6.8340
+    156.0000   1480.1531     34.6184      6.8420
+    156.6500   1480.1819     34.6207      6.8460
+    157.3100   1480.1991     34.6222      6.8470
+    157.9700   1480.2164     34.6245      6.8480
+    158.6300   1480.2260     34.6260      6.8470
+    159.2900   1480.2393     34.6283      6.8470
+    159.9500   1480.2488     34.6298      6.8460
+    160.6000   1480.2659     34.6321      6.8470
+    161.2600   1480.2715     34.6336      6.8450
+    161.9200   1480.2965     34.6359      6.8480
+    162.5800   1480.2944     34.6375      6.8440
+    163.2400   1480.3116     34.6397      6.8450
+    163.8900   1480.3132     34.6420      6.8420
+    164.5500   1480.3265     34.6436      6.8420
+    165.2100   1480.3127     34.6458      6.8350
+    165.8700   1480.3417     34.6474      6.8390
+    166.5300   1480.3434     34.6497      6.8360
+    167.1800   1480.3683     34.6512      6.8390
+    167.8400   1480.3856     34.6535      6.8400
+    168.5000   1480.4028     34.6550      6.8410
+    169.1600   1480.4318     34.6573      6.8450
+    169.8200   1480.4491     34.6588      6.8460
+    170.4700   1480.4662     34.6611      6.8470
+    171.1300   1480.4873     34.6634      6.8490
+    171.7900   1480.5123     34.6649      6.8520
+    172.4400   1480.5294     34.6672      6.8530
+    173.1000   1480.5544     34.6687      6.8560
+    173.7600   1480.5718     34.6710      6.8570
+    174.4200   1480.5852     34.6725      6.8570
+    175.0700   1480.6061     34.6748      6.8590
+    175.7300   1480.6234     34.6764      6.8600
+    176.3900   1480.6251     34.6786      6.8570
+    177.0500   1480.6385     34.6802      6.8570
+    177.7000   1480.6866     34.6825      6.8660
+    178.3600   1480.7195     34.6840      6.8710
+    179.0200   1480.7601     34.6863      6.8780
+    179.6700   1480.7888     34.6878      6.8820
+    180.3300   1480.8022     34.6901      6.8820
+    180.9900   1480.8040     34.6924      6.8790
+    181.6400   1480.8289     34.6939      6.8820
+    182.3000   1480.8966     34.6962      6.8960
+    182.9600   1480.8828     34.6977      6.8890
+    183.6100   1480.9154     34.7000      6.8940
+    184.2700   1480.9559     34.7015      6.9010
+    184.9300   1480.9421     34.7038      6.8940
+    185.5800   1480.9786     34.7054      6.9000
+    186.2400   1480.9803     34.7076      6.8970
+    186.9000   1481.0675     34.7092      6.9160
+    187.5500   1481.1156     34.7115      6.9250
+    188.2100   1481.1989     34.7130      6.9430
+    188.8700   1481.2161     34.7153      6.9440
+    189.5200   1481.2642     34.7168      6.9530
+    190.1800   1481.2582     34.7191      6.9480
+    190.8300   1481.2714     34.7214      6.9480
+    191.4900   1481.3662     34.7229      6.9690
+    192.1500   1481.3718     34.7252      6.9670
+    192.8000   1481.4392     34.7267      6.9810
+    193.4600   1481.4565     34.7290      6.9820
+    194.1100   1481.4658     34.7305      6.9810
+    194.7700   1481.5295     34.7328      6.9940
+    195.4300   1481.5314     34.7343      6.9910
+    196.0800   1481.5291     34.7366      6.9870
+    196.7400   1481.5541     34.7382      6.9900
+    197.3900   1481.5789     34.7404      6.9930
+    198.0500   1481.5962     34.7420      6.9940
+    198.7000   1481.5862     34.7443      6.9880
+    199.3600   1481.6189     34.7458      6.9930
+    200.0200   1481.5858     34.7481      6.9810
+    200.6700   1481.5912     34.7504      6.9790
+    201.3300   1481.6162     34.7519      6.9820
+    201.9800   1481.6410     34.7542      6.9850
+    202.6400   1481.6466     34.7557      6.9830
+    203.2900   1481.6597     34.7572      6.9830
+    203.9500   1481.6615     34.7595      6.9800
+    204.6000   1481.6669     34.7610      6.9780
+    205.2600   1481.6841     34.7633      6.9790
+    205.9100   1481.6818     34.7649      6.9750
+    206.5700   1481.7106     34.7672      6.9790
+    207.2200   1481.6812     34.7687      6.9680
+    207.8800   1481.6595     34.7710      6.9590
+    208.5300   1481.6688     34.7725      6.9580
+    209.1900   1481.6512     34.7748      6.9500
+    209.8400   1481.6140     34.7763      6.9370
+    210.5000   1481.5226     34.7786      6.9100
+    211.1500   1481.4891     34.7801      6.8980
+    211.8100   1481.5065     34.7824      6.8990
+    212.4600   1481.5040     34.7839      6.8950
+    213.1200   1481.5291     34.7862      6.8980
+    213.7700   1481.5383     34.7878      6.8970
+    214.4300   1481.5710     34.7900      6.9020
+    215.0800   1481.6152     34.7916      6.9100
+    215.7400   1481.6597     34.7939      6.9180
+    216.3900   1481.6729     34.7954      6.9180
+    217.0400   1481.6859     34.7977      6.9180
+    217.7000   1481.7264     34.7992      6.9250
+    218.3500   1481.9180     34.8015      6.9710
+    219.0100   1482.0165     34.8030      6.9930
+    219.6600   1482.0605     34.8045      7.0010
+    220.3200   1482.0779     34.8068      7.0020
+    220.9700   1482.1490     34.8083      7.0170
+    221.6200   1482.2705     34.8106      7.0450
+    222.2800   1482.3032     34.8122      7.0500
+    222.9300   1482.3241     34.8145      7.0520
+    223.5900   1482.3645     34.8160      7.0590
+    224.2400   1482.3699     34.8183      7.0570
+    224.8900   1482.4371     34.8198      7.0710
+    225.5500   1482.5007     34.8221      7.0840
+    226.2000   1482.5255     34.8236      7.0870
+    226.8500   1482.5232     34.8259      7.0830
+    227.5100   1482.5404     34.8274      7.0840
+    228.1600   1482.5845     34.8297      7.0920
+    228.8100   1482.6401     34.8312      7.1030
+    229.4700   1482.6302     34.8335      7.0970
+    230.1200   1482.6473     34.8351      7.0980
+    230.7800   1482.7108     34.8373      7.1110
+    231.4300   1482.7317     34.8389      7.1130
+    232.0800   1482.7642     34.8404      7.1180
+    232.7400   1482.7853     34.8427      7.1200
+    233.3900   1482.8177     34.8450      7.1250
+    234.0400   1482.8347     34.8465      7.1260
+    234.6900   1482.8595     34.8480      7.1290
+    235.3500   1482.8844     34.8503      7.1320
+    236.0000   1482.9014     34.8518      7.1330
+    236.6500   1482.9299     34.8541      7.1370
+    237.3100   1482.9934     34.8557      7.1500
+    237.9600   1483.1107     34.8579      7.1770
+    238.6100   1483.2240     34.8595      7.2030
+    239.2700   1483.3105     34.8618      7.2220
+    239.9200   1483.3738     34.8633      7.2350
+    240.5700   1483.4061     34.8656      7.2400
+    241.2200   1483.4462     34.8671      7.2470
+    241.8800   1483.4865     34.8694      7.2540
+    242.5300   1483.5497     34.8709      7.2670
+    243.1800   1483.5859     34.8732      7.2730
+    243.8300   1483.6260     34.8747      7.2800
+    244.4900   1483.6815     34.8763      7.2910
+    245.1400   1483.7024     34.8785      7.2930
+    245.7900   1483.7540     34.8801      7.3030
+    246.4400   1483.7825     34.8824      7.3070
+    247.1000   1483.8342     34.8839      7.3170
+    247.7500   1483.8936     34.8862      7.3290
+    248.4000   1483.9297     34.8877      7.3350
+    249.0500   1483.9583     34.8900      7.3390
+    249.7000   1483.9291     34.8915      7.3280
+    250.3600   1483.9611     34.8930      7.3330
+    251.0100   1483.9539     34.8938      7.3280
+    251.6600   1483.9812     34.8953      7.3320
+    252.3100   1483.9778     34.8961      7.3280
+    252.9600   1484.0012     34.8969      7.3310
+    253.6200   1483.9827     34.8976      7.3230
+    254.2700   1483.9985     34.8984      7.3240
+    254.9200   1484.0297     34.8999      7.3290
+    255.5700   1483.9956     34.9007      7.3170
+    256.2200   1483.9423     34.9014      7.3000
+    256.8800   1483.9353     34.9022      7.2950
+    257.5300   1483.9242     34.9037      7.2890
+    258.1800   1483.9553     34.9045      7.2940
+    258.8300   1483.9404     34.9052      7.2870
+    259.4800   1483.9178     34.9060      7.2780
+    260.1300   1483.9260     34.9075      7.2770
+    260.7800   1483.9264     34.9083      7.2740
+    261.4400   1483.9309     34.9091      7.2720
+    262.0900   1483.9314     34.9098      7.2690
+    262.7400   1483.9548     34.9106      7.2720
+    263.3900   1483.9630     34.9121      7.2710
+    264.0400   1483.9673     34.9129      7.2690
+    264.6900   1483.9254     34.9136      7.2550
+    265.3400   1483.9259     34.9144      7.2520
+    265.9900   1483.9109     34.9159      7.2450
+    266.6400   1483.8883     34.9167      7.2360
+    267.2900   1483.8733     34.9174      7.2290
+    267.9500   1483.8662     34.9182      7.2240
+    268.6000   1483.8628     34.9197      7.2200
+    269.2500   1483.8633     34.9205      7.2170
+    269.9000   1483.8560     34.9213      7.2120
+    270.5500   1483.8411     34.9220      7.2050
+    271.2000   1483.8568     34.9228      7.2060
+    271.8500   1483.8573     34.9243      7.2030
+    272.5000   1483.8577     34.9251      7.2000
+    273.1500   1483.8812     34.9258      7.2030
+    273.8000   1483.8817     34.9266      7.2000
+    274.4500   1483.8860     34.9281      7.1980
+    275.1000   1483.9056     34.9289      7.2000
+    275.7500   1483.8829     34.9297      7.1910
+    276.4000   1483.8872     34.9304      7.1890
+    277.0500   1483.9031     34.9319      7.1900
+    277.7000   1483.8920     34.9327      7.1840
+    278.3500   1483.8809     34.9335      7.1780
+    279.0000   1483.8735     34.9342      7.1730
+    279.6500   1483.8392     34.9350      7.1610
+    280.3000   1483.8242     34.9365      7.1540
+    280.9500   1483.8247     34.9373      7.1510
+    281.6000   1483.8290     34.9380      7.1490
+    282.2500   1483.8447     34.9388      7.1500
+    282.9000   1483.8490     34.9403      7.1480
+    283.5500   1483.8649     34.9411      7.1490
+    284.2000   1483.8730     34.9419      7.1480
+    284.8500   1483.8696     34.9426      7.1440
+    285.5000   1483.8738     34.9434      7.1420
+    286.1500   1483.8704     34.9449      7.1380
+    286.8000   1483.8746     34.9457      7.1360
+    287.4500   1483.8712     34.9464      7.1320
+    288.1000   1483.8716     34.9472      7.1290
+    288.7500   1483.8721     34.9487      7.1260
+    289.4000   1483.8763     34.9495      7.1240
+    290.0500   1483.8883     34.9503      7.1240
+    290.7000   1483.8965     34.9510      7.1230
+    291.3500   1483.9084     34.9525      7.1230
+    292.0000   1483.8895     34.9533      7.1150
+    292.6400   1483.9167     34.9541      7.1190
+    293.2900   1483.9017     34.9548      7.1120
+    293.9400   1483.9060     34.9564      7.1100
+    294.5900   1483.8755     34.9571      7.0990
+    295.2400   1483.8875     34.9579      7.0990
+    295.8900   1483.8763     34.9586      7.0930
+    296.5400   1483.8767     34.9594      7.0900
+    297.1900   1483.8694     34.9609      7.0850
+    297.8400   1483.8698     34.9617      7.0820
+    298.4900   1483.8779     34.9625      7.0810
+    299.1300   1483.8666     34.9632      7.0750
+    299.7800   1483.8438     34.9648      7.0660
+    300.4300   1483.8475     34.9648      7.0640
+    301.0800   1483.8472     34.9655      7.0610
+    301.7300   1483.8237     34.9655      7.0520
+    302.3800   1483.8040     34.9663      7.0440
+    303.0200   1483.7842     34.9663      7.0360
+    303.6700   1483.7606     34.9670      7.0270
+    304.3200   1483.7410     34.9670      7.0190
+    304.9700   1483.7406     34.9678      7.0160
+    305.6200   1483.7402     34.9678      7.0130
+    306.2700   1483.6935     34.9686      6.9980
+    306.9100   1483.6774     34.9686      6.9910
+    307.5600   1483.6693     34.9686      6.9860
+    308.2100   1483.6497     34.9693      6.9780
+    308.8600   1483.6338     34.9693      6.9710
+    309.5100   1483.6101     34.9701      6.9620
+    310.1500   1483.5941     34.9701      6.9550
+    310.8000   1483.5859     34.9709      6.9500
+    311.4500   1483.5701     34.9709      6.9430
+    312.1000   1483.5426     34.9716      6.9330
+    312.7500   1483.5189     34.9716      6.9240
+    313.3900   1483.4719     34.9724      6.9090
+    314.0400   1483.4482     34.9724      6.9000
+    314.6900   1483.4362     34.9731      6.8940
+    315.3400   1483.4513     34.9731      6.8950
+    315.9800   1483.4585     34.9731      6.8940
+    316.6300   1483.4581     34.9739      6.8910
+    317.2800   1483.4500     34.9739      6.8860
+    317.9300   1483.4457     34.9747      6.8820
+    318.5700   1483.4491     34.9747      6.8800
+    319.2200   1483.4603     34.9754      6.8800
+    319.8700   1483.4482     34.9754      6.8740
+    320.5200   1483.4130     34.9762      6.8620
+    321.1600   1483.3696     34.9762      6.8480
+    321.8100   1483.2760     34.9770      6.8210
+    322.4600   1483.2134     34.9770      6.8020
+    323.1000   1483.1855     34.9777      6.7920
+    323.7500   1483.1735     34.9777      6.7860
+    324.4000   1483.1458     34.9777      6.7760
+    325.0400   1483.1218     34.9785      6.7670
+    325.6900   1483.1292     34.9785      6.7660
+    326.3400   1483.1366     34.9792      6.7650
+    326.9800   1483.1477     34.9792      6.7650
+    327.6300   1483.1355     34.9800      6.7590
+    328.2800   1483.0962     34.9800      6.7460
+    328.9200   1483.1034     34.9808      6.7450
+    329.5700   1483.1068     34.9808      6.7430
+    330.2200   1483.1025     34.9815      6.7390
+    330.8600   1483.0902     34.9815      6.7330
+    331.5100   1483.0781     34.9823      6.7270
+    332.1600   1483.0465     34.9823      6.7160
+    332.8000   1482.9952     34.9831      6.7000
+    333.4500   1482.9480     34.9831      6.6850
+    334.1000   1482.8265     34.9831      6.6510
+    334.7400   1482.6814     34.9838      6.6110
+    335.3900   1482.6184     34.9838      6.5920
+    336.0300   1482.5513     34.9846      6.5720
+    336.6800   1482.5233     34.9846      6.5620
+    337.3300   1482.5150     34.9854      6.5570
+    337.9700   1482.5144     34.9854      6.5540
+    338.6200   1482.5256     34.9861      6.5540
+    339.2600   1482.5406     34.9861      6.5550
+    339.9100   1482.5598     34.9869      6.5570
+    340.5600   1482.5984     34.9869      6.5640
+    341.2000   1482.6173     34.9876      6.5660
+    341.8500   1482.6207     34.9876      6.5640
+    342.4900   1482.6396     34.9876      6.5660
+    343.1400   1482.6666     34.9884      6.5700
+    343.7800   1482.6816     34.9884      6.5710
+    344.4300   1482.6968     34.9892      6.5720
+    345.0800   1482.7119     34.9892      6.5730
+    345.7200   1482.7191     34.9899      6.5720
+    346.3700   1482.7421     34.9899      6.5750
+    347.0100   1482.7649     34.9907      6.5780
+    347.6600   1482.7802     34.9907      6.5790
+    348.3000   1482.8069     34.9915      6.5830
+    348.9500   1482.8220     34.9915      6.5840
+    349.5900   1482.8488     34.9922      6.5880
+    350.2400   1482.8639     34.9922      6.5890
+    350.8800   1482.8828     34.9922      6.5910
+    351.5300   1482.8981     34.9930      6.5920
+    352.1700   1482.9130     34.9930      6.5930
+    352.8200   1482.9243     34.9937      6.5930
+    353.4600   1482.9354     34.9937      6.5930
+    354.1100   1482.9506     34.9945      6.5940
+    354.7500   1482.9656     34.9945      6.5950
+    355.4000   1482.9807     34.9953      6.5960
+    356.0400   1482.9840     34.9953      6.5940
+    356.6900   1482.9874     34.9960      6.5920
+    357.3300   1482.9907     34.9960      6.5900
+    357.9800   1482.9980     34.9968      6.5890
+    358.6200   1483.0092     34.9968      6.5890
+    359.2700   1483.0243     34.9968      6.5900
+    359.9100   1483.0315     34.9976      6.5890
+    360.5500   1483.0426     34.9976      6.5890
+    361.2000   1483.0499     34.9983      6.5880
+    361.8400   1483.0493     34.9983      6.5850
+    362.4900   1483.0527     34.9991      6.5830
+    363.1300   1483.0795     34.9991      6.5870
+    363.7800   1483.0829     34.9998      6.5850
+    364.4200   1483.0979     34.9998      6.5860
+    365.0600   1483.0856     35.0006      6.5800
+    365.7100   1483.0890     35.0006      6.5780
+    366.3500   1483.1196     35.0014      6.5830
+    367.0000   1483.1074     35.0014      6.5770
+    367.6400   1483.1107     35.0021      6.5750
+    368.2800   1483.1140     35.0021      6.5730
+    368.9300   1483.1409     35.0021      6.5770
+    369.5700   1483.1285     35.0029      6.5710
+    370.2200   1483.1711     35.0029      6.5790
+    370.8600   1483.1821     35.0037      6.5790
+    371.5000   1483.1698     35.0037      6.5730
+    372.1500   1483.1654     35.0044      6.5690
+    372.7900   1483.1492     35.0044      6.5620
+    373.4300   1483.1406     35.0052      6.5570
+    374.0800   1483.1362     35.0052      6.5530
+    374.7200   1483.1395     35.0060      6.5510
+    375.3600   1483.1467     35.0060      6.5500
+    376.0100   1483.1697     35.0060      6.5530
+    376.6500   1483.1769     35.0067      6.5520
+    377.2900   1483.1841     35.0067      6.5510
+    377.9400   1483.1875     35.0075      6.5490
+    378.5800   1483.1713     35.0075      6.5420
+    379.2200   1483.1627     35.0082      6.5370
+    379.8700   1483.1583     35.0082      6.5330
+    380.5100   1483.1772     35.0090      6.5350
+    381.1500   1483.1766     35.0090      6.5320
+    381.7900   1483.1877     35.0098      6.5320
+    382.4400   1483.1755     35.0098      6.5260
+    383.0800   1483.1553     35.0105      6.5180
+    383.7200   1483.1428     35.0105      6.5120
+    384.3700   1483.1267     35.0113      6.5050
+    385.0100   1483.1378     35.0113      6.5050
+    385.6500   1483.1254     35.0113      6.4990
+    386.2900   1483.1365     35.0121      6.4990
+    386.9400   1483.1241     35.0121      6.4930
+    387.5800   1483.1392     35.0128      6.4940
+    388.2200   1483.1503     35.0128      6.4940
+    388.8600   1483.1536     35.0136      6.4920
+    389.5100   1483.1570     35.0136      6.4900
+    390.1500   1483.1759     35.0143      6.4920
+    390.7900   1483.1675     35.0143      6.4870
+    391.4300   1483.1707     35.0151      6.4850
+    392.0800   1483.1741     35.0151      6.4830
+    392.7200   1483.1813     35.0151      6.4820
+    393.3600   1483.1885     35.0159      6.4810
+    394.0000   1483.2074     35.0159      6.4830
+    394.6400   1483.2029     35.0166      6.4790
+    395.2900   1483.2102     35.0166      6.4780
+    395.9300   1483.2213     35.0174      6.4780
+    396.5700   1483.2245     35.0174      6.4760
+    397.2100   1483.2239     35.0182      6.4730
+    397.8500   1483.2428     35.0182      6.4750
+    398.5000   1483.2540     35.0189      6.4750
+    399.1400   1483.2651     35.0189      6.4750
+    399.7800   1483.2762     35.0197      6.4750
+    400.4200   1483.2677     35.0197      6.4700
+    401.0600   1483.2788     35.0197      6.4700
+    401.7000   1483.2742     35.0204      6.4660
+    402.3400   1483.2264     35.0204      6.4510
+    402.9900   1483.2063     35.0212      6.4430
+    403.6300   1483.2174     35.0212      6.4430
+    404.2700   1483.2167     35.0220      6.4400
+    404.9100   1483.2042     35.0220      6.4340
+    405.5500   1483.2114     35.0227      6.4330
+    406.1900   1483.2186     35.0227      6.4320
+    406.8300   1483.2375     35.0235      6.4340
+    407.4800   1483.2605     35.0235      6.4370
+    408.1200   1483.2402     35.0235      6.4290
+    408.7600   1483.2552     35.0243      6.4300
+    409.4000   1483.2664     35.0243      6.4300
+    410.0400   1483.2814     35.0250      6.4310
+    410.6800   1483.2454     35.0250      6.4190
+    411.3200   1483.2289     35.0258      6.4120
+    411.9600   1483.2439     35.0258      6.4130
+    412.6000   1483.2472     35.0266      6.4110
+    413.2400   1483.2386     35.0266      6.4060
+    413.8800   1483.2418     35.0266      6.4040
+    414.5200   1483.2450     35.0273      6.4020
+    415.1700   1483.2484     35.0273      6.4000
+    415.8100   1483.2595     35.0281      6.4000
+    416.4500   1483.2588     35.0281      6.3970
+    417.0900   1483.2699     35.0288      6.3970
+    417.7300   1483.2810     35.0288      6.3970
+    418.3700   1483.2882     35.0296      6.3960
+    419.0100   1483.2953     35.0296      6.3950
+    419.6500   1483.3025     35.0296      6.3940
+    420.2900   1483.2900     35.0304      6.3880
+    420.9300   1483.2893     35.0304      6.3850
+    421.5700   1483.2965     35.0311      6.3840
+    422.2100   1483.3036     35.0311      6.3830
+    422.8500   1483.3069     35.0319      6.3810
+    423.4900   1483.3140     35.0319      6.3800
+    424.1300   1483.3251     35.0319      6.3800
+    424.7700   1483.3284     35.0327      6.3780
+    425.4100   1483.3237     35.0327      6.3740
+    426.0500   1483.3269     35.0334      6.3720
+    426.6900   1483.3184     35.0334      6.3670
+    427.3300   1483.3215     35.0342      6.3650
+    427.9700   1483.3248     35.0342      6.3630
+    428.6100   1483.3280     35.0349      6.3610
+    429.2500   1483.3234     35.0349      6.3570
+    429.8900   1483.3306     35.0357      6.3560
+    430.5300   1483.3376     35.0357      6.3550
+    431.1700   1483.3330     35.0357      6.3510
+    431.8000   1483.3440     35.0365      6.3510
+    432.4400   1483.3511     35.0365      6.3500
+    433.0800   1483.3583     35.0372      6.3490
+    433.7200   1483.3654     35.0372      6.3480
+    434.3600   1483.3765     35.0380      6.3480
+    435.0000   1483.3757     35.0380      6.3450
+    435.6400   1483.3829     35.0380      6.3440
+    436.2800   1483.3783     35.0388      6.3400
+    436.9200   1483.3855     35.0388      6.3390
+    437.5600   1483.3965     35.0395      6.3390
+    438.2000   1483.3879     35.0395      6.3340
+    438.8400   1483.3912     35.0403      6.3320
+    439.4700   1483.4021     35.0403      6.3320
+    440.1100   1483.4132     35.0410      6.3320
+    440.7500   1483.4203     35.0410      6.3310
+    441.3900   1483.4314     35.0410      6.3310
+    442.0300   1483.4347     35.0418      6.3290
+    442.6700   1483.4458     35.0418      6.3290
+    443.3100   1483.4608     35.0426      6.3300
+    443.9500   1483.4679     35.0426      6.3290
+    444.5800   1483.4828     35.0433      6.3300
+    445.2200   1483.4821     35.0433      6.3270
+    445.8600   1483.5010     35.0433      6.3290
+    446.5000   1483.5082     35.0441      6.3280
+    447.1400   1483.5154     35.0449      6.3270
+    447.7800   1483.5186     35.0449      6.3250
+    448.4100   1483.5295     35.0449      6.3250
+    449.0500   1483.5366     35.0456      6.3240
+    449.6900   1483.5477     35.0456      6.3240
+    450.3300   1483.5509     35.0464      6.3220
+    450.9700   1483.5660     35.0464      6.3230
+    451.6000   1483.5730     35.0471      6.3220
+    452.2400   1483.5762     35.0471      6.3200
+    452.8800   1483.5795     35.0479      6.3180
+    453.5200   1483.5905     35.0479      6.3180
+    454.1600   1483.6016     35.0479      6.3180
+    454.7900   1483.6165     35.0487      6.3190
+    455.4300   1483.6196     35.0487      6.3170
+    456.0700   1483.6268     35.0494      6.3160
+    456.7100   1483.6498     35.0494      6.3190
+    457.3400   1483.6606     35.0502      6.3190
+    457.9800   1483.6718     35.0502      6.3190
+    458.6200   1483.6790     35.0502      6.3180
+    459.2600   1483.6901     35.0510      6.3180
+    459.9000   1483.7051     35.0510      6.3190
+    460.5300   1483.7120     35.0517      6.3180
+    461.1700   1483.7271     35.0517      6.3190
+    461.8100   1483.7343     35.0525      6.3180
+    462.4400   1483.7531     35.0525      6.3200
+    463.0800   1483.7523     35.0533      6.3170
+    463.7200   1483.7712     35.0533      6.3190
+    464.3600   1483.7823     35.0533      6.3190
+    464.9900   1483.7893     35.0540      6.3180
+    465.6300   1483.8043     35.0540      6.3190
+    466.2700   1483.8115     35.0548      6.3180
+    466.9000   1483.8146     35.0548      6.3160
+    467.5400   1483.8414     35.0555      6.3200
+    468.1800   1483.8446     35.0555      6.3180
+    468.8100   1483.8556     35.0563      6.3180
+    469.4500   1483.8706     35.0563      6.3190
+    470.0900   1483.8895     35.0563      6.3210
+    470.7200   1484.2740     35.0571      6.4160
+    471.3600   1483.9628     35.0571      6.3340
+    472.0000   1483.8794     35.0578      6.3100
+    472.6300   1483.8549     35.0578      6.3010
+    473.2700   1483.8384     35.0586      6.2940
+    473.9100   1483.8376     35.0586      6.2910
+    474.5400   1483.8368     35.0586      6.2880
+    475.1800   1483.8439     35.0594      6.2870
+    475.8200   1483.8431     35.0594      6.2840
+    476.4500   1483.8541     35.0601      6.2840
+    477.0900   1483.8613     35.0601      6.2830
+    477.7300   1483.8684     35.0609      6.2820
+    478.3600   1483.8754     35.0609      6.2810
+    479.0000   1483.8826     35.0616      6.2800
+    479.6300   1483.8936     35.0616      6.2800
+    480.2700   1483.8967     35.0616      6.2780
+    480.9100   1483.9039     35.0624      6.2770
+    481.5400   1483.9266     35.0624      6.2800
+    482.1800   1483.9298     35.0632      6.2780
+    482.8100   1483.9408     35.0632      6.2780
+    483.4500   1483.9519     35.0639      6.2780
+    484.0800   1483.9628     35.0639      6.2780
+    484.7200   1483.9739     35.0647      6.2780
+    485.3600   1483.9811     35.0647      6.2770
+    485.9900   1483.9880     35.0647      6.2760
+    486.6300   1484.0031     35.0655      6.2770
+    487.2600   1484.0100     35.0655      6.2760
+    487.9000   1484.0291     35.0662      6.2780
+    488.5300   1484.0321     35.0662      6.2760
+    489.1700   1484.0510     35.0670      6.2780
+    489.8000   1484.0620     35.0670      6.2780
+    490.4400   1484.0574     35.0677      6.2740
+    491.0700   1484.0762     35.0677      6.2760
+    491.7100   1484.0991     35.0677      6.2790
+    492.3400   1484.0981     35.0685      6.2760
+    492.9800   1484.1132     35.0685      6.2770
+    493.6200   1484.1243     35.0693      6.2770
+    494.2500   1484.1353     35.0693      6.2770
+    494.8900   1484.1464     35.0700      6.2770
+    495.5200   1484.1572     35.0700      6.2770
+    496.1500   1484.1721     35.0700      6.2780
+    496.7900   1484.1754     35.0708      6.2760
+    497.4200   1484.1902     35.0708      6.2770
+    498.0600   1484.1974     35.0716      6.2760
+    498.6900   1484.2201     35.0716      6.2790
+    499.3300   1484.2273     35.0723      6.2780
+    499.9600   1484.2343     35.0723      6.2770
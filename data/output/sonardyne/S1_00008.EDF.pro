@@ -0,0 +1,1655 @@
+test_read_store_and_write
+1/1/2015
+1:46:18
+Probe: XSV-01
+Source: /root/package/data/input/sippican/S1_00008.EDF
+      3.8000   1544.7500      0.0000      0.0000
+      4.3000   1544.8700      0.0000      0.0000
+      4.8000   1544.8900      0.0000      0.0000
+      5.4000   1544.9000      0.0000      0.0000
+      5.9000   1544.9300      0.0000      0.0000
+      6.4000   1544.9400      0.0000      0.0000
+      7.0000   1544.9500      0.0000      0.0000
+      7.5000   1544.9600      0.0000      0.0000
+      8.0000   1544.9800      0.0000      0.0000
+      8.6000   1545.0000      0.0000      0.0000
+      9.1000   1545.0200      0.0000      0.0000
+      9.7000   1545.0300      0.0000      0.0000
+     10.2000   1545.0500      0.0000      0.0000
+     10.7000   1545.0700      0.0000      0.0000
+     11.3000   1545.1000      0.0000      0.0000
+     11.8000   1545.1200      0.0000      0.0000
+     12.3000   1545.1400      0.0000      0.0000
+     12.9000   1545.1600      0.0000      0.0000
+     13.4000   1545.1800      0.0000      0.0000
+     13.9000   1545.2000      0.0000      0.0000
+     14.5000   1545.2100      0.0000      0.0000
+     15.0000   1545.2200      0.0000      0.0000
+     15.6000   1545.2200      0.0000      0.0000
+     16.1000   1545.2100      0.0000      0.0000
+     16.6000   1545.1800      0.0000      0.0000
+     17.2000   1545.1500      0.0000      0.0000
+     17.7000   1545.1200      0.0000      0.0000
+     18.2000   1545.0700      0.0000      0.0000
+     18.8000   1545.0300      0.0000      0.0000
+     19.3000   1544.9800      0.0000      0.0000
+     19.8000   1544.9300      0.0000      0.0000
+     20.4000   1544.8900      0.0000      0.0000
+     20.9000   1544.8400      0.0000      0.0000
+     21.4000   1544.8000      0.0000      0.0000
+     22.0000   1544.7700      0.0000      0.0000
+     22.5000   1544.7400      0.0000      0.0000
+     23.1000   1544.7200      0.0000      0.0000
+     23.6000   1544.7000      0.0000      0.0000
+     24.1000   1544.6800      0.0000      0.0000
+     24.7000   1544.6700      0.0000      0.0000
+     25.2000   1544.6600      0.0000      0.0000
+     25.7000   1544.6600      0.0000      0.0000
+     26.3000   1544.6600      0.0000      0.0000
+     26.8000   1544.6600      0.0000      0.0000
+     27.3000   1544.6500      0.0000      0.0000
+     27.9000   1544.6500      0.0000      0.0000
+     28.4000   1544.6500      0.0000      0.0000
+     28.9000   1544.6400      0.0000      0.0000
+     29.5000   1544.6300      0.0000      0.0000
+     30.0000   1544.6300      0.0000      0.0000
+     30.5000   1544.6200      0.0000      0.0000
+     31.1000   1544.6200      0.0000      0.0000
+     31.6000   1544.6100      0.0000      0.0000
+     32.1000   1544.6000      0.0000      0.0000
+     32.7000   1544.6000      0.0000      0.0000
+     33.2000   1544.6000      0.0000      0.0000
+     33.8000   1544.5900      0.0000      0.0000
+     34.3000   1544.6000      0.0000      0.0000
+     34.8000   1544.6000      0.0000      0.0000
+     35.4000   1544.6100      0.0000      0.0000
+     35.9000   1544.6200      0.0000      0.0000
+     36.4000   1544.6000      0.0000      0.0000
+     37.0000   1544.5400      0.0000      0.0000
+     37.5000   1544.4400      0.0000      0.0000
+     38.0000   1544.2900      0.0000      0.0000
+     38.6000   1544.1100      0.0000      0.0000
+     39.1000   1543.9000      0.0000      0.0000
+     39.6000   1543.6400      0.0000      0.0000
+     40.2000   1543.3600      0.0000      0.0000
+     40.7000   1543.0400      0.0000      0.0000
+     41.2000   1542.6900      0.0000      0.0000
+     41.8000   1542.3600      0.0000      0.0000
+     42.3000   1542.0500      0.0000      0.0000
+     42.8000   1541.7700      0.0000      0.0000
+     43.4000   1541.5100      0.0000      0.0000
+     43.9000   1541.2300      0.0000      0.0000
+     44.4000   1540.9600      0.0000      0.0000
+     45.0000   1540.6900      0.0000      0.0000
+     45.5000   1540.4400      0.0000      0.0000
+     46.0000   1540.2100      0.0000      0.0000
+     46.6000   1540.0000      0.0000      0.0000
+     47.1000   1539.8000      0.0000      0.0000
+     47.6000   1539.5900      0.0000      0.0000
+     48.2000   1539.3900      0.0000      0.0000
+     48.7000   1539.2400      0.0000      0.0000
+     49.3000   1539.0900      0.0000      0.0000
+     49.8000   1538.9500      0.0000      0.0000
+     50.3000   1538.8100      0.0000      0.0000
+     50.9000   1538.6700      0.0000      0.0000
+     51.4000   1538.5400      0.0000      0.0000
+     51.9000   1538.4100      0.0000      0.0000
+     52.5000   1538.2700      0.0000      0.0000
+     53.0000   1538.0900      0.0000      0.0000
+     53.5000   1537.8700      0.0000      0.0000
+     54.1000   1537.6500      0.0000      0.0000
+     54.6000   1537.4300      0.0000      0.0000
+     55.1000   1537.2200      0.0000      0.0000
+     55.7000   1537.0100      0.0000      0.0000
+     56.2000   1536.8000      0.0000      0.0000
+     56.7000   1536.6100      0.0000      0.0000
+     57.3000   1536.4400      0.0000      0.0000
+     57.8000   1536.3200      0.0000      0.0000
+     58.3000   1536.2300      0.0000      0.0000
+     58.9000   1536.1600      0.0000      0.0000
+     59.4000   1536.0800      0.0000      0.0000
+     59.9000   1536.0000      0.0000      0.0000
+     60.5000   1535.9200      0.0000      0.0000
+     61.0000   1535.8400      0.0000      0.0000
+     61.5000   1535.7300      0.0000      0.0000
+     62.1000   1535.6300      0.0000      0.0000
+     62.6000   1535.5200      0.0000      0.0000
+     63.1000   1535.4200      0.0000      0.0000
+     63.7000   1535.3300      0.0000      0.0000
+     64.2000   1535.2500      0.0000      0.0000
+     64.7000   1535.1900      0.0000      0.0000
+     65.3000   1535.1300      0.0000      0.0000
+     65.8000   1535.0800      0.0000      0.0000
+     66.3000   1535.0500      0.0000      0.0000
+     66.9000   1535.0200      0.0000      0.0000
+     67.4000   1534.9800      0.0000      0.0000
+     67.9000   1534.9400      0.0000      0.0000
+     68.5000   1534.8900      0.0000      0.0000
+     69.0000   1534.8400      0.0000      0.0000
+     69.5000   1534.7800      0.0000      0.0000
+     70.1000   1534.7000      0.0000      0.0000
+     70.6000   1534.6100      0.0000      0.0000
+     71.1000   1534.5100      0.0000      0.0000
+     71.7000   1534.4100      0.0000      0.0000
+     72.2000   1534.3000      0.0000      0.0000
+     72.7000   1534.1900      0.0000      0.0000
+     73.3000   1534.0700      0.0000      0.0000
+     73.8000   1533.9500      0.0000      0.0000
+     74.3000   1533.8300      0.0000      0.0000
+     74.8000   1533.7000      0.0000      0.0000
+     75.4000   1533.5700      0.0000      0.0000
+     75.9000   1533.4400      0.0000      0.0000
+     76.4000   1533.3100      0.0000      0.0000
+     77.0000   1533.1800      0.0000      0.0000
+     77.5000   1533.0700      0.0000      0.0000
+     78.0000   1532.9400      0.0000      0.0000
+     78.6000   1532.8000      0.0000      0.0000
+     79.1000   1532.6600      0.0000      0.0000
+     79.6000   1532.5500      0.0000      0.0000
+     80.2000   1532.4400      0.0000      0.0000
+     80.7000   1532.3300      0.0000      0.0000
+     81.2000   1532.2300      0.0000      0.0000
+     81.8000   1532.1200      0.0000      0.0000
+     82.3000   1532.0100      0.0000      0.0000
+     82.8000   1531.9100      0.0000      0.0000
+     83.4000   1531.8400      0.0000      0.0000
+     83.9000   1531.7700      0.0000      0.0000
+     84.4000   1531.7000      0.0000      0.0000
+     85.0000   1531.6300      0.0000      0.0000
+     85.5000   1531.5700      0.0000      0.0000
+     86.0000   1531.5100      0.0000      0.0000
+     86.6000   1531.4600      0.0000      0.0000
+     87.1000   1531.4100      0.0000      0.0000
+     87.6000   1531.3700      0.0000      0.0000
+     88.2000   1531.3200      0.0000      0.0000
+     88.7000   1531.2700      0.0000      0.0000
+     89.2000   1531.2000      0.0000      0.0000
+     89.7000   1531.1200      0.0000      0.0000
+     90.3000   1531.0300      0.0000      0.0000
+     90.8000   1530.9300      0.0000      0.0000
+     91.3000   1530.8200      0.0000      0.0000
+     91.9000   1530.7200      0.0000      0.0000
+     92.4000   1530.6200      0.0000      0.0000
+     92.9000   1530.5200      0.0000      0.0000
+     93.5000   1530.4500      0.0000      0.0000
+     94.0000   1530.4000      0.0000      0.0000
+     94.5000   1530.3500      0.0000      0.0000
+     95.1000   1530.3100      0.0000      0.0000
+     95.6000   1530.2700      0.0000      0.0000
+     96.1000   1530.2200      0.0000      0.0000
+     96.7000   1530.1700      0.0000      0.0000
+     97.2000   1530.1100      0.0000      0.0000
+     97.7000   1530.0500      0.0000      0.0000
+     98.3000   1529.9900      0.0000      0.0000
+     98.8000   1529.9200      0.0000      0.0000
+     99.3000   1529.8300      0.0000      0.0000
+     99.8000   1529.7500      0.0000      0.0000
+    100.4000   1529.6900      0.0000      0.0000
+    100.9000   1529.6300      0.0000      0.0000
+    101.4000   1529.5800      0.0000      0.0000
+    102.0000   1529.5600      0.0000      0.0000
+    102.5000   1529.5100      0.0000      0.0000
+    103.0000   1529.4300      0.0000      0.0000
+    103.6000   1529.3600      0.0000      0.0000
+    104.1000   1529.3000      0.0000      0.0000
+    104.6000   1529.2600      0.0000      0.0000
+    105.2000   1529.2200      0.0000      0.0000
+    105.7000   1529.1800      0.0000      0.0000
+    106.2000   1529.1100      0.0000      0.0000
+    106.7000   1529.0200      0.0000      0.0000
+    107.3000   1528.9400      0.0000      0.0000
+    107.8000   1528.8800      0.0000      0.0000
+    108.3000   1528.8200      0.0000      0.0000
+    108.9000   1528.7600      0.0000      0.0000
+    109.4000   1528.7000      0.0000      0.0000
+    109.9000   1528.6300      0.0000      0.0000
+    110.5000   1528.5600      0.0000      0.0000
+    111.0000   1528.5000      0.0000      0.0000
+    111.5000   1528.4400      0.0000      0.0000
+    112.1000   1528.4000      0.0000      0.0000
+    112.6000   1528.3500      0.0000      0.0000
+    113.1000   1528.3100      0.0000      0.0000
+    113.6000   1528.2500      0.0000      0.0000
+    114.2000   1528.1900      0.0000      0.0000
+    114.7000   1528.1300      0.0000      0.0000
+    115.2000   1528.0800      0.0000      0.0000
+    115.8000   1528.0300      0.0000      0.0000
+    116.3000   1527.9900      0.0000      0.0000
+    116.8000   1527.9500      0.0000      0.0000
+    117.4000   1527.9100      0.0000      0.0000
+    117.9000   1527.8800      0.0000      0.0000
+    118.4000   1527.8400      0.0000      0.0000
+    119.0000   1527.8000      0.0000      0.0000
+    119.5000   1527.7500      0.0000      0.0000
+    120.0000   1527.7000      0.0000      0.0000
+    120.5000   1527.6400      0.0000      0.0000
+    121.1000   1527.5900      0.0000      0.0000
+    121.6000   1527.5500      0.0000      0.0000
+    122.1000   1527.5000      0.0000      0.0000
+    122.7000   1527.4600      0.0000      0.0000
+    123.2000   1527.4300      0.0000      0.0000
+    123.7000   1527.4100      0.0000      0.0000
+    124.2000   1527.4000      0.0000      0.0000
+    124.8000   1527.3900      0.0000      0.0000
+    125.3000   1527.3600      0.0000      0.0000
+    125.8000   1527.3400      0.0000      0.0000
+    126.4000   1527.3100      0.0000      0.0000
+    126.9000   1527.2800      0.0000      0.0000
+    127.4000   1527.2400      0.0000      0.0000
+    128.0000   1527.2100      0.0000      0.0000
+    128.5000   1527.1700      0.0000      0.0000
+    129.0000   1527.1400      0.0000      0.0000
+    129.5000   1527.1100      0.0000      0.0000
+    130.1000   1527.0900      0.0000      0.0000
+    130.6000   1527.0800      0.0000      0.0000
+    131.1000   1527.0600      0.0000      0.0000
+    131.7000   1527.0500      0.0000      0.0000
+    132.2000   1527.0500      0.0000      0.0000
+    132.7000   1527.0400      0.0000      0.0000
+    133.3000   1527.0300      0.0000      0.0000
+    133.8000   1527.0100      0.0000      0.0000
+    134.3000   1527.0000      0.0000      0.0000
+    134.8000   1526.9900      0.0000      0.0000
+    135.4000   1526.9600      0.0000      0.0000
+    135.9000   1526.9300      0.0000      0.0000
+    136.4000   1526.8900      0.0000      0.0000
+    137.0000   1526.8500      0.0000      0.0000
+    137.5000   1526.8000      0.0000      0.0000
+    138.0000   1526.7400      0.0000      0.0000
+    138.5000   1526.6700      0.0000      0.0000
+    139.1000   1526.6000      0.0000      0.0000
+    139.6000   1526.5300      0.0000      0.0000
+    140.1000   1526.4600      0.0000      0.0000
+    140.7000   1526.4100      0.0000      0.0000
+    141.2000   1526.3600      0.0000      0.0000
+    141.7000   1526.3100      0.0000      0.0000
+    142.2000   1526.2700      0.0000      0.0000
+    142.8000   1526.2400      0.0000      0.0000
+    143.3000   1526.2300      0.0000      0.0000
+    143.8000   1526.2200      0.0000      0.0000
+    144.4000   1526.1900      0.0000      0.0000
+    144.9000   1526.1600      0.0000      0.0000
+    145.4000   1526.1200      0.0000      0.0000
+    145.9000   1526.0900      0.0000      0.0000
+    146.5000   1526.0600      0.0000      0.0000
+    147.0000   1526.0200      0.0000      0.0000
+    147.5000   1525.9800      0.0000      0.0000
+    148.1000   1525.9200      0.0000      0.0000
+    148.6000   1525.8700      0.0000      0.0000
+    149.1000   1525.8200      0.0000      0.0000
+    149.6000   1525.7800      0.0000      0.0000
+    150.2000   1525.7300      0.0000      0.0000
+    150.7000   1525.6900      0.0000      0.0000
+    151.2000   1525.6400      0.0000      0.0000
+    151.8000   1525.6000      0.0000      0.0000
+    152.3000   1525.5600      0.0000      0.0000
+    152.8000   1525.5200      0.0000      0.0000
+    153.3000   1525.4900      0.0000      0.0000
+    153.9000   1525.4600      0.0000      0.0000
+    154.4000   1525.4300      0.0000      0.0000
+    154.9000   1525.4000      0.0000      0.0000
+    155.5000   1525.3700      0.0000      0.0000
+    156.0000   1525.3300      0.0000      0.0000
+    156.5000   1525.3000      0.0000      0.0000
+    157.0000   1525.2700      0.0000      0.0000
+    157.6000   1525.2500      0.0000      0.0000
+    158.1000   1525.2300      0.0000      0.0000
+    158.6000   1525.2100      0.0000      0.0000
+    159.2000   1525.1900      0.0000      0.0000
+    159.7000   1525.1600      0.0000      0.0000
+    160.2000   1525.1400      0.0000      0.0000
+    160.7000   1525.1200      0.0000      0.0000
+    161.3000   1525.1000      0.0000      0.0000
+    161.8000   1525.0700      0.0000      0.0000
+    162.3000   1525.0400      0.0000      0.0000
+    162.8000   1525.0000      0.0000      0.0000
+    163.4000   1524.9700      0.0000      0.0000
+    163.9000   1524.9500      0.0000      0.0000
+    164.4000   1524.9300      0.0000      0.0000
+    165.0000   1524.9100      0.0000      0.0000
+    165.5000   1524.9000      0.0000      0.0000
+    166.0000   1524.8800      0.0000      0.0000
+    166.5000   1524.8500      0.0000      0.0000
+    167.1000   1524.8300      0.0000      0.0000
+    167.6000   1524.8200      0.0000      0.0000
+    168.1000   1524.8100      0.0000      0.0000
+    168.7000   1524.7900      0.0000      0.0000
+    169.2000   1524.7800      0.0000      0.0000
+    169.7000   1524.7600      0.0000      0.0000
+    170.2000   1524.7500      0.0000      0.0000
+    170.8000   1524.7300      0.0000      0.0000
+    171.3000   1524.7200      0.0000      0.0000
+    171.8000   1524.7100      0.0000      0.0000
+    172.3000   1524.7000      0.0000      0.0000
+    172.9000   1524.6800      0.0000      0.0000
+    173.4000   1524.6800      0.0000      0.0000
+    173.9000   1524.6700      0.0000      0.0000
+    174.4000   1524.6500      0.0000      0.0000
+    175.0000   1524.6500      0.0000      0.0000
+    175.5000   1524.6400      0.0000      0.0000
+    176.0000   1524.6400      0.0000      0.0000
+    176.6000   1524.6400      0.0000      0.0000
+    177.1000   1524.6400      0.0000      0.0000
+    177.6000   1524.6400      0.0000      0.0000
+    178.1000   1524.6300      0.0000      0.0000
+    178.7000   1524.6300      0.0000      0.0000
+    179.2000   1524.6200      0.0000      0.0000
+    179.7000   1524.6200      0.0000      0.0000
+    180.2000   1524.6200      0.0000      0.0000
+    180.8000   1524.6200      0.0000      0.0000
+    181.3000   1524.6100      0.0000      0.0000
+    181.8000   1524.6000      0.0000      0.0000
+    182.4000   1524.5900      0.0000      0.0000
+    182.9000   1524.5700      0.0000      0.0000
+    183.4000   1524.5600      0.0000      0.0000
+    183.9000   1524.5500      0.0000      0.0000
+    184.5000   1524.5400      0.0000      0.0000
+    185.0000   1524.5200      0.0000      0.0000
+    185.5000   1524.5100      0.0000      0.0000
+    186.0000   1524.5000      0.0000      0.0000
+    186.6000   1524.5000      0.0000      0.0000
+    187.1000   1524.5000      0.0000      0.0000
+    187.6000   1524.4900      0.0000      0.0000
+    188.1000   1524.4900      0.0000      0.0000
+    188.7000   1524.4900      0.0000      0.0000
+    189.2000   1524.4800      0.0000      0.0000
+    189.7000   1524.4700      0.0000      0.0000
+    190.2000   1524.4700      0.0000      0.0000
+    190.8000   1524.4500      0.0000      0.0000
+    191.3000   1524.4400      0.0000      0.0000
+    191.8000   1524.4300      0.0000      0.0000
+    192.4000   1524.4200      0.0000      0.0000
+    192.9000   1524.4100      0.0000      0.0000
+    193.4000   1524.3900      0.0000      0.0000
+    193.9000   1524.3800      0.0000      0.0000
+    194.5000   1524.3600      0.0000      0.0000
+    195.0000   1524.3300      0.0000      0.0000
+    195.5000   1524.3100      0.0000      0.0000
+    196.0000   1524.2900      0.0000      0.0000
+    196.6000   1524.2700      0.0000      0.0000
+    197.1000   1524.2300      0.0000      0.0000
+    197.6000   1524.2000      0.0000      0.0000
+    198.1000   1524.1600      0.0000      0.0000
+    198.7000   1524.1300      0.0000      0.0000
+    199.2000   1524.0900      0.0000      0.0000
+    199.7000   1524.0500      0.0000      0.0000
+    200.2000   1524.0000      0.0000      0.0000
+    200.8000   1523.9500      0.0000      0.0000
+    201.3000   1523.8900      0.0000      0.0000
+    201.8000   1523.8400      0.0000      0.0000
+    202.3000   1523.7800      0.0000      0.0000
+    202.9000   1523.7400      0.0000      0.0000
+    203.4000   1523.7000      0.0000      0.0000
+    203.9000   1523.6800      0.0000      0.0000
+    204.4000   1523.6500      0.0000      0.0000
+    205.0000   1523.6300      0.0000      0.0000
+    205.5000   1523.6200      0.0000      0.0000
+    206.0000   1523.6100      0.0000      0.0000
+    206.5000   1523.6000      0.0000      0.0000
+    207.1000   1523.5800      0.0000      0.0000
+    207.6000   1523.5500      0.0000      0.0000
+    208.1000   1523.5200      0.0000      0.0000
+    208.6000   1523.4900      0.0000      0.0000
+    209.2000   1523.4500      0.0000      0.0000
+    209.7000   1523.4200      0.0000      0.0000
+    210.2000   1523.3900      0.0000      0.0000
+    210.7000   1523.3700      0.0000      0.0000
+    211.3000   1523.3500      0.0000      0.0000
+    211.8000   1523.3400      0.0000      0.0000
+    212.3000   1523.3400      0.0000      0.0000
+    212.8000   1523.3400      0.0000      0.0000
+    213.4000   1523.3400      0.0000      0.0000
+    213.9000   1523.3300      0.0000      0.0000
+    214.4000   1523.3300      0.0000      0.0000
+    214.9000   1523.3300      0.0000      0.0000
+    215.5000   1523.3200      0.0000      0.0000
+    216.0000   1523.3000      0.0000      0.0000
+    216.5000   1523.2800      0.0000      0.0000
+    217.0000   1523.2500      0.0000      0.0000
+    217.6000   1523.2100      0.0000      0.0000
+    218.1000   1523.1700      0.0000      0.0000
+    218.6000   1523.1300      0.0000      0.0000
+    219.1000   1523.0900      0.0000      0.0000
+    219.7000   1523.0500      0.0000      0.0000
+    220.2000   1523.0000      0.0000      0.0000
+    220.7000   1522.9500      0.0000      0.0000
+    221.2000   1522.9100      0.0000      0.0000
+    221.8000   1522.8700      0.0000      0.0000
+    222.3000   1522.8400      0.0000      0.0000
+    222.8000   1522.8100      0.0000      0.0000
+    223.3000   1522.7800      0.0000      0.0000
+    223.9000   1522.7600      0.0000      0.0000
+    224.4000   1522.7400      0.0000      0.0000
+    224.9000   1522.7200      0.0000      0.0000
+    225.4000   1522.6900      0.0000      0.0000
+    226.0000   1522.6600      0.0000      0.0000
+    226.5000   1522.6400      0.0000      0.0000
+    227.0000   1522.6100      0.0000      0.0000
+    227.5000   1522.5800      0.0000      0.0000
+    228.1000   1522.5500      0.0000      0.0000
+    228.6000   1522.5300      0.0000      0.0000
+    229.1000   1522.5000      0.0000      0.0000
+    229.6000   1522.4700      0.0000      0.0000
+    230.1000   1522.4400      0.0000      0.0000
+    230.7000   1522.4200      0.0000      0.0000
+    231.2000   1522.3900      0.0000      0.0000
+    231.7000   1522.3600      0.0000      0.0000
+    232.2000   1522.3200      0.0000      0.0000
+    232.8000   1522.2800      0.0000      0.0000
+    233.3000   1522.2400      0.0000      0.0000
+    233.8000   1522.2000      0.0000      0.0000
+    234.3000   1522.1600      0.0000      0.0000
+    234.9000   1522.1300      0.0000      0.0000
+    235.4000   1522.1000      0.0000      0.0000
+    235.9000   1522.0700      0.0000      0.0000
+    236.4000   1522.0400      0.0000      0.0000
+    237.0000   1522.0100      0.0000      0.0000
+    237.5000   1521.9800      0.0000      0.0000
+    238.0000   1521.9500      0.0000      0.0000
+    238.5000   1521.9300      0.0000      0.0000
+    239.0000   1521.9000      0.0000      0.0000
+    239.6000   1521.8800      0.0000      0.0000
+    240.1000   1521.8500      0.0000      0.0000
+    240.6000   1521.8300      0.0000      0.0000
+    241.1000   1521.8100      0.0000      0.0000
+    241.7000   1521.7900      0.0000      0.0000
+    242.2000   1521.7800      0.0000      0.0000
+    242.7000   1521.7600      0.0000      0.0000
+    243.2000   1521.7500      0.0000      0.0000
+    243.8000   1521.7400      0.0000      0.0000
+    244.3000   1521.7400      0.0000      0.0000
+    244.8000   1521.7300      0.0000      0.0000
+    245.3000   1521.7200      0.0000      0.0000
+    245.9000   1521.7100      0.0000      0.0000
+    246.4000   1521.6900      0.0000      0.0000
+    246.9000   1521.6800      0.0000      0.0000
+    247.4000   1521.6600      0.0000      0.0000
+    247.9000   1521.6500      0.0000      0.0000
+    248.5000   1521.6200      0.0000      0.0000
+    249.0000   1521.6000      0.0000      0.0000
+    249.5000   1521.5700      0.0000      0.0000
+    250.0000   1521.5400      0.0000      0.0000
+    250.6000   1521.5100      0.0000      0.0000
+    251.1000   1521.4900      0.0000      0.0000
+    251.6000   1521.4700      0.0000      0.0000
+    252.1000   1521.4400      0.0000      0.0000
+    252.6000   1521.4200      0.0000      0.0000
+    253.2000   1521.4100      0.0000      0.0000
+    253.7000   1521.4000      0.0000      0.0000
+    254.2000   1521.3900      0.0000      0.0000
+    254.7000   1521.3900      0.0000      0.0000
+    255.3000   1521.3900      0.0000      0.0000
+    255.8000   1521.4000      0.0000      0.0000
+    256.3000   1521.4100      0.0000      0.0000
+    256.8000   1521.4100      0.0000      0.0000
+    257.3000   1521.3900      0.0000      0.0000
+    257.9000   1521.3700      0.0000      0.0000
+    258.4000   1521.3500      0.0000      0.0000
+    258.9000   1521.3300      0.0000      0.0000
+    259.4000   1521.3100      0.0000      0.0000
+    260.0000   1521.2800      0.0000      0.0000
+    260.5000   1521.2500      0.0000      0.0000
+    261.0000   1521.2200      0.0000      0.0000
+    261.5000   1521.1900      0.0000      0.0000
+    262.0000   1521.1700      0.0000      0.0000
+    262.6000   1521.1500      0.0000      0.0000
+    263.1000   1521.1300      0.0000      0.0000
+    263.6000   1521.1100      0.0000      0.0000
+    264.1000   1521.0900      0.0000      0.0000
+    264.7000   1521.0700      0.0000      0.0000
+    265.2000   1521.0500      0.0000      0.0000
+    265.7000   1521.0400      0.0000      0.0000
+    266.2000   1521.0400      0.0000      0.0000
+    266.7000   1521.0300      0.0000      0.0000
+    267.3000   1521.0200      0.0000      0.0000
+    267.8000   1521.0000      0.0000      0.0000
+    268.3000   1520.9800      0.0000      0.0000
+    268.8000   1520.9700      0.0000      0.0000
+    269.4000   1520.9500      0.0000      0.0000
+    269.9000   1520.9400      0.0000      0.0000
+    270.4000   1520.9200      0.0000      0.0000
+    270.9000   1520.8900      0.0000      0.0000
+    271.4000   1520.8700      0.0000      0.0000
+    272.0000   1520.8400      0.0000      0.0000
+    272.5000   1520.8200      0.0000      0.0000
+    273.0000   1520.8100      0.0000      0.0000
+    273.5000   1520.8100      0.0000      0.0000
+    274.1000   1520.8000      0.0000      0.0000
+    274.6000   1520.7900      0.0000      0.0000
+    275.1000   1520.7900      0.0000      0.0000
+    275.6000   1520.8000      0.0000      0.0000
+    276.1000   1520.8300      0.0000      0.0000
+    276.7000   1520.8600      0.0000      0.0000
+    277.2000   1520.8900      0.0000      0.0000
+    277.7000   1520.9200      0.0000      0.0000
+    278.2000   1520.9400      0.0000      0.0000
+    278.7000   1520.9700      0.0000      0.0000
+    279.3000   1520.9800      0.0000      0.0000
+    279.8000   1520.9900      0.0000      0.0000
+    280.3000   1520.9600      0.0000      0.0000
+    280.8000   1520.9100      0.0000      0.0000
+    281.3000   1520.8600      0.0000      0.0000
+    281.9000   1520.7900      0.0000      0.0000
+    282.4000   1520.7200      0.0000      0.0000
+    282.9000   1520.6500      0.0000      0.0000
+    283.4000   1520.5800      0.0000      0.0000
+    284.0000   1520.5200      0.0000      0.0000
+    284.5000   1520.4700      0.0000      0.0000
+    285.0000   1520.4400      0.0000      0.0000
+    285.5000   1520.4400      0.0000      0.0000
+    286.0000   1520.4400      0.0000      0.0000
+    286.6000   1520.4400      0.0000      0.0000
+    287.1000   1520.4500      0.0000      0.0000
+    287.6000   1520.4500      0.0000      0.0000
+    288.1000   1520.4800      0.0000      0.0000
+    288.6000   1520.5300      0.0000      0.0000
+    289.2000   1520.5700      0.0000      0.0000
+    289.7000   1520.6200      0.0000      0.0000
+    290.2000   1520.6600      0.0000      0.0000
+    290.7000   1520.7000      0.0000      0.0000
+    291.2000   1520.7500      0.0000      0.0000
+    291.8000   1520.8000      0.0000      0.0000
+    292.3000   1520.8400      0.0000      0.0000
+    292.8000   1520.8600      0.0000      0.0000
+    293.3000   1520.8600      0.0000      0.0000
+    293.8000   1520.8500      0.0000      0.0000
+    294.4000   1520.8400      0.0000      0.0000
+    294.9000   1520.8300      0.0000      0.0000
+    295.4000   1520.8200      0.0000      0.0000
+    295.9000   1520.8000      0.0000      0.0000
+    296.4000   1520.7800      0.0000      0.0000
+    297.0000   1520.7700      0.0000      0.0000
+    297.5000   1520.7700      0.0000      0.0000
+    298.0000   1520.7600      0.0000      0.0000
+    298.5000   1520.7500      0.0000      0.0000
+    299.0000   1520.7400      0.0000      0.0000
+    299.6000   1520.7200      0.0000      0.0000
+    300.1000   1520.7000      0.0000      0.0000
+    300.6000   1520.6700      0.0000      0.0000
+    301.1000   1520.6500      0.0000      0.0000
+    301.6000   1520.6200      0.0000      0.0000
+    302.2000   1520.5900      0.0000      0.0000
+    302.7000   1520.5600      0.0000      0.0000
+    303.2000   1520.5300      0.0000      0.0000
+    303.7000   1520.5000      0.0000      0.0000
+    304.2000   1520.4700      0.0000      0.0000
+    304.8000   1520.4300      0.0000      0.0000
+    305.3000   1520.3900      0.0000      0.0000
+    305.8000   1520.3400      0.0000      0.0000
+    306.3000   1520.3000      0.0000      0.0000
+    306.8000   1520.2500      0.0000      0.0000
+    307.4000   1520.2000      0.0000      0.0000
+    307.9000   1520.1600      0.0000      0.0000
+    308.4000   1520.1200      0.0000      0.0000
+    308.9000   1520.1000      0.0000      0.0000
+    309.4000   1520.1100      0.0000      0.0000
+    310.0000   1520.1300      0.0000      0.0000
+    310.5000   1520.1500      0.0000      0.0000
+    311.0000   1520.1700      0.0000      0.0000
+    311.5000   1520.1900      0.0000      0.0000
+    312.0000   1520.2000      0.0000      0.0000
+    312.6000   1520.2200      0.0000      0.0000
+    313.1000   1520.2300      0.0000      0.0000
+    313.6000   1520.2300      0.0000      0.0000
+    314.1000   1520.2100      0.0000      0.0000
+    314.6000   1520.1900      0.0000      0.0000
+    315.1000   1520.1600      0.0000      0.0000
+    315.7000   1520.1400      0.0000      0.0000
+    316.2000   1520.1200      0.0000      0.0000
+    316.7000   1520.1000      0.0000      0.0000
+    317.2000   1520.0900      0.0000      0.0000
+    317.7000   1520.0700      0.0000      0.0000
+    318.3000   1520.0600      0.0000      0.0000
+    318.8000   1520.0400      0.0000      0.0000
+    319.3000   1520.0300      0.0000      0.0000
+    319.8000   1520.0200      0.0000      0.0000
+    320.3000   1520.0000      0.0000      0.0000
+    320.9000   1519.9800      0.0000      0.0000
+    321.4000   1519.9700      0.0000      0.0000
+    321.9000   1519.9500      0.0000      0.0000
+    322.4000   1519.9300      0.0000      0.0000
+    322.9000   1519.9200      0.0000      0.0000
+    323.5000   1519.9100      0.0000      0.0000
+    324.0000   1519.9000      0.0000      0.0000
+    324.5000   1519.8900      0.0000      0.0000
+    325.0000   1519.8900      0.0000      0.0000
+    325.5000   1519.8800      0.0000      0.0000
+    326.0000   1519.8700      0.0000      0.0000
+    326.6000   1519.8700      0.0000      0.0000
+    327.1000   1519.8600      0.0000      0.0000
+    327.6000   1519.8500      0.0000      0.0000
+    328.1000   1519.8400      0.0000      0.0000
+    328.6000   1519.8300      0.0000      0.0000
+    329.2000   1519.8100      0.0000      0.0000
+    329.7000   1519.7900      0.0000      0.0000
+    330.2000   1519.7800      0.0000      0.0000
+    330.7000   1519.7600      0.0000      0.0000
+    331.2000   1519.7400      0.0000      0.0000
+    331.7000   1519.7300      0.0000      0.0000
+    332.3000   1519.7100      0.0000      0.0000
+    332.8000   1519.7000      0.0000      0.0000
+    333.3000   1519.6900      0.0000      0.0000
+    333.8000   1519.6800      0.0000      0.0000
+    334.3000   1519.6700      0.0000      0.0000
+    334.9000   1519.6600      0.0000      0.0000
+    335.4000   1519.6500      0.0000      0.0000
+    335.9000   1519.6400      0.0000      0.0000
+    336.4000   1519.6300      0.0000      0.0000
+    336.9000   1519.6100      0.0000      0.0000
+    337.4000   1519.5800      0.0000      0.0000
+    338.0000   1519.5500      0.0000      0.0000
+    338.5000   1519.5200      0.0000      0.0000
+    339.0000   1519.4800      0.0000      0.0000
+    339.5000   1519.4300      0.0000      0.0000
+    340.0000   1519.3800      0.0000      0.0000
+    340.5000   1519.3200      0.0000      0.0000
+    341.1000   1519.2700      0.0000      0.0000
+    341.6000   1519.2100      0.0000      0.0000
+    342.1000   1519.1600      0.0000      0.0000
+    342.6000   1519.1200      0.0000      0.0000
+    343.1000   1519.0800      0.0000      0.0000
+    343.7000   1519.0400      0.0000      0.0000
+    344.2000   1519.0000      0.0000      0.0000
+    344.7000   1518.9700      0.0000      0.0000
+    345.2000   1518.9400      0.0000      0.0000
+    345.7000   1518.9200      0.0000      0.0000
+    346.2000   1518.9000      0.0000      0.0000
+    346.8000   1518.8900      0.0000      0.0000
+    347.3000   1518.8700      0.0000      0.0000
+    347.8000   1518.8500      0.0000      0.0000
+    348.3000   1518.8300      0.0000      0.0000
+    348.8000   1518.8100      0.0000      0.0000
+    349.3000   1518.7900      0.0000      0.0000
+    349.9000   1518.7700      0.0000      0.0000
+    350.4000   1518.7400      0.0000      0.0000
+    350.9000   1518.7100      0.0000      0.0000
+    351.4000   1518.6800      0.0000      0.0000
+    351.9000   1518.6400      0.0000      0.0000
+    352.4000   1518.6100      0.0000      0.0000
+    353.0000   1518.5900      0.0000      0.0000
+    353.5000   1518.5600      0.0000      0.0000
+    354.0000   1518.5400      0.0000      0.0000
+    354.5000   1518.5200      0.0000      0.0000
+    355.0000   1518.5000      0.0000      0.0000
+    355.5000   1518.4800      0.0000      0.0000
+    356.1000   1518.4500      0.0000      0.0000
+    356.6000   1518.4200      0.0000      0.0000
+    357.1000   1518.3800      0.0000      0.0000
+    357.6000   1518.3400      0.0000      0.0000
+    358.1000   1518.3100      0.0000      0.0000
+    358.6000   1518.2700      0.0000      0.0000
+    359.2000   1518.2300      0.0000      0.0000
+    359.7000   1518.1800      0.0000      0.0000
+    360.2000   1518.1300      0.0000      0.0000
+    360.7000   1518.0900      0.0000      0.0000
+    361.2000   1518.0600      0.0000      0.0000
+    361.7000   1518.0200      0.0000      0.0000
+    362.3000   1517.9700      0.0000      0.0000
+    362.8000   1517.9100      0.0000      0.0000
+    363.3000   1517.8500      0.0000      0.0000
+    363.8000   1517.7900      0.0000      0.0000
+    364.3000   1517.7400      0.0000      0.0000
+    364.8000   1517.6800      0.0000      0.0000
+    365.4000   1517.6300      0.0000      0.0000
+    365.9000   1517.5800      0.0000      0.0000
+    366.4000   1517.5300      0.0000      0.0000
+    366.9000   1517.4900      0.0000      0.0000
+    367.4000   1517.4500      0.0000      0.0000
+    367.9000   1517.4200      0.0000      0.0000
+    368.5000   1517.3800      0.0000      0.0000
+    369.0000   1517.3500      0.0000      0.0000
+    369.5000   1517.3200      0.0000      0.0000
+    370.0000   1517.2800      0.0000      0.0000
+    370.5000   1517.2500      0.0000      0.0000
+    371.0000   1517.2200      0.0000      0.0000
+    371.6000   1517.2000      0.0000      0.0000
+    372.1000   1517.1800      0.0000      0.0000
+    372.6000   1517.1500      0.0000      0.0000
+    373.1000   1517.1300      0.0000      0.0000
+    373.6000   1517.1000      0.0000      0.0000
+    374.1000   1517.0800      0.0000      0.0000
+    374.6000   1517.0500      0.0000      0.0000
+    375.2000   1517.0300      0.0000      0.0000
+    375.7000   1517.0000      0.0000      0.0000
+    376.2000   1516.9700      0.0000      0.0000
+    376.7000   1516.9400      0.0000      0.0000
+    377.2000   1516.9200      0.0000      0.0000
+    377.7000   1516.9000      0.0000      0.0000
+    378.3000   1516.8800      0.0000      0.0000
+    378.8000   1516.8500      0.0000      0.0000
+    379.3000   1516.8200      0.0000      0.0000
+    379.8000   1516.7900      0.0000      0.0000
+    380.3000   1516.7700      0.0000      0.0000
+    380.8000   1516.7500      0.0000      0.0000
+    381.3000   1516.7300      0.0000      0.0000
+    381.9000   1516.7000      0.0000      0.0000
+    382.4000   1516.6700      0.0000      0.0000
+    382.9000   1516.6500      0.0000      0.0000
+    383.4000   1516.6200      0.0000      0.0000
+    383.9000   1516.5900      0.0000      0.0000
+    384.4000   1516.5600      0.0000      0.0000
+    385.0000   1516.5200      0.0000      0.0000
+    385.5000   1516.4700      0.0000      0.0000
+    386.0000   1516.4200      0.0000      0.0000
+    386.5000   1516.3700      0.0000      0.0000
+    387.0000   1516.3200      0.0000      0.0000
+    387.5000   1516.2800      0.0000      0.0000
+    388.0000   1516.2500      0.0000      0.0000
+    388.6000   1516.2100      0.0000      0.0000
+    389.1000   1516.1800      0.0000      0.0000
+    389.6000   1516.1600      0.0000      0.0000
+    390.1000   1516.1400      0.0000      0.0000
+    390.6000   1516.1100      0.0000      0.0000
+    391.1000   1516.0900      0.0000      0.0000
+    391.6000   1516.0700      0.0000      0.0000
+    392.2000   1516.0500      0.0000      0.0000
+    392.7000   1516.0300      0.0000      0.0000
+    393.2000   1516.0000      0.0000      0.0000
+    393.7000   1515.9800      0.0000      0.0000
+    394.2000   1515.9600      0.0000      0.0000
+    394.7000   1515.9500      0.0000      0.0000
+    395.3000   1515.9300      0.0000      0.0000
+    395.8000   1515.9300      0.0000      0.0000
+    396.3000   1515.9200      0.0000      0.0000
+    396.8000   1515.9100      0.0000      0.0000
+    397.3000   1515.9000      0.0000      0.0000
+    397.8000   1515.8800      0.0000      0.0000
+    398.3000   1515.8500      0.0000      0.0000
+    398.9000   1515.8200      0.0000      0.0000
+    399.4000   1515.7900      0.0000      0.0000
+    399.9000   1515.7400      0.0000      0.0000
+    400.4000   1515.6800      0.0000      0.0000
+    400.9000   1515.6100      0.0000      0.0000
+    401.4000   1515.5500      0.0000      0.0000
+    401.9000   1515.5000      0.0000      0.0000
+    402.5000   1515.4500      0.0000      0.0000
+    403.0000   1515.4000      0.0000      0.0000
+    403.5000   1515.3500      0.0000      0.0000
+    404.0000   1515.3100      0.0000      0.0000
+    404.5000   1515.2900      0.0000      0.0000
+    405.0000   1515.2800      0.0000      0.0000
+    405.5000   1515.2600      0.0000      0.0000
+    406.0000   1515.2400      0.0000      0.0000
+    406.6000   1515.2000      0.0000      0.0000
+    407.1000   1515.1700      0.0000      0.0000
+    407.6000   1515.1400      0.0000      0.0000
+    408.1000   1515.1100      0.0000      0.0000
+    408.6000   1515.0800      0.0000      0.0000
+    409.1000   1515.0400      0.0000      0.0000
+    409.6000   1515.0000      0.0000      0.0000
+    410.2000   1514.9500      0.0000      0.0000
+    410.7000   1514.9100      0.0000      0.0000
+    411.2000   1514.8700      0.0000      0.0000
+    411.7000   1514.8400      0.0000      0.0000
+    412.2000   1514.8000      0.0000      0.0000
+    412.7000   1514.7600      0.0000      0.0000
+    413.2000   1514.7100      0.0000      0.0000
+    413.8000   1514.6600      0.0000      0.0000
+    414.3000   1514.6100      0.0000      0.0000
+    414.8000   1514.5600      0.0000      0.0000
+    415.3000   1514.5000      0.0000      0.0000
+    415.8000   1514.4500      0.0000      0.0000
+    416.3000   1514.4000      0.0000      0.0000
+    416.8000   1514.3500      0.0000      0.0000
+    417.3000   1514.3000      0.0000      0.0000
+    417.9000   1514.2500      0.0000      0.0000
+    418.4000   1514.2100      0.0000      0.0000
+    418.9000   1514.1700      0.0000      0.0000
+    419.4000   1514.1300      0.0000      0.0000
+    419.9000   1514.1000      0.0000      0.0000
+    420.4000   1514.0600      0.0000      0.0000
+    420.9000   1514.0200      0.0000      0.0000
+    421.5000   1513.9900      0.0000      0.0000
+    422.0000   1513.9600      0.0000      0.0000
+    422.5000   1513.9300      0.0000      0.0000
+    423.0000   1513.9000      0.0000      0.0000
+    423.5000   1513.8700      0.0000      0.0000
+    424.0000   1513.8400      0.0000      0.0000
+    424.5000   1513.8000      0.0000      0.0000
+    425.0000   1513.7600      0.0000      0.0000
+    425.6000   1513.7200      0.0000      0.0000
+    426.1000   1513.6700      0.0000      0.0000
+    426.6000   1513.6200      0.0000      0.0000
+    427.1000   1513.5700      0.0000      0.0000
+    427.6000   1513.5200      0.0000      0.0000
+    428.1000   1513.4700      0.0000      0.0000
+    428.6000   1513.4200      0.0000      0.0000
+    429.1000   1513.3800      0.0000      0.0000
+    429.7000   1513.3400      0.0000      0.0000
+    430.2000   1513.2800      0.0000      0.0000
+    430.7000   1513.2300      0.0000      0.0000
+    431.2000   1513.1700      0.0000      0.0000
+    431.7000   1513.1100      0.0000      0.0000
+    432.2000   1513.0600      0.0000      0.0000
+    432.7000   1513.0100      0.0000      0.0000
+    433.2000   1512.9600      0.0000      0.0000
+    433.8000   1512.9100      0.0000      0.0000
+    434.3000   1512.8600      0.0000      0.0000
+    434.8000   1512.8300      0.0000      0.0000
+    435.3000   1512.8100      0.0000      0.0000
+    435.8000   1512.7900      0.0000      0.0000
+    436.3000   1512.7700      0.0000      0.0000
+    436.8000   1512.7400      0.0000      0.0000
+    437.3000   1512.7100      0.0000      0.0000
+    437.9000   1512.6700      0.0000      0.0000
+    438.4000   1512.6400      0.0000      0.0000
+    438.9000   1512.6000      0.0000      0.0000
+    439.4000   1512.5600      0.0000      0.0000
+    439.9000   1512.5300      0.0000      0.0000
+    440.4000   1512.4800      0.0000      0.0000
+    440.9000   1512.4400      0.0000      0.0000
+    441.4000   1512.3900      0.0000      0.0000
+    441.9000   1512.3500      0.0000      0.0000
+    442.5000   1512.3000      0.0000      0.0000
+    443.0000   1512.2500      0.0000      0.0000
+    443.5000   1512.1900      0.0000      0.0000
+    444.0000   1512.1300      0.0000      0.0000
+    444.5000   1512.0600      0.0000      0.0000
+    445.0000   1512.0000      0.0000      0.0000
+    445.5000   1511.9400      0.0000      0.0000
+    446.0000   1511.8900      0.0000      0.0000
+    446.6000   1511.8400      0.0000      0.0000
+    447.1000   1511.8000      0.0000      0.0000
+    447.6000   1511.7600      0.0000      0.0000
+    448.1000   1511.7300      0.0000      0.0000
+    448.6000   1511.7000      0.0000      0.0000
+    449.1000   1511.6800      0.0000      0.0000
+    449.6000   1511.6600      0.0000      0.0000
+    450.1000   1511.6500      0.0000      0.0000
+    450.6000   1511.6300      0.0000      0.0000
+    451.2000   1511.6100      0.0000      0.0000
+    451.7000   1511.5900      0.0000      0.0000
+    452.2000   1511.5600      0.0000      0.0000
+    452.7000   1511.5400      0.0000      0.0000
+    453.2000   1511.5200      0.0000      0.0000
+    453.7000   1511.5000      0.0000      0.0000
+    454.2000   1511.4800      0.0000      0.0000
+    454.7000   1511.4600      0.0000      0.0000
+    455.2000   1511.4500      0.0000      0.0000
+    455.8000   1511.4300      0.0000      0.0000
+    456.3000   1511.4000      0.0000      0.0000
+    456.8000   1511.3600      0.0000      0.0000
+    457.3000   1511.3300      0.0000      0.0000
+    457.8000   1511.2900      0.0000      0.0000
+    458.3000   1511.2500      0.0000      0.0000
+    458.8000   1511.2100      0.0000      0.0000
+    459.3000   1511.1500      0.0000      0.0000
+    459.8000   1511.0800      0.0000      0.0000
+    460.4000   1511.0300      0.0000      0.0000
+    460.9000   1510.9800      0.0000      0.0000
+    461.4000   1510.9300      0.0000      0.0000
+    461.9000   1510.8900      0.0000      0.0000
+    462.4000   1510.8400      0.0000      0.0000
+    462.9000   1510.7900      0.0000      0.0000
+    463.4000   1510.7600      0.0000      0.0000
+    463.9000   1510.7300      0.0000      0.0000
+    464.4000   1510.7000      0.0000      0.0000
+    465.0000   1510.6800      0.0000      0.0000
+    465.5000   1510.6500      0.0000      0.0000
+    466.0000   1510.6200      0.0000      0.0000
+    466.5000   1510.5900      0.0000      0.0000
+    467.0000   1510.5500      0.0000      0.0000
+    467.5000   1510.5100      0.0000      0.0000
+    468.0000   1510.4600      0.0000      0.0000
+    468.5000   1510.4100      0.0000      0.0000
+    469.0000   1510.3600      0.0000      0.0000
+    469.5000   1510.3100      0.0000      0.0000
+    470.1000   1510.2600      0.0000      0.0000
+    470.6000   1510.2100      0.0000      0.0000
+    471.1000   1510.1700      0.0000      0.0000
+    471.6000   1510.1300      0.0000      0.0000
+    472.1000   1510.1000      0.0000      0.0000
+    472.6000   1510.0700      0.0000      0.0000
+    473.1000   1510.0500      0.0000      0.0000
+    473.6000   1510.0200      0.0000      0.0000
+    474.1000   1509.9900      0.0000      0.0000
+    474.6000   1509.9500      0.0000      0.0000
+    475.2000   1509.9200      0.0000      0.0000
+    475.7000   1509.8800      0.0000      0.0000
+    476.2000   1509.8300      0.0000      0.0000
+    476.7000   1509.7900      0.0000      0.0000
+    477.2000   1509.7500      0.0000      0.0000
+    477.7000   1509.7100      0.0000      0.0000
+    478.2000   1509.6800      0.0000      0.0000
+    478.7000   1509.6500      0.0000      0.0000
+    479.2000   1509.6300      0.0000      0.0000
+    479.7000   1509.6100      0.0000      0.0000
+    480.3000   1509.6000      0.0000      0.0000
+    480.8000   1509.5900      0.0000      0.0000
+    481.3000   1509.5600      0.0000      0.0000
+    481.8000   1509.5400      0.0000      0.0000
+    482.3000   1509.5100      0.0000      0.0000
+    482.8000   1509.4800      0.0000      0.0000
+    483.3000   1509.4400      0.0000      0.0000
+    483.8000   1509.3900      0.0000      0.0000
+    484.3000   1509.3400      0.0000      0.0000
+    484.8000   1509.3000      0.0000      0.0000
+    485.3000   1509.2600      0.0000      0.0000
+    485.9000   1509.2100      0.0000      0.0000
+    486.4000   1509.1600      0.0000      0.0000
+    486.9000   1509.1200      0.0000      0.0000
+    487.4000   1509.0700      0.0000      0.0000
+    487.9000   1509.0200      0.0000      0.0000
+    488.4000   1508.9700      0.0000      0.0000
+    488.9000   1508.9300      0.0000      0.0000
+    489.4000   1508.8800      0.0000      0.0000
+    489.9000   1508.8300      0.0000      0.0000
+    490.4000   1508.7900      0.0000      0.0000
+    490.9000   1508.7500      0.0000      0.0000
+    491.5000   1508.7100      0.0000      0.0000
+    492.0000   1508.6700      0.0000      0.0000
+    492.5000   1508.6300      0.0000      0.0000
+    493.0000   1508.5800      0.0000      0.0000
+    493.5000   1508.5300      0.0000      0.0000
+    494.0000   1508.4600      0.0000      0.0000
+    494.5000   1508.4000      0.0000      0.0000
+    495.0000   1508.3300      0.0000      0.0000
+    495.5000   1508.2700      0.0000      0.0000
+    496.0000   1508.2000      0.0000      0.0000
+    496.5000   1508.1400      0.0000      0.0000
+    497.1000   1508.0700      0.0000      0.0000
+    497.6000   1508.0200      0.0000      0.0000
+    498.1000   1507.9700      0.0000      0.0000
+    498.6000   1507.9400      0.0000      0.0000
+    499.1000   1507.9000      0.0000      0.0000
+    499.6000   1507.8800      0.0000      0.0000
+    500.1000   1507.8600      0.0000      0.0000
+    500.6000   1507.8400      0.0000      0.0000
+    501.1000   1507.8200      0.0000      0.0000
+    501.6000   1507.8000      0.0000      0.0000
+    502.1000   1507.7700      0.0000      0.0000
+    502.6000   1507.7400      0.0000      0.0000
+    503.2000   1507.7000      0.0000      0.0000
+    503.7000   1507.6600      0.0000      0.0000
+    504.2000   1507.6000      0.0000      0.0000
+    504.7000   1507.5400      0.0000      0.0000
+    505.2000   1507.4600      0.0000      0.0000
+    505.7000   1507.3900      0.0000      0.0000
+    506.2000   1507.3200      0.0000      0.0000
+    506.7000   1507.2600      0.0000      0.0000
+    507.2000   1507.2000      0.0000      0.0000
+    507.7000   1507.1400      0.0000      0.0000
+    508.2000   1507.0900      0.0000      0.0000
+    508.7000   1507.0500      0.0000      0.0000
+    509.3000   1507.0100      0.0000      0.0000
+    509.8000   1506.9900      0.0000      0.0000
+    510.3000   1506.9700      0.0000      0.0000
+    510.8000   1506.9500      0.0000      0.0000
+    511.3000   1506.9400      0.0000      0.0000
+    511.8000   1506.9200      0.0000      0.0000
+    512.3000   1506.9100      0.0000      0.0000
+    512.8000   1506.9000      0.0000      0.0000
+    513.3000   1506.8900      0.0000      0.0000
+    513.8000   1506.8800      0.0000      0.0000
+    514.3000   1506.8800      0.0000      0.0000
+    514.8000   1506.8800      0.0000      0.0000
+    515.3000   1506.8700      0.0000      0.0000
+    515.9000   1506.8600      0.0000      0.0000
+    516.4000   1506.8600      0.0000      0.0000
+    516.9000   1506.8500      0.0000      0.0000
+    517.4000   1506.8400      0.0000      0.0000
+    517.9000   1506.8300      0.0000      0.0000
+    518.4000   1506.8000      0.0000      0.0000
+    518.9000   1506.7700      0.0000      0.0000
+    519.4000   1506.7300      0.0000      0.0000
+    519.9000   1506.6800      0.0000      0.0000
+    520.4000   1506.6400      0.0000      0.0000
+    520.9000   1506.5900      0.0000      0.0000
+    521.4000   1506.5500      0.0000      0.0000
+    521.9000   1506.5100      0.0000      0.0000
+    522.4000   1506.4600      0.0000      0.0000
+    523.0000   1506.4300      0.0000      0.0000
+    523.5000   1506.4100      0.0000      0.0000
+    524.0000   1506.3900      0.0000      0.0000
+    524.5000   1506.3700      0.0000      0.0000
+    525.0000   1506.3600      0.0000      0.0000
+    525.5000   1506.3400      0.0000      0.0000
+    526.0000   1506.3200      0.0000      0.0000
+    526.5000   1506.3000      0.0000      0.0000
+    527.0000   1506.2700      0.0000      0.0000
+    527.5000   1506.2500      0.0000      0.0000
+    528.0000   1506.2200      0.0000      0.0000
+    528.5000   1506.1900      0.0000      0.0000
+    529.0000   1506.1600      0.0000      0.0000
+    529.5000   1506.1200      0.0000      0.0000
+    530.1000   1506.0700      0.0000      0.0000
+    530.6000   1506.0300      0.0000      0.0000
+    531.1000   1505.9700      0.0000      0.0000
+    531.6000   1505.9000      0.0000      0.0000
+    532.1000   1505.8300      0.0000      0.0000
+    532.6000   1505.7600      0.0000      0.0000
+    533.1000   1505.7000      0.0000      0.0000
+    533.6000   1505.6400      0.0000      0.0000
+    534.1000   1505.5800      0.0000      0.0000
+    534.6000   1505.5400      0.0000      0.0000
+    535.1000   1505.5000      0.0000      0.0000
+    535.6000   1505.4800      0.0000      0.0000
+    536.1000   1505.4700      0.0000      0.0000
+    536.6000   1505.4500      0.0000      0.0000
+    537.1000   1505.4400      0.0000      0.0000
+    537.6000   1505.4300      0.0000      0.0000
+    538.2000   1505.4200      0.0000      0.0000
+    538.7000   1505.3900      0.0000      0.0000
+    539.2000   1505.3500      0.0000      0.0000
+    539.7000   1505.2800      0.0000      0.0000
+    540.2000   1505.2000      0.0000      0.0000
+    540.7000   1505.1000      0.0000      0.0000
+    541.2000   1504.9900      0.0000      0.0000
+    541.7000   1504.8700      0.0000      0.0000
+    542.2000   1504.7400      0.0000      0.0000
+    542.7000   1504.6100      0.0000      0.0000
+    543.2000   1504.4800      0.0000      0.0000
+    543.7000   1504.3700      0.0000      0.0000
+    544.2000   1504.2700      0.0000      0.0000
+    544.7000   1504.1800      0.0000      0.0000
+    545.2000   1504.1100      0.0000      0.0000
+    545.7000   1504.0400      0.0000      0.0000
+    546.3000   1503.9800      0.0000      0.0000
+    546.8000   1503.9200      0.0000      0.0000
+    547.3000   1503.8600      0.0000      0.0000
+    547.8000   1503.7900      0.0000      0.0000
+    548.3000   1503.7300      0.0000      0.0000
+    548.8000   1503.6700      0.0000      0.0000
+    549.3000   1503.6000      0.0000      0.0000
+    549.8000   1503.5200      0.0000      0.0000
+    550.3000   1503.4300      0.0000      0.0000
+    550.8000   1503.3400      0.0000      0.0000
+    551.3000   1503.2500      0.0000      0.0000
+    551.8000   1503.1400      0.0000      0.0000
+    552.3000   1503.0300      0.0000      0.0000
+    552.8000   1502.9100      0.0000      0.0000
+    553.3000   1502.7900      0.0000      0.0000
+    553.8000   1502.6700      0.0000      0.0000
+    554.3000   1502.5700      0.0000      0.0000
+    554.8000   1502.4600      0.0000      0.0000
+    555.3000   1502.3600      0.0000      0.0000
+    555.9000   1502.2600      0.0000      0.0000
+    556.4000   1502.1700      0.0000      0.0000
+    556.9000   1502.0800      0.0000      0.0000
+    557.4000   1502.0000      0.0000      0.0000
+    557.9000   1501.9200      0.0000      0.0000
+    558.4000   1501.8300      0.0000      0.0000
+    558.9000   1501.7500      0.0000      0.0000
+    559.4000   1501.6700      0.0000      0.0000
+    559.9000   1501.5900      0.0000      0.0000
+    560.4000   1501.5300      0.0000      0.0000
+    560.9000   1501.4700      0.0000      0.0000
+    561.4000   1501.4100      0.0000      0.0000
+    561.9000   1501.3400      0.0000      0.0000
+    562.4000   1501.2700      0.0000      0.0000
+    562.9000   1501.1900      0.0000      0.0000
+    563.4000   1501.1200      0.0000      0.0000
+    563.9000   1501.0500      0.0000      0.0000
+    564.4000   1500.9700      0.0000      0.0000
+    564.9000   1500.8900      0.0000      0.0000
+    565.4000   1500.8000      0.0000      0.0000
+    566.0000   1500.7100      0.0000      0.0000
+    566.5000   1500.6300      0.0000      0.0000
+    567.0000   1500.5500      0.0000      0.0000
+    567.5000   1500.4800      0.0000      0.0000
+    568.0000   1500.4000      0.0000      0.0000
+    568.5000   1500.3200      0.0000      0.0000
+    569.0000   1500.2400      0.0000      0.0000
+    569.5000   1500.1600      0.0000      0.0000
+    570.0000   1500.0800      0.0000      0.0000
+    570.5000   1499.9800      0.0000      0.0000
+    571.0000   1499.8700      0.0000      0.0000
+    571.5000   1499.7400      0.0000      0.0000
+    572.0000   1499.6100      0.0000      0.0000
+    572.5000   1499.4800      0.0000      0.0000
+    573.0000   1499.3600      0.0000      0.0000
+    573.5000   1499.2500      0.0000      0.0000
+    574.0000   1499.1500      0.0000      0.0000
+    574.5000   1499.0600      0.0000      0.0000
+    575.0000   1498.9500      0.0000      0.0000
+    575.5000   1498.8500      0.0000      0.0000
+    576.0000   1498.7500      0.0000      0.0000
+    576.5000   1498.6600      0.0000      0.0000
+    577.0000   1498.5600      0.0000      0.0000
+    577.6000   1498.4700      0.0000      0.0000
+    578.1000   1498.3700      0.0000      0.0000
+    578.6000   1498.2700      0.0000      0.0000
+    579.1000   1498.1700      0.0000      0.0000
+    579.6000   1498.0900      0.0000      0.0000
+    580.1000   1498.0400      0.0000      0.0000
+    580.6000   1497.9900      0.0000      0.0000
+    581.1000   1497.9400      0.0000      0.0000
+    581.6000   1497.8800      0.0000      0.0000
+    582.1000   1497.8000      0.0000      0.0000
+    582.6000   1497.7000      0.0000      0.0000
+    583.1000   1497.5900      0.0000      0.0000
+    583.6000   1497.4700      0.0000      0.0000
+    584.1000   1497.3500      0.0000      0.0000
+    584.6000   1497.2300      0.0000      0.0000
+    585.1000   1497.1100      0.0000      0.0000
+    585.6000   1496.9800      0.0000      0.0000
+    586.1000   1496.8800      0.0000      0.0000
+    586.6000   1496.7900      0.0000      0.0000
+    587.1000   1496.7300      0.0000      0.0000
+    587.6000   1496.6600      0.0000      0.0000
+    588.1000   1496.6100      0.0000      0.0000
+    588.6000   1496.5600      0.0000      0.0000
+    589.1000   1496.5000      0.0000      0.0000
+    589.6000   1496.4400      0.0000      0.0000
+    590.1000   1496.3700      0.0000      0.0000
+    590.6000   1496.3000      0.0000      0.0000
+    591.1000   1496.2200      0.0000      0.0000
+    591.6000   1496.1200      0.0000      0.0000
+    592.2000   1496.0300      0.0000      0.0000
+    592.7000   1495.9400      0.0000      0.0000
+    593.2000   1495.8500      0.0000      0.0000
+    593.7000   1495.7700      0.0000      0.0000
+    594.2000   1495.7000      0.0000      0.0000
+    594.7000   1495.6400      0.0000      0.0000
+    595.2000   1495.5800      0.0000      0.0000
+    595.7000   1495.5200      0.0000      0.0000
+    596.2000   1495.4600      0.0000      0.0000
+    596.7000   1495.3900      0.0000      0.0000
+    597.2000   1495.2900      0.0000      0.0000
+    597.7000   1495.1900      0.0000      0.0000
+    598.2000   1495.0700      0.0000      0.0000
+    598.7000   1494.9500      0.0000      0.0000
+    599.2000   1494.8300      0.0000      0.0000
+    599.7000   1494.7000      0.0000      0.0000
+    600.2000   1494.5900      0.0000      0.0000
+    600.7000   1494.4800      0.0000      0.0000
+    601.2000   1494.3900      0.0000      0.0000
+    601.7000   1494.3300      0.0000      0.0000
+    602.2000   1494.2800      0.0000      0.0000
+    602.7000   1494.2400      0.0000      0.0000
+    603.2000   1494.2200      0.0000      0.0000
+    603.7000   1494.2100      0.0000      0.0000
+    604.2000   1494.2000      0.0000      0.0000
+    604.7000   1494.2000      0.0000      0.0000
+    605.2000   1494.2100      0.0000      0.0000
+    605.7000   1494.2200      0.0000      0.0000
+    606.2000   1494.2300      0.0000      0.0000
+    606.7000   1494.2400      0.0000      0.0000
+    607.2000   1494.2600      0.0000      0.0000
+    607.7000   1494.2700      0.0000      0.0000
+    608.2000   1494.2900      0.0000      0.0000
+    608.7000   1494.3000      0.0000      0.0000
+    609.2000   1494.3100      0.0000      0.0000
+    609.7000   1494.3100      0.0000      0.0000
+    610.2000   1494.3200      0.0000      0.0000
+    610.7000   1494.3200      0.0000      0.0000
+    611.2000   1494.3300      0.0000      0.0000
+    611.8000   1494.3300      0.0000      0.0000
+    612.3000   1494.3400      0.0000      0.0000
+    612.8000   1494.3400      0.0000      0.0000
+    613.3000   1494.3500      0.0000      0.0000
+    613.8000   1494.3600      0.0000      0.0000
+    614.3000   1494.3600      0.0000      0.0000
+    614.8000   1494.3600      0.0000      0.0000
+    615.3000   1494.3500      0.0000      0.0000
+    615.8000   1494.3400      0.0000      0.0000
+    616.3000   1494.3200      0.0000      0.0000
+    616.8000   1494.3000      0.0000      0.0000
+    617.3000   1494.2700      0.0000      0.0000
+    617.8000   1494.2500      0.0000      0.0000
+    618.3000   1494.2100      0.0000      0.0000
+    618.8000   1494.1800      0.0000      0.0000
+    619.3000   1494.1600      0.0000      0.0000
+    619.8000   1494.1400      0.0000      0.0000
+    620.3000   1494.1200      0.0000      0.0000
+    620.8000   1494.1000      0.0000      0.0000
+    621.3000   1494.0900      0.0000      0.0000
+    621.8000   1494.0800      0.0000      0.0000
+    622.3000   1494.0700      0.0000      0.0000
+    622.8000   1494.0600      0.0000      0.0000
+    623.3000   1494.0600      0.0000      0.0000
+    623.8000   1494.0500      0.0000      0.0000
+    624.3000   1494.0500      0.0000      0.0000
+    624.8000   1494.0500      0.0000      0.0000
+    625.3000   1494.0500      0.0000      0.0000
+    625.8000   1494.0400      0.0000      0.0000
+    626.3000   1494.0400      0.0000      0.0000
+    626.8000   1494.0400      0.0000      0.0000
+    627.3000   1494.0300      0.0000      0.0000
+    627.8000   1493.9900      0.0000      0.0000
+    628.3000   1493.9400      0.0000      0.0000
+    628.8000   1493.8700      0.0000      0.0000
+    629.3000   1493.8000      0.0000      0.0000
+    629.8000   1493.7200      0.0000      0.0000
+    630.3000   1493.6300      0.0000      0.0000
+    630.8000   1493.5200      0.0000      0.0000
+    631.3000   1493.4100      0.0000      0.0000
+    631.8000   1493.2800      0.0000      0.0000
+    632.3000   1493.1500      0.0000      0.0000
+    632.8000   1493.0300      0.0000      0.0000
+    633.3000   1492.9100      0.0000      0.0000
+    633.8000   1492.7900      0.0000      0.0000
+    634.3000   1492.6800      0.0000      0.0000
+    634.8000   1492.5700      0.0000      0.0000
+    635.3000   1492.4600      0.0000      0.0000
+    635.8000   1492.3800      0.0000      0.0000
+    636.3000   1492.3100      0.0000      0.0000
+    636.8000   1492.2600      0.0000      0.0000
+    637.3000   1492.2300      0.0000      0.0000
+    637.8000   1492.2000      0.0000      0.0000
+    638.3000   1492.1700      0.0000      0.0000
+    638.8000   1492.1400      0.0000      0.0000
+    639.3000   1492.1200      0.0000      0.0000
+    639.8000   1492.0900      0.0000      0.0000
+    640.3000   1492.0500      0.0000      0.0000
+    640.8000   1492.0100      0.0000      0.0000
+    641.3000   1491.9600      0.0000      0.0000
+    641.8000   1491.9000      0.0000      0.0000
+    642.3000   1491.8300      0.0000      0.0000
+    642.8000   1491.7600      0.0000      0.0000
+    643.3000   1491.7000      0.0000      0.0000
+    643.8000   1491.6400      0.0000      0.0000
+    644.3000   1491.5800      0.0000      0.0000
+    644.8000   1491.5200      0.0000      0.0000
+    645.3000   1491.4600      0.0000      0.0000
+    645.8000   1491.4100      0.0000      0.0000
+    646.3000   1491.3700      0.0000      0.0000
+    646.8000   1491.3300      0.0000      0.0000
+    647.3000   1491.2700      0.0000      0.0000
+    647.8000   1491.2000      0.0000      0.0000
+    648.3000   1491.1300      0.0000      0.0000
+    648.8000   1491.0600      0.0000      0.0000
+    649.3000   1490.9900      0.0000      0.0000
+    649.8000   1490.9300      0.0000      0.0000
+    650.3000   1490.8700      0.0000      0.0000
+    650.8000   1490.7900      0.0000      0.0000
+    651.3000   1490.7200      0.0000      0.0000
+    651.8000   1490.6600      0.0000      0.0000
+    652.3000   1490.6000      0.0000      0.0000
+    652.8000   1490.5500      0.0000      0.0000
+    653.3000   1490.5100      0.0000      0.0000
+    653.8000   1490.4500      0.0000      0.0000
+    654.3000   1490.4000      0.0000      0.0000
+    654.8000   1490.3500      0.0000      0.0000
+    655.3000   1490.3100      0.0000      0.0000
+    655.8000   1490.2800      0.0000      0.0000
+    656.3000   1490.2500      0.0000      0.0000
+    656.8000   1490.2300      0.0000      0.0000
+    657.3000   1490.2100      0.0000      0.0000
+    657.8000   1490.1800      0.0000      0.0000
+    658.3000   1490.1600      0.0000      0.0000
+    658.8000   1490.1500      0.0000      0.0000
+    659.3000   1490.1300      0.0000      0.0000
+    659.8000   1490.1200      0.0000      0.0000
+    660.3000   1490.1100      0.0000      0.0000
+    660.8000   1490.1000      0.0000      0.0000
+    661.3000   1490.0800      0.0000      0.0000
+    661.8000   1490.0700      0.0000      0.0000
+    662.3000   1490.0400      0.0000      0.0000
+    662.8000   1490.0200      0.0000      0.0000
+    663.3000   1489.9900      0.0000      0.0000
+    663.8000   1489.9600      0.0000      0.0000
+    664.3000   1489.9300      0.0000      0.0000
+    664.8000   1489.9000      0.0000      0.0000
+    665.3000   1489.8700      0.0000      0.0000
+    665.8000   1489.8400      0.0000      0.0000
+    666.3000   1489.8200      0.0000      0.0000
+    666.8000   1489.8000      0.0000      0.0000
+    667.3000   1489.7800      0.0000      0.0000
+    667.8000   1489.7600      0.0000      0.0000
+    668.3000   1489.7400      0.0000      0.0000
+    668.8000   1489.7300      0.0000      0.0000
+    669.3000   1489.7100      0.0000      0.0000
+    669.8000   1489.6900      0.0000      0.0000
+    670.3000   1489.6700      0.0000      0.0000
+    670.8000   1489.6500      0.0000      0.0000
+    671.3000   1489.6400      0.0000      0.0000
+    671.8000   1489.6200      0.0000      0.0000
+    672.3000   1489.6100      0.0000      0.0000
+    672.8000   1489.6000      0.0000      0.0000
+    673.3000   1489.5900      0.0000      0.0000
+    673.8000   1489.5700      0.0000      0.0000
+    674.3000   1489.5500      0.0000      0.0000
+    674.8000   1489.5300      0.0000      0.0000
+    675.3000   1489.5100      0.0000      0.0000
+    675.8000   1489.4800      0.0000      0.0000
+    676.3000   1489.4400      0.0000      0.0000
+    676.8000   1489.4000      0.0000      0.0000
+    677.2000   1489.3600      0.0000      0.0000
+    677.7000   1489.3100      0.0000      0.0000
+    678.2000   1489.2700      0.0000      0.0000
+    678.7000   1489.2200      0.0000      0.0000
+    679.2000   1489.1800      0.0000      0.0000
+    679.7000   1489.1500      0.0000      0.0000
+    680.2000   1489.1100      0.0000      0.0000
+    680.7000   1489.0800      0.0000      0.0000
+    681.2000   1489.0600      0.0000      0.0000
+    681.7000   1489.0500      0.0000      0.0000
+    682.2000   1489.0400      0.0000      0.0000
+    682.7000   1489.0300      0.0000      0.0000
+    683.2000   1489.0200      0.0000      0.0000
+    683.7000   1489.0100      0.0000      0.0000
+    684.2000   1489.0000      0.0000      0.0000
+    684.7000   1488.9800      0.0000      0.0000
+    685.2000   1488.9700      0.0000      0.0000
+    685.7000   1488.9600      0.0000      0.0000
+    686.2000   1488.9500      0.0000      0.0000
+    686.7000   1488.9300      0.0000      0.0000
+    687.2000   1488.9200      0.0000      0.0000
+    687.7000   1488.9000      0.0000      0.0000
+    688.2000   1488.8900      0.0000      0.0000
+    688.7000   1488.8800      0.0000      0.0000
+    689.2000   1488.8700      0.0000      0.0000
+    689.7000   1488.8600      0.0000      0.0000
+    690.2000   1488.8500      0.0000      0.0000
+    690.7000   1488.8400      0.0000      0.0000
+    691.2000   1488.8300      0.0000      0.0000
+    691.7000   1488.8100      0.0000      0.0000
+    692.2000   1488.8000      0.0000      0.0000
+    692.7000   1488.7700      0.0000      0.0000
+    693.2000   1488.7400      0.0000      0.0000
+    693.7000   1488.7100      0.0000      0.0000
+    694.2000   1488.6800      0.0000      0.0000
+    694.7000   1488.6500      0.0000      0.0000
+    695.2000   1488.6200      0.0000      0.0000
+    695.7000   1488.5800      0.0000      0.0000
+    696.2000   1488.5400      0.0000      0.0000
+    696.7000   1488.5100      0.0000      0.0000
+    697.1000   1488.4700      0.0000      0.0000
+    697.6000   1488.4400      0.0000      0.0000
+    698.1000   1488.4100      0.0000      0.0000
+    698.6000   1488.3800      0.0000      0.0000
+    699.1000   1488.3400      0.0000      0.0000
+    699.6000   1488.3200      0.0000      0.0000
+    700.1000   1488.2900      0.0000      0.0000
+    700.6000   1488.2700      0.0000      0.0000
+    701.1000   1488.2500      0.0000      0.0000
+    701.6000   1488.2400      0.0000      0.0000
+    702.1000   1488.2300      0.0000      0.0000
+    702.6000   1488.2200      0.0000      0.0000
+    703.1000   1488.2100      0.0000      0.0000
+    703.6000   1488.2000      0.0000      0.0000
+    704.1000   1488.2000      0.0000      0.0000
+    704.6000   1488.1900      0.0000      0.0000
+    705.1000   1488.1800      0.0000      0.0000
+    705.6000   1488.1700      0.0000      0.0000
+    706.1000   1488.1500      0.0000      0.0000
+    706.6000   1488.1400      0.0000      0.0000
+    707.1000   1488.1300      0.0000      0.0000
+    707.6000   1488.1100      0.0000      0.0000
+    708.1000   1488.1000      0.0000      0.0000
+    708.6000   1488.0900      0.0000      0.0000
+    709.1000   1488.0700      0.0000      0.0000
+    709.6000   1488.0500      0.0000      0.0000
+    710.1000   1488.0400      0.0000      0.0000
+    710.6000   1488.0200      0.0000      0.0000
+    711.0000   1488.0100      0.0000      0.0000
+    711.5000   1487.9800      0.0000      0.0000
+    712.0000   1487.9500      0.0000      0.0000
+    712.5000   1487.9200      0.0000      0.0000
+    713.0000   1487.8800      0.0000      0.0000
+    713.5000   1487.8500      0.0000      0.0000
+    714.0000   1487.8200      0.0000      0.0000
+    714.5000   1487.7900      0.0000      0.0000
+    715.0000   1487.7500      0.0000      0.0000
+    715.5000   1487.7100      0.0000      0.0000
+    716.0000   1487.6700      0.0000      0.0000
+    716.5000   1487.6300      0.0000      0.0000
+    717.0000   1487.6000      0.0000      0.0000
+    717.5000   1487.5700      0.0000      0.0000
+    718.0000   1487.5400      0.0000      0.0000
+    718.5000   1487.5100      0.0000      0.0000
+    719.0000   1487.4900      0.0000      0.0000
+    719.5000   1487.4700      0.0000      0.0000
+    720.0000   1487.4600      0.0000      0.0000
+    720.5000   1487.4500      0.0000      0.0000
+    721.0000   1487.4500      0.0000      0.0000
+    721.5000   1487.4400      0.0000      0.0000
+    722.0000   1487.4400      0.0000      0.0000
+    722.5000   1487.4300      0.0000      0.0000
+    722.9000   1487.4300      0.0000      0.0000
+    723.4000   1487.4200      0.0000      0.0000
+    723.9000   1487.4100      0.0000      0.0000
+    724.4000   1487.4000      0.0000      0.0000
+    724.9000   1487.3900      0.0000      0.0000
+    725.4000   1487.3800      0.0000      0.0000
+    725.9000   1487.3700      0.0000      0.0000
+    726.4000   1487.3700      0.0000      0.0000
+    726.9000   1487.3600      0.0000      0.0000
+    727.4000   1487.3600      0.0000      0.0000
+    727.9000   1487.3500      0.0000      0.0000
+    728.4000   1487.3500      0.0000      0.0000
+    728.9000   1487.3400      0.0000      0.0000
+    729.4000   1487.3400      0.0000      0.0000
+    729.9000   1487.3300      0.0000      0.0000
+    730.4000   1487.3300      0.0000      0.0000
+    730.9000   1487.3200      0.0000      0.0000
+    731.4000   1487.3100      0.0000      0.0000
+    731.9000   1487.2900      0.0000      0.0000
+    732.4000   1487.2700      0.0000      0.0000
+    732.8000   1487.2600      0.0000      0.0000
+    733.3000   1487.2400      0.0000      0.0000
+    733.8000   1487.2200      0.0000      0.0000
+    734.3000   1487.2000      0.0000      0.0000
+    734.8000   1487.1800      0.0000      0.0000
+    735.3000   1487.1600      0.0000      0.0000
+    735.8000   1487.1500      0.0000      0.0000
+    736.3000   1487.1400      0.0000      0.0000
+    736.8000   1487.1300      0.0000      0.0000
+    737.3000   1487.1200      0.0000      0.0000
+    737.8000   1487.1200      0.0000      0.0000
+    738.3000   1487.1100      0.0000      0.0000
+    738.8000   1487.1100      0.0000      0.0000
+    739.3000   1487.1100      0.0000      0.0000
+    739.8000   1487.1000      0.0000      0.0000
+    740.3000   1487.0900      0.0000      0.0000
+    740.8000   1487.0800      0.0000      0.0000
+    741.3000   1487.0600      0.0000      0.0000
+    741.7000   1487.0500      0.0000      0.0000
+    742.2000   1487.0400      0.0000      0.0000
+    742.7000   1487.0300      0.0000      0.0000
+    743.2000   1487.0200      0.0000      0.0000
+    743.7000   1487.0200      0.0000      0.0000
+    744.2000   1487.0100      0.0000      0.0000
+    744.7000   1487.0100      0.0000      0.0000
+    745.2000   1487.0100      0.0000      0.0000
+    745.7000   1487.0100      0.0000      0.0000
+    746.2000   1487.0100      0.0000      0.0000
+    746.7000   1487.0000      0.0000      0.0000
+    747.2000   1486.9900      0.0000      0.0000
+    747.7000   1486.9800      0.0000      0.0000
+    748.2000   1486.9700      0.0000      0.0000
+    748.7000   1486.9600      0.0000      0.0000
+    749.2000   1486.9400      0.0000      0.0000
+    749.7000   1486.9300      0.0000      0.0000
+    750.1000   1486.9100      0.0000      0.0000
+    750.6000   1486.9000      0.0000      0.0000
+    751.1000   1486.8900      0.0000      0.0000
+    751.6000   1486.8800      0.0000      0.0000
+    752.1000   1486.8700      0.0000      0.0000
+    752.6000   1486.8600      0.0000      0.0000
+    753.1000   1486.8600      0.0000      0.0000
+    753.6000   1486.8500      0.0000      0.0000
+    754.1000   1486.8500      0.0000      0.0000
+    754.6000   1486.8500      0.0000      0.0000
+    755.1000   1486.8500      0.0000      0.0000
+    755.6000   1486.8600      0.0000      0.0000
+    756.1000   1486.8600      0.0000      0.0000
+    756.6000   1486.8600      0.0000      0.0000
+    757.1000   1486.8700      0.0000      0.0000
+    757.5000   1486.8700      0.0000      0.0000
+    758.0000   1486.8600      0.0000      0.0000
+    758.5000   1486.8600      0.0000      0.0000
+    759.0000   1486.8600      0.0000      0.0000
+    759.5000   1486.8500      0.0000      0.0000
+    760.0000   1486.8400      0.0000      0.0000
+    760.5000   1486.8300      0.0000      0.0000
+    761.0000   1486.8200      0.0000      0.0000
+    761.5000   1486.8100      0.0000      0.0000
+    762.0000   1486.7900      0.0000      0.0000
+    762.5000   1486.7800      0.0000      0.0000
+    763.0000   1486.7800      0.0000      0.0000
+    763.5000   1486.7700      0.0000      0.0000
+    764.0000   1486.7600      0.0000      0.0000
+    764.5000   1486.7600      0.0000      0.0000
+    764.9000   1486.7600      0.0000      0.0000
+    765.4000   1486.7600      0.0000      0.0000
+    765.9000   1486.7700      0.0000      0.0000
+    766.4000   1486.7700      0.0000      0.0000
+    766.9000   1486.7800      0.0000      0.0000
+    767.4000   1486.7800      0.0000      0.0000
+    767.9000   1486.7900      0.0000      0.0000
+    768.4000   1486.7900      0.0000      0.0000
+    768.9000   1486.7900      0.0000      0.0000
+    769.4000   1486.7900      0.0000      0.0000
+    769.9000   1486.7900      0.0000      0.0000
+    770.4000   1486.7900      0.0000      0.0000
+    770.9000   1486.7900      0.0000      0.0000
+    771.3000   1486.7900      0.0000      0.0000
+    771.8000   1486.8000      0.0000      0.0000
+    772.3000   1486.8000      0.0000      0.0000
+    772.8000   1486.8000      0.0000      0.0000
+    773.3000   1486.8100      0.0000      0.0000
+    773.8000   1486.8100      0.0000      0.0000
+    774.3000   1486.8100      0.0000      0.0000
+    774.8000   1486.8200      0.0000      0.0000
+    775.3000   1486.8200      0.0000      0.0000
+    775.8000   1486.8100      0.0000      0.0000
+    776.3000   1486.8100      0.0000      0.0000
+    776.8000   1486.8000      0.0000      0.0000
+    777.3000   1486.8000      0.0000      0.0000
+    777.7000   1486.7900      0.0000      0.0000
+    778.2000   1486.7700      0.0000      0.0000
+    778.7000   1486.7600      0.0000      0.0000
+    779.2000   1486.7500      0.0000      0.0000
+    779.7000   1486.7400      0.0000      0.0000
+    780.2000   1486.7300      0.0000      0.0000
+    780.7000   1486.7100      0.0000      0.0000
+    781.2000   1486.7000      0.0000      0.0000
+    781.7000   1486.6900      0.0000      0.0000
+    782.2000   1486.6800      0.0000      0.0000
+    782.7000   1486.6700      0.0000      0.0000
+    783.2000   1486.6600      0.0000      0.0000
+    783.6000   1486.6400      0.0000      0.0000
+    784.1000   1486.6400      0.0000      0.0000
+    784.6000   1486.6300      0.0000      0.0000
+    785.1000   1486.6200      0.0000      0.0000
+    785.6000   1486.6200      0.0000      0.0000
+    786.1000   1486.6100      0.0000      0.0000
+    786.6000   1486.6100      0.0000      0.0000
+    787.1000   1486.6100      0.0000      0.0000
+    787.6000   1486.6100      0.0000      0.0000
+    788.1000   1486.6100      0.0000      0.0000
+    788.6000   1486.6100      0.0000      0.0000
+    789.1000   1486.6100      0.0000      0.0000
+    789.5000   1486.6100      0.0000      0.0000
+    790.0000   1486.6100      0.0000      0.0000
+    790.5000   1486.6100      0.0000      0.0000
+    791.0000   1486.6100      0.0000      0.0000
+    791.5000   1486.6100      0.0000      0.0000
+    792.0000   1486.6200      0.0000      0.0000
+    792.5000   1486.6200      0.0000      0.0000
+    793.0000   1486.6200      0.0000      0.0000
+    793.5000   1486.6300      0.0000      0.0000
+    794.0000   1486.6400      0.0000      0.0000
+    794.5000   1486.6400      0.0000      0.0000
+    795.0000   1486.6500      0.0000      0.0000
+    795.4000   1486.6600      0.0000      0.0000
+    795.9000   1486.6700      0.0000      0.0000
+    796.4000   1486.6700      0.0000      0.0000
+    796.9000   1486.6800      0.0000      0.0000
+    797.4000   1486.6800      0.0000      0.0000
+    797.9000   1486.6900      0.0000      0.0000
+    798.4000   1486.7000      0.0000      0.0000
+    798.9000   1486.7000      0.0000      0.0000
+    799.4000   1486.7000      0.0000      0.0000
+    799.9000   1486.7000      0.0000      0.0000
+    800.4000   1486.6900      0.0000      0.0000
+    800.8000   1486.6900      0.0000      0.0000
+    801.3000   1486.6900      0.0000      0.0000
+    801.8000   1486.6900      0.0000      0.0000
+    802.3000   1486.6800      0.0000      0.0000
+    802.8000   1486.6800      0.0000      0.0000
+    803.3000   1486.6700      0.0000      0.0000
+    803.8000   1486.6600      0.0000      0.0000
+    804.3000   1486.6500      0.0000      0.0000
+    804.8000   1486.6300      0.0000      0.0000
+    805.3000   1486.6200      0.0000      0.0000
+    805.7000   1486.6000      0.0000      0.0000
+    806.2000   1486.5900      0.0000      0.0000
+    806.7000   1486.5800      0.0000      0.0000
+    807.2000   1486.5600      0.0000      0.0000
+    807.7000   1486.5500      0.0000      0.0000
+    808.2000   1486.5500      0.0000      0.0000
+    808.7000   1486.5400      0.0000      0.0000
+    809.2000   1486.5300      0.0000      0.0000
+    809.7000   1486.5200      0.0000      0.0000
+    810.2000   1486.5100      0.0000      0.0000
+    810.6000   1486.5000      0.0000      0.0000
+    811.1000   1486.4900      0.0000      0.0000
+    811.6000   1486.4800      0.0000      0.0000
+    812.1000   1486.4600      0.0000      0.0000
+    812.6000   1486.4500      0.0000      0.0000
+    813.1000   1486.4400      0.0000      0.0000
+    813.6000   1486.4400      0.0000      0.0000
+    814.1000   1486.4300      0.0000      0.0000
+    814.6000   1486.4300      0.0000      0.0000
+    815.1000   1486.4200      0.0000      0.0000
+    815.5000   1486.4200      0.0000      0.0000
+    816.0000   1486.4200      0.0000      0.0000
+    816.5000   1486.4200      0.0000      0.0000
+    817.0000   1486.4200      0.0000      0.0000
+    817.5000   1486.4200      0.0000      0.0000
+    818.0000   1486.4200      0.0000      0.0000
+    818.5000   1486.4200      0.0000      0.0000
+    819.0000   1486.4200      0.0000      0.0000
+    819.5000   1486.4200      0.0000      0.0000
+    820.0000   1486.4300      0.0000      0.0000
+    820.4000   1486.4300      0.0000      0.0000
+    820.9000   1486.4400      0.0000      0.0000
+    821.4000   1486.4400      0.0000      0.0000
+    821.9000   1486.4500      0.0000      0.0000
+    822.4000   1486.4600      0.0000      0.0000
+    822.9000   1486.4600      0.0000      0.0000
+    823.4000   1486.4600      0.0000      0.0000
+    823.9000   1486.4600      0.0000      0.0000
+    824.4000   1486.4600      0.0000      0.0000
+    824.8000   1486.4600      0.0000      0.0000
+    825.3000   1486.4600      0.0000      0.0000
+    825.8000   1486.4600      0.0000      0.0000
+    826.3000   1486.4600      0.0000      0.0000
+    826.8000   1486.4600      0.0000      0.0000
+    827.3000   1486.4600      0.0000      0.0000
+    827.8000   1486.4600      0.0000      0.0000
+    828.3000   1486.4600      0.0000      0.0000
+    828.8000   1486.4600      0.0000      0.0000
+    829.3000   1486.4600      0.0000      0.0000
+    829.7000   1486.4600      0.0000      0.0000
+    830.2000   1486.4600      0.0000      0.0000
+    830.7000   1486.4600      0.0000      0.0000
+    831.2000   1486.4600      0.0000      0.0000
+    831.7000   1486.4700      0.0000      0.0000
+    832.2000   1486.4700      0.0000      0.0000
+    832.7000   1486.4700      0.0000      0.0000
+    833.2000   1486.4700      0.0000      0.0000
+    833.7000   1486.4800      0.0000      0.0000
+    834.1000   1486.4800      0.0000      0.0000
+    834.6000   1486.4800      0.0000      0.0000
+    835.1000   1486.4800      0.0000      0.0000
+    835.6000   1486.4800      0.0000      0.0000
+    836.1000   1486.4800      0.0000      0.0000
+    836.6000   1486.4800      0.0000      0.0000
+    837.1000   1486.4700      0.0000      0.0000
+    837.6000   1486.4600      0.0000      0.0000
+    838.0000   1486.4600      0.0000      0.0000
+    838.5000   1486.4400      0.0000      0.0000
+    839.0000   1486.4300      0.0000      0.0000
+    839.5000   1486.4200      0.0000      0.0000
+    840.0000   1486.4100      0.0000      0.0000
+    840.5000   1486.4000      0.0000      0.0000
+    841.0000   1486.3900      0.0000      0.0000
+    841.5000   1486.3900      0.0000      0.0000
+    842.0000   1486.3800      0.0000      0.0000
+    842.4000   1486.3900      0.0000      0.0000
+    842.9000   1486.3900      0.0000      0.0000
+    843.4000   1486.4000      0.0000      0.0000
+    843.9000   1486.4100      0.0000      0.0000
+    844.4000   1486.4100      0.0000      0.0000
+    844.9000   1486.4200      0.0000      0.0000
+    845.4000   1486.4300      0.0000      0.0000
+    845.9000   1486.4300      0.0000      0.0000
+    846.3000   1486.4300      0.0000      0.0000
+    846.8000   1486.4400      0.0000      0.0000
+    847.3000   1486.4400      0.0000      0.0000
+    847.8000   1486.4400      0.0000      0.0000
+    848.3000   1486.4400      0.0000      0.0000
@@ -0,0 +1,125 @@
+test_read_store_and_write
+4/11/2014
+6:4:21
+Probe: S2
+Source: /root/package/data/input/saiv/S2.5_FG_SD008_20141104_0610.txt
+      0.0000   1490.8800      0.0700     22.8640
+      0.5357   1530.5400     37.6600     22.2880
+      0.8730   1530.4800     37.7400     22.2320
+      1.0714   1530.5300     37.7600     22.2400
+      1.4384   1530.5400     37.7600     22.2380
+      1.5773   1530.5400     37.7600     22.2400
+      1.7360   1530.5400     37.7500     22.2390
+      2.2817   1530.5500     37.7600     22.2390
+      2.5495   1530.5700     37.7600     22.2420
+      2.7876   1530.5600     37.7500     22.2410
+      3.4324   1530.6000     37.7700     22.2450
+      4.3252   1530.6000     37.7500     22.2470
+      5.0990   1530.6900     37.7800     22.2680
+      5.7438   1530.6700     37.7600     22.2620
+      6.4084   1530.6600     37.7600     22.2530
+      7.1326   1530.7100     37.7700     22.2660
+      7.7972   1530.6800     37.7700     22.2500
+      8.1246   1530.6700     37.7500     22.2470
+      8.4023   1530.6700     37.7500     22.2460
+      8.9281   1530.7000     37.7700     22.2450
+      9.5332   1530.7100     37.7700     22.2460
+     10.0788   1530.7200     37.7700     22.2460
+     10.5946   1530.7200     37.7700     22.2460
+     11.2493   1530.7400     37.7700     22.2470
+     11.9933   1530.7500     37.7700     22.2470
+     12.5984   1530.7600     37.7700     22.2490
+     13.2035   1530.7600     37.7600     22.2480
+     13.8284   1530.7800     37.7700     22.2470
+     14.4930   1530.7800     37.7700     22.2460
+     15.0882   1530.8100     37.7600     22.2500
+     15.7726   1530.8200     37.7700     22.2500
+     16.4968   1530.8300     37.7700     22.2480
+     17.1217   1530.8400     37.7700     22.2480
+     17.8061   1530.8600     37.7800     22.2460
+     18.4509   1530.8600     37.7700     22.2470
+     19.0461   1530.8700     37.7700     22.2490
+     19.6908   1530.8900     37.7700     22.2510
+     20.4943   1530.8900     37.7700     22.2480
+     21.0597   1530.9000     37.7700     22.2500
+     21.7243   1530.9100     37.7700     22.2490
+     22.4285   1530.9300     37.7700     22.2500
+     23.1130   1530.9600     37.7800     22.2510
+     23.7875   1530.9600     37.7800     22.2510
+     24.4124   1530.9700     37.7700     22.2510
+     25.0571   1530.9800     37.7700     22.2510
+     25.6721   1531.0000     37.7800     22.2520
+     26.4160   1531.0100     37.7700     22.2520
+     27.0607   1531.0200     37.7800     22.2520
+     27.6460   1531.0300     37.7700     22.2520
+     28.3601   1531.0400     37.7600     22.2560
+     29.1040   1531.0600     37.7700     22.2560
+     29.7091   1531.0600     37.7600     22.2540
+     30.4530   1531.0800     37.7800     22.2540
+     31.2961   1531.0800     37.7600     22.2530
+     32.1590   1531.1000     37.7600     22.2520
+     33.1410   1531.1100     37.7600     22.2520
+     34.1031   1531.1200     37.7800     22.2430
+     34.9858   1529.8400     37.5900     21.8240
+     35.8190   1525.0000     37.0000     20.2580
+     36.7513   1521.0900     37.0100     18.8400
+     37.6837   1519.4100     37.3700     18.1060
+     38.6359   1518.6500     37.5600     17.7630
+     39.5583   1517.6600     37.5000     17.4430
+     40.5104   1517.1900     37.5100     17.2710
+     41.4130   1516.8000     37.5100     17.1360
+     42.2660   1516.6500     37.5400     17.0730
+     43.1487   1516.8800     37.5900     17.1210
+     44.0314   1517.7200     37.8400     17.3040
+     44.8645   1519.0400     38.1700     17.6210
+     45.6778   1519.4300     38.1000     17.7780
+     46.6299   1519.4900     38.0800     17.8020
+     47.5920   1519.1500     38.0000     17.7110
+     48.3854   1518.9200     37.9900     17.6310
+     49.2086   1518.7800     37.9900     17.5790
+     50.0417   1518.6600     37.9900     17.5350
+     50.8946   1518.5100     37.9700     17.4840
+     51.7674   1517.7600     37.8600     17.2680
+     52.5906   1517.4400     37.9000     17.1420
+     53.5824   1517.5500     37.9800     17.1400
+     54.5047   1518.0500     38.1500     17.2410
+     55.3279   1518.1500     38.1400     17.2700
+     56.1510   1518.1700     38.1400     17.2730
+     57.0337   1518.2200     38.1500     17.2800
+     57.8667   1518.2600     38.1700     17.2820
+     58.6403   1518.2600     38.1500     17.2830
+     59.5527   1518.2300     38.1600     17.2680
+     60.5246   1518.1100     38.1600     17.2220
+     61.4469   1517.9400     38.1200     17.1760
+     62.1709   1517.7700     38.0900     17.1200
+     63.0238   1517.6100     38.1100     17.0590
+     63.8866   1517.4600     38.0800     17.0110
+     64.7692   1517.4500     38.1000     16.9960
+     65.6320   1517.4700     38.1000     16.9960
+     66.5245   1517.5000     38.1200     16.9960
+     67.3873   1517.5400     38.1200     17.0020
+     68.3195   1517.5600     38.1200     17.0020
+     69.1922   1517.5200     38.1200     16.9860
+     69.8864   1517.4900     38.1300     16.9680
+     70.7095   1517.4700     38.1300     16.9600
+     71.6417   1517.4900     38.1400     16.9570
+     72.6433   1517.5100     38.1200     16.9640
+     73.4366   1517.5100     38.1400     16.9530
+     74.3093   1517.3600     38.1300     16.9030
+     75.1423   1517.2300     38.1400     16.8500
+     76.0050   1517.2100     38.1600     16.8320
+     76.8876   1517.2100     38.1700     16.8210
+     77.7999   1517.2100     38.1800     16.8110
+     78.6428   1517.1800     38.1900     16.7930
+     79.4857   1517.1400     38.1800     16.7800
+     80.3683   1517.0900     38.1800     16.7580
+     81.2607   1517.0700     38.2000     16.7400
+     82.0838   1516.9800     38.1800     16.7070
+     82.8771   1516.9000     38.1900     16.6750
+     83.7200   1516.8600     38.2000     16.6530
+     84.6124   1516.8300     38.2100     16.6370
+     85.4851   1516.7500     38.2000     16.6080
+     86.3676   1516.5800     38.2200     16.5380
+     87.2799   1516.4000     38.2000     16.4800
+     88.1822   1516.1800     38.2200     16.3950
+     88.6979   1515.8500     38.2100     16.2870
@@ -0,0 +1,1666 @@
+test_read_store_and_write
+1/1/2016
+23:42:56
+Probe: XSV-02
+Source: /root/package/data/input/sippican/S2_00004.edf
+      0.0000   1421.1300      0.0000      0.0000
+      0.5400   1526.0400      0.0000      0.0000
+      1.0700   1521.0300      0.0000      0.0000
+      1.6100   1534.0700      0.0000      0.0000
+      2.1500   1535.5800      0.0000      0.0000
+      2.6800   1535.6000      0.0000      0.0000
+      3.2200   1535.4900      0.0000      0.0000
+      3.7600   1535.5400      0.0000      0.0000
+      4.2900   1535.5800      0.0000      0.0000
+      4.8300   1535.6200      0.0000      0.0000
+      5.3700   1535.6800      0.0000      0.0000
+      5.9000   1535.7400      0.0000      0.0000
+      6.4400   1535.7700      0.0000      0.0000
+      6.9700   1535.8000      0.0000      0.0000
+      7.5100   1535.8500      0.0000      0.0000
+      8.0500   1535.8800      0.0000      0.0000
+      8.5800   1535.9300      0.0000      0.0000
+      9.1200   1535.9700      0.0000      0.0000
+      9.6600   1536.0100      0.0000      0.0000
+     10.1900   1536.0400      0.0000      0.0000
+     10.7300   1536.0700      0.0000      0.0000
+     11.2600   1536.1000      0.0000      0.0000
+     11.8000   1536.1300      0.0000      0.0000
+     12.3400   1536.1600      0.0000      0.0000
+     12.8700   1536.1800      0.0000      0.0000
+     13.4100   1536.2000      0.0000      0.0000
+     13.9400   1536.2100      0.0000      0.0000
+     14.4800   1536.2400      0.0000      0.0000
+     15.0200   1536.2600      0.0000      0.0000
+     15.5500   1536.2700      0.0000      0.0000
+     16.0900   1536.2900      0.0000      0.0000
+     16.6200   1536.3100      0.0000      0.0000
+     17.1600   1536.3200      0.0000      0.0000
+     17.7000   1536.3400      0.0000      0.0000
+     18.2300   1536.3600      0.0000      0.0000
+     18.7700   1536.3700      0.0000      0.0000
+     19.3000   1536.3900      0.0000      0.0000
+     19.8400   1536.4000      0.0000      0.0000
+     20.3700   1536.4100      0.0000      0.0000
+     20.9100   1536.4300      0.0000      0.0000
+     21.4400   1536.4400      0.0000      0.0000
+     21.9800   1536.4500      0.0000      0.0000
+     22.5200   1536.4600      0.0000      0.0000
+     23.0500   1536.4700      0.0000      0.0000
+     23.5900   1536.4800      0.0000      0.0000
+     24.1200   1536.5000      0.0000      0.0000
+     24.6600   1536.5100      0.0000      0.0000
+     25.1900   1536.5200      0.0000      0.0000
+     25.7300   1536.5300      0.0000      0.0000
+     26.2600   1536.5400      0.0000      0.0000
+     26.8000   1536.5500      0.0000      0.0000
+     27.3300   1536.5600      0.0000      0.0000
+     27.8700   1536.5700      0.0000      0.0000
+     28.4000   1536.5800      0.0000      0.0000
+     28.9400   1536.5900      0.0000      0.0000
+     29.4700   1536.6100      0.0000      0.0000
+     30.0100   1536.6200      0.0000      0.0000
+     30.5400   1536.6300      0.0000      0.0000
+     31.0800   1536.6300      0.0000      0.0000
+     31.6100   1536.6500      0.0000      0.0000
+     32.1500   1536.6600      0.0000      0.0000
+     32.6800   1536.6700      0.0000      0.0000
+     33.2200   1536.6800      0.0000      0.0000
+     33.7500   1536.6900      0.0000      0.0000
+     34.2900   1536.7000      0.0000      0.0000
+     34.8200   1536.7000      0.0000      0.0000
+     35.3600   1536.7100      0.0000      0.0000
+     35.8900   1536.7200      0.0000      0.0000
+     36.4300   1536.7300      0.0000      0.0000
+     36.9600   1536.7400      0.0000      0.0000
+     37.5000   1536.7600      0.0000      0.0000
+     38.0300   1536.7700      0.0000      0.0000
+     38.5700   1536.7800      0.0000      0.0000
+     39.1000   1536.7900      0.0000      0.0000
+     39.6300   1536.7900      0.0000      0.0000
+     40.1700   1536.8100      0.0000      0.0000
+     40.7000   1536.8200      0.0000      0.0000
+     41.2400   1536.8200      0.0000      0.0000
+     41.7700   1536.8300      0.0000      0.0000
+     42.3100   1536.8400      0.0000      0.0000
+     42.8400   1536.8500      0.0000      0.0000
+     43.3800   1536.8600      0.0000      0.0000
+     43.9100   1536.8700      0.0000      0.0000
+     44.4400   1536.8800      0.0000      0.0000
+     44.9800   1536.8900      0.0000      0.0000
+     45.5100   1536.9000      0.0000      0.0000
+     46.0500   1536.9100      0.0000      0.0000
+     46.5800   1536.9200      0.0000      0.0000
+     47.1200   1536.9200      0.0000      0.0000
+     47.6500   1536.9400      0.0000      0.0000
+     48.1800   1536.9400      0.0000      0.0000
+     48.7200   1536.9600      0.0000      0.0000
+     49.2500   1536.9700      0.0000      0.0000
+     49.7900   1536.9800      0.0000      0.0000
+     50.3200   1536.9900      0.0000      0.0000
+     50.8500   1537.0000      0.0000      0.0000
+     51.3900   1537.0100      0.0000      0.0000
+     51.9200   1537.0200      0.0000      0.0000
+     52.4500   1537.0300      0.0000      0.0000
+     52.9900   1537.0400      0.0000      0.0000
+     53.5200   1537.0500      0.0000      0.0000
+     54.0600   1537.0500      0.0000      0.0000
+     54.5900   1537.0600      0.0000      0.0000
+     55.1200   1537.0700      0.0000      0.0000
+     55.6600   1537.0800      0.0000      0.0000
+     56.1900   1537.0900      0.0000      0.0000
+     56.7200   1537.1000      0.0000      0.0000
+     57.2600   1537.1100      0.0000      0.0000
+     57.7900   1537.1200      0.0000      0.0000
+     58.3200   1537.1300      0.0000      0.0000
+     58.8600   1537.1400      0.0000      0.0000
+     59.3900   1537.1500      0.0000      0.0000
+     59.9300   1537.1600      0.0000      0.0000
+     60.4600   1537.1700      0.0000      0.0000
+     60.9900   1537.1800      0.0000      0.0000
+     61.5300   1537.1900      0.0000      0.0000
+     62.0600   1537.2000      0.0000      0.0000
+     62.5900   1537.2000      0.0000      0.0000
+     63.1300   1537.2100      0.0000      0.0000
+     63.6600   1537.2200      0.0000      0.0000
+     64.1900   1537.2300      0.0000      0.0000
+     64.7200   1537.2400      0.0000      0.0000
+     65.2600   1537.2400      0.0000      0.0000
+     65.7900   1537.2500      0.0000      0.0000
+     66.3200   1537.2500      0.0000      0.0000
+     66.8600   1537.2500      0.0000      0.0000
+     67.3900   1537.2400      0.0000      0.0000
+     67.9200   1537.2400      0.0000      0.0000
+     68.4600   1537.2400      0.0000      0.0000
+     68.9900   1537.2500      0.0000      0.0000
+     69.5200   1537.2700      0.0000      0.0000
+     70.0500   1537.2900      0.0000      0.0000
+     70.5900   1537.3200      0.0000      0.0000
+     71.1200   1537.3600      0.0000      0.0000
+     71.6500   1537.3900      0.0000      0.0000
+     72.1900   1537.4000      0.0000      0.0000
+     72.7200   1537.3900      0.0000      0.0000
+     73.2500   1537.3600      0.0000      0.0000
+     73.7800   1537.3000      0.0000      0.0000
+     74.3200   1537.2000      0.0000      0.0000
+     74.8500   1537.1100      0.0000      0.0000
+     75.3800   1537.0000      0.0000      0.0000
+     75.9100   1536.6700      0.0000      0.0000
+     76.4500   1536.4300      0.0000      0.0000
+     76.9800   1536.2700      0.0000      0.0000
+     77.5100   1536.1300      0.0000      0.0000
+     78.0400   1536.0300      0.0000      0.0000
+     78.5800   1535.9900      0.0000      0.0000
+     79.1100   1535.9400      0.0000      0.0000
+     79.6400   1535.8800      0.0000      0.0000
+     80.1700   1535.8300      0.0000      0.0000
+     80.7100   1535.8000      0.0000      0.0000
+     81.2400   1535.7600      0.0000      0.0000
+     81.7700   1535.6700      0.0000      0.0000
+     82.3000   1535.5200      0.0000      0.0000
+     82.8300   1535.3800      0.0000      0.0000
+     83.3700   1535.2800      0.0000      0.0000
+     83.9000   1535.2400      0.0000      0.0000
+     84.4300   1535.0800      0.0000      0.0000
+     84.9600   1534.9300      0.0000      0.0000
+     85.4900   1534.8600      0.0000      0.0000
+     86.0300   1534.8200      0.0000      0.0000
+     86.5600   1534.8000      0.0000      0.0000
+     87.0900   1534.7800      0.0000      0.0000
+     87.6200   1534.7200      0.0000      0.0000
+     88.1500   1534.6600      0.0000      0.0000
+     88.6900   1534.5900      0.0000      0.0000
+     89.2200   1534.4900      0.0000      0.0000
+     89.7500   1534.4500      0.0000      0.0000
+     90.2800   1534.4200      0.0000      0.0000
+     90.8100   1534.3900      0.0000      0.0000
+     91.3400   1534.3200      0.0000      0.0000
+     91.8800   1534.2600      0.0000      0.0000
+     92.4100   1534.1300      0.0000      0.0000
+     92.9400   1534.0500      0.0000      0.0000
+     93.4700   1534.0600      0.0000      0.0000
+     94.0000   1534.0300      0.0000      0.0000
+     94.5300   1534.0100      0.0000      0.0000
+     95.0600   1533.9900      0.0000      0.0000
+     95.6000   1533.9700      0.0000      0.0000
+     96.1300   1533.8500      0.0000      0.0000
+     96.6600   1533.7400      0.0000      0.0000
+     97.1900   1533.7000      0.0000      0.0000
+     97.7200   1533.6800      0.0000      0.0000
+     98.2500   1533.6500      0.0000      0.0000
+     98.7800   1533.6300      0.0000      0.0000
+     99.3200   1533.6100      0.0000      0.0000
+     99.8500   1533.5700      0.0000      0.0000
+    100.3800   1533.5600      0.0000      0.0000
+    100.9100   1533.5700      0.0000      0.0000
+    101.4400   1533.5700      0.0000      0.0000
+    101.9700   1533.5600      0.0000      0.0000
+    102.5000   1533.5400      0.0000      0.0000
+    103.0300   1533.5200      0.0000      0.0000
+    103.5600   1533.5000      0.0000      0.0000
+    104.1000   1533.4200      0.0000      0.0000
+    104.6300   1533.1200      0.0000      0.0000
+    105.1600   1532.8300      0.0000      0.0000
+    105.6900   1532.6700      0.0000      0.0000
+    106.2200   1532.6000      0.0000      0.0000
+    106.7500   1532.5800      0.0000      0.0000
+    107.2800   1532.5500      0.0000      0.0000
+    107.8100   1532.5300      0.0000      0.0000
+    108.3400   1532.5000      0.0000      0.0000
+    108.8700   1532.4600      0.0000      0.0000
+    109.4000   1532.4200      0.0000      0.0000
+    109.9300   1532.4000      0.0000      0.0000
+    110.4600   1532.3900      0.0000      0.0000
+    111.0000   1532.3700      0.0000      0.0000
+    111.5300   1532.3300      0.0000      0.0000
+    112.0600   1532.2700      0.0000      0.0000
+    112.5900   1532.2200      0.0000      0.0000
+    113.1200   1532.1700      0.0000      0.0000
+    113.6500   1532.0600      0.0000      0.0000
+    114.1800   1531.9100      0.0000      0.0000
+    114.7100   1531.6800      0.0000      0.0000
+    115.2400   1531.4300      0.0000      0.0000
+    115.7700   1531.3400      0.0000      0.0000
+    116.3000   1531.2300      0.0000      0.0000
+    116.8300   1531.1200      0.0000      0.0000
+    117.3600   1531.0400      0.0000      0.0000
+    117.8900   1531.0100      0.0000      0.0000
+    118.4200   1530.9700      0.0000      0.0000
+    118.9500   1530.8900      0.0000      0.0000
+    119.4800   1530.7600      0.0000      0.0000
+    120.0100   1530.6200      0.0000      0.0000
+    120.5400   1530.5000      0.0000      0.0000
+    121.0700   1530.4100      0.0000      0.0000
+    121.6000   1530.3100      0.0000      0.0000
+    122.1300   1530.2400      0.0000      0.0000
+    122.6600   1530.1900      0.0000      0.0000
+    123.1900   1530.1500      0.0000      0.0000
+    123.7200   1530.0400      0.0000      0.0000
+    124.2500   1529.8500      0.0000      0.0000
+    124.7800   1529.7800      0.0000      0.0000
+    125.3100   1529.7600      0.0000      0.0000
+    125.8400   1529.7400      0.0000      0.0000
+    126.3700   1529.7200      0.0000      0.0000
+    126.9000   1529.6700      0.0000      0.0000
+    127.4300   1529.6000      0.0000      0.0000
+    127.9600   1529.5200      0.0000      0.0000
+    128.4900   1529.4300      0.0000      0.0000
+    129.0200   1529.3500      0.0000      0.0000
+    129.5500   1529.2800      0.0000      0.0000
+    130.0800   1529.1900      0.0000      0.0000
+    130.6100   1529.1300      0.0000      0.0000
+    131.1300   1529.1000      0.0000      0.0000
+    131.6600   1529.0900      0.0000      0.0000
+    132.1900   1529.0900      0.0000      0.0000
+    132.7200   1529.0400      0.0000      0.0000
+    133.2500   1528.8900      0.0000      0.0000
+    133.7800   1528.6800      0.0000      0.0000
+    134.3100   1528.5800      0.0000      0.0000
+    134.8400   1528.5300      0.0000      0.0000
+    135.3700   1528.5000      0.0000      0.0000
+    135.9000   1528.4800      0.0000      0.0000
+    136.4300   1528.4700      0.0000      0.0000
+    136.9600   1528.4300      0.0000      0.0000
+    137.4900   1528.3700      0.0000      0.0000
+    138.0200   1528.3100      0.0000      0.0000
+    138.5400   1528.1000      0.0000      0.0000
+    139.0700   1527.7100      0.0000      0.0000
+    139.6000   1527.4300      0.0000      0.0000
+    140.1300   1527.2000      0.0000      0.0000
+    140.6600   1527.0300      0.0000      0.0000
+    141.1900   1526.9800      0.0000      0.0000
+    141.7200   1526.9400      0.0000      0.0000
+    142.2500   1526.8900      0.0000      0.0000
+    142.7800   1526.8600      0.0000      0.0000
+    143.3000   1526.8500      0.0000      0.0000
+    143.8300   1526.8500      0.0000      0.0000
+    144.3600   1526.8500      0.0000      0.0000
+    144.8900   1526.8200      0.0000      0.0000
+    145.4200   1526.7700      0.0000      0.0000
+    145.9500   1526.7200      0.0000      0.0000
+    146.4800   1526.6500      0.0000      0.0000
+    147.0000   1526.5700      0.0000      0.0000
+    147.5300   1526.5200      0.0000      0.0000
+    148.0600   1526.4800      0.0000      0.0000
+    148.5900   1526.4500      0.0000      0.0000
+    149.1200   1526.3900      0.0000      0.0000
+    149.6500   1526.3400      0.0000      0.0000
+    150.1800   1526.3100      0.0000      0.0000
+    150.7000   1526.3100      0.0000      0.0000
+    151.2300   1526.2900      0.0000      0.0000
+    151.7600   1526.2700      0.0000      0.0000
+    152.2900   1526.2600      0.0000      0.0000
+    152.8200   1526.2500      0.0000      0.0000
+    153.3500   1526.2300      0.0000      0.0000
+    153.8700   1526.2200      0.0000      0.0000
+    154.4000   1526.2000      0.0000      0.0000
+    154.9300   1526.1900      0.0000      0.0000
+    155.4600   1526.1200      0.0000      0.0000
+    155.9900   1526.0100      0.0000      0.0000
+    156.5100   1525.8000      0.0000      0.0000
+    157.0400   1525.4100      0.0000      0.0000
+    157.5700   1525.1600      0.0000      0.0000
+    158.1000   1525.0300      0.0000      0.0000
+    158.6300   1524.9100      0.0000      0.0000
+    159.1500   1524.8500      0.0000      0.0000
+    159.6800   1524.8400      0.0000      0.0000
+    160.2100   1524.8100      0.0000      0.0000
+    160.7400   1524.7600      0.0000      0.0000
+    161.2600   1524.6800      0.0000      0.0000
+    161.7900   1524.5900      0.0000      0.0000
+    162.3200   1524.4400      0.0000      0.0000
+    162.8500   1524.0400      0.0000      0.0000
+    163.3800   1523.4800      0.0000      0.0000
+    163.9000   1522.9700      0.0000      0.0000
+    164.4300   1522.6500      0.0000      0.0000
+    164.9600   1522.4800      0.0000      0.0000
+    165.4900   1522.3800      0.0000      0.0000
+    166.0100   1522.3200      0.0000      0.0000
+    166.5400   1522.2700      0.0000      0.0000
+    167.0700   1522.2600      0.0000      0.0000
+    167.6000   1522.2600      0.0000      0.0000
+    168.1200   1522.2600      0.0000      0.0000
+    168.6500   1522.2600      0.0000      0.0000
+    169.1800   1522.2600      0.0000      0.0000
+    169.7100   1522.2000      0.0000      0.0000
+    170.2300   1522.1200      0.0000      0.0000
+    170.7600   1522.0200      0.0000      0.0000
+    171.2900   1521.9100      0.0000      0.0000
+    171.8100   1521.8600      0.0000      0.0000
+    172.3400   1521.8400      0.0000      0.0000
+    172.8700   1521.7000      0.0000      0.0000
+    173.4000   1521.4500      0.0000      0.0000
+    173.9200   1521.1200      0.0000      0.0000
+    174.4500   1520.8700      0.0000      0.0000
+    174.9800   1520.6800      0.0000      0.0000
+    175.5000   1520.4800      0.0000      0.0000
+    176.0300   1520.2100      0.0000      0.0000
+    176.5600   1520.0000      0.0000      0.0000
+    177.0800   1519.8900      0.0000      0.0000
+    177.6100   1519.8400      0.0000      0.0000
+    178.1400   1519.7500      0.0000      0.0000
+    178.6600   1519.6400      0.0000      0.0000
+    179.1900   1519.4100      0.0000      0.0000
+    179.7200   1519.0800      0.0000      0.0000
+    180.2500   1518.9200      0.0000      0.0000
+    180.7700   1518.7600      0.0000      0.0000
+    181.3000   1518.6200      0.0000      0.0000
+    181.8300   1518.5600      0.0000      0.0000
+    182.3500   1518.5300      0.0000      0.0000
+    182.8800   1518.5100      0.0000      0.0000
+    183.4000   1518.4700      0.0000      0.0000
+    183.9300   1518.4300      0.0000      0.0000
+    184.4600   1518.4000      0.0000      0.0000
+    184.9800   1518.3500      0.0000      0.0000
+    185.5100   1518.2300      0.0000      0.0000
+    186.0400   1518.0000      0.0000      0.0000
+    186.5600   1517.8300      0.0000      0.0000
+    187.0900   1517.7600      0.0000      0.0000
+    187.6200   1517.6500      0.0000      0.0000
+    188.1400   1517.5100      0.0000      0.0000
+    188.6700   1517.3800      0.0000      0.0000
+    189.1900   1517.2300      0.0000      0.0000
+    189.7200   1517.1000      0.0000      0.0000
+    190.2500   1516.9700      0.0000      0.0000
+    190.7700   1516.8400      0.0000      0.0000
+    191.3000   1516.7000      0.0000      0.0000
+    191.8300   1516.6300      0.0000      0.0000
+    192.3500   1516.5600      0.0000      0.0000
+    192.8800   1516.4800      0.0000      0.0000
+    193.4000   1516.3600      0.0000      0.0000
+    193.9300   1516.2700      0.0000      0.0000
+    194.4600   1516.1600      0.0000      0.0000
+    194.9800   1515.9700      0.0000      0.0000
+    195.5100   1515.7100      0.0000      0.0000
+    196.0300   1515.2400      0.0000      0.0000
+    196.5600   1514.7600      0.0000      0.0000
+    197.0800   1514.6000      0.0000      0.0000
+    197.6100   1514.5800      0.0000      0.0000
+    198.1400   1514.6000      0.0000      0.0000
+    198.6600   1514.5800      0.0000      0.0000
+    199.1900   1514.5600      0.0000      0.0000
+    199.7100   1514.5700      0.0000      0.0000
+    200.2400   1514.4700      0.0000      0.0000
+    200.7600   1514.3500      0.0000      0.0000
+    201.2900   1514.1400      0.0000      0.0000
+    201.8100   1514.0400      0.0000      0.0000
+    202.3400   1513.9500      0.0000      0.0000
+    202.8700   1513.8700      0.0000      0.0000
+    203.3900   1513.7900      0.0000      0.0000
+    203.9200   1513.7000      0.0000      0.0000
+    204.4400   1513.6000      0.0000      0.0000
+    204.9700   1513.5700      0.0000      0.0000
+    205.4900   1513.5700      0.0000      0.0000
+    206.0200   1513.6300      0.0000      0.0000
+    206.5400   1513.6600      0.0000      0.0000
+    207.0700   1513.6800      0.0000      0.0000
+    207.5900   1513.7000      0.0000      0.0000
+    208.1200   1513.7100      0.0000      0.0000
+    208.6400   1513.7200      0.0000      0.0000
+    209.1700   1513.7300      0.0000      0.0000
+    209.6900   1513.7600      0.0000      0.0000
+    210.2200   1513.8300      0.0000      0.0000
+    210.7400   1513.9300      0.0000      0.0000
+    211.2700   1514.1000      0.0000      0.0000
+    211.7900   1514.0900      0.0000      0.0000
+    212.3200   1514.0400      0.0000      0.0000
+    212.8400   1513.9600      0.0000      0.0000
+    213.3700   1513.8600      0.0000      0.0000
+    213.8900   1513.5600      0.0000      0.0000
+    214.4200   1513.2700      0.0000      0.0000
+    214.9400   1513.1900      0.0000      0.0000
+    215.4700   1513.1500      0.0000      0.0000
+    215.9900   1513.1100      0.0000      0.0000
+    216.5200   1513.0500      0.0000      0.0000
+    217.0400   1513.0000      0.0000      0.0000
+    217.5700   1512.9600      0.0000      0.0000
+    218.0900   1512.9300      0.0000      0.0000
+    218.6100   1512.9000      0.0000      0.0000
+    219.1400   1512.8600      0.0000      0.0000
+    219.6600   1512.8400      0.0000      0.0000
+    220.1900   1512.8200      0.0000      0.0000
+    220.7100   1512.7700      0.0000      0.0000
+    221.2400   1512.6000      0.0000      0.0000
+    221.7600   1511.8000      0.0000      0.0000
+    222.2900   1511.1600      0.0000      0.0000
+    222.8100   1510.9700      0.0000      0.0000
+    223.3300   1510.9000      0.0000      0.0000
+    223.8600   1510.8300      0.0000      0.0000
+    224.3800   1510.7500      0.0000      0.0000
+    224.9100   1510.7100      0.0000      0.0000
+    225.4300   1510.6000      0.0000      0.0000
+    225.9600   1510.5300      0.0000      0.0000
+    226.4800   1510.4500      0.0000      0.0000
+    227.0000   1510.3800      0.0000      0.0000
+    227.5300   1510.2600      0.0000      0.0000
+    228.0500   1510.1500      0.0000      0.0000
+    228.5800   1510.0500      0.0000      0.0000
+    229.1000   1509.9100      0.0000      0.0000
+    229.6200   1509.8400      0.0000      0.0000
+    230.1500   1509.7400      0.0000      0.0000
+    230.6700   1509.6900      0.0000      0.0000
+    231.2000   1509.6300      0.0000      0.0000
+    231.7200   1509.5600      0.0000      0.0000
+    232.2400   1509.4700      0.0000      0.0000
+    232.7700   1509.1500      0.0000      0.0000
+    233.2900   1508.8100      0.0000      0.0000
+    233.8100   1508.6600      0.0000      0.0000
+    234.3400   1508.5900      0.0000      0.0000
+    234.8600   1508.5500      0.0000      0.0000
+    235.3900   1508.5000      0.0000      0.0000
+    235.9100   1508.4400      0.0000      0.0000
+    236.4300   1508.4300      0.0000      0.0000
+    236.9600   1508.4200      0.0000      0.0000
+    237.4800   1508.3900      0.0000      0.0000
+    238.0000   1508.3600      0.0000      0.0000
+    238.5300   1508.2700      0.0000      0.0000
+    239.0500   1508.1500      0.0000      0.0000
+    239.5700   1507.9700      0.0000      0.0000
+    240.1000   1507.8200      0.0000      0.0000
+    240.6200   1507.7500      0.0000      0.0000
+    241.1400   1507.6500      0.0000      0.0000
+    241.6700   1507.4700      0.0000      0.0000
+    242.1900   1507.3600      0.0000      0.0000
+    242.7100   1507.3100      0.0000      0.0000
+    243.2400   1507.2800      0.0000      0.0000
+    243.7600   1507.2600      0.0000      0.0000
+    244.2800   1507.2400      0.0000      0.0000
+    244.8000   1507.1800      0.0000      0.0000
+    245.3300   1506.9600      0.0000      0.0000
+    245.8500   1506.8200      0.0000      0.0000
+    246.3700   1506.7500      0.0000      0.0000
+    246.9000   1506.5600      0.0000      0.0000
+    247.4200   1506.4300      0.0000      0.0000
+    247.9400   1506.3700      0.0000      0.0000
+    248.4700   1506.3400      0.0000      0.0000
+    248.9900   1506.2900      0.0000      0.0000
+    249.5100   1506.2200      0.0000      0.0000
+    250.0300   1506.0100      0.0000      0.0000
+    250.5600   1505.8700      0.0000      0.0000
+    251.0800   1505.8300      0.0000      0.0000
+    251.6000   1505.7800      0.0000      0.0000
+    252.1200   1505.7400      0.0000      0.0000
+    252.6500   1505.7000      0.0000      0.0000
+    253.1700   1505.6100      0.0000      0.0000
+    253.6900   1505.5700      0.0000      0.0000
+    254.2200   1505.5600      0.0000      0.0000
+    254.7400   1505.4700      0.0000      0.0000
+    255.2600   1505.3700      0.0000      0.0000
+    255.7800   1505.3100      0.0000      0.0000
+    256.3100   1505.2200      0.0000      0.0000
+    256.8300   1505.0900      0.0000      0.0000
+    257.3500   1504.9000      0.0000      0.0000
+    257.8700   1504.7400      0.0000      0.0000
+    258.3900   1504.6000      0.0000      0.0000
+    258.9200   1504.4600      0.0000      0.0000
+    259.4400   1504.2300      0.0000      0.0000
+    259.9600   1504.0400      0.0000      0.0000
+    260.4800   1503.9000      0.0000      0.0000
+    261.0100   1503.7100      0.0000      0.0000
+    261.5300   1503.5700      0.0000      0.0000
+    262.0500   1503.4900      0.0000      0.0000
+    262.5700   1503.4500      0.0000      0.0000
+    263.0900   1503.3700      0.0000      0.0000
+    263.6200   1503.2800      0.0000      0.0000
+    264.1400   1503.2100      0.0000      0.0000
+    264.6600   1503.1500      0.0000      0.0000
+    265.1800   1502.9900      0.0000      0.0000
+    265.7000   1502.8600      0.0000      0.0000
+    266.2300   1502.7700      0.0000      0.0000
+    266.7500   1502.6900      0.0000      0.0000
+    267.2700   1502.6500      0.0000      0.0000
+    267.7900   1502.6400      0.0000      0.0000
+    268.3100   1502.5800      0.0000      0.0000
+    268.8300   1502.4100      0.0000      0.0000
+    269.3600   1502.2000      0.0000      0.0000
+    269.8800   1502.0700      0.0000      0.0000
+    270.4000   1501.9600      0.0000      0.0000
+    270.9200   1501.9000      0.0000      0.0000
+    271.4400   1501.8600      0.0000      0.0000
+    271.9600   1501.8200      0.0000      0.0000
+    272.4900   1501.8000      0.0000      0.0000
+    273.0100   1501.8100      0.0000      0.0000
+    273.5300   1501.8100      0.0000      0.0000
+    274.0500   1501.8000      0.0000      0.0000
+    274.5700   1501.7800      0.0000      0.0000
+    275.0900   1501.7600      0.0000      0.0000
+    275.6100   1501.7500      0.0000      0.0000
+    276.1400   1501.7200      0.0000      0.0000
+    276.6600   1501.7000      0.0000      0.0000
+    277.1800   1501.6500      0.0000      0.0000
+    277.7000   1501.6200      0.0000      0.0000
+    278.2200   1501.5900      0.0000      0.0000
+    278.7400   1501.5400      0.0000      0.0000
+    279.2600   1501.4800      0.0000      0.0000
+    279.7800   1501.4600      0.0000      0.0000
+    280.3000   1501.4300      0.0000      0.0000
+    280.8300   1501.4100      0.0000      0.0000
+    281.3500   1501.3900      0.0000      0.0000
+    281.8700   1501.3700      0.0000      0.0000
+    282.3900   1501.3500      0.0000      0.0000
+    282.9100   1501.3200      0.0000      0.0000
+    283.4300   1501.2700      0.0000      0.0000
+    283.9500   1501.1500      0.0000      0.0000
+    284.4700   1501.0600      0.0000      0.0000
+    284.9900   1501.0300      0.0000      0.0000
+    285.5100   1501.0000      0.0000      0.0000
+    286.0300   1500.9700      0.0000      0.0000
+    286.5600   1500.9500      0.0000      0.0000
+    287.0800   1500.9300      0.0000      0.0000
+    287.6000   1500.9200      0.0000      0.0000
+    288.1200   1500.9200      0.0000      0.0000
+    288.6400   1500.9300      0.0000      0.0000
+    289.1600   1500.9300      0.0000      0.0000
+    289.6800   1500.9400      0.0000      0.0000
+    290.2000   1500.9300      0.0000      0.0000
+    290.7200   1500.9300      0.0000      0.0000
+    291.2400   1500.9200      0.0000      0.0000
+    291.7600   1500.8800      0.0000      0.0000
+    292.2800   1500.8100      0.0000      0.0000
+    292.8000   1500.7100      0.0000      0.0000
+    293.3200   1500.5800      0.0000      0.0000
+    293.8400   1500.4600      0.0000      0.0000
+    294.3600   1500.3700      0.0000      0.0000
+    294.8800   1500.2700      0.0000      0.0000
+    295.4000   1500.1700      0.0000      0.0000
+    295.9200   1500.1300      0.0000      0.0000
+    296.4400   1500.0600      0.0000      0.0000
+    296.9600   1499.9600      0.0000      0.0000
+    297.4800   1499.8400      0.0000      0.0000
+    298.0000   1499.7700      0.0000      0.0000
+    298.5200   1499.7400      0.0000      0.0000
+    299.0400   1499.7300      0.0000      0.0000
+    299.5600   1499.7300      0.0000      0.0000
+    300.0800   1499.7300      0.0000      0.0000
+    300.6000   1499.7300      0.0000      0.0000
+    301.1200   1499.7300      0.0000      0.0000
+    301.6400   1499.7500      0.0000      0.0000
+    302.1600   1499.7500      0.0000      0.0000
+    302.6800   1499.7600      0.0000      0.0000
+    303.2000   1499.7700      0.0000      0.0000
+    303.7200   1499.7200      0.0000      0.0000
+    304.2400   1499.6400      0.0000      0.0000
+    304.7600   1499.5400      0.0000      0.0000
+    305.2800   1499.4400      0.0000      0.0000
+    305.8000   1499.4000      0.0000      0.0000
+    306.3200   1499.3800      0.0000      0.0000
+    306.8400   1499.3600      0.0000      0.0000
+    307.3600   1499.3500      0.0000      0.0000
+    307.8800   1499.3300      0.0000      0.0000
+    308.4000   1499.3000      0.0000      0.0000
+    308.9200   1499.2300      0.0000      0.0000
+    309.4400   1499.1800      0.0000      0.0000
+    309.9600   1499.1100      0.0000      0.0000
+    310.4800   1499.0300      0.0000      0.0000
+    311.0000   1498.9900      0.0000      0.0000
+    311.5200   1498.9700      0.0000      0.0000
+    312.0300   1498.9500      0.0000      0.0000
+    312.5500   1498.9400      0.0000      0.0000
+    313.0700   1498.9400      0.0000      0.0000
+    313.5900   1498.9200      0.0000      0.0000
+    314.1100   1498.9100      0.0000      0.0000
+    314.6300   1498.9100      0.0000      0.0000
+    315.1500   1498.9100      0.0000      0.0000
+    315.6700   1498.9000      0.0000      0.0000
+    316.1900   1498.8800      0.0000      0.0000
+    316.7100   1498.7800      0.0000      0.0000
+    317.2300   1498.7000      0.0000      0.0000
+    317.7400   1498.6300      0.0000      0.0000
+    318.2600   1498.5800      0.0000      0.0000
+    318.7800   1498.5300      0.0000      0.0000
+    319.3000   1498.4900      0.0000      0.0000
+    319.8200   1498.4500      0.0000      0.0000
+    320.3400   1498.4000      0.0000      0.0000
+    320.8600   1498.3200      0.0000      0.0000
+    321.3800   1498.2800      0.0000      0.0000
+    321.8900   1498.1300      0.0000      0.0000
+    322.4100   1497.9000      0.0000      0.0000
+    322.9300   1497.7200      0.0000      0.0000
+    323.4500   1497.4600      0.0000      0.0000
+    323.9700   1497.2100      0.0000      0.0000
+    324.4900   1496.7700      0.0000      0.0000
+    325.0100   1496.4900      0.0000      0.0000
+    325.5200   1496.3900      0.0000      0.0000
+    326.0400   1496.3600      0.0000      0.0000
+    326.5600   1496.3500      0.0000      0.0000
+    327.0800   1496.3200      0.0000      0.0000
+    327.6000   1496.2600      0.0000      0.0000
+    328.1200   1496.2300      0.0000      0.0000
+    328.6400   1496.2200      0.0000      0.0000
+    329.1500   1496.1900      0.0000      0.0000
+    329.6700   1496.1800      0.0000      0.0000
+    330.1900   1496.1600      0.0000      0.0000
+    330.7100   1496.1500      0.0000      0.0000
+    331.2300   1496.1500      0.0000      0.0000
+    331.7400   1496.1500      0.0000      0.0000
+    332.2600   1496.1400      0.0000      0.0000
+    332.7800   1496.1100      0.0000      0.0000
+    333.3000   1496.0700      0.0000      0.0000
+    333.8200   1496.0400      0.0000      0.0000
+    334.3300   1495.9800      0.0000      0.0000
+    334.8500   1495.8400      0.0000      0.0000
+    335.3700   1495.6200      0.0000      0.0000
+    335.8900   1495.4900      0.0000      0.0000
+    336.4100   1495.4300      0.0000      0.0000
+    336.9200   1495.4100      0.0000      0.0000
+    337.4400   1495.3300      0.0000      0.0000
+    337.9600   1495.0500      0.0000      0.0000
+    338.4800   1494.8400      0.0000      0.0000
+    339.0000   1494.7500      0.0000      0.0000
+    339.5100   1494.7100      0.0000      0.0000
+    340.0300   1494.6800      0.0000      0.0000
+    340.5500   1494.6800      0.0000      0.0000
+    341.0700   1494.6800      0.0000      0.0000
+    341.5800   1494.6800      0.0000      0.0000
+    342.1000   1494.6900      0.0000      0.0000
+    342.6200   1494.6900      0.0000      0.0000
+    343.1400   1494.6900      0.0000      0.0000
+    343.6500   1494.6800      0.0000      0.0000
+    344.1700   1494.6800      0.0000      0.0000
+    344.6900   1494.6800      0.0000      0.0000
+    345.2100   1494.6700      0.0000      0.0000
+    345.7200   1494.6700      0.0000      0.0000
+    346.2400   1494.6600      0.0000      0.0000
+    346.7600   1494.6300      0.0000      0.0000
+    347.2800   1494.5600      0.0000      0.0000
+    347.7900   1494.3500      0.0000      0.0000
+    348.3100   1494.0600      0.0000      0.0000
+    348.8300   1493.9500      0.0000      0.0000
+    349.3400   1493.9000      0.0000      0.0000
+    349.8600   1493.8600      0.0000      0.0000
+    350.3800   1493.8200      0.0000      0.0000
+    350.9000   1493.7900      0.0000      0.0000
+    351.4100   1493.7500      0.0000      0.0000
+    351.9300   1493.6700      0.0000      0.0000
+    352.4500   1493.5100      0.0000      0.0000
+    352.9600   1493.4200      0.0000      0.0000
+    353.4800   1493.3700      0.0000      0.0000
+    354.0000   1493.3400      0.0000      0.0000
+    354.5100   1493.3100      0.0000      0.0000
+    355.0300   1493.3100      0.0000      0.0000
+    355.5500   1493.3100      0.0000      0.0000
+    356.0600   1493.3000      0.0000      0.0000
+    356.5800   1493.2800      0.0000      0.0000
+    357.1000   1493.2600      0.0000      0.0000
+    357.6100   1493.2700      0.0000      0.0000
+    358.1300   1493.2700      0.0000      0.0000
+    358.6500   1493.2700      0.0000      0.0000
+    359.1600   1493.2500      0.0000      0.0000
+    359.6800   1493.2300      0.0000      0.0000
+    360.2000   1493.2200      0.0000      0.0000
+    360.7100   1493.2300      0.0000      0.0000
+    361.2300   1493.2300      0.0000      0.0000
+    361.7500   1493.2200      0.0000      0.0000
+    362.2600   1493.2200      0.0000      0.0000
+    362.7800   1493.2200      0.0000      0.0000
+    363.3000   1493.2200      0.0000      0.0000
+    363.8100   1493.2200      0.0000      0.0000
+    364.3300   1493.2100      0.0000      0.0000
+    364.8400   1493.1900      0.0000      0.0000
+    365.3600   1493.1700      0.0000      0.0000
+    365.8800   1493.1500      0.0000      0.0000
+    366.3900   1493.1300      0.0000      0.0000
+    366.9100   1493.1000      0.0000      0.0000
+    367.4300   1493.0700      0.0000      0.0000
+    367.9400   1493.0100      0.0000      0.0000
+    368.4600   1492.8700      0.0000      0.0000
+    368.9700   1492.6400      0.0000      0.0000
+    369.4900   1492.5300      0.0000      0.0000
+    370.0100   1492.4800      0.0000      0.0000
+    370.5200   1492.4000      0.0000      0.0000
+    371.0400   1492.3500      0.0000      0.0000
+    371.5500   1492.2700      0.0000      0.0000
+    372.0700   1492.1000      0.0000      0.0000
+    372.5800   1491.9800      0.0000      0.0000
+    373.1000   1491.8800      0.0000      0.0000
+    373.6200   1491.7900      0.0000      0.0000
+    374.1300   1491.6900      0.0000      0.0000
+    374.6500   1491.5800      0.0000      0.0000
+    375.1600   1491.5600      0.0000      0.0000
+    375.6800   1491.6000      0.0000      0.0000
+    376.1900   1491.6400      0.0000      0.0000
+    376.7100   1491.6600      0.0000      0.0000
+    377.2300   1491.6800      0.0000      0.0000
+    377.7400   1491.7000      0.0000      0.0000
+    378.2600   1491.7000      0.0000      0.0000
+    378.7700   1491.6000      0.0000      0.0000
+    379.2900   1491.5400      0.0000      0.0000
+    379.8000   1491.5300      0.0000      0.0000
+    380.3200   1491.5200      0.0000      0.0000
+    380.8300   1491.5000      0.0000      0.0000
+    381.3500   1491.4800      0.0000      0.0000
+    381.8600   1491.4600      0.0000      0.0000
+    382.3800   1491.4400      0.0000      0.0000
+    382.9000   1491.4300      0.0000      0.0000
+    383.4100   1491.4300      0.0000      0.0000
+    383.9300   1491.4300      0.0000      0.0000
+    384.4400   1491.3900      0.0000      0.0000
+    384.9600   1491.3500      0.0000      0.0000
+    385.4700   1491.3200      0.0000      0.0000
+    385.9900   1491.2200      0.0000      0.0000
+    386.5000   1491.1300      0.0000      0.0000
+    387.0200   1491.0700      0.0000      0.0000
+    387.5300   1491.0200      0.0000      0.0000
+    388.0500   1490.9900      0.0000      0.0000
+    388.5600   1490.9900      0.0000      0.0000
+    389.0800   1490.9900      0.0000      0.0000
+    389.5900   1490.9900      0.0000      0.0000
+    390.1100   1490.9600      0.0000      0.0000
+    390.6200   1490.8300      0.0000      0.0000
+    391.1300   1490.6000      0.0000      0.0000
+    391.6500   1490.4300      0.0000      0.0000
+    392.1600   1490.2000      0.0000      0.0000
+    392.6800   1489.9200      0.0000      0.0000
+    393.1900   1489.7300      0.0000      0.0000
+    393.7100   1489.5200      0.0000      0.0000
+    394.2200   1489.3400      0.0000      0.0000
+    394.7400   1489.2700      0.0000      0.0000
+    395.2500   1489.1800      0.0000      0.0000
+    395.7700   1489.1500      0.0000      0.0000
+    396.2800   1489.1300      0.0000      0.0000
+    396.7900   1489.1200      0.0000      0.0000
+    397.3100   1489.1200      0.0000      0.0000
+    397.8200   1489.1100      0.0000      0.0000
+    398.3400   1489.0900      0.0000      0.0000
+    398.8500   1489.0700      0.0000      0.0000
+    399.3700   1489.0500      0.0000      0.0000
+    399.8800   1489.0400      0.0000      0.0000
+    400.4000   1489.0200      0.0000      0.0000
+    400.9100   1489.0100      0.0000      0.0000
+    401.4200   1488.9800      0.0000      0.0000
+    401.9400   1488.9200      0.0000      0.0000
+    402.4500   1488.8500      0.0000      0.0000
+    402.9700   1488.7600      0.0000      0.0000
+    403.4800   1488.5400      0.0000      0.0000
+    403.9900   1488.4200      0.0000      0.0000
+    404.5100   1488.3900      0.0000      0.0000
+    405.0200   1488.3900      0.0000      0.0000
+    405.5400   1488.4000      0.0000      0.0000
+    406.0500   1488.4000      0.0000      0.0000
+    406.5600   1488.4100      0.0000      0.0000
+    407.0800   1488.4000      0.0000      0.0000
+    407.5900   1488.4000      0.0000      0.0000
+    408.1000   1488.4000      0.0000      0.0000
+    408.6200   1488.4000      0.0000      0.0000
+    409.1300   1488.4100      0.0000      0.0000
+    409.6500   1488.4100      0.0000      0.0000
+    410.1600   1488.4100      0.0000      0.0000
+    410.6700   1488.4000      0.0000      0.0000
+    411.1900   1488.3800      0.0000      0.0000
+    411.7000   1488.3100      0.0000      0.0000
+    412.2100   1488.2700      0.0000      0.0000
+    412.7300   1488.2300      0.0000      0.0000
+    413.2400   1488.2100      0.0000      0.0000
+    413.7500   1488.1400      0.0000      0.0000
+    414.2700   1488.1100      0.0000      0.0000
+    414.7800   1488.0900      0.0000      0.0000
+    415.2900   1488.0800      0.0000      0.0000
+    415.8100   1488.0400      0.0000      0.0000
+    416.3200   1488.0300      0.0000      0.0000
+    416.8300   1488.0300      0.0000      0.0000
+    417.3500   1488.0000      0.0000      0.0000
+    417.8600   1487.9900      0.0000      0.0000
+    418.3700   1487.9900      0.0000      0.0000
+    418.8900   1488.0000      0.0000      0.0000
+    419.4000   1487.9800      0.0000      0.0000
+    419.9100   1487.8900      0.0000      0.0000
+    420.4300   1487.9200      0.0000      0.0000
+    420.9400   1487.8500      0.0000      0.0000
+    421.4500   1487.6800      0.0000      0.0000
+    421.9700   1487.5200      0.0000      0.0000
+    422.4800   1487.4600      0.0000      0.0000
+    422.9900   1487.4500      0.0000      0.0000
+    423.5000   1487.4200      0.0000      0.0000
+    424.0200   1487.3800      0.0000      0.0000
+    424.5300   1487.3200      0.0000      0.0000
+    425.0400   1487.2800      0.0000      0.0000
+    425.5600   1487.2600      0.0000      0.0000
+    426.0700   1487.2500      0.0000      0.0000
+    426.5800   1487.2400      0.0000      0.0000
+    427.0900   1487.2400      0.0000      0.0000
+    427.6100   1487.2300      0.0000      0.0000
+    428.1200   1487.1600      0.0000      0.0000
+    428.6300   1487.0700      0.0000      0.0000
+    429.1400   1486.9800      0.0000      0.0000
+    429.6600   1486.9000      0.0000      0.0000
+    430.1700   1486.8300      0.0000      0.0000
+    430.6800   1486.8000      0.0000      0.0000
+    431.1900   1486.8000      0.0000      0.0000
+    431.7100   1486.8100      0.0000      0.0000
+    432.2200   1486.8100      0.0000      0.0000
+    432.7300   1486.8100      0.0000      0.0000
+    433.2400   1486.7900      0.0000      0.0000
+    433.7600   1486.7300      0.0000      0.0000
+    434.2700   1486.6400      0.0000      0.0000
+    434.7800   1486.5000      0.0000      0.0000
+    435.2900   1486.4100      0.0000      0.0000
+    435.8100   1486.3900      0.0000      0.0000
+    436.3200   1486.3800      0.0000      0.0000
+    436.8300   1486.3800      0.0000      0.0000
+    437.3400   1486.3700      0.0000      0.0000
+    437.8500   1486.3400      0.0000      0.0000
+    438.3700   1486.3000      0.0000      0.0000
+    438.8800   1486.2500      0.0000      0.0000
+    439.3900   1486.1900      0.0000      0.0000
+    439.9000   1486.1300      0.0000      0.0000
+    440.4100   1486.0800      0.0000      0.0000
+    440.9300   1486.0400      0.0000      0.0000
+    441.4400   1485.9900      0.0000      0.0000
+    441.9500   1485.9000      0.0000      0.0000
+    442.4600   1485.6900      0.0000      0.0000
+    442.9700   1485.5100      0.0000      0.0000
+    443.4800   1485.4600      0.0000      0.0000
+    444.0000   1485.4000      0.0000      0.0000
+    444.5100   1485.3300      0.0000      0.0000
+    445.0200   1485.3200      0.0000      0.0000
+    445.5300   1485.3100      0.0000      0.0000
+    446.0400   1485.3200      0.0000      0.0000
+    446.5500   1485.3200      0.0000      0.0000
+    447.0700   1485.3300      0.0000      0.0000
+    447.5800   1485.3300      0.0000      0.0000
+    448.0900   1485.3300      0.0000      0.0000
+    448.6000   1485.3300      0.0000      0.0000
+    449.1100   1485.3300      0.0000      0.0000
+    449.6200   1485.3300      0.0000      0.0000
+    450.1300   1485.3300      0.0000      0.0000
+    450.6500   1485.3200      0.0000      0.0000
+    451.1600   1485.3000      0.0000      0.0000
+    451.6700   1485.2500      0.0000      0.0000
+    452.1800   1485.2100      0.0000      0.0000
+    452.6900   1485.1900      0.0000      0.0000
+    453.2000   1485.1700      0.0000      0.0000
+    453.7100   1485.1600      0.0000      0.0000
+    454.2200   1485.1500      0.0000      0.0000
+    454.7400   1485.0500      0.0000      0.0000
+    455.2500   1484.9700      0.0000      0.0000
+    455.7600   1484.9000      0.0000      0.0000
+    456.2700   1484.8500      0.0000      0.0000
+    456.7800   1484.8200      0.0000      0.0000
+    457.2900   1484.7900      0.0000      0.0000
+    457.8000   1484.7700      0.0000      0.0000
+    458.3100   1484.7500      0.0000      0.0000
+    458.8200   1484.7400      0.0000      0.0000
+    459.3300   1484.7200      0.0000      0.0000
+    459.8400   1484.6400      0.0000      0.0000
+    460.3600   1484.5100      0.0000      0.0000
+    460.8700   1484.4200      0.0000      0.0000
+    461.3800   1484.4100      0.0000      0.0000
+    461.8900   1484.4200      0.0000      0.0000
+    462.4000   1484.4300      0.0000      0.0000
+    462.9100   1484.4500      0.0000      0.0000
+    463.4200   1484.4600      0.0000      0.0000
+    463.9300   1484.4500      0.0000      0.0000
+    464.4400   1484.4400      0.0000      0.0000
+    464.9500   1484.4300      0.0000      0.0000
+    465.4600   1484.4200      0.0000      0.0000
+    465.9700   1484.4200      0.0000      0.0000
+    466.4800   1484.4200      0.0000      0.0000
+    466.9900   1484.4100      0.0000      0.0000
+    467.5000   1484.4200      0.0000      0.0000
+    468.0100   1484.4200      0.0000      0.0000
+    468.5200   1484.4300      0.0000      0.0000
+    469.0300   1484.3900      0.0000      0.0000
+    469.5400   1484.3500      0.0000      0.0000
+    470.0500   1484.3000      0.0000      0.0000
+    470.5600   1484.2600      0.0000      0.0000
+    471.0700   1484.2500      0.0000      0.0000
+    471.5800   1484.2600      0.0000      0.0000
+    472.0900   1484.2600      0.0000      0.0000
+    472.6000   1484.2000      0.0000      0.0000
+    473.1100   1484.1100      0.0000      0.0000
+    473.6200   1484.0100      0.0000      0.0000
+    474.1300   1483.9600      0.0000      0.0000
+    474.6400   1483.9200      0.0000      0.0000
+    475.1500   1483.9100      0.0000      0.0000
+    475.6600   1483.9200      0.0000      0.0000
+    476.1700   1483.9300      0.0000      0.0000
+    476.6800   1483.9500      0.0000      0.0000
+    477.1900   1483.9600      0.0000      0.0000
+    477.7000   1483.9900      0.0000      0.0000
+    478.2100   1484.0000      0.0000      0.0000
+    478.7200   1484.0200      0.0000      0.0000
+    479.2300   1484.0500      0.0000      0.0000
+    479.7400   1484.0600      0.0000      0.0000
+    480.2500   1484.0800      0.0000      0.0000
+    480.7600   1484.1000      0.0000      0.0000
+    481.2700   1484.1300      0.0000      0.0000
+    481.7800   1484.1400      0.0000      0.0000
+    482.2900   1484.1500      0.0000      0.0000
+    482.8000   1484.1500      0.0000      0.0000
+    483.3100   1484.1600      0.0000      0.0000
+    483.8200   1484.1600      0.0000      0.0000
+    484.3300   1484.1600      0.0000      0.0000
+    484.8400   1484.1700      0.0000      0.0000
+    485.3500   1484.1900      0.0000      0.0000
+    485.8600   1484.1900      0.0000      0.0000
+    486.3700   1484.2000      0.0000      0.0000
+    486.8700   1484.2100      0.0000      0.0000
+    487.3800   1484.2500      0.0000      0.0000
+    487.8900   1484.2300      0.0000      0.0000
+    488.4000   1484.1900      0.0000      0.0000
+    488.9100   1484.1800      0.0000      0.0000
+    489.4200   1484.2000      0.0000      0.0000
+    489.9300   1484.2100      0.0000      0.0000
+    490.4400   1484.2100      0.0000      0.0000
+    490.9500   1484.2100      0.0000      0.0000
+    491.4600   1484.2000      0.0000      0.0000
+    491.9600   1484.1800      0.0000      0.0000
+    492.4700   1484.1400      0.0000      0.0000
+    492.9800   1484.1400      0.0000      0.0000
+    493.4900   1484.1400      0.0000      0.0000
+    494.0000   1484.1400      0.0000      0.0000
+    494.5100   1484.1500      0.0000      0.0000
+    495.0200   1484.1500      0.0000      0.0000
+    495.5300   1484.1600      0.0000      0.0000
+    496.0400   1484.1600      0.0000      0.0000
+    496.5400   1484.1700      0.0000      0.0000
+    497.0500   1484.1700      0.0000      0.0000
+    497.5600   1484.1800      0.0000      0.0000
+    498.0700   1484.1800      0.0000      0.0000
+    498.5800   1484.1800      0.0000      0.0000
+    499.0900   1484.1900      0.0000      0.0000
+    499.6000   1484.2000      0.0000      0.0000
+    500.1000   1484.2000      0.0000      0.0000
+    500.6100   1484.2100      0.0000      0.0000
+    501.1200   1484.2100      0.0000      0.0000
+    501.6300   1484.2200      0.0000      0.0000
+    502.1400   1484.2300      0.0000      0.0000
+    502.6500   1484.2400      0.0000      0.0000
+    503.1500   1484.2400      0.0000      0.0000
+    503.6600   1484.2500      0.0000      0.0000
+    504.1700   1484.2500      0.0000      0.0000
+    504.6800   1484.2500      0.0000      0.0000
+    505.1900   1484.2500      0.0000      0.0000
+    505.7000   1484.2200      0.0000      0.0000
+    506.2000   1484.2100      0.0000      0.0000
+    506.7100   1484.2100      0.0000      0.0000
+    507.2200   1484.2100      0.0000      0.0000
+    507.7300   1484.2200      0.0000      0.0000
+    508.2400   1484.2100      0.0000      0.0000
+    508.7400   1484.2100      0.0000      0.0000
+    509.2500   1484.2000      0.0000      0.0000
+    509.7600   1484.2000      0.0000      0.0000
+    510.2700   1484.2100      0.0000      0.0000
+    510.7700   1484.2000      0.0000      0.0000
+    511.2800   1484.1700      0.0000      0.0000
+    511.7900   1484.1300      0.0000      0.0000
+    512.3000   1484.0800      0.0000      0.0000
+    512.8100   1484.0200      0.0000      0.0000
+    513.3100   1483.9200      0.0000      0.0000
+    513.8200   1483.8700      0.0000      0.0000
+    514.3300   1483.8400      0.0000      0.0000
+    514.8400   1483.8100      0.0000      0.0000
+    515.3400   1483.8000      0.0000      0.0000
+    515.8500   1483.7600      0.0000      0.0000
+    516.3600   1483.7200      0.0000      0.0000
+    516.8700   1483.6900      0.0000      0.0000
+    517.3700   1483.6600      0.0000      0.0000
+    517.8800   1483.6600      0.0000      0.0000
+    518.3900   1483.6500      0.0000      0.0000
+    518.9000   1483.6500      0.0000      0.0000
+    519.4000   1483.6500      0.0000      0.0000
+    519.9100   1483.6500      0.0000      0.0000
+    520.4200   1483.6600      0.0000      0.0000
+    520.9300   1483.6300      0.0000      0.0000
+    521.4300   1483.6000      0.0000      0.0000
+    521.9400   1483.6000      0.0000      0.0000
+    522.4500   1483.6000      0.0000      0.0000
+    522.9500   1483.5900      0.0000      0.0000
+    523.4600   1483.5800      0.0000      0.0000
+    523.9700   1483.5700      0.0000      0.0000
+    524.4800   1483.5700      0.0000      0.0000
+    524.9800   1483.5600      0.0000      0.0000
+    525.4900   1483.5300      0.0000      0.0000
+    526.0000   1483.5100      0.0000      0.0000
+    526.5000   1483.5000      0.0000      0.0000
+    527.0100   1483.4700      0.0000      0.0000
+    527.5200   1483.4600      0.0000      0.0000
+    528.0200   1483.4500      0.0000      0.0000
+    528.5300   1483.4200      0.0000      0.0000
+    529.0400   1483.3900      0.0000      0.0000
+    529.5400   1483.3800      0.0000      0.0000
+    530.0500   1483.3800      0.0000      0.0000
+    530.5600   1483.3700      0.0000      0.0000
+    531.0600   1483.3700      0.0000      0.0000
+    531.5700   1483.3800      0.0000      0.0000
+    532.0800   1483.3800      0.0000      0.0000
+    532.5800   1483.3900      0.0000      0.0000
+    533.0900   1483.4000      0.0000      0.0000
+    533.6000   1483.4000      0.0000      0.0000
+    534.1000   1483.4000      0.0000      0.0000
+    534.6100   1483.4200      0.0000      0.0000
+    535.1200   1483.4300      0.0000      0.0000
+    535.6200   1483.4400      0.0000      0.0000
+    536.1300   1483.4500      0.0000      0.0000
+    536.6400   1483.4600      0.0000      0.0000
+    537.1400   1483.4400      0.0000      0.0000
+    537.6500   1483.3900      0.0000      0.0000
+    538.1500   1483.3800      0.0000      0.0000
+    538.6600   1483.3600      0.0000      0.0000
+    539.1700   1483.3300      0.0000      0.0000
+    539.6700   1483.3200      0.0000      0.0000
+    540.1800   1483.3100      0.0000      0.0000
+    540.6900   1483.2900      0.0000      0.0000
+    541.1900   1483.2700      0.0000      0.0000
+    541.7000   1483.2600      0.0000      0.0000
+    542.2000   1483.2500      0.0000      0.0000
+    542.7100   1483.2500      0.0000      0.0000
+    543.2200   1483.2400      0.0000      0.0000
+    543.7200   1483.2300      0.0000      0.0000
+    544.2300   1483.2300      0.0000      0.0000
+    544.7300   1483.2400      0.0000      0.0000
+    545.2400   1483.2400      0.0000      0.0000
+    545.7400   1483.2500      0.0000      0.0000
+    546.2500   1483.2500      0.0000      0.0000
+    546.7600   1483.2500      0.0000      0.0000
+    547.2600   1483.2400      0.0000      0.0000
+    547.7700   1483.2500      0.0000      0.0000
+    548.2700   1483.2600      0.0000      0.0000
+    548.7800   1483.2700      0.0000      0.0000
+    549.2800   1483.2700      0.0000      0.0000
+    549.7900   1483.2400      0.0000      0.0000
+    550.3000   1483.1700      0.0000      0.0000
+    550.8000   1483.0900      0.0000      0.0000
+    551.3100   1483.0600      0.0000      0.0000
+    551.8100   1483.0400      0.0000      0.0000
+    552.3200   1483.0200      0.0000      0.0000
+    552.8200   1483.0100      0.0000      0.0000
+    553.3300   1483.0100      0.0000      0.0000
+    553.8300   1483.0100      0.0000      0.0000
+    554.3400   1483.0100      0.0000      0.0000
+    554.8400   1483.0100      0.0000      0.0000
+    555.3500   1483.0200      0.0000      0.0000
+    555.8500   1483.0200      0.0000      0.0000
+    556.3600   1483.0200      0.0000      0.0000
+    556.8700   1483.0200      0.0000      0.0000
+    557.3700   1483.0100      0.0000      0.0000
+    557.8800   1482.9600      0.0000      0.0000
+    558.3800   1482.9400      0.0000      0.0000
+    558.8900   1482.9300      0.0000      0.0000
+    559.3900   1482.8700      0.0000      0.0000
+    559.9000   1482.8100      0.0000      0.0000
+    560.4000   1482.7700      0.0000      0.0000
+    560.9100   1482.7600      0.0000      0.0000
+    561.4100   1482.7600      0.0000      0.0000
+    561.9200   1482.7300      0.0000      0.0000
+    562.4200   1482.7200      0.0000      0.0000
+    562.9200   1482.7100      0.0000      0.0000
+    563.4300   1482.7100      0.0000      0.0000
+    563.9300   1482.7000      0.0000      0.0000
+    564.4400   1482.7000      0.0000      0.0000
+    564.9400   1482.7000      0.0000      0.0000
+    565.4500   1482.7000      0.0000      0.0000
+    565.9500   1482.7000      0.0000      0.0000
+    566.4600   1482.7000      0.0000      0.0000
+    566.9600   1482.7000      0.0000      0.0000
+    567.4700   1482.7000      0.0000      0.0000
+    567.9700   1482.7000      0.0000      0.0000
+    568.4800   1482.7000      0.0000      0.0000
+    568.9800   1482.7100      0.0000      0.0000
+    569.4800   1482.7100      0.0000      0.0000
+    569.9900   1482.7200      0.0000      0.0000
+    570.4900   1482.7200      0.0000      0.0000
+    571.0000   1482.7300      0.0000      0.0000
+    571.5000   1482.7300      0.0000      0.0000
+    572.0100   1482.7400      0.0000      0.0000
+    572.5100   1482.7500      0.0000      0.0000
+    573.0100   1482.7500      0.0000      0.0000
+    573.5200   1482.7500      0.0000      0.0000
+    574.0200   1482.7400      0.0000      0.0000
+    574.5300   1482.7300      0.0000      0.0000
+    575.0300   1482.7300      0.0000      0.0000
+    575.5400   1482.7300      0.0000      0.0000
+    576.0400   1482.7400      0.0000      0.0000
+    576.5400   1482.7400      0.0000      0.0000
+    577.0500   1482.7500      0.0000      0.0000
+    577.5500   1482.7500      0.0000      0.0000
+    578.0600   1482.7600      0.0000      0.0000
+    578.5600   1482.7500      0.0000      0.0000
+    579.0600   1482.7500      0.0000      0.0000
+    579.5700   1482.7100      0.0000      0.0000
+    580.0700   1482.6600      0.0000      0.0000
+    580.5700   1482.5700      0.0000      0.0000
+    581.0800   1482.5000      0.0000      0.0000
+    581.5800   1482.4900      0.0000      0.0000
+    582.0900   1482.4800      0.0000      0.0000
+    582.5900   1482.4600      0.0000      0.0000
+    583.0900   1482.4400      0.0000      0.0000
+    583.6000   1482.4200      0.0000      0.0000
+    584.1000   1482.4100      0.0000      0.0000
+    584.6000   1482.4100      0.0000      0.0000
+    585.1100   1482.4100      0.0000      0.0000
+    585.6100   1482.4100      0.0000      0.0000
+    586.1100   1482.4200      0.0000      0.0000
+    586.6200   1482.4300      0.0000      0.0000
+    587.1200   1482.4300      0.0000      0.0000
+    587.6200   1482.4400      0.0000      0.0000
+    588.1300   1482.4500      0.0000      0.0000
+    588.6300   1482.4500      0.0000      0.0000
+    589.1300   1482.4600      0.0000      0.0000
+    589.6400   1482.4600      0.0000      0.0000
+    590.1400   1482.4700      0.0000      0.0000
+    590.6400   1482.4600      0.0000      0.0000
+    591.1500   1482.4600      0.0000      0.0000
+    591.6500   1482.4500      0.0000      0.0000
+    592.1500   1482.4400      0.0000      0.0000
+    592.6600   1482.4300      0.0000      0.0000
+    593.1600   1482.4300      0.0000      0.0000
+    593.6600   1482.4400      0.0000      0.0000
+    594.1600   1482.4500      0.0000      0.0000
+    594.6700   1482.4400      0.0000      0.0000
+    595.1700   1482.4200      0.0000      0.0000
+    595.6700   1482.4100      0.0000      0.0000
+    596.1800   1482.4100      0.0000      0.0000
+    596.6800   1482.4100      0.0000      0.0000
+    597.1800   1482.4200      0.0000      0.0000
+    597.6800   1482.4200      0.0000      0.0000
+    598.1900   1482.4300      0.0000      0.0000
+    598.6900   1482.4200      0.0000      0.0000
+    599.1900   1482.4100      0.0000      0.0000
+    599.7000   1482.4200      0.0000      0.0000
+    600.2000   1482.4300      0.0000      0.0000
+    600.7000   1482.4200      0.0000      0.0000
+    601.2000   1482.3900      0.0000      0.0000
+    601.7100   1482.3700      0.0000      0.0000
+    602.2100   1482.3500      0.0000      0.0000
+    602.7100   1482.3200      0.0000      0.0000
+    603.2100   1482.2400      0.0000      0.0000
+    603.7200   1482.1500      0.0000      0.0000
+    604.2200   1482.1300      0.0000      0.0000
+    604.7200   1482.1200      0.0000      0.0000
+    605.2200   1482.1200      0.0000      0.0000
+    605.7300   1482.1300      0.0000      0.0000
+    606.2300   1482.1300      0.0000      0.0000
+    606.7300   1482.1400      0.0000      0.0000
+    607.2300   1482.1400      0.0000      0.0000
+    607.7300   1482.1400      0.0000      0.0000
+    608.2400   1482.1500      0.0000      0.0000
+    608.7400   1482.1600      0.0000      0.0000
+    609.2400   1482.1700      0.0000      0.0000
+    609.7400   1482.1800      0.0000      0.0000
+    610.2400   1482.1900      0.0000      0.0000
+    610.7500   1482.2000      0.0000      0.0000
+    611.2500   1482.2100      0.0000      0.0000
+    611.7500   1482.2100      0.0000      0.0000
+    612.2500   1482.2200      0.0000      0.0000
+    612.7500   1482.2400      0.0000      0.0000
+    613.2600   1482.2400      0.0000      0.0000
+    613.7600   1482.2500      0.0000      0.0000
+    614.2600   1482.2500      0.0000      0.0000
+    614.7600   1482.2700      0.0000      0.0000
+    615.2600   1482.2700      0.0000      0.0000
+    615.7600   1482.2800      0.0000      0.0000
+    616.2700   1482.2800      0.0000      0.0000
+    616.7700   1482.2900      0.0000      0.0000
+    617.2700   1482.2900      0.0000      0.0000
+    617.7700   1482.2900      0.0000      0.0000
+    618.2700   1482.2900      0.0000      0.0000
+    618.7700   1482.2700      0.0000      0.0000
+    619.2800   1482.2700      0.0000      0.0000
+    619.7800   1482.2600      0.0000      0.0000
+    620.2800   1482.2400      0.0000      0.0000
+    620.7800   1482.2300      0.0000      0.0000
+    621.2800   1482.2300      0.0000      0.0000
+    621.7800   1482.2300      0.0000      0.0000
+    622.2800   1482.2400      0.0000      0.0000
+    622.7900   1482.2400      0.0000      0.0000
+    623.2900   1482.2200      0.0000      0.0000
+    623.7900   1482.2000      0.0000      0.0000
+    624.2900   1482.1900      0.0000      0.0000
+    624.7900   1482.1900      0.0000      0.0000
+    625.2900   1482.1900      0.0000      0.0000
+    625.7900   1482.1800      0.0000      0.0000
+    626.2900   1482.1900      0.0000      0.0000
+    626.7900   1482.1900      0.0000      0.0000
+    627.3000   1482.1700      0.0000      0.0000
+    627.8000   1482.1200      0.0000      0.0000
+    628.3000   1482.0900      0.0000      0.0000
+    628.8000   1482.0900      0.0000      0.0000
+    629.3000   1482.0800      0.0000      0.0000
+    629.8000   1482.0800      0.0000      0.0000
+    630.3000   1482.0800      0.0000      0.0000
+    630.8000   1482.0800      0.0000      0.0000
+    631.3000   1482.0800      0.0000      0.0000
+    631.8000   1482.0900      0.0000      0.0000
+    632.3000   1482.0900      0.0000      0.0000
+    632.8100   1482.0900      0.0000      0.0000
+    633.3100   1482.1000      0.0000      0.0000
+    633.8100   1482.1100      0.0000      0.0000
+    634.3100   1482.1200      0.0000      0.0000
+    634.8100   1482.1200      0.0000      0.0000
+    635.3100   1482.1200      0.0000      0.0000
+    635.8100   1482.1000      0.0000      0.0000
+    636.3100   1482.1000      0.0000      0.0000
+    636.8100   1482.0900      0.0000      0.0000
+    637.3100   1482.1000      0.0000      0.0000
+    637.8100   1482.1000      0.0000      0.0000
+    638.3100   1482.1100      0.0000      0.0000
+    638.8100   1482.1100      0.0000      0.0000
+    639.3100   1482.1200      0.0000      0.0000
+    639.8100   1482.1200      0.0000      0.0000
+    640.3100   1482.1200      0.0000      0.0000
+    640.8100   1482.1300      0.0000      0.0000
+    641.3100   1482.1300      0.0000      0.0000
+    641.8100   1482.1400      0.0000      0.0000
+    642.3100   1482.1400      0.0000      0.0000
+    642.8100   1482.1300      0.0000      0.0000
+    643.3100   1482.1500      0.0000      0.0000
+    643.8100   1482.1600      0.0000      0.0000
+    644.3100   1482.1600      0.0000      0.0000
+    644.8100   1482.1600      0.0000      0.0000
+    645.3100   1482.1600      0.0000      0.0000
+    645.8100   1482.1300      0.0000      0.0000
+    646.3100   1482.1300      0.0000      0.0000
+    646.8100   1482.1400      0.0000      0.0000
+    647.3100   1482.1500      0.0000      0.0000
+    647.8100   1482.1500      0.0000      0.0000
+    648.3100   1482.1600      0.0000      0.0000
+    648.8100   1482.1700      0.0000      0.0000
+    649.3100   1482.1800      0.0000      0.0000
+    649.8100   1482.1900      0.0000      0.0000
+    650.3100   1482.1900      0.0000      0.0000
+    650.8100   1482.2000      0.0000      0.0000
+    651.3100   1482.1900      0.0000      0.0000
+    651.8100   1482.1900      0.0000      0.0000
+    652.3100   1482.1900      0.0000      0.0000
+    652.8100   1482.2000      0.0000      0.0000
+    653.3100   1482.2000      0.0000      0.0000
+    653.8100   1482.2000      0.0000      0.0000
+    654.3100   1482.1600      0.0000      0.0000
+    654.8100   1482.1500      0.0000      0.0000
+    655.3100   1482.1500      0.0000      0.0000
+    655.8100   1482.1400      0.0000      0.0000
+    656.3000   1482.1500      0.0000      0.0000
+    656.8000   1482.1600      0.0000      0.0000
+    657.3000   1482.1700      0.0000      0.0000
+    657.8000   1482.1700      0.0000      0.0000
+    658.3000   1482.1800      0.0000      0.0000
+    658.8000   1482.1800      0.0000      0.0000
+    659.3000   1482.1900      0.0000      0.0000
+    659.8000   1482.2000      0.0000      0.0000
+    660.3000   1482.2000      0.0000      0.0000
+    660.8000   1482.2000      0.0000      0.0000
+    661.3000   1482.2100      0.0000      0.0000
+    661.8000   1482.2200      0.0000      0.0000
+    662.2900   1482.2300      0.0000      0.0000
+    662.7900   1482.2300      0.0000      0.0000
+    663.2900   1482.2400      0.0000      0.0000
+    663.7900   1482.2400      0.0000      0.0000
+    664.2900   1482.2500      0.0000      0.0000
+    664.7900   1482.2500      0.0000      0.0000
+    665.2900   1482.2600      0.0000      0.0000
+    665.7900   1482.2700      0.0000      0.0000
+    666.2800   1482.2800      0.0000      0.0000
+    666.7800   1482.2800      0.0000      0.0000
+    667.2800   1482.2800      0.0000      0.0000
+    667.7800   1482.2900      0.0000      0.0000
+    668.2800   1482.3000      0.0000      0.0000
+    668.7800   1482.3000      0.0000      0.0000
+    669.2800   1482.3100      0.0000      0.0000
+    669.7800   1482.3100      0.0000      0.0000
+    670.2700   1482.3100      0.0000      0.0000
+    670.7700   1482.3200      0.0000      0.0000
+    671.2700   1482.3300      0.0000      0.0000
+    671.7700   1482.3300      0.0000      0.0000
+    672.2700   1482.3400      0.0000      0.0000
+    672.7700   1482.3400      0.0000      0.0000
+    673.2600   1482.3400      0.0000      0.0000
+    673.7600   1482.3300      0.0000      0.0000
+    674.2600   1482.3300      0.0000      0.0000
+    674.7600   1482.3400      0.0000      0.0000
+    675.2600   1482.3500      0.0000      0.0000
+    675.7600   1482.3500      0.0000      0.0000
+    676.2500   1482.3600      0.0000      0.0000
+    676.7500   1482.3700      0.0000      0.0000
+    677.2500   1482.3700      0.0000      0.0000
+    677.7500   1482.3700      0.0000      0.0000
+    678.2500   1482.3800      0.0000      0.0000
+    678.7400   1482.3800      0.0000      0.0000
+    679.2400   1482.3800      0.0000      0.0000
+    679.7400   1482.3600      0.0000      0.0000
+    680.2400   1482.3400      0.0000      0.0000
+    680.7400   1482.3200      0.0000      0.0000
+    681.2300   1482.2900      0.0000      0.0000
+    681.7300   1482.2900      0.0000      0.0000
+    682.2300   1482.2900      0.0000      0.0000
+    682.7300   1482.3000      0.0000      0.0000
+    683.2200   1482.3100      0.0000      0.0000
+    683.7200   1482.3200      0.0000      0.0000
+    684.2200   1482.3100      0.0000      0.0000
+    684.7200   1482.3000      0.0000      0.0000
+    685.2100   1482.2800      0.0000      0.0000
+    685.7100   1482.2700      0.0000      0.0000
+    686.2100   1482.2600      0.0000      0.0000
+    686.7100   1482.2600      0.0000      0.0000
+    687.2000   1482.2700      0.0000      0.0000
+    687.7000   1482.2700      0.0000      0.0000
+    688.2000   1482.2700      0.0000      0.0000
+    688.7000   1482.2700      0.0000      0.0000
+    689.1900   1482.2800      0.0000      0.0000
+    689.6900   1482.2900      0.0000      0.0000
+    690.1900   1482.3000      0.0000      0.0000
+    690.6900   1482.3000      0.0000      0.0000
+    691.1800   1482.3100      0.0000      0.0000
+    691.6800   1482.3100      0.0000      0.0000
+    692.1800   1482.3200      0.0000      0.0000
+    692.6700   1482.3200      0.0000      0.0000
+    693.1700   1482.3200      0.0000      0.0000
+    693.6700   1482.3300      0.0000      0.0000
+    694.1700   1482.3300      0.0000      0.0000
+    694.6600   1482.3400      0.0000      0.0000
+    695.1600   1482.3400      0.0000      0.0000
+    695.6600   1482.3200      0.0000      0.0000
+    696.1500   1482.3200      0.0000      0.0000
+    696.6500   1482.3200      0.0000      0.0000
+    697.1500   1482.3200      0.0000      0.0000
+    697.6400   1482.3300      0.0000      0.0000
+    698.1400   1482.3300      0.0000      0.0000
+    698.6400   1482.3300      0.0000      0.0000
+    699.1400   1482.3200      0.0000      0.0000
+    699.6300   1482.3200      0.0000      0.0000
+    700.1300   1482.3300      0.0000      0.0000
+    700.6300   1482.3300      0.0000      0.0000
+    701.1200   1482.3300      0.0000      0.0000
+    701.6200   1482.3400      0.0000      0.0000
+    702.1200   1482.3400      0.0000      0.0000
+    702.6100   1482.3500      0.0000      0.0000
+    703.1100   1482.3500      0.0000      0.0000
+    703.6000   1482.3600      0.0000      0.0000
+    704.1000   1482.3600      0.0000      0.0000
+    704.6000   1482.3600      0.0000      0.0000
+    705.0900   1482.3600      0.0000      0.0000
+    705.5900   1482.3600      0.0000      0.0000
+    706.0900   1482.3700      0.0000      0.0000
+    706.5800   1482.3800      0.0000      0.0000
+    707.0800   1482.3700      0.0000      0.0000
+    707.5800   1482.3600      0.0000      0.0000
+    708.0700   1482.3500      0.0000      0.0000
+    708.5700   1482.3200      0.0000      0.0000
+    709.0600   1482.2900      0.0000      0.0000
+    709.5600   1482.2700      0.0000      0.0000
+    710.0600   1482.2700      0.0000      0.0000
+    710.5500   1482.2800      0.0000      0.0000
+    711.0500   1482.2900      0.0000      0.0000
+    711.5500   1482.3000      0.0000      0.0000
+    712.0400   1482.3100      0.0000      0.0000
+    712.5400   1482.3200      0.0000      0.0000
+    713.0300   1482.3200      0.0000      0.0000
+    713.5300   1482.3300      0.0000      0.0000
+    714.0200   1482.3300      0.0000      0.0000
+    714.5200   1482.3300      0.0000      0.0000
+    715.0200   1482.3300      0.0000      0.0000
+    715.5100   1482.3400      0.0000      0.0000
+    716.0100   1482.3400      0.0000      0.0000
+    716.5000   1482.3400      0.0000      0.0000
+    717.0000   1482.3500      0.0000      0.0000
+    717.5000   1482.3500      0.0000      0.0000
+    717.9900   1482.3500      0.0000      0.0000
+    718.4900   1482.3600      0.0000      0.0000
+    718.9800   1482.3600      0.0000      0.0000
+    719.4800   1482.3600      0.0000      0.0000
+    719.9700   1482.3700      0.0000      0.0000
+    720.4700   1482.3500      0.0000      0.0000
+    720.9600   1482.2900      0.0000      0.0000
+    721.4600   1482.2700      0.0000      0.0000
+    721.9500   1482.2700      0.0000      0.0000
+    722.4500   1482.2700      0.0000      0.0000
+    722.9500   1482.2700      0.0000      0.0000
+    723.4400   1482.2300      0.0000      0.0000
+    723.9400   1482.2200      0.0000      0.0000
+    724.4300   1482.2200      0.0000      0.0000
+    724.9300   1482.2200      0.0000      0.0000
+    725.4200   1482.2300      0.0000      0.0000
+    725.9200   1482.2300      0.0000      0.0000
+    726.4100   1482.2400      0.0000      0.0000
+    726.9100   1482.2500      0.0000      0.0000
+    727.4000   1482.2600      0.0000      0.0000
+    727.9000   1482.2700      0.0000      0.0000
+    728.3900   1482.2800      0.0000      0.0000
+    728.8900   1482.2900      0.0000      0.0000
+    729.3800   1482.2900      0.0000      0.0000
+    729.8800   1482.3000      0.0000      0.0000
+    730.3700   1482.3100      0.0000      0.0000
+    730.8700   1482.3200      0.0000      0.0000
+    731.3600   1482.3200      0.0000      0.0000
+    731.8600   1482.3300      0.0000      0.0000
+    732.3500   1482.3300      0.0000      0.0000
+    732.8500   1482.3400      0.0000      0.0000
+    733.3400   1482.3500      0.0000      0.0000
+    733.8400   1482.3600      0.0000      0.0000
+    734.3300   1482.3600      0.0000      0.0000
+    734.8300   1482.3700      0.0000      0.0000
+    735.3200   1482.3700      0.0000      0.0000
+    735.8100   1482.3800      0.0000      0.0000
+    736.3100   1482.3900      0.0000      0.0000
+    736.8000   1482.3800      0.0000      0.0000
+    737.3000   1482.3600      0.0000      0.0000
+    737.7900   1482.3600      0.0000      0.0000
+    738.2900   1482.3600      0.0000      0.0000
+    738.7800   1482.3700      0.0000      0.0000
+    739.2800   1482.3700      0.0000      0.0000
+    739.7700   1482.3800      0.0000      0.0000
+    740.2600   1482.3900      0.0000      0.0000
+    740.7600   1482.4000      0.0000      0.0000
+    741.2500   1482.4100      0.0000      0.0000
+    741.7500   1482.4200      0.0000      0.0000
+    742.2400   1482.4300      0.0000      0.0000
+    742.7400   1482.4400      0.0000      0.0000
+    743.2300   1482.4500      0.0000      0.0000
+    743.7200   1482.4500      0.0000      0.0000
+    744.2200   1482.4600      0.0000      0.0000
+    744.7100   1482.4700      0.0000      0.0000
+    745.2100   1482.4800      0.0000      0.0000
+    745.7000   1482.4800      0.0000      0.0000
+    746.1900   1482.4900      0.0000      0.0000
+    746.6900   1482.5000      0.0000      0.0000
+    747.1800   1482.5100      0.0000      0.0000
+    747.6800   1482.5200      0.0000      0.0000
+    748.1700   1482.5300      0.0000      0.0000
+    748.6600   1482.5300      0.0000      0.0000
+    749.1600   1482.5400      0.0000      0.0000
+    749.6500   1482.5500      0.0000      0.0000
+    750.1400   1482.5500      0.0000      0.0000
+    750.6400   1482.5500      0.0000      0.0000
+    751.1300   1482.5600      0.0000      0.0000
+    751.6300   1482.5600      0.0000      0.0000
+    752.1200   1482.5600      0.0000      0.0000
+    752.6100   1482.5600      0.0000      0.0000
+    753.1100   1482.5500      0.0000      0.0000
+    753.6000   1482.5300      0.0000      0.0000
+    754.0900   1482.5200      0.0000      0.0000
+    754.5900   1482.5100      0.0000      0.0000
+    755.0800   1482.5000      0.0000      0.0000
+    755.5700   1482.4800      0.0000      0.0000
+    756.0700   1482.4800      0.0000      0.0000
+    756.5600   1482.4800      0.0000      0.0000
+    757.0500   1482.4800      0.0000      0.0000
+    757.5500   1482.4900      0.0000      0.0000
+    758.0400   1482.4900      0.0000      0.0000
+    758.5300   1482.4800      0.0000      0.0000
+    759.0300   1482.4800      0.0000      0.0000
+    759.5200   1482.4800      0.0000      0.0000
+    760.0100   1482.4800      0.0000      0.0000
+    760.5100   1482.4800      0.0000      0.0000
+    761.0000   1482.4800      0.0000      0.0000
+    761.4900   1482.4900      0.0000      0.0000
+    761.9900   1482.4900      0.0000      0.0000
+    762.4800   1482.4900      0.0000      0.0000
+    762.9700   1482.4900      0.0000      0.0000
+    763.4600   1482.4800      0.0000      0.0000
+    763.9600   1482.4700      0.0000      0.0000
+    764.4500   1482.4600      0.0000      0.0000
+    764.9400   1482.4500      0.0000      0.0000
+    765.4400   1482.4500      0.0000      0.0000
+    765.9300   1482.4600      0.0000      0.0000
+    766.4200   1482.4600      0.0000      0.0000
+    766.9100   1482.4700      0.0000      0.0000
+    767.4100   1482.4800      0.0000      0.0000
+    767.9000   1482.4900      0.0000      0.0000
+    768.3900   1482.4900      0.0000      0.0000
+    768.8800   1482.5000      0.0000      0.0000
+    769.3800   1482.4800      0.0000      0.0000
+    769.8700   1482.4700      0.0000      0.0000
+    770.3600   1482.4700      0.0000      0.0000
+    770.8600   1482.4800      0.0000      0.0000
+    771.3500   1482.4900      0.0000      0.0000
+    771.8400   1482.5000      0.0000      0.0000
+    772.3300   1482.5100      0.0000      0.0000
+    772.8200   1482.5100      0.0000      0.0000
+    773.3200   1482.5200      0.0000      0.0000
+    773.8100   1482.5100      0.0000      0.0000
+    774.3000   1482.5100      0.0000      0.0000
+    774.7900   1482.5000      0.0000      0.0000
+    775.2900   1482.5000      0.0000      0.0000
+    775.7800   1482.5000      0.0000      0.0000
+    776.2700   1482.5000      0.0000      0.0000
+    776.7600   1482.5000      0.0000      0.0000
+    777.2500   1482.5000      0.0000      0.0000
+    777.7500   1482.5000      0.0000      0.0000
+    778.2400   1482.5000      0.0000      0.0000
+    778.7300   1482.5100      0.0000      0.0000
+    779.2200   1482.5100      0.0000      0.0000
+    779.7100   1482.5200      0.0000      0.0000
+    780.2100   1482.5200      0.0000      0.0000
+    780.7000   1482.5200      0.0000      0.0000
+    781.1900   1482.5200      0.0000      0.0000
+    781.6800   1482.5200      0.0000      0.0000
+    782.1700   1482.5200      0.0000      0.0000
+    782.6700   1482.5200      0.0000      0.0000
+    783.1600   1482.5200      0.0000      0.0000
+    783.6500   1482.5200      0.0000      0.0000
+    784.1400   1482.5200      0.0000      0.0000
+    784.6300   1482.5200      0.0000      0.0000
+    785.1200   1482.5200      0.0000      0.0000
+    785.6200   1482.5300      0.0000      0.0000
+    786.1100   1482.5300      0.0000      0.0000
+    786.6000   1482.5300      0.0000      0.0000
+    787.0900   1482.5300      0.0000      0.0000
+    787.5800   1482.5100      0.0000      0.0000
+    788.0700   1482.4900      0.0000      0.0000
+    788.5700   1482.4800      0.0000      0.0000
+    789.0600   1482.4800      0.0000      0.0000
+    789.5500   1482.4700      0.0000      0.0000
+    790.0400   1482.4700      0.0000      0.0000
+    790.5300   1482.4700      0.0000      0.0000
+    791.0200   1482.4800      0.0000      0.0000
+    791.5100   1482.4800      0.0000      0.0000
+    792.0000   1482.4900      0.0000      0.0000
+    792.5000   1482.5000      0.0000      0.0000
+    792.9900   1482.5100      0.0000      0.0000
+    793.4800   1482.5200      0.0000      0.0000
+    793.9700   1482.5300      0.0000      0.0000
+    794.4600   1482.5500      0.0000      0.0000
+    794.9500   1482.5600      0.0000      0.0000
+    795.4400   1482.5700      0.0000      0.0000
+    795.9300   1482.5900      0.0000      0.0000
+    796.4200   1482.6000      0.0000      0.0000
+    796.9200   1482.6100      0.0000      0.0000
+    797.4100   1482.6100      0.0000      0.0000
+    797.9000   1482.6200      0.0000      0.0000
+    798.3900   1482.6300      0.0000      0.0000
+    798.8800   1482.6300      0.0000      0.0000
+    799.3700   1482.6300      0.0000      0.0000
+    799.8600   1482.6400      0.0000      0.0000
+    800.3500   1482.6400      0.0000      0.0000
+    800.8400   1482.6500      0.0000      0.0000
+    801.3300   1482.6500      0.0000      0.0000
+    801.8200   1482.6600      0.0000      0.0000
+    802.3100   1482.6600      0.0000      0.0000
+    802.8000   1482.6600      0.0000      0.0000
+    803.2900   1482.6600      0.0000      0.0000
+    803.7800   1482.6600      0.0000      0.0000
+    804.2800   1482.6500      0.0000      0.0000
+    804.7700   1482.6500      0.0000      0.0000
+    805.2600   1482.6600      0.0000      0.0000
+    805.7500   1482.6700      0.0000      0.0000
+    806.2400   1482.6700      0.0000      0.0000
+    806.7300   1482.6800      0.0000      0.0000
+    807.2200   1482.6900      0.0000      0.0000
+    807.7100   1482.7000      0.0000      0.0000
+    808.2000   1482.7000      0.0000      0.0000
+    808.6900   1482.7000      0.0000      0.0000
+    809.1800   1482.7000      0.0000      0.0000
+    809.6700   1482.7000      0.0000      0.0000
+    810.1600   1482.7100      0.0000      0.0000
+    810.6500   1482.7100      0.0000      0.0000
+    811.1400   1482.7200      0.0000      0.0000
+    811.6300   1482.7300      0.0000      0.0000
+    812.1200   1482.7300      0.0000      0.0000
+    812.6100   1482.7400      0.0000      0.0000
+    813.1000   1482.7400      0.0000      0.0000
+    813.5900   1482.7500      0.0000      0.0000
+    814.0800   1482.7500      0.0000      0.0000
+    814.5700   1482.7500      0.0000      0.0000
+    815.0600   1482.7500      0.0000      0.0000
+    815.5500   1482.7500      0.0000      0.0000
+    816.0400   1482.7500      0.0000      0.0000
+    816.5300   1482.7600      0.0000      0.0000
+    817.0200   1482.7600      0.0000      0.0000
+    817.5100   1482.7600      0.0000      0.0000
+    818.0000   1482.7700      0.0000      0.0000
+    818.4900   1482.7800      0.0000      0.0000
+    818.9800   1482.7800      0.0000      0.0000
+    819.4700   1482.7900      0.0000      0.0000
+    819.9600   1482.7900      0.0000      0.0000
+    820.4400   1482.7900      0.0000      0.0000
+    820.9300   1482.7700      0.0000      0.0000
+    821.4200   1482.7500      0.0000      0.0000
+    821.9100   1482.7400      0.0000      0.0000
+    822.4000   1482.7400      0.0000      0.0000
+    822.8900   1482.7400      0.0000      0.0000
+    823.3800   1482.7400      0.0000      0.0000
+    823.8700   1482.7500      0.0000      0.0000
+    824.3600   1482.7500      0.0000      0.0000
+    824.8500   1482.7600      0.0000      0.0000
+    825.3400   1482.7600      0.0000      0.0000
+    825.8300   1482.7600      0.0000      0.0000
+    826.3200   1482.7600      0.0000      0.0000
+    826.8100   1482.7400      0.0000      0.0000
+    827.2900   1482.7400      0.0000      0.0000
+    827.7800   1482.7300      0.0000      0.0000
+    828.2700   1482.7300      0.0000      0.0000
+    828.7600   1482.7300      0.0000      0.0000
+    829.2500   1482.7300      0.0000      0.0000
+    829.7400   1482.7200      0.0000      0.0000
+    830.2300   1482.6800      0.0000      0.0000
+    830.7200   1482.6300      0.0000      0.0000
+    831.2100   1482.6100      0.0000      0.0000
+    831.7000   1482.6100      0.0000      0.0000
+    832.1800   1482.5900      0.0000      0.0000
+    832.6700   1482.5800      0.0000      0.0000
+    833.1600   1482.5700      0.0000      0.0000
+    833.6500   1482.5700      0.0000      0.0000
+    834.1400   1482.5800      0.0000      0.0000
+    834.6300   1482.5900      0.0000      0.0000
+    835.1200   1482.5900      0.0000      0.0000
+    835.6100   1482.6000      0.0000      0.0000
+    836.0900   1482.6100      0.0000      0.0000
+    836.5800   1482.6200      0.0000      0.0000
+    837.0700   1482.6300      0.0000      0.0000
+    837.5600   1482.6400      0.0000      0.0000
+    838.0500   1482.6500      0.0000      0.0000
+    838.5400   1482.6500      0.0000      0.0000
+    839.0200   1482.6600      0.0000      0.0000
+    839.5100   1482.6700      0.0000      0.0000
+    840.0000   1482.6700      0.0000      0.0000
+    840.4900   1482.6500      0.0000      0.0000
+    840.9800   1482.6200      0.0000      0.0000
+    841.4700   1482.6200      0.0000      0.0000
+    841.9500   1482.6300      0.0000      0.0000
+    842.4400   1482.6300      0.0000      0.0000
+    842.9300   1482.6400      0.0000      0.0000
+    843.4200   1482.6500      0.0000      0.0000
+    843.9100   1482.6600      0.0000      0.0000
+    844.3900   1482.6700      0.0000      0.0000
+    844.8800   1482.6800      0.0000      0.0000
+    845.3700   1482.6800      0.0000      0.0000
+    845.8600   1482.6700      0.0000      0.0000
+    846.3500   1482.6600      0.0000      0.0000
+    846.8300   1482.6300      0.0000      0.0000
+    847.3200   1482.6200      0.0000      0.0000
+    847.8100   1482.6200      0.0000      0.0000
+    848.3000   1482.6100      0.0000      0.0000
+    848.7900   1482.6000      0.0000      0.0000
+    849.2700   1482.5800      0.0000      0.0000
+    849.7600   1482.5600      0.0000      0.0000
+    850.2500   1482.5500      0.0000      0.0000
@@ -0,0 +1,4007 @@
+test_read_store_and_write
+1/1/2007
+6:43:11
+Probe: XSV-02
+Source: /root/package/data/input/sippican/S2_00174.EDF
+      0.0000   1530.1300      0.0000      0.0000
+      0.6000   1524.5300      0.0000      0.0000
+      1.1000   1560.0000      0.0000      0.0000
+      1.7000   1526.6600      0.0000      0.0000
+      2.2000   1533.6600      0.0000      0.0000
+      2.8000   1534.0100      0.0000      0.0000
+      3.4000   1534.5700      0.0000      0.0000
+      3.9000   1534.8100      0.0000      0.0000
+      4.5000   1534.9600      0.0000      0.0000
+      5.0000   1535.1400      0.0000      0.0000
+      5.6000   1535.2500      0.0000      0.0000
+      6.1000   1535.3600      0.0000      0.0000
+      6.7000   1535.4500      0.0000      0.0000
+      7.3000   1535.5100      0.0000      0.0000
+      7.8000   1535.5600      0.0000      0.0000
+      8.4000   1535.6100      0.0000      0.0000
+      8.9000   1535.6600      0.0000      0.0000
+      9.5000   1535.7000      0.0000      0.0000
+     10.1000   1535.7400      0.0000      0.0000
+     10.6000   1535.7900      0.0000      0.0000
+     11.2000   1535.8100      0.0000      0.0000
+     11.7000   1535.8400      0.0000      0.0000
+     12.3000   1535.8600      0.0000      0.0000
+     12.8000   1535.8900      0.0000      0.0000
+     13.4000   1535.9200      0.0000      0.0000
+     14.0000   1535.9500      0.0000      0.0000
+     14.5000   1535.9800      0.0000      0.0000
+     15.1000   1536.0000      0.0000      0.0000
+     15.6000   1536.0200      0.0000      0.0000
+     16.2000   1536.0400      0.0000      0.0000
+     16.8000   1536.0600      0.0000      0.0000
+     17.3000   1536.0800      0.0000      0.0000
+     17.9000   1536.1000      0.0000      0.0000
+     18.4000   1536.1200      0.0000      0.0000
+     19.0000   1536.1300      0.0000      0.0000
+     19.5000   1536.1300      0.0000      0.0000
+     20.1000   1536.1400      0.0000      0.0000
+     20.7000   1536.1100      0.0000      0.0000
+     21.2000   1536.1000      0.0000      0.0000
+     21.8000   1536.1100      0.0000      0.0000
+     22.3000   1536.0900      0.0000      0.0000
+     22.9000   1536.0500      0.0000      0.0000
+     23.4000   1536.0500      0.0000      0.0000
+     24.0000   1536.0500      0.0000      0.0000
+     24.6000   1536.0400      0.0000      0.0000
+     25.1000   1536.0700      0.0000      0.0000
+     25.7000   1536.0900      0.0000      0.0000
+     26.2000   1536.0800      0.0000      0.0000
+     26.8000   1536.0900      0.0000      0.0000
+     27.4000   1536.0900      0.0000      0.0000
+     27.9000   1536.1000      0.0000      0.0000
+     28.5000   1536.1100      0.0000      0.0000
+     29.0000   1536.1200      0.0000      0.0000
+     29.6000   1536.1300      0.0000      0.0000
+     30.1000   1536.1400      0.0000      0.0000
+     30.7000   1536.1500      0.0000      0.0000
+     31.3000   1536.1500      0.0000      0.0000
+     31.8000   1536.1600      0.0000      0.0000
+     32.4000   1536.1700      0.0000      0.0000
+     32.9000   1536.1700      0.0000      0.0000
+     33.5000   1536.1600      0.0000      0.0000
+     34.0000   1536.1800      0.0000      0.0000
+     34.6000   1536.1800      0.0000      0.0000
+     35.2000   1536.2000      0.0000      0.0000
+     35.7000   1536.1900      0.0000      0.0000
+     36.3000   1536.1900      0.0000      0.0000
+     36.8000   1536.2200      0.0000      0.0000
+     37.4000   1536.2100      0.0000      0.0000
+     37.9000   1536.2200      0.0000      0.0000
+     38.5000   1536.2200      0.0000      0.0000
+     39.1000   1536.2400      0.0000      0.0000
+     39.6000   1536.2400      0.0000      0.0000
+     40.2000   1536.2300      0.0000      0.0000
+     40.7000   1536.2300      0.0000      0.0000
+     41.3000   1536.2300      0.0000      0.0000
+     41.8000   1536.2400      0.0000      0.0000
+     42.4000   1536.2500      0.0000      0.0000
+     43.0000   1536.2700      0.0000      0.0000
+     43.5000   1536.2900      0.0000      0.0000
+     44.1000   1536.3000      0.0000      0.0000
+     44.6000   1536.3200      0.0000      0.0000
+     45.2000   1536.3300      0.0000      0.0000
+     45.7000   1536.3400      0.0000      0.0000
+     46.3000   1536.3500      0.0000      0.0000
+     46.8000   1536.3600      0.0000      0.0000
+     47.4000   1536.3800      0.0000      0.0000
+     48.0000   1536.3900      0.0000      0.0000
+     48.5000   1536.3900      0.0000      0.0000
+     49.1000   1536.4000      0.0000      0.0000
+     49.6000   1536.4200      0.0000      0.0000
+     50.2000   1536.4400      0.0000      0.0000
+     50.7000   1536.4500      0.0000      0.0000
+     51.3000   1536.4500      0.0000      0.0000
+     51.9000   1536.4600      0.0000      0.0000
+     52.4000   1536.4500      0.0000      0.0000
+     53.0000   1536.4500      0.0000      0.0000
+     53.5000   1536.4400      0.0000      0.0000
+     54.1000   1536.4500      0.0000      0.0000
+     54.6000   1536.4500      0.0000      0.0000
+     55.2000   1536.4500      0.0000      0.0000
+     55.7000   1536.4500      0.0000      0.0000
+     56.3000   1536.4500      0.0000      0.0000
+     56.9000   1536.4700      0.0000      0.0000
+     57.4000   1536.4900      0.0000      0.0000
+     58.0000   1536.5200      0.0000      0.0000
+     58.5000   1536.5200      0.0000      0.0000
+     59.1000   1536.5200      0.0000      0.0000
+     59.6000   1536.5300      0.0000      0.0000
+     60.2000   1536.5600      0.0000      0.0000
+     60.8000   1536.5700      0.0000      0.0000
+     61.3000   1536.5800      0.0000      0.0000
+     61.9000   1536.5900      0.0000      0.0000
+     62.4000   1536.6000      0.0000      0.0000
+     63.0000   1536.6100      0.0000      0.0000
+     63.5000   1536.6200      0.0000      0.0000
+     64.1000   1536.6400      0.0000      0.0000
+     64.6000   1536.6500      0.0000      0.0000
+     65.2000   1536.6400      0.0000      0.0000
+     65.8000   1536.6700      0.0000      0.0000
+     66.3000   1536.6700      0.0000      0.0000
+     66.9000   1536.6800      0.0000      0.0000
+     67.4000   1536.6900      0.0000      0.0000
+     68.0000   1536.7000      0.0000      0.0000
+     68.5000   1536.7100      0.0000      0.0000
+     69.1000   1536.7100      0.0000      0.0000
+     69.6000   1536.7300      0.0000      0.0000
+     70.2000   1536.7400      0.0000      0.0000
+     70.7000   1536.7600      0.0000      0.0000
+     71.3000   1536.7600      0.0000      0.0000
+     71.9000   1536.7700      0.0000      0.0000
+     72.4000   1536.7700      0.0000      0.0000
+     73.0000   1536.7800      0.0000      0.0000
+     73.5000   1536.7900      0.0000      0.0000
+     74.1000   1536.8000      0.0000      0.0000
+     74.6000   1536.8100      0.0000      0.0000
+     75.2000   1536.8300      0.0000      0.0000
+     75.7000   1536.8300      0.0000      0.0000
+     76.3000   1536.8400      0.0000      0.0000
+     76.9000   1536.8500      0.0000      0.0000
+     77.4000   1536.8600      0.0000      0.0000
+     78.0000   1536.8700      0.0000      0.0000
+     78.5000   1536.8800      0.0000      0.0000
+     79.1000   1536.8800      0.0000      0.0000
+     79.6000   1536.8900      0.0000      0.0000
+     80.2000   1536.9100      0.0000      0.0000
+     80.7000   1536.9100      0.0000      0.0000
+     81.3000   1536.9300      0.0000      0.0000
+     81.8000   1536.9300      0.0000      0.0000
+     82.4000   1536.9200      0.0000      0.0000
+     83.0000   1536.9100      0.0000      0.0000
+     83.5000   1536.9000      0.0000      0.0000
+     84.1000   1536.9000      0.0000      0.0000
+     84.6000   1536.8900      0.0000      0.0000
+     85.2000   1536.8900      0.0000      0.0000
+     85.7000   1536.8300      0.0000      0.0000
+     86.3000   1536.7400      0.0000      0.0000
+     86.8000   1536.7000      0.0000      0.0000
+     87.4000   1536.7000      0.0000      0.0000
+     87.9000   1536.6600      0.0000      0.0000
+     88.5000   1536.3900      0.0000      0.0000
+     89.1000   1536.0600      0.0000      0.0000
+     89.6000   1535.8800      0.0000      0.0000
+     90.2000   1535.7200      0.0000      0.0000
+     90.7000   1535.5000      0.0000      0.0000
+     91.3000   1535.2900      0.0000      0.0000
+     91.8000   1535.1300      0.0000      0.0000
+     92.4000   1535.0200      0.0000      0.0000
+     92.9000   1534.9600      0.0000      0.0000
+     93.5000   1534.9000      0.0000      0.0000
+     94.0000   1534.8300      0.0000      0.0000
+     94.6000   1534.6700      0.0000      0.0000
+     95.1000   1534.5200      0.0000      0.0000
+     95.7000   1534.4600      0.0000      0.0000
+     96.3000   1534.4100      0.0000      0.0000
+     96.8000   1534.3700      0.0000      0.0000
+     97.4000   1534.3300      0.0000      0.0000
+     97.9000   1534.2800      0.0000      0.0000
+     98.5000   1534.2400      0.0000      0.0000
+     99.0000   1534.2300      0.0000      0.0000
+     99.6000   1534.2000      0.0000      0.0000
+    100.1000   1534.1900      0.0000      0.0000
+    100.7000   1534.1700      0.0000      0.0000
+    101.2000   1534.1500      0.0000      0.0000
+    101.8000   1534.1400      0.0000      0.0000
+    102.3000   1534.1200      0.0000      0.0000
+    102.9000   1534.0500      0.0000      0.0000
+    103.5000   1533.9900      0.0000      0.0000
+    104.0000   1533.9400      0.0000      0.0000
+    104.6000   1533.8200      0.0000      0.0000
+    105.1000   1533.6600      0.0000      0.0000
+    105.7000   1533.5800      0.0000      0.0000
+    106.2000   1533.3900      0.0000      0.0000
+    106.8000   1533.1600      0.0000      0.0000
+    107.3000   1532.9500      0.0000      0.0000
+    107.9000   1532.8200      0.0000      0.0000
+    108.4000   1532.7400      0.0000      0.0000
+    109.0000   1532.6600      0.0000      0.0000
+    109.5000   1532.5100      0.0000      0.0000
+    110.1000   1532.2900      0.0000      0.0000
+    110.6000   1532.1400      0.0000      0.0000
+    111.2000   1532.0900      0.0000      0.0000
+    111.8000   1532.0000      0.0000      0.0000
+    112.3000   1531.8300      0.0000      0.0000
+    112.9000   1531.7200      0.0000      0.0000
+    113.4000   1531.6600      0.0000      0.0000
+    114.0000   1531.6100      0.0000      0.0000
+    114.5000   1531.5500      0.0000      0.0000
+    115.1000   1531.5100      0.0000      0.0000
+    115.6000   1531.4900      0.0000      0.0000
+    116.2000   1531.4500      0.0000      0.0000
+    116.7000   1531.3900      0.0000      0.0000
+    117.3000   1531.3400      0.0000      0.0000
+    117.8000   1531.3100      0.0000      0.0000
+    118.4000   1531.2500      0.0000      0.0000
+    118.9000   1531.1900      0.0000      0.0000
+    119.5000   1531.0900      0.0000      0.0000
+    120.0000   1530.8500      0.0000      0.0000
+    120.6000   1530.6400      0.0000      0.0000
+    121.1000   1530.5100      0.0000      0.0000
+    121.7000   1530.4700      0.0000      0.0000
+    122.3000   1530.4700      0.0000      0.0000
+    122.8000   1530.4600      0.0000      0.0000
+    123.4000   1530.4300      0.0000      0.0000
+    123.9000   1530.3600      0.0000      0.0000
+    124.5000   1530.2400      0.0000      0.0000
+    125.0000   1530.1600      0.0000      0.0000
+    125.6000   1530.0200      0.0000      0.0000
+    126.1000   1529.9200      0.0000      0.0000
+    126.7000   1529.8400      0.0000      0.0000
+    127.2000   1529.8200      0.0000      0.0000
+    127.8000   1529.7900      0.0000      0.0000
+    128.3000   1529.7700      0.0000      0.0000
+    128.9000   1529.7700      0.0000      0.0000
+    129.4000   1529.6900      0.0000      0.0000
+    130.0000   1529.5400      0.0000      0.0000
+    130.5000   1529.4200      0.0000      0.0000
+    131.1000   1529.3100      0.0000      0.0000
+    131.6000   1529.2400      0.0000      0.0000
+    132.2000   1529.1600      0.0000      0.0000
+    132.7000   1529.1300      0.0000      0.0000
+    133.3000   1529.1000      0.0000      0.0000
+    133.8000   1529.0600      0.0000      0.0000
+    134.4000   1529.0100      0.0000      0.0000
+    135.0000   1528.9900      0.0000      0.0000
+    135.5000   1528.9600      0.0000      0.0000
+    136.1000   1528.9300      0.0000      0.0000
+    136.6000   1528.8800      0.0000      0.0000
+    137.2000   1528.8200      0.0000      0.0000
+    137.7000   1528.7700      0.0000      0.0000
+    138.3000   1528.7200      0.0000      0.0000
+    138.8000   1528.6800      0.0000      0.0000
+    139.4000   1528.6300      0.0000      0.0000
+    139.9000   1528.5800      0.0000      0.0000
+    140.5000   1528.5100      0.0000      0.0000
+    141.0000   1528.4500      0.0000      0.0000
+    141.6000   1528.3600      0.0000      0.0000
+    142.1000   1528.2100      0.0000      0.0000
+    142.7000   1528.1300      0.0000      0.0000
+    143.2000   1528.0600      0.0000      0.0000
+    143.8000   1528.0000      0.0000      0.0000
+    144.3000   1527.9700      0.0000      0.0000
+    144.9000   1527.9200      0.0000      0.0000
+    145.4000   1527.8600      0.0000      0.0000
+    146.0000   1527.8200      0.0000      0.0000
+    146.5000   1527.7400      0.0000      0.0000
+    147.1000   1527.6800      0.0000      0.0000
+    147.6000   1527.6000      0.0000      0.0000
+    148.2000   1527.5800      0.0000      0.0000
+    148.7000   1527.5700      0.0000      0.0000
+    149.3000   1527.5800      0.0000      0.0000
+    149.8000   1527.4900      0.0000      0.0000
+    150.4000   1527.2300      0.0000      0.0000
+    150.9000   1527.1000      0.0000      0.0000
+    151.5000   1527.0500      0.0000      0.0000
+    152.0000   1527.0000      0.0000      0.0000
+    152.6000   1526.9400      0.0000      0.0000
+    153.1000   1526.9100      0.0000      0.0000
+    153.7000   1526.8400      0.0000      0.0000
+    154.2000   1526.6500      0.0000      0.0000
+    154.8000   1526.5300      0.0000      0.0000
+    155.3000   1526.4300      0.0000      0.0000
+    155.9000   1526.3400      0.0000      0.0000
+    156.5000   1526.2900      0.0000      0.0000
+    157.0000   1526.2700      0.0000      0.0000
+    157.6000   1526.2600      0.0000      0.0000
+    158.1000   1526.2100      0.0000      0.0000
+    158.7000   1526.2000      0.0000      0.0000
+    159.2000   1526.1500      0.0000      0.0000
+    159.8000   1526.0800      0.0000      0.0000
+    160.3000   1526.0200      0.0000      0.0000
+    160.9000   1526.0200      0.0000      0.0000
+    161.4000   1526.0100      0.0000      0.0000
+    162.0000   1525.9800      0.0000      0.0000
+    162.5000   1525.9200      0.0000      0.0000
+    163.1000   1525.8500      0.0000      0.0000
+    163.6000   1525.8200      0.0000      0.0000
+    164.2000   1525.7800      0.0000      0.0000
+    164.7000   1525.7500      0.0000      0.0000
+    165.3000   1525.6700      0.0000      0.0000
+    165.8000   1525.5800      0.0000      0.0000
+    166.4000   1525.4500      0.0000      0.0000
+    166.9000   1525.3100      0.0000      0.0000
+    167.5000   1525.1800      0.0000      0.0000
+    168.0000   1525.0900      0.0000      0.0000
+    168.6000   1525.0100      0.0000      0.0000
+    169.1000   1524.9700      0.0000      0.0000
+    169.7000   1524.8900      0.0000      0.0000
+    170.2000   1524.7000      0.0000      0.0000
+    170.8000   1524.4500      0.0000      0.0000
+    171.3000   1524.1900      0.0000      0.0000
+    171.9000   1524.0000      0.0000      0.0000
+    172.4000   1523.8900      0.0000      0.0000
+    173.0000   1523.7700      0.0000      0.0000
+    173.5000   1523.6100      0.0000      0.0000
+    174.1000   1523.4800      0.0000      0.0000
+    174.6000   1523.4100      0.0000      0.0000
+    175.2000   1523.3900      0.0000      0.0000
+    175.7000   1523.3200      0.0000      0.0000
+    176.3000   1523.2800      0.0000      0.0000
+    176.8000   1523.2600      0.0000      0.0000
+    177.4000   1523.2000      0.0000      0.0000
+    177.9000   1523.1800      0.0000      0.0000
+    178.5000   1523.1600      0.0000      0.0000
+    179.0000   1523.1400      0.0000      0.0000
+    179.6000   1523.1200      0.0000      0.0000
+    180.1000   1523.0800      0.0000      0.0000
+    180.6000   1523.0500      0.0000      0.0000
+    181.2000   1523.0000      0.0000      0.0000
+    181.7000   1522.8700      0.0000      0.0000
+    182.3000   1522.7600      0.0000      0.0000
+    182.8000   1522.5600      0.0000      0.0000
+    183.4000   1522.3200      0.0000      0.0000
+    183.9000   1522.2500      0.0000      0.0000
+    184.5000   1522.2100      0.0000      0.0000
+    185.0000   1522.2000      0.0000      0.0000
+    185.6000   1522.2200      0.0000      0.0000
+    186.1000   1522.3900      0.0000      0.0000
+    186.7000   1522.7900      0.0000      0.0000
+    187.2000   1522.9700      0.0000      0.0000
+    187.8000   1523.0100      0.0000      0.0000
+    188.3000   1523.0400      0.0000      0.0000
+    188.9000   1523.1600      0.0000      0.0000
+    189.4000   1523.2000      0.0000      0.0000
+    190.0000   1523.1800      0.0000      0.0000
+    190.5000   1523.1800      0.0000      0.0000
+    191.1000   1523.1700      0.0000      0.0000
+    191.6000   1523.1400      0.0000      0.0000
+    192.2000   1523.0100      0.0000      0.0000
+    192.7000   1522.8600      0.0000      0.0000
+    193.3000   1522.7800      0.0000      0.0000
+    193.8000   1522.6700      0.0000      0.0000
+    194.4000   1522.5700      0.0000      0.0000
+    194.9000   1522.4700      0.0000      0.0000
+    195.5000   1522.3700      0.0000      0.0000
+    196.0000   1522.2300      0.0000      0.0000
+    196.6000   1522.1300      0.0000      0.0000
+    197.1000   1521.9800      0.0000      0.0000
+    197.7000   1521.7700      0.0000      0.0000
+    198.2000   1521.6300      0.0000      0.0000
+    198.8000   1521.4400      0.0000      0.0000
+    199.3000   1521.2600      0.0000      0.0000
+    199.9000   1521.1500      0.0000      0.0000
+    200.4000   1521.0900      0.0000      0.0000
+    201.0000   1520.9900      0.0000      0.0000
+    201.5000   1520.8200      0.0000      0.0000
+    202.1000   1520.6000      0.0000      0.0000
+    202.6000   1520.4400      0.0000      0.0000
+    203.1000   1520.2600      0.0000      0.0000
+    203.7000   1520.0400      0.0000      0.0000
+    204.2000   1519.8200      0.0000      0.0000
+    204.8000   1519.5700      0.0000      0.0000
+    205.3000   1519.4000      0.0000      0.0000
+    205.9000   1519.2400      0.0000      0.0000
+    206.4000   1519.1400      0.0000      0.0000
+    207.0000   1518.9300      0.0000      0.0000
+    207.5000   1518.6600      0.0000      0.0000
+    208.1000   1518.4200      0.0000      0.0000
+    208.6000   1518.2300      0.0000      0.0000
+    209.2000   1518.1100      0.0000      0.0000
+    209.7000   1518.0700      0.0000      0.0000
+    210.3000   1518.0000      0.0000      0.0000
+    210.8000   1517.9100      0.0000      0.0000
+    211.4000   1517.8100      0.0000      0.0000
+    211.9000   1517.4900      0.0000      0.0000
+    212.5000   1517.1200      0.0000      0.0000
+    213.0000   1516.9500      0.0000      0.0000
+    213.6000   1516.7900      0.0000      0.0000
+    214.1000   1516.6900      0.0000      0.0000
+    214.7000   1516.6200      0.0000      0.0000
+    215.2000   1516.4800      0.0000      0.0000
+    215.7000   1516.3200      0.0000      0.0000
+    216.3000   1516.2400      0.0000      0.0000
+    216.8000   1516.1000      0.0000      0.0000
+    217.4000   1515.7600      0.0000      0.0000
+    217.9000   1515.4800      0.0000      0.0000
+    218.5000   1515.3500      0.0000      0.0000
+    219.0000   1515.0600      0.0000      0.0000
+    219.6000   1514.7900      0.0000      0.0000
+    220.1000   1514.3400      0.0000      0.0000
+    220.7000   1514.0700      0.0000      0.0000
+    221.2000   1513.9100      0.0000      0.0000
+    221.8000   1513.8000      0.0000      0.0000
+    222.3000   1513.7400      0.0000      0.0000
+    222.9000   1513.7200      0.0000      0.0000
+    223.4000   1513.6300      0.0000      0.0000
+    224.0000   1513.4800      0.0000      0.0000
+    224.5000   1513.3600      0.0000      0.0000
+    225.0000   1513.2900      0.0000      0.0000
+    225.6000   1513.2200      0.0000      0.0000
+    226.1000   1512.9900      0.0000      0.0000
+    226.7000   1512.5900      0.0000      0.0000
+    227.2000   1512.3000      0.0000      0.0000
+    227.8000   1512.0100      0.0000      0.0000
+    228.3000   1511.8200      0.0000      0.0000
+    228.9000   1511.7100      0.0000      0.0000
+    229.4000   1511.5400      0.0000      0.0000
+    230.0000   1511.4200      0.0000      0.0000
+    230.5000   1511.2500      0.0000      0.0000
+    231.1000   1511.0400      0.0000      0.0000
+    231.6000   1510.8100      0.0000      0.0000
+    232.2000   1510.4300      0.0000      0.0000
+    232.7000   1510.0000      0.0000      0.0000
+    233.2000   1509.6300      0.0000      0.0000
+    233.8000   1509.3600      0.0000      0.0000
+    234.3000   1509.2100      0.0000      0.0000
+    234.9000   1509.1700      0.0000      0.0000
+    235.4000   1509.1600      0.0000      0.0000
+    236.0000   1509.1300      0.0000      0.0000
+    236.5000   1509.0000      0.0000      0.0000
+    237.1000   1508.9500      0.0000      0.0000
+    237.6000   1508.9300      0.0000      0.0000
+    238.2000   1508.9400      0.0000      0.0000
+    238.7000   1508.9300      0.0000      0.0000
+    239.3000   1508.8700      0.0000      0.0000
+    239.8000   1508.7600      0.0000      0.0000
+    240.4000   1508.5900      0.0000      0.0000
+    240.9000   1508.4700      0.0000      0.0000
+    241.4000   1508.4000      0.0000      0.0000
+    242.0000   1508.3100      0.0000      0.0000
+    242.5000   1508.1900      0.0000      0.0000
+    243.1000   1508.0600      0.0000      0.0000
+    243.6000   1507.9400      0.0000      0.0000
+    244.2000   1507.6800      0.0000      0.0000
+    244.7000   1507.4100      0.0000      0.0000
+    245.3000   1507.2300      0.0000      0.0000
+    245.8000   1507.1300      0.0000      0.0000
+    246.4000   1507.0200      0.0000      0.0000
+    246.9000   1506.8700      0.0000      0.0000
+    247.4000   1506.7600      0.0000      0.0000
+    248.0000   1506.5200      0.0000      0.0000
+    248.5000   1506.1800      0.0000      0.0000
+    249.1000   1505.7400      0.0000      0.0000
+    249.6000   1505.3800      0.0000      0.0000
+    250.2000   1505.2200      0.0000      0.0000
+    250.7000   1505.0700      0.0000      0.0000
+    251.3000   1505.0400      0.0000      0.0000
+    251.8000   1505.0600      0.0000      0.0000
+    252.4000   1505.0700      0.0000      0.0000
+    252.9000   1505.0700      0.0000      0.0000
+    253.4000   1505.1200      0.0000      0.0000
+    254.0000   1505.0100      0.0000      0.0000
+    254.5000   1504.7900      0.0000      0.0000
+    255.1000   1504.5300      0.0000      0.0000
+    255.6000   1504.3800      0.0000      0.0000
+    256.2000   1504.3200      0.0000      0.0000
+    256.7000   1504.1500      0.0000      0.0000
+    257.3000   1504.0100      0.0000      0.0000
+    257.8000   1503.8700      0.0000      0.0000
+    258.4000   1503.7400      0.0000      0.0000
+    258.9000   1503.5800      0.0000      0.0000
+    259.4000   1503.3600      0.0000      0.0000
+    260.0000   1503.1500      0.0000      0.0000
+    260.5000   1503.0400      0.0000      0.0000
+    261.1000   1502.9100      0.0000      0.0000
+    261.6000   1502.8100      0.0000      0.0000
+    262.2000   1502.7600      0.0000      0.0000
+    262.7000   1502.6500      0.0000      0.0000
+    263.3000   1502.4400      0.0000      0.0000
+    263.8000   1502.3200      0.0000      0.0000
+    264.4000   1502.2900      0.0000      0.0000
+    264.9000   1502.3000      0.0000      0.0000
+    265.4000   1502.3200      0.0000      0.0000
+    266.0000   1502.3200      0.0000      0.0000
+    266.5000   1502.3200      0.0000      0.0000
+    267.1000   1502.2200      0.0000      0.0000
+    267.6000   1502.0600      0.0000      0.0000
+    268.2000   1501.9700      0.0000      0.0000
+    268.7000   1501.8900      0.0000      0.0000
+    269.3000   1501.8400      0.0000      0.0000
+    269.8000   1501.7300      0.0000      0.0000
+    270.3000   1501.4700      0.0000      0.0000
+    270.9000   1501.2600      0.0000      0.0000
+    271.4000   1501.1500      0.0000      0.0000
+    272.0000   1501.0700      0.0000      0.0000
+    272.5000   1501.0600      0.0000      0.0000
+    273.1000   1501.0400      0.0000      0.0000
+    273.6000   1500.9700      0.0000      0.0000
+    274.2000   1500.9400      0.0000      0.0000
+    274.7000   1500.8100      0.0000      0.0000
+    275.2000   1500.5600      0.0000      0.0000
+    275.8000   1500.4200      0.0000      0.0000
+    276.3000   1500.3600      0.0000      0.0000
+    276.9000   1500.3100      0.0000      0.0000
+    277.4000   1500.2600      0.0000      0.0000
+    278.0000   1500.1800      0.0000      0.0000
+    278.5000   1500.0500      0.0000      0.0000
+    279.0000   1499.9000      0.0000      0.0000
+    279.6000   1499.8100      0.0000      0.0000
+    280.1000   1499.7100      0.0000      0.0000
+    280.7000   1499.6700      0.0000      0.0000
+    281.2000   1499.6000      0.0000      0.0000
+    281.8000   1499.5300      0.0000      0.0000
+    282.3000   1499.4200      0.0000      0.0000
+    282.9000   1499.2600      0.0000      0.0000
+    283.4000   1499.0900      0.0000      0.0000
+    283.9000   1498.8900      0.0000      0.0000
+    284.5000   1498.6200      0.0000      0.0000
+    285.0000   1498.4500      0.0000      0.0000
+    285.6000   1498.3800      0.0000      0.0000
+    286.1000   1498.3300      0.0000      0.0000
+    286.7000   1498.2400      0.0000      0.0000
+    287.2000   1498.1300      0.0000      0.0000
+    287.8000   1497.9900      0.0000      0.0000
+    288.3000   1497.7900      0.0000      0.0000
+    288.8000   1497.5900      0.0000      0.0000
+    289.4000   1497.5300      0.0000      0.0000
+    289.9000   1497.5300      0.0000      0.0000
+    290.5000   1497.5300      0.0000      0.0000
+    291.0000   1497.5100      0.0000      0.0000
+    291.6000   1497.4700      0.0000      0.0000
+    292.1000   1497.4500      0.0000      0.0000
+    292.6000   1497.4200      0.0000      0.0000
+    293.2000   1497.3600      0.0000      0.0000
+    293.7000   1497.2900      0.0000      0.0000
+    294.3000   1497.2400      0.0000      0.0000
+    294.8000   1497.2200      0.0000      0.0000
+    295.4000   1497.2000      0.0000      0.0000
+    295.9000   1497.2000      0.0000      0.0000
+    296.4000   1497.1700      0.0000      0.0000
+    297.0000   1497.1000      0.0000      0.0000
+    297.5000   1497.0200      0.0000      0.0000
+    298.1000   1496.9700      0.0000      0.0000
+    298.6000   1496.8700      0.0000      0.0000
+    299.2000   1496.8100      0.0000      0.0000
+    299.7000   1496.7900      0.0000      0.0000
+    300.2000   1496.6400      0.0000      0.0000
+    300.8000   1496.5300      0.0000      0.0000
+    301.3000   1496.3400      0.0000      0.0000
+    301.9000   1496.2200      0.0000      0.0000
+    302.4000   1496.1500      0.0000      0.0000
+    303.0000   1496.1100      0.0000      0.0000
+    303.5000   1496.0200      0.0000      0.0000
+    304.0000   1495.9300      0.0000      0.0000
+    304.6000   1495.9200      0.0000      0.0000
+    305.1000   1495.8900      0.0000      0.0000
+    305.7000   1495.8300      0.0000      0.0000
+    306.2000   1495.7500      0.0000      0.0000
+    306.8000   1495.7100      0.0000      0.0000
+    307.3000   1495.6400      0.0000      0.0000
+    307.8000   1495.6100      0.0000      0.0000
+    308.4000   1495.5700      0.0000      0.0000
+    308.9000   1495.5300      0.0000      0.0000
+    309.5000   1495.5000      0.0000      0.0000
+    310.0000   1495.4800      0.0000      0.0000
+    310.6000   1495.4500      0.0000      0.0000
+    311.1000   1495.4100      0.0000      0.0000
+    311.6000   1495.3600      0.0000      0.0000
+    312.2000   1495.3100      0.0000      0.0000
+    312.7000   1495.2700      0.0000      0.0000
+    313.3000   1495.1800      0.0000      0.0000
+    313.8000   1495.0200      0.0000      0.0000
+    314.3000   1494.9400      0.0000      0.0000
+    314.9000   1494.8900      0.0000      0.0000
+    315.4000   1494.8500      0.0000      0.0000
+    316.0000   1494.8300      0.0000      0.0000
+    316.5000   1494.8100      0.0000      0.0000
+    317.1000   1494.8000      0.0000      0.0000
+    317.6000   1494.7900      0.0000      0.0000
+    318.1000   1494.7400      0.0000      0.0000
+    318.7000   1494.7000      0.0000      0.0000
+    319.2000   1494.6700      0.0000      0.0000
+    319.8000   1494.6600      0.0000      0.0000
+    320.3000   1494.6400      0.0000      0.0000
+    320.9000   1494.6200      0.0000      0.0000
+    321.4000   1494.5600      0.0000      0.0000
+    321.9000   1494.4700      0.0000      0.0000
+    322.5000   1494.4200      0.0000      0.0000
+    323.0000   1494.3800      0.0000      0.0000
+    323.6000   1494.3600      0.0000      0.0000
+    324.1000   1494.3600      0.0000      0.0000
+    324.6000   1494.3500      0.0000      0.0000
+    325.2000   1494.3500      0.0000      0.0000
+    325.7000   1494.3500      0.0000      0.0000
+    326.3000   1494.3500      0.0000      0.0000
+    326.8000   1494.3600      0.0000      0.0000
+    327.3000   1494.3600      0.0000      0.0000
+    327.9000   1494.3500      0.0000      0.0000
+    328.4000   1494.3200      0.0000      0.0000
+    329.0000   1494.2300      0.0000      0.0000
+    329.5000   1494.1500      0.0000      0.0000
+    330.1000   1494.0900      0.0000      0.0000
+    330.6000   1493.9100      0.0000      0.0000
+    331.1000   1493.6700      0.0000      0.0000
+    331.7000   1493.5000      0.0000      0.0000
+    332.2000   1493.4400      0.0000      0.0000
+    332.8000   1493.3800      0.0000      0.0000
+    333.3000   1493.3000      0.0000      0.0000
+    333.8000   1493.1100      0.0000      0.0000
+    334.4000   1492.9300      0.0000      0.0000
+    334.9000   1492.8500      0.0000      0.0000
+    335.5000   1492.8200      0.0000      0.0000
+    336.0000   1492.8300      0.0000      0.0000
+    336.5000   1492.8400      0.0000      0.0000
+    337.1000   1492.8300      0.0000      0.0000
+    337.6000   1492.7900      0.0000      0.0000
+    338.2000   1492.7300      0.0000      0.0000
+    338.7000   1492.6900      0.0000      0.0000
+    339.3000   1492.6700      0.0000      0.0000
+    339.8000   1492.6600      0.0000      0.0000
+    340.3000   1492.6600      0.0000      0.0000
+    340.9000   1492.6300      0.0000      0.0000
+    341.4000   1492.6500      0.0000      0.0000
+    342.0000   1492.6200      0.0000      0.0000
+    342.5000   1492.4500      0.0000      0.0000
+    343.0000   1492.4100      0.0000      0.0000
+    343.6000   1492.3100      0.0000      0.0000
+    344.1000   1492.2100      0.0000      0.0000
+    344.7000   1492.1600      0.0000      0.0000
+    345.2000   1492.1300      0.0000      0.0000
+    345.7000   1492.1000      0.0000      0.0000
+    346.3000   1492.0900      0.0000      0.0000
+    346.8000   1492.1000      0.0000      0.0000
+    347.4000   1492.0900      0.0000      0.0000
+    347.9000   1492.1000      0.0000      0.0000
+    348.4000   1492.0600      0.0000      0.0000
+    349.0000   1492.0000      0.0000      0.0000
+    349.5000   1491.9800      0.0000      0.0000
+    350.1000   1491.9500      0.0000      0.0000
+    350.6000   1491.9200      0.0000      0.0000
+    351.1000   1491.8900      0.0000      0.0000
+    351.7000   1491.8900      0.0000      0.0000
+    352.2000   1491.8500      0.0000      0.0000
+    352.8000   1491.6800      0.0000      0.0000
+    353.3000   1491.5700      0.0000      0.0000
+    353.8000   1491.5100      0.0000      0.0000
+    354.4000   1491.2900      0.0000      0.0000
+    354.9000   1491.0700      0.0000      0.0000
+    355.5000   1490.9900      0.0000      0.0000
+    356.0000   1490.9500      0.0000      0.0000
+    356.5000   1490.9000      0.0000      0.0000
+    357.1000   1490.8700      0.0000      0.0000
+    357.6000   1490.8200      0.0000      0.0000
+    358.2000   1490.8200      0.0000      0.0000
+    358.7000   1490.8200      0.0000      0.0000
+    359.2000   1490.8300      0.0000      0.0000
+    359.8000   1490.8100      0.0000      0.0000
+    360.3000   1490.8100      0.0000      0.0000
+    360.9000   1490.8100      0.0000      0.0000
+    361.4000   1490.8200      0.0000      0.0000
+    361.9000   1490.8100      0.0000      0.0000
+    362.5000   1490.8100      0.0000      0.0000
+    363.0000   1490.8200      0.0000      0.0000
+    363.6000   1490.8000      0.0000      0.0000
+    364.1000   1490.7100      0.0000      0.0000
+    364.6000   1490.6700      0.0000      0.0000
+    365.2000   1490.5500      0.0000      0.0000
+    365.7000   1490.4500      0.0000      0.0000
+    366.3000   1490.3100      0.0000      0.0000
+    366.8000   1490.1500      0.0000      0.0000
+    367.3000   1490.0700      0.0000      0.0000
+    367.9000   1490.0400      0.0000      0.0000
+    368.4000   1490.0100      0.0000      0.0000
+    368.9000   1489.9200      0.0000      0.0000
+    369.5000   1489.8500      0.0000      0.0000
+    370.0000   1489.8500      0.0000      0.0000
+    370.6000   1489.8500      0.0000      0.0000
+    371.1000   1489.8000      0.0000      0.0000
+    371.6000   1489.6800      0.0000      0.0000
+    372.2000   1489.7100      0.0000      0.0000
+    372.7000   1489.6400      0.0000      0.0000
+    373.3000   1489.6000      0.0000      0.0000
+    373.8000   1489.4900      0.0000      0.0000
+    374.3000   1489.3900      0.0000      0.0000
+    374.9000   1489.2100      0.0000      0.0000
+    375.4000   1489.0700      0.0000      0.0000
+    376.0000   1489.0300      0.0000      0.0000
+    376.5000   1489.0000      0.0000      0.0000
+    377.0000   1488.9900      0.0000      0.0000
+    377.6000   1489.0000      0.0000      0.0000
+    378.1000   1488.9700      0.0000      0.0000
+    378.6000   1488.9700      0.0000      0.0000
+    379.2000   1488.9700      0.0000      0.0000
+    379.7000   1488.9500      0.0000      0.0000
+    380.3000   1488.9500      0.0000      0.0000
+    380.8000   1488.9400      0.0000      0.0000
+    381.3000   1488.7900      0.0000      0.0000
+    381.9000   1488.8100      0.0000      0.0000
+    382.4000   1488.9700      0.0000      0.0000
+    383.0000   1489.0100      0.0000      0.0000
+    383.5000   1489.0200      0.0000      0.0000
+    384.0000   1489.0100      0.0000      0.0000
+    384.6000   1489.0200      0.0000      0.0000
+    385.1000   1489.0200      0.0000      0.0000
+    385.6000   1489.0200      0.0000      0.0000
+    386.2000   1489.0100      0.0000      0.0000
+    386.7000   1489.0200      0.0000      0.0000
+    387.3000   1489.0000      0.0000      0.0000
+    387.8000   1488.9900      0.0000      0.0000
+    388.3000   1488.9600      0.0000      0.0000
+    388.9000   1488.9300      0.0000      0.0000
+    389.4000   1488.9000      0.0000      0.0000
+    390.0000   1488.9100      0.0000      0.0000
+    390.5000   1488.8800      0.0000      0.0000
+    391.0000   1488.8600      0.0000      0.0000
+    391.6000   1488.8100      0.0000      0.0000
+    392.1000   1488.8100      0.0000      0.0000
+    392.6000   1488.7900      0.0000      0.0000
+    393.2000   1488.7800      0.0000      0.0000
+    393.7000   1488.7300      0.0000      0.0000
+    394.3000   1488.6500      0.0000      0.0000
+    394.8000   1488.6600      0.0000      0.0000
+    395.3000   1488.6700      0.0000      0.0000
+    395.9000   1488.6400      0.0000      0.0000
+    396.4000   1488.6500      0.0000      0.0000
+    396.9000   1488.6300      0.0000      0.0000
+    397.5000   1488.5900      0.0000      0.0000
+    398.0000   1488.5500      0.0000      0.0000
+    398.6000   1488.5300      0.0000      0.0000
+    399.1000   1488.4500      0.0000      0.0000
+    399.6000   1488.3800      0.0000      0.0000
+    400.2000   1488.3300      0.0000      0.0000
+    400.7000   1488.3300      0.0000      0.0000
+    401.2000   1488.3300      0.0000      0.0000
+    401.8000   1488.3400      0.0000      0.0000
+    402.3000   1488.3500      0.0000      0.0000
+    402.9000   1488.3500      0.0000      0.0000
+    403.4000   1488.3600      0.0000      0.0000
+    403.9000   1488.3600      0.0000      0.0000
+    404.5000   1488.3800      0.0000      0.0000
+    405.0000   1488.3700      0.0000      0.0000
+    405.5000   1488.3600      0.0000      0.0000
+    406.1000   1488.3600      0.0000      0.0000
+    406.6000   1488.3500      0.0000      0.0000
+    407.2000   1488.3100      0.0000      0.0000
+    407.7000   1488.2600      0.0000      0.0000
+    408.2000   1488.2500      0.0000      0.0000
+    408.8000   1488.2000      0.0000      0.0000
+    409.3000   1488.1600      0.0000      0.0000
+    409.8000   1488.1200      0.0000      0.0000
+    410.4000   1488.0800      0.0000      0.0000
+    410.9000   1488.0000      0.0000      0.0000
+    411.4000   1487.9100      0.0000      0.0000
+    412.0000   1487.8900      0.0000      0.0000
+    412.5000   1487.8100      0.0000      0.0000
+    413.1000   1487.5100      0.0000      0.0000
+    413.6000   1487.3400      0.0000      0.0000
+    414.1000   1487.2700      0.0000      0.0000
+    414.7000   1487.2400      0.0000      0.0000
+    415.2000   1487.2000      0.0000      0.0000
+    415.7000   1487.1700      0.0000      0.0000
+    416.3000   1487.1600      0.0000      0.0000
+    416.8000   1487.1500      0.0000      0.0000
+    417.3000   1487.1600      0.0000      0.0000
+    417.9000   1486.8700      0.0000      0.0000
+    418.4000   1486.5100      0.0000      0.0000
+    419.0000   1486.4100      0.0000      0.0000
+    419.5000   1486.3900      0.0000      0.0000
+    420.0000   1486.4000      0.0000      0.0000
+    420.6000   1486.4100      0.0000      0.0000
+    421.1000   1486.4100      0.0000      0.0000
+    421.6000   1486.3200      0.0000      0.0000
+    422.2000   1486.2000      0.0000      0.0000
+    422.7000   1486.0000      0.0000      0.0000
+    423.2000   1485.8500      0.0000      0.0000
+    423.8000   1485.6500      0.0000      0.0000
+    424.3000   1485.5800      0.0000      0.0000
+    424.9000   1485.5200      0.0000      0.0000
+    425.4000   1485.5600      0.0000      0.0000
+    425.9000   1485.5800      0.0000      0.0000
+    426.5000   1485.6200      0.0000      0.0000
+    427.0000   1485.5700      0.0000      0.0000
+    427.5000   1485.5300      0.0000      0.0000
+    428.1000   1485.5400      0.0000      0.0000
+    428.6000   1485.5500      0.0000      0.0000
+    429.1000   1485.5400      0.0000      0.0000
+    429.7000   1485.5700      0.0000      0.0000
+    430.2000   1485.6300      0.0000      0.0000
+    430.8000   1485.6600      0.0000      0.0000
+    431.3000   1485.7500      0.0000      0.0000
+    431.8000   1485.8000      0.0000      0.0000
+    432.4000   1485.8300      0.0000      0.0000
+    432.9000   1485.8400      0.0000      0.0000
+    433.4000   1485.7200      0.0000      0.0000
+    434.0000   1485.6800      0.0000      0.0000
+    434.5000   1485.7400      0.0000      0.0000
+    435.0000   1485.7800      0.0000      0.0000
+    435.6000   1485.7600      0.0000      0.0000
+    436.1000   1485.6800      0.0000      0.0000
+    436.6000   1485.5800      0.0000      0.0000
+    437.2000   1485.4200      0.0000      0.0000
+    437.7000   1485.3000      0.0000      0.0000
+    438.2000   1485.3000      0.0000      0.0000
+    438.8000   1485.3000      0.0000      0.0000
+    439.3000   1485.3000      0.0000      0.0000
+    439.9000   1485.2900      0.0000      0.0000
+    440.4000   1485.3800      0.0000      0.0000
+    440.9000   1485.5000      0.0000      0.0000
+    441.5000   1485.6000      0.0000      0.0000
+    442.0000   1485.7000      0.0000      0.0000
+    442.5000   1485.7800      0.0000      0.0000
+    443.1000   1485.8200      0.0000      0.0000
+    443.6000   1485.8400      0.0000      0.0000
+    444.1000   1485.8400      0.0000      0.0000
+    444.7000   1485.8500      0.0000      0.0000
+    445.2000   1485.8700      0.0000      0.0000
+    445.7000   1485.8800      0.0000      0.0000
+    446.3000   1485.9000      0.0000      0.0000
+    446.8000   1485.9000      0.0000      0.0000
+    447.3000   1485.9100      0.0000      0.0000
+    447.9000   1485.9200      0.0000      0.0000
+    448.4000   1485.9400      0.0000      0.0000
+    448.9000   1485.9500      0.0000      0.0000
+    449.5000   1485.9500      0.0000      0.0000
+    450.0000   1485.9600      0.0000      0.0000
+    450.6000   1485.9600      0.0000      0.0000
+    451.1000   1485.9700      0.0000      0.0000
+    451.6000   1485.9900      0.0000      0.0000
+    452.2000   1485.9500      0.0000      0.0000
+    452.7000   1485.9400      0.0000      0.0000
+    453.2000   1485.9100      0.0000      0.0000
+    453.8000   1485.8100      0.0000      0.0000
+    454.3000   1485.8000      0.0000      0.0000
+    454.8000   1485.7500      0.0000      0.0000
+    455.4000   1485.7700      0.0000      0.0000
+    455.9000   1485.7900      0.0000      0.0000
+    456.4000   1485.7700      0.0000      0.0000
+    457.0000   1485.8000      0.0000      0.0000
+    457.5000   1485.8100      0.0000      0.0000
+    458.0000   1485.8200      0.0000      0.0000
+    458.6000   1485.8400      0.0000      0.0000
+    459.1000   1485.8500      0.0000      0.0000
+    459.6000   1485.8500      0.0000      0.0000
+    460.2000   1485.8700      0.0000      0.0000
+    460.7000   1485.9000      0.0000      0.0000
+    461.2000   1485.9200      0.0000      0.0000
+    461.8000   1485.9400      0.0000      0.0000
+    462.3000   1485.9400      0.0000      0.0000
+    462.8000   1485.9500      0.0000      0.0000
+    463.4000   1485.9600      0.0000      0.0000
+    463.9000   1485.9500      0.0000      0.0000
+    464.4000   1485.9400      0.0000      0.0000
+    465.0000   1485.9400      0.0000      0.0000
+    465.5000   1485.9900      0.0000      0.0000
+    466.0000   1486.0200      0.0000      0.0000
+    466.6000   1486.0800      0.0000      0.0000
+    467.1000   1486.1200      0.0000      0.0000
+    467.6000   1486.1400      0.0000      0.0000
+    468.2000   1486.2000      0.0000      0.0000
+    468.7000   1486.2600      0.0000      0.0000
+    469.2000   1486.2700      0.0000      0.0000
+    469.8000   1486.2800      0.0000      0.0000
+    470.3000   1486.2600      0.0000      0.0000
+    470.8000   1486.2400      0.0000      0.0000
+    471.4000   1486.2500      0.0000      0.0000
+    471.9000   1486.2400      0.0000      0.0000
+    472.4000   1486.1900      0.0000      0.0000
+    473.0000   1485.9800      0.0000      0.0000
+    473.5000   1485.9000      0.0000      0.0000
+    474.0000   1485.8100      0.0000      0.0000
+    474.6000   1485.7200      0.0000      0.0000
+    475.1000   1485.5900      0.0000      0.0000
+    475.6000   1485.4200      0.0000      0.0000
+    476.2000   1485.2900      0.0000      0.0000
+    476.7000   1485.2400      0.0000      0.0000
+    477.2000   1485.1800      0.0000      0.0000
+    477.8000   1485.1000      0.0000      0.0000
+    478.3000   1484.9100      0.0000      0.0000
+    478.8000   1484.7900      0.0000      0.0000
+    479.4000   1484.7500      0.0000      0.0000
+    479.9000   1484.7400      0.0000      0.0000
+    480.4000   1484.8000      0.0000      0.0000
+    481.0000   1484.7700      0.0000      0.0000
+    481.5000   1484.7600      0.0000      0.0000
+    482.0000   1484.7600      0.0000      0.0000
+    482.6000   1484.7100      0.0000      0.0000
+    483.1000   1484.5800      0.0000      0.0000
+    483.6000   1484.5800      0.0000      0.0000
+    484.2000   1484.5800      0.0000      0.0000
+    484.7000   1484.5900      0.0000      0.0000
+    485.2000   1484.6300      0.0000      0.0000
+    485.8000   1484.6400      0.0000      0.0000
+    486.3000   1484.6400      0.0000      0.0000
+    486.8000   1484.4300      0.0000      0.0000
+    487.4000   1484.0800      0.0000      0.0000
+    487.9000   1483.8500      0.0000      0.0000
+    488.4000   1483.7600      0.0000      0.0000
+    489.0000   1483.7500      0.0000      0.0000
+    489.5000   1483.7500      0.0000      0.0000
+    490.0000   1483.7600      0.0000      0.0000
+    490.6000   1483.7700      0.0000      0.0000
+    491.1000   1483.7600      0.0000      0.0000
+    491.6000   1483.7800      0.0000      0.0000
+    492.2000   1483.7700      0.0000      0.0000
+    492.7000   1483.7700      0.0000      0.0000
+    493.2000   1483.7800      0.0000      0.0000
+    493.8000   1483.7800      0.0000      0.0000
+    494.3000   1483.7900      0.0000      0.0000
+    494.8000   1483.7900      0.0000      0.0000
+    495.4000   1483.7900      0.0000      0.0000
+    495.9000   1483.7400      0.0000      0.0000
+    496.4000   1483.7000      0.0000      0.0000
+    497.0000   1483.6500      0.0000      0.0000
+    497.5000   1483.6600      0.0000      0.0000
+    498.0000   1483.6600      0.0000      0.0000
+    498.5000   1483.6600      0.0000      0.0000
+    499.1000   1483.5700      0.0000      0.0000
+    499.6000   1483.5400      0.0000      0.0000
+    500.1000   1483.5100      0.0000      0.0000
+    500.7000   1483.4500      0.0000      0.0000
+    501.2000   1483.4200      0.0000      0.0000
+    501.7000   1483.4400      0.0000      0.0000
+    502.3000   1483.4300      0.0000      0.0000
+    502.8000   1483.3900      0.0000      0.0000
+    503.3000   1483.3500      0.0000      0.0000
+    503.9000   1483.3600      0.0000      0.0000
+    504.4000   1483.3500      0.0000      0.0000
+    504.9000   1483.3400      0.0000      0.0000
+    505.5000   1483.3300      0.0000      0.0000
+    506.0000   1483.3300      0.0000      0.0000
+    506.5000   1483.3100      0.0000      0.0000
+    507.1000   1483.3100      0.0000      0.0000
+    507.6000   1483.3100      0.0000      0.0000
+    508.1000   1483.3100      0.0000      0.0000
+    508.7000   1483.2900      0.0000      0.0000
+    509.2000   1483.2700      0.0000      0.0000
+    509.7000   1483.2800      0.0000      0.0000
+    510.2000   1483.2800      0.0000      0.0000
+    510.8000   1483.2900      0.0000      0.0000
+    511.3000   1483.3000      0.0000      0.0000
+    511.8000   1483.3100      0.0000      0.0000
+    512.4000   1483.3000      0.0000      0.0000
+    512.9000   1483.3000      0.0000      0.0000
+    513.4000   1483.3000      0.0000      0.0000
+    514.0000   1483.3400      0.0000      0.0000
+    514.5000   1483.3300      0.0000      0.0000
+    515.0000   1483.3500      0.0000      0.0000
+    515.6000   1483.3500      0.0000      0.0000
+    516.1000   1483.3600      0.0000      0.0000
+    516.6000   1483.3700      0.0000      0.0000
+    517.2000   1483.3800      0.0000      0.0000
+    517.7000   1483.3800      0.0000      0.0000
+    518.2000   1483.3900      0.0000      0.0000
+    518.7000   1483.3800      0.0000      0.0000
+    519.3000   1483.3600      0.0000      0.0000
+    519.8000   1483.3700      0.0000      0.0000
+    520.3000   1483.3500      0.0000      0.0000
+    520.9000   1483.3300      0.0000      0.0000
+    521.4000   1483.3100      0.0000      0.0000
+    521.9000   1483.3200      0.0000      0.0000
+    522.5000   1483.2900      0.0000      0.0000
+    523.0000   1483.2200      0.0000      0.0000
+    523.5000   1483.1800      0.0000      0.0000
+    524.1000   1483.1900      0.0000      0.0000
+    524.6000   1483.1700      0.0000      0.0000
+    525.1000   1483.1800      0.0000      0.0000
+    525.6000   1483.1800      0.0000      0.0000
+    526.2000   1483.2000      0.0000      0.0000
+    526.7000   1483.1900      0.0000      0.0000
+    527.2000   1483.2000      0.0000      0.0000
+    527.8000   1483.2000      0.0000      0.0000
+    528.3000   1483.2000      0.0000      0.0000
+    528.8000   1483.2300      0.0000      0.0000
+    529.4000   1483.1600      0.0000      0.0000
+    529.9000   1483.0400      0.0000      0.0000
+    530.4000   1482.9300      0.0000      0.0000
+    530.9000   1482.8700      0.0000      0.0000
+    531.5000   1482.8200      0.0000      0.0000
+    532.0000   1482.7300      0.0000      0.0000
+    532.5000   1482.7000      0.0000      0.0000
+    533.1000   1482.7000      0.0000      0.0000
+    533.6000   1482.7100      0.0000      0.0000
+    534.1000   1482.7100      0.0000      0.0000
+    534.7000   1482.7400      0.0000      0.0000
+    535.2000   1482.7200      0.0000      0.0000
+    535.7000   1482.7200      0.0000      0.0000
+    536.2000   1482.7100      0.0000      0.0000
+    536.8000   1482.7000      0.0000      0.0000
+    537.3000   1482.7100      0.0000      0.0000
+    537.8000   1482.7100      0.0000      0.0000
+    538.4000   1482.7100      0.0000      0.0000
+    538.9000   1482.7400      0.0000      0.0000
+    539.4000   1482.7500      0.0000      0.0000
+    540.0000   1482.7600      0.0000      0.0000
+    540.5000   1482.7600      0.0000      0.0000
+    541.0000   1482.7700      0.0000      0.0000
+    541.5000   1482.7800      0.0000      0.0000
+    542.1000   1482.7900      0.0000      0.0000
+    542.6000   1482.7800      0.0000      0.0000
+    543.1000   1482.7900      0.0000      0.0000
+    543.7000   1482.7800      0.0000      0.0000
+    544.2000   1482.7800      0.0000      0.0000
+    544.7000   1482.7800      0.0000      0.0000
+    545.2000   1482.7500      0.0000      0.0000
+    545.8000   1482.7500      0.0000      0.0000
+    546.3000   1482.7500      0.0000      0.0000
+    546.8000   1482.7400      0.0000      0.0000
+    547.4000   1482.7600      0.0000      0.0000
+    547.9000   1482.7800      0.0000      0.0000
+    548.4000   1482.8000      0.0000      0.0000
+    549.0000   1482.8600      0.0000      0.0000
+    549.5000   1482.8800      0.0000      0.0000
+    550.0000   1482.9100      0.0000      0.0000
+    550.5000   1482.9400      0.0000      0.0000
+    551.1000   1482.9700      0.0000      0.0000
+    551.6000   1482.9700      0.0000      0.0000
+    552.1000   1482.9800      0.0000      0.0000
+    552.7000   1483.0600      0.0000      0.0000
+    553.2000   1483.1100      0.0000      0.0000
+    553.7000   1483.1800      0.0000      0.0000
+    554.2000   1483.2500      0.0000      0.0000
+    554.8000   1483.2800      0.0000      0.0000
+    555.3000   1483.3400      0.0000      0.0000
+    555.8000   1483.3600      0.0000      0.0000
+    556.4000   1483.4100      0.0000      0.0000
+    556.9000   1483.4500      0.0000      0.0000
+    557.4000   1483.4700      0.0000      0.0000
+    557.9000   1483.4800      0.0000      0.0000
+    558.5000   1483.5000      0.0000      0.0000
+    559.0000   1483.4900      0.0000      0.0000
+    559.5000   1483.4500      0.0000      0.0000
+    560.1000   1483.4200      0.0000      0.0000
+    560.6000   1483.3500      0.0000      0.0000
+    561.1000   1483.2600      0.0000      0.0000
+    561.6000   1483.1900      0.0000      0.0000
+    562.2000   1483.1500      0.0000      0.0000
+    562.7000   1483.1400      0.0000      0.0000
+    563.2000   1483.1300      0.0000      0.0000
+    563.8000   1483.1000      0.0000      0.0000
+    564.3000   1483.0900      0.0000      0.0000
+    564.8000   1483.0500      0.0000      0.0000
+    565.3000   1483.0600      0.0000      0.0000
+    565.9000   1483.0500      0.0000      0.0000
+    566.4000   1483.0600      0.0000      0.0000
+    566.9000   1483.0800      0.0000      0.0000
+    567.5000   1483.0800      0.0000      0.0000
+    568.0000   1483.0700      0.0000      0.0000
+    568.5000   1483.0900      0.0000      0.0000
+    569.0000   1483.1000      0.0000      0.0000
+    569.6000   1483.0900      0.0000      0.0000
+    570.1000   1483.1000      0.0000      0.0000
+    570.6000   1483.1000      0.0000      0.0000
+    571.2000   1483.0800      0.0000      0.0000
+    571.7000   1483.0800      0.0000      0.0000
+    572.2000   1483.0800      0.0000      0.0000
+    572.7000   1483.0900      0.0000      0.0000
+    573.3000   1483.1000      0.0000      0.0000
+    573.8000   1483.0900      0.0000      0.0000
+    574.3000   1483.1000      0.0000      0.0000
+    574.8000   1483.1200      0.0000      0.0000
+    575.4000   1483.1300      0.0000      0.0000
+    575.9000   1483.1300      0.0000      0.0000
+    576.4000   1483.1200      0.0000      0.0000
+    577.0000   1483.1200      0.0000      0.0000
+    577.5000   1483.1200      0.0000      0.0000
+    578.0000   1483.1500      0.0000      0.0000
+    578.5000   1483.1700      0.0000      0.0000
+    579.1000   1483.2000      0.0000      0.0000
+    579.6000   1483.2500      0.0000      0.0000
+    580.1000   1483.2800      0.0000      0.0000
+    580.7000   1483.3400      0.0000      0.0000
+    581.2000   1483.3600      0.0000      0.0000
+    581.7000   1483.4000      0.0000      0.0000
+    582.2000   1483.4300      0.0000      0.0000
+    582.8000   1483.4500      0.0000      0.0000
+    583.3000   1483.4700      0.0000      0.0000
+    583.8000   1483.5600      0.0000      0.0000
+    584.3000   1483.6100      0.0000      0.0000
+    584.9000   1483.6500      0.0000      0.0000
+    585.4000   1483.6600      0.0000      0.0000
+    585.9000   1483.6900      0.0000      0.0000
+    586.4000   1483.7000      0.0000      0.0000
+    587.0000   1483.7000      0.0000      0.0000
+    587.5000   1483.6900      0.0000      0.0000
+    588.0000   1483.7000      0.0000      0.0000
+    588.6000   1483.7000      0.0000      0.0000
+    589.1000   1483.7000      0.0000      0.0000
+    589.6000   1483.7100      0.0000      0.0000
+    590.1000   1483.7200      0.0000      0.0000
+    590.7000   1483.7300      0.0000      0.0000
+    591.2000   1483.7400      0.0000      0.0000
+    591.7000   1483.7500      0.0000      0.0000
+    592.2000   1483.7700      0.0000      0.0000
+    592.8000   1483.8000      0.0000      0.0000
+    593.3000   1483.8300      0.0000      0.0000
+    593.8000   1483.8500      0.0000      0.0000
+    594.4000   1483.8600      0.0000      0.0000
+    594.9000   1483.8800      0.0000      0.0000
+    595.4000   1483.8900      0.0000      0.0000
+    595.9000   1483.9000      0.0000      0.0000
+    596.5000   1483.9000      0.0000      0.0000
+    597.0000   1483.9100      0.0000      0.0000
+    597.5000   1483.9100      0.0000      0.0000
+    598.0000   1483.9200      0.0000      0.0000
+    598.6000   1483.9200      0.0000      0.0000
+    599.1000   1483.9400      0.0000      0.0000
+    599.6000   1483.9400      0.0000      0.0000
+    600.1000   1483.9500      0.0000      0.0000
+    600.7000   1483.9600      0.0000      0.0000
+    601.2000   1483.9700      0.0000      0.0000
+    601.7000   1483.9700      0.0000      0.0000
+    602.2000   1483.9800      0.0000      0.0000
+    602.8000   1483.9900      0.0000      0.0000
+    603.3000   1484.0000      0.0000      0.0000
+    603.8000   1483.9900      0.0000      0.0000
+    604.4000   1484.0000      0.0000      0.0000
+    604.9000   1484.0000      0.0000      0.0000
+    605.4000   1484.0100      0.0000      0.0000
+    605.9000   1484.0200      0.0000      0.0000
+    606.5000   1484.0400      0.0000      0.0000
+    607.0000   1484.0800      0.0000      0.0000
+    607.5000   1484.1100      0.0000      0.0000
+    608.0000   1484.1200      0.0000      0.0000
+    608.6000   1484.1400      0.0000      0.0000
+    609.1000   1484.1400      0.0000      0.0000
+    609.6000   1484.1300      0.0000      0.0000
+    610.1000   1484.1000      0.0000      0.0000
+    610.7000   1484.0700      0.0000      0.0000
+    611.2000   1484.0700      0.0000      0.0000
+    611.7000   1484.0900      0.0000      0.0000
+    612.2000   1484.1200      0.0000      0.0000
+    612.8000   1484.1300      0.0000      0.0000
+    613.3000   1484.1300      0.0000      0.0000
+    613.8000   1484.1100      0.0000      0.0000
+    614.3000   1484.1100      0.0000      0.0000
+    614.9000   1484.0800      0.0000      0.0000
+    615.4000   1484.0600      0.0000      0.0000
+    615.9000   1484.0400      0.0000      0.0000
+    616.4000   1484.0300      0.0000      0.0000
+    617.0000   1484.0200      0.0000      0.0000
+    617.5000   1483.9900      0.0000      0.0000
+    618.0000   1483.9800      0.0000      0.0000
+    618.5000   1483.9800      0.0000      0.0000
+    619.1000   1483.9700      0.0000      0.0000
+    619.6000   1483.9600      0.0000      0.0000
+    620.1000   1483.9800      0.0000      0.0000
+    620.6000   1483.9800      0.0000      0.0000
+    621.2000   1484.0000      0.0000      0.0000
+    621.7000   1483.9800      0.0000      0.0000
+    622.2000   1483.9600      0.0000      0.0000
+    622.7000   1483.9600      0.0000      0.0000
+    623.3000   1483.9600      0.0000      0.0000
+    623.8000   1483.9700      0.0000      0.0000
+    624.3000   1483.9800      0.0000      0.0000
+    624.8000   1484.0100      0.0000      0.0000
+    625.4000   1484.0300      0.0000      0.0000
+    625.9000   1484.0400      0.0000      0.0000
+    626.4000   1484.0500      0.0000      0.0000
+    626.9000   1484.0700      0.0000      0.0000
+    627.5000   1484.0800      0.0000      0.0000
+    628.0000   1484.0900      0.0000      0.0000
+    628.5000   1484.0900      0.0000      0.0000
+    629.0000   1484.1100      0.0000      0.0000
+    629.6000   1484.1200      0.0000      0.0000
+    630.1000   1484.1300      0.0000      0.0000
+    630.6000   1484.1100      0.0000      0.0000
+    631.1000   1484.0700      0.0000      0.0000
+    631.7000   1484.0700      0.0000      0.0000
+    632.2000   1484.0700      0.0000      0.0000
+    632.7000   1484.0500      0.0000      0.0000
+    633.2000   1484.0400      0.0000      0.0000
+    633.8000   1484.0500      0.0000      0.0000
+    634.3000   1484.0200      0.0000      0.0000
+    634.8000   1483.9700      0.0000      0.0000
+    635.3000   1483.9100      0.0000      0.0000
+    635.9000   1483.8900      0.0000      0.0000
+    636.4000   1483.9000      0.0000      0.0000
+    636.9000   1483.9000      0.0000      0.0000
+    637.4000   1483.9100      0.0000      0.0000
+    638.0000   1483.9200      0.0000      0.0000
+    638.5000   1483.9200      0.0000      0.0000
+    639.0000   1483.9400      0.0000      0.0000
+    639.5000   1483.9500      0.0000      0.0000
+    640.1000   1483.9600      0.0000      0.0000
+    640.6000   1483.9700      0.0000      0.0000
+    641.1000   1483.9800      0.0000      0.0000
+    641.6000   1483.9700      0.0000      0.0000
+    642.2000   1483.9500      0.0000      0.0000
+    642.7000   1483.9500      0.0000      0.0000
+    643.2000   1483.9500      0.0000      0.0000
+    643.7000   1483.9500      0.0000      0.0000
+    644.2000   1483.9600      0.0000      0.0000
+    644.8000   1483.9600      0.0000      0.0000
+    645.3000   1483.9700      0.0000      0.0000
+    645.8000   1483.9700      0.0000      0.0000
+    646.3000   1483.9900      0.0000      0.0000
+    646.9000   1483.9900      0.0000      0.0000
+    647.4000   1483.9900      0.0000      0.0000
+    647.9000   1483.9800      0.0000      0.0000
+    648.4000   1483.9800      0.0000      0.0000
+    649.0000   1483.9800      0.0000      0.0000
+    649.5000   1483.9500      0.0000      0.0000
+    650.0000   1483.9400      0.0000      0.0000
+    650.5000   1483.9500      0.0000      0.0000
+    651.1000   1483.9500      0.0000      0.0000
+    651.6000   1483.9500      0.0000      0.0000
+    652.1000   1483.9400      0.0000      0.0000
+    652.6000   1483.9300      0.0000      0.0000
+    653.1000   1483.9500      0.0000      0.0000
+    653.7000   1483.9400      0.0000      0.0000
+    654.2000   1483.9400      0.0000      0.0000
+    654.7000   1483.9500      0.0000      0.0000
+    655.2000   1483.9300      0.0000      0.0000
+    655.8000   1483.9300      0.0000      0.0000
+    656.3000   1483.9200      0.0000      0.0000
+    656.8000   1483.9000      0.0000      0.0000
+    657.3000   1483.9200      0.0000      0.0000
+    657.9000   1483.9100      0.0000      0.0000
+    658.4000   1483.9300      0.0000      0.0000
+    658.9000   1483.9300      0.0000      0.0000
+    659.4000   1483.9100      0.0000      0.0000
+    660.0000   1483.9400      0.0000      0.0000
+    660.5000   1483.9400      0.0000      0.0000
+    661.0000   1483.9500      0.0000      0.0000
+    661.5000   1483.9700      0.0000      0.0000
+    662.0000   1483.9700      0.0000      0.0000
+    662.6000   1483.9800      0.0000      0.0000
+    663.1000   1483.9700      0.0000      0.0000
+    663.6000   1483.9900      0.0000      0.0000
+    664.1000   1484.0000      0.0000      0.0000
+    664.7000   1484.0100      0.0000      0.0000
+    665.2000   1484.0400      0.0000      0.0000
+    665.7000   1484.0400      0.0000      0.0000
+    666.2000   1484.0200      0.0000      0.0000
+    666.7000   1484.0300      0.0000      0.0000
+    667.3000   1484.0200      0.0000      0.0000
+    667.8000   1484.0200      0.0000      0.0000
+    668.3000   1484.0300      0.0000      0.0000
+    668.8000   1484.0000      0.0000      0.0000
+    669.4000   1483.9900      0.0000      0.0000
+    669.9000   1483.9700      0.0000      0.0000
+    670.4000   1483.9700      0.0000      0.0000
+    670.9000   1483.9600      0.0000      0.0000
+    671.4000   1483.9800      0.0000      0.0000
+    672.0000   1483.9900      0.0000      0.0000
+    672.5000   1483.9600      0.0000      0.0000
+    673.0000   1483.9900      0.0000      0.0000
+    673.5000   1483.9900      0.0000      0.0000
+    674.1000   1483.9900      0.0000      0.0000
+    674.6000   1484.0000      0.0000      0.0000
+    675.1000   1483.9600      0.0000      0.0000
+    675.6000   1483.9300      0.0000      0.0000
+    676.1000   1483.8100      0.0000      0.0000
+    676.7000   1483.7600      0.0000      0.0000
+    677.2000   1483.7700      0.0000      0.0000
+    677.7000   1483.7600      0.0000      0.0000
+    678.2000   1483.7800      0.0000      0.0000
+    678.8000   1483.7900      0.0000      0.0000
+    679.3000   1483.8000      0.0000      0.0000
+    679.8000   1483.8100      0.0000      0.0000
+    680.3000   1483.8200      0.0000      0.0000
+    680.8000   1483.8200      0.0000      0.0000
+    681.4000   1483.8300      0.0000      0.0000
+    681.9000   1483.8400      0.0000      0.0000
+    682.4000   1483.8600      0.0000      0.0000
+    682.9000   1483.8600      0.0000      0.0000
+    683.5000   1483.8600      0.0000      0.0000
+    684.0000   1483.8700      0.0000      0.0000
+    684.5000   1483.8800      0.0000      0.0000
+    685.0000   1483.8900      0.0000      0.0000
+    685.5000   1483.8900      0.0000      0.0000
+    686.1000   1483.8500      0.0000      0.0000
+    686.6000   1483.8100      0.0000      0.0000
+    687.1000   1483.7800      0.0000      0.0000
+    687.6000   1483.7700      0.0000      0.0000
+    688.1000   1483.7500      0.0000      0.0000
+    688.7000   1483.7000      0.0000      0.0000
+    689.2000   1483.6900      0.0000      0.0000
+    689.7000   1483.6400      0.0000      0.0000
+    690.2000   1483.6300      0.0000      0.0000
+    690.8000   1483.6400      0.0000      0.0000
+    691.3000   1483.6200      0.0000      0.0000
+    691.8000   1483.6300      0.0000      0.0000
+    692.3000   1483.6400      0.0000      0.0000
+    692.8000   1483.6300      0.0000      0.0000
+    693.4000   1483.6200      0.0000      0.0000
+    693.9000   1483.6400      0.0000      0.0000
+    694.4000   1483.6400      0.0000      0.0000
+    694.9000   1483.6600      0.0000      0.0000
+    695.4000   1483.6700      0.0000      0.0000
+    696.0000   1483.6500      0.0000      0.0000
+    696.5000   1483.6700      0.0000      0.0000
+    697.0000   1483.6500      0.0000      0.0000
+    697.5000   1483.6600      0.0000      0.0000
+    698.0000   1483.6300      0.0000      0.0000
+    698.6000   1483.6300      0.0000      0.0000
+    699.1000   1483.6400      0.0000      0.0000
+    699.6000   1483.6400      0.0000      0.0000
+    700.1000   1483.6400      0.0000      0.0000
+    700.6000   1483.6500      0.0000      0.0000
+    701.2000   1483.6400      0.0000      0.0000
+    701.7000   1483.6500      0.0000      0.0000
+    702.2000   1483.6600      0.0000      0.0000
+    702.7000   1483.6600      0.0000      0.0000
+    703.3000   1483.6600      0.0000      0.0000
+    703.8000   1483.6400      0.0000      0.0000
+    704.3000   1483.6300      0.0000      0.0000
+    704.8000   1483.6300      0.0000      0.0000
+    705.3000   1483.6600      0.0000      0.0000
+    705.9000   1483.6800      0.0000      0.0000
+    706.4000   1483.7200      0.0000      0.0000
+    706.9000   1483.7400      0.0000      0.0000
+    707.4000   1483.7400      0.0000      0.0000
+    707.9000   1483.7600      0.0000      0.0000
+    708.5000   1483.8200      0.0000      0.0000
+    709.0000   1483.8100      0.0000      0.0000
+    709.5000   1483.7900      0.0000      0.0000
+    710.0000   1483.8000      0.0000      0.0000
+    710.5000   1483.8200      0.0000      0.0000
+    711.1000   1483.8500      0.0000      0.0000
+    711.6000   1483.8800      0.0000      0.0000
+    712.1000   1483.9800      0.0000      0.0000
+    712.6000   1484.0000      0.0000      0.0000
+    713.1000   1484.0400      0.0000      0.0000
+    713.7000   1484.0600      0.0000      0.0000
+    714.2000   1484.0600      0.0000      0.0000
+    714.7000   1484.0700      0.0000      0.0000
+    715.2000   1484.0800      0.0000      0.0000
+    715.7000   1484.0800      0.0000      0.0000
+    716.3000   1484.0700      0.0000      0.0000
+    716.8000   1484.0600      0.0000      0.0000
+    717.3000   1484.0800      0.0000      0.0000
+    717.8000   1484.0700      0.0000      0.0000
+    718.3000   1484.0800      0.0000      0.0000
+    718.9000   1484.0700      0.0000      0.0000
+    719.4000   1484.0700      0.0000      0.0000
+    719.9000   1484.0600      0.0000      0.0000
+    720.4000   1484.0500      0.0000      0.0000
+    720.9000   1484.0500      0.0000      0.0000
+    721.5000   1484.0100      0.0000      0.0000
+    722.0000   1484.0100      0.0000      0.0000
+    722.5000   1483.9500      0.0000      0.0000
+    723.0000   1483.9100      0.0000      0.0000
+    723.5000   1483.9300      0.0000      0.0000
+    724.0000   1483.8900      0.0000      0.0000
+    724.6000   1483.9000      0.0000      0.0000
+    725.1000   1483.8800      0.0000      0.0000
+    725.6000   1483.8700      0.0000      0.0000
+    726.1000   1483.8700      0.0000      0.0000
+    726.6000   1483.8600      0.0000      0.0000
+    727.2000   1483.8900      0.0000      0.0000
+    727.7000   1483.9000      0.0000      0.0000
+    728.2000   1483.9200      0.0000      0.0000
+    728.7000   1483.9000      0.0000      0.0000
+    729.2000   1483.8700      0.0000      0.0000
+    729.8000   1483.8500      0.0000      0.0000
+    730.3000   1483.8200      0.0000      0.0000
+    730.8000   1483.8200      0.0000      0.0000
+    731.3000   1483.8000      0.0000      0.0000
+    731.8000   1483.7700      0.0000      0.0000
+    732.4000   1483.7400      0.0000      0.0000
+    732.9000   1483.7200      0.0000      0.0000
+    733.4000   1483.6800      0.0000      0.0000
+    733.9000   1483.6600      0.0000      0.0000
+    734.4000   1483.6600      0.0000      0.0000
+    734.9000   1483.6700      0.0000      0.0000
+    735.5000   1483.6600      0.0000      0.0000
+    736.0000   1483.6700      0.0000      0.0000
+    736.5000   1483.6600      0.0000      0.0000
+    737.0000   1483.6500      0.0000      0.0000
+    737.5000   1483.6900      0.0000      0.0000
+    738.1000   1483.6700      0.0000      0.0000
+    738.6000   1483.6400      0.0000      0.0000
+    739.1000   1483.6100      0.0000      0.0000
+    739.6000   1483.5900      0.0000      0.0000
+    740.1000   1483.5900      0.0000      0.0000
+    740.7000   1483.6000      0.0000      0.0000
+    741.2000   1483.6000      0.0000      0.0000
+    741.7000   1483.5900      0.0000      0.0000
+    742.2000   1483.6300      0.0000      0.0000
+    742.7000   1483.6500      0.0000      0.0000
+    743.2000   1483.6700      0.0000      0.0000
+    743.8000   1483.6700      0.0000      0.0000
+    744.3000   1483.6800      0.0000      0.0000
+    744.8000   1483.6500      0.0000      0.0000
+    745.3000   1483.6800      0.0000      0.0000
+    745.8000   1483.6600      0.0000      0.0000
+    746.4000   1483.6800      0.0000      0.0000
+    746.9000   1483.6700      0.0000      0.0000
+    747.4000   1483.6800      0.0000      0.0000
+    747.9000   1483.6800      0.0000      0.0000
+    748.4000   1483.6800      0.0000      0.0000
+    748.9000   1483.7000      0.0000      0.0000
+    749.5000   1483.7300      0.0000      0.0000
+    750.0000   1483.7500      0.0000      0.0000
+    750.5000   1483.7200      0.0000      0.0000
+    751.0000   1483.7500      0.0000      0.0000
+    751.5000   1483.7800      0.0000      0.0000
+    752.0000   1483.7800      0.0000      0.0000
+    752.6000   1483.7700      0.0000      0.0000
+    753.1000   1483.7600      0.0000      0.0000
+    753.6000   1483.7600      0.0000      0.0000
+    754.1000   1483.7600      0.0000      0.0000
+    754.6000   1483.7800      0.0000      0.0000
+    755.2000   1483.7800      0.0000      0.0000
+    755.7000   1483.7900      0.0000      0.0000
+    756.2000   1483.7600      0.0000      0.0000
+    756.7000   1483.7400      0.0000      0.0000
+    757.2000   1483.6900      0.0000      0.0000
+    757.7000   1483.6800      0.0000      0.0000
+    758.3000   1483.6900      0.0000      0.0000
+    758.8000   1483.7200      0.0000      0.0000
+    759.3000   1483.7300      0.0000      0.0000
+    759.8000   1483.7400      0.0000      0.0000
+    760.3000   1483.7000      0.0000      0.0000
+    760.8000   1483.6800      0.0000      0.0000
+    761.4000   1483.6200      0.0000      0.0000
+    761.9000   1483.4700      0.0000      0.0000
+    762.4000   1483.3300      0.0000      0.0000
+    762.9000   1483.2300      0.0000      0.0000
+    763.4000   1483.2000      0.0000      0.0000
+    763.9000   1483.1800      0.0000      0.0000
+    764.5000   1483.1800      0.0000      0.0000
+    765.0000   1483.1900      0.0000      0.0000
+    765.5000   1483.1800      0.0000      0.0000
+    766.0000   1483.2000      0.0000      0.0000
+    766.5000   1483.2100      0.0000      0.0000
+    767.0000   1483.2200      0.0000      0.0000
+    767.6000   1483.2600      0.0000      0.0000
+    768.1000   1483.2700      0.0000      0.0000
+    768.6000   1483.2800      0.0000      0.0000
+    769.1000   1483.3000      0.0000      0.0000
+    769.6000   1483.3300      0.0000      0.0000
+    770.1000   1483.3400      0.0000      0.0000
+    770.7000   1483.3700      0.0000      0.0000
+    771.2000   1483.3900      0.0000      0.0000
+    771.7000   1483.4000      0.0000      0.0000
+    772.2000   1483.4200      0.0000      0.0000
+    772.7000   1483.4300      0.0000      0.0000
+    773.2000   1483.3900      0.0000      0.0000
+    773.8000   1483.4100      0.0000      0.0000
+    774.3000   1483.4000      0.0000      0.0000
+    774.8000   1483.4000      0.0000      0.0000
+    775.3000   1483.3700      0.0000      0.0000
+    775.8000   1483.3900      0.0000      0.0000
+    776.3000   1483.3900      0.0000      0.0000
+    776.9000   1483.3900      0.0000      0.0000
+    777.4000   1483.4100      0.0000      0.0000
+    777.9000   1483.4100      0.0000      0.0000
+    778.4000   1483.4200      0.0000      0.0000
+    778.9000   1483.4100      0.0000      0.0000
+    779.4000   1483.4100      0.0000      0.0000
+    780.0000   1483.4300      0.0000      0.0000
+    780.5000   1483.4300      0.0000      0.0000
+    781.0000   1483.4400      0.0000      0.0000
+    781.5000   1483.4500      0.0000      0.0000
+    782.0000   1483.4200      0.0000      0.0000
+    782.5000   1483.4500      0.0000      0.0000
+    783.1000   1483.4500      0.0000      0.0000
+    783.6000   1483.4500      0.0000      0.0000
+    784.1000   1483.4500      0.0000      0.0000
+    784.6000   1483.4700      0.0000      0.0000
+    785.1000   1483.4600      0.0000      0.0000
+    785.6000   1483.4700      0.0000      0.0000
+    786.2000   1483.4400      0.0000      0.0000
+    786.7000   1483.4300      0.0000      0.0000
+    787.2000   1483.4200      0.0000      0.0000
+    787.7000   1483.4300      0.0000      0.0000
+    788.2000   1483.4600      0.0000      0.0000
+    788.7000   1483.4700      0.0000      0.0000
+    789.2000   1483.4800      0.0000      0.0000
+    789.8000   1483.5000      0.0000      0.0000
+    790.3000   1483.5100      0.0000      0.0000
+    790.8000   1483.5100      0.0000      0.0000
+    791.3000   1483.5400      0.0000      0.0000
+    791.8000   1483.5700      0.0000      0.0000
+    792.3000   1483.5800      0.0000      0.0000
+    792.9000   1483.5900      0.0000      0.0000
+    793.4000   1483.6100      0.0000      0.0000
+    793.9000   1483.6100      0.0000      0.0000
+    794.4000   1483.6400      0.0000      0.0000
+    794.9000   1483.6500      0.0000      0.0000
+    795.4000   1483.6700      0.0000      0.0000
+    795.9000   1483.6900      0.0000      0.0000
+    796.5000   1483.7000      0.0000      0.0000
+    797.0000   1483.7100      0.0000      0.0000
+    797.5000   1483.7000      0.0000      0.0000
+    798.0000   1483.6800      0.0000      0.0000
+    798.5000   1483.6800      0.0000      0.0000
+    799.0000   1483.6400      0.0000      0.0000
+    799.6000   1483.6800      0.0000      0.0000
+    800.1000   1483.6900      0.0000      0.0000
+    800.6000   1483.6900      0.0000      0.0000
+    801.1000   1483.6900      0.0000      0.0000
+    801.6000   1483.7000      0.0000      0.0000
+    802.1000   1483.7100      0.0000      0.0000
+    802.6000   1483.6900      0.0000      0.0000
+    803.2000   1483.7000      0.0000      0.0000
+    803.7000   1483.6500      0.0000      0.0000
+    804.2000   1483.5800      0.0000      0.0000
+    804.7000   1483.5800      0.0000      0.0000
+    805.2000   1483.5900      0.0000      0.0000
+    805.7000   1483.6100      0.0000      0.0000
+    806.2000   1483.6000      0.0000      0.0000
+    806.8000   1483.5600      0.0000      0.0000
+    807.3000   1483.5000      0.0000      0.0000
+    807.8000   1483.5000      0.0000      0.0000
+    808.3000   1483.4800      0.0000      0.0000
+    808.8000   1483.4800      0.0000      0.0000
+    809.3000   1483.4000      0.0000      0.0000
+    809.8000   1483.3700      0.0000      0.0000
+    810.4000   1483.3300      0.0000      0.0000
+    810.9000   1483.3000      0.0000      0.0000
+    811.4000   1483.2900      0.0000      0.0000
+    811.9000   1483.2900      0.0000      0.0000
+    812.4000   1483.3000      0.0000      0.0000
+    812.9000   1483.3100      0.0000      0.0000
+    813.4000   1483.3000      0.0000      0.0000
+    814.0000   1483.3100      0.0000      0.0000
+    814.5000   1483.3300      0.0000      0.0000
+    815.0000   1483.3400      0.0000      0.0000
+    815.5000   1483.5500      0.0000      0.0000
+    816.0000   1483.6000      0.0000      0.0000
+    816.5000   1483.6300      0.0000      0.0000
+    817.0000   1483.6800      0.0000      0.0000
+    817.6000   1483.6800      0.0000      0.0000
+    818.1000   1483.7400      0.0000      0.0000
+    818.6000   1483.7600      0.0000      0.0000
+    819.1000   1483.7800      0.0000      0.0000
+    819.6000   1483.7800      0.0000      0.0000
+    820.1000   1483.7700      0.0000      0.0000
+    820.6000   1483.7900      0.0000      0.0000
+    821.2000   1483.7900      0.0000      0.0000
+    821.7000   1483.8200      0.0000      0.0000
+    822.2000   1483.8200      0.0000      0.0000
+    822.7000   1483.8100      0.0000      0.0000
+    823.2000   1483.8300      0.0000      0.0000
+    823.7000   1483.8400      0.0000      0.0000
+    824.2000   1483.8300      0.0000      0.0000
+    824.8000   1483.7400      0.0000      0.0000
+    825.3000   1483.7000      0.0000      0.0000
+    825.8000   1483.6900      0.0000      0.0000
+    826.3000   1483.6800      0.0000      0.0000
+    826.8000   1483.6800      0.0000      0.0000
+    827.3000   1483.6800      0.0000      0.0000
+    827.8000   1483.7000      0.0000      0.0000
+    828.3000   1483.7200      0.0000      0.0000
+    828.9000   1483.7300      0.0000      0.0000
+    829.4000   1483.7400      0.0000      0.0000
+    829.9000   1483.7500      0.0000      0.0000
+    830.4000   1483.7500      0.0000      0.0000
+    830.9000   1483.7600      0.0000      0.0000
+    831.4000   1483.7600      0.0000      0.0000
+    831.9000   1483.7500      0.0000      0.0000
+    832.5000   1483.7400      0.0000      0.0000
+    833.0000   1483.7200      0.0000      0.0000
+    833.5000   1483.7000      0.0000      0.0000
+    834.0000   1483.6800      0.0000      0.0000
+    834.5000   1483.6500      0.0000      0.0000
+    835.0000   1483.6600      0.0000      0.0000
+    835.5000   1483.6500      0.0000      0.0000
+    836.0000   1483.6600      0.0000      0.0000
+    836.6000   1483.5900      0.0000      0.0000
+    837.1000   1483.5300      0.0000      0.0000
+    837.6000   1483.5400      0.0000      0.0000
+    838.1000   1483.5400      0.0000      0.0000
+    838.6000   1483.5500      0.0000      0.0000
+    839.1000   1483.5500      0.0000      0.0000
+    839.6000   1483.5400      0.0000      0.0000
+    840.1000   1483.5500      0.0000      0.0000
+    840.7000   1483.5500      0.0000      0.0000
+    841.2000   1483.5600      0.0000      0.0000
+    841.7000   1483.5700      0.0000      0.0000
+    842.2000   1483.5700      0.0000      0.0000
+    842.7000   1483.5800      0.0000      0.0000
+    843.2000   1483.5700      0.0000      0.0000
+    843.7000   1483.5800      0.0000      0.0000
+    844.2000   1483.5700      0.0000      0.0000
+    844.8000   1483.4600      0.0000      0.0000
+    845.3000   1483.3600      0.0000      0.0000
+    845.8000   1483.2500      0.0000      0.0000
+    846.3000   1483.2000      0.0000      0.0000
+    846.8000   1483.1900      0.0000      0.0000
+    847.3000   1483.1800      0.0000      0.0000
+    847.8000   1483.1800      0.0000      0.0000
+    848.3000   1483.1900      0.0000      0.0000
+    848.9000   1483.1800      0.0000      0.0000
+    849.4000   1483.1900      0.0000      0.0000
+    849.9000   1483.2100      0.0000      0.0000
+    850.4000   1483.2700      0.0000      0.0000
+    850.9000   1483.3200      0.0000      0.0000
+    851.4000   1483.3100      0.0000      0.0000
+    851.9000   1483.3300      0.0000      0.0000
+    852.4000   1483.3500      0.0000      0.0000
+    853.0000   1483.3800      0.0000      0.0000
+    853.5000   1483.4000      0.0000      0.0000
+    854.0000   1483.4200      0.0000      0.0000
+    854.5000   1483.4100      0.0000      0.0000
+    855.0000   1483.3800      0.0000      0.0000
+    855.5000   1483.3700      0.0000      0.0000
+    856.0000   1483.3500      0.0000      0.0000
+    856.5000   1483.3400      0.0000      0.0000
+    857.0000   1483.3300      0.0000      0.0000
+    857.6000   1483.3200      0.0000      0.0000
+    858.1000   1483.3300      0.0000      0.0000
+    858.6000   1483.3000      0.0000      0.0000
+    859.1000   1483.2900      0.0000      0.0000
+    859.6000   1483.2700      0.0000      0.0000
+    860.1000   1483.2400      0.0000      0.0000
+    860.6000   1483.2300      0.0000      0.0000
+    861.1000   1483.2200      0.0000      0.0000
+    861.7000   1483.2100      0.0000      0.0000
+    862.2000   1483.1700      0.0000      0.0000
+    862.7000   1483.1500      0.0000      0.0000
+    863.2000   1483.1100      0.0000      0.0000
+    863.7000   1483.0700      0.0000      0.0000
+    864.2000   1483.0100      0.0000      0.0000
+    864.7000   1482.9900      0.0000      0.0000
+    865.2000   1482.9900      0.0000      0.0000
+    865.7000   1483.0000      0.0000      0.0000
+    866.3000   1483.0400      0.0000      0.0000
+    866.8000   1483.0300      0.0000      0.0000
+    867.3000   1483.0600      0.0000      0.0000
+    867.8000   1483.0700      0.0000      0.0000
+    868.3000   1483.0900      0.0000      0.0000
+    868.8000   1483.1000      0.0000      0.0000
+    869.3000   1483.1100      0.0000      0.0000
+    869.8000   1483.1200      0.0000      0.0000
+    870.3000   1483.1100      0.0000      0.0000
+    870.9000   1483.1000      0.0000      0.0000
+    871.4000   1483.0800      0.0000      0.0000
+    871.9000   1483.0800      0.0000      0.0000
+    872.4000   1483.0200      0.0000      0.0000
+    872.9000   1483.0300      0.0000      0.0000
+    873.4000   1483.0300      0.0000      0.0000
+    873.9000   1483.0400      0.0000      0.0000
+    874.4000   1483.0700      0.0000      0.0000
+    874.9000   1483.0200      0.0000      0.0000
+    875.4000   1483.0100      0.0000      0.0000
+    876.0000   1483.0000      0.0000      0.0000
+    876.5000   1483.0000      0.0000      0.0000
+    877.0000   1483.0000      0.0000      0.0000
+    877.5000   1483.0200      0.0000      0.0000
+    878.0000   1483.0100      0.0000      0.0000
+    878.5000   1483.0400      0.0000      0.0000
+    879.0000   1483.0600      0.0000      0.0000
+    879.5000   1483.1000      0.0000      0.0000
+    880.0000   1483.1200      0.0000      0.0000
+    880.6000   1483.1200      0.0000      0.0000
+    881.1000   1483.1200      0.0000      0.0000
+    881.6000   1483.1400      0.0000      0.0000
+    882.1000   1483.1400      0.0000      0.0000
+    882.6000   1483.1600      0.0000      0.0000
+    883.1000   1483.1500      0.0000      0.0000
+    883.6000   1483.1600      0.0000      0.0000
+    884.1000   1483.1500      0.0000      0.0000
+    884.6000   1483.1500      0.0000      0.0000
+    885.1000   1483.1600      0.0000      0.0000
+    885.7000   1483.1600      0.0000      0.0000
+    886.2000   1483.1700      0.0000      0.0000
+    886.7000   1483.1700      0.0000      0.0000
+    887.2000   1483.1700      0.0000      0.0000
+    887.7000   1483.1800      0.0000      0.0000
+    888.2000   1483.1800      0.0000      0.0000
+    888.7000   1483.1900      0.0000      0.0000
+    889.2000   1483.1900      0.0000      0.0000
+    889.7000   1483.2100      0.0000      0.0000
+    890.2000   1483.2200      0.0000      0.0000
+    890.8000   1483.1900      0.0000      0.0000
+    891.3000   1483.1600      0.0000      0.0000
+    891.8000   1483.1400      0.0000      0.0000
+    892.3000   1483.1200      0.0000      0.0000
+    892.8000   1483.1100      0.0000      0.0000
+    893.3000   1483.0900      0.0000      0.0000
+    893.8000   1483.0800      0.0000      0.0000
+    894.3000   1483.0800      0.0000      0.0000
+    894.8000   1483.0900      0.0000      0.0000
+    895.3000   1483.0700      0.0000      0.0000
+    895.8000   1483.0900      0.0000      0.0000
+    896.4000   1483.0900      0.0000      0.0000
+    896.9000   1483.1000      0.0000      0.0000
+    897.4000   1483.1100      0.0000      0.0000
+    897.9000   1483.1000      0.0000      0.0000
+    898.4000   1483.1300      0.0000      0.0000
+    898.9000   1483.1500      0.0000      0.0000
+    899.4000   1483.1400      0.0000      0.0000
+    899.9000   1483.1700      0.0000      0.0000
+    900.4000   1483.1900      0.0000      0.0000
+    900.9000   1483.1700      0.0000      0.0000
+    901.5000   1483.1600      0.0000      0.0000
+    902.0000   1483.1600      0.0000      0.0000
+    902.5000   1483.1600      0.0000      0.0000
+    903.0000   1483.1500      0.0000      0.0000
+    903.5000   1483.1500      0.0000      0.0000
+    904.0000   1483.1600      0.0000      0.0000
+    904.5000   1483.1500      0.0000      0.0000
+    905.0000   1483.1500      0.0000      0.0000
+    905.5000   1483.1600      0.0000      0.0000
+    906.0000   1483.1400      0.0000      0.0000
+    906.5000   1483.1500      0.0000      0.0000
+    907.0000   1483.1400      0.0000      0.0000
+    907.6000   1483.1500      0.0000      0.0000
+    908.1000   1483.1700      0.0000      0.0000
+    908.6000   1483.1800      0.0000      0.0000
+    909.1000   1483.1900      0.0000      0.0000
+    909.6000   1483.2200      0.0000      0.0000
+    910.1000   1483.2300      0.0000      0.0000
+    910.6000   1483.2800      0.0000      0.0000
+    911.1000   1483.2800      0.0000      0.0000
+    911.6000   1483.2900      0.0000      0.0000
+    912.1000   1483.2900      0.0000      0.0000
+    912.6000   1483.2900      0.0000      0.0000
+    913.2000   1483.2700      0.0000      0.0000
+    913.7000   1483.2900      0.0000      0.0000
+    914.2000   1483.2700      0.0000      0.0000
+    914.7000   1483.2400      0.0000      0.0000
+    915.2000   1483.2500      0.0000      0.0000
+    915.7000   1483.2400      0.0000      0.0000
+    916.2000   1483.2500      0.0000      0.0000
+    916.7000   1483.2400      0.0000      0.0000
+    917.2000   1483.2200      0.0000      0.0000
+    917.7000   1483.1400      0.0000      0.0000
+    918.2000   1483.0900      0.0000      0.0000
+    918.7000   1483.0700      0.0000      0.0000
+    919.3000   1483.0200      0.0000      0.0000
+    919.8000   1482.9500      0.0000      0.0000
+    920.3000   1482.9300      0.0000      0.0000
+    920.8000   1482.9400      0.0000      0.0000
+    921.3000   1482.9500      0.0000      0.0000
+    921.8000   1482.9500      0.0000      0.0000
+    922.3000   1482.9600      0.0000      0.0000
+    922.8000   1482.9700      0.0000      0.0000
+    923.3000   1482.9700      0.0000      0.0000
+    923.8000   1482.9600      0.0000      0.0000
+    924.3000   1482.9600      0.0000      0.0000
+    924.8000   1482.9900      0.0000      0.0000
+    925.3000   1482.9900      0.0000      0.0000
+    925.9000   1483.0100      0.0000      0.0000
+    926.4000   1483.0400      0.0000      0.0000
+    926.9000   1483.0500      0.0000      0.0000
+    927.4000   1483.0500      0.0000      0.0000
+    927.9000   1483.0800      0.0000      0.0000
+    928.4000   1483.0700      0.0000      0.0000
+    928.9000   1483.0300      0.0000      0.0000
+    929.4000   1483.0400      0.0000      0.0000
+    929.9000   1483.0300      0.0000      0.0000
+    930.4000   1483.0300      0.0000      0.0000
+    930.9000   1483.0300      0.0000      0.0000
+    931.4000   1483.0500      0.0000      0.0000
+    931.9000   1483.0500      0.0000      0.0000
+    932.5000   1483.0700      0.0000      0.0000
+    933.0000   1483.0600      0.0000      0.0000
+    933.5000   1483.0500      0.0000      0.0000
+    934.0000   1483.0600      0.0000      0.0000
+    934.5000   1483.0700      0.0000      0.0000
+    935.0000   1483.0800      0.0000      0.0000
+    935.5000   1483.0800      0.0000      0.0000
+    936.0000   1483.0800      0.0000      0.0000
+    936.5000   1483.0900      0.0000      0.0000
+    937.0000   1483.0900      0.0000      0.0000
+    937.5000   1483.1000      0.0000      0.0000
+    938.0000   1483.1000      0.0000      0.0000
+    938.5000   1483.1000      0.0000      0.0000
+    939.0000   1483.1400      0.0000      0.0000
+    939.6000   1483.1600      0.0000      0.0000
+    940.1000   1483.1200      0.0000      0.0000
+    940.6000   1483.1100      0.0000      0.0000
+    941.1000   1483.1000      0.0000      0.0000
+    941.6000   1483.1200      0.0000      0.0000
+    942.1000   1483.1200      0.0000      0.0000
+    942.6000   1483.1300      0.0000      0.0000
+    943.1000   1483.1400      0.0000      0.0000
+    943.6000   1483.1700      0.0000      0.0000
+    944.1000   1483.1900      0.0000      0.0000
+    944.6000   1483.2100      0.0000      0.0000
+    945.1000   1483.2300      0.0000      0.0000
+    945.6000   1483.2400      0.0000      0.0000
+    946.1000   1483.2300      0.0000      0.0000
+    946.6000   1483.2000      0.0000      0.0000
+    947.2000   1483.1600      0.0000      0.0000
+    947.7000   1483.1600      0.0000      0.0000
+    948.2000   1483.1700      0.0000      0.0000
+    948.7000   1483.2100      0.0000      0.0000
+    949.2000   1483.2400      0.0000      0.0000
+    949.7000   1483.2000      0.0000      0.0000
+    950.2000   1483.2100      0.0000      0.0000
+    950.7000   1483.2200      0.0000      0.0000
+    951.2000   1483.2000      0.0000      0.0000
+    951.7000   1483.2100      0.0000      0.0000
+    952.2000   1483.2100      0.0000      0.0000
+    952.7000   1483.2400      0.0000      0.0000
+    953.2000   1483.2500      0.0000      0.0000
+    953.7000   1483.2800      0.0000      0.0000
+    954.2000   1483.3000      0.0000      0.0000
+    954.7000   1483.3000      0.0000      0.0000
+    955.3000   1483.2800      0.0000      0.0000
+    955.8000   1483.2800      0.0000      0.0000
+    956.3000   1483.2600      0.0000      0.0000
+    956.8000   1483.2700      0.0000      0.0000
+    957.3000   1483.2800      0.0000      0.0000
+    957.8000   1483.2900      0.0000      0.0000
+    958.3000   1483.3000      0.0000      0.0000
+    958.8000   1483.3100      0.0000      0.0000
+    959.3000   1483.3100      0.0000      0.0000
+    959.8000   1483.3000      0.0000      0.0000
+    960.3000   1483.3100      0.0000      0.0000
+    960.8000   1483.3100      0.0000      0.0000
+    961.3000   1483.3100      0.0000      0.0000
+    961.8000   1483.3200      0.0000      0.0000
+    962.3000   1483.3000      0.0000      0.0000
+    962.8000   1483.3100      0.0000      0.0000
+    963.3000   1483.3100      0.0000      0.0000
+    963.8000   1483.3100      0.0000      0.0000
+    964.4000   1483.3200      0.0000      0.0000
+    964.9000   1483.3200      0.0000      0.0000
+    965.4000   1483.3400      0.0000      0.0000
+    965.9000   1483.3500      0.0000      0.0000
+    966.4000   1483.3600      0.0000      0.0000
+    966.9000   1483.3800      0.0000      0.0000
+    967.4000   1483.3700      0.0000      0.0000
+    967.9000   1483.3800      0.0000      0.0000
+    968.4000   1483.4200      0.0000      0.0000
+    968.9000   1483.4300      0.0000      0.0000
+    969.4000   1483.4600      0.0000      0.0000
+    969.9000   1483.4800      0.0000      0.0000
+    970.4000   1483.4600      0.0000      0.0000
+    970.9000   1483.4600      0.0000      0.0000
+    971.4000   1483.4800      0.0000      0.0000
+    971.9000   1483.4800      0.0000      0.0000
+    972.4000   1483.4900      0.0000      0.0000
+    972.9000   1483.5000      0.0000      0.0000
+    973.4000   1483.5100      0.0000      0.0000
+    974.0000   1483.5100      0.0000      0.0000
+    974.5000   1483.5200      0.0000      0.0000
+    975.0000   1483.5200      0.0000      0.0000
+    975.5000   1483.5200      0.0000      0.0000
+    976.0000   1483.5300      0.0000      0.0000
+    976.5000   1483.5300      0.0000      0.0000
+    977.0000   1483.5400      0.0000      0.0000
+    977.5000   1483.5400      0.0000      0.0000
+    978.0000   1483.5500      0.0000      0.0000
+    978.5000   1483.5500      0.0000      0.0000
+    979.0000   1483.5700      0.0000      0.0000
+    979.5000   1483.5700      0.0000      0.0000
+    980.0000   1483.5800      0.0000      0.0000
+    980.5000   1483.5900      0.0000      0.0000
+    981.0000   1483.5900      0.0000      0.0000
+    981.5000   1483.6100      0.0000      0.0000
+    982.0000   1483.6200      0.0000      0.0000
+    982.5000   1483.6200      0.0000      0.0000
+    983.0000   1483.6200      0.0000      0.0000
+    983.5000   1483.6300      0.0000      0.0000
+    984.0000   1483.6200      0.0000      0.0000
+    984.5000   1483.6200      0.0000      0.0000
+    985.1000   1483.6100      0.0000      0.0000
+    985.6000   1483.6000      0.0000      0.0000
+    986.1000   1483.6300      0.0000      0.0000
+    986.6000   1483.6400      0.0000      0.0000
+    987.1000   1483.6500      0.0000      0.0000
+    987.6000   1483.6500      0.0000      0.0000
+    988.1000   1483.6700      0.0000      0.0000
+    988.6000   1483.6800      0.0000      0.0000
+    989.1000   1483.7000      0.0000      0.0000
+    989.6000   1483.6800      0.0000      0.0000
+    990.1000   1483.7000      0.0000      0.0000
+    990.6000   1483.7000      0.0000      0.0000
+    991.1000   1483.6400      0.0000      0.0000
+    991.6000   1483.6100      0.0000      0.0000
+    992.1000   1483.6100      0.0000      0.0000
+    992.6000   1483.6100      0.0000      0.0000
+    993.1000   1483.6200      0.0000      0.0000
+    993.6000   1483.6100      0.0000      0.0000
+    994.1000   1483.6400      0.0000      0.0000
+    994.6000   1483.6600      0.0000      0.0000
+    995.1000   1483.6500      0.0000      0.0000
+    995.6000   1483.6400      0.0000      0.0000
+    996.1000   1483.6300      0.0000      0.0000
+    996.6000   1483.6400      0.0000      0.0000
+    997.1000   1483.6500      0.0000      0.0000
+    997.7000   1483.6700      0.0000      0.0000
+    998.2000   1483.6700      0.0000      0.0000
+    998.7000   1483.6600      0.0000      0.0000
+    999.2000   1483.6600      0.0000      0.0000
+    999.7000   1483.6400      0.0000      0.0000
+   1000.2000   1483.6700      0.0000      0.0000
+   1000.7000   1483.6500      0.0000      0.0000
+   1001.2000   1483.6700      0.0000      0.0000
+   1001.7000   1483.6600      0.0000      0.0000
+   1002.2000   1483.6500      0.0000      0.0000
+   1002.7000   1483.6400      0.0000      0.0000
+   1003.2000   1483.6300      0.0000      0.0000
+   1003.7000   1483.6100      0.0000      0.0000
+   1004.2000   1483.6200      0.0000      0.0000
+   1004.7000   1483.6000      0.0000      0.0000
+   1005.2000   1483.6100      0.0000      0.0000
+   1005.7000   1483.6200      0.0000      0.0000
+   1006.2000   1483.6000      0.0000      0.0000
+   1006.7000   1483.5900      0.0000      0.0000
+   1007.2000   1483.5700      0.0000      0.0000
+   1007.7000   1483.5500      0.0000      0.0000
+   1008.2000   1483.5400      0.0000      0.0000
+   1008.7000   1483.4900      0.0000      0.0000
+   1009.2000   1483.4700      0.0000      0.0000
+   1009.7000   1483.4500      0.0000      0.0000
+   1010.2000   1483.4300      0.0000      0.0000
+   1010.7000   1483.4200      0.0000      0.0000
+   1011.2000   1483.3900      0.0000      0.0000
+   1011.7000   1483.3900      0.0000      0.0000
+   1012.2000   1483.3800      0.0000      0.0000
+   1012.7000   1483.3900      0.0000      0.0000
+   1013.2000   1483.4000      0.0000      0.0000
+   1013.7000   1483.4000      0.0000      0.0000
+   1014.3000   1483.3800      0.0000      0.0000
+   1014.8000   1483.3000      0.0000      0.0000
+   1015.3000   1483.3400      0.0000      0.0000
+   1015.8000   1483.3400      0.0000      0.0000
+   1016.3000   1483.3400      0.0000      0.0000
+   1016.8000   1483.3500      0.0000      0.0000
+   1017.3000   1483.3800      0.0000      0.0000
+   1017.8000   1483.3700      0.0000      0.0000
+   1018.3000   1483.3600      0.0000      0.0000
+   1018.8000   1483.4000      0.0000      0.0000
+   1019.3000   1483.3900      0.0000      0.0000
+   1019.8000   1483.3900      0.0000      0.0000
+   1020.3000   1483.3900      0.0000      0.0000
+   1020.8000   1483.4100      0.0000      0.0000
+   1021.3000   1483.4200      0.0000      0.0000
+   1021.8000   1483.4100      0.0000      0.0000
+   1022.3000   1483.4400      0.0000      0.0000
+   1022.8000   1483.4300      0.0000      0.0000
+   1023.3000   1483.4600      0.0000      0.0000
+   1023.8000   1483.4300      0.0000      0.0000
+   1024.3000   1483.4300      0.0000      0.0000
+   1024.8000   1483.3900      0.0000      0.0000
+   1025.3000   1483.3900      0.0000      0.0000
+   1025.8000   1483.3900      0.0000      0.0000
+   1026.3000   1483.4000      0.0000      0.0000
+   1026.8000   1483.4100      0.0000      0.0000
+   1027.3000   1483.4100      0.0000      0.0000
+   1027.8000   1483.4300      0.0000      0.0000
+   1028.3000   1483.4500      0.0000      0.0000
+   1028.8000   1483.4800      0.0000      0.0000
+   1029.3000   1483.5100      0.0000      0.0000
+   1029.8000   1483.5300      0.0000      0.0000
+   1030.3000   1483.5100      0.0000      0.0000
+   1030.8000   1483.5000      0.0000      0.0000
+   1031.3000   1483.4900      0.0000      0.0000
+   1031.8000   1483.4700      0.0000      0.0000
+   1032.3000   1483.4800      0.0000      0.0000
+   1032.8000   1483.5100      0.0000      0.0000
+   1033.3000   1483.5000      0.0000      0.0000
+   1033.8000   1483.4900      0.0000      0.0000
+   1034.3000   1483.5100      0.0000      0.0000
+   1034.8000   1483.5200      0.0000      0.0000
+   1035.3000   1483.5100      0.0000      0.0000
+   1035.8000   1483.4800      0.0000      0.0000
+   1036.3000   1483.4800      0.0000      0.0000
+   1036.8000   1483.4800      0.0000      0.0000
+   1037.3000   1483.4700      0.0000      0.0000
+   1037.8000   1483.4600      0.0000      0.0000
+   1038.3000   1483.4800      0.0000      0.0000
+   1038.8000   1483.4800      0.0000      0.0000
+   1039.3000   1483.5100      0.0000      0.0000
+   1039.8000   1483.5200      0.0000      0.0000
+   1040.3000   1483.5200      0.0000      0.0000
+   1040.8000   1483.5800      0.0000      0.0000
+   1041.3000   1483.5700      0.0000      0.0000
+   1041.8000   1483.5700      0.0000      0.0000
+   1042.3000   1483.5900      0.0000      0.0000
+   1042.8000   1483.6200      0.0000      0.0000
+   1043.3000   1483.6100      0.0000      0.0000
+   1043.8000   1483.6000      0.0000      0.0000
+   1044.4000   1483.5600      0.0000      0.0000
+   1044.9000   1483.5400      0.0000      0.0000
+   1045.4000   1483.4600      0.0000      0.0000
+   1045.9000   1483.4700      0.0000      0.0000
+   1046.4000   1483.4600      0.0000      0.0000
+   1046.9000   1483.4800      0.0000      0.0000
+   1047.4000   1483.4900      0.0000      0.0000
+   1047.9000   1483.5100      0.0000      0.0000
+   1048.4000   1483.5300      0.0000      0.0000
+   1048.9000   1483.5500      0.0000      0.0000
+   1049.4000   1483.5800      0.0000      0.0000
+   1049.9000   1483.5700      0.0000      0.0000
+   1050.4000   1483.6000      0.0000      0.0000
+   1050.9000   1483.6100      0.0000      0.0000
+   1051.4000   1483.6200      0.0000      0.0000
+   1051.9000   1483.6400      0.0000      0.0000
+   1052.4000   1483.6500      0.0000      0.0000
+   1052.9000   1483.6400      0.0000      0.0000
+   1053.4000   1483.6100      0.0000      0.0000
+   1053.9000   1483.6100      0.0000      0.0000
+   1054.4000   1483.6200      0.0000      0.0000
+   1054.9000   1483.6200      0.0000      0.0000
+   1055.4000   1483.6300      0.0000      0.0000
+   1055.9000   1483.6400      0.0000      0.0000
+   1056.4000   1483.6600      0.0000      0.0000
+   1056.9000   1483.6700      0.0000      0.0000
+   1057.4000   1483.6800      0.0000      0.0000
+   1057.9000   1483.7000      0.0000      0.0000
+   1058.4000   1483.7300      0.0000      0.0000
+   1058.9000   1483.7900      0.0000      0.0000
+   1059.4000   1483.8100      0.0000      0.0000
+   1059.9000   1483.8100      0.0000      0.0000
+   1060.4000   1483.8000      0.0000      0.0000
+   1060.9000   1483.8100      0.0000      0.0000
+   1061.4000   1483.8000      0.0000      0.0000
+   1061.9000   1483.8000      0.0000      0.0000
+   1062.4000   1483.7800      0.0000      0.0000
+   1062.9000   1483.7800      0.0000      0.0000
+   1063.4000   1483.7900      0.0000      0.0000
+   1063.9000   1483.7900      0.0000      0.0000
+   1064.4000   1483.8000      0.0000      0.0000
+   1064.9000   1483.8100      0.0000      0.0000
+   1065.4000   1483.8000      0.0000      0.0000
+   1065.9000   1483.7800      0.0000      0.0000
+   1066.4000   1483.7300      0.0000      0.0000
+   1066.9000   1483.7000      0.0000      0.0000
+   1067.4000   1483.6700      0.0000      0.0000
+   1067.9000   1483.6500      0.0000      0.0000
+   1068.4000   1483.6500      0.0000      0.0000
+   1068.9000   1483.6600      0.0000      0.0000
+   1069.4000   1483.6700      0.0000      0.0000
+   1069.9000   1483.7100      0.0000      0.0000
+   1070.4000   1483.7500      0.0000      0.0000
+   1070.8000   1483.7900      0.0000      0.0000
+   1071.3000   1483.8100      0.0000      0.0000
+   1071.8000   1483.8200      0.0000      0.0000
+   1072.3000   1483.8300      0.0000      0.0000
+   1072.8000   1483.8400      0.0000      0.0000
+   1073.3000   1483.8600      0.0000      0.0000
+   1073.8000   1483.8600      0.0000      0.0000
+   1074.3000   1483.8500      0.0000      0.0000
+   1074.8000   1483.8600      0.0000      0.0000
+   1075.3000   1483.8600      0.0000      0.0000
+   1075.8000   1483.8700      0.0000      0.0000
+   1076.3000   1483.8600      0.0000      0.0000
+   1076.8000   1483.8600      0.0000      0.0000
+   1077.3000   1483.8700      0.0000      0.0000
+   1077.8000   1483.8800      0.0000      0.0000
+   1078.3000   1483.9000      0.0000      0.0000
+   1078.8000   1483.9100      0.0000      0.0000
+   1079.3000   1483.9100      0.0000      0.0000
+   1079.8000   1483.9100      0.0000      0.0000
+   1080.3000   1483.9000      0.0000      0.0000
+   1080.8000   1483.9000      0.0000      0.0000
+   1081.3000   1483.9000      0.0000      0.0000
+   1081.8000   1483.9300      0.0000      0.0000
+   1082.3000   1483.9100      0.0000      0.0000
+   1082.8000   1483.9200      0.0000      0.0000
+   1083.3000   1483.9300      0.0000      0.0000
+   1083.8000   1483.9500      0.0000      0.0000
+   1084.3000   1483.9400      0.0000      0.0000
+   1084.8000   1483.9500      0.0000      0.0000
+   1085.3000   1483.9700      0.0000      0.0000
+   1085.8000   1483.9700      0.0000      0.0000
+   1086.3000   1483.9800      0.0000      0.0000
+   1086.8000   1483.9800      0.0000      0.0000
+   1087.3000   1483.9900      0.0000      0.0000
+   1087.8000   1484.0000      0.0000      0.0000
+   1088.3000   1484.0000      0.0000      0.0000
+   1088.8000   1483.9900      0.0000      0.0000
+   1089.3000   1483.9900      0.0000      0.0000
+   1089.8000   1483.9700      0.0000      0.0000
+   1090.3000   1483.9600      0.0000      0.0000
+   1090.8000   1483.9500      0.0000      0.0000
+   1091.3000   1483.9600      0.0000      0.0000
+   1091.8000   1483.9900      0.0000      0.0000
+   1092.3000   1484.0000      0.0000      0.0000
+   1092.8000   1484.0100      0.0000      0.0000
+   1093.3000   1483.9400      0.0000      0.0000
+   1093.8000   1483.9300      0.0000      0.0000
+   1094.3000   1483.9100      0.0000      0.0000
+   1094.8000   1483.8800      0.0000      0.0000
+   1095.3000   1483.8800      0.0000      0.0000
+   1095.8000   1483.8900      0.0000      0.0000
+   1096.3000   1483.8900      0.0000      0.0000
+   1096.8000   1483.9000      0.0000      0.0000
+   1097.3000   1483.9000      0.0000      0.0000
+   1097.8000   1483.8900      0.0000      0.0000
+   1098.3000   1483.9100      0.0000      0.0000
+   1098.8000   1483.9200      0.0000      0.0000
+   1099.3000   1483.9200      0.0000      0.0000
+   1099.8000   1483.9000      0.0000      0.0000
+   1100.3000   1483.9000      0.0000      0.0000
+   1100.7000   1483.9200      0.0000      0.0000
+   1101.2000   1483.9100      0.0000      0.0000
+   1101.7000   1483.9300      0.0000      0.0000
+   1102.2000   1483.9500      0.0000      0.0000
+   1102.7000   1483.9500      0.0000      0.0000
+   1103.2000   1483.9300      0.0000      0.0000
+   1103.7000   1483.9300      0.0000      0.0000
+   1104.2000   1483.9200      0.0000      0.0000
+   1104.7000   1483.9100      0.0000      0.0000
+   1105.2000   1483.9200      0.0000      0.0000
+   1105.7000   1483.9200      0.0000      0.0000
+   1106.2000   1483.9300      0.0000      0.0000
+   1106.7000   1483.9400      0.0000      0.0000
+   1107.2000   1483.9600      0.0000      0.0000
+   1107.7000   1483.9500      0.0000      0.0000
+   1108.2000   1483.8900      0.0000      0.0000
+   1108.7000   1483.8300      0.0000      0.0000
+   1109.2000   1483.8200      0.0000      0.0000
+   1109.7000   1483.8100      0.0000      0.0000
+   1110.2000   1483.8200      0.0000      0.0000
+   1110.7000   1483.8400      0.0000      0.0000
+   1111.2000   1483.8300      0.0000      0.0000
+   1111.7000   1483.8400      0.0000      0.0000
+   1112.2000   1483.8400      0.0000      0.0000
+   1112.7000   1483.8500      0.0000      0.0000
+   1113.2000   1483.8600      0.0000      0.0000
+   1113.7000   1483.8600      0.0000      0.0000
+   1114.2000   1483.8600      0.0000      0.0000
+   1114.7000   1483.8600      0.0000      0.0000
+   1115.2000   1483.8700      0.0000      0.0000
+   1115.7000   1483.8600      0.0000      0.0000
+   1116.2000   1483.8400      0.0000      0.0000
+   1116.7000   1483.8300      0.0000      0.0000
+   1117.1000   1483.8300      0.0000      0.0000
+   1117.6000   1483.8400      0.0000      0.0000
+   1118.1000   1483.8500      0.0000      0.0000
+   1118.6000   1483.8500      0.0000      0.0000
+   1119.1000   1483.8500      0.0000      0.0000
+   1119.6000   1483.8300      0.0000      0.0000
+   1120.1000   1483.8300      0.0000      0.0000
+   1120.6000   1483.8400      0.0000      0.0000
+   1121.1000   1483.8200      0.0000      0.0000
+   1121.6000   1483.7900      0.0000      0.0000
+   1122.1000   1483.8200      0.0000      0.0000
+   1122.6000   1483.8200      0.0000      0.0000
+   1123.1000   1483.8100      0.0000      0.0000
+   1123.6000   1483.8100      0.0000      0.0000
+   1124.1000   1483.8000      0.0000      0.0000
+   1124.6000   1483.8000      0.0000      0.0000
+   1125.1000   1483.8100      0.0000      0.0000
+   1125.6000   1483.8100      0.0000      0.0000
+   1126.1000   1483.8100      0.0000      0.0000
+   1126.6000   1483.8100      0.0000      0.0000
+   1127.1000   1483.8100      0.0000      0.0000
+   1127.6000   1483.8200      0.0000      0.0000
+   1128.1000   1483.8300      0.0000      0.0000
+   1128.6000   1483.8400      0.0000      0.0000
+   1129.1000   1483.8300      0.0000      0.0000
+   1129.5000   1483.8400      0.0000      0.0000
+   1130.0000   1483.8300      0.0000      0.0000
+   1130.5000   1483.8300      0.0000      0.0000
+   1131.0000   1483.8400      0.0000      0.0000
+   1131.5000   1483.8400      0.0000      0.0000
+   1132.0000   1483.8400      0.0000      0.0000
+   1132.5000   1483.8600      0.0000      0.0000
+   1133.0000   1483.8500      0.0000      0.0000
+   1133.5000   1483.8600      0.0000      0.0000
+   1134.0000   1483.8700      0.0000      0.0000
+   1134.5000   1483.8700      0.0000      0.0000
+   1135.0000   1483.8600      0.0000      0.0000
+   1135.5000   1483.8600      0.0000      0.0000
+   1136.0000   1483.8700      0.0000      0.0000
+   1136.5000   1483.8800      0.0000      0.0000
+   1137.0000   1483.8800      0.0000      0.0000
+   1137.5000   1483.8900      0.0000      0.0000
+   1138.0000   1483.9100      0.0000      0.0000
+   1138.5000   1483.9000      0.0000      0.0000
+   1139.0000   1483.9200      0.0000      0.0000
+   1139.5000   1483.9400      0.0000      0.0000
+   1140.0000   1483.9500      0.0000      0.0000
+   1140.4000   1483.9500      0.0000      0.0000
+   1140.9000   1483.9700      0.0000      0.0000
+   1141.4000   1483.9700      0.0000      0.0000
+   1141.9000   1483.9600      0.0000      0.0000
+   1142.4000   1483.9800      0.0000      0.0000
+   1142.9000   1483.9900      0.0000      0.0000
+   1143.4000   1484.0000      0.0000      0.0000
+   1143.9000   1484.0000      0.0000      0.0000
+   1144.4000   1484.0200      0.0000      0.0000
+   1144.9000   1484.0000      0.0000      0.0000
+   1145.4000   1484.0200      0.0000      0.0000
+   1145.9000   1484.0300      0.0000      0.0000
+   1146.4000   1484.0200      0.0000      0.0000
+   1146.9000   1484.0200      0.0000      0.0000
+   1147.4000   1484.0300      0.0000      0.0000
+   1147.9000   1484.0300      0.0000      0.0000
+   1148.4000   1484.0600      0.0000      0.0000
+   1148.9000   1484.0600      0.0000      0.0000
+   1149.4000   1484.0600      0.0000      0.0000
+   1149.8000   1484.0500      0.0000      0.0000
+   1150.3000   1484.0400      0.0000      0.0000
+   1150.8000   1484.0800      0.0000      0.0000
+   1151.3000   1484.0900      0.0000      0.0000
+   1151.8000   1484.0900      0.0000      0.0000
+   1152.3000   1484.0800      0.0000      0.0000
+   1152.8000   1484.0700      0.0000      0.0000
+   1153.3000   1484.0600      0.0000      0.0000
+   1153.8000   1484.0700      0.0000      0.0000
+   1154.3000   1484.0700      0.0000      0.0000
+   1154.8000   1484.0600      0.0000      0.0000
+   1155.3000   1484.0600      0.0000      0.0000
+   1155.8000   1484.0500      0.0000      0.0000
+   1156.3000   1484.0600      0.0000      0.0000
+   1156.8000   1484.0700      0.0000      0.0000
+   1157.3000   1484.0900      0.0000      0.0000
+   1157.8000   1484.1000      0.0000      0.0000
+   1158.3000   1484.1100      0.0000      0.0000
+   1158.7000   1484.1200      0.0000      0.0000
+   1159.2000   1484.1300      0.0000      0.0000
+   1159.7000   1484.1400      0.0000      0.0000
+   1160.2000   1484.1500      0.0000      0.0000
+   1160.7000   1484.1600      0.0000      0.0000
+   1161.2000   1484.1700      0.0000      0.0000
+   1161.7000   1484.1700      0.0000      0.0000
+   1162.2000   1484.1700      0.0000      0.0000
+   1162.7000   1484.1700      0.0000      0.0000
+   1163.2000   1484.1800      0.0000      0.0000
+   1163.7000   1484.1800      0.0000      0.0000
+   1164.2000   1484.2000      0.0000      0.0000
+   1164.7000   1484.1800      0.0000      0.0000
+   1165.2000   1484.2100      0.0000      0.0000
+   1165.7000   1484.1900      0.0000      0.0000
+   1166.2000   1484.1700      0.0000      0.0000
+   1166.6000   1484.1700      0.0000      0.0000
+   1167.1000   1484.1700      0.0000      0.0000
+   1167.6000   1484.1900      0.0000      0.0000
+   1168.1000   1484.1800      0.0000      0.0000
+   1168.6000   1484.1900      0.0000      0.0000
+   1169.1000   1484.2100      0.0000      0.0000
+   1169.6000   1484.2100      0.0000      0.0000
+   1170.1000   1484.2100      0.0000      0.0000
+   1170.6000   1484.2100      0.0000      0.0000
+   1171.1000   1484.2100      0.0000      0.0000
+   1171.6000   1484.2200      0.0000      0.0000
+   1172.1000   1484.2300      0.0000      0.0000
+   1172.6000   1484.2300      0.0000      0.0000
+   1173.1000   1484.2400      0.0000      0.0000
+   1173.6000   1484.2500      0.0000      0.0000
+   1174.0000   1484.2600      0.0000      0.0000
+   1174.5000   1484.2500      0.0000      0.0000
+   1175.0000   1484.2600      0.0000      0.0000
+   1175.5000   1484.2600      0.0000      0.0000
+   1176.0000   1484.2700      0.0000      0.0000
+   1176.5000   1484.2600      0.0000      0.0000
+   1177.0000   1484.2900      0.0000      0.0000
+   1177.5000   1484.2800      0.0000      0.0000
+   1178.0000   1484.2900      0.0000      0.0000
+   1178.5000   1484.2900      0.0000      0.0000
+   1179.0000   1484.3000      0.0000      0.0000
+   1179.5000   1484.3100      0.0000      0.0000
+   1180.0000   1484.3300      0.0000      0.0000
+   1180.5000   1484.3300      0.0000      0.0000
+   1180.9000   1484.3300      0.0000      0.0000
+   1181.4000   1484.3500      0.0000      0.0000
+   1181.9000   1484.3600      0.0000      0.0000
+   1182.4000   1484.3600      0.0000      0.0000
+   1182.9000   1484.3700      0.0000      0.0000
+   1183.4000   1484.3600      0.0000      0.0000
+   1183.9000   1484.3800      0.0000      0.0000
+   1184.4000   1484.3700      0.0000      0.0000
+   1184.9000   1484.3600      0.0000      0.0000
+   1185.4000   1484.3600      0.0000      0.0000
+   1185.9000   1484.3700      0.0000      0.0000
+   1186.4000   1484.3700      0.0000      0.0000
+   1186.9000   1484.3800      0.0000      0.0000
+   1187.3000   1484.3900      0.0000      0.0000
+   1187.8000   1484.4000      0.0000      0.0000
+   1188.3000   1484.4100      0.0000      0.0000
+   1188.8000   1484.4100      0.0000      0.0000
+   1189.3000   1484.4200      0.0000      0.0000
+   1189.8000   1484.4300      0.0000      0.0000
+   1190.3000   1484.4300      0.0000      0.0000
+   1190.8000   1484.4400      0.0000      0.0000
+   1191.3000   1484.4500      0.0000      0.0000
+   1191.8000   1484.4500      0.0000      0.0000
+   1192.3000   1484.4600      0.0000      0.0000
+   1192.8000   1484.4500      0.0000      0.0000
+   1193.3000   1484.4100      0.0000      0.0000
+   1193.7000   1484.4000      0.0000      0.0000
+   1194.2000   1484.4000      0.0000      0.0000
+   1194.7000   1484.4100      0.0000      0.0000
+   1195.2000   1484.4200      0.0000      0.0000
+   1195.7000   1484.4300      0.0000      0.0000
+   1196.2000   1484.4400      0.0000      0.0000
+   1196.7000   1484.4500      0.0000      0.0000
+   1197.2000   1484.4600      0.0000      0.0000
+   1197.7000   1484.4700      0.0000      0.0000
+   1198.2000   1484.4700      0.0000      0.0000
+   1198.7000   1484.4800      0.0000      0.0000
+   1199.2000   1484.4800      0.0000      0.0000
+   1199.6000   1484.4800      0.0000      0.0000
+   1200.1000   1484.4900      0.0000      0.0000
+   1200.6000   1484.4800      0.0000      0.0000
+   1201.1000   1484.4900      0.0000      0.0000
+   1201.6000   1484.5000      0.0000      0.0000
+   1202.1000   1484.5000      0.0000      0.0000
+   1202.6000   1484.5100      0.0000      0.0000
+   1203.1000   1484.5000      0.0000      0.0000
+   1203.6000   1484.4800      0.0000      0.0000
+   1204.1000   1484.5000      0.0000      0.0000
+   1204.6000   1484.4900      0.0000      0.0000
+   1205.0000   1484.5000      0.0000      0.0000
+   1205.5000   1484.5000      0.0000      0.0000
+   1206.0000   1484.5000      0.0000      0.0000
+   1206.5000   1484.5000      0.0000      0.0000
+   1207.0000   1484.4900      0.0000      0.0000
+   1207.5000   1484.5000      0.0000      0.0000
+   1208.0000   1484.5100      0.0000      0.0000
+   1208.5000   1484.5100      0.0000      0.0000
+   1209.0000   1484.5100      0.0000      0.0000
+   1209.5000   1484.5000      0.0000      0.0000
+   1210.0000   1484.5000      0.0000      0.0000
+   1210.5000   1484.5100      0.0000      0.0000
+   1210.9000   1484.5200      0.0000      0.0000
+   1211.4000   1484.5300      0.0000      0.0000
+   1211.9000   1484.5300      0.0000      0.0000
+   1212.4000   1484.5400      0.0000      0.0000
+   1212.9000   1484.5400      0.0000      0.0000
+   1213.4000   1484.5600      0.0000      0.0000
+   1213.9000   1484.5200      0.0000      0.0000
+   1214.4000   1484.5500      0.0000      0.0000
+   1214.9000   1484.5500      0.0000      0.0000
+   1215.4000   1484.5600      0.0000      0.0000
+   1215.8000   1484.5600      0.0000      0.0000
+   1216.3000   1484.5800      0.0000      0.0000
+   1216.8000   1484.5800      0.0000      0.0000
+   1217.3000   1484.5800      0.0000      0.0000
+   1217.8000   1484.5900      0.0000      0.0000
+   1218.3000   1484.6000      0.0000      0.0000
+   1218.8000   1484.6000      0.0000      0.0000
+   1219.3000   1484.6100      0.0000      0.0000
+   1219.8000   1484.6300      0.0000      0.0000
+   1220.3000   1484.6400      0.0000      0.0000
+   1220.8000   1484.6500      0.0000      0.0000
+   1221.2000   1484.6500      0.0000      0.0000
+   1221.7000   1484.6600      0.0000      0.0000
+   1222.2000   1484.6900      0.0000      0.0000
+   1222.7000   1484.6900      0.0000      0.0000
+   1223.2000   1484.6800      0.0000      0.0000
+   1223.7000   1484.6900      0.0000      0.0000
+   1224.2000   1484.7100      0.0000      0.0000
+   1224.7000   1484.7100      0.0000      0.0000
+   1225.2000   1484.7000      0.0000      0.0000
+   1225.7000   1484.7000      0.0000      0.0000
+   1226.1000   1484.7000      0.0000      0.0000
+   1226.6000   1484.7000      0.0000      0.0000
+   1227.1000   1484.6800      0.0000      0.0000
+   1227.6000   1484.6800      0.0000      0.0000
+   1228.1000   1484.6900      0.0000      0.0000
+   1228.6000   1484.7000      0.0000      0.0000
+   1229.1000   1484.7100      0.0000      0.0000
+   1229.6000   1484.7200      0.0000      0.0000
+   1230.1000   1484.7200      0.0000      0.0000
+   1230.6000   1484.7100      0.0000      0.0000
+   1231.0000   1484.7200      0.0000      0.0000
+   1231.5000   1484.7200      0.0000      0.0000
+   1232.0000   1484.7300      0.0000      0.0000
+   1232.5000   1484.7200      0.0000      0.0000
+   1233.0000   1484.7100      0.0000      0.0000
+   1233.5000   1484.7200      0.0000      0.0000
+   1234.0000   1484.7200      0.0000      0.0000
+   1234.5000   1484.7300      0.0000      0.0000
+   1235.0000   1484.7300      0.0000      0.0000
+   1235.4000   1484.7400      0.0000      0.0000
+   1235.9000   1484.7500      0.0000      0.0000
+   1236.4000   1484.7600      0.0000      0.0000
+   1236.9000   1484.7700      0.0000      0.0000
+   1237.4000   1484.7700      0.0000      0.0000
+   1237.9000   1484.7800      0.0000      0.0000
+   1238.4000   1484.7800      0.0000      0.0000
+   1238.9000   1484.7900      0.0000      0.0000
+   1239.4000   1484.7900      0.0000      0.0000
+   1239.8000   1484.8000      0.0000      0.0000
+   1240.3000   1484.8100      0.0000      0.0000
+   1240.8000   1484.8200      0.0000      0.0000
+   1241.3000   1484.8200      0.0000      0.0000
+   1241.8000   1484.8200      0.0000      0.0000
+   1242.3000   1484.8200      0.0000      0.0000
+   1242.8000   1484.8200      0.0000      0.0000
+   1243.3000   1484.8200      0.0000      0.0000
+   1243.8000   1484.8300      0.0000      0.0000
+   1244.3000   1484.8300      0.0000      0.0000
+   1244.7000   1484.8200      0.0000      0.0000
+   1245.2000   1484.8200      0.0000      0.0000
+   1245.7000   1484.8300      0.0000      0.0000
+   1246.2000   1484.8300      0.0000      0.0000
+   1246.7000   1484.8200      0.0000      0.0000
+   1247.2000   1484.8200      0.0000      0.0000
+   1247.7000   1484.8200      0.0000      0.0000
+   1248.2000   1484.8200      0.0000      0.0000
+   1248.6000   1484.8000      0.0000      0.0000
+   1249.1000   1484.7900      0.0000      0.0000
+   1249.6000   1484.7900      0.0000      0.0000
+   1250.1000   1484.7900      0.0000      0.0000
+   1250.6000   1484.7900      0.0000      0.0000
+   1251.1000   1484.8000      0.0000      0.0000
+   1251.6000   1484.8100      0.0000      0.0000
+   1252.1000   1484.8000      0.0000      0.0000
+   1252.6000   1484.8000      0.0000      0.0000
+   1253.0000   1484.8100      0.0000      0.0000
+   1253.5000   1484.8000      0.0000      0.0000
+   1254.0000   1484.8000      0.0000      0.0000
+   1254.5000   1484.8000      0.0000      0.0000
+   1255.0000   1484.8200      0.0000      0.0000
+   1255.5000   1484.8100      0.0000      0.0000
+   1256.0000   1484.8200      0.0000      0.0000
+   1256.5000   1484.8100      0.0000      0.0000
+   1257.0000   1484.8000      0.0000      0.0000
+   1257.4000   1484.8000      0.0000      0.0000
+   1257.9000   1484.8000      0.0000      0.0000
+   1258.4000   1484.8100      0.0000      0.0000
+   1258.9000   1484.8000      0.0000      0.0000
+   1259.4000   1484.8000      0.0000      0.0000
+   1259.9000   1484.8000      0.0000      0.0000
+   1260.4000   1484.7800      0.0000      0.0000
+   1260.9000   1484.8000      0.0000      0.0000
+   1261.3000   1484.8000      0.0000      0.0000
+   1261.8000   1484.8100      0.0000      0.0000
+   1262.3000   1484.8100      0.0000      0.0000
+   1262.8000   1484.8200      0.0000      0.0000
+   1263.3000   1484.8300      0.0000      0.0000
+   1263.8000   1484.8300      0.0000      0.0000
+   1264.3000   1484.8400      0.0000      0.0000
+   1264.8000   1484.8400      0.0000      0.0000
+   1265.2000   1484.8500      0.0000      0.0000
+   1265.7000   1484.8600      0.0000      0.0000
+   1266.2000   1484.8600      0.0000      0.0000
+   1266.7000   1484.8700      0.0000      0.0000
+   1267.2000   1484.8800      0.0000      0.0000
+   1267.7000   1484.8800      0.0000      0.0000
+   1268.2000   1484.9000      0.0000      0.0000
+   1268.7000   1484.8900      0.0000      0.0000
+   1269.1000   1484.9000      0.0000      0.0000
+   1269.6000   1484.8900      0.0000      0.0000
+   1270.1000   1484.8800      0.0000      0.0000
+   1270.6000   1484.8900      0.0000      0.0000
+   1271.1000   1484.9000      0.0000      0.0000
+   1271.6000   1484.9100      0.0000      0.0000
+   1272.1000   1484.9000      0.0000      0.0000
+   1272.6000   1484.8900      0.0000      0.0000
+   1273.0000   1484.8800      0.0000      0.0000
+   1273.5000   1484.8800      0.0000      0.0000
+   1274.0000   1484.8900      0.0000      0.0000
+   1274.5000   1484.8900      0.0000      0.0000
+   1275.0000   1484.9100      0.0000      0.0000
+   1275.5000   1484.9200      0.0000      0.0000
+   1276.0000   1484.9100      0.0000      0.0000
+   1276.4000   1484.9200      0.0000      0.0000
+   1276.9000   1484.9200      0.0000      0.0000
+   1277.4000   1484.9200      0.0000      0.0000
+   1277.9000   1484.9600      0.0000      0.0000
+   1278.4000   1484.9600      0.0000      0.0000
+   1278.9000   1484.9400      0.0000      0.0000
+   1279.4000   1484.9600      0.0000      0.0000
+   1279.9000   1484.9600      0.0000      0.0000
+   1280.3000   1484.9600      0.0000      0.0000
+   1280.8000   1484.9900      0.0000      0.0000
+   1281.3000   1484.9800      0.0000      0.0000
+   1281.8000   1484.9900      0.0000      0.0000
+   1282.3000   1485.0000      0.0000      0.0000
+   1282.8000   1485.0100      0.0000      0.0000
+   1283.3000   1485.0100      0.0000      0.0000
+   1283.7000   1485.0200      0.0000      0.0000
+   1284.2000   1485.0400      0.0000      0.0000
+   1284.7000   1485.0400      0.0000      0.0000
+   1285.2000   1485.0400      0.0000      0.0000
+   1285.7000   1485.0500      0.0000      0.0000
+   1286.2000   1485.0500      0.0000      0.0000
+   1286.7000   1485.0600      0.0000      0.0000
+   1287.2000   1485.0800      0.0000      0.0000
+   1287.6000   1485.0700      0.0000      0.0000
+   1288.1000   1485.0800      0.0000      0.0000
+   1288.6000   1485.0900      0.0000      0.0000
+   1289.1000   1485.1000      0.0000      0.0000
+   1289.6000   1485.1000      0.0000      0.0000
+   1290.1000   1485.0900      0.0000      0.0000
+   1290.6000   1485.1000      0.0000      0.0000
+   1291.0000   1485.1000      0.0000      0.0000
+   1291.5000   1485.1100      0.0000      0.0000
+   1292.0000   1485.1200      0.0000      0.0000
+   1292.5000   1485.1300      0.0000      0.0000
+   1293.0000   1485.1400      0.0000      0.0000
+   1293.5000   1485.1500      0.0000      0.0000
+   1294.0000   1485.1500      0.0000      0.0000
+   1294.4000   1485.1700      0.0000      0.0000
+   1294.9000   1485.1500      0.0000      0.0000
+   1295.4000   1485.1600      0.0000      0.0000
+   1295.9000   1485.1900      0.0000      0.0000
+   1296.4000   1485.2000      0.0000      0.0000
+   1296.9000   1485.2100      0.0000      0.0000
+   1297.4000   1485.1900      0.0000      0.0000
+   1297.8000   1485.2000      0.0000      0.0000
+   1298.3000   1485.2200      0.0000      0.0000
+   1298.8000   1485.2200      0.0000      0.0000
+   1299.3000   1485.2200      0.0000      0.0000
+   1299.8000   1485.2200      0.0000      0.0000
+   1300.3000   1485.1900      0.0000      0.0000
+   1300.8000   1485.2100      0.0000      0.0000
+   1301.2000   1485.2200      0.0000      0.0000
+   1301.7000   1485.2300      0.0000      0.0000
+   1302.2000   1485.2500      0.0000      0.0000
+   1302.7000   1485.2600      0.0000      0.0000
+   1303.2000   1485.2600      0.0000      0.0000
+   1303.7000   1485.2800      0.0000      0.0000
+   1304.2000   1485.2800      0.0000      0.0000
+   1304.6000   1485.2800      0.0000      0.0000
+   1305.1000   1485.3100      0.0000      0.0000
+   1305.6000   1485.3000      0.0000      0.0000
+   1306.1000   1485.3300      0.0000      0.0000
+   1306.6000   1485.3300      0.0000      0.0000
+   1307.1000   1485.3400      0.0000      0.0000
+   1307.6000   1485.3400      0.0000      0.0000
+   1308.0000   1485.3600      0.0000      0.0000
+   1308.5000   1485.3500      0.0000      0.0000
+   1309.0000   1485.3500      0.0000      0.0000
+   1309.5000   1485.3400      0.0000      0.0000
+   1310.0000   1485.3400      0.0000      0.0000
+   1310.5000   1485.3500      0.0000      0.0000
+   1310.9000   1485.3400      0.0000      0.0000
+   1311.4000   1485.3300      0.0000      0.0000
+   1311.9000   1485.3300      0.0000      0.0000
+   1312.4000   1485.3200      0.0000      0.0000
+   1312.9000   1485.3200      0.0000      0.0000
+   1313.4000   1485.3500      0.0000      0.0000
+   1313.9000   1485.3300      0.0000      0.0000
+   1314.3000   1485.3500      0.0000      0.0000
+   1314.8000   1485.3700      0.0000      0.0000
+   1315.3000   1485.3900      0.0000      0.0000
+   1315.8000   1485.3900      0.0000      0.0000
+   1316.3000   1485.3900      0.0000      0.0000
+   1316.8000   1485.3900      0.0000      0.0000
+   1317.2000   1485.4000      0.0000      0.0000
+   1317.7000   1485.4000      0.0000      0.0000
+   1318.2000   1485.4000      0.0000      0.0000
+   1318.7000   1485.4100      0.0000      0.0000
+   1319.2000   1485.4100      0.0000      0.0000
+   1319.7000   1485.4300      0.0000      0.0000
+   1320.2000   1485.4200      0.0000      0.0000
+   1320.6000   1485.4400      0.0000      0.0000
+   1321.1000   1485.4300      0.0000      0.0000
+   1321.6000   1485.4500      0.0000      0.0000
+   1322.1000   1485.4500      0.0000      0.0000
+   1322.6000   1485.4600      0.0000      0.0000
+   1323.1000   1485.4500      0.0000      0.0000
+   1323.5000   1485.4600      0.0000      0.0000
+   1324.0000   1485.4500      0.0000      0.0000
+   1324.5000   1485.4800      0.0000      0.0000
+   1325.0000   1485.4800      0.0000      0.0000
+   1325.5000   1485.4800      0.0000      0.0000
+   1326.0000   1485.5000      0.0000      0.0000
+   1326.4000   1485.5100      0.0000      0.0000
+   1326.9000   1485.5100      0.0000      0.0000
+   1327.4000   1485.5200      0.0000      0.0000
+   1327.9000   1485.5400      0.0000      0.0000
+   1328.4000   1485.5400      0.0000      0.0000
+   1328.9000   1485.5600      0.0000      0.0000
+   1329.3000   1485.5500      0.0000      0.0000
+   1329.8000   1485.5700      0.0000      0.0000
+   1330.3000   1485.5800      0.0000      0.0000
+   1330.8000   1485.5800      0.0000      0.0000
+   1331.3000   1485.5800      0.0000      0.0000
+   1331.8000   1485.5900      0.0000      0.0000
+   1332.2000   1485.5900      0.0000      0.0000
+   1332.7000   1485.6000      0.0000      0.0000
+   1333.2000   1485.6000      0.0000      0.0000
+   1333.7000   1485.6100      0.0000      0.0000
+   1334.2000   1485.6200      0.0000      0.0000
+   1334.7000   1485.6100      0.0000      0.0000
+   1335.1000   1485.6000      0.0000      0.0000
+   1335.6000   1485.6100      0.0000      0.0000
+   1336.1000   1485.6100      0.0000      0.0000
+   1336.6000   1485.6200      0.0000      0.0000
+   1337.1000   1485.6400      0.0000      0.0000
+   1337.6000   1485.6000      0.0000      0.0000
+   1338.0000   1485.6200      0.0000      0.0000
+   1338.5000   1485.6100      0.0000      0.0000
+   1339.0000   1485.6400      0.0000      0.0000
+   1339.5000   1485.6400      0.0000      0.0000
+   1340.0000   1485.6100      0.0000      0.0000
+   1340.5000   1485.6100      0.0000      0.0000
+   1340.9000   1485.6200      0.0000      0.0000
+   1341.4000   1485.6300      0.0000      0.0000
+   1341.9000   1485.6400      0.0000      0.0000
+   1342.4000   1485.6400      0.0000      0.0000
+   1342.9000   1485.6400      0.0000      0.0000
+   1343.4000   1485.6500      0.0000      0.0000
+   1343.8000   1485.6600      0.0000      0.0000
+   1344.3000   1485.6600      0.0000      0.0000
+   1344.8000   1485.6600      0.0000      0.0000
+   1345.3000   1485.6600      0.0000      0.0000
+   1345.8000   1485.6700      0.0000      0.0000
+   1346.3000   1485.6700      0.0000      0.0000
+   1346.7000   1485.6700      0.0000      0.0000
+   1347.2000   1485.6900      0.0000      0.0000
+   1347.7000   1485.7000      0.0000      0.0000
+   1348.2000   1485.7000      0.0000      0.0000
+   1348.7000   1485.7100      0.0000      0.0000
+   1349.2000   1485.7100      0.0000      0.0000
+   1349.6000   1485.7300      0.0000      0.0000
+   1350.1000   1485.7300      0.0000      0.0000
+   1350.6000   1485.7400      0.0000      0.0000
+   1351.1000   1485.7400      0.0000      0.0000
+   1351.6000   1485.7400      0.0000      0.0000
+   1352.0000   1485.7500      0.0000      0.0000
+   1352.5000   1485.7400      0.0000      0.0000
+   1353.0000   1485.7400      0.0000      0.0000
+   1353.5000   1485.7400      0.0000      0.0000
+   1354.0000   1485.7600      0.0000      0.0000
+   1354.5000   1485.7500      0.0000      0.0000
+   1354.9000   1485.7500      0.0000      0.0000
+   1355.4000   1485.7500      0.0000      0.0000
+   1355.9000   1485.7400      0.0000      0.0000
+   1356.4000   1485.7300      0.0000      0.0000
+   1356.9000   1485.7500      0.0000      0.0000
+   1357.3000   1485.7400      0.0000      0.0000
+   1357.8000   1485.7300      0.0000      0.0000
+   1358.3000   1485.7500      0.0000      0.0000
+   1358.8000   1485.7400      0.0000      0.0000
+   1359.3000   1485.7600      0.0000      0.0000
+   1359.8000   1485.7400      0.0000      0.0000
+   1360.2000   1485.7500      0.0000      0.0000
+   1360.7000   1485.7500      0.0000      0.0000
+   1361.2000   1485.7500      0.0000      0.0000
+   1361.7000   1485.7600      0.0000      0.0000
+   1362.2000   1485.7700      0.0000      0.0000
+   1362.6000   1485.7800      0.0000      0.0000
+   1363.1000   1485.7900      0.0000      0.0000
+   1363.6000   1485.8100      0.0000      0.0000
+   1364.1000   1485.8100      0.0000      0.0000
+   1364.6000   1485.8100      0.0000      0.0000
+   1365.1000   1485.8000      0.0000      0.0000
+   1365.5000   1485.7900      0.0000      0.0000
+   1366.0000   1485.7900      0.0000      0.0000
+   1366.5000   1485.8000      0.0000      0.0000
+   1367.0000   1485.7900      0.0000      0.0000
+   1367.5000   1485.8100      0.0000      0.0000
+   1367.9000   1485.8100      0.0000      0.0000
+   1368.4000   1485.8400      0.0000      0.0000
+   1368.9000   1485.8400      0.0000      0.0000
+   1369.4000   1485.8500      0.0000      0.0000
+   1369.9000   1485.8500      0.0000      0.0000
+   1370.4000   1485.8600      0.0000      0.0000
+   1370.8000   1485.8600      0.0000      0.0000
+   1371.3000   1485.8900      0.0000      0.0000
+   1371.8000   1485.8800      0.0000      0.0000
+   1372.3000   1485.9000      0.0000      0.0000
+   1372.8000   1485.9000      0.0000      0.0000
+   1373.2000   1485.9000      0.0000      0.0000
+   1373.7000   1485.9200      0.0000      0.0000
+   1374.2000   1485.9200      0.0000      0.0000
+   1374.7000   1485.9200      0.0000      0.0000
+   1375.2000   1485.9200      0.0000      0.0000
+   1375.6000   1485.9100      0.0000      0.0000
+   1376.1000   1485.8900      0.0000      0.0000
+   1376.6000   1485.9100      0.0000      0.0000
+   1377.1000   1485.9000      0.0000      0.0000
+   1377.6000   1485.9100      0.0000      0.0000
+   1378.0000   1485.9200      0.0000      0.0000
+   1378.5000   1485.9400      0.0000      0.0000
+   1379.0000   1485.9300      0.0000      0.0000
+   1379.5000   1485.9500      0.0000      0.0000
+   1380.0000   1485.9500      0.0000      0.0000
+   1380.4000   1485.9600      0.0000      0.0000
+   1380.9000   1485.9800      0.0000      0.0000
+   1381.4000   1485.9900      0.0000      0.0000
+   1381.9000   1485.9800      0.0000      0.0000
+   1382.4000   1485.9900      0.0000      0.0000
+   1382.9000   1485.9900      0.0000      0.0000
+   1383.3000   1485.9900      0.0000      0.0000
+   1383.8000   1486.0100      0.0000      0.0000
+   1384.3000   1486.0100      0.0000      0.0000
+   1384.8000   1486.0100      0.0000      0.0000
+   1385.3000   1486.0100      0.0000      0.0000
+   1385.7000   1486.0300      0.0000      0.0000
+   1386.2000   1486.0200      0.0000      0.0000
+   1386.7000   1486.0400      0.0000      0.0000
+   1387.2000   1486.0400      0.0000      0.0000
+   1387.7000   1486.0400      0.0000      0.0000
+   1388.1000   1486.0400      0.0000      0.0000
+   1388.6000   1486.0600      0.0000      0.0000
+   1389.1000   1486.0500      0.0000      0.0000
+   1389.6000   1486.0500      0.0000      0.0000
+   1390.1000   1486.0500      0.0000      0.0000
+   1390.5000   1486.0300      0.0000      0.0000
+   1391.0000   1486.0300      0.0000      0.0000
+   1391.5000   1486.0300      0.0000      0.0000
+   1392.0000   1486.0100      0.0000      0.0000
+   1392.5000   1486.0000      0.0000      0.0000
+   1392.9000   1485.9800      0.0000      0.0000
+   1393.4000   1485.9900      0.0000      0.0000
+   1393.9000   1486.0000      0.0000      0.0000
+   1394.4000   1486.0000      0.0000      0.0000
+   1394.9000   1486.0100      0.0000      0.0000
+   1395.3000   1486.0100      0.0000      0.0000
+   1395.8000   1486.0300      0.0000      0.0000
+   1396.3000   1486.0300      0.0000      0.0000
+   1396.8000   1486.0200      0.0000      0.0000
+   1397.3000   1486.0100      0.0000      0.0000
+   1397.7000   1486.0200      0.0000      0.0000
+   1398.2000   1486.0100      0.0000      0.0000
+   1398.7000   1486.0200      0.0000      0.0000
+   1399.2000   1486.0300      0.0000      0.0000
+   1399.6000   1486.0500      0.0000      0.0000
+   1400.1000   1486.0200      0.0000      0.0000
+   1400.6000   1486.0500      0.0000      0.0000
+   1401.1000   1486.0200      0.0000      0.0000
+   1401.6000   1486.0400      0.0000      0.0000
+   1402.0000   1486.1000      0.0000      0.0000
+   1402.5000   1486.0500      0.0000      0.0000
+   1403.0000   1486.0900      0.0000      0.0000
+   1403.5000   1486.0800      0.0000      0.0000
+   1404.0000   1486.0700      0.0000      0.0000
+   1404.4000   1486.0700      0.0000      0.0000
+   1404.9000   1486.0800      0.0000      0.0000
+   1405.4000   1486.1000      0.0000      0.0000
+   1405.9000   1486.1000      0.0000      0.0000
+   1406.4000   1486.1100      0.0000      0.0000
+   1406.8000   1486.1100      0.0000      0.0000
+   1407.3000   1486.1100      0.0000      0.0000
+   1407.8000   1486.1200      0.0000      0.0000
+   1408.3000   1486.1200      0.0000      0.0000
+   1408.8000   1486.1200      0.0000      0.0000
+   1409.2000   1486.1200      0.0000      0.0000
+   1409.7000   1486.1200      0.0000      0.0000
+   1410.2000   1486.1300      0.0000      0.0000
+   1410.7000   1486.1100      0.0000      0.0000
+   1411.1000   1486.1300      0.0000      0.0000
+   1411.6000   1486.1300      0.0000      0.0000
+   1412.1000   1486.1200      0.0000      0.0000
+   1412.6000   1486.1300      0.0000      0.0000
+   1413.1000   1486.1300      0.0000      0.0000
+   1413.5000   1486.1300      0.0000      0.0000
+   1414.0000   1486.1500      0.0000      0.0000
+   1414.5000   1486.1600      0.0000      0.0000
+   1415.0000   1486.1700      0.0000      0.0000
+   1415.5000   1486.1700      0.0000      0.0000
+   1415.9000   1486.1800      0.0000      0.0000
+   1416.4000   1486.1900      0.0000      0.0000
+   1416.9000   1486.2000      0.0000      0.0000
+   1417.4000   1486.2000      0.0000      0.0000
+   1417.8000   1486.2200      0.0000      0.0000
+   1418.3000   1486.2100      0.0000      0.0000
+   1418.8000   1486.2100      0.0000      0.0000
+   1419.3000   1486.2300      0.0000      0.0000
+   1419.8000   1486.2200      0.0000      0.0000
+   1420.2000   1486.2400      0.0000      0.0000
+   1420.7000   1486.2500      0.0000      0.0000
+   1421.2000   1486.2500      0.0000      0.0000
+   1421.7000   1486.2500      0.0000      0.0000
+   1422.1000   1486.2700      0.0000      0.0000
+   1422.6000   1486.2600      0.0000      0.0000
+   1423.1000   1486.2700      0.0000      0.0000
+   1423.6000   1486.2700      0.0000      0.0000
+   1424.1000   1486.2800      0.0000      0.0000
+   1424.5000   1486.2900      0.0000      0.0000
+   1425.0000   1486.3000      0.0000      0.0000
+   1425.5000   1486.2900      0.0000      0.0000
+   1426.0000   1486.2700      0.0000      0.0000
+   1426.4000   1486.2700      0.0000      0.0000
+   1426.9000   1486.2700      0.0000      0.0000
+   1427.4000   1486.2700      0.0000      0.0000
+   1427.9000   1486.2600      0.0000      0.0000
+   1428.4000   1486.2600      0.0000      0.0000
+   1428.8000   1486.2600      0.0000      0.0000
+   1429.3000   1486.2500      0.0000      0.0000
+   1429.8000   1486.2600      0.0000      0.0000
+   1430.3000   1486.2700      0.0000      0.0000
+   1430.7000   1486.2800      0.0000      0.0000
+   1431.2000   1486.3000      0.0000      0.0000
+   1431.7000   1486.2900      0.0000      0.0000
+   1432.2000   1486.3000      0.0000      0.0000
+   1432.7000   1486.2900      0.0000      0.0000
+   1433.1000   1486.3200      0.0000      0.0000
+   1433.6000   1486.3200      0.0000      0.0000
+   1434.1000   1486.3400      0.0000      0.0000
+   1434.6000   1486.3400      0.0000      0.0000
+   1435.0000   1486.3300      0.0000      0.0000
+   1435.5000   1486.3300      0.0000      0.0000
+   1436.0000   1486.3300      0.0000      0.0000
+   1436.5000   1486.3300      0.0000      0.0000
+   1436.9000   1486.3300      0.0000      0.0000
+   1437.4000   1486.3400      0.0000      0.0000
+   1437.9000   1486.3400      0.0000      0.0000
+   1438.4000   1486.3600      0.0000      0.0000
+   1438.9000   1486.3600      0.0000      0.0000
+   1439.3000   1486.3900      0.0000      0.0000
+   1439.8000   1486.3700      0.0000      0.0000
+   1440.3000   1486.3700      0.0000      0.0000
+   1440.8000   1486.3900      0.0000      0.0000
+   1441.2000   1486.3900      0.0000      0.0000
+   1441.7000   1486.3800      0.0000      0.0000
+   1442.2000   1486.4000      0.0000      0.0000
+   1442.7000   1486.3900      0.0000      0.0000
+   1443.1000   1486.4000      0.0000      0.0000
+   1443.6000   1486.4100      0.0000      0.0000
+   1444.1000   1486.4300      0.0000      0.0000
+   1444.6000   1486.4400      0.0000      0.0000
+   1445.1000   1486.4400      0.0000      0.0000
+   1445.5000   1486.4500      0.0000      0.0000
+   1446.0000   1486.4500      0.0000      0.0000
+   1446.5000   1486.4700      0.0000      0.0000
+   1447.0000   1486.4800      0.0000      0.0000
+   1447.4000   1486.4900      0.0000      0.0000
+   1447.9000   1486.4900      0.0000      0.0000
+   1448.4000   1486.5000      0.0000      0.0000
+   1448.9000   1486.5100      0.0000      0.0000
+   1449.3000   1486.5000      0.0000      0.0000
+   1449.8000   1486.5000      0.0000      0.0000
+   1450.3000   1486.5100      0.0000      0.0000
+   1450.8000   1486.5200      0.0000      0.0000
+   1451.2000   1486.5100      0.0000      0.0000
+   1451.7000   1486.5000      0.0000      0.0000
+   1452.2000   1486.5100      0.0000      0.0000
+   1452.7000   1486.5200      0.0000      0.0000
+   1453.2000   1486.5200      0.0000      0.0000
+   1453.6000   1486.5200      0.0000      0.0000
+   1454.1000   1486.5200      0.0000      0.0000
+   1454.6000   1486.5300      0.0000      0.0000
+   1455.1000   1486.5300      0.0000      0.0000
+   1455.5000   1486.5500      0.0000      0.0000
+   1456.0000   1486.5400      0.0000      0.0000
+   1456.5000   1486.5400      0.0000      0.0000
+   1457.0000   1486.5300      0.0000      0.0000
+   1457.4000   1486.5500      0.0000      0.0000
+   1457.9000   1486.5600      0.0000      0.0000
+   1458.4000   1486.5500      0.0000      0.0000
+   1458.9000   1486.5800      0.0000      0.0000
+   1459.3000   1486.5800      0.0000      0.0000
+   1459.8000   1486.5900      0.0000      0.0000
+   1460.3000   1486.5900      0.0000      0.0000
+   1460.8000   1486.5900      0.0000      0.0000
+   1461.2000   1486.5900      0.0000      0.0000
+   1461.7000   1486.6100      0.0000      0.0000
+   1462.2000   1486.5900      0.0000      0.0000
+   1462.7000   1486.6200      0.0000      0.0000
+   1463.1000   1486.6200      0.0000      0.0000
+   1463.6000   1486.6400      0.0000      0.0000
+   1464.1000   1486.6400      0.0000      0.0000
+   1464.6000   1486.6500      0.0000      0.0000
+   1465.0000   1486.6500      0.0000      0.0000
+   1465.5000   1486.6600      0.0000      0.0000
+   1466.0000   1486.6600      0.0000      0.0000
+   1466.5000   1486.6700      0.0000      0.0000
+   1466.9000   1486.7000      0.0000      0.0000
+   1467.4000   1486.6800      0.0000      0.0000
+   1467.9000   1486.7100      0.0000      0.0000
+   1468.4000   1486.7000      0.0000      0.0000
+   1468.8000   1486.7100      0.0000      0.0000
+   1469.3000   1486.7100      0.0000      0.0000
+   1469.8000   1486.7400      0.0000      0.0000
+   1470.3000   1486.7100      0.0000      0.0000
+   1470.7000   1486.7400      0.0000      0.0000
+   1471.2000   1486.7200      0.0000      0.0000
+   1471.7000   1486.7400      0.0000      0.0000
+   1472.2000   1486.7500      0.0000      0.0000
+   1472.6000   1486.7500      0.0000      0.0000
+   1473.1000   1486.7600      0.0000      0.0000
+   1473.6000   1486.7400      0.0000      0.0000
+   1474.1000   1486.7600      0.0000      0.0000
+   1474.5000   1486.7400      0.0000      0.0000
+   1475.0000   1486.7600      0.0000      0.0000
+   1475.5000   1486.7500      0.0000      0.0000
+   1476.0000   1486.7400      0.0000      0.0000
+   1476.4000   1486.7600      0.0000      0.0000
+   1476.9000   1486.7500      0.0000      0.0000
+   1477.4000   1486.7500      0.0000      0.0000
+   1477.9000   1486.7400      0.0000      0.0000
+   1478.3000   1486.7400      0.0000      0.0000
+   1478.8000   1486.7500      0.0000      0.0000
+   1479.3000   1486.7300      0.0000      0.0000
+   1479.8000   1486.7400      0.0000      0.0000
+   1480.2000   1486.7700      0.0000      0.0000
+   1480.7000   1486.7400      0.0000      0.0000
+   1481.2000   1486.7600      0.0000      0.0000
+   1481.7000   1486.7700      0.0000      0.0000
+   1482.1000   1486.7700      0.0000      0.0000
+   1482.6000   1486.7800      0.0000      0.0000
+   1483.1000   1486.7900      0.0000      0.0000
+   1483.6000   1486.8100      0.0000      0.0000
+   1484.0000   1486.7800      0.0000      0.0000
+   1484.5000   1486.8100      0.0000      0.0000
+   1485.0000   1486.8000      0.0000      0.0000
+   1485.5000   1486.7700      0.0000      0.0000
+   1485.9000   1486.8200      0.0000      0.0000
+   1486.4000   1486.8000      0.0000      0.0000
+   1486.9000   1486.8100      0.0000      0.0000
+   1487.4000   1486.8100      0.0000      0.0000
+   1487.8000   1486.7900      0.0000      0.0000
+   1488.3000   1486.8200      0.0000      0.0000
+   1488.8000   1486.8200      0.0000      0.0000
+   1489.2000   1486.8400      0.0000      0.0000
+   1489.7000   1486.8400      0.0000      0.0000
+   1490.2000   1486.8500      0.0000      0.0000
+   1490.7000   1486.8500      0.0000      0.0000
+   1491.1000   1486.8500      0.0000      0.0000
+   1491.6000   1486.8400      0.0000      0.0000
+   1492.1000   1486.8600      0.0000      0.0000
+   1492.6000   1486.8600      0.0000      0.0000
+   1493.0000   1486.8600      0.0000      0.0000
+   1493.5000   1486.8800      0.0000      0.0000
+   1494.0000   1486.8800      0.0000      0.0000
+   1494.5000   1486.8700      0.0000      0.0000
+   1494.9000   1486.9000      0.0000      0.0000
+   1495.4000   1486.9000      0.0000      0.0000
+   1495.9000   1486.8900      0.0000      0.0000
+   1496.3000   1486.8900      0.0000      0.0000
+   1496.8000   1486.8800      0.0000      0.0000
+   1497.3000   1486.9000      0.0000      0.0000
+   1497.8000   1486.8900      0.0000      0.0000
+   1498.2000   1486.9100      0.0000      0.0000
+   1498.7000   1486.9200      0.0000      0.0000
+   1499.2000   1486.9100      0.0000      0.0000
+   1499.7000   1486.9000      0.0000      0.0000
+   1500.1000   1486.8900      0.0000      0.0000
+   1500.6000   1486.9100      0.0000      0.0000
+   1501.1000   1486.9100      0.0000      0.0000
+   1501.6000   1486.9500      0.0000      0.0000
+   1502.0000   1486.9400      0.0000      0.0000
+   1502.5000   1486.9400      0.0000      0.0000
+   1503.0000   1486.9500      0.0000      0.0000
+   1503.4000   1486.9400      0.0000      0.0000
+   1503.9000   1486.9600      0.0000      0.0000
+   1504.4000   1486.9800      0.0000      0.0000
+   1504.9000   1486.9900      0.0000      0.0000
+   1505.3000   1486.9900      0.0000      0.0000
+   1505.8000   1486.9800      0.0000      0.0000
+   1506.3000   1487.0300      0.0000      0.0000
+   1506.8000   1487.0200      0.0000      0.0000
+   1507.2000   1487.0200      0.0000      0.0000
+   1507.7000   1487.0200      0.0000      0.0000
+   1508.2000   1487.0400      0.0000      0.0000
+   1508.6000   1487.0400      0.0000      0.0000
+   1509.1000   1487.0500      0.0000      0.0000
+   1509.6000   1487.0600      0.0000      0.0000
+   1510.1000   1487.0600      0.0000      0.0000
+   1510.5000   1487.0800      0.0000      0.0000
+   1511.0000   1487.0900      0.0000      0.0000
+   1511.5000   1487.0800      0.0000      0.0000
+   1512.0000   1487.0800      0.0000      0.0000
+   1512.4000   1487.0800      0.0000      0.0000
+   1512.9000   1487.0900      0.0000      0.0000
+   1513.4000   1487.1100      0.0000      0.0000
+   1513.8000   1487.1000      0.0000      0.0000
+   1514.3000   1487.1300      0.0000      0.0000
+   1514.8000   1487.1300      0.0000      0.0000
+   1515.3000   1487.1400      0.0000      0.0000
+   1515.7000   1487.1500      0.0000      0.0000
+   1516.2000   1487.1500      0.0000      0.0000
+   1516.7000   1487.1500      0.0000      0.0000
+   1517.1000   1487.1600      0.0000      0.0000
+   1517.6000   1487.1700      0.0000      0.0000
+   1518.1000   1487.1600      0.0000      0.0000
+   1518.6000   1487.1800      0.0000      0.0000
+   1519.0000   1487.1800      0.0000      0.0000
+   1519.5000   1487.1700      0.0000      0.0000
+   1520.0000   1487.2000      0.0000      0.0000
+   1520.5000   1487.1900      0.0000      0.0000
+   1520.9000   1487.2000      0.0000      0.0000
+   1521.4000   1487.2300      0.0000      0.0000
+   1521.9000   1487.2200      0.0000      0.0000
+   1522.3000   1487.2200      0.0000      0.0000
+   1522.8000   1487.2300      0.0000      0.0000
+   1523.3000   1487.2300      0.0000      0.0000
+   1523.8000   1487.2400      0.0000      0.0000
+   1524.2000   1487.2200      0.0000      0.0000
+   1524.7000   1487.2400      0.0000      0.0000
+   1525.2000   1487.2400      0.0000      0.0000
+   1525.6000   1487.2600      0.0000      0.0000
+   1526.1000   1487.2500      0.0000      0.0000
+   1526.6000   1487.2700      0.0000      0.0000
+   1527.1000   1487.2800      0.0000      0.0000
+   1527.5000   1487.2700      0.0000      0.0000
+   1528.0000   1487.2700      0.0000      0.0000
+   1528.5000   1487.2800      0.0000      0.0000
+   1528.9000   1487.2900      0.0000      0.0000
+   1529.4000   1487.2900      0.0000      0.0000
+   1529.9000   1487.3100      0.0000      0.0000
+   1530.4000   1487.3000      0.0000      0.0000
+   1530.8000   1487.3100      0.0000      0.0000
+   1531.3000   1487.3100      0.0000      0.0000
+   1531.8000   1487.3200      0.0000      0.0000
+   1532.2000   1487.3200      0.0000      0.0000
+   1532.7000   1487.3300      0.0000      0.0000
+   1533.2000   1487.3200      0.0000      0.0000
+   1533.7000   1487.3200      0.0000      0.0000
+   1534.1000   1487.3400      0.0000      0.0000
+   1534.6000   1487.3500      0.0000      0.0000
+   1535.1000   1487.3600      0.0000      0.0000
+   1535.5000   1487.3800      0.0000      0.0000
+   1536.0000   1487.3700      0.0000      0.0000
+   1536.5000   1487.3900      0.0000      0.0000
+   1537.0000   1487.3900      0.0000      0.0000
+   1537.4000   1487.4000      0.0000      0.0000
+   1537.9000   1487.4100      0.0000      0.0000
+   1538.4000   1487.4300      0.0000      0.0000
+   1538.8000   1487.4300      0.0000      0.0000
+   1539.3000   1487.4300      0.0000      0.0000
+   1539.8000   1487.4600      0.0000      0.0000
+   1540.2000   1487.4600      0.0000      0.0000
+   1540.7000   1487.4700      0.0000      0.0000
+   1541.2000   1487.4700      0.0000      0.0000
+   1541.7000   1487.4700      0.0000      0.0000
+   1542.1000   1487.4800      0.0000      0.0000
+   1542.6000   1487.5000      0.0000      0.0000
+   1543.1000   1487.5100      0.0000      0.0000
+   1543.5000   1487.5100      0.0000      0.0000
+   1544.0000   1487.5100      0.0000      0.0000
+   1544.5000   1487.5200      0.0000      0.0000
+   1545.0000   1487.5300      0.0000      0.0000
+   1545.4000   1487.5200      0.0000      0.0000
+   1545.9000   1487.5200      0.0000      0.0000
+   1546.4000   1487.5300      0.0000      0.0000
+   1546.8000   1487.5300      0.0000      0.0000
+   1547.3000   1487.5200      0.0000      0.0000
+   1547.8000   1487.5400      0.0000      0.0000
+   1548.2000   1487.5500      0.0000      0.0000
+   1548.7000   1487.5600      0.0000      0.0000
+   1549.2000   1487.5700      0.0000      0.0000
+   1549.7000   1487.5800      0.0000      0.0000
+   1550.1000   1487.5900      0.0000      0.0000
+   1550.6000   1487.6000      0.0000      0.0000
+   1551.1000   1487.6200      0.0000      0.0000
+   1551.5000   1487.6100      0.0000      0.0000
+   1552.0000   1487.6200      0.0000      0.0000
+   1552.5000   1487.6200      0.0000      0.0000
+   1552.9000   1487.6200      0.0000      0.0000
+   1553.4000   1487.6300      0.0000      0.0000
+   1553.9000   1487.6300      0.0000      0.0000
+   1554.4000   1487.6300      0.0000      0.0000
+   1554.8000   1487.6400      0.0000      0.0000
+   1555.3000   1487.6400      0.0000      0.0000
+   1555.8000   1487.6500      0.0000      0.0000
+   1556.2000   1487.6300      0.0000      0.0000
+   1556.7000   1487.6500      0.0000      0.0000
+   1557.2000   1487.6400      0.0000      0.0000
+   1557.6000   1487.6500      0.0000      0.0000
+   1558.1000   1487.6700      0.0000      0.0000
+   1558.6000   1487.6800      0.0000      0.0000
+   1559.0000   1487.6800      0.0000      0.0000
+   1559.5000   1487.6900      0.0000      0.0000
+   1560.0000   1487.7000      0.0000      0.0000
+   1560.5000   1487.7200      0.0000      0.0000
+   1560.9000   1487.7100      0.0000      0.0000
+   1561.4000   1487.7300      0.0000      0.0000
+   1561.9000   1487.7500      0.0000      0.0000
+   1562.3000   1487.7300      0.0000      0.0000
+   1562.8000   1487.7400      0.0000      0.0000
+   1563.3000   1487.7400      0.0000      0.0000
+   1563.7000   1487.7400      0.0000      0.0000
+   1564.2000   1487.7400      0.0000      0.0000
+   1564.7000   1487.7600      0.0000      0.0000
+   1565.1000   1487.7500      0.0000      0.0000
+   1565.6000   1487.7600      0.0000      0.0000
+   1566.1000   1487.7800      0.0000      0.0000
+   1566.6000   1487.8000      0.0000      0.0000
+   1567.0000   1487.8000      0.0000      0.0000
+   1567.5000   1487.8300      0.0000      0.0000
+   1568.0000   1487.8100      0.0000      0.0000
+   1568.4000   1487.8300      0.0000      0.0000
+   1568.9000   1487.8400      0.0000      0.0000
+   1569.4000   1487.8400      0.0000      0.0000
+   1569.8000   1487.8400      0.0000      0.0000
+   1570.3000   1487.8400      0.0000      0.0000
+   1570.8000   1487.8500      0.0000      0.0000
+   1571.2000   1487.8600      0.0000      0.0000
+   1571.7000   1487.8600      0.0000      0.0000
+   1572.2000   1487.8600      0.0000      0.0000
+   1572.6000   1487.8700      0.0000      0.0000
+   1573.1000   1487.8900      0.0000      0.0000
+   1573.6000   1487.8900      0.0000      0.0000
+   1574.1000   1487.9000      0.0000      0.0000
+   1574.5000   1487.9000      0.0000      0.0000
+   1575.0000   1487.9000      0.0000      0.0000
+   1575.5000   1487.8400      0.0000      0.0000
+   1575.9000   1487.8200      0.0000      0.0000
+   1576.4000   1487.8200      0.0000      0.0000
+   1576.9000   1487.8300      0.0000      0.0000
+   1577.3000   1487.8400      0.0000      0.0000
+   1577.8000   1487.8500      0.0000      0.0000
+   1578.3000   1487.8600      0.0000      0.0000
+   1578.7000   1487.8700      0.0000      0.0000
+   1579.2000   1487.8700      0.0000      0.0000
+   1579.7000   1487.8700      0.0000      0.0000
+   1580.1000   1487.8800      0.0000      0.0000
+   1580.6000   1487.8700      0.0000      0.0000
+   1581.1000   1487.8700      0.0000      0.0000
+   1581.5000   1487.8800      0.0000      0.0000
+   1582.0000   1487.8800      0.0000      0.0000
+   1582.5000   1487.8700      0.0000      0.0000
+   1583.0000   1487.8900      0.0000      0.0000
+   1583.4000   1487.9000      0.0000      0.0000
+   1583.9000   1487.8900      0.0000      0.0000
+   1584.4000   1487.9000      0.0000      0.0000
+   1584.8000   1487.9400      0.0000      0.0000
+   1585.3000   1487.9100      0.0000      0.0000
+   1585.8000   1487.9400      0.0000      0.0000
+   1586.2000   1487.9400      0.0000      0.0000
+   1586.7000   1487.9400      0.0000      0.0000
+   1587.2000   1487.9600      0.0000      0.0000
+   1587.6000   1487.9500      0.0000      0.0000
+   1588.1000   1487.9500      0.0000      0.0000
+   1588.6000   1487.9500      0.0000      0.0000
+   1589.0000   1487.9500      0.0000      0.0000
+   1589.5000   1487.9700      0.0000      0.0000
+   1590.0000   1487.9800      0.0000      0.0000
+   1590.4000   1487.9800      0.0000      0.0000
+   1590.9000   1488.0100      0.0000      0.0000
+   1591.4000   1487.9900      0.0000      0.0000
+   1591.8000   1488.0100      0.0000      0.0000
+   1592.3000   1488.0200      0.0000      0.0000
+   1592.8000   1488.0300      0.0000      0.0000
+   1593.2000   1488.0300      0.0000      0.0000
+   1593.7000   1488.0400      0.0000      0.0000
+   1594.2000   1488.0400      0.0000      0.0000
+   1594.6000   1488.0500      0.0000      0.0000
+   1595.1000   1488.0600      0.0000      0.0000
+   1595.6000   1488.0500      0.0000      0.0000
+   1596.0000   1488.0600      0.0000      0.0000
+   1596.5000   1488.0700      0.0000      0.0000
+   1597.0000   1488.0600      0.0000      0.0000
+   1597.4000   1488.0700      0.0000      0.0000
+   1597.9000   1488.0800      0.0000      0.0000
+   1598.4000   1488.0900      0.0000      0.0000
+   1598.8000   1488.1000      0.0000      0.0000
+   1599.3000   1488.1000      0.0000      0.0000
+   1599.8000   1488.0800      0.0000      0.0000
+   1600.2000   1488.1000      0.0000      0.0000
+   1600.7000   1488.1000      0.0000      0.0000
+   1601.2000   1488.0800      0.0000      0.0000
+   1601.6000   1488.1000      0.0000      0.0000
+   1602.1000   1488.1300      0.0000      0.0000
+   1602.6000   1488.1300      0.0000      0.0000
+   1603.0000   1488.1500      0.0000      0.0000
+   1603.5000   1488.1400      0.0000      0.0000
+   1604.0000   1488.1500      0.0000      0.0000
+   1604.4000   1488.1500      0.0000      0.0000
+   1604.9000   1488.1400      0.0000      0.0000
+   1605.4000   1488.1500      0.0000      0.0000
+   1605.8000   1488.1600      0.0000      0.0000
+   1606.3000   1488.1600      0.0000      0.0000
+   1606.8000   1488.1800      0.0000      0.0000
+   1607.2000   1488.1900      0.0000      0.0000
+   1607.7000   1488.1900      0.0000      0.0000
+   1608.2000   1488.1900      0.0000      0.0000
+   1608.6000   1488.2000      0.0000      0.0000
+   1609.1000   1488.2100      0.0000      0.0000
+   1609.6000   1488.2000      0.0000      0.0000
+   1610.0000   1488.2100      0.0000      0.0000
+   1610.5000   1488.2200      0.0000      0.0000
+   1611.0000   1488.2200      0.0000      0.0000
+   1611.4000   1488.2200      0.0000      0.0000
+   1611.9000   1488.2200      0.0000      0.0000
+   1612.4000   1488.2400      0.0000      0.0000
+   1612.8000   1488.2500      0.0000      0.0000
+   1613.3000   1488.2600      0.0000      0.0000
+   1613.8000   1488.2500      0.0000      0.0000
+   1614.2000   1488.2600      0.0000      0.0000
+   1614.7000   1488.2800      0.0000      0.0000
+   1615.2000   1488.2800      0.0000      0.0000
+   1615.6000   1488.2800      0.0000      0.0000
+   1616.1000   1488.2900      0.0000      0.0000
+   1616.6000   1488.2800      0.0000      0.0000
+   1617.0000   1488.2900      0.0000      0.0000
+   1617.5000   1488.3000      0.0000      0.0000
+   1618.0000   1488.3000      0.0000      0.0000
+   1618.4000   1488.3100      0.0000      0.0000
+   1618.9000   1488.3100      0.0000      0.0000
+   1619.4000   1488.3100      0.0000      0.0000
+   1619.8000   1488.3300      0.0000      0.0000
+   1620.3000   1488.3300      0.0000      0.0000
+   1620.8000   1488.3500      0.0000      0.0000
+   1621.2000   1488.3400      0.0000      0.0000
+   1621.7000   1488.3600      0.0000      0.0000
+   1622.2000   1488.3600      0.0000      0.0000
+   1622.6000   1488.3500      0.0000      0.0000
+   1623.1000   1488.3900      0.0000      0.0000
+   1623.5000   1488.3900      0.0000      0.0000
+   1624.0000   1488.4100      0.0000      0.0000
+   1624.5000   1488.4100      0.0000      0.0000
+   1624.9000   1488.4100      0.0000      0.0000
+   1625.4000   1488.4300      0.0000      0.0000
+   1625.9000   1488.4300      0.0000      0.0000
+   1626.3000   1488.4400      0.0000      0.0000
+   1626.8000   1488.4500      0.0000      0.0000
+   1627.3000   1488.4600      0.0000      0.0000
+   1627.7000   1488.4800      0.0000      0.0000
+   1628.2000   1488.4800      0.0000      0.0000
+   1628.7000   1488.5000      0.0000      0.0000
+   1629.1000   1488.5200      0.0000      0.0000
+   1629.6000   1488.5200      0.0000      0.0000
+   1630.1000   1488.5200      0.0000      0.0000
+   1630.5000   1488.5200      0.0000      0.0000
+   1631.0000   1488.5500      0.0000      0.0000
+   1631.5000   1488.5400      0.0000      0.0000
+   1631.9000   1488.5500      0.0000      0.0000
+   1632.4000   1488.5700      0.0000      0.0000
+   1632.9000   1488.5700      0.0000      0.0000
+   1633.3000   1488.5900      0.0000      0.0000
+   1633.8000   1488.5700      0.0000      0.0000
+   1634.2000   1488.6000      0.0000      0.0000
+   1634.7000   1488.6100      0.0000      0.0000
+   1635.2000   1488.6100      0.0000      0.0000
+   1635.6000   1488.6300      0.0000      0.0000
+   1636.1000   1488.6300      0.0000      0.0000
+   1636.6000   1488.6100      0.0000      0.0000
+   1637.0000   1488.6200      0.0000      0.0000
+   1637.5000   1488.6000      0.0000      0.0000
+   1638.0000   1488.6200      0.0000      0.0000
+   1638.4000   1488.6000      0.0000      0.0000
+   1638.9000   1488.6400      0.0000      0.0000
+   1639.4000   1488.6200      0.0000      0.0000
+   1639.8000   1488.6500      0.0000      0.0000
+   1640.3000   1488.6600      0.0000      0.0000
+   1640.7000   1488.6600      0.0000      0.0000
+   1641.2000   1488.6800      0.0000      0.0000
+   1641.7000   1488.6700      0.0000      0.0000
+   1642.1000   1488.6700      0.0000      0.0000
+   1642.6000   1488.6900      0.0000      0.0000
+   1643.1000   1488.7000      0.0000      0.0000
+   1643.5000   1488.7000      0.0000      0.0000
+   1644.0000   1488.6900      0.0000      0.0000
+   1644.5000   1488.7100      0.0000      0.0000
+   1644.9000   1488.7000      0.0000      0.0000
+   1645.4000   1488.7100      0.0000      0.0000
+   1645.9000   1488.7000      0.0000      0.0000
+   1646.3000   1488.7100      0.0000      0.0000
+   1646.8000   1488.7100      0.0000      0.0000
+   1647.2000   1488.7300      0.0000      0.0000
+   1647.7000   1488.7100      0.0000      0.0000
+   1648.2000   1488.7400      0.0000      0.0000
+   1648.6000   1488.7400      0.0000      0.0000
+   1649.1000   1488.7500      0.0000      0.0000
+   1649.6000   1488.7600      0.0000      0.0000
+   1650.0000   1488.7700      0.0000      0.0000
+   1650.5000   1488.7700      0.0000      0.0000
+   1651.0000   1488.7900      0.0000      0.0000
+   1651.4000   1488.8100      0.0000      0.0000
+   1651.9000   1488.8100      0.0000      0.0000
+   1652.3000   1488.8200      0.0000      0.0000
+   1652.8000   1488.8200      0.0000      0.0000
+   1653.3000   1488.8200      0.0000      0.0000
+   1653.7000   1488.8300      0.0000      0.0000
+   1654.2000   1488.8600      0.0000      0.0000
+   1654.7000   1488.8400      0.0000      0.0000
+   1655.1000   1488.8500      0.0000      0.0000
+   1655.6000   1488.8300      0.0000      0.0000
+   1656.1000   1488.8400      0.0000      0.0000
+   1656.5000   1488.8600      0.0000      0.0000
+   1657.0000   1488.8500      0.0000      0.0000
+   1657.4000   1488.8800      0.0000      0.0000
+   1657.9000   1488.8600      0.0000      0.0000
+   1658.4000   1488.8800      0.0000      0.0000
+   1658.8000   1488.8900      0.0000      0.0000
+   1659.3000   1488.9000      0.0000      0.0000
+   1659.8000   1488.8900      0.0000      0.0000
+   1660.2000   1488.8800      0.0000      0.0000
+   1660.7000   1488.9100      0.0000      0.0000
+   1661.1000   1488.8900      0.0000      0.0000
+   1661.6000   1488.9100      0.0000      0.0000
+   1662.1000   1488.9400      0.0000      0.0000
+   1662.5000   1488.9300      0.0000      0.0000
+   1663.0000   1488.9200      0.0000      0.0000
+   1663.5000   1488.9400      0.0000      0.0000
+   1663.9000   1488.9300      0.0000      0.0000
+   1664.4000   1488.9400      0.0000      0.0000
+   1664.9000   1488.9600      0.0000      0.0000
+   1665.3000   1488.9700      0.0000      0.0000
+   1665.8000   1488.9700      0.0000      0.0000
+   1666.2000   1489.0000      0.0000      0.0000
+   1666.7000   1488.9900      0.0000      0.0000
+   1667.2000   1489.0100      0.0000      0.0000
+   1667.6000   1489.0100      0.0000      0.0000
+   1668.1000   1489.0000      0.0000      0.0000
+   1668.6000   1488.9900      0.0000      0.0000
+   1669.0000   1489.0100      0.0000      0.0000
+   1669.5000   1489.0200      0.0000      0.0000
+   1669.9000   1489.0200      0.0000      0.0000
+   1670.4000   1489.0100      0.0000      0.0000
+   1670.9000   1489.0300      0.0000      0.0000
+   1671.3000   1489.0300      0.0000      0.0000
+   1671.8000   1489.0300      0.0000      0.0000
+   1672.3000   1489.0500      0.0000      0.0000
+   1672.7000   1489.0600      0.0000      0.0000
+   1673.2000   1489.0700      0.0000      0.0000
+   1673.6000   1489.0800      0.0000      0.0000
+   1674.1000   1489.0600      0.0000      0.0000
+   1674.6000   1489.0800      0.0000      0.0000
+   1675.0000   1489.0900      0.0000      0.0000
+   1675.5000   1489.0900      0.0000      0.0000
+   1675.9000   1489.0900      0.0000      0.0000
+   1676.4000   1489.1100      0.0000      0.0000
+   1676.9000   1489.1200      0.0000      0.0000
+   1677.3000   1489.1300      0.0000      0.0000
+   1677.8000   1489.1100      0.0000      0.0000
+   1678.3000   1489.1500      0.0000      0.0000
+   1678.7000   1489.1400      0.0000      0.0000
+   1679.2000   1489.1400      0.0000      0.0000
+   1679.6000   1489.1700      0.0000      0.0000
+   1680.1000   1489.1700      0.0000      0.0000
+   1680.6000   1489.1800      0.0000      0.0000
+   1681.0000   1489.1700      0.0000      0.0000
+   1681.5000   1489.2200      0.0000      0.0000
+   1682.0000   1489.1600      0.0000      0.0000
+   1682.4000   1489.1800      0.0000      0.0000
+   1682.9000   1489.1700      0.0000      0.0000
+   1683.3000   1489.1900      0.0000      0.0000
+   1683.8000   1489.1900      0.0000      0.0000
+   1684.3000   1489.1900      0.0000      0.0000
+   1684.7000   1489.1800      0.0000      0.0000
+   1685.2000   1489.1900      0.0000      0.0000
+   1685.6000   1489.2000      0.0000      0.0000
+   1686.1000   1489.2200      0.0000      0.0000
+   1686.6000   1489.2100      0.0000      0.0000
+   1687.0000   1489.2300      0.0000      0.0000
+   1687.5000   1489.2400      0.0000      0.0000
+   1688.0000   1489.2500      0.0000      0.0000
+   1688.4000   1489.2500      0.0000      0.0000
+   1688.9000   1489.2700      0.0000      0.0000
+   1689.3000   1489.2900      0.0000      0.0000
+   1689.8000   1489.2700      0.0000      0.0000
+   1690.3000   1489.2800      0.0000      0.0000
+   1690.7000   1489.3000      0.0000      0.0000
+   1691.2000   1489.3100      0.0000      0.0000
+   1691.6000   1489.3000      0.0000      0.0000
+   1692.1000   1489.3100      0.0000      0.0000
+   1692.6000   1489.3100      0.0000      0.0000
+   1693.0000   1489.3300      0.0000      0.0000
+   1693.5000   1489.3400      0.0000      0.0000
+   1693.9000   1489.3300      0.0000      0.0000
+   1694.4000   1489.3500      0.0000      0.0000
+   1694.9000   1489.3700      0.0000      0.0000
+   1695.3000   1489.3700      0.0000      0.0000
+   1695.8000   1489.3800      0.0000      0.0000
+   1696.2000   1489.3700      0.0000      0.0000
+   1696.7000   1489.3800      0.0000      0.0000
+   1697.2000   1489.4000      0.0000      0.0000
+   1697.6000   1489.4000      0.0000      0.0000
+   1698.1000   1489.4200      0.0000      0.0000
+   1698.6000   1489.4100      0.0000      0.0000
+   1699.0000   1489.4100      0.0000      0.0000
+   1699.5000   1489.4100      0.0000      0.0000
+   1699.9000   1489.4300      0.0000      0.0000
+   1700.4000   1489.4500      0.0000      0.0000
+   1700.9000   1489.4400      0.0000      0.0000
+   1701.3000   1489.4600      0.0000      0.0000
+   1701.8000   1489.4600      0.0000      0.0000
+   1702.2000   1489.4900      0.0000      0.0000
+   1702.7000   1489.4700      0.0000      0.0000
+   1703.2000   1489.4700      0.0000      0.0000
+   1703.6000   1489.4900      0.0000      0.0000
+   1704.1000   1489.4700      0.0000      0.0000
+   1704.5000   1489.4800      0.0000      0.0000
+   1705.0000   1489.5000      0.0000      0.0000
+   1705.5000   1489.5100      0.0000      0.0000
+   1705.9000   1489.5200      0.0000      0.0000
+   1706.4000   1489.5400      0.0000      0.0000
+   1706.8000   1489.5200      0.0000      0.0000
+   1707.3000   1489.5500      0.0000      0.0000
+   1707.8000   1489.5400      0.0000      0.0000
+   1708.2000   1489.5400      0.0000      0.0000
+   1708.7000   1489.5700      0.0000      0.0000
+   1709.1000   1489.5700      0.0000      0.0000
+   1709.6000   1489.5600      0.0000      0.0000
+   1710.1000   1489.5900      0.0000      0.0000
+   1710.5000   1489.5600      0.0000      0.0000
+   1711.0000   1489.5600      0.0000      0.0000
+   1711.4000   1489.6100      0.0000      0.0000
+   1711.9000   1489.5900      0.0000      0.0000
+   1712.4000   1489.6100      0.0000      0.0000
+   1712.8000   1489.5900      0.0000      0.0000
+   1713.3000   1489.6400      0.0000      0.0000
+   1713.7000   1489.6400      0.0000      0.0000
+   1714.2000   1489.6200      0.0000      0.0000
+   1714.7000   1489.6300      0.0000      0.0000
+   1715.1000   1489.6200      0.0000      0.0000
+   1715.6000   1489.6200      0.0000      0.0000
+   1716.0000   1489.6400      0.0000      0.0000
+   1716.5000   1489.6600      0.0000      0.0000
+   1717.0000   1489.6800      0.0000      0.0000
+   1717.4000   1489.6700      0.0000      0.0000
+   1717.9000   1489.7000      0.0000      0.0000
+   1718.3000   1489.7000      0.0000      0.0000
+   1718.8000   1489.7000      0.0000      0.0000
+   1719.2000   1489.6800      0.0000      0.0000
+   1719.7000   1489.7000      0.0000      0.0000
+   1720.2000   1489.7100      0.0000      0.0000
+   1720.6000   1489.7100      0.0000      0.0000
+   1721.1000   1489.7200      0.0000      0.0000
+   1721.5000   1489.7400      0.0000      0.0000
+   1722.0000   1489.7400      0.0000      0.0000
+   1722.5000   1489.7500      0.0000      0.0000
+   1722.9000   1489.7500      0.0000      0.0000
+   1723.4000   1489.7600      0.0000      0.0000
+   1723.8000   1489.7700      0.0000      0.0000
+   1724.3000   1489.7700      0.0000      0.0000
+   1724.8000   1489.7800      0.0000      0.0000
+   1725.2000   1489.7800      0.0000      0.0000
+   1725.7000   1489.7900      0.0000      0.0000
+   1726.1000   1489.7900      0.0000      0.0000
+   1726.6000   1489.7900      0.0000      0.0000
+   1727.1000   1489.8000      0.0000      0.0000
+   1727.5000   1489.8000      0.0000      0.0000
+   1728.0000   1489.8100      0.0000      0.0000
+   1728.4000   1489.8000      0.0000      0.0000
+   1728.9000   1489.8200      0.0000      0.0000
+   1729.3000   1489.8100      0.0000      0.0000
+   1729.8000   1489.8000      0.0000      0.0000
+   1730.3000   1489.8200      0.0000      0.0000
+   1730.7000   1489.8200      0.0000      0.0000
+   1731.2000   1489.8300      0.0000      0.0000
+   1731.6000   1489.8200      0.0000      0.0000
+   1732.1000   1489.8500      0.0000      0.0000
+   1732.6000   1489.8400      0.0000      0.0000
+   1733.0000   1489.8500      0.0000      0.0000
+   1733.5000   1489.8500      0.0000      0.0000
+   1733.9000   1489.8800      0.0000      0.0000
+   1734.4000   1489.8700      0.0000      0.0000
+   1734.8000   1489.9100      0.0000      0.0000
+   1735.3000   1489.9000      0.0000      0.0000
+   1735.8000   1489.9100      0.0000      0.0000
+   1736.2000   1489.9200      0.0000      0.0000
+   1736.7000   1489.9100      0.0000      0.0000
+   1737.1000   1489.9200      0.0000      0.0000
+   1737.6000   1489.9400      0.0000      0.0000
+   1738.1000   1489.9600      0.0000      0.0000
+   1738.5000   1489.9300      0.0000      0.0000
+   1739.0000   1489.9500      0.0000      0.0000
+   1739.4000   1489.9500      0.0000      0.0000
+   1739.9000   1489.9500      0.0000      0.0000
+   1740.3000   1489.9700      0.0000      0.0000
+   1740.8000   1489.9800      0.0000      0.0000
+   1741.3000   1489.9900      0.0000      0.0000
+   1741.7000   1489.9900      0.0000      0.0000
+   1742.2000   1489.9900      0.0000      0.0000
+   1742.6000   1490.0100      0.0000      0.0000
+   1743.1000   1490.0200      0.0000      0.0000
+   1743.5000   1490.0200      0.0000      0.0000
+   1744.0000   1490.0400      0.0000      0.0000
+   1744.5000   1490.0300      0.0000      0.0000
+   1744.9000   1490.0200      0.0000      0.0000
+   1745.4000   1490.0400      0.0000      0.0000
+   1745.8000   1490.0700      0.0000      0.0000
+   1746.3000   1490.0400      0.0000      0.0000
+   1746.8000   1490.0700      0.0000      0.0000
+   1747.2000   1490.0600      0.0000      0.0000
+   1747.7000   1490.0800      0.0000      0.0000
+   1748.1000   1490.0700      0.0000      0.0000
+   1748.6000   1490.0700      0.0000      0.0000
+   1749.0000   1490.0900      0.0000      0.0000
+   1749.5000   1490.0700      0.0000      0.0000
+   1750.0000   1490.0700      0.0000      0.0000
+   1750.4000   1490.0700      0.0000      0.0000
+   1750.9000   1490.0800      0.0000      0.0000
+   1751.3000   1490.0700      0.0000      0.0000
+   1751.8000   1490.0600      0.0000      0.0000
+   1752.2000   1490.0900      0.0000      0.0000
+   1752.7000   1490.0700      0.0000      0.0000
+   1753.2000   1490.1000      0.0000      0.0000
+   1753.6000   1490.1000      0.0000      0.0000
+   1754.1000   1490.1000      0.0000      0.0000
+   1754.5000   1490.0800      0.0000      0.0000
+   1755.0000   1490.0800      0.0000      0.0000
+   1755.4000   1490.0800      0.0000      0.0000
+   1755.9000   1490.1000      0.0000      0.0000
+   1756.4000   1490.0900      0.0000      0.0000
+   1756.8000   1490.1000      0.0000      0.0000
+   1757.3000   1490.1000      0.0000      0.0000
+   1757.7000   1490.0800      0.0000      0.0000
+   1758.2000   1490.1100      0.0000      0.0000
+   1758.6000   1490.1100      0.0000      0.0000
+   1759.1000   1490.1200      0.0000      0.0000
+   1759.5000   1490.1300      0.0000      0.0000
+   1760.0000   1490.1200      0.0000      0.0000
+   1760.5000   1490.1100      0.0000      0.0000
+   1760.9000   1490.1100      0.0000      0.0000
+   1761.4000   1490.1300      0.0000      0.0000
+   1761.8000   1490.1200      0.0000      0.0000
+   1762.3000   1490.1300      0.0000      0.0000
+   1762.7000   1490.1500      0.0000      0.0000
+   1763.2000   1490.1400      0.0000      0.0000
+   1763.7000   1490.1600      0.0000      0.0000
+   1764.1000   1490.1500      0.0000      0.0000
+   1764.6000   1490.1100      0.0000      0.0000
+   1765.0000   1490.1400      0.0000      0.0000
+   1765.5000   1490.1600      0.0000      0.0000
+   1765.9000   1490.1500      0.0000      0.0000
+   1766.4000   1490.1500      0.0000      0.0000
+   1766.9000   1490.1600      0.0000      0.0000
+   1767.3000   1490.1500      0.0000      0.0000
+   1767.8000   1490.1800      0.0000      0.0000
+   1768.2000   1490.1800      0.0000      0.0000
+   1768.7000   1490.1800      0.0000      0.0000
+   1769.1000   1490.1800      0.0000      0.0000
+   1769.6000   1490.2100      0.0000      0.0000
+   1770.0000   1490.1900      0.0000      0.0000
+   1770.5000   1490.2100      0.0000      0.0000
+   1771.0000   1490.2200      0.0000      0.0000
+   1771.4000   1490.2200      0.0000      0.0000
+   1771.9000   1490.2200      0.0000      0.0000
+   1772.3000   1490.2400      0.0000      0.0000
+   1772.8000   1490.2400      0.0000      0.0000
+   1773.2000   1490.2400      0.0000      0.0000
+   1773.7000   1490.2400      0.0000      0.0000
+   1774.1000   1490.2400      0.0000      0.0000
+   1774.6000   1490.2600      0.0000      0.0000
+   1775.1000   1490.2400      0.0000      0.0000
+   1775.5000   1490.2700      0.0000      0.0000
+   1776.0000   1490.2700      0.0000      0.0000
+   1776.4000   1490.2600      0.0000      0.0000
+   1776.9000   1490.2800      0.0000      0.0000
+   1777.3000   1490.2800      0.0000      0.0000
+   1777.8000   1490.2800      0.0000      0.0000
+   1778.2000   1490.2900      0.0000      0.0000
+   1778.7000   1490.2900      0.0000      0.0000
+   1779.2000   1490.2800      0.0000      0.0000
+   1779.6000   1490.3000      0.0000      0.0000
+   1780.1000   1490.3100      0.0000      0.0000
+   1780.5000   1490.3100      0.0000      0.0000
+   1781.0000   1490.3100      0.0000      0.0000
+   1781.4000   1490.3300      0.0000      0.0000
+   1781.9000   1490.3100      0.0000      0.0000
+   1782.3000   1490.3200      0.0000      0.0000
+   1782.8000   1490.3500      0.0000      0.0000
+   1783.3000   1490.3200      0.0000      0.0000
+   1783.7000   1490.3500      0.0000      0.0000
+   1784.2000   1490.3300      0.0000      0.0000
+   1784.6000   1490.3500      0.0000      0.0000
+   1785.1000   1490.3700      0.0000      0.0000
+   1785.5000   1490.3800      0.0000      0.0000
+   1786.0000   1490.3600      0.0000      0.0000
+   1786.4000   1490.3800      0.0000      0.0000
+   1786.9000   1490.3500      0.0000      0.0000
+   1787.4000   1490.3800      0.0000      0.0000
+   1787.8000   1490.3700      0.0000      0.0000
+   1788.3000   1490.3900      0.0000      0.0000
+   1788.7000   1490.4000      0.0000      0.0000
+   1789.2000   1490.4100      0.0000      0.0000
+   1789.6000   1490.4200      0.0000      0.0000
+   1790.1000   1490.4200      0.0000      0.0000
+   1790.5000   1490.4200      0.0000      0.0000
+   1791.0000   1490.4300      0.0000      0.0000
+   1791.4000   1490.4700      0.0000      0.0000
+   1791.9000   1490.4600      0.0000      0.0000
+   1792.4000   1490.4500      0.0000      0.0000
+   1792.8000   1490.4600      0.0000      0.0000
+   1793.3000   1490.4600      0.0000      0.0000
+   1793.7000   1490.4700      0.0000      0.0000
+   1794.2000   1490.5000      0.0000      0.0000
+   1794.6000   1490.4900      0.0000      0.0000
+   1795.1000   1490.5000      0.0000      0.0000
+   1795.5000   1490.5100      0.0000      0.0000
+   1796.0000   1490.5100      0.0000      0.0000
+   1796.4000   1490.5200      0.0000      0.0000
+   1796.9000   1490.5100      0.0000      0.0000
+   1797.4000   1490.5000      0.0000      0.0000
+   1797.8000   1490.5300      0.0000      0.0000
+   1798.3000   1490.5500      0.0000      0.0000
+   1798.7000   1490.5400      0.0000      0.0000
+   1799.2000   1490.5400      0.0000      0.0000
+   1799.6000   1490.5400      0.0000      0.0000
+   1800.1000   1490.5700      0.0000      0.0000
+   1800.5000   1490.5600      0.0000      0.0000
+   1801.0000   1490.5600      0.0000      0.0000
+   1801.4000   1490.6000      0.0000      0.0000
+   1801.9000   1490.5900      0.0000      0.0000
+   1802.3000   1490.5800      0.0000      0.0000
+   1802.8000   1490.6100      0.0000      0.0000
+   1803.3000   1490.6000      0.0000      0.0000
+   1803.7000   1490.6100      0.0000      0.0000
+   1804.2000   1490.6100      0.0000      0.0000
+   1804.6000   1490.6200      0.0000      0.0000
+   1805.1000   1490.6000      0.0000      0.0000
+   1805.5000   1490.6200      0.0000      0.0000
+   1806.0000   1490.6400      0.0000      0.0000
+   1806.4000   1490.6400      0.0000      0.0000
+   1806.9000   1490.6600      0.0000      0.0000
+   1807.3000   1490.6300      0.0000      0.0000
+   1807.8000   1490.6400      0.0000      0.0000
+   1808.2000   1490.6700      0.0000      0.0000
+   1808.7000   1490.6900      0.0000      0.0000
+   1809.2000   1490.6800      0.0000      0.0000
+   1809.6000   1490.6800      0.0000      0.0000
+   1810.1000   1490.7100      0.0000      0.0000
+   1810.5000   1490.7100      0.0000      0.0000
+   1811.0000   1490.7100      0.0000      0.0000
+   1811.4000   1490.7100      0.0000      0.0000
+   1811.9000   1490.7000      0.0000      0.0000
+   1812.3000   1490.7200      0.0000      0.0000
+   1812.8000   1490.7200      0.0000      0.0000
+   1813.2000   1490.7300      0.0000      0.0000
+   1813.7000   1490.7100      0.0000      0.0000
+   1814.1000   1490.7200      0.0000      0.0000
+   1814.6000   1490.7300      0.0000      0.0000
+   1815.0000   1490.7400      0.0000      0.0000
+   1815.5000   1490.7500      0.0000      0.0000
+   1815.9000   1490.7500      0.0000      0.0000
+   1816.4000   1490.7400      0.0000      0.0000
+   1816.9000   1490.7700      0.0000      0.0000
+   1817.3000   1490.7700      0.0000      0.0000
+   1817.8000   1490.7700      0.0000      0.0000
+   1818.2000   1490.7800      0.0000      0.0000
+   1818.7000   1490.8000      0.0000      0.0000
+   1819.1000   1490.7900      0.0000      0.0000
+   1819.6000   1490.8200      0.0000      0.0000
+   1820.0000   1490.8200      0.0000      0.0000
+   1820.5000   1490.8200      0.0000      0.0000
+   1820.9000   1490.8300      0.0000      0.0000
+   1821.4000   1490.8500      0.0000      0.0000
+   1821.8000   1490.8500      0.0000      0.0000
+   1822.3000   1490.8300      0.0000      0.0000
+   1822.7000   1490.8900      0.0000      0.0000
+   1823.2000   1490.8800      0.0000      0.0000
+   1823.6000   1490.8900      0.0000      0.0000
+   1824.1000   1490.8600      0.0000      0.0000
+   1824.6000   1490.9000      0.0000      0.0000
+   1825.0000   1490.8900      0.0000      0.0000
+   1825.5000   1490.9200      0.0000      0.0000
+   1825.9000   1490.9100      0.0000      0.0000
+   1826.4000   1490.9200      0.0000      0.0000
+   1826.8000   1490.9000      0.0000      0.0000
+   1827.3000   1490.9500      0.0000      0.0000
+   1827.7000   1490.9500      0.0000      0.0000
+   1828.2000   1490.9500      0.0000      0.0000
+   1828.6000   1490.9600      0.0000      0.0000
+   1829.1000   1490.9100      0.0000      0.0000
+   1829.5000   1490.9300      0.0000      0.0000
+   1830.0000   1490.9100      0.0000      0.0000
+   1830.4000   1490.9400      0.0000      0.0000
+   1830.9000   1490.9200      0.0000      0.0000
+   1831.3000   1490.9400      0.0000      0.0000
+   1831.8000   1490.9300      0.0000      0.0000
+   1832.2000   1490.9500      0.0000      0.0000
+   1832.7000   1490.9600      0.0000      0.0000
+   1833.1000   1490.9900      0.0000      0.0000
+   1833.6000   1490.9600      0.0000      0.0000
+   1834.0000   1490.9900      0.0000      0.0000
+   1834.5000   1491.0000      0.0000      0.0000
+   1834.9000   1490.9900      0.0000      0.0000
+   1835.4000   1491.0000      0.0000      0.0000
+   1835.9000   1491.0100      0.0000      0.0000
+   1836.3000   1491.0300      0.0000      0.0000
+   1836.8000   1491.0500      0.0000      0.0000
+   1837.2000   1491.0300      0.0000      0.0000
+   1837.7000   1491.0400      0.0000      0.0000
+   1838.1000   1491.0400      0.0000      0.0000
+   1838.6000   1491.0900      0.0000      0.0000
+   1839.0000   1491.0500      0.0000      0.0000
+   1839.5000   1491.0700      0.0000      0.0000
+   1839.9000   1491.1200      0.0000      0.0000
+   1840.4000   1491.0700      0.0000      0.0000
+   1840.8000   1491.0700      0.0000      0.0000
+   1841.3000   1491.0800      0.0000      0.0000
+   1841.7000   1491.0900      0.0000      0.0000
+   1842.2000   1491.1000      0.0000      0.0000
+   1842.6000   1491.0900      0.0000      0.0000
+   1843.1000   1491.1100      0.0000      0.0000
+   1843.5000   1491.1100      0.0000      0.0000
+   1844.0000   1491.1200      0.0000      0.0000
+   1844.4000   1491.1200      0.0000      0.0000
+   1844.9000   1491.1300      0.0000      0.0000
+   1845.3000   1491.1500      0.0000      0.0000
+   1845.8000   1491.1600      0.0000      0.0000
+   1846.2000   1491.1400      0.0000      0.0000
+   1846.7000   1491.1600      0.0000      0.0000
+   1847.1000   1491.1700      0.0000      0.0000
+   1847.6000   1491.1900      0.0000      0.0000
+   1848.0000   1491.1800      0.0000      0.0000
+   1848.5000   1491.2100      0.0000      0.0000
+   1848.9000   1491.2200      0.0000      0.0000
+   1849.4000   1491.2200      0.0000      0.0000
+   1849.8000   1491.2200      0.0000      0.0000
+   1850.3000   1491.2500      0.0000      0.0000
+   1850.7000   1491.2300      0.0000      0.0000
+   1851.2000   1491.2400      0.0000      0.0000
+   1851.6000   1491.2800      0.0000      0.0000
+   1852.1000   1491.2600      0.0000      0.0000
+   1852.5000   1491.2600      0.0000      0.0000
+   1853.0000   1491.2700      0.0000      0.0000
+   1853.4000   1491.2700      0.0000      0.0000
+   1853.9000   1491.2800      0.0000      0.0000
+   1854.3000   1491.2900      0.0000      0.0000
+   1854.8000   1491.3000      0.0000      0.0000
+   1855.2000   1491.3100      0.0000      0.0000
+   1855.7000   1491.3000      0.0000      0.0000
+   1856.1000   1491.3400      0.0000      0.0000
+   1856.6000   1491.3500      0.0000      0.0000
+   1857.1000   1491.3200      0.0000      0.0000
+   1857.5000   1491.3300      0.0000      0.0000
+   1858.0000   1491.3500      0.0000      0.0000
+   1858.4000   1491.3600      0.0000      0.0000
+   1858.9000   1491.3600      0.0000      0.0000
+   1859.3000   1491.3800      0.0000      0.0000
+   1859.8000   1491.3800      0.0000      0.0000
+   1860.2000   1491.3900      0.0000      0.0000
+   1860.7000   1491.3900      0.0000      0.0000
+   1861.1000   1491.4200      0.0000      0.0000
+   1861.6000   1491.4100      0.0000      0.0000
+   1862.0000   1491.4400      0.0000      0.0000
+   1862.5000   1491.4200      0.0000      0.0000
+   1862.9000   1491.4300      0.0000      0.0000
+   1863.4000   1491.4300      0.0000      0.0000
+   1863.8000   1491.4200      0.0000      0.0000
+   1864.3000   1491.4300      0.0000      0.0000
+   1864.7000   1491.4400      0.0000      0.0000
+   1865.2000   1491.4400      0.0000      0.0000
+   1865.6000   1491.4700      0.0000      0.0000
+   1866.1000   1491.4600      0.0000      0.0000
+   1866.5000   1491.4500      0.0000      0.0000
+   1867.0000   1491.4300      0.0000      0.0000
+   1867.4000   1491.4700      0.0000      0.0000
+   1867.8000   1491.4700      0.0000      0.0000
+   1868.3000   1491.4800      0.0000      0.0000
+   1868.7000   1491.4800      0.0000      0.0000
+   1869.2000   1491.5100      0.0000      0.0000
+   1869.6000   1491.4900      0.0000      0.0000
+   1870.1000   1491.4900      0.0000      0.0000
+   1870.5000   1491.5100      0.0000      0.0000
+   1871.0000   1491.5200      0.0000      0.0000
+   1871.4000   1491.5300      0.0000      0.0000
+   1871.9000   1491.5300      0.0000      0.0000
+   1872.3000   1491.5300      0.0000      0.0000
+   1872.8000   1491.5400      0.0000      0.0000
+   1873.2000   1491.5500      0.0000      0.0000
+   1873.7000   1491.5500      0.0000      0.0000
+   1874.1000   1491.5800      0.0000      0.0000
+   1874.6000   1491.5700      0.0000      0.0000
+   1875.0000   1491.5700      0.0000      0.0000
+   1875.5000   1491.5900      0.0000      0.0000
+   1875.9000   1491.5800      0.0000      0.0000
+   1876.4000   1491.6000      0.0000      0.0000
+   1876.8000   1491.5800      0.0000      0.0000
+   1877.3000   1491.6200      0.0000      0.0000
+   1877.7000   1491.6100      0.0000      0.0000
+   1878.2000   1491.6200      0.0000      0.0000
+   1878.6000   1491.6300      0.0000      0.0000
+   1879.1000   1491.6300      0.0000      0.0000
+   1879.5000   1491.6100      0.0000      0.0000
+   1880.0000   1491.6300      0.0000      0.0000
+   1880.4000   1491.6200      0.0000      0.0000
+   1880.9000   1491.6400      0.0000      0.0000
+   1881.3000   1491.6400      0.0000      0.0000
+   1881.8000   1491.6500      0.0000      0.0000
+   1882.2000   1491.6700      0.0000      0.0000
+   1882.7000   1491.6600      0.0000      0.0000
+   1883.1000   1491.6800      0.0000      0.0000
+   1883.6000   1491.6800      0.0000      0.0000
+   1884.0000   1491.6800      0.0000      0.0000
+   1884.5000   1491.7000      0.0000      0.0000
+   1884.9000   1491.6700      0.0000      0.0000
+   1885.4000   1491.7200      0.0000      0.0000
+   1885.8000   1491.7200      0.0000      0.0000
+   1886.3000   1491.7300      0.0000      0.0000
+   1886.7000   1491.7200      0.0000      0.0000
+   1887.2000   1491.7500      0.0000      0.0000
+   1887.6000   1491.7500      0.0000      0.0000
+   1888.1000   1491.7300      0.0000      0.0000
+   1888.5000   1491.7800      0.0000      0.0000
+   1888.9000   1491.7800      0.0000      0.0000
+   1889.4000   1491.7700      0.0000      0.0000
+   1889.8000   1491.7700      0.0000      0.0000
+   1890.3000   1491.8200      0.0000      0.0000
+   1890.7000   1491.8200      0.0000      0.0000
+   1891.2000   1491.8200      0.0000      0.0000
+   1891.6000   1491.8300      0.0000      0.0000
+   1892.1000   1491.8600      0.0000      0.0000
+   1892.5000   1491.8300      0.0000      0.0000
+   1893.0000   1491.8400      0.0000      0.0000
+   1893.4000   1491.8600      0.0000      0.0000
+   1893.9000   1491.8500      0.0000      0.0000
+   1894.3000   1491.8700      0.0000      0.0000
+   1894.8000   1491.8400      0.0000      0.0000
+   1895.2000   1491.8700      0.0000      0.0000
+   1895.7000   1491.8900      0.0000      0.0000
+   1896.1000   1491.8800      0.0000      0.0000
+   1896.6000   1491.8800      0.0000      0.0000
+   1897.0000   1491.9100      0.0000      0.0000
+   1897.5000   1491.9100      0.0000      0.0000
+   1897.9000   1491.9200      0.0000      0.0000
+   1898.4000   1491.9100      0.0000      0.0000
+   1898.8000   1491.9400      0.0000      0.0000
+   1899.2000   1491.9700      0.0000      0.0000
+   1899.7000   1491.9500      0.0000      0.0000
+   1900.1000   1491.9800      0.0000      0.0000
+   1900.6000   1491.9600      0.0000      0.0000
+   1901.0000   1491.9400      0.0000      0.0000
+   1901.5000   1491.9800      0.0000      0.0000
+   1901.9000   1491.9600      0.0000      0.0000
+   1902.4000   1491.9900      0.0000      0.0000
+   1902.8000   1492.0000      0.0000      0.0000
+   1903.3000   1492.0200      0.0000      0.0000
+   1903.7000   1492.0300      0.0000      0.0000
+   1904.2000   1492.0300      0.0000      0.0000
+   1904.6000   1492.0200      0.0000      0.0000
+   1905.1000   1492.0300      0.0000      0.0000
+   1905.5000   1492.0300      0.0000      0.0000
+   1906.0000   1492.0600      0.0000      0.0000
+   1906.4000   1492.0700      0.0000      0.0000
+   1906.9000   1492.0500      0.0000      0.0000
+   1907.3000   1492.0800      0.0000      0.0000
+   1907.7000   1492.1000      0.0000      0.0000
+   1908.2000   1492.0700      0.0000      0.0000
+   1908.6000   1492.0900      0.0000      0.0000
+   1909.1000   1492.1200      0.0000      0.0000
+   1909.5000   1492.1200      0.0000      0.0000
+   1910.0000   1492.1100      0.0000      0.0000
+   1910.4000   1492.1500      0.0000      0.0000
+   1910.9000   1492.1200      0.0000      0.0000
+   1911.3000   1492.1300      0.0000      0.0000
+   1911.8000   1492.1500      0.0000      0.0000
+   1912.2000   1492.1600      0.0000      0.0000
+   1912.7000   1492.1500      0.0000      0.0000
+   1913.1000   1492.1500      0.0000      0.0000
+   1913.6000   1492.1700      0.0000      0.0000
+   1914.0000   1492.1900      0.0000      0.0000
+   1914.4000   1492.1900      0.0000      0.0000
+   1914.9000   1492.1900      0.0000      0.0000
+   1915.3000   1492.1500      0.0000      0.0000
+   1915.8000   1492.1500      0.0000      0.0000
+   1916.2000   1492.1900      0.0000      0.0000
+   1916.7000   1492.1700      0.0000      0.0000
+   1917.1000   1492.2100      0.0000      0.0000
+   1917.6000   1492.2200      0.0000      0.0000
+   1918.0000   1492.2200      0.0000      0.0000
+   1918.5000   1492.2400      0.0000      0.0000
+   1918.9000   1492.2400      0.0000      0.0000
+   1919.4000   1492.2400      0.0000      0.0000
+   1919.8000   1492.2500      0.0000      0.0000
+   1920.3000   1492.2500      0.0000      0.0000
+   1920.7000   1492.2400      0.0000      0.0000
+   1921.1000   1492.2400      0.0000      0.0000
+   1921.6000   1492.2400      0.0000      0.0000
+   1922.0000   1492.2500      0.0000      0.0000
+   1922.5000   1492.2700      0.0000      0.0000
+   1922.9000   1492.2600      0.0000      0.0000
+   1923.4000   1492.2700      0.0000      0.0000
+   1923.8000   1492.2700      0.0000      0.0000
+   1924.3000   1492.3000      0.0000      0.0000
+   1924.7000   1492.3200      0.0000      0.0000
+   1925.2000   1492.2900      0.0000      0.0000
+   1925.6000   1492.3100      0.0000      0.0000
+   1926.0000   1492.3000      0.0000      0.0000
+   1926.5000   1492.3200      0.0000      0.0000
+   1926.9000   1492.3000      0.0000      0.0000
+   1927.4000   1492.3100      0.0000      0.0000
+   1927.8000   1492.3700      0.0000      0.0000
+   1928.3000   1492.3500      0.0000      0.0000
+   1928.7000   1492.3400      0.0000      0.0000
+   1929.2000   1492.3600      0.0000      0.0000
+   1929.6000   1492.3400      0.0000      0.0000
+   1930.1000   1492.3700      0.0000      0.0000
+   1930.5000   1492.3900      0.0000      0.0000
+   1931.0000   1492.3900      0.0000      0.0000
+   1931.4000   1492.4000      0.0000      0.0000
+   1931.8000   1492.4200      0.0000      0.0000
+   1932.3000   1492.4100      0.0000      0.0000
+   1932.7000   1492.3900      0.0000      0.0000
+   1933.2000   1492.4300      0.0000      0.0000
+   1933.6000   1492.4100      0.0000      0.0000
+   1934.1000   1492.4200      0.0000      0.0000
+   1934.5000   1492.3800      0.0000      0.0000
+   1935.0000   1492.3900      0.0000      0.0000
+   1935.4000   1492.4000      0.0000      0.0000
+   1935.8000   1492.4100      0.0000      0.0000
+   1936.3000   1492.4000      0.0000      0.0000
+   1936.7000   1492.4000      0.0000      0.0000
+   1937.2000   1492.4100      0.0000      0.0000
+   1937.6000   1492.4200      0.0000      0.0000
+   1938.1000   1492.4400      0.0000      0.0000
+   1938.5000   1492.4400      0.0000      0.0000
+   1939.0000   1492.4400      0.0000      0.0000
+   1939.4000   1492.4600      0.0000      0.0000
+   1939.9000   1492.4600      0.0000      0.0000
+   1940.3000   1492.4500      0.0000      0.0000
+   1940.7000   1492.4900      0.0000      0.0000
+   1941.2000   1492.4700      0.0000      0.0000
+   1941.6000   1492.4800      0.0000      0.0000
+   1942.1000   1492.4800      0.0000      0.0000
+   1942.5000   1492.5100      0.0000      0.0000
+   1943.0000   1492.5100      0.0000      0.0000
+   1943.4000   1492.5100      0.0000      0.0000
+   1943.9000   1492.5300      0.0000      0.0000
+   1944.3000   1492.5400      0.0000      0.0000
+   1944.7000   1492.5500      0.0000      0.0000
+   1945.2000   1492.5600      0.0000      0.0000
+   1945.6000   1492.5600      0.0000      0.0000
+   1946.1000   1492.5500      0.0000      0.0000
+   1946.5000   1492.5800      0.0000      0.0000
+   1947.0000   1492.5700      0.0000      0.0000
+   1947.4000   1492.5700      0.0000      0.0000
+   1947.9000   1492.5800      0.0000      0.0000
+   1948.3000   1492.6000      0.0000      0.0000
+   1948.7000   1492.6300      0.0000      0.0000
+   1949.2000   1492.6000      0.0000      0.0000
+   1949.6000   1492.6000      0.0000      0.0000
+   1950.1000   1492.6000      0.0000      0.0000
+   1950.5000   1492.6200      0.0000      0.0000
+   1951.0000   1492.6400      0.0000      0.0000
+   1951.4000   1492.6400      0.0000      0.0000
+   1951.9000   1492.6400      0.0000      0.0000
+   1952.3000   1492.6600      0.0000      0.0000
+   1952.7000   1492.6500      0.0000      0.0000
+   1953.2000   1492.6800      0.0000      0.0000
+   1953.6000   1492.6700      0.0000      0.0000
+   1954.1000   1492.6700      0.0000      0.0000
+   1954.5000   1492.6900      0.0000      0.0000
+   1955.0000   1492.6900      0.0000      0.0000
+   1955.4000   1492.6900      0.0000      0.0000
+   1955.8000   1492.7000      0.0000      0.0000
+   1956.3000   1492.7100      0.0000      0.0000
+   1956.7000   1492.7200      0.0000      0.0000
+   1957.2000   1492.7100      0.0000      0.0000
+   1957.6000   1492.7500      0.0000      0.0000
+   1958.1000   1492.7200      0.0000      0.0000
+   1958.5000   1492.7000      0.0000      0.0000
+   1959.0000   1492.7200      0.0000      0.0000
+   1959.4000   1492.7200      0.0000      0.0000
+   1959.8000   1492.7600      0.0000      0.0000
+   1960.3000   1492.7500      0.0000      0.0000
+   1960.7000   1492.7600      0.0000      0.0000
+   1961.2000   1492.7900      0.0000      0.0000
+   1961.6000   1492.7900      0.0000      0.0000
+   1962.1000   1492.8100      0.0000      0.0000
+   1962.5000   1492.8000      0.0000      0.0000
+   1962.9000   1492.8400      0.0000      0.0000
+   1963.4000   1492.8300      0.0000      0.0000
+   1963.8000   1492.8100      0.0000      0.0000
+   1964.3000   1492.8000      0.0000      0.0000
+   1964.7000   1492.8700      0.0000      0.0000
+   1965.2000   1492.8400      0.0000      0.0000
+   1965.6000   1492.8700      0.0000      0.0000
+   1966.0000   1492.8800      0.0000      0.0000
+   1966.5000   1492.8800      0.0000      0.0000
+   1966.9000   1492.8600      0.0000      0.0000
+   1967.4000   1492.9000      0.0000      0.0000
+   1967.8000   1492.9100      0.0000      0.0000
+   1968.3000   1492.8700      0.0000      0.0000
+   1968.7000   1492.9600      0.0000      0.0000
+   1969.1000   1492.9400      0.0000      0.0000
+   1969.6000   1492.9400      0.0000      0.0000
+   1970.0000   1492.9300      0.0000      0.0000
+   1970.5000   1492.9400      0.0000      0.0000
+   1970.9000   1492.9700      0.0000      0.0000
+   1971.4000   1492.9800      0.0000      0.0000
+   1971.8000   1492.9700      0.0000      0.0000
+   1972.2000   1492.9700      0.0000      0.0000
+   1972.7000   1492.9800      0.0000      0.0000
+   1973.1000   1492.9900      0.0000      0.0000
+   1973.6000   1493.0200      0.0000      0.0000
+   1974.0000   1493.0000      0.0000      0.0000
+   1974.5000   1492.9900      0.0000      0.0000
+   1974.9000   1493.0000      0.0000      0.0000
+   1975.3000   1492.9900      0.0000      0.0000
+   1975.8000   1493.0300      0.0000      0.0000
+   1976.2000   1493.0000      0.0000      0.0000
+   1976.7000   1493.0300      0.0000      0.0000
+   1977.1000   1493.0400      0.0000      0.0000
+   1977.6000   1493.0400      0.0000      0.0000
+   1978.0000   1493.0400      0.0000      0.0000
+   1978.4000   1493.0500      0.0000      0.0000
+   1978.9000   1493.0400      0.0000      0.0000
+   1979.3000   1493.0400      0.0000      0.0000
+   1979.8000   1493.0500      0.0000      0.0000
+   1980.2000   1493.0600      0.0000      0.0000
+   1980.7000   1493.0800      0.0000      0.0000
+   1981.1000   1493.0700      0.0000      0.0000
+   1981.5000   1493.1000      0.0000      0.0000
+   1982.0000   1493.0800      0.0000      0.0000
+   1982.4000   1493.1200      0.0000      0.0000
+   1982.9000   1493.0800      0.0000      0.0000
+   1983.3000   1493.1100      0.0000      0.0000
+   1983.7000   1493.1200      0.0000      0.0000
+   1984.2000   1493.1200      0.0000      0.0000
+   1984.6000   1493.1300      0.0000      0.0000
+   1985.1000   1493.1200      0.0000      0.0000
+   1985.5000   1493.1400      0.0000      0.0000
+   1986.0000   1493.1300      0.0000      0.0000
+   1986.4000   1493.1500      0.0000      0.0000
+   1986.8000   1493.1700      0.0000      0.0000
+   1987.3000   1493.1600      0.0000      0.0000
+   1987.7000   1493.1600      0.0000      0.0000
+   1988.2000   1493.1900      0.0000      0.0000
+   1988.6000   1493.1800      0.0000      0.0000
+   1989.1000   1493.1700      0.0000      0.0000
+   1989.5000   1493.1900      0.0000      0.0000
+   1989.9000   1493.2000      0.0000      0.0000
+   1990.4000   1493.2000      0.0000      0.0000
+   1990.8000   1493.2100      0.0000      0.0000
+   1991.3000   1493.1900      0.0000      0.0000
+   1991.7000   1493.2200      0.0000      0.0000
+   1992.1000   1493.2300      0.0000      0.0000
+   1992.6000   1493.2200      0.0000      0.0000
+   1993.0000   1493.2200      0.0000      0.0000
+   1993.5000   1493.2200      0.0000      0.0000
+   1993.9000   1493.2600      0.0000      0.0000
+   1994.3000   1493.2600      0.0000      0.0000
+   1994.8000   1493.2500      0.0000      0.0000
+   1995.2000   1493.2900      0.0000      0.0000
+   1995.7000   1493.2600      0.0000      0.0000
+   1996.1000   1493.6400      0.0000      0.0000
+   1996.6000   1493.3800      0.0000      0.0000
+   1997.0000   1493.3200      0.0000      0.0000
+   1997.4000   1493.3200      0.0000      0.0000
+   1997.9000   1493.3000      0.0000      0.0000
+   1998.3000   1493.2900      0.0000      0.0000
+   1998.8000   1493.2700      0.0000      0.0000
+   1999.2000   1493.3100      0.0000      0.0000
+   1999.6000   1493.3100      0.0000      0.0000
+   2000.1000   1493.3100      0.0000      0.0000
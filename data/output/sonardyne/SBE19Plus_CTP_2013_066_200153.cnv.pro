@@ -0,0 +1,75 @@
+test_read_store_and_write
+7/3/2013
+20:1:0
+Probe: SBE
+Source: /root/package/data/input/seabird/SBE19Plus_CTP_2013_066_200153.cnv
+      0.0288   1444.9601      0.1732      9.3652
+      0.1369   1448.9243      7.8961      7.9741
+      0.4544   1450.2844     11.0527      7.3495
+      0.5962   1447.2105     11.3831      6.5090
+      0.6210   1445.5578     11.5462      6.0680
+      0.6290   1442.7109     11.6811      5.3613
+      0.6557   1442.7117     11.6810      5.3614
+      0.7202   1442.7123     11.6807      5.3614
+      0.8333   1442.7086     11.6780      5.3609
+      0.9504   1442.6998     11.6774      5.3586
+      0.9970   1442.6839     11.6789      5.3543
+      1.0218   1442.6726     11.6798      5.3513
+      1.1031   1442.6643     11.6801      5.3490
+      1.2281   1442.6576     11.6810      5.3467
+      1.3264   1442.6552     11.6810      5.3458
+      1.3660   1442.6534     11.6814      5.3451
+      1.3789   1442.6543     11.6813      5.3453
+      1.4305   1442.6543     11.6810      5.3452
+      1.5258   1442.6376     11.6812      5.3409
+      1.6012   1442.5948     11.6859      5.3293
+      1.6468   1442.5641     11.6886      5.3212
+      1.6617   1442.5413     11.6905      5.3153
+      1.7083   1442.5281     11.6918      5.3117
+      1.7956   1442.5124     11.6916      5.3078
+      1.8710   1442.4870     11.6933      5.3011
+      1.9136   1442.4601     11.6954      5.2941
+      1.9295   1442.4451     11.6970      5.2901
+      1.9781   1442.4440     11.6975      5.2895
+      2.0565   1442.4373     11.6981      5.2875
+      2.1220   1442.4069     11.7005      5.2795
+      2.1428   1442.3477     11.7045      5.2645
+      2.1537   1442.2877     11.7105      5.2488
+      2.2182   1442.2554     11.7122      5.2406
+      2.3114   1442.1970     11.7126      5.2266
+      2.4116   1442.0631     11.7223      5.1924
+      2.4503   1441.9297     11.7346      5.1578
+      2.4622   1441.8428     11.7437      5.1350
+      2.4970   1441.7990     11.7459      5.1241
+      2.5813   1441.7553     11.7424      5.1147
+      2.6696   1441.6983     11.7483      5.0995
+      2.7341   1441.6609     11.7539      5.0890
+      2.7509   1441.6425     11.7556      5.0842
+      2.7559   1441.6328     11.7567      5.0816
+      2.8174   1441.6324     11.7559      5.0815
+      2.8967   1441.6273     11.7554      5.0802
+      2.9702   1441.6113     11.7562      5.0760
+      3.0049   1441.5884     11.7579      5.0701
+      3.0128   1441.5746     11.7609      5.0660
+      3.0406   1441.5796     11.7621      5.0667
+      3.0842   1441.5879     11.7578      5.0697
+      3.1557   1441.5616     11.7482      5.0662
+      3.2112   1441.5269     11.7591      5.0548
+      3.2291   1441.5158     11.7593      5.0521
+      3.2330   1441.5023     11.7578      5.0494
+      3.2628   1441.4875     11.7513      5.0478
+      3.3243   1441.4563     11.7567      5.0388
+      3.3858   1441.4310     11.7575      5.0325
+      3.4265   1441.4111     11.7567      5.0280
+      3.4324   1441.3813     11.7628      5.0193
+      3.4384   1441.3754     11.7626      5.0180
+      3.4711   1441.3722     11.7610      5.0176
+      3.5386   1441.3594     11.7620      5.0141
+      3.6031   1441.3389     11.7615      5.0093
+      3.6318   1441.3008     11.7640      4.9997
+      3.6328   1441.2667     11.7678      4.9907
+      3.6477   1441.2440     11.7696      4.9849
+      3.6953   1441.2357     11.7704      4.9826
+      3.7519   1441.2232     11.7694      4.9798
+      3.7916   1441.0413     11.6875      4.9617
+      3.8005   1440.2262     11.1969      4.9175
@@ -0,0 +1,78 @@
+test_read_store_and_write
+11/7/2013
+18:34:0
+Probe: SBE
+Source: /root/package/data/input/seabird/SBE19Plus_PCTSDSv_2013_192_183432.cnv
+     -0.0188   1493.5800      0.0486     23.8309
+     -0.0089   1496.5000      0.1043     24.8800
+     -0.0069   1496.5100      0.1035     24.8835
+      0.0079   1497.4100      0.8358     24.9127
+      0.1716   1507.6500      9.6108     25.1777
+      0.2212   1511.7000     10.9312     26.2150
+      0.3512   1514.8199     12.2789     26.8936
+      0.4891   1515.3900     12.1943     27.1644
+      0.5932   1515.6000     12.1645     27.2657
+      0.7083   1515.6801     12.1496     27.3031
+      0.8125   1515.6899     12.1301     27.3155
+      0.8611   1515.6801     12.1117     27.3171
+      0.9176   1515.6500     12.1013     27.3121
+      0.9841   1515.6200     12.0952     27.3010
+      1.0367   1515.5900     12.0888     27.2918
+      1.0466   1515.5800     12.0941     27.2835
+      1.0486   1515.5200     12.0940     27.2586
+      1.0922   1515.8800     12.1575     27.3777
+      1.0932   1515.8600     12.1580     27.3711
+      1.0972   1515.8700     12.1584     27.3740
+      1.1002   1515.8600     12.1565     27.3708
+      1.1031   1515.8600     12.1566     27.3711
+      1.1517   1515.8500     12.1570     27.3657
+      1.1944   1515.8500     12.1565     27.3654
+      1.2648   1515.8400     12.1557     27.3635
+      1.3680   1515.8400     12.1581     27.3600
+      1.5426   1515.8300     12.1531     27.3574
+      1.7608   1515.8101     12.1529     27.3463
+      2.0009   1515.7800     12.1533     27.3318
+      2.2370   1515.7300     12.1509     27.3110
+      2.4563   1515.6400     12.1593     27.2697
+      2.6566   1515.5300     12.1722     27.2180
+      2.8868   1515.4399     12.1830     27.1742
+      3.0981   1515.3600     12.1921     27.1371
+      3.2737   1515.3101     12.1978     27.1128
+      3.4155   1515.2800     12.2015     27.0963
+      3.5375   1515.2600     12.2037     27.0856
+      3.6834   1515.2500     12.2045     27.0790
+      3.8947   1515.2400     12.2054     27.0730
+      4.1417   1515.2300     12.2061     27.0682
+      4.3679   1515.2200     12.2062     27.0644
+      4.5782   1515.2200     12.2063     27.0611
+      4.7409   1515.2100     12.2051     27.0582
+      4.9045   1515.2100     12.2036     27.0542
+      5.1010   1515.2000     12.2030     27.0492
+      5.3251   1515.1801     12.1999     27.0446
+      5.5364   1515.1700     12.1953     27.0373
+      5.7329   1515.1400     12.1969     27.0266
+      5.8985   1515.1300     12.1980     27.0186
+      6.0622   1515.1100     12.1976     27.0115
+      6.2328   1515.1000     12.2104     27.0007
+      6.4491   1515.1100     12.2410     26.9898
+      6.6782   1515.1300     12.2810     26.9756
+      6.8945   1515.1100     12.3127     26.9529
+      7.0919   1515.1400     12.3977     26.9266
+      7.2546   1515.1000     12.4406     26.8902
+      7.3935   1515.0500     12.4724     26.8587
+      7.5125   1515.0500     12.5205     26.8335
+      7.6742   1515.0100     12.5427     26.8094
+      7.8954   1515.0000     12.5754     26.7901
+      8.1315   1514.9900     12.5978     26.7724
+      8.3775   1514.9600     12.6062     26.7560
+      8.4648   1514.9399     12.6160     26.7436
+      8.4966   1514.9200     12.6147     26.7351
+      8.5035   1514.9100     12.6199     26.7285
+      8.5104   1514.9100     12.6196     26.7280
+      8.5253   1514.9100     12.6185     26.7276
+      8.5392   1514.6801     12.4039     26.7284
+      8.5521   1513.7900     11.5727     26.7257
+      8.5650   1514.0400     11.8260     26.7163
+      8.5729   1514.6500     12.4076     26.7138
+      8.5749   1514.8500     12.5852     26.7174
+      8.5759   1514.8900     12.6010     26.7272
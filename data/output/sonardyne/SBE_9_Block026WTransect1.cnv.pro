@@ -0,0 +1,2185 @@
+test_read_store_and_write
+8/4/2013
+1:46:0
+Probe: SBE
+Source: /root/package/data/input/seabird/SBE_9_Block026WTransect1.cnv
+      3.6340   1520.8800     34.5234     19.9551
+      3.6440   1520.8800     34.5237     19.9548
+      3.6748   1520.8800     34.5233     19.9549
+      3.6956   1520.8800     34.5234     19.9550
+      3.7274   1520.8800     34.5237     19.9550
+      3.7363   1520.8800     34.5237     19.9551
+      3.7572   1520.8800     34.5238     19.9550
+      3.7671   1520.8800     34.5241     19.9550
+      3.7989   1520.8800     34.5243     19.9551
+      3.8188   1520.8800     34.5244     19.9548
+      3.8506   1520.8800     34.5243     19.9548
+      3.8705   1520.8800     34.5241     19.9550
+      3.8814   1520.8800     34.5242     19.9548
+      3.9032   1520.8800     34.5241     19.9550
+      3.9122   1520.8800     34.5245     19.9548
+      3.9340   1520.8800     34.5247     19.9550
+      3.9430   1520.8800     34.5244     19.9548
+      3.9648   1520.8800     34.5247     19.9548
+      3.9758   1520.8800     34.5245     19.9546
+      3.9857   1520.8800     34.5240     19.9548
+      3.9946   1520.8800     34.5237     19.9550
+      4.0046   1520.8800     34.5235     19.9546
+      4.0254   1520.8800     34.5230     19.9548
+      4.0374   1520.8800     34.5217     19.9548
+      4.0473   1520.8800     34.5204     19.9548
+      4.0562   1520.8800     34.5199     19.9550
+      4.0691   1520.8800     34.5191     19.9548
+      4.0771   1520.8900     34.5272     19.9546
+      4.1079   1520.8900     34.5275     19.9546
+      4.1307   1520.8900     34.5278     19.9544
+      4.1605   1520.8900     34.5276     19.9546
+      4.1913   1520.8900     34.5274     19.9544
+      4.2023   1520.8900     34.5274     19.9544
+      4.2033   1520.8900     34.5273     19.9548
+      4.2221   1520.8900     34.5276     19.9546
+      4.2331   1520.8900     34.5279     19.9550
+      4.2440   1520.8900     34.5278     19.9550
+      4.2937   1520.8900     34.5254     19.9557
+      4.3453   1520.9000     34.5253     19.9569
+      4.4188   1520.9000     34.5254     19.9580
+      4.4804   1520.9100     34.5254     19.9592
+      4.5221   1520.9100     34.5256     19.9596
+      4.5837   1520.9100     34.5256     19.9599
+      4.6453   1520.9100     34.5254     19.9603
+      4.7099   1520.9100     34.5254     19.9599
+      4.7586   1520.9100     34.5256     19.9596
+      4.8311   1520.9100     34.5259     19.9592
+      4.8828   1520.9100     34.5261     19.9589
+      4.9563   1520.9100     34.5258     19.9589
+      5.0079   1520.9100     34.5261     19.9587
+      5.0596   1520.9200     34.5257     19.9590
+      5.1420   1520.9200     34.5258     19.9594
+      5.1828   1520.9200     34.5259     19.9594
+      5.2454   1520.9200     34.5256     19.9597
+      5.2861   1520.9200     34.5255     19.9601
+      5.3586   1520.9200     34.5258     19.9601
+      5.3993   1520.9301     34.5260     19.9606
+      5.4510   1520.9301     34.5260     19.9610
+      5.4927   1520.9301     34.5259     19.9613
+      5.5335   1520.9301     34.5256     19.9610
+      5.5662   1520.9301     34.5258     19.9599
+      5.6070   1520.9200     34.5254     19.9590
+      5.6378   1520.9200     34.5256     19.9578
+      5.6686   1520.9200     34.5256     19.9573
+      5.7103   1520.9200     34.5256     19.9569
+      5.7520   1520.9200     34.5257     19.9565
+      5.7619   1520.9200     34.5258     19.9567
+      5.8027   1520.9200     34.5255     19.9572
+      5.8235   1520.9200     34.5256     19.9576
+      5.8444   1520.9301     34.5255     19.9576
+      5.8543   1520.9301     34.5254     19.9580
+      5.8752   1520.9301     34.5255     19.9580
+      5.8961   1520.9301     34.5257     19.9581
+      5.9060   1520.9301     34.5253     19.9580
+      5.9169   1520.9301     34.5256     19.9581
+      5.9368   1520.9301     34.5253     19.9580
+      5.9577   1520.9301     34.5254     19.9580
+      5.9785   1520.9301     34.5258     19.9573
+      5.9974   1520.9301     34.5251     19.9571
+      6.0093   1520.9200     34.5247     19.9564
+      6.0401   1520.9200     34.5249     19.9555
+      6.0610   1520.9200     34.5252     19.9548
+      6.0828   1520.9200     34.5252     19.9544
+      6.1037   1520.9200     34.5254     19.9543
+      6.1345   1520.9200     34.5250     19.9546
+      6.1444   1520.9200     34.5248     19.9544
+      6.1752   1520.9200     34.5251     19.9543
+      6.1961   1520.9200     34.5248     19.9542
+      6.2269   1520.9200     34.5250     19.9537
+      6.2378   1520.9200     34.5249     19.9535
+      6.2577   1520.9200     34.5248     19.9535
+      6.2895   1520.9200     34.5254     19.9530
+      6.2964   1520.9200     34.5250     19.9530
+      6.3302   1520.9200     34.5249     19.9532
+      6.3411   1520.9200     34.5254     19.9530
+      6.3610   1520.9200     34.5256     19.9532
+      6.3818   1520.9200     34.5257     19.9535
+      6.4027   1520.9200     34.5255     19.9541
+      6.4126   1520.9200     34.5259     19.9539
+      6.4434   1520.9301     34.5256     19.9541
+      6.4544   1520.9301     34.5258     19.9541
+      6.4752   1520.9301     34.5256     19.9539
+      6.4921   1520.9200     34.5251     19.9537
+      6.5160   1520.9200     34.5248     19.9532
+      6.5468   1520.9200     34.5249     19.9523
+      6.5587   1520.9200     34.5246     19.9521
+      6.5895   1520.9200     34.5244     19.9520
+      6.6103   1520.9200     34.5245     19.9514
+      6.6411   1520.9200     34.5247     19.9514
+      6.6620   1520.9200     34.5247     19.9511
+      6.6888   1520.9200     34.5246     19.9512
+      6.7136   1520.9200     34.5248     19.9512
+      6.7544   1520.9200     34.5249     19.9511
+      6.7752   1520.9200     34.5249     19.9512
+      6.8269   1520.9200     34.5244     19.9511
+      6.8478   1520.9200     34.5245     19.9505
+      6.8885   1520.9200     34.5245     19.9504
+      6.9262   1520.9200     34.5248     19.9500
+      6.9709   1520.9200     34.5251     19.9500
+      7.0127   1520.9200     34.5258     19.9495
+      7.0534   1520.9200     34.5260     19.9493
+      7.0961   1520.9200     34.5271     19.9488
+      7.1438   1520.9200     34.5284     19.9482
+      7.1885   1520.9301     34.5291     19.9481
+      7.2402   1520.9301     34.5302     19.9475
+      7.3027   1520.9301     34.5304     19.9472
+      7.3335   1520.9301     34.5311     19.9468
+      7.3922   1520.9301     34.5318     19.9463
+      7.4468   1520.9301     34.5321     19.9461
+      7.4895   1520.9301     34.5327     19.9456
+      7.5412   1520.9301     34.5319     19.9461
+      7.5928   1520.9301     34.5314     19.9465
+      7.6504   1520.9301     34.5299     19.9477
+      7.7061   1520.9301     34.5286     19.9484
+      7.7468   1520.9301     34.5285     19.9484
+      7.8054   1520.9399     34.5285     19.9486
+      7.8710   1520.9399     34.5288     19.9484
+      7.9226   1520.9399     34.5306     19.9468
+      7.9842   1520.9301     34.5328     19.9452
+      8.0438   1520.9399     34.5340     19.9445
+      8.0995   1520.9399     34.5346     19.9442
+      8.1611   1520.9399     34.5345     19.9442
+      8.2187   1520.9399     34.5342     19.9444
+      8.2644   1520.9399     34.5330     19.9452
+      8.3468   1520.9399     34.5314     19.9463
+      8.3945   1520.9399     34.5294     19.9477
+      8.4511   1520.9500     34.5283     19.9484
+      8.5127   1520.9500     34.5283     19.9486
+      8.5813   1520.9500     34.5296     19.9477
+      8.6468   1520.9500     34.5316     19.9465
+      8.6886   1520.9500     34.5333     19.9452
+      8.7670   1520.9500     34.5343     19.9447
+      8.8137   1520.9500     34.5343     19.9445
+      8.8753   1520.9500     34.5345     19.9447
+      8.9528   1520.9500     34.5349     19.9442
+      9.0194   1520.9500     34.5350     19.9440
+      9.0760   1520.9500     34.5364     19.9424
+      9.1545   1520.9500     34.5390     19.9406
+      9.2111   1520.9500     34.5418     19.9390
+      9.2776   1520.9500     34.5440     19.9380
+      9.3303   1520.9500     34.5481     19.9364
+      9.3969   1520.9500     34.5529     19.9350
+      9.4545   1520.9500     34.5568     19.9339
+      9.5101   1520.9600     34.5610     19.9328
+      9.5985   1520.9600     34.5702     19.9302
+      9.6353   1520.9700     34.5820     19.9267
+      9.7018   1520.9700     34.5907     19.9244
+      9.7694   1520.9800     34.6023     19.9212
+      9.8270   1520.9900     34.6217     19.9173
+      9.8826   1521.0000     34.6449     19.9133
+      9.9403   1521.0200     34.6703     19.9104
+      9.9979   1521.0500     34.6965     19.9090
+     10.0555   1521.1000     34.7367     19.9106
+     10.1002   1521.1899     34.7948     19.9188
+     10.1588   1521.2800     34.8497     19.9293
+     10.2035   1521.3600     34.8890     19.9412
+     10.2611   1521.4301     34.9175     19.9543
+     10.3187   1521.5000     34.9406     19.9699
+     10.3704   1521.5800     34.9625     19.9898
+     10.4270   1521.6600     34.9833     20.0091
+     10.4727   1521.7300     34.9999     20.0270
+     10.5105   1521.7900     35.0135     20.0442
+     10.5452   1521.8400     35.0261     20.0570
+     10.6029   1521.8800     35.0350     20.0677
+     10.6386   1521.9200     35.0437     20.0777
+     10.6793   1521.9600     35.0519     20.0887
+     10.7171   1522.0000     35.0613     20.0997
+     10.7519   1522.0400     35.0710     20.1118
+     10.7995   1522.0900     35.0822     20.1238
+     10.8353   1522.1500     35.0944     20.1391
+     10.8661   1522.2000     35.1074     20.1546
+     10.9039   1522.2600     35.1207     20.1693
+     10.9386   1522.3199     35.1356     20.1839
+     10.9694   1522.3900     35.1555     20.2018
+     11.0072   1522.4800     35.1802     20.2251
+     11.0419   1522.5800     35.2020     20.2500
+     11.0827   1522.6500     35.2176     20.2713
+     11.1105   1522.7100     35.2300     20.2871
+     11.1462   1522.7500     35.2380     20.2988
+     11.1721   1522.7800     35.2445     20.3066
+     11.1979   1522.8101     35.2502     20.3135
+     11.2287   1522.8300     35.2544     20.3200
+     11.2664   1522.8500     35.2596     20.3247
+     11.2804   1522.8700     35.2656     20.3296
+     11.3111   1522.8900     35.2708     20.3332
+     11.3280   1522.8900     35.2728     20.3355
+     11.3727   1522.9000     35.2727     20.3364
+     11.3837   1522.9000     35.2735     20.3375
+     11.4145   1522.9100     35.2741     20.3386
+     11.4313   1522.9100     35.2748     20.3403
+     11.4661   1522.9200     35.2783     20.3416
+     11.4761   1522.9301     35.2826     20.3428
+     11.5039   1522.9399     35.2872     20.3439
+     11.5277   1522.9500     35.2920     20.3453
+     11.5486   1522.9500     35.2956     20.3467
+     11.5655   1522.9600     35.2972     20.3484
+     11.5794   1522.9600     35.2963     20.3488
+     11.6012   1522.9500     35.2911     20.3476
+     11.6320   1522.9301     35.2834     20.3421
+     11.6390   1522.9200     35.2828     20.3380
+     11.6628   1522.9301     35.2876     20.3389
+     11.6727   1522.9399     35.2942     20.3414
+     11.6906   1522.9600     35.3001     20.3453
+     11.7244   1522.9700     35.3027     20.3479
+     11.7353   1522.9600     35.3029     20.3463
+     11.7562   1522.9700     35.3064     20.3485
+     11.7830   1522.9800     35.3050     20.3492
+     11.7969   1522.9600     35.3020     20.3451
+     11.8178   1522.9700     35.3054     20.3476
+     11.8456   1523.0100     35.3183     20.3548
+     11.8585   1523.0500     35.3297     20.3649
+     11.8903   1523.0601     35.3343     20.3685
+     11.9102   1523.0800     35.3392     20.3718
+     11.9280   1523.0900     35.3409     20.3763
+     11.9618   1523.0800     35.3380     20.3741
+     11.9827   1523.0800     35.3378     20.3729
+     12.0045   1523.0900     35.3415     20.3757
+     12.0324   1523.1100     35.3453     20.3789
+     12.0562   1523.1200     35.3522     20.3817
+     12.0870   1523.1500     35.3600     20.3895
+     12.1079   1523.1700     35.3653     20.3953
+     12.1386   1523.1899     35.3695     20.3996
+     12.1665   1523.2000     35.3729     20.4024
+     12.2002   1523.2100     35.3755     20.4046
+     12.2310   1523.2200     35.3782     20.4070
+     12.2519   1523.2300     35.3822     20.4095
+     12.2916   1523.2500     35.3866     20.4131
+     12.3244   1523.2700     35.3910     20.4171
+     12.3463   1523.2800     35.3963     20.4216
+     12.3860   1523.3101     35.4022     20.4267
+     12.4168   1523.3300     35.4075     20.4315
+     12.4466   1523.3400     35.4128     20.4356
+     12.5012   1523.3600     35.4169     20.4387
+     12.5112   1523.3700     35.4196     20.4412
+     12.5628   1523.3800     35.4220     20.4437
+     12.6045   1523.3900     35.4253     20.4460
+     12.6334   1523.4000     35.4274     20.4489
+     12.6761   1523.4100     35.4310     20.4513
+     12.7069   1523.4200     35.4348     20.4547
+     12.7496   1523.4399     35.4388     20.4584
+     12.8012   1523.4500     35.4418     20.4616
+     12.8420   1523.4600     35.4445     20.4641
+     12.8837   1523.4800     35.4472     20.4684
+     12.9324   1523.5000     35.4512     20.4732
+     12.9771   1523.5100     35.4553     20.4776
+     13.0297   1523.5300     35.4593     20.4832
+     13.0794   1523.5601     35.4655     20.4898
+     13.1221   1523.5800     35.4714     20.4953
+     13.1638   1523.6000     35.4752     20.4997
+     13.2155   1523.6100     35.4782     20.5022
+     13.2771   1523.6200     35.4803     20.5042
+     13.3049   1523.6300     35.4819     20.5058
+     13.3903   1523.6300     35.4840     20.5065
+     13.4330   1523.6400     35.4858     20.5067
+     13.4847   1523.6400     35.4867     20.5067
+     13.5254   1523.6400     35.4873     20.5064
+     13.5880   1523.6400     35.4879     20.5058
+     13.6496   1523.6400     35.4883     20.5053
+     13.7112   1523.6400     35.4883     20.5050
+     13.7529   1523.6400     35.4885     20.5049
+     13.8264   1523.6400     35.4889     20.5051
+     13.8781   1523.6400     35.4893     20.5056
+     13.9297   1523.6500     35.4902     20.5060
+     14.0013   1523.6500     35.4914     20.5065
+     14.0529   1523.6500     35.4914     20.5071
+     14.1165   1523.6500     35.4927     20.5069
+     14.1681   1523.6600     35.4927     20.5076
+     14.2297   1523.6600     35.4940     20.5074
+     14.3022   1523.6600     35.4950     20.5071
+     14.3539   1523.6600     35.4962     20.5067
+     14.4155   1523.6600     35.4968     20.5065
+     14.4671   1523.6700     35.4973     20.5069
+     14.5506   1523.6700     35.4983     20.5072
+     14.6022   1523.6700     35.4993     20.5076
+     14.6748   1523.6801     35.5004     20.5079
+     14.7264   1523.6801     35.5012     20.5079
+     14.7880   1523.6801     35.5020     20.5074
+     14.8407   1523.6801     35.5021     20.5074
+     14.9023   1523.6801     35.5024     20.5072
+     14.9758   1523.6801     35.5031     20.5074
+     15.0165   1523.6801     35.5037     20.5072
+     15.0900   1523.6899     35.5050     20.5073
+     15.1516   1523.6899     35.5064     20.5076
+     15.2032   1523.6899     35.5076     20.5081
+     15.2648   1523.6899     35.5082     20.5081
+     15.3274   1523.7000     35.5089     20.5083
+     15.3681   1523.7000     35.5093     20.5088
+     15.4317   1523.7000     35.5101     20.5088
+     15.4933   1523.7100     35.5106     20.5097
+     15.5450   1523.7100     35.5121     20.5101
+     15.5966   1523.7200     35.5146     20.5113
+     15.6483   1523.7200     35.5165     20.5126
+     15.6999   1523.7300     35.5182     20.5138
+     15.7526   1523.7300     35.5200     20.5150
+     15.8042   1523.7400     35.5218     20.5159
+     15.8450   1523.7500     35.5225     20.5172
+     15.8966   1523.7500     35.5243     20.5182
+     15.9383   1523.7600     35.5274     20.5202
+     15.9801   1523.7700     35.5307     20.5223
+     16.0307   1523.7800     35.5336     20.5239
+     16.0635   1523.7800     35.5352     20.5252
+     16.1251   1523.7900     35.5364     20.5260
+     16.1460   1523.7900     35.5374     20.5262
+     16.1867   1523.7900     35.5382     20.5267
+     16.2383   1523.8000     35.5394     20.5269
+     16.2592   1523.8000     35.5405     20.5275
+     16.3009   1523.8000     35.5422     20.5277
+     16.3317   1523.8101     35.5429     20.5280
+     16.3625   1523.8101     35.5435     20.5281
+     16.4052   1523.8101     35.5442     20.5283
+     16.4360   1523.8101     35.5445     20.5286
+     16.4668   1523.8101     35.5457     20.5285
+     16.4976   1523.8101     35.5467     20.5282
+     16.5284   1523.8199     35.5485     20.5280
+     16.5493   1523.8199     35.5502     20.5272
+     16.5801   1523.8199     35.5512     20.5271
+     16.6109   1523.8199     35.5506     20.5266
+     16.6426   1523.8101     35.5490     20.5262
+     16.6625   1523.8101     35.5482     20.5260
+     16.6953   1523.8101     35.5494     20.5259
+     16.7142   1523.8199     35.5514     20.5259
+     16.7470   1523.8199     35.5524     20.5255
+     16.7668   1523.8199     35.5524     20.5255
+     16.7986   1523.8199     35.5526     20.5253
+     16.8185   1523.8199     35.5524     20.5252
+     16.8393   1523.8199     35.5524     20.5253
+     16.8602   1523.8199     35.5521     20.5250
+     16.9009   1523.8199     35.5528     20.5247
+     16.9218   1523.8199     35.5538     20.5244
+     16.9327   1523.8199     35.5537     20.5244
+     16.9635   1523.8199     35.5549     20.5241
+     16.9854   1523.8199     35.5561     20.5236
+     17.0162   1523.8199     35.5571     20.5226
+     17.0350   1523.8199     35.5577     20.5216
+     17.0569   1523.8199     35.5578     20.5216
+     17.0777   1523.8199     35.5589     20.5210
+     17.0986   1523.8199     35.5591     20.5207
+     17.1403   1523.8199     35.5594     20.5205
+     17.1503   1523.8199     35.5600     20.5202
+     17.1811   1523.8199     35.5600     20.5200
+     17.2019   1523.8199     35.5595     20.5202
+     17.2327   1523.8199     35.5606     20.5197
+     17.2536   1523.8199     35.5607     20.5195
+     17.2754   1523.8199     35.5619     20.5189
+     17.3062   1523.8199     35.5623     20.5184
+     17.3370   1523.8199     35.5626     20.5177
+     17.3579   1523.8199     35.5628     20.5173
+     17.3887   1523.8101     35.5634     20.5165
+     17.4195   1523.8101     35.5644     20.5156
+     17.4503   1523.8101     35.5645     20.5150
+     17.4711   1523.8101     35.5654     20.5140
+     17.5019   1523.8101     35.5655     20.5134
+     17.5327   1523.8101     35.5656     20.5131
+     17.5744   1523.8101     35.5661     20.5127
+     17.5963   1523.8101     35.5665     20.5120
+     17.6271   1523.8101     35.5663     20.5119
+     17.6688   1523.8101     35.5669     20.5111
+     17.6887   1523.8101     35.5673     20.5106
+     17.7413   1523.8101     35.5672     20.5104
+     17.7612   1523.8101     35.5674     20.5103
+     17.8029   1523.8101     35.5676     20.5099
+     17.8337   1523.8101     35.5677     20.5090
+     17.8645   1523.8101     35.5681     20.5087
+     17.9171   1523.8101     35.5685     20.5083
+     17.9360   1523.8101     35.5688     20.5079
+     17.9897   1523.8101     35.5689     20.5078
+     18.0304   1523.8101     35.5689     20.5078
+     18.0622   1523.8101     35.5693     20.5067
+     18.1029   1523.8000     35.5707     20.5048
+     18.1446   1523.8000     35.5716     20.5028
+     18.2072   1523.8000     35.5728     20.5006
+     18.2261   1523.7900     35.5734     20.4987
+     18.2797   1523.7900     35.5746     20.4969
+     18.3105   1523.7900     35.5751     20.4960
+     18.3622   1523.7900     35.5755     20.4950
+     18.4029   1523.7800     35.5762     20.4932
+     18.4466   1523.7800     35.5769     20.4914
+     18.4963   1523.7800     35.5776     20.4898
+     18.5499   1523.7700     35.5774     20.4890
+     18.5896   1523.7700     35.5777     20.4874
+     18.6423   1523.7700     35.5785     20.4864
+     18.6830   1523.7700     35.5784     20.4863
+     18.7347   1523.7700     35.5787     20.4849
+     18.7983   1523.7700     35.5792     20.4831
+     18.8489   1523.7600     35.5796     20.4820
+     18.9016   1523.7600     35.5803     20.4811
+     18.9413   1523.7600     35.5800     20.4808
+     19.0059   1523.7600     35.5800     20.4809
+     19.0446   1523.7600     35.5801     20.4809
+     19.1191   1523.7600     35.5799     20.4804
+     19.1598   1523.7600     35.5804     20.4790
+     19.2006   1523.7600     35.5816     20.4767
+     19.2651   1523.7500     35.5823     20.4742
+     19.3247   1523.7500     35.5838     20.4710
+     19.3684   1523.7400     35.5847     20.4685
+     19.4290   1523.7400     35.5854     20.4666
+     19.4807   1523.7300     35.5868     20.4641
+     19.5453   1523.7300     35.5879     20.4613
+     19.5840   1523.7200     35.5901     20.4577
+     19.6575   1523.7100     35.5916     20.4542
+     19.7002   1523.7100     35.5927     20.4519
+     19.7598   1523.7000     35.5942     20.4490
+     19.8115   1523.7000     35.5966     20.4449
+     19.8661   1523.6899     35.5992     20.4403
+     19.9257   1523.6801     35.6001     20.4382
+     19.9784   1523.6801     35.6011     20.4359
+     20.0330   1523.6700     35.6033     20.4326
+     20.0817   1523.6700     35.6047     20.4303
+     20.1333   1523.6700     35.6056     20.4290
+     20.1979   1523.6700     35.6061     20.4281
+     20.2466   1523.6700     35.6059     20.4276
+     20.2992   1523.6600     35.6066     20.4256
+     20.3509   1523.6600     35.6076     20.4229
+     20.4154   1523.6500     35.6078     20.4210
+     20.4542   1523.6500     35.6082     20.4198
+     20.5158   1523.6500     35.6087     20.4189
+     20.5605   1523.6500     35.6085     20.4184
+     20.6201   1523.6500     35.6083     20.4178
+     20.6717   1523.6500     35.6079     20.4159
+     20.7134   1523.6400     35.6081     20.4133
+     20.7651   1523.6300     35.6076     20.4099
+     20.8108   1523.6200     35.6072     20.4069
+     20.8585   1523.6100     35.6072     20.4040
+     20.9211   1523.6100     35.6065     20.4026
+     20.9519   1523.6100     35.6062     20.4010
+     21.0065   1523.6100     35.6067     20.4001
+     21.0442   1523.6100     35.6065     20.4001
+     21.0959   1523.6100     35.6072     20.3998
+     21.1386   1523.6100     35.6063     20.3996
+     21.1903   1523.6000     35.6060     20.3982
+     21.2210   1523.6000     35.6061     20.3964
+     21.2767   1523.6000     35.6059     20.3955
+     21.2936   1523.6000     35.6059     20.3948
+     21.3671   1523.6000     35.6055     20.3945
+     21.3979   1523.6000     35.6053     20.3942
+     21.4386   1523.5900     35.6051     20.3937
+     21.4704   1523.5900     35.6047     20.3925
+     21.5042   1523.5900     35.6049     20.3906
+     21.5528   1523.5800     35.6046     20.3893
+     21.5836   1523.5800     35.6042     20.3879
+     21.6154   1523.5800     35.6043     20.3867
+     21.6671   1523.5699     35.6039     20.3849
+     21.6979   1523.5699     35.6034     20.3837
+     21.7187   1523.5699     35.6033     20.3821
+     21.7604   1523.5601     35.6026     20.3801
+     21.7962   1523.5500     35.6027     20.3780
+     21.8320   1523.5500     35.6028     20.3766
+     21.8647   1523.5500     35.6022     20.3752
+     21.8955   1523.5400     35.6019     20.3739
+     21.9164   1523.5400     35.6022     20.3724
+     21.9472   1523.5400     35.6019     20.3713
+     21.9780   1523.5300     35.6027     20.3697
+     22.0197   1523.5300     35.6027     20.3689
+     22.0396   1523.5300     35.6026     20.3683
+     22.0723   1523.5300     35.6027     20.3675
+     22.0912   1523.5300     35.6027     20.3674
+     22.1379   1523.5300     35.6028     20.3674
+     22.1439   1523.5300     35.6022     20.3674
+     22.1757   1523.5300     35.6019     20.3677
+     22.2064   1523.5400     35.6028     20.3685
+     22.2372   1523.5400     35.6030     20.3690
+     22.2581   1523.5400     35.6028     20.3693
+     22.2889   1523.5400     35.6027     20.3692
+     22.3098   1523.5400     35.6031     20.3683
+     22.3406   1523.5400     35.6031     20.3682
+     22.3624   1523.5400     35.6026     20.3683
+     22.3932   1523.5400     35.6029     20.3679
+     22.4141   1523.5400     35.6033     20.3675
+     22.4449   1523.5400     35.6030     20.3681
+     22.4657   1523.5400     35.6034     20.3678
+     22.4965   1523.5400     35.6031     20.3677
+     22.5174   1523.5400     35.6032     20.3675
+     22.5581   1523.5400     35.6032     20.3678
+     22.5690   1523.5400     35.6032     20.3670
+     22.6097   1523.5400     35.6033     20.3663
+     22.6316   1523.5400     35.6037     20.3658
+     22.6624   1523.5400     35.6033     20.3658
+     22.6932   1523.5400     35.6039     20.3654
+     22.7140   1523.5400     35.6039     20.3651
+     22.7558   1523.5400     35.6039     20.3647
+     22.7766   1523.5400     35.6040     20.3645
+     22.8174   1523.5300     35.6038     20.3640
+     22.8482   1523.5300     35.6041     20.3636
+     22.8690   1523.5300     35.6043     20.3630
+     22.9117   1523.5300     35.6046     20.3623
+     22.9326   1523.5300     35.6048     20.3613
+     22.9842   1523.5300     35.6050     20.3607
+     23.0041   1523.5300     35.6054     20.3597
+     23.0458   1523.5300     35.6061     20.3587
+     23.0766   1523.5300     35.6060     20.3582
+     23.1193   1523.5300     35.6063     20.3576
+     23.1501   1523.5300     35.6062     20.3575
+     23.1909   1523.5200     35.6064     20.3571
+     23.2326   1523.5300     35.6068     20.3569
+     23.2743   1523.5300     35.6063     20.3570
+     23.2942   1523.5300     35.6065     20.3565
+     23.3458   1523.5200     35.6067     20.3554
+     23.3885   1523.5200     35.6076     20.3541
+     23.4193   1523.5200     35.6075     20.3530
+     23.4859   1523.5200     35.6084     20.3511
+     23.5226   1523.5100     35.6091     20.3496
+     23.5534   1523.5100     35.6099     20.3485
+     23.6051   1523.5100     35.6101     20.3479
+     23.6577   1523.5100     35.6106     20.3474
+     23.6994   1523.5100     35.6111     20.3472
+     23.7511   1523.5100     35.6117     20.3466
+     23.7938   1523.5100     35.6129     20.3444
+     23.8455   1523.5000     35.6137     20.3419
+     23.8912   1523.5000     35.6140     20.3389
+     23.9378   1523.4900     35.6147     20.3350
+     23.9895   1523.4800     35.6153     20.3320
+     24.0531   1523.4700     35.6163     20.3283
+     24.0938   1523.4600     35.6170     20.3252
+     24.1564   1523.4600     35.6180     20.3223
+     24.2031   1523.4500     35.6192     20.3187
+     24.2607   1523.4399     35.6210     20.3151
+     24.3004   1523.4399     35.6222     20.3121
+     24.3739   1523.4301     35.6237     20.3096
+     24.4156   1523.4301     35.6240     20.3082
+     24.4772   1523.4301     35.6252     20.3063
+     24.5338   1523.4301     35.6262     20.3043
+     24.5915   1523.4200     35.6281     20.3024
+     24.6431   1523.4200     35.6309     20.3002
+     24.6948   1523.4200     35.6333     20.2991
+     24.7524   1523.4200     35.6351     20.2986
+     24.8100   1523.4301     35.6377     20.2983
+     24.8825   1523.4301     35.6401     20.2983
+     24.9232   1523.4301     35.6413     20.2986
+     24.9699   1523.4399     35.6423     20.2997
+     25.0385   1523.4399     35.6447     20.3007
+     25.0901   1523.4500     35.6467     20.3021
+     25.1517   1523.4600     35.6487     20.3041
+     25.2083   1523.4700     35.6512     20.3062
+     25.2659   1523.4800     35.6542     20.3087
+     25.3176   1523.4900     35.6570     20.3109
+     25.3732   1523.5000     35.6593     20.3124
+     25.4209   1523.5000     35.6635     20.3114
+     25.4845   1523.5000     35.6694     20.3089
+     25.5401   1523.5100     35.6787     20.3068
+     25.5878   1523.5200     35.6897     20.3068
+     25.6394   1523.5300     35.6984     20.3078
+     25.6941   1523.5400     35.7041     20.3092
+     25.7437   1523.5500     35.7084     20.3104
+     25.8053   1523.5601     35.7122     20.3104
+     25.8500   1523.5601     35.7164     20.3094
+     25.8997   1523.5699     35.7202     20.3089
+     25.9513   1523.5699     35.7256     20.3092
+     25.9960   1523.5800     35.7319     20.3101
+     26.0437   1523.5900     35.7363     20.3113
+     26.0884   1523.6000     35.7399     20.3134
+     26.1470   1523.6200     35.7459     20.3173
+     26.1798   1523.6400     35.7527     20.3219
+     26.2344   1523.6600     35.7581     20.3258
+     26.2722   1523.6801     35.7618     20.3297
+     26.3169   1523.6899     35.7658     20.3348
+     26.3546   1523.7200     35.7719     20.3404
+     26.3973   1523.7500     35.7788     20.3486
+     26.4520   1523.7800     35.7875     20.3565
+     26.4798   1523.8101     35.7954     20.3658
+     26.5145   1523.8500     35.8041     20.3759
+     26.5622   1523.8900     35.8116     20.3846
+     26.5980   1523.9100     35.8164     20.3916
+     26.6357   1523.9301     35.8199     20.3973
+     26.6804   1523.9500     35.8236     20.4017
+     26.7082   1523.9600     35.8269     20.4063
+     26.7599   1523.9800     35.8303     20.4108
+     26.7837   1523.9900     35.8328     20.4143
+     26.8235   1524.0100     35.8350     20.4175
+     26.8572   1524.0200     35.8375     20.4212
+     26.8950   1524.0300     35.8410     20.4249
+     26.9298   1524.0500     35.8447     20.4281
+     26.9576   1524.0601     35.8474     20.4313
+     27.0013   1524.0699     35.8506     20.4340
+     27.0201   1524.0800     35.8534     20.4370
+     27.0648   1524.0900     35.8555     20.4395
+     27.1026   1524.1000     35.8572     20.4419
+     27.1264   1524.1100     35.8593     20.4432
+     27.1652   1524.1100     35.8610     20.4442
+     27.1890   1524.1100     35.8620     20.4437
+     27.2387   1524.1100     35.8622     20.4419
+     27.2516   1524.1000     35.8625     20.4391
+     27.3003   1524.0900     35.8623     20.4356
+     27.3132   1524.0800     35.8620     20.4313
+     27.3549   1524.0699     35.8616     20.4273
+     27.3827   1524.0601     35.8609     20.4240
+     27.4274   1524.0500     35.8599     20.4212
+     27.4463   1524.0500     35.8601     20.4182
+     27.4681   1524.0400     35.8614     20.4154
+     27.5079   1524.0400     35.8618     20.4142
+     27.5516   1524.0400     35.8618     20.4140
+     27.5704   1524.0400     35.8619     20.4136
+     27.6032   1524.0400     35.8641     20.4147
+     27.6330   1524.0601     35.8677     20.4177
+     27.6757   1524.0699     35.8700     20.4196
+     27.7065   1524.0699     35.8709     20.4212
+     27.7264   1524.0699     35.8713     20.4220
+     27.7701   1524.0699     35.8713     20.4209
+     27.7979   1524.0699     35.8711     20.4187
+     27.8218   1524.0601     35.8707     20.4148
+     27.8625   1524.0400     35.8692     20.4092
+     27.9022   1524.0100     35.8671     20.3994
+     27.9261   1523.9800     35.8651     20.3882
+     27.9648   1523.9500     35.8628     20.3783
+     27.9986   1523.9200     35.8606     20.3695
+     28.0294   1523.8900     35.8602     20.3578
+     28.0592   1523.8700     35.8593     20.3488
+     28.1029   1523.8500     35.8593     20.3439
+     28.1416   1523.8500     35.8596     20.3407
+     28.1644   1523.8400     35.8598     20.3382
+     28.2062   1523.8400     35.8598     20.3363
+     28.2459   1523.8300     35.8595     20.3341
+     28.2777   1523.8199     35.8586     20.3297
+     28.2985   1523.8000     35.8570     20.3241
+     28.3591   1523.7900     35.8558     20.3196
+     28.3820   1523.7800     35.8554     20.3161
+     28.4237   1523.7700     35.8558     20.3139
+     28.4535   1523.7700     35.8556     20.3131
+     28.5061   1523.7700     35.8560     20.3125
+     28.5369   1523.7700     35.8560     20.3122
+     28.5667   1523.7700     35.8557     20.3121
+     28.6214   1523.7700     35.8560     20.3116
+     28.6522   1523.7700     35.8557     20.3119
+     28.6919   1523.7700     35.8558     20.3118
+     28.7247   1523.7700     35.8560     20.3119
+     28.7773   1523.7800     35.8575     20.3123
+     28.8061   1523.7900     35.8617     20.3161
+     28.8697   1523.8101     35.8668     20.3214
+     28.8906   1523.8300     35.8711     20.3269
+     28.9323   1523.8500     35.8744     20.3322
+     28.9720   1523.8700     35.8767     20.3357
+     29.0257   1523.8700     35.8784     20.3379
+     29.0564   1523.8800     35.8792     20.3389
+     29.0982   1523.8800     35.8801     20.3393
+     29.1389   1523.8800     35.8803     20.3395
+     29.1925   1523.8800     35.8811     20.3393
+     29.2233   1523.8900     35.8821     20.3403
+     29.2640   1523.8900     35.8837     20.3416
+     29.3256   1523.9000     35.8858     20.3430
+     29.3475   1523.9100     35.8873     20.3451
+     29.3882   1523.9200     35.8886     20.3471
+     29.4409   1523.9200     35.8896     20.3490
+     29.4816   1523.9301     35.8908     20.3502
+     29.5233   1523.9399     35.8920     20.3517
+     29.5650   1523.9399     35.8923     20.3534
+     29.6077   1523.9399     35.8927     20.3544
+     29.6485   1523.9500     35.8933     20.3550
+     29.6892   1523.9500     35.8934     20.3552
+     29.7418   1523.9500     35.8935     20.3553
+     29.7826   1523.9500     35.8939     20.3555
+     29.8253   1523.9500     35.8943     20.3555
+     29.8561   1523.9500     35.8945     20.3557
+     29.9186   1523.9600     35.8950     20.3561
+     29.9484   1523.9600     35.8953     20.3565
+     29.9802   1523.9600     35.8956     20.3570
+     30.0428   1523.9600     35.8964     20.3571
+     30.0746   1523.9700     35.8964     20.3574
+     30.1153   1523.9700     35.8964     20.3577
+     30.1670   1523.9700     35.8971     20.3576
+     30.1978   1523.9700     35.8970     20.3582
+     30.2405   1523.9700     35.8974     20.3589
+     30.2921   1523.9800     35.8985     20.3599
+     30.3338   1523.9800     35.8992     20.3605
+     30.3746   1523.9800     35.8991     20.3615
+     30.4173   1523.9900     35.8997     20.3619
+     30.4580   1523.9900     35.9000     20.3624
+     30.4997   1523.9900     35.9001     20.3628
+     30.5305   1523.9900     35.9002     20.3633
+     30.5822   1524.0000     35.9008     20.3637
+     30.6338   1524.0000     35.9013     20.3640
+     30.6557   1524.0000     35.9021     20.3647
+     30.7073   1524.0100     35.9029     20.3663
+     30.7490   1524.0100     35.9037     20.3675
+     30.7798   1524.0200     35.9040     20.3685
+     30.8325   1524.0200     35.9047     20.3695
+     30.8633   1524.0300     35.9056     20.3711
+     30.9050   1524.0300     35.9064     20.3723
+     30.9457   1524.0400     35.9069     20.3734
+     30.9874   1524.0400     35.9070     20.3745
+     31.0301   1524.0400     35.9069     20.3752
+     31.0709   1524.0400     35.9079     20.3753
+     31.1126   1524.0500     35.9085     20.3761
+     31.1434   1524.0500     35.9091     20.3770
+     31.1861   1524.0500     35.9095     20.3778
+     31.2377   1524.0601     35.9101     20.3789
+     31.2685   1524.0601     35.9106     20.3791
+     31.3093   1524.0601     35.9107     20.3799
+     31.3510   1524.0601     35.9101     20.3803
+     31.3937   1524.0699     35.9110     20.3803
+     31.4126   1524.0699     35.9120     20.3809
+     31.4761   1524.0699     35.9126     20.3819
+     31.5069   1524.0800     35.9143     20.3824
+     31.5487   1524.0800     35.9156     20.3830
+     31.6013   1524.0800     35.9163     20.3832
+     31.6202   1524.0900     35.9164     20.3837
+     31.6728   1524.0900     35.9169     20.3837
+     31.7145   1524.0900     35.9172     20.3836
+     31.7453   1524.0900     35.9168     20.3840
+     31.7880   1524.0900     35.9171     20.3837
+     31.8397   1524.0900     35.9169     20.3839
+     31.8705   1524.0900     35.9173     20.3843
+     31.9122   1524.0900     35.9175     20.3844
+     31.9638   1524.0900     35.9175     20.3846
+     31.9857   1524.1000     35.9188     20.3849
+     32.0473   1524.1000     35.9190     20.3864
+     32.0781   1524.1100     35.9198     20.3874
+     32.1297   1524.1100     35.9201     20.3881
+     32.1724   1524.1100     35.9207     20.3884
+     32.2132   1524.1100     35.9211     20.3887
+     32.2450   1524.1200     35.9213     20.3893
+     32.3065   1524.1200     35.9216     20.3904
+     32.3373   1524.1300     35.9228     20.3920
+     32.3800   1524.1300     35.9245     20.3935
+     32.4317   1524.1400     35.9252     20.3957
+     32.4724   1524.1500     35.9258     20.3975
+     32.5141   1524.1500     35.9263     20.3987
+     32.5658   1524.1600     35.9267     20.3995
+     32.5976   1524.1600     35.9271     20.3998
+     32.6601   1524.1600     35.9276     20.4003
+     32.7009   1524.1600     35.9283     20.4007
+     32.7426   1524.1700     35.9291     20.4016
+     32.7933   1524.1700     35.9301     20.4028
+     32.8469   1524.1801     35.9311     20.4047
+     32.8886   1524.1899     35.9323     20.4063
+     32.9293   1524.1899     35.9327     20.4076
+     32.9820   1524.2000     35.9340     20.4095
+     33.0446   1524.2100     35.9350     20.4122
+     33.0744   1524.2100     35.9362     20.4142
+     33.1181   1524.2200     35.9372     20.4155
+     33.1796   1524.2200     35.9371     20.4166
+     33.2313   1524.2300     35.9373     20.4168
+     33.2611   1524.2300     35.9378     20.4171
+     33.3257   1524.2300     35.9373     20.4173
+     33.3664   1524.2300     35.9374     20.4173
+     33.4180   1524.2300     35.9378     20.4172
+     33.4697   1524.2300     35.9381     20.4173
+     33.5203   1524.2300     35.9382     20.4173
+     33.5640   1524.2300     35.9382     20.4175
+     33.6058   1524.2400     35.9387     20.4182
+     33.6664   1524.2400     35.9393     20.4196
+     33.7101   1524.2500     35.9403     20.4214
+     33.7617   1524.2600     35.9420     20.4235
+     33.8134   1524.2600     35.9434     20.4250
+     33.8531   1524.2700     35.9439     20.4263
+     33.9067   1524.2700     35.9447     20.4269
+     33.9584   1524.2800     35.9451     20.4277
+     33.9991   1524.2800     35.9449     20.4285
+     34.0527   1524.2800     35.9450     20.4290
+     34.0945   1524.2800     35.9449     20.4294
+     34.1431   1524.2800     35.9453     20.4292
+     34.1978   1524.2800     35.9454     20.4292
+     34.2295   1524.2900     35.9452     20.4294
+     34.2782   1524.2900     35.9453     20.4292
+     34.3329   1524.2900     35.9449     20.4293
+     34.3636   1524.2900     35.9453     20.4294
+     34.4242   1524.2900     35.9458     20.4290
+     34.4580   1524.2900     35.9450     20.4290
+     34.4997   1524.2900     35.9454     20.4288
+     34.5494   1524.2900     35.9460     20.4294
+     34.5921   1524.3000     35.9463     20.4313
+     34.6348   1524.3000     35.9471     20.4324
+     34.6735   1524.3101     35.9471     20.4338
+     34.7073   1524.3101     35.9474     20.4340
+     34.7570   1524.3101     35.9475     20.4343
+     34.7908   1524.3101     35.9473     20.4343
+     34.8215   1524.3101     35.9475     20.4343
+     34.8702   1524.3101     35.9471     20.4340
+     34.8941   1524.3101     35.9472     20.4341
+     34.9437   1524.3101     35.9472     20.4340
+     34.9676   1524.3101     35.9474     20.4345
+     35.0192   1524.3199     35.9475     20.4349
+     35.0371   1524.3199     35.9481     20.4356
+     35.0808   1524.3199     35.9484     20.4359
+     35.1086   1524.3199     35.9498     20.4364
+     35.1324   1524.3400     35.9523     20.4405
+     35.1722   1524.3600     35.9555     20.4459
+     35.2060   1524.3700     35.9572     20.4501
+     35.2338   1524.3800     35.9571     20.4524
+     35.2576   1524.3800     35.9572     20.4529
+     35.2904   1524.3800     35.9566     20.4528
+     35.3182   1524.3800     35.9571     20.4522
+     35.3420   1524.3800     35.9574     20.4528
+     35.3698   1524.3800     35.9574     20.4524
+     35.3937   1524.3800     35.9578     20.4524
+     35.4225   1524.3900     35.9588     20.4551
+     35.4463   1524.4000     35.9605     20.4590
+     35.4632   1524.4200     35.9637     20.4618
+     35.4980   1524.4301     35.9679     20.4668
+     35.5258   1524.4500     35.9695     20.4714
+     35.5288   1524.4500     35.9678     20.4719
+     35.5665   1524.4399     35.9648     20.4689
+     35.5903   1524.4301     35.9648     20.4670
+     35.6082   1524.4399     35.9666     20.4684
+     35.6331   1524.4500     35.9687     20.4719
+     35.6490   1524.4600     35.9703     20.4746
+     35.6847   1524.4700     35.9703     20.4762
+     35.7016   1524.4700     35.9705     20.4770
+     35.7264   1524.4700     35.9703     20.4767
+     35.7433   1524.4600     35.9702     20.4753
+     35.7672   1524.4700     35.9702     20.4755
+     35.7950   1524.4700     35.9731     20.4774
+     35.8188   1524.5000     35.9788     20.4840
+     35.8476   1524.5300     35.9852     20.4937
+     35.8714   1524.5601     35.9893     20.5034
+     35.8893   1524.5800     35.9901     20.5078
+     35.9132   1524.5699     35.9881     20.5074
+     35.9410   1524.5699     35.9879     20.5072
+     35.9748   1524.5800     35.9895     20.5097
+     35.9936   1524.6000     35.9911     20.5138
+     36.0284   1524.6100     35.9938     20.5161
+     36.0552   1524.6200     35.9976     20.5205
+     36.0761   1524.6400     35.9992     20.5255
+     36.1108   1524.6400     35.9997     20.5259
+     36.1376   1524.6500     36.0010     20.5275
+     36.1734   1524.6600     36.0032     20.5310
+     36.2012   1524.6700     36.0054     20.5334
+     36.2251   1524.6801     36.0072     20.5362
+     36.2628   1524.6899     36.0079     20.5385
+     36.2936   1524.6899     36.0075     20.5398
+     36.3284   1524.7000     36.0086     20.5413
+     36.3572   1524.7000     36.0114     20.5428
+     36.3919   1524.7200     36.0149     20.5474
+     36.4297   1524.7400     36.0171     20.5527
+     36.4744   1524.7500     36.0174     20.5568
+     36.5131   1524.7600     36.0182     20.5591
+     36.5340   1524.7600     36.0182     20.5596
+     36.5896   1524.7600     36.0180     20.5597
+     36.6164   1524.7700     36.0187     20.5607
+     36.6611   1524.7900     36.0291     20.5649
+     36.6988   1524.8700     36.0472     20.5870
+     36.7306   1524.9700     36.0663     20.6140
+     36.7863   1525.0601     36.0802     20.6430
+     36.8240   1525.1400     36.0922     20.6673
+     36.8548   1525.2000     36.1015     20.6852
+     36.9114   1525.2400     36.1094     20.6978
+     36.9492   1525.2900     36.1153     20.7111
+     37.0008   1525.3199     36.1211     20.7223
+     37.0475   1525.3500     36.1255     20.7300
+     37.0942   1525.3700     36.1288     20.7353
+     37.1359   1525.3900     36.1335     20.7417
+     37.1826   1525.4301     36.1381     20.7524
+     37.2402   1525.4600     36.1429     20.7606
+     37.2819   1525.4700     36.1468     20.7647
+     37.3385   1525.4800     36.1477     20.7684
+     37.3951   1525.4900     36.1490     20.7705
+     37.4378   1525.5000     36.1506     20.7725
+     37.4935   1525.5100     36.1526     20.7763
+     37.5511   1525.5300     36.1551     20.7815
+     37.6037   1525.5500     36.1576     20.7871
+     37.6554   1525.5699     36.1601     20.7916
+     37.7229   1525.5800     36.1622     20.7944
+     37.7597   1525.5900     36.1638     20.7970
+     37.8322   1525.6000     36.1659     20.7990
+     37.8739   1525.6000     36.1680     20.8011
+     37.9414   1525.6200     36.1707     20.8043
+     37.9990   1525.6300     36.1739     20.8082
+     38.0507   1525.6400     36.1772     20.8113
+     38.1133   1525.6500     36.1793     20.8118
+     38.1709   1525.6400     36.1802     20.8091
+     38.2285   1525.6300     36.1806     20.8048
+     38.2901   1525.6200     36.1806     20.7999
+     38.3417   1525.6100     36.1807     20.7951
+     38.4152   1525.6000     36.1804     20.7898
+     38.4768   1525.5900     36.1802     20.7853
+     38.5245   1525.5699     36.1798     20.7810
+     38.5920   1525.5601     36.1797     20.7772
+     38.6437   1525.5500     36.1797     20.7730
+     38.7162   1525.5400     36.1798     20.7682
+     38.7688   1525.5300     36.1799     20.7632
+     38.8304   1525.5200     36.1798     20.7588
+     38.9029   1525.5100     36.1808     20.7563
+     38.9605   1525.5100     36.1824     20.7552
+     39.0072   1525.5200     36.1833     20.7559
+     39.0807   1525.5200     36.1845     20.7570
+     39.1324   1525.5300     36.1856     20.7579
+     39.1939   1525.5300     36.1860     20.7588
+     39.2575   1525.5400     36.1870     20.7606
+     39.3191   1525.5500     36.1879     20.7622
+     39.3707   1525.5500     36.1886     20.7638
+     39.4343   1525.5601     36.1891     20.7646
+     39.4959   1525.5601     36.1895     20.7650
+     39.5475   1525.5601     36.1899     20.7648
+     39.6002   1525.5601     36.1898     20.7654
+     39.6518   1525.5601     36.1901     20.7661
+     39.7204   1525.5699     36.1907     20.7666
+     39.7671   1525.5800     36.1914     20.7691
+     39.8286   1525.5900     36.1937     20.7725
+     39.8803   1525.6000     36.1967     20.7768
+     39.9439   1525.6200     36.1997     20.7812
+     39.9846   1525.6400     36.2024     20.7865
+     40.0362   1525.6600     36.2055     20.7930
+     40.0889   1525.6801     36.2100     20.7985
+     40.1514   1525.7000     36.2124     20.8043
+     40.1862   1525.7100     36.2139     20.8082
+     40.2458   1525.7200     36.2155     20.8104
+     40.2865   1525.7300     36.2165     20.8126
+     40.3382   1525.7400     36.2177     20.8146
+     40.3898   1525.7400     36.2190     20.8162
+     40.4325   1525.7500     36.2201     20.8180
+     40.4743   1525.7600     36.2208     20.8192
+     40.5269   1525.7600     36.2215     20.8200
+     40.5577   1525.7600     36.2220     20.8210
+     40.6193   1525.7700     36.2227     20.8221
+     40.6511   1525.7700     36.2233     20.8227
+     40.6918   1525.7700     36.2233     20.8233
+     40.7345   1525.7700     36.2231     20.8239
+     40.7861   1525.7800     36.2233     20.8240
+     40.8169   1525.7800     36.2239     20.8243
+     40.8527   1525.7800     36.2239     20.8240
+     40.9004   1525.7800     36.2238     20.8239
+     40.9321   1525.7800     36.2236     20.8238
+     40.9729   1525.7800     36.2237     20.8239
+     41.0037   1525.7800     36.2238     20.8236
+     41.0464   1525.7800     36.2236     20.8228
+     41.0772   1525.7800     36.2235     20.8226
+     41.1089   1525.7800     36.2239     20.8227
+     41.1397   1525.7800     36.2241     20.8224
+     41.1854   1525.7800     36.2241     20.8223
+     41.2132   1525.7800     36.2246     20.8229
+     41.2440   1525.7800     36.2248     20.8236
+     41.2649   1525.7800     36.2244     20.8231
+     41.3056   1525.7800     36.2241     20.8227
+     41.3384   1525.7800     36.2243     20.8221
+     41.3602   1525.7800     36.2247     20.8224
+     41.3900   1525.7900     36.2251     20.8228
+     41.4208   1525.7900     36.2254     20.8229
+     41.4417   1525.7900     36.2255     20.8232
+     41.4824   1525.7900     36.2255     20.8233
+     41.4943   1525.7900     36.2256     20.8232
+     41.5281   1525.7900     36.2255     20.8233
+     41.5559   1525.7900     36.2265     20.8230
+     41.5668   1525.7900     36.2257     20.8242
+     41.6076   1525.7900     36.2258     20.8243
+     41.6284   1525.7900     36.2262     20.8240
+     41.6532   1525.7900     36.2262     20.8243
+     41.6711   1525.8000     36.2265     20.8249
+     41.6910   1525.8000     36.2272     20.8262
+     41.7327   1525.8101     36.2288     20.8282
+     41.7436   1525.8199     36.2306     20.8305
+     41.7774   1525.8199     36.2304     20.8327
+     41.7963   1525.8199     36.2294     20.8323
+     41.8161   1525.8199     36.2295     20.8316
+     41.8479   1525.8199     36.2301     20.8314
+     41.8579   1525.8300     36.2307     20.8325
+     41.8916   1525.8300     36.2309     20.8333
+     41.9095   1525.8300     36.2302     20.8337
+     41.9304   1525.8300     36.2295     20.8335
+     41.9621   1525.8300     36.2299     20.8330
+     41.9860   1525.8300     36.2305     20.8333
+     42.0138   1525.8300     36.2313     20.8335
+     42.0654   1525.8300     36.2304     20.8341
+     42.0774   1525.8300     36.2300     20.8332
+     42.1101   1525.8300     36.2300     20.8327
+     42.1181   1525.8300     36.2302     20.8326
+     42.1598   1525.8300     36.2304     20.8328
+     42.1807   1525.8300     36.2300     20.8333
+     42.2035   1525.8300     36.2304     20.8334
+     42.2323   1525.8400     36.2307     20.8341
+     42.2542   1525.8400     36.2305     20.8341
+     42.2760   1525.8400     36.2308     20.8335
+     42.3058   1525.8400     36.2306     20.8337
+     42.3366   1525.8400     36.2299     20.8339
+     42.3674   1525.8400     36.2304     20.8337
+     42.4012   1525.8400     36.2311     20.8348
+     42.4101   1525.8400     36.2311     20.8353
+     42.4409   1525.8400     36.2310     20.8349
+     42.4846   1525.8400     36.2313     20.8348
+     42.5134   1525.8500     36.2328     20.8360
+     42.5343   1525.8600     36.2342     20.8380
+     42.5660   1525.8600     36.2337     20.8387
+     42.5998   1525.8600     36.2340     20.8380
+     42.6276   1525.8500     36.2331     20.8376
+     42.6693   1525.8500     36.2322     20.8369
+     42.6922   1525.8600     36.2333     20.8373
+     42.7329   1525.8600     36.2331     20.8382
+     42.7637   1525.8600     36.2327     20.8383
+     42.8074   1525.8600     36.2324     20.8380
+     42.8372   1525.8600     36.2319     20.8374
+     42.8680   1525.8600     36.2325     20.8364
+     42.9107   1525.8700     36.2365     20.8396
+     42.9296   1525.8900     36.2421     20.8457
+     42.9812   1525.9100     36.2466     20.8488
+     43.0150   1525.9100     36.2491     20.8507
+     43.0448   1525.9200     36.2505     20.8503
+     43.0964   1525.9100     36.2507     20.8477
+     43.1292   1525.9000     36.2505     20.8430
+     43.1580   1525.8800     36.2504     20.8380
+     43.2117   1525.8700     36.2505     20.8332
+     43.2325   1525.8600     36.2506     20.8288
+     43.2832   1525.8500     36.2502     20.8258
+     43.3269   1525.8500     36.2501     20.8226
+     43.3567   1525.8400     36.2503     20.8195
+     43.3984   1525.8300     36.2504     20.8173
+     43.4421   1525.8300     36.2505     20.8152
+     43.4818   1525.8199     36.2506     20.8134
+     43.5345   1525.8199     36.2508     20.8125
+     43.5652   1525.8199     36.2507     20.8120
+     43.6179   1525.8199     36.2511     20.8119
+     43.6497   1525.8199     36.2519     20.8113
+     43.7003   1525.8199     36.2515     20.8118
+     43.7430   1525.8199     36.2522     20.8113
+     43.7947   1525.8300     36.2521     20.8114
+     43.8265   1525.8300     36.2522     20.8113
+     43.8771   1525.8300     36.2521     20.8114
+     43.9308   1525.8300     36.2526     20.8110
+     43.9715   1525.8300     36.2528     20.8104
+     44.0142   1525.8199     36.2534     20.8094
+     44.0639   1525.8300     36.2537     20.8091
+     44.1066   1525.8300     36.2545     20.8086
+     44.1701   1525.8300     36.2549     20.8084
+     44.2108   1525.8300     36.2552     20.8084
+     44.2635   1525.8300     36.2557     20.8078
+     44.3042   1525.8300     36.2559     20.8073
+     44.3569   1525.8199     36.2562     20.8054
+     44.4085   1525.8199     36.2551     20.8031
+     44.4621   1525.8000     36.2541     20.7970
+     44.5029   1525.7700     36.2523     20.7870
+     44.5644   1525.7500     36.2508     20.7780
+     44.6062   1525.7300     36.2492     20.7714
+     44.6797   1525.7100     36.2491     20.7632
+     44.7104   1525.6899     36.2485     20.7565
+     44.7720   1525.6801     36.2475     20.7527
+     44.8257   1525.6700     36.2471     20.7501
+     44.8773   1525.6600     36.2466     20.7468
+     44.9180   1525.6500     36.2463     20.7435
+     44.9915   1525.6500     36.2455     20.7420
+     45.0332   1525.6500     36.2453     20.7406
+     45.0958   1525.6400     36.2447     20.7394
+     45.1375   1525.6400     36.2447     20.7378
+     45.2011   1525.6400     36.2439     20.7371
+     45.2528   1525.6400     36.2435     20.7357
+     45.3044   1525.6300     36.2429     20.7343
+     45.3670   1525.6200     36.2421     20.7316
+     45.4087   1525.6100     36.2419     20.7278
+     45.4822   1525.6100     36.2408     20.7263
+     45.5229   1525.6100     36.2405     20.7254
+     45.5646   1525.6000     36.2404     20.7236
+     45.6381   1525.6000     36.2399     20.7227
+     45.6898   1525.6000     36.2400     20.7230
+     45.7514   1525.6100     36.2404     20.7238
+     45.7941   1525.6100     36.2404     20.7234
+     45.8556   1525.6100     36.2404     20.7238
+     45.9093   1525.6200     36.2405     20.7254
+     45.9709   1525.6200     36.2408     20.7261
+     46.0116   1525.6200     36.2412     20.7264
+     46.0751   1525.6200     36.2410     20.7266
+     46.1367   1525.6200     36.2400     20.7257
+     46.1884   1525.6100     36.2385     20.7215
+     46.2420   1525.5900     36.2363     20.7154
+     46.2937   1525.5800     36.2351     20.7106
+     46.3463   1525.5699     36.2346     20.7078
+     46.3979   1525.5699     36.2350     20.7067
+     46.4595   1525.5699     36.2353     20.7063
+     46.5022   1525.5699     36.2352     20.7063
+     46.5638   1525.5699     36.2351     20.7058
+     46.6155   1525.5699     36.2346     20.7055
+     46.6671   1525.5601     36.2344     20.7044
+     46.7207   1525.5601     36.2336     20.7035
+     46.7714   1525.5601     36.2339     20.7028
+     46.8141   1525.5601     36.2344     20.7021
+     46.8767   1525.5601     36.2335     20.7012
+     46.9293   1525.5601     36.2334     20.7000
+     46.9710   1525.5500     36.2332     20.6989
+     47.0217   1525.5500     36.2329     20.6982
+     47.0853   1525.5500     36.2325     20.6982
+     47.1260   1525.5500     36.2330     20.6977
+     47.1677   1525.5500     36.2330     20.6970
+     47.2193   1525.5500     36.2326     20.6962
+     47.2730   1525.5500     36.2328     20.6957
+     47.3028   1525.5500     36.2326     20.6955
+     47.3663   1525.5500     36.2326     20.6952
+     47.4081   1525.5500     36.2322     20.6946
+     47.4597   1525.5500     36.2323     20.6938
+     47.4905   1525.5500     36.2319     20.6934
+     47.5431   1525.5400     36.2317     20.6927
+     47.5968   1525.5400     36.2312     20.6909
+     47.6256   1525.5400     36.2314     20.6891
+     47.6683   1525.5300     36.2313     20.6877
+     47.7100   1525.5300     36.2307     20.6865
+     47.7507   1525.5300     36.2305     20.6849
+     47.7934   1525.5200     36.2300     20.6824
+     47.8342   1525.5100     36.2296     20.6794
+     47.8659   1525.5000     36.2291     20.6760
+     47.9067   1525.5000     36.2281     20.6738
+     47.9494   1525.4900     36.2275     20.6716
+     47.9802   1525.4800     36.2273     20.6684
+     48.0139   1525.4700     36.2264     20.6659
+     48.0527   1525.4700     36.2262     20.6643
+     48.0844   1525.4700     36.2266     20.6641
+     48.1262   1525.4700     36.2258     20.6634
+     48.1470   1525.4600     36.2251     20.6609
+     48.1778   1525.4500     36.2242     20.6565
+     48.2205   1525.4301     36.2231     20.6512
+     48.2414   1525.4200     36.2223     20.6457
+     48.2722   1525.4000     36.2211     20.6392
+     48.3129   1525.3800     36.2193     20.6317
+     48.3337   1525.3500     36.2161     20.6226
+     48.3645   1525.3101     36.2099     20.6098
+     48.3973   1525.2400     36.2050     20.5865
+     48.4182   1525.1600     36.2024     20.5581
+     48.4490   1525.1000     36.1983     20.5359
+     48.4708   1525.0400     36.1951     20.5150
+     48.5016   1524.9700     36.1920     20.4921
+     48.5324   1524.9000     36.1894     20.4671
+     48.5532   1524.8400     36.1886     20.4455
+     48.5840   1524.8000     36.1885     20.4318
+     48.6148   1524.7900     36.1918     20.4230
+     48.6267   1524.7800     36.1943     20.4209
+     48.6575   1524.7600     36.1948     20.4136
+     48.6784   1524.7400     36.1950     20.4033
+     48.6992   1524.7200     36.1943     20.3994
+     48.7400   1524.7200     36.1963     20.3973
+     48.7519   1524.7200     36.1967     20.3971
+     48.7827   1524.7200     36.1970     20.3943
+     48.8135   1524.7100     36.1967     20.3930
+     48.8343   1524.7100     36.1982     20.3904
+     48.8552   1524.7100     36.1992     20.3907
+     48.8770   1524.7100     36.1998     20.3904
+     48.8979   1524.7100     36.2012     20.3886
+     48.9287   1524.7100     36.2024     20.3876
+     48.9495   1524.7000     36.2037     20.3863
+     48.9694   1524.7000     36.2040     20.3858
+     48.9903   1524.7000     36.2043     20.3859
+     49.0230   1524.7100     36.2054     20.3858
+     49.0419   1524.7100     36.2087     20.3869
+     49.0747   1524.7200     36.2132     20.3890
+     49.0945   1524.7300     36.2149     20.3916
+     49.1333   1524.7400     36.2158     20.3923
+     49.1581   1524.7400     36.2173     20.3943
+     49.1671   1524.7600     36.2212     20.3970
+     49.2098   1524.7800     36.2253     20.4021
+     49.2405   1524.7900     36.2291     20.4056
+     49.2515   1524.8000     36.2309     20.4081
+     49.2823   1524.8101     36.2340     20.4113
+     49.3140   1524.8199     36.2363     20.4140
+     49.3349   1524.8300     36.2359     20.4154
+     49.3657   1524.8300     36.2362     20.4163
+     49.3965   1524.8300     36.2369     20.4174
+     49.4173   1524.8400     36.2383     20.4186
+     49.4600   1524.8400     36.2394     20.4198
+     49.4670   1524.8500     36.2404     20.4212
+     49.5117   1524.8500     36.2402     20.4219
+     49.5544   1524.8500     36.2402     20.4219
+     49.5733   1524.8500     36.2402     20.4223
+     49.6061   1524.8500     36.2404     20.4226
+     49.6368   1524.8600     36.2410     20.4227
+     49.6676   1524.8600     36.2410     20.4233
+     49.6984   1524.8600     36.2413     20.4235
+     49.7272   1524.8600     36.2410     20.4237
+     49.7719   1524.8600     36.2416     20.4239
+     49.7828   1524.8600     36.2415     20.4239
+     49.8355   1524.8600     36.2420     20.4240
+     49.8563   1524.8700     36.2416     20.4244
+     49.8971   1524.8700     36.2416     20.4244
+     49.9388   1524.8700     36.2421     20.4241
+     49.9775   1524.8700     36.2414     20.4246
+     50.0123   1524.8700     36.2419     20.4242
+     50.0431   1524.8700     36.2418     20.4242
+     50.0739   1524.8700     36.2421     20.4240
+     50.1166   1524.8700     36.2415     20.4244
+     50.1583   1524.8700     36.2417     20.4244
+     50.1960   1524.8700     36.2419     20.4244
+     50.2318   1524.8700     36.2417     20.4244
+     50.2725   1524.8700     36.2419     20.4245
+     50.3043   1524.8700     36.2410     20.4240
+     50.3569   1524.8600     36.2408     20.4209
+     50.3947   1524.8600     36.2409     20.4180
+     50.4394   1524.8500     36.2406     20.4157
+     50.4821   1524.8500     36.2403     20.4136
+     50.5228   1524.8400     36.2397     20.4104
+     50.5744   1524.8199     36.2404     20.4049
+     50.6122   1524.8101     36.2395     20.4007
+     50.6479   1524.7900     36.2399     20.3943
+     50.6996   1524.7800     36.2415     20.3870
+     50.7413   1524.7600     36.2424     20.3816
+     50.7890   1524.7500     36.2428     20.3766
+     50.8356   1524.7400     36.2426     20.3720
+     50.8883   1524.7300     36.2422     20.3671
+     50.9290   1524.7100     36.2413     20.3608
+     50.9777   1524.6899     36.2410     20.3533
+     51.0343   1524.6700     36.2404     20.3453
+     51.0859   1524.6500     36.2392     20.3380
+     51.1227   1524.6300     36.2384     20.3304
+     51.1694   1524.6100     36.2380     20.3230
+     51.2210   1524.5900     36.2374     20.3176
+     51.2687   1524.5800     36.2379     20.3136
+     51.3154   1524.5699     36.2370     20.3109
+     51.3670   1524.5699     36.2367     20.3076
+     51.4197   1524.5601     36.2358     20.3041
+     51.4673   1524.5400     36.2356     20.2993
+     51.5349   1524.5400     36.2366     20.2963
+     51.5756   1524.5400     36.2390     20.2953
+     51.6342   1524.5400     36.2412     20.2940
+     51.6789   1524.5400     36.2429     20.2919
+     51.7266   1524.5300     36.2445     20.2894
+     51.7732   1524.5300     36.2454     20.2875
+     51.8368   1524.5200     36.2463     20.2857
+     51.8845   1524.5200     36.2472     20.2844
+     51.9411   1524.5200     36.2470     20.2840
+     51.9828   1524.5200     36.2475     20.2828
+     52.0503   1524.5200     36.2470     20.2825
+     52.1079   1524.5200     36.2473     20.2812
+     52.1447   1524.5200     36.2474     20.2805
+     52.2122   1524.5200     36.2472     20.2800
+     52.2529   1524.5200     36.2478     20.2794
+     52.3106   1524.5200     36.2482     20.2793
+     52.3682   1524.5200     36.2481     20.2796
+     52.4258   1524.5200     36.2489     20.2797
+     52.4724   1524.5200     36.2492     20.2795
+     52.5201   1524.5200     36.2491     20.2789
+     52.5757   1524.5200     36.2488     20.2781
+     52.6333   1524.5100     36.2492     20.2759
+     52.6909   1524.5100     36.2486     20.2734
+     52.7486   1524.5000     36.2483     20.2692
+     52.7952   1524.4900     36.2480     20.2651
+     52.8528   1524.4800     36.2481     20.2612
+     52.8995   1524.4700     36.2476     20.2587
+     52.9472   1524.4600     36.2483     20.2560
+     53.0147   1524.4600     36.2481     20.2538
+     53.0396   1524.4500     36.2480     20.2520
+     53.1091   1524.4500     36.2481     20.2502
+     53.1558   1524.4500     36.2475     20.2491
+     53.2034   1524.4500     36.2475     20.2479
+     53.2690   1524.4399     36.2481     20.2464
+     53.3286   1524.4399     36.2483     20.2451
+     53.3633   1524.4399     36.2480     20.2445
+     53.4209   1524.4399     36.2484     20.2438
+     53.4786   1524.4399     36.2483     20.2433
+     53.5054   1524.4399     36.2484     20.2428
+     53.5719   1524.4399     36.2485     20.2424
+     53.6136   1524.4399     36.2484     20.2422
+     53.6514   1524.4399     36.2488     20.2421
+     53.7080   1524.4399     36.2491     20.2421
+     53.7557   1524.4399     36.2497     20.2422
+     53.8023   1524.4399     36.2503     20.2425
+     53.8431   1524.4500     36.2508     20.2433
+     53.9016   1524.4500     36.2518     20.2440
+     53.9473   1524.4600     36.2532     20.2449
+     53.9851   1524.4600     36.2535     20.2458
+     54.0318   1524.4600     36.2546     20.2459
+     54.0834   1524.4600     36.2549     20.2462
+     54.1202   1524.4600     36.2551     20.2461
+     54.1658   1524.4700     36.2552     20.2459
+     54.2085   1524.4700     36.2552     20.2459
+     54.2453   1524.4700     36.2558     20.2458
+     54.2811   1524.4700     36.2563     20.2451
+     54.3337   1524.4700     36.2561     20.2449
+     54.3605   1524.4600     36.2564     20.2442
+     54.4062   1524.4600     36.2561     20.2438
+     54.4479   1524.4600     36.2560     20.2431
+     54.4757   1524.4600     36.2563     20.2428
+     54.5204   1524.4600     36.2562     20.2427
+     54.5631   1524.4600     36.2558     20.2428
+     54.6009   1524.4600     36.2564     20.2422
+     54.6356   1524.4600     36.2563     20.2424
+     54.6664   1524.4600     36.2571     20.2418
+     54.7091   1524.4600     36.2571     20.2416
+     54.7469   1524.4600     36.2571     20.2415
+     54.7915   1524.4700     36.2573     20.2415
+     54.8233   1524.4700     36.2578     20.2411
+     54.8511   1524.4700     36.2580     20.2414
+     54.8958   1524.4700     36.2582     20.2410
+     54.9167   1524.4700     36.2589     20.2409
+     54.9485   1524.4700     36.2599     20.2410
+     54.9862   1524.4700     36.2603     20.2411
+     55.0210   1524.4700     36.2609     20.2411
+     55.0518   1524.4700     36.2608     20.2411
+     55.0845   1524.4700     36.2611     20.2415
+     55.1114   1524.4800     36.2622     20.2421
+     55.1461   1524.4800     36.2638     20.2433
+     55.1670   1524.4900     36.2652     20.2447
+     55.2097   1524.4900     36.2647     20.2459
+     55.2365   1524.5000     36.2650     20.2465
+     55.2613   1524.5000     36.2656     20.2470
+     55.2921   1524.5000     36.2668     20.2480
+     55.3239   1524.5100     36.2682     20.2499
+     55.3517   1524.5200     36.2692     20.2525
+     55.3865   1524.5300     36.2712     20.2546
+     55.4272   1524.5400     36.2727     20.2575
+     55.4391   1524.5500     36.2741     20.2598
+     55.4798   1524.5500     36.2755     20.2617
+     55.5076   1524.5601     36.2765     20.2635
+     55.5424   1524.5601     36.2772     20.2649
+     55.5742   1524.5699     36.2784     20.2663
+     55.6258   1524.5699     36.2789     20.2674
+     55.6367   1524.5800     36.2796     20.2692
+     55.6864   1524.5900     36.2809     20.2709
+     55.6993   1524.5900     36.2818     20.2727
+     55.7510   1524.6000     36.2827     20.2739
+     55.7619   1524.6000     36.2836     20.2754
+     55.8026   1524.6100     36.2848     20.2767
+     55.8354   1524.6200     36.2862     20.2782
+     55.8731   1524.6200     36.2876     20.2805
+     55.9089   1524.6300     36.2887     20.2822
+     55.9278   1524.6400     36.2889     20.2837
+     55.9605   1524.6400     36.2900     20.2844
+     56.0012   1524.6400     36.2904     20.2854
+     56.0340   1524.6500     36.2904     20.2860
+     56.0747   1524.6500     36.2914     20.2864
+     56.0926   1524.6500     36.2925     20.2871
+     56.1373   1524.6600     36.2937     20.2880
+     56.1691   1524.6600     36.2942     20.2891
+     56.1999   1524.6600     36.2954     20.2896
+     56.2307   1524.6700     36.2960     20.2897
+     56.2724   1524.6700     36.2965     20.2901
+     56.3042   1524.6700     36.2971     20.2906
+     56.3359   1524.6700     36.2980     20.2904
+     56.3667   1524.6700     36.2996     20.2905
+     56.4164   1524.6801     36.3008     20.2903
+     56.4402   1524.6801     36.3032     20.2904
+     56.4810   1524.6899     36.3053     20.2918
+     56.5137   1524.6899     36.3077     20.2926
+     56.5545   1524.7000     36.3103     20.2940
+     56.5862   1524.7100     36.3133     20.2953
+     56.6170   1524.7100     36.3158     20.2945
+     56.6597   1524.7000     36.3177     20.2923
+     56.6905   1524.7000     36.3201     20.2885
+     56.7422   1524.6899     36.3215     20.2853
+     56.7640   1524.6801     36.3226     20.2824
+     56.8157   1524.6801     36.3233     20.2803
+     56.8365   1524.6801     36.3238     20.2786
+     56.8891   1524.6700     36.3242     20.2771
+     56.9199   1524.6700     36.3245     20.2754
+     56.9716   1524.6700     36.3244     20.2739
+     57.0014   1524.6600     36.3248     20.2713
+     57.0451   1524.6500     36.3249     20.2682
+     57.0759   1524.6400     36.3249     20.2647
+     57.1086   1524.6300     36.3249     20.2614
+     57.1702   1524.6300     36.3250     20.2575
+     57.1911   1524.6100     36.3245     20.2534
+     57.2427   1524.6000     36.3245     20.2496
+     57.2854   1524.6000     36.3243     20.2465
+     57.3261   1524.5900     36.3243     20.2431
+     57.3589   1524.5800     36.3239     20.2408
+     57.3996   1524.5800     36.3242     20.2393
+     57.4414   1524.5800     36.3240     20.2381
+     57.4950   1524.5699     36.3238     20.2374
+     57.5248   1524.5699     36.3247     20.2369
+     57.5764   1524.5800     36.3266     20.2369
+     57.6092   1524.5800     36.3282     20.2367
+     57.6608   1524.5800     36.3286     20.2370
+     57.7016   1524.5800     36.3294     20.2367
+     57.7343   1524.5800     36.3301     20.2369
+     57.7860   1524.5900     36.3303     20.2373
+     57.8267   1524.5900     36.3305     20.2378
+     57.8803   1524.5900     36.3309     20.2378
+     57.9211   1524.5900     36.3317     20.2381
+     57.9518   1524.5900     36.3322     20.2385
+     58.0055   1524.6000     36.3325     20.2390
+     58.0462   1524.6000     36.3330     20.2394
+     58.0988   1524.6000     36.3338     20.2397
+     58.1326   1524.6100     36.3348     20.2411
+     58.1823   1524.6200     36.3366     20.2431
+     58.2240   1524.6300     36.3381     20.2457
+     58.2766   1524.6300     36.3389     20.2470
+     58.3173   1524.6300     36.3391     20.2481
+     58.3491   1524.6400     36.3392     20.2482
+     58.4117   1524.6400     36.3397     20.2479
+     58.4435   1524.6400     36.3398     20.2482
+     58.5060   1524.6400     36.3402     20.2484
+     58.5368   1524.6400     36.3400     20.2491
+     58.5895   1524.6400     36.3405     20.2495
+     58.6312   1524.6500     36.3414     20.2502
+     58.6620   1524.6600     36.3434     20.2522
+     58.7255   1524.6700     36.3450     20.2553
+     58.7682   1524.6801     36.3469     20.2575
+     58.8090   1524.6899     36.3487     20.2598
+     58.8507   1524.6899     36.3507     20.2617
+     58.9033   1524.7000     36.3529     20.2644
+     58.9341   1524.7100     36.3550     20.2667
+     58.9857   1524.7200     36.3566     20.2685
+     59.0284   1524.7300     36.3573     20.2697
+     59.0801   1524.7300     36.3582     20.2704
+     59.1109   1524.7300     36.3596     20.2708
+     59.1744   1524.7400     36.3607     20.2716
+     59.2052   1524.7400     36.3613     20.2727
+     59.2479   1524.7400     36.3623     20.2727
+     59.2996   1524.7500     36.3629     20.2731
+     59.3403   1524.7500     36.3641     20.2730
+     59.3731   1524.7500     36.3649     20.2729
+     59.4247   1524.7500     36.3654     20.2727
+     59.4555   1524.7500     36.3666     20.2722
+     59.4982   1524.7500     36.3670     20.2721
+     59.5399   1524.7500     36.3676     20.2715
+     59.5806   1524.7500     36.3678     20.2718
+     59.6233   1524.7500     36.3685     20.2721
+     59.6641   1524.7600     36.3695     20.2729
+     59.7058   1524.7600     36.3711     20.2739
+     59.7376   1524.7700     36.3737     20.2753
+     59.7793   1524.7800     36.3764     20.2779
+     59.8220   1524.7900     36.3805     20.2800
+     59.8528   1524.8000     36.3842     20.2821
+     59.9044   1524.8101     36.3878     20.2840
+     59.9253   1524.8199     36.3901     20.2855
+     59.9779   1524.8199     36.3921     20.2856
+     60.0196   1524.8300     36.3927     20.2855
+     60.0415   1524.8199     36.3941     20.2844
+     60.0931   1524.8199     36.3947     20.2829
+     60.1239   1524.8199     36.3947     20.2819
+     60.1547   1524.8199     36.3944     20.2803
+     60.1974   1524.8101     36.3940     20.2777
+     60.2391   1524.8000     36.3938     20.2748
+     60.2699   1524.8000     36.3939     20.2727
+     60.3116   1524.7900     36.3933     20.2715
+     60.3325   1524.7900     36.3934     20.2702
+     60.3841   1524.7900     36.3934     20.2695
+     60.4050   1524.7900     36.3933     20.2694
+     60.4586   1524.7900     36.3933     20.2690
+     60.4894   1524.7900     36.3934     20.2688
+     60.5112   1524.7900     36.3932     20.2685
+     60.5629   1524.7900     36.3931     20.2681
+     60.5937   1524.7900     36.3932     20.2681
+     60.6155   1524.7900     36.3932     20.2681
+     60.6672   1524.7900     36.3929     20.2679
+     60.6979   1524.7900     36.3931     20.2678
+     60.7307   1524.7900     36.3932     20.2674
+     60.7595   1524.7900     36.3929     20.2668
+     60.8132   1524.7800     36.3925     20.2658
+     60.8231   1524.7800     36.3920     20.2651
+     60.8757   1524.7800     36.3922     20.2644
+     60.9075   1524.7800     36.3922     20.2642
+     60.9482   1524.7800     36.3918     20.2640
+     60.9701   1524.7800     36.3921     20.2637
+     61.0217   1524.7800     36.3918     20.2637
+     61.0426   1524.7800     36.3920     20.2635
+     61.0833   1524.7800     36.3922     20.2633
+     61.1161   1524.7800     36.3930     20.2635
+     61.1568   1524.7900     36.3934     20.2642
+     61.2005   1524.7900     36.3935     20.2647
+     61.2313   1524.7900     36.3940     20.2649
+     61.2720   1524.7900     36.3944     20.2651
+     61.3048   1524.7900     36.3949     20.2654
+     61.3455   1524.8000     36.3952     20.2661
+     61.3872   1524.8000     36.3960     20.2672
+     61.4180   1524.8101     36.3964     20.2682
+     61.4508   1524.8101     36.3978     20.2692
+     61.5014   1524.8199     36.3985     20.2704
+     61.5342   1524.8199     36.4005     20.2715
+     61.5749   1524.8300     36.4023     20.2739
+     61.6186   1524.8400     36.4035     20.2754
+     61.6573   1524.8400     36.4042     20.2759
+     61.6911   1524.8400     36.4049     20.2753
+     61.7308   1524.8400     36.4046     20.2747
+     61.7845   1524.8300     36.4048     20.2732
+     61.8152   1524.8300     36.4039     20.2713
+     61.8570   1524.8199     36.4038     20.2681
+     61.8987   1524.8101     36.4034     20.2645
+     61.9503   1524.8000     36.4031     20.2612
+     61.9831   1524.7900     36.4032     20.2580
+     62.0238   1524.7900     36.4033     20.2560
+     62.0774   1524.7900     36.4043     20.2546
+     62.1062   1524.7900     36.4054     20.2543
+     62.1619   1524.7900     36.4068     20.2539
+     62.2125   1524.7900     36.4079     20.2538
+     62.2443   1524.7900     36.4083     20.2536
+     62.2949   1524.7900     36.4084     20.2534
+     62.3376   1524.7900     36.4086     20.2529
+     62.3903   1524.7900     36.4088     20.2520
+     62.4409   1524.7900     36.4084     20.2495
+     62.4737   1524.7800     36.4080     20.2472
+     62.5244   1524.7700     36.4081     20.2454
+     62.5879   1524.7700     36.4079     20.2444
+     62.6316   1524.7700     36.4080     20.2436
+     62.6803   1524.7700     36.4090     20.2441
+     62.7230   1524.7800     36.4100     20.2465
+     62.7776   1524.7900     36.4109     20.2486
+     62.8273   1524.8000     36.4115     20.2500
+     62.8690   1524.8000     36.4117     20.2511
+     62.9246   1524.8000     36.4118     20.2515
+     62.9733   1524.8000     36.4120     20.2516
+     63.0259   1524.8000     36.4117     20.2518
+     63.0805   1524.8000     36.4119     20.2514
+     63.1193   1524.8101     36.4115     20.2516
+     63.1719   1524.8101     36.4122     20.2515
+     63.2265   1524.8101     36.4129     20.2522
+     63.2762   1524.8101     36.4136     20.2532
+     63.3179   1524.8199     36.4142     20.2537
+     63.3824   1524.8199     36.4139     20.2533
+     63.4331   1524.8101     36.4141     20.2513
+     63.4748   1524.8000     36.4139     20.2482
+     63.5274   1524.8000     36.4133     20.2451
+     63.5930   1524.7900     36.4125     20.2424
+     63.6208   1524.7800     36.4124     20.2403
+     63.6844   1524.7800     36.4121     20.2378
+     63.7390   1524.7700     36.4112     20.2340
+     63.7787   1524.7500     36.4099     20.2291
+     63.8303   1524.7400     36.4086     20.2236
+     63.8711   1524.7200     36.4079     20.2172
+     63.9346   1524.7000     36.4075     20.2111
+     63.9684   1524.6899     36.4063     20.2050
+     64.0181   1524.6700     36.4058     20.1985
+     64.0806   1524.6500     36.4053     20.1926
+     64.1114   1524.6400     36.4043     20.1880
+     64.1571   1524.6300     36.4036     20.1829
+     64.2276   1524.6100     36.4031     20.1785
+     64.2485   1524.6000     36.4027     20.1739
+     64.2892   1524.5900     36.4024     20.1696
+     64.3408   1524.5800     36.4017     20.1661
+     64.3935   1524.5699     36.4014     20.1617
+     64.4183   1524.5601     36.4009     20.1567
+     64.4669   1524.5400     36.3994     20.1521
+     64.5196   1524.5300     36.3990     20.1477
+     64.5514   1524.5200     36.3992     20.1440
+     64.5931   1524.5100     36.3993     20.1405
+     64.6338   1524.5100     36.3986     20.1385
+     64.6696   1524.5000     36.3989     20.1362
+     64.7073   1524.5000     36.3990     20.1346
+     64.7490   1524.4900     36.3985     20.1331
+     64.7808   1524.4900     36.3986     20.1321
+     64.8225   1524.4900     36.3985     20.1307
+     64.8533   1524.4900     36.3981     20.1299
+     64.8960   1524.4800     36.3981     20.1290
+     64.9168   1524.4800     36.3980     20.1288
+     64.9695   1524.4800     36.3979     20.1284
+     64.9933   1524.4800     36.3977     20.1283
+     65.0311   1524.4800     36.3982     20.1281
+     65.0638   1524.4900     36.3982     20.1284
+     65.0946   1524.4900     36.3983     20.1282
+     65.1254   1524.4900     36.3984     20.1284
+     65.1562   1524.4900     36.3983     20.1286
+     65.1890   1524.4900     36.3987     20.1286
+     65.2297   1524.4900     36.3990     20.1281
+     65.2505   1524.4900     36.3988     20.1276
+     65.2813   1524.4900     36.3988     20.1267
+     65.3141   1524.4800     36.3989     20.1256
+     65.3449   1524.4800     36.3987     20.1249
+     65.3697   1524.4800     36.3987     20.1242
+     65.4084   1524.4800     36.3984     20.1231
+     65.4283   1524.4700     36.3979     20.1223
+     65.4700   1524.4700     36.3979     20.1212
+     65.5008   1524.4700     36.3979     20.1199
+     65.5127   1524.4600     36.3973     20.1185
+     65.5534   1524.4600     36.3972     20.1171
+     65.5743   1524.4600     36.3967     20.1150
+     65.6170   1524.4500     36.3964     20.1123
+     65.6379   1524.4399     36.3960     20.1091
+     65.6686   1524.4301     36.3959     20.1067
+     65.6994   1524.4301     36.3951     20.1048
+     65.7104   1524.4200     36.3952     20.1026
+     65.7630   1524.4200     36.3952     20.1012
+     65.7729   1524.4100     36.3951     20.0995
+     65.8146   1524.4100     36.3947     20.0980
+     65.8365   1524.4100     36.3948     20.0965
+     65.8782   1524.4000     36.3946     20.0949
+     65.8981   1524.4000     36.3948     20.0933
+     65.9189   1524.3900     36.3942     20.0915
+     65.9616   1524.3900     36.3941     20.0898
+     65.9924   1524.3800     36.3943     20.0874
+     66.0133   1524.3800     36.3941     20.0846
+     66.0560   1524.3700     36.3936     20.0814
+     66.0768   1524.3600     36.3939     20.0774
+     66.1076   1524.3500     36.3936     20.0733
+     66.1503   1524.3400     36.3929     20.0697
+     66.1702   1524.3199     36.3934     20.0647
+     66.2119   1524.3101     36.3933     20.0604
+     66.2327   1524.3000     36.3926     20.0575
+     66.2755   1524.2900     36.3924     20.0539
+     66.2963   1524.2900     36.3921     20.0511
+     66.3370   1524.2800     36.3928     20.0483
+     66.3797   1524.2800     36.3924     20.0463
+     66.4105   1524.2700     36.3922     20.0442
+     66.4274   1524.2600     36.3917     20.0423
+     66.4840   1524.2600     36.3916     20.0406
+     66.5049   1524.2600     36.3915     20.0388
+     66.5466   1524.2500     36.3912     20.0369
+     66.5784   1524.2500     36.3910     20.0349
+     66.6201   1524.2400     36.3913     20.0326
+     66.6608   1524.2400     36.3911     20.0309
+     66.6936   1524.2300     36.3911     20.0298
+     66.7343   1524.2300     36.3910     20.0285
+     66.7671   1524.2300     36.3907     20.0275
+     66.8187   1524.2300     36.3905     20.0265
+     66.8455   1524.2200     36.3905     20.0248
+     66.8922   1524.2200     36.3902     20.0229
+     66.9230   1524.2100     36.3900     20.0213
+     66.9746   1524.2100     36.3896     20.0201
+     67.0064   1524.2100     36.3898     20.0183
+     67.0481   1524.2000     36.3895     20.0171
+     67.0908   1524.2000     36.3896     20.0153
+     67.1325   1524.2000     36.3895     20.0139
+     67.1792   1524.1899     36.3891     20.0125
+     67.2159   1524.1899     36.3889     20.0107
+     67.2577   1524.1801     36.3889     20.0093
+     67.2984   1524.1801     36.3890     20.0070
+     67.3411   1524.1700     36.3883     20.0049
+     67.3927   1524.1700     36.3883     20.0029
+     67.4394   1524.1600     36.3880     20.0004
+     67.4662   1524.1500     36.3867     19.9970
+     67.5188   1524.1400     36.3860     19.9919
+     67.5606   1524.1200     36.3846     19.9861
+     67.6132   1524.1000     36.3844     19.9790
+     67.6489   1524.0800     36.3841     19.9728
+     67.6857   1524.0699     36.3838     19.9677
+     67.7383   1524.0601     36.3834     19.9627
+     67.7701   1524.0400     36.3832     19.9571
+     67.8327   1524.0300     36.3817     19.9520
+     67.8694   1524.0100     36.3808     19.9474
+     67.9151   1524.0000     36.3808     19.9422
+     67.9687   1523.9800     36.3793     19.9362
+     67.9995   1523.9600     36.3777     19.9272
+     68.0462   1523.9301     36.3771     19.9185
+     68.1038   1523.9200     36.3765     19.9126
+     68.1465   1523.9000     36.3766     19.9074
+     68.1773   1523.8800     36.3755     19.9004
+     68.2339   1523.8500     36.3743     19.8893
+     68.2816   1523.8199     36.3722     19.8783
+     68.3233   1523.8000     36.3704     19.8702
+     68.3700   1523.7800     36.3699     19.8640
+     68.4176   1523.7700     36.3699     19.8599
+     68.4703   1523.7600     36.3700     19.8564
+     68.5010   1523.7500     36.3695     19.8539
+     68.5477   1523.7500     36.3694     19.8521
+     68.6063   1523.7400     36.3686     19.8495
+     68.6381   1523.7300     36.3676     19.8466
+     68.6838   1523.7200     36.3668     19.8434
+     68.7424   1523.7100     36.3656     19.8390
+     68.7841   1523.7000     36.3646     19.8342
+     68.8198   1523.6801     36.3641     19.8285
+     68.8675   1523.6700     36.3628     19.8246
+     68.9092   1523.6600     36.3627     19.8210
+     68.9450   1523.6500     36.3614     19.8173
+     69.0036   1523.6400     36.3606     19.8120
+     69.0344   1523.6200     36.3593     19.8065
+     69.0810   1523.6000     36.3586     19.8006
+     69.1198   1523.5900     36.3576     19.7952
+     69.1744   1523.5699     36.3572     19.7897
+     69.2022   1523.5601     36.3564     19.7852
+     69.2548   1523.5500     36.3558     19.7803
+     69.2896   1523.5400     36.3556     19.7762
+     69.3392   1523.5200     36.3550     19.7720
+     69.3730   1523.5100     36.3544     19.7671
+     69.4117   1523.5000     36.3532     19.7616
+     69.4534   1523.4800     36.3527     19.7562
+     69.4882   1523.4700     36.3519     19.7515
+     69.5379   1523.4500     36.3516     19.7467
+     69.5726   1523.4399     36.3505     19.7420
+     69.5994   1523.4200     36.3497     19.7366
+     69.6421   1523.4100     36.3485     19.7319
+     69.6868   1523.4000     36.3484     19.7270
+     69.7146   1523.3800     36.3473     19.7211
+     69.7603   1523.3600     36.3460     19.7144
+     69.7981   1523.3400     36.3447     19.7070
+     69.8229   1523.3199     36.3439     19.6982
+     69.8716   1523.2800     36.3422     19.6874
+     69.8855   1523.2500     36.3410     19.6740
+     69.9440   1523.2100     36.3385     19.6616
+     69.9589   1523.1801     36.3386     19.6491
+     70.0076   1523.1500     36.3372     19.6386
+     70.0314   1523.1100     36.3365     19.6269
+     70.0910   1523.0699     36.3354     19.6126
+     70.0950   1523.0300     36.3331     19.5971
+     70.1447   1522.9900     36.3310     19.5832
+     70.1754   1522.9500     36.3299     19.5697
+     70.1993   1522.9100     36.3302     19.5563
+     70.2489   1522.8800     36.3294     19.5461
+     70.2608   1522.8600     36.3291     19.5381
+     70.3036   1522.8400     36.3285     19.5322
+     70.3314   1522.8300     36.3276     19.5275
+     70.3770   1522.8199     36.3277     19.5234
+     70.3949   1522.8101     36.3277     19.5201
+     70.4287   1522.8000     36.3274     19.5173
+     70.4585   1522.8000     36.3275     19.5151
+     70.5022   1522.7900     36.3271     19.5138
+     70.5201   1522.7900     36.3269     19.5123
+     70.5538   1522.7900     36.3270     19.5110
+     70.5836   1522.7800     36.3267     19.5098
+     70.6065   1522.7800     36.3259     19.5085
+     70.6571   1522.7800     36.3256     19.5070
+     70.6799   1522.7700     36.3250     19.5056
+     70.6978   1522.7700     36.3248     19.5032
+     70.7425   1522.7600     36.3245     19.5007
+     70.7644   1522.7500     36.3239     19.4982
+     70.8031   1522.7400     36.3232     19.4955
+     70.8160   1522.7400     36.3230     19.4927
+     70.8557   1522.7300     36.3233     19.4902
+     70.8895   1522.7300     36.3230     19.4885
+     70.9173   1522.7200     36.3223     19.4867
+     70.9411   1522.7100     36.3219     19.4848
+     70.9838   1522.7100     36.3213     19.4830
+     71.0017   1522.7100     36.3213     19.4816
+     71.0355   1522.7000     36.3210     19.4802
+     71.0643   1522.7000     36.3212     19.4789
+     71.0980   1522.7000     36.3212     19.4781
+     71.1298   1522.7000     36.3212     19.4772
+     71.1586   1522.6899     36.3210     19.4761
+     71.1924   1522.6899     36.3202     19.4751
+     71.2222   1522.6899     36.3200     19.4740
+     71.2559   1522.6801     36.3195     19.4733
+     71.2768   1522.6801     36.3196     19.4726
+     71.3265   1522.6801     36.3195     19.4724
+     71.3384   1522.6801     36.3199     19.4726
+     71.3811   1522.6899     36.3197     19.4731
+     71.4208   1522.6899     36.3200     19.4731
+     71.4327   1522.6899     36.3196     19.4733
+     71.4854   1522.6899     36.3193     19.4729
+     71.5152   1522.6801     36.3185     19.4719
+     71.5489   1522.6801     36.3185     19.4702
+     71.5569   1522.6801     36.3180     19.4694
+     71.6214   1522.6801     36.3179     19.4684
+     71.6433   1522.6700     36.3150     19.4666
+     71.6711   1522.6600     36.3158     19.4641
+     71.7158   1522.6600     36.3165     19.4616
+     71.7475   1522.6500     36.3160     19.4586
+     71.7783   1522.6400     36.3156     19.4551
+     71.8081   1522.6300     36.3152     19.4525
+     71.8419   1522.6300     36.3152     19.4509
+     71.8826   1522.6200     36.3146     19.4492
+     71.9124   1522.6100     36.3136     19.4456
+     71.9462   1522.6000     36.3128     19.4424
+     71.9769   1522.5900     36.3122     19.4384
+     72.0177   1522.5800     36.3117     19.4327
+     72.0405   1522.5601     36.3102     19.4276
+     72.0812   1522.5500     36.3101     19.4232
+     72.1130   1522.5400     36.3098     19.4197
+     72.1527   1522.5300     36.3098     19.4177
+     72.1865   1522.5300     36.3087     19.4157
+     72.2073   1522.5200     36.3088     19.4125
+     72.2471   1522.5100     36.3083     19.4089
+     72.2908   1522.5000     36.3073     19.4058
+     72.3215   1522.4900     36.3068     19.4019
+     72.3543   1522.4800     36.3067     19.3996
+     72.3941   1522.4800     36.3066     19.3980
+     72.4278   1522.4700     36.3064     19.3963
+     72.4586   1522.4700     36.3054     19.3946
+     72.5003   1522.4600     36.3055     19.3922
+     72.5192   1522.4600     36.3049     19.3903
+     72.5738   1522.4500     36.3049     19.3891
+     72.5937   1522.4500     36.3043     19.3880
+     72.6364   1522.4500     36.3039     19.3859
+     72.6572   1522.4399     36.3030     19.3833
+     72.7079   1522.4301     36.3034     19.3804
+     72.7307   1522.4301     36.3034     19.3797
+     72.7724   1522.4301     36.3033     19.3785
+     72.8032   1522.4200     36.3024     19.3767
+     72.8340   1522.4100     36.3021     19.3741
+     72.8757   1522.4100     36.3022     19.3725
+     72.8866   1522.4100     36.3023     19.3730
+     72.9383   1522.4100     36.3019     19.3725
+     72.9710   1522.4100     36.3019     19.3709
+     73.0018   1522.4100     36.3020     19.3707
+     73.0326   1522.4100     36.3018     19.3722
+     73.0753   1522.4100     36.3019     19.3716
+     73.0852   1522.4100     36.3017     19.3707
+     73.1389   1522.4100     36.3017     19.3704
+     73.1587   1522.4100     36.3012     19.3706
+     73.2004   1522.4100     36.3019     19.3700
+     73.2223   1522.4100     36.3009     19.3700
+     73.2630   1522.4100     36.3008     19.3697
+     73.2948   1522.4100     36.3011     19.3697
+     73.3266   1522.4100     36.3009     19.3702
+     73.3474   1522.4100     36.3012     19.3700
+     73.3891   1522.4100     36.3009     19.3700
+     73.4209   1522.4100     36.3007     19.3695
+     73.4517   1522.4100     36.3008     19.3695
+     73.4725   1522.4100     36.3012     19.3689
+     73.5153   1522.4100     36.3008     19.3684
+     73.5460   1522.4100     36.3005     19.3678
+     73.5669   1522.4000     36.3004     19.3671
+     73.5977   1522.4000     36.3013     19.3650
+     73.6404   1522.4000     36.3018     19.3632
+     73.6612   1522.3900     36.3018     19.3620
+     73.7139   1522.3900     36.3020     19.3615
+     73.7248   1522.3900     36.3021     19.3605
+     73.7655   1522.3900     36.3025     19.3598
+     73.7864   1522.3900     36.3027     19.3598
+     73.8291   1522.3900     36.3032     19.3599
+     73.8499   1522.3900     36.3034     19.3598
+     73.8906   1522.3900     36.3041     19.3593
+     73.9125   1522.3900     36.3036     19.3594
+     73.9542   1522.3900     36.3035     19.3590
+     73.9850   1522.3900     36.3033     19.3591
+     74.0178   1522.3900     36.3038     19.3588
+     74.0486   1522.3900     36.3039     19.3590
+     74.0793   1522.3900     36.3042     19.3588
+     74.1220   1522.4000     36.3041     19.3595
+     74.1429   1522.4000     36.3046     19.3597
+     74.1737   1522.4000     36.3047     19.3597
+     74.2164   1522.4000     36.3041     19.3598
+     74.2571   1522.4000     36.3043     19.3597
+     74.2779   1522.4000     36.3038     19.3597
+     74.3207   1522.4000     36.3040     19.3597
+     74.3634   1522.4000     36.3042     19.3597
+     74.3941   1522.4000     36.3041     19.3597
+     74.4150   1522.4000     36.3037     19.3597
+     74.4676   1522.4000     36.3036     19.3597
+     74.4984   1522.4000     36.3032     19.3595
+     74.5302   1522.4000     36.3039     19.3597
+     74.5928   1522.4100     36.3047     19.3598
+     74.6037   1522.4100     36.3056     19.3595
+     74.6563   1522.4100     36.3061     19.3594
+     74.6970   1522.4100     36.3063     19.3584
+     74.7288   1522.4000     36.3064     19.3565
+     74.7705   1522.3900     36.3070     19.3527
+     74.8232   1522.3800     36.3068     19.3493
+     74.8430   1522.3800     36.3069     19.3466
+     74.8966   1522.3700     36.3063     19.3445
+     74.9493   1522.3700     36.3061     19.3426
+     74.9701   1522.3600     36.3061     19.3407
+     75.0317   1522.3600     36.3059     19.3389
+     75.0635   1522.3500     36.3057     19.3366
+     75.1052   1522.3400     36.3050     19.3333
+     75.1578   1522.3300     36.3053     19.3298
+     75.1995   1522.3199     36.3048     19.3271
+     75.2422   1522.3199     36.3044     19.3240
+     75.2939   1522.3101     36.3037     19.3219
+     75.3465   1522.3101     36.3036     19.3201
+     75.3773   1522.3000     36.3036     19.3185
+     75.4389   1522.3000     36.3035     19.3171
+     75.4925   1522.2900     36.3030     19.3145
+     75.5243   1522.2800     36.3023     19.3112
+     75.5769   1522.2700     36.3023     19.3074
+     75.6186   1522.2700     36.3022     19.3050
+     75.6703   1522.2600     36.3022     19.3037
+     75.7239   1522.2600     36.3021     19.3036
+     75.7646   1522.2600     36.3019     19.3036
+     75.8172   1522.2700     36.3023     19.3032
+     75.8709   1522.2700     36.3022     19.3030
+     75.9116   1522.2700     36.3019     19.3029
+     75.9751   1522.2600     36.3018     19.3020
+     76.0059   1522.2600     36.3018     19.3009
+     76.0576   1522.2600     36.3013     19.2999
+     76.1102   1522.2600     36.3008     19.2986
+     76.1420   1522.2500     36.3008     19.2969
+     76.2045   1522.2500     36.3006     19.2956
+     76.2463   1522.2500     36.3005     19.2944
+     76.3098   1522.2400     36.3006     19.2931
+     76.3396   1522.2400     36.3003     19.2925
+     76.3833   1522.2400     36.3008     19.2915
+     76.4359   1522.2400     36.3001     19.2909
+     76.4776   1522.2400     36.3001     19.2903
+     76.5184   1522.2400     36.2998     19.2899
+     76.5591   1522.2400     36.3001     19.2894
+     76.6127   1522.2400     36.3002     19.2889
+     76.6455   1522.2300     36.2999     19.2885
+     76.6862   1522.2300     36.2999     19.2878
+     76.7269   1522.2300     36.2997     19.2872
+     76.7706   1522.2300     36.2995     19.2866
+     76.8014   1522.2300     36.2993     19.2860
+     76.8441   1522.2300     36.2994     19.2854
+     76.8838   1522.2300     36.2991     19.2847
+     76.9057   1522.2300     36.2989     19.2841
+     76.9593   1522.2300     36.2992     19.2838
+     76.9782   1522.2300     36.2990     19.2836
+     77.0219   1522.2300     36.2989     19.2832
+     77.0427   1522.2300     36.2990     19.2832
+     77.0854   1522.2300     36.2988     19.2830
+     77.1033   1522.2300     36.2989     19.2827
+     77.1370   1522.2200     36.2987     19.2825
+     77.1678   1522.2300     36.2984     19.2825
+     77.1976   1522.2200     36.2976     19.2822
+     77.2205   1522.2200     36.2981     19.2821
+     77.2532   1522.2300     36.2988     19.2818
+     77.2711   1522.2200     36.2984     19.2818
+     77.2840   1522.2300     36.2983     19.2820
+     77.3148   1522.2300     36.2985     19.2818
+     77.3446   1522.2300     36.2990     19.2818
+     77.3575   1522.2300     36.2987     19.2820
+     77.3784   1522.2300     36.2991     19.2821
+     77.3962   1522.2300     36.2992     19.2822
+     77.4091   1522.2300     36.2984     19.2825
+     77.4399   1522.2300     36.2987     19.2825
+     77.4489   1522.2300     36.2994     19.2825
+     77.4727   1522.2300     36.2991     19.2827
+     77.4936   1522.2300     36.2988     19.2824
+     77.5005   1522.2300     36.2990     19.2825
+     77.5134   1522.2300     36.2990     19.2825
+     77.5343   1522.2300     36.2990     19.2824
+     77.5432   1522.2300     36.2992     19.2824
+     77.5770   1522.2300     36.2993     19.2824
+     77.5949   1522.2300     36.2988     19.2822
+     77.5978   1522.2300     36.2992     19.2820
+     77.6187   1522.2300     36.2992     19.2818
+     77.6276   1522.2300     36.2992     19.2820
+     77.6505   1522.2300     36.2989     19.2818
+     77.6683   1522.2300     36.2992     19.2818
+     77.6813   1522.2300     36.2990     19.2822
+     77.6892   1522.2300     36.2991     19.2822
+     77.7021   1522.2300     36.2986     19.2821
+     77.7140   1522.2300     36.2990     19.2824
+     77.7319   1522.2400     36.2991     19.2825
+     77.7349   1522.2400     36.2986     19.2831
+     77.7547   1522.2400     36.2983     19.2834
+     77.7865   1522.2300     36.2987     19.2818
+     77.7935   1522.2300     36.2983     19.2804
+     77.8183   1522.2300     36.2987     19.2801
+     77.8262   1522.2300     36.2982     19.2802
+     77.8491   1522.2300     36.2983     19.2799
+     77.8600   1522.2300     36.2984     19.2795
+     77.8789   1522.2300     36.2975     19.2801
+     77.9206   1522.2300     36.2979     19.2792
+     77.9434   1522.2200     36.2975     19.2771
+     77.9732   1522.2200     36.2979     19.2764
+     77.9762   1522.2200     36.2977     19.2760
+     77.9951   1522.2200     36.2974     19.2755
+     78.0348   1522.2200     36.2975     19.2750
+     78.0487   1522.2200     36.2975     19.2742
+     78.0676   1522.2200     36.2975     19.2741
+     78.1013   1522.2100     36.2975     19.2734
+     78.1291   1522.2100     36.2972     19.2729
+     78.1530   1522.2100     36.2972     19.2725
+     78.1748   1522.2100     36.2973     19.2723
+     78.2235   1522.2100     36.2977     19.2718
+     78.2265   1522.2100     36.2973     19.2714
+     78.2761   1522.2100     36.2972     19.2714
+     78.3099   1522.2100     36.2975     19.2709
+     78.3397   1522.2100     36.2972     19.2709
+     78.3734   1522.2100     36.2970     19.2706
+     78.4042   1522.2100     36.2972     19.2700
+     78.4539   1522.2100     36.2978     19.2693
+     78.4777   1522.2100     36.2992     19.2679
+     78.5164   1522.2100     36.3003     19.2673
+     78.5621   1522.2100     36.3012     19.2668
+     78.5998   1522.2100     36.3022     19.2671
+     78.6356   1522.2100     36.3035     19.2676
+     78.6843   1522.2200     36.3047     19.2679
+     78.7180   1522.2200     36.3055     19.2694
+     78.7677   1522.2300     36.3073     19.2704
+     78.8034   1522.2300     36.3089     19.2714
+     78.8620   1522.2400     36.3102     19.2721
+     78.8978   1522.2400     36.3115     19.2725
+     78.9464   1522.2400     36.3124     19.2716
+     78.9921   1522.2400     36.3130     19.2696
+     79.0507   1522.2300     36.3141     19.2668
+     79.0864   1522.2300     36.3161     19.2641
+     79.1242   1522.2200     36.3189     19.2621
+     79.2007   1522.2300     36.3215     19.2612
+     79.2404   1522.2300     36.3241     19.2602
+     79.3059   1522.2300     36.3269     19.2605
+     79.3546   1522.2400     36.3298     19.2608
+     79.4003   1522.2400     36.3320     19.2611
+     79.4598   1522.2400     36.3330     19.2615
+     79.5115   1522.2500     36.3339     19.2617
+     79.5572   1522.2500     36.3341     19.2616
+     79.6167   1522.2500     36.3341     19.2617
+     79.6823   1522.2500     36.3339     19.2622
+     79.7319   1522.2500     36.3345     19.2622
+     79.7836   1522.2500     36.3349     19.2624
+     79.8402   1522.2600     36.3349     19.2626
+     79.8998   1522.2600     36.3358     19.2625
+     79.9564   1522.2600     36.3358     19.2626
+     80.0249   1522.2600     36.3357     19.2628
+     80.0676   1522.2600     36.3356     19.2630
+     80.1232   1522.2600     36.3356     19.2628
+     80.1927   1522.2600     36.3356     19.2628
+     80.2454   1522.2600     36.3358     19.2629
+     80.2910   1522.2700     36.3360     19.2630
+     80.3605   1522.2700     36.3360     19.2630
+     80.4013   1522.2700     36.3359     19.2632
+     80.4688   1522.2700     36.3360     19.2628
+     80.5284   1522.2700     36.3358     19.2628
+     80.5800   1522.2700     36.3361     19.2625
+     80.6267   1522.2700     36.3363     19.2626
+     80.6942   1522.2700     36.3362     19.2624
+     80.7369   1522.2700     36.3364     19.2627
+     80.7886   1522.2700     36.3369     19.2626
+     80.8472   1522.2700     36.3376     19.2624
+     80.8948   1522.2800     36.3376     19.2629
+     80.9465   1522.2800     36.3378     19.2630
+     80.9991   1522.2800     36.3384     19.2631
+     81.0458   1522.2800     36.3386     19.2632
+     81.0934   1522.2800     36.3386     19.2633
+     81.1361   1522.2800     36.3384     19.2633
+     81.1878   1522.2800     36.3392     19.2625
+     81.2245   1522.2800     36.3396     19.2619
+     81.2712   1522.2800     36.3399     19.2615
+     81.3238   1522.2800     36.3398     19.2611
+     81.3655   1522.2800     36.3404     19.2610
+     81.3963   1522.2800     36.3410     19.2605
+     81.4331   1522.2800     36.3409     19.2606
+     81.4907   1522.2800     36.3408     19.2603
+     81.5234   1522.2800     36.3408     19.2596
+     81.5542   1522.2800     36.3405     19.2581
+     81.5969   1522.2700     36.3401     19.2554
+     81.6337   1522.2600     36.3394     19.2532
+     81.6704   1522.2600     36.3391     19.2504
+     81.7012   1522.2500     36.3389     19.2471
+     81.7439   1522.2400     36.3392     19.2439
+     81.7647   1522.2300     36.3385     19.2416
+     81.8055   1522.2200     36.3382     19.2388
+     81.8323   1522.2200     36.3382     19.2366
+     81.8690   1522.2100     36.3377     19.2351
+     81.8899   1522.2100     36.3372     19.2335
+     81.9306   1522.2000     36.3367     19.2316
+     81.9524   1522.2000     36.3370     19.2295
+     81.9842   1522.1899     36.3367     19.2274
+     82.0210   1522.1899     36.3361     19.2259
+     82.0368   1522.1801     36.3361     19.2240
+     82.0676   1522.1801     36.3358     19.2226
+     82.0984   1522.1801     36.3353     19.2210
+     82.1203   1522.1700     36.3352     19.2197
+     82.1411   1522.1700     36.3354     19.2185
+     82.1719   1522.1700     36.3353     19.2178
+     82.1927   1522.1700     36.3348     19.2168
+     82.2146   1522.1600     36.3344     19.2156
+     82.2414   1522.1600     36.3349     19.2143
+     82.2662   1522.1600     36.3348     19.2134
+     82.2881   1522.1500     36.3348     19.2125
+     82.3089   1522.1500     36.3344     19.2118
+     82.3397   1522.1500     36.3341     19.2113
+     82.3506   1522.1500     36.3340     19.2104
+     82.3824   1522.1500     36.3339     19.2096
+     82.4033   1522.1400     36.3341     19.2085
+     82.4132   1522.1400     36.3339     19.2080
+     82.4460   1522.1400     36.3338     19.2073
+     82.4609   1522.1400     36.3335     19.2067
+     82.4976   1522.1400     36.3334     19.2060
+     82.5075   1522.1300     36.3334     19.2046
+     82.5185   1522.1300     36.3317     19.2018
+     82.5284   1522.1200     36.3318     19.2016
+     82.5612   1522.1300     36.3318     19.2022
+     82.5711   1522.1300     36.3316     19.2018
+     82.5810   1522.1300     36.3318     19.2018
+     82.5920   1522.1300     36.3315     19.2016
+     82.6188   1522.1300     36.3315     19.2020
+     82.6227   1522.1300     36.3317     19.2020
+     82.6545   1522.1300     36.3319     19.2020
+     82.6654   1522.1300     36.3320     19.2016
+     82.6754   1522.1300     36.3319     19.2014
+     82.7081   1522.1300     36.3316     19.2013
+     82.7280   1522.1300     36.3317     19.2015
+     82.7489   1522.1300     36.3319     19.2013
+     82.7598   1522.1300     36.3323     19.2014
+     82.7806   1522.1300     36.3320     19.2016
+     82.8124   1522.1300     36.3323     19.2018
+     82.8333   1522.1300     36.3323     19.2020
+     82.8541   1522.1300     36.3327     19.2022
+     82.8859   1522.1300     36.3326     19.2025
+     82.8958   1522.1400     36.3324     19.2029
+     82.9276   1522.1400     36.3330     19.2029
+     82.9485   1522.1400     36.3333     19.2034
+     82.9584   1522.1400     36.3335     19.2037
+     82.9902   1522.1400     36.3340     19.2043
+     83.0110   1522.1400     36.3341     19.2048
+     83.0319   1522.1500     36.3347     19.2055
+     83.0627   1522.1500     36.3347     19.2064
+     83.0845   1522.1500     36.3357     19.2067
+     83.1163   1522.1600     36.3361     19.2074
+     83.1262   1522.1600     36.3370     19.2085
+     83.1580   1522.1600     36.3378     19.2096
+     83.1789   1522.1700     36.3383     19.2106
+     83.2096   1522.1700     36.3395     19.2115
+     83.2206   1522.1801     36.3401     19.2122
+     83.2633   1522.1801     36.3404     19.2127
+     83.2831   1522.1801     36.3417     19.2129
+     83.3159   1522.1801     36.3419     19.2132
+     83.3467   1522.1801     36.3420     19.2134
+     83.3675   1522.1801     36.3417     19.2138
+     83.4102   1522.1899     36.3427     19.2134
+     83.4410   1522.1899     36.3429     19.2136
+     83.4718   1522.1899     36.3427     19.2134
+     83.4936   1522.1899     36.3429     19.2134
+     83.5354   1522.1899     36.3431     19.2136
+     83.5661   1522.1899     36.3428     19.2134
+     83.5989   1522.1899     36.3427     19.2136
+     83.6396   1522.1899     36.3428     19.2132
+     83.6605   1522.1899     36.3431     19.2131
+     83.6923   1522.1899     36.3432     19.2127
+     83.7340   1522.1899     36.3432     19.2124
+     83.7558   1522.1899     36.3429     19.2120
+     83.7767   1522.1899     36.3432     19.2117
+     83.8194   1522.1899     36.3429     19.2113
+     83.8502   1522.1899     36.3433     19.2106
+     83.8710   1522.1801     36.3428     19.2102
+     83.9068   1522.1801     36.3431     19.2096
+     83.9236   1522.1801     36.3433     19.2087
+     83.9544   1522.1801     36.3436     19.2076
+     83.9753   1522.1801     36.3434     19.2062
+     84.0080   1522.1700     36.3439     19.2045
+     84.0279   1522.1700     36.3444     19.2029
+     84.0488   1522.1600     36.3452     19.2013
+     84.0696   1522.1600     36.3454     19.2002
+     84.0915   1522.1600     36.3461     19.1991
+     84.1123   1522.1600     36.3465     19.1983
+     84.1361   1522.1600     36.3464     19.1976
+     84.1431   1522.1600     36.3473     19.1967
+     84.1957   1522.1600     36.3476     19.1965
+     84.2166   1522.1600     36.3478     19.1962
+     84.2275   1522.1500     36.3477     19.1958
+     84.2593   1522.1600     36.3483     19.1955
+     84.2692   1522.1600     36.3485     19.1955
+     84.2801   1522.1500     36.3486     19.1951
+     84.3040   1522.1600     36.3487     19.1951
+     84.3318   1522.1500     36.3488     19.1947
+     84.3635   1522.1600     36.3487     19.1946
+     84.3844   1522.1600     36.3477     19.1953
+     84.4053   1522.1600     36.3488     19.1951
+     84.4082   1522.1600     36.3491     19.1942
+     84.4370   1522.1500     36.3488     19.1939
+     84.4480   1522.1500     36.3485     19.1935
+     84.4579   1522.1500     36.3492     19.1932
+     84.4688   1522.1500     36.3491     19.1931
+     84.4788   1522.1500     36.3494     19.1930
+     84.4897   1522.1500     36.3496     19.1921
+     84.4996   1522.1500     36.3490     19.1935
+     84.5095   1522.1500     36.3488     19.1930
+     84.5244   1522.1500     36.3488     19.1934
+     84.5314   1522.1600     36.3485     19.1937
+     84.5423   1522.1600     36.3485     19.1940
+     84.5632   1522.1500     36.3485     19.1932
+     84.5661   1522.1500     36.3489     19.1928
+     84.5731   1522.1500     36.3487     19.1928
+     84.5830   1522.1500     36.3487     19.1927
+     84.6039   1522.1500     36.3486     19.1928
+     84.6257   1522.1500     36.3484     19.1927
+     84.6366   1522.1500     36.3482     19.1925
+     84.6396   1522.1500     36.3489     19.1914
+     84.6466   1522.1500     36.3486     19.1904
+     84.6774   1522.1500     36.3488     19.1901
+     84.7101   1522.1500     36.3485     19.1898
+     84.7131   1522.1500     36.3485     19.1895
+     84.7201   1522.1500     36.3488     19.1891
+     84.7409   1522.1500     36.3491     19.1889
+     84.7628   1522.1500     36.3486     19.1891
+     84.7717   1522.1500     36.3491     19.1886
+     84.7935   1522.1400     36.3488     19.1884
+     84.8074   1522.1400     36.3489     19.1880
+     84.8144   1522.1500     36.3492     19.1883
+     84.8452   1522.1500     36.3486     19.1883
+     84.8780   1522.1400     36.3483     19.1863
+     84.9117   1522.1400     36.3491     19.1856
+     84.9395   1522.1400     36.3493     19.1852
+     84.9723   1522.1400     36.3494     19.1851
+     84.9961   1522.1400     36.3492     19.1837
+     85.0349   1522.1300     36.3492     19.1828
+     85.0766   1522.1300     36.3490     19.1817
+     85.0984   1522.1300     36.3490     19.1812
+     85.1222   1522.1300     36.3490     19.1812
+     85.1292   1522.1300     36.3490     19.1807
+     85.1709   1522.1300     36.3490     19.1803
+     85.1927   1522.1300     36.3490     19.1800
+     85.2166   1522.1300     36.3488     19.1796
+     85.2444   1522.1200     36.3490     19.1785
+     85.2662   1522.1200     36.3488     19.1780
+     85.2871   1522.1200     36.3490     19.1773
+     85.3208   1522.1200     36.3491     19.1763
+     85.3387   1522.1200     36.3487     19.1757
+     85.3705   1522.1200     36.3490     19.1749
+     85.3814   1522.1100     36.3491     19.1740
+     85.4251   1522.1100     36.3489     19.1729
+     85.4341   1522.1100     36.3493     19.1715
+     85.4648   1522.1000     36.3491     19.1701
+     85.4857   1522.1000     36.3494     19.1684
+     85.5095   1522.1000     36.3500     19.1673
+     85.5492   1522.1000     36.3511     19.1669
+     85.5592   1522.1000     36.3516     19.1675
+     85.5701   1522.1100     36.3521     19.1685
+     85.5830   1522.1100     36.3524     19.1692
+     85.6019   1522.1100     36.3523     19.1694
+     85.6456   1522.1100     36.3533     19.1694
+     85.6535   1522.1100     36.3525     19.1701
+     85.6644   1522.1100     36.3530     19.1698
+     85.6873   1522.1100     36.3530     19.1703
+     85.7061   1522.1100     36.3532     19.1698
+     85.7091   1522.1100     36.3531     19.1701
+     85.7171   1522.1100     36.3530     19.1701
+     85.7270   1522.1000     36.3525     19.1668
+     85.7300   1522.1000     36.3525     19.1668
+     85.7379   1522.1000     36.3529     19.1669
+     85.7608   1522.1000     36.3522     19.1664
+     85.7697   1522.1000     36.3516     19.1662
+     85.7717   1522.1100     36.3529     19.1692
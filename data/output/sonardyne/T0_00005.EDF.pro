@@ -0,0 +1,327 @@
+test_read_store_and_write
+1/1/2011
+9:14:43
+Probe: T-10
+Source: /root/package/data/input/sippican/T0_00005.EDF
+      0.0000   1525.7200     38.0000     20.3300
+      0.6300   1525.5300     38.0000     20.2500
+      1.2600   1525.4900     38.0000     20.2400
+      1.8900   1525.4900     38.0000     20.2300
+      2.5200   1525.4900     38.0000     20.2300
+      3.1500   1525.5100     38.0000     20.2300
+      3.7800   1525.5100     38.0000     20.2300
+      4.4100   1525.4900     38.0000     20.2200
+      5.0400   1525.4900     38.0000     20.2100
+      5.6700   1525.5100     38.0000     20.2200
+      6.3000   1525.5100     38.0000     20.2100
+      6.9300   1525.5200     38.0000     20.2100
+      7.5600   1525.5200     38.0000     20.2100
+      8.1900   1525.5400     38.0000     20.2100
+      8.8200   1525.5500     38.0000     20.2100
+      9.4500   1525.5400     38.0000     20.2000
+     10.0800   1525.5300     38.0000     20.2000
+     10.7100   1525.5200     38.0000     20.1900
+     11.3300   1525.5200     38.0000     20.1900
+     11.9600   1525.5200     38.0000     20.1800
+     12.5900   1525.5200     38.0000     20.1800
+     13.2200   1525.5300     38.0000     20.1800
+     13.8500   1525.5300     38.0000     20.1800
+     14.4800   1525.5500     38.0000     20.1800
+     15.1100   1525.5600     38.0000     20.1800
+     15.7400   1525.5600     38.0000     20.1700
+     16.3700   1525.5500     38.0000     20.1700
+     17.0000   1525.5300     38.0000     20.1600
+     17.6300   1525.5200     38.0000     20.1500
+     18.2500   1525.5300     38.0000     20.1500
+     18.8800   1525.5300     38.0000     20.1400
+     19.5100   1525.5300     38.0000     20.1400
+     20.1400   1525.5300     38.0000     20.1400
+     20.7700   1525.5400     38.0000     20.1400
+     21.4000   1525.5500     38.0000     20.1300
+     22.0300   1525.5400     38.0000     20.1300
+     22.6600   1525.5200     38.0000     20.1200
+     23.2800   1525.5200     38.0000     20.1100
+     23.9100   1525.5200     38.0000     20.1100
+     24.5400   1525.5300     38.0000     20.1100
+     25.1700   1525.5300     38.0000     20.1000
+     25.8000   1525.5300     38.0000     20.1000
+     26.4300   1525.5400     38.0000     20.1000
+     27.0500   1525.5400     38.0000     20.1000
+     27.6800   1525.5500     38.0000     20.1000
+     28.3100   1525.5600     38.0000     20.1000
+     28.9400   1525.5700     38.0000     20.1000
+     29.5700   1525.5700     38.0000     20.0900
+     30.2000   1525.5700     38.0000     20.0900
+     30.8200   1525.5800     38.0000     20.0900
+     31.4500   1525.5900     38.0000     20.0900
+     32.0800   1525.6000     38.0000     20.0900
+     32.7100   1525.6100     38.0000     20.0900
+     33.3300   1525.6200     38.0000     20.0900
+     33.9600   1525.6300     38.0000     20.0900
+     34.5900   1525.6400     38.0000     20.0900
+     35.2200   1525.6400     38.0000     20.0900
+     35.8500   1525.6400     38.0000     20.0800
+     36.4700   1525.6100     38.0000     20.0700
+     37.1000   1525.5800     38.0000     20.0500
+     37.7300   1525.5300     38.0000     20.0300
+     38.3600   1525.4200     38.0000     19.9900
+     38.9800   1525.2300     38.0000     19.9100
+     39.6100   1524.9700     38.0000     19.8100
+     40.2400   1524.4100     38.0000     19.6100
+     40.8700   1523.4900     38.0000     19.2700
+     41.4900   1522.6500     38.0000     18.9700
+     42.1200   1522.1800     38.0000     18.8000
+     42.7500   1521.5200     38.0000     18.5700
+     43.3700   1520.1900     38.0000     18.1000
+     44.0000   1518.6800     38.0000     17.5700
+     44.6300   1517.6000     38.0000     17.2000
+     45.2600   1516.7000     38.0000     16.9000
+     45.8800   1516.0900     38.0000     16.6900
+     46.5100   1515.8500     38.0000     16.6000
+     47.1400   1515.7800     38.0000     16.5800
+     47.7600   1515.7600     38.0000     16.5700
+     48.3900   1515.7500     38.0000     16.5600
+     49.0200   1515.7300     38.0000     16.5500
+     49.6400   1515.6400     38.0000     16.5200
+     50.2700   1515.4200     38.0000     16.4400
+     50.9000   1515.0600     38.0000     16.3200
+     51.5200   1514.4800     38.0000     16.1200
+     52.1500   1514.0400     38.0000     15.9700
+     52.7800   1513.6000     38.0000     15.8300
+     53.4000   1512.9100     38.0000     15.6000
+     54.0300   1512.3800     38.0000     15.4200
+     54.6600   1512.0800     38.0000     15.3300
+     55.2800   1511.8600     38.0000     15.2500
+     55.9100   1511.6800     38.0000     15.1900
+     56.5300   1511.5400     38.0000     15.1400
+     57.1600   1511.4600     38.0000     15.1100
+     57.7900   1511.4000     38.0000     15.0900
+     58.4100   1511.3400     38.0000     15.0700
+     59.0400   1511.2500     38.0000     15.0300
+     59.6600   1511.1100     38.0000     14.9900
+     60.2900   1511.0000     38.0000     14.9500
+     60.9200   1510.9100     38.0000     14.9200
+     61.5400   1510.7900     38.0000     14.8700
+     62.1700   1510.6100     38.0000     14.8100
+     62.7900   1510.3800     38.0000     14.7400
+     63.4200   1510.1700     38.0000     14.6700
+     64.0500   1509.9900     38.0000     14.6100
+     64.6700   1509.8100     38.0000     14.5500
+     65.3000   1509.6500     38.0000     14.4900
+     65.9200   1509.5300     38.0000     14.4500
+     66.5500   1509.4400     38.0000     14.4200
+     67.1700   1509.3800     38.0000     14.4000
+     67.8000   1509.3100     38.0000     14.3700
+     68.4200   1509.2400     38.0000     14.3500
+     69.0500   1509.1800     38.0000     14.3300
+     69.6700   1509.0800     38.0000     14.2900
+     70.3000   1508.9300     38.0000     14.2400
+     70.9300   1508.8300     38.0000     14.2100
+     71.5500   1508.7700     38.0000     14.1800
+     72.1800   1508.7300     38.0000     14.1700
+     72.8000   1508.6800     38.0000     14.1500
+     73.4300   1508.6500     38.0000     14.1400
+     74.0500   1508.6200     38.0000     14.1200
+     74.6800   1508.5500     38.0000     14.1000
+     75.3000   1508.4900     38.0000     14.0800
+     75.9300   1508.4600     38.0000     14.0700
+     76.5500   1508.4200     38.0000     14.0500
+     77.1800   1508.3800     38.0000     14.0300
+     77.8000   1508.3600     38.0000     14.0200
+     78.4300   1508.3300     38.0000     14.0100
+     79.0500   1508.2900     38.0000     14.0000
+     79.6700   1508.2200     38.0000     13.9700
+     80.3000   1508.1200     38.0000     13.9400
+     80.9200   1508.0400     38.0000     13.9100
+     81.5500   1508.0000     38.0000     13.8900
+     82.1700   1507.9800     38.0000     13.8800
+     82.8000   1507.9800     38.0000     13.8800
+     83.4200   1507.9800     38.0000     13.8800
+     84.0500   1507.9800     38.0000     13.8700
+     84.6700   1507.9800     38.0000     13.8700
+     85.2900   1507.9900     38.0000     13.8700
+     85.9200   1508.0000     38.0000     13.8700
+     86.5400   1508.0100     38.0000     13.8700
+     87.1700   1508.0000     38.0000     13.8600
+     87.7900   1507.9800     38.0000     13.8500
+     88.4100   1507.9600     38.0000     13.8400
+     89.0400   1507.9500     38.0000     13.8400
+     89.6600   1507.9600     38.0000     13.8400
+     90.2900   1507.9900     38.0000     13.8400
+     90.9100   1508.0100     38.0000     13.8500
+     91.5300   1508.0200     38.0000     13.8500
+     92.1600   1507.9800     38.0000     13.8300
+     92.7800   1507.8800     38.0000     13.8000
+     93.4100   1507.7600     38.0000     13.7600
+     94.0300   1507.6200     38.0000     13.7100
+     94.6500   1507.5500     38.0000     13.6900
+     95.2800   1507.5100     38.0000     13.6700
+     95.9000   1507.4800     38.0000     13.6600
+     96.5200   1507.4700     38.0000     13.6500
+     97.1500   1507.4800     38.0000     13.6500
+     97.7700   1507.5000     38.0000     13.6500
+     98.3900   1507.5100     38.0000     13.6600
+     99.0200   1507.5200     38.0000     13.6500
+     99.6400   1507.5200     38.0000     13.6500
+    100.2600   1507.5300     38.0000     13.6500
+    100.8900   1507.5400     38.0000     13.6500
+    101.5100   1507.5400     38.0000     13.6500
+    102.1300   1507.5500     38.0000     13.6500
+    102.7600   1507.5600     38.0000     13.6500
+    103.3800   1507.5700     38.0000     13.6500
+    104.0000   1507.5600     38.0000     13.6400
+    104.6200   1507.5600     38.0000     13.6400
+    105.2500   1507.5700     38.0000     13.6400
+    105.8700   1507.5800     38.0000     13.6400
+    106.4900   1507.5900     38.0000     13.6400
+    107.1200   1507.6000     38.0000     13.6400
+    107.7400   1507.6100     38.0000     13.6400
+    108.3600   1507.6200     38.0000     13.6400
+    108.9800   1507.6300     38.0000     13.6400
+    109.6100   1507.6400     38.0000     13.6400
+    110.2300   1507.6500     38.0000     13.6400
+    110.8500   1507.6600     38.0000     13.6400
+    111.4700   1507.6700     38.0000     13.6400
+    112.1000   1507.6800     38.0000     13.6400
+    112.7200   1507.6900     38.0000     13.6400
+    113.3400   1507.7000     38.0000     13.6400
+    113.9600   1507.7100     38.0000     13.6400
+    114.5800   1507.7200     38.0000     13.6400
+    115.2100   1507.7300     38.0000     13.6400
+    115.8300   1507.7300     38.0000     13.6300
+    116.4500   1507.7300     38.0000     13.6300
+    117.0700   1507.7400     38.0000     13.6300
+    117.7000   1507.7500     38.0000     13.6300
+    118.3200   1507.7600     38.0000     13.6300
+    118.9400   1507.7700     38.0000     13.6300
+    119.5600   1507.7800     38.0000     13.6300
+    120.1800   1507.7900     38.0000     13.6300
+    120.8000   1507.8000     38.0000     13.6300
+    121.4300   1507.8100     38.0000     13.6300
+    122.0500   1507.8200     38.0000     13.6300
+    122.6700   1507.8300     38.0000     13.6300
+    123.2900   1507.8400     38.0000     13.6300
+    123.9100   1507.8500     38.0000     13.6300
+    124.5300   1507.8500     38.0000     13.6300
+    125.1600   1507.8600     38.0000     13.6200
+    125.7800   1507.8600     38.0000     13.6200
+    126.4000   1507.8500     38.0000     13.6200
+    127.0200   1507.8600     38.0000     13.6200
+    127.6400   1507.8700     38.0000     13.6200
+    128.2600   1507.8800     38.0000     13.6200
+    128.8800   1507.8900     38.0000     13.6200
+    129.5100   1507.8900     38.0000     13.6100
+    130.1300   1507.9000     38.0000     13.6100
+    130.7500   1507.9100     38.0000     13.6100
+    131.3700   1507.9200     38.0000     13.6100
+    131.9900   1507.9300     38.0000     13.6100
+    132.6100   1507.9400     38.0000     13.6100
+    133.2300   1507.9500     38.0000     13.6100
+    133.8500   1507.9500     38.0000     13.6100
+    134.4700   1507.9600     38.0000     13.6100
+    135.0900   1507.9700     38.0000     13.6100
+    135.7100   1507.9800     38.0000     13.6100
+    136.3400   1507.9900     38.0000     13.6100
+    136.9600   1508.0000     38.0000     13.6100
+    137.5800   1508.0100     38.0000     13.6100
+    138.2000   1508.0300     38.0000     13.6100
+    138.8200   1508.0300     38.0000     13.6100
+    139.4400   1508.0400     38.0000     13.6100
+    140.0600   1508.0500     38.0000     13.6100
+    140.6800   1508.0600     38.0000     13.6100
+    141.3000   1508.0600     38.0000     13.6100
+    141.9200   1508.0700     38.0000     13.6000
+    142.5400   1508.0600     38.0000     13.6000
+    143.1600   1508.0600     38.0000     13.5900
+    143.7800   1508.0600     38.0000     13.5900
+    144.4000   1508.0700     38.0000     13.5900
+    145.0200   1508.0900     38.0000     13.5900
+    145.6400   1508.1000     38.0000     13.5900
+    146.2600   1508.1100     38.0000     13.5900
+    146.8800   1508.1200     38.0000     13.6000
+    147.5000   1508.1300     38.0000     13.6000
+    148.1200   1508.1500     38.0000     13.6000
+    148.7400   1508.1600     38.0000     13.6000
+    149.3600   1508.1700     38.0000     13.6000
+    149.9800   1508.1800     38.0000     13.6000
+    150.6000   1508.1900     38.0000     13.6000
+    151.2200   1508.2000     38.0000     13.6000
+    151.8400   1508.2000     38.0000     13.6000
+    152.4600   1508.2200     38.0000     13.6000
+    153.0800   1508.2300     38.0000     13.6000
+    153.7000   1508.2500     38.0000     13.6000
+    154.3200   1508.2600     38.0000     13.6000
+    154.9400   1508.2700     38.0000     13.6000
+    155.5600   1508.2800     38.0000     13.6000
+    156.1800   1508.2900     38.0000     13.6000
+    156.7900   1508.3100     38.0000     13.6000
+    157.4100   1508.3200     38.0000     13.6000
+    158.0300   1508.3200     38.0000     13.6000
+    158.6500   1508.3200     38.0000     13.6000
+    159.2700   1508.3300     38.0000     13.6000
+    159.8900   1508.3300     38.0000     13.5900
+    160.5100   1508.3400     38.0000     13.5900
+    161.1300   1508.3500     38.0000     13.5900
+    161.7500   1508.3600     38.0000     13.5900
+    162.3700   1508.3800     38.0000     13.6000
+    162.9800   1508.4100     38.0000     13.6000
+    163.6000   1508.4200     38.0000     13.6000
+    164.2200   1508.4400     38.0000     13.6000
+    164.8400   1508.4500     38.0000     13.6100
+    165.4600   1508.4600     38.0000     13.6000
+    166.0800   1508.4600     38.0000     13.6000
+    166.7000   1508.4700     38.0000     13.6000
+    167.3200   1508.4800     38.0000     13.6000
+    167.9300   1508.4900     38.0000     13.6000
+    168.5500   1508.5000     38.0000     13.6000
+    169.1700   1508.5200     38.0000     13.6000
+    169.7900   1508.5300     38.0000     13.6000
+    170.4100   1508.5400     38.0000     13.6100
+    171.0300   1508.5500     38.0000     13.6100
+    171.6400   1508.5600     38.0000     13.6100
+    172.2600   1508.5600     38.0000     13.6000
+    172.8800   1508.5500     38.0000     13.6000
+    173.5000   1508.5500     38.0000     13.5900
+    174.1200   1508.5500     38.0000     13.5900
+    174.7300   1508.5600     38.0000     13.5900
+    175.3500   1508.5700     38.0000     13.5900
+    175.9700   1508.5800     38.0000     13.5900
+    176.5900   1508.5800     38.0000     13.5800
+    177.2100   1508.5700     38.0000     13.5800
+    177.8200   1508.5800     38.0000     13.5800
+    178.4400   1508.6000     38.0000     13.5800
+    179.0600   1508.6100     38.0000     13.5800
+    179.6800   1508.6300     38.0000     13.5800
+    180.2900   1508.6400     38.0000     13.5900
+    180.9100   1508.6500     38.0000     13.5900
+    181.5300   1508.6700     38.0000     13.5900
+    182.1500   1508.6800     38.0000     13.5900
+    182.7600   1508.7000     38.0000     13.5900
+    183.3800   1508.7100     38.0000     13.5900
+    184.0000   1508.7200     38.0000     13.5900
+    184.6200   1508.7300     38.0000     13.5900
+    185.2300   1508.7400     38.0000     13.5900
+    185.8500   1508.7500     38.0000     13.5900
+    186.4700   1508.7600     38.0000     13.5900
+    187.0900   1508.7700     38.0000     13.5900
+    187.7000   1508.7800     38.0000     13.5900
+    188.3200   1508.7900     38.0000     13.5900
+    188.9400   1508.8000     38.0000     13.5900
+    189.5500   1508.8100     38.0000     13.5900
+    190.1700   1508.8200     38.0000     13.5900
+    190.7900   1508.8300     38.0000     13.5900
+    191.4000   1508.8400     38.0000     13.5900
+    192.0200   1508.8500     38.0000     13.5900
+    192.6400   1508.8500     38.0000     13.5900
+    193.2600   1508.8700     38.0000     13.5900
+    193.8700   1508.8800     38.0000     13.5900
+    194.4900   1508.8800     38.0000     13.5900
+    195.1100   1508.8900     38.0000     13.5900
+    195.7200   1508.9000     38.0000     13.5900
+    196.3400   1508.9100     38.0000     13.5900
+    196.9500   1508.9100     38.0000     13.5800
+    197.5700   1508.9100     38.0000     13.5800
+    198.1900   1508.8900     38.0000     13.5700
+    198.8000   1508.8900     38.0000     13.5700
+    199.4200   1508.9000     38.0000     13.5700
+    200.0400   1508.9100     38.0000     13.5700
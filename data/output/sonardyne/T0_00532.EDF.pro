@@ -0,0 +1,327 @@
+test_read_store_and_write
+1/1/2010
+15:54:24
+Probe: T-10
+Source: /root/package/data/input/sippican/T0_00532.EDF
+      0.0000   1537.6300     34.7000     26.5100
+      0.6000   1539.6500     34.7000     27.3900
+      1.3000   1540.1100     34.7000     27.5900
+      1.9000   1540.1800     34.7000     27.6200
+      2.5000   1540.1900     34.7000     27.6200
+      3.1000   1540.2300     34.7000     27.6300
+      3.8000   1540.2100     34.7000     27.6200
+      4.4000   1540.2600     34.7000     27.6300
+      5.0000   1540.2800     34.7000     27.6400
+      5.7000   1540.2500     34.7000     27.6200
+      6.3000   1540.2500     34.7000     27.6200
+      6.9000   1540.2800     34.7000     27.6200
+      7.6000   1540.3000     34.7000     27.6300
+      8.2000   1540.3500     34.7000     27.6400
+      8.8000   1540.3200     34.7000     27.6300
+      9.4000   1540.3100     34.7000     27.6200
+     10.1000   1540.3300     34.7000     27.6200
+     10.7000   1540.3200     34.7000     27.6100
+     11.3000   1540.3200     34.7000     27.6100
+     12.0000   1540.3700     34.7000     27.6300
+     12.6000   1540.4100     34.7000     27.6400
+     13.2000   1540.3900     34.7000     27.6300
+     13.9000   1540.3700     34.7000     27.6100
+     14.5000   1540.3800     34.7000     27.6100
+     15.1000   1540.4100     34.7000     27.6200
+     15.7000   1540.4300     34.7000     27.6200
+     16.4000   1540.3900     34.7000     27.6000
+     17.0000   1540.3700     34.7000     27.5900
+     17.6000   1540.2900     34.7000     27.5500
+     18.3000   1540.2000     34.7000     27.5000
+     18.9000   1540.1400     34.7000     27.4700
+     19.5000   1540.1500     34.7000     27.4700
+     20.1000   1540.2000     34.7000     27.4900
+     20.8000   1540.2000     34.7000     27.4800
+     21.4000   1540.1600     34.7000     27.4600
+     22.0000   1540.1900     34.7000     27.4700
+     22.7000   1540.1900     34.7000     27.4700
+     23.3000   1540.1900     34.7000     27.4600
+     23.9000   1540.2100     34.7000     27.4600
+     24.5000   1540.2200     34.7000     27.4600
+     25.2000   1540.2500     34.7000     27.4700
+     25.8000   1540.2000     34.7000     27.4500
+     26.4000   1540.2100     34.7000     27.4500
+     27.1000   1540.2600     34.7000     27.4700
+     27.7000   1540.2800     34.7000     27.4700
+     28.3000   1540.2400     34.7000     27.4500
+     28.9000   1540.2200     34.7000     27.4300
+     29.6000   1540.2600     34.7000     27.4400
+     30.2000   1540.3000     34.7000     27.4600
+     30.8000   1540.2700     34.7000     27.4400
+     31.5000   1540.1700     34.7000     27.3900
+     32.1000   1540.1300     34.7000     27.3700
+     32.7000   1540.1400     34.7000     27.3700
+     33.3000   1540.1500     34.7000     27.3700
+     34.0000   1540.1600     34.7000     27.3700
+     34.6000   1540.1700     34.7000     27.3700
+     35.2000   1540.1700     34.7000     27.3600
+     35.8000   1540.2100     34.7000     27.3800
+     36.5000   1540.2000     34.7000     27.3600
+     37.1000   1540.2200     34.7000     27.3700
+     37.7000   1540.2200     34.7000     27.3700
+     38.4000   1540.2000     34.7000     27.3500
+     39.0000   1540.1100     34.7000     27.3100
+     39.6000   1539.9300     34.7000     27.2200
+     40.2000   1539.7700     34.7000     27.1500
+     40.9000   1539.6500     34.7000     27.0900
+     41.5000   1539.5600     34.7000     27.0500
+     42.1000   1539.5100     34.7000     27.0200
+     42.7000   1539.4600     34.7000     26.9900
+     43.4000   1539.3800     34.7000     26.9500
+     44.0000   1539.3000     34.7000     26.9100
+     44.6000   1539.2500     34.7000     26.8900
+     45.3000   1539.2100     34.7000     26.8600
+     45.9000   1539.1600     34.7000     26.8400
+     46.5000   1539.1700     34.7000     26.8400
+     47.1000   1539.1500     34.7000     26.8200
+     47.8000   1539.0500     34.7000     26.7800
+     48.4000   1538.9600     34.7000     26.7400
+     49.0000   1538.9100     34.7000     26.7100
+     49.6000   1538.9200     34.7000     26.7100
+     50.3000   1538.9200     34.7000     26.7000
+     50.9000   1538.8800     34.7000     26.6800
+     51.5000   1538.8400     34.7000     26.6600
+     52.1000   1538.8400     34.7000     26.6600
+     52.8000   1538.8500     34.7000     26.6500
+     53.4000   1538.8700     34.7000     26.6600
+     54.0000   1538.8400     34.7000     26.6400
+     54.7000   1538.8600     34.7000     26.6400
+     55.3000   1538.8300     34.7000     26.6300
+     55.9000   1538.8500     34.7000     26.6300
+     56.5000   1538.9100     34.7000     26.6500
+     57.2000   1538.9000     34.7000     26.6400
+     57.8000   1538.9100     34.7000     26.6400
+     58.4000   1538.9300     34.7000     26.6500
+     59.0000   1538.9500     34.7000     26.6500
+     59.7000   1538.9500     34.7000     26.6400
+     60.3000   1538.9400     34.7000     26.6400
+     60.9000   1538.9600     34.7000     26.6400
+     61.5000   1538.9700     34.7000     26.6400
+     62.2000   1538.9500     34.7000     26.6300
+     62.8000   1538.9600     34.7000     26.6300
+     63.4000   1538.9800     34.7000     26.6300
+     64.0000   1539.0100     34.7000     26.6400
+     64.7000   1538.9700     34.7000     26.6200
+     65.3000   1538.9500     34.7000     26.6000
+     65.9000   1538.9300     34.7000     26.5900
+     66.5000   1538.9100     34.7000     26.5800
+     67.2000   1538.8800     34.7000     26.5600
+     67.8000   1538.9100     34.7000     26.5700
+     68.4000   1538.9400     34.7000     26.5800
+     69.0000   1538.9300     34.7000     26.5700
+     69.7000   1538.9100     34.7000     26.5600
+     70.3000   1538.9100     34.7000     26.5500
+     70.9000   1538.9300     34.7000     26.5600
+     71.6000   1538.9300     34.7000     26.5500
+     72.2000   1538.9700     34.7000     26.5600
+     72.8000   1538.9500     34.7000     26.5500
+     73.4000   1538.9600     34.7000     26.5500
+     74.1000   1538.9600     34.7000     26.5400
+     74.7000   1538.9900     34.7000     26.5500
+     75.3000   1539.0100     34.7000     26.5600
+     75.9000   1539.0200     34.7000     26.5600
+     76.6000   1539.0200     34.7000     26.5500
+     77.2000   1538.9900     34.7000     26.5400
+     77.8000   1538.9500     34.7000     26.5100
+     78.4000   1538.8800     34.7000     26.4800
+     79.0000   1538.8100     34.7000     26.4400
+     79.7000   1538.7000     34.7000     26.3900
+     80.3000   1538.6300     34.7000     26.3600
+     80.9000   1538.5800     34.7000     26.3300
+     81.5000   1538.5500     34.7000     26.3200
+     82.2000   1538.5300     34.7000     26.3000
+     82.8000   1538.5200     34.7000     26.2900
+     83.4000   1538.5400     34.7000     26.3000
+     84.0000   1538.5000     34.7000     26.2700
+     84.7000   1538.3600     34.7000     26.2100
+     85.3000   1538.1600     34.7000     26.1200
+     85.9000   1537.9400     34.7000     26.0200
+     86.5000   1537.7300     34.7000     25.9300
+     87.2000   1537.4800     34.7000     25.8200
+     87.8000   1537.2800     34.7000     25.7300
+     88.4000   1537.1300     34.7000     25.6600
+     89.0000   1536.9500     34.7000     25.5800
+     89.7000   1536.6800     34.7000     25.4600
+     90.3000   1536.4400     34.7000     25.3600
+     90.9000   1536.1800     34.7000     25.2400
+     91.5000   1535.6000     34.7000     25.0000
+     92.2000   1535.0300     34.7000     24.7600
+     92.8000   1534.7500     34.7000     24.6400
+     93.4000   1534.5700     34.7000     24.5600
+     94.0000   1534.4500     34.7000     24.5100
+     94.7000   1534.3500     34.7000     24.4600
+     95.3000   1534.2000     34.7000     24.4000
+     95.9000   1533.9800     34.7000     24.3000
+     96.5000   1533.8700     34.7000     24.2500
+     97.1000   1533.8100     34.7000     24.2200
+     97.8000   1533.7200     34.7000     24.1800
+     98.4000   1533.6400     34.7000     24.1500
+     99.0000   1533.6300     34.7000     24.1400
+     99.6000   1533.5500     34.7000     24.1100
+    100.3000   1533.4500     34.7000     24.0600
+    100.9000   1533.3700     34.7000     24.0200
+    101.5000   1533.3500     34.7000     24.0100
+    102.1000   1533.2900     34.7000     23.9800
+    102.8000   1533.1200     34.7000     23.9100
+    103.4000   1532.9700     34.7000     23.8500
+    104.0000   1532.8800     34.7000     23.8000
+    104.6000   1532.7200     34.7000     23.7400
+    105.2000   1532.6600     34.7000     23.7100
+    105.9000   1532.6100     34.7000     23.6800
+    106.5000   1532.5600     34.7000     23.6600
+    107.1000   1532.6100     34.7000     23.6700
+    107.7000   1532.6100     34.7000     23.6700
+    108.4000   1532.5900     34.7000     23.6600
+    109.0000   1532.6500     34.7000     23.6800
+    109.6000   1532.6900     34.7000     23.6900
+    110.2000   1532.6800     34.7000     23.6800
+    110.9000   1532.6400     34.7000     23.6600
+    111.5000   1532.5500     34.7000     23.6200
+    112.1000   1532.4300     34.7000     23.5700
+    112.7000   1532.2500     34.7000     23.5000
+    113.3000   1532.1200     34.7000     23.4400
+    114.0000   1531.9900     34.7000     23.3800
+    114.6000   1531.8700     34.7000     23.3300
+    115.2000   1531.8300     34.7000     23.3100
+    115.8000   1531.8100     34.7000     23.3000
+    116.5000   1531.8100     34.7000     23.3000
+    117.1000   1531.7800     34.7000     23.2800
+    117.7000   1531.6800     34.7000     23.2400
+    118.3000   1531.6100     34.7000     23.2000
+    118.9000   1531.5600     34.7000     23.1800
+    119.6000   1531.5200     34.7000     23.1600
+    120.2000   1531.4700     34.7000     23.1400
+    120.8000   1531.4500     34.7000     23.1300
+    121.4000   1531.4800     34.7000     23.1300
+    122.0000   1531.4400     34.7000     23.1100
+    122.7000   1531.4000     34.7000     23.1000
+    123.3000   1531.3500     34.7000     23.0700
+    123.9000   1531.3600     34.7000     23.0700
+    124.5000   1531.2900     34.7000     23.0400
+    125.2000   1531.2300     34.7000     23.0100
+    125.8000   1531.0500     34.7000     22.9400
+    126.4000   1530.7900     34.7000     22.8300
+    127.0000   1530.6400     34.7000     22.7700
+    127.6000   1530.6000     34.7000     22.7500
+    128.3000   1530.4900     34.7000     22.7000
+    128.9000   1530.4000     34.7000     22.6700
+    129.5000   1530.3300     34.7000     22.6300
+    130.1000   1530.2700     34.7000     22.6100
+    130.7000   1530.2600     34.7000     22.6000
+    131.4000   1530.2200     34.7000     22.5800
+    132.0000   1530.1500     34.7000     22.5500
+    132.6000   1530.0800     34.7000     22.5100
+    133.2000   1529.9800     34.7000     22.4700
+    133.9000   1529.9200     34.7000     22.4500
+    134.5000   1529.9400     34.7000     22.4500
+    135.1000   1529.8800     34.7000     22.4200
+    135.7000   1529.7400     34.7000     22.3600
+    136.3000   1529.5700     34.7000     22.3000
+    137.0000   1529.4600     34.7000     22.2500
+    137.6000   1529.3500     34.7000     22.2000
+    138.2000   1529.3200     34.7000     22.1900
+    138.8000   1529.2600     34.7000     22.1600
+    139.4000   1529.1900     34.7000     22.1300
+    140.1000   1529.1200     34.7000     22.1000
+    140.7000   1529.1100     34.7000     22.0900
+    141.3000   1529.0800     34.7000     22.0800
+    141.9000   1529.0500     34.7000     22.0600
+    142.5000   1529.0100     34.7000     22.0400
+    143.2000   1528.9000     34.7000     22.0000
+    143.8000   1528.8300     34.7000     21.9600
+    144.4000   1528.7600     34.7000     21.9300
+    145.0000   1528.7100     34.7000     21.9100
+    145.6000   1528.7100     34.7000     21.9100
+    146.3000   1528.6800     34.7000     21.8900
+    146.9000   1528.6100     34.7000     21.8600
+    147.5000   1528.5300     34.7000     21.8300
+    148.1000   1528.4600     34.7000     21.8000
+    148.7000   1528.3600     34.7000     21.7600
+    149.4000   1528.2500     34.7000     21.7100
+    150.0000   1528.1800     34.7000     21.6800
+    150.6000   1528.1600     34.7000     21.6700
+    151.2000   1528.1800     34.7000     21.6700
+    151.8000   1528.1700     34.7000     21.6600
+    152.5000   1528.1600     34.7000     21.6600
+    153.1000   1528.1500     34.7000     21.6500
+    153.7000   1528.1100     34.7000     21.6300
+    154.3000   1528.1100     34.7000     21.6200
+    154.9000   1528.0900     34.7000     21.6200
+    155.6000   1528.1200     34.7000     21.6200
+    156.2000   1528.1200     34.7000     21.6200
+    156.8000   1528.1200     34.7000     21.6200
+    157.4000   1528.1400     34.7000     21.6200
+    158.0000   1528.1200     34.7000     21.6000
+    158.7000   1528.0800     34.7000     21.5900
+    159.3000   1528.0100     34.7000     21.5600
+    159.9000   1527.9500     34.7000     21.5300
+    160.5000   1527.9500     34.7000     21.5300
+    161.1000   1527.9200     34.7000     21.5100
+    161.7000   1527.9300     34.7000     21.5100
+    162.4000   1527.9000     34.7000     21.5000
+    163.0000   1527.8700     34.7000     21.4800
+    163.6000   1527.8100     34.7000     21.4600
+    164.2000   1527.7300     34.7000     21.4200
+    164.8000   1527.6600     34.7000     21.3900
+    165.5000   1527.5700     34.7000     21.3500
+    166.1000   1527.5200     34.7000     21.3300
+    166.7000   1527.4900     34.7000     21.3200
+    167.3000   1527.4000     34.7000     21.2800
+    167.9000   1527.3300     34.7000     21.2500
+    168.6000   1527.2800     34.7000     21.2200
+    169.2000   1527.2400     34.7000     21.2100
+    169.8000   1527.1600     34.7000     21.1800
+    170.4000   1527.1600     34.7000     21.1700
+    171.0000   1527.1700     34.7000     21.1700
+    171.6000   1527.1600     34.7000     21.1600
+    172.3000   1527.1600     34.7000     21.1600
+    172.9000   1527.0800     34.7000     21.1300
+    173.5000   1527.0100     34.7000     21.0900
+    174.1000   1526.9600     34.7000     21.0700
+    174.7000   1526.9100     34.7000     21.0500
+    175.4000   1526.8900     34.7000     21.0400
+    176.0000   1526.8900     34.7000     21.0300
+    176.6000   1526.8600     34.7000     21.0200
+    177.2000   1526.8400     34.7000     21.0100
+    177.8000   1526.8100     34.7000     20.9900
+    178.4000   1526.7900     34.7000     20.9800
+    179.1000   1526.7200     34.7000     20.9500
+    179.7000   1526.6700     34.7000     20.9300
+    180.3000   1526.6600     34.7000     20.9200
+    180.9000   1526.6600     34.7000     20.9200
+    181.5000   1526.6600     34.7000     20.9100
+    182.1000   1526.6500     34.7000     20.9100
+    182.8000   1526.6600     34.7000     20.9100
+    183.4000   1526.7000     34.7000     20.9200
+    184.0000   1526.6700     34.7000     20.9000
+    184.6000   1526.6600     34.7000     20.9000
+    185.2000   1526.6600     34.7000     20.8900
+    185.9000   1526.6500     34.7000     20.8900
+    186.5000   1526.6400     34.7000     20.8800
+    187.1000   1526.6600     34.7000     20.8800
+    187.7000   1526.6600     34.7000     20.8800
+    188.3000   1526.6300     34.7000     20.8600
+    188.9000   1526.5800     34.7000     20.8400
+    189.6000   1526.5100     34.7000     20.8100
+    190.2000   1526.4200     34.7000     20.7700
+    190.8000   1526.3700     34.7000     20.7500
+    191.4000   1526.3200     34.7000     20.7300
+    192.0000   1526.2800     34.7000     20.7100
+    192.6000   1526.2900     34.7000     20.7100
+    193.3000   1526.3100     34.7000     20.7100
+    193.9000   1526.2900     34.7000     20.7000
+    194.5000   1526.2900     34.7000     20.7000
+    195.1000   1526.3000     34.7000     20.7000
+    195.7000   1526.3200     34.7000     20.7000
+    196.3000   1526.3400     34.7000     20.7100
+    197.0000   1526.3200     34.7000     20.7000
+    197.6000   1526.3600     34.7000     20.7100
+    198.2000   1526.3500     34.7000     20.7000
+    198.8000   1526.2800     34.7000     20.6700
+    199.4000   1526.1900     34.7000     20.6300
+    200.0000   1526.1800     34.7000     20.6300
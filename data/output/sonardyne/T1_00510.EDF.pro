@@ -0,0 +1,2698 @@
+test_read_store_and_write
+1/1/2010
+15:41:44
+Probe: T-11 (Fine Structure)
+Source: /root/package/data/input/sippican/T1_00510.EDF
+      0.0000   1513.2500     32.5000     18.1100
+      0.2000   1495.8900     32.5000     12.6000
+      0.4000   1492.5500     32.5000     11.6300
+      0.5000   1491.4900     32.5000     11.3200
+      0.7000   1491.2000     32.5000     11.2400
+      0.9000   1491.1000     32.5000     11.2100
+      1.1000   1491.0000     32.5000     11.1800
+      1.2000   1490.9600     32.5000     11.1700
+      1.4000   1490.9800     32.5000     11.1700
+      1.6000   1491.0500     32.5000     11.1900
+      1.8000   1491.0900     32.5000     11.2000
+      2.0000   1491.0900     32.5000     11.2000
+      2.1000   1491.1000     32.5000     11.2000
+      2.3000   1491.1100     32.5000     11.2000
+      2.5000   1491.1000     32.5000     11.2000
+      2.7000   1491.1000     32.5000     11.2000
+      2.8000   1491.1100     32.5000     11.2000
+      3.0000   1491.1100     32.5000     11.2000
+      3.2000   1491.1100     32.5000     11.2000
+      3.4000   1491.0200     32.5000     11.1800
+      3.6000   1491.0100     32.5000     11.1700
+      3.7000   1491.0600     32.5000     11.1900
+      3.9000   1491.0700     32.5000     11.1900
+      4.1000   1491.0900     32.5000     11.1900
+      4.3000   1491.1100     32.5000     11.2000
+      4.4000   1491.1100     32.5000     11.1900
+      4.6000   1491.0900     32.5000     11.1900
+      4.8000   1491.0900     32.5000     11.1900
+      5.0000   1491.1200     32.5000     11.2000
+      5.2000   1491.1500     32.5000     11.2000
+      5.3000   1491.1600     32.5000     11.2000
+      5.5000   1491.1900     32.5000     11.2100
+      5.7000   1491.2600     32.5000     11.2300
+      5.9000   1491.3000     32.5000     11.2400
+      6.0000   1491.3400     32.5000     11.2500
+      6.2000   1491.4000     32.5000     11.2700
+      6.4000   1491.4200     32.5000     11.2700
+      6.6000   1491.4200     32.5000     11.2700
+      6.8000   1491.4300     32.5000     11.2800
+      6.9000   1491.4500     32.5000     11.2800
+      7.1000   1491.4400     32.5000     11.2800
+      7.3000   1491.4400     32.5000     11.2800
+      7.5000   1491.4500     32.5000     11.2800
+      7.6000   1491.4900     32.5000     11.2900
+      7.8000   1491.4700     32.5000     11.2800
+      8.0000   1491.4600     32.5000     11.2800
+      8.2000   1491.4600     32.5000     11.2800
+      8.4000   1491.4600     32.5000     11.2800
+      8.5000   1491.4700     32.5000     11.2800
+      8.7000   1491.4800     32.5000     11.2800
+      8.9000   1491.4900     32.5000     11.2800
+      9.1000   1491.4900     32.5000     11.2800
+      9.2000   1491.4900     32.5000     11.2800
+      9.4000   1491.4700     32.5000     11.2800
+      9.6000   1491.4900     32.5000     11.2800
+      9.8000   1491.5000     32.5000     11.2800
+      9.9000   1491.4900     32.5000     11.2800
+     10.1000   1491.5100     32.5000     11.2800
+     10.3000   1491.5100     32.5000     11.2800
+     10.5000   1491.5100     32.5000     11.2800
+     10.7000   1491.5300     32.5000     11.2900
+     10.8000   1491.5300     32.5000     11.2900
+     11.0000   1491.5500     32.5000     11.2900
+     11.2000   1491.5500     32.5000     11.2900
+     11.4000   1491.5600     32.5000     11.2900
+     11.5000   1491.5700     32.5000     11.2900
+     11.7000   1491.5700     32.5000     11.2900
+     11.9000   1491.5600     32.5000     11.2900
+     12.1000   1491.5700     32.5000     11.2900
+     12.3000   1491.5700     32.5000     11.2900
+     12.4000   1491.5900     32.5000     11.3000
+     12.6000   1491.6000     32.5000     11.3000
+     12.8000   1491.5900     32.5000     11.2900
+     13.0000   1491.5800     32.5000     11.2900
+     13.1000   1491.5900     32.5000     11.2900
+     13.3000   1491.6100     32.5000     11.3000
+     13.5000   1491.6100     32.5000     11.3000
+     13.7000   1491.6300     32.5000     11.3000
+     13.9000   1491.6200     32.5000     11.3000
+     14.0000   1491.6200     32.5000     11.3000
+     14.2000   1491.6200     32.5000     11.3000
+     14.4000   1491.6300     32.5000     11.3000
+     14.6000   1491.6300     32.5000     11.3000
+     14.7000   1491.6300     32.5000     11.3000
+     14.9000   1491.6200     32.5000     11.2900
+     15.1000   1491.6000     32.5000     11.2900
+     15.3000   1491.5700     32.5000     11.2800
+     15.4000   1491.5500     32.5000     11.2700
+     15.6000   1491.5200     32.5000     11.2600
+     15.8000   1491.4300     32.5000     11.2300
+     16.0000   1491.2800     32.5000     11.1900
+     16.2000   1491.1900     32.5000     11.1600
+     16.3000   1491.1800     32.5000     11.1600
+     16.5000   1491.2000     32.5000     11.1700
+     16.7000   1491.2400     32.5000     11.1700
+     16.9000   1491.2200     32.5000     11.1700
+     17.0000   1491.0000     32.5000     11.1100
+     17.2000   1490.4900     32.5000     10.9600
+     17.4000   1490.0100     32.5000     10.8200
+     17.6000   1489.7000     32.5000     10.7400
+     17.8000   1489.4500     32.5000     10.6600
+     17.9000   1489.0900     32.5000     10.5600
+     18.1000   1488.4800     32.5000     10.3900
+     18.3000   1488.0300     32.5000     10.2600
+     18.5000   1487.6600     32.5000     10.1600
+     18.6000   1487.2500     32.5000     10.0500
+     18.8000   1486.8700     32.5000      9.9400
+     19.0000   1486.5300     32.5000      9.8400
+     19.2000   1486.2800     32.5000      9.7700
+     19.3000   1486.1200     32.5000      9.7300
+     19.5000   1485.9700     32.5000      9.6900
+     19.7000   1485.7500     32.5000      9.6300
+     19.9000   1485.5400     32.5000      9.5700
+     20.1000   1485.3200     32.5000      9.5100
+     20.2000   1485.1000     32.5000      9.4500
+     20.4000   1484.8100     32.5000      9.3700
+     20.6000   1484.5200     32.5000      9.2900
+     20.8000   1484.3700     32.5000      9.2500
+     20.9000   1484.2800     32.5000      9.2200
+     21.1000   1484.1900     32.5000      9.2000
+     21.3000   1484.0900     32.5000      9.1700
+     21.5000   1483.9600     32.5000      9.1300
+     21.7000   1483.8500     32.5000      9.1000
+     21.8000   1483.7700     32.5000      9.0800
+     22.0000   1483.6800     32.5000      9.0500
+     22.2000   1483.6400     32.5000      9.0400
+     22.4000   1483.5900     32.5000      9.0300
+     22.5000   1483.5400     32.5000      9.0100
+     22.7000   1483.4200     32.5000      8.9800
+     22.9000   1483.3200     32.5000      8.9500
+     23.1000   1483.2400     32.5000      8.9300
+     23.2000   1483.2100     32.5000      8.9200
+     23.4000   1483.1800     32.5000      8.9100
+     23.6000   1483.1600     32.5000      8.9100
+     23.8000   1483.1200     32.5000      8.9000
+     24.0000   1483.1000     32.5000      8.8900
+     24.1000   1483.1100     32.5000      8.8900
+     24.3000   1483.1100     32.5000      8.8900
+     24.5000   1483.1100     32.5000      8.8900
+     24.7000   1483.1100     32.5000      8.8900
+     24.8000   1483.1100     32.5000      8.8900
+     25.0000   1483.1200     32.5000      8.8900
+     25.2000   1483.1300     32.5000      8.8900
+     25.4000   1483.1200     32.5000      8.8900
+     25.5000   1483.1200     32.5000      8.8900
+     25.7000   1483.1400     32.5000      8.8900
+     25.9000   1483.1600     32.5000      8.9000
+     26.1000   1483.1500     32.5000      8.8900
+     26.3000   1483.1500     32.5000      8.8900
+     26.4000   1483.1500     32.5000      8.8900
+     26.6000   1483.1700     32.5000      8.8900
+     26.8000   1483.1700     32.5000      8.8900
+     27.0000   1483.1500     32.5000      8.8900
+     27.1000   1483.1500     32.5000      8.8900
+     27.3000   1483.1300     32.5000      8.8800
+     27.5000   1483.1200     32.5000      8.8800
+     27.7000   1483.1000     32.5000      8.8700
+     27.9000   1483.1000     32.5000      8.8700
+     28.0000   1483.0900     32.5000      8.8700
+     28.2000   1483.0700     32.5000      8.8600
+     28.4000   1483.0700     32.5000      8.8600
+     28.6000   1483.0500     32.5000      8.8600
+     28.7000   1483.0000     32.5000      8.8400
+     28.9000   1482.9000     32.5000      8.8100
+     29.1000   1482.8400     32.5000      8.7900
+     29.3000   1482.8100     32.5000      8.7900
+     29.4000   1482.8200     32.5000      8.7900
+     29.6000   1482.8200     32.5000      8.7900
+     29.8000   1482.8400     32.5000      8.7900
+     30.0000   1482.8500     32.5000      8.7900
+     30.2000   1482.8000     32.5000      8.7800
+     30.3000   1482.7200     32.5000      8.7600
+     30.5000   1482.6700     32.5000      8.7400
+     30.7000   1482.5500     32.5000      8.7100
+     30.9000   1482.3900     32.5000      8.6700
+     31.0000   1482.2500     32.5000      8.6300
+     31.2000   1482.1700     32.5000      8.6100
+     31.4000   1482.1400     32.5000      8.6000
+     31.6000   1482.1100     32.5000      8.5900
+     31.7000   1482.0900     32.5000      8.5800
+     31.9000   1482.0600     32.5000      8.5700
+     32.1000   1482.0200     32.5000      8.5600
+     32.3000   1481.9900     32.5000      8.5500
+     32.5000   1481.9800     32.5000      8.5500
+     32.6000   1481.9600     32.5000      8.5400
+     32.8000   1481.9400     32.5000      8.5400
+     33.0000   1481.9300     32.5000      8.5400
+     33.2000   1481.8900     32.5000      8.5200
+     33.3000   1481.8500     32.5000      8.5100
+     33.5000   1481.8000     32.5000      8.5000
+     33.7000   1481.7100     32.5000      8.4700
+     33.9000   1481.5800     32.5000      8.4400
+     34.0000   1481.4800     32.5000      8.4100
+     34.2000   1481.4200     32.5000      8.3900
+     34.4000   1481.3900     32.5000      8.3800
+     34.6000   1481.3700     32.5000      8.3800
+     34.7000   1481.3500     32.5000      8.3700
+     34.9000   1481.3600     32.5000      8.3700
+     35.1000   1481.3700     32.5000      8.3800
+     35.3000   1481.3700     32.5000      8.3800
+     35.5000   1481.3800     32.5000      8.3800
+     35.6000   1481.3900     32.5000      8.3800
+     35.8000   1481.3500     32.5000      8.3700
+     36.0000   1481.3400     32.5000      8.3600
+     36.2000   1481.3600     32.5000      8.3700
+     36.3000   1481.3200     32.5000      8.3600
+     36.5000   1481.2600     32.5000      8.3400
+     36.7000   1481.2200     32.5000      8.3300
+     36.9000   1481.2100     32.5000      8.3300
+     37.0000   1481.1700     32.5000      8.3200
+     37.2000   1481.1600     32.5000      8.3100
+     37.4000   1481.1400     32.5000      8.3000
+     37.6000   1481.1100     32.5000      8.3000
+     37.8000   1481.1100     32.5000      8.3000
+     37.9000   1481.1000     32.5000      8.2900
+     38.1000   1481.1000     32.5000      8.2900
+     38.3000   1481.0800     32.5000      8.2900
+     38.5000   1480.9800     32.5000      8.2600
+     38.6000   1480.8200     32.5000      8.2200
+     38.8000   1480.7300     32.5000      8.1900
+     39.0000   1480.7200     32.5000      8.1900
+     39.2000   1480.7300     32.5000      8.1900
+     39.3000   1480.7400     32.5000      8.1900
+     39.5000   1480.7400     32.5000      8.1900
+     39.7000   1480.7600     32.5000      8.2000
+     39.9000   1480.7900     32.5000      8.2000
+     40.1000   1480.8100     32.5000      8.2100
+     40.2000   1480.8500     32.5000      8.2200
+     40.4000   1480.8900     32.5000      8.2300
+     40.6000   1480.9100     32.5000      8.2300
+     40.8000   1480.8900     32.5000      8.2300
+     40.9000   1480.8400     32.5000      8.2100
+     41.1000   1480.7900     32.5000      8.2000
+     41.3000   1480.7600     32.5000      8.1900
+     41.5000   1480.7400     32.5000      8.1800
+     41.6000   1480.7200     32.5000      8.1800
+     41.8000   1480.6900     32.5000      8.1700
+     42.0000   1480.6600     32.5000      8.1600
+     42.2000   1480.6300     32.5000      8.1500
+     42.3000   1480.6200     32.5000      8.1500
+     42.5000   1480.5900     32.5000      8.1400
+     42.7000   1480.5800     32.5000      8.1300
+     42.9000   1480.5800     32.5000      8.1300
+     43.1000   1480.5600     32.5000      8.1300
+     43.2000   1480.5600     32.5000      8.1300
+     43.4000   1480.5500     32.5000      8.1200
+     43.6000   1480.5300     32.5000      8.1200
+     43.8000   1480.5000     32.5000      8.1100
+     43.9000   1480.4300     32.5000      8.0900
+     44.1000   1480.3700     32.5000      8.0700
+     44.3000   1480.3200     32.5000      8.0600
+     44.5000   1480.2700     32.5000      8.0500
+     44.6000   1480.2500     32.5000      8.0400
+     44.8000   1480.2400     32.5000      8.0400
+     45.0000   1480.2600     32.5000      8.0400
+     45.2000   1480.2600     32.5000      8.0400
+     45.3000   1480.2200     32.5000      8.0300
+     45.5000   1480.2000     32.5000      8.0200
+     45.7000   1480.1900     32.5000      8.0200
+     45.9000   1480.2000     32.5000      8.0200
+     46.1000   1480.2000     32.5000      8.0200
+     46.2000   1480.1900     32.5000      8.0200
+     46.4000   1480.1600     32.5000      8.0100
+     46.6000   1480.1500     32.5000      8.0100
+     46.8000   1480.1500     32.5000      8.0000
+     46.9000   1480.1400     32.5000      8.0000
+     47.1000   1480.0600     32.5000      7.9800
+     47.3000   1479.9700     32.5000      7.9500
+     47.5000   1479.8800     32.5000      7.9300
+     47.6000   1479.8200     32.5000      7.9100
+     47.8000   1479.7900     32.5000      7.9000
+     48.0000   1479.7700     32.5000      7.9000
+     48.2000   1479.7600     32.5000      7.8900
+     48.3000   1479.7300     32.5000      7.8900
+     48.5000   1479.7200     32.5000      7.8800
+     48.7000   1479.6900     32.5000      7.8800
+     48.9000   1479.6800     32.5000      7.8700
+     49.1000   1479.6700     32.5000      7.8700
+     49.2000   1479.6300     32.5000      7.8600
+     49.4000   1479.5800     32.5000      7.8400
+     49.6000   1479.5400     32.5000      7.8300
+     49.8000   1479.5000     32.5000      7.8200
+     49.9000   1479.4800     32.5000      7.8100
+     50.1000   1479.4600     32.5000      7.8100
+     50.3000   1479.4400     32.5000      7.8000
+     50.5000   1479.4000     32.5000      7.7900
+     50.6000   1479.3800     32.5000      7.7900
+     50.8000   1479.3600     32.5000      7.7800
+     51.0000   1479.3400     32.5000      7.7700
+     51.2000   1479.3300     32.5000      7.7700
+     51.3000   1479.3400     32.5000      7.7700
+     51.5000   1479.3200     32.5000      7.7700
+     51.7000   1479.3200     32.5000      7.7600
+     51.9000   1479.3100     32.5000      7.7600
+     52.0000   1479.3000     32.5000      7.7600
+     52.2000   1479.3000     32.5000      7.7600
+     52.4000   1479.2800     32.5000      7.7500
+     52.6000   1479.2400     32.5000      7.7400
+     52.8000   1479.2400     32.5000      7.7400
+     52.9000   1479.2200     32.5000      7.7300
+     53.1000   1479.1500     32.5000      7.7100
+     53.3000   1479.1100     32.5000      7.7000
+     53.5000   1479.0600     32.5000      7.6900
+     53.6000   1479.0300     32.5000      7.6800
+     53.8000   1478.9500     32.5000      7.6600
+     54.0000   1478.8400     32.5000      7.6300
+     54.2000   1478.8100     32.5000      7.6200
+     54.3000   1478.7700     32.5000      7.6100
+     54.5000   1478.7300     32.5000      7.6000
+     54.7000   1478.7100     32.5000      7.5900
+     54.9000   1478.6800     32.5000      7.5800
+     55.0000   1478.6800     32.5000      7.5800
+     55.2000   1478.6800     32.5000      7.5800
+     55.4000   1478.6700     32.5000      7.5800
+     55.6000   1478.6600     32.5000      7.5800
+     55.8000   1478.6800     32.5000      7.5800
+     55.9000   1478.7000     32.5000      7.5800
+     56.1000   1478.6900     32.5000      7.5800
+     56.3000   1478.6900     32.5000      7.5800
+     56.5000   1478.6700     32.5000      7.5700
+     56.6000   1478.6000     32.5000      7.5600
+     56.8000   1478.5100     32.5000      7.5300
+     57.0000   1478.4400     32.5000      7.5100
+     57.2000   1478.4000     32.5000      7.5000
+     57.3000   1478.3500     32.5000      7.4900
+     57.5000   1478.2900     32.5000      7.4700
+     57.7000   1478.2400     32.5000      7.4600
+     57.9000   1478.1700     32.5000      7.4400
+     58.0000   1478.0900     32.5000      7.4200
+     58.2000   1478.0400     32.5000      7.4000
+     58.4000   1478.0000     32.5000      7.3900
+     58.6000   1477.9400     32.5000      7.3800
+     58.7000   1477.9100     32.5000      7.3700
+     58.9000   1477.8800     32.5000      7.3600
+     59.1000   1477.8600     32.5000      7.3500
+     59.3000   1477.8600     32.5000      7.3500
+     59.4000   1477.8600     32.5000      7.3500
+     59.6000   1477.8600     32.5000      7.3500
+     59.8000   1477.8500     32.5000      7.3500
+     60.0000   1477.8300     32.5000      7.3400
+     60.2000   1477.8400     32.5000      7.3400
+     60.3000   1477.8400     32.5000      7.3400
+     60.5000   1477.8400     32.5000      7.3400
+     60.7000   1477.8300     32.5000      7.3400
+     60.9000   1477.8100     32.5000      7.3300
+     61.0000   1477.8000     32.5000      7.3300
+     61.2000   1477.7900     32.5000      7.3300
+     61.4000   1477.7900     32.5000      7.3200
+     61.6000   1477.7900     32.5000      7.3300
+     61.7000   1477.7800     32.5000      7.3200
+     61.9000   1477.7700     32.5000      7.3200
+     62.1000   1477.7600     32.5000      7.3200
+     62.3000   1477.6900     32.5000      7.3000
+     62.4000   1477.6400     32.5000      7.2800
+     62.6000   1477.6200     32.5000      7.2800
+     62.8000   1477.6300     32.5000      7.2800
+     63.0000   1477.6100     32.5000      7.2700
+     63.1000   1477.6200     32.5000      7.2700
+     63.3000   1477.6200     32.5000      7.2700
+     63.5000   1477.5900     32.5000      7.2700
+     63.7000   1477.6000     32.5000      7.2700
+     63.8000   1477.5900     32.5000      7.2600
+     64.0000   1477.5900     32.5000      7.2600
+     64.2000   1477.5800     32.5000      7.2600
+     64.4000   1477.5700     32.5000      7.2600
+     64.6000   1477.5400     32.5000      7.2500
+     64.7000   1477.4500     32.5000      7.2200
+     64.9000   1477.3400     32.5000      7.1900
+     65.1000   1477.2900     32.5000      7.1800
+     65.3000   1477.2900     32.5000      7.1800
+     65.4000   1477.2800     32.5000      7.1800
+     65.6000   1477.2900     32.5000      7.1800
+     65.8000   1477.3000     32.5000      7.1800
+     66.0000   1477.3000     32.5000      7.1800
+     66.1000   1477.2800     32.5000      7.1700
+     66.3000   1477.2300     32.5000      7.1600
+     66.5000   1477.1700     32.5000      7.1400
+     66.7000   1477.1300     32.5000      7.1300
+     66.8000   1477.1100     32.5000      7.1300
+     67.0000   1477.1100     32.5000      7.1200
+     67.2000   1477.0800     32.5000      7.1200
+     67.4000   1477.0800     32.5000      7.1200
+     67.5000   1477.0500     32.5000      7.1100
+     67.7000   1476.9400     32.5000      7.0800
+     67.9000   1476.8200     32.5000      7.0500
+     68.1000   1476.7400     32.5000      7.0200
+     68.2000   1476.6900     32.5000      7.0100
+     68.4000   1476.6600     32.5000      7.0000
+     68.6000   1476.6300     32.5000      7.0000
+     68.8000   1476.6100     32.5000      6.9900
+     69.0000   1476.5900     32.5000      6.9800
+     69.1000   1476.5700     32.5000      6.9800
+     69.3000   1476.5400     32.5000      6.9700
+     69.5000   1476.5400     32.5000      6.9700
+     69.7000   1476.5400     32.5000      6.9700
+     69.8000   1476.5400     32.5000      6.9700
+     70.0000   1476.5200     32.5000      6.9600
+     70.2000   1476.5200     32.5000      6.9600
+     70.4000   1476.5300     32.5000      6.9600
+     70.5000   1476.5500     32.5000      6.9700
+     70.7000   1476.5800     32.5000      6.9700
+     70.9000   1476.5700     32.5000      6.9700
+     71.1000   1476.5400     32.5000      6.9600
+     71.2000   1476.5200     32.5000      6.9600
+     71.4000   1476.5200     32.5000      6.9500
+     71.6000   1476.4800     32.5000      6.9500
+     71.8000   1476.4500     32.5000      6.9400
+     71.9000   1476.3900     32.5000      6.9200
+     72.1000   1476.3300     32.5000      6.9000
+     72.3000   1476.3200     32.5000      6.9000
+     72.5000   1476.3000     32.5000      6.9000
+     72.6000   1476.2800     32.5000      6.8900
+     72.8000   1476.2700     32.5000      6.8800
+     73.0000   1476.2500     32.5000      6.8800
+     73.2000   1476.2400     32.5000      6.8800
+     73.3000   1476.2400     32.5000      6.8700
+     73.5000   1476.2400     32.5000      6.8700
+     73.7000   1476.2300     32.5000      6.8700
+     73.9000   1476.2300     32.5000      6.8700
+     74.0000   1476.2200     32.5000      6.8700
+     74.2000   1476.1700     32.5000      6.8500
+     74.4000   1476.1100     32.5000      6.8400
+     74.6000   1476.0200     32.5000      6.8100
+     74.7000   1475.9400     32.5000      6.7900
+     74.9000   1475.8800     32.5000      6.7800
+     75.1000   1475.8400     32.5000      6.7700
+     75.3000   1475.7900     32.5000      6.7500
+     75.5000   1475.7600     32.5000      6.7500
+     75.6000   1475.7600     32.5000      6.7400
+     75.8000   1475.7400     32.5000      6.7400
+     76.0000   1475.7600     32.5000      6.7400
+     76.2000   1475.7500     32.5000      6.7400
+     76.3000   1475.7600     32.5000      6.7400
+     76.5000   1475.7600     32.5000      6.7400
+     76.7000   1475.7800     32.5000      6.7400
+     76.9000   1475.8100     32.5000      6.7500
+     77.0000   1475.8400     32.5000      6.7600
+     77.2000   1475.8900     32.5000      6.7700
+     77.4000   1475.9300     32.5000      6.7800
+     77.6000   1475.9700     32.5000      6.7900
+     77.7000   1476.0000     32.5000      6.8000
+     77.9000   1476.0400     32.5000      6.8000
+     78.1000   1476.0800     32.5000      6.8100
+     78.3000   1476.1000     32.5000      6.8200
+     78.4000   1476.1400     32.5000      6.8300
+     78.6000   1476.1800     32.5000      6.8400
+     78.8000   1476.2100     32.5000      6.8400
+     79.0000   1476.2300     32.5000      6.8500
+     79.1000   1476.2500     32.5000      6.8500
+     79.3000   1476.2900     32.5000      6.8600
+     79.5000   1476.3100     32.5000      6.8700
+     79.7000   1476.3300     32.5000      6.8700
+     79.8000   1476.3300     32.5000      6.8700
+     80.0000   1476.3200     32.5000      6.8700
+     80.2000   1476.3000     32.5000      6.8600
+     80.4000   1476.2800     32.5000      6.8600
+     80.5000   1476.2400     32.5000      6.8500
+     80.7000   1476.2000     32.5000      6.8300
+     80.9000   1476.1600     32.5000      6.8200
+     81.1000   1476.1000     32.5000      6.8100
+     81.2000   1476.0700     32.5000      6.8000
+     81.4000   1476.0500     32.5000      6.7900
+     81.6000   1476.0500     32.5000      6.7900
+     81.8000   1476.0500     32.5000      6.7900
+     81.9000   1476.0700     32.5000      6.8000
+     82.1000   1476.0600     32.5000      6.7900
+     82.3000   1476.0400     32.5000      6.7900
+     82.5000   1476.0300     32.5000      6.7800
+     82.6000   1476.0300     32.5000      6.7800
+     82.8000   1476.0300     32.5000      6.7800
+     83.0000   1476.0500     32.5000      6.7900
+     83.2000   1476.0800     32.5000      6.7900
+     83.3000   1476.0800     32.5000      6.7900
+     83.5000   1476.0900     32.5000      6.7900
+     83.7000   1476.0800     32.5000      6.7900
+     83.9000   1476.0400     32.5000      6.7800
+     84.1000   1476.0000     32.5000      6.7700
+     84.2000   1475.9500     32.5000      6.7600
+     84.4000   1475.8900     32.5000      6.7400
+     84.6000   1475.8600     32.5000      6.7300
+     84.8000   1475.8300     32.5000      6.7200
+     84.9000   1475.8000     32.5000      6.7100
+     85.1000   1475.8000     32.5000      6.7100
+     85.3000   1475.7700     32.5000      6.7100
+     85.5000   1475.7400     32.5000      6.7000
+     85.6000   1475.7400     32.5000      6.7000
+     85.8000   1475.7200     32.5000      6.6900
+     86.0000   1475.7000     32.5000      6.6900
+     86.2000   1475.6700     32.5000      6.6800
+     86.3000   1475.6200     32.5000      6.6600
+     86.5000   1475.5800     32.5000      6.6500
+     86.7000   1475.5600     32.5000      6.6500
+     86.9000   1475.5200     32.5000      6.6400
+     87.0000   1475.4800     32.5000      6.6300
+     87.2000   1475.4700     32.5000      6.6200
+     87.4000   1475.4400     32.5000      6.6100
+     87.6000   1475.4300     32.5000      6.6100
+     87.7000   1475.4100     32.5000      6.6000
+     87.9000   1475.4000     32.5000      6.6000
+     88.1000   1475.3800     32.5000      6.5900
+     88.3000   1475.3500     32.5000      6.5900
+     88.4000   1475.3200     32.5000      6.5800
+     88.6000   1475.3000     32.5000      6.5700
+     88.8000   1475.2700     32.5000      6.5600
+     89.0000   1475.2500     32.5000      6.5600
+     89.1000   1475.2400     32.5000      6.5500
+     89.3000   1475.2200     32.5000      6.5500
+     89.5000   1475.2200     32.5000      6.5500
+     89.7000   1475.2000     32.5000      6.5400
+     89.8000   1475.1800     32.5000      6.5400
+     90.0000   1475.1900     32.5000      6.5400
+     90.2000   1475.2000     32.5000      6.5400
+     90.4000   1475.2100     32.5000      6.5400
+     90.5000   1475.2000     32.5000      6.5400
+     90.7000   1475.1300     32.5000      6.5200
+     90.9000   1475.0400     32.5000      6.5000
+     91.1000   1475.0100     32.5000      6.4900
+     91.2000   1474.9800     32.5000      6.4800
+     91.4000   1474.9400     32.5000      6.4700
+     91.6000   1474.8800     32.5000      6.4500
+     91.8000   1474.8200     32.5000      6.4400
+     91.9000   1474.8000     32.5000      6.4300
+     92.1000   1474.7800     32.5000      6.4200
+     92.3000   1474.7400     32.5000      6.4100
+     92.5000   1474.6900     32.5000      6.4000
+     92.6000   1474.6500     32.5000      6.3900
+     92.8000   1474.6200     32.5000      6.3800
+     93.0000   1474.5700     32.5000      6.3700
+     93.2000   1474.5300     32.5000      6.3600
+     93.3000   1474.4900     32.5000      6.3500
+     93.5000   1474.4700     32.5000      6.3400
+     93.7000   1474.4700     32.5000      6.3400
+     93.9000   1474.4700     32.5000      6.3400
+     94.0000   1474.4500     32.5000      6.3400
+     94.2000   1474.4400     32.5000      6.3300
+     94.4000   1474.4200     32.5000      6.3300
+     94.6000   1474.3900     32.5000      6.3200
+     94.7000   1474.3600     32.5000      6.3100
+     94.9000   1474.3200     32.5000      6.3000
+     95.1000   1474.2800     32.5000      6.2900
+     95.3000   1474.2700     32.5000      6.2800
+     95.4000   1474.2500     32.5000      6.2800
+     95.6000   1474.2400     32.5000      6.2700
+     95.8000   1474.2100     32.5000      6.2700
+     96.0000   1474.1500     32.5000      6.2500
+     96.1000   1474.0900     32.5000      6.2300
+     96.3000   1474.0700     32.5000      6.2300
+     96.5000   1474.0700     32.5000      6.2300
+     96.7000   1474.0600     32.5000      6.2300
+     96.8000   1474.0400     32.5000      6.2200
+     97.0000   1474.0000     32.5000      6.2100
+     97.2000   1473.9700     32.5000      6.2000
+     97.4000   1473.9300     32.5000      6.1900
+     97.5000   1473.8500     32.5000      6.1700
+     97.7000   1473.7800     32.5000      6.1500
+     97.9000   1473.7400     32.5000      6.1400
+     98.1000   1473.6900     32.5000      6.1300
+     98.2000   1473.6700     32.5000      6.1200
+     98.4000   1473.6500     32.5000      6.1100
+     98.6000   1473.6000     32.5000      6.1000
+     98.8000   1473.5100     32.5000      6.0800
+     98.9000   1473.4300     32.5000      6.0600
+     99.1000   1473.3700     32.5000      6.0400
+     99.3000   1473.3600     32.5000      6.0400
+     99.5000   1473.3600     32.5000      6.0400
+     99.6000   1473.3800     32.5000      6.0400
+     99.8000   1473.4000     32.5000      6.0500
+    100.0000   1473.4000     32.5000      6.0500
+    100.2000   1473.4300     32.5000      6.0500
+    100.3000   1473.4500     32.5000      6.0600
+    100.5000   1473.4600     32.5000      6.0600
+    100.7000   1473.4600     32.5000      6.0600
+    100.9000   1473.4700     32.5000      6.0600
+    101.0000   1473.5100     32.5000      6.0700
+    101.2000   1473.5700     32.5000      6.0800
+    101.4000   1473.6100     32.5000      6.0900
+    101.6000   1473.4700     32.5000      6.0600
+    101.7000   1473.4200     32.5000      6.0400
+    101.9000   1473.4000     32.5000      6.0400
+    102.1000   1473.4000     32.5000      6.0400
+    102.3000   1473.4200     32.5000      6.0400
+    102.4000   1473.6300     32.5000      6.0900
+    102.6000   1473.7900     32.5000      6.1300
+    102.8000   1473.6300     32.5000      6.0900
+    103.0000   1473.4300     32.5000      6.0400
+    103.1000   1473.6500     32.5000      6.1000
+    103.3000   1473.8800     32.5000      6.1500
+    103.5000   1473.9200     32.5000      6.1600
+    103.7000   1473.9300     32.5000      6.1600
+    103.8000   1473.8900     32.5000      6.1500
+    104.0000   1473.8500     32.5000      6.1400
+    104.2000   1473.8200     32.5000      6.1400
+    104.4000   1473.8400     32.5000      6.1400
+    104.5000   1473.6700     32.5000      6.0900
+    104.7000   1473.3700     32.5000      6.0200
+    104.9000   1473.2600     32.5000      5.9900
+    105.1000   1473.3700     32.5000      6.0200
+    105.2000   1473.9700     32.5000      6.1700
+    105.4000   1474.2100     32.5000      6.2300
+    105.6000   1474.1900     32.5000      6.2200
+    105.8000   1474.2300     32.5000      6.2300
+    105.9000   1474.2300     32.5000      6.2300
+    106.1000   1474.0600     32.5000      6.1900
+    106.3000   1473.8400     32.5000      6.1300
+    106.5000   1473.7200     32.5000      6.1000
+    106.6000   1473.9800     32.5000      6.1600
+    106.8000   1474.0500     32.5000      6.1800
+    107.0000   1474.0900     32.5000      6.1900
+    107.2000   1474.0800     32.5000      6.1900
+    107.3000   1474.0500     32.5000      6.1800
+    107.5000   1474.0200     32.5000      6.1700
+    107.7000   1474.0000     32.5000      6.1600
+    107.9000   1473.9800     32.5000      6.1600
+    108.0000   1473.9300     32.5000      6.1500
+    108.2000   1473.8900     32.5000      6.1300
+    108.4000   1473.8700     32.5000      6.1300
+    108.6000   1473.8600     32.5000      6.1300
+    108.7000   1473.8500     32.5000      6.1200
+    108.9000   1473.8000     32.5000      6.1100
+    109.1000   1473.7900     32.5000      6.1100
+    109.2000   1473.7800     32.5000      6.1000
+    109.4000   1473.7700     32.5000      6.1000
+    109.6000   1473.7600     32.5000      6.1000
+    109.8000   1473.7700     32.5000      6.1000
+    109.9000   1473.7800     32.5000      6.1000
+    110.1000   1473.7900     32.5000      6.1000
+    110.3000   1473.7900     32.5000      6.1000
+    110.5000   1473.8000     32.5000      6.1000
+    110.6000   1473.8000     32.5000      6.1000
+    110.8000   1473.7800     32.5000      6.1000
+    111.0000   1473.7700     32.5000      6.0900
+    111.2000   1473.7700     32.5000      6.0900
+    111.3000   1473.7500     32.5000      6.0900
+    111.5000   1473.7100     32.5000      6.0700
+    111.7000   1473.6400     32.5000      6.0600
+    111.9000   1473.5500     32.5000      6.0300
+    112.0000   1473.4500     32.5000      6.0100
+    112.2000   1473.3600     32.5000      5.9900
+    112.4000   1473.2700     32.5000      5.9600
+    112.6000   1473.2300     32.5000      5.9500
+    112.7000   1473.2100     32.5000      5.9500
+    112.9000   1473.1800     32.5000      5.9400
+    113.1000   1473.1400     32.5000      5.9300
+    113.3000   1473.0600     32.5000      5.9100
+    113.4000   1472.9700     32.5000      5.8800
+    113.6000   1472.8700     32.5000      5.8600
+    113.8000   1472.8200     32.5000      5.8500
+    114.0000   1472.8000     32.5000      5.8400
+    114.1000   1472.8400     32.5000      5.8500
+    114.3000   1472.8900     32.5000      5.8600
+    114.5000   1472.9200     32.5000      5.8700
+    114.7000   1472.9300     32.5000      5.8700
+    114.8000   1472.9400     32.5000      5.8700
+    115.0000   1473.0000     32.5000      5.8800
+    115.2000   1473.0500     32.5000      5.9000
+    115.4000   1473.0600     32.5000      5.9000
+    115.5000   1473.0600     32.5000      5.9000
+    115.7000   1473.0900     32.5000      5.9000
+    115.9000   1473.0800     32.5000      5.9000
+    116.1000   1473.0900     32.5000      5.9000
+    116.2000   1473.0900     32.5000      5.9000
+    116.4000   1473.0700     32.5000      5.9000
+    116.6000   1473.0800     32.5000      5.9000
+    116.8000   1473.0800     32.5000      5.9000
+    116.9000   1473.0900     32.5000      5.9000
+    117.1000   1473.0700     32.5000      5.8900
+    117.3000   1473.0400     32.5000      5.8900
+    117.5000   1473.0400     32.5000      5.8900
+    117.6000   1473.0400     32.5000      5.8800
+    117.8000   1473.0400     32.5000      5.8800
+    118.0000   1473.0400     32.5000      5.8800
+    118.1000   1473.0200     32.5000      5.8800
+    118.3000   1473.0200     32.5000      5.8800
+    118.5000   1473.0000     32.5000      5.8700
+    118.7000   1473.0000     32.5000      5.8700
+    118.8000   1473.0100     32.5000      5.8700
+    119.0000   1473.0200     32.5000      5.8700
+    119.2000   1473.0100     32.5000      5.8700
+    119.4000   1473.0100     32.5000      5.8700
+    119.5000   1473.0100     32.5000      5.8700
+    119.7000   1472.9900     32.5000      5.8600
+    119.9000   1472.9300     32.5000      5.8500
+    120.1000   1472.8900     32.5000      5.8400
+    120.2000   1472.8800     32.5000      5.8300
+    120.4000   1472.8500     32.5000      5.8200
+    120.6000   1472.7900     32.5000      5.8100
+    120.8000   1472.7600     32.5000      5.8000
+    120.9000   1472.7600     32.5000      5.8000
+    121.1000   1472.7600     32.5000      5.8000
+    121.3000   1472.7400     32.5000      5.7900
+    121.5000   1472.6800     32.5000      5.7800
+    121.6000   1472.6500     32.5000      5.7700
+    121.8000   1472.6200     32.5000      5.7600
+    122.0000   1472.6100     32.5000      5.7600
+    122.2000   1472.6100     32.5000      5.7600
+    122.3000   1472.6200     32.5000      5.7600
+    122.5000   1472.6200     32.5000      5.7600
+    122.7000   1472.6300     32.5000      5.7600
+    122.9000   1472.6100     32.5000      5.7600
+    123.0000   1472.5900     32.5000      5.7500
+    123.2000   1472.5900     32.5000      5.7500
+    123.4000   1472.5900     32.5000      5.7500
+    123.6000   1472.5900     32.5000      5.7500
+    123.7000   1472.6000     32.5000      5.7500
+    123.9000   1472.5800     32.5000      5.7400
+    124.1000   1472.5100     32.5000      5.7300
+    124.2000   1472.4600     32.5000      5.7100
+    124.4000   1472.4400     32.5000      5.7100
+    124.6000   1472.4300     32.5000      5.7000
+    124.8000   1472.4100     32.5000      5.7000
+    124.9000   1472.4000     32.5000      5.7000
+    125.1000   1472.4000     32.5000      5.6900
+    125.3000   1472.3900     32.5000      5.6900
+    125.5000   1472.3500     32.5000      5.6800
+    125.6000   1472.3100     32.5000      5.6700
+    125.8000   1472.2300     32.5000      5.6500
+    126.0000   1472.1800     32.5000      5.6400
+    126.2000   1472.1700     32.5000      5.6300
+    126.3000   1472.1500     32.5000      5.6300
+    126.5000   1472.1300     32.5000      5.6200
+    126.7000   1472.1100     32.5000      5.6200
+    126.9000   1472.1100     32.5000      5.6100
+    127.0000   1472.1000     32.5000      5.6100
+    127.2000   1472.0700     32.5000      5.6000
+    127.4000   1472.0200     32.5000      5.5900
+    127.6000   1471.9800     32.5000      5.5800
+    127.7000   1471.9600     32.5000      5.5700
+    127.9000   1471.9400     32.5000      5.5700
+    128.1000   1471.9100     32.5000      5.5600
+    128.3000   1471.8800     32.5000      5.5500
+    128.4000   1471.8900     32.5000      5.5500
+    128.6000   1471.8700     32.5000      5.5500
+    128.8000   1471.8800     32.5000      5.5500
+    128.9000   1471.8800     32.5000      5.5500
+    129.1000   1471.8600     32.5000      5.5400
+    129.3000   1471.8500     32.5000      5.5400
+    129.5000   1471.8400     32.5000      5.5400
+    129.6000   1471.8300     32.5000      5.5300
+    129.8000   1471.8000     32.5000      5.5300
+    130.0000   1471.7800     32.5000      5.5200
+    130.2000   1471.7700     32.5000      5.5200
+    130.3000   1471.7800     32.5000      5.5200
+    130.5000   1471.7600     32.5000      5.5100
+    130.7000   1471.7000     32.5000      5.5000
+    130.9000   1471.6500     32.5000      5.4800
+    131.0000   1471.6000     32.5000      5.4700
+    131.2000   1471.5600     32.5000      5.4600
+    131.4000   1471.5400     32.5000      5.4600
+    131.6000   1471.5200     32.5000      5.4500
+    131.7000   1471.4900     32.5000      5.4400
+    131.9000   1471.4700     32.5000      5.4400
+    132.1000   1471.4300     32.5000      5.4300
+    132.3000   1471.4000     32.5000      5.4200
+    132.4000   1471.3400     32.5000      5.4000
+    132.6000   1471.2600     32.5000      5.3800
+    132.8000   1471.2100     32.5000      5.3700
+    133.0000   1471.1500     32.5000      5.3500
+    133.1000   1471.1100     32.5000      5.3400
+    133.3000   1471.0600     32.5000      5.3300
+    133.5000   1471.0200     32.5000      5.3200
+    133.6000   1470.9700     32.5000      5.3100
+    133.8000   1470.9500     32.5000      5.3000
+    134.0000   1470.9500     32.5000      5.3000
+    134.2000   1470.9100     32.5000      5.2900
+    134.3000   1470.9000     32.5000      5.2900
+    134.5000   1470.9000     32.5000      5.2800
+    134.7000   1470.9000     32.5000      5.2800
+    134.9000   1470.9000     32.5000      5.2800
+    135.0000   1470.9000     32.5000      5.2800
+    135.2000   1470.8900     32.5000      5.2800
+    135.4000   1470.8800     32.5000      5.2800
+    135.6000   1470.8600     32.5000      5.2700
+    135.7000   1470.8400     32.5000      5.2600
+    135.9000   1470.8200     32.5000      5.2600
+    136.1000   1470.8200     32.5000      5.2600
+    136.3000   1470.8100     32.5000      5.2600
+    136.4000   1470.8100     32.5000      5.2600
+    136.6000   1470.8200     32.5000      5.2600
+    136.8000   1470.8000     32.5000      5.2500
+    137.0000   1470.7700     32.5000      5.2400
+    137.1000   1470.7400     32.5000      5.2300
+    137.3000   1470.7300     32.5000      5.2300
+    137.5000   1470.7300     32.5000      5.2300
+    137.6000   1470.7000     32.5000      5.2200
+    137.8000   1470.6900     32.5000      5.2200
+    138.0000   1470.7000     32.5000      5.2200
+    138.2000   1470.7100     32.5000      5.2200
+    138.3000   1470.7000     32.5000      5.2200
+    138.5000   1470.7200     32.5000      5.2200
+    138.7000   1470.7400     32.5000      5.2300
+    138.9000   1470.7400     32.5000      5.2300
+    139.0000   1470.7200     32.5000      5.2200
+    139.2000   1470.7200     32.5000      5.2200
+    139.4000   1470.7100     32.5000      5.2200
+    139.6000   1470.7100     32.5000      5.2200
+    139.7000   1470.6900     32.5000      5.2100
+    139.9000   1470.6900     32.5000      5.2100
+    140.1000   1470.6800     32.5000      5.2100
+    140.3000   1470.6700     32.5000      5.2000
+    140.4000   1470.6600     32.5000      5.2000
+    140.6000   1470.6700     32.5000      5.2000
+    140.8000   1470.6700     32.5000      5.2000
+    140.9000   1470.6700     32.5000      5.2000
+    141.1000   1470.6500     32.5000      5.2000
+    141.3000   1470.6600     32.5000      5.2000
+    141.5000   1470.6600     32.5000      5.2000
+    141.6000   1470.6800     32.5000      5.2000
+    141.8000   1470.7000     32.5000      5.2100
+    142.0000   1470.7200     32.5000      5.2100
+    142.2000   1470.7300     32.5000      5.2100
+    142.3000   1470.7200     32.5000      5.2100
+    142.5000   1470.7200     32.5000      5.2100
+    142.7000   1470.7100     32.5000      5.2000
+    142.9000   1470.7100     32.5000      5.2000
+    143.0000   1470.7000     32.5000      5.2000
+    143.2000   1470.7000     32.5000      5.2000
+    143.4000   1470.7100     32.5000      5.2000
+    143.6000   1470.6700     32.5000      5.1900
+    143.7000   1470.6500     32.5000      5.1900
+    143.9000   1470.6600     32.5000      5.1900
+    144.1000   1470.6600     32.5000      5.1900
+    144.2000   1470.6500     32.5000      5.1800
+    144.4000   1470.6500     32.5000      5.1800
+    144.6000   1470.6200     32.5000      5.1800
+    144.8000   1470.6000     32.5000      5.1700
+    144.9000   1470.5700     32.5000      5.1600
+    145.1000   1470.5600     32.5000      5.1600
+    145.3000   1470.5300     32.5000      5.1500
+    145.5000   1470.5300     32.5000      5.1500
+    145.6000   1470.5300     32.5000      5.1500
+    145.8000   1470.5200     32.5000      5.1400
+    146.0000   1470.5100     32.5000      5.1400
+    146.2000   1470.5100     32.5000      5.1400
+    146.3000   1470.4900     32.5000      5.1400
+    146.5000   1470.4600     32.5000      5.1300
+    146.7000   1470.4800     32.5000      5.1300
+    146.9000   1470.5700     32.5000      5.1500
+    147.0000   1470.7000     32.5000      5.1900
+    147.2000   1470.8600     32.5000      5.2200
+    147.4000   1471.0200     32.5000      5.2600
+    147.5000   1471.1600     32.5000      5.3000
+    147.7000   1471.3000     32.5000      5.3300
+    147.9000   1471.4200     32.5000      5.3600
+    148.1000   1471.5100     32.5000      5.3800
+    148.2000   1471.5700     32.5000      5.3900
+    148.4000   1471.6200     32.5000      5.4100
+    148.6000   1471.6900     32.5000      5.4200
+    148.8000   1471.7500     32.5000      5.4400
+    148.9000   1471.7600     32.5000      5.4400
+    149.1000   1471.7900     32.5000      5.4500
+    149.3000   1471.8100     32.5000      5.4500
+    149.5000   1471.8300     32.5000      5.4500
+    149.6000   1471.8200     32.5000      5.4500
+    149.8000   1471.8200     32.5000      5.4500
+    150.0000   1471.8100     32.5000      5.4500
+    150.1000   1471.8000     32.5000      5.4400
+    150.3000   1471.7700     32.5000      5.4400
+    150.5000   1471.7400     32.5000      5.4300
+    150.7000   1471.7100     32.5000      5.4200
+    150.8000   1471.7000     32.5000      5.4200
+    151.0000   1471.6700     32.5000      5.4100
+    151.2000   1471.6400     32.5000      5.4000
+    151.4000   1471.6100     32.5000      5.3900
+    151.5000   1471.5700     32.5000      5.3800
+    151.7000   1471.5400     32.5000      5.3700
+    151.9000   1471.4900     32.5000      5.3600
+    152.1000   1471.4500     32.5000      5.3500
+    152.2000   1471.4300     32.5000      5.3400
+    152.4000   1471.4200     32.5000      5.3400
+    152.6000   1471.4100     32.5000      5.3400
+    152.7000   1471.3900     32.5000      5.3300
+    152.9000   1471.3700     32.5000      5.3300
+    153.1000   1471.3500     32.5000      5.3200
+    153.3000   1471.3200     32.5000      5.3100
+    153.4000   1471.2900     32.5000      5.3100
+    153.6000   1471.2700     32.5000      5.3000
+    153.8000   1471.2700     32.5000      5.3000
+    154.0000   1471.2600     32.5000      5.2900
+    154.1000   1471.2400     32.5000      5.2900
+    154.3000   1471.1900     32.5000      5.2800
+    154.5000   1471.1500     32.5000      5.2600
+    154.7000   1471.0900     32.5000      5.2500
+    154.8000   1471.0600     32.5000      5.2400
+    155.0000   1471.0300     32.5000      5.2300
+    155.2000   1471.0100     32.5000      5.2300
+    155.3000   1471.0000     32.5000      5.2300
+    155.5000   1471.0000     32.5000      5.2200
+    155.7000   1471.0100     32.5000      5.2300
+    155.9000   1471.0100     32.5000      5.2300
+    156.0000   1471.0000     32.5000      5.2200
+    156.2000   1470.9900     32.5000      5.2200
+    156.4000   1470.9900     32.5000      5.2200
+    156.6000   1470.9900     32.5000      5.2200
+    156.7000   1470.9900     32.5000      5.2200
+    156.9000   1470.9800     32.5000      5.2100
+    157.1000   1470.9700     32.5000      5.2100
+    157.3000   1470.9500     32.5000      5.2100
+    157.4000   1470.9200     32.5000      5.2000
+    157.6000   1470.8800     32.5000      5.1900
+    157.8000   1470.8600     32.5000      5.1800
+    157.9000   1470.8600     32.5000      5.1800
+    158.1000   1470.8500     32.5000      5.1800
+    158.3000   1470.8500     32.5000      5.1800
+    158.5000   1470.8500     32.5000      5.1700
+    158.6000   1470.8400     32.5000      5.1700
+    158.8000   1470.8300     32.5000      5.1700
+    159.0000   1470.8200     32.5000      5.1700
+    159.2000   1470.8100     32.5000      5.1600
+    159.3000   1470.7700     32.5000      5.1500
+    159.5000   1470.7500     32.5000      5.1500
+    159.7000   1470.7200     32.5000      5.1400
+    159.9000   1470.6900     32.5000      5.1300
+    160.0000   1470.6700     32.5000      5.1200
+    160.2000   1470.6500     32.5000      5.1200
+    160.4000   1470.6400     32.5000      5.1200
+    160.5000   1470.6400     32.5000      5.1200
+    160.7000   1470.6200     32.5000      5.1100
+    160.9000   1470.6100     32.5000      5.1100
+    161.1000   1470.6100     32.5000      5.1100
+    161.2000   1470.5900     32.5000      5.1000
+    161.4000   1470.5900     32.5000      5.1000
+    161.6000   1470.5800     32.5000      5.1000
+    161.8000   1470.5800     32.5000      5.1000
+    161.9000   1470.5600     32.5000      5.0900
+    162.1000   1470.5500     32.5000      5.0900
+    162.3000   1470.5100     32.5000      5.0800
+    162.4000   1470.4800     32.5000      5.0700
+    162.6000   1470.4600     32.5000      5.0600
+    162.8000   1470.4500     32.5000      5.0600
+    163.0000   1470.4500     32.5000      5.0600
+    163.1000   1470.4400     32.5000      5.0600
+    163.3000   1470.4300     32.5000      5.0500
+    163.5000   1470.4300     32.5000      5.0500
+    163.7000   1470.4400     32.5000      5.0500
+    163.8000   1470.4300     32.5000      5.0500
+    164.0000   1470.4200     32.5000      5.0500
+    164.2000   1470.4000     32.5000      5.0400
+    164.4000   1470.3900     32.5000      5.0400
+    164.5000   1470.3700     32.5000      5.0300
+    164.7000   1470.3500     32.5000      5.0300
+    164.9000   1470.3500     32.5000      5.0300
+    165.0000   1470.3300     32.5000      5.0200
+    165.2000   1470.3200     32.5000      5.0200
+    165.4000   1470.3200     32.5000      5.0200
+    165.6000   1470.3200     32.5000      5.0200
+    165.7000   1470.3100     32.5000      5.0100
+    165.9000   1470.2900     32.5000      5.0100
+    166.1000   1470.3000     32.5000      5.0100
+    166.3000   1470.3000     32.5000      5.0100
+    166.4000   1470.2800     32.5000      5.0000
+    166.6000   1470.2600     32.5000      5.0000
+    166.8000   1470.2400     32.5000      4.9900
+    166.9000   1470.2300     32.5000      4.9900
+    167.1000   1470.2100     32.5000      4.9900
+    167.3000   1470.2100     32.5000      4.9800
+    167.5000   1470.2100     32.5000      4.9800
+    167.6000   1470.2000     32.5000      4.9800
+    167.8000   1470.1900     32.5000      4.9800
+    168.0000   1470.1700     32.5000      4.9700
+    168.2000   1470.1700     32.5000      4.9700
+    168.3000   1470.1600     32.5000      4.9700
+    168.5000   1470.1500     32.5000      4.9700
+    168.7000   1470.1300     32.5000      4.9600
+    168.8000   1470.1300     32.5000      4.9600
+    169.0000   1470.1200     32.5000      4.9500
+    169.2000   1470.1000     32.5000      4.9500
+    169.4000   1470.0900     32.5000      4.9500
+    169.5000   1470.1000     32.5000      4.9500
+    169.7000   1470.0700     32.5000      4.9400
+    169.9000   1470.0500     32.5000      4.9400
+    170.1000   1470.0500     32.5000      4.9300
+    170.2000   1470.0500     32.5000      4.9300
+    170.4000   1470.0400     32.5000      4.9300
+    170.6000   1470.0200     32.5000      4.9300
+    170.7000   1470.0100     32.5000      4.9200
+    170.9000   1469.9900     32.5000      4.9200
+    171.1000   1469.9500     32.5000      4.9000
+    171.3000   1469.9200     32.5000      4.9000
+    171.4000   1469.9200     32.5000      4.9000
+    171.6000   1469.9100     32.5000      4.8900
+    171.8000   1469.9000     32.5000      4.8900
+    172.0000   1469.8900     32.5000      4.8900
+    172.1000   1469.8900     32.5000      4.8900
+    172.3000   1469.8800     32.5000      4.8800
+    172.5000   1469.8900     32.5000      4.8900
+    172.6000   1469.8900     32.5000      4.8900
+    172.8000   1469.8800     32.5000      4.8800
+    173.0000   1469.8700     32.5000      4.8800
+    173.2000   1469.8500     32.5000      4.8700
+    173.3000   1469.8400     32.5000      4.8700
+    173.5000   1469.8400     32.5000      4.8700
+    173.7000   1469.8600     32.5000      4.8700
+    173.9000   1469.8800     32.5000      4.8800
+    174.0000   1469.9100     32.5000      4.8800
+    174.2000   1469.9300     32.5000      4.8900
+    174.4000   1469.9400     32.5000      4.8900
+    174.5000   1469.9600     32.5000      4.9000
+    174.7000   1469.9800     32.5000      4.9000
+    174.9000   1470.0200     32.5000      4.9100
+    175.1000   1470.0900     32.5000      4.9200
+    175.2000   1470.2100     32.5000      4.9500
+    175.4000   1470.3300     32.5000      4.9800
+    175.6000   1470.4400     32.5000      5.0100
+    175.8000   1470.5400     32.5000      5.0300
+    175.9000   1470.6600     32.5000      5.0600
+    176.1000   1470.7600     32.5000      5.0800
+    176.3000   1470.8600     32.5000      5.1100
+    176.4000   1470.9400     32.5000      5.1300
+    176.6000   1471.0000     32.5000      5.1400
+    176.8000   1471.0300     32.5000      5.1500
+    177.0000   1471.0400     32.5000      5.1500
+    177.1000   1471.0500     32.5000      5.1500
+    177.3000   1471.0500     32.5000      5.1500
+    177.5000   1471.0100     32.5000      5.1400
+    177.7000   1470.9700     32.5000      5.1300
+    177.8000   1470.9300     32.5000      5.1200
+    178.0000   1470.8800     32.5000      5.1100
+    178.2000   1470.8100     32.5000      5.0900
+    178.3000   1470.7400     32.5000      5.0700
+    178.5000   1470.6200     32.5000      5.0400
+    178.7000   1470.5300     32.5000      5.0200
+    178.9000   1470.4700     32.5000      5.0000
+    179.0000   1470.4400     32.5000      4.9900
+    179.2000   1470.4100     32.5000      4.9800
+    179.4000   1470.3800     32.5000      4.9800
+    179.6000   1470.3500     32.5000      4.9700
+    179.7000   1470.3100     32.5000      4.9600
+    179.9000   1470.2900     32.5000      4.9500
+    180.1000   1470.2600     32.5000      4.9400
+    180.2000   1470.2300     32.5000      4.9400
+    180.4000   1470.2100     32.5000      4.9300
+    180.6000   1470.1800     32.5000      4.9200
+    180.8000   1470.1500     32.5000      4.9200
+    180.9000   1470.1300     32.5000      4.9100
+    181.1000   1470.1300     32.5000      4.9100
+    181.3000   1470.1300     32.5000      4.9100
+    181.5000   1470.1100     32.5000      4.9000
+    181.6000   1470.0900     32.5000      4.9000
+    181.8000   1470.0800     32.5000      4.8900
+    182.0000   1470.0900     32.5000      4.9000
+    182.1000   1470.0900     32.5000      4.9000
+    182.3000   1470.1400     32.5000      4.9100
+    182.5000   1470.1800     32.5000      4.9200
+    182.7000   1470.2400     32.5000      4.9300
+    182.8000   1470.3200     32.5000      4.9500
+    183.0000   1470.4000     32.5000      4.9700
+    183.2000   1470.4700     32.5000      4.9800
+    183.4000   1470.5300     32.5000      5.0000
+    183.5000   1470.5800     32.5000      5.0100
+    183.7000   1470.6100     32.5000      5.0200
+    183.9000   1470.6500     32.5000      5.0200
+    184.0000   1470.6800     32.5000      5.0300
+    184.2000   1470.7100     32.5000      5.0400
+    184.4000   1470.7300     32.5000      5.0400
+    184.6000   1470.7500     32.5000      5.0500
+    184.7000   1470.7800     32.5000      5.0500
+    184.9000   1470.7800     32.5000      5.0500
+    185.1000   1470.7800     32.5000      5.0500
+    185.2000   1470.7800     32.5000      5.0500
+    185.4000   1470.7700     32.5000      5.0500
+    185.6000   1470.7500     32.5000      5.0400
+    185.8000   1470.7400     32.5000      5.0400
+    185.9000   1470.7100     32.5000      5.0300
+    186.1000   1470.6900     32.5000      5.0300
+    186.3000   1470.6600     32.5000      5.0200
+    186.5000   1470.6500     32.5000      5.0100
+    186.6000   1470.6400     32.5000      5.0100
+    186.8000   1470.6100     32.5000      5.0000
+    187.0000   1470.5800     32.5000      5.0000
+    187.1000   1470.5600     32.5000      4.9900
+    187.3000   1470.5100     32.5000      4.9800
+    187.5000   1470.4400     32.5000      4.9600
+    187.7000   1470.4200     32.5000      4.9500
+    187.8000   1470.4000     32.5000      4.9500
+    188.0000   1470.3800     32.5000      4.9400
+    188.2000   1470.3600     32.5000      4.9400
+    188.3000   1470.3400     32.5000      4.9300
+    188.5000   1470.3300     32.5000      4.9300
+    188.7000   1470.3000     32.5000      4.9200
+    188.9000   1470.2900     32.5000      4.9200
+    189.0000   1470.2700     32.5000      4.9100
+    189.2000   1470.2500     32.5000      4.9100
+    189.4000   1470.2500     32.5000      4.9100
+    189.6000   1470.2400     32.5000      4.9000
+    189.7000   1470.2000     32.5000      4.8900
+    189.9000   1470.1700     32.5000      4.8800
+    190.1000   1470.1600     32.5000      4.8800
+    190.2000   1470.1500     32.5000      4.8800
+    190.4000   1470.1400     32.5000      4.8700
+    190.6000   1470.1300     32.5000      4.8700
+    190.8000   1470.1200     32.5000      4.8700
+    190.9000   1470.1100     32.5000      4.8700
+    191.1000   1470.0800     32.5000      4.8600
+    191.3000   1470.0700     32.5000      4.8500
+    191.5000   1470.0400     32.5000      4.8500
+    191.6000   1470.0000     32.5000      4.8400
+    191.8000   1469.9900     32.5000      4.8300
+    192.0000   1469.9900     32.5000      4.8300
+    192.1000   1469.9800     32.5000      4.8300
+    192.3000   1469.9800     32.5000      4.8300
+    192.5000   1469.9700     32.5000      4.8300
+    192.7000   1469.9700     32.5000      4.8200
+    192.8000   1470.0000     32.5000      4.8300
+    193.0000   1470.1700     32.5000      4.8700
+    193.2000   1470.2100     32.5000      4.8800
+    193.3000   1470.2500     32.5000      4.8900
+    193.5000   1470.3500     32.5000      4.9100
+    193.7000   1470.4700     32.5000      4.9400
+    193.9000   1470.5800     32.5000      4.9700
+    194.0000   1470.6700     32.5000      4.9900
+    194.2000   1470.7300     32.5000      5.0000
+    194.4000   1470.7600     32.5000      5.0100
+    194.5000   1470.8000     32.5000      5.0200
+    194.7000   1470.8100     32.5000      5.0200
+    194.9000   1470.7900     32.5000      5.0200
+    195.1000   1470.7900     32.5000      5.0100
+    195.2000   1470.7700     32.5000      5.0100
+    195.4000   1470.7400     32.5000      5.0000
+    195.6000   1470.7100     32.5000      4.9900
+    195.8000   1470.6700     32.5000      4.9800
+    195.9000   1470.6600     32.5000      4.9800
+    196.1000   1470.6300     32.5000      4.9700
+    196.3000   1470.6100     32.5000      4.9700
+    196.4000   1470.5700     32.5000      4.9600
+    196.6000   1470.5400     32.5000      4.9500
+    196.8000   1470.5200     32.5000      4.9400
+    197.0000   1470.4900     32.5000      4.9300
+    197.1000   1470.4500     32.5000      4.9200
+    197.3000   1470.4200     32.5000      4.9100
+    197.5000   1470.3900     32.5000      4.9100
+    197.6000   1470.3500     32.5000      4.9000
+    197.8000   1470.3200     32.5000      4.8900
+    198.0000   1470.2900     32.5000      4.8800
+    198.2000   1470.2800     32.5000      4.8800
+    198.3000   1470.2500     32.5000      4.8700
+    198.5000   1470.2200     32.5000      4.8600
+    198.7000   1470.2100     32.5000      4.8600
+    198.9000   1470.1900     32.5000      4.8500
+    199.0000   1470.1800     32.5000      4.8500
+    199.2000   1470.1400     32.5000      4.8400
+    199.4000   1470.1400     32.5000      4.8400
+    199.5000   1470.1200     32.5000      4.8300
+    199.7000   1470.1000     32.5000      4.8300
+    199.9000   1470.0800     32.5000      4.8200
+    200.1000   1470.0700     32.5000      4.8200
+    200.2000   1470.0400     32.5000      4.8100
+    200.4000   1470.0300     32.5000      4.8100
+    200.6000   1470.0100     32.5000      4.8000
+    200.7000   1470.0000     32.5000      4.8000
+    200.9000   1469.9900     32.5000      4.8000
+    201.1000   1469.9600     32.5000      4.7900
+    201.3000   1469.9600     32.5000      4.7900
+    201.4000   1469.9500     32.5000      4.7900
+    201.6000   1469.9300     32.5000      4.7800
+    201.8000   1469.9300     32.5000      4.7800
+    201.9000   1469.9200     32.5000      4.7700
+    202.1000   1469.9100     32.5000      4.7700
+    202.3000   1469.9100     32.5000      4.7700
+    202.5000   1469.8900     32.5000      4.7600
+    202.6000   1469.8600     32.5000      4.7600
+    202.8000   1469.8400     32.5000      4.7500
+    203.0000   1469.8400     32.5000      4.7500
+    203.1000   1469.8400     32.5000      4.7500
+    203.3000   1469.8300     32.5000      4.7500
+    203.5000   1469.8000     32.5000      4.7400
+    203.7000   1469.7800     32.5000      4.7300
+    203.8000   1469.7500     32.5000      4.7300
+    204.0000   1469.6900     32.5000      4.7100
+    204.2000   1469.6300     32.5000      4.7000
+    204.4000   1469.6100     32.5000      4.6900
+    204.5000   1469.5900     32.5000      4.6900
+    204.7000   1469.5900     32.5000      4.6800
+    204.9000   1469.5700     32.5000      4.6800
+    205.0000   1469.5600     32.5000      4.6700
+    205.2000   1469.5700     32.5000      4.6800
+    205.4000   1469.5700     32.5000      4.6800
+    205.6000   1469.5600     32.5000      4.6700
+    205.7000   1469.5400     32.5000      4.6700
+    205.9000   1469.5400     32.5000      4.6700
+    206.1000   1469.5200     32.5000      4.6600
+    206.2000   1469.5100     32.5000      4.6600
+    206.4000   1469.5100     32.5000      4.6600
+    206.6000   1469.5200     32.5000      4.6600
+    206.8000   1469.5300     32.5000      4.6600
+    206.9000   1469.5200     32.5000      4.6600
+    207.1000   1469.5100     32.5000      4.6500
+    207.3000   1469.5000     32.5000      4.6500
+    207.4000   1469.4900     32.5000      4.6500
+    207.6000   1469.4900     32.5000      4.6500
+    207.8000   1469.4900     32.5000      4.6500
+    208.0000   1469.4800     32.5000      4.6400
+    208.1000   1469.4800     32.5000      4.6400
+    208.3000   1469.4700     32.5000      4.6400
+    208.5000   1469.4400     32.5000      4.6300
+    208.6000   1469.4300     32.5000      4.6300
+    208.8000   1469.4300     32.5000      4.6300
+    209.0000   1469.4100     32.5000      4.6200
+    209.2000   1469.4100     32.5000      4.6200
+    209.3000   1469.4000     32.5000      4.6200
+    209.5000   1469.3800     32.5000      4.6100
+    209.7000   1469.3700     32.5000      4.6100
+    209.8000   1469.3600     32.5000      4.6100
+    210.0000   1469.3400     32.5000      4.6000
+    210.2000   1469.3200     32.5000      4.6000
+    210.4000   1469.3200     32.5000      4.6000
+    210.5000   1469.3000     32.5000      4.5900
+    210.7000   1469.2900     32.5000      4.5900
+    210.9000   1469.2800     32.5000      4.5800
+    211.0000   1469.2800     32.5000      4.5800
+    211.2000   1469.2800     32.5000      4.5800
+    211.4000   1469.2600     32.5000      4.5800
+    211.6000   1469.2300     32.5000      4.5700
+    211.7000   1469.2100     32.5000      4.5600
+    211.9000   1469.1900     32.5000      4.5600
+    212.1000   1469.2000     32.5000      4.5600
+    212.3000   1469.1900     32.5000      4.5600
+    212.4000   1469.1800     32.5000      4.5600
+    212.6000   1469.1800     32.5000      4.5500
+    212.8000   1469.1600     32.5000      4.5500
+    212.9000   1469.1400     32.5000      4.5400
+    213.1000   1469.1500     32.5000      4.5400
+    213.3000   1469.1900     32.5000      4.5500
+    213.5000   1469.2300     32.5000      4.5600
+    213.6000   1469.2300     32.5000      4.5600
+    213.8000   1469.2400     32.5000      4.5600
+    214.0000   1469.2500     32.5000      4.5700
+    214.1000   1469.2600     32.5000      4.5700
+    214.3000   1469.2600     32.5000      4.5700
+    214.5000   1469.2500     32.5000      4.5600
+    214.7000   1469.2700     32.5000      4.5700
+    214.8000   1469.2700     32.5000      4.5700
+    215.0000   1469.2700     32.5000      4.5700
+    215.2000   1469.2400     32.5000      4.5600
+    215.3000   1469.2400     32.5000      4.5600
+    215.5000   1469.2300     32.5000      4.5500
+    215.7000   1469.2200     32.5000      4.5500
+    215.9000   1469.2100     32.5000      4.5500
+    216.0000   1469.1900     32.5000      4.5400
+    216.2000   1469.1900     32.5000      4.5400
+    216.4000   1469.1900     32.5000      4.5400
+    216.5000   1469.1800     32.5000      4.5400
+    216.7000   1469.1600     32.5000      4.5300
+    216.9000   1469.1500     32.5000      4.5300
+    217.1000   1469.1400     32.5000      4.5300
+    217.2000   1469.1200     32.5000      4.5200
+    217.4000   1469.1100     32.5000      4.5200
+    217.6000   1469.1000     32.5000      4.5200
+    217.7000   1469.0700     32.5000      4.5100
+    217.9000   1469.0700     32.5000      4.5100
+    218.1000   1469.0600     32.5000      4.5000
+    218.3000   1469.0200     32.5000      4.4900
+    218.4000   1469.0100     32.5000      4.4900
+    218.6000   1468.9900     32.5000      4.4900
+    218.8000   1468.9700     32.5000      4.4800
+    218.9000   1468.9600     32.5000      4.4800
+    219.1000   1468.9500     32.5000      4.4700
+    219.3000   1468.9500     32.5000      4.4700
+    219.5000   1468.9400     32.5000      4.4700
+    219.6000   1468.9300     32.5000      4.4700
+    219.8000   1468.9300     32.5000      4.4600
+    220.0000   1468.9200     32.5000      4.4600
+    220.1000   1468.9100     32.5000      4.4600
+    220.3000   1468.9000     32.5000      4.4500
+    220.5000   1468.8900     32.5000      4.4500
+    220.7000   1468.8700     32.5000      4.4500
+    220.8000   1468.8700     32.5000      4.4500
+    221.0000   1468.8600     32.5000      4.4400
+    221.2000   1468.8600     32.5000      4.4400
+    221.3000   1468.8400     32.5000      4.4400
+    221.5000   1468.8100     32.5000      4.4300
+    221.7000   1468.7900     32.5000      4.4200
+    221.9000   1468.7800     32.5000      4.4200
+    222.0000   1468.7600     32.5000      4.4200
+    222.2000   1468.7600     32.5000      4.4100
+    222.4000   1468.7400     32.5000      4.4100
+    222.5000   1468.7200     32.5000      4.4000
+    222.7000   1468.7300     32.5000      4.4000
+    222.9000   1468.7100     32.5000      4.4000
+    223.1000   1468.7000     32.5000      4.4000
+    223.2000   1468.6800     32.5000      4.3900
+    223.4000   1468.6700     32.5000      4.3900
+    223.6000   1468.6600     32.5000      4.3900
+    223.7000   1468.6600     32.5000      4.3800
+    223.9000   1468.6700     32.5000      4.3900
+    224.1000   1468.6500     32.5000      4.3800
+    224.2000   1468.6300     32.5000      4.3700
+    224.4000   1468.6200     32.5000      4.3700
+    224.6000   1468.6200     32.5000      4.3700
+    224.8000   1468.6000     32.5000      4.3700
+    224.9000   1468.5800     32.5000      4.3600
+    225.1000   1468.5800     32.5000      4.3600
+    225.3000   1468.5800     32.5000      4.3600
+    225.4000   1468.5600     32.5000      4.3500
+    225.6000   1468.5600     32.5000      4.3500
+    225.8000   1468.5700     32.5000      4.3500
+    226.0000   1468.5600     32.5000      4.3500
+    226.1000   1468.5600     32.5000      4.3500
+    226.3000   1468.5500     32.5000      4.3500
+    226.5000   1468.5500     32.5000      4.3500
+    226.6000   1468.5500     32.5000      4.3500
+    226.8000   1468.5400     32.5000      4.3400
+    227.0000   1468.5400     32.5000      4.3400
+    227.2000   1468.5400     32.5000      4.3400
+    227.3000   1468.5300     32.5000      4.3400
+    227.5000   1468.5100     32.5000      4.3300
+    227.7000   1468.5200     32.5000      4.3300
+    227.8000   1468.5100     32.5000      4.3300
+    228.0000   1468.5000     32.5000      4.3300
+    228.2000   1468.4900     32.5000      4.3300
+    228.4000   1468.5000     32.5000      4.3300
+    228.5000   1468.4900     32.5000      4.3300
+    228.7000   1468.4900     32.5000      4.3200
+    228.9000   1468.4900     32.5000      4.3200
+    229.0000   1468.4900     32.5000      4.3200
+    229.2000   1468.4900     32.5000      4.3200
+    229.4000   1468.4900     32.5000      4.3200
+    229.6000   1468.4800     32.5000      4.3200
+    229.7000   1468.4800     32.5000      4.3200
+    229.9000   1468.4800     32.5000      4.3200
+    230.1000   1468.4900     32.5000      4.3200
+    230.2000   1468.4900     32.5000      4.3200
+    230.4000   1468.4800     32.5000      4.3100
+    230.6000   1468.4800     32.5000      4.3100
+    230.8000   1468.4600     32.5000      4.3100
+    230.9000   1468.4500     32.5000      4.3100
+    231.1000   1468.4400     32.5000      4.3000
+    231.3000   1468.4300     32.5000      4.3000
+    231.4000   1468.4200     32.5000      4.3000
+    231.6000   1468.4100     32.5000      4.2900
+    231.8000   1468.4200     32.5000      4.3000
+    232.0000   1468.4000     32.5000      4.2900
+    232.1000   1468.3800     32.5000      4.2800
+    232.3000   1468.3700     32.5000      4.2800
+    232.5000   1468.3500     32.5000      4.2800
+    232.6000   1468.3500     32.5000      4.2700
+    232.8000   1468.3300     32.5000      4.2700
+    233.0000   1468.3300     32.5000      4.2700
+    233.1000   1468.3300     32.5000      4.2700
+    233.3000   1468.3400     32.5000      4.2700
+    233.5000   1468.3400     32.5000      4.2700
+    233.7000   1468.3300     32.5000      4.2700
+    233.8000   1468.3300     32.5000      4.2700
+    234.0000   1468.3300     32.5000      4.2700
+    234.2000   1468.3300     32.5000      4.2600
+    234.3000   1468.3300     32.5000      4.2600
+    234.5000   1468.3300     32.5000      4.2600
+    234.7000   1468.3400     32.5000      4.2600
+    234.9000   1468.3500     32.5000      4.2700
+    235.0000   1468.3500     32.5000      4.2700
+    235.2000   1468.3600     32.5000      4.2700
+    235.4000   1468.3600     32.5000      4.2700
+    235.5000   1468.3400     32.5000      4.2600
+    235.7000   1468.3400     32.5000      4.2600
+    235.9000   1468.3100     32.5000      4.2500
+    236.1000   1468.2900     32.5000      4.2500
+    236.2000   1468.2800     32.5000      4.2400
+    236.4000   1468.2900     32.5000      4.2500
+    236.6000   1468.2700     32.5000      4.2400
+    236.7000   1468.2700     32.5000      4.2400
+    236.9000   1468.2600     32.5000      4.2400
+    237.1000   1468.2500     32.5000      4.2300
+    237.2000   1468.2300     32.5000      4.2300
+    237.4000   1468.2200     32.5000      4.2200
+    237.6000   1468.2200     32.5000      4.2300
+    237.8000   1468.2300     32.5000      4.2300
+    237.9000   1468.2300     32.5000      4.2300
+    238.1000   1468.2200     32.5000      4.2200
+    238.3000   1468.2000     32.5000      4.2200
+    238.4000   1468.1900     32.5000      4.2100
+    238.6000   1468.1900     32.5000      4.2100
+    238.8000   1468.1800     32.5000      4.2100
+    239.0000   1468.1700     32.5000      4.2100
+    239.1000   1468.1700     32.5000      4.2100
+    239.3000   1468.1600     32.5000      4.2000
+    239.5000   1468.1400     32.5000      4.2000
+    239.6000   1468.1500     32.5000      4.2000
+    239.8000   1468.1500     32.5000      4.2000
+    240.0000   1468.1500     32.5000      4.2000
+    240.2000   1468.1600     32.5000      4.2000
+    240.3000   1468.1400     32.5000      4.1900
+    240.5000   1468.1400     32.5000      4.1900
+    240.7000   1468.1400     32.5000      4.1900
+    240.8000   1468.1400     32.5000      4.1900
+    241.0000   1468.1300     32.5000      4.1900
+    241.2000   1468.1400     32.5000      4.1900
+    241.3000   1468.1300     32.5000      4.1900
+    241.5000   1468.1200     32.5000      4.1900
+    241.7000   1468.1200     32.5000      4.1900
+    241.9000   1468.1300     32.5000      4.1900
+    242.0000   1468.1200     32.5000      4.1800
+    242.2000   1468.1100     32.5000      4.1800
+    242.4000   1468.1200     32.5000      4.1800
+    242.5000   1468.1100     32.5000      4.1800
+    242.7000   1468.1000     32.5000      4.1800
+    242.9000   1468.1000     32.5000      4.1700
+    243.1000   1468.0900     32.5000      4.1700
+    243.2000   1468.0700     32.5000      4.1700
+    243.4000   1468.0500     32.5000      4.1600
+    243.6000   1468.0600     32.5000      4.1600
+    243.7000   1468.0600     32.5000      4.1600
+    243.9000   1468.0500     32.5000      4.1600
+    244.1000   1468.0500     32.5000      4.1600
+    244.2000   1468.0500     32.5000      4.1600
+    244.4000   1468.0500     32.5000      4.1600
+    244.6000   1468.0500     32.5000      4.1600
+    244.8000   1468.0500     32.5000      4.1600
+    244.9000   1468.0800     32.5000      4.1600
+    245.1000   1468.0800     32.5000      4.1600
+    245.3000   1468.0700     32.5000      4.1600
+    245.4000   1468.0700     32.5000      4.1600
+    245.6000   1468.0600     32.5000      4.1600
+    245.8000   1468.0600     32.5000      4.1500
+    246.0000   1468.0500     32.5000      4.1500
+    246.1000   1468.0500     32.5000      4.1500
+    246.3000   1468.0300     32.5000      4.1500
+    246.5000   1468.0100     32.5000      4.1400
+    246.6000   1468.0000     32.5000      4.1400
+    246.8000   1467.9700     32.5000      4.1300
+    247.0000   1467.9500     32.5000      4.1200
+    247.1000   1467.9500     32.5000      4.1200
+    247.3000   1467.9500     32.5000      4.1200
+    247.5000   1467.9300     32.5000      4.1200
+    247.7000   1467.9400     32.5000      4.1200
+    247.8000   1467.9500     32.5000      4.1200
+    248.0000   1467.9500     32.5000      4.1200
+    248.2000   1467.9300     32.5000      4.1100
+    248.3000   1467.9100     32.5000      4.1100
+    248.5000   1467.9100     32.5000      4.1100
+    248.7000   1467.8900     32.5000      4.1000
+    248.9000   1467.8900     32.5000      4.1000
+    249.0000   1467.8900     32.5000      4.1000
+    249.2000   1467.8900     32.5000      4.1000
+    249.4000   1467.8900     32.5000      4.1000
+    249.5000   1467.8800     32.5000      4.1000
+    249.7000   1467.8800     32.5000      4.0900
+    249.9000   1467.8800     32.5000      4.1000
+    250.0000   1467.8600     32.5000      4.0900
+    250.2000   1467.8500     32.5000      4.0900
+    250.4000   1467.8400     32.5000      4.0800
+    250.6000   1467.8500     32.5000      4.0900
+    250.7000   1467.8500     32.5000      4.0800
+    250.9000   1467.8500     32.5000      4.0800
+    251.1000   1467.8400     32.5000      4.0800
+    251.2000   1467.8300     32.5000      4.0800
+    251.4000   1467.8200     32.5000      4.0700
+    251.6000   1467.8200     32.5000      4.0700
+    251.8000   1467.8100     32.5000      4.0700
+    251.9000   1467.8000     32.5000      4.0700
+    252.1000   1467.8000     32.5000      4.0700
+    252.3000   1467.8100     32.5000      4.0700
+    252.4000   1467.8100     32.5000      4.0700
+    252.6000   1467.8100     32.5000      4.0700
+    252.8000   1467.8100     32.5000      4.0700
+    252.9000   1467.8100     32.5000      4.0700
+    253.1000   1467.8200     32.5000      4.0700
+    253.3000   1467.8100     32.5000      4.0700
+    253.5000   1467.8100     32.5000      4.0600
+    253.6000   1467.8000     32.5000      4.0600
+    253.8000   1467.7900     32.5000      4.0600
+    254.0000   1467.7800     32.5000      4.0600
+    254.1000   1467.7800     32.5000      4.0500
+    254.3000   1467.7700     32.5000      4.0500
+    254.5000   1467.7600     32.5000      4.0500
+    254.6000   1467.7300     32.5000      4.0400
+    254.8000   1467.7200     32.5000      4.0400
+    255.0000   1467.7100     32.5000      4.0400
+    255.2000   1467.7000     32.5000      4.0300
+    255.3000   1467.6900     32.5000      4.0300
+    255.5000   1467.6800     32.5000      4.0300
+    255.7000   1467.6800     32.5000      4.0200
+    255.8000   1467.6600     32.5000      4.0200
+    256.0000   1467.6500     32.5000      4.0200
+    256.2000   1467.6400     32.5000      4.0100
+    256.4000   1467.6400     32.5000      4.0100
+    256.5000   1467.6500     32.5000      4.0100
+    256.7000   1467.6400     32.5000      4.0100
+    256.9000   1467.6500     32.5000      4.0100
+    257.0000   1467.6500     32.5000      4.0100
+    257.2000   1467.6600     32.5000      4.0100
+    257.4000   1467.6600     32.5000      4.0100
+    257.5000   1467.6600     32.5000      4.0100
+    257.7000   1467.6700     32.5000      4.0100
+    257.9000   1467.6600     32.5000      4.0100
+    258.1000   1467.6600     32.5000      4.0100
+    258.2000   1467.6800     32.5000      4.0100
+    258.4000   1467.6700     32.5000      4.0100
+    258.6000   1467.6500     32.5000      4.0100
+    258.7000   1467.6200     32.5000      4.0000
+    258.9000   1467.6000     32.5000      3.9900
+    259.1000   1467.5900     32.5000      3.9900
+    259.2000   1467.5700     32.5000      3.9900
+    259.4000   1467.5600     32.5000      3.9800
+    259.6000   1467.5500     32.5000      3.9800
+    259.8000   1467.5400     32.5000      3.9800
+    259.9000   1467.5400     32.5000      3.9700
+    260.1000   1467.5400     32.5000      3.9700
+    260.3000   1467.5300     32.5000      3.9700
+    260.4000   1467.5400     32.5000      3.9700
+    260.6000   1467.5300     32.5000      3.9700
+    260.8000   1467.5400     32.5000      3.9700
+    260.9000   1467.5200     32.5000      3.9700
+    261.1000   1467.5200     32.5000      3.9600
+    261.3000   1467.5100     32.5000      3.9600
+    261.5000   1467.5100     32.5000      3.9600
+    261.6000   1467.5100     32.5000      3.9600
+    261.8000   1467.5200     32.5000      3.9600
+    262.0000   1467.5100     32.5000      3.9600
+    262.1000   1467.5200     32.5000      3.9600
+    262.3000   1467.5400     32.5000      3.9700
+    262.5000   1467.5400     32.5000      3.9700
+    262.6000   1467.5300     32.5000      3.9600
+    262.8000   1467.5300     32.5000      3.9600
+    263.0000   1467.5200     32.5000      3.9600
+    263.2000   1467.5200     32.5000      3.9600
+    263.3000   1467.5200     32.5000      3.9600
+    263.5000   1467.5100     32.5000      3.9500
+    263.7000   1467.5100     32.5000      3.9500
+    263.8000   1467.5000     32.5000      3.9500
+    264.0000   1467.4800     32.5000      3.9400
+    264.2000   1467.4800     32.5000      3.9400
+    264.3000   1467.4900     32.5000      3.9400
+    264.5000   1467.4900     32.5000      3.9500
+    264.7000   1467.5000     32.5000      3.9500
+    264.9000   1467.5100     32.5000      3.9500
+    265.0000   1467.5000     32.5000      3.9500
+    265.2000   1467.5000     32.5000      3.9400
+    265.4000   1467.5000     32.5000      3.9400
+    265.5000   1467.4900     32.5000      3.9400
+    265.7000   1467.4700     32.5000      3.9400
+    265.9000   1467.4700     32.5000      3.9300
+    266.0000   1467.4700     32.5000      3.9300
+    266.2000   1467.4500     32.5000      3.9300
+    266.4000   1467.4500     32.5000      3.9300
+    266.6000   1467.4400     32.5000      3.9300
+    266.7000   1467.4400     32.5000      3.9200
+    266.9000   1467.4400     32.5000      3.9200
+    267.1000   1467.4300     32.5000      3.9200
+    267.2000   1467.4300     32.5000      3.9200
+    267.4000   1467.4200     32.5000      3.9200
+    267.6000   1467.4100     32.5000      3.9100
+    267.7000   1467.4100     32.5000      3.9100
+    267.9000   1467.4000     32.5000      3.9100
+    268.1000   1467.4000     32.5000      3.9100
+    268.3000   1467.4100     32.5000      3.9100
+    268.4000   1467.4000     32.5000      3.9100
+    268.6000   1467.3900     32.5000      3.9000
+    268.8000   1467.3800     32.5000      3.9000
+    268.9000   1467.3800     32.5000      3.9000
+    269.1000   1467.3700     32.5000      3.9000
+    269.3000   1467.3700     32.5000      3.9000
+    269.4000   1467.3700     32.5000      3.9000
+    269.6000   1467.3400     32.5000      3.8900
+    269.8000   1467.3300     32.5000      3.8900
+    270.0000   1467.3000     32.5000      3.8800
+    270.1000   1467.2700     32.5000      3.8700
+    270.3000   1467.2600     32.5000      3.8700
+    270.5000   1467.2400     32.5000      3.8600
+    270.6000   1467.2200     32.5000      3.8600
+    270.8000   1467.2200     32.5000      3.8600
+    271.0000   1467.2100     32.5000      3.8500
+    271.1000   1467.2100     32.5000      3.8500
+    271.3000   1467.2000     32.5000      3.8500
+    271.5000   1467.2000     32.5000      3.8500
+    271.7000   1467.1800     32.5000      3.8400
+    271.8000   1467.1800     32.5000      3.8400
+    272.0000   1467.1900     32.5000      3.8400
+    272.2000   1467.2000     32.5000      3.8500
+    272.3000   1467.2100     32.5000      3.8500
+    272.5000   1467.2100     32.5000      3.8500
+    272.7000   1467.2100     32.5000      3.8500
+    272.8000   1467.2100     32.5000      3.8500
+    273.0000   1467.2100     32.5000      3.8500
+    273.2000   1467.2000     32.5000      3.8400
+    273.4000   1467.2100     32.5000      3.8400
+    273.5000   1467.2100     32.5000      3.8400
+    273.7000   1467.2100     32.5000      3.8400
+    273.9000   1467.2200     32.5000      3.8400
+    274.0000   1467.2300     32.5000      3.8500
+    274.2000   1467.2200     32.5000      3.8400
+    274.4000   1467.2300     32.5000      3.8500
+    274.5000   1467.2300     32.5000      3.8400
+    274.7000   1467.2300     32.5000      3.8400
+    274.9000   1467.2200     32.5000      3.8400
+    275.1000   1467.2200     32.5000      3.8400
+    275.2000   1467.2200     32.5000      3.8400
+    275.4000   1467.2200     32.5000      3.8400
+    275.6000   1467.2300     32.5000      3.8400
+    275.7000   1467.2200     32.5000      3.8400
+    275.9000   1467.2100     32.5000      3.8400
+    276.1000   1467.2100     32.5000      3.8300
+    276.2000   1467.2200     32.5000      3.8400
+    276.4000   1467.2200     32.5000      3.8300
+    276.6000   1467.2100     32.5000      3.8300
+    276.7000   1467.2100     32.5000      3.8300
+    276.9000   1467.2100     32.5000      3.8300
+    277.1000   1467.2200     32.5000      3.8300
+    277.3000   1467.2200     32.5000      3.8300
+    277.4000   1467.2200     32.5000      3.8300
+    277.6000   1467.2200     32.5000      3.8300
+    277.8000   1467.2300     32.5000      3.8300
+    277.9000   1467.2200     32.5000      3.8300
+    278.1000   1467.2200     32.5000      3.8300
+    278.3000   1467.2200     32.5000      3.8300
+    278.4000   1467.2200     32.5000      3.8300
+    278.6000   1467.2300     32.5000      3.8300
+    278.8000   1467.2400     32.5000      3.8300
+    279.0000   1467.2300     32.5000      3.8300
+    279.1000   1467.2500     32.5000      3.8300
+    279.3000   1467.2700     32.5000      3.8400
+    279.5000   1467.2900     32.5000      3.8400
+    279.6000   1467.2900     32.5000      3.8400
+    279.8000   1467.2900     32.5000      3.8400
+    280.0000   1467.3100     32.5000      3.8400
+    280.1000   1467.3200     32.5000      3.8400
+    280.3000   1467.3100     32.5000      3.8400
+    280.5000   1467.3100     32.5000      3.8400
+    280.6000   1467.3300     32.5000      3.8400
+    280.8000   1467.3300     32.5000      3.8400
+    281.0000   1467.3300     32.5000      3.8400
+    281.2000   1467.3600     32.5000      3.8500
+    281.3000   1467.3900     32.5000      3.8600
+    281.5000   1467.4200     32.5000      3.8600
+    281.7000   1467.4500     32.5000      3.8700
+    281.8000   1467.4600     32.5000      3.8700
+    282.0000   1467.4600     32.5000      3.8700
+    282.2000   1467.4700     32.5000      3.8700
+    282.3000   1467.4800     32.5000      3.8700
+    282.5000   1467.5000     32.5000      3.8800
+    282.7000   1467.5000     32.5000      3.8800
+    282.9000   1467.4900     32.5000      3.8700
+    283.0000   1467.4800     32.5000      3.8700
+    283.2000   1467.4700     32.5000      3.8700
+    283.4000   1467.4700     32.5000      3.8700
+    283.5000   1467.4500     32.5000      3.8600
+    283.7000   1467.4300     32.5000      3.8600
+    283.9000   1467.4200     32.5000      3.8500
+    284.0000   1467.4100     32.5000      3.8500
+    284.2000   1467.4100     32.5000      3.8500
+    284.4000   1467.4000     32.5000      3.8500
+    284.5000   1467.4000     32.5000      3.8500
+    284.7000   1467.3800     32.5000      3.8400
+    284.9000   1467.3500     32.5000      3.8300
+    285.1000   1467.3400     32.5000      3.8300
+    285.2000   1467.3300     32.5000      3.8300
+    285.4000   1467.3200     32.5000      3.8200
+    285.6000   1467.3100     32.5000      3.8200
+    285.7000   1467.2900     32.5000      3.8200
+    285.9000   1467.2900     32.5000      3.8100
+    286.1000   1467.2800     32.5000      3.8100
+    286.2000   1467.2700     32.5000      3.8100
+    286.4000   1467.2600     32.5000      3.8000
+    286.6000   1467.2400     32.5000      3.8000
+    286.7000   1467.2300     32.5000      3.8000
+    286.9000   1467.2200     32.5000      3.7900
+    287.1000   1467.2100     32.5000      3.7900
+    287.3000   1467.2000     32.5000      3.7900
+    287.4000   1467.1900     32.5000      3.7800
+    287.6000   1467.1800     32.5000      3.7800
+    287.8000   1467.1800     32.5000      3.7800
+    287.9000   1467.1600     32.5000      3.7800
+    288.1000   1467.1400     32.5000      3.7700
+    288.3000   1467.1200     32.5000      3.7700
+    288.4000   1467.1100     32.5000      3.7600
+    288.6000   1467.0900     32.5000      3.7600
+    288.8000   1467.0600     32.5000      3.7500
+    289.0000   1467.0700     32.5000      3.7500
+    289.1000   1467.0600     32.5000      3.7500
+    289.3000   1467.0400     32.5000      3.7400
+    289.5000   1467.0300     32.5000      3.7400
+    289.6000   1467.0300     32.5000      3.7400
+    289.8000   1467.0200     32.5000      3.7300
+    290.0000   1467.0300     32.5000      3.7400
+    290.1000   1467.0200     32.5000      3.7300
+    290.3000   1467.0200     32.5000      3.7300
+    290.5000   1467.0400     32.5000      3.7400
+    290.6000   1467.0400     32.5000      3.7400
+    290.8000   1467.0400     32.5000      3.7400
+    291.0000   1467.0500     32.5000      3.7400
+    291.2000   1467.0400     32.5000      3.7400
+    291.3000   1467.0300     32.5000      3.7300
+    291.5000   1467.0400     32.5000      3.7300
+    291.7000   1467.0400     32.5000      3.7300
+    291.8000   1467.0400     32.5000      3.7300
+    292.0000   1467.0600     32.5000      3.7400
+    292.2000   1467.0300     32.5000      3.7300
+    292.3000   1467.0400     32.5000      3.7300
+    292.5000   1467.0400     32.5000      3.7300
+    292.7000   1467.0300     32.5000      3.7300
+    292.8000   1467.0200     32.5000      3.7200
+    293.0000   1467.0200     32.5000      3.7200
+    293.2000   1467.0100     32.5000      3.7200
+    293.4000   1466.9900     32.5000      3.7100
+    293.5000   1466.9600     32.5000      3.7100
+    293.7000   1466.9300     32.5000      3.7000
+    293.9000   1466.9100     32.5000      3.6900
+    294.0000   1466.8900     32.5000      3.6900
+    294.2000   1466.8900     32.5000      3.6900
+    294.4000   1466.8700     32.5000      3.6800
+    294.5000   1466.8600     32.5000      3.6800
+    294.7000   1466.8400     32.5000      3.6700
+    294.9000   1466.8200     32.5000      3.6700
+    295.0000   1466.7900     32.5000      3.6600
+    295.2000   1466.7800     32.5000      3.6600
+    295.4000   1466.7500     32.5000      3.6500
+    295.5000   1466.7400     32.5000      3.6500
+    295.7000   1466.7200     32.5000      3.6400
+    295.9000   1466.7100     32.5000      3.6400
+    296.1000   1466.7000     32.5000      3.6400
+    296.2000   1466.6900     32.5000      3.6300
+    296.4000   1466.6900     32.5000      3.6300
+    296.6000   1466.6900     32.5000      3.6300
+    296.7000   1466.6800     32.5000      3.6300
+    296.9000   1466.6800     32.5000      3.6300
+    297.1000   1466.6700     32.5000      3.6200
+    297.2000   1466.6500     32.5000      3.6200
+    297.4000   1466.6400     32.5000      3.6100
+    297.6000   1466.6200     32.5000      3.6100
+    297.7000   1466.6100     32.5000      3.6100
+    297.9000   1466.6000     32.5000      3.6000
+    298.1000   1466.6000     32.5000      3.6000
+    298.3000   1466.5900     32.5000      3.6000
+    298.4000   1466.5900     32.5000      3.6000
+    298.6000   1466.5900     32.5000      3.6000
+    298.8000   1466.5800     32.5000      3.6000
+    298.9000   1466.5800     32.5000      3.5900
+    299.1000   1466.5700     32.5000      3.5900
+    299.3000   1466.5900     32.5000      3.6000
+    299.4000   1466.6000     32.5000      3.6000
+    299.6000   1466.6000     32.5000      3.6000
+    299.8000   1466.6000     32.5000      3.6000
+    299.9000   1466.6100     32.5000      3.6000
+    300.1000   1466.6100     32.5000      3.6000
+    300.3000   1466.6000     32.5000      3.6000
+    300.5000   1466.5800     32.5000      3.5900
+    300.6000   1466.5500     32.5000      3.5800
+    300.8000   1466.5300     32.5000      3.5800
+    301.0000   1466.5000     32.5000      3.5700
+    301.1000   1466.4900     32.5000      3.5700
+    301.3000   1466.4800     32.5000      3.5600
+    301.5000   1466.4600     32.5000      3.5600
+    301.6000   1466.4500     32.5000      3.5500
+    301.8000   1466.4400     32.5000      3.5500
+    302.0000   1466.4200     32.5000      3.5500
+    302.1000   1466.4000     32.5000      3.5400
+    302.3000   1466.3700     32.5000      3.5300
+    302.5000   1466.3500     32.5000      3.5300
+    302.6000   1466.3600     32.5000      3.5300
+    302.8000   1466.3600     32.5000      3.5300
+    303.0000   1466.3600     32.5000      3.5300
+    303.2000   1466.3700     32.5000      3.5300
+    303.3000   1466.3700     32.5000      3.5300
+    303.5000   1466.3800     32.5000      3.5300
+    303.7000   1466.3900     32.5000      3.5300
+    303.8000   1466.3800     32.5000      3.5300
+    304.0000   1466.3900     32.5000      3.5300
+    304.2000   1466.3900     32.5000      3.5300
+    304.3000   1466.3800     32.5000      3.5300
+    304.5000   1466.3800     32.5000      3.5300
+    304.7000   1466.4000     32.5000      3.5300
+    304.8000   1466.4000     32.5000      3.5300
+    305.0000   1466.4000     32.5000      3.5300
+    305.2000   1466.3800     32.5000      3.5300
+    305.3000   1466.3800     32.5000      3.5200
+    305.5000   1466.3900     32.5000      3.5200
+    305.7000   1466.3900     32.5000      3.5200
+    305.9000   1466.3700     32.5000      3.5200
+    306.0000   1466.3700     32.5000      3.5200
+    306.2000   1466.3700     32.5000      3.5200
+    306.4000   1466.3700     32.5000      3.5200
+    306.5000   1466.3700     32.5000      3.5200
+    306.7000   1466.3700     32.5000      3.5200
+    306.9000   1466.3600     32.5000      3.5100
+    307.0000   1466.3600     32.5000      3.5100
+    307.2000   1466.3400     32.5000      3.5100
+    307.4000   1466.3200     32.5000      3.5000
+    307.5000   1466.3000     32.5000      3.5000
+    307.7000   1466.2800     32.5000      3.4900
+    307.9000   1466.2600     32.5000      3.4900
+    308.0000   1466.2700     32.5000      3.4900
+    308.2000   1466.2500     32.5000      3.4800
+    308.4000   1466.2300     32.5000      3.4800
+    308.6000   1466.2400     32.5000      3.4800
+    308.7000   1466.2500     32.5000      3.4800
+    308.9000   1466.2400     32.5000      3.4800
+    309.1000   1466.2500     32.5000      3.4800
+    309.2000   1466.2400     32.5000      3.4800
+    309.4000   1466.2400     32.5000      3.4800
+    309.6000   1466.2500     32.5000      3.4800
+    309.7000   1466.2700     32.5000      3.4800
+    309.9000   1466.2800     32.5000      3.4800
+    310.1000   1466.2800     32.5000      3.4800
+    310.2000   1466.2800     32.5000      3.4800
+    310.4000   1466.2900     32.5000      3.4800
+    310.6000   1466.3100     32.5000      3.4900
+    310.7000   1466.3500     32.5000      3.5000
+    310.9000   1466.4000     32.5000      3.5100
+    311.1000   1466.4800     32.5000      3.5300
+    311.3000   1466.5600     32.5000      3.5400
+    311.4000   1466.6300     32.5000      3.5600
+    311.6000   1466.6900     32.5000      3.5700
+    311.8000   1466.7300     32.5000      3.5800
+    311.9000   1466.7700     32.5000      3.5900
+    312.1000   1466.8300     32.5000      3.6000
+    312.3000   1466.8600     32.5000      3.6100
+    312.4000   1466.8700     32.5000      3.6100
+    312.6000   1466.8700     32.5000      3.6100
+    312.8000   1466.8800     32.5000      3.6100
+    312.9000   1466.8800     32.5000      3.6100
+    313.1000   1466.8900     32.5000      3.6100
+    313.3000   1466.8900     32.5000      3.6100
+    313.4000   1466.9000     32.5000      3.6200
+    313.6000   1466.9000     32.5000      3.6100
+    313.8000   1466.8900     32.5000      3.6100
+    314.0000   1466.8900     32.5000      3.6100
+    314.1000   1466.8800     32.5000      3.6100
+    314.3000   1466.8800     32.5000      3.6100
+    314.5000   1466.8900     32.5000      3.6100
+    314.6000   1466.8900     32.5000      3.6100
+    314.8000   1466.8900     32.5000      3.6100
+    315.0000   1466.8900     32.5000      3.6100
+    315.1000   1466.9000     32.5000      3.6100
+    315.3000   1466.8800     32.5000      3.6000
+    315.5000   1466.8800     32.5000      3.6000
+    315.6000   1466.8700     32.5000      3.6000
+    315.8000   1466.8500     32.5000      3.6000
+    316.0000   1466.8500     32.5000      3.5900
+    316.1000   1466.8400     32.5000      3.5900
+    316.3000   1466.8200     32.5000      3.5900
+    316.5000   1466.8000     32.5000      3.5800
+    316.6000   1466.7900     32.5000      3.5800
+    316.8000   1466.7800     32.5000      3.5700
+    317.0000   1466.7600     32.5000      3.5700
+    317.2000   1466.7500     32.5000      3.5600
+    317.3000   1466.7200     32.5000      3.5600
+    317.5000   1466.7000     32.5000      3.5500
+    317.7000   1466.6900     32.5000      3.5500
+    317.8000   1466.6800     32.5000      3.5500
+    318.0000   1466.6800     32.5000      3.5400
+    318.2000   1466.6600     32.5000      3.5400
+    318.3000   1466.6500     32.5000      3.5400
+    318.5000   1466.6500     32.5000      3.5400
+    318.7000   1466.6500     32.5000      3.5400
+    318.8000   1466.6300     32.5000      3.5300
+    319.0000   1466.6100     32.5000      3.5200
+    319.2000   1466.6000     32.5000      3.5200
+    319.3000   1466.6100     32.5000      3.5200
+    319.5000   1466.6300     32.5000      3.5300
+    319.7000   1466.6200     32.5000      3.5200
+    319.8000   1466.5900     32.5000      3.5200
+    320.0000   1466.5600     32.5000      3.5100
+    320.2000   1466.5600     32.5000      3.5100
+    320.4000   1466.5400     32.5000      3.5000
+    320.5000   1466.5400     32.5000      3.5000
+    320.7000   1466.5200     32.5000      3.5000
+    320.9000   1466.4900     32.5000      3.4900
+    321.0000   1466.4600     32.5000      3.4800
+    321.2000   1466.4300     32.5000      3.4700
+    321.4000   1466.4100     32.5000      3.4700
+    321.5000   1466.4000     32.5000      3.4700
+    321.7000   1466.3800     32.5000      3.4600
+    321.9000   1466.3600     32.5000      3.4600
+    322.0000   1466.3400     32.5000      3.4500
+    322.2000   1466.3200     32.5000      3.4500
+    322.4000   1466.3200     32.5000      3.4400
+    322.5000   1466.3100     32.5000      3.4400
+    322.7000   1466.3100     32.5000      3.4400
+    322.9000   1466.3000     32.5000      3.4400
+    323.0000   1466.3100     32.5000      3.4400
+    323.2000   1466.2900     32.5000      3.4300
+    323.4000   1466.2900     32.5000      3.4300
+    323.6000   1466.2800     32.5000      3.4300
+    323.7000   1466.2500     32.5000      3.4200
+    323.9000   1466.2300     32.5000      3.4200
+    324.1000   1466.2100     32.5000      3.4100
+    324.2000   1466.2000     32.5000      3.4100
+    324.4000   1466.1600     32.5000      3.4000
+    324.6000   1466.1400     32.5000      3.3900
+    324.7000   1466.1300     32.5000      3.3900
+    324.9000   1466.1300     32.5000      3.3900
+    325.1000   1466.1500     32.5000      3.3900
+    325.2000   1466.1600     32.5000      3.3900
+    325.4000   1466.1500     32.5000      3.3900
+    325.6000   1466.1400     32.5000      3.3900
+    325.7000   1466.1300     32.5000      3.3900
+    325.9000   1466.1200     32.5000      3.3800
+    326.1000   1466.1400     32.5000      3.3900
+    326.2000   1466.1400     32.5000      3.3900
+    326.4000   1466.1300     32.5000      3.3800
+    326.6000   1466.1300     32.5000      3.3800
+    326.7000   1466.1300     32.5000      3.3800
+    326.9000   1466.1300     32.5000      3.3800
+    327.1000   1466.1200     32.5000      3.3800
+    327.3000   1466.1100     32.5000      3.3800
+    327.4000   1466.1300     32.5000      3.3800
+    327.6000   1466.1300     32.5000      3.3800
+    327.8000   1466.1400     32.5000      3.3800
+    327.9000   1466.1300     32.5000      3.3800
+    328.1000   1466.1300     32.5000      3.3800
+    328.3000   1466.1400     32.5000      3.3800
+    328.4000   1466.1400     32.5000      3.3800
+    328.6000   1466.1400     32.5000      3.3800
+    328.8000   1466.1300     32.5000      3.3700
+    328.9000   1466.1400     32.5000      3.3800
+    329.1000   1466.1400     32.5000      3.3800
+    329.3000   1466.1500     32.5000      3.3800
+    329.4000   1466.1400     32.5000      3.3700
+    329.6000   1466.1300     32.5000      3.3700
+    329.8000   1466.1300     32.5000      3.3700
+    329.9000   1466.1200     32.5000      3.3700
+    330.1000   1466.1200     32.5000      3.3700
+    330.3000   1466.1300     32.5000      3.3700
+    330.4000   1466.1200     32.5000      3.3700
+    330.6000   1466.1100     32.5000      3.3600
+    330.8000   1466.1100     32.5000      3.3600
+    330.9000   1466.1000     32.5000      3.3600
+    331.1000   1466.1000     32.5000      3.3600
+    331.3000   1466.1000     32.5000      3.3600
+    331.5000   1466.0900     32.5000      3.3600
+    331.6000   1466.0700     32.5000      3.3500
+    331.8000   1466.0200     32.5000      3.3400
+    332.0000   1465.9800     32.5000      3.3300
+    332.1000   1465.9700     32.5000      3.3200
+    332.3000   1465.9500     32.5000      3.3200
+    332.5000   1465.9400     32.5000      3.3200
+    332.6000   1465.9300     32.5000      3.3100
+    332.8000   1465.9300     32.5000      3.3100
+    333.0000   1465.9200     32.5000      3.3100
+    333.1000   1465.9300     32.5000      3.3100
+    333.3000   1465.9300     32.5000      3.3100
+    333.5000   1465.9300     32.5000      3.3100
+    333.6000   1465.9300     32.5000      3.3100
+    333.8000   1465.9500     32.5000      3.3100
+    334.0000   1465.9600     32.5000      3.3100
+    334.1000   1465.9500     32.5000      3.3100
+    334.3000   1465.9400     32.5000      3.3100
+    334.5000   1465.9500     32.5000      3.3100
+    334.6000   1465.9600     32.5000      3.3100
+    334.8000   1465.9400     32.5000      3.3100
+    335.0000   1465.9300     32.5000      3.3000
+    335.1000   1465.9200     32.5000      3.3000
+    335.3000   1465.9500     32.5000      3.3100
+    335.5000   1465.9800     32.5000      3.3100
+    335.7000   1465.9800     32.5000      3.3100
+    335.8000   1465.9800     32.5000      3.3100
+    336.0000   1465.9600     32.5000      3.3100
+    336.2000   1465.9400     32.5000      3.3000
+    336.3000   1465.9100     32.5000      3.2900
+    336.5000   1465.8800     32.5000      3.2900
+    336.7000   1465.8500     32.5000      3.2800
+    336.8000   1465.8300     32.5000      3.2700
+    337.0000   1465.8000     32.5000      3.2700
+    337.2000   1465.7800     32.5000      3.2600
+    337.3000   1465.7700     32.5000      3.2600
+    337.5000   1465.7600     32.5000      3.2500
+    337.7000   1465.7500     32.5000      3.2500
+    337.8000   1465.7500     32.5000      3.2500
+    338.0000   1465.7500     32.5000      3.2500
+    338.2000   1465.7400     32.5000      3.2500
+    338.3000   1465.7400     32.5000      3.2500
+    338.5000   1465.7600     32.5000      3.2500
+    338.7000   1465.7700     32.5000      3.2500
+    338.8000   1465.7900     32.5000      3.2600
+    339.0000   1465.8300     32.5000      3.2600
+    339.2000   1465.8300     32.5000      3.2600
+    339.3000   1465.8200     32.5000      3.2600
+    339.5000   1465.8000     32.5000      3.2600
+    339.7000   1465.8100     32.5000      3.2600
+    339.8000   1465.8200     32.5000      3.2600
+    340.0000   1465.8100     32.5000      3.2600
+    340.2000   1465.8300     32.5000      3.2600
+    340.4000   1465.8300     32.5000      3.2600
+    340.5000   1465.8200     32.5000      3.2600
+    340.7000   1465.8300     32.5000      3.2600
+    340.9000   1465.8200     32.5000      3.2600
+    341.0000   1465.8200     32.5000      3.2500
+    341.2000   1465.8100     32.5000      3.2500
+    341.4000   1465.8100     32.5000      3.2500
+    341.5000   1465.8000     32.5000      3.2500
+    341.7000   1465.7900     32.5000      3.2500
+    341.9000   1465.7700     32.5000      3.2400
+    342.0000   1465.7500     32.5000      3.2400
+    342.2000   1465.7300     32.5000      3.2300
+    342.4000   1465.7100     32.5000      3.2200
+    342.5000   1465.7000     32.5000      3.2200
+    342.7000   1465.7100     32.5000      3.2200
+    342.9000   1465.6900     32.5000      3.2200
+    343.0000   1465.6800     32.5000      3.2200
+    343.2000   1465.6800     32.5000      3.2100
+    343.4000   1465.7000     32.5000      3.2200
+    343.5000   1465.7000     32.5000      3.2200
+    343.7000   1465.7000     32.5000      3.2200
+    343.9000   1465.7000     32.5000      3.2200
+    344.0000   1465.7100     32.5000      3.2200
+    344.2000   1465.7000     32.5000      3.2200
+    344.4000   1465.7100     32.5000      3.2200
+    344.5000   1465.7100     32.5000      3.2200
+    344.7000   1465.7200     32.5000      3.2200
+    344.9000   1465.7100     32.5000      3.2100
+    345.0000   1465.7100     32.5000      3.2100
+    345.2000   1465.7100     32.5000      3.2100
+    345.4000   1465.7200     32.5000      3.2200
+    345.5000   1465.7100     32.5000      3.2100
+    345.7000   1465.7200     32.5000      3.2100
+    345.9000   1465.7100     32.5000      3.2100
+    346.1000   1465.7200     32.5000      3.2100
+    346.2000   1465.7100     32.5000      3.2100
+    346.4000   1465.7200     32.5000      3.2100
+    346.6000   1465.7300     32.5000      3.2100
+    346.7000   1465.7300     32.5000      3.2100
+    346.9000   1465.7400     32.5000      3.2100
+    347.1000   1465.7500     32.5000      3.2200
+    347.2000   1465.7500     32.5000      3.2200
+    347.4000   1465.7500     32.5000      3.2200
+    347.6000   1465.7700     32.5000      3.2200
+    347.7000   1465.7700     32.5000      3.2200
+    347.9000   1465.7500     32.5000      3.2100
+    348.1000   1465.7500     32.5000      3.2100
+    348.2000   1465.7400     32.5000      3.2100
+    348.4000   1465.7400     32.5000      3.2100
+    348.6000   1465.7400     32.5000      3.2100
+    348.7000   1465.7500     32.5000      3.2100
+    348.9000   1465.7300     32.5000      3.2100
+    349.1000   1465.7000     32.5000      3.2000
+    349.2000   1465.6800     32.5000      3.1900
+    349.4000   1465.6800     32.5000      3.1900
+    349.6000   1465.6800     32.5000      3.1900
+    349.7000   1465.6700     32.5000      3.1900
+    349.9000   1465.6700     32.5000      3.1900
+    350.1000   1465.6700     32.5000      3.1900
+    350.2000   1465.6600     32.5000      3.1800
+    350.4000   1465.6500     32.5000      3.1800
+    350.6000   1465.6300     32.5000      3.1700
+    350.7000   1465.6200     32.5000      3.1700
+    350.9000   1465.6100     32.5000      3.1700
+    351.1000   1465.6100     32.5000      3.1700
+    351.2000   1465.6100     32.5000      3.1700
+    351.4000   1465.5900     32.5000      3.1600
+    351.6000   1465.5900     32.5000      3.1600
+    351.7000   1465.5900     32.5000      3.1600
+    351.9000   1465.5700     32.5000      3.1600
+    352.1000   1465.5600     32.5000      3.1500
+    352.2000   1465.5500     32.5000      3.1500
+    352.4000   1465.5400     32.5000      3.1500
+    352.6000   1465.5300     32.5000      3.1400
+    352.7000   1465.5300     32.5000      3.1400
+    352.9000   1465.5200     32.5000      3.1400
+    353.1000   1465.5100     32.5000      3.1400
+    353.3000   1465.5100     32.5000      3.1400
+    353.4000   1465.5100     32.5000      3.1400
+    353.6000   1465.5400     32.5000      3.1400
+    353.8000   1465.5800     32.5000      3.1500
+    353.9000   1465.6100     32.5000      3.1600
+    354.1000   1465.6200     32.5000      3.1600
+    354.3000   1465.6300     32.5000      3.1600
+    354.4000   1465.6300     32.5000      3.1600
+    354.6000   1465.6400     32.5000      3.1600
+    354.8000   1465.6400     32.5000      3.1600
+    354.9000   1465.6400     32.5000      3.1600
+    355.1000   1465.6300     32.5000      3.1600
+    355.3000   1465.6200     32.5000      3.1500
+    355.4000   1465.6300     32.5000      3.1600
+    355.6000   1465.6300     32.5000      3.1600
+    355.8000   1465.6300     32.5000      3.1500
+    355.9000   1465.6300     32.5000      3.1500
+    356.1000   1465.6400     32.5000      3.1600
+    356.3000   1465.6400     32.5000      3.1600
+    356.4000   1465.6400     32.5000      3.1500
+    356.6000   1465.6400     32.5000      3.1500
+    356.8000   1465.6200     32.5000      3.1500
+    356.9000   1465.6200     32.5000      3.1500
+    357.1000   1465.6200     32.5000      3.1500
+    357.3000   1465.6200     32.5000      3.1500
+    357.4000   1465.6200     32.5000      3.1500
+    357.6000   1465.6300     32.5000      3.1500
+    357.8000   1465.6200     32.5000      3.1500
+    357.9000   1465.6200     32.5000      3.1400
+    358.1000   1465.6200     32.5000      3.1400
+    358.3000   1465.6100     32.5000      3.1400
+    358.4000   1465.6200     32.5000      3.1400
+    358.6000   1465.6200     32.5000      3.1400
+    358.8000   1465.6200     32.5000      3.1400
+    358.9000   1465.6200     32.5000      3.1400
+    359.1000   1465.6200     32.5000      3.1400
+    359.3000   1465.6000     32.5000      3.1400
+    359.4000   1465.6000     32.5000      3.1300
+    359.6000   1465.5900     32.5000      3.1300
+    359.8000   1465.5900     32.5000      3.1300
+    359.9000   1465.5800     32.5000      3.1300
+    360.1000   1465.5900     32.5000      3.1300
+    360.3000   1465.6000     32.5000      3.1300
+    360.4000   1465.5900     32.5000      3.1300
+    360.6000   1465.5900     32.5000      3.1300
+    360.8000   1465.6000     32.5000      3.1300
+    360.9000   1465.6100     32.5000      3.1300
+    361.1000   1465.6000     32.5000      3.1300
+    361.3000   1465.5900     32.5000      3.1200
+    361.4000   1465.5900     32.5000      3.1200
+    361.6000   1465.5900     32.5000      3.1200
+    361.8000   1465.5900     32.5000      3.1200
+    361.9000   1465.6000     32.5000      3.1200
+    362.1000   1465.6100     32.5000      3.1300
+    362.3000   1465.6100     32.5000      3.1300
+    362.4000   1465.6000     32.5000      3.1200
+    362.6000   1465.6200     32.5000      3.1300
+    362.8000   1465.6200     32.5000      3.1300
+    362.9000   1465.6300     32.5000      3.1300
+    363.1000   1465.6500     32.5000      3.1300
+    363.3000   1465.6400     32.5000      3.1300
+    363.4000   1465.6500     32.5000      3.1300
+    363.6000   1465.6500     32.5000      3.1300
+    363.8000   1465.6500     32.5000      3.1300
+    364.0000   1465.6400     32.5000      3.1300
+    364.1000   1465.6400     32.5000      3.1200
+    364.3000   1465.6300     32.5000      3.1200
+    364.5000   1465.6200     32.5000      3.1200
+    364.6000   1465.6100     32.5000      3.1200
+    364.8000   1465.6100     32.5000      3.1200
+    365.0000   1465.6000     32.5000      3.1100
+    365.1000   1465.6000     32.5000      3.1100
+    365.3000   1465.6000     32.5000      3.1100
+    365.5000   1465.5900     32.5000      3.1100
+    365.6000   1465.5900     32.5000      3.1100
+    365.8000   1465.6000     32.5000      3.1100
+    366.0000   1465.6000     32.5000      3.1100
+    366.1000   1465.6300     32.5000      3.1100
+    366.3000   1465.6500     32.5000      3.1200
+    366.5000   1465.7000     32.5000      3.1300
+    366.6000   1465.7700     32.5000      3.1400
+    366.8000   1465.8500     32.5000      3.1600
+    367.0000   1465.9500     32.5000      3.1900
+    367.1000   1466.0400     32.5000      3.2100
+    367.3000   1466.1400     32.5000      3.2300
+    367.5000   1466.2300     32.5000      3.2500
+    367.6000   1466.3000     32.5000      3.2700
+    367.8000   1466.3800     32.5000      3.2800
+    368.0000   1466.4400     32.5000      3.3000
+    368.1000   1466.5400     32.5000      3.3200
+    368.3000   1466.6200     32.5000      3.3400
+    368.5000   1466.6800     32.5000      3.3500
+    368.6000   1466.7400     32.5000      3.3600
+    368.8000   1466.8000     32.5000      3.3800
+    369.0000   1466.8300     32.5000      3.3900
+    369.1000   1466.8500     32.5000      3.3900
+    369.3000   1466.8700     32.5000      3.3900
+    369.5000   1466.9000     32.5000      3.4000
+    369.6000   1466.9000     32.5000      3.4000
+    369.8000   1466.9200     32.5000      3.4000
+    370.0000   1466.9300     32.5000      3.4000
+    370.1000   1466.9300     32.5000      3.4000
+    370.3000   1466.9300     32.5000      3.4000
+    370.5000   1466.9200     32.5000      3.4000
+    370.6000   1466.9100     32.5000      3.4000
+    370.8000   1466.9100     32.5000      3.4000
+    371.0000   1466.9000     32.5000      3.3900
+    371.1000   1466.8900     32.5000      3.3900
+    371.3000   1466.8900     32.5000      3.3900
+    371.5000   1466.8700     32.5000      3.3900
+    371.6000   1466.8500     32.5000      3.3800
+    371.8000   1466.8300     32.5000      3.3700
+    372.0000   1466.8300     32.5000      3.3700
+    372.1000   1466.8200     32.5000      3.3700
+    372.3000   1466.8000     32.5000      3.3700
+    372.5000   1466.7900     32.5000      3.3600
+    372.6000   1466.7800     32.5000      3.3600
+    372.8000   1466.7600     32.5000      3.3500
+    373.0000   1466.7300     32.5000      3.3500
+    373.1000   1466.7200     32.5000      3.3400
+    373.3000   1466.6900     32.5000      3.3300
+    373.5000   1466.6600     32.5000      3.3300
+    373.6000   1466.6500     32.5000      3.3200
+    373.8000   1466.6300     32.5000      3.3200
+    374.0000   1466.6100     32.5000      3.3100
+    374.1000   1466.5900     32.5000      3.3100
+    374.3000   1466.5700     32.5000      3.3000
+    374.5000   1466.5600     32.5000      3.3000
+    374.6000   1466.5600     32.5000      3.3000
+    374.8000   1466.5500     32.5000      3.3000
+    375.0000   1466.5200     32.5000      3.2900
+    375.1000   1466.5100     32.5000      3.2900
+    375.3000   1466.4900     32.5000      3.2800
+    375.5000   1466.4800     32.5000      3.2800
+    375.6000   1466.4700     32.5000      3.2700
+    375.8000   1466.4400     32.5000      3.2700
+    376.0000   1466.4200     32.5000      3.2600
+    376.1000   1466.4100     32.5000      3.2600
+    376.3000   1466.4000     32.5000      3.2600
+    376.5000   1466.3700     32.5000      3.2500
+    376.6000   1466.3500     32.5000      3.2400
+    376.8000   1466.3300     32.5000      3.2400
+    377.0000   1466.3200     32.5000      3.2400
+    377.1000   1466.3200     32.5000      3.2400
+    377.3000   1466.3300     32.5000      3.2400
+    377.5000   1466.3500     32.5000      3.2400
+    377.6000   1466.3500     32.5000      3.2400
+    377.8000   1466.3500     32.5000      3.2400
+    378.0000   1466.3300     32.5000      3.2300
+    378.1000   1466.3000     32.5000      3.2300
+    378.3000   1466.2900     32.5000      3.2200
+    378.5000   1466.2900     32.5000      3.2200
+    378.6000   1466.2800     32.5000      3.2200
+    378.8000   1466.2900     32.5000      3.2200
+    379.0000   1466.3000     32.5000      3.2200
+    379.1000   1466.2800     32.5000      3.2200
+    379.3000   1466.2700     32.5000      3.2100
+    379.5000   1466.2500     32.5000      3.2100
+    379.6000   1466.2300     32.5000      3.2000
+    379.8000   1466.2400     32.5000      3.2000
+    380.0000   1466.2400     32.5000      3.2000
+    380.1000   1466.2100     32.5000      3.2000
+    380.3000   1466.2100     32.5000      3.2000
+    380.5000   1466.2400     32.5000      3.2000
+    380.6000   1466.3600     32.5000      3.2300
+    380.8000   1466.5600     32.5000      3.2800
+    381.0000   1466.8400     32.5000      3.3400
+    381.1000   1467.1200     32.5000      3.4100
+    381.3000   1467.3900     32.5000      3.4700
+    381.5000   1467.6500     32.5000      3.5300
+    381.6000   1467.9700     32.5000      3.6000
+    381.8000   1468.3400     32.5000      3.6900
+    382.0000   1468.7000     32.5000      3.7800
+    382.1000   1469.0200     32.5000      3.8500
+    382.3000   1469.2800     32.5000      3.9100
+    382.5000   1469.4600     32.5000      3.9500
+    382.6000   1469.5600     32.5000      3.9800
+    382.8000   1469.7100     32.5000      4.0100
+    383.0000   1469.8600     32.5000      4.0500
+    383.1000   1469.9100     32.5000      4.0600
+    383.3000   1469.9100     32.5000      4.0600
+    383.5000   1469.9500     32.5000      4.0700
+    383.6000   1469.9800     32.5000      4.0700
+    383.8000   1469.9500     32.5000      4.0700
+    384.0000   1469.8600     32.5000      4.0400
+    384.1000   1469.8100     32.5000      4.0300
+    384.3000   1469.7600     32.5000      4.0200
+    384.5000   1469.7100     32.5000      4.0100
+    384.6000   1469.7400     32.5000      4.0100
+    384.8000   1469.8500     32.5000      4.0400
+    385.0000   1470.1700     32.5000      4.1100
+    385.1000   1470.7100     32.5000      4.2400
+    385.3000   1471.3300     32.5000      4.3900
+    385.5000   1471.7600     32.5000      4.4900
+    385.6000   1472.0600     32.5000      4.5700
+    385.8000   1472.5000     32.5000      4.6700
+    386.0000   1473.1900     32.5000      4.8400
+    386.1000   1473.9100     32.5000      5.0100
+    386.3000   1474.3100     32.5000      5.1100
+    386.5000   1474.9000     32.5000      5.2500
+    386.6000   1475.9300     32.5000      5.5000
+    386.8000   1476.7100     32.5000      5.7000
+    387.0000   1477.2200     32.5000      5.8200
+    387.1000   1477.7000     32.5000      5.9400
+    387.3000   1478.0800     32.5000      6.0400
+    387.5000   1478.0700     32.5000      6.0300
+    387.6000   1477.3800     32.5000      5.8600
+    387.8000   1476.1600     32.5000      5.5600
+    387.9000   1475.3700     32.5000      5.3600
+    388.1000   1474.8800     32.5000      5.2400
+    388.3000   1474.2000     32.5000      5.0700
+    388.4000   1473.9200     32.5000      5.0100
+    388.6000   1473.7100     32.5000      4.9500
+    388.8000   1473.5800     32.5000      4.9200
+    388.9000   1473.5000     32.5000      4.9000
+    389.1000   1526.4000     32.5000     20.4500
+    389.3000   1560.1400     32.5000     35.5000
+    389.4000   1560.1500     32.5000     35.5000
+    389.6000   1560.1500     32.5000     35.5000
+    389.8000   1560.1500     32.5000     35.5000
+    389.9000   1560.1500     32.5000     35.5000
+    390.1000   1560.1600     32.5000     35.5000
+    390.3000   1560.1600     32.5000     35.5000
+    390.4000   1560.1600     32.5000     35.5000
+    390.6000   1560.1700     32.5000     35.5000
+    390.8000   1560.1700     32.5000     35.5000
+    390.9000   1560.1700     32.5000     35.5000
+    391.1000   1560.1700     32.5000     35.5000
+    391.3000   1560.1800     32.5000     35.5000
+    391.4000   1560.1800     32.5000     35.5000
+    391.6000   1560.1800     32.5000     35.5000
+    391.8000   1560.1900     32.5000     35.5000
+    391.9000   1560.1900     32.5000     35.5000
+    392.1000   1560.1900     32.5000     35.5000
+    392.3000   1560.1900     32.5000     35.5000
+    392.4000   1560.2000     32.5000     35.5000
+    392.6000   1560.2000     32.5000     35.5000
+    392.8000   1560.2000     32.5000     35.5000
+    392.9000   1560.2100     32.5000     35.5000
+    393.1000   1560.2100     32.5000     35.5000
+    393.3000   1560.2100     32.5000     35.5000
+    393.4000   1560.2100     32.5000     35.5000
+    393.6000   1560.2200     32.5000     35.5000
+    393.8000   1560.2200     32.5000     35.5000
+    393.9000   1560.2200     32.5000     35.5000
+    394.1000   1560.2200     32.5000     35.5000
+    394.3000   1560.2300     32.5000     35.5000
+    394.4000   1560.2300     32.5000     35.5000
+    394.6000   1560.2300     32.5000     35.5000
+    394.8000   1560.2400     32.5000     35.5000
+    394.9000   1560.2400     32.5000     35.5000
+    395.1000   1560.2400     32.5000     35.5000
+    395.3000   1560.2400     32.5000     35.5000
+    395.4000   1560.2500     32.5000     35.5000
+    395.6000   1560.2500     32.5000     35.5000
+    395.8000   1560.2500     32.5000     35.5000
+    395.9000   1560.2600     32.5000     35.5000
+    396.1000   1560.2600     32.5000     35.5000
+    396.3000   1560.2600     32.5000     35.5000
+    396.4000   1560.2600     32.5000     35.5000
+    396.6000   1560.2700     32.5000     35.5000
+    396.8000   1560.2700     32.5000     35.5000
+    396.9000   1560.2700     32.5000     35.5000
+    397.1000   1560.2800     32.5000     35.5000
+    397.3000   1560.2800     32.5000     35.5000
+    397.4000   1560.2800     32.5000     35.5000
+    397.6000   1560.2800     32.5000     35.5000
+    397.8000   1560.2900     32.5000     35.5000
+    397.9000   1560.2900     32.5000     35.5000
+    398.1000   1560.2900     32.5000     35.5000
+    398.2000   1560.3000     32.5000     35.5000
+    398.4000   1560.3000     32.5000     35.5000
+    398.6000   1560.3000     32.5000     35.5000
+    398.7000   1560.3000     32.5000     35.5000
+    398.9000   1560.3100     32.5000     35.5000
+    399.1000   1560.3100     32.5000     35.5000
+    399.2000   1560.3100     32.5000     35.5000
+    399.4000   1560.3200     32.5000     35.5000
+    399.6000   1560.3200     32.5000     35.5000
+    399.7000   1560.3200     32.5000     35.5000
+    399.9000   1560.3200     32.5000     35.5000
+    400.1000   1560.3300     32.5000     35.5000
+    400.2000   1560.3300     32.5000     35.5000
+    400.4000   1560.3300     32.5000     35.5000
+    400.6000   1560.3300     32.5000     35.5000
+    400.7000   1560.3400     32.5000     35.5000
+    400.9000   1560.3400     32.5000     35.5000
+    401.1000   1560.3400     32.5000     35.5000
+    401.2000   1560.3500     32.5000     35.5000
+    401.4000   1560.3500     32.5000     35.5000
+    401.6000   1560.3500     32.5000     35.5000
+    401.7000   1560.3500     32.5000     35.5000
+    401.9000   1560.3600     32.5000     35.5000
+    402.1000   1560.3600     32.5000     35.5000
+    402.2000   1560.3600     32.5000     35.5000
+    402.4000   1560.3700     32.5000     35.5000
+    402.6000   1560.3700     32.5000     35.5000
+    402.7000   1560.3700     32.5000     35.5000
+    402.9000   1560.3700     32.5000     35.5000
+    403.1000   1560.3800     32.5000     35.5000
+    403.2000   1560.3800     32.5000     35.5000
+    403.4000   1560.3800     32.5000     35.5000
+    403.6000   1560.3900     32.5000     35.5000
+    403.7000   1560.3900     32.5000     35.5000
+    403.9000   1560.3900     32.5000     35.5000
+    404.1000   1560.3900     32.5000     35.5000
+    404.2000   1560.4000     32.5000     35.5000
+    404.4000   1560.4000     32.5000     35.5000
+    404.6000   1560.4000     32.5000     35.5000
+    404.7000   1560.4100     32.5000     35.5000
+    404.9000   1560.4100     32.5000     35.5000
+    405.1000   1560.4100     32.5000     35.5000
+    405.2000   1560.4100     32.5000     35.5000
+    405.4000   1560.4200     32.5000     35.5000
+    405.5000   1560.4200     32.5000     35.5000
+    405.7000   1560.4200     32.5000     35.5000
+    405.9000   1560.4200     32.5000     35.5000
+    406.0000   1560.4300     32.5000     35.5000
+    406.2000   1560.4300     32.5000     35.5000
+    406.4000   1560.4300     32.5000     35.5000
+    406.5000   1560.4400     32.5000     35.5000
+    406.7000   1560.4400     32.5000     35.5000
+    406.9000   1560.4400     32.5000     35.5000
+    407.0000   1560.4400     32.5000     35.5000
+    407.2000   1560.4500     32.5000     35.5000
+    407.4000   1560.4500     32.5000     35.5000
+    407.5000   1560.4500     32.5000     35.5000
+    407.7000   1560.4600     32.5000     35.5000
+    407.9000   1560.4600     32.5000     35.5000
+    408.0000   1560.4600     32.5000     35.5000
+    408.2000   1560.4600     32.5000     35.5000
+    408.4000   1560.4700     32.5000     35.5000
+    408.5000   1560.4700     32.5000     35.5000
+    408.7000   1560.4700     32.5000     35.5000
+    408.9000   1560.4800     32.5000     35.5000
+    409.0000   1560.4800     32.5000     35.5000
+    409.2000   1560.4800     32.5000     35.5000
+    409.4000   1560.4800     32.5000     35.5000
+    409.5000   1560.4900     32.5000     35.5000
+    409.7000   1560.4900     32.5000     35.5000
+    409.9000   1560.4900     32.5000     35.5000
+    410.0000   1560.5000     32.5000     35.5000
+    410.2000   1560.5000     32.5000     35.5000
+    410.4000   1560.5000     32.5000     35.5000
+    410.5000   1560.5000     32.5000     35.5000
+    410.7000   1560.5100     32.5000     35.5000
+    410.8000   1560.5100     32.5000     35.5000
+    411.0000   1560.5100     32.5000     35.5000
+    411.2000   1560.5100     32.5000     35.5000
+    411.3000   1560.5200     32.5000     35.5000
+    411.5000   1560.5200     32.5000     35.5000
+    411.7000   1560.5200     32.5000     35.5000
+    411.8000   1560.5300     32.5000     35.5000
+    412.0000   1560.5300     32.5000     35.5000
+    412.2000   1560.5300     32.5000     35.5000
+    412.3000   1560.5300     32.5000     35.5000
+    412.5000   1560.5400     32.5000     35.5000
+    412.7000   1560.5400     32.5000     35.5000
+    412.8000   1560.5400     32.5000     35.5000
+    413.0000   1560.5500     32.5000     35.5000
+    413.2000   1560.5500     32.5000     35.5000
+    413.3000   1560.5500     32.5000     35.5000
+    413.5000   1560.5500     32.5000     35.5000
+    413.7000   1560.5600     32.5000     35.5000
+    413.8000   1560.5600     32.5000     35.5000
+    414.0000   1560.5600     32.5000     35.5000
+    414.2000   1560.5700     32.5000     35.5000
+    414.3000   1560.5700     32.5000     35.5000
+    414.5000   1560.5700     32.5000     35.5000
+    414.7000   1560.5700     32.5000     35.5000
+    414.8000   1560.5800     32.5000     35.5000
+    415.0000   1560.5800     32.5000     35.5000
+    415.2000   1560.5800     32.5000     35.5000
+    415.3000   1560.5900     32.5000     35.5000
+    415.5000   1560.5900     32.5000     35.5000
+    415.6000   1560.5900     32.5000     35.5000
+    415.8000   1560.5900     32.5000     35.5000
+    416.0000   1560.6000     32.5000     35.5000
+    416.1000   1560.6000     32.5000     35.5000
+    416.3000   1560.6000     32.5000     35.5000
+    416.5000   1560.6000     32.5000     35.5000
+    416.6000   1560.6100     32.5000     35.5000
+    416.8000   1560.6100     32.5000     35.5000
+    417.0000   1560.6100     32.5000     35.5000
+    417.1000   1560.6200     32.5000     35.5000
+    417.3000   1560.6200     32.5000     35.5000
+    417.5000   1560.6200     32.5000     35.5000
+    417.6000   1560.6200     32.5000     35.5000
+    417.8000   1560.6300     32.5000     35.5000
+    418.0000   1560.6300     32.5000     35.5000
+    418.1000   1560.6300     32.5000     35.5000
+    418.3000   1560.6400     32.5000     35.5000
+    418.5000   1560.6400     32.5000     35.5000
+    418.6000   1560.6400     32.5000     35.5000
+    418.8000   1560.6400     32.5000     35.5000
+    419.0000   1560.6500     32.5000     35.5000
+    419.1000   1560.6500     32.5000     35.5000
+    419.3000   1560.6500     32.5000     35.5000
+    419.5000   1560.6600     32.5000     35.5000
+    419.6000   1560.6600     32.5000     35.5000
+    419.8000   1560.6600     32.5000     35.5000
+    419.9000   1560.6600     32.5000     35.5000
+    420.1000   1560.6700     32.5000     35.5000
+    420.3000   1560.6700     32.5000     35.5000
+    420.4000   1560.6700     32.5000     35.5000
+    420.6000   1560.6700     32.5000     35.5000
+    420.8000   1560.6800     32.5000     35.5000
+    420.9000   1560.6800     32.5000     35.5000
+    421.1000   1560.6800     32.5000     35.5000
+    421.3000   1560.6900     32.5000     35.5000
+    421.4000   1560.6900     32.5000     35.5000
+    421.6000   1560.6900     32.5000     35.5000
+    421.8000   1560.6900     32.5000     35.5000
+    421.9000   1560.7000     32.5000     35.5000
+    422.1000   1560.7000     32.5000     35.5000
+    422.3000   1560.7000     32.5000     35.5000
+    422.4000   1560.7100     32.5000     35.5000
+    422.6000   1560.7100     32.5000     35.5000
+    422.8000   1560.7100     32.5000     35.5000
+    422.9000   1560.7100     32.5000     35.5000
+    423.1000   1560.7200     32.5000     35.5000
+    423.3000   1560.7200     32.5000     35.5000
+    423.4000   1560.7200     32.5000     35.5000
+    423.6000   1560.7300     32.5000     35.5000
+    423.7000   1560.7300     32.5000     35.5000
+    423.9000   1560.7300     32.5000     35.5000
+    424.1000   1560.7300     32.5000     35.5000
+    424.2000   1560.7400     32.5000     35.5000
+    424.4000   1560.7400     32.5000     35.5000
+    424.6000   1560.7400     32.5000     35.5000
+    424.7000   1560.7400     32.5000     35.5000
+    424.9000   1560.7500     32.5000     35.5000
+    425.1000   1560.7500     32.5000     35.5000
+    425.2000   1560.7500     32.5000     35.5000
+    425.4000   1560.7600     32.5000     35.5000
+    425.6000   1560.7600     32.5000     35.5000
+    425.7000   1560.7600     32.5000     35.5000
+    425.9000   1560.7600     32.5000     35.5000
+    426.1000   1560.7700     32.5000     35.5000
+    426.2000   1560.7700     32.5000     35.5000
+    426.4000   1560.7700     32.5000     35.5000
+    426.6000   1560.7800     32.5000     35.5000
+    426.7000   1560.7800     32.5000     35.5000
+    426.9000   1560.7800     32.5000     35.5000
+    427.1000   1560.7800     32.5000     35.5000
+    427.2000   1560.7900     32.5000     35.5000
+    427.4000   1560.7900     32.5000     35.5000
+    427.5000   1560.7900     32.5000     35.5000
+    427.7000   1560.8000     32.5000     35.5000
+    427.9000   1560.8000     32.5000     35.5000
+    428.0000   1560.8000     32.5000     35.5000
+    428.2000   1560.8000     32.5000     35.5000
+    428.4000   1560.8100     32.5000     35.5000
+    428.5000   1560.8100     32.5000     35.5000
+    428.7000   1560.8100     32.5000     35.5000
+    428.9000   1560.8200     32.5000     35.5000
+    429.0000   1560.8200     32.5000     35.5000
+    429.2000   1560.8200     32.5000     35.5000
+    429.4000   1560.8200     32.5000     35.5000
+    429.5000   1560.8300     32.5000     35.5000
+    429.7000   1560.8300     32.5000     35.5000
+    429.9000   1560.8300     32.5000     35.5000
+    430.0000   1560.8300     32.5000     35.5000
+    430.2000   1560.8400     32.5000     35.5000
+    430.4000   1560.8400     32.5000     35.5000
+    430.5000   1560.8400     32.5000     35.5000
+    430.7000   1560.8500     32.5000     35.5000
+    430.8000   1560.8500     32.5000     35.5000
+    431.0000   1560.8500     32.5000     35.5000
+    431.2000   1560.8500     32.5000     35.5000
+    431.3000   1560.8600     32.5000     35.5000
+    431.5000   1560.8600     32.5000     35.5000
+    431.7000   1560.8600     32.5000     35.5000
+    431.8000   1560.8700     32.5000     35.5000
+    432.0000   1560.8700     32.5000     35.5000
+    432.2000   1560.8700     32.5000     35.5000
+    432.3000   1560.8700     32.5000     35.5000
+    432.5000   1560.8800     32.5000     35.5000
+    432.7000   1560.8800     32.5000     35.5000
+    432.8000   1560.8800     32.5000     35.5000
+    433.0000   1560.8900     32.5000     35.5000
+    433.2000   1560.8900     32.5000     35.5000
+    433.3000   1560.8900     32.5000     35.5000
+    433.5000   1560.8900     32.5000     35.5000
+    433.7000   1560.9000     32.5000     35.5000
+    433.8000   1560.9000     32.5000     35.5000
+    434.0000   1560.9000     32.5000     35.5000
+    434.1000   1560.9000     32.5000     35.5000
+    434.3000   1560.9100     32.5000     35.5000
+    434.5000   1560.9100     32.5000     35.5000
+    434.6000   1560.9100     32.5000     35.5000
+    434.8000   1560.9200     32.5000     35.5000
+    435.0000   1560.9200     32.5000     35.5000
+    435.1000   1560.9200     32.5000     35.5000
+    435.3000   1560.9200     32.5000     35.5000
+    435.5000   1560.9300     32.5000     35.5000
+    435.6000   1560.9300     32.5000     35.5000
+    435.8000   1560.9300     32.5000     35.5000
+    436.0000   1560.9400     32.5000     35.5000
+    436.1000   1560.9400     32.5000     35.5000
+    436.3000   1560.9400     32.5000     35.5000
+    436.5000   1560.9400     32.5000     35.5000
+    436.6000   1560.9500     32.5000     35.5000
+    436.8000   1560.9500     32.5000     35.5000
+    436.9000   1560.9500     32.5000     35.5000
+    437.1000   1560.9600     32.5000     35.5000
+    437.3000   1560.9600     32.5000     35.5000
+    437.4000   1560.9600     32.5000     35.5000
+    437.6000   1560.9600     32.5000     35.5000
+    437.8000   1560.9700     32.5000     35.5000
+    437.9000   1560.9700     32.5000     35.5000
+    438.1000   1560.9700     32.5000     35.5000
+    438.3000   1560.9700     32.5000     35.5000
+    438.4000   1560.9800     32.5000     35.5000
+    438.6000   1560.9800     32.5000     35.5000
+    438.8000   1560.9800     32.5000     35.5000
+    438.9000   1560.9900     32.5000     35.5000
+    439.1000   1560.9900     32.5000     35.5000
+    439.3000   1560.9900     32.5000     35.5000
+    439.4000   1560.9900     32.5000     35.5000
+    439.6000   1561.0000     32.5000     35.5000
+    439.7000   1561.0000     32.5000     35.5000
+    439.9000   1561.0000     32.5000     35.5000
+    440.1000   1561.0100     32.5000     35.5000
+    440.2000   1561.0100     32.5000     35.5000
+    440.4000   1561.0100     32.5000     35.5000
+    440.6000   1561.0100     32.5000     35.5000
+    440.7000   1561.0200     32.5000     35.5000
+    440.9000   1561.0200     32.5000     35.5000
+    441.1000   1561.0200     32.5000     35.5000
+    441.2000   1561.0200     32.5000     35.5000
+    441.4000   1561.0300     32.5000     35.5000
+    441.6000   1561.0300     32.5000     35.5000
+    441.7000   1561.0300     32.5000     35.5000
+    441.9000   1561.0400     32.5000     35.5000
+    442.1000   1561.0400     32.5000     35.5000
+    442.2000   1561.0400     32.5000     35.5000
+    442.4000   1561.0400     32.5000     35.5000
+    442.5000   1561.0500     32.5000     35.5000
+    442.7000   1561.0500     32.5000     35.5000
+    442.9000   1561.0500     32.5000     35.5000
+    443.0000   1561.0600     32.5000     35.5000
+    443.2000   1561.0600     32.5000     35.5000
+    443.4000   1561.0600     32.5000     35.5000
+    443.5000   1561.0600     32.5000     35.5000
+    443.7000   1561.0700     32.5000     35.5000
+    443.9000   1561.0700     32.5000     35.5000
+    444.0000   1561.0700     32.5000     35.5000
+    444.2000   1561.0800     32.5000     35.5000
+    444.4000   1561.0800     32.5000     35.5000
+    444.5000   1561.0800     32.5000     35.5000
+    444.7000   1561.0800     32.5000     35.5000
+    444.9000   1561.0900     32.5000     35.5000
+    445.0000   1561.0900     32.5000     35.5000
+    445.2000   1561.0900     32.5000     35.5000
+    445.3000   1561.0900     32.5000     35.5000
+    445.5000   1561.1000     32.5000     35.5000
+    445.7000   1561.1000     32.5000     35.5000
+    445.8000   1561.1000     32.5000     35.5000
+    446.0000   1561.1100     32.5000     35.5000
+    446.2000   1561.1100     32.5000     35.5000
+    446.3000   1561.1100     32.5000     35.5000
+    446.5000   1561.1100     32.5000     35.5000
+    446.7000   1561.1200     32.5000     35.5000
+    446.8000   1561.1200     32.5000     35.5000
+    447.0000   1561.1200     32.5000     35.5000
+    447.2000   1561.1300     32.5000     35.5000
+    447.3000   1561.1300     32.5000     35.5000
+    447.5000   1561.1300     32.5000     35.5000
+    447.6000   1561.1300     32.5000     35.5000
+    447.8000   1561.1400     32.5000     35.5000
+    448.0000   1561.1400     32.5000     35.5000
+    448.1000   1561.1400     32.5000     35.5000
+    448.3000   1561.1500     32.5000     35.5000
+    448.5000   1561.1500     32.5000     35.5000
+    448.6000   1561.1500     32.5000     35.5000
+    448.8000   1561.1500     32.5000     35.5000
+    449.0000   1561.1600     32.5000     35.5000
+    449.1000   1561.1600     32.5000     35.5000
+    449.3000   1561.1600     32.5000     35.5000
+    449.5000   1561.1600     32.5000     35.5000
+    449.6000   1561.1700     32.5000     35.5000
+    449.8000   1561.1700     32.5000     35.5000
+    449.9000   1561.1700     32.5000     35.5000
+    450.1000   1561.1800     32.5000     35.5000
+    450.3000   1561.1800     32.5000     35.5000
+    450.4000   1561.1800     32.5000     35.5000
+    450.6000   1561.1800     32.5000     35.5000
+    450.8000   1561.1900     32.5000     35.5000
+    450.9000   1561.1900     32.5000     35.5000
+    451.1000   1561.1900     32.5000     35.5000
+    451.3000   1561.2000     32.5000     35.5000
+    451.4000   1561.2000     32.5000     35.5000
+    451.6000   1561.2000     32.5000     35.5000
+    451.8000   1561.2000     32.5000     35.5000
+    451.9000   1561.2100     32.5000     35.5000
+    452.1000   1561.2100     32.5000     35.5000
+    452.3000   1561.2100     32.5000     35.5000
+    452.4000   1561.2100     32.5000     35.5000
+    452.6000   1561.2200     32.5000     35.5000
+    452.7000   1561.2200     32.5000     35.5000
+    452.9000   1561.2200     32.5000     35.5000
+    453.1000   1561.2300     32.5000     35.5000
+    453.2000   1561.2300     32.5000     35.5000
+    453.4000   1561.2300     32.5000     35.5000
+    453.6000   1561.2300     32.5000     35.5000
+    453.7000   1561.2400     32.5000     35.5000
+    453.9000   1561.2400     32.5000     35.5000
+    454.1000   1561.2400     32.5000     35.5000
+    454.2000   1561.2500     32.5000     35.5000
+    454.4000   1561.2500     32.5000     35.5000
+    454.6000   1561.2500     32.5000     35.5000
+    454.7000   1561.2500     32.5000     35.5000
+    454.9000   1561.2600     32.5000     35.5000
+    455.0000   1561.2600     32.5000     35.5000
+    455.2000   1561.2600     32.5000     35.5000
+    455.4000   1561.2600     32.5000     35.5000
+    455.5000   1561.2700     32.5000     35.5000
+    455.7000   1561.2700     32.5000     35.5000
+    455.9000   1561.2700     32.5000     35.5000
+    456.0000   1561.2800     32.5000     35.5000
+    456.2000   1561.2800     32.5000     35.5000
+    456.4000   1561.2800     32.5000     35.5000
+    456.5000   1561.2800     32.5000     35.5000
+    456.7000   1561.2900     32.5000     35.5000
+    456.8000   1561.2900     32.5000     35.5000
+    457.0000   1561.2900     32.5000     35.5000
+    457.2000   1561.3000     32.5000     35.5000
+    457.3000   1561.3000     32.5000     35.5000
+    457.5000   1561.3000     32.5000     35.5000
+    457.7000   1561.3000     32.5000     35.5000
+    457.8000   1561.3100     32.5000     35.5000
+    458.0000   1561.3100     32.5000     35.5000
+    458.2000   1561.3100     32.5000     35.5000
+    458.3000   1561.3200     32.5000     35.5000
+    458.5000   1561.3200     32.5000     35.5000
+    458.7000   1561.3200     32.5000     35.5000
+    458.8000   1561.3200     32.5000     35.5000
+    459.0000   1561.3300     32.5000     35.5000
+    459.1000   1561.3300     32.5000     35.5000
+    459.3000   1561.3300     32.5000     35.5000
+    459.5000   1561.3300     32.5000     35.5000
+    459.6000   1561.3400     32.5000     35.5000
+    459.8000   1561.3400     32.5000     35.5000
+    460.0000   1561.3400     32.5000     35.5000
+    460.1000   1561.3500     32.5000     35.5000
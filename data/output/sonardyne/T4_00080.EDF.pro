@@ -0,0 +1,735 @@
+test_read_store_and_write
+1/1/2007
+18:57:20
+Probe: T-4
+Source: /root/package/data/input/sippican/T4_00080.EDF
+      0.0000   1541.0000     36.2000     27.2900
+      0.6000   1543.0400     36.2000     28.2100
+      1.3000   1544.1900     36.2000     28.7300
+      1.9000   1544.5400     36.2000     28.8900
+      2.6000   1544.6500     36.2000     28.9400
+      3.2000   1544.7000     36.2000     28.9500
+      3.9000   1544.7100     36.2000     28.9500
+      4.5000   1544.7400     36.2000     28.9600
+      5.2000   1544.6400     36.2000     28.9100
+      5.8000   1544.6300     36.2000     28.9000
+      6.5000   1544.7600     36.2000     28.9600
+      7.1000   1544.7000     36.2000     28.9200
+      7.8000   1544.7200     36.2000     28.9300
+      8.4000   1544.7300     36.2000     28.9300
+      9.1000   1544.7400     36.2000     28.9300
+      9.7000   1544.7600     36.2000     28.9300
+     10.3000   1544.7200     36.2000     28.9100
+     11.0000   1544.7000     36.2000     28.8900
+     11.6000   1544.7900     36.2000     28.9300
+     12.3000   1544.8500     36.2000     28.9500
+     12.9000   1544.8000     36.2000     28.9200
+     13.6000   1544.7500     36.2000     28.8900
+     14.2000   1544.7100     36.2000     28.8700
+     14.9000   1544.7900     36.2000     28.9100
+     15.5000   1544.8000     36.2000     28.9000
+     16.2000   1544.7900     36.2000     28.8900
+     16.8000   1544.7900     36.2000     28.8900
+     17.5000   1544.8100     36.2000     28.8900
+     18.1000   1544.8000     36.2000     28.8800
+     18.8000   1544.8800     36.2000     28.9100
+     19.4000   1544.7900     36.2000     28.8700
+     20.0000   1544.7900     36.2000     28.8600
+     20.7000   1544.8200     36.2000     28.8700
+     21.3000   1544.8500     36.2000     28.8800
+     22.0000   1544.7600     36.2000     28.8300
+     22.6000   1544.7800     36.2000     28.8400
+     23.3000   1544.7600     36.2000     28.8200
+     23.9000   1544.8300     36.2000     28.8500
+     24.6000   1544.8100     36.2000     28.8400
+     25.2000   1544.7300     36.2000     28.8000
+     25.9000   1544.7000     36.2000     28.7800
+     26.5000   1544.6000     36.2000     28.7200
+     27.1000   1544.5600     36.2000     28.7000
+     27.8000   1544.5600     36.2000     28.7000
+     28.4000   1544.4500     36.2000     28.6400
+     29.1000   1544.2500     36.2000     28.5400
+     29.7000   1543.9500     36.2000     28.4000
+     30.4000   1543.5600     36.2000     28.2100
+     31.0000   1543.1400     36.2000     28.0200
+     31.7000   1542.7300     36.2000     27.8200
+     32.3000   1542.3600     36.2000     27.6500
+     33.0000   1542.0900     36.2000     27.5300
+     33.6000   1541.9200     36.2000     27.4500
+     34.2000   1541.7900     36.2000     27.3900
+     34.9000   1541.7000     36.2000     27.3400
+     35.5000   1541.6100     36.2000     27.3000
+     36.2000   1541.5400     36.2000     27.2600
+     36.8000   1541.3900     36.2000     27.1800
+     37.5000   1541.2800     36.2000     27.1300
+     38.1000   1541.2400     36.2000     27.1100
+     38.8000   1541.2200     36.2000     27.0900
+     39.4000   1541.2000     36.2000     27.0800
+     40.0000   1541.2000     36.2000     27.0800
+     40.7000   1541.2200     36.2000     27.0800
+     41.3000   1541.1500     36.2000     27.0500
+     42.0000   1541.0700     36.2000     27.0100
+     42.6000   1540.9900     36.2000     26.9700
+     43.3000   1540.9800     36.2000     26.9600
+     43.9000   1541.0200     36.2000     26.9700
+     44.6000   1541.0700     36.2000     26.9900
+     45.2000   1541.1500     36.2000     27.0200
+     45.8000   1541.1800     36.2000     27.0300
+     46.5000   1541.1500     36.2000     27.0100
+     47.1000   1541.0800     36.2000     26.9700
+     47.8000   1541.0500     36.2000     26.9500
+     48.4000   1541.0200     36.2000     26.9300
+     49.1000   1540.9800     36.2000     26.9100
+     49.7000   1540.8500     36.2000     26.8500
+     50.4000   1540.7600     36.2000     26.8100
+     51.0000   1540.7100     36.2000     26.7800
+     51.6000   1540.6600     36.2000     26.7500
+     52.3000   1540.6000     36.2000     26.7300
+     52.9000   1540.5400     36.2000     26.6900
+     53.6000   1540.4800     36.2000     26.6600
+     54.2000   1540.3600     36.2000     26.6000
+     54.9000   1540.2100     36.2000     26.5400
+     55.5000   1540.0700     36.2000     26.4700
+     56.1000   1539.8200     36.2000     26.3500
+     56.8000   1539.4600     36.2000     26.2000
+     57.4000   1539.2300     36.2000     26.0900
+     58.1000   1539.0800     36.2000     26.0200
+     58.7000   1538.9700     36.2000     25.9700
+     59.4000   1538.8800     36.2000     25.9300
+     60.0000   1538.8500     36.2000     25.9100
+     60.6000   1538.8100     36.2000     25.8900
+     61.3000   1538.7500     36.2000     25.8600
+     61.9000   1538.6800     36.2000     25.8200
+     62.6000   1538.7300     36.2000     25.8400
+     63.2000   1538.8500     36.2000     25.8900
+     63.9000   1538.9600     36.2000     25.9300
+     64.5000   1538.9700     36.2000     25.9300
+     65.1000   1539.0000     36.2000     25.9400
+     65.8000   1538.9100     36.2000     25.9000
+     66.4000   1538.5900     36.2000     25.7500
+     67.1000   1538.3200     36.2000     25.6300
+     67.7000   1537.9900     36.2000     25.4900
+     68.4000   1537.7100     36.2000     25.3700
+     69.0000   1537.4900     36.2000     25.2700
+     69.6000   1537.2200     36.2000     25.1500
+     70.3000   1537.0700     36.2000     25.0900
+     70.9000   1537.0300     36.2000     25.0600
+     71.6000   1536.9600     36.2000     25.0300
+     72.2000   1536.8600     36.2000     24.9800
+     72.9000   1536.7900     36.2000     24.9500
+     73.5000   1536.7600     36.2000     24.9300
+     74.1000   1536.6500     36.2000     24.8800
+     74.8000   1536.6700     36.2000     24.8900
+     75.4000   1536.6200     36.2000     24.8600
+     76.1000   1536.5300     36.2000     24.8200
+     76.7000   1536.5000     36.2000     24.8000
+     77.4000   1536.4800     36.2000     24.7900
+     78.0000   1536.4600     36.2000     24.7800
+     78.6000   1536.4500     36.2000     24.7700
+     79.3000   1536.3900     36.2000     24.7400
+     79.9000   1536.3500     36.2000     24.7200
+     80.6000   1536.3200     36.2000     24.7000
+     81.2000   1536.2900     36.2000     24.6900
+     81.8000   1536.2700     36.2000     24.6700
+     82.5000   1536.2900     36.2000     24.6800
+     83.1000   1536.4100     36.2000     24.7200
+     83.8000   1536.4800     36.2000     24.7500
+     84.4000   1536.4700     36.2000     24.7400
+     85.1000   1536.4600     36.2000     24.7300
+     85.7000   1536.4400     36.2000     24.7200
+     86.3000   1536.5300     36.2000     24.7500
+     87.0000   1536.6100     36.2000     24.7800
+     87.6000   1536.5800     36.2000     24.7600
+     88.3000   1536.4200     36.2000     24.6900
+     88.9000   1536.2700     36.2000     24.6300
+     89.5000   1536.2300     36.2000     24.6000
+     90.2000   1536.1900     36.2000     24.5800
+     90.8000   1536.1500     36.2000     24.5600
+     91.5000   1536.1400     36.2000     24.5500
+     92.1000   1536.1400     36.2000     24.5500
+     92.7000   1536.1200     36.2000     24.5400
+     93.4000   1536.0900     36.2000     24.5200
+     94.0000   1536.1600     36.2000     24.5400
+     94.7000   1536.2200     36.2000     24.5600
+     95.3000   1536.2800     36.2000     24.5800
+     96.0000   1536.3200     36.2000     24.6000
+     96.6000   1536.2900     36.2000     24.5800
+     97.2000   1536.1900     36.2000     24.5300
+     97.9000   1536.0600     36.2000     24.4800
+     98.5000   1536.0100     36.2000     24.4500
+     99.2000   1535.9500     36.2000     24.4200
+     99.8000   1535.9300     36.2000     24.4100
+    100.4000   1535.9100     36.2000     24.4000
+    101.1000   1535.9000     36.2000     24.3900
+    101.7000   1535.9200     36.2000     24.3900
+    102.4000   1535.9400     36.2000     24.3900
+    103.0000   1535.9200     36.2000     24.3800
+    103.6000   1535.9300     36.2000     24.3800
+    104.3000   1535.9200     36.2000     24.3700
+    104.9000   1535.8900     36.2000     24.3600
+    105.6000   1535.9000     36.2000     24.3600
+    106.2000   1535.8800     36.2000     24.3400
+    106.8000   1535.8400     36.2000     24.3300
+    107.5000   1535.8100     36.2000     24.3100
+    108.1000   1535.7800     36.2000     24.2900
+    108.8000   1535.7300     36.2000     24.2700
+    109.4000   1535.7000     36.2000     24.2500
+    110.0000   1535.6700     36.2000     24.2300
+    110.7000   1535.5700     36.2000     24.1900
+    111.3000   1535.5000     36.2000     24.1500
+    112.0000   1535.4200     36.2000     24.1200
+    112.6000   1535.3400     36.2000     24.0800
+    113.2000   1535.2600     36.2000     24.0400
+    113.9000   1535.1800     36.2000     24.0100
+    114.5000   1535.0900     36.2000     23.9700
+    115.2000   1535.0500     36.2000     23.9500
+    115.8000   1535.0500     36.2000     23.9400
+    116.4000   1535.0500     36.2000     23.9400
+    117.1000   1535.0400     36.2000     23.9300
+    117.7000   1535.0800     36.2000     23.9400
+    118.4000   1535.1700     36.2000     23.9700
+    119.0000   1535.2200     36.2000     23.9900
+    119.6000   1535.2200     36.2000     23.9900
+    120.3000   1535.2000     36.2000     23.9700
+    120.9000   1535.1600     36.2000     23.9500
+    121.5000   1535.1200     36.2000     23.9300
+    122.2000   1535.0900     36.2000     23.9200
+    122.8000   1535.0600     36.2000     23.9000
+    123.5000   1535.0200     36.2000     23.8800
+    124.1000   1534.9700     36.2000     23.8600
+    124.7000   1534.9100     36.2000     23.8300
+    125.4000   1534.8600     36.2000     23.8000
+    126.0000   1534.7600     36.2000     23.7600
+    126.7000   1534.6600     36.2000     23.7100
+    127.3000   1534.6100     36.2000     23.6900
+    127.9000   1534.6100     36.2000     23.6800
+    128.6000   1534.5800     36.2000     23.6700
+    129.2000   1534.5300     36.2000     23.6400
+    129.9000   1534.4300     36.2000     23.6000
+    130.5000   1534.2700     36.2000     23.5300
+    131.1000   1534.1700     36.2000     23.4900
+    131.8000   1534.1100     36.2000     23.4600
+    132.4000   1534.0700     36.2000     23.4400
+    133.0000   1534.0700     36.2000     23.4300
+    133.7000   1534.0500     36.2000     23.4200
+    134.3000   1534.0300     36.2000     23.4100
+    135.0000   1534.0600     36.2000     23.4200
+    135.6000   1534.0800     36.2000     23.4200
+    136.2000   1534.0800     36.2000     23.4200
+    136.9000   1534.0300     36.2000     23.3900
+    137.5000   1533.9900     36.2000     23.3700
+    138.1000   1533.9100     36.2000     23.3400
+    138.8000   1533.8800     36.2000     23.3200
+    139.4000   1533.8700     36.2000     23.3100
+    140.1000   1533.8400     36.2000     23.2900
+    140.7000   1533.8200     36.2000     23.2800
+    141.3000   1533.7900     36.2000     23.2700
+    142.0000   1533.7700     36.2000     23.2500
+    142.6000   1533.7000     36.2000     23.2300
+    143.3000   1533.5800     36.2000     23.1700
+    143.9000   1533.4200     36.2000     23.1100
+    144.5000   1533.3200     36.2000     23.0600
+    145.2000   1533.2500     36.2000     23.0300
+    145.8000   1533.2300     36.2000     23.0200
+    146.4000   1533.2000     36.2000     23.0000
+    147.1000   1533.1800     36.2000     22.9900
+    147.7000   1533.2400     36.2000     23.0100
+    148.4000   1533.2700     36.2000     23.0200
+    149.0000   1533.2600     36.2000     23.0100
+    149.6000   1533.2700     36.2000     23.0100
+    150.3000   1533.2800     36.2000     23.0100
+    150.9000   1533.2600     36.2000     23.0000
+    151.5000   1533.2300     36.2000     22.9800
+    152.2000   1533.1900     36.2000     22.9600
+    152.8000   1533.0800     36.2000     22.9100
+    153.4000   1532.9300     36.2000     22.8500
+    154.1000   1532.7500     36.2000     22.7700
+    154.7000   1532.5800     36.2000     22.7000
+    155.4000   1532.4800     36.2000     22.6600
+    156.0000   1532.3100     36.2000     22.5900
+    156.6000   1532.1300     36.2000     22.5200
+    157.3000   1531.9900     36.2000     22.4600
+    157.9000   1531.9500     36.2000     22.4400
+    158.5000   1531.9100     36.2000     22.4200
+    159.2000   1531.8700     36.2000     22.4000
+    159.8000   1531.8300     36.2000     22.3800
+    160.4000   1531.7600     36.2000     22.3500
+    161.1000   1531.7300     36.2000     22.3300
+    161.7000   1531.6900     36.2000     22.3100
+    162.4000   1531.6400     36.2000     22.2900
+    163.0000   1531.5300     36.2000     22.2400
+    163.6000   1531.3100     36.2000     22.1600
+    164.3000   1531.1000     36.2000     22.0700
+    164.9000   1530.9600     36.2000     22.0100
+    165.5000   1530.8500     36.2000     21.9700
+    166.2000   1530.7400     36.2000     21.9200
+    166.8000   1530.6400     36.2000     21.8800
+    167.4000   1530.4800     36.2000     21.8100
+    168.1000   1530.3400     36.2000     21.7500
+    168.7000   1530.2600     36.2000     21.7200
+    169.4000   1530.1900     36.2000     21.6900
+    170.0000   1530.1600     36.2000     21.6800
+    170.6000   1530.1700     36.2000     21.6800
+    171.3000   1530.1800     36.2000     21.6700
+    171.9000   1530.2200     36.2000     21.6900
+    172.5000   1530.2200     36.2000     21.6800
+    173.2000   1530.2300     36.2000     21.6800
+    173.8000   1530.2700     36.2000     21.6900
+    174.4000   1530.3100     36.2000     21.7100
+    175.1000   1530.4000     36.2000     21.7300
+    175.7000   1530.4100     36.2000     21.7400
+    176.3000   1530.4300     36.2000     21.7400
+    177.0000   1530.4000     36.2000     21.7200
+    177.6000   1530.3500     36.2000     21.7000
+    178.3000   1530.2400     36.2000     21.6500
+    178.9000   1530.0700     36.2000     21.5800
+    179.5000   1529.9300     36.2000     21.5300
+    180.2000   1529.8200     36.2000     21.4800
+    180.8000   1529.6700     36.2000     21.4200
+    181.4000   1529.5400     36.2000     21.3700
+    182.1000   1529.4600     36.2000     21.3400
+    182.7000   1529.3100     36.2000     21.2700
+    183.3000   1529.1400     36.2000     21.2100
+    184.0000   1528.8900     36.2000     21.1100
+    184.6000   1528.7500     36.2000     21.0500
+    185.2000   1528.5500     36.2000     20.9800
+    185.9000   1528.4400     36.2000     20.9300
+    186.5000   1528.3500     36.2000     20.8900
+    187.1000   1528.2700     36.2000     20.8600
+    187.8000   1528.1900     36.2000     20.8300
+    188.4000   1528.0700     36.2000     20.7800
+    189.0000   1527.9300     36.2000     20.7200
+    189.7000   1527.7400     36.2000     20.6500
+    190.3000   1527.7400     36.2000     20.6400
+    190.9000   1527.6700     36.2000     20.6200
+    191.6000   1527.6000     36.2000     20.5800
+    192.2000   1527.5500     36.2000     20.5600
+    192.9000   1527.4700     36.2000     20.5300
+    193.5000   1527.4700     36.2000     20.5300
+    194.1000   1527.4400     36.2000     20.5100
+    194.8000   1527.3700     36.2000     20.4800
+    195.4000   1527.3400     36.2000     20.4600
+    196.0000   1527.3300     36.2000     20.4600
+    196.7000   1527.3500     36.2000     20.4600
+    197.3000   1527.3500     36.2000     20.4600
+    197.9000   1527.3200     36.2000     20.4400
+    198.6000   1527.2100     36.2000     20.4000
+    199.2000   1527.1400     36.2000     20.3700
+    199.8000   1527.0500     36.2000     20.3300
+    200.5000   1526.9600     36.2000     20.3000
+    201.1000   1526.8600     36.2000     20.2600
+    201.7000   1526.8500     36.2000     20.2500
+    202.4000   1526.7700     36.2000     20.2100
+    203.0000   1526.6900     36.2000     20.1800
+    203.6000   1526.6000     36.2000     20.1500
+    204.3000   1526.4600     36.2000     20.0900
+    204.9000   1526.3900     36.2000     20.0600
+    205.5000   1526.2800     36.2000     20.0200
+    206.2000   1526.1700     36.2000     19.9700
+    206.8000   1526.0200     36.2000     19.9200
+    207.4000   1525.9200     36.2000     19.8800
+    208.1000   1525.8400     36.2000     19.8400
+    208.7000   1525.8000     36.2000     19.8300
+    209.3000   1525.7200     36.2000     19.7900
+    210.0000   1525.6500     36.2000     19.7600
+    210.6000   1525.6000     36.2000     19.7400
+    211.2000   1525.5600     36.2000     19.7200
+    211.9000   1525.4500     36.2000     19.6800
+    212.5000   1525.4200     36.2000     19.6700
+    213.1000   1525.4200     36.2000     19.6600
+    213.8000   1525.3300     36.2000     19.6300
+    214.4000   1525.2900     36.2000     19.6100
+    215.0000   1525.2500     36.2000     19.5900
+    215.7000   1525.2100     36.2000     19.5700
+    216.3000   1525.2000     36.2000     19.5700
+    216.9000   1525.1800     36.2000     19.5500
+    217.6000   1525.1400     36.2000     19.5400
+    218.2000   1525.1100     36.2000     19.5200
+    218.8000   1525.0000     36.2000     19.4800
+    219.4000   1524.8600     36.2000     19.4200
+    220.1000   1524.7600     36.2000     19.3900
+    220.7000   1524.7100     36.2000     19.3600
+    221.3000   1524.6300     36.2000     19.3300
+    222.0000   1524.5800     36.2000     19.3100
+    222.6000   1524.5300     36.2000     19.2900
+    223.2000   1524.4600     36.2000     19.2600
+    223.9000   1524.4200     36.2000     19.2400
+    224.5000   1524.3200     36.2000     19.2000
+    225.1000   1524.2200     36.2000     19.1600
+    225.8000   1524.1200     36.2000     19.1200
+    226.4000   1524.0400     36.2000     19.0900
+    227.0000   1524.0000     36.2000     19.0700
+    227.7000   1523.9500     36.2000     19.0500
+    228.3000   1523.9100     36.2000     19.0400
+    228.9000   1523.8700     36.2000     19.0200
+    229.6000   1523.8400     36.2000     19.0000
+    230.2000   1523.8100     36.2000     18.9900
+    230.8000   1523.7900     36.2000     18.9800
+    231.5000   1523.7000     36.2000     18.9400
+    232.1000   1523.6500     36.2000     18.9200
+    232.7000   1523.6200     36.2000     18.9100
+    233.4000   1523.5500     36.2000     18.8800
+    234.0000   1523.5200     36.2000     18.8700
+    234.6000   1523.4400     36.2000     18.8300
+    235.2000   1523.3100     36.2000     18.7800
+    235.9000   1523.1600     36.2000     18.7300
+    236.5000   1523.0200     36.2000     18.6700
+    237.1000   1522.9100     36.2000     18.6300
+    237.8000   1522.7900     36.2000     18.5900
+    238.4000   1522.6700     36.2000     18.5400
+    239.0000   1522.5700     36.2000     18.5000
+    239.7000   1522.4900     36.2000     18.4700
+    240.3000   1522.3700     36.2000     18.4300
+    240.9000   1522.1800     36.2000     18.3600
+    241.6000   1522.0200     36.2000     18.3000
+    242.2000   1521.9300     36.2000     18.2600
+    242.8000   1521.8800     36.2000     18.2400
+    243.4000   1521.8100     36.2000     18.2100
+    244.1000   1521.7600     36.2000     18.1900
+    244.7000   1521.7000     36.2000     18.1700
+    245.3000   1521.6100     36.2000     18.1400
+    246.0000   1521.5100     36.2000     18.1000
+    246.6000   1521.3300     36.2000     18.0300
+    247.2000   1521.1800     36.2000     17.9800
+    247.9000   1521.0800     36.2000     17.9400
+    248.5000   1520.9900     36.2000     17.9000
+    249.1000   1520.8500     36.2000     17.8500
+    249.8000   1520.7900     36.2000     17.8300
+    250.4000   1520.6600     36.2000     17.7800
+    251.0000   1520.4900     36.2000     17.7200
+    251.6000   1520.4300     36.2000     17.6900
+    252.3000   1520.3700     36.2000     17.6700
+    252.9000   1520.3600     36.2000     17.6600
+    253.5000   1520.3100     36.2000     17.6400
+    254.2000   1520.1800     36.2000     17.6000
+    254.8000   1520.0500     36.2000     17.5500
+    255.4000   1519.9700     36.2000     17.5200
+    256.1000   1519.8900     36.2000     17.4900
+    256.7000   1519.8500     36.2000     17.4700
+    257.3000   1519.7600     36.2000     17.4300
+    257.9000   1519.6600     36.2000     17.4000
+    258.6000   1519.5600     36.2000     17.3600
+    259.2000   1519.4800     36.2000     17.3300
+    259.8000   1519.3900     36.2000     17.3000
+    260.5000   1519.2800     36.2000     17.2600
+    261.1000   1519.2700     36.2000     17.2500
+    261.7000   1519.1900     36.2000     17.2200
+    262.4000   1519.1200     36.2000     17.1900
+    263.0000   1519.1200     36.2000     17.1900
+    263.6000   1519.1300     36.2000     17.1900
+    264.2000   1519.0800     36.2000     17.1700
+    264.9000   1519.0300     36.2000     17.1500
+    265.5000   1519.0000     36.2000     17.1300
+    266.1000   1518.8900     36.2000     17.0900
+    266.8000   1518.6900     36.2000     17.0200
+    267.4000   1518.4700     36.2000     16.9400
+    268.0000   1518.3500     36.2000     16.9000
+    268.6000   1518.2800     36.2000     16.8800
+    269.3000   1518.2600     36.2000     16.8700
+    269.9000   1518.2100     36.2000     16.8400
+    270.5000   1518.0700     36.2000     16.7900
+    271.2000   1518.0300     36.2000     16.7800
+    271.8000   1517.9900     36.2000     16.7600
+    272.4000   1517.9300     36.2000     16.7400
+    273.0000   1517.9000     36.2000     16.7200
+    273.7000   1517.8100     36.2000     16.6900
+    274.3000   1517.7000     36.2000     16.6500
+    274.9000   1517.6400     36.2000     16.6300
+    275.6000   1517.6100     36.2000     16.6200
+    276.2000   1517.5200     36.2000     16.5800
+    276.8000   1517.4100     36.2000     16.5400
+    277.4000   1517.2700     36.2000     16.4900
+    278.1000   1517.1900     36.2000     16.4600
+    278.7000   1517.1700     36.2000     16.4500
+    279.3000   1517.0900     36.2000     16.4200
+    280.0000   1517.0000     36.2000     16.3900
+    280.6000   1516.9900     36.2000     16.3800
+    281.2000   1517.0100     36.2000     16.3800
+    281.8000   1516.9200     36.2000     16.3500
+    282.5000   1516.8800     36.2000     16.3400
+    283.1000   1516.9200     36.2000     16.3400
+    283.7000   1516.9000     36.2000     16.3400
+    284.4000   1516.8900     36.2000     16.3300
+    285.0000   1516.8900     36.2000     16.3300
+    285.6000   1516.9000     36.2000     16.3300
+    286.2000   1516.8500     36.2000     16.3000
+    286.9000   1516.7200     36.2000     16.2600
+    287.5000   1516.5600     36.2000     16.2000
+    288.1000   1516.4300     36.2000     16.1600
+    288.7000   1516.3800     36.2000     16.1400
+    289.4000   1516.3100     36.2000     16.1100
+    290.0000   1516.2300     36.2000     16.0800
+    290.6000   1516.1500     36.2000     16.0500
+    291.3000   1516.1200     36.2000     16.0400
+    291.9000   1516.1000     36.2000     16.0300
+    292.5000   1516.0100     36.2000     16.0000
+    293.1000   1515.9800     36.2000     15.9800
+    293.8000   1515.9400     36.2000     15.9700
+    294.4000   1515.8800     36.2000     15.9500
+    295.0000   1515.8400     36.2000     15.9300
+    295.7000   1515.7800     36.2000     15.9100
+    296.3000   1515.6100     36.2000     15.8500
+    296.9000   1515.4600     36.2000     15.7900
+    297.5000   1515.3100     36.2000     15.7400
+    298.2000   1515.1400     36.2000     15.6800
+    298.8000   1515.0400     36.2000     15.6500
+    299.4000   1514.8500     36.2000     15.5800
+    300.0000   1514.6600     36.2000     15.5200
+    300.7000   1514.4000     36.2000     15.4300
+    301.3000   1514.2000     36.2000     15.3700
+    301.9000   1514.1000     36.2000     15.3300
+    302.5000   1514.0100     36.2000     15.3000
+    303.2000   1513.8500     36.2000     15.2400
+    303.8000   1513.6100     36.2000     15.1600
+    304.4000   1513.4900     36.2000     15.1200
+    305.1000   1513.4500     36.2000     15.1000
+    305.7000   1513.4100     36.2000     15.0900
+    306.3000   1513.2500     36.2000     15.0400
+    306.9000   1513.0900     36.2000     14.9800
+    307.6000   1512.9800     36.2000     14.9400
+    308.2000   1512.8900     36.2000     14.9100
+    308.8000   1512.7900     36.2000     14.8800
+    309.4000   1512.7100     36.2000     14.8500
+    310.1000   1512.6800     36.2000     14.8300
+    310.7000   1512.6300     36.2000     14.8200
+    311.3000   1512.6400     36.2000     14.8200
+    311.9000   1512.6200     36.2000     14.8100
+    312.6000   1512.4900     36.2000     14.7600
+    313.2000   1512.3200     36.2000     14.7000
+    313.8000   1512.1800     36.2000     14.6600
+    314.4000   1512.0700     36.2000     14.6200
+    315.1000   1512.0000     36.2000     14.6000
+    315.7000   1511.9600     36.2000     14.5800
+    316.3000   1511.8700     36.2000     14.5500
+    316.9000   1511.8400     36.2000     14.5300
+    317.6000   1511.7000     36.2000     14.4900
+    318.2000   1511.5700     36.2000     14.4400
+    318.8000   1511.4300     36.2000     14.4000
+    319.5000   1511.3700     36.2000     14.3700
+    320.1000   1511.3800     36.2000     14.3800
+    320.7000   1511.3200     36.2000     14.3500
+    321.3000   1511.2600     36.2000     14.3300
+    322.0000   1511.2200     36.2000     14.3200
+    322.6000   1511.2000     36.2000     14.3000
+    323.2000   1511.0800     36.2000     14.2600
+    323.8000   1510.9100     36.2000     14.2100
+    324.5000   1510.8200     36.2000     14.1800
+    325.1000   1510.7700     36.2000     14.1600
+    325.7000   1510.7500     36.2000     14.1500
+    326.3000   1510.7600     36.2000     14.1500
+    327.0000   1510.7400     36.2000     14.1400
+    327.6000   1510.6500     36.2000     14.1100
+    328.2000   1510.5100     36.2000     14.0600
+    328.8000   1510.4400     36.2000     14.0400
+    329.5000   1510.3700     36.2000     14.0100
+    330.1000   1510.3100     36.2000     13.9900
+    330.7000   1510.2000     36.2000     13.9600
+    331.3000   1510.1100     36.2000     13.9200
+    332.0000   1510.0500     36.2000     13.9000
+    332.6000   1509.9200     36.2000     13.8600
+    333.2000   1509.8300     36.2000     13.8300
+    333.8000   1509.7500     36.2000     13.8000
+    334.5000   1509.7000     36.2000     13.7800
+    335.1000   1509.6700     36.2000     13.7700
+    335.7000   1509.6100     36.2000     13.7500
+    336.3000   1509.5800     36.2000     13.7300
+    336.9000   1509.5000     36.2000     13.7100
+    337.6000   1509.3700     36.2000     13.6600
+    338.2000   1509.2500     36.2000     13.6200
+    338.8000   1509.1700     36.2000     13.6000
+    339.4000   1509.0300     36.2000     13.5500
+    340.1000   1508.9500     36.2000     13.5200
+    340.7000   1508.8700     36.2000     13.4900
+    341.3000   1508.8300     36.2000     13.4800
+    341.9000   1508.7400     36.2000     13.4500
+    342.6000   1508.6400     36.2000     13.4200
+    343.2000   1508.5800     36.2000     13.3900
+    343.8000   1508.5400     36.2000     13.3800
+    344.4000   1508.4900     36.2000     13.3600
+    345.1000   1508.4600     36.2000     13.3500
+    345.7000   1508.4000     36.2000     13.3300
+    346.3000   1508.3000     36.2000     13.2900
+    346.9000   1508.2500     36.2000     13.2700
+    347.6000   1508.2200     36.2000     13.2600
+    348.2000   1508.1000     36.2000     13.2200
+    348.8000   1507.9400     36.2000     13.1700
+    349.4000   1507.7600     36.2000     13.1100
+    350.0000   1507.6400     36.2000     13.0800
+    350.7000   1507.5600     36.2000     13.0500
+    351.3000   1507.4400     36.2000     13.0100
+    351.9000   1507.3300     36.2000     12.9700
+    352.5000   1507.2300     36.2000     12.9400
+    353.2000   1507.1600     36.2000     12.9100
+    353.8000   1507.0900     36.2000     12.8900
+    354.4000   1506.8900     36.2000     12.8300
+    355.0000   1506.7200     36.2000     12.7700
+    355.7000   1506.6300     36.2000     12.7400
+    356.3000   1506.6200     36.2000     12.7400
+    356.9000   1506.5900     36.2000     12.7200
+    357.5000   1506.5800     36.2000     12.7200
+    358.1000   1506.5600     36.2000     12.7100
+    358.8000   1506.5400     36.2000     12.7000
+    359.4000   1506.5100     36.2000     12.6900
+    360.0000   1506.4700     36.2000     12.6700
+    360.6000   1506.4500     36.2000     12.6600
+    361.3000   1506.4800     36.2000     12.6700
+    361.9000   1506.4000     36.2000     12.6400
+    362.5000   1506.3700     36.2000     12.6300
+    363.1000   1506.3000     36.2000     12.6100
+    363.8000   1506.2400     36.2000     12.5800
+    364.4000   1506.1000     36.2000     12.5400
+    365.0000   1505.9800     36.2000     12.5000
+    365.6000   1505.8200     36.2000     12.4500
+    366.2000   1505.6900     36.2000     12.4100
+    366.9000   1505.6500     36.2000     12.4000
+    367.5000   1505.5800     36.2000     12.3700
+    368.1000   1505.5200     36.2000     12.3500
+    368.7000   1505.4600     36.2000     12.3300
+    369.4000   1505.4200     36.2000     12.3100
+    370.0000   1505.3400     36.2000     12.2900
+    370.6000   1505.2000     36.2000     12.2400
+    371.2000   1504.9700     36.2000     12.1700
+    371.8000   1504.7300     36.2000     12.1000
+    372.5000   1504.5800     36.2000     12.0500
+    373.1000   1504.5100     36.2000     12.0300
+    373.7000   1504.4300     36.2000     12.0000
+    374.3000   1504.2100     36.2000     11.9300
+    375.0000   1504.1300     36.2000     11.9100
+    375.6000   1504.1700     36.2000     11.9100
+    376.2000   1504.2000     36.2000     11.9200
+    376.8000   1504.1900     36.2000     11.9200
+    377.4000   1504.1100     36.2000     11.8900
+    378.1000   1504.0200     36.2000     11.8600
+    378.7000   1503.9600     36.2000     11.8400
+    379.3000   1503.8700     36.2000     11.8100
+    379.9000   1503.7800     36.2000     11.7800
+    380.5000   1503.7000     36.2000     11.7500
+    381.2000   1503.7600     36.2000     11.7700
+    381.8000   1503.8000     36.2000     11.7800
+    382.4000   1503.6400     36.2000     11.7300
+    383.0000   1503.5200     36.2000     11.6900
+    383.6000   1503.4700     36.2000     11.6700
+    384.3000   1503.5500     36.2000     11.6900
+    384.9000   1503.5500     36.2000     11.6900
+    385.5000   1503.4100     36.2000     11.6500
+    386.1000   1503.2300     36.2000     11.5900
+    386.8000   1503.1000     36.2000     11.5500
+    387.4000   1502.9800     36.2000     11.5100
+    388.0000   1502.9300     36.2000     11.4900
+    388.6000   1502.9700     36.2000     11.5000
+    389.2000   1502.8500     36.2000     11.4700
+    389.9000   1502.7500     36.2000     11.4300
+    390.5000   1502.7200     36.2000     11.4200
+    391.1000   1502.7200     36.2000     11.4200
+    391.7000   1502.7100     36.2000     11.4100
+    392.3000   1502.6100     36.2000     11.3800
+    393.0000   1502.6600     36.2000     11.3900
+    393.6000   1502.7300     36.2000     11.4100
+    394.2000   1502.7800     36.2000     11.4200
+    394.8000   1502.7100     36.2000     11.4000
+    395.4000   1502.6500     36.2000     11.3800
+    396.1000   1502.5800     36.2000     11.3500
+    396.7000   1502.5400     36.2000     11.3400
+    397.3000   1502.4800     36.2000     11.3200
+    397.9000   1502.4900     36.2000     11.3200
+    398.5000   1502.3900     36.2000     11.2900
+    399.2000   1502.2700     36.2000     11.2500
+    399.8000   1502.1900     36.2000     11.2200
+    400.4000   1502.1400     36.2000     11.2100
+    401.0000   1502.0600     36.2000     11.1800
+    401.6000   1502.0100     36.2000     11.1600
+    402.3000   1501.9400     36.2000     11.1400
+    402.9000   1501.7600     36.2000     11.0900
+    403.5000   1501.6300     36.2000     11.0500
+    404.1000   1501.8200     36.2000     11.1000
+    404.7000   1501.8700     36.2000     11.1100
+    405.4000   1501.8000     36.2000     11.0800
+    406.0000   1501.7600     36.2000     11.0700
+    406.6000   1501.7700     36.2000     11.0700
+    407.2000   1501.6900     36.2000     11.0400
+    407.8000   1501.7300     36.2000     11.0500
+    408.5000   1501.6000     36.2000     11.0100
+    409.1000   1501.4300     36.2000     10.9600
+    409.7000   1501.3000     36.2000     10.9200
+    410.3000   1501.1400     36.2000     10.8700
+    410.9000   1501.0600     36.2000     10.8500
+    411.6000   1501.0000     36.2000     10.8300
+    412.2000   1500.8800     36.2000     10.7900
+    412.8000   1500.8000     36.2000     10.7600
+    413.4000   1500.6200     36.2000     10.7100
+    414.0000   1500.5400     36.2000     10.6800
+    414.6000   1500.5000     36.2000     10.6700
+    415.3000   1500.3900     36.2000     10.6400
+    415.9000   1500.3300     36.2000     10.6200
+    416.5000   1500.2600     36.2000     10.5900
+    417.1000   1500.2300     36.2000     10.5800
+    417.7000   1500.2400     36.2000     10.5800
+    418.4000   1500.2500     36.2000     10.5800
+    419.0000   1500.2500     36.2000     10.5800
+    419.6000   1500.2100     36.2000     10.5700
+    420.2000   1500.1900     36.2000     10.5600
+    420.8000   1500.0600     36.2000     10.5200
+    421.5000   1499.9500     36.2000     10.4800
+    422.1000   1499.8700     36.2000     10.4600
+    422.7000   1499.7700     36.2000     10.4300
+    423.3000   1499.6700     36.2000     10.3900
+    423.9000   1499.6400     36.2000     10.3800
+    424.5000   1499.6800     36.2000     10.3900
+    425.2000   1499.7100     36.2000     10.4000
+    425.8000   1499.6200     36.2000     10.3700
+    426.4000   1499.6200     36.2000     10.3700
+    427.0000   1499.6200     36.2000     10.3600
+    427.6000   1499.5900     36.2000     10.3500
+    428.3000   1499.5700     36.2000     10.3400
+    428.9000   1499.5100     36.2000     10.3200
+    429.5000   1499.4900     36.2000     10.3200
+    430.1000   1499.4800     36.2000     10.3100
+    430.7000   1499.4300     36.2000     10.2900
+    431.3000   1499.2500     36.2000     10.2400
+    432.0000   1499.3500     36.2000     10.2700
+    432.6000   1499.4600     36.2000     10.2900
+    433.2000   1499.5800     36.2000     10.3200
+    433.8000   1499.5200     36.2000     10.3000
+    434.4000   1499.4700     36.2000     10.2900
+    435.0000   1499.4000     36.2000     10.2600
+    435.7000   1499.3500     36.2000     10.2500
+    436.3000   1499.3100     36.2000     10.2300
+    436.9000   1499.2700     36.2000     10.2200
+    437.5000   1499.2600     36.2000     10.2100
+    438.1000   1499.1400     36.2000     10.1800
+    438.8000   1499.0500     36.2000     10.1500
+    439.4000   1498.9300     36.2000     10.1100
+    440.0000   1498.8700     36.2000     10.0900
+    440.6000   1498.8800     36.2000     10.0900
+    441.2000   1498.7500     36.2000     10.0500
+    441.8000   1498.6500     36.2000     10.0200
+    442.5000   1498.4200     36.2000      9.9500
+    443.1000   1498.1600     36.2000      9.8800
+    443.7000   1498.0600     36.2000      9.8500
+    444.3000   1497.9600     36.2000      9.8200
+    444.9000   1497.9600     36.2000      9.8200
+    445.5000   1498.0200     36.2000      9.8300
+    446.2000   1498.1200     36.2000      9.8500
+    446.8000   1498.0800     36.2000      9.8400
+    447.4000   1498.0600     36.2000      9.8300
+    448.0000   1498.0900     36.2000      9.8400
+    448.6000   1498.1400     36.2000      9.8500
+    449.2000   1498.1300     36.2000      9.8400
+    449.9000   1498.1900     36.2000      9.8600
+    450.5000   1498.2300     36.2000      9.8700
+    451.1000   1498.1800     36.2000      9.8500
+    451.7000   1498.1400     36.2000      9.8300
+    452.3000   1497.9900     36.2000      9.7900
+    452.9000   1497.8100     36.2000      9.7400
+    453.6000   1497.6800     36.2000      9.7000
+    454.2000   1497.5700     36.2000      9.6600
+    454.8000   1497.5000     36.2000      9.6400
+    455.4000   1497.4400     36.2000      9.6200
+    456.0000   1497.4200     36.2000      9.6200
+    456.6000   1497.4500     36.2000      9.6200
+    457.3000   1497.4100     36.2000      9.6100
+    457.9000   1497.4600     36.2000      9.6200
+    458.5000   1497.4900     36.2000      9.6200
+    459.1000   1497.4100     36.2000      9.6000
+    459.7000   1497.3300     36.2000      9.5700
+    460.3000   1497.3100     36.2000      9.5700
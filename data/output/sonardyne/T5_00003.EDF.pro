@@ -0,0 +1,2912 @@
+test_read_store_and_write
+1/1/2011
+7:31:24
+Probe: T-5
+Source: /root/package/data/input/sippican/T5_00003.EDF
+      0.0000   1496.9800     30.0000     13.8100
+      0.6800   1495.5600     30.0000     13.3800
+      1.3700   1495.2100     30.0000     13.2700
+      2.0500   1495.1000     30.0000     13.2400
+      2.7300   1495.0700     30.0000     13.2300
+      3.4100   1495.0700     30.0000     13.2200
+      4.1000   1495.0200     30.0000     13.2000
+      4.7800   1495.0500     30.0000     13.2100
+      5.4600   1495.1100     30.0000     13.2200
+      6.1400   1495.1500     30.0000     13.2300
+      6.8300   1495.1800     30.0000     13.2400
+      7.5100   1495.1900     30.0000     13.2400
+      8.1900   1495.2000     30.0000     13.2400
+      8.8700   1495.2200     30.0000     13.2400
+      9.5600   1495.2100     30.0000     13.2300
+     10.2400   1495.2200     30.0000     13.2300
+     10.9200   1495.2300     30.0000     13.2300
+     11.6000   1495.2300     30.0000     13.2300
+     12.2800   1495.2300     30.0000     13.2300
+     12.9700   1495.2400     30.0000     13.2300
+     13.6500   1495.2600     30.0000     13.2300
+     14.3300   1495.2500     30.0000     13.2200
+     15.0100   1495.2600     30.0000     13.2200
+     15.6900   1495.2600     30.0000     13.2200
+     16.3800   1495.2800     30.0000     13.2200
+     17.0600   1495.2800     30.0000     13.2200
+     17.7400   1495.2700     30.0000     13.2100
+     18.4200   1495.2800     30.0000     13.2100
+     19.1000   1495.2800     30.0000     13.2100
+     19.7900   1495.3000     30.0000     13.2100
+     20.4700   1495.2900     30.0000     13.2100
+     21.1500   1495.3000     30.0000     13.2000
+     21.8300   1495.3200     30.0000     13.2100
+     22.5100   1495.3400     30.0000     13.2100
+     23.1900   1495.3400     30.0000     13.2100
+     23.8800   1495.3400     30.0000     13.2000
+     24.5600   1495.3600     30.0000     13.2000
+     25.2400   1495.3700     30.0000     13.2000
+     25.9200   1495.3700     30.0000     13.2000
+     26.6000   1495.3800     30.0000     13.2000
+     27.2800   1495.3900     30.0000     13.2000
+     27.9600   1495.4000     30.0000     13.2000
+     28.6500   1495.4100     30.0000     13.2000
+     29.3300   1495.4200     30.0000     13.2000
+     30.0100   1495.4300     30.0000     13.2000
+     30.6900   1495.4400     30.0000     13.2000
+     31.3700   1495.4400     30.0000     13.2000
+     32.0500   1495.4400     30.0000     13.1900
+     32.7300   1495.4500     30.0000     13.1900
+     33.4100   1495.4500     30.0000     13.1900
+     34.0900   1495.4400     30.0000     13.1800
+     34.7800   1495.4500     30.0000     13.1800
+     35.4600   1495.4600     30.0000     13.1800
+     36.1400   1495.4500     30.0000     13.1800
+     36.8200   1495.4500     30.0000     13.1700
+     37.5000   1495.4500     30.0000     13.1700
+     38.1800   1495.4400     30.0000     13.1600
+     38.8600   1495.4200     30.0000     13.1500
+     39.5400   1495.4000     30.0000     13.1400
+     40.2200   1495.3700     30.0000     13.1300
+     40.9000   1495.3200     30.0000     13.1100
+     41.5800   1495.3100     30.0000     13.1100
+     42.2600   1495.3000     30.0000     13.1000
+     42.9400   1495.3100     30.0000     13.1000
+     43.6200   1495.3000     30.0000     13.0900
+     44.3100   1495.3100     30.0000     13.0900
+     44.9900   1495.3200     30.0000     13.0900
+     45.6700   1495.3400     30.0000     13.1000
+     46.3500   1495.3600     30.0000     13.1000
+     47.0300   1495.3800     30.0000     13.1000
+     47.7100   1495.4000     30.0000     13.1000
+     48.3900   1495.4000     30.0000     13.1000
+     49.0700   1495.4000     30.0000     13.1000
+     49.7500   1495.3800     30.0000     13.0900
+     50.4300   1495.3600     30.0000     13.0800
+     51.1100   1495.3600     30.0000     13.0800
+     51.7900   1495.3700     30.0000     13.0700
+     52.4700   1495.3800     30.0000     13.0700
+     53.1500   1495.4000     30.0000     13.0800
+     53.8300   1495.4000     30.0000     13.0700
+     54.5100   1495.4000     30.0000     13.0700
+     55.1900   1495.4100     30.0000     13.0700
+     55.8700   1495.4200     30.0000     13.0700
+     56.5500   1495.4400     30.0000     13.0700
+     57.2300   1495.4900     30.0000     13.0800
+     57.9100   1495.5700     30.0000     13.1000
+     58.5900   1495.6200     30.0000     13.1100
+     59.2700   1495.6400     30.0000     13.1200
+     59.9500   1495.6600     30.0000     13.1200
+     60.6300   1495.6700     30.0000     13.1200
+     61.3000   1495.6800     30.0000     13.1200
+     61.9800   1495.7000     30.0000     13.1200
+     62.6600   1495.6900     30.0000     13.1200
+     63.3400   1495.6800     30.0000     13.1100
+     64.0200   1495.6800     30.0000     13.1100
+     64.7000   1495.6900     30.0000     13.1100
+     65.3800   1495.7000     30.0000     13.1100
+     66.0600   1495.7200     30.0000     13.1100
+     66.7400   1495.7200     30.0000     13.1100
+     67.4200   1495.7100     30.0000     13.1000
+     68.1000   1495.7200     30.0000     13.1000
+     68.7800   1495.7100     30.0000     13.0900
+     69.4600   1495.7000     30.0000     13.0900
+     70.1400   1495.7100     30.0000     13.0800
+     70.8100   1495.7200     30.0000     13.0800
+     71.4900   1495.7200     30.0000     13.0800
+     72.1700   1495.7300     30.0000     13.0800
+     72.8500   1495.7300     30.0000     13.0800
+     73.5300   1495.7400     30.0000     13.0800
+     74.2100   1495.7400     30.0000     13.0800
+     74.8900   1495.7600     30.0000     13.0800
+     75.5700   1495.7700     30.0000     13.0800
+     76.2500   1495.8000     30.0000     13.0800
+     76.9200   1495.8400     30.0000     13.0900
+     77.6000   1495.8700     30.0000     13.1000
+     78.2800   1495.8900     30.0000     13.1000
+     78.9600   1495.9000     30.0000     13.1000
+     79.6400   1495.9200     30.0000     13.1000
+     80.3200   1495.9400     30.0000     13.1000
+     81.0000   1495.9800     30.0000     13.1100
+     81.6700   1496.0100     30.0000     13.1200
+     82.3500   1496.0200     30.0000     13.1200
+     83.0300   1496.0500     30.0000     13.1200
+     83.7100   1496.0700     30.0000     13.1300
+     84.3900   1496.0900     30.0000     13.1300
+     85.0700   1496.0900     30.0000     13.1300
+     85.7400   1496.1000     30.0000     13.1200
+     86.4200   1496.1200     30.0000     13.1300
+     87.1000   1496.1400     30.0000     13.1300
+     87.7800   1496.1700     30.0000     13.1400
+     88.4600   1496.2100     30.0000     13.1400
+     89.1300   1496.2500     30.0000     13.1500
+     89.8100   1496.2800     30.0000     13.1600
+     90.4900   1496.2900     30.0000     13.1600
+     91.1700   1496.3200     30.0000     13.1600
+     91.8500   1496.3400     30.0000     13.1700
+     92.5200   1496.3600     30.0000     13.1700
+     93.2000   1496.3700     30.0000     13.1700
+     93.8800   1496.3800     30.0000     13.1700
+     94.5600   1496.4000     30.0000     13.1700
+     95.2400   1496.4100     30.0000     13.1700
+     95.9100   1496.4200     30.0000     13.1700
+     96.5900   1496.4300     30.0000     13.1700
+     97.2700   1496.4500     30.0000     13.1700
+     97.9500   1496.4600     30.0000     13.1700
+     98.6200   1496.4800     30.0000     13.1700
+     99.3000   1496.5000     30.0000     13.1800
+     99.9800   1496.5200     30.0000     13.1800
+    100.6600   1496.5400     30.0000     13.1800
+    101.3300   1496.5500     30.0000     13.1800
+    102.0100   1496.5600     30.0000     13.1800
+    102.6900   1496.5800     30.0000     13.1800
+    103.3700   1496.5900     30.0000     13.1800
+    104.0400   1496.6000     30.0000     13.1800
+    104.7200   1496.6100     30.0000     13.1800
+    105.4000   1496.6200     30.0000     13.1800
+    106.0700   1496.6400     30.0000     13.1800
+    106.7500   1496.6500     30.0000     13.1900
+    107.4300   1496.6700     30.0000     13.1900
+    108.1100   1496.6800     30.0000     13.1900
+    108.7800   1496.7000     30.0000     13.1900
+    109.4600   1496.7200     30.0000     13.1900
+    110.1400   1496.7500     30.0000     13.2000
+    110.8100   1496.7700     30.0000     13.2000
+    111.4900   1496.7900     30.0000     13.2000
+    112.1700   1496.8000     30.0000     13.2000
+    112.8400   1496.8200     30.0000     13.2100
+    113.5200   1496.8400     30.0000     13.2100
+    114.2000   1496.8400     30.0000     13.2100
+    114.8700   1496.8600     30.0000     13.2100
+    115.5500   1496.8600     30.0000     13.2100
+    116.2300   1496.8700     30.0000     13.2100
+    116.9000   1496.8800     30.0000     13.2100
+    117.5800   1496.8900     30.0000     13.2000
+    118.2600   1496.9000     30.0000     13.2000
+    118.9300   1496.9100     30.0000     13.2000
+    119.6100   1496.9100     30.0000     13.2000
+    120.2900   1496.9100     30.0000     13.2000
+    120.9600   1496.9100     30.0000     13.1900
+    121.6400   1496.9300     30.0000     13.1900
+    122.3100   1496.9200     30.0000     13.1900
+    122.9900   1496.9200     30.0000     13.1900
+    123.6700   1496.9200     30.0000     13.1800
+    124.3400   1496.8700     30.0000     13.1600
+    125.0200   1496.8300     30.0000     13.1500
+    125.7000   1496.7800     30.0000     13.1300
+    126.3700   1496.7100     30.0000     13.1100
+    127.0500   1496.6600     30.0000     13.0900
+    127.7200   1496.6200     30.0000     13.0700
+    128.4000   1496.6000     30.0000     13.0700
+    129.0700   1496.6000     30.0000     13.0600
+    129.7500   1496.5900     30.0000     13.0600
+    130.4300   1496.6000     30.0000     13.0500
+    131.1000   1496.5800     30.0000     13.0500
+    131.7800   1496.5800     30.0000     13.0400
+    132.4500   1496.5800     30.0000     13.0400
+    133.1300   1496.5600     30.0000     13.0300
+    133.8100   1496.5400     30.0000     13.0200
+    134.4800   1496.5200     30.0000     13.0100
+    135.1600   1496.4700     30.0000     12.9900
+    135.8300   1496.4200     30.0000     12.9800
+    136.5100   1496.4000     30.0000     12.9600
+    137.1800   1496.3600     30.0000     12.9500
+    137.8600   1496.3400     30.0000     12.9400
+    138.5300   1496.3400     30.0000     12.9400
+    139.2100   1496.3400     30.0000     12.9400
+    139.8800   1496.3300     30.0000     12.9300
+    140.5600   1496.3000     30.0000     12.9200
+    141.2300   1496.2900     30.0000     12.9100
+    141.9100   1496.3000     30.0000     12.9100
+    142.5900   1496.3100     30.0000     12.9100
+    143.2600   1496.3300     30.0000     12.9100
+    143.9400   1496.3400     30.0000     12.9100
+    144.6100   1496.3400     30.0000     12.9100
+    145.2900   1496.3600     30.0000     12.9100
+    145.9600   1496.3700     30.0000     12.9100
+    146.6400   1496.3700     30.0000     12.9100
+    147.3100   1496.3700     30.0000     12.9000
+    147.9900   1496.3700     30.0000     12.9000
+    148.6600   1496.3700     30.0000     12.9000
+    149.3400   1496.3800     30.0000     12.9000
+    150.0100   1496.4100     30.0000     12.9000
+    150.6800   1496.4300     30.0000     12.9100
+    151.3600   1496.4200     30.0000     12.9000
+    152.0300   1496.4400     30.0000     12.9000
+    152.7100   1496.4500     30.0000     12.9000
+    153.3800   1496.4800     30.0000     12.9100
+    154.0600   1496.4900     30.0000     12.9100
+    154.7300   1496.5000     30.0000     12.9100
+    155.4100   1496.5300     30.0000     12.9100
+    156.0800   1496.5400     30.0000     12.9100
+    156.7600   1496.5600     30.0000     12.9100
+    157.4300   1496.5800     30.0000     12.9200
+    158.1000   1496.6200     30.0000     12.9300
+    158.7800   1496.6400     30.0000     12.9300
+    159.4500   1496.6800     30.0000     12.9400
+    160.1300   1496.7000     30.0000     12.9400
+    160.8000   1496.7200     30.0000     12.9400
+    161.4800   1496.7500     30.0000     12.9500
+    162.1500   1496.7700     30.0000     12.9500
+    162.8200   1496.7900     30.0000     12.9500
+    163.5000   1496.7900     30.0000     12.9500
+    164.1700   1496.8100     30.0000     12.9500
+    164.8500   1496.8300     30.0000     12.9500
+    165.5200   1496.8600     30.0000     12.9600
+    166.1900   1496.8800     30.0000     12.9600
+    166.8700   1496.9100     30.0000     12.9700
+    167.5400   1496.9200     30.0000     12.9700
+    168.2200   1496.9100     30.0000     12.9600
+    168.8900   1496.9200     30.0000     12.9600
+    169.5600   1496.9300     30.0000     12.9600
+    170.2400   1496.9500     30.0000     12.9600
+    170.9100   1496.9500     30.0000     12.9600
+    171.5800   1496.9700     30.0000     12.9600
+    172.2600   1497.0000     30.0000     12.9700
+    172.9300   1497.0300     30.0000     12.9700
+    173.6000   1497.0600     30.0000     12.9800
+    174.2800   1497.0800     30.0000     12.9800
+    174.9500   1497.0800     30.0000     12.9800
+    175.6200   1497.1000     30.0000     12.9800
+    176.3000   1497.1400     30.0000     12.9900
+    176.9700   1497.1700     30.0000     13.0000
+    177.6400   1497.2000     30.0000     13.0000
+    178.3200   1497.2300     30.0000     13.0100
+    178.9900   1497.2600     30.0000     13.0100
+    179.6600   1497.3000     30.0000     13.0200
+    180.3400   1497.3800     30.0000     13.0400
+    181.0100   1497.4500     30.0000     13.0600
+    181.6800   1497.5100     30.0000     13.0700
+    182.3600   1497.5600     30.0000     13.0800
+    183.0300   1497.6000     30.0000     13.0900
+    183.7000   1497.6300     30.0000     13.1000
+    184.3800   1497.6400     30.0000     13.1000
+    185.0500   1497.6600     30.0000     13.1000
+    185.7200   1497.6700     30.0000     13.1000
+    186.3900   1497.6900     30.0000     13.1000
+    187.0700   1497.7100     30.0000     13.1100
+    187.7400   1497.7300     30.0000     13.1100
+    188.4100   1497.7600     30.0000     13.1100
+    189.0800   1497.7800     30.0000     13.1200
+    189.7600   1497.8000     30.0000     13.1200
+    190.4300   1497.8300     30.0000     13.1300
+    191.1000   1497.8500     30.0000     13.1300
+    191.7700   1497.8800     30.0000     13.1300
+    192.4500   1497.9100     30.0000     13.1400
+    193.1200   1497.9400     30.0000     13.1500
+    193.7900   1497.9700     30.0000     13.1500
+    194.4600   1498.0000     30.0000     13.1600
+    195.1400   1498.0300     30.0000     13.1600
+    195.8100   1498.0600     30.0000     13.1700
+    196.4800   1498.0900     30.0000     13.1700
+    197.1500   1498.1300     30.0000     13.1800
+    197.8300   1498.1700     30.0000     13.1900
+    198.5000   1498.2200     30.0000     13.2000
+    199.1700   1498.2800     30.0000     13.2200
+    199.8400   1498.3300     30.0000     13.2300
+    200.5100   1498.3800     30.0000     13.2400
+    201.1900   1498.4600     30.0000     13.2600
+    201.8600   1498.5500     30.0000     13.2800
+    202.5300   1498.6100     30.0000     13.3000
+    203.2000   1498.6400     30.0000     13.3000
+    203.8700   1498.6500     30.0000     13.3000
+    204.5500   1498.6500     30.0000     13.3000
+    205.2200   1498.6700     30.0000     13.3000
+    205.8900   1498.7000     30.0000     13.3100
+    206.5600   1498.7400     30.0000     13.3200
+    207.2300   1498.7700     30.0000     13.3200
+    207.9000   1498.8000     30.0000     13.3300
+    208.5800   1498.8100     30.0000     13.3300
+    209.2500   1498.8300     30.0000     13.3300
+    209.9200   1498.8400     30.0000     13.3300
+    210.5900   1498.8600     30.0000     13.3300
+    211.2600   1498.8800     30.0000     13.3400
+    211.9300   1498.9100     30.0000     13.3400
+    212.6000   1498.9500     30.0000     13.3500
+    213.2800   1498.9900     30.0000     13.3600
+    213.9500   1499.0300     30.0000     13.3700
+    214.6200   1499.0700     30.0000     13.3800
+    215.2900   1499.1000     30.0000     13.3800
+    215.9600   1499.1200     30.0000     13.3800
+    216.6300   1499.1300     30.0000     13.3900
+    217.3000   1499.1500     30.0000     13.3900
+    217.9700   1499.1900     30.0000     13.4000
+    218.6500   1499.2500     30.0000     13.4100
+    219.3200   1499.2900     30.0000     13.4200
+    219.9900   1499.3100     30.0000     13.4200
+    220.6600   1499.3200     30.0000     13.4200
+    221.3300   1499.3200     30.0000     13.4200
+    222.0000   1499.3400     30.0000     13.4200
+    222.6700   1499.3400     30.0000     13.4200
+    223.3400   1499.3300     30.0000     13.4100
+    224.0100   1499.3400     30.0000     13.4100
+    224.6800   1499.3300     30.0000     13.4000
+    225.3500   1499.3300     30.0000     13.4000
+    226.0200   1499.3300     30.0000     13.4000
+    226.7000   1499.3200     30.0000     13.3900
+    227.3700   1499.3200     30.0000     13.3900
+    228.0400   1499.3300     30.0000     13.3900
+    228.7100   1499.3300     30.0000     13.3800
+    229.3800   1499.3500     30.0000     13.3900
+    230.0500   1499.3500     30.0000     13.3800
+    230.7200   1499.3600     30.0000     13.3800
+    231.3900   1499.3800     30.0000     13.3900
+    232.0600   1499.4000     30.0000     13.3900
+    232.7300   1499.4000     30.0000     13.3800
+    233.4000   1499.4000     30.0000     13.3800
+    234.0700   1499.4200     30.0000     13.3800
+    234.7400   1499.4400     30.0000     13.3900
+    235.4100   1499.4400     30.0000     13.3800
+    236.0800   1499.4500     30.0000     13.3800
+    236.7500   1499.4600     30.0000     13.3800
+    237.4200   1499.4600     30.0000     13.3800
+    238.0900   1499.4800     30.0000     13.3800
+    238.7600   1499.4800     30.0000     13.3800
+    239.4300   1499.4900     30.0000     13.3800
+    240.1000   1499.5100     30.0000     13.3800
+    240.7700   1499.5200     30.0000     13.3800
+    241.4400   1499.5200     30.0000     13.3800
+    242.1100   1499.5300     30.0000     13.3800
+    242.7800   1499.5400     30.0000     13.3800
+    243.4500   1499.5500     30.0000     13.3800
+    244.1200   1499.5700     30.0000     13.3800
+    244.7900   1499.5800     30.0000     13.3800
+    245.4600   1499.5800     30.0000     13.3800
+    246.1300   1499.6000     30.0000     13.3800
+    246.8000   1499.6200     30.0000     13.3800
+    247.4700   1499.6400     30.0000     13.3800
+    248.1400   1499.6600     30.0000     13.3900
+    248.8100   1499.6700     30.0000     13.3900
+    249.4800   1499.6900     30.0000     13.3900
+    250.1400   1499.7000     30.0000     13.3900
+    250.8100   1499.7100     30.0000     13.3900
+    251.4800   1499.7200     30.0000     13.3900
+    252.1500   1499.7300     30.0000     13.3900
+    252.8200   1499.7500     30.0000     13.3900
+    253.4900   1499.7800     30.0000     13.4000
+    254.1600   1499.7900     30.0000     13.4000
+    254.8300   1499.8100     30.0000     13.4000
+    255.5000   1499.8300     30.0000     13.4000
+    256.1700   1499.8400     30.0000     13.4000
+    256.8400   1499.8500     30.0000     13.4000
+    257.5000   1499.8700     30.0000     13.4000
+    258.1700   1499.8800     30.0000     13.4000
+    258.8400   1499.9000     30.0000     13.4100
+    259.5100   1499.9200     30.0000     13.4100
+    260.1800   1499.9300     30.0000     13.4100
+    260.8500   1499.9400     30.0000     13.4100
+    261.5200   1499.9400     30.0000     13.4000
+    262.1900   1499.9500     30.0000     13.4000
+    262.8600   1499.9600     30.0000     13.4000
+    263.5200   1499.9600     30.0000     13.4000
+    264.1900   1499.9700     30.0000     13.4000
+    264.8600   1499.9900     30.0000     13.4000
+    265.5300   1499.9900     30.0000     13.4000
+    266.2000   1500.0000     30.0000     13.4000
+    266.8700   1500.0200     30.0000     13.4000
+    267.5300   1500.0300     30.0000     13.4000
+    268.2000   1500.0400     30.0000     13.4000
+    268.8700   1500.0600     30.0000     13.4000
+    269.5400   1500.0600     30.0000     13.4000
+    270.2100   1500.0700     30.0000     13.4000
+    270.8800   1500.0600     30.0000     13.4000
+    271.5400   1500.0600     30.0000     13.3900
+    272.2100   1500.0700     30.0000     13.3900
+    272.8800   1500.0700     30.0000     13.3900
+    273.5500   1500.0700     30.0000     13.3900
+    274.2200   1500.0800     30.0000     13.3800
+    274.8800   1500.0700     30.0000     13.3800
+    275.5500   1500.0600     30.0000     13.3700
+    276.2200   1500.0600     30.0000     13.3700
+    276.8900   1500.0700     30.0000     13.3700
+    277.5600   1500.0800     30.0000     13.3700
+    278.2200   1500.1000     30.0000     13.3700
+    278.8900   1500.1100     30.0000     13.3700
+    279.5600   1500.1200     30.0000     13.3700
+    280.2300   1500.1300     30.0000     13.3700
+    280.9000   1500.1400     30.0000     13.3700
+    281.5600   1500.1500     30.0000     13.3700
+    282.2300   1500.1600     30.0000     13.3700
+    282.9000   1500.1700     30.0000     13.3700
+    283.5700   1500.1700     30.0000     13.3700
+    284.2300   1500.1700     30.0000     13.3600
+    284.9000   1500.1800     30.0000     13.3600
+    285.5700   1500.1800     30.0000     13.3600
+    286.2400   1500.1900     30.0000     13.3600
+    286.9000   1500.2000     30.0000     13.3600
+    287.5700   1500.2200     30.0000     13.3600
+    288.2400   1500.2300     30.0000     13.3600
+    288.9000   1500.2300     30.0000     13.3600
+    289.5700   1500.2400     30.0000     13.3600
+    290.2400   1500.2500     30.0000     13.3600
+    290.9100   1500.2500     30.0000     13.3500
+    291.5700   1500.2700     30.0000     13.3500
+    292.2400   1500.2700     30.0000     13.3500
+    292.9100   1500.2800     30.0000     13.3500
+    293.5700   1500.2900     30.0000     13.3500
+    294.2400   1500.3000     30.0000     13.3500
+    294.9100   1500.3100     30.0000     13.3500
+    295.5700   1500.3300     30.0000     13.3500
+    296.2400   1500.3500     30.0000     13.3600
+    296.9100   1500.3600     30.0000     13.3500
+    297.5800   1500.3700     30.0000     13.3600
+    298.2400   1500.3800     30.0000     13.3500
+    298.9100   1500.3900     30.0000     13.3600
+    299.5800   1500.4000     30.0000     13.3500
+    300.2400   1500.4100     30.0000     13.3500
+    300.9100   1500.4100     30.0000     13.3500
+    301.5800   1500.4200     30.0000     13.3500
+    302.2400   1500.4300     30.0000     13.3500
+    302.9100   1500.4300     30.0000     13.3500
+    303.5700   1500.4400     30.0000     13.3400
+    304.2400   1500.4500     30.0000     13.3500
+    304.9100   1500.4600     30.0000     13.3400
+    305.5700   1500.4700     30.0000     13.3500
+    306.2400   1500.4800     30.0000     13.3500
+    306.9100   1500.4900     30.0000     13.3500
+    307.5700   1500.5000     30.0000     13.3400
+    308.2400   1500.5200     30.0000     13.3500
+    308.9000   1500.5300     30.0000     13.3500
+    309.5700   1500.5400     30.0000     13.3500
+    310.2400   1500.5500     30.0000     13.3500
+    310.9000   1500.5700     30.0000     13.3500
+    311.5700   1500.6000     30.0000     13.3500
+    312.2300   1500.6000     30.0000     13.3500
+    312.9000   1500.6000     30.0000     13.3500
+    313.5700   1500.6200     30.0000     13.3500
+    314.2300   1500.6400     30.0000     13.3500
+    314.9000   1500.6700     30.0000     13.3600
+    315.5600   1500.6800     30.0000     13.3600
+    316.2300   1500.6800     30.0000     13.3600
+    316.9000   1500.7000     30.0000     13.3600
+    317.5600   1500.7100     30.0000     13.3600
+    318.2300   1500.7200     30.0000     13.3600
+    318.8900   1500.7300     30.0000     13.3600
+    319.5600   1500.7500     30.0000     13.3600
+    320.2200   1500.7600     30.0000     13.3600
+    320.8900   1500.7700     30.0000     13.3600
+    321.5500   1500.7900     30.0000     13.3600
+    322.2200   1500.8000     30.0000     13.3600
+    322.8900   1500.8200     30.0000     13.3600
+    323.5500   1500.8500     30.0000     13.3700
+    324.2200   1500.8800     30.0000     13.3800
+    324.8800   1500.9100     30.0000     13.3800
+    325.5500   1500.9300     30.0000     13.3800
+    326.2100   1500.9400     30.0000     13.3900
+    326.8800   1500.9600     30.0000     13.3900
+    327.5400   1500.9700     30.0000     13.3900
+    328.2100   1500.9800     30.0000     13.3900
+    328.8700   1501.0100     30.0000     13.3900
+    329.5400   1501.0200     30.0000     13.3900
+    330.2000   1501.0300     30.0000     13.3900
+    330.8700   1501.0700     30.0000     13.4000
+    331.5300   1501.1400     30.0000     13.4200
+    332.2000   1501.2000     30.0000     13.4300
+    332.8600   1501.2500     30.0000     13.4400
+    333.5300   1501.2900     30.0000     13.4500
+    334.1900   1501.3100     30.0000     13.4500
+    334.8600   1501.3400     30.0000     13.4600
+    335.5200   1501.3600     30.0000     13.4600
+    336.1900   1501.3900     30.0000     13.4700
+    336.8500   1501.4100     30.0000     13.4700
+    337.5100   1501.4300     30.0000     13.4700
+    338.1800   1501.4500     30.0000     13.4800
+    338.8400   1501.4900     30.0000     13.4800
+    339.5100   1501.5200     30.0000     13.4900
+    340.1700   1501.5400     30.0000     13.4900
+    340.8400   1501.5600     30.0000     13.5000
+    341.5000   1501.5900     30.0000     13.5000
+    342.1700   1501.6100     30.0000     13.5000
+    342.8300   1501.6200     30.0000     13.5100
+    343.4900   1501.6500     30.0000     13.5100
+    344.1600   1501.6600     30.0000     13.5100
+    344.8200   1501.6800     30.0000     13.5100
+    345.4900   1501.6900     30.0000     13.5100
+    346.1500   1501.7100     30.0000     13.5200
+    346.8100   1501.7200     30.0000     13.5100
+    347.4800   1501.7200     30.0000     13.5100
+    348.1400   1501.7500     30.0000     13.5200
+    348.8100   1501.7600     30.0000     13.5200
+    349.4700   1501.7800     30.0000     13.5200
+    350.1300   1501.8000     30.0000     13.5200
+    350.8000   1501.8100     30.0000     13.5200
+    351.4600   1501.8300     30.0000     13.5300
+    352.1300   1501.8500     30.0000     13.5300
+    352.7900   1501.8700     30.0000     13.5300
+    353.4500   1501.8800     30.0000     13.5300
+    354.1200   1501.9000     30.0000     13.5300
+    354.7800   1501.9200     30.0000     13.5300
+    355.4400   1501.9200     30.0000     13.5300
+    356.1100   1501.9300     30.0000     13.5300
+    356.7700   1501.9400     30.0000     13.5300
+    357.4400   1501.9600     30.0000     13.5300
+    358.1000   1501.9800     30.0000     13.5400
+    358.7600   1501.9900     30.0000     13.5400
+    359.4300   1502.0000     30.0000     13.5400
+    360.0900   1502.0200     30.0000     13.5400
+    360.7500   1502.0300     30.0000     13.5400
+    361.4200   1502.0400     30.0000     13.5400
+    362.0800   1502.0600     30.0000     13.5400
+    362.7400   1502.0700     30.0000     13.5400
+    363.4000   1502.0800     30.0000     13.5400
+    364.0700   1502.1000     30.0000     13.5400
+    364.7300   1502.1200     30.0000     13.5500
+    365.3900   1502.1400     30.0000     13.5500
+    366.0600   1502.1400     30.0000     13.5500
+    366.7200   1502.1600     30.0000     13.5500
+    367.3800   1502.1700     30.0000     13.5500
+    368.0500   1502.1900     30.0000     13.5500
+    368.7100   1502.2000     30.0000     13.5500
+    369.3700   1502.2200     30.0000     13.5500
+    370.0300   1502.2300     30.0000     13.5500
+    370.7000   1502.2500     30.0000     13.5600
+    371.3600   1502.2500     30.0000     13.5500
+    372.0200   1502.2600     30.0000     13.5500
+    372.6900   1502.2800     30.0000     13.5500
+    373.3500   1502.2900     30.0000     13.5600
+    374.0100   1502.3000     30.0000     13.5600
+    374.6700   1502.3100     30.0000     13.5500
+    375.3400   1502.3200     30.0000     13.5500
+    376.0000   1502.3400     30.0000     13.5600
+    376.6600   1502.3500     30.0000     13.5600
+    377.3200   1502.3600     30.0000     13.5600
+    377.9900   1502.3600     30.0000     13.5500
+    378.6500   1502.3800     30.0000     13.5600
+    379.3100   1502.3800     30.0000     13.5500
+    379.9700   1502.3800     30.0000     13.5500
+    380.6300   1502.3900     30.0000     13.5500
+    381.3000   1502.4000     30.0000     13.5500
+    381.9600   1502.4200     30.0000     13.5500
+    382.6200   1502.4300     30.0000     13.5500
+    383.2800   1502.4400     30.0000     13.5500
+    383.9400   1502.4500     30.0000     13.5500
+    384.6100   1502.4600     30.0000     13.5500
+    385.2700   1502.4600     30.0000     13.5500
+    385.9300   1502.4700     30.0000     13.5500
+    386.5900   1502.4900     30.0000     13.5500
+    387.2500   1502.4900     30.0000     13.5500
+    387.9200   1502.4900     30.0000     13.5400
+    388.5800   1502.5000     30.0000     13.5400
+    389.2400   1502.5000     30.0000     13.5400
+    389.9000   1502.5200     30.0000     13.5400
+    390.5600   1502.5200     30.0000     13.5400
+    391.2200   1502.5300     30.0000     13.5400
+    391.8900   1502.5400     30.0000     13.5400
+    392.5500   1502.5500     30.0000     13.5400
+    393.2100   1502.5600     30.0000     13.5400
+    393.8700   1502.5700     30.0000     13.5400
+    394.5300   1502.5800     30.0000     13.5400
+    395.1900   1502.6000     30.0000     13.5400
+    395.8600   1502.6000     30.0000     13.5400
+    396.5200   1502.6100     30.0000     13.5400
+    397.1800   1502.6200     30.0000     13.5400
+    397.8400   1502.6400     30.0000     13.5400
+    398.5000   1502.6500     30.0000     13.5400
+    399.1600   1502.6600     30.0000     13.5400
+    399.8200   1502.6700     30.0000     13.5400
+    400.4800   1502.6800     30.0000     13.5400
+    401.1400   1502.6800     30.0000     13.5300
+    401.8100   1502.7000     30.0000     13.5400
+    402.4700   1502.7100     30.0000     13.5400
+    403.1300   1502.7200     30.0000     13.5400
+    403.7900   1502.7400     30.0000     13.5400
+    404.4500   1502.7400     30.0000     13.5400
+    405.1100   1502.7600     30.0000     13.5400
+    405.7700   1502.7700     30.0000     13.5400
+    406.4300   1502.7900     30.0000     13.5400
+    407.0900   1502.8000     30.0000     13.5400
+    407.7500   1502.8100     30.0000     13.5400
+    408.4100   1502.8200     30.0000     13.5400
+    409.0800   1502.8400     30.0000     13.5400
+    409.7400   1502.8600     30.0000     13.5400
+    410.4000   1502.8700     30.0000     13.5400
+    411.0600   1502.8800     30.0000     13.5400
+    411.7200   1502.8900     30.0000     13.5500
+    412.3800   1502.9100     30.0000     13.5500
+    413.0400   1502.9300     30.0000     13.5500
+    413.7000   1502.9400     30.0000     13.5500
+    414.3600   1502.9400     30.0000     13.5500
+    415.0200   1502.9600     30.0000     13.5500
+    415.6800   1502.9700     30.0000     13.5500
+    416.3400   1502.9800     30.0000     13.5500
+    417.0000   1502.9900     30.0000     13.5500
+    417.6600   1502.9900     30.0000     13.5500
+    418.3200   1503.0100     30.0000     13.5500
+    418.9800   1503.0400     30.0000     13.5500
+    419.6400   1503.0400     30.0000     13.5500
+    420.3000   1503.0500     30.0000     13.5500
+    420.9600   1503.0600     30.0000     13.5500
+    421.6200   1503.0700     30.0000     13.5500
+    422.2800   1503.0800     30.0000     13.5500
+    422.9400   1503.0900     30.0000     13.5500
+    423.6000   1503.0900     30.0000     13.5500
+    424.2600   1503.0900     30.0000     13.5400
+    424.9200   1503.1100     30.0000     13.5500
+    425.5800   1503.1200     30.0000     13.5400
+    426.2400   1503.1100     30.0000     13.5400
+    426.9000   1503.1200     30.0000     13.5400
+    427.5600   1503.1400     30.0000     13.5400
+    428.2200   1503.1500     30.0000     13.5400
+    428.8800   1503.1600     30.0000     13.5400
+    429.5400   1503.1800     30.0000     13.5400
+    430.2000   1503.2000     30.0000     13.5500
+    430.8600   1503.2100     30.0000     13.5400
+    431.5200   1503.1900     30.0000     13.5400
+    432.1800   1503.1900     30.0000     13.5300
+    432.8300   1503.1900     30.0000     13.5300
+    433.4900   1503.1900     30.0000     13.5300
+    434.1500   1503.1900     30.0000     13.5200
+    434.8100   1503.2000     30.0000     13.5200
+    435.4700   1503.2000     30.0000     13.5200
+    436.1300   1503.1800     30.0000     13.5100
+    436.7900   1503.1800     30.0000     13.5100
+    437.4500   1503.2000     30.0000     13.5100
+    438.1100   1503.2000     30.0000     13.5100
+    438.7700   1503.2100     30.0000     13.5100
+    439.4300   1503.2300     30.0000     13.5100
+    440.0800   1503.2400     30.0000     13.5100
+    440.7400   1503.2500     30.0000     13.5100
+    441.4000   1503.2400     30.0000     13.5000
+    442.0600   1503.2400     30.0000     13.5000
+    442.7200   1503.2500     30.0000     13.5000
+    443.3800   1503.2600     30.0000     13.5000
+    444.0400   1503.2700     30.0000     13.5000
+    444.7000   1503.2800     30.0000     13.5000
+    445.3500   1503.2900     30.0000     13.5000
+    446.0100   1503.2900     30.0000     13.4900
+    446.6700   1503.3000     30.0000     13.4900
+    447.3300   1503.3100     30.0000     13.4900
+    447.9900   1503.3200     30.0000     13.4900
+    448.6500   1503.3200     30.0000     13.4900
+    449.3100   1503.3300     30.0000     13.4900
+    449.9600   1503.3400     30.0000     13.4900
+    450.6200   1503.3500     30.0000     13.4900
+    451.2800   1503.3600     30.0000     13.4900
+    451.9400   1503.3700     30.0000     13.4900
+    452.6000   1503.3900     30.0000     13.4900
+    453.2600   1503.4000     30.0000     13.4900
+    453.9100   1503.4000     30.0000     13.4900
+    454.5700   1503.4200     30.0000     13.4900
+    455.2300   1503.4200     30.0000     13.4900
+    455.8900   1503.4300     30.0000     13.4900
+    456.5500   1503.4400     30.0000     13.4900
+    457.2000   1503.4600     30.0000     13.4900
+    457.8600   1503.4700     30.0000     13.4900
+    458.5200   1503.4800     30.0000     13.4900
+    459.1800   1503.5000     30.0000     13.4900
+    459.8400   1503.5000     30.0000     13.4900
+    460.4900   1503.5300     30.0000     13.4900
+    461.1500   1503.5400     30.0000     13.4900
+    461.8100   1503.5500     30.0000     13.4900
+    462.4700   1503.5600     30.0000     13.4900
+    463.1200   1503.5600     30.0000     13.4900
+    463.7800   1503.5600     30.0000     13.4900
+    464.4400   1503.5600     30.0000     13.4800
+    465.1000   1503.5800     30.0000     13.4900
+    465.7500   1503.5900     30.0000     13.4900
+    466.4100   1503.5900     30.0000     13.4800
+    467.0700   1503.5900     30.0000     13.4800
+    467.7300   1503.5900     30.0000     13.4800
+    468.3800   1503.6000     30.0000     13.4800
+    469.0400   1503.6100     30.0000     13.4800
+    469.7000   1503.6200     30.0000     13.4800
+    470.3600   1503.6200     30.0000     13.4700
+    471.0100   1503.5700     30.0000     13.4500
+    471.6700   1503.5100     30.0000     13.4300
+    472.3300   1503.5100     30.0000     13.4300
+    472.9900   1503.5100     30.0000     13.4300
+    473.6400   1503.5000     30.0000     13.4200
+    474.3000   1503.5100     30.0000     13.4200
+    474.9600   1503.5200     30.0000     13.4200
+    475.6100   1503.5300     30.0000     13.4200
+    476.2700   1503.5500     30.0000     13.4200
+    476.9300   1503.5600     30.0000     13.4200
+    477.5800   1503.5600     30.0000     13.4200
+    478.2400   1503.5700     30.0000     13.4200
+    478.9000   1503.5800     30.0000     13.4200
+    479.5500   1503.5900     30.0000     13.4200
+    480.2100   1503.5900     30.0000     13.4200
+    480.8700   1503.6000     30.0000     13.4100
+    481.5200   1503.6100     30.0000     13.4100
+    482.1800   1503.6200     30.0000     13.4200
+    482.8400   1503.6300     30.0000     13.4200
+    483.4900   1503.6400     30.0000     13.4100
+    484.1500   1503.6500     30.0000     13.4200
+    484.8100   1503.6700     30.0000     13.4200
+    485.4600   1503.6800     30.0000     13.4100
+    486.1200   1503.6900     30.0000     13.4200
+    486.7800   1503.7000     30.0000     13.4200
+    487.4300   1503.7200     30.0000     13.4200
+    488.0900   1503.7300     30.0000     13.4200
+    488.7500   1503.7400     30.0000     13.4200
+    489.4000   1503.7500     30.0000     13.4200
+    490.0600   1503.7700     30.0000     13.4200
+    490.7100   1503.7700     30.0000     13.4200
+    491.3700   1503.7800     30.0000     13.4200
+    492.0300   1503.7900     30.0000     13.4200
+    492.6800   1503.8000     30.0000     13.4200
+    493.3400   1503.8000     30.0000     13.4100
+    493.9900   1503.8200     30.0000     13.4200
+    494.6500   1503.8400     30.0000     13.4200
+    495.3100   1503.8600     30.0000     13.4200
+    495.9600   1503.8900     30.0000     13.4300
+    496.6200   1503.9100     30.0000     13.4300
+    497.2700   1503.9400     30.0000     13.4400
+    497.9300   1503.9600     30.0000     13.4400
+    498.5800   1503.9700     30.0000     13.4400
+    499.2400   1503.9800     30.0000     13.4400
+    499.9000   1503.9900     30.0000     13.4400
+    500.5500   1504.0100     30.0000     13.4400
+    501.2100   1504.0100     30.0000     13.4400
+    501.8600   1504.0200     30.0000     13.4400
+    502.5200   1504.0400     30.0000     13.4400
+    503.1700   1504.0500     30.0000     13.4400
+    503.8300   1504.0600     30.0000     13.4400
+    504.4800   1504.0700     30.0000     13.4400
+    505.1400   1504.0900     30.0000     13.4400
+    505.7900   1504.1000     30.0000     13.4400
+    506.4500   1504.1100     30.0000     13.4400
+    507.1100   1504.1300     30.0000     13.4400
+    507.7600   1504.1400     30.0000     13.4400
+    508.4200   1504.1400     30.0000     13.4400
+    509.0700   1504.1500     30.0000     13.4400
+    509.7300   1504.1600     30.0000     13.4400
+    510.3800   1504.1800     30.0000     13.4400
+    511.0400   1504.1900     30.0000     13.4400
+    511.6900   1504.2200     30.0000     13.4500
+    512.3500   1504.2300     30.0000     13.4500
+    513.0000   1504.2500     30.0000     13.4500
+    513.6600   1504.2600     30.0000     13.4500
+    514.3100   1504.2600     30.0000     13.4500
+    514.9700   1504.2800     30.0000     13.4500
+    515.6200   1504.2900     30.0000     13.4500
+    516.2700   1504.3100     30.0000     13.4500
+    516.9300   1504.3200     30.0000     13.4500
+    517.5800   1504.3400     30.0000     13.4500
+    518.2400   1504.3500     30.0000     13.4500
+    518.8900   1504.3600     30.0000     13.4500
+    519.5500   1504.3600     30.0000     13.4500
+    520.2000   1504.3800     30.0000     13.4500
+    520.8600   1504.3900     30.0000     13.4500
+    521.5100   1504.3900     30.0000     13.4500
+    522.1700   1504.4100     30.0000     13.4500
+    522.8200   1504.4300     30.0000     13.4500
+    523.4700   1504.4300     30.0000     13.4500
+    524.1300   1504.4400     30.0000     13.4500
+    524.7800   1504.4500     30.0000     13.4500
+    525.4400   1504.4500     30.0000     13.4500
+    526.0900   1504.4600     30.0000     13.4500
+    526.7500   1504.4700     30.0000     13.4500
+    527.4000   1504.4800     30.0000     13.4500
+    528.0500   1504.4900     30.0000     13.4500
+    528.7100   1504.5000     30.0000     13.4500
+    529.3600   1504.5100     30.0000     13.4500
+    530.0200   1504.5200     30.0000     13.4500
+    530.6700   1504.5300     30.0000     13.4500
+    531.3200   1504.5400     30.0000     13.4500
+    531.9800   1504.5600     30.0000     13.4500
+    532.6300   1504.5800     30.0000     13.4500
+    533.2800   1504.5900     30.0000     13.4500
+    533.9400   1504.5900     30.0000     13.4500
+    534.5900   1504.6000     30.0000     13.4500
+    535.2500   1504.6100     30.0000     13.4500
+    535.9000   1504.6000     30.0000     13.4400
+    536.5500   1504.6100     30.0000     13.4400
+    537.2100   1504.6200     30.0000     13.4400
+    537.8600   1504.6400     30.0000     13.4400
+    538.5100   1504.6600     30.0000     13.4500
+    539.1700   1504.6600     30.0000     13.4400
+    539.8200   1504.6700     30.0000     13.4400
+    540.4700   1504.6800     30.0000     13.4400
+    541.1300   1504.6900     30.0000     13.4400
+    541.7800   1504.7100     30.0000     13.4500
+    542.4300   1504.7300     30.0000     13.4500
+    543.0900   1504.7400     30.0000     13.4500
+    543.7400   1504.7600     30.0000     13.4500
+    544.3900   1504.7700     30.0000     13.4500
+    545.0500   1504.7700     30.0000     13.4500
+    545.7000   1504.7900     30.0000     13.4500
+    546.3500   1504.8000     30.0000     13.4500
+    547.0100   1504.8100     30.0000     13.4500
+    547.6600   1504.8300     30.0000     13.4500
+    548.3100   1504.8400     30.0000     13.4500
+    548.9600   1504.8500     30.0000     13.4500
+    549.6200   1504.8600     30.0000     13.4500
+    550.2700   1504.8700     30.0000     13.4500
+    550.9200   1504.8800     30.0000     13.4500
+    551.5800   1504.9000     30.0000     13.4500
+    552.2300   1504.9100     30.0000     13.4500
+    552.8800   1504.9300     30.0000     13.4600
+    553.5300   1504.9400     30.0000     13.4600
+    554.1900   1504.9400     30.0000     13.4500
+    554.8400   1504.9600     30.0000     13.4600
+    555.4900   1504.9700     30.0000     13.4600
+    556.1400   1504.9800     30.0000     13.4500
+    556.8000   1505.0000     30.0000     13.4600
+    557.4500   1505.0100     30.0000     13.4600
+    558.1000   1505.0200     30.0000     13.4600
+    558.7500   1505.0300     30.0000     13.4600
+    559.4100   1505.0500     30.0000     13.4600
+    560.0600   1505.0700     30.0000     13.4600
+    560.7100   1505.0800     30.0000     13.4600
+    561.3600   1505.0800     30.0000     13.4600
+    562.0100   1505.0900     30.0000     13.4600
+    562.6700   1505.0900     30.0000     13.4600
+    563.3200   1505.1000     30.0000     13.4600
+    563.9700   1505.1100     30.0000     13.4500
+    564.6200   1505.1200     30.0000     13.4600
+    565.2700   1505.1300     30.0000     13.4600
+    565.9300   1505.1400     30.0000     13.4500
+    566.5800   1505.1500     30.0000     13.4500
+    567.2300   1505.1600     30.0000     13.4600
+    567.8800   1505.1800     30.0000     13.4600
+    568.5300   1505.2000     30.0000     13.4600
+    569.1900   1505.2000     30.0000     13.4600
+    569.8400   1505.2100     30.0000     13.4600
+    570.4900   1505.2300     30.0000     13.4600
+    571.1400   1505.2400     30.0000     13.4600
+    571.7900   1505.2500     30.0000     13.4600
+    572.4400   1505.2600     30.0000     13.4600
+    573.1000   1505.2700     30.0000     13.4600
+    573.7500   1505.2900     30.0000     13.4600
+    574.4000   1505.3100     30.0000     13.4600
+    575.0500   1505.3200     30.0000     13.4600
+    575.7000   1505.3300     30.0000     13.4600
+    576.3500   1505.3500     30.0000     13.4600
+    577.0000   1505.3600     30.0000     13.4600
+    577.6600   1505.3800     30.0000     13.4700
+    578.3100   1505.3900     30.0000     13.4700
+    578.9600   1505.4100     30.0000     13.4700
+    579.6100   1505.4300     30.0000     13.4700
+    580.2600   1505.4300     30.0000     13.4700
+    580.9100   1505.4400     30.0000     13.4700
+    581.5600   1505.4600     30.0000     13.4700
+    582.2100   1505.4800     30.0000     13.4800
+    582.8600   1505.5000     30.0000     13.4800
+    583.5200   1505.5000     30.0000     13.4800
+    584.1700   1505.5100     30.0000     13.4700
+    584.8200   1505.5200     30.0000     13.4700
+    585.4700   1505.5300     30.0000     13.4800
+    586.1200   1505.5300     30.0000     13.4700
+    586.7700   1505.5400     30.0000     13.4700
+    587.4200   1505.5600     30.0000     13.4700
+    588.0700   1505.5700     30.0000     13.4700
+    588.7200   1505.5800     30.0000     13.4700
+    589.3700   1505.6000     30.0000     13.4800
+    590.0200   1505.6100     30.0000     13.4800
+    590.6700   1505.6100     30.0000     13.4700
+    591.3200   1505.6300     30.0000     13.4800
+    591.9700   1505.6400     30.0000     13.4700
+    592.6300   1505.6500     30.0000     13.4700
+    593.2800   1505.6600     30.0000     13.4700
+    593.9300   1505.6700     30.0000     13.4800
+    594.5800   1505.6800     30.0000     13.4700
+    595.2300   1505.6800     30.0000     13.4700
+    595.8800   1505.6900     30.0000     13.4700
+    596.5300   1505.7100     30.0000     13.4700
+    597.1800   1505.7100     30.0000     13.4700
+    597.8300   1505.7200     30.0000     13.4700
+    598.4800   1505.7200     30.0000     13.4700
+    599.1300   1505.7300     30.0000     13.4700
+    599.7800   1505.7500     30.0000     13.4700
+    600.4300   1505.7700     30.0000     13.4700
+    601.0800   1505.7800     30.0000     13.4700
+    601.7300   1505.7900     30.0000     13.4700
+    602.3800   1505.8100     30.0000     13.4700
+    603.0300   1505.8100     30.0000     13.4700
+    603.6800   1505.8200     30.0000     13.4700
+    604.3300   1505.8400     30.0000     13.4700
+    604.9800   1505.8500     30.0000     13.4700
+    605.6300   1505.8500     30.0000     13.4700
+    606.2800   1505.8800     30.0000     13.4700
+    606.9300   1505.9000     30.0000     13.4800
+    607.5800   1505.9100     30.0000     13.4800
+    608.2300   1505.9100     30.0000     13.4800
+    608.8800   1505.9200     30.0000     13.4800
+    609.5200   1505.9400     30.0000     13.4800
+    610.1700   1505.9600     30.0000     13.4800
+    610.8200   1505.9700     30.0000     13.4800
+    611.4700   1505.9800     30.0000     13.4800
+    612.1200   1506.0000     30.0000     13.4800
+    612.7700   1506.0100     30.0000     13.4800
+    613.4200   1506.0300     30.0000     13.4900
+    614.0700   1506.0400     30.0000     13.4900
+    614.7200   1506.0400     30.0000     13.4800
+    615.3700   1506.0600     30.0000     13.4900
+    616.0200   1506.0800     30.0000     13.4900
+    616.6700   1506.1000     30.0000     13.4900
+    617.3200   1506.1100     30.0000     13.4900
+    617.9600   1506.1100     30.0000     13.4900
+    618.6100   1506.1300     30.0000     13.4900
+    619.2600   1506.1400     30.0000     13.4900
+    619.9100   1506.1400     30.0000     13.4900
+    620.5600   1506.1600     30.0000     13.4900
+    621.2100   1506.1700     30.0000     13.4900
+    621.8600   1506.1900     30.0000     13.4900
+    622.5100   1506.2000     30.0000     13.4900
+    623.1600   1506.2200     30.0000     13.4900
+    623.8000   1506.2400     30.0000     13.5000
+    624.4500   1506.2400     30.0000     13.4900
+    625.1000   1506.2300     30.0000     13.4900
+    625.7500   1506.2500     30.0000     13.4900
+    626.4000   1506.2700     30.0000     13.4900
+    627.0500   1506.2800     30.0000     13.4900
+    627.7000   1506.2900     30.0000     13.4900
+    628.3400   1506.3100     30.0000     13.5000
+    628.9900   1506.3300     30.0000     13.5000
+    629.6400   1506.3400     30.0000     13.5000
+    630.2900   1506.3600     30.0000     13.5000
+    630.9400   1506.3800     30.0000     13.5000
+    631.5900   1506.4000     30.0000     13.5100
+    632.2300   1506.4100     30.0000     13.5100
+    632.8800   1506.4200     30.0000     13.5100
+    633.5300   1506.4200     30.0000     13.5000
+    634.1800   1506.4400     30.0000     13.5100
+    634.8300   1506.4500     30.0000     13.5100
+    635.4800   1506.4600     30.0000     13.5100
+    636.1200   1506.4700     30.0000     13.5100
+    636.7700   1506.4900     30.0000     13.5100
+    637.4200   1506.5000     30.0000     13.5100
+    638.0700   1506.5000     30.0000     13.5100
+    638.7100   1506.5200     30.0000     13.5100
+    639.3600   1506.5200     30.0000     13.5000
+    640.0100   1506.5400     30.0000     13.5100
+    640.6600   1506.5500     30.0000     13.5100
+    641.3100   1506.5600     30.0000     13.5100
+    641.9500   1506.5700     30.0000     13.5100
+    642.6000   1506.5800     30.0000     13.5000
+    643.2500   1506.5900     30.0000     13.5100
+    643.9000   1506.6100     30.0000     13.5100
+    644.5400   1506.6200     30.0000     13.5100
+    645.1900   1506.6200     30.0000     13.5100
+    645.8400   1506.6400     30.0000     13.5100
+    646.4900   1506.6500     30.0000     13.5100
+    647.1300   1506.6400     30.0000     13.5000
+    647.7800   1506.6500     30.0000     13.5000
+    648.4300   1506.6700     30.0000     13.5000
+    649.0800   1506.6800     30.0000     13.5000
+    649.7200   1506.6800     30.0000     13.5000
+    650.3700   1506.7000     30.0000     13.5000
+    651.0200   1506.7100     30.0000     13.5000
+    651.6600   1506.7300     30.0000     13.5100
+    652.3100   1506.7400     30.0000     13.5100
+    652.9600   1506.7400     30.0000     13.5000
+    653.6100   1506.7600     30.0000     13.5000
+    654.2500   1506.7700     30.0000     13.5000
+    654.9000   1506.7800     30.0000     13.5000
+    655.5500   1506.7900     30.0000     13.5000
+    656.1900   1506.8000     30.0000     13.5000
+    656.8400   1506.8100     30.0000     13.5100
+    657.4900   1506.8300     30.0000     13.5100
+    658.1300   1506.8500     30.0000     13.5100
+    658.7800   1506.8600     30.0000     13.5100
+    659.4300   1506.8600     30.0000     13.5100
+    660.0700   1506.8700     30.0000     13.5100
+    660.7200   1506.8800     30.0000     13.5100
+    661.3700   1506.8900     30.0000     13.5100
+    662.0100   1506.9000     30.0000     13.5100
+    662.6600   1506.9100     30.0000     13.5100
+    663.3100   1506.9200     30.0000     13.5100
+    663.9500   1506.9200     30.0000     13.5000
+    664.6000   1506.9300     30.0000     13.5000
+    665.2500   1506.9500     30.0000     13.5000
+    665.8900   1506.9600     30.0000     13.5000
+    666.5400   1506.9700     30.0000     13.5000
+    667.1900   1506.9800     30.0000     13.5100
+    667.8300   1506.9900     30.0000     13.5000
+    668.4800   1507.0000     30.0000     13.5000
+    669.1200   1507.0100     30.0000     13.5000
+    669.7700   1507.0100     30.0000     13.5000
+    670.4200   1507.0000     30.0000     13.5000
+    671.0600   1507.0000     30.0000     13.4900
+    671.7100   1507.0200     30.0000     13.4900
+    672.3500   1507.0300     30.0000     13.4900
+    673.0000   1507.0300     30.0000     13.4900
+    673.6500   1507.0400     30.0000     13.4900
+    674.2900   1507.0500     30.0000     13.4900
+    674.9400   1507.0600     30.0000     13.4900
+    675.5800   1507.0700     30.0000     13.4900
+    676.2300   1507.0800     30.0000     13.4900
+    676.8800   1507.0900     30.0000     13.4900
+    677.5200   1507.1000     30.0000     13.4900
+    678.1700   1507.1200     30.0000     13.4900
+    678.8100   1507.1200     30.0000     13.4900
+    679.4600   1507.1200     30.0000     13.4900
+    680.1000   1507.1500     30.0000     13.4900
+    680.7500   1507.1600     30.0000     13.4900
+    681.3900   1507.1600     30.0000     13.4900
+    682.0400   1507.1800     30.0000     13.4900
+    682.6800   1507.1900     30.0000     13.4900
+    683.3300   1507.1900     30.0000     13.4900
+    683.9800   1507.2100     30.0000     13.4900
+    684.6200   1507.2200     30.0000     13.4900
+    685.2700   1507.2300     30.0000     13.4900
+    685.9100   1507.2500     30.0000     13.4900
+    686.5600   1507.2600     30.0000     13.4900
+    687.2000   1507.2700     30.0000     13.4900
+    687.8500   1507.2900     30.0000     13.4900
+    688.4900   1507.2900     30.0000     13.4900
+    689.1400   1507.3100     30.0000     13.4900
+    689.7800   1507.3200     30.0000     13.4900
+    690.4300   1507.3300     30.0000     13.4900
+    691.0700   1507.3400     30.0000     13.4900
+    691.7200   1507.3500     30.0000     13.4900
+    692.3600   1507.3600     30.0000     13.4900
+    693.0100   1507.3700     30.0000     13.4900
+    693.6500   1507.3800     30.0000     13.4900
+    694.3000   1507.4000     30.0000     13.5000
+    694.9400   1507.4100     30.0000     13.4900
+    695.5900   1507.4200     30.0000     13.4900
+    696.2300   1507.4300     30.0000     13.4900
+    696.8700   1507.4400     30.0000     13.4900
+    697.5200   1507.4500     30.0000     13.4900
+    698.1600   1507.4700     30.0000     13.5000
+    698.8100   1507.4800     30.0000     13.5000
+    699.4500   1507.5000     30.0000     13.5000
+    700.1000   1507.5100     30.0000     13.5000
+    700.7400   1507.5200     30.0000     13.5000
+    701.3900   1507.5300     30.0000     13.5000
+    702.0300   1507.5400     30.0000     13.5000
+    702.6700   1507.5600     30.0000     13.5000
+    703.3200   1507.5700     30.0000     13.5000
+    703.9600   1507.5900     30.0000     13.5000
+    704.6100   1507.6100     30.0000     13.5100
+    705.2500   1507.6200     30.0000     13.5100
+    705.9000   1507.6200     30.0000     13.5000
+    706.5400   1507.6200     30.0000     13.5000
+    707.1800   1507.6300     30.0000     13.5000
+    707.8300   1507.6500     30.0000     13.5000
+    708.4700   1507.6600     30.0000     13.5000
+    709.1100   1507.6500     30.0000     13.5000
+    709.7600   1507.6600     30.0000     13.5000
+    710.4000   1507.6900     30.0000     13.5000
+    711.0500   1507.7000     30.0000     13.5000
+    711.6900   1507.7100     30.0000     13.5000
+    712.3300   1507.7300     30.0000     13.5000
+    712.9800   1507.7400     30.0000     13.5000
+    713.6200   1507.7500     30.0000     13.5100
+    714.2600   1507.7600     30.0000     13.5000
+    714.9100   1507.7700     30.0000     13.5000
+    715.5500   1507.7800     30.0000     13.5000
+    716.2000   1507.7900     30.0000     13.5000
+    716.8400   1507.8100     30.0000     13.5100
+    717.4800   1507.8300     30.0000     13.5100
+    718.1300   1507.8500     30.0000     13.5100
+    718.7700   1507.8600     30.0000     13.5100
+    719.4100   1507.8700     30.0000     13.5100
+    720.0600   1507.8800     30.0000     13.5100
+    720.7000   1507.8900     30.0000     13.5100
+    721.3400   1507.8900     30.0000     13.5100
+    721.9900   1507.9000     30.0000     13.5100
+    722.6300   1507.9200     30.0000     13.5100
+    723.2700   1507.9300     30.0000     13.5100
+    723.9100   1507.9500     30.0000     13.5100
+    724.5600   1507.9600     30.0000     13.5100
+    725.2000   1507.9600     30.0000     13.5100
+    725.8400   1507.9700     30.0000     13.5100
+    726.4900   1507.9800     30.0000     13.5100
+    727.1300   1507.9900     30.0000     13.5100
+    727.7700   1508.0000     30.0000     13.5100
+    728.4200   1508.0200     30.0000     13.5100
+    729.0600   1508.0200     30.0000     13.5100
+    729.7000   1508.0300     30.0000     13.5100
+    730.3400   1508.0400     30.0000     13.5100
+    730.9900   1508.0500     30.0000     13.5100
+    731.6300   1508.0600     30.0000     13.5100
+    732.2700   1508.0700     30.0000     13.5100
+    732.9100   1508.0800     30.0000     13.5100
+    733.5600   1508.0900     30.0000     13.5100
+    734.2000   1508.1100     30.0000     13.5100
+    734.8400   1508.1200     30.0000     13.5100
+    735.4800   1508.1300     30.0000     13.5100
+    736.1300   1508.1400     30.0000     13.5100
+    736.7700   1508.1500     30.0000     13.5100
+    737.4100   1508.1600     30.0000     13.5100
+    738.0500   1508.1700     30.0000     13.5100
+    738.7000   1508.1800     30.0000     13.5100
+    739.3400   1508.1800     30.0000     13.5100
+    739.9800   1508.2000     30.0000     13.5100
+    740.6200   1508.2100     30.0000     13.5100
+    741.2600   1508.2200     30.0000     13.5100
+    741.9100   1508.2300     30.0000     13.5100
+    742.5500   1508.2400     30.0000     13.5100
+    743.1900   1508.2500     30.0000     13.5100
+    743.8300   1508.2500     30.0000     13.5100
+    744.4700   1508.2800     30.0000     13.5100
+    745.1200   1508.2900     30.0000     13.5100
+    745.7600   1508.3000     30.0000     13.5100
+    746.4000   1508.3100     30.0000     13.5100
+    747.0400   1508.3200     30.0000     13.5100
+    747.6800   1508.3300     30.0000     13.5100
+    748.3200   1508.3500     30.0000     13.5100
+    748.9700   1508.3600     30.0000     13.5100
+    749.6100   1508.3700     30.0000     13.5100
+    750.2500   1508.3800     30.0000     13.5100
+    750.8900   1508.3900     30.0000     13.5100
+    751.5300   1508.4000     30.0000     13.5100
+    752.1700   1508.4100     30.0000     13.5100
+    752.8200   1508.4200     30.0000     13.5100
+    753.4600   1508.4400     30.0000     13.5100
+    754.1000   1508.4500     30.0000     13.5100
+    754.7400   1508.4600     30.0000     13.5100
+    755.3800   1508.4800     30.0000     13.5200
+    756.0200   1508.4900     30.0000     13.5200
+    756.6600   1508.5000     30.0000     13.5200
+    757.3000   1508.5200     30.0000     13.5200
+    757.9500   1508.5200     30.0000     13.5200
+    758.5900   1508.5300     30.0000     13.5200
+    759.2300   1508.5500     30.0000     13.5200
+    759.8700   1508.5700     30.0000     13.5200
+    760.5100   1508.5700     30.0000     13.5200
+    761.1500   1508.5900     30.0000     13.5200
+    761.7900   1508.6000     30.0000     13.5200
+    762.4300   1508.6100     30.0000     13.5200
+    763.0700   1508.6100     30.0000     13.5200
+    763.7100   1508.6200     30.0000     13.5200
+    764.3500   1508.6400     30.0000     13.5200
+    765.0000   1508.6400     30.0000     13.5200
+    765.6400   1508.6600     30.0000     13.5200
+    766.2800   1508.6700     30.0000     13.5200
+    766.9200   1508.6800     30.0000     13.5200
+    767.5600   1508.7000     30.0000     13.5200
+    768.2000   1508.7000     30.0000     13.5200
+    768.8400   1508.7000     30.0000     13.5200
+    769.4800   1508.7200     30.0000     13.5200
+    770.1200   1508.7300     30.0000     13.5200
+    770.7600   1508.7400     30.0000     13.5200
+    771.4000   1508.7500     30.0000     13.5200
+    772.0400   1508.7600     30.0000     13.5200
+    772.6800   1508.7700     30.0000     13.5200
+    773.3200   1508.7800     30.0000     13.5200
+    773.9600   1508.7900     30.0000     13.5200
+    774.6000   1508.7900     30.0000     13.5100
+    775.2400   1508.8000     30.0000     13.5100
+    775.8800   1508.8200     30.0000     13.5200
+    776.5200   1508.8300     30.0000     13.5200
+    777.1600   1508.8300     30.0000     13.5100
+    777.8000   1508.8600     30.0000     13.5200
+    778.4400   1508.8600     30.0000     13.5200
+    779.0800   1508.8800     30.0000     13.5200
+    779.7200   1508.9100     30.0000     13.5300
+    780.3600   1508.9200     30.0000     13.5200
+    781.0000   1508.9200     30.0000     13.5200
+    781.6400   1508.9200     30.0000     13.5200
+    782.2800   1508.9200     30.0000     13.5200
+    782.9200   1508.9300     30.0000     13.5200
+    783.5600   1508.9500     30.0000     13.5200
+    784.2000   1508.9600     30.0000     13.5200
+    784.8400   1508.9700     30.0000     13.5200
+    785.4800   1508.9800     30.0000     13.5200
+    786.1200   1508.9900     30.0000     13.5200
+    786.7600   1509.0000     30.0000     13.5200
+    787.4000   1509.0100     30.0000     13.5200
+    788.0400   1509.0200     30.0000     13.5200
+    788.6800   1509.0300     30.0000     13.5100
+    789.3200   1509.0400     30.0000     13.5100
+    789.9600   1509.0500     30.0000     13.5200
+    790.6000   1509.0600     30.0000     13.5100
+    791.2300   1509.0700     30.0000     13.5100
+    791.8700   1509.0900     30.0000     13.5200
+    792.5100   1509.0900     30.0000     13.5100
+    793.1500   1509.1000     30.0000     13.5200
+    793.7900   1509.1100     30.0000     13.5100
+    794.4300   1509.1200     30.0000     13.5100
+    795.0700   1509.1300     30.0000     13.5100
+    795.7100   1509.1500     30.0000     13.5200
+    796.3500   1509.1500     30.0000     13.5100
+    796.9900   1509.1600     30.0000     13.5100
+    797.6200   1509.1800     30.0000     13.5100
+    798.2600   1509.1800     30.0000     13.5100
+    798.9000   1509.1900     30.0000     13.5100
+    799.5400   1509.2000     30.0000     13.5100
+    800.1800   1509.2100     30.0000     13.5100
+    800.8200   1509.2300     30.0000     13.5100
+    801.4600   1509.2300     30.0000     13.5100
+    802.1000   1509.2400     30.0000     13.5100
+    802.7300   1509.2500     30.0000     13.5100
+    803.3700   1509.2700     30.0000     13.5100
+    804.0100   1509.2800     30.0000     13.5100
+    804.6500   1509.2900     30.0000     13.5100
+    805.2900   1509.3000     30.0000     13.5200
+    805.9300   1509.3200     30.0000     13.5200
+    806.5700   1509.3300     30.0000     13.5200
+    807.2000   1509.3400     30.0000     13.5200
+    807.8400   1509.3400     30.0000     13.5100
+    808.4800   1509.3600     30.0000     13.5200
+    809.1200   1509.3700     30.0000     13.5200
+    809.7600   1509.3800     30.0000     13.5200
+    810.3900   1509.3900     30.0000     13.5200
+    811.0300   1509.4000     30.0000     13.5100
+    811.6700   1509.4100     30.0000     13.5200
+    812.3100   1509.4300     30.0000     13.5200
+    812.9500   1509.4400     30.0000     13.5200
+    813.5900   1509.4500     30.0000     13.5200
+    814.2200   1509.4500     30.0000     13.5200
+    814.8600   1509.4700     30.0000     13.5200
+    815.5000   1509.4900     30.0000     13.5200
+    816.1400   1509.4900     30.0000     13.5200
+    816.7700   1509.4900     30.0000     13.5100
+    817.4100   1509.5100     30.0000     13.5200
+    818.0500   1509.5200     30.0000     13.5200
+    818.6900   1509.5400     30.0000     13.5200
+    819.3300   1509.5500     30.0000     13.5200
+    819.9600   1509.5600     30.0000     13.5200
+    820.6000   1509.5700     30.0000     13.5200
+    821.2400   1509.5800     30.0000     13.5200
+    821.8800   1509.5900     30.0000     13.5200
+    822.5100   1509.6000     30.0000     13.5200
+    823.1500   1509.6100     30.0000     13.5200
+    823.7900   1509.6200     30.0000     13.5200
+    824.4300   1509.6400     30.0000     13.5200
+    825.0600   1509.6400     30.0000     13.5200
+    825.7000   1509.6600     30.0000     13.5200
+    826.3400   1509.6700     30.0000     13.5200
+    826.9700   1509.6800     30.0000     13.5200
+    827.6100   1509.7000     30.0000     13.5200
+    828.2500   1509.7100     30.0000     13.5200
+    828.8900   1509.7200     30.0000     13.5200
+    829.5200   1509.7200     30.0000     13.5200
+    830.1600   1509.7300     30.0000     13.5200
+    830.8000   1509.7400     30.0000     13.5200
+    831.4300   1509.7500     30.0000     13.5200
+    832.0700   1509.7600     30.0000     13.5200
+    832.7100   1509.7800     30.0000     13.5200
+    833.3400   1509.7900     30.0000     13.5200
+    833.9800   1509.8000     30.0000     13.5200
+    834.6200   1509.8000     30.0000     13.5200
+    835.2500   1509.8100     30.0000     13.5200
+    835.8900   1509.8200     30.0000     13.5200
+    836.5300   1509.8400     30.0000     13.5200
+    837.1600   1509.8600     30.0000     13.5200
+    837.8000   1509.8600     30.0000     13.5200
+    838.4400   1509.8800     30.0000     13.5200
+    839.0700   1509.8900     30.0000     13.5200
+    839.7100   1509.8900     30.0000     13.5200
+    840.3500   1509.9000     30.0000     13.5200
+    840.9800   1509.9200     30.0000     13.5200
+    841.6200   1509.9300     30.0000     13.5200
+    842.2600   1509.9400     30.0000     13.5200
+    842.8900   1509.9600     30.0000     13.5200
+    843.5300   1509.9600     30.0000     13.5200
+    844.1700   1509.9600     30.0000     13.5200
+    844.8000   1509.9700     30.0000     13.5200
+    845.4400   1509.9800     30.0000     13.5200
+    846.0700   1509.9800     30.0000     13.5200
+    846.7100   1509.9900     30.0000     13.5100
+    847.3500   1510.0000     30.0000     13.5200
+    847.9800   1510.0200     30.0000     13.5200
+    848.6200   1510.0300     30.0000     13.5200
+    849.2500   1510.0400     30.0000     13.5200
+    849.8900   1510.0500     30.0000     13.5200
+    850.5300   1510.0500     30.0000     13.5200
+    851.1600   1510.0600     30.0000     13.5200
+    851.8000   1510.0800     30.0000     13.5200
+    852.4300   1510.0900     30.0000     13.5200
+    853.0700   1510.0900     30.0000     13.5100
+    853.7000   1510.1100     30.0000     13.5200
+    854.3400   1510.1200     30.0000     13.5200
+    854.9800   1510.1300     30.0000     13.5200
+    855.6100   1510.1300     30.0000     13.5100
+    856.2500   1510.1400     30.0000     13.5100
+    856.8800   1510.1400     30.0000     13.5100
+    857.5200   1510.1600     30.0000     13.5100
+    858.1500   1510.1700     30.0000     13.5100
+    858.7900   1510.1700     30.0000     13.5100
+    859.4200   1510.1800     30.0000     13.5100
+    860.0600   1510.2000     30.0000     13.5100
+    860.6900   1510.2200     30.0000     13.5100
+    861.3300   1510.2200     30.0000     13.5100
+    861.9600   1510.2400     30.0000     13.5100
+    862.6000   1510.2400     30.0000     13.5100
+    863.2300   1510.2500     30.0000     13.5100
+    863.8700   1510.2500     30.0000     13.5100
+    864.5100   1510.2700     30.0000     13.5100
+    865.1400   1510.2800     30.0000     13.5100
+    865.7800   1510.2900     30.0000     13.5100
+    866.4100   1510.3000     30.0000     13.5100
+    867.0500   1510.3100     30.0000     13.5100
+    867.6800   1510.3200     30.0000     13.5100
+    868.3100   1510.3300     30.0000     13.5100
+    868.9500   1510.3300     30.0000     13.5100
+    869.5800   1510.3300     30.0000     13.5000
+    870.2200   1510.3500     30.0000     13.5100
+    870.8500   1510.3600     30.0000     13.5100
+    871.4900   1510.3700     30.0000     13.5100
+    872.1200   1510.3800     30.0000     13.5100
+    872.7600   1510.4000     30.0000     13.5100
+    873.3900   1510.4100     30.0000     13.5100
+    874.0300   1510.4200     30.0000     13.5100
+    874.6600   1510.4200     30.0000     13.5100
+    875.3000   1510.4300     30.0000     13.5100
+    875.9300   1510.4400     30.0000     13.5000
+    876.5600   1510.4500     30.0000     13.5100
+    877.2000   1510.4600     30.0000     13.5100
+    877.8300   1510.4700     30.0000     13.5100
+    878.4700   1510.4800     30.0000     13.5000
+    879.1000   1510.4900     30.0000     13.5000
+    879.7400   1510.5000     30.0000     13.5100
+    880.3700   1510.5200     30.0000     13.5100
+    881.0000   1510.5200     30.0000     13.5000
+    881.6400   1510.5300     30.0000     13.5000
+    882.2700   1510.5400     30.0000     13.5000
+    882.9100   1510.5500     30.0000     13.5000
+    883.5400   1510.5600     30.0000     13.5000
+    884.1700   1510.5700     30.0000     13.5000
+    884.8100   1510.5800     30.0000     13.5000
+    885.4400   1510.5800     30.0000     13.5000
+    886.0800   1510.5900     30.0000     13.5000
+    886.7100   1510.6000     30.0000     13.5000
+    887.3400   1510.6200     30.0000     13.5000
+    887.9800   1510.6200     30.0000     13.5000
+    888.6100   1510.6300     30.0000     13.5000
+    889.2400   1510.6400     30.0000     13.5000
+    889.8800   1510.6600     30.0000     13.5000
+    890.5100   1510.6800     30.0000     13.5000
+    891.1400   1510.6800     30.0000     13.5000
+    891.7800   1510.6900     30.0000     13.5000
+    892.4100   1510.7000     30.0000     13.5000
+    893.0500   1510.7000     30.0000     13.5000
+    893.6800   1510.7100     30.0000     13.5000
+    894.3100   1510.7300     30.0000     13.5000
+    894.9500   1510.7400     30.0000     13.5000
+    895.5800   1510.7500     30.0000     13.5000
+    896.2100   1510.7600     30.0000     13.5000
+    896.8500   1510.7700     30.0000     13.5000
+    897.4800   1510.7800     30.0000     13.5000
+    898.1100   1510.7800     30.0000     13.5000
+    898.7400   1510.8000     30.0000     13.5000
+    899.3800   1510.8000     30.0000     13.5000
+    900.0100   1510.8200     30.0000     13.5000
+    900.6400   1510.8400     30.0000     13.5000
+    901.2800   1510.8400     30.0000     13.5000
+    901.9100   1510.8500     30.0000     13.5000
+    902.5400   1510.8600     30.0000     13.5000
+    903.1800   1510.8700     30.0000     13.5000
+    903.8100   1510.8800     30.0000     13.5000
+    904.4400   1510.8900     30.0000     13.5000
+    905.0700   1510.9000     30.0000     13.5000
+    905.7100   1510.9200     30.0000     13.5000
+    906.3400   1510.9300     30.0000     13.5000
+    906.9700   1510.9400     30.0000     13.5000
+    907.6000   1510.9600     30.0000     13.5000
+    908.2400   1510.9600     30.0000     13.5000
+    908.8700   1510.9700     30.0000     13.5000
+    909.5000   1510.9900     30.0000     13.5000
+    910.1300   1510.9900     30.0000     13.5000
+    910.7700   1511.0100     30.0000     13.5000
+    911.4000   1511.0200     30.0000     13.5000
+    912.0300   1511.0200     30.0000     13.5000
+    912.6600   1511.0300     30.0000     13.5000
+    913.3000   1511.0400     30.0000     13.5000
+    913.9300   1511.0400     30.0000     13.5000
+    914.5600   1511.0600     30.0000     13.5000
+    915.1900   1511.0700     30.0000     13.5000
+    915.8200   1511.0900     30.0000     13.5000
+    916.4600   1511.1000     30.0000     13.5000
+    917.0900   1511.1100     30.0000     13.5000
+    917.7200   1511.1200     30.0000     13.5000
+    918.3500   1511.1300     30.0000     13.5000
+    918.9800   1511.1400     30.0000     13.5000
+    919.6200   1511.1500     30.0000     13.5000
+    920.2500   1511.1700     30.0000     13.5000
+    920.8800   1511.1800     30.0000     13.5000
+    921.5100   1511.1900     30.0000     13.5000
+    922.1400   1511.2000     30.0000     13.5000
+    922.7800   1511.2100     30.0000     13.5000
+    923.4100   1511.2200     30.0000     13.5000
+    924.0400   1511.2300     30.0000     13.5000
+    924.6700   1511.2400     30.0000     13.5000
+    925.3000   1511.2600     30.0000     13.5000
+    925.9300   1511.2600     30.0000     13.5000
+    926.5600   1511.2600     30.0000     13.5000
+    927.2000   1511.2700     30.0000     13.5000
+    927.8300   1511.2800     30.0000     13.5000
+    928.4600   1511.2900     30.0000     13.5000
+    929.0900   1511.3000     30.0000     13.5000
+    929.7200   1511.3200     30.0000     13.5000
+    930.3500   1511.3300     30.0000     13.5000
+    930.9800   1511.3300     30.0000     13.5000
+    931.6200   1511.3500     30.0000     13.5000
+    932.2500   1511.3600     30.0000     13.5000
+    932.8800   1511.3800     30.0000     13.5000
+    933.5100   1511.3800     30.0000     13.5000
+    934.1400   1511.3900     30.0000     13.5000
+    934.7700   1511.4000     30.0000     13.5000
+    935.4000   1511.4100     30.0000     13.5000
+    936.0300   1511.4200     30.0000     13.5000
+    936.6600   1511.4300     30.0000     13.5000
+    937.2900   1511.4300     30.0000     13.5000
+    937.9300   1511.4400     30.0000     13.5000
+    938.5600   1511.4500     30.0000     13.5000
+    939.1900   1511.4500     30.0000     13.4900
+    939.8200   1511.4700     30.0000     13.5000
+    940.4500   1511.4900     30.0000     13.5000
+    941.0800   1511.5000     30.0000     13.5000
+    941.7100   1511.5100     30.0000     13.5000
+    942.3400   1511.5100     30.0000     13.5000
+    942.9700   1511.5300     30.0000     13.5000
+    943.6000   1511.5500     30.0000     13.5000
+    944.2300   1511.5500     30.0000     13.5000
+    944.8600   1511.5600     30.0000     13.5000
+    945.4900   1511.5700     30.0000     13.5000
+    946.1200   1511.5900     30.0000     13.5000
+    946.7500   1511.6000     30.0000     13.5000
+    947.3800   1511.6100     30.0000     13.5000
+    948.0100   1511.6300     30.0000     13.5000
+    948.6400   1511.6300     30.0000     13.5000
+    949.2700   1511.6500     30.0000     13.5000
+    949.9000   1511.6600     30.0000     13.5000
+    950.5300   1511.6700     30.0000     13.5000
+    951.1600   1511.6800     30.0000     13.5000
+    951.7900   1511.6800     30.0000     13.5000
+    952.4200   1511.6900     30.0000     13.5000
+    953.0500   1511.7000     30.0000     13.5000
+    953.6800   1511.7100     30.0000     13.5000
+    954.3100   1511.7200     30.0000     13.5000
+    954.9400   1511.7300     30.0000     13.5000
+    955.5700   1511.7300     30.0000     13.5000
+    956.2000   1511.7500     30.0000     13.5000
+    956.8300   1511.7600     30.0000     13.5000
+    957.4600   1511.7600     30.0000     13.5000
+    958.0900   1511.7800     30.0000     13.5000
+    958.7200   1511.7800     30.0000     13.5000
+    959.3500   1511.7900     30.0000     13.5000
+    959.9800   1511.8100     30.0000     13.5000
+    960.6100   1511.8100     30.0000     13.5000
+    961.2400   1511.8200     30.0000     13.5000
+    961.8700   1511.8400     30.0000     13.5000
+    962.5000   1511.8400     30.0000     13.4900
+    963.1300   1511.8500     30.0000     13.4900
+    963.7600   1511.8600     30.0000     13.4900
+    964.3900   1511.8800     30.0000     13.5000
+    965.0200   1511.9000     30.0000     13.5000
+    965.6500   1511.9100     30.0000     13.5000
+    966.2800   1511.9100     30.0000     13.5000
+    966.9000   1511.9200     30.0000     13.5000
+    967.5300   1511.9300     30.0000     13.5000
+    968.1600   1511.9300     30.0000     13.4900
+    968.7900   1511.9400     30.0000     13.4900
+    969.4200   1511.9500     30.0000     13.4900
+    970.0500   1511.9600     30.0000     13.4900
+    970.6800   1511.9700     30.0000     13.4900
+    971.3100   1511.9800     30.0000     13.4900
+    971.9400   1511.9900     30.0000     13.4900
+    972.5700   1512.0000     30.0000     13.4900
+    973.1900   1512.0100     30.0000     13.4900
+    973.8200   1512.0200     30.0000     13.4900
+    974.4500   1512.0500     30.0000     13.5000
+    975.0800   1512.0600     30.0000     13.5000
+    975.7100   1512.0700     30.0000     13.5000
+    976.3400   1512.0700     30.0000     13.5000
+    976.9700   1512.0800     30.0000     13.4900
+    977.5900   1512.1000     30.0000     13.5000
+    978.2200   1512.1100     30.0000     13.5000
+    978.8500   1512.1200     30.0000     13.5000
+    979.4800   1512.1300     30.0000     13.5000
+    980.1100   1512.1400     30.0000     13.5000
+    980.7400   1512.1500     30.0000     13.5000
+    981.3700   1512.1600     30.0000     13.5000
+    981.9900   1512.1900     30.0000     13.5000
+    982.6200   1512.2000     30.0000     13.5000
+    983.2500   1512.2000     30.0000     13.5000
+    983.8800   1512.2100     30.0000     13.5000
+    984.5100   1512.2200     30.0000     13.5000
+    985.1300   1512.2200     30.0000     13.5000
+    985.7600   1512.2400     30.0000     13.5000
+    986.3900   1512.2500     30.0000     13.5000
+    987.0200   1512.2500     30.0000     13.5000
+    987.6500   1512.2500     30.0000     13.4900
+    988.2700   1512.2700     30.0000     13.5000
+    988.9000   1512.2900     30.0000     13.5000
+    989.5300   1512.2900     30.0000     13.5000
+    990.1600   1512.3000     30.0000     13.5000
+    990.7900   1512.3100     30.0000     13.5000
+    991.4100   1512.3100     30.0000     13.4900
+    992.0400   1512.3200     30.0000     13.4900
+    992.6700   1512.3400     30.0000     13.4900
+    993.3000   1512.3400     30.0000     13.4900
+    993.9200   1512.3600     30.0000     13.4900
+    994.5500   1512.3800     30.0000     13.5000
+    995.1800   1512.3900     30.0000     13.5000
+    995.8100   1512.4000     30.0000     13.5000
+    996.4300   1512.4100     30.0000     13.5000
+    997.0600   1512.4200     30.0000     13.5000
+    997.6900   1512.4300     30.0000     13.5000
+    998.3200   1512.4300     30.0000     13.4900
+    998.9400   1512.4400     30.0000     13.4900
+    999.5700   1512.4500     30.0000     13.4900
+   1000.2000   1512.4700     30.0000     13.5000
+   1000.8300   1512.4800     30.0000     13.5000
+   1001.4500   1512.4900     30.0000     13.5000
+   1002.0800   1512.5000     30.0000     13.5000
+   1002.7100   1512.5100     30.0000     13.5000
+   1003.3300   1512.5200     30.0000     13.5000
+   1003.9600   1512.5300     30.0000     13.5000
+   1004.5900   1512.5300     30.0000     13.4900
+   1005.2100   1512.5300     30.0000     13.4900
+   1005.8400   1512.5500     30.0000     13.4900
+   1006.4700   1512.5500     30.0000     13.4900
+   1007.1000   1512.5600     30.0000     13.4900
+   1007.7200   1512.5800     30.0000     13.4900
+   1008.3500   1512.5900     30.0000     13.4900
+   1008.9800   1512.6000     30.0000     13.4900
+   1009.6000   1512.6100     30.0000     13.4900
+   1010.2300   1512.6300     30.0000     13.4900
+   1010.8600   1512.6400     30.0000     13.4900
+   1011.4800   1512.6400     30.0000     13.4900
+   1012.1100   1512.6400     30.0000     13.4900
+   1012.7400   1512.6600     30.0000     13.4900
+   1013.3600   1512.6700     30.0000     13.4900
+   1013.9900   1512.6800     30.0000     13.4900
+   1014.6100   1512.6900     30.0000     13.4900
+   1015.2400   1512.7000     30.0000     13.4900
+   1015.8700   1512.6900     30.0000     13.4900
+   1016.4900   1512.7100     30.0000     13.4900
+   1017.1200   1512.7300     30.0000     13.4900
+   1017.7500   1512.7300     30.0000     13.4900
+   1018.3700   1512.7400     30.0000     13.4900
+   1019.0000   1512.7500     30.0000     13.4900
+   1019.6200   1512.7600     30.0000     13.4900
+   1020.2500   1512.7700     30.0000     13.4900
+   1020.8800   1512.7800     30.0000     13.4900
+   1021.5000   1512.8000     30.0000     13.4900
+   1022.1300   1512.8100     30.0000     13.4900
+   1022.7500   1512.8200     30.0000     13.4900
+   1023.3800   1512.8200     30.0000     13.4900
+   1024.0100   1512.8300     30.0000     13.4800
+   1024.6300   1512.8400     30.0000     13.4900
+   1025.2600   1512.8600     30.0000     13.4900
+   1025.8800   1512.8600     30.0000     13.4900
+   1026.5100   1512.8800     30.0000     13.4900
+   1027.1300   1512.8900     30.0000     13.4900
+   1027.7600   1512.9000     30.0000     13.4900
+   1028.3900   1512.9200     30.0000     13.4900
+   1029.0100   1512.9400     30.0000     13.4900
+   1029.6400   1512.9300     30.0000     13.4900
+   1030.2600   1512.9300     30.0000     13.4800
+   1030.8900   1512.9400     30.0000     13.4900
+   1031.5100   1512.9600     30.0000     13.4900
+   1032.1400   1512.9700     30.0000     13.4900
+   1032.7600   1512.9800     30.0000     13.4900
+   1033.3900   1512.9900     30.0000     13.4900
+   1034.0100   1513.0000     30.0000     13.4900
+   1034.6400   1513.0100     30.0000     13.4900
+   1035.2700   1513.0200     30.0000     13.4900
+   1035.8900   1513.0300     30.0000     13.4900
+   1036.5200   1513.0500     30.0000     13.4900
+   1037.1400   1513.0600     30.0000     13.4900
+   1037.7700   1513.0600     30.0000     13.4900
+   1038.3900   1513.0700     30.0000     13.4900
+   1039.0200   1513.0800     30.0000     13.4900
+   1039.6400   1513.1000     30.0000     13.4900
+   1040.2700   1513.1000     30.0000     13.4900
+   1040.8900   1513.1200     30.0000     13.4900
+   1041.5200   1513.1300     30.0000     13.4900
+   1042.1400   1513.1500     30.0000     13.4900
+   1042.7600   1513.1500     30.0000     13.4900
+   1043.3900   1513.1600     30.0000     13.4900
+   1044.0100   1513.1700     30.0000     13.4900
+   1044.6400   1513.1800     30.0000     13.4900
+   1045.2600   1513.1900     30.0000     13.4900
+   1045.8900   1513.2000     30.0000     13.4900
+   1046.5100   1513.2200     30.0000     13.4900
+   1047.1400   1513.2300     30.0000     13.4900
+   1047.7600   1513.2400     30.0000     13.4900
+   1048.3900   1513.2500     30.0000     13.4900
+   1049.0100   1513.2500     30.0000     13.4900
+   1049.6300   1513.2600     30.0000     13.4900
+   1050.2600   1513.2700     30.0000     13.4900
+   1050.8800   1513.2700     30.0000     13.4900
+   1051.5100   1513.2800     30.0000     13.4800
+   1052.1300   1513.3000     30.0000     13.4900
+   1052.7600   1513.3000     30.0000     13.4900
+   1053.3800   1513.3100     30.0000     13.4800
+   1054.0000   1513.3300     30.0000     13.4900
+   1054.6300   1513.3300     30.0000     13.4800
+   1055.2500   1513.3400     30.0000     13.4800
+   1055.8800   1513.3600     30.0000     13.4900
+   1056.5000   1513.3700     30.0000     13.4800
+   1057.1200   1513.3700     30.0000     13.4800
+   1057.7500   1513.3900     30.0000     13.4900
+   1058.3700   1513.4100     30.0000     13.4900
+   1059.0000   1513.4300     30.0000     13.4900
+   1059.6200   1513.4300     30.0000     13.4900
+   1060.2400   1513.4300     30.0000     13.4900
+   1060.8700   1513.4400     30.0000     13.4900
+   1061.4900   1513.4600     30.0000     13.4900
+   1062.1100   1513.4600     30.0000     13.4900
+   1062.7400   1513.4700     30.0000     13.4900
+   1063.3600   1513.4900     30.0000     13.4900
+   1063.9800   1513.4900     30.0000     13.4900
+   1064.6100   1513.5000     30.0000     13.4900
+   1065.2300   1513.5200     30.0000     13.4900
+   1065.8600   1513.5200     30.0000     13.4800
+   1066.4800   1513.5300     30.0000     13.4800
+   1067.1000   1513.5700     30.0000     13.4900
+   1067.7300   1513.6100     30.0000     13.5000
+   1068.3500   1513.6100     30.0000     13.5000
+   1068.9700   1513.6200     30.0000     13.5000
+   1069.5900   1513.5900     30.0000     13.4900
+   1070.2200   1513.5900     30.0000     13.4900
+   1070.8400   1513.6300     30.0000     13.4900
+   1071.4600   1513.7100     30.0000     13.5100
+   1072.0900   1513.7000     30.0000     13.5100
+   1072.7100   1513.6600     30.0000     13.4900
+   1073.3300   1513.6400     30.0000     13.4800
+   1073.9600   1513.6500     30.0000     13.4800
+   1074.5800   1513.6600     30.0000     13.4800
+   1075.2000   1513.6700     30.0000     13.4800
+   1075.8200   1513.6900     30.0000     13.4900
+   1076.4500   1513.7500     30.0000     13.5000
+   1077.0700   1513.7600     30.0000     13.5000
+   1077.6900   1513.7400     30.0000     13.4900
+   1078.3200   1513.7600     30.0000     13.5000
+   1078.9400   1513.7600     30.0000     13.4900
+   1079.5600   1513.7700     30.0000     13.4900
+   1080.1800   1513.8100     30.0000     13.5000
+   1080.8100   1513.9600     30.0000     13.5400
+   1081.4300   1513.9600     30.0000     13.5400
+   1082.0500   1513.9100     30.0000     13.5200
+   1082.6700   1513.8400     30.0000     13.5000
+   1083.3000   1513.8300     30.0000     13.4900
+   1083.9200   1513.8400     30.0000     13.4900
+   1084.5400   1513.8400     30.0000     13.4900
+   1085.1600   1513.8600     30.0000     13.4900
+   1085.7900   1513.9300     30.0000     13.5100
+   1086.4100   1513.8900     30.0000     13.4900
+   1087.0300   1513.8800     30.0000     13.4900
+   1087.6500   1514.0100     30.0000     13.5200
+   1088.2700   1514.1400     30.0000     13.5600
+   1088.9000   1514.0100     30.0000     13.5200
+   1089.5200   1513.9400     30.0000     13.4900
+   1090.1400   1513.9300     30.0000     13.4900
+   1090.7600   1513.9300     30.0000     13.4900
+   1091.3800   1513.9500     30.0000     13.4900
+   1092.0100   1513.9600     30.0000     13.4900
+   1092.6300   1513.9700     30.0000     13.4900
+   1093.2500   1513.9900     30.0000     13.4900
+   1093.8700   1514.0100     30.0000     13.4900
+   1094.4900   1514.0600     30.0000     13.5000
+   1095.1100   1514.3200     30.0000     13.5800
+   1095.7400   1514.3000     30.0000     13.5700
+   1096.3600   1514.2400     30.0000     13.5500
+   1096.9800   1514.2300     30.0000     13.5400
+   1097.6000   1514.2300     30.0000     13.5400
+   1098.2200   1514.2300     30.0000     13.5400
+   1098.8400   1514.1900     30.0000     13.5200
+   1099.4700   1514.1200     30.0000     13.5000
+   1100.0900   1514.1200     30.0000     13.4900
+   1100.7100   1514.1200     30.0000     13.4900
+   1101.3300   1514.1600     30.0000     13.5000
+   1101.9500   1514.1900     30.0000     13.5100
+   1102.5700   1514.1700     30.0000     13.5000
+   1103.1900   1514.1800     30.0000     13.5000
+   1103.8100   1514.1800     30.0000     13.4900
+   1104.4400   1514.1900     30.0000     13.4900
+   1105.0600   1514.2000     30.0000     13.4900
+   1105.6800   1514.2100     30.0000     13.4900
+   1106.3000   1514.2200     30.0000     13.4900
+   1106.9200   1514.2400     30.0000     13.5000
+   1107.5400   1514.2500     30.0000     13.5000
+   1108.1600   1514.2500     30.0000     13.4900
+   1108.7800   1514.2600     30.0000     13.4900
+   1109.4000   1514.2700     30.0000     13.4900
+   1110.0200   1514.2800     30.0000     13.4900
+   1110.6500   1514.2900     30.0000     13.4900
+   1111.2700   1514.3000     30.0000     13.4900
+   1111.8900   1514.3000     30.0000     13.4900
+   1112.5100   1514.3000     30.0000     13.4900
+   1113.1300   1514.3300     30.0000     13.4900
+   1113.7500   1514.3400     30.0000     13.4900
+   1114.3700   1514.3600     30.0000     13.4900
+   1114.9900   1514.3700     30.0000     13.4900
+   1115.6100   1514.3800     30.0000     13.4900
+   1116.2300   1514.3900     30.0000     13.5000
+   1116.8500   1514.4000     30.0000     13.4900
+   1117.4700   1514.4100     30.0000     13.4900
+   1118.0900   1514.4200     30.0000     13.5000
+   1118.7100   1514.4300     30.0000     13.4900
+   1119.3300   1514.4300     30.0000     13.4900
+   1119.9500   1514.4400     30.0000     13.4900
+   1120.5700   1514.4500     30.0000     13.4900
+   1121.1900   1514.4700     30.0000     13.4900
+   1121.8100   1514.4800     30.0000     13.4900
+   1122.4300   1514.4900     30.0000     13.4900
+   1123.0500   1514.5000     30.0000     13.4900
+   1123.6700   1514.5100     30.0000     13.4900
+   1124.2900   1514.5200     30.0000     13.4900
+   1124.9100   1514.5400     30.0000     13.5000
+   1125.5300   1514.5600     30.0000     13.5000
+   1126.1500   1514.5600     30.0000     13.5000
+   1126.7700   1514.5500     30.0000     13.4900
+   1127.3900   1514.5600     30.0000     13.4900
+   1128.0100   1514.5700     30.0000     13.4900
+   1128.6300   1514.5800     30.0000     13.4900
+   1129.2500   1514.5900     30.0000     13.4900
+   1129.8700   1514.6200     30.0000     13.5000
+   1130.4900   1514.9800     30.0000     13.6000
+   1131.1100   1515.1600     30.0000     13.6500
+   1131.7300   1515.0200     30.0000     13.6100
+   1132.3500   1514.9500     30.0000     13.5800
+   1132.9700   1514.9300     30.0000     13.5700
+   1133.5900   1514.9200     30.0000     13.5700
+   1134.2100   1514.9000     30.0000     13.5600
+   1134.8300   1514.8900     30.0000     13.5500
+   1135.4500   1514.8900     30.0000     13.5500
+   1136.0700   1514.9000     30.0000     13.5500
+   1136.6900   1514.9000     30.0000     13.5500
+   1137.3100   1514.8700     30.0000     13.5400
+   1137.9200   1514.8500     30.0000     13.5200
+   1138.5400   1514.9300     30.0000     13.5500
+   1139.1600   1514.9100     30.0000     13.5400
+   1139.7800   1514.8100     30.0000     13.5000
+   1140.4000   1514.7900     30.0000     13.4900
+   1141.0200   1514.8000     30.0000     13.4900
+   1141.6400   1514.9000     30.0000     13.5200
+   1142.2600   1514.9800     30.0000     13.5400
+   1142.8800   1514.9300     30.0000     13.5200
+   1143.5000   1514.8400     30.0000     13.5000
+   1144.1100   1514.8600     30.0000     13.5000
+   1144.7300   1514.8600     30.0000     13.4900
+   1145.3500   1514.8600     30.0000     13.4900
+   1145.9700   1514.8900     30.0000     13.5000
+   1146.5900   1514.9000     30.0000     13.5000
+   1147.2100   1514.9400     30.0000     13.5100
+   1147.8300   1514.9900     30.0000     13.5200
+   1148.4400   1514.9600     30.0000     13.5000
+   1149.0600   1514.9700     30.0000     13.5100
+   1149.6800   1515.1700     30.0000     13.5600
+   1150.3000   1515.1700     30.0000     13.5600
+   1150.9200   1515.1300     30.0000     13.5400
+   1151.5400   1515.1200     30.0000     13.5400
+   1152.1600   1515.1100     30.0000     13.5300
+   1152.7700   1515.1300     30.0000     13.5300
+   1153.3900   1515.1400     30.0000     13.5300
+   1154.0100   1515.1400     30.0000     13.5300
+   1154.6300   1515.1500     30.0000     13.5300
+   1155.2500   1515.1500     30.0000     13.5300
+   1155.8600   1515.1800     30.0000     13.5300
+   1156.4800   1515.1600     30.0000     13.5300
+   1157.1000   1515.1200     30.0000     13.5100
+   1157.7200   1515.1900     30.0000     13.5300
+   1158.3400   1515.2100     30.0000     13.5300
+   1158.9600   1515.2100     30.0000     13.5300
+   1159.5700   1515.2200     30.0000     13.5300
+   1160.1900   1515.2300     30.0000     13.5300
+   1160.8100   1515.2300     30.0000     13.5300
+   1161.4300   1515.2400     30.0000     13.5200
+   1162.0400   1515.2500     30.0000     13.5300
+   1162.6600   1515.2600     30.0000     13.5200
+   1163.2800   1515.2700     30.0000     13.5200
+   1163.9000   1515.2800     30.0000     13.5300
+   1164.5200   1515.2900     30.0000     13.5200
+   1165.1300   1515.2900     30.0000     13.5200
+   1165.7500   1515.3000     30.0000     13.5200
+   1166.3700   1515.3200     30.0000     13.5300
+   1166.9900   1515.3400     30.0000     13.5300
+   1167.6000   1515.3500     30.0000     13.5300
+   1168.2200   1515.3400     30.0000     13.5200
+   1168.8400   1515.3600     30.0000     13.5200
+   1169.4500   1515.3700     30.0000     13.5300
+   1170.0700   1515.3800     30.0000     13.5200
+   1170.6900   1515.3900     30.0000     13.5200
+   1171.3100   1515.4000     30.0000     13.5200
+   1171.9200   1515.4100     30.0000     13.5200
+   1172.5400   1515.4300     30.0000     13.5300
+   1173.1600   1515.4500     30.0000     13.5300
+   1173.7800   1515.4500     30.0000     13.5300
+   1174.3900   1515.4500     30.0000     13.5200
+   1175.0100   1515.4600     30.0000     13.5200
+   1175.6300   1515.4800     30.0000     13.5300
+   1176.2400   1515.4800     30.0000     13.5200
+   1176.8600   1515.5000     30.0000     13.5300
+   1177.4800   1515.5100     30.0000     13.5300
+   1178.0900   1515.5100     30.0000     13.5200
+   1178.7100   1515.5200     30.0000     13.5200
+   1179.3300   1515.5300     30.0000     13.5200
+   1179.9400   1515.5500     30.0000     13.5200
+   1180.5600   1515.5500     30.0000     13.5200
+   1181.1800   1515.5700     30.0000     13.5300
+   1181.7900   1515.5900     30.0000     13.5300
+   1182.4100   1515.5900     30.0000     13.5200
+   1183.0300   1515.5800     30.0000     13.5200
+   1183.6400   1515.5900     30.0000     13.5200
+   1184.2600   1515.6100     30.0000     13.5200
+   1184.8800   1515.6100     30.0000     13.5200
+   1185.4900   1515.6300     30.0000     13.5200
+   1186.1100   1515.6400     30.0000     13.5200
+   1186.7300   1515.6500     30.0000     13.5200
+   1187.3400   1515.6600     30.0000     13.5200
+   1187.9600   1515.6600     30.0000     13.5200
+   1188.5700   1515.6800     30.0000     13.5200
+   1189.1900   1515.6800     30.0000     13.5200
+   1189.8100   1515.6900     30.0000     13.5200
+   1190.4200   1515.7100     30.0000     13.5200
+   1191.0400   1515.7100     30.0000     13.5200
+   1191.6500   1515.7300     30.0000     13.5200
+   1192.2700   1515.7500     30.0000     13.5200
+   1192.8900   1515.7600     30.0000     13.5200
+   1193.5000   1515.7600     30.0000     13.5200
+   1194.1200   1515.7800     30.0000     13.5200
+   1194.7300   1515.7800     30.0000     13.5200
+   1195.3500   1515.8000     30.0000     13.5200
+   1195.9700   1515.8100     30.0000     13.5200
+   1196.5800   1515.8300     30.0000     13.5300
+   1197.2000   1515.8400     30.0000     13.5300
+   1197.8100   1515.8400     30.0000     13.5300
+   1198.4300   1515.8500     30.0000     13.5200
+   1199.0400   1515.8700     30.0000     13.5300
+   1199.6600   1515.8800     30.0000     13.5300
+   1200.2800   1515.8900     30.0000     13.5300
+   1200.8900   1515.8900     30.0000     13.5200
+   1201.5100   1515.9100     30.0000     13.5300
+   1202.1200   1515.9300     30.0000     13.5300
+   1202.7400   1515.9400     30.0000     13.5300
+   1203.3500   1515.9400     30.0000     13.5300
+   1203.9700   1515.9600     30.0000     13.5300
+   1204.5800   1515.9700     30.0000     13.5300
+   1205.2000   1515.9800     30.0000     13.5300
+   1205.8100   1515.9800     30.0000     13.5300
+   1206.4300   1516.0000     30.0000     13.5300
+   1207.0400   1516.0100     30.0000     13.5300
+   1207.6600   1516.0200     30.0000     13.5300
+   1208.2700   1516.0400     30.0000     13.5300
+   1208.8900   1516.0500     30.0000     13.5300
+   1209.5000   1516.0600     30.0000     13.5300
+   1210.1200   1516.0700     30.0000     13.5300
+   1210.7300   1516.0900     30.0000     13.5300
+   1211.3500   1516.0900     30.0000     13.5300
+   1211.9600   1516.1100     30.0000     13.5300
+   1212.5800   1516.1200     30.0000     13.5300
+   1213.1900   1516.1300     30.0000     13.5400
+   1213.8100   1516.1500     30.0000     13.5400
+   1214.4200   1516.1600     30.0000     13.5400
+   1215.0400   1516.1600     30.0000     13.5400
+   1215.6500   1516.1700     30.0000     13.5300
+   1216.2700   1516.1800     30.0000     13.5300
+   1216.8800   1516.1900     30.0000     13.5300
+   1217.4900   1516.2000     30.0000     13.5300
+   1218.1100   1516.2100     30.0000     13.5300
+   1218.7200   1516.2200     30.0000     13.5300
+   1219.3400   1516.2400     30.0000     13.5400
+   1219.9500   1516.2400     30.0000     13.5300
+   1220.5700   1516.2500     30.0000     13.5300
+   1221.1800   1516.2600     30.0000     13.5300
+   1221.8000   1516.2700     30.0000     13.5300
+   1222.4100   1516.2800     30.0000     13.5300
+   1223.0200   1516.2900     30.0000     13.5300
+   1223.6400   1516.2900     30.0000     13.5300
+   1224.2500   1516.3000     30.0000     13.5300
+   1224.8700   1516.3100     30.0000     13.5300
+   1225.4800   1516.3200     30.0000     13.5300
+   1226.0900   1516.3300     30.0000     13.5300
+   1226.7100   1516.3300     30.0000     13.5300
+   1227.3200   1516.3500     30.0000     13.5300
+   1227.9400   1516.3600     30.0000     13.5300
+   1228.5500   1516.3700     30.0000     13.5300
+   1229.1600   1516.3900     30.0000     13.5300
+   1229.7800   1516.3900     30.0000     13.5300
+   1230.3900   1516.4000     30.0000     13.5300
+   1231.0000   1516.4000     30.0000     13.5300
+   1231.6200   1516.4200     30.0000     13.5300
+   1232.2300   1516.4300     30.0000     13.5300
+   1232.8500   1516.4300     30.0000     13.5300
+   1233.4600   1516.4500     30.0000     13.5300
+   1234.0700   1516.4700     30.0000     13.5300
+   1234.6900   1516.4600     30.0000     13.5300
+   1235.3000   1516.4700     30.0000     13.5300
+   1235.9100   1516.4800     30.0000     13.5300
+   1236.5300   1516.4800     30.0000     13.5200
+   1237.1400   1516.5000     30.0000     13.5300
+   1237.7500   1516.5200     30.0000     13.5300
+   1238.3700   1516.5200     30.0000     13.5200
+   1238.9800   1516.5300     30.0000     13.5300
+   1239.5900   1516.5500     30.0000     13.5300
+   1240.2100   1516.5500     30.0000     13.5300
+   1240.8200   1516.5600     30.0000     13.5200
+   1241.4300   1516.5700     30.0000     13.5300
+   1242.0400   1516.5800     30.0000     13.5300
+   1242.6600   1516.5900     30.0000     13.5300
+   1243.2700   1516.6000     30.0000     13.5300
+   1243.8800   1516.6100     30.0000     13.5300
+   1244.5000   1516.6200     30.0000     13.5300
+   1245.1100   1516.6300     30.0000     13.5300
+   1245.7200   1516.6400     30.0000     13.5300
+   1246.3300   1516.6500     30.0000     13.5200
+   1246.9500   1516.6600     30.0000     13.5200
+   1247.5600   1516.6700     30.0000     13.5300
+   1248.1700   1516.6800     30.0000     13.5300
+   1248.7900   1516.6800     30.0000     13.5200
+   1249.4000   1516.6900     30.0000     13.5200
+   1250.0100   1516.7200     30.0000     13.5300
+   1250.6200   1516.7200     30.0000     13.5300
+   1251.2400   1516.7200     30.0000     13.5200
+   1251.8500   1516.7300     30.0000     13.5200
+   1252.4600   1516.7500     30.0000     13.5200
+   1253.0700   1516.7700     30.0000     13.5300
+   1253.6900   1516.7700     30.0000     13.5300
+   1254.3000   1516.7800     30.0000     13.5300
+   1254.9100   1516.8000     30.0000     13.5300
+   1255.5200   1516.8100     30.0000     13.5300
+   1256.1300   1516.8200     30.0000     13.5300
+   1256.7500   1516.8300     30.0000     13.5300
+   1257.3600   1516.8500     30.0000     13.5300
+   1257.9700   1516.8500     30.0000     13.5300
+   1258.5800   1516.8700     30.0000     13.5300
+   1259.1900   1516.8800     30.0000     13.5300
+   1259.8100   1516.8800     30.0000     13.5300
+   1260.4200   1516.9000     30.0000     13.5300
+   1261.0300   1516.9100     30.0000     13.5300
+   1261.6400   1516.9100     30.0000     13.5300
+   1262.2500   1516.9200     30.0000     13.5300
+   1262.8700   1516.9300     30.0000     13.5300
+   1263.4800   1516.9400     30.0000     13.5300
+   1264.0900   1516.9500     30.0000     13.5300
+   1264.7000   1516.9600     30.0000     13.5300
+   1265.3100   1516.9700     30.0000     13.5300
+   1265.9200   1516.9800     30.0000     13.5300
+   1266.5400   1516.9900     30.0000     13.5300
+   1267.1500   1516.9900     30.0000     13.5300
+   1267.7600   1517.0100     30.0000     13.5300
+   1268.3700   1517.0300     30.0000     13.5300
+   1268.9800   1517.0300     30.0000     13.5300
+   1269.5900   1517.0400     30.0000     13.5300
+   1270.2100   1517.0500     30.0000     13.5300
+   1270.8200   1517.0700     30.0000     13.5300
+   1271.4300   1517.0800     30.0000     13.5300
+   1272.0400   1517.0900     30.0000     13.5300
+   1272.6500   1517.1000     30.0000     13.5300
+   1273.2600   1517.1100     30.0000     13.5300
+   1273.8700   1517.1200     30.0000     13.5300
+   1274.4800   1517.1300     30.0000     13.5300
+   1275.0900   1517.1300     30.0000     13.5300
+   1275.7100   1517.1400     30.0000     13.5300
+   1276.3200   1517.1600     30.0000     13.5300
+   1276.9300   1517.1600     30.0000     13.5300
+   1277.5400   1517.1800     30.0000     13.5300
+   1278.1500   1517.2000     30.0000     13.5300
+   1278.7600   1517.2000     30.0000     13.5300
+   1279.3700   1517.2100     30.0000     13.5300
+   1279.9800   1517.2300     30.0000     13.5300
+   1280.5900   1517.2400     30.0000     13.5300
+   1281.2000   1517.2500     30.0000     13.5300
+   1281.8100   1517.2600     30.0000     13.5300
+   1282.4200   1517.2600     30.0000     13.5300
+   1283.0400   1517.2700     30.0000     13.5300
+   1283.6500   1517.2700     30.0000     13.5300
+   1284.2600   1517.2800     30.0000     13.5300
+   1284.8700   1517.2800     30.0000     13.5200
+   1285.4800   1517.2900     30.0000     13.5200
+   1286.0900   1517.3100     30.0000     13.5300
+   1286.7000   1517.3200     30.0000     13.5300
+   1287.3100   1517.3400     30.0000     13.5300
+   1287.9200   1517.3400     30.0000     13.5200
+   1288.5300   1517.3500     30.0000     13.5300
+   1289.1400   1517.3700     30.0000     13.5300
+   1289.7500   1517.3700     30.0000     13.5300
+   1290.3600   1517.3700     30.0000     13.5200
+   1290.9700   1517.3800     30.0000     13.5200
+   1291.5800   1517.3900     30.0000     13.5200
+   1292.1900   1517.4000     30.0000     13.5200
+   1292.8000   1517.4100     30.0000     13.5200
+   1293.4100   1517.4100     30.0000     13.5200
+   1294.0200   1517.4200     30.0000     13.5200
+   1294.6300   1517.4400     30.0000     13.5200
+   1295.2400   1517.4500     30.0000     13.5200
+   1295.8500   1517.4600     30.0000     13.5200
+   1296.4600   1517.4700     30.0000     13.5200
+   1297.0700   1517.4700     30.0000     13.5200
+   1297.6800   1517.4900     30.0000     13.5200
+   1298.2900   1517.5000     30.0000     13.5200
+   1298.9000   1517.5100     30.0000     13.5200
+   1299.5100   1517.5100     30.0000     13.5200
+   1300.1200   1517.5300     30.0000     13.5200
+   1300.7300   1517.5400     30.0000     13.5200
+   1301.3400   1517.5500     30.0000     13.5200
+   1301.9500   1517.5600     30.0000     13.5200
+   1302.5600   1517.5800     30.0000     13.5200
+   1303.1600   1517.5900     30.0000     13.5200
+   1303.7700   1517.6000     30.0000     13.5200
+   1304.3800   1517.6100     30.0000     13.5300
+   1304.9900   1517.6200     30.0000     13.5200
+   1305.6000   1517.6200     30.0000     13.5200
+   1306.2100   1517.6400     30.0000     13.5200
+   1306.8200   1517.6600     30.0000     13.5300
+   1307.4300   1517.6700     30.0000     13.5300
+   1308.0400   1517.6900     30.0000     13.5300
+   1308.6500   1517.6900     30.0000     13.5300
+   1309.2600   1517.7000     30.0000     13.5300
+   1309.8700   1517.7200     30.0000     13.5300
+   1310.4700   1517.7400     30.0000     13.5300
+   1311.0800   1517.7500     30.0000     13.5300
+   1311.6900   1517.7500     30.0000     13.5300
+   1312.3000   1517.7600     30.0000     13.5300
+   1312.9100   1517.7800     30.0000     13.5300
+   1313.5200   1517.7900     30.0000     13.5300
+   1314.1300   1517.8000     30.0000     13.5300
+   1314.7400   1517.8000     30.0000     13.5300
+   1315.3500   1517.8200     30.0000     13.5300
+   1315.9500   1517.8300     30.0000     13.5300
+   1316.5600   1517.8400     30.0000     13.5300
+   1317.1700   1517.8400     30.0000     13.5300
+   1317.7800   1517.8600     30.0000     13.5300
+   1318.3900   1517.8700     30.0000     13.5300
+   1319.0000   1517.8900     30.0000     13.5300
+   1319.6000   1517.8800     30.0000     13.5300
+   1320.2100   1517.8900     30.0000     13.5300
+   1320.8200   1517.9000     30.0000     13.5300
+   1321.4300   1517.9100     30.0000     13.5300
+   1322.0400   1517.9300     30.0000     13.5300
+   1322.6500   1517.9300     30.0000     13.5300
+   1323.2500   1517.9400     30.0000     13.5300
+   1323.8600   1517.9500     30.0000     13.5300
+   1324.4700   1517.9700     30.0000     13.5300
+   1325.0800   1517.9700     30.0000     13.5300
+   1325.6900   1517.9800     30.0000     13.5300
+   1326.2900   1517.9900     30.0000     13.5300
+   1326.9000   1518.0100     30.0000     13.5300
+   1327.5100   1518.0300     30.0000     13.5300
+   1328.1200   1518.0300     30.0000     13.5300
+   1328.7300   1518.0400     30.0000     13.5300
+   1329.3300   1518.0500     30.0000     13.5300
+   1329.9400   1518.0700     30.0000     13.5300
+   1330.5500   1518.0800     30.0000     13.5400
+   1331.1600   1518.0900     30.0000     13.5400
+   1331.7700   1518.1100     30.0000     13.5400
+   1332.3700   1518.1100     30.0000     13.5400
+   1332.9800   1518.1300     30.0000     13.5400
+   1333.5900   1518.1400     30.0000     13.5400
+   1334.2000   1518.1500     30.0000     13.5400
+   1334.8000   1518.1700     30.0000     13.5400
+   1335.4100   1518.1900     30.0000     13.5400
+   1336.0200   1518.1900     30.0000     13.5400
+   1336.6300   1518.2000     30.0000     13.5400
+   1337.2300   1518.2100     30.0000     13.5400
+   1337.8400   1518.2200     30.0000     13.5400
+   1338.4500   1518.2200     30.0000     13.5400
+   1339.0500   1518.2300     30.0000     13.5400
+   1339.6600   1518.2400     30.0000     13.5400
+   1340.2700   1518.2500     30.0000     13.5400
+   1340.8800   1518.2700     30.0000     13.5400
+   1341.4800   1518.2800     30.0000     13.5400
+   1342.0900   1518.2800     30.0000     13.5400
+   1342.7000   1518.3000     30.0000     13.5400
+   1343.3000   1518.3000     30.0000     13.5400
+   1343.9100   1518.3100     30.0000     13.5400
+   1344.5200   1518.3200     30.0000     13.5400
+   1345.1300   1518.3400     30.0000     13.5400
+   1345.7300   1518.3600     30.0000     13.5400
+   1346.3400   1518.3600     30.0000     13.5400
+   1346.9500   1518.3700     30.0000     13.5400
+   1347.5500   1518.3900     30.0000     13.5400
+   1348.1600   1518.4100     30.0000     13.5500
+   1348.7700   1518.4200     30.0000     13.5500
+   1349.3700   1518.4200     30.0000     13.5400
+   1349.9800   1518.4100     30.0000     13.5400
+   1350.5900   1518.4300     30.0000     13.5400
+   1351.1900   1518.4400     30.0000     13.5400
+   1351.8000   1518.4500     30.0000     13.5400
+   1352.4100   1518.4500     30.0000     13.5400
+   1353.0100   1518.4600     30.0000     13.5400
+   1353.6200   1518.4800     30.0000     13.5400
+   1354.2200   1518.4900     30.0000     13.5400
+   1354.8300   1518.5000     30.0000     13.5400
+   1355.4400   1518.5100     30.0000     13.5400
+   1356.0400   1518.5300     30.0000     13.5400
+   1356.6500   1518.5300     30.0000     13.5400
+   1357.2600   1518.5400     30.0000     13.5400
+   1357.8600   1518.5500     30.0000     13.5400
+   1358.4700   1518.5600     30.0000     13.5400
+   1359.0700   1518.5600     30.0000     13.5400
+   1359.6800   1518.5800     30.0000     13.5400
+   1360.2900   1518.6000     30.0000     13.5400
+   1360.8900   1518.6000     30.0000     13.5400
+   1361.5000   1518.6200     30.0000     13.5400
+   1362.1000   1518.6200     30.0000     13.5400
+   1362.7100   1518.6300     30.0000     13.5400
+   1363.3200   1518.6500     30.0000     13.5400
+   1363.9200   1518.6600     30.0000     13.5400
+   1364.5300   1518.6700     30.0000     13.5400
+   1365.1300   1518.6800     30.0000     13.5400
+   1365.7400   1518.6900     30.0000     13.5400
+   1366.3400   1518.6900     30.0000     13.5400
+   1366.9500   1518.7100     30.0000     13.5400
+   1367.5500   1518.7200     30.0000     13.5400
+   1368.1600   1518.7300     30.0000     13.5400
+   1368.7700   1518.7400     30.0000     13.5400
+   1369.3700   1518.7600     30.0000     13.5500
+   1369.9800   1518.7700     30.0000     13.5500
+   1370.5800   1518.7800     30.0000     13.5500
+   1371.1900   1518.7900     30.0000     13.5500
+   1371.7900   1518.8000     30.0000     13.5500
+   1372.4000   1518.8100     30.0000     13.5500
+   1373.0000   1518.8200     30.0000     13.5500
+   1373.6100   1518.8300     30.0000     13.5400
+   1374.2100   1518.8400     30.0000     13.5500
+   1374.8200   1518.8500     30.0000     13.5400
+   1375.4200   1518.8600     30.0000     13.5500
+   1376.0300   1518.8700     30.0000     13.5500
+   1376.6300   1518.8900     30.0000     13.5500
+   1377.2400   1518.9000     30.0000     13.5500
+   1377.8400   1518.9100     30.0000     13.5500
+   1378.4500   1518.9100     30.0000     13.5500
+   1379.0500   1518.9200     30.0000     13.5500
+   1379.6600   1518.9400     30.0000     13.5500
+   1380.2600   1518.9500     30.0000     13.5500
+   1380.8700   1518.9500     30.0000     13.5400
+   1381.4700   1518.9600     30.0000     13.5500
+   1382.0800   1518.9800     30.0000     13.5500
+   1382.6800   1518.9900     30.0000     13.5500
+   1383.2900   1519.0000     30.0000     13.5500
+   1383.8900   1519.0000     30.0000     13.5500
+   1384.5000   1519.0200     30.0000     13.5500
+   1385.1000   1519.0200     30.0000     13.5500
+   1385.7000   1519.0300     30.0000     13.5500
+   1386.3100   1519.0400     30.0000     13.5500
+   1386.9100   1519.0500     30.0000     13.5400
+   1387.5200   1519.0600     30.0000     13.5400
+   1388.1200   1519.0700     30.0000     13.5500
+   1388.7300   1519.0800     30.0000     13.5500
+   1389.3300   1519.1000     30.0000     13.5500
+   1389.9300   1519.1000     30.0000     13.5500
+   1390.5400   1519.1200     30.0000     13.5500
+   1391.1400   1519.1300     30.0000     13.5500
+   1391.7500   1519.1300     30.0000     13.5500
+   1392.3500   1519.1400     30.0000     13.5500
+   1392.9500   1519.1600     30.0000     13.5500
+   1393.5600   1519.1700     30.0000     13.5500
+   1394.1600   1519.1800     30.0000     13.5500
+   1394.7700   1519.2000     30.0000     13.5500
+   1395.3700   1519.2100     30.0000     13.5500
+   1395.9700   1519.2300     30.0000     13.5500
+   1396.5800   1519.2200     30.0000     13.5500
+   1397.1800   1519.2300     30.0000     13.5500
+   1397.7900   1519.2500     30.0000     13.5500
+   1398.3900   1519.2600     30.0000     13.5500
+   1398.9900   1519.2700     30.0000     13.5500
+   1399.6000   1519.2700     30.0000     13.5500
+   1400.2000   1519.2800     30.0000     13.5500
+   1400.8000   1519.2900     30.0000     13.5500
+   1401.4100   1519.3100     30.0000     13.5500
+   1402.0100   1519.3200     30.0000     13.5500
+   1402.6100   1519.3300     30.0000     13.5500
+   1403.2200   1519.3400     30.0000     13.5500
+   1403.8200   1519.3500     30.0000     13.5500
+   1404.4200   1519.3700     30.0000     13.5500
+   1405.0300   1519.3800     30.0000     13.5500
+   1405.6300   1519.3900     30.0000     13.5500
+   1406.2300   1519.4000     30.0000     13.5500
+   1406.8400   1519.4000     30.0000     13.5500
+   1407.4400   1519.4100     30.0000     13.5500
+   1408.0400   1519.4200     30.0000     13.5500
+   1408.6500   1519.4300     30.0000     13.5500
+   1409.2500   1519.4400     30.0000     13.5500
+   1409.8500   1519.4500     30.0000     13.5500
+   1410.4500   1519.5100     30.0000     13.5700
+   1411.0600   1519.5500     30.0000     13.5700
+   1411.6600   1519.5800     30.0000     13.5800
+   1412.2600   1519.6100     30.0000     13.5900
+   1412.8700   1519.6300     30.0000     13.5900
+   1413.4700   1519.6400     30.0000     13.5900
+   1414.0700   1519.6600     30.0000     13.5900
+   1414.6700   1519.6800     30.0000     13.6000
+   1415.2800   1519.6900     30.0000     13.5900
+   1415.8800   1519.7000     30.0000     13.6000
+   1416.4800   1519.7200     30.0000     13.6000
+   1417.0900   1519.7400     30.0000     13.6000
+   1417.6900   1519.7500     30.0000     13.6000
+   1418.2900   1519.7600     30.0000     13.6000
+   1418.8900   1519.7800     30.0000     13.6100
+   1419.4900   1519.8100     30.0000     13.6100
+   1420.1000   1519.8400     30.0000     13.6200
+   1420.7000   1519.8500     30.0000     13.6200
+   1421.3000   1519.8600     30.0000     13.6200
+   1421.9000   1519.8700     30.0000     13.6200
+   1422.5100   1519.8800     30.0000     13.6200
+   1423.1100   1519.8900     30.0000     13.6200
+   1423.7100   1519.9000     30.0000     13.6200
+   1424.3100   1519.9000     30.0000     13.6100
+   1424.9200   1519.9000     30.0000     13.6100
+   1425.5200   1519.9200     30.0000     13.6100
+   1426.1200   1519.9400     30.0000     13.6200
+   1426.7200   1519.9500     30.0000     13.6200
+   1427.3200   1519.9600     30.0000     13.6200
+   1427.9200   1519.9700     30.0000     13.6200
+   1428.5300   1519.9800     30.0000     13.6200
+   1429.1300   1519.9900     30.0000     13.6200
+   1429.7300   1520.0000     30.0000     13.6200
+   1430.3300   1520.0200     30.0000     13.6200
+   1430.9300   1520.0300     30.0000     13.6200
+   1431.5400   1520.0300     30.0000     13.6200
+   1432.1400   1520.0300     30.0000     13.6100
+   1432.7400   1520.0300     30.0000     13.6100
+   1433.3400   1520.0500     30.0000     13.6100
+   1433.9400   1520.0700     30.0000     13.6200
+   1434.5400   1520.0900     30.0000     13.6200
+   1435.1400   1520.1100     30.0000     13.6200
+   1435.7500   1520.1200     30.0000     13.6200
+   1436.3500   1520.1300     30.0000     13.6200
+   1436.9500   1520.1300     30.0000     13.6200
+   1437.5500   1520.1400     30.0000     13.6200
+   1438.1500   1520.1400     30.0000     13.6200
+   1438.7500   1520.1500     30.0000     13.6200
+   1439.3500   1520.1700     30.0000     13.6200
+   1439.9600   1520.1800     30.0000     13.6200
+   1440.5600   1520.1900     30.0000     13.6200
+   1441.1600   1520.2000     30.0000     13.6200
+   1441.7600   1520.2000     30.0000     13.6200
+   1442.3600   1520.2100     30.0000     13.6200
+   1442.9600   1520.2200     30.0000     13.6200
+   1443.5600   1520.2200     30.0000     13.6100
+   1444.1600   1520.2200     30.0000     13.6100
+   1444.7600   1520.2200     30.0000     13.6100
+   1445.3600   1520.2200     30.0000     13.6100
+   1445.9700   1520.2300     30.0000     13.6000
+   1446.5700   1520.2200     30.0000     13.6000
+   1447.1700   1520.2400     30.0000     13.6000
+   1447.7700   1520.2400     30.0000     13.6000
+   1448.3700   1520.2600     30.0000     13.6000
+   1448.9700   1520.2700     30.0000     13.6000
+   1449.5700   1520.2800     30.0000     13.6000
+   1450.1700   1520.3000     30.0000     13.6000
+   1450.7700   1520.2900     30.0000     13.6000
+   1451.3700   1520.2900     30.0000     13.6000
+   1451.9700   1520.3000     30.0000     13.6000
+   1452.5700   1520.3100     30.0000     13.6000
+   1453.1700   1520.3200     30.0000     13.6000
+   1453.7700   1520.3400     30.0000     13.6000
+   1454.3700   1520.3600     30.0000     13.6000
+   1454.9700   1520.3700     30.0000     13.6000
+   1455.5700   1520.3800     30.0000     13.6000
+   1456.1700   1520.4100     30.0000     13.6100
+   1456.7700   1520.4200     30.0000     13.6100
+   1457.3700   1520.4300     30.0000     13.6100
+   1457.9700   1520.4400     30.0000     13.6100
+   1458.5700   1520.4400     30.0000     13.6100
+   1459.1700   1520.4500     30.0000     13.6100
+   1459.7700   1520.4700     30.0000     13.6100
+   1460.3700   1520.4800     30.0000     13.6100
+   1460.9700   1520.4900     30.0000     13.6100
+   1461.5700   1520.5000     30.0000     13.6100
+   1462.1700   1520.5100     30.0000     13.6100
+   1462.7700   1520.5200     30.0000     13.6100
+   1463.3700   1520.5400     30.0000     13.6100
+   1463.9700   1520.5500     30.0000     13.6100
+   1464.5700   1520.5600     30.0000     13.6100
+   1465.1700   1520.5800     30.0000     13.6100
+   1465.7700   1520.5900     30.0000     13.6100
+   1466.3700   1520.6000     30.0000     13.6100
+   1466.9700   1520.6200     30.0000     13.6200
+   1467.5700   1520.6200     30.0000     13.6200
+   1468.1700   1520.6300     30.0000     13.6100
+   1468.7700   1520.6300     30.0000     13.6100
+   1469.3700   1520.6400     30.0000     13.6100
+   1469.9700   1520.6600     30.0000     13.6100
+   1470.5700   1520.6700     30.0000     13.6100
+   1471.1700   1520.6700     30.0000     13.6100
+   1471.7700   1520.6800     30.0000     13.6100
+   1472.3600   1520.6900     30.0000     13.6100
+   1472.9600   1520.7000     30.0000     13.6100
+   1473.5600   1520.7100     30.0000     13.6100
+   1474.1600   1520.7200     30.0000     13.6100
+   1474.7600   1520.7300     30.0000     13.6100
+   1475.3600   1520.7400     30.0000     13.6100
+   1475.9600   1520.7500     30.0000     13.6100
+   1476.5600   1520.7600     30.0000     13.6100
+   1477.1600   1520.7700     30.0000     13.6100
+   1477.7600   1520.7800     30.0000     13.6100
+   1478.3500   1520.7800     30.0000     13.6100
+   1478.9500   1520.7900     30.0000     13.6100
+   1479.5500   1520.7900     30.0000     13.6100
+   1480.1500   1520.8000     30.0000     13.6100
+   1480.7500   1520.8200     30.0000     13.6100
+   1481.3500   1520.8300     30.0000     13.6100
+   1481.9500   1520.8400     30.0000     13.6100
+   1482.5500   1520.8500     30.0000     13.6100
+   1483.1400   1520.8600     30.0000     13.6100
+   1483.7400   1520.8700     30.0000     13.6100
+   1484.3400   1520.8800     30.0000     13.6100
+   1484.9400   1520.8800     30.0000     13.6100
+   1485.5400   1520.8900     30.0000     13.6100
+   1486.1400   1520.9100     30.0000     13.6100
+   1486.7300   1520.9200     30.0000     13.6100
+   1487.3300   1520.9300     30.0000     13.6100
+   1487.9300   1520.9400     30.0000     13.6100
+   1488.5300   1520.9500     30.0000     13.6100
+   1489.1300   1520.9600     30.0000     13.6100
+   1489.7300   1520.9600     30.0000     13.6100
+   1490.3200   1520.9700     30.0000     13.6100
+   1490.9200   1520.9800     30.0000     13.6100
+   1491.5200   1521.0000     30.0000     13.6100
+   1492.1200   1521.0000     30.0000     13.6100
+   1492.7200   1521.0100     30.0000     13.6100
+   1493.3100   1521.0200     30.0000     13.6100
+   1493.9100   1521.0300     30.0000     13.6100
+   1494.5100   1521.0400     30.0000     13.6100
+   1495.1100   1521.0500     30.0000     13.6100
+   1495.7100   1521.0600     30.0000     13.6100
+   1496.3000   1521.0700     30.0000     13.6100
+   1496.9000   1521.0800     30.0000     13.6100
+   1497.5000   1521.0900     30.0000     13.6100
+   1498.1000   1521.1000     30.0000     13.6000
+   1498.6900   1521.1100     30.0000     13.6100
+   1499.2900   1521.1100     30.0000     13.6000
+   1499.8900   1521.1300     30.0000     13.6100
+   1500.4900   1521.1300     30.0000     13.6000
+   1501.0800   1521.1400     30.0000     13.6000
+   1501.6800   1521.1500     30.0000     13.6000
+   1502.2800   1521.1600     30.0000     13.6000
+   1502.8800   1521.1700     30.0000     13.6000
+   1503.4700   1521.1800     30.0000     13.6000
+   1504.0700   1521.1900     30.0000     13.6000
+   1504.6700   1521.2000     30.0000     13.6000
+   1505.2600   1521.2200     30.0000     13.6100
+   1505.8600   1521.2300     30.0000     13.6100
+   1506.4600   1521.2300     30.0000     13.6000
+   1507.0600   1521.2500     30.0000     13.6100
+   1507.6500   1521.2500     30.0000     13.6000
+   1508.2500   1521.2500     30.0000     13.6000
+   1508.8500   1521.2700     30.0000     13.6000
+   1509.4400   1521.2800     30.0000     13.6100
+   1510.0400   1521.3000     30.0000     13.6100
+   1510.6400   1521.3100     30.0000     13.6100
+   1511.2300   1521.3200     30.0000     13.6100
+   1511.8300   1521.3200     30.0000     13.6000
+   1512.4300   1521.3300     30.0000     13.6000
+   1513.0300   1521.3400     30.0000     13.6100
+   1513.6200   1521.3500     30.0000     13.6000
+   1514.2200   1521.3600     30.0000     13.6000
+   1514.8200   1521.3700     30.0000     13.6000
+   1515.4100   1521.3800     30.0000     13.6000
+   1516.0100   1521.3900     30.0000     13.6100
+   1516.6000   1521.4000     30.0000     13.6000
+   1517.2000   1521.4100     30.0000     13.6000
+   1517.8000   1521.4200     30.0000     13.6000
+   1518.3900   1521.4300     30.0000     13.6000
+   1518.9900   1521.4400     30.0000     13.6100
+   1519.5900   1521.4500     30.0000     13.6000
+   1520.1800   1521.4600     30.0000     13.6000
+   1520.7800   1521.4600     30.0000     13.6000
+   1521.3800   1521.4700     30.0000     13.6000
+   1521.9700   1521.4900     30.0000     13.6000
+   1522.5700   1521.5000     30.0000     13.6000
+   1523.1600   1521.5100     30.0000     13.6000
+   1523.7600   1521.5200     30.0000     13.6000
+   1524.3600   1521.5300     30.0000     13.6100
+   1524.9500   1521.5400     30.0000     13.6000
+   1525.5500   1521.5500     30.0000     13.6000
+   1526.1400   1521.5600     30.0000     13.6100
+   1526.7400   1521.5700     30.0000     13.6100
+   1527.3400   1521.5800     30.0000     13.6000
+   1527.9300   1521.5900     30.0000     13.6100
+   1528.5300   1521.5900     30.0000     13.6000
+   1529.1200   1521.6000     30.0000     13.6000
+   1529.7200   1521.6100     30.0000     13.6000
+   1530.3100   1521.6200     30.0000     13.6000
+   1530.9100   1521.6300     30.0000     13.6000
+   1531.5100   1521.6500     30.0000     13.6000
+   1532.1000   1521.6600     30.0000     13.6100
+   1532.7000   1521.6600     30.0000     13.6000
+   1533.2900   1521.6700     30.0000     13.6000
+   1533.8900   1521.6800     30.0000     13.6000
+   1534.4800   1521.6900     30.0000     13.6000
+   1535.0800   1521.7000     30.0000     13.6000
+   1535.6700   1521.7100     30.0000     13.6000
+   1536.2700   1521.7200     30.0000     13.6000
+   1536.8600   1521.7300     30.0000     13.6000
+   1537.4600   1521.7400     30.0000     13.6000
+   1538.0600   1521.7500     30.0000     13.6000
+   1538.6500   1521.7700     30.0000     13.6000
+   1539.2500   1521.7800     30.0000     13.6000
+   1539.8400   1521.7900     30.0000     13.6000
+   1540.4400   1521.8000     30.0000     13.6100
+   1541.0300   1521.8100     30.0000     13.6100
+   1541.6300   1521.8200     30.0000     13.6000
+   1542.2200   1521.8300     30.0000     13.6100
+   1542.8200   1521.8300     30.0000     13.6000
+   1543.4100   1521.8500     30.0000     13.6000
+   1544.0100   1521.8500     30.0000     13.6000
+   1544.6000   1521.8600     30.0000     13.6000
+   1545.1900   1521.8800     30.0000     13.6000
+   1545.7900   1521.8900     30.0000     13.6000
+   1546.3800   1521.9000     30.0000     13.6100
+   1546.9800   1521.9100     30.0000     13.6000
+   1547.5700   1521.9100     30.0000     13.6000
+   1548.1700   1521.9200     30.0000     13.6000
+   1548.7600   1521.9300     30.0000     13.6000
+   1549.3600   1521.9300     30.0000     13.6000
+   1549.9500   1521.9400     30.0000     13.6000
+   1550.5500   1521.9600     30.0000     13.6000
+   1551.1400   1521.9800     30.0000     13.6100
+   1551.7300   1521.9800     30.0000     13.6000
+   1552.3300   1521.9900     30.0000     13.6000
+   1552.9200   1522.0000     30.0000     13.6000
+   1553.5200   1522.0100     30.0000     13.6000
+   1554.1100   1522.0300     30.0000     13.6100
+   1554.7100   1522.0400     30.0000     13.6100
+   1555.3000   1522.0400     30.0000     13.6000
+   1555.8900   1522.0500     30.0000     13.6000
+   1556.4900   1522.0600     30.0000     13.6000
+   1557.0800   1522.0700     30.0000     13.6000
+   1557.6800   1522.0700     30.0000     13.6000
+   1558.2700   1522.0900     30.0000     13.6000
+   1558.8600   1522.0900     30.0000     13.6000
+   1559.4600   1522.1000     30.0000     13.6000
+   1560.0500   1522.1100     30.0000     13.6000
+   1560.6500   1522.1300     30.0000     13.6000
+   1561.2400   1522.1300     30.0000     13.6000
+   1561.8300   1522.1400     30.0000     13.6000
+   1562.4300   1522.1400     30.0000     13.6000
+   1563.0200   1522.1600     30.0000     13.6000
+   1563.6100   1522.1600     30.0000     13.6000
+   1564.2100   1522.1700     30.0000     13.6000
+   1564.8000   1522.1800     30.0000     13.6000
+   1565.4000   1522.1900     30.0000     13.6000
+   1565.9900   1522.2000     30.0000     13.6000
+   1566.5800   1522.2100     30.0000     13.6000
+   1567.1800   1522.2200     30.0000     13.6000
+   1567.7700   1522.2400     30.0000     13.6000
+   1568.3600   1522.2500     30.0000     13.6000
+   1568.9600   1522.2500     30.0000     13.6000
+   1569.5500   1522.2600     30.0000     13.6000
+   1570.1400   1522.2800     30.0000     13.6000
+   1570.7400   1522.2900     30.0000     13.6000
+   1571.3300   1522.2900     30.0000     13.6000
+   1571.9200   1522.3000     30.0000     13.6000
+   1572.5100   1522.3100     30.0000     13.6000
+   1573.1100   1522.3200     30.0000     13.6000
+   1573.7000   1522.3300     30.0000     13.6000
+   1574.2900   1522.3500     30.0000     13.6000
+   1574.8900   1522.3600     30.0000     13.6000
+   1575.4800   1522.3800     30.0000     13.6000
+   1576.0700   1522.3800     30.0000     13.6000
+   1576.6700   1522.4000     30.0000     13.6000
+   1577.2600   1522.4000     30.0000     13.6000
+   1577.8500   1522.4000     30.0000     13.6000
+   1578.4400   1522.4000     30.0000     13.6000
+   1579.0400   1522.4100     30.0000     13.6000
+   1579.6300   1522.4300     30.0000     13.6000
+   1580.2200   1522.4400     30.0000     13.6000
+   1580.8100   1522.4500     30.0000     13.6000
+   1581.4100   1522.4500     30.0000     13.6000
+   1582.0000   1522.4700     30.0000     13.6000
+   1582.5900   1522.4800     30.0000     13.6000
+   1583.1800   1522.4900     30.0000     13.6000
+   1583.7800   1522.5100     30.0000     13.6000
+   1584.3700   1522.5100     30.0000     13.6000
+   1584.9600   1522.5300     30.0000     13.6000
+   1585.5500   1522.5400     30.0000     13.6000
+   1586.1500   1522.5500     30.0000     13.6000
+   1586.7400   1522.5600     30.0000     13.6000
+   1587.3300   1522.5800     30.0000     13.6000
+   1587.9200   1522.5900     30.0000     13.6100
+   1588.5100   1522.5900     30.0000     13.6000
+   1589.1100   1522.6000     30.0000     13.6000
+   1589.7000   1522.6000     30.0000     13.6000
+   1590.2900   1522.6200     30.0000     13.6000
+   1590.8800   1522.6300     30.0000     13.6000
+   1591.4700   1522.6400     30.0000     13.6000
+   1592.0700   1522.6300     30.0000     13.6000
+   1592.6600   1522.6400     30.0000     13.6000
+   1593.2500   1522.6500     30.0000     13.6000
+   1593.8400   1522.6700     30.0000     13.6000
+   1594.4300   1522.6800     30.0000     13.6000
+   1595.0300   1522.6900     30.0000     13.6000
+   1595.6200   1522.7000     30.0000     13.6000
+   1596.2100   1522.7100     30.0000     13.6000
+   1596.8000   1522.7200     30.0000     13.6000
+   1597.3900   1522.7300     30.0000     13.6000
+   1597.9800   1522.7500     30.0000     13.6000
+   1598.5700   1522.7800     30.0000     13.6100
+   1599.1700   1522.7800     30.0000     13.6100
+   1599.7600   1522.7800     30.0000     13.6000
+   1600.3500   1522.8000     30.0000     13.6100
+   1600.9400   1522.8000     30.0000     13.6100
+   1601.5300   1522.8100     30.0000     13.6000
+   1602.1200   1522.8300     30.0000     13.6100
+   1602.7100   1522.8400     30.0000     13.6100
+   1603.3100   1522.8400     30.0000     13.6000
+   1603.9000   1522.8500     30.0000     13.6000
+   1604.4900   1522.8600     30.0000     13.6000
+   1605.0800   1522.8800     30.0000     13.6100
+   1605.6700   1522.8900     30.0000     13.6100
+   1606.2600   1522.9000     30.0000     13.6100
+   1606.8500   1522.9100     30.0000     13.6100
+   1607.4400   1522.9200     30.0000     13.6100
+   1608.0300   1522.9200     30.0000     13.6100
+   1608.6200   1522.9300     30.0000     13.6000
+   1609.2200   1522.9400     30.0000     13.6000
+   1609.8100   1522.9600     30.0000     13.6100
+   1610.4000   1522.9600     30.0000     13.6100
+   1610.9900   1522.9800     30.0000     13.6100
+   1611.5800   1522.9900     30.0000     13.6100
+   1612.1700   1523.0000     30.0000     13.6100
+   1612.7600   1523.0000     30.0000     13.6100
+   1613.3500   1523.0100     30.0000     13.6000
+   1613.9400   1523.0100     30.0000     13.6000
+   1614.5300   1523.0300     30.0000     13.6100
+   1615.1200   1523.0400     30.0000     13.6100
+   1615.7100   1523.0500     30.0000     13.6000
+   1616.3000   1523.0600     30.0000     13.6000
+   1616.8900   1523.0600     30.0000     13.6000
+   1617.4800   1523.0600     30.0000     13.6000
+   1618.0700   1523.0700     30.0000     13.6000
+   1618.6600   1523.0900     30.0000     13.6000
+   1619.2500   1523.0900     30.0000     13.6000
+   1619.8400   1523.1000     30.0000     13.6000
+   1620.4300   1523.1000     30.0000     13.6000
+   1621.0200   1523.1200     30.0000     13.6000
+   1621.6100   1523.1400     30.0000     13.6000
+   1622.2000   1523.1400     30.0000     13.6000
+   1622.7900   1523.1500     30.0000     13.6000
+   1623.3800   1523.1700     30.0000     13.6000
+   1623.9700   1523.1800     30.0000     13.6000
+   1624.5600   1523.1900     30.0000     13.6000
+   1625.1500   1523.2000     30.0000     13.6000
+   1625.7400   1523.2100     30.0000     13.6000
+   1626.3300   1523.2200     30.0000     13.6000
+   1626.9200   1523.2300     30.0000     13.6000
+   1627.5100   1523.2400     30.0000     13.6000
+   1628.1000   1523.2500     30.0000     13.6000
+   1628.6900   1523.2600     30.0000     13.6000
+   1629.2800   1523.2700     30.0000     13.6000
+   1629.8700   1523.2800     30.0000     13.6000
+   1630.4600   1523.2900     30.0000     13.6000
+   1631.0500   1523.3000     30.0000     13.6000
+   1631.6400   1523.3100     30.0000     13.6000
+   1632.2300   1523.3100     30.0000     13.6000
+   1632.8200   1523.3200     30.0000     13.6000
+   1633.4100   1523.3300     30.0000     13.6000
+   1634.0000   1523.3400     30.0000     13.6000
+   1634.5900   1523.3500     30.0000     13.6000
+   1635.1800   1523.3600     30.0000     13.6000
+   1635.7700   1523.3700     30.0000     13.6000
+   1636.3500   1523.3800     30.0000     13.6000
+   1636.9400   1523.3900     30.0000     13.6000
+   1637.5300   1523.4000     30.0000     13.6000
+   1638.1200   1523.4100     30.0000     13.6000
+   1638.7100   1523.4200     30.0000     13.6000
+   1639.3000   1523.4300     30.0000     13.6000
+   1639.8900   1523.4400     30.0000     13.6000
+   1640.4800   1523.4400     30.0000     13.6000
+   1641.0700   1523.4600     30.0000     13.6000
+   1641.6600   1523.4700     30.0000     13.6000
+   1642.2400   1523.4900     30.0000     13.6000
+   1642.8300   1523.5100     30.0000     13.6100
+   1643.4200   1523.5100     30.0000     13.6000
+   1644.0100   1523.5200     30.0000     13.6100
+   1644.6000   1523.5300     30.0000     13.6100
+   1645.1900   1523.5400     30.0000     13.6000
+   1645.7800   1523.5500     30.0000     13.6000
+   1646.3600   1523.5500     30.0000     13.6000
+   1646.9500   1523.5600     30.0000     13.6000
+   1647.5400   1523.5700     30.0000     13.6000
+   1648.1300   1523.5800     30.0000     13.6000
+   1648.7200   1523.5900     30.0000     13.6000
+   1649.3100   1523.6000     30.0000     13.6000
+   1649.9000   1523.6200     30.0000     13.6100
+   1650.4800   1523.6300     30.0000     13.6100
+   1651.0700   1523.6300     30.0000     13.6000
+   1651.6600   1523.6500     30.0000     13.6000
+   1652.2500   1523.6600     30.0000     13.6000
+   1652.8400   1523.6600     30.0000     13.6000
+   1653.4200   1523.6800     30.0000     13.6000
+   1654.0100   1523.6900     30.0000     13.6100
+   1654.6000   1523.7000     30.0000     13.6100
+   1655.1900   1523.7100     30.0000     13.6100
+   1655.7800   1523.7200     30.0000     13.6100
+   1656.3600   1523.7300     30.0000     13.6100
+   1656.9500   1523.7400     30.0000     13.6100
+   1657.5400   1523.7500     30.0000     13.6100
+   1658.1300   1523.7500     30.0000     13.6000
+   1658.7200   1523.7600     30.0000     13.6000
+   1659.3000   1523.7800     30.0000     13.6100
+   1659.8900   1523.7900     30.0000     13.6100
+   1660.4800   1523.7900     30.0000     13.6100
+   1661.0700   1523.8100     30.0000     13.6100
+   1661.6500   1523.8200     30.0000     13.6100
+   1662.2400   1523.8300     30.0000     13.6100
+   1662.8300   1523.8400     30.0000     13.6100
+   1663.4200   1523.8400     30.0000     13.6000
+   1664.0000   1523.8400     30.0000     13.6000
+   1664.5900   1523.8400     30.0000     13.6000
+   1665.1800   1523.8600     30.0000     13.6000
+   1665.7700   1523.8800     30.0000     13.6000
+   1666.3500   1523.8900     30.0000     13.6000
+   1666.9400   1523.8900     30.0000     13.6000
+   1667.5300   1523.9000     30.0000     13.6000
+   1668.1200   1523.9200     30.0000     13.6000
+   1668.7000   1523.9200     30.0000     13.6000
+   1669.2900   1523.9300     30.0000     13.6000
+   1669.8800   1523.9400     30.0000     13.6000
+   1670.4600   1523.9500     30.0000     13.6000
+   1671.0500   1523.9600     30.0000     13.6000
+   1671.6400   1523.9600     30.0000     13.6000
+   1672.2200   1523.9800     30.0000     13.6000
+   1672.8100   1523.9900     30.0000     13.6000
+   1673.4000   1523.9900     30.0000     13.6000
+   1673.9900   1524.0000     30.0000     13.6000
+   1674.5700   1524.0100     30.0000     13.6000
+   1675.1600   1524.0300     30.0000     13.6000
+   1675.7500   1524.0400     30.0000     13.6000
+   1676.3300   1524.0600     30.0000     13.6000
+   1676.9200   1524.0700     30.0000     13.6100
+   1677.5100   1524.0700     30.0000     13.6000
+   1678.0900   1524.0800     30.0000     13.6000
+   1678.6800   1524.0900     30.0000     13.6000
+   1679.2600   1524.1100     30.0000     13.6000
+   1679.8500   1524.1100     30.0000     13.6000
+   1680.4400   1524.1200     30.0000     13.6000
+   1681.0200   1524.1300     30.0000     13.6000
+   1681.6100   1524.1500     30.0000     13.6100
+   1682.2000   1524.1600     30.0000     13.6100
+   1682.7800   1524.1700     30.0000     13.6100
+   1683.3700   1524.1800     30.0000     13.6100
+   1683.9600   1524.1800     30.0000     13.6000
+   1684.5400   1524.1900     30.0000     13.6000
+   1685.1300   1524.2100     30.0000     13.6100
+   1685.7100   1524.2200     30.0000     13.6100
+   1686.3000   1524.2300     30.0000     13.6100
+   1686.8900   1524.2300     30.0000     13.6000
+   1687.4700   1524.2400     30.0000     13.6000
+   1688.0600   1524.2500     30.0000     13.6000
+   1688.6400   1524.2600     30.0000     13.6000
+   1689.2300   1524.2800     30.0000     13.6100
+   1689.8200   1524.2800     30.0000     13.6100
+   1690.4000   1524.2800     30.0000     13.6000
+   1690.9900   1524.2900     30.0000     13.6000
+   1691.5700   1524.3000     30.0000     13.6000
+   1692.1600   1524.3200     30.0000     13.6000
+   1692.7400   1524.3200     30.0000     13.6000
+   1693.3300   1524.3200     30.0000     13.6000
+   1693.9200   1524.3200     30.0000     13.6000
+   1694.5000   1524.3400     30.0000     13.6000
+   1695.0900   1524.3500     30.0000     13.6000
+   1695.6700   1524.3500     30.0000     13.6000
+   1696.2600   1524.3600     30.0000     13.6000
+   1696.8400   1524.3800     30.0000     13.6000
+   1697.4300   1524.4000     30.0000     13.6000
+   1698.0100   1524.4100     30.0000     13.6000
+   1698.6000   1524.4100     30.0000     13.6000
+   1699.1800   1524.4200     30.0000     13.6000
+   1699.7700   1524.4400     30.0000     13.6000
+   1700.3500   1524.4500     30.0000     13.6000
+   1700.9400   1524.4500     30.0000     13.6000
+   1701.5300   1524.4600     30.0000     13.6000
+   1702.1100   1524.4800     30.0000     13.6000
+   1702.7000   1524.5000     30.0000     13.6100
+   1703.2800   1524.5000     30.0000     13.6000
+   1703.8700   1524.5100     30.0000     13.6000
+   1704.4500   1524.5200     30.0000     13.6000
+   1705.0400   1524.5400     30.0000     13.6100
+   1705.6200   1524.5500     30.0000     13.6100
+   1706.2000   1524.5500     30.0000     13.6000
+   1706.7900   1524.5600     30.0000     13.6000
+   1707.3700   1524.5600     30.0000     13.6000
+   1707.9600   1524.5700     30.0000     13.6000
+   1708.5400   1524.5900     30.0000     13.6000
+   1709.1300   1524.6000     30.0000     13.6000
+   1709.7100   1524.6100     30.0000     13.6000
+   1710.3000   1524.6100     30.0000     13.6000
+   1710.8800   1524.6200     30.0000     13.6000
+   1711.4700   1524.6300     30.0000     13.6000
+   1712.0500   1524.6300     30.0000     13.6000
+   1712.6400   1524.6400     30.0000     13.6000
+   1713.2200   1524.6600     30.0000     13.6000
+   1713.8000   1524.6700     30.0000     13.6000
+   1714.3900   1524.6800     30.0000     13.6000
+   1714.9700   1524.6800     30.0000     13.6000
+   1715.5600   1524.6900     30.0000     13.6000
+   1716.1400   1524.7000     30.0000     13.6000
+   1716.7300   1524.7100     30.0000     13.6000
+   1717.3100   1524.7200     30.0000     13.6000
+   1717.8900   1524.7300     30.0000     13.6000
+   1718.4800   1524.7400     30.0000     13.6000
+   1719.0600   1524.7600     30.0000     13.6000
+   1719.6500   1524.7700     30.0000     13.6000
+   1720.2300   1524.7800     30.0000     13.6000
+   1720.8100   1524.7900     30.0000     13.6000
+   1721.4000   1524.8000     30.0000     13.6000
+   1721.9800   1524.8100     30.0000     13.6000
+   1722.5700   1524.8100     30.0000     13.6000
+   1723.1500   1524.8300     30.0000     13.6000
+   1723.7300   1524.8400     30.0000     13.6000
+   1724.3200   1524.8600     30.0000     13.6100
+   1724.9000   1524.8600     30.0000     13.6000
+   1725.4800   1524.8800     30.0000     13.6100
+   1726.0700   1524.9000     30.0000     13.6100
+   1726.6500   1524.9000     30.0000     13.6100
+   1727.2300   1524.9000     30.0000     13.6000
+   1727.8200   1524.9100     30.0000     13.6000
+   1728.4000   1524.9200     30.0000     13.6000
+   1728.9800   1524.9300     30.0000     13.6000
+   1729.5700   1524.9500     30.0000     13.6100
+   1730.1500   1524.9500     30.0000     13.6000
+   1730.7300   1524.9600     30.0000     13.6000
+   1731.3200   1524.9600     30.0000     13.6000
+   1731.9000   1524.9800     30.0000     13.6000
+   1732.4800   1524.9900     30.0000     13.6000
+   1733.0700   1524.9900     30.0000     13.6000
+   1733.6500   1525.0000     30.0000     13.6000
+   1734.2300   1525.0100     30.0000     13.6000
+   1734.8200   1525.0300     30.0000     13.6000
+   1735.4000   1525.0400     30.0000     13.6100
+   1735.9800   1525.0500     30.0000     13.6100
+   1736.5700   1525.0500     30.0000     13.6000
+   1737.1500   1525.0600     30.0000     13.6000
+   1737.7300   1525.0800     30.0000     13.6000
+   1738.3100   1525.0800     30.0000     13.6000
+   1738.9000   1525.1000     30.0000     13.6100
+   1739.4800   1525.1100     30.0000     13.6100
+   1740.0600   1525.1200     30.0000     13.6100
+   1740.6500   1525.1300     30.0000     13.6100
+   1741.2300   1525.1300     30.0000     13.6000
+   1741.8100   1525.1500     30.0000     13.6100
+   1742.3900   1525.1600     30.0000     13.6100
+   1742.9800   1525.1700     30.0000     13.6100
+   1743.5600   1525.1700     30.0000     13.6000
+   1744.1400   1525.1800     30.0000     13.6000
+   1744.7200   1525.1900     30.0000     13.6000
+   1745.3100   1525.2100     30.0000     13.6100
+   1745.8900   1525.2300     30.0000     13.6100
+   1746.4700   1525.2300     30.0000     13.6100
+   1747.0500   1525.2500     30.0000     13.6100
+   1747.6300   1525.2500     30.0000     13.6100
+   1748.2200   1525.2600     30.0000     13.6100
+   1748.8000   1525.2700     30.0000     13.6100
+   1749.3800   1525.2800     30.0000     13.6100
+   1749.9600   1525.2900     30.0000     13.6100
+   1750.5500   1525.2900     30.0000     13.6000
+   1751.1300   1525.3100     30.0000     13.6100
+   1751.7100   1525.3200     30.0000     13.6100
+   1752.2900   1525.3300     30.0000     13.6100
+   1752.8700   1525.3400     30.0000     13.6100
+   1753.4500   1525.3400     30.0000     13.6100
+   1754.0400   1525.3500     30.0000     13.6100
+   1754.6200   1525.3600     30.0000     13.6100
+   1755.2000   1525.3800     30.0000     13.6100
+   1755.7800   1525.3900     30.0000     13.6100
+   1756.3600   1525.3900     30.0000     13.6100
+   1756.9500   1525.4100     30.0000     13.6100
+   1757.5300   1525.4200     30.0000     13.6100
+   1758.1100   1525.4300     30.0000     13.6100
+   1758.6900   1525.4300     30.0000     13.6100
+   1759.2700   1525.4400     30.0000     13.6100
+   1759.8500   1525.4500     30.0000     13.6100
+   1760.4300   1525.4600     30.0000     13.6100
+   1761.0200   1525.4700     30.0000     13.6100
+   1761.6000   1525.4700     30.0000     13.6000
+   1762.1800   1525.5000     30.0000     13.6100
+   1762.7600   1525.5000     30.0000     13.6100
+   1763.3400   1525.5000     30.0000     13.6000
+   1763.9200   1525.5200     30.0000     13.6100
+   1764.5000   1525.5300     30.0000     13.6100
+   1765.0800   1525.5400     30.0000     13.6100
+   1765.6700   1525.5500     30.0000     13.6100
+   1766.2500   1525.5600     30.0000     13.6100
+   1766.8300   1525.5700     30.0000     13.6100
+   1767.4100   1525.5800     30.0000     13.6100
+   1767.9900   1525.5900     30.0000     13.6100
+   1768.5700   1525.5900     30.0000     13.6100
+   1769.1500   1525.6000     30.0000     13.6100
+   1769.7300   1525.6200     30.0000     13.6100
+   1770.3100   1525.6300     30.0000     13.6100
+   1770.8900   1525.6300     30.0000     13.6000
+   1771.4800   1525.6400     30.0000     13.6100
+   1772.0600   1525.6500     30.0000     13.6000
+   1772.6400   1525.6600     30.0000     13.6100
+   1773.2200   1525.6800     30.0000     13.6100
+   1773.8000   1525.6900     30.0000     13.6100
+   1774.3800   1525.7000     30.0000     13.6100
+   1774.9600   1525.7100     30.0000     13.6100
+   1775.5400   1525.7200     30.0000     13.6100
+   1776.1200   1525.7300     30.0000     13.6100
+   1776.7000   1525.7400     30.0000     13.6100
+   1777.2800   1525.7400     30.0000     13.6100
+   1777.8600   1525.7500     30.0000     13.6100
+   1778.4400   1525.7600     30.0000     13.6100
+   1779.0200   1525.7700     30.0000     13.6100
+   1779.6000   1525.7900     30.0000     13.6100
+   1780.1800   1525.8000     30.0000     13.6100
+   1780.7600   1525.8100     30.0000     13.6100
+   1781.3400   1525.8100     30.0000     13.6100
+   1781.9200   1525.8200     30.0000     13.6100
+   1782.5000   1525.8300     30.0000     13.6100
+   1783.0800   1525.8400     30.0000     13.6100
+   1783.6600   1525.8500     30.0000     13.6100
+   1784.2400   1525.8500     30.0000     13.6100
+   1784.8200   1525.8600     30.0000     13.6100
+   1785.4000   1525.8800     30.0000     13.6100
+   1785.9800   1525.8900     30.0000     13.6100
+   1786.5600   1525.8900     30.0000     13.6100
+   1787.1400   1525.9000     30.0000     13.6000
+   1787.7200   1525.9100     30.0000     13.6100
+   1788.3000   1525.9200     30.0000     13.6000
+   1788.8800   1525.9300     30.0000     13.6100
+   1789.4600   1525.9400     30.0000     13.6100
+   1790.0400   1525.9600     30.0000     13.6100
+   1790.6200   1525.9600     30.0000     13.6100
+   1791.2000   1525.9800     30.0000     13.6100
+   1791.7800   1525.9900     30.0000     13.6100
+   1792.3600   1525.9900     30.0000     13.6100
+   1792.9400   1526.0000     30.0000     13.6100
+   1793.5200   1526.0100     30.0000     13.6100
+   1794.1000   1526.0200     30.0000     13.6100
+   1794.6800   1526.0300     30.0000     13.6100
+   1795.2500   1526.0400     30.0000     13.6100
+   1795.8300   1526.0400     30.0000     13.6000
+   1796.4100   1526.0400     30.0000     13.6000
+   1796.9900   1526.0500     30.0000     13.6000
+   1797.5700   1526.0700     30.0000     13.6000
+   1798.1500   1526.0800     30.0000     13.6000
+   1798.7300   1526.0900     30.0000     13.6000
+   1799.3100   1526.1000     30.0000     13.6000
+   1799.8900   1526.1200     30.0000     13.6100
+   1800.4700   1526.1300     30.0000     13.6100
+   1801.0500   1526.1400     30.0000     13.6100
+   1801.6200   1526.1400     30.0000     13.6100
+   1802.2000   1526.1500     30.0000     13.6000
+   1802.7800   1526.1600     30.0000     13.6100
+   1803.3600   1526.1600     30.0000     13.6000
+   1803.9400   1526.1800     30.0000     13.6000
+   1804.5200   1526.1800     30.0000     13.6000
+   1805.1000   1526.2100     30.0000     13.6100
+   1805.6800   1526.2200     30.0000     13.6100
+   1806.2500   1526.2200     30.0000     13.6100
+   1806.8300   1526.2300     30.0000     13.6100
+   1807.4100   1526.2400     30.0000     13.6100
+   1807.9900   1526.2500     30.0000     13.6100
+   1808.5700   1526.2600     30.0000     13.6100
+   1809.1500   1526.2700     30.0000     13.6100
+   1809.7200   1526.2800     30.0000     13.6100
+   1810.3000   1526.2800     30.0000     13.6000
+   1810.8800   1526.2900     30.0000     13.6000
+   1811.4600   1526.3100     30.0000     13.6100
+   1812.0400   1526.3200     30.0000     13.6100
+   1812.6200   1526.3300     30.0000     13.6100
+   1813.1900   1526.3300     30.0000     13.6000
+   1813.7700   1526.3400     30.0000     13.6000
+   1814.3500   1526.3500     30.0000     13.6100
+   1814.9300   1526.3600     30.0000     13.6000
+   1815.5100   1526.3800     30.0000     13.6100
+   1816.0800   1526.3900     30.0000     13.6100
+   1816.6600   1526.4000     30.0000     13.6100
+   1817.2400   1526.4100     30.0000     13.6100
+   1817.8200   1526.4200     30.0000     13.6100
+   1818.4000   1526.4200     30.0000     13.6100
+   1818.9700   1526.4400     30.0000     13.6100
+   1819.5500   1526.4500     30.0000     13.6100
+   1820.1300   1526.4500     30.0000     13.6100
+   1820.7100   1526.4700     30.0000     13.6100
+   1821.2800   1526.4700     30.0000     13.6100
+   1821.8600   1526.4800     30.0000     13.6100
+   1822.4400   1526.4900     30.0000     13.6100
+   1823.0200   1526.5000     30.0000     13.6100
+   1823.5900   1526.5100     30.0000     13.6100
+   1824.1700   1526.5200     30.0000     13.6100
+   1824.7500   1526.5300     30.0000     13.6100
+   1825.3300   1526.5400     30.0000     13.6100
+   1825.9000   1526.5500     30.0000     13.6100
+   1826.4800   1526.5600     30.0000     13.6100
+   1827.0600   1526.5700     30.0000     13.6100
+   1827.6400   1526.5800     30.0000     13.6100
+   1828.2100   1526.5900     30.0000     13.6100
+   1828.7900   1526.6000     30.0000     13.6100
+   1829.3700   1526.6100     30.0000     13.6100
+   1829.9400   1526.6200     30.0000     13.6100
+   1830.5200   1526.6300     30.0000     13.6100
@@ -0,0 +1,1109 @@
+test_read_store_and_write
+1/1/2011
+19:24:33
+Probe: T-5
+Source: /root/package/data/input/sippican/T5_00014a.edf
+      0.0000   1531.7300     38.0000     22.6100
+      0.7000   1531.4600     38.0000     22.5000
+      1.4000   1531.4000     38.0000     22.4700
+      2.0000   1531.3000     38.0000     22.4300
+      2.7000   1531.2900     38.0000     22.4200
+      3.4000   1531.2300     38.0000     22.3900
+      4.1000   1531.2800     38.0000     22.4100
+      4.8000   1531.3200     38.0000     22.4200
+      5.5000   1531.3800     38.0000     22.4400
+      6.1000   1531.3200     38.0000     22.4100
+      6.8000   1530.8900     38.0000     22.2400
+      7.5000   1530.0000     38.0000     21.8900
+      8.2000   1528.9800     38.0000     21.5000
+      8.9000   1527.9900     38.0000     21.1200
+      9.6000   1527.1100     38.0000     20.7900
+     10.2000   1526.3000     38.0000     20.4800
+     10.9000   1525.5600     38.0000     20.2000
+     11.6000   1525.1300     38.0000     20.0400
+     12.3000   1524.7800     38.0000     19.9100
+     13.0000   1524.3300     38.0000     19.7400
+     13.6000   1523.9000     38.0000     19.5800
+     14.3000   1523.5500     38.0000     19.4500
+     15.0000   1522.9400     38.0000     19.2300
+     15.7000   1522.3900     38.0000     19.0300
+     16.4000   1521.8300     38.0000     18.8300
+     17.1000   1520.9800     38.0000     18.5200
+     17.7000   1520.1200     38.0000     18.2200
+     18.4000   1519.3900     38.0000     17.9600
+     19.1000   1518.7900     38.0000     17.7500
+     19.8000   1518.1000     38.0000     17.5100
+     20.5000   1517.5900     38.0000     17.3300
+     21.1000   1517.1900     38.0000     17.2000
+     21.8000   1516.7800     38.0000     17.0500
+     22.5000   1516.4400     38.0000     16.9300
+     23.2000   1516.1200     38.0000     16.8200
+     23.9000   1515.5500     38.0000     16.6300
+     24.6000   1514.9300     38.0000     16.4200
+     25.2000   1514.2000     38.0000     16.1700
+     25.9000   1513.6300     38.0000     15.9800
+     26.6000   1513.2500     38.0000     15.8600
+     27.3000   1512.8700     38.0000     15.7300
+     28.0000   1512.4700     38.0000     15.5900
+     28.6000   1512.0000     38.0000     15.4400
+     29.3000   1511.6800     38.0000     15.3300
+     30.0000   1511.3700     38.0000     15.2300
+     30.7000   1511.0500     38.0000     15.1200
+     31.4000   1510.9600     38.0000     15.0900
+     32.1000   1510.7700     38.0000     15.0200
+     32.7000   1510.6000     38.0000     14.9700
+     33.4000   1510.4100     38.0000     14.9000
+     34.1000   1510.2800     38.0000     14.8600
+     34.8000   1510.3100     38.0000     14.8600
+     35.5000   1510.3100     38.0000     14.8600
+     36.1000   1510.1600     38.0000     14.8100
+     36.8000   1510.0900     38.0000     14.7800
+     37.5000   1510.0800     38.0000     14.7700
+     38.2000   1510.0100     38.0000     14.7500
+     38.9000   1509.9700     38.0000     14.7300
+     39.5000   1509.8300     38.0000     14.6800
+     40.2000   1509.6500     38.0000     14.6300
+     40.9000   1509.5100     38.0000     14.5800
+     41.6000   1509.4100     38.0000     14.5400
+     42.3000   1509.3800     38.0000     14.5300
+     42.9000   1509.2700     38.0000     14.4900
+     43.6000   1509.2100     38.0000     14.4700
+     44.3000   1509.1200     38.0000     14.4400
+     45.0000   1509.0500     38.0000     14.4100
+     45.7000   1508.9500     38.0000     14.3800
+     46.3000   1508.7800     38.0000     14.3200
+     47.0000   1508.6600     38.0000     14.2800
+     47.7000   1508.5800     38.0000     14.2500
+     48.4000   1508.4000     38.0000     14.1900
+     49.1000   1508.2800     38.0000     14.1500
+     49.7000   1508.2500     38.0000     14.1300
+     50.4000   1508.1400     38.0000     14.1000
+     51.1000   1508.0900     38.0000     14.0800
+     51.8000   1508.0400     38.0000     14.0600
+     52.5000   1507.9800     38.0000     14.0400
+     53.1000   1507.9300     38.0000     14.0200
+     53.8000   1507.9000     38.0000     14.0100
+     54.5000   1507.8200     38.0000     13.9700
+     55.2000   1507.7500     38.0000     13.9500
+     55.9000   1507.7300     38.0000     13.9400
+     56.5000   1507.7200     38.0000     13.9300
+     57.2000   1507.7300     38.0000     13.9400
+     57.9000   1507.7300     38.0000     13.9300
+     58.6000   1507.6800     38.0000     13.9100
+     59.3000   1507.6800     38.0000     13.9100
+     59.9000   1507.6300     38.0000     13.8900
+     60.6000   1507.5200     38.0000     13.8500
+     61.3000   1507.5200     38.0000     13.8500
+     62.0000   1507.5200     38.0000     13.8500
+     62.7000   1507.4600     38.0000     13.8200
+     63.3000   1507.3600     38.0000     13.7900
+     64.0000   1507.2800     38.0000     13.7600
+     64.7000   1507.3000     38.0000     13.7600
+     65.4000   1507.2600     38.0000     13.7400
+     66.1000   1507.2100     38.0000     13.7300
+     66.7000   1507.2400     38.0000     13.7300
+     67.4000   1507.2900     38.0000     13.7500
+     68.1000   1507.4100     38.0000     13.7800
+     68.8000   1507.3900     38.0000     13.7700
+     69.5000   1507.3600     38.0000     13.7600
+     70.1000   1507.3700     38.0000     13.7600
+     70.8000   1507.4100     38.0000     13.7700
+     71.5000   1507.4500     38.0000     13.7700
+     72.2000   1507.5300     38.0000     13.7900
+     72.9000   1507.4600     38.0000     13.7700
+     73.5000   1507.4300     38.0000     13.7600
+     74.2000   1507.4500     38.0000     13.7600
+     74.9000   1507.4500     38.0000     13.7600
+     75.6000   1507.4100     38.0000     13.7400
+     76.2000   1507.3800     38.0000     13.7300
+     76.9000   1507.3300     38.0000     13.7100
+     77.6000   1507.3200     38.0000     13.7000
+     78.3000   1507.3200     38.0000     13.7000
+     79.0000   1507.3200     38.0000     13.6900
+     79.6000   1507.3000     38.0000     13.6900
+     80.3000   1507.3200     38.0000     13.6900
+     81.0000   1507.3000     38.0000     13.6800
+     81.7000   1507.3000     38.0000     13.6800
+     82.4000   1507.3000     38.0000     13.6700
+     83.0000   1507.2300     38.0000     13.6500
+     83.7000   1507.1100     38.0000     13.6100
+     84.4000   1507.0800     38.0000     13.5900
+     85.1000   1507.0100     38.0000     13.5700
+     85.7000   1506.9700     38.0000     13.5500
+     86.4000   1507.0000     38.0000     13.5600
+     87.1000   1506.9800     38.0000     13.5500
+     87.8000   1507.0000     38.0000     13.5500
+     88.5000   1507.0300     38.0000     13.5600
+     89.1000   1507.0400     38.0000     13.5600
+     89.8000   1507.0200     38.0000     13.5500
+     90.5000   1507.0300     38.0000     13.5500
+     91.2000   1506.9700     38.0000     13.5300
+     91.8000   1507.0400     38.0000     13.5400
+     92.5000   1507.1300     38.0000     13.5700
+     93.2000   1507.0600     38.0000     13.5400
+     93.9000   1507.0500     38.0000     13.5400
+     94.6000   1507.1200     38.0000     13.5600
+     95.2000   1507.1400     38.0000     13.5600
+     95.9000   1507.1400     38.0000     13.5500
+     96.6000   1507.1000     38.0000     13.5400
+     97.3000   1507.1300     38.0000     13.5400
+     97.9000   1507.1400     38.0000     13.5400
+     98.6000   1507.1500     38.0000     13.5400
+     99.3000   1507.1400     38.0000     13.5400
+    100.0000   1507.1200     38.0000     13.5300
+    100.7000   1507.1900     38.0000     13.5500
+    101.3000   1507.1800     38.0000     13.5400
+    102.0000   1507.1200     38.0000     13.5200
+    102.7000   1507.1600     38.0000     13.5200
+    103.4000   1507.1300     38.0000     13.5100
+    104.0000   1507.1200     38.0000     13.5100
+    104.7000   1507.1100     38.0000     13.5000
+    105.4000   1507.0900     38.0000     13.4900
+    106.1000   1507.1400     38.0000     13.5000
+    106.8000   1507.1600     38.0000     13.5000
+    107.4000   1507.2100     38.0000     13.5200
+    108.1000   1507.2000     38.0000     13.5100
+    108.8000   1507.1900     38.0000     13.5000
+    109.5000   1507.2300     38.0000     13.5100
+    110.1000   1507.2400     38.0000     13.5100
+    110.8000   1507.3300     38.0000     13.5400
+    111.5000   1507.3800     38.0000     13.5500
+    112.2000   1507.3500     38.0000     13.5300
+    112.8000   1507.3400     38.0000     13.5300
+    113.5000   1507.3600     38.0000     13.5300
+    114.2000   1507.3500     38.0000     13.5200
+    114.9000   1507.3700     38.0000     13.5300
+    115.6000   1507.4100     38.0000     13.5400
+    116.2000   1507.4000     38.0000     13.5300
+    116.9000   1507.4000     38.0000     13.5300
+    117.6000   1507.4200     38.0000     13.5300
+    118.3000   1507.4200     38.0000     13.5300
+    118.9000   1507.3600     38.0000     13.5000
+    119.6000   1507.3800     38.0000     13.5000
+    120.3000   1507.4100     38.0000     13.5100
+    121.0000   1507.3900     38.0000     13.5000
+    121.6000   1507.3000     38.0000     13.4700
+    122.3000   1507.3200     38.0000     13.4700
+    123.0000   1507.3200     38.0000     13.4700
+    123.7000   1507.3400     38.0000     13.4700
+    124.3000   1507.3900     38.0000     13.4800
+    125.0000   1507.3700     38.0000     13.4800
+    125.7000   1507.3400     38.0000     13.4600
+    126.4000   1507.3900     38.0000     13.4700
+    127.0000   1507.3900     38.0000     13.4700
+    127.7000   1507.4200     38.0000     13.4800
+    128.4000   1507.4400     38.0000     13.4800
+    129.1000   1507.4500     38.0000     13.4800
+    129.8000   1507.4400     38.0000     13.4700
+    130.4000   1507.4200     38.0000     13.4600
+    131.1000   1507.4400     38.0000     13.4700
+    131.8000   1507.4400     38.0000     13.4600
+    132.5000   1507.4200     38.0000     13.4500
+    133.1000   1507.4300     38.0000     13.4500
+    133.8000   1507.4800     38.0000     13.4600
+    134.5000   1507.5300     38.0000     13.4800
+    135.2000   1507.5500     38.0000     13.4800
+    135.8000   1507.5400     38.0000     13.4700
+    136.5000   1507.5500     38.0000     13.4700
+    137.2000   1507.5700     38.0000     13.4800
+    137.9000   1507.5300     38.0000     13.4600
+    138.5000   1507.5500     38.0000     13.4600
+    139.2000   1507.6100     38.0000     13.4800
+    139.9000   1507.5700     38.0000     13.4600
+    140.6000   1507.5600     38.0000     13.4600
+    141.2000   1507.6300     38.0000     13.4700
+    141.9000   1507.6200     38.0000     13.4700
+    142.6000   1507.6200     38.0000     13.4600
+    143.3000   1507.6700     38.0000     13.4700
+    143.9000   1507.6200     38.0000     13.4600
+    144.6000   1507.5900     38.0000     13.4500
+    145.3000   1507.6100     38.0000     13.4500
+    146.0000   1507.6400     38.0000     13.4500
+    146.6000   1507.7400     38.0000     13.4800
+    147.3000   1507.7600     38.0000     13.4800
+    148.0000   1507.7200     38.0000     13.4700
+    148.7000   1507.7200     38.0000     13.4600
+    149.3000   1507.7200     38.0000     13.4600
+    150.0000   1507.7400     38.0000     13.4600
+    150.7000   1507.7800     38.0000     13.4700
+    151.4000   1507.7700     38.0000     13.4600
+    152.0000   1507.7600     38.0000     13.4600
+    152.7000   1507.7700     38.0000     13.4600
+    153.4000   1507.7500     38.0000     13.4500
+    154.1000   1507.8200     38.0000     13.4700
+    154.7000   1507.7800     38.0000     13.4500
+    155.4000   1507.8300     38.0000     13.4600
+    156.1000   1507.8700     38.0000     13.4700
+    156.8000   1507.8200     38.0000     13.4500
+    157.4000   1507.8800     38.0000     13.4700
+    158.1000   1507.8700     38.0000     13.4600
+    158.8000   1507.8400     38.0000     13.4500
+    159.5000   1507.8800     38.0000     13.4600
+    160.1000   1507.8800     38.0000     13.4500
+    160.8000   1507.8500     38.0000     13.4400
+    161.5000   1507.8200     38.0000     13.4300
+    162.1000   1507.8500     38.0000     13.4300
+    162.8000   1507.8500     38.0000     13.4300
+    163.5000   1507.8700     38.0000     13.4300
+    164.2000   1507.8900     38.0000     13.4400
+    164.8000   1507.9000     38.0000     13.4400
+    165.5000   1507.9500     38.0000     13.4500
+    166.2000   1507.9900     38.0000     13.4600
+    166.9000   1508.0800     38.0000     13.4800
+    167.5000   1508.1600     38.0000     13.5000
+    168.2000   1508.1500     38.0000     13.5000
+    168.9000   1508.1300     38.0000     13.4900
+    169.6000   1508.0600     38.0000     13.4600
+    170.2000   1508.0900     38.0000     13.4700
+    170.9000   1508.1100     38.0000     13.4700
+    171.6000   1508.1000     38.0000     13.4600
+    172.3000   1508.0500     38.0000     13.4400
+    172.9000   1508.0800     38.0000     13.4500
+    173.6000   1508.0200     38.0000     13.4300
+    174.3000   1508.0700     38.0000     13.4400
+    175.0000   1508.0500     38.0000     13.4300
+    175.6000   1508.0400     38.0000     13.4300
+    176.3000   1508.0000     38.0000     13.4100
+    177.0000   1508.0300     38.0000     13.4100
+    177.6000   1508.1500     38.0000     13.4500
+    178.3000   1508.1400     38.0000     13.4400
+    179.0000   1508.1500     38.0000     13.4400
+    179.7000   1508.1100     38.0000     13.4300
+    180.3000   1508.1100     38.0000     13.4200
+    181.0000   1508.1500     38.0000     13.4300
+    181.7000   1508.1700     38.0000     13.4300
+    182.4000   1508.2100     38.0000     13.4400
+    183.0000   1508.2300     38.0000     13.4500
+    183.7000   1508.2800     38.0000     13.4600
+    184.4000   1508.2900     38.0000     13.4600
+    185.0000   1508.2800     38.0000     13.4500
+    185.7000   1508.2500     38.0000     13.4400
+    186.4000   1508.3100     38.0000     13.4500
+    187.1000   1508.3500     38.0000     13.4600
+    187.7000   1508.3200     38.0000     13.4500
+    188.4000   1508.3400     38.0000     13.4500
+    189.1000   1508.4200     38.0000     13.4700
+    189.8000   1508.4500     38.0000     13.4800
+    190.4000   1508.4400     38.0000     13.4700
+    191.1000   1508.4200     38.0000     13.4600
+    191.8000   1508.4000     38.0000     13.4500
+    192.4000   1508.4200     38.0000     13.4600
+    193.1000   1508.4600     38.0000     13.4600
+    193.8000   1508.5000     38.0000     13.4700
+    194.5000   1508.5000     38.0000     13.4700
+    195.1000   1508.4900     38.0000     13.4600
+    195.8000   1508.5200     38.0000     13.4700
+    196.5000   1508.5100     38.0000     13.4600
+    197.2000   1508.5000     38.0000     13.4500
+    197.8000   1508.5400     38.0000     13.4600
+    198.5000   1508.5300     38.0000     13.4600
+    199.2000   1508.5400     38.0000     13.4600
+    199.8000   1508.5400     38.0000     13.4500
+    200.5000   1508.5300     38.0000     13.4500
+    201.2000   1508.5500     38.0000     13.4500
+    201.9000   1508.5700     38.0000     13.4500
+    202.5000   1508.6300     38.0000     13.4700
+    203.2000   1508.6600     38.0000     13.4700
+    203.9000   1508.6500     38.0000     13.4700
+    204.5000   1508.7100     38.0000     13.4800
+    205.2000   1508.6800     38.0000     13.4700
+    205.9000   1508.6500     38.0000     13.4600
+    206.6000   1508.6700     38.0000     13.4600
+    207.2000   1508.7300     38.0000     13.4800
+    207.9000   1508.7100     38.0000     13.4700
+    208.6000   1508.7400     38.0000     13.4700
+    209.2000   1508.7600     38.0000     13.4700
+    209.9000   1508.7500     38.0000     13.4700
+    210.6000   1508.7600     38.0000     13.4700
+    211.3000   1508.7800     38.0000     13.4700
+    211.9000   1508.8300     38.0000     13.4800
+    212.6000   1508.8000     38.0000     13.4700
+    213.3000   1508.8200     38.0000     13.4700
+    213.9000   1508.8400     38.0000     13.4800
+    214.6000   1508.8100     38.0000     13.4600
+    215.3000   1508.8800     38.0000     13.4800
+    216.0000   1508.9200     38.0000     13.4900
+    216.6000   1508.9600     38.0000     13.5000
+    217.3000   1508.9400     38.0000     13.4900
+    218.0000   1508.9100     38.0000     13.4800
+    218.6000   1508.9300     38.0000     13.4800
+    219.3000   1508.9700     38.0000     13.4900
+    220.0000   1508.9700     38.0000     13.4800
+    220.7000   1508.9100     38.0000     13.4600
+    221.3000   1508.9600     38.0000     13.4700
+    222.0000   1509.0000     38.0000     13.4800
+    222.7000   1509.0200     38.0000     13.4900
+    223.3000   1509.0400     38.0000     13.4900
+    224.0000   1509.0300     38.0000     13.4800
+    224.7000   1509.0400     38.0000     13.4800
+    225.4000   1509.0400     38.0000     13.4800
+    226.0000   1509.1100     38.0000     13.5000
+    226.7000   1509.1100     38.0000     13.4900
+    227.4000   1509.1000     38.0000     13.4900
+    228.0000   1509.0800     38.0000     13.4800
+    228.7000   1509.1400     38.0000     13.4900
+    229.4000   1509.1800     38.0000     13.5000
+    230.0000   1509.1900     38.0000     13.5000
+    230.7000   1509.1900     38.0000     13.5000
+    231.4000   1509.1900     38.0000     13.4900
+    232.1000   1509.1300     38.0000     13.4700
+    232.7000   1509.1400     38.0000     13.4700
+    233.4000   1509.2500     38.0000     13.5000
+    234.1000   1509.2500     38.0000     13.5000
+    234.7000   1509.2100     38.0000     13.4800
+    235.4000   1509.2400     38.0000     13.4900
+    236.1000   1509.3100     38.0000     13.5100
+    236.8000   1509.2700     38.0000     13.4900
+    237.4000   1509.2400     38.0000     13.4800
+    238.1000   1509.2600     38.0000     13.4800
+    238.8000   1509.3200     38.0000     13.5000
+    239.4000   1509.3200     38.0000     13.4900
+    240.1000   1509.3500     38.0000     13.5000
+    240.8000   1509.4100     38.0000     13.5100
+    241.4000   1509.3800     38.0000     13.5000
+    242.1000   1509.4000     38.0000     13.5000
+    242.8000   1509.4000     38.0000     13.5000
+    243.4000   1509.4300     38.0000     13.5100
+    244.1000   1509.4300     38.0000     13.5000
+    244.8000   1509.4100     38.0000     13.4900
+    245.5000   1509.4800     38.0000     13.5100
+    246.1000   1509.5400     38.0000     13.5300
+    246.8000   1509.4500     38.0000     13.4900
+    247.5000   1509.4900     38.0000     13.5000
+    248.1000   1509.5200     38.0000     13.5100
+    248.8000   1509.5200     38.0000     13.5100
+    249.5000   1509.5000     38.0000     13.5000
+    250.1000   1509.5100     38.0000     13.5000
+    250.8000   1509.5100     38.0000     13.4900
+    251.5000   1509.5400     38.0000     13.5000
+    252.2000   1509.5700     38.0000     13.5000
+    252.8000   1509.6200     38.0000     13.5200
+    253.5000   1509.6200     38.0000     13.5200
+    254.2000   1509.5900     38.0000     13.5000
+    254.8000   1509.6000     38.0000     13.5000
+    255.5000   1509.6500     38.0000     13.5100
+    256.2000   1509.6500     38.0000     13.5100
+    256.8000   1509.7100     38.0000     13.5300
+    257.5000   1509.7300     38.0000     13.5300
+    258.2000   1509.7200     38.0000     13.5200
+    258.8000   1509.6900     38.0000     13.5100
+    259.5000   1509.7100     38.0000     13.5100
+    260.2000   1509.7500     38.0000     13.5200
+    260.8000   1509.7500     38.0000     13.5200
+    261.5000   1509.7400     38.0000     13.5100
+    262.2000   1509.7800     38.0000     13.5200
+    262.9000   1509.7600     38.0000     13.5100
+    263.5000   1509.8000     38.0000     13.5200
+    264.2000   1509.8000     38.0000     13.5200
+    264.9000   1509.8300     38.0000     13.5200
+    265.5000   1509.8700     38.0000     13.5300
+    266.2000   1509.9100     38.0000     13.5400
+    266.9000   1509.9500     38.0000     13.5500
+    267.5000   1509.8900     38.0000     13.5200
+    268.2000   1509.8600     38.0000     13.5100
+    268.9000   1509.9000     38.0000     13.5200
+    269.5000   1509.9700     38.0000     13.5400
+    270.2000   1510.0300     38.0000     13.5600
+    270.9000   1510.0500     38.0000     13.5600
+    271.5000   1510.0600     38.0000     13.5600
+    272.2000   1510.0500     38.0000     13.5500
+    272.9000   1510.0100     38.0000     13.5300
+    273.5000   1510.0300     38.0000     13.5400
+    274.2000   1510.0500     38.0000     13.5400
+    274.9000   1510.0700     38.0000     13.5400
+    275.6000   1510.0900     38.0000     13.5500
+    276.2000   1510.1100     38.0000     13.5500
+    276.9000   1510.1200     38.0000     13.5500
+    277.6000   1510.1100     38.0000     13.5400
+    278.2000   1510.1300     38.0000     13.5500
+    278.9000   1510.1700     38.0000     13.5500
+    279.6000   1510.1800     38.0000     13.5500
+    280.2000   1510.1400     38.0000     13.5400
+    280.9000   1510.1500     38.0000     13.5400
+    281.6000   1510.1600     38.0000     13.5400
+    282.2000   1510.1400     38.0000     13.5300
+    282.9000   1510.2100     38.0000     13.5500
+    283.6000   1510.2300     38.0000     13.5500
+    284.2000   1510.2800     38.0000     13.5600
+    284.9000   1510.2700     38.0000     13.5500
+    285.6000   1510.2900     38.0000     13.5600
+    286.2000   1510.2700     38.0000     13.5500
+    286.9000   1510.3000     38.0000     13.5500
+    287.6000   1510.3100     38.0000     13.5500
+    288.2000   1510.2800     38.0000     13.5400
+    288.9000   1510.3500     38.0000     13.5600
+    289.6000   1510.3800     38.0000     13.5700
+    290.2000   1510.3000     38.0000     13.5400
+    290.9000   1510.3000     38.0000     13.5300
+    291.6000   1510.3100     38.0000     13.5300
+    292.2000   1510.3400     38.0000     13.5400
+    292.9000   1510.4100     38.0000     13.5600
+    293.6000   1510.4300     38.0000     13.5600
+    294.2000   1510.4200     38.0000     13.5500
+    294.9000   1510.4200     38.0000     13.5500
+    295.6000   1510.3600     38.0000     13.5300
+    296.2000   1510.3900     38.0000     13.5300
+    296.9000   1510.4100     38.0000     13.5400
+    297.6000   1510.3600     38.0000     13.5200
+    298.2000   1510.3400     38.0000     13.5100
+    298.9000   1510.3700     38.0000     13.5100
+    299.6000   1510.4000     38.0000     13.5200
+    300.2000   1510.4600     38.0000     13.5300
+    300.9000   1510.4200     38.0000     13.5200
+    301.6000   1510.4500     38.0000     13.5300
+    302.2000   1510.4600     38.0000     13.5300
+    302.9000   1510.4900     38.0000     13.5300
+    303.6000   1510.5300     38.0000     13.5400
+    304.2000   1510.5600     38.0000     13.5400
+    304.9000   1510.5200     38.0000     13.5300
+    305.6000   1510.5300     38.0000     13.5300
+    306.2000   1510.5100     38.0000     13.5200
+    306.9000   1510.5600     38.0000     13.5300
+    307.6000   1510.6500     38.0000     13.5600
+    308.2000   1510.6200     38.0000     13.5400
+    308.9000   1510.6300     38.0000     13.5400
+    309.6000   1510.6700     38.0000     13.5500
+    310.2000   1510.7100     38.0000     13.5600
+    310.9000   1510.6600     38.0000     13.5400
+    311.6000   1510.6700     38.0000     13.5400
+    312.2000   1510.7200     38.0000     13.5500
+    312.9000   1510.7700     38.0000     13.5700
+    313.6000   1510.7500     38.0000     13.5600
+    314.2000   1510.6900     38.0000     13.5300
+    314.9000   1510.7100     38.0000     13.5400
+    315.6000   1510.7900     38.0000     13.5600
+    316.2000   1510.8400     38.0000     13.5700
+    316.9000   1510.7800     38.0000     13.5500
+    317.6000   1510.8000     38.0000     13.5500
+    318.2000   1510.8600     38.0000     13.5600
+    318.9000   1510.9000     38.0000     13.5700
+    319.6000   1510.8400     38.0000     13.5500
+    320.2000   1510.8100     38.0000     13.5400
+    320.9000   1510.8800     38.0000     13.5600
+    321.6000   1510.9500     38.0000     13.5800
+    322.2000   1510.9800     38.0000     13.5800
+    322.9000   1510.9800     38.0000     13.5800
+    323.6000   1510.9500     38.0000     13.5700
+    324.2000   1510.9500     38.0000     13.5600
+    324.9000   1510.9200     38.0000     13.5500
+    325.5000   1510.9200     38.0000     13.5500
+    326.2000   1510.9900     38.0000     13.5700
+    326.9000   1511.0100     38.0000     13.5700
+    327.5000   1511.0500     38.0000     13.5800
+    328.2000   1511.0200     38.0000     13.5600
+    328.9000   1510.9700     38.0000     13.5500
+    329.5000   1510.9400     38.0000     13.5300
+    330.2000   1510.9300     38.0000     13.5300
+    330.9000   1510.9600     38.0000     13.5300
+    331.5000   1510.9500     38.0000     13.5200
+    332.2000   1510.9000     38.0000     13.5100
+    332.9000   1510.9200     38.0000     13.5100
+    333.5000   1510.9100     38.0000     13.5000
+    334.2000   1510.9000     38.0000     13.5000
+    334.9000   1510.9600     38.0000     13.5100
+    335.5000   1510.9900     38.0000     13.5200
+    336.2000   1510.9800     38.0000     13.5100
+    336.9000   1511.0200     38.0000     13.5200
+    337.5000   1511.0400     38.0000     13.5200
+    338.2000   1511.0800     38.0000     13.5300
+    338.8000   1511.1000     38.0000     13.5300
+    339.5000   1511.0800     38.0000     13.5300
+    340.2000   1511.1100     38.0000     13.5300
+    340.8000   1511.1500     38.0000     13.5400
+    341.5000   1511.1300     38.0000     13.5300
+    342.2000   1511.1600     38.0000     13.5400
+    342.8000   1511.2300     38.0000     13.5500
+    343.5000   1511.2100     38.0000     13.5500
+    344.2000   1511.2600     38.0000     13.5600
+    344.8000   1511.2300     38.0000     13.5400
+    345.5000   1511.1800     38.0000     13.5300
+    346.2000   1511.2100     38.0000     13.5300
+    346.8000   1511.3000     38.0000     13.5600
+    347.5000   1511.3100     38.0000     13.5600
+    348.1000   1511.3000     38.0000     13.5500
+    348.8000   1511.3300     38.0000     13.5600
+    349.5000   1511.3700     38.0000     13.5600
+    350.1000   1511.3900     38.0000     13.5700
+    350.8000   1511.4400     38.0000     13.5800
+    351.5000   1511.4200     38.0000     13.5700
+    352.1000   1511.4600     38.0000     13.5800
+    352.8000   1511.4600     38.0000     13.5700
+    353.5000   1511.4300     38.0000     13.5600
+    354.1000   1511.4600     38.0000     13.5700
+    354.8000   1511.4700     38.0000     13.5700
+    355.4000   1511.4900     38.0000     13.5700
+    356.1000   1511.5700     38.0000     13.5900
+    356.8000   1511.5000     38.0000     13.5700
+    357.4000   1511.5400     38.0000     13.5700
+    358.1000   1511.6200     38.0000     13.6000
+    358.8000   1511.6100     38.0000     13.5900
+    359.4000   1511.6700     38.0000     13.6100
+    360.1000   1511.6700     38.0000     13.6000
+    360.8000   1511.6500     38.0000     13.5900
+    361.4000   1511.6400     38.0000     13.5900
+    362.1000   1511.7500     38.0000     13.6200
+    362.7000   1511.7100     38.0000     13.6000
+    363.4000   1511.7600     38.0000     13.6100
+    364.1000   1511.7400     38.0000     13.6000
+    364.7000   1511.7000     38.0000     13.5900
+    365.4000   1511.7700     38.0000     13.6000
+    366.1000   1511.8100     38.0000     13.6100
+    366.7000   1511.7900     38.0000     13.6000
+    367.4000   1511.7800     38.0000     13.6000
+    368.0000   1511.8200     38.0000     13.6100
+    368.7000   1511.7800     38.0000     13.5900
+    369.4000   1511.7900     38.0000     13.5900
+    370.0000   1511.7500     38.0000     13.5800
+    370.7000   1511.7900     38.0000     13.5800
+    371.4000   1511.8400     38.0000     13.6000
+    372.0000   1511.8500     38.0000     13.5900
+    372.7000   1511.8800     38.0000     13.6000
+    373.3000   1511.8300     38.0000     13.5800
+    374.0000   1511.8300     38.0000     13.5800
+    374.7000   1511.8500     38.0000     13.5800
+    375.3000   1511.9000     38.0000     13.5900
+    376.0000   1511.8700     38.0000     13.5800
+    376.7000   1511.8400     38.0000     13.5700
+    377.3000   1511.8600     38.0000     13.5700
+    378.0000   1511.8200     38.0000     13.5600
+    378.6000   1511.7900     38.0000     13.5400
+    379.3000   1511.8000     38.0000     13.5400
+    380.0000   1511.8500     38.0000     13.5500
+    380.6000   1511.8400     38.0000     13.5500
+    381.3000   1511.8300     38.0000     13.5400
+    382.0000   1511.8800     38.0000     13.5500
+    382.6000   1511.8600     38.0000     13.5400
+    383.3000   1511.9200     38.0000     13.5600
+    383.9000   1511.9300     38.0000     13.5600
+    384.6000   1511.9700     38.0000     13.5700
+    385.3000   1511.9500     38.0000     13.5600
+    385.9000   1511.9200     38.0000     13.5500
+    386.6000   1511.9300     38.0000     13.5500
+    387.3000   1511.9800     38.0000     13.5600
+    387.9000   1511.9500     38.0000     13.5500
+    388.6000   1511.9400     38.0000     13.5400
+    389.2000   1511.9700     38.0000     13.5500
+    389.9000   1512.0100     38.0000     13.5500
+    390.6000   1512.0300     38.0000     13.5600
+    391.2000   1512.0200     38.0000     13.5500
+    391.9000   1512.0300     38.0000     13.5500
+    392.5000   1512.0200     38.0000     13.5400
+    393.2000   1512.0500     38.0000     13.5500
+    393.9000   1512.1400     38.0000     13.5800
+    394.5000   1512.1600     38.0000     13.5800
+    395.2000   1512.1300     38.0000     13.5700
+    395.9000   1512.1500     38.0000     13.5700
+    396.5000   1512.1700     38.0000     13.5700
+    397.2000   1512.2300     38.0000     13.5900
+    397.8000   1512.2000     38.0000     13.5700
+    398.5000   1512.2200     38.0000     13.5800
+    399.2000   1512.2700     38.0000     13.5900
+    399.8000   1512.3000     38.0000     13.5900
+    400.5000   1512.2900     38.0000     13.5900
+    401.1000   1512.2900     38.0000     13.5800
+    401.8000   1512.3300     38.0000     13.5900
+    402.5000   1512.3100     38.0000     13.5800
+    403.1000   1512.3800     38.0000     13.6000
+    403.8000   1512.3500     38.0000     13.5900
+    404.4000   1512.3300     38.0000     13.5800
+    405.1000   1512.4000     38.0000     13.6000
+    405.8000   1512.4200     38.0000     13.6000
+    406.4000   1512.4600     38.0000     13.6100
+    407.1000   1512.4200     38.0000     13.5900
+    407.8000   1512.3900     38.0000     13.5800
+    408.4000   1512.5000     38.0000     13.6100
+    409.1000   1512.5000     38.0000     13.6100
+    409.7000   1512.4600     38.0000     13.5900
+    410.4000   1512.5100     38.0000     13.6000
+    411.1000   1512.5200     38.0000     13.6000
+    411.7000   1512.5100     38.0000     13.6000
+    412.4000   1512.5400     38.0000     13.6000
+    413.0000   1512.5800     38.0000     13.6100
+    413.7000   1512.5800     38.0000     13.6100
+    414.4000   1512.6100     38.0000     13.6100
+    415.0000   1512.6600     38.0000     13.6300
+    415.7000   1512.6500     38.0000     13.6200
+    416.3000   1512.5900     38.0000     13.6000
+    417.0000   1512.6000     38.0000     13.6000
+    417.7000   1512.6300     38.0000     13.6000
+    418.3000   1512.6800     38.0000     13.6200
+    419.0000   1512.6900     38.0000     13.6200
+    419.6000   1512.7000     38.0000     13.6200
+    420.3000   1512.7500     38.0000     13.6300
+    421.0000   1512.7900     38.0000     13.6400
+    421.6000   1512.7800     38.0000     13.6300
+    422.3000   1512.7400     38.0000     13.6200
+    422.9000   1512.7600     38.0000     13.6200
+    423.6000   1512.8000     38.0000     13.6300
+    424.3000   1512.8400     38.0000     13.6400
+    424.9000   1512.8400     38.0000     13.6300
+    425.6000   1512.8400     38.0000     13.6300
+    426.2000   1512.8200     38.0000     13.6200
+    426.9000   1512.8500     38.0000     13.6200
+    427.6000   1512.8700     38.0000     13.6300
+    428.2000   1512.8700     38.0000     13.6200
+    428.9000   1512.8500     38.0000     13.6100
+    429.5000   1512.8800     38.0000     13.6200
+    430.2000   1512.9200     38.0000     13.6300
+    430.9000   1512.9500     38.0000     13.6300
+    431.5000   1512.9700     38.0000     13.6400
+    432.2000   1512.9500     38.0000     13.6300
+    432.8000   1512.9200     38.0000     13.6200
+    433.5000   1512.9000     38.0000     13.6000
+    434.2000   1513.0000     38.0000     13.6300
+    434.8000   1513.0300     38.0000     13.6400
+    435.5000   1512.9400     38.0000     13.6100
+    436.1000   1513.0100     38.0000     13.6300
+    436.8000   1512.9800     38.0000     13.6100
+    437.4000   1512.9500     38.0000     13.6000
+    438.1000   1513.0300     38.0000     13.6200
+    438.8000   1513.0100     38.0000     13.6100
+    439.4000   1513.0200     38.0000     13.6100
+    440.1000   1513.0000     38.0000     13.6000
+    440.7000   1513.0200     38.0000     13.6100
+    441.4000   1513.0100     38.0000     13.6000
+    442.1000   1513.0900     38.0000     13.6200
+    442.7000   1513.1200     38.0000     13.6300
+    443.4000   1513.0900     38.0000     13.6100
+    444.0000   1513.0400     38.0000     13.6000
+    444.7000   1513.0800     38.0000     13.6100
+    445.4000   1513.1200     38.0000     13.6100
+    446.0000   1513.1200     38.0000     13.6100
+    446.7000   1513.0500     38.0000     13.5900
+    447.3000   1513.1400     38.0000     13.6100
+    448.0000   1513.2000     38.0000     13.6200
+    448.6000   1513.1100     38.0000     13.5900
+    449.3000   1513.0800     38.0000     13.5800
+    450.0000   1513.1500     38.0000     13.6000
+    450.6000   1513.1500     38.0000     13.6000
+    451.3000   1513.1700     38.0000     13.6000
+    451.9000   1513.1800     38.0000     13.6000
+    452.6000   1513.2100     38.0000     13.6100
+    453.3000   1513.1500     38.0000     13.5800
+    453.9000   1513.1900     38.0000     13.5900
+    454.6000   1513.2500     38.0000     13.6100
+    455.2000   1513.2800     38.0000     13.6100
+    455.9000   1513.3200     38.0000     13.6200
+    456.5000   1513.2900     38.0000     13.6100
+    457.2000   1513.2700     38.0000     13.6000
+    457.9000   1513.2600     38.0000     13.5900
+    458.5000   1513.2900     38.0000     13.6000
+    459.2000   1513.3500     38.0000     13.6100
+    459.8000   1513.3300     38.0000     13.6000
+    460.5000   1513.3400     38.0000     13.6000
+    461.2000   1513.4000     38.0000     13.6200
+    461.8000   1513.3700     38.0000     13.6100
+    462.5000   1513.4000     38.0000     13.6100
+    463.1000   1513.4300     38.0000     13.6200
+    463.8000   1513.4100     38.0000     13.6100
+    464.4000   1513.4600     38.0000     13.6200
+    465.1000   1513.4800     38.0000     13.6200
+    465.8000   1513.4500     38.0000     13.6100
+    466.4000   1513.4100     38.0000     13.6000
+    467.1000   1513.3800     38.0000     13.5800
+    467.7000   1513.4300     38.0000     13.5900
+    468.4000   1513.4400     38.0000     13.6000
+    469.0000   1513.4600     38.0000     13.6000
+    469.7000   1513.5000     38.0000     13.6100
+    470.4000   1513.4900     38.0000     13.6000
+    471.0000   1513.4800     38.0000     13.5900
+    471.7000   1513.4400     38.0000     13.5800
+    472.3000   1513.5100     38.0000     13.6000
+    473.0000   1513.5800     38.0000     13.6100
+    473.6000   1513.5100     38.0000     13.5900
+    474.3000   1513.5500     38.0000     13.6000
+    475.0000   1513.5400     38.0000     13.5900
+    475.6000   1513.5200     38.0000     13.5800
+    476.3000   1513.5300     38.0000     13.5800
+    476.9000   1513.5500     38.0000     13.5900
+    477.6000   1513.5400     38.0000     13.5800
+    478.2000   1513.6000     38.0000     13.5900
+    478.9000   1513.5700     38.0000     13.5800
+    479.6000   1513.5900     38.0000     13.5800
+    480.2000   1513.5700     38.0000     13.5800
+    480.9000   1513.6300     38.0000     13.5900
+    481.5000   1513.6100     38.0000     13.5800
+    482.2000   1513.5900     38.0000     13.5700
+    482.8000   1513.6200     38.0000     13.5800
+    483.5000   1513.6200     38.0000     13.5700
+    484.2000   1513.6900     38.0000     13.5900
+    484.8000   1513.6700     38.0000     13.5800
+    485.5000   1513.7200     38.0000     13.6000
+    486.1000   1513.7000     38.0000     13.5800
+    486.8000   1513.7200     38.0000     13.5900
+    487.4000   1513.7600     38.0000     13.5900
+    488.1000   1513.7500     38.0000     13.5900
+    488.7000   1513.7400     38.0000     13.5800
+    489.4000   1513.6700     38.0000     13.5600
+    490.1000   1513.7400     38.0000     13.5800
+    490.7000   1513.7500     38.0000     13.5800
+    491.4000   1513.7300     38.0000     13.5700
+    492.0000   1513.7900     38.0000     13.5800
+    492.7000   1513.8100     38.0000     13.5800
+    493.3000   1513.8100     38.0000     13.5800
+    494.0000   1513.8300     38.0000     13.5800
+    494.6000   1513.8400     38.0000     13.5800
+    495.3000   1513.8500     38.0000     13.5800
+    496.0000   1513.8600     38.0000     13.5800
+    496.6000   1513.8800     38.0000     13.5900
+    497.3000   1513.8900     38.0000     13.5900
+    497.9000   1513.9100     38.0000     13.5900
+    498.6000   1513.9300     38.0000     13.5900
+    499.2000   1513.8900     38.0000     13.5800
+    499.9000   1513.9600     38.0000     13.5900
+    500.6000   1513.9200     38.0000     13.5800
+    501.2000   1513.8700     38.0000     13.5600
+    501.9000   1513.8800     38.0000     13.5600
+    502.5000   1513.9700     38.0000     13.5800
+    503.2000   1513.9700     38.0000     13.5800
+    503.8000   1513.9700     38.0000     13.5800
+    504.5000   1514.0100     38.0000     13.5900
+    505.1000   1514.0200     38.0000     13.5900
+    505.8000   1513.9800     38.0000     13.5700
+    506.5000   1513.9800     38.0000     13.5700
+    507.1000   1514.0300     38.0000     13.5800
+    507.8000   1514.0100     38.0000     13.5700
+    508.4000   1514.0800     38.0000     13.5900
+    509.1000   1514.0900     38.0000     13.5900
+    509.7000   1514.1100     38.0000     13.5900
+    510.4000   1514.1000     38.0000     13.5900
+    511.0000   1514.0700     38.0000     13.5700
+    511.7000   1514.0800     38.0000     13.5700
+    512.3000   1514.1200     38.0000     13.5800
+    513.0000   1514.1100     38.0000     13.5700
+    513.7000   1514.1700     38.0000     13.5900
+    514.3000   1514.2100     38.0000     13.6000
+    515.0000   1514.1400     38.0000     13.5700
+    515.6000   1514.1600     38.0000     13.5800
+    516.3000   1514.2200     38.0000     13.5900
+    516.9000   1514.2100     38.0000     13.5800
+    517.6000   1514.2400     38.0000     13.5900
+    518.2000   1514.2700     38.0000     13.5900
+    518.9000   1514.2900     38.0000     13.6000
+    519.5000   1514.2500     38.0000     13.5800
+    520.2000   1514.3100     38.0000     13.6000
+    520.9000   1514.3000     38.0000     13.5900
+    521.5000   1514.3400     38.0000     13.6000
+    522.2000   1514.3700     38.0000     13.6100
+    522.8000   1514.4200     38.0000     13.6200
+    523.5000   1514.3600     38.0000     13.6000
+    524.1000   1514.3800     38.0000     13.6000
+    524.8000   1514.4500     38.0000     13.6200
+    525.4000   1514.3700     38.0000     13.5900
+    526.1000   1514.4200     38.0000     13.6000
+    526.7000   1514.4500     38.0000     13.6100
+    527.4000   1514.4400     38.0000     13.6000
+    528.1000   1514.4500     38.0000     13.6000
+    528.7000   1514.4200     38.0000     13.5900
+    529.4000   1514.4300     38.0000     13.5900
+    530.0000   1514.4500     38.0000     13.5900
+    530.7000   1514.4200     38.0000     13.5800
+    531.3000   1514.4600     38.0000     13.5900
+    532.0000   1514.5200     38.0000     13.6000
+    532.6000   1514.5200     38.0000     13.6000
+    533.3000   1514.5300     38.0000     13.6000
+    533.9000   1514.5400     38.0000     13.6000
+    534.6000   1514.4400     38.0000     13.5700
+    535.2000   1514.4600     38.0000     13.5700
+    535.9000   1514.4900     38.0000     13.5700
+    536.6000   1514.5300     38.0000     13.5800
+    537.2000   1514.5900     38.0000     13.6000
+    537.9000   1514.6100     38.0000     13.6000
+    538.5000   1514.5800     38.0000     13.5900
+    539.2000   1514.5300     38.0000     13.5700
+    539.8000   1514.5200     38.0000     13.5600
+    540.5000   1514.5100     38.0000     13.5600
+    541.1000   1514.5100     38.0000     13.5500
+    541.8000   1514.5400     38.0000     13.5600
+    542.4000   1514.5300     38.0000     13.5500
+    543.1000   1514.5500     38.0000     13.5600
+    543.7000   1514.5900     38.0000     13.5700
+    544.4000   1514.5500     38.0000     13.5500
+    545.0000   1514.5500     38.0000     13.5500
+    545.7000   1514.5300     38.0000     13.5400
+    546.4000   1514.5600     38.0000     13.5400
+    547.0000   1514.5400     38.0000     13.5300
+    547.7000   1514.5700     38.0000     13.5400
+    548.3000   1514.5600     38.0000     13.5300
+    549.0000   1514.5600     38.0000     13.5300
+    549.6000   1514.5800     38.0000     13.5300
+    550.3000   1514.5900     38.0000     13.5300
+    550.9000   1514.6200     38.0000     13.5400
+    551.6000   1514.6600     38.0000     13.5400
+    552.2000   1514.6300     38.0000     13.5300
+    552.9000   1514.6500     38.0000     13.5400
+    553.5000   1514.6200     38.0000     13.5200
+    554.2000   1514.5800     38.0000     13.5100
+    554.8000   1514.5900     38.0000     13.5100
+    555.5000   1514.6300     38.0000     13.5200
+    556.1000   1514.6600     38.0000     13.5200
+    556.8000   1514.6700     38.0000     13.5200
+    557.4000   1514.6200     38.0000     13.5000
+    558.1000   1514.6700     38.0000     13.5200
+    558.8000   1514.6900     38.0000     13.5200
+    559.4000   1514.6700     38.0000     13.5100
+    560.1000   1514.6900     38.0000     13.5100
+    560.7000   1514.7300     38.0000     13.5200
+    561.4000   1514.7000     38.0000     13.5100
+    562.0000   1514.7400     38.0000     13.5200
+    562.7000   1514.7500     38.0000     13.5200
+    563.3000   1514.7500     38.0000     13.5100
+    564.0000   1514.7500     38.0000     13.5100
+    564.6000   1514.7400     38.0000     13.5100
+    565.3000   1514.7800     38.0000     13.5100
+    565.9000   1514.7900     38.0000     13.5100
+    566.6000   1514.8200     38.0000     13.5200
+    567.2000   1514.8100     38.0000     13.5100
+    567.9000   1514.8300     38.0000     13.5100
+    568.5000   1514.8200     38.0000     13.5100
+    569.2000   1514.8200     38.0000     13.5100
+    569.8000   1514.8400     38.0000     13.5100
+    570.5000   1514.8500     38.0000     13.5100
+    571.1000   1514.8400     38.0000     13.5000
+    571.8000   1514.8900     38.0000     13.5100
+    572.4000   1514.9100     38.0000     13.5200
+    573.1000   1514.9500     38.0000     13.5200
+    573.7000   1514.8900     38.0000     13.5100
+    574.4000   1514.9000     38.0000     13.5000
+    575.1000   1514.8700     38.0000     13.4900
+    575.7000   1514.9800     38.0000     13.5200
+    576.4000   1515.0100     38.0000     13.5300
+    577.0000   1514.9800     38.0000     13.5200
+    577.7000   1514.9400     38.0000     13.5000
+    578.3000   1515.0100     38.0000     13.5200
+    579.0000   1514.9700     38.0000     13.5000
+    579.6000   1514.9700     38.0000     13.5000
+    580.3000   1514.9700     38.0000     13.4900
+    580.9000   1515.0000     38.0000     13.5000
+    581.6000   1515.0300     38.0000     13.5100
+    582.2000   1515.0300     38.0000     13.5000
+    582.9000   1514.9800     38.0000     13.4900
+    583.5000   1515.0500     38.0000     13.5000
+    584.2000   1515.0500     38.0000     13.5000
+    584.8000   1515.0700     38.0000     13.5000
+    585.5000   1515.0800     38.0000     13.5000
+    586.1000   1515.1500     38.0000     13.5200
+    586.8000   1515.1600     38.0000     13.5200
+    587.4000   1515.1600     38.0000     13.5200
+    588.1000   1515.1500     38.0000     13.5100
+    588.7000   1515.1700     38.0000     13.5100
+    589.4000   1515.1800     38.0000     13.5100
+    590.0000   1515.2200     38.0000     13.5200
+    590.7000   1515.1400     38.0000     13.5000
+    591.3000   1515.1400     38.0000     13.4900
+    592.0000   1515.2100     38.0000     13.5100
+    592.6000   1515.1800     38.0000     13.5000
+    593.3000   1515.1800     38.0000     13.4900
+    593.9000   1515.2500     38.0000     13.5100
+    594.6000   1515.2900     38.0000     13.5200
+    595.2000   1515.2600     38.0000     13.5100
+    595.9000   1515.2000     38.0000     13.4900
+    596.5000   1515.2500     38.0000     13.5000
+    597.2000   1515.2700     38.0000     13.5000
+    597.8000   1515.2900     38.0000     13.5100
+    598.5000   1515.2900     38.0000     13.5000
+    599.1000   1515.3400     38.0000     13.5100
+    599.8000   1515.3400     38.0000     13.5100
+    600.4000   1515.3200     38.0000     13.5000
+    601.1000   1515.3300     38.0000     13.5000
+    601.7000   1515.3800     38.0000     13.5100
+    602.4000   1515.3600     38.0000     13.5000
+    603.0000   1515.3500     38.0000     13.4900
+    603.7000   1515.3800     38.0000     13.5000
+    604.3000   1515.3700     38.0000     13.5000
+    605.0000   1515.3800     38.0000     13.5000
+    605.6000   1515.4000     38.0000     13.5000
+    606.3000   1515.3900     38.0000     13.4900
+    606.9000   1515.3800     38.0000     13.4900
+    607.6000   1515.3900     38.0000     13.4800
+    608.2000   1515.3800     38.0000     13.4800
+    608.9000   1515.4100     38.0000     13.4800
+    609.5000   1515.4400     38.0000     13.4900
+    610.2000   1515.4200     38.0000     13.4800
+    610.8000   1515.4000     38.0000     13.4700
+    611.5000   1515.4400     38.0000     13.4800
+    612.1000   1515.4800     38.0000     13.4900
+    612.8000   1515.3900     38.0000     13.4600
+    613.4000   1515.4000     38.0000     13.4600
+    614.1000   1515.4400     38.0000     13.4700
+    614.7000   1515.5500     38.0000     13.5000
+    615.4000   1515.5100     38.0000     13.4800
+    616.0000   1515.4400     38.0000     13.4600
+    616.7000   1515.4700     38.0000     13.4600
+    617.3000   1515.4700     38.0000     13.4600
+    618.0000   1515.4900     38.0000     13.4600
+    618.6000   1515.5400     38.0000     13.4800
+    619.3000   1515.5200     38.0000     13.4600
+    619.9000   1515.5200     38.0000     13.4600
+    620.6000   1515.5700     38.0000     13.4800
+    621.2000   1515.5700     38.0000     13.4700
+    621.9000   1515.5600     38.0000     13.4600
+    622.5000   1515.6000     38.0000     13.4800
+    623.2000   1515.5700     38.0000     13.4600
+    623.8000   1515.5700     38.0000     13.4600
+    624.5000   1515.5900     38.0000     13.4600
+    625.1000   1515.5700     38.0000     13.4500
+    625.8000   1515.5600     38.0000     13.4500
+    626.4000   1515.5800     38.0000     13.4500
+    627.0000   1515.6500     38.0000     13.4700
+    627.7000   1515.6100     38.0000     13.4500
+    628.3000   1515.7000     38.0000     13.4800
+    629.0000   1515.6500     38.0000     13.4600
+    629.6000   1515.6400     38.0000     13.4500
+    630.3000   1515.6800     38.0000     13.4600
+    630.9000   1515.6900     38.0000     13.4600
+    631.6000   1515.6900     38.0000     13.4600
+    632.2000   1515.6800     38.0000     13.4500
+    632.9000   1515.7600     38.0000     13.4700
+    633.5000   1515.7900     38.0000     13.4800
+    634.2000   1515.7400     38.0000     13.4600
+    634.8000   1515.7700     38.0000     13.4600
+    635.5000   1515.7400     38.0000     13.4500
+    636.1000   1515.7500     38.0000     13.4500
+    636.8000   1515.7200     38.0000     13.4400
+    637.4000   1515.7400     38.0000     13.4400
+    638.1000   1515.6900     38.0000     13.4200
+    638.7000   1515.6900     38.0000     13.4200
+    639.4000   1515.7500     38.0000     13.4400
+    640.0000   1515.7900     38.0000     13.4400
+    640.7000   1515.8100     38.0000     13.4500
+    641.3000   1515.8600     38.0000     13.4600
+    642.0000   1515.7900     38.0000     13.4300
+    642.6000   1515.7500     38.0000     13.4200
+    643.2000   1515.8200     38.0000     13.4400
+    643.9000   1515.9400     38.0000     13.4700
+    644.5000   1515.9100     38.0000     13.4600
+    645.2000   1515.9300     38.0000     13.4600
+    645.8000   1515.9200     38.0000     13.4500
+    646.5000   1515.9600     38.0000     13.4600
+    647.1000   1515.9400     38.0000     13.4500
+    647.8000   1515.9800     38.0000     13.4600
+    648.4000   1515.9800     38.0000     13.4600
+    649.1000   1515.9000     38.0000     13.4300
+    649.7000   1515.9000     38.0000     13.4300
+    650.4000   1515.9600     38.0000     13.4400
+    651.0000   1515.9600     38.0000     13.4400
+    651.7000   1516.0100     38.0000     13.4500
+    652.3000   1516.0400     38.0000     13.4600
+    653.0000   1516.0500     38.0000     13.4600
+    653.6000   1516.0400     38.0000     13.4500
+    654.3000   1516.0500     38.0000     13.4500
+    654.9000   1516.0900     38.0000     13.4600
+    655.5000   1516.0900     38.0000     13.4600
+    656.2000   1516.1000     38.0000     13.4500
+    656.8000   1516.1100     38.0000     13.4500
+    657.5000   1516.0800     38.0000     13.4400
+    658.1000   1516.1200     38.0000     13.4500
+    658.8000   1516.1000     38.0000     13.4400
+    659.4000   1516.1300     38.0000     13.4500
+    660.1000   1516.1100     38.0000     13.4400
+    660.7000   1516.1600     38.0000     13.4500
+    661.4000   1516.1900     38.0000     13.4600
+    662.0000   1516.1900     38.0000     13.4500
+    662.7000   1516.1900     38.0000     13.4500
+    663.3000   1516.2000     38.0000     13.4500
+    664.0000   1516.2300     38.0000     13.4600
+    664.6000   1516.2500     38.0000     13.4600
+    665.2000   1516.2100     38.0000     13.4400
+    665.9000   1516.2900     38.0000     13.4600
+    666.5000   1516.3400     38.0000     13.4800
+    667.2000   1516.2800     38.0000     13.4600
+    667.8000   1516.2700     38.0000     13.4500
+    668.5000   1516.2900     38.0000     13.4500
+    669.1000   1516.2700     38.0000     13.4400
+    669.8000   1516.2800     38.0000     13.4400
+    670.4000   1516.3000     38.0000     13.4500
+    671.1000   1516.2800     38.0000     13.4400
+    671.7000   1516.3300     38.0000     13.4500
+    672.4000   1516.3800     38.0000     13.4600
+    673.0000   1516.4100     38.0000     13.4700
+    673.6000   1516.3700     38.0000     13.4500
+    674.3000   1516.4200     38.0000     13.4600
+    674.9000   1516.3800     38.0000     13.4500
+    675.6000   1516.3600     38.0000     13.4400
+    676.2000   1516.3700     38.0000     13.4400
+    676.9000   1516.4500     38.0000     13.4600
+    677.5000   1516.4100     38.0000     13.4400
+    678.2000   1516.4700     38.0000     13.4600
+    678.8000   1516.4800     38.0000     13.4600
+    679.5000   1516.4800     38.0000     13.4500
+    680.1000   1516.4700     38.0000     13.4500
+    680.7000   1516.5200     38.0000     13.4600
+    681.4000   1516.5500     38.0000     13.4600
+    682.0000   1516.4900     38.0000     13.4400
+    682.7000   1516.5300     38.0000     13.4500
+    683.3000   1516.4900     38.0000     13.4400
+    684.0000   1516.5300     38.0000     13.4500
+    684.6000   1516.5500     38.0000     13.4500
+    685.3000   1516.5400     38.0000     13.4400
+    685.9000   1516.5300     38.0000     13.4400
+    686.6000   1516.5300     38.0000     13.4300
+    687.2000   1516.5600     38.0000     13.4400
+    687.8000   1516.5700     38.0000     13.4400
+    688.5000   1516.6200     38.0000     13.4500
+    689.1000   1516.6200     38.0000     13.4500
+    689.8000   1516.6500     38.0000     13.4600
+    690.4000   1516.6400     38.0000     13.4500
+    691.1000   1516.6300     38.0000     13.4400
+    691.7000   1516.6700     38.0000     13.4500
+    692.4000   1516.7100     38.0000     13.4600
+    693.0000   1516.7500     38.0000     13.4700
+    693.7000   1516.7200     38.0000     13.4600
+    694.3000   1516.6700     38.0000     13.4400
+    694.9000   1516.7400     38.0000     13.4600
+    695.6000   1516.7500     38.0000     13.4600
+    696.2000   1516.7400     38.0000     13.4500
+    696.9000   1516.7000     38.0000     13.4300
+    697.5000   1516.7300     38.0000     13.4400
+    698.2000   1516.8300     38.0000     13.4700
+    698.8000   1516.7800     38.0000     13.4500
+    699.5000   1516.8100     38.0000     13.4500
+    700.1000   1516.8100     38.0000     13.4500
+    700.7000   1516.8100     38.0000     13.4500
+    701.4000   1516.7900     38.0000     13.4400
+    702.0000   1516.8100     38.0000     13.4400
+    702.7000   1516.8200     38.0000     13.4400
+    703.3000   1516.8000     38.0000     13.4300
+    704.0000   1516.8600     38.0000     13.4500
+    704.6000   1516.9000     38.0000     13.4500
+    705.3000   1516.8900     38.0000     13.4500
+    705.9000   1516.8400     38.0000     13.4300
+    706.5000   1516.8800     38.0000     13.4400
+    707.2000   1516.8900     38.0000     13.4400
+    707.8000   1516.9100     38.0000     13.4400
+    708.5000   1516.8700     38.0000     13.4300
+    709.1000   1516.9700     38.0000     13.4500
+    709.8000   1516.9200     38.0000     13.4400
+    710.4000   1516.9500     38.0000     13.4400
+    711.0000   1516.9300     38.0000     13.4300
+    711.7000   1516.9300     38.0000     13.4300
+    712.3000   1516.9100     38.0000     13.4200
+    713.0000   1516.9200     38.0000     13.4200
+    713.6000   1516.9700     38.0000     13.4300
+    714.3000   1516.9700     38.0000     13.4300
+    714.9000   1516.9400     38.0000     13.4200
+    715.6000   1517.0400     38.0000     13.4400
+    716.2000   1517.0600     38.0000     13.4500
+    716.8000   1517.0700     38.0000     13.4500
+    717.5000   1517.0900     38.0000     13.4500
+    718.1000   1517.1500     38.0000     13.4600
+    718.8000   1517.1200     38.0000     13.4500
+    719.4000   1517.0900     38.0000     13.4400
+    720.1000   1517.0900     38.0000     13.4400
+    720.7000   1517.0900     38.0000     13.4300
+    721.3000   1517.1100     38.0000     13.4300
+    722.0000   1517.0800     38.0000     13.4200
+    722.6000   1517.0700     38.0000     13.4200
+    723.3000   1517.1200     38.0000     13.4300
+    723.9000   1517.1700     38.0000     13.4400
+    724.6000   1517.2200     38.0000     13.4500
+    725.2000   1517.2100     38.0000     13.4500
+    725.8000   1517.1900     38.0000     13.4400
+    726.5000   1517.1500     38.0000     13.4200
+    727.1000   1517.1800     38.0000     13.4300
+    727.8000   1517.2300     38.0000     13.4400
+    728.4000   1517.2200     38.0000     13.4300
+    729.1000   1517.2600     38.0000     13.4400
+    729.7000   1517.2200     38.0000     13.4300
+    730.3000   1517.2800     38.0000     13.4400
+    731.0000   1517.3200     38.0000     13.4500
@@ -0,0 +1,2912 @@
+test_read_store_and_write
+1/1/2009
+18:23:28
+Probe: T-5
+Source: /root/package/data/input/sippican/T5_00386.EDF
+      0.0000   1545.3800     35.1500     29.8200
+      0.7000   1544.9400     35.1500     29.6100
+      1.4000   1544.8000     35.1500     29.5300
+      2.0000   1544.7600     35.1500     29.5100
+      2.7000   1544.7400     35.1500     29.4900
+      3.4000   1544.7300     35.1500     29.4800
+      4.1000   1544.7400     35.1500     29.4800
+      4.8000   1544.7600     35.1500     29.4900
+      5.5000   1544.7700     35.1500     29.4900
+      6.1000   1544.7900     35.1500     29.4900
+      6.8000   1544.8000     35.1500     29.4900
+      7.5000   1544.8000     35.1500     29.4800
+      8.2000   1544.8200     35.1500     29.4900
+      8.9000   1544.8200     35.1500     29.4800
+      9.6000   1544.8300     35.1500     29.4800
+     10.2000   1544.8400     35.1500     29.4800
+     10.9000   1544.8400     35.1500     29.4700
+     11.6000   1544.8200     35.1500     29.4600
+     12.3000   1544.8200     35.1500     29.4600
+     13.0000   1544.8400     35.1500     29.4600
+     13.6000   1544.8400     35.1500     29.4500
+     14.3000   1544.8300     35.1500     29.4400
+     15.0000   1544.8200     35.1500     29.4300
+     15.7000   1544.7900     35.1500     29.4200
+     16.4000   1544.7700     35.1500     29.4000
+     17.1000   1544.7400     35.1500     29.3800
+     17.7000   1544.7100     35.1500     29.3600
+     18.4000   1544.7000     35.1500     29.3500
+     19.1000   1544.7100     35.1500     29.3500
+     19.8000   1544.6900     35.1500     29.3400
+     20.5000   1544.6700     35.1500     29.3200
+     21.1000   1544.6400     35.1500     29.3000
+     21.8000   1544.6400     35.1500     29.3000
+     22.5000   1544.6500     35.1500     29.3000
+     23.2000   1544.6600     35.1500     29.2900
+     23.9000   1544.6800     35.1500     29.3000
+     24.6000   1544.7000     35.1500     29.3000
+     25.2000   1544.7300     35.1500     29.3100
+     25.9000   1544.7300     35.1500     29.3100
+     26.6000   1544.7400     35.1500     29.3000
+     27.3000   1544.7400     35.1500     29.3000
+     28.0000   1544.7600     35.1500     29.3000
+     28.6000   1544.7900     35.1500     29.3100
+     29.3000   1544.7800     35.1500     29.3000
+     30.0000   1544.7900     35.1500     29.3000
+     30.7000   1544.8100     35.1500     29.3000
+     31.4000   1544.8300     35.1500     29.3100
+     32.1000   1544.8500     35.1500     29.3100
+     32.7000   1544.8400     35.1500     29.3000
+     33.4000   1544.8400     35.1500     29.3000
+     34.1000   1544.8500     35.1500     29.2900
+     34.8000   1544.8600     35.1500     29.3000
+     35.5000   1544.8700     35.1500     29.2900
+     36.1000   1544.8700     35.1500     29.2900
+     36.8000   1544.8800     35.1500     29.2900
+     37.5000   1544.9100     35.1500     29.3000
+     38.2000   1544.9300     35.1500     29.3000
+     38.9000   1544.9500     35.1500     29.3100
+     39.5000   1544.9800     35.1500     29.3100
+     40.2000   1544.9900     35.1500     29.3100
+     40.9000   1545.0100     35.1500     29.3200
+     41.6000   1545.0200     35.1500     29.3200
+     42.3000   1545.0200     35.1500     29.3100
+     42.9000   1544.9800     35.1500     29.2800
+     43.6000   1544.8800     35.1500     29.2300
+     44.3000   1544.8100     35.1500     29.2000
+     45.0000   1544.8000     35.1500     29.1800
+     45.7000   1544.7800     35.1500     29.1700
+     46.3000   1544.7500     35.1500     29.1500
+     47.0000   1544.7100     35.1500     29.1300
+     47.7000   1544.7000     35.1500     29.1200
+     48.4000   1544.6900     35.1500     29.1100
+     49.1000   1544.6400     35.1500     29.0800
+     49.7000   1544.5800     35.1500     29.0400
+     50.4000   1544.5500     35.1500     29.0300
+     51.1000   1544.5500     35.1500     29.0200
+     51.8000   1544.5600     35.1500     29.0200
+     52.5000   1544.5800     35.1500     29.0200
+     53.1000   1544.5800     35.1500     29.0200
+     53.8000   1544.5900     35.1500     29.0200
+     54.5000   1544.5900     35.1500     29.0100
+     55.2000   1544.5900     35.1500     29.0100
+     55.9000   1544.5600     35.1500     28.9900
+     56.5000   1544.5200     35.1500     28.9600
+     57.2000   1544.4900     35.1500     28.9400
+     57.9000   1544.4000     35.1500     28.9000
+     58.6000   1544.2500     35.1500     28.8200
+     59.3000   1544.1000     35.1500     28.7500
+     59.9000   1544.0400     35.1500     28.7100
+     60.6000   1544.0200     35.1500     28.7000
+     61.3000   1544.0100     35.1500     28.6900
+     62.0000   1544.0300     35.1500     28.6900
+     62.7000   1544.0100     35.1500     28.6800
+     63.3000   1543.9700     35.1500     28.6500
+     64.0000   1543.9300     35.1500     28.6300
+     64.7000   1543.8600     35.1500     28.6000
+     65.4000   1543.8000     35.1500     28.5600
+     66.1000   1543.7700     35.1500     28.5400
+     66.7000   1543.7400     35.1500     28.5200
+     67.4000   1543.6600     35.1500     28.4800
+     68.1000   1543.5800     35.1500     28.4400
+     68.8000   1543.5400     35.1500     28.4200
+     69.5000   1543.5000     35.1500     28.3900
+     70.1000   1543.3900     35.1500     28.3300
+     70.8000   1543.3100     35.1500     28.2900
+     71.5000   1543.2900     35.1500     28.2800
+     72.2000   1543.2800     35.1500     28.2700
+     72.9000   1543.2800     35.1500     28.2700
+     73.5000   1543.2700     35.1500     28.2500
+     74.2000   1543.2600     35.1500     28.2500
+     74.9000   1543.2600     35.1500     28.2400
+     75.6000   1543.2200     35.1500     28.2200
+     76.2000   1543.1500     35.1500     28.1800
+     76.9000   1543.0500     35.1500     28.1300
+     77.6000   1543.0000     35.1500     28.1000
+     78.3000   1542.9700     35.1500     28.0800
+     79.0000   1542.9700     35.1500     28.0800
+     79.6000   1542.9700     35.1500     28.0700
+     80.3000   1542.9600     35.1500     28.0600
+     81.0000   1542.9700     35.1500     28.0600
+     81.7000   1542.9700     35.1500     28.0600
+     82.4000   1542.9800     35.1500     28.0500
+     83.0000   1542.9200     35.1500     28.0200
+     83.7000   1542.8500     35.1500     27.9900
+     84.4000   1542.7900     35.1500     27.9500
+     85.1000   1542.7700     35.1500     27.9400
+     85.7000   1542.7300     35.1500     27.9200
+     86.4000   1542.7100     35.1500     27.9000
+     87.1000   1542.7000     35.1500     27.8900
+     87.8000   1542.6900     35.1500     27.8800
+     88.5000   1542.7000     35.1500     27.8800
+     89.1000   1542.6900     35.1500     27.8700
+     89.8000   1542.6600     35.1500     27.8500
+     90.5000   1542.6400     35.1500     27.8400
+     91.2000   1542.6500     35.1500     27.8400
+     91.8000   1542.6600     35.1500     27.8400
+     92.5000   1542.6700     35.1500     27.8400
+     93.2000   1542.6700     35.1500     27.8300
+     93.9000   1542.6700     35.1500     27.8300
+     94.6000   1542.6400     35.1500     27.8100
+     95.2000   1542.6000     35.1500     27.7900
+     95.9000   1542.5700     35.1500     27.7600
+     96.6000   1542.5000     35.1500     27.7300
+     97.3000   1542.4600     35.1500     27.7100
+     97.9000   1542.4300     35.1500     27.6900
+     98.6000   1542.3900     35.1500     27.6700
+     99.3000   1542.3800     35.1500     27.6600
+    100.0000   1542.3800     35.1500     27.6500
+    100.7000   1542.3600     35.1500     27.6400
+    101.3000   1542.3600     35.1500     27.6300
+    102.0000   1542.3400     35.1500     27.6100
+    102.7000   1542.3200     35.1500     27.6000
+    103.4000   1542.3200     35.1500     27.6000
+    104.0000   1542.3100     35.1500     27.5900
+    104.7000   1542.3000     35.1500     27.5800
+    105.4000   1542.2900     35.1500     27.5700
+    106.1000   1542.2600     35.1500     27.5500
+    106.8000   1542.2300     35.1500     27.5300
+    107.4000   1542.2300     35.1500     27.5300
+    108.1000   1542.2400     35.1500     27.5300
+    108.8000   1542.2500     35.1500     27.5200
+    109.5000   1542.2500     35.1500     27.5200
+    110.1000   1542.2700     35.1500     27.5200
+    110.8000   1542.2600     35.1500     27.5200
+    111.5000   1542.2500     35.1500     27.5000
+    112.2000   1542.2500     35.1500     27.5000
+    112.8000   1542.2400     35.1500     27.4900
+    113.5000   1542.2300     35.1500     27.4800
+    114.2000   1542.2200     35.1500     27.4700
+    114.9000   1542.2200     35.1500     27.4700
+    115.6000   1542.2600     35.1500     27.4800
+    116.2000   1542.2700     35.1500     27.4800
+    116.9000   1542.2700     35.1500     27.4700
+    117.6000   1542.2600     35.1500     27.4600
+    118.3000   1542.2500     35.1500     27.4500
+    118.9000   1542.2500     35.1500     27.4500
+    119.6000   1542.2300     35.1500     27.4300
+    120.3000   1542.2200     35.1500     27.4200
+    121.0000   1542.2100     35.1500     27.4200
+    121.6000   1542.2200     35.1500     27.4100
+    122.3000   1542.2200     35.1500     27.4100
+    123.0000   1542.2000     35.1500     27.4000
+    123.7000   1542.1800     35.1500     27.3800
+    124.3000   1542.1600     35.1500     27.3700
+    125.0000   1542.1500     35.1500     27.3600
+    125.7000   1542.1500     35.1500     27.3500
+    126.4000   1542.1300     35.1500     27.3400
+    127.0000   1542.1300     35.1500     27.3300
+    127.7000   1542.1200     35.1500     27.3300
+    128.4000   1542.1000     35.1500     27.3100
+    129.1000   1542.0900     35.1500     27.3000
+    129.8000   1542.0700     35.1500     27.2900
+    130.4000   1542.0700     35.1500     27.2900
+    131.1000   1542.0800     35.1500     27.2800
+    131.8000   1542.0800     35.1500     27.2800
+    132.5000   1542.0800     35.1500     27.2700
+    133.1000   1542.0900     35.1500     27.2700
+    133.8000   1542.0900     35.1500     27.2700
+    134.5000   1542.0900     35.1500     27.2600
+    135.2000   1542.1000     35.1500     27.2600
+    135.8000   1542.1100     35.1500     27.2600
+    136.5000   1542.1000     35.1500     27.2500
+    137.2000   1542.1000     35.1500     27.2500
+    137.9000   1542.1000     35.1500     27.2400
+    138.5000   1542.0900     35.1500     27.2300
+    139.2000   1542.1000     35.1500     27.2300
+    139.9000   1542.1100     35.1500     27.2300
+    140.6000   1542.1000     35.1500     27.2200
+    141.2000   1542.1100     35.1500     27.2200
+    141.9000   1542.0900     35.1500     27.2100
+    142.6000   1542.0400     35.1500     27.1800
+    143.3000   1542.0300     35.1500     27.1700
+    143.9000   1542.0100     35.1500     27.1600
+    144.6000   1541.9600     35.1500     27.1300
+    145.3000   1541.9200     35.1500     27.1100
+    146.0000   1541.9200     35.1500     27.1000
+    146.6000   1541.8900     35.1500     27.0900
+    147.3000   1541.8700     35.1500     27.0700
+    148.0000   1541.8700     35.1500     27.0600
+    148.7000   1541.8700     35.1500     27.0600
+    149.3000   1541.8600     35.1500     27.0500
+    150.0000   1541.8500     35.1500     27.0400
+    150.7000   1541.8400     35.1500     27.0300
+    151.4000   1541.8300     35.1500     27.0200
+    152.0000   1541.7900     35.1500     27.0000
+    152.7000   1541.7300     35.1500     26.9700
+    153.4000   1541.6800     35.1500     26.9400
+    154.1000   1541.6300     35.1500     26.9100
+    154.7000   1541.5900     35.1500     26.8900
+    155.4000   1541.5300     35.1500     26.8600
+    156.1000   1541.3900     35.1500     26.7900
+    156.8000   1541.2300     35.1500     26.7200
+    157.4000   1541.1000     35.1500     26.6600
+    158.1000   1541.0100     35.1500     26.6100
+    158.8000   1540.9600     35.1500     26.5900
+    159.5000   1540.8400     35.1500     26.5300
+    160.1000   1540.7000     35.1500     26.4600
+    160.8000   1540.6000     35.1500     26.4200
+    161.5000   1540.5600     35.1500     26.3900
+    162.1000   1540.5200     35.1500     26.3700
+    162.8000   1540.4400     35.1500     26.3300
+    163.5000   1540.3600     35.1500     26.2900
+    164.2000   1540.3200     35.1500     26.2700
+    164.8000   1540.3000     35.1500     26.2600
+    165.5000   1540.2600     35.1500     26.2400
+    166.2000   1540.1600     35.1500     26.1900
+    166.9000   1539.9600     35.1500     26.1000
+    167.5000   1539.7400     35.1500     26.0000
+    168.2000   1539.5900     35.1500     25.9300
+    168.9000   1539.4900     35.1500     25.8800
+    169.6000   1539.4200     35.1500     25.8500
+    170.2000   1539.3300     35.1500     25.8000
+    170.9000   1539.2400     35.1500     25.7600
+    171.6000   1539.1300     35.1500     25.7100
+    172.3000   1539.0500     35.1500     25.6700
+    172.9000   1538.9000     35.1500     25.6000
+    173.6000   1538.7200     35.1500     25.5200
+    174.3000   1538.5600     35.1500     25.4500
+    175.0000   1538.4100     35.1500     25.3800
+    175.6000   1538.3200     35.1500     25.3400
+    176.3000   1538.2500     35.1500     25.3100
+    177.0000   1538.2000     35.1500     25.2800
+    177.6000   1538.1700     35.1500     25.2600
+    178.3000   1538.1600     35.1500     25.2500
+    179.0000   1538.1200     35.1500     25.2400
+    179.7000   1538.0900     35.1500     25.2200
+    180.3000   1538.0500     35.1500     25.2000
+    181.0000   1538.0400     35.1500     25.1900
+    181.7000   1538.0100     35.1500     25.1700
+    182.4000   1537.9600     35.1500     25.1400
+    183.0000   1537.9100     35.1500     25.1200
+    183.7000   1537.8400     35.1500     25.0800
+    184.4000   1537.6300     35.1500     24.9900
+    185.0000   1537.2800     35.1500     24.8400
+    185.7000   1536.9600     35.1500     24.7100
+    186.4000   1536.7000     35.1500     24.5900
+    187.1000   1536.3100     35.1500     24.4300
+    187.7000   1535.7300     35.1500     24.1900
+    188.4000   1535.2800     35.1500     24.0100
+    189.1000   1535.0200     35.1500     23.8900
+    189.8000   1534.7500     35.1500     23.7800
+    190.4000   1534.5200     35.1500     23.6900
+    191.1000   1534.3400     35.1500     23.6100
+    191.8000   1534.1000     35.1500     23.5100
+    192.4000   1533.9000     35.1500     23.4300
+    193.1000   1533.7900     35.1500     23.3800
+    193.8000   1533.7400     35.1500     23.3500
+    194.5000   1533.7000     35.1500     23.3300
+    195.1000   1533.6200     35.1500     23.3000
+    195.8000   1533.4800     35.1500     23.2400
+    196.5000   1533.2800     35.1500     23.1500
+    197.2000   1533.0400     35.1500     23.0600
+    197.8000   1532.8600     35.1500     22.9800
+    198.5000   1532.7000     35.1500     22.9100
+    199.2000   1532.5100     35.1500     22.8300
+    199.8000   1532.2700     35.1500     22.7400
+    200.5000   1531.8900     35.1500     22.5900
+    201.2000   1531.5100     35.1500     22.4300
+    201.9000   1531.2900     35.1500     22.3400
+    202.5000   1531.1800     35.1500     22.3000
+    203.2000   1531.0900     35.1500     22.2600
+    203.9000   1531.0500     35.1500     22.2400
+    204.5000   1530.9700     35.1500     22.2000
+    205.2000   1530.8100     35.1500     22.1400
+    205.9000   1530.6200     35.1500     22.0600
+    206.6000   1530.3700     35.1500     21.9600
+    207.2000   1530.0600     35.1500     21.8400
+    207.9000   1529.6300     35.1500     21.6800
+    208.6000   1529.2500     35.1500     21.5300
+    209.2000   1528.8500     35.1500     21.3700
+    209.9000   1528.4700     35.1500     21.2200
+    210.6000   1528.1300     35.1500     21.1000
+    211.3000   1527.8300     35.1500     20.9800
+    211.9000   1527.5900     35.1500     20.8900
+    212.6000   1527.4200     35.1500     20.8200
+    213.3000   1527.3100     35.1500     20.7800
+    213.9000   1527.2100     35.1500     20.7300
+    214.6000   1527.0500     35.1500     20.6700
+    215.3000   1526.6500     35.1500     20.5200
+    216.0000   1526.1000     35.1500     20.3200
+    216.6000   1525.7500     35.1500     20.1800
+    217.3000   1525.4700     35.1500     20.0800
+    218.0000   1525.1500     35.1500     19.9600
+    218.6000   1524.8100     35.1500     19.8300
+    219.3000   1524.5200     35.1500     19.7300
+    220.0000   1524.3400     35.1500     19.6600
+    220.7000   1524.2500     35.1500     19.6200
+    221.3000   1524.1200     35.1500     19.5700
+    222.0000   1523.8700     35.1500     19.4800
+    222.7000   1523.5400     35.1500     19.3600
+    223.3000   1523.2800     35.1500     19.2600
+    224.0000   1523.0400     35.1500     19.1700
+    224.7000   1522.7800     35.1500     19.0800
+    225.4000   1522.4600     35.1500     18.9600
+    226.0000   1522.1400     35.1500     18.8400
+    226.7000   1521.9000     35.1500     18.7600
+    227.4000   1521.6500     35.1500     18.6600
+    228.0000   1521.3400     35.1500     18.5500
+    228.7000   1521.0600     35.1500     18.4500
+    229.4000   1520.7800     35.1500     18.3500
+    230.0000   1520.5000     35.1500     18.2500
+    230.7000   1520.2200     35.1500     18.1500
+    231.4000   1519.9700     35.1500     18.0600
+    232.1000   1519.7200     35.1500     17.9700
+    232.7000   1519.4100     35.1500     17.8600
+    233.4000   1519.0100     35.1500     17.7200
+    234.1000   1518.7000     35.1500     17.6100
+    234.7000   1518.5300     35.1500     17.5500
+    235.4000   1518.4200     35.1500     17.5100
+    236.1000   1518.3100     35.1500     17.4700
+    236.8000   1518.1400     35.1500     17.4100
+    237.4000   1517.9300     35.1500     17.3300
+    238.1000   1517.7700     35.1500     17.2800
+    238.8000   1517.6900     35.1500     17.2500
+    239.4000   1517.6700     35.1500     17.2400
+    240.1000   1517.6600     35.1500     17.2300
+    240.8000   1517.6600     35.1500     17.2200
+    241.4000   1517.6200     35.1500     17.2100
+    242.1000   1517.4900     35.1500     17.1600
+    242.8000   1517.2800     35.1500     17.0900
+    243.4000   1517.0800     35.1500     17.0200
+    244.1000   1516.8900     35.1500     16.9500
+    244.8000   1516.7100     35.1500     16.8900
+    245.5000   1516.5600     35.1500     16.8300
+    246.1000   1516.4200     35.1500     16.7800
+    246.8000   1516.2800     35.1500     16.7300
+    247.5000   1516.1600     35.1500     16.6900
+    248.1000   1516.0700     35.1500     16.6500
+    248.8000   1515.9700     35.1500     16.6200
+    249.5000   1515.9000     35.1500     16.5900
+    250.1000   1515.8700     35.1500     16.5800
+    250.8000   1515.8400     35.1500     16.5600
+    251.5000   1515.7300     35.1500     16.5200
+    252.2000   1515.6100     35.1500     16.4800
+    252.8000   1515.3400     35.1500     16.3900
+    253.5000   1514.7500     35.1500     16.1900
+    254.2000   1514.1300     35.1500     15.9900
+    254.8000   1513.7600     35.1500     15.8600
+    255.5000   1513.5200     35.1500     15.7800
+    256.2000   1513.3400     35.1500     15.7200
+    256.8000   1513.2000     35.1500     15.6700
+    257.5000   1513.0600     35.1500     15.6200
+    258.2000   1512.9100     35.1500     15.5700
+    258.8000   1512.8100     35.1500     15.5400
+    259.5000   1512.7300     35.1500     15.5100
+    260.2000   1512.6500     35.1500     15.4800
+    260.8000   1512.5900     35.1500     15.4500
+    261.5000   1512.5200     35.1500     15.4300
+    262.2000   1512.4600     35.1500     15.4100
+    262.9000   1512.3900     35.1500     15.3800
+    263.5000   1512.3100     35.1500     15.3500
+    264.2000   1512.2000     35.1500     15.3100
+    264.9000   1512.0600     35.1500     15.2700
+    265.5000   1511.9600     35.1500     15.2300
+    266.2000   1511.8800     35.1500     15.2000
+    266.9000   1511.8200     35.1500     15.1800
+    267.5000   1511.7100     35.1500     15.1400
+    268.2000   1511.5600     35.1500     15.0900
+    268.9000   1511.3900     35.1500     15.0300
+    269.5000   1511.2600     35.1500     14.9900
+    270.2000   1511.2000     35.1500     14.9600
+    270.9000   1511.1500     35.1500     14.9500
+    271.5000   1511.0700     35.1500     14.9100
+    272.2000   1510.9600     35.1500     14.8800
+    272.9000   1510.8300     35.1500     14.8300
+    273.5000   1510.7300     35.1500     14.8000
+    274.2000   1510.7000     35.1500     14.7800
+    274.9000   1510.7000     35.1500     14.7800
+    275.6000   1510.6800     35.1500     14.7700
+    276.2000   1510.6700     35.1500     14.7700
+    276.9000   1510.6600     35.1500     14.7600
+    277.6000   1510.6700     35.1500     14.7600
+    278.2000   1510.6400     35.1500     14.7500
+    278.9000   1510.4600     35.1500     14.6900
+    279.6000   1510.2000     35.1500     14.6000
+    280.2000   1510.0100     35.1500     14.5400
+    280.9000   1509.9100     35.1500     14.5000
+    281.6000   1509.8300     35.1500     14.4700
+    282.2000   1509.7500     35.1500     14.4500
+    282.9000   1509.7000     35.1500     14.4300
+    283.6000   1509.6500     35.1500     14.4100
+    284.2000   1509.5400     35.1500     14.3700
+    284.9000   1509.3900     35.1500     14.3200
+    285.6000   1509.2700     35.1500     14.2800
+    286.2000   1509.2000     35.1500     14.2500
+    286.9000   1509.1800     35.1500     14.2400
+    287.6000   1509.1700     35.1500     14.2400
+    288.2000   1509.1600     35.1500     14.2300
+    288.9000   1509.1200     35.1500     14.2200
+    289.6000   1509.1000     35.1500     14.2100
+    290.2000   1509.0500     35.1500     14.1900
+    290.9000   1508.9900     35.1500     14.1700
+    291.6000   1508.9500     35.1500     14.1500
+    292.2000   1508.8400     35.1500     14.1100
+    292.9000   1508.6800     35.1500     14.0600
+    293.6000   1508.5500     35.1500     14.0200
+    294.2000   1508.4400     35.1500     13.9800
+    294.9000   1508.3900     35.1500     13.9600
+    295.6000   1508.3500     35.1500     13.9400
+    296.2000   1508.3200     35.1500     13.9300
+    296.9000   1508.2900     35.1500     13.9200
+    297.6000   1508.2100     35.1500     13.8900
+    298.2000   1508.1100     35.1500     13.8600
+    298.9000   1508.0200     35.1500     13.8300
+    299.6000   1507.9600     35.1500     13.8000
+    300.2000   1507.9100     35.1500     13.7900
+    300.9000   1507.8700     35.1500     13.7700
+    301.6000   1507.8300     35.1500     13.7500
+    302.2000   1507.8000     35.1500     13.7400
+    302.9000   1507.7400     35.1500     13.7200
+    303.6000   1507.6200     35.1500     13.6800
+    304.2000   1507.3200     35.1500     13.5800
+    304.9000   1506.9500     35.1500     13.4700
+    305.6000   1506.7000     35.1500     13.3900
+    306.2000   1506.5600     35.1500     13.3400
+    306.9000   1506.4900     35.1500     13.3200
+    307.6000   1506.4300     35.1500     13.3000
+    308.2000   1506.3800     35.1500     13.2800
+    308.9000   1506.3300     35.1500     13.2600
+    309.6000   1506.2500     35.1500     13.2300
+    310.2000   1506.1900     35.1500     13.2100
+    310.9000   1506.1200     35.1500     13.1900
+    311.6000   1506.0000     35.1500     13.1500
+    312.2000   1505.8300     35.1500     13.0900
+    312.9000   1505.7100     35.1500     13.0500
+    313.6000   1505.6600     35.1500     13.0300
+    314.2000   1505.6000     35.1500     13.0100
+    314.9000   1505.5400     35.1500     12.9900
+    315.6000   1505.5100     35.1500     12.9800
+    316.2000   1505.4800     35.1500     12.9700
+    316.9000   1505.3900     35.1500     12.9400
+    317.6000   1505.2500     35.1500     12.8900
+    318.2000   1505.1200     35.1500     12.8500
+    318.9000   1504.9500     35.1500     12.8000
+    319.6000   1504.7700     35.1500     12.7400
+    320.2000   1504.5900     35.1500     12.6800
+    320.9000   1504.3600     35.1500     12.6100
+    321.6000   1504.1500     35.1500     12.5400
+    322.2000   1503.9600     35.1500     12.4900
+    322.9000   1503.7500     35.1500     12.4200
+    323.6000   1503.5700     35.1500     12.3600
+    324.2000   1503.3500     35.1500     12.3000
+    324.9000   1503.0800     35.1500     12.2100
+    325.5000   1502.7900     35.1500     12.1200
+    326.2000   1502.5700     35.1500     12.0600
+    326.9000   1502.4200     35.1500     12.0100
+    327.5000   1502.3300     35.1500     11.9800
+    328.2000   1502.2300     35.1500     11.9400
+    328.9000   1502.1000     35.1500     11.9000
+    329.5000   1501.9600     35.1500     11.8600
+    330.2000   1501.8500     35.1500     11.8300
+    330.9000   1501.7600     35.1500     11.8000
+    331.5000   1501.7100     35.1500     11.7800
+    332.2000   1501.7000     35.1500     11.7700
+    332.9000   1501.6000     35.1500     11.7400
+    333.5000   1501.4200     35.1500     11.6800
+    334.2000   1501.2900     35.1500     11.6400
+    334.9000   1501.2300     35.1500     11.6200
+    335.5000   1501.1800     35.1500     11.6100
+    336.2000   1501.1500     35.1500     11.5900
+    336.9000   1501.1000     35.1500     11.5800
+    337.5000   1501.0400     35.1500     11.5500
+    338.2000   1500.9700     35.1500     11.5300
+    338.8000   1500.9100     35.1500     11.5100
+    339.5000   1500.8400     35.1500     11.4900
+    340.2000   1500.7700     35.1500     11.4600
+    340.8000   1500.7200     35.1500     11.4500
+    341.5000   1500.6600     35.1500     11.4300
+    342.2000   1500.6200     35.1500     11.4100
+    342.8000   1500.5800     35.1500     11.4000
+    343.5000   1500.5200     35.1500     11.3700
+    344.2000   1500.4100     35.1500     11.3400
+    344.8000   1500.2100     35.1500     11.2800
+    345.5000   1500.0400     35.1500     11.2300
+    346.2000   1499.8600     35.1500     11.1700
+    346.8000   1499.6700     35.1500     11.1100
+    347.5000   1499.3900     35.1500     11.0300
+    348.1000   1499.1500     35.1500     10.9600
+    348.8000   1498.9900     35.1500     10.9100
+    349.5000   1498.9000     35.1500     10.8800
+    350.1000   1498.8200     35.1500     10.8600
+    350.8000   1498.7500     35.1500     10.8300
+    351.5000   1498.6600     35.1500     10.8000
+    352.1000   1498.4900     35.1500     10.7500
+    352.8000   1498.2600     35.1500     10.6900
+    353.5000   1498.0100     35.1500     10.6100
+    354.1000   1497.6900     35.1500     10.5200
+    354.8000   1497.3300     35.1500     10.4100
+    355.4000   1497.0600     35.1500     10.3300
+    356.1000   1496.9000     35.1500     10.2900
+    356.8000   1496.8300     35.1500     10.2600
+    357.4000   1496.7900     35.1500     10.2500
+    358.1000   1496.7500     35.1500     10.2300
+    358.8000   1496.7300     35.1500     10.2300
+    359.4000   1496.7200     35.1500     10.2200
+    360.1000   1496.7100     35.1500     10.2100
+    360.8000   1496.7100     35.1500     10.2100
+    361.4000   1496.7000     35.1500     10.2100
+    362.1000   1496.6300     35.1500     10.1800
+    362.7000   1496.4500     35.1500     10.1300
+    363.4000   1496.1400     35.1500     10.0400
+    364.1000   1495.7900     35.1500      9.9400
+    364.7000   1495.4600     35.1500      9.8500
+    365.4000   1495.1200     35.1500      9.7500
+    366.1000   1494.8200     35.1500      9.6600
+    366.7000   1494.6500     35.1500      9.6100
+    367.4000   1494.6300     35.1500      9.6000
+    368.0000   1494.6600     35.1500      9.6100
+    368.7000   1494.6800     35.1500      9.6100
+    369.4000   1494.6800     35.1500      9.6100
+    370.0000   1494.6400     35.1500      9.6000
+    370.7000   1494.6000     35.1500      9.5800
+    371.4000   1494.5700     35.1500      9.5700
+    372.0000   1494.5700     35.1500      9.5600
+    372.7000   1494.5500     35.1500      9.5600
+    373.3000   1494.5500     35.1500      9.5500
+    374.0000   1494.5600     35.1500      9.5500
+    374.7000   1494.5800     35.1500      9.5600
+    375.3000   1494.6000     35.1500      9.5600
+    376.0000   1494.5800     35.1500      9.5500
+    376.7000   1494.5500     35.1500      9.5400
+    377.3000   1494.5400     35.1500      9.5300
+    378.0000   1494.5400     35.1500      9.5300
+    378.6000   1494.5000     35.1500      9.5200
+    379.3000   1494.4700     35.1500      9.5100
+    380.0000   1494.4200     35.1500      9.4900
+    380.6000   1494.3100     35.1500      9.4600
+    381.3000   1494.2700     35.1500      9.4400
+    382.0000   1494.2400     35.1500      9.4300
+    382.6000   1494.2200     35.1500      9.4200
+    383.3000   1494.1900     35.1500      9.4100
+    383.9000   1494.1300     35.1500      9.3900
+    384.6000   1494.0900     35.1500      9.3800
+    385.3000   1494.0700     35.1500      9.3700
+    385.9000   1494.0500     35.1500      9.3600
+    386.6000   1494.0400     35.1500      9.3500
+    387.3000   1494.0400     35.1500      9.3500
+    387.9000   1494.0200     35.1500      9.3400
+    388.6000   1494.0200     35.1500      9.3400
+    389.2000   1494.0200     35.1500      9.3400
+    389.9000   1494.0200     35.1500      9.3400
+    390.6000   1494.0400     35.1500      9.3400
+    391.2000   1494.0500     35.1500      9.3400
+    391.9000   1494.0300     35.1500      9.3300
+    392.5000   1493.9800     35.1500      9.3100
+    393.2000   1493.9400     35.1500      9.3000
+    393.9000   1493.8900     35.1500      9.2800
+    394.5000   1493.8300     35.1500      9.2600
+    395.2000   1493.8000     35.1500      9.2500
+    395.9000   1493.8100     35.1500      9.2500
+    396.5000   1493.8200     35.1500      9.2500
+    397.2000   1493.8300     35.1500      9.2500
+    397.8000   1493.8300     35.1500      9.2500
+    398.5000   1493.8100     35.1500      9.2400
+    399.2000   1493.7700     35.1500      9.2200
+    399.8000   1493.7500     35.1500      9.2200
+    400.5000   1493.7400     35.1500      9.2100
+    401.1000   1493.7200     35.1500      9.2000
+    401.8000   1493.6700     35.1500      9.1800
+    402.5000   1493.6100     35.1500      9.1600
+    403.1000   1493.5500     35.1500      9.1400
+    403.8000   1493.5000     35.1500      9.1300
+    404.4000   1493.4300     35.1500      9.1100
+    405.1000   1493.3600     35.1500      9.0800
+    405.8000   1493.3100     35.1500      9.0700
+    406.4000   1493.2600     35.1500      9.0500
+    407.1000   1493.1900     35.1500      9.0300
+    407.8000   1493.1300     35.1500      9.0100
+    408.4000   1493.0400     35.1500      8.9800
+    409.1000   1492.9200     35.1500      8.9500
+    409.7000   1492.8300     35.1500      8.9200
+    410.4000   1492.7300     35.1500      8.8900
+    411.1000   1492.6000     35.1500      8.8500
+    411.7000   1492.4400     35.1500      8.8100
+    412.4000   1492.3100     35.1500      8.7700
+    413.0000   1492.2100     35.1500      8.7400
+    413.7000   1492.1800     35.1500      8.7300
+    414.4000   1492.1800     35.1500      8.7200
+    415.0000   1492.1800     35.1500      8.7200
+    415.7000   1492.1900     35.1500      8.7200
+    416.3000   1492.2000     35.1500      8.7200
+    417.0000   1492.2000     35.1500      8.7200
+    417.7000   1492.1900     35.1500      8.7100
+    418.3000   1492.1900     35.1500      8.7100
+    419.0000   1492.1600     35.1500      8.7000
+    419.6000   1492.1000     35.1500      8.6800
+    420.3000   1492.0600     35.1500      8.6700
+    421.0000   1492.0400     35.1500      8.6600
+    421.6000   1492.0000     35.1500      8.6400
+    422.3000   1491.8700     35.1500      8.6100
+    422.9000   1491.7500     35.1500      8.5700
+    423.6000   1491.7000     35.1500      8.5500
+    424.3000   1491.6600     35.1500      8.5400
+    424.9000   1491.6300     35.1500      8.5300
+    425.6000   1491.5900     35.1500      8.5200
+    426.2000   1491.5300     35.1500      8.5000
+    426.9000   1491.5000     35.1500      8.4800
+    427.6000   1491.4700     35.1500      8.4700
+    428.2000   1491.4500     35.1500      8.4700
+    428.9000   1491.4400     35.1500      8.4600
+    429.5000   1491.4400     35.1500      8.4600
+    430.2000   1491.4600     35.1500      8.4600
+    430.9000   1491.4800     35.1500      8.4600
+    431.5000   1491.5000     35.1500      8.4600
+    432.2000   1491.5200     35.1500      8.4700
+    432.8000   1491.5200     35.1500      8.4600
+    433.5000   1491.4900     35.1500      8.4500
+    434.2000   1491.4000     35.1500      8.4300
+    434.8000   1491.2600     35.1500      8.3900
+    435.5000   1491.0700     35.1500      8.3300
+    436.1000   1490.8900     35.1500      8.2800
+    436.8000   1490.7600     35.1500      8.2400
+    437.4000   1490.6700     35.1500      8.2200
+    438.1000   1490.6000     35.1500      8.2000
+    438.8000   1490.5700     35.1500      8.1800
+    439.4000   1490.5600     35.1500      8.1800
+    440.1000   1490.5700     35.1500      8.1800
+    440.7000   1490.5900     35.1500      8.1800
+    441.4000   1490.6100     35.1500      8.1800
+    442.1000   1490.6200     35.1500      8.1800
+    442.7000   1490.6300     35.1500      8.1800
+    443.4000   1490.6400     35.1500      8.1800
+    444.0000   1490.6400     35.1500      8.1800
+    444.7000   1490.6400     35.1500      8.1800
+    445.4000   1490.6400     35.1500      8.1800
+    446.0000   1490.6300     35.1500      8.1700
+    446.7000   1490.6200     35.1500      8.1600
+    447.3000   1490.6200     35.1500      8.1600
+    448.0000   1490.6000     35.1500      8.1500
+    448.6000   1490.6000     35.1500      8.1500
+    449.3000   1490.6000     35.1500      8.1500
+    450.0000   1490.6300     35.1500      8.1500
+    450.6000   1490.6500     35.1500      8.1500
+    451.3000   1490.6600     35.1500      8.1500
+    451.9000   1490.6400     35.1500      8.1500
+    452.6000   1490.6300     35.1500      8.1400
+    453.3000   1490.6100     35.1500      8.1300
+    453.9000   1490.5600     35.1500      8.1200
+    454.6000   1490.5300     35.1500      8.1000
+    455.2000   1490.5000     35.1500      8.0900
+    455.9000   1490.4600     35.1500      8.0800
+    456.5000   1490.4700     35.1500      8.0800
+    457.2000   1490.4300     35.1500      8.0700
+    457.9000   1490.4000     35.1500      8.0600
+    458.5000   1490.4000     35.1500      8.0500
+    459.2000   1490.3800     35.1500      8.0500
+    459.8000   1490.3800     35.1500      8.0400
+    460.5000   1490.3800     35.1500      8.0400
+    461.2000   1490.3700     35.1500      8.0300
+    461.8000   1490.3600     35.1500      8.0300
+    462.5000   1490.3500     35.1500      8.0200
+    463.1000   1490.3200     35.1500      8.0100
+    463.8000   1490.2700     35.1500      8.0000
+    464.4000   1490.2300     35.1500      7.9800
+    465.1000   1490.2000     35.1500      7.9700
+    465.8000   1490.1900     35.1500      7.9700
+    466.4000   1490.1800     35.1500      7.9600
+    467.1000   1490.1500     35.1500      7.9500
+    467.7000   1490.1200     35.1500      7.9400
+    468.4000   1490.0900     35.1500      7.9300
+    469.0000   1490.0400     35.1500      7.9100
+    469.7000   1489.9900     35.1500      7.9000
+    470.4000   1489.9400     35.1500      7.8800
+    471.0000   1489.8700     35.1500      7.8600
+    471.7000   1489.8400     35.1500      7.8500
+    472.3000   1489.8400     35.1500      7.8400
+    473.0000   1489.8300     35.1500      7.8400
+    473.6000   1489.8200     35.1500      7.8300
+    474.3000   1489.8100     35.1500      7.8300
+    475.0000   1489.8000     35.1500      7.8200
+    475.6000   1489.7900     35.1500      7.8200
+    476.3000   1489.7700     35.1500      7.8100
+    476.9000   1489.7600     35.1500      7.8000
+    477.6000   1489.7600     35.1500      7.8000
+    478.2000   1489.7500     35.1500      7.8000
+    478.9000   1489.7400     35.1500      7.7900
+    479.6000   1489.7200     35.1500      7.7800
+    480.2000   1489.7200     35.1500      7.7800
+    480.9000   1489.7200     35.1500      7.7800
+    481.5000   1489.6900     35.1500      7.7600
+    482.2000   1489.6600     35.1500      7.7500
+    482.8000   1489.6400     35.1500      7.7500
+    483.5000   1489.6300     35.1500      7.7400
+    484.2000   1489.6300     35.1500      7.7400
+    484.8000   1489.6200     35.1500      7.7300
+    485.5000   1489.6000     35.1500      7.7200
+    486.1000   1489.5700     35.1500      7.7100
+    486.8000   1489.5300     35.1500      7.7000
+    487.4000   1489.5300     35.1500      7.7000
+    488.1000   1489.5100     35.1500      7.6900
+    488.7000   1489.4900     35.1500      7.6800
+    489.4000   1489.4800     35.1500      7.6700
+    490.1000   1489.4500     35.1500      7.6700
+    490.7000   1489.4300     35.1500      7.6600
+    491.4000   1489.4200     35.1500      7.6500
+    492.0000   1489.4000     35.1500      7.6400
+    492.7000   1489.4000     35.1500      7.6400
+    493.3000   1489.3800     35.1500      7.6300
+    494.0000   1489.3600     35.1500      7.6200
+    494.6000   1489.3300     35.1500      7.6100
+    495.3000   1489.3000     35.1500      7.6000
+    496.0000   1489.2900     35.1500      7.6000
+    496.6000   1489.2700     35.1500      7.5900
+    497.3000   1489.2500     35.1500      7.5800
+    497.9000   1489.2400     35.1500      7.5800
+    498.6000   1489.2400     35.1500      7.5700
+    499.2000   1489.2400     35.1500      7.5700
+    499.9000   1489.2300     35.1500      7.5600
+    500.6000   1489.2100     35.1500      7.5600
+    501.2000   1489.1700     35.1500      7.5400
+    501.9000   1489.1300     35.1500      7.5300
+    502.5000   1489.1100     35.1500      7.5200
+    503.2000   1489.1100     35.1500      7.5200
+    503.8000   1489.1200     35.1500      7.5200
+    504.5000   1489.1200     35.1500      7.5200
+    505.1000   1489.1300     35.1500      7.5100
+    505.8000   1489.1200     35.1500      7.5100
+    506.5000   1489.1200     35.1500      7.5100
+    507.1000   1489.1200     35.1500      7.5100
+    507.8000   1489.1300     35.1500      7.5000
+    508.4000   1489.1200     35.1500      7.5000
+    509.1000   1489.1200     35.1500      7.5000
+    509.7000   1489.1200     35.1500      7.4900
+    510.4000   1489.1300     35.1500      7.4900
+    511.0000   1489.1300     35.1500      7.4900
+    511.7000   1489.1200     35.1500      7.4800
+    512.3000   1489.1100     35.1500      7.4800
+    513.0000   1489.1100     35.1500      7.4800
+    513.7000   1489.1100     35.1500      7.4700
+    514.3000   1489.1000     35.1500      7.4700
+    515.0000   1489.0600     35.1500      7.4600
+    515.6000   1489.0300     35.1500      7.4400
+    516.3000   1489.0100     35.1500      7.4400
+    516.9000   1489.0000     35.1500      7.4300
+    517.6000   1489.0100     35.1500      7.4300
+    518.2000   1489.0100     35.1500      7.4300
+    518.9000   1489.0100     35.1500      7.4200
+    519.5000   1489.0100     35.1500      7.4200
+    520.2000   1489.0200     35.1500      7.4200
+    520.9000   1489.0100     35.1500      7.4200
+    521.5000   1489.0100     35.1500      7.4100
+    522.2000   1489.0000     35.1500      7.4100
+    522.8000   1488.9900     35.1500      7.4000
+    523.5000   1488.9700     35.1500      7.4000
+    524.1000   1488.9500     35.1500      7.3900
+    524.8000   1488.9400     35.1500      7.3800
+    525.4000   1488.9100     35.1500      7.3700
+    526.1000   1488.8600     35.1500      7.3600
+    526.7000   1488.8200     35.1500      7.3400
+    527.4000   1488.8000     35.1500      7.3300
+    528.1000   1488.7500     35.1500      7.3200
+    528.7000   1488.6900     35.1500      7.3000
+    529.4000   1488.6600     35.1500      7.2900
+    530.0000   1488.6300     35.1500      7.2800
+    530.7000   1488.5900     35.1500      7.2600
+    531.3000   1488.5300     35.1500      7.2500
+    532.0000   1488.4900     35.1500      7.2300
+    532.6000   1488.4700     35.1500      7.2300
+    533.3000   1488.4700     35.1500      7.2200
+    533.9000   1488.4700     35.1500      7.2200
+    534.6000   1488.4800     35.1500      7.2200
+    535.2000   1488.4800     35.1500      7.2200
+    535.9000   1488.4800     35.1500      7.2100
+    536.6000   1488.4800     35.1500      7.2100
+    537.2000   1488.4900     35.1500      7.2100
+    537.9000   1488.4700     35.1500      7.2000
+    538.5000   1488.4300     35.1500      7.1900
+    539.2000   1488.4300     35.1500      7.1900
+    539.8000   1488.4100     35.1500      7.1800
+    540.5000   1488.3900     35.1500      7.1700
+    541.1000   1488.3500     35.1500      7.1600
+    541.8000   1488.2600     35.1500      7.1300
+    542.4000   1488.1900     35.1500      7.1100
+    543.1000   1488.1200     35.1500      7.0900
+    543.7000   1488.0500     35.1500      7.0700
+    544.4000   1488.0000     35.1500      7.0500
+    545.0000   1487.9700     35.1500      7.0400
+    545.7000   1487.9500     35.1500      7.0400
+    546.4000   1487.9400     35.1500      7.0300
+    547.0000   1487.9500     35.1500      7.0300
+    547.7000   1487.9600     35.1500      7.0300
+    548.3000   1487.9700     35.1500      7.0300
+    549.0000   1487.9700     35.1500      7.0300
+    549.6000   1487.9900     35.1500      7.0300
+    550.3000   1487.9900     35.1500      7.0300
+    550.9000   1488.0100     35.1500      7.0300
+    551.6000   1488.0200     35.1500      7.0300
+    552.2000   1488.0200     35.1500      7.0300
+    552.9000   1488.0300     35.1500      7.0200
+    553.5000   1488.0600     35.1500      7.0300
+    554.2000   1488.0700     35.1500      7.0300
+    554.8000   1488.0800     35.1500      7.0300
+    555.5000   1488.1000     35.1500      7.0300
+    556.1000   1488.1100     35.1500      7.0300
+    556.8000   1488.1200     35.1500      7.0300
+    557.4000   1488.1300     35.1500      7.0300
+    558.1000   1488.1400     35.1500      7.0300
+    558.8000   1488.1400     35.1500      7.0300
+    559.4000   1488.1300     35.1500      7.0200
+    560.1000   1488.1200     35.1500      7.0200
+    560.7000   1488.1100     35.1500      7.0100
+    561.4000   1488.1000     35.1500      7.0100
+    562.0000   1488.1100     35.1500      7.0100
+    562.7000   1488.1200     35.1500      7.0100
+    563.3000   1488.1000     35.1500      7.0000
+    564.0000   1488.0900     35.1500      6.9900
+    564.6000   1488.0900     35.1500      6.9900
+    565.3000   1488.0900     35.1500      6.9900
+    565.9000   1488.0900     35.1500      6.9800
+    566.6000   1488.0700     35.1500      6.9800
+    567.2000   1488.0600     35.1500      6.9700
+    567.9000   1488.0300     35.1500      6.9600
+    568.5000   1488.0000     35.1500      6.9500
+    569.2000   1487.9500     35.1500      6.9400
+    569.8000   1487.9000     35.1500      6.9200
+    570.5000   1487.8600     35.1500      6.9100
+    571.1000   1487.8400     35.1500      6.9000
+    571.8000   1487.8300     35.1500      6.8900
+    572.4000   1487.8100     35.1500      6.8800
+    573.1000   1487.8000     35.1500      6.8800
+    573.7000   1487.7900     35.1500      6.8800
+    574.4000   1487.7900     35.1500      6.8700
+    575.1000   1487.7900     35.1500      6.8700
+    575.7000   1487.7800     35.1500      6.8600
+    576.4000   1487.7700     35.1500      6.8600
+    577.0000   1487.7700     35.1500      6.8600
+    577.7000   1487.7700     35.1500      6.8500
+    578.3000   1487.7700     35.1500      6.8500
+    579.0000   1487.7600     35.1500      6.8400
+    579.6000   1487.7500     35.1500      6.8400
+    580.3000   1487.7500     35.1500      6.8400
+    580.9000   1487.7600     35.1500      6.8400
+    581.6000   1487.7600     35.1500      6.8300
+    582.2000   1487.7700     35.1500      6.8300
+    582.9000   1487.7800     35.1500      6.8300
+    583.5000   1487.7800     35.1500      6.8300
+    584.2000   1487.7600     35.1500      6.8200
+    584.8000   1487.7200     35.1500      6.8100
+    585.5000   1487.6600     35.1500      6.7900
+    586.1000   1487.5800     35.1500      6.7700
+    586.8000   1487.4900     35.1500      6.7400
+    587.4000   1487.3900     35.1500      6.7100
+    588.1000   1487.3300     35.1500      6.7000
+    588.7000   1487.2900     35.1500      6.6800
+    589.4000   1487.2600     35.1500      6.6700
+    590.0000   1487.2200     35.1500      6.6600
+    590.7000   1487.1900     35.1500      6.6500
+    591.3000   1487.1700     35.1500      6.6400
+    592.0000   1487.1400     35.1500      6.6300
+    592.6000   1487.1000     35.1500      6.6200
+    593.3000   1487.0800     35.1500      6.6100
+    593.9000   1487.0700     35.1500      6.6000
+    594.6000   1487.0500     35.1500      6.6000
+    595.2000   1487.0400     35.1500      6.5900
+    595.9000   1487.0200     35.1500      6.5800
+    596.5000   1486.9600     35.1500      6.5600
+    597.2000   1486.9200     35.1500      6.5500
+    597.8000   1486.9000     35.1500      6.5400
+    598.5000   1486.8900     35.1500      6.5400
+    599.1000   1486.8800     35.1500      6.5300
+    599.8000   1486.8800     35.1500      6.5300
+    600.4000   1486.8700     35.1500      6.5300
+    601.1000   1486.8600     35.1500      6.5200
+    601.7000   1486.8600     35.1500      6.5200
+    602.4000   1486.8300     35.1500      6.5100
+    603.0000   1486.8200     35.1500      6.5000
+    603.7000   1486.8000     35.1500      6.4900
+    604.3000   1486.7900     35.1500      6.4900
+    605.0000   1486.7800     35.1500      6.4800
+    605.6000   1486.7800     35.1500      6.4800
+    606.3000   1486.7800     35.1500      6.4800
+    606.9000   1486.7900     35.1500      6.4800
+    607.6000   1486.7800     35.1500      6.4700
+    608.2000   1486.7800     35.1500      6.4700
+    608.9000   1486.7800     35.1500      6.4700
+    609.5000   1486.7700     35.1500      6.4600
+    610.2000   1486.7700     35.1500      6.4600
+    610.8000   1486.7800     35.1500      6.4600
+    611.5000   1486.7900     35.1500      6.4600
+    612.1000   1486.7900     35.1500      6.4600
+    612.8000   1486.8000     35.1500      6.4500
+    613.4000   1486.8000     35.1500      6.4500
+    614.1000   1486.8100     35.1500      6.4500
+    614.7000   1486.8200     35.1500      6.4500
+    615.4000   1486.8100     35.1500      6.4500
+    616.0000   1486.8200     35.1500      6.4500
+    616.7000   1486.8200     35.1500      6.4400
+    617.3000   1486.8100     35.1500      6.4400
+    618.0000   1486.8100     35.1500      6.4400
+    618.6000   1486.8300     35.1500      6.4400
+    619.3000   1486.8300     35.1500      6.4400
+    619.9000   1486.8300     35.1500      6.4300
+    620.6000   1486.8100     35.1500      6.4200
+    621.2000   1486.8000     35.1500      6.4200
+    621.9000   1486.7800     35.1500      6.4100
+    622.5000   1486.7800     35.1500      6.4100
+    623.2000   1486.7800     35.1500      6.4100
+    623.8000   1486.7900     35.1500      6.4100
+    624.5000   1486.8000     35.1500      6.4100
+    625.1000   1486.8000     35.1500      6.4000
+    625.8000   1486.8100     35.1500      6.4000
+    626.4000   1486.8100     35.1500      6.4000
+    627.0000   1486.8100     35.1500      6.4000
+    627.7000   1486.7900     35.1500      6.3900
+    628.3000   1486.7800     35.1500      6.3800
+    629.0000   1486.7600     35.1500      6.3800
+    629.6000   1486.7500     35.1500      6.3700
+    630.3000   1486.7500     35.1500      6.3700
+    630.9000   1486.7500     35.1500      6.3700
+    631.6000   1486.7400     35.1500      6.3600
+    632.2000   1486.7400     35.1500      6.3600
+    632.9000   1486.7400     35.1500      6.3600
+    633.5000   1486.7400     35.1500      6.3500
+    634.2000   1486.7400     35.1500      6.3500
+    634.8000   1486.7600     35.1500      6.3500
+    635.5000   1486.7700     35.1500      6.3500
+    636.1000   1486.7800     35.1500      6.3500
+    636.8000   1486.7700     35.1500      6.3500
+    637.4000   1486.7600     35.1500      6.3400
+    638.1000   1486.7700     35.1500      6.3400
+    638.7000   1486.7700     35.1500      6.3400
+    639.4000   1486.7900     35.1500      6.3400
+    640.0000   1486.7900     35.1500      6.3400
+    640.7000   1486.7900     35.1500      6.3400
+    641.3000   1486.7900     35.1500      6.3300
+    642.0000   1486.8000     35.1500      6.3300
+    642.6000   1486.8100     35.1500      6.3300
+    643.2000   1486.8200     35.1500      6.3300
+    643.9000   1486.8400     35.1500      6.3300
+    644.5000   1486.8300     35.1500      6.3300
+    645.2000   1486.8400     35.1500      6.3300
+    645.8000   1486.8300     35.1500      6.3200
+    646.5000   1486.7900     35.1500      6.3100
+    647.1000   1486.7700     35.1500      6.3000
+    647.8000   1486.7700     35.1500      6.3000
+    648.4000   1486.7700     35.1500      6.3000
+    649.1000   1486.7800     35.1500      6.3000
+    649.7000   1486.7900     35.1500      6.3000
+    650.4000   1486.7800     35.1500      6.2900
+    651.0000   1486.7800     35.1500      6.2900
+    651.7000   1486.7700     35.1500      6.2800
+    652.3000   1486.7700     35.1500      6.2800
+    653.0000   1486.7900     35.1500      6.2800
+    653.6000   1486.8000     35.1500      6.2800
+    654.3000   1486.8100     35.1500      6.2800
+    654.9000   1486.8200     35.1500      6.2800
+    655.5000   1486.8200     35.1500      6.2800
+    656.2000   1486.8300     35.1500      6.2800
+    656.8000   1486.8400     35.1500      6.2800
+    657.5000   1486.8600     35.1500      6.2800
+    658.1000   1486.8700     35.1500      6.2800
+    658.8000   1486.8600     35.1500      6.2800
+    659.4000   1486.8400     35.1500      6.2700
+    660.1000   1486.8300     35.1500      6.2600
+    660.7000   1486.8200     35.1500      6.2600
+    661.4000   1486.8100     35.1500      6.2500
+    662.0000   1486.7900     35.1500      6.2500
+    662.7000   1486.7800     35.1500      6.2400
+    663.3000   1486.7400     35.1500      6.2300
+    664.0000   1486.7200     35.1500      6.2200
+    664.6000   1486.7100     35.1500      6.2100
+    665.2000   1486.7100     35.1500      6.2100
+    665.9000   1486.7100     35.1500      6.2100
+    666.5000   1486.7200     35.1500      6.2100
+    667.2000   1486.7200     35.1500      6.2100
+    667.8000   1486.7300     35.1500      6.2100
+    668.5000   1486.7400     35.1500      6.2100
+    669.1000   1486.7400     35.1500      6.2000
+    669.8000   1486.7400     35.1500      6.2000
+    670.4000   1486.7400     35.1500      6.2000
+    671.1000   1486.7300     35.1500      6.1900
+    671.7000   1486.7400     35.1500      6.1900
+    672.4000   1486.7300     35.1500      6.1900
+    673.0000   1486.6900     35.1500      6.1800
+    673.6000   1486.6700     35.1500      6.1700
+    674.3000   1486.6600     35.1500      6.1600
+    674.9000   1486.6600     35.1500      6.1600
+    675.6000   1486.6600     35.1500      6.1600
+    676.2000   1486.6600     35.1500      6.1500
+    676.9000   1486.6600     35.1500      6.1500
+    677.5000   1486.6700     35.1500      6.1500
+    678.2000   1486.6800     35.1500      6.1500
+    678.8000   1486.6800     35.1500      6.1500
+    679.5000   1486.6900     35.1500      6.1500
+    680.1000   1486.6900     35.1500      6.1500
+    680.7000   1486.7000     35.1500      6.1500
+    681.4000   1486.7100     35.1500      6.1500
+    682.0000   1486.7200     35.1500      6.1400
+    682.7000   1486.7300     35.1500      6.1400
+    683.3000   1486.7400     35.1500      6.1400
+    684.0000   1486.7600     35.1500      6.1500
+    684.6000   1486.7600     35.1500      6.1400
+    685.3000   1486.7700     35.1500      6.1400
+    685.9000   1486.7900     35.1500      6.1500
+    686.6000   1486.8100     35.1500      6.1500
+    687.2000   1486.8100     35.1500      6.1500
+    687.8000   1486.7900     35.1500      6.1400
+    688.5000   1486.8100     35.1500      6.1400
+    689.1000   1486.8300     35.1500      6.1400
+    689.8000   1486.8300     35.1500      6.1400
+    690.4000   1486.8300     35.1500      6.1400
+    691.1000   1486.8400     35.1500      6.1400
+    691.7000   1486.8300     35.1500      6.1300
+    692.4000   1486.8300     35.1500      6.1300
+    693.0000   1486.8200     35.1500      6.1200
+    693.7000   1486.8300     35.1500      6.1200
+    694.3000   1486.8300     35.1500      6.1200
+    694.9000   1486.8300     35.1500      6.1200
+    695.6000   1486.8400     35.1500      6.1200
+    696.2000   1486.8500     35.1500      6.1200
+    696.9000   1486.8600     35.1500      6.1200
+    697.5000   1486.8800     35.1500      6.1200
+    698.2000   1486.8900     35.1500      6.1200
+    698.8000   1486.8800     35.1500      6.1100
+    699.5000   1486.8600     35.1500      6.1100
+    700.1000   1486.8600     35.1500      6.1100
+    700.7000   1486.8600     35.1500      6.1000
+    701.4000   1486.8500     35.1500      6.1000
+    702.0000   1486.8500     35.1500      6.0900
+    702.7000   1486.8600     35.1500      6.0900
+    703.3000   1486.8600     35.1500      6.0900
+    704.0000   1486.8600     35.1500      6.0900
+    704.6000   1486.8800     35.1500      6.0900
+    705.3000   1486.8800     35.1500      6.0900
+    705.9000   1486.8700     35.1500      6.0800
+    706.5000   1486.8500     35.1500      6.0700
+    707.2000   1486.8100     35.1500      6.0600
+    707.8000   1486.7900     35.1500      6.0500
+    708.5000   1486.7800     35.1500      6.0500
+    709.1000   1486.7800     35.1500      6.0500
+    709.8000   1486.7800     35.1500      6.0400
+    710.4000   1486.7700     35.1500      6.0400
+    711.0000   1486.7700     35.1500      6.0400
+    711.7000   1486.7600     35.1500      6.0300
+    712.3000   1486.7800     35.1500      6.0300
+    713.0000   1486.7900     35.1500      6.0300
+    713.6000   1486.7900     35.1500      6.0300
+    714.3000   1486.8000     35.1500      6.0300
+    714.9000   1486.8000     35.1500      6.0300
+    715.6000   1486.8000     35.1500      6.0300
+    716.2000   1486.8100     35.1500      6.0300
+    716.8000   1486.8200     35.1500      6.0300
+    717.5000   1486.8100     35.1500      6.0200
+    718.1000   1486.8100     35.1500      6.0200
+    718.8000   1486.7900     35.1500      6.0100
+    719.4000   1486.7600     35.1500      6.0000
+    720.1000   1486.7400     35.1500      5.9900
+    720.7000   1486.7300     35.1500      5.9900
+    721.3000   1486.7400     35.1500      5.9900
+    722.0000   1486.7300     35.1500      5.9800
+    722.6000   1486.7300     35.1500      5.9800
+    723.3000   1486.7300     35.1500      5.9800
+    723.9000   1486.7500     35.1500      5.9800
+    724.6000   1486.7600     35.1500      5.9800
+    725.2000   1486.7500     35.1500      5.9700
+    725.8000   1486.7600     35.1500      5.9700
+    726.5000   1486.7600     35.1500      5.9700
+    727.1000   1486.7700     35.1500      5.9700
+    727.8000   1486.7800     35.1500      5.9700
+    728.4000   1486.7900     35.1500      5.9700
+    729.1000   1486.8100     35.1500      5.9700
+    729.7000   1486.8100     35.1500      5.9700
+    730.3000   1486.8100     35.1500      5.9700
+    731.0000   1486.7800     35.1500      5.9600
+    731.6000   1486.7500     35.1500      5.9500
+    732.3000   1486.7000     35.1500      5.9300
+    732.9000   1486.6600     35.1500      5.9200
+    733.6000   1486.6400     35.1500      5.9100
+    734.2000   1486.6400     35.1500      5.9100
+    734.8000   1486.6300     35.1500      5.9000
+    735.5000   1486.6300     35.1500      5.9000
+    736.1000   1486.6200     35.1500      5.8900
+    736.8000   1486.6100     35.1500      5.8900
+    737.4000   1486.5700     35.1500      5.8800
+    738.1000   1486.5400     35.1500      5.8700
+    738.7000   1486.5200     35.1500      5.8600
+    739.3000   1486.5100     35.1500      5.8500
+    740.0000   1486.4700     35.1500      5.8400
+    740.6000   1486.4500     35.1500      5.8300
+    741.3000   1486.4300     35.1500      5.8300
+    741.9000   1486.4300     35.1500      5.8200
+    742.5000   1486.4300     35.1500      5.8200
+    743.2000   1486.4400     35.1500      5.8200
+    743.8000   1486.4500     35.1500      5.8200
+    744.5000   1486.4500     35.1500      5.8200
+    745.1000   1486.4600     35.1500      5.8200
+    745.8000   1486.4600     35.1500      5.8100
+    746.4000   1486.4700     35.1500      5.8100
+    747.0000   1486.4700     35.1500      5.8100
+    747.7000   1486.4700     35.1500      5.8100
+    748.3000   1486.4500     35.1500      5.8000
+    749.0000   1486.4300     35.1500      5.7900
+    749.6000   1486.4200     35.1500      5.7900
+    750.2000   1486.4200     35.1500      5.7900
+    750.9000   1486.4100     35.1500      5.7800
+    751.5000   1486.4100     35.1500      5.7800
+    752.2000   1486.4000     35.1500      5.7700
+    752.8000   1486.3700     35.1500      5.7600
+    753.5000   1486.3600     35.1500      5.7600
+    754.1000   1486.3400     35.1500      5.7500
+    754.7000   1486.3500     35.1500      5.7500
+    755.4000   1486.3600     35.1500      5.7500
+    756.0000   1486.3600     35.1500      5.7500
+    756.7000   1486.3700     35.1500      5.7500
+    757.3000   1486.3800     35.1500      5.7500
+    757.9000   1486.4000     35.1500      5.7500
+    758.6000   1486.4000     35.1500      5.7500
+    759.2000   1486.4100     35.1500      5.7500
+    759.9000   1486.4400     35.1500      5.7500
+    760.5000   1486.4300     35.1500      5.7500
+    761.2000   1486.4400     35.1500      5.7400
+    761.8000   1486.4500     35.1500      5.7500
+    762.4000   1486.4500     35.1500      5.7400
+    763.1000   1486.4600     35.1500      5.7400
+    763.7000   1486.4600     35.1500      5.7400
+    764.4000   1486.4500     35.1500      5.7300
+    765.0000   1486.4300     35.1500      5.7300
+    765.6000   1486.4300     35.1500      5.7200
+    766.3000   1486.4300     35.1500      5.7200
+    766.9000   1486.4300     35.1500      5.7200
+    767.6000   1486.4300     35.1500      5.7200
+    768.2000   1486.4300     35.1500      5.7100
+    768.8000   1486.4300     35.1500      5.7100
+    769.5000   1486.4400     35.1500      5.7100
+    770.1000   1486.4500     35.1500      5.7100
+    770.8000   1486.4600     35.1500      5.7100
+    771.4000   1486.4600     35.1500      5.7100
+    772.0000   1486.4600     35.1500      5.7000
+    772.7000   1486.4600     35.1500      5.7000
+    773.3000   1486.4600     35.1500      5.7000
+    774.0000   1486.4600     35.1500      5.7000
+    774.6000   1486.4600     35.1500      5.6900
+    775.2000   1486.4500     35.1500      5.6900
+    775.9000   1486.4500     35.1500      5.6900
+    776.5000   1486.4600     35.1500      5.6900
+    777.2000   1486.4600     35.1500      5.6800
+    777.8000   1486.4700     35.1500      5.6800
+    778.4000   1486.4700     35.1500      5.6800
+    779.1000   1486.4800     35.1500      5.6800
+    779.7000   1486.4800     35.1500      5.6800
+    780.4000   1486.4900     35.1500      5.6800
+    781.0000   1486.4900     35.1500      5.6700
+    781.6000   1486.4700     35.1500      5.6700
+    782.3000   1486.4500     35.1500      5.6600
+    782.9000   1486.4300     35.1500      5.6500
+    783.6000   1486.4000     35.1500      5.6400
+    784.2000   1486.3700     35.1500      5.6300
+    784.8000   1486.3500     35.1500      5.6300
+    785.5000   1486.3500     35.1500      5.6200
+    786.1000   1486.3500     35.1500      5.6200
+    786.8000   1486.3400     35.1500      5.6100
+    787.4000   1486.3600     35.1500      5.6200
+    788.0000   1486.3700     35.1500      5.6200
+    788.7000   1486.3800     35.1500      5.6200
+    789.3000   1486.3900     35.1500      5.6200
+    790.0000   1486.4000     35.1500      5.6200
+    790.6000   1486.4100     35.1500      5.6200
+    791.2000   1486.4200     35.1500      5.6200
+    791.9000   1486.4400     35.1500      5.6200
+    792.5000   1486.4500     35.1500      5.6200
+    793.2000   1486.4400     35.1500      5.6100
+    793.8000   1486.4700     35.1500      5.6200
+    794.4000   1486.4900     35.1500      5.6200
+    795.1000   1486.5000     35.1500      5.6200
+    795.7000   1486.5000     35.1500      5.6200
+    796.3000   1486.4900     35.1500      5.6100
+    797.0000   1486.4900     35.1500      5.6100
+    797.6000   1486.4900     35.1500      5.6100
+    798.3000   1486.4900     35.1500      5.6000
+    798.9000   1486.5000     35.1500      5.6000
+    799.5000   1486.5100     35.1500      5.6000
+    800.2000   1486.5000     35.1500      5.6000
+    800.8000   1486.4900     35.1500      5.6000
+    801.5000   1486.4900     35.1500      5.5900
+    802.1000   1486.4800     35.1500      5.5900
+    802.7000   1486.4900     35.1500      5.5800
+    803.4000   1486.4900     35.1500      5.5800
+    804.0000   1486.4800     35.1500      5.5800
+    804.7000   1486.4500     35.1500      5.5700
+    805.3000   1486.4400     35.1500      5.5600
+    805.9000   1486.4300     35.1500      5.5600
+    806.6000   1486.4300     35.1500      5.5500
+    807.2000   1486.4300     35.1500      5.5500
+    807.8000   1486.4400     35.1500      5.5500
+    808.5000   1486.4600     35.1500      5.5500
+    809.1000   1486.4700     35.1500      5.5600
+    809.8000   1486.4700     35.1500      5.5500
+    810.4000   1486.4800     35.1500      5.5500
+    811.0000   1486.4900     35.1500      5.5500
+    811.7000   1486.5000     35.1500      5.5500
+    812.3000   1486.5100     35.1500      5.5500
+    812.9000   1486.5200     35.1500      5.5500
+    813.6000   1486.5300     35.1500      5.5500
+    814.2000   1486.5500     35.1500      5.5500
+    814.9000   1486.5500     35.1500      5.5500
+    815.5000   1486.5500     35.1500      5.5500
+    816.1000   1486.5600     35.1500      5.5500
+    816.8000   1486.5700     35.1500      5.5500
+    817.4000   1486.5800     35.1500      5.5500
+    818.0000   1486.5900     35.1500      5.5500
+    818.7000   1486.5900     35.1500      5.5500
+    819.3000   1486.6100     35.1500      5.5500
+    820.0000   1486.6100     35.1500      5.5500
+    820.6000   1486.6200     35.1500      5.5400
+    821.2000   1486.6200     35.1500      5.5400
+    821.9000   1486.6200     35.1500      5.5400
+    822.5000   1486.6300     35.1500      5.5400
+    823.2000   1486.6300     35.1500      5.5400
+    823.8000   1486.6300     35.1500      5.5300
+    824.4000   1486.6300     35.1500      5.5300
+    825.1000   1486.6200     35.1500      5.5300
+    825.7000   1486.6100     35.1500      5.5200
+    826.3000   1486.6000     35.1500      5.5200
+    827.0000   1486.5800     35.1500      5.5100
+    827.6000   1486.5600     35.1500      5.5000
+    828.2000   1486.5600     35.1500      5.5000
+    828.9000   1486.5700     35.1500      5.5000
+    829.5000   1486.5900     35.1500      5.5000
+    830.2000   1486.6000     35.1500      5.5000
+    830.8000   1486.6000     35.1500      5.5000
+    831.4000   1486.5900     35.1500      5.4900
+    832.1000   1486.5700     35.1500      5.4800
+    832.7000   1486.5200     35.1500      5.4700
+    833.3000   1486.4900     35.1500      5.4600
+    834.0000   1486.4700     35.1500      5.4500
+    834.6000   1486.4700     35.1500      5.4500
+    835.3000   1486.4600     35.1500      5.4400
+    835.9000   1486.4500     35.1500      5.4400
+    836.5000   1486.4300     35.1500      5.4300
+    837.2000   1486.4000     35.1500      5.4200
+    837.8000   1486.3700     35.1500      5.4100
+    838.4000   1486.3500     35.1500      5.4000
+    839.1000   1486.3500     35.1500      5.4000
+    839.7000   1486.3500     35.1500      5.4000
+    840.3000   1486.3400     35.1500      5.3900
+    841.0000   1486.3300     35.1500      5.3900
+    841.6000   1486.3200     35.1500      5.3800
+    842.3000   1486.3100     35.1500      5.3800
+    842.9000   1486.3100     35.1500      5.3800
+    843.5000   1486.3200     35.1500      5.3800
+    844.2000   1486.3100     35.1500      5.3700
+    844.8000   1486.3100     35.1500      5.3700
+    845.4000   1486.3100     35.1500      5.3600
+    846.1000   1486.3200     35.1500      5.3600
+    846.7000   1486.3300     35.1500      5.3700
+    847.3000   1486.3300     35.1500      5.3600
+    848.0000   1486.3200     35.1500      5.3600
+    848.6000   1486.3200     35.1500      5.3500
+    849.3000   1486.3200     35.1500      5.3500
+    849.9000   1486.3100     35.1500      5.3500
+    850.5000   1486.2900     35.1500      5.3400
+    851.2000   1486.2600     35.1500      5.3300
+    851.8000   1486.2400     35.1500      5.3200
+    852.4000   1486.2300     35.1500      5.3200
+    853.1000   1486.2200     35.1500      5.3100
+    853.7000   1486.2200     35.1500      5.3100
+    854.3000   1486.2200     35.1500      5.3100
+    855.0000   1486.2400     35.1500      5.3100
+    855.6000   1486.2400     35.1500      5.3100
+    856.2000   1486.2600     35.1500      5.3100
+    856.9000   1486.2700     35.1500      5.3100
+    857.5000   1486.2700     35.1500      5.3100
+    858.2000   1486.2900     35.1500      5.3100
+    858.8000   1486.2800     35.1500      5.3000
+    859.4000   1486.2600     35.1500      5.3000
+    860.1000   1486.2600     35.1500      5.2900
+    860.7000   1486.2500     35.1500      5.2900
+    861.3000   1486.2500     35.1500      5.2900
+    862.0000   1486.2600     35.1500      5.2800
+    862.6000   1486.2500     35.1500      5.2800
+    863.2000   1486.2400     35.1500      5.2800
+    863.9000   1486.2300     35.1500      5.2700
+    864.5000   1486.2300     35.1500      5.2700
+    865.1000   1486.2300     35.1500      5.2600
+    865.8000   1486.2200     35.1500      5.2600
+    866.4000   1486.2300     35.1500      5.2600
+    867.0000   1486.2400     35.1500      5.2600
+    867.7000   1486.2400     35.1500      5.2600
+    868.3000   1486.2500     35.1500      5.2600
+    868.9000   1486.2600     35.1500      5.2600
+    869.6000   1486.2700     35.1500      5.2600
+    870.2000   1486.2900     35.1500      5.2600
+    870.9000   1486.2900     35.1500      5.2600
+    871.5000   1486.3000     35.1500      5.2600
+    872.1000   1486.3200     35.1500      5.2600
+    872.8000   1486.3300     35.1500      5.2600
+    873.4000   1486.3500     35.1500      5.2600
+    874.0000   1486.3400     35.1500      5.2600
+    874.7000   1486.3400     35.1500      5.2500
+    875.3000   1486.3500     35.1500      5.2500
+    875.9000   1486.3500     35.1500      5.2500
+    876.6000   1486.3500     35.1500      5.2500
+    877.2000   1486.3600     35.1500      5.2500
+    877.8000   1486.3500     35.1500      5.2400
+    878.5000   1486.3500     35.1500      5.2400
+    879.1000   1486.3600     35.1500      5.2400
+    879.7000   1486.3600     35.1500      5.2400
+    880.4000   1486.3600     35.1500      5.2300
+    881.0000   1486.3600     35.1500      5.2300
+    881.6000   1486.3700     35.1500      5.2300
+    882.3000   1486.3800     35.1500      5.2300
+    882.9000   1486.3800     35.1500      5.2300
+    883.5000   1486.3900     35.1500      5.2300
+    884.2000   1486.4000     35.1500      5.2300
+    884.8000   1486.4000     35.1500      5.2300
+    885.4000   1486.4000     35.1500      5.2200
+    886.1000   1486.3900     35.1500      5.2200
+    886.7000   1486.3700     35.1500      5.2100
+    887.3000   1486.3500     35.1500      5.2100
+    888.0000   1486.3200     35.1500      5.1900
+    888.6000   1486.3100     35.1500      5.1900
+    889.2000   1486.3100     35.1500      5.1900
+    889.9000   1486.3000     35.1500      5.1800
+    890.5000   1486.3200     35.1500      5.1800
+    891.1000   1486.3200     35.1500      5.1800
+    891.8000   1486.3200     35.1500      5.1800
+    892.4000   1486.3200     35.1500      5.1800
+    893.0000   1486.3100     35.1500      5.1700
+    893.7000   1486.3200     35.1500      5.1700
+    894.3000   1486.3200     35.1500      5.1700
+    894.9000   1486.3300     35.1500      5.1700
+    895.6000   1486.3500     35.1500      5.1700
+    896.2000   1486.3500     35.1500      5.1700
+    896.8000   1486.3500     35.1500      5.1700
+    897.5000   1486.3500     35.1500      5.1600
+    898.1000   1486.3600     35.1500      5.1600
+    898.7000   1486.3500     35.1500      5.1600
+    899.4000   1486.3300     35.1500      5.1500
+    900.0000   1486.3200     35.1500      5.1400
+    900.6000   1486.3100     35.1500      5.1400
+    901.3000   1486.2900     35.1500      5.1300
+    901.9000   1486.2700     35.1500      5.1300
+    902.5000   1486.2700     35.1500      5.1200
+    903.2000   1486.2700     35.1500      5.1200
+    903.8000   1486.2700     35.1500      5.1200
+    904.4000   1486.2800     35.1500      5.1200
+    905.1000   1486.2800     35.1500      5.1100
+    905.7000   1486.2800     35.1500      5.1100
+    906.3000   1486.2800     35.1500      5.1100
+    907.0000   1486.2800     35.1500      5.1100
+    907.6000   1486.2800     35.1500      5.1000
+    908.2000   1486.2500     35.1500      5.0900
+    908.9000   1486.2200     35.1500      5.0800
+    909.5000   1486.2100     35.1500      5.0800
+    910.1000   1486.1900     35.1500      5.0700
+    910.8000   1486.1700     35.1500      5.0600
+    911.4000   1486.1700     35.1500      5.0600
+    912.0000   1486.1800     35.1500      5.0600
+    912.7000   1486.1700     35.1500      5.0600
+    913.3000   1486.1800     35.1500      5.0500
+    913.9000   1486.1800     35.1500      5.0500
+    914.6000   1486.1700     35.1500      5.0500
+    915.2000   1486.1800     35.1500      5.0500
+    915.8000   1486.1800     35.1500      5.0500
+    916.5000   1486.2000     35.1500      5.0500
+    917.1000   1486.2100     35.1500      5.0500
+    917.7000   1486.2200     35.1500      5.0500
+    918.4000   1486.2300     35.1500      5.0500
+    919.0000   1486.2400     35.1500      5.0500
+    919.6000   1486.2600     35.1500      5.0500
+    920.2000   1486.2600     35.1500      5.0500
+    920.9000   1486.2600     35.1500      5.0500
+    921.5000   1486.2700     35.1500      5.0400
+    922.1000   1486.2500     35.1500      5.0400
+    922.8000   1486.2400     35.1500      5.0300
+    923.4000   1486.2300     35.1500      5.0300
+    924.0000   1486.2200     35.1500      5.0200
+    924.7000   1486.2300     35.1500      5.0200
+    925.3000   1486.2200     35.1500      5.0200
+    925.9000   1486.2200     35.1500      5.0200
+    926.6000   1486.2300     35.1500      5.0200
+    927.2000   1486.2500     35.1500      5.0200
+    927.8000   1486.2500     35.1500      5.0100
+    928.5000   1486.2400     35.1500      5.0100
+    929.1000   1486.2200     35.1500      5.0000
+    929.7000   1486.2000     35.1500      4.9900
+    930.4000   1486.1800     35.1500      4.9900
+    931.0000   1486.1800     35.1500      4.9800
+    931.6000   1486.1600     35.1500      4.9800
+    932.2000   1486.1400     35.1500      4.9700
+    932.9000   1486.1300     35.1500      4.9600
+    933.5000   1486.1200     35.1500      4.9600
+    934.1000   1486.1200     35.1500      4.9600
+    934.8000   1486.1100     35.1500      4.9500
+    935.4000   1486.1000     35.1500      4.9500
+    936.0000   1486.1100     35.1500      4.9500
+    936.7000   1486.1100     35.1500      4.9400
+    937.3000   1486.1000     35.1500      4.9400
+    937.9000   1486.1100     35.1500      4.9400
+    938.6000   1486.1300     35.1500      4.9400
+    939.2000   1486.1300     35.1500      4.9400
+    939.8000   1486.1400     35.1500      4.9400
+    940.4000   1486.1500     35.1500      4.9400
+    941.1000   1486.1700     35.1500      4.9400
+    941.7000   1486.1800     35.1500      4.9400
+    942.3000   1486.1700     35.1500      4.9400
+    943.0000   1486.1900     35.1500      4.9400
+    943.6000   1486.2000     35.1500      4.9400
+    944.2000   1486.2000     35.1500      4.9300
+    944.9000   1486.2000     35.1500      4.9300
+    945.5000   1486.1900     35.1500      4.9300
+    946.1000   1486.2000     35.1500      4.9300
+    946.8000   1486.2100     35.1500      4.9300
+    947.4000   1486.2000     35.1500      4.9200
+    948.0000   1486.2000     35.1500      4.9200
+    948.6000   1486.1900     35.1500      4.9200
+    949.3000   1486.2000     35.1500      4.9200
+    949.9000   1486.2000     35.1500      4.9100
+    950.5000   1486.2000     35.1500      4.9100
+    951.2000   1486.1900     35.1500      4.9000
+    951.8000   1486.1900     35.1500      4.9000
+    952.4000   1486.1900     35.1500      4.9000
+    953.1000   1486.1800     35.1500      4.9000
+    953.7000   1486.1900     35.1500      4.8900
+    954.3000   1486.2000     35.1500      4.8900
+    954.9000   1486.1900     35.1500      4.8900
+    955.6000   1486.1700     35.1500      4.8800
+    956.2000   1486.1500     35.1500      4.8700
+    956.8000   1486.1500     35.1500      4.8700
+    957.5000   1486.1500     35.1500      4.8700
+    958.1000   1486.1400     35.1500      4.8600
+    958.7000   1486.1600     35.1500      4.8700
+    959.4000   1486.1500     35.1500      4.8600
+    960.0000   1486.1600     35.1500      4.8600
+    960.6000   1486.1600     35.1500      4.8600
+    961.2000   1486.1700     35.1500      4.8600
+    961.9000   1486.1700     35.1500      4.8600
+    962.5000   1486.1900     35.1500      4.8600
+    963.1000   1486.1900     35.1500      4.8600
+    963.8000   1486.1800     35.1500      4.8500
+    964.4000   1486.1700     35.1500      4.8500
+    965.0000   1486.1700     35.1500      4.8400
+    965.6000   1486.1700     35.1500      4.8400
+    966.3000   1486.1800     35.1500      4.8400
+    966.9000   1486.1800     35.1500      4.8400
+    967.5000   1486.1700     35.1500      4.8300
+    968.2000   1486.1600     35.1500      4.8300
+    968.8000   1486.1600     35.1500      4.8300
+    969.4000   1486.1500     35.1500      4.8200
+    970.0000   1486.1500     35.1500      4.8200
+    970.7000   1486.1600     35.1500      4.8200
+    971.3000   1486.1500     35.1500      4.8100
+    971.9000   1486.1600     35.1500      4.8100
+    972.6000   1486.1600     35.1500      4.8100
+    973.2000   1486.1600     35.1500      4.8100
+    973.8000   1486.1700     35.1500      4.8100
+    974.5000   1486.1700     35.1500      4.8100
+    975.1000   1486.1700     35.1500      4.8000
+    975.7000   1486.1700     35.1500      4.8000
+    976.3000   1486.1800     35.1500      4.8000
+    977.0000   1486.1900     35.1500      4.8000
+    977.6000   1486.1800     35.1500      4.8000
+    978.2000   1486.1800     35.1500      4.7900
+    978.9000   1486.1800     35.1500      4.7900
+    979.5000   1486.1700     35.1500      4.7900
+    980.1000   1486.1700     35.1500      4.7800
+    980.7000   1486.1800     35.1500      4.7800
+    981.4000   1486.1800     35.1500      4.7800
+    982.0000   1486.2000     35.1500      4.7800
+    982.6000   1486.2100     35.1500      4.7800
+    983.2000   1486.2000     35.1500      4.7800
+    983.9000   1486.2300     35.1500      4.7800
+    984.5000   1486.2500     35.1500      4.7800
+    985.1000   1486.2700     35.1500      4.7900
+    985.8000   1486.2700     35.1500      4.7800
+    986.4000   1486.2800     35.1500      4.7800
+    987.0000   1486.2900     35.1500      4.7800
+    987.6000   1486.3000     35.1500      4.7800
+    988.3000   1486.3000     35.1500      4.7800
+    988.9000   1486.3000     35.1500      4.7800
+    989.5000   1486.3100     35.1500      4.7800
+    990.2000   1486.3100     35.1500      4.7800
+    990.8000   1486.3000     35.1500      4.7700
+    991.4000   1486.3000     35.1500      4.7700
+    992.0000   1486.3000     35.1500      4.7700
+    992.7000   1486.3000     35.1500      4.7600
+    993.3000   1486.3000     35.1500      4.7600
+    993.9000   1486.2900     35.1500      4.7600
+    994.6000   1486.2700     35.1500      4.7500
+    995.2000   1486.2600     35.1500      4.7400
+    995.8000   1486.2600     35.1500      4.7400
+    996.4000   1486.2600     35.1500      4.7400
+    997.1000   1486.2600     35.1500      4.7400
+    997.7000   1486.2600     35.1500      4.7300
+    998.3000   1486.2700     35.1500      4.7300
+    998.9000   1486.2800     35.1500      4.7300
+    999.6000   1486.2700     35.1500      4.7300
+   1000.2000   1486.2800     35.1500      4.7300
+   1000.8000   1486.2900     35.1500      4.7300
+   1001.5000   1486.3000     35.1500      4.7300
+   1002.1000   1486.3000     35.1500      4.7300
+   1002.7000   1486.3000     35.1500      4.7200
+   1003.3000   1486.3100     35.1500      4.7200
+   1004.0000   1486.2900     35.1500      4.7100
+   1004.6000   1486.2600     35.1500      4.7100
+   1005.2000   1486.2800     35.1500      4.7100
+   1005.8000   1486.2700     35.1500      4.7000
+   1006.5000   1486.2800     35.1500      4.7000
+   1007.1000   1486.2700     35.1500      4.7000
+   1007.7000   1486.2600     35.1500      4.6900
+   1008.3000   1486.2500     35.1500      4.6900
+   1009.0000   1486.2400     35.1500      4.6800
+   1009.6000   1486.2400     35.1500      4.6800
+   1010.2000   1486.2300     35.1500      4.6700
+   1010.9000   1486.2200     35.1500      4.6700
+   1011.5000   1486.2200     35.1500      4.6700
+   1012.1000   1486.2300     35.1500      4.6700
+   1012.7000   1486.2300     35.1500      4.6700
+   1013.4000   1486.2500     35.1500      4.6700
+   1014.0000   1486.2400     35.1500      4.6600
+   1014.6000   1486.2400     35.1500      4.6600
+   1015.2000   1486.2500     35.1500      4.6600
+   1015.9000   1486.2600     35.1500      4.6600
+   1016.5000   1486.2700     35.1500      4.6600
+   1017.1000   1486.2600     35.1500      4.6600
+   1017.7000   1486.2600     35.1500      4.6500
+   1018.4000   1486.2400     35.1500      4.6500
+   1019.0000   1486.2500     35.1500      4.6400
+   1019.6000   1486.2400     35.1500      4.6400
+   1020.3000   1486.2400     35.1500      4.6400
+   1020.9000   1486.2300     35.1500      4.6300
+   1021.5000   1486.2100     35.1500      4.6200
+   1022.1000   1486.2000     35.1500      4.6200
+   1022.8000   1486.1900     35.1500      4.6200
+   1023.4000   1486.1800     35.1500      4.6100
+   1024.0000   1486.1700     35.1500      4.6000
+   1024.6000   1486.1700     35.1500      4.6000
+   1025.3000   1486.1700     35.1500      4.6000
+   1025.9000   1486.1600     35.1500      4.5900
+   1026.5000   1486.1400     35.1500      4.5900
+   1027.1000   1486.0900     35.1500      4.5700
+   1027.8000   1486.0800     35.1500      4.5700
+   1028.4000   1486.0800     35.1500      4.5700
+   1029.0000   1486.0700     35.1500      4.5600
+   1029.6000   1486.0800     35.1500      4.5600
+   1030.3000   1486.0800     35.1500      4.5600
+   1030.9000   1486.0900     35.1500      4.5600
+   1031.5000   1486.1000     35.1500      4.5600
+   1032.1000   1486.1100     35.1500      4.5600
+   1032.8000   1486.1100     35.1500      4.5500
+   1033.4000   1486.1200     35.1500      4.5500
+   1034.0000   1486.1200     35.1500      4.5500
+   1034.6000   1486.1200     35.1500      4.5500
+   1035.3000   1486.1200     35.1500      4.5500
+   1035.9000   1486.1300     35.1500      4.5500
+   1036.5000   1486.1400     35.1500      4.5500
+   1037.1000   1486.1500     35.1500      4.5500
+   1037.8000   1486.1600     35.1500      4.5500
+   1038.4000   1486.1700     35.1500      4.5500
+   1039.0000   1486.1700     35.1500      4.5400
+   1039.6000   1486.1800     35.1500      4.5400
+   1040.3000   1486.2000     35.1500      4.5500
+   1040.9000   1486.2100     35.1500      4.5500
+   1041.5000   1486.2200     35.1500      4.5400
+   1042.1000   1486.2200     35.1500      4.5400
+   1042.8000   1486.2300     35.1500      4.5400
+   1043.4000   1486.2400     35.1500      4.5400
+   1044.0000   1486.2400     35.1500      4.5400
+   1044.6000   1486.2400     35.1500      4.5400
+   1045.3000   1486.2300     35.1500      4.5300
+   1045.9000   1486.2200     35.1500      4.5300
+   1046.5000   1486.2200     35.1500      4.5300
+   1047.1000   1486.2300     35.1500      4.5200
+   1047.8000   1486.2300     35.1500      4.5200
+   1048.4000   1486.2200     35.1500      4.5200
+   1049.0000   1486.2100     35.1500      4.5100
+   1049.6000   1486.2000     35.1500      4.5100
+   1050.3000   1486.2000     35.1500      4.5100
+   1050.9000   1486.2000     35.1500      4.5000
+   1051.5000   1486.2000     35.1500      4.5000
+   1052.1000   1486.2100     35.1500      4.5000
+   1052.8000   1486.2000     35.1500      4.5000
+   1053.4000   1486.1900     35.1500      4.4900
+   1054.0000   1486.1900     35.1500      4.4900
+   1054.6000   1486.1900     35.1500      4.4900
+   1055.3000   1486.1800     35.1500      4.4800
+   1055.9000   1486.1700     35.1500      4.4800
+   1056.5000   1486.1500     35.1500      4.4700
+   1057.1000   1486.1500     35.1500      4.4700
+   1057.7000   1486.1300     35.1500      4.4600
+   1058.4000   1486.1200     35.1500      4.4500
+   1059.0000   1486.1100     35.1500      4.4500
+   1059.6000   1486.1200     35.1500      4.4500
+   1060.2000   1486.1200     35.1500      4.4500
+   1060.9000   1486.1200     35.1500      4.4400
+   1061.5000   1486.1300     35.1500      4.4400
+   1062.1000   1486.1300     35.1500      4.4400
+   1062.7000   1486.1400     35.1500      4.4400
+   1063.4000   1486.1400     35.1500      4.4400
+   1064.0000   1486.1500     35.1500      4.4400
+   1064.6000   1486.1500     35.1500      4.4400
+   1065.2000   1486.1500     35.1500      4.4300
+   1065.9000   1486.1300     35.1500      4.4300
+   1066.5000   1486.1200     35.1500      4.4200
+   1067.1000   1486.1300     35.1500      4.4200
+   1067.7000   1486.1300     35.1500      4.4200
+   1068.3000   1486.1200     35.1500      4.4100
+   1069.0000   1486.1300     35.1500      4.4100
+   1069.6000   1486.1300     35.1500      4.4100
+   1070.2000   1486.1200     35.1500      4.4100
+   1070.8000   1486.1100     35.1500      4.4000
+   1071.5000   1486.1100     35.1500      4.4000
+   1072.1000   1486.1200     35.1500      4.4000
+   1072.7000   1486.1200     35.1500      4.4000
+   1073.3000   1486.1100     35.1500      4.3900
+   1074.0000   1486.1000     35.1500      4.3900
+   1074.6000   1486.0900     35.1500      4.3800
+   1075.2000   1486.0900     35.1500      4.3800
+   1075.8000   1486.0800     35.1500      4.3800
+   1076.4000   1486.0700     35.1500      4.3700
+   1077.1000   1486.0600     35.1500      4.3600
+   1077.7000   1486.0500     35.1500      4.3600
+   1078.3000   1486.0400     35.1500      4.3500
+   1078.9000   1486.0500     35.1500      4.3500
+   1079.6000   1486.0300     35.1500      4.3500
+   1080.2000   1486.0300     35.1500      4.3400
+   1080.8000   1486.0400     35.1500      4.3400
+   1081.4000   1486.0400     35.1500      4.3400
+   1082.1000   1486.0400     35.1500      4.3400
+   1082.7000   1486.0400     35.1500      4.3400
+   1083.3000   1486.0500     35.1500      4.3400
+   1083.9000   1486.0500     35.1500      4.3300
+   1084.5000   1486.0500     35.1500      4.3300
+   1085.2000   1486.0500     35.1500      4.3300
+   1085.8000   1486.0500     35.1500      4.3300
+   1086.4000   1486.0400     35.1500      4.3200
+   1087.0000   1486.0200     35.1500      4.3100
+   1087.7000   1486.0000     35.1500      4.3100
+   1088.3000   1486.0100     35.1500      4.3100
+   1088.9000   1486.0100     35.1500      4.3000
+   1089.5000   1486.0100     35.1500      4.3000
+   1090.1000   1486.0100     35.1500      4.3000
+   1090.8000   1486.0200     35.1500      4.3000
+   1091.4000   1486.0300     35.1500      4.3000
+   1092.0000   1486.0200     35.1500      4.2900
+   1092.6000   1486.0100     35.1500      4.2900
+   1093.2000   1486.0000     35.1500      4.2900
+   1093.9000   1485.9800     35.1500      4.2800
+   1094.5000   1485.9800     35.1500      4.2700
+   1095.1000   1485.9900     35.1500      4.2700
+   1095.7000   1485.9900     35.1500      4.2700
+   1096.4000   1486.0000     35.1500      4.2700
+   1097.0000   1486.0100     35.1500      4.2700
+   1097.6000   1486.0100     35.1500      4.2700
+   1098.2000   1486.0000     35.1500      4.2700
+   1098.8000   1486.0000     35.1500      4.2600
+   1099.5000   1486.0100     35.1500      4.2600
+   1100.1000   1485.9900     35.1500      4.2600
+   1100.7000   1486.0000     35.1500      4.2500
+   1101.3000   1486.0000     35.1500      4.2500
+   1102.0000   1485.9900     35.1500      4.2500
+   1102.6000   1485.9900     35.1500      4.2500
+   1103.2000   1486.0000     35.1500      4.2400
+   1103.8000   1485.9900     35.1500      4.2400
+   1104.4000   1486.0100     35.1500      4.2400
+   1105.1000   1486.0000     35.1500      4.2400
+   1105.7000   1486.0100     35.1500      4.2400
+   1106.3000   1486.0100     35.1500      4.2300
+   1106.9000   1486.0200     35.1500      4.2300
+   1107.5000   1486.0100     35.1500      4.2300
+   1108.2000   1486.0000     35.1500      4.2300
+   1108.8000   1485.9900     35.1500      4.2200
+   1109.4000   1485.9800     35.1500      4.2200
+   1110.0000   1485.9600     35.1500      4.2100
+   1110.6000   1485.9500     35.1500      4.2000
+   1111.3000   1485.9400     35.1500      4.2000
+   1111.9000   1485.9300     35.1500      4.1900
+   1112.5000   1485.9200     35.1500      4.1900
+   1113.1000   1485.9300     35.1500      4.1900
+   1113.7000   1485.9300     35.1500      4.1900
+   1114.4000   1485.9200     35.1500      4.1800
+   1115.0000   1485.9000     35.1500      4.1700
+   1115.6000   1485.8600     35.1500      4.1600
+   1116.2000   1485.8200     35.1500      4.1500
+   1116.9000   1485.7900     35.1500      4.1400
+   1117.5000   1485.7700     35.1500      4.1300
+   1118.1000   1485.7700     35.1500      4.1300
+   1118.7000   1485.7700     35.1500      4.1300
+   1119.3000   1485.7700     35.1500      4.1200
+   1120.0000   1485.7700     35.1500      4.1200
+   1120.6000   1485.7700     35.1500      4.1200
+   1121.2000   1485.7700     35.1500      4.1200
+   1121.8000   1485.7800     35.1500      4.1200
+   1122.4000   1485.7800     35.1500      4.1200
+   1123.1000   1485.7900     35.1500      4.1100
+   1123.7000   1485.7900     35.1500      4.1100
+   1124.3000   1485.7900     35.1500      4.1100
+   1124.9000   1485.7800     35.1500      4.1000
+   1125.5000   1485.7500     35.1500      4.1000
+   1126.2000   1485.7300     35.1500      4.0900
+   1126.8000   1485.7200     35.1500      4.0800
+   1127.4000   1485.7200     35.1500      4.0800
+   1128.0000   1485.7100     35.1500      4.0800
+   1128.6000   1485.7000     35.1500      4.0700
+   1129.3000   1485.7000     35.1500      4.0700
+   1129.9000   1485.6900     35.1500      4.0600
+   1130.5000   1485.7000     35.1500      4.0600
+   1131.1000   1485.7000     35.1500      4.0600
+   1131.7000   1485.7100     35.1500      4.0600
+   1132.4000   1485.7100     35.1500      4.0600
+   1133.0000   1485.7300     35.1500      4.0600
+   1133.6000   1485.7300     35.1500      4.0600
+   1134.2000   1485.7500     35.1500      4.0600
+   1134.8000   1485.7500     35.1500      4.0600
+   1135.4000   1485.7600     35.1500      4.0600
+   1136.1000   1485.7800     35.1500      4.0600
+   1136.7000   1485.7800     35.1500      4.0600
+   1137.3000   1485.7900     35.1500      4.0600
+   1137.9000   1485.8000     35.1500      4.0600
+   1138.5000   1485.8000     35.1500      4.0600
+   1139.2000   1485.8200     35.1500      4.0600
+   1139.8000   1485.8300     35.1500      4.0600
+   1140.4000   1485.8400     35.1500      4.0600
+   1141.0000   1485.8500     35.1500      4.0600
+   1141.6000   1485.8700     35.1500      4.0600
+   1142.3000   1485.8800     35.1500      4.0600
+   1142.9000   1485.8900     35.1500      4.0600
+   1143.5000   1485.8900     35.1500      4.0600
+   1144.1000   1485.8900     35.1500      4.0600
+   1144.7000   1485.9000     35.1500      4.0600
+   1145.4000   1485.9200     35.1500      4.0600
+   1146.0000   1485.9300     35.1500      4.0600
+   1146.6000   1485.9200     35.1500      4.0500
+   1147.2000   1485.9100     35.1500      4.0500
+   1147.8000   1485.8900     35.1500      4.0400
+   1148.4000   1485.8700     35.1500      4.0300
+   1149.1000   1485.8600     35.1500      4.0300
+   1149.7000   1485.8200     35.1500      4.0200
+   1150.3000   1485.7800     35.1500      4.0100
+   1150.9000   1485.7800     35.1500      4.0000
+   1151.5000   1485.7900     35.1500      4.0000
+   1152.2000   1485.7900     35.1500      4.0000
+   1152.8000   1485.8000     35.1500      4.0000
+   1153.4000   1485.8000     35.1500      4.0000
+   1154.0000   1485.8200     35.1500      4.0000
+   1154.6000   1485.8200     35.1500      4.0000
+   1155.2000   1485.8400     35.1500      4.0000
+   1155.9000   1485.8400     35.1500      4.0000
+   1156.5000   1485.8400     35.1500      3.9900
+   1157.1000   1485.8400     35.1500      3.9900
+   1157.7000   1485.8500     35.1500      3.9900
+   1158.3000   1485.8600     35.1500      3.9900
+   1159.0000   1485.8700     35.1500      3.9900
+   1159.6000   1485.8800     35.1500      3.9900
+   1160.2000   1485.8900     35.1500      3.9900
+   1160.8000   1485.9100     35.1500      3.9900
+   1161.4000   1485.9000     35.1500      3.9900
+   1162.0000   1485.9000     35.1500      3.9900
+   1162.7000   1485.9000     35.1500      3.9800
+   1163.3000   1485.8900     35.1500      3.9800
+   1163.9000   1485.8800     35.1500      3.9700
+   1164.5000   1485.8600     35.1500      3.9700
+   1165.1000   1485.8400     35.1500      3.9600
+   1165.8000   1485.8400     35.1500      3.9600
+   1166.4000   1485.8500     35.1500      3.9600
+   1167.0000   1485.8600     35.1500      3.9600
+   1167.6000   1485.8700     35.1500      3.9600
+   1168.2000   1485.8600     35.1500      3.9500
+   1168.8000   1485.8700     35.1500      3.9500
+   1169.5000   1485.8800     35.1500      3.9500
+   1170.1000   1485.8800     35.1500      3.9500
+   1170.7000   1485.8800     35.1500      3.9500
+   1171.3000   1485.8800     35.1500      3.9400
+   1171.9000   1485.8700     35.1500      3.9400
+   1172.5000   1485.8900     35.1500      3.9400
+   1173.2000   1485.8800     35.1500      3.9400
+   1173.8000   1485.8900     35.1500      3.9400
+   1174.4000   1485.8800     35.1500      3.9300
+   1175.0000   1485.8600     35.1500      3.9200
+   1175.6000   1485.8600     35.1500      3.9200
+   1176.2000   1485.8500     35.1500      3.9200
+   1176.9000   1485.8400     35.1500      3.9100
+   1177.5000   1485.8300     35.1500      3.9100
+   1178.1000   1485.8500     35.1500      3.9100
+   1178.7000   1485.8500     35.1500      3.9100
+   1179.3000   1485.8500     35.1500      3.9000
+   1179.9000   1485.8300     35.1500      3.9000
+   1180.6000   1485.8000     35.1500      3.8900
+   1181.2000   1485.8000     35.1500      3.8900
+   1181.8000   1485.7900     35.1500      3.8800
+   1182.4000   1485.8100     35.1500      3.8800
+   1183.0000   1485.8100     35.1500      3.8800
+   1183.6000   1485.8200     35.1500      3.8800
+   1184.3000   1485.8400     35.1500      3.8800
+   1184.9000   1485.8200     35.1500      3.8800
+   1185.5000   1485.8200     35.1500      3.8700
+   1186.1000   1485.8300     35.1500      3.8700
+   1186.7000   1485.8300     35.1500      3.8700
+   1187.3000   1485.8300     35.1500      3.8700
+   1188.0000   1485.8300     35.1500      3.8700
+   1188.6000   1485.8200     35.1500      3.8600
+   1189.2000   1485.8200     35.1500      3.8600
+   1189.8000   1485.8400     35.1500      3.8600
+   1190.4000   1485.8300     35.1500      3.8600
+   1191.0000   1485.8300     35.1500      3.8500
+   1191.7000   1485.8300     35.1500      3.8500
+   1192.3000   1485.8400     35.1500      3.8500
+   1192.9000   1485.8500     35.1500      3.8500
+   1193.5000   1485.8400     35.1500      3.8500
+   1194.1000   1485.8500     35.1500      3.8500
+   1194.7000   1485.8500     35.1500      3.8400
+   1195.3000   1485.8500     35.1500      3.8400
+   1196.0000   1485.8600     35.1500      3.8400
+   1196.6000   1485.8600     35.1500      3.8400
+   1197.2000   1485.8700     35.1500      3.8400
+   1197.8000   1485.8900     35.1500      3.8400
+   1198.4000   1485.8900     35.1500      3.8400
+   1199.0000   1485.9000     35.1500      3.8400
+   1199.7000   1485.9200     35.1500      3.8400
+   1200.3000   1485.9300     35.1500      3.8400
+   1200.9000   1485.9300     35.1500      3.8400
+   1201.5000   1485.9400     35.1500      3.8400
+   1202.1000   1485.9500     35.1500      3.8400
+   1202.7000   1485.9500     35.1500      3.8400
+   1203.4000   1485.9500     35.1500      3.8300
+   1204.0000   1485.9600     35.1500      3.8300
+   1204.6000   1485.9600     35.1500      3.8300
+   1205.2000   1485.9700     35.1500      3.8300
+   1205.8000   1485.9700     35.1500      3.8300
+   1206.4000   1485.9700     35.1500      3.8300
+   1207.0000   1485.9600     35.1500      3.8200
+   1207.7000   1485.9600     35.1500      3.8200
+   1208.3000   1485.9700     35.1500      3.8200
+   1208.9000   1485.9700     35.1500      3.8200
+   1209.5000   1485.9600     35.1500      3.8100
+   1210.1000   1485.9700     35.1500      3.8100
+   1210.7000   1485.9600     35.1500      3.8100
+   1211.3000   1485.9800     35.1500      3.8100
+   1212.0000   1485.9800     35.1500      3.8100
+   1212.6000   1485.9900     35.1500      3.8100
+   1213.2000   1485.9900     35.1500      3.8000
+   1213.8000   1485.9900     35.1500      3.8000
+   1214.4000   1486.0000     35.1500      3.8000
+   1215.0000   1485.9900     35.1500      3.8000
+   1215.7000   1485.9700     35.1500      3.7900
+   1216.3000   1485.9600     35.1500      3.7900
+   1216.9000   1485.9600     35.1500      3.7800
+   1217.5000   1485.9600     35.1500      3.7800
+   1218.1000   1485.9800     35.1500      3.7800
+   1218.7000   1485.9800     35.1500      3.7800
+   1219.3000   1485.9900     35.1500      3.7800
+   1220.0000   1485.9900     35.1500      3.7800
+   1220.6000   1486.0000     35.1500      3.7800
+   1221.2000   1486.0100     35.1500      3.7800
+   1221.8000   1486.0200     35.1500      3.7800
+   1222.4000   1486.0400     35.1500      3.7800
+   1223.0000   1486.0400     35.1500      3.7800
+   1223.6000   1486.0500     35.1500      3.7800
+   1224.3000   1486.0600     35.1500      3.7800
+   1224.9000   1486.0800     35.1500      3.7800
+   1225.5000   1486.0800     35.1500      3.7800
+   1226.1000   1486.0900     35.1500      3.7800
+   1226.7000   1486.0900     35.1500      3.7800
+   1227.3000   1486.1000     35.1500      3.7800
+   1227.9000   1486.1300     35.1500      3.7800
+   1228.5000   1486.1400     35.1500      3.7800
+   1229.2000   1486.1400     35.1500      3.7800
+   1229.8000   1486.1600     35.1500      3.7800
+   1230.4000   1486.1700     35.1500      3.7800
+   1231.0000   1486.1800     35.1500      3.7800
+   1231.6000   1486.1800     35.1500      3.7800
+   1232.2000   1486.1700     35.1500      3.7700
+   1232.8000   1486.1800     35.1500      3.7700
+   1233.5000   1486.2000     35.1500      3.7700
+   1234.1000   1486.2100     35.1500      3.7700
+   1234.7000   1486.2300     35.1500      3.7800
+   1235.3000   1486.2300     35.1500      3.7700
+   1235.9000   1486.2500     35.1500      3.7800
+   1236.5000   1486.2500     35.1500      3.7700
+   1237.1000   1486.2600     35.1500      3.7700
+   1237.8000   1486.2600     35.1500      3.7700
+   1238.4000   1486.2600     35.1500      3.7700
+   1239.0000   1486.2900     35.1500      3.7700
+   1239.6000   1486.3000     35.1500      3.7700
+   1240.2000   1486.3000     35.1500      3.7700
+   1240.8000   1486.2900     35.1500      3.7700
+   1241.4000   1486.2800     35.1500      3.7600
+   1242.0000   1486.2800     35.1500      3.7600
+   1242.7000   1486.2800     35.1500      3.7600
+   1243.3000   1486.2700     35.1500      3.7500
+   1243.9000   1486.2900     35.1500      3.7500
+   1244.5000   1486.2900     35.1500      3.7500
+   1245.1000   1486.2900     35.1500      3.7500
+   1245.7000   1486.2800     35.1500      3.7400
+   1246.3000   1486.2600     35.1500      3.7400
+   1246.9000   1486.2500     35.1500      3.7300
+   1247.6000   1486.2400     35.1500      3.7300
+   1248.2000   1486.2500     35.1500      3.7300
+   1248.8000   1486.2400     35.1500      3.7200
+   1249.4000   1486.2500     35.1500      3.7200
+   1250.0000   1486.2600     35.1500      3.7200
+   1250.6000   1486.2700     35.1500      3.7200
+   1251.2000   1486.2700     35.1500      3.7200
+   1251.8000   1486.2700     35.1500      3.7200
+   1252.5000   1486.2700     35.1500      3.7200
+   1253.1000   1486.2700     35.1500      3.7100
+   1253.7000   1486.2700     35.1500      3.7100
+   1254.3000   1486.2600     35.1500      3.7100
+   1254.9000   1486.2600     35.1500      3.7000
+   1255.5000   1486.2600     35.1500      3.7000
+   1256.1000   1486.2600     35.1500      3.7000
+   1256.7000   1486.2600     35.1500      3.7000
+   1257.4000   1486.2700     35.1500      3.7000
+   1258.0000   1486.2600     35.1500      3.6900
+   1258.6000   1486.2500     35.1500      3.6900
+   1259.2000   1486.2400     35.1500      3.6800
+   1259.8000   1486.2400     35.1500      3.6800
+   1260.4000   1486.2400     35.1500      3.6800
+   1261.0000   1486.2500     35.1500      3.6800
+   1261.6000   1486.2500     35.1500      3.6700
+   1262.3000   1486.2500     35.1500      3.6700
+   1262.9000   1486.2500     35.1500      3.6700
+   1263.5000   1486.2500     35.1500      3.6700
+   1264.1000   1486.2400     35.1500      3.6600
+   1264.7000   1486.2400     35.1500      3.6600
+   1265.3000   1486.2700     35.1500      3.6600
+   1265.9000   1486.2800     35.1500      3.6600
+   1266.5000   1486.2900     35.1500      3.6600
+   1267.1000   1486.3000     35.1500      3.6700
+   1267.8000   1486.3000     35.1500      3.6600
+   1268.4000   1486.3100     35.1500      3.6600
+   1269.0000   1486.3200     35.1500      3.6600
+   1269.6000   1486.3200     35.1500      3.6600
+   1270.2000   1486.3200     35.1500      3.6600
+   1270.8000   1486.3300     35.1500      3.6600
+   1271.4000   1486.3400     35.1500      3.6600
+   1272.0000   1486.3400     35.1500      3.6500
+   1272.7000   1486.3500     35.1500      3.6500
+   1273.3000   1486.3600     35.1500      3.6500
+   1273.9000   1486.3600     35.1500      3.6500
+   1274.5000   1486.3600     35.1500      3.6500
+   1275.1000   1486.3700     35.1500      3.6500
+   1275.7000   1486.3700     35.1500      3.6500
+   1276.3000   1486.3700     35.1500      3.6400
+   1276.9000   1486.3700     35.1500      3.6400
+   1277.5000   1486.3600     35.1500      3.6400
+   1278.1000   1486.3500     35.1500      3.6300
+   1278.8000   1486.3400     35.1500      3.6300
+   1279.4000   1486.3400     35.1500      3.6300
+   1280.0000   1486.3300     35.1500      3.6200
+   1280.6000   1486.3200     35.1500      3.6200
+   1281.2000   1486.3300     35.1500      3.6200
+   1281.8000   1486.3300     35.1500      3.6100
+   1282.4000   1486.3300     35.1500      3.6100
+   1283.0000   1486.3300     35.1500      3.6100
+   1283.6000   1486.3200     35.1500      3.6000
+   1284.3000   1486.3200     35.1500      3.6000
+   1284.9000   1486.3100     35.1500      3.6000
+   1285.5000   1486.3100     35.1500      3.5900
+   1286.1000   1486.3000     35.1500      3.5900
+   1286.7000   1486.2900     35.1500      3.5800
+   1287.3000   1486.2800     35.1500      3.5800
+   1287.9000   1486.2900     35.1500      3.5800
+   1288.5000   1486.2900     35.1500      3.5800
+   1289.1000   1486.2800     35.1500      3.5700
+   1289.7000   1486.3000     35.1500      3.5800
+   1290.4000   1486.3000     35.1500      3.5700
+   1291.0000   1486.3000     35.1500      3.5700
+   1291.6000   1486.3100     35.1500      3.5700
+   1292.2000   1486.3100     35.1500      3.5700
+   1292.8000   1486.3100     35.1500      3.5700
+   1293.4000   1486.3100     35.1500      3.5600
+   1294.0000   1486.3200     35.1500      3.5600
+   1294.6000   1486.3200     35.1500      3.5600
+   1295.2000   1486.3100     35.1500      3.5600
+   1295.8000   1486.3100     35.1500      3.5500
+   1296.5000   1486.3100     35.1500      3.5500
+   1297.1000   1486.3100     35.1500      3.5500
+   1297.7000   1486.3300     35.1500      3.5500
+   1298.3000   1486.3300     35.1500      3.5500
+   1298.9000   1486.3300     35.1500      3.5400
+   1299.5000   1486.3300     35.1500      3.5400
+   1300.1000   1486.3400     35.1500      3.5400
+   1300.7000   1486.3400     35.1500      3.5400
+   1301.3000   1486.3300     35.1500      3.5400
+   1301.9000   1486.3400     35.1500      3.5400
+   1302.6000   1486.3400     35.1500      3.5300
+   1303.2000   1486.3400     35.1500      3.5300
+   1303.8000   1486.3400     35.1500      3.5300
+   1304.4000   1486.3400     35.1500      3.5300
+   1305.0000   1486.3400     35.1500      3.5300
+   1305.6000   1486.3500     35.1500      3.5200
+   1306.2000   1486.3500     35.1500      3.5200
+   1306.8000   1486.3500     35.1500      3.5200
+   1307.4000   1486.3600     35.1500      3.5200
+   1308.0000   1486.3500     35.1500      3.5100
+   1308.6000   1486.3500     35.1500      3.5100
+   1309.3000   1486.3700     35.1500      3.5100
+   1309.9000   1486.3600     35.1500      3.5100
+   1310.5000   1486.3500     35.1500      3.5100
+   1311.1000   1486.3500     35.1500      3.5000
+   1311.7000   1486.3600     35.1500      3.5000
+   1312.3000   1486.3500     35.1500      3.5000
+   1312.9000   1486.3400     35.1500      3.4900
+   1313.5000   1486.3400     35.1500      3.4900
+   1314.1000   1486.3300     35.1500      3.4900
+   1314.7000   1486.3400     35.1500      3.4900
+   1315.3000   1486.3500     35.1500      3.4900
+   1316.0000   1486.3500     35.1500      3.4800
+   1316.6000   1486.3500     35.1500      3.4800
+   1317.2000   1486.3500     35.1500      3.4800
+   1317.8000   1486.3500     35.1500      3.4800
+   1318.4000   1486.3500     35.1500      3.4700
+   1319.0000   1486.3700     35.1500      3.4700
+   1319.6000   1486.3800     35.1500      3.4800
+   1320.2000   1486.3800     35.1500      3.4700
+   1320.8000   1486.4000     35.1500      3.4700
+   1321.4000   1486.4100     35.1500      3.4700
+   1322.0000   1486.4200     35.1500      3.4800
+   1322.6000   1486.4300     35.1500      3.4800
+   1323.3000   1486.4200     35.1500      3.4700
+   1323.9000   1486.4100     35.1500      3.4700
+   1324.5000   1486.4100     35.1500      3.4600
+   1325.1000   1486.4100     35.1500      3.4600
+   1325.7000   1486.4000     35.1500      3.4600
+   1326.3000   1486.4100     35.1500      3.4600
+   1326.9000   1486.4200     35.1500      3.4600
+   1327.5000   1486.4200     35.1500      3.4500
+   1328.1000   1486.4200     35.1500      3.4500
+   1328.7000   1486.4200     35.1500      3.4500
+   1329.3000   1486.4300     35.1500      3.4500
+   1329.9000   1486.4400     35.1500      3.4500
+   1330.6000   1486.4600     35.1500      3.4500
+   1331.2000   1486.4600     35.1500      3.4500
+   1331.8000   1486.4600     35.1500      3.4500
+   1332.4000   1486.4800     35.1500      3.4500
+   1333.0000   1486.4800     35.1500      3.4500
+   1333.6000   1486.4800     35.1500      3.4500
+   1334.2000   1486.4900     35.1500      3.4500
+   1334.8000   1486.5100     35.1500      3.4500
+   1335.4000   1486.5200     35.1500      3.4500
+   1336.0000   1486.5300     35.1500      3.4500
+   1336.6000   1486.5200     35.1500      3.4400
+   1337.2000   1486.5300     35.1500      3.4400
+   1337.8000   1486.5500     35.1500      3.4400
+   1338.4000   1486.5500     35.1500      3.4400
+   1339.1000   1486.5600     35.1500      3.4400
+   1339.7000   1486.5600     35.1500      3.4400
+   1340.3000   1486.5800     35.1500      3.4400
+   1340.9000   1486.5800     35.1500      3.4400
+   1341.5000   1486.6000     35.1500      3.4400
+   1342.1000   1486.6000     35.1500      3.4400
+   1342.7000   1486.6100     35.1500      3.4400
+   1343.3000   1486.6000     35.1500      3.4300
+   1343.9000   1486.5900     35.1500      3.4300
+   1344.5000   1486.6000     35.1500      3.4300
+   1345.1000   1486.6000     35.1500      3.4300
+   1345.7000   1486.6100     35.1500      3.4300
+   1346.3000   1486.6100     35.1500      3.4200
+   1346.9000   1486.6100     35.1500      3.4200
+   1347.6000   1486.6200     35.1500      3.4200
+   1348.2000   1486.6300     35.1500      3.4200
+   1348.8000   1486.6300     35.1500      3.4200
+   1349.4000   1486.6400     35.1500      3.4200
+   1350.0000   1486.6500     35.1500      3.4200
+   1350.6000   1486.6600     35.1500      3.4200
+   1351.2000   1486.6600     35.1500      3.4200
+   1351.8000   1486.6700     35.1500      3.4200
+   1352.4000   1486.6800     35.1500      3.4200
+   1353.0000   1486.6900     35.1500      3.4200
+   1353.6000   1486.6900     35.1500      3.4200
+   1354.2000   1486.7000     35.1500      3.4100
+   1354.8000   1486.7000     35.1500      3.4100
+   1355.4000   1486.7200     35.1500      3.4100
+   1356.0000   1486.7300     35.1500      3.4100
+   1356.6000   1486.7300     35.1500      3.4100
+   1357.3000   1486.7300     35.1500      3.4100
+   1357.9000   1486.7300     35.1500      3.4100
+   1358.5000   1486.7300     35.1500      3.4100
+   1359.1000   1486.7400     35.1500      3.4100
+   1359.7000   1486.7400     35.1500      3.4000
+   1360.3000   1486.7500     35.1500      3.4000
+   1360.9000   1486.7500     35.1500      3.4000
+   1361.5000   1486.7500     35.1500      3.4000
+   1362.1000   1486.7600     35.1500      3.4000
+   1362.7000   1486.7600     35.1500      3.4000
+   1363.3000   1486.7600     35.1500      3.3900
+   1363.9000   1486.7600     35.1500      3.3900
+   1364.5000   1486.7700     35.1500      3.3900
+   1365.1000   1486.7700     35.1500      3.3900
+   1365.7000   1486.7800     35.1500      3.3900
+   1366.3000   1486.7800     35.1500      3.3900
+   1366.9000   1486.7900     35.1500      3.3900
+   1367.6000   1486.7900     35.1500      3.3800
+   1368.2000   1486.8000     35.1500      3.3800
+   1368.8000   1486.8200     35.1500      3.3900
+   1369.4000   1486.8200     35.1500      3.3800
+   1370.0000   1486.8200     35.1500      3.3800
+   1370.6000   1486.8300     35.1500      3.3800
+   1371.2000   1486.8300     35.1500      3.3800
+   1371.8000   1486.8400     35.1500      3.3800
+   1372.4000   1486.8500     35.1500      3.3800
+   1373.0000   1486.8600     35.1500      3.3800
+   1373.6000   1486.8700     35.1500      3.3800
+   1374.2000   1486.8800     35.1500      3.3800
+   1374.8000   1486.8900     35.1500      3.3800
+   1375.4000   1486.9000     35.1500      3.3800
+   1376.0000   1486.9100     35.1500      3.3800
+   1376.6000   1486.9300     35.1500      3.3800
+   1377.2000   1486.9300     35.1500      3.3800
+   1377.8000   1486.9400     35.1500      3.3800
+   1378.4000   1486.9300     35.1500      3.3700
+   1379.1000   1486.9300     35.1500      3.3700
+   1379.7000   1486.9400     35.1500      3.3700
+   1380.3000   1486.9400     35.1500      3.3700
+   1380.9000   1486.9500     35.1500      3.3700
+   1381.5000   1486.9600     35.1500      3.3700
+   1382.1000   1486.9600     35.1500      3.3700
+   1382.7000   1486.9700     35.1500      3.3700
+   1383.3000   1486.9800     35.1500      3.3700
+   1383.9000   1486.9800     35.1500      3.3700
+   1384.5000   1486.9900     35.1500      3.3600
+   1385.1000   1486.9900     35.1500      3.3600
+   1385.7000   1486.9900     35.1500      3.3600
+   1386.3000   1486.9900     35.1500      3.3600
+   1386.9000   1486.9800     35.1500      3.3500
+   1387.5000   1486.9800     35.1500      3.3500
+   1388.1000   1486.9800     35.1500      3.3500
+   1388.7000   1486.9900     35.1500      3.3500
+   1389.3000   1486.9900     35.1500      3.3500
+   1389.9000   1487.0000     35.1500      3.3500
+   1390.5000   1487.0000     35.1500      3.3400
+   1391.1000   1487.0100     35.1500      3.3400
+   1391.7000   1487.0100     35.1500      3.3400
+   1392.4000   1487.0200     35.1500      3.3400
+   1393.0000   1487.0400     35.1500      3.3400
+   1393.6000   1487.0500     35.1500      3.3400
+   1394.2000   1487.0500     35.1500      3.3400
+   1394.8000   1487.0700     35.1500      3.3400
+   1395.4000   1487.0700     35.1500      3.3400
+   1396.0000   1487.0800     35.1500      3.3400
+   1396.6000   1487.1000     35.1500      3.3400
+   1397.2000   1487.1000     35.1500      3.3400
+   1397.8000   1487.0900     35.1500      3.3400
+   1398.4000   1487.0900     35.1500      3.3300
+   1399.0000   1487.0800     35.1500      3.3300
+   1399.6000   1487.0700     35.1500      3.3200
+   1400.2000   1487.0700     35.1500      3.3200
+   1400.8000   1487.0800     35.1500      3.3200
+   1401.4000   1487.0900     35.1500      3.3200
+   1402.0000   1487.1000     35.1500      3.3200
+   1402.6000   1487.1000     35.1500      3.3200
+   1403.2000   1487.1100     35.1500      3.3200
+   1403.8000   1487.1200     35.1500      3.3200
+   1404.4000   1487.1300     35.1500      3.3200
+   1405.0000   1487.1400     35.1500      3.3200
+   1405.6000   1487.1400     35.1500      3.3200
+   1406.2000   1487.1400     35.1500      3.3100
+   1406.8000   1487.1600     35.1500      3.3200
+   1407.4000   1487.1600     35.1500      3.3200
+   1408.0000   1487.1500     35.1500      3.3100
+   1408.6000   1487.1700     35.1500      3.3100
+   1409.2000   1487.1600     35.1500      3.3100
+   1409.9000   1487.1700     35.1500      3.3100
+   1410.5000   1487.1800     35.1500      3.3100
+   1411.1000   1487.1900     35.1500      3.3100
+   1411.7000   1487.1900     35.1500      3.3000
+   1412.3000   1487.2000     35.1500      3.3000
+   1412.9000   1487.2200     35.1500      3.3100
+   1413.5000   1487.2200     35.1500      3.3100
+   1414.1000   1487.2200     35.1500      3.3000
+   1414.7000   1487.2300     35.1500      3.3000
+   1415.3000   1487.2400     35.1500      3.3000
+   1415.9000   1487.2400     35.1500      3.3000
+   1416.5000   1487.2500     35.1500      3.3000
+   1417.1000   1487.2500     35.1500      3.3000
+   1417.7000   1487.2600     35.1500      3.3000
+   1418.3000   1487.2700     35.1500      3.3000
+   1418.9000   1487.2700     35.1500      3.3000
+   1419.5000   1487.2800     35.1500      3.2900
+   1420.1000   1487.2800     35.1500      3.2900
+   1420.7000   1487.3000     35.1500      3.2900
+   1421.3000   1487.3100     35.1500      3.3000
+   1421.9000   1487.3200     35.1500      3.3000
+   1422.5000   1487.3300     35.1500      3.2900
+   1423.1000   1487.3300     35.1500      3.2900
+   1423.7000   1487.3400     35.1500      3.2900
+   1424.3000   1487.3500     35.1500      3.2900
+   1424.9000   1487.3400     35.1500      3.2900
+   1425.5000   1487.3200     35.1500      3.2800
+   1426.1000   1487.3200     35.1500      3.2800
+   1426.7000   1487.3200     35.1500      3.2800
+   1427.3000   1487.3100     35.1500      3.2700
+   1427.9000   1487.3200     35.1500      3.2700
+   1428.5000   1487.2900     35.1500      3.2600
+   1429.1000   1487.2500     35.1500      3.2500
+   1429.7000   1487.2100     35.1500      3.2400
+   1430.3000   1487.1900     35.1500      3.2300
+   1430.9000   1487.1800     35.1500      3.2300
+   1431.5000   1487.1800     35.1500      3.2200
+   1432.1000   1487.1700     35.1500      3.2200
+   1432.7000   1487.1800     35.1500      3.2200
+   1433.3000   1487.1700     35.1500      3.2100
+   1433.9000   1487.1800     35.1500      3.2100
+   1434.5000   1487.1700     35.1500      3.2100
+   1435.1000   1487.1800     35.1500      3.2100
+   1435.7000   1487.1800     35.1500      3.2100
+   1436.3000   1487.1900     35.1500      3.2100
+   1436.9000   1487.1600     35.1500      3.2000
+   1437.6000   1487.1700     35.1500      3.2000
+   1438.2000   1487.2100     35.1500      3.2000
+   1438.8000   1487.2100     35.1500      3.2000
+   1439.4000   1487.2100     35.1500      3.2000
+   1440.0000   1487.2200     35.1500      3.2000
+   1440.6000   1487.2200     35.1500      3.2000
+   1441.2000   1487.2200     35.1500      3.2000
+   1441.8000   1487.2200     35.1500      3.1900
+   1442.4000   1487.2200     35.1500      3.1900
+   1443.0000   1487.2400     35.1500      3.1900
+   1443.6000   1487.2300     35.1500      3.1900
+   1444.2000   1487.2400     35.1500      3.1900
+   1444.8000   1487.2500     35.1500      3.1900
+   1445.4000   1487.2600     35.1500      3.1900
+   1446.0000   1487.2700     35.1500      3.1900
+   1446.6000   1487.2700     35.1500      3.1900
+   1447.2000   1487.2700     35.1500      3.1900
+   1447.8000   1487.2900     35.1500      3.1900
+   1448.4000   1487.3000     35.1500      3.1900
+   1449.0000   1487.3000     35.1500      3.1800
+   1449.6000   1487.3100     35.1500      3.1800
+   1450.2000   1487.3200     35.1500      3.1800
+   1450.8000   1487.3200     35.1500      3.1800
+   1451.4000   1487.3000     35.1500      3.1800
+   1452.0000   1487.3100     35.1500      3.1800
+   1452.6000   1487.3200     35.1500      3.1700
+   1453.2000   1487.3100     35.1500      3.1700
+   1453.8000   1487.3100     35.1500      3.1700
+   1454.4000   1487.3000     35.1500      3.1600
+   1455.0000   1487.2800     35.1500      3.1600
+   1455.6000   1487.2700     35.1500      3.1500
+   1456.2000   1487.2800     35.1500      3.1500
+   1456.8000   1487.2800     35.1500      3.1500
+   1457.4000   1487.2800     35.1500      3.1500
+   1458.0000   1487.3000     35.1500      3.1500
+   1458.6000   1487.2900     35.1500      3.1400
+   1459.2000   1487.3000     35.1500      3.1400
+   1459.8000   1487.3100     35.1500      3.1400
+   1460.4000   1487.3200     35.1500      3.1400
+   1461.0000   1487.3200     35.1500      3.1400
+   1461.6000   1487.3200     35.1500      3.1400
+   1462.2000   1487.3200     35.1500      3.1400
+   1462.8000   1487.3200     35.1500      3.1400
+   1463.4000   1487.3300     35.1500      3.1300
+   1464.0000   1487.3400     35.1500      3.1300
+   1464.6000   1487.3400     35.1500      3.1300
+   1465.2000   1487.3400     35.1500      3.1300
+   1465.8000   1487.3500     35.1500      3.1300
+   1466.4000   1487.3600     35.1500      3.1300
+   1467.0000   1487.3600     35.1500      3.1300
+   1467.6000   1487.3600     35.1500      3.1300
+   1468.2000   1487.3500     35.1500      3.1200
+   1468.8000   1487.3500     35.1500      3.1200
+   1469.4000   1487.3600     35.1500      3.1200
+   1470.0000   1487.3600     35.1500      3.1200
+   1470.6000   1487.3700     35.1500      3.1200
+   1471.2000   1487.3700     35.1500      3.1100
+   1471.8000   1487.3800     35.1500      3.1100
+   1472.4000   1487.4000     35.1500      3.1200
+   1473.0000   1487.4000     35.1500      3.1100
+   1473.6000   1487.4100     35.1500      3.1100
+   1474.2000   1487.4200     35.1500      3.1100
+   1474.8000   1487.4300     35.1500      3.1100
+   1475.4000   1487.4300     35.1500      3.1100
+   1476.0000   1487.4500     35.1500      3.1100
+   1476.6000   1487.4500     35.1500      3.1100
+   1477.2000   1487.4600     35.1500      3.1100
+   1477.8000   1487.4700     35.1500      3.1100
+   1478.4000   1487.4800     35.1500      3.1100
+   1479.0000   1487.5000     35.1500      3.1100
+   1479.6000   1487.4900     35.1500      3.1100
+   1480.2000   1487.5100     35.1500      3.1100
+   1480.7000   1487.5100     35.1500      3.1100
+   1481.3000   1487.5200     35.1500      3.1100
+   1481.9000   1487.5200     35.1500      3.1100
+   1482.5000   1487.5400     35.1500      3.1100
+   1483.1000   1487.5500     35.1500      3.1100
+   1483.7000   1487.5600     35.1500      3.1100
+   1484.3000   1487.5700     35.1500      3.1100
+   1484.9000   1487.5700     35.1500      3.1100
+   1485.5000   1487.5700     35.1500      3.1000
+   1486.1000   1487.5800     35.1500      3.1100
+   1486.7000   1487.5900     35.1500      3.1000
+   1487.3000   1487.5900     35.1500      3.1000
+   1487.9000   1487.6000     35.1500      3.1000
+   1488.5000   1487.6000     35.1500      3.1000
+   1489.1000   1487.6000     35.1500      3.1000
+   1489.7000   1487.6200     35.1500      3.1000
+   1490.3000   1487.6400     35.1500      3.1000
+   1490.9000   1487.6500     35.1500      3.1000
+   1491.5000   1487.6500     35.1500      3.1000
+   1492.1000   1487.6500     35.1500      3.1000
+   1492.7000   1487.6600     35.1500      3.1000
+   1493.3000   1487.6700     35.1500      3.1000
+   1493.9000   1487.6900     35.1500      3.1000
+   1494.5000   1487.7000     35.1500      3.1000
+   1495.1000   1487.7000     35.1500      3.1000
+   1495.7000   1487.7000     35.1500      3.1000
+   1496.3000   1487.7100     35.1500      3.1000
+   1496.9000   1487.7100     35.1500      3.0900
+   1497.5000   1487.6900     35.1500      3.0900
+   1498.1000   1487.6800     35.1500      3.0800
+   1498.7000   1487.6500     35.1500      3.0700
+   1499.3000   1487.6300     35.1500      3.0700
+   1499.9000   1487.6200     35.1500      3.0600
+   1500.5000   1487.6200     35.1500      3.0600
+   1501.1000   1487.6100     35.1500      3.0500
+   1501.7000   1487.6200     35.1500      3.0500
+   1502.3000   1487.6300     35.1500      3.0500
+   1502.9000   1487.6400     35.1500      3.0500
+   1503.5000   1487.6400     35.1500      3.0500
+   1504.1000   1487.6700     35.1500      3.0500
+   1504.7000   1487.6800     35.1500      3.0600
+   1505.3000   1487.6900     35.1500      3.0500
+   1505.9000   1487.7100     35.1500      3.0600
+   1506.5000   1487.7100     35.1500      3.0600
+   1507.1000   1487.7300     35.1500      3.0600
+   1507.7000   1487.7300     35.1500      3.0600
+   1508.3000   1487.7400     35.1500      3.0600
+   1508.8000   1487.7500     35.1500      3.0600
+   1509.4000   1487.7600     35.1500      3.0500
+   1510.0000   1487.7600     35.1500      3.0500
+   1510.6000   1487.7700     35.1500      3.0500
+   1511.2000   1487.7800     35.1500      3.0500
+   1511.8000   1487.7800     35.1500      3.0500
+   1512.4000   1487.7800     35.1500      3.0500
+   1513.0000   1487.7800     35.1500      3.0500
+   1513.6000   1487.7800     35.1500      3.0400
+   1514.2000   1487.7800     35.1500      3.0400
+   1514.8000   1487.7800     35.1500      3.0400
+   1515.4000   1487.7700     35.1500      3.0300
+   1516.0000   1487.7900     35.1500      3.0400
+   1516.6000   1487.8000     35.1500      3.0400
+   1517.2000   1487.8100     35.1500      3.0400
+   1517.8000   1487.8100     35.1500      3.0400
+   1518.4000   1487.8200     35.1500      3.0300
+   1519.0000   1487.8300     35.1500      3.0300
+   1519.6000   1487.8400     35.1500      3.0300
+   1520.2000   1487.8500     35.1500      3.0300
+   1520.8000   1487.8500     35.1500      3.0300
+   1521.4000   1487.8600     35.1500      3.0300
+   1522.0000   1487.8700     35.1500      3.0300
+   1522.6000   1487.8600     35.1500      3.0300
+   1523.2000   1487.8600     35.1500      3.0200
+   1523.8000   1487.8500     35.1500      3.0200
+   1524.4000   1487.8200     35.1500      3.0100
+   1525.0000   1487.8100     35.1500      3.0100
+   1525.5000   1487.8000     35.1500      3.0000
+   1526.1000   1487.7900     35.1500      3.0000
+   1526.7000   1487.8000     35.1500      3.0000
+   1527.3000   1487.8000     35.1500      2.9900
+   1527.9000   1487.8100     35.1500      2.9900
+   1528.5000   1487.8100     35.1500      2.9900
+   1529.1000   1487.8400     35.1500      3.0000
+   1529.7000   1487.8400     35.1500      2.9900
+   1530.3000   1487.8400     35.1500      2.9900
+   1530.9000   1487.8400     35.1500      2.9900
+   1531.5000   1487.8400     35.1500      2.9900
+   1532.1000   1487.8300     35.1500      2.9800
+   1532.7000   1487.8400     35.1500      2.9800
+   1533.3000   1487.8300     35.1500      2.9800
+   1533.9000   1487.8300     35.1500      2.9800
+   1534.5000   1487.8300     35.1500      2.9700
+   1535.1000   1487.8300     35.1500      2.9700
+   1535.7000   1487.8200     35.1500      2.9700
+   1536.3000   1487.8400     35.1500      2.9700
+   1536.9000   1487.8400     35.1500      2.9700
+   1537.5000   1487.8400     35.1500      2.9600
+   1538.1000   1487.8400     35.1500      2.9600
+   1538.7000   1487.8500     35.1500      2.9600
+   1539.2000   1487.8500     35.1500      2.9600
+   1539.8000   1487.8600     35.1500      2.9600
+   1540.4000   1487.8600     35.1500      2.9600
+   1541.0000   1487.8700     35.1500      2.9600
+   1541.6000   1487.8800     35.1500      2.9600
+   1542.2000   1487.8800     35.1500      2.9600
+   1542.8000   1487.8900     35.1500      2.9600
+   1543.4000   1487.8900     35.1500      2.9500
+   1544.0000   1487.9000     35.1500      2.9500
+   1544.6000   1487.9200     35.1500      2.9500
+   1545.2000   1487.9200     35.1500      2.9500
+   1545.8000   1487.9200     35.1500      2.9500
+   1546.4000   1487.9200     35.1500      2.9500
+   1547.0000   1487.9200     35.1500      2.9500
+   1547.6000   1487.9300     35.1500      2.9500
+   1548.2000   1487.9400     35.1500      2.9500
+   1548.8000   1487.9500     35.1500      2.9500
+   1549.4000   1487.9500     35.1500      2.9400
+   1550.0000   1487.9700     35.1500      2.9500
+   1550.5000   1488.0100     35.1500      2.9500
+   1551.1000   1488.0300     35.1500      2.9600
+   1551.7000   1488.0100     35.1500      2.9500
+   1552.3000   1488.0100     35.1500      2.9500
+   1552.9000   1488.0100     35.1500      2.9400
+   1553.5000   1488.0000     35.1500      2.9400
+   1554.1000   1488.0100     35.1500      2.9400
+   1554.7000   1488.0200     35.1500      2.9400
+   1555.3000   1488.0200     35.1500      2.9400
+   1555.9000   1488.0300     35.1500      2.9400
+   1556.5000   1488.0300     35.1500      2.9300
+   1557.1000   1488.0500     35.1500      2.9400
+   1557.7000   1488.0600     35.1500      2.9400
+   1558.3000   1488.0700     35.1500      2.9400
+   1558.9000   1488.0800     35.1500      2.9400
+   1559.5000   1488.0900     35.1500      2.9400
+   1560.1000   1488.1000     35.1500      2.9400
+   1560.6000   1488.1000     35.1500      2.9400
+   1561.2000   1488.1100     35.1500      2.9400
+   1561.8000   1488.1200     35.1500      2.9400
+   1562.4000   1488.1300     35.1500      2.9300
+   1563.0000   1488.1400     35.1500      2.9300
+   1563.6000   1488.1700     35.1500      2.9400
+   1564.2000   1488.1800     35.1500      2.9400
+   1564.8000   1488.1900     35.1500      2.9400
+   1565.4000   1488.1900     35.1500      2.9400
+   1566.0000   1488.2100     35.1500      2.9400
+   1566.6000   1488.2000     35.1500      2.9300
+   1567.2000   1488.2200     35.1500      2.9400
+   1567.8000   1488.2200     35.1500      2.9300
+   1568.4000   1488.2300     35.1500      2.9300
+   1569.0000   1488.2400     35.1500      2.9300
+   1569.5000   1488.2400     35.1500      2.9300
+   1570.1000   1488.2500     35.1500      2.9300
+   1570.7000   1488.2600     35.1500      2.9300
+   1571.3000   1488.2700     35.1500      2.9300
+   1571.9000   1488.2700     35.1500      2.9300
+   1572.5000   1488.2700     35.1500      2.9300
+   1573.1000   1488.2600     35.1500      2.9200
+   1573.7000   1488.2700     35.1500      2.9200
+   1574.3000   1488.3000     35.1500      2.9300
+   1574.9000   1488.3100     35.1500      2.9300
+   1575.5000   1488.3300     35.1500      2.9300
+   1576.1000   1488.3300     35.1500      2.9300
+   1576.7000   1488.3400     35.1500      2.9300
+   1577.3000   1488.3500     35.1500      2.9300
+   1577.9000   1488.3600     35.1500      2.9300
+   1578.4000   1488.3500     35.1500      2.9200
+   1579.0000   1488.3300     35.1500      2.9200
+   1579.6000   1488.3300     35.1500      2.9200
+   1580.2000   1488.3200     35.1500      2.9100
+   1580.8000   1488.3300     35.1500      2.9100
+   1581.4000   1488.3500     35.1500      2.9100
+   1582.0000   1488.3600     35.1500      2.9100
+   1582.6000   1488.3600     35.1500      2.9100
+   1583.2000   1488.3600     35.1500      2.9100
+   1583.8000   1488.3600     35.1500      2.9100
+   1584.4000   1488.3600     35.1500      2.9000
+   1585.0000   1488.3700     35.1500      2.9000
+   1585.6000   1488.3800     35.1500      2.9000
+   1586.1000   1488.3800     35.1500      2.9000
+   1586.7000   1488.3700     35.1500      2.9000
+   1587.3000   1488.4000     35.1500      2.9000
+   1587.9000   1488.4000     35.1500      2.9000
+   1588.5000   1488.4100     35.1500      2.9000
+   1589.1000   1488.4300     35.1500      2.9000
+   1589.7000   1488.4400     35.1500      2.9000
+   1590.3000   1488.4500     35.1500      2.9000
+   1590.9000   1488.4500     35.1500      2.9000
+   1591.5000   1488.4600     35.1500      2.9000
+   1592.1000   1488.4600     35.1500      2.9000
+   1592.7000   1488.4500     35.1500      2.8900
+   1593.2000   1488.4500     35.1500      2.8900
+   1593.8000   1488.4600     35.1500      2.8900
+   1594.4000   1488.4600     35.1500      2.8900
+   1595.0000   1488.4500     35.1500      2.8800
+   1595.6000   1488.4700     35.1500      2.8800
+   1596.2000   1488.4800     35.1500      2.8900
+   1596.8000   1488.4800     35.1500      2.8800
+   1597.4000   1488.4800     35.1500      2.8800
+   1598.0000   1488.4700     35.1500      2.8800
+   1598.6000   1488.4800     35.1500      2.8700
+   1599.2000   1488.4800     35.1500      2.8700
+   1599.8000   1488.4800     35.1500      2.8700
+   1600.3000   1488.4900     35.1500      2.8700
+   1600.9000   1488.4500     35.1500      2.8600
+   1601.5000   1488.4100     35.1500      2.8500
+   1602.1000   1488.4000     35.1500      2.8400
+   1602.7000   1488.4400     35.1500      2.8500
+   1603.3000   1488.5000     35.1500      2.8600
+   1603.9000   1488.5500     35.1500      2.8700
+   1604.5000   1486.0400     35.1500      2.2900
+   1605.1000   1463.8200     35.1500     -2.5300
+   1605.7000   1463.8300     35.1500     -2.5300
+   1606.3000   1583.3600     35.1500     35.5000
+   1606.9000   1583.3700     35.1500     35.5000
+   1607.4000   1583.3800     35.1500     35.5000
+   1608.0000   1583.3900     35.1500     35.5000
+   1608.6000   1583.4000     35.1500     35.5000
+   1609.2000   1583.4100     35.1500     35.5000
+   1609.8000   1583.4200     35.1500     35.5000
+   1610.4000   1583.4300     35.1500     35.5000
+   1611.0000   1583.4400     35.1500     35.5000
+   1611.6000   1583.4500     35.1500     35.5000
+   1612.2000   1583.4600     35.1500     35.5000
+   1612.8000   1583.4700     35.1500     35.5000
+   1613.4000   1583.4800     35.1500     35.5000
+   1613.9000   1583.4900     35.1500     35.5000
+   1614.5000   1583.5000     35.1500     35.5000
+   1615.1000   1583.5100     35.1500     35.5000
+   1615.7000   1583.5200     35.1500     35.5000
+   1616.3000   1583.5300     35.1500     35.5000
+   1616.9000   1583.5400     35.1500     35.5000
+   1617.5000   1583.5500     35.1500     35.5000
+   1618.1000   1583.5600     35.1500     35.5000
+   1618.7000   1583.5700     35.1500     35.5000
+   1619.3000   1583.5800     35.1500     35.5000
+   1619.8000   1583.5900     35.1500     35.5000
+   1620.4000   1583.6000     35.1500     35.5000
+   1621.0000   1583.6100     35.1500     35.5000
+   1621.6000   1583.6200     35.1500     35.5000
+   1622.2000   1583.6300     35.1500     35.5000
+   1622.8000   1583.6400     35.1500     35.5000
+   1623.4000   1583.6500     35.1500     35.5000
+   1624.0000   1583.6600     35.1500     35.5000
+   1624.6000   1583.6700     35.1500     35.5000
+   1625.2000   1583.6800     35.1500     35.5000
+   1625.7000   1583.6900     35.1500     35.5000
+   1626.3000   1583.7000     35.1500     35.5000
+   1626.9000   1583.7100     35.1500     35.5000
+   1627.5000   1583.7200     35.1500     35.5000
+   1628.1000   1583.7300     35.1500     35.5000
+   1628.7000   1583.7400     35.1500     35.5000
+   1629.3000   1583.7500     35.1500     35.5000
+   1629.9000   1583.7600     35.1500     35.5000
+   1630.5000   1583.7700     35.1500     35.5000
+   1631.1000   1583.7800     35.1500     35.5000
+   1631.6000   1583.7900     35.1500     35.5000
+   1632.2000   1583.8000     35.1500     35.5000
+   1632.8000   1583.8100     35.1500     35.5000
+   1633.4000   1583.8200     35.1500     35.5000
+   1634.0000   1583.8300     35.1500     35.5000
+   1634.6000   1583.8400     35.1500     35.5000
+   1635.2000   1583.8500     35.1500     35.5000
+   1635.8000   1583.8600     35.1500     35.5000
+   1636.4000   1583.8700     35.1500     35.5000
+   1636.9000   1583.8800     35.1500     35.5000
+   1637.5000   1583.8900     35.1500     35.5000
+   1638.1000   1583.9000     35.1500     35.5000
+   1638.7000   1583.9100     35.1500     35.5000
+   1639.3000   1583.9200     35.1500     35.5000
+   1639.9000   1583.9300     35.1500     35.5000
+   1640.5000   1583.9400     35.1500     35.5000
+   1641.1000   1583.9500     35.1500     35.5000
+   1641.7000   1583.9600     35.1500     35.5000
+   1642.2000   1583.9700     35.1500     35.5000
+   1642.8000   1583.9800     35.1500     35.5000
+   1643.4000   1583.9900     35.1500     35.5000
+   1644.0000   1584.0000     35.1500     35.5000
+   1644.6000   1584.0100     35.1500     35.5000
+   1645.2000   1584.0200     35.1500     35.5000
+   1645.8000   1584.0300     35.1500     35.5000
+   1646.4000   1584.0400     35.1500     35.5000
+   1647.0000   1584.0500     35.1500     35.5000
+   1647.5000   1584.0600     35.1500     35.5000
+   1648.1000   1584.0700     35.1500     35.5000
+   1648.7000   1584.0800     35.1500     35.5000
+   1649.3000   1584.0900     35.1500     35.5000
+   1649.9000   1584.1000     35.1500     35.5000
+   1650.5000   1584.1100     35.1500     35.5000
+   1651.1000   1584.1200     35.1500     35.5000
+   1651.7000   1584.1300     35.1500     35.5000
+   1652.2000   1584.1400     35.1500     35.5000
+   1652.8000   1584.1500     35.1500     35.5000
+   1653.4000   1584.1600     35.1500     35.5000
+   1654.0000   1584.1700     35.1500     35.5000
+   1654.6000   1584.1800     35.1500     35.5000
+   1655.2000   1584.1900     35.1500     35.5000
+   1655.8000   1584.2000     35.1500     35.5000
+   1656.4000   1584.2100     35.1500     35.5000
+   1657.0000   1584.2200     35.1500     35.5000
+   1657.5000   1584.2300     35.1500     35.5000
+   1658.1000   1584.2400     35.1500     35.5000
+   1658.7000   1584.2500     35.1500     35.5000
+   1659.3000   1584.2600     35.1500     35.5000
+   1659.9000   1584.2700     35.1500     35.5000
+   1660.5000   1584.2800     35.1500     35.5000
+   1661.1000   1584.2800     35.1500     35.5000
+   1661.7000   1584.2900     35.1500     35.5000
+   1662.2000   1584.3000     35.1500     35.5000
+   1662.8000   1584.3100     35.1500     35.5000
+   1663.4000   1584.3200     35.1500     35.5000
+   1664.0000   1584.3300     35.1500     35.5000
+   1664.6000   1584.3400     35.1500     35.5000
+   1665.2000   1584.3500     35.1500     35.5000
+   1665.8000   1584.3600     35.1500     35.5000
+   1666.4000   1584.3700     35.1500     35.5000
+   1666.9000   1584.3800     35.1500     35.5000
+   1667.5000   1584.3900     35.1500     35.5000
+   1668.1000   1584.4000     35.1500     35.5000
+   1668.7000   1584.4100     35.1500     35.5000
+   1669.3000   1584.4200     35.1500     35.5000
+   1669.9000   1584.4300     35.1500     35.5000
+   1670.5000   1584.4400     35.1500     35.5000
+   1671.1000   1584.4500     35.1500     35.5000
+   1671.6000   1584.4600     35.1500     35.5000
+   1672.2000   1584.4700     35.1500     35.5000
+   1672.8000   1584.4800     35.1500     35.5000
+   1673.4000   1584.4900     35.1500     35.5000
+   1674.0000   1584.5000     35.1500     35.5000
+   1674.6000   1584.5100     35.1500     35.5000
+   1675.2000   1584.5200     35.1500     35.5000
+   1675.7000   1584.5300     35.1500     35.5000
+   1676.3000   1584.5400     35.1500     35.5000
+   1676.9000   1584.5500     35.1500     35.5000
+   1677.5000   1584.5600     35.1500     35.5000
+   1678.1000   1584.5700     35.1500     35.5000
+   1678.7000   1584.5800     35.1500     35.5000
+   1679.3000   1584.5900     35.1500     35.5000
+   1679.9000   1584.6000     35.1500     35.5000
+   1680.4000   1584.6100     35.1500     35.5000
+   1681.0000   1584.6200     35.1500     35.5000
+   1681.6000   1584.6300     35.1500     35.5000
+   1682.2000   1584.6400     35.1500     35.5000
+   1682.8000   1584.6500     35.1500     35.5000
+   1683.4000   1584.6600     35.1500     35.5000
+   1684.0000   1584.6700     35.1500     35.5000
+   1684.5000   1584.6800     35.1500     35.5000
+   1685.1000   1584.6900     35.1500     35.5000
+   1685.7000   1584.7000     35.1500     35.5000
+   1686.3000   1584.7100     35.1500     35.5000
+   1686.9000   1584.7200     35.1500     35.5000
+   1687.5000   1584.7300     35.1500     35.5000
+   1688.1000   1584.7400     35.1500     35.5000
+   1688.6000   1584.7500     35.1500     35.5000
+   1689.2000   1584.7600     35.1500     35.5000
+   1689.8000   1584.7700     35.1500     35.5000
+   1690.4000   1584.7800     35.1500     35.5000
+   1691.0000   1584.7900     35.1500     35.5000
+   1691.6000   1584.8000     35.1500     35.5000
+   1692.2000   1584.8100     35.1500     35.5000
+   1692.7000   1584.8200     35.1500     35.5000
+   1693.3000   1584.8300     35.1500     35.5000
+   1693.9000   1584.8400     35.1500     35.5000
+   1694.5000   1584.8500     35.1500     35.5000
+   1695.1000   1584.8600     35.1500     35.5000
+   1695.7000   1584.8700     35.1500     35.5000
+   1696.3000   1584.8800     35.1500     35.5000
+   1696.8000   1584.8900     35.1500     35.5000
+   1697.4000   1584.9000     35.1500     35.5000
+   1698.0000   1584.9100     35.1500     35.5000
+   1698.6000   1584.9200     35.1500     35.5000
+   1699.2000   1584.9300     35.1500     35.5000
+   1699.8000   1584.9400     35.1500     35.5000
+   1700.4000   1584.9500     35.1500     35.5000
+   1700.9000   1584.9600     35.1500     35.5000
+   1701.5000   1584.9700     35.1500     35.5000
+   1702.1000   1584.9800     35.1500     35.5000
+   1702.7000   1584.9900     35.1500     35.5000
+   1703.3000   1585.0000     35.1500     35.5000
+   1703.9000   1585.0100     35.1500     35.5000
+   1704.5000   1585.0200     35.1500     35.5000
+   1705.0000   1585.0300     35.1500     35.5000
+   1705.6000   1585.0400     35.1500     35.5000
+   1706.2000   1585.0500     35.1500     35.5000
+   1706.8000   1585.0600     35.1500     35.5000
+   1707.4000   1585.0600     35.1500     35.5000
+   1708.0000   1585.0700     35.1500     35.5000
+   1708.5000   1585.0800     35.1500     35.5000
+   1709.1000   1585.0900     35.1500     35.5000
+   1709.7000   1585.1000     35.1500     35.5000
+   1710.3000   1585.1100     35.1500     35.5000
+   1710.9000   1585.1200     35.1500     35.5000
+   1711.5000   1585.1300     35.1500     35.5000
+   1712.1000   1585.1400     35.1500     35.5000
+   1712.6000   1585.1500     35.1500     35.5000
+   1713.2000   1585.1600     35.1500     35.5000
+   1713.8000   1585.1700     35.1500     35.5000
+   1714.4000   1585.1800     35.1500     35.5000
+   1715.0000   1585.1900     35.1500     35.5000
+   1715.6000   1585.2000     35.1500     35.5000
+   1716.1000   1585.2100     35.1500     35.5000
+   1716.7000   1585.2200     35.1500     35.5000
+   1717.3000   1585.2300     35.1500     35.5000
+   1717.9000   1585.2400     35.1500     35.5000
+   1718.5000   1585.2500     35.1500     35.5000
+   1719.1000   1585.2600     35.1500     35.5000
+   1719.6000   1585.2700     35.1500     35.5000
+   1720.2000   1585.2800     35.1500     35.5000
+   1720.8000   1585.2900     35.1500     35.5000
+   1721.4000   1585.3000     35.1500     35.5000
+   1722.0000   1585.3100     35.1500     35.5000
+   1722.6000   1585.3200     35.1500     35.5000
+   1723.1000   1585.3300     35.1500     35.5000
+   1723.7000   1585.3400     35.1500     35.5000
+   1724.3000   1585.3500     35.1500     35.5000
+   1724.9000   1585.3600     35.1500     35.5000
+   1725.5000   1585.3700     35.1500     35.5000
+   1726.1000   1585.3800     35.1500     35.5000
+   1726.7000   1585.3900     35.1500     35.5000
+   1727.2000   1585.4000     35.1500     35.5000
+   1727.8000   1585.4100     35.1500     35.5000
+   1728.4000   1585.4200     35.1500     35.5000
+   1729.0000   1585.4300     35.1500     35.5000
+   1729.6000   1585.4400     35.1500     35.5000
+   1730.2000   1585.4500     35.1500     35.5000
+   1730.7000   1585.4600     35.1500     35.5000
+   1731.3000   1585.4700     35.1500     35.5000
+   1731.9000   1585.4800     35.1500     35.5000
+   1732.5000   1585.4900     35.1500     35.5000
+   1733.1000   1585.5000     35.1500     35.5000
+   1733.7000   1585.5100     35.1500     35.5000
+   1734.2000   1585.5200     35.1500     35.5000
+   1734.8000   1585.5300     35.1500     35.5000
+   1735.4000   1585.5400     35.1500     35.5000
+   1736.0000   1585.5500     35.1500     35.5000
+   1736.6000   1585.5600     35.1500     35.5000
+   1737.1000   1585.5700     35.1500     35.5000
+   1737.7000   1585.5800     35.1500     35.5000
+   1738.3000   1585.5900     35.1500     35.5000
+   1738.9000   1585.6000     35.1500     35.5000
+   1739.5000   1585.6100     35.1500     35.5000
+   1740.1000   1585.6200     35.1500     35.5000
+   1740.6000   1585.6300     35.1500     35.5000
+   1741.2000   1585.6400     35.1500     35.5000
+   1741.8000   1585.6400     35.1500     35.5000
+   1742.4000   1585.6500     35.1500     35.5000
+   1743.0000   1585.6600     35.1500     35.5000
+   1743.6000   1585.6700     35.1500     35.5000
+   1744.1000   1585.6800     35.1500     35.5000
+   1744.7000   1585.6900     35.1500     35.5000
+   1745.3000   1585.7000     35.1500     35.5000
+   1745.9000   1585.7100     35.1500     35.5000
+   1746.5000   1585.7200     35.1500     35.5000
+   1747.1000   1585.7300     35.1500     35.5000
+   1747.6000   1585.7400     35.1500     35.5000
+   1748.2000   1585.7500     35.1500     35.5000
+   1748.8000   1585.7600     35.1500     35.5000
+   1749.4000   1585.7700     35.1500     35.5000
+   1750.0000   1585.7800     35.1500     35.5000
+   1750.5000   1585.7900     35.1500     35.5000
+   1751.1000   1585.8000     35.1500     35.5000
+   1751.7000   1585.8100     35.1500     35.5000
+   1752.3000   1585.8200     35.1500     35.5000
+   1752.9000   1585.8300     35.1500     35.5000
+   1753.5000   1585.8400     35.1500     35.5000
+   1754.0000   1585.8500     35.1500     35.5000
+   1754.6000   1585.8600     35.1500     35.5000
+   1755.2000   1585.8700     35.1500     35.5000
+   1755.8000   1585.8800     35.1500     35.5000
+   1756.4000   1585.8900     35.1500     35.5000
+   1756.9000   1585.9000     35.1500     35.5000
+   1757.5000   1585.9100     35.1500     35.5000
+   1758.1000   1585.9200     35.1500     35.5000
+   1758.7000   1585.9300     35.1500     35.5000
+   1759.3000   1585.9400     35.1500     35.5000
+   1759.9000   1585.9500     35.1500     35.5000
+   1760.4000   1585.9600     35.1500     35.5000
+   1761.0000   1585.9700     35.1500     35.5000
+   1761.6000   1585.9800     35.1500     35.5000
+   1762.2000   1585.9900     35.1500     35.5000
+   1762.8000   1586.0000     35.1500     35.5000
+   1763.3000   1586.0100     35.1500     35.5000
+   1763.9000   1586.0200     35.1500     35.5000
+   1764.5000   1586.0300     35.1500     35.5000
+   1765.1000   1586.0400     35.1500     35.5000
+   1765.7000   1586.0500     35.1500     35.5000
+   1766.2000   1586.0600     35.1500     35.5000
+   1766.8000   1586.0700     35.1500     35.5000
+   1767.4000   1586.0800     35.1500     35.5000
+   1768.0000   1586.0900     35.1500     35.5000
+   1768.6000   1586.1000     35.1500     35.5000
+   1769.2000   1586.1100     35.1500     35.5000
+   1769.7000   1586.1100     35.1500     35.5000
+   1770.3000   1586.1200     35.1500     35.5000
+   1770.9000   1586.1300     35.1500     35.5000
+   1771.5000   1586.1400     35.1500     35.5000
+   1772.1000   1586.1500     35.1500     35.5000
+   1772.6000   1586.1600     35.1500     35.5000
+   1773.2000   1586.1700     35.1500     35.5000
+   1773.8000   1586.1800     35.1500     35.5000
+   1774.4000   1586.1900     35.1500     35.5000
+   1775.0000   1586.2000     35.1500     35.5000
+   1775.5000   1586.2100     35.1500     35.5000
+   1776.1000   1586.2200     35.1500     35.5000
+   1776.7000   1586.2300     35.1500     35.5000
+   1777.3000   1586.2400     35.1500     35.5000
+   1777.9000   1586.2500     35.1500     35.5000
+   1778.4000   1586.2600     35.1500     35.5000
+   1779.0000   1586.2700     35.1500     35.5000
+   1779.6000   1586.2800     35.1500     35.5000
+   1780.2000   1586.2900     35.1500     35.5000
+   1780.8000   1586.3000     35.1500     35.5000
+   1781.3000   1586.3100     35.1500     35.5000
+   1781.9000   1586.3200     35.1500     35.5000
+   1782.5000   1586.3300     35.1500     35.5000
+   1783.1000   1586.3400     35.1500     35.5000
+   1783.7000   1586.3500     35.1500     35.5000
+   1784.2000   1586.3600     35.1500     35.5000
+   1784.8000   1586.3700     35.1500     35.5000
+   1785.4000   1586.3800     35.1500     35.5000
+   1786.0000   1586.3900     35.1500     35.5000
+   1786.6000   1586.4000     35.1500     35.5000
+   1787.1000   1586.4100     35.1500     35.5000
+   1787.7000   1586.4200     35.1500     35.5000
+   1788.3000   1586.4300     35.1500     35.5000
+   1788.9000   1586.4400     35.1500     35.5000
+   1789.5000   1586.4500     35.1500     35.5000
+   1790.0000   1586.4600     35.1500     35.5000
+   1790.6000   1586.4700     35.1500     35.5000
+   1791.2000   1586.4800     35.1500     35.5000
+   1791.8000   1586.4900     35.1500     35.5000
+   1792.4000   1586.5000     35.1500     35.5000
+   1792.9000   1586.5100     35.1500     35.5000
+   1793.5000   1586.5200     35.1500     35.5000
+   1794.1000   1586.5300     35.1500     35.5000
+   1794.7000   1586.5300     35.1500     35.5000
+   1795.3000   1586.5400     35.1500     35.5000
+   1795.8000   1586.5500     35.1500     35.5000
+   1796.4000   1586.5600     35.1500     35.5000
+   1797.0000   1586.5700     35.1500     35.5000
+   1797.6000   1586.5800     35.1500     35.5000
+   1798.2000   1586.5900     35.1500     35.5000
+   1798.7000   1586.6000     35.1500     35.5000
+   1799.3000   1586.6100     35.1500     35.5000
+   1799.9000   1586.6200     35.1500     35.5000
+   1800.5000   1586.6300     35.1500     35.5000
+   1801.0000   1586.6400     35.1500     35.5000
+   1801.6000   1586.6500     35.1500     35.5000
+   1802.2000   1586.6600     35.1500     35.5000
+   1802.8000   1586.6700     35.1500     35.5000
+   1803.4000   1586.6800     35.1500     35.5000
+   1803.9000   1586.6900     35.1500     35.5000
+   1804.5000   1586.7000     35.1500     35.5000
+   1805.1000   1586.7100     35.1500     35.5000
+   1805.7000   1586.7200     35.1500     35.5000
+   1806.3000   1586.7300     35.1500     35.5000
+   1806.8000   1586.7400     35.1500     35.5000
+   1807.4000   1586.7500     35.1500     35.5000
+   1808.0000   1586.7600     35.1500     35.5000
+   1808.6000   1586.7700     35.1500     35.5000
+   1809.1000   1586.7800     35.1500     35.5000
+   1809.7000   1586.7900     35.1500     35.5000
+   1810.3000   1586.8000     35.1500     35.5000
+   1810.9000   1586.8100     35.1500     35.5000
+   1811.5000   1586.8200     35.1500     35.5000
+   1812.0000   1586.8300     35.1500     35.5000
+   1812.6000   1586.8400     35.1500     35.5000
+   1813.2000   1586.8500     35.1500     35.5000
+   1813.8000   1586.8600     35.1500     35.5000
+   1814.3000   1586.8700     35.1500     35.5000
+   1814.9000   1586.8800     35.1500     35.5000
+   1815.5000   1586.8900     35.1500     35.5000
+   1816.1000   1586.9000     35.1500     35.5000
+   1816.7000   1586.9100     35.1500     35.5000
+   1817.2000   1586.9100     35.1500     35.5000
+   1817.8000   1586.9200     35.1500     35.5000
+   1818.4000   1586.9300     35.1500     35.5000
+   1819.0000   1586.9400     35.1500     35.5000
+   1819.6000   1586.9500     35.1500     35.5000
+   1820.1000   1586.9600     35.1500     35.5000
+   1820.7000   1586.9700     35.1500     35.5000
+   1821.3000   1586.9800     35.1500     35.5000
+   1821.9000   1586.9900     35.1500     35.5000
+   1822.4000   1587.0000     35.1500     35.5000
+   1823.0000   1587.0100     35.1500     35.5000
+   1823.6000   1587.0200     35.1500     35.5000
+   1824.2000   1587.0300     35.1500     35.5000
+   1824.7000   1587.0400     35.1500     35.5000
+   1825.3000   1587.0500     35.1500     35.5000
+   1825.9000   1587.0600     35.1500     35.5000
+   1826.5000   1587.0700     35.1500     35.5000
+   1827.1000   1587.0800     35.1500     35.5000
+   1827.6000   1587.0900     35.1500     35.5000
+   1828.2000   1587.1000     35.1500     35.5000
+   1828.8000   1587.1100     35.1500     35.5000
+   1829.4000   1587.1200     35.1500     35.5000
+   1829.9000   1587.1300     35.1500     35.5000
+   1830.5000   1587.1400     35.1500     35.5000
@@ -0,0 +1,1585 @@
+test_read_store_and_write
+1/1/2011
+13:27:58
+Probe: T-7
+Source: /root/package/data/input/sippican/T7_00007.EDF
+      0.0000   1510.7100     38.0000     15.1700
+      0.7000   1506.4700     38.0000     13.8300
+      1.3000   1505.0400     38.0000     13.3900
+      2.0000   1504.6500     38.0000     13.2700
+      2.7000   1504.5500     38.0000     13.2300
+      3.3000   1504.5200     38.0000     13.2200
+      4.0000   1504.5100     38.0000     13.2100
+      4.7000   1504.4900     38.0000     13.2000
+      5.4000   1504.3900     38.0000     13.1700
+      6.0000   1504.3100     38.0000     13.1400
+      6.7000   1504.4300     38.0000     13.1700
+      7.4000   1504.5000     38.0000     13.1900
+      8.0000   1504.5200     38.0000     13.2000
+      8.7000   1504.5300     38.0000     13.2000
+      9.4000   1504.5400     38.0000     13.1900
+     10.0000   1504.5300     38.0000     13.1900
+     10.7000   1504.5300     38.0000     13.1800
+     11.4000   1504.5500     38.0000     13.1900
+     12.0000   1504.5600     38.0000     13.1900
+     12.7000   1504.5600     38.0000     13.1800
+     13.4000   1504.5700     38.0000     13.1800
+     14.0000   1504.5600     38.0000     13.1800
+     14.7000   1504.5800     38.0000     13.1800
+     15.4000   1504.6000     38.0000     13.1800
+     16.0000   1504.5700     38.0000     13.1700
+     16.7000   1504.5800     38.0000     13.1700
+     17.4000   1504.6000     38.0000     13.1700
+     18.0000   1504.6400     38.0000     13.1800
+     18.7000   1504.6400     38.0000     13.1800
+     19.4000   1504.6600     38.0000     13.1800
+     20.1000   1504.6700     38.0000     13.1800
+     20.7000   1504.6700     38.0000     13.1800
+     21.4000   1504.6800     38.0000     13.1800
+     22.1000   1504.6700     38.0000     13.1700
+     22.7000   1504.6500     38.0000     13.1600
+     23.4000   1504.6600     38.0000     13.1600
+     24.1000   1504.6600     38.0000     13.1600
+     24.7000   1504.6800     38.0000     13.1600
+     25.4000   1504.6700     38.0000     13.1600
+     26.1000   1504.6700     38.0000     13.1500
+     26.7000   1504.6600     38.0000     13.1400
+     27.4000   1504.6600     38.0000     13.1400
+     28.1000   1504.6800     38.0000     13.1400
+     28.7000   1504.6800     38.0000     13.1400
+     29.4000   1504.6900     38.0000     13.1400
+     30.1000   1504.6800     38.0000     13.1300
+     30.7000   1504.6400     38.0000     13.1200
+     31.4000   1504.6200     38.0000     13.1100
+     32.1000   1504.6100     38.0000     13.1000
+     32.7000   1504.6200     38.0000     13.1000
+     33.4000   1504.6400     38.0000     13.1000
+     34.1000   1504.6500     38.0000     13.1100
+     34.7000   1504.6700     38.0000     13.1100
+     35.4000   1504.6800     38.0000     13.1100
+     36.1000   1504.6900     38.0000     13.1100
+     36.7000   1504.7200     38.0000     13.1100
+     37.4000   1504.7300     38.0000     13.1100
+     38.1000   1504.7400     38.0000     13.1100
+     38.7000   1504.7600     38.0000     13.1100
+     39.4000   1504.7800     38.0000     13.1200
+     40.1000   1504.7900     38.0000     13.1200
+     40.7000   1504.7900     38.0000     13.1100
+     41.4000   1504.7900     38.0000     13.1100
+     42.1000   1504.7900     38.0000     13.1100
+     42.7000   1504.8000     38.0000     13.1100
+     43.4000   1504.8100     38.0000     13.1100
+     44.1000   1504.8100     38.0000     13.1000
+     44.7000   1504.8200     38.0000     13.1000
+     45.4000   1504.8300     38.0000     13.1000
+     46.1000   1504.8400     38.0000     13.1000
+     46.7000   1504.8600     38.0000     13.1000
+     47.4000   1504.8800     38.0000     13.1100
+     48.1000   1504.9100     38.0000     13.1100
+     48.7000   1504.9400     38.0000     13.1200
+     49.4000   1504.9500     38.0000     13.1200
+     50.1000   1504.9600     38.0000     13.1200
+     50.7000   1504.9700     38.0000     13.1200
+     51.4000   1504.9700     38.0000     13.1200
+     52.1000   1504.9900     38.0000     13.1200
+     52.7000   1504.9900     38.0000     13.1100
+     53.4000   1504.9800     38.0000     13.1100
+     54.0000   1504.9500     38.0000     13.0900
+     54.7000   1504.8800     38.0000     13.0700
+     55.4000   1504.8400     38.0000     13.0500
+     56.0000   1504.8100     38.0000     13.0400
+     56.7000   1504.8100     38.0000     13.0400
+     57.4000   1504.8000     38.0000     13.0300
+     58.0000   1504.8100     38.0000     13.0300
+     58.7000   1504.8200     38.0000     13.0300
+     59.4000   1504.8400     38.0000     13.0300
+     60.0000   1504.8500     38.0000     13.0300
+     60.7000   1504.8600     38.0000     13.0300
+     61.4000   1504.8600     38.0000     13.0300
+     62.0000   1504.8600     38.0000     13.0300
+     62.7000   1504.8600     38.0000     13.0200
+     63.4000   1504.8700     38.0000     13.0200
+     64.0000   1504.8800     38.0000     13.0200
+     64.7000   1504.8800     38.0000     13.0200
+     65.4000   1504.8900     38.0000     13.0200
+     66.0000   1504.9000     38.0000     13.0200
+     66.7000   1504.9100     38.0000     13.0200
+     67.3000   1504.9100     38.0000     13.0200
+     68.0000   1504.9200     38.0000     13.0200
+     68.7000   1504.9300     38.0000     13.0200
+     69.3000   1504.9500     38.0000     13.0200
+     70.0000   1504.9600     38.0000     13.0200
+     70.7000   1504.9700     38.0000     13.0200
+     71.3000   1504.9700     38.0000     13.0100
+     72.0000   1504.9800     38.0000     13.0100
+     72.7000   1504.9900     38.0000     13.0100
+     73.3000   1504.9800     38.0000     13.0100
+     74.0000   1504.9800     38.0000     13.0000
+     74.7000   1504.9800     38.0000     13.0000
+     75.3000   1504.9800     38.0000     13.0000
+     76.0000   1505.0000     38.0000     13.0000
+     76.6000   1504.9900     38.0000     12.9900
+     77.3000   1504.9900     38.0000     12.9900
+     78.0000   1504.9900     38.0000     12.9900
+     78.6000   1504.9800     38.0000     12.9800
+     79.3000   1504.9700     38.0000     12.9700
+     80.0000   1504.9700     38.0000     12.9700
+     80.6000   1504.9800     38.0000     12.9700
+     81.3000   1505.0100     38.0000     12.9700
+     82.0000   1505.0300     38.0000     12.9800
+     82.6000   1505.0300     38.0000     12.9800
+     83.3000   1505.0500     38.0000     12.9800
+     83.9000   1505.0700     38.0000     12.9800
+     84.6000   1505.1000     38.0000     12.9900
+     85.3000   1505.1100     38.0000     12.9900
+     85.9000   1505.1200     38.0000     12.9900
+     86.6000   1505.1400     38.0000     12.9900
+     87.3000   1505.1600     38.0000     12.9900
+     87.9000   1505.1600     38.0000     12.9900
+     88.6000   1505.1700     38.0000     12.9900
+     89.3000   1505.1900     38.0000     12.9900
+     89.9000   1505.2300     38.0000     13.0000
+     90.6000   1505.2500     38.0000     13.0000
+     91.2000   1505.2700     38.0000     13.0000
+     91.9000   1505.2800     38.0000     13.0100
+     92.6000   1505.3100     38.0000     13.0100
+     93.2000   1505.3300     38.0000     13.0100
+     93.9000   1505.3500     38.0000     13.0200
+     94.6000   1505.3700     38.0000     13.0200
+     95.2000   1505.4000     38.0000     13.0200
+     95.9000   1505.4100     38.0000     13.0200
+     96.5000   1505.4300     38.0000     13.0300
+     97.2000   1505.4500     38.0000     13.0300
+     97.9000   1505.4900     38.0000     13.0400
+     98.5000   1505.5100     38.0000     13.0400
+     99.2000   1505.5200     38.0000     13.0400
+     99.9000   1505.5400     38.0000     13.0400
+    100.5000   1505.5700     38.0000     13.0500
+    101.2000   1505.6000     38.0000     13.0500
+    101.8000   1505.6300     38.0000     13.0600
+    102.5000   1505.6600     38.0000     13.0700
+    103.2000   1505.6800     38.0000     13.0700
+    103.8000   1505.6900     38.0000     13.0700
+    104.5000   1505.7000     38.0000     13.0700
+    105.2000   1505.7300     38.0000     13.0700
+    105.8000   1505.7500     38.0000     13.0800
+    106.5000   1505.7700     38.0000     13.0800
+    107.1000   1505.7900     38.0000     13.0800
+    107.8000   1505.8100     38.0000     13.0800
+    108.5000   1505.8200     38.0000     13.0800
+    109.1000   1505.8400     38.0000     13.0900
+    109.8000   1505.8800     38.0000     13.1000
+    110.5000   1505.8900     38.0000     13.1000
+    111.1000   1505.9100     38.0000     13.1000
+    111.8000   1505.9200     38.0000     13.1000
+    112.4000   1505.9500     38.0000     13.1000
+    113.1000   1505.9600     38.0000     13.1000
+    113.8000   1505.9900     38.0000     13.1100
+    114.4000   1505.9900     38.0000     13.1100
+    115.1000   1506.0000     38.0000     13.1100
+    115.7000   1506.0200     38.0000     13.1100
+    116.4000   1506.0200     38.0000     13.1100
+    117.1000   1506.0200     38.0000     13.1000
+    117.7000   1506.0400     38.0000     13.1100
+    118.4000   1506.0500     38.0000     13.1100
+    119.0000   1506.0500     38.0000     13.1000
+    119.7000   1506.0500     38.0000     13.1000
+    120.4000   1506.0700     38.0000     13.1000
+    121.0000   1506.0800     38.0000     13.1000
+    121.7000   1506.1000     38.0000     13.1000
+    122.4000   1506.1000     38.0000     13.1000
+    123.0000   1506.1000     38.0000     13.1000
+    123.7000   1506.1000     38.0000     13.1000
+    124.3000   1506.1200     38.0000     13.1000
+    125.0000   1506.1300     38.0000     13.1000
+    125.7000   1506.1500     38.0000     13.1000
+    126.3000   1506.1600     38.0000     13.1000
+    127.0000   1506.1700     38.0000     13.1000
+    127.6000   1506.1700     38.0000     13.1000
+    128.3000   1506.2000     38.0000     13.1000
+    129.0000   1506.2100     38.0000     13.1000
+    129.6000   1506.2200     38.0000     13.1000
+    130.3000   1506.2400     38.0000     13.1000
+    130.9000   1506.2500     38.0000     13.1000
+    131.6000   1506.2500     38.0000     13.1000
+    132.3000   1506.2600     38.0000     13.1000
+    132.9000   1506.2700     38.0000     13.1000
+    133.6000   1506.2900     38.0000     13.1000
+    134.2000   1506.3000     38.0000     13.1000
+    134.9000   1506.3000     38.0000     13.1000
+    135.6000   1506.3100     38.0000     13.1000
+    136.2000   1506.3300     38.0000     13.1000
+    136.9000   1506.3300     38.0000     13.1000
+    137.5000   1506.3400     38.0000     13.1000
+    138.2000   1506.3400     38.0000     13.0900
+    138.9000   1506.3600     38.0000     13.1000
+    139.5000   1506.3700     38.0000     13.1000
+    140.2000   1506.3700     38.0000     13.0900
+    140.8000   1506.3800     38.0000     13.0900
+    141.5000   1506.3900     38.0000     13.0900
+    142.2000   1506.4100     38.0000     13.1000
+    142.8000   1506.4200     38.0000     13.1000
+    143.5000   1506.4200     38.0000     13.0900
+    144.1000   1506.4200     38.0000     13.0900
+    144.8000   1506.4300     38.0000     13.0900
+    145.5000   1506.4300     38.0000     13.0900
+    146.1000   1506.4300     38.0000     13.0800
+    146.8000   1506.4600     38.0000     13.0900
+    147.4000   1506.4700     38.0000     13.0900
+    148.1000   1506.4800     38.0000     13.0900
+    148.7000   1506.5000     38.0000     13.0900
+    149.4000   1506.5000     38.0000     13.0900
+    150.1000   1506.5100     38.0000     13.0900
+    150.7000   1506.5000     38.0000     13.0800
+    151.4000   1506.5000     38.0000     13.0800
+    152.0000   1506.4700     38.0000     13.0700
+    152.7000   1506.4500     38.0000     13.0600
+    153.4000   1506.4500     38.0000     13.0500
+    154.0000   1506.4600     38.0000     13.0500
+    154.7000   1506.4600     38.0000     13.0500
+    155.3000   1506.4600     38.0000     13.0400
+    156.0000   1506.4600     38.0000     13.0400
+    156.7000   1506.4700     38.0000     13.0400
+    157.3000   1506.4800     38.0000     13.0400
+    158.0000   1506.4900     38.0000     13.0400
+    158.6000   1506.4900     38.0000     13.0400
+    159.3000   1506.4900     38.0000     13.0400
+    159.9000   1506.5100     38.0000     13.0400
+    160.6000   1506.5200     38.0000     13.0400
+    161.3000   1506.5300     38.0000     13.0400
+    161.9000   1506.5300     38.0000     13.0300
+    162.6000   1506.5400     38.0000     13.0300
+    163.2000   1506.5500     38.0000     13.0300
+    163.9000   1506.5700     38.0000     13.0300
+    164.6000   1506.5800     38.0000     13.0300
+    165.2000   1506.6000     38.0000     13.0400
+    165.9000   1506.6200     38.0000     13.0400
+    166.5000   1506.6400     38.0000     13.0400
+    167.2000   1506.6600     38.0000     13.0400
+    167.8000   1506.6600     38.0000     13.0400
+    168.5000   1506.6800     38.0000     13.0400
+    169.2000   1506.7000     38.0000     13.0500
+    169.8000   1506.7100     38.0000     13.0500
+    170.5000   1506.7100     38.0000     13.0500
+    171.1000   1506.7200     38.0000     13.0500
+    171.8000   1506.7200     38.0000     13.0400
+    172.4000   1506.7400     38.0000     13.0400
+    173.1000   1506.7600     38.0000     13.0500
+    173.8000   1506.7700     38.0000     13.0500
+    174.4000   1506.7700     38.0000     13.0400
+    175.1000   1506.7800     38.0000     13.0400
+    175.7000   1506.7900     38.0000     13.0400
+    176.4000   1506.7900     38.0000     13.0400
+    177.0000   1506.8000     38.0000     13.0400
+    177.7000   1506.8100     38.0000     13.0400
+    178.4000   1506.8200     38.0000     13.0400
+    179.0000   1506.8300     38.0000     13.0400
+    179.7000   1506.8500     38.0000     13.0400
+    180.3000   1506.8800     38.0000     13.0500
+    181.0000   1506.9100     38.0000     13.0500
+    181.6000   1506.9500     38.0000     13.0600
+    182.3000   1506.9800     38.0000     13.0700
+    183.0000   1507.0100     38.0000     13.0700
+    183.6000   1507.0400     38.0000     13.0800
+    184.3000   1507.0600     38.0000     13.0800
+    184.9000   1507.0700     38.0000     13.0800
+    185.6000   1507.0900     38.0000     13.0800
+    186.2000   1507.1100     38.0000     13.0900
+    186.9000   1507.1300     38.0000     13.0900
+    187.6000   1507.1400     38.0000     13.0900
+    188.2000   1507.1600     38.0000     13.0900
+    188.9000   1507.1800     38.0000     13.1000
+    189.5000   1507.2000     38.0000     13.1000
+    190.2000   1507.2200     38.0000     13.1000
+    190.8000   1507.2400     38.0000     13.1000
+    191.5000   1507.2700     38.0000     13.1100
+    192.1000   1507.3000     38.0000     13.1200
+    192.8000   1507.3200     38.0000     13.1200
+    193.5000   1507.3500     38.0000     13.1200
+    194.1000   1507.3700     38.0000     13.1300
+    194.8000   1507.4000     38.0000     13.1300
+    195.4000   1507.4100     38.0000     13.1300
+    196.1000   1507.4300     38.0000     13.1300
+    196.7000   1507.4300     38.0000     13.1300
+    197.4000   1507.4200     38.0000     13.1200
+    198.0000   1507.4200     38.0000     13.1200
+    198.7000   1507.4500     38.0000     13.1300
+    199.4000   1507.4500     38.0000     13.1300
+    200.0000   1507.4600     38.0000     13.1200
+    200.7000   1507.4600     38.0000     13.1200
+    201.3000   1507.4500     38.0000     13.1200
+    202.0000   1507.4200     38.0000     13.1000
+    202.6000   1507.4000     38.0000     13.0900
+    203.3000   1507.4100     38.0000     13.0900
+    203.9000   1507.4100     38.0000     13.0900
+    204.6000   1507.4000     38.0000     13.0800
+    205.3000   1507.4100     38.0000     13.0800
+    205.9000   1507.4200     38.0000     13.0800
+    206.6000   1507.4500     38.0000     13.0900
+    207.2000   1507.4800     38.0000     13.0900
+    207.9000   1507.5200     38.0000     13.1000
+    208.5000   1507.5400     38.0000     13.1100
+    209.2000   1507.5600     38.0000     13.1100
+    209.8000   1507.5800     38.0000     13.1100
+    210.5000   1507.5800     38.0000     13.1100
+    211.2000   1507.5800     38.0000     13.1000
+    211.8000   1507.5600     38.0000     13.0900
+    212.5000   1507.5500     38.0000     13.0900
+    213.1000   1507.5400     38.0000     13.0800
+    213.8000   1507.5500     38.0000     13.0800
+    214.4000   1507.5500     38.0000     13.0800
+    215.1000   1507.5600     38.0000     13.0800
+    215.7000   1507.5800     38.0000     13.0800
+    216.4000   1507.6300     38.0000     13.0900
+    217.0000   1507.7000     38.0000     13.1100
+    217.7000   1507.7800     38.0000     13.1300
+    218.4000   1507.8200     38.0000     13.1400
+    219.0000   1507.8400     38.0000     13.1400
+    219.7000   1507.8600     38.0000     13.1500
+    220.3000   1507.8700     38.0000     13.1500
+    221.0000   1507.8600     38.0000     13.1400
+    221.6000   1507.8100     38.0000     13.1200
+    222.3000   1507.7700     38.0000     13.1100
+    222.9000   1507.7600     38.0000     13.1000
+    223.6000   1507.7400     38.0000     13.0900
+    224.2000   1507.7400     38.0000     13.0900
+    224.9000   1507.7500     38.0000     13.0900
+    225.5000   1507.7700     38.0000     13.0900
+    226.2000   1507.7800     38.0000     13.0900
+    226.9000   1507.8000     38.0000     13.0900
+    227.5000   1507.8200     38.0000     13.0900
+    228.2000   1507.8400     38.0000     13.1000
+    228.8000   1507.8800     38.0000     13.1100
+    229.5000   1507.9000     38.0000     13.1100
+    230.1000   1507.9500     38.0000     13.1200
+    230.8000   1508.0100     38.0000     13.1400
+    231.4000   1508.0600     38.0000     13.1500
+    232.1000   1508.1000     38.0000     13.1600
+    232.7000   1508.1500     38.0000     13.1700
+    233.4000   1508.1900     38.0000     13.1800
+    234.0000   1508.2300     38.0000     13.1900
+    234.7000   1508.2800     38.0000     13.2000
+    235.3000   1508.3100     38.0000     13.2100
+    236.0000   1508.3400     38.0000     13.2100
+    236.7000   1508.3600     38.0000     13.2100
+    237.3000   1508.3500     38.0000     13.2100
+    238.0000   1508.3500     38.0000     13.2000
+    238.6000   1508.3500     38.0000     13.2000
+    239.3000   1508.3300     38.0000     13.1900
+    239.9000   1508.3300     38.0000     13.1900
+    240.6000   1508.3300     38.0000     13.1800
+    241.2000   1508.3500     38.0000     13.1900
+    241.9000   1508.3700     38.0000     13.1900
+    242.5000   1508.3900     38.0000     13.1900
+    243.2000   1508.3900     38.0000     13.1900
+    243.8000   1508.4100     38.0000     13.1900
+    244.5000   1508.4200     38.0000     13.1900
+    245.1000   1508.4400     38.0000     13.2000
+    245.8000   1508.4700     38.0000     13.2000
+    246.4000   1508.4900     38.0000     13.2000
+    247.1000   1508.5100     38.0000     13.2100
+    247.7000   1508.5100     38.0000     13.2000
+    248.4000   1508.5200     38.0000     13.2000
+    249.1000   1508.5200     38.0000     13.2000
+    249.7000   1508.5200     38.0000     13.2000
+    250.4000   1508.5300     38.0000     13.1900
+    251.0000   1508.5400     38.0000     13.1900
+    251.7000   1508.5600     38.0000     13.2000
+    252.3000   1508.6100     38.0000     13.2100
+    253.0000   1508.6300     38.0000     13.2100
+    253.6000   1508.6300     38.0000     13.2100
+    254.3000   1508.6100     38.0000     13.2000
+    254.9000   1508.5900     38.0000     13.1900
+    255.6000   1508.6000     38.0000     13.1900
+    256.2000   1508.6200     38.0000     13.1900
+    256.9000   1508.6300     38.0000     13.1900
+    257.5000   1508.6800     38.0000     13.2000
+    258.2000   1508.7100     38.0000     13.2100
+    258.8000   1508.7400     38.0000     13.2200
+    259.5000   1508.7600     38.0000     13.2200
+    260.1000   1508.7700     38.0000     13.2200
+    260.8000   1508.7800     38.0000     13.2200
+    261.4000   1508.8000     38.0000     13.2200
+    262.1000   1508.8300     38.0000     13.2300
+    262.7000   1508.8500     38.0000     13.2300
+    263.4000   1508.8600     38.0000     13.2300
+    264.0000   1508.8700     38.0000     13.2300
+    264.7000   1508.8800     38.0000     13.2300
+    265.3000   1508.9000     38.0000     13.2300
+    266.0000   1508.9200     38.0000     13.2400
+    266.6000   1508.9400     38.0000     13.2400
+    267.3000   1508.9500     38.0000     13.2400
+    267.9000   1508.9600     38.0000     13.2400
+    268.6000   1508.9700     38.0000     13.2400
+    269.2000   1508.9900     38.0000     13.2400
+    269.9000   1509.0100     38.0000     13.2400
+    270.5000   1509.0300     38.0000     13.2500
+    271.2000   1509.0500     38.0000     13.2500
+    271.8000   1509.0700     38.0000     13.2500
+    272.5000   1509.0800     38.0000     13.2500
+    273.2000   1509.0900     38.0000     13.2500
+    273.8000   1509.1100     38.0000     13.2500
+    274.5000   1509.1100     38.0000     13.2500
+    275.1000   1509.1300     38.0000     13.2500
+    275.8000   1509.1700     38.0000     13.2600
+    276.4000   1509.2000     38.0000     13.2700
+    277.1000   1509.2300     38.0000     13.2800
+    277.7000   1509.2700     38.0000     13.2800
+    278.4000   1509.2800     38.0000     13.2800
+    279.0000   1509.2900     38.0000     13.2800
+    279.7000   1509.3100     38.0000     13.2900
+    280.3000   1509.3200     38.0000     13.2900
+    281.0000   1509.3200     38.0000     13.2800
+    281.6000   1509.3300     38.0000     13.2800
+    282.3000   1509.3400     38.0000     13.2800
+    282.9000   1509.3500     38.0000     13.2800
+    283.6000   1509.3500     38.0000     13.2800
+    284.2000   1509.3600     38.0000     13.2800
+    284.9000   1509.3700     38.0000     13.2800
+    285.5000   1509.3800     38.0000     13.2800
+    286.2000   1509.3800     38.0000     13.2700
+    286.8000   1509.3900     38.0000     13.2700
+    287.5000   1509.3900     38.0000     13.2700
+    288.1000   1509.4000     38.0000     13.2700
+    288.7000   1509.4100     38.0000     13.2700
+    289.4000   1509.4100     38.0000     13.2700
+    290.0000   1509.4200     38.0000     13.2700
+    290.7000   1509.4400     38.0000     13.2700
+    291.3000   1509.4500     38.0000     13.2700
+    292.0000   1509.4400     38.0000     13.2600
+    292.6000   1509.4400     38.0000     13.2600
+    293.3000   1509.4600     38.0000     13.2600
+    293.9000   1509.4700     38.0000     13.2600
+    294.6000   1509.4700     38.0000     13.2600
+    295.2000   1509.4600     38.0000     13.2500
+    295.9000   1509.4700     38.0000     13.2500
+    296.5000   1509.4900     38.0000     13.2600
+    297.2000   1509.5000     38.0000     13.2600
+    297.8000   1509.5200     38.0000     13.2600
+    298.5000   1509.5100     38.0000     13.2500
+    299.1000   1509.5100     38.0000     13.2500
+    299.8000   1509.5100     38.0000     13.2500
+    300.4000   1509.5300     38.0000     13.2500
+    301.1000   1509.5400     38.0000     13.2500
+    301.7000   1509.5400     38.0000     13.2400
+    302.4000   1509.5500     38.0000     13.2400
+    303.0000   1509.5600     38.0000     13.2400
+    303.7000   1509.5700     38.0000     13.2500
+    304.3000   1509.5800     38.0000     13.2400
+    305.0000   1509.5900     38.0000     13.2400
+    305.6000   1509.6000     38.0000     13.2400
+    306.3000   1509.6100     38.0000     13.2400
+    306.9000   1509.6400     38.0000     13.2500
+    307.6000   1509.6900     38.0000     13.2600
+    308.2000   1509.7400     38.0000     13.2700
+    308.9000   1509.7900     38.0000     13.2800
+    309.5000   1509.8100     38.0000     13.2900
+    310.2000   1509.8500     38.0000     13.3000
+    310.8000   1509.8700     38.0000     13.3000
+    311.5000   1509.9200     38.0000     13.3100
+    312.1000   1509.9700     38.0000     13.3200
+    312.7000   1510.0300     38.0000     13.3400
+    313.4000   1510.0700     38.0000     13.3500
+    314.0000   1510.0800     38.0000     13.3500
+    314.7000   1510.0700     38.0000     13.3400
+    315.3000   1510.0500     38.0000     13.3300
+    316.0000   1510.0400     38.0000     13.3300
+    316.6000   1510.0400     38.0000     13.3200
+    317.3000   1510.0700     38.0000     13.3300
+    317.9000   1510.1100     38.0000     13.3400
+    318.6000   1510.1300     38.0000     13.3400
+    319.2000   1510.1500     38.0000     13.3400
+    319.9000   1510.1600     38.0000     13.3400
+    320.5000   1510.1500     38.0000     13.3400
+    321.2000   1510.1700     38.0000     13.3400
+    321.8000   1510.2000     38.0000     13.3500
+    322.5000   1510.2200     38.0000     13.3500
+    323.1000   1510.2400     38.0000     13.3500
+    323.8000   1510.2500     38.0000     13.3500
+    324.4000   1510.2700     38.0000     13.3500
+    325.0000   1510.3000     38.0000     13.3600
+    325.7000   1510.3100     38.0000     13.3600
+    326.3000   1510.3100     38.0000     13.3500
+    327.0000   1510.3200     38.0000     13.3600
+    327.6000   1510.3200     38.0000     13.3500
+    328.3000   1510.3300     38.0000     13.3500
+    328.9000   1510.3300     38.0000     13.3500
+    329.6000   1510.3400     38.0000     13.3500
+    330.2000   1510.3500     38.0000     13.3500
+    330.9000   1510.3600     38.0000     13.3500
+    331.5000   1510.3700     38.0000     13.3500
+    332.2000   1510.3900     38.0000     13.3500
+    332.8000   1510.3900     38.0000     13.3500
+    333.5000   1510.3800     38.0000     13.3400
+    334.1000   1510.3700     38.0000     13.3300
+    334.7000   1510.3800     38.0000     13.3400
+    335.4000   1510.4000     38.0000     13.3400
+    336.0000   1510.4100     38.0000     13.3400
+    336.7000   1510.4300     38.0000     13.3400
+    337.3000   1510.4400     38.0000     13.3400
+    338.0000   1510.4400     38.0000     13.3400
+    338.6000   1510.4500     38.0000     13.3400
+    339.3000   1510.4600     38.0000     13.3400
+    339.9000   1510.4700     38.0000     13.3400
+    340.6000   1510.4800     38.0000     13.3400
+    341.2000   1510.5000     38.0000     13.3400
+    341.8000   1510.5100     38.0000     13.3400
+    342.5000   1510.5300     38.0000     13.3400
+    343.1000   1510.5400     38.0000     13.3400
+    343.8000   1510.5400     38.0000     13.3400
+    344.4000   1510.5600     38.0000     13.3400
+    345.1000   1510.5700     38.0000     13.3400
+    345.7000   1510.5800     38.0000     13.3400
+    346.4000   1510.5900     38.0000     13.3400
+    347.0000   1510.6000     38.0000     13.3400
+    347.7000   1510.6100     38.0000     13.3400
+    348.3000   1510.6100     38.0000     13.3400
+    348.9000   1510.6200     38.0000     13.3400
+    349.6000   1510.6300     38.0000     13.3400
+    350.2000   1510.6400     38.0000     13.3400
+    350.9000   1510.6600     38.0000     13.3400
+    351.5000   1510.6700     38.0000     13.3400
+    352.2000   1510.6800     38.0000     13.3400
+    352.8000   1510.6900     38.0000     13.3400
+    353.5000   1510.7000     38.0000     13.3400
+    354.1000   1510.7000     38.0000     13.3300
+    354.8000   1510.7100     38.0000     13.3400
+    355.4000   1510.7400     38.0000     13.3400
+    356.0000   1510.7700     38.0000     13.3500
+    356.7000   1510.8100     38.0000     13.3500
+    357.3000   1510.8300     38.0000     13.3600
+    358.0000   1510.8400     38.0000     13.3600
+    358.6000   1510.8600     38.0000     13.3600
+    359.3000   1510.8800     38.0000     13.3600
+    359.9000   1510.8900     38.0000     13.3600
+    360.6000   1510.9100     38.0000     13.3700
+    361.2000   1510.9100     38.0000     13.3600
+    361.8000   1510.9200     38.0000     13.3600
+    362.5000   1510.9400     38.0000     13.3600
+    363.1000   1510.9500     38.0000     13.3600
+    363.8000   1510.9500     38.0000     13.3600
+    364.4000   1510.9700     38.0000     13.3700
+    365.1000   1510.9900     38.0000     13.3700
+    365.7000   1511.0100     38.0000     13.3700
+    366.4000   1511.0200     38.0000     13.3700
+    367.0000   1511.0300     38.0000     13.3700
+    367.6000   1511.0400     38.0000     13.3700
+    368.3000   1511.0500     38.0000     13.3700
+    368.9000   1511.0600     38.0000     13.3700
+    369.6000   1511.0800     38.0000     13.3700
+    370.2000   1511.1000     38.0000     13.3800
+    370.9000   1511.1200     38.0000     13.3800
+    371.5000   1511.1300     38.0000     13.3800
+    372.1000   1511.1400     38.0000     13.3800
+    372.8000   1511.1700     38.0000     13.3800
+    373.4000   1511.1800     38.0000     13.3800
+    374.1000   1511.2100     38.0000     13.3900
+    374.7000   1511.2500     38.0000     13.4000
+    375.4000   1511.2800     38.0000     13.4000
+    376.0000   1511.3000     38.0000     13.4100
+    376.7000   1511.3200     38.0000     13.4100
+    377.3000   1511.3300     38.0000     13.4100
+    377.9000   1511.3400     38.0000     13.4100
+    378.6000   1511.3400     38.0000     13.4100
+    379.2000   1511.3500     38.0000     13.4100
+    379.9000   1511.3600     38.0000     13.4100
+    380.5000   1511.3700     38.0000     13.4100
+    381.2000   1511.3800     38.0000     13.4100
+    381.8000   1511.4000     38.0000     13.4100
+    382.4000   1511.4200     38.0000     13.4100
+    383.1000   1511.4300     38.0000     13.4100
+    383.7000   1511.4500     38.0000     13.4100
+    384.4000   1511.4600     38.0000     13.4100
+    385.0000   1511.4800     38.0000     13.4200
+    385.7000   1511.5200     38.0000     13.4200
+    386.3000   1511.5600     38.0000     13.4300
+    386.9000   1511.5900     38.0000     13.4400
+    387.6000   1511.6000     38.0000     13.4400
+    388.2000   1511.6100     38.0000     13.4400
+    388.9000   1511.6200     38.0000     13.4400
+    389.5000   1511.6300     38.0000     13.4400
+    390.1000   1511.6400     38.0000     13.4400
+    390.8000   1511.6600     38.0000     13.4400
+    391.4000   1511.6600     38.0000     13.4400
+    392.1000   1511.6600     38.0000     13.4400
+    392.7000   1511.6700     38.0000     13.4400
+    393.4000   1511.6700     38.0000     13.4300
+    394.0000   1511.6700     38.0000     13.4300
+    394.6000   1511.6800     38.0000     13.4300
+    395.3000   1511.7100     38.0000     13.4400
+    395.9000   1511.7100     38.0000     13.4300
+    396.6000   1511.7100     38.0000     13.4300
+    397.2000   1511.7100     38.0000     13.4300
+    397.9000   1511.7300     38.0000     13.4300
+    398.5000   1511.7400     38.0000     13.4300
+    399.1000   1511.7500     38.0000     13.4300
+    399.8000   1511.7700     38.0000     13.4300
+    400.4000   1511.7900     38.0000     13.4300
+    401.1000   1511.7900     38.0000     13.4300
+    401.7000   1511.7900     38.0000     13.4300
+    402.3000   1511.8100     38.0000     13.4300
+    403.0000   1511.8300     38.0000     13.4300
+    403.6000   1511.8400     38.0000     13.4300
+    404.3000   1511.8500     38.0000     13.4300
+    404.9000   1511.8600     38.0000     13.4300
+    405.6000   1511.8700     38.0000     13.4300
+    406.2000   1511.8800     38.0000     13.4300
+    406.8000   1511.8900     38.0000     13.4300
+    407.5000   1511.9000     38.0000     13.4300
+    408.1000   1511.9200     38.0000     13.4300
+    408.8000   1511.9400     38.0000     13.4400
+    409.4000   1511.9400     38.0000     13.4400
+    410.0000   1511.9600     38.0000     13.4400
+    410.7000   1511.9600     38.0000     13.4300
+    411.3000   1511.9700     38.0000     13.4300
+    412.0000   1511.9900     38.0000     13.4400
+    412.6000   1512.0100     38.0000     13.4400
+    413.2000   1512.0300     38.0000     13.4400
+    413.9000   1512.0500     38.0000     13.4500
+    414.5000   1512.0700     38.0000     13.4500
+    415.2000   1512.0900     38.0000     13.4500
+    415.8000   1512.1000     38.0000     13.4500
+    416.4000   1512.1200     38.0000     13.4500
+    417.1000   1512.1200     38.0000     13.4500
+    417.7000   1512.1300     38.0000     13.4500
+    418.4000   1512.1200     38.0000     13.4400
+    419.0000   1512.1100     38.0000     13.4400
+    419.6000   1512.1100     38.0000     13.4300
+    420.3000   1512.1100     38.0000     13.4300
+    420.9000   1512.1200     38.0000     13.4300
+    421.6000   1512.1100     38.0000     13.4300
+    422.2000   1512.1200     38.0000     13.4300
+    422.8000   1512.1400     38.0000     13.4300
+    423.5000   1512.1600     38.0000     13.4300
+    424.1000   1512.1700     38.0000     13.4300
+    424.8000   1512.1800     38.0000     13.4300
+    425.4000   1512.1800     38.0000     13.4300
+    426.0000   1512.2000     38.0000     13.4300
+    426.7000   1512.2100     38.0000     13.4300
+    427.3000   1512.2300     38.0000     13.4300
+    428.0000   1512.2400     38.0000     13.4300
+    428.6000   1512.2600     38.0000     13.4400
+    429.2000   1512.2800     38.0000     13.4400
+    429.9000   1512.3100     38.0000     13.4400
+    430.5000   1512.3300     38.0000     13.4500
+    431.2000   1512.3600     38.0000     13.4500
+    431.8000   1512.3900     38.0000     13.4600
+    432.4000   1512.4100     38.0000     13.4600
+    433.1000   1512.4200     38.0000     13.4600
+    433.7000   1512.4300     38.0000     13.4600
+    434.4000   1512.4500     38.0000     13.4600
+    435.0000   1512.4600     38.0000     13.4600
+    435.6000   1512.4800     38.0000     13.4600
+    436.3000   1512.4900     38.0000     13.4700
+    436.9000   1512.5000     38.0000     13.4600
+    437.6000   1512.5200     38.0000     13.4700
+    438.2000   1512.5200     38.0000     13.4700
+    438.8000   1512.5300     38.0000     13.4700
+    439.5000   1512.5500     38.0000     13.4700
+    440.1000   1512.5500     38.0000     13.4700
+    440.8000   1512.5600     38.0000     13.4700
+    441.4000   1512.5800     38.0000     13.4700
+    442.0000   1512.5900     38.0000     13.4700
+    442.7000   1512.6100     38.0000     13.4700
+    443.3000   1512.6100     38.0000     13.4700
+    443.9000   1512.6300     38.0000     13.4700
+    444.6000   1512.6500     38.0000     13.4700
+    445.2000   1512.6500     38.0000     13.4700
+    445.9000   1512.6700     38.0000     13.4700
+    446.5000   1512.6900     38.0000     13.4700
+    447.1000   1512.7100     38.0000     13.4800
+    447.8000   1512.7100     38.0000     13.4800
+    448.4000   1512.7200     38.0000     13.4800
+    449.1000   1512.7300     38.0000     13.4800
+    449.7000   1512.7400     38.0000     13.4700
+    450.3000   1512.7500     38.0000     13.4700
+    451.0000   1512.7600     38.0000     13.4700
+    451.6000   1512.7700     38.0000     13.4700
+    452.2000   1512.7800     38.0000     13.4700
+    452.9000   1512.7800     38.0000     13.4700
+    453.5000   1512.7900     38.0000     13.4700
+    454.2000   1512.8000     38.0000     13.4700
+    454.8000   1512.8100     38.0000     13.4700
+    455.4000   1512.8300     38.0000     13.4700
+    456.1000   1512.8300     38.0000     13.4700
+    456.7000   1512.8300     38.0000     13.4700
+    457.3000   1512.8400     38.0000     13.4700
+    458.0000   1512.8500     38.0000     13.4700
+    458.6000   1512.8600     38.0000     13.4700
+    459.3000   1512.8700     38.0000     13.4700
+    459.9000   1512.8700     38.0000     13.4600
+    460.5000   1512.8600     38.0000     13.4600
+    461.2000   1512.8700     38.0000     13.4600
+    461.8000   1512.8800     38.0000     13.4600
+    462.4000   1512.8800     38.0000     13.4500
+    463.1000   1512.8800     38.0000     13.4500
+    463.7000   1512.8800     38.0000     13.4500
+    464.4000   1512.8800     38.0000     13.4400
+    465.0000   1512.8800     38.0000     13.4400
+    465.6000   1512.8900     38.0000     13.4400
+    466.3000   1512.9100     38.0000     13.4400
+    466.9000   1512.9300     38.0000     13.4400
+    467.5000   1512.9400     38.0000     13.4400
+    468.2000   1512.9400     38.0000     13.4400
+    468.8000   1512.9500     38.0000     13.4400
+    469.5000   1512.9600     38.0000     13.4400
+    470.1000   1512.9600     38.0000     13.4400
+    470.7000   1512.9700     38.0000     13.4400
+    471.4000   1512.9900     38.0000     13.4400
+    472.0000   1513.0100     38.0000     13.4400
+    472.6000   1513.0200     38.0000     13.4400
+    473.3000   1513.0300     38.0000     13.4400
+    473.9000   1513.0400     38.0000     13.4400
+    474.5000   1513.0400     38.0000     13.4400
+    475.2000   1513.0600     38.0000     13.4400
+    475.8000   1513.0600     38.0000     13.4400
+    476.5000   1513.0700     38.0000     13.4400
+    477.1000   1513.0900     38.0000     13.4400
+    477.7000   1513.1100     38.0000     13.4400
+    478.4000   1513.1100     38.0000     13.4400
+    479.0000   1513.1200     38.0000     13.4400
+    479.6000   1513.1400     38.0000     13.4400
+    480.3000   1513.1500     38.0000     13.4500
+    480.9000   1513.1600     38.0000     13.4400
+    481.5000   1513.1700     38.0000     13.4400
+    482.2000   1513.1600     38.0000     13.4400
+    482.8000   1513.1800     38.0000     13.4400
+    483.4000   1513.1800     38.0000     13.4400
+    484.1000   1513.1900     38.0000     13.4400
+    484.7000   1513.2000     38.0000     13.4400
+    485.4000   1513.2100     38.0000     13.4400
+    486.0000   1513.2200     38.0000     13.4400
+    486.6000   1513.2300     38.0000     13.4400
+    487.3000   1513.2400     38.0000     13.4400
+    487.9000   1513.2400     38.0000     13.4300
+    488.5000   1513.2500     38.0000     13.4300
+    489.2000   1513.2600     38.0000     13.4300
+    489.8000   1513.2800     38.0000     13.4400
+    490.4000   1513.2900     38.0000     13.4400
+    491.1000   1513.3000     38.0000     13.4400
+    491.7000   1513.3100     38.0000     13.4400
+    492.3000   1513.3100     38.0000     13.4300
+    493.0000   1513.3400     38.0000     13.4400
+    493.6000   1513.3400     38.0000     13.4400
+    494.3000   1513.3400     38.0000     13.4300
+    494.9000   1513.3600     38.0000     13.4400
+    495.5000   1513.3700     38.0000     13.4400
+    496.2000   1513.3700     38.0000     13.4300
+    496.8000   1513.3800     38.0000     13.4300
+    497.4000   1513.3900     38.0000     13.4300
+    498.1000   1513.4100     38.0000     13.4300
+    498.7000   1513.4200     38.0000     13.4300
+    499.3000   1513.4200     38.0000     13.4300
+    500.0000   1513.4200     38.0000     13.4300
+    500.6000   1513.4200     38.0000     13.4200
+    501.2000   1513.4300     38.0000     13.4200
+    501.9000   1513.4000     38.0000     13.4100
+    502.5000   1513.3700     38.0000     13.4000
+    503.1000   1513.3600     38.0000     13.3900
+    503.8000   1513.3700     38.0000     13.3900
+    504.4000   1513.3700     38.0000     13.3900
+    505.0000   1513.3700     38.0000     13.3900
+    505.7000   1513.3700     38.0000     13.3800
+    506.3000   1513.3800     38.0000     13.3800
+    506.9000   1513.3900     38.0000     13.3800
+    507.6000   1513.4000     38.0000     13.3800
+    508.2000   1513.4000     38.0000     13.3800
+    508.8000   1513.4000     38.0000     13.3800
+    509.5000   1513.4200     38.0000     13.3800
+    510.1000   1513.4300     38.0000     13.3800
+    510.7000   1513.4400     38.0000     13.3800
+    511.4000   1513.4600     38.0000     13.3800
+    512.0000   1513.4700     38.0000     13.3800
+    512.6000   1513.4900     38.0000     13.3800
+    513.3000   1513.5000     38.0000     13.3900
+    513.9000   1513.5200     38.0000     13.3900
+    514.5000   1513.5100     38.0000     13.3800
+    515.2000   1513.5300     38.0000     13.3800
+    515.8000   1513.5400     38.0000     13.3800
+    516.4000   1513.5500     38.0000     13.3800
+    517.1000   1513.5500     38.0000     13.3800
+    517.7000   1513.5700     38.0000     13.3800
+    518.3000   1513.5900     38.0000     13.3900
+    519.0000   1513.5900     38.0000     13.3800
+    519.6000   1513.6000     38.0000     13.3800
+    520.2000   1513.5900     38.0000     13.3800
+    520.9000   1513.6100     38.0000     13.3800
+    521.5000   1513.6100     38.0000     13.3800
+    522.1000   1513.5900     38.0000     13.3700
+    522.8000   1513.6000     38.0000     13.3700
+    523.4000   1513.6200     38.0000     13.3700
+    524.0000   1513.6300     38.0000     13.3700
+    524.7000   1513.6400     38.0000     13.3700
+    525.3000   1513.6600     38.0000     13.3700
+    525.9000   1513.6700     38.0000     13.3700
+    526.6000   1513.6800     38.0000     13.3700
+    527.2000   1513.6700     38.0000     13.3700
+    527.8000   1513.6800     38.0000     13.3700
+    528.5000   1513.6800     38.0000     13.3600
+    529.1000   1513.6900     38.0000     13.3600
+    529.7000   1513.7000     38.0000     13.3600
+    530.4000   1513.7100     38.0000     13.3600
+    531.0000   1513.7300     38.0000     13.3600
+    531.6000   1513.7500     38.0000     13.3700
+    532.3000   1513.7700     38.0000     13.3700
+    532.9000   1513.7900     38.0000     13.3700
+    533.5000   1513.8000     38.0000     13.3800
+    534.2000   1513.8200     38.0000     13.3800
+    534.8000   1513.8300     38.0000     13.3800
+    535.4000   1513.8400     38.0000     13.3800
+    536.1000   1513.8500     38.0000     13.3800
+    536.7000   1513.8500     38.0000     13.3700
+    537.3000   1513.8700     38.0000     13.3800
+    538.0000   1513.8800     38.0000     13.3800
+    538.6000   1513.8900     38.0000     13.3800
+    539.2000   1513.9000     38.0000     13.3700
+    539.9000   1513.9000     38.0000     13.3700
+    540.5000   1513.9100     38.0000     13.3700
+    541.1000   1513.9300     38.0000     13.3800
+    541.7000   1513.9400     38.0000     13.3800
+    542.4000   1513.9600     38.0000     13.3800
+    543.0000   1513.9700     38.0000     13.3800
+    543.6000   1513.9800     38.0000     13.3800
+    544.3000   1513.9800     38.0000     13.3800
+    544.9000   1514.0000     38.0000     13.3800
+    545.5000   1514.0000     38.0000     13.3700
+    546.2000   1514.0100     38.0000     13.3700
+    546.8000   1514.0200     38.0000     13.3700
+    547.4000   1514.0200     38.0000     13.3700
+    548.1000   1514.0300     38.0000     13.3700
+    548.7000   1514.0500     38.0000     13.3700
+    549.3000   1514.0500     38.0000     13.3700
+    550.0000   1514.0500     38.0000     13.3700
+    550.6000   1514.0500     38.0000     13.3600
+    551.2000   1514.0600     38.0000     13.3600
+    551.8000   1514.0800     38.0000     13.3700
+    552.5000   1514.0900     38.0000     13.3700
+    553.1000   1514.1000     38.0000     13.3700
+    553.7000   1514.1100     38.0000     13.3700
+    554.4000   1514.1200     38.0000     13.3700
+    555.0000   1514.1300     38.0000     13.3700
+    555.6000   1514.1400     38.0000     13.3700
+    556.3000   1514.1600     38.0000     13.3700
+    556.9000   1514.1700     38.0000     13.3700
+    557.5000   1514.1700     38.0000     13.3700
+    558.2000   1514.1800     38.0000     13.3600
+    558.8000   1514.1800     38.0000     13.3600
+    559.4000   1514.1900     38.0000     13.3600
+    560.0000   1514.2100     38.0000     13.3600
+    560.7000   1514.2100     38.0000     13.3600
+    561.3000   1514.2200     38.0000     13.3600
+    561.9000   1514.2400     38.0000     13.3600
+    562.6000   1514.2400     38.0000     13.3600
+    563.2000   1514.2400     38.0000     13.3600
+    563.8000   1514.2500     38.0000     13.3600
+    564.5000   1514.2600     38.0000     13.3600
+    565.1000   1514.2700     38.0000     13.3600
+    565.7000   1514.2800     38.0000     13.3600
+    566.3000   1514.2900     38.0000     13.3600
+    567.0000   1514.3000     38.0000     13.3600
+    567.6000   1514.3000     38.0000     13.3500
+    568.2000   1514.3100     38.0000     13.3500
+    568.9000   1514.3200     38.0000     13.3500
+    569.5000   1514.3400     38.0000     13.3600
+    570.1000   1514.3500     38.0000     13.3600
+    570.8000   1514.3500     38.0000     13.3500
+    571.4000   1514.3700     38.0000     13.3600
+    572.0000   1514.3900     38.0000     13.3600
+    572.6000   1514.3900     38.0000     13.3600
+    573.3000   1514.4000     38.0000     13.3600
+    573.9000   1514.4000     38.0000     13.3500
+    574.5000   1514.4100     38.0000     13.3500
+    575.2000   1514.4200     38.0000     13.3500
+    575.8000   1514.4300     38.0000     13.3500
+    576.4000   1514.4400     38.0000     13.3500
+    577.0000   1514.4400     38.0000     13.3500
+    577.7000   1514.4500     38.0000     13.3500
+    578.3000   1514.4600     38.0000     13.3500
+    578.9000   1514.4700     38.0000     13.3500
+    579.6000   1514.4900     38.0000     13.3500
+    580.2000   1514.5000     38.0000     13.3500
+    580.8000   1514.5200     38.0000     13.3600
+    581.5000   1514.5300     38.0000     13.3500
+    582.1000   1514.5300     38.0000     13.3500
+    582.7000   1514.5400     38.0000     13.3500
+    583.3000   1514.5500     38.0000     13.3500
+    584.0000   1514.5700     38.0000     13.3500
+    584.6000   1514.5600     38.0000     13.3500
+    585.2000   1514.5700     38.0000     13.3500
+    585.9000   1514.5900     38.0000     13.3500
+    586.5000   1514.6100     38.0000     13.3500
+    587.1000   1514.6300     38.0000     13.3600
+    587.7000   1514.6500     38.0000     13.3600
+    588.4000   1514.6700     38.0000     13.3600
+    589.0000   1514.6900     38.0000     13.3600
+    589.6000   1514.7000     38.0000     13.3700
+    590.2000   1514.7100     38.0000     13.3700
+    590.9000   1514.7200     38.0000     13.3700
+    591.5000   1514.7300     38.0000     13.3700
+    592.1000   1514.7400     38.0000     13.3600
+    592.8000   1514.7500     38.0000     13.3600
+    593.4000   1514.7700     38.0000     13.3700
+    594.0000   1514.7800     38.0000     13.3700
+    594.6000   1514.7900     38.0000     13.3700
+    595.3000   1514.7900     38.0000     13.3600
+    595.9000   1514.7900     38.0000     13.3600
+    596.5000   1514.7900     38.0000     13.3600
+    597.2000   1514.8000     38.0000     13.3600
+    597.8000   1514.8000     38.0000     13.3500
+    598.4000   1514.8100     38.0000     13.3500
+    599.0000   1514.8200     38.0000     13.3500
+    599.7000   1514.8200     38.0000     13.3500
+    600.3000   1514.8300     38.0000     13.3500
+    600.9000   1514.8400     38.0000     13.3500
+    601.5000   1514.8500     38.0000     13.3500
+    602.2000   1514.8500     38.0000     13.3500
+    602.8000   1514.8700     38.0000     13.3500
+    603.4000   1514.8600     38.0000     13.3400
+    604.1000   1514.8600     38.0000     13.3400
+    604.7000   1514.8700     38.0000     13.3400
+    605.3000   1514.8800     38.0000     13.3400
+    605.9000   1514.8800     38.0000     13.3400
+    606.6000   1514.9000     38.0000     13.3400
+    607.2000   1514.9000     38.0000     13.3400
+    607.8000   1514.9100     38.0000     13.3400
+    608.4000   1514.9200     38.0000     13.3400
+    609.1000   1514.9300     38.0000     13.3400
+    609.7000   1514.9500     38.0000     13.3400
+    610.3000   1514.9400     38.0000     13.3400
+    611.0000   1514.9400     38.0000     13.3300
+    611.6000   1514.9600     38.0000     13.3300
+    612.2000   1514.9800     38.0000     13.3400
+    612.8000   1515.0000     38.0000     13.3400
+    613.5000   1515.0000     38.0000     13.3400
+    614.1000   1515.0000     38.0000     13.3300
+    614.7000   1515.0200     38.0000     13.3400
+    615.3000   1515.0300     38.0000     13.3400
+    616.0000   1515.0400     38.0000     13.3300
+    616.6000   1515.0600     38.0000     13.3400
+    617.2000   1515.0700     38.0000     13.3400
+    617.8000   1515.0700     38.0000     13.3400
+    618.5000   1515.0800     38.0000     13.3400
+    619.1000   1515.0900     38.0000     13.3300
+    619.7000   1515.0900     38.0000     13.3300
+    620.3000   1515.1100     38.0000     13.3300
+    621.0000   1515.1200     38.0000     13.3400
+    621.6000   1515.1300     38.0000     13.3400
+    622.2000   1515.1500     38.0000     13.3400
+    622.9000   1515.1500     38.0000     13.3400
+    623.5000   1515.1600     38.0000     13.3400
+    624.1000   1515.1800     38.0000     13.3400
+    624.7000   1515.1900     38.0000     13.3400
+    625.4000   1515.2000     38.0000     13.3400
+    626.0000   1515.2100     38.0000     13.3400
+    626.6000   1515.2200     38.0000     13.3400
+    627.2000   1515.2300     38.0000     13.3400
+    627.9000   1515.2500     38.0000     13.3400
+    628.5000   1515.2500     38.0000     13.3400
+    629.1000   1515.2600     38.0000     13.3400
+    629.7000   1515.2700     38.0000     13.3400
+    630.4000   1515.2900     38.0000     13.3400
+    631.0000   1515.2900     38.0000     13.3400
+    631.6000   1515.3000     38.0000     13.3300
+    632.2000   1515.3000     38.0000     13.3300
+    632.9000   1515.3000     38.0000     13.3300
+    633.5000   1515.3200     38.0000     13.3300
+    634.1000   1515.3300     38.0000     13.3300
+    634.7000   1515.3300     38.0000     13.3300
+    635.4000   1515.3400     38.0000     13.3300
+    636.0000   1515.3500     38.0000     13.3300
+    636.6000   1515.3700     38.0000     13.3300
+    637.2000   1515.3800     38.0000     13.3300
+    637.9000   1515.3900     38.0000     13.3300
+    638.5000   1515.4000     38.0000     13.3300
+    639.1000   1515.4000     38.0000     13.3300
+    639.7000   1515.4200     38.0000     13.3300
+    640.4000   1515.4300     38.0000     13.3300
+    641.0000   1515.4400     38.0000     13.3300
+    641.6000   1515.4500     38.0000     13.3300
+    642.2000   1515.4600     38.0000     13.3300
+    642.9000   1515.4700     38.0000     13.3300
+    643.5000   1515.4800     38.0000     13.3300
+    644.1000   1515.4900     38.0000     13.3300
+    644.7000   1515.5100     38.0000     13.3300
+    645.4000   1515.5200     38.0000     13.3300
+    646.0000   1515.5300     38.0000     13.3400
+    646.6000   1515.5500     38.0000     13.3400
+    647.2000   1515.5700     38.0000     13.3400
+    647.8000   1515.5900     38.0000     13.3400
+    648.5000   1515.6100     38.0000     13.3400
+    649.1000   1515.6300     38.0000     13.3500
+    649.7000   1515.6400     38.0000     13.3500
+    650.3000   1515.6500     38.0000     13.3500
+    651.0000   1515.6700     38.0000     13.3500
+    651.6000   1515.6800     38.0000     13.3500
+    652.2000   1515.6800     38.0000     13.3500
+    652.8000   1515.6800     38.0000     13.3400
+    653.5000   1515.6900     38.0000     13.3400
+    654.1000   1515.7000     38.0000     13.3400
+    654.7000   1515.7100     38.0000     13.3500
+    655.3000   1515.7100     38.0000     13.3400
+    656.0000   1515.7400     38.0000     13.3500
+    656.6000   1515.7400     38.0000     13.3400
+    657.2000   1515.7500     38.0000     13.3400
+    657.8000   1515.7700     38.0000     13.3500
+    658.4000   1515.7700     38.0000     13.3400
+    659.1000   1515.7800     38.0000     13.3400
+    659.7000   1515.7900     38.0000     13.3400
+    660.3000   1515.7900     38.0000     13.3400
+    660.9000   1515.8000     38.0000     13.3400
+    661.6000   1515.8000     38.0000     13.3400
+    662.2000   1515.8100     38.0000     13.3400
+    662.8000   1515.8200     38.0000     13.3400
+    663.4000   1515.8200     38.0000     13.3400
+    664.1000   1515.8400     38.0000     13.3400
+    664.7000   1515.8400     38.0000     13.3300
+    665.3000   1515.8500     38.0000     13.3300
+    665.9000   1515.8600     38.0000     13.3400
+    666.5000   1515.8700     38.0000     13.3300
+    667.2000   1515.8800     38.0000     13.3300
+    667.8000   1515.8900     38.0000     13.3300
+    668.4000   1515.9000     38.0000     13.3300
+    669.0000   1515.9100     38.0000     13.3300
+    669.7000   1515.9300     38.0000     13.3400
+    670.3000   1515.9400     38.0000     13.3400
+    670.9000   1515.9500     38.0000     13.3400
+    671.5000   1515.9700     38.0000     13.3400
+    672.2000   1515.9700     38.0000     13.3400
+    672.8000   1515.9900     38.0000     13.3400
+    673.4000   1516.0000     38.0000     13.3400
+    674.0000   1516.0000     38.0000     13.3400
+    674.6000   1516.0200     38.0000     13.3400
+    675.3000   1516.0300     38.0000     13.3400
+    675.9000   1516.0400     38.0000     13.3400
+    676.5000   1516.0400     38.0000     13.3300
+    677.1000   1516.0500     38.0000     13.3300
+    677.7000   1516.0700     38.0000     13.3400
+    678.4000   1516.0800     38.0000     13.3400
+    679.0000   1516.0900     38.0000     13.3400
+    679.6000   1516.1000     38.0000     13.3400
+    680.2000   1516.1100     38.0000     13.3400
+    680.9000   1516.1200     38.0000     13.3400
+    681.5000   1516.1300     38.0000     13.3400
+    682.1000   1516.1400     38.0000     13.3400
+    682.7000   1516.1500     38.0000     13.3400
+    683.3000   1516.1600     38.0000     13.3400
+    684.0000   1516.1600     38.0000     13.3300
+    684.6000   1516.1800     38.0000     13.3400
+    685.2000   1516.1900     38.0000     13.3400
+    685.8000   1516.2000     38.0000     13.3400
+    686.5000   1516.2000     38.0000     13.3400
+    687.1000   1516.2100     38.0000     13.3300
+    687.7000   1516.2200     38.0000     13.3300
+    688.3000   1516.2300     38.0000     13.3300
+    688.9000   1516.2400     38.0000     13.3300
+    689.6000   1516.2400     38.0000     13.3300
+    690.2000   1516.2500     38.0000     13.3300
+    690.8000   1516.2700     38.0000     13.3300
+    691.4000   1516.2800     38.0000     13.3300
+    692.0000   1516.2800     38.0000     13.3300
+    692.7000   1516.2900     38.0000     13.3300
+    693.3000   1516.3000     38.0000     13.3300
+    693.9000   1516.3100     38.0000     13.3300
+    694.5000   1516.3200     38.0000     13.3300
+    695.1000   1516.3300     38.0000     13.3300
+    695.8000   1516.3400     38.0000     13.3300
+    696.4000   1516.3500     38.0000     13.3300
+    697.0000   1516.3600     38.0000     13.3300
+    697.6000   1516.3800     38.0000     13.3300
+    698.2000   1516.3800     38.0000     13.3300
+    698.9000   1516.3900     38.0000     13.3300
+    699.5000   1516.4100     38.0000     13.3300
+    700.1000   1516.4100     38.0000     13.3300
+    700.7000   1516.4200     38.0000     13.3300
+    701.3000   1516.4200     38.0000     13.3300
+    702.0000   1516.4400     38.0000     13.3300
+    702.6000   1516.4600     38.0000     13.3300
+    703.2000   1516.4700     38.0000     13.3300
+    703.8000   1516.4800     38.0000     13.3300
+    704.4000   1516.4900     38.0000     13.3300
+    705.1000   1516.4800     38.0000     13.3200
+    705.7000   1516.4800     38.0000     13.3200
+    706.3000   1516.4900     38.0000     13.3200
+    706.9000   1516.5000     38.0000     13.3200
+    707.5000   1516.5100     38.0000     13.3200
+    708.2000   1516.5300     38.0000     13.3300
+    708.8000   1516.5400     38.0000     13.3300
+    709.4000   1516.5600     38.0000     13.3300
+    710.0000   1516.5600     38.0000     13.3300
+    710.6000   1516.5700     38.0000     13.3200
+    711.3000   1516.5800     38.0000     13.3300
+    711.9000   1516.5900     38.0000     13.3200
+    712.5000   1516.6000     38.0000     13.3200
+    713.1000   1516.6100     38.0000     13.3200
+    713.7000   1516.6200     38.0000     13.3200
+    714.4000   1516.6300     38.0000     13.3200
+    715.0000   1516.6500     38.0000     13.3300
+    715.6000   1516.6600     38.0000     13.3300
+    716.2000   1516.6700     38.0000     13.3300
+    716.8000   1516.6800     38.0000     13.3300
+    717.5000   1516.6800     38.0000     13.3200
+    718.1000   1516.6900     38.0000     13.3200
+    718.7000   1516.7200     38.0000     13.3300
+    719.3000   1516.7200     38.0000     13.3300
+    719.9000   1516.7300     38.0000     13.3300
+    720.5000   1516.7400     38.0000     13.3300
+    721.2000   1516.7400     38.0000     13.3200
+    721.8000   1516.7600     38.0000     13.3200
+    722.4000   1516.7700     38.0000     13.3200
+    723.0000   1516.7800     38.0000     13.3300
+    723.6000   1516.7900     38.0000     13.3200
+    724.3000   1516.7900     38.0000     13.3200
+    724.9000   1516.8100     38.0000     13.3300
+    725.5000   1516.8000     38.0000     13.3200
+    726.1000   1516.8200     38.0000     13.3200
+    726.7000   1516.8200     38.0000     13.3200
+    727.4000   1516.8400     38.0000     13.3200
+    728.0000   1516.8500     38.0000     13.3200
+    728.6000   1516.8600     38.0000     13.3200
+    729.2000   1516.8700     38.0000     13.3200
+    729.8000   1516.8800     38.0000     13.3200
+    730.4000   1516.9000     38.0000     13.3200
+    731.1000   1516.9100     38.0000     13.3200
+    731.7000   1516.9100     38.0000     13.3200
+    732.3000   1516.9300     38.0000     13.3200
+    732.9000   1516.9400     38.0000     13.3300
+    733.5000   1516.9600     38.0000     13.3300
+    734.2000   1516.9600     38.0000     13.3300
+    734.8000   1516.9700     38.0000     13.3200
+    735.4000   1516.9800     38.0000     13.3200
+    736.0000   1516.9700     38.0000     13.3200
+    736.6000   1516.9900     38.0000     13.3200
+    737.2000   1517.0000     38.0000     13.3200
+    737.9000   1517.0100     38.0000     13.3200
+    738.5000   1517.0100     38.0000     13.3200
+    739.1000   1517.0100     38.0000     13.3100
+    739.7000   1517.0200     38.0000     13.3200
+    740.3000   1517.0400     38.0000     13.3200
+    740.9000   1517.0500     38.0000     13.3200
+    741.6000   1517.0500     38.0000     13.3200
+    742.2000   1517.0600     38.0000     13.3100
+    742.8000   1517.0700     38.0000     13.3100
+    743.4000   1517.0800     38.0000     13.3100
+    744.0000   1517.0900     38.0000     13.3100
+    744.6000   1517.1000     38.0000     13.3200
+    745.3000   1517.1100     38.0000     13.3100
+    745.9000   1517.1300     38.0000     13.3200
+    746.5000   1517.1300     38.0000     13.3200
+    747.1000   1517.1400     38.0000     13.3100
+    747.7000   1517.1500     38.0000     13.3100
+    748.3000   1517.1500     38.0000     13.3100
+    749.0000   1517.1600     38.0000     13.3100
+    749.6000   1517.1800     38.0000     13.3100
+    750.2000   1517.1800     38.0000     13.3100
+    750.8000   1517.1900     38.0000     13.3100
+    751.4000   1517.2000     38.0000     13.3100
+    752.0000   1517.2000     38.0000     13.3100
+    752.7000   1517.2100     38.0000     13.3100
+    753.3000   1517.2200     38.0000     13.3100
+    753.9000   1517.2400     38.0000     13.3100
+    754.5000   1517.2600     38.0000     13.3100
+    755.1000   1517.2600     38.0000     13.3100
+    755.7000   1517.2600     38.0000     13.3100
+    756.4000   1517.2700     38.0000     13.3100
+    757.0000   1517.2800     38.0000     13.3100
+    757.6000   1517.2800     38.0000     13.3000
+    758.2000   1517.3000     38.0000     13.3100
+    758.8000   1517.3000     38.0000     13.3000
+    759.4000   1517.3200     38.0000     13.3100
+    760.1000   1517.3200     38.0000     13.3000
+    760.7000   1517.3200     38.0000     13.3000
+    761.3000   1517.3400     38.0000     13.3000
+    761.9000   1517.3500     38.0000     13.3000
+    762.5000   1517.3600     38.0000     13.3000
+    763.1000   1517.3600     38.0000     13.3000
+    763.8000   1517.3700     38.0000     13.3000
+    764.4000   1517.3800     38.0000     13.3000
+    765.0000   1517.3900     38.0000     13.3000
+    765.6000   1517.4000     38.0000     13.3000
+    766.2000   1517.4100     38.0000     13.3000
+    766.8000   1517.4100     38.0000     13.3000
+    767.4000   1517.4200     38.0000     13.3000
+    768.1000   1517.4400     38.0000     13.3000
+    768.7000   1517.4500     38.0000     13.3000
+    769.3000   1517.4500     38.0000     13.3000
+    769.9000   1517.4600     38.0000     13.3000
+    770.5000   1517.4700     38.0000     13.3000
+    771.1000   1517.4900     38.0000     13.3000
+    771.8000   1517.5000     38.0000     13.3000
+    772.4000   1517.5100     38.0000     13.3000
+    773.0000   1517.5300     38.0000     13.3000
+    773.6000   1517.5400     38.0000     13.3000
+    774.2000   1517.5500     38.0000     13.3000
+    774.8000   1517.5500     38.0000     13.3000
+    775.4000   1517.5600     38.0000     13.3000
+    776.1000   1517.5600     38.0000     13.3000
+    776.7000   1517.5800     38.0000     13.3000
+    777.3000   1517.5900     38.0000     13.3000
+    777.9000   1517.5900     38.0000     13.3000
+    778.5000   1517.6000     38.0000     13.3000
+    779.1000   1517.6000     38.0000     13.2900
+    779.7000   1517.6200     38.0000     13.3000
+    780.4000   1517.6300     38.0000     13.2900
+    781.0000   1517.6300     38.0000     13.2900
+    781.6000   1517.6300     38.0000     13.2900
+    782.2000   1517.6500     38.0000     13.2900
+    782.8000   1517.6400     38.0000     13.2900
+    783.4000   1517.6500     38.0000     13.2800
+    784.0000   1517.6600     38.0000     13.2800
+    784.7000   1517.6700     38.0000     13.2900
+    785.3000   1517.7000     38.0000     13.2900
+    785.9000   1517.7100     38.0000     13.2900
+    786.5000   1517.7200     38.0000     13.2900
+    787.1000   1517.7300     38.0000     13.2900
+    787.7000   1517.7500     38.0000     13.3000
+    788.3000   1517.7400     38.0000     13.2900
+    789.0000   1517.7500     38.0000     13.2900
+    789.6000   1517.7600     38.0000     13.2900
+    790.2000   1517.7700     38.0000     13.2900
+    790.8000   1517.7700     38.0000     13.2900
+    791.4000   1517.8000     38.0000     13.2900
+    792.0000   1517.8000     38.0000     13.2900
+    792.6000   1517.8100     38.0000     13.2900
+    793.2000   1517.8300     38.0000     13.2900
+    793.9000   1517.8400     38.0000     13.2900
+    794.5000   1517.8500     38.0000     13.2900
+    795.1000   1517.8600     38.0000     13.2900
+    795.7000   1517.8700     38.0000     13.2900
+    796.3000   1517.8800     38.0000     13.2900
+    796.9000   1517.8900     38.0000     13.2900
+    797.5000   1517.9100     38.0000     13.2900
+    798.2000   1517.9100     38.0000     13.2900
+    798.8000   1517.9100     38.0000     13.2900
+    799.4000   1517.9300     38.0000     13.2900
+    800.0000   1517.9500     38.0000     13.2900
+    800.6000   1517.9600     38.0000     13.2900
+    801.2000   1517.9500     38.0000     13.2900
+    801.8000   1517.9400     38.0000     13.2800
+    802.4000   1517.9400     38.0000     13.2800
+    803.1000   1517.9600     38.0000     13.2800
+    803.7000   1517.9700     38.0000     13.2800
+    804.3000   1517.9800     38.0000     13.2800
+    804.9000   1517.9900     38.0000     13.2800
+    805.5000   1517.9900     38.0000     13.2800
+    806.1000   1518.0000     38.0000     13.2800
+    806.7000   1518.0100     38.0000     13.2800
+    807.3000   1518.0200     38.0000     13.2800
+    808.0000   1518.0400     38.0000     13.2800
+    808.6000   1518.0400     38.0000     13.2800
+    809.2000   1518.0500     38.0000     13.2800
+    809.8000   1518.0600     38.0000     13.2800
+    810.4000   1518.0600     38.0000     13.2800
+    811.0000   1518.0600     38.0000     13.2700
+    811.6000   1518.0700     38.0000     13.2700
+    812.2000   1518.0900     38.0000     13.2700
+    812.9000   1518.1000     38.0000     13.2700
+    813.5000   1518.1000     38.0000     13.2700
+    814.1000   1518.1100     38.0000     13.2700
+    814.7000   1518.1200     38.0000     13.2700
+    815.3000   1518.1200     38.0000     13.2700
+    815.9000   1518.1300     38.0000     13.2700
+    816.5000   1518.1500     38.0000     13.2700
+    817.1000   1518.1500     38.0000     13.2700
+    817.7000   1518.1600     38.0000     13.2700
+    818.4000   1518.1700     38.0000     13.2700
+    819.0000   1518.1800     38.0000     13.2700
+    819.6000   1518.1900     38.0000     13.2700
+    820.2000   1518.2100     38.0000     13.2700
+    820.8000   1518.2000     38.0000     13.2700
+    821.4000   1518.2200     38.0000     13.2700
+    822.0000   1518.2400     38.0000     13.2700
+    822.6000   1518.2500     38.0000     13.2700
+    823.3000   1518.2600     38.0000     13.2700
+    823.9000   1518.2600     38.0000     13.2700
+    824.5000   1518.2700     38.0000     13.2700
+    825.1000   1518.2900     38.0000     13.2700
+    825.7000   1518.3000     38.0000     13.2700
+    826.3000   1518.3100     38.0000     13.2700
+    826.9000   1518.3200     38.0000     13.2700
+    827.5000   1518.3400     38.0000     13.2700
+    828.1000   1518.3400     38.0000     13.2700
+    828.8000   1518.3500     38.0000     13.2700
+    829.4000   1518.3600     38.0000     13.2700
+    830.0000   1518.3700     38.0000     13.2700
+    830.6000   1518.3800     38.0000     13.2700
+    831.2000   1518.3900     38.0000     13.2700
+    831.8000   1518.4000     38.0000     13.2700
+    832.4000   1518.4100     38.0000     13.2700
+    833.0000   1518.4200     38.0000     13.2700
+    833.6000   1518.4300     38.0000     13.2700
+    834.2000   1518.4500     38.0000     13.2700
+    834.9000   1518.4600     38.0000     13.2700
+    835.5000   1518.4700     38.0000     13.2700
+    836.1000   1518.4700     38.0000     13.2700
+    836.7000   1518.4800     38.0000     13.2700
+    837.3000   1518.4900     38.0000     13.2700
+    837.9000   1518.5100     38.0000     13.2700
+    838.5000   1518.5200     38.0000     13.2700
+    839.1000   1518.5300     38.0000     13.2700
+    839.7000   1518.5300     38.0000     13.2700
+    840.3000   1518.5300     38.0000     13.2700
+    841.0000   1518.5500     38.0000     13.2700
+    841.6000   1518.5600     38.0000     13.2700
+    842.2000   1518.5800     38.0000     13.2700
+    842.8000   1518.5800     38.0000     13.2700
+    843.4000   1518.6000     38.0000     13.2700
+    844.0000   1518.6000     38.0000     13.2700
+    844.6000   1518.6100     38.0000     13.2700
+    845.2000   1518.6200     38.0000     13.2700
+    845.8000   1518.6300     38.0000     13.2700
+    846.4000   1518.6300     38.0000     13.2700
+    847.1000   1518.6500     38.0000     13.2700
+    847.7000   1518.6700     38.0000     13.2700
+    848.3000   1518.6800     38.0000     13.2700
+    848.9000   1518.6900     38.0000     13.2700
+    849.5000   1518.7000     38.0000     13.2700
+    850.1000   1518.7100     38.0000     13.2700
+    850.7000   1518.7300     38.0000     13.2700
+    851.3000   1518.7300     38.0000     13.2700
+    851.9000   1518.7400     38.0000     13.2700
+    852.5000   1518.7500     38.0000     13.2700
+    853.1000   1518.7600     38.0000     13.2700
+    853.8000   1518.7600     38.0000     13.2700
+    854.4000   1518.7700     38.0000     13.2700
+    855.0000   1518.7700     38.0000     13.2700
+    855.6000   1518.7800     38.0000     13.2700
+    856.2000   1518.7900     38.0000     13.2600
+    856.8000   1518.7900     38.0000     13.2600
+    857.4000   1518.8100     38.0000     13.2600
+    858.0000   1518.8200     38.0000     13.2700
+    858.6000   1518.8200     38.0000     13.2600
+    859.2000   1518.8300     38.0000     13.2600
+    859.8000   1518.8400     38.0000     13.2600
+    860.5000   1518.8500     38.0000     13.2600
+    861.1000   1518.8600     38.0000     13.2600
+    861.7000   1518.8700     38.0000     13.2600
+    862.3000   1518.8900     38.0000     13.2600
+    862.9000   1518.9000     38.0000     13.2600
+    863.5000   1518.9000     38.0000     13.2600
+    864.1000   1518.9100     38.0000     13.2600
+    864.7000   1518.9200     38.0000     13.2600
+    865.3000   1518.9300     38.0000     13.2600
+    865.9000   1518.9300     38.0000     13.2600
+    866.5000   1518.9500     38.0000     13.2600
+    867.1000   1518.9500     38.0000     13.2600
+    867.8000   1518.9600     38.0000     13.2600
+    868.4000   1518.9700     38.0000     13.2600
+    869.0000   1518.9900     38.0000     13.2600
+    869.6000   1518.9900     38.0000     13.2600
+    870.2000   1519.0000     38.0000     13.2600
+    870.8000   1519.0000     38.0000     13.2600
+    871.4000   1519.0100     38.0000     13.2600
+    872.0000   1519.0300     38.0000     13.2600
+    872.6000   1519.0300     38.0000     13.2600
+    873.2000   1519.0400     38.0000     13.2600
+    873.8000   1519.0500     38.0000     13.2600
+    874.4000   1519.0700     38.0000     13.2600
+    875.0000   1519.0900     38.0000     13.2600
+    875.7000   1519.0800     38.0000     13.2600
+    876.3000   1519.0800     38.0000     13.2500
+    876.9000   1519.0900     38.0000     13.2500
+    877.5000   1519.0900     38.0000     13.2500
+    878.1000   1519.1100     38.0000     13.2500
+    878.7000   1519.1200     38.0000     13.2500
+    879.3000   1519.1300     38.0000     13.2500
+    879.9000   1519.1400     38.0000     13.2500
+    880.5000   1519.1500     38.0000     13.2500
+    881.1000   1519.1600     38.0000     13.2500
+    881.7000   1519.1700     38.0000     13.2500
+    882.3000   1519.1800     38.0000     13.2500
+    882.9000   1519.1800     38.0000     13.2500
+    883.5000   1519.1900     38.0000     13.2500
+    884.2000   1519.2000     38.0000     13.2500
+    884.8000   1519.2100     38.0000     13.2500
+    885.4000   1519.2300     38.0000     13.2500
+    886.0000   1519.2300     38.0000     13.2500
+    886.6000   1519.2400     38.0000     13.2500
+    887.2000   1519.2500     38.0000     13.2500
+    887.8000   1519.2600     38.0000     13.2500
+    888.4000   1519.2700     38.0000     13.2500
+    889.0000   1519.2900     38.0000     13.2500
+    889.6000   1519.2900     38.0000     13.2500
+    890.2000   1519.3000     38.0000     13.2500
+    890.8000   1519.3000     38.0000     13.2500
+    891.4000   1519.3300     38.0000     13.2500
+    892.0000   1519.3300     38.0000     13.2500
+    892.6000   1519.3400     38.0000     13.2500
+    893.2000   1519.3500     38.0000     13.2500
+    893.9000   1519.3600     38.0000     13.2500
+    894.5000   1519.3600     38.0000     13.2500
+    895.1000   1519.3700     38.0000     13.2500
+    895.7000   1519.3700     38.0000     13.2400
+    896.3000   1519.3700     38.0000     13.2400
+    896.9000   1519.3800     38.0000     13.2400
+    897.5000   1519.3800     38.0000     13.2400
+    898.1000   1519.4000     38.0000     13.2400
+    898.7000   1519.4200     38.0000     13.2400
+    899.3000   1519.4300     38.0000     13.2400
+    899.9000   1519.4400     38.0000     13.2400
+    900.5000   1519.4500     38.0000     13.2400
+    901.1000   1519.4600     38.0000     13.2400
+    901.7000   1519.4700     38.0000     13.2400
+    902.3000   1519.4700     38.0000     13.2400
+    902.9000   1519.4800     38.0000     13.2400
+    903.5000   1519.4900     38.0000     13.2400
+    904.1000   1519.5000     38.0000     13.2400
+    904.8000   1519.5100     38.0000     13.2400
+    905.4000   1519.5100     38.0000     13.2400
+    906.0000   1519.5200     38.0000     13.2400
+    906.6000   1519.5400     38.0000     13.2400
+    907.2000   1519.5300     38.0000     13.2400
+    907.8000   1519.5500     38.0000     13.2400
+    908.4000   1519.5600     38.0000     13.2400
+    909.0000   1519.5600     38.0000     13.2300
+    909.6000   1519.5800     38.0000     13.2400
+    910.2000   1519.5900     38.0000     13.2400
+    910.8000   1519.5900     38.0000     13.2400
+    911.4000   1519.6000     38.0000     13.2300
+    912.0000   1519.6100     38.0000     13.2300
+    912.6000   1519.6100     38.0000     13.2300
+    913.2000   1519.6300     38.0000     13.2300
+    913.8000   1519.6400     38.0000     13.2300
+    914.4000   1519.6400     38.0000     13.2300
+    915.0000   1519.6500     38.0000     13.2300
+    915.6000   1519.6600     38.0000     13.2300
+    916.2000   1519.6700     38.0000     13.2300
+    916.8000   1519.6900     38.0000     13.2300
+    917.5000   1519.6900     38.0000     13.2300
+    918.1000   1519.7100     38.0000     13.2300
+    918.7000   1519.7200     38.0000     13.2300
+    919.3000   1519.7200     38.0000     13.2300
+    919.9000   1519.7400     38.0000     13.2300
+    920.5000   1519.7300     38.0000     13.2300
+    921.1000   1519.7400     38.0000     13.2300
+    921.7000   1519.7600     38.0000     13.2300
+    922.3000   1519.8700     38.0000     13.2600
+    922.9000   1525.1700     38.0000     14.9100
+    923.5000   1542.9200     38.0000     21.0000
+    924.1000   1556.9400     38.0000     26.6400
+    924.7000   1564.0500     38.0000     29.8900
+    925.3000   1568.8400     38.0000     32.2800
+    925.9000   1572.5500     38.0000     34.2700
+    926.5000   1574.7300     38.0000     35.5000
+    927.1000   1574.7400     38.0000     35.5000
+    927.7000   1574.7500     38.0000     35.5000
+    928.3000   1574.7600     38.0000     35.5000
+    928.9000   1574.7700     38.0000     35.5000
+    929.5000   1574.7800     38.0000     35.5000
+    930.1000   1574.7900     38.0000     35.5000
+    930.7000   1574.8000     38.0000     35.5000
+    931.3000   1574.8100     38.0000     35.5000
+    931.9000   1574.8200     38.0000     35.5000
+    932.5000   1574.8300     38.0000     35.5000
+    933.1000   1574.8400     38.0000     35.5000
+    933.8000   1574.8500     38.0000     35.5000
+    934.4000   1574.8600     38.0000     35.5000
+    935.0000   1574.8700     38.0000     35.5000
+    935.6000   1574.8800     38.0000     35.5000
+    936.2000   1574.8900     38.0000     35.5000
+    936.8000   1574.9000     38.0000     35.5000
+    937.4000   1574.9100     38.0000     35.5000
+    938.0000   1574.9200     38.0000     35.5000
+    938.6000   1574.9300     38.0000     35.5000
+    939.2000   1574.9400     38.0000     35.5000
+    939.8000   1574.9500     38.0000     35.5000
+    940.4000   1574.9600     38.0000     35.5000
+    941.0000   1574.9700     38.0000     35.5000
+    941.6000   1574.9800     38.0000     35.5000
+    942.2000   1574.9900     38.0000     35.5000
+    942.8000   1575.0000     38.0000     35.5000
+    943.4000   1575.0100     38.0000     35.5000
+    944.0000   1575.0200     38.0000     35.5000
+    944.6000   1575.0300     38.0000     35.5000
+    945.2000   1575.0400     38.0000     35.5000
+    945.8000   1575.0500     38.0000     35.5000
+    946.4000   1575.0600     38.0000     35.5000
+    947.0000   1575.0700     38.0000     35.5000
+    947.6000   1575.0800     38.0000     35.5000
+    948.2000   1575.0900     38.0000     35.5000
+    948.8000   1575.1000     38.0000     35.5000
+    949.4000   1575.1100     38.0000     35.5000
+    950.0000   1575.1200     38.0000     35.5000
+    950.6000   1575.1300     38.0000     35.5000
+    951.2000   1575.1400     38.0000     35.5000
+    951.8000   1575.1500     38.0000     35.5000
+    952.4000   1575.1600     38.0000     35.5000
+    953.0000   1575.1700     38.0000     35.5000
+    953.6000   1575.1800     38.0000     35.5000
+    954.2000   1575.1900     38.0000     35.5000
+    954.8000   1575.2000     38.0000     35.5000
+    955.4000   1575.2100     38.0000     35.5000
+    956.0000   1575.2200     38.0000     35.5000
+    956.6000   1575.2300     38.0000     35.5000
+    957.2000   1575.2400     38.0000     35.5000
+    957.8000   1575.2500     38.0000     35.5000
+    958.4000   1575.2600     38.0000     35.5000
+    959.0000   1575.2700     38.0000     35.5000
+    959.6000   1575.2800     38.0000     35.5000
+    960.2000   1575.2900     38.0000     35.5000
+    960.8000   1575.3000     38.0000     35.5000
+    961.4000   1575.3100     38.0000     35.5000
+    962.0000   1575.3200     38.0000     35.5000
+    962.6000   1575.3300     38.0000     35.5000
+    963.2000   1575.3400     38.0000     35.5000
+    963.8000   1575.3500     38.0000     35.5000
+    964.4000   1575.3700     38.0000     35.5000
+    965.0000   1575.3800     38.0000     35.5000
+    965.6000   1575.3900     38.0000     35.5000
+    966.2000   1575.4000     38.0000     35.5000
+    966.8000   1575.4100     38.0000     35.5000
+    967.5000   1575.4200     38.0000     35.5000
+    968.1000   1575.4300     38.0000     35.5000
+    968.7000   1575.4400     38.0000     35.5000
+    969.3000   1575.4500     38.0000     35.5000
+    969.9000   1575.4600     38.0000     35.5000
+    970.5000   1575.4700     38.0000     35.5000
+    971.1000   1575.4800     38.0000     35.5000
+    971.7000   1575.4900     38.0000     35.5000
+    972.3000   1575.5000     38.0000     35.5000
+    972.9000   1575.5100     38.0000     35.5000
+    973.5000   1575.5200     38.0000     35.5000
+    974.1000   1575.5300     38.0000     35.5000
+    974.7000   1575.5400     38.0000     35.5000
+    975.3000   1575.5500     38.0000     35.5000
+    975.9000   1575.5600     38.0000     35.5000
+    976.5000   1575.5700     38.0000     35.5000
+    977.1000   1472.2800     38.0000      0.6700
+    977.7000   1457.3200     38.0000     -2.5300
+    978.3000   1487.9000     38.0000      4.3100
+    978.9000   1457.3400     38.0000     -2.5300
+    979.5000   1457.3500     38.0000     -2.5300
+    980.1000   1475.2900     38.0000      1.3400
+    980.7000   1484.1900     38.0000      3.4100
+    981.3000   1523.5900     38.0000     14.1100
+    981.8000   1530.9100     38.0000     16.4500
+    982.4000   1488.4400     38.0000      4.4300
+    983.0000   1457.4100     38.0000     -2.5300
+    983.6000   1575.6900     38.0000     35.5000
+    984.2000   1575.7000     38.0000     35.5000
+    984.8000   1536.6500     38.0000     18.3800
+    985.4000   1553.8900     38.0000     24.9000
+    986.0000   1575.7300     38.0000     35.5000
+    986.6000   1575.7400     38.0000     35.5000
+    987.2000   1575.7500     38.0000     35.5000
+    987.8000   1575.7600     38.0000     35.5000
+    988.4000   1575.7700     38.0000     35.5000
+    989.0000   1575.7800     38.0000     35.5000
+    989.6000   1575.7900     38.0000     35.5000
+    990.2000   1575.8000     38.0000     35.5000
+    990.8000   1575.8100     38.0000     35.5000
+    991.4000   1575.8200     38.0000     35.5000
+    992.0000   1575.8300     38.0000     35.5000
+    992.6000   1575.8400     38.0000     35.5000
+    993.2000   1575.8500     38.0000     35.5000
+    993.8000   1470.1400     38.0000      0.1400
+    994.4000   1575.8700     38.0000     35.5000
+    995.0000   1575.8800     38.0000     35.5000
+    995.6000   1575.8900     38.0000     35.5000
+    996.2000   1575.9000     38.0000     35.5000
+    996.8000   1575.9100     38.0000     35.5000
+    997.4000   1575.9200     38.0000     35.5000
+    998.0000   1575.9300     38.0000     35.5000
+    998.6000   1575.9400     38.0000     35.5000
+    999.2000   1575.9500     38.0000     35.5000
+    999.8000   1575.9600     38.0000     35.5000
+   1000.4000   1501.1300     38.0000      7.5800
@@ -0,0 +1,1231 @@
+test_read_store_and_write
+1/1/2007
+23:32:2
+Probe: T-7
+Source: /root/package/data/input/sippican/T7_00070.EDF
+      0.0000   1541.4100     37.0000     27.0900
+      0.6000   1542.0000     37.0000     27.3500
+      1.3000   1542.4800     37.0000     27.5600
+      1.9000   1542.5500     37.0000     27.5900
+      2.6000   1542.5600     37.0000     27.5900
+      3.2000   1542.5500     37.0000     27.5800
+      3.9000   1542.5400     37.0000     27.5700
+      4.5000   1542.5300     37.0000     27.5600
+      5.2000   1542.5400     37.0000     27.5600
+      5.8000   1542.5500     37.0000     27.5600
+      6.5000   1542.5500     37.0000     27.5500
+      7.1000   1542.5600     37.0000     27.5500
+      7.8000   1542.5600     37.0000     27.5500
+      8.4000   1542.5700     37.0000     27.5500
+      9.1000   1542.5800     37.0000     27.5500
+      9.7000   1542.5800     37.0000     27.5400
+     10.3000   1542.5900     37.0000     27.5400
+     11.0000   1542.6000     37.0000     27.5400
+     11.6000   1542.6000     37.0000     27.5400
+     12.3000   1542.6200     37.0000     27.5400
+     12.9000   1542.6200     37.0000     27.5400
+     13.6000   1542.6300     37.0000     27.5400
+     14.2000   1542.6300     37.0000     27.5300
+     14.9000   1542.6200     37.0000     27.5200
+     15.5000   1542.6000     37.0000     27.5100
+     16.2000   1542.5600     37.0000     27.4900
+     16.8000   1542.5200     37.0000     27.4600
+     17.5000   1542.4700     37.0000     27.4400
+     18.1000   1542.4300     37.0000     27.4100
+     18.8000   1542.3700     37.0000     27.3800
+     19.4000   1542.3300     37.0000     27.3600
+     20.0000   1542.3200     37.0000     27.3500
+     20.7000   1542.2900     37.0000     27.3300
+     21.3000   1542.2800     37.0000     27.3200
+     22.0000   1542.3000     37.0000     27.3300
+     22.6000   1542.2700     37.0000     27.3100
+     23.3000   1542.2400     37.0000     27.2900
+     23.9000   1542.2100     37.0000     27.2700
+     24.6000   1542.1900     37.0000     27.2500
+     25.2000   1542.1700     37.0000     27.2400
+     25.9000   1542.1500     37.0000     27.2300
+     26.5000   1542.1500     37.0000     27.2200
+     27.1000   1542.1500     37.0000     27.2200
+     27.8000   1542.1600     37.0000     27.2200
+     28.4000   1542.1700     37.0000     27.2200
+     29.1000   1542.1800     37.0000     27.2200
+     29.7000   1542.1900     37.0000     27.2200
+     30.4000   1542.2000     37.0000     27.2200
+     31.0000   1542.2100     37.0000     27.2200
+     31.7000   1542.2200     37.0000     27.2100
+     32.3000   1542.2300     37.0000     27.2200
+     33.0000   1542.2400     37.0000     27.2200
+     33.6000   1542.2500     37.0000     27.2200
+     34.2000   1542.2600     37.0000     27.2200
+     34.9000   1542.2700     37.0000     27.2200
+     35.5000   1542.2800     37.0000     27.2200
+     36.2000   1542.2900     37.0000     27.2200
+     36.8000   1542.3000     37.0000     27.2100
+     37.5000   1542.3200     37.0000     27.2100
+     38.1000   1542.3300     37.0000     27.2200
+     38.8000   1542.3400     37.0000     27.2200
+     39.4000   1542.3500     37.0000     27.2200
+     40.0000   1542.3600     37.0000     27.2200
+     40.7000   1542.3700     37.0000     27.2200
+     41.3000   1542.3800     37.0000     27.2200
+     42.0000   1542.4000     37.0000     27.2200
+     42.6000   1542.4000     37.0000     27.2200
+     43.3000   1542.4100     37.0000     27.2100
+     43.9000   1542.4200     37.0000     27.2100
+     44.6000   1542.4300     37.0000     27.2100
+     45.2000   1542.4400     37.0000     27.2100
+     45.8000   1542.4500     37.0000     27.2100
+     46.5000   1542.4600     37.0000     27.2100
+     47.1000   1542.4800     37.0000     27.2100
+     47.8000   1542.4900     37.0000     27.2100
+     48.4000   1542.5000     37.0000     27.2100
+     49.1000   1542.5100     37.0000     27.2100
+     49.7000   1542.5200     37.0000     27.2200
+     50.4000   1542.5300     37.0000     27.2200
+     51.0000   1542.5400     37.0000     27.2200
+     51.6000   1542.5500     37.0000     27.2100
+     52.3000   1542.5600     37.0000     27.2200
+     52.9000   1542.5800     37.0000     27.2200
+     53.6000   1542.5300     37.0000     27.1900
+     54.2000   1542.5700     37.0000     27.2000
+     54.9000   1542.5500     37.0000     27.1900
+     55.5000   1542.5200     37.0000     27.1700
+     56.1000   1542.5400     37.0000     27.1800
+     56.8000   1542.5200     37.0000     27.1600
+     57.4000   1542.5300     37.0000     27.1600
+     58.1000   1542.5400     37.0000     27.1600
+     58.7000   1542.5500     37.0000     27.1600
+     59.4000   1542.5500     37.0000     27.1600
+     60.0000   1542.5600     37.0000     27.1600
+     60.6000   1542.5700     37.0000     27.1600
+     61.3000   1542.5800     37.0000     27.1500
+     61.9000   1542.5900     37.0000     27.1500
+     62.6000   1542.6000     37.0000     27.1500
+     63.2000   1542.6100     37.0000     27.1500
+     63.9000   1542.6200     37.0000     27.1500
+     64.5000   1542.6300     37.0000     27.1500
+     65.1000   1542.6400     37.0000     27.1500
+     65.8000   1542.6500     37.0000     27.1500
+     66.4000   1542.6600     37.0000     27.1500
+     67.1000   1542.6700     37.0000     27.1500
+     67.7000   1542.6800     37.0000     27.1500
+     68.4000   1542.6900     37.0000     27.1500
+     69.0000   1542.7000     37.0000     27.1500
+     69.6000   1542.7000     37.0000     27.1500
+     70.3000   1542.7200     37.0000     27.1500
+     70.9000   1542.7300     37.0000     27.1500
+     71.6000   1542.7400     37.0000     27.1500
+     72.2000   1542.7500     37.0000     27.1500
+     72.9000   1542.7600     37.0000     27.1500
+     73.5000   1542.7700     37.0000     27.1500
+     74.1000   1542.7800     37.0000     27.1500
+     74.8000   1542.7900     37.0000     27.1500
+     75.4000   1542.8100     37.0000     27.1500
+     76.1000   1542.8100     37.0000     27.1500
+     76.7000   1542.8300     37.0000     27.1500
+     77.4000   1542.8400     37.0000     27.1500
+     78.0000   1542.8400     37.0000     27.1500
+     78.6000   1542.8500     37.0000     27.1500
+     79.3000   1542.8600     37.0000     27.1400
+     79.9000   1542.8700     37.0000     27.1400
+     80.6000   1542.8800     37.0000     27.1400
+     81.2000   1542.8900     37.0000     27.1400
+     81.8000   1542.9000     37.0000     27.1400
+     82.5000   1542.9100     37.0000     27.1400
+     83.1000   1542.9300     37.0000     27.1500
+     83.8000   1542.9400     37.0000     27.1400
+     84.4000   1542.9400     37.0000     27.1400
+     85.1000   1542.9500     37.0000     27.1400
+     85.7000   1542.9600     37.0000     27.1400
+     86.3000   1542.9700     37.0000     27.1400
+     87.0000   1542.9800     37.0000     27.1400
+     87.6000   1542.9900     37.0000     27.1400
+     88.3000   1543.0000     37.0000     27.1400
+     88.9000   1543.0200     37.0000     27.1500
+     89.5000   1543.0400     37.0000     27.1500
+     90.2000   1543.0500     37.0000     27.1500
+     90.8000   1543.0400     37.0000     27.1400
+     91.5000   1543.0500     37.0000     27.1400
+     92.1000   1543.0700     37.0000     27.1400
+     92.7000   1543.0800     37.0000     27.1400
+     93.4000   1543.0900     37.0000     27.1400
+     94.0000   1543.1000     37.0000     27.1400
+     94.7000   1543.1100     37.0000     27.1400
+     95.3000   1543.1200     37.0000     27.1400
+     96.0000   1543.1300     37.0000     27.1400
+     96.6000   1543.1400     37.0000     27.1400
+     97.2000   1543.1600     37.0000     27.1400
+     97.9000   1543.1600     37.0000     27.1400
+     98.5000   1543.1700     37.0000     27.1400
+     99.2000   1543.1800     37.0000     27.1400
+     99.8000   1543.1900     37.0000     27.1400
+    100.4000   1543.2000     37.0000     27.1400
+    101.1000   1543.2100     37.0000     27.1400
+    101.7000   1543.2200     37.0000     27.1400
+    102.4000   1543.2300     37.0000     27.1400
+    103.0000   1543.2400     37.0000     27.1400
+    103.6000   1543.2500     37.0000     27.1400
+    104.3000   1543.2600     37.0000     27.1400
+    104.9000   1543.2700     37.0000     27.1400
+    105.6000   1543.2800     37.0000     27.1400
+    106.2000   1543.2900     37.0000     27.1300
+    106.8000   1543.3000     37.0000     27.1300
+    107.5000   1543.3200     37.0000     27.1400
+    108.1000   1543.3300     37.0000     27.1400
+    108.8000   1543.3300     37.0000     27.1300
+    109.4000   1543.3500     37.0000     27.1400
+    110.0000   1543.3600     37.0000     27.1400
+    110.7000   1543.3700     37.0000     27.1400
+    111.3000   1543.3800     37.0000     27.1400
+    112.0000   1543.3900     37.0000     27.1400
+    112.6000   1543.4000     37.0000     27.1300
+    113.2000   1543.4100     37.0000     27.1300
+    113.9000   1543.4200     37.0000     27.1300
+    114.5000   1543.4300     37.0000     27.1300
+    115.2000   1543.4400     37.0000     27.1300
+    115.8000   1543.4500     37.0000     27.1300
+    116.4000   1543.4600     37.0000     27.1300
+    117.1000   1543.4700     37.0000     27.1300
+    117.7000   1543.4800     37.0000     27.1300
+    118.4000   1543.4900     37.0000     27.1300
+    119.0000   1543.5000     37.0000     27.1300
+    119.6000   1543.5000     37.0000     27.1300
+    120.3000   1543.5100     37.0000     27.1300
+    120.9000   1543.5200     37.0000     27.1300
+    121.5000   1543.5300     37.0000     27.1300
+    122.2000   1543.5500     37.0000     27.1300
+    122.8000   1543.5600     37.0000     27.1300
+    123.5000   1543.5600     37.0000     27.1300
+    124.1000   1543.5800     37.0000     27.1300
+    124.7000   1543.5900     37.0000     27.1300
+    125.4000   1543.5800     37.0000     27.1200
+    126.0000   1543.6000     37.0000     27.1200
+    126.7000   1543.6200     37.0000     27.1300
+    127.3000   1543.6200     37.0000     27.1300
+    127.9000   1543.6400     37.0000     27.1300
+    128.6000   1543.6500     37.0000     27.1300
+    129.2000   1543.6600     37.0000     27.1300
+    129.9000   1543.6700     37.0000     27.1300
+    130.5000   1543.6800     37.0000     27.1300
+    131.1000   1543.6900     37.0000     27.1300
+    131.8000   1543.7000     37.0000     27.1200
+    132.4000   1543.7100     37.0000     27.1200
+    133.0000   1543.7200     37.0000     27.1200
+    133.7000   1543.7300     37.0000     27.1200
+    134.3000   1543.7400     37.0000     27.1200
+    135.0000   1543.7500     37.0000     27.1300
+    135.6000   1543.7700     37.0000     27.1300
+    136.2000   1543.7800     37.0000     27.1300
+    136.9000   1543.7800     37.0000     27.1200
+    137.5000   1543.7900     37.0000     27.1200
+    138.1000   1543.8000     37.0000     27.1200
+    138.8000   1543.8100     37.0000     27.1200
+    139.4000   1543.8200     37.0000     27.1200
+    140.1000   1543.8300     37.0000     27.1200
+    140.7000   1543.8500     37.0000     27.1200
+    141.3000   1543.8500     37.0000     27.1200
+    142.0000   1543.8600     37.0000     27.1200
+    142.6000   1543.8700     37.0000     27.1200
+    143.3000   1543.8800     37.0000     27.1200
+    143.9000   1543.9000     37.0000     27.1200
+    144.5000   1543.9100     37.0000     27.1200
+    145.2000   1543.9100     37.0000     27.1200
+    145.8000   1543.9200     37.0000     27.1200
+    146.4000   1543.9300     37.0000     27.1200
+    147.1000   1543.9400     37.0000     27.1200
+    147.7000   1543.9500     37.0000     27.1200
+    148.4000   1543.9600     37.0000     27.1200
+    149.0000   1543.9700     37.0000     27.1200
+    149.6000   1543.9900     37.0000     27.1200
+    150.3000   1544.0000     37.0000     27.1200
+    150.9000   1544.0000     37.0000     27.1200
+    151.5000   1544.0100     37.0000     27.1200
+    152.2000   1544.0200     37.0000     27.1100
+    152.8000   1544.0300     37.0000     27.1100
+    153.4000   1544.0400     37.0000     27.1200
+    154.1000   1544.0500     37.0000     27.1200
+    154.7000   1544.0600     37.0000     27.1100
+    155.4000   1544.0700     37.0000     27.1200
+    156.0000   1544.0800     37.0000     27.1200
+    156.6000   1544.0900     37.0000     27.1100
+    157.3000   1544.1100     37.0000     27.1200
+    157.9000   1544.1300     37.0000     27.1200
+    158.5000   1544.1300     37.0000     27.1200
+    159.2000   1544.1400     37.0000     27.1100
+    159.8000   1544.1200     37.0000     27.1000
+    160.4000   1544.1400     37.0000     27.1100
+    161.1000   1544.1600     37.0000     27.1100
+    161.7000   1544.1700     37.0000     27.1100
+    162.4000   1544.1800     37.0000     27.1100
+    163.0000   1544.2000     37.0000     27.1100
+    163.6000   1544.2100     37.0000     27.1100
+    164.3000   1544.2200     37.0000     27.1100
+    164.9000   1544.2300     37.0000     27.1100
+    165.5000   1544.2400     37.0000     27.1100
+    166.2000   1544.2400     37.0000     27.1100
+    166.8000   1544.2600     37.0000     27.1100
+    167.4000   1544.2700     37.0000     27.1100
+    168.1000   1544.2900     37.0000     27.1100
+    168.7000   1544.2900     37.0000     27.1100
+    169.4000   1544.3000     37.0000     27.1100
+    170.0000   1544.3100     37.0000     27.1100
+    170.6000   1544.3200     37.0000     27.1100
+    171.3000   1544.3300     37.0000     27.1100
+    171.9000   1544.3400     37.0000     27.1100
+    172.5000   1544.3500     37.0000     27.1100
+    173.2000   1544.3600     37.0000     27.1100
+    173.8000   1544.3700     37.0000     27.1100
+    174.4000   1544.3800     37.0000     27.1100
+    175.1000   1544.3800     37.0000     27.1100
+    175.7000   1544.4000     37.0000     27.1100
+    176.3000   1544.4100     37.0000     27.1100
+    177.0000   1544.4200     37.0000     27.1100
+    177.6000   1544.4300     37.0000     27.1100
+    178.3000   1544.4300     37.0000     27.1000
+    178.9000   1544.4500     37.0000     27.1100
+    179.5000   1544.4600     37.0000     27.1100
+    180.2000   1544.4700     37.0000     27.1100
+    180.8000   1544.4800     37.0000     27.1100
+    181.4000   1544.4900     37.0000     27.1100
+    182.1000   1544.5000     37.0000     27.1100
+    182.7000   1544.5200     37.0000     27.1100
+    183.3000   1544.5300     37.0000     27.1100
+    184.0000   1544.5400     37.0000     27.1100
+    184.6000   1544.5600     37.0000     27.1100
+    185.2000   1544.5500     37.0000     27.1100
+    185.9000   1544.5600     37.0000     27.1000
+    186.5000   1544.5800     37.0000     27.1100
+    187.1000   1544.5900     37.0000     27.1100
+    187.8000   1544.5900     37.0000     27.1000
+    188.4000   1544.6000     37.0000     27.1000
+    189.0000   1544.6200     37.0000     27.1000
+    189.7000   1544.6200     37.0000     27.1000
+    190.3000   1544.6400     37.0000     27.1100
+    190.9000   1544.6500     37.0000     27.1000
+    191.6000   1544.6400     37.0000     27.1000
+    192.2000   1544.6600     37.0000     27.1000
+    192.9000   1544.6700     37.0000     27.1000
+    193.5000   1544.6800     37.0000     27.1000
+    194.1000   1544.6900     37.0000     27.1000
+    194.8000   1544.7000     37.0000     27.1000
+    195.4000   1544.7200     37.0000     27.1000
+    196.0000   1544.7300     37.0000     27.1000
+    196.7000   1544.7400     37.0000     27.1000
+    197.3000   1544.7500     37.0000     27.1000
+    197.9000   1544.7600     37.0000     27.1000
+    198.6000   1544.7700     37.0000     27.1000
+    199.2000   1544.7800     37.0000     27.1000
+    199.8000   1544.7900     37.0000     27.1000
+    200.5000   1544.8000     37.0000     27.1000
+    201.1000   1544.8000     37.0000     27.1000
+    201.7000   1544.8200     37.0000     27.1000
+    202.4000   1544.8300     37.0000     27.1000
+    203.0000   1544.8400     37.0000     27.1000
+    203.6000   1544.8500     37.0000     27.1000
+    204.3000   1544.8600     37.0000     27.1000
+    204.9000   1544.8700     37.0000     27.1000
+    205.5000   1544.8800     37.0000     27.1000
+    206.2000   1544.8900     37.0000     27.1000
+    206.8000   1544.9000     37.0000     27.1000
+    207.4000   1544.9100     37.0000     27.1000
+    208.1000   1544.9300     37.0000     27.1000
+    208.7000   1544.9300     37.0000     27.1000
+    209.3000   1544.9400     37.0000     27.1000
+    210.0000   1544.9600     37.0000     27.1000
+    210.6000   1544.9700     37.0000     27.1000
+    211.2000   1544.9800     37.0000     27.1000
+    211.9000   1544.9900     37.0000     27.1000
+    212.5000   1544.9900     37.0000     27.1000
+    213.1000   1545.0100     37.0000     27.1000
+    213.8000   1545.0200     37.0000     27.1000
+    214.4000   1545.0300     37.0000     27.1000
+    215.0000   1545.0400     37.0000     27.1000
+    215.7000   1545.0500     37.0000     27.1000
+    216.3000   1545.0600     37.0000     27.1000
+    216.9000   1545.0700     37.0000     27.1000
+    217.6000   1545.0800     37.0000     27.1000
+    218.2000   1545.0900     37.0000     27.1000
+    218.8000   1545.0900     37.0000     27.1000
+    219.4000   1545.1000     37.0000     27.0900
+    220.1000   1545.1100     37.0000     27.0900
+    220.7000   1545.1200     37.0000     27.0900
+    221.3000   1545.1300     37.0000     27.0900
+    222.0000   1545.1500     37.0000     27.0900
+    222.6000   1545.1600     37.0000     27.1000
+    223.2000   1545.1800     37.0000     27.1000
+    223.9000   1545.1800     37.0000     27.1000
+    224.5000   1545.2000     37.0000     27.1000
+    225.1000   1545.2000     37.0000     27.0900
+    225.8000   1545.1900     37.0000     27.0900
+    226.4000   1545.2100     37.0000     27.0900
+    227.0000   1545.2200     37.0000     27.0900
+    227.7000   1545.2300     37.0000     27.0900
+    228.3000   1545.2500     37.0000     27.0900
+    228.9000   1545.2600     37.0000     27.0900
+    229.6000   1545.2700     37.0000     27.0900
+    230.2000   1545.2900     37.0000     27.1000
+    230.8000   1545.2900     37.0000     27.0900
+    231.5000   1545.3000     37.0000     27.0900
+    232.1000   1545.3200     37.0000     27.0900
+    232.7000   1545.3300     37.0000     27.0900
+    233.4000   1545.3400     37.0000     27.0900
+    234.0000   1545.3400     37.0000     27.0900
+    234.6000   1545.3500     37.0000     27.0900
+    235.2000   1545.3600     37.0000     27.0900
+    235.9000   1545.3600     37.0000     27.0900
+    236.5000   1545.3800     37.0000     27.0900
+    237.1000   1545.3900     37.0000     27.0900
+    237.8000   1545.4000     37.0000     27.0900
+    238.4000   1545.4200     37.0000     27.0900
+    239.0000   1545.4300     37.0000     27.0900
+    239.7000   1545.4400     37.0000     27.0900
+    240.3000   1545.4500     37.0000     27.0900
+    240.9000   1545.4600     37.0000     27.0900
+    241.6000   1545.4700     37.0000     27.0900
+    242.2000   1545.4800     37.0000     27.0900
+    242.8000   1545.4900     37.0000     27.0900
+    243.4000   1545.5000     37.0000     27.0900
+    244.1000   1545.5100     37.0000     27.0900
+    244.7000   1545.5200     37.0000     27.0900
+    245.3000   1545.5300     37.0000     27.0900
+    246.0000   1545.5400     37.0000     27.0900
+    246.6000   1545.5500     37.0000     27.0900
+    247.2000   1545.5500     37.0000     27.0900
+    247.9000   1545.5600     37.0000     27.0900
+    248.5000   1545.5800     37.0000     27.0900
+    249.1000   1545.5900     37.0000     27.0900
+    249.8000   1545.6000     37.0000     27.0900
+    250.4000   1545.6100     37.0000     27.0900
+    251.0000   1545.6200     37.0000     27.0900
+    251.6000   1545.6300     37.0000     27.0900
+    252.3000   1545.6400     37.0000     27.0900
+    252.9000   1545.6500     37.0000     27.0900
+    253.5000   1545.6600     37.0000     27.0900
+    254.2000   1545.6700     37.0000     27.0900
+    254.8000   1545.6800     37.0000     27.0900
+    255.4000   1545.6800     37.0000     27.0800
+    256.1000   1545.7000     37.0000     27.0900
+    256.7000   1545.7000     37.0000     27.0800
+    257.3000   1545.7200     37.0000     27.0900
+    257.9000   1545.7300     37.0000     27.0800
+    258.6000   1545.7400     37.0000     27.0900
+    259.2000   1545.7500     37.0000     27.0900
+    259.8000   1545.7700     37.0000     27.0900
+    260.5000   1545.7800     37.0000     27.0900
+    261.1000   1545.7900     37.0000     27.0900
+    261.7000   1545.8000     37.0000     27.0900
+    262.4000   1545.8100     37.0000     27.0900
+    263.0000   1545.8200     37.0000     27.0900
+    263.6000   1545.8300     37.0000     27.0900
+    264.2000   1545.8400     37.0000     27.0900
+    264.9000   1545.8500     37.0000     27.0900
+    265.5000   1545.8600     37.0000     27.0900
+    266.1000   1545.8700     37.0000     27.0900
+    266.8000   1545.8800     37.0000     27.0900
+    267.4000   1545.8900     37.0000     27.0900
+    268.0000   1545.9000     37.0000     27.0800
+    268.6000   1545.9100     37.0000     27.0800
+    269.3000   1545.9200     37.0000     27.0900
+    269.9000   1545.9300     37.0000     27.0800
+    270.5000   1545.9400     37.0000     27.0800
+    271.2000   1545.9500     37.0000     27.0900
+    271.8000   1545.9600     37.0000     27.0800
+    272.4000   1545.9700     37.0000     27.0800
+    273.0000   1545.9800     37.0000     27.0900
+    273.7000   1546.0000     37.0000     27.0900
+    274.3000   1546.0000     37.0000     27.0800
+    274.9000   1546.0100     37.0000     27.0800
+    275.6000   1546.0200     37.0000     27.0800
+    276.2000   1546.0300     37.0000     27.0800
+    276.8000   1546.0400     37.0000     27.0800
+    277.4000   1546.0500     37.0000     27.0800
+    278.1000   1546.0700     37.0000     27.0800
+    278.7000   1546.0800     37.0000     27.0800
+    279.3000   1546.0800     37.0000     27.0800
+    280.0000   1546.0900     37.0000     27.0800
+    280.6000   1546.1100     37.0000     27.0800
+    281.2000   1546.1100     37.0000     27.0800
+    281.8000   1546.1300     37.0000     27.0800
+    282.5000   1546.1300     37.0000     27.0800
+    283.1000   1546.1400     37.0000     27.0800
+    283.7000   1546.1500     37.0000     27.0800
+    284.4000   1546.1600     37.0000     27.0800
+    285.0000   1546.1800     37.0000     27.0800
+    285.6000   1546.1900     37.0000     27.0800
+    286.2000   1546.2000     37.0000     27.0800
+    286.9000   1546.2100     37.0000     27.0800
+    287.5000   1546.2500     37.0000     27.0900
+    288.1000   1546.2300     37.0000     27.0800
+    288.7000   1546.2200     37.0000     27.0700
+    289.4000   1546.2400     37.0000     27.0800
+    290.0000   1546.2500     37.0000     27.0800
+    290.6000   1546.2700     37.0000     27.0800
+    291.3000   1546.2800     37.0000     27.0800
+    291.9000   1546.2900     37.0000     27.0800
+    292.5000   1546.3000     37.0000     27.0800
+    293.1000   1546.3000     37.0000     27.0800
+    293.8000   1546.3200     37.0000     27.0800
+    294.4000   1546.3200     37.0000     27.0800
+    295.0000   1546.3300     37.0000     27.0800
+    295.7000   1546.3400     37.0000     27.0800
+    296.3000   1546.3600     37.0000     27.0800
+    296.9000   1546.3700     37.0000     27.0800
+    297.5000   1546.3800     37.0000     27.0800
+    298.2000   1546.3900     37.0000     27.0800
+    298.8000   1546.4000     37.0000     27.0800
+    299.4000   1546.4100     37.0000     27.0800
+    300.0000   1546.4200     37.0000     27.0800
+    300.7000   1546.4300     37.0000     27.0800
+    301.3000   1546.4400     37.0000     27.0800
+    301.9000   1546.4500     37.0000     27.0800
+    302.5000   1546.4700     37.0000     27.0800
+    303.2000   1546.4800     37.0000     27.0800
+    303.8000   1546.4900     37.0000     27.0800
+    304.4000   1546.5000     37.0000     27.0800
+    305.1000   1546.5100     37.0000     27.0800
+    305.7000   1546.5200     37.0000     27.0800
+    306.3000   1546.5300     37.0000     27.0800
+    306.9000   1546.5500     37.0000     27.0800
+    307.6000   1546.5500     37.0000     27.0800
+    308.2000   1546.5600     37.0000     27.0800
+    308.8000   1546.5700     37.0000     27.0800
+    309.4000   1546.5800     37.0000     27.0800
+    310.1000   1546.5900     37.0000     27.0800
+    310.7000   1546.6000     37.0000     27.0800
+    311.3000   1546.6100     37.0000     27.0800
+    311.9000   1546.6200     37.0000     27.0800
+    312.6000   1546.6300     37.0000     27.0800
+    313.2000   1546.6400     37.0000     27.0800
+    313.8000   1546.6500     37.0000     27.0800
+    314.4000   1546.6600     37.0000     27.0800
+    315.1000   1546.6700     37.0000     27.0800
+    315.7000   1546.6800     37.0000     27.0800
+    316.3000   1546.6800     37.0000     27.0700
+    316.9000   1546.7000     37.0000     27.0700
+    317.6000   1546.7100     37.0000     27.0700
+    318.2000   1546.7200     37.0000     27.0800
+    318.8000   1546.7500     37.0000     27.0800
+    319.5000   1546.7500     37.0000     27.0800
+    320.1000   1546.7500     37.0000     27.0700
+    320.7000   1546.7500     37.0000     27.0700
+    321.3000   1546.7600     37.0000     27.0700
+    322.0000   1546.7800     37.0000     27.0700
+    322.6000   1546.7900     37.0000     27.0700
+    323.2000   1546.8100     37.0000     27.0800
+    323.8000   1546.8200     37.0000     27.0800
+    324.5000   1546.8200     37.0000     27.0700
+    325.1000   1546.8400     37.0000     27.0800
+    325.7000   1546.8500     37.0000     27.0800
+    326.3000   1546.8600     37.0000     27.0800
+    327.0000   1546.8700     37.0000     27.0800
+    327.6000   1546.8800     37.0000     27.0800
+    328.2000   1546.8900     37.0000     27.0800
+    328.8000   1546.9000     37.0000     27.0700
+    329.5000   1546.9100     37.0000     27.0800
+    330.1000   1546.9200     37.0000     27.0800
+    330.7000   1546.9300     37.0000     27.0700
+    331.3000   1546.9300     37.0000     27.0700
+    332.0000   1546.9500     37.0000     27.0700
+    332.6000   1546.9600     37.0000     27.0700
+    333.2000   1546.9700     37.0000     27.0700
+    333.8000   1546.9800     37.0000     27.0700
+    334.5000   1546.9900     37.0000     27.0700
+    335.1000   1547.0000     37.0000     27.0800
+    335.7000   1547.0100     37.0000     27.0800
+    336.3000   1547.0200     37.0000     27.0700
+    336.9000   1547.0300     37.0000     27.0700
+    337.6000   1547.0400     37.0000     27.0700
+    338.2000   1547.0500     37.0000     27.0700
+    338.8000   1547.0600     37.0000     27.0700
+    339.4000   1547.0700     37.0000     27.0700
+    340.1000   1547.0800     37.0000     27.0700
+    340.7000   1547.0900     37.0000     27.0700
+    341.3000   1547.1000     37.0000     27.0700
+    341.9000   1547.1100     37.0000     27.0700
+    342.6000   1547.1300     37.0000     27.0700
+    343.2000   1547.1400     37.0000     27.0700
+    343.8000   1547.1400     37.0000     27.0700
+    344.4000   1547.1500     37.0000     27.0700
+    345.1000   1547.1600     37.0000     27.0700
+    345.7000   1547.1700     37.0000     27.0700
+    346.3000   1547.1900     37.0000     27.0700
+    346.9000   1547.2000     37.0000     27.0700
+    347.6000   1547.2100     37.0000     27.0800
+    348.2000   1547.2200     37.0000     27.0700
+    348.8000   1547.2300     37.0000     27.0700
+    349.4000   1547.2500     37.0000     27.0800
+    350.0000   1547.2500     37.0000     27.0700
+    350.7000   1547.2500     37.0000     27.0700
+    351.3000   1547.2500     37.0000     27.0700
+    351.9000   1547.2800     37.0000     27.0700
+    352.5000   1547.2900     37.0000     27.0700
+    353.2000   1547.3000     37.0000     27.0700
+    353.8000   1547.3100     37.0000     27.0700
+    354.4000   1547.3200     37.0000     27.0700
+    355.0000   1547.3300     37.0000     27.0700
+    355.7000   1547.3400     37.0000     27.0700
+    356.3000   1547.3500     37.0000     27.0700
+    356.9000   1547.3700     37.0000     27.0700
+    357.5000   1547.3700     37.0000     27.0700
+    358.1000   1547.3800     37.0000     27.0700
+    358.8000   1547.4000     37.0000     27.0700
+    359.4000   1547.4000     37.0000     27.0700
+    360.0000   1547.4100     37.0000     27.0700
+    360.6000   1547.4200     37.0000     27.0700
+    361.3000   1547.4300     37.0000     27.0700
+    361.9000   1547.4400     37.0000     27.0700
+    362.5000   1547.4500     37.0000     27.0700
+    363.1000   1547.4600     37.0000     27.0700
+    363.8000   1547.4700     37.0000     27.0700
+    364.4000   1547.4800     37.0000     27.0700
+    365.0000   1547.4900     37.0000     27.0700
+    365.6000   1547.5000     37.0000     27.0700
+    366.2000   1547.5100     37.0000     27.0700
+    366.9000   1547.5300     37.0000     27.0700
+    367.5000   1547.5400     37.0000     27.0700
+    368.1000   1547.5500     37.0000     27.0700
+    368.7000   1547.5600     37.0000     27.0700
+    369.4000   1547.5700     37.0000     27.0700
+    370.0000   1547.5800     37.0000     27.0700
+    370.6000   1547.5900     37.0000     27.0700
+    371.2000   1547.6000     37.0000     27.0700
+    371.8000   1547.6100     37.0000     27.0700
+    372.5000   1547.6100     37.0000     27.0700
+    373.1000   1547.6300     37.0000     27.0700
+    373.7000   1547.6400     37.0000     27.0700
+    374.3000   1547.6500     37.0000     27.0700
+    375.0000   1547.6600     37.0000     27.0700
+    375.6000   1547.6800     37.0000     27.0700
+    376.2000   1547.6900     37.0000     27.0700
+    376.8000   1547.6900     37.0000     27.0700
+    377.4000   1547.6900     37.0000     27.0700
+    378.1000   1547.7000     37.0000     27.0600
+    378.7000   1547.7100     37.0000     27.0700
+    379.3000   1547.7300     37.0000     27.0700
+    379.9000   1547.7400     37.0000     27.0700
+    380.5000   1547.7700     37.0000     27.0800
+    381.2000   1547.7600     37.0000     27.0700
+    381.8000   1547.7700     37.0000     27.0700
+    382.4000   1547.7700     37.0000     27.0600
+    383.0000   1547.7800     37.0000     27.0600
+    383.6000   1547.7900     37.0000     27.0600
+    384.3000   1547.8100     37.0000     27.0700
+    384.9000   1547.8200     37.0000     27.0700
+    385.5000   1547.8400     37.0000     27.0700
+    386.1000   1547.8400     37.0000     27.0700
+    386.8000   1547.8600     37.0000     27.0700
+    387.4000   1547.8600     37.0000     27.0700
+    388.0000   1547.8800     37.0000     27.0700
+    388.6000   1547.8900     37.0000     27.0700
+    389.2000   1547.9000     37.0000     27.0700
+    389.9000   1547.9100     37.0000     27.0700
+    390.5000   1547.9200     37.0000     27.0700
+    391.1000   1547.9300     37.0000     27.0700
+    391.7000   1547.9300     37.0000     27.0700
+    392.3000   1547.9400     37.0000     27.0700
+    393.0000   1547.9600     37.0000     27.0700
+    393.6000   1547.9700     37.0000     27.0700
+    394.2000   1547.9800     37.0000     27.0700
+    394.8000   1547.9900     37.0000     27.0700
+    395.4000   1548.0000     37.0000     27.0700
+    396.1000   1548.0100     37.0000     27.0700
+    396.7000   1548.0200     37.0000     27.0700
+    397.3000   1548.0300     37.0000     27.0700
+    397.9000   1548.0400     37.0000     27.0700
+    398.5000   1548.0500     37.0000     27.0700
+    399.2000   1548.0600     37.0000     27.0700
+    399.8000   1548.0700     37.0000     27.0700
+    400.4000   1548.0800     37.0000     27.0700
+    401.0000   1548.0900     37.0000     27.0600
+    401.6000   1548.0900     37.0000     27.0600
+    402.3000   1548.1100     37.0000     27.0700
+    402.9000   1548.1200     37.0000     27.0700
+    403.5000   1548.1400     37.0000     27.0700
+    404.1000   1548.1400     37.0000     27.0700
+    404.7000   1548.1500     37.0000     27.0700
+    405.4000   1548.1600     37.0000     27.0700
+    406.0000   1548.1800     37.0000     27.0700
+    406.6000   1548.1900     37.0000     27.0700
+    407.2000   1548.2000     37.0000     27.0700
+    407.8000   1548.2000     37.0000     27.0700
+    408.5000   1548.2100     37.0000     27.0600
+    409.1000   1548.2200     37.0000     27.0600
+    409.7000   1548.2300     37.0000     27.0600
+    410.3000   1548.2600     37.0000     27.0700
+    410.9000   1548.2400     37.0000     27.0600
+    411.6000   1548.2800     37.0000     27.0700
+    412.2000   1548.2700     37.0000     27.0600
+    412.8000   1548.2800     37.0000     27.0600
+    413.4000   1548.2900     37.0000     27.0600
+    414.0000   1548.3100     37.0000     27.0700
+    414.6000   1548.3200     37.0000     27.0700
+    415.3000   1548.3300     37.0000     27.0700
+    415.9000   1548.3400     37.0000     27.0700
+    416.5000   1548.3500     37.0000     27.0700
+    417.1000   1548.3600     37.0000     27.0700
+    417.7000   1548.3700     37.0000     27.0700
+    418.4000   1548.3800     37.0000     27.0700
+    419.0000   1548.3800     37.0000     27.0600
+    419.6000   1548.3900     37.0000     27.0600
+    420.2000   1548.4000     37.0000     27.0600
+    420.8000   1548.4100     37.0000     27.0600
+    421.5000   1548.4200     37.0000     27.0600
+    422.1000   1548.4300     37.0000     27.0600
+    422.7000   1548.4500     37.0000     27.0600
+    423.3000   1548.4600     37.0000     27.0600
+    423.9000   1548.4700     37.0000     27.0600
+    424.5000   1548.4800     37.0000     27.0600
+    425.2000   1548.4900     37.0000     27.0700
+    425.8000   1548.5100     37.0000     27.0700
+    426.4000   1548.5200     37.0000     27.0700
+    427.0000   1548.5300     37.0000     27.0700
+    427.6000   1548.5300     37.0000     27.0600
+    428.3000   1548.5500     37.0000     27.0700
+    428.9000   1548.5600     37.0000     27.0700
+    429.5000   1548.5700     37.0000     27.0700
+    430.1000   1548.5800     37.0000     27.0700
+    430.7000   1548.5800     37.0000     27.0600
+    431.3000   1548.5900     37.0000     27.0600
+    432.0000   1548.6100     37.0000     27.0700
+    432.6000   1548.6200     37.0000     27.0700
+    433.2000   1548.6300     37.0000     27.0700
+    433.8000   1548.6300     37.0000     27.0600
+    434.4000   1548.6500     37.0000     27.0700
+    435.0000   1548.6600     37.0000     27.0600
+    435.7000   1548.6600     37.0000     27.0600
+    436.3000   1548.6800     37.0000     27.0700
+    436.9000   1548.6900     37.0000     27.0600
+    437.5000   1548.6900     37.0000     27.0600
+    438.1000   1548.7100     37.0000     27.0600
+    438.8000   1548.7100     37.0000     27.0600
+    439.4000   1548.7200     37.0000     27.0600
+    440.0000   1548.7400     37.0000     27.0600
+    440.6000   1548.7600     37.0000     27.0700
+    441.2000   1548.7800     37.0000     27.0700
+    441.8000   1548.7600     37.0000     27.0600
+    442.5000   1548.7600     37.0000     27.0500
+    443.1000   1548.7700     37.0000     27.0600
+    443.7000   1548.7900     37.0000     27.0600
+    444.3000   1548.8100     37.0000     27.0600
+    444.9000   1548.8100     37.0000     27.0600
+    445.5000   1548.8200     37.0000     27.0600
+    446.2000   1548.8400     37.0000     27.0600
+    446.8000   1548.8500     37.0000     27.0600
+    447.4000   1548.8600     37.0000     27.0600
+    448.0000   1548.8700     37.0000     27.0600
+    448.6000   1548.8800     37.0000     27.0600
+    449.2000   1548.8900     37.0000     27.0600
+    449.9000   1548.9000     37.0000     27.0600
+    450.5000   1548.9100     37.0000     27.0600
+    451.1000   1548.9300     37.0000     27.0600
+    451.7000   1548.9400     37.0000     27.0600
+    452.3000   1548.9400     37.0000     27.0600
+    452.9000   1548.9500     37.0000     27.0600
+    453.6000   1548.9700     37.0000     27.0600
+    454.2000   1548.9800     37.0000     27.0600
+    454.8000   1548.9800     37.0000     27.0600
+    455.4000   1548.9900     37.0000     27.0600
+    456.0000   1549.0000     37.0000     27.0600
+    456.6000   1549.0100     37.0000     27.0600
+    457.3000   1549.0200     37.0000     27.0600
+    457.9000   1549.0300     37.0000     27.0600
+    458.5000   1549.0400     37.0000     27.0600
+    459.1000   1549.0500     37.0000     27.0600
+    459.7000   1549.0600     37.0000     27.0600
+    460.3000   1549.0700     37.0000     27.0600
+    460.9000   1549.0800     37.0000     27.0600
+    461.6000   1549.0900     37.0000     27.0600
+    462.2000   1549.1000     37.0000     27.0600
+    462.8000   1549.1200     37.0000     27.0600
+    463.4000   1549.1200     37.0000     27.0600
+    464.0000   1549.1300     37.0000     27.0600
+    464.6000   1549.1500     37.0000     27.0600
+    465.3000   1549.1500     37.0000     27.0600
+    465.9000   1549.1600     37.0000     27.0600
+    466.5000   1549.1700     37.0000     27.0600
+    467.1000   1549.1800     37.0000     27.0600
+    467.7000   1549.1900     37.0000     27.0600
+    468.3000   1549.2000     37.0000     27.0600
+    468.9000   1549.2200     37.0000     27.0600
+    469.6000   1549.2300     37.0000     27.0600
+    470.2000   1549.2300     37.0000     27.0600
+    470.8000   1549.2400     37.0000     27.0600
+    471.4000   1549.2500     37.0000     27.0600
+    472.0000   1549.2700     37.0000     27.0600
+    472.6000   1549.2700     37.0000     27.0600
+    473.2000   1549.2900     37.0000     27.0600
+    473.9000   1549.3000     37.0000     27.0600
+    474.5000   1549.3100     37.0000     27.0600
+    475.1000   1549.3200     37.0000     27.0600
+    475.7000   1549.3300     37.0000     27.0600
+    476.3000   1549.3500     37.0000     27.0600
+    476.9000   1549.3500     37.0000     27.0600
+    477.6000   1549.3600     37.0000     27.0600
+    478.2000   1549.3700     37.0000     27.0600
+    478.8000   1549.3800     37.0000     27.0600
+    479.4000   1549.3900     37.0000     27.0600
+    480.0000   1549.4000     37.0000     27.0600
+    480.6000   1549.4200     37.0000     27.0600
+    481.2000   1549.4200     37.0000     27.0600
+    481.9000   1549.4300     37.0000     27.0600
+    482.5000   1549.4400     37.0000     27.0600
+    483.1000   1549.4300     37.0000     27.0500
+    483.7000   1549.4200     37.0000     27.0400
+    484.3000   1549.4300     37.0000     27.0400
+    484.9000   1549.4500     37.0000     27.0400
+    485.5000   1549.4700     37.0000     27.0500
+    486.2000   1549.4900     37.0000     27.0500
+    486.8000   1549.5000     37.0000     27.0600
+    487.4000   1549.5200     37.0000     27.0600
+    488.0000   1549.5100     37.0000     27.0500
+    488.6000   1549.5200     37.0000     27.0500
+    489.2000   1549.5400     37.0000     27.0500
+    489.8000   1549.5600     37.0000     27.0600
+    490.4000   1549.5800     37.0000     27.0600
+    491.1000   1547.1900     37.0000     26.0200
+    491.7000   1566.3800     37.0000     35.5000
+    492.3000   1566.3900     37.0000     35.5000
+    492.9000   1566.4000     37.0000     35.5000
+    493.5000   1566.4100     37.0000     35.5000
+    494.1000   1566.4200     37.0000     35.5000
+    494.7000   1566.4300     37.0000     35.5000
+    495.4000   1566.4400     37.0000     35.5000
+    496.0000   1566.4500     37.0000     35.5000
+    496.6000   1566.4600     37.0000     35.5000
+    497.2000   1566.4700     37.0000     35.5000
+    497.8000   1566.4900     37.0000     35.5000
+    498.4000   1566.5000     37.0000     35.5000
+    499.0000   1566.5100     37.0000     35.5000
+    499.6000   1566.5200     37.0000     35.5000
+    500.3000   1566.5300     37.0000     35.5000
+    500.9000   1566.5400     37.0000     35.5000
+    501.5000   1566.5500     37.0000     35.5000
+    502.1000   1566.5600     37.0000     35.5000
+    502.7000   1566.5700     37.0000     35.5000
+    503.3000   1566.5800     37.0000     35.5000
+    503.9000   1566.5900     37.0000     35.5000
+    504.5000   1566.6000     37.0000     35.5000
+    505.2000   1566.6100     37.0000     35.5000
+    505.8000   1566.6200     37.0000     35.5000
+    506.4000   1566.6300     37.0000     35.5000
+    507.0000   1566.6400     37.0000     35.5000
+    507.6000   1566.6500     37.0000     35.5000
+    508.2000   1566.6600     37.0000     35.5000
+    508.8000   1566.6700     37.0000     35.5000
+    509.4000   1566.6800     37.0000     35.5000
+    510.1000   1566.6900     37.0000     35.5000
+    510.7000   1566.7000     37.0000     35.5000
+    511.3000   1566.7100     37.0000     35.5000
+    511.9000   1566.7200     37.0000     35.5000
+    512.5000   1566.7300     37.0000     35.5000
+    513.1000   1566.7400     37.0000     35.5000
+    513.7000   1566.7500     37.0000     35.5000
+    514.3000   1566.7600     37.0000     35.5000
+    515.0000   1566.7800     37.0000     35.5000
+    515.6000   1566.7900     37.0000     35.5000
+    516.2000   1566.8000     37.0000     35.5000
+    516.8000   1566.8100     37.0000     35.5000
+    517.4000   1566.8200     37.0000     35.5000
+    518.0000   1566.8300     37.0000     35.5000
+    518.6000   1566.8400     37.0000     35.5000
+    519.2000   1566.8500     37.0000     35.5000
+    519.9000   1566.8600     37.0000     35.5000
+    520.5000   1566.8700     37.0000     35.5000
+    521.1000   1566.8800     37.0000     35.5000
+    521.7000   1566.8900     37.0000     35.5000
+    522.3000   1566.9000     37.0000     35.5000
+    522.9000   1566.9100     37.0000     35.5000
+    523.5000   1566.9200     37.0000     35.5000
+    524.1000   1566.9300     37.0000     35.5000
+    524.7000   1566.9400     37.0000     35.5000
+    525.4000   1566.9500     37.0000     35.5000
+    526.0000   1566.9600     37.0000     35.5000
+    526.6000   1566.9700     37.0000     35.5000
+    527.2000   1566.9800     37.0000     35.5000
+    527.8000   1566.9900     37.0000     35.5000
+    528.4000   1567.0000     37.0000     35.5000
+    529.0000   1567.0100     37.0000     35.5000
+    529.6000   1567.0200     37.0000     35.5000
+    530.2000   1567.0300     37.0000     35.5000
+    530.9000   1567.0400     37.0000     35.5000
+    531.5000   1567.0500     37.0000     35.5000
+    532.1000   1567.0600     37.0000     35.5000
+    532.7000   1567.0700     37.0000     35.5000
+    533.3000   1567.0900     37.0000     35.5000
+    533.9000   1567.1000     37.0000     35.5000
+    534.5000   1567.1100     37.0000     35.5000
+    535.1000   1567.1200     37.0000     35.5000
+    535.7000   1567.1300     37.0000     35.5000
+    536.3000   1567.1400     37.0000     35.5000
+    537.0000   1567.1500     37.0000     35.5000
+    537.6000   1567.1600     37.0000     35.5000
+    538.2000   1567.1700     37.0000     35.5000
+    538.8000   1567.1800     37.0000     35.5000
+    539.4000   1567.1900     37.0000     35.5000
+    540.0000   1567.2000     37.0000     35.5000
+    540.6000   1567.2100     37.0000     35.5000
+    541.2000   1567.2200     37.0000     35.5000
+    541.8000   1567.2300     37.0000     35.5000
+    542.4000   1567.2400     37.0000     35.5000
+    543.1000   1567.2500     37.0000     35.5000
+    543.7000   1567.2600     37.0000     35.5000
+    544.3000   1567.2700     37.0000     35.5000
+    544.9000   1567.2800     37.0000     35.5000
+    545.5000   1567.2900     37.0000     35.5000
+    546.1000   1567.3000     37.0000     35.5000
+    546.7000   1567.3100     37.0000     35.5000
+    547.3000   1567.3200     37.0000     35.5000
+    547.9000   1567.3300     37.0000     35.5000
+    548.5000   1567.3400     37.0000     35.5000
+    549.2000   1567.3500     37.0000     35.5000
+    549.8000   1567.3600     37.0000     35.5000
+    550.4000   1567.3700     37.0000     35.5000
+    551.0000   1567.3800     37.0000     35.5000
+    551.6000   1567.3900     37.0000     35.5000
+    552.2000   1567.4000     37.0000     35.5000
+    552.8000   1567.4200     37.0000     35.5000
+    553.4000   1567.4300     37.0000     35.5000
+    554.0000   1567.4400     37.0000     35.5000
+    554.6000   1567.4500     37.0000     35.5000
+    555.2000   1567.4600     37.0000     35.5000
+    555.9000   1567.4700     37.0000     35.5000
+    556.5000   1567.4800     37.0000     35.5000
+    557.1000   1567.4900     37.0000     35.5000
+    557.7000   1567.5000     37.0000     35.5000
+    558.3000   1567.5100     37.0000     35.5000
+    558.9000   1567.5200     37.0000     35.5000
+    559.5000   1567.5300     37.0000     35.5000
+    560.1000   1567.5400     37.0000     35.5000
+    560.7000   1567.5500     37.0000     35.5000
+    561.3000   1567.5600     37.0000     35.5000
+    561.9000   1567.5700     37.0000     35.5000
+    562.6000   1567.5800     37.0000     35.5000
+    563.2000   1567.5900     37.0000     35.5000
+    563.8000   1567.6000     37.0000     35.5000
+    564.4000   1567.6100     37.0000     35.5000
+    565.0000   1567.6200     37.0000     35.5000
+    565.6000   1567.6300     37.0000     35.5000
+    566.2000   1567.6400     37.0000     35.5000
+    566.8000   1567.6500     37.0000     35.5000
+    567.4000   1567.6600     37.0000     35.5000
+    568.0000   1567.6700     37.0000     35.5000
+    568.6000   1567.6800     37.0000     35.5000
+    569.2000   1567.6900     37.0000     35.5000
+    569.8000   1567.7000     37.0000     35.5000
+    570.5000   1567.7100     37.0000     35.5000
+    571.1000   1567.7200     37.0000     35.5000
+    571.7000   1567.7300     37.0000     35.5000
+    572.3000   1567.7400     37.0000     35.5000
+    572.9000   1567.7500     37.0000     35.5000
+    573.5000   1567.7700     37.0000     35.5000
+    574.1000   1567.7800     37.0000     35.5000
+    574.7000   1567.7900     37.0000     35.5000
+    575.3000   1567.8000     37.0000     35.5000
+    575.9000   1567.8100     37.0000     35.5000
+    576.5000   1567.8200     37.0000     35.5000
+    577.1000   1567.8300     37.0000     35.5000
+    577.7000   1567.8400     37.0000     35.5000
+    578.4000   1567.8500     37.0000     35.5000
+    579.0000   1567.8600     37.0000     35.5000
+    579.6000   1567.8700     37.0000     35.5000
+    580.2000   1567.8800     37.0000     35.5000
+    580.8000   1567.8900     37.0000     35.5000
+    581.4000   1567.9000     37.0000     35.5000
+    582.0000   1567.9100     37.0000     35.5000
+    582.6000   1567.9200     37.0000     35.5000
+    583.2000   1567.9300     37.0000     35.5000
+    583.8000   1567.9400     37.0000     35.5000
+    584.4000   1567.9500     37.0000     35.5000
+    585.0000   1567.9600     37.0000     35.5000
+    585.6000   1567.9700     37.0000     35.5000
+    586.2000   1567.9800     37.0000     35.5000
+    586.9000   1567.9900     37.0000     35.5000
+    587.5000   1568.0000     37.0000     35.5000
+    588.1000   1568.0100     37.0000     35.5000
+    588.7000   1568.0200     37.0000     35.5000
+    589.3000   1568.0300     37.0000     35.5000
+    589.9000   1568.0400     37.0000     35.5000
+    590.5000   1568.0500     37.0000     35.5000
+    591.1000   1568.0600     37.0000     35.5000
+    591.7000   1568.0700     37.0000     35.5000
+    592.3000   1568.0800     37.0000     35.5000
+    592.9000   1568.0900     37.0000     35.5000
+    593.5000   1568.1000     37.0000     35.5000
+    594.1000   1568.1100     37.0000     35.5000
+    594.7000   1568.1200     37.0000     35.5000
+    595.3000   1568.1300     37.0000     35.5000
+    596.0000   1568.1400     37.0000     35.5000
+    596.6000   1568.1600     37.0000     35.5000
+    597.2000   1568.1700     37.0000     35.5000
+    597.8000   1568.1800     37.0000     35.5000
+    598.4000   1568.1900     37.0000     35.5000
+    599.0000   1568.2000     37.0000     35.5000
+    599.6000   1568.2100     37.0000     35.5000
+    600.2000   1568.2200     37.0000     35.5000
+    600.8000   1568.2300     37.0000     35.5000
+    601.4000   1568.2400     37.0000     35.5000
+    602.0000   1568.2500     37.0000     35.5000
+    602.6000   1568.2600     37.0000     35.5000
+    603.2000   1568.2700     37.0000     35.5000
+    603.8000   1568.2800     37.0000     35.5000
+    604.4000   1568.2900     37.0000     35.5000
+    605.0000   1568.3000     37.0000     35.5000
+    605.6000   1568.3100     37.0000     35.5000
+    606.2000   1568.3200     37.0000     35.5000
+    606.9000   1568.3300     37.0000     35.5000
+    607.5000   1568.3400     37.0000     35.5000
+    608.1000   1568.3500     37.0000     35.5000
+    608.7000   1568.3600     37.0000     35.5000
+    609.3000   1568.3700     37.0000     35.5000
+    609.9000   1568.3800     37.0000     35.5000
+    610.5000   1568.3900     37.0000     35.5000
+    611.1000   1568.4000     37.0000     35.5000
+    611.7000   1568.4100     37.0000     35.5000
+    612.3000   1568.4200     37.0000     35.5000
+    612.9000   1568.4300     37.0000     35.5000
+    613.5000   1568.4400     37.0000     35.5000
+    614.1000   1568.4500     37.0000     35.5000
+    614.7000   1568.4600     37.0000     35.5000
+    615.3000   1568.4700     37.0000     35.5000
+    615.9000   1568.4800     37.0000     35.5000
+    616.5000   1568.4900     37.0000     35.5000
+    617.1000   1568.5000     37.0000     35.5000
+    617.7000   1568.5100     37.0000     35.5000
+    618.3000   1568.5200     37.0000     35.5000
+    619.0000   1568.5300     37.0000     35.5000
+    619.6000   1568.5400     37.0000     35.5000
+    620.2000   1568.5500     37.0000     35.5000
+    620.8000   1568.5600     37.0000     35.5000
+    621.4000   1568.5700     37.0000     35.5000
+    622.0000   1568.5800     37.0000     35.5000
+    622.6000   1568.5900     37.0000     35.5000
+    623.2000   1568.6100     37.0000     35.5000
+    623.8000   1568.6200     37.0000     35.5000
+    624.4000   1568.6300     37.0000     35.5000
+    625.0000   1568.6400     37.0000     35.5000
+    625.6000   1568.6500     37.0000     35.5000
+    626.2000   1568.6600     37.0000     35.5000
+    626.8000   1568.6700     37.0000     35.5000
+    627.4000   1568.6800     37.0000     35.5000
+    628.0000   1568.6900     37.0000     35.5000
+    628.6000   1568.7000     37.0000     35.5000
+    629.2000   1568.7100     37.0000     35.5000
+    629.8000   1568.7200     37.0000     35.5000
+    630.4000   1568.7300     37.0000     35.5000
+    631.0000   1568.7400     37.0000     35.5000
+    631.6000   1568.7500     37.0000     35.5000
+    632.2000   1568.7600     37.0000     35.5000
+    632.8000   1568.7700     37.0000     35.5000
+    633.4000   1568.7800     37.0000     35.5000
+    634.1000   1568.7900     37.0000     35.5000
+    634.7000   1568.8000     37.0000     35.5000
+    635.3000   1568.8100     37.0000     35.5000
+    635.9000   1568.8200     37.0000     35.5000
+    636.5000   1568.8300     37.0000     35.5000
+    637.1000   1568.8400     37.0000     35.5000
+    637.7000   1568.8500     37.0000     35.5000
+    638.3000   1568.8600     37.0000     35.5000
+    638.9000   1568.8700     37.0000     35.5000
+    639.5000   1568.8800     37.0000     35.5000
+    640.1000   1568.8900     37.0000     35.5000
+    640.7000   1568.9000     37.0000     35.5000
+    641.3000   1568.9100     37.0000     35.5000
+    641.9000   1568.9200     37.0000     35.5000
+    642.5000   1568.9300     37.0000     35.5000
+    643.1000   1568.9400     37.0000     35.5000
+    643.7000   1568.9500     37.0000     35.5000
+    644.3000   1568.9600     37.0000     35.5000
+    644.9000   1568.9700     37.0000     35.5000
+    645.5000   1568.9800     37.0000     35.5000
+    646.1000   1568.9900     37.0000     35.5000
+    646.7000   1569.0000     37.0000     35.5000
+    647.3000   1569.0100     37.0000     35.5000
+    647.9000   1569.0200     37.0000     35.5000
+    648.5000   1569.0300     37.0000     35.5000
+    649.1000   1569.0400     37.0000     35.5000
+    649.7000   1569.0500     37.0000     35.5000
+    650.3000   1569.0600     37.0000     35.5000
+    650.9000   1569.0700     37.0000     35.5000
+    651.5000   1569.0800     37.0000     35.5000
+    652.1000   1569.0900     37.0000     35.5000
+    652.7000   1569.1000     37.0000     35.5000
+    653.3000   1569.1100     37.0000     35.5000
+    653.9000   1569.1200     37.0000     35.5000
+    654.5000   1569.1400     37.0000     35.5000
+    655.1000   1569.1500     37.0000     35.5000
+    655.7000   1569.1600     37.0000     35.5000
+    656.3000   1569.1700     37.0000     35.5000
+    656.9000   1569.1800     37.0000     35.5000
+    657.6000   1569.1900     37.0000     35.5000
+    658.2000   1569.2000     37.0000     35.5000
+    658.8000   1569.2100     37.0000     35.5000
+    659.4000   1569.2200     37.0000     35.5000
+    660.0000   1569.2300     37.0000     35.5000
+    660.6000   1569.2400     37.0000     35.5000
+    661.2000   1569.2500     37.0000     35.5000
+    661.8000   1569.2600     37.0000     35.5000
+    662.4000   1569.2700     37.0000     35.5000
+    663.0000   1569.2800     37.0000     35.5000
+    663.6000   1569.2900     37.0000     35.5000
+    664.2000   1569.3000     37.0000     35.5000
+    664.8000   1569.3100     37.0000     35.5000
+    665.4000   1569.3200     37.0000     35.5000
+    666.0000   1569.3300     37.0000     35.5000
+    666.6000   1569.3400     37.0000     35.5000
+    667.2000   1569.3500     37.0000     35.5000
+    667.8000   1569.3600     37.0000     35.5000
+    668.4000   1569.3700     37.0000     35.5000
+    669.0000   1569.3800     37.0000     35.5000
+    669.6000   1569.3900     37.0000     35.5000
+    670.2000   1569.4000     37.0000     35.5000
+    670.8000   1569.4100     37.0000     35.5000
+    671.4000   1569.4200     37.0000     35.5000
+    672.0000   1569.4300     37.0000     35.5000
+    672.6000   1569.4400     37.0000     35.5000
+    673.2000   1569.4500     37.0000     35.5000
+    673.8000   1569.4600     37.0000     35.5000
+    674.4000   1569.4700     37.0000     35.5000
+    675.0000   1569.4800     37.0000     35.5000
+    675.6000   1569.4900     37.0000     35.5000
+    676.2000   1569.5000     37.0000     35.5000
+    676.8000   1569.5100     37.0000     35.5000
+    677.4000   1569.5200     37.0000     35.5000
+    678.0000   1569.5300     37.0000     35.5000
+    678.6000   1569.5400     37.0000     35.5000
+    679.2000   1569.5500     37.0000     35.5000
+    679.8000   1569.5600     37.0000     35.5000
+    680.4000   1569.5700     37.0000     35.5000
+    681.0000   1569.5800     37.0000     35.5000
+    681.6000   1569.5900     37.0000     35.5000
+    682.2000   1569.6000     37.0000     35.5000
+    682.8000   1569.6100     37.0000     35.5000
+    683.4000   1569.6200     37.0000     35.5000
+    684.0000   1569.6300     37.0000     35.5000
+    684.6000   1569.6400     37.0000     35.5000
+    685.2000   1569.6500     37.0000     35.5000
+    685.8000   1569.6600     37.0000     35.5000
+    686.4000   1569.6700     37.0000     35.5000
+    687.0000   1569.6800     37.0000     35.5000
+    687.6000   1569.6900     37.0000     35.5000
+    688.2000   1569.7000     37.0000     35.5000
+    688.8000   1569.7100     37.0000     35.5000
+    689.4000   1569.7200     37.0000     35.5000
+    690.0000   1569.7300     37.0000     35.5000
+    690.6000   1569.7400     37.0000     35.5000
+    691.2000   1569.7500     37.0000     35.5000
+    691.8000   1569.7600     37.0000     35.5000
+    692.4000   1569.7700     37.0000     35.5000
+    693.0000   1569.7800     37.0000     35.5000
+    693.6000   1569.7900     37.0000     35.5000
+    694.2000   1569.8100     37.0000     35.5000
+    694.8000   1569.8200     37.0000     35.5000
+    695.4000   1569.8300     37.0000     35.5000
+    696.0000   1569.8400     37.0000     35.5000
+    696.6000   1569.8500     37.0000     35.5000
+    697.2000   1569.8600     37.0000     35.5000
+    697.8000   1569.8700     37.0000     35.5000
+    698.4000   1569.8800     37.0000     35.5000
+    699.0000   1569.8900     37.0000     35.5000
+    699.6000   1569.9000     37.0000     35.5000
+    700.2000   1569.9100     37.0000     35.5000
+    700.8000   1569.9200     37.0000     35.5000
+    701.4000   1569.9300     37.0000     35.5000
+    702.0000   1569.9400     37.0000     35.5000
+    702.6000   1569.9500     37.0000     35.5000
+    703.2000   1569.9600     37.0000     35.5000
+    703.8000   1569.9700     37.0000     35.5000
+    704.4000   1569.9800     37.0000     35.5000
+    705.0000   1569.9900     37.0000     35.5000
+    705.5000   1570.0000     37.0000     35.5000
+    706.1000   1570.0100     37.0000     35.5000
+    706.7000   1570.0200     37.0000     35.5000
+    707.3000   1570.0300     37.0000     35.5000
+    707.9000   1570.0400     37.0000     35.5000
+    708.5000   1570.0500     37.0000     35.5000
+    709.1000   1570.0600     37.0000     35.5000
+    709.7000   1570.0700     37.0000     35.5000
+    710.3000   1570.0800     37.0000     35.5000
+    710.9000   1570.0900     37.0000     35.5000
+    711.5000   1570.1000     37.0000     35.5000
+    712.1000   1570.1100     37.0000     35.5000
+    712.7000   1570.1200     37.0000     35.5000
+    713.3000   1570.1300     37.0000     35.5000
+    713.9000   1570.1400     37.0000     35.5000
+    714.5000   1570.1500     37.0000     35.5000
+    715.1000   1570.1600     37.0000     35.5000
+    715.7000   1570.1700     37.0000     35.5000
+    716.3000   1570.1800     37.0000     35.5000
+    716.9000   1570.1900     37.0000     35.5000
+    717.5000   1570.2000     37.0000     35.5000
+    718.1000   1570.2100     37.0000     35.5000
+    718.7000   1570.2200     37.0000     35.5000
+    719.3000   1570.2300     37.0000     35.5000
+    719.9000   1570.2400     37.0000     35.5000
+    720.5000   1570.2500     37.0000     35.5000
+    721.1000   1570.2600     37.0000     35.5000
+    721.7000   1570.2700     37.0000     35.5000
+    722.3000   1570.2800     37.0000     35.5000
+    722.9000   1570.2900     37.0000     35.5000
+    723.5000   1570.3000     37.0000     35.5000
+    724.1000   1570.3100     37.0000     35.5000
+    724.7000   1570.3200     37.0000     35.5000
+    725.3000   1570.3300     37.0000     35.5000
+    725.9000   1570.3400     37.0000     35.5000
+    726.5000   1570.3500     37.0000     35.5000
+    727.1000   1570.3600     37.0000     35.5000
+    727.7000   1570.3700     37.0000     35.5000
+    728.3000   1570.3800     37.0000     35.5000
+    728.8000   1570.3900     37.0000     35.5000
+    729.4000   1570.4000     37.0000     35.5000
+    730.0000   1570.4100     37.0000     35.5000
+    730.6000   1570.4200     37.0000     35.5000
+    731.2000   1570.4300     37.0000     35.5000
+    731.8000   1570.4400     37.0000     35.5000
+    732.4000   1570.4500     37.0000     35.5000
+    733.0000   1570.4600     37.0000     35.5000
+    733.6000   1570.4700     37.0000     35.5000
+    734.2000   1570.4800     37.0000     35.5000
+    734.8000   1570.4900     37.0000     35.5000
+    735.4000   1570.5000     37.0000     35.5000
+    736.0000   1570.5100     37.0000     35.5000
+    736.6000   1570.5200     37.0000     35.5000
+    737.2000   1570.5300     37.0000     35.5000
+    737.8000   1570.5400     37.0000     35.5000
+    738.4000   1570.5500     37.0000     35.5000
+    739.0000   1570.5600     37.0000     35.5000
+    739.6000   1570.5700     37.0000     35.5000
+    740.2000   1570.5800     37.0000     35.5000
+    740.8000   1570.5900     37.0000     35.5000
+    741.4000   1570.6000     37.0000     35.5000
+    742.0000   1570.6100     37.0000     35.5000
+    742.6000   1570.6200     37.0000     35.5000
+    743.2000   1570.6300     37.0000     35.5000
+    743.7000   1570.6400     37.0000     35.5000
+    744.3000   1570.6500     37.0000     35.5000
+    744.9000   1570.6600     37.0000     35.5000
+    745.5000   1570.6700     37.0000     35.5000
+    746.1000   1570.6800     37.0000     35.5000
+    746.7000   1570.6900     37.0000     35.5000
+    747.3000   1570.7000     37.0000     35.5000
+    747.9000   1570.7100     37.0000     35.5000
+    748.5000   1570.7200     37.0000     35.5000
+    749.1000   1570.7300     37.0000     35.5000
+    749.7000   1570.7400     37.0000     35.5000
+    750.3000   1570.7500     37.0000     35.5000
+    750.9000   1570.7600     37.0000     35.5000
+    751.5000   1570.7700     37.0000     35.5000
+    752.1000   1570.7800     37.0000     35.5000
+    752.7000   1570.7900     37.0000     35.5000
+    753.3000   1570.8000     37.0000     35.5000
+    753.9000   1570.8100     37.0000     35.5000
+    754.5000   1570.8200     37.0000     35.5000
+    755.1000   1570.8300     37.0000     35.5000
+    755.7000   1570.8400     37.0000     35.5000
+    756.2000   1570.8500     37.0000     35.5000
+    756.8000   1570.8600     37.0000     35.5000
+    757.4000   1570.8700     37.0000     35.5000
+    758.0000   1570.8800     37.0000     35.5000
+    758.6000   1570.8900     37.0000     35.5000
+    759.2000   1570.9000     37.0000     35.5000
+    759.8000   1570.9100     37.0000     35.5000
+    760.4000   1570.9200     37.0000     35.5000
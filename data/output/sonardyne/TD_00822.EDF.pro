@@ -0,0 +1,1231 @@
+test_read_store_and_write
+1/1/2011
+16:42:18
+Probe: Deep Blue
+Source: /root/package/data/input/sippican/TD_00822.EDF
+      0.0000   1541.9400     36.2500     27.6900
+      0.6000   1543.3400     36.2500     28.3200
+      1.3000   1543.7900     36.2500     28.5200
+      1.9000   1543.9400     36.2500     28.5800
+      2.6000   1543.9900     36.2500     28.6000
+      3.2000   1544.0000     36.2500     28.6000
+      3.9000   1544.0000     36.2500     28.6000
+      4.5000   1544.0100     36.2500     28.6000
+      5.2000   1544.0300     36.2500     28.6000
+      5.8000   1544.0500     36.2500     28.6000
+      6.5000   1544.0300     36.2500     28.5900
+      7.1000   1544.0500     36.2500     28.6000
+      7.8000   1544.0700     36.2500     28.6000
+      8.4000   1544.0700     36.2500     28.6000
+      9.1000   1544.0700     36.2500     28.5900
+      9.7000   1544.0500     36.2500     28.5700
+     10.3000   1544.0400     36.2500     28.5700
+     11.0000   1544.0200     36.2500     28.5500
+     11.6000   1544.0000     36.2500     28.5400
+     12.3000   1543.9800     36.2500     28.5200
+     12.9000   1543.9400     36.2500     28.5000
+     13.6000   1543.9400     36.2500     28.4900
+     14.2000   1543.9500     36.2500     28.4900
+     14.9000   1543.9100     36.2500     28.4700
+     15.5000   1543.9000     36.2500     28.4600
+     16.2000   1543.8900     36.2500     28.4500
+     16.8000   1543.8600     36.2500     28.4300
+     17.5000   1543.8500     36.2500     28.4200
+     18.1000   1543.8400     36.2500     28.4100
+     18.8000   1543.8500     36.2500     28.4100
+     19.4000   1543.8600     36.2500     28.4100
+     20.0000   1543.8600     36.2500     28.4100
+     20.7000   1543.8800     36.2500     28.4100
+     21.3000   1543.9000     36.2500     28.4200
+     22.0000   1543.9100     36.2500     28.4100
+     22.6000   1543.9100     36.2500     28.4100
+     23.3000   1543.9200     36.2500     28.4100
+     23.9000   1543.9200     36.2500     28.4000
+     24.6000   1543.9300     36.2500     28.4100
+     25.2000   1543.9400     36.2500     28.4000
+     25.9000   1543.9400     36.2500     28.4000
+     26.5000   1543.9600     36.2500     28.4000
+     27.1000   1543.9800     36.2500     28.4100
+     27.8000   1543.9900     36.2500     28.4100
+     28.4000   1544.0000     36.2500     28.4000
+     29.1000   1544.0000     36.2500     28.4000
+     29.7000   1544.0100     36.2500     28.4000
+     30.4000   1544.0100     36.2500     28.4000
+     31.0000   1544.0200     36.2500     28.4000
+     31.7000   1544.0300     36.2500     28.4000
+     32.3000   1544.0500     36.2500     28.4000
+     33.0000   1544.0700     36.2500     28.4000
+     33.6000   1544.0900     36.2500     28.4100
+     34.2000   1544.1000     36.2500     28.4000
+     34.9000   1544.1000     36.2500     28.4000
+     35.5000   1544.1000     36.2500     28.4000
+     36.2000   1544.1100     36.2500     28.3900
+     36.8000   1544.1100     36.2500     28.3900
+     37.5000   1544.1300     36.2500     28.3900
+     38.1000   1544.1300     36.2500     28.3900
+     38.8000   1544.1200     36.2500     28.3800
+     39.4000   1544.1300     36.2500     28.3800
+     40.0000   1544.1300     36.2500     28.3800
+     40.7000   1544.1200     36.2500     28.3700
+     41.3000   1544.1400     36.2500     28.3700
+     42.0000   1544.1600     36.2500     28.3800
+     42.6000   1544.1700     36.2500     28.3700
+     43.3000   1544.1700     36.2500     28.3700
+     43.9000   1544.2000     36.2500     28.3800
+     44.6000   1544.2100     36.2500     28.3800
+     45.2000   1544.2100     36.2500     28.3700
+     45.8000   1544.2200     36.2500     28.3700
+     46.5000   1544.2300     36.2500     28.3700
+     47.1000   1544.2200     36.2500     28.3600
+     47.8000   1544.2000     36.2500     28.3500
+     48.4000   1544.2000     36.2500     28.3400
+     49.1000   1544.2000     36.2500     28.3400
+     49.7000   1544.1900     36.2500     28.3300
+     50.4000   1544.1800     36.2500     28.3200
+     51.0000   1544.1700     36.2500     28.3100
+     51.6000   1544.1800     36.2500     28.3100
+     52.3000   1544.1800     36.2500     28.3000
+     52.9000   1544.1700     36.2500     28.2900
+     53.6000   1544.1500     36.2500     28.2800
+     54.2000   1544.1500     36.2500     28.2800
+     54.9000   1544.1400     36.2500     28.2700
+     55.5000   1544.1500     36.2500     28.2600
+     56.1000   1544.1400     36.2500     28.2600
+     56.8000   1544.1500     36.2500     28.2600
+     57.4000   1544.1400     36.2500     28.2500
+     58.1000   1544.1600     36.2500     28.2500
+     58.7000   1544.1600     36.2500     28.2500
+     59.4000   1544.1600     36.2500     28.2400
+     60.0000   1544.1600     36.2500     28.2400
+     60.6000   1544.1400     36.2500     28.2200
+     61.3000   1544.1200     36.2500     28.2100
+     61.9000   1544.1200     36.2500     28.2000
+     62.6000   1544.1000     36.2500     28.1900
+     63.2000   1544.0900     36.2500     28.1800
+     63.9000   1544.0900     36.2500     28.1700
+     64.5000   1544.0900     36.2500     28.1700
+     65.1000   1544.0700     36.2500     28.1500
+     65.8000   1544.0300     36.2500     28.1300
+     66.4000   1544.0000     36.2500     28.1100
+     67.1000   1543.9600     36.2500     28.0900
+     67.7000   1543.9300     36.2500     28.0700
+     68.4000   1543.9400     36.2500     28.0700
+     69.0000   1543.9700     36.2500     28.0800
+     69.6000   1543.9500     36.2500     28.0600
+     70.3000   1543.9200     36.2500     28.0400
+     70.9000   1543.9100     36.2500     28.0400
+     71.6000   1543.9500     36.2500     28.0500
+     72.2000   1543.9300     36.2500     28.0400
+     72.9000   1543.8900     36.2500     28.0100
+     73.5000   1543.8600     36.2500     27.9900
+     74.1000   1543.8300     36.2500     27.9800
+     74.8000   1543.8100     36.2500     27.9600
+     75.4000   1543.8200     36.2500     27.9600
+     76.1000   1543.8000     36.2500     27.9500
+     76.7000   1543.7900     36.2500     27.9400
+     77.4000   1543.7500     36.2500     27.9200
+     78.0000   1543.6800     36.2500     27.8800
+     78.6000   1543.5300     36.2500     27.8100
+     79.3000   1543.3700     36.2500     27.7300
+     79.9000   1543.2500     36.2500     27.6700
+     80.6000   1543.1800     36.2500     27.6300
+     81.2000   1543.1300     36.2500     27.6100
+     81.8000   1543.1100     36.2500     27.5900
+     82.5000   1543.1100     36.2500     27.5900
+     83.1000   1543.1100     36.2500     27.5800
+     83.8000   1543.1200     36.2500     27.5800
+     84.4000   1543.1000     36.2500     27.5700
+     85.1000   1543.0300     36.2500     27.5300
+     85.7000   1542.9700     36.2500     27.5000
+     86.3000   1542.9100     36.2500     27.4700
+     87.0000   1542.8600     36.2500     27.4400
+     87.6000   1542.8200     36.2500     27.4200
+     88.3000   1542.8200     36.2500     27.4100
+     88.9000   1542.8700     36.2500     27.4300
+     89.5000   1542.9400     36.2500     27.4600
+     90.2000   1542.9800     36.2500     27.4700
+     90.8000   1543.0000     36.2500     27.4800
+     91.5000   1543.0400     36.2500     27.4900
+     92.1000   1543.0900     36.2500     27.5100
+     92.7000   1543.0900     36.2500     27.5000
+     93.4000   1543.0700     36.2500     27.4900
+     94.0000   1543.0600     36.2500     27.4800
+     94.7000   1543.0500     36.2500     27.4700
+     95.3000   1543.0100     36.2500     27.4500
+     96.0000   1542.9500     36.2500     27.4100
+     96.6000   1542.8700     36.2500     27.3700
+     97.2000   1542.8100     36.2500     27.3400
+     97.9000   1542.7700     36.2500     27.3200
+     98.5000   1542.7400     36.2500     27.3000
+     99.2000   1542.7000     36.2500     27.2800
+     99.8000   1542.6800     36.2500     27.2700
+    100.4000   1542.6900     36.2500     27.2600
+    101.1000   1542.6900     36.2500     27.2600
+    101.7000   1542.6600     36.2500     27.2400
+    102.4000   1542.6500     36.2500     27.2300
+    103.0000   1542.6300     36.2500     27.2200
+    103.6000   1542.5800     36.2500     27.1900
+    104.3000   1542.5300     36.2500     27.1700
+    104.9000   1542.5300     36.2500     27.1600
+    105.6000   1542.5400     36.2500     27.1600
+    106.2000   1542.5600     36.2500     27.1600
+    106.8000   1542.5600     36.2500     27.1600
+    107.5000   1542.5800     36.2500     27.1600
+    108.1000   1542.6000     36.2500     27.1700
+    108.8000   1542.6000     36.2500     27.1600
+    109.4000   1542.5800     36.2500     27.1500
+    110.0000   1542.4900     36.2500     27.1100
+    110.7000   1542.3800     36.2500     27.0500
+    111.3000   1542.2800     36.2500     27.0000
+    112.0000   1542.2300     36.2500     26.9800
+    112.6000   1542.1600     36.2500     26.9400
+    113.2000   1542.0600     36.2500     26.8900
+    113.9000   1542.0000     36.2500     26.8600
+    114.5000   1541.9700     36.2500     26.8400
+    115.2000   1541.9300     36.2500     26.8200
+    115.8000   1541.8800     36.2500     26.7900
+    116.4000   1541.8300     36.2500     26.7700
+    117.1000   1541.7600     36.2500     26.7300
+    117.7000   1541.7000     36.2500     26.7000
+    118.4000   1541.6400     36.2500     26.6700
+    119.0000   1541.6000     36.2500     26.6400
+    119.6000   1541.5400     36.2500     26.6200
+    120.3000   1541.4800     36.2500     26.5900
+    120.9000   1541.4200     36.2500     26.5500
+    121.5000   1541.3600     36.2500     26.5200
+    122.2000   1541.2700     36.2500     26.4800
+    122.8000   1541.1900     36.2500     26.4400
+    123.5000   1541.0600     36.2500     26.3800
+    124.1000   1540.8500     36.2500     26.2800
+    124.7000   1540.6900     36.2500     26.2100
+    125.4000   1540.6400     36.2500     26.1800
+    126.0000   1540.5900     36.2500     26.1600
+    126.7000   1540.5600     36.2500     26.1400
+    127.3000   1540.5200     36.2500     26.1200
+    127.9000   1540.4700     36.2500     26.0900
+    128.6000   1540.3900     36.2500     26.0500
+    129.2000   1540.1500     36.2500     25.9500
+    129.9000   1539.8600     36.2500     25.8200
+    130.5000   1539.6700     36.2500     25.7300
+    131.1000   1539.5500     36.2500     25.6800
+    131.8000   1539.4900     36.2500     25.6500
+    132.4000   1539.4500     36.2500     25.6200
+    133.0000   1539.4000     36.2500     25.6000
+    133.7000   1539.3400     36.2500     25.5700
+    134.3000   1539.1400     36.2500     25.4800
+    135.0000   1538.9500     36.2500     25.4000
+    135.6000   1538.8900     36.2500     25.3700
+    136.2000   1538.8400     36.2500     25.3400
+    136.9000   1538.8200     36.2500     25.3300
+    137.5000   1538.8200     36.2500     25.3200
+    138.1000   1538.8100     36.2500     25.3100
+    138.8000   1538.7600     36.2500     25.2900
+    139.4000   1538.7000     36.2500     25.2600
+    140.1000   1538.6100     36.2500     25.2200
+    140.7000   1538.5600     36.2500     25.1900
+    141.3000   1538.5200     36.2500     25.1700
+    142.0000   1538.3900     36.2500     25.1100
+    142.6000   1538.1700     36.2500     25.0200
+    143.3000   1537.9500     36.2500     24.9200
+    143.9000   1537.8000     36.2500     24.8500
+    144.5000   1537.6500     36.2500     24.7900
+    145.2000   1537.4500     36.2500     24.7000
+    145.8000   1537.2100     36.2500     24.6000
+    146.4000   1537.0300     36.2500     24.5200
+    147.1000   1536.9600     36.2500     24.4800
+    147.7000   1536.9100     36.2500     24.4600
+    148.4000   1536.8600     36.2500     24.4300
+    149.0000   1536.8300     36.2500     24.4200
+    149.6000   1536.8100     36.2500     24.4000
+    150.3000   1536.8100     36.2500     24.4000
+    150.9000   1536.8000     36.2500     24.3900
+    151.5000   1536.7900     36.2500     24.3900
+    152.2000   1536.7900     36.2500     24.3800
+    152.8000   1536.8000     36.2500     24.3800
+    153.4000   1536.8100     36.2500     24.3800
+    154.1000   1536.8200     36.2500     24.3800
+    154.7000   1536.8200     36.2500     24.3700
+    155.4000   1536.8400     36.2500     24.3800
+    156.0000   1536.8300     36.2500     24.3700
+    156.6000   1536.7900     36.2500     24.3500
+    157.3000   1536.6700     36.2500     24.3000
+    157.9000   1536.5300     36.2500     24.2300
+    158.5000   1536.4300     36.2500     24.1900
+    159.2000   1536.4000     36.2500     24.1700
+    159.8000   1536.3800     36.2500     24.1600
+    160.4000   1536.3700     36.2500     24.1500
+    161.1000   1536.3600     36.2500     24.1500
+    161.7000   1536.3800     36.2500     24.1500
+    162.4000   1536.3000     36.2500     24.1100
+    163.0000   1536.1700     36.2500     24.0500
+    163.6000   1536.1000     36.2500     24.0200
+    164.3000   1536.0500     36.2500     24.0000
+    164.9000   1535.9800     36.2500     23.9600
+    165.5000   1535.8900     36.2500     23.9200
+    166.2000   1535.8700     36.2500     23.9100
+    166.8000   1535.8700     36.2500     23.9100
+    167.4000   1535.8600     36.2500     23.9000
+    168.1000   1535.8500     36.2500     23.8900
+    168.7000   1535.8000     36.2500     23.8700
+    169.4000   1535.7700     36.2500     23.8500
+    170.0000   1535.7200     36.2500     23.8300
+    170.6000   1535.6700     36.2500     23.8000
+    171.3000   1535.6000     36.2500     23.7700
+    171.9000   1535.4500     36.2500     23.7000
+    172.5000   1535.2900     36.2500     23.6400
+    173.2000   1535.1500     36.2500     23.5800
+    173.8000   1534.9800     36.2500     23.5000
+    174.4000   1534.8200     36.2500     23.4300
+    175.1000   1534.7200     36.2500     23.3900
+    175.7000   1534.6400     36.2500     23.3500
+    176.3000   1534.5900     36.2500     23.3300
+    177.0000   1534.5500     36.2500     23.3100
+    177.6000   1534.5100     36.2500     23.2900
+    178.3000   1534.5000     36.2500     23.2800
+    178.9000   1534.4800     36.2500     23.2700
+    179.5000   1534.4600     36.2500     23.2600
+    180.2000   1534.4300     36.2500     23.2400
+    180.8000   1534.3500     36.2500     23.2100
+    181.4000   1534.2600     36.2500     23.1700
+    182.1000   1534.2000     36.2500     23.1400
+    182.7000   1534.1700     36.2500     23.1200
+    183.3000   1534.1800     36.2500     23.1200
+    184.0000   1534.1700     36.2500     23.1100
+    184.6000   1534.1500     36.2500     23.1000
+    185.2000   1534.1300     36.2500     23.0900
+    185.9000   1534.0900     36.2500     23.0700
+    186.5000   1534.0000     36.2500     23.0300
+    187.1000   1533.8500     36.2500     22.9700
+    187.8000   1533.7100     36.2500     22.9100
+    188.4000   1533.6200     36.2500     22.8700
+    189.0000   1533.6000     36.2500     22.8600
+    189.7000   1533.5500     36.2500     22.8300
+    190.3000   1533.5000     36.2500     22.8100
+    190.9000   1533.4400     36.2500     22.7800
+    191.6000   1533.3800     36.2500     22.7500
+    192.2000   1533.3200     36.2500     22.7300
+    192.9000   1533.2700     36.2500     22.7000
+    193.5000   1533.2000     36.2500     22.6700
+    194.1000   1533.1100     36.2500     22.6300
+    194.8000   1533.0400     36.2500     22.6000
+    195.4000   1532.9900     36.2500     22.5800
+    196.0000   1532.9200     36.2500     22.5500
+    196.7000   1532.8800     36.2500     22.5300
+    197.3000   1532.8400     36.2500     22.5100
+    197.9000   1532.7800     36.2500     22.4800
+    198.6000   1532.7000     36.2500     22.4500
+    199.2000   1532.6100     36.2500     22.4000
+    199.8000   1532.5100     36.2500     22.3600
+    200.5000   1532.4200     36.2500     22.3300
+    201.1000   1532.2200     36.2500     22.2400
+    201.7000   1531.9400     36.2500     22.1300
+    202.4000   1531.7600     36.2500     22.0600
+    203.0000   1531.6200     36.2500     22.0000
+    203.6000   1531.4100     36.2500     21.9100
+    204.3000   1531.1800     36.2500     21.8300
+    204.9000   1531.0000     36.2500     21.7500
+    205.5000   1530.9100     36.2500     21.7200
+    206.2000   1530.8600     36.2500     21.6900
+    206.8000   1530.7900     36.2500     21.6600
+    207.4000   1530.6800     36.2500     21.6200
+    208.1000   1530.5900     36.2500     21.5800
+    208.7000   1530.4800     36.2500     21.5300
+    209.3000   1530.3400     36.2500     21.4700
+    210.0000   1530.2600     36.2500     21.4400
+    210.6000   1530.2300     36.2500     21.4200
+    211.2000   1530.1900     36.2500     21.4000
+    211.9000   1530.1400     36.2500     21.3800
+    212.5000   1530.1100     36.2500     21.3700
+    213.1000   1530.1000     36.2500     21.3600
+    213.8000   1530.0900     36.2500     21.3500
+    214.4000   1530.0700     36.2500     21.3400
+    215.0000   1530.0400     36.2500     21.3300
+    215.7000   1530.0000     36.2500     21.3100
+    216.3000   1529.9300     36.2500     21.2800
+    216.9000   1529.8400     36.2500     21.2400
+    217.6000   1529.7800     36.2500     21.2100
+    218.2000   1529.7100     36.2500     21.1800
+    218.8000   1529.5400     36.2500     21.1100
+    219.4000   1529.3600     36.2500     21.0400
+    220.1000   1529.2500     36.2500     21.0000
+    220.7000   1529.1000     36.2500     20.9400
+    221.3000   1528.9200     36.2500     20.8700
+    222.0000   1528.7800     36.2500     20.8100
+    222.6000   1528.7000     36.2500     20.7800
+    223.2000   1528.6100     36.2500     20.7400
+    223.9000   1528.5300     36.2500     20.7100
+    224.5000   1528.4600     36.2500     20.6800
+    225.1000   1528.4000     36.2500     20.6500
+    225.8000   1528.3700     36.2500     20.6400
+    226.4000   1528.3200     36.2500     20.6100
+    227.0000   1528.2700     36.2500     20.5900
+    227.7000   1528.2100     36.2500     20.5700
+    228.3000   1528.1700     36.2500     20.5500
+    228.9000   1528.1500     36.2500     20.5400
+    229.6000   1528.1000     36.2500     20.5100
+    230.2000   1528.0400     36.2500     20.4900
+    230.8000   1527.9700     36.2500     20.4600
+    231.5000   1527.8800     36.2500     20.4200
+    232.1000   1527.8000     36.2500     20.3900
+    232.7000   1527.7400     36.2500     20.3600
+    233.4000   1527.7000     36.2500     20.3400
+    234.0000   1527.6900     36.2500     20.3400
+    234.6000   1527.6800     36.2500     20.3300
+    235.2000   1527.6700     36.2500     20.3200
+    235.9000   1527.6600     36.2500     20.3200
+    236.5000   1527.6000     36.2500     20.2900
+    237.1000   1527.4600     36.2500     20.2300
+    237.8000   1527.3000     36.2500     20.1700
+    238.4000   1527.1300     36.2500     20.1100
+    239.0000   1527.0100     36.2500     20.0600
+    239.7000   1526.9000     36.2500     20.0200
+    240.3000   1526.8200     36.2500     19.9800
+    240.9000   1526.7600     36.2500     19.9600
+    241.6000   1526.7000     36.2500     19.9300
+    242.2000   1526.6400     36.2500     19.9100
+    242.8000   1526.6000     36.2500     19.8900
+    243.4000   1526.5800     36.2500     19.8800
+    244.1000   1526.5600     36.2500     19.8700
+    244.7000   1526.5100     36.2500     19.8400
+    245.3000   1526.4300     36.2500     19.8100
+    246.0000   1526.2700     36.2500     19.7500
+    246.6000   1525.9200     36.2500     19.6200
+    247.2000   1525.4600     36.2500     19.4500
+    247.9000   1525.0900     36.2500     19.3200
+    248.5000   1524.8900     36.2500     19.2400
+    249.1000   1524.8100     36.2500     19.2100
+    249.8000   1524.7700     36.2500     19.1900
+    250.4000   1524.7700     36.2500     19.1900
+    251.0000   1524.7400     36.2500     19.1700
+    251.6000   1524.6900     36.2500     19.1500
+    252.3000   1524.5800     36.2500     19.1100
+    252.9000   1524.4700     36.2500     19.0700
+    253.5000   1524.3500     36.2500     19.0200
+    254.2000   1524.2000     36.2500     18.9700
+    254.8000   1524.1000     36.2500     18.9300
+    255.4000   1524.0300     36.2500     18.9000
+    256.1000   1523.9800     36.2500     18.8800
+    256.7000   1523.9200     36.2500     18.8500
+    257.3000   1523.8800     36.2500     18.8400
+    257.9000   1523.8600     36.2500     18.8200
+    258.6000   1523.8400     36.2500     18.8100
+    259.2000   1523.8100     36.2500     18.8000
+    259.8000   1523.7900     36.2500     18.7900
+    260.5000   1523.7700     36.2500     18.7800
+    261.1000   1523.7500     36.2500     18.7700
+    261.7000   1523.7100     36.2500     18.7500
+    262.4000   1523.6600     36.2500     18.7300
+    263.0000   1523.6200     36.2500     18.7100
+    263.6000   1523.5600     36.2500     18.6900
+    264.2000   1523.5100     36.2500     18.6600
+    264.9000   1523.4900     36.2500     18.6500
+    265.5000   1523.4600     36.2500     18.6400
+    266.1000   1523.4200     36.2500     18.6200
+    266.8000   1523.3500     36.2500     18.5900
+    267.4000   1523.2900     36.2500     18.5700
+    268.0000   1523.2200     36.2500     18.5400
+    268.6000   1523.1400     36.2500     18.5100
+    269.3000   1523.0600     36.2500     18.4800
+    269.9000   1523.0100     36.2500     18.4600
+    270.5000   1522.9900     36.2500     18.4500
+    271.2000   1522.9600     36.2500     18.4300
+    271.8000   1522.9400     36.2500     18.4200
+    272.4000   1522.9300     36.2500     18.4200
+    273.0000   1522.9200     36.2500     18.4100
+    273.7000   1522.9200     36.2500     18.4000
+    274.3000   1522.8900     36.2500     18.3900
+    274.9000   1522.8700     36.2500     18.3800
+    275.6000   1522.8600     36.2500     18.3700
+    276.2000   1522.8400     36.2500     18.3600
+    276.8000   1522.8000     36.2500     18.3400
+    277.4000   1522.7100     36.2500     18.3100
+    278.1000   1522.6300     36.2500     18.2800
+    278.7000   1522.5400     36.2500     18.2400
+    279.3000   1522.4200     36.2500     18.2000
+    280.0000   1522.0900     36.2500     18.0800
+    280.6000   1521.6900     36.2500     17.9400
+    281.2000   1521.4200     36.2500     17.8400
+    281.8000   1521.2900     36.2500     17.8000
+    282.5000   1521.2300     36.2500     17.7700
+    283.1000   1521.1600     36.2500     17.7500
+    283.7000   1521.1000     36.2500     17.7200
+    284.4000   1521.0800     36.2500     17.7100
+    285.0000   1521.0700     36.2500     17.7000
+    285.6000   1521.0700     36.2500     17.7000
+    286.2000   1521.0400     36.2500     17.6900
+    286.9000   1520.9400     36.2500     17.6500
+    287.5000   1520.7900     36.2500     17.5900
+    288.1000   1520.6700     36.2500     17.5500
+    288.7000   1520.6000     36.2500     17.5300
+    289.4000   1520.5400     36.2500     17.5000
+    290.0000   1520.4700     36.2500     17.4700
+    290.6000   1520.4300     36.2500     17.4600
+    291.3000   1520.4100     36.2500     17.4500
+    291.9000   1520.4100     36.2500     17.4400
+    292.5000   1520.4000     36.2500     17.4300
+    293.1000   1520.3600     36.2500     17.4200
+    293.8000   1520.2700     36.2500     17.3800
+    294.4000   1520.1700     36.2500     17.3500
+    295.0000   1520.0900     36.2500     17.3200
+    295.7000   1520.0200     36.2500     17.2900
+    296.3000   1519.8900     36.2500     17.2400
+    296.9000   1519.7700     36.2500     17.2000
+    297.5000   1519.7000     36.2500     17.1700
+    298.2000   1519.6600     36.2500     17.1600
+    298.8000   1519.6300     36.2500     17.1400
+    299.4000   1519.5600     36.2500     17.1100
+    300.0000   1519.5000     36.2500     17.0900
+    300.7000   1519.4400     36.2500     17.0600
+    301.3000   1519.3800     36.2500     17.0400
+    301.9000   1519.3500     36.2500     17.0300
+    302.5000   1519.3100     36.2500     17.0100
+    303.2000   1519.2500     36.2500     16.9900
+    303.8000   1519.1600     36.2500     16.9500
+    304.4000   1519.0400     36.2500     16.9100
+    305.1000   1518.9100     36.2500     16.8600
+    305.7000   1518.8000     36.2500     16.8300
+    306.3000   1518.7200     36.2500     16.8000
+    306.9000   1518.5800     36.2500     16.7500
+    307.6000   1518.3500     36.2500     16.6700
+    308.2000   1518.0900     36.2500     16.5800
+    308.8000   1517.8800     36.2500     16.5000
+    309.4000   1517.7100     36.2500     16.4400
+    310.1000   1517.5700     36.2500     16.3900
+    310.7000   1517.4500     36.2500     16.3500
+    311.3000   1517.3500     36.2500     16.3100
+    311.9000   1517.2400     36.2500     16.2800
+    312.6000   1517.1500     36.2500     16.2400
+    313.2000   1517.0300     36.2500     16.2000
+    313.8000   1516.8900     36.2500     16.1500
+    314.4000   1516.7600     36.2500     16.1100
+    315.1000   1516.6000     36.2500     16.0500
+    315.7000   1516.4200     36.2500     15.9900
+    316.3000   1516.2700     36.2500     15.9300
+    316.9000   1516.1200     36.2500     15.8800
+    317.6000   1516.0000     36.2500     15.8400
+    318.2000   1515.9500     36.2500     15.8200
+    318.8000   1515.8600     36.2500     15.7900
+    319.5000   1515.6700     36.2500     15.7200
+    320.1000   1515.4500     36.2500     15.6500
+    320.7000   1515.3500     36.2500     15.6100
+    321.3000   1515.3000     36.2500     15.5900
+    322.0000   1515.2500     36.2500     15.5700
+    322.6000   1515.2100     36.2500     15.5600
+    323.2000   1515.1900     36.2500     15.5500
+    323.8000   1515.1900     36.2500     15.5400
+    324.5000   1515.1600     36.2500     15.5300
+    325.1000   1515.1100     36.2500     15.5100
+    325.7000   1515.0200     36.2500     15.4800
+    326.3000   1514.9100     36.2500     15.4400
+    327.0000   1514.8400     36.2500     15.4100
+    327.6000   1514.7900     36.2500     15.4000
+    328.2000   1514.7600     36.2500     15.3800
+    328.8000   1514.7600     36.2500     15.3800
+    329.5000   1514.7300     36.2500     15.3700
+    330.1000   1514.5600     36.2500     15.3100
+    330.7000   1514.2700     36.2500     15.2100
+    331.3000   1514.0000     36.2500     15.1200
+    332.0000   1513.8200     36.2500     15.0600
+    332.6000   1513.6300     36.2500     15.0000
+    333.2000   1513.4600     36.2500     14.9400
+    333.8000   1513.3200     36.2500     14.8900
+    334.5000   1513.1400     36.2500     14.8400
+    335.1000   1512.8800     36.2500     14.7500
+    335.7000   1512.6900     36.2500     14.6900
+    336.3000   1512.5800     36.2500     14.6500
+    336.9000   1512.5200     36.2500     14.6300
+    337.6000   1512.5000     36.2500     14.6200
+    338.2000   1512.4700     36.2500     14.6000
+    338.8000   1512.4300     36.2500     14.5900
+    339.4000   1512.3800     36.2500     14.5700
+    340.1000   1512.3000     36.2500     14.5400
+    340.7000   1512.1900     36.2500     14.5000
+    341.3000   1511.9900     36.2500     14.4400
+    341.9000   1511.7000     36.2500     14.3400
+    342.6000   1511.4000     36.2500     14.2500
+    343.2000   1511.1100     36.2500     14.1500
+    343.8000   1510.9000     36.2500     14.0900
+    344.4000   1510.7600     36.2500     14.0400
+    345.1000   1510.6200     36.2500     13.9900
+    345.7000   1510.4600     36.2500     13.9400
+    346.3000   1510.1700     36.2500     13.8500
+    346.9000   1509.9800     36.2500     13.7900
+    347.6000   1509.8900     36.2500     13.7500
+    348.2000   1509.7600     36.2500     13.7100
+    348.8000   1509.6600     36.2500     13.6800
+    349.4000   1509.6100     36.2500     13.6600
+    350.0000   1509.5500     36.2500     13.6400
+    350.7000   1509.4900     36.2500     13.6100
+    351.3000   1509.4000     36.2500     13.5800
+    351.9000   1509.2700     36.2500     13.5400
+    352.5000   1509.1500     36.2500     13.5000
+    353.2000   1509.0700     36.2500     13.4700
+    353.8000   1508.9700     36.2500     13.4400
+    354.4000   1508.9100     36.2500     13.4200
+    355.0000   1508.8500     36.2500     13.4000
+    355.7000   1508.7600     36.2500     13.3700
+    356.3000   1508.6700     36.2500     13.3400
+    356.9000   1508.5600     36.2500     13.3000
+    357.5000   1508.4400     36.2500     13.2600
+    358.1000   1508.3300     36.2500     13.2300
+    358.8000   1508.2500     36.2500     13.2000
+    359.4000   1508.0900     36.2500     13.1500
+    360.0000   1507.9500     36.2500     13.1000
+    360.6000   1507.8500     36.2500     13.0700
+    361.3000   1507.7700     36.2500     13.0400
+    361.9000   1507.7000     36.2500     13.0200
+    362.5000   1507.6600     36.2500     13.0000
+    363.1000   1507.6100     36.2500     12.9800
+    363.8000   1507.5900     36.2500     12.9700
+    364.4000   1507.5300     36.2500     12.9500
+    365.0000   1507.3700     36.2500     12.9000
+    365.6000   1507.2000     36.2500     12.8400
+    366.2000   1507.0900     36.2500     12.8100
+    366.9000   1506.9400     36.2500     12.7600
+    367.5000   1506.7400     36.2500     12.7000
+    368.1000   1506.5200     36.2500     12.6300
+    368.7000   1506.3900     36.2500     12.5900
+    369.4000   1506.2800     36.2500     12.5500
+    370.0000   1506.1400     36.2500     12.5100
+    370.6000   1505.9900     36.2500     12.4600
+    371.2000   1505.8500     36.2500     12.4200
+    371.8000   1505.7600     36.2500     12.3800
+    372.5000   1505.7100     36.2500     12.3700
+    373.1000   1505.6900     36.2500     12.3600
+    373.7000   1505.6800     36.2500     12.3500
+    374.3000   1505.6600     36.2500     12.3400
+    375.0000   1505.6200     36.2500     12.3300
+    375.6000   1505.5900     36.2500     12.3200
+    376.2000   1505.5800     36.2500     12.3100
+    376.8000   1505.5300     36.2500     12.2900
+    377.4000   1505.4700     36.2500     12.2700
+    378.1000   1505.4300     36.2500     12.2600
+    378.7000   1505.4200     36.2500     12.2500
+    379.3000   1505.4100     36.2500     12.2500
+    379.9000   1505.4000     36.2500     12.2400
+    380.5000   1505.3500     36.2500     12.2200
+    381.2000   1505.2700     36.2500     12.1900
+    381.8000   1505.1500     36.2500     12.1600
+    382.4000   1505.0500     36.2500     12.1200
+    383.0000   1504.8600     36.2500     12.0700
+    383.6000   1504.6000     36.2500     11.9900
+    384.3000   1504.4500     36.2500     11.9400
+    384.9000   1504.4000     36.2500     11.9200
+    385.5000   1504.3800     36.2500     11.9100
+    386.1000   1504.3600     36.2500     11.9000
+    386.8000   1504.3300     36.2500     11.8900
+    387.4000   1504.2500     36.2500     11.8700
+    388.0000   1504.1300     36.2500     11.8200
+    388.6000   1504.0300     36.2500     11.7900
+    389.2000   1503.9800     36.2500     11.7800
+    389.9000   1503.9700     36.2500     11.7700
+    390.5000   1503.9300     36.2500     11.7600
+    391.1000   1503.8100     36.2500     11.7200
+    391.7000   1503.7500     36.2500     11.7000
+    392.3000   1503.7100     36.2500     11.6800
+    393.0000   1503.6200     36.2500     11.6500
+    393.6000   1503.5000     36.2500     11.6200
+    394.2000   1503.4200     36.2500     11.5900
+    394.8000   1503.3900     36.2500     11.5800
+    395.4000   1503.3500     36.2500     11.5600
+    396.1000   1503.3200     36.2500     11.5500
+    396.7000   1503.2400     36.2500     11.5200
+    397.3000   1503.1100     36.2500     11.4800
+    397.9000   1503.0000     36.2500     11.4500
+    398.5000   1502.9100     36.2500     11.4200
+    399.2000   1502.7900     36.2500     11.3800
+    399.8000   1502.6900     36.2500     11.3500
+    400.4000   1502.6000     36.2500     11.3200
+    401.0000   1502.5300     36.2500     11.3000
+    401.6000   1502.5100     36.2500     11.2900
+    402.3000   1502.4900     36.2500     11.2800
+    402.9000   1502.4700     36.2500     11.2700
+    403.5000   1502.4100     36.2500     11.2500
+    404.1000   1502.3100     36.2500     11.2200
+    404.7000   1502.2300     36.2500     11.1900
+    405.4000   1502.1800     36.2500     11.1800
+    406.0000   1502.1300     36.2500     11.1600
+    406.6000   1502.1100     36.2500     11.1500
+    407.2000   1502.0800     36.2500     11.1400
+    407.8000   1502.0400     36.2500     11.1200
+    408.5000   1501.9600     36.2500     11.1000
+    409.1000   1501.8500     36.2500     11.0700
+    409.7000   1501.7500     36.2500     11.0300
+    410.3000   1501.6700     36.2500     11.0100
+    410.9000   1501.6200     36.2500     10.9900
+    411.6000   1501.5900     36.2500     10.9800
+    412.2000   1501.5500     36.2500     10.9600
+    412.8000   1501.5400     36.2500     10.9600
+    413.4000   1501.5200     36.2500     10.9500
+    414.0000   1501.4800     36.2500     10.9300
+    414.6000   1501.4200     36.2500     10.9200
+    415.3000   1501.3600     36.2500     10.9000
+    415.9000   1501.2900     36.2500     10.8700
+    416.5000   1501.1600     36.2500     10.8300
+    417.1000   1501.0500     36.2500     10.8000
+    417.7000   1501.0000     36.2500     10.7800
+    418.4000   1500.9800     36.2500     10.7700
+    419.0000   1500.9600     36.2500     10.7600
+    419.6000   1500.9200     36.2500     10.7500
+    420.2000   1500.9100     36.2500     10.7400
+    420.8000   1500.8900     36.2500     10.7400
+    421.5000   1500.8900     36.2500     10.7300
+    422.1000   1500.8800     36.2500     10.7300
+    422.7000   1500.8700     36.2500     10.7200
+    423.3000   1500.8500     36.2500     10.7100
+    423.9000   1500.8200     36.2500     10.7000
+    424.5000   1500.7900     36.2500     10.6900
+    425.2000   1500.7300     36.2500     10.6700
+    425.8000   1500.6500     36.2500     10.6400
+    426.4000   1500.5800     36.2500     10.6200
+    427.0000   1500.5300     36.2500     10.6000
+    427.6000   1500.4900     36.2500     10.5900
+    428.3000   1500.4100     36.2500     10.5600
+    428.9000   1500.3400     36.2500     10.5400
+    429.5000   1500.2900     36.2500     10.5200
+    430.1000   1500.2400     36.2500     10.5100
+    430.7000   1500.2000     36.2500     10.4900
+    431.3000   1500.1700     36.2500     10.4800
+    432.0000   1500.1400     36.2500     10.4700
+    432.6000   1500.1000     36.2500     10.4500
+    433.2000   1500.0200     36.2500     10.4300
+    433.8000   1499.9100     36.2500     10.4000
+    434.4000   1499.8500     36.2500     10.3800
+    435.0000   1499.8000     36.2500     10.3600
+    435.7000   1499.7300     36.2500     10.3400
+    436.3000   1499.6400     36.2500     10.3100
+    436.9000   1499.5100     36.2500     10.2700
+    437.5000   1499.3500     36.2500     10.2200
+    438.1000   1499.2300     36.2500     10.1900
+    438.8000   1499.1800     36.2500     10.1700
+    439.4000   1499.1400     36.2500     10.1500
+    440.0000   1499.1300     36.2500     10.1500
+    440.6000   1499.1300     36.2500     10.1500
+    441.2000   1499.1300     36.2500     10.1400
+    441.8000   1499.1200     36.2500     10.1400
+    442.5000   1499.0900     36.2500     10.1300
+    443.1000   1499.0300     36.2500     10.1100
+    443.7000   1498.9100     36.2500     10.0700
+    444.3000   1498.6900     36.2500     10.0000
+    444.9000   1498.4700     36.2500      9.9400
+    445.5000   1498.3200     36.2500      9.9000
+    446.2000   1498.2300     36.2500      9.8700
+    446.8000   1498.1800     36.2500      9.8500
+    447.4000   1498.1300     36.2500      9.8300
+    448.0000   1498.0300     36.2500      9.8000
+    448.6000   1497.9200     36.2500      9.7700
+    449.2000   1497.8100     36.2500      9.7400
+    449.9000   1497.7000     36.2500      9.7000
+    450.5000   1497.6000     36.2500      9.6700
+    451.1000   1497.5200     36.2500      9.6500
+    451.7000   1497.4800     36.2500      9.6300
+    452.3000   1497.4600     36.2500      9.6300
+    452.9000   1497.4700     36.2500      9.6200
+    453.6000   1497.4700     36.2500      9.6200
+    454.2000   1497.4600     36.2500      9.6200
+    454.8000   1497.4400     36.2500      9.6100
+    455.4000   1497.4400     36.2500      9.6100
+    456.0000   1497.4300     36.2500      9.6000
+    456.6000   1497.4000     36.2500      9.5900
+    457.3000   1497.3700     36.2500      9.5800
+    457.9000   1497.3300     36.2500      9.5600
+    458.5000   1497.2600     36.2500      9.5400
+    459.1000   1497.1600     36.2500      9.5100
+    459.7000   1497.0900     36.2500      9.4900
+    460.3000   1497.0300     36.2500      9.4700
+    460.9000   1496.9300     36.2500      9.4400
+    461.6000   1496.8600     36.2500      9.4200
+    462.2000   1496.8000     36.2500      9.4000
+    462.8000   1496.7600     36.2500      9.3800
+    463.4000   1496.7200     36.2500      9.3700
+    464.0000   1496.6900     36.2500      9.3600
+    464.6000   1496.6800     36.2500      9.3500
+    465.3000   1496.6800     36.2500      9.3500
+    465.9000   1496.6700     36.2500      9.3500
+    466.5000   1496.6500     36.2500      9.3400
+    467.1000   1496.6000     36.2500      9.3200
+    467.7000   1496.5300     36.2500      9.3000
+    468.3000   1496.4300     36.2500      9.2700
+    468.9000   1496.3600     36.2500      9.2500
+    469.6000   1496.2900     36.2500      9.2200
+    470.2000   1496.2100     36.2500      9.2000
+    470.8000   1496.1500     36.2500      9.1800
+    471.4000   1496.1100     36.2500      9.1700
+    472.0000   1496.0900     36.2500      9.1600
+    472.6000   1496.0700     36.2500      9.1500
+    473.2000   1496.0700     36.2500      9.1500
+    473.9000   1496.0800     36.2500      9.1500
+    474.5000   1496.0900     36.2500      9.1500
+    475.1000   1496.0800     36.2500      9.1400
+    475.7000   1496.0900     36.2500      9.1400
+    476.3000   1496.0900     36.2500      9.1400
+    476.9000   1496.1000     36.2500      9.1400
+    477.6000   1496.0900     36.2500      9.1300
+    478.2000   1496.0800     36.2500      9.1300
+    478.8000   1496.0800     36.2500      9.1300
+    479.4000   1496.0800     36.2500      9.1200
+    480.0000   1496.0300     36.2500      9.1100
+    480.6000   1495.9600     36.2500      9.0800
+    481.2000   1495.9200     36.2500      9.0700
+    481.9000   1495.8300     36.2500      9.0400
+    482.5000   1495.6200     36.2500      8.9800
+    483.1000   1495.4200     36.2500      8.9300
+    483.7000   1495.3000     36.2500      8.8900
+    484.3000   1495.2200     36.2500      8.8700
+    484.9000   1495.1200     36.2500      8.8400
+    485.5000   1495.0200     36.2500      8.8100
+    486.2000   1494.9400     36.2500      8.7800
+    486.8000   1494.8200     36.2500      8.7500
+    487.4000   1494.6700     36.2500      8.7000
+    488.0000   1494.5700     36.2500      8.6700
+    488.6000   1494.5000     36.2500      8.6500
+    489.2000   1494.3800     36.2500      8.6200
+    489.8000   1494.2300     36.2500      8.5700
+    490.4000   1494.1300     36.2500      8.5400
+    491.1000   1494.0900     36.2500      8.5300
+    491.7000   1494.0800     36.2500      8.5300
+    492.3000   1494.0700     36.2500      8.5200
+    492.9000   1494.0500     36.2500      8.5100
+    493.5000   1494.0400     36.2500      8.5100
+    494.1000   1494.0300     36.2500      8.5000
+    494.7000   1494.0100     36.2500      8.4900
+    495.4000   1493.9300     36.2500      8.4700
+    496.0000   1493.8500     36.2500      8.4400
+    496.6000   1493.7800     36.2500      8.4200
+    497.2000   1493.7300     36.2500      8.4100
+    497.8000   1493.6800     36.2500      8.3900
+    498.4000   1493.6600     36.2500      8.3800
+    499.0000   1493.6500     36.2500      8.3800
+    499.6000   1493.6400     36.2500      8.3700
+    500.3000   1493.6400     36.2500      8.3700
+    500.9000   1493.6300     36.2500      8.3600
+    501.5000   1493.6100     36.2500      8.3600
+    502.1000   1493.6100     36.2500      8.3500
+    502.7000   1493.6000     36.2500      8.3500
+    503.3000   1493.5900     36.2500      8.3400
+    503.9000   1493.5800     36.2500      8.3400
+    504.5000   1493.5400     36.2500      8.3200
+    505.2000   1493.4900     36.2500      8.3100
+    505.8000   1493.4100     36.2500      8.2800
+    506.4000   1493.3300     36.2500      8.2600
+    507.0000   1493.2800     36.2500      8.2400
+    507.6000   1493.2600     36.2500      8.2300
+    508.2000   1493.2200     36.2500      8.2200
+    508.8000   1493.1400     36.2500      8.2000
+    509.4000   1492.9500     36.2500      8.1400
+    510.1000   1492.7300     36.2500      8.0800
+    510.7000   1492.5900     36.2500      8.0400
+    511.3000   1492.5400     36.2500      8.0300
+    511.9000   1492.5000     36.2500      8.0100
+    512.5000   1492.4400     36.2500      7.9900
+    513.1000   1492.3700     36.2500      7.9700
+    513.7000   1492.2800     36.2500      7.9500
+    514.3000   1492.2100     36.2500      7.9300
+    515.0000   1492.1800     36.2500      7.9200
+    515.6000   1492.1500     36.2500      7.9000
+    516.2000   1492.1100     36.2500      7.8900
+    516.8000   1492.0600     36.2500      7.8800
+    517.4000   1492.0100     36.2500      7.8600
+    518.0000   1491.9900     36.2500      7.8500
+    518.6000   1491.9800     36.2500      7.8500
+    519.2000   1491.9800     36.2500      7.8400
+    519.9000   1491.9600     36.2500      7.8400
+    520.5000   1491.9600     36.2500      7.8300
+    521.1000   1491.9600     36.2500      7.8300
+    521.7000   1491.9500     36.2500      7.8200
+    522.3000   1491.9400     36.2500      7.8200
+    522.9000   1491.9300     36.2500      7.8100
+    523.5000   1491.9300     36.2500      7.8100
+    524.1000   1491.9300     36.2500      7.8100
+    524.7000   1491.9400     36.2500      7.8100
+    525.4000   1491.9400     36.2500      7.8000
+    526.0000   1491.9200     36.2500      7.8000
+    526.6000   1491.9000     36.2500      7.7900
+    527.2000   1491.8700     36.2500      7.7800
+    527.8000   1491.8200     36.2500      7.7600
+    528.4000   1491.7400     36.2500      7.7400
+    529.0000   1491.6700     36.2500      7.7200
+    529.6000   1491.6300     36.2500      7.7100
+    530.2000   1491.6000     36.2500      7.6900
+    530.9000   1491.5800     36.2500      7.6900
+    531.5000   1491.5600     36.2500      7.6800
+    532.1000   1491.5100     36.2500      7.6600
+    532.7000   1491.4200     36.2500      7.6400
+    533.3000   1491.3100     36.2500      7.6000
+    533.9000   1491.1700     36.2500      7.5700
+    534.5000   1491.0000     36.2500      7.5200
+    535.1000   1490.8700     36.2500      7.4800
+    535.7000   1490.7400     36.2500      7.4400
+    536.3000   1490.5000     36.2500      7.3800
+    537.0000   1490.1700     36.2500      7.2900
+    537.6000   1489.9200     36.2500      7.2200
+    538.2000   1489.8000     36.2500      7.1900
+    538.8000   1489.6700     36.2500      7.1500
+    539.4000   1489.5400     36.2500      7.1200
+    540.0000   1489.4400     36.2500      7.0900
+    540.6000   1489.3800     36.2500      7.0700
+    541.2000   1489.3300     36.2500      7.0500
+    541.8000   1489.3100     36.2500      7.0500
+    542.4000   1489.2700     36.2500      7.0300
+    543.1000   1489.2300     36.2500      7.0200
+    543.7000   1489.1900     36.2500      7.0100
+    544.3000   1489.1600     36.2500      7.0000
+    544.9000   1489.1300     36.2500      6.9900
+    545.5000   1489.0900     36.2500      6.9700
+    546.1000   1489.0800     36.2500      6.9700
+    546.7000   1489.0800     36.2500      6.9600
+    547.3000   1489.0800     36.2500      6.9600
+    547.9000   1489.0800     36.2500      6.9600
+    548.5000   1489.0800     36.2500      6.9600
+    549.2000   1489.0900     36.2500      6.9600
+    549.8000   1489.1100     36.2500      6.9600
+    550.4000   1489.1100     36.2500      6.9600
+    551.0000   1489.1100     36.2500      6.9500
+    551.6000   1489.0500     36.2500      6.9300
+    552.2000   1488.9500     36.2500      6.9100
+    552.8000   1488.8800     36.2500      6.8900
+    553.4000   1488.8300     36.2500      6.8700
+    554.0000   1488.7700     36.2500      6.8500
+    554.6000   1488.7000     36.2500      6.8300
+    555.2000   1488.6400     36.2500      6.8200
+    555.9000   1488.5900     36.2500      6.8000
+    556.5000   1488.5400     36.2500      6.7800
+    557.1000   1488.5200     36.2500      6.7800
+    557.7000   1488.5000     36.2500      6.7700
+    558.3000   1488.4800     36.2500      6.7600
+    558.9000   1488.4800     36.2500      6.7600
+    559.5000   1488.4900     36.2500      6.7600
+    560.1000   1488.4900     36.2500      6.7600
+    560.7000   1488.4900     36.2500      6.7500
+    561.3000   1488.4900     36.2500      6.7500
+    561.9000   1488.5100     36.2500      6.7500
+    562.6000   1488.5100     36.2500      6.7500
+    563.2000   1488.5000     36.2500      6.7500
+    563.8000   1488.4900     36.2500      6.7400
+    564.4000   1488.4900     36.2500      6.7400
+    565.0000   1488.4800     36.2500      6.7300
+    565.6000   1488.4900     36.2500      6.7300
+    566.2000   1488.5000     36.2500      6.7300
+    566.8000   1488.5300     36.2500      6.7400
+    567.4000   1488.5400     36.2500      6.7400
+    568.0000   1488.5700     36.2500      6.7400
+    568.6000   1488.5900     36.2500      6.7500
+    569.2000   1488.6000     36.2500      6.7400
+    569.8000   1488.5600     36.2500      6.7300
+    570.5000   1488.5200     36.2500      6.7200
+    571.1000   1488.5200     36.2500      6.7200
+    571.7000   1488.5100     36.2500      6.7100
+    572.3000   1488.4700     36.2500      6.7000
+    572.9000   1488.4700     36.2500      6.6900
+    573.5000   1488.4400     36.2500      6.6900
+    574.1000   1488.4100     36.2500      6.6700
+    574.7000   1488.3800     36.2500      6.6700
+    575.3000   1488.3700     36.2500      6.6600
+    575.9000   1488.3800     36.2500      6.6600
+    576.5000   1488.3800     36.2500      6.6600
+    577.1000   1488.3800     36.2500      6.6500
+    577.7000   1488.3900     36.2500      6.6600
+    578.4000   1488.4100     36.2500      6.6600
+    579.0000   1488.4100     36.2500      6.6500
+    579.6000   1488.4200     36.2500      6.6500
+    580.2000   1488.4200     36.2500      6.6500
+    580.8000   1488.4100     36.2500      6.6500
+    581.4000   1488.3900     36.2500      6.6400
+    582.0000   1488.3700     36.2500      6.6300
+    582.6000   1488.3300     36.2500      6.6200
+    583.2000   1488.2900     36.2500      6.6100
+    583.8000   1488.2300     36.2500      6.5900
+    584.4000   1488.1700     36.2500      6.5700
+    585.0000   1488.1200     36.2500      6.5500
+    585.6000   1488.0800     36.2500      6.5400
+    586.2000   1488.0100     36.2500      6.5200
+    586.9000   1487.9500     36.2500      6.5000
+    587.5000   1487.8900     36.2500      6.4800
+    588.1000   1487.8000     36.2500      6.4600
+    588.7000   1487.7200     36.2500      6.4400
+    589.3000   1487.6500     36.2500      6.4200
+    589.9000   1487.6100     36.2500      6.4000
+    590.5000   1487.6000     36.2500      6.4000
+    591.1000   1487.5800     36.2500      6.3900
+    591.7000   1487.5500     36.2500      6.3800
+    592.3000   1487.5300     36.2500      6.3700
+    592.9000   1487.5300     36.2500      6.3700
+    593.5000   1487.5400     36.2500      6.3700
+    594.1000   1487.5400     36.2500      6.3700
+    594.7000   1487.5200     36.2500      6.3600
+    595.3000   1487.4900     36.2500      6.3500
+    596.0000   1487.4700     36.2500      6.3400
+    596.6000   1487.4300     36.2500      6.3300
+    597.2000   1487.4200     36.2500      6.3200
+    597.8000   1487.3900     36.2500      6.3100
+    598.4000   1487.3300     36.2500      6.3000
+    599.0000   1487.2500     36.2500      6.2700
+    599.6000   1487.2200     36.2500      6.2600
+    600.2000   1487.2000     36.2500      6.2600
+    600.8000   1487.1700     36.2500      6.2500
+    601.4000   1487.1400     36.2500      6.2300
+    602.0000   1487.1300     36.2500      6.2300
+    602.6000   1487.1200     36.2500      6.2200
+    603.2000   1487.1100     36.2500      6.2200
+    603.8000   1487.0700     36.2500      6.2100
+    604.4000   1487.0300     36.2500      6.1900
+    605.0000   1486.9900     36.2500      6.1800
+    605.6000   1486.9600     36.2500      6.1700
+    606.2000   1486.9100     36.2500      6.1600
+    606.9000   1486.8700     36.2500      6.1400
+    607.5000   1486.8500     36.2500      6.1300
+    608.1000   1486.8200     36.2500      6.1300
+    608.7000   1486.8200     36.2500      6.1200
+    609.3000   1486.8200     36.2500      6.1200
+    609.9000   1486.8200     36.2500      6.1200
+    610.5000   1486.8300     36.2500      6.1200
+    611.1000   1486.8200     36.2500      6.1100
+    611.7000   1486.8200     36.2500      6.1100
+    612.3000   1486.8400     36.2500      6.1100
+    612.9000   1486.8400     36.2500      6.1100
+    613.5000   1486.8200     36.2500      6.1000
+    614.1000   1486.8000     36.2500      6.0900
+    614.7000   1486.7900     36.2500      6.0900
+    615.3000   1486.7900     36.2500      6.0900
+    615.9000   1486.8000     36.2500      6.0900
+    616.5000   1486.8200     36.2500      6.0900
+    617.1000   1486.8300     36.2500      6.0900
+    617.7000   1486.8300     36.2500      6.0900
+    618.3000   1486.8100     36.2500      6.0800
+    619.0000   1486.7900     36.2500      6.0700
+    619.6000   1486.7900     36.2500      6.0700
+    620.2000   1486.7700     36.2500      6.0600
+    620.8000   1486.7600     36.2500      6.0600
+    621.4000   1486.7400     36.2500      6.0500
+    622.0000   1486.7100     36.2500      6.0400
+    622.6000   1486.6700     36.2500      6.0300
+    623.2000   1486.6400     36.2500      6.0200
+    623.8000   1486.6300     36.2500      6.0100
+    624.4000   1486.6200     36.2500      6.0100
+    625.0000   1486.6300     36.2500      6.0100
+    625.6000   1486.6400     36.2500      6.0100
+    626.2000   1486.6300     36.2500      6.0000
+    626.8000   1486.6000     36.2500      5.9900
+    627.4000   1486.5700     36.2500      5.9800
+    628.0000   1486.5400     36.2500      5.9700
+    628.6000   1486.5000     36.2500      5.9600
+    629.2000   1486.4700     36.2500      5.9500
+    629.8000   1486.4400     36.2500      5.9400
+    630.4000   1486.4300     36.2500      5.9300
+    631.0000   1486.4300     36.2500      5.9300
+    631.6000   1486.4300     36.2500      5.9300
+    632.2000   1486.4400     36.2500      5.9300
+    632.8000   1486.4500     36.2500      5.9300
+    633.4000   1486.4600     36.2500      5.9300
+    634.1000   1486.4700     36.2500      5.9300
+    634.7000   1486.4700     36.2500      5.9300
+    635.3000   1486.4800     36.2500      5.9300
+    635.9000   1486.4900     36.2500      5.9300
+    636.5000   1486.5000     36.2500      5.9300
+    637.1000   1486.5100     36.2500      5.9300
+    637.7000   1486.5000     36.2500      5.9200
+    638.3000   1486.5000     36.2500      5.9200
+    638.9000   1486.4900     36.2500      5.9100
+    639.5000   1486.5000     36.2500      5.9100
+    640.1000   1486.5000     36.2500      5.9100
+    640.7000   1486.5100     36.2500      5.9100
+    641.3000   1486.5200     36.2500      5.9100
+    641.9000   1486.5300     36.2500      5.9100
+    642.5000   1486.5300     36.2500      5.9100
+    643.1000   1486.5300     36.2500      5.9000
+    643.7000   1486.5300     36.2500      5.9000
+    644.3000   1486.5300     36.2500      5.9000
+    644.9000   1486.5300     36.2500      5.9000
+    645.5000   1486.5400     36.2500      5.9000
+    646.1000   1486.5500     36.2500      5.9000
+    646.7000   1486.5500     36.2500      5.9000
+    647.3000   1486.5500     36.2500      5.8900
+    647.9000   1486.5600     36.2500      5.8900
+    648.5000   1486.5800     36.2500      5.9000
+    649.1000   1486.5700     36.2500      5.8900
+    649.7000   1486.5300     36.2500      5.8800
+    650.3000   1486.4600     36.2500      5.8600
+    650.9000   1486.4200     36.2500      5.8400
+    651.5000   1486.3900     36.2500      5.8400
+    652.1000   1486.3800     36.2500      5.8300
+    652.7000   1486.3500     36.2500      5.8200
+    653.3000   1486.3300     36.2500      5.8100
+    653.9000   1486.3100     36.2500      5.8000
+    654.5000   1486.2900     36.2500      5.8000
+    655.1000   1486.3000     36.2500      5.8000
+    655.7000   1486.3100     36.2500      5.8000
+    656.3000   1486.3200     36.2500      5.8000
+    656.9000   1486.3100     36.2500      5.7900
+    657.6000   1486.3000     36.2500      5.7900
+    658.2000   1486.2700     36.2500      5.7800
+    658.8000   1486.2500     36.2500      5.7700
+    659.4000   1486.2200     36.2500      5.7600
+    660.0000   1486.2000     36.2500      5.7500
+    660.6000   1486.2000     36.2500      5.7500
+    661.2000   1486.1800     36.2500      5.7400
+    661.8000   1486.1500     36.2500      5.7300
+    662.4000   1486.1400     36.2500      5.7300
+    663.0000   1486.1300     36.2500      5.7200
+    663.6000   1486.1000     36.2500      5.7100
+    664.2000   1486.0600     36.2500      5.7000
+    664.8000   1486.0100     36.2500      5.6800
+    665.4000   1485.9900     36.2500      5.6800
+    666.0000   1485.9800     36.2500      5.6700
+    666.6000   1485.9600     36.2500      5.6700
+    667.2000   1485.9500     36.2500      5.6600
+    667.8000   1485.9200     36.2500      5.6500
+    668.4000   1485.9000     36.2500      5.6400
+    669.0000   1485.8800     36.2500      5.6300
+    669.6000   1485.8600     36.2500      5.6300
+    670.2000   1485.8600     36.2500      5.6200
+    670.8000   1485.8500     36.2500      5.6200
+    671.4000   1485.8400     36.2500      5.6200
+    672.0000   1485.8200     36.2500      5.6100
+    672.6000   1485.7900     36.2500      5.6000
+    673.2000   1485.7700     36.2500      5.5900
+    673.8000   1485.7500     36.2500      5.5800
+    674.4000   1485.7500     36.2500      5.5800
+    675.0000   1485.7400     36.2500      5.5800
+    675.6000   1485.7400     36.2500      5.5700
+    676.2000   1485.7300     36.2500      5.5700
+    676.8000   1485.6700     36.2500      5.5500
+    677.4000   1485.6100     36.2500      5.5300
+    678.0000   1485.5400     36.2500      5.5100
+    678.6000   1485.3500     36.2500      5.4600
+    679.2000   1485.1800     36.2500      5.4200
+    679.8000   1485.0900     36.2500      5.3900
+    680.4000   1485.0300     36.2500      5.3800
+    681.0000   1485.0000     36.2500      5.3700
+    681.6000   1484.9600     36.2500      5.3500
+    682.2000   1484.9200     36.2500      5.3400
+    682.8000   1484.9100     36.2500      5.3400
+    683.4000   1484.9000     36.2500      5.3300
+    684.0000   1484.9100     36.2500      5.3300
+    684.6000   1484.9100     36.2500      5.3300
+    685.2000   1484.9100     36.2500      5.3300
+    685.8000   1484.9000     36.2500      5.3200
+    686.4000   1484.8900     36.2500      5.3200
+    687.0000   1484.8700     36.2500      5.3100
+    687.6000   1484.8600     36.2500      5.3000
+    688.2000   1484.8600     36.2500      5.3000
+    688.8000   1484.8800     36.2500      5.3000
+    689.4000   1484.8700     36.2500      5.3000
+    690.0000   1484.8300     36.2500      5.2900
+    690.6000   1484.8200     36.2500      5.2800
+    691.2000   1484.8800     36.2500      5.2900
+    691.8000   1484.9500     36.2500      5.3100
+    692.4000   1484.9700     36.2500      5.3100
+    693.0000   1484.9200     36.2500      5.3000
+    693.6000   1484.8600     36.2500      5.2800
+    694.2000   1484.8200     36.2500      5.2700
+    694.8000   1484.7500     36.2500      5.2500
+    695.4000   1484.7000     36.2500      5.2300
+    696.0000   1484.6800     36.2500      5.2300
+    696.6000   1484.6300     36.2500      5.2100
+    697.2000   1484.5900     36.2500      5.2000
+    697.8000   1484.5800     36.2500      5.1900
+    698.4000   1484.6000     36.2500      5.2000
+    699.0000   1484.6100     36.2500      5.2000
+    699.6000   1484.6100     36.2500      5.1900
+    700.2000   1484.6100     36.2500      5.1900
+    700.8000   1484.6100     36.2500      5.1900
+    701.4000   1484.6300     36.2500      5.1900
+    702.0000   1484.6300     36.2500      5.1900
+    702.6000   1484.6200     36.2500      5.1800
+    703.2000   1484.5800     36.2500      5.1700
+    703.8000   1484.5700     36.2500      5.1600
+    704.4000   1484.5600     36.2500      5.1600
+    705.0000   1484.5600     36.2500      5.1600
+    705.5000   1484.5400     36.2500      5.1500
+    706.1000   1484.5500     36.2500      5.1500
+    706.7000   1484.5400     36.2500      5.1500
+    707.3000   1484.5300     36.2500      5.1400
+    707.9000   1484.5400     36.2500      5.1400
+    708.5000   1484.5400     36.2500      5.1400
+    709.1000   1484.5600     36.2500      5.1400
+    709.7000   1484.5700     36.2500      5.1400
+    710.3000   1484.5700     36.2500      5.1400
+    710.9000   1484.5700     36.2500      5.1400
+    711.5000   1484.5600     36.2500      5.1300
+    712.1000   1484.5300     36.2500      5.1200
+    712.7000   1484.5100     36.2500      5.1100
+    713.3000   1484.5000     36.2500      5.1100
+    713.9000   1484.4900     36.2500      5.1000
+    714.5000   1484.4900     36.2500      5.1000
+    715.1000   1484.4700     36.2500      5.1000
+    715.7000   1484.4400     36.2500      5.0800
+    716.3000   1484.4200     36.2500      5.0800
+    716.9000   1484.4100     36.2500      5.0700
+    717.5000   1484.4000     36.2500      5.0700
+    718.1000   1484.4100     36.2500      5.0700
+    718.7000   1484.4100     36.2500      5.0600
+    719.3000   1484.3900     36.2500      5.0600
+    719.9000   1484.3500     36.2500      5.0500
+    720.5000   1484.3000     36.2500      5.0300
+    721.1000   1484.2700     36.2500      5.0200
+    721.7000   1484.2500     36.2500      5.0100
+    722.3000   1484.2500     36.2500      5.0100
+    722.9000   1484.2600     36.2500      5.0100
+    723.5000   1484.2700     36.2500      5.0100
+    724.1000   1484.2900     36.2500      5.0100
+    724.7000   1484.2900     36.2500      5.0100
+    725.3000   1484.2800     36.2500      5.0100
+    725.9000   1484.2700     36.2500      5.0000
+    726.5000   1484.2600     36.2500      5.0000
+    727.1000   1484.2400     36.2500      4.9900
+    727.7000   1484.2200     36.2500      4.9800
+    728.3000   1484.2000     36.2500      4.9700
+    728.8000   1484.1800     36.2500      4.9700
+    729.4000   1484.1700     36.2500      4.9600
+    730.0000   1484.1700     36.2500      4.9600
+    730.6000   1484.1700     36.2500      4.9600
+    731.2000   1484.1700     36.2500      4.9500
+    731.8000   1484.1800     36.2500      4.9500
+    732.4000   1484.1700     36.2500      4.9500
+    733.0000   1484.1600     36.2500      4.9500
+    733.6000   1484.1500     36.2500      4.9400
+    734.2000   1484.1300     36.2500      4.9300
+    734.8000   1484.1100     36.2500      4.9200
+    735.4000   1484.0800     36.2500      4.9200
+    736.0000   1484.0700     36.2500      4.9100
+    736.6000   1484.0300     36.2500      4.9000
+    737.2000   1483.9800     36.2500      4.8800
+    737.8000   1483.9300     36.2500      4.8700
+    738.4000   1483.9000     36.2500      4.8600
+    739.0000   1483.8800     36.2500      4.8500
+    739.6000   1483.8700     36.2500      4.8500
+    740.2000   1483.8800     36.2500      4.8500
+    740.8000   1483.8900     36.2500      4.8500
+    741.4000   1483.9000     36.2500      4.8500
+    742.0000   1483.9100     36.2500      4.8500
+    742.6000   1483.9200     36.2500      4.8500
+    743.2000   1483.9400     36.2500      4.8500
+    743.7000   1483.9500     36.2500      4.8500
+    744.3000   1483.9400     36.2500      4.8400
+    744.9000   1483.9400     36.2500      4.8400
+    745.5000   1483.9200     36.2500      4.8300
+    746.1000   1483.8900     36.2500      4.8200
+    746.7000   1483.8600     36.2500      4.8200
+    747.3000   1483.8500     36.2500      4.8100
+    747.9000   1483.8600     36.2500      4.8100
+    748.5000   1483.8600     36.2500      4.8100
+    749.1000   1483.8500     36.2500      4.8000
+    749.7000   1483.8400     36.2500      4.8000
+    750.3000   1483.8500     36.2500      4.8000
+    750.9000   1483.8600     36.2500      4.8000
+    751.5000   1483.8800     36.2500      4.8000
+    752.1000   1483.9000     36.2500      4.8000
+    752.7000   1483.8800     36.2500      4.8000
+    753.3000   1483.8600     36.2500      4.7900
+    753.9000   1483.8400     36.2500      4.7800
+    754.5000   1483.8400     36.2500      4.7800
+    755.1000   1483.8400     36.2500      4.7800
+    755.7000   1483.8400     36.2500      4.7700
+    756.2000   1483.8400     36.2500      4.7700
+    756.8000   1483.8400     36.2500      4.7700
+    757.4000   1483.8500     36.2500      4.7700
+    758.0000   1483.8400     36.2500      4.7700
+    758.6000   1483.8300     36.2500      4.7600
+    759.2000   1483.8100     36.2500      4.7500
+    759.8000   1483.8000     36.2500      4.7500
+    760.4000   1483.7900     36.2500      4.7400
@@ -0,0 +1,1231 @@
+test_read_store_and_write
+1/1/2012
+3:1:1
+Probe: Deep Blue
+Source: /root/package/data/input/sippican/TD_00831.edf
+      0.0000   1530.4900     34.9600     23.4300
+      0.6000   1530.7000     34.9600     23.5100
+      1.3000   1530.7700     34.9600     23.5300
+      1.9000   1530.7900     34.9600     23.5400
+      2.6000   1530.8000     34.9600     23.5400
+      3.2000   1530.7800     34.9600     23.5200
+      3.9000   1530.8000     34.9600     23.5300
+      4.5000   1530.8100     34.9600     23.5300
+      5.2000   1530.8100     34.9600     23.5300
+      5.8000   1530.8400     34.9600     23.5300
+      6.5000   1530.8500     34.9600     23.5300
+      7.1000   1530.8400     34.9600     23.5200
+      7.8000   1530.8500     34.9600     23.5200
+      8.4000   1530.8600     34.9600     23.5200
+      9.1000   1530.8600     34.9600     23.5200
+      9.7000   1530.8700     34.9600     23.5200
+     10.3000   1530.8800     34.9600     23.5200
+     11.0000   1530.9100     34.9600     23.5300
+     11.6000   1530.9100     34.9600     23.5200
+     12.3000   1530.9200     34.9600     23.5200
+     12.9000   1530.9300     34.9600     23.5200
+     13.6000   1530.9300     34.9600     23.5200
+     14.2000   1530.9500     34.9600     23.5200
+     14.9000   1530.9700     34.9600     23.5200
+     15.5000   1530.9800     34.9600     23.5200
+     16.2000   1530.9900     34.9600     23.5200
+     16.8000   1531.0000     34.9600     23.5200
+     17.5000   1531.0300     34.9600     23.5300
+     18.1000   1531.0200     34.9600     23.5200
+     18.8000   1531.0300     34.9600     23.5200
+     19.4000   1531.0300     34.9600     23.5200
+     20.0000   1531.0400     34.9600     23.5200
+     20.7000   1531.0600     34.9600     23.5200
+     21.3000   1531.0800     34.9600     23.5300
+     22.0000   1531.0900     34.9600     23.5200
+     22.6000   1531.1000     34.9600     23.5200
+     23.3000   1531.1000     34.9600     23.5200
+     23.9000   1531.0900     34.9600     23.5100
+     24.6000   1531.1100     34.9600     23.5200
+     25.2000   1531.1300     34.9600     23.5200
+     25.9000   1531.1300     34.9600     23.5100
+     26.5000   1531.1500     34.9600     23.5200
+     27.1000   1531.1600     34.9600     23.5200
+     27.8000   1531.1500     34.9600     23.5100
+     28.4000   1531.1600     34.9600     23.5100
+     29.1000   1531.1800     34.9600     23.5100
+     29.7000   1531.1700     34.9600     23.5100
+     30.4000   1531.2000     34.9600     23.5100
+     31.0000   1531.2200     34.9600     23.5200
+     31.7000   1531.2200     34.9600     23.5100
+     32.3000   1531.2300     34.9600     23.5100
+     33.0000   1531.2500     34.9600     23.5100
+     33.6000   1531.2500     34.9600     23.5100
+     34.2000   1531.2800     34.9600     23.5200
+     34.9000   1531.2800     34.9600     23.5200
+     35.5000   1531.2900     34.9600     23.5100
+     36.2000   1531.3000     34.9600     23.5100
+     36.8000   1531.3100     34.9600     23.5100
+     37.5000   1531.3200     34.9600     23.5100
+     38.1000   1531.3200     34.9600     23.5100
+     38.8000   1531.3200     34.9600     23.5000
+     39.4000   1531.3400     34.9600     23.5100
+     40.0000   1531.3500     34.9600     23.5100
+     40.7000   1531.3400     34.9600     23.5000
+     41.3000   1531.3500     34.9600     23.5000
+     42.0000   1531.3500     34.9600     23.4900
+     42.6000   1531.3600     34.9600     23.5000
+     43.3000   1531.3800     34.9600     23.5000
+     43.9000   1531.3800     34.9600     23.4900
+     44.6000   1531.4000     34.9600     23.5000
+     45.2000   1531.4200     34.9600     23.5000
+     45.8000   1531.4400     34.9600     23.5000
+     46.5000   1531.4400     34.9600     23.5000
+     47.1000   1531.4500     34.9600     23.5000
+     47.8000   1531.4600     34.9600     23.5000
+     48.4000   1531.4900     34.9600     23.5100
+     49.1000   1531.5300     34.9600     23.5200
+     49.7000   1531.5400     34.9600     23.5200
+     50.4000   1531.5200     34.9600     23.5100
+     51.0000   1531.5300     34.9600     23.5100
+     51.6000   1531.5400     34.9600     23.5000
+     52.3000   1531.5600     34.9600     23.5100
+     52.9000   1531.5900     34.9600     23.5200
+     53.6000   1531.5900     34.9600     23.5100
+     54.2000   1531.6000     34.9600     23.5100
+     54.9000   1531.6000     34.9600     23.5100
+     55.5000   1531.6100     34.9600     23.5100
+     56.1000   1531.6200     34.9600     23.5100
+     56.8000   1531.6300     34.9600     23.5100
+     57.4000   1531.6400     34.9600     23.5100
+     58.1000   1531.6500     34.9600     23.5100
+     58.7000   1531.6600     34.9600     23.5100
+     59.4000   1531.6800     34.9600     23.5100
+     60.0000   1531.6900     34.9600     23.5100
+     60.6000   1531.6900     34.9600     23.5000
+     61.3000   1531.7100     34.9600     23.5100
+     61.9000   1531.7300     34.9600     23.5100
+     62.6000   1531.7400     34.9600     23.5100
+     63.2000   1531.7500     34.9600     23.5100
+     63.9000   1531.7600     34.9600     23.5100
+     64.5000   1531.7600     34.9600     23.5100
+     65.1000   1531.7800     34.9600     23.5100
+     65.8000   1531.7900     34.9600     23.5100
+     66.4000   1531.7900     34.9600     23.5100
+     67.1000   1531.8000     34.9600     23.5100
+     67.7000   1531.8100     34.9600     23.5000
+     68.4000   1531.8300     34.9600     23.5100
+     69.0000   1531.8400     34.9600     23.5100
+     69.6000   1531.8700     34.9600     23.5200
+     70.3000   1531.8600     34.9600     23.5100
+     70.9000   1531.8600     34.9600     23.5100
+     71.6000   1531.8700     34.9600     23.5000
+     72.2000   1531.8700     34.9600     23.5000
+     72.9000   1531.8800     34.9600     23.5000
+     73.5000   1531.8800     34.9600     23.5000
+     74.1000   1531.8800     34.9600     23.4900
+     74.8000   1531.8700     34.9600     23.4800
+     75.4000   1531.8900     34.9600     23.4900
+     76.1000   1531.9100     34.9600     23.4900
+     76.7000   1531.9100     34.9600     23.4800
+     77.4000   1531.9200     34.9600     23.4900
+     78.0000   1531.9300     34.9600     23.4900
+     78.6000   1531.9500     34.9600     23.4900
+     79.3000   1531.9600     34.9600     23.4900
+     79.9000   1531.9800     34.9600     23.4900
+     80.6000   1531.9900     34.9600     23.4900
+     81.2000   1532.0200     34.9600     23.5000
+     81.8000   1532.0300     34.9600     23.5000
+     82.5000   1532.0400     34.9600     23.5000
+     83.1000   1532.0500     34.9600     23.5000
+     83.8000   1532.0500     34.9600     23.4900
+     84.4000   1532.0500     34.9600     23.4900
+     85.1000   1532.0400     34.9600     23.4800
+     85.7000   1532.0200     34.9600     23.4700
+     86.3000   1532.0100     34.9600     23.4600
+     87.0000   1532.0000     34.9600     23.4600
+     87.6000   1532.0100     34.9600     23.4500
+     88.3000   1532.0100     34.9600     23.4500
+     88.9000   1532.0200     34.9600     23.4500
+     89.5000   1532.0300     34.9600     23.4500
+     90.2000   1532.0400     34.9600     23.4500
+     90.8000   1532.0400     34.9600     23.4400
+     91.5000   1532.0300     34.9600     23.4400
+     92.1000   1532.0500     34.9600     23.4400
+     92.7000   1532.0500     34.9600     23.4300
+     93.4000   1532.0100     34.9600     23.4200
+     94.0000   1531.9900     34.9600     23.4000
+     94.7000   1531.9500     34.9600     23.3800
+     95.3000   1531.9200     34.9600     23.3700
+     96.0000   1531.9000     34.9600     23.3600
+     96.6000   1531.9000     34.9600     23.3500
+     97.2000   1531.9100     34.9600     23.3500
+     97.9000   1531.9100     34.9600     23.3500
+     98.5000   1531.9400     34.9600     23.3500
+     99.2000   1531.9300     34.9600     23.3400
+     99.8000   1531.9300     34.9600     23.3400
+    100.4000   1531.9100     34.9600     23.3300
+    101.1000   1531.8800     34.9600     23.3100
+    101.7000   1531.8200     34.9600     23.2800
+    102.4000   1531.8100     34.9600     23.2700
+    103.0000   1531.7800     34.9600     23.2600
+    103.6000   1531.7500     34.9600     23.2500
+    104.3000   1531.7300     34.9600     23.2300
+    104.9000   1531.6900     34.9600     23.2100
+    105.6000   1531.6200     34.9600     23.1800
+    106.2000   1531.5700     34.9600     23.1600
+    106.8000   1531.5200     34.9600     23.1300
+    107.5000   1531.5000     34.9600     23.1200
+    108.1000   1531.4700     34.9600     23.1000
+    108.8000   1531.4600     34.9600     23.1000
+    109.4000   1531.4400     34.9600     23.0800
+    110.0000   1531.4400     34.9600     23.0800
+    110.7000   1531.4200     34.9600     23.0700
+    111.3000   1531.3800     34.9600     23.0500
+    112.0000   1531.3400     34.9600     23.0300
+    112.6000   1531.2600     34.9600     22.9900
+    113.2000   1531.1300     34.9600     22.9400
+    113.9000   1530.9800     34.9600     22.8700
+    114.5000   1530.8500     34.9600     22.8200
+    115.2000   1530.7300     34.9600     22.7700
+    115.8000   1530.6400     34.9600     22.7300
+    116.4000   1530.5900     34.9600     22.7100
+    117.1000   1530.5500     34.9600     22.6900
+    117.7000   1530.4800     34.9600     22.6500
+    118.4000   1530.3800     34.9600     22.6100
+    119.0000   1530.3100     34.9600     22.5800
+    119.6000   1530.2500     34.9600     22.5500
+    120.3000   1530.1600     34.9600     22.5100
+    120.9000   1530.0900     34.9600     22.4800
+    121.5000   1530.0500     34.9600     22.4600
+    122.2000   1530.0500     34.9600     22.4600
+    122.8000   1529.9600     34.9600     22.4200
+    123.5000   1529.8200     34.9600     22.3600
+    124.1000   1529.7300     34.9600     22.3300
+    124.7000   1529.6700     34.9600     22.3000
+    125.4000   1529.5300     34.9600     22.2400
+    126.0000   1529.4700     34.9600     22.2100
+    126.7000   1529.4700     34.9600     22.2100
+    127.3000   1529.4600     34.9600     22.2000
+    127.9000   1529.4600     34.9600     22.1900
+    128.6000   1529.4700     34.9600     22.2000
+    129.2000   1529.4800     34.9600     22.2000
+    129.9000   1529.5000     34.9600     22.2000
+    130.5000   1529.5200     34.9600     22.2000
+    131.1000   1529.5600     34.9600     22.2100
+    131.8000   1529.5800     34.9600     22.2200
+    132.4000   1529.6100     34.9600     22.2300
+    133.0000   1529.6800     34.9600     22.2500
+    133.7000   1529.7400     34.9600     22.2600
+    134.3000   1529.7800     34.9600     22.2800
+    135.0000   1529.8600     34.9600     22.3000
+    135.6000   1529.9000     34.9600     22.3100
+    136.2000   1529.9300     34.9600     22.3200
+    136.9000   1529.9700     34.9600     22.3300
+    137.5000   1530.0000     34.9600     22.3400
+    138.1000   1530.0600     34.9600     22.3600
+    138.8000   1530.0900     34.9600     22.3700
+    139.4000   1530.0800     34.9600     22.3600
+    140.1000   1530.0800     34.9600     22.3600
+    140.7000   1530.0900     34.9600     22.3600
+    141.3000   1530.0900     34.9600     22.3500
+    142.0000   1530.0600     34.9600     22.3400
+    142.6000   1529.9900     34.9600     22.3100
+    143.3000   1529.8900     34.9600     22.2600
+    143.9000   1529.8100     34.9600     22.2300
+    144.5000   1529.7400     34.9600     22.2000
+    145.2000   1529.6500     34.9600     22.1600
+    145.8000   1529.5800     34.9600     22.1300
+    146.4000   1529.5200     34.9600     22.1000
+    147.1000   1529.4900     34.9600     22.0900
+    147.7000   1529.4600     34.9600     22.0700
+    148.4000   1529.4200     34.9600     22.0500
+    149.0000   1529.3600     34.9600     22.0200
+    149.6000   1529.3000     34.9600     22.0000
+    150.3000   1529.2000     34.9600     21.9500
+    150.9000   1529.0900     34.9600     21.9100
+    151.5000   1528.9700     34.9600     21.8600
+    152.2000   1528.8800     34.9600     21.8200
+    152.8000   1528.7800     34.9600     21.7800
+    153.4000   1528.7200     34.9600     21.7500
+    154.1000   1528.6600     34.9600     21.7300
+    154.7000   1528.5800     34.9600     21.6900
+    155.4000   1528.4500     34.9600     21.6400
+    156.0000   1528.3500     34.9600     21.5900
+    156.6000   1528.3000     34.9600     21.5700
+    157.3000   1528.2400     34.9600     21.5500
+    157.9000   1528.1900     34.9600     21.5200
+    158.5000   1528.1000     34.9600     21.4800
+    159.2000   1528.0100     34.9600     21.4500
+    159.8000   1527.9200     34.9600     21.4100
+    160.4000   1527.8700     34.9600     21.3900
+    161.1000   1527.8300     34.9600     21.3700
+    161.7000   1527.8300     34.9600     21.3700
+    162.4000   1527.7700     34.9600     21.3400
+    163.0000   1527.5800     34.9600     21.2600
+    163.6000   1527.4200     34.9600     21.2000
+    164.3000   1527.2700     34.9600     21.1400
+    164.9000   1527.1300     34.9600     21.0800
+    165.5000   1527.0700     34.9600     21.0600
+    166.2000   1527.0700     34.9600     21.0500
+    166.8000   1527.0500     34.9600     21.0400
+    167.4000   1527.0000     34.9600     21.0200
+    168.1000   1526.9500     34.9600     21.0000
+    168.7000   1526.8700     34.9600     20.9600
+    169.4000   1526.7700     34.9600     20.9200
+    170.0000   1526.6800     34.9600     20.8900
+    170.6000   1526.5700     34.9600     20.8400
+    171.3000   1526.4900     34.9600     20.8100
+    171.9000   1526.4100     34.9600     20.7700
+    172.5000   1526.3600     34.9600     20.7500
+    173.2000   1526.3400     34.9600     20.7400
+    173.8000   1526.3000     34.9600     20.7200
+    174.4000   1526.2500     34.9600     20.7000
+    175.1000   1526.1400     34.9600     20.6600
+    175.7000   1526.0400     34.9600     20.6200
+    176.3000   1525.9300     34.9600     20.5700
+    177.0000   1525.8300     34.9600     20.5300
+    177.6000   1525.7000     34.9600     20.4800
+    178.3000   1525.3400     34.9600     20.3400
+    178.9000   1524.8600     34.9600     20.1600
+    179.5000   1524.5700     34.9600     20.0600
+    180.2000   1524.4200     34.9600     20.0000
+    180.8000   1524.3300     34.9600     19.9600
+    181.4000   1524.2600     34.9600     19.9300
+    182.1000   1524.2100     34.9600     19.9100
+    182.7000   1524.1700     34.9600     19.8900
+    183.3000   1524.1200     34.9600     19.8700
+    184.0000   1524.0600     34.9600     19.8500
+    184.6000   1523.9900     34.9600     19.8200
+    185.2000   1523.9200     34.9600     19.7900
+    185.9000   1523.8600     34.9600     19.7600
+    186.5000   1523.8000     34.9600     19.7400
+    187.1000   1523.7400     34.9600     19.7100
+    187.8000   1523.6800     34.9600     19.6900
+    188.4000   1523.6200     34.9600     19.6600
+    189.0000   1523.5700     34.9600     19.6400
+    189.7000   1523.4900     34.9600     19.6100
+    190.3000   1523.3100     34.9600     19.5400
+    190.9000   1523.1300     34.9600     19.4700
+    191.6000   1523.0200     34.9600     19.4300
+    192.2000   1522.9400     34.9600     19.4000
+    192.9000   1522.8200     34.9600     19.3500
+    193.5000   1522.6600     34.9600     19.2900
+    194.1000   1522.5600     34.9600     19.2500
+    194.8000   1522.4400     34.9600     19.2000
+    195.4000   1522.2200     34.9600     19.1300
+    196.0000   1521.9600     34.9600     19.0300
+    196.7000   1521.7700     34.9600     18.9600
+    197.3000   1521.6500     34.9600     18.9100
+    197.9000   1521.5000     34.9600     18.8600
+    198.6000   1521.2200     34.9600     18.7500
+    199.2000   1520.9200     34.9600     18.6500
+    199.8000   1520.7100     34.9600     18.5700
+    200.5000   1520.5800     34.9600     18.5200
+    201.1000   1520.4800     34.9600     18.4800
+    201.7000   1520.4200     34.9600     18.4600
+    202.4000   1520.4200     34.9600     18.4600
+    203.0000   1520.4700     34.9600     18.4700
+    203.6000   1520.5200     34.9600     18.4800
+    204.3000   1520.5700     34.9600     18.5000
+    204.9000   1520.6200     34.9600     18.5100
+    205.5000   1520.6800     34.9600     18.5300
+    206.2000   1520.7200     34.9600     18.5400
+    206.8000   1520.7600     34.9600     18.5500
+    207.4000   1520.7200     34.9600     18.5300
+    208.1000   1520.6600     34.9600     18.5100
+    208.7000   1520.6000     34.9600     18.4800
+    209.3000   1520.5300     34.9600     18.4500
+    210.0000   1520.4700     34.9600     18.4300
+    210.6000   1520.3600     34.9600     18.3800
+    211.2000   1520.0900     34.9600     18.2900
+    211.9000   1519.6600     34.9600     18.1400
+    212.5000   1519.2400     34.9600     17.9900
+    213.1000   1518.9100     34.9600     17.8800
+    213.8000   1518.7200     34.9600     17.8100
+    214.4000   1518.6000     34.9600     17.7600
+    215.0000   1518.4800     34.9600     17.7200
+    215.7000   1518.4000     34.9600     17.6900
+    216.3000   1518.3700     34.9600     17.6700
+    216.9000   1518.3600     34.9600     17.6700
+    217.6000   1518.3500     34.9600     17.6600
+    218.2000   1518.3400     34.9600     17.6500
+    218.8000   1518.3400     34.9600     17.6500
+    219.4000   1518.3500     34.9600     17.6500
+    220.1000   1518.3400     34.9600     17.6400
+    220.7000   1518.3200     34.9600     17.6300
+    221.3000   1518.2900     34.9600     17.6200
+    222.0000   1518.2400     34.9600     17.6000
+    222.6000   1518.1600     34.9600     17.5700
+    223.2000   1518.0800     34.9600     17.5400
+    223.9000   1518.0000     34.9600     17.5100
+    224.5000   1517.8800     34.9600     17.4600
+    225.1000   1517.6700     34.9600     17.3900
+    225.8000   1517.2600     34.9600     17.2500
+    226.4000   1516.6700     34.9600     17.0500
+    227.0000   1516.1900     34.9600     16.8800
+    227.7000   1515.9600     34.9600     16.8000
+    228.3000   1515.8500     34.9600     16.7600
+    228.9000   1515.7900     34.9600     16.7400
+    229.6000   1515.8100     34.9600     16.7400
+    230.2000   1515.9800     34.9600     16.8000
+    230.8000   1516.2000     34.9600     16.8600
+    231.5000   1516.3000     34.9600     16.8900
+    232.1000   1516.2700     34.9600     16.8800
+    232.7000   1516.1800     34.9600     16.8500
+    233.4000   1516.0100     34.9600     16.7900
+    234.0000   1515.7600     34.9600     16.7000
+    234.6000   1515.4300     34.9600     16.5900
+    235.2000   1515.1700     34.9600     16.5000
+    235.9000   1515.0100     34.9600     16.4400
+    236.5000   1514.9300     34.9600     16.4200
+    237.1000   1514.9000     34.9600     16.4000
+    237.8000   1514.8600     34.9600     16.3900
+    238.4000   1514.8200     34.9600     16.3700
+    239.0000   1514.7700     34.9600     16.3500
+    239.7000   1514.7200     34.9600     16.3300
+    240.3000   1514.6300     34.9600     16.2900
+    240.9000   1514.5600     34.9600     16.2700
+    241.6000   1514.5300     34.9600     16.2600
+    242.2000   1514.5100     34.9600     16.2500
+    242.8000   1514.4400     34.9600     16.2200
+    243.4000   1514.3100     34.9600     16.1800
+    244.1000   1514.1700     34.9600     16.1200
+    244.7000   1513.9800     34.9600     16.0600
+    245.3000   1513.7500     34.9600     15.9800
+    246.0000   1513.5600     34.9600     15.9200
+    246.6000   1513.4200     34.9600     15.8700
+    247.2000   1513.3400     34.9600     15.8400
+    247.9000   1513.3300     34.9600     15.8300
+    248.5000   1513.3300     34.9600     15.8300
+    249.1000   1513.2900     34.9600     15.8100
+    249.8000   1513.2200     34.9600     15.7900
+    250.4000   1513.1400     34.9600     15.7600
+    251.0000   1513.0800     34.9600     15.7300
+    251.6000   1513.0500     34.9600     15.7200
+    252.3000   1513.0200     34.9600     15.7100
+    252.9000   1512.9000     34.9600     15.6700
+    253.5000   1512.6200     34.9600     15.5700
+    254.2000   1512.2900     34.9600     15.4700
+    254.8000   1511.9400     34.9600     15.3500
+    255.4000   1511.5800     34.9600     15.2300
+    256.1000   1511.3800     34.9600     15.1600
+    256.7000   1511.2700     34.9600     15.1300
+    257.3000   1511.1900     34.9600     15.1000
+    257.9000   1511.1300     34.9600     15.0700
+    258.6000   1511.0700     34.9600     15.0500
+    259.2000   1511.0200     34.9600     15.0300
+    259.8000   1510.9100     34.9600     15.0000
+    260.5000   1510.7900     34.9600     14.9500
+    261.1000   1510.6300     34.9600     14.9000
+    261.7000   1510.4100     34.9600     14.8300
+    262.4000   1510.1500     34.9600     14.7400
+    263.0000   1509.9700     34.9600     14.6800
+    263.6000   1509.7900     34.9600     14.6200
+    264.2000   1509.6100     34.9600     14.5600
+    264.9000   1509.4600     34.9600     14.5100
+    265.5000   1509.2900     34.9600     14.4600
+    266.1000   1509.1000     34.9600     14.3900
+    266.8000   1508.9400     34.9600     14.3400
+    267.4000   1508.8100     34.9600     14.3000
+    268.0000   1508.7000     34.9600     14.2600
+    268.6000   1508.6300     34.9600     14.2300
+    269.3000   1508.5600     34.9600     14.2100
+    269.9000   1508.5300     34.9600     14.2000
+    270.5000   1508.5000     34.9600     14.1800
+    271.2000   1508.4600     34.9600     14.1700
+    271.8000   1508.4300     34.9600     14.1600
+    272.4000   1508.4100     34.9600     14.1500
+    273.0000   1508.3600     34.9600     14.1300
+    273.7000   1508.3300     34.9600     14.1200
+    274.3000   1508.2600     34.9600     14.0900
+    274.9000   1508.1300     34.9600     14.0500
+    275.6000   1508.0100     34.9600     14.0100
+    276.2000   1507.8200     34.9600     13.9500
+    276.8000   1507.6000     34.9600     13.8800
+    277.4000   1507.4000     34.9600     13.8100
+    278.1000   1507.1000     34.9600     13.7200
+    278.7000   1506.8100     34.9600     13.6200
+    279.3000   1506.6100     34.9600     13.5600
+    280.0000   1506.4400     34.9600     13.5000
+    280.6000   1506.3200     34.9600     13.4700
+    281.2000   1506.2200     34.9600     13.4300
+    281.8000   1506.1400     34.9600     13.4100
+    282.5000   1506.0700     34.9600     13.3800
+    283.1000   1506.0300     34.9600     13.3600
+    283.7000   1506.0000     34.9600     13.3500
+    284.4000   1505.9700     34.9600     13.3400
+    285.0000   1505.8500     34.9600     13.3000
+    285.6000   1505.7300     34.9600     13.2600
+    286.2000   1505.6600     34.9600     13.2400
+    286.9000   1505.6500     34.9600     13.2300
+    287.5000   1505.6300     34.9600     13.2200
+    288.1000   1505.6000     34.9600     13.2100
+    288.7000   1505.5400     34.9600     13.1900
+    289.4000   1505.4500     34.9600     13.1600
+    290.0000   1505.3500     34.9600     13.1300
+    290.6000   1505.2500     34.9600     13.0900
+    291.3000   1505.2000     34.9600     13.0700
+    291.9000   1505.1600     34.9600     13.0600
+    292.5000   1505.1000     34.9600     13.0400
+    293.1000   1505.0200     34.9600     13.0100
+    293.8000   1504.9600     34.9600     12.9900
+    294.4000   1504.9400     34.9600     12.9800
+    295.0000   1504.9000     34.9600     12.9700
+    295.7000   1504.8000     34.9600     12.9300
+    296.3000   1504.5800     34.9600     12.8600
+    296.9000   1504.3300     34.9600     12.7900
+    297.5000   1504.1600     34.9600     12.7300
+    298.2000   1504.0100     34.9600     12.6800
+    298.8000   1503.7800     34.9600     12.6100
+    299.4000   1503.4800     34.9600     12.5200
+    300.0000   1503.2300     34.9600     12.4400
+    300.7000   1503.0500     34.9600     12.3900
+    301.3000   1502.8000     34.9600     12.3100
+    301.9000   1502.4400     34.9600     12.2000
+    302.5000   1502.2000     34.9600     12.1300
+    303.2000   1502.0600     34.9600     12.0800
+    303.8000   1501.8600     34.9600     12.0200
+    304.4000   1501.5700     34.9600     11.9300
+    305.1000   1501.3400     34.9600     11.8600
+    305.7000   1501.1900     34.9600     11.8200
+    306.3000   1501.1100     34.9600     11.7900
+    306.9000   1501.0300     34.9600     11.7600
+    307.6000   1500.9700     34.9600     11.7400
+    308.2000   1500.9000     34.9600     11.7200
+    308.8000   1500.8600     34.9600     11.7100
+    309.4000   1500.8200     34.9600     11.6900
+    310.1000   1500.8100     34.9600     11.6800
+    310.7000   1500.8100     34.9600     11.6800
+    311.3000   1500.8100     34.9600     11.6800
+    311.9000   1500.8100     34.9600     11.6700
+    312.6000   1500.7900     34.9600     11.6700
+    313.2000   1500.7600     34.9600     11.6500
+    313.8000   1500.7200     34.9600     11.6400
+    314.4000   1500.6500     34.9600     11.6200
+    315.1000   1500.5900     34.9600     11.6000
+    315.7000   1500.5600     34.9600     11.5900
+    316.3000   1500.5300     34.9600     11.5700
+    316.9000   1500.5100     34.9600     11.5600
+    317.6000   1500.4800     34.9600     11.5500
+    318.2000   1500.4300     34.9600     11.5300
+    318.8000   1500.3700     34.9600     11.5100
+    319.5000   1500.3300     34.9600     11.5000
+    320.1000   1500.2900     34.9600     11.4800
+    320.7000   1500.2300     34.9600     11.4600
+    321.3000   1500.1600     34.9600     11.4400
+    322.0000   1500.0700     34.9600     11.4100
+    322.6000   1499.9500     34.9600     11.3700
+    323.2000   1499.8300     34.9600     11.3400
+    323.8000   1499.7100     34.9600     11.3000
+    324.5000   1499.6100     34.9600     11.2700
+    325.1000   1499.5500     34.9600     11.2500
+    325.7000   1499.5300     34.9600     11.2400
+    326.3000   1499.4800     34.9600     11.2200
+    327.0000   1499.4100     34.9600     11.2000
+    327.6000   1499.3300     34.9600     11.1700
+    328.2000   1499.2200     34.9600     11.1400
+    328.8000   1499.1100     34.9600     11.1000
+    329.5000   1498.9900     34.9600     11.0700
+    330.1000   1498.9200     34.9600     11.0500
+    330.7000   1498.9000     34.9600     11.0300
+    331.3000   1498.8900     34.9600     11.0300
+    332.0000   1498.8800     34.9600     11.0200
+    332.6000   1498.8500     34.9600     11.0100
+    333.2000   1498.8100     34.9600     11.0000
+    333.8000   1498.8000     34.9600     10.9900
+    334.5000   1498.7700     34.9600     10.9800
+    335.1000   1498.7300     34.9600     10.9700
+    335.7000   1498.7100     34.9600     10.9600
+    336.3000   1498.6900     34.9600     10.9500
+    336.9000   1498.6900     34.9600     10.9500
+    337.6000   1498.6700     34.9600     10.9400
+    338.2000   1498.6400     34.9600     10.9300
+    338.8000   1498.5900     34.9600     10.9100
+    339.4000   1498.5000     34.9600     10.8800
+    340.1000   1498.3100     34.9600     10.8200
+    340.7000   1498.0100     34.9600     10.7400
+    341.3000   1497.7900     34.9600     10.6700
+    341.9000   1497.6800     34.9600     10.6400
+    342.6000   1497.6000     34.9600     10.6100
+    343.2000   1497.5400     34.9600     10.5900
+    343.8000   1497.4900     34.9600     10.5700
+    344.4000   1497.4400     34.9600     10.5600
+    345.1000   1497.4200     34.9600     10.5500
+    345.7000   1497.4000     34.9600     10.5400
+    346.3000   1497.4000     34.9600     10.5400
+    346.9000   1497.3900     34.9600     10.5300
+    347.6000   1497.3400     34.9600     10.5100
+    348.2000   1497.3100     34.9600     10.5000
+    348.8000   1497.2500     34.9600     10.4800
+    349.4000   1497.1600     34.9600     10.4500
+    350.0000   1497.0300     34.9600     10.4200
+    350.7000   1496.9500     34.9600     10.3900
+    351.3000   1496.9100     34.9600     10.3800
+    351.9000   1496.8900     34.9600     10.3700
+    352.5000   1496.8700     34.9600     10.3600
+    353.2000   1496.8800     34.9600     10.3600
+    353.8000   1496.8800     34.9600     10.3500
+    354.4000   1496.8800     34.9600     10.3500
+    355.0000   1496.8700     34.9600     10.3500
+    355.7000   1496.8800     34.9600     10.3500
+    356.3000   1496.9000     34.9600     10.3500
+    356.9000   1496.9000     34.9600     10.3500
+    357.5000   1496.8900     34.9600     10.3400
+    358.1000   1496.8800     34.9600     10.3400
+    358.8000   1496.8800     34.9600     10.3300
+    359.4000   1496.9000     34.9600     10.3400
+    360.0000   1496.9000     34.9600     10.3300
+    360.6000   1496.9000     34.9600     10.3300
+    361.3000   1496.8900     34.9600     10.3200
+    361.9000   1496.8900     34.9600     10.3200
+    362.5000   1496.9000     34.9600     10.3200
+    363.1000   1496.8900     34.9600     10.3100
+    363.8000   1496.8800     34.9600     10.3100
+    364.4000   1496.8700     34.9600     10.3000
+    365.0000   1496.8500     34.9600     10.3000
+    365.6000   1496.8300     34.9600     10.2900
+    366.2000   1496.8100     34.9600     10.2800
+    366.9000   1496.7800     34.9600     10.2700
+    367.5000   1496.7800     34.9600     10.2600
+    368.1000   1496.7200     34.9600     10.2400
+    368.7000   1496.6200     34.9600     10.2100
+    369.4000   1496.5200     34.9600     10.1800
+    370.0000   1496.4600     34.9600     10.1600
+    370.6000   1496.4100     34.9600     10.1500
+    371.2000   1496.3800     34.9600     10.1400
+    371.8000   1496.3500     34.9600     10.1200
+    372.5000   1496.2400     34.9600     10.0900
+    373.1000   1496.0700     34.9600     10.0400
+    373.7000   1495.9500     34.9600     10.0000
+    374.3000   1495.8500     34.9600      9.9700
+    375.0000   1495.7900     34.9600      9.9500
+    375.6000   1495.7700     34.9600      9.9400
+    376.2000   1495.7500     34.9600      9.9400
+    376.8000   1495.7600     34.9600      9.9400
+    377.4000   1495.7500     34.9600      9.9300
+    378.1000   1495.7500     34.9600      9.9300
+    378.7000   1495.7700     34.9600      9.9300
+    379.3000   1495.7800     34.9600      9.9300
+    379.9000   1495.7900     34.9600      9.9300
+    380.5000   1495.8100     34.9600      9.9300
+    381.2000   1495.8100     34.9600      9.9300
+    381.8000   1495.8100     34.9600      9.9300
+    382.4000   1495.8100     34.9600      9.9200
+    383.0000   1495.8100     34.9600      9.9200
+    383.6000   1495.8000     34.9600      9.9200
+    384.3000   1495.7700     34.9600      9.9100
+    384.9000   1495.7200     34.9600      9.8900
+    385.5000   1495.6400     34.9600      9.8600
+    386.1000   1495.5400     34.9600      9.8300
+    386.8000   1495.4700     34.9600      9.8100
+    387.4000   1495.4300     34.9600      9.8000
+    388.0000   1495.4200     34.9600      9.7900
+    388.6000   1495.4100     34.9600      9.7900
+    389.2000   1495.4000     34.9600      9.7800
+    389.9000   1495.4000     34.9600      9.7800
+    390.5000   1495.3900     34.9600      9.7700
+    391.1000   1495.3900     34.9600      9.7700
+    391.7000   1495.4000     34.9600      9.7700
+    392.3000   1495.4200     34.9600      9.7700
+    393.0000   1495.4300     34.9600      9.7700
+    393.6000   1495.4100     34.9600      9.7600
+    394.2000   1495.4100     34.9600      9.7600
+    394.8000   1495.4100     34.9600      9.7600
+    395.4000   1495.4000     34.9600      9.7500
+    396.1000   1495.4000     34.9600      9.7500
+    396.7000   1495.4000     34.9600      9.7500
+    397.3000   1495.3800     34.9600      9.7400
+    397.9000   1495.3600     34.9600      9.7300
+    398.5000   1495.3500     34.9600      9.7200
+    399.2000   1495.3700     34.9600      9.7200
+    399.8000   1495.3600     34.9600      9.7200
+    400.4000   1495.3600     34.9600      9.7200
+    401.0000   1495.3700     34.9600      9.7200
+    401.6000   1495.3700     34.9600      9.7200
+    402.3000   1495.3900     34.9600      9.7200
+    402.9000   1495.3600     34.9600      9.7100
+    403.5000   1495.2200     34.9600      9.6700
+    404.1000   1494.9900     34.9600      9.6000
+    404.7000   1494.7400     34.9600      9.5300
+    405.4000   1494.5100     34.9600      9.4600
+    406.0000   1494.3600     34.9600      9.4200
+    406.6000   1494.2700     34.9600      9.3900
+    407.2000   1494.2300     34.9600      9.3800
+    407.8000   1494.1900     34.9600      9.3600
+    408.5000   1494.1100     34.9600      9.3400
+    409.1000   1494.0400     34.9600      9.3100
+    409.7000   1493.9800     34.9600      9.3000
+    410.3000   1493.9600     34.9600      9.2900
+    410.9000   1493.9500     34.9600      9.2800
+    411.6000   1493.9400     34.9600      9.2800
+    412.2000   1493.9400     34.9600      9.2700
+    412.8000   1493.8900     34.9600      9.2600
+    413.4000   1493.7800     34.9600      9.2300
+    414.0000   1493.7000     34.9600      9.2000
+    414.6000   1493.6500     34.9600      9.1800
+    415.3000   1493.5800     34.9600      9.1600
+    415.9000   1493.5100     34.9600      9.1400
+    416.5000   1493.4600     34.9600      9.1200
+    417.1000   1493.4300     34.9600      9.1100
+    417.7000   1493.4000     34.9600      9.1000
+    418.4000   1493.3800     34.9600      9.0900
+    419.0000   1493.3800     34.9600      9.0900
+    419.6000   1493.3700     34.9600      9.0900
+    420.2000   1493.3600     34.9600      9.0800
+    420.8000   1493.3300     34.9600      9.0700
+    421.5000   1493.3200     34.9600      9.0600
+    422.1000   1493.3100     34.9600      9.0600
+    422.7000   1493.2600     34.9600      9.0400
+    423.3000   1493.2300     34.9600      9.0300
+    423.9000   1493.2200     34.9600      9.0300
+    424.5000   1493.2000     34.9600      9.0200
+    425.2000   1493.1800     34.9600      9.0100
+    425.8000   1493.1400     34.9600      9.0000
+    426.4000   1493.0700     34.9600      8.9700
+    427.0000   1492.9900     34.9600      8.9500
+    427.6000   1492.9400     34.9600      8.9300
+    428.3000   1492.8900     34.9600      8.9200
+    428.9000   1492.8500     34.9600      8.9000
+    429.5000   1492.8000     34.9600      8.8900
+    430.1000   1492.7800     34.9600      8.8800
+    430.7000   1492.7600     34.9600      8.8700
+    431.3000   1492.7400     34.9600      8.8600
+    432.0000   1492.7300     34.9600      8.8600
+    432.6000   1492.7200     34.9600      8.8500
+    433.2000   1492.7100     34.9600      8.8500
+    433.8000   1492.7100     34.9600      8.8400
+    434.4000   1492.7100     34.9600      8.8400
+    435.0000   1492.7000     34.9600      8.8300
+    435.7000   1492.7000     34.9600      8.8300
+    436.3000   1492.7000     34.9600      8.8300
+    436.9000   1492.6900     34.9600      8.8200
+    437.5000   1492.6800     34.9600      8.8200
+    438.1000   1492.6600     34.9600      8.8100
+    438.8000   1492.6300     34.9600      8.8000
+    439.4000   1492.6300     34.9600      8.8000
+    440.0000   1492.6200     34.9600      8.7900
+    440.6000   1492.5800     34.9600      8.7800
+    441.2000   1492.4900     34.9600      8.7500
+    441.8000   1492.4200     34.9600      8.7300
+    442.5000   1492.3400     34.9600      8.7000
+    443.1000   1492.3000     34.9600      8.6900
+    443.7000   1492.2600     34.9600      8.6800
+    444.3000   1492.2000     34.9600      8.6600
+    444.9000   1492.1400     34.9600      8.6400
+    445.5000   1492.1200     34.9600      8.6300
+    446.2000   1492.1000     34.9600      8.6200
+    446.8000   1492.0800     34.9600      8.6100
+    447.4000   1492.0700     34.9600      8.6100
+    448.0000   1492.0700     34.9600      8.6100
+    448.6000   1492.0100     34.9600      8.5900
+    449.2000   1491.9600     34.9600      8.5700
+    449.9000   1491.9100     34.9600      8.5600
+    450.5000   1491.8400     34.9600      8.5300
+    451.1000   1491.7300     34.9600      8.5000
+    451.7000   1491.6600     34.9600      8.4800
+    452.3000   1491.6400     34.9600      8.4700
+    452.9000   1491.6300     34.9600      8.4700
+    453.6000   1491.6400     34.9600      8.4700
+    454.2000   1491.6500     34.9600      8.4700
+    454.8000   1491.6500     34.9600      8.4600
+    455.4000   1491.6400     34.9600      8.4600
+    456.0000   1491.6200     34.9600      8.4500
+    456.6000   1491.5900     34.9600      8.4400
+    457.3000   1491.5400     34.9600      8.4200
+    457.9000   1491.4900     34.9600      8.4100
+    458.5000   1491.4100     34.9600      8.3800
+    459.1000   1491.3200     34.9600      8.3600
+    459.7000   1491.2000     34.9600      8.3200
+    460.3000   1491.0800     34.9600      8.2900
+    460.9000   1491.0100     34.9600      8.2700
+    461.6000   1490.9600     34.9600      8.2500
+    462.2000   1490.8900     34.9600      8.2300
+    462.8000   1490.7600     34.9600      8.1900
+    463.4000   1490.6300     34.9600      8.1600
+    464.0000   1490.5300     34.9600      8.1200
+    464.6000   1490.4500     34.9600      8.1000
+    465.3000   1490.4200     34.9600      8.0900
+    465.9000   1490.4000     34.9600      8.0800
+    466.5000   1490.3400     34.9600      8.0600
+    467.1000   1490.2400     34.9600      8.0400
+    467.7000   1490.1500     34.9600      8.0100
+    468.3000   1490.0700     34.9600      7.9800
+    468.9000   1489.9900     34.9600      7.9600
+    469.6000   1489.9300     34.9600      7.9400
+    470.2000   1489.9000     34.9600      7.9300
+    470.8000   1489.8700     34.9600      7.9200
+    471.4000   1489.8500     34.9600      7.9100
+    472.0000   1489.8000     34.9600      7.9000
+    472.6000   1489.7400     34.9600      7.8800
+    473.2000   1489.6900     34.9600      7.8600
+    473.9000   1489.6400     34.9600      7.8500
+    474.5000   1489.5800     34.9600      7.8300
+    475.1000   1489.5500     34.9600      7.8200
+    475.7000   1489.5400     34.9600      7.8100
+    476.3000   1489.5500     34.9600      7.8100
+    476.9000   1489.5500     34.9600      7.8100
+    477.6000   1489.5500     34.9600      7.8100
+    478.2000   1489.5200     34.9600      7.8000
+    478.8000   1489.4500     34.9600      7.7700
+    479.4000   1489.3800     34.9600      7.7500
+    480.0000   1489.3200     34.9600      7.7400
+    480.6000   1489.2800     34.9600      7.7200
+    481.2000   1489.2300     34.9600      7.7100
+    481.9000   1489.2100     34.9600      7.7000
+    482.5000   1489.2000     34.9600      7.6900
+    483.1000   1489.1900     34.9600      7.6900
+    483.7000   1489.1500     34.9600      7.6800
+    484.3000   1489.1200     34.9600      7.6600
+    484.9000   1489.0400     34.9600      7.6400
+    485.5000   1488.9400     34.9600      7.6100
+    486.2000   1488.8900     34.9600      7.5900
+    486.8000   1488.8800     34.9600      7.5900
+    487.4000   1488.8600     34.9600      7.5800
+    488.0000   1488.8000     34.9600      7.5600
+    488.6000   1488.7100     34.9600      7.5400
+    489.2000   1488.6200     34.9600      7.5100
+    489.8000   1488.5400     34.9600      7.4900
+    490.4000   1488.4700     34.9600      7.4700
+    491.1000   1488.4200     34.9600      7.4500
+    491.7000   1488.3800     34.9600      7.4400
+    492.3000   1488.3300     34.9600      7.4200
+    492.9000   1488.2800     34.9600      7.4100
+    493.5000   1488.2200     34.9600      7.3900
+    494.1000   1488.1900     34.9600      7.3800
+    494.7000   1488.1600     34.9600      7.3700
+    495.4000   1488.1400     34.9600      7.3600
+    496.0000   1488.1200     34.9600      7.3500
+    496.6000   1488.0900     34.9600      7.3400
+    497.2000   1488.0900     34.9600      7.3400
+    497.8000   1488.0900     34.9600      7.3400
+    498.4000   1488.1000     34.9600      7.3400
+    499.0000   1488.0900     34.9600      7.3300
+    499.6000   1488.0900     34.9600      7.3300
+    500.3000   1488.0900     34.9600      7.3200
+    500.9000   1488.0500     34.9600      7.3100
+    501.5000   1487.9500     34.9600      7.2900
+    502.1000   1487.8700     34.9600      7.2600
+    502.7000   1487.8000     34.9600      7.2400
+    503.3000   1487.8000     34.9600      7.2400
+    503.9000   1487.7800     34.9600      7.2300
+    504.5000   1487.7300     34.9600      7.2100
+    505.2000   1487.6900     34.9600      7.2000
+    505.8000   1487.6800     34.9600      7.2000
+    506.4000   1487.6500     34.9600      7.1900
+    507.0000   1487.6000     34.9600      7.1700
+    507.6000   1487.5800     34.9600      7.1600
+    508.2000   1487.5400     34.9600      7.1500
+    508.8000   1487.4600     34.9600      7.1300
+    509.4000   1487.3900     34.9600      7.1100
+    510.1000   1487.2800     34.9600      7.0700
+    510.7000   1487.1800     34.9600      7.0500
+    511.3000   1487.1200     34.9600      7.0300
+    511.9000   1487.0600     34.9600      7.0100
+    512.5000   1486.9800     34.9600      6.9900
+    513.1000   1486.9000     34.9600      6.9600
+    513.7000   1486.7900     34.9600      6.9300
+    514.3000   1486.7000     34.9600      6.9100
+    515.0000   1486.6100     34.9600      6.8800
+    515.6000   1486.5200     34.9600      6.8500
+    516.2000   1486.4200     34.9600      6.8300
+    516.8000   1486.3300     34.9600      6.8000
+    517.4000   1486.2500     34.9600      6.7800
+    518.0000   1486.1700     34.9600      6.7500
+    518.6000   1486.0800     34.9600      6.7300
+    519.2000   1485.9900     34.9600      6.7000
+    519.9000   1485.9200     34.9600      6.6800
+    520.5000   1485.8600     34.9600      6.6600
+    521.1000   1485.7900     34.9600      6.6400
+    521.7000   1485.7500     34.9600      6.6300
+    522.3000   1485.7100     34.9600      6.6200
+    522.9000   1485.6800     34.9600      6.6100
+    523.5000   1485.6400     34.9600      6.6000
+    524.1000   1485.6100     34.9600      6.5900
+    524.7000   1485.5800     34.9600      6.5700
+    525.4000   1485.5700     34.9600      6.5700
+    526.0000   1485.5600     34.9600      6.5600
+    526.6000   1485.5500     34.9600      6.5600
+    527.2000   1485.5300     34.9600      6.5500
+    527.8000   1485.5100     34.9600      6.5400
+    528.4000   1485.5000     34.9600      6.5400
+    529.0000   1485.4900     34.9600      6.5300
+    529.6000   1485.4800     34.9600      6.5300
+    530.2000   1485.4600     34.9600      6.5200
+    530.9000   1485.4600     34.9600      6.5200
+    531.5000   1485.4400     34.9600      6.5100
+    532.1000   1485.4400     34.9600      6.5100
+    532.7000   1485.4400     34.9600      6.5000
+    533.3000   1485.4200     34.9600      6.5000
+    533.9000   1485.3900     34.9600      6.4900
+    534.5000   1485.3600     34.9600      6.4800
+    535.1000   1485.3100     34.9600      6.4600
+    535.7000   1485.2300     34.9600      6.4400
+    536.3000   1485.1500     34.9600      6.4200
+    537.0000   1485.1000     34.9600      6.4000
+    537.6000   1485.0400     34.9600      6.3800
+    538.2000   1484.9900     34.9600      6.3700
+    538.8000   1484.9700     34.9600      6.3600
+    539.4000   1484.9600     34.9600      6.3500
+    540.0000   1484.9400     34.9600      6.3500
+    540.6000   1484.9100     34.9600      6.3400
+    541.2000   1484.9100     34.9600      6.3300
+    541.8000   1484.8900     34.9600      6.3300
+    542.4000   1484.8800     34.9600      6.3200
+    543.1000   1484.8900     34.9600      6.3200
+    543.7000   1484.8900     34.9600      6.3200
+    544.3000   1484.8800     34.9600      6.3100
+    544.9000   1484.8700     34.9600      6.3100
+    545.5000   1484.8800     34.9600      6.3100
+    546.1000   1484.8800     34.9600      6.3100
+    546.7000   1484.8800     34.9600      6.3000
+    547.3000   1484.8900     34.9600      6.3000
+    547.9000   1484.8800     34.9600      6.3000
+    548.5000   1484.8800     34.9600      6.3000
+    549.2000   1484.8600     34.9600      6.2900
+    549.8000   1484.8100     34.9600      6.2700
+    550.4000   1484.7700     34.9600      6.2600
+    551.0000   1484.7600     34.9600      6.2600
+    551.6000   1484.7600     34.9600      6.2500
+    552.2000   1484.7400     34.9600      6.2500
+    552.8000   1484.7000     34.9600      6.2300
+    553.4000   1484.6500     34.9600      6.2200
+    554.0000   1484.6200     34.9600      6.2100
+    554.6000   1484.6100     34.9600      6.2000
+    555.2000   1484.6100     34.9600      6.2000
+    555.9000   1484.6200     34.9600      6.2000
+    556.5000   1484.6300     34.9600      6.2000
+    557.1000   1484.6400     34.9600      6.2000
+    557.7000   1484.6300     34.9600      6.2000
+    558.3000   1484.6100     34.9600      6.1900
+    558.9000   1484.5500     34.9600      6.1700
+    559.5000   1484.5200     34.9600      6.1600
+    560.1000   1484.4900     34.9600      6.1500
+    560.7000   1484.4500     34.9600      6.1400
+    561.3000   1484.3600     34.9600      6.1100
+    561.9000   1484.2700     34.9600      6.0900
+    562.6000   1484.2500     34.9600      6.0800
+    563.2000   1484.2400     34.9600      6.0700
+    563.8000   1484.2400     34.9600      6.0700
+    564.4000   1484.2500     34.9600      6.0700
+    565.0000   1484.2600     34.9600      6.0700
+    565.6000   1484.2400     34.9600      6.0600
+    566.2000   1484.2100     34.9600      6.0500
+    566.8000   1484.1900     34.9600      6.0500
+    567.4000   1484.1700     34.9600      6.0400
+    568.0000   1484.1500     34.9600      6.0300
+    568.6000   1484.1200     34.9600      6.0200
+    569.2000   1484.0900     34.9600      6.0100
+    569.8000   1484.0900     34.9600      6.0100
+    570.5000   1484.0900     34.9600      6.0100
+    571.1000   1484.1000     34.9600      6.0100
+    571.7000   1484.1000     34.9600      6.0000
+    572.3000   1484.0900     34.9600      6.0000
+    572.9000   1484.0700     34.9600      5.9900
+    573.5000   1484.0400     34.9600      5.9800
+    574.1000   1484.0200     34.9600      5.9700
+    574.7000   1483.9700     34.9600      5.9600
+    575.3000   1483.8800     34.9600      5.9300
+    575.9000   1483.8100     34.9600      5.9100
+    576.5000   1483.7700     34.9600      5.9000
+    577.1000   1483.7600     34.9600      5.8900
+    577.7000   1483.7400     34.9600      5.8900
+    578.4000   1483.7100     34.9600      5.8800
+    579.0000   1483.6800     34.9600      5.8700
+    579.6000   1483.6400     34.9600      5.8500
+    580.2000   1483.6100     34.9600      5.8500
+    580.8000   1483.5900     34.9600      5.8400
+    581.4000   1483.5600     34.9600      5.8300
+    582.0000   1483.5600     34.9600      5.8200
+    582.6000   1483.5400     34.9600      5.8200
+    583.2000   1483.5300     34.9600      5.8100
+    583.8000   1483.5300     34.9600      5.8100
+    584.4000   1483.5200     34.9600      5.8000
+    585.0000   1483.5200     34.9600      5.8000
+    585.6000   1483.5200     34.9600      5.8000
+    586.2000   1483.5100     34.9600      5.7900
+    586.9000   1483.4800     34.9600      5.7800
+    587.5000   1483.4500     34.9600      5.7700
+    588.1000   1483.4000     34.9600      5.7600
+    588.7000   1483.3600     34.9600      5.7500
+    589.3000   1483.3000     34.9600      5.7300
+    589.9000   1483.2600     34.9600      5.7200
+    590.5000   1483.2400     34.9600      5.7100
+    591.1000   1483.2100     34.9600      5.7000
+    591.7000   1483.2000     34.9600      5.6900
+    592.3000   1483.1800     34.9600      5.6900
+    592.9000   1483.1600     34.9600      5.6800
+    593.5000   1483.1300     34.9600      5.6700
+    594.1000   1483.1000     34.9600      5.6600
+    594.7000   1483.0600     34.9600      5.6500
+    595.3000   1483.0400     34.9600      5.6400
+    596.0000   1483.0200     34.9600      5.6300
+    596.6000   1483.0100     34.9600      5.6300
+    597.2000   1483.0200     34.9600      5.6300
+    597.8000   1483.0300     34.9600      5.6300
+    598.4000   1483.0500     34.9600      5.6300
+    599.0000   1483.0500     34.9600      5.6300
+    599.6000   1483.0700     34.9600      5.6300
+    600.2000   1483.0700     34.9600      5.6300
+    600.8000   1483.0800     34.9600      5.6300
+    601.4000   1483.0900     34.9600      5.6300
+    602.0000   1483.0900     34.9600      5.6200
+    602.6000   1483.0600     34.9600      5.6100
+    603.2000   1483.0200     34.9600      5.6000
+    603.8000   1483.0000     34.9600      5.5900
+    604.4000   1482.9800     34.9600      5.5900
+    605.0000   1482.9600     34.9600      5.5800
+    605.6000   1482.9500     34.9600      5.5700
+    606.2000   1482.9300     34.9600      5.5700
+    606.9000   1482.9200     34.9600      5.5600
+    607.5000   1482.9200     34.9600      5.5600
+    608.1000   1482.9300     34.9600      5.5600
+    608.7000   1482.9100     34.9600      5.5500
+    609.3000   1482.8900     34.9600      5.5400
+    609.9000   1482.8800     34.9600      5.5400
+    610.5000   1482.8700     34.9600      5.5300
+    611.1000   1482.8500     34.9600      5.5300
+    611.7000   1482.8300     34.9600      5.5200
+    612.3000   1482.8000     34.9600      5.5100
+    612.9000   1482.7700     34.9600      5.5000
+    613.5000   1482.7700     34.9600      5.5000
+    614.1000   1482.7700     34.9600      5.4900
+    614.7000   1482.7600     34.9600      5.4900
+    615.3000   1482.7400     34.9600      5.4800
+    615.9000   1482.6700     34.9600      5.4600
+    616.5000   1482.6400     34.9600      5.4500
+    617.1000   1482.6200     34.9600      5.4500
+    617.7000   1482.6100     34.9600      5.4400
+    618.3000   1482.5900     34.9600      5.4300
+    619.0000   1482.5800     34.9600      5.4300
+    619.6000   1482.5800     34.9600      5.4200
+    620.2000   1482.5400     34.9600      5.4100
+    620.8000   1482.4800     34.9600      5.4000
+    621.4000   1482.4500     34.9600      5.3900
+    622.0000   1482.4500     34.9600      5.3800
+    622.6000   1482.4300     34.9600      5.3800
+    623.2000   1482.4000     34.9600      5.3600
+    623.8000   1482.3700     34.9600      5.3600
+    624.4000   1482.3800     34.9600      5.3600
+    625.0000   1482.4000     34.9600      5.3600
+    625.6000   1482.4200     34.9600      5.3600
+    626.2000   1482.4000     34.9600      5.3500
+    626.8000   1482.3300     34.9600      5.3300
+    627.4000   1482.2500     34.9600      5.3100
+    628.0000   1482.1800     34.9600      5.2900
+    628.6000   1482.1600     34.9600      5.2800
+    629.2000   1482.1400     34.9600      5.2800
+    629.8000   1482.1500     34.9600      5.2800
+    630.4000   1482.1500     34.9600      5.2700
+    631.0000   1482.1500     34.9600      5.2700
+    631.6000   1482.1400     34.9600      5.2700
+    632.2000   1482.1300     34.9600      5.2600
+    632.8000   1482.1300     34.9600      5.2600
+    633.4000   1482.1300     34.9600      5.2600
+    634.1000   1482.1300     34.9600      5.2500
+    634.7000   1482.1100     34.9600      5.2500
+    635.3000   1482.1100     34.9600      5.2400
+    635.9000   1482.1100     34.9600      5.2400
+    636.5000   1482.0900     34.9600      5.2300
+    637.1000   1482.1000     34.9600      5.2400
+    637.7000   1482.1000     34.9600      5.2300
+    638.3000   1482.1000     34.9600      5.2300
+    638.9000   1482.1000     34.9600      5.2300
+    639.5000   1482.1000     34.9600      5.2200
+    640.1000   1482.1000     34.9600      5.2200
+    640.7000   1482.1100     34.9600      5.2200
+    641.3000   1482.1000     34.9600      5.2200
+    641.9000   1482.0900     34.9600      5.2100
+    642.5000   1482.0900     34.9600      5.2100
+    643.1000   1482.1100     34.9600      5.2100
+    643.7000   1482.1000     34.9600      5.2100
+    644.3000   1482.1000     34.9600      5.2100
+    644.9000   1482.0900     34.9600      5.2000
+    645.5000   1482.0500     34.9600      5.1900
+    646.1000   1482.0000     34.9600      5.1700
+    646.7000   1481.9600     34.9600      5.1600
+    647.3000   1481.9300     34.9600      5.1500
+    647.9000   1481.9200     34.9600      5.1500
+    648.5000   1481.9200     34.9600      5.1400
+    649.1000   1481.9100     34.9600      5.1400
+    649.7000   1481.9000     34.9600      5.1300
+    650.3000   1481.9000     34.9600      5.1300
+    650.9000   1481.8900     34.9600      5.1300
+    651.5000   1481.8800     34.9600      5.1200
+    652.1000   1481.8800     34.9600      5.1200
+    652.7000   1481.8700     34.9600      5.1100
+    653.3000   1481.8600     34.9600      5.1100
+    653.9000   1481.8700     34.9600      5.1100
+    654.5000   1481.8700     34.9600      5.1100
+    655.1000   1481.8700     34.9600      5.1000
+    655.7000   1481.8700     34.9600      5.1000
+    656.3000   1481.8800     34.9600      5.1000
+    656.9000   1481.8800     34.9600      5.1000
+    657.6000   1481.8700     34.9600      5.1000
+    658.2000   1481.8600     34.9600      5.0900
+    658.8000   1481.8400     34.9600      5.0800
+    659.4000   1481.7900     34.9600      5.0700
+    660.0000   1481.7400     34.9600      5.0500
+    660.6000   1481.7100     34.9600      5.0400
+    661.2000   1481.7000     34.9600      5.0400
+    661.8000   1481.7000     34.9600      5.0400
+    662.4000   1481.7000     34.9600      5.0300
+    663.0000   1481.7100     34.9600      5.0300
+    663.6000   1481.7000     34.9600      5.0300
+    664.2000   1481.7000     34.9600      5.0300
+    664.8000   1481.7000     34.9600      5.0200
+    665.4000   1481.7000     34.9600      5.0200
+    666.0000   1481.7000     34.9600      5.0200
+    666.6000   1481.6900     34.9600      5.0100
+    667.2000   1481.6800     34.9600      5.0100
+    667.8000   1481.6700     34.9600      5.0000
+    668.4000   1481.6900     34.9600      5.0100
+    669.0000   1481.7300     34.9600      5.0100
+    669.6000   1481.7500     34.9600      5.0200
+    670.2000   1481.7500     34.9600      5.0100
+    670.8000   1481.7300     34.9600      5.0100
+    671.4000   1481.7200     34.9600      5.0000
+    672.0000   1481.7200     34.9600      5.0000
+    672.6000   1481.7300     34.9600      5.0000
+    673.2000   1481.7300     34.9600      5.0000
+    673.8000   1481.7100     34.9600      4.9900
+    674.4000   1481.7000     34.9600      4.9800
+    675.0000   1481.7000     34.9600      4.9800
+    675.6000   1481.7000     34.9600      4.9800
+    676.2000   1481.7000     34.9600      4.9800
+    676.8000   1481.7000     34.9600      4.9700
+    677.4000   1481.7200     34.9600      4.9800
+    678.0000   1481.7200     34.9600      4.9800
+    678.6000   1481.7300     34.9600      4.9700
+    679.2000   1481.7100     34.9600      4.9700
+    679.8000   1481.7200     34.9600      4.9700
+    680.4000   1481.7400     34.9600      4.9700
+    681.0000   1481.7200     34.9600      4.9600
+    681.6000   1481.7000     34.9600      4.9600
+    682.2000   1481.7000     34.9600      4.9500
+    682.8000   1481.6900     34.9600      4.9500
+    683.4000   1481.6900     34.9600      4.9400
+    684.0000   1481.6800     34.9600      4.9400
+    684.6000   1481.7000     34.9600      4.9400
+    685.2000   1481.6900     34.9600      4.9400
+    685.8000   1481.7000     34.9600      4.9400
+    686.4000   1481.6900     34.9600      4.9300
+    687.0000   1481.7000     34.9600      4.9300
+    687.6000   1481.7100     34.9600      4.9300
+    688.2000   1481.7100     34.9600      4.9300
+    688.8000   1481.7200     34.9600      4.9300
+    689.4000   1481.7100     34.9600      4.9200
+    690.0000   1481.7000     34.9600      4.9200
+    690.6000   1481.7200     34.9600      4.9200
+    691.2000   1481.7300     34.9600      4.9200
+    691.8000   1481.7300     34.9600      4.9200
+    692.4000   1481.7300     34.9600      4.9200
+    693.0000   1481.7400     34.9600      4.9200
+    693.6000   1481.7300     34.9600      4.9100
+    694.2000   1481.7200     34.9600      4.9100
+    694.8000   1481.7200     34.9600      4.9100
+    695.4000   1481.7400     34.9600      4.9100
+    696.0000   1481.7700     34.9600      4.9100
+    696.6000   1481.7800     34.9600      4.9100
+    697.2000   1481.7900     34.9600      4.9100
+    697.8000   1481.7900     34.9600      4.9100
+    698.4000   1481.8000     34.9600      4.9100
+    699.0000   1481.8000     34.9600      4.9100
+    699.6000   1481.8000     34.9600      4.9100
+    700.2000   1481.8000     34.9600      4.9000
+    700.8000   1481.7900     34.9600      4.9000
+    701.4000   1481.7800     34.9600      4.9000
+    702.0000   1481.7700     34.9600      4.8900
+    702.6000   1481.7800     34.9600      4.8900
+    703.2000   1481.7900     34.9600      4.8900
+    703.8000   1481.8000     34.9600      4.8900
+    704.4000   1481.8000     34.9600      4.8900
+    705.0000   1481.8100     34.9600      4.8900
+    705.5000   1481.8000     34.9600      4.8800
+    706.1000   1481.8000     34.9600      4.8800
+    706.7000   1481.8100     34.9600      4.8800
+    707.3000   1481.8000     34.9600      4.8800
+    707.9000   1481.8000     34.9600      4.8700
+    708.5000   1481.8100     34.9600      4.8700
+    709.1000   1481.8200     34.9600      4.8700
+    709.7000   1481.8300     34.9600      4.8700
+    710.3000   1481.8400     34.9600      4.8700
+    710.9000   1481.8600     34.9600      4.8800
+    711.5000   1481.8700     34.9600      4.8700
+    712.1000   1481.8700     34.9600      4.8700
+    712.7000   1481.8900     34.9600      4.8800
+    713.3000   1481.9100     34.9600      4.8800
+    713.9000   1481.9200     34.9600      4.8800
+    714.5000   1481.9300     34.9600      4.8800
+    715.1000   1481.9500     34.9600      4.8800
+    715.7000   1481.9400     34.9600      4.8800
+    716.3000   1481.9400     34.9600      4.8700
+    716.9000   1481.9700     34.9600      4.8800
+    717.5000   1481.9800     34.9600      4.8800
+    718.1000   1481.9900     34.9600      4.8800
+    718.7000   1482.0100     34.9600      4.8800
+    719.3000   1482.0200     34.9600      4.8800
+    719.9000   1482.0100     34.9600      4.8800
+    720.5000   1482.0200     34.9600      4.8800
+    721.1000   1482.0200     34.9600      4.8700
+    721.7000   1482.0300     34.9600      4.8700
+    722.3000   1482.0600     34.9600      4.8800
+    722.9000   1482.1300     34.9600      4.8900
+    723.5000   1482.2200     34.9600      4.9100
+    724.1000   1482.2900     34.9600      4.9300
+    724.7000   1482.3700     34.9600      4.9400
+    725.3000   1482.4500     34.9600      4.9600
+    725.9000   1482.5100     34.9600      4.9700
+    726.5000   1482.5800     34.9600      4.9900
+    727.1000   1482.6000     34.9600      4.9900
+    727.7000   1482.6200     34.9600      5.0000
+    728.3000   1482.6600     34.9600      5.0000
+    728.8000   1482.6900     34.9600      5.0100
+    729.4000   1482.7100     34.9600      5.0100
+    730.0000   1482.7400     34.9600      5.0100
+    730.6000   1482.7700     34.9600      5.0200
+    731.2000   1482.7900     34.9600      5.0200
+    731.8000   1482.7900     34.9600      5.0200
+    732.4000   1482.7900     34.9600      5.0200
+    733.0000   1482.8200     34.9600      5.0200
+    733.6000   1482.8400     34.9600      5.0300
+    734.2000   1482.8600     34.9600      5.0300
+    734.8000   1482.8700     34.9600      5.0300
+    735.4000   1482.8800     34.9600      5.0300
+    736.0000   1482.9000     34.9600      5.0300
+    736.6000   1482.9100     34.9600      5.0300
+    737.2000   1482.9100     34.9600      5.0300
+    737.8000   1482.9000     34.9600      5.0200
+    738.4000   1482.8900     34.9600      5.0200
+    739.0000   1482.9000     34.9600      5.0200
+    739.6000   1482.9000     34.9600      5.0100
+    740.2000   1482.9100     34.9600      5.0200
+    740.8000   1482.9400     34.9600      5.0200
+    741.4000   1482.9800     34.9600      5.0300
+    742.0000   1483.0300     34.9600      5.0400
+    742.6000   1483.0500     34.9600      5.0400
+    743.2000   1483.0500     34.9600      5.0400
+    743.7000   1483.0600     34.9600      5.0400
+    744.3000   1483.0900     34.9600      5.0400
+    744.9000   1483.1000     34.9600      5.0400
+    745.5000   1483.1000     34.9600      5.0400
+    746.1000   1483.1100     34.9600      5.0400
+    746.7000   1483.1300     34.9600      5.0400
+    747.3000   1483.1400     34.9600      5.0400
+    747.9000   1483.1500     34.9600      5.0400
+    748.5000   1483.1400     34.9600      5.0400
+    749.1000   1483.1500     34.9600      5.0400
+    749.7000   1483.1500     34.9600      5.0300
+    750.3000   1483.1700     34.9600      5.0400
+    750.9000   1483.1700     34.9600      5.0400
+    751.5000   1483.1900     34.9600      5.0400
+    752.1000   1483.2000     34.9600      5.0400
+    752.7000   1483.2000     34.9600      5.0400
+    753.3000   1483.2000     34.9600      5.0300
+    753.9000   1483.1700     34.9600      5.0200
+    754.5000   1483.1600     34.9600      5.0200
+    755.1000   1483.1500     34.9600      5.0100
+    755.7000   1483.1600     34.9600      5.0100
+    756.2000   1483.1700     34.9600      5.0100
+    756.8000   1483.2000     34.9600      5.0200
+    757.4000   1483.2100     34.9600      5.0200
+    758.0000   1483.2200     34.9600      5.0200
+    758.6000   1483.2300     34.9600      5.0200
+    759.2000   1483.2500     34.9600      5.0200
+    759.8000   1483.2600     34.9600      5.0200
+    760.4000   1483.2600     34.9600      5.0200
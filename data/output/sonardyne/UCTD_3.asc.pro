@@ -0,0 +1,56 @@
+test_read_store_and_write
+21/4/2014
+18:20:0
+Probe: OceanScience
+Source: /root/package/data/input/oceanscience/UCTD_3.asc
+      0.2173   1514.8806     32.3971     18.7000
+      0.3105   1517.4168     34.7312     18.6650
+      0.4960   1518.0599     35.3708     18.6360
+      0.7440   1518.0938     35.3945     18.6370
+      0.8988   1518.0736     35.4047     18.6250
+      0.9613   1518.0479     35.4141     18.6120
+      1.1160   1518.0231     35.4026     18.6070
+      1.2708   1517.9852     35.4048     18.5920
+      1.3025   1517.9798     35.4528     18.5710
+      1.5813   1517.8765     35.4108     18.5500
+      1.7053   1517.8416     35.4035     18.5400
+      1.7668   1517.8061     35.4068     18.5260
+      1.9226   1517.8616     35.4281     18.5360
+      2.0148   1517.9091     35.4205     18.5550
+      2.0773   1517.9334     35.4232     18.5620
+      2.1388   1517.9518     35.4234     18.5680
+      2.2628   1517.9693     35.4243     18.5730
+      2.3868   1517.9848     35.4235     18.5780
+      2.5108   1518.0060     35.4201     18.5860
+      2.6348   1518.0234     35.4183     18.5920
+      2.6973   1518.0321     35.4175     18.5950
+      2.7281   1518.0346     35.4193     18.5950
+      2.7906   1518.0414     35.4193     18.5970
+      2.8521   1518.0252     35.4244     18.5890
+      3.0069   1518.0028     35.4251     18.5800
+      3.1626   1517.9679     35.4046     18.5750
+      3.3174   1517.9112     35.4208     18.5480
+      3.4721   1517.8799     35.3959     18.5460
+      3.6269   1517.7609     35.3469     18.5230
+      3.8134   1517.6355     35.3835     18.4640
+      3.9989   1517.5734     35.4047     18.4330
+      4.1854   1517.5437     35.4089     18.4200
+      4.4026   1517.5219     35.4042     18.4130
+      4.5881   1517.4858     35.3951     18.4030
+      4.8054   1517.4428     35.3946     18.3870
+      4.9909   1517.3870     35.3783     18.3730
+      5.2082   1517.3776     35.3974     18.3610
+      5.3947   1517.3751     35.4052     18.3560
+      5.6109   1517.3748     35.4068     18.3540
+      5.7974   1517.3640     35.3996     18.3520
+      5.9522   1517.3510     35.3986     18.3470
+      6.1387   1517.3346     35.3992     18.3400
+      6.3549   1517.3207     35.3991     18.3340
+      6.5722   1517.3167     35.4051     18.3290
+      6.7894   1517.3144     35.4049     18.3270
+      7.0067   1517.3141     35.4066     18.3250
+      7.2229   1517.3176     35.4065     18.3250
+      7.3469   1517.3256     35.4092     18.3260
+      7.4402   1517.3332     35.4170     18.3250
+      7.5334   1517.3487     35.4268     18.3260
+      7.5642   1517.3588     35.4225     18.3310
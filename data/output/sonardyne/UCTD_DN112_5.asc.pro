@@ -0,0 +1,81 @@
+test_read_store_and_write
+22/4/2014
+13:33:0
+Probe: OceanScience
+Source: /root/package/data/input/oceanscience/UCTD_DN112_5.asc
+      0.3416   1512.7097     33.2203     17.6390
+      0.5899   1513.3777     33.8241     17.6310
+      0.9315   1513.5909     34.0114     17.6290
+      1.1172   1513.6754     34.0855     17.6280
+      1.1480   1513.7067     34.1254     17.6230
+      1.2413   1513.6557     34.1131     17.6100
+      1.3963   1513.6323     34.1266     17.5960
+      1.4896   1513.6299     34.1387     17.5900
+      1.6138   1513.6362     34.1476     17.5880
+      1.7379   1513.6606     34.1646     17.5890
+      1.8620   1513.6971     34.1844     17.5930
+      1.9862   1513.7336     34.2016     17.5980
+      2.1103   1513.7599     34.2099     17.6030
+      2.2344   1513.7699     34.2091     17.6060
+      2.4519   1513.7898     34.2233     17.6060
+      2.6376   1513.8478     34.2663     17.6080
+      2.7310   1514.0629     34.4147     17.6230
+      2.8551   1514.3295     34.5225     17.6710
+      2.9484   1514.4666     34.5096     17.7220
+      3.0408   1514.5442     34.5168     17.7450
+      3.1341   1514.5858     34.5235     17.7560
+      3.3208   1514.6190     34.5345     17.7620
+      3.5065   1514.6503     34.5515     17.7650
+      3.6615   1514.6730     34.5614     17.7680
+      3.8482   1514.7002     34.5748     17.7710
+      4.0031   1514.7289     34.5848     17.7760
+      4.1898   1514.7743     34.6064     17.7820
+      4.3139   1514.8126     34.6253     17.7870
+      4.5314   1514.8464     34.6389     17.7920
+      4.7479   1514.9024     34.6720     17.7970
+      4.9961   1514.9669     34.7044     17.8050
+      5.2136   1515.0410     34.7431     17.8140
+      5.4003   1515.1187     34.7880     17.8220
+      5.6168   1515.2091     34.8410     17.8310
+      5.7727   1515.2757     34.8611     17.8450
+      5.9584   1515.3065     34.8649     17.8530
+      6.1451   1515.3176     34.8693     17.8540
+      6.3308   1515.3369     34.8835     17.8540
+      6.5483   1515.3589     34.9048     17.8520
+      6.7658   1515.3750     34.9286     17.8470
+      6.9822   1515.3831     34.9480     17.8410
+      7.1997   1515.3991     34.9692     17.8370
+      7.3864   1515.4185     34.9861     17.8360
+      7.6029   1515.4463     35.0021     17.8380
+      7.8512   1515.4743     35.0102     17.8430
+      8.0686   1515.4957     35.0103     17.8490
+      8.2543   1515.5126     35.0122     17.8530
+      8.4718   1515.5301     35.0167     17.8560
+      8.7201   1515.5502     35.0229     17.8590
+      8.9375   1515.5699     35.0318     17.8610
+      9.1858   1515.5860     35.0372     17.8630
+      9.4648   1515.6006     35.0434     17.8640
+      9.7131   1515.6147     35.0495     17.8650
+      9.8998   1515.6258     35.0540     17.8660
+     10.1163   1515.6394     35.0602     17.8670
+     10.3645   1515.6535     35.0638     17.8690
+     10.5512   1515.6646     35.0681     17.8700
+     10.7369   1515.6776     35.0717     17.8720
+     10.9236   1515.6886     35.0735     17.8740
+     11.1093   1515.6956     35.0743     17.8750
+     11.2960   1515.7026     35.0752     17.8760
+     11.4817   1515.7117     35.0779     17.8770
+     11.6684   1515.7207     35.0805     17.8780
+     11.8859   1515.7303     35.0831     17.8790
+     12.1023   1515.7419     35.0876     17.8800
+     12.3198   1515.7494     35.0858     17.8820
+     12.5373   1515.7568     35.0840     17.8840
+     12.7548   1515.7644     35.0874     17.8840
+     12.9712   1515.7860     35.0981     17.8860
+     13.1887   1515.7993     35.0937     17.8910
+     13.4062   1515.8068     35.0919     17.8930
+     13.6236   1515.8143     35.0928     17.8940
+     13.8093   1515.8234     35.0980     17.8940
+     13.9335   1515.8395     35.1078     17.8950
+     14.0268   1515.8531     35.1158     17.8960
+     14.0576   1515.8712     35.1055     17.9060
@@ -0,0 +1,96 @@
+test_read_store_and_write
+18/7/2016
+20:53:53
+Probe: RapidSVT
+Source: /root/package/data/input/valeport/rapid_svt/V000007.TXT
+      0.0298   1478.1140      0.0000     21.1860
+      0.9930   1477.9140      0.0000     21.1860
+      1.6000   1477.6080     12.3581     14.1660
+      1.6417   1477.6140      6.2836     16.2450
+      1.9849   1477.6020      6.6437     16.1150
+      2.4839   1477.6190      4.2221     16.9620
+      2.9977   1477.6360      3.2112     17.3210
+      3.4768   1477.6360      6.0837     16.3120
+      3.9916   1477.6240      7.0038     15.9870
+      4.4926   1477.6450      6.2500     16.2520
+      4.9677   1477.6430      6.3309     16.2210
+      5.4587   1477.6290      6.2164     16.2540
+      5.9577   1477.6650      6.2347     16.2560
+      6.4527   1477.6510      6.2416     16.2470
+      6.9605   1477.1310      5.7961     16.2430
+      7.4724   1476.1800      5.0201     16.2250
+      7.9644   1475.3420      4.3259     16.2130
+      8.4603   1475.3060      4.6432     16.0900
+      8.9305   1475.2900      4.8195     16.0220
+      9.4255   1475.3090      5.1537     15.9100
+      9.9264   1475.2640      5.3658     15.8210
+     10.4233   1475.2410      5.5634     15.7440
+     10.9183   1475.1800      5.7449     15.6610
+     11.4202   1474.8140      5.6450     15.5850
+     11.9092   1470.7430      2.3933     15.5050
+     12.4111   1460.8200      0.0000     15.2130
+     12.8962   1458.0010      0.0000     15.0270
+     13.4209   1454.7050      0.0000     14.1770
+     13.8901   1451.3290      0.0000     13.6600
+     14.3840   1448.0350      0.0000     12.6550
+     14.8869   1440.1240      0.0000     11.8950
+     15.3819   1437.0850      0.0000     10.5530
+     15.8759   1434.3870      0.0000      9.5020
+     16.3738   1434.4110      0.0000      8.4140
+     16.8628   1433.3920      0.0000      7.3450
+     17.3845   1431.7190      0.0000      6.8130
+     17.8815   1431.6620      0.5600      6.0120
+     18.3576   1430.6530      1.1978      5.5920
+     18.8505   1430.8480      3.4409      4.9810
+     19.3445   1430.7040      3.6690      4.8810
+     19.8464   1430.7910      4.9652      4.5250
+     20.3413   1430.6830      4.8752      4.5250
+     20.8323   1430.6390      5.4550      4.3470
+     21.3342   1430.6410      5.4817      4.3380
+     21.8232   1430.6760      5.8273      4.2450
+     22.3181   1430.6180      5.7655      4.2480
+     22.8259   1430.5480      5.8655      4.2020
+     23.3645   1430.3730      5.5977      4.2380
+     23.8079   1430.0920      5.3879      4.2340
+     24.3097   1430.0510      5.4893      4.1940
+     24.8057   1430.1020      5.6038      4.1710
+     25.3780   1430.0920      5.6725      4.1470
+     25.7916   1430.0220      5.6938      4.1240
+     26.2964   1429.9240      5.7236      4.0920
+     26.7864   1429.9170      5.8098      4.0640
+     27.2813   1429.8680      5.8922      4.0280
+     27.7911   1429.7760      5.9227      3.9970
+     28.2870   1429.7540      5.9280      3.9890
+     28.7750   1429.7470      5.9830      3.9700
+     29.2868   1429.7340      6.0783      3.9380
+     29.7609   1429.7600      6.1844      3.9120
+     30.2578   1429.7860      6.2439      3.8990
+     30.7507   1429.8180      6.3293      3.8800
+     31.2506   1429.8070      6.3637      3.8660
+     31.7445   1429.8400      6.4430      3.8490
+     32.2394   1429.8900      6.4896      3.8450
+     32.7403   1429.8540      6.4903      3.8350
+     33.2392   1429.9330      6.5453      3.8350
+     33.7291   1430.0170      6.6223      3.8300
+     34.2280   1430.0190      6.6460      3.8220
+     34.7180   1430.0470      6.6826      3.8160
+     35.2188   1430.0550      6.6681      3.8200
+     35.7147   1430.1000      6.7009      3.8190
+     36.2096   1430.0900      6.6971      3.8160
+     36.7006   1430.1120      6.7154      3.8140
+     37.2510   1430.1890      6.8001      3.8050
+     37.6924   1430.2110      6.8291      3.8000
+     38.1942   1430.2080      6.8100      3.8030
+     38.6941   1430.2090      6.8115      3.8010
+     39.1880   1430.2240      6.8245      3.7990
+     39.6829   1430.2410      6.8382      3.7970
+     40.1778   1430.3170      6.9298      3.7860
+     40.6717   1430.3580      6.9801      3.7790
+     41.1765   1430.3460      6.9435      3.7850
+     41.6773   1430.3680      6.9542      3.7850
+     42.1613   1430.3740      6.9702      3.7800
+     42.6572   1430.3950      6.9908      3.7770
+     43.1491   1430.4310      7.0724      3.7600
+     43.6489   1430.4490      7.1159      3.7500
+     44.1498   1430.4420      7.0900      3.7540
+     44.6337   1430.4360      7.0900      3.7510
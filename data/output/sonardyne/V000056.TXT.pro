@@ -0,0 +1,218 @@
+test_read_store_and_write
+5/6/2013
+8:10:41
+Probe: MiniSVP
+Source: /root/package/data/input/valeport/mini_svp/V000056.TXT
+      0.1220   1522.5690     34.1263     20.7520
+      0.1490   1522.5710     34.7397     20.5020
+      0.2040   1522.5540     35.5072     20.1830
+      0.3010   1522.5320     36.4777     19.7810
+      0.4020   1522.4950     37.0049     19.5540
+      0.5030   1522.4830     37.4580     19.3660
+      0.6030   1522.4770     37.7960     19.2270
+      0.7090   1522.2730     37.7579     19.1690
+      0.8190   1522.2840     37.8708     19.1270
+      1.0180   1522.2780     37.9242     19.1020
+      1.2690   1522.2130     37.8906     19.0910
+      1.3330   1522.1540     37.8723     19.0770
+      1.4160   1522.1520     37.9044     19.0630
+      1.5060   1522.1430     37.9372     19.0460
+      1.6120   1522.1050     37.9494     19.0270
+      1.7090   1522.0980     37.9890     19.0080
+      1.8290   1522.0950     38.0241     18.9920
+      2.0310   1522.0920     38.0486     18.9800
+      2.2290   1522.0830     38.0577     18.9720
+      2.3070   1522.0860     38.0768     18.9650
+      2.4130   1522.0800     38.0875     18.9580
+      2.5090   1522.0750     38.0989     18.9510
+      2.6010   1522.0650     38.1035     18.9450
+      2.7150   1522.0700     38.1187     18.9400
+      2.8030   1522.0610     38.1294     18.9320
+      2.9060   1522.0620     38.1462     18.9250
+      3.0540   1522.0620     38.1615     18.9180
+      3.1460   1522.0600     38.1706     18.9130
+      3.3200   1522.0600     38.1729     18.9110
+      3.5410   1522.0580     38.1683     18.9110
+      3.6550   1522.0560     38.1699     18.9090
+      3.7350   1522.0560     38.1760     18.9060
+      3.9070   1522.0530     38.1760     18.9040
+      4.1300   1522.0530     38.1821     18.9000
+      4.2360   1522.0530     38.1882     18.8970
+      4.4150   1522.0540     38.1943     18.8940
+      4.6120   1522.0520     38.1973     18.8910
+      4.7180   1522.0540     38.2050     18.8880
+      4.9040   1522.0520     38.2050     18.8860
+      5.0650   1522.0550     38.2103     18.8840
+      5.2810   1522.0550     38.2118     18.8820
+      5.4760   1522.0590     38.2156     18.8810
+      5.6200   1522.0620     38.2210     18.8790
+      5.7460   1522.0630     38.2225     18.8780
+      5.9170   1522.0620     38.2217     18.8770
+      6.1710   1522.0640     38.2195     18.8770
+      6.3050   1522.0650     38.2210     18.8760
+      6.4370   1522.0700     38.2233     18.8760
+      6.6650   1522.0710     38.2233     18.8750
+      6.8290   1522.0710     38.2256     18.8730
+      7.0300   1522.0750     38.2286     18.8720
+      7.2830   1522.0730     38.2233     18.8720
+      7.3900   1522.0750     38.2263     18.8710
+      7.5040   1522.0700     38.2225     18.8700
+      7.7560   1522.0730     38.2263     18.8680
+      8.0400   1522.0710     38.2256     18.8660
+      8.1240   1522.0710     38.2294     18.8640
+      8.3010   1522.0740     38.2339     18.8620
+      8.5430   1522.0760     38.2347     18.8610
+      8.6990   1522.0830     38.2439     18.8590
+      8.9680   1522.0840     38.2431     18.8580
+      9.1330   1522.0870     38.2454     18.8570
+      9.3170   1522.0880     38.2462     18.8560
+      9.5320   1522.0850     38.2431     18.8550
+      9.6760   1522.0350     38.2019     18.8530
+      9.8670   1522.0300     38.2019     18.8500
+     10.0310   1521.9850     38.1721     18.8450
+     10.3020   1521.9620     38.1653     18.8380
+     10.4720   1521.9050     38.1325     18.8300
+     10.6470   1521.8820     38.1317     18.8210
+     10.9320   1521.8580     38.1340     18.8100
+     11.1880   1521.8310     38.1340     18.7990
+     11.2960   1521.8170     38.1500     18.7870
+     11.4570   1521.8090     38.1653     18.7770
+     11.6980   1521.7900     38.1676     18.7680
+     11.9930   1521.7830     38.1798     18.7590
+     12.1430   1521.7860     38.1973     18.7520
+     12.2490   1521.7820     38.2072     18.7460
+     12.4740   1521.7840     38.2210     18.7400
+     12.7300   1521.7880     38.2278     18.7370
+     12.8300   1521.7790     38.2263     18.7340
+     13.0780   1521.7650     38.2179     18.7310
+     13.3820   1521.7560     38.2103     18.7290
+     13.5130   1521.7530     38.2156     18.7250
+     13.7010   1521.7540     38.2217     18.7220
+     13.9410   1521.7510     38.2248     18.7180
+     14.0840   1521.7420     38.2225     18.7150
+     14.3640   1521.7420     38.2263     18.7120
+     14.5490   1521.7420     38.2309     18.7090
+     14.7470   1521.7400     38.2309     18.7070
+     15.0680   1521.7360     38.2301     18.7040
+     15.2050   1521.7380     38.2355     18.7020
+     15.4470   1521.7410     38.2416     18.6990
+     15.7100   1521.7430     38.2446     18.6970
+     15.8190   1521.7430     38.2477     18.6950
+     16.1280   1521.7470     38.2523     18.6930
+     16.4560   1521.7330     38.2370     18.6920
+     16.7110   1521.7150     38.2225     18.6900
+     16.8070   1521.6780     38.1989     18.6860
+     17.0390   1521.5760     38.1180     18.6810
+     17.3630   1521.4750     38.0463     18.6720
+     17.5180   1521.4050     38.0150     18.6590
+     17.7950   1521.3040     37.9669     18.6410
+     18.0920   1521.2040     37.9295     18.6190
+     18.2530   1521.1540     37.9433     18.5950
+     18.4950   1521.1090     37.9654     18.5690
+     18.7240   1521.0560     37.9776     18.5440
+     18.8710   1521.0060     37.9921     18.5200
+     19.1520   1520.9990     38.0394     18.4970
+     19.2400   1520.9610     38.0524     18.4780
+     19.4860   1520.9630     38.0936     18.4610
+     19.7890   1520.9490     38.1142     18.4460
+     19.8900   1520.9270     38.1241     18.4340
+     20.1570   1520.9260     38.1439     18.4240
+     20.4590   1520.9220     38.1584     18.4150
+     20.5480   1520.9130     38.1645     18.4090
+     20.7520   1520.9150     38.1805     18.4020
+     21.0570   1520.9010     38.1790     18.3960
+     21.2140   1520.8870     38.1775     18.3910
+     21.4070   1520.8870     38.1897     18.3850
+     21.6760   1520.8850     38.1966     18.3800
+     21.8170   1520.8490     38.1752     18.3750
+     22.0980   1520.7920     38.1310     18.3710
+     22.2530   1520.7020     38.0646     18.3650
+     22.5420   1520.6560     38.0402     18.3570
+     22.6680   1520.5530     37.9753     18.3460
+     22.8800   1520.4820     37.9524     18.3290
+     23.1920   1520.4430     37.9639     18.3090
+     23.4260   1520.4250     37.9974     18.2880
+     23.5450   1520.3150     37.9547     18.2660
+     23.7970   1520.2710     37.9631     18.2460
+     24.1250   1520.2210     37.9669     18.2250
+     24.3030   1520.2110     38.0035     18.2060
+     24.4340   1520.1780     38.0211     18.1870
+     24.7160   1520.1440     38.0325     18.1690
+     25.0160   1520.1430     38.0653     18.1540
+     25.1980   1520.1210     38.0783     18.1400
+     25.3640   1520.0650     38.0600     18.1270
+     25.6810   1520.0260     38.0539     18.1140
+     25.8680   1519.7400     37.8380     18.0990
+     26.0720   1519.4130     37.6007     18.0780
+     26.3100   1519.0550     37.3695     18.0440
+     26.4850   1518.7900     37.2589     17.9950
+     26.7830   1518.7610     37.3871     17.9330
+     26.9380   1518.6640     37.4702     17.8660
+     27.0950   1518.5540     37.5351     17.8020
+     27.3340   1518.5410     37.6633     17.7460
+     27.6080   1518.5000     37.7457     17.6980
+     27.7390   1518.4720     37.8212     17.6580
+     28.0160   1518.3940     37.8357     17.6240
+     28.3240   1518.3360     37.8548     17.5950
+     28.5830   1518.3050     37.8906     17.5690
+     28.6880   1518.2530     37.9051     17.5450
+     28.8470   1518.2400     37.9501     17.5220
+     29.1540   1518.1790     37.9486     17.5000
+     29.3640   1518.0150     37.8540     17.4800
+     29.4950   1517.8320     37.7457     17.4590
+     29.7100   1517.6510     37.6457     17.4350
+     29.8880   1517.2540     37.3787     17.4030
+     30.1970   1516.8410     37.1246     17.3600
+     30.3020   1516.6220     37.0834     17.3010
+     30.5740   1516.3430     37.0193     17.2300
+     30.9030   1516.1520     37.0598     17.1480
+     31.0450   1516.0100     37.1521     17.0640
+     31.2600   1515.8660     37.2253     16.9860
+     31.4200   1515.8210     37.3657     16.9160
+     31.6300   1515.6890     37.4031     16.8560
+     31.9080   1515.2800     37.1811     16.8030
+     32.0670   1515.1790     37.2238     16.7520
+     32.3300   1514.8490     37.0796     16.6960
+     32.4420   1514.8310     37.2215     16.6350
+     32.6550   1514.6650     37.2437     16.5700
+     33.0060   1514.3700     37.1529     16.5050
+     33.1290   1514.2040     37.1719     16.4420
+     33.3270   1514.0220     37.1742     16.3800
+     33.5310   1513.9520     37.2734     16.3180
+     33.7740   1513.8920     37.3726     16.2590
+     33.9740   1513.7920     37.4252     16.2050
+     34.1130   1513.5530     37.3451     16.1560
+     34.4330   1513.3190     37.2566     16.1110
+     34.7100   1513.1230     37.2101     16.0630
+     34.8640   1512.9180     37.1651     16.0120
+     35.1200   1512.7940     37.2025     15.9560
+     35.2730   1512.7460     37.3093     15.8990
+     35.4580   1512.7100     37.4130     15.8470
+     35.6370   1512.6850     37.5107     15.8010
+     35.8610   1512.6370     37.5664     15.7630
+     36.0980   1512.5660     37.5893     15.7300
+     36.2610   1512.4920     37.6022     15.7000
+     36.5200   1512.4260     37.6137     15.6730
+     36.6520   1512.3570     37.6236     15.6460
+     36.8470   1512.2870     37.6297     15.6200
+     37.1090   1512.1830     37.6030     15.5950
+     37.2640   1512.0620     37.5656     15.5690
+     37.4610   1511.9660     37.5496     15.5430
+     37.7030   1511.9420     37.5992     15.5150
+     37.8420   1511.8780     37.6167     15.4870
+     38.0860   1511.8280     37.6427     15.4600
+     38.2580   1511.8170     37.6968     15.4350
+     38.5040   1511.7710     37.7151     15.4120
+     38.7760   1511.7100     37.7151     15.3910
+     38.9250   1511.6550     37.7159     15.3720
+     39.0640   1511.6450     37.7563     15.3530
+     39.3520   1511.6250     37.7823     15.3350
+     39.4990   1511.6220     37.8204     15.3190
+     39.7430   1511.6190     37.8548     15.3040
+     39.9160   1511.6040     37.8708     15.2920
+     40.0610   1511.5690     37.8685     15.2810
+     40.2920   1511.5210     37.8479     15.2720
+     40.3890   1511.4730     37.8296     15.2630
+     40.4890   1511.3970     37.7815     15.2560
+     40.5620   1511.2860     37.7037     15.2490
+     40.6020   1511.2330     37.6793     15.2410
@@ -0,0 +1,2703 @@
+test_read_store_and_write
+6/7/1990
+8:0:0
+Probe: XBT
+Source: /root/package/data/input/unb/WOD_CTDO1014_3316204.unb
+      1.0000   1543.2080     33.7440     29.4690
+      3.0000   1543.5510     34.1370     29.4210
+      5.0000   1543.3930     34.1810     29.3090
+      7.0000   1543.4220     34.1920     29.3010
+      8.9000   1543.4410     34.2000     29.2910
+     10.9000   1543.4690     34.2040     29.2860
+     12.9000   1543.4900     34.2060     29.2790
+     14.9000   1543.5100     34.2090     29.2710
+     16.9000   1543.5360     34.2120     29.2660
+     18.9000   1543.5660     34.2140     29.2630
+     20.9000   1543.5960     34.2160     29.2600
+     22.9000   1543.6330     34.2190     29.2600
+     24.9000   1543.6660     34.2220     29.2580
+     26.8000   1543.7010     34.2230     29.2590
+     28.8000   1543.7340     34.2240     29.2580
+     30.8000   1543.7680     34.2260     29.2570
+     32.8000   1543.8270     34.2360     29.2640
+     34.8000   1543.9000     34.2610     29.2700
+     36.8000   1543.9070     34.2820     29.2470
+     38.8000   1543.8360     34.3180     29.1800
+     40.8000   1543.6950     34.3330     29.0910
+     42.8000   1543.5700     34.3280     29.0190
+     44.7000   1543.3110     34.3190     28.8880
+     46.7000   1542.9380     34.3080     28.7050
+     48.7000   1542.9430     34.3220     28.6850
+     50.7000   1542.8140     34.3320     28.6050
+     52.7000   1542.5840     34.3270     28.4860
+     54.7000   1542.4250     34.3200     28.4010
+     56.7000   1542.3030     34.3130     28.3330
+     58.7000   1542.1680     34.3110     28.2570
+     60.6000   1542.1570     34.3450     28.2210
+     62.6000   1541.2550     34.4190     27.7630
+     64.6000   1541.2100     34.4620     27.7070
+     66.6000   1541.1690     34.4800     27.6650
+     68.6000   1540.6400     34.5480     27.3820
+     70.6000   1540.3280     34.6420     27.1850
+     72.6000   1540.2210     34.6860     27.1020
+     74.6000   1540.0580     34.7240     26.9980
+     76.6000   1539.9520     34.7420     26.9280
+     78.5000   1539.8710     34.7560     26.8720
+     80.5000   1539.7290     34.7890     26.7800
+     82.5000   1539.6370     34.8110     26.7150
+     84.5000   1539.5520     34.8330     26.6530
+     86.5000   1539.5070     34.8470     26.6120
+     88.5000   1539.3960     34.8630     26.5420
+     90.5000   1538.9920     34.8860     26.3420
+     92.5000   1538.1940     34.9050     25.9770
+     94.4000   1537.8380     34.9070     25.8110
+     96.4000   1537.5470     34.9060     25.6740
+     98.4000   1536.9590     34.9150     25.4080
+    100.4000   1535.9250     34.9550     24.9450
+    102.4000   1534.2950     34.9830     24.2510
+    104.4000   1533.9080     34.9910     24.0770
+    106.4000   1533.7250     34.9900     23.9900
+    108.4000   1533.5630     34.9930     23.9100
+    110.3000   1533.0760     34.9950     23.7010
+    112.3000   1532.3820     35.0010     23.4090
+    114.3000   1531.6320     35.0470     23.0800
+    116.3000   1531.1100     35.0410     22.8650
+    118.3000   1530.8270     35.0490     22.7380
+    120.3000   1530.6510     35.0670     22.6490
+    122.3000   1530.3480     35.0780     22.5140
+    124.3000   1530.0180     35.0940     22.3670
+    126.2000   1529.7960     35.0850     22.2730
+    128.2000   1528.3610     35.0400     21.7320
+    130.2000   1527.5670     34.9880     21.4420
+    132.2000   1526.8130     34.9600     21.1590
+    134.2000   1526.1450     34.9330     20.9100
+    136.2000   1525.1880     34.9220     20.5500
+    138.2000   1524.9080     34.9130     20.4390
+    140.2000   1524.7300     34.9130     20.3620
+    142.1000   1524.6190     34.9100     20.3110
+    144.1000   1524.5190     34.9060     20.2640
+    146.1000   1523.7640     34.8910     19.9850
+    148.1000   1522.8070     34.8620     19.6410
+    150.1000   1522.6910     34.8560     19.5900
+    152.1000   1522.4390     34.8570     19.4880
+    154.1000   1522.1150     34.8490     19.3640
+    156.1000   1521.5590     34.8260     19.1650
+    158.0000   1519.1670     34.7920     18.3330
+    160.0000   1517.6150     34.7560     17.8040
+    162.0000   1517.4760     34.7390     17.7520
+    164.0000   1517.0820     34.7420     17.6060
+    166.0000   1516.6820     34.7340     17.4630
+    168.0000   1516.4850     34.7300     17.3870
+    170.0000   1515.4820     34.7300     17.0400
+    172.0000   1513.4340     34.7050     16.3620
+    173.9000   1512.4150     34.6560     16.0380
+    175.9000   1511.3260     34.6460     15.6790
+    177.9000   1510.0650     34.6250     15.2730
+    179.9000   1509.3550     34.6090     15.0430
+    181.9000   1508.7790     34.5870     14.8590
+    183.9000   1507.5690     34.5780     14.4730
+    185.9000   1507.1350     34.5600     14.3340
+    187.8000   1506.5630     34.5550     14.1490
+    189.8000   1505.8310     34.5530     13.9140
+    191.8000   1505.1860     34.5450     13.7090
+    193.8000   1504.4200     34.5380     13.4680
+    195.8000   1503.7510     34.5280     13.2590
+    197.8000   1503.6170     34.5180     13.2120
+    199.8000   1503.5880     34.5160     13.1940
+    201.8000   1503.5240     34.5150     13.1650
+    203.7000   1503.3160     34.5120     13.0940
+    205.7000   1503.0100     34.5040     12.9950
+    207.7000   1502.3160     34.4910     12.7820
+    209.7000   1501.6820     34.4780     12.5880
+    211.7000   1501.1800     34.4680     12.4330
+    213.7000   1500.6850     34.4540     12.2820
+    215.7000   1500.1290     34.4450     12.1120
+    217.6000   1499.7870     34.4360     12.0060
+    219.6000   1499.3960     34.4360     11.8820
+    221.6000   1499.1710     34.4470     11.8030
+    223.6000   1499.1480     34.4600     11.7820
+    225.6000   1498.6990     34.4690     11.6390
+    227.6000   1498.3910     34.4580     11.5440
+    229.6000   1498.1420     34.4570     11.4630
+    231.6000   1497.9820     34.4550     11.4080
+    233.5000   1497.9200     34.4550     11.3810
+    235.5000   1497.7880     34.4560     11.3330
+    237.5000   1497.4110     34.4630     11.2130
+    239.5000   1497.0850     34.4630     11.1100
+    241.5000   1496.8600     34.4670     11.0350
+    243.5000   1496.7350     34.4690     10.9890
+    245.5000   1496.7230     34.4670     10.9770
+    247.4000   1496.6950     34.4670     10.9600
+    249.4000   1496.4570     34.4750     10.8800
+    251.4000   1496.2030     34.4790     10.7970
+    253.4000   1495.9970     34.4830     10.7280
+    255.4000   1495.7870     34.4890     10.6570
+    257.4000   1495.6690     34.4960     10.6120
+    259.4000   1495.5510     34.5000     10.5680
+    261.3000   1495.4550     34.5030     10.5310
+    263.3000   1495.3830     34.5040     10.5010
+    265.3000   1495.2940     34.5060     10.4660
+    267.3000   1495.2190     34.5070     10.4350
+    269.3000   1495.1900     34.5060     10.4180
+    271.3000   1495.0870     34.5020     10.3810
+    273.3000   1494.8130     34.4960     10.2970
+    275.2000   1494.5060     34.4940     10.2030
+    277.2000   1494.2860     34.4950     10.1320
+    279.2000   1493.9990     34.4910     10.0440
+    281.2000   1493.9560     34.4940     10.0220
+    283.2000   1493.6780     34.5010      9.9330
+    285.2000   1493.5310     34.5040      9.8820
+    287.2000   1493.5680     34.5160      9.8790
+    289.2000   1493.6130     34.5260      9.8790
+    291.1000   1493.6050     34.5290      9.8670
+    293.1000   1493.5230     34.5290      9.8350
+    295.1000   1493.6950     34.5480      9.8670
+    297.1000   1493.6810     34.5630      9.8490
+    299.1000   1493.5530     34.5700      9.8020
+    301.1000   1493.4700     34.5720      9.7690
+    303.1000   1493.3850     34.5730      9.7360
+    305.0000   1493.2050     34.5780      9.6760
+    307.0000   1493.1900     34.5770      9.6630
+    309.0000   1493.2270     34.5830      9.6620
+    311.0000   1493.1510     34.5890      9.6300
+    313.0000   1493.0850     34.5880      9.6030
+    315.0000   1492.9850     34.5860      9.5670
+    317.0000   1492.9330     34.5850      9.5440
+    318.9000   1492.9230     34.5860      9.5320
+    320.9000   1492.9120     34.5860      9.5200
+    322.9000   1492.9250     34.5870      9.5140
+    324.9000   1492.9120     34.5880      9.5010
+    326.9000   1492.8600     34.5870      9.4780
+    328.9000   1492.8420     34.5870      9.4640
+    330.9000   1492.8380     34.5890      9.4530
+    332.8000   1492.8550     34.5890      9.4490
+    334.8000   1492.7450     34.5910      9.4090
+    336.8000   1492.6110     34.5920      9.3630
+    338.8000   1492.5420     34.5920      9.3350
+    340.8000   1492.4050     34.5940      9.2880
+    342.8000   1492.3790     34.5930      9.2720
+    344.7000   1492.1890     34.5980      9.2100
+    346.7000   1492.1140     34.5960      9.1810
+    348.7000   1492.1090     34.5950      9.1710
+    350.7000   1492.1030     34.5960      9.1600
+    352.7000   1492.0600     34.5970      9.1390
+    354.7000   1491.9590     34.5950      9.1030
+    356.7000   1492.0030     34.5950      9.1060
+    358.6000   1492.0300     34.5970      9.1040
+    360.6000   1491.9870     34.5980      9.0830
+    362.6000   1491.8930     34.5970      9.0490
+    364.6000   1491.8760     34.5950      9.0360
+    366.6000   1491.8160     34.5970      9.0100
+    368.6000   1491.7670     34.5960      8.9880
+    370.6000   1491.7510     34.5950      8.9750
+    372.5000   1491.7800     34.5960      8.9740
+    374.5000   1491.7810     34.5970      8.9650
+    376.5000   1491.6740     34.5970      8.9270
+    378.5000   1491.6090     34.5950      8.9010
+    380.5000   1491.5520     34.5940      8.8770
+    382.5000   1491.5090     34.5950      8.8560
+    384.5000   1491.4750     34.5950      8.8380
+    386.4000   1491.4770     34.5950      8.8300
+    388.4000   1491.4590     34.5950      8.8160
+    390.4000   1491.4550     34.5950      8.8060
+    392.4000   1491.4210     34.5950      8.7880
+    394.4000   1491.3980     34.5940      8.7730
+    396.4000   1491.3520     34.5930      8.7520
+    398.3000   1491.3330     34.5910      8.7390
+    400.3000   1491.3240     34.5900      8.7280
+    402.3000   1491.2800     34.5880      8.7080
+    404.3000   1491.1050     34.5850      8.6530
+    406.3000   1491.0180     34.5810      8.6220
+    408.3000   1490.9320     34.5780      8.5910
+    410.3000   1490.9070     34.5760      8.5760
+    412.2000   1490.7610     34.5740      8.5290
+    414.2000   1490.6820     34.5710      8.5000
+    416.2000   1490.6660     34.5700      8.4870
+    418.2000   1490.6850     34.5710      8.4830
+    420.2000   1490.7150     34.5710      8.4820
+    422.2000   1490.7440     34.5710      8.4810
+    424.1000   1490.7760     34.5710      8.4810
+    426.1000   1490.8100     34.5720      8.4810
+    428.1000   1490.8030     34.5760      8.4690
+    430.1000   1490.8220     34.5760      8.4650
+    432.1000   1490.8410     34.5770      8.4610
+    434.1000   1490.8430     34.5790      8.4520
+    436.1000   1490.8190     34.5810      8.4360
+    438.0000   1490.8390     34.5810      8.4330
+    440.0000   1490.8580     34.5810      8.4290
+    442.0000   1490.8560     34.5800      8.4200
+    444.0000   1490.7730     34.5800      8.3890
+    446.0000   1490.5850     34.5770      8.3310
+    448.0000   1490.5260     34.5750      8.3070
+    449.9000   1490.4740     34.5740      8.2850
+    451.9000   1490.3740     34.5730      8.2500
+    453.9000   1490.2780     34.5720      8.2160
+    455.9000   1490.2710     34.5700      8.2060
+    457.9000   1490.2920     34.5690      8.2030
+    459.9000   1490.2800     34.5690      8.1910
+    461.9000   1490.2220     34.5680      8.1670
+    463.8000   1490.1820     34.5680      8.1480
+    465.8000   1490.1890     34.5680      8.1410
+    467.8000   1490.1250     34.5690      8.1150
+    469.8000   1490.0690     34.5670      8.0920
+    471.8000   1490.0530     34.5670      8.0790
+    473.8000   1490.0630     34.5660      8.0730
+    475.7000   1490.0600     34.5660      8.0640
+    477.7000   1490.0430     34.5650      8.0510
+    479.7000   1490.0300     34.5640      8.0390
+    481.7000   1490.0050     34.5630      8.0240
+    483.7000   1489.9220     34.5610      7.9940
+    485.7000   1489.7780     34.5610      7.9470
+    487.6000   1489.6970     34.5620      7.9170
+    489.6000   1489.6990     34.5610      7.9090
+    491.6000   1489.7480     34.5620      7.9130
+    493.6000   1489.7790     34.5630      7.9120
+    495.6000   1489.8010     34.5630      7.9090
+    497.6000   1489.8080     34.5630      7.9020
+    499.5000   1489.7780     34.5630      7.8860
+    501.5000   1489.7470     34.5630      7.8690
+    503.5000   1489.7130     34.5640      7.8510
+    505.5000   1489.6610     34.5650      7.8280
+    507.5000   1489.6290     34.5650      7.8110
+    509.5000   1489.6130     34.5650      7.7980
+    511.5000   1489.5850     34.5650      7.7820
+    513.4000   1489.5550     34.5640      7.7660
+    515.4000   1489.4930     34.5640      7.7410
+    517.4000   1489.5050     34.5620      7.7360
+    519.4000   1489.5420     34.5620      7.7370
+    521.4000   1489.5690     34.5630      7.7350
+    523.4000   1489.5410     34.5630      7.7190
+    525.3000   1489.5220     34.5620      7.7060
+    527.3000   1489.5080     34.5610      7.6940
+    529.3000   1489.4660     34.5590      7.6750
+    531.3000   1489.3090     34.5560      7.6260
+    533.3000   1489.1370     34.5510      7.5740
+    535.3000   1488.9740     34.5470      7.5240
+    537.2000   1488.8910     34.5440      7.4950
+    539.2000   1488.8770     34.5430      7.4830
+    541.2000   1488.7980     34.5420      7.4540
+    543.2000   1488.7570     34.5410      7.4350
+    545.2000   1488.7420     34.5420      7.4220
+    547.2000   1488.6390     34.5410      7.3870
+    549.1000   1488.5860     34.5380      7.3660
+    551.1000   1488.5910     34.5370      7.3590
+    553.1000   1488.5890     34.5360      7.3500
+    555.1000   1488.5900     34.5350      7.3420
+    557.1000   1488.6000     34.5350      7.3360
+    559.1000   1488.6070     34.5350      7.3290
+    561.0000   1488.5860     34.5360      7.3150
+    563.0000   1488.6150     34.5390      7.3130
+    565.0000   1488.6570     34.5400      7.3150
+    567.0000   1488.6870     34.5400      7.3140
+    569.0000   1488.6220     34.5390      7.2890
+    571.0000   1488.4410     34.5370      7.2340
+    572.9000   1488.4340     34.5340      7.2250
+    574.9000   1488.4200     34.5330      7.2130
+    576.9000   1488.4190     34.5330      7.2040
+    578.9000   1488.4700     34.5350      7.2080
+    580.9000   1488.5660     34.5390      7.2230
+    582.9000   1488.5700     34.5400      7.2150
+    584.8000   1488.3980     34.5380      7.1630
+    586.8000   1488.3010     34.5330      7.1310
+    588.8000   1488.2640     34.5320      7.1130
+    590.8000   1488.2420     34.5310      7.0990
+    592.8000   1488.2160     34.5300      7.0840
+    594.8000   1488.1690     34.5310      7.0630
+    596.7000   1488.1630     34.5320      7.0530
+    598.7000   1488.1520     34.5310      7.0420
+    600.7000   1488.1740     34.5310      7.0390
+    602.7000   1488.2050     34.5320      7.0380
+    604.7000   1488.2280     34.5330      7.0350
+    606.7000   1488.2230     34.5340      7.0250
+    608.6000   1488.1830     34.5350      7.0060
+    610.6000   1488.1360     34.5360      6.9850
+    612.6000   1488.1330     34.5350      6.9760
+    614.6000   1488.1430     34.5350      6.9700
+    616.6000   1488.1450     34.5350      6.9620
+    618.5000   1488.1300     34.5350      6.9500
+    620.5000   1488.1050     34.5350      6.9350
+    622.5000   1488.1270     34.5350      6.9320
+    624.5000   1488.1440     34.5350      6.9280
+    626.5000   1488.1210     34.5360      6.9130
+    628.5000   1488.0630     34.5350      6.8900
+    630.4000   1488.0470     34.5340      6.8780
+    632.4000   1487.9340     34.5350      6.8400
+    634.4000   1487.8490     34.5340      6.8100
+    636.4000   1487.8420     34.5330      6.8000
+    638.4000   1487.8480     34.5330      6.7930
+    640.4000   1487.8020     34.5320      6.7730
+    642.3000   1487.7830     34.5320      6.7600
+    644.3000   1487.7460     34.5320      6.7420
+    646.3000   1487.7150     34.5310      6.7260
+    648.3000   1487.7080     34.5300      6.7160
+    650.3000   1487.6880     34.5310      6.7020
+    652.3000   1487.6390     34.5310      6.6810
+    654.2000   1487.6280     34.5310      6.6700
+    656.2000   1487.6260     34.5310      6.6610
+    658.2000   1487.6130     34.5310      6.6490
+    660.2000   1487.6070     34.5310      6.6390
+    662.2000   1487.5660     34.5310      6.6200
+    664.1000   1487.5230     34.5310      6.6010
+    666.1000   1487.4820     34.5310      6.5820
+    668.1000   1487.4640     34.5310      6.5690
+    670.1000   1487.4780     34.5310      6.5640
+    672.1000   1487.4910     34.5310      6.5590
+    674.1000   1487.5040     34.5300      6.5540
+    676.0000   1487.4690     34.5300      6.5370
+    678.0000   1487.4790     34.5300      6.5310
+    680.0000   1487.5170     34.5310      6.5320
+    682.0000   1487.6070     34.5350      6.5450
+    684.0000   1487.6550     34.5380      6.5480
+    686.0000   1487.6570     34.5380      6.5400
+    687.9000   1487.5410     34.5390      6.5020
+    689.9000   1487.4950     34.5380      6.4820
+    691.9000   1487.4950     34.5370      6.4740
+    693.9000   1487.5090     34.5370      6.4690
+    695.9000   1487.5230     34.5370      6.4640
+    697.8000   1487.5380     34.5370      6.4600
+    699.8000   1487.5140     34.5380      6.4450
+    701.8000   1487.4580     34.5390      6.4220
+    703.8000   1487.3920     34.5380      6.3970
+    705.8000   1487.3700     34.5380      6.3830
+    707.8000   1487.3560     34.5380      6.3710
+    709.7000   1487.3140     34.5390      6.3520
+    711.7000   1487.2280     34.5380      6.3220
+    713.7000   1487.1980     34.5380      6.3060
+    715.7000   1487.1640     34.5380      6.2890
+    717.7000   1487.1230     34.5380      6.2700
+    719.6000   1487.1030     34.5380      6.2570
+    721.6000   1487.1120     34.5380      6.2510
+    723.6000   1487.1220     34.5380      6.2450
+    725.6000   1487.1230     34.5370      6.2370
+    727.6000   1487.0790     34.5360      6.2180
+    729.6000   1487.0550     34.5340      6.2040
+    731.5000   1487.0620     34.5330      6.1980
+    733.5000   1487.0920     34.5340      6.1970
+    735.5000   1487.0950     34.5350      6.1890
+    737.5000   1487.0030     34.5330      6.1580
+    739.5000   1486.9510     34.5310      6.1370
+    741.4000   1486.9270     34.5310      6.1230
+    743.4000   1486.9180     34.5320      6.1120
+    745.4000   1486.8130     34.5290      6.0780
+    747.4000   1486.6910     34.5260      6.0400
+    749.4000   1486.6700     34.5240      6.0270
+    751.3000   1486.6280     34.5220      6.0090
+    753.3000   1486.6120     34.5210      5.9970
+    755.3000   1486.6250     34.5200      5.9920
+    757.3000   1486.6500     34.5200      5.9900
+    759.3000   1486.6790     34.5200      5.9890
+    761.3000   1486.7050     34.5200      5.9870
+    763.2000   1486.6850     34.5200      5.9740
+    765.2000   1486.6080     34.5180      5.9470
+    767.2000   1486.6160     34.5170      5.9410
+    769.2000   1486.6300     34.5170      5.9360
+    771.2000   1486.6510     34.5170      5.9330
+    773.1000   1486.6430     34.5200      5.9220
+    775.1000   1486.6020     34.5210      5.9030
+    777.1000   1486.5910     34.5210      5.8920
+    779.1000   1486.5770     34.5210      5.8800
+    781.1000   1486.5820     34.5210      5.8730
+    783.1000   1486.5850     34.5220      5.8650
+    785.0000   1486.5970     34.5220      5.8600
+    787.0000   1486.5980     34.5220      5.8520
+    789.0000   1486.6010     34.5230      5.8440
+    791.0000   1486.5990     34.5240      5.8350
+    793.0000   1486.5470     34.5260      5.8130
+    794.9000   1486.5070     34.5260      5.7950
+    796.9000   1486.4850     34.5260      5.7810
+    798.9000   1486.4770     34.5250      5.7710
+    800.9000   1486.4300     34.5250      5.7510
+    802.9000   1486.3770     34.5230      5.7300
+    804.8000   1486.3540     34.5210      5.7170
+    806.8000   1486.2780     34.5200      5.6900
+    808.8000   1486.1460     34.5190      5.6490
+    810.8000   1486.0870     34.5190      5.6260
+    812.8000   1486.0680     34.5190      5.6130
+    814.7000   1486.0590     34.5190      5.6030
+    816.7000   1486.0670     34.5180      5.5970
+    818.7000   1485.9650     34.5190      5.5630
+    820.7000   1485.9140     34.5190      5.5420
+    822.7000   1485.9240     34.5190      5.5360
+    824.7000   1485.9170     34.5190      5.5260
+    826.6000   1485.8960     34.5190      5.5130
+    828.6000   1485.8620     34.5200      5.4960
+    830.6000   1485.8590     34.5200      5.4870
+    832.6000   1485.8790     34.5190      5.4840
+    834.6000   1485.8390     34.5210      5.4650
+    836.5000   1485.8180     34.5210      5.4520
+    838.5000   1485.7670     34.5210      5.4310
+    840.5000   1485.7680     34.5210      5.4230
+    842.5000   1485.7580     34.5220      5.4120
+    844.5000   1485.7510     34.5220      5.4020
+    846.4000   1485.7430     34.5220      5.3920
+    848.4000   1485.7370     34.5230      5.3820
+    850.4000   1485.7380     34.5230      5.3740
+    852.4000   1485.7550     34.5230      5.3700
+    854.4000   1485.7730     34.5230      5.3660
+    856.3000   1485.7920     34.5230      5.3630
+    858.3000   1485.8180     34.5230      5.3610
+    860.3000   1485.8310     34.5230      5.3560
+    862.3000   1485.8440     34.5230      5.3510
+    864.3000   1485.8530     34.5230      5.3450
+    866.2000   1485.8280     34.5230      5.3310
+    868.2000   1485.8020     34.5240      5.3160
+    870.2000   1485.7260     34.5240      5.2890
+    872.2000   1485.6870     34.5240      5.2710
+    874.2000   1485.6600     34.5240      5.2560
+    876.1000   1485.6400     34.5250      5.2430
+    878.1000   1485.6450     34.5250      5.2360
+    880.1000   1485.6540     34.5250      5.2300
+    882.1000   1485.6370     34.5270      5.2170
+    884.1000   1485.6590     34.5270      5.2140
+    886.0000   1485.6580     34.5270      5.2060
+    888.0000   1485.6280     34.5280      5.1900
+    890.0000   1485.6310     34.5270      5.1830
+    892.0000   1485.6580     34.5280      5.1810
+    894.0000   1485.6590     34.5280      5.1730
+    895.9000   1485.6470     34.5290      5.1620
+    897.9000   1485.6520     34.5290      5.1550
+    899.9000   1485.6370     34.5290      5.1430
+    901.9000   1485.6420     34.5290      5.1360
+    903.9000   1485.6440     34.5300      5.1280
+    905.8000   1485.6230     34.5300      5.1150
+    907.8000   1485.6080     34.5300      5.1030
+    909.8000   1485.4810     34.5320      5.0630
+    911.8000   1485.4180     34.5300      5.0400
+    913.8000   1485.4340     34.5290      5.0360
+    915.7000   1485.4540     34.5290      5.0330
+    917.7000   1485.4670     34.5290      5.0280
+    919.7000   1485.4880     34.5290      5.0250
+    921.7000   1485.5010     34.5290      5.0200
+    923.7000   1485.4580     34.5300      5.0010
+    925.6000   1485.4200     34.5290      4.9840
+    927.6000   1485.4240     34.5290      4.9770
+    929.6000   1485.4060     34.5300      4.9640
+    931.6000   1485.4150     34.5300      4.9580
+    933.6000   1485.4170     34.5310      4.9500
+    935.5000   1485.4290     34.5310      4.9450
+    937.5000   1485.4590     34.5320      4.9440
+    939.5000   1485.4400     34.5320      4.9310
+    941.5000   1485.4440     34.5320      4.9240
+    943.5000   1485.4210     34.5320      4.9100
+    945.4000   1485.3610     34.5310      4.8880
+    947.4000   1485.3590     34.5320      4.8790
+    949.4000   1485.3760     34.5320      4.8750
+    951.4000   1485.4020     34.5320      4.8730
+    953.4000   1485.4020     34.5320      4.8650
+    955.3000   1485.4140     34.5320      4.8600
+    957.3000   1485.4010     34.5340      4.8480
+    959.3000   1485.3920     34.5360      4.8370
+    961.3000   1485.3490     34.5370      4.8180
+    963.3000   1485.3210     34.5370      4.8030
+    965.2000   1485.2910     34.5370      4.7880
+    967.2000   1485.2880     34.5370      4.7790
+    969.2000   1485.3020     34.5380      4.7740
+    971.2000   1485.3150     34.5380      4.7690
+    973.2000   1485.3250     34.5390      4.7630
+    975.1000   1485.3280     34.5390      4.7560
+    977.1000   1485.3370     34.5390      4.7500
+    979.1000   1485.3460     34.5390      4.7440
+    981.1000   1485.3460     34.5390      4.7360
+    983.1000   1485.3630     34.5390      4.7320
+    985.0000   1485.3670     34.5390      4.7250
+    987.0000   1485.3590     34.5390      4.7150
+    989.0000   1485.3640     34.5390      4.7080
+    991.0000   1485.3880     34.5380      4.7060
+    992.9000   1485.3950     34.5380      4.7000
+    994.9000   1485.3870     34.5380      4.6900
+    996.9000   1485.3840     34.5380      4.6810
+    998.9000   1485.3720     34.5380      4.6700
+   1000.9000   1485.0590     34.5390      4.6590
+   1002.8000   1485.0690     34.5380      4.6540
+   1004.8000   1485.0620     34.5390      4.6440
+   1006.8000   1485.0410     34.5390      4.6310
+   1008.8000   1485.0210     34.5390      4.6180
+   1010.8000   1485.0210     34.5390      4.6100
+   1012.7000   1485.0280     34.5390      4.6040
+   1014.7000   1485.0040     34.5400      4.5900
+   1016.7000   1484.9750     34.5400      4.5750
+   1018.7000   1484.9520     34.5410      4.5610
+   1020.7000   1484.9020     34.5410      4.5410
+   1022.6000   1484.8800     34.5410      4.5280
+   1024.6000   1484.8800     34.5410      4.5200
+   1026.6000   1484.9050     34.5410      4.5180
+   1028.6000   1484.9260     34.5410      4.5150
+   1030.5000   1484.9370     34.5410      4.5100
+   1032.5000   1484.9500     34.5420      4.5050
+   1034.5000   1484.9750     34.5420      4.5030
+   1036.5000   1484.9990     34.5410      4.5010
+   1038.5000   1485.0130     34.5420      4.4960
+   1040.4000   1484.9910     34.5430      4.4830
+   1042.4000   1484.9790     34.5430      4.4720
+   1044.4000   1484.9710     34.5430      4.4620
+   1046.4000   1484.9550     34.5440      4.4500
+   1048.4000   1484.9550     34.5440      4.4420
+   1050.3000   1484.9790     34.5440      4.4400
+   1052.3000   1484.9950     34.5440      4.4360
+   1054.3000   1484.9970     34.5450      4.4280
+   1056.3000   1484.9970     34.5450      4.4200
+   1058.3000   1485.0200     34.5440      4.4180
+   1060.2000   1485.0130     34.5460      4.4080
+   1062.2000   1485.0130     34.5460      4.4000
+   1064.2000   1484.9920     34.5460      4.3870
+   1066.2000   1484.9590     34.5460      4.3710
+   1068.1000   1484.9740     34.5460      4.3670
+   1070.1000   1484.9940     34.5460      4.3640
+   1072.1000   1485.0110     34.5460      4.3600
+   1074.1000   1485.0080     34.5470      4.3510
+   1076.1000   1484.9700     34.5470      4.3340
+   1078.0000   1484.9520     34.5470      4.3220
+   1080.0000   1484.9440     34.5470      4.3120
+   1082.0000   1484.9600     34.5470      4.3080
+   1084.0000   1484.9810     34.5470      4.3050
+   1085.9000   1484.9550     34.5480      4.2910
+   1087.9000   1484.9820     34.5490      4.2890
+   1089.9000   1484.9840     34.5510      4.2810
+   1091.9000   1484.9880     34.5510      4.2740
+   1093.9000   1484.9870     34.5500      4.2660
+   1095.8000   1484.9770     34.5500      4.2560
+   1097.8000   1484.9920     34.5490      4.2520
+   1099.8000   1484.9740     34.5480      4.2400
+   1101.8000   1484.9240     34.5480      4.2200
+   1103.8000   1484.9030     34.5480      4.2070
+   1105.7000   1484.9120     34.5500      4.2010
+   1107.7000   1484.8990     34.5500      4.1900
+   1109.7000   1484.8740     34.5500      4.1760
+   1111.7000   1484.9020     34.5490      4.1750
+   1113.6000   1484.9290     34.5490      4.1740
+   1115.6000   1484.8900     34.5510      4.1560
+   1117.6000   1484.8420     34.5500      4.1370
+   1119.6000   1484.8320     34.5490      4.1270
+   1121.6000   1484.8400     34.5490      4.1210
+   1123.5000   1484.8550     34.5490      4.1170
+   1125.5000   1484.8520     34.5500      4.1080
+   1127.5000   1484.8190     34.5500      4.0920
+   1129.5000   1484.8220     34.5500      4.0850
+   1131.4000   1484.8400     34.5490      4.0820
+   1133.4000   1484.8450     34.5500      4.0750
+   1135.4000   1484.8200     34.5500      4.0610
+   1137.4000   1484.7990     34.5500      4.0480
+   1139.4000   1484.8110     34.5500      4.0430
+   1141.3000   1484.7850     34.5510      4.0290
+   1143.3000   1484.7770     34.5510      4.0190
+   1145.3000   1484.7810     34.5510      4.0120
+   1147.3000   1484.7850     34.5510      4.0050
+   1149.2000   1484.7990     34.5510      4.0010
+   1151.2000   1484.8070     34.5510      3.9950
+   1153.2000   1484.8160     34.5510      3.9890
+   1155.2000   1484.8280     34.5510      3.9840
+   1157.2000   1484.8400     34.5510      3.9790
+   1159.1000   1484.8590     34.5510      3.9760
+   1161.1000   1484.8760     34.5510      3.9720
+   1163.1000   1484.8810     34.5520      3.9650
+   1165.1000   1484.8800     34.5520      3.9570
+   1167.0000   1484.8870     34.5520      3.9510
+   1169.0000   1484.8880     34.5530      3.9430
+   1171.0000   1484.8920     34.5530      3.9360
+   1173.0000   1484.8420     34.5540      3.9160
+   1175.0000   1484.7890     34.5550      3.8950
+   1176.9000   1484.8020     34.5540      3.8910
+   1178.9000   1484.8100     34.5540      3.8850
+   1180.9000   1484.8140     34.5540      3.8780
+   1182.9000   1484.8220     34.5540      3.8720
+   1184.8000   1484.8000     34.5550      3.8590
+   1186.8000   1484.8110     34.5540      3.8540
+   1188.8000   1484.8320     34.5540      3.8510
+   1190.8000   1484.8610     34.5540      3.8500
+   1192.8000   1484.8740     34.5550      3.8450
+   1194.7000   1484.8570     34.5560      3.8330
+   1196.7000   1484.8560     34.5560      3.8250
+   1198.7000   1484.8730     34.5560      3.8210
+   1200.7000   1484.8890     34.5560      3.8170
+   1202.6000   1484.9180     34.5570      3.8160
+   1204.6000   1484.9350     34.5570      3.8120
+   1206.6000   1484.9510     34.5570      3.8080
+   1208.6000   1484.9480     34.5580      3.7990
+   1210.5000   1484.9470     34.5590      3.7910
+   1212.5000   1484.9660     34.5610      3.7870
+   1214.5000   1484.9820     34.5610      3.7830
+   1216.5000   1485.0070     34.5610      3.7810
+   1218.5000   1485.0210     34.5620      3.7760
+   1220.4000   1484.9870     34.5640      3.7600
+   1222.4000   1484.9420     34.5650      3.7410
+   1224.4000   1484.9040     34.5650      3.7240
+   1226.4000   1484.8900     34.5650      3.7130
+   1228.3000   1484.8970     34.5650      3.7070
+   1230.3000   1484.9240     34.5640      3.7060
+   1232.3000   1484.9580     34.5640      3.7060
+   1234.3000   1484.9840     34.5650      3.7040
+   1236.2000   1485.0110     34.5650      3.7030
+   1238.2000   1485.0360     34.5650      3.7010
+   1240.2000   1485.0610     34.5650      3.6990
+   1242.2000   1485.0790     34.5660      3.6950
+   1244.2000   1485.1080     34.5660      3.6940
+   1246.1000   1485.1030     34.5670      3.6850
+   1248.1000   1485.0810     34.5670      3.6720
+   1250.1000   1485.0780     34.5680      3.6630
+   1252.1000   1485.0940     34.5680      3.6590
+   1254.0000   1485.1090     34.5680      3.6550
+   1256.0000   1485.1380     34.5680      3.6540
+   1258.0000   1485.1630     34.5680      3.6520
+   1260.0000   1485.1710     34.5680      3.6460
+   1261.9000   1485.1860     34.5680      3.6420
+   1263.9000   1485.1910     34.5690      3.6350
+   1265.9000   1485.1900     34.5690      3.6270
+   1267.9000   1485.2070     34.5690      3.6230
+   1269.9000   1485.2030     34.5700      3.6140
+   1271.8000   1485.1930     34.5700      3.6040
+   1273.8000   1485.1920     34.5700      3.5960
+   1275.8000   1485.2040     34.5700      3.5910
+   1277.8000   1485.2380     34.5700      3.5910
+   1279.7000   1485.2650     34.5700      3.5900
+   1281.7000   1485.2530     34.5710      3.5790
+   1283.7000   1485.2610     34.5710      3.5730
+   1285.7000   1485.2690     34.5710      3.5670
+   1287.6000   1485.2600     34.5720      3.5570
+   1289.6000   1485.2760     34.5720      3.5530
+   1291.6000   1485.2510     34.5730      3.5390
+   1293.6000   1485.2210     34.5730      3.5240
+   1295.5000   1485.2300     34.5720      3.5190
+   1297.5000   1485.2610     34.5730      3.5180
+   1299.5000   1485.2900     34.5730      3.5170
+   1301.5000   1485.3020     34.5730      3.5120
+   1303.4000   1485.3290     34.5730      3.5110
+   1305.4000   1485.3540     34.5730      3.5090
+   1307.4000   1485.3790     34.5730      3.5070
+   1309.4000   1485.3760     34.5740      3.4980
+   1311.4000   1485.3540     34.5740      3.4850
+   1313.3000   1485.3550     34.5730      3.4780
+   1315.3000   1485.3710     34.5730      3.4740
+   1317.3000   1485.3830     34.5730      3.4690
+   1319.3000   1485.3780     34.5730      3.4600
+   1321.2000   1485.3730     34.5740      3.4510
+   1323.2000   1485.3600     34.5740      3.4400
+   1325.2000   1485.3720     34.5740      3.4350
+   1327.2000   1485.3940     34.5750      3.4320
+   1329.1000   1485.3830     34.5750      3.4220
+   1331.1000   1485.3510     34.5770      3.4060
+   1333.1000   1485.3750     34.5760      3.4040
+   1335.1000   1485.3540     34.5770      3.3910
+   1337.0000   1485.3470     34.5770      3.3820
+   1339.0000   1485.3310     34.5780      3.3700
+   1341.0000   1485.2810     34.5790      3.3500
+   1343.0000   1485.2960     34.5780      3.3460
+   1344.9000   1485.3060     34.5780      3.3410
+   1346.9000   1485.3070     34.5790      3.3330
+   1348.9000   1485.2930     34.5790      3.3220
+   1350.9000   1485.3010     34.5790      3.3160
+   1352.8000   1485.2990     34.5790      3.3080
+   1354.8000   1485.2870     34.5800      3.2970
+   1356.8000   1485.3030     34.5800      3.2930
+   1358.8000   1485.3260     34.5790      3.2910
+   1360.8000   1485.3480     34.5800      3.2880
+   1362.7000   1485.3630     34.5800      3.2840
+   1364.7000   1485.3580     34.5800      3.2750
+   1366.7000   1485.3660     34.5800      3.2690
+   1368.7000   1485.3670     34.5810      3.2610
+   1370.6000   1485.3600     34.5810      3.2520
+   1372.6000   1485.3590     34.5810      3.2440
+   1374.6000   1485.3580     34.5810      3.2360
+   1376.6000   1485.3620     34.5810      3.2290
+   1378.5000   1485.3270     34.5820      3.2130
+   1380.5000   1485.3130     34.5820      3.2020
+   1382.5000   1485.3340     34.5820      3.1990
+   1384.5000   1485.3590     34.5820      3.1970
+   1386.4000   1485.3820     34.5820      3.1950
+   1388.4000   1485.4110     34.5820      3.1940
+   1390.4000   1485.4360     34.5820      3.1920
+   1392.4000   1485.4410     34.5830      3.1850
+   1394.3000   1485.4510     34.5830      3.1800
+   1396.3000   1485.4720     34.5830      3.1770
+   1398.3000   1485.4710     34.5830      3.1690
+   1400.3000   1485.4870     34.5830      3.1650
+   1402.2000   1485.4990     34.5840      3.1600
+   1404.2000   1485.5200     34.5840      3.1570
+   1406.2000   1485.5190     34.5840      3.1490
+   1408.2000   1485.5220     34.5840      3.1420
+   1410.1000   1485.5210     34.5850      3.1340
+   1412.1000   1485.5160     34.5850      3.1250
+   1414.1000   1485.5240     34.5850      3.1190
+   1416.1000   1485.5240     34.5860      3.1110
+   1418.0000   1485.5300     34.5860      3.1050
+   1420.0000   1485.5380     34.5860      3.0990
+   1422.0000   1485.5470     34.5870      3.0930
+   1424.0000   1485.5670     34.5860      3.0900
+   1425.9000   1485.5900     34.5860      3.0880
+   1427.9000   1485.6150     34.5860      3.0860
+   1429.9000   1485.6370     34.5870      3.0830
+   1431.9000   1485.6620     34.5870      3.0810
+   1433.8000   1485.6630     34.5870      3.0740
+   1435.8000   1485.6710     34.5870      3.0680
+   1437.8000   1485.6760     34.5880      3.0610
+   1439.8000   1485.6680     34.5890      3.0510
+   1441.7000   1485.6610     34.5890      3.0420
+   1443.7000   1485.6900     34.5890      3.0410
+   1445.7000   1485.7190     34.5890      3.0400
+   1447.7000   1485.7440     34.5890      3.0380
+   1449.6000   1485.7760     34.5890      3.0380
+   1451.6000   1485.7890     34.5900      3.0330
+   1453.6000   1485.7970     34.5900      3.0270
+   1455.6000   1485.8130     34.5900      3.0230
+   1457.5000   1485.8400     34.5890      3.0220
+   1459.5000   1485.8530     34.5900      3.0170
+   1461.5000   1485.8740     34.5900      3.0140
+   1463.5000   1485.8940     34.5900      3.0110
+   1465.4000   1485.9140     34.5910      3.0080
+   1467.4000   1485.9380     34.5900      3.0060
+   1469.4000   1485.9600     34.5910      3.0030
+   1471.4000   1485.9720     34.5910      2.9980
+   1473.3000   1485.9950     34.5910      2.9960
+   1475.3000   1486.0200     34.5910      2.9940
+   1477.3000   1486.0410     34.5910      2.9910
+   1479.3000   1486.0660     34.5910      2.9890
+   1481.2000   1486.0930     34.5910      2.9880
+   1483.2000   1486.1020     34.5920      2.9820
+   1485.2000   1486.0800     34.5920      2.9690
+   1487.2000   1486.0920     34.5920      2.9640
+   1489.1000   1486.1070     34.5920      2.9600
+   1491.1000   1486.1070     34.5930      2.9520
+   1493.1000   1486.0890     34.5930      2.9400
+   1495.1000   1486.0940     34.5940      2.9330
+   1497.0000   1486.0960     34.5940      2.9260
+   1499.0000   1486.1120     34.5940      2.9220
+   1501.0000   1486.1150     34.5940      2.9150
+   1503.0000   1486.1400     34.5940      2.9130
+   1504.9000   1486.1680     34.5940      2.9120
+   1506.9000   1486.1880     34.5940      2.9090
+   1508.9000   1486.2220     34.5940      2.9090
+   1510.9000   1486.2510     34.5940      2.9080
+   1512.8000   1486.2790     34.5940      2.9070
+   1514.8000   1486.3080     34.5940      2.9060
+   1516.8000   1486.3290     34.5940      2.9030
+   1518.8000   1486.3580     34.5940      2.9020
+   1520.7000   1486.3850     34.5940      2.9010
+   1522.7000   1486.4100     34.5940      2.8990
+   1524.7000   1486.4240     34.5950      2.8940
+   1526.6000   1486.4430     34.5950      2.8910
+   1528.6000   1486.4670     34.5950      2.8890
+   1530.6000   1486.4970     34.5950      2.8880
+   1532.6000   1486.5220     34.5950      2.8860
+   1534.5000   1486.5490     34.5950      2.8850
+   1536.5000   1486.5740     34.5950      2.8830
+   1538.5000   1486.5700     34.5960      2.8740
+   1540.5000   1486.5820     34.5960      2.8690
+   1542.4000   1486.6010     34.5960      2.8660
+   1544.4000   1486.6260     34.5960      2.8640
+   1546.4000   1486.6340     34.5960      2.8580
+   1548.4000   1486.6260     34.5970      2.8480
+   1550.3000   1486.6150     34.5970      2.8380
+   1552.3000   1486.6180     34.5970      2.8310
+   1554.3000   1486.6340     34.5970      2.8270
+   1556.3000   1486.6460     34.5970      2.8220
+   1558.2000   1486.6450     34.5980      2.8140
+   1560.2000   1486.6530     34.5980      2.8080
+   1562.2000   1486.6650     34.5980      2.8030
+   1564.2000   1486.6900     34.5980      2.8010
+   1566.1000   1486.7130     34.5980      2.7990
+   1568.1000   1486.7090     34.5990      2.7900
+   1570.1000   1486.7120     34.5990      2.7830
+   1572.0000   1486.7310     34.5990      2.7800
+   1574.0000   1486.7610     34.5990      2.7790
+   1576.0000   1486.7860     34.5990      2.7770
+   1578.0000   1486.8060     34.5990      2.7740
+   1579.9000   1486.8220     34.6000      2.7700
+   1581.9000   1486.8410     34.5990      2.7670
+   1583.9000   1486.8720     34.6000      2.7660
+   1585.9000   1486.8930     34.6000      2.7630
+   1587.8000   1486.9160     34.6000      2.7610
+   1589.8000   1486.9320     34.6000      2.7570
+   1591.8000   1486.9530     34.6000      2.7540
+   1593.8000   1486.9740     34.6000      2.7510
+   1595.7000   1486.9810     34.6010      2.7450
+   1597.7000   1486.9810     34.6020      2.7370
+   1599.7000   1486.9930     34.6020      2.7320
+   1601.7000   1487.0180     34.6020      2.7300
+   1603.6000   1487.0330     34.6020      2.7260
+   1605.6000   1487.0360     34.6020      2.7190
+   1607.6000   1487.0480     34.6020      2.7140
+   1609.5000   1487.0690     34.6030      2.7110
+   1611.5000   1487.0920     34.6020      2.7090
+   1613.5000   1487.1140     34.6030      2.7060
+   1615.5000   1487.1430     34.6030      2.7050
+   1617.4000   1487.1670     34.6030      2.7030
+   1619.4000   1487.1870     34.6030      2.7000
+   1621.4000   1487.2120     34.6030      2.6980
+   1623.4000   1487.2300     34.6040      2.6940
+   1625.3000   1487.2560     34.6030      2.6930
+   1627.3000   1487.2740     34.6040      2.6890
+   1629.3000   1487.2830     34.6050      2.6830
+   1631.3000   1487.3040     34.6050      2.6800
+   1633.2000   1487.3270     34.6050      2.6780
+   1635.2000   1487.3560     34.6050      2.6770
+   1637.2000   1487.3900     34.6050      2.6770
+   1639.1000   1487.4170     34.6050      2.6760
+   1641.1000   1487.4470     34.6050      2.6750
+   1643.1000   1487.4720     34.6050      2.6730
+   1645.1000   1487.4920     34.6050      2.6700
+   1647.0000   1487.5030     34.6050      2.6650
+   1649.0000   1487.5120     34.6060      2.6590
+   1651.0000   1487.5190     34.6060      2.6530
+   1653.0000   1487.5360     34.6060      2.6490
+   1654.9000   1487.5550     34.6060      2.6460
+   1656.9000   1487.5750     34.6060      2.6430
+   1658.9000   1487.5930     34.6070      2.6390
+   1660.8000   1487.6030     34.6070      2.6340
+   1662.8000   1487.6200     34.6070      2.6300
+   1664.8000   1487.6270     34.6070      2.6240
+   1666.8000   1487.6480     34.6070      2.6210
+   1668.7000   1487.6580     34.6070      2.6160
+   1670.7000   1487.6850     34.6080      2.6140
+   1672.7000   1487.7100     34.6080      2.6120
+   1674.7000   1487.7390     34.6080      2.6110
+   1676.6000   1487.7620     34.6080      2.6090
+   1678.6000   1487.7870     34.6080      2.6070
+   1680.6000   1487.8080     34.6080      2.6040
+   1682.5000   1487.8310     34.6080      2.6020
+   1684.5000   1487.8430     34.6080      2.5970
+   1686.5000   1487.8510     34.6080      2.5910
+   1688.5000   1487.8760     34.6080      2.5890
+   1690.4000   1487.9050     34.6090      2.5880
+   1692.4000   1487.9370     34.6080      2.5880
+   1694.4000   1487.9670     34.6080      2.5870
+   1696.4000   1487.9960     34.6080      2.5860
+   1698.3000   1488.0160     34.6090      2.5830
+   1700.3000   1488.0280     34.6090      2.5780
+   1702.3000   1488.0450     34.6090      2.5740
+   1704.2000   1488.0590     34.6090      2.5700
+   1706.2000   1488.0840     34.6090      2.5680
+   1708.2000   1488.1110     34.6100      2.5660
+   1710.2000   1488.1400     34.6100      2.5650
+   1712.1000   1488.1330     34.6100      2.5560
+   1714.1000   1488.1450     34.6100      2.5510
+   1716.1000   1488.1700     34.6100      2.5490
+   1718.1000   1488.2000     34.6100      2.5480
+   1720.0000   1488.2230     34.6100      2.5460
+   1722.0000   1488.2540     34.6110      2.5450
+   1724.0000   1488.2660     34.6110      2.5400
+   1725.9000   1488.2850     34.6110      2.5370
+   1727.9000   1488.3050     34.6110      2.5340
+   1729.9000   1488.3300     34.6110      2.5320
+   1731.9000   1488.3510     34.6110      2.5290
+   1733.8000   1488.3740     34.6110      2.5270
+   1735.8000   1488.4010     34.6120      2.5250
+   1737.8000   1488.4290     34.6110      2.5240
+   1739.7000   1488.4490     34.6120      2.5210
+   1741.7000   1488.4740     34.6120      2.5190
+   1743.7000   1488.4900     34.6120      2.5150
+   1745.7000   1488.5070     34.6120      2.5110
+   1747.6000   1488.5230     34.6130      2.5070
+   1749.6000   1488.5390     34.6130      2.5030
+   1751.6000   1488.5640     34.6130      2.5010
+   1753.6000   1488.5810     34.6130      2.4970
+   1755.5000   1488.6080     34.6130      2.4960
+   1757.5000   1488.6330     34.6130      2.4940
+   1759.5000   1488.6670     34.6130      2.4940
+   1761.4000   1488.6950     34.6130      2.4930
+   1763.4000   1488.7150     34.6130      2.4900
+   1765.4000   1488.7330     34.6140      2.4860
+   1767.4000   1488.7630     34.6140      2.4850
+   1769.3000   1488.7820     34.6140      2.4820
+   1771.3000   1488.8020     34.6140      2.4790
+   1773.3000   1488.8320     34.6140      2.4780
+   1775.2000   1488.8590     34.6140      2.4770
+   1777.2000   1488.8680     34.6150      2.4710
+   1779.2000   1488.8800     34.6150      2.4660
+   1781.2000   1488.8970     34.6150      2.4620
+   1783.1000   1488.9160     34.6150      2.4590
+   1785.1000   1488.9200     34.6160      2.4520
+   1787.1000   1488.9280     34.6160      2.4460
+   1789.0000   1488.9520     34.6160      2.4440
+   1791.0000   1488.9810     34.6160      2.4430
+   1793.0000   1489.0020     34.6160      2.4400
+   1795.0000   1489.0350     34.6160      2.4400
+   1796.9000   1489.0630     34.6160      2.4390
+   1798.9000   1489.0880     34.6160      2.4370
+   1800.9000   1489.1130     34.6160      2.4350
+   1802.8000   1489.1370     34.6160      2.4330
+   1804.8000   1489.1620     34.6160      2.4310
+   1806.8000   1489.1870     34.6160      2.4290
+   1808.8000   1489.2090     34.6170      2.4260
+   1810.7000   1489.2240     34.6170      2.4220
+   1812.7000   1489.2440     34.6170      2.4190
+   1814.7000   1489.2690     34.6170      2.4170
+   1816.6000   1489.2930     34.6170      2.4150
+   1818.6000   1489.3180     34.6170      2.4130
+   1820.6000   1489.3360     34.6180      2.4090
+   1822.6000   1489.3560     34.6180      2.4060
+   1824.5000   1489.3750     34.6180      2.4030
+   1826.5000   1489.3920     34.6180      2.3990
+   1828.5000   1489.4120     34.6180      2.3960
+   1830.4000   1489.4200     34.6190      2.3900
+   1832.4000   1489.4300     34.6180      2.3850
+   1834.4000   1489.4530     34.6190      2.3820
+   1836.4000   1489.4820     34.6190      2.3810
+   1838.3000   1489.5130     34.6180      2.3810
+   1840.3000   1489.5390     34.6190      2.3790
+   1842.3000   1489.5560     34.6190      2.3750
+   1844.2000   1489.5700     34.6190      2.3710
+   1846.2000   1489.5660     34.6200      2.3620
+   1848.2000   1489.5830     34.6200      2.3580
+   1850.2000   1489.5990     34.6200      2.3540
+   1852.1000   1489.6090     34.6200      2.3490
+   1854.1000   1489.6390     34.6200      2.3480
+   1856.1000   1489.6730     34.6200      2.3480
+   1858.0000   1489.6930     34.6210      2.3450
+   1860.0000   1489.6960     34.6210      2.3380
+   1862.0000   1489.7080     34.6210      2.3330
+   1864.0000   1489.7350     34.6220      2.3310
+   1865.9000   1489.7520     34.6210      2.3280
+   1867.9000   1489.7780     34.6210      2.3260
+   1869.9000   1489.8030     34.6210      2.3240
+   1871.8000   1489.8260     34.6210      2.3220
+   1873.8000   1489.8530     34.6220      2.3200
+   1875.8000   1489.8780     34.6220      2.3180
+   1877.8000   1489.8980     34.6220      2.3150
+   1879.7000   1489.9170     34.6220      2.3120
+   1881.7000   1489.9470     34.6220      2.3110
+   1883.7000   1489.9760     34.6220      2.3100
+   1885.6000   1490.0060     34.6230      2.3090
+   1887.6000   1490.0350     34.6230      2.3080
+   1889.6000   1490.0630     34.6220      2.3070
+   1891.6000   1490.0630     34.6230      2.2990
+   1893.5000   1490.0780     34.6230      2.2950
+   1895.5000   1490.0950     34.6230      2.2910
+   1897.5000   1490.1150     34.6230      2.2880
+   1899.4000   1490.1430     34.6230      2.2870
+   1901.4000   1490.1650     34.6240      2.2840
+   1903.4000   1490.1860     34.6240      2.2810
+   1905.3000   1490.2090     34.6240      2.2790
+   1907.3000   1490.2350     34.6240      2.2770
+   1909.3000   1490.2640     34.6240      2.2760
+   1911.3000   1490.2980     34.6240      2.2760
+   1913.2000   1490.3260     34.6240      2.2750
+   1915.2000   1490.3510     34.6240      2.2730
+   1917.2000   1490.3760     34.6240      2.2710
+   1919.1000   1490.3960     34.6250      2.2680
+   1921.1000   1490.4250     34.6240      2.2670
+   1923.1000   1490.4540     34.6240      2.2660
+   1925.1000   1490.4840     34.6240      2.2650
+   1927.0000   1490.5130     34.6250      2.2640
+   1929.0000   1490.5470     34.6250      2.2640
+   1931.0000   1490.5670     34.6250      2.2610
+   1932.9000   1490.5790     34.6260      2.2560
+   1934.9000   1490.6040     34.6260      2.2540
+   1936.9000   1490.6290     34.6260      2.2520
+   1938.8000   1490.6570     34.6260      2.2510
+   1940.8000   1490.6820     34.6260      2.2490
+   1942.8000   1490.7030     34.6260      2.2460
+   1944.8000   1490.7150     34.6260      2.2410
+   1946.7000   1490.7310     34.6270      2.2370
+   1948.7000   1490.7430     34.6270      2.2320
+   1950.7000   1490.7510     34.6270      2.2260
+   1952.6000   1490.7740     34.6270      2.2240
+   1954.6000   1490.7960     34.6280      2.2210
+   1956.6000   1490.8170     34.6280      2.2180
+   1958.5000   1490.8450     34.6280      2.2170
+   1960.5000   1490.8690     34.6270      2.2150
+   1962.5000   1490.8950     34.6280      2.2130
+   1964.5000   1490.9120     34.6280      2.2090
+   1966.4000   1490.9350     34.6280      2.2070
+   1968.4000   1490.9690     34.6280      2.2070
+   1970.4000   1490.9990     34.6280      2.2060
+   1972.3000   1491.0310     34.6280      2.2060
+   1974.3000   1491.0650     34.6280      2.2060
+   1976.3000   1491.0960     34.6290      2.2050
+   1978.2000   1491.1220     34.6280      2.2040
+   1980.2000   1491.1570     34.6290      2.2040
+   1982.2000   1491.1870     34.6290      2.2030
+   1984.2000   1491.2170     34.6290      2.2020
+   1986.1000   1491.2310     34.6290      2.1980
+   1988.1000   1491.2430     34.6290      2.1930
+   1990.1000   1491.2600     34.6290      2.1890
+   1992.0000   1491.2850     34.6300      2.1870
+   1994.0000   1491.3100     34.6300      2.1850
+   1996.0000   1491.3390     34.6300      2.1840
+   1997.9000   1491.3660     34.6290      2.1830
+   1999.9000   1491.3950     34.6290      2.1820
+   2001.9000   1491.4260     34.6300      2.1810
+   2003.9000   1491.4590     34.6290      2.1810
+   2005.8000   1491.4880     34.6300      2.1800
+   2007.8000   1491.5220     34.6300      2.1800
+   2009.8000   1491.5550     34.6290      2.1800
+   2011.7000   1491.5870     34.6290      2.1800
+   2013.7000   1491.6180     34.6300      2.1790
+   2015.7000   1491.6390     34.6300      2.1760
+   2017.6000   1491.6670     34.6300      2.1750
+   2019.6000   1491.6960     34.6300      2.1740
+   2021.6000   1491.7260     34.6300      2.1730
+   2023.6000   1491.7600     34.6300      2.1730
+   2025.5000   1491.7920     34.6300      2.1730
+   2027.5000   1491.8260     34.6300      2.1730
+   2029.5000   1491.8570     34.6310      2.1720
+   2031.4000   1491.8850     34.6310      2.1710
+   2033.4000   1491.9140     34.6310      2.1700
+   2035.4000   1491.9350     34.6310      2.1670
+   2037.3000   1491.9450     34.6310      2.1620
+   2039.3000   1491.9620     34.6310      2.1580
+   2041.3000   1491.9830     34.6310      2.1550
+   2043.2000   1492.0060     34.6310      2.1530
+   2045.2000   1492.0200     34.6320      2.1480
+   2047.2000   1492.0450     34.6320      2.1460
+   2049.2000   1492.0530     34.6320      2.1400
+   2051.1000   1492.0590     34.6320      2.1340
+   2053.1000   1492.0880     34.6320      2.1330
+   2055.1000   1492.1220     34.6320      2.1330
+   2057.0000   1492.1510     34.6330      2.1320
+   2059.0000   1492.1840     34.6320      2.1320
+   2061.0000   1492.2150     34.6330      2.1310
+   2062.9000   1492.2370     34.6320      2.1290
+   2064.9000   1492.2640     34.6330      2.1270
+   2066.9000   1492.2890     34.6330      2.1250
+   2068.8000   1492.2950     34.6330      2.1190
+   2070.8000   1492.3030     34.6330      2.1130
+   2072.8000   1492.3280     34.6330      2.1110
+   2074.8000   1492.3450     34.6330      2.1070
+   2076.7000   1492.3720     34.6330      2.1060
+   2078.7000   1492.4030     34.6340      2.1050
+   2080.7000   1492.4330     34.6340      2.1040
+   2082.6000   1492.4610     34.6340      2.1030
+   2084.6000   1492.4950     34.6340      2.1030
+   2086.6000   1492.5200     34.6340      2.1010
+   2088.5000   1492.5350     34.6340      2.0970
+   2090.5000   1492.5510     34.6340      2.0930
+   2092.5000   1492.5770     34.6340      2.0910
+   2094.4000   1492.6100     34.6350      2.0910
+   2096.4000   1492.6270     34.6350      2.0870
+   2098.4000   1492.6480     34.6350      2.0840
+   2100.4000   1492.6760     34.6340      2.0830
+   2102.3000   1492.7010     34.6350      2.0810
+   2104.3000   1492.7260     34.6350      2.0790
+   2106.3000   1492.7560     34.6350      2.0780
+   2108.2000   1492.7880     34.6350      2.0780
+   2110.2000   1492.8130     34.6350      2.0760
+   2112.2000   1492.8390     34.6350      2.0740
+   2114.1000   1492.8670     34.6350      2.0730
+   2116.1000   1492.8960     34.6350      2.0720
+   2118.1000   1492.9320     34.6360      2.0720
+   2120.0000   1492.9630     34.6350      2.0720
+   2122.0000   1492.9920     34.6350      2.0710
+   2124.0000   1493.0220     34.6350      2.0700
+   2125.9000   1493.0510     34.6360      2.0690
+   2127.9000   1493.0760     34.6360      2.0670
+   2129.9000   1493.1060     34.6360      2.0660
+   2131.8000   1493.1340     34.6360      2.0650
+   2133.8000   1493.1550     34.6360      2.0620
+   2135.8000   1493.1800     34.6360      2.0600
+   2137.8000   1493.2140     34.6360      2.0600
+   2139.7000   1493.2470     34.6360      2.0600
+   2141.7000   1493.2640     34.6370      2.0560
+   2143.7000   1493.2950     34.6380      2.0550
+   2145.6000   1493.3230     34.6380      2.0540
+   2147.6000   1493.3560     34.6370      2.0540
+   2149.6000   1493.3860     34.6370      2.0530
+   2151.5000   1493.4060     34.6380      2.0500
+   2153.5000   1493.4270     34.6380      2.0470
+   2155.5000   1493.4570     34.6380      2.0460
+   2157.4000   1493.4850     34.6380      2.0450
+   2159.4000   1493.5140     34.6380      2.0440
+   2161.4000   1493.5440     34.6380      2.0430
+   2163.3000   1493.5680     34.6380      2.0410
+   2165.3000   1493.5930     34.6380      2.0390
+   2167.3000   1493.6060     34.6390      2.0340
+   2169.2000   1493.6260     34.6390      2.0310
+   2171.2000   1493.6550     34.6390      2.0300
+   2173.2000   1493.6810     34.6390      2.0280
+   2175.2000   1493.7020     34.6390      2.0250
+   2177.1000   1493.7300     34.6390      2.0240
+   2179.1000   1493.7550     34.6390      2.0220
+   2181.1000   1493.7850     34.6390      2.0210
+   2183.0000   1493.8080     34.6390      2.0190
+   2185.0000   1493.8380     34.6390      2.0180
+   2187.0000   1493.8720     34.6390      2.0180
+   2188.9000   1493.9000     34.6390      2.0170
+   2190.9000   1493.9180     34.6400      2.0130
+   2192.9000   1493.9300     34.6400      2.0080
+   2194.8000   1493.9490     34.6400      2.0050
+   2196.8000   1493.9750     34.6400      2.0030
+   2198.8000   1494.0000     34.6400      2.0010
+   2200.7000   1494.0190     34.6400      1.9980
+   2202.7000   1494.0530     34.6400      1.9980
+   2204.7000   1494.0830     34.6400      1.9970
+   2206.6000   1494.1020     34.6400      1.9940
+   2208.6000   1494.1200     34.6410      1.9900
+   2210.6000   1494.1450     34.6410      1.9880
+   2212.5000   1494.1730     34.6410      1.9870
+   2214.5000   1494.2070     34.6410      1.9870
+   2216.5000   1494.2330     34.6410      1.9850
+   2218.4000   1494.2530     34.6420      1.9820
+   2220.4000   1494.2740     34.6420      1.9790
+   2222.4000   1494.2870     34.6420      1.9740
+   2224.4000   1494.3030     34.6420      1.9700
+   2226.3000   1494.3270     34.6420      1.9680
+   2228.3000   1494.3620     34.6430      1.9680
+   2230.3000   1494.3860     34.6420      1.9660
+   2232.2000   1494.4140     34.6420      1.9650
+   2234.2000   1494.4440     34.6420      1.9640
+   2236.2000   1494.4750     34.6430      1.9630
+   2238.1000   1494.4990     34.6430      1.9610
+   2240.1000   1494.5280     34.6430      1.9600
+   2242.1000   1494.5450     34.6430      1.9560
+   2244.0000   1494.5640     34.6430      1.9530
+   2246.0000   1494.5810     34.6430      1.9490
+   2248.0000   1494.6070     34.6440      1.9470
+   2249.9000   1494.6300     34.6430      1.9450
+   2251.9000   1494.6600     34.6430      1.9440
+   2253.9000   1494.6910     34.6440      1.9430
+   2255.8000   1494.7220     34.6430      1.9430
+   2257.8000   1494.7480     34.6440      1.9410
+   2259.8000   1494.7780     34.6440      1.9400
+   2261.7000   1494.8110     34.6440      1.9400
+   2263.7000   1494.8360     34.6440      1.9380
+   2265.7000   1494.8700     34.6440      1.9380
+   2267.6000   1494.9020     34.6440      1.9380
+   2269.6000   1494.9320     34.6440      1.9370
+   2271.6000   1494.9530     34.6440      1.9340
+   2273.5000   1494.9770     34.6440      1.9320
+   2275.5000   1494.9980     34.6440      1.9290
+   2277.5000   1495.0280     34.6440      1.9280
+   2279.4000   1495.0600     34.6440      1.9280
+   2281.4000   1495.0910     34.6450      1.9270
+   2283.4000   1495.1200     34.6440      1.9260
+   2285.3000   1495.1480     34.6440      1.9250
+   2287.3000   1495.1790     34.6450      1.9240
+   2289.3000   1495.2000     34.6450      1.9210
+   2291.2000   1495.2230     34.6450      1.9190
+   2293.2000   1495.2530     34.6450      1.9180
+   2295.2000   1495.2790     34.6450      1.9160
+   2297.1000   1495.3110     34.6450      1.9160
+   2299.1000   1495.3410     34.6450      1.9150
+   2301.1000   1495.3710     34.6450      1.9140
+   2303.0000   1495.3960     34.6460      1.9120
+   2305.0000   1495.4170     34.6460      1.9090
+   2307.0000   1495.4450     34.6450      1.9080
+   2308.9000   1495.4790     34.6460      1.9080
+   2310.9000   1495.5130     34.6460      1.9080
+   2312.9000   1495.5380     34.6460      1.9060
+   2314.8000   1495.5710     34.6460      1.9060
+   2316.8000   1495.6010     34.6460      1.9050
+   2318.8000   1495.6260     34.6460      1.9030
+   2320.7000   1495.6500     34.6460      1.9010
+   2322.7000   1495.6680     34.6470      1.8970
+   2324.7000   1495.6930     34.6470      1.8950
+   2326.6000   1495.7200     34.6460      1.8940
+   2328.6000   1495.7500     34.6460      1.8930
+   2330.6000   1495.7850     34.6470      1.8930
+   2332.5000   1495.8180     34.6470      1.8930
+   2334.5000   1495.8430     34.6470      1.8910
+   2336.5000   1495.8640     34.6470      1.8880
+   2338.4000   1495.8970     34.6470      1.8880
+   2340.4000   1495.9260     34.6470      1.8870
+   2342.4000   1495.9560     34.6470      1.8860
+   2344.3000   1495.9770     34.6480      1.8830
+   2346.3000   1496.0100     34.6470      1.8830
+   2348.3000   1496.0400     34.6470      1.8820
+   2350.2000   1496.0720     34.6470      1.8820
+   2352.2000   1496.1020     34.6470      1.8810
+   2354.2000   1496.1320     34.6470      1.8800
+   2356.1000   1496.1610     34.6480      1.8790
+   2358.1000   1496.1900     34.6470      1.8780
+   2360.1000   1496.2190     34.6470      1.8770
+   2362.0000   1496.2440     34.6480      1.8750
+   2364.0000   1496.2740     34.6480      1.8740
+   2366.0000   1496.3040     34.6480      1.8730
+   2367.9000   1496.3280     34.6480      1.8710
+   2369.9000   1496.3620     34.6480      1.8710
+   2371.9000   1496.3920     34.6480      1.8700
+   2373.8000   1496.4160     34.6480      1.8680
+   2375.8000   1496.4450     34.6480      1.8670
+   2377.8000   1496.4720     34.6490      1.8650
+   2379.7000   1496.5000     34.6490      1.8640
+   2381.7000   1496.5330     34.6480      1.8640
+   2383.7000   1496.5640     34.6490      1.8630
+   2385.6000   1496.5930     34.6490      1.8620
+   2387.6000   1496.6140     34.6490      1.8590
+   2389.6000   1496.6390     34.6490      1.8570
+   2391.5000   1496.6720     34.6490      1.8570
+   2393.5000   1496.7060     34.6490      1.8570
+   2395.5000   1496.7400     34.6490      1.8570
+   2397.4000   1496.7730     34.6490      1.8570
+   2399.4000   1496.8020     34.6490      1.8560
+   2401.4000   1496.8320     34.6490      1.8550
+   2403.3000   1496.8600     34.6490      1.8540
+   2405.3000   1496.8920     34.6500      1.8530
+   2407.3000   1496.9260     34.6500      1.8530
+   2409.2000   1496.9540     34.6500      1.8520
+   2411.2000   1496.9840     34.6500      1.8510
+   2413.2000   1497.0180     34.6500      1.8510
+   2415.1000   1497.0510     34.6500      1.8510
+   2417.1000   1497.0780     34.6510      1.8490
+   2419.1000   1497.1030     34.6510      1.8470
+   2421.0000   1497.1220     34.6510      1.8440
+   2423.0000   1497.1510     34.6500      1.8430
+   2425.0000   1497.1850     34.6500      1.8430
+   2426.9000   1497.2180     34.6500      1.8430
+   2428.9000   1497.2490     34.6510      1.8420
+   2430.9000   1497.2700     34.6510      1.8390
+   2432.8000   1497.2940     34.6510      1.8370
+   2434.8000   1497.3240     34.6510      1.8360
+   2436.8000   1497.3490     34.6510      1.8340
+   2438.7000   1497.3820     34.6510      1.8340
+   2440.7000   1497.4120     34.6510      1.8330
+   2442.7000   1497.4420     34.6510      1.8320
+   2444.6000   1497.4700     34.6510      1.8310
+   2446.6000   1497.4910     34.6510      1.8280
+   2448.6000   1497.5160     34.6510      1.8260
+   2450.5000   1497.5490     34.6510      1.8260
+   2452.5000   1497.5800     34.6520      1.8250
+   2454.4000   1497.6040     34.6520      1.8230
+   2456.4000   1497.6380     34.6520      1.8230
+   2458.4000   1497.6640     34.6520      1.8210
+   2460.3000   1497.6920     34.6520      1.8200
+   2462.3000   1497.7170     34.6520      1.8180
+   2464.3000   1497.7470     34.6520      1.8170
+   2466.2000   1497.7800     34.6520      1.8170
+   2468.2000   1497.8140     34.6520      1.8170
+   2470.2000   1497.8370     34.6530      1.8140
+   2472.1000   1497.8520     34.6530      1.8100
+   2474.1000   1497.8810     34.6530      1.8090
+   2476.1000   1497.9160     34.6530      1.8090
+   2478.0000   1497.9470     34.6520      1.8090
+   2480.0000   1497.9770     34.6520      1.8080
+   2482.0000   1498.0070     34.6520      1.8070
+   2483.9000   1498.0360     34.6530      1.8060
+   2485.9000   1498.0660     34.6530      1.8050
+   2487.9000   1498.0950     34.6520      1.8040
+   2489.8000   1498.1200     34.6530      1.8020
+   2491.8000   1498.1460     34.6530      1.8000
+   2493.8000   1498.1760     34.6530      1.7990
+   2495.7000   1498.2080     34.6530      1.7990
+   2497.7000   1498.2380     34.6530      1.7980
+   2499.7000   1498.2680     34.6530      1.7970
+   2501.6000   1498.3010     34.6530      1.7970
+   2503.6000   1498.3260     34.6530      1.7950
+   2505.5000   1498.3410     34.6530      1.7910
+   2507.5000   1498.3750     34.6530      1.7910
+   2509.5000   1498.4100     34.6530      1.7910
+   2511.4000   1498.4380     34.6530      1.7900
+   2513.4000   1498.4720     34.6530      1.7900
+   2515.4000   1498.5040     34.6540      1.7890
+   2517.3000   1498.5320     34.6540      1.7880
+   2519.3000   1498.5600     34.6530      1.7870
+   2521.3000   1498.5830     34.6540      1.7840
+   2523.2000   1498.6070     34.6540      1.7820
+   2525.2000   1498.6190     34.6540      1.7770
+   2527.2000   1498.6320     34.6540      1.7720
+   2529.1000   1498.6600     34.6540      1.7710
+   2531.1000   1498.6910     34.6550      1.7700
+   2533.1000   1498.7210     34.6550      1.7690
+   2535.0000   1498.7490     34.6550      1.7680
+   2537.0000   1498.7790     34.6550      1.7670
+   2539.0000   1498.8090     34.6550      1.7660
+   2540.9000   1498.8420     34.6550      1.7660
+   2542.9000   1498.8760     34.6550      1.7660
+   2544.8000   1498.9040     34.6550      1.7650
+   2546.8000   1498.9390     34.6550      1.7650
+   2548.8000   1498.9700     34.6560      1.7640
+   2550.7000   1498.9970     34.6550      1.7630
+   2552.7000   1499.0270     34.6550      1.7620
+   2554.7000   1499.0630     34.6560      1.7620
+   2556.6000   1499.0940     34.6550      1.7620
+   2558.6000   1499.1210     34.6560      1.7600
+   2560.6000   1499.1510     34.6560      1.7590
+   2562.5000   1499.1750     34.6560      1.7570
+   2564.5000   1499.2050     34.6560      1.7560
+   2566.5000   1499.2430     34.6560      1.7570
+   2568.4000   1499.2750     34.6550      1.7570
+   2570.4000   1499.3100     34.6560      1.7570
+   2572.3000   1499.3390     34.6560      1.7560
+   2574.3000   1499.3690     34.6560      1.7550
+   2576.3000   1499.3900     34.6560      1.7520
+   2578.2000   1499.4180     34.6560      1.7510
+   2580.2000   1499.4480     34.6560      1.7500
+   2582.2000   1499.4740     34.6560      1.7480
+   2584.1000   1499.5030     34.6570      1.7470
+   2586.1000   1499.5380     34.6570      1.7470
+   2588.1000   1499.5710     34.6560      1.7470
+   2590.0000   1499.5990     34.6560      1.7460
+   2592.0000   1499.6290     34.6560      1.7450
+   2594.0000   1499.6600     34.6570      1.7440
+   2595.9000   1499.6930     34.6570      1.7440
+   2597.9000   1499.7220     34.6560      1.7430
+   2599.9000   1499.7560     34.6560      1.7430
+   2601.8000   1499.7900     34.6570      1.7430
+   2603.8000   1499.8230     34.6560      1.7430
+   2605.7000   1499.8520     34.6560      1.7420
+   2607.7000   1499.8820     34.6560      1.7410
+   2609.7000   1499.9170     34.6570      1.7410
+   2611.6000   1499.9410     34.6570      1.7390
+   2613.6000   1499.9670     34.6570      1.7370
+   2615.6000   1499.9970     34.6570      1.7360
+   2617.5000   1500.0300     34.6570      1.7360
+   2619.5000   1500.0610     34.6580      1.7350
+   2621.5000   1500.0940     34.6570      1.7350
+   2623.4000   1500.1270     34.6570      1.7350
+   2625.4000   1500.1570     34.6570      1.7340
+   2627.3000   1500.1890     34.6570      1.7340
+   2629.3000   1500.2160     34.6580      1.7320
+   2631.3000   1500.2460     34.6580      1.7310
+   2633.2000   1500.2780     34.6570      1.7310
+   2635.2000   1500.3130     34.6580      1.7310
+   2637.2000   1500.3390     34.6580      1.7290
+   2639.1000   1500.3670     34.6580      1.7280
+   2641.1000   1500.3970     34.6580      1.7270
+   2643.1000   1500.4230     34.6580      1.7250
+   2645.0000   1500.4480     34.6590      1.7230
+   2647.0000   1500.4610     34.6590      1.7180
+   2649.0000   1500.4860     34.6590      1.7160
+   2650.9000   1500.5190     34.6590      1.7160
+   2652.9000   1500.5540     34.6590      1.7160
+   2654.8000   1500.5860     34.6590      1.7160
+   2656.8000   1500.6160     34.6590      1.7150
+   2658.8000   1500.6420     34.6590      1.7130
+   2660.7000   1500.6750     34.6590      1.7130
+   2662.7000   1500.7090     34.6590      1.7130
+   2664.7000   1500.7440     34.6590      1.7130
+   2666.6000   1500.7720     34.6590      1.7120
+   2668.6000   1500.8020     34.6590      1.7110
+   2670.6000   1500.8370     34.6590      1.7110
+   2672.5000   1500.8690     34.6590      1.7110
+   2674.5000   1500.8950     34.6590      1.7090
+   2676.4000   1500.9140     34.6590      1.7060
+   2678.4000   1500.9360     34.6590      1.7030
+   2680.4000   1500.9570     34.6590      1.7000
+   2682.3000   1500.9810     34.6590      1.6980
+   2684.3000   1501.0110     34.6590      1.6970
+   2686.3000   1501.0370     34.6590      1.6950
+   2688.2000   1501.0690     34.6590      1.6950
+   2690.2000   1501.1040     34.6590      1.6950
+   2692.2000   1501.1380     34.6590      1.6950
+   2694.1000   1501.1720     34.6600      1.6950
+   2696.1000   1501.2030     34.6600      1.6940
+   2698.0000   1501.2350     34.6600      1.6940
+   2700.0000   1501.2680     34.6590      1.6940
+   2702.0000   1501.2990     34.6590      1.6930
+   2703.9000   1501.3330     34.6600      1.6930
+   2705.9000   1501.3670     34.6600      1.6930
+   2707.9000   1501.4000     34.6590      1.6930
+   2709.8000   1501.4330     34.6590      1.6930
+   2711.8000   1501.4590     34.6590      1.6910
+   2713.7000   1501.4880     34.6600      1.6900
+   2715.7000   1501.5100     34.6600      1.6870
+   2717.7000   1501.5400     34.6600      1.6860
+   2719.6000   1501.5680     34.6600      1.6850
+   2721.6000   1501.6030     34.6600      1.6850
+   2723.6000   1501.6370     34.6600      1.6850
+   2725.5000   1501.6660     34.6600      1.6840
+   2727.5000   1501.6960     34.6600      1.6830
+   2729.5000   1501.7260     34.6600      1.6820
+   2731.4000   1501.7550     34.6610      1.6810
+   2733.4000   1501.7900     34.6610      1.6810
+   2735.3000   1501.8180     34.6610      1.6800
+   2737.3000   1501.8560     34.6600      1.6810
+   2739.3000   1501.8900     34.6600      1.6810
+   2741.2000   1501.9140     34.6600      1.6790
+   2743.2000   1501.9440     34.6600      1.6780
+   2745.2000   1501.9760     34.6610      1.6770
+   2747.1000   1502.0040     34.6610      1.6760
+   2749.1000   1502.0340     34.6610      1.6750
+   2751.0000   1502.0670     34.6610      1.6750
+   2753.0000   1502.0970     34.6610      1.6740
+   2755.0000   1502.1270     34.6610      1.6730
+   2756.9000   1502.1560     34.6610      1.6720
+   2758.9000   1502.1860     34.6610      1.6710
+   2760.9000   1502.2160     34.6610      1.6700
+   2762.8000   1502.2500     34.6620      1.6700
+   2764.8000   1502.2830     34.6610      1.6700
+   2766.7000   1502.3120     34.6610      1.6690
+   2768.7000   1502.3460     34.6610      1.6690
+   2770.7000   1502.3730     34.6620      1.6670
+   2772.6000   1502.3970     34.6620      1.6650
+   2774.6000   1502.4310     34.6610      1.6650
+   2776.6000   1502.4620     34.6620      1.6640
+   2778.5000   1502.4950     34.6620      1.6640
+   2780.5000   1502.5290     34.6620      1.6640
+   2782.5000   1502.5640     34.6620      1.6640
+   2784.4000   1502.5920     34.6620      1.6630
+   2786.4000   1502.6270     34.6620      1.6630
+   2788.3000   1502.6600     34.6620      1.6630
+   2790.3000   1502.6940     34.6620      1.6630
+   2792.3000   1502.7330     34.6620      1.6640
+   2794.2000   1502.7660     34.6620      1.6640
+   2796.2000   1502.8010     34.6620      1.6640
+   2798.2000   1502.8350     34.6620      1.6640
+   2800.1000   1502.8640     34.6620      1.6630
+   2802.1000   1502.8890     34.6620      1.6610
+   2804.0000   1502.9220     34.6620      1.6610
+   2806.0000   1502.9520     34.6620      1.6600
+   2808.0000   1502.9830     34.6620      1.6590
+   2809.9000   1503.0110     34.6620      1.6580
+   2811.9000   1503.0470     34.6630      1.6580
+   2813.8000   1503.0740     34.6620      1.6570
+   2815.8000   1503.1040     34.6620      1.6560
+   2817.8000   1503.1400     34.6630      1.6560
+   2819.7000   1503.1720     34.6620      1.6560
+   2821.7000   1503.2060     34.6620      1.6560
+   2823.7000   1503.2420     34.6630      1.6560
+   2825.6000   1503.2700     34.6630      1.6550
+   2827.6000   1503.2960     34.6630      1.6530
+   2829.5000   1503.3330     34.6630      1.6540
+   2831.5000   1503.3680     34.6630      1.6540
+   2833.5000   1503.3980     34.6630      1.6530
+   2835.4000   1503.4310     34.6630      1.6530
+   2837.4000   1503.4660     34.6630      1.6530
+   2839.4000   1503.4910     34.6630      1.6510
+   2841.3000   1503.5200     34.6630      1.6500
+   2843.3000   1503.5500     34.6630      1.6490
+   2845.2000   1503.5830     34.6630      1.6490
+   2847.2000   1503.6180     34.6630      1.6490
+   2849.2000   1503.6520     34.6630      1.6490
+   2851.1000   1503.6810     34.6630      1.6480
+   2853.1000   1503.7150     34.6630      1.6480
+   2855.1000   1503.7510     34.6640      1.6480
+   2857.0000   1503.7830     34.6630      1.6480
+   2859.0000   1503.8130     34.6630      1.6470
+   2860.9000   1503.8410     34.6630      1.6460
+   2862.9000   1503.8770     34.6640      1.6460
+   2864.9000   1503.9120     34.6640      1.6460
+   2866.8000   1503.9400     34.6640      1.6450
+   2868.8000   1503.9710     34.6640      1.6440
+   2870.7000   1503.9990     34.6640      1.6430
+   2872.7000   1504.0290     34.6640      1.6420
+   2874.7000   1504.0590     34.6640      1.6410
+   2876.6000   1504.0920     34.6640      1.6410
+   2878.6000   1504.1270     34.6640      1.6410
+   2880.6000   1504.1620     34.6640      1.6410
+   2882.5000   1504.1940     34.6640      1.6410
+   2884.5000   1504.2250     34.6640      1.6400
+   2886.4000   1504.2580     34.6640      1.6400
+   2888.4000   1504.2830     34.6640      1.6380
+   2890.4000   1504.3150     34.6650      1.6370
+   2892.3000   1504.3460     34.6640      1.6370
+   2894.3000   1504.3810     34.6640      1.6370
+   2896.3000   1504.4160     34.6640      1.6370
+   2898.2000   1504.4460     34.6650      1.6360
+   2900.2000   1504.4800     34.6650      1.6360
+   2902.1000   1504.5090     34.6650      1.6350
+   2904.1000   1504.5480     34.6650      1.6360
+   2906.1000   1504.5780     34.6650      1.6350
+   2908.0000   1504.6110     34.6650      1.6350
+   2910.0000   1504.6410     34.6650      1.6340
+   2911.9000   1504.6740     34.6650      1.6340
+   2913.9000   1504.7040     34.6650      1.6330
+   2915.9000   1504.7390     34.6650      1.6330
+   2917.8000   1504.7760     34.6650      1.6340
+   2919.8000   1504.8090     34.6640      1.6340
+   2921.8000   1504.8410     34.6650      1.6330
+   2923.7000   1504.8650     34.6650      1.6310
+   2925.7000   1504.8910     34.6650      1.6290
+   2927.6000   1504.9200     34.6650      1.6280
+   2929.6000   1504.9500     34.6650      1.6270
+   2931.6000   1504.9800     34.6650      1.6260
+   2933.5000   1505.0100     34.6660      1.6250
+   2935.5000   1505.0390     34.6650      1.6240
+   2937.4000   1505.0720     34.6650      1.6240
+   2939.4000   1505.1080     34.6660      1.6240
+   2941.4000   1505.1410     34.6650      1.6240
+   2943.3000   1505.1660     34.6660      1.6220
+   2945.3000   1505.1970     34.6660      1.6210
+   2947.2000   1505.2250     34.6660      1.6200
+   2949.2000   1505.2600     34.6660      1.6200
+   2951.2000   1505.2900     34.6660      1.6190
+   2953.1000   1505.3230     34.6660      1.6190
+   2955.1000   1505.3580     34.6660      1.6190
+   2957.1000   1505.3920     34.6660      1.6190
+   2959.0000   1505.4250     34.6660      1.6190
+   2961.0000   1505.4600     34.6660      1.6190
+   2962.9000   1505.4930     34.6660      1.6190
+   2964.9000   1505.5280     34.6660      1.6190
+   2966.9000   1505.5620     34.6660      1.6190
+   2968.8000   1505.5920     34.6670      1.6180
+   2970.8000   1505.6260     34.6660      1.6180
+   2972.7000   1505.6500     34.6660      1.6160
+   2974.7000   1505.6840     34.6660      1.6160
+   2976.7000   1505.7200     34.6670      1.6160
+   2978.6000   1505.7490     34.6670      1.6150
+   2980.6000   1505.7820     34.6660      1.6150
+   2982.5000   1505.8210     34.6670      1.6160
+   2984.5000   1505.8560     34.6670      1.6160
+   2986.5000   1505.8900     34.6670      1.6160
+   2988.4000   1505.9190     34.6670      1.6150
+   2990.4000   1505.9490     34.6670      1.6140
+   2992.3000   1505.9820     34.6670      1.6140
+   2994.3000   1506.0080     34.6670      1.6120
+   2996.3000   1506.0340     34.6670      1.6100
+   2998.2000   1506.0630     34.6670      1.6090
+   3000.2000   1506.0940     34.6680      1.6080
+   3002.2000   1506.1250     34.6680      1.6070
+   3004.1000   1506.1560     34.6670      1.6070
+   3006.1000   1506.1920     34.6680      1.6070
+   3008.0000   1506.2210     34.6680      1.6060
+   3010.0000   1506.2510     34.6680      1.6050
+   3012.0000   1506.2860     34.6680      1.6050
+   3013.9000   1506.3170     34.6670      1.6050
+   3015.9000   1506.3480     34.6670      1.6040
+   3017.8000   1506.3780     34.6680      1.6030
+   3019.8000   1506.4080     34.6680      1.6020
+   3021.8000   1506.4460     34.6670      1.6030
+   3023.7000   1506.4760     34.6680      1.6020
+   3025.7000   1506.5060     34.6680      1.6010
+   3027.6000   1506.5360     34.6690      1.6000
+   3029.6000   1506.5650     34.6680      1.5990
+   3031.6000   1506.5950     34.6680      1.5980
+   3033.5000   1506.6280     34.6680      1.5980
+   3035.5000   1506.6590     34.6680      1.5970
+   3037.4000   1506.6920     34.6680      1.5970
+   3039.4000   1506.7230     34.6690      1.5960
+   3041.4000   1506.7540     34.6690      1.5950
+   3043.3000   1506.7850     34.6680      1.5950
+   3045.3000   1506.8160     34.6680      1.5940
+   3047.2000   1506.8490     34.6680      1.5940
+   3049.2000   1506.8800     34.6690      1.5930
+   3051.2000   1506.9110     34.6690      1.5920
+   3053.1000   1506.9440     34.6690      1.5920
+   3055.1000   1506.9780     34.6690      1.5920
+   3057.0000   1507.0100     34.6680      1.5920
+   3059.0000   1507.0460     34.6690      1.5920
+   3061.0000   1507.0760     34.6690      1.5910
+   3062.9000   1507.1090     34.6690      1.5910
+   3064.9000   1507.1440     34.6690      1.5910
+   3066.8000   1507.1730     34.6690      1.5900
+   3068.8000   1507.2080     34.6690      1.5900
+   3070.8000   1507.2380     34.6690      1.5890
+   3072.7000   1507.2710     34.6690      1.5890
+   3074.7000   1507.3060     34.6690      1.5890
+   3076.6000   1507.3340     34.6690      1.5880
+   3078.6000   1507.3690     34.6690      1.5880
+   3080.6000   1507.3990     34.6690      1.5870
+   3082.5000   1507.4320     34.6690      1.5870
+   3084.5000   1507.4630     34.6690      1.5860
+   3086.4000   1507.4910     34.6690      1.5850
+   3088.4000   1507.5260     34.6690      1.5850
+   3090.4000   1507.5610     34.6690      1.5850
+   3092.3000   1507.5950     34.6700      1.5850
+   3094.3000   1507.6210     34.6700      1.5830
+   3096.2000   1507.6460     34.6700      1.5810
+   3098.2000   1507.6800     34.6700      1.5810
+   3100.2000   1507.7110     34.6700      1.5800
+   3102.1000   1507.7470     34.6690      1.5810
+   3104.1000   1507.7830     34.6700      1.5810
+   3106.0000   1507.8120     34.6700      1.5800
+   3108.0000   1507.8420     34.6700      1.5790
+   3110.0000   1507.8770     34.6700      1.5790
+   3111.9000   1507.9140     34.6700      1.5800
+   3113.9000   1507.9430     34.6690      1.5790
+   3115.8000   1507.9780     34.6700      1.5790
+   3117.8000   1508.0080     34.6700      1.5780
+   3119.8000   1508.0380     34.6700      1.5770
+   3121.7000   1508.0760     34.6700      1.5780
+   3123.7000   1508.1110     34.6700      1.5780
+   3125.6000   1508.1390     34.6700      1.5770
+   3127.6000   1508.1700     34.6700      1.5760
+   3129.6000   1508.2050     34.6700      1.5760
+   3131.5000   1508.2380     34.6700      1.5760
+   3133.5000   1508.2720     34.6700      1.5760
+   3135.4000   1508.3050     34.6700      1.5760
+   3137.4000   1508.3360     34.6700      1.5750
+   3139.4000   1508.3710     34.6700      1.5750
+   3141.3000   1508.3990     34.6700      1.5740
+   3143.3000   1508.4350     34.6710      1.5740
+   3145.2000   1508.4670     34.6700      1.5740
+   3147.2000   1508.4980     34.6700      1.5730
+   3149.1000   1508.5320     34.6710      1.5730
+   3151.1000   1508.5620     34.6710      1.5720
+   3153.1000   1508.5970     34.6710      1.5720
+   3155.0000   1508.6250     34.6700      1.5710
+   3157.0000   1508.6520     34.6710      1.5690
+   3158.9000   1508.6810     34.6710      1.5680
+   3160.9000   1508.7170     34.6720      1.5680
+   3162.9000   1508.7500     34.6710      1.5680
+   3164.8000   1508.7830     34.6710      1.5680
+   3166.8000   1508.8180     34.6710      1.5680
+   3168.7000   1508.8420     34.6710      1.5660
+   3170.7000   1508.8730     34.6710      1.5650
+   3172.7000   1508.9080     34.6710      1.5650
+   3174.6000   1508.9410     34.6710      1.5650
+   3176.6000   1508.9710     34.6710      1.5640
+   3178.5000   1509.0060     34.6720      1.5640
+   3180.5000   1509.0390     34.6710      1.5640
+   3182.5000   1509.0740     34.6710      1.5640
+   3184.4000   1509.1070     34.6710      1.5640
+   3186.4000   1509.1370     34.6710      1.5630
+   3188.3000   1509.1670     34.6720      1.5620
+   3190.3000   1509.2020     34.6720      1.5620
+   3192.2000   1509.2340     34.6710      1.5620
+   3194.2000   1509.2700     34.6720      1.5620
+   3196.2000   1509.3010     34.6720      1.5610
+   3198.1000   1509.3340     34.6720      1.5610
+   3200.1000   1509.3690     34.6720      1.5610
+   3202.0000   1509.4020     34.6720      1.5610
+   3204.0000   1509.4320     34.6720      1.5600
+   3206.0000   1509.4670     34.6720      1.5600
+   3207.9000   1509.5000     34.6720      1.5600
+   3209.9000   1509.5310     34.6720      1.5590
+   3211.8000   1509.5590     34.6720      1.5580
+   3213.8000   1509.5910     34.6730      1.5570
+   3215.8000   1509.6200     34.6720      1.5560
+   3217.7000   1509.6530     34.6720      1.5560
+   3219.7000   1509.6880     34.6720      1.5560
+   3221.6000   1509.7180     34.6730      1.5550
+   3223.6000   1509.7490     34.6730      1.5540
+   3225.5000   1509.7760     34.6720      1.5530
+   3227.5000   1509.8110     34.6720      1.5530
+   3229.5000   1509.8420     34.6720      1.5520
+   3231.4000   1509.8720     34.6730      1.5510
+   3233.4000   1509.9060     34.6730      1.5510
+   3235.3000   1509.9430     34.6720      1.5520
+   3237.3000   1509.9730     34.6720      1.5510
+   3239.3000   1510.0040     34.6720      1.5500
+   3241.2000   1510.0340     34.6730      1.5490
+   3243.2000   1510.0690     34.6730      1.5490
+   3245.1000   1510.1020     34.6730      1.5490
+   3247.1000   1510.1370     34.6730      1.5490
+   3249.0000   1510.1700     34.6730      1.5490
+   3251.0000   1510.2050     34.6730      1.5490
+   3253.0000   1510.2310     34.6730      1.5470
+   3254.9000   1510.2640     34.6730      1.5470
+   3256.9000   1510.2990     34.6730      1.5470
+   3258.8000   1510.3330     34.6740      1.5470
+   3260.8000   1510.3590     34.6740      1.5450
+   3262.8000   1510.3900     34.6740      1.5440
+   3264.7000   1510.4220     34.6730      1.5440
+   3266.7000   1510.4580     34.6740      1.5440
+   3268.6000   1510.4820     34.6740      1.5420
+   3270.6000   1510.5130     34.6740      1.5410
+   3272.5000   1510.5460     34.6740      1.5410
+   3274.5000   1510.5810     34.6740      1.5410
+   3276.5000   1510.6140     34.6730      1.5410
+   3278.4000   1510.6470     34.6730      1.5410
+   3280.4000   1510.6820     34.6730      1.5410
+   3282.3000   1510.7170     34.6740      1.5410
+   3284.3000   1510.7520     34.6740      1.5410
+   3286.3000   1510.7870     34.6740      1.5410
+   3288.2000   1510.8150     34.6740      1.5400
+   3290.2000   1510.8500     34.6740      1.5400
+   3292.1000   1510.8830     34.6740      1.5400
+   3294.1000   1510.9140     34.6740      1.5390
+   3296.0000   1510.9400     34.6750      1.5370
+   3298.0000   1510.9700     34.6750      1.5360
+   3300.0000   1511.0050     34.6750      1.5360
+   3301.9000   1511.0380     34.6750      1.5360
+   3303.9000   1511.0680     34.6740      1.5350
+   3305.8000   1511.0980     34.6750      1.5340
+   3307.8000   1511.1280     34.6750      1.5330
+   3309.8000   1511.1570     34.6740      1.5320
+   3311.7000   1511.1920     34.6750      1.5320
+   3313.7000   1511.2270     34.6750      1.5320
+   3315.6000   1511.2560     34.6750      1.5310
+   3317.6000   1511.2900     34.6750      1.5310
+   3319.5000   1511.3190     34.6750      1.5300
+   3321.5000   1511.3540     34.6750      1.5300
+   3323.5000   1511.3890     34.6750      1.5300
+   3325.4000   1511.4220     34.6750      1.5300
+   3327.4000   1511.4570     34.6750      1.5300
+   3329.3000   1511.4900     34.6750      1.5300
+   3331.3000   1511.5250     34.6750      1.5300
+   3333.2000   1511.5500     34.6750      1.5280
+   3335.2000   1511.5820     34.6760      1.5270
+   3337.2000   1511.6150     34.6750      1.5270
+   3339.1000   1511.6490     34.6750      1.5270
+   3341.1000   1511.6830     34.6750      1.5270
+   3343.0000   1511.7170     34.6750      1.5270
+   3345.0000   1511.7520     34.6750      1.5270
+   3346.9000   1511.7760     34.6750      1.5250
+   3348.9000   1511.8110     34.6750      1.5250
+   3350.9000   1511.8370     34.6750      1.5230
+   3352.8000   1511.8700     34.6750      1.5230
+   3354.8000   1511.9070     34.6760      1.5230
+   3356.7000   1511.9350     34.6760      1.5220
+   3358.7000   1511.9690     34.6750      1.5220
+   3360.6000   1512.0070     34.6750      1.5230
+   3362.6000   1512.0370     34.6750      1.5220
+   3364.6000   1512.0720     34.6750      1.5220
+   3366.5000   1512.1070     34.6760      1.5220
+   3368.5000   1512.1400     34.6750      1.5220
+   3370.4000   1512.1690     34.6750      1.5210
+   3372.4000   1512.2040     34.6750      1.5210
+   3374.4000   1512.2390     34.6750      1.5210
+   3376.3000   1512.2740     34.6760      1.5210
+   3378.3000   1512.3040     34.6760      1.5200
+   3380.2000   1512.3370     34.6760      1.5200
+   3382.2000   1512.3720     34.6760      1.5200
+   3384.1000   1512.4060     34.6760      1.5200
+   3386.1000   1512.4360     34.6760      1.5190
+   3388.1000   1512.4710     34.6760      1.5190
+   3390.0000   1512.5000     34.6760      1.5180
+   3392.0000   1512.5260     34.6760      1.5160
+   3393.9000   1512.5560     34.6770      1.5150
+   3395.9000   1512.5810     34.6760      1.5130
+   3397.8000   1512.6120     34.6770      1.5120
+   3399.8000   1512.6410     34.6760      1.5110
+   3401.8000   1512.6770     34.6770      1.5110
+   3403.7000   1512.7100     34.6770      1.5110
+   3405.7000   1512.7410     34.6770      1.5100
+   3407.6000   1512.7700     34.6770      1.5090
+   3409.6000   1512.8000     34.6770      1.5080
+   3411.5000   1512.8290     34.6770      1.5070
+   3413.5000   1512.8670     34.6760      1.5080
+   3415.4000   1512.8970     34.6770      1.5070
+   3417.4000   1512.9280     34.6770      1.5060
+   3419.4000   1512.9590     34.6770      1.5050
+   3421.3000   1512.9880     34.6770      1.5040
+   3423.3000   1513.0230     34.6770      1.5040
+   3425.2000   1513.0560     34.6770      1.5040
+   3427.2000   1513.0860     34.6770      1.5030
+   3429.1000   1513.1200     34.6770      1.5030
+   3431.1000   1513.1550     34.6770      1.5030
+   3433.1000   1513.1870     34.6780      1.5020
+   3435.0000   1513.2200     34.6780      1.5020
+   3437.0000   1513.2490     34.6770      1.5010
+   3438.9000   1513.2840     34.6780      1.5010
+   3440.9000   1513.3140     34.6780      1.5000
+   3442.8000   1513.3480     34.6780      1.5000
+   3444.8000   1513.3810     34.6770      1.5000
+   3446.8000   1513.4180     34.6780      1.5000
+   3448.7000   1513.4510     34.6780      1.5000
+   3450.7000   1513.4860     34.6780      1.5000
+   3452.6000   1513.5190     34.6780      1.5000
+   3454.6000   1513.5500     34.6780      1.4990
+   3456.5000   1513.5830     34.6780      1.4990
+   3458.5000   1513.6140     34.6780      1.4980
+   3460.5000   1513.6460     34.6790      1.4970
+   3462.4000   1513.6780     34.6780      1.4970
+   3464.4000   1513.7080     34.6780      1.4960
+   3466.3000   1513.7370     34.6780      1.4950
+   3468.3000   1513.7720     34.6780      1.4950
+   3470.2000   1513.8010     34.6780      1.4940
+   3472.2000   1513.8380     34.6790      1.4940
+   3474.1000   1513.8700     34.6780      1.4940
+   3476.1000   1513.9000     34.6780      1.4930
+   3478.1000   1513.9260     34.6780      1.4910
+   3480.0000   1513.9600     34.6780      1.4910
+   3482.0000   1513.9950     34.6780      1.4910
+   3483.9000   1514.0250     34.6790      1.4900
+   3485.9000   1514.0630     34.6780      1.4910
+   3487.8000   1514.0960     34.6780      1.4910
+   3489.8000   1514.1330     34.6790      1.4910
+   3491.8000   1514.1670     34.6780      1.4910
+   3493.7000   1514.2010     34.6790      1.4910
+   3495.7000   1514.2350     34.6780      1.4910
+   3497.6000   1514.2680     34.6780      1.4910
+   3499.6000   1514.3000     34.6790      1.4900
+   3501.5000   1514.3330     34.6790      1.4900
+   3503.5000   1514.3670     34.6780      1.4900
+   3505.4000   1514.4000     34.6780      1.4900
+   3507.4000   1514.4360     34.6780      1.4900
+   3509.4000   1514.4720     34.6790      1.4900
+   3511.3000   1514.5050     34.6790      1.4900
+   3513.3000   1514.5400     34.6790      1.4900
+   3515.2000   1514.5740     34.6790      1.4900
+   3517.2000   1514.6090     34.6790      1.4900
+   3519.1000   1514.6410     34.6780      1.4900
+   3521.1000   1514.6730     34.6790      1.4890
+   3523.1000   1514.7030     34.6790      1.4880
+   3525.0000   1514.7370     34.6790      1.4880
+   3527.0000   1514.7670     34.6790      1.4870
+   3528.9000   1514.8010     34.6790      1.4870
+   3530.9000   1514.8360     34.6790      1.4870
+   3532.8000   1514.8650     34.6790      1.4860
+   3534.8000   1514.9000     34.6790      1.4860
+   3536.7000   1514.9330     34.6790      1.4860
+   3538.7000   1514.9680     34.6790      1.4860
+   3540.7000   1515.0030     34.6790      1.4860
+   3542.6000   1515.0370     34.6790      1.4860
+   3544.6000   1515.0720     34.6790      1.4860
+   3546.5000   1515.1090     34.6790      1.4870
+   3548.5000   1515.1440     34.6790      1.4870
+   3550.4000   1515.1780     34.6790      1.4870
+   3552.4000   1515.2140     34.6800      1.4870
+   3554.3000   1515.2460     34.6790      1.4870
+   3556.3000   1515.2810     34.6790      1.4870
+   3558.3000   1515.3160     34.6790      1.4870
+   3560.2000   1515.3450     34.6790      1.4860
+   3562.2000   1515.3770     34.6800      1.4850
+   3564.1000   1515.4060     34.6800      1.4840
+   3566.1000   1515.4400     34.6790      1.4840
+   3568.0000   1515.4690     34.6790      1.4830
+   3570.0000   1515.5010     34.6800      1.4820
+   3571.9000   1515.5340     34.6800      1.4820
+   3573.9000   1515.5650     34.6800      1.4810
+   3575.9000   1515.6000     34.6800      1.4810
+   3577.8000   1515.6290     34.6800      1.4800
+   3579.8000   1515.6640     34.6800      1.4800
+   3581.7000   1515.6980     34.6800      1.4800
+   3583.7000   1515.7330     34.6800      1.4800
+   3585.6000   1515.7660     34.6800      1.4800
+   3587.6000   1515.7970     34.6800      1.4790
+   3589.5000   1515.8300     34.6800      1.4790
+   3591.5000   1515.8650     34.6800      1.4790
+   3593.5000   1515.9050     34.6800      1.4800
+   3595.4000   1515.9340     34.6800      1.4790
+   3597.4000   1515.9690     34.6800      1.4790
+   3599.3000   1515.9980     34.6800      1.4780
+   3601.3000   1516.0340     34.6810      1.4780
+   3603.2000   1516.0680     34.6810      1.4780
+   3605.2000   1516.1020     34.6800      1.4780
+   3607.1000   1516.1360     34.6810      1.4780
+   3609.1000   1516.1700     34.6800      1.4780
+   3611.1000   1516.2020     34.6810      1.4770
+   3613.0000   1516.2350     34.6810      1.4770
+   3615.0000   1516.2660     34.6810      1.4760
+   3616.9000   1516.3000     34.6810      1.4760
+   3618.9000   1516.3300     34.6810      1.4750
+   3620.8000   1516.3620     34.6800      1.4750
+   3622.8000   1516.3980     34.6800      1.4750
+   3624.7000   1516.4270     34.6800      1.4740
+   3626.7000   1516.4630     34.6810      1.4740
+   3628.6000   1516.4960     34.6810      1.4740
+   3630.6000   1516.5320     34.6810      1.4740
+   3632.6000   1516.5670     34.6810      1.4740
+   3634.5000   1516.5960     34.6810      1.4730
+   3636.5000   1516.6310     34.6810      1.4730
+   3638.4000   1516.6640     34.6810      1.4730
+   3640.4000   1516.6990     34.6810      1.4730
+   3642.3000   1516.7330     34.6810      1.4730
+   3644.3000   1516.7650     34.6820      1.4720
+   3646.2000   1516.8010     34.6810      1.4730
+   3648.2000   1516.8320     34.6810      1.4720
+   3650.2000   1516.8670     34.6810      1.4720
+   3652.1000   1516.8960     34.6810      1.4710
+   3654.1000   1516.9360     34.6810      1.4720
+   3656.0000   1516.9650     34.6810      1.4710
+   3658.0000   1517.0000     34.6810      1.4710
+   3659.9000   1517.0330     34.6810      1.4710
+   3661.9000   1517.0690     34.6810      1.4710
+   3663.8000   1517.0990     34.6820      1.4700
+   3665.8000   1517.1340     34.6820      1.4700
+   3667.7000   1517.1670     34.6820      1.4700
+   3669.7000   1517.2010     34.6810      1.4700
+   3671.7000   1517.2380     34.6820      1.4700
+   3673.6000   1517.2670     34.6820      1.4690
+   3675.6000   1517.3020     34.6820      1.4690
+   3677.5000   1517.3350     34.6820      1.4690
+   3679.5000   1517.3750     34.6820      1.4700
+   3681.4000   1517.4080     34.6820      1.4700
+   3683.4000   1517.4420     34.6810      1.4700
+   3685.3000   1517.4770     34.6820      1.4700
+   3687.3000   1517.5080     34.6820      1.4690
+   3689.2000   1517.5410     34.6820      1.4690
+   3691.2000   1517.5760     34.6820      1.4690
+   3693.2000   1517.6070     34.6820      1.4680
+   3695.1000   1517.6410     34.6820      1.4680
+   3697.1000   1517.6710     34.6820      1.4670
+   3699.0000   1517.7050     34.6820      1.4670
+   3701.0000   1517.7360     34.6820      1.4660
+   3702.9000   1517.7730     34.6820      1.4670
+   3704.9000   1517.8040     34.6820      1.4660
+   3706.8000   1517.8350     34.6830      1.4650
+   3708.8000   1517.8730     34.6820      1.4660
+   3710.7000   1517.9060     34.6820      1.4660
+   3712.7000   1517.9460     34.6820      1.4670
+   3714.7000   1517.9810     34.6820      1.4670
+   3716.6000   1518.0100     34.6820      1.4660
+   3718.6000   1518.0450     34.6820      1.4660
+   3720.5000   1518.0800     34.6830      1.4660
+   3722.5000   1518.1140     34.6820      1.4660
+   3724.4000   1518.1470     34.6820      1.4660
+   3726.4000   1518.1830     34.6820      1.4660
+   3728.3000   1518.2160     34.6820      1.4660
+   3730.3000   1518.2510     34.6820      1.4660
+   3732.2000   1518.2820     34.6830      1.4650
+   3734.2000   1518.3170     34.6830      1.4650
+   3736.1000   1518.3490     34.6820      1.4650
+   3738.1000   1518.3840     34.6820      1.4650
+   3740.1000   1518.4160     34.6830      1.4640
+   3742.0000   1518.4500     34.6830      1.4640
+   3744.0000   1518.4810     34.6830      1.4630
+   3745.9000   1518.5170     34.6820      1.4640
+   3747.9000   1518.5540     34.6830      1.4640
+   3749.8000   1518.5830     34.6830      1.4630
+   3751.8000   1518.6180     34.6830      1.4630
+   3753.7000   1518.6510     34.6830      1.4630
+   3755.7000   1518.6870     34.6830      1.4630
+   3757.6000   1518.7110     34.6830      1.4610
+   3759.6000   1518.7470     34.6830      1.4610
+   3761.6000   1518.7820     34.6830      1.4610
+   3763.5000   1518.8150     34.6830      1.4610
+   3765.5000   1518.8500     34.6830      1.4610
+   3767.4000   1518.8850     34.6840      1.4610
+   3769.4000   1518.9150     34.6830      1.4600
+   3771.3000   1518.9480     34.6830      1.4600
+   3773.3000   1518.9840     34.6830      1.4600
+   3775.2000   1519.0170     34.6830      1.4600
+   3777.2000   1519.0490     34.6840      1.4590
+   3779.1000   1519.0810     34.6830      1.4590
+   3781.1000   1519.1170     34.6830      1.4590
+   3783.0000   1519.1500     34.6830      1.4590
+   3785.0000   1519.1870     34.6840      1.4590
+   3786.9000   1519.2200     34.6840      1.4590
+   3788.9000   1519.2540     34.6830      1.4590
+   3790.9000   1519.2890     34.6830      1.4590
+   3792.8000   1519.3180     34.6830      1.4580
+   3794.8000   1519.3550     34.6840      1.4580
+   3796.7000   1519.3880     34.6840      1.4580
+   3798.7000   1519.4190     34.6840      1.4570
+   3800.6000   1519.4530     34.6840      1.4570
+   3802.6000   1519.4880     34.6840      1.4570
+   3804.5000   1519.5220     34.6840      1.4570
+   3806.5000   1519.5610     34.6840      1.4580
+   3808.4000   1519.5900     34.6840      1.4570
+   3810.4000   1519.6260     34.6840      1.4570
+   3812.3000   1519.6590     34.6840      1.4570
+   3814.3000   1519.6940     34.6840      1.4570
+   3816.3000   1519.7300     34.6840      1.4570
+   3818.2000   1519.7630     34.6840      1.4570
+   3820.2000   1519.7980     34.6840      1.4570
+   3822.1000   1519.8320     34.6840      1.4570
+   3824.1000   1519.8630     34.6840      1.4560
+   3826.0000   1519.8920     34.6840      1.4550
+   3828.0000   1519.9310     34.6840      1.4560
+   3829.9000   1519.9650     34.6840      1.4560
+   3831.9000   1520.0000     34.6840      1.4560
+   3833.8000   1520.0290     34.6840      1.4550
+   3835.8000   1520.0650     34.6840      1.4550
+   3837.7000   1520.0990     34.6850      1.4550
+   3839.7000   1520.1330     34.6840      1.4550
+   3841.6000   1520.1670     34.6840      1.4550
+   3843.6000   1520.2020     34.6840      1.4550
+   3845.5000   1520.2360     34.6840      1.4550
+   3847.5000   1520.2750     34.6840      1.4560
+   3849.5000   1520.3080     34.6850      1.4550
+   3851.4000   1520.3370     34.6850      1.4540
+   3853.4000   1520.3680     34.6850      1.4530
+   3855.3000   1520.4010     34.6850      1.4530
+   3857.3000   1520.4350     34.6840      1.4530
+   3859.2000   1520.4730     34.6840      1.4540
+   3861.2000   1520.5050     34.6850      1.4530
+   3863.1000   1520.5390     34.6850      1.4530
+   3865.1000   1520.5740     34.6850      1.4530
+   3867.0000   1520.6110     34.6840      1.4540
+   3869.0000   1520.6430     34.6850      1.4530
+   3870.9000   1520.6720     34.6850      1.4520
+   3872.9000   1520.7070     34.6850      1.4520
+   3874.8000   1520.7410     34.6850      1.4520
+   3876.8000   1520.7760     34.6850      1.4520
+   3878.8000   1520.8120     34.6850      1.4520
+   3880.7000   1520.8410     34.6850      1.4510
+   3882.7000   1520.8720     34.6850      1.4500
+   3884.6000   1520.9050     34.6850      1.4500
+   3886.6000   1520.9450     34.6850      1.4510
+   3888.5000   1520.9740     34.6850      1.4500
+   3890.5000   1521.0090     34.6850      1.4500
+   3892.4000   1521.0400     34.6860      1.4490
+   3894.4000   1521.0740     34.6850      1.4490
+   3896.3000   1521.1070     34.6850      1.4490
+   3898.3000   1521.1380     34.6850      1.4480
+   3900.2000   1521.1690     34.6860      1.4470
+   3902.2000   1521.2040     34.6860      1.4470
+   3904.1000   1521.2380     34.6860      1.4470
+   3906.1000   1521.2730     34.6860      1.4470
+   3908.0000   1521.3070     34.6860      1.4470
+   3910.0000   1521.3420     34.6860      1.4470
+   3911.9000   1521.3750     34.6860      1.4470
+   3913.9000   1521.4110     34.6860      1.4470
+   3915.8000   1521.4400     34.6860      1.4460
+   3917.8000   1521.4710     34.6860      1.4450
+   3919.8000   1521.5060     34.6860      1.4450
+   3921.7000   1521.5400     34.6860      1.4450
+   3923.7000   1521.5750     34.6860      1.4450
+   3925.6000   1521.6040     34.6860      1.4440
+   3927.6000   1521.6350     34.6860      1.4430
+   3929.5000   1521.6690     34.6860      1.4430
+   3931.5000   1521.7040     34.6860      1.4430
+   3933.4000   1521.7350     34.6870      1.4420
+   3935.4000   1521.7730     34.6860      1.4430
+   3937.3000   1521.8070     34.6860      1.4430
+   3939.3000   1521.8420     34.6860      1.4430
+   3941.2000   1521.8710     34.6860      1.4420
+   3943.2000   1521.9020     34.6860      1.4410
+   3945.1000   1521.9360     34.6860      1.4410
+   3947.1000   1521.9750     34.6860      1.4420
+   3949.0000   1522.0090     34.6860      1.4420
+   3951.0000   1522.0440     34.6860      1.4420
+   3952.9000   1522.0780     34.6860      1.4420
+   3954.9000   1522.1130     34.6860      1.4420
+   3956.8000   1522.1470     34.6860      1.4420
+   3958.8000   1522.1840     34.6870      1.4420
+   3960.8000   1522.2150     34.6870      1.4410
+   3962.7000   1522.2470     34.6860      1.4410
+   3964.7000   1522.2820     34.6860      1.4410
+   3966.6000   1522.3160     34.6860      1.4410
+   3968.6000   1522.3470     34.6860      1.4400
+   3970.5000   1522.3820     34.6870      1.4400
+   3972.5000   1522.4200     34.6860      1.4410
+   3974.4000   1522.4550     34.6870      1.4410
+   3976.4000   1522.4860     34.6870      1.4400
+   3978.3000   1522.5200     34.6870      1.4400
+   3980.3000   1522.5540     34.6860      1.4400
+   3982.2000   1522.5880     34.6870      1.4400
+   3984.2000   1522.6240     34.6870      1.4400
+   3986.1000   1522.6570     34.6870      1.4400
+   3988.1000   1522.6930     34.6870      1.4400
+   3990.0000   1522.7280     34.6880      1.4400
+   3992.0000   1522.7570     34.6870      1.4390
+   3993.9000   1522.7870     34.6870      1.4380
+   3995.9000   1522.8220     34.6870      1.4380
+   3997.8000   1522.8560     34.6870      1.4380
+   3999.8000   1522.8910     34.6870      1.4380
+   4001.7000   1522.9250     34.6870      1.4380
+   4003.7000   1522.9600     34.6870      1.4380
+   4005.6000   1522.9980     34.6870      1.4390
+   4007.6000   1523.0330     34.6870      1.4390
+   4009.5000   1523.0670     34.6870      1.4390
+   4011.5000   1523.1020     34.6870      1.4390
+   4013.5000   1523.1420     34.6870      1.4400
+   4015.4000   1523.1760     34.6870      1.4400
+   4017.4000   1523.2080     34.6880      1.4390
+   4019.3000   1523.2450     34.6870      1.4400
+   4021.3000   1523.2800     34.6870      1.4400
+   4023.2000   1523.3090     34.6870      1.4390
+   4025.2000   1523.3400     34.6870      1.4380
+   4027.1000   1523.3700     34.6870      1.4370
+   4029.1000   1523.4020     34.6880      1.4360
+   4031.0000   1523.4340     34.6870      1.4360
+   4033.0000   1523.4710     34.6880      1.4360
+   4034.9000   1523.5000     34.6880      1.4350
+   4036.9000   1523.5310     34.6880      1.4340
+   4038.8000   1523.5650     34.6880      1.4340
+   4040.8000   1523.5960     34.6880      1.4330
+   4042.7000   1523.6250     34.6880      1.4320
+   4044.7000   1523.6610     34.6880      1.4320
+   4046.6000   1523.6990     34.6880      1.4330
+   4048.6000   1523.7300     34.6880      1.4320
+   4050.5000   1523.7630     34.6880      1.4320
+   4052.5000   1523.7990     34.6880      1.4320
+   4054.4000   1523.8320     34.6880      1.4320
+   4056.4000   1523.8680     34.6880      1.4320
+   4058.3000   1523.9010     34.6880      1.4320
+   4060.3000   1523.9370     34.6880      1.4320
+   4062.2000   1523.9750     34.6880      1.4330
+   4064.2000   1524.0100     34.6880      1.4330
+   4066.1000   1524.0440     34.6880      1.4330
+   4068.1000   1524.0750     34.6880      1.4320
+   4070.0000   1524.1090     34.6880      1.4320
+   4072.0000   1524.1440     34.6880      1.4320
+   4073.9000   1524.1780     34.6880      1.4320
+   4075.9000   1524.2130     34.6880      1.4320
+   4077.8000   1524.2470     34.6880      1.4320
+   4079.8000   1524.2820     34.6880      1.4320
+   4081.7000   1524.3160     34.6880      1.4320
+   4083.7000   1524.3510     34.6880      1.4320
+   4085.7000   1524.3870     34.6880      1.4320
+   4087.6000   1524.4200     34.6880      1.4320
+   4089.6000   1524.4560     34.6880      1.4320
+   4091.5000   1524.4890     34.6880      1.4320
+   4093.5000   1524.5250     34.6880      1.4320
+   4095.4000   1524.5590     34.6880      1.4320
+   4097.4000   1524.5940     34.6880      1.4320
+   4099.3000   1524.6280     34.6880      1.4320
+   4101.3000   1524.6630     34.6880      1.4320
+   4103.2000   1524.6920     34.6880      1.4310
+   4105.2000   1524.7290     34.6890      1.4310
+   4107.1000   1524.7660     34.6880      1.4320
+   4109.1000   1524.7970     34.6880      1.4310
+   4111.0000   1524.8320     34.6890      1.4310
+   4113.0000   1524.8660     34.6880      1.4310
+   4114.9000   1524.8970     34.6890      1.4300
+   4116.9000   1524.9320     34.6890      1.4300
+   4118.8000   1524.9660     34.6890      1.4300
+   4120.8000   1525.0010     34.6890      1.4300
+   4122.7000   1525.0310     34.6890      1.4290
+   4124.7000   1525.0660     34.6890      1.4290
+   4126.6000   1525.1040     34.6890      1.4300
+   4128.6000   1525.1400     34.6890      1.4300
+   4130.5000   1525.1730     34.6890      1.4300
+   4132.5000   1525.2090     34.6890      1.4300
+   4134.4000   1525.2420     34.6890      1.4300
+   4136.4000   1525.2780     34.6890      1.4300
+   4138.3000   1525.3120     34.6890      1.4300
+   4140.3000   1525.3470     34.6890      1.4300
+   4142.2000   1525.3760     34.6890      1.4290
+   4144.2000   1525.4160     34.6890      1.4300
+   4146.1000   1525.4500     34.6890      1.4300
+   4148.1000   1525.4850     34.6890      1.4300
+   4150.0000   1525.5190     34.6890      1.4300
+   4152.0000   1525.5540     34.6890      1.4300
+   4153.9000   1525.5880     34.6890      1.4300
+   4155.9000   1525.6240     34.6890      1.4300
+   4157.8000   1525.6570     34.6890      1.4300
+   4159.8000   1525.6930     34.6890      1.4300
+   4161.7000   1525.7260     34.6890      1.4300
+   4163.7000   1525.7620     34.6890      1.4300
+   4165.6000   1525.7910     34.6890      1.4290
+   4167.6000   1525.8270     34.6890      1.4290
+   4169.5000   1525.8610     34.6890      1.4290
+   4171.5000   1525.8960     34.6890      1.4290
+   4173.4000   1525.9300     34.6890      1.4290
+   4175.4000   1525.9650     34.6890      1.4290
+   4177.3000   1526.0000     34.6900      1.4290
+   4179.3000   1526.0340     34.6890      1.4290
+   4181.2000   1526.0680     34.6890      1.4290
+   4183.2000   1526.1040     34.6890      1.4290
+   4185.1000   1526.1370     34.6890      1.4290
+   4187.1000   1526.1730     34.6890      1.4290
+   4189.0000   1526.2060     34.6890      1.4290
+   4191.0000   1526.2430     34.6900      1.4290
+   4192.9000   1526.2770     34.6900      1.4290
+   4194.9000   1526.3120     34.6900      1.4290
+   4196.8000   1526.3460     34.6900      1.4290
+   4198.8000   1526.3800     34.6890      1.4290
+   4200.7000   1526.4140     34.6890      1.4290
+   4202.7000   1526.4500     34.6890      1.4290
+   4204.6000   1526.4880     34.6890      1.4300
+   4206.6000   1526.5190     34.6890      1.4290
+   4208.5000   1526.5540     34.6900      1.4290
+   4210.5000   1526.5920     34.6890      1.4300
+   4212.4000   1526.6230     34.6900      1.4290
+   4214.4000   1526.6590     34.6900      1.4290
+   4216.3000   1526.6920     34.6900      1.4290
+   4218.3000   1526.7280     34.6900      1.4290
+   4220.2000   1526.7620     34.6900      1.4290
+   4222.2000   1526.7970     34.6900      1.4290
+   4224.1000   1526.8350     34.6900      1.4300
+   4226.1000   1526.8660     34.6900      1.4290
+   4228.0000   1526.9040     34.6900      1.4300
+   4230.0000   1526.9400     34.6900      1.4300
+   4231.9000   1526.9740     34.6900      1.4300
+   4233.9000   1527.0050     34.6900      1.4290
+   4235.8000   1527.0390     34.6900      1.4290
+   4237.8000   1527.0780     34.6900      1.4300
+   4239.7000   1527.1120     34.6900      1.4300
+   4241.7000   1527.1480     34.6900      1.4300
+   4243.6000   1527.1810     34.6900      1.4300
+   4245.6000   1527.2170     34.6900      1.4300
+   4247.5000   1527.2510     34.6900      1.4300
+   4249.5000   1527.2910     34.6900      1.4310
+   4251.4000   1527.3200     34.6900      1.4300
+   4253.4000   1527.3550     34.6900      1.4300
+   4255.3000   1527.3890     34.6900      1.4300
+   4257.3000   1527.4250     34.6900      1.4300
+   4259.2000   1527.4590     34.6900      1.4300
+   4261.2000   1527.4900     34.6900      1.4290
+   4263.1000   1527.5230     34.6900      1.4290
+   4265.1000   1527.5590     34.6900      1.4290
+   4267.0000   1527.5930     34.6900      1.4290
+   4269.0000   1527.6280     34.6900      1.4290
+   4270.9000   1527.6620     34.6900      1.4290
+   4272.9000   1527.6980     34.6900      1.4290
+   4274.8000   1527.7310     34.6900      1.4290
+   4276.8000   1527.7670     34.6900      1.4290
+   4278.7000   1527.8010     34.6900      1.4290
+   4280.7000   1527.8360     34.6900      1.4290
+   4282.6000   1527.8700     34.6900      1.4290
+   4284.6000   1527.9060     34.6900      1.4290
+   4286.5000   1527.9440     34.6900      1.4300
+   4288.5000   1527.9750     34.6900      1.4290
+   4290.4000   1528.0090     34.6900      1.4290
+   4292.4000   1528.0440     34.6900      1.4290
+   4294.3000   1528.0820     34.6900      1.4300
+   4296.3000   1528.1130     34.6900      1.4290
+   4298.2000   1528.1470     34.6900      1.4290
+   4300.2000   1528.1840     34.6910      1.4290
+   4302.1000   1528.2170     34.6900      1.4290
+   4304.1000   1528.2570     34.6900      1.4300
+   4306.0000   1528.2860     34.6900      1.4290
+   4308.0000   1528.3230     34.6910      1.4290
+   4309.9000   1528.3550     34.6900      1.4290
+   4311.9000   1528.3950     34.6900      1.4300
+   4313.8000   1528.4290     34.6900      1.4300
+   4315.7000   1528.4640     34.6910      1.4300
+   4317.7000   1528.4980     34.6900      1.4300
+   4319.6000   1528.5320     34.6900      1.4300
+   4321.6000   1528.5690     34.6910      1.4300
+   4323.5000   1528.6010     34.6900      1.4300
+   4325.5000   1528.6380     34.6910      1.4300
+   4327.4000   1528.6720     34.6910      1.4300
+   4329.4000   1528.7060     34.6900      1.4300
+   4331.3000   1528.7410     34.6910      1.4300
+   4333.3000   1528.7760     34.6900      1.4300
+   4335.2000   1528.8140     34.6900      1.4310
+   4337.2000   1528.8460     34.6910      1.4300
+   4339.1000   1528.8790     34.6900      1.4300
+   4341.1000   1528.9110     34.6910      1.4290
+   4343.0000   1528.9480     34.6900      1.4300
+   4345.0000   1528.9840     34.6900      1.4300
+   4346.9000   1529.0190     34.6910      1.4300
+   4348.9000   1529.0500     34.6910      1.4290
+   4350.8000   1529.0840     34.6910      1.4290
+   4352.8000   1529.1200     34.6910      1.4290
+   4354.7000   1529.1520     34.6900      1.4290
+   4356.7000   1529.1930     34.6910      1.4300
+   4358.6000   1529.2230     34.6910      1.4290
+   4360.6000   1529.2580     34.6910      1.4290
+   4362.5000   1529.2920     34.6910      1.4290
+   4364.5000   1529.3280     34.6910      1.4290
+   4366.4000   1529.3620     34.6910      1.4290
+   4368.4000   1529.3970     34.6910      1.4290
+   4370.3000   1529.4350     34.6910      1.4300
+   4372.3000   1529.4670     34.6910      1.4290
+   4374.2000   1529.5000     34.6910      1.4290
+   4376.2000   1529.5360     34.6910      1.4290
+   4378.1000   1529.5700     34.6910      1.4290
+   4380.1000   1529.6050     34.6910      1.4290
+   4382.0000   1529.6390     34.6910      1.4290
+   4384.0000   1529.6750     34.6910      1.4290
+   4385.9000   1529.7090     34.6910      1.4290
+   4387.8000   1529.7470     34.6910      1.4300
+   4389.8000   1529.7820     34.6910      1.4300
+   4391.7000   1529.8120     34.6910      1.4290
+   4393.7000   1529.8490     34.6920      1.4290
+   4395.6000   1529.8770     34.6910      1.4280
+   4397.6000   1529.9130     34.6910      1.4280
+   4399.5000   1529.9480     34.6920      1.4280
+   4401.5000   1529.9830     34.6920      1.4280
+   4403.4000   1530.0160     34.6910      1.4280
+   4405.4000   1530.0520     34.6910      1.4280
+   4407.3000   1530.0870     34.6920      1.4280
+   4409.3000   1530.1210     34.6910      1.4280
+   4411.2000   1530.1550     34.6910      1.4280
+   4413.2000   1530.1900     34.6910      1.4280
+   4415.1000   1530.2240     34.6910      1.4280
+   4417.1000   1530.2610     34.6920      1.4280
+   4419.0000   1530.2950     34.6920      1.4280
+   4421.0000   1530.3290     34.6910      1.4280
+   4422.9000   1530.3680     34.6910      1.4290
+   4424.9000   1530.4030     34.6910      1.4290
+   4426.8000   1530.4380     34.6920      1.4290
+   4428.8000   1530.4740     34.6920      1.4290
+   4430.7000   1530.5080     34.6920      1.4290
+   4432.7000   1530.5430     34.6920      1.4290
+   4434.6000   1530.5760     34.6910      1.4290
+   4436.6000   1530.6090     34.6920      1.4280
+   4438.5000   1530.6420     34.6920      1.4280
+   4440.4000   1530.6760     34.6920      1.4280
+   4442.4000   1530.7110     34.6910      1.4280
+   4444.3000   1530.7460     34.6920      1.4280
+   4446.3000   1530.7810     34.6920      1.4280
+   4448.2000   1530.8150     34.6920      1.4280
+   4450.2000   1530.8510     34.6920      1.4280
+   4452.1000   1530.8850     34.6920      1.4280
+   4454.1000   1530.9200     34.6920      1.4280
+   4456.0000   1530.9500     34.6920      1.4270
+   4458.0000   1530.9860     34.6920      1.4270
+   4459.9000   1531.0190     34.6920      1.4270
+   4461.9000   1531.0590     34.6920      1.4280
+   4463.8000   1531.0930     34.6920      1.4280
+   4465.8000   1531.1290     34.6920      1.4280
+   4467.7000   1531.1630     34.6920      1.4280
+   4469.7000   1531.1980     34.6920      1.4280
+   4471.6000   1531.2320     34.6920      1.4280
+   4473.6000   1531.2680     34.6920      1.4280
+   4475.5000   1531.3020     34.6920      1.4280
+   4477.5000   1531.3380     34.6920      1.4280
+   4479.4000   1531.3710     34.6920      1.4280
+   4481.4000   1531.4030     34.6920      1.4270
+   4483.3000   1531.4370     34.6920      1.4270
+   4485.2000   1531.4750     34.6920      1.4280
+   4487.2000   1531.5100     34.6920      1.4280
+   4489.1000   1531.5440     34.6920      1.4280
+   4491.1000   1531.5760     34.6920      1.4270
+   4493.0000   1531.6140     34.6920      1.4280
+   4495.0000   1531.6500     34.6920      1.4280
+   4496.9000   1531.6830     34.6920      1.4280
+   4498.9000   1531.7150     34.6920      1.4270
+   4500.8000   1531.7530     34.6920      1.4280
+   4502.8000   1531.7890     34.6920      1.4280
+   4504.7000   1531.8230     34.6920      1.4280
+   4506.7000   1531.8550     34.6930      1.4270
+   4508.6000   1531.8880     34.6920      1.4270
+   4510.6000   1531.9280     34.6920      1.4280
+   4512.5000   1531.9620     34.6920      1.4280
+   4514.5000   1531.9940     34.6930      1.4270
+   4516.4000   1532.0280     34.6930      1.4270
+   4518.4000   1532.0630     34.6920      1.4270
+   4520.3000   1532.1010     34.6920      1.4280
+   4522.2000   1532.1300     34.6920      1.4270
+   4524.2000   1532.1670     34.6930      1.4270
+   4526.1000   1532.2010     34.6930      1.4270
+   4528.1000   1532.2360     34.6920      1.4270
+   4530.0000   1532.2750     34.6930      1.4280
+   4532.0000   1532.3110     34.6930      1.4280
+   4533.9000   1532.3450     34.6930      1.4280
+   4535.9000   1532.3800     34.6930      1.4280
+   4537.8000   1532.4140     34.6930      1.4280
+   4539.8000   1532.4500     34.6930      1.4280
+   4541.7000   1532.4840     34.6930      1.4280
+   4543.7000   1532.5180     34.6920      1.4280
+   4545.6000   1532.5540     34.6930      1.4280
+   4547.6000   1532.5890     34.6930      1.4280
+   4549.5000   1532.6230     34.6930      1.4280
+   4551.5000   1532.6590     34.6930      1.4280
+   4553.4000   1532.6930     34.6930      1.4280
+   4555.3000   1532.7300     34.6920      1.4290
+   4557.3000   1532.7650     34.6920      1.4290
+   4559.2000   1532.7960     34.6930      1.4280
+   4561.2000   1532.8320     34.6930      1.4280
+   4563.1000   1532.8700     34.6930      1.4290
+   4565.1000   1532.9060     34.6930      1.4290
+   4567.0000   1532.9400     34.6930      1.4290
+   4569.0000   1532.9760     34.6930      1.4290
+   4570.9000   1533.0050     34.6930      1.4280
+   4572.9000   1533.0410     34.6930      1.4280
+   4574.8000   1533.0750     34.6930      1.4280
+   4576.8000   1533.1100     34.6930      1.4280
+   4578.7000   1533.1440     34.6930      1.4280
+   4580.7000   1533.1800     34.6930      1.4280
+   4582.6000   1533.2180     34.6930      1.4290
+   4584.5000   1533.2520     34.6930      1.4290
+   4586.5000   1533.2880     34.6930      1.4290
+   4588.4000   1533.3220     34.6930      1.4290
+   4590.4000   1533.3580     34.6930      1.4290
+   4592.3000   1533.3960     34.6930      1.4300
+   4594.3000   1533.4320     34.6930      1.4300
+   4596.2000   1533.4660     34.6930      1.4300
+   4598.2000   1533.5010     34.6930      1.4300
+   4600.1000   1533.5350     34.6930      1.4300
+   4602.1000   1533.5750     34.6930      1.4310
+   4604.0000   1533.6090     34.6930      1.4310
+   4606.0000   1533.6450     34.6930      1.4310
+   4607.9000   1533.6790     34.6930      1.4310
+   4609.9000   1533.7150     34.6930      1.4310
+   4611.8000   1533.7480     34.6930      1.4310
+   4613.7000   1533.7820     34.6930      1.4310
+   4615.7000   1533.8180     34.6930      1.4310
+   4617.6000   1533.8520     34.6930      1.4310
+   4619.6000   1533.8920     34.6930      1.4320
+   4621.5000   1533.9260     34.6930      1.4320
+   4623.5000   1533.9620     34.6930      1.4320
+   4625.4000   1533.9960     34.6930      1.4320
+   4627.4000   1534.0320     34.6930      1.4320
+   4629.3000   1534.0700     34.6930      1.4330
+   4631.3000   1534.1060     34.6930      1.4330
+   4633.2000   1534.1440     34.6930      1.4340
+   4635.2000   1534.1800     34.6930      1.4340
+   4637.1000   1534.2130     34.6930      1.4340
+   4639.0000   1534.2470     34.6930      1.4340
+   4641.0000   1534.2830     34.6930      1.4340
+   4642.9000   1534.3170     34.6930      1.4340
+   4644.9000   1534.3530     34.6930      1.4340
+   4646.8000   1534.3910     34.6930      1.4350
+   4648.8000   1534.4270     34.6930      1.4350
+   4650.7000   1534.4610     34.6930      1.4350
+   4652.7000   1534.4970     34.6930      1.4350
+   4654.6000   1534.5310     34.6930      1.4350
+   4656.6000   1534.5660     34.6930      1.4350
+   4658.5000   1534.6000     34.6930      1.4350
+   4660.5000   1534.6360     34.6930      1.4350
+   4662.4000   1534.6710     34.6940      1.4350
+   4664.3000   1534.7040     34.6930      1.4350
+   4666.3000   1534.7410     34.6940      1.4350
+   4668.2000   1534.7740     34.6930      1.4350
+   4670.2000   1534.8090     34.6930      1.4350
+   4672.1000   1534.8450     34.6940      1.4350
+   4674.1000   1534.8810     34.6940      1.4350
+   4676.0000   1534.9130     34.6930      1.4350
+   4678.0000   1534.9490     34.6930      1.4350
+   4679.9000   1534.9830     34.6930      1.4350
+   4681.9000   1535.0190     34.6930      1.4350
+   4683.8000   1535.0530     34.6930      1.4350
+   4685.7000   1535.0920     34.6940      1.4360
+   4687.7000   1535.1220     34.6930      1.4350
+   4689.6000   1535.1580     34.6940      1.4350
+   4691.6000   1535.1930     34.6940      1.4350
+   4693.5000   1535.2260     34.6930      1.4350
+   4695.5000   1535.2630     34.6940      1.4350
+   4697.4000   1535.2930     34.6940      1.4340
+   4699.4000   1535.3290     34.6940      1.4340
+   4701.3000   1535.3670     34.6940      1.4350
+   4703.3000   1535.4010     34.6930      1.4350
+   4705.2000   1535.4350     34.6930      1.4350
+   4707.2000   1535.4730     34.6940      1.4350
+   4709.1000   1535.5060     34.6940      1.4350
+   4711.0000   1535.5400     34.6940      1.4350
+   4713.0000   1535.5790     34.6930      1.4360
+   4714.9000   1535.6150     34.6940      1.4360
+   4716.9000   1535.6500     34.6940      1.4360
+   4718.8000   1535.6840     34.6940      1.4360
+   4720.8000   1535.7200     34.6940      1.4360
+   4722.7000   1535.7540     34.6940      1.4360
+   4724.7000   1535.7900     34.6940      1.4360
+   4726.6000   1535.8240     34.6940      1.4360
+   4728.6000   1535.8600     34.6940      1.4360
+   4730.5000   1535.8940     34.6940      1.4360
+   4732.4000   1535.9280     34.6940      1.4360
+   4734.4000   1535.9640     34.6940      1.4360
+   4736.3000   1535.9980     34.6940      1.4360
+   4738.3000   1536.0330     34.6940      1.4360
+   4740.2000   1536.0670     34.6940      1.4360
+   4742.2000   1536.1030     34.6940      1.4360
+   4744.1000   1536.1370     34.6940      1.4360
+   4746.1000   1536.1730     34.6940      1.4360
+   4748.0000   1536.2110     34.6940      1.4370
+   4749.9000   1536.2410     34.6940      1.4360
+   4751.9000   1536.2770     34.6940      1.4360
+   4753.8000   1536.3140     34.6930      1.4370
+   4755.8000   1536.3470     34.6940      1.4360
+   4757.7000   1536.3810     34.6940      1.4360
+   4759.7000   1536.4160     34.6940      1.4360
+   4761.6000   1536.4550     34.6940      1.4370
+   4763.6000   1536.4910     34.6940      1.4370
+   4765.5000   1536.5250     34.6940      1.4370
+   4767.5000   1536.5600     34.6940      1.4370
+   4769.4000   1536.5940     34.6940      1.4370
+   4771.3000   1536.6280     34.6940      1.4370
+   4773.3000   1536.6640     34.6940      1.4370
+   4775.2000   1536.6980     34.6940      1.4370
+   4777.2000   1536.7310     34.6950      1.4360
+   4779.1000   1536.7680     34.6940      1.4370
+   4781.1000   1536.8040     34.6940      1.4370
+   4783.0000   1536.8380     34.6940      1.4370
+   4785.0000   1536.8750     34.6950      1.4370
+   4786.9000   1536.9080     34.6940      1.4370
+   4788.8000   1536.9460     34.6940      1.4380
+   4790.8000   1536.9820     34.6940      1.4380
+   4792.7000   1537.0160     34.6940      1.4380
+   4794.7000   1537.0520     34.6940      1.4380
+   4796.6000   1537.0900     34.6940      1.4390
+   4798.6000   1537.1260     34.6940      1.4390
+   4800.5000   1537.1560     34.6940      1.4380
+   4802.5000   1537.1960     34.6940      1.4390
+   4804.4000   1537.2300     34.6940      1.4390
+   4806.4000   1537.2660     34.6940      1.4390
+   4808.3000   1537.3000     34.6940      1.4390
+   4810.2000   1537.3340     34.6940      1.4390
+   4812.2000   1537.3740     34.6940      1.4400
+   4814.1000   1537.4090     34.6950      1.4400
+   4816.1000   1537.4450     34.6950      1.4400
+   4818.0000   1537.4780     34.6940      1.4400
+   4820.0000   1537.5180     34.6940      1.4410
+   4821.9000   1537.5520     34.6940      1.4410
+   4823.9000   1537.5890     34.6950      1.4410
+   4825.8000   1537.6220     34.6940      1.4410
+   4827.7000   1537.6560     34.6940      1.4410
+   4829.7000   1537.6920     34.6940      1.4410
+   4831.6000   1537.7270     34.6950      1.4410
+   4833.6000   1537.7630     34.6950      1.4410
+   4835.5000   1537.7970     34.6950      1.4410
+   4837.5000   1537.8330     34.6950      1.4410
+   4839.4000   1537.8710     34.6950      1.4420
+   4841.4000   1537.9070     34.6950      1.4420
+   4843.3000   1537.9410     34.6950      1.4420
+   4845.2000   1537.9750     34.6950      1.4420
+   4847.2000   1538.0110     34.6950      1.4420
+   4849.1000   1538.0450     34.6950      1.4420
+   4851.1000   1538.0840     34.6940      1.4430
+   4853.0000   1538.1190     34.6950      1.4430
+   4855.0000   1538.1550     34.6950      1.4430
+   4856.9000   1538.1890     34.6950      1.4430
+   4858.9000   1538.2240     34.6940      1.4430
+   4860.8000   1538.2590     34.6950      1.4430
+   4862.7000   1538.2930     34.6950      1.4430
+   4864.7000   1538.3290     34.6950      1.4430
+   4866.6000   1538.3670     34.6950      1.4440
+   4868.6000   1538.4030     34.6950      1.4440
+   4870.5000   1538.4370     34.6950      1.4440
+   4872.5000   1538.4730     34.6950      1.4440
+   4874.4000   1538.5070     34.6950      1.4440
+   4876.4000   1538.5430     34.6950      1.4440
+   4878.3000   1538.5770     34.6950      1.4440
+   4880.2000   1538.6110     34.6950      1.4440
+   4882.2000   1538.6470     34.6950      1.4440
+   4884.1000   1538.6840     34.6940      1.4450
+   4886.1000   1538.7210     34.6950      1.4450
+   4888.0000   1538.7550     34.6950      1.4450
+   4890.0000   1538.7870     34.6950      1.4440
+   4891.9000   1538.8250     34.6950      1.4450
+   4893.8000   1538.8590     34.6950      1.4450
+   4895.8000   1538.8950     34.6950      1.4450
+   4897.7000   1538.9290     34.6950      1.4450
+   4899.7000   1538.9650     34.6950      1.4450
+   4901.6000   1538.9990     34.6950      1.4450
+   4903.6000   1539.0400     34.6950      1.4460
+   4905.5000   1539.0690     34.6950      1.4450
+   4907.5000   1539.1050     34.6950      1.4450
+   4909.4000   1539.1440     34.6950      1.4460
+   4911.3000   1539.1780     34.6950      1.4460
+   4913.3000   1539.2140     34.6950      1.4460
+   4915.2000   1539.2480     34.6950      1.4460
+   4917.2000   1539.2840     34.6950      1.4460
+   4919.1000   1539.3220     34.6950      1.4470
+   4921.1000   1539.3580     34.6950      1.4470
+   4923.0000   1539.3880     34.6950      1.4460
+   4924.9000   1539.4220     34.6950      1.4460
+   4926.9000   1539.4620     34.6950      1.4470
+   4928.8000   1539.4960     34.6950      1.4470
+   4930.8000   1539.5320     34.6950      1.4470
+   4932.7000   1539.5660     34.6950      1.4470
+   4934.7000   1539.6020     34.6950      1.4470
+   4936.6000   1539.6400     34.6950      1.4480
+   4938.6000   1539.6760     34.6950      1.4480
+   4940.5000   1539.7100     34.6950      1.4480
+   4942.4000   1539.7440     34.6950      1.4480
+   4944.4000   1539.7850     34.6950      1.4490
+   4946.3000   1539.8190     34.6950      1.4490
+   4948.3000   1539.8550     34.6950      1.4490
+   4950.2000   1539.8890     34.6950      1.4490
+   4952.2000   1539.9250     34.6950      1.4490
+   4954.1000   1539.9600     34.6960      1.4490
+   4956.0000   1539.9930     34.6950      1.4490
+   4958.0000   1540.0330     34.6950      1.4500
+   4959.9000   1540.0670     34.6950      1.4500
+   4961.9000   1540.1030     34.6950      1.4500
+   4963.8000   1540.1370     34.6950      1.4500
+   4965.8000   1540.1730     34.6950      1.4500
+   4967.7000   1540.2110     34.6950      1.4510
+   4969.7000   1540.2470     34.6950      1.4510
+   4971.6000   1540.2820     34.6950      1.4510
+   4973.5000   1540.3160     34.6950      1.4510
+   4975.5000   1540.3520     34.6950      1.4510
+   4977.4000   1540.3860     34.6950      1.4510
+   4979.4000   1540.4220     34.6950      1.4510
+   4981.3000   1540.4600     34.6950      1.4520
+   4983.3000   1540.4960     34.6950      1.4520
+   4985.2000   1540.5300     34.6950      1.4520
+   4987.1000   1540.5640     34.6950      1.4520
+   4989.1000   1540.6000     34.6950      1.4520
+   4991.0000   1540.6380     34.6950      1.4530
+   4993.0000   1540.6740     34.6950      1.4530
+   4994.9000   1540.7100     34.6960      1.4530
+   4996.9000   1540.7440     34.6950      1.4530
+   4998.8000   1540.7790     34.6950      1.4530
+   5000.7000   1540.8130     34.6950      1.4530
+   5002.7000   1540.8530     34.6950      1.4540
+   5004.6000   1540.8870     34.6950      1.4540
+   5006.6000   1540.9230     34.6950      1.4540
+   5008.5000   1540.9580     34.6960      1.4540
+   5010.5000   1540.9930     34.6950      1.4540
+   5012.4000   1541.0270     34.6950      1.4540
+   5014.3000   1541.0660     34.6950      1.4550
+   5016.3000   1541.1020     34.6950      1.4550
+   5018.2000   1541.1370     34.6960      1.4550
+   5020.2000   1541.1720     34.6950      1.4550
+   5022.1000   1541.2100     34.6950      1.4560
+   5024.1000   1541.2460     34.6950      1.4560
+   5026.0000   1541.2810     34.6960      1.4560
+   5027.9000   1541.3140     34.6950      1.4560
+   5029.9000   1541.3500     34.6950      1.4560
+   5031.8000   1541.3840     34.6950      1.4560
+   5033.8000   1541.4250     34.6950      1.4570
+   5035.7000   1541.4590     34.6950      1.4570
+   5037.7000   1541.4950     34.6950      1.4570
+   5039.6000   1541.5290     34.6950      1.4570
+   5041.5000   1541.5640     34.6960      1.4570
+   5043.5000   1541.6000     34.6960      1.4570
+   5045.4000   1541.6370     34.6950      1.4580
+   5047.4000   1541.6750     34.6960      1.4580
+   5049.3000   1541.7070     34.6950      1.4580
+   5051.3000   1541.7430     34.6950      1.4580
+   5053.2000   1541.7790     34.6960      1.4580
+   5055.1000   1541.8120     34.6950      1.4580
+   5057.1000   1541.8520     34.6950      1.4590
+   5059.0000   1541.8860     34.6950      1.4590
+   5061.0000   1541.9260     34.6950      1.4600
+   5062.9000   1541.9560     34.6950      1.4590
+   5064.9000   1541.9930     34.6960      1.4590
+   5066.8000   1542.0310     34.6950      1.4600
+   5068.7000   1542.0650     34.6950      1.4600
+   5070.7000   1542.1050     34.6950      1.4610
+   5072.6000   1542.1360     34.6960      1.4600
+   5074.6000   1542.1760     34.6960      1.4610
+   5076.5000   1542.2110     34.6960      1.4610
+   5078.5000   1542.2470     34.6960      1.4610
+   5080.4000   1542.2810     34.6960      1.4610
+   5082.3000   1542.3190     34.6960      1.4620
+   5084.3000   1542.3550     34.6960      1.4620
+   5086.2000   1542.3890     34.6960      1.4620
+   5088.2000   1542.4250     34.6960      1.4620
+   5090.1000   1542.4620     34.6950      1.4630
+   5092.0000   1542.4970     34.6950      1.4630
+   5094.0000   1542.5330     34.6950      1.4630
+   5095.9000   1542.5680     34.6960      1.4630
+   5097.9000   1542.6040     34.6960      1.4630
+   5099.8000   1542.6410     34.6950      1.4640
+   5101.8000   1542.6770     34.6950      1.4640
+   5103.7000   1542.7110     34.6950      1.4640
+   5105.6000   1542.7470     34.6960      1.4640
+   5107.6000   1542.7830     34.6960      1.4640
+   5109.5000   1542.8170     34.6960      1.4640
+   5111.5000   1542.8570     34.6960      1.4650
+   5113.4000   1542.8910     34.6960      1.4650
+   5115.4000   1542.9270     34.6960      1.4650
+   5117.3000   1542.9620     34.6960      1.4650
+   5119.2000   1542.9960     34.6960      1.4650
+   5121.2000   1543.0360     34.6960      1.4660
+   5123.1000   1543.0700     34.6960      1.4660
+   5125.1000   1543.1060     34.6960      1.4660
+   5127.0000   1543.1400     34.6960      1.4660
+   5128.9000   1543.1790     34.6960      1.4670
+   5130.9000   1543.2150     34.6960      1.4670
+   5132.8000   1543.2490     34.6960      1.4670
+   5134.8000   1543.2850     34.6960      1.4670
+   5136.7000   1543.3220     34.6950      1.4680
+   5138.7000   1543.3590     34.6960      1.4680
+   5140.6000   1543.3940     34.6960      1.4680
+   5142.5000   1543.4280     34.6960      1.4680
+   5144.5000   1543.4640     34.6960      1.4680
+   5146.4000   1543.5020     34.6960      1.4690
+   5148.4000   1543.5380     34.6960      1.4690
+   5150.3000   1543.5720     34.6960      1.4690
+   5152.2000   1543.6070     34.6960      1.4690
+   5154.2000   1543.6430     34.6960      1.4690
+   5156.1000   1543.6810     34.6960      1.4700
+   5158.1000   1543.7170     34.6960      1.4700
+   5160.0000   1543.7510     34.6960      1.4700
+   5162.0000   1543.7870     34.6960      1.4700
+   5163.9000   1543.8260     34.6960      1.4710
+   5165.8000   1543.8600     34.6960      1.4710
+   5167.8000   1543.8960     34.6960      1.4710
+   5169.7000   1543.9300     34.6960      1.4710
+   5171.7000   1543.9700     34.6960      1.4720
+   5173.6000   1544.0000     34.6960      1.4710
+   5175.5000   1544.0350     34.6960      1.4710
+   5177.5000   1544.0750     34.6960      1.4720
+   5179.4000   1544.1090     34.6960      1.4720
+   5181.4000   1544.1450     34.6960      1.4720
+   5183.3000   1544.1790     34.6960      1.4720
+   5185.3000   1544.2180     34.6950      1.4730
+   5187.2000   1544.2530     34.6950      1.4730
+   5189.1000   1544.2880     34.6960      1.4730
+   5191.1000   1544.3240     34.6960      1.4730
+   5193.0000   1544.3580     34.6960      1.4730
+   5195.0000   1544.3990     34.6960      1.4740
+   5196.9000   1544.4330     34.6960      1.4740
+   5198.8000   1544.4670     34.6960      1.4740
+   5200.8000   1544.5030     34.6960      1.4740
+   5202.7000   1544.5420     34.6960      1.4750
+   5204.7000   1544.5780     34.6960      1.4750
+   5206.6000   1544.6120     34.6960      1.4750
+   5208.6000   1544.6480     34.6960      1.4750
+   5210.5000   1544.6860     34.6960      1.4760
+   5212.4000   1544.7190     34.6950      1.4760
+   5214.4000   1544.7570     34.6960      1.4760
+   5216.3000   1544.7910     34.6960      1.4760
+   5218.3000   1544.8270     34.6960      1.4760
+   5220.2000   1544.8650     34.6960      1.4770
+   5222.1000   1544.8990     34.6960      1.4770
+   5224.1000   1544.9360     34.6960      1.4770
+   5226.0000   1544.9700     34.6960      1.4770
+   5228.0000   1545.0060     34.6960      1.4770
+   5229.9000   1545.0400     34.6960      1.4770
+   5231.8000   1545.0790     34.6960      1.4780
+   5233.8000   1545.1150     34.6960      1.4780
+   5235.7000   1545.1490     34.6960      1.4780
+   5237.7000   1545.1890     34.6960      1.4790
+   5239.6000   1545.2190     34.6960      1.4780
+   5241.6000   1545.2590     34.6960      1.4790
+   5243.5000   1545.2940     34.6960      1.4790
+   5245.4000   1545.3280     34.6960      1.4790
+   5247.4000   1545.3680     34.6960      1.4800
+   5249.3000   1545.4020     34.6960      1.4800
+   5251.3000   1545.4380     34.6960      1.4800
+   5253.2000   1545.4730     34.6960      1.4800
+   5255.1000   1545.5110     34.6960      1.4810
+   5257.1000   1545.5470     34.6960      1.4810
+   5259.0000   1545.5810     34.6960      1.4810
+   5261.0000   1545.6180     34.6960      1.4810
+   5262.9000   1545.6520     34.6960      1.4810
+   5264.8000   1545.6900     34.6960      1.4820
+   5266.8000   1545.7260     34.6960      1.4820
+   5268.7000   1545.7620     34.6970      1.4820
+   5270.7000   1545.7970     34.6960      1.4820
+   5272.6000   1545.8310     34.6960      1.4820
+   5274.5000   1545.8690     34.6960      1.4830
+   5276.5000   1545.9050     34.6960      1.4830
+   5278.4000   1545.9400     34.6960      1.4830
+   5280.4000   1545.9760     34.6960      1.4830
+   5282.3000   1546.0140     34.6960      1.4840
+   5284.3000   1546.0500     34.6960      1.4840
+   5286.2000   1546.0850     34.6960      1.4840
+   5288.1000   1546.1190     34.6960      1.4840
+   5290.1000   1546.1590     34.6960      1.4850
+   5292.0000   1546.1930     34.6960      1.4850
+   5294.0000   1546.2290     34.6960      1.4850
+   5295.9000   1546.2640     34.6960      1.4850
+   5297.8000   1546.2980     34.6960      1.4850
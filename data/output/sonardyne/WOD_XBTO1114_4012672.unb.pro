@@ -0,0 +1,102 @@
+test_read_store_and_write
+28/7/1992
+:0:0
+Probe: XBT
+Source: /root/package/data/input/unb/WOD_XBTO1114_4012672.unb
+      3.0000   1543.0980     34.5000     29.0300
+      6.0000   1543.0420     34.5000     28.9800
+     10.0000   1543.2170     34.5000     29.0300
+     12.0000   1543.3150     34.5000     29.0600
+     45.0000   1543.5320     34.5000     28.9000
+     48.0000   1543.2810     34.5000     28.7600
+     52.0000   1543.2620     34.5000     28.7200
+     55.0000   1543.0960     34.5000     28.6200
+     76.0000   1543.1480     34.5000     28.4800
+     80.0000   1542.9760     34.5000     28.3700
+     85.0000   1542.8630     34.5000     28.2800
+     89.0000   1542.4690     34.5000     28.0700
+     95.0000   1541.7490     34.5000     27.7000
+    105.0000   1538.6340     34.5000     26.2600
+    109.0000   1536.9830     34.5000     25.5300
+    111.0000   1536.3000     34.5000     25.2300
+    117.0000   1531.9430     34.5000     23.4200
+    119.0000   1531.7240     34.5000     23.3200
+    122.0000   1529.4390     34.5000     22.4100
+    124.0000   1528.5060     34.5000     22.0400
+    133.0000   1520.4210     34.5000     19.0300
+    136.0000   1520.1290     34.5000     18.9100
+    143.0000   1516.9680     34.5000     17.7800
+    148.0000   1516.6390     34.5000     17.6400
+    153.0000   1514.8750     34.5000     17.0200
+    159.0000   1511.7150     34.5000     15.9500
+    162.0000   1511.2380     34.5000     15.7800
+    165.0000   1511.1640     34.5000     15.7400
+    174.0000   1508.8350     34.5000     14.9500
+    178.0000   1507.2100     34.5000     14.4200
+    185.0000   1506.4550     34.5000     14.1500
+    190.0000   1504.7460     34.5000     13.6000
+    193.0000   1503.7080     34.5000     13.2700
+    197.0000   1503.3760     34.5000     13.1500
+    202.0000   1502.1920     34.5000     12.7700
+    212.0000   1502.2240     34.5000     12.7300
+    214.0000   1501.9210     34.5000     12.6300
+    217.0000   1500.9910     34.5000     12.3400
+    222.0000   1500.3610     34.5000     12.1300
+    224.0000   1500.0530     34.5000     12.0300
+    230.0000   1499.9810     34.5000     11.9800
+    236.0000   1499.4640     34.5000     11.8000
+    242.0000   1498.8740     34.5000     11.6000
+    246.0000   1498.8370     34.5000     11.5700
+    249.0000   1498.4720     34.5000     11.4500
+    258.0000   1497.7860     34.5000     11.2100
+    261.0000   1497.6620     34.5000     11.1600
+    268.0000   1497.2180     34.5000     11.0000
+    275.0000   1497.1940     34.5000     10.9600
+    282.0000   1496.3590     34.5000     10.6900
+    292.0000   1495.6740     34.5000     10.4500
+    297.0000   1494.0030     34.5000      9.9600
+    301.0000   1493.4920     34.5000      9.8000
+    314.0000   1493.4910     34.5000      9.7400
+    323.0000   1492.6230     34.5000      9.4600
+    329.0000   1492.5770     34.5000      9.4200
+    335.0000   1492.6760     34.5000      9.4200
+    348.0000   1492.2700     34.5000      9.2500
+    356.0000   1492.0730     34.5000      9.1600
+    362.0000   1491.7310     34.5000      9.0400
+    369.0000   1491.6630     34.5000      8.9900
+    377.0000   1491.2410     34.5000      8.8400
+    382.0000   1490.8790     34.5000      8.7200
+    386.0000   1490.4620     34.5000      8.5900
+    390.0000   1490.6770     34.5000      8.6300
+    395.0000   1490.7600     34.5000      8.6300
+    399.0000   1490.6780     34.5000      8.5900
+    407.0000   1490.4750     34.5000      8.5000
+    417.0000   1490.1920     34.5000      8.3800
+    427.0000   1490.3580     34.5000      8.3800
+    434.0000   1489.8740     34.5000      8.2200
+    437.0000   1489.9990     34.5000      8.2400
+    442.0000   1489.6670     34.5000      8.1300
+    455.0000   1489.4300     34.5000      8.0100
+    458.0000   1489.2910     34.5000      7.9600
+    472.0000   1489.0300     34.5000      7.8300
+    484.0000   1488.6970     34.5000      7.6900
+    494.0000   1488.6720     34.5000      7.6400
+    498.0000   1488.5860     34.5000      7.6000
+    529.0000   1488.2970     34.5000      7.3900
+    533.0000   1488.2100     34.5000      7.3500
+    553.0000   1488.3500     34.5000      7.3000
+    564.0000   1488.0320     34.5000      7.1700
+    572.0000   1487.8940     34.5000      7.1000
+    587.0000   1487.8720     34.5000      7.0300
+    594.0000   1487.7950     34.5000      6.9800
+    609.0000   1487.8890     34.5000      6.9400
+    618.0000   1487.6110     34.5000      6.8300
+    633.0000   1487.6270     34.5000      6.7700
+    643.0000   1487.4030     34.5000      6.6700
+    652.0000   1487.2000     34.5000      6.5800
+    663.0000   1487.1090     34.5000      6.5100
+    678.0000   1487.1620     34.5000      6.4600
+    689.0000   1486.9120     34.5000      6.3500
+    713.0000   1487.1540     34.5000      6.3100
+    720.0000   1487.1130     34.5000      6.2700
+    721.0000   1487.1300     34.5000      6.2700
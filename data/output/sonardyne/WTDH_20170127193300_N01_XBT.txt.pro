@@ -0,0 +1,1564 @@
+test_read_store_and_write
+27/1/2017
+19:33:0
+Probe: Deep Blue
+Source: /root/package/data/input/aoml/WTDH_20170127193300_N01_XBT.txt
+      0.6700      0.0000      0.0000     26.2500
+      1.3400      0.0000      0.0000     26.1400
+      2.0100      0.0000      0.0000     26.0900
+      2.6800      0.0000      0.0000     26.0700
+      3.3400      0.0000      0.0000     26.0600
+      4.0100      0.0000      0.0000     26.0400
+      4.6800      0.0000      0.0000     26.0300
+      5.3500      0.0000      0.0000     26.0100
+      6.0200      0.0000      0.0000     26.0100
+      6.6900      0.0000      0.0000     26.0000
+      7.3600      0.0000      0.0000     26.0000
+      8.0300      0.0000      0.0000     25.9900
+      8.6900      0.0000      0.0000     25.9800
+      9.3600      0.0000      0.0000     25.9800
+     10.0300      0.0000      0.0000     25.9700
+     10.7000      0.0000      0.0000     25.9700
+     11.3700      0.0000      0.0000     25.9700
+     12.0400      0.0000      0.0000     25.9700
+     12.7000      0.0000      0.0000     25.9700
+     13.3700      0.0000      0.0000     25.9700
+     14.0400      0.0000      0.0000     25.9700
+     14.7100      0.0000      0.0000     25.9700
+     15.3800      0.0000      0.0000     25.9700
+     16.0500      0.0000      0.0000     25.9700
+     16.7100      0.0000      0.0000     25.9700
+     17.3800      0.0000      0.0000     25.9700
+     18.0500      0.0000      0.0000     25.9600
+     18.7200      0.0000      0.0000     25.9600
+     19.3800      0.0000      0.0000     25.9600
+     20.0500      0.0000      0.0000     25.9600
+     20.7200      0.0000      0.0000     25.9600
+     21.3900      0.0000      0.0000     25.9600
+     22.0600      0.0000      0.0000     25.9700
+     22.7200      0.0000      0.0000     25.9700
+     23.3900      0.0000      0.0000     25.9700
+     24.0600      0.0000      0.0000     25.9700
+     24.7300      0.0000      0.0000     25.9700
+     25.3900      0.0000      0.0000     25.9700
+     26.0600      0.0000      0.0000     25.9700
+     26.7300      0.0000      0.0000     25.9700
+     27.4000      0.0000      0.0000     25.9700
+     28.0600      0.0000      0.0000     25.9700
+     28.7300      0.0000      0.0000     25.9700
+     29.4000      0.0000      0.0000     25.9700
+     30.0600      0.0000      0.0000     25.9700
+     30.7300      0.0000      0.0000     25.9700
+     31.4000      0.0000      0.0000     25.9700
+     32.0600      0.0000      0.0000     25.9700
+     32.7300      0.0000      0.0000     25.9700
+     33.4000      0.0000      0.0000     25.9700
+     34.0700      0.0000      0.0000     25.9600
+     34.7300      0.0000      0.0000     25.9500
+     35.4000      0.0000      0.0000     25.9500
+     36.0700      0.0000      0.0000     25.9600
+     36.7300      0.0000      0.0000     25.9600
+     37.4000      0.0000      0.0000     25.9600
+     38.0700      0.0000      0.0000     25.9600
+     38.7300      0.0000      0.0000     25.9600
+     39.4000      0.0000      0.0000     25.9600
+     40.0600      0.0000      0.0000     25.9600
+     40.7300      0.0000      0.0000     25.9600
+     41.4000      0.0000      0.0000     25.9500
+     42.0600      0.0000      0.0000     25.9500
+     42.7300      0.0000      0.0000     25.9500
+     43.4000      0.0000      0.0000     25.9500
+     44.0600      0.0000      0.0000     25.9500
+     44.7300      0.0000      0.0000     25.9400
+     45.3900      0.0000      0.0000     25.9400
+     46.0600      0.0000      0.0000     25.9400
+     46.7300      0.0000      0.0000     25.9300
+     47.3900      0.0000      0.0000     25.9300
+     48.0600      0.0000      0.0000     25.9300
+     48.7200      0.0000      0.0000     25.9300
+     49.3900      0.0000      0.0000     25.9300
+     50.0600      0.0000      0.0000     25.9300
+     50.7200      0.0000      0.0000     25.9300
+     51.3900      0.0000      0.0000     25.9300
+     52.0500      0.0000      0.0000     25.9300
+     52.7200      0.0000      0.0000     25.9200
+     53.3800      0.0000      0.0000     25.9200
+     54.0500      0.0000      0.0000     25.9200
+     54.7100      0.0000      0.0000     25.9200
+     55.3800      0.0000      0.0000     25.9200
+     56.0500      0.0000      0.0000     25.9200
+     56.7100      0.0000      0.0000     25.9200
+     57.3800      0.0000      0.0000     25.9200
+     58.0400      0.0000      0.0000     25.9200
+     58.7100      0.0000      0.0000     25.9200
+     59.3700      0.0000      0.0000     25.9200
+     60.0400      0.0000      0.0000     25.9200
+     60.7000      0.0000      0.0000     25.9200
+     61.3700      0.0000      0.0000     25.9200
+     62.0300      0.0000      0.0000     25.9200
+     62.7000      0.0000      0.0000     25.9200
+     63.3600      0.0000      0.0000     25.9200
+     64.0300      0.0000      0.0000     25.9100
+     64.6900      0.0000      0.0000     25.9100
+     65.3600      0.0000      0.0000     25.9100
+     66.0200      0.0000      0.0000     25.9100
+     66.6800      0.0000      0.0000     25.9100
+     67.3500      0.0000      0.0000     25.9100
+     68.0100      0.0000      0.0000     25.9100
+     68.6800      0.0000      0.0000     25.9100
+     69.3400      0.0000      0.0000     25.9100
+     70.0100      0.0000      0.0000     25.9100
+     70.6700      0.0000      0.0000     25.9100
+     71.3400      0.0000      0.0000     25.9100
+     72.0000      0.0000      0.0000     25.9000
+     72.6600      0.0000      0.0000     25.9000
+     73.3300      0.0000      0.0000     25.9000
+     73.9900      0.0000      0.0000     25.9000
+     74.6600      0.0000      0.0000     25.8900
+     75.3200      0.0000      0.0000     25.8900
+     75.9800      0.0000      0.0000     25.8900
+     76.6500      0.0000      0.0000     25.8900
+     77.3100      0.0000      0.0000     25.8900
+     77.9800      0.0000      0.0000     25.8900
+     78.6400      0.0000      0.0000     25.8900
+     79.3000      0.0000      0.0000     25.8900
+     79.9700      0.0000      0.0000     25.8900
+     80.6300      0.0000      0.0000     25.8900
+     81.3000      0.0000      0.0000     25.8900
+     81.9600      0.0000      0.0000     25.8800
+     82.6200      0.0000      0.0000     25.8800
+     83.2900      0.0000      0.0000     25.8800
+     83.9500      0.0000      0.0000     25.8800
+     84.6100      0.0000      0.0000     25.8700
+     85.2800      0.0000      0.0000     25.8700
+     85.9400      0.0000      0.0000     25.8600
+     86.6000      0.0000      0.0000     25.8400
+     87.2700      0.0000      0.0000     25.8300
+     87.9300      0.0000      0.0000     25.8100
+     88.5900      0.0000      0.0000     25.7500
+     89.2600      0.0000      0.0000     25.7000
+     89.9200      0.0000      0.0000     25.6700
+     90.5800      0.0000      0.0000     25.6500
+     91.2400      0.0000      0.0000     25.6400
+     91.9100      0.0000      0.0000     25.6400
+     92.5700      0.0000      0.0000     25.6300
+     93.2300      0.0000      0.0000     25.6400
+     93.9000      0.0000      0.0000     25.6400
+     94.5600      0.0000      0.0000     25.6600
+     95.2200      0.0000      0.0000     25.6700
+     95.8800      0.0000      0.0000     25.6900
+     96.5500      0.0000      0.0000     25.7000
+     97.2100      0.0000      0.0000     25.6900
+     97.8700      0.0000      0.0000     25.6900
+     98.5300      0.0000      0.0000     25.7000
+     99.2000      0.0000      0.0000     25.7100
+     99.8600      0.0000      0.0000     25.7200
+    100.5200      0.0000      0.0000     25.7300
+    101.1800      0.0000      0.0000     25.7400
+    101.8500      0.0000      0.0000     25.7400
+    102.5100      0.0000      0.0000     25.7500
+    103.1700      0.0000      0.0000     25.7500
+    103.8300      0.0000      0.0000     25.7500
+    104.4900      0.0000      0.0000     25.7300
+    105.1600      0.0000      0.0000     25.7100
+    105.8200      0.0000      0.0000     25.6900
+    106.4800      0.0000      0.0000     25.6700
+    107.1400      0.0000      0.0000     25.6600
+    107.8000      0.0000      0.0000     25.6400
+    108.4700      0.0000      0.0000     25.6200
+    109.1300      0.0000      0.0000     25.5800
+    109.7900      0.0000      0.0000     25.5300
+    110.4500      0.0000      0.0000     25.4600
+    111.1100      0.0000      0.0000     25.4100
+    111.7700      0.0000      0.0000     25.3700
+    112.4400      0.0000      0.0000     25.3200
+    113.1000      0.0000      0.0000     25.2700
+    113.7600      0.0000      0.0000     25.2300
+    114.4200      0.0000      0.0000     25.2000
+    115.0800      0.0000      0.0000     25.1800
+    115.7400      0.0000      0.0000     25.1600
+    116.4000      0.0000      0.0000     25.1500
+    117.0600      0.0000      0.0000     25.1500
+    117.7300      0.0000      0.0000     25.1400
+    118.3900      0.0000      0.0000     25.1300
+    119.0500      0.0000      0.0000     25.1300
+    119.7100      0.0000      0.0000     25.1200
+    120.3700      0.0000      0.0000     25.1100
+    121.0300      0.0000      0.0000     25.0900
+    121.6900      0.0000      0.0000     25.0800
+    122.3500      0.0000      0.0000     25.0800
+    123.0100      0.0000      0.0000     25.0700
+    123.6700      0.0000      0.0000     25.0600
+    124.3300      0.0000      0.0000     25.0500
+    125.0000      0.0000      0.0000     25.0400
+    125.6600      0.0000      0.0000     25.0300
+    126.3200      0.0000      0.0000     25.0100
+    126.9800      0.0000      0.0000     24.9700
+    127.6400      0.0000      0.0000     24.9200
+    128.3000      0.0000      0.0000     24.8500
+    128.9600      0.0000      0.0000     24.7500
+    129.6200      0.0000      0.0000     24.6600
+    130.2800      0.0000      0.0000     24.6100
+    130.9400      0.0000      0.0000     24.5800
+    131.6000      0.0000      0.0000     24.5500
+    132.2600      0.0000      0.0000     24.5100
+    132.9200      0.0000      0.0000     24.4700
+    133.5800      0.0000      0.0000     24.4200
+    134.2400      0.0000      0.0000     24.3600
+    134.9000      0.0000      0.0000     24.3100
+    135.5600      0.0000      0.0000     24.2600
+    136.2200      0.0000      0.0000     24.2000
+    136.8800      0.0000      0.0000     24.1400
+    137.5400      0.0000      0.0000     24.0700
+    138.2000      0.0000      0.0000     23.9700
+    138.8600      0.0000      0.0000     23.8300
+    139.5200      0.0000      0.0000     23.6800
+    140.1800      0.0000      0.0000     23.5200
+    140.8400      0.0000      0.0000     23.3800
+    141.5000      0.0000      0.0000     23.2900
+    142.1600      0.0000      0.0000     23.2000
+    142.8200      0.0000      0.0000     23.0600
+    143.4800      0.0000      0.0000     22.9300
+    144.1400      0.0000      0.0000     22.7300
+    144.7900      0.0000      0.0000     22.5200
+    145.4500      0.0000      0.0000     22.3900
+    146.1100      0.0000      0.0000     22.3400
+    146.7700      0.0000      0.0000     22.3100
+    147.4300      0.0000      0.0000     22.2600
+    148.0900      0.0000      0.0000     22.2000
+    148.7500      0.0000      0.0000     22.1400
+    149.4100      0.0000      0.0000     22.0600
+    150.0700      0.0000      0.0000     21.9600
+    150.7300      0.0000      0.0000     21.8200
+    151.3900      0.0000      0.0000     21.6500
+    152.0400      0.0000      0.0000     21.4700
+    152.7000      0.0000      0.0000     21.2900
+    153.3600      0.0000      0.0000     21.1300
+    154.0200      0.0000      0.0000     21.0000
+    154.6800      0.0000      0.0000     20.9300
+    155.3400      0.0000      0.0000     20.8900
+    156.0000      0.0000      0.0000     20.8500
+    156.6500      0.0000      0.0000     20.7700
+    157.3100      0.0000      0.0000     20.6900
+    157.9700      0.0000      0.0000     20.6400
+    158.6300      0.0000      0.0000     20.5900
+    159.2900      0.0000      0.0000     20.5300
+    159.9500      0.0000      0.0000     20.4100
+    160.6000      0.0000      0.0000     20.3000
+    161.2600      0.0000      0.0000     20.2500
+    161.9200      0.0000      0.0000     20.2000
+    162.5800      0.0000      0.0000     20.0400
+    163.2400      0.0000      0.0000     19.8500
+    163.9000      0.0000      0.0000     19.7200
+    164.5500      0.0000      0.0000     19.6300
+    165.2100      0.0000      0.0000     19.5700
+    165.8700      0.0000      0.0000     19.5200
+    166.5300      0.0000      0.0000     19.4400
+    167.1800      0.0000      0.0000     19.2700
+    167.8400      0.0000      0.0000     18.9000
+    168.5000      0.0000      0.0000     18.5400
+    169.1600      0.0000      0.0000     18.2500
+    169.8200      0.0000      0.0000     18.0100
+    170.4700      0.0000      0.0000     17.8400
+    171.1300      0.0000      0.0000     17.7200
+    171.7900      0.0000      0.0000     17.6700
+    172.4500      0.0000      0.0000     17.6200
+    173.1000      0.0000      0.0000     17.4800
+    173.7600      0.0000      0.0000     17.2700
+    174.4200      0.0000      0.0000     17.1000
+    175.0700      0.0000      0.0000     16.9600
+    175.7300      0.0000      0.0000     16.8500
+    176.3900      0.0000      0.0000     16.8000
+    177.0500      0.0000      0.0000     16.7800
+    177.7000      0.0000      0.0000     16.7500
+    178.3600      0.0000      0.0000     16.7000
+    179.0200      0.0000      0.0000     16.6000
+    179.6700      0.0000      0.0000     16.4900
+    180.3300      0.0000      0.0000     16.3600
+    180.9900      0.0000      0.0000     16.1800
+    181.6400      0.0000      0.0000     15.9500
+    182.3000      0.0000      0.0000     15.7200
+    182.9600      0.0000      0.0000     15.4800
+    183.6100      0.0000      0.0000     15.2500
+    184.2700      0.0000      0.0000     15.1000
+    184.9300      0.0000      0.0000     14.9800
+    185.5800      0.0000      0.0000     14.8600
+    186.2400      0.0000      0.0000     14.7600
+    186.9000      0.0000      0.0000     14.6800
+    187.5500      0.0000      0.0000     14.6300
+    188.2100      0.0000      0.0000     14.5700
+    188.8700      0.0000      0.0000     14.4900
+    189.5200      0.0000      0.0000     14.4300
+    190.1800      0.0000      0.0000     14.3900
+    190.8300      0.0000      0.0000     14.3500
+    191.4900      0.0000      0.0000     14.3200
+    192.1500      0.0000      0.0000     14.2900
+    192.8000      0.0000      0.0000     14.2500
+    193.4600      0.0000      0.0000     14.1900
+    194.1100      0.0000      0.0000     14.1500
+    194.7700      0.0000      0.0000     14.1200
+    195.4300      0.0000      0.0000     14.0800
+    196.0800      0.0000      0.0000     14.0500
+    196.7400      0.0000      0.0000     14.0000
+    197.3900      0.0000      0.0000     13.9100
+    198.0500      0.0000      0.0000     13.8000
+    198.7100      0.0000      0.0000     13.7000
+    199.3600      0.0000      0.0000     13.6400
+    200.0200      0.0000      0.0000     13.5600
+    200.6700      0.0000      0.0000     13.5000
+    201.3300      0.0000      0.0000     13.4700
+    201.9800      0.0000      0.0000     13.4400
+    202.6400      0.0000      0.0000     13.4200
+    203.2900      0.0000      0.0000     13.4000
+    203.9500      0.0000      0.0000     13.3600
+    204.6000      0.0000      0.0000     13.2700
+    205.2600      0.0000      0.0000     13.2000
+    205.9100      0.0000      0.0000     13.1500
+    206.5700      0.0000      0.0000     13.1000
+    207.2200      0.0000      0.0000     13.0600
+    207.8800      0.0000      0.0000     13.0400
+    208.5300      0.0000      0.0000     13.0300
+    209.1900      0.0000      0.0000     13.0100
+    209.8400      0.0000      0.0000     12.9800
+    210.5000      0.0000      0.0000     12.9500
+    211.1500      0.0000      0.0000     12.9100
+    211.8100      0.0000      0.0000     12.8700
+    212.4600      0.0000      0.0000     12.8400
+    213.1200      0.0000      0.0000     12.8300
+    213.7700      0.0000      0.0000     12.8300
+    214.4300      0.0000      0.0000     12.8200
+    215.0800      0.0000      0.0000     12.8200
+    215.7400      0.0000      0.0000     12.8200
+    216.3900      0.0000      0.0000     12.8200
+    217.0400      0.0000      0.0000     12.8100
+    217.7000      0.0000      0.0000     12.8000
+    218.3500      0.0000      0.0000     12.8100
+    219.0100      0.0000      0.0000     12.8200
+    219.6600      0.0000      0.0000     12.8300
+    220.3200      0.0000      0.0000     12.8200
+    220.9700      0.0000      0.0000     12.7700
+    221.6200      0.0000      0.0000     12.7300
+    222.2800      0.0000      0.0000     12.7100
+    222.9300      0.0000      0.0000     12.6900
+    223.5900      0.0000      0.0000     12.6700
+    224.2400      0.0000      0.0000     12.6500
+    224.8900      0.0000      0.0000     12.6300
+    225.5500      0.0000      0.0000     12.6200
+    226.2000      0.0000      0.0000     12.6100
+    226.8500      0.0000      0.0000     12.6100
+    227.5100      0.0000      0.0000     12.6000
+    228.1600      0.0000      0.0000     12.6000
+    228.8100      0.0000      0.0000     12.5900
+    229.4700      0.0000      0.0000     12.5900
+    230.1200      0.0000      0.0000     12.5900
+    230.7800      0.0000      0.0000     12.5700
+    231.4300      0.0000      0.0000     12.5600
+    232.0800      0.0000      0.0000     12.5400
+    232.7400      0.0000      0.0000     12.5300
+    233.3900      0.0000      0.0000     12.5100
+    234.0400      0.0000      0.0000     12.5000
+    234.6900      0.0000      0.0000     12.4900
+    235.3500      0.0000      0.0000     12.4800
+    236.0000      0.0000      0.0000     12.4800
+    236.6500      0.0000      0.0000     12.4800
+    237.3100      0.0000      0.0000     12.4800
+    237.9600      0.0000      0.0000     12.4800
+    238.6100      0.0000      0.0000     12.4900
+    239.2700      0.0000      0.0000     12.4900
+    239.9200      0.0000      0.0000     12.4900
+    240.5700      0.0000      0.0000     12.4900
+    241.2200      0.0000      0.0000     12.4900
+    241.8800      0.0000      0.0000     12.5000
+    242.5300      0.0000      0.0000     12.5000
+    243.1800      0.0000      0.0000     12.5000
+    243.8300      0.0000      0.0000     12.4900
+    244.4900      0.0000      0.0000     12.5000
+    245.1400      0.0000      0.0000     12.5000
+    245.7900      0.0000      0.0000     12.4900
+    246.4400      0.0000      0.0000     12.5000
+    247.1000      0.0000      0.0000     12.5000
+    247.7500      0.0000      0.0000     12.5000
+    248.4000      0.0000      0.0000     12.5000
+    249.0500      0.0000      0.0000     12.5000
+    249.7000      0.0000      0.0000     12.5000
+    250.3600      0.0000      0.0000     12.5100
+    251.0100      0.0000      0.0000     12.5100
+    251.6600      0.0000      0.0000     12.5100
+    252.3100      0.0000      0.0000     12.5100
+    252.9600      0.0000      0.0000     12.5100
+    253.6200      0.0000      0.0000     12.5000
+    254.2700      0.0000      0.0000     12.4800
+    254.9200      0.0000      0.0000     12.4700
+    255.5700      0.0000      0.0000     12.4700
+    256.2200      0.0000      0.0000     12.4600
+    256.8800      0.0000      0.0000     12.4500
+    257.5300      0.0000      0.0000     12.4500
+    258.1800      0.0000      0.0000     12.4400
+    258.8300      0.0000      0.0000     12.4300
+    259.4800      0.0000      0.0000     12.4300
+    260.1300      0.0000      0.0000     12.4200
+    260.7800      0.0000      0.0000     12.4100
+    261.4400      0.0000      0.0000     12.4100
+    262.0900      0.0000      0.0000     12.4000
+    262.7400      0.0000      0.0000     12.3900
+    263.3900      0.0000      0.0000     12.3800
+    264.0400      0.0000      0.0000     12.3800
+    264.6900      0.0000      0.0000     12.3800
+    265.3400      0.0000      0.0000     12.3700
+    265.9900      0.0000      0.0000     12.3700
+    266.6400      0.0000      0.0000     12.3700
+    267.2900      0.0000      0.0000     12.3600
+    267.9500      0.0000      0.0000     12.3600
+    268.6000      0.0000      0.0000     12.3500
+    269.2500      0.0000      0.0000     12.3400
+    269.9000      0.0000      0.0000     12.3300
+    270.5500      0.0000      0.0000     12.3100
+    271.2000      0.0000      0.0000     12.2900
+    271.8500      0.0000      0.0000     12.2600
+    272.5000      0.0000      0.0000     12.2400
+    273.1500      0.0000      0.0000     12.2200
+    273.8000      0.0000      0.0000     12.2200
+    274.4500      0.0000      0.0000     12.2100
+    275.1000      0.0000      0.0000     12.2100
+    275.7500      0.0000      0.0000     12.2100
+    276.4000      0.0000      0.0000     12.2000
+    277.0500      0.0000      0.0000     12.1900
+    277.7000      0.0000      0.0000     12.1700
+    278.3500      0.0000      0.0000     12.1300
+    279.0000      0.0000      0.0000     12.1100
+    279.6500      0.0000      0.0000     12.1000
+    280.3000      0.0000      0.0000     12.0900
+    280.9500      0.0000      0.0000     12.0800
+    281.6000      0.0000      0.0000     12.0800
+    282.2500      0.0000      0.0000     12.0700
+    282.9000      0.0000      0.0000     12.0700
+    283.5500      0.0000      0.0000     12.0700
+    284.2000      0.0000      0.0000     12.0700
+    284.8500      0.0000      0.0000     12.0600
+    285.5000      0.0000      0.0000     12.0600
+    286.1500      0.0000      0.0000     12.0600
+    286.8000      0.0000      0.0000     12.0500
+    287.4500      0.0000      0.0000     12.0500
+    288.1000      0.0000      0.0000     12.0500
+    288.7500      0.0000      0.0000     12.0400
+    289.4000      0.0000      0.0000     12.0400
+    290.0500      0.0000      0.0000     12.0400
+    290.7000      0.0000      0.0000     12.0300
+    291.3500      0.0000      0.0000     12.0100
+    292.0000      0.0000      0.0000     11.9900
+    292.6400      0.0000      0.0000     11.9800
+    293.2900      0.0000      0.0000     11.9700
+    293.9400      0.0000      0.0000     11.9700
+    294.5900      0.0000      0.0000     11.9600
+    295.2400      0.0000      0.0000     11.9500
+    295.8900      0.0000      0.0000     11.9400
+    296.5400      0.0000      0.0000     11.9200
+    297.1900      0.0000      0.0000     11.9100
+    297.8400      0.0000      0.0000     11.9000
+    298.4900      0.0000      0.0000     11.8900
+    299.1300      0.0000      0.0000     11.8800
+    299.7800      0.0000      0.0000     11.8600
+    300.4300      0.0000      0.0000     11.8500
+    301.0800      0.0000      0.0000     11.8400
+    301.7300      0.0000      0.0000     11.8300
+    302.3800      0.0000      0.0000     11.8200
+    303.0200      0.0000      0.0000     11.8200
+    303.6700      0.0000      0.0000     11.8100
+    304.3200      0.0000      0.0000     11.8100
+    304.9700      0.0000      0.0000     11.8000
+    305.6200      0.0000      0.0000     11.8000
+    306.2700      0.0000      0.0000     11.8000
+    306.9100      0.0000      0.0000     11.8000
+    307.5600      0.0000      0.0000     11.7900
+    308.2100      0.0000      0.0000     11.7800
+    308.8600      0.0000      0.0000     11.7800
+    309.5100      0.0000      0.0000     11.7700
+    310.1500      0.0000      0.0000     11.7600
+    310.8000      0.0000      0.0000     11.7600
+    311.4500      0.0000      0.0000     11.7600
+    312.1000      0.0000      0.0000     11.7600
+    312.7500      0.0000      0.0000     11.7600
+    313.3900      0.0000      0.0000     11.7600
+    314.0400      0.0000      0.0000     11.7600
+    314.6900      0.0000      0.0000     11.7600
+    315.3400      0.0000      0.0000     11.7500
+    315.9800      0.0000      0.0000     11.7500
+    316.6300      0.0000      0.0000     11.7500
+    317.2800      0.0000      0.0000     11.7500
+    317.9300      0.0000      0.0000     11.7500
+    318.5700      0.0000      0.0000     11.7500
+    319.2200      0.0000      0.0000     11.7500
+    319.8700      0.0000      0.0000     11.7500
+    320.5200      0.0000      0.0000     11.7400
+    321.1600      0.0000      0.0000     11.7400
+    321.8100      0.0000      0.0000     11.7300
+    322.4600      0.0000      0.0000     11.7300
+    323.1000      0.0000      0.0000     11.7300
+    323.7500      0.0000      0.0000     11.7300
+    324.4000      0.0000      0.0000     11.7300
+    325.0400      0.0000      0.0000     11.7300
+    325.6900      0.0000      0.0000     11.7200
+    326.3400      0.0000      0.0000     11.7200
+    326.9900      0.0000      0.0000     11.7200
+    327.6300      0.0000      0.0000     11.7100
+    328.2800      0.0000      0.0000     11.7000
+    328.9200      0.0000      0.0000     11.7000
+    329.5700      0.0000      0.0000     11.7000
+    330.2200      0.0000      0.0000     11.6900
+    330.8600      0.0000      0.0000     11.6900
+    331.5100      0.0000      0.0000     11.6900
+    332.1600      0.0000      0.0000     11.6800
+    332.8000      0.0000      0.0000     11.6700
+    333.4500      0.0000      0.0000     11.6600
+    334.1000      0.0000      0.0000     11.6600
+    334.7400      0.0000      0.0000     11.6500
+    335.3900      0.0000      0.0000     11.6500
+    336.0300      0.0000      0.0000     11.6400
+    336.6800      0.0000      0.0000     11.6300
+    337.3300      0.0000      0.0000     11.6300
+    337.9700      0.0000      0.0000     11.6200
+    338.6200      0.0000      0.0000     11.6200
+    339.2600      0.0000      0.0000     11.6200
+    339.9100      0.0000      0.0000     11.6200
+    340.5600      0.0000      0.0000     11.6200
+    341.2000      0.0000      0.0000     11.6200
+    341.8500      0.0000      0.0000     11.6200
+    342.4900      0.0000      0.0000     11.6200
+    343.1400      0.0000      0.0000     11.6200
+    343.7800      0.0000      0.0000     11.6200
+    344.4300      0.0000      0.0000     11.6200
+    345.0800      0.0000      0.0000     11.6200
+    345.7200      0.0000      0.0000     11.6200
+    346.3700      0.0000      0.0000     11.6200
+    347.0100      0.0000      0.0000     11.6200
+    347.6600      0.0000      0.0000     11.6200
+    348.3000      0.0000      0.0000     11.6200
+    348.9500      0.0000      0.0000     11.6200
+    349.5900      0.0000      0.0000     11.6200
+    350.2400      0.0000      0.0000     11.6200
+    350.8800      0.0000      0.0000     11.6200
+    351.5300      0.0000      0.0000     11.6100
+    352.1700      0.0000      0.0000     11.6100
+    352.8200      0.0000      0.0000     11.6100
+    353.4600      0.0000      0.0000     11.6100
+    354.1100      0.0000      0.0000     11.6000
+    354.7500      0.0000      0.0000     11.6000
+    355.4000      0.0000      0.0000     11.6000
+    356.0400      0.0000      0.0000     11.6000
+    356.6900      0.0000      0.0000     11.6000
+    357.3300      0.0000      0.0000     11.6000
+    357.9800      0.0000      0.0000     11.6000
+    358.6200      0.0000      0.0000     11.6000
+    359.2700      0.0000      0.0000     11.6000
+    359.9100      0.0000      0.0000     11.5900
+    360.5500      0.0000      0.0000     11.5800
+    361.2000      0.0000      0.0000     11.5800
+    361.8400      0.0000      0.0000     11.5800
+    362.4900      0.0000      0.0000     11.5800
+    363.1300      0.0000      0.0000     11.5800
+    363.7800      0.0000      0.0000     11.5600
+    364.4200      0.0000      0.0000     11.5500
+    365.0600      0.0000      0.0000     11.5400
+    365.7100      0.0000      0.0000     11.5300
+    366.3500      0.0000      0.0000     11.5200
+    367.0000      0.0000      0.0000     11.5100
+    367.6400      0.0000      0.0000     11.5000
+    368.2800      0.0000      0.0000     11.5000
+    368.9300      0.0000      0.0000     11.5000
+    369.5700      0.0000      0.0000     11.4900
+    370.2200      0.0000      0.0000     11.4900
+    370.8600      0.0000      0.0000     11.4900
+    371.5000      0.0000      0.0000     11.4800
+    372.1500      0.0000      0.0000     11.4800
+    372.7900      0.0000      0.0000     11.4600
+    373.4300      0.0000      0.0000     11.4400
+    374.0800      0.0000      0.0000     11.4200
+    374.7200      0.0000      0.0000     11.4000
+    375.3600      0.0000      0.0000     11.3900
+    376.0100      0.0000      0.0000     11.3700
+    376.6500      0.0000      0.0000     11.3600
+    377.2900      0.0000      0.0000     11.3400
+    377.9400      0.0000      0.0000     11.3200
+    378.5800      0.0000      0.0000     11.3000
+    379.2200      0.0000      0.0000     11.2900
+    379.8700      0.0000      0.0000     11.2900
+    380.5100      0.0000      0.0000     11.2800
+    381.1500      0.0000      0.0000     11.2700
+    381.7900      0.0000      0.0000     11.2700
+    382.4400      0.0000      0.0000     11.2600
+    383.0800      0.0000      0.0000     11.2500
+    383.7200      0.0000      0.0000     11.2400
+    384.3700      0.0000      0.0000     11.2400
+    385.0100      0.0000      0.0000     11.2300
+    385.6500      0.0000      0.0000     11.2300
+    386.2900      0.0000      0.0000     11.2200
+    386.9400      0.0000      0.0000     11.2200
+    387.5800      0.0000      0.0000     11.2200
+    388.2200      0.0000      0.0000     11.2200
+    388.8600      0.0000      0.0000     11.2200
+    389.5100      0.0000      0.0000     11.2200
+    390.1500      0.0000      0.0000     11.2100
+    390.7900      0.0000      0.0000     11.2000
+    391.4300      0.0000      0.0000     11.1700
+    392.0800      0.0000      0.0000     11.1400
+    392.7200      0.0000      0.0000     11.1000
+    393.3600      0.0000      0.0000     11.0700
+    394.0000      0.0000      0.0000     11.0500
+    394.6400      0.0000      0.0000     11.0300
+    395.2900      0.0000      0.0000     11.0100
+    395.9300      0.0000      0.0000     11.0100
+    396.5700      0.0000      0.0000     11.0000
+    397.2100      0.0000      0.0000     10.9900
+    397.8500      0.0000      0.0000     10.9900
+    398.5000      0.0000      0.0000     10.9900
+    399.1400      0.0000      0.0000     10.9800
+    399.7800      0.0000      0.0000     10.9700
+    400.4200      0.0000      0.0000     10.9600
+    401.0600      0.0000      0.0000     10.9500
+    401.7000      0.0000      0.0000     10.9400
+    402.3500      0.0000      0.0000     10.9300
+    402.9900      0.0000      0.0000     10.9200
+    403.6300      0.0000      0.0000     10.9100
+    404.2700      0.0000      0.0000     10.9000
+    404.9100      0.0000      0.0000     10.8900
+    405.5500      0.0000      0.0000     10.8900
+    406.1900      0.0000      0.0000     10.8700
+    406.8300      0.0000      0.0000     10.8500
+    407.4800      0.0000      0.0000     10.8300
+    408.1200      0.0000      0.0000     10.8200
+    408.7600      0.0000      0.0000     10.8200
+    409.4000      0.0000      0.0000     10.8100
+    410.0400      0.0000      0.0000     10.8100
+    410.6800      0.0000      0.0000     10.8000
+    411.3200      0.0000      0.0000     10.7700
+    411.9600      0.0000      0.0000     10.7300
+    412.6000      0.0000      0.0000     10.7100
+    413.2400      0.0000      0.0000     10.7000
+    413.8800      0.0000      0.0000     10.6800
+    414.5200      0.0000      0.0000     10.6600
+    415.1700      0.0000      0.0000     10.6300
+    415.8100      0.0000      0.0000     10.6100
+    416.4500      0.0000      0.0000     10.5800
+    417.0900      0.0000      0.0000     10.5500
+    417.7300      0.0000      0.0000     10.5300
+    418.3700      0.0000      0.0000     10.5100
+    419.0100      0.0000      0.0000     10.4800
+    419.6500      0.0000      0.0000     10.4400
+    420.2900      0.0000      0.0000     10.4100
+    420.9300      0.0000      0.0000     10.3900
+    421.5700      0.0000      0.0000     10.3600
+    422.2100      0.0000      0.0000     10.3500
+    422.8500      0.0000      0.0000     10.3400
+    423.4900      0.0000      0.0000     10.3300
+    424.1300      0.0000      0.0000     10.3100
+    424.7700      0.0000      0.0000     10.2900
+    425.4100      0.0000      0.0000     10.2600
+    426.0500      0.0000      0.0000     10.2400
+    426.6900      0.0000      0.0000     10.2000
+    427.3300      0.0000      0.0000     10.1600
+    427.9700      0.0000      0.0000     10.1300
+    428.6100      0.0000      0.0000     10.1100
+    429.2500      0.0000      0.0000     10.0900
+    429.8900      0.0000      0.0000     10.0800
+    430.5300      0.0000      0.0000     10.0800
+    431.1700      0.0000      0.0000     10.0700
+    431.8000      0.0000      0.0000     10.0700
+    432.4400      0.0000      0.0000     10.0600
+    433.0800      0.0000      0.0000     10.0500
+    433.7200      0.0000      0.0000     10.0300
+    434.3600      0.0000      0.0000     10.0200
+    435.0000      0.0000      0.0000     10.0000
+    435.6400      0.0000      0.0000      9.9800
+    436.2800      0.0000      0.0000      9.9500
+    436.9200      0.0000      0.0000      9.9200
+    437.5600      0.0000      0.0000      9.9000
+    438.2000      0.0000      0.0000      9.8800
+    438.8400      0.0000      0.0000      9.8700
+    439.4700      0.0000      0.0000      9.8600
+    440.1100      0.0000      0.0000      9.8600
+    440.7500      0.0000      0.0000      9.8500
+    441.3900      0.0000      0.0000      9.8500
+    442.0300      0.0000      0.0000      9.8500
+    442.6700      0.0000      0.0000      9.8500
+    443.3100      0.0000      0.0000      9.8500
+    443.9500      0.0000      0.0000      9.8400
+    444.5800      0.0000      0.0000      9.8300
+    445.2200      0.0000      0.0000      9.8200
+    445.8600      0.0000      0.0000      9.8100
+    446.5000      0.0000      0.0000      9.8000
+    447.1400      0.0000      0.0000      9.7600
+    447.7800      0.0000      0.0000      9.6600
+    448.4100      0.0000      0.0000      9.5700
+    449.0500      0.0000      0.0000      9.5300
+    449.6900      0.0000      0.0000      9.5000
+    450.3300      0.0000      0.0000      9.4800
+    450.9700      0.0000      0.0000      9.4700
+    451.6000      0.0000      0.0000      9.4300
+    452.2400      0.0000      0.0000      9.3700
+    452.8800      0.0000      0.0000      9.3200
+    453.5200      0.0000      0.0000      9.2800
+    454.1600      0.0000      0.0000      9.2400
+    454.7900      0.0000      0.0000      9.2100
+    455.4300      0.0000      0.0000      9.1900
+    456.0700      0.0000      0.0000      9.1500
+    456.7100      0.0000      0.0000      9.0900
+    457.3500      0.0000      0.0000      9.0300
+    457.9800      0.0000      0.0000      8.9900
+    458.6200      0.0000      0.0000      8.9700
+    459.2600      0.0000      0.0000      8.9600
+    459.9000      0.0000      0.0000      8.9500
+    460.5300      0.0000      0.0000      8.9300
+    461.1700      0.0000      0.0000      8.9100
+    461.8100      0.0000      0.0000      8.9000
+    462.4400      0.0000      0.0000      8.8900
+    463.0800      0.0000      0.0000      8.8700
+    463.7200      0.0000      0.0000      8.8500
+    464.3600      0.0000      0.0000      8.8100
+    464.9900      0.0000      0.0000      8.7800
+    465.6300      0.0000      0.0000      8.7600
+    466.2700      0.0000      0.0000      8.7300
+    466.9000      0.0000      0.0000      8.7200
+    467.5400      0.0000      0.0000      8.7000
+    468.1800      0.0000      0.0000      8.6900
+    468.8100      0.0000      0.0000      8.6800
+    469.4500      0.0000      0.0000      8.6700
+    470.0900      0.0000      0.0000      8.6600
+    470.7200      0.0000      0.0000      8.6500
+    471.3600      0.0000      0.0000      8.6200
+    472.0000      0.0000      0.0000      8.6000
+    472.6300      0.0000      0.0000      8.5600
+    473.2700      0.0000      0.0000      8.5300
+    473.9100      0.0000      0.0000      8.5000
+    474.5400      0.0000      0.0000      8.4800
+    475.1800      0.0000      0.0000      8.4700
+    475.8200      0.0000      0.0000      8.4600
+    476.4500      0.0000      0.0000      8.4500
+    477.0900      0.0000      0.0000      8.4300
+    477.7300      0.0000      0.0000      8.4100
+    478.3600      0.0000      0.0000      8.4000
+    479.0000      0.0000      0.0000      8.3900
+    479.6300      0.0000      0.0000      8.3800
+    480.2700      0.0000      0.0000      8.3700
+    480.9100      0.0000      0.0000      8.3600
+    481.5400      0.0000      0.0000      8.3600
+    482.1800      0.0000      0.0000      8.3500
+    482.8100      0.0000      0.0000      8.3500
+    483.4500      0.0000      0.0000      8.3400
+    484.0800      0.0000      0.0000      8.3400
+    484.7200      0.0000      0.0000      8.3300
+    485.3600      0.0000      0.0000      8.3200
+    485.9900      0.0000      0.0000      8.3200
+    486.6300      0.0000      0.0000      8.3100
+    487.2600      0.0000      0.0000      8.3000
+    487.9000      0.0000      0.0000      8.2600
+    488.5300      0.0000      0.0000      8.2000
+    489.1700      0.0000      0.0000      8.1500
+    489.8000      0.0000      0.0000      8.1000
+    490.4400      0.0000      0.0000      8.0500
+    491.0700      0.0000      0.0000      8.0100
+    491.7100      0.0000      0.0000      7.9800
+    492.3400      0.0000      0.0000      7.9700
+    492.9800      0.0000      0.0000      7.9600
+    493.6200      0.0000      0.0000      7.9500
+    494.2500      0.0000      0.0000      7.9400
+    494.8900      0.0000      0.0000      7.9300
+    495.5200      0.0000      0.0000      7.9200
+    496.1500      0.0000      0.0000      7.9100
+    496.7900      0.0000      0.0000      7.8900
+    497.4200      0.0000      0.0000      7.8500
+    498.0600      0.0000      0.0000      7.8300
+    498.6900      0.0000      0.0000      7.8000
+    499.3300      0.0000      0.0000      7.7500
+    499.9600      0.0000      0.0000      7.7200
+    500.6000      0.0000      0.0000      7.7000
+    501.2300      0.0000      0.0000      7.6800
+    501.8700      0.0000      0.0000      7.6700
+    502.5000      0.0000      0.0000      7.6600
+    503.1400      0.0000      0.0000      7.6600
+    503.7700      0.0000      0.0000      7.6600
+    504.4000      0.0000      0.0000      7.6600
+    505.0400      0.0000      0.0000      7.6600
+    505.6700      0.0000      0.0000      7.6600
+    506.3100      0.0000      0.0000      7.6600
+    506.9400      0.0000      0.0000      7.6500
+    507.5700      0.0000      0.0000      7.6500
+    508.2100      0.0000      0.0000      7.6500
+    508.8400      0.0000      0.0000      7.6500
+    509.4800      0.0000      0.0000      7.6500
+    510.1100      0.0000      0.0000      7.6500
+    510.7400      0.0000      0.0000      7.6500
+    511.3800      0.0000      0.0000      7.6400
+    512.0100      0.0000      0.0000      7.6200
+    512.6500      0.0000      0.0000      7.5800
+    513.2800      0.0000      0.0000      7.5500
+    513.9100      0.0000      0.0000      7.5300
+    514.5500      0.0000      0.0000      7.5200
+    515.1800      0.0000      0.0000      7.5100
+    515.8100      0.0000      0.0000      7.5000
+    516.4500      0.0000      0.0000      7.4900
+    517.0800      0.0000      0.0000      7.4600
+    517.7100      0.0000      0.0000      7.4400
+    518.3500      0.0000      0.0000      7.4200
+    518.9800      0.0000      0.0000      7.4100
+    519.6100      0.0000      0.0000      7.4000
+    520.2500      0.0000      0.0000      7.4000
+    520.8800      0.0000      0.0000      7.4000
+    521.5100      0.0000      0.0000      7.4000
+    522.1500      0.0000      0.0000      7.4000
+    522.7800      0.0000      0.0000      7.4000
+    523.4100      0.0000      0.0000      7.4000
+    524.0400      0.0000      0.0000      7.4000
+    524.6800      0.0000      0.0000      7.3900
+    525.3100      0.0000      0.0000      7.3900
+    525.9400      0.0000      0.0000      7.3900
+    526.5800      0.0000      0.0000      7.4000
+    527.2100      0.0000      0.0000      7.4000
+    527.8400      0.0000      0.0000      7.4000
+    528.4700      0.0000      0.0000      7.3900
+    529.1100      0.0000      0.0000      7.3900
+    529.7400      0.0000      0.0000      7.4000
+    530.3700      0.0000      0.0000      7.4000
+    531.0000      0.0000      0.0000      7.3900
+    531.6400      0.0000      0.0000      7.3900
+    532.2700      0.0000      0.0000      7.3900
+    532.9000      0.0000      0.0000      7.3900
+    533.5300      0.0000      0.0000      7.3900
+    534.1700      0.0000      0.0000      7.3900
+    534.8000      0.0000      0.0000      7.3900
+    535.4300      0.0000      0.0000      7.3900
+    536.0600      0.0000      0.0000      7.3900
+    536.6900      0.0000      0.0000      7.3900
+    537.3300      0.0000      0.0000      7.3900
+    537.9600      0.0000      0.0000      7.3900
+    538.5900      0.0000      0.0000      7.3900
+    539.2200      0.0000      0.0000      7.3800
+    539.8500      0.0000      0.0000      7.3700
+    540.4800      0.0000      0.0000      7.3600
+    541.1200      0.0000      0.0000      7.3500
+    541.7500      0.0000      0.0000      7.3400
+    542.3800      0.0000      0.0000      7.3400
+    543.0100      0.0000      0.0000      7.3300
+    543.6400      0.0000      0.0000      7.3300
+    544.2700      0.0000      0.0000      7.3200
+    544.9100      0.0000      0.0000      7.3200
+    545.5400      0.0000      0.0000      7.3100
+    546.1700      0.0000      0.0000      7.3000
+    546.8000      0.0000      0.0000      7.2900
+    547.4300      0.0000      0.0000      7.2900
+    548.0600      0.0000      0.0000      7.2800
+    548.6900      0.0000      0.0000      7.2700
+    549.3200      0.0000      0.0000      7.2500
+    549.9500      0.0000      0.0000      7.2400
+    550.5900      0.0000      0.0000      7.2300
+    551.2200      0.0000      0.0000      7.2200
+    551.8500      0.0000      0.0000      7.2100
+    552.4800      0.0000      0.0000      7.2000
+    553.1100      0.0000      0.0000      7.2000
+    553.7400      0.0000      0.0000      7.1900
+    554.3700      0.0000      0.0000      7.1800
+    555.0000      0.0000      0.0000      7.1700
+    555.6300      0.0000      0.0000      7.1700
+    556.2600      0.0000      0.0000      7.1600
+    556.8900      0.0000      0.0000      7.1500
+    557.5200      0.0000      0.0000      7.1500
+    558.1500      0.0000      0.0000      7.1500
+    558.7800      0.0000      0.0000      7.1500
+    559.4200      0.0000      0.0000      7.1500
+    560.0500      0.0000      0.0000      7.1500
+    560.6800      0.0000      0.0000      7.1500
+    561.3100      0.0000      0.0000      7.1500
+    561.9400      0.0000      0.0000      7.1500
+    562.5700      0.0000      0.0000      7.1500
+    563.2000      0.0000      0.0000      7.1500
+    563.8300      0.0000      0.0000      7.1400
+    564.4600      0.0000      0.0000      7.1400
+    565.0900      0.0000      0.0000      7.1400
+    565.7200      0.0000      0.0000      7.1400
+    566.3500      0.0000      0.0000      7.1400
+    566.9800      0.0000      0.0000      7.1400
+    567.6100      0.0000      0.0000      7.1300
+    568.2400      0.0000      0.0000      7.1300
+    568.8700      0.0000      0.0000      7.1200
+    569.5000      0.0000      0.0000      7.1100
+    570.1200      0.0000      0.0000      7.1000
+    570.7500      0.0000      0.0000      7.0900
+    571.3800      0.0000      0.0000      7.0700
+    572.0100      0.0000      0.0000      7.0600
+    572.6400      0.0000      0.0000      7.0500
+    573.2700      0.0000      0.0000      7.0400
+    573.9000      0.0000      0.0000      7.0400
+    574.5300      0.0000      0.0000      7.0300
+    575.1600      0.0000      0.0000      7.0300
+    575.7900      0.0000      0.0000      7.0300
+    576.4200      0.0000      0.0000      7.0200
+    577.0500      0.0000      0.0000      7.0100
+    577.6800      0.0000      0.0000      7.0000
+    578.3100      0.0000      0.0000      7.0000
+    578.9300      0.0000      0.0000      6.9900
+    579.5600      0.0000      0.0000      6.9900
+    580.1900      0.0000      0.0000      6.9900
+    580.8200      0.0000      0.0000      6.9800
+    581.4500      0.0000      0.0000      6.9700
+    582.0800      0.0000      0.0000      6.9700
+    582.7100      0.0000      0.0000      6.9700
+    583.3400      0.0000      0.0000      6.9700
+    583.9700      0.0000      0.0000      6.9700
+    584.5900      0.0000      0.0000      6.9700
+    585.2200      0.0000      0.0000      6.9700
+    585.8500      0.0000      0.0000      6.9700
+    586.4800      0.0000      0.0000      6.9600
+    587.1100      0.0000      0.0000      6.9600
+    587.7400      0.0000      0.0000      6.9600
+    588.3600      0.0000      0.0000      6.9500
+    588.9900      0.0000      0.0000      6.9500
+    589.6200      0.0000      0.0000      6.9500
+    590.2500      0.0000      0.0000      6.9400
+    590.8800      0.0000      0.0000      6.9400
+    591.5000      0.0000      0.0000      6.9400
+    592.1300      0.0000      0.0000      6.9300
+    592.7600      0.0000      0.0000      6.9300
+    593.3900      0.0000      0.0000      6.9300
+    594.0200      0.0000      0.0000      6.9300
+    594.6400      0.0000      0.0000      6.9200
+    595.2700      0.0000      0.0000      6.9200
+    595.9000      0.0000      0.0000      6.9200
+    596.5300      0.0000      0.0000      6.9100
+    597.1600      0.0000      0.0000      6.9100
+    597.7800      0.0000      0.0000      6.9100
+    598.4100      0.0000      0.0000      6.9000
+    599.0400      0.0000      0.0000      6.9000
+    599.6700      0.0000      0.0000      6.8900
+    600.2900      0.0000      0.0000      6.8800
+    600.9200      0.0000      0.0000      6.8800
+    601.5500      0.0000      0.0000      6.8700
+    602.1800      0.0000      0.0000      6.8700
+    602.8000      0.0000      0.0000      6.8600
+    603.4300      0.0000      0.0000      6.8500
+    604.0600      0.0000      0.0000      6.8400
+    604.6800      0.0000      0.0000      6.8300
+    605.3100      0.0000      0.0000      6.8200
+    605.9400      0.0000      0.0000      6.8200
+    606.5700      0.0000      0.0000      6.8200
+    607.1900      0.0000      0.0000      6.8100
+    607.8200      0.0000      0.0000      6.8100
+    608.4500      0.0000      0.0000      6.8100
+    609.0700      0.0000      0.0000      6.8000
+    609.7000      0.0000      0.0000      6.8000
+    610.3300      0.0000      0.0000      6.7900
+    610.9500      0.0000      0.0000      6.7900
+    611.5800      0.0000      0.0000      6.7800
+    612.2100      0.0000      0.0000      6.7800
+    612.8300      0.0000      0.0000      6.7700
+    613.4600      0.0000      0.0000      6.7700
+    614.0900      0.0000      0.0000      6.7700
+    614.7100      0.0000      0.0000      6.7700
+    615.3400      0.0000      0.0000      6.7700
+    615.9700      0.0000      0.0000      6.7700
+    616.5900      0.0000      0.0000      6.7600
+    617.2200      0.0000      0.0000      6.7600
+    617.8400      0.0000      0.0000      6.7500
+    618.4700      0.0000      0.0000      6.7500
+    619.1000      0.0000      0.0000      6.7500
+    619.7200      0.0000      0.0000      6.7500
+    620.3500      0.0000      0.0000      6.7400
+    620.9700      0.0000      0.0000      6.7400
+    621.6000      0.0000      0.0000      6.7400
+    622.2300      0.0000      0.0000      6.7400
+    622.8500      0.0000      0.0000      6.7300
+    623.4800      0.0000      0.0000      6.7300
+    624.1000      0.0000      0.0000      6.7200
+    624.7300      0.0000      0.0000      6.7200
+    625.3500      0.0000      0.0000      6.7100
+    625.9800      0.0000      0.0000      6.7100
+    626.6100      0.0000      0.0000      6.7100
+    627.2300      0.0000      0.0000      6.7000
+    627.8600      0.0000      0.0000      6.7000
+    628.4800      0.0000      0.0000      6.6900
+    629.1100      0.0000      0.0000      6.6800
+    629.7300      0.0000      0.0000      6.6700
+    630.3600      0.0000      0.0000      6.6700
+    630.9800      0.0000      0.0000      6.6700
+    631.6100      0.0000      0.0000      6.6700
+    632.2300      0.0000      0.0000      6.6600
+    632.8600      0.0000      0.0000      6.6500
+    633.4800      0.0000      0.0000      6.6400
+    634.1100      0.0000      0.0000      6.6400
+    634.7300      0.0000      0.0000      6.6400
+    635.3600      0.0000      0.0000      6.6300
+    635.9800      0.0000      0.0000      6.6300
+    636.6100      0.0000      0.0000      6.6300
+    637.2300      0.0000      0.0000      6.6300
+    637.8600      0.0000      0.0000      6.6300
+    638.4800      0.0000      0.0000      6.6200
+    639.1100      0.0000      0.0000      6.6200
+    639.7300      0.0000      0.0000      6.6200
+    640.3600      0.0000      0.0000      6.6200
+    640.9800      0.0000      0.0000      6.6200
+    641.6100      0.0000      0.0000      6.6200
+    642.2300      0.0000      0.0000      6.6200
+    642.8500      0.0000      0.0000      6.6100
+    643.4800      0.0000      0.0000      6.6100
+    644.1000      0.0000      0.0000      6.6100
+    644.7300      0.0000      0.0000      6.6100
+    645.3500      0.0000      0.0000      6.6000
+    645.9800      0.0000      0.0000      6.6100
+    646.6000      0.0000      0.0000      6.6000
+    647.2200      0.0000      0.0000      6.6000
+    647.8500      0.0000      0.0000      6.6000
+    648.4700      0.0000      0.0000      6.6000
+    649.1000      0.0000      0.0000      6.5900
+    649.7200      0.0000      0.0000      6.5900
+    650.3400      0.0000      0.0000      6.5800
+    650.9700      0.0000      0.0000      6.5800
+    651.5900      0.0000      0.0000      6.5800
+    652.2200      0.0000      0.0000      6.5800
+    652.8400      0.0000      0.0000      6.5700
+    653.4600      0.0000      0.0000      6.5700
+    654.0900      0.0000      0.0000      6.5700
+    654.7100      0.0000      0.0000      6.5600
+    655.3300      0.0000      0.0000      6.5500
+    655.9600      0.0000      0.0000      6.5400
+    656.5800      0.0000      0.0000      6.5300
+    657.2000      0.0000      0.0000      6.5200
+    657.8300      0.0000      0.0000      6.5200
+    658.4500      0.0000      0.0000      6.5100
+    659.0700      0.0000      0.0000      6.5000
+    659.7000      0.0000      0.0000      6.4900
+    660.3200      0.0000      0.0000      6.4800
+    660.9400      0.0000      0.0000      6.4700
+    661.5700      0.0000      0.0000      6.4600
+    662.1900      0.0000      0.0000      6.4600
+    662.8100      0.0000      0.0000      6.4500
+    663.4300      0.0000      0.0000      6.4500
+    664.0600      0.0000      0.0000      6.4400
+    664.6800      0.0000      0.0000      6.4300
+    665.3000      0.0000      0.0000      6.4200
+    665.9300      0.0000      0.0000      6.4100
+    666.5500      0.0000      0.0000      6.4000
+    667.1700      0.0000      0.0000      6.3900
+    667.7900      0.0000      0.0000      6.3800
+    668.4200      0.0000      0.0000      6.3700
+    669.0400      0.0000      0.0000      6.3600
+    669.6600      0.0000      0.0000      6.3500
+    670.2800      0.0000      0.0000      6.3400
+    670.9100      0.0000      0.0000      6.3400
+    671.5300      0.0000      0.0000      6.3400
+    672.1500      0.0000      0.0000      6.3400
+    672.7700      0.0000      0.0000      6.3300
+    673.3900      0.0000      0.0000      6.3300
+    674.0200      0.0000      0.0000      6.3300
+    674.6400      0.0000      0.0000      6.3300
+    675.2600      0.0000      0.0000      6.3200
+    675.8800      0.0000      0.0000      6.3200
+    676.5100      0.0000      0.0000      6.3200
+    677.1300      0.0000      0.0000      6.3100
+    677.7500      0.0000      0.0000      6.3100
+    678.3700      0.0000      0.0000      6.3000
+    678.9900      0.0000      0.0000      6.2900
+    679.6100      0.0000      0.0000      6.2800
+    680.2400      0.0000      0.0000      6.2800
+    680.8600      0.0000      0.0000      6.2700
+    681.4800      0.0000      0.0000      6.2500
+    682.1000      0.0000      0.0000      6.2300
+    682.7200      0.0000      0.0000      6.2300
+    683.3400      0.0000      0.0000      6.2200
+    683.9700      0.0000      0.0000      6.2200
+    684.5900      0.0000      0.0000      6.2200
+    685.2100      0.0000      0.0000      6.2100
+    685.8300      0.0000      0.0000      6.2100
+    686.4500      0.0000      0.0000      6.2100
+    687.0700      0.0000      0.0000      6.2100
+    687.6900      0.0000      0.0000      6.2100
+    688.3100      0.0000      0.0000      6.2000
+    688.9300      0.0000      0.0000      6.2000
+    689.5600      0.0000      0.0000      6.2000
+    690.1800      0.0000      0.0000      6.2000
+    690.8000      0.0000      0.0000      6.2000
+    691.4200      0.0000      0.0000      6.1900
+    692.0400      0.0000      0.0000      6.1900
+    692.6600      0.0000      0.0000      6.1800
+    693.2800      0.0000      0.0000      6.1800
+    693.9000      0.0000      0.0000      6.1800
+    694.5200      0.0000      0.0000      6.1800
+    695.1400      0.0000      0.0000      6.1700
+    695.7600      0.0000      0.0000      6.1600
+    696.3800      0.0000      0.0000      6.1600
+    697.0000      0.0000      0.0000      6.1500
+    697.6200      0.0000      0.0000      6.1500
+    698.2500      0.0000      0.0000      6.1400
+    698.8700      0.0000      0.0000      6.1400
+    699.4900      0.0000      0.0000      6.1300
+    700.1100      0.0000      0.0000      6.1300
+    700.7300      0.0000      0.0000      6.1300
+    701.3500      0.0000      0.0000      6.1300
+    701.9700      0.0000      0.0000      6.1200
+    702.5900      0.0000      0.0000      6.1200
+    703.2100      0.0000      0.0000      6.1200
+    703.8300      0.0000      0.0000      6.1100
+    704.4500      0.0000      0.0000      6.1100
+    705.0700      0.0000      0.0000      6.1000
+    705.6900      0.0000      0.0000      6.1000
+    706.3100      0.0000      0.0000      6.1000
+    706.9300      0.0000      0.0000      6.1000
+    707.5500      0.0000      0.0000      6.1000
+    708.1700      0.0000      0.0000      6.0900
+    708.7800      0.0000      0.0000      6.0800
+    709.4000      0.0000      0.0000      6.0700
+    710.0200      0.0000      0.0000      6.0700
+    710.6400      0.0000      0.0000      6.0600
+    711.2600      0.0000      0.0000      6.0600
+    711.8800      0.0000      0.0000      6.0500
+    712.5000      0.0000      0.0000      6.0500
+    713.1200      0.0000      0.0000      6.0400
+    713.7400      0.0000      0.0000      6.0400
+    714.3600      0.0000      0.0000      6.0400
+    714.9800      0.0000      0.0000      6.0400
+    715.6000      0.0000      0.0000      6.0300
+    716.2200      0.0000      0.0000      6.0300
+    716.8400      0.0000      0.0000      6.0300
+    717.4600      0.0000      0.0000      6.0200
+    718.0700      0.0000      0.0000      6.0200
+    718.6900      0.0000      0.0000      6.0200
+    719.3100      0.0000      0.0000      6.0100
+    719.9300      0.0000      0.0000      6.0100
+    720.5500      0.0000      0.0000      6.0100
+    721.1700      0.0000      0.0000      6.0100
+    721.7900      0.0000      0.0000      6.0000
+    722.4100      0.0000      0.0000      6.0000
+    723.0200      0.0000      0.0000      6.0000
+    723.6400      0.0000      0.0000      6.0000
+    724.2600      0.0000      0.0000      6.0000
+    724.8800      0.0000      0.0000      6.0000
+    725.5000      0.0000      0.0000      5.9900
+    726.1200      0.0000      0.0000      5.9900
+    726.7300      0.0000      0.0000      5.9900
+    727.3500      0.0000      0.0000      5.9900
+    727.9700      0.0000      0.0000      5.9900
+    728.5900      0.0000      0.0000      5.9800
+    729.2100      0.0000      0.0000      5.9800
+    729.8300      0.0000      0.0000      5.9800
+    730.4400      0.0000      0.0000      5.9800
+    731.0600      0.0000      0.0000      5.9800
+    731.6800      0.0000      0.0000      5.9800
+    732.3000      0.0000      0.0000      5.9800
+    732.9200      0.0000      0.0000      5.9800
+    733.5300      0.0000      0.0000      5.9700
+    734.1500      0.0000      0.0000      5.9700
+    734.7700      0.0000      0.0000      5.9700
+    735.3900      0.0000      0.0000      5.9700
+    736.0000      0.0000      0.0000      5.9700
+    736.6200      0.0000      0.0000      5.9600
+    737.2400      0.0000      0.0000      5.9600
+    737.8600      0.0000      0.0000      5.9600
+    738.4700      0.0000      0.0000      5.9600
+    739.0900      0.0000      0.0000      5.9600
+    739.7100      0.0000      0.0000      5.9500
+    740.3300      0.0000      0.0000      5.9500
+    740.9400      0.0000      0.0000      5.9500
+    741.5600      0.0000      0.0000      5.9500
+    742.1800      0.0000      0.0000      5.9500
+    742.7900      0.0000      0.0000      5.9500
+    743.4100      0.0000      0.0000      5.9500
+    744.0300      0.0000      0.0000      5.9500
+    744.6500      0.0000      0.0000      5.9400
+    745.2600      0.0000      0.0000      5.9400
+    745.8800      0.0000      0.0000      5.9400
+    746.5000      0.0000      0.0000      5.9400
+    747.1100      0.0000      0.0000      5.9400
+    747.7300      0.0000      0.0000      5.9400
+    748.3500      0.0000      0.0000      5.9400
+    748.9600      0.0000      0.0000      5.9300
+    749.5800      0.0000      0.0000      5.9300
+    750.2000      0.0000      0.0000      5.9300
+    750.8100      0.0000      0.0000      5.9300
+    751.4300      0.0000      0.0000      5.9300
+    752.0500      0.0000      0.0000      5.9300
+    752.6600      0.0000      0.0000      5.9300
+    753.2800      0.0000      0.0000      5.9200
+    753.9000      0.0000      0.0000      5.9200
+    754.5100      0.0000      0.0000      5.9200
+    755.1300      0.0000      0.0000      5.9100
+    755.7400      0.0000      0.0000      5.9000
+    756.3600      0.0000      0.0000      5.8900
+    756.9800      0.0000      0.0000      5.8800
+    757.5900      0.0000      0.0000      5.8700
+    758.2100      0.0000      0.0000      5.8600
+    758.8200      0.0000      0.0000      5.8600
+    759.4400      0.0000      0.0000      5.8600
+    760.0600      0.0000      0.0000      5.8600
+    760.6700      0.0000      0.0000      5.8600
+    761.2900      0.0000      0.0000      5.8600
+    761.9000      0.0000      0.0000      5.8600
+    762.5200      0.0000      0.0000      5.8600
+    763.1400      0.0000      0.0000      5.8600
+    763.7500      0.0000      0.0000      5.8600
+    764.3700      0.0000      0.0000      5.8600
+    764.9800      0.0000      0.0000      5.8600
+    765.6000      0.0000      0.0000      5.8600
+    766.2100      0.0000      0.0000      5.8600
+    766.8300      0.0000      0.0000      5.8600
+    767.4400      0.0000      0.0000      5.8600
+    768.0600      0.0000      0.0000      5.8600
+    768.6700      0.0000      0.0000      5.8600
+    769.2900      0.0000      0.0000      5.8600
+    769.9000      0.0000      0.0000      5.8600
+    770.5200      0.0000      0.0000      5.8600
+    771.1400      0.0000      0.0000      5.8600
+    771.7500      0.0000      0.0000      5.8600
+    772.3700      0.0000      0.0000      5.8600
+    772.9800      0.0000      0.0000      5.8600
+    773.5900      0.0000      0.0000      5.8600
+    774.2100      0.0000      0.0000      5.8500
+    774.8200      0.0000      0.0000      5.8500
+    775.4400      0.0000      0.0000      5.8500
+    776.0500      0.0000      0.0000      5.8400
+    776.6700      0.0000      0.0000      5.8400
+    777.2800      0.0000      0.0000      5.8400
+    777.9000      0.0000      0.0000      5.8400
+    778.5100      0.0000      0.0000      5.8300
+    779.1300      0.0000      0.0000      5.8300
+    779.7400      0.0000      0.0000      5.8300
+    780.3600      0.0000      0.0000      5.8300
+    780.9700      0.0000      0.0000      5.8200
+    781.5800      0.0000      0.0000      5.8200
+    782.2000      0.0000      0.0000      5.8100
+    782.8100      0.0000      0.0000      5.8000
+    783.4300      0.0000      0.0000      5.8000
+    784.0400      0.0000      0.0000      5.8000
+    784.6600      0.0000      0.0000      5.8000
+    785.2700      0.0000      0.0000      5.8000
+    785.8800      0.0000      0.0000      5.8000
+    786.5000      0.0000      0.0000      5.7900
+    787.1100      0.0000      0.0000      5.7900
+    787.7300      0.0000      0.0000      5.7900
+    788.3400      0.0000      0.0000      5.7900
+    788.9500      0.0000      0.0000      5.7900
+    789.5700      0.0000      0.0000      5.7900
+    790.1800      0.0000      0.0000      5.7900
+    790.7900      0.0000      0.0000      5.7800
+    791.4100      0.0000      0.0000      5.7800
+    792.0200      0.0000      0.0000      5.7700
+    792.6300      0.0000      0.0000      5.7700
+    793.2500      0.0000      0.0000      5.7600
+    793.8600      0.0000      0.0000      5.7600
+    794.4700      0.0000      0.0000      5.7600
+    795.0900      0.0000      0.0000      5.7600
+    795.7000      0.0000      0.0000      5.7600
+    796.3100      0.0000      0.0000      5.7600
+    796.9300      0.0000      0.0000      5.7600
+    797.5400      0.0000      0.0000      5.7500
+    798.1500      0.0000      0.0000      5.7500
+    798.7700      0.0000      0.0000      5.7500
+    799.3800      0.0000      0.0000      5.7500
+    799.9900      0.0000      0.0000      5.7500
+    800.6100      0.0000      0.0000      5.7400
+    801.2200      0.0000      0.0000      5.7400
+    801.8300      0.0000      0.0000      5.7400
+    802.4400      0.0000      0.0000      5.7400
+    803.0600      0.0000      0.0000      5.7300
+    803.6700      0.0000      0.0000      5.7300
+    804.2800      0.0000      0.0000      5.7200
+    804.9000      0.0000      0.0000      5.7100
+    805.5100      0.0000      0.0000      5.7100
+    806.1200      0.0000      0.0000      5.7100
+    806.7300      0.0000      0.0000      5.7000
+    807.3400      0.0000      0.0000      5.6900
+    807.9600      0.0000      0.0000      5.6900
+    808.5700      0.0000      0.0000      5.6900
+    809.1800      0.0000      0.0000      5.6900
+    809.7900      0.0000      0.0000      5.6800
+    810.4100      0.0000      0.0000      5.6800
+    811.0200      0.0000      0.0000      5.6800
+    811.6300      0.0000      0.0000      5.6700
+    812.2400      0.0000      0.0000      5.6700
+    812.8500      0.0000      0.0000      5.6700
+    813.4700      0.0000      0.0000      5.6700
+    814.0800      0.0000      0.0000      5.6700
+    814.6900      0.0000      0.0000      5.6700
+    815.3000      0.0000      0.0000      5.6700
+    815.9100      0.0000      0.0000      5.6700
+    816.5300      0.0000      0.0000      5.6600
+    817.1400      0.0000      0.0000      5.6600
+    817.7500      0.0000      0.0000      5.6600
+    818.3600      0.0000      0.0000      5.6500
+    818.9700      0.0000      0.0000      5.6500
+    819.5800      0.0000      0.0000      5.6400
+    820.2000      0.0000      0.0000      5.6400
+    820.8100      0.0000      0.0000      5.6200
+    821.4200      0.0000      0.0000      5.6100
+    822.0300      0.0000      0.0000      5.6000
+    822.6400      0.0000      0.0000      5.5900
+    823.2500      0.0000      0.0000      5.5900
+    823.8600      0.0000      0.0000      5.5800
+    824.4700      0.0000      0.0000      5.5700
+    825.0900      0.0000      0.0000      5.5700
+    825.7000      0.0000      0.0000      5.5600
+    826.3100      0.0000      0.0000      5.5600
+    826.9200      0.0000      0.0000      5.5500
+    827.5300      0.0000      0.0000      5.5500
+    828.1400      0.0000      0.0000      5.5500
+    828.7500      0.0000      0.0000      5.5500
+    829.3600      0.0000      0.0000      5.5500
+    829.9700      0.0000      0.0000      5.5500
+    830.5800      0.0000      0.0000      5.5400
+    831.1900      0.0000      0.0000      5.5400
+    831.8000      0.0000      0.0000      5.5300
+    832.4200      0.0000      0.0000      5.5200
+    833.0300      0.0000      0.0000      5.5200
+    833.6400      0.0000      0.0000      5.5200
+    834.2500      0.0000      0.0000      5.5100
+    834.8600      0.0000      0.0000      5.5100
+    835.4700      0.0000      0.0000      5.5100
+    836.0800      0.0000      0.0000      5.5100
+    836.6900      0.0000      0.0000      5.5000
+    837.3000      0.0000      0.0000      5.5000
+    837.9100      0.0000      0.0000      5.5000
+    838.5200      0.0000      0.0000      5.4900
+    839.1300      0.0000      0.0000      5.4900
+    839.7400      0.0000      0.0000      5.4800
+    840.3500      0.0000      0.0000      5.4800
+    840.9600      0.0000      0.0000      5.4700
+    841.5700      0.0000      0.0000      5.4700
+    842.1800      0.0000      0.0000      5.4700
+    842.7900      0.0000      0.0000      5.4700
+    843.4000      0.0000      0.0000      5.4700
+    844.0100      0.0000      0.0000      5.4700
+    844.6200      0.0000      0.0000      5.4700
+    845.2300      0.0000      0.0000      5.4700
+    845.8400      0.0000      0.0000      5.4700
+    846.4500      0.0000      0.0000      5.4600
+    847.0600      0.0000      0.0000      5.4600
+    847.6700      0.0000      0.0000      5.4700
+    848.2700      0.0000      0.0000      5.4700
+    848.8800      0.0000      0.0000      5.4700
+    849.4900      0.0000      0.0000      5.4700
+    850.1000      0.0000      0.0000      5.4700
+    850.7100      0.0000      0.0000      5.4700
+    851.3200      0.0000      0.0000      5.4700
+    851.9300      0.0000      0.0000      5.4700
+    852.5400      0.0000      0.0000      5.4600
+    853.1500      0.0000      0.0000      5.4600
+    853.7600      0.0000      0.0000      5.4600
+    854.3700      0.0000      0.0000      5.4500
+    854.9800      0.0000      0.0000      5.4500
+    855.5800      0.0000      0.0000      5.4500
+    856.1900      0.0000      0.0000      5.4500
+    856.8000      0.0000      0.0000      5.4400
+    857.4100      0.0000      0.0000      5.4300
+    858.0200      0.0000      0.0000      5.4300
+    858.6300      0.0000      0.0000      5.4300
+    859.2400      0.0000      0.0000      5.4300
+    859.8500      0.0000      0.0000      5.4300
+    860.4500      0.0000      0.0000      5.4200
+    861.0600      0.0000      0.0000      5.4200
+    861.6700      0.0000      0.0000      5.4100
+    862.2800      0.0000      0.0000      5.4000
+    862.8900      0.0000      0.0000      5.3900
+    863.5000      0.0000      0.0000      5.3800
+    864.1000      0.0000      0.0000      5.3600
+    864.7100      0.0000      0.0000      5.3400
+    865.3200      0.0000      0.0000      5.3200
+    865.9300      0.0000      0.0000      5.3100
+    866.5400      0.0000      0.0000      5.3000
+    867.1400      0.0000      0.0000      5.2900
+    867.7500      0.0000      0.0000      5.2800
+    868.3600      0.0000      0.0000      5.2700
+    868.9700      0.0000      0.0000      5.2700
+    869.5800      0.0000      0.0000      5.2600
+    870.1800      0.0000      0.0000      5.2600
+    870.7900      0.0000      0.0000      5.2600
+    871.4000      0.0000      0.0000      5.2600
+    872.0100      0.0000      0.0000      5.2600
+    872.6100      0.0000      0.0000      5.2600
+    873.2200      0.0000      0.0000      5.2500
+    873.8300      0.0000      0.0000      5.2500
+    874.4400      0.0000      0.0000      5.2500
+    875.0400      0.0000      0.0000      5.2500
+    875.6500      0.0000      0.0000      5.2500
+    876.2600      0.0000      0.0000      5.2500
+    876.8700      0.0000      0.0000      5.2500
+    877.4700      0.0000      0.0000      5.2500
+    878.0800      0.0000      0.0000      5.2500
+    878.6900      0.0000      0.0000      5.2500
+    879.2900      0.0000      0.0000      5.2500
+    879.9000      0.0000      0.0000      5.2500
+    880.5100      0.0000      0.0000      5.2500
+    881.1200      0.0000      0.0000      5.2400
+    881.7200      0.0000      0.0000      5.2500
+    882.3300      0.0000      0.0000      5.2500
+    882.9400      0.0000      0.0000      5.2400
+    883.5400      0.0000      0.0000      5.2500
+    884.1500      0.0000      0.0000      5.2400
+    884.7600      0.0000      0.0000      5.2400
+    885.3600      0.0000      0.0000      5.2400
+    885.9700      0.0000      0.0000      5.2400
+    886.5800      0.0000      0.0000      5.2400
+    887.1800      0.0000      0.0000      5.2400
+    887.7900      0.0000      0.0000      5.2400
+    888.4000      0.0000      0.0000      5.2400
+    889.0000      0.0000      0.0000      5.2400
+    889.6100      0.0000      0.0000      5.2400
+    890.2200      0.0000      0.0000      5.2400
+    890.8200      0.0000      0.0000      5.2400
+    891.4300      0.0000      0.0000      5.2400
+    892.0300      0.0000      0.0000      5.2400
+    892.6400      0.0000      0.0000      5.2400
+    893.2500      0.0000      0.0000      5.2400
+    893.8500      0.0000      0.0000      5.2300
+    894.4600      0.0000      0.0000      5.2300
+    895.0600      0.0000      0.0000      5.2300
+    895.6700      0.0000      0.0000      5.2300
+    896.2800      0.0000      0.0000      5.2300
+    896.8800      0.0000      0.0000      5.2300
+    897.4900      0.0000      0.0000      5.2300
+    898.0900      0.0000      0.0000      5.2300
+    898.7000      0.0000      0.0000      5.2300
+    899.3000      0.0000      0.0000      5.2300
+    899.9100      0.0000      0.0000      5.2300
+    900.5200      0.0000      0.0000      5.2300
+    901.1200      0.0000      0.0000      5.2200
+    901.7300      0.0000      0.0000      5.2200
+    902.3300      0.0000      0.0000      5.2200
+    902.9400      0.0000      0.0000      5.2200
+    903.5400      0.0000      0.0000      5.2200
+    904.1500      0.0000      0.0000      5.2200
+    904.7500      0.0000      0.0000      5.2200
+    905.3600      0.0000      0.0000      5.2100
+    905.9600      0.0000      0.0000      5.2100
+    906.5700      0.0000      0.0000      5.2100
+    907.1700      0.0000      0.0000      5.2100
+    907.7800      0.0000      0.0000      5.2100
+    908.3800      0.0000      0.0000      5.2000
+    908.9900      0.0000      0.0000      5.2000
+    909.5900      0.0000      0.0000      5.2000
+    910.2000      0.0000      0.0000      5.2000
+    910.8000      0.0000      0.0000      5.2000
+    911.4100      0.0000      0.0000      5.2000
+    912.0100      0.0000      0.0000      5.2000
+    912.6200      0.0000      0.0000      5.2000
+    913.2200      0.0000      0.0000      5.2000
+    913.8300      0.0000      0.0000      5.2000
+    914.4300      0.0000      0.0000      5.2000
+    915.0300      0.0000      0.0000      5.2100
+    915.6400      0.0000      0.0000      5.2100
+    916.2400      0.0000      0.0000      5.2000
+    916.8500      0.0000      0.0000      5.2000
+    917.4500      0.0000      0.0000      5.2000
+    918.0600      0.0000      0.0000      5.2000
+    918.6600      0.0000      0.0000      5.2000
+    919.2600      0.0000      0.0000      5.2000
+    919.8700      0.0000      0.0000      5.2000
+    920.4700      0.0000      0.0000      5.1900
+    921.0800      0.0000      0.0000      5.1900
+    921.6800      0.0000      0.0000      5.1900
+    922.2800      0.0000      0.0000      5.1800
+    922.8900      0.0000      0.0000      5.1800
+    923.4900      0.0000      0.0000      5.1800
+    924.1000      0.0000      0.0000      5.1800
+    924.7000      0.0000      0.0000      5.1800
+    925.3000      0.0000      0.0000      5.1800
+    925.9100      0.0000      0.0000      5.1800
+    926.5100      0.0000      0.0000      5.1800
+    927.1100      0.0000      0.0000      5.1800
+    927.7200      0.0000      0.0000      5.1800
+    928.3200      0.0000      0.0000      5.1800
+    928.9200      0.0000      0.0000      5.1800
+    929.5300      0.0000      0.0000      5.1800
+    930.1300      0.0000      0.0000      5.1800
+    930.7400      0.0000      0.0000      5.1800
+    931.3400      0.0000      0.0000      5.1800
+    931.9400      0.0000      0.0000      5.1800
+    932.5400      0.0000      0.0000      5.1800
+    933.1500      0.0000      0.0000      5.1800
+    933.7500      0.0000      0.0000      5.1800
+    934.3500      0.0000      0.0000      5.1800
+    934.9600      0.0000      0.0000      5.1800
+    935.5600      0.0000      0.0000      5.1800
+    936.1600      0.0000      0.0000      5.1800
+    936.7700      0.0000      0.0000      5.1800
+    937.3700      0.0000      0.0000      5.1800
+    937.9700      0.0000      0.0000      5.3000
+    938.5700      0.0000      0.0000      6.3700
+    939.1800      0.0000      0.0000      9.3500
+    939.7800      0.0000      0.0000     13.0400
+    940.3800      0.0000      0.0000     15.1100
+    940.9800      0.0000      0.0000     16.0900
+    941.5900      0.0000      0.0000     16.7400
+    942.1900      0.0000      0.0000     17.2600
+    942.7900      0.0000      0.0000     17.7200
+    943.3900      0.0000      0.0000     18.1300
+    944.0000      0.0000      0.0000     18.5000
+    944.6000      0.0000      0.0000     18.8300
+    945.2000      0.0000      0.0000     19.1400
+    945.8000      0.0000      0.0000     19.4100
+    946.4000      0.0000      0.0000     19.6700
+    947.0100      0.0000      0.0000     19.8900
+    947.6100      0.0000      0.0000     20.1000
+    948.2100      0.0000      0.0000     20.2900
+    948.8100      0.0000      0.0000     20.4700
+    949.4100      0.0000      0.0000     21.0900
+    950.0200      0.0000      0.0000     34.9300
+    950.6200      0.0000      0.0000     35.5000
+    951.2200      0.0000      0.0000     35.5000
+    951.8200      0.0000      0.0000     35.5000
+    952.4200      0.0000      0.0000     35.5000
+    953.0300      0.0000      0.0000     35.5000
+    953.6300      0.0000      0.0000     35.5000
+    954.2300      0.0000      0.0000     35.5000
+    954.8300      0.0000      0.0000     35.5000
+    955.4300      0.0000      0.0000     35.5000
+    956.0300      0.0000      0.0000     35.5000
+    956.6300      0.0000      0.0000     35.5000
+    957.2400      0.0000      0.0000     35.5000
+    957.8400      0.0000      0.0000     35.5000
+    958.4400      0.0000      0.0000     35.5000
+    959.0400      0.0000      0.0000     35.5000
+    959.6400      0.0000      0.0000     35.5000
+    960.2400      0.0000      0.0000     35.5000
+    960.8400      0.0000      0.0000     35.5000
+    961.4400      0.0000      0.0000     35.5000
+    962.0400      0.0000      0.0000     35.5000
+    962.6400      0.0000      0.0000     35.5000
+    963.2500      0.0000      0.0000     35.5000
+    963.8500      0.0000      0.0000     35.5000
+    964.4500      0.0000      0.0000     35.5000
+    965.0500      0.0000      0.0000     35.5000
+    965.6500      0.0000      0.0000     35.5000
+    966.2500      0.0000      0.0000     35.5000
+    966.8500      0.0000      0.0000     35.5000
+    967.4500      0.0000      0.0000     35.5000
+    968.0500      0.0000      0.0000     35.5000
+    968.6500      0.0000      0.0000     35.5000
+    969.2500      0.0000      0.0000     35.5000
+    969.8500      0.0000      0.0000     35.5000
+    970.4500      0.0000      0.0000     35.5000
+    971.0500      0.0000      0.0000     35.5000
+    971.6500      0.0000      0.0000     35.5000
+    972.2500      0.0000      0.0000     35.5000
+    972.8500      0.0000      0.0000     35.5000
+    973.4500      0.0000      0.0000     35.5000
+    974.0500      0.0000      0.0000     35.5000
+    974.6500      0.0000      0.0000     35.5000
+    975.2500      0.0000      0.0000     35.5000
+    975.8500      0.0000      0.0000     35.5000
+    976.4500      0.0000      0.0000     35.5000
+    977.0500      0.0000      0.0000     35.5000
+    977.6500      0.0000      0.0000     35.5000
+    978.2500      0.0000      0.0000     35.5000
+    978.8500      0.0000      0.0000     35.5000
+    979.4500      0.0000      0.0000     35.5000
+    980.0500      0.0000      0.0000     35.5000
+    980.6500      0.0000      0.0000     35.5000
+    981.2500      0.0000      0.0000     35.5000
+    981.8500      0.0000      0.0000     35.5000
+    982.4500      0.0000      0.0000     35.5000
+    983.0500      0.0000      0.0000     35.5000
+    983.6500      0.0000      0.0000     35.5000
+    984.2500      0.0000      0.0000     35.5000
+    984.8500      0.0000      0.0000     35.5000
+    985.4500      0.0000      0.0000     35.5000
+    986.0400      0.0000      0.0000     35.5000
+    986.6400      0.0000      0.0000     35.5000
+    987.2400      0.0000      0.0000     35.5000
+    987.8400      0.0000      0.0000     35.5000
+    988.4400      0.0000      0.0000     35.5000
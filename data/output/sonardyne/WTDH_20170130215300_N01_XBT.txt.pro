@@ -0,0 +1,1539 @@
+test_read_store_and_write
+30/1/2017
+21:53:0
+Probe: Deep Blue
+Source: /root/package/data/input/aoml/WTDH_20170130215300_N01_XBT.txt
+      0.6700      0.0000      0.0000     26.3100
+      1.3400      0.0000      0.0000     26.2200
+      2.0100      0.0000      0.0000     26.2000
+      2.6800      0.0000      0.0000     26.1900
+      3.3400      0.0000      0.0000     26.1900
+      4.0100      0.0000      0.0000     26.1800
+      4.6800      0.0000      0.0000     26.1800
+      5.3500      0.0000      0.0000     26.1700
+      6.0200      0.0000      0.0000     26.1700
+      6.6900      0.0000      0.0000     26.1600
+      7.3600      0.0000      0.0000     26.1400
+      8.0300      0.0000      0.0000     26.1300
+      8.6900      0.0000      0.0000     26.1300
+      9.3600      0.0000      0.0000     26.1200
+     10.0300      0.0000      0.0000     26.1100
+     10.7000      0.0000      0.0000     26.1100
+     11.3700      0.0000      0.0000     26.1100
+     12.0400      0.0000      0.0000     26.1000
+     12.7000      0.0000      0.0000     26.1000
+     13.3700      0.0000      0.0000     26.1000
+     14.0400      0.0000      0.0000     26.1000
+     14.7100      0.0000      0.0000     26.0900
+     15.3800      0.0000      0.0000     26.0900
+     16.0500      0.0000      0.0000     26.0900
+     16.7100      0.0000      0.0000     26.0900
+     17.3800      0.0000      0.0000     26.0900
+     18.0500      0.0000      0.0000     26.0900
+     18.7200      0.0000      0.0000     26.0800
+     19.3800      0.0000      0.0000     26.0800
+     20.0500      0.0000      0.0000     26.0800
+     20.7200      0.0000      0.0000     26.0800
+     21.3900      0.0000      0.0000     26.0800
+     22.0600      0.0000      0.0000     26.0700
+     22.7200      0.0000      0.0000     26.0700
+     23.3900      0.0000      0.0000     26.0700
+     24.0600      0.0000      0.0000     26.0700
+     24.7300      0.0000      0.0000     26.0700
+     25.3900      0.0000      0.0000     26.0700
+     26.0600      0.0000      0.0000     26.0700
+     26.7300      0.0000      0.0000     26.0700
+     27.4000      0.0000      0.0000     26.0600
+     28.0600      0.0000      0.0000     26.0500
+     28.7300      0.0000      0.0000     26.0500
+     29.4000      0.0000      0.0000     26.0500
+     30.0600      0.0000      0.0000     26.0500
+     30.7300      0.0000      0.0000     26.0500
+     31.4000      0.0000      0.0000     26.0500
+     32.0600      0.0000      0.0000     26.0400
+     32.7300      0.0000      0.0000     26.0400
+     33.4000      0.0000      0.0000     26.0400
+     34.0700      0.0000      0.0000     26.0400
+     34.7300      0.0000      0.0000     26.0400
+     35.4000      0.0000      0.0000     26.0300
+     36.0700      0.0000      0.0000     26.0300
+     36.7300      0.0000      0.0000     26.0300
+     37.4000      0.0000      0.0000     26.0300
+     38.0700      0.0000      0.0000     26.0300
+     38.7300      0.0000      0.0000     26.0300
+     39.4000      0.0000      0.0000     26.0300
+     40.0600      0.0000      0.0000     26.0200
+     40.7300      0.0000      0.0000     26.0200
+     41.4000      0.0000      0.0000     26.0200
+     42.0600      0.0000      0.0000     26.0200
+     42.7300      0.0000      0.0000     26.0100
+     43.4000      0.0000      0.0000     26.0100
+     44.0600      0.0000      0.0000     26.0100
+     44.7300      0.0000      0.0000     26.0100
+     45.3900      0.0000      0.0000     26.0100
+     46.0600      0.0000      0.0000     26.0000
+     46.7300      0.0000      0.0000     25.9900
+     47.3900      0.0000      0.0000     25.9900
+     48.0600      0.0000      0.0000     25.9900
+     48.7200      0.0000      0.0000     25.9900
+     49.3900      0.0000      0.0000     25.9800
+     50.0600      0.0000      0.0000     25.9700
+     50.7200      0.0000      0.0000     25.9700
+     51.3900      0.0000      0.0000     25.9600
+     52.0500      0.0000      0.0000     25.9500
+     52.7200      0.0000      0.0000     25.9500
+     53.3800      0.0000      0.0000     25.9500
+     54.0500      0.0000      0.0000     25.9500
+     54.7100      0.0000      0.0000     25.9400
+     55.3800      0.0000      0.0000     25.9300
+     56.0500      0.0000      0.0000     25.9300
+     56.7100      0.0000      0.0000     25.9200
+     57.3800      0.0000      0.0000     25.9100
+     58.0400      0.0000      0.0000     25.9100
+     58.7100      0.0000      0.0000     25.9000
+     59.3700      0.0000      0.0000     25.9000
+     60.0400      0.0000      0.0000     25.8800
+     60.7000      0.0000      0.0000     25.8600
+     61.3700      0.0000      0.0000     25.8600
+     62.0300      0.0000      0.0000     25.8500
+     62.7000      0.0000      0.0000     25.8500
+     63.3600      0.0000      0.0000     25.8400
+     64.0300      0.0000      0.0000     25.8400
+     64.6900      0.0000      0.0000     25.8300
+     65.3600      0.0000      0.0000     25.8300
+     66.0200      0.0000      0.0000     25.8100
+     66.6800      0.0000      0.0000     25.7900
+     67.3500      0.0000      0.0000     25.7800
+     68.0100      0.0000      0.0000     25.7800
+     68.6800      0.0000      0.0000     25.7600
+     69.3400      0.0000      0.0000     25.7500
+     70.0100      0.0000      0.0000     25.7400
+     70.6700      0.0000      0.0000     25.7300
+     71.3400      0.0000      0.0000     25.7200
+     72.0000      0.0000      0.0000     25.7100
+     72.6600      0.0000      0.0000     25.6900
+     73.3300      0.0000      0.0000     25.6700
+     73.9900      0.0000      0.0000     25.6500
+     74.6600      0.0000      0.0000     25.6400
+     75.3200      0.0000      0.0000     25.6300
+     75.9800      0.0000      0.0000     25.6200
+     76.6500      0.0000      0.0000     25.6200
+     77.3100      0.0000      0.0000     25.6100
+     77.9800      0.0000      0.0000     25.6000
+     78.6400      0.0000      0.0000     25.5900
+     79.3000      0.0000      0.0000     25.5900
+     79.9700      0.0000      0.0000     25.5900
+     80.6300      0.0000      0.0000     25.5900
+     81.3000      0.0000      0.0000     25.5900
+     81.9600      0.0000      0.0000     25.6000
+     82.6200      0.0000      0.0000     25.6000
+     83.2900      0.0000      0.0000     25.6000
+     83.9500      0.0000      0.0000     25.6000
+     84.6100      0.0000      0.0000     25.6100
+     85.2800      0.0000      0.0000     25.6200
+     85.9400      0.0000      0.0000     25.6300
+     86.6000      0.0000      0.0000     25.6300
+     87.2700      0.0000      0.0000     25.6300
+     87.9300      0.0000      0.0000     25.6300
+     88.5900      0.0000      0.0000     25.6300
+     89.2600      0.0000      0.0000     25.6400
+     89.9200      0.0000      0.0000     25.6500
+     90.5800      0.0000      0.0000     25.6500
+     91.2400      0.0000      0.0000     25.6500
+     91.9100      0.0000      0.0000     25.6400
+     92.5700      0.0000      0.0000     25.6400
+     93.2300      0.0000      0.0000     25.6400
+     93.9000      0.0000      0.0000     25.6500
+     94.5600      0.0000      0.0000     25.6600
+     95.2200      0.0000      0.0000     25.6600
+     95.8800      0.0000      0.0000     25.6600
+     96.5500      0.0000      0.0000     25.6600
+     97.2100      0.0000      0.0000     25.6600
+     97.8700      0.0000      0.0000     25.6700
+     98.5300      0.0000      0.0000     25.6700
+     99.2000      0.0000      0.0000     25.6700
+     99.8600      0.0000      0.0000     25.6800
+    100.5200      0.0000      0.0000     25.6800
+    101.1800      0.0000      0.0000     25.6800
+    101.8500      0.0000      0.0000     25.6900
+    102.5100      0.0000      0.0000     25.6900
+    103.1700      0.0000      0.0000     25.7000
+    103.8300      0.0000      0.0000     25.7000
+    104.4900      0.0000      0.0000     25.7000
+    105.1600      0.0000      0.0000     25.7100
+    105.8200      0.0000      0.0000     25.7200
+    106.4800      0.0000      0.0000     25.7200
+    107.1400      0.0000      0.0000     25.7200
+    107.8000      0.0000      0.0000     25.7200
+    108.4700      0.0000      0.0000     25.7300
+    109.1300      0.0000      0.0000     25.7200
+    109.7900      0.0000      0.0000     25.7300
+    110.4500      0.0000      0.0000     25.7300
+    111.1100      0.0000      0.0000     25.7300
+    111.7700      0.0000      0.0000     25.7300
+    112.4400      0.0000      0.0000     25.7300
+    113.1000      0.0000      0.0000     25.7300
+    113.7600      0.0000      0.0000     25.7300
+    114.4200      0.0000      0.0000     25.7300
+    115.0800      0.0000      0.0000     25.7300
+    115.7400      0.0000      0.0000     25.7300
+    116.4000      0.0000      0.0000     25.7400
+    117.0600      0.0000      0.0000     25.7400
+    117.7300      0.0000      0.0000     25.7400
+    118.3900      0.0000      0.0000     25.7500
+    119.0500      0.0000      0.0000     25.7500
+    119.7100      0.0000      0.0000     25.7600
+    120.3700      0.0000      0.0000     25.7700
+    121.0300      0.0000      0.0000     25.7800
+    121.6900      0.0000      0.0000     25.8000
+    122.3500      0.0000      0.0000     25.8100
+    123.0100      0.0000      0.0000     25.8200
+    123.6700      0.0000      0.0000     25.8300
+    124.3300      0.0000      0.0000     25.8300
+    125.0000      0.0000      0.0000     25.8400
+    125.6600      0.0000      0.0000     25.8500
+    126.3200      0.0000      0.0000     25.8500
+    126.9800      0.0000      0.0000     25.8500
+    127.6400      0.0000      0.0000     25.8500
+    128.3000      0.0000      0.0000     25.8700
+    128.9600      0.0000      0.0000     25.8900
+    129.6200      0.0000      0.0000     25.8600
+    130.2800      0.0000      0.0000     25.8300
+    130.9400      0.0000      0.0000     25.7300
+    131.6000      0.0000      0.0000     25.6400
+    132.2600      0.0000      0.0000     25.4600
+    132.9200      0.0000      0.0000     25.0900
+    133.5800      0.0000      0.0000     24.7800
+    134.2400      0.0000      0.0000     24.4500
+    134.9000      0.0000      0.0000     24.1800
+    135.5600      0.0000      0.0000     24.0100
+    136.2200      0.0000      0.0000     23.8100
+    136.8800      0.0000      0.0000     23.5100
+    137.5400      0.0000      0.0000     23.2600
+    138.2000      0.0000      0.0000     22.9300
+    138.8600      0.0000      0.0000     22.6700
+    139.5200      0.0000      0.0000     22.5300
+    140.1800      0.0000      0.0000     22.4500
+    140.8400      0.0000      0.0000     22.3100
+    141.5000      0.0000      0.0000     22.0900
+    142.1600      0.0000      0.0000     21.7500
+    142.8200      0.0000      0.0000     21.2600
+    143.4800      0.0000      0.0000     20.8400
+    144.1400      0.0000      0.0000     20.5700
+    144.7900      0.0000      0.0000     20.3600
+    145.4500      0.0000      0.0000     20.1100
+    146.1100      0.0000      0.0000     19.9100
+    146.7700      0.0000      0.0000     19.8000
+    147.4300      0.0000      0.0000     19.7400
+    148.0900      0.0000      0.0000     19.6700
+    148.7500      0.0000      0.0000     19.5500
+    149.4100      0.0000      0.0000     19.4400
+    150.0700      0.0000      0.0000     19.3700
+    150.7300      0.0000      0.0000     19.2800
+    151.3900      0.0000      0.0000     19.1400
+    152.0400      0.0000      0.0000     18.9800
+    152.7000      0.0000      0.0000     18.8700
+    153.3600      0.0000      0.0000     18.7800
+    154.0200      0.0000      0.0000     18.6800
+    154.6800      0.0000      0.0000     18.5700
+    155.3400      0.0000      0.0000     18.4900
+    156.0000      0.0000      0.0000     18.4500
+    156.6500      0.0000      0.0000     18.4200
+    157.3100      0.0000      0.0000     18.3300
+    157.9700      0.0000      0.0000     18.1900
+    158.6300      0.0000      0.0000     18.1200
+    159.2900      0.0000      0.0000     18.1000
+    159.9500      0.0000      0.0000     18.0900
+    160.6000      0.0000      0.0000     18.0700
+    161.2600      0.0000      0.0000     18.0600
+    161.9200      0.0000      0.0000     18.0500
+    162.5800      0.0000      0.0000     18.0400
+    163.2400      0.0000      0.0000     18.0300
+    163.9000      0.0000      0.0000     18.0100
+    164.5500      0.0000      0.0000     18.0100
+    165.2100      0.0000      0.0000     18.0000
+    165.8700      0.0000      0.0000     17.9800
+    166.5300      0.0000      0.0000     17.9500
+    167.1800      0.0000      0.0000     17.9100
+    167.8400      0.0000      0.0000     17.8700
+    168.5000      0.0000      0.0000     17.8400
+    169.1600      0.0000      0.0000     17.8200
+    169.8200      0.0000      0.0000     17.8100
+    170.4700      0.0000      0.0000     17.8000
+    171.1300      0.0000      0.0000     17.7700
+    171.7900      0.0000      0.0000     17.6600
+    172.4500      0.0000      0.0000     17.5400
+    173.1000      0.0000      0.0000     17.4600
+    173.7600      0.0000      0.0000     17.4100
+    174.4200      0.0000      0.0000     17.3900
+    175.0700      0.0000      0.0000     17.3700
+    175.7300      0.0000      0.0000     17.3600
+    176.3900      0.0000      0.0000     17.3500
+    177.0500      0.0000      0.0000     17.3600
+    177.7000      0.0000      0.0000     17.3800
+    178.3600      0.0000      0.0000     17.4000
+    179.0200      0.0000      0.0000     17.4100
+    179.6700      0.0000      0.0000     17.4000
+    180.3300      0.0000      0.0000     17.4000
+    180.9900      0.0000      0.0000     17.3900
+    181.6400      0.0000      0.0000     17.3700
+    182.3000      0.0000      0.0000     17.3300
+    182.9600      0.0000      0.0000     17.3000
+    183.6100      0.0000      0.0000     17.2600
+    184.2700      0.0000      0.0000     17.2200
+    184.9300      0.0000      0.0000     17.1600
+    185.5800      0.0000      0.0000     17.1000
+    186.2400      0.0000      0.0000     17.0700
+    186.9000      0.0000      0.0000     17.0500
+    187.5500      0.0000      0.0000     17.0200
+    188.2100      0.0000      0.0000     16.9600
+    188.8700      0.0000      0.0000     16.8800
+    189.5200      0.0000      0.0000     16.7900
+    190.1800      0.0000      0.0000     16.7300
+    190.8300      0.0000      0.0000     16.7000
+    191.4900      0.0000      0.0000     16.6500
+    192.1500      0.0000      0.0000     16.5800
+    192.8000      0.0000      0.0000     16.5400
+    193.4600      0.0000      0.0000     16.5000
+    194.1100      0.0000      0.0000     16.4800
+    194.7700      0.0000      0.0000     16.4400
+    195.4300      0.0000      0.0000     16.3800
+    196.0800      0.0000      0.0000     16.2600
+    196.7400      0.0000      0.0000     16.1500
+    197.3900      0.0000      0.0000     16.0900
+    198.0500      0.0000      0.0000     16.0600
+    198.7100      0.0000      0.0000     16.0500
+    199.3600      0.0000      0.0000     16.0400
+    200.0200      0.0000      0.0000     16.0300
+    200.6700      0.0000      0.0000     16.0300
+    201.3300      0.0000      0.0000     16.0300
+    201.9800      0.0000      0.0000     16.0400
+    202.6400      0.0000      0.0000     15.9700
+    203.2900      0.0000      0.0000     15.8000
+    203.9500      0.0000      0.0000     15.6300
+    204.6000      0.0000      0.0000     15.5100
+    205.2600      0.0000      0.0000     15.4500
+    205.9100      0.0000      0.0000     15.4200
+    206.5700      0.0000      0.0000     15.3900
+    207.2200      0.0000      0.0000     15.3600
+    207.8800      0.0000      0.0000     15.3300
+    208.5300      0.0000      0.0000     15.3100
+    209.1900      0.0000      0.0000     15.2900
+    209.8400      0.0000      0.0000     15.2700
+    210.5000      0.0000      0.0000     15.2500
+    211.1500      0.0000      0.0000     15.2300
+    211.8100      0.0000      0.0000     15.2200
+    212.4600      0.0000      0.0000     15.2100
+    213.1200      0.0000      0.0000     15.2000
+    213.7700      0.0000      0.0000     15.1900
+    214.4300      0.0000      0.0000     15.1800
+    215.0800      0.0000      0.0000     15.1800
+    215.7400      0.0000      0.0000     15.1700
+    216.3900      0.0000      0.0000     15.1600
+    217.0400      0.0000      0.0000     15.1300
+    217.7000      0.0000      0.0000     15.1100
+    218.3500      0.0000      0.0000     15.0800
+    219.0100      0.0000      0.0000     15.0500
+    219.6600      0.0000      0.0000     15.0300
+    220.3200      0.0000      0.0000     15.0200
+    220.9700      0.0000      0.0000     15.0100
+    221.6200      0.0000      0.0000     15.0100
+    222.2800      0.0000      0.0000     15.0100
+    222.9300      0.0000      0.0000     14.9900
+    223.5900      0.0000      0.0000     14.9700
+    224.2400      0.0000      0.0000     14.9600
+    224.8900      0.0000      0.0000     14.9500
+    225.5500      0.0000      0.0000     14.9500
+    226.2000      0.0000      0.0000     14.9500
+    226.8500      0.0000      0.0000     14.9500
+    227.5100      0.0000      0.0000     14.9400
+    228.1600      0.0000      0.0000     14.9200
+    228.8100      0.0000      0.0000     14.9100
+    229.4700      0.0000      0.0000     14.8800
+    230.1200      0.0000      0.0000     14.8600
+    230.7800      0.0000      0.0000     14.8300
+    231.4300      0.0000      0.0000     14.8000
+    232.0800      0.0000      0.0000     14.7700
+    232.7400      0.0000      0.0000     14.7400
+    233.3900      0.0000      0.0000     14.7200
+    234.0400      0.0000      0.0000     14.7100
+    234.6900      0.0000      0.0000     14.7200
+    235.3500      0.0000      0.0000     14.7300
+    236.0000      0.0000      0.0000     14.7300
+    236.6500      0.0000      0.0000     14.7300
+    237.3100      0.0000      0.0000     14.7200
+    237.9600      0.0000      0.0000     14.7000
+    238.6100      0.0000      0.0000     14.6500
+    239.2700      0.0000      0.0000     14.6200
+    239.9200      0.0000      0.0000     14.6000
+    240.5700      0.0000      0.0000     14.5500
+    241.2200      0.0000      0.0000     14.4900
+    241.8800      0.0000      0.0000     14.4600
+    242.5300      0.0000      0.0000     14.4400
+    243.1800      0.0000      0.0000     14.4400
+    243.8300      0.0000      0.0000     14.4400
+    244.4900      0.0000      0.0000     14.4400
+    245.1400      0.0000      0.0000     14.4300
+    245.7900      0.0000      0.0000     14.4400
+    246.4400      0.0000      0.0000     14.4300
+    247.1000      0.0000      0.0000     14.4300
+    247.7500      0.0000      0.0000     14.4200
+    248.4000      0.0000      0.0000     14.4300
+    249.0500      0.0000      0.0000     14.4300
+    249.7000      0.0000      0.0000     14.4200
+    250.3600      0.0000      0.0000     14.4200
+    251.0100      0.0000      0.0000     14.4200
+    251.6600      0.0000      0.0000     14.4200
+    252.3100      0.0000      0.0000     14.4200
+    252.9600      0.0000      0.0000     14.4100
+    253.6200      0.0000      0.0000     14.4000
+    254.2700      0.0000      0.0000     14.3700
+    254.9200      0.0000      0.0000     14.3200
+    255.5700      0.0000      0.0000     14.1400
+    256.2200      0.0000      0.0000     13.8800
+    256.8800      0.0000      0.0000     13.7500
+    257.5300      0.0000      0.0000     13.7100
+    258.1800      0.0000      0.0000     13.7000
+    258.8300      0.0000      0.0000     13.6800
+    259.4800      0.0000      0.0000     13.6500
+    260.1300      0.0000      0.0000     13.6100
+    260.7800      0.0000      0.0000     13.5600
+    261.4400      0.0000      0.0000     13.5000
+    262.0900      0.0000      0.0000     13.4400
+    262.7400      0.0000      0.0000     13.4100
+    263.3900      0.0000      0.0000     13.3900
+    264.0400      0.0000      0.0000     13.3800
+    264.6900      0.0000      0.0000     13.3200
+    265.3400      0.0000      0.0000     13.2400
+    265.9900      0.0000      0.0000     13.1700
+    266.6400      0.0000      0.0000     13.1200
+    267.2900      0.0000      0.0000     13.0900
+    267.9500      0.0000      0.0000     13.0400
+    268.6000      0.0000      0.0000     12.9700
+    269.2500      0.0000      0.0000     12.9200
+    269.9000      0.0000      0.0000     12.8900
+    270.5500      0.0000      0.0000     12.8700
+    271.2000      0.0000      0.0000     12.8600
+    271.8500      0.0000      0.0000     12.8500
+    272.5000      0.0000      0.0000     12.8300
+    273.1500      0.0000      0.0000     12.8000
+    273.8000      0.0000      0.0000     12.7800
+    274.4500      0.0000      0.0000     12.7700
+    275.1000      0.0000      0.0000     12.7700
+    275.7500      0.0000      0.0000     12.7700
+    276.4000      0.0000      0.0000     12.7600
+    277.0500      0.0000      0.0000     12.7500
+    277.7000      0.0000      0.0000     12.7300
+    278.3500      0.0000      0.0000     12.7100
+    279.0000      0.0000      0.0000     12.6900
+    279.6500      0.0000      0.0000     12.6900
+    280.3000      0.0000      0.0000     12.6800
+    280.9500      0.0000      0.0000     12.6800
+    281.6000      0.0000      0.0000     12.6700
+    282.2500      0.0000      0.0000     12.6700
+    282.9000      0.0000      0.0000     12.6700
+    283.5500      0.0000      0.0000     12.6700
+    284.2000      0.0000      0.0000     12.6600
+    284.8500      0.0000      0.0000     12.6500
+    285.5000      0.0000      0.0000     12.6400
+    286.1500      0.0000      0.0000     12.6300
+    286.8000      0.0000      0.0000     12.6200
+    287.4500      0.0000      0.0000     12.6200
+    288.1000      0.0000      0.0000     12.6100
+    288.7500      0.0000      0.0000     12.6000
+    289.4000      0.0000      0.0000     12.5700
+    290.0500      0.0000      0.0000     12.5400
+    290.7000      0.0000      0.0000     12.5200
+    291.3500      0.0000      0.0000     12.4900
+    292.0000      0.0000      0.0000     12.4500
+    292.6400      0.0000      0.0000     12.4200
+    293.2900      0.0000      0.0000     12.4000
+    293.9400      0.0000      0.0000     12.3600
+    294.5900      0.0000      0.0000     12.3100
+    295.2400      0.0000      0.0000     12.2700
+    295.8900      0.0000      0.0000     12.2400
+    296.5400      0.0000      0.0000     12.2200
+    297.1900      0.0000      0.0000     12.1900
+    297.8400      0.0000      0.0000     12.1700
+    298.4900      0.0000      0.0000     12.1500
+    299.1300      0.0000      0.0000     12.1300
+    299.7800      0.0000      0.0000     12.1100
+    300.4300      0.0000      0.0000     12.0800
+    301.0800      0.0000      0.0000     12.0700
+    301.7300      0.0000      0.0000     12.0600
+    302.3800      0.0000      0.0000     12.0400
+    303.0200      0.0000      0.0000     12.0300
+    303.6700      0.0000      0.0000     12.0200
+    304.3200      0.0000      0.0000     12.0200
+    304.9700      0.0000      0.0000     12.0200
+    305.6200      0.0000      0.0000     12.0200
+    306.2700      0.0000      0.0000     12.0100
+    306.9100      0.0000      0.0000     12.0100
+    307.5600      0.0000      0.0000     12.0100
+    308.2100      0.0000      0.0000     12.0100
+    308.8600      0.0000      0.0000     12.0000
+    309.5100      0.0000      0.0000     12.0000
+    310.1500      0.0000      0.0000     11.9900
+    310.8000      0.0000      0.0000     11.9800
+    311.4500      0.0000      0.0000     11.9700
+    312.1000      0.0000      0.0000     11.9600
+    312.7500      0.0000      0.0000     11.9500
+    313.3900      0.0000      0.0000     11.9500
+    314.0400      0.0000      0.0000     11.9500
+    314.6900      0.0000      0.0000     11.9400
+    315.3400      0.0000      0.0000     11.9400
+    315.9800      0.0000      0.0000     11.9400
+    316.6300      0.0000      0.0000     11.9400
+    317.2800      0.0000      0.0000     11.9400
+    317.9300      0.0000      0.0000     11.9400
+    318.5700      0.0000      0.0000     11.9300
+    319.2200      0.0000      0.0000     11.9300
+    319.8700      0.0000      0.0000     11.9300
+    320.5200      0.0000      0.0000     11.9300
+    321.1600      0.0000      0.0000     11.9300
+    321.8100      0.0000      0.0000     11.9200
+    322.4600      0.0000      0.0000     11.9000
+    323.1000      0.0000      0.0000     11.8800
+    323.7500      0.0000      0.0000     11.8700
+    324.4000      0.0000      0.0000     11.8600
+    325.0400      0.0000      0.0000     11.8400
+    325.6900      0.0000      0.0000     11.8300
+    326.3400      0.0000      0.0000     11.8200
+    326.9900      0.0000      0.0000     11.8000
+    327.6300      0.0000      0.0000     11.7900
+    328.2800      0.0000      0.0000     11.7700
+    328.9200      0.0000      0.0000     11.7400
+    329.5700      0.0000      0.0000     11.7100
+    330.2200      0.0000      0.0000     11.6800
+    330.8600      0.0000      0.0000     11.6600
+    331.5100      0.0000      0.0000     11.6400
+    332.1600      0.0000      0.0000     11.6200
+    332.8000      0.0000      0.0000     11.6100
+    333.4500      0.0000      0.0000     11.6000
+    334.1000      0.0000      0.0000     11.5700
+    334.7400      0.0000      0.0000     11.5400
+    335.3900      0.0000      0.0000     11.5200
+    336.0300      0.0000      0.0000     11.4800
+    336.6800      0.0000      0.0000     11.4500
+    337.3300      0.0000      0.0000     11.4100
+    337.9700      0.0000      0.0000     11.3700
+    338.6200      0.0000      0.0000     11.3200
+    339.2600      0.0000      0.0000     11.2600
+    339.9100      0.0000      0.0000     11.1700
+    340.5600      0.0000      0.0000     11.0800
+    341.2000      0.0000      0.0000     10.9900
+    341.8500      0.0000      0.0000     10.9200
+    342.4900      0.0000      0.0000     10.8500
+    343.1400      0.0000      0.0000     10.8100
+    343.7800      0.0000      0.0000     10.8000
+    344.4300      0.0000      0.0000     10.7900
+    345.0800      0.0000      0.0000     10.7900
+    345.7200      0.0000      0.0000     10.7800
+    346.3700      0.0000      0.0000     10.7700
+    347.0100      0.0000      0.0000     10.7600
+    347.6600      0.0000      0.0000     10.7400
+    348.3000      0.0000      0.0000     10.7300
+    348.9500      0.0000      0.0000     10.7200
+    349.5900      0.0000      0.0000     10.7100
+    350.2400      0.0000      0.0000     10.7000
+    350.8800      0.0000      0.0000     10.7000
+    351.5300      0.0000      0.0000     10.6800
+    352.1700      0.0000      0.0000     10.6600
+    352.8200      0.0000      0.0000     10.6400
+    353.4600      0.0000      0.0000     10.6300
+    354.1100      0.0000      0.0000     10.6200
+    354.7500      0.0000      0.0000     10.6100
+    355.4000      0.0000      0.0000     10.6000
+    356.0400      0.0000      0.0000     10.5900
+    356.6900      0.0000      0.0000     10.5800
+    357.3300      0.0000      0.0000     10.5800
+    357.9800      0.0000      0.0000     10.5700
+    358.6200      0.0000      0.0000     10.5600
+    359.2700      0.0000      0.0000     10.5600
+    359.9100      0.0000      0.0000     10.5500
+    360.5500      0.0000      0.0000     10.5500
+    361.2000      0.0000      0.0000     10.5400
+    361.8400      0.0000      0.0000     10.5300
+    362.4900      0.0000      0.0000     10.5300
+    363.1300      0.0000      0.0000     10.5200
+    363.7800      0.0000      0.0000     10.5200
+    364.4200      0.0000      0.0000     10.5200
+    365.0600      0.0000      0.0000     10.5100
+    365.7100      0.0000      0.0000     10.5100
+    366.3500      0.0000      0.0000     10.5000
+    367.0000      0.0000      0.0000     10.5000
+    367.6400      0.0000      0.0000     10.4900
+    368.2800      0.0000      0.0000     10.4800
+    368.9300      0.0000      0.0000     10.4800
+    369.5700      0.0000      0.0000     10.4700
+    370.2200      0.0000      0.0000     10.4600
+    370.8600      0.0000      0.0000     10.4600
+    371.5000      0.0000      0.0000     10.4500
+    372.1500      0.0000      0.0000     10.4400
+    372.7900      0.0000      0.0000     10.4300
+    373.4300      0.0000      0.0000     10.4300
+    374.0800      0.0000      0.0000     10.4200
+    374.7200      0.0000      0.0000     10.4200
+    375.3600      0.0000      0.0000     10.4100
+    376.0100      0.0000      0.0000     10.4000
+    376.6500      0.0000      0.0000     10.3900
+    377.2900      0.0000      0.0000     10.3900
+    377.9400      0.0000      0.0000     10.3900
+    378.5800      0.0000      0.0000     10.3900
+    379.2200      0.0000      0.0000     10.3900
+    379.8700      0.0000      0.0000     10.3900
+    380.5100      0.0000      0.0000     10.3900
+    381.1500      0.0000      0.0000     10.3900
+    381.7900      0.0000      0.0000     10.3900
+    382.4400      0.0000      0.0000     10.3900
+    383.0800      0.0000      0.0000     10.3900
+    383.7200      0.0000      0.0000     10.3900
+    384.3700      0.0000      0.0000     10.3900
+    385.0100      0.0000      0.0000     10.3900
+    385.6500      0.0000      0.0000     10.3900
+    386.2900      0.0000      0.0000     10.3900
+    386.9400      0.0000      0.0000     10.3900
+    387.5800      0.0000      0.0000     10.3900
+    388.2200      0.0000      0.0000     10.3900
+    388.8600      0.0000      0.0000     10.3800
+    389.5100      0.0000      0.0000     10.3800
+    390.1500      0.0000      0.0000     10.3800
+    390.7900      0.0000      0.0000     10.3800
+    391.4300      0.0000      0.0000     10.3800
+    392.0800      0.0000      0.0000     10.3800
+    392.7200      0.0000      0.0000     10.3800
+    393.3600      0.0000      0.0000     10.3800
+    394.0000      0.0000      0.0000     10.3800
+    394.6400      0.0000      0.0000     10.3800
+    395.2900      0.0000      0.0000     10.3800
+    395.9300      0.0000      0.0000     10.3800
+    396.5700      0.0000      0.0000     10.3800
+    397.2100      0.0000      0.0000     10.3800
+    397.8500      0.0000      0.0000     10.3800
+    398.5000      0.0000      0.0000     10.3700
+    399.1400      0.0000      0.0000     10.3700
+    399.7800      0.0000      0.0000     10.3700
+    400.4200      0.0000      0.0000     10.3700
+    401.0600      0.0000      0.0000     10.3700
+    401.7000      0.0000      0.0000     10.3700
+    402.3500      0.0000      0.0000     10.3600
+    402.9900      0.0000      0.0000     10.3600
+    403.6300      0.0000      0.0000     10.3600
+    404.2700      0.0000      0.0000     10.3600
+    404.9100      0.0000      0.0000     10.3500
+    405.5500      0.0000      0.0000     10.3500
+    406.1900      0.0000      0.0000     10.3500
+    406.8300      0.0000      0.0000     10.3400
+    407.4800      0.0000      0.0000     10.3400
+    408.1200      0.0000      0.0000     10.3300
+    408.7600      0.0000      0.0000     10.3000
+    409.4000      0.0000      0.0000     10.2600
+    410.0400      0.0000      0.0000     10.2300
+    410.6800      0.0000      0.0000     10.2100
+    411.3200      0.0000      0.0000     10.2000
+    411.9600      0.0000      0.0000     10.2000
+    412.6000      0.0000      0.0000     10.1900
+    413.2400      0.0000      0.0000     10.1600
+    413.8800      0.0000      0.0000     10.1400
+    414.5200      0.0000      0.0000     10.1300
+    415.1700      0.0000      0.0000     10.1200
+    415.8100      0.0000      0.0000     10.1100
+    416.4500      0.0000      0.0000     10.1000
+    417.0900      0.0000      0.0000     10.0900
+    417.7300      0.0000      0.0000     10.0800
+    418.3700      0.0000      0.0000     10.0800
+    419.0100      0.0000      0.0000     10.0700
+    419.6500      0.0000      0.0000     10.0600
+    420.2900      0.0000      0.0000     10.0600
+    420.9300      0.0000      0.0000     10.0600
+    421.5700      0.0000      0.0000     10.0600
+    422.2100      0.0000      0.0000     10.0600
+    422.8500      0.0000      0.0000     10.0500
+    423.4900      0.0000      0.0000     10.0500
+    424.1300      0.0000      0.0000     10.0400
+    424.7700      0.0000      0.0000     10.0400
+    425.4100      0.0000      0.0000     10.0300
+    426.0500      0.0000      0.0000     10.0300
+    426.6900      0.0000      0.0000     10.0300
+    427.3300      0.0000      0.0000     10.0200
+    427.9700      0.0000      0.0000     10.0200
+    428.6100      0.0000      0.0000     10.0200
+    429.2500      0.0000      0.0000     10.0100
+    429.8900      0.0000      0.0000     10.0100
+    430.5300      0.0000      0.0000     10.0000
+    431.1700      0.0000      0.0000     10.0000
+    431.8000      0.0000      0.0000     10.0000
+    432.4400      0.0000      0.0000     10.0000
+    433.0800      0.0000      0.0000      9.9900
+    433.7200      0.0000      0.0000      9.9900
+    434.3600      0.0000      0.0000      9.9900
+    435.0000      0.0000      0.0000      9.9900
+    435.6400      0.0000      0.0000      9.9900
+    436.2800      0.0000      0.0000      9.9900
+    436.9200      0.0000      0.0000      9.9900
+    437.5600      0.0000      0.0000      9.9900
+    438.2000      0.0000      0.0000      9.9900
+    438.8400      0.0000      0.0000      9.9900
+    439.4700      0.0000      0.0000      9.9900
+    440.1100      0.0000      0.0000      9.9800
+    440.7500      0.0000      0.0000      9.9700
+    441.3900      0.0000      0.0000      9.9700
+    442.0300      0.0000      0.0000      9.9600
+    442.6700      0.0000      0.0000      9.9400
+    443.3100      0.0000      0.0000      9.9300
+    443.9500      0.0000      0.0000      9.9200
+    444.5800      0.0000      0.0000      9.9200
+    445.2200      0.0000      0.0000      9.9000
+    445.8600      0.0000      0.0000      9.8900
+    446.5000      0.0000      0.0000      9.8600
+    447.1400      0.0000      0.0000      9.8200
+    447.7800      0.0000      0.0000      9.7800
+    448.4100      0.0000      0.0000      9.7700
+    449.0500      0.0000      0.0000      9.7600
+    449.6900      0.0000      0.0000      9.7500
+    450.3300      0.0000      0.0000      9.7300
+    450.9700      0.0000      0.0000      9.7100
+    451.6000      0.0000      0.0000      9.6900
+    452.2400      0.0000      0.0000      9.6700
+    452.8800      0.0000      0.0000      9.6700
+    453.5200      0.0000      0.0000      9.6500
+    454.1600      0.0000      0.0000      9.6200
+    454.7900      0.0000      0.0000      9.5800
+    455.4300      0.0000      0.0000      9.5500
+    456.0700      0.0000      0.0000      9.5300
+    456.7100      0.0000      0.0000      9.5100
+    457.3500      0.0000      0.0000      9.4400
+    457.9800      0.0000      0.0000      9.3400
+    458.6200      0.0000      0.0000      9.2600
+    459.2600      0.0000      0.0000      9.2000
+    459.9000      0.0000      0.0000      9.1700
+    460.5300      0.0000      0.0000      9.1500
+    461.1700      0.0000      0.0000      9.1300
+    461.8100      0.0000      0.0000      9.1200
+    462.4400      0.0000      0.0000      9.1000
+    463.0800      0.0000      0.0000      9.0700
+    463.7200      0.0000      0.0000      9.0500
+    464.3600      0.0000      0.0000      9.0300
+    464.9900      0.0000      0.0000      9.0100
+    465.6300      0.0000      0.0000      9.0000
+    466.2700      0.0000      0.0000      9.0000
+    466.9000      0.0000      0.0000      8.9900
+    467.5400      0.0000      0.0000      8.9800
+    468.1800      0.0000      0.0000      8.9800
+    468.8100      0.0000      0.0000      8.9700
+    469.4500      0.0000      0.0000      8.9600
+    470.0900      0.0000      0.0000      8.9600
+    470.7200      0.0000      0.0000      8.9500
+    471.3600      0.0000      0.0000      8.9500
+    472.0000      0.0000      0.0000      8.9500
+    472.6300      0.0000      0.0000      8.9400
+    473.2700      0.0000      0.0000      8.9400
+    473.9100      0.0000      0.0000      8.9400
+    474.5400      0.0000      0.0000      8.9300
+    475.1800      0.0000      0.0000      8.9300
+    475.8200      0.0000      0.0000      8.9200
+    476.4500      0.0000      0.0000      8.9200
+    477.0900      0.0000      0.0000      8.9200
+    477.7300      0.0000      0.0000      8.9100
+    478.3600      0.0000      0.0000      8.8900
+    479.0000      0.0000      0.0000      8.8700
+    479.6300      0.0000      0.0000      8.8500
+    480.2700      0.0000      0.0000      8.8400
+    480.9100      0.0000      0.0000      8.8300
+    481.5400      0.0000      0.0000      8.8200
+    482.1800      0.0000      0.0000      8.8100
+    482.8100      0.0000      0.0000      8.7900
+    483.4500      0.0000      0.0000      8.7600
+    484.0800      0.0000      0.0000      8.7400
+    484.7200      0.0000      0.0000      8.7000
+    485.3600      0.0000      0.0000      8.6600
+    485.9900      0.0000      0.0000      8.6300
+    486.6300      0.0000      0.0000      8.6100
+    487.2600      0.0000      0.0000      8.5900
+    487.9000      0.0000      0.0000      8.5800
+    488.5300      0.0000      0.0000      8.5600
+    489.1700      0.0000      0.0000      8.5400
+    489.8000      0.0000      0.0000      8.5200
+    490.4400      0.0000      0.0000      8.4800
+    491.0700      0.0000      0.0000      8.4500
+    491.7100      0.0000      0.0000      8.4200
+    492.3400      0.0000      0.0000      8.4000
+    492.9800      0.0000      0.0000      8.3800
+    493.6200      0.0000      0.0000      8.3600
+    494.2500      0.0000      0.0000      8.3400
+    494.8900      0.0000      0.0000      8.3200
+    495.5200      0.0000      0.0000      8.2900
+    496.1500      0.0000      0.0000      8.2700
+    496.7900      0.0000      0.0000      8.2500
+    497.4200      0.0000      0.0000      8.2400
+    498.0600      0.0000      0.0000      8.2300
+    498.6900      0.0000      0.0000      8.2300
+    499.3300      0.0000      0.0000      8.2200
+    499.9600      0.0000      0.0000      8.2000
+    500.6000      0.0000      0.0000      8.1900
+    501.2300      0.0000      0.0000      8.1700
+    501.8700      0.0000      0.0000      8.1500
+    502.5000      0.0000      0.0000      8.1300
+    503.1400      0.0000      0.0000      8.0900
+    503.7700      0.0000      0.0000      8.0300
+    504.4000      0.0000      0.0000      7.9900
+    505.0400      0.0000      0.0000      7.9500
+    505.6700      0.0000      0.0000      7.9100
+    506.3100      0.0000      0.0000      7.8800
+    506.9400      0.0000      0.0000      7.8400
+    507.5700      0.0000      0.0000      7.8000
+    508.2100      0.0000      0.0000      7.7700
+    508.8400      0.0000      0.0000      7.7500
+    509.4800      0.0000      0.0000      7.7400
+    510.1100      0.0000      0.0000      7.7300
+    510.7400      0.0000      0.0000      7.7300
+    511.3800      0.0000      0.0000      7.7200
+    512.0100      0.0000      0.0000      7.7100
+    512.6500      0.0000      0.0000      7.7000
+    513.2800      0.0000      0.0000      7.7000
+    513.9100      0.0000      0.0000      7.7000
+    514.5500      0.0000      0.0000      7.6900
+    515.1800      0.0000      0.0000      7.6900
+    515.8100      0.0000      0.0000      7.6800
+    516.4500      0.0000      0.0000      7.6800
+    517.0800      0.0000      0.0000      7.6700
+    517.7100      0.0000      0.0000      7.6600
+    518.3500      0.0000      0.0000      7.6600
+    518.9800      0.0000      0.0000      7.6500
+    519.6100      0.0000      0.0000      7.6500
+    520.2500      0.0000      0.0000      7.6400
+    520.8800      0.0000      0.0000      7.6300
+    521.5100      0.0000      0.0000      7.6100
+    522.1500      0.0000      0.0000      7.6000
+    522.7800      0.0000      0.0000      7.5800
+    523.4100      0.0000      0.0000      7.5700
+    524.0400      0.0000      0.0000      7.5700
+    524.6800      0.0000      0.0000      7.5600
+    525.3100      0.0000      0.0000      7.5600
+    525.9400      0.0000      0.0000      7.5500
+    526.5800      0.0000      0.0000      7.5300
+    527.2100      0.0000      0.0000      7.5300
+    527.8400      0.0000      0.0000      7.5200
+    528.4700      0.0000      0.0000      7.5100
+    529.1100      0.0000      0.0000      7.5000
+    529.7400      0.0000      0.0000      7.5000
+    530.3700      0.0000      0.0000      7.4900
+    531.0000      0.0000      0.0000      7.4900
+    531.6400      0.0000      0.0000      7.4900
+    532.2700      0.0000      0.0000      7.4800
+    532.9000      0.0000      0.0000      7.4800
+    533.5300      0.0000      0.0000      7.4800
+    534.1700      0.0000      0.0000      7.4700
+    534.8000      0.0000      0.0000      7.4700
+    535.4300      0.0000      0.0000      7.4700
+    536.0600      0.0000      0.0000      7.4600
+    536.6900      0.0000      0.0000      7.4600
+    537.3300      0.0000      0.0000      7.4600
+    537.9600      0.0000      0.0000      7.4500
+    538.5900      0.0000      0.0000      7.4500
+    539.2200      0.0000      0.0000      7.4500
+    539.8500      0.0000      0.0000      7.4500
+    540.4800      0.0000      0.0000      7.4400
+    541.1200      0.0000      0.0000      7.4400
+    541.7500      0.0000      0.0000      7.4300
+    542.3800      0.0000      0.0000      7.4300
+    543.0100      0.0000      0.0000      7.4300
+    543.6400      0.0000      0.0000      7.4300
+    544.2700      0.0000      0.0000      7.4200
+    544.9100      0.0000      0.0000      7.4200
+    545.5400      0.0000      0.0000      7.4200
+    546.1700      0.0000      0.0000      7.4200
+    546.8000      0.0000      0.0000      7.4200
+    547.4300      0.0000      0.0000      7.4200
+    548.0600      0.0000      0.0000      7.4100
+    548.6900      0.0000      0.0000      7.4100
+    549.3200      0.0000      0.0000      7.4000
+    549.9500      0.0000      0.0000      7.3900
+    550.5900      0.0000      0.0000      7.3800
+    551.2200      0.0000      0.0000      7.3600
+    551.8500      0.0000      0.0000      7.3400
+    552.4800      0.0000      0.0000      7.3200
+    553.1100      0.0000      0.0000      7.3100
+    553.7400      0.0000      0.0000      7.3100
+    554.3700      0.0000      0.0000      7.3000
+    555.0000      0.0000      0.0000      7.3000
+    555.6300      0.0000      0.0000      7.2900
+    556.2600      0.0000      0.0000      7.2800
+    556.8900      0.0000      0.0000      7.2700
+    557.5200      0.0000      0.0000      7.2700
+    558.1500      0.0000      0.0000      7.2600
+    558.7800      0.0000      0.0000      7.2600
+    559.4200      0.0000      0.0000      7.2500
+    560.0500      0.0000      0.0000      7.2500
+    560.6800      0.0000      0.0000      7.2400
+    561.3100      0.0000      0.0000      7.2300
+    561.9400      0.0000      0.0000      7.2300
+    562.5700      0.0000      0.0000      7.2200
+    563.2000      0.0000      0.0000      7.2200
+    563.8300      0.0000      0.0000      7.2200
+    564.4600      0.0000      0.0000      7.2200
+    565.0900      0.0000      0.0000      7.2200
+    565.7200      0.0000      0.0000      7.2200
+    566.3500      0.0000      0.0000      7.2200
+    566.9800      0.0000      0.0000      7.2100
+    567.6100      0.0000      0.0000      7.2100
+    568.2400      0.0000      0.0000      7.2100
+    568.8700      0.0000      0.0000      7.2100
+    569.5000      0.0000      0.0000      7.2000
+    570.1200      0.0000      0.0000      7.2000
+    570.7500      0.0000      0.0000      7.2000
+    571.3800      0.0000      0.0000      7.2000
+    572.0100      0.0000      0.0000      7.1900
+    572.6400      0.0000      0.0000      7.1900
+    573.2700      0.0000      0.0000      7.1900
+    573.9000      0.0000      0.0000      7.1900
+    574.5300      0.0000      0.0000      7.1800
+    575.1600      0.0000      0.0000      7.1800
+    575.7900      0.0000      0.0000      7.1800
+    576.4200      0.0000      0.0000      7.1800
+    577.0500      0.0000      0.0000      7.1800
+    577.6800      0.0000      0.0000      7.1700
+    578.3100      0.0000      0.0000      7.1700
+    578.9300      0.0000      0.0000      7.1700
+    579.5600      0.0000      0.0000      7.1700
+    580.1900      0.0000      0.0000      7.1700
+    580.8200      0.0000      0.0000      7.1700
+    581.4500      0.0000      0.0000      7.1700
+    582.0800      0.0000      0.0000      7.1700
+    582.7100      0.0000      0.0000      7.1700
+    583.3400      0.0000      0.0000      7.1600
+    583.9700      0.0000      0.0000      7.1600
+    584.5900      0.0000      0.0000      7.1600
+    585.2200      0.0000      0.0000      7.1600
+    585.8500      0.0000      0.0000      7.1600
+    586.4800      0.0000      0.0000      7.1600
+    587.1100      0.0000      0.0000      7.1600
+    587.7400      0.0000      0.0000      7.1600
+    588.3600      0.0000      0.0000      7.1500
+    588.9900      0.0000      0.0000      7.1500
+    589.6200      0.0000      0.0000      7.1500
+    590.2500      0.0000      0.0000      7.1500
+    590.8800      0.0000      0.0000      7.1500
+    591.5000      0.0000      0.0000      7.1400
+    592.1300      0.0000      0.0000      7.1400
+    592.7600      0.0000      0.0000      7.1400
+    593.3900      0.0000      0.0000      7.1400
+    594.0200      0.0000      0.0000      7.1400
+    594.6400      0.0000      0.0000      7.1400
+    595.2700      0.0000      0.0000      7.1300
+    595.9000      0.0000      0.0000      7.1300
+    596.5300      0.0000      0.0000      7.1200
+    597.1600      0.0000      0.0000      7.1200
+    597.7800      0.0000      0.0000      7.1100
+    598.4100      0.0000      0.0000      7.1000
+    599.0400      0.0000      0.0000      7.0900
+    599.6700      0.0000      0.0000      7.0700
+    600.2900      0.0000      0.0000      7.0600
+    600.9200      0.0000      0.0000      7.0400
+    601.5500      0.0000      0.0000      7.0400
+    602.1800      0.0000      0.0000      7.0300
+    602.8000      0.0000      0.0000      7.0300
+    603.4300      0.0000      0.0000      7.0200
+    604.0600      0.0000      0.0000      7.0200
+    604.6800      0.0000      0.0000      7.0100
+    605.3100      0.0000      0.0000      7.0100
+    605.9400      0.0000      0.0000      7.0100
+    606.5700      0.0000      0.0000      7.0100
+    607.1900      0.0000      0.0000      7.0100
+    607.8200      0.0000      0.0000      7.0000
+    608.4500      0.0000      0.0000      7.0000
+    609.0700      0.0000      0.0000      6.9900
+    609.7000      0.0000      0.0000      6.9800
+    610.3300      0.0000      0.0000      6.9700
+    610.9500      0.0000      0.0000      6.9700
+    611.5800      0.0000      0.0000      6.9700
+    612.2100      0.0000      0.0000      6.9600
+    612.8300      0.0000      0.0000      6.9600
+    613.4600      0.0000      0.0000      6.9600
+    614.0900      0.0000      0.0000      6.9500
+    614.7100      0.0000      0.0000      6.9500
+    615.3400      0.0000      0.0000      6.9500
+    615.9700      0.0000      0.0000      6.9400
+    616.5900      0.0000      0.0000      6.9400
+    617.2200      0.0000      0.0000      6.9400
+    617.8400      0.0000      0.0000      6.9300
+    618.4700      0.0000      0.0000      6.9300
+    619.1000      0.0000      0.0000      6.9100
+    619.7200      0.0000      0.0000      6.9000
+    620.3500      0.0000      0.0000      6.8800
+    620.9700      0.0000      0.0000      6.8600
+    621.6000      0.0000      0.0000      6.8400
+    622.2300      0.0000      0.0000      6.8100
+    622.8500      0.0000      0.0000      6.7600
+    623.4800      0.0000      0.0000      6.7200
+    624.1000      0.0000      0.0000      6.7000
+    624.7300      0.0000      0.0000      6.6900
+    625.3500      0.0000      0.0000      6.6800
+    625.9800      0.0000      0.0000      6.6700
+    626.6100      0.0000      0.0000      6.6600
+    627.2300      0.0000      0.0000      6.6600
+    627.8600      0.0000      0.0000      6.6600
+    628.4800      0.0000      0.0000      6.6600
+    629.1100      0.0000      0.0000      6.6500
+    629.7300      0.0000      0.0000      6.6500
+    630.3600      0.0000      0.0000      6.6500
+    630.9800      0.0000      0.0000      6.6500
+    631.6100      0.0000      0.0000      6.6500
+    632.2300      0.0000      0.0000      6.6500
+    632.8600      0.0000      0.0000      6.6500
+    633.4800      0.0000      0.0000      6.6300
+    634.1100      0.0000      0.0000      6.5800
+    634.7300      0.0000      0.0000      6.5300
+    635.3600      0.0000      0.0000      6.5100
+    635.9800      0.0000      0.0000      6.4800
+    636.6100      0.0000      0.0000      6.4600
+    637.2300      0.0000      0.0000      6.4500
+    637.8600      0.0000      0.0000      6.4400
+    638.4800      0.0000      0.0000      6.4400
+    639.1100      0.0000      0.0000      6.4300
+    639.7300      0.0000      0.0000      6.4300
+    640.3600      0.0000      0.0000      6.4200
+    640.9800      0.0000      0.0000      6.4200
+    641.6100      0.0000      0.0000      6.4200
+    642.2300      0.0000      0.0000      6.4100
+    642.8500      0.0000      0.0000      6.4100
+    643.4800      0.0000      0.0000      6.4100
+    644.1000      0.0000      0.0000      6.4000
+    644.7300      0.0000      0.0000      6.4000
+    645.3500      0.0000      0.0000      6.3900
+    645.9800      0.0000      0.0000      6.3800
+    646.6000      0.0000      0.0000      6.3800
+    647.2200      0.0000      0.0000      6.3800
+    647.8500      0.0000      0.0000      6.3700
+    648.4700      0.0000      0.0000      6.3700
+    649.1000      0.0000      0.0000      6.3700
+    649.7200      0.0000      0.0000      6.3600
+    650.3400      0.0000      0.0000      6.3600
+    650.9700      0.0000      0.0000      6.3600
+    651.5900      0.0000      0.0000      6.3500
+    652.2200      0.0000      0.0000      6.3500
+    652.8400      0.0000      0.0000      6.3500
+    653.4600      0.0000      0.0000      6.3500
+    654.0900      0.0000      0.0000      6.3500
+    654.7100      0.0000      0.0000      6.3500
+    655.3300      0.0000      0.0000      6.3500
+    655.9600      0.0000      0.0000      6.3500
+    656.5800      0.0000      0.0000      6.3500
+    657.2000      0.0000      0.0000      6.3500
+    657.8300      0.0000      0.0000      6.3400
+    658.4500      0.0000      0.0000      6.3400
+    659.0700      0.0000      0.0000      6.3400
+    659.7000      0.0000      0.0000      6.3400
+    660.3200      0.0000      0.0000      6.3400
+    660.9400      0.0000      0.0000      6.3400
+    661.5700      0.0000      0.0000      6.3300
+    662.1900      0.0000      0.0000      6.3300
+    662.8100      0.0000      0.0000      6.3300
+    663.4300      0.0000      0.0000      6.3300
+    664.0600      0.0000      0.0000      6.3200
+    664.6800      0.0000      0.0000      6.3200
+    665.3000      0.0000      0.0000      6.3200
+    665.9300      0.0000      0.0000      6.3200
+    666.5500      0.0000      0.0000      6.3100
+    667.1700      0.0000      0.0000      6.3100
+    667.7900      0.0000      0.0000      6.3100
+    668.4200      0.0000      0.0000      6.3100
+    669.0400      0.0000      0.0000      6.3100
+    669.6600      0.0000      0.0000      6.3100
+    670.2800      0.0000      0.0000      6.3100
+    670.9100      0.0000      0.0000      6.3000
+    671.5300      0.0000      0.0000      6.3000
+    672.1500      0.0000      0.0000      6.3000
+    672.7700      0.0000      0.0000      6.2900
+    673.3900      0.0000      0.0000      6.2900
+    674.0200      0.0000      0.0000      6.2800
+    674.6400      0.0000      0.0000      6.2700
+    675.2600      0.0000      0.0000      6.2500
+    675.8800      0.0000      0.0000      6.2400
+    676.5100      0.0000      0.0000      6.2300
+    677.1300      0.0000      0.0000      6.2300
+    677.7500      0.0000      0.0000      6.2200
+    678.3700      0.0000      0.0000      6.2200
+    678.9900      0.0000      0.0000      6.2200
+    679.6100      0.0000      0.0000      6.2100
+    680.2400      0.0000      0.0000      6.2100
+    680.8600      0.0000      0.0000      6.2100
+    681.4800      0.0000      0.0000      6.2100
+    682.1000      0.0000      0.0000      6.2100
+    682.7200      0.0000      0.0000      6.2000
+    683.3400      0.0000      0.0000      6.2000
+    683.9700      0.0000      0.0000      6.2000
+    684.5900      0.0000      0.0000      6.2000
+    685.2100      0.0000      0.0000      6.2000
+    685.8300      0.0000      0.0000      6.2000
+    686.4500      0.0000      0.0000      6.2000
+    687.0700      0.0000      0.0000      6.2000
+    687.6900      0.0000      0.0000      6.2000
+    688.3100      0.0000      0.0000      6.2000
+    688.9300      0.0000      0.0000      6.2000
+    689.5600      0.0000      0.0000      6.2000
+    690.1800      0.0000      0.0000      6.2000
+    690.8000      0.0000      0.0000      6.2000
+    691.4200      0.0000      0.0000      6.2000
+    692.0400      0.0000      0.0000      6.2000
+    692.6600      0.0000      0.0000      6.2000
+    693.2800      0.0000      0.0000      6.2000
+    693.9000      0.0000      0.0000      6.2000
+    694.5200      0.0000      0.0000      6.2000
+    695.1400      0.0000      0.0000      6.2000
+    695.7600      0.0000      0.0000      6.2000
+    696.3800      0.0000      0.0000      6.2000
+    697.0000      0.0000      0.0000      6.2000
+    697.6200      0.0000      0.0000      6.2000
+    698.2500      0.0000      0.0000      6.2000
+    698.8700      0.0000      0.0000      6.2000
+    699.4900      0.0000      0.0000      6.1900
+    700.1100      0.0000      0.0000      6.1900
+    700.7300      0.0000      0.0000      6.1900
+    701.3500      0.0000      0.0000      6.1900
+    701.9700      0.0000      0.0000      6.1900
+    702.5900      0.0000      0.0000      6.1900
+    703.2100      0.0000      0.0000      6.1900
+    703.8300      0.0000      0.0000      6.1900
+    704.4500      0.0000      0.0000      6.1900
+    705.0700      0.0000      0.0000      6.1900
+    705.6900      0.0000      0.0000      6.1900
+    706.3100      0.0000      0.0000      6.1800
+    706.9300      0.0000      0.0000      6.1800
+    707.5500      0.0000      0.0000      6.1800
+    708.1700      0.0000      0.0000      6.1800
+    708.7800      0.0000      0.0000      6.1800
+    709.4000      0.0000      0.0000      6.1800
+    710.0200      0.0000      0.0000      6.1800
+    710.6400      0.0000      0.0000      6.1800
+    711.2600      0.0000      0.0000      6.1700
+    711.8800      0.0000      0.0000      6.1700
+    712.5000      0.0000      0.0000      6.1700
+    713.1200      0.0000      0.0000      6.1700
+    713.7400      0.0000      0.0000      6.1700
+    714.3600      0.0000      0.0000      6.1700
+    714.9800      0.0000      0.0000      6.1700
+    715.6000      0.0000      0.0000      6.1700
+    716.2200      0.0000      0.0000      6.1700
+    716.8400      0.0000      0.0000      6.1700
+    717.4600      0.0000      0.0000      6.1700
+    718.0700      0.0000      0.0000      6.1700
+    718.6900      0.0000      0.0000      6.1700
+    719.3100      0.0000      0.0000      6.1600
+    719.9300      0.0000      0.0000      6.1600
+    720.5500      0.0000      0.0000      6.1600
+    721.1700      0.0000      0.0000      6.1600
+    721.7900      0.0000      0.0000      6.1600
+    722.4100      0.0000      0.0000      6.1600
+    723.0200      0.0000      0.0000      6.1500
+    723.6400      0.0000      0.0000      6.1500
+    724.2600      0.0000      0.0000      6.1500
+    724.8800      0.0000      0.0000      6.1500
+    725.5000      0.0000      0.0000      6.1500
+    726.1200      0.0000      0.0000      6.1500
+    726.7300      0.0000      0.0000      6.1500
+    727.3500      0.0000      0.0000      6.1500
+    727.9700      0.0000      0.0000      6.1500
+    728.5900      0.0000      0.0000      6.1500
+    729.2100      0.0000      0.0000      6.1500
+    729.8300      0.0000      0.0000      6.1500
+    730.4400      0.0000      0.0000      6.1500
+    731.0600      0.0000      0.0000      6.1500
+    731.6800      0.0000      0.0000      6.1500
+    732.3000      0.0000      0.0000      6.1500
+    732.9200      0.0000      0.0000      6.1500
+    733.5300      0.0000      0.0000      6.1500
+    734.1500      0.0000      0.0000      6.1500
+    734.7700      0.0000      0.0000      6.1500
+    735.3900      0.0000      0.0000      6.1500
+    736.0000      0.0000      0.0000      6.1400
+    736.6200      0.0000      0.0000      6.1400
+    737.2400      0.0000      0.0000      6.1400
+    737.8600      0.0000      0.0000      6.1400
+    738.4700      0.0000      0.0000      6.1300
+    739.0900      0.0000      0.0000      6.1300
+    739.7100      0.0000      0.0000      6.1200
+    740.3300      0.0000      0.0000      6.1100
+    740.9400      0.0000      0.0000      6.1100
+    741.5600      0.0000      0.0000      6.1000
+    742.1800      0.0000      0.0000      6.1000
+    742.7900      0.0000      0.0000      6.0900
+    743.4100      0.0000      0.0000      6.0900
+    744.0300      0.0000      0.0000      6.0900
+    744.6500      0.0000      0.0000      6.0800
+    745.2600      0.0000      0.0000      6.0700
+    745.8800      0.0000      0.0000      6.0700
+    746.5000      0.0000      0.0000      6.0600
+    747.1100      0.0000      0.0000      6.0600
+    747.7300      0.0000      0.0000      6.0600
+    748.3500      0.0000      0.0000      6.0600
+    748.9600      0.0000      0.0000      6.0600
+    749.5800      0.0000      0.0000      6.0600
+    750.2000      0.0000      0.0000      6.0500
+    750.8100      0.0000      0.0000      6.0500
+    751.4300      0.0000      0.0000      6.0500
+    752.0500      0.0000      0.0000      6.0500
+    752.6600      0.0000      0.0000      6.0500
+    753.2800      0.0000      0.0000      6.0500
+    753.9000      0.0000      0.0000      6.0400
+    754.5100      0.0000      0.0000      6.0400
+    755.1300      0.0000      0.0000      6.0300
+    755.7400      0.0000      0.0000      6.0300
+    756.3600      0.0000      0.0000      6.0200
+    756.9800      0.0000      0.0000      6.0200
+    757.5900      0.0000      0.0000      6.0200
+    758.2100      0.0000      0.0000      6.0200
+    758.8200      0.0000      0.0000      6.0200
+    759.4400      0.0000      0.0000      6.0200
+    760.0600      0.0000      0.0000      6.0200
+    760.6700      0.0000      0.0000      6.0200
+    761.2900      0.0000      0.0000      6.0100
+    761.9000      0.0000      0.0000      6.0200
+    762.5200      0.0000      0.0000      6.0100
+    763.1400      0.0000      0.0000      6.0100
+    763.7500      0.0000      0.0000      6.0100
+    764.3700      0.0000      0.0000      6.0000
+    764.9800      0.0000      0.0000      6.0000
+    765.6000      0.0000      0.0000      6.0000
+    766.2100      0.0000      0.0000      6.0000
+    766.8300      0.0000      0.0000      6.0000
+    767.4400      0.0000      0.0000      6.0000
+    768.0600      0.0000      0.0000      6.0000
+    768.6700      0.0000      0.0000      6.0000
+    769.2900      0.0000      0.0000      6.0000
+    769.9000      0.0000      0.0000      6.0000
+    770.5200      0.0000      0.0000      6.0000
+    771.1400      0.0000      0.0000      5.9900
+    771.7500      0.0000      0.0000      5.9900
+    772.3700      0.0000      0.0000      5.9900
+    772.9800      0.0000      0.0000      5.9900
+    773.5900      0.0000      0.0000      5.9800
+    774.2100      0.0000      0.0000      5.9800
+    774.8200      0.0000      0.0000      5.9800
+    775.4400      0.0000      0.0000      5.9800
+    776.0500      0.0000      0.0000      5.9700
+    776.6700      0.0000      0.0000      5.9700
+    777.2800      0.0000      0.0000      5.9700
+    777.9000      0.0000      0.0000      5.9700
+    778.5100      0.0000      0.0000      5.9700
+    779.1300      0.0000      0.0000      5.9600
+    779.7400      0.0000      0.0000      5.9600
+    780.3600      0.0000      0.0000      5.9600
+    780.9700      0.0000      0.0000      5.9500
+    781.5800      0.0000      0.0000      5.9500
+    782.2000      0.0000      0.0000      5.9400
+    782.8100      0.0000      0.0000      5.9400
+    783.4300      0.0000      0.0000      5.9300
+    784.0400      0.0000      0.0000      5.9300
+    784.6600      0.0000      0.0000      5.9200
+    785.2700      0.0000      0.0000      5.9200
+    785.8800      0.0000      0.0000      5.9200
+    786.5000      0.0000      0.0000      5.9200
+    787.1100      0.0000      0.0000      5.9200
+    787.7300      0.0000      0.0000      5.9200
+    788.3400      0.0000      0.0000      5.9200
+    788.9500      0.0000      0.0000      5.9200
+    789.5700      0.0000      0.0000      5.9100
+    790.1800      0.0000      0.0000      5.9100
+    790.7900      0.0000      0.0000      5.9100
+    791.4100      0.0000      0.0000      5.9000
+    792.0200      0.0000      0.0000      5.8900
+    792.6300      0.0000      0.0000      5.8800
+    793.2500      0.0000      0.0000      5.8700
+    793.8600      0.0000      0.0000      5.8600
+    794.4700      0.0000      0.0000      5.8500
+    795.0900      0.0000      0.0000      5.8300
+    795.7000      0.0000      0.0000      5.8200
+    796.3100      0.0000      0.0000      5.8100
+    796.9300      0.0000      0.0000      5.8000
+    797.5400      0.0000      0.0000      5.7900
+    798.1500      0.0000      0.0000      5.7900
+    798.7700      0.0000      0.0000      5.7900
+    799.3800      0.0000      0.0000      5.7900
+    799.9900      0.0000      0.0000      5.7900
+    800.6100      0.0000      0.0000      5.7900
+    801.2200      0.0000      0.0000      5.7900
+    801.8300      0.0000      0.0000      5.7900
+    802.4400      0.0000      0.0000      5.7900
+    803.0600      0.0000      0.0000      5.7900
+    803.6700      0.0000      0.0000      5.7800
+    804.2800      0.0000      0.0000      5.7800
+    804.9000      0.0000      0.0000      5.7800
+    805.5100      0.0000      0.0000      5.7800
+    806.1200      0.0000      0.0000      5.7800
+    806.7300      0.0000      0.0000      5.7800
+    807.3400      0.0000      0.0000      5.7700
+    807.9600      0.0000      0.0000      5.7700
+    808.5700      0.0000      0.0000      5.7700
+    809.1800      0.0000      0.0000      5.7700
+    809.7900      0.0000      0.0000      5.7600
+    810.4100      0.0000      0.0000      5.7500
+    811.0200      0.0000      0.0000      5.7400
+    811.6300      0.0000      0.0000      5.7300
+    812.2400      0.0000      0.0000      5.7200
+    812.8500      0.0000      0.0000      5.7200
+    813.4700      0.0000      0.0000      5.7100
+    814.0800      0.0000      0.0000      5.7100
+    814.6900      0.0000      0.0000      5.7100
+    815.3000      0.0000      0.0000      5.7000
+    815.9100      0.0000      0.0000      5.7000
+    816.5300      0.0000      0.0000      5.7000
+    817.1400      0.0000      0.0000      5.7000
+    817.7500      0.0000      0.0000      5.6900
+    818.3600      0.0000      0.0000      5.6900
+    818.9700      0.0000      0.0000      5.6900
+    819.5800      0.0000      0.0000      5.6900
+    820.2000      0.0000      0.0000      5.6900
+    820.8100      0.0000      0.0000      5.6800
+    821.4200      0.0000      0.0000      5.6800
+    822.0300      0.0000      0.0000      5.6800
+    822.6400      0.0000      0.0000      5.6800
+    823.2500      0.0000      0.0000      5.6700
+    823.8600      0.0000      0.0000      5.6700
+    824.4700      0.0000      0.0000      5.6700
+    825.0900      0.0000      0.0000      5.6700
+    825.7000      0.0000      0.0000      5.6600
+    826.3100      0.0000      0.0000      5.6600
+    826.9200      0.0000      0.0000      5.6600
+    827.5300      0.0000      0.0000      5.6600
+    828.1400      0.0000      0.0000      5.6600
+    828.7500      0.0000      0.0000      5.6600
+    829.3600      0.0000      0.0000      5.6600
+    829.9700      0.0000      0.0000      5.6600
+    830.5800      0.0000      0.0000      5.6400
+    831.1900      0.0000      0.0000      5.6300
+    831.8000      0.0000      0.0000      5.6100
+    832.4200      0.0000      0.0000      5.6000
+    833.0300      0.0000      0.0000      5.6000
+    833.6400      0.0000      0.0000      5.6000
+    834.2500      0.0000      0.0000      5.5900
+    834.8600      0.0000      0.0000      5.5900
+    835.4700      0.0000      0.0000      5.5800
+    836.0800      0.0000      0.0000      5.5700
+    836.6900      0.0000      0.0000      5.5600
+    837.3000      0.0000      0.0000      5.5500
+    837.9100      0.0000      0.0000      5.5500
+    838.5200      0.0000      0.0000      5.5400
+    839.1300      0.0000      0.0000      5.5300
+    839.7400      0.0000      0.0000      5.5200
+    840.3500      0.0000      0.0000      5.5200
+    840.9600      0.0000      0.0000      5.5200
+    841.5700      0.0000      0.0000      5.5100
+    842.1800      0.0000      0.0000      5.5100
+    842.7900      0.0000      0.0000      5.5100
+    843.4000      0.0000      0.0000      5.5000
+    844.0100      0.0000      0.0000      5.5000
+    844.6200      0.0000      0.0000      5.5000
+    845.2300      0.0000      0.0000      5.5000
+    845.8400      0.0000      0.0000      5.4900
+    846.4500      0.0000      0.0000      5.4900
+    847.0600      0.0000      0.0000      5.4900
+    847.6700      0.0000      0.0000      5.4900
+    848.2700      0.0000      0.0000      5.4800
+    848.8800      0.0000      0.0000      5.4700
+    849.4900      0.0000      0.0000      5.4600
+    850.1000      0.0000      0.0000      5.4600
+    850.7100      0.0000      0.0000      5.4600
+    851.3200      0.0000      0.0000      5.4600
+    851.9300      0.0000      0.0000      5.4600
+    852.5400      0.0000      0.0000      5.4600
+    853.1500      0.0000      0.0000      5.4600
+    853.7600      0.0000      0.0000      5.4600
+    854.3700      0.0000      0.0000      5.4600
+    854.9800      0.0000      0.0000      5.4500
+    855.5800      0.0000      0.0000      5.4500
+    856.1900      0.0000      0.0000      5.4600
+    856.8000      0.0000      0.0000      5.4600
+    857.4100      0.0000      0.0000      5.4500
+    858.0200      0.0000      0.0000      5.4500
+    858.6300      0.0000      0.0000      5.4500
+    859.2400      0.0000      0.0000      5.4400
+    859.8500      0.0000      0.0000      5.4500
+    860.4500      0.0000      0.0000      5.4500
+    861.0600      0.0000      0.0000      5.4500
+    861.6700      0.0000      0.0000      5.4400
+    862.2800      0.0000      0.0000      5.4400
+    862.8900      0.0000      0.0000      5.4400
+    863.5000      0.0000      0.0000      5.4400
+    864.1000      0.0000      0.0000      5.4400
+    864.7100      0.0000      0.0000      5.4400
+    865.3200      0.0000      0.0000      5.4400
+    865.9300      0.0000      0.0000      5.4300
+    866.5400      0.0000      0.0000      5.4300
+    867.1400      0.0000      0.0000      5.4300
+    867.7500      0.0000      0.0000      5.4200
+    868.3600      0.0000      0.0000      5.4200
+    868.9700      0.0000      0.0000      5.4100
+    869.5800      0.0000      0.0000      5.4100
+    870.1800      0.0000      0.0000      5.4100
+    870.7900      0.0000      0.0000      5.4000
+    871.4000      0.0000      0.0000      5.4000
+    872.0100      0.0000      0.0000      5.4000
+    872.6100      0.0000      0.0000      5.3900
+    873.2200      0.0000      0.0000      5.3800
+    873.8300      0.0000      0.0000      5.3600
+    874.4400      0.0000      0.0000      5.3600
+    875.0400      0.0000      0.0000      5.3500
+    875.6500      0.0000      0.0000      5.3400
+    876.2600      0.0000      0.0000      5.3300
+    876.8700      0.0000      0.0000      5.3300
+    877.4700      0.0000      0.0000      5.3200
+    878.0800      0.0000      0.0000      5.3200
+    878.6900      0.0000      0.0000      5.3100
+    879.2900      0.0000      0.0000      5.3100
+    879.9000      0.0000      0.0000      5.3100
+    880.5100      0.0000      0.0000      5.3100
+    881.1200      0.0000      0.0000      5.3000
+    881.7200      0.0000      0.0000      5.3000
+    882.3300      0.0000      0.0000      5.3000
+    882.9400      0.0000      0.0000      5.3000
+    883.5400      0.0000      0.0000      5.3000
+    884.1500      0.0000      0.0000      5.3000
+    884.7600      0.0000      0.0000      5.3000
+    885.3600      0.0000      0.0000      5.2900
+    885.9700      0.0000      0.0000      5.2900
+    886.5800      0.0000      0.0000      5.2900
+    887.1800      0.0000      0.0000      5.2900
+    887.7900      0.0000      0.0000      5.2800
+    888.4000      0.0000      0.0000      5.2800
+    889.0000      0.0000      0.0000      5.2800
+    889.6100      0.0000      0.0000      5.2800
+    890.2200      0.0000      0.0000      5.2800
+    890.8200      0.0000      0.0000      5.2700
+    891.4300      0.0000      0.0000      5.2800
+    892.0300      0.0000      0.0000      5.2800
+    892.6400      0.0000      0.0000      5.2700
+    893.2500      0.0000      0.0000      5.2700
+    893.8500      0.0000      0.0000      5.2700
+    894.4600      0.0000      0.0000      5.2600
+    895.0600      0.0000      0.0000      5.2600
+    895.6700      0.0000      0.0000      5.2500
+    896.2800      0.0000      0.0000      5.2400
+    896.8800      0.0000      0.0000      5.2400
+    897.4900      0.0000      0.0000      5.2300
+    898.0900      0.0000      0.0000      5.2200
+    898.7000      0.0000      0.0000      5.2100
+    899.3000      0.0000      0.0000      5.2000
+    899.9100      0.0000      0.0000      5.1900
+    900.5200      0.0000      0.0000      5.1800
+    901.1200      0.0000      0.0000      5.1800
+    901.7300      0.0000      0.0000      5.1800
+    902.3300      0.0000      0.0000      5.2100
+    902.9400      0.0000      0.0000      5.7800
+    903.5400      0.0000      0.0000      8.5200
+    904.1500      0.0000      0.0000     13.0500
+    904.7500      0.0000      0.0000     16.2600
+    905.3600      0.0000      0.0000     17.5900
+    905.9600      0.0000      0.0000     18.3600
+    906.5700      0.0000      0.0000     18.9500
+    907.1700      0.0000      0.0000     19.4600
+    907.7800      0.0000      0.0000     19.9300
+    908.3800      0.0000      0.0000     20.3600
+    908.9900      0.0000      0.0000     20.7600
+    909.5900      0.0000      0.0000     21.4100
+    910.2000      0.0000      0.0000     34.8400
+    910.8000      0.0000      0.0000     35.5000
+    911.4100      0.0000      0.0000     35.5000
+    912.0100      0.0000      0.0000     35.5000
+    912.6200      0.0000      0.0000     35.5000
+    913.2200      0.0000      0.0000     35.5000
+    913.8300      0.0000      0.0000     35.5000
+    914.4300      0.0000      0.0000     35.5000
+    915.0300      0.0000      0.0000     35.5000
+    915.6400      0.0000      0.0000     35.5000
+    916.2400      0.0000      0.0000     35.5000
+    916.8500      0.0000      0.0000     35.5000
+    917.4500      0.0000      0.0000     35.5000
+    918.0600      0.0000      0.0000     35.5000
+    918.6600      0.0000      0.0000     35.5000
+    919.2600      0.0000      0.0000     35.5000
+    919.8700      0.0000      0.0000     35.5000
+    920.4700      0.0000      0.0000     35.5000
+    921.0800      0.0000      0.0000     35.5000
+    921.6800      0.0000      0.0000     35.5000
+    922.2800      0.0000      0.0000     35.5000
+    922.8900      0.0000      0.0000     35.5000
+    923.4900      0.0000      0.0000     35.5000
+    924.1000      0.0000      0.0000     35.5000
+    924.7000      0.0000      0.0000     35.5000
+    925.3000      0.0000      0.0000     35.5000
+    925.9100      0.0000      0.0000     35.5000
+    926.5100      0.0000      0.0000     35.5000
+    927.1100      0.0000      0.0000     35.5000
+    927.7200      0.0000      0.0000     35.5000
+    928.3200      0.0000      0.0000     35.5000
+    928.9200      0.0000      0.0000     35.5000
+    929.5300      0.0000      0.0000     35.5000
+    930.1300      0.0000      0.0000     35.5000
+    930.7400      0.0000      0.0000     35.5000
+    931.3400      0.0000      0.0000     35.5000
+    931.9400      0.0000      0.0000     35.5000
+    932.5400      0.0000      0.0000     35.5000
+    933.1500      0.0000      0.0000     35.5000
+    933.7500      0.0000      0.0000     35.5000
+    934.3500      0.0000      0.0000     35.5000
+    934.9600      0.0000      0.0000     35.5000
+    935.5600      0.0000      0.0000     35.5000
+    936.1600      0.0000      0.0000     35.5000
+    936.7700      0.0000      0.0000     35.5000
+    937.3700      0.0000      0.0000     35.5000
+    937.9700      0.0000      0.0000     35.5000
+    938.5700      0.0000      0.0000     35.5000
+    939.1800      0.0000      0.0000     35.5000
+    939.7800      0.0000      0.0000     35.5000
+    940.3800      0.0000      0.0000     35.5000
+    940.9800      0.0000      0.0000     35.5000
+    941.5900      0.0000      0.0000     35.5000
+    942.1900      0.0000      0.0000     35.5000
+    942.7900      0.0000      0.0000     35.5000
+    943.3900      0.0000      0.0000     35.5000
+    944.0000      0.0000      0.0000     35.5000
+    944.6000      0.0000      0.0000     35.5000
+    945.2000      0.0000      0.0000     35.5000
+    945.8000      0.0000      0.0000     35.5000
+    946.4000      0.0000      0.0000     35.5000
+    947.0100      0.0000      0.0000     35.5000
+    947.6100      0.0000      0.0000     35.5000
+    948.2100      0.0000      0.0000     35.5000
+    948.8100      0.0000      0.0000     35.5000
+    949.4100      0.0000      0.0000     35.5000
+    950.0200      0.0000      0.0000     35.5000
+    950.6200      0.0000      0.0000     35.5000
+    951.2200      0.0000      0.0000     35.5000
+    951.8200      0.0000      0.0000     35.5000
+    952.4200      0.0000      0.0000     35.5000
+    953.0300      0.0000      0.0000     35.5000
+    953.6300      0.0000      0.0000     35.5000
+    954.2300      0.0000      0.0000     35.5000
+    954.8300      0.0000      0.0000     35.5000
+    955.4300      0.0000      0.0000     35.5000
+    956.0300      0.0000      0.0000     35.5000
+    956.6300      0.0000      0.0000     35.5000
+    957.2400      0.0000      0.0000     35.5000
+    957.8400      0.0000      0.0000     35.5000
+    958.4400      0.0000      0.0000     35.5000
+    959.0400      0.0000      0.0000     35.5000
+    959.6400      0.0000      0.0000     35.5000
+    960.2400      0.0000      0.0000     35.5000
+    960.8400      0.0000      0.0000     35.5000
+    961.4400      0.0000      0.0000     35.5000
+    962.0400      0.0000      0.0000     35.5000
+    962.6400      0.0000      0.0000     35.5000
+    963.2500      0.0000      0.0000     35.5000
+    963.8500      0.0000      0.0000     35.5000
+    964.4500      0.0000      0.0000     35.5000
+    965.0500      0.0000      0.0000     35.5000
+    965.6500      0.0000      0.0000     35.5000
+    966.2500      0.0000      0.0000     35.5000
+    966.8500      0.0000      0.0000     35.5000
+    967.4500      0.0000      0.0000     35.5000
+    968.0500      0.0000      0.0000     35.5000
+    968.6500      0.0000      0.0000     35.5000
+    969.2500      0.0000      0.0000     35.5000
+    969.8500      0.0000      0.0000     35.5000
+    970.4500      0.0000      0.0000     35.5000
+    971.0500      0.0000      0.0000     35.5000
+    971.6500      0.0000      0.0000     35.5000
+    972.2500      0.0000      0.0000     35.5000
+    972.8500      0.0000      0.0000     35.5000
+    973.4500      0.0000      0.0000     35.5000
@@ -0,0 +1,1254 @@
+test_read_store_and_write
+30/1/2017
+22:3:0
+Probe: Deep Blue
+Source: /root/package/data/input/aoml/WTDH_20170130220300_N02_XBT.txt
+      0.6700      0.0000      0.0000     26.4500
+      1.3400      0.0000      0.0000     26.3000
+      2.0100      0.0000      0.0000     26.2600
+      2.6800      0.0000      0.0000     26.2400
+      3.3400      0.0000      0.0000     26.2200
+      4.0100      0.0000      0.0000     26.2200
+      4.6800      0.0000      0.0000     26.2200
+      5.3500      0.0000      0.0000     26.2200
+      6.0200      0.0000      0.0000     26.2300
+      6.6900      0.0000      0.0000     26.2200
+      7.3600      0.0000      0.0000     26.2100
+      8.0300      0.0000      0.0000     26.2000
+      8.6900      0.0000      0.0000     26.1900
+      9.3600      0.0000      0.0000     26.1900
+     10.0300      0.0000      0.0000     26.1900
+     10.7000      0.0000      0.0000     26.2000
+     11.3700      0.0000      0.0000     26.2000
+     12.0400      0.0000      0.0000     26.2000
+     12.7000      0.0000      0.0000     26.1900
+     13.3700      0.0000      0.0000     26.1800
+     14.0400      0.0000      0.0000     26.1700
+     14.7100      0.0000      0.0000     26.1600
+     15.3800      0.0000      0.0000     26.1600
+     16.0500      0.0000      0.0000     26.1600
+     16.7100      0.0000      0.0000     26.1600
+     17.3800      0.0000      0.0000     26.1600
+     18.0500      0.0000      0.0000     26.1600
+     18.7200      0.0000      0.0000     26.1600
+     19.3800      0.0000      0.0000     26.1600
+     20.0500      0.0000      0.0000     26.1600
+     20.7200      0.0000      0.0000     26.1600
+     21.3900      0.0000      0.0000     26.1600
+     22.0600      0.0000      0.0000     26.1600
+     22.7200      0.0000      0.0000     26.1600
+     23.3900      0.0000      0.0000     26.1600
+     24.0600      0.0000      0.0000     26.1600
+     24.7300      0.0000      0.0000     26.1500
+     25.3900      0.0000      0.0000     26.1500
+     26.0600      0.0000      0.0000     26.1500
+     26.7300      0.0000      0.0000     26.1500
+     27.4000      0.0000      0.0000     26.1400
+     28.0600      0.0000      0.0000     26.1400
+     28.7300      0.0000      0.0000     26.1400
+     29.4000      0.0000      0.0000     26.1500
+     30.0600      0.0000      0.0000     26.1500
+     30.7300      0.0000      0.0000     26.1400
+     31.4000      0.0000      0.0000     26.1400
+     32.0600      0.0000      0.0000     26.1300
+     32.7300      0.0000      0.0000     26.1200
+     33.4000      0.0000      0.0000     26.1200
+     34.0700      0.0000      0.0000     26.1200
+     34.7300      0.0000      0.0000     26.1200
+     35.4000      0.0000      0.0000     26.1200
+     36.0700      0.0000      0.0000     26.1200
+     36.7300      0.0000      0.0000     26.1100
+     37.4000      0.0000      0.0000     26.1200
+     38.0700      0.0000      0.0000     26.1100
+     38.7300      0.0000      0.0000     26.1200
+     39.4000      0.0000      0.0000     26.1100
+     40.0600      0.0000      0.0000     26.1100
+     40.7300      0.0000      0.0000     26.1200
+     41.4000      0.0000      0.0000     26.1100
+     42.0600      0.0000      0.0000     26.1100
+     42.7300      0.0000      0.0000     26.1100
+     43.4000      0.0000      0.0000     26.1100
+     44.0600      0.0000      0.0000     26.1100
+     44.7300      0.0000      0.0000     26.1000
+     45.3900      0.0000      0.0000     26.1000
+     46.0600      0.0000      0.0000     26.1100
+     46.7300      0.0000      0.0000     26.1100
+     47.3900      0.0000      0.0000     26.1000
+     48.0600      0.0000      0.0000     26.0900
+     48.7200      0.0000      0.0000     26.0900
+     49.3900      0.0000      0.0000     26.0800
+     50.0600      0.0000      0.0000     26.0800
+     50.7200      0.0000      0.0000     26.0900
+     51.3900      0.0000      0.0000     26.0900
+     52.0500      0.0000      0.0000     26.0900
+     52.7200      0.0000      0.0000     26.0900
+     53.3800      0.0000      0.0000     26.0800
+     54.0500      0.0000      0.0000     26.0900
+     54.7100      0.0000      0.0000     26.0900
+     55.3800      0.0000      0.0000     26.0900
+     56.0500      0.0000      0.0000     26.0700
+     56.7100      0.0000      0.0000     26.0400
+     57.3800      0.0000      0.0000     26.0200
+     58.0400      0.0000      0.0000     26.0200
+     58.7100      0.0000      0.0000     26.0100
+     59.3700      0.0000      0.0000     26.0000
+     60.0400      0.0000      0.0000     25.9900
+     60.7000      0.0000      0.0000     25.9800
+     61.3700      0.0000      0.0000     25.9700
+     62.0300      0.0000      0.0000     25.9500
+     62.7000      0.0000      0.0000     25.9200
+     63.3600      0.0000      0.0000     25.9100
+     64.0300      0.0000      0.0000     25.9000
+     64.6900      0.0000      0.0000     25.8900
+     65.3600      0.0000      0.0000     25.8700
+     66.0200      0.0000      0.0000     25.8500
+     66.6800      0.0000      0.0000     25.8500
+     67.3500      0.0000      0.0000     25.8400
+     68.0100      0.0000      0.0000     25.8400
+     68.6800      0.0000      0.0000     25.8300
+     69.3400      0.0000      0.0000     25.8300
+     70.0100      0.0000      0.0000     25.8300
+     70.6700      0.0000      0.0000     25.8200
+     71.3400      0.0000      0.0000     25.8200
+     72.0000      0.0000      0.0000     25.8200
+     72.6600      0.0000      0.0000     25.8200
+     73.3300      0.0000      0.0000     25.8100
+     73.9900      0.0000      0.0000     25.8000
+     74.6600      0.0000      0.0000     25.8000
+     75.3200      0.0000      0.0000     25.7900
+     75.9800      0.0000      0.0000     25.7800
+     76.6500      0.0000      0.0000     25.7800
+     77.3100      0.0000      0.0000     25.7700
+     77.9800      0.0000      0.0000     25.7700
+     78.6400      0.0000      0.0000     25.7600
+     79.3000      0.0000      0.0000     25.7400
+     79.9700      0.0000      0.0000     25.7300
+     80.6300      0.0000      0.0000     25.7200
+     81.3000      0.0000      0.0000     25.7100
+     81.9600      0.0000      0.0000     25.7000
+     82.6200      0.0000      0.0000     25.7000
+     83.2900      0.0000      0.0000     25.6900
+     83.9500      0.0000      0.0000     25.6800
+     84.6100      0.0000      0.0000     25.6800
+     85.2800      0.0000      0.0000     25.6800
+     85.9400      0.0000      0.0000     25.6800
+     86.6000      0.0000      0.0000     25.6800
+     87.2700      0.0000      0.0000     25.6800
+     87.9300      0.0000      0.0000     25.6800
+     88.5900      0.0000      0.0000     25.6900
+     89.2600      0.0000      0.0000     25.6900
+     89.9200      0.0000      0.0000     25.6900
+     90.5800      0.0000      0.0000     25.7000
+     91.2400      0.0000      0.0000     25.7000
+     91.9100      0.0000      0.0000     25.7000
+     92.5700      0.0000      0.0000     25.7000
+     93.2300      0.0000      0.0000     25.7000
+     93.9000      0.0000      0.0000     25.7000
+     94.5600      0.0000      0.0000     25.7000
+     95.2200      0.0000      0.0000     25.7000
+     95.8800      0.0000      0.0000     25.7000
+     96.5500      0.0000      0.0000     25.7100
+     97.2100      0.0000      0.0000     25.7300
+     97.8700      0.0000      0.0000     25.7500
+     98.5300      0.0000      0.0000     25.7500
+     99.2000      0.0000      0.0000     25.7500
+     99.8600      0.0000      0.0000     25.7500
+    100.5200      0.0000      0.0000     25.7500
+    101.1800      0.0000      0.0000     25.7500
+    101.8500      0.0000      0.0000     25.7500
+    102.5100      0.0000      0.0000     25.7500
+    103.1700      0.0000      0.0000     25.7500
+    103.8300      0.0000      0.0000     25.7600
+    104.4900      0.0000      0.0000     25.7700
+    105.1600      0.0000      0.0000     25.7700
+    105.8200      0.0000      0.0000     25.7700
+    106.4800      0.0000      0.0000     25.7700
+    107.1400      0.0000      0.0000     25.7600
+    107.8000      0.0000      0.0000     25.7600
+    108.4700      0.0000      0.0000     25.7600
+    109.1300      0.0000      0.0000     25.7600
+    109.7900      0.0000      0.0000     25.7600
+    110.4500      0.0000      0.0000     25.7600
+    111.1100      0.0000      0.0000     25.7600
+    111.7700      0.0000      0.0000     25.7600
+    112.4400      0.0000      0.0000     25.7600
+    113.1000      0.0000      0.0000     25.7600
+    113.7600      0.0000      0.0000     25.7700
+    114.4200      0.0000      0.0000     25.7700
+    115.0800      0.0000      0.0000     25.7700
+    115.7400      0.0000      0.0000     25.7800
+    116.4000      0.0000      0.0000     25.7800
+    117.0600      0.0000      0.0000     25.7800
+    117.7300      0.0000      0.0000     25.8000
+    118.3900      0.0000      0.0000     25.8100
+    119.0500      0.0000      0.0000     25.8100
+    119.7100      0.0000      0.0000     25.8100
+    120.3700      0.0000      0.0000     25.8100
+    121.0300      0.0000      0.0000     25.8100
+    121.6900      0.0000      0.0000     25.8200
+    122.3500      0.0000      0.0000     25.8200
+    123.0100      0.0000      0.0000     25.8200
+    123.6700      0.0000      0.0000     25.8200
+    124.3300      0.0000      0.0000     25.8300
+    125.0000      0.0000      0.0000     25.8500
+    125.6600      0.0000      0.0000     25.8700
+    126.3200      0.0000      0.0000     25.8800
+    126.9800      0.0000      0.0000     25.8800
+    127.6400      0.0000      0.0000     25.8800
+    128.3000      0.0000      0.0000     25.8800
+    128.9600      0.0000      0.0000     25.9000
+    129.6200      0.0000      0.0000     25.9300
+    130.2800      0.0000      0.0000     25.9500
+    130.9400      0.0000      0.0000     25.9700
+    131.6000      0.0000      0.0000     25.9800
+    132.2600      0.0000      0.0000     25.9900
+    132.9200      0.0000      0.0000     26.0000
+    133.5800      0.0000      0.0000     25.9900
+    134.2400      0.0000      0.0000     25.9700
+    134.9000      0.0000      0.0000     25.9600
+    135.5600      0.0000      0.0000     25.9400
+    136.2200      0.0000      0.0000     25.9100
+    136.8800      0.0000      0.0000     25.8300
+    137.5400      0.0000      0.0000     25.7500
+    138.2000      0.0000      0.0000     25.7100
+    138.8600      0.0000      0.0000     25.5100
+    139.5200      0.0000      0.0000     25.1600
+    140.1800      0.0000      0.0000     24.8900
+    140.8400      0.0000      0.0000     24.6100
+    141.5000      0.0000      0.0000     24.3300
+    142.1600      0.0000      0.0000     24.1700
+    142.8200      0.0000      0.0000     24.0600
+    143.4800      0.0000      0.0000     23.9300
+    144.1400      0.0000      0.0000     23.7200
+    144.7900      0.0000      0.0000     23.5000
+    145.4500      0.0000      0.0000     23.2800
+    146.1100      0.0000      0.0000     23.0300
+    146.7700      0.0000      0.0000     22.8700
+    147.4300      0.0000      0.0000     22.7600
+    148.0900      0.0000      0.0000     22.6800
+    148.7500      0.0000      0.0000     22.5800
+    149.4100      0.0000      0.0000     22.4500
+    150.0700      0.0000      0.0000     22.3400
+    150.7300      0.0000      0.0000     22.2700
+    151.3900      0.0000      0.0000     22.2000
+    152.0400      0.0000      0.0000     21.9000
+    152.7000      0.0000      0.0000     21.0900
+    153.3600      0.0000      0.0000     20.3800
+    154.0200      0.0000      0.0000     20.0500
+    154.6800      0.0000      0.0000     19.8400
+    155.3400      0.0000      0.0000     19.6900
+    156.0000      0.0000      0.0000     19.5500
+    156.6500      0.0000      0.0000     19.4200
+    157.3100      0.0000      0.0000     19.2400
+    157.9700      0.0000      0.0000     19.0500
+    158.6300      0.0000      0.0000     18.9100
+    159.2900      0.0000      0.0000     18.7500
+    159.9500      0.0000      0.0000     18.6100
+    160.6000      0.0000      0.0000     18.5000
+    161.2600      0.0000      0.0000     18.4100
+    161.9200      0.0000      0.0000     18.3300
+    162.5800      0.0000      0.0000     18.2300
+    163.2400      0.0000      0.0000     18.1400
+    163.9000      0.0000      0.0000     18.0600
+    164.5500      0.0000      0.0000     18.0300
+    165.2100      0.0000      0.0000     18.0100
+    165.8700      0.0000      0.0000     17.9900
+    166.5300      0.0000      0.0000     17.9600
+    167.1800      0.0000      0.0000     17.9000
+    167.8400      0.0000      0.0000     17.8400
+    168.5000      0.0000      0.0000     17.8100
+    169.1600      0.0000      0.0000     17.7900
+    169.8200      0.0000      0.0000     17.7600
+    170.4700      0.0000      0.0000     17.7100
+    171.1300      0.0000      0.0000     17.6500
+    171.7900      0.0000      0.0000     17.5800
+    172.4500      0.0000      0.0000     17.5200
+    173.1000      0.0000      0.0000     17.4900
+    173.7600      0.0000      0.0000     17.5000
+    174.4200      0.0000      0.0000     17.5200
+    175.0700      0.0000      0.0000     17.5200
+    175.7300      0.0000      0.0000     17.5200
+    176.3900      0.0000      0.0000     17.5200
+    177.0500      0.0000      0.0000     17.5200
+    177.7000      0.0000      0.0000     17.5100
+    178.3600      0.0000      0.0000     17.4900
+    179.0200      0.0000      0.0000     17.4700
+    179.6700      0.0000      0.0000     17.4300
+    180.3300      0.0000      0.0000     17.3400
+    180.9900      0.0000      0.0000     17.2200
+    181.6400      0.0000      0.0000     17.1300
+    182.3000      0.0000      0.0000     17.0800
+    182.9600      0.0000      0.0000     17.0500
+    183.6100      0.0000      0.0000     16.9900
+    184.2700      0.0000      0.0000     16.9300
+    184.9300      0.0000      0.0000     16.8600
+    185.5800      0.0000      0.0000     16.7900
+    186.2400      0.0000      0.0000     16.7500
+    186.9000      0.0000      0.0000     16.7200
+    187.5500      0.0000      0.0000     16.7000
+    188.2100      0.0000      0.0000     16.6900
+    188.8700      0.0000      0.0000     16.6800
+    189.5200      0.0000      0.0000     16.6700
+    190.1800      0.0000      0.0000     16.6300
+    190.8300      0.0000      0.0000     16.5600
+    191.4900      0.0000      0.0000     16.4900
+    192.1500      0.0000      0.0000     16.4300
+    192.8000      0.0000      0.0000     16.4100
+    193.4600      0.0000      0.0000     16.3700
+    194.1100      0.0000      0.0000     16.2800
+    194.7700      0.0000      0.0000     16.1900
+    195.4300      0.0000      0.0000     16.1300
+    196.0800      0.0000      0.0000     16.1100
+    196.7400      0.0000      0.0000     16.1100
+    197.3900      0.0000      0.0000     16.1200
+    198.0500      0.0000      0.0000     16.1300
+    198.7100      0.0000      0.0000     16.1500
+    199.3600      0.0000      0.0000     16.1600
+    200.0200      0.0000      0.0000     16.1600
+    200.6700      0.0000      0.0000     16.1200
+    201.3300      0.0000      0.0000     15.9500
+    201.9800      0.0000      0.0000     15.7200
+    202.6400      0.0000      0.0000     15.5600
+    203.2900      0.0000      0.0000     15.4900
+    203.9500      0.0000      0.0000     15.4600
+    204.6000      0.0000      0.0000     15.4400
+    205.2600      0.0000      0.0000     15.4200
+    205.9100      0.0000      0.0000     15.4100
+    206.5700      0.0000      0.0000     15.3900
+    207.2200      0.0000      0.0000     15.3800
+    207.8800      0.0000      0.0000     15.3600
+    208.5300      0.0000      0.0000     15.3500
+    209.1900      0.0000      0.0000     15.3300
+    209.8400      0.0000      0.0000     15.3200
+    210.5000      0.0000      0.0000     15.3100
+    211.1500      0.0000      0.0000     15.2900
+    211.8100      0.0000      0.0000     15.2800
+    212.4600      0.0000      0.0000     15.2800
+    213.1200      0.0000      0.0000     15.2600
+    213.7700      0.0000      0.0000     15.2500
+    214.4300      0.0000      0.0000     15.2500
+    215.0800      0.0000      0.0000     15.2400
+    215.7400      0.0000      0.0000     15.2200
+    216.3900      0.0000      0.0000     15.2100
+    217.0400      0.0000      0.0000     15.1900
+    217.7000      0.0000      0.0000     15.1600
+    218.3500      0.0000      0.0000     15.1200
+    219.0100      0.0000      0.0000     15.0800
+    219.6600      0.0000      0.0000     15.0500
+    220.3200      0.0000      0.0000     15.0200
+    220.9700      0.0000      0.0000     15.0000
+    221.6200      0.0000      0.0000     14.9900
+    222.2800      0.0000      0.0000     14.9800
+    222.9300      0.0000      0.0000     14.9700
+    223.5900      0.0000      0.0000     14.9600
+    224.2400      0.0000      0.0000     14.9400
+    224.8900      0.0000      0.0000     14.9400
+    225.5500      0.0000      0.0000     14.9300
+    226.2000      0.0000      0.0000     14.9100
+    226.8500      0.0000      0.0000     14.9000
+    227.5100      0.0000      0.0000     14.8900
+    228.1600      0.0000      0.0000     14.8800
+    228.8100      0.0000      0.0000     14.8600
+    229.4700      0.0000      0.0000     14.8300
+    230.1200      0.0000      0.0000     14.8000
+    230.7800      0.0000      0.0000     14.7800
+    231.4300      0.0000      0.0000     14.7700
+    232.0800      0.0000      0.0000     14.7700
+    232.7400      0.0000      0.0000     14.7700
+    233.3900      0.0000      0.0000     14.7600
+    234.0400      0.0000      0.0000     14.7700
+    234.6900      0.0000      0.0000     14.7600
+    235.3500      0.0000      0.0000     14.7600
+    236.0000      0.0000      0.0000     14.7600
+    236.6500      0.0000      0.0000     14.7600
+    237.3100      0.0000      0.0000     14.7400
+    237.9600      0.0000      0.0000     14.7200
+    238.6100      0.0000      0.0000     14.7000
+    239.2700      0.0000      0.0000     14.6800
+    239.9200      0.0000      0.0000     14.6500
+    240.5700      0.0000      0.0000     14.6000
+    241.2200      0.0000      0.0000     14.5500
+    241.8800      0.0000      0.0000     14.5100
+    242.5300      0.0000      0.0000     14.5000
+    243.1800      0.0000      0.0000     14.5000
+    243.8300      0.0000      0.0000     14.4900
+    244.4900      0.0000      0.0000     14.4700
+    245.1400      0.0000      0.0000     14.4700
+    245.7900      0.0000      0.0000     14.4700
+    246.4400      0.0000      0.0000     14.4700
+    247.1000      0.0000      0.0000     14.4700
+    247.7500      0.0000      0.0000     14.4700
+    248.4000      0.0000      0.0000     14.4700
+    249.0500      0.0000      0.0000     14.4600
+    249.7000      0.0000      0.0000     14.4600
+    250.3600      0.0000      0.0000     14.4600
+    251.0100      0.0000      0.0000     14.4600
+    251.6600      0.0000      0.0000     14.4500
+    252.3100      0.0000      0.0000     14.4500
+    252.9600      0.0000      0.0000     14.4400
+    253.6200      0.0000      0.0000     14.4300
+    254.2700      0.0000      0.0000     14.3600
+    254.9200      0.0000      0.0000     14.1900
+    255.5700      0.0000      0.0000     14.0800
+    256.2200      0.0000      0.0000     13.9700
+    256.8800      0.0000      0.0000     13.8600
+    257.5300      0.0000      0.0000     13.7900
+    258.1800      0.0000      0.0000     13.7400
+    258.8300      0.0000      0.0000     13.7100
+    259.4800      0.0000      0.0000     13.6900
+    260.1300      0.0000      0.0000     13.6600
+    260.7800      0.0000      0.0000     13.6200
+    261.4400      0.0000      0.0000     13.5600
+    262.0900      0.0000      0.0000     13.4800
+    262.7400      0.0000      0.0000     13.4100
+    263.3900      0.0000      0.0000     13.3800
+    264.0400      0.0000      0.0000     13.3600
+    264.6900      0.0000      0.0000     13.3000
+    265.3400      0.0000      0.0000     13.1900
+    265.9900      0.0000      0.0000     13.1100
+    266.6400      0.0000      0.0000     13.0800
+    267.2900      0.0000      0.0000     13.0500
+    267.9500      0.0000      0.0000     13.0200
+    268.6000      0.0000      0.0000     13.0000
+    269.2500      0.0000      0.0000     12.9800
+    269.9000      0.0000      0.0000     12.9600
+    270.5500      0.0000      0.0000     12.9500
+    271.2000      0.0000      0.0000     12.9300
+    271.8500      0.0000      0.0000     12.9100
+    272.5000      0.0000      0.0000     12.9000
+    273.1500      0.0000      0.0000     12.8900
+    273.8000      0.0000      0.0000     12.8800
+    274.4500      0.0000      0.0000     12.8600
+    275.1000      0.0000      0.0000     12.8400
+    275.7500      0.0000      0.0000     12.8300
+    276.4000      0.0000      0.0000     12.8200
+    277.0500      0.0000      0.0000     12.8100
+    277.7000      0.0000      0.0000     12.8000
+    278.3500      0.0000      0.0000     12.7900
+    279.0000      0.0000      0.0000     12.7900
+    279.6500      0.0000      0.0000     12.7900
+    280.3000      0.0000      0.0000     12.7900
+    280.9500      0.0000      0.0000     12.7900
+    281.6000      0.0000      0.0000     12.7800
+    282.2500      0.0000      0.0000     12.7600
+    282.9000      0.0000      0.0000     12.7500
+    283.5500      0.0000      0.0000     12.7400
+    284.2000      0.0000      0.0000     12.7300
+    284.8500      0.0000      0.0000     12.7200
+    285.5000      0.0000      0.0000     12.7200
+    286.1500      0.0000      0.0000     12.7200
+    286.8000      0.0000      0.0000     12.7100
+    287.4500      0.0000      0.0000     12.7100
+    288.1000      0.0000      0.0000     12.7100
+    288.7500      0.0000      0.0000     12.7000
+    289.4000      0.0000      0.0000     12.7000
+    290.0500      0.0000      0.0000     12.6800
+    290.7000      0.0000      0.0000     12.6700
+    291.3500      0.0000      0.0000     12.6600
+    292.0000      0.0000      0.0000     12.6400
+    292.6400      0.0000      0.0000     12.6100
+    293.2900      0.0000      0.0000     12.6000
+    293.9400      0.0000      0.0000     12.5800
+    294.5900      0.0000      0.0000     12.5400
+    295.2400      0.0000      0.0000     12.5100
+    295.8900      0.0000      0.0000     12.4800
+    296.5400      0.0000      0.0000     12.4500
+    297.1900      0.0000      0.0000     12.4100
+    297.8400      0.0000      0.0000     12.3500
+    298.4900      0.0000      0.0000     12.3000
+    299.1300      0.0000      0.0000     12.2800
+    299.7800      0.0000      0.0000     12.2600
+    300.4300      0.0000      0.0000     12.2400
+    301.0800      0.0000      0.0000     12.2200
+    301.7300      0.0000      0.0000     12.2000
+    302.3800      0.0000      0.0000     12.1800
+    303.0200      0.0000      0.0000     12.1600
+    303.6700      0.0000      0.0000     12.1300
+    304.3200      0.0000      0.0000     12.1000
+    304.9700      0.0000      0.0000     12.0900
+    305.6200      0.0000      0.0000     12.0900
+    306.2700      0.0000      0.0000     12.0900
+    306.9100      0.0000      0.0000     12.0800
+    307.5600      0.0000      0.0000     12.0800
+    308.2100      0.0000      0.0000     12.0800
+    308.8600      0.0000      0.0000     12.0700
+    309.5100      0.0000      0.0000     12.0700
+    310.1500      0.0000      0.0000     12.0600
+    310.8000      0.0000      0.0000     12.0600
+    311.4500      0.0000      0.0000     12.0600
+    312.1000      0.0000      0.0000     12.0500
+    312.7500      0.0000      0.0000     12.0500
+    313.3900      0.0000      0.0000     12.0400
+    314.0400      0.0000      0.0000     12.0400
+    314.6900      0.0000      0.0000     12.0300
+    315.3400      0.0000      0.0000     12.0200
+    315.9800      0.0000      0.0000     12.0100
+    316.6300      0.0000      0.0000     12.0100
+    317.2800      0.0000      0.0000     12.0000
+    317.9300      0.0000      0.0000     12.0000
+    318.5700      0.0000      0.0000     12.0000
+    319.2200      0.0000      0.0000     11.9900
+    319.8700      0.0000      0.0000     11.9900
+    320.5200      0.0000      0.0000     11.9900
+    321.1600      0.0000      0.0000     11.9900
+    321.8100      0.0000      0.0000     11.9900
+    322.4600      0.0000      0.0000     11.9800
+    323.1000      0.0000      0.0000     11.9800
+    323.7500      0.0000      0.0000     11.9800
+    324.4000      0.0000      0.0000     11.9700
+    325.0400      0.0000      0.0000     11.9700
+    325.6900      0.0000      0.0000     11.9600
+    326.3400      0.0000      0.0000     11.9500
+    326.9900      0.0000      0.0000     11.9400
+    327.6300      0.0000      0.0000     11.9300
+    328.2800      0.0000      0.0000     11.9100
+    328.9200      0.0000      0.0000     11.9000
+    329.5700      0.0000      0.0000     11.8800
+    330.2200      0.0000      0.0000     11.8700
+    330.8600      0.0000      0.0000     11.8600
+    331.5100      0.0000      0.0000     11.8400
+    332.1600      0.0000      0.0000     11.8200
+    332.8000      0.0000      0.0000     11.8000
+    333.4500      0.0000      0.0000     11.7600
+    334.1000      0.0000      0.0000     11.7200
+    334.7400      0.0000      0.0000     11.6900
+    335.3900      0.0000      0.0000     11.6800
+    336.0300      0.0000      0.0000     11.6500
+    336.6800      0.0000      0.0000     11.6100
+    337.3300      0.0000      0.0000     11.5700
+    337.9700      0.0000      0.0000     11.5400
+    338.6200      0.0000      0.0000     11.5000
+    339.2600      0.0000      0.0000     11.4700
+    339.9100      0.0000      0.0000     11.4600
+    340.5600      0.0000      0.0000     11.4500
+    341.2000      0.0000      0.0000     11.4400
+    341.8500      0.0000      0.0000     11.4200
+    342.4900      0.0000      0.0000     11.3700
+    343.1400      0.0000      0.0000     11.3100
+    343.7800      0.0000      0.0000     11.2700
+    344.4300      0.0000      0.0000     11.1800
+    345.0800      0.0000      0.0000     11.0400
+    345.7200      0.0000      0.0000     10.9500
+    346.3700      0.0000      0.0000     10.9000
+    347.0100      0.0000      0.0000     10.8700
+    347.6600      0.0000      0.0000     10.8400
+    348.3000      0.0000      0.0000     10.8100
+    348.9500      0.0000      0.0000     10.7900
+    349.5900      0.0000      0.0000     10.7600
+    350.2400      0.0000      0.0000     10.7500
+    350.8800      0.0000      0.0000     10.7400
+    351.5300      0.0000      0.0000     10.7300
+    352.1700      0.0000      0.0000     10.7200
+    352.8200      0.0000      0.0000     10.7100
+    353.4600      0.0000      0.0000     10.6900
+    354.1100      0.0000      0.0000     10.6800
+    354.7500      0.0000      0.0000     10.6700
+    355.4000      0.0000      0.0000     10.6600
+    356.0400      0.0000      0.0000     10.6500
+    356.6900      0.0000      0.0000     10.6500
+    357.3300      0.0000      0.0000     10.6400
+    357.9800      0.0000      0.0000     10.6300
+    358.6200      0.0000      0.0000     10.6300
+    359.2700      0.0000      0.0000     10.6300
+    359.9100      0.0000      0.0000     10.6300
+    360.5500      0.0000      0.0000     10.6200
+    361.2000      0.0000      0.0000     10.6100
+    361.8400      0.0000      0.0000     10.6100
+    362.4900      0.0000      0.0000     10.6000
+    363.1300      0.0000      0.0000     10.6000
+    363.7800      0.0000      0.0000     10.5900
+    364.4200      0.0000      0.0000     10.5900
+    365.0600      0.0000      0.0000     10.5800
+    365.7100      0.0000      0.0000     10.5800
+    366.3500      0.0000      0.0000     10.5700
+    367.0000      0.0000      0.0000     10.5600
+    367.6400      0.0000      0.0000     10.5500
+    368.2800      0.0000      0.0000     10.5500
+    368.9300      0.0000      0.0000     10.5400
+    369.5700      0.0000      0.0000     10.5300
+    370.2200      0.0000      0.0000     10.5200
+    370.8600      0.0000      0.0000     10.5200
+    371.5000      0.0000      0.0000     10.5100
+    372.1500      0.0000      0.0000     10.5100
+    372.7900      0.0000      0.0000     10.5000
+    373.4300      0.0000      0.0000     10.4900
+    374.0800      0.0000      0.0000     10.4900
+    374.7200      0.0000      0.0000     10.4800
+    375.3600      0.0000      0.0000     10.4800
+    376.0100      0.0000      0.0000     10.4800
+    376.6500      0.0000      0.0000     10.4700
+    377.2900      0.0000      0.0000     10.4700
+    377.9400      0.0000      0.0000     10.4700
+    378.5800      0.0000      0.0000     10.4700
+    379.2200      0.0000      0.0000     10.4700
+    379.8700      0.0000      0.0000     10.4600
+    380.5100      0.0000      0.0000     10.4700
+    381.1500      0.0000      0.0000     10.4700
+    381.7900      0.0000      0.0000     10.4700
+    382.4400      0.0000      0.0000     10.4700
+    383.0800      0.0000      0.0000     10.4700
+    383.7200      0.0000      0.0000     10.4700
+    384.3700      0.0000      0.0000     10.4700
+    385.0100      0.0000      0.0000     10.4700
+    385.6500      0.0000      0.0000     10.4700
+    386.2900      0.0000      0.0000     10.4700
+    386.9400      0.0000      0.0000     10.4600
+    387.5800      0.0000      0.0000     10.4600
+    388.2200      0.0000      0.0000     10.4600
+    388.8600      0.0000      0.0000     10.4600
+    389.5100      0.0000      0.0000     10.4600
+    390.1500      0.0000      0.0000     10.4600
+    390.7900      0.0000      0.0000     10.4600
+    391.4300      0.0000      0.0000     10.4600
+    392.0800      0.0000      0.0000     10.4600
+    392.7200      0.0000      0.0000     10.4600
+    393.3600      0.0000      0.0000     10.4600
+    394.0000      0.0000      0.0000     10.4600
+    394.6400      0.0000      0.0000     10.4600
+    395.2900      0.0000      0.0000     10.4600
+    395.9300      0.0000      0.0000     10.4600
+    396.5700      0.0000      0.0000     10.4600
+    397.2100      0.0000      0.0000     10.4500
+    397.8500      0.0000      0.0000     10.4500
+    398.5000      0.0000      0.0000     10.4500
+    399.1400      0.0000      0.0000     10.4500
+    399.7800      0.0000      0.0000     10.4500
+    400.4200      0.0000      0.0000     10.4500
+    401.0600      0.0000      0.0000     10.4400
+    401.7000      0.0000      0.0000     10.4300
+    402.3500      0.0000      0.0000     10.4300
+    402.9900      0.0000      0.0000     10.4300
+    403.6300      0.0000      0.0000     10.4300
+    404.2700      0.0000      0.0000     10.4300
+    404.9100      0.0000      0.0000     10.4300
+    405.5500      0.0000      0.0000     10.4300
+    406.1900      0.0000      0.0000     10.4300
+    406.8300      0.0000      0.0000     10.4200
+    407.4800      0.0000      0.0000     10.4000
+    408.1200      0.0000      0.0000     10.3800
+    408.7600      0.0000      0.0000     10.3300
+    409.4000      0.0000      0.0000     10.2900
+    410.0400      0.0000      0.0000     10.2700
+    410.6800      0.0000      0.0000     10.2600
+    411.3200      0.0000      0.0000     10.2500
+    411.9600      0.0000      0.0000     10.2400
+    412.6000      0.0000      0.0000     10.2200
+    413.2400      0.0000      0.0000     10.2000
+    413.8800      0.0000      0.0000     10.1900
+    414.5200      0.0000      0.0000     10.1900
+    415.1700      0.0000      0.0000     10.1800
+    415.8100      0.0000      0.0000     10.1700
+    416.4500      0.0000      0.0000     10.1600
+    417.0900      0.0000      0.0000     10.1500
+    417.7300      0.0000      0.0000     10.1400
+    418.3700      0.0000      0.0000     10.1400
+    419.0100      0.0000      0.0000     10.1400
+    419.6500      0.0000      0.0000     10.1300
+    420.2900      0.0000      0.0000     10.1300
+    420.9300      0.0000      0.0000     10.1300
+    421.5700      0.0000      0.0000     10.1300
+    422.2100      0.0000      0.0000     10.1300
+    422.8500      0.0000      0.0000     10.1300
+    423.4900      0.0000      0.0000     10.1200
+    424.1300      0.0000      0.0000     10.1200
+    424.7700      0.0000      0.0000     10.1100
+    425.4100      0.0000      0.0000     10.1100
+    426.0500      0.0000      0.0000     10.1100
+    426.6900      0.0000      0.0000     10.1100
+    427.3300      0.0000      0.0000     10.1000
+    427.9700      0.0000      0.0000     10.1000
+    428.6100      0.0000      0.0000     10.1000
+    429.2500      0.0000      0.0000     10.0900
+    429.8900      0.0000      0.0000     10.0900
+    430.5300      0.0000      0.0000     10.0900
+    431.1700      0.0000      0.0000     10.0900
+    431.8000      0.0000      0.0000     10.0900
+    432.4400      0.0000      0.0000     10.0800
+    433.0800      0.0000      0.0000     10.0800
+    433.7200      0.0000      0.0000     10.0800
+    434.3600      0.0000      0.0000     10.0800
+    435.0000      0.0000      0.0000     10.0800
+    435.6400      0.0000      0.0000     10.0700
+    436.2800      0.0000      0.0000     10.0700
+    436.9200      0.0000      0.0000     10.0700
+    437.5600      0.0000      0.0000     10.0600
+    438.2000      0.0000      0.0000     10.0600
+    438.8400      0.0000      0.0000     10.0600
+    439.4700      0.0000      0.0000     10.0600
+    440.1100      0.0000      0.0000     10.0600
+    440.7500      0.0000      0.0000     10.0600
+    441.3900      0.0000      0.0000     10.0600
+    442.0300      0.0000      0.0000     10.0500
+    442.6700      0.0000      0.0000     10.0500
+    443.3100      0.0000      0.0000     10.0400
+    443.9500      0.0000      0.0000     10.0300
+    444.5800      0.0000      0.0000     10.0300
+    445.2200      0.0000      0.0000     10.0200
+    445.8600      0.0000      0.0000     10.0100
+    446.5000      0.0000      0.0000      9.9900
+    447.1400      0.0000      0.0000      9.9800
+    447.7800      0.0000      0.0000      9.9600
+    448.4100      0.0000      0.0000      9.9400
+    449.0500      0.0000      0.0000      9.9000
+    449.6900      0.0000      0.0000      9.8500
+    450.3300      0.0000      0.0000      9.8200
+    450.9700      0.0000      0.0000      9.8000
+    451.6000      0.0000      0.0000      9.7800
+    452.2400      0.0000      0.0000      9.7600
+    452.8800      0.0000      0.0000      9.7300
+    453.5200      0.0000      0.0000      9.6900
+    454.1600      0.0000      0.0000      9.6400
+    454.7900      0.0000      0.0000      9.6200
+    455.4300      0.0000      0.0000      9.6000
+    456.0700      0.0000      0.0000      9.5800
+    456.7100      0.0000      0.0000      9.5400
+    457.3500      0.0000      0.0000      9.4400
+    457.9800      0.0000      0.0000      9.3500
+    458.6200      0.0000      0.0000      9.3000
+    459.2600      0.0000      0.0000      9.2600
+    459.9000      0.0000      0.0000      9.2400
+    460.5300      0.0000      0.0000      9.2300
+    461.1700      0.0000      0.0000      9.2200
+    461.8100      0.0000      0.0000      9.2200
+    462.4400      0.0000      0.0000      9.2100
+    463.0800      0.0000      0.0000      9.2000
+    463.7200      0.0000      0.0000      9.1900
+    464.3600      0.0000      0.0000      9.1800
+    464.9900      0.0000      0.0000      9.1700
+    465.6300      0.0000      0.0000      9.1600
+    466.2700      0.0000      0.0000      9.1400
+    466.9000      0.0000      0.0000      9.1200
+    467.5400      0.0000      0.0000      9.1000
+    468.1800      0.0000      0.0000      9.0900
+    468.8100      0.0000      0.0000      9.0800
+    469.4500      0.0000      0.0000      9.0700
+    470.0900      0.0000      0.0000      9.0700
+    470.7200      0.0000      0.0000      9.0600
+    471.3600      0.0000      0.0000      9.0600
+    472.0000      0.0000      0.0000      9.0500
+    472.6300      0.0000      0.0000      9.0500
+    473.2700      0.0000      0.0000      9.0400
+    473.9100      0.0000      0.0000      9.0400
+    474.5400      0.0000      0.0000      9.0300
+    475.1800      0.0000      0.0000      9.0300
+    475.8200      0.0000      0.0000      9.0200
+    476.4500      0.0000      0.0000      9.0100
+    477.0900      0.0000      0.0000      9.0100
+    477.7300      0.0000      0.0000      9.0000
+    478.3600      0.0000      0.0000      8.9900
+    479.0000      0.0000      0.0000      8.9900
+    479.6300      0.0000      0.0000      8.9800
+    480.2700      0.0000      0.0000      8.9700
+    480.9100      0.0000      0.0000      8.9500
+    481.5400      0.0000      0.0000      8.9300
+    482.1800      0.0000      0.0000      8.9000
+    482.8100      0.0000      0.0000      8.8900
+    483.4500      0.0000      0.0000      8.8700
+    484.0800      0.0000      0.0000      8.8400
+    484.7200      0.0000      0.0000      8.8000
+    485.3600      0.0000      0.0000      8.7700
+    485.9900      0.0000      0.0000      8.7100
+    486.6300      0.0000      0.0000      8.6600
+    487.2600      0.0000      0.0000      8.6300
+    487.9000      0.0000      0.0000      8.6100
+    488.5300      0.0000      0.0000      8.5900
+    489.1700      0.0000      0.0000      8.5600
+    489.8000      0.0000      0.0000      8.5300
+    490.4400      0.0000      0.0000      8.5000
+    491.0700      0.0000      0.0000      8.4700
+    491.7100      0.0000      0.0000      8.4400
+    492.3400      0.0000      0.0000      8.4000
+    492.9800      0.0000      0.0000      8.3600
+    493.6200      0.0000      0.0000      8.3300
+    494.2500      0.0000      0.0000      8.3200
+    494.8900      0.0000      0.0000      8.3100
+    495.5200      0.0000      0.0000      8.3000
+    496.1500      0.0000      0.0000      8.2900
+    496.7900      0.0000      0.0000      8.2800
+    497.4200      0.0000      0.0000      8.2700
+    498.0600      0.0000      0.0000      8.2500
+    498.6900      0.0000      0.0000      8.2300
+    499.3300      0.0000      0.0000      8.2100
+    499.9600      0.0000      0.0000      8.1900
+    500.6000      0.0000      0.0000      8.1600
+    501.2300      0.0000      0.0000      8.1100
+    501.8700      0.0000      0.0000      8.0500
+    502.5000      0.0000      0.0000      7.9900
+    503.1400      0.0000      0.0000      7.9300
+    503.7700      0.0000      0.0000      7.8800
+    504.4000      0.0000      0.0000      7.8400
+    505.0400      0.0000      0.0000      7.8200
+    505.6700      0.0000      0.0000      7.8100
+    506.3100      0.0000      0.0000      7.8000
+    506.9400      0.0000      0.0000      7.8000
+    507.5700      0.0000      0.0000      7.8000
+    508.2100      0.0000      0.0000      7.8000
+    508.8400      0.0000      0.0000      7.7900
+    509.4800      0.0000      0.0000      7.7900
+    510.1100      0.0000      0.0000      7.7800
+    510.7400      0.0000      0.0000      7.7800
+    511.3800      0.0000      0.0000      7.7800
+    512.0100      0.0000      0.0000      7.7800
+    512.6500      0.0000      0.0000      7.7800
+    513.2800      0.0000      0.0000      7.7800
+    513.9100      0.0000      0.0000      7.7700
+    514.5500      0.0000      0.0000      7.7600
+    515.1800      0.0000      0.0000      7.7600
+    515.8100      0.0000      0.0000      7.7500
+    516.4500      0.0000      0.0000      7.7500
+    517.0800      0.0000      0.0000      7.7400
+    517.7100      0.0000      0.0000      7.7200
+    518.3500      0.0000      0.0000      7.7100
+    518.9800      0.0000      0.0000      7.7000
+    519.6100      0.0000      0.0000      7.6800
+    520.2500      0.0000      0.0000      7.6700
+    520.8800      0.0000      0.0000      7.6500
+    521.5100      0.0000      0.0000      7.6400
+    522.1500      0.0000      0.0000      7.6300
+    522.7800      0.0000      0.0000      7.6200
+    523.4100      0.0000      0.0000      7.6200
+    524.0400      0.0000      0.0000      7.6200
+    524.6800      0.0000      0.0000      7.6100
+    525.3100      0.0000      0.0000      7.6100
+    525.9400      0.0000      0.0000      7.6000
+    526.5800      0.0000      0.0000      7.6000
+    527.2100      0.0000      0.0000      7.5900
+    527.8400      0.0000      0.0000      7.5900
+    528.4700      0.0000      0.0000      7.5800
+    529.1100      0.0000      0.0000      7.5800
+    529.7400      0.0000      0.0000      7.5700
+    530.3700      0.0000      0.0000      7.5700
+    531.0000      0.0000      0.0000      7.5600
+    531.6400      0.0000      0.0000      7.5600
+    532.2700      0.0000      0.0000      7.5500
+    532.9000      0.0000      0.0000      7.5500
+    533.5300      0.0000      0.0000      7.5500
+    534.1700      0.0000      0.0000      7.5400
+    534.8000      0.0000      0.0000      7.5400
+    535.4300      0.0000      0.0000      7.5400
+    536.0600      0.0000      0.0000      7.5400
+    536.6900      0.0000      0.0000      7.5400
+    537.3300      0.0000      0.0000      7.5300
+    537.9600      0.0000      0.0000      7.5300
+    538.5900      0.0000      0.0000      7.5300
+    539.2200      0.0000      0.0000      7.5300
+    539.8500      0.0000      0.0000      7.5300
+    540.4800      0.0000      0.0000      7.5200
+    541.1200      0.0000      0.0000      7.5100
+    541.7500      0.0000      0.0000      7.5100
+    542.3800      0.0000      0.0000      7.5000
+    543.0100      0.0000      0.0000      7.5000
+    543.6400      0.0000      0.0000      7.5000
+    544.2700      0.0000      0.0000      7.4900
+    544.9100      0.0000      0.0000      7.4900
+    545.5400      0.0000      0.0000      7.4900
+    546.1700      0.0000      0.0000      7.4900
+    546.8000      0.0000      0.0000      7.4900
+    547.4300      0.0000      0.0000      7.4900
+    548.0600      0.0000      0.0000      7.4900
+    548.6900      0.0000      0.0000      7.4900
+    549.3200      0.0000      0.0000      7.4900
+    549.9500      0.0000      0.0000      7.4900
+    550.5900      0.0000      0.0000      7.4900
+    551.2200      0.0000      0.0000      7.4800
+    551.8500      0.0000      0.0000      7.4800
+    552.4800      0.0000      0.0000      7.4800
+    553.1100      0.0000      0.0000      7.4800
+    553.7400      0.0000      0.0000      7.4800
+    554.3700      0.0000      0.0000      7.4700
+    555.0000      0.0000      0.0000      7.4700
+    555.6300      0.0000      0.0000      7.4600
+    556.2600      0.0000      0.0000      7.4500
+    556.8900      0.0000      0.0000      7.4300
+    557.5200      0.0000      0.0000      7.4100
+    558.1500      0.0000      0.0000      7.4000
+    558.7800      0.0000      0.0000      7.3900
+    559.4200      0.0000      0.0000      7.3900
+    560.0500      0.0000      0.0000      7.3800
+    560.6800      0.0000      0.0000      7.3800
+    561.3100      0.0000      0.0000      7.3700
+    561.9400      0.0000      0.0000      7.3700
+    562.5700      0.0000      0.0000      7.3700
+    563.2000      0.0000      0.0000      7.3700
+    563.8300      0.0000      0.0000      7.3600
+    564.4600      0.0000      0.0000      7.3600
+    565.0900      0.0000      0.0000      7.3600
+    565.7200      0.0000      0.0000      7.3500
+    566.3500      0.0000      0.0000      7.3500
+    566.9800      0.0000      0.0000      7.3400
+    567.6100      0.0000      0.0000      7.3300
+    568.2400      0.0000      0.0000      7.3300
+    568.8700      0.0000      0.0000      7.3200
+    569.5000      0.0000      0.0000      7.3200
+    570.1200      0.0000      0.0000      7.3100
+    570.7500      0.0000      0.0000      7.3100
+    571.3800      0.0000      0.0000      7.3100
+    572.0100      0.0000      0.0000      7.3100
+    572.6400      0.0000      0.0000      7.3100
+    573.2700      0.0000      0.0000      7.3100
+    573.9000      0.0000      0.0000      7.3000
+    574.5300      0.0000      0.0000      7.3000
+    575.1600      0.0000      0.0000      7.3000
+    575.7900      0.0000      0.0000      7.3000
+    576.4200      0.0000      0.0000      7.3000
+    577.0500      0.0000      0.0000      7.3000
+    577.6800      0.0000      0.0000      7.2900
+    578.3100      0.0000      0.0000      7.2900
+    578.9300      0.0000      0.0000      7.2900
+    579.5600      0.0000      0.0000      7.2800
+    580.1900      0.0000      0.0000      7.2800
+    580.8200      0.0000      0.0000      7.2800
+    581.4500      0.0000      0.0000      7.2800
+    582.0800      0.0000      0.0000      7.2700
+    582.7100      0.0000      0.0000      7.2700
+    583.3400      0.0000      0.0000      7.2700
+    583.9700      0.0000      0.0000      7.2700
+    584.5900      0.0000      0.0000      7.2700
+    585.2200      0.0000      0.0000      7.2700
+    585.8500      0.0000      0.0000      7.2700
+    586.4800      0.0000      0.0000      7.2700
+    587.1100      0.0000      0.0000      7.2700
+    587.7400      0.0000      0.0000      7.2700
+    588.3600      0.0000      0.0000      7.2700
+    588.9900      0.0000      0.0000      7.2600
+    589.6200      0.0000      0.0000      7.2600
+    590.2500      0.0000      0.0000      7.2600
+    590.8800      0.0000      0.0000      7.2600
+    591.5000      0.0000      0.0000      7.2600
+    592.1300      0.0000      0.0000      7.2600
+    592.7600      0.0000      0.0000      7.2600
+    593.3900      0.0000      0.0000      7.2600
+    594.0200      0.0000      0.0000      7.2500
+    594.6400      0.0000      0.0000      7.2500
+    595.2700      0.0000      0.0000      7.2500
+    595.9000      0.0000      0.0000      7.2500
+    596.5300      0.0000      0.0000      7.2500
+    597.1600      0.0000      0.0000      7.2500
+    597.7800      0.0000      0.0000      7.2400
+    598.4100      0.0000      0.0000      7.2400
+    599.0400      0.0000      0.0000      7.2400
+    599.6700      0.0000      0.0000      7.2400
+    600.2900      0.0000      0.0000      7.2400
+    600.9200      0.0000      0.0000      7.2400
+    601.5500      0.0000      0.0000      7.2400
+    602.1800      0.0000      0.0000      7.2300
+    602.8000      0.0000      0.0000      7.2300
+    603.4300      0.0000      0.0000      7.2300
+    604.0600      0.0000      0.0000      7.2300
+    604.6800      0.0000      0.0000      7.2300
+    605.3100      0.0000      0.0000      7.2300
+    605.9400      0.0000      0.0000      7.2300
+    606.5700      0.0000      0.0000      7.2300
+    607.1900      0.0000      0.0000      7.2300
+    607.8200      0.0000      0.0000      7.2200
+    608.4500      0.0000      0.0000      7.2200
+    609.0700      0.0000      0.0000      7.2200
+    609.7000      0.0000      0.0000      7.2200
+    610.3300      0.0000      0.0000      7.2100
+    610.9500      0.0000      0.0000      7.2100
+    611.5800      0.0000      0.0000      7.2100
+    612.2100      0.0000      0.0000      7.2100
+    612.8300      0.0000      0.0000      7.2000
+    613.4600      0.0000      0.0000      7.2000
+    614.0900      0.0000      0.0000      7.1900
+    614.7100      0.0000      0.0000      7.1900
+    615.3400      0.0000      0.0000      7.1900
+    615.9700      0.0000      0.0000      7.1800
+    616.5900      0.0000      0.0000      7.1700
+    617.2200      0.0000      0.0000      7.1500
+    617.8400      0.0000      0.0000      7.1400
+    618.4700      0.0000      0.0000      7.1300
+    619.1000      0.0000      0.0000      7.1200
+    619.7200      0.0000      0.0000      7.1100
+    620.3500      0.0000      0.0000      7.1000
+    620.9700      0.0000      0.0000      7.0900
+    621.6000      0.0000      0.0000      7.0900
+    622.2300      0.0000      0.0000      7.0900
+    622.8500      0.0000      0.0000      7.0900
+    623.4800      0.0000      0.0000      7.0900
+    624.1000      0.0000      0.0000      7.0800
+    624.7300      0.0000      0.0000      7.0800
+    625.3500      0.0000      0.0000      7.0800
+    625.9800      0.0000      0.0000      7.0800
+    626.6100      0.0000      0.0000      7.0700
+    627.2300      0.0000      0.0000      7.0700
+    627.8600      0.0000      0.0000      7.0700
+    628.4800      0.0000      0.0000      7.0700
+    629.1100      0.0000      0.0000      7.0600
+    629.7300      0.0000      0.0000      7.0600
+    630.3600      0.0000      0.0000      7.0600
+    630.9800      0.0000      0.0000      7.0500
+    631.6100      0.0000      0.0000      7.0500
+    632.2300      0.0000      0.0000      7.0400
+    632.8600      0.0000      0.0000      7.0400
+    633.4800      0.0000      0.0000      7.0300
+    634.1100      0.0000      0.0000      7.0300
+    634.7300      0.0000      0.0000      7.0200
+    635.3600      0.0000      0.0000      7.0200
+    635.9800      0.0000      0.0000      7.0200
+    636.6100      0.0000      0.0000      7.0200
+    637.2300      0.0000      0.0000      7.0100
+    637.8600      0.0000      0.0000      7.0100
+    638.4800      0.0000      0.0000      7.0000
+    639.1100      0.0000      0.0000      7.0000
+    639.7300      0.0000      0.0000      6.9900
+    640.3600      0.0000      0.0000      6.9800
+    640.9800      0.0000      0.0000      6.9700
+    641.6100      0.0000      0.0000      6.9500
+    642.2300      0.0000      0.0000      6.9300
+    642.8500      0.0000      0.0000      6.8800
+    643.4800      0.0000      0.0000      6.8400
+    644.1000      0.0000      0.0000      6.8000
+    644.7300      0.0000      0.0000      6.7800
+    645.3500      0.0000      0.0000      6.7700
+    645.9800      0.0000      0.0000      6.7600
+    646.6000      0.0000      0.0000      6.7600
+    647.2200      0.0000      0.0000      6.7500
+    647.8500      0.0000      0.0000      6.7500
+    648.4700      0.0000      0.0000      6.7400
+    649.1000      0.0000      0.0000      6.7400
+    649.7200      0.0000      0.0000      6.7300
+    650.3400      0.0000      0.0000      6.7300
+    650.9700      0.0000      0.0000      6.7300
+    651.5900      0.0000      0.0000      6.7300
+    652.2200      0.0000      0.0000      6.7300
+    652.8400      0.0000      0.0000      6.7300
+    653.4600      0.0000      0.0000      6.7300
+    654.0900      0.0000      0.0000      6.7300
+    654.7100      0.0000      0.0000      6.7200
+    655.3300      0.0000      0.0000      6.7200
+    655.9600      0.0000      0.0000      6.6900
+    656.5800      0.0000      0.0000      6.6200
+    657.2000      0.0000      0.0000      6.5800
+    657.8300      0.0000      0.0000      6.5600
+    658.4500      0.0000      0.0000      6.5400
+    659.0700      0.0000      0.0000      6.5400
+    659.7000      0.0000      0.0000      6.5300
+    660.3200      0.0000      0.0000      6.5200
+    660.9400      0.0000      0.0000      6.5200
+    661.5700      0.0000      0.0000      6.5200
+    662.1900      0.0000      0.0000      6.5100
+    662.8100      0.0000      0.0000      6.5100
+    663.4300      0.0000      0.0000      6.5000
+    664.0600      0.0000      0.0000      6.4900
+    664.6800      0.0000      0.0000      6.4900
+    665.3000      0.0000      0.0000      6.4800
+    665.9300      0.0000      0.0000      6.4800
+    666.5500      0.0000      0.0000      6.4700
+    667.1700      0.0000      0.0000      6.4700
+    667.7900      0.0000      0.0000      6.4600
+    668.4200      0.0000      0.0000      6.4400
+    669.0400      0.0000      0.0000      6.4300
+    669.6600      0.0000      0.0000      6.4200
+    670.2800      0.0000      0.0000      6.4200
+    670.9100      0.0000      0.0000      6.4200
+    671.5300      0.0000      0.0000      6.4200
+    672.1500      0.0000      0.0000      6.4200
+    672.7700      0.0000      0.0000      6.4200
+    673.3900      0.0000      0.0000      6.4200
+    674.0200      0.0000      0.0000      6.4100
+    674.6400      0.0000      0.0000      6.4100
+    675.2600      0.0000      0.0000      6.4200
+    675.8800      0.0000      0.0000      6.4100
+    676.5100      0.0000      0.0000      6.4100
+    677.1300      0.0000      0.0000      6.4000
+    677.7500      0.0000      0.0000      6.4000
+    678.3700      0.0000      0.0000      6.3900
+    678.9900      0.0000      0.0000      6.3900
+    679.6100      0.0000      0.0000      6.3800
+    680.2400      0.0000      0.0000      6.3700
+    680.8600      0.0000      0.0000      6.3600
+    681.4800      0.0000      0.0000      6.3400
+    682.1000      0.0000      0.0000      6.3300
+    682.7200      0.0000      0.0000      6.3100
+    683.3400      0.0000      0.0000      6.3100
+    683.9700      0.0000      0.0000      6.3100
+    684.5900      0.0000      0.0000      6.3000
+    685.2100      0.0000      0.0000      6.3000
+    685.8300      0.0000      0.0000      6.3000
+    686.4500      0.0000      0.0000      6.3000
+    687.0700      0.0000      0.0000      6.3000
+    687.6900      0.0000      0.0000      6.3000
+    688.3100      0.0000      0.0000      6.3000
+    688.9300      0.0000      0.0000      6.3000
+    689.5600      0.0000      0.0000      6.3000
+    690.1800      0.0000      0.0000      6.3000
+    690.8000      0.0000      0.0000      6.3000
+    691.4200      0.0000      0.0000      6.3000
+    692.0400      0.0000      0.0000      6.3000
+    692.6600      0.0000      0.0000      6.3000
+    693.2800      0.0000      0.0000      6.2900
+    693.9000      0.0000      0.0000      6.2900
+    694.5200      0.0000      0.0000      6.2900
+    695.1400      0.0000      0.0000      6.2900
+    695.7600      0.0000      0.0000      6.2900
+    696.3800      0.0000      0.0000      6.2900
+    697.0000      0.0000      0.0000      6.2900
+    697.6200      0.0000      0.0000      6.2900
+    698.2500      0.0000      0.0000      6.2900
+    698.8700      0.0000      0.0000      6.2900
+    699.4900      0.0000      0.0000      6.2900
+    700.1100      0.0000      0.0000      6.2900
+    700.7300      0.0000      0.0000      6.2900
+    701.3500      0.0000      0.0000      6.2900
+    701.9700      0.0000      0.0000      6.2800
+    702.5900      0.0000      0.0000      6.2800
+    703.2100      0.0000      0.0000      6.2800
+    703.8300      0.0000      0.0000      6.2800
+    704.4500      0.0000      0.0000      6.2800
+    705.0700      0.0000      0.0000      6.2800
+    705.6900      0.0000      0.0000      6.2800
+    706.3100      0.0000      0.0000      6.2800
+    706.9300      0.0000      0.0000      6.2800
+    707.5500      0.0000      0.0000      6.2700
+    708.1700      0.0000      0.0000      6.2700
+    708.7800      0.0000      0.0000      6.2700
+    709.4000      0.0000      0.0000      6.2700
+    710.0200      0.0000      0.0000      6.2700
+    710.6400      0.0000      0.0000      6.2700
+    711.2600      0.0000      0.0000      6.2700
+    711.8800      0.0000      0.0000      6.2600
+    712.5000      0.0000      0.0000      6.2600
+    713.1200      0.0000      0.0000      6.2600
+    713.7400      0.0000      0.0000      6.2600
+    714.3600      0.0000      0.0000      6.2600
+    714.9800      0.0000      0.0000      6.2600
+    715.6000      0.0000      0.0000      6.2600
+    716.2200      0.0000      0.0000      6.2500
+    716.8400      0.0000      0.0000      6.2500
+    717.4600      0.0000      0.0000      6.2500
+    718.0700      0.0000      0.0000      6.2500
+    718.6900      0.0000      0.0000      6.2500
+    719.3100      0.0000      0.0000      6.2500
+    719.9300      0.0000      0.0000      6.2500
+    720.5500      0.0000      0.0000      6.2500
+    721.1700      0.0000      0.0000      6.2500
+    721.7900      0.0000      0.0000      6.2500
+    722.4100      0.0000      0.0000      6.2400
+    723.0200      0.0000      0.0000      6.2400
+    723.6400      0.0000      0.0000      6.2400
+    724.2600      0.0000      0.0000      6.2400
+    724.8800      0.0000      0.0000      6.2300
+    725.5000      0.0000      0.0000      6.2300
+    726.1200      0.0000      0.0000      6.2300
+    726.7300      0.0000      0.0000      6.2300
+    727.3500      0.0000      0.0000      6.2300
+    727.9700      0.0000      0.0000      6.2300
+    728.5900      0.0000      0.0000      6.2300
+    729.2100      0.0000      0.0000      6.2300
+    729.8300      0.0000      0.0000      6.2300
+    730.4400      0.0000      0.0000      6.2300
+    731.0600      0.0000      0.0000      6.2300
+    731.6800      0.0000      0.0000      6.2300
+    732.3000      0.0000      0.0000      6.2300
+    732.9200      0.0000      0.0000      6.2300
+    733.5300      0.0000      0.0000      6.2300
+    734.1500      0.0000      0.0000      6.2300
+    734.7700      0.0000      0.0000      6.2300
+    735.3900      0.0000      0.0000      6.2300
+    736.0000      0.0000      0.0000      6.2300
+    736.6200      0.0000      0.0000      6.2300
+    737.2400      0.0000      0.0000      6.2300
+    737.8600      0.0000      0.0000      6.2300
+    738.4700      0.0000      0.0000      6.2300
+    739.0900      0.0000      0.0000      6.2300
+    739.7100      0.0000      0.0000      6.2300
+    740.3300      0.0000      0.0000      6.2300
+    740.9400      0.0000      0.0000      6.2200
+    741.5600      0.0000      0.0000      6.2200
+    742.1800      0.0000      0.0000      6.2200
+    742.7900      0.0000      0.0000      6.2100
+    743.4100      0.0000      0.0000      6.2100
+    744.0300      0.0000      0.0000      6.2000
+    744.6500      0.0000      0.0000      6.2000
+    745.2600      0.0000      0.0000      6.1900
+    745.8800      0.0000      0.0000      6.1900
+    746.5000      0.0000      0.0000      6.1900
+    747.1100      0.0000      0.0000      6.1800
+    747.7300      0.0000      0.0000      6.1800
+    748.3500      0.0000      0.0000      6.1700
+    748.9600      0.0000      0.0000      6.1600
+    749.5800      0.0000      0.0000      6.1600
+    750.2000      0.0000      0.0000      6.1500
+    750.8100      0.0000      0.0000      6.1500
+    751.4300      0.0000      0.0000      6.1400
+    752.0500      0.0000      0.0000      6.1400
+    752.6600      0.0000      0.0000      6.1400
+    753.2800      0.0000      0.0000      6.1400
+    753.9000      0.0000      0.0000      6.1300
+    754.5100      0.0000      0.0000      6.1300
+    755.1300      0.0000      0.0000      6.1300
+    755.7400      0.0000      0.0000      6.1200
+    756.3600      0.0000      0.0000      6.1200
+    756.9800      0.0000      0.0000      6.1100
+    757.5900      0.0000      0.0000      6.1000
+    758.2100      0.0000      0.0000      6.1000
+    758.8200      0.0000      0.0000      6.1000
+    759.4400      0.0000      0.0000      6.1000
+    760.0600      0.0000      0.0000      6.1000
+    760.6700      0.0000      0.0000      6.1000
+    761.2900      0.0000      0.0000      6.1000
+    761.9000      0.0000      0.0000      6.0900
+    762.5200      0.0000      0.0000      6.0900
+    763.1400      0.0000      0.0000      6.0900
+    763.7500      0.0000      0.0000      6.0900
+    764.3700      0.0000      0.0000      6.0800
+    764.9800      0.0000      0.0000      6.0800
+    765.6000      0.0000      0.0000      6.0800
+    766.2100      0.0000      0.0000      6.0800
+    766.8300      0.0000      0.0000      6.0800
+    767.4400      0.0000      0.0000      6.0800
+    768.0600      0.0000      0.0000      6.0800
+    768.6700      0.0000      0.0000      6.0800
+    769.2900      0.0000      0.0000      6.0800
+    769.9000      0.0000      0.0000      6.0800
+    770.5200      0.0000      0.0000      6.0800
+    771.1400      0.0000      0.0000      6.0800
+    771.7500      0.0000      0.0000      6.0800
+    772.3700      0.0000      0.0000      6.0800
+    772.9800      0.0000      0.0000      6.0700
+    773.5900      0.0000      0.0000      6.0700
+    774.2100      0.0000      0.0000      6.0700
+    774.8200      0.0000      0.0000      6.0700
+    775.4400      0.0000      0.0000      6.0700
+    776.0500      0.0000      0.0000      6.0700
+    776.6700      0.0000      0.0000      6.0600
+    777.2800      0.0000      0.0000      6.0600
+    777.9000      0.0000      0.0000      6.0600
+    778.5100      0.0000      0.0000      6.0500
+    779.1300      0.0000      0.0000      6.0500
+    779.7400      0.0000      0.0000      6.0500
+    780.3600      0.0000      0.0000      6.0500
+    780.9700      0.0000      0.0000      6.0500
+    781.5800      0.0000      0.0000      6.0400
+    782.2000      0.0000      0.0000      6.0400
+    782.8100      0.0000      0.0000      6.0400
+    783.4300      0.0000      0.0000      6.0400
+    784.0400      0.0000      0.0000      6.0300
+    784.6600      0.0000      0.0000      6.0200
+    785.2700      0.0000      0.0000      6.0100
+    785.8800      0.0000      0.0000      6.0000
+    786.5000      0.0000      0.0000      6.0000
+    787.1100      0.0000      0.0000      6.0000
+    787.7300      0.0000      0.0000      6.0000
+    788.3400      0.0000      0.0000      6.0000
+    788.9500      0.0000      0.0000      5.9900
+    789.5700      0.0000      0.0000      5.9900
+    790.1800      0.0000      0.0000      5.9900
+    790.7900      0.0000      0.0000      5.9900
+    791.4100      0.0000      0.0000      5.9900
+    792.0200      0.0000      0.0000      5.9900
+    792.6300      0.0000      0.0000      5.9800
+    793.2500      0.0000      0.0000      5.9700
+    793.8600      0.0000      0.0000      5.9700
+    794.4700      0.0000      0.0000      5.9600
+    795.0900      0.0000      0.0000      5.9500
+    795.7000      0.0000      0.0000      5.9400
+    796.3100      0.0000      0.0000      5.9300
+    796.9300      0.0000      0.0000      5.9100
+    797.5400      0.0000      0.0000      5.9000
+    798.1500      0.0000      0.0000      5.9000
+    798.7700      0.0000      0.0000      5.8900
+    799.3800      0.0000      0.0000      5.8900
+    799.9900      0.0000      0.0000      5.8900
+    800.6100      0.0000      0.0000      5.8900
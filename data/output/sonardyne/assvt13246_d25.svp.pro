@@ -0,0 +1,38 @@
+test_read_store_and_write
+3/9/2013
+17:13:11
+Probe: ISS
+Source: /root/package/data/input/iss/assvt13246_d25.svp
+      0.8800   1521.9900      0.0000      0.0000
+      0.8900   1521.9800      0.0000      0.0000
+      0.9000   1521.9800      0.0000      0.0000
+      0.9100   1521.9700      0.0000      0.0000
+      0.9400   1521.9700      0.0000      0.0000
+      1.0100   1521.9600      0.0000      0.0000
+      1.0700   1522.0600      0.0000      0.0000
+      1.1600   1522.0300      0.0000      0.0000
+      1.2800   1521.9000      0.0000      0.0000
+      1.4400   1521.9800      0.0000      0.0000
+      1.5900   1521.8100      0.0000      0.0000
+      1.7400   1521.8400      0.0000      0.0000
+      1.9400   1521.8000      0.0000      0.0000
+      2.1200   1521.6200      0.0000      0.0000
+      2.3500   1521.5300      0.0000      0.0000
+      2.5300   1521.3100      0.0000      0.0000
+      2.7600   1521.1700      0.0000      0.0000
+      2.9900   1520.9300      0.0000      0.0000
+      3.2000   1520.7100      0.0000      0.0000
+      3.4500   1520.5200      0.0000      0.0000
+      3.6900   1520.3200      0.0000      0.0000
+      3.9700   1520.2500      0.0000      0.0000
+      4.2000   1520.1500      0.0000      0.0000
+      4.4100   1520.0800      0.0000      0.0000
+      4.6900   1520.0700      0.0000      0.0000
+      4.9200   1520.0300      0.0000      0.0000
+      5.2100   1520.0100      0.0000      0.0000
+      5.4900   1519.9700      0.0000      0.0000
+      5.5000   1520.0000      0.0000      0.0000
+      5.5300   1520.0200      0.0000      0.0000
+      5.5400   1520.0200      0.0000      0.0000
+      5.5600   1520.0100      0.0000      0.0000
+      5.5700   1520.0500      0.0000      0.0000
@@ -0,0 +1,54 @@
+test_read_store_and_write
+3/9/2013
+17:44:19
+Probe: ISS
+Source: /root/package/data/input/iss/assvt13246_d26.svp
+      0.0400   1524.0700      0.0000      0.0000
+      0.0500   1523.9500      0.0000      0.0000
+      0.1100   1524.1900      0.0000      0.0000
+      0.1500   1524.0300      0.0000      0.0000
+      0.1700   1524.1000      0.0000      0.0000
+      0.1900   1524.0300      0.0000      0.0000
+      0.2600   1524.1200      0.0000      0.0000
+      0.3300   1523.9800      0.0000      0.0000
+      0.4700   1523.8500      0.0000      0.0000
+      0.6100   1523.8200      0.0000      0.0000
+      0.7000   1523.8200      0.0000      0.0000
+      0.8500   1523.8400      0.0000      0.0000
+      1.0100   1524.0200      0.0000      0.0000
+      1.1000   1523.9000      0.0000      0.0000
+      1.2700   1524.0400      0.0000      0.0000
+      1.4800   1523.5800      0.0000      0.0000
+      1.5900   1523.6400      0.0000      0.0000
+      1.8300   1523.3800      0.0000      0.0000
+      1.9800   1523.3200      0.0000      0.0000
+      2.1800   1523.3100      0.0000      0.0000
+      2.3800   1523.2700      0.0000      0.0000
+      2.5600   1523.2500      0.0000      0.0000
+      2.7900   1523.1000      0.0000      0.0000
+      3.0500   1522.6200      0.0000      0.0000
+      3.2400   1522.1200      0.0000      0.0000
+      3.4900   1521.6400      0.0000      0.0000
+      3.6900   1521.4000      0.0000      0.0000
+      3.9300   1521.2400      0.0000      0.0000
+      4.1700   1521.0300      0.0000      0.0000
+      4.4100   1520.2300      0.0000      0.0000
+      4.6100   1519.8000      0.0000      0.0000
+      4.8800   1519.6500      0.0000      0.0000
+      5.0900   1519.6300      0.0000      0.0000
+      5.3300   1519.5500      0.0000      0.0000
+      5.5800   1519.5500      0.0000      0.0000
+      5.8200   1519.4700      0.0000      0.0000
+      6.0600   1519.4600      0.0000      0.0000
+      6.3200   1519.4300      0.0000      0.0000
+      6.5700   1519.4600      0.0000      0.0000
+      6.7800   1519.4200      0.0000      0.0000
+      7.0200   1519.4300      0.0000      0.0000
+      7.3000   1519.4200      0.0000      0.0000
+      7.5100   1519.4200      0.0000      0.0000
+      7.7400   1519.4300      0.0000      0.0000
+      7.9800   1519.4000      0.0000      0.0000
+      8.2300   1519.3900      0.0000      0.0000
+      8.4700   1519.4000      0.0000      0.0000
+      8.7500   1519.3800      0.0000      0.0000
+      8.9900   1519.3900      0.0000      0.0000
@@ -0,0 +1,70 @@
+test_read_store_and_write
+3/9/2013
+18:0:7
+Probe: ISS
+Source: /root/package/data/input/iss/assvt13246_d27.svp
+      0.0400   1522.4100      0.0000      0.0000
+      0.0800   1522.5100      0.0000      0.0000
+      0.1400   1522.5000      0.0000      0.0000
+      0.1600   1522.4200      0.0000      0.0000
+      0.2200   1522.3200      0.0000      0.0000
+      0.2400   1522.5000      0.0000      0.0000
+      0.2900   1522.1300      0.0000      0.0000
+      0.4000   1522.1100      0.0000      0.0000
+      0.4400   1522.4200      0.0000      0.0000
+      0.5100   1522.3200      0.0000      0.0000
+      0.6700   1522.5400      0.0000      0.0000
+      0.7900   1522.0800      0.0000      0.0000
+      0.9900   1521.8600      0.0000      0.0000
+      1.1200   1521.8800      0.0000      0.0000
+      1.2800   1522.2400      0.0000      0.0000
+      1.4700   1521.7300      0.0000      0.0000
+      1.6400   1521.5900      0.0000      0.0000
+      1.8400   1521.4200      0.0000      0.0000
+      2.0700   1520.0900      0.0000      0.0000
+      2.2600   1519.5000      0.0000      0.0000
+      2.4200   1518.6200      0.0000      0.0000
+      2.6400   1518.7400      0.0000      0.0000
+      2.8900   1518.8100      0.0000      0.0000
+      3.1300   1518.9600      0.0000      0.0000
+      3.3300   1519.0200      0.0000      0.0000
+      3.5700   1519.2300      0.0000      0.0000
+      3.8100   1519.2100      0.0000      0.0000
+      4.0300   1519.2800      0.0000      0.0000
+      4.2700   1519.2100      0.0000      0.0000
+      4.5000   1519.1900      0.0000      0.0000
+      4.7300   1519.1900      0.0000      0.0000
+      4.9800   1519.2000      0.0000      0.0000
+      5.2200   1519.2000      0.0000      0.0000
+      5.4700   1519.1600      0.0000      0.0000
+      5.7200   1519.1600      0.0000      0.0000
+      5.9200   1519.1300      0.0000      0.0000
+      6.1700   1519.1100      0.0000      0.0000
+      6.4000   1519.1800      0.0000      0.0000
+      6.6300   1519.3100      0.0000      0.0000
+      6.8900   1519.3500      0.0000      0.0000
+      7.1100   1519.4000      0.0000      0.0000
+      7.4000   1519.4400      0.0000      0.0000
+      7.6000   1519.5100      0.0000      0.0000
+      7.8600   1519.5600      0.0000      0.0000
+      8.0900   1519.5600      0.0000      0.0000
+      8.3400   1519.5800      0.0000      0.0000
+      8.6000   1519.6200      0.0000      0.0000
+      8.8100   1519.6400      0.0000      0.0000
+      9.0700   1519.6800      0.0000      0.0000
+      9.2900   1519.6800      0.0000      0.0000
+      9.5500   1519.6700      0.0000      0.0000
+      9.7900   1519.7400      0.0000      0.0000
+     10.0400   1519.6800      0.0000      0.0000
+     10.3000   1519.7200      0.0000      0.0000
+     10.5400   1519.7300      0.0000      0.0000
+     10.7900   1519.7300      0.0000      0.0000
+     11.0300   1519.7100      0.0000      0.0000
+     11.2800   1519.7100      0.0000      0.0000
+     11.5300   1519.6100      0.0000      0.0000
+     11.7900   1519.5300      0.0000      0.0000
+     12.0300   1519.5300      0.0000      0.0000
+     12.2500   1519.4400      0.0000      0.0000
+     12.5100   1519.4100      0.0000      0.0000
+     12.8100   1519.4300      0.0000      0.0000
+     12.8400   1519.4200      0.0000      0.0000
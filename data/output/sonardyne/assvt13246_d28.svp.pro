@@ -0,0 +1,62 @@
+test_read_store_and_write
+3/9/2013
+18:33:36
+Probe: ISS
+Source: /root/package/data/input/iss/assvt13246_d28.svp
+      0.1800   1520.1400      0.0000      0.0000
+      0.4000   1520.1900      0.0000      0.0000
+      0.4100   1520.1800      0.0000      0.0000
+      0.5600   1520.2100      0.0000      0.0000
+      0.6400   1520.1700      0.0000      0.0000
+      0.7600   1520.2600      0.0000      0.0000
+      0.8600   1520.2200      0.0000      0.0000
+      1.0800   1520.2400      0.0000      0.0000
+      1.1600   1520.3100      0.0000      0.0000
+      1.3800   1520.0300      0.0000      0.0000
+      1.5600   1519.8900      0.0000      0.0000
+      1.7800   1520.0500      0.0000      0.0000
+      2.0800   1519.8700      0.0000      0.0000
+      2.2900   1519.4800      0.0000      0.0000
+      2.4600   1519.3400      0.0000      0.0000
+      2.6900   1519.2400      0.0000      0.0000
+      2.8900   1519.1600      0.0000      0.0000
+      3.1300   1519.0600      0.0000      0.0000
+      3.3400   1519.0100      0.0000      0.0000
+      3.5500   1519.0000      0.0000      0.0000
+      3.8100   1518.9400      0.0000      0.0000
+      3.9900   1519.0100      0.0000      0.0000
+      4.2700   1518.9800      0.0000      0.0000
+      4.4700   1519.0200      0.0000      0.0000
+      4.7200   1518.9800      0.0000      0.0000
+      4.9400   1518.9600      0.0000      0.0000
+      5.2000   1519.0100      0.0000      0.0000
+      5.4100   1519.0500      0.0000      0.0000
+      5.6800   1519.1000      0.0000      0.0000
+      5.9000   1519.1300      0.0000      0.0000
+      6.1500   1519.1300      0.0000      0.0000
+      6.3700   1519.1300      0.0000      0.0000
+      6.6200   1519.1500      0.0000      0.0000
+      6.8700   1519.2400      0.0000      0.0000
+      7.1100   1519.2500      0.0000      0.0000
+      7.3700   1519.3300      0.0000      0.0000
+      7.5700   1519.3700      0.0000      0.0000
+      7.8400   1519.5200      0.0000      0.0000
+      8.0800   1519.7500      0.0000      0.0000
+      8.3000   1519.8500      0.0000      0.0000
+      8.5800   1520.0000      0.0000      0.0000
+      8.7900   1520.0600      0.0000      0.0000
+      9.0500   1520.0200      0.0000      0.0000
+      9.2700   1519.9500      0.0000      0.0000
+      9.5000   1519.9600      0.0000      0.0000
+      9.7500   1519.9600      0.0000      0.0000
+     10.0000   1519.9600      0.0000      0.0000
+     10.2700   1519.9800      0.0000      0.0000
+     10.5000   1519.9700      0.0000      0.0000
+     10.7200   1519.9700      0.0000      0.0000
+     10.9800   1519.9600      0.0000      0.0000
+     11.2300   1519.9700      0.0000      0.0000
+     11.4800   1519.9800      0.0000      0.0000
+     11.7100   1519.9300      0.0000      0.0000
+     11.9900   1519.8800      0.0000      0.0000
+     12.2300   1519.7800      0.0000      0.0000
+     12.4000   1519.7700      0.0000      0.0000
@@ -0,0 +1,45 @@
+test_read_store_and_write
+3/9/2013
+19:5:42
+Probe: ISS
+Source: /root/package/data/input/iss/assvt13246_d29.svp
+      0.2900   1520.4500      0.0000      0.0000
+      0.3100   1520.4300      0.0000      0.0000
+      0.3500   1520.4200      0.0000      0.0000
+      0.4300   1520.4200      0.0000      0.0000
+      0.6100   1520.3400      0.0000      0.0000
+      0.7600   1520.3800      0.0000      0.0000
+      0.8800   1520.3900      0.0000      0.0000
+      1.0800   1520.4000      0.0000      0.0000
+      1.1900   1520.4000      0.0000      0.0000
+      1.4100   1520.4100      0.0000      0.0000
+      1.6000   1520.3700      0.0000      0.0000
+      1.8300   1520.3000      0.0000      0.0000
+      1.9500   1520.3400      0.0000      0.0000
+      2.1700   1520.1700      0.0000      0.0000
+      2.3500   1520.0300      0.0000      0.0000
+      2.5800   1519.9600      0.0000      0.0000
+      2.8000   1519.9900      0.0000      0.0000
+      3.0500   1519.7800      0.0000      0.0000
+      3.2500   1519.6700      0.0000      0.0000
+      3.5300   1519.6000      0.0000      0.0000
+      3.7100   1519.5800      0.0000      0.0000
+      3.9800   1519.5800      0.0000      0.0000
+      4.1900   1519.5200      0.0000      0.0000
+      4.4300   1519.4300      0.0000      0.0000
+      4.6600   1519.3500      0.0000      0.0000
+      4.9000   1519.1500      0.0000      0.0000
+      5.1600   1518.9700      0.0000      0.0000
+      5.4000   1519.0100      0.0000      0.0000
+      5.6300   1519.1200      0.0000      0.0000
+      5.8300   1519.1600      0.0000      0.0000
+      6.0800   1519.1700      0.0000      0.0000
+      6.3500   1519.1900      0.0000      0.0000
+      6.6100   1519.1800      0.0000      0.0000
+      6.8600   1519.1700      0.0000      0.0000
+      7.1100   1519.2100      0.0000      0.0000
+      7.3600   1519.2200      0.0000      0.0000
+      7.5900   1519.2200      0.0000      0.0000
+      7.8400   1519.2000      0.0000      0.0000
+      8.1100   1519.1800      0.0000      0.0000
+      8.1300   1519.2100      0.0000      0.0000
@@ -0,0 +1,68 @@
+test_read_store_and_write
+3/9/2013
+19:20:30
+Probe: ISS
+Source: /root/package/data/input/iss/assvt13246_d30.svp
+      0.0400   1522.3700      0.0000      0.0000
+      0.0700   1522.5300      0.0000      0.0000
+      0.0800   1522.4300      0.0000      0.0000
+      0.1500   1522.3500      0.0000      0.0000
+      0.2100   1522.2200      0.0000      0.0000
+      0.2900   1522.2100      0.0000      0.0000
+      0.4100   1522.4000      0.0000      0.0000
+      0.6000   1522.2800      0.0000      0.0000
+      0.7200   1522.0000      0.0000      0.0000
+      0.8400   1522.3100      0.0000      0.0000
+      0.9700   1522.1800      0.0000      0.0000
+      1.2000   1522.0400      0.0000      0.0000
+      1.3300   1521.9500      0.0000      0.0000
+      1.5400   1521.8600      0.0000      0.0000
+      1.7100   1522.0500      0.0000      0.0000
+      1.9400   1522.1000      0.0000      0.0000
+      2.1200   1520.8500      0.0000      0.0000
+      2.2900   1519.3800      0.0000      0.0000
+      2.4600   1519.3000      0.0000      0.0000
+      2.7000   1519.2300      0.0000      0.0000
+      2.9100   1519.1100      0.0000      0.0000
+      3.1300   1518.9700      0.0000      0.0000
+      3.3500   1518.7700      0.0000      0.0000
+      3.5900   1518.8300      0.0000      0.0000
+      3.8000   1518.8100      0.0000      0.0000
+      4.0300   1518.8300      0.0000      0.0000
+      4.2800   1518.8100      0.0000      0.0000
+      4.5000   1518.8600      0.0000      0.0000
+      4.7600   1518.8600      0.0000      0.0000
+      4.9700   1518.8800      0.0000      0.0000
+      5.2100   1518.9100      0.0000      0.0000
+      5.4300   1518.9400      0.0000      0.0000
+      5.6800   1518.9800      0.0000      0.0000
+      5.8800   1518.9700      0.0000      0.0000
+      6.1300   1519.0100      0.0000      0.0000
+      6.3600   1519.0300      0.0000      0.0000
+      6.6100   1519.0700      0.0000      0.0000
+      6.8400   1519.1000      0.0000      0.0000
+      7.0800   1519.1100      0.0000      0.0000
+      7.3200   1519.2600      0.0000      0.0000
+      7.5500   1519.2700      0.0000      0.0000
+      7.7900   1519.3000      0.0000      0.0000
+      8.0100   1519.4100      0.0000      0.0000
+      8.2700   1519.3900      0.0000      0.0000
+      8.5000   1519.4000      0.0000      0.0000
+      8.7400   1519.4100      0.0000      0.0000
+      9.0100   1519.5000      0.0000      0.0000
+      9.2100   1519.7500      0.0000      0.0000
+      9.4700   1519.7600      0.0000      0.0000
+      9.7100   1519.7600      0.0000      0.0000
+      9.9600   1519.8000      0.0000      0.0000
+     10.2400   1519.8200      0.0000      0.0000
+     10.4400   1519.8800      0.0000      0.0000
+     10.7200   1519.7000      0.0000      0.0000
+     10.9200   1519.6600      0.0000      0.0000
+     11.2000   1519.5900      0.0000      0.0000
+     11.4500   1519.5500      0.0000      0.0000
+     11.6800   1519.5000      0.0000      0.0000
+     11.9400   1519.4500      0.0000      0.0000
+     12.1600   1519.2800      0.0000      0.0000
+     12.4200   1519.2400      0.0000      0.0000
+     12.7100   1519.2200      0.0000      0.0000
+     12.7700   1519.2200      0.0000      0.0000
@@ -0,0 +1,51 @@
+test_read_store_and_write
+3/9/2013
+19:48:5
+Probe: ISS
+Source: /root/package/data/input/iss/assvt13246_d31.svp
+      0.1000   1521.4100      0.0000      0.0000
+      0.1200   1521.4300      0.0000      0.0000
+      0.3600   1521.3900      0.0000      0.0000
+      0.4700   1521.3700      0.0000      0.0000
+      0.6100   1521.4400      0.0000      0.0000
+      0.7800   1521.4000      0.0000      0.0000
+      0.9100   1521.4600      0.0000      0.0000
+      1.0800   1521.4200      0.0000      0.0000
+      1.2500   1521.3800      0.0000      0.0000
+      1.4100   1521.3900      0.0000      0.0000
+      1.6000   1521.3200      0.0000      0.0000
+      1.8000   1521.2300      0.0000      0.0000
+      1.9700   1521.2300      0.0000      0.0000
+      2.1500   1521.1900      0.0000      0.0000
+      2.3700   1520.7400      0.0000      0.0000
+      2.5800   1520.5600      0.0000      0.0000
+      2.8100   1520.2800      0.0000      0.0000
+      3.0500   1519.5400      0.0000      0.0000
+      3.2400   1519.0600      0.0000      0.0000
+      3.4800   1518.9700      0.0000      0.0000
+      3.6900   1518.8800      0.0000      0.0000
+      3.9500   1518.8000      0.0000      0.0000
+      4.1800   1518.8300      0.0000      0.0000
+      4.4100   1518.7900      0.0000      0.0000
+      4.6500   1518.8400      0.0000      0.0000
+      4.9000   1518.8500      0.0000      0.0000
+      5.1600   1518.8000      0.0000      0.0000
+      5.3900   1518.8400      0.0000      0.0000
+      5.6400   1518.8400      0.0000      0.0000
+      5.9000   1518.8300      0.0000      0.0000
+      6.1400   1518.8300      0.0000      0.0000
+      6.3900   1518.9100      0.0000      0.0000
+      6.6400   1518.9400      0.0000      0.0000
+      6.9100   1518.9700      0.0000      0.0000
+      7.1500   1518.9900      0.0000      0.0000
+      7.3600   1518.9900      0.0000      0.0000
+      7.6200   1519.0300      0.0000      0.0000
+      7.8600   1519.0700      0.0000      0.0000
+      8.1300   1519.1000      0.0000      0.0000
+      8.3800   1519.1200      0.0000      0.0000
+      8.6000   1519.1300      0.0000      0.0000
+      8.8500   1519.2100      0.0000      0.0000
+      9.1000   1519.2700      0.0000      0.0000
+      9.3200   1519.2800      0.0000      0.0000
+      9.6500   1519.3900      0.0000      0.0000
+      9.7000   1519.3900      0.0000      0.0000
@@ -0,0 +1,51 @@
+test_read_store_and_write
+3/9/2013
+20:5:22
+Probe: ISS
+Source: /root/package/data/input/iss/assvt13246_d32.svp
+      0.1600   1523.7800      0.0000      0.0000
+      0.3100   1523.9700      0.0000      0.0000
+      0.3400   1523.7600      0.0000      0.0000
+      0.3800   1523.7600      0.0000      0.0000
+      0.4300   1523.7500      0.0000      0.0000
+      0.5000   1523.7500      0.0000      0.0000
+      0.6200   1523.6100      0.0000      0.0000
+      0.7100   1523.7500      0.0000      0.0000
+      0.8200   1523.8500      0.0000      0.0000
+      0.9600   1523.8700      0.0000      0.0000
+      1.1100   1523.7900      0.0000      0.0000
+      1.2600   1523.7000      0.0000      0.0000
+      1.4600   1523.5900      0.0000      0.0000
+      1.5700   1523.2700      0.0000      0.0000
+      1.7900   1523.4900      0.0000      0.0000
+      1.9200   1523.6000      0.0000      0.0000
+      2.1500   1523.3600      0.0000      0.0000
+      2.3700   1523.0700      0.0000      0.0000
+      2.5700   1522.5100      0.0000      0.0000
+      2.8000   1521.5100      0.0000      0.0000
+      2.9700   1521.1200      0.0000      0.0000
+      3.2100   1520.6500      0.0000      0.0000
+      3.4400   1520.4200      0.0000      0.0000
+      3.6600   1519.8900      0.0000      0.0000
+      3.9200   1519.4000      0.0000      0.0000
+      4.1400   1519.0400      0.0000      0.0000
+      4.3600   1519.1600      0.0000      0.0000
+      4.6000   1519.1700      0.0000      0.0000
+      4.8300   1519.1600      0.0000      0.0000
+      5.0600   1519.1700      0.0000      0.0000
+      5.3000   1519.2300      0.0000      0.0000
+      5.5500   1519.2300      0.0000      0.0000
+      5.7900   1519.2500      0.0000      0.0000
+      6.0400   1519.2500      0.0000      0.0000
+      6.2700   1519.2500      0.0000      0.0000
+      6.5200   1519.2600      0.0000      0.0000
+      6.7200   1519.2500      0.0000      0.0000
+      6.9900   1519.2700      0.0000      0.0000
+      7.2000   1519.2600      0.0000      0.0000
+      7.4400   1519.2700      0.0000      0.0000
+      7.6900   1519.2800      0.0000      0.0000
+      7.9200   1519.3000      0.0000      0.0000
+      8.1600   1519.2800      0.0000      0.0000
+      8.4100   1519.2800      0.0000      0.0000
+      8.6800   1519.2900      0.0000      0.0000
+      8.9700   1519.3300      0.0000      0.0000
@@ -0,0 +1,46 @@
+test_read_store_and_write
+3/9/2013
+22:48:41
+Probe: ISS
+Source: /root/package/data/input/iss/assvt13246_d33.svp
+      0.4600   1522.2300      0.0000      0.0000
+      0.4700   1522.1900      0.0000      0.0000
+      0.5000   1522.0800      0.0000      0.0000
+      0.5600   1521.9400      0.0000      0.0000
+      0.6100   1522.0700      0.0000      0.0000
+      0.6200   1522.0800      0.0000      0.0000
+      0.7100   1522.1100      0.0000      0.0000
+      0.7800   1522.1400      0.0000      0.0000
+      0.8400   1522.1700      0.0000      0.0000
+      1.0400   1522.2100      0.0000      0.0000
+      1.1100   1522.1000      0.0000      0.0000
+      1.2200   1521.9300      0.0000      0.0000
+      1.3700   1522.1500      0.0000      0.0000
+      1.5100   1522.1900      0.0000      0.0000
+      1.7200   1522.1600      0.0000      0.0000
+      1.8600   1522.1100      0.0000      0.0000
+      1.9700   1522.1700      0.0000      0.0000
+      2.1600   1522.2000      0.0000      0.0000
+      2.3700   1522.1200      0.0000      0.0000
+      2.5700   1522.0800      0.0000      0.0000
+      2.7600   1521.9300      0.0000      0.0000
+      2.9600   1522.0100      0.0000      0.0000
+      3.1900   1521.8400      0.0000      0.0000
+      3.3800   1521.7100      0.0000      0.0000
+      3.5800   1521.6100      0.0000      0.0000
+      3.8400   1521.5300      0.0000      0.0000
+      4.0600   1521.4500      0.0000      0.0000
+      4.2600   1521.3600      0.0000      0.0000
+      4.4800   1521.2700      0.0000      0.0000
+      4.7100   1521.1800      0.0000      0.0000
+      4.9400   1521.1000      0.0000      0.0000
+      5.1900   1521.0000      0.0000      0.0000
+      5.4000   1520.8800      0.0000      0.0000
+      5.6300   1520.7700      0.0000      0.0000
+      5.8700   1520.5400      0.0000      0.0000
+      6.0800   1520.4000      0.0000      0.0000
+      6.3200   1520.4100      0.0000      0.0000
+      6.5600   1520.3700      0.0000      0.0000
+      6.7900   1520.4000      0.0000      0.0000
+      7.0300   1520.3700      0.0000      0.0000
+      7.1000   1520.3400      0.0000      0.0000
@@ -0,0 +1,48 @@
+test_read_store_and_write
+3/9/2013
+23:20:9
+Probe: ISS
+Source: /root/package/data/input/iss/assvt13246_d34.svp
+      0.0000   1520.4300      0.0000      0.0000
+      0.2300   1520.2000      0.0000      0.0000
+      0.2600   1520.3900      0.0000      0.0000
+      0.3900   1520.3900      0.0000      0.0000
+      0.5400   1520.4300      0.0000      0.0000
+      0.7000   1520.3100      0.0000      0.0000
+      0.7500   1520.3600      0.0000      0.0000
+      1.1200   1520.5100      0.0000      0.0000
+      1.2600   1520.4000      0.0000      0.0000
+      1.4400   1520.4400      0.0000      0.0000
+      1.5600   1520.3500      0.0000      0.0000
+      1.6900   1520.4300      0.0000      0.0000
+      1.8600   1520.4000      0.0000      0.0000
+      2.0500   1520.3600      0.0000      0.0000
+      2.3100   1520.1400      0.0000      0.0000
+      2.4500   1520.0300      0.0000      0.0000
+      2.7000   1519.9300      0.0000      0.0000
+      2.9000   1519.9400      0.0000      0.0000
+      3.1200   1519.9300      0.0000      0.0000
+      3.3600   1519.9400      0.0000      0.0000
+      3.5800   1519.9800      0.0000      0.0000
+      3.8200   1519.9800      0.0000      0.0000
+      4.0600   1520.0200      0.0000      0.0000
+      4.2600   1520.0200      0.0000      0.0000
+      4.4800   1520.0100      0.0000      0.0000
+      4.7100   1520.0000      0.0000      0.0000
+      4.9500   1520.0500      0.0000      0.0000
+      5.1900   1520.1200      0.0000      0.0000
+      5.4200   1520.1200      0.0000      0.0000
+      5.6900   1520.1300      0.0000      0.0000
+      5.9000   1520.1400      0.0000      0.0000
+      6.1600   1520.1500      0.0000      0.0000
+      6.3800   1520.1200      0.0000      0.0000
+      6.6300   1520.1000      0.0000      0.0000
+      6.8300   1520.1300      0.0000      0.0000
+      7.0800   1520.1600      0.0000      0.0000
+      7.3500   1520.1500      0.0000      0.0000
+      7.5900   1520.1400      0.0000      0.0000
+      7.8400   1520.1200      0.0000      0.0000
+      8.0400   1520.1700      0.0000      0.0000
+      8.3200   1520.1600      0.0000      0.0000
+      8.6000   1520.1700      0.0000      0.0000
+      8.6400   1520.1500      0.0000      0.0000
@@ -0,0 +1,67 @@
+test_read_store_and_write
+18/6/2016
+14:0:1
+Probe: ISS
+Source: /root/package/data/input/iss/assvt16170_d14.svp
+      1.4800   1531.0400      0.0000      0.0000
+      1.5100   1531.0400      0.0000      0.0000
+      1.5300   1530.9900      0.0000      0.0000
+      1.5400   1531.0100      0.0000      0.0000
+      1.5800   1531.0200      0.0000      0.0000
+      1.6000   1531.0300      0.0000      0.0000
+      1.6400   1531.0400      0.0000      0.0000
+      1.7400   1531.0100      0.0000      0.0000
+      1.8100   1531.0200      0.0000      0.0000
+      1.9200   1531.0300      0.0000      0.0000
+      2.0700   1531.0000      0.0000      0.0000
+      2.2300   1531.0500      0.0000      0.0000
+      2.4200   1531.0100      0.0000      0.0000
+      2.6600   1531.0300      0.0000      0.0000
+      2.8400   1531.0500      0.0000      0.0000
+      3.0600   1531.0500      0.0000      0.0000
+      3.2600   1531.0400      0.0000      0.0000
+      3.5300   1531.0300      0.0000      0.0000
+      3.7300   1531.1400      0.0000      0.0000
+      3.9900   1531.1600      0.0000      0.0000
+      4.2000   1531.1700      0.0000      0.0000
+      4.4300   1531.1600      0.0000      0.0000
+      4.7000   1531.1700      0.0000      0.0000
+      4.9600   1531.1600      0.0000      0.0000
+      5.2200   1531.2200      0.0000      0.0000
+      5.4900   1531.2500      0.0000      0.0000
+      5.7300   1531.2700      0.0000      0.0000
+      6.0000   1531.2300      0.0000      0.0000
+      6.2800   1531.2900      0.0000      0.0000
+      6.5500   1531.5200      0.0000      0.0000
+      6.7800   1531.7300      0.0000      0.0000
+      7.0600   1532.0800      0.0000      0.0000
+      7.3900   1532.4900      0.0000      0.0000
+      7.6300   1533.7200      0.0000      0.0000
+      7.9200   1533.9700      0.0000      0.0000
+      8.1800   1534.0100      0.0000      0.0000
+      8.5100   1534.4900      0.0000      0.0000
+      8.7200   1534.9200      0.0000      0.0000
+      9.0500   1535.3000      0.0000      0.0000
+      9.2800   1535.3300      0.0000      0.0000
+      9.6000   1535.7100      0.0000      0.0000
+      9.9100   1535.6600      0.0000      0.0000
+     10.1600   1535.7600      0.0000      0.0000
+     10.4600   1535.9500      0.0000      0.0000
+     10.7800   1536.2200      0.0000      0.0000
+     11.0200   1536.0900      0.0000      0.0000
+     11.3100   1535.8000      0.0000      0.0000
+     11.6000   1535.6600      0.0000      0.0000
+     11.8300   1535.6600      0.0000      0.0000
+     12.1400   1535.4700      0.0000      0.0000
+     12.4400   1537.0100      0.0000      0.0000
+     12.7000   1539.0000      0.0000      0.0000
+     12.9700   1539.4600      0.0000      0.0000
+     13.2400   1539.4800      0.0000      0.0000
+     13.5600   1539.6000      0.0000      0.0000
+     13.8300   1539.6200      0.0000      0.0000
+     14.1000   1539.6000      0.0000      0.0000
+     14.3900   1539.6000      0.0000      0.0000
+     14.6200   1539.6600      0.0000      0.0000
+     14.9500   1539.6300      0.0000      0.0000
+     15.2200   1539.6300      0.0000      0.0000
+     15.3200   1539.6600      0.0000      0.0000
@@ -0,0 +1,66 @@
+test_read_store_and_write
+18/6/2016
+14:26:42
+Probe: ISS
+Source: /root/package/data/input/iss/assvt16170_d15.svp
+      1.7400   1531.2600      0.0000      0.0000
+      1.7700   1531.1800      0.0000      0.0000
+      1.7900   1531.2100      0.0000      0.0000
+      1.8300   1531.2200      0.0000      0.0000
+      1.9200   1531.3000      0.0000      0.0000
+      2.0000   1531.3000      0.0000      0.0000
+      2.0700   1530.9800      0.0000      0.0000
+      2.1000   1531.1900      0.0000      0.0000
+      2.2200   1531.2600      0.0000      0.0000
+      2.3200   1531.2800      0.0000      0.0000
+      2.4400   1531.2900      0.0000      0.0000
+      2.5700   1531.2800      0.0000      0.0000
+      2.6900   1531.3000      0.0000      0.0000
+      2.8900   1531.2600      0.0000      0.0000
+      3.0400   1531.2400      0.0000      0.0000
+      3.2000   1531.2300      0.0000      0.0000
+      3.4200   1531.2400      0.0000      0.0000
+      3.6500   1531.2300      0.0000      0.0000
+      3.8500   1531.1700      0.0000      0.0000
+      4.0700   1531.1100      0.0000      0.0000
+      4.2800   1531.0800      0.0000      0.0000
+      4.5100   1530.9600      0.0000      0.0000
+      4.7500   1530.9300      0.0000      0.0000
+      4.9600   1530.8800      0.0000      0.0000
+      5.2300   1530.8400      0.0000      0.0000
+      5.4700   1530.8500      0.0000      0.0000
+      5.7300   1530.9600      0.0000      0.0000
+      5.9600   1531.0600      0.0000      0.0000
+      6.2600   1531.1400      0.0000      0.0000
+      6.4800   1531.4500      0.0000      0.0000
+      6.7500   1532.0200      0.0000      0.0000
+      7.0100   1532.8200      0.0000      0.0000
+      7.2600   1533.7700      0.0000      0.0000
+      7.4900   1534.7500      0.0000      0.0000
+      7.7600   1535.0500      0.0000      0.0000
+      7.9900   1535.1200      0.0000      0.0000
+      8.2800   1535.0600      0.0000      0.0000
+      8.5500   1535.0800      0.0000      0.0000
+      8.7600   1535.0000      0.0000      0.0000
+      9.0100   1535.0000      0.0000      0.0000
+      9.2700   1535.0900      0.0000      0.0000
+      9.5400   1535.3900      0.0000      0.0000
+      9.7700   1535.5900      0.0000      0.0000
+      9.9900   1535.8400      0.0000      0.0000
+     10.2700   1535.9600      0.0000      0.0000
+     10.5300   1536.1300      0.0000      0.0000
+     10.8000   1536.0700      0.0000      0.0000
+     11.0100   1535.7400      0.0000      0.0000
+     11.2700   1535.6200      0.0000      0.0000
+     11.5200   1535.6300      0.0000      0.0000
+     11.7700   1535.4500      0.0000      0.0000
+     12.0300   1535.4600      0.0000      0.0000
+     12.2800   1537.2200      0.0000      0.0000
+     12.5500   1538.8300      0.0000      0.0000
+     12.7900   1539.3700      0.0000      0.0000
+     13.0600   1539.5600      0.0000      0.0000
+     13.3100   1539.6900      0.0000      0.0000
+     13.5700   1539.6700      0.0000      0.0000
+     13.8300   1539.6900      0.0000      0.0000
+     14.1200   1539.7200      0.0000      0.0000
+     14.3300   1539.6900      0.0000      0.0000
@@ -0,0 +1,65 @@
+test_read_store_and_write
+18/6/2016
+14:35:3
+Probe: ISS
+Source: /root/package/data/input/iss/assvt16170_d16.svp
+      1.5800   1530.3400      0.0000      0.0000
+      1.6000   1530.3800      0.0000      0.0000
+      1.6200   1530.4400      0.0000      0.0000
+      1.6700   1530.3800      0.0000      0.0000
+      1.7500   1530.4100      0.0000      0.0000
+      1.8200   1530.3300      0.0000      0.0000
+      1.9100   1530.4000      0.0000      0.0000
+      2.0200   1530.4500      0.0000      0.0000
+      2.1800   1530.3600      0.0000      0.0000
+      2.2600   1530.3800      0.0000      0.0000
+      2.4100   1530.3800      0.0000      0.0000
+      2.5900   1530.4000      0.0000      0.0000
+      2.7800   1530.4000      0.0000      0.0000
+      2.9300   1530.3700      0.0000      0.0000
+      3.1200   1530.3600      0.0000      0.0000
+      3.3400   1530.3000      0.0000      0.0000
+      3.5700   1530.3200      0.0000      0.0000
+      3.7800   1530.3500      0.0000      0.0000
+      4.0400   1530.3400      0.0000      0.0000
+      4.2500   1530.3400      0.0000      0.0000
+      4.4900   1530.3800      0.0000      0.0000
+      4.7500   1530.4600      0.0000      0.0000
+      4.9800   1530.4900      0.0000      0.0000
+      5.2800   1530.5900      0.0000      0.0000
+      5.5400   1530.8500      0.0000      0.0000
+      5.8100   1531.3800      0.0000      0.0000
+      6.0400   1531.9100      0.0000      0.0000
+      6.3500   1532.6700      0.0000      0.0000
+      6.6200   1533.1800      0.0000      0.0000
+      6.8400   1533.7700      0.0000      0.0000
+      7.1100   1534.1600      0.0000      0.0000
+      7.3800   1534.1900      0.0000      0.0000
+      7.6800   1534.8300      0.0000      0.0000
+      7.9000   1535.3200      0.0000      0.0000
+      8.1600   1535.5300      0.0000      0.0000
+      8.4100   1535.5600      0.0000      0.0000
+      8.6700   1535.4600      0.0000      0.0000
+      8.9100   1535.3300      0.0000      0.0000
+      9.1400   1535.2800      0.0000      0.0000
+      9.4100   1535.3300      0.0000      0.0000
+      9.6400   1535.5300      0.0000      0.0000
+      9.9100   1535.5800      0.0000      0.0000
+     10.1400   1535.6800      0.0000      0.0000
+     10.4200   1535.7400      0.0000      0.0000
+     10.6700   1535.8900      0.0000      0.0000
+     10.9200   1535.9500      0.0000      0.0000
+     11.1400   1536.5900      0.0000      0.0000
+     11.4000   1537.0400      0.0000      0.0000
+     11.6300   1537.7400      0.0000      0.0000
+     11.8800   1538.5400      0.0000      0.0000
+     12.1500   1538.8800      0.0000      0.0000
+     12.4000   1539.0700      0.0000      0.0000
+     12.6700   1539.2200      0.0000      0.0000
+     12.9100   1539.3000      0.0000      0.0000
+     13.1600   1539.5000      0.0000      0.0000
+     13.4200   1539.6600      0.0000      0.0000
+     13.6300   1539.7600      0.0000      0.0000
+     13.9000   1539.8800      0.0000      0.0000
+     14.1800   1539.8700      0.0000      0.0000
+     14.4300   1539.8800      0.0000      0.0000
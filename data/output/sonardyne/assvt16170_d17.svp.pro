@@ -0,0 +1,63 @@
+test_read_store_and_write
+18/6/2016
+15:1:34
+Probe: ISS
+Source: /root/package/data/input/iss/assvt16170_d17.svp
+      1.8100   1531.1400      0.0000      0.0000
+      1.8600   1531.2000      0.0000      0.0000
+      1.9000   1531.2200      0.0000      0.0000
+      1.9700   1531.2300      0.0000      0.0000
+      2.0300   1531.1600      0.0000      0.0000
+      2.1000   1531.1600      0.0000      0.0000
+      2.2000   1531.1300      0.0000      0.0000
+      2.2900   1531.1300      0.0000      0.0000
+      2.4300   1531.1100      0.0000      0.0000
+      2.5700   1531.1700      0.0000      0.0000
+      2.7300   1531.1100      0.0000      0.0000
+      2.9000   1531.1100      0.0000      0.0000
+      3.0700   1531.1100      0.0000      0.0000
+      3.2600   1531.1400      0.0000      0.0000
+      3.4300   1531.1800      0.0000      0.0000
+      3.6400   1531.1900      0.0000      0.0000
+      3.8600   1531.1400      0.0000      0.0000
+      4.0700   1531.1500      0.0000      0.0000
+      4.2700   1531.2100      0.0000      0.0000
+      4.5000   1531.2400      0.0000      0.0000
+      4.7400   1531.4700      0.0000      0.0000
+      4.9700   1531.7400      0.0000      0.0000
+      5.2000   1532.2900      0.0000      0.0000
+      5.4100   1532.9500      0.0000      0.0000
+      5.6500   1533.5200      0.0000      0.0000
+      5.8900   1534.2100      0.0000      0.0000
+      6.1600   1534.8500      0.0000      0.0000
+      6.3700   1535.0700      0.0000      0.0000
+      6.6300   1535.3000      0.0000      0.0000
+      6.8500   1535.4500      0.0000      0.0000
+      7.1000   1535.5400      0.0000      0.0000
+      7.3200   1535.6900      0.0000      0.0000
+      7.5500   1535.9600      0.0000      0.0000
+      7.8300   1536.2500      0.0000      0.0000
+      8.0900   1536.7200      0.0000      0.0000
+      8.3300   1536.9200      0.0000      0.0000
+      8.5600   1537.2500      0.0000      0.0000
+      8.8300   1538.1600      0.0000      0.0000
+      9.0600   1538.5400      0.0000      0.0000
+      9.2800   1538.6700      0.0000      0.0000
+      9.5500   1538.9200      0.0000      0.0000
+      9.8200   1539.2600      0.0000      0.0000
+     10.0800   1539.4700      0.0000      0.0000
+     10.3200   1539.5600      0.0000      0.0000
+     10.5200   1539.5600      0.0000      0.0000
+     10.8100   1539.6600      0.0000      0.0000
+     11.0500   1539.7000      0.0000      0.0000
+     11.3200   1539.7600      0.0000      0.0000
+     11.5500   1539.7600      0.0000      0.0000
+     11.7700   1539.8000      0.0000      0.0000
+     12.0500   1539.7900      0.0000      0.0000
+     12.2800   1539.8300      0.0000      0.0000
+     12.5700   1539.8800      0.0000      0.0000
+     12.8000   1539.9100      0.0000      0.0000
+     13.0600   1539.8900      0.0000      0.0000
+     13.2800   1539.8800      0.0000      0.0000
+     13.5800   1539.9100      0.0000      0.0000
+     13.7100   1539.9000      0.0000      0.0000
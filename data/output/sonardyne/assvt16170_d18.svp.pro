@@ -0,0 +1,76 @@
+test_read_store_and_write
+18/6/2016
+15:16:31
+Probe: ISS
+Source: /root/package/data/input/iss/assvt16170_d18.svp
+      1.6600   1531.7500      0.0000      0.0000
+      1.6700   1531.7600      0.0000      0.0000
+      1.6800   1531.8700      0.0000      0.0000
+      1.7200   1531.8700      0.0000      0.0000
+      1.7500   1531.7500      0.0000      0.0000
+      1.7800   1531.7400      0.0000      0.0000
+      1.8300   1531.7900      0.0000      0.0000
+      1.8700   1531.7600      0.0000      0.0000
+      1.9300   1531.7900      0.0000      0.0000
+      1.9700   1531.7400      0.0000      0.0000
+      2.0600   1531.7400      0.0000      0.0000
+      2.1400   1531.6700      0.0000      0.0000
+      2.2700   1531.7000      0.0000      0.0000
+      2.3800   1531.6900      0.0000      0.0000
+      2.5200   1531.6500      0.0000      0.0000
+      2.7000   1531.6600      0.0000      0.0000
+      2.8500   1531.6200      0.0000      0.0000
+      3.0500   1531.6500      0.0000      0.0000
+      3.2100   1531.6300      0.0000      0.0000
+      3.4200   1531.5400      0.0000      0.0000
+      3.6400   1531.5700      0.0000      0.0000
+      3.8700   1531.6000      0.0000      0.0000
+      4.0900   1531.4800      0.0000      0.0000
+      4.2700   1531.4800      0.0000      0.0000
+      4.5100   1531.4900      0.0000      0.0000
+      4.7600   1531.5800      0.0000      0.0000
+      4.9800   1531.6500      0.0000      0.0000
+      5.2400   1531.7900      0.0000      0.0000
+      5.4700   1532.0400      0.0000      0.0000
+      5.7000   1532.4300      0.0000      0.0000
+      5.9400   1532.9100      0.0000      0.0000
+      6.2100   1533.9000      0.0000      0.0000
+      6.4100   1535.7200      0.0000      0.0000
+      6.6700   1537.0200      0.0000      0.0000
+      6.9400   1537.2300      0.0000      0.0000
+      7.1500   1538.0000      0.0000      0.0000
+      7.3800   1538.1800      0.0000      0.0000
+      7.6400   1538.3700      0.0000      0.0000
+      7.9000   1538.3600      0.0000      0.0000
+      8.1300   1538.4300      0.0000      0.0000
+      8.3700   1538.6700      0.0000      0.0000
+      8.6300   1538.8400      0.0000      0.0000
+      8.8700   1539.2100      0.0000      0.0000
+      9.1200   1539.3900      0.0000      0.0000
+      9.3600   1539.7100      0.0000      0.0000
+      9.6100   1539.7400      0.0000      0.0000
+      9.8800   1539.6700      0.0000      0.0000
+     10.0900   1539.5800      0.0000      0.0000
+     10.3500   1539.4900      0.0000      0.0000
+     10.5800   1539.4900      0.0000      0.0000
+     10.8300   1539.4300      0.0000      0.0000
+     11.0900   1539.4800      0.0000      0.0000
+     11.3600   1539.4300      0.0000      0.0000
+     11.5700   1539.4500      0.0000      0.0000
+     11.8100   1539.4500      0.0000      0.0000
+     12.0800   1539.4600      0.0000      0.0000
+     12.3100   1539.4700      0.0000      0.0000
+     12.5900   1539.5100      0.0000      0.0000
+     12.8100   1539.5300      0.0000      0.0000
+     13.0800   1539.5200      0.0000      0.0000
+     13.3200   1539.6200      0.0000      0.0000
+     13.5800   1539.5700      0.0000      0.0000
+     13.8400   1539.6100      0.0000      0.0000
+     14.0700   1539.6200      0.0000      0.0000
+     14.3500   1539.6400      0.0000      0.0000
+     14.5800   1539.6600      0.0000      0.0000
+     14.8500   1539.6600      0.0000      0.0000
+     15.1000   1539.6600      0.0000      0.0000
+     15.3600   1539.6600      0.0000      0.0000
+     15.6300   1539.6600      0.0000      0.0000
+     15.8100   1539.7100      0.0000      0.0000
@@ -0,0 +1,70 @@
+test_read_store_and_write
+18/6/2016
+16:15:41
+Probe: ISS
+Source: /root/package/data/input/iss/assvt16170_d19.svp
+      1.0100   1531.2200      0.0000      0.0000
+      1.1800   1531.5000      0.0000      0.0000
+      1.2900   1531.5400      0.0000      0.0000
+      1.3500   1531.5800      0.0000      0.0000
+      1.4400   1531.5800      0.0000      0.0000
+      1.5200   1531.5200      0.0000      0.0000
+      1.6200   1531.5000      0.0000      0.0000
+      1.7500   1531.5500      0.0000      0.0000
+      1.8500   1531.5300      0.0000      0.0000
+      1.9800   1531.4600      0.0000      0.0000
+      2.1700   1531.3800      0.0000      0.0000
+      2.3100   1531.3300      0.0000      0.0000
+      2.4700   1531.3200      0.0000      0.0000
+      2.6500   1531.3200      0.0000      0.0000
+      2.7900   1531.3200      0.0000      0.0000
+      3.0100   1531.2800      0.0000      0.0000
+      3.2000   1531.3300      0.0000      0.0000
+      3.4000   1531.2900      0.0000      0.0000
+      3.6300   1531.3300      0.0000      0.0000
+      3.8300   1531.3500      0.0000      0.0000
+      4.0800   1531.3200      0.0000      0.0000
+      4.2700   1531.3100      0.0000      0.0000
+      4.5100   1531.3500      0.0000      0.0000
+      4.7100   1531.3800      0.0000      0.0000
+      4.9800   1531.5300      0.0000      0.0000
+      5.2300   1531.6100      0.0000      0.0000
+      5.4500   1531.8500      0.0000      0.0000
+      5.7300   1532.0400      0.0000      0.0000
+      5.9700   1532.3900      0.0000      0.0000
+      6.2100   1533.1000      0.0000      0.0000
+      6.5000   1533.6600      0.0000      0.0000
+      6.7400   1534.4900      0.0000      0.0000
+      6.9900   1535.4000      0.0000      0.0000
+      7.2400   1536.7600      0.0000      0.0000
+      7.4800   1537.9000      0.0000      0.0000
+      7.7700   1537.9300      0.0000      0.0000
+      8.0400   1537.9500      0.0000      0.0000
+      8.2700   1537.8900      0.0000      0.0000
+      8.5600   1538.0700      0.0000      0.0000
+      8.8300   1538.1800      0.0000      0.0000
+      9.1000   1538.5900      0.0000      0.0000
+      9.3500   1539.2400      0.0000      0.0000
+      9.5700   1539.7100      0.0000      0.0000
+      9.8600   1539.7600      0.0000      0.0000
+     10.1300   1539.6800      0.0000      0.0000
+     10.3500   1539.5900      0.0000      0.0000
+     10.6200   1539.5400      0.0000      0.0000
+     10.8800   1539.5300      0.0000      0.0000
+     11.1500   1539.5500      0.0000      0.0000
+     11.3900   1539.5300      0.0000      0.0000
+     11.6800   1539.5200      0.0000      0.0000
+     11.9300   1539.5100      0.0000      0.0000
+     12.1600   1539.5300      0.0000      0.0000
+     12.4300   1539.5400      0.0000      0.0000
+     12.7300   1539.5500      0.0000      0.0000
+     12.9500   1539.5900      0.0000      0.0000
+     13.2400   1539.6300      0.0000      0.0000
+     13.5100   1539.6800      0.0000      0.0000
+     13.7800   1539.7500      0.0000      0.0000
+     14.0200   1539.7500      0.0000      0.0000
+     14.3100   1539.7500      0.0000      0.0000
+     14.5700   1539.8000      0.0000      0.0000
+     14.8400   1539.8000      0.0000      0.0000
+     15.1200   1539.8400      0.0000      0.0000
+     15.2400   1539.8200      0.0000      0.0000
@@ -0,0 +1,66 @@
+test_read_store_and_write
+18/6/2016
+16:34:1
+Probe: ISS
+Source: /root/package/data/input/iss/assvt16170_d20.svp
+      0.9000   1530.8000      0.0000      0.0000
+      0.9300   1530.8800      0.0000      0.0000
+      1.0500   1530.7000      0.0000      0.0000
+      1.1900   1530.3400      0.0000      0.0000
+      1.4700   1530.8300      0.0000      0.0000
+      1.6300   1530.7900      0.0000      0.0000
+      1.7700   1530.7300      0.0000      0.0000
+      1.9200   1530.6800      0.0000      0.0000
+      2.1000   1530.6700      0.0000      0.0000
+      2.2700   1530.5900      0.0000      0.0000
+      2.4800   1530.5800      0.0000      0.0000
+      2.6800   1530.5000      0.0000      0.0000
+      2.8600   1530.4700      0.0000      0.0000
+      3.1100   1530.4700      0.0000      0.0000
+      3.2800   1530.4100      0.0000      0.0000
+      3.5300   1530.4000      0.0000      0.0000
+      3.7500   1530.3800      0.0000      0.0000
+      3.9900   1530.3700      0.0000      0.0000
+      4.1700   1530.5100      0.0000      0.0000
+      4.4600   1530.7600      0.0000      0.0000
+      4.6800   1531.1300      0.0000      0.0000
+      4.9500   1531.7400      0.0000      0.0000
+      5.1600   1532.4200      0.0000      0.0000
+      5.4000   1533.1800      0.0000      0.0000
+      5.6200   1533.7800      0.0000      0.0000
+      5.8900   1534.2900      0.0000      0.0000
+      6.1400   1534.7300      0.0000      0.0000
+      6.4100   1535.0500      0.0000      0.0000
+      6.6800   1535.3600      0.0000      0.0000
+      6.9100   1535.6200      0.0000      0.0000
+      7.1800   1535.8000      0.0000      0.0000
+      7.4200   1535.8500      0.0000      0.0000
+      7.6800   1535.5500      0.0000      0.0000
+      7.9300   1535.2100      0.0000      0.0000
+      8.2000   1536.0000      0.0000      0.0000
+      8.4300   1536.7700      0.0000      0.0000
+      8.7200   1536.9400      0.0000      0.0000
+      8.9900   1538.2100      0.0000      0.0000
+      9.2300   1539.1200      0.0000      0.0000
+      9.5000   1538.9900      0.0000      0.0000
+      9.7400   1539.4700      0.0000      0.0000
+     10.0300   1539.7000      0.0000      0.0000
+     10.2700   1539.6800      0.0000      0.0000
+     10.5700   1539.7000      0.0000      0.0000
+     10.8600   1539.7700      0.0000      0.0000
+     11.0800   1539.8600      0.0000      0.0000
+     11.3800   1539.9500      0.0000      0.0000
+     11.6300   1540.0000      0.0000      0.0000
+     11.9000   1540.0100      0.0000      0.0000
+     12.1900   1540.0700      0.0000      0.0000
+     12.4100   1540.1000      0.0000      0.0000
+     12.7200   1540.1400      0.0000      0.0000
+     12.9600   1540.1800      0.0000      0.0000
+     13.2300   1540.2000      0.0000      0.0000
+     13.5200   1540.1900      0.0000      0.0000
+     13.7600   1540.1800      0.0000      0.0000
+     14.0300   1540.1800      0.0000      0.0000
+     14.2900   1540.1900      0.0000      0.0000
+     14.5900   1540.1700      0.0000      0.0000
+     14.7900   1540.1600      0.0000      0.0000
+     14.8600   1540.1600      0.0000      0.0000
@@ -0,0 +1,68 @@
+test_read_store_and_write
+18/6/2016
+16:40:21
+Probe: ISS
+Source: /root/package/data/input/iss/assvt16170_d21.svp
+      0.7900   1531.4400      0.0000      0.0000
+      0.8600   1531.5800      0.0000      0.0000
+      1.2700   1531.6500      0.0000      0.0000
+      1.3700   1531.4600      0.0000      0.0000
+      1.4600   1531.3900      0.0000      0.0000
+      1.5600   1531.6000      0.0000      0.0000
+      1.7300   1531.5700      0.0000      0.0000
+      1.8500   1531.1000      0.0000      0.0000
+      1.9600   1531.5300      0.0000      0.0000
+      2.1800   1531.3100      0.0000      0.0000
+      2.3000   1531.0500      0.0000      0.0000
+      2.5200   1530.8400      0.0000      0.0000
+      2.7200   1530.7500      0.0000      0.0000
+      2.9000   1530.6600      0.0000      0.0000
+      3.1200   1530.5700      0.0000      0.0000
+      3.3300   1530.4800      0.0000      0.0000
+      3.5600   1530.4000      0.0000      0.0000
+      3.7800   1530.4000      0.0000      0.0000
+      4.0200   1530.3600      0.0000      0.0000
+      4.2300   1530.4200      0.0000      0.0000
+      4.5100   1530.5400      0.0000      0.0000
+      4.7200   1530.7200      0.0000      0.0000
+      5.0000   1531.2900      0.0000      0.0000
+      5.2200   1532.1700      0.0000      0.0000
+      5.4900   1532.9300      0.0000      0.0000
+      5.7400   1533.4600      0.0000      0.0000
+      5.9500   1534.0000      0.0000      0.0000
+      6.2300   1534.4200      0.0000      0.0000
+      6.4900   1534.8100      0.0000      0.0000
+      6.7700   1535.0300      0.0000      0.0000
+      7.0100   1535.2300      0.0000      0.0000
+      7.3200   1534.9700      0.0000      0.0000
+      7.5200   1535.0100      0.0000      0.0000
+      7.7800   1535.5800      0.0000      0.0000
+      8.0700   1535.1500      0.0000      0.0000
+      8.3300   1534.8200      0.0000      0.0000
+      8.5800   1535.0200      0.0000      0.0000
+      8.8400   1535.2300      0.0000      0.0000
+      9.1100   1535.6200      0.0000      0.0000
+      9.3700   1536.5800      0.0000      0.0000
+      9.6000   1538.0800      0.0000      0.0000
+      9.8800   1539.4100      0.0000      0.0000
+     10.1500   1539.5700      0.0000      0.0000
+     10.4000   1539.7100      0.0000      0.0000
+     10.6900   1539.7400      0.0000      0.0000
+     10.9400   1539.8100      0.0000      0.0000
+     11.2100   1539.8900      0.0000      0.0000
+     11.4700   1539.9800      0.0000      0.0000
+     11.7300   1540.0300      0.0000      0.0000
+     11.9500   1540.1700      0.0000      0.0000
+     12.2400   1540.2200      0.0000      0.0000
+     12.5300   1540.2900      0.0000      0.0000
+     12.7300   1540.3300      0.0000      0.0000
+     13.0600   1540.3200      0.0000      0.0000
+     13.3100   1540.3500      0.0000      0.0000
+     13.5600   1540.3700      0.0000      0.0000
+     13.8400   1540.4100      0.0000      0.0000
+     14.0900   1540.3800      0.0000      0.0000
+     14.3900   1540.3500      0.0000      0.0000
+     14.6300   1540.3500      0.0000      0.0000
+     14.9300   1540.3600      0.0000      0.0000
+     15.1400   1540.3400      0.0000      0.0000
+     15.1900   1540.3700      0.0000      0.0000
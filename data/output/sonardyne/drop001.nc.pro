@@ -0,0 +1,1835 @@
+test_read_store_and_write
+9/2/2016
+6:43:35
+Probe: XBT
+Source: /root/package/data/input/turo/drop001.nc
+      0.6300   1522.1460     33.4976     20.8500
+      1.2700   1522.1268     33.4976     20.8390
+      1.9000   1522.1211     33.4976     20.8330
+      2.5400   1522.1292     33.4976     20.8320
+      3.1700   1522.1370     33.4976     20.8310
+      3.8100   1522.1423     33.4976     20.8290
+      4.4400   1522.1530     33.4976     20.8290
+      5.0800   1522.1528     33.4976     20.8250
+      5.7100   1522.1852     33.4976     20.8330
+      6.3400   1522.2229     33.4976     20.8430
+      6.9800   1522.2717     33.4976     20.8570
+      7.6100   1522.3204     33.4976     20.8710
+      8.2500   1522.3121     33.4976     20.8640
+      8.8800   1522.3363     33.4976     20.8690
+      9.5100   1522.3496     33.4976     20.8700
+     10.1500   1522.3522     33.4976     20.8670
+     10.7800   1522.3466     33.4976     20.8610
+     11.4200   1522.3600     33.4976     20.8620
+     12.0500   1522.3733     33.4976     20.8630
+     12.6800   1522.3812     33.4976     20.8620
+     13.3200   1522.3865     33.4976     20.8600
+     13.9500   1522.3835     33.4976     20.8550
+     14.5900   1522.3888     33.4976     20.8530
+     15.2200   1522.4049     33.4976     20.8550
+     15.8500   1522.4073     33.4976     20.8520
+     16.4900   1522.4072     33.4976     20.8480
+     17.1200   1522.4205     33.4976     20.8490
+     17.7500   1522.4230     33.4976     20.8460
+     18.3900   1522.4337     33.4976     20.8460
+     19.0200   1522.4443     33.4976     20.8460
+     19.6600   1522.4469     33.4976     20.8430
+     20.2900   1522.3976     33.4976     20.8210
+     20.9200   1522.3810     33.4976     20.8110
+     21.5600   1522.3727     33.4976     20.8040
+     22.1900   1522.3452     33.4976     20.7900
+     22.8200   1522.3368     33.4976     20.7830
+     23.4600   1522.3339     33.4976     20.7780
+     24.0900   1522.3336     33.4976     20.7740
+     24.7200   1522.3414     33.4976     20.7730
+     25.3500   1522.3357     33.4976     20.7670
+     25.9900   1522.3383     33.4976     20.7640
+     26.6200   1522.2207     33.4976     20.7170
+     27.2500   1522.0620     33.4976     20.6550
+     27.8900   1521.9442     33.4976     20.6080
+     28.5200   1521.6863     33.4976     20.5100
+     29.1500   1521.2266     33.4976     20.3390
+     29.7900   1521.0083     33.4976     20.2560
+     30.4200   1520.9138     33.4976     20.2180
+     31.0500   1520.8746     33.4976     20.2000
+     31.6800   1520.8464     33.4976     20.1860
+     32.3200   1520.7770     33.4976     20.1570
+     32.9500   1520.6989     33.4976     20.1250
+     33.5800   1520.6567     33.4976     20.1060
+     34.2200   1520.6064     33.4976     20.0840
+     34.8500   1520.5753     33.4976     20.0690
+     35.4800   1520.5360     33.4976     20.0510
+     36.1100   1520.4938     33.4976     20.0320
+     36.7500   1520.4489     33.4976     20.0120
+     37.3800   1520.2786     33.4976     19.9470
+     38.0100   1519.9709     33.4976     19.8330
+     38.6400   1519.5784     33.4976     19.6890
+     39.2800   1519.2828     33.4976     19.5800
+     39.9100   1519.1555     33.4976     19.5310
+     40.5400   1519.0758     33.4976     19.4990
+     41.1700   1519.0159     33.4976     19.4740
+     41.8000   1518.8740     33.4976     19.4200
+     42.4400   1518.7745     33.4976     19.3810
+     43.0700   1518.5897     33.4976     19.3120
+     43.7000   1518.2823     33.4976     19.2000
+     44.3300   1518.0254     33.4976     19.1060
+     44.9600   1517.7734     33.4976     19.0140
+     45.6000   1517.3663     33.4976     18.8680
+     46.2300   1517.1672     33.4976     18.7950
+     46.8600   1517.0599     33.4976     18.7540
+     47.4900   1517.0101     33.4976     18.7330
+     48.1200   1516.9774     33.4976     18.7180
+     48.7600   1516.9479     33.4976     18.7040
+     49.3900   1516.9066     33.4976     18.6860
+     50.0200   1516.8652     33.4976     18.6680
+     50.6500   1516.8297     33.4976     18.6520
+     51.2800   1516.7797     33.4976     18.6310
+     51.9100   1516.7498     33.4976     18.6170
+     52.5500   1516.7144     33.4976     18.6010
+     53.1800   1516.7046     33.4976     18.5940
+     53.8100   1516.7008     33.4976     18.5890
+     54.4400   1516.7286     33.4976     18.5950
+     55.0700   1516.7247     33.4976     18.5900
+     55.7000   1516.7035     33.4976     18.5790
+     56.3400   1516.6854     33.4976     18.5690
+     56.9700   1516.5802     33.4976     18.5290
+     57.6000   1516.4343     33.4976     18.4750
+     58.2300   1516.0879     33.4976     18.3520
+     58.8600   1515.6935     33.4976     18.2130
+     59.4900   1515.5171     33.4976     18.1490
+     60.1200   1515.3667     33.4976     18.0940
+     60.7500   1515.3685     33.4976     18.0910
+     61.3800   1515.2501     33.4976     18.0470
+     62.0200   1514.9850     33.4976     17.9530
+     62.6500   1514.5686     33.4976     17.8080
+     63.2800   1514.2689     33.4976     17.7030
+     63.9100   1514.0544     33.4976     17.6270
+     64.5400   1513.8781     33.4976     17.5640
+     65.1700   1513.6389     33.4976     17.4800
+     65.8000   1512.9810     33.4984     17.2560
+     66.4300   1512.5536     33.4984     17.1100
+     67.0600   1512.3235     33.4984     17.0300
+     67.6900   1512.1954     33.4984     16.9840
+     68.3200   1512.0007     33.4984     16.9160
+     68.9600   1511.6515     33.4984     16.7970
+     69.5900   1511.4407     33.4984     16.7240
+     70.2200   1511.3752     33.4984     16.6990
+     70.8500   1511.4496     33.4984     16.7200
+     71.4800   1511.6118     33.4984     16.7700
+     72.1100   1511.6376     33.4984     16.7750
+     72.7400   1511.5966     33.4984     16.7580
+     73.3700   1511.5464     33.4984     16.7380
+     74.0000   1511.4780     33.4984     16.7120
+     74.6300   1511.4126     33.4984     16.6870
+     75.2600   1511.2863     33.4984     16.6420
+     75.8900   1511.1385     33.4984     16.5900
+     76.5200   1511.0240     33.4984     16.5490
+     77.1500   1511.0103     33.4984     16.5410
+     77.7800   1511.0299     33.4984     16.5440
+     78.4100   1511.0009     33.4984     16.5310
+     79.0400   1510.9534     33.4984     16.5120
+     79.6700   1510.9150     33.4984     16.4960
+     80.3000   1510.8676     33.4984     16.4770
+     80.9300   1510.8016     33.4984     16.4520
+     81.5600   1510.6622     33.4984     16.4030
+     82.1900   1510.4399     33.4984     16.3270
+     82.8200   1510.3154     33.4984     16.2830
+     83.4500   1510.2307     33.4984     16.2520
+     84.0800   1510.2135     33.4984     16.2430
+     84.7100   1510.1442     33.4984     16.2170
+     85.3400   1510.1239     33.4984     16.2070
+     85.9700   1510.1621     33.4984     16.2160
+     86.6000   1510.1481     33.4984     16.2080
+     87.2300   1510.0908     33.4984     16.1860
+     87.8600   1510.0059     33.4984     16.1550
+     88.4900   1509.9456     33.4984     16.1320
+     89.1200   1509.8698     33.4984     16.1040
+     89.7500   1509.8247     33.4984     16.0860
+     90.3800   1509.8167     33.4984     16.0800
+     91.0100   1509.8303     33.4984     16.0810
+     91.6300   1509.8375     33.4984     16.0800
+     92.2600   1509.8882     33.4984     16.0930
+     92.8900   1509.9111     33.4984     16.0970
+     93.5200   1509.8970     33.4984     16.0890
+     94.1500   1509.8488     33.4984     16.0700
+     94.7800   1509.7759     33.4984     16.0430
+     95.4100   1509.6659     33.4984     16.0040
+     96.0400   1509.5681     33.4984     15.9690
+     96.6700   1509.5291     33.4984     15.9530
+     97.3000   1509.4993     33.4984     15.9400
+     97.9300   1509.4509     33.4984     15.9210
+     98.5500   1509.3931     33.4984     15.8990
+     99.1800   1509.3478     33.4984     15.8810
+     99.8100   1509.2931     33.4984     15.8600
+    100.4400   1509.2228     33.4984     15.8340
+    101.0700   1509.1619     33.4984     15.8110
+    101.7000   1509.0916     33.4984     15.7850
+    102.3300   1508.9868     33.4984     15.7480
+    102.9600   1508.8727     33.4984     15.7080
+    103.5800   1508.7645     33.4984     15.6700
+    104.2100   1508.7189     33.4984     15.6520
+    104.8400   1508.6794     33.4984     15.6360
+    105.4700   1508.6556     33.4984     15.6250
+    106.1000   1508.5974     33.4984     15.6030
+    106.7300   1508.5610     33.4984     15.5880
+    107.3600   1508.5465     33.4984     15.5800
+    107.9800   1508.5413     33.4984     15.5750
+    108.6100   1508.5236     33.4984     15.5660
+    109.2400   1508.4872     33.4984     15.5510
+    109.8700   1508.3693     33.4984     15.5100
+    110.5000   1508.2952     33.4984     15.4830
+    111.1300   1508.2681     33.4984     15.4710
+    111.7500   1508.1968     33.4984     15.4450
+    112.3800   1508.0880     33.4984     15.4070
+    113.0100   1508.0137     33.4984     15.3800
+    113.6400   1507.9707     33.4984     15.3630
+    114.2700   1507.9246     33.4984     15.3450
+    114.8900   1507.8877     33.4984     15.3300
+    115.5200   1507.8573     33.4984     15.3170
+    116.1500   1507.8016     33.4984     15.2960
+    116.7800   1507.7271     33.4984     15.2690
+    117.4100   1507.6744     33.4984     15.2490
+    118.0300   1507.6406     33.4984     15.2350
+    118.6600   1507.6101     33.4984     15.2220
+    119.2900   1507.5638     33.4984     15.2040
+    119.9200   1507.5396     33.4984     15.1930
+    120.5400   1507.5278     33.4984     15.1860
+    121.1700   1507.5288     33.4984     15.1830
+    121.8000   1507.4919     33.4984     15.1680
+    122.4300   1507.3727     33.4984     15.1270
+    123.0500   1507.2563     33.4984     15.0870
+    123.6800   1507.2067     33.4984     15.0680
+    124.3100   1507.1284     33.4984     15.0400
+    124.9400   1507.0532     33.4984     15.0130
+    125.5600   1506.9429     33.4984     14.9750
+    126.1900   1506.8867     33.4984     14.9540
+    126.8200   1506.8717     33.4984     14.9460
+    127.4500   1506.8568     33.4984     14.9380
+    128.0700   1506.8004     33.4984     14.9170
+    128.7000   1506.6835     33.4984     14.8770
+    129.3300   1506.5920     33.4984     14.8450
+    129.9600   1506.5323     33.4984     14.8230
+    130.5800   1506.5076     33.4984     14.8120
+    131.2100   1506.4670     33.4984     14.7960
+    131.8400   1506.4137     33.4984     14.7760
+    132.4600   1506.3698     33.4984     14.7590
+    133.0900   1506.3291     33.4984     14.7430
+    133.7200   1506.2596     33.4984     14.7180
+    134.3400   1506.2092     33.4984     14.6990
+    134.9700   1506.1877     33.4984     14.6890
+    135.6000   1506.1694     33.4984     14.6800
+    136.2200   1506.1093     33.4984     14.6580
+    136.8500   1505.9852     33.4984     14.6160
+    137.4800   1505.8063     33.4984     14.5570
+    138.1000   1505.7235     33.4984     14.5280
+    138.7300   1505.6890     33.4984     14.5140
+    139.3600   1505.6802     33.4984     14.5080
+    139.9800   1505.6583     33.4984     14.4980
+    140.6100   1505.6271     33.4984     14.4850
+    141.2400   1505.5828     33.4984     14.4680
+    141.8600   1505.5546     33.4984     14.4560
+    142.4900   1505.5232     33.4984     14.4430
+    143.1200   1505.4724     33.4984     14.4240
+    143.7400   1505.4506     33.4984     14.4140
+    144.3700   1505.4417     33.4984     14.4080
+    145.0000   1505.4458     33.4984     14.4060
+    145.6200   1505.4109     33.4984     14.3920
+    146.2500   1505.3925     33.4984     14.3830
+    146.8700   1505.3059     33.4984     14.3530
+    147.5000   1505.2098     33.4984     14.3200
+    148.1300   1505.1492     33.4984     14.2980
+    148.7500   1505.1045     33.4984     14.2810
+    149.3800   1505.0503     33.4984     14.2610
+    150.0000   1505.0219     33.4984     14.2490
+    150.6300   1504.9967     33.4984     14.2380
+    151.2600   1504.9716     33.4984     14.2270
+    151.8800   1504.9268     33.4984     14.2100
+    152.5100   1504.9016     33.4984     14.1990
+    153.1300   1504.8828     33.4984     14.1900
+    153.7600   1504.8608     33.4984     14.1800
+    154.3800   1504.8387     33.4984     14.1700
+    155.0100   1504.7909     33.4984     14.1520
+    155.6400   1504.7494     33.4984     14.1360
+    156.2600   1504.7078     33.4984     14.1200
+    156.8900   1504.6631     33.4984     14.1030
+    157.5100   1504.6213     33.4984     14.0870
+    158.1400   1504.5734     33.4984     14.0690
+    158.7600   1504.4926     33.4984     14.0410
+    159.3900   1504.4412     33.4984     14.0220
+    160.0100   1504.3961     33.4984     14.0050
+    160.6400   1504.3121     33.4984     13.9760
+    161.2600   1504.2736     33.4984     13.9610
+    161.8900   1504.1763     33.4984     13.9280
+    162.5200   1504.1150     33.4984     13.9060
+    163.1400   1504.0861     33.4984     13.8940
+    163.7700   1504.0214     33.4984     13.8710
+    164.3900   1503.9957     33.4984     13.8600
+    165.0200   1503.9801     33.4984     13.8520
+    165.6400   1503.9938     33.4984     13.8530
+    166.2700   1503.9911     33.4984     13.8490
+    166.8900   1503.9917     33.4984     13.8460
+    167.5200   1503.9858     33.4984     13.8410
+    168.1400   1503.9667     33.4984     13.8320
+    168.7700   1503.9379     33.4984     13.8200
+    169.3900   1503.9023     33.4984     13.8060
+    170.0200   1503.8342     33.4984     13.7820
+    170.6400   1503.8413     33.4984     13.7810
+    171.2600   1503.7959     33.4984     13.7640
+    171.8900   1503.7375     33.4984     13.7430
+    172.5100   1503.7314     33.4984     13.7380
+    173.1400   1503.7289     33.4984     13.7340
+    173.7600   1503.7327     33.4984     13.7320
+    174.3900   1503.7103     33.4984     13.7220
+    175.0100   1503.5795     33.4984     13.6790
+    175.6400   1503.4617     33.4984     13.6400
+    176.2600   1503.4326     33.4984     13.6280
+    176.8900   1503.4266     33.4984     13.6230
+    177.5100   1503.4271     33.4984     13.6200
+    178.1300   1503.4111     33.4984     13.6120
+    178.7600   1503.3524     33.4984     13.5910
+    179.3800   1503.2837     33.4984     13.5670
+    180.0100   1503.2678     33.4984     13.5590
+    180.6300   1503.2452     33.4984     13.5490
+    181.2600   1503.2062     33.4984     13.5340
+    181.8800   1503.1902     33.4984     13.5260
+    182.5000   1503.1411     33.4984     13.5080
+    183.1300   1503.0658     33.4984     13.4820
+    183.7500   1502.9902     33.4984     13.4560
+    184.3800   1502.9578     33.4984     13.4430
+    185.0000   1502.9250     33.4984     13.4300
+    185.6200   1502.9023     33.4984     13.4200
+    186.2500   1502.8864     33.4984     13.4120
+    186.8700   1502.8636     33.4984     13.4020
+    187.4900   1502.7944     33.4984     13.3780
+    188.1200   1502.7454     33.4984     13.3600
+    188.7400   1502.7258     33.4984     13.3510
+    189.3700   1502.6899     33.4984     13.3370
+    189.9900   1502.6605     33.4984     13.3250
+    190.6100   1502.6277     33.4984     13.3120
+    191.2400   1502.5984     33.4984     13.3000
+    191.8600   1502.5822     33.4984     13.2920
+    192.4800   1502.5659     33.4984     13.2840
+    193.1100   1502.5631     33.4984     13.2800
+    193.7300   1502.5204     33.4984     13.2640
+    194.3500   1502.4476     33.4984     13.2390
+    194.9800   1502.3950     33.4984     13.2200
+    195.6000   1502.3322     33.4984     13.1980
+    196.2200   1502.2659     33.4984     13.1750
+    196.8500   1502.2164     33.4984     13.1570
+    197.4700   1502.1968     33.4984     13.1480
+    198.0900   1502.1538     33.4984     13.1320
+    198.7200   1502.1244     33.4984     13.1200
+    199.3400   1502.0547     33.4984     13.0960
+    199.9600   1502.0049     33.4984     13.0780
+    200.5900   1501.9921     33.4984     13.0710
+    201.2100   1501.9657     33.4984     13.0600
+    201.8300   1501.9292     33.4984     13.0460
+    202.4500   1501.9095     33.4984     13.0370
+    203.0800   1501.8832     33.4984     13.0260
+    203.7000   1501.8368     33.4984     13.0090
+    204.3200   1501.8470     33.4984     13.0090
+    204.9500   1501.8442     33.4984     13.0050
+    205.5700   1501.8110     33.4984     12.9920
+    206.1900   1501.7377     33.4984     12.9670
+    206.8100   1501.7246     33.4984     12.9600
+    207.4400   1501.7385     33.4984     12.9610
+    208.0600   1501.7522     33.4984     12.9620
+    208.6800   1501.7390     33.4984     12.9550
+    209.3000   1501.7628     33.4984     12.9590
+    209.9300   1501.7733     33.4984     12.9590
+    210.5500   1501.7870     33.4984     12.9600
+    211.1700   1501.7805     33.4984     12.9550
+    211.7900   1501.7742     33.4984     12.9500
+    212.4200   1501.7712     33.4984     12.9460
+    213.0400   1501.7615     33.4984     12.9400
+    213.6600   1501.7584     33.4984     12.9360
+    214.2800   1501.7352     33.4984     12.9260
+    214.9000   1501.6919     33.4984     12.9100
+    215.5300   1501.6354     33.4984     12.8900
+    216.1500   1501.6021     33.4984     12.8770
+    216.7700   1501.5823     33.4984     12.8680
+    217.3900   1501.5388     33.4984     12.8520
+    218.0100   1501.4888     33.4984     12.8340
+    218.6400   1501.4320     33.4984     12.8140
+    219.2600   1501.2339     33.4984     12.7520
+    219.8800   1501.0995     33.4991     12.7090
+    220.5000   1501.0424     33.4984     12.6890
+    221.1200   1501.0291     33.4984     12.6820
+    221.7500   1501.0363     33.4991     12.6810
+    222.3700   1501.0331     33.4991     12.6770
+    222.9900   1501.0265     33.4984     12.6720
+    223.6100   1500.9795     33.4984     12.6550
+    224.2300   1500.9662     33.4984     12.6480
+    224.8500   1500.9360     33.4984     12.6360
+    225.4800   1500.8588     33.4991     12.6100
+    226.1000   1500.7610     33.4991     12.5780
+    226.7200   1500.7206     33.4991     12.5630
+    227.3400   1500.6937     33.4991     12.5520
+    227.9600   1500.6702     33.4991     12.5420
+    228.5800   1500.6534     33.4991     12.5340
+    229.2000   1500.5859     33.4991     12.5110
+    229.8300   1500.5354     33.4991     12.4930
+    230.4500   1500.5118     33.4991     12.4830
+    231.0700   1500.4679     33.4984     12.4670
+    231.6900   1500.4207     33.4991     12.4500
+    232.3100   1500.3632     33.4991     12.4300
+    232.9300   1500.1594     33.4984     12.3670
+    233.5500   1500.0338     33.4991     12.3270
+    234.1700   1500.0067     33.4991     12.3160
+    234.7900   1500.0103     33.4991     12.3140
+    235.4200   1499.9355     33.4991     12.2890
+    236.0400   1499.8676     33.4991     12.2660
+    236.6600   1499.8403     33.4984     12.2550
+    237.2800   1499.8336     33.4991     12.2500
+    237.9000   1499.8134     33.4991     12.2410
+    238.5200   1499.8134     33.4991     12.2380
+    239.1400   1499.8237     33.4991     12.2380
+    239.7600   1499.7112     33.4991     12.2020
+    240.3800   1499.6123     33.4991     12.1700
+    241.0000   1499.5406     33.4991     12.1460
+    241.6200   1499.4894     33.4991     12.1280
+    242.2400   1499.4279     33.4991     12.1070
+    242.8600   1499.4006     33.4991     12.0960
+    243.4800   1499.3596     33.4991     12.0810
+    244.1100   1499.3529     33.4991     12.0760
+    244.7300   1499.3290     33.4991     12.0660
+    245.3500   1499.2811     33.4991     12.0490
+    245.9700   1499.1920     33.4991     12.0200
+    246.5900   1499.1029     33.4991     11.9910
+    247.2100   1499.0377     33.4991     11.9690
+    247.8300   1499.0308     33.4991     11.9640
+    248.4500   1499.0309     33.4991     11.9610
+    249.0700   1499.0481     33.4991     11.9630
+    249.6900   1499.0411     33.4991     11.9580
+    250.3100   1499.0687     33.4991     11.9630
+    250.9300   1499.0824     33.4991     11.9640
+    251.5500   1499.0894     33.4991     11.9630
+    252.1700   1499.1100     33.4991     11.9660
+    252.7900   1499.1306     33.4991     11.9690
+    253.4100   1499.1100     33.4991     11.9600
+    254.0300   1499.0448     33.4991     11.9380
+    254.6500   1498.9382     33.4991     11.9040
+    255.2700   1498.8934     33.4991     11.8880
+    255.8900   1498.8522     33.4991     11.8730
+    256.5100   1498.7971     33.4991     11.8540
+    257.1300   1498.6696     33.4991     11.8140
+    257.7500   1498.6144     33.4991     11.7950
+    258.3700   1498.5972     33.4991     11.7870
+    258.9900   1498.5868     33.4991     11.7810
+    259.6100   1498.5833     33.4991     11.7770
+    260.2200   1498.5762     33.4991     11.7720
+    260.8400   1498.5692     33.4991     11.7670
+    261.4600   1498.5554     33.4991     11.7600
+    262.0800   1498.5139     33.4991     11.7450
+    262.7000   1498.4448     33.4991     11.7220
+    263.3200   1498.3237     33.4991     11.6840
+    263.9400   1498.2856     33.4991     11.6700
+    264.5600   1498.2164     33.4991     11.6470
+    265.1800   1498.1298     33.4991     11.6190
+    265.8000   1498.0708     33.4991     11.5990
+    266.4200   1498.0360     33.4991     11.5860
+    267.0400   1498.0291     33.4991     11.5810
+    267.6600   1498.0323     33.4991     11.5790
+    268.2700   1498.0426     33.4991     11.5790
+    268.8900   1498.0355     33.4991     11.5740
+    269.5100   1497.9764     33.4991     11.5540
+    270.1300   1497.9243     33.4991     11.5360
+    270.7500   1497.7819     33.4991     11.4920
+    271.3700   1497.7434     33.4991     11.4780
+    271.9900   1497.7156     33.4991     11.4670
+    272.6100   1497.7015     33.4991     11.4600
+    273.2300   1497.6805     33.4991     11.4510
+    273.8400   1497.6245     33.4991     11.4320
+    274.4600   1497.5792     33.4991     11.4160
+    275.0800   1497.5442     33.4991     11.4030
+    275.7000   1497.5476     33.4991     11.4010
+    276.3200   1497.5370     33.4991     11.3950
+    276.9400   1497.5090     33.4991     11.3840
+    277.5600   1497.4810     33.4991     11.3730
+    278.1700   1497.4667     33.4991     11.3660
+    278.7900   1497.4666     33.4991     11.3630
+    279.4100   1497.4559     33.4991     11.3570
+    280.0300   1497.4453     33.4991     11.3510
+    280.6500   1497.4382     33.4991     11.3460
+    281.2700   1497.4590     33.4991     11.3490
+    281.8800   1497.4587     33.4991     11.3460
+    282.5000   1497.4620     33.4991     11.3440
+    283.1200   1497.4550     33.4991     11.3390
+    283.7400   1497.4688     33.4991     11.3400
+    284.3600   1497.4651     33.4991     11.3360
+    284.9800   1497.4650     33.4991     11.3330
+    285.5900   1497.4612     33.4991     11.3290
+    286.2100   1497.3947     33.4991     11.3070
+    286.8300   1497.2583     33.4991     11.2650
+    287.4500   1497.1812     33.4991     11.2400
+    288.0600   1497.1598     33.4991     11.2310
+    288.6800   1497.1492     33.4991     11.2250
+    289.3000   1497.1035     33.4991     11.2090
+    289.9200   1497.0193     33.4991     11.1820
+    290.5400   1496.9525     33.4991     11.1600
+    291.1500   1496.9241     33.4991     11.1490
+    291.7700   1496.8993     33.4991     11.1390
+    292.3900   1496.8535     33.4991     11.1230
+    293.0100   1496.8147     33.4991     11.1090
+    293.6200   1496.7827     33.4991     11.0970
+    294.2400   1496.7650     33.4991     11.0890
+    294.8600   1496.7753     33.4991     11.0890
+    295.4800   1496.7645     33.4991     11.0830
+    296.0900   1496.7361     33.4991     11.0720
+    296.7100   1496.6655     33.4991     11.0490
+    297.3300   1496.5880     33.4991     11.0240
+    297.9500   1496.5455     33.4991     11.0090
+    298.5600   1496.4889     33.4991     10.9900
+    299.1800   1496.4111     33.4991     10.9650
+    299.8000   1496.3474     33.4991     10.9440
+    300.4100   1496.3047     33.4991     10.9290
+    301.0300   1496.2657     33.4991     10.9150
+    301.6500   1496.1948     33.4991     10.8920
+    302.2700   1496.1205     33.4991     10.8680
+    302.8800   1496.0530     33.4991     10.8460
+    303.5000   1495.9996     33.4991     10.8280
+    304.1200   1495.9604     33.4991     10.8140
+    304.7300   1495.9247     33.4991     10.8010
+    305.3500   1495.8606     33.4991     10.7800
+    305.9700   1495.8214     33.4991     10.7660
+    306.5800   1495.7820     33.4991     10.7520
+    307.2000   1495.7179     33.4991     10.7310
+    307.8200   1495.7141     33.4991     10.7270
+    308.4300   1495.6604     33.4991     10.7090
+    309.0500   1495.6034     33.4991     10.6900
+    309.6700   1495.5747     33.4991     10.6790
+    310.2800   1495.5529     33.4991     10.6700
+    310.9000   1495.5383     33.4991     10.6630
+    311.5200   1495.5061     33.4991     10.6510
+    312.1300   1495.4558     33.4991     10.6340
+    312.7500   1495.4022     33.4991     10.6160
+    313.3700   1495.3663     33.4991     10.6030
+    313.9800   1495.3729     33.4991     10.6020
+    314.6000   1495.3584     33.4991     10.5950
+    315.2200   1495.3510     33.4991     10.5900
+    315.8300   1495.3752     33.4991     10.5940
+    316.4500   1495.3892     33.4991     10.5950
+    317.0600   1495.3887     33.4991     10.5920
+    317.6800   1495.3989     33.4991     10.5920
+    318.3000   1495.4093     33.4991     10.5920
+    318.9100   1495.4124     33.4991     10.5900
+    319.5300   1495.4226     33.4991     10.5900
+    320.1400   1495.4186     33.4991     10.5860
+    320.7600   1495.4218     33.4991     10.5840
+    321.3800   1495.4357     33.4991     10.5850
+    321.9900   1495.4138     33.4991     10.5760
+    322.6100   1495.3850     33.4991     10.5650
+    323.2200   1495.3738     33.4991     10.5590
+    323.8400   1495.3734     33.4991     10.5560
+    324.4600   1495.3766     33.4991     10.5540
+    325.0700   1495.3262     33.4991     10.5370
+    325.6900   1495.2795     33.4991     10.5210
+    326.3000   1495.2577     33.4991     10.5120
+    326.9200   1495.2358     33.4991     10.5030
+    327.5300   1495.2211     33.4991     10.4960
+    328.1500   1495.2172     33.4991     10.4920
+    328.7600   1495.2095     33.4991     10.4870
+    329.3800   1495.2234     33.4991     10.4880
+    329.9900   1495.2228     33.4991     10.4850
+    330.6100   1495.2367     33.4991     10.4860
+    331.2300   1495.2220     33.4991     10.4790
+    331.8400   1495.2036     33.4991     10.4710
+    332.4600   1495.2069     33.4991     10.4690
+    333.0700   1495.1956     33.4991     10.4630
+    333.6900   1495.1987     33.4991     10.4610
+    334.3000   1495.1840     33.4991     10.4540
+    334.9200   1495.1801     33.4991     10.4500
+    335.5300   1495.1759     33.4991     10.4460
+    336.1500   1495.1147     33.4991     10.4260
+    336.7600   1495.0571     33.4991     10.4070
+    337.3800   1495.0138     33.4991     10.3920
+    337.9900   1494.9703     33.4991     10.3770
+    338.6100   1494.8840     33.4991     10.3500
+    339.2200   1494.8441     33.4991     10.3360
+    339.8400   1494.8115     33.4991     10.3240
+    340.4500   1494.8002     33.4991     10.3180
+    341.0700   1494.7532     33.4991     10.3020
+    341.6800   1494.6559     33.4991     10.2720
+    342.3000   1494.5155     33.4991     10.2300
+    342.9100   1494.4144     33.4991     10.1990
+    343.5200   1494.3778     33.4991     10.1860
+    344.1400   1494.3594     33.4991     10.1780
+    344.7500   1494.3516     33.4991     10.1730
+    345.3700   1494.3547     33.4991     10.1710
+    345.9800   1494.3469     33.4991     10.1660
+    346.6000   1494.3141     33.4991     10.1540
+    347.2100   1494.3207     33.4991     10.1530
+    347.8300   1494.3346     33.4991     10.1540
+    348.4400   1494.3375     33.4991     10.1520
+    349.0500   1494.3405     33.4991     10.1500
+    349.6700   1494.3256     33.4991     10.1430
+    350.2800   1494.2675     33.4991     10.1240
+    350.9000   1494.1373     33.4991     10.0850
+    351.5100   1494.0070     33.4991     10.0460
+    352.1300   1493.9668     33.4991     10.0320
+    352.7400   1493.9481     33.4991     10.0240
+    353.3500   1493.9402     33.4991     10.0190
+    353.9700   1493.9325     33.4991     10.0140
+    354.5800   1493.9030     33.4991     10.0030
+    355.1900   1493.9022     33.4991     10.0000
+    355.8100   1493.9089     33.4991      9.9990
+    356.4200   1493.9083     33.4991      9.9960
+    357.0400   1493.9114     33.4991      9.9940
+    357.6500   1493.9178     33.4991      9.9930
+    358.2600   1493.9316     33.4991      9.9940
+    358.8800   1493.9131     33.4991      9.9860
+    359.4900   1493.9125     33.4991      9.9830
+    360.1000   1493.9479     33.4991      9.9900
+    360.7200   1494.0051     33.4991     10.0030
+    361.3300   1494.0188     33.4991     10.0040
+    361.9500   1494.0327     33.4991     10.0050
+    362.5600   1494.0826     33.4991     10.0160
+    363.1700   1494.0494     33.4991     10.0040
+    363.7900   1493.9948     33.4991      9.9860
+    364.4000   1493.9724     33.4991      9.9770
+    365.0100   1493.9320     33.4991      9.9630
+    365.6300   1493.8882     33.4991      9.9480
+    366.2400   1493.8477     33.4991      9.9340
+    366.8500   1493.8362     33.4991      9.9280
+    367.4700   1493.8103     33.4991      9.9180
+    368.0800   1493.7770     33.4991      9.9060
+    368.6900   1493.7510     33.4991      9.8960
+    369.3000   1493.7213     33.4991      9.8850
+    369.9200   1493.7208     33.4991      9.8820
+    370.5300   1493.7056     33.4991      9.8750
+    371.1400   1493.7122     33.4991      9.8740
+    371.7600   1493.7007     33.4991      9.8680
+    372.3700   1493.6891     33.4991      9.8620
+    372.9800   1493.7029     33.4991      9.8630
+    373.6000   1493.6987     33.4991      9.8590
+    374.2100   1493.7125     33.4991      9.8600
+    374.8200   1493.7335     33.4991      9.8630
+    375.4300   1493.7473     33.4991      9.8640
+    376.0500   1493.7540     33.4991      9.8630
+    376.6600   1493.7642     33.4991      9.8630
+    377.2700   1493.7562     33.4991      9.8580
+    377.8800   1493.7809     33.4991      9.8620
+    378.5000   1493.8346     33.4991      9.8740
+    379.1100   1493.8629     33.4991      9.8790
+    379.7200   1493.8839     33.4991      9.8820
+    380.3300   1493.9302     33.4991      9.8920
+    380.9500   1493.9369     33.4991      9.8910
+    381.5600   1493.9471     33.4991      9.8910
+    382.1700   1493.9210     33.4991      9.8810
+    382.7800   1493.9240     33.4991      9.8790
+    383.4000   1493.9559     33.4991      9.8850
+    384.0100   1493.9480     33.4991      9.8800
+    384.6200   1493.9329     33.4991      9.8730
+    385.2300   1493.9321     33.4991      9.8700
+    385.8400   1493.9170     33.4991      9.8630
+    386.4600   1493.8875     33.4991      9.8520
+    387.0700   1493.8541     33.4991      9.8400
+    387.6800   1493.8135     33.4991      9.8260
+    388.2900   1493.7946     33.4991      9.8180
+    388.9000   1493.7758     33.4991      9.8100
+    389.5200   1493.7606     33.4991      9.8030
+    390.1300   1493.7527     33.4991      9.7980
+    390.7400   1493.7483     33.4991      9.7940
+    391.3500   1493.7512     33.4991      9.7920
+    391.9600   1493.7251     33.4991      9.7820
+    392.5700   1493.6917     33.4991      9.7700
+    393.1900   1493.6730     33.4991      9.7620
+    393.8000   1493.6794     33.4991      9.7610
+    394.4100   1493.6787     33.4991      9.7580
+    395.0200   1493.6853     33.4991      9.7570
+    395.6300   1493.6664     33.4991      9.7490
+    396.2400   1493.6982     33.4991      9.7550
+    396.8600   1493.7050     33.4991      9.7540
+    397.4700   1493.7188     33.4991      9.7550
+    398.0800   1493.7144     33.4991      9.7510
+    398.6900   1493.7064     33.4991      9.7460
+    399.3000   1493.7129     33.4991      9.7450
+    399.9100   1493.7122     33.4991      9.7420
+    400.5200   1493.7151     33.4991      9.7400
+    401.1300   1493.6852     33.4991      9.7290
+    401.7500   1493.6810     33.4991      9.7250
+    402.3600   1493.6366     33.4991      9.7100
+    402.9700   1493.6213     33.4991      9.7030
+    403.5800   1493.6133     33.4991      9.6980
+    404.1900   1493.6344     33.4991      9.7010
+    404.8000   1493.6554     33.4991      9.7040
+    405.4100   1493.6473     33.4991      9.6990
+    406.0200   1493.6648     33.4991      9.7010
+    406.6300   1493.6567     33.4991      9.6960
+    407.2400   1493.6451     33.4991      9.6900
+    407.8500   1493.6407     33.4991      9.6860
+    408.4700   1493.6365     33.4991      9.6820
+    409.0800   1493.6176     33.4991      9.6740
+    409.6900   1493.5985     33.4991      9.6660
+    410.3000   1493.5833     33.4991      9.6590
+    410.9100   1493.5533     33.4991      9.6480
+    411.5200   1493.5562     33.4991      9.6460
+    412.1300   1493.5699     33.4991      9.6470
+    412.7400   1493.5765     33.4991      9.6460
+    413.3500   1493.5903     33.4991      9.6470
+    413.9600   1493.6332     33.4991      9.6560
+    414.5700   1493.6361     33.4991      9.6540
+    415.1800   1493.6389     33.4991      9.6520
+    415.7900   1493.6490     33.4991      9.6520
+    416.4000   1493.6375     33.4991      9.6460
+    417.0100   1493.6329     33.4991      9.6420
+    417.6200   1493.5922     33.4991      9.6280
+    418.2300   1493.5986     33.4991      9.6270
+    418.8400   1493.5942     33.4991      9.6230
+    419.4500   1493.6007     33.4991      9.6220
+    420.0600   1493.5671     33.4991      9.6100
+    420.6700   1493.5956     33.4991      9.6150
+    421.2800   1493.6094     33.4991      9.6160
+    421.8900   1493.6195     33.4991      9.6160
+    422.5000   1493.6115     33.4991      9.6110
+    423.1100   1493.6106     33.4991      9.6080
+    423.7200   1493.6317     33.4991      9.6110
+    424.3300   1493.6382     33.4991      9.6100
+    424.9400   1493.6411     33.4991      9.6080
+    425.5500   1493.6512     33.4991      9.6080
+    426.1600   1493.6542     33.4991      9.6060
+    426.7700   1493.6533     33.4991      9.6030
+    427.3800   1493.6781     33.4991      9.6070
+    427.9900   1493.6846     33.4991      9.6060
+    428.6000   1493.6583     33.4991      9.5960
+    429.2100   1493.6648     33.4991      9.5950
+    429.8200   1493.6348     33.4991      9.5840
+    430.4300   1493.6194     33.4991      9.5770
+    431.0400   1493.6040     33.4991      9.5700
+    431.6500   1493.5266     33.4991      9.5460
+    432.2600   1493.4966     33.4991      9.5350
+    432.8700   1493.4629     33.4991      9.5230
+    433.4700   1493.4473     33.4991      9.5160
+    434.0800   1493.4539     33.4991      9.5150
+    434.6900   1493.4677     33.4991      9.5160
+    435.3000   1493.4521     33.4991      9.5090
+    435.9100   1493.4733     33.4991      9.5120
+    436.5200   1493.4506     33.4991      9.5030
+    437.1300   1493.4059     33.4991      9.4880
+    437.7400   1493.3795     33.4991      9.4780
+    438.3500   1493.3787     33.4991      9.4750
+    438.9600   1493.3668     33.4991      9.4690
+    439.5600   1493.3768     33.4991      9.4690
+    440.1700   1493.3833     33.4991      9.4680
+    440.7800   1493.3861     33.4991      9.4660
+    441.3900   1493.3707     33.4991      9.4590
+    442.0000   1493.3845     33.4991      9.4600
+    442.6100   1493.3727     33.4991      9.4540
+    443.2200   1493.3866     33.4991      9.4550
+    443.8300   1493.3931     33.4991      9.4540
+    444.4300   1493.3958     33.4991      9.4520
+    445.0400   1493.3546     33.4991      9.4380
+    445.6500   1493.3721     33.4991      9.4400
+    446.2600   1493.3676     33.4991      9.4360
+    446.8700   1493.3668     33.4991      9.4330
+    447.4800   1493.3660     33.4991      9.4300
+    448.0900   1493.3505     33.4991      9.4230
+    448.6900   1493.3458     33.4991      9.4190
+    449.3000   1493.3303     33.4991      9.4120
+    449.9100   1493.2892     33.4991      9.3980
+    450.5200   1493.2737     33.4991      9.3910
+    451.1300   1493.2838     33.4991      9.3910
+    451.7300   1493.2792     33.4991      9.3870
+    452.3400   1493.2966     33.4991      9.3890
+    452.9500   1493.2885     33.4991      9.3840
+    453.5600   1493.2766     33.4991      9.3780
+    454.1700   1493.2831     33.4991      9.3770
+    454.7800   1493.2529     33.4991      9.3660
+    455.3800   1493.2408     33.4991      9.3600
+    455.9900   1493.2474     33.4991      9.3590
+    456.6000   1493.2391     33.4991      9.3540
+    457.2100   1493.2126     33.4991      9.3440
+    457.8100   1493.2336     33.4991      9.3470
+    458.4200   1493.2181     33.4991      9.3400
+    459.0300   1493.2063     33.4991      9.3340
+    459.6400   1493.2274     33.4991      9.3370
+    460.2500   1493.2156     33.4991      9.3310
+    460.8500   1493.1998     33.4991      9.3240
+    461.4600   1493.1953     33.4991      9.3200
+    462.0700   1493.2239     33.4991      9.3250
+    462.6800   1493.2156     33.4991      9.3200
+    463.2800   1493.2329     33.4991      9.3220
+    463.8900   1493.2321     33.4991      9.3190
+    464.5000   1493.2349     33.4991      9.3170
+    465.1100   1493.2340     33.4991      9.3140
+    465.7100   1493.2404     33.4991      9.3130
+    466.3200   1493.2395     33.4991      9.3100
+    466.9300   1493.2533     33.4991      9.3110
+    467.5300   1493.2377     33.4991      9.3040
+    468.1400   1493.2367     33.4991      9.3010
+    468.7500   1493.2358     33.4991      9.2980
+    469.3600   1493.2534     33.4991      9.3000
+    469.9600   1493.2487     33.4991      9.2960
+    470.5700   1493.2551     33.4991      9.2950
+    471.1800   1493.2690     33.4991      9.2960
+    471.7800   1493.2864     33.4991      9.2980
+    472.3900   1493.2928     33.4991      9.2970
+    473.0000   1493.3066     33.4991      9.2980
+    473.6000   1493.2983     33.4991      9.2930
+    474.2100   1493.3231     33.4991      9.2970
+    474.8200   1493.3113     33.4991      9.2910
+    475.4200   1493.2771     33.4991      9.2790
+    476.0300   1493.2836     33.4991      9.2780
+    476.6400   1493.2864     33.4991      9.2760
+    477.2400   1493.2743     33.4991      9.2700
+    477.8500   1493.2515     33.4991      9.2610
+    478.4600   1493.2910     33.4991      9.2690
+    479.0600   1493.2826     33.4991      9.2640
+    479.6700   1493.2891     33.4991      9.2630
+    480.2800   1493.2772     33.4991      9.2570
+    480.8800   1493.2504     33.4991      9.2470
+    481.4900   1493.2311     33.4991      9.2390
+    482.1000   1493.2118     33.4991      9.2310
+    482.7000   1493.2181     33.4991      9.2300
+    483.3100   1493.1914     33.4991      9.2200
+    483.9200   1493.1980     33.4991      9.2190
+    484.5200   1493.1821     33.4991      9.2120
+    485.1300   1493.2034     33.4991      9.2150
+    485.7300   1493.1986     33.4991      9.2110
+    486.3400   1493.1941     33.4991      9.2070
+    486.9500   1493.1858     33.4991      9.2020
+    487.5500   1493.2031     33.4991      9.2040
+    488.1600   1493.2244     33.4991      9.2070
+    488.7600   1493.2048     33.4991      9.1990
+    489.3700   1493.1855     33.4991      9.1910
+    489.9800   1493.1663     33.4991      9.1830
+    490.5800   1493.1688     33.4991      9.1810
+    491.1900   1493.1606     33.4991      9.1760
+    491.7900   1493.1448     33.4991      9.1690
+    492.4000   1493.1660     33.4991      9.1720
+    493.0000   1493.1576     33.4991      9.1670
+    493.6100   1493.1382     33.4991      9.1590
+    494.2200   1493.1116     33.4991      9.1490
+    494.8200   1493.1030     33.4991      9.1440
+    495.4300   1493.0837     33.4991      9.1360
+    496.0300   1493.0826     33.4991      9.1330
+    496.6400   1493.0670     33.4991      9.1260
+    497.2400   1493.0659     33.4991      9.1230
+    497.8500   1493.0834     33.4991      9.1250
+    498.4500   1493.1008     33.4991      9.1270
+    499.0600   1493.0814     33.4991      9.1190
+    499.6600   1493.0989     33.4991      9.1210
+    500.2700   1493.0979     33.4991      9.1180
+    500.8700   1493.0820     33.4991      9.1110
+    501.4800   1493.0848     33.4991      9.1090
+    502.0800   1493.1022     33.4991      9.1110
+    502.6900   1493.0939     33.4991      9.1060
+    503.3000   1493.0856     33.4991      9.1010
+    503.9000   1493.0697     33.4991      9.0940
+    504.5100   1493.0577     33.4991      9.0880
+    505.1100   1493.0677     33.4991      9.0880
+    505.7200   1493.0483     33.4991      9.0800
+    506.3200   1493.0066     33.4991      9.0660
+    506.9200   1492.9871     33.4991      9.0580
+    507.5300   1492.9861     33.4991      9.0550
+    508.1300   1493.0183     33.4991      9.0610
+    508.7400   1493.0100     33.4991      9.0560
+    509.3400   1493.0199     33.4991      9.0560
+    509.9500   1493.0522     33.4991      9.0620
+    510.5500   1493.0327     33.4991      9.0540
+    511.1600   1493.0317     33.4991      9.0510
+    511.7600   1493.0529     33.4991      9.0540
+    512.3700   1493.0519     33.4991      9.0510
+    512.9700   1493.0730     33.4991      9.0540
+    513.5800   1493.0425     33.4991      9.0430
+    514.1800   1493.0414     33.4991      9.0400
+    514.7800   1493.0441     33.4991      9.0380
+    515.3900   1493.0468     33.4991      9.0360
+    515.9900   1493.0457     33.4991      9.0330
+    516.6000   1493.0447     33.4991      9.0300
+    517.2000   1493.0325     33.4991      9.0240
+    517.8100   1493.0427     33.4991      9.0240
+    518.4100   1493.0601     33.4991      9.0260
+    519.0100   1493.0367     33.4991      9.0170
+    519.6200   1493.0248     33.4991      9.0110
+    520.2200   1493.0496     33.4991      9.0150
+    520.8300   1493.0597     33.4991      9.0150
+    521.4300   1493.0253     33.4991      9.0030
+    522.0300   1493.0094     33.4991      8.9960
+    522.6400   1493.0048     33.4991      8.9920
+    523.2400   1492.9851     33.4991      8.9840
+    523.8500   1492.9211     33.4991      8.9640
+    524.4500   1492.9163     33.4991      8.9600
+    525.0500   1492.9004     33.4991      8.9530
+    525.6600   1492.8734     33.4991      8.9430
+    526.2600   1492.8760     33.4991      8.9410
+    526.8600   1492.8119     33.4991      8.9210
+    527.4700   1492.7811     33.4991      8.9100
+    528.0700   1492.7540     33.4991      8.9000
+    528.6700   1492.7269     33.4991      8.8900
+    529.2800   1492.7223     33.4991      8.8860
+    529.8800   1492.7136     33.4991      8.8810
+    530.4900   1492.7350     33.4991      8.8840
+    531.0900   1492.7152     33.4991      8.8760
+    531.6900   1492.7290     33.4991      8.8770
+    532.3000   1492.7095     33.4991      8.8690
+    532.9000   1492.7231     33.4991      8.8700
+    533.5000   1492.7108     33.4991      8.8640
+    534.1100   1492.7247     33.4991      8.8650
+    534.7100   1492.7162     33.4991      8.8600
+    535.3100   1492.7113     33.4991      8.8560
+    535.9100   1492.7101     33.4991      8.8530
+    536.5200   1492.7203     33.4991      8.8530
+    537.1200   1492.7229     33.4991      8.8510
+    537.7200   1492.7106     33.4991      8.8450
+    538.3300   1492.6798     33.4991      8.8340
+    538.9300   1492.6415     33.4991      8.8210
+    539.5300   1492.6106     33.4991      8.8100
+    540.1400   1492.5798     33.4991      8.7990
+    540.7400   1492.5601     33.4991      8.7910
+    541.3400   1492.5812     33.4991      8.7940
+    541.9400   1492.5652     33.4991      8.7870
+    542.5500   1492.5753     33.4991      8.7870
+    543.1500   1492.5779     33.4991      8.7850
+    543.7500   1492.5730     33.4991      8.7810
+    544.3500   1492.5792     33.4991      8.7800
+    544.9600   1492.5670     33.4991      8.7740
+    545.5600   1492.5734     33.4991      8.7730
+    546.1600   1492.5647     33.4991      8.7680
+    546.7600   1492.5673     33.4991      8.7660
+    547.3700   1492.5699     33.4991      8.7640
+    547.9700   1492.5874     33.4991      8.7660
+    548.5700   1492.5900     33.4991      8.7640
+    549.1700   1492.5851     33.4991      8.7600
+    549.7800   1492.5990     33.4991      8.7610
+    550.3800   1492.5978     33.4991      8.7580
+    550.9800   1492.5891     33.4991      8.7530
+    551.5800   1492.5955     33.4991      8.7520
+    552.1800   1492.5942     33.4991      8.7490
+    552.7900   1492.5671     33.4991      8.7390
+    553.3900   1492.5659     33.4991      8.7360
+    553.9900   1492.5685     33.4991      8.7340
+    554.5900   1492.5598     33.4991      8.7290
+    555.1900   1492.5923     33.4991      8.7350
+    555.8000   1492.5801     33.4991      8.7290
+    556.4000   1492.5527     33.4991      8.7190
+    557.0000   1492.5255     33.4991      8.7090
+    557.6000   1492.5317     33.4991      8.7080
+    558.2000   1492.5343     33.4991      8.7060
+    558.8100   1492.5221     33.4991      8.7000
+    559.4100   1492.5321     33.4991      8.7000
+    560.0100   1492.5309     33.4991      8.6970
+    560.6100   1492.5259     33.4991      8.6930
+    561.2100   1492.5023     33.4991      8.6840
+    561.8100   1492.5198     33.4991      8.6860
+    562.4100   1492.5223     33.4991      8.6840
+    563.0200   1492.5363     33.4991      8.6850
+    563.6200   1492.5350     33.4991      8.6820
+    564.2200   1492.5302     33.4991      8.6780
+    564.8200   1492.5438     33.4991      8.6790
+    565.4200   1492.5725     33.4991      8.6840
+    566.0200   1492.5452     33.4991      8.6740
+    566.6200   1492.5626     33.4991      8.6760
+    567.2300   1492.5803     33.4991      8.6780
+    567.8300   1492.5791     33.4991      8.6750
+    568.4300   1492.5779     33.4991      8.6720
+    569.0300   1492.5879     33.4991      8.6720
+    569.6300   1492.5830     33.4991      8.6680
+    570.2300   1492.5892     33.4991      8.6670
+    570.8300   1492.6030     33.4991      8.6680
+    571.4300   1492.6428     33.4991      8.6760
+    572.0300   1492.5931     33.4991      8.6600
+    572.6300   1492.5582     33.4991      8.6480
+    573.2400   1492.5535     33.4991      8.6440
+    573.8400   1492.5522     33.4991      8.6410
+    574.4400   1492.5287     33.4991      8.6320
+    575.0400   1492.5311     33.4991      8.6300
+    575.6400   1492.5150     33.4991      8.6230
+    576.2400   1492.5138     33.4991      8.6200
+    576.8400   1492.4977     33.4991      8.6130
+    577.4400   1492.5151     33.4991      8.6150
+    578.0400   1492.5326     33.4991      8.6170
+    578.6400   1492.5500     33.4991      8.6190
+    579.2400   1492.5339     33.4991      8.6120
+    579.8400   1492.5552     33.4991      8.6150
+    580.4400   1492.5726     33.4991      8.6170
+    581.0400   1492.5714     33.4991      8.6140
+    581.6400   1492.5889     33.4991      8.6160
+    582.2400   1492.6027     33.4991      8.6170
+    582.8400   1492.6014     33.4991      8.6140
+    583.4400   1492.6002     33.4991      8.6110
+    584.0400   1492.5691     33.4991      8.6000
+    584.6400   1492.5865     33.4991      8.6020
+    585.2400   1492.5667     33.4991      8.5940
+    585.8400   1492.4943     33.4991      8.5720
+    586.4400   1492.3994     33.4991      8.5440
+    587.0400   1492.3008     33.4991      8.5150
+    587.6400   1492.2208     33.4991      8.4910
+    588.2400   1492.1970     33.4991      8.4820
+    588.8400   1492.1920     33.4991      8.4780
+    589.4400   1492.1984     33.4991      8.4770
+    590.0400   1492.1783     33.4991      8.4690
+    590.6400   1492.1658     33.4991      8.4630
+    591.2400   1492.1007     33.4991      8.4430
+    591.8400   1492.0845     33.4991      8.4360
+    592.4400   1492.0719     33.4991      8.4300
+    593.0400   1492.0894     33.4991      8.4320
+    593.6400   1492.1107     33.4991      8.4350
+    594.2400   1492.1056     33.4991      8.4310
+    594.8400   1492.1119     33.4991      8.4300
+    595.4400   1492.1219     33.4991      8.4300
+    596.0400   1492.1168     33.4991      8.4260
+    596.6400   1492.1082     33.4991      8.4210
+    597.2400   1492.1482     33.4991      8.4290
+    597.8400   1492.1206     33.4991      8.4190
+    598.4400   1492.1494     33.4991      8.4240
+    599.0400   1492.1744     33.4991      8.4280
+    599.6400   1492.1581     33.4991      8.4210
+    600.2400   1492.1268     33.4991      8.4100
+    600.8300   1492.1254     33.4991      8.4070
+    601.4300   1492.1166     33.4991      8.4020
+    602.0300   1492.0776     33.4991      8.3890
+    602.6300   1492.0614     33.4991      8.3820
+    603.2300   1492.0601     33.4991      8.3790
+    603.8300   1492.0475     33.4991      8.3730
+    604.4300   1492.0537     33.4991      8.3720
+    605.0300   1492.0637     33.4991      8.3720
+    605.6300   1492.0625     33.4991      8.3690
+    606.2300   1492.0575     33.4991      8.3650
+    606.8200   1492.0673     33.4991      8.3650
+    607.4200   1492.0698     33.4991      8.3630
+    608.0200   1492.0835     33.4991      8.3640
+    608.6200   1492.0709     33.4991      8.3580
+    609.2200   1492.0320     33.4991      8.3450
+    609.8200   1492.0232     33.4991      8.3400
+    610.4200   1492.0106     33.4991      8.3340
+    611.0100   1492.0129     33.4991      8.3320
+    611.6100   1491.9928     33.4991      8.3240
+    612.2100   1491.9539     33.4991      8.3110
+    612.8100   1491.9487     33.4991      8.3070
+    613.4100   1491.9587     33.4991      8.3070
+    614.0100   1491.9725     33.4991      8.3080
+    614.6100   1491.9751     33.4991      8.3060
+    615.2000   1491.9736     33.4991      8.3030
+    615.8000   1491.9873     33.4991      8.3040
+    616.4000   1492.0049     33.4991      8.3060
+    617.0000   1491.9999     33.4991      8.3020
+    617.6000   1492.0061     33.4991      8.3010
+    618.1900   1492.0272     33.4991      8.3040
+    618.7900   1492.0674     33.4991      8.3120
+    619.3900   1492.0623     33.4991      8.3080
+    619.9900   1492.0685     33.4991      8.3070
+    620.5900   1492.0748     33.4991      8.3060
+    621.1800   1492.0696     33.4991      8.3020
+    621.7800   1492.0607     33.4991      8.2970
+    622.3800   1492.0594     33.4991      8.2940
+    622.9800   1492.0280     33.4991      8.2830
+    623.5800   1492.0154     33.4991      8.2770
+    624.1700   1492.0441     33.4991      8.2820
+    624.7700   1492.0012     33.4991      8.2680
+    625.3700   1491.9659     33.4991      8.2560
+    625.9700   1491.9835     33.4991      8.2580
+    626.5600   1491.9707     33.4991      8.2520
+    627.1600   1491.9203     33.4991      8.2360
+    627.7600   1491.8738     33.4991      8.2210
+    628.3600   1491.8120     33.4991      8.2020
+    628.9500   1491.7991     33.4991      8.1960
+    629.5500   1491.7941     33.4991      8.1920
+    630.1500   1491.7889     33.4991      8.1880
+    630.7500   1491.7611     33.4991      8.1780
+    631.3400   1491.7218     33.4991      8.1650
+    631.9400   1491.6826     33.4991      8.1520
+    632.5400   1491.6926     33.4991      8.1520
+    633.1400   1491.6686     33.4991      8.1430
+    633.7300   1491.6785     33.4991      8.1430
+    634.3300   1491.6733     33.4991      8.1390
+    634.9300   1491.6720     33.4991      8.1360
+    635.5200   1491.6289     33.4991      8.1220
+    636.1200   1491.6237     33.4991      8.1180
+    636.7200   1491.6072     33.4991      8.1110
+    637.3100   1491.5830     33.4991      8.1020
+    637.9100   1491.5551     33.4991      8.0920
+    638.5100   1491.5575     33.4991      8.0900
+    639.1100   1491.4841     33.4991      8.0680
+    639.7000   1491.4675     33.4991      8.0610
+    640.3000   1491.4320     33.4991      8.0490
+    640.9000   1491.4078     33.4991      8.0400
+    641.4900   1491.3342     33.4991      8.0180
+    642.0900   1491.2834     33.4991      8.0020
+    642.6900   1491.2328     33.4991      7.9860
+    643.2800   1491.1970     33.4991      7.9740
+    643.8800   1491.1842     33.4991      7.9680
+    644.4800   1491.1600     33.4991      7.9590
+    645.0700   1491.1281     33.4991      7.9480
+    645.6700   1491.0886     33.4991      7.9350
+    646.2600   1491.0261     33.4991      7.9160
+    646.8600   1490.9486     33.4991      7.8930
+    647.4600   1490.9205     33.4991      7.8830
+    648.0500   1490.9266     33.4991      7.8820
+    648.6500   1490.8986     33.4991      7.8720
+    649.2500   1490.9124     33.4991      7.8730
+    649.8400   1490.9222     33.4991      7.8730
+    650.4400   1490.9246     33.4991      7.8710
+    651.0300   1490.8964     33.4991      7.8610
+    651.6300   1490.8644     33.4991      7.8500
+    652.2300   1490.8401     33.4991      7.8410
+    652.8200   1490.8195     33.4991      7.8330
+    653.4200   1490.8027     33.4991      7.8260
+    654.0100   1490.8011     33.4991      7.8230
+    654.6100   1490.7806     33.4991      7.8150
+    655.2100   1490.7601     33.4991      7.8070
+    655.8000   1490.7700     33.4991      7.8070
+    656.4000   1490.7648     33.4991      7.8030
+    656.9900   1490.7784     33.4991      7.8040
+    657.5900   1490.7845     33.4991      7.8030
+    658.1800   1490.7944     33.4991      7.8030
+    658.7800   1490.7854     33.4991      7.7980
+    659.3800   1490.7534     33.4991      7.7870
+    659.9700   1490.7174     33.4991      7.7750
+    660.5700   1490.6969     33.4991      7.7670
+    661.1600   1490.6418     33.4991      7.7500
+    661.7600   1490.5601     33.4991      7.7260
+    662.3500   1490.5126     33.4991      7.7110
+    662.9500   1490.4767     33.4991      7.6990
+    663.5400   1490.4520     33.4991      7.6900
+    664.1400   1490.4353     33.4991      7.6830
+    664.7300   1490.4106     33.4991      7.6740
+    665.3300   1490.3403     33.4991      7.6530
+    665.9300   1490.3312     33.4991      7.6480
+    666.5200   1490.3219     33.4991      7.6430
+    667.1200   1490.3319     33.4991      7.6430
+    667.7100   1490.3417     33.4991      7.6430
+    668.3100   1490.3479     33.4991      7.6420
+    668.9000   1490.3577     33.4991      7.6420
+    669.5000   1490.3831     33.4991      7.6460
+    670.0900   1490.4005     33.4991      7.6480
+    670.6900   1490.3990     33.4991      7.6450
+    671.2800   1490.4050     33.4991      7.6440
+    671.8800   1490.4189     33.4991      7.6450
+    672.4700   1490.4249     33.4991      7.6440
+    673.0600   1490.4271     33.4991      7.6420
+    673.6600   1490.4257     33.4991      7.6390
+    674.2500   1490.3818     33.4991      7.6250
+    674.8500   1490.3075     33.4991      7.6030
+    675.4400   1490.2560     33.4991      7.5870
+    676.0400   1490.2238     33.4991      7.5760
+    676.6300   1490.2145     33.4991      7.5710
+    677.2300   1490.1746     33.4991      7.5580
+    677.8200   1490.1191     33.4991      7.5410
+    678.4200   1490.0599     33.4991      7.5230
+    679.0100   1490.0006     33.4991      7.5050
+    679.6000   1489.9528     33.4991      7.4900
+    680.2000   1489.9089     33.4991      7.4760
+    680.7900   1489.8804     33.4991      7.4660
+    681.3900   1489.8364     33.4991      7.4520
+    681.9800   1489.8156     33.4991      7.4440
+    682.5800   1489.7986     33.4991      7.4370
+    683.1700   1489.7506     33.4991      7.4220
+    683.7600   1489.7412     33.4991      7.4170
+    684.3600   1489.7281     33.4991      7.4110
+    684.9500   1489.7302     33.4991      7.4090
+    685.5500   1489.6863     33.4991      7.3950
+    686.1400   1489.6885     33.4991      7.3930
+    686.7300   1489.6598     33.4991      7.3830
+    687.3300   1489.6428     33.4991      7.3760
+    687.9200   1489.6449     33.4991      7.3740
+    688.5200   1489.6318     33.4991      7.3680
+    689.1100   1489.5721     33.4991      7.3500
+    689.7000   1489.4739     33.4991      7.3220
+    690.3000   1489.4067     33.4991      7.3020
+    690.8900   1489.4436     33.4991      7.3090
+    691.4800   1489.4380     33.4991      7.3050
+    692.0800   1489.4403     33.4991      7.3030
+    692.6700   1489.4153     33.4991      7.2940
+    693.2600   1489.4368     33.4991      7.2970
+    693.8600   1489.4352     33.4991      7.2940
+    694.4500   1489.4412     33.4991      7.2930
+    695.0500   1489.4241     33.4991      7.2860
+    695.6400   1489.4147     33.4991      7.2810
+    696.2300   1489.3279     33.4991      7.2560
+    696.8300   1489.2721     33.4991      7.2390
+    697.4200   1489.2278     33.4991      7.2250
+    698.0100   1489.2299     33.4991      7.2230
+    698.6100   1489.2089     33.4991      7.2150
+    699.2000   1489.2188     33.4991      7.2150
+    699.7900   1489.2247     33.4991      7.2140
+    700.3800   1489.2384     33.4991      7.2150
+    700.9800   1489.2484     33.4991      7.2150
+    701.5700   1489.2389     33.4991      7.2100
+    702.1600   1489.2255     33.4991      7.2040
+    702.7600   1489.2627     33.4991      7.2110
+    703.3500   1489.2532     33.4991      7.2060
+    703.9400   1489.2552     33.4991      7.2040
+    704.5300   1489.2418     33.4991      7.1980
+    705.1300   1489.2286     33.4991      7.1920
+    705.7200   1489.1261     33.4991      7.1630
+    706.3100   1488.9769     33.4991      7.1220
+    706.9100   1488.8860     33.4991      7.0960
+    707.5000   1488.8569     33.4991      7.0860
+    708.0900   1488.8396     33.4991      7.0790
+    708.6800   1488.8223     33.4991      7.0720
+    709.2800   1488.7701     33.4991      7.0560
+    709.8700   1488.6982     33.4991      7.0350
+    710.4600   1488.5992     33.4991      7.0070
+    711.0500   1488.5311     33.4991      6.9870
+    711.6500   1488.4867     33.4991      6.9730
+    712.2400   1488.4810     33.4991      6.9690
+    712.8300   1488.4246     33.4991      6.9520
+    713.4200   1488.3915     33.4991      6.9410
+    714.0200   1488.3508     33.4991      6.9280
+    714.6100   1488.3099     33.4991      6.9150
+    715.2000   1488.2535     33.4991      6.8980
+    715.7900   1488.2205     33.4991      6.8870
+    716.3800   1488.1678     33.4991      6.8710
+    716.9800   1488.1075     33.4991      6.8530
+    717.5700   1488.0704     33.4991      6.8410
+    718.1600   1488.0413     33.4991      6.8310
+    718.7500   1488.0198     33.4991      6.8230
+    719.3400   1487.9436     33.4991      6.8010
+    719.9400   1487.8715     33.4991      6.7800
+    720.5300   1487.8383     33.4991      6.7690
+    721.1200   1487.8129     33.4991      6.7600
+    721.7100   1487.7756     33.4991      6.7480
+    722.3000   1487.7463     33.4991      6.7380
+    722.8900   1487.7131     33.4991      6.7270
+    723.4900   1487.7074     33.4991      6.7230
+    724.0800   1487.6937     33.4991      6.7170
+    724.6700   1487.6722     33.4991      6.7090
+    725.2600   1487.6782     33.4991      6.7080
+    725.8500   1487.6685     33.4991      6.7030
+    726.4400   1487.6390     33.4991      6.6930
+    727.0400   1487.6216     33.4991      6.6860
+    727.6300   1487.5923     33.4991      6.6760
+    728.2200   1487.5746     33.4991      6.6690
+    728.8100   1487.5334     33.4991      6.6560
+    729.4000   1487.5079     33.4991      6.6470
+    729.9900   1487.4392     33.4991      6.6270
+    730.5800   1487.3744     33.4991      6.6080
+    731.1700   1487.3489     33.4991      6.5990
+    731.7700   1487.3431     33.4991      6.5950
+    732.3600   1487.3098     33.4991      6.5840
+    732.9500   1487.2330     33.4991      6.5620
+    733.5400   1487.2075     33.4991      6.5530
+    734.1300   1487.1937     33.4991      6.5470
+    734.7200   1487.1879     33.4991      6.5430
+    735.3100   1487.1700     33.4991      6.5360
+    735.9000   1487.1327     33.4991      6.5240
+    736.4900   1487.1150     33.4991      6.5170
+    737.0800   1487.0657     33.4991      6.5020
+    737.6800   1487.0481     33.4991      6.4950
+    738.2700   1487.0343     33.4991      6.4890
+    738.8600   1487.0087     33.4991      6.4800
+    739.4500   1487.0186     33.4991      6.4800
+    740.0400   1487.0363     33.4991      6.4820
+    740.6300   1487.0225     33.4991      6.4760
+    741.2200   1487.0007     33.4991      6.4680
+    741.8100   1486.9910     33.4991      6.4630
+    742.4000   1486.9534     33.4991      6.4510
+    742.9900   1486.8961     33.4991      6.4340
+    743.5800   1486.8191     33.4991      6.4120
+    744.1700   1486.7737     33.4991      6.3980
+    744.7600   1486.7479     33.4991      6.3890
+    745.3500   1486.6985     33.4991      6.3740
+    745.9400   1486.6570     33.4991      6.3610
+    746.5300   1486.6312     33.4991      6.3520
+    747.1200   1486.5975     33.4991      6.3410
+    747.7100   1486.5718     33.4991      6.3320
+    748.3000   1486.5342     33.4991      6.3200
+    748.8900   1486.5044     33.4991      6.3100
+    749.4800   1486.4905     33.4991      6.3040
+    750.0700   1486.5004     33.4991      6.3040
+    750.6600   1486.4983     33.4991      6.3010
+    751.2500   1486.4923     33.4991      6.2970
+    751.8400   1486.4625     33.4991      6.2870
+    752.4300   1486.4288     33.4991      6.2760
+    753.0200   1486.3911     33.4991      6.2640
+    753.6100   1486.3335     33.4991      6.2470
+    754.2000   1486.2482     33.4991      6.2230
+    754.7900   1486.1310     33.4991      6.1910
+    755.3800   1486.0693     33.4991      6.1730
+    755.9700   1486.0792     33.4991      6.1730
+    756.5600   1486.0374     33.4991      6.1600
+    757.1500   1486.0074     33.4991      6.1500
+    757.7400   1485.9458     33.4991      6.1320
+    758.3300   1485.8840     33.4991      6.1140
+    758.9200   1485.8700     33.4991      6.1080
+    759.5100   1485.8679     33.4991      6.1050
+    760.1000   1485.8778     33.4991      6.1050
+    760.6900   1485.8757     33.4991      6.1020
+    761.2800   1485.8735     33.4991      6.0990
+    761.8700   1485.8516     33.4991      6.0910
+    762.4600   1485.8655     33.4991      6.0920
+    763.0500   1485.8594     33.4991      6.0880
+    763.6300   1485.8412     33.4991      6.0810
+    764.2200   1485.8231     33.4991      6.0740
+    764.8100   1485.7852     33.4991      6.0620
+    765.4000   1485.7194     33.4991      6.0430
+    765.9900   1485.7212     33.4991      6.0410
+    766.5800   1485.6992     33.4991      6.0330
+    767.1700   1485.6692     33.4991      6.0230
+    767.7600   1485.6232     33.4991      6.0090
+    768.3500   1485.5931     33.4991      5.9990
+    768.9400   1485.5710     33.4991      5.9910
+    769.5200   1485.5728     33.4991      5.9890
+    770.1100   1485.5586     33.4991      5.9830
+    770.7000   1485.5245     33.4991      5.9720
+    771.2900   1485.4945     33.4991      5.9620
+    771.8800   1485.5004     33.4991      5.9610
+    772.4700   1485.5103     33.4991      5.9610
+    773.0600   1485.4841     33.4991      5.9520
+    773.6400   1485.4658     33.4991      5.9450
+    774.2300   1485.4557     33.4991      5.9400
+    774.8200   1485.4456     33.4991      5.9350
+    775.4100   1485.4314     33.4991      5.9290
+    776.0000   1485.4573     33.4991      5.9330
+    776.5900   1485.4471     33.4991      5.9280
+    777.1800   1485.4210     33.4991      5.9190
+    777.7600   1485.3748     33.4991      5.9050
+    778.3500   1485.3646     33.4991      5.9000
+    778.9400   1485.3185     33.4991      5.8860
+    779.5300   1485.3082     33.4991      5.8810
+    780.1200   1485.2821     33.4991      5.8720
+    780.7000   1485.2758     33.4991      5.8680
+    781.2900   1485.2656     33.4991      5.8630
+    781.8800   1485.2434     33.4991      5.8550
+    782.4700   1485.2212     33.4991      5.8470
+    783.0600   1485.2271     33.4991      5.8460
+    783.6500   1485.2169     33.4991      5.8410
+    784.2300   1485.1665     33.4991      5.8260
+    784.8200   1485.1283     33.4991      5.8140
+    785.4100   1485.1542     33.4991      5.8180
+    786.0000   1485.1320     33.4991      5.8100
+    786.5800   1485.1296     33.4991      5.8070
+    787.1700   1485.1355     33.4991      5.8060
+    787.7600   1485.1373     33.4991      5.8040
+    788.3500   1485.1351     33.4991      5.8010
+    788.9400   1485.1370     33.4991      5.7990
+    789.5200   1485.1387     33.4991      5.7970
+    790.1100   1485.1405     33.4991      5.7950
+    790.7000   1485.1302     33.4991      5.7900
+    791.2900   1485.1200     33.4991      5.7850
+    791.8700   1485.0535     33.4991      5.7660
+    792.4600   1485.0072     33.4991      5.7520
+    793.0500   1484.9366     33.4991      5.7320
+    793.6300   1484.9143     33.4991      5.7240
+    794.2200   1484.8639     33.4991      5.7090
+    794.8100   1484.8254     33.4991      5.6970
+    795.4000   1484.7871     33.4991      5.6850
+    795.9800   1484.7526     33.4991      5.6740
+    796.5700   1484.7181     33.4991      5.6630
+    797.1600   1484.7240     33.4991      5.6620
+    797.7500   1484.7136     33.4991      5.6570
+    798.3300   1484.7355     33.4991      5.6600
+    798.9200   1484.7413     33.4991      5.6590
+    799.5100   1484.7430     33.4991      5.6570
+    800.0900   1484.7407     33.4991      5.6540
+    800.6800   1484.7426     33.4991      5.6520
+    801.2700   1484.7362     33.4991      5.6480
+    801.8500   1484.7218     33.4991      5.6420
+    802.4400   1484.6511     33.4991      5.6220
+    803.0300   1484.5321     33.4999      5.5900
+    803.6100   1484.4288     33.4991      5.5620
+    804.2000   1484.3903     33.4991      5.5500
+    804.7900   1484.3396     33.4991      5.5350
+    805.3700   1484.3170     33.4991      5.5270
+    805.9600   1484.3107     33.4991      5.5230
+    806.5500   1484.2964     33.4999      5.5170
+    807.1300   1484.2697     33.4991      5.5080
+    807.7200   1484.2552     33.4991      5.5020
+    808.3100   1484.2328     33.4991      5.4940
+    808.8900   1484.1576     33.4991      5.4730
+    809.4800   1484.1190     33.4991      5.4610
+    810.0700   1484.0803     33.4991      5.4490
+    810.6500   1484.0455     33.4991      5.4380
+    811.2400   1483.9785     33.4999      5.4190
+    811.8200   1483.9761     33.4999      5.4160
+    812.4100   1483.9738     33.4991      5.4130
+    813.0000   1483.9714     33.4991      5.4100
+    813.5800   1483.9568     33.4991      5.4040
+    814.1700   1483.9384     33.4991      5.3970
+    814.7500   1483.9642     33.4991      5.4010
+    815.3400   1483.9539     33.4991      5.3960
+    815.9300   1483.9395     33.4999      5.3900
+    816.5100   1483.9329     33.4991      5.3860
+    817.1000   1483.8942     33.4999      5.3740
+    817.6800   1483.8633     33.4991      5.3640
+    818.2700   1483.8367     33.4991      5.3550
+    818.8600   1483.8141     33.4991      5.3470
+    819.4400   1483.7670     33.4991      5.3330
+    820.0300   1483.7363     33.4999      5.3230
+    820.6100   1483.6973     33.4991      5.3110
+    821.2000   1483.6584     33.4991      5.2990
+    821.7800   1483.6356     33.4991      5.2910
+    822.3700   1483.5764     33.4991      5.2740
+    822.9600   1483.5376     33.4999      5.2620
+    823.5400   1483.5270     33.4999      5.2570
+    824.1300   1483.5327     33.4991      5.2560
+    824.7100   1483.5505     33.4991      5.2580
+    825.3000   1483.5645     33.4991      5.2590
+    825.8800   1483.5254     33.4991      5.2470
+    826.4700   1483.5190     33.4999      5.2430
+    827.0500   1483.4758     33.4991      5.2300
+    827.6400   1483.3962     33.4999      5.2080
+    828.2200   1483.3571     33.4999      5.1960
+    828.8100   1483.3344     33.4999      5.1880
+    829.3900   1483.2830     33.4999      5.1730
+    829.9800   1483.2561     33.4991      5.1640
+    830.5600   1483.2617     33.4991      5.1630
+    831.1500   1483.2512     33.4991      5.1580
+    831.7300   1483.2446     33.4991      5.1540
+    832.3200   1483.2219     33.4991      5.1460
+    832.9000   1483.1664     33.4991      5.1300
+    833.4900   1483.1273     33.4991      5.1180
+    834.0700   1483.0881     33.4999      5.1060
+    834.6600   1483.0571     33.4991      5.0960
+    835.2400   1483.0383     33.4999      5.0890
+    835.8300   1483.0195     33.4991      5.0820
+    836.4100   1483.0007     33.4999      5.0750
+    837.0000   1482.9370     33.4991      5.0570
+    837.5800   1482.9019     33.4999      5.0460
+    838.1700   1482.8872     33.4999      5.0400
+    838.7500   1482.9010     33.4999      5.0410
+    839.3300   1482.8821     33.4999      5.0340
+    839.9200   1482.8837     33.4991      5.0320
+    840.5000   1482.8607     33.4999      5.0240
+    841.0900   1482.8337     33.4991      5.0150
+    841.6700   1482.8026     33.4999      5.0050
+    842.2600   1482.7716     33.4999      4.9950
+    842.8400   1482.7485     33.4999      4.9870
+    843.4300   1482.7421     33.4999      4.9830
+    844.0100   1482.7559     33.4999      4.9840
+    844.5900   1482.7286     33.4991      4.9750
+    845.1800   1482.7140     33.4999      4.9690
+    845.7600   1482.6991     33.4999      4.9630
+    846.3500   1482.6926     33.4999      4.9590
+    846.9300   1482.6614     33.4999      4.9490
+    847.5100   1482.6383     33.4999      4.9410
+    848.1000   1482.5785     33.4999      4.9240
+    848.6800   1482.5513     33.4991      4.9150
+    849.2700   1482.5201     33.4991      4.9050
+    849.8500   1482.5052     33.4991      4.8990
+    850.4300   1482.5068     33.4999      4.8970
+    851.0200   1482.5084     33.4999      4.8950
+    851.6000   1482.5140     33.4999      4.8940
+    852.1800   1482.5155     33.4991      4.8920
+    852.7700   1482.5212     33.4991      4.8910
+    853.3500   1482.5269     33.4991      4.8900
+    853.9400   1482.5244     33.4991      4.8870
+    854.5200   1482.5424     33.4999      4.8890
+    855.1000   1482.5480     33.4999      4.8880
+    855.6900   1482.5250     33.4999      4.8800
+    856.2700   1482.5757     33.4991      4.8900
+    856.8500   1482.5690     33.4991      4.8860
+    857.4400   1482.5665     33.4991      4.8830
+    858.0200   1482.5803     33.4991      4.8840
+    858.6000   1482.5614     33.4999      4.8770
+    859.1900   1482.5712     33.4991      4.8770
+    859.7700   1482.5686     33.4999      4.8740
+    860.3500   1482.5577     33.4991      4.8690
+    860.9400   1482.5266     33.4999      4.8590
+    861.5200   1482.5076     33.4999      4.8520
+    862.1000   1482.4845     33.4999      4.8440
+    862.6800   1482.4941     33.4999      4.8440
+    863.2700   1482.4794     33.4999      4.8380
+    863.8500   1482.4890     33.4991      4.8380
+    864.4300   1482.5070     33.4999      4.8400
+    865.0200   1482.5045     33.4999      4.8370
+    865.6000   1482.5101     33.4999      4.8360
+    866.1800   1482.5157     33.4999      4.8350
+    866.7600   1482.5254     33.4999      4.8350
+    867.3500   1482.5353     33.4999      4.8350
+    867.9300   1482.5162     33.4999      4.8280
+    868.5100   1482.4972     33.4999      4.8210
+    869.1000   1482.4741     33.4991      4.8130
+    869.6800   1482.4304     33.4999      4.8000
+    870.2600   1482.3702     33.4999      4.7830
+    870.8400   1482.3429     33.4991      4.7740
+    871.4300   1482.3363     33.4991      4.7700
+    872.0100   1482.3173     33.4999      4.7630
+    872.5900   1482.3187     33.4999      4.7610
+    873.1700   1482.2997     33.4999      4.7540
+    873.7600   1482.2560     33.4999      4.7410
+    874.3400   1482.2328     33.4999      4.7330
+    874.9200   1482.2136     33.4999      4.7260
+    875.5000   1482.2316     33.4999      4.7280
+    876.0800   1482.2124     33.4991      4.7210
+    876.6700   1482.2183     33.4999      4.7200
+    877.2500   1482.2238     33.4999      4.7190
+    877.8300   1482.2006     33.4999      4.7110
+    878.4100   1482.2102     33.4999      4.7110
+    878.9900   1482.1747     33.4999      4.7000
+    879.5800   1482.1927     33.4999      4.7020
+    880.1600   1482.1859     33.4999      4.6980
+    880.7400   1482.1627     33.4999      4.6900
+    881.3200   1482.1271     33.4999      4.6790
+    881.9000   1482.1121     33.4999      4.6730
+    882.4900   1482.1301     33.4999      4.6750
+    883.0700   1482.1274     33.4999      4.6720
+    883.6500   1482.1001     33.4999      4.6630
+    884.2300   1482.1139     33.4999      4.6640
+    884.8100   1482.0906     33.4999      4.6560
+    885.3900   1482.1085     33.4999      4.6580
+    885.9800   1482.0936     33.4999      4.6520
+    886.5600   1482.1074     33.4991      4.6530
+    887.1400   1482.1130     33.4999      4.6520
+    887.7200   1482.1104     33.4999      4.6490
+    888.3000   1482.1077     33.4999      4.6460
+    888.8800   1482.0927     33.4999      4.6400
+    889.4700   1482.0778     33.4999      4.6340
+    890.0500   1482.0503     33.4999      4.6250
+    890.6300   1482.0022     33.4999      4.6110
+    891.2100   1481.9747     33.4999      4.6020
+    891.7900   1481.9597     33.4999      4.5960
+    892.3700   1481.9487     33.4999      4.5910
+    892.9500   1481.9294     33.4999      4.5840
+    893.5300   1481.8896     33.4999      4.5720
+    894.1100   1481.8745     33.4999      4.5660
+    894.7000   1481.8719     33.4999      4.5630
+    895.2800   1481.8528     33.4999      4.5560
+    895.8600   1481.8707     33.4999      4.5580
+    896.4400   1481.8514     33.4999      4.5510
+    897.0200   1481.8571     33.4999      4.5500
+    897.6000   1481.8461     33.4999      4.5450
+    898.1800   1481.8434     33.4999      4.5420
+    898.7600   1481.8324     33.4999      4.5370
+    899.3400   1481.7800     33.4999      4.5220
+    899.9200   1481.7815     33.4999      4.5200
+    900.5000   1481.7290     33.4999      4.5050
+    901.0800   1481.7139     33.4999      4.4990
+    901.6700   1481.6948     33.4999      4.4920
+    902.2500   1481.6838     33.4999      4.4870
+    902.8300   1481.6893     33.4999      4.4860
+    903.4100   1481.6411     33.4999      4.4720
+    903.9900   1481.6218     33.4999      4.4650
+    904.5700   1481.6107     33.4999      4.4600
+    905.1500   1481.6163     33.4999      4.4590
+    905.7300   1481.6467     33.4999      4.4640
+    906.3100   1481.6191     33.4999      4.4550
+    906.8900   1481.6289     33.4999      4.4550
+    907.4700   1481.6095     33.4999      4.4480
+    908.0500   1481.5944     33.4999      4.4420
+    908.6300   1481.5585     33.4999      4.4310
+    909.2100   1481.5557     33.4999      4.4280
+    909.7900   1481.5488     33.4999      4.4240
+    910.3700   1481.5626     33.4999      4.4250
+    910.9500   1481.5516     33.4999      4.4200
+    911.5300   1481.5573     33.4999      4.4190
+    912.1100   1481.5378     33.4999      4.4120
+    912.6900   1481.5310     33.4999      4.4080
+    913.2700   1481.5240     33.4999      4.4040
+    913.8500   1481.5131     33.4999      4.3990
+    914.4300   1481.5352     33.4999      4.4020
+    915.0100   1481.5532     33.4999      4.4040
+    915.5900   1481.5670     33.4999      4.4050
+    916.1700   1481.5768     33.4999      4.4050
+    916.7500   1481.5615     33.4999      4.3990
+    917.3300   1481.5962     33.4999      4.4050
+    917.9100   1481.5975     33.4999      4.4030
+    918.4900   1481.5699     33.4999      4.3940
+    919.0700   1481.5671     33.4999      4.3910
+    919.6500   1481.5603     33.4999      4.3870
+    920.2300   1481.5616     33.4999      4.3850
+    920.8000   1481.5670     33.4999      4.3840
+    921.3800   1481.5519     33.4999      4.3780
+    921.9600   1481.4951     33.4999      4.3620
+    922.5400   1481.4882     33.4999      4.3580
+    923.1200   1481.4521     33.4999      4.3470
+    923.7000   1481.4161     33.4999      4.3360
+    924.2800   1481.4052     33.4999      4.3310
+    924.8600   1481.4189     33.4999      4.3320
+    925.4400   1481.4204     33.4999      4.3300
+    926.0200   1481.4259     33.4999      4.3290
+    926.6000   1481.4314     33.4999      4.3280
+    927.1800   1481.4078     33.4999      4.3200
+    927.7500   1481.4133     33.4999      4.3190
+    928.3300   1481.4105     33.4999      4.3160
+    928.9100   1481.4160     33.4999      4.3150
+    929.4900   1481.3966     33.4999      4.3080
+    930.0700   1481.4147     33.4999      4.3100
+    930.6500   1481.4244     33.4999      4.3100
+    931.2300   1481.4008     33.4999      4.3020
+    931.8100   1481.4313     33.4999      4.3070
+    932.3900   1481.4244     33.4999      4.3030
+    932.9600   1481.4464     33.4999      4.3060
+    933.5400   1481.4436     33.4999      4.3030
+    934.1200   1481.4368     33.4999      4.2990
+    934.7000   1481.4257     33.4999      4.2940
+    935.2800   1481.4229     33.4999      4.2910
+    935.8600   1481.4200     33.4999      4.2880
+    936.4300   1481.4213     33.4999      4.2860
+    937.0100   1481.4310     33.4999      4.2860
+    937.5900   1481.4241     33.4999      4.2820
+    938.1700   1481.4130     33.4999      4.2770
+    938.7500   1481.4226     33.4999      4.2770
+    939.3300   1481.4115     33.4999      4.2720
+    939.9000   1481.4419     33.4999      4.2770
+    940.4800   1481.4434     33.4999      4.2750
+    941.0600   1481.4280     33.4999      4.2690
+    941.6400   1481.4127     33.4999      4.2630
+    942.2200   1481.4183     33.4999      4.2620
+    942.7900   1481.4111     33.4999      4.2580
+    943.3700   1481.3959     33.4999      4.2520
+    943.9500   1481.3806     33.4999      4.2460
+    944.5300   1481.4028     33.4999      4.2490
+    945.1100   1481.4209     33.4999      4.2510
+    945.6800   1481.4095     33.4999      4.2460
+    946.2600   1481.3860     33.4999      4.2380
+    946.8400   1481.3790     33.4999      4.2340
+    947.4200   1481.3553     33.4999      4.2260
+    948.0000   1481.3401     33.4999      4.2200
+    948.5700   1481.3079     33.4999      4.2100
+    949.1500   1481.2926     33.4999      4.2040
+    949.7300   1481.2731     33.4999      4.1970
+    950.3100   1481.2661     33.4999      4.1930
+    950.8800   1481.2465     33.4999      4.1860
+    951.4600   1481.2437     33.4999      4.1830
+    952.0400   1481.2241     33.4999      4.1760
+    952.6200   1481.2172     33.4999      4.1720
+    953.1900   1481.2184     33.4999      4.1700
+    953.7700   1481.1906     33.4999      4.1610
+    954.3500   1481.1919     33.4999      4.1590
+    954.9200   1481.1805     33.4999      4.1540
+    955.5000   1481.1736     33.4999      4.1500
+    956.0800   1481.1832     33.4999      4.1500
+    956.6600   1481.2222     33.4999      4.1570
+    957.2300   1481.2318     33.4999      4.1570
+    957.8100   1481.2247     33.4999      4.1530
+    958.3900   1481.2345     33.4999      4.1530
+    958.9600   1481.2440     33.4999      4.1530
+    959.5400   1481.2496     33.4999      4.1520
+    960.1200   1481.2468     33.4999      4.1490
+    960.7000   1481.2523     33.4999      4.1480
+    961.2700   1481.2660     33.4999      4.1490
+    961.8500   1481.2590     33.4999      4.1450
+    962.4300   1481.2228     33.4999      4.1340
+    963.0000   1481.2031     33.4999      4.1270
+    963.5800   1481.2170     33.4999      4.1280
+    964.1600   1481.1891     33.4999      4.1190
+    964.7300   1481.1527     33.4999      4.1080
+    965.3100   1481.1415     33.4999      4.1030
+    965.8900   1481.1344     33.4999      4.0990
+    966.4600   1481.1440     33.4999      4.0990
+    967.0400   1481.1830     33.4999      4.1060
+    967.6200   1481.1509     33.4999      4.0960
+    968.1900   1481.1688     33.4999      4.0980
+    968.7700   1481.1952     33.4999      4.1020
+    969.3400   1481.1881     33.4999      4.0980
+    969.9200   1481.1810     33.4999      4.0940
+    970.5000   1481.1824     33.4999      4.0920
+    971.0700   1481.1836     33.4999      4.0900
+    971.6500   1481.1682     33.4999      4.0840
+    972.2300   1481.1904     33.4999      4.0870
+    972.8000   1481.1665     33.4999      4.0790
+    973.3800   1481.1888     33.4999      4.0820
+    973.9500   1481.1942     33.4999      4.0810
+    974.5300   1481.2499     33.4999      4.0920
+    975.1100   1481.2596     33.4999      4.0920
+    975.6800   1481.2399     33.4999      4.0850
+    976.2600   1481.2831     33.4999      4.0930
+    976.8300   1481.3010     33.4999      4.0950
+    977.4100   1481.2898     33.4999      4.0900
+    977.9900   1481.2368     33.4999      4.0750
+    978.5600   1481.1877     33.4999      4.0610
+    979.1400   1481.1891     33.4999      4.0590
+    979.7100   1481.1149     33.4999      4.0390
+    980.2900   1481.1162     33.4999      4.0370
+    980.8600   1481.1300     33.4999      4.0380
+    981.4400   1481.1648     33.4999      4.0440
+    982.0100   1481.1324     33.4999      4.0340
+    982.5900   1481.1213     33.4999      4.0290
+    983.1700   1481.1184     33.4999      4.0260
+    983.7400   1481.1531     33.4999      4.0320
+    984.3200   1481.1335     33.4999      4.0250
+    984.8900   1481.1053     33.4999      4.0160
+    985.4700   1481.1234     33.4999      4.0180
+    986.0400   1481.0743     33.4999      4.0040
+    986.6200   1481.0924     33.4999      4.0060
+    987.1900   1481.0894     33.4999      4.0030
+    987.7700   1481.0488     33.4999      3.9910
+    988.3400   1481.0416     33.4999      3.9870
+    988.9200   1481.0010     33.4999      3.9750
+    989.4900   1481.0232     33.4999      3.9780
+    990.0700   1481.0287     33.4999      3.9770
+    990.6400   1481.0634     33.4999      3.9830
+    991.2200   1481.1276     33.4999      3.9960
+    991.7900   1481.2126     33.4999      4.0140
+    992.3700   1481.2097     33.4999      4.0110
+    992.9400   1481.1899     33.4999      4.0040
+    993.5200   1481.1200     33.4999      3.9850
+    994.0900   1481.0709     33.4999      3.9710
+    994.6700   1481.0848     33.4999      3.9720
+    995.2400   1481.1028     33.4999      3.9740
+    995.8200   1481.0873     33.4999      3.9680
+    996.3900   1481.1136     33.4999      3.9720
+    996.9700   1481.0981     33.4999      3.9660
+    997.5400   1481.0741     33.4999      3.9580
+    998.1200   1481.0923     33.4999      3.9600
+    998.6900   1481.0724     33.4999      3.9530
+    999.2600   1481.0400     33.4999      3.9430
+    999.8400   1481.0371     33.4999      3.9400
+   1000.4100   1481.0341     33.4999      3.9370
+   1000.9900   1481.0144     33.4999      3.9300
+   1001.5600   1481.0156     33.4999      3.9280
+   1002.1400   1481.0380     33.4999      3.9310
+   1002.7100   1481.0265     33.4999      3.9260
+   1003.2800   1481.0570     33.4999      3.9310
+   1003.8600   1481.0625     33.4999      3.9300
+   1004.4300   1481.0721     33.4999      3.9300
+   1005.0100   1481.0398     33.4999      3.9200
+   1005.5800   1481.0284     33.4999      3.9150
+   1006.1500   1481.0295     33.4999      3.9130
+   1006.7300   1481.0266     33.4999      3.9100
+   1007.3000   1481.0153     33.4999      3.9050
+   1007.8800   1481.0039     33.4999      3.9000
+   1008.4500   1481.0093     33.4999      3.8990
+   1009.0200   1481.0188     33.4999      3.8990
+   1009.6000   1481.0496     33.4999      3.9040
+   1010.1700   1481.0214     33.4999      3.8950
+   1010.7500   1481.0353     33.4999      3.8960
+   1011.3200   1481.0405     33.4999      3.8950
+   1011.8900   1481.0586     33.4999      3.8970
+   1012.4700   1481.0262     33.4999      3.8870
+   1013.0400   1481.0400     33.4999      3.8880
+   1013.6100   1481.0159     33.4999      3.8800
+   1014.1900   1481.0004     33.4999      3.8740
+   1014.7600   1481.0057     33.4999      3.8730
+   1015.3300   1480.9901     33.4999      3.8670
+   1015.9100   1480.9703     33.4999      3.8600
+   1016.4800   1480.9379     33.4999      3.8500
+   1017.0500   1480.9222     33.4999      3.8440
+   1017.6300   1480.9319     33.4999      3.8440
+   1018.2000   1480.9331     33.4999      3.8420
+   1018.7700   1480.9089     33.4999      3.8340
+   1019.3500   1480.9271     33.4999      3.8360
+   1019.9200   1480.9366     33.4999      3.8360
+   1020.4900   1480.9673     33.4999      3.8410
+   1021.0700   1480.9475     33.4999      3.8340
+   1021.6400   1480.9486     33.4999      3.8320
+   1022.2100   1480.9540     33.4999      3.8310
+   1022.7900   1480.9595     33.4999      3.8300
+   1023.3600   1480.9733     33.4999      3.8310
+   1023.9300   1480.9702     33.4999      3.8280
+   1024.5000   1480.9672     33.4999      3.8250
+   1025.0800   1480.9727     33.4999      3.8240
+   1025.6500   1481.0243     33.4999      3.8340
+   1026.2200   1480.9666     33.4999      3.8180
+   1026.7900   1480.9886     33.4999      3.8210
+   1027.3700   1480.9858     33.4999      3.8180
+   1027.9399   1480.9448     33.4999      3.8060
+   1028.5100   1480.9543     33.4999      3.8060
+   1029.0900   1480.9641     33.4999      3.8060
+   1029.6600   1480.9021     33.4999      3.7890
+   1030.2300   1480.9116     33.4999      3.7890
+   1030.8000   1480.9043     33.4999      3.7850
+   1031.3800   1480.9478     33.4999      3.7930
+   1031.9500   1480.9447     33.4999      3.7900
+   1032.5200   1480.9417     33.4999      3.7870
+   1033.0900   1480.9469     33.4999      3.7860
+   1033.6600   1480.9523     33.4999      3.7850
+   1034.2400   1480.9662     33.4999      3.7860
+   1034.8101   1480.9843     33.4999      3.7880
+   1035.3800   1481.0149     33.4999      3.7930
+   1035.9500   1480.9949     33.4999      3.7860
+   1036.5300   1481.0299     33.4999      3.7920
+   1037.1000   1480.9763     33.4999      3.7770
+   1037.6700   1480.9985     33.4999      3.7800
+   1038.2400   1480.9406     33.4999      3.7640
+   1038.8101   1480.9755     33.4999      3.7700
+   1039.3800   1480.9640     33.4999      3.7650
+   1039.9600   1480.9863     33.4999      3.7680
+   1040.5300   1481.0043     33.4999      3.7700
+   1041.1000   1480.9760     33.4999      3.7610
+   1041.6700   1481.0319     33.4999      3.7720
+   1042.2400   1481.0161     33.4999      3.7660
+   1042.8199   1480.9795     33.4999      3.7550
+   1043.3900   1480.9595     33.4999      3.7480
+   1043.9600   1480.9901     33.4999      3.7530
+   1044.5300   1480.9744     33.4999      3.7470
+   1045.1000   1480.9756     33.4999      3.7450
+   1045.6700   1480.9640     33.4999      3.7400
+   1046.2400   1480.9314     33.4999      3.7300
+   1046.8199   1480.9496     33.4999      3.7320
+   1047.3900   1480.9550     33.4999      3.7310
+   1047.9600   1480.9645     33.4999      3.7310
+   1048.5300   1480.9445     33.4999      3.7240
+   1049.1000   1480.9625     33.4999      3.7260
+   1049.6700   1480.9509     33.4999      3.7210
+   1050.2400   1480.9352     33.4999      3.7150
+   1050.8199   1480.9196     33.4999      3.7090
+   1051.3900   1480.9122     33.4999      3.7050
+   1051.9600   1480.9471     33.4999      3.7110
+   1052.5300   1480.9736     33.4999      3.7150
+   1053.1000   1480.9579     33.4999      3.7090
+   1053.6700   1480.9717     33.4999      3.7100
+   1054.2400   1480.9432     33.4999      3.7010
+   1054.8101   1480.9655     33.4999      3.7040
+   1055.3800   1480.9877     33.4999      3.7070
+   1055.9500   1480.9846     33.4999      3.7040
+   1056.5300   1480.9774     33.4999      3.7000
+   1057.1000   1480.9701     33.4999      3.6960
+   1057.6700   1480.9669     33.4999      3.6930
+   1058.2400   1480.9554     33.4999      3.6880
+   1058.8101   1480.9777     33.4999      3.6910
+   1059.3800   1480.9703     33.4999      3.6870
+   1059.9500   1480.9841     33.4999      3.6880
+   1060.5200   1480.9768     33.4999      3.6840
+   1061.0900   1480.9822     33.4999      3.6830
+   1061.6600   1481.0212     33.4999      3.6900
+   1062.2300   1481.0182     33.4999      3.6870
+   1062.8000   1481.0234     33.4999      3.6860
+   1063.3700   1481.0077     33.4999      3.6800
+   1063.9399   1481.0088     33.4999      3.6780
+   1064.5100   1481.0437     33.4999      3.6840
+   1065.0800   1481.0702     33.4999      3.6880
+   1065.6500   1481.0502     33.4999      3.6810
+   1066.2200   1481.0598     33.4999      3.6810
+   1066.7900   1481.0947     33.4999      3.6870
+   1067.3600   1481.1127     33.4999      3.6890
+   1067.9301   1481.1012     33.4999      3.6840
+   1068.5000   1481.1064     33.4999      3.6830
+   1069.0699   1481.1329     33.4999      3.6870
+   1069.6400   1481.1299     33.4999      3.6840
+   1070.2100   1481.1437     33.4999      3.6850
+   1070.7800   1481.0814     33.4999      3.6680
+   1071.3500   1481.1332     33.4999      3.6780
+   1071.9200   1481.1259     33.4999      3.6740
+   1072.4900   1481.1439     33.4999      3.6760
+   1073.0601   1481.1450     33.4999      3.6740
+   1073.6300   1481.1545     33.4999      3.6740
+   1074.2000   1481.1556     33.4999      3.6720
+   1074.7700   1481.1653     33.4999      3.6720
+   1075.3400   1481.1707     33.4999      3.6710
+   1075.9100   1481.1718     33.4999      3.6690
+   1076.4800   1481.1729     33.4999      3.6670
+   1077.0500   1481.1951     33.4999      3.6700
+   1077.6200   1481.1750     33.4999      3.6630
+   1078.1899   1481.1508     33.4999      3.6550
+   1078.7600   1481.1393     33.4999      3.6500
+   1079.3300   1481.1785     33.4999      3.6570
+   1079.9000   1481.2048     33.4999      3.6610
+   1080.4700   1481.1891     33.4999      3.6550
+   1081.0400   1481.1733     33.4999      3.6490
+   1081.6000   1481.1742     33.4999      3.6470
+   1082.1700   1481.1542     33.4999      3.6400
+   1082.7400   1481.1511     33.4999      3.6370
+   1083.3101   1481.1649     33.4999      3.6380
+   1083.8800   1481.1660     33.4999      3.6360
+   1084.4500   1481.1460     33.4999      3.6290
+   1085.0200   1481.1682     33.4999      3.6320
+   1085.5900   1481.1863     33.4999      3.6340
+   1086.1600   1481.1663     33.4999      3.6270
+   1086.7300   1481.1758     33.4999      3.6270
+   1087.2900   1481.1555     33.4999      3.6200
+   1087.8600   1481.1398     33.4999      3.6140
+   1088.4301   1481.1409     33.4999      3.6120
+   1089.0000   1481.1420     33.4999      3.6100
+   1089.5699   1481.1261     33.4999      3.6040
+   1090.1400   1481.1484     33.4999      3.6070
+   1090.7100   1481.1453     33.4999      3.6040
+   1091.2800   1481.1464     33.4999      3.6020
+   1091.8400   1481.1600     33.4999      3.6030
+   1092.4100   1481.1865     33.4999      3.6070
+   1092.9800   1481.1833     33.4999      3.6040
+   1093.5500   1481.1506     33.4999      3.5940
+   1094.1200   1481.1730     33.4999      3.5970
+   1094.6899   1481.2079     33.4999      3.6030
+   1095.2500   1481.2130     33.4999      3.6020
+   1095.8199   1481.1973     33.4999      3.5960
+   1096.3900   1481.1687     33.4999      3.5870
+   1096.9600   1481.1995     33.4999      3.5920
+   1097.5300   1481.2006     33.4999      3.5900
+   1098.1000   1481.1847     33.4999      3.5840
+   1098.6600   1481.2068     33.4999      3.5870
+   1099.2300   1481.1868     33.4999      3.5800
+   1099.8000   1481.2006     33.4999      3.5810
+   1100.3700   1481.2186     33.4999      3.5830
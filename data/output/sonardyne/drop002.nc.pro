@@ -0,0 +1,1835 @@
+test_read_store_and_write
+11/2/2016
+5:47:47
+Probe: XBT
+Source: /root/package/data/input/turo/drop002.nc
+      0.6300   1501.0449     33.4984     13.7920
+      1.2700   1500.6162     33.4984     13.6580
+      1.9000   1500.2418     33.4984     13.5410
+      2.5400   1500.0878     33.4984     13.4910
+      3.1700   1499.9993     33.4984     13.4610
+      3.8100   1499.9570     33.4984     13.4450
+      4.4400   1499.9510     33.4984     13.4400
+      5.0800   1499.9749     33.4984     13.4440
+      5.7100   1499.9985     33.4984     13.4480
+      6.3400   1499.9298     33.4984     13.4240
+      6.9800   1499.9636     33.4984     13.4310
+      7.6100   1500.0369     33.4984     13.4500
+      8.2500   1500.0442     33.4984     13.4490
+      8.8800   1500.0580     33.4984     13.4500
+      9.5100   1500.0784     33.4984     13.4530
+     10.1500   1500.1221     33.4984     13.4630
+     10.7800   1500.1326     33.4984     13.4630
+     11.4200   1500.1399     33.4984     13.4620
+     12.0500   1500.1174     33.4984     13.4520
+     12.6800   1500.1212     33.4984     13.4500
+     13.3200   1500.1320     33.4984     13.4500
+     13.9500   1500.1259     33.4984     13.4450
+     14.5900   1500.1366     33.4984     13.4450
+     15.2200   1500.1272     33.4984     13.4390
+     15.8500   1500.1410     33.4984     13.4400
+     16.4900   1500.1318     33.4984     13.4340
+     17.1200   1500.0961     33.4984     13.4200
+     17.7500   1500.0868     33.4984     13.4140
+     18.3900   1500.0643     33.4984     13.4040
+     19.0200   1500.0682     33.4984     13.4020
+     19.6600   1500.0889     33.4984     13.4050
+     20.2900   1500.0596     33.4984     13.3930
+     20.9200   1500.1165     33.4984     13.4070
+     21.5600   1500.1072     33.4984     13.4010
+     22.1900   1500.1144     33.4984     13.4000
+     22.8200   1500.1183     33.4984     13.3980
+     23.4600   1500.1256     33.4984     13.3970
+     24.0900   1500.1394     33.4984     13.3980
+     24.7200   1500.1168     33.4984     13.3880
+     25.3500   1500.1174     33.4984     13.3850
+     25.9900   1500.1149     33.4984     13.3810
+     26.6200   1500.1353     33.4984     13.3840
+     27.2500   1500.1359     33.4984     13.3810
+     27.8900   1500.1333     33.4984     13.3770
+     28.5200   1500.1471     33.4984     13.3780
+     29.1500   1500.1609     33.4984     13.3790
+     29.7900   1500.1748     33.4984     13.3800
+     30.4200   1500.1622     33.4984     13.3730
+     31.0500   1500.1760     33.4984     13.3740
+     31.6800   1500.1732     33.4984     13.3700
+     32.3200   1500.1772     33.4984     13.3680
+     32.9500   1500.1877     33.4984     13.3680
+     33.5800   1500.1917     33.4984     13.3660
+     34.2200   1500.1957     33.4984     13.3640
+     34.8500   1500.1996     33.4984     13.3620
+     35.4800   1500.2134     33.4984     13.3630
+     36.1100   1500.2106     33.4984     13.3590
+     36.7500   1500.2047     33.4984     13.3540
+     37.3800   1500.1953     33.4984     13.3480
+     38.0100   1500.2091     33.4984     13.3490
+     38.6400   1500.2229     33.4984     13.3500
+     39.2800   1500.2269     33.4984     13.3480
+     39.9100   1500.2308     33.4984     13.3460
+     40.5400   1500.2446     33.4984     13.3470
+     41.1700   1500.2551     33.4984     13.3470
+     41.8000   1500.2590     33.4984     13.3450
+     42.4400   1500.2432     33.4984     13.3370
+     43.0700   1500.2703     33.4984     13.3420
+     43.7000   1500.2939     33.4984     13.3460
+     44.3300   1500.2979     33.4984     13.3440
+     44.9600   1500.3018     33.4984     13.3420
+     45.6000   1500.3157     33.4984     13.3430
+     46.2300   1500.3361     33.4984     13.3460
+     46.8600   1500.3400     33.4984     13.3440
+     47.4900   1500.3439     33.4984     13.3420
+     48.1200   1500.3643     33.4984     13.3450
+     48.7600   1500.3650     33.4984     13.3420
+     49.3900   1500.3755     33.4984     13.3420
+     50.0200   1500.3860     33.4984     13.3420
+     50.6500   1500.3832     33.4984     13.3380
+     51.2800   1500.3904     33.4984     13.3370
+     51.9100   1500.4076     33.4984     13.3390
+     52.5500   1500.4082     33.4984     13.3360
+     53.1800   1500.4287     33.4984     13.3390
+     53.8100   1500.4359     33.4984     13.3380
+     54.4400   1500.4530     33.4984     13.3400
+     55.0700   1500.4602     33.4984     13.3390
+     55.7000   1500.4640     33.4984     13.3370
+     56.3400   1500.4846     33.4984     13.3400
+     56.9700   1500.4984     33.4984     13.3410
+     57.6000   1500.5321     33.4984     13.3480
+     58.2300   1500.5492     33.4984     13.3500
+     58.8600   1500.5697     33.4984     13.3530
+     59.4900   1500.5868     33.4984     13.3550
+     60.1200   1500.5940     33.4984     13.3540
+     60.7500   1500.5945     33.4984     13.3510
+     61.3800   1500.5686     33.4984     13.3400
+     62.0200   1500.5229     33.4984     13.3230
+     62.6500   1500.4705     33.4984     13.3040
+     63.2800   1500.4246     33.4984     13.2870
+     63.9100   1500.4119     33.4984     13.2800
+     64.5400   1500.3925     33.4984     13.2710
+     65.1700   1500.3599     33.4984     13.2580
+     65.8000   1500.3538     33.4984     13.2530
+     66.4300   1500.1316     33.4984     13.1830
+     67.0600   1499.6589     33.4984     13.0380
+     67.6900   1498.9397     33.4984     12.8200
+     68.3200   1498.4355     33.4984     12.6670
+     68.9600   1498.1527     33.4991     12.5800
+     69.5900   1498.0247     33.4991     12.5390
+     70.2200   1497.7440     33.4984     12.4530
+     70.8500   1497.4391     33.4991     12.3600
+     71.4800   1497.3340     33.4991     12.3260
+     72.1100   1497.2902     33.4991     12.3100
+     72.7400   1497.2394     33.4991     12.2920
+     73.3700   1497.2023     33.4991     12.2780
+     74.0000   1497.1514     33.4991     12.2600
+     74.6300   1497.1177     33.4991     12.2470
+     75.2600   1497.0906     33.4991     12.2360
+     75.8900   1497.0807     33.4991     12.2300
+     76.5200   1497.0298     33.4991     12.2120
+     77.1500   1496.9482     33.4991     12.1850
+     77.7800   1496.8734     33.4991     12.1600
+     78.4100   1496.8190     33.4991     12.1410
+     79.0400   1496.7406     33.4991     12.1150
+     79.6700   1496.6827     33.4991     12.0950
+     80.3000   1496.6591     33.4991     12.0850
+     80.9300   1496.5258     33.4991     12.0430
+     81.5600   1496.3203     33.4991     11.9800
+     82.1900   1496.1559     33.4991     11.9290
+     82.8200   1496.0496     33.4991     11.8950
+     83.4500   1495.9155     33.4991     11.8530
+     84.0800   1495.7607     33.4991     11.8050
+     84.7100   1495.6300     33.4991     11.7640
+     85.3400   1495.5646     33.4991     11.7420
+     85.9700   1495.5405     33.4991     11.7320
+     86.6000   1495.5303     33.4991     11.7260
+     87.2300   1495.4994     33.4991     11.7140
+     87.8600   1495.4546     33.4991     11.6980
+     88.4900   1495.4443     33.4991     11.6920
+     89.1200   1495.4307     33.4991     11.6850
+     89.7500   1495.3893     33.4991     11.6700
+     90.3800   1495.2787     33.4991     11.6350
+     91.0100   1495.1853     33.4991     11.6050
+     91.6300   1495.0986     33.4991     11.5770
+     92.2600   1495.0364     33.4991     11.5560
+     92.8900   1494.9775     33.4991     11.5360
+     93.5200   1494.8387     33.4991     11.4930
+     94.1500   1494.6268     33.4991     11.4290
+     94.7800   1494.4946     33.4991     11.3880
+     95.4100   1494.4181     33.4991     11.3630
+     96.0400   1494.3379     33.4991     11.3370
+     96.6700   1494.3101     33.4991     11.3260
+     97.3000   1494.3135     33.4991     11.3240
+     97.9300   1494.3031     33.4991     11.3180
+     98.5500   1494.2889     33.4991     11.3110
+     99.1800   1494.2437     33.4991     11.2950
+     99.8100   1494.1947     33.4991     11.2780
+    100.4400   1494.1598     33.4991     11.2650
+    101.0700   1494.1459     33.4991     11.2580
+    101.7000   1494.1528     33.4991     11.2570
+    102.3300   1494.1388     33.4991     11.2500
+    102.9600   1494.0131     33.4991     11.2110
+    103.5800   1493.8168     33.4991     11.1520
+    104.2100   1493.6661     33.4991     11.1060
+    104.8400   1493.5679     33.4991     11.0750
+    105.4700   1493.4976     33.4991     11.0520
+    106.1000   1493.4061     33.4991     11.0230
+    106.7300   1493.3358     33.4991     11.0000
+    107.3600   1493.2725     33.4991     10.9790
+    107.9800   1493.2194     33.4991     10.9610
+    108.6100   1493.1523     33.4991     10.9390
+    109.2400   1493.0396     33.4991     10.9040
+    109.8700   1492.8807     33.4991     10.8560
+    110.5000   1492.7959     33.4991     10.8290
+    111.1300   1492.7570     33.4991     10.8150
+    111.7500   1492.7107     33.4991     10.7990
+    112.3800   1492.6859     33.4991     10.7890
+    113.0100   1492.7104     33.4991     10.7930
+    113.6400   1492.7633     33.4991     10.8050
+    114.2700   1492.7384     33.4991     10.7950
+    114.8900   1492.7240     33.4991     10.7880
+    115.5200   1492.7310     33.4991     10.7870
+    116.1500   1492.7061     33.4991     10.7770
+    116.7800   1492.6812     33.4991     10.7670
+    117.4100   1492.6562     33.4991     10.7570
+    118.0300   1492.6737     33.4991     10.7590
+    118.6600   1492.6735     33.4991     10.7560
+    119.2900   1492.6840     33.4991     10.7560
+    119.9200   1492.6980     33.4991     10.7570
+    120.5400   1492.7118     33.4991     10.7580
+    121.1700   1492.7152     33.4991     10.7560
+    121.8000   1492.7257     33.4991     10.7560
+    122.4300   1492.7467     33.4991     10.7590
+    123.0500   1492.7465     33.4991     10.7560
+    123.6800   1492.7605     33.4991     10.7570
+    124.3100   1492.7709     33.4991     10.7570
+    124.9400   1492.7849     33.4991     10.7580
+    125.5600   1492.7882     33.4991     10.7560
+    126.1900   1492.8057     33.4991     10.7580
+    126.8200   1492.8162     33.4991     10.7580
+    127.4500   1492.8125     33.4991     10.7540
+    128.0700   1492.7980     33.4991     10.7470
+    128.7000   1492.7625     33.4991     10.7340
+    129.3300   1492.7128     33.4991     10.7170
+    129.9600   1492.6559     33.4991     10.6980
+    130.5800   1492.6237     33.4991     10.6860
+    131.2100   1492.6625     33.4991     10.6940
+    131.8400   1492.7722     33.4991     10.7220
+    132.4600   1492.8179     33.4991     10.7320
+    133.0900   1492.8107     33.4991     10.7270
+    133.7200   1492.7679     33.4991     10.7120
+    134.3400   1492.6508     33.4991     10.6760
+    134.9700   1492.5442     33.4991     10.6430
+    135.6000   1492.5511     33.4991     10.6420
+    136.2200   1492.5365     33.4991     10.6350
+    136.8500   1492.5576     33.4991     10.6380
+    137.4800   1492.5895     33.4991     10.6440
+    138.1000   1492.6068     33.4991     10.6460
+    138.7300   1492.5676     33.4991     10.6320
+    139.3600   1492.5426     33.4991     10.6220
+    139.9800   1492.5316     33.4991     10.6160
+    140.6100   1492.4994     33.4991     10.6040
+    141.2400   1492.4567     33.4991     10.5890
+    141.8600   1492.4100     33.4991     10.5730
+    142.4900   1492.3921     33.4991     10.5650
+    143.1200   1492.3386     33.4991     10.5470
+    143.7400   1492.2920     33.4991     10.5310
+    144.3700   1492.2775     33.4991     10.5240
+    145.0000   1492.2595     33.4991     10.5160
+    145.6200   1492.2343     33.4991     10.5060
+    146.2500   1492.2054     33.4991     10.4950
+    146.8700   1492.2015     33.4991     10.4910
+    147.5000   1492.2013     33.4991     10.4880
+    148.1300   1492.1975     33.4991     10.4840
+    148.7500   1492.1793     33.4991     10.4760
+    149.3800   1492.1898     33.4991     10.4760
+    150.0000   1492.1752     33.4991     10.4690
+    150.6300   1492.1892     33.4991     10.4700
+    151.2600   1492.1925     33.4991     10.4680
+    151.8800   1492.1921     33.4991     10.4650
+    152.5100   1492.2134     33.4991     10.4680
+    153.1300   1492.1951     33.4991     10.4600
+    153.7600   1492.2091     33.4991     10.4610
+    154.3800   1492.2373     33.4991     10.4660
+    155.0100   1492.2798     33.4991     10.4750
+    155.6400   1492.3259     33.4991     10.4850
+    156.2600   1492.3575     33.4991     10.4910
+    156.8900   1492.4180     33.4991     10.5050
+    157.5100   1492.4460     33.4991     10.5100
+    158.1400   1492.4672     33.4991     10.5130
+    158.7600   1492.4703     33.4991     10.5110
+    159.3900   1492.5057     33.4991     10.5180
+    160.0100   1492.5338     33.4991     10.5230
+    160.6400   1492.5551     33.4991     10.5260
+    161.2600   1492.4906     33.4991     10.5050
+    161.8900   1492.4583     33.4991     10.4930
+    162.5200   1492.4117     33.4991     10.4770
+    163.1400   1492.4114     33.4991     10.4740
+    163.7700   1492.4468     33.4991     10.4810
+    164.3900   1492.4713     33.4991     10.4850
+    165.0200   1492.5459     33.4991     10.5030
+    165.6400   1492.5776     33.4991     10.5090
+    166.2700   1492.5631     33.4991     10.5020
+    166.8900   1492.5128     33.4991     10.4850
+    167.5200   1492.4771     33.4991     10.4720
+    168.1400   1492.4552     33.4991     10.4630
+    168.7700   1492.4586     33.4991     10.4610
+    169.3900   1492.4689     33.4991     10.4610
+    170.0200   1492.4651     33.4991     10.4570
+    170.6400   1492.4647     33.4991     10.4540
+    171.2600   1492.4822     33.4991     10.4560
+    171.8900   1492.4855     33.4991     10.4540
+    172.5100   1492.4816     33.4991     10.4500
+    173.1400   1492.4849     33.4991     10.4480
+    173.7600   1492.4951     33.4991     10.4480
+    174.3900   1492.5128     33.4991     10.4500
+    175.0100   1492.5266     33.4991     10.4510
+    175.6400   1492.5479     33.4991     10.4540
+    176.2600   1492.5616     33.4991     10.4550
+    176.8900   1492.5508     33.4991     10.4490
+    177.5100   1492.5753     33.4991     10.4530
+    178.1300   1492.5750     33.4991     10.4500
+    178.7600   1492.5961     33.4991     10.4530
+    179.3800   1492.6064     33.4991     10.4530
+    180.0100   1492.6133     33.4991     10.4520
+    180.6300   1492.6129     33.4991     10.4490
+    181.2600   1492.6021     33.4991     10.4430
+    181.8800   1492.5945     33.4991     10.4380
+    182.5000   1492.6047     33.4991     10.4380
+    183.1300   1492.6260     33.4991     10.4410
+    183.7500   1492.6470     33.4991     10.4440
+    184.3800   1492.6575     33.4991     10.4440
+    185.0000   1492.6749     33.4991     10.4460
+    185.6200   1492.7030     33.4991     10.4510
+    186.2500   1492.7100     33.4991     10.4500
+    186.8700   1492.7167     33.4991     10.4490
+    187.4900   1492.7269     33.4991     10.4490
+    188.1200   1492.7231     33.4991     10.4450
+    188.7400   1492.7406     33.4991     10.4470
+    189.3700   1492.7439     33.4991     10.4450
+    189.9900   1492.7507     33.4991     10.4440
+    190.6100   1492.7645     33.4991     10.4450
+    191.2400   1492.7607     33.4991     10.4410
+    191.8600   1492.7639     33.4991     10.4390
+    192.4800   1492.7671     33.4991     10.4370
+    193.1100   1492.7668     33.4991     10.4340
+    193.7300   1492.7808     33.4991     10.4350
+    194.3500   1492.7697     33.4991     10.4290
+    194.9800   1492.7729     33.4991     10.4270
+    195.6000   1492.7761     33.4991     10.4250
+    196.2200   1492.7900     33.4991     10.4260
+    196.8500   1492.7970     33.4991     10.4250
+    197.4700   1492.7930     33.4991     10.4210
+    198.0900   1492.7961     33.4991     10.4190
+    198.7200   1492.8066     33.4991     10.4190
+    199.3400   1492.8134     33.4991     10.4180
+    199.9600   1492.8130     33.4991     10.4150
+    200.5900   1492.8127     33.4991     10.4120
+    201.2100   1492.8016     33.4991     10.4060
+    201.8300   1492.7477     33.4991     10.3880
+    202.4500   1492.7186     33.4991     10.3770
+    203.0800   1492.7076     33.4991     10.3710
+    203.7000   1492.7251     33.4991     10.3730
+    204.3200   1492.7355     33.4991     10.3730
+    204.9500   1492.7388     33.4991     10.3710
+    205.5700   1492.7097     33.4991     10.3600
+    206.1900   1492.7021     33.4991     10.3550
+    206.8100   1492.7125     33.4991     10.3550
+    207.4400   1492.7194     33.4991     10.3540
+    208.0600   1492.7225     33.4991     10.3520
+    208.6800   1492.7114     33.4991     10.3460
+    209.3000   1492.7360     33.4991     10.3500
+    209.9300   1492.7214     33.4991     10.3430
+    210.5500   1492.7461     33.4991     10.3470
+    211.1700   1492.7528     33.4991     10.3460
+    211.7900   1492.7667     33.4991     10.3470
+    212.4200   1492.7808     33.4991     10.3480
+    213.0400   1492.7910     33.4991     10.3480
+    213.6600   1492.7942     33.4991     10.3460
+    214.2800   1492.7938     33.4991     10.3430
+    214.9000   1492.8041     33.4991     10.3430
+    215.5300   1492.8181     33.4991     10.3440
+    216.1500   1492.8285     33.4991     10.3440
+    216.7700   1492.8317     33.4991     10.3420
+    217.3900   1492.8169     33.4991     10.3350
+    218.0100   1492.8164     33.4991     10.3320
+    218.6400   1492.8162     33.4991     10.3290
+    219.2600   1492.8265     33.4991     10.3290
+    219.8800   1492.8405     33.4991     10.3300
+    220.5000   1492.8542     33.4991     10.3310
+    221.1200   1492.8467     33.4991     10.3260
+    221.7500   1492.8464     33.4991     10.3230
+    222.3700   1492.8496     33.4991     10.3210
+    222.9900   1492.8599     33.4991     10.3210
+    223.6100   1492.8702     33.4991     10.3210
+    224.2300   1492.8805     33.4991     10.3210
+    224.8500   1492.8801     33.4991     10.3180
+    225.4800   1492.8906     33.4991     10.3180
+    226.1000   1492.8937     33.4991     10.3160
+    226.7200   1492.9041     33.4991     10.3160
+    227.3400   1492.9000     33.4991     10.3120
+    227.9600   1492.9139     33.4991     10.3130
+    228.5800   1492.9207     33.4991     10.3120
+    229.2000   1492.8916     33.4991     10.3010
+    229.8300   1492.8842     33.4991     10.2960
+    230.4500   1492.8873     33.4991     10.2940
+    231.0700   1492.8905     33.4991     10.2920
+    231.6900   1492.8828     33.4991     10.2870
+    232.3100   1492.8967     33.4991     10.2880
+    232.9300   1492.8999     33.4991     10.2860
+    233.5500   1492.9102     33.4991     10.2860
+    234.1700   1492.9313     33.4991     10.2890
+    234.7900   1492.9523     33.4991     10.2920
+    235.4200   1492.9449     33.4991     10.2870
+    236.0400   1492.9480     33.4991     10.2850
+    236.6600   1492.9512     33.4991     10.2830
+    237.2800   1492.9579     33.4991     10.2820
+    237.9000   1492.9683     33.4991     10.2820
+    238.5200   1492.9750     33.4991     10.2810
+    239.1400   1492.9709     33.4991     10.2770
+    239.7600   1492.9956     33.4991     10.2810
+    240.3800   1493.0059     33.4991     10.2810
+    241.0000   1493.0341     33.4991     10.2860
+    241.6200   1493.0444     33.4991     10.2860
+    242.2400   1493.0547     33.4991     10.2860
+    242.8600   1493.0758     33.4991     10.2890
+    243.4800   1493.0538     33.4991     10.2800
+    244.1100   1493.0571     33.4991     10.2780
+    244.7300   1493.0568     33.4991     10.2750
+    245.3500   1493.0563     33.4991     10.2720
+    245.9700   1493.0774     33.4991     10.2750
+    246.5900   1493.0876     33.4991     10.2750
+    247.2100   1493.0658     33.4991     10.2660
+    247.8300   1493.0833     33.4991     10.2680
+    248.4500   1493.0648     33.4991     10.2600
+    249.0700   1493.0645     33.4991     10.2570
+    249.6900   1493.0712     33.4991     10.2560
+    250.3100   1493.0671     33.4991     10.2520
+    250.9300   1493.0881     33.4991     10.2550
+    251.5500   1493.0950     33.4991     10.2540
+    252.1700   1493.0909     33.4991     10.2500
+    252.7900   1493.1155     33.4991     10.2540
+    253.4100   1493.1187     33.4991     10.2520
+    254.0300   1493.1183     33.4991     10.2490
+    254.6500   1493.1250     33.4991     10.2480
+    255.2700   1493.1281     33.4991     10.2460
+    255.8900   1493.1240     33.4991     10.2420
+    256.5100   1493.1487     33.4991     10.2460
+    257.1300   1493.1519     33.4991     10.2440
+    257.7500   1493.1730     33.4991     10.2470
+    258.3700   1493.1653     33.4991     10.2420
+    258.9900   1493.1864     33.4991     10.2450
+    259.6100   1493.1824     33.4991     10.2410
+    260.2200   1493.1710     33.4991     10.2350
+    260.8400   1493.1885     33.4991     10.2370
+    261.4600   1493.1844     33.4991     10.2330
+    262.0800   1493.1840     33.4991     10.2300
+    262.7000   1493.1943     33.4991     10.2300
+    263.3200   1493.1652     33.4991     10.2190
+    263.9400   1493.1575     33.4991     10.2140
+    264.5600   1493.1714     33.4991     10.2150
+    265.1800   1493.1853     33.4991     10.2160
+    265.8000   1493.1885     33.4991     10.2140
+    266.4200   1493.1987     33.4991     10.2140
+    267.0400   1493.2163     33.4991     10.2160
+    267.6600   1493.2158     33.4991     10.2130
+    268.2700   1493.2260     33.4991     10.2130
+    268.8900   1493.2112     33.4991     10.2060
+    269.5100   1493.2358     33.4991     10.2100
+    270.1300   1493.2461     33.4991     10.2100
+    270.7500   1493.2385     33.4991     10.2050
+    271.3700   1493.2560     33.4991     10.2070
+    271.9900   1493.2699     33.4991     10.2080
+    272.6100   1493.2623     33.4991     10.2030
+    273.2300   1493.2761     33.4991     10.2040
+    273.8400   1493.2935     33.4991     10.2060
+    274.4600   1493.2931     33.4991     10.2030
+    275.0800   1493.2961     33.4991     10.2010
+    275.7000   1493.2993     33.4991     10.1990
+    276.3200   1493.3097     33.4991     10.1990
+    276.9400   1493.3199     33.4991     10.1990
+    277.5600   1493.3087     33.4991     10.1930
+    278.1700   1493.3225     33.4991     10.1940
+    278.7900   1493.3364     33.4991     10.1950
+    279.4100   1493.3431     33.4991     10.1940
+    280.0300   1493.3641     33.4991     10.1970
+    280.6500   1493.3708     33.4991     10.1960
+    281.2700   1493.3848     33.4991     10.1970
+    281.8800   1493.3842     33.4991     10.1940
+    282.5000   1493.3981     33.4991     10.1950
+    283.1200   1493.3976     33.4991     10.1920
+    283.7400   1493.4152     33.4991     10.1940
+    284.3600   1493.4147     33.4991     10.1910
+    284.9800   1493.4537     33.4991     10.1990
+    285.5900   1493.4783     33.4991     10.2030
+    286.2100   1493.4813     33.4991     10.2010
+    286.8300   1493.4738     33.4991     10.1960
+    287.4500   1493.4877     33.4991     10.1970
+    288.0600   1493.4978     33.4991     10.1970
+    288.6800   1493.5010     33.4991     10.1950
+    289.3000   1493.5149     33.4991     10.1960
+    289.9200   1493.5216     33.4991     10.1950
+    290.5400   1493.5319     33.4991     10.1950
+    291.1500   1493.5457     33.4991     10.1960
+    291.7700   1493.5559     33.4991     10.1960
+    292.3900   1493.5626     33.4991     10.1950
+    293.0100   1493.5802     33.4991     10.1970
+    293.6200   1493.5759     33.4991     10.1930
+    294.2400   1493.5970     33.4991     10.1960
+    294.8600   1493.6038     33.4991     10.1950
+    295.4800   1493.5925     33.4991     10.1890
+    296.0900   1493.6206     33.4991     10.1940
+    296.7100   1493.6094     33.4991     10.1880
+    297.3300   1493.6233     33.4991     10.1890
+    297.9500   1493.6444     33.4991     10.1920
+    298.5600   1493.6582     33.4991     10.1930
+    299.1800   1493.6361     33.4991     10.1840
+    299.8000   1493.6500     33.4991     10.1850
+    300.4100   1493.6566     33.4991     10.1840
+    301.0300   1493.6526     33.4991     10.1800
+    301.6500   1493.6593     33.4991     10.1790
+    302.2700   1493.6625     33.4991     10.1770
+    302.8800   1493.6617     33.4991     10.1740
+    303.5000   1493.6686     33.4991     10.1730
+    304.1200   1493.6681     33.4991     10.1700
+    304.7300   1493.6854     33.4991     10.1720
+    305.3500   1493.6742     33.4991     10.1660
+    305.9700   1493.6881     33.4991     10.1670
+    306.5800   1493.6946     33.4991     10.1660
+    307.2000   1493.6942     33.4991     10.1630
+    307.8200   1493.7045     33.4991     10.1630
+    308.4300   1493.7183     33.4991     10.1640
+    309.0500   1493.7285     33.4991     10.1640
+    309.6700   1493.7352     33.4991     10.1630
+    310.2800   1493.7490     33.4991     10.1640
+    310.9000   1493.7522     33.4991     10.1620
+    311.5200   1493.7589     33.4991     10.1610
+    312.1300   1493.7618     33.4991     10.1590
+    312.7500   1493.7758     33.4991     10.1600
+    313.3700   1493.7825     33.4991     10.1590
+    313.9800   1493.8035     33.4991     10.1620
+    314.6000   1493.8137     33.4991     10.1620
+    315.2200   1493.8348     33.4991     10.1650
+    315.8300   1493.8378     33.4991     10.1630
+    316.4500   1493.8589     33.4991     10.1660
+    317.0600   1493.8583     33.4991     10.1630
+    317.6800   1493.8794     33.4991     10.1660
+    318.3000   1493.8896     33.4991     10.1660
+    318.9100   1493.8890     33.4991     10.1630
+    319.5300   1493.9066     33.4991     10.1650
+    320.1400   1493.9059     33.4991     10.1620
+    320.7600   1493.9198     33.4991     10.1630
+    321.3800   1493.9194     33.4991     10.1600
+    321.9900   1493.9331     33.4991     10.1610
+    322.6100   1493.9219     33.4991     10.1550
+    323.2200   1493.9392     33.4991     10.1570
+    323.8400   1493.9496     33.4991     10.1570
+    324.4600   1493.9456     33.4991     10.1530
+    325.0700   1493.9520     33.4991     10.1520
+    325.6900   1493.9445     33.4991     10.1470
+    326.3000   1493.9618     33.4991     10.1490
+    326.9200   1493.9792     33.4991     10.1510
+    327.5300   1493.9607     33.4991     10.1430
+    328.1500   1493.9818     33.4991     10.1460
+    328.7600   1493.9703     33.4991     10.1400
+    329.3800   1493.9878     33.4991     10.1420
+    329.9900   1494.0016     33.4991     10.1430
+    330.6100   1494.0155     33.4991     10.1440
+    331.2300   1494.0043     33.4991     10.1380
+    331.8400   1494.0109     33.4991     10.1370
+    332.4600   1494.0067     33.4991     10.1330
+    333.0700   1494.0421     33.4991     10.1400
+    333.6900   1494.0380     33.4991     10.1360
+    334.3000   1494.0482     33.4991     10.1360
+    334.9200   1494.0477     33.4991     10.1330
+    335.5300   1494.0542     33.4991     10.1320
+    336.1500   1494.0610     33.4991     10.1310
+    336.7600   1494.0712     33.4991     10.1310
+    337.3800   1494.0779     33.4991     10.1300
+    337.9900   1494.0808     33.4991     10.1280
+    338.6100   1494.1019     33.4991     10.1310
+    339.2200   1494.0941     33.4991     10.1260
+    339.8400   1494.1116     33.4991     10.1280
+    340.4500   1494.1110     33.4991     10.1250
+    341.0700   1494.1177     33.4991     10.1240
+    341.6800   1494.1243     33.4991     10.1230
+    342.3000   1494.1238     33.4991     10.1200
+    342.9100   1494.1520     33.4991     10.1250
+    343.5200   1494.1477     33.4991     10.1210
+    344.1400   1494.1400     33.4991     10.1160
+    344.7500   1494.1610     33.4991     10.1190
+    345.3700   1494.1605     33.4991     10.1160
+    345.9800   1494.1671     33.4991     10.1150
+    346.6000   1494.1594     33.4991     10.1100
+    347.2100   1494.1696     33.4991     10.1100
+    347.8300   1494.1763     33.4991     10.1090
+    348.4400   1494.1829     33.4991     10.1080
+    349.0500   1494.1893     33.4991     10.1070
+    349.6700   1494.1818     33.4991     10.1020
+    350.2800   1494.1775     33.4991     10.0980
+    350.9000   1494.1770     33.4991     10.0950
+    351.5100   1494.1764     33.4991     10.0920
+    352.1300   1494.1794     33.4991     10.0900
+    352.7400   1494.1788     33.4991     10.0870
+    353.3500   1494.1710     33.4991     10.0820
+    353.9700   1494.1849     33.4991     10.0830
+    354.5800   1494.1951     33.4991     10.0830
+    355.1900   1494.1873     33.4991     10.0780
+    355.8100   1494.2119     33.4991     10.0820
+    356.4200   1494.2185     33.4991     10.0810
+    357.0400   1494.2216     33.4991     10.0790
+    357.6500   1494.2462     33.4991     10.0830
+    358.2600   1494.2563     33.4991     10.0830
+    358.8800   1494.2487     33.4991     10.0780
+    359.4900   1494.2697     33.4991     10.0810
+    360.1000   1494.2726     33.4991     10.0790
+    360.7200   1494.2900     33.4991     10.0810
+    361.3300   1494.3003     33.4991     10.0810
+    361.9500   1494.2998     33.4991     10.0780
+    362.5600   1494.3099     33.4991     10.0780
+    363.1700   1494.3237     33.4991     10.0790
+    363.7900   1494.3232     33.4991     10.0760
+    364.4000   1494.3369     33.4991     10.0770
+    365.0100   1494.3616     33.4991     10.0810
+    365.6300   1494.3755     33.4991     10.0820
+    366.2400   1494.3856     33.4991     10.0820
+    366.8500   1494.3813     33.4991     10.0780
+    367.4700   1494.3881     33.4991     10.0770
+    368.0800   1494.3982     33.4991     10.0770
+    368.6900   1494.3940     33.4991     10.0730
+    369.3000   1494.3970     33.4991     10.0710
+    369.9200   1494.3965     33.4991     10.0680
+    370.5300   1494.4066     33.4991     10.0680
+    371.1400   1494.3951     33.4991     10.0620
+    371.7600   1494.3911     33.4991     10.0580
+    372.3700   1494.3796     33.4991     10.0520
+    372.9800   1494.3898     33.4991     10.0520
+    373.6000   1494.3749     33.4991     10.0450
+    374.2100   1494.3778     33.4991     10.0430
+    374.8200   1494.3663     33.4991     10.0370
+    375.4300   1494.3765     33.4991     10.0370
+    376.0500   1494.3688     33.4991     10.0320
+    376.6600   1494.3826     33.4991     10.0330
+    377.2700   1494.3927     33.4991     10.0330
+    377.8800   1494.4100     33.4991     10.0350
+    378.5000   1494.4276     33.4991     10.0370
+    379.1100   1494.4377     33.4991     10.0370
+    379.7200   1494.4263     33.4991     10.0310
+    380.3300   1494.4039     33.4991     10.0220
+    380.9500   1494.4359     33.4991     10.0280
+    381.5600   1494.4316     33.4991     10.0240
+    382.1700   1494.4491     33.4991     10.0260
+    382.7800   1494.4664     33.4991     10.0280
+    383.4000   1494.4659     33.4991     10.0250
+    384.0100   1494.4545     33.4991     10.0190
+    384.6200   1494.4683     33.4991     10.0200
+    385.2300   1494.4712     33.4991     10.0180
+    385.8400   1494.4669     33.4991     10.0140
+    386.4600   1494.4736     33.4991     10.0130
+    387.0700   1494.4946     33.4991     10.0160
+    387.6800   1494.4939     33.4991     10.0130
+    388.2900   1494.5005     33.4991     10.0120
+    388.9000   1494.5106     33.4991     10.0120
+    389.5200   1494.5173     33.4991     10.0110
+    390.1300   1494.5420     33.4991     10.0150
+    390.7400   1494.5737     33.4991     10.0210
+    391.3500   1494.5731     33.4991     10.0180
+    391.9600   1494.6013     33.4991     10.0230
+    392.5700   1494.6151     33.4991     10.0240
+    393.1900   1494.6218     33.4991     10.0230
+    393.8000   1494.6355     33.4991     10.0240
+    394.4100   1494.6493     33.4991     10.0250
+    395.0200   1494.6667     33.4991     10.0270
+    395.6300   1494.6697     33.4991     10.0250
+    396.2400   1494.6835     33.4991     10.0260
+    396.8600   1494.6865     33.4991     10.0240
+    397.4700   1494.6859     33.4991     10.0210
+    398.0800   1494.6816     33.4991     10.0170
+    398.6900   1494.6918     33.4991     10.0170
+    399.3000   1494.6838     33.4991     10.0120
+    399.9100   1494.6976     33.4991     10.0130
+    400.5200   1494.6898     33.4991     10.0080
+    401.1300   1494.6927     33.4991     10.0060
+    401.7500   1494.7067     33.4991     10.0070
+    402.3600   1494.7205     33.4991     10.0080
+    402.9700   1494.7269     33.4991     10.0070
+    403.5800   1494.7191     33.4991     10.0020
+    404.1900   1494.7329     33.4991     10.0030
+    404.8000   1494.7286     33.4991      9.9990
+    405.4100   1494.7423     33.4991     10.0000
+    406.0200   1494.7345     33.4991      9.9950
+    406.6300   1494.7266     33.4991      9.9900
+    407.2400   1494.7114     33.4991      9.9830
+    407.8500   1494.6927     33.4991      9.9750
+    408.4700   1494.6923     33.4991      9.9720
+    409.0800   1494.6843     33.4991      9.9670
+    409.6900   1494.6873     33.4991      9.9650
+    410.3000   1494.7155     33.4991      9.9700
+    410.9100   1494.7148     33.4991      9.9670
+    411.5200   1494.7394     33.4991      9.9710
+    412.1300   1494.7532     33.4991      9.9720
+    412.7400   1494.7670     33.4991      9.9730
+    413.3500   1494.7699     33.4991      9.9710
+    413.9600   1494.7874     33.4991      9.9730
+    414.5700   1494.7866     33.4991      9.9700
+    415.1800   1494.7968     33.4991      9.9700
+    415.7900   1494.7961     33.4991      9.9670
+    416.4000   1494.8063     33.4991      9.9670
+    417.0100   1494.8055     33.4991      9.9640
+    417.6200   1494.8085     33.4991      9.9620
+    418.2300   1494.8259     33.4991      9.9640
+    418.8400   1494.8361     33.4991      9.9640
+    419.4500   1494.8427     33.4991      9.9630
+    420.0600   1494.8384     33.4991      9.9590
+    420.6700   1494.8413     33.4991      9.9570
+    421.2800   1494.8442     33.4991      9.9550
+    421.8900   1494.8472     33.4991      9.9530
+    422.5000   1494.8429     33.4991      9.9490
+    423.1100   1494.8530     33.4991      9.9490
+    423.7200   1494.8777     33.4991      9.9530
+    424.3300   1494.8733     33.4991      9.9490
+    424.9400   1494.8835     33.4991      9.9490
+    425.5500   1494.8828     33.4991      9.9460
+    426.1600   1494.8822     33.4991      9.9430
+    426.7700   1494.9067     33.4991      9.9470
+    427.3800   1494.9061     33.4991      9.9440
+    427.9900   1494.9308     33.4991      9.9480
+    428.6000   1494.9337     33.4991      9.9460
+    429.2100   1494.9366     33.4991      9.9440
+    429.8200   1494.9396     33.4991      9.9420
+    430.4300   1494.9388     33.4991      9.9390
+    431.0400   1494.9563     33.4991      9.9410
+    431.6500   1494.9664     33.4991      9.9410
+    432.2600   1494.9622     33.4991      9.9370
+    432.8700   1494.9867     33.4991      9.9410
+    433.4700   1494.9895     33.4991      9.9390
+    434.0800   1494.9996     33.4991      9.9390
+    434.6900   1495.0026     33.4991      9.9370
+    435.3000   1495.0055     33.4991      9.9350
+    435.9100   1495.0229     33.4991      9.9370
+    436.5200   1495.0331     33.4991      9.9370
+    437.1300   1495.0179     33.4991      9.9300
+    437.7400   1495.0389     33.4991      9.9330
+    438.3500   1495.0455     33.4991      9.9320
+    438.9600   1495.0195     33.4991      9.9220
+    439.5600   1495.0187     33.4991      9.9190
+    440.1700   1495.0288     33.4991      9.9190
+    440.7800   1495.0535     33.4991      9.9230
+    441.3900   1495.0455     33.4991      9.9180
+    442.0000   1495.0593     33.4991      9.9190
+    442.6100   1495.0514     33.4991      9.9140
+    443.2200   1495.0580     33.4991      9.9130
+    443.8300   1495.0500     33.4991      9.9080
+    444.4300   1495.0709     33.4991      9.9110
+    445.0400   1495.0883     33.4991      9.9130
+    445.6500   1495.0659     33.4991      9.9040
+    446.2600   1495.0615     33.4991      9.9000
+    446.8700   1495.0753     33.4991      9.9010
+    447.4800   1495.0819     33.4991      9.9000
+    448.0900   1495.0812     33.4991      9.8970
+    448.6900   1495.0803     33.4991      9.8940
+    449.3000   1495.0760     33.4991      9.8900
+    449.9100   1495.0862     33.4991      9.8900
+    450.5200   1495.1036     33.4991      9.8920
+    451.1300   1495.1029     33.4991      9.8890
+    451.7300   1495.1166     33.4991      9.8900
+    452.3400   1495.1086     33.4991      9.8850
+    452.9500   1495.1296     33.4991      9.8880
+    453.5600   1495.1289     33.4991      9.8850
+    454.1700   1495.1318     33.4991      9.8830
+    454.7800   1495.1384     33.4991      9.8820
+    455.3800   1495.1448     33.4991      9.8810
+    455.9900   1495.1368     33.4991      9.8760
+    456.6000   1495.1578     33.4991      9.8790
+    457.2100   1495.1464     33.4991      9.8730
+    457.8100   1495.1455     33.4991      9.8700
+    458.4200   1495.1339     33.4991      9.8640
+    459.0300   1495.1187     33.4991      9.8570
+    459.6400   1495.1035     33.4991      9.8500
+    460.2500   1495.1064     33.4991      9.8480
+    460.8500   1495.1091     33.4991      9.8460
+    461.4600   1495.1121     33.4991      9.8440
+    462.0700   1495.1041     33.4991      9.8390
+    462.6800   1495.1251     33.4991      9.8420
+    463.2800   1495.1279     33.4991      9.8400
+    463.8900   1495.1235     33.4991      9.8360
+    464.5000   1495.1301     33.4991      9.8350
+    465.1100   1495.1367     33.4991      9.8340
+    465.7100   1495.1539     33.4991      9.8360
+    466.3200   1495.1495     33.4991      9.8320
+    466.9300   1495.1561     33.4991      9.8310
+    467.5300   1495.1516     33.4991      9.8270
+    468.1400   1495.1509     33.4991      9.8240
+    468.7500   1495.1466     33.4991      9.8200
+    469.3600   1495.1422     33.4991      9.8160
+    469.9600   1495.1559     33.4991      9.8170
+    470.5700   1495.1479     33.4991      9.8120
+    471.1800   1495.1254     33.4991      9.8030
+    471.7800   1495.1318     33.4991      9.8020
+    472.3900   1495.1274     33.4991      9.7980
+    473.0000   1495.1158     33.4991      9.7920
+    473.6000   1495.1040     33.4991      9.7860
+    474.2100   1495.1215     33.4991      9.7880
+    474.8200   1495.1317     33.4991      9.7880
+    475.4200   1495.1344     33.4991      9.7860
+    476.0300   1495.1445     33.4991      9.7860
+    476.6400   1495.1583     33.4991      9.7870
+    477.2400   1495.1575     33.4991      9.7840
+    477.8500   1495.1713     33.4991      9.7850
+    478.4600   1495.1814     33.4991      9.7850
+    479.0600   1495.1914     33.4991      9.7850
+    479.6700   1495.2052     33.4991      9.7860
+    480.2800   1495.2046     33.4991      9.7830
+    480.8800   1495.1964     33.4991      9.7780
+    481.4900   1495.2174     33.4991      9.7810
+    482.1000   1495.2167     33.4991      9.7780
+    482.7000   1495.2122     33.4991      9.7740
+    483.3100   1495.2405     33.4991      9.7790
+    483.9200   1495.2325     33.4991      9.7740
+    484.5200   1495.2135     33.4991      9.7660
+    485.1300   1495.1982     33.4991      9.7590
+    485.7300   1495.1829     33.4991      9.7520
+    486.3400   1495.1748     33.4991      9.7470
+    486.9500   1495.1814     33.4991      9.7460
+    487.5500   1495.1768     33.4991      9.7420
+    488.1600   1495.1725     33.4991      9.7380
+    488.7600   1495.1715     33.4991      9.7350
+    489.3700   1495.1853     33.4991      9.7360
+    489.9800   1495.1846     33.4991      9.7330
+    490.5800   1495.1946     33.4991      9.7330
+    491.1900   1495.2012     33.4991      9.7320
+    491.7900   1495.2112     33.4991      9.7320
+    492.4000   1495.2177     33.4991      9.7310
+    493.0000   1495.2205     33.4991      9.7290
+    493.6100   1495.1833     33.4991      9.7160
+    494.2200   1495.1608     33.4991      9.7070
+    494.8200   1495.1635     33.4991      9.7050
+    495.4300   1495.1627     33.4991      9.7020
+    496.0300   1495.1691     33.4991      9.7010
+    496.6400   1495.1611     33.4991      9.6960
+    497.2400   1495.1675     33.4991      9.6950
+    497.8500   1495.1667     33.4991      9.6920
+    498.4500   1495.1840     33.4991      9.6940
+    499.0600   1495.1906     33.4991      9.6930
+    499.6600   1495.1932     33.4991      9.6910
+    500.2700   1495.1998     33.4991      9.6900
+    500.8700   1495.2098     33.4991      9.6900
+    501.4800   1495.2273     33.4991      9.6920
+    502.0800   1495.2445     33.4991      9.6940
+    502.6900   1495.2438     33.4991      9.6910
+    503.3000   1495.2430     33.4991      9.6880
+    503.9000   1495.2094     33.4991      9.6760
+    504.5100   1495.1904     33.4991      9.6680
+    505.1100   1495.1858     33.4991      9.6640
+    505.7200   1495.1742     33.4991      9.6580
+    506.3200   1495.1696     33.4991      9.6540
+    506.9200   1495.1285     33.4991      9.6400
+    507.5300   1495.1023     33.4991      9.6300
+    508.1300   1495.0905     33.4991      9.6240
+    508.7400   1495.0934     33.4991      9.6220
+    509.3400   1495.1106     33.4991      9.6240
+    509.9500   1495.1062     33.4991      9.6200
+    510.5500   1495.1053     33.4991      9.6170
+    511.1600   1495.0936     33.4991      9.6110
+    511.7600   1495.0853     33.4991      9.6060
+    512.3700   1495.0992     33.4991      9.6070
+    512.9700   1495.1128     33.4991      9.6080
+    513.5800   1495.1121     33.4991      9.6050
+    514.1800   1495.1331     33.4991      9.6080
+    514.7800   1495.1431     33.4991      9.6080
+    515.3900   1495.1495     33.4991      9.6070
+    515.9900   1495.1522     33.4991      9.6050
+    516.6000   1495.1405     33.4991      9.5990
+    517.2000   1495.1323     33.4991      9.5940
+    517.8100   1495.1316     33.4991      9.5910
+    518.4100   1495.1343     33.4991      9.5890
+    519.0100   1495.1443     33.4991      9.5890
+    519.6200   1495.1399     33.4991      9.5850
+    520.2200   1495.1462     33.4991      9.5840
+    520.8300   1495.1235     33.4991      9.5750
+    521.4300   1495.1007     33.4991      9.5660
+    522.0300   1495.1107     33.4991      9.5660
+    522.6400   1495.1172     33.4991      9.5650
+    523.2400   1495.1162     33.4991      9.5620
+    523.8500   1495.1265     33.4991      9.5620
+    524.4500   1495.1328     33.4991      9.5610
+    525.0500   1495.1465     33.4991      9.5620
+    525.6600   1495.1348     33.4991      9.5560
+    526.2600   1495.1155     33.4991      9.5480
+    526.8600   1495.1073     33.4991      9.5430
+    527.4700   1495.1101     33.4991      9.5410
+    528.0700   1495.1311     33.4991      9.5440
+    528.6700   1495.1082     33.4991      9.5350
+    529.2800   1495.1147     33.4991      9.5340
+    529.8800   1495.1211     33.4991      9.5330
+    530.4900   1495.1239     33.4991      9.5310
+    531.0900   1495.1121     33.4991      9.5250
+    531.6900   1495.0964     33.4991      9.5180
+    532.3000   1495.0920     33.4991      9.5140
+    532.9000   1495.0911     33.4991      9.5110
+    533.5000   1495.0974     33.4991      9.5100
+    534.1100   1495.0820     33.4991      9.5030
+    534.7100   1495.0994     33.4991      9.5050
+    535.3100   1495.1057     33.4991      9.5040
+    535.9100   1495.1084     33.4991      9.5020
+    536.5200   1495.1185     33.4991      9.5020
+    537.1200   1495.1322     33.4991      9.5030
+    537.7200   1495.1239     33.4991      9.4980
+    538.3300   1495.1377     33.4991      9.4990
+    538.9300   1495.1185     33.4991      9.4910
+    539.5300   1495.0956     33.4991      9.4820
+    540.1400   1495.0656     33.4991      9.4710
+    540.7400   1495.0573     33.4991      9.4660
+    541.3400   1495.0526     33.4991      9.4620
+    541.9400   1495.0480     33.4991      9.4580
+    542.5500   1495.0581     33.4991      9.4580
+    543.1500   1495.0535     33.4991      9.4540
+    543.7500   1495.0562     33.4991      9.4520
+    544.3500   1495.0405     33.4991      9.4450
+    544.9600   1495.0215     33.4991      9.4370
+    545.5600   1495.0057     33.4991      9.4300
+    546.1600   1495.0084     33.4991      9.4280
+    546.7600   1495.0038     33.4991      9.4240
+    547.3700   1494.9700     33.4991      9.4120
+    547.9700   1494.9543     33.4991      9.4050
+    548.5700   1494.9717     33.4991      9.4070
+    549.1700   1494.9817     33.4991      9.4070
+    549.7800   1494.9883     33.4991      9.4060
+    550.3800   1494.9983     33.4991      9.4060
+    550.9800   1495.0120     33.4991      9.4070
+    551.5800   1495.0146     33.4991      9.4050
+    552.1800   1495.0320     33.4991      9.4070
+    552.7900   1495.0275     33.4991      9.4030
+    553.3900   1495.0338     33.4991      9.4020
+    553.9900   1495.0109     33.4991      9.3930
+    554.5900   1495.0024     33.4991      9.3880
+    555.1900   1495.0161     33.4991      9.3890
+    555.8000   1495.0190     33.4991      9.3870
+    556.4000   1495.0070     33.4991      9.3810
+    557.0000   1495.0023     33.4991      9.3770
+    557.6000   1494.9977     33.4991      9.3730
+    558.2000   1494.9784     33.4991      9.3650
+    558.8100   1494.9518     33.4991      9.3550
+    559.4100   1494.9471     33.4991      9.3510
+    560.0100   1494.9535     33.4991      9.3500
+    560.6100   1494.9341     33.4991      9.3420
+    561.2100   1494.9515     33.4991      9.3440
+    561.8100   1494.9578     33.4991      9.3430
+    562.4100   1494.9678     33.4991      9.3430
+    563.0200   1494.9744     33.4991      9.3420
+    563.6200   1494.9586     33.4991      9.3350
+    564.2200   1494.9467     33.4991      9.3290
+    564.8200   1494.9309     33.4991      9.3220
+    565.4200   1494.9299     33.4991      9.3190
+    566.0200   1494.9142     33.4991      9.3120
+    566.6200   1494.9021     33.4991      9.3060
+    567.2300   1494.9307     33.4991      9.3110
+    567.8300   1494.8745     33.4991      9.2930
+    568.4300   1494.8551     33.4991      9.2850
+    569.0300   1494.8762     33.4991      9.2880
+    569.6300   1494.8789     33.4991      9.2860
+    570.2300   1494.8484     33.4991      9.2750
+    570.8300   1494.8658     33.4991      9.2770
+    571.4300   1494.8684     33.4991      9.2750
+    572.0300   1494.8969     33.4991      9.2800
+    572.6300   1494.9069     33.4991      9.2800
+    573.2400   1494.9244     33.4991      9.2820
+    573.8400   1494.9124     33.4991      9.2760
+    574.4400   1494.9260     33.4991      9.2770
+    575.0400   1494.9287     33.4991      9.2750
+    575.6400   1494.9387     33.4991      9.2750
+    576.2400   1494.9376     33.4991      9.2720
+    576.8400   1494.9440     33.4991      9.2710
+    577.4400   1494.9467     33.4991      9.2690
+    578.0400   1494.9714     33.4991      9.2730
+    578.6400   1494.9667     33.4991      9.2690
+    579.2400   1494.9803     33.4991      9.2700
+    579.8400   1494.9720     33.4991      9.2650
+    580.4400   1494.9709     33.4991      9.2620
+    581.0400   1494.9552     33.4991      9.2550
+    581.6400   1494.9727     33.4991      9.2570
+    582.2400   1494.9642     33.4991      9.2520
+    582.8400   1494.9669     33.4991      9.2500
+    583.4400   1494.9695     33.4991      9.2480
+    584.0400   1494.9833     33.4991      9.2490
+    584.6400   1494.9858     33.4991      9.2470
+    585.2400   1494.9738     33.4991      9.2410
+    585.8400   1494.9617     33.4991      9.2350
+    586.4400   1494.9534     33.4991      9.2300
+    587.0400   1494.9523     33.4991      9.2270
+    587.6400   1494.9365     33.4991      9.2200
+    588.2400   1494.9502     33.4991      9.2210
+    588.8400   1494.9233     33.4991      9.2110
+    589.4400   1494.9113     33.4991      9.2050
+    590.0400   1494.9066     33.4991      9.2010
+    590.6400   1494.9130     33.4991      9.2000
+    591.2400   1494.9045     33.4991      9.1950
+    591.8400   1494.9034     33.4991      9.1920
+    592.4400   1494.8950     33.4991      9.1870
+    593.0400   1494.8903     33.4991      9.1830
+    593.6400   1494.8929     33.4991      9.1810
+    594.2400   1494.9141     33.4991      9.1840
+    594.8400   1494.9351     33.4991      9.1870
+    595.4400   1494.9156     33.4991      9.1790
+    596.0400   1494.9182     33.4991      9.1770
+    596.6400   1494.9209     33.4991      9.1750
+    597.2400   1494.9346     33.4991      9.1760
+    597.8400   1494.9594     33.4991      9.1800
+    598.4400   1494.9436     33.4991      9.1730
+    599.0400   1494.9425     33.4991      9.1700
+    599.6400   1494.9304     33.4991      9.1640
+    600.2400   1494.9109     33.4991      9.1560
+    600.8300   1494.9208     33.4991      9.1560
+    601.4300   1494.9086     33.4991      9.1500
+    602.0300   1494.9224     33.4991      9.1510
+    602.6300   1494.9324     33.4991      9.1510
+    603.2300   1494.9092     33.4991      9.1420
+    603.8300   1494.8712     33.4991      9.1290
+    604.4300   1494.8553     33.4991      9.1220
+    605.0300   1494.8506     33.4991      9.1180
+    605.6300   1494.8533     33.4991      9.1160
+    606.2300   1494.8300     33.4991      9.1070
+    606.8200   1494.8325     33.4991      9.1050
+    607.4200   1494.8462     33.4991      9.1060
+    608.0200   1494.8340     33.4991      9.1000
+    608.6200   1494.8588     33.4991      9.1040
+    609.2200   1494.8319     33.4991      9.0940
+    609.8200   1494.8160     33.4991      9.0870
+    610.4200   1494.8519     33.4991      9.0940
+    611.0100   1494.8544     33.4991      9.0920
+    611.6100   1494.8792     33.4991      9.0960
+    612.2100   1494.8855     33.4991      9.0950
+    612.8100   1494.8733     33.4991      9.0890
+    613.4100   1494.8871     33.4991      9.0900
+    614.0100   1494.8896     33.4991      9.0880
+    614.6100   1494.8812     33.4991      9.0830
+    615.2000   1494.8615     33.4991      9.0750
+    615.8000   1494.8530     33.4991      9.0700
+    616.4000   1494.8519     33.4991      9.0670
+    617.0000   1494.8213     33.4991      9.0560
+    617.6000   1494.8129     33.4991      9.0510
+    618.1900   1494.7893     33.4991      9.0420
+    618.7900   1494.7845     33.4991      9.0380
+    619.3900   1494.7761     33.4991      9.0330
+    619.9900   1494.7750     33.4991      9.0300
+    620.5900   1494.7184     33.4991      9.0120
+    621.1800   1494.7097     33.4991      9.0070
+    621.7800   1494.6753     33.4991      8.9950
+    622.3800   1494.6667     33.4991      8.9900
+    622.9800   1494.6398     33.4991      8.9800
+    623.5800   1494.6201     33.4991      8.9720
+    624.1700   1494.5966     33.4991      8.9630
+    624.7700   1494.5955     33.4991      8.9600
+    625.3700   1494.5536     33.4991      8.9460
+    625.9700   1494.5192     33.4991      8.9340
+    626.5600   1494.5216     33.4991      8.9320
+    627.1600   1494.5204     33.4991      8.9290
+    627.7600   1494.5304     33.4991      8.9290
+    628.3600   1494.5479     33.4991      8.9310
+    628.9500   1494.5466     33.4991      8.9280
+    629.5500   1494.5270     33.4991      8.9200
+    630.1500   1494.5295     33.4991      8.9180
+    630.7500   1494.4801     33.4991      8.9020
+    631.3400   1494.4343     33.4991      8.8870
+    631.9400   1494.4146     33.4991      8.8790
+    632.5400   1494.3726     33.4991      8.8650
+    633.1400   1494.3529     33.4991      8.8570
+    633.7300   1494.3256     33.4991      8.8470
+    634.3300   1494.3281     33.4991      8.8450
+    634.9300   1494.3158     33.4991      8.8390
+    635.5200   1494.3331     33.4991      8.8410
+    636.1200   1494.3059     33.4991      8.8310
+    636.7200   1494.3234     33.4991      8.8330
+    637.3100   1494.3370     33.4991      8.8340
+    637.9100   1494.3396     33.4991      8.8320
+    638.5100   1494.3496     33.4991      8.8320
+    639.1100   1494.3373     33.4991      8.8260
+    639.7000   1494.3025     33.4991      8.8140
+    640.3000   1494.2642     33.4991      8.8010
+    640.9000   1494.2853     33.4991      8.8040
+    641.4900   1494.2803     33.4991      8.8000
+    642.0900   1494.2679     33.4991      8.7940
+    642.6900   1494.2556     33.4991      8.7880
+    643.2800   1494.2692     33.4991      8.7890
+    643.8800   1494.2568     33.4991      8.7830
+    644.4800   1494.2632     33.4991      8.7820
+    645.0700   1494.2395     33.4991      8.7730
+    645.6700   1494.2346     33.4991      8.7690
+    646.2600   1494.2371     33.4991      8.7670
+    646.8600   1494.2396     33.4991      8.7650
+    647.4600   1494.2422     33.4991      8.7630
+    648.0500   1494.2147     33.4991      8.7530
+    648.6500   1494.2247     33.4991      8.7530
+    649.2500   1494.1864     33.4991      8.7400
+    649.8400   1494.1589     33.4991      8.7300
+    650.4400   1494.1428     33.4991      8.7230
+    651.0300   1494.0892     33.4991      8.7060
+    651.6300   1494.0544     33.4991      8.6940
+    652.2300   1494.0085     33.4991      8.6790
+    652.8200   1493.9773     33.4991      8.6680
+    653.4200   1493.9911     33.4991      8.6690
+    654.0100   1493.9785     33.4991      8.6630
+    654.6100   1493.9885     33.4991      8.6630
+    655.2100   1493.9836     33.4991      8.6590
+    655.8000   1493.9448     33.4991      8.6460
+    656.4000   1493.9437     33.4991      8.6430
+    656.9900   1493.9161     33.4991      8.6330
+    657.5900   1493.9038     33.4991      8.6270
+    658.1800   1493.8762     33.4991      8.6170
+    658.7800   1493.8712     33.4991      8.6130
+    659.3800   1493.8850     33.4991      8.6140
+    659.9700   1493.8949     33.4991      8.6140
+    660.5700   1493.9087     33.4991      8.6150
+    661.1600   1493.9148     33.4991      8.6140
+    661.7600   1493.9248     33.4991      8.6140
+    662.3500   1493.9384     33.4991      8.6150
+    662.9500   1493.9371     33.4991      8.6120
+    663.5400   1493.9432     33.4991      8.6110
+    664.1400   1493.9233     33.4991      8.6030
+    664.7300   1493.9370     33.4991      8.6040
+    665.3300   1493.9208     33.4991      8.5970
+    665.9300   1493.8822     33.4991      8.5840
+    666.5200   1493.8733     33.4991      8.5790
+    667.1200   1493.8833     33.4991      8.5790
+    667.7100   1493.8745     33.4991      8.5740
+    668.3100   1493.8920     33.4991      8.5760
+    668.9000   1493.9019     33.4991      8.5760
+    669.5000   1493.9156     33.4991      8.5770
+    670.0900   1493.9330     33.4991      8.5790
+    670.6900   1493.9504     33.4991      8.5810
+    671.2800   1493.9304     33.4991      8.5730
+    671.8800   1493.9479     33.4991      8.5750
+    672.4700   1493.9390     33.4991      8.5700
+    673.0600   1493.9302     33.4991      8.5650
+    673.6600   1493.9065     33.4991      8.5560
+    674.2500   1493.9163     33.4991      8.5560
+    674.8500   1493.9264     33.4991      8.5560
+    675.4400   1493.9062     33.4991      8.5480
+    676.0400   1493.9012     33.4991      8.5440
+    676.6300   1493.9186     33.4991      8.5460
+    677.2300   1493.9061     33.4991      8.5400
+    677.8200   1493.8860     33.4991      8.5320
+    678.4200   1493.8848     33.4991      8.5290
+    679.0100   1493.9022     33.4991      8.5310
+    679.6000   1493.8970     33.4991      8.5270
+    680.2000   1493.9071     33.4991      8.5270
+    680.7900   1493.8982     33.4991      8.5220
+    681.3900   1493.9082     33.4991      8.5220
+    681.9800   1493.9031     33.4991      8.5180
+    682.5800   1493.9055     33.4991      8.5160
+    683.1700   1493.9004     33.4991      8.5120
+    683.7600   1493.9028     33.4991      8.5100
+    684.3600   1493.9053     33.4991      8.5080
+    684.9500   1493.9114     33.4991      8.5070
+    685.5500   1493.9214     33.4991      8.5070
+    686.1400   1493.9238     33.4991      8.5050
+    686.7300   1493.9111     33.4991      8.4990
+    687.3300   1493.9061     33.4991      8.4950
+    687.9200   1493.8635     33.4991      8.4810
+    688.5200   1493.8397     33.4991      8.4720
+    689.1100   1493.8196     33.4991      8.4640
+    689.7000   1493.7994     33.4991      8.4560
+    690.3000   1493.7794     33.4991      8.4480
+    690.8900   1493.7817     33.4991      8.4460
+    691.4800   1493.7878     33.4991      8.4450
+    692.0800   1493.7941     33.4991      8.4440
+    692.6700   1493.7777     33.4991      8.4370
+    693.2600   1493.7687     33.4991      8.4320
+    693.8600   1493.7111     33.4991      8.4140
+    694.4500   1493.6608     33.4991      8.3980
+    695.0500   1493.6332     33.4991      8.3880
+    695.6400   1493.6055     33.4991      8.3780
+    696.2300   1493.5740     33.4991      8.3670
+    696.8300   1493.6140     33.4991      8.3750
+    697.4200   1493.5787     33.4991      8.3630
+    698.0100   1493.5886     33.4991      8.3630
+    698.6100   1493.5912     33.4991      8.3610
+    699.2000   1493.5822     33.4991      8.3560
+    699.7900   1493.5845     33.4991      8.3540
+    700.3800   1493.6094     33.4991      8.3580
+    700.9800   1493.6044     33.4991      8.3540
+    701.5700   1493.5955     33.4991      8.3490
+    702.1600   1493.5902     33.4991      8.3450
+    702.7600   1493.6002     33.4991      8.3450
+    703.3500   1493.5837     33.4991      8.3380
+    703.9400   1493.5409     33.4991      8.3240
+    704.5300   1493.5243     33.4991      8.3170
+    705.1300   1493.4967     33.4991      8.3070
+    705.7200   1493.5140     33.4991      8.3090
+    706.3100   1493.4938     33.4991      8.3010
+    706.9100   1493.4926     33.4991      8.2980
+    707.5000   1493.4647     33.4991      8.2880
+    708.0900   1493.4633     33.4991      8.2850
+    708.6800   1493.4504     33.4991      8.2790
+    709.2800   1493.4114     33.4991      8.2660
+    709.8700   1493.4025     33.4991      8.2610
+    710.4600   1493.4160     33.4991      8.2620
+    711.0500   1493.4183     33.4991      8.2600
+    711.6500   1493.4247     33.4991      8.2590
+    712.2400   1493.4382     33.4991      8.2600
+    712.8300   1493.4330     33.4991      8.2560
+    713.4200   1493.4467     33.4991      8.2570
+    714.0200   1493.4379     33.4991      8.2520
+    714.6100   1493.4288     33.4991      8.2470
+    715.2000   1493.4274     33.4991      8.2440
+    715.7900   1493.4221     33.4991      8.2400
+    716.3800   1493.4244     33.4991      8.2380
+    716.9800   1493.4117     33.4991      8.2320
+    717.5700   1493.4178     33.4991      8.2310
+    718.1600   1493.4088     33.4991      8.2260
+    718.7500   1493.4149     33.4991      8.2250
+    719.3400   1493.4059     33.4991      8.2200
+    719.9400   1493.4008     33.4991      8.2160
+    720.5300   1493.4220     33.4991      8.2190
+    721.1200   1493.4130     33.4991      8.2140
+    721.7100   1493.4001     33.4991      8.2080
+    722.3000   1493.3534     33.4991      8.1930
+    722.8900   1493.3141     33.4991      8.1800
+    723.4900   1493.2825     33.4991      8.1690
+    724.0800   1493.2583     33.4991      8.1600
+    724.6700   1493.2455     33.4991      8.1540
+    725.2600   1493.2289     33.4991      8.1470
+    725.8500   1493.2426     33.4991      8.1480
+    726.4400   1493.2410     33.4991      8.1450
+    727.0400   1493.2434     33.4991      8.1430
+    727.6300   1493.2382     33.4991      8.1390
+    728.2200   1493.2216     33.4991      8.1320
+    728.8100   1493.2087     33.4991      8.1260
+    729.4000   1493.2185     33.4991      8.1260
+    729.9900   1493.1943     33.4991      8.1170
+    730.5800   1493.2080     33.4991      8.1180
+    731.1700   1493.1990     33.4991      8.1130
+    731.7700   1493.2241     33.4991      8.1170
+    732.3600   1493.2150     33.4991      8.1120
+    732.9500   1493.1567     33.4991      8.0940
+    733.5400   1493.1249     33.4991      8.0830
+    734.1300   1493.0968     33.4991      8.0730
+    734.7200   1493.1067     33.4991      8.0730
+    735.3100   1493.1014     33.4991      8.0690
+    735.9000   1493.0847     33.4991      8.0620
+    736.4900   1493.0908     33.4991      8.0610
+    737.0800   1493.0779     33.4991      8.0550
+    737.6800   1493.0841     33.4991      8.0540
+    738.2700   1493.0789     33.4991      8.0500
+    738.8600   1493.0697     33.4991      8.0450
+    739.4500   1493.0796     33.4991      8.0450
+    740.0400   1493.0895     33.4991      8.0450
+    740.6300   1493.0614     33.4991      8.0350
+    741.2200   1493.0332     33.4991      8.0250
+    741.8100   1493.0013     33.4991      8.0140
+    742.4000   1492.9884     33.4991      8.0080
+    742.9900   1492.9794     33.4991      8.0030
+    743.5800   1492.9626     33.4991      7.9960
+    744.1700   1492.9497     33.4991      7.9900
+    744.7600   1492.9215     33.4991      7.9800
+    745.3500   1492.9276     33.4991      7.9790
+    745.9400   1492.9071     33.4991      7.9710
+    746.5300   1492.9131     33.4991      7.9700
+    747.1200   1492.9078     33.4991      7.9660
+    747.7100   1492.9062     33.4991      7.9630
+    748.3000   1492.8933     33.4991      7.9570
+    748.8900   1492.8842     33.4991      7.9520
+    749.4800   1492.8484     33.4991      7.9400
+    750.0700   1492.8240     33.4991      7.9310
+    750.6600   1492.7920     33.4991      7.9200
+    751.2500   1492.7600     33.4991      7.9090
+    751.8400   1492.7509     33.4991      7.9040
+    752.4300   1492.7379     33.4991      7.8980
+    753.0200   1492.7439     33.4991      7.8970
+    753.6100   1492.7385     33.4991      7.8930
+    754.2000   1492.7446     33.4991      7.8920
+    754.7900   1492.7240     33.4991      7.8840
+    755.3800   1492.7491     33.4991      7.8880
+    755.9700   1492.7285     33.4991      7.8800
+    756.5600   1492.7041     33.4991      7.8710
+    757.1500   1492.6910     33.4991      7.8650
+    757.7400   1492.6781     33.4991      7.8590
+    758.3300   1492.6537     33.4991      7.8500
+    758.9200   1492.6444     33.4991      7.8450
+    759.5100   1492.6390     33.4991      7.8410
+    760.1000   1492.6489     33.4991      7.8410
+    760.6900   1492.6359     33.4991      7.8350
+    761.2800   1492.6534     33.4991      7.8370
+    761.8700   1492.6479     33.4991      7.8330
+    762.4600   1492.6273     33.4991      7.8250
+    763.0500   1492.5647     33.4991      7.8060
+    763.6300   1492.5400     33.4991      7.7970
+    764.2200   1492.4927     33.4991      7.7820
+    764.8100   1492.4644     33.4991      7.7720
+    765.4000   1492.4818     33.4991      7.7740
+    765.9900   1492.4688     33.4991      7.7680
+    766.5800   1492.4672     33.4991      7.7650
+    767.1700   1492.4388     33.4991      7.7550
+    767.7600   1492.3914     33.4991      7.7400
+    768.3500   1492.3094     33.4991      7.7160
+    768.9400   1492.2964     33.4991      7.7100
+    769.5200   1492.2717     33.4991      7.7010
+    770.1100   1492.2126     33.4991      7.6830
+    770.7000   1492.1804     33.4991      7.6720
+    771.2900   1492.1482     33.4991      7.6610
+    771.8800   1492.1198     33.4991      7.6510
+    772.4700   1492.1143     33.4991      7.6470
+    773.0600   1492.1011     33.4991      7.6410
+    773.6400   1492.1031     33.4991      7.6390
+    774.2300   1492.1016     33.4991      7.6360
+    774.8200   1492.0730     33.4991      7.6260
+    775.4100   1492.0522     33.4991      7.6180
+    776.0000   1492.0391     33.4991      7.6120
+    776.5900   1492.0529     33.4991      7.6130
+    777.1800   1492.0243     33.4991      7.6030
+    777.7600   1492.0110     33.4991      7.5970
+    778.3500   1491.9902     33.4991      7.5890
+    778.9400   1491.9731     33.4991      7.5820
+    779.5300   1491.9293     33.4991      7.5680
+    780.1200   1491.9124     33.4991      7.5610
+    780.7000   1491.8760     33.4991      7.5490
+    781.2900   1491.8782     33.4991      7.5470
+    781.8800   1491.8226     33.4991      7.5300
+    782.4700   1491.7941     33.4991      7.5200
+    783.0600   1491.7655     33.4991      7.5100
+    783.6500   1491.7446     33.4991      7.5020
+    784.2300   1491.7197     33.4991      7.4930
+    784.8200   1491.6873     33.4991      7.4820
+    785.4100   1491.6510     33.4991      7.4700
+    786.0000   1491.6686     33.4991      7.4720
+    786.5800   1491.6552     33.4991      7.4660
+    787.1700   1491.6343     33.4991      7.4580
+    787.7600   1491.6018     33.4991      7.4470
+    788.3500   1491.5615     33.4991      7.4340
+    788.9400   1491.5214     33.4991      7.4210
+    789.5200   1491.4886     33.4991      7.4100
+    790.1100   1491.4753     33.4991      7.4040
+    790.7000   1491.4545     33.4991      7.3960
+    791.2900   1491.4412     33.4991      7.3900
+    791.8700   1491.4470     33.4991      7.3890
+    792.4600   1491.4453     33.4991      7.3860
+    793.0500   1491.4513     33.4991      7.3850
+    793.6300   1491.4495     33.4991      7.3820
+    794.2200   1491.4594     33.4991      7.3820
+    794.8100   1491.4576     33.4991      7.3790
+    795.4000   1491.4636     33.4991      7.3780
+    795.9800   1491.4656     33.4991      7.3760
+    796.5700   1491.4601     33.4991      7.3720
+    797.1600   1491.4777     33.4991      7.3740
+    797.7500   1491.4528     33.4991      7.3650
+    798.3300   1491.4432     33.4991      7.3600
+    798.9200   1491.4492     33.4991      7.3590
+    799.5100   1491.4398     33.4991      7.3540
+    800.0900   1491.4225     33.4991      7.3470
+    800.6800   1491.4438     33.4991      7.3500
+    801.2700   1491.4036     33.4991      7.3370
+    801.8500   1491.4133     33.4991      7.3370
+    802.4400   1491.4116     33.4991      7.3340
+    803.0300   1491.3673     33.4991      7.3200
+    803.6100   1491.3539     33.4991      7.3140
+    804.2000   1491.3406     33.4991      7.3080
+    804.7900   1491.3466     33.4991      7.3070
+    805.3700   1491.3215     33.4991      7.2980
+    805.9600   1491.2966     33.4991      7.2890
+    806.5500   1491.2678     33.4991      7.2790
+    807.1300   1491.2272     33.4991      7.2660
+    807.7200   1491.1520     33.4991      7.2440
+    808.3100   1491.0961     33.4991      7.2270
+    808.8900   1491.0709     33.4991      7.2180
+    809.4800   1491.0691     33.4991      7.2150
+    810.0700   1491.0674     33.4991      7.2120
+    810.6500   1491.0771     33.4991      7.2120
+    811.2400   1491.0637     33.4991      7.2060
+    811.8200   1491.0773     33.4991      7.2070
+    812.4100   1491.0601     33.4991      7.2000
+    813.0000   1491.0621     33.4991      7.1980
+    813.5800   1491.0603     33.4991      7.1950
+    814.1700   1491.0275     33.4991      7.1840
+    814.7500   1491.0411     33.4991      7.1850
+    815.3400   1491.0316     33.4991      7.1800
+    815.9300   1491.0453     33.4991      7.1810
+    816.5100   1491.0046     33.4991      7.1680
+    817.1000   1491.0339     33.4991      7.1730
+    817.6800   1491.0204     33.4991      7.1670
+    818.2700   1490.9604     33.4991      7.1490
+    818.8600   1490.9276     33.4991      7.1380
+    819.4400   1490.9296     33.4991      7.1360
+    820.0300   1490.9161     33.4991      7.1300
+    820.6100   1490.9026     33.4991      7.1240
+    821.2000   1490.9202     33.4991      7.1260
+    821.7800   1490.9648     33.4991      7.1350
+    822.3700   1490.9203     33.4991      7.1210
+    822.9600   1490.8798     33.4991      7.1080
+    823.5400   1490.8118     33.4991      7.0880
+    824.1300   1490.7556     33.4991      7.0710
+    824.7100   1490.6642     33.4991      7.0450
+    825.3000   1490.6547     33.4991      7.0400
+    825.8800   1490.6021     33.4991      7.0240
+    826.4700   1490.6119     33.4991      7.0240
+    827.0500   1490.5867     33.4991      7.0150
+    827.6400   1490.5692     33.4991      7.0080
+    828.2200   1490.5518     33.4991      7.0010
+    828.8100   1490.5615     33.4991      7.0010
+    829.3900   1490.5519     33.4991      6.9960
+    829.9800   1490.5305     33.4991      6.9880
+    830.5600   1490.5090     33.4991      6.9800
+    831.1500   1490.4995     33.4991      6.9750
+    831.7300   1490.4780     33.4991      6.9670
+    832.3200   1490.4528     33.4991      6.9580
+    832.9000   1490.4508     33.4991      6.9550
+    833.4900   1490.3866     33.4991      6.9360
+    834.0700   1490.3417     33.4991      6.9220
+    834.6600   1490.2814     33.4991      6.9040
+    835.2400   1490.2833     33.4991      6.9020
+    835.8300   1490.2659     33.4991      6.8950
+    836.4100   1490.2638     33.4991      6.8920
+    837.0000   1490.2659     33.4991      6.8900
+    837.5800   1490.2639     33.4991      6.8870
+    838.1700   1490.2504     33.4991      6.8810
+    838.7500   1490.2639     33.4991      6.8820
+    839.3300   1490.2581     33.4991      6.8780
+    839.9200   1490.2678     33.4991      6.8780
+    840.5000   1490.2542     33.4991      6.8720
+    841.0900   1490.2484     33.4991      6.8680
+    841.6700   1490.2268     33.4991      6.8600
+    842.2600   1490.2015     33.4991      6.8510
+    842.8400   1490.1565     33.4991      6.8370
+    843.4300   1490.1312     33.4991      6.8280
+    844.0100   1490.1018     33.4991      6.8180
+    844.5900   1490.0685     33.4991      6.8070
+    845.1800   1490.0706     33.4991      6.8050
+    845.7600   1490.0725     33.4991      6.8030
+    846.3500   1490.0745     33.4991      6.8010
+    846.9300   1490.0803     33.4991      6.8000
+    847.5100   1490.0665     33.4991      6.7940
+    848.1000   1490.0060     33.4991      6.7760
+    848.6800   1489.9686     33.4991      6.7640
+    849.2700   1489.9707     33.4991      6.7620
+    849.8500   1489.9491     33.4991      6.7540
+    850.4300   1489.9039     33.4991      6.7400
+    851.0200   1489.8668     33.4991      6.7280
+    851.6000   1489.8098     33.4991      6.7110
+    852.1800   1489.8038     33.4991      6.7070
+    852.7700   1489.7902     33.4991      6.7010
+    853.3500   1489.7842     33.4991      6.6970
+    853.9400   1489.7823     33.4991      6.6940
+    854.5200   1489.7606     33.4991      6.6860
+    855.1000   1489.7585     33.4991      6.6830
+    855.6900   1489.7488     33.4991      6.6780
+    856.2700   1489.7389     33.4991      6.6730
+    856.8500   1489.7173     33.4991      6.6650
+    857.4400   1489.6957     33.4991      6.6570
+    858.0200   1489.7094     33.4991      6.6580
+    858.6000   1489.6876     33.4991      6.6500
+    859.1900   1489.6897     33.4991      6.6480
+    859.7700   1489.6483     33.4991      6.6350
+    860.3500   1489.6147     33.4991      6.6240
+    860.9400   1489.5736     33.4991      6.6110
+    861.5200   1489.5714     33.4991      6.6080
+    862.1000   1489.5576     33.4991      6.6020
+    862.6800   1489.5555     33.4991      6.5990
+    863.2700   1489.5536     33.4991      6.5960
+    863.8500   1489.5436     33.4991      6.5910
+    864.4300   1489.5258     33.4991      6.5840
+    865.0200   1489.5042     33.4991      6.5760
+    865.6000   1489.4785     33.4991      6.5670
+    866.1800   1489.4882     33.4991      6.5670
+    866.7600   1489.4585     33.4991      6.5570
+    867.3500   1489.4133     33.4991      6.5430
+    867.9300   1489.3876     33.4991      6.5340
+    868.5100   1489.3816     33.4991      6.5300
+    869.1000   1489.3480     33.4991      6.5190
+    869.6800   1489.3184     33.4991      6.5090
+    870.2600   1489.3124     33.4991      6.5050
+    870.8400   1489.2983     33.4991      6.4990
+    871.4300   1489.2610     33.4991      6.4870
+    872.0100   1489.2352     33.4991      6.4780
+    872.5900   1489.2173     33.4991      6.4710
+    873.1700   1489.1678     33.4991      6.4560
+    873.7600   1489.1224     33.4991      6.4420
+    874.3400   1489.1124     33.4991      6.4370
+    874.9200   1489.0865     33.4991      6.4280
+    875.5000   1489.0608     33.4991      6.4190
+    876.0800   1489.0625     33.4991      6.4170
+    876.6700   1489.0724     33.4991      6.4170
+    877.2500   1489.0861     33.4991      6.4180
+    877.8300   1489.0800     33.4991      6.4140
+    878.4100   1489.0779     33.4991      6.4110
+    878.9900   1489.0363     33.4991      6.3980
+    879.5800   1489.0382     33.4991      6.3960
+    880.1600   1489.0242     33.4991      6.3900
+    880.7400   1488.9825     33.4991      6.3770
+    881.3200   1488.9645     33.4991      6.3700
+    881.9000   1488.9861     33.4991      6.3730
+    882.4900   1488.9880     33.4991      6.3710
+    883.0700   1488.9542     33.4991      6.3600
+    883.6500   1488.9363     33.4991      6.3530
+    884.2300   1488.9065     33.4991      6.3430
+    884.8100   1488.9003     33.4991      6.3390
+    885.3900   1488.8862     33.4991      6.3330
+    885.9800   1488.8566     33.4991      6.3230
+    886.5600   1488.8228     33.4991      6.3120
+    887.1400   1488.8483     33.4991      6.3160
+    887.7200   1488.8422     33.4991      6.3120
+    888.3000   1488.8361     33.4991      6.3080
+    888.8800   1488.8418     33.4991      6.3070
+    889.4700   1488.8199     33.4991      6.2990
+    890.0500   1488.8177     33.4991      6.2960
+    890.6300   1488.7958     33.4991      6.2880
+    891.2100   1488.7897     33.4991      6.2840
+    891.7900   1488.8073     33.4991      6.2860
+    892.3700   1488.7932     33.4991      6.2800
+    892.9500   1488.7910     33.4991      6.2770
+    893.5300   1488.7889     33.4991      6.2740
+    894.1100   1488.7788     33.4991      6.2690
+    894.7000   1488.7887     33.4991      6.2690
+    895.2800   1488.7507     33.4991      6.2570
+    895.8600   1488.7090     33.4991      6.2440
+    896.4400   1488.7068     33.4991      6.2410
+    897.0200   1488.6887     33.4991      6.2340
+    897.6000   1488.6389     33.4991      6.2190
+    898.1800   1488.6288     33.4991      6.2140
+    898.7600   1488.5988     33.4991      6.2040
+    899.3400   1488.5846     33.4991      6.1980
+    899.9200   1488.5864     33.4991      6.1960
+    900.5000   1488.5604     33.4991      6.1870
+    901.0800   1488.5502     33.4991      6.1820
+    901.6700   1488.5323     33.4991      6.1750
+    902.2500   1488.5221     33.4991      6.1700
+    902.8300   1488.4961     33.4991      6.1610
+    903.4100   1488.4661     33.4991      6.1510
+    903.9900   1488.4360     33.4991      6.1410
+    904.5700   1488.3860     33.4991      6.1260
+    905.1500   1488.3718     33.4991      6.1200
+    905.7300   1488.3339     33.4991      6.1080
+    906.3100   1488.3118     33.4991      6.1000
+    906.8900   1488.3413     33.4991      6.1050
+    907.4700   1488.3271     33.4991      6.0990
+    908.0500   1488.3130     33.4991      6.0930
+    908.6300   1488.3267     33.4991      6.0940
+    909.2100   1488.3204     33.4991      6.0900
+    909.7900   1488.3142     33.4991      6.0860
+    910.3700   1488.2921     33.4991      6.0780
+    910.9500   1488.2859     33.4991      6.0740
+    911.5300   1488.2677     33.4991      6.0670
+    912.1100   1488.2734     33.4991      6.0660
+    912.6900   1488.2832     33.4991      6.0660
+    913.2700   1488.3048     33.4991      6.0690
+    913.8500   1488.2866     33.4991      6.0620
+    914.4300   1488.2565     33.4991      6.0520
+    915.0100   1488.2463     33.4991      6.0470
+    915.5900   1488.2241     33.4991      6.0390
+    916.1700   1488.1980     33.4991      6.0300
+    916.7500   1488.1559     33.4991      6.0170
+    917.3300   1488.1495     33.4991      6.0130
+    917.9100   1488.1313     33.4991      6.0060
+    918.4900   1488.1292     33.4991      6.0030
+    919.0700   1488.1149     33.4991      5.9970
+    919.6500   1488.0647     33.4991      5.9820
+    920.2300   1488.0305     33.4991      5.9710
+    920.8000   1488.0001     33.4991      5.9610
+    921.3800   1488.0099     33.4991      5.9610
+    921.9600   1488.0035     33.4991      5.9570
+    922.5400   1487.9894     33.4991      5.9510
+    923.1200   1487.9790     33.4991      5.9460
+    923.7000   1487.9728     33.4991      5.9420
+    924.2800   1487.9785     33.4991      5.9410
+    924.8600   1487.9602     33.4991      5.9340
+    925.4400   1487.9540     33.4991      5.9300
+    926.0200   1487.9357     33.4991      5.9230
+    926.6000   1487.9054     33.4991      5.9130
+    927.1800   1487.8071     33.4991      5.8860
+    927.7500   1487.6965     33.4991      5.8560
+    928.3300   1487.6503     33.4991      5.8420
+    928.9100   1487.6439     33.4991      5.8380
+    929.4900   1487.6016     33.4991      5.8250
+    930.0700   1487.6072     33.4991      5.8240
+    930.6500   1487.5969     33.4991      5.8190
+    931.2300   1487.5946     33.4991      5.8160
+    931.8100   1487.5883     33.4991      5.8120
+    932.3900   1487.5819     33.4991      5.8080
+    932.9600   1487.5995     33.4991      5.8100
+    933.5400   1487.5892     33.4991      5.8050
+    934.1200   1487.5989     33.4991      5.8050
+    934.7000   1487.5846     33.4991      5.7990
+    935.2800   1487.5983     33.4991      5.8000
+    935.8600   1487.5840     33.4991      5.7940
+    936.4300   1487.6135     33.4991      5.7990
+    937.0100   1487.6193     33.4991      5.7980
+    937.5900   1487.6010     33.4991      5.7910
+    938.1700   1487.6066     33.4991      5.7900
+    938.7500   1487.5963     33.4991      5.7850
+    939.3300   1487.5779     33.4991      5.7780
+    939.9000   1487.5875     33.4991      5.7780
+    940.4800   1487.5410     33.4991      5.7640
+    941.0600   1487.5226     33.4991      5.7570
+    941.6400   1487.4882     33.4991      5.7460
+    942.2200   1487.4818     33.4991      5.7420
+    942.7900   1487.4873     33.4991      5.7410
+    943.3700   1487.4971     33.4991      5.7410
+    943.9500   1487.4667     33.4991      5.7310
+    944.5300   1487.4482     33.4991      5.7240
+    945.1100   1487.4258     33.4991      5.7160
+    945.6800   1487.3550     33.4991      5.6960
+    946.2600   1487.3285     33.4991      5.6870
+    946.8400   1487.3020     33.4991      5.6780
+    947.4200   1487.2594     33.4991      5.6650
+    948.0000   1487.2249     33.4991      5.6540
+    948.5700   1487.2223     33.4991      5.6510
+    949.1500   1487.2119     33.4991      5.6460
+    949.7300   1487.1975     33.4991      5.6400
+    950.3100   1487.1750     33.4991      5.6320
+    950.8800   1487.1564     33.4991      5.6250
+    951.4600   1487.1379     33.4991      5.6180
+    952.0400   1487.1355     33.4991      5.6150
+    952.6200   1487.1372     33.4991      5.6130
+    953.1900   1487.1548     33.4991      5.6150
+    953.7700   1487.1323     33.4991      5.6070
+    954.3500   1487.1218     33.4991      5.6020
+    954.9200   1487.1194     33.4991      5.5990
+    955.5000   1487.1210     33.4991      5.5970
+    956.0800   1487.1267     33.4991      5.5960
+    956.6600   1487.1202     33.4991      5.5920
+    957.2300   1487.0895     33.4991      5.5820
+    957.8100   1487.0952     33.4991      5.5810
+    958.3900   1487.0605     33.4991      5.5700
+    958.9600   1487.0540     33.4991      5.5660
+    959.5400   1487.0233     33.4991      5.5560
+    960.1200   1487.0250     33.4991      5.5540
+    960.7000   1487.0105     33.4991      5.5480
+    961.2700   1487.0039     33.4991      5.5440
+    961.8500   1487.0137     33.4991      5.5440
+    962.4300   1486.9790     33.4991      5.5330
+    963.0000   1486.9563     33.4991      5.5250
+    963.5800   1486.9296     33.4991      5.5160
+    964.1600   1486.9070     33.4991      5.5080
+    964.7300   1486.8964     33.4991      5.5030
+    965.3100   1486.8698     33.4991      5.4940
+    965.8900   1486.8673     33.4991      5.4910
+    966.4600   1486.8728     33.4991      5.4900
+    967.0400   1486.8260     33.4991      5.4760
+    967.6200   1486.8357     33.4991      5.4760
+    968.1900   1486.8695     33.4991      5.4820
+    968.7700   1486.8712     33.4991      5.4800
+    969.3400   1486.8564     33.4991      5.4740
+    969.9200   1486.8582     33.4991      5.4720
+    970.5000   1486.8840     33.4991      5.4760
+    971.0700   1486.8168     33.4991      5.4570
+    971.6500   1486.8103     33.4991      5.4530
+    972.2300   1486.8079     33.4991      5.4500
+    972.8000   1486.7163     33.4991      5.4250
+    973.3800   1486.6450     33.4991      5.4050
+    973.9500   1486.6465     33.4991      5.4030
+    974.5300   1486.6238     33.4991      5.3950
+    975.1100   1486.6173     33.4991      5.3910
+    975.6800   1486.6147     33.4991      5.3880
+    976.2600   1486.5961     33.4991      5.3810
+    976.8300   1486.5530     33.4991      5.3680
+    977.4100   1486.5262     33.4999      5.3590
+    977.9900   1486.4954     33.4991      5.3490
+    978.5600   1486.5211     33.4991      5.3530
+    979.1400   1486.4904     33.4999      5.3430
+    979.7100   1486.4917     33.4991      5.3410
+    980.2900   1486.4974     33.4991      5.3400
+    980.8600   1486.5029     33.4991      5.3390
+    981.4400   1486.5045     33.4991      5.3370
+    982.0100   1486.5060     33.4991      5.3350
+    982.5900   1486.4995     33.4991      5.3310
+    983.1700   1486.5092     33.4991      5.3310
+    983.7400   1486.5066     33.4991      5.3280
+    984.3200   1486.4879     33.4991      5.3210
+    984.8900   1486.4650     33.4991      5.3130
+    985.4700   1486.4423     33.4991      5.3050
+    986.0400   1486.4193     33.4991      5.2970
+    986.6200   1486.3478     33.4991      5.2770
+    987.1900   1486.3330     33.4991      5.2710
+    987.7700   1486.3265     33.4999      5.2670
+    988.3400   1486.3116     33.4991      5.2610
+    988.9200   1486.2848     33.4991      5.2520
+    989.4900   1486.2903     33.4991      5.2510
+    990.0700   1486.2756     33.4991      5.2450
+    990.6400   1486.2527     33.4991      5.2370
+    991.2200   1486.2665     33.4991      5.2380
+    991.7900   1486.2394     33.4991      5.2290
+    992.3700   1486.2654     33.4991      5.2330
+    992.9400   1486.2465     33.4991      5.2260
+    993.5200   1486.2725     33.4991      5.2300
+    994.0900   1486.2495     33.4991      5.2220
+    994.6700   1486.2389     33.4991      5.2170
+    995.2400   1486.1956     33.4991      5.2040
+    995.8200   1486.1890     33.4991      5.2000
+    996.3900   1486.1578     33.4991      5.1900
+    996.9700   1486.1514     33.4999      5.1860
+    997.5400   1486.1487     33.4999      5.1830
+    998.1200   1486.1665     33.4991      5.1850
+    998.6900   1486.1313     33.4999      5.1740
+    999.2600   1486.1123     33.4991      5.1670
+    999.8400   1486.0977     33.4999      5.1610
+   1000.4100   1486.0828     33.4999      5.1550
+   1000.9900   1486.0884     33.4991      5.1540
+   1001.5600   1486.0653     33.4991      5.1460
+   1002.1400   1486.0261     33.4991      5.1340
+   1002.7100   1486.0194     33.4991      5.1300
+   1003.2800   1486.0289     33.4991      5.1300
+   1003.8600   1486.0183     33.4991      5.1250
+   1004.4300   1485.9952     33.4991      5.1170
+   1005.0100   1486.0010     33.4999      5.1160
+   1005.5800   1485.9574     33.4991      5.1030
+   1006.1500   1485.9385     33.4999      5.0960
+   1006.7300   1485.9359     33.4991      5.0930
+   1007.3000   1485.9169     33.4991      5.0860
+   1007.8800   1485.8777     33.4999      5.0740
+   1008.4500   1485.8383     33.4999      5.0620
+   1009.0200   1485.8314     33.4991      5.0580
+   1009.6000   1485.8290     33.4999      5.0550
+   1010.1700   1485.8385     33.4999      5.0550
+   1010.7500   1485.8483     33.4999      5.0550
+   1011.3200   1485.8414     33.4991      5.0510
+   1011.8900   1485.8387     33.4991      5.0480
+   1012.4700   1485.8689     33.4991      5.0530
+   1013.0400   1485.8540     33.4999      5.0470
+   1013.6100   1485.8145     33.4991      5.0350
+   1014.1900   1485.7957     33.4999      5.0280
+   1014.7600   1485.7521     33.4999      5.0150
+   1015.3300   1485.7412     33.4999      5.0100
+   1015.9100   1485.7100     33.4991      5.0000
+   1016.4800   1485.7155     33.4991      4.9990
+   1017.0500   1485.6801     33.4999      4.9880
+   1017.6300   1485.6530     33.4999      4.9790
+   1018.2000   1485.6503     33.4999      4.9760
+   1018.7700   1485.6434     33.4999      4.9720
+   1019.3500   1485.6531     33.4991      4.9720
+   1019.9200   1485.6135     33.4991      4.9600
+   1020.4900   1485.6272     33.4991      4.9610
+   1021.0700   1485.6328     33.4991      4.9600
+   1021.6400   1485.6301     33.4991      4.9570
+   1022.2100   1485.6193     33.4999      4.9520
+   1022.7900   1485.6085     33.4999      4.9470
+   1023.3600   1485.5853     33.4999      4.9390
+   1023.9300   1485.6235     33.4999      4.9460
+   1024.5000   1485.5840     33.4999      4.9340
+   1025.0800   1485.5896     33.4999      4.9330
+   1025.6500   1485.5746     33.4999      4.9270
+   1026.2200   1485.5801     33.4999      4.9260
+   1026.7900   1485.5486     33.4991      4.9160
+   1027.3700   1485.5378     33.4999      4.9110
+   1027.9399   1485.5065     33.4999      4.9010
+   1028.5100   1485.5118     33.4991      4.9000
+   1029.0900   1485.5093     33.4991      4.8970
+   1029.6600   1485.4943     33.4999      4.8910
+   1030.2300   1485.5038     33.4991      4.8910
+   1030.8000   1485.5011     33.4999      4.8880
+   1031.3800   1485.4862     33.4991      4.8820
+   1031.9500   1485.4917     33.4999      4.8810
+   1032.5200   1485.5012     33.4991      4.8810
+   1033.0900   1485.4862     33.4999      4.8750
+   1033.6600   1485.4875     33.4991      4.8730
+   1034.2400   1485.4808     33.4991      4.8690
+   1034.8101   1485.4781     33.4999      4.8660
+   1035.3800   1485.4672     33.4991      4.8610
+   1035.9500   1485.4603     33.4999      4.8570
+   1036.5300   1485.4496     33.4999      4.8520
+   1037.1000   1485.4468     33.4991      4.8490
+   1037.6700   1485.4318     33.4999      4.8430
+   1038.2400   1485.4331     33.4999      4.8410
+   1038.8101   1485.4180     33.4991      4.8350
+   1039.3800   1485.4316     33.4991      4.8360
+   1039.9600   1485.4209     33.4999      4.8310
+   1040.5300   1485.3812     33.4999      4.8190
+   1041.1000   1485.3989     33.4991      4.8210
+   1041.6700   1485.3921     33.4999      4.8170
+   1042.2400   1485.3811     33.4999      4.8120
+   1042.8199   1485.3744     33.4999      4.8080
+   1043.3900   1485.3757     33.4991      4.8060
+   1043.9600   1485.3730     33.4999      4.8030
+   1044.5300   1485.3867     33.4999      4.8040
+   1045.1000   1485.3716     33.4999      4.7980
+   1045.6700   1485.3771     33.4999      4.7970
+   1046.2400   1485.3538     33.4999      4.7890
+   1046.8199   1485.3511     33.4991      4.7860
+   1047.3900   1485.3237     33.4999      4.7770
+   1047.9600   1485.3414     33.4991      4.7790
+   1048.5300   1485.3264     33.4999      4.7730
+   1049.1000   1485.3030     33.4991      4.7650
+   1049.6700   1485.3168     33.4999      4.7660
+   1050.2400   1485.3140     33.4999      4.7630
+   1050.8199   1485.3319     33.4999      4.7650
+   1051.3900   1485.3291     33.4991      4.7620
+   1051.9600   1485.3387     33.4999      4.7620
+   1052.5300   1485.3524     33.4999      4.7630
+   1053.1000   1485.3619     33.4999      4.7630
+   1053.6700   1485.3303     33.4991      4.7530
+   1054.2400   1485.3112     33.4999      4.7460
+   1054.8101   1485.3248     33.4999      4.7470
+   1055.3800   1485.2932     33.4999      4.7370
+   1055.9500   1485.2987     33.4999      4.7360
+   1056.5300   1485.2837     33.4991      4.7300
+   1057.1000   1485.2850     33.4999      4.7280
+   1057.6700   1485.2905     33.4999      4.7270
+   1058.2400   1485.3165     33.4999      4.7310
+   1058.8101   1485.3179     33.4999      4.7290
+   1059.3800   1485.3398     33.4999      4.7320
+   1059.9500   1485.3124     33.4999      4.7230
+   1060.5200   1485.3301     33.4991      4.7250
+   1061.0900   1485.3314     33.4991      4.7230
+   1061.6600   1485.2958     33.4999      4.7120
+   1062.2300   1485.3383     33.4999      4.7200
+   1062.8000   1485.2985     33.4999      4.7080
+   1063.3700   1485.2792     33.4999      4.7010
+   1063.9399   1485.2228     33.4999      4.6850
+   1064.5100   1485.2448     33.4999      4.6880
+   1065.0800   1485.2460     33.4991      4.6860
+   1065.6500   1485.2391     33.4999      4.6820
+   1066.2200   1485.2405     33.4999      4.6800
+   1066.7900   1485.2500     33.4999      4.6800
+   1067.3600   1485.2142     33.4999      4.6690
+   1067.9301   1485.1908     33.4999      4.6610
+   1068.5000   1485.1550     33.4999      4.6500
+   1069.0699   1485.1481     33.4999      4.6460
+   1069.6400   1485.1453     33.4999      4.6430
+   1070.2100   1485.1466     33.4999      4.6410
+   1070.7800   1485.1313     33.4991      4.6350
+   1071.3500   1485.1368     33.4999      4.6340
+   1071.9200   1485.1217     33.4999      4.6280
+   1072.4900   1485.1271     33.4999      4.6270
+   1073.0601   1485.1036     33.4999      4.6190
+   1073.6300   1485.1091     33.4999      4.6180
+   1074.2000   1485.0691     33.4999      4.6060
+   1074.7700   1485.0704     33.4999      4.6040
+   1075.3400   1485.0635     33.4999      4.6000
+   1075.9100   1485.0690     33.4999      4.5990
+   1076.4800   1485.0331     33.4999      4.5880
+   1077.0500   1485.0261     33.4999      4.5840
+   1077.6200   1485.0150     33.4999      4.5790
+   1078.1899   1485.0039     33.4999      4.5740
+   1078.7600   1485.0135     33.4999      4.5740
+   1079.3300   1484.9611     33.4999      4.5590
+   1079.9000   1484.9583     33.4999      4.5560
+   1080.4700   1484.9471     33.4999      4.5510
+   1081.0400   1484.9236     33.4999      4.5430
+   1081.6000   1484.9454     33.4999      4.5460
+   1082.1700   1484.9550     33.4999      4.5460
+   1082.7400   1484.9398     33.4999      4.5400
+   1083.3101   1484.9535     33.4999      4.5410
+   1083.8800   1484.9424     33.4999      4.5360
+   1084.4500   1484.9685     33.4999      4.5400
+   1085.0200   1484.9574     33.4999      4.5350
+   1085.5900   1484.9546     33.4999      4.5320
+   1086.1600   1484.9227     33.4999      4.5220
+   1086.7300   1484.8909     33.4999      4.5120
+   1087.2900   1484.9086     33.4999      4.5140
+   1087.8600   1484.9058     33.4999      4.5110
+   1088.4301   1484.8533     33.4999      4.4960
+   1089.0000   1484.9000     33.4991      4.5050
+   1089.5699   1484.8806     33.4999      4.4980
+   1090.1400   1484.8530     33.4999      4.4890
+   1090.7100   1484.8584     33.4999      4.4880
+   1091.2800   1484.8804     33.4999      4.4910
+   1091.8400   1484.8691     33.4999      4.4860
+   1092.4100   1484.8870     33.4999      4.4880
+   1092.9800   1484.8842     33.4999      4.4850
+   1093.5500   1484.8564     33.4999      4.4760
+   1094.1200   1484.8453     33.4999      4.4710
+   1094.6899   1484.8300     33.4999      4.4650
+   1095.2500   1484.8394     33.4999      4.4650
+   1095.8199   1484.8282     33.4999      4.4600
+   1096.3900   1484.8379     33.4999      4.4600
+   1096.9600   1484.8350     33.4999      4.4570
+   1097.5300   1484.8405     33.4999      4.4560
+   1098.1000   1484.8251     33.4999      4.4500
+   1098.6600   1484.8097     33.4999      4.4440
+   1099.2300   1484.8068     33.4999      4.4410
+   1099.8000   1484.8040     33.4999      4.4380
+   1100.3700   1484.7844     33.4999      4.4310
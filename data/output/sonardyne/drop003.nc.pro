@@ -0,0 +1,1835 @@
+test_read_store_and_write
+12/2/2016
+4:41:16
+Probe: XBT
+Source: /root/package/data/input/turo/drop003.nc
+      0.6300   1497.9008     33.4984     12.8430
+      1.2700   1497.6462     33.4991     12.7640
+      1.9000   1497.4448     33.4984     12.7010
+      2.5400   1497.3746     33.4984     12.6770
+      3.1700   1497.3346     33.4984     12.6620
+      3.8100   1497.3285     33.4991     12.6570
+      4.4400   1497.3390     33.4991     12.6570
+      5.0800   1497.3260     33.4991     12.6500
+      5.7100   1497.3196     33.4984     12.6450
+      6.3400   1497.3368     33.4984     12.6470
+      6.9800   1497.4048     33.4991     12.6640
+      7.6100   1497.3647     33.4991     12.6490
+      8.2500   1497.3821     33.4984     12.6510
+      8.8800   1497.4061     33.4991     12.6550
+      9.5100   1497.4940     33.4984     12.6780
+     10.1500   1497.5720     33.4991     12.6980
+     10.7800   1497.6465     33.4991     12.7170
+     11.4200   1497.6134     33.4991     12.7040
+     12.0500   1497.6642     33.4984     12.7160
+     12.6800   1497.5872     33.4984     12.6900
+     13.3200   1497.6282     33.4991     12.6990
+     13.9500   1497.6454     33.4991     12.7010
+     14.5900   1497.6493     33.4991     12.6990
+     15.2200   1497.6429     33.4991     12.6940
+     15.8500   1497.6500     33.4984     12.6930
+     16.4900   1497.6506     33.4991     12.6900
+     17.1200   1497.6577     33.4991     12.6890
+     17.7500   1497.6918     33.4991     12.6960
+     18.3900   1497.6755     33.4991     12.6880
+     19.0200   1497.6725     33.4984     12.6840
+     19.6600   1497.6731     33.4991     12.6810
+     20.2900   1497.6768     33.4984     12.6790
+     20.9200   1497.6840     33.4991     12.6780
+     21.5600   1497.6777     33.4991     12.6730
+     22.1900   1497.6915     33.4984     12.6740
+     22.8200   1497.6987     33.4991     12.6730
+     23.4600   1497.7026     33.4991     12.6710
+     24.0900   1497.6996     33.4984     12.6670
+     24.7200   1497.7135     33.4991     12.6680
+     25.3500   1497.7206     33.4991     12.6670
+     25.9900   1497.7480     33.4984     12.6720
+     26.6200   1497.7417     33.4984     12.6670
+     27.2500   1497.7388     33.4991     12.6630
+     27.8900   1497.7427     33.4991     12.6610
+     28.5200   1497.7532     33.4991     12.6610
+     29.1500   1497.7603     33.4991     12.6600
+     29.7900   1497.7676     33.4991     12.6590
+     30.4200   1497.7747     33.4991     12.6580
+     31.0500   1497.7885     33.4984     12.6590
+     31.6800   1497.7957     33.4991     12.6580
+     32.3200   1497.8029     33.4984     12.6570
+     32.9500   1497.8201     33.4984     12.6590
+     33.5800   1497.8239     33.4991     12.6570
+     34.2200   1497.8345     33.4984     12.6570
+     34.8500   1497.8450     33.4984     12.6570
+     35.4800   1497.8488     33.4991     12.6550
+     36.1100   1497.8660     33.4991     12.6570
+     36.7500   1497.8733     33.4991     12.6560
+     37.3800   1497.8838     33.4991     12.6560
+     38.0100   1497.8875     33.4984     12.6540
+     38.6400   1497.9115     33.4991     12.6580
+     39.2800   1497.9154     33.4991     12.6560
+     39.9100   1497.9225     33.4991     12.6550
+     40.5400   1497.9263     33.4991     12.6530
+     41.1700   1497.9368     33.4991     12.6530
+     41.8000   1497.9438     33.4991     12.6520
+     42.4400   1497.9510     33.4984     12.6510
+     43.0700   1497.9548     33.4984     12.6490
+     43.7000   1497.9653     33.4991     12.6490
+     44.3300   1497.9657     33.4984     12.6460
+     44.9600   1497.9728     33.4984     12.6450
+     45.6000   1497.9835     33.4991     12.6450
+     46.2300   1497.9872     33.4984     12.6430
+     46.8600   1497.9977     33.4984     12.6430
+     47.4900   1498.0082     33.4984     12.6430
+     48.1200   1498.0221     33.4991     12.6440
+     48.7600   1498.0260     33.4991     12.6420
+     49.3900   1498.0297     33.4984     12.6400
+     50.0200   1498.0369     33.4991     12.6390
+     50.6500   1498.0439     33.4991     12.6380
+     51.2800   1498.0510     33.4984     12.6370
+     51.9100   1498.0649     33.4991     12.6380
+     52.5500   1498.0756     33.4991     12.6380
+     53.1800   1498.0759     33.4984     12.6350
+     53.8100   1498.0864     33.4991     12.6350
+     54.4400   1498.0935     33.4984     12.6340
+     55.0700   1498.1007     33.4991     12.6330
+     55.7000   1498.1449     33.4991     12.6430
+     56.3400   1498.1285     33.4991     12.6350
+     56.9700   1498.1492     33.4991     12.6380
+     57.6000   1498.1630     33.4984     12.6390
+     58.2300   1498.1633     33.4984     12.6360
+     58.8600   1498.1772     33.4991     12.6370
+     59.4900   1498.1910     33.4984     12.6380
+     60.1200   1498.2151     33.4991     12.6420
+     60.7500   1498.2087     33.4991     12.6370
+     61.3800   1498.2428     33.4991     12.6440
+     62.0200   1498.2804     33.4984     12.6520
+     62.6500   1498.2505     33.4991     12.6400
+     63.2800   1498.2643     33.4984     12.6410
+     63.9100   1498.2883     33.4991     12.6450
+     64.5400   1498.2920     33.4984     12.6430
+     65.1700   1498.3059     33.4991     12.6440
+     65.8000   1498.3063     33.4991     12.6410
+     66.4300   1498.3101     33.4991     12.6390
+     67.0600   1498.3206     33.4991     12.6390
+     67.6900   1498.3276     33.4991     12.6380
+     68.3200   1498.3347     33.4984     12.6370
+     68.9600   1498.3522     33.4991     12.6390
+     69.5900   1498.3525     33.4991     12.6360
+     70.2200   1498.3698     33.4991     12.6380
+     70.8500   1498.3768     33.4984     12.6370
+     71.4800   1498.3873     33.4984     12.6370
+     72.1100   1498.3877     33.4984     12.6340
+     72.7400   1498.3982     33.4991     12.6340
+     73.3700   1498.3986     33.4984     12.6310
+     74.0000   1498.4192     33.4991     12.6340
+     74.6300   1498.4398     33.4991     12.6370
+     75.2600   1498.4435     33.4984     12.6350
+     75.8900   1498.4507     33.4991     12.6340
+     76.5200   1498.4510     33.4991     12.6310
+     77.1500   1498.4683     33.4991     12.6330
+     77.7800   1498.4753     33.4984     12.6320
+     78.4100   1498.4825     33.4991     12.6310
+     79.0400   1498.4998     33.4991     12.6330
+     79.6700   1498.5068     33.4991     12.6320
+     80.3000   1498.5038     33.4984     12.6280
+     80.9300   1498.5143     33.4984     12.6280
+     81.5600   1498.5215     33.4991     12.6270
+     82.1900   1498.5286     33.4991     12.6260
+     82.8200   1498.5323     33.4991     12.6240
+     83.4500   1498.4989     33.4984     12.6110
+     84.0800   1498.4587     33.4984     12.5960
+     84.7100   1498.4254     33.4991     12.5830
+     85.3400   1498.3750     33.4984     12.5650
+     85.9700   1498.3180     33.4991     12.5450
+     86.6000   1498.2642     33.4991     12.5260
+     87.2300   1498.2002     33.4984     12.5040
+     87.8600   1498.1160     33.4991     12.4760
+     88.4900   1498.0485     33.4984     12.4530
+     89.1200   1497.9302     33.4991     12.4150
+     89.7500   1497.6927     33.4984     12.3420
+     90.3800   1497.4788     33.4991     12.2760
+     91.0100   1497.3599     33.4991     12.2380
+     91.6300   1497.3020     33.4991     12.2180
+     92.2600   1497.2545     33.4991     12.2010
+     92.8900   1497.2173     33.4991     12.1870
+     93.5200   1497.2073     33.4991     12.1810
+     94.1500   1497.1837     33.4991     12.1710
+     94.7800   1497.1259     33.4991     12.1510
+     95.4100   1497.0988     33.4991     12.1400
+     96.0400   1497.0922     33.4991     12.1350
+     96.6700   1497.0651     33.4991     12.1240
+     97.3000   1497.0653     33.4991     12.1210
+     97.9300   1497.0826     33.4991     12.1230
+     98.5500   1497.0793     33.4991     12.1190
+     99.1800   1497.0693     33.4991     12.1130
+     99.8100   1497.0524     33.4991     12.1050
+    100.4400   1497.2815     33.4991     12.1690
+    101.0700   1498.1528     33.4991     12.4220
+    101.7000   1498.2650     33.4984     12.4520
+    102.3300   1498.5160     33.4991     12.5230
+    102.9600   1499.2417     33.4984     12.7350
+    103.5800   1499.4639     33.4991     12.7980
+    104.2100   1499.4945     33.4991     12.8040
+    104.8400   1499.5754     33.4984     12.8250
+    105.4700   1499.2734     33.4991     12.7320
+    106.1000   1499.1863     33.4984     12.7030
+    106.7300   1499.1564     33.4991     12.6910
+    107.3600   1499.1736     33.4984     12.6930
+    107.9800   1499.1805     33.4984     12.6920
+    108.6100   1499.1742     33.4984     12.6870
+    109.2400   1499.1342     33.4991     12.6720
+    109.8700   1499.1177     33.4991     12.6640
+    110.5000   1499.1113     33.4991     12.6590
+    111.1300   1499.1184     33.4984     12.6580
+    111.7500   1499.0883     33.4984     12.6460
+    112.3800   1499.0280     33.4991     12.6250
+    113.0100   1498.9811     33.4991     12.6080
+    113.6400   1498.9409     33.4991     12.5930
+    114.2700   1498.8771     33.4991     12.5710
+    114.8900   1498.7927     33.4984     12.5430
+    115.5200   1498.6611     33.4991     12.5010
+    116.1500   1498.6107     33.4991     12.4830
+    116.7800   1498.5737     33.4984     12.4690
+    117.4100   1498.5808     33.4984     12.4680
+    118.0300   1498.5437     33.4984     12.4540
+    118.6600   1498.5271     33.4991     12.4460
+    119.2900   1498.5105     33.4991     12.4380
+    119.9200   1498.4497     33.4984     12.4170
+    120.5400   1498.3684     33.4984     12.3900
+    121.1700   1498.2567     33.4991     12.3540
+    121.8000   1498.1210     33.4991     12.3110
+    122.4300   1498.0192     33.4991     12.2780
+    123.0500   1497.8865     33.4991     12.2360
+    123.6800   1497.7742     33.4991     12.2000
+    124.3100   1497.7028     33.4991     12.1760
+    124.9400   1497.6519     33.4991     12.1580
+    125.5600   1497.6178     33.4991     12.1450
+    126.1900   1497.6044     33.4991     12.1380
+    126.8200   1497.5909     33.4991     12.1310
+    127.4500   1497.5979     33.4991     12.1300
+    128.0700   1497.5980     33.4991     12.1270
+    128.7000   1497.5641     33.4991     12.1140
+    129.3300   1497.5370     33.4991     12.1030
+    129.9600   1497.5029     33.4991     12.0900
+    130.5800   1497.5133     33.4991     12.0900
+    131.2100   1497.5306     33.4991     12.0920
+    131.8400   1497.5548     33.4991     12.0960
+    132.4600   1497.5789     33.4991     12.1000
+    133.0900   1497.5756     33.4991     12.0960
+    133.7200   1497.5656     33.4991     12.0900
+    134.3400   1497.5450     33.4991     12.0810
+    134.9700   1497.5316     33.4991     12.0740
+    135.6000   1497.4977     33.4991     12.0610
+    136.2200   1497.4634     33.4991     12.0480
+    136.8500   1497.4397     33.4991     12.0380
+    137.4800   1497.4125     33.4991     12.0270
+    138.1000   1497.3954     33.4991     12.0190
+    138.7300   1497.3477     33.4991     12.0020
+    139.3600   1497.2964     33.4991     11.9840
+    139.9800   1497.2689     33.4991     11.9730
+    140.6100   1497.2383     33.4991     11.9610
+    141.2400   1497.2213     33.4991     11.9530
+    141.8600   1497.2041     33.4991     11.9450
+    142.4900   1497.1699     33.4991     11.9320
+    143.1200   1497.1702     33.4991     11.9290
+    143.7400   1497.1976     33.4991     11.9340
+    144.3700   1497.2150     33.4991     11.9360
+    145.0000   1497.2220     33.4991     11.9350
+    145.6200   1497.2427     33.4991     11.9380
+    146.2500   1497.2566     33.4991     11.9390
+    146.8700   1497.2600     33.4991     11.9370
+    147.5000   1497.2603     33.4991     11.9340
+    148.1300   1497.2261     33.4991     11.9210
+    148.7500   1497.1882     33.4991     11.9070
+    149.3800   1497.1713     33.4991     11.8990
+    150.0000   1497.1300     33.4991     11.8840
+    150.6300   1497.0614     33.4991     11.8610
+    151.2600   1496.9824     33.4991     11.8350
+    151.8800   1496.9204     33.4991     11.8140
+    152.5100   1496.8999     33.4991     11.8050
+    153.1300   1496.8516     33.4991     11.7880
+    153.7600   1496.7861     33.4991     11.7660
+    154.3800   1496.7413     33.4991     11.7500
+    155.0100   1496.7311     33.4991     11.7440
+    155.6400   1496.6863     33.4991     11.7280
+    156.2600   1496.6897     33.4991     11.7260
+    156.8900   1496.6692     33.4991     11.7170
+    157.5100   1496.6726     33.4991     11.7150
+    158.1400   1496.6624     33.4991     11.7090
+    158.7600   1496.6554     33.4991     11.7040
+    159.3900   1496.6451     33.4991     11.6980
+    160.0100   1496.5691     33.4991     11.6730
+    160.6400   1496.5623     33.4991     11.6680
+    161.2600   1496.5276     33.4991     11.6550
+    161.8900   1496.4930     33.4991     11.6420
+    162.5200   1496.4413     33.4991     11.6240
+    163.1400   1496.3685     33.4991     11.6000
+    163.7700   1496.3408     33.4991     11.5890
+    164.3900   1496.3339     33.4991     11.5840
+    165.0200   1496.3167     33.4991     11.5760
+    165.6400   1496.3096     33.4991     11.5710
+    166.2700   1496.2958     33.4991     11.5640
+    166.8900   1496.2784     33.4991     11.5560
+    167.5200   1496.2784     33.4991     11.5530
+    168.1400   1496.2784     33.4991     11.5500
+    168.7700   1496.2681     33.4991     11.5440
+    169.3900   1496.2922     33.4991     11.5480
+    170.0200   1496.2924     33.4991     11.5450
+    170.6400   1496.3026     33.4991     11.5450
+    171.2600   1496.2957     33.4991     11.5400
+    171.8900   1496.2853     33.4991     11.5340
+    172.5100   1496.2714     33.4991     11.5270
+    173.1400   1496.2714     33.4991     11.5240
+    173.7600   1496.2748     33.4991     11.5220
+    174.3900   1496.2714     33.4991     11.5180
+    175.0100   1496.2574     33.4991     11.5110
+    175.6400   1496.2644     33.4991     11.5100
+    176.2600   1496.2748     33.4991     11.5100
+    176.8900   1496.3060     33.4991     11.5160
+    177.5100   1496.3198     33.4991     11.5170
+    178.1300   1496.3406     33.4991     11.5200
+    178.7600   1496.3475     33.4991     11.5190
+    179.3800   1496.3545     33.4991     11.5180
+    180.0100   1496.3649     33.4991     11.5180
+    180.6300   1496.3892     33.4991     11.5220
+    181.2600   1496.3892     33.4991     11.5190
+    181.8800   1496.3787     33.4991     11.5130
+    182.5000   1496.3717     33.4991     11.5080
+    183.1300   1496.3544     33.4991     11.5000
+    183.7500   1496.3508     33.4991     11.4960
+    184.3800   1496.3508     33.4991     11.4930
+    185.0000   1496.3507     33.4991     11.4900
+    185.6200   1496.3333     33.4991     11.4820
+    186.2500   1496.3646     33.4991     11.4880
+    186.8700   1496.3611     33.4991     11.4840
+    187.4900   1496.3470     33.4991     11.4770
+    188.1200   1496.3019     33.4991     11.4610
+    188.7400   1496.2670     33.4991     11.4480
+    189.3700   1496.2253     33.4991     11.4330
+    189.9900   1496.1974     33.4991     11.4220
+    190.6100   1496.1520     33.4991     11.4060
+    191.2400   1496.0894     33.4991     11.3850
+    191.8600   1496.0404     33.4991     11.3680
+    192.4800   1496.0298     33.4991     11.3620
+    193.1100   1495.9950     33.4991     11.3490
+    193.7300   1495.9669     33.4991     11.3380
+    194.3500   1495.9564     33.4991     11.3320
+    194.9800   1495.9529     33.4991     11.3280
+    195.6000   1495.9528     33.4991     11.3250
+    196.2200   1495.9596     33.4991     11.3240
+    196.8500   1495.9491     33.4991     11.3180
+    197.4700   1495.9490     33.4991     11.3150
+    198.0900   1495.9453     33.4991     11.3110
+    198.7200   1495.9594     33.4991     11.3120
+    199.3400   1495.9452     33.4991     11.3050
+    199.9600   1495.9136     33.4991     11.2930
+    200.5900   1495.8857     33.4991     11.2820
+    201.2100   1495.8575     33.4991     11.2710
+    201.8300   1495.8330     33.4991     11.2610
+    202.4500   1495.8224     33.4991     11.2550
+    203.0800   1495.7909     33.4991     11.2430
+    203.7000   1495.7837     33.4991     11.2380
+    204.3200   1495.7731     33.4991     11.2320
+    204.9500   1495.7870     33.4991     11.2330
+    205.5700   1495.7833     33.4991     11.2290
+    206.1900   1495.7832     33.4991     11.2260
+    206.8100   1495.7760     33.4991     11.2210
+    207.4400   1495.7725     33.4991     11.2170
+    208.0600   1495.8248     33.4991     11.2290
+    208.6800   1495.8456     33.4991     11.2320
+    209.3000   1495.8734     33.4991     11.2370
+    209.9300   1495.9084     33.4991     11.2440
+    210.5500   1495.9502     33.4991     11.2530
+    211.1700   1495.9675     33.4991     11.2550
+    211.7900   1495.9952     33.4991     11.2600
+    212.4200   1496.0023     33.4991     11.2590
+    213.0400   1496.0161     33.4991     11.2600
+    213.6600   1496.0334     33.4991     11.2620
+    214.2800   1496.0857     33.4991     11.2740
+    214.9000   1496.1029     33.4991     11.2760
+    215.5300   1496.0995     33.4991     11.2720
+    216.1500   1496.1097     33.4991     11.2720
+    216.7700   1496.0957     33.4991     11.2650
+    217.3900   1496.1060     33.4991     11.2650
+    218.0100   1496.1128     33.4991     11.2640
+    218.6400   1496.1233     33.4991     11.2640
+    219.2600   1496.1337     33.4991     11.2640
+    219.8800   1496.1683     33.4991     11.2710
+    220.5000   1496.1857     33.4991     11.2730
+    221.1200   1496.1855     33.4991     11.2700
+    221.7500   1496.2065     33.4991     11.2730
+    222.3700   1496.2063     33.4991     11.2700
+    222.9900   1496.1957     33.4991     11.2640
+    223.6100   1496.1676     33.4991     11.2530
+    224.2300   1496.1675     33.4991     11.2500
+    224.8500   1496.1708     33.4991     11.2480
+    225.4800   1496.1462     33.4991     11.2380
+    226.1000   1496.1287     33.4991     11.2300
+    226.7200   1496.1005     33.4991     11.2190
+    227.3400   1496.0933     33.4991     11.2140
+    227.9600   1496.0966     33.4991     11.2120
+    228.5800   1496.1069     33.4991     11.2120
+    229.2000   1496.1243     33.4991     11.2140
+    229.8300   1496.1663     33.4991     11.2230
+    230.4500   1496.1801     33.4991     11.2240
+    231.0700   1496.2148     33.4991     11.2310
+    231.6900   1496.2286     33.4991     11.2320
+    232.3100   1496.2635     33.4991     11.2390
+    232.9300   1496.2703     33.4991     11.2380
+    233.5500   1496.2947     33.4991     11.2420
+    234.1700   1496.2875     33.4991     11.2370
+    234.7900   1496.2733     33.4991     11.2300
+    235.4200   1496.2943     33.4991     11.2330
+    236.0400   1496.3326     33.4991     11.2410
+    236.6600   1496.3324     33.4991     11.2380
+    237.2800   1496.3392     33.4991     11.2370
+    237.9000   1496.3286     33.4991     11.2310
+    238.5200   1496.3250     33.4991     11.2270
+    239.1400   1496.3177     33.4991     11.2220
+    239.7600   1496.3036     33.4991     11.2150
+    240.3800   1496.2964     33.4991     11.2100
+    241.0000   1496.3068     33.4991     11.2100
+    241.6200   1496.3275     33.4991     11.2130
+    242.2400   1496.2749     33.4991     11.1950
+    242.8600   1496.2537     33.4991     11.1860
+    243.4800   1496.2500     33.4991     11.1820
+    244.1100   1496.1835     33.4991     11.1600
+    244.7300   1496.1272     33.4991     11.1410
+    245.3500   1496.0989     33.4991     11.1300
+    245.9700   1496.0881     33.4991     11.1240
+    246.5900   1496.6796     33.4991     11.2900
+    247.2100   1499.1271     33.4991     11.9940
+    247.8300   1500.3705     33.4991     12.3550
+    248.4500   1501.8248     33.4984     12.7820
+    249.0700   1503.3368     33.4984     13.2310
+    249.6900   1504.1329     33.4984     13.4680
+    250.3100   1504.6677     33.4984     13.6270
+    250.9300   1505.0463     33.4984     13.7390
+    251.5500   1505.1484     33.4984     13.7670
+    252.1700   1505.2572     33.4984     13.7970
+    252.7900   1505.4641     33.4984     13.8570
+    253.4100   1504.7327     33.4984     13.6310
+    254.0300   1504.6903     33.4984     13.6150
+    254.6500   1504.5524     33.4984     13.5700
+    255.2700   1503.5499     33.4984     13.2640
+    255.8900   1502.6667     33.4984     12.9960
+    256.5100   1498.0826     33.4991     11.6460
+    257.1300   1502.7911     33.4984     13.0270
+    257.7500   1502.5941     33.4984     12.9650
+    258.3700   1502.1987     33.4991     12.8440
+    258.9900   1502.0713     33.4984     12.8030
+    259.6100   1502.0110     33.4984     12.7820
+    260.2200   1501.9000     33.4984     12.7460
+    260.8400   1501.7689     33.4991     12.7040
+    261.4600   1501.6578     33.4984     12.6680
+    262.0800   1501.6108     33.4991     12.6510
+    262.7000   1501.5671     33.4984     12.6350
+    263.3200   1501.4728     33.4984     12.6040
+    263.9400   1501.3953     33.4991     12.5780
+    264.5600   1501.2533     33.4984     12.5330
+    265.1800   1501.1451     33.4991     12.4980
+    265.8000   1501.0470     33.4984     12.4660
+    266.4200   1500.9081     33.4991     12.4220
+    267.0400   1500.7893     33.4984     12.3840
+    267.6600   1500.7079     33.4984     12.3570
+    268.2700   1500.5411     33.4991     12.3050
+    268.8900   1500.2856     33.4991     12.2270
+    269.5100   1500.0023     33.4991     12.1410
+    270.1300   1499.6360     33.4991     12.0310
+    270.7500   1499.3580     33.4991     11.9470
+    271.3700   1499.2172     33.4991     11.9030
+    271.9900   1499.0898     33.4991     11.8630
+    272.6100   1498.9968     33.4991     11.8330
+    273.2300   1498.9348     33.4991     11.8120
+    273.8400   1498.8794     33.4991     11.7930
+    274.4600   1498.8346     33.4991     11.7770
+    275.0800   1498.7655     33.4991     11.7540
+    275.7000   1498.6860     33.4991     11.7280
+    276.3200   1498.6342     33.4991     11.7100
+    276.9400   1498.6064     33.4991     11.6990
+    277.5600   1498.5684     33.4991     11.6850
+    278.1700   1498.5266     33.4991     11.6700
+    278.7900   1498.5162     33.4991     11.6640
+    279.4100   1498.4781     33.4991     11.6500
+    280.0300   1498.4435     33.4991     11.6370
+    280.6500   1498.4053     33.4991     11.6230
+    281.2700   1498.3844     33.4991     11.6140
+    281.8800   1498.3530     33.4991     11.6020
+    282.5000   1498.3529     33.4991     11.5990
+    283.1200   1498.4326     33.4991     11.6190
+    283.7400   1498.4048     33.4991     11.6080
+    284.3600   1498.3909     33.4991     11.6010
+    284.9800   1498.3423     33.4991     11.5840
+    285.5900   1498.3594     33.4991     11.5860
+    286.2100   1498.3662     33.4991     11.5850
+    286.8300   1498.3350     33.4991     11.5730
+    287.4500   1498.3348     33.4991     11.5700
+    288.0600   1498.3381     33.4991     11.5680
+    288.6800   1498.3380     33.4991     11.5650
+    289.3000   1498.3518     33.4991     11.5660
+    289.9200   1498.3483     33.4991     11.5620
+    290.5400   1498.3481     33.4991     11.5590
+    291.1500   1498.3202     33.4991     11.5480
+    291.7700   1498.3236     33.4991     11.5460
+    292.3900   1498.3374     33.4991     11.5470
+    293.0100   1498.2921     33.4991     11.5310
+    293.6200   1498.3301     33.4991     11.5390
+    294.2400   1498.3231     33.4991     11.5340
+    294.8600   1498.3265     33.4991     11.5320
+    295.4800   1498.3055     33.4991     11.5230
+    296.0900   1498.2498     33.4991     11.5040
+    296.7100   1498.2148     33.4991     11.4910
+    297.3300   1498.1904     33.4991     11.4810
+    297.9500   1498.1730     33.4991     11.4730
+    298.5600   1498.1831     33.4991     11.4730
+    299.1800   1498.2178     33.4991     11.4800
+    299.8000   1498.2490     33.4991     11.4860
+    300.4100   1498.2349     33.4991     11.4790
+    301.0300   1498.1616     33.4991     11.4550
+    301.6500   1498.1024     33.4991     11.4350
+    302.2700   1498.0953     33.4991     11.4300
+    302.8800   1498.1160     33.4991     11.4330
+    303.5000   1498.1262     33.4991     11.4330
+    304.1200   1498.1853     33.4991     11.4470
+    304.7300   1498.1956     33.4991     11.4470
+    305.3500   1498.2754     33.4991     11.4670
+    305.9700   1498.3866     33.4991     11.4960
+    306.5800   1498.4210     33.4991     11.5030
+    307.2000   1498.4280     33.4991     11.5020
+    307.8200   1498.4313     33.4991     11.5000
+    308.4300   1498.4310     33.4991     11.4970
+    309.0500   1498.4136     33.4991     11.4890
+    309.6700   1498.3649     33.4991     11.4720
+    310.2800   1498.2567     33.4991     11.4380
+    310.9000   1498.2288     33.4991     11.4270
+    311.5200   1498.1868     33.4991     11.4120
+    312.1300   1498.1656     33.4991     11.4030
+    312.7500   1498.1516     33.4991     11.3960
+    313.3700   1498.1549     33.4991     11.3940
+    313.9800   1498.1442     33.4991     11.3880
+    314.6000   1498.1301     33.4991     11.3810
+    315.2200   1498.0986     33.4991     11.3690
+    315.8300   1498.0984     33.4991     11.3660
+    316.4500   1498.1122     33.4991     11.3670
+    317.0600   1498.0909     33.4991     11.3580
+    317.6800   1498.1187     33.4991     11.3630
+    318.3000   1498.1221     33.4991     11.3610
+    318.9100   1498.1218     33.4991     11.3580
+    319.5300   1498.1460     33.4991     11.3620
+    320.1400   1498.1562     33.4991     11.3620
+    320.7600   1498.1770     33.4991     11.3650
+    321.3800   1498.2048     33.4991     11.3700
+    321.9900   1498.2010     33.4991     11.3660
+    322.6100   1498.1938     33.4991     11.3610
+    323.2200   1498.1936     33.4991     11.3580
+    323.8400   1498.1830     33.4991     11.3520
+    324.4600   1498.1654     33.4991     11.3440
+    325.0700   1498.1721     33.4991     11.3430
+    325.6900   1498.1720     33.4991     11.3400
+    326.3000   1498.1228     33.4991     11.3230
+    326.9200   1498.0912     33.4991     11.3110
+    327.5300   1498.0804     33.4991     11.3050
+    328.1500   1498.0663     33.4991     11.2980
+    328.7600   1498.0381     33.4991     11.2870
+    329.3800   1498.0205     33.4991     11.2790
+    329.9900   1497.9956     33.4991     11.2690
+    330.6100   1497.9780     33.4991     11.2610
+    331.2300   1497.9708     33.4991     11.2560
+    331.8400   1497.9181     33.4991     11.2380
+    332.4600   1497.9109     33.4991     11.2330
+    333.0700   1497.8685     33.4991     11.2180
+    333.6900   1497.8474     33.4991     11.2090
+    334.3000   1497.8156     33.4991     11.1970
+    334.9200   1497.8154     33.4991     11.1940
+    335.5300   1497.8186     33.4991     11.1920
+    336.1500   1497.7904     33.4991     11.1810
+    336.7600   1497.7620     33.4991     11.1700
+    337.3800   1497.7723     33.4991     11.1700
+    337.9900   1497.7755     33.4991     11.1680
+    338.6100   1497.7788     33.4991     11.1660
+    339.2200   1497.7784     33.4991     11.1630
+    339.8400   1497.7922     33.4991     11.1640
+    340.4500   1497.8025     33.4991     11.1640
+    341.0700   1497.8127     33.4991     11.1640
+    341.6800   1497.8159     33.4991     11.1620
+    342.3000   1497.8613     33.4991     11.1720
+    342.9100   1497.8435     33.4991     11.1640
+    343.5200   1497.8572     33.4991     11.1650
+    344.1400   1497.8429     33.4991     11.1580
+    344.7500   1497.8040     33.4991     11.1440
+    345.3700   1497.7863     33.4991     11.1360
+    345.9800   1497.7614     33.4991     11.1260
+    346.6000   1497.7682     33.4991     11.1250
+    347.2100   1497.7538     33.4991     11.1180
+    347.8300   1497.7535     33.4991     11.1150
+    348.4400   1497.7532     33.4991     11.1120
+    349.0500   1497.7563     33.4991     11.1100
+    349.6700   1497.7527     33.4991     11.1060
+    350.2800   1497.7383     33.4991     11.0990
+    350.9000   1497.7380     33.4991     11.0960
+    351.5100   1497.7448     33.4991     11.0950
+    352.1300   1497.7410     33.4991     11.0910
+    352.7400   1497.7653     33.4991     11.0950
+    353.3500   1497.7578     33.4991     11.0900
+    353.9700   1497.7155     33.4991     11.0750
+    354.5800   1497.6940     33.4991     11.0660
+    355.1900   1497.7042     33.4991     11.0660
+    355.8100   1497.7532     33.4991     11.0770
+    356.4200   1497.8020     33.4991     11.0880
+    357.0400   1497.8298     33.4991     11.0930
+    357.6500   1497.8401     33.4991     11.0930
+    358.2600   1498.2290     33.4991     11.2010
+    358.8800   1498.3093     33.4991     11.2210
+    359.4900   1498.2180     33.4991     11.1920
+    360.1000   1498.1440     33.4991     11.1680
+    360.7200   1498.0807     33.4991     11.1470
+    361.3300   1498.0103     33.4991     11.1240
+    361.9500   1497.9644     33.4991     11.1080
+    362.5600   1497.9325     33.4991     11.0960
+    363.1700   1497.8899     33.4991     11.0810
+    363.7900   1497.8511     33.4991     11.0670
+    364.4000   1497.8507     33.4991     11.0640
+    365.0100   1497.8081     33.4991     11.0490
+    365.6300   1497.7798     33.4991     11.0380
+    366.2400   1497.7618     33.4991     11.0300
+    366.8500   1497.7439     33.4991     11.0220
+    367.4700   1497.7225     33.4991     11.0130
+    368.0800   1497.7115     33.4991     11.0070
+    368.6900   1497.7076     33.4991     11.0030
+    369.3000   1497.7213     33.4991     11.0040
+    369.9200   1497.7070     33.4991     10.9970
+    370.5300   1497.7137     33.4991     10.9960
+    371.1400   1497.7133     33.4991     10.9930
+    371.7600   1497.7130     33.4991     10.9900
+    372.3700   1497.6810     33.4991     10.9780
+    372.9800   1497.6700     33.4991     10.9720
+    373.6000   1497.6345     33.4991     10.9590
+    374.2100   1497.6235     33.4991     10.9530
+    374.8200   1497.6232     33.4991     10.9500
+    375.4300   1497.6016     33.4991     10.9410
+    376.0500   1497.5908     33.4991     10.9350
+    376.6600   1497.5903     33.4991     10.9320
+    377.2700   1497.5793     33.4991     10.9260
+    377.8800   1497.5754     33.4991     10.9220
+    378.5000   1497.5858     33.4991     10.9220
+    379.1100   1497.6030     33.4991     10.9240
+    379.7200   1497.5991     33.4991     10.9200
+    380.3300   1497.5986     33.4991     10.9170
+    380.9500   1497.6055     33.4991     10.9160
+    381.5600   1497.5945     33.4991     10.9100
+    382.1700   1497.5729     33.4991     10.9010
+    382.7800   1497.5690     33.4991     10.8970
+    383.4000   1497.5723     33.4991     10.8950
+    384.0100   1497.5330     33.4991     10.8810
+    384.6200   1497.5396     33.4991     10.8800
+    385.2300   1497.5427     33.4991     10.8780
+    385.8400   1497.5317     33.4991     10.8720
+    386.4600   1497.5314     33.4991     10.8690
+    387.0700   1497.5310     33.4991     10.8660
+    387.6800   1497.5376     33.4991     10.8650
+    388.2900   1497.5443     33.4991     10.8640
+    388.9000   1497.5509     33.4991     10.8630
+    389.5200   1497.5507     33.4991     10.8600
+    390.1300   1497.5750     33.4991     10.8640
+    390.7400   1497.5533     33.4991     10.8550
+    391.3500   1497.5493     33.4991     10.8510
+    391.9600   1497.5878     33.4991     10.8590
+    392.5700   1497.5980     33.4991     10.8590
+    393.1900   1497.6224     33.4991     10.8630
+    393.8000   1497.6255     33.4991     10.8610
+    394.4100   1497.6216     33.4991     10.8570
+    395.0200   1497.6141     33.4991     10.8520
+    395.6300   1497.6066     33.4991     10.8470
+    396.2400   1497.5991     33.4991     10.8420
+    396.8600   1497.5953     33.4991     10.8380
+    397.4700   1497.5878     33.4991     10.8330
+    398.0800   1497.5908     33.4991     10.8310
+    398.6900   1497.5975     33.4991     10.8300
+    399.3000   1497.5864     33.4991     10.8240
+    399.9100   1497.5754     33.4991     10.8180
+    400.5200   1497.5643     33.4991     10.8120
+    401.1300   1497.5356     33.4991     10.8010
+    401.7500   1497.5177     33.4991     10.7930
+    402.3600   1497.4995     33.4991     10.7850
+    402.9700   1497.4955     33.4991     10.7810
+    403.5800   1497.4951     33.4991     10.7780
+    404.1900   1497.4557     33.4991     10.7640
+    404.8000   1497.3773     33.4991     10.7390
+    405.4100   1497.3271     33.4991     10.7220
+    406.0200   1497.2983     33.4991     10.7110
+    406.6300   1497.2802     33.4991     10.7030
+    407.2400   1497.2903     33.4991     10.7030
+    407.8500   1497.2863     33.4991     10.6990
+    408.4700   1497.2896     33.4991     10.6970
+    409.0800   1497.2714     33.4991     10.6890
+    409.6900   1497.2424     33.4991     10.6780
+    410.3000   1497.2349     33.4991     10.6730
+    410.9100   1497.2415     33.4991     10.6720
+    411.5200   1497.2410     33.4991     10.6690
+    412.1300   1497.2583     33.4991     10.6710
+    412.7400   1497.2578     33.4991     10.6680
+    413.3500   1497.2787     33.4991     10.6710
+    413.9600   1497.2959     33.4991     10.6730
+    414.5700   1497.3132     33.4991     10.6750
+    415.1800   1497.3518     33.4991     10.6830
+    415.7900   1497.3619     33.4991     10.6830
+    416.4000   1497.3934     33.4991     10.6890
+    417.0100   1497.4036     33.4991     10.6890
+    417.6200   1497.4243     33.4991     10.6920
+    418.2300   1497.4310     33.4991     10.6910
+    418.8400   1497.4341     33.4991     10.6890
+    419.4500   1497.4407     33.4991     10.6880
+    420.0600   1497.4473     33.4991     10.6870
+    420.6700   1497.4540     33.4991     10.6860
+    421.2800   1497.4500     33.4991     10.6820
+    421.8900   1497.4565     33.4991     10.6810
+    422.5000   1497.4561     33.4991     10.6780
+    423.1100   1497.3633     33.4991     10.6490
+    423.7200   1497.3202     33.4991     10.6340
+    424.3300   1497.2948     33.4991     10.6240
+    424.9400   1497.2588     33.4991     10.6110
+    425.5500   1497.2120     33.4991     10.5950
+    426.1600   1497.1475     33.4991     10.5740
+    426.7700   1497.1256     33.4991     10.5650
+    427.3800   1497.1251     33.4991     10.5620
+    427.9900   1497.1139     33.4991     10.5560
+    428.6000   1497.1134     33.4991     10.5530
+    429.2100   1497.0524     33.4991     10.5330
+    429.8200   1497.0126     33.4991     10.5190
+    430.4300   1497.0015     33.4991     10.5130
+    431.0400   1496.9866     33.4991     10.5060
+    431.6500   1497.0182     33.4991     10.5120
+    432.2600   1497.0142     33.4991     10.5080
+    432.8700   1497.0171     33.4991     10.5060
+    433.4700   1497.0343     33.4991     10.5080
+    434.0800   1497.0302     33.4991     10.5040
+    434.6900   1497.0546     33.4991     10.5080
+    435.3000   1497.0327     33.4991     10.4990
+    435.9100   1497.0144     33.4991     10.4910
+    436.5200   1496.9995     33.4991     10.4840
+    437.1300   1496.9919     33.4991     10.4790
+    437.7400   1496.9985     33.4991     10.4780
+    438.3500   1496.9836     33.4991     10.4710
+    438.9600   1496.9974     33.4991     10.4720
+    439.5600   1496.9789     33.4991     10.4640
+    440.1700   1496.9606     33.4991     10.4560
+    440.7800   1496.9885     33.4991     10.4610
+    441.3900   1496.9666     33.4991     10.4520
+    442.0000   1496.9696     33.4991     10.4500
+    442.6100   1496.9548     33.4991     10.4430
+    443.2200   1496.9685     33.4991     10.4440
+    443.8300   1496.9645     33.4991     10.4400
+    444.4300   1496.9888     33.4991     10.4440
+    445.0400   1496.9703     33.4991     10.4360
+    445.6500   1496.9734     33.4991     10.4340
+    446.2600   1496.9622     33.4991     10.4280
+    446.8700   1496.9866     33.4991     10.4320
+    447.4800   1497.0074     33.4991     10.4350
+    448.0900   1496.9927     33.4991     10.4280
+    448.6900   1496.9883     33.4991     10.4240
+    449.3000   1496.9950     33.4991     10.4230
+    449.9100   1496.9908     33.4991     10.4190
+    450.5200   1497.0010     33.4991     10.4190
+    451.1300   1497.0469     33.4991     10.4290
+    451.7300   1497.0854     33.4991     10.4370
+    452.3400   1497.1063     33.4991     10.4400
+    452.9500   1497.1094     33.4991     10.4380
+    453.5600   1497.0981     33.4991     10.4320
+    454.1700   1497.1262     33.4991     10.4370
+    454.7800   1497.1292     33.4991     10.4350
+    455.3800   1497.1356     33.4991     10.4340
+    455.9900   1497.1279     33.4991     10.4290
+    456.6000   1497.1453     33.4991     10.4310
+    457.2100   1497.1661     33.4991     10.4340
+    457.8100   1497.1691     33.4991     10.4320
+    458.4200   1497.2007     33.4991     10.4380
+    459.0300   1497.2466     33.4991     10.4480
+    459.6400   1497.3745     33.4991     10.4810
+    460.2500   1497.4310     33.4991     10.4940
+    460.8500   1497.4481     33.4991     10.4960
+    461.4600   1497.4512     33.4991     10.4940
+    462.0700   1497.4685     33.4991     10.4960
+    462.6800   1497.4645     33.4991     10.4920
+    463.2800   1497.4495     33.4991     10.4850
+    463.8900   1497.4561     33.4991     10.4840
+    464.5000   1497.3949     33.4991     10.4640
+    465.1100   1497.3123     33.4991     10.4380
+    465.7100   1497.2830     33.4991     10.4270
+    466.3200   1497.2645     33.4991     10.4190
+    466.9300   1497.2640     33.4991     10.4160
+    467.5300   1497.2668     33.4991     10.4140
+    468.1400   1497.2842     33.4991     10.4160
+    468.7500   1497.3193     33.4991     10.4230
+    469.3600   1497.3259     33.4991     10.4220
+    469.9600   1497.3324     33.4991     10.4210
+    470.5700   1497.3783     33.4991     10.4310
+    471.1800   1497.3813     33.4991     10.4290
+    471.7800   1497.4377     33.4991     10.4420
+    472.3900   1497.4515     33.4991     10.4430
+    473.0000   1497.4581     33.4991     10.4420
+    473.6000   1497.4396     33.4991     10.4340
+    474.2100   1497.4141     33.4991     10.4240
+    474.8200   1497.3849     33.4991     10.4130
+    475.4200   1497.3699     33.4991     10.4060
+    476.0300   1497.3586     33.4991     10.4000
+    476.6400   1497.3652     33.4991     10.3990
+    477.2400   1497.3538     33.4991     10.3930
+    477.8500   1497.3676     33.4991     10.3940
+    478.4600   1497.3741     33.4991     10.3930
+    479.0600   1497.3591     33.4991     10.3860
+    479.6700   1497.3442     33.4991     10.3790
+    480.2800   1497.3401     33.4991     10.3750
+    480.8800   1497.3108     33.4991     10.3640
+    481.4900   1497.3031     33.4991     10.3590
+    482.1000   1497.2917     33.4991     10.3530
+    482.7000   1497.3125     33.4991     10.3560
+    483.3100   1497.3298     33.4991     10.3580
+    483.9200   1497.3436     33.4991     10.3590
+    484.5200   1497.3607     33.4991     10.3610
+    485.1300   1497.3530     33.4991     10.3560
+    485.7300   1497.3738     33.4991     10.3590
+    486.3400   1497.3768     33.4991     10.3570
+    486.9500   1497.3799     33.4991     10.3550
+    487.5500   1497.3755     33.4991     10.3510
+    488.1600   1497.3857     33.4991     10.3510
+    488.7600   1497.3993     33.4991     10.3520
+    489.3700   1497.4095     33.4991     10.3520
+    489.9800   1497.4232     33.4991     10.3530
+    490.5800   1497.4297     33.4991     10.3520
+    491.1900   1497.4470     33.4991     10.3540
+    491.7900   1497.4570     33.4991     10.3540
+    492.4000   1497.4601     33.4991     10.3520
+    493.0000   1497.4701     33.4991     10.3520
+    493.6100   1497.4945     33.4991     10.3560
+    494.2200   1497.5155     33.4991     10.3590
+    494.8200   1497.5326     33.4991     10.3610
+    495.4300   1497.5321     33.4991     10.3580
+    496.0300   1497.5278     33.4991     10.3540
+    496.6400   1497.5344     33.4991     10.3530
+    497.2400   1497.5480     33.4991     10.3540
+    497.8500   1497.5618     33.4991     10.3550
+    498.4500   1497.6003     33.4991     10.3630
+    499.0600   1497.5999     33.4991     10.3600
+    499.6600   1497.6062     33.4991     10.3590
+    500.2700   1497.6165     33.4991     10.3590
+    500.8700   1497.6050     33.4991     10.3530
+    501.4800   1497.6116     33.4991     10.3520
+    502.0800   1497.5858     33.4991     10.3420
+    502.6900   1497.5817     33.4991     10.3380
+    503.3000   1497.5883     33.4991     10.3370
+    503.9000   1497.5839     33.4991     10.3330
+    504.5100   1497.5906     33.4991     10.3320
+    505.1100   1497.5934     33.4991     10.3300
+    505.7200   1497.6035     33.4991     10.3300
+    506.3200   1497.6172     33.4991     10.3310
+    506.9200   1497.6200     33.4991     10.3290
+    507.5300   1497.5908     33.4991     10.3180
+    508.1300   1497.5829     33.4991     10.3130
+    508.7400   1497.5573     33.4991     10.3030
+    509.3400   1497.5673     33.4991     10.3030
+    509.9500   1497.5559     33.4991     10.2970
+    510.5500   1497.5552     33.4991     10.2940
+    511.1600   1497.5725     33.4991     10.2960
+    511.7600   1497.5610     33.4991     10.2900
+    512.3700   1497.5210     33.4991     10.2760
+    512.9700   1497.3695     33.4991     10.2310
+    513.5800   1497.3007     33.4991     10.2090
+    514.1800   1497.2280     33.4991     10.1860
+    514.7800   1497.2164     33.4991     10.1800
+    515.3900   1497.2051     33.4991     10.1740
+    515.9900   1497.1935     33.4991     10.1680
+    516.6000   1497.1642     33.4991     10.1570
+    517.2000   1497.1057     33.4991     10.1380
+    517.8100   1497.0728     33.4991     10.1260
+    518.4100   1497.0756     33.4991     10.1240
+    519.0100   1497.0748     33.4991     10.1210
+    519.6200   1497.0741     33.4991     10.1180
+    520.2200   1497.0842     33.4991     10.1180
+    520.8300   1497.0907     33.4991     10.1170
+    521.4300   1497.1007     33.4991     10.1170
+    522.0300   1497.1107     33.4991     10.1170
+    522.6400   1497.1101     33.4991     10.1140
+    523.2400   1497.1310     33.4991     10.1170
+    523.8500   1497.1520     33.4991     10.1200
+    524.4500   1497.1548     33.4991     10.1180
+    525.0500   1497.1611     33.4991     10.1170
+    525.6600   1497.1821     33.4991     10.1200
+    526.2600   1497.1814     33.4991     10.1170
+    526.8600   1497.1842     33.4991     10.1150
+    527.4700   1497.2159     33.4991     10.1210
+    528.0700   1497.2224     33.4991     10.1200
+    528.6700   1497.2576     33.4991     10.1270
+    529.2800   1497.2930     33.4991     10.1340
+    529.8800   1497.3030     33.4991     10.1340
+    530.4900   1497.3240     33.4991     10.1370
+    531.0900   1497.3376     33.4991     10.1380
+    531.6900   1497.3584     33.4991     10.1410
+    532.3000   1497.3794     33.4991     10.1440
+    532.9000   1497.4073     33.4991     10.1490
+    533.5000   1497.4174     33.4991     10.1490
+    534.1100   1497.4348     33.4991     10.1510
+    534.7100   1497.4520     33.4991     10.1530
+    535.3100   1497.4692     33.4991     10.1550
+    535.9100   1497.5009     33.4991     10.1610
+    536.5200   1497.5361     33.4991     10.1680
+    537.1200   1497.5461     33.4991     10.1680
+    537.7200   1497.5598     33.4991     10.1690
+    538.3300   1497.5664     33.4991     10.1680
+    538.9300   1497.5728     33.4991     10.1670
+    539.5300   1497.5936     33.4991     10.1700
+    540.1400   1497.6074     33.4991     10.1710
+    540.7400   1497.5958     33.4991     10.1650
+    541.3400   1497.5483     33.4991     10.1490
+    541.9400   1497.5295     33.4991     10.1410
+    542.5500   1497.5073     33.4991     10.1320
+    543.1500   1497.5245     33.4991     10.1340
+    543.7500   1497.5381     33.4991     10.1350
+    544.3500   1497.5229     33.4991     10.1280
+    544.9600   1497.5656     33.4991     10.1370
+    545.5600   1497.5359     33.4991     10.1260
+    546.1600   1497.5135     33.4991     10.1170
+    546.7600   1497.4984     33.4991     10.1100
+    547.3700   1497.4797     33.4991     10.1020
+    547.9700   1497.5078     33.4991     10.1070
+    548.5700   1497.4998     33.4991     10.1020
+    549.1700   1497.5314     33.4991     10.1080
+    549.7800   1497.5488     33.4991     10.1100
+    550.3800   1497.5984     33.4991     10.1210
+    550.9800   1497.5977     33.4991     10.1180
+    551.5800   1497.6184     33.4991     10.1210
+    552.1800   1497.6249     33.4991     10.1200
+    552.7900   1497.6243     33.4991     10.1170
+    553.3900   1497.6343     33.4991     10.1170
+    553.9900   1497.6478     33.4991     10.1180
+    554.5900   1497.6255     33.4991     10.1090
+    555.1900   1497.6067     33.4991     10.1010
+    555.8000   1497.5808     33.4991     10.0910
+    556.4000   1497.5801     33.4991     10.0880
+    557.0000   1497.5757     33.4991     10.0840
+    557.6000   1497.5676     33.4991     10.0790
+    558.2000   1497.5560     33.4991     10.0730
+    558.8100   1497.5265     33.4991     10.0620
+    559.4100   1497.4933     33.4991     10.0500
+    560.0100   1497.4889     33.4991     10.0460
+    560.6100   1497.5096     33.4991     10.0490
+    561.2100   1497.5270     33.4991     10.0510
+    561.8100   1497.5298     33.4991     10.0490
+    562.4100   1497.5433     33.4991     10.0500
+    563.0200   1497.5499     33.4991     10.0490
+    563.6200   1497.5671     33.4991     10.0510
+    564.2200   1497.5664     33.4991     10.0480
+    564.8200   1497.5872     33.4991     10.0510
+    565.4200   1497.6008     33.4991     10.0520
+    566.0200   1497.5928     33.4991     10.0470
+    566.6200   1497.5884     33.4991     10.0430
+    567.2300   1497.5662     33.4991     10.0340
+    567.8300   1497.5869     33.4991     10.0370
+    568.4300   1497.5862     33.4991     10.0340
+    569.0300   1497.6069     33.4991     10.0370
+    569.6300   1497.6206     33.4991     10.0380
+    570.2300   1497.6090     33.4991     10.0320
+    570.8300   1497.5829     33.4991     10.0220
+    571.4300   1497.5820     33.4991     10.0190
+    572.0300   1497.5669     33.4991     10.0120
+    572.6300   1497.5515     33.4991     10.0050
+    573.2400   1497.5726     33.4991     10.0080
+    573.8400   1497.5754     33.4991     10.0060
+    574.4400   1497.5962     33.4991     10.0090
+    575.0400   1497.5846     33.4991     10.0030
+    575.6400   1497.5837     33.4991     10.0000
+    576.2400   1497.5649     33.4991      9.9920
+    576.8400   1497.5641     33.4991      9.9890
+    577.4400   1497.5597     33.4991      9.9850
+    578.0400   1497.8621     33.4991     10.0660
+    578.6400   1499.0465     33.4991     10.3930
+    579.2400   1502.9409     33.4991     11.4940
+    579.8400   1503.4060     33.4991     11.6250
+    580.4400   1502.6196     33.4991     11.3960
+    581.0400   1506.4242     33.4991     12.4990
+    581.6400   1504.0867     33.4991     11.8130
+    582.2400   1500.2255     33.4991     10.7070
+    582.8400   1500.2887     33.4991     10.7220
+    583.4400   1502.7848     33.4991     11.4290
+    584.0400   1504.8463     33.4991     12.0220
+    584.6400   1506.3044     33.4984     12.4460
+    585.2400   1507.5723     33.4984     12.8180
+    585.8400   1508.4679     33.4984     13.0820
+    586.4400   1508.7917     33.4984     13.1760
+    587.0400   1508.6383     33.4984     13.1270
+    587.6400   1508.4746     33.4984     13.0750
+    588.2400   1508.1799     33.4984     12.9840
+    588.8400   1507.7537     33.4984     12.8540
+    589.4400   1507.4000     33.4984     12.7460
+    590.0400   1507.0928     33.4984     12.6520
+    590.6400   1506.7474     33.4984     12.5470
+    591.2400   1506.4319     33.4991     12.4510
+    591.8400   1506.1018     33.4991     12.3510
+    592.4400   1505.8629     33.4984     12.2780
+    593.0400   1505.5896     33.4991     12.1950
+    593.6400   1505.3497     33.4984     12.1220
+    594.2400   1505.1542     33.4991     12.0620
+    594.8400   1504.9651     33.4991     12.0040
+    595.4400   1504.8755     33.4991     11.9750
+    596.0400   1504.7651     33.4991     11.9400
+    596.6400   1504.6237     33.4991     11.8960
+    597.2400   1504.4441     33.4991     11.8410
+    597.8400   1504.3057     33.4991     11.7980
+    598.4400   1504.1637     33.4991     11.7540
+    599.0400   1504.0181     33.4991     11.7090
+    599.6400   1503.9034     33.4991     11.6730
+    600.2400   1503.7853     33.4991     11.6360
+    600.8300   1503.6876     33.4991     11.6050
+    601.4300   1503.5831     33.4991     11.5720
+    602.0300   1503.4716     33.4991     11.5370
+    602.6300   1503.3807     33.4991     11.5080
+    603.2300   1503.3107     33.4991     11.4850
+    603.8300   1503.2233     33.4991     11.4570
+    604.4300   1503.1252     33.4991     11.4260
+    605.0300   1503.1005     33.4991     11.4160
+    605.6300   1503.0406     33.4991     11.3960
+    606.2300   1503.0018     33.4991     11.3820
+    606.8200   1502.9175     33.4991     11.3550
+    607.4200   1502.8821     33.4991     11.3420
+    608.0200   1502.7943     33.4991     11.3140
+    608.6200   1502.7484     33.4991     11.2980
+    609.2200   1502.7164     33.4991     11.2860
+    609.8200   1502.6915     33.4991     11.2760
+    610.4200   1502.7051     33.4991     11.2770
+    611.0100   1503.7397     33.4991     11.5710
+    611.6100   1504.8361     33.4991     11.8850
+    612.2100   1504.7220     33.4991     11.8490
+    612.8100   1504.5664     33.4991     11.8010
+    613.4100   1504.5903     33.4991     11.8050
+    614.0100   1505.2239     33.4991     11.9860
+    614.6100   1505.6354     33.4984     12.1030
+    615.2000   1505.8542     33.4991     12.1640
+    615.8000   1506.1274     33.4991     12.2410
+    616.4000   1506.3695     33.4984     12.3090
+    617.0000   1506.6656     33.4991     12.3930
+    617.6000   1506.7947     33.4984     12.4280
+    618.1900   1506.8419     33.4984     12.4390
+    618.7900   1506.7976     33.4984     12.4230
+    619.3900   1506.7295     33.4991     12.4000
+    619.9900   1506.7054     33.4984     12.3900
+    620.5900   1506.6610     33.4984     12.3740
+    621.1800   1505.4435     33.4991     12.0150
+    621.7800   1505.6354     33.4991     12.0680
+    622.3800   1506.1863     33.4984     12.2260
+    622.9800   1502.1115     33.4991     11.0480
+    623.5800   1502.0088     33.4991     11.0160
+    624.1700   1506.5269     33.4991     12.3170
+    624.7700   1506.3595     33.4991     12.2650
+    625.3700   1505.9387     33.4984     12.1390
+    625.9700   1505.5029     33.4991     12.0090
+    626.5600   1505.0620     33.4991     11.8780
+    627.1600   1504.6025     33.4991     11.7420
+    627.7600   1504.4083     33.4991     11.6830
+    628.3600   1504.2001     33.4991     11.6200
+    628.9500   1503.9216     33.4991     11.5370
+    629.5500   1503.6812     33.4991     11.4650
+    630.1500   1503.5239     33.4991     11.4170
+    630.7500   1503.4154     33.4991     11.3830
+    631.3400   1503.3729     33.4991     11.3680
+    631.9400   1503.3480     33.4991     11.3580
+    632.5400   1503.3370     33.4991     11.3520
+    633.1400   1503.3401     33.4991     11.3500
+    633.7300   1503.3186     33.4991     11.3410
+    634.3300   1503.2832     33.4991     11.3280
+    634.9300   1503.2338     33.4991     11.3110
+    635.5200   1503.2227     33.4991     11.3050
+    636.1200   1503.0157     33.4991     11.2430
+    636.7200   1502.5205     33.4991     11.0990
+    637.3100   1501.9916     33.4991     10.9460
+    637.9100   1501.5352     33.4991     10.8140
+    638.5100   1501.1445     33.4991     10.7010
+    639.1100   1500.9272     33.4991     10.6370
+    639.7000   1500.7699     33.4991     10.5900
+    640.3000   1500.6802     33.4991     10.5620
+    640.9000   1500.5762     33.4991     10.5300
+    641.4900   1500.5111     33.4991     10.5090
+    642.0900   1500.4819     33.4991     10.4980
+    642.6900   1500.4277     33.4991     10.4800
+    643.2800   1500.3948     33.4991     10.4680
+    643.8800   1500.3727     33.4991     10.4590
+    644.4800   1500.3184     33.4991     10.4410
+    645.0700   1500.2747     33.4991     10.4260
+    645.6700   1500.2382     33.4991     10.4130
+    646.2600   1499.0847     33.4991     10.0890
+    646.8600   1499.0587     33.4991     10.0790
+    647.4600   1499.0436     33.4991     10.0720
+    648.0500   1499.0498     33.4991     10.0710
+    648.6500   1499.0634     33.4991     10.0720
+    649.2500   1499.9364     33.4991     10.3120
+    649.8400   1499.0941     33.4991     10.0750
+    650.4400   1498.9851     33.4991     10.0420
+    651.0300   1500.2169     33.4991     10.3820
+    651.6300   1500.3593     33.4991     10.4190
+    652.2300   1500.3228     33.4991     10.4060
+    652.8200   1500.3076     33.4991     10.3990
+    653.4200   1500.2819     33.4991     10.3890
+    654.0100   1500.2953     33.4991     10.3900
+    654.6100   1500.2803     33.4991     10.3830
+    655.2100   1500.2867     33.4991     10.3820
+    655.8000   1500.2787     33.4991     10.3770
+    656.4000   1500.2959     33.4991     10.3790
+    656.9900   1500.2521     33.4991     10.3640
+    657.5900   1500.2621     33.4991     10.3640
+    658.1800   1500.2469     33.4991     10.3570
+    658.7800   1500.2427     33.4991     10.3530
+    659.3800   1500.2383     33.4991     10.3490
+    659.9700   1500.2339     33.4991     10.3450
+    660.5700   1500.2511     33.4991     10.3470
+    661.1600   1500.2681     33.4991     10.3490
+    661.7600   1500.2495     33.4991     10.3410
+    662.3500   1500.2200     33.4991     10.3300
+    662.9500   1500.1941     33.4991     10.3200
+    663.5400   1500.1646     33.4991     10.3090
+    664.1400   1500.1494     33.4991     10.3020
+    664.7300   1500.1235     33.4991     10.2920
+    665.3300   1500.1049     33.4991     10.2840
+    665.9300   1500.0969     33.4991     10.2790
+    666.5200   1500.0745     33.4991     10.2700
+    667.1200   1500.0593     33.4991     10.2630
+    667.7100   1500.0154     33.4991     10.2480
+    668.3100   1499.9788     33.4991     10.2350
+    668.9000   1499.9670     33.4991     10.2290
+    669.5000   1499.9340     33.4991     10.2170
+    670.0900   1499.9366     33.4991     10.2150
+    670.6900   1499.9108     33.4991     10.2050
+    671.2800   1499.8954     33.4991     10.1980
+    671.8800   1499.9091     33.4991     10.1990
+    672.4700   1499.8938     33.4991     10.1920
+    673.0600   1499.9000     33.4991     10.1910
+    673.6600   1499.8741     33.4991     10.1810
+    674.2500   1499.8839     33.4991     10.1810
+    674.8500   1499.8904     33.4991     10.1800
+    675.4400   1499.8643     33.4991     10.1700
+    676.0400   1499.8419     33.4991     10.1610
+    676.6300   1499.8195     33.4991     10.1520
+    677.2300   1499.7970     33.4991     10.1430
+    677.8200   1499.7889     33.4991     10.1380
+    678.4200   1499.7629     33.4991     10.1280
+    679.0100   1499.7440     33.4991     10.1200
+    679.6000   1499.7394     33.4991     10.1160
+    680.2000   1499.7206     33.4991     10.1080
+    680.7900   1499.7089     33.4991     10.1020
+    681.3900   1499.6973     33.4991     10.0960
+    681.9800   1499.6639     33.4991     10.0840
+    682.5800   1499.6631     33.4991     10.0810
+    683.1700   1499.6296     33.4991     10.0690
+    683.7600   1499.6107     33.4991     10.0610
+    684.3600   1499.6027     33.4991     10.0560
+    684.9500   1499.6090     33.4991     10.0550
+    685.5500   1499.6082     33.4991     10.0520
+    686.1400   1499.5675     33.4991     10.0380
+    686.7300   1499.5557     33.4991     10.0320
+    687.3300   1499.5332     33.4991     10.0230
+    687.9200   1499.5178     33.4991     10.0160
+    688.5200   1499.5026     33.4991     10.0090
+    689.1100   1499.4872     33.4991     10.0020
+    689.7000   1499.4536     33.4991      9.9900
+    690.3000   1499.4384     33.4991      9.9830
+    690.8900   1499.4374     33.4991      9.9800
+    691.4800   1499.4039     33.4991      9.9680
+    692.0800   1499.4175     33.4991      9.9690
+    692.6700   1499.3767     33.4991      9.9550
+    693.2600   1499.3505     33.4991      9.9450
+    693.8600   1499.3279     33.4991      9.9360
+    694.4500   1499.3197     33.4991      9.9310
+    695.0500   1499.3116     33.4991      9.9260
+    695.6400   1499.2998     33.4991      9.9200
+    696.2300   1499.2843     33.4991      9.9130
+    696.8300   1499.2617     33.4991      9.9040
+    697.4200   1499.2426     33.4991      9.8960
+    698.0100   1499.2344     33.4991      9.8910
+    698.6100   1499.2227     33.4991      9.8850
+    699.2000   1499.2252     33.4991      9.8830
+    699.7900   1499.2170     33.4991      9.8780
+    700.3800   1499.2087     33.4991      9.8730
+    700.9800   1499.1608     33.4991      9.8570
+    701.5700   1499.0836     33.4991      9.8330
+    702.1600   1498.9664     33.4991      9.7980
+    702.7600   1498.8529     33.4991      9.7640
+    703.3500   1498.7646     33.4991      9.7370
+    703.9400   1498.4468     33.4991      9.6470
+    704.5300   1498.2231     33.4991      9.5830
+    705.1300   1498.1345     33.4991      9.5560
+    705.7200   1498.1189     33.4991      9.5490
+    706.3100   1498.1141     33.4991      9.5450
+    706.9100   1498.1278     33.4991      9.5460
+    707.5000   1498.1340     33.4991      9.5450
+    708.0900   1498.1036     33.4991      9.5340
+    708.6800   1498.0952     33.4991      9.5290
+    709.2800   1498.1017     33.4991      9.5280
+    709.8700   1498.1151     33.4991      9.5290
+    710.4600   1498.1689     33.4991      9.5410
+    711.0500   1498.1715     33.4991      9.5390
+    711.6500   1498.2070     33.4991      9.5460
+    712.2400   1498.2059     33.4991      9.5430
+    712.8300   1498.2158     33.4991      9.5430
+    713.4200   1498.2147     33.4991      9.5400
+    714.0200   1498.2174     33.4991      9.5380
+    714.6100   1498.1945     33.4991      9.5290
+    715.2000   1498.2007     33.4991      9.5280
+    715.7900   1498.2178     33.4991      9.5300
+    716.3800   1498.1875     33.4991      9.5190
+    716.9800   1498.1536     33.4991      9.5070
+    717.5700   1498.1268     33.4991      9.4970
+    718.1600   1498.0416     33.4991      9.4710
+    718.7500   1498.0112     33.4991      9.4600
+    719.3400   1497.9771     33.4991      9.4480
+    719.9400   1497.9688     33.4991      9.4430
+    720.5300   1497.9420     33.4991      9.4330
+    721.1200   1497.9116     33.4991      9.4220
+    721.7100   1497.9104     33.4991      9.4190
+    722.3000   1497.8910     33.4991      9.4110
+    722.8900   1497.8641     33.4991      9.4010
+    723.4900   1497.8375     33.4991      9.3910
+    724.0800   1497.8328     33.4991      9.3870
+    724.6700   1497.8573     33.4991      9.3910
+    725.2600   1497.8488     33.4991      9.3860
+    725.8500   1497.8733     33.4991      9.3900
+    726.4400   1497.9199     33.4991      9.4000
+    727.0400   1497.9482     33.4991      9.4050
+    727.6300   1497.9984     33.4991      9.4160
+    728.2200   1497.9827     33.4991      9.4090
+    728.8100   1497.9779     33.4991      9.4050
+    729.4000   1497.9803     33.4991      9.4030
+    729.9900   1497.9683     33.4991      9.3970
+    730.5800   1497.9451     33.4991      9.3880
+    731.1700   1497.9366     33.4991      9.3830
+    731.7700   1497.9283     33.4991      9.3780
+    732.3600   1497.9198     33.4991      9.3730
+    732.9500   1497.8893     33.4991      9.3620
+    733.5400   1497.8698     33.4991      9.3540
+    734.1300   1497.8466     33.4991      9.3450
+    734.7200   1497.8455     33.4991      9.3420
+    735.3100   1497.8296     33.4991      9.3350
+    735.9000   1497.8285     33.4991      9.3320
+    736.4900   1497.8163     33.4991      9.3260
+    737.0800   1497.8188     33.4991      9.3240
+    737.6800   1497.8031     33.4991      9.3170
+    738.2700   1497.7689     33.4991      9.3050
+    738.8600   1497.7531     33.4991      9.2980
+    739.4500   1497.7372     33.4991      9.2910
+    740.0400   1497.7250     33.4991      9.2850
+    740.6300   1497.7347     33.4991      9.2850
+    741.2200   1497.7263     33.4991      9.2800
+    741.8100   1497.7067     33.4991      9.2720
+    742.4000   1497.6761     33.4991      9.2610
+    742.9900   1497.6528     33.4991      9.2520
+    743.5800   1497.6259     33.4991      9.2420
+    744.1700   1497.5842     33.4991      9.2280
+    744.7600   1497.5646     33.4991      9.2200
+    745.3500   1497.5449     33.4991      9.2120
+    745.9400   1497.4922     33.4991      9.1950
+    746.5300   1497.4468     33.4991      9.1800
+    747.1200   1497.4087     33.4991      9.1670
+    747.7100   1497.3964     33.4991      9.1610
+    748.3000   1497.3951     33.4991      9.1580
+    748.8900   1497.3497     33.4991      9.1430
+    749.4800   1497.3226     33.4991      9.1330
+    750.0700   1497.3141     33.4991      9.1280
+    750.6600   1497.2981     33.4991      9.1210
+    751.2500   1497.2821     33.4991      9.1140
+    751.8400   1497.2587     33.4991      9.1050
+    752.4300   1497.2501     33.4991      9.1000
+    753.0200   1497.3005     33.4991      9.1110
+    753.6100   1499.3796     33.4991      9.6750
+    754.2000   1502.4287     33.4991     10.5180
+    754.7900   1503.5508     33.4991     10.8310
+    755.3800   1503.9282     33.4991     10.9350
+    755.9700   1504.1886     33.4991     11.0060
+    756.5600   1504.2336     33.4991     11.0160
+    757.1500   1504.0814     33.4991     10.9700
+    757.7400   1503.7452     33.4991     10.8720
+    758.3300   1502.8718     33.4991     10.6230
+    758.9200   1501.6202     33.4991     10.2700
+    759.5100   1500.7444     33.4991     10.0240
+    760.1000   1500.0881     33.4991      9.8400
+    760.6900   1499.6329     33.4991      9.7120
+    761.2800   1499.3148     33.4991      9.6220
+    761.8700   1499.1385     33.4991      9.5710
+    762.4600   1498.9949     33.4991      9.5290
+    763.0500   1498.9243     33.4991      9.5070
+    763.6300   1498.8755     33.4991      9.4910
+    764.2200   1498.8304     33.4991      9.4760
+    764.8100   1498.7817     33.4991      9.4600
+    765.4000   1498.7366     33.4991      9.4450
+    765.9900   1498.6622     33.4991      9.4220
+    766.5800   1498.6134     33.4991      9.4060
+    767.1700   1498.5756     33.4991      9.3930
+    767.7600   1498.5341     33.4991      9.3790
+    768.3500   1498.4816     33.4991      9.3620
+    768.9400   1498.4180     33.4991      9.3420
+    769.5200   1498.4020     33.4991      9.3350
+    770.1100   1498.3604     33.4991      9.3210
+    770.7000   1498.3666     33.4991      9.3200
+    771.2900   1498.3507     33.4991      9.3130
+    771.8800   1498.3275     33.4991      9.3040
+    772.4700   1498.2932     33.4991      9.2920
+    773.0600   1498.2590     33.4991      9.2800
+    773.6400   1498.2502     33.4991      9.2750
+    774.2300   1498.2417     33.4991      9.2700
+    774.8200   1498.2037     33.4991      9.2570
+    775.4100   1498.1548     33.4991      9.2410
+    776.0000   1498.1167     33.4991      9.2280
+    776.5900   1498.0934     33.4991      9.2190
+    777.1800   1498.0848     33.4991      9.2140
+    777.7600   1498.0688     33.4991      9.2070
+    778.3500   1498.0713     33.4991      9.2050
+    778.9400   1498.0554     33.4991      9.1980
+    779.5300   1498.0431     33.4991      9.1920
+    780.1200   1498.0234     33.4991      9.1840
+    780.7000   1497.9927     33.4991      9.1730
+    781.2900   1497.9840     33.4991      9.1680
+    781.8800   1497.9386     33.4991      9.1530
+    782.4700   1497.8967     33.4991      9.1390
+    783.0600   1497.8623     33.4991      9.1270
+    783.6500   1497.8352     33.4991      9.1170
+    784.2300   1497.7821     33.4991      9.1000
+    784.8200   1497.7625     33.4991      9.0920
+    785.4100   1497.7354     33.4991      9.0820
+    786.0000   1497.6971     33.4991      9.0690
+    786.5800   1497.6661     33.4991      9.0580
+    787.1700   1497.6390     33.4991      9.0480
+    787.7600   1497.6267     33.4991      9.0420
+    788.3500   1497.6144     33.4991      9.0360
+    788.9400   1497.5984     33.4991      9.0290
+    789.5200   1497.6044     33.4991      9.0280
+    790.1100   1497.5883     33.4991      9.0210
+    790.7000   1497.5834     33.4991      9.0170
+    791.2900   1497.5450     33.4991      9.0040
+    791.8700   1497.5251     33.4991      8.9960
+    792.4600   1497.4943     33.4991      8.9850
+    793.0500   1497.4819     33.4991      8.9790
+    793.6300   1497.4471     33.4991      8.9670
+    794.2200   1497.4125     33.4991      8.9550
+    794.8100   1497.3667     33.4991      8.9400
+    795.4000   1497.3320     33.4991      8.9280
+    795.9800   1497.3009     33.4991      8.9170
+    796.5700   1497.2811     33.4991      8.9090
+    797.1600   1497.2501     33.4991      8.8980
+    797.7500   1497.2080     33.4991      8.8840
+    798.3300   1497.1768     33.4991      8.8730
+    798.9200   1497.1606     33.4991      8.8660
+    799.5100   1497.1407     33.4991      8.8580
+    800.0900   1497.1133     33.4991      8.8480
+    800.6800   1497.0972     33.4991      8.8410
+    801.2700   1497.0996     33.4991      8.8390
+    801.8500   1497.1018     33.4991      8.8370
+    802.4400   1497.1042     33.4991      8.8350
+    803.0300   1497.1067     33.4991      8.8330
+    803.6100   1497.1052     33.4991      8.8300
+    804.2000   1497.0557     33.4991      8.8140
+    804.7900   1497.0282     33.4991      8.8040
+    805.3700   1497.0305     33.4991      8.8020
+    805.9600   1497.0441     33.4991      8.8030
+    806.5500   1496.9982     33.4991      8.7880
+    807.1300   1496.9706     33.4991      8.7780
+    807.7200   1496.9618     33.4991      8.7730
+    808.3100   1496.9717     33.4991      8.7730
+    808.8900   1496.9702     33.4991      8.7700
+    809.4800   1496.9354     33.4991      8.7580
+    810.0700   1496.9192     33.4991      8.7510
+    810.6500   1496.8990     33.4991      8.7430
+    811.2400   1496.9052     33.4991      8.7420
+    811.8200   1496.8701     33.4991      8.7300
+    812.4100   1496.8726     33.4991      8.7280
+    813.0000   1496.8228     33.4991      8.7120
+    813.5800   1496.8175     33.4991      8.7080
+    814.1700   1496.7976     33.4991      8.7000
+    814.7500   1496.7773     33.4991      8.6920
+    815.3400   1496.7723     33.4991      8.6880
+    815.9300   1496.7710     33.4991      8.6850
+    816.5100   1496.7770     33.4991      8.6840
+    817.1000   1496.7794     33.4991      8.6820
+    817.6800   1496.7854     33.4991      8.6810
+    818.2700   1496.7953     33.4991      8.6810
+    818.8600   1496.7827     33.4991      8.6750
+    819.4400   1496.7999     33.4991      8.6770
+    820.0300   1496.7948     33.4991      8.6730
+    820.6100   1496.7933     33.4991      8.6700
+    821.2000   1496.7920     33.4991      8.6670
+    821.7800   1496.7345     33.4991      8.6490
+    822.3700   1496.7107     33.4991      8.6400
+    822.9600   1496.6458     33.4991      8.6200
+    823.5400   1496.5807     33.4991      8.6000
+    824.1300   1496.5082     33.4991      8.5780
+    824.7100   1496.4617     33.4991      8.5630
+    825.3000   1496.4004     33.4991      8.5440
+    825.8800   1496.3577     33.4991      8.5300
+    826.4700   1496.3638     33.4991      8.5290
+    827.0500   1496.3473     33.4991      8.5220
+    827.6400   1496.3458     33.4991      8.5190
+    828.2200   1496.3518     33.4991      8.5180
+    828.8100   1496.3317     33.4991      8.5100
+    829.3900   1496.3414     33.4991      8.5100
+    829.9800   1496.3438     33.4991      8.5080
+    830.5600   1496.3723     33.4991      8.5130
+    831.1500   1496.3409     33.4991      8.5020
+    831.7300   1496.3394     33.4991      8.4990
+    832.3200   1496.2966     33.4991      8.4850
+    832.9000   1496.2463     33.4991      8.4690
+    833.4900   1496.2000     33.4991      8.4540
+    834.0700   1496.1758     33.4991      8.4450
+    834.6600   1496.1707     33.4991      8.4410
+    835.2400   1496.1653     33.4991      8.4370
+    835.8300   1496.1451     33.4991      8.4290
+    836.4100   1496.1248     33.4991      8.4210
+    837.0000   1496.0782     33.4991      8.4060
+    837.5800   1496.0692     33.4991      8.4010
+    838.1700   1496.0415     33.4991      8.3910
+    838.7500   1495.9910     33.4991      8.3750
+    839.3300   1495.9744     33.4991      8.3680
+    839.9200   1495.9503     33.4991      8.3590
+    840.5000   1495.9073     33.4991      8.3450
+    841.0900   1495.8871     33.4991      8.3370
+    841.6700   1495.8969     33.4991      8.3370
+    842.2600   1495.8840     33.4991      8.3310
+    842.8400   1495.8787     33.4991      8.3270
+    843.4300   1495.8547     33.4991      8.3180
+    844.0100   1495.8342     33.4991      8.3100
+    844.5900   1495.8175     33.4991      8.3030
+    845.1800   1495.7633     33.4991      8.2860
+    845.7600   1495.7806     33.4991      8.2880
+    846.3500   1495.7754     33.4991      8.2840
+    846.9300   1495.7549     33.4991      8.2760
+    847.5100   1495.7231     33.4991      8.2650
+    848.1000   1495.6915     33.4991      8.2540
+    848.6800   1495.6672     33.4991      8.2450
+    849.2700   1495.6432     33.4991      8.2360
+    849.8500   1495.5697     33.4991      8.2140
+    850.4300   1495.5077     33.4991      8.1950
+    851.0200   1495.4797     33.4991      8.1850
+    851.6000   1495.4517     33.4991      8.1750
+    852.1800   1495.3895     33.4991      8.1560
+    852.7700   1495.3539     33.4991      8.1440
+    853.3500   1495.3409     33.4991      8.1380
+    853.9400   1495.3584     33.4991      8.1400
+    854.5200   1495.3378     33.4991      8.1320
+    855.1000   1495.3135     33.4991      8.1230
+    855.6900   1495.2740     33.4991      8.1100
+    856.2700   1495.2573     33.4991      8.1030
+    856.8500   1495.2405     33.4991      8.0960
+    857.4400   1495.2428     33.4991      8.0940
+    858.0200   1495.1843     33.4991      8.0760
+    858.6000   1495.0840     33.4991      8.0470
+    859.1900   1495.0673     33.4991      8.0400
+    859.7700   1495.0543     33.4991      8.0340
+    860.3500   1495.0109     33.4991      8.0200
+    860.9400   1495.0093     33.4991      8.0170
+    861.5200   1495.0039     33.4991      8.0130
+    862.1000   1495.0098     33.4991      8.0120
+    862.6800   1495.0005     33.4991      8.0070
+    863.2700   1495.0028     33.4991      8.0050
+    863.8500   1494.9860     33.4991      7.9980
+    864.4300   1494.9576     33.4991      7.9880
+    865.0200   1494.9485     33.4991      7.9830
+    865.6000   1494.9583     33.4991      7.9830
+    866.1800   1494.9718     33.4991      7.9840
+    866.7600   1494.9701     33.4991      7.9810
+    867.3500   1494.9609     33.4991      7.9760
+    867.9300   1494.9783     33.4991      7.9780
+    868.5100   1494.9803     33.4991      7.9760
+    869.1000   1494.9712     33.4991      7.9710
+    869.6800   1494.9696     33.4991      7.9680
+    870.2600   1494.9298     33.4991      7.9550
+    870.8400   1494.9053     33.4991      7.9460
+    871.4300   1494.8582     33.4991      7.9310
+    872.0100   1494.8298     33.4991      7.9210
+    872.5900   1494.8129     33.4991      7.9140
+    873.1700   1494.8455     33.4991      7.9200
+    873.7600   1494.8248     33.4991      7.9120
+    874.3400   1494.7889     33.4991      7.9000
+    874.9200   1494.7529     33.4991      7.8880
+    875.5000   1494.7397     33.4991      7.8820
+    876.0800   1494.7114     33.4991      7.8720
+    876.6700   1494.6565     33.4991      7.8550
+    877.2500   1494.6357     33.4991      7.8470
+    877.8300   1494.6531     33.4991      7.8490
+    878.4100   1494.6895     33.4991      7.8560
+    878.9900   1494.6838     33.4991      7.8520
+    879.5800   1494.6061     33.4991      7.8290
+    880.1600   1494.5699     33.4991      7.8170
+    880.7400   1494.5530     33.4991      7.8100
+    881.3200   1494.5017     33.4991      7.7940
+    881.9000   1494.5114     33.4991      7.7940
+    882.4900   1494.5137     33.4991      7.7920
+    883.0700   1494.4661     33.4991      7.7770
+    883.6500   1494.4070     33.4991      7.7590
+    884.2300   1494.3594     33.4991      7.7440
+    884.8100   1494.3500     33.4991      7.7390
+    885.3900   1494.3253     33.4991      7.7300
+    885.9800   1494.3083     33.4991      7.7230
+    886.5600   1494.2799     33.4991      7.7130
+    887.1400   1494.2781     33.4991      7.7100
+    887.7200   1494.2878     33.4991      7.7100
+    888.3000   1494.2745     33.4991      7.7040
+    888.8800   1494.2345     33.4991      7.6910
+    889.4700   1494.2291     33.4991      7.6870
+    890.0500   1494.2158     33.4991      7.6810
+    890.6300   1494.2064     33.4991      7.6760
+    891.2100   1494.2123     33.4991      7.6750
+    891.7900   1494.1799     33.4991      7.6640
+    892.3700   1494.1743     33.4991      7.6600
+    892.9500   1494.1495     33.4991      7.6510
+    893.5300   1494.1324     33.4991      7.6440
+    894.1100   1494.1689     33.4991      7.6510
+    894.7000   1494.1597     33.4991      7.6460
+    895.2800   1494.1848     33.4991      7.6500
+    895.8600   1494.2059     33.4991      7.6530
+    896.4400   1494.1927     33.4991      7.6470
+    897.0200   1494.1488     33.4991      7.6330
+    897.6000   1494.1278     33.4991      7.6250
+    898.1800   1494.1068     33.4991      7.6170
+    898.7600   1494.0552     33.4991      7.6010
+    899.3400   1494.0496     33.4991      7.5970
+    899.9200   1494.0248     33.4991      7.5880
+    900.5000   1493.9807     33.4991      7.5740
+    901.0800   1493.9175     33.4991      7.5550
+    901.6700   1493.8890     33.4991      7.5450
+    902.2500   1493.8756     33.4991      7.5390
+    902.8300   1493.8931     33.4991      7.5410
+    903.4100   1493.8721     33.4991      7.5330
+    903.9900   1493.8625     33.4991      7.5280
+    904.5700   1493.8723     33.4991      7.5280
+    905.1500   1493.8589     33.4991      7.5220
+    905.7300   1493.8187     33.4991      7.5090
+    906.3100   1493.8169     33.4991      7.5060
+    906.8900   1493.8419     33.4991      7.5100
+    907.4700   1493.7786     33.4991      7.4910
+    908.0500   1493.7729     33.4991      7.4870
+    908.6300   1493.7634     33.4991      7.4820
+    909.2100   1493.7039     33.4991      7.4640
+    909.7900   1493.6636     33.4991      7.4510
+    910.3700   1493.6232     33.4991      7.4380
+    910.9500   1493.6213     33.4991      7.4350
+    911.5300   1493.6157     33.4991      7.4310
+    912.1100   1493.6177     33.4991      7.4290
+    912.6900   1493.6005     33.4991      7.4220
+    913.2700   1493.6101     33.4991      7.4220
+    913.8500   1493.6083     33.4991      7.4190
+    914.4300   1493.5948     33.4991      7.4130
+    915.0100   1493.5699     33.4991      7.4040
+    915.5900   1493.5488     33.4991      7.3960
+    916.1700   1493.5277     33.4991      7.3880
+    916.7500   1493.5143     33.4991      7.3820
+    917.3300   1493.5162     33.4991      7.3800
+    917.9100   1493.4990     33.4991      7.3730
+    918.4900   1493.4663     33.4991      7.3620
+    919.0700   1493.4451     33.4991      7.3540
+    919.6500   1493.4163     33.4991      7.3440
+    920.2300   1493.3796     33.4991      7.3320
+    920.8000   1493.3622     33.4991      7.3250
+    921.3800   1493.3525     33.4991      7.3200
+    921.9600   1493.3661     33.4991      7.3210
+    922.5400   1493.3450     33.4991      7.3130
+    923.1200   1493.2968     33.4991      7.2980
+    923.7000   1493.2484     33.4991      7.2830
+    924.2800   1493.2118     33.4991      7.2710
+    924.8600   1493.1943     33.4991      7.2640
+    925.4400   1493.1848     33.4991      7.2590
+    926.0200   1493.1558     33.4991      7.2490
+    926.6000   1493.1461     33.4991      7.2440
+    927.1800   1493.1288     33.4991      7.2370
+    927.7500   1493.0996     33.4991      7.2270
+    928.3300   1493.0784     33.4991      7.2190
+    928.9100   1493.0571     33.4991      7.2110
+    929.4900   1493.0475     33.4991      7.2060
+    930.0700   1493.0378     33.4991      7.2010
+    930.6500   1492.9662     33.4991      7.1800
+    931.2300   1492.9061     33.4991      7.1620
+    931.8100   1492.8499     33.4991      7.1450
+    932.3900   1492.8092     33.4991      7.1320
+    932.9600   1492.7915     33.4991      7.1250
+    933.5400   1492.7858     33.4991      7.1210
+    934.1200   1492.7916     33.4991      7.1200
+    934.7000   1492.7819     33.4991      7.1150
+    935.2800   1492.8149     33.4991      7.1210
+    935.8600   1492.7936     33.4991      7.1130
+    936.4300   1492.8070     33.4991      7.1140
+    937.0100   1492.7856     33.4991      7.1060
+    937.5900   1492.7449     33.4991      7.0930
+    938.1700   1492.7080     33.4991      7.0810
+    938.7500   1492.6672     33.4991      7.0680
+    939.3300   1492.6420     33.4991      7.0590
+    939.9000   1492.6049     33.4991      7.0470
+    940.4800   1492.6068     33.4991      7.0450
+    941.0600   1492.5814     33.4991      7.0360
+    941.6400   1492.5640     33.4991      7.0290
+    942.2200   1492.5659     33.4991      7.0270
+    942.7900   1492.5638     33.4991      7.0240
+    943.3700   1492.5696     33.4991      7.0230
+    943.9500   1492.5560     33.4991      7.0170
+    944.5300   1492.5657     33.4991      7.0170
+    945.1100   1492.5637     33.4991      7.0140
+    945.6800   1492.5383     33.4991      7.0050
+    946.2600   1492.5247     33.4991      6.9990
+    946.8400   1492.5110     33.4991      6.9930
+    947.4200   1492.5363     33.4991      6.9970
+    948.0000   1492.5266     33.4991      6.9920
+    948.5700   1492.4855     33.4991      6.9790
+    949.1500   1492.4329     33.4991      6.9630
+    949.7300   1492.4075     33.4991      6.9540
+    950.3100   1492.3938     33.4991      6.9480
+    950.8800   1492.3917     33.4991      6.9450
+    951.4600   1492.4014     33.4991      6.9450
+    952.0400   1492.3527     33.4991      6.9300
+    952.6200   1492.3779     33.4991      6.9340
+    953.1900   1492.2979     33.4991      6.9110
+    953.7700   1492.2881     33.4991      6.9060
+    954.3500   1492.2665     33.4991      6.8980
+    954.9200   1492.2839     33.4991      6.9000
+    955.5000   1492.2584     33.4991      6.8910
+    956.0800   1492.2487     33.4991      6.8860
+    956.6600   1492.2350     33.4991      6.8800
+    957.2300   1492.2289     33.4991      6.8760
+    957.8100   1492.2152     33.4991      6.8700
+    958.3900   1492.1820     33.4991      6.8590
+    958.9600   1492.1798     33.4991      6.8560
+    959.5400   1492.1779     33.4991      6.8530
+    960.1200   1492.1602     33.4991      6.8460
+    960.7000   1492.1777     33.4991      6.8480
+    961.2700   1492.1443     33.4991      6.8370
+    961.8500   1492.1383     33.4991      6.8330
+    962.4300   1492.1168     33.4991      6.8250
+    963.0000   1492.0481     33.4991      6.8050
+    963.5800   1492.0383     33.4991      6.8000
+    964.1600   1492.0793     33.4991      6.8080
+    964.7300   1492.0341     33.4991      6.7940
+    965.3100   1492.0046     33.4991      6.7840
+    965.8900   1491.9832     33.4991      6.7760
+    966.4600   1491.9535     33.4991      6.7660
+    967.0400   1491.9280     33.4991      6.7570
+    967.6200   1491.9064     33.4991      6.7490
+    968.1900   1491.8572     33.4991      6.7340
+    968.7700   1491.8512     33.4991      6.7300
+    969.3400   1491.8529     33.4991      6.7280
+    969.9200   1491.8705     33.4991      6.7300
+    970.5000   1491.8409     33.4991      6.7200
+    971.0700   1491.7878     33.4991      6.7040
+    971.6500   1491.7858     33.4991      6.7010
+    972.2300   1491.7955     33.4991      6.7010
+    972.8000   1491.8168     33.4991      6.7040
+    973.3800   1491.7991     33.4991      6.6970
+    973.9500   1491.7694     33.4991      6.6870
+    974.5300   1491.7517     33.4991      6.6800
+    975.1100   1491.7339     33.4991      6.6730
+    975.6800   1491.7278     33.4991      6.6690
+    976.2600   1491.7179     33.4991      6.6640
+    976.8300   1491.7039     33.4991      6.6580
+    977.4100   1491.6979     33.4991      6.6540
+    977.9900   1491.6290     33.4991      6.6340
+    978.5600   1491.5758     33.4991      6.6180
+    979.1400   1491.5776     33.4991      6.6160
+    979.7100   1491.5872     33.4991      6.6160
+    980.2900   1491.5812     33.4991      6.6120
+    980.8600   1491.5790     33.4991      6.6090
+    981.4400   1491.5494     33.4991      6.5990
+    982.0100   1491.5275     33.4991      6.5910
+    982.5900   1491.4742     33.4991      6.5750
+    983.1700   1491.4644     33.4991      6.5700
+    983.7400   1491.4227     33.4991      6.5570
+    984.3200   1491.3892     33.4991      6.5460
+    984.8900   1491.3120     33.4991      6.5240
+    985.4700   1491.2233     33.4991      6.4990
+    986.0400   1491.1815     33.4991      6.4860
+    986.6200   1491.1519     33.4991      6.4760
+    987.1900   1491.1299     33.4991      6.4680
+    987.7700   1491.1317     33.4991      6.4660
+    988.3400   1491.1097     33.4991      6.4580
+    988.9200   1491.6985     33.4991      6.6050
+    989.4900   1494.3556     33.4991      7.2840
+    990.0700   1496.3783     33.4991      7.8080
+    990.6400   1497.6346     33.4991      8.1360
+    991.2200   1498.2566     33.4991      8.2980
+    991.7900   1498.5637     33.4991      8.3770
+    992.3700   1498.5283     33.4991      8.3650
+    992.9400   1498.3759     33.4991      8.3220
+    993.5200   1498.1820     33.4991      8.2680
+    994.0900   1497.9233     33.4991      8.1970
+    994.6700   1497.5092     33.4991      8.0850
+    995.2400   1496.9338     33.4991      7.9310
+    995.8200   1496.4442     33.4991      7.8000
+    996.3900   1496.1328     33.4991      7.7160
+    996.9700   1495.9089     33.4991      7.6550
+    997.5400   1495.7000     33.4991      7.5980
+    998.1200   1495.5062     33.4991      7.5450
+    998.6900   1495.3851     33.4991      7.5110
+    999.2600   1495.2332     33.4991      7.4690
+    999.8400   1495.0503     33.4991      7.4190
+   1000.4100   1494.9172     33.4991      7.3820
+   1000.9900   1494.7881     33.4991      7.3460
+   1001.5600   1494.6509     33.4991      7.3080
+   1002.1400   1494.5446     33.4991      7.2780
+   1002.7100   1494.4574     33.4991      7.2530
+   1003.2800   1494.4012     33.4991      7.2360
+   1003.8600   1494.3490     33.4991      7.2200
+   1004.4300   1494.2927     33.4991      7.2030
+   1005.0100   1494.2405     33.4991      7.1870
+   1005.5800   1494.1802     33.4991      7.1690
+   1006.1500   1494.1277     33.4991      7.1530
+   1006.7300   1494.0521     33.4991      7.1310
+   1007.3000   1494.0073     33.4991      7.1170
+   1007.8800   1493.9744     33.4991      7.1060
+   1008.4500   1493.9296     33.4991      7.0920
+   1009.0200   1493.9003     33.4991      7.0820
+   1009.6000   1493.8750     33.4991      7.0730
+   1010.1700   1493.8146     33.4991      7.0550
+   1010.7500   1493.7815     33.4991      7.0440
+   1011.3200   1493.7444     33.4991      7.0320
+   1011.8900   1493.6918     33.4991      7.0160
+   1012.4700   1493.6781     33.4991      7.0100
+   1013.0400   1493.6332     33.4991      6.9960
+   1013.6100   1493.6116     33.4991      6.9880
+   1014.1900   1493.5433     33.4991      6.9680
+   1014.7600   1493.4828     33.4991      6.9500
+   1015.3300   1493.4417     33.4991      6.9370
+   1015.9100   1493.3773     33.4991      6.9180
+   1016.4800   1493.3401     33.4991      6.9060
+   1017.0500   1493.2910     33.4991      6.8910
+   1017.6300   1493.2578     33.4991      6.8800
+   1018.2000   1493.2440     33.4991      6.8740
+   1018.7700   1493.1949     33.4991      6.8590
+   1019.3500   1493.1656     33.4991      6.8490
+   1019.9200   1493.1556     33.4991      6.8440
+   1020.4900   1493.1222     33.4991      6.8330
+   1021.0700   1493.0811     33.4991      6.8200
+   1021.6400   1493.0398     33.4991      6.8070
+   1022.2100   1493.0103     33.4991      6.7970
+   1022.7900   1492.9808     33.4991      6.7870
+   1023.3600   1492.9552     33.4991      6.7780
+   1023.9300   1492.9255     33.4991      6.7680
+   1024.5000   1492.9155     33.4991      6.7630
+   1025.0800   1492.8744     33.4991      6.7500
+   1025.6500   1492.8291     33.4991      6.7360
+   1026.2200   1492.7799     33.4991      6.7210
+   1026.7900   1492.6953     33.4991      6.6970
+   1027.3700   1492.6305     33.4991      6.6780
+   1027.9399   1492.5890     33.4991      6.6650
+   1028.5100   1492.5632     33.4991      6.6560
+   1029.0900   1492.5652     33.4991      6.6540
+   1029.6600   1492.5472     33.4991      6.6470
+   1030.2300   1492.4939     33.4991      6.6310
+   1030.8000   1492.4642     33.4991      6.6210
+   1031.3800   1492.4542     33.4991      6.6160
+   1031.9500   1492.4481     33.4991      6.6120
+   1032.5200   1492.4420     33.4991      6.6080
+   1033.0900   1492.3887     33.4991      6.5920
+   1033.6600   1492.3706     33.4991      6.5850
+   1034.2400   1492.3411     33.4991      6.5750
+   1034.8101   1492.3348     33.4991      6.5710
+   1035.3800   1492.3484     33.4991      6.5720
+   1035.9500   1492.3147     33.4991      6.5610
+   1036.5300   1492.2928     33.4991      6.5530
+   1037.1000   1492.2710     33.4991      6.5450
+   1037.6700   1492.2214     33.4991      6.5300
+   1038.2400   1492.1719     33.4991      6.5150
+   1038.8101   1492.1500     33.4991      6.5070
+   1039.3800   1492.1320     33.4991      6.5000
+   1039.9600   1492.0905     33.4991      6.4870
+   1040.5300   1492.0763     33.4991      6.4810
+   1041.1000   1492.0662     33.4991      6.4760
+   1041.6700   1492.0560     33.4991      6.4710
+   1042.2400   1492.0538     33.4991      6.4680
+   1042.8199   1492.0557     33.4991      6.4660
+   1043.3900   1492.0850     33.4991      6.4710
+   1043.9600   1492.0747     33.4991      6.4660
+   1044.5300   1492.0883     33.4991      6.4670
+   1045.1000   1492.0900     33.4991      6.4650
+   1045.6700   1492.0876     33.4991      6.4620
+   1046.2400   1492.0815     33.4991      6.4580
+   1046.8199   1492.0438     33.4991      6.4460
+   1047.3900   1491.9902     33.4991      6.4300
+   1047.9600   1491.9248     33.4991      6.4110
+   1048.5300   1491.9462     33.4991      6.4140
+   1049.1000   1491.9637     33.4991      6.4160
+   1049.6700   1491.9614     33.4991      6.4130
+   1050.2400   1491.9512     33.4991      6.4080
+   1050.8199   1491.9530     33.4991      6.4060
+   1051.3900   1491.9271     33.4991      6.3970
+   1051.9600   1491.9089     33.4991      6.3900
+   1052.5300   1491.8988     33.4991      6.3850
+   1053.1000   1491.8688     33.4991      6.3750
+   1053.6700   1491.8230     33.4991      6.3610
+   1054.2400   1491.7811     33.4991      6.3480
+   1054.8101   1491.7393     33.4991      6.3350
+   1055.3800   1491.7172     33.4991      6.3270
+   1055.9500   1491.6753     33.4991      6.3140
+   1056.5300   1491.6731     33.4991      6.3110
+   1057.1000   1491.6510     33.4991      6.3030
+   1057.6700   1491.6606     33.4991      6.3030
+   1058.2400   1491.6504     33.4991      6.2980
+   1058.8101   1491.6560     33.4991      6.2970
+   1059.3800   1491.6497     33.4991      6.2930
+   1059.9500   1491.6553     33.4991      6.2920
+   1060.5200   1491.6293     33.4991      6.2830
+   1061.0900   1491.6270     33.4991      6.2800
+   1061.6600   1491.6206     33.4991      6.2760
+   1062.2300   1491.5985     33.4991      6.2680
+   1062.8000   1491.5724     33.4991      6.2590
+   1063.3700   1491.5304     33.4991      6.2460
+   1063.9399   1491.4923     33.4991      6.2340
+   1064.5100   1491.4741     33.4991      6.2270
+   1065.0800   1491.4441     33.4991      6.2170
+   1065.6500   1491.4178     33.4991      6.2080
+   1066.2200   1491.3956     33.4991      6.2000
+   1066.7900   1491.3973     33.4991      6.1980
+   1067.3600   1491.4030     33.4991      6.1970
+   1067.9301   1491.3807     33.4991      6.1890
+   1068.5000   1491.3665     33.4991      6.1830
+   1069.0699   1491.3840     33.4991      6.1850
+   1069.6400   1491.3657     33.4991      6.1780
+   1070.2100   1491.3754     33.4991      6.1780
+   1070.7800   1491.3253     33.4991      6.1630
+   1071.3500   1491.2991     33.4991      6.1540
+   1071.9200   1491.2649     33.4991      6.1430
+   1072.4900   1491.2506     33.4991      6.1370
+   1073.0601   1491.2164     33.4991      6.1260
+   1073.6300   1491.1902     33.4991      6.1170
+   1074.2000   1491.1680     33.4991      6.1090
+   1074.7700   1491.1377     33.4991      6.0990
+   1075.3400   1491.1273     33.4991      6.0940
+   1075.9100   1491.0891     33.4991      6.0820
+   1076.4800   1491.0629     33.4991      6.0730
+   1077.0500   1491.0605     33.4991      6.0700
+   1077.6200   1491.0621     33.4991      6.0680
+   1078.1899   1491.0637     33.4991      6.0660
+   1078.7600   1491.0334     33.4991      6.0560
+   1079.3300   1491.0311     33.4991      6.0530
+   1079.9000   1491.0088     33.4991      6.0450
+   1080.4700   1491.0104     33.4991      6.0430
+   1081.0400   1491.0040     33.4991      6.0390
+   1081.6000   1490.9935     33.4991      6.0340
+   1082.1700   1490.9751     33.4991      6.0270
+   1082.7400   1491.0166     33.4991      6.0350
+   1083.3101   1491.0182     33.4991      6.0330
+   1083.8800   1491.0358     33.4991      6.0350
+   1084.4500   1491.0613     33.4991      6.0390
+   1085.0200   1491.0389     33.4991      6.0310
+   1085.5900   1491.0565     33.4991      6.0330
+   1086.1600   1491.0541     33.4991      6.0300
+   1086.7300   1491.0199     33.4991      6.0190
+   1087.2900   1490.9933     33.4991      6.0100
+   1087.8600   1491.0109     33.4991      6.0120
+   1088.4301   1490.9926     33.4991      6.0050
+   1089.0000   1491.0181     33.4991      6.0090
+   1089.5699   1490.9998     33.4991      6.0020
+   1090.1400   1490.9894     33.4991      5.9970
+   1090.7100   1490.9750     33.4991      5.9910
+   1091.2800   1490.9766     33.4991      5.9890
+   1091.8400   1490.9821     33.4991      5.9880
+   1092.4100   1490.9717     33.4991      5.9830
+   1092.9800   1490.9612     33.4991      5.9780
+   1093.5500   1490.9469     33.4991      5.9720
+   1094.1200   1490.9205     33.4991      5.9630
+   1094.6899   1490.9141     33.4991      5.9590
+   1095.2500   1490.9315     33.4991      5.9610
+   1095.8199   1490.9291     33.4991      5.9580
+   1096.3900   1490.9147     33.4991      5.9520
+   1096.9600   1490.9403     33.4991      5.9560
+   1097.5300   1490.9338     33.4991      5.9520
+   1098.1000   1490.9674     33.4991      5.9580
+   1098.6600   1490.9608     33.4991      5.9540
+   1099.2300   1490.9424     33.4991      5.9470
+   1099.8000   1490.9320     33.4991      5.9420
+   1100.3700   1490.9016     33.4991      5.9320
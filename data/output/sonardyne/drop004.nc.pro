@@ -0,0 +1,3530 @@
+test_read_store_and_write
+1/9/2016
+8:56:17
+Probe: XBT
+Source: /root/package/data/input/turo/drop004.nc
+      0.6800      0.0000      0.0000     30.3500
+      1.3700      0.0000      0.0000     30.4250
+      2.0500      0.0000      0.0000     30.4030
+      2.7300      0.0000      0.0000     30.2200
+      3.4100      0.0000      0.0000     30.0790
+      4.1000      0.0000      0.0000     30.0460
+      4.7800      0.0000      0.0000     30.0090
+      5.4600      0.0000      0.0000     30.0250
+      6.1400      0.0000      0.0000     30.0570
+      6.8300      0.0000      0.0000     30.0780
+      7.5100      0.0000      0.0000     30.0920
+      8.1900      0.0000      0.0000     30.1040
+      8.8700      0.0000      0.0000     30.1000
+      9.5600      0.0000      0.0000     30.0870
+     10.2400      0.0000      0.0000     30.0840
+     10.9200      0.0000      0.0000     30.0830
+     11.6000      0.0000      0.0000     30.0750
+     12.2800      0.0000      0.0000     30.0650
+     12.9700      0.0000      0.0000     30.0660
+     13.6500      0.0000      0.0000     30.0730
+     14.3300      0.0000      0.0000     30.0770
+     15.0100      0.0000      0.0000     30.0830
+     15.6900      0.0000      0.0000     30.0830
+     16.3800      0.0000      0.0000     30.0830
+     17.0600      0.0000      0.0000     30.0760
+     17.7400      0.0000      0.0000     30.0620
+     18.4200      0.0000      0.0000     30.0490
+     19.1000      0.0000      0.0000     30.0120
+     19.7900      0.0000      0.0000     29.9260
+     20.4700      0.0000      0.0000     29.8750
+     21.1500      0.0000      0.0000     29.7860
+     21.8300      0.0000      0.0000     29.5740
+     22.5100      0.0000      0.0000     29.3210
+     23.1900      0.0000      0.0000     29.2020
+     23.8800      0.0000      0.0000     29.0990
+     24.5600      0.0000      0.0000     29.0090
+     25.2400      0.0000      0.0000     28.9250
+     25.9200      0.0000      0.0000     28.8770
+     26.6000      0.0000      0.0000     28.8370
+     27.2800      0.0000      0.0000     28.7920
+     27.9600      0.0000      0.0000     28.7580
+     28.6500      0.0000      0.0000     28.7280
+     29.3300      0.0000      0.0000     28.7080
+     30.0100      0.0000      0.0000     28.6860
+     30.6900      0.0000      0.0000     28.6630
+     31.3700      0.0000      0.0000     28.6390
+     32.0500      0.0000      0.0000     28.6050
+     32.7300      0.0000      0.0000     28.5750
+     33.4100      0.0000      0.0000     28.5600
+     34.0900      0.0000      0.0000     28.5450
+     34.7800      0.0000      0.0000     28.5220
+     35.4600      0.0000      0.0000     28.4960
+     36.1400      0.0000      0.0000     28.4760
+     36.8200      0.0000      0.0000     28.4650
+     37.5000      0.0000      0.0000     28.4560
+     38.1800      0.0000      0.0000     28.4470
+     38.8600      0.0000      0.0000     28.4200
+     39.5400      0.0000      0.0000     28.3700
+     40.2200      0.0000      0.0000     28.2940
+     40.9000      0.0000      0.0000     28.1670
+     41.5800      0.0000      0.0000     27.9570
+     42.2600      0.0000      0.0000     27.5480
+     42.9400      0.0000      0.0000     27.0210
+     43.6200      0.0000      0.0000     26.4520
+     44.3100      0.0000      0.0000     26.3100
+     44.9900      0.0000      0.0000     26.2420
+     45.6700      0.0000      0.0000     26.1820
+     46.3500      0.0000      0.0000     26.1560
+     47.0300      0.0000      0.0000     26.1160
+     47.7100      0.0000      0.0000     26.0690
+     48.3900      0.0000      0.0000     26.0430
+     49.0700      0.0000      0.0000     26.0330
+     49.7500      0.0000      0.0000     26.0260
+     50.4300      0.0000      0.0000     26.0170
+     51.1100      0.0000      0.0000     26.0160
+     51.7900      0.0000      0.0000     26.0100
+     52.4700      0.0000      0.0000     26.0060
+     53.1500      0.0000      0.0000     26.0050
+     53.8300      0.0000      0.0000     26.0020
+     54.5100      0.0000      0.0000     26.0030
+     55.1900      0.0000      0.0000     26.0000
+     55.8700      0.0000      0.0000     25.9950
+     56.5500      0.0000      0.0000     25.9880
+     57.2300      0.0000      0.0000     25.9870
+     57.9100      0.0000      0.0000     25.9800
+     58.5900      0.0000      0.0000     25.9680
+     59.2700      0.0000      0.0000     25.9520
+     59.9500      0.0000      0.0000     25.9400
+     60.6300      0.0000      0.0000     25.9310
+     61.3000      0.0000      0.0000     25.9290
+     61.9800      0.0000      0.0000     25.9270
+     62.6600      0.0000      0.0000     25.9240
+     63.3400      0.0000      0.0000     25.9240
+     64.0200      0.0000      0.0000     25.9270
+     64.7000      0.0000      0.0000     25.9150
+     65.3800      0.0000      0.0000     25.9130
+     66.0600      0.0000      0.0000     25.8950
+     66.7400      0.0000      0.0000     25.8780
+     67.4200      0.0000      0.0000     25.8710
+     68.1000      0.0000      0.0000     25.8610
+     68.7800      0.0000      0.0000     25.8550
+     69.4600      0.0000      0.0000     25.8410
+     70.1400      0.0000      0.0000     25.8300
+     70.8100      0.0000      0.0000     25.8280
+     71.4900      0.0000      0.0000     25.8200
+     72.1700      0.0000      0.0000     25.8130
+     72.8500      0.0000      0.0000     25.8040
+     73.5300      0.0000      0.0000     25.7960
+     74.2100      0.0000      0.0000     25.7810
+     74.8900      0.0000      0.0000     25.7710
+     75.5700      0.0000      0.0000     25.7580
+     76.2500      0.0000      0.0000     25.7370
+     76.9200      0.0000      0.0000     25.7130
+     77.6000      0.0000      0.0000     25.7040
+     78.2800      0.0000      0.0000     25.6950
+     78.9600      0.0000      0.0000     25.6810
+     79.6400      0.0000      0.0000     25.6630
+     80.3200      0.0000      0.0000     25.5950
+     81.0000      0.0000      0.0000     25.5280
+     81.6700      0.0000      0.0000     25.4940
+     82.3500      0.0000      0.0000     25.5160
+     83.0300      0.0000      0.0000     25.5470
+     83.7100      0.0000      0.0000     25.5680
+     84.3900      0.0000      0.0000     25.5590
+     85.0700      0.0000      0.0000     25.5690
+     85.7400      0.0000      0.0000     25.5730
+     86.4200      0.0000      0.0000     25.5760
+     87.1000      0.0000      0.0000     25.5470
+     87.7800      0.0000      0.0000     25.4940
+     88.4600      0.0000      0.0000     25.3850
+     89.1300      0.0000      0.0000     25.3200
+     89.8100      0.0000      0.0000     25.2500
+     90.4900      0.0000      0.0000     25.2130
+     91.1700      0.0000      0.0000     25.1250
+     91.8500      0.0000      0.0000     25.0090
+     92.5200      0.0000      0.0000     24.9550
+     93.2000      0.0000      0.0000     24.8870
+     93.8800      0.0000      0.0000     24.8470
+     94.5600      0.0000      0.0000     24.8140
+     95.2400      0.0000      0.0000     24.8220
+     95.9100      0.0000      0.0000     24.6960
+     96.5900      0.0000      0.0000     24.5620
+     97.2700      0.0000      0.0000     24.4750
+     97.9500      0.0000      0.0000     24.3770
+     98.6200      0.0000      0.0000     24.3390
+     99.3000      0.0000      0.0000     24.3140
+     99.9800      0.0000      0.0000     24.2050
+    100.6600      0.0000      0.0000     23.8880
+    101.3300      0.0000      0.0000     23.4770
+    102.0100      0.0000      0.0000     23.1590
+    102.6900      0.0000      0.0000     22.9240
+    103.3700      0.0000      0.0000     22.7670
+    104.0400      0.0000      0.0000     22.6900
+    104.7200      0.0000      0.0000     22.6620
+    105.4000      0.0000      0.0000     22.6590
+    106.0700      0.0000      0.0000     22.6580
+    106.7500      0.0000      0.0000     22.6530
+    107.4300      0.0000      0.0000     22.6560
+    108.1100      0.0000      0.0000     22.6540
+    108.7800      0.0000      0.0000     22.6520
+    109.4600      0.0000      0.0000     22.5960
+    110.1400      0.0000      0.0000     22.3430
+    110.8100      0.0000      0.0000     22.0670
+    111.4900      0.0000      0.0000     21.6620
+    112.1700      0.0000      0.0000     21.2650
+    112.8400      0.0000      0.0000     21.0880
+    113.5200      0.0000      0.0000     21.0130
+    114.2000      0.0000      0.0000     20.9050
+    114.8700      0.0000      0.0000     20.7380
+    115.5500      0.0000      0.0000     20.6520
+    116.2300      0.0000      0.0000     20.5700
+    116.9000      0.0000      0.0000     20.5270
+    117.5800      0.0000      0.0000     20.4440
+    118.2600      0.0000      0.0000     20.3170
+    118.9300      0.0000      0.0000     20.2940
+    119.6100      0.0000      0.0000     20.2430
+    120.2900      0.0000      0.0000     20.2010
+    120.9600      0.0000      0.0000     20.1160
+    121.6400      0.0000      0.0000     20.0520
+    122.3100      0.0000      0.0000     20.0040
+    122.9900      0.0000      0.0000     19.9470
+    123.6700      0.0000      0.0000     19.8450
+    124.3400      0.0000      0.0000     19.7960
+    125.0200      0.0000      0.0000     19.7310
+    125.7000      0.0000      0.0000     19.6530
+    126.3700      0.0000      0.0000     19.6230
+    127.0500      0.0000      0.0000     19.5860
+    127.7200      0.0000      0.0000     19.5700
+    128.4000      0.0000      0.0000     19.5570
+    129.0700      0.0000      0.0000     19.5460
+    129.7500      0.0000      0.0000     19.5240
+    130.4300      0.0000      0.0000     19.5220
+    131.1000      0.0000      0.0000     19.5160
+    131.7800      0.0000      0.0000     19.5130
+    132.4500      0.0000      0.0000     19.5080
+    133.1300      0.0000      0.0000     19.4980
+    133.8100      0.0000      0.0000     19.4900
+    134.4800      0.0000      0.0000     19.4890
+    135.1600      0.0000      0.0000     19.4850
+    135.8300      0.0000      0.0000     19.4830
+    136.5100      0.0000      0.0000     19.4810
+    137.1800      0.0000      0.0000     19.4820
+    137.8600      0.0000      0.0000     19.4700
+    138.5300      0.0000      0.0000     19.4630
+    139.2100      0.0000      0.0000     19.4560
+    139.8800      0.0000      0.0000     19.4470
+    140.5600      0.0000      0.0000     19.4360
+    141.2300      0.0000      0.0000     19.4420
+    141.9100      0.0000      0.0000     19.4390
+    142.5900      0.0000      0.0000     19.4360
+    143.2600      0.0000      0.0000     19.4280
+    143.9400      0.0000      0.0000     19.4260
+    144.6100      0.0000      0.0000     19.4240
+    145.2900      0.0000      0.0000     19.4200
+    145.9600      0.0000      0.0000     19.4110
+    146.6400      0.0000      0.0000     19.4090
+    147.3100      0.0000      0.0000     19.3830
+    147.9900      0.0000      0.0000     19.3520
+    148.6600      0.0000      0.0000     19.3300
+    149.3400      0.0000      0.0000     19.2990
+    150.0100      0.0000      0.0000     19.2810
+    150.6800      0.0000      0.0000     19.2780
+    151.3600      0.0000      0.0000     19.2760
+    152.0300      0.0000      0.0000     19.2770
+    152.7100      0.0000      0.0000     19.2800
+    153.3800      0.0000      0.0000     19.2790
+    154.0600      0.0000      0.0000     19.2460
+    154.7300      0.0000      0.0000     19.2280
+    155.4100      0.0000      0.0000     19.2250
+    156.0800      0.0000      0.0000     19.2190
+    156.7600      0.0000      0.0000     19.2160
+    157.4300      0.0000      0.0000     19.2150
+    158.1000      0.0000      0.0000     19.2170
+    158.7800      0.0000      0.0000     19.2140
+    159.4500      0.0000      0.0000     19.2140
+    160.1300      0.0000      0.0000     19.2130
+    160.8000      0.0000      0.0000     19.2120
+    161.4800      0.0000      0.0000     19.2110
+    162.1500      0.0000      0.0000     19.2110
+    162.8200      0.0000      0.0000     19.2110
+    163.5000      0.0000      0.0000     19.2120
+    164.1700      0.0000      0.0000     19.2110
+    164.8500      0.0000      0.0000     19.2120
+    165.5200      0.0000      0.0000     19.2110
+    166.1900      0.0000      0.0000     19.2100
+    166.8700      0.0000      0.0000     19.2130
+    167.5400      0.0000      0.0000     19.2110
+    168.2200      0.0000      0.0000     19.2150
+    168.8900      0.0000      0.0000     19.2130
+    169.5600      0.0000      0.0000     19.2120
+    170.2400      0.0000      0.0000     19.2170
+    170.9100      0.0000      0.0000     19.2110
+    171.5800      0.0000      0.0000     19.2140
+    172.2600      0.0000      0.0000     19.2140
+    172.9300      0.0000      0.0000     19.2140
+    173.6000      0.0000      0.0000     19.2130
+    174.2800      0.0000      0.0000     19.2140
+    174.9500      0.0000      0.0000     19.2180
+    175.6200      0.0000      0.0000     19.2120
+    176.3000      0.0000      0.0000     19.2170
+    176.9700      0.0000      0.0000     19.2140
+    177.6400      0.0000      0.0000     19.2090
+    178.3200      0.0000      0.0000     19.2120
+    178.9900      0.0000      0.0000     19.2100
+    179.6600      0.0000      0.0000     19.2110
+    180.3400      0.0000      0.0000     19.2030
+    181.0100      0.0000      0.0000     19.2010
+    181.6800      0.0000      0.0000     19.2000
+    182.3600      0.0000      0.0000     19.1850
+    183.0300      0.0000      0.0000     19.1520
+    183.7000      0.0000      0.0000     19.0940
+    184.3800      0.0000      0.0000     19.0720
+    185.0500      0.0000      0.0000     19.0570
+    185.7200      0.0000      0.0000     19.0280
+    186.3900      0.0000      0.0000     18.9750
+    187.0700      0.0000      0.0000     18.9080
+    187.7400      0.0000      0.0000     18.5240
+    188.4100      0.0000      0.0000     18.1590
+    189.0800      0.0000      0.0000     17.9930
+    189.7600      0.0000      0.0000     17.8320
+    190.4300      0.0000      0.0000     17.6200
+    191.1000      0.0000      0.0000     16.4740
+    191.7700      0.0000      0.0000     15.4540
+    192.4500      0.0000      0.0000     15.1110
+    193.1200      0.0000      0.0000     15.0170
+    193.7900      0.0000      0.0000     14.9430
+    194.4600      0.0000      0.0000     14.9090
+    195.1400      0.0000      0.0000     14.8810
+    195.8100      0.0000      0.0000     14.8670
+    196.4800      0.0000      0.0000     14.8460
+    197.1500      0.0000      0.0000     14.8180
+    197.8300      0.0000      0.0000     14.7950
+    198.5000      0.0000      0.0000     14.7890
+    199.1700      0.0000      0.0000     14.7830
+    199.8400      0.0000      0.0000     14.7740
+    200.5100      0.0000      0.0000     14.7690
+    201.1900      0.0000      0.0000     14.7600
+    201.8600      0.0000      0.0000     14.7500
+    202.5300      0.0000      0.0000     14.7410
+    203.2000      0.0000      0.0000     14.7330
+    203.8700      0.0000      0.0000     14.7320
+    204.5500      0.0000      0.0000     14.7310
+    205.2200      0.0000      0.0000     14.7190
+    205.8900      0.0000      0.0000     14.7150
+    206.5600      0.0000      0.0000     14.7100
+    207.2300      0.0000      0.0000     14.7070
+    207.9000      0.0000      0.0000     14.7040
+    208.5800      0.0000      0.0000     14.6960
+    209.2500      0.0000      0.0000     14.6940
+    209.9200      0.0000      0.0000     14.6840
+    210.5900      0.0000      0.0000     14.6690
+    211.2600      0.0000      0.0000     14.6570
+    211.9300      0.0000      0.0000     14.6520
+    212.6000      0.0000      0.0000     14.6410
+    213.2800      0.0000      0.0000     14.6350
+    213.9500      0.0000      0.0000     14.6250
+    214.6200      0.0000      0.0000     14.6190
+    215.2900      0.0000      0.0000     14.6100
+    215.9600      0.0000      0.0000     14.6010
+    216.6300      0.0000      0.0000     14.5900
+    217.3000      0.0000      0.0000     14.5770
+    217.9700      0.0000      0.0000     14.5650
+    218.6500      0.0000      0.0000     14.5510
+    219.3200      0.0000      0.0000     14.5330
+    219.9900      0.0000      0.0000     14.4830
+    220.6600      0.0000      0.0000     14.4300
+    221.3300      0.0000      0.0000     14.3520
+    222.0000      0.0000      0.0000     14.2610
+    222.6700      0.0000      0.0000     14.1380
+    223.3400      0.0000      0.0000     13.8480
+    224.0100      0.0000      0.0000     13.6120
+    224.6800      0.0000      0.0000     13.5120
+    225.3500      0.0000      0.0000     13.4690
+    226.0200      0.0000      0.0000     13.4490
+    226.7000      0.0000      0.0000     13.4350
+    227.3700      0.0000      0.0000     13.4290
+    228.0400      0.0000      0.0000     13.4210
+    228.7100      0.0000      0.0000     13.4120
+    229.3800      0.0000      0.0000     13.4010
+    230.0500      0.0000      0.0000     13.3860
+    230.7200      0.0000      0.0000     13.3670
+    231.3900      0.0000      0.0000     13.3490
+    232.0600      0.0000      0.0000     13.3320
+    232.7300      0.0000      0.0000     13.3160
+    233.4000      0.0000      0.0000     13.2930
+    234.0700      0.0000      0.0000     13.2790
+    234.7400      0.0000      0.0000     13.2650
+    235.4100      0.0000      0.0000     13.2300
+    236.0800      0.0000      0.0000     13.1880
+    236.7500      0.0000      0.0000     13.1450
+    237.4200      0.0000      0.0000     13.0920
+    238.0900      0.0000      0.0000     13.0500
+    238.7600      0.0000      0.0000     12.9970
+    239.4300      0.0000      0.0000     12.9390
+    240.1000      0.0000      0.0000     12.8580
+    240.7700      0.0000      0.0000     12.7890
+    241.4400      0.0000      0.0000     12.7350
+    242.1100      0.0000      0.0000     12.6740
+    242.7800      0.0000      0.0000     12.6140
+    243.4500      0.0000      0.0000     12.5730
+    244.1200      0.0000      0.0000     12.5470
+    244.7900      0.0000      0.0000     12.5110
+    245.4600      0.0000      0.0000     12.4840
+    246.1300      0.0000      0.0000     12.4500
+    246.8000      0.0000      0.0000     12.3980
+    247.4700      0.0000      0.0000     12.3590
+    248.1400      0.0000      0.0000     12.3430
+    248.8100      0.0000      0.0000     12.3290
+    249.4800      0.0000      0.0000     12.3080
+    250.1400      0.0000      0.0000     12.2840
+    250.8100      0.0000      0.0000     12.2710
+    251.4800      0.0000      0.0000     12.2510
+    252.1500      0.0000      0.0000     12.2460
+    252.8200      0.0000      0.0000     12.2400
+    253.4900      0.0000      0.0000     12.2250
+    254.1600      0.0000      0.0000     12.2080
+    254.8300      0.0000      0.0000     12.2000
+    255.5000      0.0000      0.0000     12.1880
+    256.1700      0.0000      0.0000     12.1670
+    256.8400      0.0000      0.0000     12.1500
+    257.5000      0.0000      0.0000     12.1230
+    258.1700      0.0000      0.0000     12.0940
+    258.8400      0.0000      0.0000     12.0730
+    259.5100      0.0000      0.0000     12.0240
+    260.1800      0.0000      0.0000     12.0080
+    260.8500      0.0000      0.0000     11.9960
+    261.5200      0.0000      0.0000     11.9690
+    262.1900      0.0000      0.0000     11.9640
+    262.8600      0.0000      0.0000     11.9340
+    263.5200      0.0000      0.0000     11.9160
+    264.1900      0.0000      0.0000     11.9070
+    264.8600      0.0000      0.0000     11.9020
+    265.5300      0.0000      0.0000     11.8800
+    266.2000      0.0000      0.0000     11.8660
+    266.8700      0.0000      0.0000     11.8560
+    267.5300      0.0000      0.0000     11.7150
+    268.2000      0.0000      0.0000     11.4570
+    268.8700      0.0000      0.0000     11.2430
+    269.5400      0.0000      0.0000     11.1790
+    270.2100      0.0000      0.0000     11.1520
+    270.8800      0.0000      0.0000     11.1370
+    271.5400      0.0000      0.0000     11.1220
+    272.2100      0.0000      0.0000     11.1170
+    272.8800      0.0000      0.0000     11.1130
+    273.5500      0.0000      0.0000     11.1070
+    274.2200      0.0000      0.0000     11.0990
+    274.8800      0.0000      0.0000     11.0930
+    275.5500      0.0000      0.0000     11.0860
+    276.2200      0.0000      0.0000     11.0780
+    276.8900      0.0000      0.0000     11.0690
+    277.5600      0.0000      0.0000     11.0550
+    278.2200      0.0000      0.0000     11.0490
+    278.8900      0.0000      0.0000     11.0330
+    279.5600      0.0000      0.0000     11.0200
+    280.2300      0.0000      0.0000     11.0150
+    280.9000      0.0000      0.0000     11.0180
+    281.5600      0.0000      0.0000     11.0120
+    282.2300      0.0000      0.0000     11.0030
+    282.9000      0.0000      0.0000     10.9930
+    283.5700      0.0000      0.0000     10.9770
+    284.2300      0.0000      0.0000     10.9740
+    284.9000      0.0000      0.0000     10.9640
+    285.5700      0.0000      0.0000     10.9540
+    286.2400      0.0000      0.0000     10.9410
+    286.9000      0.0000      0.0000     10.9290
+    287.5700      0.0000      0.0000     10.9200
+    288.2400      0.0000      0.0000     10.9170
+    288.9000      0.0000      0.0000     10.9100
+    289.5700      0.0000      0.0000     10.9080
+    290.2400      0.0000      0.0000     10.9070
+    290.9100      0.0000      0.0000     10.9070
+    291.5700      0.0000      0.0000     10.9050
+    292.2400      0.0000      0.0000     10.9020
+    292.9100      0.0000      0.0000     10.9020
+    293.5700      0.0000      0.0000     10.9000
+    294.2400      0.0000      0.0000     10.8990
+    294.9100      0.0000      0.0000     10.8720
+    295.5700      0.0000      0.0000     10.8640
+    296.2400      0.0000      0.0000     10.8570
+    296.9100      0.0000      0.0000     10.8520
+    297.5800      0.0000      0.0000     10.8580
+    298.2400      0.0000      0.0000     10.8570
+    298.9100      0.0000      0.0000     10.8510
+    299.5800      0.0000      0.0000     10.8490
+    300.2400      0.0000      0.0000     10.8460
+    300.9100      0.0000      0.0000     10.8290
+    301.5800      0.0000      0.0000     10.8200
+    302.2400      0.0000      0.0000     10.8130
+    302.9100      0.0000      0.0000     10.7960
+    303.5700      0.0000      0.0000     10.7820
+    304.2400      0.0000      0.0000     10.7710
+    304.9100      0.0000      0.0000     10.7740
+    305.5700      0.0000      0.0000     10.7640
+    306.2400      0.0000      0.0000     10.7640
+    306.9100      0.0000      0.0000     10.7570
+    307.5700      0.0000      0.0000     10.7450
+    308.2400      0.0000      0.0000     10.7430
+    308.9000      0.0000      0.0000     10.7100
+    309.5700      0.0000      0.0000     10.6860
+    310.2400      0.0000      0.0000     10.6800
+    310.9000      0.0000      0.0000     10.6730
+    311.5700      0.0000      0.0000     10.6400
+    312.2300      0.0000      0.0000     10.6130
+    312.9000      0.0000      0.0000     10.6050
+    313.5700      0.0000      0.0000     10.6000
+    314.2300      0.0000      0.0000     10.6040
+    314.9000      0.0000      0.0000     10.5890
+    315.5600      0.0000      0.0000     10.5830
+    316.2300      0.0000      0.0000     10.5680
+    316.9000      0.0000      0.0000     10.5430
+    317.5600      0.0000      0.0000     10.5290
+    318.2300      0.0000      0.0000     10.5160
+    318.8900      0.0000      0.0000     10.5030
+    319.5600      0.0000      0.0000     10.4870
+    320.2200      0.0000      0.0000     10.4760
+    320.8900      0.0000      0.0000     10.4630
+    321.5500      0.0000      0.0000     10.4490
+    322.2200      0.0000      0.0000     10.4230
+    322.8900      0.0000      0.0000     10.3880
+    323.5500      0.0000      0.0000     10.3220
+    324.2200      0.0000      0.0000     10.1820
+    324.8800      0.0000      0.0000     10.1230
+    325.5500      0.0000      0.0000     10.1100
+    326.2100      0.0000      0.0000     10.1050
+    326.8800      0.0000      0.0000     10.1040
+    327.5400      0.0000      0.0000     10.1000
+    328.2100      0.0000      0.0000     10.0970
+    328.8700      0.0000      0.0000     10.0900
+    329.5400      0.0000      0.0000     10.0840
+    330.2000      0.0000      0.0000     10.0730
+    330.8700      0.0000      0.0000     10.0670
+    331.5300      0.0000      0.0000     10.0560
+    332.2000      0.0000      0.0000     10.0450
+    332.8600      0.0000      0.0000     10.0350
+    333.5300      0.0000      0.0000     10.0250
+    334.1900      0.0000      0.0000     10.0120
+    334.8600      0.0000      0.0000     10.0010
+    335.5200      0.0000      0.0000      9.9930
+    336.1900      0.0000      0.0000      9.9810
+    336.8500      0.0000      0.0000      9.9750
+    337.5100      0.0000      0.0000      9.9720
+    338.1800      0.0000      0.0000      9.9650
+    338.8400      0.0000      0.0000      9.9640
+    339.5100      0.0000      0.0000      9.9510
+    340.1700      0.0000      0.0000      9.9330
+    340.8400      0.0000      0.0000      9.9090
+    341.5000      0.0000      0.0000      9.8970
+    342.1700      0.0000      0.0000      9.8980
+    342.8300      0.0000      0.0000      9.8950
+    343.4900      0.0000      0.0000      9.8930
+    344.1600      0.0000      0.0000      9.8830
+    344.8200      0.0000      0.0000      9.8720
+    345.4900      0.0000      0.0000      9.8630
+    346.1500      0.0000      0.0000      9.8540
+    346.8100      0.0000      0.0000      9.8080
+    347.4800      0.0000      0.0000      9.7770
+    348.1400      0.0000      0.0000      9.7710
+    348.8100      0.0000      0.0000      9.7750
+    349.4700      0.0000      0.0000      9.7800
+    350.1300      0.0000      0.0000      9.7780
+    350.8000      0.0000      0.0000      9.7670
+    351.4600      0.0000      0.0000      9.7590
+    352.1300      0.0000      0.0000      9.7600
+    352.7900      0.0000      0.0000      9.7610
+    353.4500      0.0000      0.0000      9.7620
+    354.1200      0.0000      0.0000      9.7480
+    354.7800      0.0000      0.0000      9.7440
+    355.4400      0.0000      0.0000      9.7380
+    356.1100      0.0000      0.0000      9.7190
+    356.7700      0.0000      0.0000      9.6950
+    357.4400      0.0000      0.0000      9.6890
+    358.1000      0.0000      0.0000      9.6890
+    358.7600      0.0000      0.0000      9.7000
+    359.4300      0.0000      0.0000      9.6990
+    360.0900      0.0000      0.0000      9.6880
+    360.7500      0.0000      0.0000      9.6800
+    361.4200      0.0000      0.0000      9.6760
+    362.0800      0.0000      0.0000      9.6650
+    362.7400      0.0000      0.0000      9.6560
+    363.4000      0.0000      0.0000      9.6550
+    364.0700      0.0000      0.0000      9.6510
+    364.7300      0.0000      0.0000      9.6500
+    365.3900      0.0000      0.0000      9.6490
+    366.0600      0.0000      0.0000      9.6460
+    366.7200      0.0000      0.0000      9.6370
+    367.3800      0.0000      0.0000      9.6420
+    368.0500      0.0000      0.0000      9.6440
+    368.7100      0.0000      0.0000      9.6440
+    369.3700      0.0000      0.0000      9.6430
+    370.0300      0.0000      0.0000      9.6460
+    370.7000      0.0000      0.0000      9.6430
+    371.3600      0.0000      0.0000      9.6410
+    372.0200      0.0000      0.0000      9.6420
+    372.6900      0.0000      0.0000      9.6450
+    373.3500      0.0000      0.0000      9.6400
+    374.0100      0.0000      0.0000      9.6380
+    374.6700      0.0000      0.0000      9.6370
+    375.3400      0.0000      0.0000      9.6320
+    376.0000      0.0000      0.0000      9.6280
+    376.6600      0.0000      0.0000      9.6200
+    377.3200      0.0000      0.0000      9.6110
+    377.9900      0.0000      0.0000      9.6060
+    378.6500      0.0000      0.0000      9.6030
+    379.3100      0.0000      0.0000      9.6000
+    379.9700      0.0000      0.0000      9.5900
+    380.6300      0.0000      0.0000      9.5890
+    381.3000      0.0000      0.0000      9.5810
+    381.9600      0.0000      0.0000      9.5670
+    382.6200      0.0000      0.0000      9.5580
+    383.2800      0.0000      0.0000      9.5470
+    383.9400      0.0000      0.0000      9.5270
+    384.6100      0.0000      0.0000      9.4860
+    385.2700      0.0000      0.0000      9.4690
+    385.9300      0.0000      0.0000      9.4700
+    386.5900      0.0000      0.0000      9.4690
+    387.2500      0.0000      0.0000      9.4590
+    387.9200      0.0000      0.0000      9.4040
+    388.5800      0.0000      0.0000      9.3160
+    389.2400      0.0000      0.0000      9.2560
+    389.9000      0.0000      0.0000      9.1810
+    390.5600      0.0000      0.0000      9.1150
+    391.2200      0.0000      0.0000      9.0740
+    391.8900      0.0000      0.0000      8.9980
+    392.5500      0.0000      0.0000      8.9290
+    393.2100      0.0000      0.0000      8.8720
+    393.8700      0.0000      0.0000      8.8390
+    394.5300      0.0000      0.0000      8.8270
+    395.1900      0.0000      0.0000      8.8060
+    395.8600      0.0000      0.0000      8.7860
+    396.5200      0.0000      0.0000      8.7440
+    397.1800      0.0000      0.0000      8.6900
+    397.8400      0.0000      0.0000      8.6580
+    398.5000      0.0000      0.0000      8.6300
+    399.1600      0.0000      0.0000      8.6180
+    399.8200      0.0000      0.0000      8.6020
+    400.4800      0.0000      0.0000      8.5800
+    401.1400      0.0000      0.0000      8.5580
+    401.8100      0.0000      0.0000      8.5450
+    402.4700      0.0000      0.0000      8.5320
+    403.1300      0.0000      0.0000      8.5260
+    403.7900      0.0000      0.0000      8.5180
+    404.4500      0.0000      0.0000      8.5090
+    405.1100      0.0000      0.0000      8.4760
+    405.7700      0.0000      0.0000      8.4460
+    406.4300      0.0000      0.0000      8.4600
+    407.0900      0.0000      0.0000      8.5190
+    407.7500      0.0000      0.0000      8.5740
+    408.4100      0.0000      0.0000      8.6060
+    409.0800      0.0000      0.0000      8.6060
+    409.7400      0.0000      0.0000      8.5810
+    410.4000      0.0000      0.0000      8.5660
+    411.0600      0.0000      0.0000      8.5540
+    411.7200      0.0000      0.0000      8.5160
+    412.3800      0.0000      0.0000      8.5040
+    413.0400      0.0000      0.0000      8.5110
+    413.7000      0.0000      0.0000      8.5280
+    414.3600      0.0000      0.0000      8.5290
+    415.0200      0.0000      0.0000      8.5250
+    415.6800      0.0000      0.0000      8.5200
+    416.3400      0.0000      0.0000      8.5170
+    417.0000      0.0000      0.0000      8.5080
+    417.6600      0.0000      0.0000      8.4930
+    418.3200      0.0000      0.0000      8.4760
+    418.9800      0.0000      0.0000      8.4710
+    419.6400      0.0000      0.0000      8.4520
+    420.3000      0.0000      0.0000      8.4410
+    420.9600      0.0000      0.0000      8.4340
+    421.6200      0.0000      0.0000      8.4320
+    422.2800      0.0000      0.0000      8.4280
+    422.9400      0.0000      0.0000      8.4250
+    423.6000      0.0000      0.0000      8.4290
+    424.2600      0.0000      0.0000      8.4230
+    424.9200      0.0000      0.0000      8.4140
+    425.5800      0.0000      0.0000      8.4030
+    426.2400      0.0000      0.0000      8.3790
+    426.9000      0.0000      0.0000      8.3570
+    427.5600      0.0000      0.0000      8.3430
+    428.2200      0.0000      0.0000      8.3340
+    428.8800      0.0000      0.0000      8.3200
+    429.5400      0.0000      0.0000      8.3050
+    430.2000      0.0000      0.0000      8.2810
+    430.8600      0.0000      0.0000      8.2610
+    431.5200      0.0000      0.0000      8.2520
+    432.1800      0.0000      0.0000      8.2400
+    432.8300      0.0000      0.0000      8.2340
+    433.4900      0.0000      0.0000      8.2220
+    434.1500      0.0000      0.0000      8.2120
+    434.8100      0.0000      0.0000      8.2100
+    435.4700      0.0000      0.0000      8.2000
+    436.1300      0.0000      0.0000      8.1850
+    436.7900      0.0000      0.0000      8.1800
+    437.4500      0.0000      0.0000      8.1790
+    438.1100      0.0000      0.0000      8.1720
+    438.7700      0.0000      0.0000      8.1750
+    439.4300      0.0000      0.0000      8.1750
+    440.0800      0.0000      0.0000      8.1730
+    440.7400      0.0000      0.0000      8.1720
+    441.4000      0.0000      0.0000      8.1740
+    442.0600      0.0000      0.0000      8.1760
+    442.7200      0.0000      0.0000      8.1720
+    443.3800      0.0000      0.0000      8.1710
+    444.0400      0.0000      0.0000      8.1720
+    444.7000      0.0000      0.0000      8.1720
+    445.3500      0.0000      0.0000      8.1710
+    446.0100      0.0000      0.0000      8.1660
+    446.6700      0.0000      0.0000      8.1650
+    447.3300      0.0000      0.0000      8.1620
+    447.9900      0.0000      0.0000      8.1620
+    448.6500      0.0000      0.0000      8.1630
+    449.3100      0.0000      0.0000      8.1590
+    449.9600      0.0000      0.0000      8.1590
+    450.6200      0.0000      0.0000      8.1590
+    451.2800      0.0000      0.0000      8.1600
+    451.9400      0.0000      0.0000      8.1590
+    452.6000      0.0000      0.0000      8.1580
+    453.2600      0.0000      0.0000      8.1590
+    453.9100      0.0000      0.0000      8.1590
+    454.5700      0.0000      0.0000      8.1590
+    455.2300      0.0000      0.0000      8.1550
+    455.8900      0.0000      0.0000      8.1570
+    456.5500      0.0000      0.0000      8.1520
+    457.2000      0.0000      0.0000      8.1500
+    457.8600      0.0000      0.0000      8.1510
+    458.5200      0.0000      0.0000      8.1490
+    459.1800      0.0000      0.0000      8.1460
+    459.8400      0.0000      0.0000      8.1450
+    460.4900      0.0000      0.0000      8.1490
+    461.1500      0.0000      0.0000      8.1460
+    461.8100      0.0000      0.0000      8.1460
+    462.4700      0.0000      0.0000      8.1490
+    463.1200      0.0000      0.0000      8.1480
+    463.7800      0.0000      0.0000      8.1430
+    464.4400      0.0000      0.0000      8.1410
+    465.1000      0.0000      0.0000      8.1420
+    465.7500      0.0000      0.0000      8.1400
+    466.4100      0.0000      0.0000      8.1400
+    467.0700      0.0000      0.0000      8.1360
+    467.7300      0.0000      0.0000      8.1330
+    468.3800      0.0000      0.0000      8.1350
+    469.0400      0.0000      0.0000      8.1330
+    469.7000      0.0000      0.0000      8.1320
+    470.3600      0.0000      0.0000      8.1320
+    471.0100      0.0000      0.0000      8.1330
+    471.6700      0.0000      0.0000      8.1300
+    472.3300      0.0000      0.0000      8.1290
+    472.9900      0.0000      0.0000      8.1280
+    473.6400      0.0000      0.0000      8.1290
+    474.3000      0.0000      0.0000      8.1260
+    474.9600      0.0000      0.0000      8.1260
+    475.6100      0.0000      0.0000      8.1200
+    476.2700      0.0000      0.0000      8.1160
+    476.9300      0.0000      0.0000      8.1070
+    477.5800      0.0000      0.0000      8.1080
+    478.2400      0.0000      0.0000      8.0980
+    478.9000      0.0000      0.0000      8.0920
+    479.5500      0.0000      0.0000      8.0900
+    480.2100      0.0000      0.0000      8.0770
+    480.8700      0.0000      0.0000      8.0720
+    481.5200      0.0000      0.0000      8.0610
+    482.1800      0.0000      0.0000      8.0350
+    482.8400      0.0000      0.0000      8.0220
+    483.4900      0.0000      0.0000      8.0170
+    484.1500      0.0000      0.0000      7.9980
+    484.8100      0.0000      0.0000      7.9840
+    485.4600      0.0000      0.0000      7.9720
+    486.1200      0.0000      0.0000      7.9650
+    486.7800      0.0000      0.0000      7.9560
+    487.4300      0.0000      0.0000      7.9340
+    488.0900      0.0000      0.0000      7.9100
+    488.7500      0.0000      0.0000      7.8560
+    489.4000      0.0000      0.0000      7.8230
+    490.0600      0.0000      0.0000      7.8160
+    490.7100      0.0000      0.0000      7.8130
+    491.3700      0.0000      0.0000      7.8140
+    492.0300      0.0000      0.0000      7.8090
+    492.6800      0.0000      0.0000      7.8020
+    493.3400      0.0000      0.0000      7.7960
+    493.9900      0.0000      0.0000      7.7900
+    494.6500      0.0000      0.0000      7.7900
+    495.3100      0.0000      0.0000      7.7900
+    495.9600      0.0000      0.0000      7.7920
+    496.6200      0.0000      0.0000      7.7900
+    497.2700      0.0000      0.0000      7.7910
+    497.9300      0.0000      0.0000      7.7880
+    498.5800      0.0000      0.0000      7.7930
+    499.2400      0.0000      0.0000      7.7900
+    499.9000      0.0000      0.0000      7.7920
+    500.5500      0.0000      0.0000      7.7900
+    501.2100      0.0000      0.0000      7.7900
+    501.8600      0.0000      0.0000      7.7870
+    502.5200      0.0000      0.0000      7.7870
+    503.1700      0.0000      0.0000      7.7830
+    503.8300      0.0000      0.0000      7.7840
+    504.4800      0.0000      0.0000      7.7810
+    505.1400      0.0000      0.0000      7.7820
+    505.7900      0.0000      0.0000      7.7770
+    506.4500      0.0000      0.0000      7.7710
+    507.1100      0.0000      0.0000      7.7670
+    507.7600      0.0000      0.0000      7.7560
+    508.4200      0.0000      0.0000      7.7430
+    509.0700      0.0000      0.0000      7.7230
+    509.7300      0.0000      0.0000      7.7050
+    510.3800      0.0000      0.0000      7.7000
+    511.0400      0.0000      0.0000      7.6900
+    511.6900      0.0000      0.0000      7.6820
+    512.3500      0.0000      0.0000      7.6780
+    513.0000      0.0000      0.0000      7.6600
+    513.6600      0.0000      0.0000      7.6340
+    514.3100      0.0000      0.0000      7.6230
+    514.9700      0.0000      0.0000      7.6230
+    515.6200      0.0000      0.0000      7.6200
+    516.2700      0.0000      0.0000      7.6180
+    516.9300      0.0000      0.0000      7.6090
+    517.5800      0.0000      0.0000      7.6010
+    518.2400      0.0000      0.0000      7.5950
+    518.8900      0.0000      0.0000      7.5790
+    519.5500      0.0000      0.0000      7.5710
+    520.2000      0.0000      0.0000      7.5590
+    520.8600      0.0000      0.0000      7.5370
+    521.5100      0.0000      0.0000      7.4930
+    522.1700      0.0000      0.0000      7.4740
+    522.8200      0.0000      0.0000      7.4550
+    523.4700      0.0000      0.0000      7.4350
+    524.1300      0.0000      0.0000      7.4260
+    524.7800      0.0000      0.0000      7.4260
+    525.4400      0.0000      0.0000      7.4250
+    526.0900      0.0000      0.0000      7.4190
+    526.7500      0.0000      0.0000      7.4230
+    527.4000      0.0000      0.0000      7.4180
+    528.0500      0.0000      0.0000      7.4170
+    528.7100      0.0000      0.0000      7.4140
+    529.3600      0.0000      0.0000      7.4160
+    530.0200      0.0000      0.0000      7.4090
+    530.6700      0.0000      0.0000      7.4140
+    531.3200      0.0000      0.0000      7.4020
+    531.9800      0.0000      0.0000      7.3990
+    532.6300      0.0000      0.0000      7.4010
+    533.2800      0.0000      0.0000      7.3960
+    533.9400      0.0000      0.0000      7.3980
+    534.5900      0.0000      0.0000      7.3910
+    535.2500      0.0000      0.0000      7.3940
+    535.9000      0.0000      0.0000      7.3910
+    536.5500      0.0000      0.0000      7.3900
+    537.2100      0.0000      0.0000      7.3950
+    537.8600      0.0000      0.0000      7.3920
+    538.5100      0.0000      0.0000      7.3890
+    539.1700      0.0000      0.0000      7.3860
+    539.8200      0.0000      0.0000      7.3860
+    540.4700      0.0000      0.0000      7.3870
+    541.1300      0.0000      0.0000      7.3800
+    541.7800      0.0000      0.0000      7.3790
+    542.4300      0.0000      0.0000      7.3770
+    543.0900      0.0000      0.0000      7.3800
+    543.7400      0.0000      0.0000      7.3710
+    544.3900      0.0000      0.0000      7.3740
+    545.0500      0.0000      0.0000      7.3680
+    545.7000      0.0000      0.0000      7.3660
+    546.3500      0.0000      0.0000      7.3660
+    547.0100      0.0000      0.0000      7.3600
+    547.6600      0.0000      0.0000      7.3550
+    548.3100      0.0000      0.0000      7.3450
+    548.9600      0.0000      0.0000      7.3450
+    549.6200      0.0000      0.0000      7.3480
+    550.2700      0.0000      0.0000      7.3400
+    550.9200      0.0000      0.0000      7.3450
+    551.5800      0.0000      0.0000      7.3440
+    552.2300      0.0000      0.0000      7.3410
+    552.8800      0.0000      0.0000      7.3450
+    553.5300      0.0000      0.0000      7.3410
+    554.1900      0.0000      0.0000      7.3390
+    554.8400      0.0000      0.0000      7.3360
+    555.4900      0.0000      0.0000      7.3300
+    556.1400      0.0000      0.0000      7.3230
+    556.8000      0.0000      0.0000      7.3190
+    557.4500      0.0000      0.0000      7.3110
+    558.1000      0.0000      0.0000      7.3090
+    558.7500      0.0000      0.0000      7.3040
+    559.4100      0.0000      0.0000      7.3020
+    560.0600      0.0000      0.0000      7.3000
+    560.7100      0.0000      0.0000      7.2990
+    561.3600      0.0000      0.0000      7.3000
+    562.0100      0.0000      0.0000      7.2930
+    562.6700      0.0000      0.0000      7.2860
+    563.3200      0.0000      0.0000      7.2800
+    563.9700      0.0000      0.0000      7.2840
+    564.6200      0.0000      0.0000      7.2880
+    565.2700      0.0000      0.0000      7.2890
+    565.9300      0.0000      0.0000      7.2620
+    566.5800      0.0000      0.0000      7.2310
+    567.2300      0.0000      0.0000      7.2310
+    567.8800      0.0000      0.0000      7.2190
+    568.5300      0.0000      0.0000      7.2150
+    569.1900      0.0000      0.0000      7.2170
+    569.8400      0.0000      0.0000      7.2150
+    570.4900      0.0000      0.0000      7.2050
+    571.1400      0.0000      0.0000      7.1680
+    571.7900      0.0000      0.0000      7.1360
+    572.4400      0.0000      0.0000      7.1240
+    573.1000      0.0000      0.0000      7.1200
+    573.7500      0.0000      0.0000      7.1150
+    574.4000      0.0000      0.0000      7.1140
+    575.0500      0.0000      0.0000      7.1120
+    575.7000      0.0000      0.0000      7.1030
+    576.3500      0.0000      0.0000      7.0950
+    577.0000      0.0000      0.0000      7.0890
+    577.6600      0.0000      0.0000      7.0710
+    578.3100      0.0000      0.0000      7.0600
+    578.9600      0.0000      0.0000      7.0490
+    579.6100      0.0000      0.0000      7.0200
+    580.2600      0.0000      0.0000      6.9900
+    580.9100      0.0000      0.0000      6.9760
+    581.5600      0.0000      0.0000      6.9600
+    582.2100      0.0000      0.0000      6.9490
+    582.8600      0.0000      0.0000      6.9400
+    583.5200      0.0000      0.0000      6.9430
+    584.1700      0.0000      0.0000      6.9400
+    584.8200      0.0000      0.0000      6.9340
+    585.4700      0.0000      0.0000      6.9290
+    586.1200      0.0000      0.0000      6.9320
+    586.7700      0.0000      0.0000      6.9320
+    587.4200      0.0000      0.0000      6.9310
+    588.0700      0.0000      0.0000      6.9270
+    588.7200      0.0000      0.0000      6.9290
+    589.3700      0.0000      0.0000      6.9250
+    590.0200      0.0000      0.0000      6.9260
+    590.6700      0.0000      0.0000      6.9230
+    591.3200      0.0000      0.0000      6.9260
+    591.9700      0.0000      0.0000      6.9230
+    592.6300      0.0000      0.0000      6.9230
+    593.2800      0.0000      0.0000      6.9150
+    593.9300      0.0000      0.0000      6.9100
+    594.5800      0.0000      0.0000      6.8960
+    595.2300      0.0000      0.0000      6.8930
+    595.8800      0.0000      0.0000      6.8870
+    596.5300      0.0000      0.0000      6.8840
+    597.1800      0.0000      0.0000      6.8830
+    597.8300      0.0000      0.0000      6.8830
+    598.4800      0.0000      0.0000      6.8790
+    599.1300      0.0000      0.0000      6.8740
+    599.7800      0.0000      0.0000      6.8670
+    600.4300      0.0000      0.0000      6.8670
+    601.0800      0.0000      0.0000      6.8640
+    601.7300      0.0000      0.0000      6.8680
+    602.3800      0.0000      0.0000      6.8620
+    603.0300      0.0000      0.0000      6.8560
+    603.6800      0.0000      0.0000      6.8510
+    604.3300      0.0000      0.0000      6.8450
+    604.9800      0.0000      0.0000      6.8370
+    605.6300      0.0000      0.0000      6.8340
+    606.2800      0.0000      0.0000      6.8330
+    606.9300      0.0000      0.0000      6.8290
+    607.5800      0.0000      0.0000      6.8240
+    608.2300      0.0000      0.0000      6.8000
+    608.8700      0.0000      0.0000      6.7350
+    609.5200      0.0000      0.0000      6.7020
+    610.1700      0.0000      0.0000      6.6890
+    610.8200      0.0000      0.0000      6.6770
+    611.4700      0.0000      0.0000      6.6710
+    612.1200      0.0000      0.0000      6.6650
+    612.7700      0.0000      0.0000      6.6570
+    613.4200      0.0000      0.0000      6.6570
+    614.0700      0.0000      0.0000      6.6540
+    614.7200      0.0000      0.0000      6.6550
+    615.3700      0.0000      0.0000      6.6550
+    616.0200      0.0000      0.0000      6.6540
+    616.6700      0.0000      0.0000      6.6540
+    617.3200      0.0000      0.0000      6.6540
+    617.9600      0.0000      0.0000      6.6520
+    618.6100      0.0000      0.0000      6.6540
+    619.2600      0.0000      0.0000      6.6510
+    619.9100      0.0000      0.0000      6.6480
+    620.5600      0.0000      0.0000      6.6450
+    621.2100      0.0000      0.0000      6.6390
+    621.8600      0.0000      0.0000      6.6310
+    622.5100      0.0000      0.0000      6.6240
+    623.1600      0.0000      0.0000      6.5900
+    623.8000      0.0000      0.0000      6.5760
+    624.4500      0.0000      0.0000      6.5670
+    625.1000      0.0000      0.0000      6.5530
+    625.7500      0.0000      0.0000      6.5340
+    626.4000      0.0000      0.0000      6.5210
+    627.0500      0.0000      0.0000      6.5200
+    627.7000      0.0000      0.0000      6.5150
+    628.3400      0.0000      0.0000      6.5160
+    628.9900      0.0000      0.0000      6.5140
+    629.6400      0.0000      0.0000      6.5110
+    630.2900      0.0000      0.0000      6.5120
+    630.9400      0.0000      0.0000      6.5100
+    631.5900      0.0000      0.0000      6.5100
+    632.2300      0.0000      0.0000      6.5100
+    632.8800      0.0000      0.0000      6.5090
+    633.5300      0.0000      0.0000      6.5060
+    634.1800      0.0000      0.0000      6.5040
+    634.8300      0.0000      0.0000      6.5060
+    635.4800      0.0000      0.0000      6.5080
+    636.1200      0.0000      0.0000      6.5010
+    636.7700      0.0000      0.0000      6.4960
+    637.4200      0.0000      0.0000      6.4950
+    638.0700      0.0000      0.0000      6.4910
+    638.7100      0.0000      0.0000      6.4890
+    639.3600      0.0000      0.0000      6.4860
+    640.0100      0.0000      0.0000      6.4860
+    640.6600      0.0000      0.0000      6.4790
+    641.3100      0.0000      0.0000      6.4770
+    641.9500      0.0000      0.0000      6.4790
+    642.6000      0.0000      0.0000      6.4720
+    643.2500      0.0000      0.0000      6.4690
+    643.9000      0.0000      0.0000      6.4710
+    644.5400      0.0000      0.0000      6.4670
+    645.1900      0.0000      0.0000      6.4670
+    645.8400      0.0000      0.0000      6.4720
+    646.4900      0.0000      0.0000      6.4630
+    647.1300      0.0000      0.0000      6.4630
+    647.7800      0.0000      0.0000      6.4670
+    648.4300      0.0000      0.0000      6.4580
+    649.0800      0.0000      0.0000      6.4560
+    649.7200      0.0000      0.0000      6.4540
+    650.3700      0.0000      0.0000      6.4530
+    651.0200      0.0000      0.0000      6.4540
+    651.6600      0.0000      0.0000      6.4460
+    652.3100      0.0000      0.0000      6.4360
+    652.9600      0.0000      0.0000      6.4270
+    653.6100      0.0000      0.0000      6.4230
+    654.2500      0.0000      0.0000      6.4210
+    654.9000      0.0000      0.0000      6.4180
+    655.5500      0.0000      0.0000      6.4120
+    656.1900      0.0000      0.0000      6.4100
+    656.8400      0.0000      0.0000      6.3910
+    657.4900      0.0000      0.0000      6.3860
+    658.1300      0.0000      0.0000      6.3810
+    658.7800      0.0000      0.0000      6.3790
+    659.4300      0.0000      0.0000      6.3570
+    660.0700      0.0000      0.0000      6.3360
+    660.7200      0.0000      0.0000      6.3270
+    661.3700      0.0000      0.0000      6.3160
+    662.0100      0.0000      0.0000      6.2990
+    662.6600      0.0000      0.0000      6.2770
+    663.3100      0.0000      0.0000      6.2610
+    663.9500      0.0000      0.0000      6.2530
+    664.6000      0.0000      0.0000      6.2500
+    665.2500      0.0000      0.0000      6.2490
+    665.8900      0.0000      0.0000      6.2510
+    666.5400      0.0000      0.0000      6.2480
+    667.1900      0.0000      0.0000      6.2420
+    667.8300      0.0000      0.0000      6.2450
+    668.4800      0.0000      0.0000      6.2430
+    669.1200      0.0000      0.0000      6.2440
+    669.7700      0.0000      0.0000      6.2380
+    670.4200      0.0000      0.0000      6.2380
+    671.0600      0.0000      0.0000      6.2400
+    671.7100      0.0000      0.0000      6.2370
+    672.3500      0.0000      0.0000      6.2380
+    673.0000      0.0000      0.0000      6.2350
+    673.6500      0.0000      0.0000      6.2340
+    674.2900      0.0000      0.0000      6.2290
+    674.9400      0.0000      0.0000      6.2280
+    675.5800      0.0000      0.0000      6.2290
+    676.2300      0.0000      0.0000      6.2300
+    676.8800      0.0000      0.0000      6.2200
+    677.5200      0.0000      0.0000      6.2150
+    678.1700      0.0000      0.0000      6.2090
+    678.8100      0.0000      0.0000      6.2060
+    679.4600      0.0000      0.0000      6.2040
+    680.1000      0.0000      0.0000      6.2040
+    680.7500      0.0000      0.0000      6.1990
+    681.3900      0.0000      0.0000      6.2010
+    682.0400      0.0000      0.0000      6.1980
+    682.6800      0.0000      0.0000      6.1970
+    683.3300      0.0000      0.0000      6.1950
+    683.9800      0.0000      0.0000      6.1890
+    684.6200      0.0000      0.0000      6.1800
+    685.2700      0.0000      0.0000      6.1780
+    685.9100      0.0000      0.0000      6.1790
+    686.5600      0.0000      0.0000      6.1780
+    687.2000      0.0000      0.0000      6.1790
+    687.8500      0.0000      0.0000      6.1790
+    688.4900      0.0000      0.0000      6.1810
+    689.1400      0.0000      0.0000      6.1770
+    689.7800      0.0000      0.0000      6.1680
+    690.4300      0.0000      0.0000      6.1590
+    691.0700      0.0000      0.0000      6.1640
+    691.7200      0.0000      0.0000      6.1560
+    692.3600      0.0000      0.0000      6.1550
+    693.0100      0.0000      0.0000      6.1460
+    693.6500      0.0000      0.0000      6.1300
+    694.3000      0.0000      0.0000      6.1370
+    694.9400      0.0000      0.0000      6.1260
+    695.5900      0.0000      0.0000      6.1250
+    696.2300      0.0000      0.0000      6.1300
+    696.8700      0.0000      0.0000      6.1240
+    697.5200      0.0000      0.0000      6.1260
+    698.1600      0.0000      0.0000      6.1060
+    698.8100      0.0000      0.0000      6.1000
+    699.4500      0.0000      0.0000      6.0900
+    700.1000      0.0000      0.0000      6.0850
+    700.7400      0.0000      0.0000      6.0840
+    701.3900      0.0000      0.0000      6.0840
+    702.0300      0.0000      0.0000      6.0790
+    702.6700      0.0000      0.0000      6.0780
+    703.3200      0.0000      0.0000      6.0820
+    703.9600      0.0000      0.0000      6.0810
+    704.6100      0.0000      0.0000      6.0780
+    705.2500      0.0000      0.0000      6.0790
+    705.9000      0.0000      0.0000      6.0760
+    706.5400      0.0000      0.0000      6.0760
+    707.1800      0.0000      0.0000      6.0600
+    707.8300      0.0000      0.0000      6.0590
+    708.4700      0.0000      0.0000      6.0570
+    709.1100      0.0000      0.0000      6.0560
+    709.7600      0.0000      0.0000      6.0580
+    710.4000      0.0000      0.0000      6.0550
+    711.0500      0.0000      0.0000      6.0590
+    711.6900      0.0000      0.0000      6.0560
+    712.3300      0.0000      0.0000      6.0510
+    712.9800      0.0000      0.0000      6.0450
+    713.6200      0.0000      0.0000      6.0430
+    714.2600      0.0000      0.0000      6.0330
+    714.9100      0.0000      0.0000      6.0310
+    715.5500      0.0000      0.0000      6.0320
+    716.2000      0.0000      0.0000      6.0250
+    716.8400      0.0000      0.0000      6.0260
+    717.4800      0.0000      0.0000      6.0270
+    718.1300      0.0000      0.0000      6.0250
+    718.7700      0.0000      0.0000      6.0220
+    719.4100      0.0000      0.0000      6.0220
+    720.0600      0.0000      0.0000      6.0210
+    720.7000      0.0000      0.0000      6.0190
+    721.3400      0.0000      0.0000      6.0190
+    721.9900      0.0000      0.0000      6.0140
+    722.6300      0.0000      0.0000      6.0090
+    723.2700      0.0000      0.0000      6.0060
+    723.9100      0.0000      0.0000      5.9970
+    724.5600      0.0000      0.0000      5.9870
+    725.2000      0.0000      0.0000      5.9800
+    725.8400      0.0000      0.0000      5.9720
+    726.4900      0.0000      0.0000      5.9620
+    727.1300      0.0000      0.0000      5.9530
+    727.7700      0.0000      0.0000      5.9530
+    728.4200      0.0000      0.0000      5.9490
+    729.0600      0.0000      0.0000      5.9410
+    729.7000      0.0000      0.0000      5.9380
+    730.3400      0.0000      0.0000      5.9310
+    730.9900      0.0000      0.0000      5.9330
+    731.6300      0.0000      0.0000      5.9330
+    732.2700      0.0000      0.0000      5.9340
+    732.9100      0.0000      0.0000      5.9280
+    733.5600      0.0000      0.0000      5.9300
+    734.2000      0.0000      0.0000      5.9290
+    734.8400      0.0000      0.0000      5.9290
+    735.4800      0.0000      0.0000      5.9300
+    736.1300      0.0000      0.0000      5.9280
+    736.7700      0.0000      0.0000      5.9220
+    737.4100      0.0000      0.0000      5.9150
+    738.0500      0.0000      0.0000      5.9030
+    738.7000      0.0000      0.0000      5.9050
+    739.3400      0.0000      0.0000      5.9000
+    739.9800      0.0000      0.0000      5.9020
+    740.6200      0.0000      0.0000      5.8960
+    741.2600      0.0000      0.0000      5.8850
+    741.9100      0.0000      0.0000      5.8880
+    742.5500      0.0000      0.0000      5.8850
+    743.1900      0.0000      0.0000      5.8870
+    743.8300      0.0000      0.0000      5.8850
+    744.4700      0.0000      0.0000      5.8880
+    745.1200      0.0000      0.0000      5.8850
+    745.7600      0.0000      0.0000      5.8850
+    746.4000      0.0000      0.0000      5.8830
+    747.0400      0.0000      0.0000      5.8780
+    747.6800      0.0000      0.0000      5.8690
+    748.3200      0.0000      0.0000      5.8540
+    748.9700      0.0000      0.0000      5.8450
+    749.6100      0.0000      0.0000      5.8380
+    750.2500      0.0000      0.0000      5.8380
+    750.8900      0.0000      0.0000      5.8340
+    751.5300      0.0000      0.0000      5.8320
+    752.1700      0.0000      0.0000      5.8340
+    752.8200      0.0000      0.0000      5.8360
+    753.4600      0.0000      0.0000      5.8360
+    754.1000      0.0000      0.0000      5.8360
+    754.7400      0.0000      0.0000      5.8300
+    755.3800      0.0000      0.0000      5.8360
+    756.0200      0.0000      0.0000      5.8310
+    756.6600      0.0000      0.0000      5.8330
+    757.3000      0.0000      0.0000      5.8300
+    757.9500      0.0000      0.0000      5.8340
+    758.5900      0.0000      0.0000      5.8300
+    759.2300      0.0000      0.0000      5.8320
+    759.8700      0.0000      0.0000      5.8310
+    760.5100      0.0000      0.0000      5.8290
+    761.1500      0.0000      0.0000      5.8310
+    761.7900      0.0000      0.0000      5.8150
+    762.4300      0.0000      0.0000      5.8140
+    763.0700      0.0000      0.0000      5.8090
+    763.7100      0.0000      0.0000      5.8110
+    764.3500      0.0000      0.0000      5.8040
+    765.0000      0.0000      0.0000      5.8040
+    765.6400      0.0000      0.0000      5.8030
+    766.2800      0.0000      0.0000      5.8020
+    766.9200      0.0000      0.0000      5.8000
+    767.5600      0.0000      0.0000      5.8000
+    768.2000      0.0000      0.0000      5.8000
+    768.8400      0.0000      0.0000      5.8020
+    769.4800      0.0000      0.0000      5.8020
+    770.1200      0.0000      0.0000      5.7990
+    770.7600      0.0000      0.0000      5.7980
+    771.4000      0.0000      0.0000      5.7990
+    772.0400      0.0000      0.0000      5.7990
+    772.6800      0.0000      0.0000      5.7990
+    773.3200      0.0000      0.0000      5.8010
+    773.9600      0.0000      0.0000      5.8010
+    774.6000      0.0000      0.0000      5.7970
+    775.2400      0.0000      0.0000      5.7980
+    775.8800      0.0000      0.0000      5.7990
+    776.5200      0.0000      0.0000      5.7930
+    777.1600      0.0000      0.0000      5.7940
+    777.8000      0.0000      0.0000      5.7880
+    778.4400      0.0000      0.0000      5.7850
+    779.0800      0.0000      0.0000      5.7730
+    779.7200      0.0000      0.0000      5.7680
+    780.3600      0.0000      0.0000      5.7640
+    781.0000      0.0000      0.0000      5.7600
+    781.6400      0.0000      0.0000      5.7570
+    782.2800      0.0000      0.0000      5.7550
+    782.9200      0.0000      0.0000      5.7530
+    783.5600      0.0000      0.0000      5.7520
+    784.2000      0.0000      0.0000      5.7520
+    784.8400      0.0000      0.0000      5.7510
+    785.4800      0.0000      0.0000      5.7450
+    786.1200      0.0000      0.0000      5.7480
+    786.7600      0.0000      0.0000      5.7460
+    787.4000      0.0000      0.0000      5.7510
+    788.0400      0.0000      0.0000      5.7470
+    788.6800      0.0000      0.0000      5.7430
+    789.3200      0.0000      0.0000      5.7480
+    789.9600      0.0000      0.0000      5.7420
+    790.6000      0.0000      0.0000      5.7360
+    791.2300      0.0000      0.0000      5.7290
+    791.8700      0.0000      0.0000      5.7290
+    792.5100      0.0000      0.0000      5.7310
+    793.1500      0.0000      0.0000      5.7280
+    793.7900      0.0000      0.0000      5.7240
+    794.4300      0.0000      0.0000      5.7180
+    795.0700      0.0000      0.0000      5.7240
+    795.7100      0.0000      0.0000      5.7220
+    796.3500      0.0000      0.0000      5.7170
+    796.9900      0.0000      0.0000      5.7070
+    797.6200      0.0000      0.0000      5.7170
+    798.2600      0.0000      0.0000      5.7160
+    798.9000      0.0000      0.0000      5.7150
+    799.5400      0.0000      0.0000      5.7140
+    800.1800      0.0000      0.0000      5.7170
+    800.8200      0.0000      0.0000      5.7150
+    801.4600      0.0000      0.0000      5.7120
+    802.1000      0.0000      0.0000      5.7070
+    802.7300      0.0000      0.0000      5.7080
+    803.3700      0.0000      0.0000      5.7060
+    804.0100      0.0000      0.0000      5.7100
+    804.6500      0.0000      0.0000      5.7100
+    805.2900      0.0000      0.0000      5.7130
+    805.9300      0.0000      0.0000      5.7120
+    806.5700      0.0000      0.0000      5.7090
+    807.2000      0.0000      0.0000      5.7070
+    807.8400      0.0000      0.0000      5.7080
+    808.4800      0.0000      0.0000      5.7040
+    809.1200      0.0000      0.0000      5.7010
+    809.7600      0.0000      0.0000      5.7050
+    810.3900      0.0000      0.0000      5.7000
+    811.0300      0.0000      0.0000      5.6960
+    811.6700      0.0000      0.0000      5.6950
+    812.3100      0.0000      0.0000      5.6990
+    812.9500      0.0000      0.0000      5.6960
+    813.5900      0.0000      0.0000      5.6940
+    814.2200      0.0000      0.0000      5.6950
+    814.8600      0.0000      0.0000      5.6940
+    815.5000      0.0000      0.0000      5.6940
+    816.1400      0.0000      0.0000      5.6960
+    816.7700      0.0000      0.0000      5.6850
+    817.4100      0.0000      0.0000      5.6900
+    818.0500      0.0000      0.0000      5.6870
+    818.6900      0.0000      0.0000      5.6870
+    819.3300      0.0000      0.0000      5.6840
+    819.9600      0.0000      0.0000      5.6870
+    820.6000      0.0000      0.0000      5.6870
+    821.2400      0.0000      0.0000      5.6830
+    821.8800      0.0000      0.0000      5.6700
+    822.5100      0.0000      0.0000      5.6680
+    823.1500      0.0000      0.0000      5.6690
+    823.7900      0.0000      0.0000      5.6590
+    824.4300      0.0000      0.0000      5.6630
+    825.0600      0.0000      0.0000      5.6600
+    825.7000      0.0000      0.0000      5.6580
+    826.3400      0.0000      0.0000      5.6520
+    826.9700      0.0000      0.0000      5.6530
+    827.6100      0.0000      0.0000      5.6490
+    828.2500      0.0000      0.0000      5.6460
+    828.8900      0.0000      0.0000      5.6420
+    829.5200      0.0000      0.0000      5.6380
+    830.1600      0.0000      0.0000      5.6290
+    830.8000      0.0000      0.0000      5.6240
+    831.4300      0.0000      0.0000      5.6190
+    832.0700      0.0000      0.0000      5.6070
+    832.7100      0.0000      0.0000      5.6060
+    833.3400      0.0000      0.0000      5.6040
+    833.9800      0.0000      0.0000      5.5990
+    834.6200      0.0000      0.0000      5.5970
+    835.2500      0.0000      0.0000      5.5950
+    835.8900      0.0000      0.0000      5.5950
+    836.5300      0.0000      0.0000      5.5910
+    837.1600      0.0000      0.0000      5.5840
+    837.8000      0.0000      0.0000      5.5810
+    838.4400      0.0000      0.0000      5.5780
+    839.0700      0.0000      0.0000      5.5750
+    839.7100      0.0000      0.0000      5.5680
+    840.3500      0.0000      0.0000      5.5650
+    840.9800      0.0000      0.0000      5.5640
+    841.6200      0.0000      0.0000      5.5580
+    842.2600      0.0000      0.0000      5.5560
+    842.8900      0.0000      0.0000      5.5550
+    843.5300      0.0000      0.0000      5.5510
+    844.1700      0.0000      0.0000      5.5500
+    844.8000      0.0000      0.0000      5.5530
+    845.4400      0.0000      0.0000      5.5490
+    846.0700      0.0000      0.0000      5.5510
+    846.7100      0.0000      0.0000      5.5450
+    847.3500      0.0000      0.0000      5.5500
+    847.9800      0.0000      0.0000      5.5480
+    848.6200      0.0000      0.0000      5.5500
+    849.2500      0.0000      0.0000      5.5500
+    849.8900      0.0000      0.0000      5.5470
+    850.5300      0.0000      0.0000      5.5420
+    851.1600      0.0000      0.0000      5.5450
+    851.8000      0.0000      0.0000      5.5460
+    852.4300      0.0000      0.0000      5.5400
+    853.0700      0.0000      0.0000      5.5310
+    853.7000      0.0000      0.0000      5.5340
+    854.3400      0.0000      0.0000      5.5280
+    854.9800      0.0000      0.0000      5.5260
+    855.6100      0.0000      0.0000      5.5170
+    856.2500      0.0000      0.0000      5.5100
+    856.8800      0.0000      0.0000      5.4970
+    857.5200      0.0000      0.0000      5.4700
+    858.1500      0.0000      0.0000      5.4560
+    858.7900      0.0000      0.0000      5.4380
+    859.4200      0.0000      0.0000      5.4000
+    860.0600      0.0000      0.0000      5.3800
+    860.6900      0.0000      0.0000      5.3750
+    861.3300      0.0000      0.0000      5.3680
+    861.9600      0.0000      0.0000      5.3700
+    862.6000      0.0000      0.0000      5.3550
+    863.2300      0.0000      0.0000      5.3140
+    863.8700      0.0000      0.0000      5.3070
+    864.5100      0.0000      0.0000      5.3090
+    865.1400      0.0000      0.0000      5.3070
+    865.7800      0.0000      0.0000      5.3090
+    866.4100      0.0000      0.0000      5.3010
+    867.0500      0.0000      0.0000      5.3050
+    867.6800      0.0000      0.0000      5.3010
+    868.3100      0.0000      0.0000      5.3010
+    868.9500      0.0000      0.0000      5.3120
+    869.5800      0.0000      0.0000      5.3050
+    870.2200      0.0000      0.0000      5.3000
+    870.8500      0.0000      0.0000      5.3040
+    871.4900      0.0000      0.0000      5.3060
+    872.1200      0.0000      0.0000      5.3030
+    872.7600      0.0000      0.0000      5.3020
+    873.3900      0.0000      0.0000      5.2990
+    874.0300      0.0000      0.0000      5.2950
+    874.6600      0.0000      0.0000      5.2930
+    875.3000      0.0000      0.0000      5.2920
+    875.9300      0.0000      0.0000      5.2880
+    876.5600      0.0000      0.0000      5.2950
+    877.2000      0.0000      0.0000      5.2880
+    877.8300      0.0000      0.0000      5.2900
+    878.4700      0.0000      0.0000      5.2950
+    879.1000      0.0000      0.0000      5.2890
+    879.7400      0.0000      0.0000      5.2890
+    880.3700      0.0000      0.0000      5.2900
+    881.0000      0.0000      0.0000      5.2900
+    881.6400      0.0000      0.0000      5.2900
+    882.2700      0.0000      0.0000      5.2880
+    882.9100      0.0000      0.0000      5.2890
+    883.5400      0.0000      0.0000      5.2930
+    884.1700      0.0000      0.0000      5.2910
+    884.8100      0.0000      0.0000      5.2910
+    885.4400      0.0000      0.0000      5.2890
+    886.0800      0.0000      0.0000      5.2890
+    886.7100      0.0000      0.0000      5.2940
+    887.3400      0.0000      0.0000      5.2910
+    887.9800      0.0000      0.0000      5.2880
+    888.6100      0.0000      0.0000      5.2880
+    889.2400      0.0000      0.0000      5.2860
+    889.8800      0.0000      0.0000      5.2880
+    890.5100      0.0000      0.0000      5.2910
+    891.1400      0.0000      0.0000      5.2840
+    891.7800      0.0000      0.0000      5.2820
+    892.4100      0.0000      0.0000      5.2850
+    893.0500      0.0000      0.0000      5.2830
+    893.6800      0.0000      0.0000      5.2800
+    894.3100      0.0000      0.0000      5.2840
+    894.9500      0.0000      0.0000      5.2800
+    895.5800      0.0000      0.0000      5.2790
+    896.2100      0.0000      0.0000      5.2890
+    896.8500      0.0000      0.0000      5.2710
+    897.4800      0.0000      0.0000      5.2800
+    898.1100      0.0000      0.0000      5.2770
+    898.7400      0.0000      0.0000      5.2800
+    899.3800      0.0000      0.0000      5.2800
+    900.0100      0.0000      0.0000      5.2800
+    900.6400      0.0000      0.0000      5.2760
+    901.2800      0.0000      0.0000      5.2760
+    901.9100      0.0000      0.0000      5.2760
+    902.5400      0.0000      0.0000      5.2760
+    903.1800      0.0000      0.0000      5.2730
+    903.8100      0.0000      0.0000      5.2840
+    904.4400      0.0000      0.0000      5.2770
+    905.0700      0.0000      0.0000      5.2820
+    905.7100      0.0000      0.0000      5.2760
+    906.3400      0.0000      0.0000      5.2720
+    906.9700      0.0000      0.0000      5.2740
+    907.6000      0.0000      0.0000      5.2720
+    908.2400      0.0000      0.0000      5.2710
+    908.8700      0.0000      0.0000      5.2740
+    909.5000      0.0000      0.0000      5.2720
+    910.1300      0.0000      0.0000      5.2700
+    910.7700      0.0000      0.0000      5.2690
+    911.4000      0.0000      0.0000      5.2700
+    912.0300      0.0000      0.0000      5.2680
+    912.6600      0.0000      0.0000      5.2660
+    913.3000      0.0000      0.0000      5.2680
+    913.9300      0.0000      0.0000      5.2650
+    914.5600      0.0000      0.0000      5.2640
+    915.1900      0.0000      0.0000      5.2660
+    915.8200      0.0000      0.0000      5.2680
+    916.4600      0.0000      0.0000      5.2640
+    917.0900      0.0000      0.0000      5.2640
+    917.7200      0.0000      0.0000      5.2700
+    918.3500      0.0000      0.0000      5.2650
+    918.9800      0.0000      0.0000      5.2680
+    919.6200      0.0000      0.0000      5.2660
+    920.2500      0.0000      0.0000      5.2680
+    920.8800      0.0000      0.0000      5.2680
+    921.5100      0.0000      0.0000      5.2690
+    922.1400      0.0000      0.0000      5.2680
+    922.7800      0.0000      0.0000      5.2710
+    923.4100      0.0000      0.0000      5.2660
+    924.0400      0.0000      0.0000      5.2700
+    924.6700      0.0000      0.0000      5.2680
+    925.3000      0.0000      0.0000      5.2690
+    925.9300      0.0000      0.0000      5.2680
+    926.5600      0.0000      0.0000      5.2650
+    927.2000      0.0000      0.0000      5.2700
+    927.8300      0.0000      0.0000      5.2700
+    928.4600      0.0000      0.0000      5.2680
+    929.0900      0.0000      0.0000      5.2660
+    929.7200      0.0000      0.0000      5.2670
+    930.3500      0.0000      0.0000      5.2670
+    930.9800      0.0000      0.0000      5.2680
+    931.6200      0.0000      0.0000      5.2680
+    932.2500      0.0000      0.0000      5.2670
+    932.8800      0.0000      0.0000      5.2710
+    933.5100      0.0000      0.0000      5.2690
+    934.1400      0.0000      0.0000      5.2690
+    934.7700      0.0000      0.0000      5.2690
+    935.4000      0.0000      0.0000      5.2730
+    936.0300      0.0000      0.0000      5.2670
+    936.6600      0.0000      0.0000      5.2640
+    937.2900      0.0000      0.0000      5.2700
+    937.9300      0.0000      0.0000      5.2650
+    938.5600      0.0000      0.0000      5.2660
+    939.1900      0.0000      0.0000      5.2680
+    939.8200      0.0000      0.0000      5.2620
+    940.4500      0.0000      0.0000      5.2600
+    941.0800      0.0000      0.0000      5.2620
+    941.7100      0.0000      0.0000      5.2610
+    942.3400      0.0000      0.0000      5.2620
+    942.9700      0.0000      0.0000      5.2610
+    943.6000      0.0000      0.0000      5.2600
+    944.2300      0.0000      0.0000      5.2570
+    944.8600      0.0000      0.0000      5.2520
+    945.4900      0.0000      0.0000      5.2440
+    946.1200      0.0000      0.0000      5.2460
+    946.7500      0.0000      0.0000      5.2380
+    947.3800      0.0000      0.0000      5.2360
+    948.0100      0.0000      0.0000      5.2340
+    948.6400      0.0000      0.0000      5.2310
+    949.2700      0.0000      0.0000      5.2270
+    949.9000      0.0000      0.0000      5.2130
+    950.5300      0.0000      0.0000      5.2060
+    951.1600      0.0000      0.0000      5.1940
+    951.7900      0.0000      0.0000      5.1920
+    952.4200      0.0000      0.0000      5.1780
+    953.0500      0.0000      0.0000      5.1770
+    953.6800      0.0000      0.0000      5.1740
+    954.3100      0.0000      0.0000      5.1730
+    954.9400      0.0000      0.0000      5.1690
+    955.5700      0.0000      0.0000      5.1610
+    956.2000      0.0000      0.0000      5.1620
+    956.8300      0.0000      0.0000      5.1590
+    957.4600      0.0000      0.0000      5.1520
+    958.0900      0.0000      0.0000      5.1470
+    958.7200      0.0000      0.0000      5.1430
+    959.3500      0.0000      0.0000      5.1450
+    959.9800      0.0000      0.0000      5.1410
+    960.6100      0.0000      0.0000      5.1370
+    961.2400      0.0000      0.0000      5.1350
+    961.8700      0.0000      0.0000      5.1250
+    962.5000      0.0000      0.0000      5.1280
+    963.1300      0.0000      0.0000      5.1260
+    963.7600      0.0000      0.0000      5.1250
+    964.3900      0.0000      0.0000      5.1220
+    965.0200      0.0000      0.0000      5.1210
+    965.6500      0.0000      0.0000      5.1190
+    966.2800      0.0000      0.0000      5.1150
+    966.9000      0.0000      0.0000      5.1080
+    967.5300      0.0000      0.0000      5.1060
+    968.1600      0.0000      0.0000      5.0980
+    968.7900      0.0000      0.0000      5.1010
+    969.4200      0.0000      0.0000      5.0970
+    970.0500      0.0000      0.0000      5.0970
+    970.6800      0.0000      0.0000      5.0960
+    971.3100      0.0000      0.0000      5.0940
+    971.9400      0.0000      0.0000      5.0850
+    972.5700      0.0000      0.0000      5.0710
+    973.1900      0.0000      0.0000      5.0700
+    973.8200      0.0000      0.0000      5.0700
+    974.4500      0.0000      0.0000      5.0650
+    975.0800      0.0000      0.0000      5.0550
+    975.7100      0.0000      0.0000      5.0520
+    976.3400      0.0000      0.0000      5.0420
+    976.9700      0.0000      0.0000      5.0340
+    977.5900      0.0000      0.0000      5.0370
+    978.2200      0.0000      0.0000      5.0350
+    978.8500      0.0000      0.0000      5.0340
+    979.4800      0.0000      0.0000      5.0290
+    980.1100      0.0000      0.0000      5.0260
+    980.7400      0.0000      0.0000      5.0230
+    981.3700      0.0000      0.0000      5.0220
+    981.9900      0.0000      0.0000      5.0210
+    982.6200      0.0000      0.0000      5.0070
+    983.2500      0.0000      0.0000      4.9630
+    983.8800      0.0000      0.0000      4.9320
+    984.5100      0.0000      0.0000      4.9240
+    985.1300      0.0000      0.0000      4.9140
+    985.7600      0.0000      0.0000      4.9180
+    986.3900      0.0000      0.0000      4.9180
+    987.0200      0.0000      0.0000      4.9150
+    987.6500      0.0000      0.0000      4.9150
+    988.2700      0.0000      0.0000      4.9140
+    988.9000      0.0000      0.0000      4.9160
+    989.5300      0.0000      0.0000      4.9130
+    990.1600      0.0000      0.0000      4.9150
+    990.7900      0.0000      0.0000      4.9160
+    991.4100      0.0000      0.0000      4.9170
+    992.0400      0.0000      0.0000      4.9150
+    992.6700      0.0000      0.0000      4.9190
+    993.3000      0.0000      0.0000      4.9160
+    993.9200      0.0000      0.0000      4.9130
+    994.5500      0.0000      0.0000      4.9100
+    995.1800      0.0000      0.0000      4.9180
+    995.8100      0.0000      0.0000      4.9170
+    996.4300      0.0000      0.0000      4.9180
+    997.0600      0.0000      0.0000      4.9170
+    997.6900      0.0000      0.0000      4.9180
+    998.3200      0.0000      0.0000      4.9160
+    998.9400      0.0000      0.0000      4.9150
+    999.5700      0.0000      0.0000      4.9120
+   1000.2000      0.0000      0.0000      4.9140
+   1000.8300      0.0000      0.0000      4.9190
+   1001.4500      0.0000      0.0000      4.9210
+   1002.0800      0.0000      0.0000      4.9150
+   1002.7100      0.0000      0.0000      4.9200
+   1003.3300      0.0000      0.0000      4.9160
+   1003.9600      0.0000      0.0000      4.9140
+   1004.5900      0.0000      0.0000      4.9120
+   1005.2100      0.0000      0.0000      4.9180
+   1005.8400      0.0000      0.0000      4.9140
+   1006.4700      0.0000      0.0000      4.9160
+   1007.1000      0.0000      0.0000      4.9130
+   1007.7200      0.0000      0.0000      4.9140
+   1008.3500      0.0000      0.0000      4.9150
+   1008.9800      0.0000      0.0000      4.9140
+   1009.6000      0.0000      0.0000      4.9080
+   1010.2300      0.0000      0.0000      4.8960
+   1010.8600      0.0000      0.0000      4.8920
+   1011.4800      0.0000      0.0000      4.8800
+   1012.1100      0.0000      0.0000      4.8770
+   1012.7400      0.0000      0.0000      4.8650
+   1013.3600      0.0000      0.0000      4.8510
+   1013.9900      0.0000      0.0000      4.8440
+   1014.6100      0.0000      0.0000      4.8410
+   1015.2400      0.0000      0.0000      4.8240
+   1015.8700      0.0000      0.0000      4.8280
+   1016.4900      0.0000      0.0000      4.8170
+   1017.1200      0.0000      0.0000      4.8140
+   1017.7500      0.0000      0.0000      4.8130
+   1018.3700      0.0000      0.0000      4.8100
+   1019.0000      0.0000      0.0000      4.8030
+   1019.6200      0.0000      0.0000      4.7960
+   1020.2500      0.0000      0.0000      4.7870
+   1020.8800      0.0000      0.0000      4.7770
+   1021.5000      0.0000      0.0000      4.7700
+   1022.1300      0.0000      0.0000      4.7690
+   1022.7500      0.0000      0.0000      4.7670
+   1023.3800      0.0000      0.0000      4.7650
+   1024.0100      0.0000      0.0000      4.7620
+   1024.6300      0.0000      0.0000      4.7630
+   1025.2600      0.0000      0.0000      4.7660
+   1025.8800      0.0000      0.0000      4.7620
+   1026.5100      0.0000      0.0000      4.7600
+   1027.1300      0.0000      0.0000      4.7540
+   1027.7600      0.0000      0.0000      4.7540
+   1028.3900      0.0000      0.0000      4.7500
+   1029.0100      0.0000      0.0000      4.7460
+   1029.6400      0.0000      0.0000      4.7450
+   1030.2600      0.0000      0.0000      4.7490
+   1030.8900      0.0000      0.0000      4.7400
+   1031.5100      0.0000      0.0000      4.7420
+   1032.1400      0.0000      0.0000      4.7380
+   1032.7600      0.0000      0.0000      4.7330
+   1033.3900      0.0000      0.0000      4.7230
+   1034.0100      0.0000      0.0000      4.7150
+   1034.6400      0.0000      0.0000      4.7130
+   1035.2700      0.0000      0.0000      4.7130
+   1035.8900      0.0000      0.0000      4.7100
+   1036.5200      0.0000      0.0000      4.7020
+   1037.1400      0.0000      0.0000      4.7030
+   1037.7700      0.0000      0.0000      4.6990
+   1038.3900      0.0000      0.0000      4.7020
+   1039.0200      0.0000      0.0000      4.6960
+   1039.6400      0.0000      0.0000      4.6990
+   1040.2700      0.0000      0.0000      4.6950
+   1040.8900      0.0000      0.0000      4.6950
+   1041.5200      0.0000      0.0000      4.6940
+   1042.1400      0.0000      0.0000      4.6890
+   1042.7600      0.0000      0.0000      4.6930
+   1043.3900      0.0000      0.0000      4.6890
+   1044.0100      0.0000      0.0000      4.6940
+   1044.6400      0.0000      0.0000      4.6930
+   1045.2600      0.0000      0.0000      4.6900
+   1045.8900      0.0000      0.0000      4.6880
+   1046.5100      0.0000      0.0000      4.6890
+   1047.1400      0.0000      0.0000      4.6990
+   1047.7600      0.0000      0.0000      4.6890
+   1048.3900      0.0000      0.0000      4.6900
+   1049.0100      0.0000      0.0000      4.6900
+   1049.6300      0.0000      0.0000      4.6890
+   1050.2600      0.0000      0.0000      4.6890
+   1050.8800      0.0000      0.0000      4.6870
+   1051.5100      0.0000      0.0000      4.6830
+   1052.1300      0.0000      0.0000      4.6760
+   1052.7600      0.0000      0.0000      4.6790
+   1053.3800      0.0000      0.0000      4.6640
+   1054.0000      0.0000      0.0000      4.6630
+   1054.6300      0.0000      0.0000      4.6620
+   1055.2500      0.0000      0.0000      4.6480
+   1055.8800      0.0000      0.0000      4.6430
+   1056.5000      0.0000      0.0000      4.6390
+   1057.1200      0.0000      0.0000      4.6340
+   1057.7500      0.0000      0.0000      4.6380
+   1058.3700      0.0000      0.0000      4.6370
+   1059.0000      0.0000      0.0000      4.6330
+   1059.6200      0.0000      0.0000      4.6310
+   1060.2400      0.0000      0.0000      4.6300
+   1060.8700      0.0000      0.0000      4.6220
+   1061.4900      0.0000      0.0000      4.6260
+   1062.1100      0.0000      0.0000      4.6200
+   1062.7400      0.0000      0.0000      4.6210
+   1063.3600      0.0000      0.0000      4.6150
+   1063.9800      0.0000      0.0000      4.6120
+   1064.6100      0.0000      0.0000      4.6000
+   1065.2300      0.0000      0.0000      4.6010
+   1065.8600      0.0000      0.0000      4.6020
+   1066.4800      0.0000      0.0000      4.5910
+   1067.1000      0.0000      0.0000      4.5950
+   1067.7300      0.0000      0.0000      4.5900
+   1068.3500      0.0000      0.0000      4.5880
+   1068.9700      0.0000      0.0000      4.5920
+   1069.6000      0.0000      0.0000      4.5910
+   1070.2200      0.0000      0.0000      4.5900
+   1070.8400      0.0000      0.0000      4.5930
+   1071.4600      0.0000      0.0000      4.5860
+   1072.0900      0.0000      0.0000      4.5900
+   1072.7100      0.0000      0.0000      4.5910
+   1073.3300      0.0000      0.0000      4.5870
+   1073.9600      0.0000      0.0000      4.5840
+   1074.5800      0.0000      0.0000      4.5870
+   1075.2000      0.0000      0.0000      4.5870
+   1075.8199      0.0000      0.0000      4.5860
+   1076.4500      0.0000      0.0000      4.5850
+   1077.0699      0.0000      0.0000      4.5850
+   1077.6899      0.0000      0.0000      4.5850
+   1078.3199      0.0000      0.0000      4.5860
+   1078.9399      0.0000      0.0000      4.5840
+   1079.5601      0.0000      0.0000      4.5820
+   1080.1801      0.0000      0.0000      4.5850
+   1080.8101      0.0000      0.0000      4.5790
+   1081.4301      0.0000      0.0000      4.5800
+   1082.0500      0.0000      0.0000      4.5800
+   1082.6700      0.0000      0.0000      4.5820
+   1083.3000      0.0000      0.0000      4.5810
+   1083.9200      0.0000      0.0000      4.5760
+   1084.5400      0.0000      0.0000      4.5760
+   1085.1600      0.0000      0.0000      4.5760
+   1085.7900      0.0000      0.0000      4.5740
+   1086.4100      0.0000      0.0000      4.5770
+   1087.0300      0.0000      0.0000      4.5760
+   1087.6500      0.0000      0.0000      4.5760
+   1088.2700      0.0000      0.0000      4.5800
+   1088.9000      0.0000      0.0000      4.5760
+   1089.5200      0.0000      0.0000      4.5830
+   1090.1400      0.0000      0.0000      4.5810
+   1090.7600      0.0000      0.0000      4.5760
+   1091.3800      0.0000      0.0000      4.5730
+   1092.0100      0.0000      0.0000      4.5780
+   1092.6300      0.0000      0.0000      4.5750
+   1093.2500      0.0000      0.0000      4.5760
+   1093.8700      0.0000      0.0000      4.5730
+   1094.4900      0.0000      0.0000      4.5770
+   1095.1100      0.0000      0.0000      4.5750
+   1095.7400      0.0000      0.0000      4.5790
+   1096.3600      0.0000      0.0000      4.5740
+   1096.9800      0.0000      0.0000      4.5770
+   1097.6000      0.0000      0.0000      4.5760
+   1098.2200      0.0000      0.0000      4.5910
+   1098.8400      0.0000      0.0000      4.5760
+   1099.4700      0.0000      0.0000      4.5790
+   1100.0900      0.0000      0.0000      4.5720
+   1100.7100      0.0000      0.0000      4.5760
+   1101.3300      0.0000      0.0000      4.5760
+   1101.9500      0.0000      0.0000      4.5790
+   1102.5699      0.0000      0.0000      4.5840
+   1103.1899      0.0000      0.0000      4.5760
+   1103.8101      0.0000      0.0000      4.5760
+   1104.4399      0.0000      0.0000      4.5770
+   1105.0601      0.0000      0.0000      4.5720
+   1105.6801      0.0000      0.0000      4.5710
+   1106.3000      0.0000      0.0000      4.5730
+   1106.9200      0.0000      0.0000      4.5750
+   1107.5400      0.0000      0.0000      4.5790
+   1108.1600      0.0000      0.0000      4.5740
+   1108.7800      0.0000      0.0000      4.5720
+   1109.4000      0.0000      0.0000      4.5700
+   1110.0200      0.0000      0.0000      4.5690
+   1110.6500      0.0000      0.0000      4.5690
+   1111.2700      0.0000      0.0000      4.5740
+   1111.8900      0.0000      0.0000      4.5690
+   1112.5100      0.0000      0.0000      4.5710
+   1113.1300      0.0000      0.0000      4.5670
+   1113.7500      0.0000      0.0000      4.5710
+   1114.3700      0.0000      0.0000      4.5680
+   1114.9900      0.0000      0.0000      4.5650
+   1115.6100      0.0000      0.0000      4.5650
+   1116.2300      0.0000      0.0000      4.5650
+   1116.8500      0.0000      0.0000      4.5610
+   1117.4700      0.0000      0.0000      4.5580
+   1118.0900      0.0000      0.0000      4.5580
+   1118.7100      0.0000      0.0000      4.5520
+   1119.3300      0.0000      0.0000      4.5530
+   1119.9500      0.0000      0.0000      4.5450
+   1120.5699      0.0000      0.0000      4.5470
+   1121.1899      0.0000      0.0000      4.5490
+   1121.8101      0.0000      0.0000      4.5520
+   1122.4301      0.0000      0.0000      4.5450
+   1123.0500      0.0000      0.0000      4.5450
+   1123.6700      0.0000      0.0000      4.5480
+   1124.2900      0.0000      0.0000      4.5440
+   1124.9100      0.0000      0.0000      4.5420
+   1125.5300      0.0000      0.0000      4.5410
+   1126.1500      0.0000      0.0000      4.5420
+   1126.7700      0.0000      0.0000      4.5400
+   1127.3900      0.0000      0.0000      4.5410
+   1128.0100      0.0000      0.0000      4.5420
+   1128.6300      0.0000      0.0000      4.5360
+   1129.2500      0.0000      0.0000      4.5360
+   1129.8700      0.0000      0.0000      4.5360
+   1130.4900      0.0000      0.0000      4.5350
+   1131.1100      0.0000      0.0000      4.5400
+   1131.7300      0.0000      0.0000      4.5240
+   1132.3500      0.0000      0.0000      4.5240
+   1132.9700      0.0000      0.0000      4.5160
+   1133.5900      0.0000      0.0000      4.5060
+   1134.2100      0.0000      0.0000      4.4990
+   1134.8300      0.0000      0.0000      4.4900
+   1135.4500      0.0000      0.0000      4.4850
+   1136.0699      0.0000      0.0000      4.4750
+   1136.6899      0.0000      0.0000      4.4740
+   1137.3101      0.0000      0.0000      4.4790
+   1137.9200      0.0000      0.0000      4.4730
+   1138.5400      0.0000      0.0000      4.4700
+   1139.1600      0.0000      0.0000      4.4680
+   1139.7800      0.0000      0.0000      4.4670
+   1140.4000      0.0000      0.0000      4.4570
+   1141.0200      0.0000      0.0000      4.4520
+   1141.6400      0.0000      0.0000      4.4460
+   1142.2600      0.0000      0.0000      4.4460
+   1142.8800      0.0000      0.0000      4.4520
+   1143.5000      0.0000      0.0000      4.4450
+   1144.1100      0.0000      0.0000      4.4560
+   1144.7300      0.0000      0.0000      4.4470
+   1145.3500      0.0000      0.0000      4.4480
+   1145.9700      0.0000      0.0000      4.4430
+   1146.5900      0.0000      0.0000      4.4400
+   1147.2100      0.0000      0.0000      4.4400
+   1147.8300      0.0000      0.0000      4.4360
+   1148.4399      0.0000      0.0000      4.4390
+   1149.0601      0.0000      0.0000      4.4360
+   1149.6801      0.0000      0.0000      4.4330
+   1150.3000      0.0000      0.0000      4.4330
+   1150.9200      0.0000      0.0000      4.4310
+   1151.5400      0.0000      0.0000      4.4310
+   1152.1600      0.0000      0.0000      4.4290
+   1152.7700      0.0000      0.0000      4.4310
+   1153.3900      0.0000      0.0000      4.4230
+   1154.0100      0.0000      0.0000      4.4250
+   1154.6300      0.0000      0.0000      4.4340
+   1155.2500      0.0000      0.0000      4.4260
+   1155.8600      0.0000      0.0000      4.4250
+   1156.4800      0.0000      0.0000      4.4280
+   1157.1000      0.0000      0.0000      4.4260
+   1157.7200      0.0000      0.0000      4.4230
+   1158.3400      0.0000      0.0000      4.4260
+   1158.9600      0.0000      0.0000      4.4250
+   1159.5699      0.0000      0.0000      4.4210
+   1160.1899      0.0000      0.0000      4.4190
+   1160.8101      0.0000      0.0000      4.4210
+   1161.4301      0.0000      0.0000      4.4230
+   1162.0400      0.0000      0.0000      4.4230
+   1162.6600      0.0000      0.0000      4.4200
+   1163.2800      0.0000      0.0000      4.4170
+   1163.9000      0.0000      0.0000      4.4190
+   1164.5200      0.0000      0.0000      4.4180
+   1165.1300      0.0000      0.0000      4.4140
+   1165.7500      0.0000      0.0000      4.4100
+   1166.3700      0.0000      0.0000      4.4060
+   1166.9900      0.0000      0.0000      4.4030
+   1167.6000      0.0000      0.0000      4.4040
+   1168.2200      0.0000      0.0000      4.4040
+   1168.8400      0.0000      0.0000      4.4070
+   1169.4500      0.0000      0.0000      4.4050
+   1170.0699      0.0000      0.0000      4.4030
+   1170.6899      0.0000      0.0000      4.4070
+   1171.3101      0.0000      0.0000      4.4020
+   1171.9200      0.0000      0.0000      4.4010
+   1172.5400      0.0000      0.0000      4.4030
+   1173.1600      0.0000      0.0000      4.4030
+   1173.7800      0.0000      0.0000      4.3960
+   1174.3900      0.0000      0.0000      4.3990
+   1175.0100      0.0000      0.0000      4.3940
+   1175.6300      0.0000      0.0000      4.3930
+   1176.2400      0.0000      0.0000      4.3920
+   1176.8600      0.0000      0.0000      4.3890
+   1177.4800      0.0000      0.0000      4.3880
+   1178.0900      0.0000      0.0000      4.3900
+   1178.7100      0.0000      0.0000      4.3920
+   1179.3300      0.0000      0.0000      4.3900
+   1179.9399      0.0000      0.0000      4.3870
+   1180.5601      0.0000      0.0000      4.3920
+   1181.1801      0.0000      0.0000      4.3860
+   1181.7900      0.0000      0.0000      4.3910
+   1182.4100      0.0000      0.0000      4.3870
+   1183.0300      0.0000      0.0000      4.3850
+   1183.6400      0.0000      0.0000      4.3920
+   1184.2600      0.0000      0.0000      4.3910
+   1184.8800      0.0000      0.0000      4.3880
+   1185.4900      0.0000      0.0000      4.3910
+   1186.1100      0.0000      0.0000      4.3830
+   1186.7300      0.0000      0.0000      4.3850
+   1187.3400      0.0000      0.0000      4.3860
+   1187.9600      0.0000      0.0000      4.3870
+   1188.5699      0.0000      0.0000      4.3790
+   1189.1899      0.0000      0.0000      4.3740
+   1189.8101      0.0000      0.0000      4.3720
+   1190.4200      0.0000      0.0000      4.3750
+   1191.0400      0.0000      0.0000      4.3680
+   1191.6500      0.0000      0.0000      4.3620
+   1192.2700      0.0000      0.0000      4.3600
+   1192.8900      0.0000      0.0000      4.3590
+   1193.5000      0.0000      0.0000      4.3540
+   1194.1200      0.0000      0.0000      4.3420
+   1194.7300      0.0000      0.0000      4.3380
+   1195.3500      0.0000      0.0000      4.3250
+   1195.9700      0.0000      0.0000      4.3320
+   1196.5800      0.0000      0.0000      4.3290
+   1197.2000      0.0000      0.0000      4.3280
+   1197.8101      0.0000      0.0000      4.3290
+   1198.4301      0.0000      0.0000      4.3250
+   1199.0400      0.0000      0.0000      4.3280
+   1199.6600      0.0000      0.0000      4.3200
+   1200.2800      0.0000      0.0000      4.3180
+   1200.8900      0.0000      0.0000      4.3220
+   1201.5100      0.0000      0.0000      4.3130
+   1202.1200      0.0000      0.0000      4.3160
+   1202.7400      0.0000      0.0000      4.3140
+   1203.3500      0.0000      0.0000      4.3150
+   1203.9700      0.0000      0.0000      4.3170
+   1204.5800      0.0000      0.0000      4.3160
+   1205.2000      0.0000      0.0000      4.3090
+   1205.8101      0.0000      0.0000      4.3120
+   1206.4301      0.0000      0.0000      4.3140
+   1207.0400      0.0000      0.0000      4.3140
+   1207.6600      0.0000      0.0000      4.3100
+   1208.2700      0.0000      0.0000      4.3140
+   1208.8900      0.0000      0.0000      4.3120
+   1209.5000      0.0000      0.0000      4.3140
+   1210.1200      0.0000      0.0000      4.3100
+   1210.7300      0.0000      0.0000      4.3120
+   1211.3500      0.0000      0.0000      4.3110
+   1211.9600      0.0000      0.0000      4.3110
+   1212.5800      0.0000      0.0000      4.3130
+   1213.1899      0.0000      0.0000      4.3150
+   1213.8101      0.0000      0.0000      4.3100
+   1214.4200      0.0000      0.0000      4.3090
+   1215.0400      0.0000      0.0000      4.3090
+   1215.6500      0.0000      0.0000      4.3160
+   1216.2700      0.0000      0.0000      4.3120
+   1216.8800      0.0000      0.0000      4.3080
+   1217.4900      0.0000      0.0000      4.3080
+   1218.1100      0.0000      0.0000      4.3200
+   1218.7200      0.0000      0.0000      4.3110
+   1219.3400      0.0000      0.0000      4.3130
+   1219.9500      0.0000      0.0000      4.3140
+   1220.5699      0.0000      0.0000      4.3130
+   1221.1801      0.0000      0.0000      4.3100
+   1221.8000      0.0000      0.0000      4.3040
+   1222.4100      0.0000      0.0000      4.3070
+   1223.0200      0.0000      0.0000      4.3070
+   1223.6400      0.0000      0.0000      4.3070
+   1224.2500      0.0000      0.0000      4.3120
+   1224.8700      0.0000      0.0000      4.3040
+   1225.4800      0.0000      0.0000      4.3030
+   1226.0900      0.0000      0.0000      4.3040
+   1226.7100      0.0000      0.0000      4.3030
+   1227.3199      0.0000      0.0000      4.3120
+   1227.9399      0.0000      0.0000      4.3020
+   1228.5500      0.0000      0.0000      4.3040
+   1229.1600      0.0000      0.0000      4.3050
+   1229.7800      0.0000      0.0000      4.2980
+   1230.3900      0.0000      0.0000      4.3010
+   1231.0000      0.0000      0.0000      4.3030
+   1231.6200      0.0000      0.0000      4.3030
+   1232.2300      0.0000      0.0000      4.3010
+   1232.8500      0.0000      0.0000      4.3000
+   1233.4600      0.0000      0.0000      4.3000
+   1234.0699      0.0000      0.0000      4.3020
+   1234.6899      0.0000      0.0000      4.2970
+   1235.3000      0.0000      0.0000      4.2990
+   1235.9100      0.0000      0.0000      4.3010
+   1236.5300      0.0000      0.0000      4.2980
+   1237.1400      0.0000      0.0000      4.3010
+   1237.7500      0.0000      0.0000      4.3000
+   1238.3700      0.0000      0.0000      4.3040
+   1238.9800      0.0000      0.0000      4.2960
+   1239.5900      0.0000      0.0000      4.3000
+   1240.2100      0.0000      0.0000      4.2970
+   1240.8199      0.0000      0.0000      4.2940
+   1241.4301      0.0000      0.0000      4.2920
+   1242.0400      0.0000      0.0000      4.2960
+   1242.6600      0.0000      0.0000      4.2940
+   1243.2700      0.0000      0.0000      4.2890
+   1243.8800      0.0000      0.0000      4.2860
+   1244.5000      0.0000      0.0000      4.2880
+   1245.1100      0.0000      0.0000      4.2840
+   1245.7200      0.0000      0.0000      4.2860
+   1246.3300      0.0000      0.0000      4.2900
+   1246.9500      0.0000      0.0000      4.2810
+   1247.5601      0.0000      0.0000      4.2840
+   1248.1700      0.0000      0.0000      4.2780
+   1248.7900      0.0000      0.0000      4.2810
+   1249.4000      0.0000      0.0000      4.2730
+   1250.0100      0.0000      0.0000      4.2780
+   1250.6200      0.0000      0.0000      4.2730
+   1251.2400      0.0000      0.0000      4.2710
+   1251.8500      0.0000      0.0000      4.2690
+   1252.4600      0.0000      0.0000      4.2660
+   1253.0699      0.0000      0.0000      4.2650
+   1253.6899      0.0000      0.0000      4.2660
+   1254.3000      0.0000      0.0000      4.2590
+   1254.9100      0.0000      0.0000      4.2630
+   1255.5200      0.0000      0.0000      4.2600
+   1256.1300      0.0000      0.0000      4.2570
+   1256.7500      0.0000      0.0000      4.2510
+   1257.3600      0.0000      0.0000      4.2530
+   1257.9700      0.0000      0.0000      4.2500
+   1258.5800      0.0000      0.0000      4.2460
+   1259.1899      0.0000      0.0000      4.2490
+   1259.8101      0.0000      0.0000      4.2440
+   1260.4200      0.0000      0.0000      4.2540
+   1261.0300      0.0000      0.0000      4.2500
+   1261.6400      0.0000      0.0000      4.2440
+   1262.2500      0.0000      0.0000      4.2440
+   1262.8700      0.0000      0.0000      4.2410
+   1263.4800      0.0000      0.0000      4.2390
+   1264.0900      0.0000      0.0000      4.2390
+   1264.7000      0.0000      0.0000      4.2430
+   1265.3101      0.0000      0.0000      4.2400
+   1265.9200      0.0000      0.0000      4.2380
+   1266.5400      0.0000      0.0000      4.2350
+   1267.1500      0.0000      0.0000      4.2390
+   1267.7600      0.0000      0.0000      4.2380
+   1268.3700      0.0000      0.0000      4.2350
+   1268.9800      0.0000      0.0000      4.2370
+   1269.5900      0.0000      0.0000      4.2350
+   1270.2100      0.0000      0.0000      4.2360
+   1270.8199      0.0000      0.0000      4.2330
+   1271.4301      0.0000      0.0000      4.2340
+   1272.0400      0.0000      0.0000      4.2380
+   1272.6500      0.0000      0.0000      4.2310
+   1273.2600      0.0000      0.0000      4.2420
+   1273.8700      0.0000      0.0000      4.2370
+   1274.4800      0.0000      0.0000      4.2350
+   1275.0900      0.0000      0.0000      4.2350
+   1275.7100      0.0000      0.0000      4.2350
+   1276.3199      0.0000      0.0000      4.2350
+   1276.9301      0.0000      0.0000      4.2440
+   1277.5400      0.0000      0.0000      4.2420
+   1278.1500      0.0000      0.0000      4.2370
+   1278.7600      0.0000      0.0000      4.2350
+   1279.3700      0.0000      0.0000      4.2360
+   1279.9800      0.0000      0.0000      4.2400
+   1280.5900      0.0000      0.0000      4.2330
+   1281.2000      0.0000      0.0000      4.2360
+   1281.8101      0.0000      0.0000      4.2330
+   1282.4200      0.0000      0.0000      4.2350
+   1283.0400      0.0000      0.0000      4.2340
+   1283.6500      0.0000      0.0000      4.2270
+   1284.2600      0.0000      0.0000      4.2310
+   1284.8700      0.0000      0.0000      4.2330
+   1285.4800      0.0000      0.0000      4.2330
+   1286.0900      0.0000      0.0000      4.2290
+   1286.7000      0.0000      0.0000      4.2310
+   1287.3101      0.0000      0.0000      4.2360
+   1287.9200      0.0000      0.0000      4.2330
+   1288.5300      0.0000      0.0000      4.2330
+   1289.1400      0.0000      0.0000      4.2320
+   1289.7500      0.0000      0.0000      4.2290
+   1290.3600      0.0000      0.0000      4.2300
+   1290.9700      0.0000      0.0000      4.2320
+   1291.5800      0.0000      0.0000      4.2290
+   1292.1899      0.0000      0.0000      4.2320
+   1292.8000      0.0000      0.0000      4.2320
+   1293.4100      0.0000      0.0000      4.2220
+   1294.0200      0.0000      0.0000      4.2260
+   1294.6300      0.0000      0.0000      4.2220
+   1295.2400      0.0000      0.0000      4.2240
+   1295.8500      0.0000      0.0000      4.2270
+   1296.4600      0.0000      0.0000      4.2240
+   1297.0699      0.0000      0.0000      4.2230
+   1297.6801      0.0000      0.0000      4.2250
+   1298.2900      0.0000      0.0000      4.2250
+   1298.9000      0.0000      0.0000      4.2250
+   1299.5100      0.0000      0.0000      4.2310
+   1300.1200      0.0000      0.0000      4.2220
+   1300.7300      0.0000      0.0000      4.2220
+   1301.3400      0.0000      0.0000      4.2180
+   1301.9500      0.0000      0.0000      4.2190
+   1302.5601      0.0000      0.0000      4.2190
+   1303.1600      0.0000      0.0000      4.2180
+   1303.7700      0.0000      0.0000      4.2170
+   1304.3800      0.0000      0.0000      4.2190
+   1304.9900      0.0000      0.0000      4.2190
+   1305.6000      0.0000      0.0000      4.2180
+   1306.2100      0.0000      0.0000      4.2190
+   1306.8199      0.0000      0.0000      4.2180
+   1307.4301      0.0000      0.0000      4.2140
+   1308.0400      0.0000      0.0000      4.2160
+   1308.6500      0.0000      0.0000      4.2210
+   1309.2600      0.0000      0.0000      4.2100
+   1309.8700      0.0000      0.0000      4.2120
+   1310.4700      0.0000      0.0000      4.2120
+   1311.0800      0.0000      0.0000      4.2070
+   1311.6899      0.0000      0.0000      4.2000
+   1312.3000      0.0000      0.0000      4.2040
+   1312.9100      0.0000      0.0000      4.1950
+   1313.5200      0.0000      0.0000      4.1980
+   1314.1300      0.0000      0.0000      4.1940
+   1314.7400      0.0000      0.0000      4.1910
+   1315.3500      0.0000      0.0000      4.1850
+   1315.9500      0.0000      0.0000      4.1820
+   1316.5601      0.0000      0.0000      4.1710
+   1317.1700      0.0000      0.0000      4.1560
+   1317.7800      0.0000      0.0000      4.1600
+   1318.3900      0.0000      0.0000      4.1550
+   1319.0000      0.0000      0.0000      4.1500
+   1319.6000      0.0000      0.0000      4.1520
+   1320.2100      0.0000      0.0000      4.1400
+   1320.8199      0.0000      0.0000      4.1460
+   1321.4301      0.0000      0.0000      4.1470
+   1322.0400      0.0000      0.0000      4.1450
+   1322.6500      0.0000      0.0000      4.1480
+   1323.2500      0.0000      0.0000      4.1500
+   1323.8600      0.0000      0.0000      4.1470
+   1324.4700      0.0000      0.0000      4.1510
+   1325.0800      0.0000      0.0000      4.1430
+   1325.6899      0.0000      0.0000      4.1510
+   1326.2900      0.0000      0.0000      4.1480
+   1326.9000      0.0000      0.0000      4.1490
+   1327.5100      0.0000      0.0000      4.1450
+   1328.1200      0.0000      0.0000      4.1500
+   1328.7300      0.0000      0.0000      4.1480
+   1329.3300      0.0000      0.0000      4.1430
+   1329.9399      0.0000      0.0000      4.1430
+   1330.5500      0.0000      0.0000      4.1490
+   1331.1600      0.0000      0.0000      4.1430
+   1331.7700      0.0000      0.0000      4.1430
+   1332.3700      0.0000      0.0000      4.1480
+   1332.9800      0.0000      0.0000      4.1470
+   1333.5900      0.0000      0.0000      4.1530
+   1334.2000      0.0000      0.0000      4.1450
+   1334.8000      0.0000      0.0000      4.1430
+   1335.4100      0.0000      0.0000      4.1400
+   1336.0200      0.0000      0.0000      4.1470
+   1336.6300      0.0000      0.0000      4.1430
+   1337.2300      0.0000      0.0000      4.1440
+   1337.8400      0.0000      0.0000      4.1450
+   1338.4500      0.0000      0.0000      4.1430
+   1339.0500      0.0000      0.0000      4.1490
+   1339.6600      0.0000      0.0000      4.1430
+   1340.2700      0.0000      0.0000      4.1440
+   1340.8800      0.0000      0.0000      4.1480
+   1341.4800      0.0000      0.0000      4.1430
+   1342.0900      0.0000      0.0000      4.1450
+   1342.7000      0.0000      0.0000      4.1410
+   1343.3000      0.0000      0.0000      4.1450
+   1343.9100      0.0000      0.0000      4.1440
+   1344.5200      0.0000      0.0000      4.1400
+   1345.1300      0.0000      0.0000      4.1430
+   1345.7300      0.0000      0.0000      4.1380
+   1346.3400      0.0000      0.0000      4.1410
+   1346.9500      0.0000      0.0000      4.1440
+   1347.5500      0.0000      0.0000      4.1430
+   1348.1600      0.0000      0.0000      4.1410
+   1348.7700      0.0000      0.0000      4.1450
+   1349.3700      0.0000      0.0000      4.1420
+   1349.9800      0.0000      0.0000      4.1420
+   1350.5900      0.0000      0.0000      4.1420
+   1351.1899      0.0000      0.0000      4.1450
+   1351.8000      0.0000      0.0000      4.1410
+   1352.4100      0.0000      0.0000      4.1400
+   1353.0100      0.0000      0.0000      4.1460
+   1353.6200      0.0000      0.0000      4.1380
+   1354.2200      0.0000      0.0000      4.1390
+   1354.8300      0.0000      0.0000      4.1360
+   1355.4399      0.0000      0.0000      4.1400
+   1356.0400      0.0000      0.0000      4.1390
+   1356.6500      0.0000      0.0000      4.1360
+   1357.2600      0.0000      0.0000      4.1410
+   1357.8600      0.0000      0.0000      4.1460
+   1358.4700      0.0000      0.0000      4.1370
+   1359.0699      0.0000      0.0000      4.1390
+   1359.6801      0.0000      0.0000      4.1350
+   1360.2900      0.0000      0.0000      4.1370
+   1360.8900      0.0000      0.0000      4.1380
+   1361.5000      0.0000      0.0000      4.1350
+   1362.1000      0.0000      0.0000      4.1360
+   1362.7100      0.0000      0.0000      4.1340
+   1363.3199      0.0000      0.0000      4.1320
+   1363.9200      0.0000      0.0000      4.1390
+   1364.5300      0.0000      0.0000      4.1360
+   1365.1300      0.0000      0.0000      4.1370
+   1365.7400      0.0000      0.0000      4.1380
+   1366.3400      0.0000      0.0000      4.1300
+   1366.9500      0.0000      0.0000      4.1370
+   1367.5500      0.0000      0.0000      4.1320
+   1368.1600      0.0000      0.0000      4.1270
+   1368.7700      0.0000      0.0000      4.1370
+   1369.3700      0.0000      0.0000      4.1340
+   1369.9800      0.0000      0.0000      4.1260
+   1370.5800      0.0000      0.0000      4.1380
+   1371.1899      0.0000      0.0000      4.1330
+   1371.7900      0.0000      0.0000      4.1250
+   1372.4000      0.0000      0.0000      4.1110
+   1373.0000      0.0000      0.0000      4.1130
+   1373.6100      0.0000      0.0000      4.1080
+   1374.2100      0.0000      0.0000      4.1160
+   1374.8199      0.0000      0.0000      4.1090
+   1375.4200      0.0000      0.0000      4.1090
+   1376.0300      0.0000      0.0000      4.1070
+   1376.6300      0.0000      0.0000      4.1040
+   1377.2400      0.0000      0.0000      4.1070
+   1377.8400      0.0000      0.0000      4.1050
+   1378.4500      0.0000      0.0000      4.1040
+   1379.0500      0.0000      0.0000      4.1030
+   1379.6600      0.0000      0.0000      4.0990
+   1380.2600      0.0000      0.0000      4.1010
+   1380.8700      0.0000      0.0000      4.0910
+   1381.4700      0.0000      0.0000      4.0930
+   1382.0800      0.0000      0.0000      4.0940
+   1382.6801      0.0000      0.0000      4.0920
+   1383.2900      0.0000      0.0000      4.0870
+   1383.8900      0.0000      0.0000      4.0840
+   1384.5000      0.0000      0.0000      4.0840
+   1385.1000      0.0000      0.0000      4.0860
+   1385.7000      0.0000      0.0000      4.0830
+   1386.3101      0.0000      0.0000      4.0860
+   1386.9100      0.0000      0.0000      4.0770
+   1387.5200      0.0000      0.0000      4.0790
+   1388.1200      0.0000      0.0000      4.0780
+   1388.7300      0.0000      0.0000      4.0830
+   1389.3300      0.0000      0.0000      4.0810
+   1389.9301      0.0000      0.0000      4.0810
+   1390.5400      0.0000      0.0000      4.0790
+   1391.1400      0.0000      0.0000      4.0820
+   1391.7500      0.0000      0.0000      4.0780
+   1392.3500      0.0000      0.0000      4.0800
+   1392.9500      0.0000      0.0000      4.0770
+   1393.5601      0.0000      0.0000      4.0730
+   1394.1600      0.0000      0.0000      4.0730
+   1394.7700      0.0000      0.0000      4.0830
+   1395.3700      0.0000      0.0000      4.0710
+   1395.9700      0.0000      0.0000      4.0760
+   1396.5800      0.0000      0.0000      4.0740
+   1397.1801      0.0000      0.0000      4.0730
+   1397.7900      0.0000      0.0000      4.0740
+   1398.3900      0.0000      0.0000      4.0700
+   1398.9900      0.0000      0.0000      4.0720
+   1399.6000      0.0000      0.0000      4.0750
+   1400.2000      0.0000      0.0000      4.0690
+   1400.8000      0.0000      0.0000      4.0700
+   1401.4100      0.0000      0.0000      4.0700
+   1402.0100      0.0000      0.0000      4.0680
+   1402.6100      0.0000      0.0000      4.0650
+   1403.2200      0.0000      0.0000      4.0530
+   1403.8199      0.0000      0.0000      4.0600
+   1404.4200      0.0000      0.0000      4.0610
+   1405.0300      0.0000      0.0000      4.0580
+   1405.6300      0.0000      0.0000      4.0580
+   1406.2300      0.0000      0.0000      4.0560
+   1406.8400      0.0000      0.0000      4.0630
+   1407.4399      0.0000      0.0000      4.0560
+   1408.0400      0.0000      0.0000      4.0610
+   1408.6500      0.0000      0.0000      4.0570
+   1409.2500      0.0000      0.0000      4.0570
+   1409.8500      0.0000      0.0000      4.0530
+   1410.4600      0.0000      0.0000      4.0560
+   1411.0601      0.0000      0.0000      4.0570
+   1411.6600      0.0000      0.0000      4.0530
+   1412.2600      0.0000      0.0000      4.0590
+   1412.8700      0.0000      0.0000      4.0510
+   1413.4700      0.0000      0.0000      4.0510
+   1414.0699      0.0000      0.0000      4.0590
+   1414.6700      0.0000      0.0000      4.0580
+   1415.2800      0.0000      0.0000      4.0550
+   1415.8800      0.0000      0.0000      4.0530
+   1416.4800      0.0000      0.0000      4.0600
+   1417.0900      0.0000      0.0000      4.0550
+   1417.6899      0.0000      0.0000      4.0560
+   1418.2900      0.0000      0.0000      4.0550
+   1418.8900      0.0000      0.0000      4.0500
+   1419.5000      0.0000      0.0000      4.0550
+   1420.1000      0.0000      0.0000      4.0530
+   1420.7000      0.0000      0.0000      4.0550
+   1421.3000      0.0000      0.0000      4.0550
+   1421.9000      0.0000      0.0000      4.0540
+   1422.5100      0.0000      0.0000      4.0470
+   1423.1100      0.0000      0.0000      4.0500
+   1423.7100      0.0000      0.0000      4.0490
+   1424.3101      0.0000      0.0000      4.0450
+   1424.9200      0.0000      0.0000      4.0410
+   1425.5200      0.0000      0.0000      4.0460
+   1426.1200      0.0000      0.0000      4.0440
+   1426.7200      0.0000      0.0000      4.0470
+   1427.3199      0.0000      0.0000      4.0420
+   1427.9200      0.0000      0.0000      4.0450
+   1428.5300      0.0000      0.0000      4.0420
+   1429.1300      0.0000      0.0000      4.0430
+   1429.7300      0.0000      0.0000      4.0410
+   1430.3300      0.0000      0.0000      4.0400
+   1430.9301      0.0000      0.0000      4.0400
+   1431.5400      0.0000      0.0000      4.0470
+   1432.1400      0.0000      0.0000      4.0390
+   1432.7400      0.0000      0.0000      4.0400
+   1433.3400      0.0000      0.0000      4.0400
+   1433.9399      0.0000      0.0000      4.0410
+   1434.5400      0.0000      0.0000      4.0390
+   1435.1400      0.0000      0.0000      4.0340
+   1435.7500      0.0000      0.0000      4.0400
+   1436.3500      0.0000      0.0000      4.0340
+   1436.9500      0.0000      0.0000      4.0360
+   1437.5500      0.0000      0.0000      4.0340
+   1438.1500      0.0000      0.0000      4.0360
+   1438.7500      0.0000      0.0000      4.0340
+   1439.3500      0.0000      0.0000      4.0360
+   1439.9600      0.0000      0.0000      4.0330
+   1440.5601      0.0000      0.0000      4.0300
+   1441.1600      0.0000      0.0000      4.0300
+   1441.7600      0.0000      0.0000      4.0250
+   1442.3600      0.0000      0.0000      4.0250
+   1442.9600      0.0000      0.0000      4.0260
+   1443.5601      0.0000      0.0000      4.0280
+   1444.1600      0.0000      0.0000      4.0180
+   1444.7600      0.0000      0.0000      4.0180
+   1445.3600      0.0000      0.0000      4.0190
+   1445.9700      0.0000      0.0000      4.0240
+   1446.5699      0.0000      0.0000      4.0160
+   1447.1700      0.0000      0.0000      4.0130
+   1447.7700      0.0000      0.0000      4.0170
+   1448.3700      0.0000      0.0000      4.0180
+   1448.9700      0.0000      0.0000      4.0160
+   1449.5699      0.0000      0.0000      4.0200
+   1450.1700      0.0000      0.0000      4.0120
+   1450.7700      0.0000      0.0000      4.0080
+   1451.3700      0.0000      0.0000      4.0160
+   1451.9700      0.0000      0.0000      4.0100
+   1452.5699      0.0000      0.0000      4.0140
+   1453.1700      0.0000      0.0000      4.0150
+   1453.7700      0.0000      0.0000      4.0090
+   1454.3700      0.0000      0.0000      4.0080
+   1454.9700      0.0000      0.0000      3.9990
+   1455.5699      0.0000      0.0000      4.0060
+   1456.1700      0.0000      0.0000      4.0050
+   1456.7700      0.0000      0.0000      4.0040
+   1457.3700      0.0000      0.0000      4.0020
+   1457.9700      0.0000      0.0000      4.0060
+   1458.5699      0.0000      0.0000      4.0030
+   1459.1700      0.0000      0.0000      4.0060
+   1459.7700      0.0000      0.0000      4.0050
+   1460.3700      0.0000      0.0000      4.0060
+   1460.9700      0.0000      0.0000      4.0040
+   1461.5699      0.0000      0.0000      4.0080
+   1462.1700      0.0000      0.0000      4.0040
+   1462.7700      0.0000      0.0000      4.0000
+   1463.3700      0.0000      0.0000      4.0020
+   1463.9700      0.0000      0.0000      4.0070
+   1464.5699      0.0000      0.0000      4.0030
+   1465.1700      0.0000      0.0000      4.0040
+   1465.7700      0.0000      0.0000      4.0010
+   1466.3700      0.0000      0.0000      4.0020
+   1466.9700      0.0000      0.0000      3.9980
+   1467.5699      0.0000      0.0000      4.0020
+   1468.1700      0.0000      0.0000      3.9970
+   1468.7700      0.0000      0.0000      3.9960
+   1469.3700      0.0000      0.0000      3.9950
+   1469.9700      0.0000      0.0000      3.9990
+   1470.5699      0.0000      0.0000      3.9960
+   1471.1700      0.0000      0.0000      4.0010
+   1471.7700      0.0000      0.0000      3.9930
+   1472.3600      0.0000      0.0000      3.9940
+   1472.9600      0.0000      0.0000      3.9870
+   1473.5601      0.0000      0.0000      3.9940
+   1474.1600      0.0000      0.0000      3.9940
+   1474.7600      0.0000      0.0000      3.9940
+   1475.3600      0.0000      0.0000      3.9890
+   1475.9600      0.0000      0.0000      3.9900
+   1476.5601      0.0000      0.0000      3.9880
+   1477.1600      0.0000      0.0000      3.9930
+   1477.7600      0.0000      0.0000      3.9880
+   1478.3500      0.0000      0.0000      3.9900
+   1478.9500      0.0000      0.0000      3.9880
+   1479.5500      0.0000      0.0000      3.9890
+   1480.1500      0.0000      0.0000      3.9880
+   1480.7500      0.0000      0.0000      3.9870
+   1481.3500      0.0000      0.0000      3.9850
+   1481.9500      0.0000      0.0000      3.9900
+   1482.5500      0.0000      0.0000      3.9900
+   1483.1400      0.0000      0.0000      3.9880
+   1483.7400      0.0000      0.0000      3.9840
+   1484.3400      0.0000      0.0000      3.9870
+   1484.9399      0.0000      0.0000      3.9840
+   1485.5400      0.0000      0.0000      3.9820
+   1486.1400      0.0000      0.0000      3.9850
+   1486.7300      0.0000      0.0000      3.9840
+   1487.3300      0.0000      0.0000      3.9860
+   1487.9301      0.0000      0.0000      3.9820
+   1488.5300      0.0000      0.0000      3.9860
+   1489.1300      0.0000      0.0000      3.9850
+   1489.7300      0.0000      0.0000      3.9800
+   1490.3199      0.0000      0.0000      3.9840
+   1490.9200      0.0000      0.0000      3.9830
+   1491.5200      0.0000      0.0000      3.9880
+   1492.1200      0.0000      0.0000      3.9810
+   1492.7200      0.0000      0.0000      3.9850
+   1493.3101      0.0000      0.0000      3.9890
+   1493.9100      0.0000      0.0000      3.9830
+   1494.5100      0.0000      0.0000      3.9870
+   1495.1100      0.0000      0.0000      3.9850
+   1495.7100      0.0000      0.0000      3.9770
+   1496.3000      0.0000      0.0000      3.9860
+   1496.9000      0.0000      0.0000      3.9810
+   1497.5000      0.0000      0.0000      3.9790
+   1498.1000      0.0000      0.0000      3.9870
+   1498.6899      0.0000      0.0000      3.9850
+   1499.2900      0.0000      0.0000      3.9860
+   1499.8900      0.0000      0.0000      3.9830
+   1500.4900      0.0000      0.0000      3.9830
+   1501.0800      0.0000      0.0000      3.9810
+   1501.6801      0.0000      0.0000      3.9840
+   1502.2800      0.0000      0.0000      3.9820
+   1502.8800      0.0000      0.0000      3.9860
+   1503.4700      0.0000      0.0000      3.9790
+   1504.0699      0.0000      0.0000      3.9840
+   1504.6700      0.0000      0.0000      3.9810
+   1505.2600      0.0000      0.0000      3.9790
+   1505.8600      0.0000      0.0000      3.9830
+   1506.4600      0.0000      0.0000      3.9800
+   1507.0601      0.0000      0.0000      3.9810
+   1507.6500      0.0000      0.0000      3.9860
+   1508.2500      0.0000      0.0000      3.9850
+   1508.8500      0.0000      0.0000      3.9820
+   1509.4399      0.0000      0.0000      3.9890
+   1510.0400      0.0000      0.0000      3.9790
+   1510.6400      0.0000      0.0000      3.9800
+   1511.2400      0.0000      0.0000      3.9790
+   1511.8300      0.0000      0.0000      3.9780
+   1512.4301      0.0000      0.0000      3.9790
+   1513.0300      0.0000      0.0000      3.9760
+   1513.6200      0.0000      0.0000      3.9830
+   1514.2200      0.0000      0.0000      3.9800
+   1514.8199      0.0000      0.0000      3.9800
+   1515.4100      0.0000      0.0000      3.9720
+   1516.0100      0.0000      0.0000      3.9800
+   1516.6000      0.0000      0.0000      3.9710
+   1517.2000      0.0000      0.0000      3.9700
+   1517.8000      0.0000      0.0000      3.9710
+   1518.3900      0.0000      0.0000      3.9690
+   1518.9900      0.0000      0.0000      3.9610
+   1519.5900      0.0000      0.0000      3.9690
+   1520.1801      0.0000      0.0000      3.9710
+   1520.7800      0.0000      0.0000      3.9660
+   1521.3800      0.0000      0.0000      3.9660
+   1521.9700      0.0000      0.0000      3.9640
+   1522.5699      0.0000      0.0000      3.9700
+   1523.1600      0.0000      0.0000      3.9690
+   1523.7600      0.0000      0.0000      3.9580
+   1524.3600      0.0000      0.0000      3.9710
+   1524.9500      0.0000      0.0000      3.9680
+   1525.5500      0.0000      0.0000      3.9560
+   1526.1400      0.0000      0.0000      3.9680
+   1526.7400      0.0000      0.0000      3.9620
+   1527.3400      0.0000      0.0000      3.9610
+   1527.9301      0.0000      0.0000      3.9560
+   1528.5300      0.0000      0.0000      3.9630
+   1529.1200      0.0000      0.0000      3.9580
+   1529.7200      0.0000      0.0000      3.9610
+   1530.3101      0.0000      0.0000      3.9600
+   1530.9100      0.0000      0.0000      3.9610
+   1531.5100      0.0000      0.0000      3.9590
+   1532.1000      0.0000      0.0000      3.9600
+   1532.7000      0.0000      0.0000      3.9600
+   1533.2900      0.0000      0.0000      3.9550
+   1533.8900      0.0000      0.0000      3.9570
+   1534.4800      0.0000      0.0000      3.9540
+   1535.0800      0.0000      0.0000      3.9580
+   1535.6700      0.0000      0.0000      3.9540
+   1536.2700      0.0000      0.0000      3.9570
+   1536.8600      0.0000      0.0000      3.9510
+   1537.4600      0.0000      0.0000      3.9520
+   1538.0601      0.0000      0.0000      3.9500
+   1538.6500      0.0000      0.0000      3.9520
+   1539.2500      0.0000      0.0000      3.9460
+   1539.8400      0.0000      0.0000      3.9540
+   1540.4399      0.0000      0.0000      3.9530
+   1541.0300      0.0000      0.0000      3.9550
+   1541.6300      0.0000      0.0000      3.9570
+   1542.2200      0.0000      0.0000      3.9470
+   1542.8199      0.0000      0.0000      3.9500
+   1543.4100      0.0000      0.0000      3.9410
+   1544.0100      0.0000      0.0000      3.9360
+   1544.6000      0.0000      0.0000      3.9340
+   1545.1899      0.0000      0.0000      3.9280
+   1545.7900      0.0000      0.0000      3.9260
+   1546.3800      0.0000      0.0000      3.9230
+   1546.9800      0.0000      0.0000      3.9290
+   1547.5699      0.0000      0.0000      3.9270
+   1548.1700      0.0000      0.0000      3.9210
+   1548.7600      0.0000      0.0000      3.9280
+   1549.3600      0.0000      0.0000      3.9240
+   1549.9500      0.0000      0.0000      3.9220
+   1550.5500      0.0000      0.0000      3.9270
+   1551.1400      0.0000      0.0000      3.9250
+   1551.7300      0.0000      0.0000      3.9240
+   1552.3300      0.0000      0.0000      3.9270
+   1552.9200      0.0000      0.0000      3.9230
+   1553.5200      0.0000      0.0000      3.9210
+   1554.1100      0.0000      0.0000      3.9170
+   1554.7100      0.0000      0.0000      3.9220
+   1555.3000      0.0000      0.0000      3.9170
+   1555.8900      0.0000      0.0000      3.9210
+   1556.4900      0.0000      0.0000      3.9220
+   1557.0800      0.0000      0.0000      3.9160
+   1557.6801      0.0000      0.0000      3.9250
+   1558.2700      0.0000      0.0000      3.9170
+   1558.8600      0.0000      0.0000      3.9110
+   1559.4600      0.0000      0.0000      3.9200
+   1560.0500      0.0000      0.0000      3.9100
+   1560.6500      0.0000      0.0000      3.9090
+   1561.2400      0.0000      0.0000      3.9070
+   1561.8300      0.0000      0.0000      3.9070
+   1562.4301      0.0000      0.0000      3.9020
+   1563.0200      0.0000      0.0000      3.9140
+   1563.6100      0.0000      0.0000      3.9050
+   1564.2100      0.0000      0.0000      3.9100
+   1564.8000      0.0000      0.0000      3.9100
+   1565.4000      0.0000      0.0000      3.9090
+   1565.9900      0.0000      0.0000      3.9120
+   1566.5800      0.0000      0.0000      3.9070
+   1567.1801      0.0000      0.0000      3.9080
+   1567.7700      0.0000      0.0000      3.9060
+   1568.3600      0.0000      0.0000      3.9090
+   1568.9600      0.0000      0.0000      3.9100
+   1569.5500      0.0000      0.0000      3.9160
+   1570.1400      0.0000      0.0000      3.9150
+   1570.7400      0.0000      0.0000      3.9080
+   1571.3300      0.0000      0.0000      3.9120
+   1571.9200      0.0000      0.0000      3.9130
+   1572.5100      0.0000      0.0000      3.9000
+   1573.1100      0.0000      0.0000      3.9000
+   1573.7000      0.0000      0.0000      3.9070
+   1574.2900      0.0000      0.0000      3.9060
+   1574.8900      0.0000      0.0000      3.8990
+   1575.4800      0.0000      0.0000      3.8940
+   1576.0699      0.0000      0.0000      3.8930
+   1576.6700      0.0000      0.0000      3.8960
+   1577.2600      0.0000      0.0000      3.8930
+   1577.8500      0.0000      0.0000      3.8890
+   1578.4399      0.0000      0.0000      3.8870
+   1579.0400      0.0000      0.0000      3.8890
+   1579.6300      0.0000      0.0000      3.8900
+   1580.2200      0.0000      0.0000      3.8860
+   1580.8101      0.0000      0.0000      3.8880
+   1581.4100      0.0000      0.0000      3.8880
+   1582.0000      0.0000      0.0000      3.8870
+   1582.5900      0.0000      0.0000      3.8800
+   1583.1801      0.0000      0.0000      3.8790
+   1583.7800      0.0000      0.0000      3.8810
+   1584.3700      0.0000      0.0000      3.8850
+   1584.9600      0.0000      0.0000      3.8850
+   1585.5500      0.0000      0.0000      3.8820
+   1586.1500      0.0000      0.0000      3.8790
+   1586.7400      0.0000      0.0000      3.8760
+   1587.3300      0.0000      0.0000      3.8810
+   1587.9200      0.0000      0.0000      3.8790
+   1588.5100      0.0000      0.0000      3.8790
+   1589.1100      0.0000      0.0000      3.8770
+   1589.7000      0.0000      0.0000      3.8790
+   1590.2900      0.0000      0.0000      3.8720
+   1590.8800      0.0000      0.0000      3.8780
+   1591.4700      0.0000      0.0000      3.8750
+   1592.0699      0.0000      0.0000      3.8830
+   1592.6600      0.0000      0.0000      3.8740
+   1593.2500      0.0000      0.0000      3.8750
+   1593.8400      0.0000      0.0000      3.8770
+   1594.4301      0.0000      0.0000      3.8770
+   1595.0300      0.0000      0.0000      3.8740
+   1595.6200      0.0000      0.0000      3.8780
+   1596.2100      0.0000      0.0000      3.8750
+   1596.8000      0.0000      0.0000      3.8750
+   1597.3900      0.0000      0.0000      3.8740
+   1597.9800      0.0000      0.0000      3.8800
+   1598.5699      0.0000      0.0000      3.8680
+   1599.1700      0.0000      0.0000      3.8790
+   1599.7600      0.0000      0.0000      3.8750
+   1600.3500      0.0000      0.0000      3.8740
+   1600.9399      0.0000      0.0000      3.8750
+   1601.5300      0.0000      0.0000      3.8790
+   1602.1200      0.0000      0.0000      3.8790
+   1602.7100      0.0000      0.0000      3.8700
+   1603.3101      0.0000      0.0000      3.8750
+   1603.9000      0.0000      0.0000      3.8780
+   1604.4900      0.0000      0.0000      3.8720
+   1605.0800      0.0000      0.0000      3.8780
+   1605.6700      0.0000      0.0000      3.8730
+   1606.2600      0.0000      0.0000      3.8750
+   1606.8500      0.0000      0.0000      3.8710
+   1607.4399      0.0000      0.0000      3.8720
+   1608.0300      0.0000      0.0000      3.8660
+   1608.6200      0.0000      0.0000      3.8710
+   1609.2200      0.0000      0.0000      3.8650
+   1609.8101      0.0000      0.0000      3.8720
+   1610.4000      0.0000      0.0000      3.8710
+   1610.9900      0.0000      0.0000      3.8640
+   1611.5800      0.0000      0.0000      3.8700
+   1612.1700      0.0000      0.0000      3.8660
+   1612.7600      0.0000      0.0000      3.8710
+   1613.3500      0.0000      0.0000      3.8640
+   1613.9399      0.0000      0.0000      3.8720
+   1614.5300      0.0000      0.0000      3.8630
+   1615.1200      0.0000      0.0000      3.8650
+   1615.7100      0.0000      0.0000      3.8590
+   1616.3000      0.0000      0.0000      3.8630
+   1616.8900      0.0000      0.0000      3.8610
+   1617.4800      0.0000      0.0000      3.8530
+   1618.0699      0.0000      0.0000      3.8570
+   1618.6600      0.0000      0.0000      3.8570
+   1619.2500      0.0000      0.0000      3.8570
+   1619.8400      0.0000      0.0000      3.8570
+   1620.4301      0.0000      0.0000      3.8530
+   1621.0200      0.0000      0.0000      3.8570
+   1621.6100      0.0000      0.0000      3.8540
+   1622.2000      0.0000      0.0000      3.8540
+   1622.7900      0.0000      0.0000      3.8570
+   1623.3800      0.0000      0.0000      3.8600
+   1623.9700      0.0000      0.0000      3.8570
+   1624.5601      0.0000      0.0000      3.8580
+   1625.1500      0.0000      0.0000      3.8560
+   1625.7400      0.0000      0.0000      3.8580
+   1626.3300      0.0000      0.0000      3.8610
+   1626.9200      0.0000      0.0000      3.8580
+   1627.5100      0.0000      0.0000      3.8590
+   1628.1000      0.0000      0.0000      3.8550
+   1628.6899      0.0000      0.0000      3.8580
+   1629.2800      0.0000      0.0000      3.8540
+   1629.8700      0.0000      0.0000      3.8580
+   1630.4600      0.0000      0.0000      3.8600
+   1631.0500      0.0000      0.0000      3.8520
+   1631.6400      0.0000      0.0000      3.8600
+   1632.2300      0.0000      0.0000      3.8610
+   1632.8199      0.0000      0.0000      3.8590
+   1633.4100      0.0000      0.0000      3.8600
+   1634.0000      0.0000      0.0000      3.8590
+   1634.5900      0.0000      0.0000      3.8640
+   1635.1801      0.0000      0.0000      3.8590
+   1635.7700      0.0000      0.0000      3.8610
+   1636.3500      0.0000      0.0000      3.8560
+   1636.9399      0.0000      0.0000      3.8660
+   1637.5300      0.0000      0.0000      3.8540
+   1638.1200      0.0000      0.0000      3.8650
+   1638.7100      0.0000      0.0000      3.8510
+   1639.3000      0.0000      0.0000      3.8570
+   1639.8900      0.0000      0.0000      3.8510
+   1640.4800      0.0000      0.0000      3.8530
+   1641.0699      0.0000      0.0000      3.8610
+   1641.6600      0.0000      0.0000      3.8590
+   1642.2400      0.0000      0.0000      3.8580
+   1642.8300      0.0000      0.0000      3.8590
+   1643.4200      0.0000      0.0000      3.8560
+   1644.0100      0.0000      0.0000      3.8590
+   1644.6000      0.0000      0.0000      3.8550
+   1645.1899      0.0000      0.0000      3.8570
+   1645.7800      0.0000      0.0000      3.8540
+   1646.3600      0.0000      0.0000      3.8550
+   1646.9500      0.0000      0.0000      3.8560
+   1647.5400      0.0000      0.0000      3.8520
+   1648.1300      0.0000      0.0000      3.8570
+   1648.7200      0.0000      0.0000      3.8560
+   1649.3101      0.0000      0.0000      3.8530
+   1649.9000      0.0000      0.0000      3.8530
+   1650.4800      0.0000      0.0000      3.8570
+   1651.0699      0.0000      0.0000      3.8540
+   1651.6600      0.0000      0.0000      3.8520
+   1652.2500      0.0000      0.0000      3.8530
+   1652.8400      0.0000      0.0000      3.8480
+   1653.4200      0.0000      0.0000      3.8530
+   1654.0100      0.0000      0.0000      3.8540
+   1654.6000      0.0000      0.0000      3.8540
+   1655.1899      0.0000      0.0000      3.8540
+   1655.7800      0.0000      0.0000      3.8530
+   1656.3600      0.0000      0.0000      3.8510
+   1656.9500      0.0000      0.0000      3.8560
+   1657.5400      0.0000      0.0000      3.8540
+   1658.1300      0.0000      0.0000      3.8490
+   1658.7200      0.0000      0.0000      3.8510
+   1659.3000      0.0000      0.0000      3.8540
+   1659.8900      0.0000      0.0000      3.8540
+   1660.4800      0.0000      0.0000      3.8530
+   1661.0699      0.0000      0.0000      3.8480
+   1661.6500      0.0000      0.0000      3.8520
+   1662.2400      0.0000      0.0000      3.8520
+   1662.8300      0.0000      0.0000      3.8560
+   1663.4200      0.0000      0.0000      3.8540
+   1664.0000      0.0000      0.0000      3.8510
+   1664.5900      0.0000      0.0000      3.8490
+   1665.1801      0.0000      0.0000      3.8520
+   1665.7700      0.0000      0.0000      3.8510
+   1666.3500      0.0000      0.0000      3.8530
+   1666.9399      0.0000      0.0000      3.8550
+   1667.5300      0.0000      0.0000      3.8530
+   1668.1200      0.0000      0.0000      3.8490
+   1668.7000      0.0000      0.0000      3.8530
+   1669.2900      0.0000      0.0000      3.8540
+   1669.8800      0.0000      0.0000      3.8470
+   1670.4600      0.0000      0.0000      3.8540
+   1671.0500      0.0000      0.0000      3.8480
+   1671.6400      0.0000      0.0000      3.8530
+   1672.2200      0.0000      0.0000      3.8500
+   1672.8101      0.0000      0.0000      3.8540
+   1673.4000      0.0000      0.0000      3.8480
+   1673.9900      0.0000      0.0000      3.8440
+   1674.5699      0.0000      0.0000      3.8530
+   1675.1600      0.0000      0.0000      3.8480
+   1675.7500      0.0000      0.0000      3.8630
+   1676.3300      0.0000      0.0000      3.8500
+   1676.9200      0.0000      0.0000      3.8480
+   1677.5100      0.0000      0.0000      3.8480
+   1678.0900      0.0000      0.0000      3.8490
+   1678.6801      0.0000      0.0000      3.8530
+   1679.2600      0.0000      0.0000      3.8430
+   1679.8500      0.0000      0.0000      3.8420
+   1680.4399      0.0000      0.0000      3.8500
+   1681.0200      0.0000      0.0000      3.8440
+   1681.6100      0.0000      0.0000      3.8490
+   1682.2000      0.0000      0.0000      3.8480
+   1682.7800      0.0000      0.0000      3.8460
+   1683.3700      0.0000      0.0000      3.8370
+   1683.9600      0.0000      0.0000      3.8410
+   1684.5400      0.0000      0.0000      3.8440
+   1685.1300      0.0000      0.0000      3.8470
+   1685.7100      0.0000      0.0000      3.8400
+   1686.3000      0.0000      0.0000      3.8420
+   1686.8900      0.0000      0.0000      3.8390
+   1687.4700      0.0000      0.0000      3.8380
+   1688.0601      0.0000      0.0000      3.8350
+   1688.6400      0.0000      0.0000      3.8430
+   1689.2300      0.0000      0.0000      3.8380
+   1689.8199      0.0000      0.0000      3.8340
+   1690.4000      0.0000      0.0000      3.8420
+   1690.9900      0.0000      0.0000      3.8350
+   1691.5699      0.0000      0.0000      3.8350
+   1692.1600      0.0000      0.0000      3.8310
+   1692.7400      0.0000      0.0000      3.8390
+   1693.3300      0.0000      0.0000      3.8360
+   1693.9200      0.0000      0.0000      3.8320
+   1694.5000      0.0000      0.0000      3.8290
+   1695.0900      0.0000      0.0000      3.8360
+   1695.6700      0.0000      0.0000      3.8340
+   1696.2600      0.0000      0.0000      3.8350
+   1696.8400      0.0000      0.0000      3.8360
+   1697.4301      0.0000      0.0000      3.8350
+   1698.0100      0.0000      0.0000      3.8350
+   1698.6000      0.0000      0.0000      3.8340
+   1699.1801      0.0000      0.0000      3.8360
+   1699.7700      0.0000      0.0000      3.8310
+   1700.3500      0.0000      0.0000      3.8300
+   1700.9399      0.0000      0.0000      3.8360
+   1701.5300      0.0000      0.0000      3.8330
+   1702.1100      0.0000      0.0000      3.8320
+   1702.7000      0.0000      0.0000      3.8360
+   1703.2800      0.0000      0.0000      3.8360
+   1703.8700      0.0000      0.0000      3.8340
+   1704.4500      0.0000      0.0000      3.8340
+   1705.0300      0.0000      0.0000      3.8340
+   1705.6200      0.0000      0.0000      3.8360
+   1706.2000      0.0000      0.0000      3.8290
+   1706.7900      0.0000      0.0000      3.8300
+   1707.3700      0.0000      0.0000      3.8300
+   1707.9600      0.0000      0.0000      3.8360
+   1708.5400      0.0000      0.0000      3.8300
+   1709.1300      0.0000      0.0000      3.8330
+   1709.7100      0.0000      0.0000      3.8250
+   1710.3000      0.0000      0.0000      3.8280
+   1710.8800      0.0000      0.0000      3.8330
+   1711.4700      0.0000      0.0000      3.8350
+   1712.0500      0.0000      0.0000      3.8260
+   1712.6400      0.0000      0.0000      3.8330
+   1713.2200      0.0000      0.0000      3.8270
+   1713.8000      0.0000      0.0000      3.8340
+   1714.3900      0.0000      0.0000      3.8250
+   1714.9700      0.0000      0.0000      3.8170
+   1715.5601      0.0000      0.0000      3.8350
+   1716.1400      0.0000      0.0000      3.8330
+   1716.7300      0.0000      0.0000      3.8260
+   1717.3101      0.0000      0.0000      3.8280
+   1717.8900      0.0000      0.0000      3.8270
+   1718.4800      0.0000      0.0000      3.8210
+   1719.0601      0.0000      0.0000      3.8330
+   1719.6500      0.0000      0.0000      3.8250
+   1720.2300      0.0000      0.0000      3.8220
+   1720.8101      0.0000      0.0000      3.8260
+   1721.4000      0.0000      0.0000      3.8310
+   1721.9800      0.0000      0.0000      3.8260
+   1722.5699      0.0000      0.0000      3.8260
+   1723.1500      0.0000      0.0000      3.8300
+   1723.7300      0.0000      0.0000      3.8260
+   1724.3199      0.0000      0.0000      3.8240
+   1724.9000      0.0000      0.0000      3.8190
+   1725.4800      0.0000      0.0000      3.8280
+   1726.0699      0.0000      0.0000      3.8280
+   1726.6500      0.0000      0.0000      3.8250
+   1727.2300      0.0000      0.0000      3.8230
+   1727.8199      0.0000      0.0000      3.8220
+   1728.4000      0.0000      0.0000      3.8230
+   1728.9800      0.0000      0.0000      3.8250
+   1729.5699      0.0000      0.0000      3.8270
+   1730.1500      0.0000      0.0000      3.8220
+   1730.7300      0.0000      0.0000      3.8200
+   1731.3199      0.0000      0.0000      3.8180
+   1731.9000      0.0000      0.0000      3.8240
+   1732.4800      0.0000      0.0000      3.8220
+   1733.0699      0.0000      0.0000      3.8260
+   1733.6500      0.0000      0.0000      3.8180
+   1734.2300      0.0000      0.0000      3.8210
+   1734.8199      0.0000      0.0000      3.8220
+   1735.4000      0.0000      0.0000      3.8220
+   1735.9800      0.0000      0.0000      3.8200
+   1736.5699      0.0000      0.0000      3.8190
+   1737.1500      0.0000      0.0000      3.8250
+   1737.7300      0.0000      0.0000      3.8170
+   1738.3101      0.0000      0.0000      3.8180
+   1738.9000      0.0000      0.0000      3.8110
+   1739.4800      0.0000      0.0000      3.8220
+   1740.0601      0.0000      0.0000      3.8200
+   1740.6500      0.0000      0.0000      3.8180
+   1741.2300      0.0000      0.0000      3.8180
+   1741.8101      0.0000      0.0000      3.8170
+   1742.3900      0.0000      0.0000      3.8190
+   1742.9800      0.0000      0.0000      3.8180
+   1743.5601      0.0000      0.0000      3.8200
+   1744.1400      0.0000      0.0000      3.8200
+   1744.7200      0.0000      0.0000      3.8190
+   1745.3101      0.0000      0.0000      3.8120
+   1745.8900      0.0000      0.0000      3.8110
+   1746.4700      0.0000      0.0000      3.8150
+   1747.0500      0.0000      0.0000      3.8140
+   1747.6300      0.0000      0.0000      3.8000
+   1748.2200      0.0000      0.0000      3.8120
+   1748.8000      0.0000      0.0000      3.8140
+   1749.3800      0.0000      0.0000      3.8070
+   1749.9600      0.0000      0.0000      3.8150
+   1750.5500      0.0000      0.0000      3.8130
+   1751.1300      0.0000      0.0000      3.8120
+   1751.7100      0.0000      0.0000      3.8110
+   1752.2900      0.0000      0.0000      3.8090
+   1752.8700      0.0000      0.0000      3.8090
+   1753.4500      0.0000      0.0000      3.8080
+   1754.0400      0.0000      0.0000      3.8050
+   1754.6200      0.0000      0.0000      3.8060
+   1755.2000      0.0000      0.0000      3.7970
+   1755.7800      0.0000      0.0000      3.8060
+   1756.3600      0.0000      0.0000      3.8060
+   1756.9500      0.0000      0.0000      3.8020
+   1757.5300      0.0000      0.0000      3.7970
+   1758.1100      0.0000      0.0000      3.7970
+   1758.6899      0.0000      0.0000      3.8040
+   1759.2700      0.0000      0.0000      3.8050
+   1759.8500      0.0000      0.0000      3.7990
+   1760.4301      0.0000      0.0000      3.7970
+   1761.0200      0.0000      0.0000      3.7960
+   1761.6000      0.0000      0.0000      3.7890
+   1762.1801      0.0000      0.0000      3.7970
+   1762.7600      0.0000      0.0000      3.8040
+   1763.3400      0.0000      0.0000      3.7980
+   1763.9200      0.0000      0.0000      3.7970
+   1764.5000      0.0000      0.0000      3.7940
+   1765.0800      0.0000      0.0000      3.7900
+   1765.6700      0.0000      0.0000      3.7890
+   1766.2500      0.0000      0.0000      3.7930
+   1766.8300      0.0000      0.0000      3.7970
+   1767.4100      0.0000      0.0000      3.7950
+   1767.9900      0.0000      0.0000      3.7930
+   1768.5699      0.0000      0.0000      3.7940
+   1769.1500      0.0000      0.0000      3.7960
+   1769.7300      0.0000      0.0000      3.7930
+   1770.3101      0.0000      0.0000      3.7970
+   1770.8900      0.0000      0.0000      3.8000
+   1771.4800      0.0000      0.0000      3.7930
+   1772.0601      0.0000      0.0000      3.8000
+   1772.6400      0.0000      0.0000      3.7920
+   1773.2200      0.0000      0.0000      3.7930
+   1773.8000      0.0000      0.0000      3.7890
+   1774.3800      0.0000      0.0000      3.7950
+   1774.9600      0.0000      0.0000      3.7920
+   1775.5400      0.0000      0.0000      3.7960
+   1776.1200      0.0000      0.0000      3.7900
+   1776.7000      0.0000      0.0000      3.7920
+   1777.2800      0.0000      0.0000      3.7910
+   1777.8600      0.0000      0.0000      3.7910
+   1778.4399      0.0000      0.0000      3.7870
+   1779.0200      0.0000      0.0000      3.7840
+   1779.6000      0.0000      0.0000      3.7940
+   1780.1801      0.0000      0.0000      3.7870
+   1780.7600      0.0000      0.0000      3.7870
+   1781.3400      0.0000      0.0000      3.7920
+   1781.9200      0.0000      0.0000      3.7840
+   1782.5000      0.0000      0.0000      3.7880
+   1783.0800      0.0000      0.0000      3.7840
+   1783.6600      0.0000      0.0000      3.7890
+   1784.2400      0.0000      0.0000      3.7870
+   1784.8199      0.0000      0.0000      3.7890
+   1785.4000      0.0000      0.0000      3.7810
+   1785.9800      0.0000      0.0000      3.7890
+   1786.5601      0.0000      0.0000      3.7810
+   1787.1400      0.0000      0.0000      3.7830
+   1787.7200      0.0000      0.0000      3.7940
+   1788.3000      0.0000      0.0000      3.7860
+   1788.8800      0.0000      0.0000      3.7860
+   1789.4600      0.0000      0.0000      3.7860
+   1790.0400      0.0000      0.0000      3.7850
+   1790.6200      0.0000      0.0000      3.7870
+   1791.2000      0.0000      0.0000      3.7890
+   1791.7800      0.0000      0.0000      3.7800
+   1792.3600      0.0000      0.0000      3.7870
+   1792.9399      0.0000      0.0000      3.7920
+   1793.5200      0.0000      0.0000      3.7860
+   1794.1000      0.0000      0.0000      3.7840
+   1794.6801      0.0000      0.0000      3.7840
+   1795.2500      0.0000      0.0000      3.7880
+   1795.8300      0.0000      0.0000      3.7830
+   1796.4100      0.0000      0.0000      3.7910
+   1796.9900      0.0000      0.0000      3.7820
+   1797.5699      0.0000      0.0000      3.7890
+   1798.1500      0.0000      0.0000      3.7860
+   1798.7300      0.0000      0.0000      3.7830
+   1799.3101      0.0000      0.0000      3.7870
+   1799.8900      0.0000      0.0000      3.7830
+   1800.4700      0.0000      0.0000      3.7820
+   1801.0500      0.0000      0.0000      3.7870
+   1801.6200      0.0000      0.0000      3.7890
+   1802.2000      0.0000      0.0000      3.7860
+   1802.7800      0.0000      0.0000      3.7880
+   1803.3600      0.0000      0.0000      3.7830
+   1803.9399      0.0000      0.0000      3.7860
+   1804.5200      0.0000      0.0000      3.7850
+   1805.1000      0.0000      0.0000      3.7880
+   1805.6801      0.0000      0.0000      3.7860
+   1806.2500      0.0000      0.0000      3.7860
+   1806.8300      0.0000      0.0000      3.7870
+   1807.4100      0.0000      0.0000      3.7850
+   1807.9900      0.0000      0.0000      3.7860
+   1808.5699      0.0000      0.0000      3.7890
+   1809.1500      0.0000      0.0000      3.7860
+   1809.7200      0.0000      0.0000      3.7880
+   1810.3000      0.0000      0.0000      3.7850
+   1810.8800      0.0000      0.0000      3.7880
+   1811.4600      0.0000      0.0000      3.7880
+   1812.0400      0.0000      0.0000      3.7830
+   1812.6200      0.0000      0.0000      3.7950
+   1813.1899      0.0000      0.0000      3.7910
+   1813.7700      0.0000      0.0000      3.7910
+   1814.3500      0.0000      0.0000      3.7850
+   1814.9301      0.0000      0.0000      3.7890
+   1815.5100      0.0000      0.0000      3.7860
+   1816.0800      0.0000      0.0000      3.7880
+   1816.6600      0.0000      0.0000      3.7880
+   1817.2400      0.0000      0.0000      3.7850
+   1817.8199      0.0000      0.0000      3.7970
+   1818.4000      0.0000      0.0000      3.7910
+   1818.9700      0.0000      0.0000      3.7910
+   1819.5500      0.0000      0.0000      3.7930
+   1820.1300      0.0000      0.0000      3.7890
+   1820.7100      0.0000      0.0000      3.7840
+   1821.2800      0.0000      0.0000      3.7940
+   1821.8600      0.0000      0.0000      3.7980
+   1822.4399      0.0000      0.0000      3.7890
+   1823.0200      0.0000      0.0000      3.7860
+   1823.5900      0.0000      0.0000      3.7960
+   1824.1700      0.0000      0.0000      3.7900
+   1824.7500      0.0000      0.0000      3.7900
+   1825.3300      0.0000      0.0000      3.7900
+   1825.9000      0.0000      0.0000      3.7910
+   1826.4800      0.0000      0.0000      3.7950
+   1827.0601      0.0000      0.0000      3.7880
+   1827.6400      0.0000      0.0000      3.7880
+   1828.2100      0.0000      0.0000      3.7870
+   1828.7900      0.0000      0.0000      3.7890
+   1829.3700      0.0000      0.0000      3.7890
+   1829.9399      0.0000      0.0000      3.7860
+   1830.5200      0.0000      0.0000      3.7870
+   1831.1000      0.0000      0.0000      3.7950
+   1831.6700      0.0000      0.0000      3.7830
+   1832.2500      0.0000      0.0000      3.7870
+   1832.8300      0.0000      0.0000      3.7910
+   1833.4100      0.0000      0.0000      3.7830
+   1833.9800      0.0000      0.0000      3.7880
+   1834.5601      0.0000      0.0000      3.7880
+   1835.1400      0.0000      0.0000      3.7910
+   1835.7100      0.0000      0.0000      3.7900
+   1836.2900      0.0000      0.0000      3.7890
+   1836.8700      0.0000      0.0000      3.7910
+   1837.4399      0.0000      0.0000      3.7900
+   1838.0200      0.0000      0.0000      3.7860
+   1838.6000      0.0000      0.0000      3.7920
+   1839.1700      0.0000      0.0000      3.7880
+   1839.7500      0.0000      0.0000      3.7870
+   1840.3199      0.0000      0.0000      3.7870
+   1840.9000      0.0000      0.0000      3.7910
+   1841.4800      0.0000      0.0000      3.7900
+   1842.0500      0.0000      0.0000      3.7900
+   1842.6300      0.0000      0.0000      3.7890
+   1843.2100      0.0000      0.0000      3.7910
+   1843.7800      0.0000      0.0000      3.7910
+   1844.3600      0.0000      0.0000      3.8000
+   1844.9301      0.0000      0.0000      3.7930
+   1845.5100      0.0000      0.0000      3.7900
+   1846.0900      0.0000      0.0000      3.7900
+   1846.6600      0.0000      0.0000      3.7890
+   1847.2400      0.0000      0.0000      3.7870
+   1847.8199      0.0000      0.0000      3.7890
+   1848.3900      0.0000      0.0000      3.7890
+   1848.9700      0.0000      0.0000      3.7930
+   1849.5400      0.0000      0.0000      3.7950
+   1850.1200      0.0000      0.0000      3.7870
+   1850.6899      0.0000      0.0000      3.7880
+   1851.2700      0.0000      0.0000      3.7870
+   1851.8500      0.0000      0.0000      3.7880
+   1852.4200      0.0000      0.0000      3.7840
+   1853.0000      0.0000      0.0000      3.7940
+   1853.5699      0.0000      0.0000      3.7860
+   1854.1500      0.0000      0.0000      3.7880
+   1854.7200      0.0000      0.0000      3.7910
+   1855.3000      0.0000      0.0000      3.7920
+   1855.8700      0.0000      0.0000      3.7910
+   1856.4500      0.0000      0.0000      3.7840
+   1857.0300      0.0000      0.0000      3.7900
+   1857.6000      0.0000      0.0000      3.7900
+   1858.1801      0.0000      0.0000      3.7860
+   1858.7500      0.0000      0.0000      3.7880
+   1859.3300      0.0000      0.0000      3.7920
+   1859.9000      0.0000      0.0000      3.7910
+   1860.4800      0.0000      0.0000      3.7830
+   1861.0500      0.0000      0.0000      3.7910
+   1861.6300      0.0000      0.0000      3.7850
+   1862.2000      0.0000      0.0000      3.7900
+   1862.7800      0.0000      0.0000      3.7790
+   1863.3500      0.0000      0.0000      3.7870
+   1863.9301      0.0000      0.0000      3.7900
+   1864.5000      0.0000      0.0000      3.7900
+   1865.0800      0.0000      0.0000      3.7860
+   1865.6500      0.0000      0.0000      3.7830
+   1866.2300      0.0000      0.0000      3.7890
+   1866.8000      0.0000      0.0000      3.7840
+   1867.3800      0.0000      0.0000      3.7860
+   1867.9500      0.0000      0.0000      3.7820
+   1868.5200      0.0000      0.0000      3.7830
+   1869.1000      0.0000      0.0000      3.7830
+   1869.6700      0.0000      0.0000      3.7820
+   1870.2500      0.0000      0.0000      3.7830
+   1870.8199      0.0000      0.0000      3.7830
+   1871.4000      0.0000      0.0000      3.7870
+   1871.9700      0.0000      0.0000      3.7830
+   1872.5500      0.0000      0.0000      3.7810
+   1873.1200      0.0000      0.0000      3.7740
+   1873.7000      0.0000      0.0000      3.7790
+   1874.2700      0.0000      0.0000      3.7800
+   1874.8400      0.0000      0.0000      3.7770
+   1875.4200      0.0000      0.0000      3.7760
+   1875.9900      0.0000      0.0000      3.7720
+   1876.5699      0.0000      0.0000      3.7720
+   1877.1400      0.0000      0.0000      3.7700
+   1877.7100      0.0000      0.0000      3.7790
+   1878.2900      0.0000      0.0000      3.7780
+   1878.8600      0.0000      0.0000      3.7770
+   1879.4399      0.0000      0.0000      3.7740
+   1880.0100      0.0000      0.0000      3.7780
+   1880.5800      0.0000      0.0000      3.7750
+   1881.1600      0.0000      0.0000      3.7750
+   1881.7300      0.0000      0.0000      3.7750
+   1882.3101      0.0000      0.0000      3.7780
+   1882.8800      0.0000      0.0000      3.7740
+   1883.4500      0.0000      0.0000      3.7690
+   1884.0300      0.0000      0.0000      3.7760
+   1884.6000      0.0000      0.0000      3.7690
+   1885.1700      0.0000      0.0000      3.7760
+   1885.7500      0.0000      0.0000      3.7690
+   1886.3199      0.0000      0.0000      3.7750
+   1886.8900      0.0000      0.0000      3.7710
+   1887.4700      0.0000      0.0000      3.7640
+   1888.0400      0.0000      0.0000      3.7700
+   1888.6100      0.0000      0.0000      3.7750
+   1889.1899      0.0000      0.0000      3.7730
+   1889.7600      0.0000      0.0000      3.7660
+   1890.3300      0.0000      0.0000      3.7720
+   1890.9100      0.0000      0.0000      3.7680
+   1891.4800      0.0000      0.0000      3.7710
+   1892.0500      0.0000      0.0000      3.7670
+   1892.6300      0.0000      0.0000      3.7730
+   1893.2000      0.0000      0.0000      3.7700
+   1893.7700      0.0000      0.0000      3.7670
+   1894.3500      0.0000      0.0000      3.7610
+   1894.9200      0.0000      0.0000      3.7710
+   1895.4900      0.0000      0.0000      3.7700
+   1896.0601      0.0000      0.0000      3.7660
+   1896.6400      0.0000      0.0000      3.7690
+   1897.2100      0.0000      0.0000      3.7730
+   1897.7800      0.0000      0.0000      3.7700
+   1898.3600      0.0000      0.0000      3.7670
+   1898.9301      0.0000      0.0000      3.7710
+   1899.5000      0.0000      0.0000      3.7660
+   1900.0699      0.0000      0.0000      3.7710
+   1900.6500      0.0000      0.0000      3.7650
+   1901.2200      0.0000      0.0000      3.7650
+   1901.7900      0.0000      0.0000      3.7680
+   1902.3600      0.0000      0.0000      3.7690
+   1902.9399      0.0000      0.0000      3.7680
+   1903.5100      0.0000      0.0000      3.7710
+   1904.0800      0.0000      0.0000      3.7640
+   1904.6500      0.0000      0.0000      3.7680
+   1905.2300      0.0000      0.0000      3.7670
+   1905.8000      0.0000      0.0000      3.7700
+   1906.3700      0.0000      0.0000      3.7670
+   1906.9399      0.0000      0.0000      3.7710
+   1907.5100      0.0000      0.0000      3.7630
+   1908.0900      0.0000      0.0000      3.7660
+   1908.6600      0.0000      0.0000      3.7690
+   1909.2300      0.0000      0.0000      3.7650
+   1909.8000      0.0000      0.0000      3.7670
+   1910.3800      0.0000      0.0000      3.7680
+   1910.9500      0.0000      0.0000      3.7640
+   1911.5200      0.0000      0.0000      3.7650
+   1912.0900      0.0000      0.0000      3.7660
+   1912.6600      0.0000      0.0000      3.7620
+   1913.2300      0.0000      0.0000      3.7600
+   1913.8101      0.0000      0.0000      3.7630
+   1914.3800      0.0000      0.0000      3.7570
+   1914.9500      0.0000      0.0000      3.7630
+   1915.5200      0.0000      0.0000      3.7610
+   1916.0900      0.0000      0.0000      3.7600
+   1916.6600      0.0000      0.0000      3.7620
+   1917.2400      0.0000      0.0000      3.7590
+   1917.8101      0.0000      0.0000      3.7590
+   1918.3800      0.0000      0.0000      3.7650
+   1918.9500      0.0000      0.0000      3.7640
+   1919.5200      0.0000      0.0000      3.7570
+   1920.0900      0.0000      0.0000      3.7520
+   1920.6600      0.0000      0.0000      3.7670
+   1921.2400      0.0000      0.0000      3.7660
+   1921.8101      0.0000      0.0000      3.7670
+   1922.3800      0.0000      0.0000      3.7640
+   1922.9500      0.0000      0.0000      3.7490
+   1923.5200      0.0000      0.0000      3.7630
+   1924.0900      0.0000      0.0000      3.7610
+   1924.6600      0.0000      0.0000      3.7500
+   1925.2300      0.0000      0.0000      3.7590
+   1925.8000      0.0000      0.0000      3.7590
+   1926.3800      0.0000      0.0000      3.7600
+   1926.9500      0.0000      0.0000      3.7560
+   1927.5200      0.0000      0.0000      3.7610
+   1928.0900      0.0000      0.0000      3.7480
+   1928.6600      0.0000      0.0000      3.7570
+   1929.2300      0.0000      0.0000      3.7570
+   1929.8000      0.0000      0.0000      3.7670
+   1930.3700      0.0000      0.0000      3.7570
+   1930.9399      0.0000      0.0000      3.7590
+   1931.5100      0.0000      0.0000      3.7580
+   1932.0800      0.0000      0.0000      3.7540
+   1932.6500      0.0000      0.0000      3.7560
+   1933.2200      0.0000      0.0000      3.7630
+   1933.8000      0.0000      0.0000      3.7560
+   1934.3700      0.0000      0.0000      3.7530
+   1934.9399      0.0000      0.0000      3.7590
+   1935.5100      0.0000      0.0000      3.7480
+   1936.0800      0.0000      0.0000      3.7560
+   1936.6500      0.0000      0.0000      3.7550
+   1937.2200      0.0000      0.0000      3.7550
+   1937.7900      0.0000      0.0000      3.7570
+   1938.3600      0.0000      0.0000      3.7590
+   1938.9301      0.0000      0.0000      3.7610
+   1939.5000      0.0000      0.0000      3.7550
+   1940.0699      0.0000      0.0000      3.7600
+   1940.6400      0.0000      0.0000      3.7540
+   1941.2100      0.0000      0.0000      3.7490
+   1941.7800      0.0000      0.0000      3.7560
+   1942.3500      0.0000      0.0000      3.7560
+   1942.9200      0.0000      0.0000      3.7590
+   1943.4900      0.0000      0.0000      3.7510
+   1944.0601      0.0000      0.0000      3.7530
+   1944.6300      0.0000      0.0000      3.7580
+   1945.2000      0.0000      0.0000      3.7570
+   1945.7700      0.0000      0.0000      3.7600
+   1946.3400      0.0000      0.0000      3.7550
+   1946.9100      0.0000      0.0000      3.7530
+   1947.4800      0.0000      0.0000      3.7580
+   1948.0500      0.0000      0.0000      3.7550
+   1948.6100      0.0000      0.0000      3.7630
+   1949.1801      0.0000      0.0000      3.7510
+   1949.7500      0.0000      0.0000      3.7570
+   1950.3199      0.0000      0.0000      3.7560
+   1950.8900      0.0000      0.0000      3.7610
+   1951.4600      0.0000      0.0000      3.7480
+   1952.0300      0.0000      0.0000      3.7590
+   1952.6000      0.0000      0.0000      3.7490
+   1953.1700      0.0000      0.0000      3.7600
+   1953.7400      0.0000      0.0000      3.7580
+   1954.3101      0.0000      0.0000      3.7540
+   1954.8800      0.0000      0.0000      3.7570
+   1955.4500      0.0000      0.0000      3.7510
+   1956.0200      0.0000      0.0000      3.7560
+   1956.5800      0.0000      0.0000      3.7530
+   1957.1500      0.0000      0.0000      3.7560
+   1957.7200      0.0000      0.0000      3.7520
+   1958.2900      0.0000      0.0000      3.7530
+   1958.8600      0.0000      0.0000      3.7530
+   1959.4301      0.0000      0.0000      3.7580
+   1960.0000      0.0000      0.0000      3.7530
+   1960.5699      0.0000      0.0000      3.7470
+   1961.1400      0.0000      0.0000      3.7560
+   1961.7000      0.0000      0.0000      3.7580
+   1962.2700      0.0000      0.0000      3.7530
+   1962.8400      0.0000      0.0000      3.7570
+   1963.4100      0.0000      0.0000      3.7490
+   1963.9800      0.0000      0.0000      3.7550
+   1964.5500      0.0000      0.0000      3.7570
+   1965.1200      0.0000      0.0000      3.7550
+   1965.6801      0.0000      0.0000      3.7500
+   1966.2500      0.0000      0.0000      3.7550
+   1966.8199      0.0000      0.0000      3.7590
+   1967.3900      0.0000      0.0000      3.7600
+   1967.9600      0.0000      0.0000      3.7530
+   1968.5300      0.0000      0.0000      3.7520
+   1969.0900      0.0000      0.0000      3.7560
+   1969.6600      0.0000      0.0000      3.7570
+   1970.2300      0.0000      0.0000      3.7560
+   1970.8000      0.0000      0.0000      3.7530
+   1971.3700      0.0000      0.0000      3.7560
+   1971.9301      0.0000      0.0000      3.7510
+   1972.5000      0.0000      0.0000      3.7570
+   1973.0699      0.0000      0.0000      3.7570
+   1973.6400      0.0000      0.0000      3.7540
+   1974.2100      0.0000      0.0000      3.7500
+   1974.7700      0.0000      0.0000      3.7560
+   1975.3400      0.0000      0.0000      3.7600
+   1975.9100      0.0000      0.0000      3.7530
+   1976.4800      0.0000      0.0000      3.7560
+   1977.0500      0.0000      0.0000      3.7470
+   1977.6100      0.0000      0.0000      3.7570
+   1978.1801      0.0000      0.0000      3.7530
+   1978.7500      0.0000      0.0000      3.7540
+   1979.3199      0.0000      0.0000      3.7530
+   1979.8800      0.0000      0.0000      3.7540
+   1980.4500      0.0000      0.0000      3.7530
+   1981.0200      0.0000      0.0000      3.7530
+   1981.5900      0.0000      0.0000      3.7510
+   1982.1500      0.0000      0.0000      3.7550
+   1982.7200      0.0000      0.0000      3.7570
+   1983.2900      0.0000      0.0000      3.7550
+   1983.8600      0.0000      0.0000      3.7590
+   1984.4200      0.0000      0.0000      3.7580
+   1984.9900      0.0000      0.0000      3.7520
+   1985.5601      0.0000      0.0000      3.7490
+   1986.1200      0.0000      0.0000      3.7660
+   1986.6899      0.0000      0.0000      3.7530
+   1987.2600      0.0000      0.0000      3.7560
+   1987.8300      0.0000      0.0000      3.7500
+   1988.3900      0.0000      0.0000      3.7600
+   1988.9600      0.0000      0.0000      3.7590
+   1989.5300      0.0000      0.0000      3.7540
+   1990.0900      0.0000      0.0000      3.7520
+   1990.6600      0.0000      0.0000      3.7560
+   1991.2300      0.0000      0.0000      3.7550
+   1991.7900      0.0000      0.0000      3.7540
+   1992.3600      0.0000      0.0000      3.7500
+   1992.9301      0.0000      0.0000      3.7560
+   1993.4900      0.0000      0.0000      3.7490
+   1994.0601      0.0000      0.0000      3.7570
+   1994.6300      0.0000      0.0000      3.7610
+   1995.1899      0.0000      0.0000      3.7550
+   1995.7600      0.0000      0.0000      3.7540
+   1996.3300      0.0000      0.0000      3.7510
+   1996.8900      0.0000      0.0000      3.7540
+   1997.4600      0.0000      0.0000      3.7640
+   1998.0300      0.0000      0.0000      3.7580
+   1998.5900      0.0000      0.0000      3.7580
+   1999.1600      0.0000      0.0000      3.7600
+   1999.7200      0.0000      0.0000      3.7640
+   2000.2900      0.0000      0.0000      3.7590
+   2000.8600      0.0000      0.0000      3.7570
+   2001.4200      0.0000      0.0000      3.7590
+   2001.9900      0.0000      0.0000      3.7590
+   2002.5601      0.0000      0.0000      3.7620
+   2003.1200      0.0000      0.0000      3.7590
+   2003.6899      0.0000      0.0000      3.7630
+   2004.2500      0.0000      0.0000      3.7590
+   2004.8199      0.0000      0.0000      3.7610
+   2005.3900      0.0000      0.0000      3.7610
+   2005.9500      0.0000      0.0000      3.7590
+   2006.5200      0.0000      0.0000      3.7660
+   2007.0800      0.0000      0.0000      3.7530
+   2007.6500      0.0000      0.0000      3.7560
+   2008.2100      0.0000      0.0000      3.7580
+   2008.7800      0.0000      0.0000      3.7550
+   2009.3500      0.0000      0.0000      3.7570
+   2009.9100      0.0000      0.0000      3.7580
+   2010.4800      0.0000      0.0000      3.7490
+   2011.0400      0.0000      0.0000      3.7570
+   2011.6100      0.0000      0.0000      3.7580
+   2012.1700      0.0000      0.0000      3.7560
+   2012.7400      0.0000      0.0000      3.7530
+   2013.3000      0.0000      0.0000      3.7570
+   2013.8700      0.0000      0.0000      3.7520
+   2014.4301      0.0000      0.0000      3.7540
+   2015.0000      0.0000      0.0000      3.7520
+   2015.5699      0.0000      0.0000      3.7560
+   2016.1300      0.0000      0.0000      3.7490
+   2016.7000      0.0000      0.0000      3.7560
+   2017.2600      0.0000      0.0000      3.7640
+   2017.8300      0.0000      0.0000      3.7570
+   2018.3900      0.0000      0.0000      3.7580
+   2018.9600      0.0000      0.0000      3.7580
+   2019.5200      0.0000      0.0000      3.7550
+   2020.0900      0.0000      0.0000      3.7610
+   2020.6500      0.0000      0.0000      3.7550
+   2021.2200      0.0000      0.0000      3.7560
+   2021.7800      0.0000      0.0000      3.7650
+   2022.3500      0.0000      0.0000      3.7570
+   2022.9100      0.0000      0.0000      3.7560
+   2023.4700      0.0000      0.0000      3.7540
+   2024.0400      0.0000      0.0000      3.7560
+   2024.6000      0.0000      0.0000      3.7540
+   2025.1700      0.0000      0.0000      3.7600
+   2025.7300      0.0000      0.0000      3.7560
+   2026.3000      0.0000      0.0000      3.7540
+   2026.8600      0.0000      0.0000      3.7560
+   2027.4301      0.0000      0.0000      3.7510
+   2027.9900      0.0000      0.0000      3.7480
+   2028.5601      0.0000      0.0000      3.7540
+   2029.1200      0.0000      0.0000      3.7490
+   2029.6801      0.0000      0.0000      3.7460
+   2030.2500      0.0000      0.0000      3.7520
+   2030.8101      0.0000      0.0000      3.7560
+   2031.3800      0.0000      0.0000      3.7560
+   2031.9399      0.0000      0.0000      3.7540
+   2032.5100      0.0000      0.0000      3.7570
+   2033.0699      0.0000      0.0000      3.7540
+   2033.6300      0.0000      0.0000      3.7560
+   2034.2000      0.0000      0.0000      3.7520
+   2034.7600      0.0000      0.0000      3.7550
+   2035.3300      0.0000      0.0000      3.7530
+   2035.8900      0.0000      0.0000      3.7510
+   2036.4500      0.0000      0.0000      3.7530
+   2037.0200      0.0000      0.0000      3.7530
+   2037.5800      0.0000      0.0000      3.7620
+   2038.1500      0.0000      0.0000      3.7530
+   2038.7100      0.0000      0.0000      3.7570
+   2039.2700      0.0000      0.0000      3.7550
+   2039.8400      0.0000      0.0000      3.7520
+   2040.4000      0.0000      0.0000      3.7490
+   2040.9600      0.0000      0.0000      3.7530
+   2041.5300      0.0000      0.0000      3.7530
+   2042.0900      0.0000      0.0000      3.7540
+   2042.6500      0.0000      0.0000      3.7530
+   2043.2200      0.0000      0.0000      3.7570
+   2043.7800      0.0000      0.0000      3.7580
+   2044.3400      0.0000      0.0000      3.7540
+   2044.9100      0.0000      0.0000      3.7580
+   2045.4700      0.0000      0.0000      3.7520
+   2046.0300      0.0000      0.0000      3.7500
+   2046.6000      0.0000      0.0000      3.7560
+   2047.1600      0.0000      0.0000      3.7560
+   2047.7200      0.0000      0.0000      3.7600
+   2048.2900      0.0000      0.0000      3.7540
+   2048.8501      0.0000      0.0000      3.7540
+   2049.4099      0.0000      0.0000      3.7550
+   2049.9800      0.0000      0.0000      3.7520
+   2050.5400      0.0000      0.0000      3.7520
+   2051.1001      0.0000      0.0000      3.7540
+   2051.6699      0.0000      0.0000      3.7630
+   2052.2300      0.0000      0.0000      3.7460
+   2052.7900      0.0000      0.0000      3.7540
+   2053.3501      0.0000      0.0000      3.7550
+   2053.9199      0.0000      0.0000      3.7520
+   2054.4800      0.0000      0.0000      3.7530
+   2055.0400      0.0000      0.0000      3.7550
+   2055.6001      0.0000      0.0000      3.7570
+   2056.1699      0.0000      0.0000      3.7540
+   2056.7300      0.0000      0.0000      3.7530
+   2057.2900      0.0000      0.0000      3.7530
+   2057.8501      0.0000      0.0000      3.7530
+   2058.4199      0.0000      0.0000      3.7560
+   2058.9800      0.0000      0.0000      3.7480
+   2059.5400      0.0000      0.0000      3.7650
+   2060.1001      0.0000      0.0000      3.7470
+   2060.6699      0.0000      0.0000      3.7520
+   2061.2300      0.0000      0.0000      3.7530
+   2061.7900      0.0000      0.0000      3.7470
+   2062.3501      0.0000      0.0000      3.7540
+   2062.9199      0.0000      0.0000      3.7540
+   2063.4800      0.0000      0.0000      3.7540
+   2064.0400      0.0000      0.0000      3.7550
+   2064.6001      0.0000      0.0000      3.7530
+   2065.1599      0.0000      0.0000      3.7590
+   2065.7300      0.0000      0.0000      3.7530
+   2066.2900      0.0000      0.0000      3.7540
+   2066.8501      0.0000      0.0000      3.7510
+   2067.4099      0.0000      0.0000      3.7500
+   2067.9700      0.0000      0.0000      3.7540
+   2068.5400      0.0000      0.0000      3.7560
+   2069.1001      0.0000      0.0000      3.7520
+   2069.6599      0.0000      0.0000      3.7510
+   2070.2200      0.0000      0.0000      3.7490
+   2070.7800      0.0000      0.0000      3.7600
+   2071.3401      0.0000      0.0000      3.7500
+   2071.9099      0.0000      0.0000      3.7590
+   2072.4700      0.0000      0.0000      3.7510
+   2073.0300      0.0000      0.0000      3.7570
+   2073.5901      0.0000      0.0000      3.7520
+   2074.1499      0.0000      0.0000      3.7460
+   2074.7100      0.0000      0.0000      3.7540
+   2075.2700      0.0000      0.0000      3.7560
+   2075.8401      0.0000      0.0000      3.7460
+   2076.3999      0.0000      0.0000      3.7520
+   2076.9600      0.0000      0.0000      3.7480
+   2077.5200      0.0000      0.0000      3.7580
+   2078.0801      0.0000      0.0000      3.7580
+   2078.6399      0.0000      0.0000      3.7520
+   2079.2000      0.0000      0.0000      3.7550
+   2079.7600      0.0000      0.0000      3.7500
+   2080.3301      0.0000      0.0000      3.7590
+   2080.8899      0.0000      0.0000      3.7530
+   2081.4500      0.0000      0.0000      3.7500
+   2082.0100      0.0000      0.0000      3.7590
+   2082.5701      0.0000      0.0000      3.7440
+   2083.1299      0.0000      0.0000      3.7530
+   2083.6899      0.0000      0.0000      3.7530
+   2084.2500      0.0000      0.0000      3.7500
+   2084.8101      0.0000      0.0000      3.7530
+   2085.3701      0.0000      0.0000      3.7420
+   2085.9299      0.0000      0.0000      3.7520
+   2086.5000      0.0000      0.0000      3.7520
+   2087.0601      0.0000      0.0000      3.7530
+   2087.6201      0.0000      0.0000      3.7450
+   2088.1799      0.0000      0.0000      3.7490
+   2088.7400      0.0000      0.0000      3.7480
+   2089.3000      0.0000      0.0000      3.7460
+   2089.8601      0.0000      0.0000      3.7490
+   2090.4199      0.0000      0.0000      3.7490
+   2090.9800      0.0000      0.0000      3.7460
+   2091.5400      0.0000      0.0000      3.7440
+   2092.1001      0.0000      0.0000      3.7750
+   2092.6599      0.0000      0.0000      3.8180
+   2093.2200      0.0000      0.0000      3.8630
+   2093.7800      0.0000      0.0000      3.8970
+   2094.3401      0.0000      0.0000      3.9220
+   2094.8999      0.0000      0.0000      3.9360
+   2095.4600      0.0000      0.0000      3.9380
+   2096.0200      0.0000      0.0000      3.9350
+   2096.5801      0.0000      0.0000      3.9340
+   2097.1399      0.0000      0.0000      3.9180
+   2097.7000      0.0000      0.0000      3.9100
+   2098.2600      0.0000      0.0000      3.8920
+   2098.8201      0.0000      0.0000      3.8890
+   2099.3799      0.0000      0.0000      3.8770
+   2099.9399      0.0000      0.0000      3.8690
+   2100.5000      0.0000      0.0000      3.8630
+   2101.0601      0.0000      0.0000      3.8630
+   2101.6201      0.0000      0.0000      3.8530
+   2102.1799      0.0000      0.0000      3.8450
+   2102.7400      0.0000      0.0000      3.8410
+   2103.3000      0.0000      0.0000      3.8320
+   2103.8601      0.0000      0.0000      3.8300
+   2104.4199      0.0000      0.0000      3.8260
+   2104.9800      0.0000      0.0000      3.8280
+   2105.5400      0.0000      0.0000      3.8120
+   2106.1001      0.0000      0.0000      3.8270
+   2106.6499      0.0000      0.0000      3.8110
+   2107.2100      0.0000      0.0000      3.8180
+   2107.7700      0.0000      0.0000      3.8190
+   2108.3301      0.0000      0.0000      3.8110
+   2108.8899      0.0000      0.0000      3.8100
+   2109.4500      0.0000      0.0000      3.8210
+   2110.0100      0.0000      0.0000      3.8180
+   2110.5701      0.0000      0.0000      3.8150
+   2111.1299      0.0000      0.0000      3.8190
+   2111.6899      0.0000      0.0000      3.8200
+   2112.2500      0.0000      0.0000      3.8170
+   2112.8000      0.0000      0.0000      3.8150
+   2113.3601      0.0000      0.0000      3.8210
+   2113.9199      0.0000      0.0000      3.8160
+   2114.4800      0.0000      0.0000      3.8120
+   2115.0400      0.0000      0.0000      3.8150
+   2115.6001      0.0000      0.0000      3.8120
+   2116.1599      0.0000      0.0000      3.8110
+   2116.7200      0.0000      0.0000      3.8060
+   2117.2800      0.0000      0.0000      3.8160
+   2117.8301      0.0000      0.0000      3.8060
+   2118.3899      0.0000      0.0000      3.8050
+   2118.9500      0.0000      0.0000      3.8070
+   2119.5100      0.0000      0.0000      3.8070
+   2120.0701      0.0000      0.0000      3.8050
+   2120.6299      0.0000      0.0000      3.8110
+   2121.1799      0.0000      0.0000      3.8060
+   2121.7400      0.0000      0.0000      3.8070
+   2122.3000      0.0000      0.0000      3.8020
+   2122.8601      0.0000      0.0000      3.8090
+   2123.4199      0.0000      0.0000      3.8020
+   2123.9800      0.0000      0.0000      3.8010
+   2124.5300      0.0000      0.0000      3.8030
+   2125.0901      0.0000      0.0000      3.8030
+   2125.6499      0.0000      0.0000      3.7990
+   2126.2100      0.0000      0.0000      3.8040
+   2126.7700      0.0000      0.0000      3.8130
+   2127.3201      0.0000      0.0000      3.8160
+   2127.8799      0.0000      0.0000      3.8150
+   2128.4399      0.0000      0.0000      3.8190
+   2129.0000      0.0000      0.0000      3.8200
+   2129.5601      0.0000      0.0000      3.8200
+   2130.1101      0.0000      0.0000      3.8290
+   2130.6699      0.0000      0.0000      3.8260
+   2131.2300      0.0000      0.0000      3.8290
+   2131.7900      0.0000      0.0000      3.8270
+   2132.3501      0.0000      0.0000      3.8300
+   2132.8999      0.0000      0.0000      3.8220
+   2133.4600      0.0000      0.0000      3.8190
+   2134.0200      0.0000      0.0000      3.8280
+   2134.5801      0.0000      0.0000      3.8210
+   2135.1299      0.0000      0.0000      3.8160
+   2135.6899      0.0000      0.0000      3.8230
+   2136.2500      0.0000      0.0000      3.8250
+   2136.8101      0.0000      0.0000      3.8260
+   2137.3601      0.0000      0.0000      3.8290
+   2137.9199      0.0000      0.0000      3.8210
+   2138.4800      0.0000      0.0000      3.8200
+   2139.0300      0.0000      0.0000      3.8280
+   2139.5901      0.0000      0.0000      3.8210
+   2140.1499      0.0000      0.0000      3.8250
+   2140.7100      0.0000      0.0000      3.8220
+   2141.2600      0.0000      0.0000      3.8300
+   2141.8201      0.0000      0.0000      3.8360
+   2142.3799      0.0000      0.0000      3.8420
+   2142.9299      0.0000      0.0000      3.8440
+   2143.4900      0.0000      0.0000      3.8470
+   2144.0500      0.0000      0.0000      3.8480
+   2144.6001      0.0000      0.0000      3.8520
+   2145.1599      0.0000      0.0000      3.8540
+   2145.7200      0.0000      0.0000      3.8530
+   2146.2800      0.0000      0.0000      3.8500
+   2146.8301      0.0000      0.0000      3.8530
+   2147.3899      0.0000      0.0000      3.8530
+   2147.9500      0.0000      0.0000      3.8520
+   2148.5000      0.0000      0.0000      3.8540
+   2149.0601      0.0000      0.0000      3.8560
+   2149.6201      0.0000      0.0000      3.8500
+   2150.1699      0.0000      0.0000      3.8450
+   2150.7300      0.0000      0.0000      3.8470
+   2151.2800      0.0000      0.0000      3.8410
+   2151.8401      0.0000      0.0000      3.8440
+   2152.3999      0.0000      0.0000      3.8370
+   2152.9500      0.0000      0.0000      3.8410
+   2153.5100      0.0000      0.0000      3.8430
+   2154.0701      0.0000      0.0000      3.8430
+   2154.6201      0.0000      0.0000      3.8480
+   2155.1799      0.0000      0.0000      3.8440
+   2155.7300      0.0000      0.0000      3.8420
+   2156.2900      0.0000      0.0000      3.8850
+   2156.8501      0.0000      0.0000      4.0100
+   2157.3999      0.0000      0.0000      4.1320
+   2157.9600      0.0000      0.0000      4.2160
+   2158.5100      0.0000      0.0000      4.3000
+   2159.0701      0.0000      0.0000      4.3730
+   2159.6299      0.0000      0.0000      4.4130
+   2160.1799      0.0000      0.0000      4.4440
+   2160.7400      0.0000      0.0000      4.4670
+   2161.2900      0.0000      0.0000      4.4640
+   2161.8501      0.0000      0.0000      4.4530
+   2162.4099      0.0000      0.0000      4.4370
+   2162.9600      0.0000      0.0000      4.4170
+   2163.5200      0.0000      0.0000      4.4010
+   2164.0701      0.0000      0.0000      4.3870
+   2164.6299      0.0000      0.0000      4.3640
+   2165.1799      0.0000      0.0000      4.3400
+   2165.7400      0.0000      0.0000      4.3190
+   2166.2900      0.0000      0.0000      4.3010
+   2166.8501      0.0000      0.0000      4.2870
+   2167.4099      0.0000      0.0000      4.2750
+   2167.9600      0.0000      0.0000      4.2640
+   2168.5200      0.0000      0.0000      4.2520
+   2169.0701      0.0000      0.0000      4.2470
+   2169.6299      0.0000      0.0000      4.2430
+   2170.1799      0.0000      0.0000      4.2370
+   2170.7400      0.0000      0.0000      4.2290
+   2171.2900      0.0000      0.0000      4.2030
+   2171.8501      0.0000      0.0000      4.1850
+   2172.3999      0.0000      0.0000      4.2310
+   2172.9600      0.0000      0.0000      4.2670
+   2173.5100      0.0000      0.0000      4.3020
+   2174.0701      0.0000      0.0000      4.3180
+   2174.6201      0.0000      0.0000      4.3290
+   2175.1799      0.0000      0.0000      4.3430
+   2175.7300      0.0000      0.0000     36.2690
+   2176.2900      0.0000      0.0000     36.2690
+   2176.8401      0.0000      0.0000     36.2690
+   2177.3999      0.0000      0.0000     36.2690
+   2177.9500      0.0000      0.0000     36.2690
+   2178.5100      0.0000      0.0000     36.2690
+   2179.0601      0.0000      0.0000     36.2690
+   2179.6101      0.0000      0.0000     36.2690
+   2180.1699      0.0000      0.0000     36.2690
+   2180.7200      0.0000      0.0000     36.2690
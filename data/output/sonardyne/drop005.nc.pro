@@ -0,0 +1,3135 @@
+test_read_store_and_write
+1/9/2016
+9:11:37
+Probe: XBT
+Source: /root/package/data/input/turo/drop005.nc
+      0.6800      0.0000      0.0000     30.4800
+      1.3700      0.0000      0.0000     30.5750
+      2.0500      0.0000      0.0000     30.6020
+      2.7300      0.0000      0.0000     30.6130
+      3.4100      0.0000      0.0000     30.6310
+      4.1000      0.0000      0.0000     30.6350
+      4.7800      0.0000      0.0000     30.6360
+      5.4600      0.0000      0.0000     30.7060
+      6.1400      0.0000      0.0000     30.6780
+      6.8300      0.0000      0.0000     30.5080
+      7.5100      0.0000      0.0000     30.3720
+      8.1900      0.0000      0.0000     30.2800
+      8.8700      0.0000      0.0000     30.2340
+      9.5600      0.0000      0.0000     30.1220
+     10.2400      0.0000      0.0000     30.0980
+     10.9200      0.0000      0.0000     30.0270
+     11.6000      0.0000      0.0000     30.0130
+     12.2800      0.0000      0.0000     30.0140
+     12.9700      0.0000      0.0000     30.0130
+     13.6500      0.0000      0.0000     30.0140
+     14.3300      0.0000      0.0000     30.0240
+     15.0100      0.0000      0.0000     30.0270
+     15.6900      0.0000      0.0000     30.0280
+     16.3800      0.0000      0.0000     30.0380
+     17.0600      0.0000      0.0000     30.0530
+     17.7400      0.0000      0.0000     30.0500
+     18.4200      0.0000      0.0000     30.0520
+     19.1000      0.0000      0.0000     30.0510
+     19.7900      0.0000      0.0000     30.0420
+     20.4700      0.0000      0.0000     30.0320
+     21.1500      0.0000      0.0000     30.0190
+     21.8300      0.0000      0.0000     30.0100
+     22.5100      0.0000      0.0000     30.0000
+     23.1900      0.0000      0.0000     29.9860
+     23.8800      0.0000      0.0000     29.8940
+     24.5600      0.0000      0.0000     29.8510
+     25.2400      0.0000      0.0000     29.8100
+     25.9200      0.0000      0.0000     29.7510
+     26.6000      0.0000      0.0000     29.6750
+     27.2800      0.0000      0.0000     29.5810
+     27.9600      0.0000      0.0000     29.4470
+     28.6500      0.0000      0.0000     29.2670
+     29.3300      0.0000      0.0000     29.1380
+     30.0100      0.0000      0.0000     29.0020
+     30.6900      0.0000      0.0000     28.8360
+     31.3700      0.0000      0.0000     28.7590
+     32.0500      0.0000      0.0000     28.7300
+     32.7300      0.0000      0.0000     28.7040
+     33.4100      0.0000      0.0000     28.6940
+     34.0900      0.0000      0.0000     28.6490
+     34.7800      0.0000      0.0000     28.6150
+     35.4600      0.0000      0.0000     28.5570
+     36.1400      0.0000      0.0000     28.5240
+     36.8200      0.0000      0.0000     28.5020
+     37.5000      0.0000      0.0000     28.4990
+     38.1800      0.0000      0.0000     28.4890
+     38.8600      0.0000      0.0000     28.4890
+     39.5400      0.0000      0.0000     28.4850
+     40.2200      0.0000      0.0000     28.4800
+     40.9000      0.0000      0.0000     28.4760
+     41.5800      0.0000      0.0000     28.4630
+     42.2600      0.0000      0.0000     28.4320
+     42.9400      0.0000      0.0000     28.3420
+     43.6200      0.0000      0.0000     28.2260
+     44.3100      0.0000      0.0000     28.1690
+     44.9900      0.0000      0.0000     28.1140
+     45.6700      0.0000      0.0000     28.0560
+     46.3500      0.0000      0.0000     28.0100
+     47.0300      0.0000      0.0000     27.9630
+     47.7100      0.0000      0.0000     27.9440
+     48.3900      0.0000      0.0000     27.9130
+     49.0700      0.0000      0.0000     27.8770
+     49.7500      0.0000      0.0000     27.8340
+     50.4300      0.0000      0.0000     27.7770
+     51.1100      0.0000      0.0000     27.5950
+     51.7900      0.0000      0.0000     27.2800
+     52.4700      0.0000      0.0000     26.8940
+     53.1500      0.0000      0.0000     26.5140
+     53.8300      0.0000      0.0000     26.3490
+     54.5100      0.0000      0.0000     26.2590
+     55.1900      0.0000      0.0000     26.2120
+     55.8700      0.0000      0.0000     26.1670
+     56.5500      0.0000      0.0000     26.1350
+     57.2300      0.0000      0.0000     26.0900
+     57.9100      0.0000      0.0000     26.0120
+     58.5900      0.0000      0.0000     25.9840
+     59.2700      0.0000      0.0000     25.9680
+     59.9500      0.0000      0.0000     25.9430
+     60.6300      0.0000      0.0000     25.9430
+     61.3000      0.0000      0.0000     25.9240
+     61.9800      0.0000      0.0000     25.9100
+     62.6600      0.0000      0.0000     25.8980
+     63.3400      0.0000      0.0000     25.8890
+     64.0200      0.0000      0.0000     25.8750
+     64.7000      0.0000      0.0000     25.8630
+     65.3800      0.0000      0.0000     25.8380
+     66.0600      0.0000      0.0000     25.8200
+     66.7400      0.0000      0.0000     25.8120
+     67.4200      0.0000      0.0000     25.8080
+     68.1000      0.0000      0.0000     25.8090
+     68.7800      0.0000      0.0000     25.8070
+     69.4600      0.0000      0.0000     25.8010
+     70.1400      0.0000      0.0000     25.7900
+     70.8100      0.0000      0.0000     25.7620
+     71.4900      0.0000      0.0000     25.7440
+     72.1700      0.0000      0.0000     25.7440
+     72.8500      0.0000      0.0000     25.7340
+     73.5300      0.0000      0.0000     25.7240
+     74.2100      0.0000      0.0000     25.7170
+     74.8900      0.0000      0.0000     25.7170
+     75.5700      0.0000      0.0000     25.7110
+     76.2500      0.0000      0.0000     25.7000
+     76.9200      0.0000      0.0000     25.7060
+     77.6000      0.0000      0.0000     25.6850
+     78.2800      0.0000      0.0000     25.6710
+     78.9600      0.0000      0.0000     25.6650
+     79.6400      0.0000      0.0000     25.6630
+     80.3200      0.0000      0.0000     25.6440
+     81.0000      0.0000      0.0000     25.6370
+     81.6700      0.0000      0.0000     25.6460
+     82.3500      0.0000      0.0000     25.6430
+     83.0300      0.0000      0.0000     25.6260
+     83.7100      0.0000      0.0000     25.6070
+     84.3900      0.0000      0.0000     25.5870
+     85.0700      0.0000      0.0000     25.5790
+     85.7400      0.0000      0.0000     25.5380
+     86.4200      0.0000      0.0000     25.5100
+     87.1000      0.0000      0.0000     25.4900
+     87.7800      0.0000      0.0000     25.4870
+     88.4600      0.0000      0.0000     25.4830
+     89.1300      0.0000      0.0000     25.4660
+     89.8100      0.0000      0.0000     25.4300
+     90.4900      0.0000      0.0000     25.4000
+     91.1700      0.0000      0.0000     25.3740
+     91.8500      0.0000      0.0000     25.3350
+     92.5200      0.0000      0.0000     25.2880
+     93.2000      0.0000      0.0000     25.2830
+     93.8800      0.0000      0.0000     25.2810
+     94.5600      0.0000      0.0000     25.2350
+     95.2400      0.0000      0.0000     25.2350
+     95.9100      0.0000      0.0000     25.2040
+     96.5900      0.0000      0.0000     25.1910
+     97.2700      0.0000      0.0000     25.1790
+     97.9500      0.0000      0.0000     25.1150
+     98.6200      0.0000      0.0000     25.1230
+     99.3000      0.0000      0.0000     25.0970
+     99.9800      0.0000      0.0000     25.0110
+    100.6600      0.0000      0.0000     25.0050
+    101.3300      0.0000      0.0000     24.9710
+    102.0100      0.0000      0.0000     24.9330
+    102.6900      0.0000      0.0000     24.8820
+    103.3700      0.0000      0.0000     24.8080
+    104.0400      0.0000      0.0000     24.7430
+    104.7200      0.0000      0.0000     24.7100
+    105.4000      0.0000      0.0000     24.6820
+    106.0700      0.0000      0.0000     24.6580
+    106.7500      0.0000      0.0000     24.6550
+    107.4300      0.0000      0.0000     24.5730
+    108.1100      0.0000      0.0000     24.5140
+    108.7800      0.0000      0.0000     24.5050
+    109.4600      0.0000      0.0000     24.4910
+    110.1400      0.0000      0.0000     24.4220
+    110.8100      0.0000      0.0000     24.3410
+    111.4900      0.0000      0.0000     24.2860
+    112.1700      0.0000      0.0000     24.1420
+    112.8400      0.0000      0.0000     24.1180
+    113.5200      0.0000      0.0000     24.0970
+    114.2000      0.0000      0.0000     24.0550
+    114.8700      0.0000      0.0000     23.9880
+    115.5500      0.0000      0.0000     23.8510
+    116.2300      0.0000      0.0000     23.4920
+    116.9000      0.0000      0.0000     23.1630
+    117.5800      0.0000      0.0000     22.9890
+    118.2600      0.0000      0.0000     22.8780
+    118.9300      0.0000      0.0000     22.7300
+    119.6100      0.0000      0.0000     22.6110
+    120.2900      0.0000      0.0000     22.5470
+    120.9600      0.0000      0.0000     22.5240
+    121.6400      0.0000      0.0000     22.5070
+    122.3100      0.0000      0.0000     22.5000
+    122.9900      0.0000      0.0000     22.4760
+    123.6700      0.0000      0.0000     22.4550
+    124.3400      0.0000      0.0000     22.4280
+    125.0200      0.0000      0.0000     22.3950
+    125.7000      0.0000      0.0000     22.1710
+    126.3700      0.0000      0.0000     21.5650
+    127.0500      0.0000      0.0000     21.2620
+    127.7200      0.0000      0.0000     20.9350
+    128.4000      0.0000      0.0000     20.7790
+    129.0700      0.0000      0.0000     20.7340
+    129.7500      0.0000      0.0000     20.6710
+    130.4300      0.0000      0.0000     20.6520
+    131.1000      0.0000      0.0000     20.6320
+    131.7800      0.0000      0.0000     20.4950
+    132.4500      0.0000      0.0000     20.3840
+    133.1300      0.0000      0.0000     20.1920
+    133.8100      0.0000      0.0000     20.0830
+    134.4800      0.0000      0.0000     20.0400
+    135.1600      0.0000      0.0000     19.9520
+    135.8300      0.0000      0.0000     19.8920
+    136.5100      0.0000      0.0000     19.8520
+    137.1800      0.0000      0.0000     19.7920
+    137.8600      0.0000      0.0000     19.7600
+    138.5300      0.0000      0.0000     19.7310
+    139.2100      0.0000      0.0000     19.7310
+    139.8800      0.0000      0.0000     19.6900
+    140.5600      0.0000      0.0000     19.6650
+    141.2300      0.0000      0.0000     19.6470
+    141.9100      0.0000      0.0000     19.6320
+    142.5900      0.0000      0.0000     19.6230
+    143.2600      0.0000      0.0000     19.5980
+    143.9400      0.0000      0.0000     19.5910
+    144.6100      0.0000      0.0000     19.6060
+    145.2900      0.0000      0.0000     19.6040
+    145.9600      0.0000      0.0000     19.5870
+    146.6400      0.0000      0.0000     19.5880
+    147.3100      0.0000      0.0000     19.5730
+    147.9900      0.0000      0.0000     19.5740
+    148.6600      0.0000      0.0000     19.5720
+    149.3400      0.0000      0.0000     19.5660
+    150.0100      0.0000      0.0000     19.5710
+    150.6800      0.0000      0.0000     19.5630
+    151.3600      0.0000      0.0000     19.5650
+    152.0300      0.0000      0.0000     19.5580
+    152.7100      0.0000      0.0000     19.5370
+    153.3800      0.0000      0.0000     19.5220
+    154.0600      0.0000      0.0000     19.5010
+    154.7300      0.0000      0.0000     19.4950
+    155.4100      0.0000      0.0000     19.4830
+    156.0800      0.0000      0.0000     19.4700
+    156.7600      0.0000      0.0000     19.4630
+    157.4300      0.0000      0.0000     19.4670
+    158.1000      0.0000      0.0000     19.4600
+    158.7800      0.0000      0.0000     19.4500
+    159.4500      0.0000      0.0000     19.4310
+    160.1300      0.0000      0.0000     19.4330
+    160.8000      0.0000      0.0000     19.4350
+    161.4800      0.0000      0.0000     19.4320
+    162.1500      0.0000      0.0000     19.4260
+    162.8200      0.0000      0.0000     19.4300
+    163.5000      0.0000      0.0000     19.4290
+    164.1700      0.0000      0.0000     19.4280
+    164.8500      0.0000      0.0000     19.4330
+    165.5200      0.0000      0.0000     19.4320
+    166.1900      0.0000      0.0000     19.4320
+    166.8700      0.0000      0.0000     19.4320
+    167.5400      0.0000      0.0000     19.4250
+    168.2200      0.0000      0.0000     19.4280
+    168.8900      0.0000      0.0000     19.4330
+    169.5600      0.0000      0.0000     19.4310
+    170.2400      0.0000      0.0000     19.4340
+    170.9100      0.0000      0.0000     19.4320
+    171.5800      0.0000      0.0000     19.4300
+    172.2600      0.0000      0.0000     19.4290
+    172.9300      0.0000      0.0000     19.4280
+    173.6000      0.0000      0.0000     19.4280
+    174.2800      0.0000      0.0000     19.4310
+    174.9500      0.0000      0.0000     19.4280
+    175.6200      0.0000      0.0000     19.4230
+    176.3000      0.0000      0.0000     19.4250
+    176.9700      0.0000      0.0000     19.4230
+    177.6400      0.0000      0.0000     19.4190
+    178.3200      0.0000      0.0000     19.4060
+    178.9900      0.0000      0.0000     19.3990
+    179.6600      0.0000      0.0000     19.3430
+    180.3400      0.0000      0.0000     19.2980
+    181.0100      0.0000      0.0000     19.2840
+    181.6800      0.0000      0.0000     19.2750
+    182.3600      0.0000      0.0000     19.2810
+    183.0300      0.0000      0.0000     19.2750
+    183.7000      0.0000      0.0000     19.2750
+    184.3800      0.0000      0.0000     19.2700
+    185.0500      0.0000      0.0000     19.2700
+    185.7200      0.0000      0.0000     19.2670
+    186.3900      0.0000      0.0000     19.2480
+    187.0700      0.0000      0.0000     19.2150
+    187.7400      0.0000      0.0000     19.1360
+    188.4100      0.0000      0.0000     19.0750
+    189.0800      0.0000      0.0000     19.0250
+    189.7600      0.0000      0.0000     19.0090
+    190.4300      0.0000      0.0000     18.9950
+    191.1000      0.0000      0.0000     18.9660
+    191.7700      0.0000      0.0000     18.9370
+    192.4500      0.0000      0.0000     18.9190
+    193.1200      0.0000      0.0000     18.8970
+    193.7900      0.0000      0.0000     18.8630
+    194.4600      0.0000      0.0000     18.7770
+    195.1400      0.0000      0.0000     18.5850
+    195.8100      0.0000      0.0000     18.4090
+    196.4800      0.0000      0.0000     18.3160
+    197.1500      0.0000      0.0000     18.2820
+    197.8300      0.0000      0.0000     18.2640
+    198.5000      0.0000      0.0000     18.2250
+    199.1700      0.0000      0.0000     18.1620
+    199.8400      0.0000      0.0000     18.0750
+    200.5100      0.0000      0.0000     18.0000
+    201.1900      0.0000      0.0000     17.9640
+    201.8600      0.0000      0.0000     17.8980
+    202.5300      0.0000      0.0000     17.7450
+    203.2000      0.0000      0.0000     17.2750
+    203.8700      0.0000      0.0000     15.8970
+    204.5500      0.0000      0.0000     15.0870
+    205.2200      0.0000      0.0000     14.9250
+    205.8900      0.0000      0.0000     14.8820
+    206.5600      0.0000      0.0000     14.8610
+    207.2300      0.0000      0.0000     14.8510
+    207.9000      0.0000      0.0000     14.8270
+    208.5800      0.0000      0.0000     14.8090
+    209.2500      0.0000      0.0000     14.7930
+    209.9200      0.0000      0.0000     14.7700
+    210.5900      0.0000      0.0000     14.7620
+    211.2600      0.0000      0.0000     14.7540
+    211.9300      0.0000      0.0000     14.7350
+    212.6000      0.0000      0.0000     14.7170
+    213.2800      0.0000      0.0000     14.7100
+    213.9500      0.0000      0.0000     14.6900
+    214.6200      0.0000      0.0000     14.6760
+    215.2900      0.0000      0.0000     14.6650
+    215.9600      0.0000      0.0000     14.6440
+    216.6300      0.0000      0.0000     14.6240
+    217.3000      0.0000      0.0000     14.6110
+    217.9700      0.0000      0.0000     14.5840
+    218.6500      0.0000      0.0000     14.5650
+    219.3200      0.0000      0.0000     14.5230
+    219.9900      0.0000      0.0000     14.4650
+    220.6600      0.0000      0.0000     14.3510
+    221.3300      0.0000      0.0000     14.1210
+    222.0000      0.0000      0.0000     13.6540
+    222.6700      0.0000      0.0000     13.4470
+    223.3400      0.0000      0.0000     13.3710
+    224.0100      0.0000      0.0000     13.3320
+    224.6800      0.0000      0.0000     13.3050
+    225.3500      0.0000      0.0000     13.2810
+    226.0200      0.0000      0.0000     13.2690
+    226.7000      0.0000      0.0000     13.2470
+    227.3700      0.0000      0.0000     13.2310
+    228.0400      0.0000      0.0000     13.1960
+    228.7100      0.0000      0.0000     13.1530
+    229.3800      0.0000      0.0000     13.0990
+    230.0500      0.0000      0.0000     13.0170
+    230.7200      0.0000      0.0000     12.9820
+    231.3900      0.0000      0.0000     12.9220
+    232.0600      0.0000      0.0000     12.8790
+    232.7300      0.0000      0.0000     12.8420
+    233.4000      0.0000      0.0000     12.7390
+    234.0700      0.0000      0.0000     12.6560
+    234.7400      0.0000      0.0000     12.5990
+    235.4100      0.0000      0.0000     12.5670
+    236.0800      0.0000      0.0000     12.5410
+    236.7500      0.0000      0.0000     12.4510
+    237.4200      0.0000      0.0000     12.3650
+    238.0900      0.0000      0.0000     12.2900
+    238.7600      0.0000      0.0000     12.2680
+    239.4300      0.0000      0.0000     12.2720
+    240.1000      0.0000      0.0000     12.2680
+    240.7700      0.0000      0.0000     12.2600
+    241.4400      0.0000      0.0000     12.2460
+    242.1100      0.0000      0.0000     12.2230
+    242.7800      0.0000      0.0000     12.1970
+    243.4500      0.0000      0.0000     12.1650
+    244.1200      0.0000      0.0000     12.1510
+    244.7900      0.0000      0.0000     12.1460
+    245.4600      0.0000      0.0000     12.1460
+    246.1300      0.0000      0.0000     12.1450
+    246.8000      0.0000      0.0000     12.1410
+    247.4700      0.0000      0.0000     12.1320
+    248.1400      0.0000      0.0000     12.1200
+    248.8100      0.0000      0.0000     12.0920
+    249.4800      0.0000      0.0000     12.0870
+    250.1400      0.0000      0.0000     12.0870
+    250.8100      0.0000      0.0000     12.0850
+    251.4800      0.0000      0.0000     12.0720
+    252.1500      0.0000      0.0000     12.0510
+    252.8200      0.0000      0.0000     12.0290
+    253.4900      0.0000      0.0000     11.9970
+    254.1600      0.0000      0.0000     11.9480
+    254.8300      0.0000      0.0000     11.8280
+    255.5000      0.0000      0.0000     11.6760
+    256.1700      0.0000      0.0000     11.3540
+    256.8400      0.0000      0.0000     11.2130
+    257.5000      0.0000      0.0000     11.1790
+    258.1700      0.0000      0.0000     11.1620
+    258.8400      0.0000      0.0000     11.1520
+    259.5100      0.0000      0.0000     11.1470
+    260.1800      0.0000      0.0000     11.1410
+    260.8500      0.0000      0.0000     11.1400
+    261.5200      0.0000      0.0000     11.1290
+    262.1900      0.0000      0.0000     11.1210
+    262.8600      0.0000      0.0000     11.1190
+    263.5200      0.0000      0.0000     11.1200
+    264.1900      0.0000      0.0000     11.1120
+    264.8600      0.0000      0.0000     11.1030
+    265.5300      0.0000      0.0000     11.0920
+    266.2000      0.0000      0.0000     11.0870
+    266.8700      0.0000      0.0000     11.0820
+    267.5300      0.0000      0.0000     11.0570
+    268.2000      0.0000      0.0000     11.0430
+    268.8700      0.0000      0.0000     11.0200
+    269.5400      0.0000      0.0000     11.0120
+    270.2100      0.0000      0.0000     11.0100
+    270.8800      0.0000      0.0000     11.0070
+    271.5400      0.0000      0.0000     11.0060
+    272.2100      0.0000      0.0000     10.9990
+    272.8800      0.0000      0.0000     10.9880
+    273.5500      0.0000      0.0000     10.9860
+    274.2200      0.0000      0.0000     10.9870
+    274.8800      0.0000      0.0000     10.9800
+    275.5500      0.0000      0.0000     10.9730
+    276.2200      0.0000      0.0000     10.9740
+    276.8900      0.0000      0.0000     10.9740
+    277.5600      0.0000      0.0000     10.9730
+    278.2200      0.0000      0.0000     10.9700
+    278.8900      0.0000      0.0000     10.9390
+    279.5600      0.0000      0.0000     10.9180
+    280.2300      0.0000      0.0000     10.9000
+    280.9000      0.0000      0.0000     10.8900
+    281.5600      0.0000      0.0000     10.8740
+    282.2300      0.0000      0.0000     10.8750
+    282.9000      0.0000      0.0000     10.8800
+    283.5700      0.0000      0.0000     10.8960
+    284.2300      0.0000      0.0000     10.8580
+    284.9000      0.0000      0.0000     10.8410
+    285.5700      0.0000      0.0000     10.8180
+    286.2400      0.0000      0.0000     10.8040
+    286.9000      0.0000      0.0000     10.7930
+    287.5700      0.0000      0.0000     10.7650
+    288.2400      0.0000      0.0000     10.7590
+    288.9000      0.0000      0.0000     10.7550
+    289.5700      0.0000      0.0000     10.7470
+    290.2400      0.0000      0.0000     10.7500
+    290.9100      0.0000      0.0000     10.7450
+    291.5700      0.0000      0.0000     10.7500
+    292.2400      0.0000      0.0000     10.7480
+    292.9100      0.0000      0.0000     10.7520
+    293.5700      0.0000      0.0000     10.7410
+    294.2400      0.0000      0.0000     10.7430
+    294.9100      0.0000      0.0000     10.7540
+    295.5700      0.0000      0.0000     10.7490
+    296.2400      0.0000      0.0000     10.7420
+    296.9100      0.0000      0.0000     10.7150
+    297.5800      0.0000      0.0000     10.7070
+    298.2400      0.0000      0.0000     10.6970
+    298.9100      0.0000      0.0000     10.6720
+    299.5800      0.0000      0.0000     10.6540
+    300.2400      0.0000      0.0000     10.6100
+    300.9100      0.0000      0.0000     10.5920
+    301.5800      0.0000      0.0000     10.5970
+    302.2400      0.0000      0.0000     10.5970
+    302.9100      0.0000      0.0000     10.5870
+    303.5700      0.0000      0.0000     10.5790
+    304.2400      0.0000      0.0000     10.5760
+    304.9100      0.0000      0.0000     10.5720
+    305.5700      0.0000      0.0000     10.5620
+    306.2400      0.0000      0.0000     10.5200
+    306.9100      0.0000      0.0000     10.4590
+    307.5700      0.0000      0.0000     10.3750
+    308.2400      0.0000      0.0000     10.2250
+    308.9000      0.0000      0.0000     10.1600
+    309.5700      0.0000      0.0000     10.1280
+    310.2400      0.0000      0.0000     10.1170
+    310.9000      0.0000      0.0000     10.1040
+    311.5700      0.0000      0.0000     10.0960
+    312.2300      0.0000      0.0000     10.0970
+    312.9000      0.0000      0.0000     10.0880
+    313.5700      0.0000      0.0000     10.0750
+    314.2300      0.0000      0.0000     10.0470
+    314.9000      0.0000      0.0000     10.0330
+    315.5600      0.0000      0.0000     10.0210
+    316.2300      0.0000      0.0000     10.0200
+    316.9000      0.0000      0.0000     10.0160
+    317.5600      0.0000      0.0000     10.0240
+    318.2300      0.0000      0.0000     10.0180
+    318.8900      0.0000      0.0000      9.9960
+    319.5600      0.0000      0.0000      9.9860
+    320.2200      0.0000      0.0000      9.9800
+    320.8900      0.0000      0.0000      9.9780
+    321.5500      0.0000      0.0000      9.9730
+    322.2200      0.0000      0.0000      9.9310
+    322.8900      0.0000      0.0000      9.9330
+    323.5500      0.0000      0.0000      9.9220
+    324.2200      0.0000      0.0000      9.9170
+    324.8800      0.0000      0.0000      9.9070
+    325.5500      0.0000      0.0000      9.9080
+    326.2100      0.0000      0.0000      9.9190
+    326.8800      0.0000      0.0000      9.9120
+    327.5400      0.0000      0.0000      9.9010
+    328.2100      0.0000      0.0000      9.8950
+    328.8700      0.0000      0.0000      9.8930
+    329.5400      0.0000      0.0000      9.8890
+    330.2000      0.0000      0.0000      9.8960
+    330.8700      0.0000      0.0000      9.8910
+    331.5300      0.0000      0.0000      9.8870
+    332.2000      0.0000      0.0000      9.8700
+    332.8600      0.0000      0.0000      9.8530
+    333.5300      0.0000      0.0000      9.8420
+    334.1900      0.0000      0.0000      9.8440
+    334.8600      0.0000      0.0000      9.8400
+    335.5200      0.0000      0.0000      9.8410
+    336.1900      0.0000      0.0000      9.8360
+    336.8500      0.0000      0.0000      9.8360
+    337.5100      0.0000      0.0000      9.8400
+    338.1800      0.0000      0.0000      9.8360
+    338.8400      0.0000      0.0000      9.8270
+    339.5100      0.0000      0.0000      9.8300
+    340.1700      0.0000      0.0000      9.8360
+    340.8400      0.0000      0.0000      9.8280
+    341.5000      0.0000      0.0000      9.8320
+    342.1700      0.0000      0.0000      9.8250
+    342.8300      0.0000      0.0000      9.8030
+    343.4900      0.0000      0.0000      9.7970
+    344.1600      0.0000      0.0000      9.7770
+    344.8200      0.0000      0.0000      9.7700
+    345.4900      0.0000      0.0000      9.7540
+    346.1500      0.0000      0.0000      9.7310
+    346.8100      0.0000      0.0000      9.7150
+    347.4800      0.0000      0.0000      9.7040
+    348.1400      0.0000      0.0000      9.6970
+    348.8100      0.0000      0.0000      9.6980
+    349.4700      0.0000      0.0000      9.7010
+    350.1300      0.0000      0.0000      9.6930
+    350.8000      0.0000      0.0000      9.6880
+    351.4600      0.0000      0.0000      9.6630
+    352.1300      0.0000      0.0000      9.6550
+    352.7900      0.0000      0.0000      9.6500
+    353.4500      0.0000      0.0000      9.6470
+    354.1200      0.0000      0.0000      9.6440
+    354.7800      0.0000      0.0000      9.6420
+    355.4400      0.0000      0.0000      9.6370
+    356.1100      0.0000      0.0000      9.6340
+    356.7700      0.0000      0.0000      9.6350
+    357.4400      0.0000      0.0000      9.6320
+    358.1000      0.0000      0.0000      9.6320
+    358.7600      0.0000      0.0000      9.6320
+    359.4300      0.0000      0.0000      9.6320
+    360.0900      0.0000      0.0000      9.6270
+    360.7500      0.0000      0.0000      9.6220
+    361.4200      0.0000      0.0000      9.6130
+    362.0800      0.0000      0.0000      9.6020
+    362.7400      0.0000      0.0000      9.5840
+    363.4000      0.0000      0.0000      9.5570
+    364.0700      0.0000      0.0000      9.5330
+    364.7300      0.0000      0.0000      9.4760
+    365.3900      0.0000      0.0000      9.3470
+    366.0600      0.0000      0.0000      9.2400
+    366.7200      0.0000      0.0000      9.1420
+    367.3800      0.0000      0.0000      9.0480
+    368.0500      0.0000      0.0000      8.9790
+    368.7100      0.0000      0.0000      8.8900
+    369.3700      0.0000      0.0000      8.8380
+    370.0300      0.0000      0.0000      8.8190
+    370.7000      0.0000      0.0000      8.7960
+    371.3600      0.0000      0.0000      8.7700
+    372.0200      0.0000      0.0000      8.7460
+    372.6900      0.0000      0.0000      8.7150
+    373.3500      0.0000      0.0000      8.6620
+    374.0100      0.0000      0.0000      8.6340
+    374.6700      0.0000      0.0000      8.6230
+    375.3400      0.0000      0.0000      8.6090
+    376.0000      0.0000      0.0000      8.5990
+    376.6600      0.0000      0.0000      8.5740
+    377.3200      0.0000      0.0000      8.5570
+    377.9900      0.0000      0.0000      8.5360
+    378.6500      0.0000      0.0000      8.5180
+    379.3100      0.0000      0.0000      8.5040
+    379.9700      0.0000      0.0000      8.4840
+    380.6300      0.0000      0.0000      8.4550
+    381.3000      0.0000      0.0000      8.4460
+    381.9600      0.0000      0.0000      8.4550
+    382.6200      0.0000      0.0000      8.4940
+    383.2800      0.0000      0.0000      8.5500
+    383.9400      0.0000      0.0000      8.6010
+    384.6100      0.0000      0.0000      8.6190
+    385.2700      0.0000      0.0000      8.6100
+    385.9300      0.0000      0.0000      8.5860
+    386.5900      0.0000      0.0000      8.5710
+    387.2500      0.0000      0.0000      8.5700
+    387.9200      0.0000      0.0000      8.5600
+    388.5800      0.0000      0.0000      8.5520
+    389.2400      0.0000      0.0000      8.5280
+    389.9000      0.0000      0.0000      8.4830
+    390.5600      0.0000      0.0000      8.4690
+    391.2200      0.0000      0.0000      8.4780
+    391.8900      0.0000      0.0000      8.4730
+    392.5500      0.0000      0.0000      8.4600
+    393.2100      0.0000      0.0000      8.4530
+    393.8700      0.0000      0.0000      8.4390
+    394.5300      0.0000      0.0000      8.4300
+    395.1900      0.0000      0.0000      8.4320
+    395.8600      0.0000      0.0000      8.4220
+    396.5200      0.0000      0.0000      8.4210
+    397.1800      0.0000      0.0000      8.4190
+    397.8400      0.0000      0.0000      8.4220
+    398.5000      0.0000      0.0000      8.4120
+    399.1600      0.0000      0.0000      8.4160
+    399.8200      0.0000      0.0000      8.4030
+    400.4800      0.0000      0.0000      8.4000
+    401.1400      0.0000      0.0000      8.3990
+    401.8100      0.0000      0.0000      8.4000
+    402.4700      0.0000      0.0000      8.4010
+    403.1300      0.0000      0.0000      8.3880
+    403.7900      0.0000      0.0000      8.3790
+    404.4500      0.0000      0.0000      8.3770
+    405.1100      0.0000      0.0000      8.3610
+    405.7700      0.0000      0.0000      8.3430
+    406.4300      0.0000      0.0000      8.3270
+    407.0900      0.0000      0.0000      8.3170
+    407.7500      0.0000      0.0000      8.2930
+    408.4100      0.0000      0.0000      8.2750
+    409.0800      0.0000      0.0000      8.2670
+    409.7400      0.0000      0.0000      8.2610
+    410.4000      0.0000      0.0000      8.2590
+    411.0600      0.0000      0.0000      8.2590
+    411.7200      0.0000      0.0000      8.2570
+    412.3800      0.0000      0.0000      8.2580
+    413.0400      0.0000      0.0000      8.2560
+    413.7000      0.0000      0.0000      8.2550
+    414.3600      0.0000      0.0000      8.2530
+    415.0200      0.0000      0.0000      8.2530
+    415.6800      0.0000      0.0000      8.2540
+    416.3400      0.0000      0.0000      8.2550
+    417.0000      0.0000      0.0000      8.2580
+    417.6600      0.0000      0.0000      8.2540
+    418.3200      0.0000      0.0000      8.2510
+    418.9800      0.0000      0.0000      8.2500
+    419.6400      0.0000      0.0000      8.2490
+    420.3000      0.0000      0.0000      8.2460
+    420.9600      0.0000      0.0000      8.2430
+    421.6200      0.0000      0.0000      8.2350
+    422.2800      0.0000      0.0000      8.2280
+    422.9400      0.0000      0.0000      8.2240
+    423.6000      0.0000      0.0000      8.2170
+    424.2600      0.0000      0.0000      8.2050
+    424.9200      0.0000      0.0000      8.1890
+    425.5800      0.0000      0.0000      8.1850
+    426.2400      0.0000      0.0000      8.1790
+    426.9000      0.0000      0.0000      8.1770
+    427.5600      0.0000      0.0000      8.1750
+    428.2200      0.0000      0.0000      8.1770
+    428.8800      0.0000      0.0000      8.1690
+    429.5400      0.0000      0.0000      8.1690
+    430.2000      0.0000      0.0000      8.1660
+    430.8600      0.0000      0.0000      8.1660
+    431.5200      0.0000      0.0000      8.1600
+    432.1800      0.0000      0.0000      8.1610
+    432.8300      0.0000      0.0000      8.1660
+    433.4900      0.0000      0.0000      8.1590
+    434.1500      0.0000      0.0000      8.1630
+    434.8100      0.0000      0.0000      8.1570
+    435.4700      0.0000      0.0000      8.1540
+    436.1300      0.0000      0.0000      8.1620
+    436.7900      0.0000      0.0000      8.1540
+    437.4500      0.0000      0.0000      8.1560
+    438.1100      0.0000      0.0000      8.1540
+    438.7700      0.0000      0.0000      8.1500
+    439.4300      0.0000      0.0000      8.1530
+    440.0800      0.0000      0.0000      8.1520
+    440.7400      0.0000      0.0000      8.1430
+    441.4000      0.0000      0.0000      8.1370
+    442.0600      0.0000      0.0000      8.1390
+    442.7200      0.0000      0.0000      8.1360
+    443.3800      0.0000      0.0000      8.1380
+    444.0400      0.0000      0.0000      8.1320
+    444.7000      0.0000      0.0000      8.1300
+    445.3500      0.0000      0.0000      8.1290
+    446.0100      0.0000      0.0000      8.1240
+    446.6700      0.0000      0.0000      8.1210
+    447.3300      0.0000      0.0000      8.1130
+    447.9900      0.0000      0.0000      8.1240
+    448.6500      0.0000      0.0000      8.1220
+    449.3100      0.0000      0.0000      8.1110
+    449.9600      0.0000      0.0000      8.1110
+    450.6200      0.0000      0.0000      8.1130
+    451.2800      0.0000      0.0000      8.1040
+    451.9400      0.0000      0.0000      8.1150
+    452.6000      0.0000      0.0000      8.1010
+    453.2600      0.0000      0.0000      8.0920
+    453.9100      0.0000      0.0000      8.0760
+    454.5700      0.0000      0.0000      8.0650
+    455.2300      0.0000      0.0000      8.0600
+    455.8900      0.0000      0.0000      8.0480
+    456.5500      0.0000      0.0000      8.0370
+    457.2000      0.0000      0.0000      8.0310
+    457.8600      0.0000      0.0000      8.0280
+    458.5200      0.0000      0.0000      8.0090
+    459.1800      0.0000      0.0000      7.9950
+    459.8400      0.0000      0.0000      7.9770
+    460.4900      0.0000      0.0000      7.9560
+    461.1500      0.0000      0.0000      7.9320
+    461.8100      0.0000      0.0000      7.8900
+    462.4700      0.0000      0.0000      7.8510
+    463.1200      0.0000      0.0000      7.8130
+    463.7800      0.0000      0.0000      7.8000
+    464.4400      0.0000      0.0000      7.8090
+    465.1000      0.0000      0.0000      7.8070
+    465.7500      0.0000      0.0000      7.8090
+    466.4100      0.0000      0.0000      7.8060
+    467.0700      0.0000      0.0000      7.8070
+    467.7300      0.0000      0.0000      7.8030
+    468.3800      0.0000      0.0000      7.8120
+    469.0400      0.0000      0.0000      7.8110
+    469.7000      0.0000      0.0000      7.8130
+    470.3600      0.0000      0.0000      7.8090
+    471.0100      0.0000      0.0000      7.8130
+    471.6700      0.0000      0.0000      7.8120
+    472.3300      0.0000      0.0000      7.8110
+    472.9900      0.0000      0.0000      7.8090
+    473.6400      0.0000      0.0000      7.8090
+    474.3000      0.0000      0.0000      7.8080
+    474.9600      0.0000      0.0000      7.8110
+    475.6100      0.0000      0.0000      7.8100
+    476.2700      0.0000      0.0000      7.8150
+    476.9300      0.0000      0.0000      7.8130
+    477.5800      0.0000      0.0000      7.8140
+    478.2400      0.0000      0.0000      7.8170
+    478.9000      0.0000      0.0000      7.8120
+    479.5500      0.0000      0.0000      7.8100
+    480.2100      0.0000      0.0000      7.8060
+    480.8700      0.0000      0.0000      7.8060
+    481.5200      0.0000      0.0000      7.7920
+    482.1800      0.0000      0.0000      7.7830
+    482.8400      0.0000      0.0000      7.7790
+    483.4900      0.0000      0.0000      7.7770
+    484.1500      0.0000      0.0000      7.7690
+    484.8100      0.0000      0.0000      7.7710
+    485.4600      0.0000      0.0000      7.7620
+    486.1200      0.0000      0.0000      7.7520
+    486.7800      0.0000      0.0000      7.7410
+    487.4300      0.0000      0.0000      7.7250
+    488.0900      0.0000      0.0000      7.7070
+    488.7500      0.0000      0.0000      7.6950
+    489.4000      0.0000      0.0000      7.6910
+    490.0600      0.0000      0.0000      7.6890
+    490.7100      0.0000      0.0000      7.6680
+    491.3700      0.0000      0.0000      7.6480
+    492.0300      0.0000      0.0000      7.6420
+    492.6800      0.0000      0.0000      7.6280
+    493.3400      0.0000      0.0000      7.6160
+    493.9900      0.0000      0.0000      7.6210
+    494.6500      0.0000      0.0000      7.6160
+    495.3100      0.0000      0.0000      7.6100
+    495.9600      0.0000      0.0000      7.5940
+    496.6200      0.0000      0.0000      7.5870
+    497.2700      0.0000      0.0000      7.5750
+    497.9300      0.0000      0.0000      7.5450
+    498.5800      0.0000      0.0000      7.5130
+    499.2400      0.0000      0.0000      7.5080
+    499.9000      0.0000      0.0000      7.5000
+    500.5500      0.0000      0.0000      7.5010
+    501.2100      0.0000      0.0000      7.5000
+    501.8600      0.0000      0.0000      7.4960
+    502.5200      0.0000      0.0000      7.4940
+    503.1700      0.0000      0.0000      7.4980
+    503.8300      0.0000      0.0000      7.4940
+    504.4800      0.0000      0.0000      7.4850
+    505.1400      0.0000      0.0000      7.4840
+    505.7900      0.0000      0.0000      7.4870
+    506.4500      0.0000      0.0000      7.4710
+    507.1100      0.0000      0.0000      7.4700
+    507.7600      0.0000      0.0000      7.4690
+    508.4200      0.0000      0.0000      7.4640
+    509.0700      0.0000      0.0000      7.4660
+    509.7300      0.0000      0.0000      7.4640
+    510.3800      0.0000      0.0000      7.4460
+    511.0400      0.0000      0.0000      7.4290
+    511.6900      0.0000      0.0000      7.4170
+    512.3500      0.0000      0.0000      7.4020
+    513.0000      0.0000      0.0000      7.3870
+    513.6600      0.0000      0.0000      7.3730
+    514.3100      0.0000      0.0000      7.3570
+    514.9700      0.0000      0.0000      7.3480
+    515.6200      0.0000      0.0000      7.3440
+    516.2700      0.0000      0.0000      7.3490
+    516.9300      0.0000      0.0000      7.3480
+    517.5800      0.0000      0.0000      7.3500
+    518.2400      0.0000      0.0000      7.3530
+    518.8900      0.0000      0.0000      7.3490
+    519.5500      0.0000      0.0000      7.3430
+    520.2000      0.0000      0.0000      7.3440
+    520.8600      0.0000      0.0000      7.3430
+    521.5100      0.0000      0.0000      7.3500
+    522.1700      0.0000      0.0000      7.3490
+    522.8200      0.0000      0.0000      7.3460
+    523.4700      0.0000      0.0000      7.3430
+    524.1300      0.0000      0.0000      7.3390
+    524.7800      0.0000      0.0000      7.3410
+    525.4400      0.0000      0.0000      7.3380
+    526.0900      0.0000      0.0000      7.3410
+    526.7500      0.0000      0.0000      7.3330
+    527.4000      0.0000      0.0000      7.3320
+    528.0500      0.0000      0.0000      7.3300
+    528.7100      0.0000      0.0000      7.3320
+    529.3600      0.0000      0.0000      7.3330
+    530.0200      0.0000      0.0000      7.3340
+    530.6700      0.0000      0.0000      7.3320
+    531.3200      0.0000      0.0000      7.3280
+    531.9800      0.0000      0.0000      7.3270
+    532.6300      0.0000      0.0000      7.3260
+    533.2800      0.0000      0.0000      7.3260
+    533.9400      0.0000      0.0000      7.3240
+    534.5900      0.0000      0.0000      7.3290
+    535.2500      0.0000      0.0000      7.3260
+    535.9000      0.0000      0.0000      7.3280
+    536.5500      0.0000      0.0000      7.3230
+    537.2100      0.0000      0.0000      7.3200
+    537.8600      0.0000      0.0000      7.3230
+    538.5100      0.0000      0.0000      7.3240
+    539.1700      0.0000      0.0000      7.3240
+    539.8200      0.0000      0.0000      7.3210
+    540.4700      0.0000      0.0000      7.3190
+    541.1300      0.0000      0.0000      7.3240
+    541.7800      0.0000      0.0000      7.3190
+    542.4300      0.0000      0.0000      7.3130
+    543.0900      0.0000      0.0000      7.3060
+    543.7400      0.0000      0.0000      7.3070
+    544.3900      0.0000      0.0000      7.2960
+    545.0500      0.0000      0.0000      7.2840
+    545.7000      0.0000      0.0000      7.2890
+    546.3500      0.0000      0.0000      7.2820
+    547.0100      0.0000      0.0000      7.2830
+    547.6600      0.0000      0.0000      7.2880
+    548.3100      0.0000      0.0000      7.2820
+    548.9600      0.0000      0.0000      7.2910
+    549.6200      0.0000      0.0000      7.2780
+    550.2700      0.0000      0.0000      7.2640
+    550.9200      0.0000      0.0000      7.2460
+    551.5800      0.0000      0.0000      7.2370
+    552.2300      0.0000      0.0000      7.2260
+    552.8800      0.0000      0.0000      7.2230
+    553.5300      0.0000      0.0000      7.2190
+    554.1900      0.0000      0.0000      7.2250
+    554.8400      0.0000      0.0000      7.2240
+    555.4900      0.0000      0.0000      7.2190
+    556.1400      0.0000      0.0000      7.2100
+    556.8000      0.0000      0.0000      7.2170
+    557.4500      0.0000      0.0000      7.2130
+    558.1000      0.0000      0.0000      7.2040
+    558.7500      0.0000      0.0000      7.2050
+    559.4100      0.0000      0.0000      7.2000
+    560.0600      0.0000      0.0000      7.1950
+    560.7100      0.0000      0.0000      7.1870
+    561.3600      0.0000      0.0000      7.1830
+    562.0100      0.0000      0.0000      7.1780
+    562.6700      0.0000      0.0000      7.1700
+    563.3200      0.0000      0.0000      7.1660
+    563.9700      0.0000      0.0000      7.1530
+    564.6200      0.0000      0.0000      7.1500
+    565.2700      0.0000      0.0000      7.1550
+    565.9300      0.0000      0.0000      7.1480
+    566.5800      0.0000      0.0000      7.1380
+    567.2300      0.0000      0.0000      7.1280
+    567.8800      0.0000      0.0000      7.1160
+    568.5300      0.0000      0.0000      7.1180
+    569.1900      0.0000      0.0000      7.1170
+    569.8400      0.0000      0.0000      7.1140
+    570.4900      0.0000      0.0000      7.0920
+    571.1400      0.0000      0.0000      7.0810
+    571.7900      0.0000      0.0000      7.0720
+    572.4400      0.0000      0.0000      7.0590
+    573.1000      0.0000      0.0000      7.0260
+    573.7500      0.0000      0.0000      7.0000
+    574.4000      0.0000      0.0000      6.9900
+    575.0500      0.0000      0.0000      6.9860
+    575.7000      0.0000      0.0000      6.9910
+    576.3500      0.0000      0.0000      6.9880
+    577.0000      0.0000      0.0000      6.9830
+    577.6600      0.0000      0.0000      6.9740
+    578.3100      0.0000      0.0000      6.9730
+    578.9600      0.0000      0.0000      6.9670
+    579.6100      0.0000      0.0000      6.9680
+    580.2600      0.0000      0.0000      6.9590
+    580.9100      0.0000      0.0000      6.9590
+    581.5600      0.0000      0.0000      6.9550
+    582.2100      0.0000      0.0000      6.9500
+    582.8600      0.0000      0.0000      6.9420
+    583.5200      0.0000      0.0000      6.9380
+    584.1700      0.0000      0.0000      6.9430
+    584.8200      0.0000      0.0000      6.9380
+    585.4700      0.0000      0.0000      6.9330
+    586.1200      0.0000      0.0000      6.9350
+    586.7700      0.0000      0.0000      6.9340
+    587.4200      0.0000      0.0000      6.9260
+    588.0700      0.0000      0.0000      6.9100
+    588.7200      0.0000      0.0000      6.8940
+    589.3700      0.0000      0.0000      6.8760
+    590.0200      0.0000      0.0000      6.8650
+    590.6700      0.0000      0.0000      6.8510
+    591.3200      0.0000      0.0000      6.8390
+    591.9700      0.0000      0.0000      6.8400
+    592.6300      0.0000      0.0000      6.8300
+    593.2800      0.0000      0.0000      6.8290
+    593.9300      0.0000      0.0000      6.8030
+    594.5800      0.0000      0.0000      6.7760
+    595.2300      0.0000      0.0000      6.7670
+    595.8800      0.0000      0.0000      6.7640
+    596.5300      0.0000      0.0000      6.7670
+    597.1800      0.0000      0.0000      6.7640
+    597.8300      0.0000      0.0000      6.7610
+    598.4800      0.0000      0.0000      6.7600
+    599.1300      0.0000      0.0000      6.7610
+    599.7800      0.0000      0.0000      6.7640
+    600.4300      0.0000      0.0000      6.7680
+    601.0800      0.0000      0.0000      6.7510
+    601.7300      0.0000      0.0000      6.7510
+    602.3800      0.0000      0.0000      6.7420
+    603.0300      0.0000      0.0000      6.7270
+    603.6800      0.0000      0.0000      6.7150
+    604.3300      0.0000      0.0000      6.7130
+    604.9800      0.0000      0.0000      6.6970
+    605.6300      0.0000      0.0000      6.6880
+    606.2800      0.0000      0.0000      6.6750
+    606.9300      0.0000      0.0000      6.6570
+    607.5800      0.0000      0.0000      6.6540
+    608.2300      0.0000      0.0000      6.6440
+    608.8700      0.0000      0.0000      6.6430
+    609.5200      0.0000      0.0000      6.6390
+    610.1700      0.0000      0.0000      6.6350
+    610.8200      0.0000      0.0000      6.6280
+    611.4700      0.0000      0.0000      6.6150
+    612.1200      0.0000      0.0000      6.6160
+    612.7700      0.0000      0.0000      6.6070
+    613.4200      0.0000      0.0000      6.6020
+    614.0700      0.0000      0.0000      6.6050
+    614.7200      0.0000      0.0000      6.5990
+    615.3700      0.0000      0.0000      6.5630
+    616.0200      0.0000      0.0000      6.5480
+    616.6700      0.0000      0.0000      6.5390
+    617.3200      0.0000      0.0000      6.5370
+    617.9600      0.0000      0.0000      6.5320
+    618.6100      0.0000      0.0000      6.5300
+    619.2600      0.0000      0.0000      6.5200
+    619.9100      0.0000      0.0000      6.5030
+    620.5600      0.0000      0.0000      6.4890
+    621.2100      0.0000      0.0000      6.4870
+    621.8600      0.0000      0.0000      6.4860
+    622.5100      0.0000      0.0000      6.4780
+    623.1600      0.0000      0.0000      6.4760
+    623.8000      0.0000      0.0000      6.4780
+    624.4500      0.0000      0.0000      6.4770
+    625.1000      0.0000      0.0000      6.4760
+    625.7500      0.0000      0.0000      6.4750
+    626.4000      0.0000      0.0000      6.4780
+    627.0500      0.0000      0.0000      6.4730
+    627.7000      0.0000      0.0000      6.4760
+    628.3400      0.0000      0.0000      6.4680
+    628.9900      0.0000      0.0000      6.4740
+    629.6400      0.0000      0.0000      6.4730
+    630.2900      0.0000      0.0000      6.4740
+    630.9400      0.0000      0.0000      6.4660
+    631.5900      0.0000      0.0000      6.4590
+    632.2300      0.0000      0.0000      6.4600
+    632.8800      0.0000      0.0000      6.4590
+    633.5300      0.0000      0.0000      6.4590
+    634.1800      0.0000      0.0000      6.4590
+    634.8300      0.0000      0.0000      6.4490
+    635.4800      0.0000      0.0000      6.4320
+    636.1200      0.0000      0.0000      6.4320
+    636.7700      0.0000      0.0000      6.4250
+    637.4200      0.0000      0.0000      6.4230
+    638.0700      0.0000      0.0000      6.4170
+    638.7100      0.0000      0.0000      6.4120
+    639.3600      0.0000      0.0000      6.4120
+    640.0100      0.0000      0.0000      6.4100
+    640.6600      0.0000      0.0000      6.4060
+    641.3100      0.0000      0.0000      6.3810
+    641.9500      0.0000      0.0000      6.3700
+    642.6000      0.0000      0.0000      6.3570
+    643.2500      0.0000      0.0000      6.3620
+    643.9000      0.0000      0.0000      6.3550
+    644.5400      0.0000      0.0000      6.3490
+    645.1900      0.0000      0.0000      6.3490
+    645.8400      0.0000      0.0000      6.3510
+    646.4900      0.0000      0.0000      6.3460
+    647.1300      0.0000      0.0000      6.3440
+    647.7800      0.0000      0.0000      6.3210
+    648.4300      0.0000      0.0000      6.3040
+    649.0800      0.0000      0.0000      6.2780
+    649.7200      0.0000      0.0000      6.2620
+    650.3700      0.0000      0.0000      6.2540
+    651.0200      0.0000      0.0000      6.2490
+    651.6600      0.0000      0.0000      6.2440
+    652.3100      0.0000      0.0000      6.2410
+    652.9600      0.0000      0.0000      6.2370
+    653.6100      0.0000      0.0000      6.2360
+    654.2500      0.0000      0.0000      6.2320
+    654.9000      0.0000      0.0000      6.2350
+    655.5500      0.0000      0.0000      6.2400
+    656.1900      0.0000      0.0000      6.2380
+    656.8400      0.0000      0.0000      6.2320
+    657.4900      0.0000      0.0000      6.2290
+    658.1300      0.0000      0.0000      6.2370
+    658.7800      0.0000      0.0000      6.2360
+    659.4300      0.0000      0.0000      6.2350
+    660.0700      0.0000      0.0000      6.2350
+    660.7200      0.0000      0.0000      6.2300
+    661.3700      0.0000      0.0000      6.2210
+    662.0100      0.0000      0.0000      6.2200
+    662.6600      0.0000      0.0000      6.2200
+    663.3100      0.0000      0.0000      6.2230
+    663.9500      0.0000      0.0000      6.2290
+    664.6000      0.0000      0.0000      6.2210
+    665.2500      0.0000      0.0000      6.2120
+    665.8900      0.0000      0.0000      6.2010
+    666.5400      0.0000      0.0000      6.2000
+    667.1900      0.0000      0.0000      6.1870
+    667.8300      0.0000      0.0000      6.1810
+    668.4800      0.0000      0.0000      6.1820
+    669.1200      0.0000      0.0000      6.1820
+    669.7700      0.0000      0.0000      6.1790
+    670.4200      0.0000      0.0000      6.1680
+    671.0600      0.0000      0.0000      6.1640
+    671.7100      0.0000      0.0000      6.1630
+    672.3500      0.0000      0.0000      6.1620
+    673.0000      0.0000      0.0000      6.1550
+    673.6500      0.0000      0.0000      6.1480
+    674.2900      0.0000      0.0000      6.1470
+    674.9400      0.0000      0.0000      6.1530
+    675.5800      0.0000      0.0000      6.1420
+    676.2300      0.0000      0.0000      6.1380
+    676.8800      0.0000      0.0000      6.1330
+    677.5200      0.0000      0.0000      6.1310
+    678.1700      0.0000      0.0000      6.1020
+    678.8100      0.0000      0.0000      6.0950
+    679.4600      0.0000      0.0000      6.0920
+    680.1000      0.0000      0.0000      6.0910
+    680.7500      0.0000      0.0000      6.0900
+    681.3900      0.0000      0.0000      6.0810
+    682.0400      0.0000      0.0000      6.0790
+    682.6800      0.0000      0.0000      6.0760
+    683.3300      0.0000      0.0000      6.0790
+    683.9800      0.0000      0.0000      6.0800
+    684.6200      0.0000      0.0000      6.0750
+    685.2700      0.0000      0.0000      6.0750
+    685.9100      0.0000      0.0000      6.0700
+    686.5600      0.0000      0.0000      6.0720
+    687.2000      0.0000      0.0000      6.0710
+    687.8500      0.0000      0.0000      6.0700
+    688.4900      0.0000      0.0000      6.0650
+    689.1400      0.0000      0.0000      6.0640
+    689.7800      0.0000      0.0000      6.0680
+    690.4300      0.0000      0.0000      6.0660
+    691.0700      0.0000      0.0000      6.0550
+    691.7200      0.0000      0.0000      6.0600
+    692.3600      0.0000      0.0000      6.0530
+    693.0100      0.0000      0.0000      6.0510
+    693.6500      0.0000      0.0000      6.0450
+    694.3000      0.0000      0.0000      6.0340
+    694.9400      0.0000      0.0000      6.0370
+    695.5900      0.0000      0.0000      6.0320
+    696.2300      0.0000      0.0000      6.0280
+    696.8700      0.0000      0.0000      6.0200
+    697.5200      0.0000      0.0000      6.0130
+    698.1600      0.0000      0.0000      6.0080
+    698.8100      0.0000      0.0000      5.9960
+    699.4500      0.0000      0.0000      5.9900
+    700.1000      0.0000      0.0000      5.9730
+    700.7400      0.0000      0.0000      5.9770
+    701.3900      0.0000      0.0000      5.9700
+    702.0300      0.0000      0.0000      5.9680
+    702.6700      0.0000      0.0000      5.9610
+    703.3200      0.0000      0.0000      5.9720
+    703.9600      0.0000      0.0000      5.9650
+    704.6100      0.0000      0.0000      5.9670
+    705.2500      0.0000      0.0000      5.9670
+    705.9000      0.0000      0.0000      5.9660
+    706.5400      0.0000      0.0000      5.9630
+    707.1800      0.0000      0.0000      5.9550
+    707.8300      0.0000      0.0000      5.9500
+    708.4700      0.0000      0.0000      5.9510
+    709.1100      0.0000      0.0000      5.9440
+    709.7600      0.0000      0.0000      5.9480
+    710.4000      0.0000      0.0000      5.9440
+    711.0500      0.0000      0.0000      5.9290
+    711.6900      0.0000      0.0000      5.9300
+    712.3300      0.0000      0.0000      5.9320
+    712.9800      0.0000      0.0000      5.9300
+    713.6200      0.0000      0.0000      5.9270
+    714.2600      0.0000      0.0000      5.9250
+    714.9100      0.0000      0.0000      5.9260
+    715.5500      0.0000      0.0000      5.9220
+    716.2000      0.0000      0.0000      5.9170
+    716.8400      0.0000      0.0000      5.9310
+    717.4800      0.0000      0.0000      5.9270
+    718.1300      0.0000      0.0000      5.9190
+    718.7700      0.0000      0.0000      5.9140
+    719.4100      0.0000      0.0000      5.9130
+    720.0600      0.0000      0.0000      5.9100
+    720.7000      0.0000      0.0000      5.9090
+    721.3400      0.0000      0.0000      5.9130
+    721.9900      0.0000      0.0000      5.9100
+    722.6300      0.0000      0.0000      5.9070
+    723.2700      0.0000      0.0000      5.9010
+    723.9100      0.0000      0.0000      5.8960
+    724.5600      0.0000      0.0000      5.8860
+    725.2000      0.0000      0.0000      5.8780
+    725.8400      0.0000      0.0000      5.8780
+    726.4900      0.0000      0.0000      5.8660
+    727.1300      0.0000      0.0000      5.8500
+    727.7700      0.0000      0.0000      5.8520
+    728.4200      0.0000      0.0000      5.8490
+    729.0600      0.0000      0.0000      5.8460
+    729.7000      0.0000      0.0000      5.8410
+    730.3400      0.0000      0.0000      5.8400
+    730.9900      0.0000      0.0000      5.8340
+    731.6300      0.0000      0.0000      5.8320
+    732.2700      0.0000      0.0000      5.8340
+    732.9100      0.0000      0.0000      5.8300
+    733.5600      0.0000      0.0000      5.8300
+    734.2000      0.0000      0.0000      5.8290
+    734.8400      0.0000      0.0000      5.8280
+    735.4800      0.0000      0.0000      5.8300
+    736.1300      0.0000      0.0000      5.8220
+    736.7700      0.0000      0.0000      5.8260
+    737.4100      0.0000      0.0000      5.8220
+    738.0500      0.0000      0.0000      5.8230
+    738.7000      0.0000      0.0000      5.8230
+    739.3400      0.0000      0.0000      5.8160
+    739.9800      0.0000      0.0000      5.8190
+    740.6200      0.0000      0.0000      5.8170
+    741.2600      0.0000      0.0000      5.8180
+    741.9100      0.0000      0.0000      5.8160
+    742.5500      0.0000      0.0000      5.8240
+    743.1900      0.0000      0.0000      5.8190
+    743.8300      0.0000      0.0000      5.8160
+    744.4700      0.0000      0.0000      5.8210
+    745.1200      0.0000      0.0000      5.8210
+    745.7600      0.0000      0.0000      5.8200
+    746.4000      0.0000      0.0000      5.8160
+    747.0400      0.0000      0.0000      5.8280
+    747.6800      0.0000      0.0000      5.8160
+    748.3200      0.0000      0.0000      5.8210
+    748.9700      0.0000      0.0000      5.8200
+    749.6100      0.0000      0.0000      5.8130
+    750.2500      0.0000      0.0000      5.8180
+    750.8900      0.0000      0.0000      5.8190
+    751.5300      0.0000      0.0000      5.8190
+    752.1700      0.0000      0.0000      5.8140
+    752.8200      0.0000      0.0000      5.8180
+    753.4600      0.0000      0.0000      5.8180
+    754.1000      0.0000      0.0000      5.8140
+    754.7400      0.0000      0.0000      5.8070
+    755.3800      0.0000      0.0000      5.8070
+    756.0200      0.0000      0.0000      5.8110
+    756.6600      0.0000      0.0000      5.8040
+    757.3000      0.0000      0.0000      5.7960
+    757.9500      0.0000      0.0000      5.7940
+    758.5900      0.0000      0.0000      5.7920
+    759.2300      0.0000      0.0000      5.7990
+    759.8700      0.0000      0.0000      5.7950
+    760.5100      0.0000      0.0000      5.7940
+    761.1500      0.0000      0.0000      5.7960
+    761.7900      0.0000      0.0000      5.7900
+    762.4300      0.0000      0.0000      5.7910
+    763.0700      0.0000      0.0000      5.7930
+    763.7100      0.0000      0.0000      5.7870
+    764.3500      0.0000      0.0000      5.7820
+    765.0000      0.0000      0.0000      5.7870
+    765.6400      0.0000      0.0000      5.7780
+    766.2800      0.0000      0.0000      5.7720
+    766.9200      0.0000      0.0000      5.7780
+    767.5600      0.0000      0.0000      5.7750
+    768.2000      0.0000      0.0000      5.7680
+    768.8400      0.0000      0.0000      5.7740
+    769.4800      0.0000      0.0000      5.7680
+    770.1200      0.0000      0.0000      5.7710
+    770.7600      0.0000      0.0000      5.7770
+    771.4000      0.0000      0.0000      5.7670
+    772.0400      0.0000      0.0000      5.7680
+    772.6800      0.0000      0.0000      5.7690
+    773.3200      0.0000      0.0000      5.7720
+    773.9600      0.0000      0.0000      5.7700
+    774.6000      0.0000      0.0000      5.7700
+    775.2400      0.0000      0.0000      5.7710
+    775.8800      0.0000      0.0000      5.7720
+    776.5200      0.0000      0.0000      5.7720
+    777.1600      0.0000      0.0000      5.7690
+    777.8000      0.0000      0.0000      5.7680
+    778.4400      0.0000      0.0000      5.7620
+    779.0800      0.0000      0.0000      5.7540
+    779.7200      0.0000      0.0000      5.7480
+    780.3600      0.0000      0.0000      5.7540
+    781.0000      0.0000      0.0000      5.7430
+    781.6400      0.0000      0.0000      5.7410
+    782.2800      0.0000      0.0000      5.7370
+    782.9200      0.0000      0.0000      5.7340
+    783.5600      0.0000      0.0000      5.7300
+    784.2000      0.0000      0.0000      5.7290
+    784.8400      0.0000      0.0000      5.7240
+    785.4800      0.0000      0.0000      5.7140
+    786.1200      0.0000      0.0000      5.7140
+    786.7600      0.0000      0.0000      5.7120
+    787.4000      0.0000      0.0000      5.7080
+    788.0400      0.0000      0.0000      5.7100
+    788.6800      0.0000      0.0000      5.7070
+    789.3200      0.0000      0.0000      5.7060
+    789.9600      0.0000      0.0000      5.6990
+    790.6000      0.0000      0.0000      5.7050
+    791.2300      0.0000      0.0000      5.7060
+    791.8700      0.0000      0.0000      5.7060
+    792.5100      0.0000      0.0000      5.7030
+    793.1500      0.0000      0.0000      5.6960
+    793.7900      0.0000      0.0000      5.6900
+    794.4300      0.0000      0.0000      5.6910
+    795.0700      0.0000      0.0000      5.6870
+    795.7100      0.0000      0.0000      5.6900
+    796.3500      0.0000      0.0000      5.6860
+    796.9900      0.0000      0.0000      5.6850
+    797.6200      0.0000      0.0000      5.6870
+    798.2600      0.0000      0.0000      5.6820
+    798.9000      0.0000      0.0000      5.6790
+    799.5400      0.0000      0.0000      5.6860
+    800.1800      0.0000      0.0000      5.6790
+    800.8200      0.0000      0.0000      5.6750
+    801.4600      0.0000      0.0000      5.6640
+    802.1000      0.0000      0.0000      5.6750
+    802.7300      0.0000      0.0000      5.6780
+    803.3700      0.0000      0.0000      5.6780
+    804.0100      0.0000      0.0000      5.6710
+    804.6500      0.0000      0.0000      5.6700
+    805.2900      0.0000      0.0000      5.6750
+    805.9300      0.0000      0.0000      5.6670
+    806.5700      0.0000      0.0000      5.6670
+    807.2000      0.0000      0.0000      5.6630
+    807.8400      0.0000      0.0000      5.6590
+    808.4800      0.0000      0.0000      5.6580
+    809.1200      0.0000      0.0000      5.6440
+    809.7600      0.0000      0.0000      5.6480
+    810.3900      0.0000      0.0000      5.6520
+    811.0300      0.0000      0.0000      5.6450
+    811.6700      0.0000      0.0000      5.6540
+    812.3100      0.0000      0.0000      5.6490
+    812.9500      0.0000      0.0000      5.6460
+    813.5900      0.0000      0.0000      5.6380
+    814.2200      0.0000      0.0000      5.6430
+    814.8600      0.0000      0.0000      5.6390
+    815.5000      0.0000      0.0000      5.6330
+    816.1400      0.0000      0.0000      5.6350
+    816.7700      0.0000      0.0000      5.6310
+    817.4100      0.0000      0.0000      5.6340
+    818.0500      0.0000      0.0000      5.6330
+    818.6900      0.0000      0.0000      5.6230
+    819.3300      0.0000      0.0000      5.6180
+    819.9600      0.0000      0.0000      5.6120
+    820.6000      0.0000      0.0000      5.6050
+    821.2400      0.0000      0.0000      5.6120
+    821.8800      0.0000      0.0000      5.6030
+    822.5100      0.0000      0.0000      5.5980
+    823.1500      0.0000      0.0000      5.5960
+    823.7900      0.0000      0.0000      5.5950
+    824.4300      0.0000      0.0000      5.5910
+    825.0600      0.0000      0.0000      5.5870
+    825.7000      0.0000      0.0000      5.5880
+    826.3400      0.0000      0.0000      5.5860
+    826.9700      0.0000      0.0000      5.5870
+    827.6100      0.0000      0.0000      5.5810
+    828.2500      0.0000      0.0000      5.5790
+    828.8900      0.0000      0.0000      5.5800
+    829.5200      0.0000      0.0000      5.5780
+    830.1600      0.0000      0.0000      5.5750
+    830.8000      0.0000      0.0000      5.5700
+    831.4300      0.0000      0.0000      5.5730
+    832.0700      0.0000      0.0000      5.5610
+    832.7100      0.0000      0.0000      5.5570
+    833.3400      0.0000      0.0000      5.5570
+    833.9800      0.0000      0.0000      5.5530
+    834.6200      0.0000      0.0000      5.5510
+    835.2500      0.0000      0.0000      5.5520
+    835.8900      0.0000      0.0000      5.5450
+    836.5300      0.0000      0.0000      5.5450
+    837.1600      0.0000      0.0000      5.5380
+    837.8000      0.0000      0.0000      5.5370
+    838.4400      0.0000      0.0000      5.5380
+    839.0700      0.0000      0.0000      5.5300
+    839.7100      0.0000      0.0000      5.5230
+    840.3500      0.0000      0.0000      5.5250
+    840.9800      0.0000      0.0000      5.5220
+    841.6200      0.0000      0.0000      5.5260
+    842.2600      0.0000      0.0000      5.5190
+    842.8900      0.0000      0.0000      5.5250
+    843.5300      0.0000      0.0000      5.5200
+    844.1700      0.0000      0.0000      5.5200
+    844.8000      0.0000      0.0000      5.5160
+    845.4400      0.0000      0.0000      5.5150
+    846.0700      0.0000      0.0000      5.5080
+    846.7100      0.0000      0.0000      5.5070
+    847.3500      0.0000      0.0000      5.5090
+    847.9800      0.0000      0.0000      5.5020
+    848.6200      0.0000      0.0000      5.4970
+    849.2500      0.0000      0.0000      5.4870
+    849.8900      0.0000      0.0000      5.4800
+    850.5300      0.0000      0.0000      5.4630
+    851.1600      0.0000      0.0000      5.4450
+    851.8000      0.0000      0.0000      5.4400
+    852.4300      0.0000      0.0000      5.4320
+    853.0700      0.0000      0.0000      5.4260
+    853.7000      0.0000      0.0000      5.4170
+    854.3400      0.0000      0.0000      5.4180
+    854.9800      0.0000      0.0000      5.4080
+    855.6100      0.0000      0.0000      5.4110
+    856.2500      0.0000      0.0000      5.3990
+    856.8800      0.0000      0.0000      5.3960
+    857.5200      0.0000      0.0000      5.3900
+    858.1500      0.0000      0.0000      5.3730
+    858.7900      0.0000      0.0000      5.3630
+    859.4200      0.0000      0.0000      5.3540
+    860.0600      0.0000      0.0000      5.3360
+    860.6900      0.0000      0.0000      5.3250
+    861.3300      0.0000      0.0000      5.3170
+    861.9600      0.0000      0.0000      5.3150
+    862.6000      0.0000      0.0000      5.3220
+    863.2300      0.0000      0.0000      5.3130
+    863.8700      0.0000      0.0000      5.3180
+    864.5100      0.0000      0.0000      5.3210
+    865.1400      0.0000      0.0000      5.3120
+    865.7800      0.0000      0.0000      5.3200
+    866.4100      0.0000      0.0000      5.3170
+    867.0500      0.0000      0.0000      5.3050
+    867.6800      0.0000      0.0000      5.3040
+    868.3100      0.0000      0.0000      5.3030
+    868.9500      0.0000      0.0000      5.3080
+    869.5800      0.0000      0.0000      5.3070
+    870.2200      0.0000      0.0000      5.3010
+    870.8500      0.0000      0.0000      5.3000
+    871.4900      0.0000      0.0000      5.2980
+    872.1200      0.0000      0.0000      5.2940
+    872.7600      0.0000      0.0000      5.2910
+    873.3900      0.0000      0.0000      5.2880
+    874.0300      0.0000      0.0000      5.2950
+    874.6600      0.0000      0.0000      5.2880
+    875.3000      0.0000      0.0000      5.2900
+    875.9300      0.0000      0.0000      5.2850
+    876.5600      0.0000      0.0000      5.2910
+    877.2000      0.0000      0.0000      5.2940
+    877.8300      0.0000      0.0000      5.2870
+    878.4700      0.0000      0.0000      5.2900
+    879.1000      0.0000      0.0000      5.2930
+    879.7400      0.0000      0.0000      5.2890
+    880.3700      0.0000      0.0000      5.2820
+    881.0000      0.0000      0.0000      5.2880
+    881.6400      0.0000      0.0000      5.2860
+    882.2700      0.0000      0.0000      5.2810
+    882.9100      0.0000      0.0000      5.2840
+    883.5400      0.0000      0.0000      5.2820
+    884.1700      0.0000      0.0000      5.2840
+    884.8100      0.0000      0.0000      5.2880
+    885.4400      0.0000      0.0000      5.2800
+    886.0800      0.0000      0.0000      5.2860
+    886.7100      0.0000      0.0000      5.2850
+    887.3400      0.0000      0.0000      5.2860
+    887.9800      0.0000      0.0000      5.2820
+    888.6100      0.0000      0.0000      5.2850
+    889.2400      0.0000      0.0000      5.2830
+    889.8800      0.0000      0.0000      5.2780
+    890.5100      0.0000      0.0000      5.2800
+    891.1400      0.0000      0.0000      5.2820
+    891.7800      0.0000      0.0000      5.2790
+    892.4100      0.0000      0.0000      5.2840
+    893.0500      0.0000      0.0000      5.2870
+    893.6800      0.0000      0.0000      5.2890
+    894.3100      0.0000      0.0000      5.2860
+    894.9500      0.0000      0.0000      5.2820
+    895.5800      0.0000      0.0000      5.2850
+    896.2100      0.0000      0.0000      5.2870
+    896.8500      0.0000      0.0000      5.2790
+    897.4800      0.0000      0.0000      5.2840
+    898.1100      0.0000      0.0000      5.2770
+    898.7400      0.0000      0.0000      5.2850
+    899.3800      0.0000      0.0000      5.2900
+    900.0100      0.0000      0.0000      5.2840
+    900.6400      0.0000      0.0000      5.2760
+    901.2800      0.0000      0.0000      5.2730
+    901.9100      0.0000      0.0000      5.2640
+    902.5400      0.0000      0.0000      5.2640
+    903.1800      0.0000      0.0000      5.2610
+    903.8100      0.0000      0.0000      5.2640
+    904.4400      0.0000      0.0000      5.2640
+    905.0700      0.0000      0.0000      5.2600
+    905.7100      0.0000      0.0000      5.2610
+    906.3400      0.0000      0.0000      5.2590
+    906.9700      0.0000      0.0000      5.2600
+    907.6000      0.0000      0.0000      5.2580
+    908.2400      0.0000      0.0000      5.2650
+    908.8700      0.0000      0.0000      5.2610
+    909.5000      0.0000      0.0000      5.2610
+    910.1300      0.0000      0.0000      5.2560
+    910.7700      0.0000      0.0000      5.2610
+    911.4000      0.0000      0.0000      5.2580
+    912.0300      0.0000      0.0000      5.2610
+    912.6600      0.0000      0.0000      5.2680
+    913.3000      0.0000      0.0000      5.2640
+    913.9300      0.0000      0.0000      5.2600
+    914.5600      0.0000      0.0000      5.2640
+    915.1900      0.0000      0.0000      5.2590
+    915.8200      0.0000      0.0000      5.2690
+    916.4600      0.0000      0.0000      5.2600
+    917.0900      0.0000      0.0000      5.2630
+    917.7200      0.0000      0.0000      5.2590
+    918.3500      0.0000      0.0000      5.2550
+    918.9800      0.0000      0.0000      5.2600
+    919.6200      0.0000      0.0000      5.2570
+    920.2500      0.0000      0.0000      5.2580
+    920.8800      0.0000      0.0000      5.2600
+    921.5100      0.0000      0.0000      5.2550
+    922.1400      0.0000      0.0000      5.2600
+    922.7800      0.0000      0.0000      5.2620
+    923.4100      0.0000      0.0000      5.2560
+    924.0400      0.0000      0.0000      5.2600
+    924.6700      0.0000      0.0000      5.2530
+    925.3000      0.0000      0.0000      5.2520
+    925.9300      0.0000      0.0000      5.2530
+    926.5600      0.0000      0.0000      5.2570
+    927.2000      0.0000      0.0000      5.2530
+    927.8300      0.0000      0.0000      5.2560
+    928.4600      0.0000      0.0000      5.2540
+    929.0900      0.0000      0.0000      5.2490
+    929.7200      0.0000      0.0000      5.2390
+    930.3500      0.0000      0.0000      5.2420
+    930.9800      0.0000      0.0000      5.2370
+    931.6200      0.0000      0.0000      5.2370
+    932.2500      0.0000      0.0000      5.2210
+    932.8800      0.0000      0.0000      5.2200
+    933.5100      0.0000      0.0000      5.2120
+    934.1400      0.0000      0.0000      5.1990
+    934.7700      0.0000      0.0000      5.1870
+    935.4000      0.0000      0.0000      5.1800
+    936.0300      0.0000      0.0000      5.1750
+    936.6600      0.0000      0.0000      5.1670
+    937.2900      0.0000      0.0000      5.1690
+    937.9300      0.0000      0.0000      5.1670
+    938.5600      0.0000      0.0000      5.1610
+    939.1900      0.0000      0.0000      5.1580
+    939.8200      0.0000      0.0000      5.1530
+    940.4500      0.0000      0.0000      5.1500
+    941.0800      0.0000      0.0000      5.1450
+    941.7100      0.0000      0.0000      5.1470
+    942.3400      0.0000      0.0000      5.1420
+    942.9700      0.0000      0.0000      5.1370
+    943.6000      0.0000      0.0000      5.1430
+    944.2300      0.0000      0.0000      5.1450
+    944.8600      0.0000      0.0000      5.1350
+    945.4900      0.0000      0.0000      5.1280
+    946.1200      0.0000      0.0000      5.1300
+    946.7500      0.0000      0.0000      5.1260
+    947.3800      0.0000      0.0000      5.1260
+    948.0100      0.0000      0.0000      5.1230
+    948.6400      0.0000      0.0000      5.1240
+    949.2700      0.0000      0.0000      5.1180
+    949.9000      0.0000      0.0000      5.1180
+    950.5300      0.0000      0.0000      5.1200
+    951.1600      0.0000      0.0000      5.1180
+    951.7900      0.0000      0.0000      5.1210
+    952.4200      0.0000      0.0000      5.1120
+    953.0500      0.0000      0.0000      5.1170
+    953.6800      0.0000      0.0000      5.1120
+    954.3100      0.0000      0.0000      5.1190
+    954.9400      0.0000      0.0000      5.1130
+    955.5700      0.0000      0.0000      5.1110
+    956.2000      0.0000      0.0000      5.1080
+    956.8300      0.0000      0.0000      5.1030
+    957.4600      0.0000      0.0000      5.1060
+    958.0900      0.0000      0.0000      5.1000
+    958.7200      0.0000      0.0000      5.1010
+    959.3500      0.0000      0.0000      5.0990
+    959.9800      0.0000      0.0000      5.0990
+    960.6100      0.0000      0.0000      5.0980
+    961.2400      0.0000      0.0000      5.0990
+    961.8700      0.0000      0.0000      5.0820
+    962.5000      0.0000      0.0000      5.0800
+    963.1300      0.0000      0.0000      5.0750
+    963.7600      0.0000      0.0000      5.0790
+    964.3900      0.0000      0.0000      5.0780
+    965.0200      0.0000      0.0000      5.0700
+    965.6500      0.0000      0.0000      5.0700
+    966.2800      0.0000      0.0000      5.0710
+    966.9000      0.0000      0.0000      5.0770
+    967.5300      0.0000      0.0000      5.0690
+    968.1600      0.0000      0.0000      5.0620
+    968.7900      0.0000      0.0000      5.0600
+    969.4200      0.0000      0.0000      5.0560
+    970.0500      0.0000      0.0000      5.0580
+    970.6800      0.0000      0.0000      5.0530
+    971.3100      0.0000      0.0000      5.0420
+    971.9400      0.0000      0.0000      5.0370
+    972.5700      0.0000      0.0000      5.0290
+    973.1900      0.0000      0.0000      5.0330
+    973.8200      0.0000      0.0000      5.0330
+    974.4500      0.0000      0.0000      5.0220
+    975.0800      0.0000      0.0000      5.0240
+    975.7100      0.0000      0.0000      5.0090
+    976.3400      0.0000      0.0000      5.0140
+    976.9700      0.0000      0.0000      5.0040
+    977.5900      0.0000      0.0000      4.9740
+    978.2200      0.0000      0.0000      4.9540
+    978.8500      0.0000      0.0000      4.9370
+    979.4800      0.0000      0.0000      4.9280
+    980.1100      0.0000      0.0000      4.9260
+    980.7400      0.0000      0.0000      4.9190
+    981.3700      0.0000      0.0000      4.9190
+    981.9900      0.0000      0.0000      4.9370
+    982.6200      0.0000      0.0000      4.9240
+    983.2500      0.0000      0.0000      4.9200
+    983.8800      0.0000      0.0000      4.9230
+    984.5100      0.0000      0.0000      4.9210
+    985.1300      0.0000      0.0000      4.9230
+    985.7600      0.0000      0.0000      4.9220
+    986.3900      0.0000      0.0000      4.9230
+    987.0200      0.0000      0.0000      4.9200
+    987.6500      0.0000      0.0000      4.9200
+    988.2700      0.0000      0.0000      4.9190
+    988.9000      0.0000      0.0000      4.9220
+    989.5300      0.0000      0.0000      4.9270
+    990.1600      0.0000      0.0000      4.9140
+    990.7900      0.0000      0.0000      4.9200
+    991.4100      0.0000      0.0000      4.9140
+    992.0400      0.0000      0.0000      4.9160
+    992.6700      0.0000      0.0000      4.9150
+    993.3000      0.0000      0.0000      4.9130
+    993.9200      0.0000      0.0000      4.9210
+    994.5500      0.0000      0.0000      4.9190
+    995.1800      0.0000      0.0000      4.9180
+    995.8100      0.0000      0.0000      4.9150
+    996.4300      0.0000      0.0000      4.9160
+    997.0600      0.0000      0.0000      4.9100
+    997.6900      0.0000      0.0000      4.9070
+    998.3200      0.0000      0.0000      4.9180
+    998.9400      0.0000      0.0000      4.9170
+    999.5700      0.0000      0.0000      4.9100
+   1000.2000      0.0000      0.0000      4.9090
+   1000.8300      0.0000      0.0000      4.9060
+   1001.4500      0.0000      0.0000      4.9010
+   1002.0800      0.0000      0.0000      4.9020
+   1002.7100      0.0000      0.0000      4.8960
+   1003.3300      0.0000      0.0000      4.8990
+   1003.9600      0.0000      0.0000      4.9030
+   1004.5900      0.0000      0.0000      4.8980
+   1005.2100      0.0000      0.0000      4.8970
+   1005.8400      0.0000      0.0000      4.8910
+   1006.4700      0.0000      0.0000      4.8930
+   1007.1000      0.0000      0.0000      4.8850
+   1007.7200      0.0000      0.0000      4.8850
+   1008.3500      0.0000      0.0000      4.8830
+   1008.9800      0.0000      0.0000      4.8850
+   1009.6000      0.0000      0.0000      4.8770
+   1010.2300      0.0000      0.0000      4.8740
+   1010.8600      0.0000      0.0000      4.8820
+   1011.4800      0.0000      0.0000      4.8760
+   1012.1100      0.0000      0.0000      4.8730
+   1012.7400      0.0000      0.0000      4.8760
+   1013.3600      0.0000      0.0000      4.8660
+   1013.9900      0.0000      0.0000      4.8700
+   1014.6100      0.0000      0.0000      4.8560
+   1015.2400      0.0000      0.0000      4.8580
+   1015.8700      0.0000      0.0000      4.8550
+   1016.4900      0.0000      0.0000      4.8550
+   1017.1200      0.0000      0.0000      4.8440
+   1017.7500      0.0000      0.0000      4.8360
+   1018.3700      0.0000      0.0000      4.8350
+   1019.0000      0.0000      0.0000      4.8290
+   1019.6200      0.0000      0.0000      4.8250
+   1020.2500      0.0000      0.0000      4.8210
+   1020.8800      0.0000      0.0000      4.8130
+   1021.5000      0.0000      0.0000      4.8070
+   1022.1300      0.0000      0.0000      4.8030
+   1022.7500      0.0000      0.0000      4.8000
+   1023.3800      0.0000      0.0000      4.7940
+   1024.0100      0.0000      0.0000      4.7840
+   1024.6300      0.0000      0.0000      4.7700
+   1025.2600      0.0000      0.0000      4.7600
+   1025.8800      0.0000      0.0000      4.7620
+   1026.5100      0.0000      0.0000      4.7570
+   1027.1300      0.0000      0.0000      4.7600
+   1027.7600      0.0000      0.0000      4.7580
+   1028.3900      0.0000      0.0000      4.7600
+   1029.0100      0.0000      0.0000      4.7600
+   1029.6400      0.0000      0.0000      4.7600
+   1030.2600      0.0000      0.0000      4.7620
+   1030.8900      0.0000      0.0000      4.7660
+   1031.5100      0.0000      0.0000      4.7590
+   1032.1400      0.0000      0.0000      4.7520
+   1032.7600      0.0000      0.0000      4.7550
+   1033.3900      0.0000      0.0000      4.7520
+   1034.0100      0.0000      0.0000      4.7600
+   1034.6400      0.0000      0.0000      4.7610
+   1035.2700      0.0000      0.0000      4.7540
+   1035.8900      0.0000      0.0000      4.7530
+   1036.5200      0.0000      0.0000      4.7580
+   1037.1400      0.0000      0.0000      4.7550
+   1037.7700      0.0000      0.0000      4.7490
+   1038.3900      0.0000      0.0000      4.7480
+   1039.0200      0.0000      0.0000      4.7450
+   1039.6400      0.0000      0.0000      4.7420
+   1040.2700      0.0000      0.0000      4.7350
+   1040.8900      0.0000      0.0000      4.7420
+   1041.5200      0.0000      0.0000      4.7390
+   1042.1400      0.0000      0.0000      4.7390
+   1042.7600      0.0000      0.0000      4.7370
+   1043.3900      0.0000      0.0000      4.7400
+   1044.0100      0.0000      0.0000      4.7380
+   1044.6400      0.0000      0.0000      4.7340
+   1045.2600      0.0000      0.0000      4.7210
+   1045.8900      0.0000      0.0000      4.7260
+   1046.5100      0.0000      0.0000      4.7230
+   1047.1400      0.0000      0.0000      4.7210
+   1047.7600      0.0000      0.0000      4.7150
+   1048.3900      0.0000      0.0000      4.7190
+   1049.0100      0.0000      0.0000      4.7130
+   1049.6300      0.0000      0.0000      4.7110
+   1050.2600      0.0000      0.0000      4.7080
+   1050.8800      0.0000      0.0000      4.7040
+   1051.5100      0.0000      0.0000      4.7020
+   1052.1300      0.0000      0.0000      4.7000
+   1052.7600      0.0000      0.0000      4.7010
+   1053.3800      0.0000      0.0000      4.6930
+   1054.0000      0.0000      0.0000      4.6900
+   1054.6300      0.0000      0.0000      4.6790
+   1055.2500      0.0000      0.0000      4.6900
+   1055.8800      0.0000      0.0000      4.6920
+   1056.5000      0.0000      0.0000      4.6800
+   1057.1200      0.0000      0.0000      4.6740
+   1057.7500      0.0000      0.0000      4.6760
+   1058.3700      0.0000      0.0000      4.6750
+   1059.0000      0.0000      0.0000      4.6720
+   1059.6200      0.0000      0.0000      4.6780
+   1060.2400      0.0000      0.0000      4.6690
+   1060.8700      0.0000      0.0000      4.6710
+   1061.4900      0.0000      0.0000      4.6590
+   1062.1100      0.0000      0.0000      4.6560
+   1062.7400      0.0000      0.0000      4.6490
+   1063.3600      0.0000      0.0000      4.6490
+   1063.9800      0.0000      0.0000      4.6460
+   1064.6100      0.0000      0.0000      4.6360
+   1065.2300      0.0000      0.0000      4.6410
+   1065.8600      0.0000      0.0000      4.6470
+   1066.4800      0.0000      0.0000      4.6400
+   1067.1000      0.0000      0.0000      4.6360
+   1067.7300      0.0000      0.0000      4.6330
+   1068.3500      0.0000      0.0000      4.6400
+   1068.9700      0.0000      0.0000      4.6320
+   1069.6000      0.0000      0.0000      4.6200
+   1070.2200      0.0000      0.0000      4.6320
+   1070.8400      0.0000      0.0000      4.6290
+   1071.4600      0.0000      0.0000      4.6240
+   1072.0900      0.0000      0.0000      4.6180
+   1072.7100      0.0000      0.0000      4.6230
+   1073.3300      0.0000      0.0000      4.6220
+   1073.9600      0.0000      0.0000      4.6180
+   1074.5800      0.0000      0.0000      4.6230
+   1075.2000      0.0000      0.0000      4.6160
+   1075.8199      0.0000      0.0000      4.6110
+   1076.4500      0.0000      0.0000      4.6170
+   1077.0699      0.0000      0.0000      4.6180
+   1077.6899      0.0000      0.0000      4.6210
+   1078.3199      0.0000      0.0000      4.6110
+   1078.9399      0.0000      0.0000      4.6190
+   1079.5601      0.0000      0.0000      4.6060
+   1080.1801      0.0000      0.0000      4.6120
+   1080.8101      0.0000      0.0000      4.6100
+   1081.4301      0.0000      0.0000      4.6110
+   1082.0500      0.0000      0.0000      4.6040
+   1082.6700      0.0000      0.0000      4.6040
+   1083.3000      0.0000      0.0000      4.6110
+   1083.9200      0.0000      0.0000      4.6000
+   1084.5400      0.0000      0.0000      4.6060
+   1085.1600      0.0000      0.0000      4.6030
+   1085.7900      0.0000      0.0000      4.5980
+   1086.4100      0.0000      0.0000      4.5980
+   1087.0300      0.0000      0.0000      4.6020
+   1087.6500      0.0000      0.0000      4.5950
+   1088.2700      0.0000      0.0000      4.5920
+   1088.9000      0.0000      0.0000      4.5940
+   1089.5200      0.0000      0.0000      4.5930
+   1090.1400      0.0000      0.0000      4.5870
+   1090.7600      0.0000      0.0000      4.5810
+   1091.3800      0.0000      0.0000      4.5830
+   1092.0100      0.0000      0.0000      4.5820
+   1092.6300      0.0000      0.0000      4.5790
+   1093.2500      0.0000      0.0000      4.5830
+   1093.8700      0.0000      0.0000      4.5820
+   1094.4900      0.0000      0.0000      4.5900
+   1095.1100      0.0000      0.0000      4.5820
+   1095.7400      0.0000      0.0000      4.5850
+   1096.3600      0.0000      0.0000      4.5830
+   1096.9800      0.0000      0.0000      4.5830
+   1097.6000      0.0000      0.0000      4.5880
+   1098.2200      0.0000      0.0000      4.5780
+   1098.8400      0.0000      0.0000      4.5720
+   1099.4700      0.0000      0.0000      4.5840
+   1100.0900      0.0000      0.0000      4.5790
+   1100.7100      0.0000      0.0000      4.5730
+   1101.3300      0.0000      0.0000      4.5780
+   1101.9500      0.0000      0.0000      4.5750
+   1102.5699      0.0000      0.0000      4.5730
+   1103.1899      0.0000      0.0000      4.5620
+   1103.8101      0.0000      0.0000      4.5690
+   1104.4399      0.0000      0.0000      4.5690
+   1105.0601      0.0000      0.0000      4.5650
+   1105.6801      0.0000      0.0000      4.5550
+   1106.3000      0.0000      0.0000      4.5630
+   1106.9200      0.0000      0.0000      4.5530
+   1107.5400      0.0000      0.0000      4.5490
+   1108.1600      0.0000      0.0000      4.5440
+   1108.7800      0.0000      0.0000      4.5460
+   1109.4000      0.0000      0.0000      4.5430
+   1110.0200      0.0000      0.0000      4.5420
+   1110.6500      0.0000      0.0000      4.5470
+   1111.2700      0.0000      0.0000      4.5470
+   1111.8900      0.0000      0.0000      4.5450
+   1112.5100      0.0000      0.0000      4.5420
+   1113.1300      0.0000      0.0000      4.5370
+   1113.7500      0.0000      0.0000      4.5380
+   1114.3700      0.0000      0.0000      4.5360
+   1114.9900      0.0000      0.0000      4.5320
+   1115.6100      0.0000      0.0000      4.5300
+   1116.2300      0.0000      0.0000      4.5310
+   1116.8500      0.0000      0.0000      4.5310
+   1117.4700      0.0000      0.0000      4.5270
+   1118.0900      0.0000      0.0000      4.5220
+   1118.7100      0.0000      0.0000      4.5250
+   1119.3300      0.0000      0.0000      4.5240
+   1119.9500      0.0000      0.0000      4.5160
+   1120.5699      0.0000      0.0000      4.5180
+   1121.1899      0.0000      0.0000      4.5050
+   1121.8101      0.0000      0.0000      4.5020
+   1122.4301      0.0000      0.0000      4.5020
+   1123.0500      0.0000      0.0000      4.5010
+   1123.6700      0.0000      0.0000      4.5000
+   1124.2900      0.0000      0.0000      4.4950
+   1124.9100      0.0000      0.0000      4.4960
+   1125.5300      0.0000      0.0000      4.4960
+   1126.1500      0.0000      0.0000      4.4950
+   1126.7700      0.0000      0.0000      4.4970
+   1127.3900      0.0000      0.0000      4.4910
+   1128.0100      0.0000      0.0000      4.4850
+   1128.6300      0.0000      0.0000      4.4920
+   1129.2500      0.0000      0.0000      4.4930
+   1129.8700      0.0000      0.0000      4.4900
+   1130.4900      0.0000      0.0000      4.4880
+   1131.1100      0.0000      0.0000      4.4880
+   1131.7300      0.0000      0.0000      4.4850
+   1132.3500      0.0000      0.0000      4.4810
+   1132.9700      0.0000      0.0000      4.4790
+   1133.5900      0.0000      0.0000      4.4750
+   1134.2100      0.0000      0.0000      4.4750
+   1134.8300      0.0000      0.0000      4.4650
+   1135.4500      0.0000      0.0000      4.4570
+   1136.0699      0.0000      0.0000      4.4600
+   1136.6899      0.0000      0.0000      4.4640
+   1137.3101      0.0000      0.0000      4.4640
+   1137.9200      0.0000      0.0000      4.4560
+   1138.5400      0.0000      0.0000      4.4540
+   1139.1600      0.0000      0.0000      4.4550
+   1139.7800      0.0000      0.0000      4.4490
+   1140.4000      0.0000      0.0000      4.4510
+   1141.0200      0.0000      0.0000      4.4390
+   1141.6400      0.0000      0.0000      4.4450
+   1142.2600      0.0000      0.0000      4.4420
+   1142.8800      0.0000      0.0000      4.4440
+   1143.5000      0.0000      0.0000      4.4330
+   1144.1100      0.0000      0.0000      4.4320
+   1144.7300      0.0000      0.0000      4.4350
+   1145.3500      0.0000      0.0000      4.4330
+   1145.9700      0.0000      0.0000      4.4230
+   1146.5900      0.0000      0.0000      4.4350
+   1147.2100      0.0000      0.0000      4.4330
+   1147.8300      0.0000      0.0000      4.4270
+   1148.4399      0.0000      0.0000      4.4310
+   1149.0601      0.0000      0.0000      4.4270
+   1149.6801      0.0000      0.0000      4.4260
+   1150.3000      0.0000      0.0000      4.4260
+   1150.9200      0.0000      0.0000      4.4220
+   1151.5400      0.0000      0.0000      4.4290
+   1152.1600      0.0000      0.0000      4.4280
+   1152.7700      0.0000      0.0000      4.4180
+   1153.3900      0.0000      0.0000      4.4180
+   1154.0100      0.0000      0.0000      4.4380
+   1154.6300      0.0000      0.0000      4.4260
+   1155.2500      0.0000      0.0000      4.4190
+   1155.8600      0.0000      0.0000      4.4220
+   1156.4800      0.0000      0.0000      4.4190
+   1157.1000      0.0000      0.0000      4.4210
+   1157.7200      0.0000      0.0000      4.4150
+   1158.3400      0.0000      0.0000      4.4170
+   1158.9600      0.0000      0.0000      4.4120
+   1159.5699      0.0000      0.0000      4.4150
+   1160.1899      0.0000      0.0000      4.4070
+   1160.8101      0.0000      0.0000      4.4120
+   1161.4301      0.0000      0.0000      4.4180
+   1162.0400      0.0000      0.0000      4.4110
+   1162.6600      0.0000      0.0000      4.4120
+   1163.2800      0.0000      0.0000      4.4080
+   1163.9000      0.0000      0.0000      4.4130
+   1164.5200      0.0000      0.0000      4.4010
+   1165.1300      0.0000      0.0000      4.4020
+   1165.7500      0.0000      0.0000      4.3990
+   1166.3700      0.0000      0.0000      4.4100
+   1166.9900      0.0000      0.0000      4.3970
+   1167.6000      0.0000      0.0000      4.4010
+   1168.2200      0.0000      0.0000      4.4020
+   1168.8400      0.0000      0.0000      4.3990
+   1169.4500      0.0000      0.0000      4.4060
+   1170.0699      0.0000      0.0000      4.3940
+   1170.6899      0.0000      0.0000      4.4030
+   1171.3101      0.0000      0.0000      4.4060
+   1171.9200      0.0000      0.0000      4.3990
+   1172.5400      0.0000      0.0000      4.3970
+   1173.1600      0.0000      0.0000      4.3990
+   1173.7800      0.0000      0.0000      4.3940
+   1174.3900      0.0000      0.0000      4.3850
+   1175.0100      0.0000      0.0000      4.3880
+   1175.6300      0.0000      0.0000      4.3810
+   1176.2400      0.0000      0.0000      4.3790
+   1176.8600      0.0000      0.0000      4.3870
+   1177.4800      0.0000      0.0000      4.3850
+   1178.0900      0.0000      0.0000      4.3780
+   1178.7100      0.0000      0.0000      4.3800
+   1179.3300      0.0000      0.0000      4.3790
+   1179.9399      0.0000      0.0000      4.3790
+   1180.5601      0.0000      0.0000      4.3800
+   1181.1801      0.0000      0.0000      4.3800
+   1181.7900      0.0000      0.0000      4.3800
+   1182.4100      0.0000      0.0000      4.3790
+   1183.0300      0.0000      0.0000      4.3690
+   1183.6400      0.0000      0.0000      4.3740
+   1184.2600      0.0000      0.0000      4.3790
+   1184.8800      0.0000      0.0000      4.3740
+   1185.4900      0.0000      0.0000      4.3680
+   1186.1100      0.0000      0.0000      4.3750
+   1186.7300      0.0000      0.0000      4.3600
+   1187.3400      0.0000      0.0000      4.3650
+   1187.9600      0.0000      0.0000      4.3640
+   1188.5699      0.0000      0.0000      4.3530
+   1189.1899      0.0000      0.0000      4.3540
+   1189.8101      0.0000      0.0000      4.3530
+   1190.4200      0.0000      0.0000      4.3540
+   1191.0400      0.0000      0.0000      4.3510
+   1191.6500      0.0000      0.0000      4.3560
+   1192.2700      0.0000      0.0000      4.3510
+   1192.8900      0.0000      0.0000      4.3490
+   1193.5000      0.0000      0.0000      4.3520
+   1194.1200      0.0000      0.0000      4.3560
+   1194.7300      0.0000      0.0000      4.3440
+   1195.3500      0.0000      0.0000      4.3520
+   1195.9700      0.0000      0.0000      4.3500
+   1196.5800      0.0000      0.0000      4.3420
+   1197.2000      0.0000      0.0000      4.3350
+   1197.8101      0.0000      0.0000      4.3260
+   1198.4301      0.0000      0.0000      4.3250
+   1199.0400      0.0000      0.0000      4.3270
+   1199.6600      0.0000      0.0000      4.3210
+   1200.2800      0.0000      0.0000      4.3220
+   1200.8900      0.0000      0.0000      4.3280
+   1201.5100      0.0000      0.0000      4.3240
+   1202.1200      0.0000      0.0000      4.3220
+   1202.7400      0.0000      0.0000      4.3230
+   1203.3500      0.0000      0.0000      4.3220
+   1203.9700      0.0000      0.0000      4.3140
+   1204.5800      0.0000      0.0000      4.3300
+   1205.2000      0.0000      0.0000      4.3230
+   1205.8101      0.0000      0.0000      4.3200
+   1206.4301      0.0000      0.0000      4.3180
+   1207.0400      0.0000      0.0000      4.3220
+   1207.6600      0.0000      0.0000      4.3220
+   1208.2700      0.0000      0.0000      4.3210
+   1208.8900      0.0000      0.0000      4.3200
+   1209.5000      0.0000      0.0000      4.3120
+   1210.1200      0.0000      0.0000      4.3200
+   1210.7300      0.0000      0.0000      4.3150
+   1211.3500      0.0000      0.0000      4.3150
+   1211.9600      0.0000      0.0000      4.3160
+   1212.5800      0.0000      0.0000      4.3190
+   1213.1899      0.0000      0.0000      4.3150
+   1213.8101      0.0000      0.0000      4.3170
+   1214.4200      0.0000      0.0000      4.3110
+   1215.0400      0.0000      0.0000      4.3180
+   1215.6500      0.0000      0.0000      4.3180
+   1216.2700      0.0000      0.0000      4.3160
+   1216.8800      0.0000      0.0000      4.3270
+   1217.4900      0.0000      0.0000      4.3200
+   1218.1100      0.0000      0.0000      4.3130
+   1218.7200      0.0000      0.0000      4.3120
+   1219.3400      0.0000      0.0000      4.3160
+   1219.9500      0.0000      0.0000      4.3180
+   1220.5699      0.0000      0.0000      4.3110
+   1221.1801      0.0000      0.0000      4.3160
+   1221.8000      0.0000      0.0000      4.3120
+   1222.4100      0.0000      0.0000      4.3140
+   1223.0200      0.0000      0.0000      4.3140
+   1223.6400      0.0000      0.0000      4.3110
+   1224.2500      0.0000      0.0000      4.3170
+   1224.8700      0.0000      0.0000      4.3080
+   1225.4800      0.0000      0.0000      4.3180
+   1226.0900      0.0000      0.0000      4.3140
+   1226.7100      0.0000      0.0000      4.3150
+   1227.3199      0.0000      0.0000      4.3130
+   1227.9399      0.0000      0.0000      4.3170
+   1228.5500      0.0000      0.0000      4.3100
+   1229.1600      0.0000      0.0000      4.3100
+   1229.7800      0.0000      0.0000      4.3130
+   1230.3900      0.0000      0.0000      4.3170
+   1231.0000      0.0000      0.0000      4.3130
+   1231.6200      0.0000      0.0000      4.3110
+   1232.2300      0.0000      0.0000      4.3090
+   1232.8500      0.0000      0.0000      4.3090
+   1233.4600      0.0000      0.0000      4.3080
+   1234.0699      0.0000      0.0000      4.3160
+   1234.6899      0.0000      0.0000      4.3120
+   1235.3000      0.0000      0.0000      4.3100
+   1235.9100      0.0000      0.0000      4.3060
+   1236.5300      0.0000      0.0000      4.3110
+   1237.1400      0.0000      0.0000      4.3060
+   1237.7500      0.0000      0.0000      4.3080
+   1238.3700      0.0000      0.0000      4.3080
+   1238.9800      0.0000      0.0000      4.3110
+   1239.5900      0.0000      0.0000      4.3020
+   1240.2100      0.0000      0.0000      4.2990
+   1240.8199      0.0000      0.0000      4.3020
+   1241.4301      0.0000      0.0000      4.2990
+   1242.0400      0.0000      0.0000      4.2890
+   1242.6600      0.0000      0.0000      4.2900
+   1243.2700      0.0000      0.0000      4.2920
+   1243.8800      0.0000      0.0000      4.2910
+   1244.5000      0.0000      0.0000      4.2920
+   1245.1100      0.0000      0.0000      4.2900
+   1245.7200      0.0000      0.0000      4.2950
+   1246.3300      0.0000      0.0000      4.2850
+   1246.9500      0.0000      0.0000      4.2900
+   1247.5601      0.0000      0.0000      4.2900
+   1248.1700      0.0000      0.0000      4.2880
+   1248.7900      0.0000      0.0000      4.2880
+   1249.4000      0.0000      0.0000      4.2880
+   1250.0100      0.0000      0.0000      4.2830
+   1250.6200      0.0000      0.0000      4.2810
+   1251.2400      0.0000      0.0000      4.2790
+   1251.8500      0.0000      0.0000      4.2700
+   1252.4600      0.0000      0.0000      4.2790
+   1253.0699      0.0000      0.0000      4.2680
+   1253.6899      0.0000      0.0000      4.2710
+   1254.3000      0.0000      0.0000      4.2660
+   1254.9100      0.0000      0.0000      4.2630
+   1255.5200      0.0000      0.0000      4.2730
+   1256.1300      0.0000      0.0000      4.2630
+   1256.7500      0.0000      0.0000      4.2700
+   1257.3600      0.0000      0.0000      4.2750
+   1257.9700      0.0000      0.0000      4.2600
+   1258.5800      0.0000      0.0000      4.2660
+   1259.1899      0.0000      0.0000      4.2620
+   1259.8101      0.0000      0.0000      4.2600
+   1260.4200      0.0000      0.0000      4.2600
+   1261.0300      0.0000      0.0000      4.2620
+   1261.6400      0.0000      0.0000      4.2610
+   1262.2500      0.0000      0.0000      4.2600
+   1262.8700      0.0000      0.0000      4.2520
+   1263.4800      0.0000      0.0000      4.2490
+   1264.0900      0.0000      0.0000      4.2620
+   1264.7000      0.0000      0.0000      4.2490
+   1265.3101      0.0000      0.0000      4.2530
+   1265.9200      0.0000      0.0000      4.2440
+   1266.5400      0.0000      0.0000      4.2600
+   1267.1500      0.0000      0.0000      4.2410
+   1267.7600      0.0000      0.0000      4.2470
+   1268.3700      0.0000      0.0000      4.2550
+   1268.9800      0.0000      0.0000      4.2500
+   1269.5900      0.0000      0.0000      4.2500
+   1270.2100      0.0000      0.0000      4.2480
+   1270.8199      0.0000      0.0000      4.2540
+   1271.4301      0.0000      0.0000      4.2460
+   1272.0400      0.0000      0.0000      4.2420
+   1272.6500      0.0000      0.0000      4.2490
+   1273.2600      0.0000      0.0000      4.2500
+   1273.8700      0.0000      0.0000      4.2410
+   1274.4800      0.0000      0.0000      4.2490
+   1275.0900      0.0000      0.0000      4.2450
+   1275.7100      0.0000      0.0000      4.2490
+   1276.3199      0.0000      0.0000      4.2490
+   1276.9301      0.0000      0.0000      4.2400
+   1277.5400      0.0000      0.0000      4.2480
+   1278.1500      0.0000      0.0000      4.2410
+   1278.7600      0.0000      0.0000      4.2420
+   1279.3700      0.0000      0.0000      4.2440
+   1279.9800      0.0000      0.0000      4.2440
+   1280.5900      0.0000      0.0000      4.2380
+   1281.2000      0.0000      0.0000      4.2440
+   1281.8101      0.0000      0.0000      4.2460
+   1282.4200      0.0000      0.0000      4.2480
+   1283.0400      0.0000      0.0000      4.2420
+   1283.6500      0.0000      0.0000      4.2470
+   1284.2600      0.0000      0.0000      4.2450
+   1284.8700      0.0000      0.0000      4.2430
+   1285.4800      0.0000      0.0000      4.2410
+   1286.0900      0.0000      0.0000      4.2450
+   1286.7000      0.0000      0.0000      4.2410
+   1287.3101      0.0000      0.0000      4.2440
+   1287.9200      0.0000      0.0000      4.2410
+   1288.5300      0.0000      0.0000      4.2410
+   1289.1400      0.0000      0.0000      4.2440
+   1289.7500      0.0000      0.0000      4.2460
+   1290.3600      0.0000      0.0000      4.2410
+   1290.9700      0.0000      0.0000      4.2460
+   1291.5800      0.0000      0.0000      4.2470
+   1292.1899      0.0000      0.0000      4.2420
+   1292.8000      0.0000      0.0000      4.2450
+   1293.4100      0.0000      0.0000      4.2420
+   1294.0200      0.0000      0.0000      4.2420
+   1294.6300      0.0000      0.0000      4.2420
+   1295.2400      0.0000      0.0000      4.2460
+   1295.8500      0.0000      0.0000      4.2450
+   1296.4600      0.0000      0.0000      4.2460
+   1297.0699      0.0000      0.0000      4.2440
+   1297.6801      0.0000      0.0000      4.2450
+   1298.2900      0.0000      0.0000      4.2420
+   1298.9000      0.0000      0.0000      4.2440
+   1299.5100      0.0000      0.0000      4.2400
+   1300.1200      0.0000      0.0000      4.2440
+   1300.7300      0.0000      0.0000      4.2370
+   1301.3400      0.0000      0.0000      4.2410
+   1301.9500      0.0000      0.0000      4.2420
+   1302.5601      0.0000      0.0000      4.2370
+   1303.1600      0.0000      0.0000      4.2410
+   1303.7700      0.0000      0.0000      4.2340
+   1304.3800      0.0000      0.0000      4.2310
+   1304.9900      0.0000      0.0000      4.2350
+   1305.6000      0.0000      0.0000      4.2300
+   1306.2100      0.0000      0.0000      4.2260
+   1306.8199      0.0000      0.0000      4.2290
+   1307.4301      0.0000      0.0000      4.2260
+   1308.0400      0.0000      0.0000      4.2120
+   1308.6500      0.0000      0.0000      4.2220
+   1309.2600      0.0000      0.0000      4.2260
+   1309.8700      0.0000      0.0000      4.2190
+   1310.4700      0.0000      0.0000      4.2210
+   1311.0800      0.0000      0.0000      4.2190
+   1311.6899      0.0000      0.0000      4.2170
+   1312.3000      0.0000      0.0000      4.2120
+   1312.9100      0.0000      0.0000      4.2060
+   1313.5200      0.0000      0.0000      4.2160
+   1314.1300      0.0000      0.0000      4.2120
+   1314.7400      0.0000      0.0000      4.2090
+   1315.3500      0.0000      0.0000      4.2110
+   1315.9500      0.0000      0.0000      4.2020
+   1316.5601      0.0000      0.0000      4.2020
+   1317.1700      0.0000      0.0000      4.2090
+   1317.7800      0.0000      0.0000      4.2010
+   1318.3900      0.0000      0.0000      4.1940
+   1319.0000      0.0000      0.0000      4.1810
+   1319.6000      0.0000      0.0000      4.1780
+   1320.2100      0.0000      0.0000      4.1750
+   1320.8199      0.0000      0.0000      4.1600
+   1321.4301      0.0000      0.0000      4.1520
+   1322.0400      0.0000      0.0000      4.1540
+   1322.6500      0.0000      0.0000      4.1550
+   1323.2500      0.0000      0.0000      4.1460
+   1323.8600      0.0000      0.0000      4.1540
+   1324.4700      0.0000      0.0000      4.1550
+   1325.0800      0.0000      0.0000      4.1560
+   1325.6899      0.0000      0.0000      4.1520
+   1326.2900      0.0000      0.0000      4.1500
+   1326.9000      0.0000      0.0000      4.1490
+   1327.5100      0.0000      0.0000      4.1520
+   1328.1200      0.0000      0.0000      4.1510
+   1328.7300      0.0000      0.0000      4.1500
+   1329.3300      0.0000      0.0000      4.1490
+   1329.9399      0.0000      0.0000      4.1480
+   1330.5500      0.0000      0.0000      4.1510
+   1331.1600      0.0000      0.0000      4.1470
+   1331.7700      0.0000      0.0000      4.1480
+   1332.3700      0.0000      0.0000      4.1450
+   1332.9800      0.0000      0.0000      4.1480
+   1333.5900      0.0000      0.0000      4.1480
+   1334.2000      0.0000      0.0000      4.1480
+   1334.8000      0.0000      0.0000      4.1420
+   1335.4100      0.0000      0.0000      4.1470
+   1336.0200      0.0000      0.0000      4.1480
+   1336.6300      0.0000      0.0000      4.1520
+   1337.2300      0.0000      0.0000      4.1450
+   1337.8400      0.0000      0.0000      4.1490
+   1338.4500      0.0000      0.0000      4.1540
+   1339.0500      0.0000      0.0000      4.1510
+   1339.6600      0.0000      0.0000      4.1450
+   1340.2700      0.0000      0.0000      4.1470
+   1340.8800      0.0000      0.0000      4.1520
+   1341.4800      0.0000      0.0000      4.1480
+   1342.0900      0.0000      0.0000      4.1470
+   1342.7000      0.0000      0.0000      4.1500
+   1343.3000      0.0000      0.0000      4.1410
+   1343.9100      0.0000      0.0000      4.1470
+   1344.5200      0.0000      0.0000      4.1460
+   1345.1300      0.0000      0.0000      4.1390
+   1345.7300      0.0000      0.0000      4.1320
+   1346.3400      0.0000      0.0000      4.1440
+   1346.9500      0.0000      0.0000      4.1430
+   1347.5500      0.0000      0.0000      4.1400
+   1348.1600      0.0000      0.0000      4.1430
+   1348.7700      0.0000      0.0000      4.1340
+   1349.3700      0.0000      0.0000      4.1340
+   1349.9800      0.0000      0.0000      4.1350
+   1350.5900      0.0000      0.0000      4.1350
+   1351.1899      0.0000      0.0000      4.1390
+   1351.8000      0.0000      0.0000      4.1340
+   1352.4100      0.0000      0.0000      4.1320
+   1353.0100      0.0000      0.0000      4.1250
+   1353.6200      0.0000      0.0000      4.1220
+   1354.2200      0.0000      0.0000      4.1180
+   1354.8300      0.0000      0.0000      4.1220
+   1355.4399      0.0000      0.0000      4.1180
+   1356.0400      0.0000      0.0000      4.1130
+   1356.6500      0.0000      0.0000      4.1170
+   1357.2600      0.0000      0.0000      4.1160
+   1357.8600      0.0000      0.0000      4.1190
+   1358.4700      0.0000      0.0000      4.1160
+   1359.0699      0.0000      0.0000      4.1090
+   1359.6801      0.0000      0.0000      4.1160
+   1360.2900      0.0000      0.0000      4.1050
+   1360.8900      0.0000      0.0000      4.1050
+   1361.5000      0.0000      0.0000      4.0980
+   1362.1000      0.0000      0.0000      4.1000
+   1362.7100      0.0000      0.0000      4.1000
+   1363.3199      0.0000      0.0000      4.0990
+   1363.9200      0.0000      0.0000      4.0980
+   1364.5300      0.0000      0.0000      4.0970
+   1365.1300      0.0000      0.0000      4.0970
+   1365.7400      0.0000      0.0000      4.0940
+   1366.3400      0.0000      0.0000      4.0970
+   1366.9500      0.0000      0.0000      4.0860
+   1367.5500      0.0000      0.0000      4.0870
+   1368.1600      0.0000      0.0000      4.0900
+   1368.7700      0.0000      0.0000      4.0890
+   1369.3700      0.0000      0.0000      4.0870
+   1369.9800      0.0000      0.0000      4.0900
+   1370.5800      0.0000      0.0000      4.0820
+   1371.1899      0.0000      0.0000      4.0840
+   1371.7900      0.0000      0.0000      4.0740
+   1372.4000      0.0000      0.0000      4.0850
+   1373.0000      0.0000      0.0000      4.0810
+   1373.6100      0.0000      0.0000      4.0790
+   1374.2100      0.0000      0.0000      4.0690
+   1374.8199      0.0000      0.0000      4.0800
+   1375.4200      0.0000      0.0000      4.0710
+   1376.0300      0.0000      0.0000      4.0840
+   1376.6300      0.0000      0.0000      4.0820
+   1377.2400      0.0000      0.0000      4.0700
+   1377.8400      0.0000      0.0000      4.0700
+   1378.4500      0.0000      0.0000      4.0730
+   1379.0500      0.0000      0.0000      4.0740
+   1379.6600      0.0000      0.0000      4.0680
+   1380.2600      0.0000      0.0000      4.0750
+   1380.8700      0.0000      0.0000      4.0800
+   1381.4700      0.0000      0.0000      4.0670
+   1382.0800      0.0000      0.0000      4.0650
+   1382.6801      0.0000      0.0000      4.0680
+   1383.2900      0.0000      0.0000      4.0690
+   1383.8900      0.0000      0.0000      4.0570
+   1384.5000      0.0000      0.0000      4.0580
+   1385.1000      0.0000      0.0000      4.0660
+   1385.7000      0.0000      0.0000      4.0560
+   1386.3101      0.0000      0.0000      4.0600
+   1386.9100      0.0000      0.0000      4.0660
+   1387.5200      0.0000      0.0000      4.0570
+   1388.1200      0.0000      0.0000      4.0580
+   1388.7300      0.0000      0.0000      4.0600
+   1389.3300      0.0000      0.0000      4.0590
+   1389.9301      0.0000      0.0000      4.0640
+   1390.5400      0.0000      0.0000      4.0560
+   1391.1400      0.0000      0.0000      4.0630
+   1391.7500      0.0000      0.0000      4.0580
+   1392.3500      0.0000      0.0000      4.0600
+   1392.9500      0.0000      0.0000      4.0580
+   1393.5601      0.0000      0.0000      4.0450
+   1394.1600      0.0000      0.0000      4.0500
+   1394.7700      0.0000      0.0000      4.0500
+   1395.3700      0.0000      0.0000      4.0560
+   1395.9700      0.0000      0.0000      4.0570
+   1396.5800      0.0000      0.0000      4.0530
+   1397.1801      0.0000      0.0000      4.0510
+   1397.7900      0.0000      0.0000      4.0510
+   1398.3900      0.0000      0.0000      4.0550
+   1398.9900      0.0000      0.0000      4.0510
+   1399.6000      0.0000      0.0000      4.0500
+   1400.2000      0.0000      0.0000      4.0480
+   1400.8000      0.0000      0.0000      4.0470
+   1401.4100      0.0000      0.0000      4.0450
+   1402.0100      0.0000      0.0000      4.0460
+   1402.6100      0.0000      0.0000      4.0500
+   1403.2200      0.0000      0.0000      4.0500
+   1403.8199      0.0000      0.0000      4.0490
+   1404.4200      0.0000      0.0000      4.0450
+   1405.0300      0.0000      0.0000      4.0480
+   1405.6300      0.0000      0.0000      4.0420
+   1406.2300      0.0000      0.0000      4.0480
+   1406.8400      0.0000      0.0000      4.0430
+   1407.4399      0.0000      0.0000      4.0460
+   1408.0400      0.0000      0.0000      4.0390
+   1408.6500      0.0000      0.0000      4.0410
+   1409.2500      0.0000      0.0000      4.0430
+   1409.8500      0.0000      0.0000      4.0390
+   1410.4600      0.0000      0.0000      4.0340
+   1411.0601      0.0000      0.0000      4.0390
+   1411.6600      0.0000      0.0000      4.0350
+   1412.2600      0.0000      0.0000      4.0390
+   1412.8700      0.0000      0.0000      4.0490
+   1413.4700      0.0000      0.0000      4.0440
+   1414.0699      0.0000      0.0000      4.0370
+   1414.6700      0.0000      0.0000      4.0440
+   1415.2800      0.0000      0.0000      4.0170
+   1415.8800      0.0000      0.0000      4.0160
+   1416.4800      0.0000      0.0000      4.0210
+   1417.0900      0.0000      0.0000      4.0220
+   1417.6899      0.0000      0.0000      4.0200
+   1418.2900      0.0000      0.0000      4.0180
+   1418.8900      0.0000      0.0000      4.0140
+   1419.5000      0.0000      0.0000      4.0210
+   1420.1000      0.0000      0.0000      4.0180
+   1420.7000      0.0000      0.0000      4.0230
+   1421.3000      0.0000      0.0000      4.0260
+   1421.9000      0.0000      0.0000      4.0190
+   1422.5100      0.0000      0.0000      4.0140
+   1423.1100      0.0000      0.0000      4.0190
+   1423.7100      0.0000      0.0000      4.0140
+   1424.3101      0.0000      0.0000      4.0090
+   1424.9200      0.0000      0.0000      4.0110
+   1425.5200      0.0000      0.0000      4.0100
+   1426.1200      0.0000      0.0000      3.9990
+   1426.7200      0.0000      0.0000      4.0140
+   1427.3199      0.0000      0.0000      3.9980
+   1427.9200      0.0000      0.0000      4.0030
+   1428.5300      0.0000      0.0000      3.9980
+   1429.1300      0.0000      0.0000      4.0030
+   1429.7300      0.0000      0.0000      3.9920
+   1430.3300      0.0000      0.0000      3.9950
+   1430.9301      0.0000      0.0000      4.0040
+   1431.5400      0.0000      0.0000      3.9940
+   1432.1400      0.0000      0.0000      3.9980
+   1432.7400      0.0000      0.0000      4.0010
+   1433.3400      0.0000      0.0000      3.9990
+   1433.9399      0.0000      0.0000      4.0010
+   1434.5400      0.0000      0.0000      3.9970
+   1435.1400      0.0000      0.0000      3.9980
+   1435.7500      0.0000      0.0000      4.0010
+   1436.3500      0.0000      0.0000      3.9940
+   1436.9500      0.0000      0.0000      3.9970
+   1437.5500      0.0000      0.0000      3.9940
+   1438.1500      0.0000      0.0000      3.9940
+   1438.7500      0.0000      0.0000      3.9970
+   1439.3500      0.0000      0.0000      3.9920
+   1439.9600      0.0000      0.0000      3.9830
+   1440.5601      0.0000      0.0000      3.9970
+   1441.1600      0.0000      0.0000      3.9880
+   1441.7600      0.0000      0.0000      3.9850
+   1442.3600      0.0000      0.0000      3.9890
+   1442.9600      0.0000      0.0000      3.9850
+   1443.5601      0.0000      0.0000      3.9820
+   1444.1600      0.0000      0.0000      3.9800
+   1444.7600      0.0000      0.0000      3.9860
+   1445.3600      0.0000      0.0000      3.9860
+   1445.9700      0.0000      0.0000      3.9820
+   1446.5699      0.0000      0.0000      3.9860
+   1447.1700      0.0000      0.0000      3.9900
+   1447.7700      0.0000      0.0000      3.9790
+   1448.3700      0.0000      0.0000      3.9890
+   1448.9700      0.0000      0.0000      3.9870
+   1449.5699      0.0000      0.0000      3.9870
+   1450.1700      0.0000      0.0000      3.9780
+   1450.7700      0.0000      0.0000      3.9780
+   1451.3700      0.0000      0.0000      3.9710
+   1451.9700      0.0000      0.0000      3.9670
+   1452.5699      0.0000      0.0000      3.9620
+   1453.1700      0.0000      0.0000      3.9650
+   1453.7700      0.0000      0.0000      3.9650
+   1454.3700      0.0000      0.0000      3.9560
+   1454.9700      0.0000      0.0000      3.9550
+   1455.5699      0.0000      0.0000      3.9630
+   1456.1700      0.0000      0.0000      3.9540
+   1456.7700      0.0000      0.0000      3.9470
+   1457.3700      0.0000      0.0000      3.9430
+   1457.9700      0.0000      0.0000      3.9420
+   1458.5699      0.0000      0.0000      3.9480
+   1459.1700      0.0000      0.0000      3.9440
+   1459.7700      0.0000      0.0000      3.9480
+   1460.3700      0.0000      0.0000      3.9520
+   1460.9700      0.0000      0.0000      3.9450
+   1461.5699      0.0000      0.0000      3.9510
+   1462.1700      0.0000      0.0000      3.9530
+   1462.7700      0.0000      0.0000      3.9430
+   1463.3700      0.0000      0.0000      3.9520
+   1463.9700      0.0000      0.0000      3.9490
+   1464.5699      0.0000      0.0000      3.9310
+   1465.1700      0.0000      0.0000      3.9550
+   1465.7700      0.0000      0.0000      3.9480
+   1466.3700      0.0000      0.0000      3.9400
+   1466.9700      0.0000      0.0000      3.9450
+   1467.5699      0.0000      0.0000      3.9420
+   1468.1700      0.0000      0.0000      3.9470
+   1468.7700      0.0000      0.0000      3.9450
+   1469.3700      0.0000      0.0000      3.9310
+   1469.9700      0.0000      0.0000      3.9440
+   1470.5699      0.0000      0.0000      3.9360
+   1471.1700      0.0000      0.0000      3.9410
+   1471.7700      0.0000      0.0000      3.9410
+   1472.3600      0.0000      0.0000      3.9390
+   1472.9600      0.0000      0.0000      3.9360
+   1473.5601      0.0000      0.0000      3.9350
+   1474.1600      0.0000      0.0000      3.9360
+   1474.7600      0.0000      0.0000      3.9340
+   1475.3600      0.0000      0.0000      3.9340
+   1475.9600      0.0000      0.0000      3.9390
+   1476.5601      0.0000      0.0000      3.9330
+   1477.1600      0.0000      0.0000      3.9310
+   1477.7600      0.0000      0.0000      3.9330
+   1478.3500      0.0000      0.0000      3.9340
+   1478.9500      0.0000      0.0000      3.9310
+   1479.5500      0.0000      0.0000      3.9260
+   1480.1500      0.0000      0.0000      3.9320
+   1480.7500      0.0000      0.0000      3.9370
+   1481.3500      0.0000      0.0000      3.9330
+   1481.9500      0.0000      0.0000      3.9300
+   1482.5500      0.0000      0.0000      3.9230
+   1483.1400      0.0000      0.0000      3.9270
+   1483.7400      0.0000      0.0000      3.9230
+   1484.3400      0.0000      0.0000      3.9280
+   1484.9399      0.0000      0.0000      3.9300
+   1485.5400      0.0000      0.0000      3.9290
+   1486.1400      0.0000      0.0000      3.9370
+   1486.7300      0.0000      0.0000      3.9160
+   1487.3300      0.0000      0.0000      3.9240
+   1487.9301      0.0000      0.0000      3.9190
+   1488.5300      0.0000      0.0000      3.9180
+   1489.1300      0.0000      0.0000      3.9190
+   1489.7300      0.0000      0.0000      3.9260
+   1490.3199      0.0000      0.0000      3.9270
+   1490.9200      0.0000      0.0000      3.9200
+   1491.5200      0.0000      0.0000      3.9150
+   1492.1200      0.0000      0.0000      3.9160
+   1492.7200      0.0000      0.0000      3.9150
+   1493.3101      0.0000      0.0000      3.9170
+   1493.9100      0.0000      0.0000      3.9110
+   1494.5100      0.0000      0.0000      3.9160
+   1495.1100      0.0000      0.0000      3.9130
+   1495.7100      0.0000      0.0000      3.9120
+   1496.3000      0.0000      0.0000      3.9130
+   1496.9000      0.0000      0.0000      3.9090
+   1497.5000      0.0000      0.0000      3.9120
+   1498.1000      0.0000      0.0000      3.9070
+   1498.6899      0.0000      0.0000      3.9010
+   1499.2900      0.0000      0.0000      3.9040
+   1499.8900      0.0000      0.0000      3.9090
+   1500.4900      0.0000      0.0000      3.9000
+   1501.0800      0.0000      0.0000      3.9050
+   1501.6801      0.0000      0.0000      3.9020
+   1502.2800      0.0000      0.0000      3.9050
+   1502.8800      0.0000      0.0000      3.8990
+   1503.4700      0.0000      0.0000      3.9010
+   1504.0699      0.0000      0.0000      3.8980
+   1504.6700      0.0000      0.0000      3.8930
+   1505.2600      0.0000      0.0000      3.8990
+   1505.8600      0.0000      0.0000      3.8960
+   1506.4600      0.0000      0.0000      3.8950
+   1507.0601      0.0000      0.0000      3.8970
+   1507.6500      0.0000      0.0000      3.9040
+   1508.2500      0.0000      0.0000      3.9000
+   1508.8500      0.0000      0.0000      3.8980
+   1509.4399      0.0000      0.0000      3.8970
+   1510.0400      0.0000      0.0000      3.8950
+   1510.6400      0.0000      0.0000      3.8980
+   1511.2400      0.0000      0.0000      3.9010
+   1511.8300      0.0000      0.0000      3.8910
+   1512.4301      0.0000      0.0000      3.8960
+   1513.0300      0.0000      0.0000      3.8990
+   1513.6200      0.0000      0.0000      3.9000
+   1514.2200      0.0000      0.0000      3.9010
+   1514.8199      0.0000      0.0000      3.8980
+   1515.4100      0.0000      0.0000      3.9030
+   1516.0100      0.0000      0.0000      3.8990
+   1516.6000      0.0000      0.0000      3.8910
+   1517.2000      0.0000      0.0000      3.9050
+   1517.8000      0.0000      0.0000      3.8990
+   1518.3900      0.0000      0.0000      3.8980
+   1518.9900      0.0000      0.0000      3.8990
+   1519.5900      0.0000      0.0000      3.9010
+   1520.1801      0.0000      0.0000      3.8940
+   1520.7800      0.0000      0.0000      3.8990
+   1521.3800      0.0000      0.0000      3.8990
+   1521.9700      0.0000      0.0000      3.8960
+   1522.5699      0.0000      0.0000      3.9060
+   1523.1600      0.0000      0.0000      3.9020
+   1523.7600      0.0000      0.0000      3.8960
+   1524.3600      0.0000      0.0000      3.8990
+   1524.9500      0.0000      0.0000      3.8950
+   1525.5500      0.0000      0.0000      3.9070
+   1526.1400      0.0000      0.0000      3.8990
+   1526.7400      0.0000      0.0000      3.8930
+   1527.3400      0.0000      0.0000      3.8900
+   1527.9301      0.0000      0.0000      3.8880
+   1528.5300      0.0000      0.0000      3.9040
+   1529.1200      0.0000      0.0000      3.8840
+   1529.7200      0.0000      0.0000      3.8880
+   1530.3101      0.0000      0.0000      3.8900
+   1530.9100      0.0000      0.0000      3.8880
+   1531.5100      0.0000      0.0000      3.8860
+   1532.1000      0.0000      0.0000      3.8930
+   1532.7000      0.0000      0.0000      3.8830
+   1533.2900      0.0000      0.0000      3.8920
+   1533.8900      0.0000      0.0000      3.8890
+   1534.4800      0.0000      0.0000      3.8860
+   1535.0800      0.0000      0.0000      3.8840
+   1535.6700      0.0000      0.0000      3.8920
+   1536.2700      0.0000      0.0000      3.8970
+   1536.8600      0.0000      0.0000      3.8890
+   1537.4600      0.0000      0.0000      3.8930
+   1538.0601      0.0000      0.0000      3.8930
+   1538.6500      0.0000      0.0000      3.8900
+   1539.2500      0.0000      0.0000      3.8860
+   1539.8400      0.0000      0.0000      3.8920
+   1540.4399      0.0000      0.0000      3.8930
+   1541.0300      0.0000      0.0000      3.8860
+   1541.6300      0.0000      0.0000      3.8910
+   1542.2200      0.0000      0.0000      3.8880
+   1542.8199      0.0000      0.0000      3.8960
+   1543.4100      0.0000      0.0000      3.8830
+   1544.0100      0.0000      0.0000      3.8870
+   1544.6000      0.0000      0.0000      3.8940
+   1545.1899      0.0000      0.0000      3.8890
+   1545.7900      0.0000      0.0000      3.8780
+   1546.3800      0.0000      0.0000      3.8860
+   1546.9800      0.0000      0.0000      3.8870
+   1547.5699      0.0000      0.0000      3.8840
+   1548.1700      0.0000      0.0000      3.8760
+   1548.7600      0.0000      0.0000      3.8780
+   1549.3600      0.0000      0.0000      3.8780
+   1549.9500      0.0000      0.0000      3.8770
+   1550.5500      0.0000      0.0000      3.8810
+   1551.1400      0.0000      0.0000      3.8790
+   1551.7300      0.0000      0.0000      3.8780
+   1552.3300      0.0000      0.0000      3.8790
+   1552.9200      0.0000      0.0000      3.8790
+   1553.5200      0.0000      0.0000      3.8770
+   1554.1100      0.0000      0.0000      3.8750
+   1554.7100      0.0000      0.0000      3.8730
+   1555.3000      0.0000      0.0000      3.8790
+   1555.8900      0.0000      0.0000      3.8770
+   1556.4900      0.0000      0.0000      3.8700
+   1557.0800      0.0000      0.0000      3.8720
+   1557.6801      0.0000      0.0000      3.8720
+   1558.2700      0.0000      0.0000      3.8770
+   1558.8600      0.0000      0.0000      3.8680
+   1559.4600      0.0000      0.0000      3.8800
+   1560.0500      0.0000      0.0000      3.8780
+   1560.6500      0.0000      0.0000      3.8710
+   1561.2400      0.0000      0.0000      3.8790
+   1561.8300      0.0000      0.0000      3.8740
+   1562.4301      0.0000      0.0000      3.8730
+   1563.0200      0.0000      0.0000      3.8670
+   1563.6100      0.0000      0.0000      3.8660
+   1564.2100      0.0000      0.0000      3.8650
+   1564.8000      0.0000      0.0000      3.8700
+   1565.4000      0.0000      0.0000      3.8790
+   1565.9900      0.0000      0.0000      3.8720
+   1566.5800      0.0000      0.0000      3.8660
+   1567.1801      0.0000      0.0000      3.8730
+   1567.7700      0.0000      0.0000      3.8710
+   1568.3600      0.0000      0.0000      3.8730
+   1568.9600      0.0000      0.0000      3.8720
+   1569.5500      0.0000      0.0000      3.8690
+   1570.1400      0.0000      0.0000      3.8670
+   1570.7400      0.0000      0.0000      3.8710
+   1571.3300      0.0000      0.0000      3.8670
+   1571.9200      0.0000      0.0000      3.8660
+   1572.5100      0.0000      0.0000      3.8660
+   1573.1100      0.0000      0.0000      3.8670
+   1573.7000      0.0000      0.0000      3.8640
+   1574.2900      0.0000      0.0000      3.8730
+   1574.8900      0.0000      0.0000      3.8620
+   1575.4800      0.0000      0.0000      3.8610
+   1576.0699      0.0000      0.0000      3.8670
+   1576.6700      0.0000      0.0000      3.8630
+   1577.2600      0.0000      0.0000      3.8650
+   1577.8500      0.0000      0.0000      3.8660
+   1578.4399      0.0000      0.0000      3.8690
+   1579.0400      0.0000      0.0000      3.8610
+   1579.6300      0.0000      0.0000      3.8590
+   1580.2200      0.0000      0.0000      3.8680
+   1580.8101      0.0000      0.0000      3.8680
+   1581.4100      0.0000      0.0000      3.8620
+   1582.0000      0.0000      0.0000      3.8640
+   1582.5900      0.0000      0.0000      3.8560
+   1583.1801      0.0000      0.0000      3.8660
+   1583.7800      0.0000      0.0000      3.8630
+   1584.3700      0.0000      0.0000      3.8560
+   1584.9600      0.0000      0.0000      3.8660
+   1585.5500      0.0000      0.0000      3.8630
+   1586.1500      0.0000      0.0000      3.8590
+   1586.7400      0.0000      0.0000      3.8560
+   1587.3300      0.0000      0.0000      3.8600
+   1587.9200      0.0000      0.0000      3.8630
+   1588.5100      0.0000      0.0000      3.8580
+   1589.1100      0.0000      0.0000      3.8650
+   1589.7000      0.0000      0.0000      3.8540
+   1590.2900      0.0000      0.0000      3.8530
+   1590.8800      0.0000      0.0000      3.8590
+   1591.4700      0.0000      0.0000      3.8520
+   1592.0699      0.0000      0.0000      3.8480
+   1592.6600      0.0000      0.0000      3.8530
+   1593.2500      0.0000      0.0000      3.8500
+   1593.8400      0.0000      0.0000      3.8550
+   1594.4301      0.0000      0.0000      3.8490
+   1595.0300      0.0000      0.0000      3.8530
+   1595.6200      0.0000      0.0000      3.8470
+   1596.2100      0.0000      0.0000      3.8440
+   1596.8000      0.0000      0.0000      3.8440
+   1597.3900      0.0000      0.0000      3.8450
+   1597.9800      0.0000      0.0000      3.8490
+   1598.5699      0.0000      0.0000      3.8470
+   1599.1700      0.0000      0.0000      3.8440
+   1599.7600      0.0000      0.0000      3.8410
+   1600.3500      0.0000      0.0000      3.8460
+   1600.9399      0.0000      0.0000      3.8450
+   1601.5300      0.0000      0.0000      3.8480
+   1602.1200      0.0000      0.0000      3.8450
+   1602.7100      0.0000      0.0000      3.8490
+   1603.3101      0.0000      0.0000      3.8560
+   1603.9000      0.0000      0.0000      3.8430
+   1604.4900      0.0000      0.0000      3.8470
+   1605.0800      0.0000      0.0000      3.8420
+   1605.6700      0.0000      0.0000      3.8480
+   1606.2600      0.0000      0.0000      3.8470
+   1606.8500      0.0000      0.0000      3.8470
+   1607.4399      0.0000      0.0000      3.8490
+   1608.0300      0.0000      0.0000      3.8420
+   1608.6200      0.0000      0.0000      3.8500
+   1609.2200      0.0000      0.0000      3.8460
+   1609.8101      0.0000      0.0000      3.8490
+   1610.4000      0.0000      0.0000      3.8440
+   1610.9900      0.0000      0.0000      3.8500
+   1611.5800      0.0000      0.0000      3.8420
+   1612.1700      0.0000      0.0000      3.8490
+   1612.7600      0.0000      0.0000      3.8440
+   1613.3500      0.0000      0.0000      3.8460
+   1613.9399      0.0000      0.0000      3.8500
+   1614.5300      0.0000      0.0000      3.8410
+   1615.1200      0.0000      0.0000      3.8380
+   1615.7100      0.0000      0.0000      3.8400
+   1616.3000      0.0000      0.0000      3.8500
+   1616.8900      0.0000      0.0000      3.8460
+   1617.4800      0.0000      0.0000      3.8440
+   1618.0699      0.0000      0.0000      3.8410
+   1618.6600      0.0000      0.0000      3.8430
+   1619.2500      0.0000      0.0000      3.8400
+   1619.8400      0.0000      0.0000      3.8390
+   1620.4301      0.0000      0.0000      3.8470
+   1621.0200      0.0000      0.0000      3.8470
+   1621.6100      0.0000      0.0000      3.8440
+   1622.2000      0.0000      0.0000      3.8430
+   1622.7900      0.0000      0.0000      3.8400
+   1623.3800      0.0000      0.0000      3.8420
+   1623.9700      0.0000      0.0000      3.8410
+   1624.5601      0.0000      0.0000      3.8450
+   1625.1500      0.0000      0.0000      3.8360
+   1625.7400      0.0000      0.0000      3.8390
+   1626.3300      0.0000      0.0000      3.8360
+   1626.9200      0.0000      0.0000      3.8350
+   1627.5100      0.0000      0.0000      3.8320
+   1628.1000      0.0000      0.0000      3.8400
+   1628.6899      0.0000      0.0000      3.8350
+   1629.2800      0.0000      0.0000      3.8290
+   1629.8700      0.0000      0.0000      3.8330
+   1630.4600      0.0000      0.0000      3.8320
+   1631.0500      0.0000      0.0000      3.8430
+   1631.6400      0.0000      0.0000      3.8320
+   1632.2300      0.0000      0.0000      3.8340
+   1632.8199      0.0000      0.0000      3.8370
+   1633.4100      0.0000      0.0000      3.8340
+   1634.0000      0.0000      0.0000      3.8360
+   1634.5900      0.0000      0.0000      3.8370
+   1635.1801      0.0000      0.0000      3.8320
+   1635.7700      0.0000      0.0000      3.8420
+   1636.3500      0.0000      0.0000      3.8370
+   1636.9399      0.0000      0.0000      3.8330
+   1637.5300      0.0000      0.0000      3.8290
+   1638.1200      0.0000      0.0000      3.8330
+   1638.7100      0.0000      0.0000      3.8370
+   1639.3000      0.0000      0.0000      3.8250
+   1639.8900      0.0000      0.0000      3.8370
+   1640.4800      0.0000      0.0000      3.8320
+   1641.0699      0.0000      0.0000      3.8260
+   1641.6600      0.0000      0.0000      3.8300
+   1642.2400      0.0000      0.0000      3.8310
+   1642.8300      0.0000      0.0000      3.8310
+   1643.4200      0.0000      0.0000      3.8310
+   1644.0100      0.0000      0.0000      3.8340
+   1644.6000      0.0000      0.0000      3.8360
+   1645.1899      0.0000      0.0000      3.8340
+   1645.7800      0.0000      0.0000      3.8340
+   1646.3600      0.0000      0.0000      3.8280
+   1646.9500      0.0000      0.0000      3.8380
+   1647.5400      0.0000      0.0000      3.8330
+   1648.1300      0.0000      0.0000      3.8300
+   1648.7200      0.0000      0.0000      3.8300
+   1649.3101      0.0000      0.0000      3.8340
+   1649.9000      0.0000      0.0000      3.8400
+   1650.4800      0.0000      0.0000      3.8360
+   1651.0699      0.0000      0.0000      3.8270
+   1651.6600      0.0000      0.0000      3.8370
+   1652.2500      0.0000      0.0000      3.8330
+   1652.8400      0.0000      0.0000      3.8390
+   1653.4200      0.0000      0.0000      3.8360
+   1654.0100      0.0000      0.0000      3.8350
+   1654.6000      0.0000      0.0000      3.8320
+   1655.1899      0.0000      0.0000      3.8330
+   1655.7800      0.0000      0.0000      3.8310
+   1656.3600      0.0000      0.0000      3.8310
+   1656.9500      0.0000      0.0000      3.8370
+   1657.5400      0.0000      0.0000      3.8300
+   1658.1300      0.0000      0.0000      3.8410
+   1658.7200      0.0000      0.0000      3.8360
+   1659.3000      0.0000      0.0000      3.8430
+   1659.8900      0.0000      0.0000      3.8280
+   1660.4800      0.0000      0.0000      3.8350
+   1661.0699      0.0000      0.0000      3.8390
+   1661.6500      0.0000      0.0000      3.8360
+   1662.2400      0.0000      0.0000      3.8300
+   1662.8300      0.0000      0.0000      3.8380
+   1663.4200      0.0000      0.0000      3.8390
+   1664.0000      0.0000      0.0000      3.8380
+   1664.5900      0.0000      0.0000      3.8380
+   1665.1801      0.0000      0.0000      3.8330
+   1665.7700      0.0000      0.0000      3.8320
+   1666.3500      0.0000      0.0000      3.8320
+   1666.9399      0.0000      0.0000      3.8230
+   1667.5300      0.0000      0.0000      3.8300
+   1668.1200      0.0000      0.0000      3.8260
+   1668.7000      0.0000      0.0000      3.8210
+   1669.2900      0.0000      0.0000      3.8360
+   1669.8800      0.0000      0.0000      3.8280
+   1670.4600      0.0000      0.0000      3.8270
+   1671.0500      0.0000      0.0000      3.8280
+   1671.6400      0.0000      0.0000      3.8260
+   1672.2200      0.0000      0.0000      3.8300
+   1672.8101      0.0000      0.0000      3.8320
+   1673.4000      0.0000      0.0000      3.8250
+   1673.9900      0.0000      0.0000      3.8330
+   1674.5699      0.0000      0.0000      3.8270
+   1675.1600      0.0000      0.0000      3.8340
+   1675.7500      0.0000      0.0000      3.8300
+   1676.3300      0.0000      0.0000      3.8270
+   1676.9200      0.0000      0.0000      3.8290
+   1677.5100      0.0000      0.0000      3.8270
+   1678.0900      0.0000      0.0000      3.8320
+   1678.6801      0.0000      0.0000      3.8320
+   1679.2600      0.0000      0.0000      3.8260
+   1679.8500      0.0000      0.0000      3.8260
+   1680.4399      0.0000      0.0000      3.8250
+   1681.0200      0.0000      0.0000      3.8210
+   1681.6100      0.0000      0.0000      3.8270
+   1682.2000      0.0000      0.0000      3.8280
+   1682.7800      0.0000      0.0000      3.8260
+   1683.3700      0.0000      0.0000      3.8310
+   1683.9600      0.0000      0.0000      3.8300
+   1684.5400      0.0000      0.0000      3.8300
+   1685.1300      0.0000      0.0000      3.8270
+   1685.7100      0.0000      0.0000      3.8270
+   1686.3000      0.0000      0.0000      3.8280
+   1686.8900      0.0000      0.0000      3.8270
+   1687.4700      0.0000      0.0000      3.8290
+   1688.0601      0.0000      0.0000      3.8230
+   1688.6400      0.0000      0.0000      3.8240
+   1689.2300      0.0000      0.0000      3.8220
+   1689.8199      0.0000      0.0000      3.8370
+   1690.4000      0.0000      0.0000      3.8260
+   1690.9900      0.0000      0.0000      3.8230
+   1691.5699      0.0000      0.0000      3.8160
+   1692.1600      0.0000      0.0000      3.8220
+   1692.7400      0.0000      0.0000      3.8180
+   1693.3300      0.0000      0.0000      3.8220
+   1693.9200      0.0000      0.0000      3.8300
+   1694.5000      0.0000      0.0000      3.8240
+   1695.0900      0.0000      0.0000      3.8240
+   1695.6700      0.0000      0.0000      3.8150
+   1696.2600      0.0000      0.0000      3.8240
+   1696.8400      0.0000      0.0000      3.8220
+   1697.4301      0.0000      0.0000      3.8230
+   1698.0100      0.0000      0.0000      3.8180
+   1698.6000      0.0000      0.0000      3.8280
+   1699.1801      0.0000      0.0000      3.8220
+   1699.7700      0.0000      0.0000      3.8290
+   1700.3500      0.0000      0.0000      3.8170
+   1700.9399      0.0000      0.0000      3.8240
+   1701.5300      0.0000      0.0000      3.8220
+   1702.1100      0.0000      0.0000      3.8140
+   1702.7000      0.0000      0.0000      3.8200
+   1703.2800      0.0000      0.0000      3.8220
+   1703.8700      0.0000      0.0000      3.8170
+   1704.4500      0.0000      0.0000      3.8180
+   1705.0300      0.0000      0.0000      3.8170
+   1705.6200      0.0000      0.0000      3.8140
+   1706.2000      0.0000      0.0000      3.8240
+   1706.7900      0.0000      0.0000      3.8130
+   1707.3700      0.0000      0.0000      3.8090
+   1707.9600      0.0000      0.0000      3.8220
+   1708.5400      0.0000      0.0000      3.8180
+   1709.1300      0.0000      0.0000      3.8120
+   1709.7100      0.0000      0.0000      3.8240
+   1710.3000      0.0000      0.0000      3.8160
+   1710.8800      0.0000      0.0000      3.8150
+   1711.4700      0.0000      0.0000      3.8160
+   1712.0500      0.0000      0.0000      3.8150
+   1712.6400      0.0000      0.0000      3.8110
+   1713.2200      0.0000      0.0000      3.8160
+   1713.8000      0.0000      0.0000      3.8120
+   1714.3900      0.0000      0.0000      3.8220
+   1714.9700      0.0000      0.0000      3.8170
+   1715.5601      0.0000      0.0000      3.8180
+   1716.1400      0.0000      0.0000      3.8190
+   1716.7300      0.0000      0.0000      3.8190
+   1717.3101      0.0000      0.0000      3.8240
+   1717.8900      0.0000      0.0000      3.8170
+   1718.4800      0.0000      0.0000      3.8180
+   1719.0601      0.0000      0.0000      3.8150
+   1719.6500      0.0000      0.0000      3.8100
+   1720.2300      0.0000      0.0000      3.8100
+   1720.8101      0.0000      0.0000      3.8220
+   1721.4000      0.0000      0.0000      3.8240
+   1721.9800      0.0000      0.0000      3.8170
+   1722.5699      0.0000      0.0000      3.8280
+   1723.1500      0.0000      0.0000      3.8200
+   1723.7300      0.0000      0.0000      3.8130
+   1724.3199      0.0000      0.0000      3.8190
+   1724.9000      0.0000      0.0000      3.8190
+   1725.4800      0.0000      0.0000      3.8280
+   1726.0699      0.0000      0.0000      3.8180
+   1726.6500      0.0000      0.0000      3.8200
+   1727.2300      0.0000      0.0000      3.8170
+   1727.8199      0.0000      0.0000      3.8240
+   1728.4000      0.0000      0.0000      3.8150
+   1728.9800      0.0000      0.0000      3.8200
+   1729.5699      0.0000      0.0000      3.8110
+   1730.1500      0.0000      0.0000      3.8210
+   1730.7300      0.0000      0.0000      3.8070
+   1731.3199      0.0000      0.0000      3.8210
+   1731.9000      0.0000      0.0000      3.8200
+   1732.4800      0.0000      0.0000      3.8190
+   1733.0699      0.0000      0.0000      3.8120
+   1733.6500      0.0000      0.0000      3.8280
+   1734.2300      0.0000      0.0000      3.8130
+   1734.8199      0.0000      0.0000      3.8170
+   1735.4000      0.0000      0.0000      3.8210
+   1735.9800      0.0000      0.0000      3.8130
+   1736.5699      0.0000      0.0000      3.8080
+   1737.1500      0.0000      0.0000      3.8140
+   1737.7300      0.0000      0.0000      3.8100
+   1738.3101      0.0000      0.0000      3.8120
+   1738.9000      0.0000      0.0000      3.8090
+   1739.4800      0.0000      0.0000      3.8080
+   1740.0601      0.0000      0.0000      3.8110
+   1740.6500      0.0000      0.0000      3.8090
+   1741.2300      0.0000      0.0000      3.8050
+   1741.8101      0.0000      0.0000      3.8060
+   1742.3900      0.0000      0.0000      3.8040
+   1742.9800      0.0000      0.0000      3.8050
+   1743.5601      0.0000      0.0000      3.7980
+   1744.1400      0.0000      0.0000      3.8080
+   1744.7200      0.0000      0.0000      3.8060
+   1745.3101      0.0000      0.0000      3.8100
+   1745.8900      0.0000      0.0000      3.8110
+   1746.4700      0.0000      0.0000      3.8020
+   1747.0500      0.0000      0.0000      3.8080
+   1747.6300      0.0000      0.0000      3.8060
+   1748.2200      0.0000      0.0000      3.8060
+   1748.8000      0.0000      0.0000      3.8030
+   1749.3800      0.0000      0.0000      3.8130
+   1749.9600      0.0000      0.0000      3.8050
+   1750.5500      0.0000      0.0000      3.8040
+   1751.1300      0.0000      0.0000      3.8030
+   1751.7100      0.0000      0.0000      3.8070
+   1752.2900      0.0000      0.0000      3.7980
+   1752.8700      0.0000      0.0000      3.8060
+   1753.4500      0.0000      0.0000      3.8080
+   1754.0400      0.0000      0.0000      3.8090
+   1754.6200      0.0000      0.0000      3.8020
+   1755.2000      0.0000      0.0000      3.8080
+   1755.7800      0.0000      0.0000      3.8030
+   1756.3600      0.0000      0.0000      3.8000
+   1756.9500      0.0000      0.0000      3.8060
+   1757.5300      0.0000      0.0000      3.8100
+   1758.1100      0.0000      0.0000      3.8150
+   1758.6899      0.0000      0.0000      3.8000
+   1759.2700      0.0000      0.0000      3.7950
+   1759.8500      0.0000      0.0000      3.8020
+   1760.4301      0.0000      0.0000      3.7980
+   1761.0200      0.0000      0.0000      3.7970
+   1761.6000      0.0000      0.0000      3.7970
+   1762.1801      0.0000      0.0000      3.7990
+   1762.7600      0.0000      0.0000      3.8010
+   1763.3400      0.0000      0.0000      3.7970
+   1763.9200      0.0000      0.0000      3.7880
+   1764.5000      0.0000      0.0000      3.8020
+   1765.0800      0.0000      0.0000      3.7980
+   1765.6700      0.0000      0.0000      3.7910
+   1766.2500      0.0000      0.0000      3.7950
+   1766.8300      0.0000      0.0000      3.7960
+   1767.4100      0.0000      0.0000      3.7900
+   1767.9900      0.0000      0.0000      3.7940
+   1768.5699      0.0000      0.0000      3.7900
+   1769.1500      0.0000      0.0000      3.7980
+   1769.7300      0.0000      0.0000      3.7940
+   1770.3101      0.0000      0.0000      3.7890
+   1770.8900      0.0000      0.0000      3.7900
+   1771.4800      0.0000      0.0000      3.7890
+   1772.0601      0.0000      0.0000      3.7900
+   1772.6400      0.0000      0.0000      3.7930
+   1773.2200      0.0000      0.0000      3.7960
+   1773.8000      0.0000      0.0000      3.7940
+   1774.3800      0.0000      0.0000      3.7900
+   1774.9600      0.0000      0.0000      3.7990
+   1775.5400      0.0000      0.0000      3.7870
+   1776.1200      0.0000      0.0000      3.7920
+   1776.7000      0.0000      0.0000      3.7910
+   1777.2800      0.0000      0.0000      3.7930
+   1777.8600      0.0000      0.0000      3.7990
+   1778.4399      0.0000      0.0000      3.7890
+   1779.0200      0.0000      0.0000      3.7890
+   1779.6000      0.0000      0.0000      3.7950
+   1780.1801      0.0000      0.0000      3.7790
+   1780.7600      0.0000      0.0000      3.7940
+   1781.3400      0.0000      0.0000      3.7920
+   1781.9200      0.0000      0.0000      3.7850
+   1782.5000      0.0000      0.0000      3.7880
+   1783.0800      0.0000      0.0000      3.7870
+   1783.6600      0.0000      0.0000      3.7900
+   1784.2400      0.0000      0.0000      3.7940
+   1784.8199      0.0000      0.0000      3.7850
+   1785.4000      0.0000      0.0000      3.8000
+   1785.9800      0.0000      0.0000      3.7900
+   1786.5601      0.0000      0.0000      3.7880
+   1787.1400      0.0000      0.0000      3.7830
+   1787.7200      0.0000      0.0000      3.7870
+   1788.3000      0.0000      0.0000      3.7910
+   1788.8800      0.0000      0.0000      3.7880
+   1789.4600      0.0000      0.0000      3.7980
+   1790.0400      0.0000      0.0000      3.7860
+   1790.6200      0.0000      0.0000      3.7960
+   1791.2000      0.0000      0.0000      3.8000
+   1791.7800      0.0000      0.0000      3.7930
+   1792.3600      0.0000      0.0000      3.7970
+   1792.9399      0.0000      0.0000      3.7830
+   1793.5200      0.0000      0.0000      3.7910
+   1794.1000      0.0000      0.0000      3.7930
+   1794.6801      0.0000      0.0000      3.7860
+   1795.2500      0.0000      0.0000      3.7890
+   1795.8300      0.0000      0.0000      3.7940
+   1796.4100      0.0000      0.0000      3.7970
+   1796.9900      0.0000      0.0000      3.7910
+   1797.5699      0.0000      0.0000      3.7950
+   1798.1500      0.0000      0.0000      3.7930
+   1798.7300      0.0000      0.0000      3.7860
+   1799.3101      0.0000      0.0000      3.7840
+   1799.8900      0.0000      0.0000      3.7870
+   1800.4700      0.0000      0.0000      3.7870
+   1801.0500      0.0000      0.0000      3.7850
+   1801.6200      0.0000      0.0000      3.7830
+   1802.2000      0.0000      0.0000      3.7860
+   1802.7800      0.0000      0.0000      3.7840
+   1803.3600      0.0000      0.0000      3.7850
+   1803.9399      0.0000      0.0000      3.7860
+   1804.5200      0.0000      0.0000      3.7880
+   1805.1000      0.0000      0.0000      3.7800
+   1805.6801      0.0000      0.0000      3.7830
+   1806.2500      0.0000      0.0000      3.7810
+   1806.8300      0.0000      0.0000      3.7800
+   1807.4100      0.0000      0.0000      3.7830
+   1807.9900      0.0000      0.0000      3.7820
+   1808.5699      0.0000      0.0000      3.7830
+   1809.1500      0.0000      0.0000      3.7790
+   1809.7200      0.0000      0.0000      3.7760
+   1810.3000      0.0000      0.0000      3.7800
+   1810.8800      0.0000      0.0000      3.7800
+   1811.4600      0.0000      0.0000      3.7860
+   1812.0400      0.0000      0.0000      3.7810
+   1812.6200      0.0000      0.0000      3.7720
+   1813.1899      0.0000      0.0000      3.7800
+   1813.7700      0.0000      0.0000      3.7790
+   1814.3500      0.0000      0.0000      3.7860
+   1814.9301      0.0000      0.0000      3.7820
+   1815.5100      0.0000      0.0000      3.7680
+   1816.0800      0.0000      0.0000      3.7810
+   1816.6600      0.0000      0.0000      3.7790
+   1817.2400      0.0000      0.0000      3.7810
+   1817.8199      0.0000      0.0000      3.7860
+   1818.4000      0.0000      0.0000      3.7870
+   1818.9700      0.0000      0.0000      3.7840
+   1819.5500      0.0000      0.0000      3.7800
+   1820.1300      0.0000      0.0000      3.7830
+   1820.7100      0.0000      0.0000      3.7780
+   1821.2800      0.0000      0.0000      3.7800
+   1821.8600      0.0000      0.0000      3.7820
+   1822.4399      0.0000      0.0000      3.7840
+   1823.0200      0.0000      0.0000      3.7770
+   1823.5900      0.0000      0.0000      3.7790
+   1824.1700      0.0000      0.0000      3.7750
+   1824.7500      0.0000      0.0000      3.7810
+   1825.3300      0.0000      0.0000      3.7780
+   1825.9000      0.0000      0.0000      3.7810
+   1826.4800      0.0000      0.0000      3.7770
+   1827.0601      0.0000      0.0000      3.7830
+   1827.6400      0.0000      0.0000      3.7820
+   1828.2100      0.0000      0.0000      3.7840
+   1828.7900      0.0000      0.0000      3.7750
+   1829.3700      0.0000      0.0000      3.7810
+   1829.9399      0.0000      0.0000      3.7760
+   1830.5200      0.0000      0.0000      3.7780
+   1831.1000      0.0000      0.0000      3.7750
+   1831.6700      0.0000      0.0000      3.7760
+   1832.2500      0.0000      0.0000      3.7790
+   1832.8300      0.0000      0.0000      3.7750
+   1833.4100      0.0000      0.0000      3.7760
+   1833.9800      0.0000      0.0000      3.7720
+   1834.5601      0.0000      0.0000      3.7740
+   1835.1400      0.0000      0.0000      3.7760
+   1835.7100      0.0000      0.0000      3.7750
+   1836.2900      0.0000      0.0000      3.7730
+   1836.8700      0.0000      0.0000      3.7780
+   1837.4399      0.0000      0.0000      3.7840
+   1838.0200      0.0000      0.0000      3.7880
+   1838.6000      0.0000      0.0000      3.7790
+   1839.1700      0.0000      0.0000      3.7710
+   1839.7500      0.0000      0.0000      3.7790
+   1840.3199      0.0000      0.0000      3.7780
+   1840.9000      0.0000      0.0000      3.7780
+   1841.4800      0.0000      0.0000      3.7790
+   1842.0500      0.0000      0.0000      3.7660
+   1842.6300      0.0000      0.0000      3.7760
+   1843.2100      0.0000      0.0000      3.7770
+   1843.7800      0.0000      0.0000      3.7750
+   1844.3600      0.0000      0.0000      3.7740
+   1844.9301      0.0000      0.0000      3.7770
+   1845.5100      0.0000      0.0000      3.7740
+   1846.0900      0.0000      0.0000      3.7790
+   1846.6600      0.0000      0.0000      3.7730
+   1847.2400      0.0000      0.0000      3.7760
+   1847.8199      0.0000      0.0000      3.7780
+   1848.3900      0.0000      0.0000      3.7810
+   1848.9700      0.0000      0.0000      3.7800
+   1849.5400      0.0000      0.0000      3.7770
+   1850.1200      0.0000      0.0000      3.7850
+   1850.6899      0.0000      0.0000      3.7790
+   1851.2700      0.0000      0.0000      3.7750
+   1851.8500      0.0000      0.0000      3.7820
+   1852.4200      0.0000      0.0000      3.7780
+   1853.0000      0.0000      0.0000      3.7740
+   1853.5699      0.0000      0.0000      3.7760
+   1854.1500      0.0000      0.0000      3.7740
+   1854.7200      0.0000      0.0000      3.7760
+   1855.3000      0.0000      0.0000      3.7790
+   1855.8700      0.0000      0.0000      3.7690
+   1856.4500      0.0000      0.0000      3.7730
+   1857.0300      0.0000      0.0000      3.7690
+   1857.6000      0.0000      0.0000      3.7740
+   1858.1801      0.0000      0.0000      3.7680
+   1858.7500      0.0000      0.0000      3.7640
+   1859.3300      0.0000      0.0000      3.7690
+   1859.9000      0.0000      0.0000      3.7620
+   1860.4800      0.0000      0.0000      3.7710
+   1861.0500      0.0000      0.0000      3.7660
+   1861.6300      0.0000      0.0000      3.7660
+   1862.2000      0.0000      0.0000      3.7690
+   1862.7800      0.0000      0.0000      3.7680
+   1863.3500      0.0000      0.0000      3.7660
+   1863.9301      0.0000      0.0000      3.7660
+   1864.5000      0.0000      0.0000      3.7670
+   1865.0800      0.0000      0.0000      3.7620
+   1865.6500      0.0000      0.0000      3.7700
+   1866.2300      0.0000      0.0000      3.7720
+   1866.8000      0.0000      0.0000      3.7720
+   1867.3800      0.0000      0.0000      3.7730
+   1867.9500      0.0000      0.0000      3.7700
+   1868.5200      0.0000      0.0000      3.7710
+   1869.1000      0.0000      0.0000      3.7700
+   1869.6700      0.0000      0.0000      3.7780
+   1870.2500      0.0000      0.0000      3.7650
+   1870.8199      0.0000      0.0000      3.7750
+   1871.4000      0.0000      0.0000      3.7780
+   1871.9700      0.0000      0.0000      3.7570
+   1872.5500      0.0000      0.0000      3.7660
+   1873.1200      0.0000      0.0000      3.7750
+   1873.7000      0.0000      0.0000      3.7670
+   1874.2700      0.0000      0.0000      3.7720
+   1874.8400      0.0000      0.0000      3.7690
+   1875.4200      0.0000      0.0000      3.7660
+   1875.9900      0.0000      0.0000      3.7680
+   1876.5699      0.0000      0.0000      3.7640
+   1877.1400      0.0000      0.0000      3.7600
+   1877.7100      0.0000      0.0000      3.7610
+   1878.2900      0.0000      0.0000      3.7720
+   1878.8600      0.0000      0.0000      3.7660
+   1879.4399      0.0000      0.0000      3.7670
+   1880.0100      0.0000      0.0000      3.7640
+   1880.5800      0.0000      0.0000      3.7660
+   1881.1600      0.0000      0.0000      3.7560
+   1881.7300      0.0000      0.0000      3.7690
+   1882.3101      0.0000      0.0000      3.7590
+   1882.8800      0.0000      0.0000      3.7630
+   1883.4500      0.0000      0.0000      3.7650
+   1884.0300      0.0000      0.0000      3.7590
+   1884.6000      0.0000      0.0000      3.7660
+   1885.1700      0.0000      0.0000      3.7640
+   1885.7500      0.0000      0.0000      3.7690
+   1886.3199      0.0000      0.0000      3.7610
+   1886.8900      0.0000      0.0000      3.7610
+   1887.4700      0.0000      0.0000      3.7660
+   1888.0400      0.0000      0.0000      3.7600
+   1888.6100      0.0000      0.0000      3.7660
+   1889.1899      0.0000      0.0000      3.7630
+   1889.7600      0.0000      0.0000      3.7610
+   1890.3300      0.0000      0.0000      3.7610
+   1890.9100      0.0000      0.0000      3.7580
+   1891.4800      0.0000      0.0000      3.7620
+   1892.0500      0.0000      0.0000      3.7650
+   1892.6300      0.0000      0.0000      3.7630
+   1893.2000      0.0000      0.0000      3.7580
+   1893.7700      0.0000      0.0000      3.7710
+   1894.3500      0.0000      0.0000      3.7640
+   1894.9200      0.0000      0.0000      3.7690
+   1895.4900      0.0000      0.0000      3.7640
+   1896.0601      0.0000      0.0000      3.7710
+   1896.6400      0.0000      0.0000      3.7700
+   1897.2100      0.0000      0.0000      3.7640
+   1897.7800      0.0000      0.0000      3.7690
+   1898.3600      0.0000      0.0000      3.7660
+   1898.9301      0.0000      0.0000      3.7730
+   1899.5000      0.0000      0.0000      3.7660
+   1900.0699      0.0000      0.0000      3.7660
+   1900.6500      0.0000      0.0000      3.7650
+   1901.2200      0.0000      0.0000      3.7600
+   1901.7900      0.0000      0.0000      3.7670
+   1902.3600      0.0000      0.0000      3.7640
+   1902.9399      0.0000      0.0000      3.7620
+   1903.5100      0.0000      0.0000      3.7610
+   1904.0800      0.0000      0.0000      3.7660
+   1904.6500      0.0000      0.0000      3.7690
+   1905.2300      0.0000      0.0000      3.7630
+   1905.8000      0.0000      0.0000      3.7710
+   1906.3700      0.0000      0.0000      3.7610
+   1906.9399      0.0000      0.0000      3.7600
+   1907.5100      0.0000      0.0000      3.7650
+   1908.0900      0.0000      0.0000      3.7670
+   1908.6600      0.0000      0.0000      3.7640
+   1909.2300      0.0000      0.0000      3.7650
+   1909.8000      0.0000      0.0000      3.7580
+   1910.3800      0.0000      0.0000      3.7650
+   1910.9500      0.0000      0.0000      3.7710
+   1911.5200      0.0000      0.0000      3.7650
+   1912.0900      0.0000      0.0000      3.7650
+   1912.6600      0.0000      0.0000      3.7660
+   1913.2300      0.0000      0.0000      3.7680
+   1913.8101      0.0000      0.0000      3.7570
+   1914.3800      0.0000      0.0000      3.7670
+   1914.9500      0.0000      0.0000      3.7670
+   1915.5200      0.0000      0.0000      3.7650
+   1916.0900      0.0000      0.0000      3.7630
+   1916.6600      0.0000      0.0000      3.7630
+   1917.2400      0.0000      0.0000      3.7580
+   1917.8101      0.0000      0.0000      3.7610
+   1918.3800      0.0000      0.0000      3.7600
+   1918.9500      0.0000      0.0000      3.7620
+   1919.5200      0.0000      0.0000      3.7620
+   1920.0900      0.0000      0.0000      3.7520
+   1920.6600      0.0000      0.0000      3.7640
+   1921.2400      0.0000      0.0000      3.7610
+   1921.8101      0.0000      0.0000      3.7550
+   1922.3800      0.0000      0.0000      3.7600
+   1922.9500      0.0000      0.0000      3.7630
+   1923.5200      0.0000      0.0000      3.7650
+   1924.0900      0.0000      0.0000      3.7630
+   1924.6600      0.0000      0.0000      3.7620
+   1925.2300      0.0000      0.0000      3.7660
+   1925.8000      0.0000      0.0000      3.7620
+   1926.3800      0.0000      0.0000      3.7600
+   1926.9500      0.0000      0.0000      3.7620
+   1927.5200      0.0000      0.0000      3.7530
+   1928.0900      0.0000      0.0000      3.7580
+   1928.6600      0.0000      0.0000      3.7640
+   1929.2300      0.0000      0.0000      3.7620
+   1929.8000      0.0000      0.0000      3.7640
+   1930.3700      0.0000      0.0000      3.7700
+   1930.9399      0.0000      0.0000      3.7580
+   1931.5100      0.0000      0.0000      3.7630
+   1932.0800      0.0000      0.0000      3.7530
+   1932.6500      0.0000      0.0000      3.7700
+   1933.2200      0.0000      0.0000      3.7610
+   1933.8000      0.0000      0.0000      3.7560
+   1934.3700      0.0000      0.0000      3.7590
+   1934.9399      0.0000      0.0000      3.7540
+   1935.5100      0.0000      0.0000      3.7550
+   1936.0800      0.0000      0.0000      3.7580
+   1936.6500      0.0000      0.0000      3.7570
+   1937.2200      0.0000      0.0000      3.7600
+   1937.7900      0.0000      0.0000      3.7600
+   1938.3600      0.0000      0.0000      3.7540
+   1938.9301      0.0000      0.0000      3.7550
+   1939.5000      0.0000      0.0000      3.7600
+   1940.0699      0.0000      0.0000      3.7550
+   1940.6400      0.0000      0.0000      3.7510
+   1941.2100      0.0000      0.0000      3.7570
+   1941.7800      0.0000      0.0000      3.7570
+   1942.3500      0.0000      0.0000      3.7560
+   1942.9200      0.0000      0.0000      3.7550
+   1943.4900      0.0000      0.0000      3.7600
+   1944.0601      0.0000      0.0000      3.7560
+   1944.6300      0.0000      0.0000      3.7590
+   1945.2000      0.0000      0.0000      3.7580
+   1945.7700      0.0000      0.0000      3.7600
+   1946.3400      0.0000      0.0000      3.7580
+   1946.9100      0.0000      0.0000      3.7580
+   1947.4800      0.0000      0.0000      3.7600
+   1948.0500      0.0000      0.0000      3.7600
+   1948.6100      0.0000      0.0000      3.7820
+   1949.1801      0.0000      0.0000      3.7630
+   1949.7500      0.0000      0.0000      3.7670
+   1950.3199      0.0000      0.0000      3.7720
+   1950.8900      0.0000      0.0000      3.7630
+   1951.4600      0.0000      0.0000      3.7600
+   1952.0300      0.0000      0.0000      3.7580
+   1952.6000      0.0000      0.0000      3.7630
+   1953.1700      0.0000      0.0000      3.7630
+   1953.7400      0.0000      0.0000     36.2690
+   1954.3101      0.0000      0.0000     36.2690
+   1954.8800      0.0000      0.0000     36.2690
+   1955.4500      0.0000      0.0000     36.2690
+   1956.0200      0.0000      0.0000     36.2690
+   1956.5800      0.0000      0.0000     36.2690
+   1957.1500      0.0000      0.0000     36.2690
+   1957.7200      0.0000      0.0000     36.2690
+   1958.2900      0.0000      0.0000     36.2690
+   1958.8600      0.0000      0.0000     36.2690
@@ -0,0 +1,654 @@
+test_read_store_and_write
+12/11/2016
+19:13:0
+Probe: SBE
+Source: /root/package/data/input/seabird/stn_003.cnv
+     -0.2630   1446.1169      0.0075      9.7068
+     -0.2130   1446.1170      0.0073      9.7067
+     -0.1950   1446.1150      0.0074      9.7061
+     -0.1820   1446.0981      0.0071      9.7019
+     -0.1500   1471.0099     17.2129     10.7298
+     -0.1050   1480.1241     24.7643     10.7415
+     -0.0880   1486.6530     30.1698     10.7474
+     -0.0520   1487.5832     30.9380     10.7483
+     -0.0380   1490.2278     33.1271     10.7488
+      0.0470   1485.8226     29.8199     10.6327
+      0.0780   1488.1961     31.5693     10.7059
+      0.1950   1489.9440     32.9676     10.7220
+      0.2760   1490.4334     33.3240     10.7382
+      0.3110   1491.2340     33.9617     10.7465
+      0.3430   1491.4046     34.0933     10.7496
+      0.3560   1491.4798     34.1509     10.7511
+      0.4370   1491.5887     34.2405     10.7509
+      0.5040   1491.6070     34.2532     10.7514
+      0.5180   1491.6167     34.2596     10.7519
+      0.5360   1491.6116     34.2551     10.7519
+      0.5710   1491.4597     34.1273     10.7525
+      0.6020   1491.7431     34.3627     10.7520
+      0.6340   1491.7450     34.3627     10.7524
+      0.6690   1491.7444     34.3626     10.7521
+      0.7010   1491.7436     34.3626     10.7517
+      0.7370   1491.7439     34.3621     10.7518
+      0.7500   1491.7428     34.3613     10.7517
+      0.7680   1491.7431     34.3613     10.7517
+      0.7990   1491.7430     34.3611     10.7516
+      0.8170   1491.7428     34.3595     10.7520
+      0.8350   1491.7444     34.3594     10.7524
+      0.8670   1491.7448     34.3590     10.7525
+      0.8980   1491.7463     34.3572     10.7534
+      0.9330   1491.7447     34.3539     10.7539
+      0.9640   1491.7477     34.3551     10.7542
+      1.0000   1491.7482     34.3556     10.7540
+      1.0310   1491.7479     34.3549     10.7540
+      1.0630   1491.7448     34.3528     10.7537
+      1.0980   1491.7363     34.3459     10.7535
+      1.1300   1491.7309     34.3395     10.7540
+      1.1430   1491.7270     34.3367     10.7538
+      1.1610   1491.7194     34.3299     10.7539
+      1.1790   1491.7145     34.3256     10.7539
+      1.1970   1491.7125     34.3237     10.7539
+      1.2280   1491.7116     34.3222     10.7540
+      1.2780   1491.7099     34.3210     10.7537
+      1.2960   1491.7113     34.3225     10.7535
+      1.3090   1491.7187     34.3284     10.7535
+      1.3630   1491.7260     34.3323     10.7540
+      1.3940   1491.7379     34.3411     10.7542
+      1.4080   1491.7396     34.3420     10.7543
+      1.4260   1491.7411     34.3430     10.7543
+      1.4620   1491.7440     34.3443     10.7545
+      1.5290   1491.7477     34.3465     10.7545
+      1.5600   1491.7514     34.3482     10.7548
+      1.6270   1491.7558     34.3504     10.7550
+      1.6590   1491.7582     34.3519     10.7550
+      1.7260   1491.7591     34.3523     10.7548
+      1.7570   1491.7600     34.3515     10.7552
+      1.7930   1491.7594     34.3505     10.7552
+      1.8070   1491.7587     34.3494     10.7553
+      1.8250   1491.7583     34.3491     10.7552
+      1.8560   1491.7573     34.3470     10.7555
+      1.9050   1491.7571     34.3462     10.7555
+      1.9230   1491.7565     34.3451     10.7556
+      1.9370   1491.7558     34.3452     10.7553
+      1.9550   1491.7573     34.3456     10.7555
+      1.9900   1491.7589     34.3459     10.7557
+      2.0350   1491.7593     34.3462     10.7555
+      2.0530   1491.7584     34.3461     10.7552
+      2.0890   1491.7587     34.3455     10.7553
+      2.1020   1491.7584     34.3451     10.7553
+      2.1200   1491.7578     34.3444     10.7553
+      2.1880   1491.7608     34.3462     10.7552
+      2.2550   1491.7646     34.3484     10.7552
+      2.2860   1491.7675     34.3510     10.7550
+      2.3360   1491.7699     34.3517     10.7552
+      2.3530   1491.7713     34.3532     10.7550
+      2.3850   1491.7726     34.3550     10.7546
+      2.4210   1491.7751     34.3560     10.7548
+      2.4660   1491.7773     34.3566     10.7550
+      2.4840   1491.7782     34.3571     10.7550
+      2.5190   1491.7806     34.3580     10.7552
+      2.5510   1491.7818     34.3592     10.7550
+      2.5640   1491.7837     34.3600     10.7552
+      2.6180   1491.7856     34.3608     10.7552
+      2.6630   1491.7874     34.3608     10.7555
+      2.6850   1491.7889     34.3612     10.7557
+      2.7170   1491.7884     34.3615     10.7553
+      2.7480   1491.7892     34.3614     10.7554
+      2.7610   1491.7893     34.3610     10.7555
+      2.8150   1491.7906     34.3608     10.7557
+      2.8470   1491.7902     34.3606     10.7555
+      2.9140   1491.7907     34.3601     10.7555
+      2.9500   1491.7902     34.3592     10.7555
+      2.9950   1491.7898     34.3585     10.7554
+      3.0120   1491.7901     34.3588     10.7553
+      3.0930   1491.7882     34.3561     10.7553
+      3.1110   1491.7854     34.3539     10.7552
+      3.1780   1491.7781     34.3466     10.7553
+      3.1920   1491.7730     34.3422     10.7553
+      3.2460   1491.7626     34.3337     10.7550
+      3.2590   1491.7586     34.3297     10.7552
+      3.3130   1491.7586     34.3289     10.7552
+      3.3260   1491.7591     34.3292     10.7552
+      3.3430   1491.6918     34.3068     10.7437
+      3.3730   1491.7193     34.3061     10.7516
+      3.3860   1491.8408     34.4076     10.7512
+      3.4090   1491.8427     34.4082     10.7514
+      3.4220   1491.8458     34.4083     10.7522
+      3.4400   1491.8473     34.4084     10.7525
+      3.4540   1491.8471     34.4078     10.7526
+      3.4760   1491.8465     34.4081     10.7522
+      3.4780   1491.8617     34.4096     10.7560
+      3.5230   1491.8571     34.4104     10.7542
+      3.5410   1491.8435     34.4109     10.7501
+      3.5540   1491.8449     34.4104     10.7506
+      3.5760   1491.8456     34.4104     10.7507
+      3.5900   1491.8468     34.4100     10.7511
+      3.6050   1491.8721     34.4106     10.7580
+      3.6180   1491.8728     34.4113     10.7579
+      3.6360   1491.8728     34.4108     10.7580
+      3.6500   1491.8727     34.4111     10.7578
+      3.6720   1491.8740     34.4110     10.7581
+      3.7170   1491.8743     34.4109     10.7580
+      3.7380   1491.8706     34.4105     10.7570
+      3.7470   1491.8643     34.4051     10.7570
+      3.8010   1491.8694     34.4077     10.7573
+      3.8370   1491.8724     34.4091     10.7575
+      3.8420   1491.8730     34.4116     10.7568
+      3.9310   1491.8752     34.4113     10.7571
+      3.9440   1491.8752     34.4114     10.7570
+      3.9620   1491.8759     34.4115     10.7571
+      4.0430   1491.8776     34.4115     10.7572
+      4.0970   1491.8789     34.4112     10.7574
+      4.1420   1491.8794     34.4113     10.7573
+      4.1600   1491.8793     34.4113     10.7572
+      4.1960   1491.8803     34.4113     10.7573
+      4.2090   1491.8807     34.4112     10.7574
+      4.2720   1491.8814     34.4112     10.7573
+      4.2940   1491.8813     34.4111     10.7572
+      4.3080   1491.8818     34.4110     10.7573
+      4.3260   1491.8814     34.4110     10.7571
+      4.3700   1491.8825     34.4113     10.7571
+      4.3930   1491.8826     34.4111     10.7571
+      4.4060   1491.8830     34.4115     10.7570
+      4.4240   1491.8821     34.4111     10.7568
+      4.4600   1491.8830     34.4111     10.7569
+      4.5360   1491.8845     34.4116     10.7568
+      4.5720   1491.8855     34.4113     10.7570
+      4.5900   1491.8867     34.4115     10.7572
+      4.6260   1491.8863     34.4112     10.7570
+      4.6350   1491.8859     34.4114     10.7568
+      4.6570   1491.8877     34.4117     10.7571
+      4.6890   1491.8884     34.4112     10.7573
+      4.7020   1491.8886     34.4112     10.7573
+      4.7330   1491.8889     34.4113     10.7572
+      4.7560   1491.8882     34.4116     10.7568
+      4.7690   1491.8889     34.4114     10.7570
+      4.7920   1491.8900     34.4114     10.7572
+      4.8230   1491.8896     34.4113     10.7570
+      4.8550   1491.8907     34.4114     10.7571
+      4.8990   1491.8914     34.4114     10.7571
+      4.9220   1491.8917     34.4116     10.7570
+      4.9350   1491.8916     34.4114     10.7570
+      4.9530   1491.8922     34.4116     10.7570
+      4.9670   1491.8921     34.4111     10.7571
+      4.9890   1491.8926     34.4115     10.7570
+      5.0200   1491.8928     34.4115     10.7569
+      5.0340   1491.8927     34.4115     10.7568
+      5.0560   1491.8929     34.4108     10.7570
+      5.0650   1491.8918     34.4112     10.7565
+      5.0880   1491.8923     34.4110     10.7566
+      5.1330   1491.8926     34.4109     10.7565
+      5.2310   1491.8951     34.4114     10.7566
+      5.2540   1491.8962     34.4114     10.7568
+      5.2630   1491.8970     34.4113     10.7570
+      5.2850   1491.8965     34.4115     10.7567
+      5.2980   1491.8977     34.4114     10.7570
+      5.3210   1491.8977     34.4117     10.7568
+      5.3300   1491.8975     34.4114     10.7568
+      5.3520   1491.8986     34.4114     10.7570
+      5.3840   1491.8991     34.4114     10.7570
+      5.3970   1491.8999     34.4110     10.7573
+      5.4280   1491.8996     34.4112     10.7570
+      5.4510   1491.9015     34.4110     10.7575
+      5.4640   1491.9017     34.4110     10.7575
+      5.4820   1491.9020     34.4110     10.7575
+      5.4960   1491.9027     34.4117     10.7574
+      5.5490   1491.9029     34.4114     10.7573
+      5.5850   1491.9049     34.4111     10.7578
+      5.5940   1491.9048     34.4109     10.7578
+      5.6170   1491.9037     34.4114     10.7572
+      5.6260   1491.9031     34.4111     10.7571
+      5.6610   1491.9046     34.4110     10.7574
+      5.6930   1491.9045     34.4113     10.7571
+      5.7150   1491.9040     34.4112     10.7569
+      5.7470   1491.9045     34.4109     10.7570
+      5.7910   1491.9042     34.4112     10.7566
+      5.8590   1491.9057     34.4109     10.7568
+      5.9120   1491.9050     34.4111     10.7563
+      5.9260   1491.9050     34.4112     10.7562
+      5.9570   1491.9066     34.4109     10.7566
+      5.9800   1491.9062     34.4111     10.7563
+      5.9890   1491.9070     34.4111     10.7565
+      6.0110   1491.9068     34.4112     10.7563
+      6.0560   1491.9065     34.4109     10.7561
+      6.0780   1491.9056     34.4110     10.7557
+      6.1460   1491.9070     34.4113     10.7557
+      6.1770   1491.9097     34.4116     10.7562
+      6.2220   1491.9111     34.4113     10.7565
+      6.2440   1491.9113     34.4114     10.7564
+      6.2530   1491.9110     34.4108     10.7565
+      6.2890   1491.9120     34.4111     10.7565
+      6.3110   1491.9120     34.4114     10.7563
+      6.3200   1491.9126     34.4109     10.7566
+      6.3790   1491.9139     34.4114     10.7565
+      6.3880   1491.9123     34.4109     10.7562
+      6.4410   1491.9132     34.4109     10.7562
+      6.4550   1491.9148     34.4111     10.7565
+      6.4770   1491.9143     34.4107     10.7564
+      6.5090   1491.9152     34.4116     10.7562
+      6.5180   1491.9136     34.4104     10.7561
+      6.5400   1491.9137     34.4114     10.7557
+      6.5540   1491.9149     34.4113     10.7560
+      6.5760   1491.9110     34.4107     10.7550
+      6.6070   1491.9158     34.4116     10.7559
+      6.6210   1491.9177     34.4107     10.7567
+      6.6430   1491.9200     34.4111     10.7571
+      6.6520   1491.9183     34.4110     10.7566
+      6.6750   1491.9176     34.4110     10.7563
+      6.6830   1491.9171     34.4114     10.7560
+      6.7060   1491.9189     34.4111     10.7565
+      6.7190   1491.9193     34.4109     10.7566
+      6.7510   1491.9155     34.4100     10.7557
+      6.8490   1491.9187     34.4116     10.7556
+      6.8810   1491.9231     34.4113     10.7568
+      6.9080   1491.9235     34.4109     10.7569
+      6.9390   1491.9250     34.4112     10.7571
+      6.9480   1491.9274     34.4110     10.7578
+      6.9700   1491.9281     34.4113     10.7578
+      7.0150   1491.9302     34.4112     10.7582
+      7.0690   1491.9333     34.4110     10.7589
+      7.1050   1491.9334     34.4109     10.7588
+      7.1450   1491.9339     34.4110     10.7587
+      7.2030   1491.9357     34.4111     10.7589
+      7.2480   1491.9405     34.4110     10.7601
+      7.2710   1491.9401     34.4106     10.7600
+      7.3470   1491.9417     34.4106     10.7601
+      7.3780   1491.9429     34.4106     10.7603
+      7.4370   1491.9440     34.4107     10.7603
+      7.4460   1491.9440     34.4106     10.7603
+      7.4680   1491.9449     34.4110     10.7603
+      7.6120   1491.9477     34.4105     10.7606
+      7.6740   1491.9472     34.4107     10.7601
+      7.7420   1491.9482     34.4106     10.7601
+      7.8000   1491.9491     34.4114     10.7598
+      7.8310   1491.9508     34.4109     10.7603
+      7.8400   1491.9528     34.4104     10.7610
+      7.8630   1491.9530     34.4108     10.7608
+      7.8760   1491.9525     34.4108     10.7606
+      7.8980   1491.9497     34.4105     10.7598
+      7.9070   1491.9545     34.4109     10.7610
+      7.9290   1491.9535     34.4109     10.7606
+      7.9380   1491.9541     34.4107     10.7608
+      7.9970   1491.9542     34.4106     10.7606
+      8.0060   1491.9546     34.4114     10.7604
+      8.0640   1491.9560     34.4111     10.7606
+      8.0950   1491.9577     34.4112     10.7609
+      8.1270   1491.9600     34.4104     10.7617
+      8.1720   1491.9604     34.4107     10.7615
+      8.2030   1491.9626     34.4109     10.7619
+      8.2390   1491.9620     34.4105     10.7617
+      8.3020   1491.9627     34.4105     10.7616
+      8.3290   1491.9619     34.4112     10.7610
+      8.3380   1491.9618     34.4107     10.7611
+      8.3600   1491.9633     34.4108     10.7614
+      8.4050   1491.9645     34.4117     10.7612
+      8.4360   1491.9681     34.4114     10.7622
+      8.4590   1491.9705     34.4110     10.7629
+      8.4940   1491.9719     34.4105     10.7633
+      8.5260   1491.9708     34.4103     10.7629
+      8.5350   1491.9699     34.4103     10.7626
+      8.5570   1491.9687     34.4102     10.7622
+      8.5660   1491.9673     34.4104     10.7617
+      8.6330   1491.9674     34.4104     10.7614
+      8.6650   1491.9674     34.4111     10.7610
+      8.7010   1491.9678     34.4107     10.7611
+      8.7320   1491.9674     34.4105     10.7609
+      8.7590   1491.9651     34.4106     10.7601
+      8.7680   1491.9654     34.4104     10.7602
+      8.8220   1491.9656     34.4116     10.7596
+      8.8310   1491.9669     34.4108     10.7602
+      8.8670   1491.9672     34.4108     10.7601
+      8.8890   1491.9660     34.4101     10.7599
+      8.9200   1491.9692     34.4120     10.7600
+      8.9290   1491.9742     34.4105     10.7619
+      8.9650   1491.9747     34.4110     10.7617
+      8.9970   1491.9767     34.4108     10.7622
+      9.0230   1491.9744     34.4108     10.7614
+      9.0320   1491.9745     34.4108     10.7614
+      9.0550   1491.9790     34.4113     10.7624
+      9.0860   1491.9818     34.4111     10.7631
+      9.0950   1491.9814     34.4107     10.7631
+      9.1220   1491.9814     34.4106     10.7630
+      9.1310   1491.9770     34.4106     10.7617
+      9.1620   1491.9800     34.4115     10.7621
+      9.1940   1491.9822     34.4103     10.7630
+      9.2210   1491.9820     34.4109     10.7626
+      9.2300   1491.9824     34.4105     10.7628
+      9.2610   1491.9811     34.4108     10.7622
+      9.2970   1491.9849     34.4114     10.7629
+      9.3190   1491.9851     34.4101     10.7633
+      9.3280   1491.9822     34.4096     10.7626
+      9.3600   1491.9801     34.4115     10.7612
+      9.3960   1491.9828     34.4112     10.7619
+      9.4270   1491.9826     34.4115     10.7616
+      9.4490   1491.9878     34.4111     10.7631
+      9.4940   1491.9897     34.4109     10.7635
+      9.5260   1491.9905     34.4111     10.7635
+      9.5930   1491.9924     34.4112     10.7637
+      9.6240   1491.9936     34.4109     10.7640
+      9.6510   1491.9949     34.4110     10.7642
+      9.6820   1491.9948     34.4105     10.7642
+      9.6910   1491.9943     34.4111     10.7638
+      9.7140   1491.9958     34.4109     10.7642
+      9.7230   1491.9956     34.4106     10.7642
+      9.7900   1491.9970     34.4108     10.7642
+      9.8570   1491.9980     34.4113     10.7640
+      9.8800   1491.9982     34.4106     10.7642
+      9.9250   1491.9997     34.4106     10.7644
+      9.9470   1491.9997     34.4109     10.7642
+      9.9870   1492.0002     34.4108     10.7642
+     10.0140   1492.0007     34.4108     10.7642
+     10.0230   1492.0011     34.4104     10.7644
+     10.0460   1492.0012     34.4105     10.7643
+     10.0860   1492.0014     34.4110     10.7640
+     10.1890   1492.0035     34.4107     10.7642
+     10.2120   1492.0036     34.4111     10.7640
+     10.2520   1492.0045     34.4107     10.7642
+     10.2790   1492.0046     34.4110     10.7640
+     10.2880   1492.0045     34.4108     10.7640
+     10.3190   1492.0051     34.4108     10.7640
+     10.4180   1492.0067     34.4102     10.7642
+     10.4490   1492.0071     34.4107     10.7640
+     10.4850   1492.0082     34.4114     10.7639
+     10.5070   1492.0076     34.4106     10.7639
+     10.5430   1492.0091     34.4105     10.7642
+     10.5520   1492.0076     34.4106     10.7637
+     10.5750   1492.0093     34.4108     10.7640
+     10.5840   1492.0083     34.4107     10.7637
+     10.6110   1492.0089     34.4108     10.7637
+     10.6150   1492.0083     34.4103     10.7637
+     10.6510   1492.0094     34.4107     10.7637
+     10.6730   1492.0102     34.4111     10.7637
+     10.7140   1492.0116     34.4111     10.7639
+     10.7500   1492.0125     34.4110     10.7640
+     10.7810   1492.0129     34.4109     10.7640
+     10.8170   1492.0130     34.4105     10.7640
+     10.8480   1492.0128     34.4108     10.7637
+     10.8750   1492.0124     34.4107     10.7635
+     10.9150   1492.0123     34.4106     10.7633
+     10.9470   1492.0141     34.4111     10.7635
+     10.9780   1492.0152     34.4110     10.7637
+     11.0140   1492.0146     34.4106     10.7635
+     11.0450   1492.0155     34.4109     10.7635
+     11.0810   1492.0158     34.4110     10.7634
+     11.1130   1492.0166     34.4109     10.7635
+     11.1440   1492.0167     34.4108     10.7634
+     11.2020   1492.0166     34.4108     10.7631
+     11.2110   1492.0178     34.4111     10.7633
+     11.2430   1492.0181     34.4109     10.7633
+     11.2700   1492.0180     34.4105     10.7633
+     11.2790   1492.0183     34.4106     10.7633
+     11.3050   1492.0184     34.4109     10.7631
+     11.3100   1492.0188     34.4112     10.7631
+     11.3370   1492.0182     34.4109     10.7629
+     11.3770   1492.0192     34.4109     10.7630
+     11.4090   1492.0197     34.4111     10.7629
+     11.4440   1492.0205     34.4113     10.7629
+     11.4670   1492.0214     34.4112     10.7631
+     11.4760   1492.0210     34.4113     10.7629
+     11.5070   1492.0232     34.4112     10.7634
+     11.5430   1492.0235     34.4113     10.7633
+     11.5700   1492.0243     34.4113     10.7634
+     11.5740   1492.0245     34.4114     10.7634
+     11.6010   1492.0254     34.4109     10.7637
+     11.6420   1492.0246     34.4111     10.7632
+     11.6690   1492.0257     34.4111     10.7634
+     11.6730   1492.0261     34.4113     10.7634
+     11.7310   1492.0269     34.4112     10.7634
+     11.7400   1492.0267     34.4109     10.7634
+     11.7670   1492.0271     34.4109     10.7634
+     11.7720   1492.0273     34.4110     10.7634
+     11.7990   1492.0288     34.4110     10.7637
+     11.8390   1492.0306     34.4113     10.7639
+     11.8700   1492.0301     34.4111     10.7637
+     11.8970   1492.0313     34.4108     10.7640
+     11.9060   1492.0312     34.4112     10.7638
+     11.9330   1492.0311     34.4110     10.7637
+     11.9380   1492.0323     34.4114     10.7639
+     11.9740   1492.0332     34.4107     10.7642
+     12.0050   1492.0348     34.4111     10.7644
+     12.0630   1492.0352     34.4112     10.7642
+     12.0720   1492.0361     34.4112     10.7644
+     12.1040   1492.0366     34.4109     10.7645
+     12.1350   1492.0370     34.4111     10.7644
+     12.1710   1492.0376     34.4111     10.7644
+     12.1980   1492.0380     34.4108     10.7645
+     12.2020   1492.0386     34.4106     10.7647
+     12.2380   1492.0377     34.4108     10.7642
+     12.2690   1492.0385     34.4111     10.7642
+     12.3010   1492.0391     34.4111     10.7642
+     12.3640   1492.0398     34.4108     10.7642
+     12.3680   1492.0392     34.4109     10.7640
+     12.3950   1492.0406     34.4111     10.7642
+     12.4260   1492.0416     34.4109     10.7644
+     12.4350   1492.0419     34.4110     10.7644
+     12.4620   1492.0412     34.4112     10.7640
+     12.4670   1492.0420     34.4104     10.7645
+     12.5250   1492.0435     34.4108     10.7645
+     12.5340   1492.0426     34.4108     10.7642
+     12.6010   1492.0443     34.4107     10.7644
+     12.6280   1492.0451     34.4110     10.7644
+     12.6640   1492.0459     34.4109     10.7645
+     12.7000   1492.0464     34.4111     10.7644
+     12.7270   1492.0461     34.4111     10.7642
+     12.7310   1492.0464     34.4107     10.7644
+     12.7580   1492.0461     34.4112     10.7640
+     12.7670   1492.0473     34.4112     10.7643
+     12.7940   1492.0473     34.4111     10.7642
+     12.7990   1492.0480     34.4108     10.7645
+     12.8300   1492.0477     34.4110     10.7642
+     12.8970   1492.0497     34.4111     10.7644
+     12.9240   1492.0497     34.4110     10.7643
+     12.9290   1492.0504     34.4110     10.7645
+     12.9650   1492.0495     34.4106     10.7642
+     12.9910   1492.0500     34.4112     10.7640
+     12.9960   1492.0512     34.4110     10.7644
+     13.0950   1492.0528     34.4110     10.7644
+     13.1220   1492.0530     34.4113     10.7642
+     13.1300   1492.0533     34.4109     10.7644
+     13.1570   1492.0532     34.4110     10.7642
+     13.1620   1492.0541     34.4111     10.7644
+     13.1930   1492.0547     34.4109     10.7645
+     13.2200   1492.0545     34.4112     10.7642
+     13.2290   1492.0553     34.4109     10.7645
+     13.2610   1492.0549     34.4110     10.7642
+     13.2870   1492.0558     34.4108     10.7644
+     13.2920   1492.0557     34.4112     10.7642
+     13.3230   1492.0558     34.4109     10.7642
+     13.3280   1492.0555     34.4106     10.7642
+     13.3590   1492.0568     34.4112     10.7642
+     13.3860   1492.0567     34.4108     10.7642
+     13.3950   1492.0565     34.4111     10.7640
+     13.4220   1492.0568     34.4109     10.7640
+     13.4260   1492.0582     34.4109     10.7644
+     13.4530   1492.0585     34.4113     10.7642
+     13.4580   1492.0588     34.4115     10.7642
+     13.4850   1492.0589     34.4112     10.7642
+     13.4940   1492.0597     34.4112     10.7644
+     13.5250   1492.0598     34.4108     10.7644
+     13.5570   1492.0597     34.4115     10.7640
+     13.5920   1492.0611     34.4110     10.7644
+     13.6190   1492.0614     34.4112     10.7643
+     13.6600   1492.0622     34.4110     10.7644
+     13.6910   1492.0619     34.4109     10.7642
+     13.7580   1492.0641     34.4112     10.7644
+     13.7900   1492.0653     34.4109     10.7647
+     13.8210   1492.0662     34.4112     10.7647
+     13.8530   1492.0660     34.4106     10.7647
+     13.8570   1492.0663     34.4108     10.7647
+     13.8840   1492.0663     34.4110     10.7645
+     13.8880   1492.0664     34.4110     10.7645
+     13.9240   1492.0672     34.4112     10.7645
+     13.9560   1492.0679     34.4113     10.7645
+     13.9870   1492.0677     34.4110     10.7644
+     14.0230   1492.0685     34.4109     10.7645
+     14.0540   1492.0689     34.4108     10.7645
+     14.0860   1492.0706     34.4112     10.7647
+     14.1170   1492.0697     34.4112     10.7643
+     14.1220   1492.0705     34.4112     10.7645
+     14.1490   1492.0702     34.4109     10.7644
+     14.1530   1492.0702     34.4111     10.7643
+     14.1890   1492.0710     34.4107     10.7645
+     14.2200   1492.0715     34.4110     10.7644
+     14.2520   1492.0724     34.4113     10.7644
+     14.2830   1492.0729     34.4110     10.7645
+     14.3190   1492.0734     34.4109     10.7645
+     14.3500   1492.0741     34.4110     10.7645
+     14.3820   1492.0743     34.4108     10.7645
+     14.4180   1492.0746     34.4111     10.7643
+     14.4530   1492.0757     34.4112     10.7644
+     14.4850   1492.0762     34.4109     10.7645
+     14.5160   1492.0767     34.4109     10.7645
+     14.5520   1492.0773     34.4109     10.7645
+     14.5840   1492.0777     34.4108     10.7645
+     14.6460   1492.0791     34.4111     10.7645
+     14.6510   1492.0787     34.4110     10.7644
+     14.6780   1492.0802     34.4110     10.7647
+     14.6820   1492.0793     34.4108     10.7645
+     14.7180   1492.0796     34.4108     10.7644
+     14.7760   1492.0814     34.4112     10.7645
+     14.7810   1492.0812     34.4113     10.7644
+     14.8480   1492.0828     34.4108     10.7647
+     14.8800   1492.0829     34.4113     10.7644
+     14.9150   1492.0834     34.4110     10.7645
+     14.9420   1492.0840     34.4114     10.7644
+     14.9470   1492.0842     34.4112     10.7645
+     14.9780   1492.0839     34.4111     10.7643
+     15.0140   1492.0851     34.4110     10.7645
+     15.0410   1492.0857     34.4111     10.7645
+     15.0460   1492.0856     34.4113     10.7644
+     15.0810   1492.0861     34.4109     10.7645
+     15.1130   1492.0877     34.4112     10.7647
+     15.1440   1492.0880     34.4110     10.7647
+     15.2070   1492.0900     34.4112     10.7649
+     15.2110   1492.0884     34.4113     10.7644
+     15.2790   1492.0898     34.4107     10.7647
+     15.3060   1492.0901     34.4111     10.7645
+     15.3100   1492.0907     34.4110     10.7647
+     15.3460   1492.0910     34.4113     10.7645
+     15.4090   1492.0919     34.4115     10.7644
+     15.4450   1492.0927     34.4114     10.7645
+     15.4720   1492.0929     34.4112     10.7645
+     15.4760   1492.0933     34.4114     10.7645
+     15.5080   1492.0936     34.4115     10.7644
+     15.5750   1492.0955     34.4113     10.7647
+     15.6110   1492.0956     34.4115     10.7645
+     15.6420   1492.0961     34.4109     10.7647
+     15.6730   1492.0965     34.4114     10.7645
+     15.7050   1492.0969     34.4113     10.7645
+     15.7090   1492.0969     34.4112     10.7645
+     15.7410   1492.0979     34.4110     10.7647
+     15.7720   1492.0981     34.4113     10.7645
+     15.8080   1492.0987     34.4113     10.7645
+     15.8390   1492.0986     34.4114     10.7643
+     15.8750   1492.1006     34.4114     10.7647
+     15.9070   1492.1012     34.4115     10.7647
+     15.9380   1492.1015     34.4113     10.7647
+     15.9740   1492.1030     34.4109     10.7651
+     16.0010   1492.1024     34.4112     10.7647
+     16.0050   1492.1029     34.4112     10.7648
+     16.0370   1492.1027     34.4109     10.7647
+     16.0730   1492.1038     34.4113     10.7647
+     16.1040   1492.1042     34.4112     10.7647
+     16.2030   1492.1061     34.4109     10.7649
+     16.2340   1492.1063     34.4112     10.7647
+     16.2390   1492.1071     34.4112     10.7649
+     16.2660   1492.1074     34.4111     10.7649
+     16.2700   1492.1066     34.4109     10.7647
+     16.3010   1492.1081     34.4112     10.7649
+     16.3370   1492.1083     34.4114     10.7647
+     16.3690   1492.1094     34.4113     10.7649
+     16.4000   1492.1102     34.4110     10.7651
+     16.4050   1492.1093     34.4110     10.7648
+     16.4360   1492.1100     34.4109     10.7649
+     16.4670   1492.1108     34.4111     10.7649
+     16.5350   1492.1121     34.4113     10.7649
+     16.5660   1492.1120     34.4113     10.7647
+     16.6020   1492.1120     34.4114     10.7645
+     16.6330   1492.1132     34.4114     10.7647
+     16.6690   1492.1141     34.4114     10.7648
+     16.6960   1492.1153     34.4111     10.7651
+     16.7320   1492.1153     34.4112     10.7649
+     16.7680   1492.1158     34.4111     10.7649
+     16.7990   1492.1164     34.4115     10.7648
+     16.8620   1492.1179     34.4116     10.7649
+     16.8670   1492.1175     34.4112     10.7649
+     16.8980   1492.1182     34.4113     10.7649
+     16.9340   1492.1182     34.4108     10.7649
+     16.9610   1492.1191     34.4112     10.7649
+     16.9650   1492.1191     34.4114     10.7648
+     16.9970   1492.1191     34.4113     10.7647
+     17.0280   1492.1198     34.4114     10.7647
+     17.0640   1492.1201     34.4112     10.7647
+     17.0950   1492.1215     34.4113     10.7649
+     17.1270   1492.1226     34.4109     10.7652
+     17.1310   1492.1225     34.4111     10.7651
+     17.1630   1492.1229     34.4116     10.7649
+     17.1940   1492.1238     34.4110     10.7652
+     17.1980   1492.1234     34.4109     10.7651
+     17.2250   1492.1232     34.4104     10.7651
+     17.2300   1492.1240     34.4110     10.7651
+     17.2610   1492.1246     34.4110     10.7651
+     17.2970   1492.1249     34.4108     10.7651
+     17.4270   1492.1270     34.4113     10.7649
+     17.4590   1492.1273     34.4111     10.7649
+     17.4950   1492.1274     34.4113     10.7647
+     17.5260   1492.1284     34.4111     10.7649
+     17.5570   1492.1289     34.4111     10.7649
+     17.5620   1492.1293     34.4114     10.7649
+     17.5930   1492.1291     34.4114     10.7647
+     17.6250   1492.1294     34.4112     10.7647
+     17.6600   1492.1305     34.4110     10.7649
+     17.6920   1492.1314     34.4113     10.7649
+     17.7230   1492.1306     34.4114     10.7645
+     17.7550   1492.1321     34.4110     10.7649
+     17.7590   1492.1317     34.4118     10.7645
+     17.7910   1492.1328     34.4114     10.7648
+     17.8260   1492.1325     34.4110     10.7647
+     17.8580   1492.1338     34.4116     10.7647
+     17.8890   1492.1355     34.4114     10.7651
+     17.9250   1492.1347     34.4114     10.7647
+     17.9560   1492.1353     34.4115     10.7647
+     17.9880   1492.1357     34.4114     10.7647
+     18.0190   1492.1357     34.4110     10.7647
+     18.0240   1492.1365     34.4113     10.7648
+     18.0550   1492.1377     34.4115     10.7649
+     18.0910   1492.1374     34.4108     10.7649
+     18.1180   1492.1373     34.4115     10.7645
+     18.1540   1492.1386     34.4115     10.7647
+     18.1850   1492.1392     34.4116     10.7647
+     18.1900   1492.1393     34.4116     10.7647
+     18.2210   1492.1396     34.4114     10.7647
+     18.2880   1492.1414     34.4114     10.7649
+     18.3200   1492.1419     34.4114     10.7649
+     18.3560   1492.1424     34.4116     10.7648
+     18.3870   1492.1420     34.4111     10.7647
+     18.4180   1492.1431     34.4116     10.7647
+     18.4540   1492.1436     34.4121     10.7645
+     18.4860   1492.1441     34.4112     10.7648
+     18.5170   1492.1451     34.4113     10.7649
+     18.5530   1492.1452     34.4109     10.7649
+     18.5840   1492.1457     34.4115     10.7647
+     18.6200   1492.1469     34.4117     10.7648
+     18.6520   1492.1468     34.4114     10.7647
+     18.6830   1492.1470     34.4112     10.7647
+     18.7140   1492.1481     34.4114     10.7648
+     18.7190   1492.1482     34.4117     10.7647
+     18.7500   1492.1499     34.4115     10.7651
+     18.7820   1492.1493     34.4117     10.7647
+     18.8180   1492.1496     34.4115     10.7647
+     18.8490   1492.1507     34.4114     10.7649
+     18.9160   1492.1519     34.4117     10.7648
+     18.9840   1492.1526     34.4117     10.7647
+     19.0460   1492.1536     34.4111     10.7649
+     19.1140   1492.1550     34.4110     10.7650
+     19.1500   1492.1557     34.4114     10.7649
+     19.2120   1492.1561     34.4114     10.7647
+     19.2480   1492.1571     34.4118     10.7647
+     19.3110   1492.1577     34.4114     10.7647
+     19.3780   1492.1586     34.4118     10.7645
+     19.4460   1492.1611     34.4118     10.7649
+     19.4770   1492.1615     34.4114     10.7650
+     19.5130   1492.1613     34.4116     10.7647
+     19.5440   1492.1622     34.4116     10.7648
+     19.5760   1492.1636     34.4115     10.7651
+     19.6070   1492.1650     34.4113     10.7654
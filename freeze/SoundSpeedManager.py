@@ -1,4 +1,5 @@
 import logging
+import multiprocessing
 
 
 class SisParseFilter(logging.Filter):
@@ -24,5 +25,8 @@ ch.addFilter(SisParseFilter())
 logger.addHandler(ch)
 
 
-from hydroffice.soundspeedmanager import gui
-gui.gui()
+if __name__ == '__main__':
+    multiprocessing.freeze_support()  # the batch import may use a process pool
+
+    from hydroffice.soundspeedmanager import gui
+    gui.gui()
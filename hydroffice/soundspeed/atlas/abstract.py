@@ -1,10 +1,15 @@
 from abc import ABCMeta, abstractmethod
+from datetime import datetime as dt, date
 import os
+import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 
 from hydroffice.soundspeed.base.geodesy import Geodesy
+from hydroffice.soundspeed.profile.profile import Profile
+from hydroffice.soundspeed.profile.profilelist import ProfileList
+from hydroffice.soundspeed.profile.dicts import Dicts
 
 
 class AbstractAtlas(object):
@@ -31,7 +36,363 @@ class AbstractAtlas(object):
     def download_db(self):
         pass
 
+    @abstractmethod
+    def cell_key(self, lat, lon, datestamp=None):
+        """Return a key that identifies the grid cell and the time slice of the query for the passed point"""
+        pass
+
+    def query_many(self, points, server_mode=False):
+        """Query the atlas for a list of (lat, lon, datestamp) points
+
+        Return a list with a ProfileList (or None) for each passed point. The derived atlases may
+        override it to share the data loading among the points.
+        """
+        return [self.query(lat=lat, lon=lon, datestamp=datestamp, server_mode=server_mode)
+                for lat, lon, datestamp in points]
+
+    @staticmethod
+    def _query_date(datestamp):
+        """Convert the passed timestamp to the date used for the query"""
+        if datestamp is None:
+            datestamp = dt.utcnow()
+        if isinstance(datestamp, dt):
+            datestamp = datestamp.date()
+        if not isinstance(datestamp, date):
+            raise RuntimeError("invalid date passed: %s" % type(datestamp))
+        return datestamp
+
     def __repr__(self):
         msg = "  <%s>\n" % self.__class__.__name__
         msg += "      <desc: %s>\n" % self.desc
         return msg
+
+
+class AbstractWoa(AbstractAtlas):
+    """Common abstract WOA atlas
+
+    It provides the nearest-water-node search engine shared by the WOA atlases.
+    """
+
+    __metaclass__ = ABCMeta
+
+    def __init__(self, data_folder, prj):
+        super(AbstractWoa, self).__init__(data_folder=data_folder, prj=prj)
+        # Limits for the grid slabs shared by a batch of queries
+        self.slab_max_nodes = 10000  # larger slabs are not read at once
+        self.slab_max_gap = 8  # gaps (in nodes) among the query windows that are filled to reduce the reads
+
+    @abstractmethod
+    def load_grids(self):
+        pass
+
+    @abstractmethod
+    def grid_coords(self, lat, lon, server_mode=False):
+        pass
+
+    @abstractmethod
+    def _calc_query_indices(self, datestamp):
+        """Set the month and season indices for the passed date"""
+        pass
+
+    @abstractmethod
+    def _read_grid_windows(self, var_name, lat_idxs, lon_idxs):
+        """Return the monthly and seasonal (levels, lat, lon) windows for the passed variable"""
+        pass
+
+    @abstractmethod
+    def _depth_levels(self):
+        """Return the depth levels of the seasonal grids"""
+        pass
+
+    def _safe_lon(self, lon):
+        """Convert the passed longitude to the grid convention"""
+        return lon
+
+    def cell_key(self, lat, lon, datestamp=None):
+        """Return the (lat, lon) grid indices with the month and season indices for the passed point"""
+        self._calc_query_indices(datestamp=self._query_date(datestamp))
+        lat_idx, lon_idx = self.grid_coords(lat=lat, lon=self._safe_lon(lon), server_mode=True)
+        return int(lat_idx), int(lon_idx), self.month_idx, self.season_idx
+
+    def query(self, lat, lon, datestamp=None, server_mode=False):
+        """Query the atlas for passed location and timestamp"""
+        datestamp = self._query_date(datestamp)
+        logger.debug("query: %s @ (%.6f, %.6f)" % (datestamp, lon, lat))
+
+        # check the inputs
+        if (lat is None) or (lon is None) or (datestamp is None):
+            logger.error("invalid query: %s @ (%.6f, %.6f)" % (datestamp.strftime("%Y%m%d"), lon, lat))
+            return None
+        lon = self._safe_lon(lon)
+
+        self.prj.progress.start(text="Retrieve %s data" % self.name.upper(), is_disabled=server_mode)
+
+        if not self.has_data_loaded:
+            if not self.load_grids():
+                self.prj.progress.end()
+                return None
+        self.prj.progress.update(20)
+
+        self._calc_query_indices(datestamp=datestamp)
+
+        # Find the nearest grid node
+        lat_base_idx, lon_base_idx = self.grid_coords(lat=lat, lon=lon, server_mode=server_mode)
+
+        self.prj.progress.update(40)
+
+        lat_idxs, lon_idxs = self._window_indices(lat_base_idx=lat_base_idx, lon_base_idx=lon_base_idx)
+        profiles = self._search_nodes(lat=lat, lon=lon, lat_idxs=lat_idxs, lon_idxs=lon_idxs, datestamp=datestamp)
+
+        self.prj.progress.update(90)
+        self.prj.progress.end()
+        return profiles
+
+    def query_many(self, points, server_mode=False):
+        """Query the atlas for a list of (lat, lon, datestamp) points
+
+        The points are grouped by month/season, and the grid slab covering the points of each group
+        is read once (unless too large, then each point reads its own window).
+        """
+        profiles = [None] * len(points)
+
+        self.prj.progress.start(text="Retrieve %s data" % self.name.upper(), is_disabled=server_mode)
+
+        if not self.has_data_loaded:
+            if not self.load_grids():
+                self.prj.progress.end()
+                return profiles
+
+        # group the points by month/season indices
+        groups = dict()
+        for i, (lat, lon, datestamp) in enumerate(points):
+            datestamp = self._query_date(datestamp)
+            if (lat is None) or (lon is None):
+                logger.error("invalid query: %s @ (%s, %s)" % (datestamp.strftime("%Y%m%d"), lon, lat))
+                continue
+            lon = self._safe_lon(lon)
+            self._calc_query_indices(datestamp=datestamp)
+            lat_base_idx, lon_base_idx = self.grid_coords(lat=lat, lon=lon, server_mode=server_mode)
+            lat_idxs, lon_idxs = self._window_indices(lat_base_idx=lat_base_idx, lon_base_idx=lon_base_idx)
+            groups.setdefault((self.month_idx, self.season_idx), list()).append(
+                (i, lat, lon, datestamp, lat_idxs, lon_idxs))
+        self.prj.progress.update(20)
+
+        for count, ((month_idx, season_idx), group) in enumerate(groups.items()):
+            self.month_idx = month_idx
+            self.season_idx = season_idx
+            logger.debug("group %s/%s: %d points" % (month_idx, season_idx, len(group)))
+
+            slab = self._read_slab(lat_idxs=np.concatenate([g[4] for g in group]),
+                                   lon_idxs=np.concatenate([g[5] for g in group]))
+            for i, lat, lon, datestamp, lat_idxs, lon_idxs in group:
+                profiles[i] = self._search_nodes(lat=lat, lon=lon, lat_idxs=lat_idxs, lon_idxs=lon_idxs,
+                                                 datestamp=datestamp, slab=slab)
+
+            self.prj.progress.update(20 + 70 * (count + 1) // len(groups))
+
+        self.prj.progress.end()
+        return profiles
+
+    def _window_indices(self, lat_base_idx, lon_base_idx):
+        """Return the grid indices of the search window around the passed base node"""
+        lat_idxs = np.arange(lat_base_idx - self.search_radius, lat_base_idx + self.search_radius + 1) % self.lat.size
+        lon_idxs = np.arange(lon_base_idx - self.search_radius, lon_base_idx + self.search_radius + 1) % self.lon.size
+        return lat_idxs, lon_idxs
+
+    def _read_slab(self, lat_idxs, lon_idxs):
+        """Read the grid slab covering the passed indices for the current month/season
+
+        The gaps among the indices are filled when small, so that the slab is read with a few slices.
+        None is returned when the slab is too large.
+        """
+        lat_idxs = self._slab_indices(lat_idxs)
+        lon_idxs = self._slab_indices(lon_idxs)
+        if lat_idxs.size * lon_idxs.size > self.slab_max_nodes:
+            logger.debug("slab too large: %d x %d nodes" % (lat_idxs.size, lon_idxs.size))
+            return None
+
+        grids = dict()
+        for var_name in ['t_an', 's_an', 't_sd', 's_sd']:
+            grids[var_name] = self._read_grid_windows(var_name=var_name, lat_idxs=lat_idxs, lon_idxs=lon_idxs)
+        return lat_idxs, lon_idxs, grids
+
+    def _slab_indices(self, idxs):
+        """Return the sorted indices covering the passed ones, with the small gaps filled"""
+        idxs = np.unique(idxs)
+        fills = [np.arange(a + 1, b) for a, b in zip(idxs[:-1], idxs[1:]) if (b - a) <= self.slab_max_gap]
+        if len(fills) == 0:
+            return idxs
+        return np.union1d(idxs, np.concatenate(fills))
+
+    def _search_nodes(self, lat, lon, lat_idxs, lon_idxs, datestamp, slab=None):
+        """Search the nodes surrounding the requested position to find the closest non-land values"""
+
+        # Check which nodes are at sea (in visiting order: by latitude, then by longitude)
+        sea = self.landsea[np.ix_(lat_idxs, lon_idxs)] != 1
+        if not sea.any():
+            logger.info("possible request on land")
+            return None
+        node_lat_idxs = np.broadcast_to(lat_idxs[:, np.newaxis], sea.shape)[sea]
+        node_lon_idxs = np.broadcast_to(lon_idxs[np.newaxis, :], sea.shape)[sea]
+
+        # calculate the distances to all the grid nodes with a single call
+        node_lats = np.asarray(self.lat[node_lat_idxs], dtype=np.float64)
+        node_lons = np.asarray(self.lon[node_lon_idxs], dtype=np.float64)
+        dists = np.asarray(self.g.distance(np.full(node_lons.size, lon, dtype=np.float64),
+                                           np.full(node_lats.size, lat, dtype=np.float64),
+                                           node_lons, node_lats))
+
+        # Extract the monthly and seasonal profiles for the whole window, then overwrite the top of
+        # the seasonal profiles with the monthly profiles
+        grids = list()
+        for var_name in ['t_an', 's_an', 't_sd', 's_sd']:
+            if slab is None:
+                monthly, seasonal = self._read_grid_windows(var_name=var_name, lat_idxs=lat_idxs, lon_idxs=lon_idxs)
+            else:
+                slab_lat_idxs, slab_lon_idxs, slab_grids = slab
+                rows = np.searchsorted(slab_lat_idxs, lat_idxs)[:, np.newaxis]
+                cols = np.searchsorted(slab_lon_idxs, lon_idxs)[np.newaxis, :]
+                monthly, seasonal = [grid[:, rows, cols] for grid in slab_grids[var_name]]
+            seasonal[0:monthly.shape[0]] = monthly
+            grids.append(seasonal[:, sea])
+
+        values = self._closest_values(dists, *grids)
+
+        # Keep track of the closest valid grid node to report the pseudo-cast position
+        closest = np.argmin(dists)
+        lat_out = self.lat[node_lat_idxs[closest]]
+        lon_out = self.lon[node_lon_idxs[closest]]
+
+        return self._build_profiles(lat_out=lat_out, lon_out=lon_out, datestamp=datestamp, values=values)
+
+    @staticmethod
+    def _closest_values(dists, t, s, t_sd, s_sd):
+        """For each depth level, retrieve the values of the closest node with valid data
+
+        The grids have (levels, nodes) shape and NaN for missing values. The nodes are in visiting order, so
+        that ties in distance are resolved in favor of the first visited node.
+        """
+        levels = np.arange(t.shape[0])
+        with np.errstate(invalid='ignore'):
+            valid_ts = (t < 50.0) & (s < 500.0) & (s >= 0)
+            valid_t_sd = (t_sd < 50.0) & (t_sd > -2)
+            valid_s_sd = (s_sd < 500.0) & (s_sd >= 0)
+
+        node_dists = np.broadcast_to(dists[np.newaxis, :], t.shape)
+        idx_ts = np.ma.masked_array(node_dists, mask=~valid_ts).argmin(axis=1)
+        idx_t_sd = np.ma.masked_array(node_dists, mask=~valid_t_sd).argmin(axis=1)
+        idx_s_sd = np.ma.masked_array(node_dists, mask=~valid_s_sd).argmin(axis=1)
+        found_ts = valid_ts.any(axis=1)
+        found_t_sd = valid_t_sd.any(axis=1)
+        found_s_sd = valid_s_sd.any(axis=1)
+
+        t_out = np.where(found_ts, t[levels, idx_ts], 0.0).astype(np.float64)
+        s_out = np.where(found_ts, s[levels, idx_ts], 0.0).astype(np.float64)
+
+        # the standard deviations are applied in the grid precision
+        with np.errstate(invalid='ignore'):
+            t_min = np.where(found_t_sd, t[levels, idx_t_sd] - t_sd[levels, idx_t_sd], 0.0).astype(np.float64)
+            t_min[t_min < -2.0] = -2.0  # can't have overly cold water
+            t_max = np.where(found_t_sd, t[levels, idx_t_sd] + t_sd[levels, idx_t_sd], 0.0).astype(np.float64)
+            s_min = np.where(found_s_sd, s[levels, idx_s_sd] - s_sd[levels, idx_s_sd], 0.0).astype(np.float64)
+            s_min[s_min < 0] = 0  # Can't have a negative salinity
+            s_max = np.where(found_s_sd, s[levels, idx_s_sd] + s_sd[levels, idx_s_sd], 0.0).astype(np.float64)
+
+        return t_out, s_out, t_min, s_min, t_max, s_max, found_ts, found_t_sd & found_s_sd
+
+    def _build_profiles(self, lat_out, lon_out, datestamp, values):
+        """Populate the output profiles (mean, min and max)"""
+        t, s, t_min, s_min, t_max, s_max, valid, valid_sd = values
+        num_values = t[valid].size
+        logger.debug("valid: %s" % num_values)
+        depth = self._depth_levels()
+        probe_type = Dicts.probe_types[self.name.upper()]
+        utc_time = dt(year=datestamp.year, month=datestamp.month, day=datestamp.day)
+
+        ssp = Profile()
+        ssp.meta.sensor_type = Dicts.sensor_types['Synthetic']
+        ssp.meta.probe_type = probe_type
+        ssp.meta.latitude = lat_out
+        ssp.meta.longitude = lon_out
+        ssp.meta.utc_time = utc_time
+        ssp.meta.original_path = "%s_%s" % (self.name.upper(), datestamp.strftime("%Y%m%d"))
+        ssp.init_data(num_values)
+        ssp.data.depth = depth[0:num_values]
+        ssp.data.temp = t[valid]
+        ssp.data.sal = s[valid]
+        ssp.calc_data_speed()
+        ssp.clone_data_to_proc()
+        ssp.init_sis()
+
+        # - min/max
+        # Isolate realistic values
+        if not valid_sd.all():
+            num_values = int(np.argmin(valid_sd))
+        # -- min
+        ssp_min = Profile()
+        ssp_min.meta.sensor_type = Dicts.sensor_types['Synthetic']
+        ssp_min.meta.probe_type = probe_type
+        ssp_min.meta.latitude = lat_out
+        ssp_min.meta.longitude = lon_out
+        ssp_min.meta.utc_time = utc_time
+        if num_values > 0:
+            ssp_min.init_data(num_values)
+            ssp_min.data.depth = depth[0:num_values]
+            ssp_min.data.temp = t_min[valid][0:num_values]
+            ssp_min.data.sal = s_min[valid][0:num_values]
+            ssp_min.calc_data_speed()
+            ssp_min.clone_data_to_proc()
+            ssp_min.init_sis()
+        else:
+            ssp_min = None
+        # -- max
+        ssp_max = Profile()
+        ssp_max.meta.sensor_type = Dicts.sensor_types['Synthetic']
+        ssp_max.meta.probe_type = probe_type
+        ssp_max.meta.latitude = lat_out
+        ssp_max.meta.longitude = lon_out
+        ssp_max.meta.utc_time = utc_time
+        if num_values > 0:
+            ssp_max.init_data(num_values)
+            ssp_max.data.depth = depth[0:num_values].astype(np.float64)
+            ssp_max.data.temp = t_max[valid][0:num_values]
+            ssp_max.data.sal = s_max[valid][0:num_values]
+            ssp_max.calc_data_speed()
+            ssp_max.clone_data_to_proc()
+            ssp_max.init_sis()
+        else:
+            ssp_max = None
+
+        profiles = ProfileList()
+        profiles.append_profile(ssp)
+        if ssp_min:
+            profiles.append_profile(ssp_min)
+        if ssp_max:
+            profiles.append_profile(ssp_max)
+        profiles.current_index = 0
+
+        return profiles
+
+    @staticmethod
+    def _index_runs(idxs):
+        """Split the passed grid indices into slices of contiguous indices"""
+        runs = list()
+        start = 0
+        for i in range(1, len(idxs) + 1):
+            if (i == len(idxs)) or (idxs[i] != idxs[i - 1] + 1):
+                runs.append(slice(int(idxs[start]), int(idxs[i - 1]) + 1))
+                start = i
+        return runs
+
+    @classmethod
+    def _read_variable_window(cls, var, time_idx, lat_idxs, lon_idxs):
+        """Read a (levels, lat, lon) window from a netCDF variable, with NaN for the missing values
+
+        Each run of contiguous indices is read as a slice, so that a window crossing the grid edges
+        only requires a few reads.
+        """
+        rows = list()
+        for lat_run in cls._index_runs(lat_idxs):
+            cols = [var[time_idx, :, lat_run, lon_run] for lon_run in cls._index_runs(lon_idxs)]
+            rows.append(np.ma.concatenate(cols, axis=2))
+        return np.ma.filled(np.ma.concatenate(rows, axis=1), np.nan)
@@ -0,0 +1,83 @@
+import os
+import shutil
+import time
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RtofsCache(object):
+    """Persistent store of the RTOFS daily data
+
+    Each day has a folder with the grid description (depth levels, latitudes, longitudes) and
+    the temperature/salinity tiles already retrieved, as compressed .npz files. The least recently
+    used days are evicted when more than max_days are stored.
+    """
+
+    grid_name = "grid.npz"
+
+    def __init__(self, folder, max_days=7, tile_size=64):
+        self.folder = folder
+        self.max_days = max_days
+        self.tile_size = tile_size  # in grid nodes, along latitude and longitude
+
+    def day_folder(self, day):
+        return os.path.join(self.folder, day.strftime("%Y%m%d"))
+
+    def has_day(self, day):
+        return os.path.exists(os.path.join(self.day_folder(day), self.grid_name))
+
+    def load_grid(self, day):
+        """Return the (depth levels, latitudes, longitudes, day index) stored for the passed day"""
+        path = os.path.join(self.day_folder(day), self.grid_name)
+        with np.load(path) as data:
+            grid = data['d'], data['lat'], data['lon'], int(data['day_idx'])
+        self._touch(day)
+        return grid
+
+    def save_grid(self, day, d, lat, lon, day_idx):
+        folder = self.day_folder(day)
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        self._save(os.path.join(folder, self.grid_name),
+                   d=np.ma.filled(d, np.nan), lat=np.ma.filled(lat, np.nan), lon=np.ma.filled(lon, np.nan),
+                   day_idx=day_idx)
+        self._touch(day)
+        self.evict()
+
+    def tile_path(self, day, tile):
+        return os.path.join(self.day_folder(day), "tile_%03d_%03d.npz" % tile)
+
+    def load_tile(self, day, tile):
+        """Return the temperature and salinity of the passed (lat, lon) tile, or None if not stored"""
+        path = self.tile_path(day, tile)
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            return data['t'], data['s']
+
+    def save_tile(self, day, tile, t, s):
+        self._save(self.tile_path(day, tile), t=t, s=s)
+
+    def evict(self):
+        """Remove the least recently used days in excess"""
+        days = [name for name in os.listdir(self.folder) if os.path.exists(os.path.join(self.folder, name,
+                                                                                          self.grid_name))]
+        if len(days) <= self.max_days:
+            return
+        days.sort(key=lambda name: os.path.getmtime(os.path.join(self.folder, name)), reverse=True)
+        for name in days[self.max_days:]:
+            logger.debug("evicting RTOFS day: %s" % name)
+            shutil.rmtree(os.path.join(self.folder, name), ignore_errors=True)
+
+    def _touch(self, day):
+        now = time.time()
+        os.utime(self.day_folder(day), (now, now))
+
+    @staticmethod
+    def _save(path, **arrays):
+        # write to a temporary file first, so that an interrupted write does not leave a corrupted file
+        tmp_path = path + ".tmp.npz"
+        np.savez_compressed(tmp_path, **arrays)
+        os.replace(tmp_path, path)
@@ -10,6 +10,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 from hydroffice.soundspeed.atlas.abstract import AbstractAtlas
+from hydroffice.soundspeed.atlas.rtofs.cache import RtofsCache
 from hydroffice.soundspeed.profile.profile import Profile
 from hydroffice.soundspeed.profile.profilelist import ProfileList
 from hydroffice.soundspeed.profile.dicts import Dicts
@@ -30,8 +31,15 @@ class Rtofs(AbstractAtlas):
         # 2000 dBar is the ref depth associated with the potential temperatures in the grid (sigma-2)
         self._ref_p = 2000
 
-        self._has_data_loaded = False  # grids are "loaded" ? (netCDF files are opened)
+        # local store of the retrieved days, so that the server is only accessed for new data
+        self.cache = RtofsCache(folder=os.path.join(self.data_folder, "cache"))
+        # when set, the pre-seeded files in this folder are used in place of the RTOFS server
+        self.source_folder = None
+
+        self._has_data_loaded = False  # grids are "loaded" ? (from the cache or with netCDF files opened)
         self._last_loaded_day = date(1900, 1, 1)  # some silly day in the past
+        self._data_day = None  # the day of the loaded data (it may be the day before the requested one)
+        self._tiles = dict()  # the tiles of the loaded day already retrieved
         self._file_temp = None
         self._file_sal = None
         self._day_idx = None
@@ -61,20 +69,6 @@ class Rtofs(AbstractAtlas):
         if not self._download_files(datestamp=datestamp, server_mode=server_mode):
             return False
 
-        try:
-            # Now get latitudes, longitudes and depths for x,y,z referencing
-            self._d = self._file_temp.variables['lev'][:]
-            self._lat = self._file_temp.variables['lat'][:]
-            self._lon = self._file_temp.variables['lon'][:]
-            # logger.debug('d:(%s)\n%s' % (self.d.shape, self.d))
-            # logger.debug('lat:(%s)\n%s' % (self.lat.shape, self.lat))
-            # logger.debug('lon:(%s)\n%s' % (self.lon.shape, self.lon))
-
-        except Exception as e:
-            logger.error("troubles in variable lookup for lat/long grid and/or depth: %s" % e)
-            self.clear_data()
-            return False
-
         self._lat_0 = self._lat[0]
         self._lat_step = self._lat[1] - self._lat_0
         self._lon_0 = self._lon[0]
@@ -99,11 +93,61 @@ class Rtofs(AbstractAtlas):
             return None
 
         try:
-            lat_idx, lon_idx = self._grid_coords(lat, lon, datestamp=datestamp, server_mode=server_mode)
+            self._grid_coords(lat, lon, datestamp=datestamp, server_mode=server_mode)
         except TypeError as e:
             logger.critical("while converting location to grid coords, %s" % e)
             return None
 
+        self.prj.progress.start(text="Retrieve RTOFS data", is_disabled=server_mode)
+        try:
+            return self._lookup(lat, lon, datestamp=datestamp)
+        finally:  # the tiles retrieval may raise
+            self.prj.progress.end()
+
+    def query_many(self, points, server_mode=False):
+        """Query RTOFS for a list of (lat, lon, datestamp) points
+
+        The points are grouped by day, so that the data set of each day is loaded only once (and each tile
+        of the grids is read only once for all the points of the day).
+        """
+        profiles = [None] * len(points)
+
+        days = dict()
+        for i, (lat, lon, datestamp) in enumerate(points):
+            if (lat is None) or (lon is None):
+                logger.error("invalid query: %s @ (%s, %s)" % (datestamp, lon, lat))
+                continue
+            days.setdefault(self._query_date(datestamp), list()).append(i)
+
+        for day in sorted(days.keys()):
+
+            try:
+                if not self.download_db(day, server_mode=server_mode):
+                    raise RuntimeError('troubles in db download')
+            except RuntimeError as e:
+                logger.warning("unable to retrieve RTOFS data for %s: %s" % (day, e))
+                continue  # no data set for this day
+
+            self.prj.progress.start(text="Retrieve RTOFS data for %s" % day, is_disabled=server_mode)
+            quantum = 100.0 / len(days[day])
+            try:
+                for i in days[day]:
+                    lat, lon, _ = points[i]
+                    try:
+                        profiles[i] = self._lookup(lat, lon, datestamp=day)
+                    except (RuntimeError, TypeError) as e:
+                        logger.warning("unable to retrieve RTOFS data for %s @ (%.6f, %.6f): %s"
+                                       % (day, lon, lat, e))
+                    self.prj.progress.add(quantum=quantum)
+            finally:
+                self.prj.progress.end()
+
+        return profiles
+
+    def _lookup(self, lat, lon, datestamp):
+        """Build the profile for the passed location from the loaded data set (None if there are no data)"""
+        lat_idx, lon_idx = self._grid_indices(lat, lon)
+
         # logger.debug("idx > lat: %s, lon: %s" % (lat_idx, lon_idx))
         lat_s_idx = lat_idx - self._search_half_window
         lat_n_idx = lat_idx + self._search_half_window
@@ -113,22 +157,12 @@ class Rtofs(AbstractAtlas):
         if lon < self._lon_0:  # Make all longitudes safe
             lon += 360.0
 
-        self.prj.progress.start(text="Retrieve RTOFS data", is_disabled=server_mode)
-
         longitudes = np.zeros((self._search_window, self._search_window))
         if (lon_e_idx < self._lon.size) and (lon_w_idx >= 0):
             # logger.info("safe case")
 
             # Need +1 on the north and east indices since it is the "stop" value in these slices
-            t = self._file_temp.variables['temperature'][self._day_idx, :, lat_s_idx:lat_n_idx + 1, lon_w_idx:lon_e_idx + 1]
-            s = self._file_sal.variables['salinity'][self._day_idx, :, lat_s_idx:lat_n_idx + 1, lon_w_idx:lon_e_idx + 1]
-            # Set 'unfilled' elements to NANs (BUT when the entire array has valid data, it returns numpy.ndarray)
-            if isinstance(t, np.ma.core.MaskedArray):
-                t_mask = t.mask
-                t[t_mask] = np.nan
-            if isinstance(s, np.ma.core.MaskedArray):
-                s_mask = s.mask
-                s[s_mask] = np.nan
+            t, s = self._read_window(lat_s_idx, lat_n_idx + 1, lon_w_idx, lon_e_idx + 1)
 
             lons = self._lon[lon_w_idx:lon_e_idx + 1]
             for i in range(self._search_window):
@@ -144,15 +178,7 @@ class Rtofs(AbstractAtlas):
             # logger.info("using lon west/east indices -> %s %s" % (lon_w_idx, lon_e_idx))
 
             # Need +1 on the north and east indices since it is the "stop" value in these slices
-            t_left = self._file_temp.variables['temperature'][self._day_idx, :, lat_s_idx:lat_n_idx + 1, lon_w_idx:lon_e_idx + 1]
-            s_left = self._file_sal.variables['salinity'][self._day_idx, :, lat_s_idx:lat_n_idx + 1, lon_w_idx:lon_e_idx + 1]
-            # Set 'unfilled' elements to NANs (BUT when the entire array has valid data, it returns numpy.ndarray)
-            if isinstance(t_left, np.ma.core.MaskedArray):
-                t_mask = t_left.mask
-                t_left[t_mask] = np.nan
-            if isinstance(s_left, np.ma.core.MaskedArray):
-                s_mask = s_left.mask
-                s_left[s_mask] = np.nan
+            t_left, s_left = self._read_window(lat_s_idx, lat_n_idx + 1, lon_w_idx, lon_e_idx + 1)
 
             lons_left = self._lon[lon_w_idx:lon_e_idx + 1]
             for i in range(self._search_window):
@@ -165,30 +191,21 @@ class Rtofs(AbstractAtlas):
             lon_e_idx = self._search_window - lons_left.size - 1
 
             # Need +1 on the north and east indices since it is the "stop" value in these slices
-            t_right = self._file_temp.variables['temperature'][self._day_idx, :, lat_s_idx:lat_n_idx + 1, lon_w_idx:lon_e_idx + 1]
-            s_right = self._file_sal.variables['salinity'][self._day_idx, :, lat_s_idx:lat_n_idx + 1, lon_w_idx:lon_e_idx + 1]
-            # Set 'unfilled' elements to NANs (BUT when the entire array has valid data, it returns numpy.ndarray)
-            if isinstance(t_right, np.ma.core.MaskedArray):
-                t_mask = t_right.mask
-                t_right[t_mask] = np.nan
-            if isinstance(s_right, np.ma.core.MaskedArray):
-                s_mask = s_right.mask
-                s_right[s_mask] = np.nan
+            t_right, s_right = self._read_window(lat_s_idx, lat_n_idx + 1, lon_w_idx, lon_e_idx + 1)
 
             lons_right = self._lon[lon_w_idx:lon_e_idx + 1]
             for i in range(self._search_window):
                 longitudes[i, lons_left.size:self._search_window] = lons_right
 
             # merge data
-            t = np.zeros((self._file_temp.variables['lev'].size, self._search_window, self._search_window))
+            t = np.zeros((self._d.size, self._search_window, self._search_window))
             t[:, :, 0:lons_left.size] = t_left
             t[:, :, lons_left.size:self._search_window] = t_right
-            s = np.zeros((self._file_temp.variables['lev'].size, self._search_window, self._search_window))
+            s = np.zeros((self._d.size, self._search_window, self._search_window))
             s[:, :, 0:lons_left.size] = s_left
             s[:, :, lons_left.size:self._search_window] = s_right
 
         # logger.info("done data retrieval > calculating nodes distance")
-        self.prj.progress.update(40)
 
         # Calculate distances from requested position to each of the grid node locations
         distances = np.zeros((self._d.size, self._search_window, self._search_window))
@@ -209,8 +226,6 @@ class Rtofs(AbstractAtlas):
         s_mask = np.isnan(s)
         distances[s_mask] = np.nan
 
-        self.prj.progress.update(70)
-
         # Spin through all the depth levels
         temp_pot = np.zeros(self._d.size)
         temp_in_situ = np.zeros(self._d.size)
@@ -252,7 +267,6 @@ class Rtofs(AbstractAtlas):
 
         if num_values == 0:
             logger.info("no data from lookup!")
-            self.prj.progress.end()
             return None
 
         ind = np.nanargmin(distances[0])
@@ -262,8 +276,6 @@ class Rtofs(AbstractAtlas):
         while lon_out > 180.0:
             lon_out -= 360.0
 
-        self.prj.progress.update(90)
-
         # Make a new SV object to return our query in
         ssp = Profile()
         ssp.meta.sensor_type = Dicts.sensor_types['Synthetic']
@@ -282,26 +294,24 @@ class Rtofs(AbstractAtlas):
 
         profiles = ProfileList()
         profiles.append_profile(ssp)
-
-        self.prj.progress.end()
         return profiles
 
     def clear_data(self):
         """Delete the data and reset the last loaded day"""
         logger.debug("clearing data")
         if self._has_data_loaded:
-            self._file_temp.close()
-            self._file_temp = None
-            self._file_sal.close()
-            self._file_sal = None
+            self._close_source()
+            self._tiles = dict()
+            self._d = None
             self._lat = None
             self._lon = None
             self._lat_step = None
             self._lat_0 = None
             self._lon_step = None
             self._lon_0 = None
-        self._has_data_loaded = False  # grids are "loaded" ? (netCDF files are opened)
+        self._has_data_loaded = False  # grids are "loaded" ? (from the cache or with netCDF files opened)
         self._last_loaded_day = date(1900, 1, 1)  # some silly day in the past
+        self._data_day = None
         self._day_idx = None
 
     def __repr__(self):
@@ -347,8 +357,53 @@ class Rtofs(AbstractAtlas):
                   % input_date.strftime("%Y%m%d")
         return url_temp, url_sal
 
+    def _build_source_paths(self, input_date):
+        """make up the paths to the pre-seeded files for salinity and temperature (same layout as the server)"""
+        folder = os.path.join(self.source_folder, 'rtofs_global%s' % input_date.strftime("%Y%m%d"))
+        path_temp = os.path.join(folder, 'rtofs_glo_3dz_nowcast_daily_temp.nc')
+        path_sal = os.path.join(folder, 'rtofs_glo_3dz_nowcast_daily_salt.nc')
+        return path_temp, path_sal
+
+    def _check_source(self, input_date):
+        """check if the data are available on the RTOFS server (or in the pre-seeded folder)"""
+        if self.source_folder is not None:
+            path_temp, path_sal = self._build_source_paths(input_date)
+            return os.path.exists(path_temp) and os.path.exists(path_sal)
+
+        url_ck_temp, url_ck_sal = self._build_check_urls(input_date)
+        return self._check_url(url_ck_temp) and self._check_url(url_ck_sal)
+
+    def _open_source(self, input_date):
+        """Connect with the remote (or pre-seeded) files"""
+        if self.source_folder is not None:
+            url_temp, url_sal = self._build_source_paths(input_date)
+        else:
+            url_temp, url_sal = self._build_opendap_urls(input_date)
+
+        try:
+            self._file_temp = Dataset(url_temp)
+            self.prj.progress.update(60)
+            self._file_sal = Dataset(url_sal)
+            self.prj.progress.update(80)
+            self._day_idx = 2  # usually 3 1-day steps
+
+        except (RuntimeError, IOError):
+            logger.warning("unable to access data: %s" % input_date.strftime("%Y%m%d"))
+            self._close_source()
+            return False
+
+        return True
+
+    def _close_source(self):
+        if self._file_temp is not None:
+            self._file_temp.close()
+            self._file_temp = None
+        if self._file_sal is not None:
+            self._file_sal.close()
+            self._file_sal = None
+
     def _download_files(self, datestamp, server_mode=False):
-        """Actually, just try to connect with the remote files
+        """Load the grids for the passed date, from the local cache or from the remote files
 
         For a given queried date, we may have to use the forecast from the previous
         day since the current nowcast doesn't hold data for today (solved?)
@@ -367,33 +422,38 @@ class Rtofs(AbstractAtlas):
 
         self.prj.progress.start(text="Download RTOFS", is_disabled=server_mode)
 
-        # check if the data are available on the RTOFS server
-        url_ck_temp, url_ck_sal = self._build_check_urls(datestamp)
-        if not (self._check_url(url_ck_temp) and self._check_url(url_ck_sal)):
-
-            datestamp -= timedelta(days=1)
-            url_ck_temp, url_ck_sal = self._build_check_urls(datestamp)
-
-            if not (self._check_url(url_ck_temp) and self._check_url(url_ck_sal)):
+        for day in (datestamp, datestamp - timedelta(days=1)):
 
-                logger.warning('unable to retrieve data from RTOFS server for date: %s and next day' % datestamp)
-                self.clear_data()
-                self.prj.progress.end()
-                return False
-        self.prj.progress.update(30)
+            if self.cache.has_day(day):
+                self._d, self._lat, self._lon, self._day_idx = self.cache.load_grid(day)
+                logger.debug("loaded cached RTOFS data for %s" % day)
+                break
 
-        # Try to download the data grid grids
-        url_temp, url_sal = self._build_opendap_urls(datestamp)
-        # logger.debug('downloading RTOFS data for %s' % datestamp)
-        try:
-            self._file_temp = Dataset(url_temp)
-            self.prj.progress.update(60)
-            self._file_sal = Dataset(url_sal)
-            self.prj.progress.update(80)
-            self._day_idx = 2  # usually 3 1-day steps
+            if self._check_source(day):
+                self.prj.progress.update(30)
+                if not self._open_source(day):
+                    self.clear_data()
+                    self.prj.progress.end()
+                    return False
+
+                try:
+                    # Now get latitudes, longitudes and depths for x,y,z referencing
+                    self._d = self._file_temp.variables['lev'][:]
+                    self._lat = self._file_temp.variables['lat'][:]
+                    self._lon = self._file_temp.variables['lon'][:]
+
+                except Exception as e:
+                    logger.error("troubles in variable lookup for lat/long grid and/or depth: %s" % e)
+                    self._close_source()
+                    self.clear_data()
+                    self.prj.progress.end()
+                    return False
+
+                self.cache.save_grid(day, d=self._d, lat=self._lat, lon=self._lon, day_idx=self._day_idx)
+                break
 
-        except (RuntimeError, IOError):
-            logger.warning("unable to access data: %s" % datestamp.strftime("%Y%m%d"))
+        else:
+            logger.warning('unable to retrieve data from RTOFS server for date: %s and previous day' % datestamp)
             self.clear_data()
             self.prj.progress.end()
             return False
@@ -401,10 +461,76 @@ class Rtofs(AbstractAtlas):
         # success!
         self._has_data_loaded = True
         self._last_loaded_day = datestamp
-        # logger.info("loaded data for %s" % datestamp)
+        self._data_day = day
+        # logger.info("loaded data for %s" % day)
         self.prj.progress.end()
         return True
 
+    def _read_window(self, lat_start, lat_stop, lon_start, lon_stop):
+        """Return the temperature and salinity (levels, lat, lon) for the passed index ranges
+
+        The values are assembled from the tiles of the loaded day, with NaN for no data.
+        """
+        lat_start = max(lat_start, 0)
+        lat_stop = min(lat_stop, self._lat.size)
+        lon_start = max(lon_start, 0)
+        lon_stop = min(lon_stop, self._lon.size)
+        size = self.cache.tile_size
+
+        t = None
+        s = None
+        for tile_lat in range(lat_start // size, (lat_stop - 1) // size + 1):
+            for tile_lon in range(lon_start // size, (lon_stop - 1) // size + 1):
+                tile_t, tile_s = self._load_tile((tile_lat, tile_lon))
+                if t is None:
+                    t = np.full((self._d.size, lat_stop - lat_start, lon_stop - lon_start), np.nan, dtype=tile_t.dtype)
+                    s = np.full((self._d.size, lat_stop - lat_start, lon_stop - lon_start), np.nan, dtype=tile_s.dtype)
+
+                # the overlap between the tile and the window
+                lat_0 = tile_lat * size
+                lon_0 = tile_lon * size
+                lat_a, lat_b = max(lat_start, lat_0), min(lat_stop, lat_0 + size)
+                lon_a, lon_b = max(lon_start, lon_0), min(lon_stop, lon_0 + size)
+                t[:, lat_a - lat_start:lat_b - lat_start, lon_a - lon_start:lon_b - lon_start] = \
+                    tile_t[:, lat_a - lat_0:lat_b - lat_0, lon_a - lon_0:lon_b - lon_0]
+                s[:, lat_a - lat_start:lat_b - lat_start, lon_a - lon_start:lon_b - lon_start] = \
+                    tile_s[:, lat_a - lat_0:lat_b - lat_0, lon_a - lon_0:lon_b - lon_0]
+
+        return t, s
+
+    def _load_tile(self, tile):
+        """Return the temperature and salinity of a tile, retrieving it from the remote files if not cached"""
+        if tile in self._tiles:
+            return self._tiles[tile]
+
+        data = self.cache.load_tile(self._data_day, tile)
+        if data is None:
+            if self._file_temp is None:
+                if not self._open_source(self._data_day):
+                    raise RuntimeError('troubles in retrieving RTOFS data for %s' % self._data_day)
+
+            size = self.cache.tile_size
+            rows = slice(tile[0] * size, (tile[0] + 1) * size)
+            cols = slice(tile[1] * size, (tile[1] + 1) * size)
+            # Set 'unfilled' elements to NANs
+            t = np.ma.filled(self._file_temp.variables['temperature'][self._day_idx, :, rows, cols], np.nan)
+            s = np.ma.filled(self._file_sal.variables['salinity'][self._day_idx, :, rows, cols], np.nan)
+            self.cache.save_tile(self._data_day, tile, t=t, s=s)
+            data = t, s
+
+        self._tiles[tile] = data
+        return data
+
+    def grid_coords(self, lat, lon, datestamp=None, server_mode=False):
+        """Convert the passed position in RTOFS grid coords"""
+        return self._grid_coords(lat, lon, datestamp=self._query_date(datestamp), server_mode=server_mode)
+
+    def cell_key(self, lat, lon, datestamp=None):
+        """Return the (lat, lon) grid indices with the day for the passed point"""
+        datestamp = self._query_date(datestamp)
+        lat_idx, lon_idx = self._grid_coords(lat, lon, datestamp=datestamp, server_mode=True)
+        return lat_idx, lon_idx, datestamp
+
     def _grid_coords(self, lat, lon, datestamp, server_mode=False):
         """Convert the passed position in RTOFS grid coords"""
 
@@ -413,6 +539,10 @@ class Rtofs(AbstractAtlas):
             logger.error("troubles in updating data set for timestamp: %s" % datestamp.strftime("%Y%m%d"))
             raise RuntimeError('troubles in db download')
 
+        return self._grid_indices(lat, lon)
+
+    def _grid_indices(self, lat, lon):
+        """Convert the passed position in grid coords of the loaded data set"""
         # make longitude "safe" since RTOFS grid starts at east longitude 70-ish degrees
         if lon < self._lon_0:
             lon += 360.0
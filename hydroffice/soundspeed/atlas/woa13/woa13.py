@@ -3,18 +3,14 @@ import csv
 import numpy as np
 from netCDF4 import Dataset
 import logging
-from datetime import datetime as dt, date
 
 logger = logging.getLogger(__name__)
 
-from hydroffice.soundspeed.atlas.abstract import AbstractAtlas
+from hydroffice.soundspeed.atlas.abstract import AbstractWoa
 from hydroffice.soundspeed.atlas.ftp import Ftp
-from hydroffice.soundspeed.profile.profile import Profile
-from hydroffice.soundspeed.profile.profilelist import ProfileList
-from hydroffice.soundspeed.profile.dicts import Dicts
 
 
-class Woa13(AbstractAtlas):
+class Woa13(AbstractWoa):
     """WOA13 atlas"""
 
     def __init__(self, data_folder, prj):
@@ -37,6 +33,13 @@ class Woa13(AbstractAtlas):
         self.month_idx = 0
         self.season_idx = 0
 
+        # memory-mapped (lat, lon, depth) grids, keyed by (variable name, grid index)
+        self.cache = dict()
+
+    @property
+    def cache_folder(self):
+        return os.path.join(self.data_folder, "cache")
+
     def is_present(self):
         """Check the presence of one of the db file
 
@@ -134,6 +137,92 @@ class Woa13(AbstractAtlas):
             logger.error("issue in reading the netCDF data: %s" % e)
             return False
 
+        self.has_data_loaded = True
+
+        if os.path.exists(self.cache_folder):
+            self._load_cache()
+
+        return True
+
+    def build_cache(self):
+        """Convert the monthly and seasonal grids into float32 .npy files, then memory-map them
+
+        Each file has a (lat, lon, depth) layout, so that a profile is a single contiguous read.
+        The missing values are stored as NaN. The files already up to date are not converted again.
+        """
+        if not self.has_data_loaded:
+            if not self.load_grids():
+                return False
+
+        if not os.path.exists(self.cache_folder):
+            os.makedirs(self.cache_folder)
+
+        items = list(self._cache_items())
+        self.prj.progress.start(text="Build WOA13 cache")
+        try:
+            for count, (var_name, idx, grid) in enumerate(items):
+                path = self._cache_path(grid=grid, var_name=var_name)
+                if self._is_cache_valid(path=path, grid=grid):
+                    continue
+
+                var = grid.variables[var_name]
+                nr_levels, nr_lats, nr_lons = var.shape[1:]
+                tmp_path = path + ".tmp"
+                out = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float32,
+                                                shape=(nr_lats, nr_lons, nr_levels))
+                # convert by bands of latitudes, so that each write is contiguous
+                band = 32
+                for lat_idx in range(0, nr_lats, band):
+                    values = np.ma.filled(var[0, :, lat_idx:lat_idx + band, :], np.nan).astype(np.float32)
+                    out[lat_idx:lat_idx + band] = np.transpose(values, (1, 2, 0))
+                out.flush()
+                del out
+                os.replace(tmp_path, path)
+                logger.debug("cached: %s" % path)
+
+                self.prj.progress.update(100 * (count + 1) // len(items))
+
+        except Exception as e:
+            logger.error("issue in building the cache: %s" % e)
+            self.prj.progress.end()
+            return False
+
+        self.prj.progress.end()
+        return self._load_cache()
+
+    def _cache_items(self):
+        """Yield the (variable name, grid index, grid) of the monthly and seasonal grids to cache"""
+        for idx in range(1, len(self.t)):  # the annual grid is skipped
+            for var_name in ['t_an', 't_sd']:
+                yield var_name, idx, self.t[idx]
+        for idx in range(len(self.s)):
+            for var_name in ['s_an', 's_sd']:
+                yield var_name, idx, self.s[idx]
+
+    def _cache_path(self, grid, var_name):
+        nc_name = os.path.splitext(os.path.basename(grid.filepath()))[0]
+        return os.path.join(self.cache_folder, "%s_%s.npy" % (nc_name, var_name))
+
+    @staticmethod
+    def _is_cache_valid(path, grid):
+        """A cache file is valid when it is more recent than the netCDF file"""
+        if not os.path.exists(path):
+            return False
+        return os.path.getmtime(path) >= os.path.getmtime(grid.filepath())
+
+    def _load_cache(self):
+        """Memory-map the cached grids, but only if all of them are present and up to date"""
+        cache = dict()
+        for var_name, idx, grid in self._cache_items():
+            path = self._cache_path(grid=grid, var_name=var_name)
+            if not self._is_cache_valid(path=path, grid=grid):
+                logger.info("missing or outdated WOA13 cache: %s" % path)
+                self.cache = dict()
+                return False
+            cache[(var_name, idx)] = np.load(path, mmap_mode='r')
+
+        logger.debug("using WOA13 cache: %s" % self.cache_folder)
+        self.cache = cache
         return True
 
     def get_depth(self, lat, lon):
@@ -172,220 +261,30 @@ class Woa13(AbstractAtlas):
         logger.debug("grid coords: %s %s" % (lat_idx, lon_idx))
         return lat_idx, lon_idx
 
-    def query(self, lat, lon, datestamp=None, server_mode=False):
-        """Query WOA13 for passed location and timestamp"""
-        if datestamp is None:
-            datestamp = dt.utcnow()
-        if isinstance(datestamp, dt):
-            datestamp = datestamp.date()
-        if not isinstance(datestamp, date):
-            raise RuntimeError("invalid date passed: %s" % type(datestamp))
-        logger.debug("query: %s @ (%.6f, %.6f)" % (datestamp, lon, lat))
-
-        # check the inputs
-        if (lat is None) or (lon is None) or (datestamp is None):
-            logger.error("invalid query: %s @ (%.6f, %.6f)" % (datestamp.strftime("%Y%m%d"), lon, lat))
-            return None
-
-        self.prj.progress.start(text="Retrieve WOA13 data", is_disabled=server_mode)
-
-        if not self.has_data_loaded:
-            if not self.load_grids():
-                return None
-        self.prj.progress.update(20)
-
+    def _calc_query_indices(self, datestamp):
         self.calc_indices(month=datestamp.month)
 
-        # Find the nearest grid node
-        lat_base_idx, lon_base_idx = self.grid_coords(lat=lat, lon=lon, server_mode=server_mode)
-        lat_offsets = range(lat_base_idx - self.search_radius, lat_base_idx + self.search_radius + 1)
-        lon_offsets = range(lon_base_idx - self.search_radius, lon_base_idx + self.search_radius + 1)
-
-        self.prj.progress.update(40)
-
-        # Search nodes surrounding the requested position to find the closest non-land
-        t = np.zeros(self.num_levels)
-        s = np.zeros(self.num_levels)
-        t_min = np.zeros(self.num_levels)
-        s_min = np.zeros(self.num_levels)
-        t_max = np.zeros(self.num_levels)
-        s_max = np.zeros(self.num_levels)
-        dist_arr = np.zeros(self.num_levels)
-        dist_t_sd = np.zeros(self.num_levels)
-        dist_s_sd = np.zeros(self.num_levels)
-        dist_arr[:] = 99999999
-        dist_t_sd[:] = 99999999
-        dist_s_sd[:] = 99999999
-        min_dist = 999999999
-        num_visited = 0
-        # These keep track of the closest node found, this will also
-        # be used to populate lat/lon of the cast to be delivered
-        lat_idx = -1
-        lon_idx = -1
-        for this_lat_index in lat_offsets:
-            for this_lon_index in lon_offsets:
-
-                if this_lon_index >= self.lon.size:
-                    # logger.debug("[%s] >= [%s]" % (this_lon_index, self.t[self.month_idx].variables['lon'].size))
-                    this_lon_index -= self.lat.size
-
-                # Check to see if we're at sea or on land
-                if self.landsea[this_lat_index][this_lon_index] == 1:
-                    # logger.debug("at land: %s, %s" % (this_lat_index, this_lon_index))
-                    # from matplotlib import pyplot
-                    # pyplot.imshow(self.landsea, origin='lower')
-                    # pyplot.scatter([this_lon_index], [this_lat_index], c='r', s=40)
-                    # pyplot.show()
-                    continue
+    def _read_grid_windows(self, var_name, lat_idxs, lon_idxs):
+        if self.cache:
+            monthly = self._read_cache_window(self.cache[(var_name, self.month_idx)], lat_idxs, lon_idxs)
+            seasonal = self._read_cache_window(self.cache[(var_name, self.season_idx)], lat_idxs, lon_idxs)
+            return monthly, seasonal
 
-                # calculate the distance to the grid node
-                dist = self.g.distance(lon, lat, self.lon[this_lon_index], self.lat[this_lat_index])
-                # logger.debug("[%s %s] [%s %s]" % (self.lon.shape, self.lat.shape, this_lon_index, this_lat_index))
-                # logger.debug("dist: %s" % dist)
-
-                # Keep track of the closest valid grid node to report the pseudo-cast position
-                if dist < min_dist:
-                    min_dist = dist
-                    lat_idx = this_lat_index
-                    lon_idx = this_lon_index
-
-                # Extract monthly temperature and salinity profile for this location
-                t_profile = self.t[self.month_idx].variables['t_an'][0, :, this_lat_index, this_lon_index]
-                s_profile = self.s[self.month_idx].variables['s_an'][0, :, this_lat_index, this_lon_index]
-                # Extract seasonal temperature and salinity profile for this location
-                t_profile2 = self.t[self.season_idx].variables['t_an'][0, :, this_lat_index, this_lon_index]
-                s_profile2 = self.s[self.season_idx].variables['s_an'][0, :, this_lat_index, this_lon_index]
-
-                # Now do the same for the standard deviation profiles
-                t_sd_profile = self.t[self.month_idx].variables['t_sd'][0, :, this_lat_index, this_lon_index]
-                s_sd_profile = self.s[self.month_idx].variables['s_sd'][0, :, this_lat_index, this_lon_index]
-                t_sd_profile2 = self.t[self.season_idx].variables['t_sd'][0, :, this_lat_index, this_lon_index]
-                s_sd_profile2 = self.s[self.season_idx].variables['s_sd'][0, :, this_lat_index, this_lon_index]
-
-                # Overwrite the top of the seasonal profiles with the monthly profiles
-                t_profile2[0:t_profile.size] = t_profile
-                s_profile2[0:s_profile.size] = s_profile
-                t_sd_profile2[0:t_sd_profile.size] = t_sd_profile
-                s_sd_profile2[0:s_sd_profile.size] = s_sd_profile
-
-                # For each element in the profile, only keep those whose distance is closer than values
-                # found from previous iterations (maintain the closest value at each depth level)
-                # logger.debug("profile sz: %d\n%s" % (t_profile2.size, t_profile2))
-                for i in range(t_profile2.size):
-                    if dist >= dist_arr[i]:
-                        continue
-                    if (t_profile2[i] < 50.0) and (s_profile2[i] < 500.0) and (s_profile2[i] >= 0):
-                        t[i] = t_profile2[i]
-                        s[i] = s_profile2[i]
-                        dist_arr[i] = dist
-
-                # Now do the same thing for the temperature standard deviations
-                for i in range(t_sd_profile2.size):
-                    if dist >= dist_t_sd[i]:
-                        continue
-                    if (t_sd_profile2[i] < 50.0) and (t_sd_profile2[i] > -2):
-                        t_min[i] = t_profile2[i] - t_sd_profile2[i]
-                        if t_min[i] < -2.0:  # can't have overly cold water
-                            t_min[i] = -2.0
-                        t_max[i] = t_profile2[i] + t_sd_profile2[i]
-                        dist_t_sd[i] = dist
-
-                # Now do the same thing for the salinity standard deviations
-                for i in range(s_sd_profile2.size):
-                    if dist >= dist_s_sd[i]:
-                        continue
-                    if (s_sd_profile2[i] < 500.0) and (s_sd_profile2[i] >= 0):
-                        s_min[i] = s_profile2[i] - s_sd_profile2[i]
-                        if s_min[i] < 0:  # Can't have a negative salinity
-                            s_min[i] = 0
-                        s_max[i] = s_profile2[i] + s_sd_profile2[i]
-                        dist_s_sd[i] = dist
-
-                num_visited += 1
-
-        # logger.debug("visited: %s" % num_visited)
-        self.prj.progress.update(90)
-
-        if (lat_idx == -1) and (lon_idx == -1):
-            logger.info("possible request on land")
-            self.prj.progress.end()
-            return None
-
-        lat_out = self.lat[lat_idx]
-        lon_out = self.lon[lon_idx]
-        valid = dist_arr != 99999999
-        num_values = t[valid].size
-        logger.debug("valid: %s" % num_values)
-
-        # populate output profiles
-        ssp = Profile()
-        ssp.meta.sensor_type = Dicts.sensor_types['Synthetic']
-        ssp.meta.probe_type = Dicts.probe_types['WOA13']
-        ssp.meta.latitude = lat_out
-        ssp.meta.longitude = lon_out
-        ssp.meta.utc_time = dt(year=datestamp.year, month=datestamp.month, day=datestamp.day)
-        ssp.init_data(num_values)
-        ssp.data.depth = self.t[self.season_idx].variables['depth'][0:num_values]
-        ssp.data.temp = t[valid]
-        ssp.data.sal = s[valid]
-        ssp.calc_data_speed()
-        ssp.clone_data_to_proc()
-        ssp.init_sis()
-
-        # - min/max
-        # Isolate realistic values
-        for i in range(t_min.size):
-            if dist_t_sd[i] == 99999999 or dist_s_sd[i] == 99999999:
-                num_values = i
-                break
-        # -- min
-        ssp_min = Profile()
-        ssp_min.meta.sensor_type = Dicts.sensor_types['Synthetic']
-        ssp_min.meta.probe_type = Dicts.probe_types['WOA13']
-        ssp_min.meta.latitude = lat_out
-        ssp_min.meta.longitude = lon_out
-        ssp_min.meta.utc_time = dt(year=datestamp.year, month=datestamp.month, day=datestamp.day)
-        if num_values > 0:
-            ssp_min.init_data(num_values)
-            ssp_min.data.depth = self.t[self.season_idx].variables['depth'][0:num_values]
-            ssp_min.data.temp = t_min[valid][0:num_values]
-            ssp_min.data.sal = s_min[valid][0:num_values]
-            ssp_min.calc_data_speed()
-            ssp_min.clone_data_to_proc()
-            ssp_min.init_sis()
-        else:
-            ssp_min = None
-        # -- max
-        ssp_max = Profile()
-        ssp_max.meta.sensor_type = Dicts.sensor_types['Synthetic']
-        ssp_max.meta.probe_type = Dicts.probe_types['WOA13']
-        ssp_max.meta.latitude = lat_out
-        ssp_max.meta.longitude = lon_out
-        ssp_max.meta.utc_time = dt(year=datestamp.year, month=datestamp.month, day=datestamp.day)
-        ssp.meta.original_path = "WOA13_%s" % datestamp.strftime("%Y%m%d")
-        if num_values > 0:
-            ssp_max.init_data(num_values)
-            ssp_max.data.depth = self.t[self.season_idx].variables['depth'][0:num_values].astype(np.float64)
-            ssp_max.data.temp = t_max[valid][0:num_values]
-            ssp_max.data.sal = s_max[valid][0:num_values]
-            ssp_max.calc_data_speed()
-            ssp_max.clone_data_to_proc()
-            ssp_max.init_sis()
+        if var_name.startswith('t'):
+            grids = self.t
         else:
-            ssp_max = None
+            grids = self.s
+        monthly = self._read_variable_window(grids[self.month_idx].variables[var_name], 0, lat_idxs, lon_idxs)
+        seasonal = self._read_variable_window(grids[self.season_idx].variables[var_name], 0, lat_idxs, lon_idxs)
+        return monthly, seasonal
 
-        profiles = ProfileList()
-        profiles.append_profile(ssp)
-        if ssp_min:
-            profiles.append_profile(ssp_min)
-        if ssp_max:
-            profiles.append_profile(ssp_max)
-        profiles.current_index = 0
+    @staticmethod
+    def _read_cache_window(grid, lat_idxs, lon_idxs):
+        """Read a (levels, lat, lon) window from a memory-mapped (lat, lon, depth) grid"""
+        return np.transpose(np.array(grid[np.ix_(lat_idxs, lon_idxs)]), (2, 0, 1))
 
-        # logger.debug("retrieved: %s" % profiles)
-
-        self.prj.progress.end()
-        return profiles
+    def _depth_levels(self):
+        return self.t[self.season_idx].variables['depth']
 
     def clear_data(self):
         """Delete the data and reset the last loaded day"""
@@ -400,6 +299,7 @@ class Woa13(AbstractAtlas):
                 if self.s[i]:
                     self.s[i].close()
             self.s = list()
+            self.cache = dict()
             self.landsea = None
             self.lat = None
             self.lon = None
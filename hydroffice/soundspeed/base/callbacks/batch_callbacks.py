@@ -0,0 +1,60 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+from hydroffice.soundspeed.base.callbacks.abstract_callbacks import AbstractCallbacks
+
+
+class BatchCallbacks(AbstractCallbacks):
+    """Used for unattended processing: no user is there to answer, so the missing values stay missing"""
+
+    def ask_number(self, title="", msg="Enter number", default=0.0,
+                   min_value=-2147483647.0, max_value=2147483647.0, decimals=7):
+        logger.info("no user input in batch mode: %s" % msg)
+        return None
+
+    def ask_text(self, title="", msg="Enter text"):
+        logger.info("no user input in batch mode: %s" % msg)
+        return None
+
+    def ask_date(self):
+        logger.info("no user input in batch mode: date")
+        return None
+
+    def ask_location(self):
+        logger.info("no user input in batch mode: location")
+        return None, None
+
+    def ask_filename(self, saving=True, key_name=None, default_path=".",
+                     title="Choose a path/filename", default_file="",
+                     file_filter="All Files|*.*", multi_file=False):
+        return None
+
+    def ask_directory(self, key_name=None, default_path=".",
+                      title="Browse for folder", message=""):
+        return None
+
+    def ask_location_from_sis(self):
+        return False
+
+    def ask_tss(self):
+        return None
+
+    def ask_draft(self):
+        return None
+
+    def msg_tx_no_verification(self, name, protocol):
+        """Profile transmitted but not verification available"""
+        pass
+
+    def msg_tx_sis_wait(self, name):
+        """Profile transmitted, SIS is waiting for confirmation"""
+        pass
+
+    def msg_tx_sis_confirmed(self, name):
+        """Profile transmitted, SIS confirmed"""
+        pass
+
+    def msg_tx_sis_not_confirmed(self, name, ip):
+        """Profile transmitted, SIS not confirmed"""
+        pass
@@ -114,6 +114,8 @@ class Setup(object):
         self.log_user = db.log_user
         self.log_server = db.log_server
         # client list
+        if self.client_list is not None:
+            self.client_list.close()  # release the socket of the replaced list
         self.client_list = ClientList()  # to reset the list
         for client in db.client_list:
             client_string = "%s:%s:%s:%s" % (client[1], client[2], client[3], client[4])
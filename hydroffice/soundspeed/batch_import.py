@@ -0,0 +1,93 @@
+"""Command-line batch import of survey folders into a project db
+
+Example: sound_speed_import --project season_2016 --recursive /data/2016/casts "/data/2016/xbt/*.edf"
+"""
+import argparse
+import csv
+import sys
+import time
+from multiprocessing import freeze_support
+
+import logging
+logger = logging.getLogger()
+
+from hydroffice.soundspeed.soundspeed import SoundSpeedLibrary
+from hydroffice.soundspeed.base.callbacks.batch_callbacks import BatchCallbacks
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="sound_speed_import",
+                                     description="Import the sound speed profiles in files, folders and glob patterns")
+    parser.add_argument("paths", nargs="+", help="data files, folders or glob patterns")
+    parser.add_argument("-p", "--project", help="project db where to store the profiles (default: current)")
+    parser.add_argument("-f", "--format", dest="data_format",
+                        help="reader to use (default: detected by file extension)")
+    parser.add_argument("-r", "--recursive", action="store_true", help="look for data files in the sub-folders")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of parsing processes")
+    parser.add_argument("--skip-atlas", action="store_true", help="do not retrieve the atlases profiles")
+    parser.add_argument("--dry-run", action="store_true", help="parse the files without storing the profiles")
+    parser.add_argument("--report", help="write the per-file report to this CSV file")
+    parser.add_argument("-v", "--verbose", action="store_true", help="verbose logging")
+    return parser.parse_args(argv)
+
+
+def write_report(path, results):
+    with open(path, "w", newline="") as fod:
+        writer = csv.writer(fod)
+        writer.writerow(["path", "format", "profiles", "parse_time", "stored", "error"])
+        for result in results:
+            writer.writerow([result.path, result.data_format or "", result.nr_profiles,
+                             "%.3f" % result.parse_time if result.parse_time is not None else "",
+                             result.stored, result.error or ""])
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    logger.setLevel(logging.NOTSET)
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.DEBUG if args.verbose else logging.WARNING)
+    ch.setFormatter(logging.Formatter('%(levelname)-9s %(name)s.%(funcName)s:%(lineno)d > %(message)s'))
+    logger.addHandler(ch)
+
+    lib = SoundSpeedLibrary(callbacks=BatchCallbacks())
+    try:
+        if args.project is not None:
+            lib.current_project = args.project
+
+        if args.data_format is not None and args.data_format not in lib.name_readers:
+            print("unknown format: %s (available: %s)" % (args.data_format, ", ".join(lib.name_readers)))
+            return 2
+
+        start_time = time.time()
+        results = lib.import_data_batch(paths=args.paths, data_format=args.data_format, recursive=args.recursive,
+                                        skip_atlas=args.skip_atlas, store=not args.dry_run,
+                                        max_workers=args.workers)
+
+    finally:
+        lib.close()
+
+    for result in results:
+        if result.success:
+            print("OK     %8.3f s  %-12s %3d  %s" % (result.parse_time, result.data_format, result.nr_profiles,
+                                                     result.path))
+        else:
+            print("FAILED %8.3f s  %s: %s" % (result.parse_time or 0.0, result.path, result.error))
+
+    nr_failed = len([result for result in results if not result.success])
+    nr_profiles = sum([result.nr_profiles for result in results])
+    print("%d files, %d failed, %d profiles in %.1f s" % (len(results), nr_failed, nr_profiles,
+                                                           time.time() - start_time))
+    if not args.dry_run and (nr_profiles > 0) and not all([result.stored for result in results if result.success]):
+        print("unable to store the profiles in project: %s" % lib.current_project)
+        nr_failed = len(results)
+
+    if args.report is not None:
+        write_report(args.report, results)
+
+    return 1 if nr_failed > 0 else 0
+
+
+if __name__ == '__main__':
+    freeze_support()
+    sys.exit(main())
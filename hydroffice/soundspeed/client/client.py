@@ -1,12 +1,10 @@
-import time
 import socket
 import logging
 
 logger = logging.getLogger(__name__)
 
 from hydroffice.soundspeed.profile.dicts import Dicts
-from hydroffice.soundspeed.formats.writers.asvp import Asvp
-from hydroffice.soundspeed.formats.writers.calc import Calc
+from hydroffice.soundspeed.client.payloads import Payloads
 
 
 class Client(object):
@@ -19,23 +17,26 @@ class Client(object):
         self.alive = True
         logger.info("client: %s(%s:%s) %s" % (self.name, self.ip, self.port, self.protocol))
 
-    def send_cast(self, prj, server_mode=False):
-        """Send a cast to the """
+    def send_cast(self, prj, server_mode=False, payloads=None, sock_out=None):
+        """Send a cast to the client, optionally reusing the encoded payloads and the output socket"""
         if not self.alive:
             logger.debug("%s[%s:%s:%s] is NOT alive" % (self.name, self.ip, self.port, self.protocol))
             return False
 
         logger.info("transmitting to %s: [%s:%s:%s]" % (self.name, self.ip, self.port, self.protocol))
 
+        if payloads is None:
+            payloads = Payloads()
+
         success = False
         if self.protocol == "HYPACK":
-            success = self.send_hyp_format(prj=prj)
+            success = self.send_hyp_format(prj=prj, payloads=payloads, sock_out=sock_out)
         else:
-            success = self.send_kng_format(prj=prj, server_mode=server_mode)
+            success = self.send_kng_format(prj=prj, server_mode=server_mode, payloads=payloads, sock_out=sock_out)
 
         return success
 
-    def send_kng_format(self, prj, server_mode=False):
+    def send_kng_format(self, prj, server_mode=False, payloads=None, sock_out=None):
         logger.info("using kng format")
         kng_fmt = None
         if self.protocol == "SIS":
@@ -47,27 +48,30 @@ class Client(object):
             kng_fmt = Dicts.kng_formats['S12']
             logger.info("forcing S12 format")
 
-        if not prj.prepare_sis():
-            logger.info("issue in preparing the data")
+        if payloads is None:
+            payloads = Payloads()
+        tx_data = payloads.get(prj=prj, fmt=kng_fmt)
+        if tx_data is None:
             return False
 
-        asvp = Asvp()
-        tx_data = asvp.convert(prj.ssp, fmt=kng_fmt)
-        # print(tx_data)
-
-        return self._transmit(tx_data)
+        return self._transmit(tx_data, sock_out=sock_out)
 
-    def send_hyp_format(self, prj):
+    def send_hyp_format(self, prj, payloads=None, sock_out=None):
         logger.info("using hyp format")
-        calc = Calc()
-        tx_data = calc.convert(prj.ssp)
-        return self._transmit(tx_data)
-
-    def _transmit(self, tx_data):
-        sock_out = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if payloads is None:
+            payloads = Payloads()
+        tx_data = payloads.get(prj=prj, fmt=Payloads.calc_format)
+        return self._transmit(tx_data, sock_out=sock_out)
+
+    def _transmit(self, tx_data, sock_out=None):
+        """Send the data, using the passed socket (if any) or a new one"""
+        if sock_out is None:
+            sock_out = self.make_socket()
+            close = True
+        else:
+            close = False
 
         try:
-            sock_out.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 2 ** 16)
             if isinstance(tx_data, bytes):
                 sock_out.sendto(tx_data, (self.ip, self.port))
             elif isinstance(tx_data, str):
@@ -76,22 +80,28 @@ class Client(object):
                 raise RuntimeError("invalid type of data to tx: %s" % type(tx_data))
 
         except socket.error:
-            sock_out.close()
+            if close:
+                sock_out.close()
             return False
 
-        sock_out.close()
+        if close:
+            sock_out.close()
         return True
 
+    @classmethod
+    def make_socket(cls):
+        sock_out = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock_out.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 2 ** 16)
+        return sock_out
+
     def request_profile_from_sis(self, prj):
+        """Request the current profile from SIS, and return the received SVP datagram (None if not received)"""
         if self.protocol != "SIS":
-            return
+            return None
 
+        prj.listeners.sis.clear_ssp(ips=[self.ip])
         prj.listeners.sis.request_iur(ip=self.ip, port=self.port)
-        wait = prj.setup.rx_max_wait_time
-        count = 0
-        quantum = 2
         logger.info("Waiting ..")
-        while (count < wait) and (not prj.listeners.sis.ssp):
-            time.sleep(quantum)
-            count += quantum
-            logger.info(".. %s sec" % count)
+        ssp = prj.listeners.sis.wait_ssp(ips=[self.ip], timeout=prj.setup.rx_max_wait_time).get(self.ip)
+        logger.info(".. %s" % ("received" if ssp else "nothing received"))
+        return ssp
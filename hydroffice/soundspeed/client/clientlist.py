@@ -1,97 +1,166 @@
 import numpy as np
 import time
+from threading import Thread
 import logging
 
 logger = logging.getLogger(__name__)
 
 from hydroffice.soundspeed.client.client import Client
+from hydroffice.soundspeed.client.payloads import Payloads
 
 
 class ClientList(object):
+    # outcomes of the transmission to a client
+    tx_failed = "failed"
+    tx_not_verifiable = "not verifiable"
+    tx_waiting_operator = "waiting for operator"
+    tx_confirmed = "confirmed"
+    tx_not_matching = "not matching"
+    tx_not_confirmed = "not confirmed"
+
     def __init__(self):
         self.num_clients = 0
         self.clients = list()
         self.last_tx_time = None
+        self.last_tx_report = list()  # (client, outcome) for each client of the last transmission
+
+        # reused among the transmissions
+        self.payloads = Payloads()
+        self._sock_out = None
 
     def add_client(self, client):
         client = Client(client)
         self.clients.append(client)
         self.num_clients += 1
 
+    def close(self):
+        if self._sock_out is not None:
+            self._sock_out.close()
+            self._sock_out = None
+
+    def request_profiles_from_sis(self, prj, clients=None):
+        """Request the current profile to all the SIS clients at once, and return the received SVP datagrams by IP"""
+        if clients is None:
+            clients = self.clients
+        sis_clients = [client for client in clients if client.protocol == "SIS"]
+        ips = list(set([client.ip for client in sis_clients]))
+        if len(ips) == 0:
+            return dict()
+
+        prj.listeners.sis.clear_ssp(ips=ips)
+        requests = [Thread(target=prj.listeners.sis.request_iur, kwargs={'ip': client.ip, 'port': client.port})
+                    for client in sis_clients]
+        for request in requests:
+            request.start()
+
+        logger.info("Waiting for %d clients .." % len(ips))
+        received = prj.listeners.sis.wait_ssp(ips=ips, timeout=prj.setup.rx_max_wait_time)
+        logger.info(".. received from %d clients" % len(received))
+
+        for request in requests:
+            request.join()
+        return received
+
     def transmit_ssp(self, prj, server_mode=False):
+        """Send the current profile to all the clients at once, then wait for the SIS confirmations"""
 
         prj.progress.start(text='Transmitting', is_disabled=server_mode, has_abortion=True)
 
-        # loop through the client list
-        success = True  # false if one tx has troubles
-        prog_quantum = 100 / (len(self.clients) + 1)
-        for client in self.clients:
+        outcomes = dict()
 
-            # clean previously received profile from SIS
-            if client.protocol == "SIS":
-                prj.listeners.sis.ssp = None
+        # clean previously received profiles from SIS
+        sis_ips = list(set([client.ip for client in self.clients if client.protocol == "SIS"]))
+        if len(sis_ips) > 0:
+            prj.listeners.sis.ssp = None
+            prj.listeners.sis.clear_ssp(ips=sis_ips)
 
-            prj.progress.add(prog_quantum)
+        # send to all the clients
+        if self._sock_out is None:
+            self._sock_out = Client.make_socket()
+        to_verify = list()
+        for client in self.clients:
 
-            if not client.send_cast(prj=prj, server_mode=server_mode):
+            if not client.send_cast(prj=prj, server_mode=server_mode, payloads=self.payloads,
+                                    sock_out=self._sock_out):
                 logger.warning('unable to send profile to %s' % client.name)
-                success = False
-                continue
+                outcomes[client] = self.tx_failed
 
-            if client.protocol != "SIS":
-                logger.info("transmitted cast, protocol %s does not allow verification"
-                            % client.protocol)
-                time.sleep(1)
-                if not server_mode:
-                    prj.cb.msg_tx_no_verification(name=client.name, protocol=client.protocol)
-                continue
+            elif client.protocol != "SIS":
+                logger.info("transmitted cast to %s, protocol %s does not allow verification"
+                            % (client.name, client.protocol))
+                outcomes[client] = self.tx_not_verifiable
 
-            if not prj.setup.sis_auto_apply_manual_casts:
-                logger.info("transmitted cast, SIS is waiting for operator confirmation")
-                if not server_mode:
-                    prj.cb.msg_tx_sis_wait(name=client.name)
-                continue
+            elif not prj.setup.sis_auto_apply_manual_casts:
+                logger.info("transmitted cast to %s, SIS is waiting for operator confirmation" % client.name)
+                outcomes[client] = self.tx_waiting_operator
 
+            else:
+                to_verify.append(client)
+        prj.progress.update(30)
+
+        # wait for the echoed casts, matched to the clients by sender IP
+        received = dict()
+        if len(to_verify) > 0:
             logger.debug("waiting for receipt confirmation...")
+            ips = list(set([client.ip for client in to_verify]))
             wait = 0
             wait_max = prj.setup.rx_max_wait_time
-            # For multiple SIS clients, make sure the client IP match with the sender IP.
-            while (not prj.listeners.sis.ssp or client.ip != prj.listeners.sis.sender[0]) and (wait < wait_max):
-                time.sleep(1)
+            while wait < wait_max:
+                received = prj.listeners.sis.wait_ssp(ips=ips, timeout=1)
+                if len(received) == len(ips):
+                    break
                 wait += 1
                 logger.debug("waiting for %s sec" % wait)
 
                 prj.progress.update()
                 if prj.progress.canceled:
                     logger.info("canceled by user")
-                    wait = wait_max
-
-            if prj.listeners.sis.ssp:
-                # The KM SVP datagrams have a bug in their time reporting and
-                # have a 100 second granularity so can't compare times
-                # to ensure it's the same profile.  Comparing the sound speeds instead
-                d_tx = prj.cur.sis.depth[prj.cur.sis_thinned]
-                s_tx = prj.cur.sis.speed[prj.cur.sis_thinned]
-                # print(d_tx, s_tx)
-                s_rx = np.interp(d_tx, prj.listeners.sis.ssp.depth, prj.listeners.sis.ssp.speed)
-                max_diff = max(abs(s_tx - s_rx))
-                if max_diff < 0.2:
-                    self.last_tx_time = prj.listeners.sis.ssp.acquisition_time
-                    logger.debug("reception confirmed: %s" % self.last_tx_time.strftime("%d/%m/%Y, %H:%M:%S"))
-                    if not server_mode:
-                        prj.cb.msg_tx_sis_confirmed(name=client.name)
-                    continue
-                else:
-                    logger.info("casts differ by %.2f m/s" % max_diff)
-                    if not server_mode:
-                        prj.cb.msg_tx_sis_not_confirmed(name=client.name, ip=prj.setup.sis_listen_port)
-                    success = False
-                    continue
+                    break
+
+        elif any([outcome == self.tx_not_verifiable for outcome in outcomes.values()]):
+            time.sleep(1)
+        prj.progress.update(80)
+
+        for client in to_verify:
+            ssp = received.get(client.ip)
+            if ssp is None:
+                logger.warning("reception NOT confirmed by %s: unable to catch the back datagram" % client.name)
+                outcomes[client] = self.tx_not_confirmed
+                continue
+
+            # The KM SVP datagrams have a bug in their time reporting and
+            # have a 100 second granularity so can't compare times
+            # to ensure it's the same profile.  Comparing the sound speeds instead
+            d_tx = prj.cur.sis.depth[prj.cur.sis_thinned]
+            s_tx = prj.cur.sis.speed[prj.cur.sis_thinned]
+            s_rx = np.interp(d_tx, ssp.depth, ssp.speed)
+            max_diff = max(abs(s_tx - s_rx))
+            if max_diff < 0.2:
+                self.last_tx_time = ssp.acquisition_time
+                logger.debug("reception confirmed by %s: %s"
+                             % (client.name, self.last_tx_time.strftime("%d/%m/%Y, %H:%M:%S")))
+                outcomes[client] = self.tx_confirmed
             else:
-                logger.warning("reception NOT confirmed: unable to catch the back datagram")
-                if not server_mode:
-                    prj.cb.msg_tx_sis_not_confirmed(name=client.name, ip=prj.setup.sis_listen_port)
-                success = False
+                logger.info("casts differ by %.2f m/s for %s" % (max_diff, client.name))
+                outcomes[client] = self.tx_not_matching
+
+        # report (in the client list order)
+        self.last_tx_report = [(client, outcomes[client]) for client in self.clients]
+        for client, outcome in self.last_tx_report:
+            logger.info("tx to %s: %s" % (client.name, outcome))
+
+            if server_mode:
+                continue
+            if outcome == self.tx_not_verifiable:
+                prj.cb.msg_tx_no_verification(name=client.name, protocol=client.protocol)
+            elif outcome == self.tx_waiting_operator:
+                prj.cb.msg_tx_sis_wait(name=client.name)
+            elif outcome == self.tx_confirmed:
+                prj.cb.msg_tx_sis_confirmed(name=client.name)
+            elif outcome in [self.tx_not_matching, self.tx_not_confirmed]:
+                prj.cb.msg_tx_sis_not_confirmed(name=client.name, ip=prj.setup.sis_listen_port)
 
         prj.progress.end()
+        success = all([outcome not in [self.tx_failed, self.tx_not_matching, self.tx_not_confirmed]
+                       for _, outcome in self.last_tx_report])
         return success
@@ -0,0 +1,73 @@
+import hashlib
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+from hydroffice.soundspeed.formats.writers.asvp import Asvp
+from hydroffice.soundspeed.formats.writers.calc import Calc
+
+
+class Payloads(object):
+    """Encoded casts for the clients, computed once for each revision of the current profile
+
+    The revision is a digest of the proc and sis samples, and of the metadata written in the payloads.
+    Thus, any edit of the profile invalidates the prepared SIS samples and the encoded payloads.
+    """
+
+    calc_format = "CALC"
+
+    def __init__(self):
+        self._revision = None
+        self._prepared_revision = None
+        self._payloads = dict()
+
+    @classmethod
+    def revision(cls, profile):
+        digest = hashlib.sha1()
+        for samples in [profile.proc, profile.sis]:
+            for name in ['depth', 'speed', 'temp', 'sal', 'source', 'flag']:
+                values = getattr(samples, name)
+                if values is None:
+                    digest.update(b'-')
+                    continue
+                values = np.ascontiguousarray(values)
+                digest.update(("%s%s" % (values.dtype, values.shape)).encode())
+                digest.update(values.tobytes())
+        digest.update(("%s|%r|%r" % (profile.meta.utc_time, profile.meta.latitude,
+                                     profile.meta.longitude)).encode())
+        return digest.digest()
+
+    def get(self, prj, fmt):
+        """Return the payload (as bytes) in the passed Kongsberg format (or 'CALC'), None in case of issues"""
+        revision = self.revision(prj.cur)
+        if revision != self._revision:
+            self._revision = revision
+            self._payloads.clear()
+
+        if fmt in self._payloads:
+            return self._payloads[fmt]
+
+        if fmt == self.calc_format:
+            payload = Calc().convert(prj.ssp)
+
+        else:
+            # the thinned sis samples are prepared only once
+            if revision != self._prepared_revision:
+                if not prj.prepare_sis():
+                    logger.info("issue in preparing the data")
+                    return None
+                self._revision = self._prepared_revision = self.revision(prj.cur)
+                self._payloads.clear()
+
+            payload = Asvp().convert(prj.ssp, fmt=fmt)
+
+        if isinstance(payload, str):
+            payload = payload.encode()
+        self._payloads[fmt] = payload
+        return payload
+
+    def clear(self):
+        self._revision = None
+        self._prepared_revision = None
+        self._payloads.clear()
@@ -1,7 +1,10 @@
 import sqlite3
 import os
+import threading
 import datetime
+import itertools
 import traceback
+from urllib.request import pathname2url
 import numpy as np
 import logging
 
@@ -9,6 +12,7 @@ logger = logging.getLogger(__name__)
 
 from hydroffice.soundspeed import __version__ as version
 from hydroffice.soundspeed import __doc__ as name
+from hydroffice.soundspeed.base.geodesy import Geodesy
 from hydroffice.soundspeed.db.point import Point, convert_point, adapt_point
 from hydroffice.soundspeed.db.plot import PlotDb
 from hydroffice.soundspeed.db.export import ExportDb
@@ -19,19 +23,15 @@ from hydroffice.soundspeed.profile.dicts import Dicts
 class ProjectDb(object):
     """Class that provides an interface to a SQLite db with Sound Speed data"""
 
-    def __init__(self, projects_folder=None, project_name=None):
+    def __init__(self, projects_folder=None, project_name=None, write_lock=None, read_only=False):
 
         # in case that no data folder is passed
         if projects_folder is None:
             projects_folder = os.path.abspath(os.path.curdir)
         self.data_folder = projects_folder
 
-        # in case that none is passed as project name
-        if project_name is None:
-            project_name = "default"
-
         # the passed project name is used to identify the project database to open
-        self.db_path = os.path.join(projects_folder, self.clean_project_name(project_name) + ".db")
+        self.db_path = self.make_db_path(projects_folder=projects_folder, project_name=project_name)
         # backup path
         self.bk_path = self.db_path + '.bk'
         logger.debug('current project db: %s' % self.db_path)
@@ -46,8 +46,24 @@ class ProjectDb(object):
         self.tmp_data = None
         self.tmp_ssp_pk = None
 
+        # serialize the writers (shared among the handles to the same db, see DbPool)
+        if write_lock is None:
+            write_lock = threading.RLock()
+        self.write_lock = write_lock
+
+        # a read-only db (e.g., from another user) is neither tuned nor upgraded
+        self.read_only = read_only
+
         self.reconnect_or_create()
 
+    @classmethod
+    def make_db_path(cls, projects_folder=None, project_name=None):
+        if projects_folder is None:
+            projects_folder = os.path.abspath(os.path.curdir)
+        if project_name is None:
+            project_name = "default"
+        return os.path.join(projects_folder, cls.clean_project_name(project_name) + ".db")
+
     @staticmethod
     def clean_name(some_var):
         return ''.join(char for char in some_var if char.isalnum())
@@ -61,8 +77,16 @@ class ProjectDb(object):
         if self.conn:
             logger.info("already connected")
 
+        if self.read_only:
+            self._connect_read_only()
+            return
+
         if not os.path.exists(self.db_path):
             logger.info("created a new project db")
+            # remove the journal left by a deleted db, since it would be applied to the new one
+            for suffix in ["-wal", "-shm"]:
+                if os.path.exists(self.db_path + suffix):
+                    os.remove(self.db_path + suffix)
 
         try:
             self.conn = sqlite3.connect(self.db_path,
@@ -80,6 +104,39 @@ class ProjectDb(object):
         except sqlite3.Error as e:
             raise RuntimeError("Unable to activate foreign keys: %s" % e)
 
+        try:
+            # write-ahead log: the readers do not block the writer (and vice versa)
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+            self.conn.execute('PRAGMA cache_size=-16384')  # KiB
+            self.conn.execute('PRAGMA mmap_size=268435456')
+
+        except sqlite3.Error as e:
+            logger.warning("Unable to tune the db: %s" % e)
+
+        self._register_types()
+
+        built = self.build_tables()
+        if not isinstance(built, bool):
+            raise RuntimeError("invalid return from 'build_tables' method, must be boolean")
+        if not built:
+            raise RuntimeError("Unable to build tables: the DB is encrypted or is not a database")
+
+    def _connect_read_only(self):
+        """Connect to an existing database without modifying it (no journal mode change, no schema upgrade)"""
+        if not os.path.exists(self.db_path):
+            raise RuntimeError("Unable to connect: missing %s" % self.db_path)
+
+        try:
+            self.conn = sqlite3.connect("file:%s?mode=ro" % pathname2url(self.db_path), uri=True,
+                                        detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+
+        except sqlite3.Error as e:
+            raise RuntimeError("Unable to connect: %s" % e)
+
+        self._register_types()
+
+    def _register_types(self):
         try:
             # Set the row factory
             self.conn.row_factory = sqlite3.Row
@@ -98,12 +155,6 @@ class ProjectDb(object):
         except sqlite3.Error as e:
             raise RuntimeError("Unable to register numpy float adapter: %s - %s" % (type(e), e))
 
-        built = self.build_tables()
-        if not isinstance(built, bool):
-            raise RuntimeError("invalid return from 'build_tables' method, must be boolean")
-        if not built:
-            raise RuntimeError("Unable to build tables: the DB is encrypted or is not a database")
-
     def disconnect(self):
         """ Disconnect from the current database """
         if not self.conn:
@@ -122,6 +173,20 @@ class ProjectDb(object):
     def close(self):
         self.disconnect()
 
+    def checkpoint(self):
+        """Move the content of the write-ahead log into the db file"""
+        if not self.conn:
+            logger.error("missing db connection")
+            return False
+
+        try:
+            self.conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            return True
+
+        except sqlite3.Error as e:
+            logger.error("Unable to checkpoint: %s" % e)
+            return False
+
     def build_tables(self):
         if not self.conn:
             logger.error("missing db connection")
@@ -154,7 +219,21 @@ class ProjectDb(object):
                                   CREATE TABLE IF NOT EXISTS ssp_pk(
                                      id INTEGER PRIMARY KEY,
                                      cast_datetime timestamp NOT NULL,
-                                     cast_position point NOT NULL)
+                                     cast_position point NOT NULL,
+                                     latitude real,
+                                     longitude real,
+                                     cast_time real)
+                                  """)
+
+                # numeric position and time (seconds since epoch) for the spatio-temporal queries
+                self._upgrade_ssp_pk()
+                # noinspection SqlResolve
+                self.conn.execute("""
+                                  CREATE INDEX IF NOT EXISTS ssp_pk_position_idx ON ssp_pk(latitude, longitude)
+                                  """)
+                # noinspection SqlResolve
+                self.conn.execute("""
+                                  CREATE INDEX IF NOT EXISTS ssp_pk_time_idx ON ssp_pk(cast_time)
                                   """)
 
                 # noinspection SqlResolve
@@ -229,6 +308,36 @@ class ProjectDb(object):
                                         REFERENCES ssp(pk))
                                   """)
 
+                # change feed: the last revision at which each cast was stored or removed
+                # noinspection SqlResolve
+                self.conn.execute("""
+                                  CREATE TABLE IF NOT EXISTS ssp_changes(
+                                     revision INTEGER PRIMARY KEY AUTOINCREMENT,
+                                     ssp_pk integer UNIQUE NOT NULL,
+                                     action text NOT NULL)
+                                  """)
+                # noinspection SqlResolve
+                self.conn.execute("""
+                                  CREATE TRIGGER IF NOT EXISTS ssp_stored_trg AFTER INSERT ON ssp
+                                  BEGIN
+                                     INSERT OR REPLACE INTO ssp_changes(ssp_pk, action) VALUES (NEW.pk, 'stored');
+                                  END
+                                  """)
+                # noinspection SqlResolve
+                self.conn.execute("""
+                                  CREATE TRIGGER IF NOT EXISTS ssp_removed_trg AFTER DELETE ON ssp
+                                  BEGIN
+                                     INSERT OR REPLACE INTO ssp_changes(ssp_pk, action) VALUES (OLD.pk, 'removed');
+                                  END
+                                  """)
+
+                # the samples are always retrieved by ssp pk
+                for table in ["data", "proc", "sis"]:
+                    # noinspection SqlResolve
+                    self.conn.execute("""
+                                      CREATE INDEX IF NOT EXISTS %s_ssp_pk_idx ON %s(ssp_pk)
+                                      """ % (table, table))
+
                 # noinspection SqlResolve
                 self.conn.execute("""
                                   CREATE VIEW IF NOT EXISTS ssp_view AS
@@ -257,6 +366,33 @@ class ProjectDb(object):
             logger.error("during building tables, %s: %s" % (type(e), e))
             return False
 
+    def _upgrade_ssp_pk(self):
+        """Add the numeric position and time columns to the ssp_pk table of older dbs, and populate them"""
+        # noinspection SqlResolve
+        columns = [row['name'] for row in self.conn.execute("PRAGMA table_info(ssp_pk)")]
+        for column in ["latitude", "longitude", "cast_time"]:
+            if column not in columns:
+                self.conn.execute("ALTER TABLE ssp_pk ADD COLUMN %s real" % column)
+
+        # noinspection SqlResolve
+        rows = self.conn.execute("""
+                                 SELECT id, cast_datetime, cast_position FROM ssp_pk WHERE cast_time IS NULL
+                                 """).fetchall()
+        if len(rows) == 0:
+            return
+
+        logger.info("adding numeric position and time to %d casts" % len(rows))
+        # noinspection SqlResolve
+        self.conn.executemany("""
+                              UPDATE ssp_pk SET latitude=?, longitude=?, cast_time=? WHERE id=?
+                              """, [(row['cast_position'].y, row['cast_position'].x,
+                                     self.epoch_time(row['cast_datetime']), row['id']) for row in rows])
+
+    @staticmethod
+    def epoch_time(timestamp):
+        """Convert a (naive UTC) datetime to seconds since epoch"""
+        return (timestamp - datetime.datetime(1970, 1, 1)).total_seconds()
+
     def add_casts(self, ssp):
         if not isinstance(ssp, ProfileList):
             raise RuntimeError("not passed a ProfileList, but %s" % type(ssp))
@@ -266,7 +402,7 @@ class ProjectDb(object):
             return False
 
         try:
-            with self.conn:
+            with self.write_lock, self.conn:
 
                 for i, self.tmp_data in enumerate(ssp.l):
 
@@ -332,8 +468,9 @@ class ProjectDb(object):
                 # logger.info("add new spp pk for %s @ %s" % (datetime, point))
                 # noinspection SqlResolve
                 self.conn.execute("""
-                                  INSERT INTO ssp_pk VALUES (NULL, ?, ?)
-                                  """, (datetime, point,))
+                                  INSERT INTO ssp_pk (cast_datetime, cast_position, latitude, longitude, cast_time)
+                                     VALUES (?, ?, ?, ?, ?)
+                                  """, (datetime, point, point.y, point.x, self.epoch_time(datetime),))
         except sqlite3.Error as e:
             logger.error("during ssp pk check, %s: %s" % (type(e), e))
             return False
@@ -356,50 +493,21 @@ class ProjectDb(object):
     def _delete_old_ssp(self, full=False):
         """Delete all the entries with the selected pk, with 'full' also the pk from ssp_pk"""
 
-        try:
-            # noinspection SqlResolve
-            self.conn.execute("""DELETE FROM data WHERE ssp_pk=?""", (self.tmp_ssp_pk, ))
-            # logger.info("deleted %s pk entries from data" % self.tmp_ssp_pk)
-
-        except sqlite3.Error as e:
-            logger.error("during deletion from data, %s: %s" % (type(e), e))
-            return False
-
-        try:
-            # noinspection SqlResolve
-            self.conn.execute("""DELETE FROM proc WHERE ssp_pk=?""", (self.tmp_ssp_pk, ))
-            # logger.info("deleted %s pk entries from proc" % self.tmp_ssp_pk)
-
-        except sqlite3.Error as e:
-            logger.error("during deletion from proc, %s: %s" % (type(e), e))
-            return False
-
-        try:
-            # noinspection SqlResolve
-            self.conn.execute("""DELETE FROM sis WHERE ssp_pk=?""", (self.tmp_ssp_pk, ))
-            # logger.info("deleted %s pk entries from sis" % self.tmp_ssp_pk)
-
-        except sqlite3.Error as e:
-            logger.error("during deletion from sis, %s: %s" % (type(e), e))
-            return False
-
-        try:
-            # noinspection SqlResolve
-            self.conn.execute("""DELETE FROM ssp WHERE pk=?""", (self.tmp_ssp_pk, ))
-            # logger.info("deleted %s pk entry from ssp" % self.tmp_ssp_pk)
-
-        except sqlite3.Error as e:
-            logger.error("during deletion from ssp, %s: %s" % (type(e), e))
-            return False
-
+        statements = [("data", """DELETE FROM data WHERE ssp_pk=?"""),
+                      ("proc", """DELETE FROM proc WHERE ssp_pk=?"""),
+                      ("sis", """DELETE FROM sis WHERE ssp_pk=?"""),
+                      ("ssp", """DELETE FROM ssp WHERE pk=?""")]
         if full:
+            statements.append(("ssp_pk", """DELETE FROM ssp_pk WHERE id=?"""))
+
+        for table, statement in statements:
             try:
                 # noinspection SqlResolve
-                self.conn.execute("""DELETE FROM ssp_pk WHERE id=?""", (self.tmp_ssp_pk, ))
-                # logger.info("deleted %s id entry from ssp_pk" % self.tmp_ssp_pk)
+                self.conn.execute(statement, (self.tmp_ssp_pk, ))
+                # logger.info("deleted %s pk entries from %s" % (self.tmp_ssp_pk, table))
 
             except sqlite3.Error as e:
-                logger.error("during deletion from ssp_pk, %s: %s" % (type(e), e))
+                logger.error("during deletion from %s, %s: %s" % (table, type(e), e))
                 return False
 
         return True
@@ -437,110 +545,48 @@ class ProjectDb(object):
         return True
 
     def _add_data(self):
-
-        sz = self.tmp_data.data.num_samples
-        # logger.info("num samples to add: %s" % sz)
-
-        added_samples = 0
-        for i in range(sz):
-
-            try:
-                # first check if the sample is already present with exactly the same values
-                # noinspection SqlResolve
-                self.conn.execute("""
-                                  INSERT INTO data VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                                  """, (self.tmp_ssp_pk,
-                                        self.tmp_data.data.pressure[i],
-                                        self.tmp_data.data.depth[i],
-                                        self.tmp_data.data.speed[i],
-                                        self.tmp_data.data.temp[i],
-                                        self.tmp_data.data.conductivity[i],
-                                        self.tmp_data.data.sal[i],
-                                        self.tmp_data.data.source[i],
-                                        self.tmp_data.data.flag[i],
-                                        ))
-                added_samples += 1
-            except sqlite3.IntegrityError as e:
-                logger.info("skipping row #%s due to %s: %s" % (i, type(e), e))
-                continue
-            except sqlite3.Error as e:
-                print(self.tmp_data.data.depth[i], type(self.tmp_data.data.depth[i]))
-                # traceback.print_stack()
-                logger.error("during adding ssp raw samples, %s: %s" % (type(e), e))
-                return False
-
-        # logger.info("added %s raw samples" % added_samples)
-        return True
+        return self._add_samples(table="data", samples=self.tmp_data.data, desc="raw")
 
     def _add_proc(self):
-
-        sz = self.tmp_data.proc.num_samples
-        # logger.info("max processed samples to add: %s" % sz)
-
-        added_samples = 0
-        for i in range(sz):
-
-            try:
-                # first check if the sample is already present with exactly the same values
-                # noinspection SqlResolve
-                self.conn.execute("""
-                                  INSERT INTO proc VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                                  """, (self.tmp_ssp_pk,
-                                        self.tmp_data.proc.pressure[i],
-                                        self.tmp_data.proc.depth[i],
-                                        self.tmp_data.proc.speed[i],
-                                        self.tmp_data.proc.temp[i],
-                                        self.tmp_data.proc.conductivity[i],
-                                        self.tmp_data.proc.sal[i],
-                                        self.tmp_data.proc.source[i],
-                                        self.tmp_data.proc.flag[i],
-                                        ))
-                added_samples += 1
-
-            except sqlite3.IntegrityError as e:
-                logger.info("skipping row #%s due to %s: %s" % (i, type(e), e))
-                continue
-            except sqlite3.Error as e:
-                logger.error("during adding ssp processed samples, %s: %s" % (type(e), e))
-                return False
-
-        # logger.info("added %s processed samples" % added_samples)
-        return True
+        return self._add_samples(table="proc", samples=self.tmp_data.proc, desc="processed")
 
     def _add_sis(self):
+        return self._add_samples(table="sis", samples=self.tmp_data.sis, desc="sis")
 
-        sz = self.tmp_data.sis.num_samples
-        # logger.info("max sis samples to add: %s" % sz)
+    def _add_samples(self, table, samples, desc):
+        """Bulk insert of the samples in the passed table, with rows built from the sample arrays"""
 
-        added_samples = 0
-        for i in range(sz):
+        sz = samples.num_samples
+        # logger.info("num %s samples to add: %s" % (desc, sz))
+        if sz == 0:
+            return True
 
-            try:
-                # first check if the sample is already present with exactly the same values
-                # noinspection SqlResolve
-                self.conn.execute("""
-                                  INSERT INTO sis VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                                  """, (self.tmp_ssp_pk,
-                                        self.tmp_data.sis.pressure[i],
-                                        self.tmp_data.sis.depth[i],
-                                        self.tmp_data.sis.speed[i],
-                                        self.tmp_data.sis.temp[i],
-                                        self.tmp_data.sis.conductivity[i],
-                                        self.tmp_data.sis.sal[i],
-                                        self.tmp_data.sis.source[i],
-                                        self.tmp_data.sis.flag[i],
-                                        ))
-                added_samples += 1
-
-            except sqlite3.IntegrityError as e:
-                logger.info("skipping row #%s due to %s: %s" % (i, type(e), e))
-                continue
+        # the depth is mandatory: the samples without it are skipped
+        valid = ~np.isnan(samples.depth[:sz])
+        if not valid.all():
+            logger.info("skipping %d %s samples without depth" % (np.count_nonzero(~valid), desc))
+
+        rows = zip(itertools.repeat(self.tmp_ssp_pk),
+                   samples.pressure[:sz][valid].tolist(),
+                   samples.depth[:sz][valid].tolist(),
+                   samples.speed[:sz][valid].tolist(),
+                   samples.temp[:sz][valid].tolist(),
+                   samples.conductivity[:sz][valid].tolist(),
+                   samples.sal[:sz][valid].tolist(),
+                   samples.source[:sz][valid].tolist(),
+                   samples.flag[:sz][valid].tolist())
 
-            except sqlite3.Error as e:
-                logger.error("during adding ssp sis samples, %s: %s" % (type(e), e))
-                return False
+        try:
+            # noinspection SqlResolve
+            self.conn.executemany("""
+                                  INSERT INTO %s VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                                  """ % table, rows)
 
-        # logger.info("added %s sis samples" % added_samples)
+        except sqlite3.Error as e:
+            logger.error("during adding ssp %s samples, %s: %s" % (desc, type(e), e))
+            return False
+
+        # logger.info("added %s %s samples" % (np.count_nonzero(valid), desc))
         return True
 
     def timestamp_list(self):
@@ -565,54 +611,263 @@ class ProjectDb(object):
                 return None
 
     def list_profiles(self):
+        return self._list_profiles()
+
+    def _list_profiles(self, where=None, params=()):
+        """List the profiles in the ssp view, optionally restricted by a condition on the ssp_pk table"""
         if not self.conn:
             logger.error("missing db connection")
             return None
 
         ssp_list = list()
-        # noinspection SqlResolve
-        sql = self.conn.execute("SELECT * FROM ssp_view")
+        if where is None:
+            # noinspection SqlResolve
+            sql = self.conn.execute("SELECT * FROM ssp_view")
+        else:
+            # noinspection SqlResolve
+            sql = self.conn.execute("SELECT * FROM ssp_view WHERE pk IN (SELECT id FROM ssp_pk WHERE %s)" % where,
+                                    params)
 
         try:
             with self.conn:
                 for row in sql:
-
-                    # special handling in case of unknown future sensor type
-                    sensor_type = row['sensor_type']
-                    if sensor_type not in Dicts.sensor_types.values():
-                        sensor_type = Dicts.sensor_types['Future']
-
-                    # special handling in case of unknown future probe type
-                    probe_type = row['probe_type']
-                    if probe_type not in Dicts.probe_types.values():
-                        probe_type = Dicts.probe_types['Future']
-
-                    ssp_list.append((row['pk'],  # 0
-                                     row['cast_datetime'],  # 1
-                                     row['cast_position'],  # 2
-                                     sensor_type,  # 3
-                                     probe_type,  # 4
-                                     row['original_path'],  # 5
-                                     row['institution'],  # 6
-                                     row['survey'],  # 7
-                                     row['vessel'],  # 8
-                                     row['sn'],  # 9
-                                     row['proc_time'],  # 10
-                                     row['proc_info'],  # 11
-                                     row['comments'],  # 12
-                                     row['pressure_uom'],  # 13
-                                     row['depth_uom'],  # 14
-                                     row['speed_uom'],  # 15
-                                     row['temperature_uom'],  # 16
-                                     row['conductivity_uom'],  # 17
-                                     row['salinity_uom'],  # 18
-                                     ))
+                    ssp_list.append(self._profile_row(row))
             return ssp_list
 
         except sqlite3.Error as e:
             logger.error("%s: %s" % (type(e), e))
             return ssp_list
 
+    @staticmethod
+    def _profile_row(row):
+        """Convert a row of the ssp view to a profile tuple"""
+
+        # special handling in case of unknown future sensor type
+        sensor_type = row['sensor_type']
+        if sensor_type not in Dicts.sensor_types.values():
+            sensor_type = Dicts.sensor_types['Future']
+
+        # special handling in case of unknown future probe type
+        probe_type = row['probe_type']
+        if probe_type not in Dicts.probe_types.values():
+            probe_type = Dicts.probe_types['Future']
+
+        return (row['pk'],  # 0
+                row['cast_datetime'],  # 1
+                row['cast_position'],  # 2
+                sensor_type,  # 3
+                probe_type,  # 4
+                row['original_path'],  # 5
+                row['institution'],  # 6
+                row['survey'],  # 7
+                row['vessel'],  # 8
+                row['sn'],  # 9
+                row['proc_time'],  # 10
+                row['proc_info'],  # 11
+                row['comments'],  # 12
+                row['pressure_uom'],  # 13
+                row['depth_uom'],  # 14
+                row['speed_uom'],  # 15
+                row['temperature_uom'],  # 16
+                row['conductivity_uom'],  # 17
+                row['salinity_uom'],  # 18
+                )
+
+    # sort keys for the paginated listing
+    page_sort_keys = {
+        'pk': "v.pk",
+        'cast_datetime': "b.cast_time",
+        'sensor_type': "v.sensor_type",
+        'probe_type': "v.probe_type",
+        'institution': "IFNULL(v.institution, '')",
+        'survey': "IFNULL(v.survey, '')",
+        'vessel': "IFNULL(v.vessel, '')",
+    }
+
+    def list_profiles_page(self, limit=100, cursor=None, sort_by='cast_datetime', descending=False,
+                           start=None, end=None, sensor_type=None, probe_type=None,
+                           vessel=None, survey=None, institution=None):
+        """List a page of profiles, sorted and filtered by the db
+
+        The returned cursor (None after the last page) is passed back to retrieve the next page.
+        """
+        if not self.conn:
+            logger.error("missing db connection")
+            return None, None
+
+        if sort_by not in self.page_sort_keys:
+            logger.error("invalid sort key: %s" % sort_by)
+            return None, None
+        key = self.page_sort_keys[sort_by]
+
+        conditions = list()
+        params = list()
+        if start is not None:
+            conditions.append("b.cast_time >= ?")
+            params.append(self.epoch_time(start))
+        if end is not None:
+            conditions.append("b.cast_time <= ?")
+            params.append(self.epoch_time(end))
+        for column, value in [("sensor_type", sensor_type), ("probe_type", probe_type),
+                              ("vessel", vessel), ("survey", survey), ("institution", institution)]:
+            if value is not None:
+                conditions.append("v.%s = ?" % column)
+                params.append(value)
+
+        # keyset pagination on (sort key, pk)
+        op = "<" if descending else ">"
+        if cursor is not None:
+            conditions.append("(%s %s ? OR (%s = ? AND v.pk %s ?))" % (key, op, key, op))
+            params.extend([cursor[0], cursor[0], cursor[1]])
+
+        where = ""
+        if len(conditions) > 0:
+            where = "WHERE %s" % " AND ".join(conditions)
+        order = "DESC" if descending else "ASC"
+
+        ssp_list = list()
+        try:
+            # noinspection SqlResolve
+            rows = self.conn.execute("""
+                                     SELECT v.*, %s AS sort_key FROM ssp_view v JOIN ssp_pk b ON v.pk=b.id
+                                        %s ORDER BY sort_key %s, v.pk %s LIMIT ?
+                                     """ % (key, where, order, order), params + [limit + 1]).fetchall()
+            for row in rows[:limit]:
+                ssp_list.append(self._profile_row(row))
+
+        except sqlite3.Error as e:
+            logger.error("listing a page of profiles, %s: %s" % (type(e), e))
+            return None, None
+
+        if len(rows) <= limit:
+            return ssp_list, None
+        return ssp_list, (rows[limit - 1]['sort_key'], rows[limit - 1]['pk'])
+
+    def revision(self):
+        """Return the current revision of the change feed"""
+        if not self.conn:
+            logger.error("missing db connection")
+            return None
+
+        # noinspection SqlResolve
+        ret = self.conn.execute("SELECT MAX(revision) FROM ssp_changes").fetchone()[0]
+        if ret is None:
+            return 0
+        return ret
+
+    def changes_since(self, revision):
+        """Return the current revision with the pks stored and removed after the passed revision"""
+        if not self.conn:
+            logger.error("missing db connection")
+            return None, list(), list()
+
+        stored = list()
+        removed = list()
+        try:
+            # noinspection SqlResolve
+            rows = self.conn.execute("""
+                                     SELECT revision, ssp_pk, action FROM ssp_changes WHERE revision > ?
+                                        ORDER BY revision
+                                     """, (revision, )).fetchall()
+        except sqlite3.Error as e:
+            logger.error("retrieving the changes since %s, %s: %s" % (revision, type(e), e))
+            return None, stored, removed
+
+        for row in rows:
+            if row['action'] == 'stored':
+                stored.append(row['ssp_pk'])
+            else:
+                removed.append(row['ssp_pk'])
+            revision = row['revision']
+
+        return revision, stored, removed
+
+    def list_profiles_in_bbox(self, min_lat, min_lon, max_lat, max_lon):
+        """List the profiles within the passed bounding box (crossing the anti-meridian when min_lon > max_lon)"""
+        if min_lon <= max_lon:
+            where = "latitude BETWEEN ? AND ? AND longitude BETWEEN ? AND ?"
+        else:
+            where = "latitude BETWEEN ? AND ? AND (longitude >= ? OR longitude <= ?)"
+        return self._list_profiles(where=where, params=(min_lat, max_lat, min_lon, max_lon))
+
+    def list_profiles_in_time_window(self, start, end):
+        """List the profiles with cast time between the passed datetimes"""
+        return self._list_profiles(where="cast_time BETWEEN ? AND ?",
+                                   params=(self.epoch_time(start), self.epoch_time(end)))
+
+    def list_profiles_in_radius(self, lat, lon, radius):
+        """List the profiles within the passed radius (in meters) from the position, nearest first"""
+        ids, dists = self._casts_around(lat=lat, lon=lon, radius=radius)
+        inside = dists <= radius
+        return self.list_profiles_by_pks(ids[inside][np.argsort(dists[inside], kind='stable')])
+
+    def list_nearest_profiles(self, lat, lon, k=1, timestamp=None, time_weight=1.0):
+        """List the k profiles nearest to the passed position, nearest first
+
+        When a timestamp is passed, the distance also accounts for the time difference (time_weight in m/sec).
+        """
+        radius = 10000.0
+        while True:
+            ids, dists = self._casts_around(lat=lat, lon=lon, radius=radius, timestamp=timestamp,
+                                            time_weight=time_weight)
+            order = np.argsort(dists, kind='stable')[:k]
+            # the casts outside the searched bounding box are farther than the radius
+            if radius >= np.pi * 6371000.0:  # the whole Earth
+                break
+            if (order.size == k) and (dists[order[-1]] <= radius):
+                break
+            radius *= 4.0
+
+        return self.list_profiles_by_pks(ids[order])
+
+    def _casts_around(self, lat, lon, radius, timestamp=None, time_weight=1.0):
+        """Return the ids and distances (in meters, haversine) of the casts in the bounding box of the radius"""
+        if not self.conn:
+            logger.error("missing db connection")
+            return np.zeros(0, dtype=int), np.zeros(0)
+
+        delta_lat = np.degrees(radius / 6371000.0)
+        min_lat = lat - delta_lat
+        max_lat = lat + delta_lat
+        cos_lat = np.cos(np.radians(max(abs(min_lat), abs(max_lat))))
+        if (max_lat >= 90.0) or (min_lat <= -90.0) or (delta_lat >= 180.0 * cos_lat):
+            where = "latitude BETWEEN ? AND ?"
+            params = (min_lat, max_lat)
+        else:
+            delta_lon = delta_lat / cos_lat
+            min_lon = (lon - delta_lon + 180.0) % 360.0 - 180.0
+            max_lon = (lon + delta_lon + 180.0) % 360.0 - 180.0
+            if min_lon <= max_lon:
+                where = "latitude BETWEEN ? AND ? AND longitude BETWEEN ? AND ?"
+            else:
+                where = "latitude BETWEEN ? AND ? AND (longitude >= ? OR longitude <= ?)"
+            params = (min_lat, max_lat, min_lon, max_lon)
+
+        cursor = self.conn.cursor()
+        cursor.row_factory = None  # plain tuples
+        # noinspection SqlResolve
+        rows = cursor.execute("SELECT id, latitude, longitude, cast_time FROM ssp_pk WHERE %s" % where,
+                              params).fetchall()
+        if len(rows) == 0:
+            return np.zeros(0, dtype=int), np.zeros(0)
+
+        values = np.array(rows, dtype=np.float64)
+        dists = Geodesy.haversine(lon, lat, values[:, 2], values[:, 1])
+        if timestamp is not None:
+            dists = np.hypot(dists, time_weight * (values[:, 3] - self.epoch_time(timestamp)))
+        return values[:, 0].astype(int), dists
+
+    def list_profiles_by_pks(self, pks):
+        """List the profiles with the passed ssp pks, in the same order"""
+        pks = [int(pk) for pk in pks]
+        if len(pks) == 0:
+            return list()
+        ssp_list = self._list_profiles(where="id IN (%s)" % ", ".join("?" * len(pks)), params=pks)
+        if ssp_list is None:
+            return None
+        by_pk = dict((row[0], row) for row in ssp_list)
+        return [by_pk[pk] for pk in pks if pk in by_pk]
+
     def profile_by_pk(self, pk):
         if not self.conn:
             logger.error("missing db connection")
@@ -674,22 +929,7 @@ class ProjectDb(object):
 
             # raw data
             try:
-                # noinspection SqlResolve
-                ssp_samples = self.conn.execute("SELECT * FROM data WHERE ssp_pk=?", (pk, )).fetchall()
-                num_samples = len(ssp_samples)
-                ssp.cur.init_data(num_samples)
-                # logger.debug("raw data samples: %s" % num_samples)
-                for i in range(num_samples):
-                    # print(ssp_samples[i])
-
-                    ssp.cur.data.pressure[i] = ssp_samples[i]['pressure']
-                    ssp.cur.data.depth[i] = ssp_samples[i]['depth']
-                    ssp.cur.data.speed[i] = ssp_samples[i]['speed']
-                    ssp.cur.data.temp[i] = ssp_samples[i]['temperature']
-                    ssp.cur.data.conductivity[i] = ssp_samples[i]['conductivity']
-                    ssp.cur.data.sal[i] = ssp_samples[i]['salinity']
-                    ssp.cur.data.source[i] = ssp_samples[i]['source']
-                    ssp.cur.data.flag[i] = ssp_samples[i]['flag']
+                self._load_samples(table="data", pk=pk, samples=ssp.cur.data, init_samples=ssp.cur.init_data)
 
             except sqlite3.Error as e:
                 logger.error("reading raw samples for %s pk, %s: %s" % (pk, type(e), e))
@@ -697,21 +937,7 @@ class ProjectDb(object):
 
             # proc data
             try:
-                # noinspection SqlResolve
-                ssp_samples = self.conn.execute("SELECT * FROM proc WHERE ssp_pk=?", (pk, )).fetchall()
-                num_samples = len(ssp_samples)
-                ssp.cur.init_proc(num_samples)
-                # logger.debug("proc data samples: %s" % num_samples)
-                for i in range(num_samples):
-                    # print(ssp_samples[i])
-                    ssp.cur.proc.pressure[i] = ssp_samples[i]['pressure']
-                    ssp.cur.proc.depth[i] = ssp_samples[i]['depth']
-                    ssp.cur.proc.speed[i] = ssp_samples[i]['speed']
-                    ssp.cur.proc.temp[i] = ssp_samples[i]['temperature']
-                    ssp.cur.proc.conductivity[i] = ssp_samples[i]['conductivity']
-                    ssp.cur.proc.sal[i] = ssp_samples[i]['salinity']
-                    ssp.cur.proc.source[i] = ssp_samples[i]['source']
-                    ssp.cur.proc.flag[i] = ssp_samples[i]['flag']
+                self._load_samples(table="proc", pk=pk, samples=ssp.cur.proc, init_samples=ssp.cur.init_proc)
 
             except sqlite3.Error as e:
                 logger.error("reading raw samples for %s pk, %s: %s" % (pk, type(e), e))
@@ -719,21 +945,8 @@ class ProjectDb(object):
 
             # sis data
             try:
-                # noinspection SqlResolve
-                ssp_samples = self.conn.execute("SELECT * FROM sis WHERE ssp_pk=?", (pk, )).fetchall()
-                num_samples = len(ssp_samples)
-                ssp.cur.init_sis(num_samples)
-                # logger.debug("sis data samples: %s" % num_samples)
-                for i in range(num_samples):
-                    # print(ssp_samples[i])
-                    ssp.cur.sis.pressure[i] = ssp_samples[i]['depth']
-                    ssp.cur.sis.depth[i] = ssp_samples[i]['depth']
-                    ssp.cur.sis.speed[i] = ssp_samples[i]['speed']
-                    ssp.cur.sis.temp[i] = ssp_samples[i]['temperature']
-                    ssp.cur.sis.conductivity[i] = ssp_samples[i]['conductivity']
-                    ssp.cur.sis.sal[i] = ssp_samples[i]['salinity']
-                    ssp.cur.sis.source[i] = ssp_samples[i]['source']
-                    ssp.cur.sis.flag[i] = ssp_samples[i]['flag']
+                self._load_samples(table="sis", pk=pk, samples=ssp.cur.sis, init_samples=ssp.cur.init_sis,
+                                   pressure_field="depth")
 
             except sqlite3.Error as e:
                 logger.error("reading sis samples for %s pk, %s: %s" % (pk, type(e), e))
@@ -744,11 +957,61 @@ class ProjectDb(object):
 
         return ssp
 
+    def _load_samples(self, table, pk, samples, init_samples, pressure_field="pressure"):
+        """Fill the samples arrays in bulk from the rows of the passed table"""
+        cursor = self.conn.cursor()
+        cursor.row_factory = None  # plain tuples
+        # noinspection SqlResolve
+        rows = cursor.execute("""
+                              SELECT %s, depth, speed, temperature, conductivity, salinity, source, flag
+                                 FROM %s WHERE ssp_pk=?
+                              """ % (pressure_field, table), (pk, )).fetchall()
+        num_samples = len(rows)
+        init_samples(num_samples)
+        # logger.debug("%s samples: %s" % (table, num_samples))
+        if num_samples == 0:
+            return
+
+        values = np.array(rows, dtype=np.float64)  # NULL values become NaN
+        samples.pressure[:] = values[:, 0]
+        samples.depth[:] = values[:, 1]
+        samples.speed[:] = values[:, 2]
+        samples.temp[:] = values[:, 3]
+        samples.conductivity[:] = values[:, 4]
+        samples.sal[:] = values[:, 5]
+        samples.source[:] = values[:, 6]
+        samples.flag[:] = values[:, 7]
+
+    def samples_by_dates(self, dates, chunk_size=100000):
+        """Yield (depths, speeds) arrays with the valid raw samples of the casts between the passed dates"""
+        if not self.conn:
+            logger.error("missing db connection")
+            return
+
+        cursor = self.conn.cursor()
+        cursor.row_factory = None  # plain tuples
+        try:
+            # noinspection SqlResolve
+            cursor.execute("""
+                           SELECT depth, speed FROM data a JOIN ssp_pk b ON a.ssp_pk=b.id
+                              WHERE date(b.cast_datetime) BETWEEN ? AND ? AND a.flag=?
+                           """, (dates[0].isoformat(), dates[1].isoformat(), Dicts.flags['valid']))
+
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if len(rows) == 0:
+                    break
+                values = np.array(rows, dtype=np.float64)  # NULL values become NaN
+                yield values[:, 0], values[:, 1]
+
+        except sqlite3.Error as e:
+            logger.error("reading samples between %s and %s, %s: %s" % (dates[0], dates[1], type(e), e))
+
     def delete_profile_by_pk(self, pk):
         """Delete all the entries related to a SSP primary key"""
         self.tmp_ssp_pk = pk
 
-        with self.conn:
+        with self.write_lock, self.conn:
             if not self._delete_old_ssp(full=True):
                 raise RuntimeError("unable to delete ssp with pk: %s" % pk)
 
@@ -51,15 +51,18 @@ class PlotDb(object):
             os.makedirs(folder)
         return folder
 
-    def map_profiles(self, output_folder, save_fig=False):
-        """plot all the ssp in the database"""
+    def map_profiles(self, output_folder, save_fig=False, bbox=None):
+        """plot all the ssp in the database (or those in the (min_lat, min_lon, max_lat, max_lon) bbox)"""
 
         with rc_context(self.rc_context):
 
             if not save_fig:
                 plt.ion()
 
-            rows = self.db.list_profiles()
+            if bbox is None:
+                rows = self.db.list_profiles()
+            else:
+                rows = self.db.list_profiles_in_bbox(*bbox)
             if rows is None:
                 raise RuntimeError("Unable to retrieve ssp view rows > Empty database?")
             if len(rows) == 0:
@@ -198,55 +201,93 @@ class PlotDb(object):
                 t.set_color(color)
 
     class AvgSsp(object):
-        def __init__(self):
-            # create and populate list used in the calculations
-            self.limits = list()  # bin limits
-            self.depths = list()  # avg depth for each bin
-            self.bins = list()  # a list of list with all the value within a bin
-
-            # populating
-            for i, z in enumerate(range(10, 781, 10)):
-                self.limits.append(z)
-                # self.depths.append(z + 5.)
-                self.bins.append(list())
+        """Running statistics of the sound speed values, binned by depth
+
+        The samples are also counted on a (depth bin, sound speed step) grid, to plot their density.
+        """
+
+        def __init__(self, bin_size=10.0, speed_range=(1460.0, 1580.0), speed_step=1.0):
+            self.bin_size = bin_size
+            self.shift = None  # reference value, to limit the numerical cancellation in the variance
+
+            # running accumulators for each bin
+            self.count = np.zeros(0)
+            self.sum = np.zeros(0)
+            self.sum_sq = np.zeros(0)
+
+            # density of the samples
+            self.speed_edges = np.arange(speed_range[0], speed_range[1] + speed_step / 2.0, speed_step)
+            self.density = np.zeros((0, self.speed_edges.size - 1))
 
             # output lists
+            self.depths = list()  # depth for each populated bin
             self.min_2std = list()
             self.max_2std = list()
             self.mean = list()
 
-        def add_samples(self, depths, values):
-
-            for i, d in enumerate(depths):
+        @property
+        def max_depth(self):
+            return self.count.size * self.bin_size
 
-                for j, lim in enumerate(self.limits):
-
-                    if d < lim:
-                        self.bins[j].append(values[i])
-                        break
+        def add_samples(self, depths, values):
+            depths = np.asarray(depths, dtype=np.float64)
+            values = np.asarray(values, dtype=np.float64)
+            valid = ~np.isnan(depths) & ~np.isnan(values)
+            if not valid.any():
+                return
+
+            if self.shift is None:
+                self.shift = values[valid].mean()
+            speeds = values[valid]
+            values = speeds - self.shift
+            # the first bin also collects the values above the surface
+            bins = np.maximum(np.floor(depths[valid] / self.bin_size), 0).astype(int)
+
+            size = max(self.count.size, bins.max() + 1)
+            self.count = self._resized(self.count, size) + np.bincount(bins, minlength=size)
+            self.sum = self._resized(self.sum, size) + np.bincount(bins, weights=values, minlength=size)
+            self.sum_sq = self._resized(self.sum_sq, size) + np.bincount(bins, weights=values ** 2, minlength=size)
+
+            # the samples outside the sound speed range are not counted in the density
+            nr_steps = self.speed_edges.size - 1
+            steps = np.floor((speeds - self.speed_edges[0]) /
+                             (self.speed_edges[1] - self.speed_edges[0])).astype(int)
+            inside = (steps >= 0) & (steps < nr_steps)
+            cells = np.bincount(bins[inside] * nr_steps + steps[inside], minlength=size * nr_steps)
+            self.density = np.concatenate((self.density, np.zeros((size - self.density.shape[0], nr_steps)))) + \
+                cells.reshape(size, nr_steps)
+
+        @property
+        def depth_edges(self):
+            return np.arange(self.count.size + 1) * self.bin_size
+
+        @staticmethod
+        def _resized(acc, size):
+            return np.concatenate((acc, np.zeros(size - acc.size)))
 
         def calc_avg(self):
 
-            for i, i_bin in enumerate(self.bins):
+            # to avoid unstable statistics
+            populated = np.nonzero(self.count >= 3)[0]
+            if populated.size == 0:
+                return
 
-                # to avoid unstable statistics
-                if len(i_bin) < 3:
-                    continue
+            count = self.count[populated]
+            avg = self.sum[populated] / count
+            std = np.sqrt(np.maximum(self.sum_sq[populated] / count - avg ** 2, 0.0))
 
-                if i == 0:
-                    self.depths.append(0.)
-                elif i == (len(self.bins) - 1):
-                    self.depths.append(780.)
-                else:
-                    self.depths.append(self.limits[i] - 5.)
+            depths = (populated + 0.5) * self.bin_size
+            if populated[0] == 0:
+                depths[0] = 0.
+            if populated[-1] == self.count.size - 1:
+                depths[-1] = self.max_depth
 
-                avg = np.mean(i_bin)
-                std = np.std(i_bin)
-                self.mean.append(avg)
-                self.min_2std.append(avg - 2 * std)
-                self.max_2std.append(avg + 2 * std)
+            self.depths = depths.tolist()
+            self.mean = (avg + self.shift).tolist()
+            self.min_2std = (avg + self.shift - 2 * std).tolist()
+            self.max_2std = (avg + self.shift + 2 * std).tolist()
 
-    def aggregate_plot(self, dates, output_folder, save_fig=False):
+    def aggregate_plot(self, dates, output_folder, save_fig=False, bin_size=10.0):
         """aggregate plot with all the SSPs between the passed dates"""
 
         if not save_fig:
@@ -259,40 +300,35 @@ class PlotDb(object):
         if len(ts_list) == 0:
             raise RuntimeError("Unable to retrieve the day list > Empty database?")
 
+        ssp_count = 0
+        for ts_pk in ts_list:
+            tmp_date = ts_pk[1].date()
+            if (tmp_date < dates[0]) or (tmp_date > dates[1]):
+                continue
+            ssp_count += 1
+
         # start a new figure
         fig = plt.figure()
         plt.title("Aggregate SSP plot [from: %s to: %s]" % (dates[0], dates[1]))
         ax = fig.add_subplot(111)
         ax.invert_yaxis()
         ax.set_xlim(1460, 1580)
-        ax.set_ylim(780, 0)
         plt.xlabel('Sound Speed [m/s]', fontsize=10)
         plt.ylabel('Depth [m]', fontsize=10)
         ax.grid(linewidth=0.8, color=(0.3, 0.3, 0.3))
 
-        avg_ssp = PlotDb.AvgSsp()
-
-        ssp_count = 0
-        for ts_pk in ts_list:
-
-            tmp_date = ts_pk[1].date()
-
-            if (tmp_date < dates[0]) or (tmp_date > dates[1]):
-                continue
-
-            ssp_count += 1
-            # print(ts_pk[1], ts_pk[0])
-            tmp_ssp = self.db.profile_by_pk(ts_pk[0])
-            # print(tmp_ssp)
-            ax.plot(tmp_ssp.cur.data.speed[tmp_ssp.cur.data_valid], tmp_ssp.cur.data.depth[tmp_ssp.cur.data_valid], '.',
-                    color=(0.85, 0.85, 0.85), markersize=2
-                    # label='%s [%04d] ' % (ts_pk[0].time(), ts_pk[1])
-                    )
+        avg_ssp = PlotDb.AvgSsp(bin_size=bin_size)
 
-            avg_ssp.add_samples(tmp_ssp.cur.data.depth[tmp_ssp.cur.data_valid],
-                                tmp_ssp.cur.data.speed[tmp_ssp.cur.data_valid])
+        # only the valid raw depths and speeds are retrieved, in chunks (and only their statistics are kept)
+        for depths, speeds in self.db.samples_by_dates(dates):
+            avg_ssp.add_samples(depths, speeds)
 
         avg_ssp.calc_avg()
+        if avg_ssp.max_depth > 0:
+            # the density of the samples in place of the samples
+            ax.pcolormesh(avg_ssp.speed_edges, avg_ssp.depth_edges, np.ma.masked_equal(avg_ssp.density, 0),
+                          cmap='Greys', vmin=-avg_ssp.density.max(), vmax=avg_ssp.density.max())
+            ax.set_ylim(avg_ssp.max_depth, 0)
         ax.plot(avg_ssp.mean, avg_ssp.depths, '-b', linewidth=2)
         ax.plot(avg_ssp.min_2std, avg_ssp.depths, '--b', linewidth=1)
         ax.plot(avg_ssp.max_2std, avg_ssp.depths, '--b', linewidth=1)
@@ -0,0 +1,75 @@
+import os
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+from hydroffice.soundspeed.db.db import ProjectDb
+
+
+class DbPool(object):
+    """Long-lived ProjectDb handles, one per project and thread
+
+    The schema check is done only when a handle is created. All the handles to the same project share
+    a write lock, so the casts are stored by a single writer while the other threads keep reading.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._generations = dict()
+        self._write_locks = dict()
+
+    def _handles(self):
+        if not hasattr(self._local, "handles"):
+            self._local.handles = dict()
+        return self._local.handles
+
+    def get(self, projects_folder=None, project_name=None):
+        """Return the handle to the project db for the current thread"""
+        db_path = ProjectDb.make_db_path(projects_folder=projects_folder, project_name=project_name)
+        with self._lock:
+            generation = self._generations.setdefault(db_path, 0)
+            write_lock = self._write_locks.setdefault(db_path, threading.RLock())
+
+        handles = self._handles()
+        if db_path in handles:
+            handle_generation, db = handles[db_path]
+            # the db may have been released by another thread, or removed
+            if (handle_generation == generation) and os.path.exists(db_path):
+                return db
+            db.disconnect()
+            del handles[db_path]
+
+        db = ProjectDb(projects_folder=projects_folder, project_name=project_name, write_lock=write_lock)
+        handles[db_path] = (generation, db)
+        return db
+
+    def release(self, projects_folder=None, project_name=None):
+        """Checkpoint and close the handles to the project db (e.g., before copying or removing its file)"""
+        db_path = ProjectDb.make_db_path(projects_folder=projects_folder, project_name=project_name)
+        with self._lock:
+            # the handles of the other threads are closed at their next use
+            self._generations[db_path] = self._generations.get(db_path, 0) + 1
+
+        handles = self._handles()
+        if db_path in handles:
+            _, db = handles.pop(db_path)
+            db.checkpoint()
+            db.disconnect()
+
+        elif os.path.exists(db_path):
+            db = ProjectDb(projects_folder=projects_folder, project_name=project_name)
+            db.checkpoint()
+            db.disconnect()
+
+    def close(self):
+        """Close all the handles of the current thread, and invalidate the ones of the other threads"""
+        with self._lock:
+            for db_path in self._generations:
+                self._generations[db_path] += 1
+
+        handles = self._handles()
+        for _, db in handles.values():
+            db.disconnect()
+        handles.clear()
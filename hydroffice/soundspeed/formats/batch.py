@@ -0,0 +1,140 @@
+import fnmatch
+import glob
+import os
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+from hydroffice.soundspeed import formats
+from hydroffice.soundspeed.base.callbacks.batch_callbacks import BatchCallbacks
+
+
+class BatchImportResult(object):
+    """The outcome of the import of a data file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.data_format = None  # name of the reader that parsed the file
+        self.ssp = None
+        self.parse_time = None  # seconds
+        self.error = None
+        self.stored = False
+
+    @property
+    def success(self):
+        return self.error is None
+
+    @property
+    def nr_profiles(self):
+        if self.ssp is None:
+            return 0
+        return self.ssp.nr_profiles
+
+    def __repr__(self):
+        if self.success:
+            return "<BatchImportResult: %s [%s] %d profiles in %.3f s>" \
+                   % (self.path, self.data_format, self.nr_profiles, self.parse_time)
+        return "<BatchImportResult: %s FAILED: %s>" % (self.path, self.error)
+
+
+def readers_for_path(path):
+    """Return the names of the readers that accept the extension of the passed path"""
+    ext = os.path.basename(path).split('.')[-1].lower()
+    names = list()
+    for reader in formats.readers:
+        for reader_ext in reader.ext:
+            if fnmatch.fnmatch(ext, reader_ext):
+                names.append(reader.name)
+                break
+    return names
+
+
+def list_data_files(paths, recursive=False):
+    """Expand the passed files, directories and glob patterns to the data files with a known extension"""
+    if isinstance(paths, str):
+        paths = [paths, ]
+
+    data_files = list()
+    for path in paths:
+
+        if os.path.isfile(path):
+            data_files.append(os.path.abspath(path))  # explicitly passed, so no check on the extension
+            continue
+
+        if os.path.isdir(path):
+            candidates = list()
+            if recursive:
+                for root, _, files in os.walk(path):
+                    candidates.extend([os.path.join(root, f) for f in files])
+            else:
+                candidates.extend([os.path.join(path, f) for f in os.listdir(path)])
+        else:
+            candidates = glob.glob(path, recursive=recursive)
+            if len(candidates) == 0:
+                logger.warning("no match for %s" % path)
+
+        for candidate in sorted(candidates):
+            if os.path.isfile(candidate) and (len(readers_for_path(candidate)) > 0):
+                data_files.append(os.path.abspath(candidate))
+
+    # remove the duplicates, keeping the order
+    seen = set()
+    return [f for f in data_files if not (f in seen or seen.add(f))]
+
+
+# the readers are stateful, so each process creates its own instances
+_readers = dict()
+
+
+def _reader(name):
+    if name not in _readers:
+        idx = formats.name_readers.index(name)
+        _readers[name] = type(formats.readers[idx])()
+    return _readers[name]
+
+
+def parse_file(path, settings, data_format=None, callbacks=None):
+    """Parse a data file (when data_format is None, the readers matching its extension are tried in turn)
+
+    It is run in the worker processes, thus it always returns a BatchImportResult and never raises.
+    When callbacks is None, the non-interactive BatchCallbacks are used.
+    """
+    if callbacks is None:
+        callbacks = BatchCallbacks()
+
+    start_time = time.time()
+    result = BatchImportResult(path=path)
+
+    if data_format is None:
+        names = readers_for_path(path)
+    else:
+        names = [data_format, ]
+
+    errors = list()
+    for name in names:
+        try:
+            reader = _reader(name)
+            if not reader.read(data_path=path, settings=settings, callbacks=callbacks):
+                errors.append("%s: unable to read" % name)
+                continue
+            if reader.ssp.nr_profiles == 0:
+                errors.append("%s: no profiles" % name)
+                continue
+
+        except Exception as e:
+            errors.append("%s: %s" % (name, e))
+            continue
+
+        result.data_format = name
+        result.ssp = reader.ssp
+        break
+
+    if result.ssp is None:
+        if len(names) == 0:
+            result.error = "unknown format"
+        else:
+            result.error = "; ".join(errors)
+
+    result.parse_time = time.time() - start_time
+    return result
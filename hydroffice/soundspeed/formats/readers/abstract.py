@@ -1,4 +1,7 @@
 from abc import ABCMeta, abstractmethod
+import array
+import codecs
+import warnings
 import numpy as np
 import logging
 
@@ -101,35 +104,173 @@ class AbstractReader(AbstractFormat):
 
 
 class AbstractTextReader(AbstractReader):
-    """ Abstract text data reader """
+    """ Abstract text data reader
+
+    The streaming readers open the file with _read(lines=False), iterate the header with _header_lines(),
+    then parse the whole body at once with _read_body(). The other readers get the list of self.lines.
+    """
 
     __metaclass__ = ABCMeta
 
+    encoding_prefix_size = 65536  # bytes used to detect the file encoding
+
     def __init__(self):
         super(AbstractTextReader, self).__init__()
         self.lines = []
         self.lines_offset = None
 
-    def _read(self, data_path, encoding='utf8'):
-        """Helper function to read the raw file"""
-        self.fid = FileManager(data_path, mode='r', encoding=encoding)
+    def _detect_encoding(self, data_path, encoding='utf8'):
+        """Return the passed encoding if it decodes the first bytes of the file, otherwise the alternative one"""
+        with open(data_path, mode='rb') as fid:
+            prefix = fid.read(self.encoding_prefix_size)
         try:
-            self.lines = self.fid.io.readlines()
+            codecs.getincrementaldecoder(encoding)().decode(prefix, final=False)
+            return encoding
         except UnicodeDecodeError as e:
             if encoding == 'utf8':
                 logger.info("changing encoding to latin: %s" % e)
-                self.fid = FileManager(data_path, mode='r', encoding='latin')
-                self.lines = self.fid.io.readlines()
+                return 'latin'
             elif encoding == 'latin':
                 logger.info("changing encoding to utf8: %s" % e)
-                self.fid = FileManager(data_path, mode='r', encoding='utf8')
+                return 'utf8'
+            raise e
+
+    def _read(self, data_path, encoding='utf8', lines=True):
+        """Helper function to read the raw file (only to open it, if not lines)"""
+        encoding = self._detect_encoding(data_path=data_path, encoding=encoding)
+        self.fid = FileManager(data_path, mode='r', encoding=encoding)
+        if lines:
+            try:
                 self.lines = self.fid.io.readlines()
-            else:
-                raise e
+            except UnicodeDecodeError as e:  # beyond the prefix used to detect the encoding
+                if encoding != 'utf8':
+                    raise e
+                logger.info("changing encoding to latin: %s" % e)
+                self.fid = FileManager(data_path, mode='r', encoding='latin')
+                self.lines = self.fid.io.readlines()
+        else:
+            self.lines = []
         self.samples_offset = 0
         self.field_index = dict()
         self.more_fields = list()
 
+    def _header_lines(self):
+        """Iterate over the lines of the opened file, counting them in samples_offset
+
+        After a break, the file is positioned at the line following the last one.
+        """
+        while True:
+            line = self.fid.io.readline()
+            if not line:
+                return
+            self.samples_offset += 1
+            yield line
+
+    def _read_body(self, columns, required=None, delimiter=None):
+        """Parse the remaining lines of the opened file as a table (see _parse_table), then close the file"""
+        try:
+            table = self._body_table(columns=columns, required=required, delimiter=delimiter)
+        except UnicodeDecodeError as e:  # beyond the prefix used to detect the encoding
+            if self.fid.io.encoding != 'utf8':
+                raise e
+            logger.info("changing encoding to latin: %s" % e)
+            self._reopen_body(encoding='latin')
+            table = self._body_table(columns=columns, required=required, delimiter=delimiter)
+        self.fid.io.close()
+        return table
+
+    def _body_table(self, columns, required=None, delimiter=None):
+        table = self._fast_table(self.fid.io, columns=columns, delimiter=delimiter)
+        if table is None:
+            self._reopen_body()
+            table = self._slow_table(self.fid.io, columns=columns, required=required, delimiter=delimiter,
+                                     first_line=self.samples_offset + 1)
+        return table
+
+    def _reopen_body(self, encoding=None):
+        """Reopen the file (with the passed encoding), positioned after the samples_offset header lines
+
+        The stream position is not used, since the codecs stream readers buffer the read data.
+        """
+        if encoding is None:
+            encoding = self.fid.io.encoding
+        self.fid.io.close()
+        self.fid = FileManager(self.fid.path, mode='r', encoding=encoding)
+        for _ in range(self.samples_offset):
+            self.fid.io.readline()
+
+    def _parse_table(self, lines, columns, required=None, delimiter=None, first_line=0):
+        """Parse the passed lines as a table of numbers, with a column for each of the passed field columns
+
+        The empty lines are skipped, as well as the lines with invalid values in the required columns
+        (all the columns, if required is None). The invalid values of the other columns are set to NaN.
+        """
+        table = self._fast_table(lines, columns=columns, delimiter=delimiter)
+        if table is None:
+            table = self._slow_table(lines, columns=columns, required=required, delimiter=delimiter,
+                                     first_line=first_line)
+        return table
+
+    @classmethod
+    def _fill_samples(cls, samples, table, names):
+        """Copy the table columns into the passed samples fields (the invalid values are left to zero)"""
+        for i, name in enumerate(names):
+            values = table[:, i]
+            getattr(samples, name)[:] = np.where(np.isnan(values), 0.0, values)
+
+    @classmethod
+    def _fill_more(cls, more, table, names):
+        """Copy the table columns into the passed additional fields (the invalid values are left to zero)"""
+        for i, name in enumerate(names):
+            values = table[:, i]
+            more.sa[name] = np.where(np.isnan(values), 0.0, values)[:, np.newaxis]
+
+    @classmethod
+    def _fast_table(cls, lines, columns, delimiter=None):
+        """Vectorized parsing of well-formed lines, None if any line is not"""
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # e.g., empty body
+                table = np.loadtxt(lines, dtype=np.float64, delimiter=delimiter, usecols=columns, comments=None,
+                                   ndmin=2)
+        except UnicodeDecodeError:  # not a parsing issue
+            raise
+        except (ValueError, IndexError):
+            return None
+        return table.reshape(-1, len(columns))
+
+    @classmethod
+    def _slow_table(cls, lines, columns, required=None, delimiter=None, first_line=0):
+        """Line-by-line parsing, that skips the invalid lines"""
+        if required is None:
+            required = columns
+        values = array.array('d')
+        row = [0.0] * len(columns)
+        for i, line in enumerate(lines):
+            tokens = line.split(delimiter)
+            if (len(tokens) == 0) or (len(line.strip()) == 0):  # skip empty lines
+                continue
+
+            try:
+                for j, col in enumerate(columns):
+                    try:
+                        row[j] = float(tokens[col])
+                    except (ValueError, IndexError):
+                        if col in required:
+                            raise
+                        row[j] = np.nan
+
+            except ValueError:
+                logger.warning("invalid conversion parsing of line #%s" % (first_line + i))
+                continue
+            except IndexError:
+                logger.warning("invalid index parsing of line #%s" % (first_line + i))
+                continue
+
+            values.extend(row)
+
+        return np.frombuffer(values, dtype=np.float64).reshape(-1, len(columns)).copy()
+
 
 class AbstractBinaryReader(AbstractReader):
     """ Abstract binary data reader """
@@ -51,7 +51,7 @@ class Aoml(AbstractTextReader):
         self.init_data()  # create a new empty profile list
         self.ssp.append()  # append a new profile
 
-        self._read(data_path=data_path)
+        self._read(data_path=data_path, lines=False)
         self._parse_header()
         self._parse_body()
 
@@ -67,8 +67,7 @@ class Aoml(AbstractTextReader):
 
         date_str = ''
 
-        for line in self.lines:
-            self.samples_offset += 1
+        for line in self._header_lines():
             line = line.strip()
 
             if line.startswith(self.tk_latitude):  # latitude
@@ -133,58 +132,22 @@ class Aoml(AbstractTextReader):
                     col += 1
                 break
 
+        if self.tk_depth not in self.field_index:
+            raise RuntimeError("Missing depth field: %s" % self.tk_depth)
         if not self.ssp.cur.meta.original_path:
             self.ssp.cur.meta.original_path = self.fid.path
 
-        # initialize data sample fields
-        self.ssp.cur.init_data(len(self.lines) - self.samples_offset)
-        # initialize additional fields
-        # self.ssp.cur.init_more(self.more_fields)
-
     def _parse_body(self):
         """Parsing samples: depth, speed, temp"""
         logger.debug('parsing body')
-        print(self.field_index)
-
-        count = 0
-        for line in self.lines[self.samples_offset:len(self.lines)]:
-
-            # skip empty lines
-            if len(line.split()) == 0:
-                continue
-
-            data = line.split()
-            # depth
-            try:
-                self.ssp.cur.data.depth[count] = float(data[self.field_index[self.tk_depth]])
-            except ValueError:
-                logger.warning("invalid conversion parsing of line #%s" % (self.samples_offset + count))
-                continue
-            except IndexError:
-                logger.warning("invalid index parsing of line #%s" % (self.samples_offset + count))
-                continue
-
-            # temperature
-            try:
-                self.ssp.cur.data.temp[count] = float(data[self.field_index[self.tk_temp]])
-            except Exception as e:
-                logger.debug("issue in reading temperature: %s -> skipping" % e)
-                
-            # salinity
-            try:
-                self.ssp.cur.data.sal[count] = float(data[self.field_index[self.tk_sal]])
-            except Exception as e:
-                pass
-                #logger.debug("issue in reading salinity: %s -> skipping" % e)
-
-            # sound speed
-            try:
-                self.ssp.cur.data.speed[count] = float(data[self.field_index[self.tk_speed]])
-            except Exception as e:
-                pass
-                #logger.debug("issue in reading sound speed: %s -> skipping" % e)
-
-            count += 1
-
-        self.ssp.cur.data_resize(count)
 
+        # the depth is required, the other fields are optional
+        fields = [(name, self.field_index[tk]) for name, tk in
+                  [('depth', self.tk_depth), ('temp', self.tk_temp), ('sal', self.tk_sal), ('speed', self.tk_speed)]
+                  if tk in self.field_index]
+        table = self._read_body(columns=[col for _, col in fields], required=[self.field_index[self.tk_depth]])
+        if table.shape[0] == 0:
+            raise RuntimeError("Missing data samples")
+
+        self.ssp.cur.init_data(table.shape[0])
+        self._fill_samples(self.ssp.cur.data, table, [name for name, _ in fields])
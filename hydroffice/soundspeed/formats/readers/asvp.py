@@ -32,7 +32,7 @@ class Asvp(AbstractTextReader):
         self.ssp.cur.meta.sensor_type = Dicts.sensor_types['SVP']
         self.ssp.cur.meta.probe_type = Dicts.probe_types['ASVP']
 
-        self._read(data_path=data_path)
+        self._read(data_path=data_path, lines=False)
         self._parse_header()
         self._parse_body()
 
@@ -48,7 +48,7 @@ class Asvp(AbstractTextReader):
 
         has_header = False
 
-        for line in self.lines:
+        for line in self._header_lines():
 
             if not line:  # skip empty lines
                 continue
@@ -68,43 +68,20 @@ class Asvp(AbstractTextReader):
                 except Exception as e:
                     logger.warning("unable to fully parse the header: %s" % e)
                 has_header = True
-                self.samples_offset += 1
                 break
 
-            self.samples_offset += 1
-
         if not has_header:
             raise RuntimeError("Missing header field: %s" % self.tk_header)
         if not self.ssp.cur.meta.original_path:
             self.ssp.cur.meta.original_path = self.fid.path
 
-        # initialize data sample fields
-        self.ssp.cur.init_data(len(self.lines) - self.samples_offset)
-
     def _parse_body(self):
         """Parsing samples: depth, speed"""
         logger.debug('parsing body')
 
-        count = 0
-        for line in self.lines[self.samples_offset:len(self.lines)]:
-
-            # skip empty lines
-            if len(line.split()) == 0:
-                continue
-
-            data = line.split()
-            # first required data fields
-            try:
-                self.ssp.cur.data.depth[count] = float(data[0])
-                self.ssp.cur.data.speed[count] = float(data[1])
-
-            except ValueError:
-                logger.warning("invalid conversion parsing of line #%s" % (self.samples_offset + count))
-                continue
-            except IndexError:
-                logger.warning("invalid index parsing of line #%s" % (self.samples_offset + count))
-                continue
-
-            count += 1
+        table = self._read_body(columns=[0, 1])
+        if table.shape[0] == 0:
+            raise RuntimeError("Missing data samples")
 
-        self.ssp.cur.data_resize(count)
+        self.ssp.cur.init_data(table.shape[0])
+        self._fill_samples(self.ssp.cur.data, table, ['depth', 'speed'])
@@ -18,7 +18,7 @@ class Caris(AbstractTextReader):
 
         self.common_path = None
         self.cur_row_idx = None
-        self.max_nr_lines = None
+        self.section_line = None
         self.section_token = "Section"
 
     def read(self, data_path, settings, callbacks=CliCallbacks(), progress=None):
@@ -29,7 +29,7 @@ class Caris(AbstractTextReader):
 
         self.init_data()  # create a new empty profile list
 
-        self._read(data_path=data_path)
+        self._read(data_path=data_path, lines=False)
         self._parse_header()
         self._parse_body()
 
@@ -40,23 +40,21 @@ class Caris(AbstractTextReader):
         """Parsing top header: common path"""
         logger.debug('parsing header')
 
-        self.max_nr_lines = len(self.lines)
-        if self.max_nr_lines < 4:
-            raise RuntimeError("The input file is only %d-line long" % len(self.lines))
-
         try:
 
-            self.cur_row_idx = 0
-            first_line = self.lines[self.cur_row_idx]
+            first_line = self.fid.io.readline()
             first_token = "[SVP_VERSION_2]"
             if first_token not in first_line:
                 raise RuntimeError("Unknown start of file: it should be %s, but it is %s" % (first_token, first_line))
 
-            self.cur_row_idx += 1
-            if self.lines[self.cur_row_idx][:len(self.section_token)] != self.section_token:
-                self.common_path = self.lines[self.cur_row_idx].strip()
-                self.cur_row_idx += 1
+            self.cur_row_idx = 1
+            second_line = self.fid.io.readline()
+            if second_line[:len(self.section_token)] != self.section_token:
+                self.common_path = second_line.strip()
                 logger.debug("common path: %s" % self.common_path)
+                self.section_line = None
+            else:
+                self.section_line = second_line
 
         except Exception as e:
             raise RuntimeError("While parsing header, %s" % e)
@@ -65,43 +63,56 @@ class Caris(AbstractTextReader):
         """Parsing all the section"""
         logger.debug('parsing body')
 
-        while self.cur_row_idx < self.max_nr_lines:
-
-            # skip empty lines
-            if len(self.lines[self.cur_row_idx]) == 0:
-                continue
+        section_lines = list()
+        for row_idx, line in enumerate(self.fid.io, start=2):
 
             # new profile
-            if self.lines[self.cur_row_idx][:len(self.section_token)] == self.section_token:
-                logger.info("new profile")
-                self.ssp.append()  # append a new profile
-
-                # initialize probe/sensor type
-                self.ssp.cur.meta.sensor_type = Dicts.sensor_types['SVP']
-                self.ssp.cur.meta.probe_type = Dicts.probe_types['CARIS']
-                self.ssp.cur.meta.original_path = self.common_path
+            if line[:len(self.section_token)] == self.section_token:
+                self._parse_section(section_lines)
+                self.section_line = line
+                self.cur_row_idx = row_idx
+                section_lines = list()
+                continue
 
-                self._parse_section_header()
-                self._parse_section_body()
+            section_lines.append(line)
 
-                continue
+        self._parse_section(section_lines)
+        self.fid.io.close()
 
-            # this point should be never reached.. unless troubles
-            logger.debug("skipping line #%03d" % self.cur_row_idx)
-            self.cur_row_idx += 1
+        if self.ssp.nr_profiles == 0:
+            raise RuntimeError("Missing section: %s" % self.section_token)
 
         self.fix()
         self.finalize()
 
         logger.debug("read %d profiles" % self.ssp.nr_profiles)
 
+    def _parse_section(self, lines):
+        """Parse the current section header with the passed body lines"""
+        if self.section_line is None:
+            for line in lines:
+                if len(line.strip()) > 0:  # this point should be never reached.. unless troubles
+                    logger.debug("skipping line: %s" % line.strip())
+            return
+
+        logger.info("new profile")
+        self.ssp.append()  # append a new profile
+
+        # initialize probe/sensor type
+        self.ssp.cur.meta.sensor_type = Dicts.sensor_types['SVP']
+        self.ssp.cur.meta.probe_type = Dicts.probe_types['CARIS']
+        self.ssp.cur.meta.original_path = self.common_path
+
+        self._parse_section_header()
+        self._parse_section_body(lines)
+
     def _parse_section_header(self):
         """Parsing header: time, latitude, longitude"""
         logger.debug('parsing section #%d header' % self.ssp.nr_profiles)
 
-        tokens = self.lines[self.cur_row_idx].strip().split()
+        tokens = self.section_line.strip().split()
         if len(tokens) < 5:
-            logger.warning("skipping section header for invalid number of tokens: %s " % self.lines[self.cur_row_idx])
+            logger.warning("skipping section header for invalid number of tokens: %s " % self.section_line)
             return
 
         time_fields = "%s %s" % (tokens[1], tokens[2])
@@ -123,11 +134,6 @@ class Caris(AbstractTextReader):
         except Exception as e:
             logger.warning("unable to interpret the longitude: %s, %s" % (tokens[4], e))
 
-        # initialize data sample fields
-        self.ssp.cur.init_data(self.max_nr_lines - self.cur_row_idx)
-
-        self.cur_row_idx += 1
-
     @classmethod
     def _interpret_caris_coord(cls, value):
 
@@ -149,41 +155,12 @@ class Caris(AbstractTextReader):
 
         return coord
 
-    def _parse_section_body(self):
+    def _parse_section_body(self, lines):
         """Parsing samples: depth, speed"""
         logger.debug('parsing section #%d body' % self.ssp.nr_profiles)
 
-        # valid samples counter
-        count = 0
+        table = self._parse_table(lines, columns=[0, 1], first_line=self.cur_row_idx + 1)
 
-        while self.cur_row_idx < self.max_nr_lines:
-
-            # A new section is coming
-            if self.lines[self.cur_row_idx][:len(self.section_token)] == self.section_token:
-                return
-
-            # skip empty lines
-            if len(self.lines[self.cur_row_idx]) == 0:
-                continue
-
-            tokens = self.lines[self.cur_row_idx].strip().split()
-            if len(tokens) != 2:
-                logger.warning("skipping line for invalid number of tokens: %s " % self.lines[self.cur_row_idx])
-                continue
-
-            try:
-                self.ssp.cur.data.depth[count] = float(tokens[0])
-                self.ssp.cur.data.speed[count] = float(tokens[1])
-
-            except ValueError:
-                logger.warning("invalid conversion parsing of line #%03d" % (self.cur_row_idx, ))
-                continue
-
-            except IndexError:
-                logger.warning("invalid index parsing of line #%03d" % (self.cur_row_idx, ))
-                continue
-
-            count += 1
-            self.cur_row_idx += 1
-
-        self.ssp.cur.data_resize(count)
+        # initialize data sample fields
+        self.ssp.cur.init_data(table.shape[0])
+        self._fill_samples(self.ssp.cur.data, table, ['depth', 'speed'])
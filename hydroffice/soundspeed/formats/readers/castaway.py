@@ -46,7 +46,7 @@ class Castaway(AbstractTextReader):
         self.ssp.cur.meta.sensor_type = Dicts.sensor_types['CTD']
         self.ssp.cur.meta.probe_type = Dicts.probe_types['Castaway']
 
-        self._read(data_path=data_path)
+        self._read(data_path=data_path, lines=False)
         self._parse_header()
         self._parse_body()
 
@@ -69,10 +69,9 @@ class Castaway(AbstractTextReader):
         has_conductivity = False
         self.conductivity_ms_per_cm = False
 
-        for line in self.lines:
+        for line in self._header_lines():
 
             if not line:  # skip empty lines
-                self.samples_offset += 1
                 continue
 
             if line[0] != '%':  # field headers
@@ -98,7 +97,6 @@ class Castaway(AbstractTextReader):
                     else:
                         self.more_fields.append(field_type)
                     col += 1
-                self.samples_offset += 1
                 logger.debug("samples offset: %s" % self.samples_offset)
                 break
 
@@ -132,8 +130,6 @@ class Castaway(AbstractTextReader):
                 except ValueError:
                     logger.error("unable to parse longitude from line #%s" % self.samples_offset)
 
-            self.samples_offset += 1
-
         # sample fields checks
         if not has_depth:
             raise RuntimeError("Missing depth field: %s" % self.tk_depth)
@@ -146,52 +142,31 @@ class Castaway(AbstractTextReader):
         if not self.ssp.cur.meta.original_path:
             self.ssp.cur.meta.original_path = self.fid.path
 
-        # initialize data sample fields
-        self.ssp.cur.init_data(len(self.lines) - self.samples_offset)
-        # initialize additional fields
-        self.ssp.cur.init_more(self.more_fields)
-
     def _parse_body(self):
         """Parsing samples: depth, speed, temp, sal"""
         logger.debug('parsing body')
 
-        count = 0
-        for line in self.lines[self.samples_offset:len(self.lines)]:
-
-            # skip empty lines
-            if len(line.split()) == 0:
-                continue
+        # depth, speed, temp and sal are required, the other fields are optional
+        names = ['depth', 'speed', 'temp', 'sal']
+        tokens = [self.tk_depth, self.tk_speed, self.tk_temp, self.tk_sal]
+        for name, tk in [('pressure', self.tk_pressure), ('conductivity', self.tk_conductivity)]:
+            if tk in self.field_index:
+                names.append(name)
+                tokens.append(tk)
+        columns = sorted(set([self.field_index[tk] for tk in tokens + self.more_fields]))
+        required = [self.field_index[tk] for tk in tokens[:4]]
+        table = self._read_body(columns=columns, required=required, delimiter=',')
+        if table.shape[0] == 0:
+            raise RuntimeError("Missing data samples")
+        table_index = dict([(col, i) for i, col in enumerate(columns)])
 
-            data = line.split(",")
-            # first required data fields
-            try:
-                self.ssp.cur.data.depth[count] = float(data[self.field_index[self.tk_depth]])
-                self.ssp.cur.data.speed[count] = float(data[self.field_index[self.tk_speed]])
-                self.ssp.cur.data.temp[count] = float(data[self.field_index[self.tk_temp]])
-                self.ssp.cur.data.sal[count] = float(data[self.field_index[self.tk_sal]])
-            except ValueError:
-                logger.warning("invalid conversion parsing of line #%s" % (self.samples_offset + count))
-                continue
-            except IndexError:
-                logger.warning("invalid index parsing of line #%s" % (self.samples_offset + count))
-                continue
+        # initialize data sample fields
+        self.ssp.cur.init_data(table.shape[0])
+        self._fill_samples(self.ssp.cur.data, table[:, [table_index[self.field_index[tk]] for tk in tokens]], names)
+        if self.conductivity_ms_per_cm:  # convert MicroS/cm to S/m
+            self.ssp.cur.data.conductivity /= 10000.0
 
-            # pressure and conductivity
-            try:
-                self.ssp.cur.data.pressure[count] = float(data[self.field_index[self.tk_pressure]])
-                self.ssp.cur.data.conductivity[count] = float(data[self.field_index[self.tk_conductivity]])
-                if self.conductivity_ms_per_cm:  # convert MicroS/cm to S/m
-                    self.ssp.cur.data.conductivity[count] = self.ssp.cur.data.conductivity[count] / 10000.0
-            except Exception as e:
-                logger.debug("issue in reading pressure and conductivity: %s -> skipping" % e)
-
-            # additional data field
-            try:
-                for mf in self.more_fields:
-                    self.ssp.cur.more.sa[mf][count] = float(data[self.field_index[mf]])
-            except Exception as e:
-                logger.debug("issue in reading additional data fields: %s -> skipping" % e)
-
-            count += 1
-
-        self.ssp.cur.data_resize(count)
+        # initialize additional fields
+        self.ssp.cur.init_more(self.more_fields)
+        self._fill_more(self.ssp.cur.more, table[:, [table_index[self.field_index[mf]] for mf in self.more_fields]],
+                        self.more_fields)
@@ -35,7 +35,7 @@ class DigibarPro(AbstractTextReader):
         self.ssp.cur.meta.sensor_type = Dicts.sensor_types['SVP']
         self.ssp.cur.meta.probe_type = Dicts.probe_types['DigibarPro']
 
-        self._read(data_path=data_path)
+        self._read(data_path=data_path, lines=False)
         self._parse_header()
         self._parse_body()
 
@@ -54,13 +54,12 @@ class DigibarPro(AbstractTextReader):
         # control flags
         has_field_header = False
 
-        for line in self.lines:
+        for line in self._header_lines():
 
             if not line:  # skip empty lines
                 continue
 
             if line[:len(self.tk_field_header)] == self.tk_field_header:
-                self.samples_offset += 1
                 logger.debug("samples offset: %s" % self.samples_offset)
                 has_field_header = True
                 break
@@ -89,48 +88,19 @@ class DigibarPro(AbstractTextReader):
                 except ValueError:
                     logger.warning("unable to parse cast date and time at line #%s" % self.samples_offset)
 
-            self.samples_offset += 1
-
         # sample fields checks
         if not has_field_header:
             raise RuntimeError("Missing field header: %s" % self.tk_field_header)
         if not self.ssp.cur.meta.original_path:
             self.ssp.cur.meta.original_path = self.fid.path
 
-        # initialize data sample fields
-        self.ssp.cur.init_data(len(self.lines) - self.samples_offset)
-
     def _parse_body(self):
         """Parsing samples: depth, speed, temp"""
         logger.debug('parsing body')
 
-        count = 0
-        for line in self.lines[self.samples_offset:len(self.lines)]:
-
-            # skip empty lines
-            if not line:
-                continue
-
-            # first required data fields
-            try:
-                depth, speed, temp = line.split()
-
-                if speed == 0.0:
-                    logger.info("skipping 0-speed row #%s" % (self.lines_offset + count))
-                    count += 1
-                    continue
-
-                self.ssp.cur.data.depth[count] = depth
-                self.ssp.cur.data.speed[count] = speed
-                self.ssp.cur.data.temp[count] = temp
-
-            except ValueError:
-                logger.warning("invalid conversion parsing of line #%s" % (self.samples_offset + count))
-                continue
-            except IndexError:
-                logger.warning("invalid index parsing of line #%s" % (self.samples_offset + count))
-                continue
-
-            count += 1
+        table = self._read_body(columns=[0, 1, 2])
+        if table.shape[0] == 0:
+            raise RuntimeError("Missing data samples")
 
-        self.ssp.cur.data_resize(count)
+        self.ssp.cur.init_data(table.shape[0])
+        self._fill_samples(self.ssp.cur.data, table, ['depth', 'speed', 'temp'])
@@ -41,7 +41,7 @@ class Elac(AbstractTextReader):
         self.ssp.cur.meta.sensor_type = Dicts.sensor_types['XBT']  # faking XBT
         self.ssp.cur.meta.probe_type = Dicts.probe_types['ELAC']
 
-        self._read(data_path=data_path)
+        self._read(data_path=data_path, lines=False)
         self._parse_header()
         self._parse_body()
 
@@ -60,14 +60,12 @@ class Elac(AbstractTextReader):
         has_temp = False
         has_sal = False
 
-        for line in self.lines:
+        for line in self._header_lines():
 
             if not line:  # skip empty lines
-                self.samples_offset += 1
                 continue
 
             if line[:len(self.tk_start_data)] == self.tk_start_data:  # start data
-                self.samples_offset += 1
                 logger.debug("samples offset: %s" % self.samples_offset)
                 break
 
@@ -90,8 +88,6 @@ class Elac(AbstractTextReader):
                         self.more_fields.append(field)
                     col += 1
 
-            self.samples_offset += 1
-
         # sample fields checks
         if not has_depth:
             raise RuntimeError("Missing depth field: %s" % self.tk_depth)
@@ -104,45 +100,21 @@ class Elac(AbstractTextReader):
         if not self.ssp.cur.meta.original_path:
             self.ssp.cur.meta.original_path = self.fid.path
 
-        # initialize data sample fields
-        self.ssp.cur.init_data(len(self.lines) - self.samples_offset)
-        # initialize additional fields
-        self.ssp.cur.init_more(self.more_fields)
-
     def _parse_body(self):
         """Parsing samples: depth, speed, temp, sal"""
         logger.debug('parsing body')
 
-        count = 0
-        for line in self.lines[self.samples_offset:len(self.lines)]:
-
-            # skip empty lines
-            if len(line.split()) == 0:
-                continue
-
-            data = line.split()
-            # first required data fields
-            try:
-                self.ssp.cur.data.depth[count] = float(data[0])
-                self.ssp.cur.data.speed[count] = float(data[1])
+        # the first four columns are required, the additional fields are optional
+        more_columns = [self.field_index[mf] for mf in self.more_fields]
+        columns = [0, 1, 2, 3] + [col for col in sorted(set(more_columns)) if col > 3]
+        table = self._read_body(columns=columns, required=[0, 1, 2, 3])
+        if table.shape[0] == 0:
+            raise RuntimeError("Missing data samples")
 
-                self.ssp.cur.data.temp[count] = float(data[2])
-                self.ssp.cur.data.sal[count] = float(data[3])
-
-            except ValueError:
-                logger.warning("invalid conversion parsing of line #%s" % (self.samples_offset + count))
-                continue
-            except IndexError:
-                logger.warning("invalid index parsing of line #%s" % (self.samples_offset + count))
-                continue
-
-            # additional data field
-            try:
-                for mf in self.more_fields:
-                    self.ssp.cur.more.sa[mf][count] = float(data[self.field_index[mf]])
-            except Exception as e:
-                logger.debug("issue in reading additional data fields: %s -> skipping" % e)
-
-            count += 1
+        # initialize data sample fields
+        self.ssp.cur.init_data(table.shape[0])
+        self._fill_samples(self.ssp.cur.data, table, ['depth', 'speed', 'temp', 'sal'])
 
-        self.ssp.cur.data_resize(count)
+        # initialize additional fields
+        self.ssp.cur.init_more(self.more_fields)
+        self._fill_more(self.ssp.cur.more, table[:, [columns.index(col) for col in more_columns]], self.more_fields)
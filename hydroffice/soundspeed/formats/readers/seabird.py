@@ -12,7 +12,7 @@ from hydroffice.soundspeed.profile.dicts import Dicts
 from hydroffice.soundspeed.base.callbacks.cli_callbacks import CliCallbacks
 
 from hydroffice.soundspeed.temp.regex_helpers import Profile, getMetaFromCoord, robust_re_number, \
-    parseNumbers
+    parseColumns
 from hydroffice.soundspeed.temp import coordinates
 
 # Note that Hex header is copied into the CNV header verbatim so these can be used in either.
@@ -119,8 +119,14 @@ class Seabird(AbstractTextReader):
         return True
 
     def _parse_header(self):
-        s = "\n".join(self.lines)
-        header, _data = s.split('*END*')
+        for i, line in enumerate(self.lines):
+            if line[:5] == '*END*':
+                self.samples_offset = i + 1  # the body starts after *END*
+                break
+        else:
+            raise RuntimeError("Missing end of header: *END*")
+        s = "\n".join(self.lines[:self.samples_offset])
+        header = s[:s.rindex('*END*')]
         meta = {}
         if SeacatHex_SBE19PLUS_TYPERE.search(header):
             seacat_type = 'SBE19PLUS'
@@ -241,7 +247,8 @@ class Seabird(AbstractTextReader):
                 col_name = col_name + "_"
             col_types.append((col_name, numpy.float32))
 
-        d = parseNumbers(self.lines, col_types,
+        # the column layout is known, so the body is parsed in one pass (with the regex path as fallback)
+        d = parseColumns(self.lines[self.samples_offset:], col_types,
                          r"\s+", pre=r'^\s*', post=r'\s*$')
         p = Profile(d, ymetric="depth", attribute="soundspeed", metadata=meta)
         self.ssp.append_profile(p.ConvertToSoundSpeedProfile())
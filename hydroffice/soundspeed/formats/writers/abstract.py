@@ -1,6 +1,7 @@
 from abc import ABCMeta, abstractmethod, abstractproperty
 import os
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -72,3 +73,13 @@ class AbstractTextWriter(AbstractWriter):
         if binary:
             mode = '%sb' % mode
         self.fod = FileManager(file_path, mode=mode, encoding=encoding)
+
+    @classmethod
+    def _valid_columns(cls, samples, valid, names):
+        """Extract the passed sample fields, applying the valid mask only once per field"""
+        return [getattr(samples, name)[valid] for name in names]
+
+    @classmethod
+    def _format_rows(cls, fmt, columns):
+        """Format a row for each sample, with the columns converted to python lists only once"""
+        return "".join([fmt % row for row in zip(*[np.asarray(column).tolist() for column in columns])])
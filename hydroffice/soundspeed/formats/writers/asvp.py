@@ -40,12 +40,15 @@ class Asvp(AbstractTextWriter):
         if (np.sum(self.ssp.cur.sis.temp[ti]) != 0) and (np.sum(self.ssp.cur.sis.sal[ti]) != 0) \
                 and (np.sum(self.ssp.cur.sis.speed[ti]) != 0):
 
+            # the attenuation for all the frequencies is calculated at once
+            depth, delta, atten = self._calc_abs()
+
             asvp_base_name = self.fod.basename
-            for abs_freq in self.abs_freqs:
+            for i, abs_freq in enumerate(self.abs_freqs):
                 abs_file = "%s_%dkHz.abs" % (asvp_base_name, abs_freq)
                 self._write(data_path=data_path, data_file=abs_file)
                 self._write_header_abs(abs_freq)
-                self._write_body_abs(abs_freq)
+                self._write_body_abs(abs_freq, depth=depth, delta=delta, atten=atten[i])
 
         else:
             logger.warning("not temperature and/or salinity to create absorption files")
@@ -79,45 +82,33 @@ class Asvp(AbstractTextWriter):
                           self.ssp.cur.sis.depth[ti].size)
         self.fod.io.write(abs_header)
 
-    def _write_body_abs(self, freq):
-        logger.debug('generating body for %d kHz' % freq)
-
+    def _calc_abs(self):
+        """Return depth, layer thickness and attenuation (a row per absorption frequency) of the valid samples"""
         ti = self.ssp.cur.sis_thinned
+        depth, temp, sal = self._valid_columns(self.ssp.cur.sis, ti, ['depth', 'temp', 'sal'])
 
-        top_mean = 0
-        bottom_mean = 0
-
-        body = str()
-        sample_sz = np.sum(ti)
-        for i in range(sample_sz):
-
-            if self.ssp.cur.sis.sal[ti][i] <= 0:
-                logger.info("skipping invalid salinity")
-                continue
+        # thickness of the layer around each sample: from the mid-depth with the previous sample to the one with
+        # the next sample (the first layer starts at the surface, the last one ends at the sample depth)
+        if depth.size > 1:
+            mid_depth = (depth[1:] + depth[:-1]) / 2.0
+            delta = np.concatenate([mid_depth[:1], mid_depth[1:] - mid_depth[:-1], depth[-1:] - mid_depth[-1:]])
+        else:  # a single layer, from the surface
+            delta = depth.copy()
 
-            abs = Oc.attenuation(f=freq, t=self.ssp.cur.sis.temp[ti][i], d=self.ssp.cur.sis.depth[ti][i],
-                                 s=self.ssp.cur.sis.sal[ti][i], ph=8.1)
+        valid = sal > 0
+        if not np.all(valid):
+            logger.info("skipping %d invalid salinity samples" % np.sum(~valid))
+        depth, temp, sal, delta = depth[valid], temp[valid], sal[valid], delta[valid]
 
-            if i == 0:  # first
-                delta = (self.ssp.cur.sis.depth[ti][0] + self.ssp.cur.sis.depth[ti][1]) / 2.0
+        atten = Oc.attenuation_grid(f=self.abs_freqs, t=temp, d=depth, s=sal, ph=8.1)
+        return depth, delta, atten
 
-            elif i == sample_sz - 1:  # last
-                delta = (self.ssp.cur.sis.depth[ti][sample_sz - 1] -
-                         (self.ssp.cur.sis.depth[ti][sample_sz - 1] + self.ssp.cur.sis.depth[ti][sample_sz - 2]) / 2.0)
-
-            else:
-                delta = ((self.ssp.cur.sis.depth[ti][i + 1] + self.ssp.cur.sis.depth[ti][i]) / 2.0 -
-                         (self.ssp.cur.sis.depth[ti][i] + self.ssp.cur.sis.depth[ti][i - 1]) / 2.0)
-
-            top_mean += abs * delta
-            bottom_mean += delta
-
-            mean_abs = top_mean / bottom_mean
+    def _write_body_abs(self, freq, depth, delta, atten):
+        logger.debug('generating body for %d kHz' % freq)
 
-            body += "%.3f %.3f %.3f %s\n" \
-                    % (self.ssp.cur.sis.depth[ti][i], abs, mean_abs, "999.000")
+        mean_atten = np.cumsum(atten * delta) / np.cumsum(delta)
 
-        self.fod.io.write(body)
+        self.fod.io.write(self._format_rows("%.3f %.3f %.3f 999.000\n", [depth, atten, mean_atten]))
         self.fod.io.close()
 
     def convert(self, ssp, fmt):
@@ -151,21 +142,18 @@ class Asvp(AbstractTextWriter):
         body = str()
         ti = self.ssp.cur.sis_thinned
 
-        for i in range(np.sum(ti)):
-            if (fmt == Dicts.kng_formats['S00']) or (fmt == Dicts.kng_formats['S10']):
-                body += "%.2f,%.1f,,,\r\n" \
-                        % (self.ssp.cur.sis.depth[ti][i], self.ssp.cur.sis.speed[ti][i])
-            elif (fmt == Dicts.kng_formats['S01']) or (fmt == Dicts.kng_formats['S12']):
-                body += "%.2f,%1f,%.2f,%.2f,\r\n" \
-                        % (self.ssp.cur.sis.depth[ti][i], self.ssp.cur.sis.speed[ti][i],
-                           self.ssp.cur.sis.temp[ti][i], self.ssp.cur.sis.sal[ti][i])
-            elif (fmt == Dicts.kng_formats['S02']) or (fmt == Dicts.kng_formats['S22']):
-                body += "%.2f,,%.2f,%.2f,\r\n" \
-                        % (self.ssp.cur.sis.depth[ti][i],
-                           self.ssp.cur.sis.temp[ti][i], self.ssp.cur.sis.sal[ti][i])
-            elif fmt == Dicts.kng_formats['ASVP']:
-                body += "%.2f %.2f\n" \
-                        % (self.ssp.cur.sis.depth[ti][i], self.ssp.cur.sis.speed[ti][i])
+        if (fmt == Dicts.kng_formats['S00']) or (fmt == Dicts.kng_formats['S10']):
+            row_fmt, names = "%.2f,%.1f,,,\r\n", ['depth', 'speed']
+        elif (fmt == Dicts.kng_formats['S01']) or (fmt == Dicts.kng_formats['S12']):
+            row_fmt, names = "%.2f,%1f,%.2f,%.2f,\r\n", ['depth', 'speed', 'temp', 'sal']
+        elif (fmt == Dicts.kng_formats['S02']) or (fmt == Dicts.kng_formats['S22']):
+            row_fmt, names = "%.2f,,%.2f,%.2f,\r\n", ['depth', 'temp', 'sal']
+        elif fmt == Dicts.kng_formats['ASVP']:
+            row_fmt, names = "%.2f %.2f\n", ['depth', 'speed']
+        else:
+            row_fmt, names = None, []
+        if row_fmt is not None:
+            body += self._format_rows(row_fmt, self._valid_columns(self.ssp.cur.sis, ti, names))
 
         if fmt == Dicts.kng_formats['ASVP']:
             return body
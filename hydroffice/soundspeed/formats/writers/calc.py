@@ -67,14 +67,12 @@ class Calc(AbstractTextWriter):
         body = str()
         vi = self.ssp.cur.proc_valid
 
+        depth, speed, temp = self._valid_columns(self.ssp.cur.sis, vi, ['depth', 'speed', 'temp'])
+        not_negative = ~(depth < 0.0)
+        body += self._format_rows("%5.1f %4.2f %1.3f\n", [depth[not_negative], speed[not_negative], temp[not_negative]])
         last_depth = None
-        for i in range(np.sum(vi)):
-            if self.ssp.cur.sis.depth[vi][i] < 0.0:
-                continue
-            body += "%5.1f %4.2f %1.3f\n" % (self.ssp.cur.sis.depth[vi][i],
-                                             self.ssp.cur.sis.speed[vi][i],
-                                             self.ssp.cur.sis.temp[vi][i])
-            last_depth = self.ssp.cur.sis.depth[vi][i]
+        if np.any(not_negative):
+            last_depth = depth[not_negative][-1]
 
         body += " 0  0  0\n"
         body += "*** NAV ****\n"
@@ -1,5 +1,4 @@
 import os
-import numpy as np
 import math
 import datetime
 import logging
@@ -57,6 +56,5 @@ class Csv(AbstractTextWriter):
     def _write_body(self):
         logger.debug('generating body')
         vi = self.ssp.cur.proc_valid
-        for idx in range(np.sum(vi)):
-            self.fod.io.write("%.2f,%.2f\n"
-                              % (self.ssp.cur.proc.depth[vi][idx], self.ssp.cur.proc.speed[vi][idx],))
+        columns = self._valid_columns(self.ssp.cur.proc, vi, ['depth', 'speed'])
+        self.fod.io.write(self._format_rows("%.2f,%.2f\n", columns))
@@ -1,4 +1,3 @@
-import numpy as np
 import os
 import logging
 
@@ -45,11 +44,7 @@ class Elac(AbstractTextWriter):
     def _write_body(self):
         logger.debug('generating body')
         vi = self.ssp.cur.proc_valid
-        for idx in range(np.sum(vi)):
-            self.fod.io.write("%8.2f%10.2f%10.2f%10.2f%10.2f\n"
-                              % (self.ssp.cur.proc.depth[vi][idx], self.ssp.cur.proc.speed[vi][idx],
-                                 self.ssp.cur.proc.temp[vi][idx], self.ssp.cur.proc.sal[vi][idx],
-                                 Oc.s2c(s=self.ssp.cur.proc.sal[vi][idx],
-                                        p=Oc.d2p(d=self.ssp.cur.proc.depth[vi][idx],
-                                                 lat=self.ssp.cur.meta.latitude),
-                                        t=self.ssp.cur.proc.temp[vi][idx])))
+        depth, speed, temp, sal = self._valid_columns(self.ssp.cur.proc, vi, ['depth', 'speed', 'temp', 'sal'])
+        conductivity = Oc.s2c(s=sal, p=Oc.d2p(d=depth, lat=self.ssp.cur.meta.latitude), t=temp)
+        self.fod.io.write(self._format_rows("%8.2f%10.2f%10.2f%10.2f%10.2f\n",
+                                            [depth, speed, temp, sal, conductivity]))
@@ -1,4 +1,3 @@
-import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
@@ -41,6 +40,5 @@ class Hypack(AbstractTextWriter):
     def _write_body(self):
         logger.debug('generating body')
         vi = self.ssp.cur.proc_valid
-        for idx in range(np.sum(vi)):
-            self.fod.io.write("%.1f %.1f\n"
-                              % (self.ssp.cur.proc.depth[vi][idx], self.ssp.cur.proc.speed[vi][idx],))
+        columns = self._valid_columns(self.ssp.cur.proc, vi, ['depth', 'speed'])
+        self.fod.io.write(self._format_rows("%.1f %.1f\n", columns))
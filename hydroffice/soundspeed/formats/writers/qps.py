@@ -12,6 +12,9 @@ from hydroffice.soundspeed.profile.dicts import Dicts
 class Qps(AbstractTextWriter):
     """QPS bsvp writer"""
 
+    sample_dtype = np.dtype([('idx', '=i4'), ('depth', '=f4'), ('speed', '=f4'), ('temp', '=f4'), ('sal', '=f4'),
+                             ('pressure', '=f4'), ('conductivity', '=f4'), ('flags', '=u4')])
+
     def __init__(self):
         super(Qps, self).__init__()
         self.desc = "QPS"
@@ -61,23 +64,16 @@ class Qps(AbstractTextWriter):
         else:
             _flags = 2**2 # User designated
         vi = self.ssp.cur.proc_valid
-        for idx in range(np.sum(vi)):
-            depth = self.ssp.cur.proc.depth[vi][idx]
-            speed = self.ssp.cur.proc.speed[vi][idx]
-            temperature = self.ssp.cur.proc.temp[vi][idx]
-            salinity = self.ssp.cur.proc.sal[vi][idx]
-            pressure = self.ssp.cur.proc.pressure[vi][idx]
-            conductivity = self.ssp.cur.proc.conductivity[vi][idx]
-            source = self.ssp.cur.proc.source[vi][idx]
-            if source == Dicts.sources['raw']:
-                flags = _flags
-            elif source == Dicts.sources['user']:
-                flags = 2**2 + 2**17 # User designated and Added (by user)
-            elif source == Dicts.sources['rtofs_ext']:
-                flags = 2**1 # Oceanographic Model
-            else:
-                flags = 2**2 # User designated
-                
-            data = struct.pack('iffffffI', idx, depth, speed, temperature, salinity, pressure, conductivity, flags)
-            # data = '%i %.1f %.1f %.1f %.1f %.1f %.1f %i\n' % (idx, depth, speed, temperature, salinity, pressure, conductivity, flags)
-            self.fod.io.write(data)
+        source = self.ssp.cur.proc.source[vi]
+        # same layout of struct.pack('iffffffI', idx, depth, speed, temperature, salinity, pressure, conductivity, flags)
+        data = np.empty(np.sum(vi), dtype=self.sample_dtype)
+        data['idx'] = np.arange(data.size)
+        for name in ['depth', 'speed', 'temp', 'sal', 'pressure', 'conductivity']:
+            data[name] = getattr(self.ssp.cur.proc, name)[vi]
+        data['flags'] = np.select([source == Dicts.sources['raw'],
+                                   source == Dicts.sources['user'],  # User designated and Added (by user)
+                                   source == Dicts.sources['rtofs_ext']],  # Oceanographic Model
+                                  [_flags, 2**2 + 2**17, 2**1],
+                                  2**2)  # User designated
+        # data = '%i %.1f %.1f %.1f %.1f %.1f %.1f %i\n' % (idx, depth, speed, temperature, salinity, pressure, conductivity, flags)
+        self.fod.io.write(data.tobytes())
@@ -1,4 +1,3 @@
-import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
@@ -70,7 +69,5 @@ class Sonardyne(AbstractTextWriter):
     def _write_body(self):
         logger.debug('generating body')
         vi = self.ssp.cur.proc_valid
-        for idx in range(np.sum(vi)):
-            self.fod.io.write("%12.4f%12.4f%12.4f%12.4f\n"
-                              % (self.ssp.cur.proc.depth[vi][idx], self.ssp.cur.proc.speed[vi][idx],
-                                 self.ssp.cur.proc.sal[vi][idx], self.ssp.cur.proc.temp[vi][idx]))
+        columns = self._valid_columns(self.ssp.cur.proc, vi, ['depth', 'speed', 'sal', 'temp'])
+        self.fod.io.write(self._format_rows("%12.4f%12.4f%12.4f%12.4f\n", columns))
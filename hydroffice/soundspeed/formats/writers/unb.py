@@ -72,7 +72,6 @@ class Unb(AbstractTextWriter):
     def _write_body(self):
         logger.debug('generating body')
         vi = self.ssp.cur.proc_valid
-        for idx in range(np.sum(vi)):
-            self.fod.io.write("%d %.3f %.3f %.3f %.3f 0.000 0\n"
-                              % (idx + 1, self.ssp.cur.proc.depth[vi][idx], self.ssp.cur.proc.speed[vi][idx],
-                                 self.ssp.cur.proc.temp[vi][idx], self.ssp.cur.proc.sal[vi][idx]))
+        columns = self._valid_columns(self.ssp.cur.proc, vi, ['depth', 'speed', 'temp', 'sal'])
+        columns.insert(0, np.arange(1, np.sum(vi) + 1))  # sample number
+        self.fod.io.write(self._format_rows("%d %.3f %.3f %.3f %.3f 0.000 0\n", columns))
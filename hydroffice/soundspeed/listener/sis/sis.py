@@ -4,6 +4,7 @@ import logging
 import functools
 import time
 import struct
+from threading import Condition
 
 logger = logging.getLogger(__name__)
 
@@ -33,11 +34,48 @@ class Sis(AbstractListener):
         self.watercolumn = None
         self.bist = None
 
+        # the nav and xyz88 updates are published to the waiting threads (e.g., the server)
+        self.update_condition = Condition()
+        self.update_count = 0
+
+        # the SVP datagrams by sender IP, to match the echoes of the transmitted casts
+        self.ssp_condition = Condition()
+        self.ssp_by_ip = dict()
+
     def __repr__(self):
         msg = "%s" % super(Sis, self).__repr__()
         # msg += "  <has data loaded: %s>\n" % self.has_data_loaded
         return msg
 
+    def notify_update(self):
+        """Wake up the threads waiting for a nav or xyz88 update"""
+        with self.update_condition:
+            self.update_count += 1
+            self.update_condition.notify_all()
+
+    def wait_update(self, last_count, timeout=None):
+        """Wait for an update after the passed count (or the timeout), then return the current count"""
+        with self.update_condition:
+            self.update_condition.wait_for(lambda: self.update_count != last_count, timeout=timeout)
+            return self.update_count
+
+    def clear_ssp(self, ips):
+        """Forget the SVP datagrams received from the passed IPs"""
+        with self.ssp_condition:
+            for ip in ips:
+                self.ssp_by_ip.pop(ip, None)
+
+    def wait_ssp(self, ips, timeout):
+        """Wait (up to the timeout) for the SVP datagrams from the passed IPs, and return those received by IP"""
+        deadline = time.time() + timeout
+        with self.ssp_condition:
+            while True:
+                received = dict((ip, self.ssp_by_ip[ip]) for ip in ips if ip in self.ssp_by_ip)
+                remaining = deadline - time.time()
+                if (len(received) == len(set(ips))) or (remaining <= 0):
+                    return received
+                self.ssp_condition.wait(remaining)
+
     @classmethod
     def request_iur(cls, ip, port=4001):
         # Leaving this statement on until I have a chance to test with all systems.
@@ -96,18 +134,23 @@ class Sis(AbstractListener):
 
         elif self.id == 0x50:
             self.nav = km.KmNav(this_data)
+            self.notify_update()
 
         elif self.id == 0x52:
             self.runtime = km.KmRuntime(this_data)
 
         elif self.id == 0x55:
-            self.ssp = km.KmSvp(this_data)
+            with self.ssp_condition:
+                self.ssp = km.KmSvp(this_data)
+                self.ssp_by_ip[self.sender[0]] = self.ssp
+                self.ssp_condition.notify_all()
 
         elif self.id == 0x57:
             self.svp_input = km.KmSvpInput(this_data)
 
         elif self.id == 0x58:
             self.xyz88 = km.KmXyz88(this_data)
+            self.notify_update()
 
         elif self.id == 0x59:
             self.seabed_image89 = km.KmSeabedImage89(this_data)
@@ -155,75 +155,59 @@ class Oceanography(object):
 
         Returns: sound speed in m/s
         """
+        # the polynomial terms lose precision in float32
+        d = np.asarray(d, dtype=np.float64)
+        t = np.asarray(t, dtype=np.float64)
+        s = np.asarray(s, dtype=np.float64)
+
+        cwtp, atp, btp, dtp = cls._speed_coefficients(d=d, t=t, lat=lat)
+        return cls._speed_polynomial(cwtp, atp, btp, dtp, s)
+
+    # Chen and Millero(1977) coefficients: one row for each power of pressure, in increasing powers of temperature
+    _cw_coeffs = ((1402.388, 5.03830, -5.81090e-2, 3.3432e-4, -1.47797e-6, 3.1419e-9),
+                  (0.153563, 6.8999e-4, -8.1829e-6, 1.3632e-7, -6.1260e-10),
+                  (3.1260e-5, -1.7111e-6, 2.5986e-8, -2.5353e-10, 1.0415e-12),
+                  (-9.7729e-9, 3.8513e-10, -2.3654e-12))
+    _a_coeffs = ((1.389, -1.262e-2, 7.166e-5, 2.008e-6, -3.21e-8),
+                 (9.4742e-5, -1.2583e-5, -6.4928e-8, 1.0515e-8, -2.0142e-10),
+                 (-3.9064e-7, 9.1061e-9, -1.6009e-10, 7.994e-12),
+                 (1.100e-10, 6.651e-12, -3.391e-13))
+    _b_coeffs = ((-1.922e-2, -4.42e-5),
+                 (7.3637e-5, 1.7950e-7))
+    _d_coeffs = ((1.727e-3,),
+                 (-7.9836e-6,))
+
+    @staticmethod
+    def _horner(coeffs, x):
+        """Evaluate the polynomial with the passed coefficients (in increasing powers of x)"""
+        result = coeffs[-1]
+        for coeff in coeffs[-2::-1]:
+            result = result * x + coeff
+        return result
+
+    @classmethod
+    def _speed_coefficients(cls, d, t, lat):
+        """Return the salinity-independent terms of the speed() polynomial"""
 
         p = cls.d2p_backup(d, lat) / 10  # pressure in bar
 
-        c00 = 1402.388
-        c01 = 5.03830
-        c02 = -5.81090e-2
-        c03 = 3.3432e-4
-        c04 = -1.47797e-6
-        c05 = 3.1419e-9
-        c10 = 0.153563
-        c11 = 6.8999e-4
-        c12 = -8.1829e-6
-        c13 = 1.3632e-7
-        c14 = -6.1260e-10
-        c20 = 3.1260e-5
-        c21 = -1.7111e-6
-        c22 = 2.5986e-8
-        c23 = -2.5353e-10
-        c24 = 1.0415e-12
-        c30 = -9.7729e-9
-        c31 = 3.8513e-10
-        c32 = -2.3654e-12
-
-        a00 = 1.389
-        a01 = -1.262e-2
-        a02 = 7.166e-5
-        a03 = 2.008e-6
-        a04 = -3.21e-8
-        a10 = 9.4742e-5
-        a11 = -1.2583e-5
-        a12 = -6.4928e-8
-        a13 = 1.0515e-8
-        a14 = -2.0142e-10
-        a20 = -3.9064e-7
-        a21 = 9.1061e-9
-        a22 = -1.6009e-10
-        a23 = 7.994e-12
-        a30 = 1.100e-10
-        a31 = 6.651e-12
-        a32 = -3.391e-13
-
-        b00 = -1.922e-2
-        b01 = -4.42e-5
-        b10 = 7.3637e-5
-        b11 = 1.7950e-7
-
-        d00 = 1.727e-3
-        d10 = -7.9836e-6
-
-        dtp = d00 + (d10 * p)
-
-        btp = b00 + b01 * t + (b10 + b11 * t) * p
-
-        atp = (a00 + a01 * t + a02 * t ** 2 + a03 * t ** 3 + a04 * t ** 4) + \
-              (a10 + a11 * t + a12 * t ** 2 + a13 * t ** 3 + a14 * t ** 4) * p + \
-              (a20 + a21 * t + a22 * t ** 2 + a23 * t ** 3) * p ** 2 + \
-              (a30 + a31 * t + a32 * t ** 2) * p ** 3
-
-        cwtp = (c00 + c01 * t + c02 * t ** 2 + c03 * t ** 3 + c04 * t ** 4 + c05 * t ** 5) + \
-               (c10 + c11 * t + c12 * t ** 2 + c13 * t ** 3 + c14 * t ** 4) * p + \
-               (c20 + c21 * t + c22 * t ** 2 + c23 * t ** 3 + c24 * t ** 4) * p ** 2 + \
-               (c30 + c31 * t + c32 * t ** 2) * p ** 3
-
-        return cwtp + atp * s + btp * s ** 1.5 + dtp * s ** 2
+        terms = list()
+        for coeffs in (cls._cw_coeffs, cls._a_coeffs, cls._b_coeffs, cls._d_coeffs):
+            terms.append(cls._horner([cls._horner(t_coeffs, t) for t_coeffs in coeffs], p))
+
+        cwtp, atp, btp, dtp = terms
+        return cwtp, atp, btp, dtp
+
+    @staticmethod
+    def _speed_polynomial(cwtp, atp, btp, dtp, s):
+        return cwtp + (atp + btp * np.sqrt(s) + dtp * s) * s
 
     @classmethod
     def sal(cls, d, speed, t, lat=30):
         """Iteratively calculate the salinity based on the speed() method
 
+        The inputs may be arrays: all the samples are bisected together.
+
         Args:
             d: depth in meter
             speed: sound speed in m/sec
@@ -233,32 +217,48 @@ class Oceanography(object):
         Returns:  Salinity in PSU (ppt)
 
         """
-        high_value = 50.0
-        low_value = 0.0
+        d, speed, t, lat = np.broadcast_arrays(np.asarray(d, dtype=np.float64), np.asarray(speed, dtype=np.float64),
+                                               np.asarray(t, dtype=np.float64), np.asarray(lat, dtype=np.float64))
+        shape = d.shape
+        d = d.ravel()
+        speed = speed.ravel()
+        t = t.ravel()
+        lat = lat.ravel()
+
+        # the terms not depending on salinity are evaluated only once
+        cwtp, atp, btp, dtp = [np.broadcast_to(term, d.shape) for term in cls._speed_coefficients(d=d, t=t, lat=lat)]
+
+        high_value = np.full(d.shape, 50.0)
+        low_value = np.zeros(d.shape)
         num_iterations = 0
         max_iterations = 1e6
-        salinity = 0
-        speed_calc = 0
+        salinity = np.zeros(d.shape)
+        active = np.abs(0.0 - speed) > 0.0005  # the calculated speed starts from zero
 
-        while np.abs(speed_calc - speed) > 0.0005:
+        while np.any(active):
 
-            if high_value == low_value:  # unstable sound speed measurement
-                logger.warning("found unstable salinity value")
-                break
+            unstable = active & (high_value == low_value)
+            if np.any(unstable):  # unstable sound speed measurement
+                logger.warning("found %d unstable salinity values" % np.count_nonzero(unstable))
+                active &= ~unstable
+                if not np.any(active):
+                    break
             if num_iterations > max_iterations:
                 logger.warning("too many iterations to obtain the salinity value")
                 break
 
-            salinity = (high_value + low_value) / 2.0
-            speed_calc = cls.speed(d, t, salinity, lat)
-            if speed_calc > speed:
-                high_value = salinity
-            else:
-                low_value = salinity
+            idx = np.nonzero(active)[0]
+            salinity[idx] = (high_value[idx] + low_value[idx]) / 2.0
+            sal = salinity[idx]
+            speed_calc = cls._speed_polynomial(cwtp[idx], atp[idx], btp[idx], dtp[idx], sal)
+            higher = speed_calc > speed[idx]
+            high_value[idx[higher]] = salinity[idx[higher]]
+            low_value[idx[~higher]] = salinity[idx[~higher]]
+            active[idx[~(np.abs(speed_calc - speed[idx]) > 0.0005)]] = False
 
             num_iterations += 1
 
-        return salinity
+        return salinity.reshape(shape)[()]
 
     @classmethod
     def atg(cls, s, t, p):
@@ -451,6 +451,8 @@ class Oceanography(object):
 
         Returns: Conductivity mmho/cm
         """
+        if isinstance(s, np.ndarray) and (s.ndim > 0):
+            return cls._s2c_array(s=s, p=p, t=t)
 
         c = 0
         c_step = 0.1
@@ -477,6 +479,47 @@ class Oceanography(object):
 
         return last_c + delta_c / delta_s * (s - last_s)
 
+    @classmethod
+    def _s2c_array(cls, s, p, t, chunk_size=1024):
+        """Vectorized s2c: the same conductivity steps are evaluated for chunks of samples at once"""
+        c_step = 0.1
+        max_c = 100
+
+        # the same (accumulated) conductivity steps of the iterative version
+        steps = list()
+        c = 0
+        while c < max_c:
+            steps.append(c)
+            c += c_step
+        steps.append(c)  # the step after the last one, when the salinity is never exceeded
+        steps = np.array(steps, dtype=np.float64)
+
+        s = np.asarray(s, dtype=np.float64)
+        p = np.broadcast_to(p, s.shape)
+        t = np.broadcast_to(t, s.shape)
+        conductivity = np.empty(s.shape, dtype=np.float64)
+        for start in range(0, s.size, chunk_size):
+            end = min(start + chunk_size, s.size)
+            ss = s[start:end, np.newaxis]
+            calc_s = cls.c2s(steps[np.newaxis, :-1], p[start:end, np.newaxis], t[start:end, np.newaxis])
+
+            exceeded = calc_s > ss
+            found = exceeded.any(axis=1)
+            idx = np.where(found, np.argmax(exceeded, axis=1), steps.size - 2)
+            rows = np.arange(end - start)
+            c = np.where(found, steps[idx], steps[-1])
+            cur_s = calc_s[rows, idx]
+            last_c = np.where(found, steps[np.maximum(idx - 1, 0)], steps[idx])
+            last_s = np.where(found, calc_s[rows, np.maximum(idx - 1, 0)], cur_s)
+            first = found & (idx == 0)
+            last_c[first] = 0
+            last_s[first] = -1
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                conductivity[start:end] = last_c + (c - last_c) / (cur_s - last_s) * (ss[:, 0] - last_s)
+
+        return conductivity
+
     @classmethod
     def a(cls, f, t, s, d, ph):
         """Calculate attenuation
@@ -697,12 +740,29 @@ class Oceanography(object):
 
     @classmethod
     def attenuation(cls, f, t, s, d, ph):
-        # Francois & Garrison, J. Acoust. Soc. Am., Vol. 72, No. 6, December 1982
-        # f frequency (kHz)
-        # T Temperature (degC)
-        # S Salinity (ppt)
-        # D Depth (m)
-        # pH Acidity
+        """Attenuation (in dB/km) for a single frequency and sample (see attenuation_grid)"""
+        return float(cls.attenuation_grid(f=[f, ], t=t, s=s, d=d, ph=ph)[0, 0])
+
+    @classmethod
+    def attenuation_grid(cls, f, t, s, d, ph):
+        """Vectorized attenuation for a grid of frequencies (rows) by samples (columns)
+
+        Francois & Garrison, J. Acoust. Soc. Am., Vol. 72, No. 6, December 1982. The terms independent from
+        the frequency (e.g., the boric acid and MgSO4 relaxation frequencies) are evaluated only once per sample.
+
+        Args:
+            f: frequencies in kHz
+            t: temperature in deg Celsius
+            s: salinity in ppt
+            d: depth in meter
+            ph: acidity
+
+        Returns: attenuation in dB/km
+        """
+        f = np.asarray(f, dtype=np.float64)[:, np.newaxis]
+        t = np.asarray(t, dtype=np.float64)
+        s = np.asarray(s, dtype=np.float64)
+        d = np.asarray(d, dtype=np.float64)
         abs_temp = 273.0 + t
 
         # sound speed calculation
@@ -711,26 +771,21 @@ class Oceanography(object):
         # Boric Acid Contribution
         A1 = (8.86 / c) * math.pow(10.0, (0.78 * ph - 5.0))
         P1 = 1.0
-
-        f1 = 2.8 * math.pow((s / 35.0), 0.5) * math.pow(10.0, 4.0 - (1245.0 / abs_temp))
+        f1 = 2.8 * np.power((s / 35.0), 0.5) * np.power(10.0, 4.0 - (1245.0 / abs_temp))
 
         # MgSO4 Contribution
         A2 = (21.44 * s / c) * (1.0 + 0.025 * t)
         P2 = (1.0 - 1.37E-4 * d) + (6.2E-9 * d * d)
-        f2 = (8.17 * math.pow(10.0, 8.0 - 1990.0 / abs_temp)) / (1.0 + 0.0018 * (s - 35.0))
+        f2 = (8.17 * np.power(10.0, 8.0 - 1990.0 / abs_temp)) / (1.0 + 0.0018 * (s - 35.0))
 
         # Pure Water Contribution
-        if t <= 20.0:
-            A3 = 4.937E-4 - 2.59E-5 * t + 9.11E-7 * t * t - 1.50E-8 * t * t * t
-        else:
-            A3 = 3.964E-4 - 1.146E-5 * t + 1.45E-7 * t * t - 6.5E-10 * t * t * t
-
+        A3 = np.where(t <= 20.0,
+                      4.937E-4 - 2.59E-5 * t + 9.11E-7 * t * t - 1.50E-8 * t * t * t,
+                      3.964E-4 - 1.146E-5 * t + 1.45E-7 * t * t - 6.5E-10 * t * t * t)
         P3 = 1.0 - 3.83E-5 * d + 4.9E-10 * d * d
 
         boric = (A1 * P1 * f1 * f * f) / (f * f + f1 * f1)
         magnes = (A2 * P2 * f2 * f * f) / (f * f + f2 * f2)
         purewat = A3 * P3 * f * f
 
-        atten = boric + magnes + purewat
-
-        return atten
\ No newline at end of file
+        return boric + magnes + purewat
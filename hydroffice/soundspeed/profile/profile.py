@@ -1,4 +1,5 @@
 import os
+import heapq
 import time
 import numpy as np
 import logging
@@ -190,9 +191,13 @@ class Profile(object):
         else:
             latitude = self.meta.latitude
 
-        for count in range(self.data.num_samples):
-            self.data.sal[count] = Oc.sal(d=self.data.depth[count], speed=self.data.speed[count],
-                                          t=self.data.temp[count], lat=latitude)
+        num_samples = self.data.num_samples
+        if num_samples == 0:
+            logger.warning("no samples to calculate salinity")
+            return
+
+        self.data.sal[:num_samples] = Oc.sal(d=self.data.depth[:num_samples], speed=self.data.speed[:num_samples],
+                                             t=self.data.temp[:num_samples], lat=latitude)
         self.modify_proc_info(Dicts.proc_import_infos['CALC_SAL'])
 
     def calc_dyn_height(self):
@@ -293,11 +298,9 @@ class Profile(object):
         else:
             latitude = self.meta.latitude
 
-        for count in range(self.data.num_samples):
-            self.data.speed[count] = Oc.speed(self.data.depth[count],
-                                              self.data.temp[count],
-                                              self.data.sal[count],
-                                              latitude)
+        num_samples = self.data.num_samples
+        self.data.speed[:num_samples] = Oc.speed(self.data.depth[:num_samples], self.data.temp[:num_samples],
+                                               self.data.sal[:num_samples], latitude)
         self.modify_proc_info(Dicts.proc_import_infos['CALC_SPD'])
 
     def calc_proc_speed(self):
@@ -309,11 +312,9 @@ class Profile(object):
         else:
             latitude = self.meta.latitude
 
-        for count in range(self.proc.num_samples):
-            self.proc.speed[count] = Oc.speed(self.proc.depth[count],
-                                              self.proc.temp[count],
-                                              self.proc.sal[count],
-                                              latitude)
+        num_samples = self.proc.num_samples
+        self.proc.speed[:num_samples] = Oc.speed(self.proc.depth[:num_samples], self.proc.temp[:num_samples],
+                                               self.proc.sal[:num_samples], latitude)
         self.modify_proc_info(Dicts.proc_user_infos['RECALC_SPD'])
 
     def calc_attenuation(self, frequency, ph):
@@ -764,8 +765,15 @@ class Profile(object):
 
     # - thinning
 
-    def thin(self, tolerance):
-        """Thin the sis data"""
+    # a sis sample as written in the Kongsberg S01/S12 formats (to estimate the size of the thinned profile)
+    _sis_sample_template = "%.2f,%1f,%.2f,%.2f,\r\n"
+
+    def thin(self, tolerance, max_points=None, max_size=None):
+        """Thin the sis data
+
+        Optionally, the thinned profile is limited to the most significant max_points samples,
+        and/or to max_size bytes (as sum of the S01/S12 sample lines).
+        """
         logger.info("thinning the sis samples")
 
         # if the profile is too short, we just pass it back
@@ -776,51 +784,74 @@ class Profile(object):
 
         # - 1000 points for: EM2040, EM710, EM302 and EM122;
         # - 570 points for: EM3000, EM3002, EM1002, EM300, EM120
-        # TODO: the resulting profile must be less than 30kB
-        flagged = self.sis.flag[self.sis_valid][:]
-        idx_start = 0
-        idx_end = self.sis.depth[self.sis_valid].size - 1
-        # logger.debug('first: %s, last: %s[%s]'
-        #              % (self.sis.depth[self.sis_valid][idx_start],
-        #                 self.sis.depth[self.sis_valid][idx_end],
-        #                 self.sis.flag[self.sis_valid][idx_end]))
-        self.douglas_peucker_1d(idx_start, idx_end, tolerance=tolerance, data=flagged)
-        self.sis.flag[self.sis_valid] = flagged[:]
+        # - the resulting profile must be less than 30kB
+        valid = self.sis_valid
+        depth = self.sis.depth[valid]
+        speed = self.sis.speed[valid]
+        sample_sizes = None
+        if max_size is not None:
+            sample_sizes = np.array([len(self._sis_sample_template % values) for values in
+                                     zip(depth, speed, self.sis.temp[valid], self.sis.sal[valid])])
+
+        kept = self.douglas_peucker_mask(depth, speed, tolerance=tolerance, max_points=max_points,
+                                         sample_sizes=sample_sizes, max_size=max_size)
+        flagged = self.sis.flag[valid][:]
+        flagged[kept] = Dicts.flags['thin']
+        self.sis.flag[valid] = flagged[:]
 
         # logger.info("thinned: %s" % self.sis.flag[self.sis_thinned].size)
         return True
 
-    def douglas_peucker_1d(self, start, end, tolerance, data):
-        """ Recursive implementation """
-        # logger.debug("dp: %s, %s" % (start, end))
-
-        # We always keep end points
-        data[start] = Dicts.flags['thin']
-        data[end] = Dicts.flags['thin']
-
-        slope = (self.sis.speed[self.sis_valid][end] - self.sis.speed[self.sis_valid][start]) / \
-                (self.sis.depth[self.sis_valid][end] - self.sis.depth[self.sis_valid][start])
+    @staticmethod
+    def douglas_peucker_mask(depth, speed, tolerance, max_points=None, sample_sizes=None, max_size=None):
+        """Iterative Douglas-Peucker, returning the mask of the kept samples
 
-        max_dist = 0
-        max_ind = 0
-        for ind in range(start + 1, end):
-            dist = abs(self.sis.speed[self.sis_valid][start] +
-                       slope * (self.sis.depth[self.sis_valid][ind] - self.sis.depth[self.sis_valid][start]) -
-                       self.sis.speed[self.sis_valid][ind])
-
-            if dist > max_dist:
-                max_dist = dist
-                max_ind = ind
-
-        if max_dist <= tolerance:
-            return
+        The segments are split by decreasing deviation, so the limits on the number of points and on the
+        size (as sum of the sample_sizes) retain the most significant samples.
+        """
+        num_samples = depth.size
+        kept = np.zeros(num_samples, dtype=bool)
+        if num_samples == 0:
+            return kept
 
-        else:
-            data[max_ind] = Dicts.flags['thin']
-            # print(max_ind, max_dist, data[max_ind])
-            self.douglas_peucker_1d(start, max_ind, tolerance, data=data)
-            self.douglas_peucker_1d(max_ind, end, tolerance, data=data)
-            return
+        # We always keep end points
+        kept[0] = True
+        kept[-1] = True
+        num_points = np.count_nonzero(kept)
+        size = 0
+        if sample_sizes is not None:
+            size = sample_sizes[kept].sum()
+
+        segments = list()  # heap of (-max deviation, start, max deviation index, end)
+
+        def add_segment(start, end):
+            if end - start < 2:
+                return
+            with np.errstate(divide='ignore', invalid='ignore'):
+                slope = (speed[end] - speed[start]) / (depth[end] - depth[start])
+                dist = np.abs(speed[start] + slope * (depth[start + 1:end] - depth[start]) - speed[start + 1:end])
+            dist[np.isnan(dist)] = 0.0
+            ind = int(np.argmax(dist))
+            if dist[ind] > tolerance:
+                heapq.heappush(segments, (-dist[ind], start, start + 1 + ind, end))
+
+        add_segment(0, num_samples - 1)
+        while len(segments) > 0:
+            if (max_points is not None) and (num_points >= max_points):
+                break
+            _, start, ind, end = segments[0]
+            if (max_size is not None) and (size + sample_sizes[ind] > max_size):
+                break
+
+            heapq.heappop(segments)
+            kept[ind] = True
+            num_points += 1
+            if sample_sizes is not None:
+                size += sample_sizes[ind]
+            add_segment(start, ind)
+            add_segment(ind, end)
+
+        return kept
 
     # - debugging
 
@@ -911,6 +942,27 @@ class Profile(object):
 
     def compute_ray_paths(self, draft, thetas_deg, travel_times=None, res=.005, b_project=False):
         """Returns a RayPath object for each launch angle."""
+        tt, fan, end_times = self._trace_ray_fan(draft, thetas_deg, travel_times=travel_times, res=res,
+                                                 b_project=b_project)
+
+        ray_paths = []
+        for i, end_time in enumerate(end_times):
+            if travel_times is None:
+                nr_times = len(np.arange(res, end_time, res))  # travel_times to reach end of profile
+            else:
+                nr_times = len(tt)
+            ray_paths.append(RayPath(fan[i, :nr_times]))
+
+        return ray_paths
+
+    def compute_ray_fan(self, draft, thetas_deg, travel_times=None, res=.005, b_project=False):
+        """Returns an (angles, travel times, 3) array of (travel time, depth, across track) for the launch angles
+
+        When travel times are not passed, they reach the end of the profile for the widest ray.
+        """
+        return self._trace_ray_fan(draft, thetas_deg, travel_times=travel_times, res=res, b_project=b_project)[1]
+
+    def _trace_ray_fan(self, draft, thetas_deg, travel_times=None, res=.005, b_project=False):
         if not draft or draft == 'Unknown':
             draft = 0.0
         else:
@@ -919,21 +971,21 @@ class Profile(object):
         depths = self.proc.depth[self.proc_dqa_valid] - draft
         speeds = self.proc.speed[self.proc_dqa_valid]
 
-        ray_paths = []
-        for launch in thetas_deg:
-
-            params = RayTracing.get_svp_layer_parameters(np.deg2rad(launch), depths, speeds)
-            if travel_times is None:
-                tt = np.arange(res, params[-2][-1], res)  # make travel_times to reach end of profile
-            else:
-                tt = np.array(travel_times)
+        params = RayTracing.get_svp_fan_parameters(np.deg2rad(thetas_deg), depths, speeds)
+        end_times = params[-2][:, -1]
+        if travel_times is None:
+            tt = np.arange(res, np.nanmax(end_times), res)  # make travel_times to reach end of profile
+        else:
+            tt = np.array(travel_times, np.float64).ravel()
 
-            rays = RayTracing.ray_trace(tt, depths, speeds, params, b_project=b_project)
-            rays[:, 0] += draft
+        rays = RayTracing.ray_trace_fan(tt, depths, speeds, params, b_project=b_project)
+        rays[:, :, 0] += draft
 
-            ray_paths.append(RayPath(np.vstack((tt, rays.transpose())).transpose()))
+        fan = np.empty((rays.shape[0], len(tt), 3))
+        fan[:, :, 0] = tt
+        fan[:, :, 1:] = rays
 
-        return ray_paths
+        return tt, fan, end_times
 
     def compare_profile(self, profile, angle):
 
@@ -9,7 +9,65 @@ class RayTracing(object):
 
     @classmethod
     def get_svp_layer_parameters(cls, launch_angle_radians, depths, speeds):
-        return cls.get_svp_layer_parameters_slow(launch_angle_radians, depths, speeds)
+        """Vectorized version of get_svp_layer_parameters_slow"""
+        gradient, gamma, radius, total_time, total_range = \
+            cls.get_svp_fan_parameters([launch_angle_radians], depths, speeds)
+        return gradient, gamma[0], radius[0], total_time[0], total_range[0]
+
+    @classmethod
+    def get_svp_fan_parameters(cls, launch_angles_radians, depths, speeds):
+        """Layer parameters for a fan of launch angles
+
+        Gamma, radius, total time and total range are (angles, depths) arrays.
+        """
+
+        speed = np.array(speeds, np.float64).ravel()  # need double precision for this computation
+        depth = np.array(depths, np.float64).ravel()
+        depth[0] = 0.0  # assume zero for top layer
+        angles = np.array(launch_angles_radians, np.float64).reshape(-1, 1)
+
+        delta_depth = np.diff(depth)
+        gradient = np.diff(speed) / delta_depth
+
+        # Snell's law: sin(gamma) / speed is constant along the ray (the ray parameter)
+        with np.errstate(invalid='ignore'):
+            gamma = arcsin((speed / speed[0]) * sin(angles))
+        gamma[:, 0] = angles[:, 0]
+        # once the ray is reflected (invalid arcsin), all the following layers are invalid
+        gamma[np.maximum.accumulate(np.isnan(gamma), axis=1)] = np.nan
+
+        gamma_top = gamma[:, :-1]
+        gamma_bottom = gamma[:, 1:]
+        shape = gamma_top.shape
+        delta_depth = np.broadcast_to(delta_depth, shape)
+        gradient_2d = np.broadcast_to(gradient, shape)
+        speed_top = np.broadcast_to(speed[:-1], shape)
+        speed_bottom = np.broadcast_to(speed[1:], shape)
+
+        nadir = gamma_top == 0  # nadir beam (could cause division by zero errors below)
+        constant = ~nadir & (gradient_2d == 0)
+        curved = ~nadir & ~constant
+
+        radius = np.zeros(gamma.shape, np.float64)
+        delta_time = np.empty(shape, np.float64)
+        delta_range = np.zeros(shape, np.float64)
+
+        delta_time[nadir] = delta_depth[nadir] / ((speed_bottom[nadir] + speed_top[nadir]) / 2.0)
+
+        delta_time[constant] = delta_depth[constant] / (speed_top[constant] * cos(gamma_top[constant]))
+        delta_range[constant] = delta_depth[constant] * tan(gamma_top[constant])
+
+        radius[:, :-1][curved] = speed_top[curved] / (gradient_2d[curved] * sin(gamma_top[curved]))
+        delta_time[curved] = log(tan(gamma_bottom[curved] / 2.0) / tan(gamma_top[curved] / 2.0)) / \
+            gradient_2d[curved]
+        delta_range[curved] = radius[:, :-1][curved] * (cos(gamma_top[curved]) - cos(gamma_bottom[curved]))
+
+        start = np.zeros((gamma.shape[0], 1), np.float64)
+        total_time = np.hstack((start, np.cumsum(delta_time, axis=1)))
+        total_range = np.hstack((start, np.cumsum(delta_range, axis=1)))
+
+        # Note the last radius doen't get computed but that isn't important
+        return gradient, gamma, radius, total_time, total_range
 
     @classmethod
     def get_svp_layer_parameters_slow(cls, launch_angle_radians, depths, speeds):
@@ -54,6 +112,83 @@ class RayTracing(object):
 
     @classmethod
     def ray_trace(cls, travel_times, depths, speeds, params, b_project=False):
+        """Vectorized version of ray_trace_slow"""
+        gradient, gamma, radius, total_time, total_range = [np.ravel(param) for param in params]
+        fan_params = gradient, gamma[np.newaxis], radius[np.newaxis], total_time[np.newaxis], total_range[np.newaxis]
+        return cls.ray_trace_fan(travel_times, depths, speeds, fan_params, b_project=b_project)[0]
+
+    @classmethod
+    def ray_trace_fan(cls, travel_times, depths, speeds, params, b_project=False):
+        """Trace a fan of rays, using the parameters from get_svp_fan_parameters
+
+        Returns an (angles, travel times, 2) array of depth and range, with -1 for out of range.
+        """
+
+        nr_layers = len(depths) - 1
+
+        speed = np.ravel(speeds)
+        depth = np.array(depths).ravel()
+        depth[0] = 0.0  # assume zero for top layer
+
+        gradient, gamma, radius, total_time, total_range = params
+        travel_times = np.atleast_1d(np.asarray(travel_times, np.float64)).ravel()
+        nr_angles = gamma.shape[0]
+
+        ret = np.zeros([nr_angles, len(travel_times), 2]) - 1.0  # create an array where -1 denotes out of range
+
+        nr_end_layers = np.empty((nr_angles, len(travel_times)), dtype=int)
+        for i in range(nr_angles):
+            nr_end_layers[i] = total_time[i].searchsorted(travel_times)
+        nr_end_layers = np.maximum(nr_end_layers - 1, 0)
+        if b_project:
+            valid = np.ones(nr_end_layers.shape, dtype=bool)
+        else:
+            valid = nr_end_layers < nr_layers  # SVP deep enough
+
+        rays = np.nonzero(valid)[0]
+        layers = nr_end_layers[valid]
+        times = np.broadcast_to(travel_times, valid.shape)[valid]
+        tau = times - total_time[rays, layers]
+
+        final_depth = np.empty(layers.shape, np.float64)
+        final_range = np.empty(layers.shape, np.float64)
+
+        # straight ray in the layer
+        straight = radius[rays, layers] == 0
+        ray = rays[straight]
+        lay = layers[straight]
+        # projecting the last speed to infinite depth (for layers beyond the profile)
+        inner = lay < nr_layers
+        lay_next = np.minimum(lay + 1, nr_layers)
+        time_top = total_time[ray, lay]
+        time_bottom = total_time[ray, lay_next]
+        speed_top = speed[lay]
+        speed_bottom = speed[lay_next]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = (speed_bottom - speed_top) / (time_bottom - time_top)
+            endspeed = slope * (times[straight] - time_top) + speed_top
+        endspeed = np.where(times[straight] <= time_top, speed_top, endspeed)
+        endspeed = np.where(times[straight] >= time_bottom, speed_bottom, endspeed)
+        endspeed = np.where(inner, endspeed, speed_top)
+
+        avg_speed = (speed_top + endspeed) / 2.0
+        final_depth[straight] = avg_speed * tau[straight] * cos(gamma[ray, lay]) + depth[lay]
+        final_range[straight] = avg_speed * tau[straight] * sin(gamma[ray, lay]) + total_range[ray, lay]
+
+        # curved ray in the layer
+        ray = rays[~straight]
+        lay = layers[~straight]
+        angle = 2 * arctan(tan(gamma[ray, lay] / 2.0) * exp(gradient[lay] * tau[~straight]))
+        final_depth[~straight] = radius[ray, lay] * (sin(angle) - sin(gamma[ray, lay])) + depth[lay]
+        final_range[~straight] = radius[ray, lay] * (-cos(angle) + cos(gamma[ray, lay])) + total_range[ray, lay]
+
+        ret[valid, 0] = final_depth
+        ret[valid, 1] = final_range
+
+        return ret
+
+    @classmethod
+    def ray_trace_slow(cls, travel_times, depths, speeds, params, b_project=False):
 
         nr_layers = len(depths) - 1
 
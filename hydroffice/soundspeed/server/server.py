@@ -5,6 +5,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 from hydroffice.soundspeed.profile.dicts import Dicts
+from hydroffice.soundspeed.server.synthetic_cache import SyntheticCache
 
 
 class Server(Thread):
@@ -16,14 +17,26 @@ class Server(Thread):
         self.delivered_casts = 0
         self.force_send = Event()
         self.shutdown = Event()
-        self.wait_time = 5
+        self.wait_time = 5  # max time waiting for a nav/xyz88 update
+        self.debounce_time = 0.2  # to collect the datagrams received together
+        self.min_update_interval = 1.0  # min time between two checks (i.e., the max update rate)
+        self.tss_threshold = 1.0  # surface sound speed drift that triggers a new cast
 
         self.tss_last = None
-        self.lat_idx_last = None
-        self.lon_idx_last = None
+        self.cell_last = None
+        self.cache = SyntheticCache(prj=self.prj)
 
     def stop(self):
         self.shutdown.set()
+        self.wake()
+
+    def force(self):
+        """Send a new cast at the next check, without waiting for an update"""
+        self.force_send.set()
+        self.wake()
+
+    def wake(self):
+        self.prj.listeners.sis.notify_update()
 
     def check_settings(self):
         """Check the server settings"""
@@ -85,9 +98,9 @@ class Server(Thread):
 
         self.prj.progress.update(20)
 
-        # Test clients interaction
-        prog_quantum = 80 / (len(self.prj.setup.client_list.clients) + 1)
+        # Test clients interaction (all the clients at once)
         logger.info("Testing clients for reception-confirmation interaction")
+        received = self.prj.setup.client_list.request_profiles_from_sis(prj=self.prj)
         num_live_clients = 0
         for client in self.prj.setup.client_list.clients:
 
@@ -95,18 +108,16 @@ class Server(Thread):
                 client.alive = False
                 continue
 
-            client.request_profile_from_sis(self.prj)
-
-            if self.prj.listeners.sis.ssp:
-                logger.info("Interaction test: OK")
+            if client.ip in received:
+                logger.info("Interaction test with %s: OK" % client.name)
                 client.alive = True
                 num_live_clients += 1
 
             else:
-                logger.warning("Interaction test: KO")
+                logger.warning("Interaction test with %s: KO" % client.name)
                 client.alive = False
 
-            self.prj.progress.add(prog_quantum)
+        self.prj.progress.update(90)
 
         if num_live_clients == 0:
             logger.error("Unable to confirm interaction with any clients > The Server Mode is not available")
@@ -125,7 +136,7 @@ class Server(Thread):
         # # reset server flags
         # self.update_plot = False
 
-        self.force_send = False
+        self.force_send.clear()
         self.delivered_casts = 0
 
         self.prj.progress.end()
@@ -136,6 +147,9 @@ class Server(Thread):
         # self.init_logger()
         logger.debug("%s start" % self.name)
 
+        sis = self.prj.listeners.sis
+        update_count = sis.update_count
+        last_check = None
         count = 0
         while True:
             if self.shutdown.is_set():
@@ -143,11 +157,28 @@ class Server(Thread):
                 break
             if (count % 100) == 0:
                 logger.debug("#%05d: running" % count)
+            count += 1
 
-            self.check()
+            # wait for a nav/xyz88 update (or for a wake up to stop or to force a send)
+            new_count = sis.wait_update(update_count, timeout=self.wait_time)
+            if self.shutdown.is_set():
+                continue
+            if (new_count == update_count) and not self.force_send.is_set():
+                logger.debug("no updates in the last %s secs" % self.wait_time)
+                continue
 
-            time.sleep(3)
-            count += 1
+            if not self.force_send.is_set():
+                # debounce, then limit the update rate
+                delay = self.debounce_time
+                if last_check is not None:
+                    delay = max(delay, self.min_update_interval - (time.time() - last_check))
+                if self.shutdown.wait(delay):
+                    continue
+
+            update_count = sis.update_count  # the updates received in the meanwhile are used by this check
+            last_check = time.time()
+            self.check()
+            self.prefetch()
 
         logger.debug("%s end" % self.name)
 
@@ -157,26 +188,13 @@ class Server(Thread):
         lon = self.prj.listeners.sis.nav.longitude
         tm = self.prj.listeners.sis.nav.dg_time
         if (lat is None) or (lon is None) or (tm is None):
-            logger.warning("Possible corrupted reception of spatial timestamp > Waiting %s secs"
-                           % self.wait_time)
-            count = 0
-            while count < self.wait_time:
-                time.sleep(1)
-                count += 1
+            logger.warning("Possible corrupted reception of spatial timestamp > Waiting for the next update")
             return
         logger.debug('loc/timestamp: (%s %s)/%s' % (lat, lon, tm.strftime('%Y/%m/%d %H:%M')))
 
-        # retrieve grid index
-        if self.prj.setup.server_source == 'RTOFS':  # RTOFS case
-            lat_idx, lon_idx = self.prj.atlases.rtofs.grid_coords(lat=lat, lon=lon, datestamp=tm, server_mode=True)
-        elif self.prj.setup.server_source == 'WOA09':  # WOA09 case
-            lat_idx, lon_idx = self.prj.atlases.woa09.grid_coords(lat=lat, lon=lon, server_mode=True)
-        elif self.prj.setup.server_source == 'WOA13':  # WOA09 case
-            lat_idx, lon_idx = self.prj.atlases.woa13.grid_coords(lat=lat, lon=lon, server_mode=True)
-        else:
-            raise RuntimeError('unable to understand server source: %s' % self.prj.setup.server_source)
-        logger.debug('lat idx: %s [last: %s]' % (lat_idx, self.lat_idx_last))
-        logger.debug('lon idx: %s [last: %s]' % (lon_idx, self.lon_idx_last))
+        # retrieve grid cell (with the time slice)
+        cell = self.cache.key(source=self.prj.setup.server_source, lat=lat, lon=lon, datestamp=tm)
+        logger.debug('cell: %s [last: %s]' % (cell, self.cell_last))
 
         # retrieve surface sound speed
         tss = None
@@ -185,12 +203,7 @@ class Server(Thread):
         if self.prj.setup.server_apply_surface_sound_speed:
 
             if self.prj.listeners.sis.xyz88 is None:
-                logger.warning("Unable to retrieve xyz88 datagram > Waiting %s secs"
-                               % self.wait_time)
-                count = 0
-                while count < self.wait_time:
-                    time.sleep(1)
-                    count += 1
+                logger.warning("Unable to retrieve xyz88 datagram > Waiting for the next update")
                 return
 
             logger.debug('loc/timestamp: (%s %s)/%s' % (lat, lon, tm.strftime('%Y/%m/%d %H:%M')))
@@ -205,7 +218,7 @@ class Server(Thread):
         logger.debug('tss delta: %s' % tss_diff)
 
         # check if we need a new cast
-        if (tss_diff < 1.0) and (lat_idx == self.lat_idx_last) and (lon_idx == self.lon_idx_last):
+        if (tss_diff < self.tss_threshold) and (cell == self.cell_last):
             if self.force_send.is_set():
                 logger.debug('forcing send')
                 self.force_send.clear()
@@ -213,18 +226,9 @@ class Server(Thread):
                 logger.debug('new profile not required')
                 return
 
-        # retrieve profile
-        if self.prj.setup.server_source == 'RTOFS':  # RTOFS case
-            self.prj.ssp = self.prj.atlases.rtofs.query(lat=lat, lon=lon, datestamp=tm, server_mode=True)
-
-        elif self.prj.setup.server_source == 'WOA09':  # WOA09 case
-            self.prj.ssp = self.prj.atlases.woa09.query(lat=lat, lon=lon, datestamp=tm, server_mode=True)
-
-        elif self.prj.setup.server_source == 'WOA13':  # WOA09 case
-            self.prj.ssp = self.prj.atlases.woa13.query(lat=lat, lon=lon, datestamp=tm, server_mode=True)
-
-        else:
-            raise RuntimeError('unable to understand server source: %s' % self.prj.setup.server_source)
+        # retrieve profile (from the cache, when the cell was already visited or prefetched)
+        self.prj.ssp = self.cache.query(source=self.prj.setup.server_source, lat=lat, lon=lon, datestamp=tm,
+                                        key=cell)
 
         if not self.prj.has_ssp():
             logger.warning("Unable to retrieve a synthetic cast > Continue the loop")
@@ -242,14 +246,18 @@ class Server(Thread):
             logger.info("Requesting cast from SIS (prior to transmission)")
 
             for client in self.prj.setup.client_list.clients:
-
-                # skipping dead clients
                 if not client.alive:
                     logger.info("Dead client: %s > Skipping" % client.ip)
+            live_clients = [client for client in self.prj.setup.client_list.clients if client.alive]
+            received = self.prj.setup.client_list.request_profiles_from_sis(prj=self.prj, clients=live_clients)
+
+            for client in live_clients:
+
+                if client.protocol != "SIS":
                     continue
 
-                client.request_profile_from_sis(prj=self.prj)
-                if not self.prj.listeners.sis.ssp:
+                ssp = received.get(client.ip)
+                if not ssp:
                     logger.info("client %s dead since last tx" % client.name)
                     client.alive = False
                     continue
@@ -258,10 +266,9 @@ class Server(Thread):
                 num_live_clients += 1
 
                 # test by comparing the times
-                if self.prj.setup.client_list.last_tx_time != self.prj.listeners.sis.ssp.acquisition_time:
+                if self.prj.setup.client_list.last_tx_time != ssp.acquisition_time:
                     logger.error("Times mismatch > %s != %s"
-                                 % (self.prj.setup.client_list.last_tx_time,
-                                    self.prj.listeners.sis.ssp.acquisition_time))
+                                 % (self.prj.setup.client_list.last_tx_time, ssp.acquisition_time))
                     self.shutdown.set()
                     return
 
@@ -274,5 +281,16 @@ class Server(Thread):
         if self.prj.setup.server_apply_surface_sound_speed:
             self.tss_last = tss  # store the tss for the next iteration
 
-        self.lat_idx_last = lat_idx
-        self.lon_idx_last = lon_idx
+        self.cell_last = cell
+
+    def prefetch(self):
+        """Retrieve the profiles for the next cells along the vessel course"""
+        nav = self.prj.listeners.sis.nav
+        if (nav is None) or (nav.latitude is None) or (nav.longitude is None) or (nav.dg_time is None):
+            return
+
+        try:
+            self.cache.prefetch(source=self.prj.setup.server_source, lat=nav.latitude, lon=nav.longitude,
+                                datestamp=nav.dg_time, course=nav.cog)
+        except RuntimeError as e:
+            logger.warning("unable to prefetch: %s" % e)
@@ -0,0 +1,95 @@
+from collections import OrderedDict
+import copy
+import math
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SyntheticCache(object):
+    """LRU cache of the synthetic profiles used by the server, keyed by atlas, grid cell and time slice"""
+
+    def __init__(self, prj, max_size=64):
+        self.prj = prj
+        self.max_size = max_size
+        # prefetch of the cells ahead of the vessel
+        self.prefetch_distance = 30000.0  # meters along the course
+        self.prefetch_step = 1000.0  # meters
+        self.prefetch_max = 2  # max number of atlas queries for each prefetch
+
+        self._profiles = OrderedDict()
+
+    def __len__(self):
+        return len(self._profiles)
+
+    def atlas(self, source):
+        if source == 'RTOFS':
+            return self.prj.atlases.rtofs
+        elif source == 'WOA09':
+            return self.prj.atlases.woa09
+        elif source == 'WOA13':
+            return self.prj.atlases.woa13
+        else:
+            raise RuntimeError('unable to understand server source: %s' % source)
+
+    def key(self, source, lat, lon, datestamp):
+        return (source, ) + tuple(self.atlas(source).cell_key(lat=lat, lon=lon, datestamp=datestamp))
+
+    def query(self, source, lat, lon, datestamp, key=None):
+        """Return a copy of the synthetic profiles for the cell of the passed point (None if not available)"""
+        if key is None:
+            key = self.key(source=source, lat=lat, lon=lon, datestamp=datestamp)
+
+        if key in self._profiles:
+            self._profiles.move_to_end(key)
+            logger.debug("cached cell: %s" % (key, ))
+
+        else:
+            ssp = self.atlas(source).query(lat=lat, lon=lon, datestamp=datestamp, server_mode=True)
+            if ssp is None:
+                return None
+            self._store(key, ssp)
+
+        # the server modifies the profiles (e.g., applying the surface sound speed)
+        return copy.deepcopy(self._profiles[key])
+
+    def _store(self, key, ssp):
+        self._profiles[key] = ssp
+        while len(self._profiles) > self.max_size:
+            self._profiles.popitem(last=False)
+
+    def prefetch(self, source, lat, lon, datestamp, course):
+        """Retrieve the profiles of the next cells along the passed course (in degrees)"""
+        if (course is None) or not (0.0 <= course <= 360.0):  # e.g., course not available
+            return 0
+
+        cos_lat = math.cos(math.radians(lat))
+        if cos_lat < 1e-6:
+            return 0
+        dlat = math.cos(math.radians(course)) / 111320.0
+        dlon = math.sin(math.radians(course)) / (111320.0 * cos_lat)
+
+        current_key = self.key(source=source, lat=lat, lon=lon, datestamp=datestamp)
+        num_queries = 0
+        dist = self.prefetch_step
+        while (dist <= self.prefetch_distance) and (num_queries < self.prefetch_max):
+            next_lat = lat + dist * dlat
+            next_lon = (lon + dist * dlon + 180.0) % 360.0 - 180.0
+            dist += self.prefetch_step
+            if abs(next_lat) > 90.0:
+                break
+
+            key = self.key(source=source, lat=next_lat, lon=next_lon, datestamp=datestamp)
+            if (key == current_key) or (key in self._profiles):
+                continue
+
+            logger.debug("prefetching cell: %s" % (key, ))
+            num_queries += 1
+            ssp = self.atlas(source).query(lat=next_lat, lon=next_lon, datestamp=datestamp, server_mode=True)
+            if ssp is not None:
+                self._store(key, ssp)
+
+        return num_queries
+
+    def clear(self):
+        self._profiles.clear()
@@ -3,6 +3,7 @@ import time
 import os
 import copy
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,6 +11,7 @@ logger = logging.getLogger(__name__)
 from hydroffice.soundspeed import __version__ as soundspeed_version
 from hydroffice.soundspeed import __doc__ as soundspeed_name
 from hydroffice.soundspeed import formats
+from hydroffice.soundspeed.formats import batch
 from hydroffice.soundspeed.appdirs.appdirs import user_data_dir
 from hydroffice.soundspeed.atlas.atlases import Atlases
 from hydroffice.soundspeed.base.callbacks.abstract_callbacks import AbstractCallbacks
@@ -20,6 +22,8 @@ from hydroffice.soundspeed.base.progress.abstract_progress import AbstractProgre
 from hydroffice.soundspeed.base.progress.cli_progress import CliProgress
 from hydroffice.soundspeed.base.setup import Setup
 from hydroffice.soundspeed.db.db import ProjectDb
+from hydroffice.soundspeed.db.point import Point, adapt_point
+from hydroffice.soundspeed.db.pool import DbPool
 from hydroffice.soundspeed.listener.listeners import Listeners
 from hydroffice.soundspeed.logging.sqlitelogging import SqliteLogging
 from hydroffice.soundspeed.profile.profilelist import ProfileList
@@ -61,6 +65,7 @@ class SoundSpeedLibrary(object):
         self.listeners = Listeners(prj=self)
         self.server = Server(prj=self)
         self.logs = SqliteLogging(self._release_folder)  # (user and server) loggers
+        self.db_pool = DbPool()  # project db handles
 
         self.logging()  # Set on/off logging for user and server based on loaded settings
 
@@ -97,6 +102,11 @@ class SoundSpeedLibrary(object):
             self.server.stop()
             self.server.join(2)
 
+        if self.setup.client_list is not None:
+            self.setup.client_list.close()
+
+        self.db_pool.close()
+
         logger.info("** > LIB: closed!")
 
     # --- library, release, atlases, and projects folders
@@ -412,24 +422,117 @@ class SoundSpeedLibrary(object):
         self.ssp = reader.ssp
         logger.debug("data file successfully parsed!")
 
-        # retrieve atlases data for each retrieved profile
-        for pr in self.ssp.l:
+        # retrieve atlases data for all the retrieved profiles at once
+        if skip_atlas:
+            return
+        self._retrieve_atlases(self.ssp.l)
+
+    def import_data_batch(self, paths, data_format=None, recursive=False, skip_atlas=False, store=True,
+                          max_workers=None, callbacks=None):
+        """Import the data files in the passed files, directories and/or glob patterns
+
+        The files are parsed in a process pool (the reader is detected by extension, unless data_format is passed),
+        the atlases are queried once for all the profiles, and the profiles are stored in a single transaction.
+        Return a BatchImportResult for each file, with the parsing time and the error (if any).
+
+        When callbacks are passed (e.g., the interactive ones of the GUI), the files are parsed serially in this
+        process, so that the user can be asked for the missing location/date.
+        """
+        data_files = batch.list_data_files(paths, recursive=recursive)
+        logger.info("batch import: %d files" % len(data_files))
+        if len(data_files) == 0:
+            return list()
+
+        # the client list may hold open sockets, and it is not used by the readers
+        settings = copy.copy(self.setup)
+        settings.client_list = None
+
+        start_time = time.time()
+        self.progress.start(text="Parsing %d files" % len(data_files))
+        quantum = 80.0 / len(data_files)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(data_files))
+        if callbacks is not None:  # the callbacks cannot be used by the worker processes
+            max_workers = 1
+
+        results = list()
+        if max_workers <= 1:
+            for data_file in data_files:
+                results.append(batch.parse_file(path=data_file, settings=settings, data_format=data_format,
+                                                callbacks=callbacks))
+                self.progress.add(quantum=quantum)
+                if self.progress.canceled:
+                    break
+
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(batch.parse_file, path=data_file, settings=settings,
+                                           data_format=data_format) for data_file in data_files]
+                for future in as_completed(futures):
+                    self.progress.add(quantum=quantum)
+                    if self.progress.canceled:
+                        for f in futures:
+                            f.cancel()
+                        break
+                for data_file, future in zip(data_files, futures):
+                    if future.cancelled() or not future.done():
+                        continue
+                    try:
+                        results.append(future.result())
+                    except Exception as e:  # e.g., a crashed worker
+                        result = batch.BatchImportResult(path=data_file)
+                        result.error = "%s: %s" % (type(e).__name__, e)
+                        results.append(result)
+
+        parsed = [result for result in results if result.success]
+        logger.info("parsed %d/%d files in %.1f s" % (len(parsed), len(data_files), time.time() - start_time))
+        for result in results:
+            if not result.success:
+                logger.warning("unable to import %s: %s" % (result.path, result.error))
+
+        profiles = ProfileList()
+        for result in parsed:
+            for profile in result.ssp.l:
+                profiles.append_profile(profile)
+
+        # atlases lookups for all the profiles (grouped by the atlases)
+        if not skip_atlas and (profiles.nr_profiles > 0):
+            self.progress.update(value=80, text="Retrieving atlases")
+            atlas_time = time.time()
+            self._retrieve_atlases(profiles.l)
+            logger.info("retrieved atlases for %d profiles in %.1f s"
+                        % (profiles.nr_profiles, time.time() - atlas_time))
+
+        # store all the profiles in a single transaction
+        if store and (profiles.nr_profiles > 0):
+            self.progress.update(value=90, text="Storing %d profiles" % profiles.nr_profiles)
+            store_time = time.time()
+            db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
+            stored = db.add_casts(profiles)
+            for result in parsed:
+                result.stored = stored
+            logger.info("stored %d profiles in %.1f s: %s"
+                        % (profiles.nr_profiles, time.time() - store_time, stored))
+
+        self.progress.end()
+        return results
 
-            if self.use_woa09() and self.has_woa09() and not skip_atlas:
-                pr.woa09 = self.atlases.woa09.query(lat=pr.meta.latitude, lon=pr.meta.longitude,
-                                                    datestamp=pr.meta.utc_time)
+    def _retrieve_atlases(self, profiles):
+        """Retrieve the atlases data for the passed profiles (with a single query for each atlas)"""
+        points = [(pr.meta.latitude, pr.meta.longitude, pr.meta.utc_time) for pr in profiles]
 
-            if self.use_woa13() and self.has_woa13() and not skip_atlas:
-                pr.woa13 = self.atlases.woa13.query(lat=pr.meta.latitude, lon=pr.meta.longitude,
-                                                    datestamp=pr.meta.utc_time)
+        if self.use_woa09() and self.has_woa09():
+            for pr, atlas_profiles in zip(profiles, self.atlases.woa09.query_many(points)):
+                pr.woa09 = atlas_profiles
 
-            if self.use_rtofs() and not skip_atlas:
-                try:
-                    pr.rtofs = self.atlases.rtofs.query(lat=pr.meta.latitude, lon=pr.meta.longitude,
-                                                        datestamp=pr.meta.utc_time)
-                except RuntimeError:
-                    pr.rtofs = None
-                    logger.warning("unable to retrieve RTOFS data")
+        if self.use_woa13() and self.has_woa13():
+            for pr, atlas_profiles in zip(profiles, self.atlases.woa13.query_many(points)):
+                pr.woa13 = atlas_profiles
+
+        if self.use_rtofs():
+            for pr, atlas_profiles in zip(profiles, self.atlases.rtofs.query_many(points)):
+                pr.rtofs = atlas_profiles
 
     # --- receive data
 
@@ -504,13 +607,10 @@ class SoundSpeedLibrary(object):
 
         self.listen_sis()
 
-        prog_quantum = 50 / len(self.setup.client_list.clients)
-
-        for client in self.setup.client_list.clients:
-            client.request_profile_from_sis(prj=self)
-            self.progress.add(prog_quantum)
+        received = self.setup.client_list.request_profiles_from_sis(prj=self)
+        self.progress.update(50)
 
-        if not self.listeners.sis.ssp:
+        if (len(received) == 0) or not self.listeners.sis.ssp:
             self.progress.end()
             raise RuntimeError("Unable to get SIS cast from any clients")
 
@@ -622,6 +722,7 @@ class SoundSpeedLibrary(object):
         if os.path.exists(new_db_path):
             raise RuntimeError("the project already exists: %s" % new_db_path)
 
+        self.db_pool.release(projects_folder=self.projects_folder, project_name=self.current_project)
         shutil.copy(old_db_path, new_db_path)
         if not os.path.exists(new_db_path):
             raise RuntimeError("unable to copy the project db: %s" % new_db_path)
@@ -640,6 +741,7 @@ class SoundSpeedLibrary(object):
         if not os.path.exists(db_path):
             raise RuntimeError("unable to locate the project to delete: %s" % db_path)
 
+        self.db_pool.release(projects_folder=self.projects_folder, project_name=name)
         os.remove(db_path)
 
     def list_projects(self):
@@ -658,7 +760,7 @@ class SoundSpeedLibrary(object):
         if not self.has_ssp():
             raise RuntimeError("Data not loaded")
 
-        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.current_project)
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
 
         # special case: synthetic multiple profiles, we just save the average profile
         if (self.ssp.l[0].meta.sensor_type == Dicts.sensor_types['Synthetic']) and \
@@ -670,7 +772,6 @@ class SoundSpeedLibrary(object):
 
         else:
             success = db.add_casts(self.ssp)
-        db.disconnect()
 
         # take care of listeners
         if success:
@@ -686,16 +787,94 @@ class SoundSpeedLibrary(object):
         if project is None:
             project = self.current_project
 
-        db = ProjectDb(projects_folder=self.projects_folder, project_name=project)
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=project)
         lst = db.list_profiles()
-        db.disconnect()
         return lst
 
+    def db_list_profiles_page(self, limit=100, cursor=None, **kwargs):
+        """List a page of profiles on the db (see ProjectDb.list_profiles_page for sorting and filtering)"""
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
+        lst, cursor = db.list_profiles_page(limit=limit, cursor=cursor, **kwargs)
+        return lst, cursor
+
+    def db_list_profiles_by_pks(self, pks):
+        """List the profiles on the db with the passed primary keys"""
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
+        lst = db.list_profiles_by_pks(pks)
+        return lst
+
+    def db_list_profiles_in_bbox(self, min_lat, min_lon, max_lat, max_lon):
+        """List the profiles on the db within the passed bounding box"""
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
+        lst = db.list_profiles_in_bbox(min_lat=min_lat, min_lon=min_lon, max_lat=max_lat, max_lon=max_lon)
+        return lst
+
+    def db_list_profiles_in_radius(self, lat, lon, radius):
+        """List the profiles on the db within the passed radius (in meters) from the position, nearest first"""
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
+        lst = db.list_profiles_in_radius(lat=lat, lon=lon, radius=radius)
+        return lst
+
+    def db_list_profiles_in_time_window(self, start, end):
+        """List the profiles on the db with cast time between the passed datetimes"""
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
+        lst = db.list_profiles_in_time_window(start=start, end=end)
+        return lst
+
+    def db_list_nearest_profiles(self, lat, lon, k=1, timestamp=None, time_weight=1.0):
+        """List the k profiles on the db nearest to the passed position (and timestamp), nearest first"""
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
+        lst = db.list_nearest_profiles(lat=lat, lon=lon, k=k, timestamp=timestamp, time_weight=time_weight)
+        return lst
+
+    def db_retrieve_nearest_ref(self, time_weight=1.0):
+        """Set the stored profile nearest to the current one (in space and time) as reference cast"""
+        if not self.has_ssp():
+            logger.warning("missing current profile")
+            return False
+
+        lat = self.cur.meta.latitude
+        lon = self.cur.meta.longitude
+        if (lat is None) or (lon is None):
+            logger.warning("missing location of the current profile")
+            return False
+
+        # the current profile may be already stored, so the second nearest is also retrieved
+        lst = self.db_list_nearest_profiles(lat=lat, lon=lon, k=2, timestamp=self.cur.meta.utc_time,
+                                            time_weight=time_weight)
+        if not lst:
+            logger.warning("no stored profiles")
+            return False
+
+        # the current profile is identified as the db does: by timestamp and stored (rounded) position
+        cur_position = adapt_point(Point(lon, lat))
+        for row in lst:
+            if (row[1] == self.cur.meta.utc_time) and (adapt_point(row[2]) == cur_position):
+                continue  # the current profile
+
+            self.ref = self.db_retrieve_profile(pk=row[0])
+            logger.debug("reference cast: %s" % row[0])
+            return self.ref is not None
+
+        logger.warning("no stored profiles other than the current one")
+        return False
+
+    def db_revision(self):
+        """Retrieve the current revision of the db change feed"""
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
+        ret = db.revision()
+        return ret
+
+    def db_changes_since(self, revision):
+        """Retrieve the current db revision with the pks stored and removed after the passed revision"""
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
+        ret = db.changes_since(revision)
+        return ret
+
     def db_retrieve_profile(self, pk):
         """Retrieve a profile by primary key"""
-        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.current_project)
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
         ssp = db.profile_by_pk(pk=pk)
-        db.disconnect()
         return ssp
 
     def db_import_data_from_db(self, input_db_path):
@@ -704,13 +883,14 @@ class SoundSpeedLibrary(object):
         in_project_name = os.path.splitext(os.path.basename(input_db_path))[0]
         logger.debug('input: folder: %s, db: %s' % (in_projects_folder, in_project_name))
 
-        in_db = ProjectDb(projects_folder=in_projects_folder, project_name=in_project_name)
+        # the db of another user is only read (e.g., no journal mode change on a network share)
+        in_db = ProjectDb(projects_folder=in_projects_folder, project_name=in_project_name, read_only=True)
 
         if in_db.get_db_version() > 1:
             raise RuntimeError("unsupported db version: %s" % in_db.get_db_version())
         logger.debug('input project db version: %s' % in_db.get_db_version())
 
-        cur_db = ProjectDb(projects_folder=self.projects_folder, project_name=self.current_project)
+        cur_db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
 
         in_lst = in_db.list_profiles()
         cur_lst = cur_db.list_profiles()
@@ -751,9 +931,8 @@ class SoundSpeedLibrary(object):
 
     def db_timestamp_list(self):
         """Retrieve a list with the timestamp of all the profiles"""
-        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.current_project)
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
         lst = db.timestamp_list()
-        db.disconnect()
         return lst
 
     def profile_stats(self):
@@ -845,9 +1024,8 @@ class SoundSpeedLibrary(object):
 
     def delete_db_profile(self, pk):
         """Retrieve a profile by primary key"""
-        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.current_project)
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
         ret = db.delete_profile_by_pk(pk=pk)
-        db.disconnect()
         return ret
 
     def dqa_at_surface(self, pk):
@@ -920,63 +1098,57 @@ class SoundSpeedLibrary(object):
     # plotting
 
     def raise_plot_window(self):
-        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.current_project)
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
         _ = db.plot.raise_window()
-        db.disconnect()
 
-    def map_db_profiles(self):
-        """List the profile on the db"""
-        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.current_project)
-        ret = db.plot.map_profiles(output_folder=self.outputs_folder, save_fig=False)
-        db.disconnect()
+    def map_db_profiles(self, bbox=None):
+        """Map the profiles on the db (only those in the (min_lat, min_lon, max_lat, max_lon) bbox, if passed)"""
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
+        ret = db.plot.map_profiles(output_folder=self.outputs_folder, save_fig=False, bbox=bbox)
         return ret
 
-    def save_map_db_profiles(self):
-        """List the profile on the db"""
-        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.current_project)
-        ret = db.plot.map_profiles(output_folder=self.outputs_folder, save_fig=True)
-        db.disconnect()
+    def save_map_db_profiles(self, bbox=None):
+        """Save the map of the profiles on the db (only those in the bbox, if passed)"""
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
+        ret = db.plot.map_profiles(output_folder=self.outputs_folder, save_fig=True, bbox=bbox)
         return ret
 
-    def aggregate_plot(self, dates):
-        """Create an aggregate plot"""
-        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.current_project)
-        success = db.plot.aggregate_plot(dates=dates, output_folder=self.outputs_folder, save_fig=False)
-        db.disconnect()
+    def aggregate_plot(self, dates, bin_size=10.0):
+        """Create an aggregate plot (with the statistics binned by depth, in meters)"""
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
+        success = db.plot.aggregate_plot(dates=dates, output_folder=self.outputs_folder, save_fig=False,
+                                         bin_size=bin_size)
         return success
 
-    def save_aggregate_plot(self, dates):
-        """Create an aggregate plot"""
-        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.current_project)
-        success = db.plot.aggregate_plot(dates=dates, output_folder=self.outputs_folder, save_fig=True)
-        db.disconnect()
+    def save_aggregate_plot(self, dates, bin_size=10.0):
+        """Create an aggregate plot (with the statistics binned by depth, in meters)"""
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
+        success = db.plot.aggregate_plot(dates=dates, output_folder=self.outputs_folder, save_fig=True,
+                                         bin_size=bin_size)
         return success
 
     def plot_daily_db_profiles(self):
         """Plot the profile on the db by day"""
-        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.current_project)
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
         success = db.plot.daily_plots(project_name=self.current_project,
                                       output_folder=self.outputs_folder, save_fig=False)
-        db.disconnect()
         return success
 
     def save_daily_db_profiles(self):
         """Save figure with the profile on the db by day"""
-        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.current_project)
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
         success = db.plot.daily_plots(project_name=self.current_project,
                                       output_folder=self.outputs_folder, save_fig=True)
-        db.disconnect()
         return success
 
     # exporting
 
     def export_db_profiles_metadata(self, ogr_format=GdalAux.ogr_formats['ESRI Shapefile']):
         """Export the db profile metadata"""
-        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.current_project)
+        db = self.db_pool.get(projects_folder=self.projects_folder, project_name=self.current_project)
         lst = db.export.export_profiles_metadata(project_name=self.current_project,
                                                  output_folder=self.outputs_folder,
                                                  ogr_format=ogr_format)
-        db.disconnect()
         return lst
 
     # --- replace
@@ -1156,7 +1328,8 @@ class SoundSpeedLibrary(object):
 
         self.cur.clone_proc_to_sis()
 
-        if not self.cur.thin(tolerance=0.1):
+        # SIS accepts up to 1000 samples and 30kB: room is left for the 0 and 12000 m samples and the header
+        if not self.cur.thin(tolerance=0.1, max_points=998, max_size=29000):
             logger.warning("thinning issue")
             return False
 
@@ -1300,6 +1473,9 @@ class SoundSpeedLibrary(object):
     def download_woa13(self):
         return self.atlases.woa13.download_db()
 
+    def build_woa13_cache(self):
+        return self.atlases.woa13.build_cache()
+
     # --- listeners
 
     def use_sis(self):
@@ -1364,8 +1540,7 @@ class SoundSpeedLibrary(object):
         if not self.server.is_alive():
             raise RuntimeError("Server is not alive")
 
-        self.server.force_send.set()
-        self.server.check()
+        self.server.force()
 
         return self.server.is_alive()
 
@@ -92,6 +92,31 @@ def parse_data(txt_lines, dtype, expr, ftype=''):
     return numpy.array(data, dtype=dtype)
 
 
+def parseColumns(txt_lines, dtype, sep=r'\s+', pre=r'^\s*', post=r'\s*$', ftype=''):
+    '''fast path of parseNumbers for tables with a known column layout (e.g., the CNV body after *END*)
+    All the lines are parsed in one pass straight into a float array, then viewed with the passed dtype
+    (all the fields must have the same type) -- sep, pre and post are only used by the regex path, that's why
+    the fast path is limited to whitespace separated values.
+    If any line does not hold exactly one finite number per column, the validating regex path is used instead.
+    '''
+    if isinstance(dtype, (list, tuple)):
+        try:
+            dtype = numpy.dtype(dtype)
+        except TypeError:
+            dtype = numpy.dtype([(str(n), t) for n, t in dtype])  # numpy in 2.7 doesn't like unicode names
+    field_types = set([dtype.fields[n][0] for n in dtype.names])
+    if len(field_types) == 1:
+        field_type = field_types.pop()
+        try:
+            table = numpy.loadtxt(txt_lines, dtype=field_type, comments=None, ndmin=2)
+        except (ValueError, IndexError):
+            table = None
+        if (table is not None) and (table.shape[0] > 0) and (table.shape[1] == len(dtype.names)) \
+                and numpy.isfinite(table).all():
+            return numpy.ascontiguousarray(table).view(dtype)[:, 0]
+    return parseNumbers(txt_lines, dtype, sep, pre=pre, post=post, ftype=ftype)
+
+
 def getMetaFromTimeRE(m):
     '''Pass in a re.match object that has groups named yr, mon, day, hour, minute and this convienence function
     will create a metadata dictionary with the Year, Day, Time formated appropriately.
@@ -187,7 +212,7 @@ class Profile(numpy.recarray):
     def __new__(cls, data, **kwargs):  # data (NxM list or array), names=('depth', 'temperature', 'soundspeed'), ymetric='depth', attribute='soundspeed', metadata={}):
         '''data should be one NxM list or array (N>=2).
         Using numpy.fromarrays -- so data that is in list form should be list of arrays [[d1,d2,d3...], [ss1,ss2,ss3...]] instead of [(d1, ss1), (d2, ss2), (d3, ss3)...] like zip would produce
-        If a structured array is supplied then the names are preserved.  Otherwise an optional names list is used.
+        If a structured array is supplied then the names are preserved and the data are not copied.  Otherwise an optional names list is used.
         names argument should be supplied describing the columns of the array.
         ymetric should be depth|pressure,
         attribute should be soundspeed|salinity|conductivity|temperature|time
@@ -203,7 +228,7 @@ class Profile(numpy.recarray):
         # names when taking a numpy.array for the first arg
         # Convert to a python list if it's a numpy array
         if isinstance(data, numpy.ndarray) and data.dtype.names:
-            r = numpy.rec.fromarrays([data[n] for n in data.dtype.names], dtype=data.dtype)
+            r = data.view(numpy.recarray)  # no need of a copy, mcopy() is there for that
         else:
             r = numpy.rec.fromarrays(data, names=kwargs.get('names', ()))  # defaults to numpy f#   -- ex: dtype=[('f0', '<f8'), ('f1', '<f8')])
 
@@ -389,32 +414,11 @@ class Profile(numpy.recarray):
         p.meta.temperature_uom = 'deg C'
         p.meta.conductivity_uom = str()
         p.meta.salinity_uom = 'PSU'
-        # convert profile data
+        # convert profile data (only the used columns are copied, in contiguous arrays)
         p.init_data(len(self))
-        try:
-            p.data.pressure = self['pressure']
-        except ValueError:  # no matching data column
-            pass
-        try:
-            p.data.depth = self['depth']
-        except ValueError:  # no matching data column
-            pass
-        try:
-            p.data.speed = self['soundspeed']
-        except ValueError:  # no matching data column
-            pass
-        try:
-            p.data.temp = self['temperature']
-        except ValueError:  # no matching data column
-            pass
-        try:
-            p.data.sal = self['salinity']
-        except ValueError:  # no matching data column
-            pass
-        try:
-            p.data.conductivity = self['conductivity']
-        except ValueError:  # no matching data column
-            pass
+        for name, attr in (('pressure', 'pressure'), ('depth', 'depth'), ('soundspeed', 'speed'),
+                           ('temperature', 'temp'), ('salinity', 'sal'), ('conductivity', 'conductivity')):
+            if name in self.dtype.names:
+                setattr(p.data, attr, numpy.ascontiguousarray(self[name]))
         # return the finised profile
         return p
-
@@ -1,4 +1,5 @@
 import logging
+import multiprocessing
 
 
 class SisParseFilter(logging.Filter):
@@ -23,6 +24,8 @@ ch.addFilter(SisParseFilter())
 logger.addHandler(ch)
 
 
-from hydroffice.soundspeedmanager import gui
+if __name__ == '__main__':
+    multiprocessing.freeze_support()  # the batch import may use a process pool
 
-gui.gui()
+    from hydroffice.soundspeedmanager import gui
+    gui.gui()
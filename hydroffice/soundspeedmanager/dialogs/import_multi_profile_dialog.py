@@ -93,24 +93,25 @@ class ImportMultiProfileDialog(AbstractDialog):
 
         nr_profiles = len(selections)
         logger.debug('user selections: %s' % nr_profiles)
-        quantum = 100 / (nr_profiles * 2 + 1)
-        self.progress.start()
 
-        for i, selection in enumerate(selections):
+        results = self.lib.import_data_batch(paths=selections, data_format=name, skip_atlas=True,
+                                             callbacks=self.lib.cb)
 
-            try:
-                self.progress.add(quantum=quantum, text="profile %s/%s" % (i, nr_profiles))
-                self.lib.import_data(data_path=selection, data_format=name, skip_atlas=True)
-
-                self.progress.add(quantum=quantum)
-                self.lib.store_data()
+        failures = [result for result in results if not result.success]
+        if len(failures) > 0:
+            msg = "Issue in importing %d of %d files:\n" % (len(failures), nr_profiles)
+            for result in failures[:10]:
+                msg += "\n> %s: %s" % (os.path.basename(result.path), result.error)
+            if len(failures) > 10:
+                msg += "\n> ..."
+            # noinspection PyCallByClass
+            QtGui.QMessageBox.critical(self, "Import error", msg, QtGui.QMessageBox.Ok)
+            return
 
-            except RuntimeError as e:
-                self.progress.end()
-                msg = "Issue in importing the file #%s: %s\n\n> %s" % (i, selection, e)
-                # noinspection PyCallByClass
-                QtGui.QMessageBox.critical(self, "Import error", msg, QtGui.QMessageBox.Ok)
-                return
+        if not all([result.stored for result in results]):
+            # noinspection PyCallByClass
+            QtGui.QMessageBox.critical(self, "Import error", "Unable to store the imported profiles",
+                                       QtGui.QMessageBox.Ok)
+            return
 
-        self.progress.end()
         self.accept()
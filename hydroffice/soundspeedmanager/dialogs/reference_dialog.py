@@ -36,6 +36,22 @@ class ReferenceDialog(AbstractDialog):
         btn.clicked.connect(self.on_set_ref)
         self.setLayout.addWidget(btn)
 
+        # set the nearest stored cast as reference
+        self.nearestLayout = QtGui.QHBoxLayout()
+        self.mainLayout.addLayout(self.nearestLayout)
+        # - label
+        label = QtGui.QLabel("Set nearest stored cast as reference cast")
+        self.nearestLayout.addWidget(label)
+        # - button
+        btn = QtGui.QPushButton("Apply")
+        btn.setToolTip("Apply!")
+        btn.setFixedWidth(60)
+        if not self.lib.has_ssp():
+            btn.setDisabled(True)
+        # noinspection PyUnresolvedReferences
+        btn.clicked.connect(self.on_set_nearest_ref)
+        self.nearestLayout.addWidget(btn)
+
         # load reference
         self.loadLayout = QtGui.QHBoxLayout()
         self.mainLayout.addLayout(self.loadLayout)
@@ -77,6 +93,17 @@ class ReferenceDialog(AbstractDialog):
 
         self.accept()
 
+    def on_set_nearest_ref(self):
+        if self.lib.has_ssp():
+            logger.debug('retrieving the nearest stored cast')
+            if not self.lib.db_retrieve_nearest_ref():
+                # noinspection PyCallByClass
+                QtGui.QMessageBox.warning(self, "Reference cast", "Unable to find a stored cast nearby",
+                                          QtGui.QMessageBox.Ok)
+                return
+
+        self.accept()
+
     def on_reload_ref(self):
         if self.lib.has_ref():
             logger.debug('reload current reference cast')
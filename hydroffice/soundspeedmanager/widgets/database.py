@@ -55,7 +55,9 @@ class Database(AbstractWidget):
         vbox.addWidget(label)
         vbox.addStretch()
 
-        # -- list
+        # -- list (with the project and the change feed revision that it shows)
+        self.table_project = None
+        self.table_revision = None
         self.ssp_list = QtGui.QTableWidget()
         self.ssp_list.setSortingEnabled(True)
         self.ssp_list.setFocus()
@@ -582,9 +584,13 @@ class Database(AbstractWidget):
         # set the top label
         self.active_label.setText("<b>Current project: %s</b>" % self.lib.current_project)
 
+        # the revision is retrieved first, so that later changes are not missed by the patches
+        self.table_project = self.lib.current_project
+        self.table_revision = self.lib.db_revision()
         lst = self.lib.db_list_profiles()
 
         # prepare the table
+        self.ssp_list.setSortingEnabled(False)
         self.ssp_list.clear()
         self.ssp_list.setColumnCount(19)
         self.ssp_list.setHorizontalHeaderLabels(['id', 'time', 'location',
@@ -600,48 +606,90 @@ class Database(AbstractWidget):
         self.ssp_list.setRowCount(len(lst))
 
         for i, ssp in enumerate(lst):
+            self._set_table_row(i, ssp)
 
-            processed = True
-            tokens = ssp[11].split(";")
-            if Dicts.proc_user_infos['PLOTTED'] not in tokens:
-                processed = False
+        self.ssp_list.setSortingEnabled(True)
+        self.ssp_list.resizeColumnsToContents()
 
-            for j, field in enumerate(ssp):
+    def patch_table(self):
+        """Update only the rows of the profiles stored or removed since the last table update"""
+        if (self.table_revision is None) or (self.table_project != self.lib.current_project):
+            self.update_table()
+            return
 
-                if j == 3:
-                    label = '%s' % Dicts.first_match(Dicts.sensor_types, int(field))
-                    # logger.debug('%s' % Dicts.first_match(Dicts.sensor_types, int(field)))
+        revision, stored, removed = self.lib.db_changes_since(self.table_revision)
+        if revision is None:
+            self.update_table()
+            return
+        self.table_revision = revision
+        if (len(stored) == 0) and (len(removed) == 0):
+            return
 
-                elif j == 4:
-                    label = '%s' % Dicts.first_match(Dicts.probe_types, int(field))
-                    # logger.debug('%s' % Dicts.first_match(Dicts.probe_types, int(field)))
+        rows = dict()
+        for i in range(self.ssp_list.rowCount()):
+            rows[int(self.ssp_list.item(i, 0).text())] = i
 
-                else:
-                    label = field
+        self.ssp_list.setSortingEnabled(False)
 
-                item = QtGui.QTableWidgetItem("%s" % label)
+        # remove from the bottom, so that the row indices stay valid
+        for i in sorted([rows[pk] for pk in removed if pk in rows], reverse=True):
+            self.ssp_list.removeRow(i)
+        if len(removed) > 0:
+            rows = dict()
+            for i in range(self.ssp_list.rowCount()):
+                rows[int(self.ssp_list.item(i, 0).text())] = i
 
-                if (j == 3) and (int(field) == Dicts.sensor_types['Future']):
-                    item.setForeground(QtGui.QColor(200, 100, 100))
+        for ssp in self.lib.db_list_profiles_by_pks(stored):
+            i = rows.get(ssp[0])
+            if i is None:
+                i = self.ssp_list.rowCount()
+                self.ssp_list.insertRow(i)
+            self._set_table_row(i, ssp)
 
-                elif (j == 4) and (int(field) == Dicts.sensor_types['Future']):
-                    item.setForeground(QtGui.QColor(200, 100, 100))
+        self.ssp_list.setSortingEnabled(True)
+        self.ssp_list.resizeColumnsToContents()
 
-                if not processed:
-                    item.setBackground(QtGui.QColor(200, 100, 100, 50))
+    def _set_table_row(self, i, ssp):
 
-                item.setTextAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignHCenter)
-                item.setFlags(QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled)
+        processed = True
+        tokens = ssp[11].split(";")
+        if Dicts.proc_user_infos['PLOTTED'] not in tokens:
+            processed = False
 
-                self.ssp_list.setItem(i, j, item)
+        for j, field in enumerate(ssp):
 
-        self.ssp_list.resizeColumnsToContents()
+            if j == 3:
+                label = '%s' % Dicts.first_match(Dicts.sensor_types, int(field))
+                # logger.debug('%s' % Dicts.first_match(Dicts.sensor_types, int(field)))
+
+            elif j == 4:
+                label = '%s' % Dicts.first_match(Dicts.probe_types, int(field))
+                # logger.debug('%s' % Dicts.first_match(Dicts.probe_types, int(field)))
+
+            else:
+                label = field
+
+            item = QtGui.QTableWidgetItem("%s" % label)
+
+            if (j == 3) and (int(field) == Dicts.sensor_types['Future']):
+                item.setForeground(QtGui.QColor(200, 100, 100))
+
+            elif (j == 4) and (int(field) == Dicts.sensor_types['Future']):
+                item.setForeground(QtGui.QColor(200, 100, 100))
+
+            if not processed:
+                item.setBackground(QtGui.QColor(200, 100, 100, 50))
+
+            item.setTextAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignHCenter)
+            item.setFlags(QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled)
+
+            self.ssp_list.setItem(i, j, item)
 
     def data_stored(self):
-        self.update_table()
+        self.patch_table()
 
     def data_removed(self):
-        self.update_table()
+        self.patch_table()
 
     def server_started(self):
         self.setDisabled(True)
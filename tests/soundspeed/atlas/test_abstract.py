@@ -0,0 +1,65 @@
+import unittest
+from datetime import datetime, date
+import numpy as np
+
+from hydroffice.soundspeed.atlas.abstract import AbstractAtlas, AbstractWoa
+
+
+class _EchoAtlas(AbstractAtlas):
+
+    def is_present(self):
+        return True
+
+    def query(self, lat, lon, datestamp=None, server_mode=False):
+        return lat, lon, self._query_date(datestamp)
+
+    def download_db(self):
+        return True
+
+
+class TestSoundSpeedAtlasAbstract(unittest.TestCase):
+
+    def test_query_many(self):
+        atlas = _EchoAtlas(data_folder=None, prj=None)
+        points = [(43.0, -70.0, datetime(2017, 3, 1, 10)), (44.0, -71.0, date(2017, 4, 2))]
+        self.assertEqual(atlas.query_many(points),
+                         [(43.0, -70.0, date(2017, 3, 1)), (44.0, -71.0, date(2017, 4, 2))])
+
+    def test_query_date(self):
+        with self.assertRaises(RuntimeError):
+            AbstractAtlas._query_date("20170301")
+
+
+class TestSoundSpeedAtlasAbstractWoa(unittest.TestCase):
+
+    def test_index_runs(self):
+        self.assertEqual(AbstractWoa._index_runs(np.array([3, 4, 5, 6, 7])), [slice(3, 8)])
+        self.assertEqual(AbstractWoa._index_runs(np.array([1438, 1439, 0, 1, 2])), [slice(1438, 1440), slice(0, 3)])
+
+    def test_closest_values(self):
+        dists = np.array([30.0, 10.0, 20.0])
+        t = np.array([[10.0, 0.5, 12.0],
+                      [20.0, np.nan, 22.0],
+                      [np.nan, np.nan, np.nan]], dtype=np.float32)
+        s = np.full((3, 3), 35.0, dtype=np.float32)
+        t_sd = np.full((3, 3), 3.0, dtype=np.float32)
+        s_sd = np.full((3, 3), 1.0, dtype=np.float32)
+
+        t_out, s_out, t_min, s_min, t_max, s_max, valid, valid_sd = \
+            AbstractWoa._closest_values(dists, t, s, t_sd, s_sd)
+
+        np.testing.assert_array_equal(t_out, [0.5, 22.0, 0.0])
+        np.testing.assert_array_equal(valid, [True, True, False])
+        np.testing.assert_array_equal(valid_sd, [True, True, True])
+        # the closest node for the standard deviation has no mean value at the second level
+        np.testing.assert_array_equal(t_min, [-2.0, np.nan, np.nan])
+        np.testing.assert_array_equal(t_max, [3.5, np.nan, np.nan])
+        np.testing.assert_array_equal(s_min, [34.0, 34.0, 34.0])
+        np.testing.assert_array_equal(s_max, [36.0, 36.0, 36.0])
+
+
+def suite():
+    s = unittest.TestSuite()
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedAtlasAbstract))
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedAtlasAbstractWoa))
+    return s
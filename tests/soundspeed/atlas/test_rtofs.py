@@ -1,8 +1,15 @@
 import unittest
 import os
 import shutil
+import tempfile
+from datetime import date, datetime, timedelta
 
+from netCDF4 import Dataset
+import numpy as np
+
+from hydroffice.soundspeed.atlas.rtofs.cache import RtofsCache
 from hydroffice.soundspeed.atlas.rtofs.rtofs import Rtofs
+from hydroffice.soundspeed.base.progress.cli_progress import CliProgress
 from hydroffice.soundspeed.soundspeed import SoundSpeedLibrary
 
 
@@ -34,7 +41,144 @@ class TestSoundSpeedAtlasRtofs(unittest.TestCase):
         prj.close()
 
 
+class CountingProgress(CliProgress):
+    """Keep track of the progress bars still open"""
+
+    def __init__(self):
+        super(CountingProgress, self).__init__()
+        self.nr_open = 0
+
+    def start(self, *args, **kwargs):
+        self.nr_open += 1
+        super(CountingProgress, self).start(*args, **kwargs)
+
+    def end(self):
+        self.nr_open -= 1
+        super(CountingProgress, self).end()
+
+
+class TestSoundSpeedAtlasRtofsOffline(unittest.TestCase):
+    """Queries on a small synthetic data set in a pre-seeded source folder"""
+
+    day = date(2016, 5, 3)
+
+    def setUp(self):
+        self.cur_dir = os.path.abspath(os.path.dirname(__file__))
+        self.source_folder = tempfile.mkdtemp()
+        self.data_folder = tempfile.mkdtemp()
+        self._write_source(self.day)
+        self.prj = SoundSpeedLibrary(data_folder=self.cur_dir, progress=CountingProgress())
+        self.rtofs = Rtofs(data_folder=self.data_folder, prj=self.prj)
+        self.rtofs.source_folder = self.source_folder
+
+    def tearDown(self):
+        self.rtofs.clear_data()
+        self.prj.close()
+        shutil.rmtree(self.source_folder, ignore_errors=True)
+        shutil.rmtree(self.data_folder, ignore_errors=True)
+        for item in os.listdir(self.cur_dir):
+            if item.split('.')[-1] == 'db':
+                os.remove(os.path.join(self.cur_dir, item))
+
+    def _write_source(self, day):
+        """A 10x20 nodes grid, with land (NaN) in the eastern part"""
+        folder = os.path.join(self.source_folder, 'rtofs_global%s' % day.strftime("%Y%m%d"))
+        os.makedirs(folder)
+        for name, var_name, value in (('temp', 'temperature', 10.0), ('salt', 'salinity', 35.0)):
+            with Dataset(os.path.join(folder, 'rtofs_glo_3dz_nowcast_daily_%s.nc' % name), 'w') as ds:
+                ds.createDimension('time', 3)
+                ds.createDimension('lev', 4)
+                ds.createDimension('lat', 10)
+                ds.createDimension('lon', 20)
+                ds.createVariable('lev', 'f4', ('lev', ))[:] = [0., 10., 50., 100.]
+                ds.createVariable('lat', 'f4', ('lat', ))[:] = 40. + 0.5 * np.arange(10)
+                ds.createVariable('lon', 'f4', ('lon', ))[:] = 280. + 0.5 * np.arange(20)
+                values = np.full((3, 4, 10, 20), value, dtype=np.float32)
+                values[:, :, :, 12:] = np.nan
+                ds.createVariable(var_name, 'f4', ('time', 'lev', 'lat', 'lon'))[:] = values
+
+    def test_query(self):
+        profiles = self.rtofs.query(42.0, -78.0, datestamp=datetime(2016, 5, 3, 12))
+        self.assertEqual(profiles.nr_profiles, 1)
+        self.assertEqual(profiles.cur.data.num_samples, 4)
+        self.assertAlmostEqual(profiles.cur.meta.latitude, 42.0, places=3)
+        self.assertAlmostEqual(profiles.cur.meta.longitude, -78.0, places=3)
+        self.assertEqual(profiles.cur.meta.original_path, "RTOFS_20160503")
+        self.assertEqual(self.prj.progress.nr_open, 0)
+        # the retrieved tiles are in the local cache
+        self.assertTrue(self.rtofs.cache.has_day(self.day))
+
+    def test_query_on_land(self):
+        self.assertIsNone(self.rtofs.query(42.0, -71.5, datestamp=datetime(2016, 5, 3, 12)))
+        self.assertEqual(self.prj.progress.nr_open, 0)
+
+    def test_query_with_failing_tile(self):
+        self.assertIsNotNone(self.rtofs.query(42.0, -78.0, datestamp=datetime(2016, 5, 3, 12)))
+        # forget the retrieved tiles, and make the source unreachable
+        self.rtofs._tiles = dict()
+        self.rtofs._close_source()
+        shutil.rmtree(self.rtofs.cache.day_folder(self.day))
+        shutil.rmtree(self.source_folder)
+        with self.assertRaises(RuntimeError):
+            self.rtofs.query(42.0, -78.0, datestamp=datetime(2016, 5, 3, 12))
+        self.assertEqual(self.prj.progress.nr_open, 0)
+
+    def test_query_many(self):
+        points = [(42.0, -78.0, datetime(2016, 5, 3, 12)),
+                  (42.0, -71.5, datetime(2016, 5, 3, 13)),  # on land
+                  (41.5, -77.5, datetime(2016, 5, 3, 14)),
+                  (42.0, -78.0, datetime(2016, 1, 1))]  # no data set for this day
+        profiles = self.rtofs.query_many(points, server_mode=True)
+        self.assertEqual(len(profiles), 4)
+        self.assertEqual(profiles[0].cur.data.num_samples, 4)
+        self.assertAlmostEqual(profiles[0].cur.data.sal[0], 35.0, places=3)
+        self.assertIsNone(profiles[1])
+        self.assertIsNotNone(profiles[2])  # the day is not aborted by the previous point
+        self.assertIsNone(profiles[3])
+
+
+class TestSoundSpeedAtlasRtofsCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cur_dir = os.path.abspath(os.path.dirname(__file__))
+        self.cache_dir = os.path.join(self.cur_dir, 'atlases', 'rtofs_cache')
+
+    def tearDown(self):
+        shutil.rmtree(os.path.join(self.cur_dir, 'atlases'), ignore_errors=True)
+
+    def test_grid_and_tiles(self):
+        cache = RtofsCache(folder=self.cache_dir)
+        day = date(2016, 5, 3)
+        self.assertFalse(cache.has_day(day))
+        cache.save_grid(day, d=np.arange(3.), lat=np.arange(4.), lon=np.arange(5.), day_idx=2)
+        self.assertTrue(cache.has_day(day))
+        d, lat, lon, day_idx = cache.load_grid(day)
+        self.assertEqual(d.tolist(), [0., 1., 2.])
+        self.assertEqual(lon.size, 5)
+        self.assertEqual(day_idx, 2)
+
+        self.assertIsNone(cache.load_tile(day, (0, 1)))
+        t = np.ma.masked_array(np.ones((3, 2, 2), dtype=np.float32), mask=[[[True, False], [False, False]]] * 3)
+        cache.save_tile(day, (0, 1), t=np.ma.filled(t, np.nan), s=np.zeros((3, 2, 2), dtype=np.float32))
+        t, s = cache.load_tile(day, (0, 1))
+        self.assertTrue(np.isnan(t[0, 0, 0]))
+        self.assertEqual(t.dtype, np.float32)
+        self.assertEqual(s.sum(), 0.)
+
+    def test_evict(self):
+        cache = RtofsCache(folder=self.cache_dir, max_days=2)
+        day = date(2016, 5, 3)
+        for i in range(4):
+            cache.save_grid(day + timedelta(days=i), d=np.arange(3.), lat=np.arange(4.), lon=np.arange(5.), day_idx=2)
+            # the eviction is based on the modification time
+            os.utime(cache.day_folder(day + timedelta(days=i)), (i, i))
+        cache.evict()
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ['20160505', '20160506'])
+
+
 def suite():
     s = unittest.TestSuite()
     s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedAtlasRtofs))
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedAtlasRtofsOffline))
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedAtlasRtofsCache))
     return s
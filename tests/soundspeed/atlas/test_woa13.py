@@ -0,0 +1,28 @@
+import unittest
+import numpy as np
+
+from hydroffice.soundspeed.atlas.woa13.woa13 import Woa13
+
+
+class TestSoundSpeedAtlasWoa13(unittest.TestCase):
+
+    def test_read_cache_window(self):
+        # a (lat, lon, depth) grid, as stored in the cache
+        grid = np.arange(4 * 6 * 3, dtype=np.float32).reshape((4, 6, 3))
+        lat_idxs = np.array([3, 0])
+        lon_idxs = np.array([5, 0, 1])
+
+        window = Woa13._read_cache_window(grid, lat_idxs, lon_idxs)
+
+        self.assertEqual(window.shape, (3, 2, 3))
+        np.testing.assert_array_equal(window[:, 0, 0], grid[3, 5, :])
+        np.testing.assert_array_equal(window[:, 1, 2], grid[0, 1, :])
+        # the window is a copy that can be safely modified
+        window[0] = 0
+        self.assertEqual(grid[3, 5, 0], 3 * 18 + 5 * 3)
+
+
+def suite():
+    s = unittest.TestSuite()
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedAtlasWoa13))
+    return s
@@ -2,6 +2,7 @@ import unittest
 import os
 
 from hydroffice.soundspeed.base.setup import Setup
+from hydroffice.soundspeed.client.client import Client
 
 
 class TestSoundSpeedSetup(unittest.TestCase):
@@ -20,6 +21,14 @@ class TestSoundSpeedSetup(unittest.TestCase):
         db = settings.db
         self.assertEqual(db.db_path, self.db_path)
 
+    def test_reload_closes_client_list(self):
+        settings = Setup(self.data_folder)
+        client_list = settings.client_list
+        client_list._sock_out = Client.make_socket()
+        settings.load_from_db()
+        self.assertIsNot(settings.client_list, client_list)
+        self.assertIsNone(client_list._sock_out)
+
 
 def suite():
     s = unittest.TestSuite()
@@ -0,0 +1,95 @@
+import time
+import unittest
+from threading import Timer
+from datetime import datetime
+import numpy as np
+
+from hydroffice.soundspeed.client.clientlist import ClientList
+from hydroffice.soundspeed.listener.sis.sis import Sis
+from hydroffice.soundspeed.base.progress.cli_progress import CliProgress
+
+
+class _Svp(object):
+    def __init__(self, speed):
+        self.depth = np.array([0.0, 100.0])
+        self.speed = np.array([speed, speed])
+        self.acquisition_time = datetime(2017, 3, 1, 10)
+
+
+class _Prj(object):
+
+    class _Setup(object):
+        rx_max_wait_time = 3
+        sis_auto_apply_manual_casts = True
+        sis_listen_port = 16103
+
+    class _Listeners(object):
+        def __init__(self):
+            self.sis = Sis(port=0, datagrams=[])
+
+    class _Cur(object):
+        class _Sis(object):
+            depth = np.array([0.0, 50.0])
+            speed = np.array([1500.0, 1500.0])
+        sis = _Sis()
+        sis_thinned = np.array([True, True])
+
+    def __init__(self):
+        self.setup = self._Setup()
+        self.listeners = self._Listeners()
+        self.progress = CliProgress()
+        self.cur = self._Cur()
+
+
+class TestSoundSpeedClientList(unittest.TestCase):
+
+    def setUp(self):
+        self.prj = _Prj()
+        self.sis = self.prj.listeners.sis
+        self.clients = ClientList()
+        for client in ["a:10.0.0.1:4001:SIS", "b:10.0.0.2:4001:SIS", "c:10.0.0.3:4001:SIS", "d:10.0.0.4:4001:HYPACK"]:
+            self.clients.add_client(client)
+
+    def _echo(self, ip, speed, delay):
+        def receive():
+            with self.sis.ssp_condition:
+                self.sis.ssp_by_ip[ip] = _Svp(speed)
+                self.sis.ssp_condition.notify_all()
+        timer = Timer(delay, receive)
+        timer.start()
+        return timer
+
+    def test_transmit_ssp(self):
+        for client in self.clients.clients:
+            client.send_cast = lambda prj, server_mode, **kwargs: True
+        self.clients.clients[2].send_cast = lambda prj, server_mode, **kwargs: False
+
+        timers = [self._echo("10.0.0.1", 1500.0, 0.5), self._echo("10.0.0.2", 1510.0, 0.5)]
+        start = time.time()
+        self.assertFalse(self.clients.transmit_ssp(prj=self.prj, server_mode=True))
+        self.assertLess(time.time() - start, 2.5)
+        for timer in timers:
+            timer.join()
+
+        self.assertEqual([outcome for _, outcome in self.clients.last_tx_report],
+                         [ClientList.tx_confirmed, ClientList.tx_not_matching, ClientList.tx_failed,
+                          ClientList.tx_not_verifiable])
+        self.assertEqual(self.clients.last_tx_time, datetime(2017, 3, 1, 10))
+
+    def test_request_profiles_from_sis(self):
+        requested = list()
+        self.sis.request_iur = lambda ip, port: requested.append(ip)
+
+        timers = [self._echo(ip, 1500.0, 0.3) for ip in ["10.0.0.1", "10.0.0.2", "10.0.0.3"]]
+        received = self.clients.request_profiles_from_sis(prj=self.prj)
+        for timer in timers:
+            timer.join()
+
+        self.assertEqual(sorted(requested), ["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+        self.assertEqual(sorted(received.keys()), ["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+
+
+def suite():
+    s = unittest.TestSuite()
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedClientList))
+    return s
@@ -0,0 +1,60 @@
+import unittest
+from datetime import datetime
+import numpy as np
+
+from hydroffice.soundspeed.client.payloads import Payloads
+from hydroffice.soundspeed.profile.dicts import Dicts
+from hydroffice.soundspeed.profile.profilelist import ProfileList
+
+
+class _Prj(object):
+
+    def __init__(self):
+        self.ssp = ProfileList()
+        self.ssp.append()
+        self.cur.meta.utc_time = datetime(2017, 3, 1, 10)
+        self.cur.meta.latitude = 43.0
+        self.cur.meta.longitude = -70.0
+        self.cur.init_proc(50)
+        self.cur.proc.depth[:] = np.arange(50) * 10.0
+        self.cur.proc.speed[:] = 1500.0 + np.sin(np.arange(50))
+        self.cur.init_sis()
+        self.num_prepared = 0
+
+    @property
+    def cur(self):
+        return self.ssp.cur
+
+    def prepare_sis(self):
+        self.num_prepared += 1
+        self.cur.clone_proc_to_sis()
+        return self.cur.thin(tolerance=0.1)
+
+
+class TestSoundSpeedClientPayloads(unittest.TestCase):
+
+    def test_get(self):
+        prj = _Prj()
+        payloads = Payloads()
+
+        s01 = payloads.get(prj=prj, fmt=Dicts.kng_formats['S01'])
+        self.assertTrue(s01.startswith(b'$MVS01'))
+        self.assertIs(payloads.get(prj=prj, fmt=Dicts.kng_formats['S01']), s01)
+        s12 = payloads.get(prj=prj, fmt=Dicts.kng_formats['S12'])
+        self.assertTrue(s12.startswith(b'$MVS12'))
+        self.assertTrue(payloads.get(prj=prj, fmt=Payloads.calc_format).startswith(b'CALC'))
+        self.assertEqual(prj.num_prepared, 1)
+
+        # an edit of the profile invalidates the payloads
+        prj.cur.proc.speed[10] += 5.0
+        self.assertNotEqual(payloads.get(prj=prj, fmt=Dicts.kng_formats['S01']), s01)
+        self.assertEqual(prj.num_prepared, 2)
+        prj.cur.meta.latitude = 44.0
+        payloads.get(prj=prj, fmt=Dicts.kng_formats['S01'])
+        self.assertEqual(prj.num_prepared, 3)
+
+
+def suite():
+    s = unittest.TestSuite()
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedClientPayloads))
+    return s
@@ -4,9 +4,13 @@ import unittest
 from datetime import datetime
 import time
 import random
+import threading
 import numpy as np
 
 from hydroffice.soundspeed.soundspeed import SoundSpeedLibrary
+from hydroffice.soundspeed.db.db import ProjectDb
+from hydroffice.soundspeed.db.plot import PlotDb
+from hydroffice.soundspeed.db.pool import DbPool
 from hydroffice.soundspeed.profile.profilelist import ProfileList
 
 
@@ -60,8 +64,237 @@ class TestSoundSpeedDb(unittest.TestCase):
             pk = i % self.max_pk + 1
             test_pk(pk)
 
+    def test_retrieve_nearest_ref(self):
+        # the current cast is stored with a position more precise than the one kept in the db
+        self.lib.ssp.cur.meta.latitude = 22.123456789
+        self.lib.ssp.cur.meta.longitude = -75.000000123
+        self.lib.ssp.cur.meta.utc_time = datetime.now()
+        self.lib.restart_proc()
+        self.assertTrue(self.lib.store_data())
+        cur_pk = self.lib.db_list_nearest_profiles(lat=22.123456789, lon=-75.000000123, k=1)[0][0]
+        self.assertEqual(cur_pk, self.max_pk + 1)
+
+        self.assertTrue(self.lib.db_retrieve_nearest_ref())
+        self.assertEqual(self.lib.ref.cur.meta.latitude, 22.0)
+        self.assertEqual(self.lib.ref.cur.meta.longitude, -75.0)
+
+
+class TestSoundSpeedProjectDb(unittest.TestCase):
+    def setUp(self):
+        self.projects_folder = os.path.abspath(os.path.dirname(__file__))
+        self.project_name = 'unittest_bulk'
+        self.db_path = os.path.join(self.projects_folder, '%s.db' % self.project_name)
+        self.tearDown()
+
+        self.ssp = ProfileList()
+        self.ssp.append()
+        self.ssp.cur.meta.latitude = 43.0
+        self.ssp.cur.meta.longitude = -70.0
+        self.ssp.cur.meta.utc_time = datetime(2016, 1, 1)
+        self.ssp.cur.init_data(100)
+        self.ssp.cur.data.depth[:] = np.arange(100)
+        self.ssp.cur.data.depth[10] = np.nan  # skipped
+        self.ssp.cur.data.speed[:] = 1500.0
+        self.ssp.cur.init_proc(50)
+        self.ssp.cur.proc.depth[:] = np.arange(50)
+        self.ssp.cur.proc.speed[:] = 1490.0
+
+    def tearDown(self):
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+    def test_add_casts(self):
+        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.project_name)
+        self.assertTrue(db.add_casts(self.ssp))
+        self.assertTrue(db.add_casts(self.ssp))  # the cast is replaced
+
+        self.assertEqual(db.conn.execute("SELECT COUNT(*) FROM data").fetchone()[0], 99)
+        self.assertEqual(db.conn.execute("SELECT COUNT(*) FROM proc").fetchone()[0], 50)
+        self.assertEqual(db.conn.execute("SELECT COUNT(*) FROM sis").fetchone()[0], 0)
+        row = db.conn.execute("SELECT * FROM proc WHERE depth=20").fetchone()
+        self.assertEqual(row['speed'], 1490.0)
+        self.assertEqual(row['flag'], 0)
+        db.disconnect()
+
+    def test_profile_by_pk(self):
+        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.project_name)
+        self.assertTrue(db.add_casts(self.ssp))
+
+        plan = db.conn.execute("EXPLAIN QUERY PLAN SELECT * FROM proc WHERE ssp_pk=1").fetchone()
+        self.assertTrue('proc_ssp_pk_idx' in plan[-1])
+
+        ssp = db.profile_by_pk(1)
+        self.assertEqual(ssp.cur.data.num_samples, 99)
+        self.assertTrue(np.array_equal(ssp.cur.data.depth[10:], np.arange(11, 100)))
+        self.assertEqual(ssp.cur.data.flag.sum(), 0)
+        self.assertTrue(np.array_equal(ssp.cur.proc.speed, np.full(50, 1490.0)))
+        self.assertEqual(ssp.cur.sis.num_samples, 0)
+        db.disconnect()
+
+    def test_samples_by_dates(self):
+        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.project_name)
+        self.assertTrue(db.add_casts(self.ssp))
+
+        chunks = list(db.samples_by_dates((datetime(2016, 1, 1).date(), datetime(2016, 1, 2).date()), chunk_size=40))
+        self.assertEqual([len(depths) for depths, speeds in chunks], [40, 40, 19])
+        self.assertEqual(list(db.samples_by_dates((datetime(2016, 1, 2).date(), datetime(2016, 1, 3).date()))), [])
+        db.disconnect()
+
+    def test_avg_ssp(self):
+        avg_ssp = PlotDb.AvgSsp(bin_size=10.0)
+        avg_ssp.add_samples([1.0, 2.0, 3.0, 11.0], [1500.0, 1501.0, 1502.0, 1490.0])
+        avg_ssp.add_samples([12.0, 13.0, 25.0], [1492.0, 1494.0, 1480.0])
+        avg_ssp.calc_avg()
+
+        self.assertEqual(avg_ssp.max_depth, 30.0)
+        self.assertEqual(avg_ssp.depths, [0.0, 15.0])
+        self.assertAlmostEqual(avg_ssp.mean[0], 1501.0)
+        self.assertAlmostEqual(avg_ssp.mean[1], 1492.0)
+        self.assertAlmostEqual(avg_ssp.max_2std[0], 1501.0 + 2 * np.std([1500.0, 1501.0, 1502.0]))
+
+        # the samples density, on the depth bins and the sound speed steps
+        self.assertEqual(avg_ssp.density.shape, (3, 120))
+        self.assertEqual(avg_ssp.depth_edges.tolist(), [0.0, 10.0, 20.0, 30.0])
+        self.assertEqual(avg_ssp.density.sum(), 7)
+        self.assertEqual(avg_ssp.density[0, 40:43].tolist(), [1, 1, 1])
+        self.assertEqual(avg_ssp.density[1].sum(), 3)
+        self.assertEqual(avg_ssp.density[2, 20], 1)
+
+    def test_spatio_temporal_queries(self):
+        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.project_name)
+        for i, (lat, lon) in enumerate([(43.0, -70.0), (43.1, -70.0), (44.0, -70.0), (10.0, 179.9), (10.0, -179.9)]):
+            self.ssp.cur.meta.latitude = lat
+            self.ssp.cur.meta.longitude = lon
+            self.ssp.cur.meta.utc_time = datetime(2016, 1, 1 + i)
+            self.assertTrue(db.add_casts(self.ssp))
+
+        plan = db.conn.execute("EXPLAIN QUERY PLAN SELECT id FROM ssp_pk WHERE cast_time > 0").fetchone()
+        self.assertTrue('ssp_pk_time_idx' in plan[-1])
+
+        self.assertEqual([row[0] for row in db.list_profiles_in_bbox(42.0, -71.0, 43.5, -69.0)], [1, 2])
+        self.assertEqual([row[0] for row in db.list_profiles_in_bbox(9.0, 179.0, 11.0, -179.0)], [4, 5])
+        self.assertEqual([row[0] for row in db.list_profiles_in_time_window(datetime(2016, 1, 2),
+                                                                            datetime(2016, 1, 3))], [2, 3])
+        self.assertEqual([row[0] for row in db.list_profiles_in_radius(43.09, -70.0, 20000.0)], [2, 1])
+        self.assertEqual([row[0] for row in db.list_profiles_in_radius(10.0, 180.0, 20000.0)], [4, 5])
+        self.assertEqual([row[0] for row in db.list_nearest_profiles(43.09, -70.0, k=3)], [2, 1, 3])
+        self.assertEqual(len(db.list_nearest_profiles(0.0, 0.0, k=10)), 5)
+        self.assertEqual([row[0] for row in db.list_nearest_profiles(43.05, -70.0, k=1,
+                                                                     timestamp=datetime(2016, 1, 1),
+                                                                     time_weight=1.0)], [1])
+        db.disconnect()
+
+    def test_list_profiles_page(self):
+        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.project_name)
+        for i, vessel in enumerate(["B", "A", "B", "A", "B"]):
+            self.ssp.cur.meta.latitude = 43.0 + i
+            self.ssp.cur.meta.vessel = vessel
+            self.ssp.cur.meta.utc_time = datetime(2016, 1, 5 - i)
+            self.assertTrue(db.add_casts(self.ssp))
+
+        pks = list()
+        lst, cursor = db.list_profiles_page(limit=2)
+        while True:
+            self.assertLessEqual(len(lst), 2)
+            pks.extend([row[0] for row in lst])
+            if cursor is None:
+                break
+            lst, cursor = db.list_profiles_page(limit=2, cursor=cursor)
+        self.assertEqual(pks, [5, 4, 3, 2, 1])
+
+        lst, cursor = db.list_profiles_page(limit=10, sort_by='vessel', descending=True)
+        self.assertEqual([row[0] for row in lst], [5, 3, 1, 4, 2])
+        self.assertIsNone(cursor)
+        lst, cursor = db.list_profiles_page(limit=1, vessel="A", start=datetime(2016, 1, 2))
+        self.assertEqual([row[0] for row in lst], [4])
+        lst, cursor = db.list_profiles_page(limit=1, cursor=cursor, vessel="A", start=datetime(2016, 1, 2))
+        self.assertEqual([row[0] for row in lst], [2])
+        self.assertIsNone(cursor)
+        db.disconnect()
+
+    def test_changes_since(self):
+        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.project_name)
+        self.assertEqual(db.revision(), 0)
+        self.assertTrue(db.add_casts(self.ssp))
+        revision = db.revision()
+        self.assertEqual(db.changes_since(0), (revision, [1], []))
+
+        self.ssp.cur.meta.latitude = 44.0
+        self.assertTrue(db.add_casts(self.ssp))
+        self.assertTrue(db.add_casts(self.ssp))  # the cast is replaced
+        self.assertTrue(db.delete_profile_by_pk(1))
+        new_revision, stored, removed = db.changes_since(revision)
+        self.assertGreater(new_revision, revision)
+        self.assertEqual((stored, removed), ([2], [1]))
+        self.assertEqual(db.changes_since(new_revision), (new_revision, [], []))
+        db.disconnect()
+
+    def test_read_only(self):
+        db = ProjectDb(projects_folder=self.projects_folder, project_name=self.project_name)
+        self.assertTrue(db.add_casts(self.ssp))
+        db.conn.execute("PRAGMA journal_mode=DELETE")
+        db.disconnect()
+
+        in_db = ProjectDb(projects_folder=self.projects_folder, project_name=self.project_name, read_only=True)
+        self.assertEqual([row[0] for row in in_db.list_profiles()], [1])
+        self.assertEqual(in_db.conn.execute("PRAGMA journal_mode").fetchone()[0], "delete")
+        self.assertFalse(in_db.add_casts(self.ssp))  # not modified
+        in_db.disconnect()
+
+        with self.assertRaises(RuntimeError):
+            ProjectDb(projects_folder=self.projects_folder, project_name="unittest_missing", read_only=True)
+
+
+class TestSoundSpeedDbPool(unittest.TestCase):
+    def setUp(self):
+        self.projects_folder = os.path.abspath(os.path.dirname(__file__))
+        self.project_name = 'unittest_pool'
+        self.db_path = os.path.join(self.projects_folder, '%s.db' % self.project_name)
+        self.pool = DbPool()
+        self.tearDown()
+
+    def tearDown(self):
+        self.pool.close()
+        for suffix in ["", "-wal", "-shm"]:
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
+
+    def test_handles(self):
+        db = self.pool.get(projects_folder=self.projects_folder, project_name=self.project_name)
+        self.assertIs(self.pool.get(projects_folder=self.projects_folder, project_name=self.project_name), db)
+        self.assertEqual(db.conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+        other = list()
+
+        def read():
+            other_db = self.pool.get(projects_folder=self.projects_folder, project_name=self.project_name)
+            other.append((other_db, other_db.list_profiles()))
+
+        # a reader in another thread gets its own handle, and it is not blocked by the writer
+        with db.write_lock:
+            thread = threading.Thread(target=read)
+            thread.start()
+            thread.join(5)
+        self.assertIsNot(other[0][0], db)
+        self.assertIs(other[0][0].write_lock, db.write_lock)
+        self.assertEqual(other[0][1], [])
+
+        self.pool.release(projects_folder=self.projects_folder, project_name=self.project_name)
+        new_db = self.pool.get(projects_folder=self.projects_folder, project_name=self.project_name)
+        self.assertIsNot(new_db, db)
+
+    def test_removed_db(self):
+        db = self.pool.get(projects_folder=self.projects_folder, project_name=self.project_name)
+        db.disconnect()
+        os.remove(self.db_path)
+        new_db = self.pool.get(projects_folder=self.projects_folder, project_name=self.project_name)
+        self.assertIsNot(new_db, db)
+        self.assertEqual(new_db.list_profiles(), [])
+
 
 def suite():
     s = unittest.TestSuite()
     s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedDb))
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedProjectDb))
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedDbPool))
     return s
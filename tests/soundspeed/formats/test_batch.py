@@ -0,0 +1,134 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from hydroffice.soundspeed.base import testing
+from hydroffice.soundspeed.base.setup import Setup
+from hydroffice.soundspeed.base.callbacks.test_callbacks import TestCallbacks
+from hydroffice.soundspeed.formats import batch
+from hydroffice.soundspeed.soundspeed import SoundSpeedLibrary
+
+
+class TestSoundSpeedFormatsBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.input_folder = testing.input_data_folder()
+        self.release_folder = tempfile.mkdtemp()
+        self.settings = Setup(release_folder=self.release_folder)
+
+    def tearDown(self):
+        shutil.rmtree(self.release_folder, ignore_errors=True)
+
+    def test_readers_for_path(self):
+        self.assertEqual(batch.readers_for_path("cast.cnv"), ["seabird", ])
+        self.assertEqual(batch.readers_for_path("CAST.EDF"), ["sippican", ])
+        self.assertEqual(batch.readers_for_path("cast.csv"), ["castaway", "digibars"])
+        self.assertEqual(batch.readers_for_path("cast.unknown"), [])
+
+    def test_list_data_files(self):
+        folder = os.path.join(self.input_folder, "aoml")
+        from_folder = batch.list_data_files(folder)
+        self.assertGreater(len(from_folder), 0)
+        self.assertEqual(batch.list_data_files([os.path.join(folder, "*.txt"), folder]), from_folder)
+        self.assertEqual(batch.list_data_files(os.path.join(folder, "*.unknown")), [])
+
+    def test_parse_file(self):
+        path = batch.list_data_files(os.path.join(self.input_folder, "aoml"))[0]
+        result = batch.parse_file(path=path, settings=self.settings)
+        self.assertTrue(result.success)
+        self.assertEqual(result.data_format, "aoml")
+        self.assertEqual(result.nr_profiles, 1)
+        self.assertGreaterEqual(result.parse_time, 0.0)
+
+    def test_parse_file_without_location(self):
+        # no user to ask for the missing location
+        path = os.path.join(self.input_folder, "seabird", "2016_223_005846.cnv")
+        result = batch.parse_file(path=path, settings=self.settings)
+        self.assertFalse(result.success)
+        self.assertIn("missing geographic location", result.error)
+
+    def test_parse_file_with_callbacks(self):
+        # the passed callbacks provide the missing location
+        path = os.path.join(self.input_folder, "seabird", "2016_223_005846.cnv")
+        result = batch.parse_file(path=path, settings=self.settings, callbacks=TestCallbacks())
+        self.assertTrue(result.success)
+        self.assertEqual(result.data_format, "seabird")
+
+    def test_parse_invalid_file(self):
+        fd, path = tempfile.mkstemp(suffix=".cnv")
+        with os.fdopen(fd, "w") as fod:
+            fod.write("not a cast\n")
+        try:
+            result = batch.parse_file(path=path, settings=self.settings)
+        finally:
+            os.remove(path)
+        self.assertFalse(result.success)
+        self.assertIsNone(result.ssp)
+        self.assertTrue(result.error.startswith("seabird"))
+
+
+class TestSoundSpeedFormatsBatchImport(unittest.TestCase):
+
+    def setUp(self):
+        self.data_folder = tempfile.mkdtemp()
+        self.lib = SoundSpeedLibrary(data_folder=self.data_folder)
+        self.lib.current_project = "unittest_batch"
+
+        # the files to import: the aoml casts and a bad file
+        self.input_folder = os.path.join(self.data_folder, "input")
+        os.makedirs(self.input_folder)
+        self.good_paths = batch.list_data_files(os.path.join(testing.input_data_folder(), "aoml"))
+        for path in self.good_paths:
+            shutil.copy(path, self.input_folder)
+        self.bad_path = os.path.join(self.input_folder, "bad.cnv")
+        with open(self.bad_path, "w") as fod:
+            fod.write("not a cast\n")
+
+        # record the atlases retrievals and the db insertions
+        self.atlas_calls = list()
+        self.lib._retrieve_atlases = lambda profiles: self.atlas_calls.append(len(profiles))
+        self.db = self.lib.db_pool.get(projects_folder=self.lib.projects_folder,
+                                       project_name=self.lib.current_project)
+        self.add_casts_calls = list()
+        add_casts = self.db.add_casts
+
+        def counting_add_casts(ssp):
+            self.add_casts_calls.append(ssp.nr_profiles)
+            return add_casts(ssp)
+
+        self.db.add_casts = counting_add_casts
+
+    def tearDown(self):
+        self.lib.close()
+        shutil.rmtree(self.data_folder, ignore_errors=True)
+
+    def test_import_data_batch(self):
+        results = self.lib.import_data_batch(self.input_folder, max_workers=2)
+
+        self.assertEqual(len(results), len(self.good_paths) + 1)
+        failed = [result for result in results if not result.success]
+        self.assertEqual([result.path for result in failed], [self.bad_path, ])
+        self.assertIsNotNone(failed[0].error)
+        self.assertFalse(failed[0].stored)
+        self.assertTrue(all(result.stored for result in results if result.success))
+
+        # a single atlases retrieval and a single insertion for all the parsed profiles
+        self.assertEqual(self.atlas_calls, [len(self.good_paths), ])
+        self.assertEqual(self.add_casts_calls, [len(self.good_paths), ])
+        self.assertEqual(len(self.lib.db_list_profiles()), len(self.good_paths))
+
+    def test_import_data_batch_skip_atlas(self):
+        results = self.lib.import_data_batch(self.input_folder, skip_atlas=True, store=False, max_workers=2)
+
+        self.assertEqual(len([result for result in results if result.success]), len(self.good_paths))
+        self.assertEqual(self.atlas_calls, [])
+        self.assertEqual(self.add_casts_calls, [])
+        self.assertEqual(len(self.lib.db_list_profiles()), 0)
+
+
+def suite():
+    s = unittest.TestSuite()
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedFormatsBatch))
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedFormatsBatchImport))
+    return s
@@ -0,0 +1,135 @@
+import unittest
+import struct
+import numpy as np
+
+from hydroffice.soundspeed.formats import km
+
+
+def make_header(dg_id):
+    return struct.pack("<BBHIIHH", 2, dg_id, 2040, 20160301, 43200000, 1, 100)
+
+
+def make_footer():
+    return struct.pack("<BH", 3, 0)
+
+
+def make_xyz88(depths, infos):
+    data = make_header(0x58)
+    data += struct.pack("<HHfHHfi", 9000, 15000, 2.5, len(depths), len(depths), 1000.0, 0)
+    for i, (depth, info) in enumerate(zip(depths, infos)):
+        data += struct.pack("<fffHBbBbh", depth, -10.0 + i, 0.5, 20, 5, -12, info, 0, -215)
+    return data + make_footer()
+
+
+def make_svp(depths, speeds):
+    data = make_header(0x55)
+    data += struct.pack("<IIHH", 20160301, 3600, len(depths), 1)
+    for depth, speed in zip(depths, speeds):
+        data += struct.pack("<II", int(depth * 100), int(speed * 10))
+    return data + make_footer()
+
+
+def make_range_angle78(num_sectors, num_beams):
+    data = make_header(0x4e)
+    data += struct.pack("<HHHHfI", 14950, num_sectors, num_beams, num_beams, 30000.0, 1)
+    for i in range(num_sectors):
+        data += struct.pack("<hH3fH2Bf", -150 + i, 1200, 0.001, 0.002 * i, 300000.0, 6500, 1, i, 2000.0)
+    for i in range(num_beams):
+        data += struct.pack("<h2BHBbfhbB", -6500 + 100 * i, i % num_sectors, 0, 40, 7, -3, 0.1 * i, -255, 0, 0)
+    return data + make_footer()
+
+
+def make_seabed_image89(num_samples):
+    data = make_header(0x59)
+    data += struct.pack("<fH2h3H", 30000.0, 100, -150, -250, 10, 250, len(num_samples))
+    for i, nr in enumerate(num_samples):
+        data += struct.pack("<bB2H", 1, 0, nr, nr // 2 + 1)
+    for i, nr in enumerate(num_samples):
+        data += struct.pack("<%dh" % nr, *[-100 * i - s for s in range(nr)])
+    return data + make_footer()
+
+
+def make_watercolumn(num_samples):
+    data = make_header(0x6b)
+    data += struct.pack("<6HIhBbB3B", 1, 1, 2, len(num_samples), len(num_samples), 14950, 3000000, -12, 10, 5, 0,
+                        0, 0, 0)
+    for i in range(2):
+        data += struct.pack("<hHBB", -100 + i, 30000, i, 0)
+    for i, nr in enumerate(num_samples):
+        data += struct.pack("<h3H2B", -6500 + 100 * i, 0, nr, nr // 2, i % 2, i)
+        data += struct.pack("<%db" % nr, *[(-i - s) % 128 for s in range(nr)])
+    return data + make_footer()
+
+
+class TestSoundSpeedFormatsKm(unittest.TestCase):
+
+    def test_xyz88(self):
+        depths = [10.0, 20.0, 30.0, 100.0]
+        dg = km.KmXyz88(make_xyz88(depths, [0, 0, 0, 0x80]))
+        self.assertEqual(dg.number_beams, 4)
+        self.assertAlmostEqual(dg.sound_speed, 1500.0)
+        self.assertTrue(np.allclose(dg.depth, depths))
+        self.assertTrue(np.allclose(dg.across, [-10.0, -9.0, -8.0, -7.0]))
+        self.assertTrue(np.allclose(dg.beam_incidence_angle_adjustment, -1.2))
+        self.assertTrue(np.allclose(dg.reflectivity, -21.5))
+        # the invalid detection is skipped
+        self.assertAlmostEqual(dg.mean_depth, 22.5)
+
+    def test_xyz88_no_valid_detections(self):
+        dg = km.KmXyz88(make_xyz88([10.0, 20.0], [0x80, 0x81]))
+        self.assertIsNone(dg.mean_depth)
+
+    def test_svp(self):
+        depths = [0.0, 10.5, 1200.25]
+        speeds = [1500.1, 1490.2, 1485.3]
+        dg = km.KmSvp(make_svp(depths, speeds))
+        self.assertEqual(dg.num_entries, 3)
+        self.assertTrue(np.allclose(dg.depth, depths))
+        self.assertTrue(np.allclose(dg.speed, speeds))
+        ssp = dg.convert_ssp()
+        self.assertTrue(np.allclose(ssp.data.depth, depths))
+
+    def test_range_angle78(self):
+        dg = km.KmRangeAngle78(make_range_angle78(num_sectors=3, num_beams=5))
+        self.assertTrue(np.allclose(dg.tilt_angle, [-1.5, -1.49, -1.48]))
+        self.assertTrue(np.allclose(dg.absorption_coefficient, 65.0))
+        self.assertTrue(np.array_equal(dg.transmit_sector_number, [0, 1, 2]))
+        self.assertTrue(np.allclose(dg.angle, [-65.0, -64.0, -63.0, -62.0, -61.0]))
+        self.assertTrue(np.array_equal(dg.sector_number, [0, 1, 2, 0, 1]))
+        self.assertTrue(np.allclose(dg.travel_time, [0.0, 0.1, 0.2, 0.3, 0.4]))
+        self.assertTrue(np.allclose(dg.reflectivity, -25.5))
+
+    def test_seabed_image89(self):
+        num_samples = [3, 0, 5]
+        data = make_seabed_image89(num_samples)
+        dg = km.KmSeabedImage89(data)
+        self.assertEqual(dg.snippets_nr, 8)
+        self.assertEqual([len(snippet) for snippet in dg.snippets], num_samples)
+        self.assertTrue(np.allclose(dg.snippets[2], [-20.0, -20.1, -20.2, -20.3, -20.4]))
+        self.assertTrue(np.array_equal(dg.center_sample, [2, 1, 3]))
+        self.assertEqual(bytes(dg.serialize()[:-3]), data[:-3])
+
+    def test_seabed_image89_no_beams(self):
+        data = make_seabed_image89([])
+        dg = km.KmSeabedImage89(data)
+        self.assertEqual(dg.number_beams, 0)
+        self.assertEqual(dg.snippets_nr, 0)
+        self.assertEqual(dg.snippets, [])
+        self.assertEqual(bytes(dg.serialize()[:-3]), data[:-3])
+
+    def test_watercolumn(self):
+        num_samples = [4, 0, 7]
+        dg = km.KmWatercolumn(make_watercolumn(num_samples))
+        self.assertTrue(np.allclose(dg.sector_tilt_angle, [-1.0, -0.99]))
+        self.assertTrue(np.allclose(dg.sector_frequency, 300000.0))
+        self.assertTrue(np.allclose(dg.beam_pointing_angle, [-65.0, -64.0, -63.0]))
+        self.assertTrue(np.array_equal(dg.beam_num_samples, num_samples))
+        self.assertTrue(np.array_equal(dg.beam_number, [0, 1, 2]))
+        self.assertEqual([len(samples) for samples in dg.samples], num_samples)
+        self.assertTrue(np.array_equal(dg.samples[2], [(-2 - s) % 128 for s in range(7)]))
+
+
+def suite():
+    s = unittest.TestSuite()
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedFormatsKm))
+    return s
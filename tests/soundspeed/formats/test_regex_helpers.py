@@ -0,0 +1,39 @@
+import unittest
+import numpy as np
+
+from hydroffice.soundspeed.temp import regex_helpers
+
+
+class TestSoundSpeedFormatsRegexHelpers(unittest.TestCase):
+
+    def setUp(self):
+        self.col_types = [('depth', np.float32), ('temperature', np.float32), ('soundspeed', np.float32)]
+
+    def test_parse_columns(self):
+        lines = ["      1.000    10.0000  1490.00\n", "\n", "      2.500    9.5000  1489.50\n"]
+        d = regex_helpers.parseColumns(lines, self.col_types)
+        self.assertEqual(d.dtype.names, ('depth', 'temperature', 'soundspeed'))
+        self.assertTrue(np.allclose(d['depth'], [1.0, 2.5]))
+        self.assertTrue(np.allclose(d['soundspeed'], [1490.0, 1489.5]))
+
+    def test_parse_columns_fallback(self):
+        lines = ["1.0 10.0 1490.0\n", "2.0 9.5\n", "3.0 9.0.1 1488.0\n", "4.0 nan 1487.0\n", "5.0 8.5 1486.5\n"]
+        d = regex_helpers.parseColumns(lines, self.col_types)
+        self.assertTrue(np.allclose(d['depth'], [1.0, 5.0]))
+        self.assertTrue(np.array_equal(d, regex_helpers.parseNumbers(lines, self.col_types, r"\s+",
+                                                                     pre=r'^\s*', post=r'\s*$')))
+
+    def test_convert_to_sound_speed_profile(self):
+        d = regex_helpers.parseColumns(["1.0 10.0 1490.0\n", "2.0 9.5 1489.5\n"], self.col_types)
+        p = regex_helpers.Profile(d, ymetric="depth", attribute="soundspeed", metadata={})
+        ssp = p.ConvertToSoundSpeedProfile()
+        self.assertTrue(ssp.data.speed.flags['C_CONTIGUOUS'])
+        self.assertTrue(np.allclose(ssp.data.speed, [1490.0, 1489.5]))
+        self.assertTrue(np.allclose(ssp.data.temp, [10.0, 9.5]))
+        self.assertFalse(np.count_nonzero(ssp.data.sal))
+
+
+def suite():
+    s = unittest.TestSuite()
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedFormatsRegexHelpers))
+    return s
@@ -0,0 +1,89 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+from hydroffice.soundspeed.formats.readers.abstract import AbstractTextReader
+from hydroffice.soundspeed.formats.readers.asvp import Asvp
+
+
+class TestSoundSpeedFormatsTextReader(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_parse_table_fast(self):
+        lines = ["1.0 1500.0 10.0\n", "2.0 1501.0 11.0\n"]
+        table = AbstractTextReader._fast_table(lines, columns=[0, 2])
+        self.assertTrue(np.allclose(table, [[1.0, 10.0], [2.0, 11.0]]))
+
+    def test_parse_table_slow(self):
+        lines = ["1.0 1500.0 10.0\n", "\n", "bad 1501.0 11.0\n", "3.0 1502.0\n", "4.0 1503.0 x\n"]
+        self.assertIsNone(AbstractTextReader._fast_table(lines, columns=[0, 1, 2]))
+        table = AbstractTextReader._slow_table(lines, columns=[0, 1, 2], required=[0, 1])
+        self.assertEqual(table.shape, (3, 3))
+        self.assertTrue(np.allclose(table[:, 0], [1.0, 3.0, 4.0]))
+        self.assertTrue(np.isnan(table[1:, 2]).all())
+
+    def test_parse_table_delimiter(self):
+        lines = io.StringIO("1.0,1500.0\n2.0,1501.0\n")
+        table = AbstractTextReader._fast_table(lines, columns=[0, 1], delimiter=',')
+        self.assertTrue(np.allclose(table, [[1.0, 1500.0], [2.0, 1501.0]]))
+
+    def test_detect_encoding(self):
+        path = os.path.join(self.folder, "latin.txt")
+        with open(path, "wb") as fod:
+            fod.write("température\n".encode("latin"))
+        self.assertEqual(Asvp()._detect_encoding(path), "latin")
+        self.assertEqual(Asvp()._detect_encoding(path, encoding="latin"), "latin")
+
+    def test_read_body(self):
+        path = os.path.join(self.folder, "cast.asvp")
+        with open(path, "w") as fod:
+            fod.write("( SoundVelocity 1.0 0 201603011200 43.0 -70.0 -1 0 0 SVP 2 )\n1.0 1500.0\n2.0 1501.0\n")
+        reader = Asvp()
+        reader._read(data_path=path, lines=False)
+        header = [line for line in reader._header_lines() if line.startswith("(")]
+        self.assertEqual(len(header), 1)
+        reader.fid.io.seek(0)
+        reader.fid.io.readline()
+        table = reader._read_body(columns=[0, 1])
+        self.assertTrue(np.allclose(table, [[1.0, 1500.0], [2.0, 1501.0]]))
+
+    def test_read_body_slow(self):
+        path = os.path.join(self.folder, "cast.asvp")
+        with open(path, "w") as fod:
+            fod.write("( SoundVelocity 1.0 0 201603011200 43.0 -70.0 -1 0 0 SVP 2 )\n1.0 1500.0\nbad\n2.0 1501.0\n")
+        reader = Asvp()
+        reader._read(data_path=path, lines=False)
+        for line in reader._header_lines():
+            break
+        table = reader._read_body(columns=[0, 1])
+        self.assertTrue(np.allclose(table, [[1.0, 1500.0], [2.0, 1501.0]]))
+
+    def test_read_body_latin(self):
+        # the latin character is beyond the prefix used to detect the encoding
+        path = os.path.join(self.folder, "cast.asvp")
+        with open(path, "wb") as fod:
+            fod.write(b"( SoundVelocity 1.0 0 201603011200 43.0 -70.0 -1 0 0 SVP 2 )\n")
+            fod.write(b"1.0 1500.0\n" * (AbstractTextReader.encoding_prefix_size // 11 + 1))
+            fod.write("2.0 1501.0 \u00b0\n".encode("latin"))
+        reader = Asvp()
+        reader._read(data_path=path, lines=False)
+        self.assertEqual(reader.fid.io.encoding, "utf8")
+        reader.fid.io.readline()
+        reader.samples_offset = 1
+        table = reader._read_body(columns=[0, 1])
+        self.assertEqual(table.shape, (AbstractTextReader.encoding_prefix_size // 11 + 2, 2))
+        self.assertTrue(np.allclose(table[-1], [2.0, 1501.0]))
+
+
+def suite():
+    s = unittest.TestSuite()
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedFormatsTextReader))
+    return s
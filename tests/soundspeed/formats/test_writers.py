@@ -0,0 +1,76 @@
+import datetime
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import numpy as np
+
+from hydroffice.soundspeed.formats.writers.abstract import AbstractTextWriter
+from hydroffice.soundspeed.formats.writers.asvp import Asvp
+from hydroffice.soundspeed.formats.writers.csv import Csv
+from hydroffice.soundspeed.formats.writers.qps import Qps
+from hydroffice.soundspeed.profile.dicts import Dicts
+from hydroffice.soundspeed.profile.profile import Profile
+from hydroffice.soundspeed.profile.profilelist import ProfileList
+
+
+class TestSoundSpeedFormatsWriters(unittest.TestCase):
+
+    def setUp(self):
+        self.data_path = tempfile.mkdtemp()
+
+        self.ssp = ProfileList()
+        self.ssp.append_profile(Profile())
+        p = self.ssp.cur
+        p.meta.latitude = 43.0
+        p.meta.longitude = -70.0
+        p.meta.utc_time = datetime.datetime(2016, 3, 1, 12, 0)
+        p.meta.original_path = "cast"
+        p.init_data(4)
+        p.data.depth[:] = [1.0, 2.0, 4.0, 8.0]
+        p.data.speed[:] = [1500.0, 1499.5, 1498.25, 1497.125]
+        p.data.temp[:] = [10.0, 9.5, 9.0, 8.5]
+        p.data.sal[:] = [35.0, 35.0, 0.0, 35.0]
+        p.clone_data_to_proc()
+        p.proc.flag[1] = Dicts.flags['user']
+        p.clone_proc_to_sis()
+        p.sis.flag[:] = Dicts.flags['thin']
+
+    def tearDown(self):
+        shutil.rmtree(self.data_path, ignore_errors=True)
+
+    def test_format_rows(self):
+        columns = [np.array([1.0, 2.5], dtype=np.float32), np.array([1500.0, 1499.0])]
+        self.assertEqual(AbstractTextWriter._format_rows("%.2f,%.1f\n", columns), "1.00,1500.0\n2.50,1499.0\n")
+        self.assertEqual(AbstractTextWriter._format_rows("%.2f\n", [np.array([])]), "")
+
+    def test_csv_valid_samples(self):
+        Csv().write(ssp=self.ssp, data_path=self.data_path)
+        with open(os.path.join(self.data_path, "csv", "cast.csv")) as fid:
+            lines = fid.readlines()
+        self.assertEqual(lines[-3:], ["1.00,1500.00\n", "4.00,1498.25\n", "8.00,1497.12\n"])
+
+    def test_qps_layout(self):
+        Qps().write(ssp=self.ssp, data_path=self.data_path)
+        with open(os.path.join(self.data_path, "qps", "cast.bsvp"), "rb") as fid:
+            data = fid.read()
+        header_size = struct.calcsize('dddi')
+        sample_size = struct.calcsize('iffffffI')
+        self.assertEqual(len(data), header_size + 3 * sample_size)
+        sample = struct.unpack('iffffffI', data[header_size + sample_size:header_size + 2 * sample_size])
+        self.assertEqual(sample[:3], (1, 4.0, 1498.25))
+
+    def test_asvp_absorption(self):
+        Asvp().write(ssp=self.ssp, data_path=self.data_path)
+        with open(os.path.join(self.data_path, "asvp", "cast_12kHz.abs")) as fid:
+            lines = fid.readlines()
+        # the sample with invalid salinity is skipped
+        self.assertEqual(len(lines), 1 + 3)
+        self.assertEqual([line.split()[0] for line in lines[1:]], ["1.000", "2.000", "8.000"])
+
+
+def suite():
+    s = unittest.TestSuite()
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedFormatsWriters))
+    return s
@@ -62,6 +62,32 @@ class TestSoundSpeedOceanography(unittest.TestCase):
 
         self.assertAlmostEqual(calc_vs, trusted_fof_vs, places=1)
 
+    def test_speed_array(self):
+        d = np.array([0.0, 10.0, 500.0, 9712.653])
+        t = np.array([25.0, 10.0, 5.0, 20.0])
+        s = np.array([0.5, 30.0, 35.0, 35.0])
+
+        calc_vs = Oc.speed(d=d, t=t, s=s, lat=30.0)
+        self.assertEqual(calc_vs.shape, d.shape)
+        for i in range(d.size):
+            self.assertAlmostEqual(calc_vs[i], Oc.speed(d=d[i], t=t[i], s=s[i], lat=30.0), places=9)
+        self.assertAlmostEqual(calc_vs[-1], 1687.198, places=1)
+
+    def test_speed_float32(self):
+        d = np.array([0.0, 10.0, 500.0, 9712.653])
+        t = np.array([25.0, 10.0, 5.0, 20.0])
+        s = np.array([0.5, 30.0, 35.0, 35.0])
+
+        calc_vs = Oc.speed(d=d, t=t, s=s, lat=30.0)
+        calc_vs_32 = Oc.speed(d=d.astype(np.float32), t=t.astype(np.float32), s=s.astype(np.float32), lat=30.0)
+        self.assertEqual(calc_vs_32.dtype, np.float64)
+        # only the rounding of the inputs to float32 is left
+        calc_vs_rounded = Oc.speed(d=d.astype(np.float32).astype(np.float64),
+                                   t=t.astype(np.float32).astype(np.float64),
+                                   s=s.astype(np.float32).astype(np.float64), lat=30.0)
+        self.assertTrue(np.array_equal(calc_vs_32, calc_vs_rounded))
+        self.assertTrue(np.allclose(calc_vs_32, calc_vs, rtol=0.0, atol=1e-3))
+
     def test_sal(self):
         # check values from Fofonoff and Millard(1983)
         trusted_fof_d = 9712.653  # m
@@ -76,6 +102,18 @@ class TestSoundSpeedOceanography(unittest.TestCase):
 
         self.assertAlmostEqual(calc_s, trusted_fof_s, places=1)
 
+    def test_sal_array(self):
+        d = np.array([0.0, 10.0, 500.0, 1000.0])
+        t = np.array([25.0, 10.0, 5.0, 2.0])
+        s = np.array([0.5, 30.0, 35.0, 38.0])
+        speed = Oc.speed(d=d, t=t, s=s, lat=45.0)
+
+        calc_s = Oc.sal(d=d, speed=speed, t=t, lat=45.0)
+        self.assertEqual(calc_s.shape, s.shape)
+        for i in range(d.size):
+            self.assertEqual(calc_s[i], Oc.sal(d=d[i], speed=speed[i], t=t[i], lat=45.0))
+            self.assertAlmostEqual(calc_s[i], s[i], places=2)
+
     def test_atg(self):
         # check values from Fofonoff and Millard(1983)
         atg_ck = 3.255976e-4
@@ -125,6 +163,37 @@ class TestSoundSpeedOceanography(unittest.TestCase):
 
         self.assertAlmostEqual(c_calc, c_ck, places=1)
 
+    def test_s2c_array(self):
+        s = np.array([0.0, 10.0, 35.0, 36.616])
+        p = np.array([0.0, 100.0, 1000.0, 10000.0])
+        t = np.array([10.0, 5.0, 20.0, 40.0])
+
+        c_calc = Oc.s2c(s=s, p=p, t=t)
+
+        for i in range(s.size):
+            self.assertEqual(c_calc[i], Oc.s2c(s=s[i], p=p[i], t=t[i]))
+
+    def test_attenuation(self):
+        # values of the original (scalar) implementation, on both the pure water branches
+        self.assertAlmostEqual(Oc.attenuation(f=12, t=5.0, s=30.0, d=10.0, ph=8.1), 1.3523911190351559, places=10)
+        self.assertAlmostEqual(Oc.attenuation(f=100, t=20.0, s=35.0, d=500.0, ph=8.1), 35.47517808595044, places=10)
+        self.assertAlmostEqual(Oc.attenuation(f=400, t=25.0, s=38.0, d=3000.0, ph=8.1), 104.94084051213942,
+                               places=10)
+        self.assertIsInstance(Oc.attenuation(f=12, t=5.0, s=30.0, d=10.0, ph=8.1), float)
+
+    def test_attenuation_grid(self):
+        freqs = [12, 100, 400]
+        t = np.array([5.0, 15.0, 25.0])
+        s = np.array([30.0, 35.0, 38.0])
+        d = np.array([10.0, 500.0, 3000.0])
+
+        atten = Oc.attenuation_grid(f=freqs, t=t, s=s, d=d, ph=8.1)
+
+        self.assertEqual(atten.shape, (3, 3))
+        for i, f in enumerate(freqs):
+            for j in range(t.size):
+                self.assertAlmostEqual(atten[i, j], Oc.attenuation(f=f, t=t[j], s=s[j], d=d[j], ph=8.1), places=10)
+
     def test_dyn_height_1000(self):
         # absolute salinity
         sa = np.array([34.7118, 34.8915, 35.0256, 34.8472, 34.7366, 34.7324])
@@ -0,0 +1,102 @@
+import unittest
+import numpy as np
+
+from hydroffice.soundspeed.profile.profile import Profile
+from hydroffice.soundspeed.profile.dicts import Dicts
+
+
+class TestSoundSpeedProfileThin(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(42)
+        num_samples = 2000
+        self.prf = Profile()
+        self.prf.init_sis(num_samples)
+        self.prf.sis.depth[:] = np.cumsum(rng.rand(num_samples) + 0.05)
+        self.prf.sis.speed[:] = 1500.0 + np.cumsum(rng.randn(num_samples) * 0.2)
+        self.prf.sis.temp[:] = 10.0
+        self.prf.sis.sal[:] = 35.0
+        self.prf.sis.flag[:] = Dicts.flags['valid']
+
+    def tearDown(self):
+        pass
+
+    @staticmethod
+    def _douglas_peucker_slow(depth, speed, start, end, tolerance, kept):
+        kept[start] = True
+        kept[end] = True
+        slope = (speed[end] - speed[start]) / (depth[end] - depth[start])
+        max_dist = 0
+        max_ind = 0
+        for ind in range(start + 1, end):
+            dist = abs(speed[start] + slope * (depth[ind] - depth[start]) - speed[ind])
+            if dist > max_dist:
+                max_dist = dist
+                max_ind = ind
+        if max_dist <= tolerance:
+            return
+        kept[max_ind] = True
+        TestSoundSpeedProfileThin._douglas_peucker_slow(depth, speed, start, max_ind, tolerance, kept)
+        TestSoundSpeedProfileThin._douglas_peucker_slow(depth, speed, max_ind, end, tolerance, kept)
+
+    def test_same_as_recursive(self):
+        depth = self.prf.sis.depth
+        speed = self.prf.sis.speed
+        slow_kept = np.zeros(depth.size, dtype=bool)
+        self._douglas_peucker_slow(depth, speed, 0, depth.size - 1, 0.1, slow_kept)
+
+        self.assertTrue(self.prf.thin(tolerance=0.1))
+        self.assertTrue(np.array_equal(self.prf.sis_thinned, slow_kept))
+
+    def test_max_points(self):
+        self.assertTrue(self.prf.thin(tolerance=0.1, max_points=100))
+        thinned = self.prf.sis_thinned
+        self.assertEqual(np.count_nonzero(thinned), 100)
+        self.assertTrue(thinned[0] and thinned[-1])
+
+        # the retained samples are the most significant ones
+        unlimited = Profile.douglas_peucker_mask(self.prf.sis.depth, self.prf.sis.speed, tolerance=0.1)
+        self.assertTrue(np.all(unlimited[thinned]))
+
+    def test_max_size(self):
+        self.assertTrue(self.prf.thin(tolerance=0.01, max_size=5000))
+        ti = self.prf.sis_thinned
+        size = sum([len(Profile._sis_sample_template % values) for values in
+                    zip(self.prf.sis.depth[ti], self.prf.sis.speed[ti], self.prf.sis.temp[ti], self.prf.sis.sal[ti])])
+        self.assertLessEqual(size, 5000)
+        self.assertGreater(size, 4900)
+
+    def test_short_profile(self):
+        prf = Profile()
+        prf.init_sis(10)
+        prf.sis.depth[:] = np.arange(10.0)
+        prf.sis.speed[:] = 1500.0
+        prf.sis.flag[:] = Dicts.flags['valid']
+        self.assertTrue(prf.thin(tolerance=0.1, max_points=2))
+        self.assertEqual(np.count_nonzero(prf.sis_thinned), 10)
+
+
+class TestSoundSpeedProfileCalc(unittest.TestCase):
+
+    def test_calc_salinity_empty(self):
+        prf = Profile()
+        self.assertEqual(prf.data.num_samples, 0)
+        prf.calc_salinity()
+        self.assertEqual(prf.data.num_samples, 0)
+
+    def test_calc_salinity(self):
+        prf = Profile()
+        prf.meta.latitude = 43.0
+        prf.init_data(3)
+        prf.data.depth[:] = [1.0, 10.0, 100.0]
+        prf.data.speed[:] = 1500.0
+        prf.data.temp[:] = 10.0
+        prf.calc_salinity()
+        self.assertTrue(np.all(np.isfinite(prf.data.sal)))
+
+
+def suite():
+    s = unittest.TestSuite()
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedProfileThin))
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedProfileCalc))
+    return s
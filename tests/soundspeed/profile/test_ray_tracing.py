@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+
+from hydroffice.soundspeed.profile.ray_tracing.ray_tracing import RayTracing
+
+
+class TestSoundSpeedRayTracing(unittest.TestCase):
+
+    def setUp(self):
+        self.depths = np.linspace(0.0, 1000.0, 201)
+        self.speeds = 1500.0 + 0.017 * self.depths + 2.0 * np.sin(self.depths / 50.0)
+        self.speeds[100:150] = self.speeds[100]  # zero-gradient layers
+
+    def tearDown(self):
+        pass
+
+    def _check_angle(self, angle_deg):
+        angle = np.deg2rad(angle_deg)
+        slow_params = RayTracing.get_svp_layer_parameters_slow(angle, self.depths, self.speeds)
+        params = RayTracing.get_svp_layer_parameters(angle, self.depths, self.speeds)
+        for slow_param, param in zip(slow_params, params):
+            self.assertTrue(np.allclose(slow_param, param, rtol=1e-9, atol=1e-9))
+
+        travel_times = np.arange(0.0, params[3][-1] * 1.2, 0.002)
+        for b_project in [False, True]:
+            slow_rays = RayTracing.ray_trace_slow(travel_times, self.depths, self.speeds, slow_params,
+                                                  b_project=b_project)
+            rays = RayTracing.ray_trace(travel_times, self.depths, self.speeds, params, b_project=b_project)
+            self.assertTrue(np.allclose(slow_rays, rays, rtol=1e-9, atol=1e-6))
+
+    def test_nadir(self):
+        self._check_angle(0.0)
+
+    def test_oblique(self):
+        self._check_angle(45.0)
+        self._check_angle(70.0)
+
+    def test_fan(self):
+        angles = np.deg2rad(np.arange(0.0, 75.1, 5.0))
+        gradient, gamma, radius, total_time, total_range = \
+            RayTracing.get_svp_fan_parameters(angles, self.depths, self.speeds)
+        self.assertEqual(gamma.shape, (angles.size, self.depths.size))
+
+        travel_times = np.arange(0.0, 1.0, 0.01)
+        fan = RayTracing.ray_trace_fan(travel_times, self.depths, self.speeds,
+                                       (gradient, gamma, radius, total_time, total_range))
+        self.assertEqual(fan.shape, (angles.size, travel_times.size, 2))
+        for i, angle in enumerate(angles):
+            params = RayTracing.get_svp_layer_parameters(angle, self.depths, self.speeds)
+            rays = RayTracing.ray_trace(travel_times, self.depths, self.speeds, params)
+            self.assertTrue(np.array_equal(fan[i], rays))
+
+    def test_out_of_range(self):
+        params = RayTracing.get_svp_layer_parameters(np.deg2rad(30.0), self.depths, self.speeds)
+        rays = RayTracing.ray_trace([params[3][-1] + 1.0], self.depths, self.speeds, params)
+        self.assertEqual(rays.tolist(), [[-1.0, -1.0]])
+
+
+def suite():
+    s = unittest.TestSuite()
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedRayTracing))
+    return s
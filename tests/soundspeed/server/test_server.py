@@ -0,0 +1,128 @@
+import time
+import unittest
+from threading import Timer
+
+from hydroffice.soundspeed.listener.sis.sis import Sis
+from hydroffice.soundspeed.server.server import Server
+
+
+class _Prj(object):
+
+    class _Setup(object):
+        server_source = 'WOA13'
+
+    class _Listeners(object):
+        def __init__(self):
+            self.sis = Sis(port=0, datagrams=[])
+
+    def __init__(self):
+        self.setup = self._Setup()
+        self.listeners = self._Listeners()
+
+
+class TestSoundSpeedServerSisUpdates(unittest.TestCase):
+
+    def setUp(self):
+        self.sis = Sis(port=0, datagrams=[])
+
+    def test_wait_update(self):
+        timer = Timer(0.2, self.sis.notify_update)
+        timer.start()
+        start = time.time()
+        self.assertEqual(self.sis.wait_update(0, timeout=5.0), 1)
+        self.assertLess(time.time() - start, 2.0)
+        timer.join()
+
+    def test_wait_update_timeout(self):
+        self.sis.notify_update()
+        start = time.time()
+        self.assertEqual(self.sis.wait_update(1, timeout=0.2), 1)
+        self.assertGreaterEqual(time.time() - start, 0.15)
+        # an update already received is returned at once
+        self.assertEqual(self.sis.wait_update(0, timeout=5.0), 1)
+
+
+class TestSoundSpeedServerRun(unittest.TestCase):
+
+    def setUp(self):
+        self.prj = _Prj()
+        self.sis = self.prj.listeners.sis
+        self.server = Server(prj=self.prj)
+        self.server.wait_time = 10.0
+        self.checks = list()
+        # the checks are only recorded
+        self.server.check = self._check
+        self.server.prefetch = lambda: None
+
+    def tearDown(self):
+        if self.server.is_alive():
+            self.server.stop()
+            self.server.join(timeout=5.0)
+
+    def _check(self):
+        self.checks.append(time.time())
+        self.server.force_send.clear()
+
+    def _updates(self, delays):
+        timers = [Timer(delay, self.sis.notify_update) for delay in delays]
+        for timer in timers:
+            timer.start()
+        return timers
+
+    def test_shutdown_wakes_up(self):
+        self.server.start()
+        time.sleep(0.2)
+        start = time.time()
+        self.server.stop()
+        self.server.join(timeout=5.0)
+        self.assertFalse(self.server.is_alive())
+        self.assertLess(time.time() - start, 2.0)
+        self.assertEqual(self.checks, [])
+
+    def test_no_updates(self):
+        self.server.wait_time = 0.1
+        self.server.start()
+        time.sleep(0.5)
+        self.assertEqual(self.checks, [])
+
+    def test_debounce(self):
+        self.server.debounce_time = 0.4
+        self.server.start()
+        start = time.time()
+        timers = self._updates([0.1, 0.15, 0.2])
+        for timer in timers:
+            timer.join()
+        time.sleep(0.8)
+        # the updates received together are handled by a single check, after the debounce time
+        self.assertEqual(len(self.checks), 1)
+        self.assertGreaterEqual(self.checks[0] - start, 0.45)
+
+    def test_min_update_interval(self):
+        self.server.debounce_time = 0.05
+        self.server.min_update_interval = 1.0
+        self.server.start()
+        timers = self._updates([0.1, 0.4])
+        for timer in timers:
+            timer.join()
+        time.sleep(0.2)
+        self.assertEqual(len(self.checks), 1)
+        time.sleep(1.0)
+        self.assertEqual(len(self.checks), 2)
+        self.assertGreaterEqual(self.checks[1] - self.checks[0], 0.95)
+
+    def test_force(self):
+        self.server.debounce_time = 5.0  # not applied when forced
+        self.server.start()
+        time.sleep(0.2)
+        start = time.time()
+        self.server.force()
+        time.sleep(0.5)
+        self.assertEqual(len(self.checks), 1)
+        self.assertLess(self.checks[0] - start, 0.4)
+
+
+def suite():
+    s = unittest.TestSuite()
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedServerSisUpdates))
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedServerRun))
+    return s
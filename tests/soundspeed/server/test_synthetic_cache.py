@@ -0,0 +1,79 @@
+import unittest
+from datetime import datetime
+
+from hydroffice.soundspeed.server.synthetic_cache import SyntheticCache
+from hydroffice.soundspeed.profile.profilelist import ProfileList
+
+
+class _GridAtlas(object):
+    """A 1-degree grid atlas that counts the queries"""
+
+    def __init__(self):
+        self.queries = list()
+
+    def cell_key(self, lat, lon, datestamp=None):
+        return int(round(lat)), int(round(lon)), datestamp.month
+
+    def query(self, lat, lon, datestamp=None, server_mode=False):
+        self.queries.append((lat, lon))
+        ssp = ProfileList()
+        ssp.append()
+        ssp.cur.meta.latitude = lat
+        ssp.cur.meta.longitude = lon
+        return ssp
+
+
+class _Prj(object):
+    class _Atlases(object):
+        def __init__(self):
+            self.woa13 = _GridAtlas()
+
+    def __init__(self):
+        self.atlases = self._Atlases()
+
+
+class TestSoundSpeedServerSyntheticCache(unittest.TestCase):
+
+    def setUp(self):
+        self.prj = _Prj()
+        self.atlas = self.prj.atlases.woa13
+        self.tm = datetime(2017, 3, 1, 10)
+
+    def test_query(self):
+        cache = SyntheticCache(prj=self.prj, max_size=2)
+        ssp = cache.query(source='WOA13', lat=43.1, lon=-70.1, datestamp=self.tm)
+        ssp.cur.meta.latitude = 0.0  # the cached copy is not modified
+        ssp = cache.query(source='WOA13', lat=42.9, lon=-69.9, datestamp=self.tm)
+        self.assertEqual(ssp.cur.meta.latitude, 43.1)
+        self.assertEqual(len(self.atlas.queries), 1)
+
+        cache.query(source='WOA13', lat=44.0, lon=-70.0, datestamp=self.tm)
+        cache.query(source='WOA13', lat=45.0, lon=-70.0, datestamp=self.tm)  # the first cell is evicted
+        self.assertEqual(len(cache), 2)
+        cache.query(source='WOA13', lat=43.0, lon=-70.0, datestamp=self.tm)
+        self.assertEqual(len(self.atlas.queries), 4)
+
+        cache.query(source='WOA13', lat=43.0, lon=-70.0, datestamp=datetime(2017, 4, 1))  # new month
+        self.assertEqual(len(self.atlas.queries), 5)
+
+        with self.assertRaises(RuntimeError):
+            cache.key(source='WOA99', lat=43.0, lon=-70.0, datestamp=self.tm)
+
+    def test_prefetch(self):
+        cache = SyntheticCache(prj=self.prj)
+        cache.prefetch_distance = 300000.0
+        cache.prefetch_step = 10000.0
+
+        self.assertEqual(cache.prefetch(source='WOA13', lat=43.0, lon=-70.0, datestamp=self.tm, course=None), 0)
+        self.assertEqual(cache.prefetch(source='WOA13', lat=43.0, lon=-70.0, datestamp=self.tm, course=0.0), 2)
+        self.assertEqual([cache.key('WOA13', lat, lon, self.tm) for lat, lon in self.atlas.queries],
+                         [('WOA13', 44, -70, 3), ('WOA13', 45, -70, 3)])
+
+        cache.query(source='WOA13', lat=44.0, lon=-70.0, datestamp=self.tm)
+        self.assertEqual(len(self.atlas.queries), 2)
+
+
+def suite():
+    s = unittest.TestSuite()
+    s.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSoundSpeedServerSyntheticCache))
+    return s